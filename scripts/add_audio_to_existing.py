@@ -3,20 +3,34 @@
 Add Audio URLs to Existing Tatoeba Sentences
 
 Searches the Tatoeba database for matching sentences and adds audio URLs
-to the existing beginner.js, intermediate.js, and advanced.js files.
+to the existing beginner.js, intermediate.js, and advanced.js files (or
+any level or shard files given). The sentence database is loaded once and
+shared read-only with a process pool that updates the files in parallel.
+
+Usage:
+    python scripts/add_audio_to_existing.py
+    python scripts/add_audio_to_existing.py --workers 8 shards/*.js
 """
 
+import argparse
 import bz2
 import csv
 import os
 import re
 import unicodedata
 
+import artifacts
+import file_pool
+import metrics
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
 DATA_DIR = os.path.join(PROJECT_DIR, "src", "data", "tatoeba")
 
+# A sentence object in a level file: { id: '...', romanian: '...', ..., audioUrl: null }
+SENTENCE_PATTERN = r"\{\s*id:\s*'([^']+)',\s*romanian:\s*'([^']*)',\s*english:\s*'([^']*)',\s*difficulty:\s*(\d+),\s*wordCount:\s*(\d+),\s*hasAudio:\s*(true|false),\s*audioUrl:\s*(null|'[^']*')\s*\}"
+
 def normalize_text(text):
     """Normalize text for comparison (remove diacritics, lowercase)."""
     # Remove diacritics
@@ -40,9 +54,9 @@ def load_romanian_sentences():
         return {}
 
     sentences = {}  # normalized_text -> (id, original_text)
-    with bz2.open(ron_file, 'rt', encoding='utf-8') as f:
+    with open(ron_file, 'rb') as raw, bz2.open(raw, 'rt', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, 'Romanian sentences', position=metrics.file_position(raw, ron_file)):
             if len(row) >= 3:
                 sentence_id = row[0]
                 text = row[2].strip()
@@ -66,23 +80,54 @@ def load_audio_ids():
     audio_ids = set()
     with open(audio_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, 'audio rows', position=metrics.file_position(f.buffer, audio_file)):
             if len(row) >= 2:
                 audio_ids.add(row[1])
 
     print(f"  Loaded {len(audio_ids)} sentence IDs with audio")
     return audio_ids
 
+def load_from_daemon(address, filepaths):
+    """
+    Build the tatoeba_db and audio ids for the sentences in `filepaths` by
+    querying a running tatoeba_daemon.py instead of parsing the exports.
+    """
+    from tatoeba_daemon import TatoebaClient
+
+    print(f"Querying {address} for the sentences in the level files...")
+    normalized = set()
+    for filepath in filepaths:
+        sentences, _ = extract_sentences_from_js(filepath)
+        normalized.update(normalize_text(s['romanian']) for s in sentences)
+
+    client = TatoebaClient(address)
+    matches = client.by_text(sorted(normalized))
+    client.close()
+
+    tatoeba_db = {text: (record['ron_id'], record['romanian']) for text, record in matches.items() if record}
+    audio_ids = {record['ron_id'] for record in matches.values() if record and record['has_audio']}
+    print(f"  {len(tatoeba_db)} of {len(normalized)} sentences found, {len(audio_ids)} with audio")
+    return tatoeba_db, audio_ids
+
+def replaced_chunks(content, replacements):
+    """The text of `content` in pieces, with sentence objects swapped per `replacements`."""
+    last = 0
+    for match in re.finditer(SENTENCE_PATTERN, content):
+        new_obj = replacements.get(match.group(0))
+        if new_obj is not None:
+            yield content[last:match.start()]
+            yield new_obj
+            last = match.end()
+    yield content[last:]
+
 def extract_sentences_from_js(filepath):
     """Extract sentence data from a JS file."""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
     # Find all sentence objects
-    pattern = r"\{\s*id:\s*'([^']+)',\s*romanian:\s*'([^']*)',\s*english:\s*'([^']*)',\s*difficulty:\s*(\d+),\s*wordCount:\s*(\d+),\s*hasAudio:\s*(true|false),\s*audioUrl:\s*(null|'[^']*')\s*\}"
-
     sentences = []
-    for match in re.finditer(pattern, content):
+    for match in re.finditer(SENTENCE_PATTERN, content):
         sentences.append({
             'id': match.group(1),
             'romanian': match.group(2).replace("\\'", "'"),
@@ -102,6 +147,7 @@ def update_js_file(filepath, sentences, tatoeba_db, audio_ids):
 
     matches_found = 0
     audio_added = 0
+    replacements = {}
 
     for sent in updated_sentences:
         normalized = normalize_text(sent['romanian'])
@@ -127,49 +173,84 @@ def update_js_file(filepath, sentences, tatoeba_db, audio_ids):
                     f"audioUrl: '{audio_url}'"
                 )
 
-                content = content.replace(old_pattern, new_obj)
+                replacements[old_pattern] = new_obj
 
     # Write updated content
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(content)
+    artifacts.write_chunks(filepath, replaced_chunks(content, replacements), track=False)
 
     return matches_found, audio_added
 
+def update_file(filepath, shared):
+    """file_pool worker: update one file if it exists. Returns its counts, or None."""
+    if not os.path.exists(filepath):
+        return None
+    tatoeba_db, audio_ids = shared
+    return update_js_file(filepath, None, tatoeba_db, audio_ids)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Add Tatoeba audio URLs to the existing level files.")
+    parser.add_argument('--daemon', metavar='ADDRESS',
+                        help="look sentences up in a running tatoeba_daemon.py (http://host:port or unix:PATH)")
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help="level or shard files to update (default: beginner.js, intermediate.js, advanced.js)")
+    file_pool.add_arguments(parser)
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    metrics.configure(args, 'add_audio_to_existing')
+
     print("=" * 60)
     print("Add Audio URLs to Existing Tatoeba Sentences")
     print("=" * 60)
 
-    # Load Tatoeba data
-    tatoeba_db = load_romanian_sentences()
-    if not tatoeba_db:
-        return
-
-    audio_ids = load_audio_ids()
-    if not audio_ids:
-        return
+    files = args.files or [os.path.join(DATA_DIR, name) for name in ('beginner.js', 'intermediate.js', 'advanced.js')]
 
-    # Filter to only Romanian audio
-    ron_ids = set(data[0] for data in tatoeba_db.values())
-    audio_ids = audio_ids.intersection(ron_ids)
-    print(f"  {len(audio_ids)} Romanian sentences have audio")
+    # Load Tatoeba data
+    if args.daemon:
+        with metrics.stage('query daemon'):
+            filepaths = [f for f in files if os.path.exists(f)]
+            tatoeba_db, audio_ids = load_from_daemon(args.daemon, filepaths)
+    else:
+        with metrics.stage('load romanian sentences'):
+            tatoeba_db = load_romanian_sentences()
+        if not tatoeba_db:
+            return
+
+        with metrics.stage('load audio ids'):
+            audio_ids = load_audio_ids()
+        if not audio_ids:
+            return
+
+        # Filter to only Romanian audio
+        ron_ids = set(data[0] for data in tatoeba_db.values())
+        audio_ids = audio_ids.intersection(ron_ids)
+        print(f"  {len(audio_ids)} Romanian sentences have audio")
 
     # Update each file
-    files = ['beginner.js', 'intermediate.js', 'advanced.js']
 
     total_matches = 0
     total_audio = 0
 
-    print("\nUpdating files...")
-    for filename in files:
-        filepath = os.path.join(DATA_DIR, filename)
-        if os.path.exists(filepath):
-            matches, audio = update_js_file(filepath, None, tatoeba_db, audio_ids)
-            print(f"  {filename}: {matches} matches found, {audio} with audio")
-            total_matches += matches
-            total_audio += audio
-        else:
+    print(f"\nUpdating {len(files)} files ({min(args.workers, len(files))} workers)...")
+    with metrics.stage('update files') as stage:
+        results = file_pool.map_files(update_file, files, (tatoeba_db, audio_ids), args.workers)
+        stage.rows = sum(counts[0] for counts in results if counts)
+    for filepath, counts in zip(files, results):
+        filename = filepath if args.files else os.path.basename(filepath)
+        if counts is None:
             print(f"  {filename}: not found")
+            continue
+        matches, audio = counts
+        print(f"  {filename}: {matches} matches found, {audio} with audio")
+        total_matches += matches
+        total_audio += audio
+
+    metrics.count('matches', total_matches)
+    metrics.count('audio urls added', total_audio)
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
 
     print("\n" + "=" * 60)
     print(f"Total: {total_matches} matches, {total_audio} audio URLs added")
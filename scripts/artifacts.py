@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Generated Artifact Manifest
+
+Content hashes for the generated data files in src/data, so generators only
+rewrite files whose content changed and deploys can cache by content.
+
+    import artifacts
+
+    date_str = artifacts.build_date(artifacts.file_dates(source_paths))
+    if not artifacts.write_text(path, text):
+        print("  unchanged")
+
+write_text() leaves a file alone (mtime included) when its bytes would not
+change, so Vite's build cache and CDN caches stay warm across runs.
+Generation dates come from source metadata (download Last-Modified times,
+dates in the input files' headers, or SOURCE_DATE_EPOCH), never the clock,
+so unchanged inputs produce byte-identical outputs.
+
+src/data/manifest.json maps every file under src/data to its sha256, size
+and a content-hashed name (beginner.js -> beginner.3f9a1c2b7d.js) for
+long-lived immutable caching. --emit-hashed copies files out under those
+names; hashed copies suit leaf modules and JSON, not modules that import
+siblings by relative path.
+
+Usage:
+    python scripts/artifacts.py                          # refresh the manifest
+    python scripts/artifacts.py --check                  # exit 1 if it is stale
+    python scripts/artifacts.py --emit-hashed public/data
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DATA_ROOT = os.path.join(PROJECT_DIR, "src", "data")
+MANIFEST_PATH = os.path.join(DATA_ROOT, "manifest.json")
+
+# Hex digits of the sha256 used in hashed file names
+HASHED_NAME_LENGTH = 10
+
+# Dates written into generated file headers (Generated:, Consolidated:, ...)
+HEADER_DATE_RE = re.compile(r'\b(?:Generated|Consolidated|Added):?\s+(\d{4}-\d{2}-\d{2})\b')
+# Headers are at the top; don't read whole files for them
+HEADER_BYTES = 2048
+# Read size when hashing existing files
+HASH_BLOCK_BYTES = 1 << 16
+
+# Entries collected by open batch() blocks, innermost last
+_batches = []
+
+
+def content_hash(data):
+    """sha256 hex digest of bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_hash(path):
+    """sha256 of a file's bytes, or None if it doesn't exist."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hashed_name(relpath, digest):
+    """beginner.js + digest -> beginner.<first 10 hex>.js"""
+    root, ext = os.path.splitext(relpath)
+    return f"{root}.{digest[:HASHED_NAME_LENGTH]}{ext}"
+
+
+def artifact_key(path):
+    """Manifest key (path under src/data, '/'-separated), or None outside it."""
+    relpath = os.path.relpath(os.path.abspath(path), DATA_ROOT)
+    if relpath.startswith('..') or os.path.isabs(relpath):
+        return None
+    return relpath.replace(os.sep, '/')
+
+
+def build_date(candidates=()):
+    """
+    The generation date for a header: SOURCE_DATE_EPOCH when set, otherwise
+    the latest source date in `candidates` (datetimes or 'YYYY-MM-DD'
+    strings). Falls back to today only when no source date is known.
+    """
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc).strftime('%Y-%m-%d')
+    dates = [c.strftime('%Y-%m-%d') if isinstance(c, datetime) else c for c in candidates if c]
+    if dates:
+        return max(dates)
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+
+def file_dates(paths):
+    """Modification dates (UTC) of the source files that exist."""
+    return [
+        datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+        for path in paths if path and os.path.exists(path)
+    ]
+
+
+def header_dates(paths):
+    """Dates in the headers of generated input files (Generated: ..., Consolidated: ...)."""
+    dates = []
+    for path in paths:
+        if path and os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                dates.extend(HEADER_DATE_RE.findall(f.read(HEADER_BYTES)))
+    return dates
+
+
+def set_source_time(path, last_modified):
+    """Stamp a downloaded file with the server's Last-Modified header, if any."""
+    from email.utils import parsedate_to_datetime
+
+    if not last_modified:
+        return
+    try:
+        stamp = parsedate_to_datetime(last_modified).timestamp()
+    except (TypeError, ValueError):
+        return
+    os.utime(path, (time.time(), stamp))
+
+
+def load_manifest(path=MANIFEST_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, path=MANIFEST_PATH):
+    """Write the manifest; returns False (and leaves the file alone) if unchanged."""
+    text = json.dumps(manifest, indent=2, sort_keys=True) + '\n'
+    return write_bytes(path, text.encode('utf-8'), track=False)
+
+
+def manifest_entry(relpath, digest, size):
+    return {'sha256': digest, 'bytes': size, 'hashed': hashed_name(relpath, digest)}
+
+
+def _update_manifest(entries):
+    """Apply {key: entry} to the manifest, saving it once if anything changed."""
+    manifest = load_manifest()
+    changed = {key: entry for key, entry in entries.items() if manifest.get(key) != entry}
+    if changed:
+        manifest.update(changed)
+        save_manifest(manifest)
+
+
+def record(path, digest, size):
+    """Update one file's manifest entry (files outside src/data aren't tracked)."""
+    key = artifact_key(path)
+    if key is None or os.path.abspath(path) == os.path.abspath(MANIFEST_PATH):
+        return
+    entry = manifest_entry(key, digest, size)
+    if _batches:
+        _batches[-1][key] = entry
+    else:
+        _update_manifest({key: entry})
+
+
+@contextmanager
+def batch():
+    """
+    Collect the manifest entries of tracked writes in the block and save
+    manifest.json once at the end, instead of once per file:
+
+        with artifacts.batch():
+            for name, content in shards:
+                artifacts.write_text(os.path.join(out_dir, name), content)
+
+    Decorating a bulk writer with @artifacts.batch() does the same for each
+    call.
+    """
+    _batches.append({})
+    try:
+        yield
+    finally:
+        entries = _batches.pop()
+        if _batches:
+            _batches[-1].update(entries)
+        elif entries:
+            _update_manifest(entries)
+
+
+def write_bytes(path, data, track=True):
+    """
+    Write `data` to `path` unless the file already holds exactly these bytes.
+    Returns True if the file was written.
+    """
+    digest = content_hash(data)
+    changed = file_hash(path) != digest
+    if changed:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        partial_path = path + '.tmp'
+        with open(partial_path, 'wb') as f:
+            f.write(data)
+        os.replace(partial_path, path)
+    if track:
+        record(path, digest, len(data))
+    return changed
+
+
+def write_text(path, text, track=True):
+    """write_bytes() for UTF-8 text (newlines are written as-is)."""
+    return write_bytes(path, text.encode('utf-8'), track)
+
+
+def write_chunks(path, chunks, track=True):
+    """
+    write_text() for text produced in pieces (e.g. batches of rendered
+    rows). The chunks stream through the temp file while being hashed, so
+    the whole text is never held in memory; an unchanged file is left
+    alone. Returns True if the file was written.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    digest = hashlib.sha256()
+    size = 0
+    partial_path = path + '.tmp'
+    with open(partial_path, 'wb') as f:
+        for chunk in chunks:
+            data = chunk.encode('utf-8')
+            digest.update(data)
+            size += len(data)
+            f.write(data)
+    digest = digest.hexdigest()
+    changed = file_hash(path) != digest
+    if changed:
+        os.replace(partial_path, path)
+    else:
+        os.remove(partial_path)
+    if track:
+        record(path, digest, size)
+    return changed
+
+
+def iter_data_files(data_root=DATA_ROOT):
+    """Every file under src/data except the manifest, as (key, path)."""
+    for root, dirs, files in os.walk(data_root):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if os.path.abspath(path) != os.path.abspath(MANIFEST_PATH) and not name.endswith('.tmp'):
+                yield os.path.relpath(path, data_root).replace(os.sep, '/'), path
+
+
+def scan(data_root=DATA_ROOT):
+    """A fresh manifest for everything under src/data."""
+    manifest = {}
+    for key, path in iter_data_files(data_root):
+        manifest[key] = manifest_entry(key, file_hash(path), os.path.getsize(path))
+    return manifest
+
+
+def refresh():
+    """
+    Bring manifest.json up to date with src/data (new, changed and removed
+    files). Returns the number of entries that changed.
+    """
+    old = load_manifest()
+    new = scan()
+    changed = sum(1 for key in old.keys() | new.keys() if old.get(key) != new.get(key))
+    if changed:
+        save_manifest(new)
+    return changed
+
+
+def emit_hashed(out_dir, manifest=None):
+    """Copy every artifact to out_dir under its hashed name. Returns the count copied."""
+    manifest = manifest if manifest is not None else load_manifest()
+    copied = 0
+    for key, entry in manifest.items():
+        target = os.path.join(out_dir, *entry['hashed'].split('/'))
+        # Hashed names are immutable: an existing copy is already right
+        if os.path.exists(target):
+            continue
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copyfile(os.path.join(DATA_ROOT, *key.split('/')), target)
+        copied += 1
+    return copied
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Refresh the content-hash manifest for src/data.")
+    parser.add_argument('--check', action='store_true', help="don't write; exit 1 if the manifest is stale")
+    parser.add_argument('--emit-hashed', metavar='DIR', help="copy artifacts into DIR under their hashed names")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    print("=" * 60)
+    print("Generated Artifact Manifest")
+    print("=" * 60)
+
+    if args.check:
+        manifest = load_manifest()
+        current = scan()
+        stale = sorted(key for key in manifest.keys() | current.keys() if manifest.get(key) != current.get(key))
+        for key in stale[:20]:
+            print(f"  stale: {key}")
+        print(f"\n{len(stale)} stale entries" if stale else "\nManifest is up to date.")
+        sys.exit(1 if stale else 0)
+
+    print("\nStep 1: Hashing src/data...")
+    changed = refresh()
+    manifest = load_manifest()
+    print(f"  {len(manifest)} artifacts, {changed} entries changed")
+
+    if args.emit_hashed:
+        print(f"\nStep 2: Copying hashed files to {args.emit_hashed}...")
+        print(f"  {emit_hashed(args.emit_hashed, manifest)} new files")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Manifest at {MANIFEST_PATH}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
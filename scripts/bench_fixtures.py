@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Synthetic Benchmark Fixtures
+
+Generates seeded, offline stand-ins for the files the data scripts read,
+in the same formats as the real Tatoeba and HuggingFace exports:
+
+    ron_sentences.tsv.bz2      id, 'ron', text
+    eng_sentences.tsv.bz2      id, 'eng', text
+    links.tar.bz2              links.csv: id, id (sorted by first id)
+    sentences_with_audio.csv   audio_id, sentence_id, username, license, url
+    level.js                   a generated level file (tat-N / tat-ext-N)
+    hf/rows-{offset}-{length}.json   ro-stories row pages
+
+`rows` is the number of translation links; sentence counts scale with it
+(half as many sentence ids, a quarter of them Romanian). The same seed and
+row count always produce byte-identical files, so fixtures are cached under
+scripts/temp/bench and reused.
+
+Usage:
+    python scripts/bench_fixtures.py --rows 10000
+    python scripts/bench_fixtures.py --rows 1000000 --seed 7
+"""
+
+import argparse
+import bz2
+import json
+import os
+import random
+import tarfile
+
+import metrics
+from process_rostories import AUTHOR_CONFIG
+from js_emit import escape
+from process_tatoeba import calculate_difficulty
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
+BENCH_DIR = os.path.join(TEMP_DIR, "bench")
+
+FIXTURE_VERSION = 1
+DEFAULT_SEED = 42
+
+# Real ro-stories fetches stop at 1500 rows
+HF_ROWS = 1500
+HF_PAGE_SIZE = 100
+
+# Sentence id → language, by id % 4 (Tatoeba's mix is mostly English)
+LANG_BY_MOD = ['ron', 'eng', 'eng', 'fra']
+
+RON_WORDS = (
+    "eu tu el ea noi voi ei ele este sunt era am ai are avem au nu da "
+    "să ar se mă te ne vă și sau dar că care ce cine unde când cum "
+    "casa casă fată fetelor băiat bărbat femeie copil copii mamă tată "
+    "carte cărți școală apă pâine masă drum oraș țară zi noapte timp "
+    "mare mic frumos frumoasă bun bună nou vechi alb negru roșu verde "
+    "merge vine face spune știe vrea poate trebuie vede aude mănâncă "
+    "bea doarme lucrează citește scrie învață vorbește iubește pleacă "
+    "în pe la cu de din pentru fără după înainte lângă sub peste "
+    "foarte mult puțin acum azi mâine ieri aici acolo mereu niciodată"
+).split()
+
+ENG_WORDS = (
+    "I you he she we they is are was am have has not yes and or but "
+    "that which what who where when how house girl boy man woman child "
+    "children mother father book books school water bread table road "
+    "city country day night time big small beautiful good new old "
+    "white black red green goes comes makes says knows wants can must "
+    "sees hears eats drinks sleeps works reads writes learns speaks "
+    "loves leaves in on at with of from for without after before "
+    "very much little now today tomorrow yesterday here there always "
+    "don't can't it's I'm \"quoted\" back\\slash"
+).split()
+
+USERNAMES = ['alina', 'mircea', 'ioana', 'radu', 'elena', 'sorin']
+LICENSES = ['CC BY 4.0', 'CC BY-NC 4.0', 'CC BY-SA 4.0']
+
+
+def fixture_dir(rows, seed=DEFAULT_SEED):
+    """Directory holding the fixtures for a row count and seed."""
+    return os.path.join(BENCH_DIR, f"{rows}-seed{seed}")
+
+
+def lang_of(sentence_id):
+    return LANG_BY_MOD[sentence_id % len(LANG_BY_MOD)]
+
+
+def zipf_weights(n, exponent=1.1):
+    return [1.0 / (rank ** exponent) for rank in range(1, n + 1)]
+
+
+def make_sentence(rng, words, weights, punctuation='.'):
+    """A sentence of 1-40 words, skewed short like Tatoeba."""
+    length = min(40, max(1, int(rng.expovariate(1 / 6)) + 1))
+    text = ' '.join(rng.choices(words, weights=weights, k=length))
+    return text[0].upper() + text[1:] + punctuation
+
+
+def write_sentences(path, rng, lang, n_ids, words):
+    """Write a bz2 TSV with a sentence for every id of one language."""
+    weights = zipf_weights(len(words))
+    with bz2.open(path, 'wt', encoding='utf-8') as f:
+        for sentence_id in range(n_ids):
+            if lang_of(sentence_id) == lang:
+                punctuation = rng.choice('...?!')
+                f.write(f"{sentence_id}\t{lang}\t{make_sentence(rng, words, weights, punctuation)}\n")
+
+
+def write_links(path, rng, n_ids, rows, temp_csv):
+    """
+    Write links.tar.bz2 with `rows` links, in id order.
+
+    Romanian ids link to English ones and back; other languages link among
+    themselves, so the Romanian-English join has misses to skip.
+    """
+    per_id = rows / n_ids
+    written = 0
+    with open(temp_csv, 'w', encoding='utf-8') as f:
+        for sentence_id in range(n_ids):
+            if written >= rows:
+                break
+            count = min(rows - written, int(per_id) + (rng.random() < per_id % 1))
+            lang = lang_of(sentence_id)
+            for _ in range(count):
+                target = rng.randrange(n_ids)
+                if lang == 'ron':
+                    target += (1 - target % 4) % 4  # an English id
+                elif lang == 'eng':
+                    target -= target % 4  # a Romanian id
+                else:
+                    target += (3 - target % 4) % 4
+                f.write(f"{sentence_id}\t{target}\n")
+            written += count
+
+    with tarfile.open(path, 'w:bz2') as tar:
+        tar.add(temp_csv, arcname='links.csv')
+    os.remove(temp_csv)
+    return written
+
+
+def write_audio(path, rng, n_ids):
+    """Audio rows for ~10% of Romanian and ~5% of other sentences."""
+    audio_id = 1
+    with open(path, 'w', encoding='utf-8') as f:
+        for sentence_id in range(n_ids):
+            chance = 0.1 if lang_of(sentence_id) == 'ron' else 0.05
+            if rng.random() < chance:
+                user = rng.choice(USERNAMES)
+                f.write(f"{audio_id}\t{sentence_id}\t{user}\t{rng.choice(LICENSES)}\t\\N\n")
+                audio_id += 1
+
+
+def write_level_file(path, rng, n_ids, count):
+    """A level file in generate_js_file's format with `count` sentences."""
+    ron_weights = zipf_weights(len(RON_WORDS))
+    eng_weights = zipf_weights(len(ENG_WORDS))
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("/**\n * Synthetic benchmark level file\n */\n\nexport const TATOEBA_BENCH = [\n")
+        for i in range(count):
+            ron_id = rng.randrange(max(n_ids // 4, 1)) * 4
+            romanian = make_sentence(rng, RON_WORDS, ron_weights)
+            english = make_sentence(rng, ENG_WORDS, eng_weights)
+            has_audio = rng.random() < 0.3
+            audio_url = f"'https://audio.tatoeba.org/sentences/ron/{ron_id}.mp3'" if has_audio else 'null'
+            sentence_id = f"tat-ext-{ron_id}" if i % 2 else f"tat-{ron_id}"
+            f.write(f"  {{ id: '{sentence_id}', romanian: '{escape(romanian)}', "
+                    f"english: '{escape(english)}', difficulty: {calculate_difficulty(romanian)}, "
+                    f"wordCount: {len(romanian.split())}, hasAudio: {str(has_audio).lower()}, audioUrl: {audio_url} }}")
+            f.write(',\n' if i < count - 1 else '\n')
+        f.write('];\n')
+
+
+def write_hf_pages(hf_dir, rng):
+    """ro-stories row pages as the datasets-server /rows endpoint returns them."""
+    os.makedirs(hf_dir, exist_ok=True)
+    authors = list(AUTHOR_CONFIG) + ['Autor Necunoscut']
+    weights = zipf_weights(len(RON_WORDS))
+    titles = [f"Povestea {i}" for i in range(HF_ROWS // 4)]
+
+    for offset in range(0, HF_ROWS, HF_PAGE_SIZE):
+        rows = []
+        for row_idx in range(offset, offset + HF_PAGE_SIZE):
+            sentences = [make_sentence(rng, RON_WORDS, weights) for _ in range(rng.randint(4, 60))]
+            paragraph = ' '.join(sentences)
+            rows.append({
+                'row_idx': row_idx,
+                'row': {
+                    'title': rng.choice(titles),
+                    'author': rng.choice(authors),
+                    'paragraph': paragraph,
+                    'word_count': len(paragraph.split()),
+                },
+                'truncated_cells': [],
+            })
+        page = {'features': [], 'rows': rows, 'num_rows_total': HF_ROWS, 'num_rows_per_page': HF_PAGE_SIZE}
+        with open(os.path.join(hf_dir, f"rows-{offset}-{HF_PAGE_SIZE}.json"), 'w', encoding='utf-8') as f:
+            json.dump(page, f, ensure_ascii=False)
+
+
+def generate_fixtures(rows, seed=DEFAULT_SEED, verbose=True):
+    """
+    Generate (or reuse) the fixture set for `rows` links.
+
+    Returns the fixture directory.
+    """
+    out_dir = fixture_dir(rows, seed)
+    manifest_path = os.path.join(out_dir, 'fixture.json')
+    params = {'version': FIXTURE_VERSION, 'rows': rows, 'seed': seed}
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            if json.load(f).get('params') == params:
+                if verbose:
+                    print(f"  Using cached fixtures: {out_dir}")
+                return out_dir
+
+    os.makedirs(out_dir, exist_ok=True)
+    n_ids = max(rows // 2, 8)
+    rng = random.Random(seed)
+    timings = {}
+
+    def timed(name, fn, *args):
+        with metrics.stage(name) as stage:
+            fn(*args)
+        timings[name] = round(stage.seconds, 2)
+        if verbose:
+            print(f"  {name}: {timings[name]}s")
+
+    timed('ron_sentences.tsv.bz2', write_sentences,
+          os.path.join(out_dir, 'ron_sentences.tsv.bz2'), rng, 'ron', n_ids, RON_WORDS)
+    timed('eng_sentences.tsv.bz2', write_sentences,
+          os.path.join(out_dir, 'eng_sentences.tsv.bz2'), rng, 'eng', n_ids, ENG_WORDS)
+    timed('links.tar.bz2', write_links,
+          os.path.join(out_dir, 'links.tar.bz2'), rng, n_ids, rows, os.path.join(out_dir, 'links.tmp'))
+    timed('sentences_with_audio.csv', write_audio,
+          os.path.join(out_dir, 'sentences_with_audio.csv'), rng, n_ids)
+    timed('level.js', write_level_file,
+          os.path.join(out_dir, 'level.js'), rng, n_ids, max(rows // 20, 100))
+    timed('hf pages', write_hf_pages, os.path.join(out_dir, 'hf'), rng)
+
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump({'params': params, 'generation_seconds': timings}, f, indent=2)
+    return out_dir
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Generate synthetic benchmark fixtures.")
+    parser.add_argument('--rows', type=int, default=10_000, help="translation link rows (default: 10000)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help=f"random seed (default: {DEFAULT_SEED})")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'bench_fixtures')
+
+    print("=" * 60)
+    print(f"Benchmark Fixtures ({args.rows} rows, seed {args.seed})")
+    print("=" * 60)
+
+    out_dir = generate_fixtures(args.rows, args.seed)
+
+    print("\n" + "=" * 60)
+    print(f"Done! Fixtures in {out_dir}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
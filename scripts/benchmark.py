@@ -0,0 +1,592 @@
+#!/usr/bin/env python3
+"""
+Data Script Benchmarks
+
+Times each stage of the Tatoeba and ro-stories pipelines against seeded
+synthetic fixtures (see bench_fixtures.py), records peak traced memory and
+compares the results with a stored baseline. Runs fully offline: the
+scripts read the fixtures through their usual cached-download paths and
+ro-stories pages are fetched from file:// URLs.
+
+Scales: small = 10k links, medium = 1M, large = 20M.
+
+A stage regresses when its time or its peak memory grows past --tolerance.
+When a change moves a stage on purpose, rerun with --save-baseline (at
+each scale the baseline holds) and commit benchmark_baseline.json with
+the change.
+
+Usage:
+    python scripts/benchmark.py                          # small scale
+    python scripts/benchmark.py --scale medium --repeat 1
+    python scripts/benchmark.py --save-baseline          # record this run
+    python scripts/benchmark.py --check                  # exit 1 on regression
+    python scripts/benchmark.py --record-memory          # dict vs namedtuple records
+    python scripts/benchmark.py --emit                   # JS emitter round trip and throughput
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import pathlib
+import random
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import add_audio_to_existing
+import artifacts
+import metrics
+import consolidate_audio_only
+import fix_audio_urls
+import process_rostories
+import process_tatoeba
+from bench_fixtures import DEFAULT_SEED, ENG_WORDS, RON_WORDS, generate_fixtures, make_sentence, zipf_weights
+from merge_stories import load_addition_file, parse_story_entries
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PATH = os.path.join(SCRIPT_DIR, "benchmark_baseline.json")
+
+SCALES = {
+    'small': 10_000,
+    'medium': 1_000_000,
+    'large': 20_000_000,
+}
+
+# A stage regresses when it is this much slower than baseline...
+DEFAULT_TOLERANCE = 0.25
+# ...and slower by at least this many seconds (ignores timer noise).
+# Peak memory is held to the same tolerance past this many MB.
+MIN_REGRESSION_SECONDS = 0.05
+MIN_REGRESSION_MB = 0.5
+
+# Records built per layout by --record-memory
+RECORD_MEMORY_COUNT = 1_000_000
+
+# Rows in the level file timed by --emit, and rows read back to check the round trip
+EMIT_ROWS = 1_000_000
+ROUND_TRIP_ROWS = 20_000
+# Distinct texts cycled through the emitted rows
+EMIT_TEXTS = 4096
+# Characters the escapers have to get through intact
+EMIT_HAZARDS = ("'", '"', '\\', '\n', '\r', '`', '$', '${', '\t', '\u2028', '*/', 'ș', 'ț', '😀')
+
+
+def point_scripts_at(fixtures, work_dir):
+    """Make the scripts read fixtures and write into the work directory."""
+    process_tatoeba.TEMP_DIR = fixtures
+    process_tatoeba.DATA_DIR = work_dir
+    fix_audio_urls.TEMP_DIR = fixtures
+    add_audio_to_existing.TEMP_DIR = fixtures
+    hf_dir = pathlib.Path(fixtures, 'hf').as_uri()
+    process_rostories.HF_API_URL = hf_dir + '/rows-{offset}-{length}.json'
+    # The fixtures are /rows pages only; time the local-filter path
+    process_rostories.HF_FILTER_URL = None
+
+
+def fresh_level_file(ctx):
+    """Copy the fixture level file into the work directory (rewriters edit in place)."""
+    path = os.path.join(ctx['work_dir'], 'level.js')
+    shutil.copyfile(os.path.join(ctx['fixtures'], 'level.js'), path)
+    return path
+
+
+# Each stage: name -> (prepare(ctx) -> args, run(ctx, *args) -> rows processed)
+
+def prepare_load_pairs(ctx):
+    # Measure the links extraction and parse too, not just the cached files
+    for cached in ('links.csv', 'links.bin'):
+        path = os.path.join(ctx['fixtures'], cached)
+        if os.path.exists(path):
+            os.remove(path)
+    return ()
+
+
+def run_load_pairs(ctx):
+    ctx['pairs'] = process_tatoeba.load_ron_eng_pairs()
+    return len(ctx['pairs'])
+
+
+def run_load_audio(ctx):
+    ids = set(p.ron_id for p in ctx['pairs'])
+    ctx['audio_ids'] = process_tatoeba.load_audio_sentences(ids)
+    return len(ids)
+
+
+def run_calculate_difficulty(ctx):
+    for pair in ctx['pairs']:
+        process_tatoeba.calculate_difficulty(pair.romanian)
+    return len(ctx['pairs'])
+
+
+def run_process_sentences(ctx):
+    ctx['sentences'] = process_tatoeba.process_sentences(ctx['pairs'], ctx['audio_ids'])
+    return len(ctx['sentences'])
+
+
+def prepare_split(ctx):
+    # split_by_difficulty sorts its input in place
+    return (list(ctx['sentences']),)
+
+
+def run_split(ctx, sentences):
+    ctx['groups'] = process_tatoeba.split_by_difficulty(sentences)
+    return len(sentences)
+
+
+def run_generate_js(ctx):
+    sentences = ctx['sentences']
+    process_tatoeba.generate_js_file(sentences, 'beginner', 'bench_extended.js')
+    return len(sentences)
+
+
+def run_load_audio_map(ctx):
+    ron_ids = fix_audio_urls.load_romanian_sentence_ids()
+    ctx['audio_map'] = fix_audio_urls.load_sentence_to_audio_map(ron_ids)
+    return len(ron_ids)
+
+
+def run_fix_audio_urls(ctx, path):
+    fix_audio_urls.update_js_file(path, ctx['audio_map'])
+    return ctx['level_rows']
+
+
+def run_load_romanian_db(ctx):
+    ctx['tatoeba_db'] = add_audio_to_existing.load_romanian_sentences()
+    ctx['all_audio_ids'] = add_audio_to_existing.load_audio_ids()
+    return len(ctx['tatoeba_db'])
+
+
+def run_add_audio(ctx, path):
+    add_audio_to_existing.update_js_file(path, None, ctx['tatoeba_db'], ctx['all_audio_ids'])
+    return ctx['level_rows']
+
+
+def run_extract_sentences(ctx, path):
+    return len(consolidate_audio_only.extract_sentences(path))
+
+
+def run_process_stories(ctx):
+    return len(process_rostories.process_stories())
+
+
+STAGES = [
+    ('tatoeba.load_ron_eng_pairs', prepare_load_pairs, run_load_pairs),
+    ('tatoeba.load_audio_sentences', None, run_load_audio),
+    ('tatoeba.calculate_difficulty', None, run_calculate_difficulty),
+    ('tatoeba.process_sentences', None, run_process_sentences),
+    ('tatoeba.split_by_difficulty', prepare_split, run_split),
+    ('tatoeba.generate_js_file', None, run_generate_js),
+    ('fix_audio_urls.load_sentence_to_audio_map', None, run_load_audio_map),
+    ('fix_audio_urls.update_js_file', lambda ctx: (fresh_level_file(ctx),), run_fix_audio_urls),
+    ('add_audio.load_romanian_sentences', None, run_load_romanian_db),
+    ('add_audio.update_js_file', lambda ctx: (fresh_level_file(ctx),), run_add_audio),
+    ('consolidate.extract_sentences', lambda ctx: (fresh_level_file(ctx),), run_extract_sentences),
+    ('rostories.process_stories', None, run_process_stories),
+]
+
+
+def measure(ctx, prepare, run, repeat, memory):
+    """
+    Run a stage `repeat` times (best time wins) and once more under
+    tracemalloc when `memory` is set. Returns (seconds, peak_bytes, rows).
+    """
+    best = None
+    rows = 0
+    quiet = io.StringIO()
+    for _ in range(repeat):
+        args = prepare(ctx) if prepare else ()
+        gc.collect()
+        with contextlib.redirect_stdout(quiet):
+            start = time.perf_counter()
+            rows = run(ctx, *args)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    peak = None
+    if memory:
+        args = prepare(ctx) if prepare else ()
+        gc.collect()
+        tracemalloc.start()
+        with contextlib.redirect_stdout(quiet):
+            run(ctx, *args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return best, peak, rows
+
+
+def run_suite(fixtures, repeat=3, memory=True, only=None):
+    """Benchmark every stage against a fixture directory."""
+    work_dir = os.path.join(fixtures, 'work')
+    os.makedirs(work_dir, exist_ok=True)
+    point_scripts_at(fixtures, work_dir)
+
+    with open(os.path.join(fixtures, 'level.js'), 'r', encoding='utf-8') as f:
+        level_rows = sum(1 for line in f if line.startswith('  { id:'))
+
+    ctx = {'fixtures': fixtures, 'work_dir': work_dir, 'level_rows': level_rows}
+    results = {}
+    for name, prepare, run in STAGES:
+        # Later stages depend on earlier ones, so filtered-out stages still
+        # run once (untimed) to fill in the context
+        if only and not any(pattern in name for pattern in only):
+            with contextlib.redirect_stdout(io.StringIO()):
+                run(ctx, *(prepare(ctx) if prepare else ()))
+            continue
+        seconds, peak, count = measure(ctx, prepare, run, repeat, memory)
+        results[name] = {
+            'seconds': round(seconds, 4),
+            'peak_mb': round(peak / 2**20, 2) if peak is not None else None,
+            'rows': count,
+            'rows_per_second': round(count / seconds) if seconds > 0 else None,
+        }
+        peak_text = f"{results[name]['peak_mb']:>9.1f}MB" if peak is not None else ''
+        print(f"  {name:<44} {seconds:>9.3f}s {count:>10} rows{peak_text}")
+
+    shutil.rmtree(work_dir, ignore_errors=True)
+    return results
+
+
+def record_layouts():
+    """
+    (name, old dict builder, record builder) for the pipeline's records. Field
+    values are shared across records so only the containers are measured.
+    """
+    ron_id, eng_id, sentence_id = '1234567', '7654321', 'tat-1234567'
+    romanian, english = 'Pisica doarme pe canapea.', 'The cat is sleeping on the couch.'
+    audio_url = 'https://audio.tatoeba.org/sentences/ron/1234567.mp3'
+    return [
+        ('Pair',
+         lambda: {'ron_id': ron_id, 'romanian': romanian, 'eng_id': eng_id, 'english': english},
+         lambda: process_tatoeba.Pair(ron_id, romanian, eng_id, english)),
+        ('Sentence',
+         lambda: {'id': sentence_id, 'romanian': romanian, 'english': english, 'difficulty': 3,
+                  'wordCount': 5, 'hasAudio': True, 'audioUrl': audio_url},
+         lambda: process_tatoeba.Sentence(sentence_id, romanian, english, 3, 5, True, audio_url)),
+    ]
+
+
+def traced_bytes(build, count):
+    """Memory held by a list of `count` records from build()."""
+    gc.collect()
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    records = [build() for _ in range(count)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del records
+    return after - before
+
+
+def record_memory(count=RECORD_MEMORY_COUNT):
+    """Compare dict and namedtuple records. Returns {name: {...}}."""
+    results = {}
+    for name, old, new in record_layouts():
+        dict_bytes = traced_bytes(old, count)
+        tuple_bytes = traced_bytes(new, count)
+        results[name] = {
+            'dict_mb': round(dict_bytes / 2**20, 1),
+            'record_mb': round(tuple_bytes / 2**20, 1),
+            'dict_bytes_per_record': round(dict_bytes / count),
+            'record_bytes_per_record': round(tuple_bytes / count),
+        }
+        saved = 1 - tuple_bytes / dict_bytes
+        print(f"  {name:<10} dict {dict_bytes / count:>6.0f} B/record ({dict_bytes / 2**20:>6.1f}MB)  "
+              f"namedtuple {tuple_bytes / count:>6.0f} B/record ({tuple_bytes / 2**20:>6.1f}MB)  "
+              f"{saved:.0%} smaller")
+    return results
+
+
+def emit_sentences(count, seed=DEFAULT_SEED):
+    """Sentence records whose texts mix fixture words with escape hazards."""
+    rng = random.Random(seed)
+    ron_weights = zipf_weights(len(RON_WORDS))
+    eng_weights = zipf_weights(len(ENG_WORDS))
+    texts = []
+    for _ in range(EMIT_TEXTS):
+        romanian = make_sentence(rng, RON_WORDS, ron_weights)
+        english = make_sentence(rng, ENG_WORDS, eng_weights)
+        if rng.random() < 0.5:
+            romanian += rng.choice(EMIT_HAZARDS) + make_sentence(rng, RON_WORDS, ron_weights)
+            english = rng.choice(EMIT_HAZARDS).join(english.split(' ', 1))
+        texts.append((romanian, english))
+    sentences = []
+    for i in range(count):
+        romanian, english = texts[i % EMIT_TEXTS]
+        has_audio = i % 3 == 0
+        audio_url = f"https://audio.tatoeba.org/sentences/ron/{i}.mp3" if has_audio else None
+        sentences.append(process_tatoeba.Sentence(f"tat-{i}", romanian, english, i % 10 + 1,
+                                                  len(romanian.split()), has_audio, audio_url))
+    return sentences
+
+
+def chained_escape(s):
+    """process_tatoeba's escaper before js_emit: five chained replaces."""
+    if s is None:
+        return ''
+    s = s.replace('\\', '\\\\')
+    s = s.replace("'", "\\'")
+    s = s.replace('"', '\\"')
+    s = s.replace('\n', '\\n')
+    s = s.replace('\r', '\\r')
+    return s
+
+
+def legacy_emit(path, sentences):
+    """generate_js_file's row loop before js_emit: a whole-file StringIO, three writes per row."""
+    with io.StringIO() as f:
+        for i, s in enumerate(sentences):
+            audio_url = f"'{s.audio_url}'" if s.audio_url else 'null'
+            f.write(f"  {{ id: '{s.id}', romanian: '{chained_escape(s.romanian)}', "
+                    f"english: '{chained_escape(s.translation)}', difficulty: {s.difficulty}, "
+                    f"wordCount: {s.word_count}, hasAudio: {str(s.has_audio).lower()}, audioUrl: {audio_url} }}")
+            if i < len(sentences) - 1:
+                f.write(',')
+            f.write('\n')
+        f.write('];\n')
+        artifacts.write_text(path, f.getvalue())
+
+
+def read_array(path):
+    """Objects in a generated module's array literal, parsed back."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    start = content.find('= [')
+    entries, _ = parse_story_entries(content, start + 3 if start >= 0 else 0)
+    return [entry for entry, _, _ in entries]
+
+
+def round_trip(work_dir, count=ROUND_TRIP_ROWS, seed=DEFAULT_SEED):
+    """
+    Emit hazard-laden rows through each generator and parse them back.
+    Returns a list of (generator, rows checked, mismatches).
+    """
+    sentences = emit_sentences(count, seed)
+    results = []
+
+    process_tatoeba.DATA_DIR = work_dir
+    with contextlib.redirect_stdout(io.StringIO()):
+        process_tatoeba.generate_js_file(sentences, 'beginner', 'round_trip.js')
+    parsed = read_array(os.path.join(work_dir, 'round_trip.js'))
+    mismatches = sum(
+        1 for s, e in zip(sentences, parsed)
+        if (e['id'], e['romanian'], e['english'], e['difficulty'], e['wordCount'], e['hasAudio'], e['audioUrl'])
+        != (s.id, s.romanian, s.translation, s.difficulty, s.word_count, s.has_audio, s.audio_url)
+    )
+    results.append(('process_tatoeba.generate_js_file', len(parsed), mismatches + abs(len(parsed) - count)))
+
+    records = [{'id': s.id, 'romanian': s.romanian, 'english': s.translation, 'difficulty': s.difficulty,
+                'wordCount': s.word_count, 'hasAudio': s.has_audio, 'audioUrl': s.audio_url}
+               for s in sentences]
+    path = os.path.join(work_dir, 'consolidated.js')
+    consolidate_audio_only.write_js_file(path, records, 'TATOEBA_ROUND_TRIP', 'Round trip', '1970-01-01')
+    parsed = consolidate_audio_only.extract_sentences(path)
+    mismatches = sum(1 for a, b in zip(records, parsed) if a != b) + abs(len(parsed) - count)
+    results.append(('consolidate_audio_only.write_js_file', len(parsed), mismatches))
+
+    stories = [{'id': f"story-{i}", 'title': s.romanian, 'titleEn': s.translation, 'author': s.romanian,
+                'excerpt': '\n\n'.join((s.romanian, s.translation, s.romanian)), 'difficulty': s.difficulty,
+                'genre': 'folktale', 'era': 'modern', 'wordCount': s.word_count,
+                'source': s.translation, 'license': 'Apache 2.0'}
+               for i, s in enumerate(sentences[:count // 10])]
+    with contextlib.redirect_stdout(io.StringIO()):
+        path = process_rostories.generate_stories_addition(stories, '1970-01-01', work_dir)
+    parsed = load_addition_file(path)
+    mismatches = sum(1 for a, b in zip(stories, parsed) if a != b) + abs(len(parsed) - len(stories))
+    results.append(('process_rostories.generate_stories_addition', len(parsed), mismatches))
+    return results
+
+
+def emit_throughput(work_dir, count=EMIT_ROWS, seed=DEFAULT_SEED):
+    """
+    Time a `count`-row level file through generate_js_file and the
+    pre-js_emit loop. Returns {name: {...}} and whether the bytes matched.
+    """
+    sentences = emit_sentences(count, seed)
+    process_tatoeba.DATA_DIR = work_dir
+    new_path = os.path.join(work_dir, 'emit.js')
+    old_path = os.path.join(work_dir, 'emit_legacy.js')
+    runs = [
+        ('legacy StringIO + replace', old_path, lambda: legacy_emit(old_path, sentences)),
+        ('js_emit', new_path, lambda: process_tatoeba.generate_js_file(sentences, 'beginner', 'emit.js')),
+    ]
+    results = {}
+    for name, path, run in runs:
+        if os.path.exists(path):
+            os.remove(path)
+        gc.collect()
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run()
+            seconds = time.perf_counter() - start
+        os.remove(path)
+        gc.collect()
+        tracemalloc.start()
+        with contextlib.redirect_stdout(io.StringIO()):
+            run()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        size = os.path.getsize(path)
+        results[name] = {
+            'seconds': round(seconds, 3),
+            'rows_per_second': round(count / seconds),
+            'mb_per_second': round(size / 2**20 / seconds, 1),
+            'peak_mb': round(peak / 2**20, 1),
+        }
+        print(f"  {name:<28} {seconds:>7.3f}s {count / seconds:>11,.0f} rows/s "
+              f"{size / 2**20 / seconds:>7.1f}MB/s  peak {peak / 2**20:>7.1f}MB")
+
+    # The legacy file has no header; compare the rows
+    with open(new_path, 'r', encoding='utf-8') as f:
+        new_rows = f.read().split(' = [\n', 1)[1]
+    with open(old_path, 'r', encoding='utf-8') as f:
+        old_rows = f.read()
+    return results, new_rows == old_rows
+
+
+def load_baseline(path=BASELINE_PATH):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def save_baseline(rows, results, path=BASELINE_PATH):
+    baseline = load_baseline(path)
+    baseline[str(rows)] = results
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(baseline, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def compare(results, baseline, tolerance=DEFAULT_TOLERANCE):
+    """Print a comparison table. Returns the names of regressed stages."""
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if not previous:
+            print(f"  {name:<44} (no baseline)")
+            continue
+        ratio = current['seconds'] / previous['seconds'] if previous['seconds'] else float('inf')
+        slower = current['seconds'] - previous['seconds']
+        flag = ''
+        if ratio > 1 + tolerance and slower > MIN_REGRESSION_SECONDS:
+            flag = '  REGRESSION'
+        memory = ''
+        if current.get('peak_mb') is not None and previous.get('peak_mb') is not None:
+            if previous['peak_mb']:
+                memory_ratio = current['peak_mb'] / previous['peak_mb']
+            else:
+                memory_ratio = float('inf') if current['peak_mb'] else 1.0
+            memory = f"  mem {memory_ratio:.2f}x"
+            grown = current['peak_mb'] - previous['peak_mb']
+            if memory_ratio > 1 + tolerance and grown > MIN_REGRESSION_MB:
+                flag = '  MEMORY REGRESSION' if not flag else '  REGRESSION (time, memory)'
+        if flag:
+            regressions.append(name)
+        print(f"  {name:<44} {ratio:>6.2f}x time{memory}{flag}")
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the data scripts on synthetic fixtures.")
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small',
+                        help="fixture size (default: small)")
+    parser.add_argument('--rows', type=int, help="custom link row count (overrides --scale)")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED, help="fixture seed")
+    parser.add_argument('--repeat', type=int, default=3, help="timed runs per stage, best wins (default: 3)")
+    parser.add_argument('--no-memory', action='store_true', help="skip the tracemalloc run")
+    parser.add_argument('--stage', action='append', help="only time stages whose name contains this")
+    parser.add_argument('--save-baseline', action='store_true', help="store this run as the baseline")
+    parser.add_argument('--check', action='store_true', help="exit with status 1 on a regression")
+    parser.add_argument('--record-memory', type=int, nargs='?', const=RECORD_MEMORY_COUNT, metavar='N',
+                        help=f"only compare dict and namedtuple record memory (default N: {RECORD_MEMORY_COUNT})")
+    parser.add_argument('--emit', type=int, nargs='?', const=EMIT_ROWS, metavar='N',
+                        help=f"only check the JS emitter round trip and time an N-row level file "
+                             f"(default N: {EMIT_ROWS})")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help=f"allowed slowdown before flagging (default: {DEFAULT_TOLERANCE})")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'benchmark')
+    rows = args.rows or SCALES[args.scale]
+
+    if args.record_memory:
+        print("=" * 60)
+        print(f"Record Memory ({args.record_memory} records)")
+        print("=" * 60)
+        with metrics.stage('record memory') as stage:
+            record_memory(args.record_memory)
+            stage.rows = args.record_memory
+        return
+
+    if args.emit:
+        print("=" * 60)
+        print(f"JS Emitter ({args.emit} rows, seed {args.seed})")
+        print("=" * 60)
+        with tempfile.TemporaryDirectory() as work_dir:
+            print(f"\nStep 1: Round trip ({ROUND_TRIP_ROWS} rows with escape hazards)...")
+            with metrics.stage('round trip') as stage:
+                checks = round_trip(work_dir, seed=args.seed)
+                stage.rows = sum(rows for _, rows, _ in checks)
+            for name, rows, mismatches in checks:
+                print(f"  {name:<44} {rows:>7} rows  {'lossless' if not mismatches else f'{mismatches} MISMATCHED'}")
+
+            print(f"\nStep 2: Emitting a {args.emit}-row level file...")
+            with metrics.stage('emit') as stage:
+                _, identical = emit_throughput(work_dir, args.emit, args.seed)
+                stage.rows = args.emit
+            print(f"  Rows identical to the legacy writer: {'yes' if identical else 'NO'}")
+
+        failed = not identical or any(mismatches for _, _, mismatches in checks)
+        print("\n" + "=" * 60)
+        print("Emitter check FAILED" if failed else "Done! Round trip lossless.")
+        print("=" * 60)
+        if failed:
+            sys.exit(1)
+        return
+
+    print("=" * 60)
+    print(f"Data Script Benchmarks ({rows} rows, seed {args.seed})")
+    print("=" * 60)
+
+    print("\nStep 1: Preparing fixtures...")
+    with metrics.stage('fixtures'):
+        fixtures = generate_fixtures(rows, args.seed)
+
+    print(f"\nStep 2: Timing stages (best of {args.repeat})...")
+    with metrics.stage('suite'):
+        results = run_suite(fixtures, args.repeat, not args.no_memory, args.stage)
+
+    baseline = load_baseline().get(str(rows), {})
+    regressions = []
+    if baseline:
+        print("\nStep 3: Comparing with baseline...")
+        regressions = compare(results, baseline, args.tolerance)
+
+    if args.save_baseline:
+        save_baseline(rows, results)
+        print(f"\n  Baseline saved to {BASELINE_PATH}")
+
+    print("\n" + "=" * 60)
+    if regressions:
+        print(f"{len(regressions)} stage(s) regressed: {', '.join(regressions)}")
+    else:
+        print("Done! No regressions." if baseline else "Done! (no baseline to compare against)")
+    print("=" * 60)
+
+    if args.check and regressions:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+Deck Pack Builder
+
+Precomputes small, shuffled, difficulty-balanced "deck packs" per level so
+a session can start from one small fetch instead of whole level files, the
+stories chunk and recipes.js.
+
+A pack for level L mixes Tatoeba sentences, story excerpts and recipes
+within the app's content range (L ± CONTENT_RANGE, as in
+filterContentByLevel). Items are shuffled, stably sorted by difficulty and
+dealt round-robin across the level's packs, so every pack gets the same
+spread of difficulties and every eligible item lands in at least one pack
+(types with fewer items than slots are dealt again from the top). Packs are
+seeded, so unchanged inputs rebuild byte-identical files.
+
+Output in src/data/decks:
+    level-<L>/<n>.js   export default {level, sentences, stories, recipes}
+    index.js           pack counts and loadDeck(level)
+
+Story excerpts are trimmed to about EXCERPT_WORDS words; loadStory(id)
+still fetches the full text.
+
+Usage:
+    python scripts/build_deck_packs.py
+    python scripts/build_deck_packs.py --sentences 30 --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import re
+
+import artifacts
+import js_emit
+import metrics
+from build_sentence_index import load_level_sentences
+from merge_stories import JSParseError, load_stories, parse_story_entries
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DATA_DIR = os.path.join(PROJECT_DIR, "src", "data")
+DECKS_DIR = os.path.join(DATA_DIR, "decks")
+RECIPES_PATH = os.path.join(DATA_DIR, "recipes.js")
+
+RECIPES_ARRAY_START = "export const ROMANIAN_RECIPES = ["
+
+LEVELS = range(1, 11)
+# Same window as DIFFICULTY_CONFIG.CONTENT_RANGE in src/utils/difficulty.js
+CONTENT_RANGE = 2
+
+DEFAULT_SENTENCES = 20
+DEFAULT_STORIES = 2
+DEFAULT_RECIPES = 1
+DEFAULT_SEED = 0
+
+# The type whose pool sets a level's pack count
+PRIMARY = 'sentences'
+
+EXCERPT_WORDS = 60
+SENTENCE_END_RE = re.compile(r'(?<=[.!?…])\s+')
+
+# Recipe fields kept in packs (attribution stays in recipes.js)
+RECIPE_FIELDS = ['id', 'title', 'description', 'difficulty', 'category', 'ingredients', 'steps']
+
+
+def load_recipes(path=RECIPES_PATH):
+    """Return the recipes in recipes.js (file order)."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    start = content.find(RECIPES_ARRAY_START)
+    if start < 0:
+        raise JSParseError(f"{RECIPES_ARRAY_START!r} not found in {path}")
+    entries, _ = parse_story_entries(content, start + len(RECIPES_ARRAY_START))
+    return [recipe for recipe, _, _ in entries]
+
+
+def trim_excerpt(text, max_words=EXCERPT_WORDS):
+    """The leading sentences of `text` up to about max_words (at least one sentence)."""
+    kept = []
+    words = 0
+    for sentence in SENTENCE_END_RE.split(' '.join(text.split())):
+        if kept and words + len(sentence.split()) > max_words:
+            break
+        kept.append(sentence)
+        words += len(sentence.split())
+    return ' '.join(kept)
+
+
+def sentence_item(s):
+    """Pack record for a sentence, in the level files' shape."""
+    return {
+        'id': s.id,
+        'romanian': s.romanian,
+        'english': s.translation,
+        'difficulty': s.difficulty,
+        'wordCount': s.word_count,
+        'hasAudio': bool(s.has_audio and s.audio_url),
+        'audioUrl': s.audio_url if s.has_audio else None,
+    }
+
+
+def story_item(story):
+    """Pack record for a story: index metadata plus a short excerpt."""
+    return {
+        'id': story['id'],
+        'title': story.get('title'),
+        'author': story.get('author'),
+        'difficulty': story.get('difficulty'),
+        'genre': story.get('genre'),
+        'wordCount': story.get('wordCount'),
+        'excerpt': trim_excerpt(story.get('excerpt') or ''),
+    }
+
+
+def recipe_item(recipe):
+    return {field: recipe[field] for field in RECIPE_FIELDS if field in recipe}
+
+
+def level_range(level, content_range=CONTENT_RANGE):
+    return max(1, level - content_range), min(10, level + content_range)
+
+
+def eligible(items, level, content_range=CONTENT_RANGE):
+    """Items within the level's content range (missing difficulty counts as 5, like the app)."""
+    low, high = level_range(level, content_range)
+    return [item for item in items if low <= (item.get('difficulty') or 5) <= high]
+
+
+def deal(items, pack_count, per_pack, rng):
+    """
+    Deal items across pack_count packs, at most per_pack each.
+
+    The items are shuffled, then stably sorted by difficulty, so dealing
+    round-robin hands every pack the same difficulty spread. The first
+    len(items) slots cover every item once; remaining slots are dealt again
+    from the top, each taking the next item its pack doesn't hold yet.
+    """
+    order = list(items)
+    rng.shuffle(order)
+    order.sort(key=lambda item: item.get('difficulty') or 5)
+
+    packs = [[] for _ in range(pack_count)]
+    if not order or per_pack <= 0:
+        return packs
+    slots = pack_count * min(per_pack, len(order))
+    for slot in range(max(slots, len(order))):
+        pack = packs[slot % pack_count]
+        if slot < len(order):
+            pack.append(order[slot])
+            continue
+        # When pack_count is a multiple of len(order), slot % len(order)
+        # hands a pack the same item every round
+        for step in range(len(order)):
+            item = order[(slot + step) % len(order)]
+            if item not in pack:
+                pack.append(item)
+                break
+
+    for pack in packs:
+        rng.shuffle(pack)
+    return packs
+
+
+def build_level(level, pools, sizes, seed):
+    """
+    Build the packs for one level. `pools` and `sizes` map a content type to
+    its items and per-pack count. Returns the packs and the eligible counts.
+    """
+    rng = random.Random(f"{seed}:{level}")
+    members = {kind: eligible(items, level) for kind, items in pools.items()}
+
+    # Enough packs for every sentence once; other types repeat to fill
+    # their slots, or get extra slots per pack when they'd otherwise not fit
+    needed = [-(-len(members[kind]) // sizes[kind]) for kind in members if sizes[kind] > 0]
+    primary = members.get(PRIMARY)
+    if primary and sizes.get(PRIMARY, 0) > 0:
+        pack_count = -(-len(primary) // sizes[PRIMARY])
+    else:
+        pack_count = max(needed + [1])
+
+    dealt = {}
+    for kind, items in members.items():
+        per_pack = max(sizes[kind], -(-len(items) // pack_count)) if sizes[kind] > 0 else 0
+        dealt[kind] = deal(items, pack_count, per_pack, rng)
+    packs = [
+        {'level': level, **{kind: dealt[kind][n] for kind in members}}
+        for n in range(pack_count)
+    ]
+    return packs, {kind: len(items) for kind, items in members.items()}
+
+
+def check_coverage(packs, pools, sizes, level):
+    """Ids of eligible items that appear in none of the level's packs."""
+    missing = []
+    for kind, items in pools.items():
+        if sizes[kind] <= 0:
+            continue
+        seen = {item['id'] for pack in packs for item in pack[kind]}
+        missing.extend(item['id'] for item in eligible(items, level) if item['id'] not in seen)
+    return missing
+
+
+def write_packs(level, packs, decks_dir=DECKS_DIR):
+    """Write a level's packs (removing stale ones). Returns (bytes, largest pack bytes)."""
+    level_dir = os.path.join(decks_dir, f"level-{level}")
+    os.makedirs(level_dir, exist_ok=True)
+    total = 0
+    largest = 0
+    for n, pack in enumerate(packs):
+        content = f"export default {js_emit.json_literal(pack)};\n"
+        artifacts.write_text(os.path.join(level_dir, f"{n}.js"), content)
+        size = len(content.encode('utf-8'))
+        total += size
+        largest = max(largest, size)
+    for name in os.listdir(level_dir):
+        if name.endswith('.js') and int(name[:-3]) >= len(packs):
+            os.remove(os.path.join(level_dir, name))
+    return total, largest
+
+
+def write_index(pack_counts, sizes, decks_dir=DECKS_DIR):
+    """Write decks/index.js for the given per-level pack counts."""
+    content = f'''/**
+ * Deck Packs
+ * Generated by scripts/build_deck_packs.py
+ * Packs: {sum(pack_counts.values())} across {len(pack_counts)} levels
+ * Per pack (at least): sentences {sizes['sentences']}, story excerpts {sizes['stories']}, recipes {sizes['recipes']}
+ *
+ * Each pack mixes content within +/- {CONTENT_RANGE} of its level with the same
+ * difficulty spread as the level's other packs, and together a level's
+ * packs cover all of its eligible content. A session costs one small fetch.
+ */
+
+export const PACK_COUNTS = {json.dumps({str(level): count for level, count in pack_counts.items()})};
+
+const PACK_LOADERS = import.meta.glob('./level-*/*.js');
+
+/**
+ * Load a deck pack for a level (1-10): a given pack number, or a random one
+ * Resolves to {{ level, sentences, stories, recipes }}
+ */
+export async function loadDeck(level, pack = null) {{
+  const clamped = Math.min(10, Math.max(1, Math.round(level)));
+  const count = PACK_COUNTS[clamped] || 0;
+  if (count === 0) return null;
+
+  const n = pack === null ? Math.floor(Math.random() * count) : pack % count;
+  const loader = PACK_LOADERS[`./level-${{clamped}}/${{n}}.js`];
+  if (!loader) return null;
+
+  const module = await loader();
+  return module.default;
+}}
+
+export default loadDeck;
+'''
+    artifacts.write_text(os.path.join(decks_dir, 'index.js'), content)
+
+
+@artifacts.batch()
+def build_deck_packs(pools, sizes, seed=DEFAULT_SEED, decks_dir=DECKS_DIR):
+    """Build and write every level's packs. Returns per-level stats."""
+    stats = {}
+    for level in LEVELS:
+        packs, counts = build_level(level, pools, sizes, seed)
+        missing = check_coverage(packs, pools, sizes, level)
+        if missing:
+            raise RuntimeError(f"level {level}: {len(missing)} items in no pack (e.g. {missing[0]})")
+        total, largest = write_packs(level, packs, decks_dir)
+        stats[level] = {'packs': len(packs), 'bytes': total, 'largest': largest, **counts}
+    write_index({level: s['packs'] for level, s in stats.items()}, sizes, decks_dir)
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build per-level deck packs from sentences, stories and recipes.")
+    parser.add_argument('--sentences', type=int, default=DEFAULT_SENTENCES,
+                        help=f"sentences per pack (default: {DEFAULT_SENTENCES})")
+    parser.add_argument('--stories', type=int, default=DEFAULT_STORIES,
+                        help=f"story excerpts per pack (default: {DEFAULT_STORIES})")
+    parser.add_argument('--recipes', type=int, default=DEFAULT_RECIPES,
+                        help=f"recipes per pack (default: {DEFAULT_RECIPES})")
+    parser.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                        help=f"shuffle seed (default: {DEFAULT_SEED})")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    if min(args.sentences, args.stories, args.recipes) < 0:
+        parser.error("per-pack counts can't be negative")
+    if args.sentences + args.stories + args.recipes == 0:
+        parser.error("packs need at least one item")
+    return args
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'build_deck_packs')
+
+    print("=" * 60)
+    print("Deck Pack Builder")
+    print("=" * 60)
+
+    print("\nStep 1: Loading sentences, stories and recipes...")
+    with metrics.stage('load content') as stage:
+        pools = {
+            'sentences': [sentence_item(s) for s in load_level_sentences()],
+            'stories': [story_item(story) for story in load_stories().values()],
+            'recipes': [recipe_item(recipe) for recipe in load_recipes()],
+        }
+        stage.rows = sum(len(items) for items in pools.values())
+    print(f"  {len(pools['sentences'])} sentences, {len(pools['stories'])} stories, "
+          f"{len(pools['recipes'])} recipes")
+
+    sizes = {'sentences': args.sentences, 'stories': args.stories, 'recipes': args.recipes}
+    print(f"\nStep 2: Building packs ({args.sentences} sentences, {args.stories} stories, "
+          f"{args.recipes} recipes each, seed {args.seed})...")
+    with metrics.stage('build packs') as stage:
+        stats = build_deck_packs(pools, sizes, args.seed)
+        stage.rows = sum(s['packs'] for s in stats.values())
+    for level, s in stats.items():
+        print(f"  Level {level:>2}: {s['packs']:>3} packs from {s['sentences']} sentences, "
+              f"{s['stories']} stories, {s['recipes']} recipes "
+              f"(largest {s['largest'] / 1024:.1f}KB, total {s['bytes'] / 1024:.1f}KB)")
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Deck packs written to {DECKS_DIR}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
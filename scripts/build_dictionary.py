@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+Romanian Dictionary Builder
+
+Builds src/data/dictionary from the Kaikki.org (Wiktionary) Romanian dump.
+The JSONL dump is streamed line by line and spilled to per-letter files
+under scripts/temp, so memory stays bounded by the largest letter rather
+than the whole dump.
+
+Entries are sorted by folded key (lowercase, no diacritics) and cut into
+shards of at most --budget KB; each shard covers a contiguous key range
+inside its first letter and is named after the shortest prefix that
+distinguishes it from the previous one (ca.js, cam.js, cas.js, ...).
+index.js is regenerated with the ranges, counts and sizes so a lookup
+loads exactly one shard. The inflected form tables (build_form_index.py),
+the hot shard (build_hot_shard.py) and the story token sidecars
+(tokenize_stories.py), which name shards, are rebuilt to match.
+
+Source: kaikki.org/dictionary/Romanian
+License: CC-BY-SA 3.0 (Wiktionary)
+
+Usage:
+    python scripts/build_dictionary.py                 # download + build
+    python scripts/build_dictionary.py --input dump.jsonl --budget 192
+    python scripts/build_dictionary.py --from-shards   # re-shard existing data
+    python scripts/build_dictionary.py --reindex       # rewrite index.js only
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import shutil
+import sys
+import urllib.request
+
+import artifacts
+import metrics
+from dictionary_shards import DICTIONARY_DIR, fold_diacritics, list_shards, read_shard
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
+SPILL_DIR = os.path.join(TEMP_DIR, "dictionary_spill")
+
+KAIKKI_URL = "https://kaikki.org/dictionary/Romanian/kaikki.org-dictionary-Romanian.jsonl"
+KAIKKI_FILENAME = "kaikki-romanian.jsonl"
+
+DEFAULT_BUDGET_KB = 256
+
+# Bucket for keys that don't start with a-z (suffixes, digits, other scripts)
+OTHER_BUCKET = '#'
+OTHER_SHARD_NAME = 'other'
+# Modules living beside the shards; a shard named like one would overwrite it
+RESERVED_SHARD_NAMES = frozenset({'hot', 'index'})
+
+SHARD_MODULE_PREFIX = 'export default '
+SHARD_MODULE_SUFFIX = ';\n'
+
+
+def ensure_dirs():
+    """Create necessary directories."""
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    os.makedirs(DICTIONARY_DIR, exist_ok=True)
+
+
+def download_dump():
+    """Download the Kaikki dump (cached in scripts/temp)."""
+    filepath = os.path.join(TEMP_DIR, KAIKKI_FILENAME)
+    if os.path.exists(filepath):
+        print(f"  Using cached: {KAIKKI_FILENAME}")
+        return filepath
+
+    print(f"  Downloading: {KAIKKI_FILENAME}...")
+    try:
+        urllib.request.urlretrieve(KAIKKI_URL, filepath, reporthook=metrics.download_hook(KAIKKI_FILENAME))
+        print(f"  Downloaded: {KAIKKI_FILENAME}")
+        return filepath
+    except Exception as e:
+        print(f"  Error downloading {KAIKKI_FILENAME}: {e}")
+        if os.path.exists(filepath):
+            os.remove(filepath)
+        return None
+
+
+def process_entry(entry):
+    """
+    Convert a Kaikki entry into the app's compact format.
+
+    Keeps up to 5 definitions, 3 examples, the first IPA pronunciation,
+    the noun gender and the first form per tag set. Returns None for
+    entries without a word or definitions.
+    """
+    if not entry.get('word') or not entry.get('senses'):
+        return None
+
+    definitions = []
+    examples = []
+    for sense in entry['senses']:
+        for gloss in sense.get('glosses') or []:
+            if gloss and gloss not in definitions:
+                definitions.append(gloss)
+        for ex in sense.get('examples') or []:
+            if ex.get('text') and len(examples) < 3:
+                examples.append({
+                    'ro': ex['text'],
+                    'en': ex.get('english') or ex.get('translation') or None,
+                })
+
+    if not definitions:
+        return None
+
+    result = {
+        'word': entry['word'],
+        'pos': entry.get('pos') or 'unknown',
+        'definitions': definitions[:5],
+    }
+
+    ipa = next((s['ipa'] for s in entry.get('sounds') or [] if s.get('ipa')), None)
+    if ipa:
+        result['pronunciation'] = ipa
+
+    head_templates = entry.get('head_templates') or []
+    if head_templates:
+        gender = (head_templates[0].get('args') or {}).get('g')
+        if gender:
+            result['gender'] = gender
+
+    if examples:
+        result['examples'] = examples
+
+    forms = {}
+    for form in entry.get('forms') or []:
+        if form.get('form') and form.get('tags'):
+            tag = '-'.join(form['tags'])
+            forms.setdefault(tag, form['form'])
+    if forms:
+        result['forms'] = forms
+
+    return result
+
+
+def bucket_of(key):
+    """First-letter bucket of a folded key."""
+    first = key[:1]
+    return first if 'a' <= first <= 'z' else OTHER_BUCKET
+
+
+def sort_key(entry):
+    """Order entries by folded key, then case-insensitively, then exactly."""
+    word = entry['word']
+    return (fold_diacritics(word), word.lower(), word)
+
+
+def iter_dump(path):
+    """Stream processed entries from a Kaikki JSONL dump (plain or .gz)."""
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path, 'rt', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            processed = process_entry(entry)
+            if processed:
+                yield processed
+
+
+def iter_existing_shards():
+    """Stream entries from the current shards (for re-sharding without the dump)."""
+    for path in list_shards().values():
+        yield from read_shard(path)
+
+
+def spill_by_bucket(entries):
+    """
+    Write entries to one JSONL spill file per bucket.
+
+    Returns {bucket: count}. Only file handles are held, never the entries.
+    """
+    if os.path.exists(SPILL_DIR):
+        shutil.rmtree(SPILL_DIR)
+    os.makedirs(SPILL_DIR)
+
+    handles = {}
+    counts = {}
+    total = 0
+    try:
+        for entry in entries:
+            bucket = bucket_of(fold_diacritics(entry['word']))
+            if bucket not in handles:
+                name = OTHER_SHARD_NAME if bucket == OTHER_BUCKET else bucket
+                handles[bucket] = open(os.path.join(SPILL_DIR, f"{name}.jsonl"), 'w', encoding='utf-8')
+            handles[bucket].write(json.dumps(entry, ensure_ascii=False, separators=(',', ':')) + '\n')
+            counts[bucket] = counts.get(bucket, 0) + 1
+            total += 1
+            if total % 10000 == 0:
+                print(f"\r  Processed {total} entries...", end='', flush=True)
+    finally:
+        for handle in handles.values():
+            handle.close()
+
+    print(f"\r  Processed {total} entries")
+    return counts
+
+
+def read_spill(bucket):
+    """Read back the serialized entries of one bucket."""
+    name = OTHER_SHARD_NAME if bucket == OTHER_BUCKET else bucket
+    with open(os.path.join(SPILL_DIR, f"{name}.jsonl"), 'r', encoding='utf-8') as f:
+        return [line.rstrip('\n') for line in f]
+
+
+def plan_shards(records, budget_bytes):
+    """
+    Cut sorted (folded_key, serialized_entry) records into shards.
+
+    A shard closes before it would exceed the budget, except that entries
+    sharing a folded key always stay together (the app finds a word and its
+    diacritic variants in a single shard). Returns a list of record lists.
+    """
+    overhead = len(SHARD_MODULE_PREFIX) + len(SHARD_MODULE_SUFFIX) + 2
+    shards = []
+    current = []
+    size = overhead
+
+    i = 0
+    while i < len(records):
+        # Group of records with the same folded key
+        j = i + 1
+        while j < len(records) and records[j][0] == records[i][0]:
+            j += 1
+        group = records[i:j]
+        group_size = sum(len(r[1].encode('utf-8')) + 1 for r in group)
+
+        if current and size + group_size > budget_bytes:
+            shards.append(current)
+            current = []
+            size = overhead
+        current.extend(group)
+        size += group_size
+        i = j
+
+    if current:
+        shards.append(current)
+    return shards
+
+
+def shard_name(bucket, from_key, previous_to):
+    """
+    Name a shard after the shortest prefix of its first key that sorts
+    after the previous shard's last key.
+    """
+    if bucket == OTHER_BUCKET:
+        return None
+    if previous_to is None:
+        return bucket
+    for length in range(1, len(from_key) + 1):
+        prefix = from_key[:length]
+        if prefix > previous_to[:length]:
+            return prefix
+    return from_key
+
+
+def sanitize_name(name):
+    """Keep shard file names to safe characters."""
+    return re.sub(r'[^a-z0-9]+', '-', name).strip('-')
+
+
+def unique_shard_name(bucket, from_key, previous_to, n, used_names, reserved=RESERVED_SHARD_NAMES):
+    """
+    The file name for the n-th shard of a bucket: shard_name(), sanitized,
+    with a "-<n>" suffix when it is taken or reserved. Adds it to
+    used_names; raises ValueError if it still collides.
+    """
+    name = shard_name(bucket, from_key, previous_to)
+    name = sanitize_name(name) if name else ''
+    if not name or name in used_names or name in reserved:
+        base = OTHER_SHARD_NAME if bucket == OTHER_BUCKET else (name or bucket)
+        name = base if base not in used_names and base not in reserved else f"{base}-{n}"
+    if name in used_names or name in reserved:
+        raise ValueError(f"Shard name {name!r} collides with another module in the directory")
+    used_names.add(name)
+    return name
+
+
+@artifacts.batch()
+def build_shards(budget_bytes, counts):
+    """Sort each bucket, cut it into shards and write the shard modules."""
+    index = {}
+    used_names = set()
+
+    for bucket in sorted(counts):
+        lines = read_spill(bucket)
+        entries = sorted((json.loads(line) for line in lines), key=sort_key)
+        records = [
+            (fold_diacritics(e['word']), json.dumps(e, ensure_ascii=False, separators=(',', ':')))
+            for e in entries
+        ]
+
+        previous_to = None
+        for n, shard_records in enumerate(plan_shards(records, budget_bytes), 1):
+            from_key = shard_records[0][0]
+            to_key = shard_records[-1][0]
+
+            name = unique_shard_name(bucket, from_key, previous_to, n, used_names)
+
+            content = SHARD_MODULE_PREFIX + '[' + ','.join(r[1] for r in shard_records) + ']' + SHARD_MODULE_SUFFIX
+            artifacts.write_text(os.path.join(DICTIONARY_DIR, f"{name}.js"), content)
+
+            index.setdefault(bucket, []).append({
+                'shard': name,
+                'from': from_key,
+                'to': to_key,
+                'count': len(shard_records),
+                'size': len(content.encode('utf-8')),
+            })
+            previous_to = to_key
+
+    return index
+
+
+def remove_stale_shards(index):
+    """Delete shard files that are not part of the new index."""
+    keep = {s['shard'] for shards in index.values() for s in shards}
+    removed = 0
+    for name, path in list_shards().items():
+        if name not in keep:
+            os.remove(path)
+            removed += 1
+    return removed
+
+
+def index_existing_shards():
+    """Describe the shards already on disk (for --reindex)."""
+    index = {}
+    for name, path in list_shards().items():
+        entries = read_shard(path)
+        if not entries:
+            continue
+        keys = sorted(fold_diacritics(e['word']) for e in entries)
+        index.setdefault(bucket_of(keys[0]), []).append({
+            'shard': name,
+            'from': keys[0],
+            'to': keys[-1],
+            'count': len(entries),
+            'size': os.path.getsize(path),
+        })
+    for shards in index.values():
+        shards.sort(key=lambda s: s['from'])
+    return index
+
+
+def write_index(index, hot=None):
+    """
+    Write src/data/dictionary/index.js for the given shard index.
+
+    `hot` is the hot/cold split summary from build_hot_shard; without it
+    the hot shard is left out of the index.
+    """
+    total_words = sum(s['count'] for shards in index.values() for s in shards)
+    shard_count = sum(len(shards) for shards in index.values())
+    largest = max((s['size'] for shards in index.values() for s in shards), default=0)
+
+    buckets = []
+    for bucket in sorted(index):
+        rows = '\n'.join(f"    {json.dumps(s, ensure_ascii=False)}," for s in index[bucket])
+        buckets.append(f"  {json.dumps(bucket)}: [\n{rows}\n  ],")
+    index_literal = '{\n' + '\n'.join(buckets) + '\n}'
+
+    if hot:
+        hot_import = "import HOT from './hot.js';\n\n"
+        hot_words = 'HOT.words'
+    else:
+        hot_import = ''
+        hot_words = '[]'
+    hot_split = json.dumps(hot or {'words': 0, 'forms': 0, 'size': 0, 'tokens': 0, 'coverage': 0})
+
+    content = f'''/**
+ * Romanian Dictionary Index
+ * Generated from Kaikki.org (Wiktionary) data by scripts/build_dictionary.py
+ * Total words: {total_words}
+ * Shards: {shard_count} (largest: {largest / 1024:.1f}KB)
+ *
+ * Shards are grouped by first letter ('#' for anything else) and each
+ * covers a contiguous range of folded keys (lowercase, no diacritics).
+ * The most frequent corpus words live in hot.js, which is bundled with
+ * this index and checked before any cold shard is loaded.
+ */
+
+{hot_import}const INDEX = {index_literal};
+
+// Hot/cold split: hot entries and the share of corpus tokens they cover
+export const HOT_SPLIT = {hot_split};
+
+const HOT_WORDS = new Map();
+for (const w of {hot_words}) {{
+  const key = w.word.toLowerCase();
+  if (!HOT_WORDS.has(key)) HOT_WORDS.set(key, w);
+}}
+
+// Every cold shard is code-split into its own lazily loaded chunk
+const SHARD_LOADERS = import.meta.glob(['./*.js', '!./index.js', '!./hot.js']);
+
+const loadedShards = {{}};
+
+/**
+ * Fold a word to its shard key (lowercase, diacritics removed)
+ */
+export function foldKey(word) {{
+  return word.toLowerCase().normalize('NFD').replace(/[\\u0300-\\u036f]/g, '');
+}}
+
+function bucketOf(key) {{
+  const first = key.charAt(0);
+  return first >= 'a' && first <= 'z' ? first : '#';
+}}
+
+/**
+ * Find the shard whose key range holds a folded key (null if none can)
+ */
+export function findShard(key) {{
+  const shards = INDEX[bucketOf(key)];
+  if (!shards) return null;
+
+  let lo = 0;
+  let hi = shards.length - 1;
+  let found = null;
+  while (lo <= hi) {{
+    const mid = (lo + hi) >> 1;
+    if (shards[mid].from <= key) {{
+      found = shards[mid];
+      lo = mid + 1;
+    }} else {{
+      hi = mid - 1;
+    }}
+  }}
+  return found && key <= found.to ? found.shard : null;
+}}
+
+/**
+ * Load one dictionary shard on demand
+ */
+export async function loadShard(shard) {{
+  if (loadedShards[shard]) {{
+    return loadedShards[shard];
+  }}
+
+  const loader = SHARD_LOADERS[`./${{shard}}.js`];
+  if (!loader) {{
+    return [];
+  }}
+
+  try {{
+    const module = await loader();
+    loadedShards[shard] = module.default;
+    return loadedShards[shard];
+  }} catch (err) {{
+    console.error(`Failed to load dictionary shard "${{shard}}"`, err);
+    return [];
+  }}
+}}
+
+/**
+ * Look up a word in the dictionary
+ * Pass the shard key when it is known (e.g. from a story token sidecar)
+ * to skip range resolution.
+ */
+export async function lookupWord(word, shard = null) {{
+  if (!word || word.length === 0) return null;
+
+  const hot = HOT_WORDS.get(word.toLowerCase());
+  if (hot) return hot;
+
+  // A hint naming a shard that no longer exists (e.g. a sidecar from
+  // before a re-shard) falls back to range resolution
+  const known = shard && SHARD_LOADERS[`./${{shard}}.js`] ? shard : null;
+  const target = known || findShard(foldKey(word));
+  if (!target) return null;
+  const words = await loadShard(target);
+
+  const normalizedWord = word.toLowerCase();
+  return words.find(w => w.word.toLowerCase() === normalizedWord) || null;
+}}
+
+/**
+ * Search for words starting with a prefix
+ */
+export async function searchWords(prefix, limit = 10) {{
+  if (!prefix || prefix.length === 0) return [];
+
+  const key = foldKey(prefix);
+  const normalizedPrefix = prefix.toLowerCase();
+  const results = [];
+
+  // Shards are sorted, so walk from the first one that can hold the prefix
+  for (const info of INDEX[bucketOf(key)] || []) {{
+    if (info.to < key) continue;
+    if (!info.from.startsWith(key) && info.from > key) break;
+
+    const words = await loadShard(info.shard);
+    for (const w of words) {{
+      if (w.word.toLowerCase().startsWith(normalizedPrefix)) {{
+        results.push(w);
+        if (results.length >= limit) return results;
+      }}
+    }}
+  }}
+  return results;
+}}
+
+/**
+ * Get dictionary statistics
+ */
+export function getStats() {{
+  return {{
+    totalWords: {total_words},
+    shards: {shard_count},
+    letters: Object.keys(INDEX).length,
+    hot: HOT_SPLIT,
+    index: INDEX,
+  }};
+}}
+
+export default {{
+  lookupWord,
+  searchWords,
+  loadShard,
+  findShard,
+  getStats,
+}};
+'''
+    artifacts.write_text(os.path.join(DICTIONARY_DIR, 'index.js'), content)
+
+    return total_words, shard_count, largest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the sharded Romanian dictionary.")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument('--input', help="local Kaikki JSONL dump (.jsonl or .jsonl.gz)")
+    source.add_argument('--from-shards', action='store_true',
+                        help="re-shard the existing dictionary instead of reading the dump")
+    source.add_argument('--reindex', action='store_true',
+                        help="only regenerate index.js for the shards on disk")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f"maximum shard size in KB (default: {DEFAULT_BUDGET_KB})")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'build_dictionary')
+
+    print("=" * 60)
+    print("Romanian Dictionary Builder")
+    print("=" * 60)
+
+    ensure_dirs()
+
+    if args.reindex:
+        print("\nIndexing existing shards...")
+        with metrics.stage('index shards'):
+            index = index_existing_shards()
+    else:
+        if args.from_shards:
+            print("\nStep 1: Reading existing shards...")
+            entries = iter_existing_shards()
+        else:
+            print("\nStep 1: Getting Kaikki.org dump...")
+            with metrics.stage('download'):
+                dump_path = args.input or download_dump()
+            if not dump_path:
+                print("\nError: No dictionary dump available. Check your internet connection.")
+                sys.exit(1)
+            entries = iter_dump(dump_path)
+
+        print("\nStep 2: Streaming entries into letter buckets...")
+        with metrics.stage('spill buckets') as stage:
+            counts = spill_by_bucket(entries)
+            stage.rows = sum(counts.values())
+        if not counts:
+            print("\nError: No dictionary entries found.")
+            sys.exit(1)
+
+        print(f"\nStep 3: Writing shards (budget {args.budget}KB)...")
+        with metrics.stage('write shards') as stage:
+            index = build_shards(args.budget * 1024, counts)
+            stage.rows = sum(counts.values())
+        removed = remove_stale_shards(index)
+        if removed:
+            print(f"  Removed {removed} stale shard files")
+        shutil.rmtree(SPILL_DIR, ignore_errors=True)
+
+    # Imported here: these stages reuse this module's shard planning
+    from build_form_index import DEFAULT_BUDGET_KB as DEFAULT_FORMS_BUDGET_KB
+    from build_form_index import build_tables as build_form_tables, collect_forms
+    from build_form_index import write_index as write_form_index
+    from build_hot_shard import build_hot_shard
+    from dictionary_shards import build_word_to_shard
+    from merge_stories import load_stories
+    from tokenize_stories import write_sidecars
+
+    # Shard names changed, so the derived indexes are stale
+    print("\nRebuilding inflected form index...")
+    with metrics.stage('form index') as stage:
+        forms = collect_forms()
+        total_forms, form_shards, _ = write_form_index(build_form_tables(forms, DEFAULT_FORMS_BUDGET_KB * 1024))
+        stage.rows = total_forms
+    print(f"  {total_forms} forms in {form_shards} tables")
+
+    print("\nRebuilding story token sidecars...")
+    with metrics.stage('story tokens') as stage:
+        sidecars = write_sidecars(load_stories(), build_word_to_shard(), forms)
+        stage.rows = sidecars['tokens']
+    print(f"  {sidecars['stories']} sidecars, {sidecars['tokens']} tokens")
+
+    print("\nRebuilding hot shard...")
+    with metrics.stage('hot shard') as stage:
+        hot = build_hot_shard(forms=forms, verbose=False)
+        stage.rows = hot['tokens']
+    print(f"  {hot['words']} entries cover {hot['coverage']:.1%} of corpus dictionary tokens")
+
+    total_words, shard_count, largest = write_index(index, hot)
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! {total_words} words in {shard_count} shards (largest {largest / 1024:.1f}KB)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Inflected Form Index Builder
+
+Walks the `forms` of every dictionary entry and writes a form→lemma reverse
+index to src/data/dictionary/forms, so inflected words from sentences and
+stories ("fetelor", "zăpezii") resolve to their headword.
+
+Keys are folded (lowercase, no diacritics). An unambiguous key maps to its
+lemma; a key that folds several forms together ("fetelor" / "fețelor") or
+belongs to several lemmas maps to a flat [form, lemma, form, lemma, ...]
+list keeping the original spelling, so the app can prefer the exact one.
+Tables are cut into range shards the same way as the dictionary itself and
+forms/index.js maps key ranges to shards: a lookup is one range search and
+one property probe in one small table.
+
+Usage:
+    python scripts/build_form_index.py
+    python scripts/build_form_index.py --budget 32
+"""
+
+import argparse
+import json
+import os
+
+import artifacts
+import metrics
+from build_dictionary import bucket_of, plan_shards, unique_shard_name
+from dictionary_lookup import NON_FORM_TAGS
+from dictionary_shards import DICTIONARY_DIR, fold_diacritics, iter_entries
+
+FORMS_DIR = os.path.join(DICTIONARY_DIR, "forms")
+# index.js lives beside the shards
+RESERVED_NAMES = frozenset({'index'})
+
+DEFAULT_BUDGET_KB = 64
+
+TABLE_PREFIX = 'export default {'
+TABLE_SUFFIX = '};\n'
+
+
+def collect_forms(dictionary_dir=DICTIONARY_DIR):
+    """
+    Map each folded form key to its (form, lemma) candidates.
+
+    Forms that fold to their own headword are skipped: the headword lookup
+    already finds them.
+    """
+    forms = {}
+    for _, _, entry in iter_entries(dictionary_dir):
+        lemma = entry['word']
+        lemma_key = fold_diacritics(lemma)
+        for tag, form in (entry.get('forms') or {}).items():
+            if tag in NON_FORM_TAGS or not isinstance(form, str):
+                continue
+            form = form.strip()
+            key = fold_diacritics(form)
+            if not key or key == lemma_key:
+                continue
+            candidates = forms.setdefault(key, [])
+            if (form.lower(), lemma) not in candidates:
+                candidates.append((form.lower(), lemma))
+    return forms
+
+
+@artifacts.batch()
+def build_tables(forms, budget_bytes, forms_dir=FORMS_DIR):
+    """Write the form table shards. Returns the shard index."""
+    os.makedirs(forms_dir, exist_ok=True)
+
+    buckets = {}
+    for key in sorted(forms):
+        candidates = forms[key]
+        if len(candidates) == 1:
+            value = candidates[0][1]
+        else:
+            value = [v for candidate in candidates for v in candidate]
+        record = json.dumps(key, ensure_ascii=False) + ':' + json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+        buckets.setdefault(bucket_of(key), []).append((key, record))
+
+    index = {}
+    used_names = set()
+    for bucket in sorted(buckets):
+        previous_to = None
+        for n, shard_records in enumerate(plan_shards(buckets[bucket], budget_bytes), 1):
+            from_key = shard_records[0][0]
+            to_key = shard_records[-1][0]
+
+            name = unique_shard_name(bucket, from_key, previous_to, n, used_names, RESERVED_NAMES)
+
+            content = TABLE_PREFIX + ','.join(r[1] for r in shard_records) + TABLE_SUFFIX
+            artifacts.write_text(os.path.join(forms_dir, f"{name}.js"), content)
+
+            index.setdefault(bucket, []).append({
+                'shard': name,
+                'from': from_key,
+                'to': to_key,
+                'count': len(shard_records),
+                'size': len(content.encode('utf-8')),
+            })
+            previous_to = to_key
+
+    keep = {f"{s['shard']}.js" for shards in index.values() for s in shards} | {'index.js'}
+    for name in os.listdir(forms_dir):
+        if name.endswith('.js') and name not in keep:
+            os.remove(os.path.join(forms_dir, name))
+
+    return index
+
+
+def write_index(index, forms_dir=FORMS_DIR):
+    """Write forms/index.js for the given shard index."""
+    total_forms = sum(s['count'] for shards in index.values() for s in shards)
+    shard_count = sum(len(shards) for shards in index.values())
+    largest = max((s['size'] for shards in index.values() for s in shards), default=0)
+
+    buckets = []
+    for bucket in sorted(index):
+        rows = '\n'.join(f"    {json.dumps(s, ensure_ascii=False)}," for s in index[bucket])
+        buckets.append(f"  {json.dumps(bucket)}: [\n{rows}\n  ],")
+    index_literal = '{\n' + '\n'.join(buckets) + '\n}'
+
+    content = f'''/**
+ * Romanian Inflected Form Index
+ * Generated from the dictionary shards by scripts/build_form_index.py
+ * Total forms: {total_forms}
+ * Shards: {shard_count} (largest: {largest / 1024:.1f}KB)
+ *
+ * Each table maps a folded form (lowercase, no diacritics) to its lemma,
+ * or to a flat [form, lemma, ...] list when the form is ambiguous. Forms
+ * that are frequent in the corpus are also in the bundled hot shard.
+ */
+
+import HOT from '../hot.js';
+import {{ foldKey }} from '../index.js';
+
+const INDEX = {index_literal};
+
+const TABLE_LOADERS = import.meta.glob(['./*.js', '!./index.js']);
+
+const loadedTables = {{}};
+
+function bucketOf(key) {{
+  const first = key.charAt(0);
+  return first >= 'a' && first <= 'z' ? first : '#';
+}}
+
+/**
+ * Find the table whose key range holds a folded form (null if none can)
+ */
+export function findFormShard(key) {{
+  const shards = INDEX[bucketOf(key)];
+  if (!shards) return null;
+
+  let lo = 0;
+  let hi = shards.length - 1;
+  let found = null;
+  while (lo <= hi) {{
+    const mid = (lo + hi) >> 1;
+    if (shards[mid].from <= key) {{
+      found = shards[mid];
+      lo = mid + 1;
+    }} else {{
+      hi = mid - 1;
+    }}
+  }}
+  return found && key <= found.to ? found.shard : null;
+}}
+
+async function loadTable(shard) {{
+  if (loadedTables[shard]) {{
+    return loadedTables[shard];
+  }}
+
+  const loader = TABLE_LOADERS[`./${{shard}}.js`];
+  if (!loader) {{
+    return {{}};
+  }}
+
+  try {{
+    const module = await loader();
+    loadedTables[shard] = module.default;
+    return loadedTables[shard];
+  }} catch (err) {{
+    console.error(`Failed to load form table "${{shard}}"`, err);
+    return {{}};
+  }}
+}}
+
+/**
+ * Lemmas an inflected word belongs to, exact spellings first
+ * (e.g. "fețelor" → ["față", "fată"], "fetelor" → ["fată", "față"])
+ */
+export async function lookupLemmas(word) {{
+  if (!word || word.trim().length === 0) return [];
+
+  const surface = word.trim().toLowerCase();
+  const key = foldKey(surface);
+
+  let table = HOT.forms;
+  if (!Object.prototype.hasOwnProperty.call(table, key)) {{
+    const shard = findFormShard(key);
+    if (!shard) return [];
+    table = await loadTable(shard);
+  }}
+  if (!Object.prototype.hasOwnProperty.call(table, key)) return [];
+  const pairs = table[key];
+  if (typeof pairs === 'string') return [pairs];
+
+  const exact = [];
+  const folded = [];
+  for (let i = 0; i < pairs.length; i += 2) {{
+    (pairs[i] === surface ? exact : folded).push(pairs[i + 1]);
+  }}
+  return [...new Set([...exact, ...folded])];
+}}
+
+export default {{
+  lookupLemmas,
+  findFormShard,
+}};
+'''
+    artifacts.write_text(os.path.join(forms_dir, 'index.js'), content)
+
+    return total_forms, shard_count, largest
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the inflected form → lemma index.")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f"maximum table size in KB (default: {DEFAULT_BUDGET_KB})")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'build_form_index')
+
+    print("=" * 60)
+    print("Inflected Form Index Builder")
+    print("=" * 60)
+
+    print("\nStep 1: Collecting forms from dictionary shards...")
+    with metrics.stage('collect forms') as stage:
+        forms = collect_forms()
+        stage.rows = len(forms)
+    ambiguous = sum(1 for candidates in forms.values() if len({lemma for _, lemma in candidates}) > 1)
+    print(f"  {len(forms)} form keys ({ambiguous} ambiguous between lemmas)")
+
+    print(f"\nStep 2: Writing form tables (budget {args.budget}KB)...")
+    with metrics.stage('write tables') as stage:
+        index = build_tables(forms, args.budget * 1024)
+        total_forms, shard_count, largest = write_index(index)
+        stage.rows = total_forms
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! {total_forms} forms in {shard_count} tables (largest {largest / 1024:.1f}KB)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Hot Dictionary Shard Builder
+
+Counts word frequencies across the generated Tatoeba level files and
+stories.js, then writes src/data/dictionary/hot.js with the most frequent
+lemmas (and the inflected forms that reach them) until they cover
+--coverage of the corpus tokens the dictionary knows, or the shard reaches
+--budget KB. index.js bundles the hot shard and checks it before loading
+any cold range shard, and records the hot/cold split.
+
+Usage:
+    python scripts/build_hot_shard.py
+    python scripts/build_hot_shard.py --coverage 0.95 --budget 400
+"""
+
+import argparse
+import json
+import os
+from collections import Counter
+
+import artifacts
+import metrics
+from build_form_index import collect_forms
+from dictionary_shards import DICTIONARY_DIR, HOT_SHARD_FILE, build_word_to_shard, fold_diacritics, list_shards, read_shard
+from merge_stories import load_stories, parse_story_entries
+from tokenize_stories import WORD_RE, resolve_key
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+TATOEBA_DIR = os.path.join(PROJECT_DIR, "src", "data", "tatoeba")
+HOT_SHARD_PATH = os.path.join(DICTIONARY_DIR, HOT_SHARD_FILE)
+
+DEFAULT_COVERAGE = 0.9
+DEFAULT_BUDGET_KB = 300
+
+MODULE_PREFIX = 'export default '
+MODULE_SUFFIX = ';\n'
+
+
+def load_tatoeba_sentences(tatoeba_dir=TATOEBA_DIR):
+    """Return the Romanian text of every sentence in the level files."""
+    sentences = []
+    for name in sorted(os.listdir(tatoeba_dir)):
+        if not name.endswith('.js') or name == 'index.js':
+            continue
+        with open(os.path.join(tatoeba_dir, name), 'r', encoding='utf-8') as f:
+            content = f.read()
+        start = content.find('= [')
+        if start < 0:
+            continue
+        entries, _ = parse_story_entries(content, start + 3)
+        sentences.extend(entry['romanian'] for entry, _, _ in entries if entry.get('romanian'))
+    return sentences
+
+
+def count_tokens(texts, word_to_shard, forms):
+    """
+    Count corpus tokens by the dictionary key they resolve to.
+
+    Returns (key_counts, form_counts, total, unresolved) where form_counts
+    counts folded surface forms that only resolve through the form index.
+    """
+    resolved = {}
+    key_counts = Counter()
+    form_counts = Counter()
+    total = 0
+    unresolved = 0
+
+    for text in texts:
+        for match in WORD_RE.finditer(text):
+            word = match.group()
+            total += 1
+            if word not in resolved:
+                resolved[word] = resolve_key(word, word_to_shard, forms)
+            key, shard = resolved[word]
+            if shard is None:
+                unresolved += 1
+                continue
+            key_counts[key] += 1
+            folded = fold_diacritics(word)
+            if word.lower() not in word_to_shard and folded not in word_to_shard:
+                form_counts[folded] += 1
+
+    return key_counts, form_counts, total, unresolved
+
+
+def entries_for_key(key, shard, cache):
+    """All entries a cold lookup of `key` could return, in shard order."""
+    if shard not in cache:
+        cache[shard] = read_shard(list_shards()[shard])
+    return [e for e in cache[shard] if e['word'].lower() == key]
+
+
+def form_value(candidates):
+    """Encode form candidates the same way as the form tables."""
+    if len(candidates) == 1:
+        return candidates[0][1]
+    return [v for candidate in candidates for v in candidate]
+
+
+def json_size(value):
+    """Bytes of a value in the hot shard's compact JSON."""
+    return len(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+
+
+def select_hot(key_counts, form_counts, word_to_shard, forms, coverage, budget_bytes):
+    """
+    Take keys in frequency order until they cover `coverage` of resolved
+    tokens, skipping any whose entries and forms no longer fit the budget.
+
+    Returns (words, hot_forms, covered_tokens).
+    """
+    # Corpus forms that reach each key, charged to the key that adds them first
+    key_forms = {}
+    for folded in sorted(form_counts):
+        for _, lemma in forms.get(folded, []):
+            key_forms.setdefault(lemma.lower(), []).append(folded)
+
+    resolved_total = sum(key_counts.values())
+    cache = {}
+    words = []
+    hot_forms = {}
+    size = len(MODULE_PREFIX) + json_size({'words': [], 'forms': {}}) + len(MODULE_SUFFIX)
+    covered = 0
+
+    for key, count in key_counts.most_common():
+        if covered >= coverage * resolved_total:
+            break
+        entries = entries_for_key(key, word_to_shard[key], cache)
+        new_forms = {folded: form_value(forms[folded]) for folded in key_forms.get(key, [])
+                     if folded not in hot_forms}
+        # Each entry and form is followed by at most one comma
+        entry_size = (sum(json_size(e) + 1 for e in entries)
+                      + sum(json_size(folded) + 1 + json_size(value) + 1 for folded, value in new_forms.items()))
+        if size + entry_size > budget_bytes:
+            continue
+        words.extend(entries)
+        hot_forms.update(new_forms)
+        size += entry_size
+        covered += count
+
+    return words, dict(sorted(hot_forms.items())), covered
+
+
+def write_hot_shard(words, hot_forms, path=HOT_SHARD_PATH):
+    """Write hot.js. Returns its size in bytes."""
+    content = (MODULE_PREFIX
+               + json.dumps({'words': words, 'forms': hot_forms}, ensure_ascii=False, separators=(',', ':'))
+               + MODULE_SUFFIX)
+    artifacts.write_text(path, content)
+    return len(content.encode('utf-8'))
+
+
+def build_hot_shard(coverage=DEFAULT_COVERAGE, budget_kb=DEFAULT_BUDGET_KB, forms=None, verbose=True):
+    """
+    Count the corpus and write hot.js.
+
+    Returns the hot/cold split summary recorded in the dictionary index.
+    """
+    word_to_shard = build_word_to_shard()
+    if forms is None:
+        forms = collect_forms()
+
+    texts = load_tatoeba_sentences()
+    stories = load_stories()
+    texts.extend(story['excerpt'] for story in stories.values())
+
+    key_counts, form_counts, total, unresolved = count_tokens(texts, word_to_shard, forms)
+    resolved_total = total - unresolved
+    if verbose:
+        print(f"  {len(texts)} texts, {total} tokens ({resolved_total} in the dictionary, "
+              f"{len(key_counts)} distinct keys)")
+
+    words, hot_forms, covered = select_hot(
+        key_counts, form_counts, word_to_shard, forms, coverage, budget_kb * 1024
+    )
+    size = write_hot_shard(words, hot_forms)
+
+    return {
+        'words': len(words),
+        'forms': len(hot_forms),
+        'size': size,
+        'tokens': resolved_total,
+        'coverage': round(covered / max(resolved_total, 1), 4),
+    }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build the frequency-ranked hot dictionary shard.")
+    parser.add_argument('--coverage', type=float, default=DEFAULT_COVERAGE,
+                        help=f"share of dictionary tokens to cover (default: {DEFAULT_COVERAGE})")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f"maximum hot shard size in KB (default: {DEFAULT_BUDGET_KB})")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    # Imported here: build_dictionary rebuilds the hot shard after sharding
+    from build_dictionary import index_existing_shards, write_index
+
+    args = parse_args()
+    metrics.configure(args, 'build_hot_shard')
+
+    print("=" * 60)
+    print("Hot Dictionary Shard Builder")
+    print("=" * 60)
+
+    print("\nStep 1: Counting corpus tokens...")
+    with metrics.stage('build hot shard') as stage:
+        split = build_hot_shard(args.coverage, args.budget)
+        stage.rows = split['tokens']
+
+    print("\nStep 2: Recording the hot/cold split in index.js...")
+    with metrics.stage('write index'):
+        write_index(index_existing_shards(), split)
+    print(f"  {split['words']} entries and {split['forms']} forms cover "
+          f"{split['coverage']:.1%} of {split['tokens']} dictionary tokens")
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Hot shard written to {HOT_SHARD_PATH} ({split['size'] / 1024:.1f}KB)")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,550 @@
+#!/usr/bin/env python3
+"""
+Tatoeba Sentence Search Index Builder
+
+Builds a word → sentences inverted index over the Tatoeba sentences so the
+app (and scripts) can fetch example sentences for a word without scanning
+the level files.
+
+Sentences are numbered in (difficulty, word count, id) order, so every
+posting list is sorted easiest first and "difficulty ≤ N" is a cutoff on the
+sentence number (LEVEL_STARTS). Each posting stores the gap to the previous
+sentence number shifted left one bit, with the low bit set when the sentence
+has audio, as an unsigned LEB128 varint; a token's list is the base64 of
+those bytes. Tokens are folded (lowercase, no diacritics) words; hyphenated
+words ("l-am") are indexed whole and by part.
+
+Output in src/data/tatoeba/search:
+    <prefix>.js      posting shards, export default {token: "base64", ...}
+    docs/<n>.js      sentence records, DOC_CHUNK per file
+    index.js         shard ranges, level starts and findSentences()
+
+Usage:
+    python scripts/build_sentence_index.py                 # from the level files
+    python scripts/build_sentence_index.py --budget 16 --query pisica --max-difficulty 3 --audio
+"""
+
+import argparse
+import base64
+import bisect
+import json
+import os
+import re
+
+import artifacts
+import metrics
+from build_dictionary import bucket_of, plan_shards, unique_shard_name
+from dictionary_shards import fold_diacritics
+from merge_stories import parse_story_entries
+from process_tatoeba import Sentence
+from tokenize_stories import WORD_RE
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+TATOEBA_DIR = os.path.join(PROJECT_DIR, "src", "data", "tatoeba")
+SEARCH_DIR = os.path.join(TATOEBA_DIR, "search")
+# index.js lives beside the shards
+RESERVED_NAMES = frozenset({'index'})
+
+DEFAULT_BUDGET_KB = 32
+DOC_CHUNK = 256
+MAX_DIFFICULTY = 10
+
+MODULE_PREFIX = 'export default '
+MODULE_SUFFIX = ';\n'
+
+# Level files in the order the app lists them; later duplicates are dropped
+LEVEL_FILES = [
+    'beginner.js', 'beginner_extended.js',
+    'intermediate.js', 'intermediate_extended.js',
+    'advanced.js', 'advanced_extended.js',
+]
+
+
+def load_level_sentences(tatoeba_dir=TATOEBA_DIR):
+    """Return the sentences in the level files on disk as Sentence records."""
+    sentences = []
+    for name in LEVEL_FILES:
+        path = os.path.join(tatoeba_dir, name)
+        if not os.path.exists(path):
+            continue
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        start = content.find('= [')
+        if start < 0:
+            continue
+        entries, _ = parse_story_entries(content, start + 3)
+        sentences.extend(
+            Sentence(e['id'], e['romanian'], e['english'], e['difficulty'], e['wordCount'],
+                     e.get('hasAudio', False), e.get('audioUrl'))
+            for e, _, _ in entries
+        )
+    return sentences
+
+
+def tokens_of(text):
+    """Distinct folded tokens of a sentence (hyphenated words also by part)."""
+    tokens = set()
+    for match in WORD_RE.finditer(text):
+        word = fold_diacritics(match.group())
+        tokens.add(word)
+        if '-' in word:
+            tokens.update(part for part in word.split('-') if part)
+    return tokens
+
+
+def order_documents(sentences):
+    """Deduplicate by id and Romanian text; sort easiest first."""
+    seen_ids = set()
+    seen_text = set()
+    docs = []
+    for s in sentences:
+        text_key = s.romanian.lower().strip()
+        if s.id in seen_ids or text_key in seen_text:
+            continue
+        seen_ids.add(s.id)
+        seen_text.add(text_key)
+        docs.append(s)
+    docs.sort(key=lambda s: (s.difficulty, s.word_count, s.id))
+    return docs
+
+
+def level_starts(docs):
+    """LEVEL_STARTS[d] = first sentence number with difficulty >= d (d = 0..11)."""
+    levels = [s.difficulty for s in docs]
+    return [bisect.bisect_left(levels, d) for d in range(MAX_DIFFICULTY + 2)]
+
+
+def encode_postings(postings):
+    """Encode ascending (doc, has_audio) postings as base64 gap varints."""
+    out = bytearray()
+    previous = 0
+    for doc, has_audio in postings:
+        value = ((doc - previous) << 1) | has_audio
+        previous = doc
+        while value >= 0x80:
+            out.append((value & 0x7F) | 0x80)
+            value >>= 7
+        out.append(value)
+    return base64.b64encode(bytes(out)).decode('ascii')
+
+
+def iter_postings(data):
+    """Yield (doc, has_audio) from raw varint bytes, so readers can stop early."""
+    doc = 0
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        doc += value >> 1
+        yield doc, value & 1
+        value = 0
+        shift = 0
+
+
+def decode_postings(encoded):
+    """Decode encode_postings() output back to [(doc, has_audio)]."""
+    return list(iter_postings(base64.b64decode(encoded)))
+
+
+def build_postings(docs):
+    """Map each token to its ascending (doc, has_audio) postings."""
+    postings = {}
+    for number, s in enumerate(docs):
+        has_audio = 1 if s.has_audio and s.audio_url else 0
+        for token in tokens_of(s.romanian):
+            postings.setdefault(token, []).append((number, has_audio))
+    return postings
+
+
+def doc_record(s):
+    """Compact sentence record: [id, romanian, english, difficulty, wordCount, hasAudio, audioUrl]."""
+    has_audio = 1 if s.has_audio and s.audio_url else 0
+    return [s.id, s.romanian, s.translation, s.difficulty, s.word_count, has_audio,
+            s.audio_url if has_audio else None]
+
+
+def write_module(path, value):
+    content = MODULE_PREFIX + json.dumps(value, ensure_ascii=False, separators=(',', ':')) + MODULE_SUFFIX
+    artifacts.write_text(path, content)
+    return len(content.encode('utf-8'))
+
+
+def write_docs(docs, search_dir=SEARCH_DIR):
+    """Write the sentence records in DOC_CHUNK-sized modules. Returns bytes written."""
+    docs_dir = os.path.join(search_dir, 'docs')
+    os.makedirs(docs_dir, exist_ok=True)
+    size = 0
+    chunks = 0
+    for chunks, start in enumerate(range(0, len(docs), DOC_CHUNK), 1):
+        size += write_module(os.path.join(docs_dir, f"{start // DOC_CHUNK}.js"),
+                             [doc_record(s) for s in docs[start:start + DOC_CHUNK]])
+    for name in os.listdir(docs_dir):
+        if name.endswith('.js') and int(name[:-3]) >= chunks:
+            os.remove(os.path.join(docs_dir, name))
+    return size
+
+
+@artifacts.batch()
+def write_shards(postings, budget_bytes, search_dir=SEARCH_DIR):
+    """Write the posting shards. Returns the shard index."""
+    os.makedirs(search_dir, exist_ok=True)
+
+    buckets = {}
+    for token in sorted(postings):
+        record = json.dumps(token, ensure_ascii=False) + ':"' + encode_postings(postings[token]) + '"'
+        buckets.setdefault(bucket_of(token), []).append((token, record))
+
+    index = {}
+    used_names = set()
+    for bucket in sorted(buckets):
+        previous_to = None
+        for n, shard_records in enumerate(plan_shards(buckets[bucket], budget_bytes), 1):
+            from_key = shard_records[0][0]
+            to_key = shard_records[-1][0]
+
+            name = unique_shard_name(bucket, from_key, previous_to, n, used_names, RESERVED_NAMES)
+
+            content = MODULE_PREFIX + '{' + ','.join(r[1] for r in shard_records) + '}' + MODULE_SUFFIX
+            artifacts.write_text(os.path.join(search_dir, f"{name}.js"), content)
+
+            index.setdefault(bucket, []).append({
+                'shard': name,
+                'from': from_key,
+                'to': to_key,
+                'count': len(shard_records),
+                'size': len(content.encode('utf-8')),
+            })
+            previous_to = to_key
+
+    keep = {f"{s['shard']}.js" for shards in index.values() for s in shards} | {'index.js'}
+    for name in os.listdir(search_dir):
+        if name.endswith('.js') and name not in keep:
+            os.remove(os.path.join(search_dir, name))
+
+    return index
+
+
+def write_index(index, starts, doc_count, search_dir=SEARCH_DIR):
+    """Write search/index.js for the given shard index."""
+    token_count = sum(s['count'] for shards in index.values() for s in shards)
+    shard_count = sum(len(shards) for shards in index.values())
+
+    content = f'''/**
+ * Tatoeba Sentence Search Index
+ * Generated by scripts/build_sentence_index.py
+ * Sentences: {doc_count}
+ * Tokens: {token_count} in {shard_count} shards
+ *
+ * Sentences are numbered easiest first, so posting lists are in difficulty
+ * order and "difficulty <= N" stops at LEVEL_STARTS[N + 1]. A posting list
+ * is base64 of LEB128 varints: (gap to previous sentence << 1) | hasAudio.
+ */
+
+export const DOC_CHUNK = {DOC_CHUNK};
+export const DOC_COUNT = {doc_count};
+export const LEVEL_STARTS = {json.dumps(starts)};
+export const INDEX = {json.dumps(index, ensure_ascii=False)};
+
+const SHARD_LOADERS = import.meta.glob(['./*.js', '!./index.js']);
+const DOC_LOADERS = import.meta.glob('./docs/*.js');
+
+const loadedShards = {{}};
+const loadedDocs = {{}};
+
+/**
+ * Fold a word the same way as the index (lowercase, no diacritics)
+ */
+export function foldToken(word) {{
+  return word.trim().toLowerCase().normalize('NFD').replace(/[\\u0300-\\u036f]/g, '');
+}}
+
+function bucketOf(key) {{
+  const first = key.charAt(0);
+  return first >= 'a' && first <= 'z' ? first : '#';
+}}
+
+/**
+ * Find the shard whose token range holds a folded token (null if none can)
+ */
+export function findShard(token) {{
+  const shards = INDEX[bucketOf(token)];
+  if (!shards) return null;
+
+  let lo = 0;
+  let hi = shards.length - 1;
+  let found = null;
+  while (lo <= hi) {{
+    const mid = (lo + hi) >> 1;
+    if (shards[mid].from <= token) {{
+      found = shards[mid];
+      lo = mid + 1;
+    }} else {{
+      hi = mid - 1;
+    }}
+  }}
+  return found && token <= found.to ? found.shard : null;
+}}
+
+async function loadModule(loaders, cache, key) {{
+  if (cache[key]) return cache[key];
+  const loader = loaders[key];
+  if (!loader) return null;
+  try {{
+    const module = await loader();
+    cache[key] = module.default;
+    return cache[key];
+  }} catch (err) {{
+    console.error(`Failed to load search module "${{key}}"`, err);
+    return null;
+  }}
+}}
+
+/**
+ * Decode a posting list into [sentenceNumber, hasAudio] pairs
+ */
+export function decodePostings(encoded) {{
+  const bytes = atob(encoded);
+  const postings = [];
+  let doc = 0;
+  let value = 0;
+  let shift = 0;
+  for (let i = 0; i < bytes.length; i++) {{
+    const byte = bytes.charCodeAt(i);
+    value += (byte & 0x7f) * 2 ** shift;
+    if (byte & 0x80) {{
+      shift += 7;
+      continue;
+    }}
+    doc += Math.floor(value / 2);
+    postings.push([doc, value % 2]);
+    value = 0;
+    shift = 0;
+  }}
+  return postings;
+}}
+
+/**
+ * Posting list for a folded token ([] if the token is not indexed)
+ */
+export async function getPostings(token) {{
+  const shard = findShard(token);
+  if (!shard) return [];
+  const table = await loadModule(SHARD_LOADERS, loadedShards, `./${{shard}}.js`);
+  if (!table || !Object.prototype.hasOwnProperty.call(table, token)) return [];
+  return decodePostings(table[token]);
+}}
+
+/**
+ * Load sentence objects by sentence number
+ */
+export async function getSentences(numbers) {{
+  const sentences = [];
+  for (const number of numbers) {{
+    const chunk = await loadModule(DOC_LOADERS, loadedDocs, `./docs/${{Math.floor(number / DOC_CHUNK)}}.js`);
+    const record = chunk && chunk[number % DOC_CHUNK];
+    if (!record) continue;
+    const [id, romanian, english, difficulty, wordCount, hasAudio, audioUrl] = record;
+    sentences.push({{ id, romanian, english, difficulty, wordCount, hasAudio: hasAudio === 1, audioUrl }});
+  }}
+  return sentences;
+}}
+
+/**
+ * Sentences containing any of the given words, easiest first
+ * @param {{string|string[]}} words - word or spelling variants to match
+ * @param {{Object}} options - {{ minDifficulty, maxDifficulty, audioOnly, limit }}
+ */
+export async function findSentences(words, {{ minDifficulty = 1, maxDifficulty = 10, audioOnly = false, limit = 5 }} = {{}}) {{
+  const tokens = [...new Set((Array.isArray(words) ? words : [words]).map(foldToken).filter(Boolean))];
+  const first = LEVEL_STARTS[Math.max(0, Math.min(minDifficulty, LEVEL_STARTS.length - 1))];
+  const end = LEVEL_STARTS[Math.max(0, Math.min(maxDifficulty + 1, LEVEL_STARTS.length - 1))];
+
+  const numbers = new Set();
+  for (const token of tokens) {{
+    for (const [doc, hasAudio] of await getPostings(token)) {{
+      if (doc >= end) break;
+      if (doc < first || (audioOnly && !hasAudio)) continue;
+      numbers.add(doc);
+    }}
+  }}
+
+  const chosen = [...numbers].sort((a, b) => a - b).slice(0, limit);
+  return getSentences(chosen);
+}}
+
+export default {{
+  findSentences,
+  getPostings,
+  getSentences,
+  findShard,
+}};
+'''
+    artifacts.write_text(os.path.join(search_dir, 'index.js'), content)
+
+    return token_count, shard_count
+
+
+def build_sentence_index(sentences, budget_kb=DEFAULT_BUDGET_KB, search_dir=SEARCH_DIR):
+    """
+    Build the search index for sentence objects (process_sentences output or
+    the level files). Returns build stats.
+    """
+    docs = order_documents(sentences)
+    postings = build_postings(docs)
+    index = write_shards(postings, budget_kb * 1024, search_dir)
+    doc_bytes = write_docs(docs, search_dir)
+    starts = level_starts(docs)
+    token_count, shard_count = write_index(index, starts, len(docs), search_dir)
+    return {
+        'sentences': len(docs),
+        'tokens': token_count,
+        'shards': shard_count,
+        'postings': sum(len(p) for p in postings.values()),
+        'shard_bytes': sum(s['size'] for shards in index.values() for s in shards),
+        'doc_bytes': doc_bytes,
+    }
+
+
+class SentenceIndex:
+    """
+    Query API over a built search directory. Shards and sentence chunks are
+    read on first use and cached.
+
+        index = SentenceIndex.load()
+        index.search('pisica', max_difficulty=3, audio=True)
+    """
+
+    INDEX_LINE_RE = re.compile(r'^export const (\w+) = (.*);$', re.M)
+
+    def __init__(self, search_dir, shards, starts, doc_count):
+        self.search_dir = search_dir
+        self.shards = shards
+        self.starts = starts
+        self.doc_count = doc_count
+        self._shards = {}
+        self._postings = {}
+        self._docs = {}
+
+    @classmethod
+    def load(cls, search_dir=SEARCH_DIR):
+        with open(os.path.join(search_dir, 'index.js'), 'r', encoding='utf-8') as f:
+            constants = {name: json.loads(value) for name, value in cls.INDEX_LINE_RE.findall(f.read())}
+        return cls(search_dir, constants['INDEX'], constants['LEVEL_STARTS'], constants['DOC_COUNT'])
+
+    @staticmethod
+    def _read_module(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        return json.loads(content[len(MODULE_PREFIX):-len(MODULE_SUFFIX)])
+
+    def find_shard(self, token):
+        shards = self.shards.get(bucket_of(token), [])
+        i = bisect.bisect_right([s['from'] for s in shards], token) - 1
+        if i >= 0 and token <= shards[i]['to']:
+            return shards[i]['shard']
+        return None
+
+    def iter_postings(self, word):
+        """Yield (sentence_number, has_audio) for a word, easiest first."""
+        token = fold_diacritics(word.strip())
+        if token not in self._postings:
+            shard = self.find_shard(token)
+            if shard is None:
+                return iter(())
+            if shard not in self._shards:
+                self._shards[shard] = self._read_module(os.path.join(self.search_dir, f"{shard}.js"))
+            encoded = self._shards[shard].get(token)
+            self._postings[token] = base64.b64decode(encoded) if encoded else b''
+        return iter_postings(self._postings[token])
+
+    def postings(self, word):
+        """[(sentence_number, has_audio)] for a word, easiest first."""
+        return list(self.iter_postings(word))
+
+    def sentence(self, number):
+        chunk = number // DOC_CHUNK
+        if chunk not in self._docs:
+            self._docs[chunk] = self._read_module(os.path.join(self.search_dir, 'docs', f"{chunk}.js"))
+        sentence_id, romanian, english, difficulty, word_count, has_audio, audio_url = self._docs[chunk][number % DOC_CHUNK]
+        return {
+            'id': sentence_id,
+            'romanian': romanian,
+            'english': english,
+            'difficulty': difficulty,
+            'wordCount': word_count,
+            'hasAudio': bool(has_audio),
+            'audioUrl': audio_url,
+        }
+
+    def search(self, word, min_difficulty=1, max_difficulty=MAX_DIFFICULTY, audio=None, limit=20):
+        """Sentences containing `word` in the difficulty range, easiest first."""
+        first = self.starts[max(0, min(min_difficulty, len(self.starts) - 1))]
+        end = self.starts[max(0, min(max_difficulty + 1, len(self.starts) - 1))]
+        results = []
+        for number, has_audio in self.iter_postings(word):
+            if number >= end or len(results) >= limit:
+                break
+            if number < first or (audio is not None and bool(has_audio) != audio):
+                continue
+            results.append(self.sentence(number))
+        return results
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build or query the Tatoeba sentence search index.")
+    parser.add_argument('--budget', type=int, default=DEFAULT_BUDGET_KB,
+                        help=f"maximum posting shard size in KB (default: {DEFAULT_BUDGET_KB})")
+    parser.add_argument('--query', metavar='WORD', help="search the built index instead of building")
+    parser.add_argument('--max-difficulty', type=int, default=MAX_DIFFICULTY)
+    parser.add_argument('--audio', action='store_true', help="only sentences with audio")
+    parser.add_argument('--limit', type=int, default=10)
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'build_sentence_index')
+
+    if args.query:
+        with metrics.stage('query') as stage:
+            index = SentenceIndex.load()
+            results = index.search(args.query, max_difficulty=args.max_difficulty,
+                                   audio=True if args.audio else None, limit=args.limit)
+            stage.rows = len(results)
+        for s in results:
+            audio = ' [audio]' if s['hasAudio'] else ''
+            print(f"  {s['difficulty']:>2} {s['romanian']} — {s['english']}{audio}")
+        print(f"\n  {len(results)} sentences in {stage.seconds * 1000:.2f} ms")
+        return
+
+    print("=" * 60)
+    print("Tatoeba Sentence Search Index Builder")
+    print("=" * 60)
+
+    print("\nStep 1: Loading sentences from the level files...")
+    with metrics.stage('load sentences') as stage:
+        sentences = load_level_sentences()
+        stage.rows = len(sentences)
+    print(f"  {len(sentences)} sentences")
+
+    print(f"\nStep 2: Writing index (budget {args.budget}KB)...")
+    with metrics.stage('build index') as stage:
+        stats = build_sentence_index(sentences, args.budget)
+        stage.rows = stats['sentences']
+    print(f"  {stats['tokens']} tokens, {stats['postings']} postings in {stats['shards']} shards "
+          f"({stats['shard_bytes'] / 1024:.1f}KB), sentences {stats['doc_bytes'] / 1024:.1f}KB")
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Search index written to {SEARCH_DIR}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -7,49 +7,59 @@ Consolidate Tatoeba sentences into audio-only files.
 - Advanced: keep all sentences (audio is rare for complex sentences)
 """
 
-import re
+import argparse
 import os
-from datetime import datetime
+import re
+
+import artifacts
+import js_emit
+import metrics
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 DATA_DIR = os.path.join(PROJECT_DIR, "src", "data", "tatoeba")
 
+# A quoted string body, escapes included. Unrolled into runs of plain
+# characters between escapes: one alternation per character is about
+# twice as slow on level files.
+STRING = r"'([^'\\]*(?:\\.[^'\\]*)*)'"
+SENTENCE_RE = re.compile(
+    r"\{\s*id:\s*" + STRING + r",\s*romanian:\s*" + STRING + r",\s*english:\s*" + STRING +
+    r",\s*difficulty:\s*(\d+),\s*wordCount:\s*(\d+),\s*hasAudio:\s*(true|false),\s*audioUrl:\s*(null|" +
+    STRING + r")\s*\}",
+    re.DOTALL,
+)
+
 def extract_sentences(filepath):
     """Extract sentence objects from a JS file."""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
 
-    # Match sentence objects
-    pattern = r"\{\s*id:\s*'([^']+)',\s*romanian:\s*'([^']*)',\s*english:\s*'([^']*)',\s*difficulty:\s*(\d+),\s*wordCount:\s*(\d+),\s*hasAudio:\s*(true|false),\s*audioUrl:\s*(null|'[^']*')\s*\}"
-
+    # Strings may hold escaped quotes and backslashes; decode them so they
+    # are escaped exactly once when written back
+    unescape = js_emit.unescape
     sentences = []
-    for match in re.finditer(pattern, content):
-        audio_url = match.group(7)
-        if audio_url != 'null':
-            audio_url = audio_url.strip("'")
-        else:
-            audio_url = None
-
+    for match in SENTENCE_RE.finditer(content):
         sentences.append({
-            'id': match.group(1),
-            'romanian': match.group(2),
-            'english': match.group(3),
+            'id': unescape(match.group(1)),
+            'romanian': unescape(match.group(2)),
+            'english': unescape(match.group(3)),
             'difficulty': int(match.group(4)),
             'wordCount': int(match.group(5)),
             'hasAudio': match.group(6) == 'true',
-            'audioUrl': audio_url
+            'audioUrl': unescape(match.group(8)) if match.group(8) is not None else None,
         })
 
     return sentences
 
-def write_js_file(filepath, sentences, export_name, header_comment):
-    """Write sentences to a JS file."""
-    date_str = datetime.now().strftime('%Y-%m-%d')
+def write_js_file(filepath, sentences, export_name, header_comment, date_str):
+    """
+    Write sentences to a JS file, dated `date_str`.
+    Returns False when the file already had this content.
+    """
     audio_count = len([s for s in sentences if s['hasAudio'] and s['audioUrl']])
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(f'''/**
+    header = f'''/**
  * {header_comment}
  * Source: tatoeba.org (CC-BY 2.0 FR)
  *
@@ -59,26 +69,31 @@ def write_js_file(filepath, sentences, export_name, header_comment):
  */
 
 export const {export_name} = [
-''')
+'''
 
-        for i, s in enumerate(sentences):
-            romanian = s['romanian'].replace("'", "\\'")
-            english = s['english'].replace("'", "\\'")
-            audio_url = f"'{s['audioUrl']}'" if s['audioUrl'] else 'null'
-            has_audio = 'true' if s['hasAudio'] and s['audioUrl'] else 'false'
+    js_string, js_bool = js_emit.js_string, js_emit.js_bool
 
-            f.write(f"  {{ id: '{s['id']}', romanian: '{romanian}', english: '{english}', difficulty: {s['difficulty']}, wordCount: {s['wordCount']}, hasAudio: {has_audio}, audioUrl: {audio_url} }}")
+    def render(s):
+        return (f"  {{ id: {js_string(s['id'])}, romanian: {js_string(s['romanian'])}, "
+                f"english: {js_string(s['english'])}, difficulty: {s['difficulty']}, "
+                f"wordCount: {s['wordCount']}, hasAudio: {js_bool(s['hasAudio'] and s['audioUrl'])}, "
+                f"audioUrl: {js_string(s['audioUrl'] or None)} }}")
 
-            if i < len(sentences) - 1:
-                f.write(',')
-            f.write('\n')
-
-        f.write(f'''];
+    footer = f'''];
 
 export default {export_name};
-''')
+'''
+    return js_emit.write_module(filepath, header, js_emit.rows(sentences, render), footer)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Consolidate Tatoeba level files into audio-only files.")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
 
 def main():
+    args = parse_args()
+    metrics.configure(args, 'consolidate_audio_only')
+
     print("=" * 60)
     print("Consolidating Tatoeba Sentences (Audio-Only)")
     print("=" * 60)
@@ -86,12 +101,19 @@ def main():
     # Load all sentences
     print("\nLoading sentences...")
 
-    beginner = extract_sentences(os.path.join(DATA_DIR, 'beginner.js'))
-    beginner_ext = extract_sentences(os.path.join(DATA_DIR, 'beginner_extended.js'))
-    intermediate = extract_sentences(os.path.join(DATA_DIR, 'intermediate.js'))
-    intermediate_ext = extract_sentences(os.path.join(DATA_DIR, 'intermediate_extended.js'))
-    advanced = extract_sentences(os.path.join(DATA_DIR, 'advanced.js'))
-    advanced_ext = extract_sentences(os.path.join(DATA_DIR, 'advanced_extended.js'))
+    # Date the output by its inputs, so an unchanged merge rewrites nothing
+    input_paths = [os.path.join(DATA_DIR, f"{level}{suffix}.js")
+                   for level in ('beginner', 'intermediate', 'advanced') for suffix in ('', '_extended')]
+    date_str = artifacts.build_date(artifacts.header_dates(input_paths))
+
+    with metrics.stage('extract sentences') as stage:
+        beginner = extract_sentences(os.path.join(DATA_DIR, 'beginner.js'))
+        beginner_ext = extract_sentences(os.path.join(DATA_DIR, 'beginner_extended.js'))
+        intermediate = extract_sentences(os.path.join(DATA_DIR, 'intermediate.js'))
+        intermediate_ext = extract_sentences(os.path.join(DATA_DIR, 'intermediate_extended.js'))
+        advanced = extract_sentences(os.path.join(DATA_DIR, 'advanced.js'))
+        advanced_ext = extract_sentences(os.path.join(DATA_DIR, 'advanced_extended.js'))
+        stage.rows = len(beginner_merged) + len(intermediate_merged) + len(advanced_merged)
 
     print(f"  Beginner: {len(beginner)} + {len(beginner_ext)} extended")
     print(f"  Intermediate: {len(intermediate)} + {len(intermediate_ext)} extended")
@@ -99,37 +121,38 @@ def main():
 
     # Merge and filter
     print("\nFiltering to audio-only (except advanced)...")
-
-    # Beginner: audio only, deduplicate by Romanian text
-    seen_ro = set()
-    beginner_merged = []
-    for s in beginner + beginner_ext:
-        if s['hasAudio'] and s['audioUrl'] and s['romanian'].lower() not in seen_ro:
-            seen_ro.add(s['romanian'].lower())
-            beginner_merged.append(s)
-
-    # Sort by difficulty, then word count
-    beginner_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
-
-    # Intermediate: audio only, deduplicate
-    seen_ro = set()
-    intermediate_merged = []
-    for s in intermediate + intermediate_ext:
-        if s['hasAudio'] and s['audioUrl'] and s['romanian'].lower() not in seen_ro:
-            seen_ro.add(s['romanian'].lower())
-            intermediate_merged.append(s)
-
-    intermediate_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
-
-    # Advanced: keep ALL (audio is rare), deduplicate
-    seen_ro = set()
-    advanced_merged = []
-    for s in advanced + advanced_ext:
-        if s['romanian'].lower() not in seen_ro:
-            seen_ro.add(s['romanian'].lower())
-            advanced_merged.append(s)
-
-    advanced_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
+    with metrics.stage('merge and filter') as stage:
+        # Beginner: audio only, deduplicate by Romanian text
+        seen_ro = set()
+        beginner_merged = []
+        for s in beginner + beginner_ext:
+            if s['hasAudio'] and s['audioUrl'] and s['romanian'].lower() not in seen_ro:
+                seen_ro.add(s['romanian'].lower())
+                beginner_merged.append(s)
+
+        # Sort by difficulty, then word count
+        beginner_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
+
+        # Intermediate: audio only, deduplicate
+        seen_ro = set()
+        intermediate_merged = []
+        for s in intermediate + intermediate_ext:
+            if s['hasAudio'] and s['audioUrl'] and s['romanian'].lower() not in seen_ro:
+                seen_ro.add(s['romanian'].lower())
+                intermediate_merged.append(s)
+
+        intermediate_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
+
+        # Advanced: keep ALL (audio is rare), deduplicate
+        seen_ro = set()
+        advanced_merged = []
+        for s in advanced + advanced_ext:
+            if s['romanian'].lower() not in seen_ro:
+                seen_ro.add(s['romanian'].lower())
+                advanced_merged.append(s)
+
+        advanced_merged.sort(key=lambda x: (x['difficulty'], x['wordCount']))
+        stage.rows = len(beginner_merged) + len(intermediate_merged) + len(advanced_merged)
 
     print(f"  Beginner (audio-only): {len(beginner_merged)}")
     print(f"  Intermediate (audio-only): {len(intermediate_merged)}")
@@ -138,29 +161,32 @@ def main():
     # Write consolidated files
     print("\nWriting consolidated files...")
 
-    write_js_file(
+    changed = write_js_file(
         os.path.join(DATA_DIR, 'beginner.js'),
         beginner_merged,
         'TATOEBA_BEGINNER',
-        'Tatoeba Beginner Sentences - Audio Only'
+        'Tatoeba Beginner Sentences - Audio Only',
+        date_str
     )
-    print(f"  beginner.js: {len(beginner_merged)} sentences")
+    print(f"  beginner.js: {len(beginner_merged)} sentences{'' if changed else ' (unchanged)'}")
 
-    write_js_file(
+    changed = write_js_file(
         os.path.join(DATA_DIR, 'intermediate.js'),
         intermediate_merged,
         'TATOEBA_INTERMEDIATE',
-        'Tatoeba Intermediate Sentences - Audio Only'
+        'Tatoeba Intermediate Sentences - Audio Only',
+        date_str
     )
-    print(f"  intermediate.js: {len(intermediate_merged)} sentences")
+    print(f"  intermediate.js: {len(intermediate_merged)} sentences{'' if changed else ' (unchanged)'}")
 
-    write_js_file(
+    changed = write_js_file(
         os.path.join(DATA_DIR, 'advanced.js'),
         advanced_merged,
         'TATOEBA_ADVANCED',
-        'Tatoeba Advanced Sentences - All (audio rare)'
+        'Tatoeba Advanced Sentences - All (audio rare)',
+        date_str
     )
-    print(f"  advanced.js: {len(advanced_merged)} sentences")
+    print(f"  advanced.js: {len(advanced_merged)} sentences{'' if changed else ' (unchanged)'}")
 
     # Remove extended files (now merged)
     print("\nRemoving extended files (now merged)...")
@@ -173,6 +199,8 @@ def main():
     total = len(beginner_merged) + len(intermediate_merged) + len(advanced_merged)
     audio_total = len(beginner_merged) + len(intermediate_merged) + len([s for s in advanced_merged if s['audioUrl']])
 
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
     print("\n" + "=" * 60)
     print(f"Done! Total: {total} sentences ({audio_total} with audio)")
     print("=" * 60)
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Dictionary Lookup Index
+
+Builds a minimal perfect hash (CHD: compress, hash and displace) over every
+dictionary headword and inflected form, mapping the folded key (lowercase,
+no diacritics) to the shard and record offset of each matching entry.
+A lookup is one hash probe plus a read of one record from one shard.
+
+Binary layout of scripts/temp/lookup.bin (little-endian):
+
+    header        'RODX', version u16, shard count u16,
+                  key count u32, slot count u32, bucket count u32,
+                  overflow count u32
+    shard names   per shard: u8 length + UTF-8 name
+    (padding to a multiple of 4)
+    displacements u32 per bucket (d0 * slots + d1)
+    values        u32 per slot: shard << 16 | offset,
+                  OVERFLOW_FLAG | index into the overflow table, or
+                  EMPTY for the few unused slots
+    overflow      u32 count followed by that many packed postings
+    fingerprints  u8 per slot
+
+Most keys are inflected forms (about 230k of 280k), so the index comes to
+about 2MB, roughly 7 bytes per key. That is too large to ship up front,
+so it is an offline tool for the data scripts (--query) and isn't part of
+the app: the app resolves headwords by shard range (dictionary/index.js)
+and inflected forms through the form tables (build_form_index.py). Shard
+ids, offsets and displacements that don't fit their fields fail the build
+instead of writing a corrupt index.
+
+Usage:
+    python scripts/dictionary_lookup.py                 # build the index
+    python scripts/dictionary_lookup.py --query fetelor # query it
+"""
+
+import argparse
+import os
+import random
+import struct
+import sys
+import time
+from array import array
+
+import metrics
+from dictionary_shards import DICTIONARY_DIR, fold_diacritics, iter_entries, list_shards, read_shard
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+LOOKUP_PATH = os.path.join(SCRIPT_DIR, "temp", "lookup.bin")
+
+MAGIC = b'RODX'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIIII')
+
+# Average keys per CHD bucket; higher is smaller but slower to build
+BUCKET_SIZE = 3
+# Keys per slot; a few spare slots keep the last buckets cheap to place
+LOAD_FACTOR = 0.99
+
+MAX_D0 = 4096
+MAX_D1_TRIES = 100000
+OVERFLOW_FLAG = 0x80000000
+EMPTY = 0xFFFFFFFF
+MAX_OFFSET = 0xFFFF
+# Shard ids sit above the offset; from 0x8000 they would set OVERFLOW_FLAG
+MAX_SHARDS = OVERFLOW_FLAG >> 16
+
+FNV_PRIME = 0x01000193
+BASIS_BUCKET = 0x811C9DC5
+BASIS_SLOT = 0x9747B28C
+GOLDEN = 0x9E3779B1
+MASK32 = 0xFFFFFFFF
+
+# Form slots that hold metadata rather than a word form
+NON_FORM_TAGS = {'table-tags', 'inflection-template', 'class', 'romanization'}
+
+
+def fnv1a(data, basis):
+    """32-bit FNV-1a over bytes, starting from `basis`."""
+    h = basis
+    for byte in data:
+        h = ((h ^ byte) * FNV_PRIME) & MASK32
+    return h
+
+
+def fmix32(h):
+    """MurmurHash3 finalizer: spreads FNV's weak low bits over the word."""
+    h ^= h >> 16
+    h = (h * 0x85EBCA6B) & MASK32
+    h ^= h >> 13
+    h = (h * 0xC2B2AE35) & MASK32
+    return h ^ (h >> 16)
+
+
+def key_hashes(key):
+    """
+    Return (h1, h2, h3) for a folded key.
+
+    h1 picks the bucket, h2 gives the fingerprint and base slot, h3 the
+    per-bucket stride.
+    """
+    data = key.encode('utf-8')
+    h1 = fmix32(fnv1a(data, BASIS_BUCKET))
+    h2 = fmix32(fnv1a(data, BASIS_SLOT))
+    h3 = fmix32((h2 + GOLDEN) & MASK32)
+    return h1, h2, h3
+
+
+def slot_of(h2, h3, n, d0, d1):
+    """CHD slot: (f1 + d0 * f2 + d1) mod n."""
+    f1 = h2 % n
+    f2 = h3 % (n - 1) + 1 if n > 1 else 0
+    return (f1 + d0 * f2 + d1) % n
+
+
+def collect_postings(dictionary_dir=DICTIONARY_DIR):
+    """
+    Map each folded key to its (shard, offset) postings.
+
+    Headword postings come before form postings so callers that want the
+    lemma itself can take the first match.
+    """
+    headwords = {}
+    forms = {}
+    for shard, offset, entry in iter_entries(dictionary_dir):
+        key = fold_diacritics(entry['word'])
+        headwords.setdefault(key, []).append((shard, offset))
+        for tag, form in (entry.get('forms') or {}).items():
+            if tag in NON_FORM_TAGS or not isinstance(form, str) or not form.strip():
+                continue
+            form_key = fold_diacritics(form.strip())
+            if form_key == key:
+                continue
+            postings = forms.setdefault(form_key, [])
+            if (shard, offset) not in postings:
+                postings.append((shard, offset))
+
+    postings = headwords
+    for key, form_postings in forms.items():
+        postings.setdefault(key, [])
+        postings[key].extend(p for p in form_postings if p not in postings[key])
+    return postings
+
+
+def build_mphf(keys):
+    """
+    Place keys with CHD.
+
+    Returns (displacements, slots, fingerprints) where slots[i] is the slot
+    of keys[i] in a table of len(fingerprints) slots.
+    """
+    n = max(2, int(len(keys) / LOAD_FACTOR) + 1)
+    n_buckets = max(1, (len(keys) + BUCKET_SIZE - 1) // BUCKET_SIZE)
+
+    hashes = [key_hashes(k) for k in keys]
+    buckets = [[] for _ in range(n_buckets)]
+    for i, (h1, _, _) in enumerate(hashes):
+        buckets[h1 % n_buckets].append(i)
+
+    taken = bytearray(n)
+    displacements = array('I', [0]) * n_buckets
+    slots = array('I', [0]) * len(keys)
+    next_free = 0
+    rng = random.Random(0)
+
+    for b in sorted(range(n_buckets), key=lambda b: -len(buckets[b])):
+        members = buckets[b]
+        if not members:
+            continue
+
+        if len(members) == 1:
+            # Any free slot works: pick the next one and solve for d1
+            while taken[next_free]:
+                next_free += 1
+            i = members[0]
+            base = slot_of(hashes[i][1], hashes[i][2], n, 0, 0)
+            d1 = (next_free - base) % n
+            taken[next_free] = 1
+            slots[i] = next_free
+            displacements[b] = d1
+            continue
+
+        for d0 in range(MAX_D0):
+            bases = [slot_of(hashes[i][1], hashes[i][2], n, d0, 0) for i in members]
+            if len(set(bases)) < len(bases):
+                continue
+            # Random displacements; scanning them in order lines buckets up
+            # with earlier ones and collides far more often
+            for _ in range(MAX_D1_TRIES):
+                d1 = rng.randrange(n)
+                positions = [(base + d1) % n for base in bases]
+                if not any(taken[p] for p in positions):
+                    break
+            else:
+                continue
+            if d0 * n + d1 > MASK32:
+                raise ValueError(f"Displacement {d0} * {n} + {d1} does not fit in 32 bits")
+            for i, p in zip(members, positions):
+                taken[p] = 1
+                slots[i] = p
+            displacements[b] = d0 * n + d1
+            break
+        else:
+            raise RuntimeError(f"Could not place bucket of {len(members)} keys")
+
+    fingerprints = bytearray(n)
+    for i, (_, h2, _) in enumerate(hashes):
+        fingerprints[slots[i]] = h2 >> 24
+
+    return displacements, slots, fingerprints
+
+
+def build_index(dictionary_dir=DICTIONARY_DIR, output_path=LOOKUP_PATH):
+    """Build lookup.bin. Returns a stats dict."""
+    shard_names = list(list_shards(dictionary_dir))
+    if len(shard_names) > MAX_SHARDS:
+        raise ValueError(f"{len(shard_names)} shards exceed the {MAX_SHARDS} a posting can address")
+    shard_ids = {name: i for i, name in enumerate(shard_names)}
+
+    postings = collect_postings(dictionary_dir)
+    keys = list(postings)
+    displacements, slots, fingerprints = build_mphf(keys)
+
+    values = array('I', [EMPTY]) * len(fingerprints)
+    overflow = array('I')
+    for i, key in enumerate(keys):
+        packed = []
+        for shard, offset in postings[key]:
+            if offset > MAX_OFFSET:
+                raise ValueError(f"Record offset {offset} in shard {shard} exceeds {MAX_OFFSET}")
+            packed.append(shard_ids[shard] << 16 | offset)
+        if len(packed) == 1:
+            values[slots[i]] = packed[0]
+        else:
+            if len(overflow) >= OVERFLOW_FLAG:
+                raise ValueError(f"Overflow table of {len(overflow)} words exceeds {OVERFLOW_FLAG - 1}")
+            values[slots[i]] = OVERFLOW_FLAG | len(overflow)
+            overflow.append(len(packed))
+            overflow.extend(packed)
+
+    names = b''.join(bytes([len(s.encode('utf-8'))]) + s.encode('utf-8') for s in shard_names)
+    names += b'\0' * (-(HEADER.size + len(names)) % 4)
+
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    with open(output_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(shard_names), len(keys), len(fingerprints),
+                            len(displacements), len(overflow)))
+        f.write(names)
+        f.write(displacements.tobytes())
+        f.write(values.tobytes())
+        f.write(overflow.tobytes())
+        f.write(bytes(fingerprints))
+
+    return {
+        'keys': len(keys),
+        'slots': len(fingerprints),
+        'buckets': len(displacements),
+        'overflow_words': len(overflow),
+        'shards': len(shard_names),
+        'bytes': os.path.getsize(output_path),
+    }
+
+
+class LookupIndex:
+    """
+    Query API over lookup.bin for offline tools.
+
+        index = LookupIndex.load()
+        index.lookup('fetelor')   # [('f-3', 412), ...]
+        index.entries('fetelor')  # matching dictionary entries
+    """
+
+    def __init__(self, data, dictionary_dir=DICTIONARY_DIR):
+        magic, version, n_shards, self.keys, n, n_buckets, n_overflow = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("Not a dictionary lookup index (or unsupported version)")
+
+        pos = HEADER.size
+        self.shards = []
+        for _ in range(n_shards):
+            length = data[pos]
+            self.shards.append(data[pos + 1:pos + 1 + length].decode('utf-8'))
+            pos += 1 + length
+        pos += -pos % 4
+
+        self.n = n
+        self.displacements = array('I', data[pos:pos + 4 * n_buckets])
+        pos += 4 * n_buckets
+        self.values = array('I', data[pos:pos + 4 * n])
+        pos += 4 * n
+        self.overflow = array('I', data[pos:pos + 4 * n_overflow])
+        pos += 4 * n_overflow
+        self.fingerprints = data[pos:pos + n]
+
+        if sys.byteorder != 'little':
+            for table in (self.displacements, self.values, self.overflow):
+                table.byteswap()
+
+        self.dictionary_dir = dictionary_dir
+        self._shard_paths = list_shards(dictionary_dir)
+        self._loaded = {}
+
+    @classmethod
+    def load(cls, path=LOOKUP_PATH, dictionary_dir=DICTIONARY_DIR):
+        with open(path, 'rb') as f:
+            return cls(f.read(), dictionary_dir)
+
+    def lookup(self, word):
+        """
+        Return [(shard, offset), ...] for a word (headword postings first).
+
+        An unknown word returns [] unless it collides with a key's 8-bit
+        fingerprint; entries() filters those out.
+        """
+        if not self.keys:
+            return []
+        h1, h2, h3 = key_hashes(fold_diacritics(word.strip()))
+        disp = self.displacements[h1 % len(self.displacements)]
+        slot = slot_of(h2, h3, self.n, disp // self.n, disp % self.n)
+        if self.fingerprints[slot] != h2 >> 24:
+            return []
+
+        value = self.values[slot]
+        if value == EMPTY:
+            return []
+        if value & OVERFLOW_FLAG:
+            start = value & ~OVERFLOW_FLAG
+            packed = self.overflow[start + 1:start + 1 + self.overflow[start]]
+        else:
+            packed = [value]
+        return [(self.shards[p >> 16], p & 0xFFFF) for p in packed]
+
+    def _shard(self, shard):
+        if shard not in self._loaded:
+            self._loaded[shard] = read_shard(self._shard_paths[shard])
+        return self._loaded[shard]
+
+    def entries(self, word):
+        """Return the dictionary entries a word resolves to (headword or form)."""
+        key = fold_diacritics(word.strip())
+        result = []
+        for shard, offset in self.lookup(word):
+            entry = self._shard(shard)[offset]
+            candidates = [entry['word']] + [
+                v for t, v in (entry.get('forms') or {}).items()
+                if t not in NON_FORM_TAGS and isinstance(v, str)
+            ]
+            if any(fold_diacritics(c.strip()) == key for c in candidates):
+                result.append(entry)
+        return result
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Build or query the dictionary lookup index.")
+    parser.add_argument('--query', nargs='+', metavar='WORD', help="look up words instead of building")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'dictionary_lookup')
+
+    if args.query:
+        index = LookupIndex.load()
+        for word in args.query:
+            start = time.perf_counter()
+            postings = index.lookup(word)
+            elapsed = (time.perf_counter() - start) * 1e6
+            print(f"{word}: {postings} ({elapsed:.0f} µs)")
+            for entry in index.entries(word):
+                print(f"  {entry['word']} ({entry['pos']}): {entry['definitions'][0]}")
+        return
+
+    print("=" * 60)
+    print("Dictionary Lookup Index")
+    print("=" * 60)
+
+    with metrics.stage('build index') as stage:
+        stats = build_index()
+        stage.rows = stats['keys']
+    elapsed = stage.seconds
+
+    print(f"\n  Keys: {stats['keys']} (headwords and forms) across {stats['shards']} shards")
+    print(f"  Slots: {stats['slots']}, buckets: {stats['buckets']}, overflow words: {stats['overflow_words']}")
+    print(f"  Size: {stats['bytes'] / 1024:.1f}KB ({stats['bytes'] / max(stats['keys'], 1):.2f} bytes/key)")
+    print(f"  Built in {elapsed:.1f}s")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Index written to {LOOKUP_PATH}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
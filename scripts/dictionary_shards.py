@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Dictionary Shard Helpers
+
+Shared readers for the generated dictionary in src/data/dictionary. Each
+shard is an ES module (`export default [...]`) of Kaikki.org entries and
+index.js maps shard keys to files.
+"""
+
+import json
+import os
+import re
+import unicodedata
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DICTIONARY_DIR = os.path.join(PROJECT_DIR, "src", "data", "dictionary")
+
+# Frequency-ranked shard bundled with index.js (see build_hot_shard.py)
+HOT_SHARD_FILE = 'hot.js'
+
+COMBINING_MARKS_RE = re.compile('[\u0300-\u036f]')
+
+
+def fold_diacritics(text):
+    """
+    Lowercase and strip Romanian diacritics (ă→a, ș/ş→s, ț/ţ→t).
+
+    Same as the app's foldKey: NFD, then drop U+0300-U+036F.
+    """
+    return COMBINING_MARKS_RE.sub('', unicodedata.normalize('NFD', text.lower()))
+
+
+def read_shard(filepath):
+    """Read a dictionary shard module as a list of entries."""
+    with open(filepath, 'r', encoding='utf-8') as f:
+        content = f.read()
+    start = content.index('[')
+    end = content.rindex(']')
+    return json.loads(content[start:end + 1])
+
+
+def list_shards(dictionary_dir=DICTIONARY_DIR):
+    """Return {shard_key: path} for every range shard (not index.js or the hot shard)."""
+    return {
+        name[:-3]: os.path.join(dictionary_dir, name)
+        for name in sorted(os.listdir(dictionary_dir))
+        if name.endswith('.js') and name not in ('index.js', HOT_SHARD_FILE)
+    }
+
+
+def iter_entries(dictionary_dir=DICTIONARY_DIR):
+    """Yield (shard_key, record_offset, entry) for every dictionary entry."""
+    for key, path in list_shards(dictionary_dir).items():
+        for offset, entry in enumerate(read_shard(path)):
+            yield key, offset, entry
+
+
+def build_word_to_shard(dictionary_dir=DICTIONARY_DIR):
+    """
+    Map every lowercase headword to the shard holding it.
+
+    This is the match the app's lookupWord performs (`w.word.toLowerCase()`),
+    so a key found here is guaranteed to resolve with one shard load.
+    """
+    word_to_shard = {}
+    for key, _, entry in iter_entries(dictionary_dir):
+        word_to_shard.setdefault(entry['word'].lower(), key)
+    return word_to_shard
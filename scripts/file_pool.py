@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Parallel File Processing
+
+Runs a per-file function over many level or shard files in a process pool,
+with one read-only object (an index built once by the caller) shared by
+every worker.
+
+    import file_pool
+
+    index = load_index()
+    results = file_pool.map_files(update_file, paths, index, workers)
+
+The shared object is never pickled: it is published in a module global
+before the pool forks, so workers inherit it copy-on-write. gc.freeze()
+moves it out of the collector's reach first, so garbage collection in a
+worker doesn't write to (and copy) every page of the index. Only the file
+path goes to a worker and only the function's result (small counts) comes
+back, in the order of `paths`.
+
+Without fork (e.g. Windows) or with one worker, files are processed in
+this process.
+
+Workers that write src/data files pass track=False to artifacts' writers:
+every tracked write rewrites manifest.json, and concurrent workers would
+race on it. Call artifacts.refresh() once after map_files() instead.
+"""
+
+import argparse
+import gc
+import multiprocessing
+import os
+
+_shared = None
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def worker_count(value):
+    """argparse type: a worker count of at least 1."""
+    try:
+        result = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value}")
+    if result < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return result
+
+
+def add_arguments(parser):
+    """Add --workers to an argparse parser."""
+    parser.add_argument('--workers', type=worker_count, default=default_workers(),
+                        help="files processed in parallel (default: one per CPU)")
+    return parser
+
+
+def _call(job):
+    function, path = job
+    return function(path, _shared)
+
+
+def map_files(function, paths, shared, workers=None):
+    """
+    function(path, shared) for every path, in a fork pool when there is more
+    than one worker and file. `function` must be a module-level function.
+    Returns the results in the order of `paths`.
+    """
+    global _shared
+
+    workers = min(workers or default_workers(), len(paths))
+    if workers <= 1 or 'fork' not in multiprocessing.get_all_start_methods():
+        return [function(path, shared) for path in paths]
+
+    _shared = shared
+    gc.freeze()
+    try:
+        with multiprocessing.get_context('fork').Pool(workers) as pool:
+            return pool.map(_call, [(function, path) for path in paths], chunksize=1)
+    finally:
+        gc.unfreeze()
+        _shared = None
@@ -5,13 +5,25 @@ Fix Tatoeba audio URLs to use correct format.
 The correct URL format is: https://tatoeba.org/en/audio/download/{audio_id}
 We need to map sentence_id -> audio_id from sentences_with_audio.csv
 ONLY for sentences that are Romanian (in ron_sentences.tsv.bz2).
+
+The audio map is built once and shared read-only with a process pool that
+rewrites the files in parallel.
+
+Usage:
+    python scripts/fix_audio_urls.py                       # the three level files
+    python scripts/fix_audio_urls.py --workers 8 shards/*.js
 """
 
+import argparse
 import os
 import re
 import csv
 import bz2
 
+import artifacts
+import file_pool
+import metrics
+
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
@@ -26,9 +38,9 @@ def load_romanian_sentence_ids():
         return set()
 
     ron_ids = set()
-    with bz2.open(ron_file, 'rt', encoding='utf-8') as f:
+    with open(ron_file, 'rb') as raw, bz2.open(raw, 'rt', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, 'Romanian sentences', position=metrics.file_position(raw, ron_file)):
             if len(row) >= 3:
                 ron_ids.add(row[0])
 
@@ -47,7 +59,7 @@ def load_sentence_to_audio_map(romanian_ids):
     sentence_to_audio = {}
     with open(audio_file, 'r', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, 'audio rows', position=metrics.file_position(f.buffer, audio_file)):
             if len(row) >= 2:
                 audio_id = row[0]
                 sentence_id = row[1]
@@ -108,43 +120,87 @@ def update_js_file(filepath, sentence_to_audio):
                 removed_count += 1
             return f"{{ id: '{sentence_id}', romanian: '{romanian}', english: '{english}', difficulty: {difficulty}, wordCount: {word_count}, hasAudio: false, audioUrl: null }}"
 
-    new_content = re.sub(pattern, fix_sentence, content)
+    def fixed_chunks():
+        last = 0
+        for match in re.finditer(pattern, content):
+            yield content[last:match.start()]
+            yield fix_sentence(match)
+            last = match.end()
+        yield content[last:]
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(new_content)
+    artifacts.write_chunks(filepath, fixed_chunks(), track=False)
 
     return updated_count, removed_count, kept_count
 
+def update_file(filepath, sentence_to_audio):
+    """file_pool worker: update one file if it exists. Returns its counts, or None."""
+    if not os.path.exists(filepath):
+        return None
+    return update_js_file(filepath, sentence_to_audio)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Fix Tatoeba audio URLs in the level files.")
+    parser.add_argument('--daemon', metavar='ADDRESS',
+                        help="read the audio map from a running tatoeba_daemon.py (http://host:port or unix:PATH)")
+    parser.add_argument('files', nargs='*', metavar='FILE',
+                        help="level or shard files to fix (default: beginner.js, intermediate.js, advanced.js)")
+    file_pool.add_arguments(parser)
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
 def main():
+    args = parse_args()
+    metrics.configure(args, 'fix_audio_urls')
+
     print("=" * 60)
     print("Fixing Tatoeba Audio URLs (Romanian Only)")
     print("=" * 60)
 
-    romanian_ids = load_romanian_sentence_ids()
-    if not romanian_ids:
-        return
-
-    sentence_to_audio = load_sentence_to_audio_map(romanian_ids)
+    if args.daemon:
+        from tatoeba_daemon import TatoebaClient
+
+        with metrics.stage('load audio map'):
+            client = TatoebaClient(args.daemon)
+            sentence_to_audio = client.audio_map()
+            client.close()
+        print(f"Found {len(sentence_to_audio)} Romanian sentences with audio (from {args.daemon})")
+    else:
+        with metrics.stage('load romanian ids'):
+            romanian_ids = load_romanian_sentence_ids()
+        if not romanian_ids:
+            return
+
+        with metrics.stage('load audio map'):
+            sentence_to_audio = load_sentence_to_audio_map(romanian_ids)
     if not sentence_to_audio:
         return
 
-    files = ['beginner.js', 'intermediate.js', 'advanced.js']
+    files = args.files or [os.path.join(DATA_DIR, name) for name in ('beginner.js', 'intermediate.js', 'advanced.js')]
 
     total_updated = 0
     total_removed = 0
     total_kept = 0
 
-    print("\nProcessing files...")
-    for filename in files:
-        filepath = os.path.join(DATA_DIR, filename)
-        if os.path.exists(filepath):
-            updated, removed, kept = update_js_file(filepath, sentence_to_audio)
-            print(f"  {filename}: {updated} updated, {removed} audio removed, {kept} kept")
-            total_updated += updated
-            total_removed += removed
-            total_kept += kept
-        else:
+    print(f"\nProcessing {len(files)} files ({min(args.workers, len(files))} workers)...")
+    with metrics.stage('update files') as stage:
+        results = file_pool.map_files(update_file, files, sentence_to_audio, args.workers)
+        stage.rows = sum(sum(counts) for counts in results if counts)
+    for filepath, counts in zip(files, results):
+        filename = filepath if args.files else os.path.basename(filepath)
+        if counts is None:
             print(f"  {filename}: not found")
+            continue
+        updated, removed, kept = counts
+        print(f"  {filename}: {updated} updated, {removed} audio removed, {kept} kept")
+        total_updated += updated
+        total_removed += removed
+        total_kept += kept
+
+    metrics.count('urls updated', total_updated)
+    metrics.count('audio removed', total_removed)
+    metrics.count('urls kept', total_kept)
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
 
     print("\n" + "=" * 60)
     print(f"Total: {total_updated} URLs updated, {total_removed} removed, {total_kept} kept")
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+JavaScript Data Emitter
+
+Shared writer for the generated data modules: the Tatoeba level files
+(process_tatoeba.py), the consolidated audio-only files
+(consolidate_audio_only.py) and the ro-stories addition file
+(process_rostories.py).
+
+    import js_emit
+
+    def render(s):
+        return f"  {{ id: {js_emit.js_string(s.id)}, romanian: {js_emit.js_string(s.romanian)} }}"
+
+    js_emit.write_module(path, header, js_emit.rows(sentences, render), '];\\n')
+
+Strings are escaped from one table per literal kind (quoted and template
+literals), replacing only the characters a string actually contains. Most
+texts contain none, so this beats both unconditional chained replaces and
+str.translate (whose multi-character mappings run per character in
+CPython, several times slower on this data).
+
+rows() renders BATCH_ROWS rows at a time and yields each batch as one
+joined string, and write_module() streams the parts through
+artifacts.write_chunks(), so rows can come from any iterator and the file
+is never built in memory whole. json_literal() renders a value as compact
+JSON, which is also a valid JavaScript literal.
+
+Everything written here reads back losslessly with the literal parser in
+merge_stories.py, which decodes with unescape() (tests/test_js_emit.py
+checks the round trip; benchmark.py --emit also times a 1M-row level).
+"""
+
+import json
+import re
+
+import artifacts
+
+# Rows rendered and joined per write
+BATCH_ROWS = 4096
+
+# '...' and "..." literals. Raw line terminators would end the literal.
+# Backslash comes first so later escapes aren't escaped again.
+STRING_ESCAPES = (
+    ('\\', '\\\\'),
+    ("'", "\\'"),
+    ('"', '\\"'),
+    ('\n', '\\n'),
+    ('\r', '\\r'),
+)
+
+# `...` literals. '$' is escaped whole ('\$' reads back as '$'), which also
+# covers '${'; a raw '\r' would be normalized to '\n' by the JS parser.
+TEMPLATE_ESCAPES = (
+    ('\\', '\\\\'),
+    ('`', '\\`'),
+    ('$', '\\$'),
+    ('\r', '\\r'),
+)
+
+# Single-character escapes as JavaScript reads them. Any other escaped
+# character stands for itself; an escaped line terminator continues the line.
+UNESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+    '\n': '', '\r': '', '\r\n': '', '\u2028': '', '\u2029': '',
+}
+UNESCAPE_RE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)', re.DOTALL)
+# \uD83D\uDE00-style pairs decode to lone surrogates first
+SURROGATE_RE = re.compile('[\ud800-\udfff]')
+
+
+def escape_with(s, table):
+    """Apply an escape table, skipping characters the string doesn't contain."""
+    for char, escaped in table:
+        if char in s:
+            s = s.replace(char, escaped)
+    return s
+
+
+def escape(s):
+    """Escape a string for a quoted JavaScript literal ('' for None)."""
+    if s is None:
+        return ''
+    return escape_with(s, STRING_ESCAPES)
+
+
+def escape_template(s):
+    """Escape a string for a JavaScript template literal ('' for None)."""
+    if s is None:
+        return ''
+    return escape_with(s, TEMPLATE_ESCAPES)
+
+
+def unescape(s):
+    """Decode the escapes in the body of a quoted or template literal."""
+    if '\\' not in s:
+        return s
+    s = UNESCAPE_RE.sub(_unescape_match, s)
+    if SURROGATE_RE.search(s):
+        s = s.encode('utf-16-le', 'surrogatepass').decode('utf-16-le', 'surrogatepass')
+    return s
+
+
+def _unescape_match(match):
+    code = match.group(1)
+    if code.startswith('u{'):
+        return chr(int(code[2:-1], 16))
+    if len(code) > 2 and code[0] in 'ux':
+        return chr(int(code[1:], 16))
+    return UNESCAPES.get(code, code)
+
+
+def js_string(s):
+    """A single-quoted JavaScript string literal, or null for None."""
+    if s is None:
+        return 'null'
+    return "'" + escape_with(s, STRING_ESCAPES) + "'"
+
+
+def js_bool(value):
+    return 'true' if value else 'false'
+
+
+def json_literal(value):
+    """A compact JSON literal (valid JavaScript) for any JSON-able value."""
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def rows(items, render, separator=',\n', end='\n', batch_rows=BATCH_ROWS):
+    """
+    Render items lazily, BATCH_ROWS at a time. Yields strings that together
+    are the rendered items joined by `separator`, followed by `end` when
+    there was at least one item.
+    """
+    batch = []
+    lead = ''
+    for item in items:
+        batch.append(render(item))
+        if len(batch) >= batch_rows:
+            yield lead + separator.join(batch)
+            lead = separator
+            batch = []
+    if batch:
+        yield lead + separator.join(batch)
+        lead = separator
+    if lead:
+        yield end
+
+
+def write_module(path, *parts):
+    """
+    Write a module made of `parts`, each a string or an iterable of strings
+    (such as rows()). Unchanged files are left alone, as with
+    artifacts.write_text(). Returns True if the file was written.
+    """
+    def chunks():
+        for part in parts:
+            if isinstance(part, str):
+                yield part
+            else:
+                yield from part
+
+    return artifacts.write_chunks(path, chunks())
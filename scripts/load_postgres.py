@@ -0,0 +1,401 @@
+#!/usr/bin/env python3
+"""
+Postgres Content Loader
+
+Publishes the generated corpus (Tatoeba sentences, stories and dictionary
+entries) into indexed content tables in the Supabase Postgres database, so
+the app can filter server-side instead of shipping everything as static JS.
+
+Each table is loaded with COPY into a staging table, indexed there, and
+swapped in with renames inside one transaction: readers keep querying the
+old table for the whole load and only wait for the instant of the swap.
+content_loads records a sha256 of each table's rows, so reloading the same
+data is a no-op.
+
+Tables (see the CONTENT TABLES section of supabase-schema.sql):
+- content_sentences: from the level files, or process_sentences() output
+- content_stories: from src/data/stories.js
+- content_dictionary: from the dictionary shards
+
+Requires: psycopg (pip install "psycopg[binary]")
+
+Usage:
+    python scripts/load_postgres.py --dsn postgresql://postgres@localhost:5432/postgres
+    DATABASE_URL=... python scripts/load_postgres.py --tables stories,dictionary
+    python scripts/process_tatoeba.py --postgres "$DATABASE_URL"
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import os
+
+try:
+    import psycopg
+    from psycopg import sql
+except ImportError:  # checked by connect(); encoding and --help work without it
+    psycopg = sql = None
+
+import metrics
+
+# Rows per COPY statement
+COPY_BATCH_ROWS = 50_000
+
+PSYCOPG_MISSING = 'psycopg is not installed (pip install "psycopg[binary]")'
+
+# The swap waits this long for readers to finish before retrying, so a long
+# query can't queue every new reader behind the swap's lock
+SWAP_LOCK_TIMEOUT = '2s'
+SWAP_ATTEMPTS = 5
+
+# name -> columns (name, type), primary key column, indexes (suffix, definition)
+CONTENT_TABLES = {
+    'content_sentences': {
+        'columns': [
+            ('id', 'TEXT NOT NULL'),
+            ('romanian', 'TEXT NOT NULL'),
+            ('english', 'TEXT NOT NULL'),
+            ('difficulty', 'SMALLINT NOT NULL'),
+            ('word_count', 'INTEGER NOT NULL'),
+            ('has_audio', 'BOOLEAN NOT NULL'),
+            ('audio_url', 'TEXT'),
+        ],
+        'key': 'id',
+        'indexes': [
+            ('difficulty_idx', "(difficulty, word_count)"),
+            ('audio_idx', "(difficulty) WHERE has_audio"),
+            ('romanian_search_idx', "USING gin (to_tsvector('simple', romanian))"),
+        ],
+    },
+    'content_stories': {
+        'columns': [
+            ('id', 'TEXT NOT NULL'),
+            ('title', 'TEXT NOT NULL'),
+            ('title_en', 'TEXT'),
+            ('author', 'TEXT'),
+            ('excerpt', 'TEXT NOT NULL'),
+            ('difficulty', 'SMALLINT NOT NULL'),
+            ('genre', 'TEXT'),
+            ('era', 'TEXT'),
+            ('word_count', 'INTEGER NOT NULL'),
+            ('source', 'TEXT'),
+            ('license', 'TEXT'),
+        ],
+        'key': 'id',
+        'indexes': [
+            ('difficulty_idx', "(difficulty)"),
+            ('author_idx', "(author)"),
+            ('genre_idx', "(genre, difficulty)"),
+        ],
+    },
+    'content_dictionary': {
+        'columns': [
+            ('id', 'INTEGER NOT NULL'),
+            ('word', 'TEXT NOT NULL'),
+            ('word_key', 'TEXT NOT NULL'),
+            ('pos', 'TEXT'),
+            ('entry', 'JSONB NOT NULL'),
+        ],
+        'key': 'id',
+        'indexes': [
+            ('word_key_idx', "(word_key)"),
+            ('word_idx', "(lower(word))"),
+        ],
+    },
+}
+
+TABLE_NAMES = {
+    'sentences': 'content_sentences',
+    'stories': 'content_stories',
+    'dictionary': 'content_dictionary',
+}
+
+CREATE_LOADS_TABLE = """
+CREATE TABLE IF NOT EXISTS content_loads (
+  table_name TEXT PRIMARY KEY,
+  content_hash TEXT NOT NULL,
+  row_count INTEGER NOT NULL,
+  loaded_at TIMESTAMPTZ DEFAULT NOW()
+)
+"""
+
+
+def sentence_row(s):
+    """A process_sentences() / level-file sentence as a content_sentences row."""
+    return (s.id, s.romanian, s.translation, s.difficulty, s.word_count,
+            bool(s.has_audio), s.audio_url)
+
+
+def story_row(story):
+    """A stories.js / process_stories() story as a content_stories row."""
+    return (story['id'], story['title'], story.get('titleEn'), story.get('author'), story['excerpt'],
+            story['difficulty'], story.get('genre'), story.get('era'), story['wordCount'],
+            story.get('source'), story.get('license'))
+
+
+def dictionary_rows(entries):
+    """Dictionary entries (in shard order) as content_dictionary rows."""
+    from dictionary_shards import fold_diacritics
+
+    for number, entry in enumerate(entries, start=1):
+        yield (number, entry['word'], fold_diacritics(entry['word']), entry.get('pos'), entry)
+
+
+def copy_value(value):
+    """One field in COPY text format."""
+    if value is None:
+        return '\\N'
+    if value is True:
+        return 't'
+    if value is False:
+        return 'f'
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    # Backslash, tab and newlines are special in COPY's text format
+    # (chained replace beats str.translate on non-ASCII text)
+    return str(value).replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+
+
+def unique_rows(rows):
+    """
+    Rows with unique keys (first column; the first row wins), sorted by key
+    so the content hash doesn't depend on input order.
+    """
+    unique = {}
+    for row in rows:
+        unique.setdefault(row[0], row)
+    return [unique[key] for key in sorted(unique)]
+
+
+def encode_rows(rows):
+    """COPY text lines for rows, one at a time."""
+    for row in rows:
+        yield '\t'.join(map(copy_value, row)) + '\n'
+
+
+def content_hash(lines):
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def ensure_loads_table(conn):
+    with conn.transaction():
+        conn.execute(CREATE_LOADS_TABLE)
+        # Bookkeeping only; no policies, so the API can't read it
+        conn.execute("ALTER TABLE content_loads ENABLE ROW LEVEL SECURITY")
+
+
+def loaded_hash(conn, table):
+    """The content hash of the live table, or None if it was never loaded."""
+    row = conn.execute(
+        "SELECT content_hash FROM content_loads WHERE table_name = %s AND to_regclass(%s) IS NOT NULL",
+        (table, table),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def create_staging(conn, table, staging):
+    """An unindexed copy of the table's columns (indexes are built after COPY)."""
+    spec = CONTENT_TABLES[table]
+    columns = sql.SQL(', ').join(
+        sql.SQL('{} {}').format(sql.Identifier(name), sql.SQL(column_type))
+        for name, column_type in spec['columns']
+    )
+    conn.execute(sql.SQL('DROP TABLE IF EXISTS {}').format(sql.Identifier(staging)))
+    conn.execute(sql.SQL('CREATE TABLE {} ({})').format(sql.Identifier(staging), columns))
+
+
+def copy_batches(conn, staging, columns, lines, batch_rows=COPY_BATCH_ROWS):
+    """
+    COPY encoded lines (any iterable) into the staging table, batch_rows per
+    statement. Lines stream into psycopg's copy buffer as they are encoded.
+    """
+    statement = sql.SQL('COPY {} ({}) FROM STDIN').format(
+        sql.Identifier(staging), sql.SQL(', ').join(map(sql.Identifier, columns))
+    )
+    lines = iter(lines)
+    with conn.cursor() as cur:
+        for first in lines:
+            count = 0
+            with cur.copy(statement) as copy:
+                for line in itertools.chain([first], itertools.islice(lines, batch_rows - 1)):
+                    copy.write(line.encode('utf-8'))
+                    count += 1
+            metrics.add_rows(count)
+
+
+def index_staging(conn, table, staging):
+    """Primary key, indexes, row security and statistics for the staging table."""
+    spec = CONTENT_TABLES[table]
+    conn.execute(sql.SQL('ALTER TABLE {} ADD CONSTRAINT {} PRIMARY KEY ({})').format(
+        sql.Identifier(staging), sql.Identifier(f"{staging}_pkey"), sql.Identifier(spec['key'])
+    ))
+    for suffix, definition in spec['indexes']:
+        conn.execute(sql.SQL('CREATE INDEX {} ON {} ' + definition).format(
+            sql.Identifier(f"{staging}_{suffix}"), sql.Identifier(staging)
+        ))
+    # Content is public, read-only through the API
+    conn.execute(sql.SQL('ALTER TABLE {} ENABLE ROW LEVEL SECURITY').format(sql.Identifier(staging)))
+    conn.execute(sql.SQL('CREATE POLICY "Content is public" ON {} FOR SELECT USING (true)').format(
+        sql.Identifier(staging)
+    ))
+    conn.execute(sql.SQL('ANALYZE {}').format(sql.Identifier(staging)))
+
+
+def swap_in(conn, table, staging, digest, row_count):
+    """Replace the live table with the staging table in one transaction."""
+    for attempt in range(1, SWAP_ATTEMPTS + 1):
+        try:
+            return _swap(conn, table, staging, digest, row_count)
+        except psycopg.errors.LockNotAvailable:
+            if attempt == SWAP_ATTEMPTS:
+                raise
+            print(f"    {table} is busy, retrying swap ({attempt}/{SWAP_ATTEMPTS})")
+
+
+def _swap(conn, table, staging, digest, row_count):
+    spec = CONTENT_TABLES[table]
+    with conn.transaction():
+        conn.execute(sql.SQL('SET LOCAL lock_timeout = {}').format(sql.Literal(SWAP_LOCK_TIMEOUT)))
+        conn.execute(sql.SQL('DROP TABLE IF EXISTS {}').format(sql.Identifier(table)))
+        conn.execute(sql.SQL('ALTER TABLE {} RENAME TO {}').format(sql.Identifier(staging), sql.Identifier(table)))
+        conn.execute(sql.SQL('ALTER TABLE {} RENAME CONSTRAINT {} TO {}').format(
+            sql.Identifier(table), sql.Identifier(f"{staging}_pkey"), sql.Identifier(f"{table}_pkey")
+        ))
+        for suffix, _ in spec['indexes']:
+            conn.execute(sql.SQL('ALTER INDEX {} RENAME TO {}').format(
+                sql.Identifier(f"{staging}_{suffix}"), sql.Identifier(f"{table}_{suffix}")
+            ))
+        conn.execute(
+            "INSERT INTO content_loads (table_name, content_hash, row_count, loaded_at) "
+            "VALUES (%s, %s, %s, NOW()) "
+            "ON CONFLICT (table_name) DO UPDATE SET content_hash = EXCLUDED.content_hash, "
+            "row_count = EXCLUDED.row_count, loaded_at = EXCLUDED.loaded_at",
+            (table, digest, row_count),
+        )
+
+
+def load_table(conn, table, rows, force=False):
+    """
+    Bulk-load rows into a content table unless its content hash is unchanged.
+    Returns {'rows': n, 'loaded': bool, 'hash': sha256}.
+    """
+    with metrics.stage(f'{table} encode') as stage:
+        rows = unique_rows(rows)
+        digest = content_hash(encode_rows(rows))
+        stage.rows = len(rows)
+
+    ensure_loads_table(conn)
+    if not force and loaded_hash(conn, table) == digest:
+        return {'rows': len(rows), 'loaded': False, 'hash': digest}
+
+    # Encoded again rather than kept: the lines stream straight into COPY
+    staging = f"{table}_staging"
+    columns = [name for name, _ in CONTENT_TABLES[table]['columns']]
+    with metrics.stage(f'{table} copy'), conn.transaction():
+        create_staging(conn, table, staging)
+        copy_batches(conn, staging, columns, encode_rows(rows))
+    with metrics.stage(f'{table} index'), conn.transaction():
+        index_staging(conn, table, staging)
+    with metrics.stage(f'{table} swap'):
+        swap_in(conn, table, staging, digest, len(rows))
+    return {'rows': len(rows), 'loaded': True, 'hash': digest}
+
+
+def load_sentences(conn, sentences, force=False):
+    """Load process_sentences() / level-file sentences into content_sentences."""
+    return load_table(conn, 'content_sentences', map(sentence_row, sentences), force)
+
+
+def load_stories(conn, stories, force=False):
+    """Load story records into content_stories."""
+    return load_table(conn, 'content_stories', map(story_row, stories), force)
+
+
+def load_dictionary(conn, entries, force=False):
+    """Load dictionary entries (in shard order) into content_dictionary."""
+    return load_table(conn, 'content_dictionary', dictionary_rows(entries), force)
+
+
+def connect(dsn):
+    """Autocommit connection; the loaders open their own transactions."""
+    if psycopg is None:
+        raise RuntimeError(PSYCOPG_MISSING)
+    return psycopg.connect(dsn, autocommit=True)
+
+
+def report(table, result):
+    status = 'loaded' if result['loaded'] else 'unchanged, skipped'
+    print(f"  {table}: {result['rows']} rows ({status}, {result['hash'][:12]})")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Bulk-load the generated corpus into Postgres content tables.")
+    parser.add_argument('--dsn', default=os.environ.get('DATABASE_URL'),
+                        help="Postgres connection string (default: $DATABASE_URL)")
+    parser.add_argument('--tables', default=','.join(TABLE_NAMES),
+                        help=f"comma-separated tables to load (default: {','.join(TABLE_NAMES)})")
+    parser.add_argument('--force', action='store_true', help="reload even if the content hash is unchanged")
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+
+    args.tables = [name.strip() for name in args.tables.split(',') if name.strip()]
+    unknown = [name for name in args.tables if name not in TABLE_NAMES]
+    if unknown:
+        parser.error(f"unknown tables: {', '.join(unknown)} (choose from {', '.join(TABLE_NAMES)})")
+    if not args.dsn:
+        parser.error("--dsn or DATABASE_URL is required")
+    if psycopg is None:
+        parser.error(PSYCOPG_MISSING)
+    return args
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'load_postgres')
+
+    print("=" * 60)
+    print("Postgres Content Loader")
+    print("=" * 60)
+
+    conn = connect(args.dsn)
+
+    if 'sentences' in args.tables:
+        from build_sentence_index import load_level_sentences
+
+        print("\nStep 1: Loading sentences from the level files...")
+        with metrics.stage('sentences') as stage:
+            result = load_sentences(conn, load_level_sentences(), args.force)
+            stage.rows = result['rows']
+        report('content_sentences', result)
+
+    if 'stories' in args.tables:
+        from merge_stories import load_stories as read_stories
+
+        print("\nStep 2: Loading stories from stories.js...")
+        with metrics.stage('stories') as stage:
+            result = load_stories(conn, read_stories().values(), args.force)
+            stage.rows = result['rows']
+        report('content_stories', result)
+
+    if 'dictionary' in args.tables:
+        from dictionary_shards import iter_entries
+
+        print("\nStep 3: Loading dictionary entries from the shards...")
+        with metrics.stage('dictionary') as stage:
+            result = load_dictionary(conn, (entry for _, _, entry in iter_entries()), args.force)
+            stage.rows = result['rows']
+        report('content_dictionary', result)
+
+    conn.close()
+
+    print("\n" + "=" * 60)
+    print("Done! Content tables are up to date.")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,494 @@
+#!/usr/bin/env python3
+"""
+Stories Merge and Chunk Builder
+
+Parses src/data/stories.js into an id-indexed structure, upserts new story
+excerpts idempotently, and emits lazy-loadable chunks for the app:
+
+- src/data/story-chunks/difficulty-N.js (or genre-X.js): full story records
+- src/data/story-chunks/index.js: metadata index (id, title, author,
+  difficulty, genre, wordCount) plus loaders for the chunks
+
+The story list renders from the index alone; excerpt text is only fetched
+when StoryReader opens a story.
+
+Usage:
+    python scripts/merge_stories.py                        # rebuild chunks
+    python scripts/merge_stories.py temp/ro_stories_addition.js
+    python scripts/merge_stories.py --chunk-by genre
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+
+import artifacts
+import js_emit
+import metrics
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+DATA_DIR = os.path.join(PROJECT_DIR, "src", "data")
+STORIES_PATH = os.path.join(DATA_DIR, "stories.js")
+CHUNKS_DIR = os.path.join(DATA_DIR, "story-chunks")
+
+STORIES_ARRAY_START = "export const ROMANIAN_STORIES = ["
+
+# Field order used when rendering a story object (matches stories.js)
+STORY_FIELDS = [
+    'id', 'title', 'titleEn', 'author', 'excerpt', 'difficulty',
+    'genre', 'era', 'wordCount', 'source', 'license',
+]
+
+# Fields kept in the always-loaded metadata index
+INDEX_FIELDS = ['id', 'title', 'author', 'difficulty', 'genre', 'wordCount']
+
+IDENTIFIER_RE = re.compile(r"[A-Za-z_$][\w$]*")
+NUMBER_RE = re.compile(r"-?\d+(?:\.\d+)?")
+
+# A literal's body per quote; escapes are decoded by js_emit.unescape()
+STRING_BODY_RES = {
+    quote: re.compile(rf"{quote}([^{quote}\\]*(?:\\.[^{quote}\\]*)*){quote}", re.DOTALL)
+    for quote in "'\"`"
+}
+# An unescaped '${' in a template literal body
+INTERPOLATION_RE = re.compile(r'(?<!\\)(?:\\\\)*\$\{')
+
+
+class JSParseError(ValueError):
+    """Raised when stories.js contains something the literal parser can't read."""
+
+
+class _LiteralParser:
+    """
+    Minimal parser for the JS data literals we generate: arrays and objects
+    of strings ('...', "...", `...` without interpolation), numbers, booleans
+    and null, with // and /* */ comments and trailing commas.
+    """
+
+    def __init__(self, text, pos=0):
+        self.text = text
+        self.pos = pos
+
+    def error(self, message):
+        line = self.text.count('\n', 0, self.pos) + 1
+        raise JSParseError(f"{message} at line {line}")
+
+    def skip(self):
+        """Skip whitespace and comments."""
+        text = self.text
+        while self.pos < len(text):
+            c = text[self.pos]
+            if c.isspace():
+                self.pos += 1
+            elif text.startswith('//', self.pos):
+                end = text.find('\n', self.pos)
+                self.pos = len(text) if end < 0 else end + 1
+            elif text.startswith('/*', self.pos):
+                end = text.find('*/', self.pos)
+                if end < 0:
+                    self.error("Unterminated comment")
+                self.pos = end + 2
+            else:
+                break
+
+    def peek(self):
+        self.skip()
+        return self.text[self.pos] if self.pos < len(self.text) else ''
+
+    def expect(self, char):
+        if self.peek() != char:
+            self.error(f"Expected {char!r}")
+        self.pos += 1
+
+    def value(self):
+        c = self.peek()
+        if c == '{':
+            return self.object()
+        if c == '[':
+            return self.array()
+        if c in "'\"`":
+            return self.string()
+        match = NUMBER_RE.match(self.text, self.pos)
+        if match:
+            self.pos = match.end()
+            literal = match.group()
+            return float(literal) if '.' in literal else int(literal)
+        match = IDENTIFIER_RE.match(self.text, self.pos)
+        if match and match.group() in ('true', 'false', 'null'):
+            self.pos = match.end()
+            return {'true': True, 'false': False, 'null': None}[match.group()]
+        self.error("Unexpected token")
+
+    def string(self):
+        quote = self.text[self.pos]
+        match = STRING_BODY_RES[quote].match(self.text, self.pos)
+        if not match:
+            self.error("Unterminated string")
+        body = match.group(1)
+        if quote == '`' and INTERPOLATION_RE.search(body):
+            self.error("Template interpolation is not supported")
+        self.pos = match.end()
+        return js_emit.unescape(body)
+
+    def key(self):
+        c = self.peek()
+        if c in "'\"":
+            return self.string()
+        match = IDENTIFIER_RE.match(self.text, self.pos)
+        if not match:
+            self.error("Expected property name")
+        self.pos = match.end()
+        return match.group()
+
+    def object(self):
+        self.expect('{')
+        result = {}
+        while self.peek() != '}':
+            key = self.key()
+            self.expect(':')
+            result[key] = self.value()
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != '}':
+                self.error("Expected ',' or '}'")
+        self.pos += 1
+        return result
+
+    def array(self):
+        self.expect('[')
+        result = []
+        while self.peek() != ']':
+            result.append(self.value())
+            if self.peek() == ',':
+                self.pos += 1
+            elif self.peek() != ']':
+                self.error("Expected ',' or ']'")
+        self.pos += 1
+        return result
+
+
+def parse_story_entries(text, start=0):
+    """
+    Parse a sequence of story objects starting at `start`.
+
+    Works on the body of the ROMANIAN_STORIES array and on standalone
+    addition files (a bare list of objects). Stops at a closing ']' or end
+    of input.
+
+    Returns (entries, end) where entries is a list of (story, span_start,
+    span_end) and end is the offset of the closing bracket (or len(text)).
+    """
+    parser = _LiteralParser(text, start)
+    entries = []
+    while True:
+        c = parser.peek()
+        if c == '' or c == ']':
+            return entries, parser.pos
+        if c == ',':
+            parser.pos += 1
+            continue
+        span_start = parser.pos
+        story = parser.object()
+        # Include the trailing comma in the span so replacements stay tidy
+        span_end = parser.pos
+        if parser.peek() == ',':
+            parser.pos += 1
+            span_end = parser.pos
+        entries.append((story, span_start, span_end))
+
+
+def load_stories_file(path=STORIES_PATH):
+    """
+    Read stories.js.
+
+    Returns (content, entries, array_end): the raw file content, the parsed
+    entries with their spans, and the offset of the array's closing ']'.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    start = content.find(STORIES_ARRAY_START)
+    if start < 0:
+        raise JSParseError(f"{STORIES_ARRAY_START!r} not found in {path}")
+
+    entries, array_end = parse_story_entries(content, start + len(STORIES_ARRAY_START))
+    return content, entries, array_end
+
+
+def load_stories(path=STORIES_PATH):
+    """Return an id-indexed dict of all stories in stories.js (file order)."""
+    _, entries, _ = load_stories_file(path)
+    return {story['id']: story for story, _, _ in entries}
+
+
+def load_addition_file(path):
+    """Read stories from an addition file as written by process_rostories."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    entries, _ = parse_story_entries(content)
+    return [story for story, _, _ in entries]
+
+
+def render_story(story):
+    """Render a story object in the stories.js layout."""
+    lines = ['  {']
+    keys = STORY_FIELDS + [k for k in story if k not in STORY_FIELDS]
+    for key in keys:
+        if key not in story:
+            continue
+        value = story[key]
+        if key == 'excerpt':
+            literal = f"`{js_emit.escape_template(value)}`"
+        elif isinstance(value, bool) or value is None:
+            literal = json.dumps(value)
+        elif isinstance(value, (int, float)):
+            literal = str(value)
+        else:
+            literal = js_emit.js_string(value)
+        lines.append(f"    {key}: {literal},")
+    lines.append('  },')
+    return '\n'.join(lines)
+
+
+def merge_story(current, story):
+    """
+    Merge a freshly generated story over its existing record, field by field.
+
+    The generator leaves fields it can't fill empty (titleEn is always ''),
+    so an empty or null incoming value keeps the existing one; fields the
+    generator doesn't emit at all are kept as they are.
+    """
+    merged = dict(current)
+    for key, value in story.items():
+        if value in ('', None) and current.get(key) not in ('', None):
+            continue
+        merged[key] = value
+    return merged
+
+
+def upsert_stories(content, entries, array_end, new_stories):
+    """
+    Upsert stories into the stories.js content.
+
+    Existing ids are merged field by field (see merge_story) and rewritten in
+    place only when a field changed; unknown ids are appended before the
+    closing bracket. Running the same upsert twice leaves the file unchanged.
+
+    Returns (new_content, stats).
+    """
+    existing = {story['id']: (story, start, end) for story, start, end in entries}
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+    replacements = []
+    appended = []
+    seen = set()
+    for story in new_stories:
+        if story['id'] in seen:
+            continue
+        seen.add(story['id'])
+
+        if story['id'] in existing:
+            current, start, end = existing[story['id']]
+            merged = merge_story(current, story)
+            if merged == current:
+                stats['unchanged'] += 1
+                continue
+            replacements.append((start, end, render_story(merged).lstrip()))
+            stats['updated'] += 1
+        else:
+            appended.append(render_story(story))
+            stats['inserted'] += 1
+
+    if appended:
+        # Insert after the last entry, keeping whatever precedes the bracket
+        if entries:
+            insert_at, text = entries[-1][2], '\n' + '\n'.join(appended)
+        else:
+            insert_at, text = array_end, '\n'.join(appended) + '\n'
+        replacements.append((insert_at, insert_at, text))
+
+    for start, end, text in sorted(replacements, reverse=True):
+        content = content[:start] + text + content[end:]
+
+    return content, stats
+
+
+def chunk_key(story, chunk_by):
+    """Chunk name for a story."""
+    if chunk_by == 'genre':
+        return f"genre-{re.sub(r'[^a-z0-9]+', '-', story.get('genre', 'other').lower())}"
+    return f"difficulty-{story['difficulty']}"
+
+
+@artifacts.batch()
+def write_chunks(stories, chunk_by='difficulty', chunks_dir=CHUNKS_DIR):
+    """
+    Write story chunk modules and the metadata index.
+
+    Each chunk is `export default { id: story, ... }`; the index maps every
+    story to its chunk and carries only the fields needed to list stories.
+    """
+    os.makedirs(chunks_dir, exist_ok=True)
+
+    chunks = {}
+    for story in stories.values():
+        chunks.setdefault(chunk_key(story, chunk_by), {})[story['id']] = story
+
+    # Remove chunks left over from a previous layout
+    for name in os.listdir(chunks_dir):
+        if name.endswith('.js') and name != 'index.js' and name[:-3] not in chunks:
+            os.remove(os.path.join(chunks_dir, name))
+
+    for name, members in chunks.items():
+        content = f"export default {json.dumps(members, ensure_ascii=False)};\n"
+        artifacts.write_text(os.path.join(chunks_dir, f"{name}.js"), content)
+
+    index = []
+    for story in stories.values():
+        entry = {field: story.get(field) for field in INDEX_FIELDS}
+        entry['chunk'] = chunk_key(story, chunk_by)
+        index.append(entry)
+
+    index_literal = '[\n' + '\n'.join(
+        f"  {json.dumps(entry, ensure_ascii=False)}," for entry in index
+    ) + '\n]'
+
+    loaders = '\n'.join(
+        f"  '{name}': () => import('./{name}.js'),"
+        for name in sorted(chunks)
+    )
+
+    content = f'''/**
+ * Romanian Stories Index
+ * Generated by scripts/merge_stories.py from src/data/stories.js
+ * Stories: {len(index)}, chunked by {chunk_by}
+ *
+ * Lists stories without loading their text. Use loadStory(id) to fetch
+ * the full record (excerpt, titleEn, era, source, license) on demand.
+ */
+
+export const STORY_INDEX = {index_literal};
+
+const CHUNK_LOADERS = {{
+{loaders}
+}};
+
+const loadedChunks = {{}};
+
+/**
+ * Load a full story record by id
+ */
+export async function loadStory(id) {{
+  const meta = STORY_INDEX.find(s => s.id === id);
+  if (!meta) return null;
+
+  if (!loadedChunks[meta.chunk]) {{
+    loadedChunks[meta.chunk] = CHUNK_LOADERS[meta.chunk]()
+      .then(module => module.default)
+      .catch(err => {{
+        delete loadedChunks[meta.chunk];
+        throw err;
+      }});
+  }}
+
+  const chunk = await loadedChunks[meta.chunk];
+  return chunk[id] || null;
+}}
+
+/**
+ * Get story metadata filtered by difficulty
+ */
+export const getStoriesByDifficulty = (minDiff, maxDiff = minDiff) => {{
+  return STORY_INDEX.filter(s => s.difficulty >= minDiff && s.difficulty <= maxDiff);
+}};
+
+/**
+ * Get story metadata by genre
+ */
+export const getStoriesByGenre = (genre) => {{
+  return STORY_INDEX.filter(s => s.genre === genre);
+}};
+
+/**
+ * Get random story metadata
+ */
+export const getRandomStory = (filter = null) => {{
+  const items = filter ? STORY_INDEX.filter(filter) : STORY_INDEX;
+  return items[Math.floor(Math.random() * items.length)];
+}};
+
+export default STORY_INDEX;
+'''
+    artifacts.write_text(os.path.join(chunks_dir, 'index.js'), content)
+
+    return {name: len(members) for name, members in sorted(chunks.items())}
+
+
+def merge_stories(new_stories=(), chunk_by='difficulty', stories_path=STORIES_PATH):
+    """
+    Upsert new stories into stories.js and rebuild the chunks.
+
+    Returns the upsert stats and the chunk sizes.
+    """
+    content, entries, array_end = load_stories_file(stories_path)
+    stats = {'inserted': 0, 'updated': 0, 'unchanged': 0}
+
+    if new_stories:
+        updated, stats = upsert_stories(content, entries, array_end, list(new_stories))
+        if updated != content:
+            artifacts.write_text(stories_path, updated)
+
+    chunk_sizes = write_chunks(load_stories(stories_path), chunk_by)
+    return stats, chunk_sizes
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Merge story excerpts into stories.js and rebuild chunks.")
+    parser.add_argument('additions', nargs='*', help="addition files to upsert (e.g. temp/ro_stories_addition.js)")
+    parser.add_argument('--chunk-by', choices=['difficulty', 'genre'], default='difficulty')
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'merge_stories')
+
+    print("=" * 60)
+    print("Stories Merge and Chunk Builder")
+    print("=" * 60)
+
+    new_stories = []
+    for path in args.additions:
+        if not os.path.isabs(path) and not os.path.exists(path):
+            path = os.path.join(SCRIPT_DIR, path)
+        if not os.path.exists(path):
+            print(f"\nError: {path} not found")
+            sys.exit(1)
+        with metrics.stage(f'load {os.path.basename(path)}') as stage:
+            additions = load_addition_file(path)
+            stage.rows = len(additions)
+        print(f"  Loaded {len(additions)} stories from {os.path.basename(path)}")
+        new_stories.extend(additions)
+
+    with metrics.stage('merge stories') as stage:
+        stats, chunk_sizes = merge_stories(new_stories, args.chunk_by)
+        stage.rows = sum(chunk_sizes.values())
+
+    print(f"\n  Inserted: {stats['inserted']}, updated: {stats['updated']}, unchanged: {stats['unchanged']}")
+    print(f"\n  Chunks ({args.chunk_by}):")
+    for name, count in chunk_sizes.items():
+        print(f"    {name}.js: {count} stories")
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print("Done! stories.js and story chunks are up to date.")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
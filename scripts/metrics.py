@@ -0,0 +1,320 @@
+#!/usr/bin/env python3
+"""
+Script Instrumentation
+
+Shared timing, counting and progress reporting for the data scripts.
+
+    import metrics
+
+    def main():
+        args = parse_args()            # parser built with metrics.add_arguments()
+        metrics.configure(args, 'process_tatoeba')
+
+        with metrics.stage('load pairs') as stage:
+            pairs = load_pairs()
+            stage.rows = len(pairs)
+
+        for row in metrics.progress(reader, 'links'):
+            ...
+
+Stages nest ("load pairs/parse links") and record wall time, rows and,
+with --trace-memory, the tracemalloc peak. Long downloads and parses print
+throughput and an ETA every few seconds. --profile writes a cProfile dump
+and --metrics writes a JSON report when the script exits, so runs can be
+diffed or fed to dashboards.
+
+Each thread keeps its own stage stack. Wrap work handed to a thread pool
+with bind() so its stages nest under the stage that submitted it:
+
+    with metrics.stage('load pairs'):
+        futures = [pool.submit(metrics.bind(parse), path) for path in paths]
+
+Stages running at the same time share tracemalloc's single peak, so their
+--trace-memory peaks are approximate.
+"""
+
+import atexit
+import cProfile
+import json
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Seconds between progress lines
+PROGRESS_INTERVAL = 5.0
+# Rows between clock checks in progress(); keeps the per-row cost tiny
+PROGRESS_CHECK_EVERY = 4096
+
+_state = {
+    'script': None,
+    'metrics_path': None,
+    'trace_memory': False,
+    'profiler': None,
+    'profile_path': None,
+    'started': None,
+    'started_at': None,
+    'stack': [],
+    'stages': [],
+    'counters': {},
+    'traced_peak': 0,
+    'registered': False,
+}
+# Stage stacks of threads other than the main one
+_local = threading.local()
+_counters_lock = threading.Lock()
+
+
+class Stage:
+    """A timed stage; set `rows` (or call add()) to report throughput."""
+
+    def __init__(self, name):
+        self.name = name
+        self.rows = 0
+        self.seconds = 0.0
+        self.peak_bytes = None
+        self.child_peak = 0
+
+    def add(self, n=1):
+        self.rows += n
+
+    def as_dict(self):
+        result = {'name': self.name, 'seconds': round(self.seconds, 4), 'rows': self.rows}
+        if self.rows and self.seconds > 0:
+            result['rows_per_second'] = round(self.rows / self.seconds)
+        if self.peak_bytes is not None:
+            result['peak_mb'] = round(self.peak_bytes / 2**20, 2)
+        return result
+
+
+def add_arguments(parser):
+    """Add --metrics, --trace-memory and --profile to an argparse parser."""
+    group = parser.add_argument_group('instrumentation')
+    group.add_argument('--metrics', metavar='PATH', help="write a JSON metrics report on exit")
+    group.add_argument('--trace-memory', action='store_true', help="record tracemalloc peaks per stage (slower)")
+    group.add_argument('--profile', metavar='PATH', help="write a cProfile dump on exit")
+    return parser
+
+
+def configure(args=None, script=None):
+    """
+    Start collecting for this run. `args` is the parsed namespace from a
+    parser passed through add_arguments(); None keeps everything off except
+    timing.
+    """
+    _state['script'] = script or os.path.splitext(os.path.basename(sys.argv[0]))[0]
+    _state['metrics_path'] = getattr(args, 'metrics', None)
+    _state['trace_memory'] = bool(getattr(args, 'trace_memory', False))
+    _state['profile_path'] = getattr(args, 'profile', None)
+    _state['started'] = time.perf_counter()
+    _state['started_at'] = datetime.now(timezone.utc).isoformat(timespec='seconds')
+    _state['stack'] = []
+    _state['stages'] = []
+    _state['counters'] = {}
+    _state['traced_peak'] = 0
+
+    if _state['trace_memory'] and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    if _state['profile_path']:
+        _state['profiler'] = cProfile.Profile()
+        _state['profiler'].enable()
+
+    # configure() may run more than once per process (benchmark.py, tests)
+    if not _state['registered']:
+        atexit.register(finish)
+        _state['registered'] = True
+
+
+def _stack():
+    """The calling thread's stack of open stages."""
+    stack = getattr(_local, 'stack', None)
+    if stack is not None:
+        return stack
+    if threading.current_thread() is threading.main_thread():
+        return _state['stack']
+    _local.stack = []
+    return _local.stack
+
+
+def bind(function):
+    """
+    Wrap `function` to run under the caller's open stages, for handing to
+    another thread. Stages it opens are named "caller's stage/its stage".
+    """
+    parents = list(_stack())
+
+    def run(*args, **kwargs):
+        previous = getattr(_local, 'stack', None)
+        _local.stack = list(parents)
+        try:
+            return function(*args, **kwargs)
+        finally:
+            _local.stack = previous
+
+    return run
+
+
+@contextmanager
+def stage(name):
+    """Time a block as a named stage (nested stages get "parent/child" names)."""
+    stack = _stack()
+    full_name = '/'.join([s.name for s in stack] + [name])
+    current = Stage(name)
+    tracing = _state['trace_memory'] and tracemalloc.is_tracing()
+
+    if tracing:
+        if stack:
+            stack[-1].child_peak = max(stack[-1].child_peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.reset_peak()
+
+    stack.append(current)
+    start = time.perf_counter()
+    try:
+        yield current
+    finally:
+        current.seconds = time.perf_counter() - start
+        stack.pop()
+        if tracing:
+            current.peak_bytes = max(current.child_peak, tracemalloc.get_traced_memory()[1])
+            if stack:
+                stack[-1].child_peak = max(stack[-1].child_peak, current.peak_bytes)
+            # reset_peak() hides earlier peaks from get_traced_memory()
+            _state['traced_peak'] = max(_state['traced_peak'], current.peak_bytes)
+        record = current.as_dict()
+        record['name'] = full_name
+        _state['stages'].append(record)
+
+
+def count(name, n=1):
+    """Add to a named run-wide counter."""
+    with _counters_lock:
+        _state['counters'][name] = _state['counters'].get(name, 0) + n
+
+
+def _format_count(n):
+    if n >= 1_000_000:
+        return f"{n / 1_000_000:.1f}M"
+    if n >= 10_000:
+        return f"{n / 1000:.0f}k"
+    return str(n)
+
+
+def _format_eta(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+def _report(label, done, total, elapsed, unit):
+    rate = done / elapsed if elapsed > 0 else 0
+    line = f"    {label}: {_format_count(done)} {unit} ({_format_count(int(rate))} {unit}/s"
+    if total and rate > 0 and done < total:
+        line += f", {done / total:.0%}, ETA {_format_eta((total - done) / rate)}"
+    print(line + ")", flush=True)
+
+
+def progress(iterable, label, total=None, unit='rows', position=None):
+    """
+    Yield from `iterable`, printing throughput (and an ETA when the total is
+    known) every PROGRESS_INTERVAL seconds. The current stage's row count is
+    increased by the number of items.
+
+    For compressed input where the row count is unknown, pass `position`, a
+    callable returning (bytes_read, total_bytes), to base the ETA on bytes.
+    """
+    start = time.perf_counter()
+    last = start
+    done = 0
+    for item in iterable:
+        yield item
+        done += 1
+        if done % PROGRESS_CHECK_EVERY == 0:
+            now = time.perf_counter()
+            if now - last >= PROGRESS_INTERVAL:
+                last = now
+                if position:
+                    read, size = position()
+                    _report(label, done, done * size / read if read else None, now - start, unit)
+                else:
+                    _report(label, done, total, now - start, unit)
+
+    add_rows(done)
+
+
+def add_rows(n):
+    """Add to the current stage's row count (for loops that don't use progress())."""
+    stack = _stack()
+    if stack:
+        stack[-1].add(n)
+
+
+def file_position(fileobj, path):
+    """position() helper for progress(): bytes read from a raw file object."""
+    size = os.path.getsize(path)
+    return lambda: (fileobj.tell(), size)
+
+
+def download_hook(label):
+    """A urlretrieve reporthook that prints throughput and ETA."""
+    start = time.perf_counter()
+    last = [start]
+
+    def hook(block_num, block_size, total_size):
+        now = time.perf_counter()
+        done = block_num * block_size
+        finished = total_size > 0 and done >= total_size
+        if now - last[0] >= PROGRESS_INTERVAL or finished:
+            last[0] = now
+            _report(label, done // 1024, total_size // 1024 if total_size > 0 else None, now - start, 'KB')
+        stack = _stack()
+        if stack:
+            stack[-1].rows = done
+
+    return hook
+
+
+def report():
+    """The run report as a dict."""
+    result = {
+        'script': _state['script'],
+        'argv': sys.argv[1:],
+        'started_at': _state['started_at'],
+        'python': platform.python_version(),
+        'wall_seconds': round(time.perf_counter() - _state['started'], 4) if _state['started'] else None,
+        'stages': list(_state['stages']),
+        'counters': dict(_state['counters']),
+    }
+    if resource is not None:
+        # ru_maxrss is KB on Linux, bytes on macOS
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        result['max_rss_mb'] = round(max_rss / (2**20 if sys.platform == 'darwin' else 2**10), 1)
+    if _state['trace_memory'] and tracemalloc.is_tracing():
+        peak = max(_state['traced_peak'], tracemalloc.get_traced_memory()[1])
+        result['traced_peak_mb'] = round(peak / 2**20, 2)
+    return result
+
+
+def finish():
+    """Stop the profiler and write the requested outputs (runs at exit)."""
+    profiler = _state['profiler']
+    if profiler is not None:
+        profiler.disable()
+        profiler.dump_stats(_state['profile_path'])
+        print(f"  Profile written to {_state['profile_path']}")
+        _state['profiler'] = None
+
+    path = _state['metrics_path']
+    if path:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report(), f, indent=2)
+            f.write('\n')
+        print(f"  Metrics written to {path}")
+        _state['metrics_path'] = None
@@ -5,16 +5,36 @@ RO-Stories Romanian Literature Processor
 Downloads and processes Romanian literature excerpts from HuggingFace.
 Generates story entries to add to the existing stories.js file.
 
+Rows are fetched through the datasets-server /filter endpoint, so the
+word-count and non-empty filters run on the server and rows we would drop
+are never downloaded. If /filter is unavailable (or --local-filter is
+given), every row is paged through /rows and filtered here instead.
+
+--sample FRACTION keeps a stable, seeded sample of the titles (every
+excerpt of a kept title, so story ids match the full build's) and writes
+the addition file to scripts/temp/sample/process_rostories/.
+
+Usage:
+    python scripts/process_rostories.py
+    python scripts/process_rostories.py --merge
+    python scripts/process_rostories.py --sample 0.2 --seed 1
+
 Source: huggingface.co/datasets/readerbench/ro-stories
 License: Apache 2.0
 """
 
+import argparse
 import json
 import os
 import re
 import sys
+import urllib.parse
 import urllib.request
-from datetime import datetime
+
+import artifacts
+import js_emit
+import metrics
+import sampling
 
 # Constants
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -24,6 +44,24 @@ TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
 
 # HuggingFace API endpoint for the dataset
 HF_API_URL = "https://datasets-server.huggingface.co/rows?dataset=readerbench%2Fro-stories&config=default&split=train&offset={offset}&length={length}"
+# Same rows with a SQL-like `where` clause applied by the server (None disables)
+HF_FILTER_URL = "https://datasets-server.huggingface.co/filter?dataset=readerbench%2Fro-stories&config=default&split=train&where={where}&offset={offset}&length={length}"
+# Dataset metadata (lastModified dates the generated file)
+HF_INFO_URL = "https://huggingface.co/api/datasets/readerbench/ro-stories"
+
+# Only the first HF_ROW_LIMIT dataset rows are used, fetched HF_BATCH_SIZE at a time
+HF_ROW_LIMIT = 1500
+HF_BATCH_SIZE = 100
+# Excerpt length bounds in words
+MIN_WORDS = 80
+MAX_WORDS = 600
+# Columns process_stories() reads; the rest are dropped as pages arrive
+HF_COLUMNS = ('title', 'author', 'paragraph', 'word_count')
+# The length and non-empty checks of process_stories(), for /filter
+HF_FILTER_WHERE = (
+    f'"word_count">={MIN_WORDS} AND "word_count"<={MAX_WORDS} '
+    """AND "title"<>'' AND "paragraph"<>''"""
+)
 
 # Author difficulty baselines (keys are lowercase for matching)
 AUTHOR_CONFIG = {
@@ -48,16 +86,82 @@ def ensure_dirs():
     """Create necessary directories."""
     os.makedirs(TEMP_DIR, exist_ok=True)
 
+def fetch_json(url):
+    """GET a JSON document, counting the bytes transferred."""
+    with urllib.request.urlopen(url, timeout=30) as response:
+        body = response.read()
+    metrics.count('bytes fetched', len(body))
+    return json.loads(body.decode('utf-8'))
+
 def fetch_hf_data(offset=0, length=100):
     """Fetch data from HuggingFace datasets API."""
     url = HF_API_URL.format(offset=offset, length=length)
     try:
-        with urllib.request.urlopen(url, timeout=30) as response:
-            return json.loads(response.read().decode('utf-8'))
+        return fetch_json(url)
     except Exception as e:
         print(f"  Error fetching data: {e}")
         return None
 
+def project(row_data):
+    """Keep only the columns process_stories() reads."""
+    return {column: row_data[column] for column in HF_COLUMNS if column in row_data}
+
+def fetch_all_rows():
+    """Page through /rows up to HF_ROW_LIMIT; filtering is left to the caller."""
+    rows = []
+    offset = 0
+    while True:
+        print(f"  Fetching rows {offset} to {offset + HF_BATCH_SIZE}...")
+        data = fetch_hf_data(offset=offset, length=HF_BATCH_SIZE)
+
+        if not data or 'rows' not in data or not data['rows']:
+            break
+
+        rows.extend(project(row.get('row', {})) for row in data['rows'])
+        metrics.count('rows fetched', len(data['rows']))
+        offset += HF_BATCH_SIZE
+
+        if offset >= HF_ROW_LIMIT:
+            break
+    return rows
+
+def fetch_filtered_rows():
+    """
+    The rows among the first HF_ROW_LIMIT that pass HF_FILTER_WHERE, via
+    /filter. Results come in dataset order, so paging stops at the first
+    row_idx past the limit. Raises if the server can't filter, including
+    when the first page is empty (the dataset has rows that pass).
+    """
+    where = urllib.parse.quote(HF_FILTER_WHERE)
+    rows = []
+    offset = 0
+    while True:
+        print(f"  Fetching filtered rows {offset} to {offset + HF_BATCH_SIZE}...")
+        data = fetch_json(HF_FILTER_URL.format(where=where, offset=offset, length=HF_BATCH_SIZE))
+        if 'rows' not in data:
+            raise ValueError(data.get('error', 'no rows in response'))
+        if offset == 0 and not data['rows']:
+            raise ValueError('filter returned no rows')
+
+        metrics.count('rows fetched', len(data['rows']))
+        for row in data['rows']:
+            if row['row_idx'] >= HF_ROW_LIMIT:
+                return rows
+            rows.append(project(row['row']))
+
+        if len(data['rows']) < HF_BATCH_SIZE:
+            return rows
+        offset += HF_BATCH_SIZE
+
+def fetch_rows(server_filter=True):
+    """Source rows, filtered on the server when it supports /filter."""
+    if server_filter and HF_FILTER_URL:
+        try:
+            return fetch_filtered_rows()
+        except Exception as e:
+            print(f"  Server-side filtering unavailable ({e}); fetching all rows")
+    return fetch_all_rows()
+
 def calculate_difficulty(text, author_base):
     """
     Calculate difficulty based on text complexity and author baseline.
@@ -112,15 +216,6 @@ def slugify(text):
     text = text.strip('-')
     return text[:50]  # Limit length
 
-def escape_js_string(s):
-    """Escape a string for use in JavaScript template literals."""
-    if s is None:
-        return ''
-    s = s.replace('\\', '\\\\')
-    s = s.replace('`', '\\`')
-    s = s.replace('${', '\\${')
-    return s
-
 def get_author_config(author):
     """Get configuration for an author."""
     author_lower = author.lower().strip()
@@ -137,28 +232,24 @@ def get_author_config(author):
 
     return DEFAULT_CONFIG, author
 
-def process_stories():
-    """Process stories from HuggingFace dataset."""
-    print("Step 1: Fetching RO-stories from HuggingFace...")
-
-    all_rows = []
-    offset = 0
-    batch_size = 100
-
-    # Fetch data in batches
-    while True:
-        print(f"  Fetching rows {offset} to {offset + batch_size}...")
-        data = fetch_hf_data(offset=offset, length=batch_size)
-
-        if not data or 'rows' not in data or not data['rows']:
-            break
+def title_key(row_data):
+    """The normalized title, as process_stories() counts excerpts by it."""
+    return row_data.get('title', '').lower().strip()
 
-        all_rows.extend(data['rows'])
-        offset += batch_size
+def process_stories(server_filter=True, keep=None):
+    """
+    Process stories from HuggingFace dataset. With `keep`, only rows whose
+    title_key() it accepts are processed.
+    """
+    print("Step 1: Fetching RO-stories from HuggingFace...")
 
-        # Limit to 1500 rows for more content
-        if offset >= 1500:
-            break
+    with metrics.stage('fetch rows') as stage:
+        all_rows = fetch_rows(server_filter)
+        if keep is not None:
+            fetched = len(all_rows)
+            all_rows = [row for row in all_rows if keep(title_key(row))]
+            print(f"  Sampled {len(all_rows)} of {fetched} rows")
+        stage.rows = len(all_rows)
 
     print(f"  Retrieved {len(all_rows)} total rows")
 
@@ -172,9 +263,8 @@ def process_stories():
     seen_content = set()  # Track by content hash to avoid exact duplicates
     title_counts = {}  # Count excerpts per title
 
-    for row in all_rows:
-        row_data = row.get('row', {})
-
+    # The server-side filter is a prefilter; these checks still decide
+    for row_data in all_rows:
         # Get text and title - field is 'paragraph' in this dataset
         text = row_data.get('paragraph', '').strip()
         title = row_data.get('title', '').strip()
@@ -184,7 +274,7 @@ def process_stories():
 
         # Get word count from data or calculate
         word_count = row_data.get('word_count', len(text.split()))
-        if word_count < 80 or word_count > 600:
+        if word_count < MIN_WORDS or word_count > MAX_WORDS:
             continue
 
         # Skip exact duplicate content
@@ -230,59 +320,158 @@ def process_stories():
     print(f"  Processed {len(stories)} unique story excerpts")
     return stories
 
-def generate_stories_addition(stories):
-    """Generate JavaScript code to add to stories.js."""
-    date_str = datetime.now().strftime('%Y-%m-%d')
+def fetch_source_date():
+    """The dataset's last-modified date ('YYYY-MM-DD'), or None if unavailable."""
+    try:
+        with urllib.request.urlopen(HF_INFO_URL, timeout=30) as response:
+            info = json.loads(response.read())
+        return info.get('lastModified', '')[:10] or None
+    except Exception as e:
+        print(f"  Could not fetch dataset date: {e}")
+        return None
+
+def generate_stories_addition(stories, source_date=None, output_dir=None):
+    """
+    Generate JavaScript code to add to stories.js (in `output_dir`, default
+    scripts/temp), dated by the dataset's `source_date`. The file is left
+    alone if its content is unchanged.
+    """
+    date_str = artifacts.build_date([source_date])
 
-    output_path = os.path.join(TEMP_DIR, "ro_stories_addition.js")
+    output_path = os.path.join(output_dir or TEMP_DIR, "ro_stories_addition.js")
 
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(f'''  // ============================================
+    header = f'''  // ============================================
   // RO-STORIES DATASET - Added {date_str}
   // Source: huggingface.co/datasets/readerbench/ro-stories
   // License: Apache 2.0
   // Count: {len(stories)}
   // ============================================
-''')
+'''
 
-        for story in stories:
-            excerpt_escaped = escape_js_string(story['excerpt'])
+    js_string = js_emit.js_string
 
-            f.write(f'''  {{
-    id: '{story["id"]}',
-    title: '{escape_js_string(story["title"])}',
-    titleEn: '{escape_js_string(story["titleEn"])}',
-    author: '{escape_js_string(story["author"])}',
-    excerpt: `{excerpt_escaped}`,
+    def render(story):
+        return f'''  {{
+    id: {js_string(story["id"])},
+    title: {js_string(story["title"])},
+    titleEn: {js_string(story["titleEn"])},
+    author: {js_string(story["author"])},
+    excerpt: `{js_emit.escape_template(story['excerpt'])}`,
     difficulty: {story["difficulty"]},
-    genre: '{story["genre"]}',
-    era: '{story["era"]}',
+    genre: {js_string(story["genre"])},
+    era: {js_string(story["era"])},
     wordCount: {story["wordCount"]},
-    source: '{story["source"]}',
-    license: '{story["license"]}',
+    source: {js_string(story["source"])},
+    license: {js_string(story["license"])},
   }},
-''')
+'''
+
+    changed = js_emit.write_module(output_path, header, js_emit.rows(stories, render, separator='', end=''))
 
-    print(f"\nGenerated addition file: {output_path}")
+    print(f"\nGenerated addition file: {output_path}{'' if changed else ' (unchanged)'}")
     return output_path
 
+def rescore_with_features(stories):
+    """Replace heuristic difficulties with the vectorized feature scores."""
+    # Imported here: story_features needs NumPy, the default path does not
+    from story_features import score_stories
+
+    difficulties, _ = score_stories(stories)
+    for story, difficulty in zip(stories, difficulties):
+        story['difficulty'] = int(difficulty)
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Process RO-stories excerpts from HuggingFace.")
+    parser.add_argument(
+        '--difficulty', choices=['heuristic', 'features'], default='heuristic',
+        help="difficulty scoring: per-excerpt heuristic or batch NumPy features (default: heuristic)"
+    )
+    parser.add_argument(
+        '--merge', action='store_true',
+        help="upsert the stories into src/data/stories.js and rebuild the story chunks"
+    )
+    parser.add_argument(
+        '--postgres', metavar='DSN',
+        help="after --merge, bulk-load stories.js into the content_stories table"
+    )
+    parser.add_argument(
+        '--local-filter', action='store_true',
+        help="fetch every row and filter locally instead of using the server's /filter endpoint"
+    )
+    sampling.add_arguments(parser)
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+    # content_stories mirrors stories.js, not just this run's excerpts
+    if args.postgres and not args.merge:
+        parser.error("--postgres needs --merge")
+    if args.merge and args.sample:
+        parser.error("--merge writes src/data; it can't be combined with --sample")
+    if args.postgres:
+        # Fail now rather than after the whole build
+        import load_postgres
+        if load_postgres.psycopg is None:
+            parser.error(load_postgres.PSYCOPG_MISSING)
+    return args
+
 def main():
+    args = parse_args()
+    metrics.configure(args, 'process_rostories')
+
     print("=" * 60)
     print("RO-Stories Romanian Literature Processor")
     print("=" * 60)
 
     ensure_dirs()
 
+    keep = None
+    output_dir = None
+    if args.sample:
+        keep = sampling.sampler(args.sample, args.seed)
+        output_dir = sampling.output_dir('process_rostories')
+        print(f"\n{sampling.describe(args.sample, args.seed)} -> {output_dir}\n")
+
     # Process stories
-    stories = process_stories()
+    with metrics.stage('process stories') as stage:
+        stories = process_stories(server_filter=not args.local_filter, keep=keep)
+        stage.rows = len(stories)
 
     if not stories:
         print("\nNo stories processed. Exiting.")
         sys.exit(1)
 
+    if args.difficulty == 'features':
+        print("\nStep 2b: Scoring difficulty from text features...")
+        with metrics.stage('score features') as stage:
+            rescore_with_features(stories)
+            stage.rows = len(stories)
+
     # Generate output
     print("\nStep 3: Generating JavaScript addition...")
-    output_path = generate_stories_addition(stories)
+    with metrics.stage('generate js') as stage:
+        output_path = generate_stories_addition(stories, fetch_source_date(), output_dir)
+        stage.rows = len(stories)
+
+    if args.merge:
+        from merge_stories import merge_stories
+
+        print("\nStep 4: Merging into stories.js...")
+        with metrics.stage('merge stories') as stage:
+            stats, chunk_sizes = merge_stories(stories)
+            stage.rows = len(stories)
+        print(f"  Inserted: {stats['inserted']}, updated: {stats['updated']}, unchanged: {stats['unchanged']}")
+        print(f"  Rebuilt {len(chunk_sizes)} story chunks")
+
+    if args.postgres:
+        # Imported here: the loader needs psycopg, the default path does not
+        import load_postgres
+        from merge_stories import load_stories
+
+        print("\nStep 5: Loading stories into Postgres...")
+        with metrics.stage('postgres') as stage:
+            with load_postgres.connect(args.postgres) as conn:
+                result = load_postgres.load_stories(conn, load_stories().values())
+            stage.rows = result['rows']
+        load_postgres.report('content_stories', result)
 
     # Show statistics
     print("\n" + "=" * 60)
@@ -306,8 +495,17 @@ def main():
     print(f"\nBy difficulty: {dict(sorted(difficulties.items()))}")
     print(f"\nTop authors: {dict(sorted(authors.items(), key=lambda x: -x[1])[:10])}")
 
+    # Sampled builds write outside src/data
+    if not args.sample:
+        print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
     print("\n" + "=" * 60)
-    print("Done! Review the generated file and add to stories.js")
+    if args.merge:
+        print("Done! stories.js and story chunks are up to date")
+    elif args.sample:
+        print(f"Done! Sampled addition written to {output_path}")
+    else:
+        print("Done! Review the generated file and run merge_stories.py to add it")
     print("=" * 60)
 
 if __name__ == '__main__':
@@ -5,18 +5,52 @@ Tatoeba Romanian-English Sentence Processor
 Downloads and processes Romanian-English sentence pairs from Tatoeba.org
 Generates JavaScript files organized by difficulty level.
 
+--pairs adds other languages (fra, spa, ita, deu): every requested language
+is paired in the same pass over links.csv, and each pair gets its own level
+files in src/data/tatoeba/ron-<lang>/.
+
+The exports download at the same time, one thread each, and each is parsed
+as soon as it arrives (the links archive is unpacked while it streams in);
+the audio export is fetched alongside the pairs. A cold run takes about as
+long as the slowest download plus the links join.
+
+With NumPy installed the links join runs vectorized over a parsed binary
+copy of links.csv (scripts/temp/links.bin); without it, row by row.
+
+--sample FRACTION keeps a stable, seeded sample of the Romanian sentences
+at ingest and writes everything to scripts/temp/sample/process_tatoeba/
+instead of src/data. The sampled pairs are cached, so repeat runs while
+tuning calculate_difficulty or split_by_difficulty take seconds.
+
+--external runs the join, dedupe and tiering over hash-partitioned spill
+files (see tatoeba_external.py) for corpora larger than the build
+machine's memory; --memory-budget sets the partition count.
+
+Usage:
+    python scripts/process_tatoeba.py
+    python scripts/process_tatoeba.py --pairs eng,fra
+    python scripts/process_tatoeba.py --sample 0.05 --seed 1
+    python scripts/process_tatoeba.py --external --memory-budget 256 --workers 4
+
 Source: tatoeba.org
 License: CC-BY 2.0 FR
 """
 
+import argparse
 import csv
+import functools
 import json
 import os
 import re
+import shutil
 import sys
 import urllib.request
-from datetime import datetime
-from collections import defaultdict
+from collections import defaultdict, namedtuple
+
+import artifacts
+import js_emit
+import metrics
+import sampling
 
 # URLs for Tatoeba data
 RON_SENTENCES_URL = "https://downloads.tatoeba.org/exports/per_language/ron/ron_sentences_detailed.tsv"
@@ -24,19 +58,71 @@ LINKS_URL = "https://downloads.tatoeba.org/exports/links.tar.bz2"
 ENG_SENTENCES_URL = "https://downloads.tatoeba.org/exports/per_language/eng/eng_sentences_detailed.tsv"
 AUDIO_URL = "https://downloads.tatoeba.org/exports/sentences_with_audio.csv"
 
+# Languages Romanian can be paired with, and their sentence field
+PAIR_LANGUAGES = {
+    'eng': 'english',
+    'fra': 'french',
+    'spa': 'spanish',
+    'ita': 'italian',
+    'deu': 'german',
+}
+
+# Pipeline records. Tuples rather than dicts: they take well under half the
+# memory per record, which adds up with several language pairs loaded.
+# A pair's translation is in the language it was loaded for.
+Pair = namedtuple('Pair', ['ron_id', 'romanian', 'other_id', 'translation'])
+Sentence = namedtuple('Sentence', [
+    'id', 'romanian', 'translation', 'difficulty', 'word_count', 'has_audio', 'audio_url',
+])
+
+# Levels and their difficulty ranges; each level file keeps TIER_SIZE sentences
+TIERS = (('beginner', 1, 3), ('intermediate', 4, 6), ('advanced', 7, 10))
+TIER_SIZE = 600
+
 # Output directory
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
 DATA_DIR = os.path.join(PROJECT_DIR, "src", "data", "tatoeba")
 TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
 
+# links.csv rows handled at a time by the NumPy join
+LINKS_CHUNK_ROWS = 4 * 1024 * 1024
+# Largest sentence id the NumPy join indexes directly (one byte per id)
+MAX_LOOKUP_ID = 1 << 27
+# Bytes read at a time when draining a streamed download
+DOWNLOAD_BLOCK_BYTES = 1 << 16
+
 def ensure_dirs():
     """Create necessary directories."""
     os.makedirs(DATA_DIR, exist_ok=True)
     os.makedirs(TEMP_DIR, exist_ok=True)
 
-def download_file(url, filename):
-    """Download a file with progress indication."""
+class TeeReader:
+    """A read-only stream over a download that also writes what it reads to `out`."""
+
+    def __init__(self, response, out, hook):
+        self.response = response
+        self.out = out
+        self.hook = hook
+        self.total = int(response.headers.get('Content-Length') or -1)
+
+    def read(self, size=-1):
+        data = self.response.read(size)
+        if data:
+            self.out.write(data)
+            # As a urlretrieve reporthook: one "block" of everything so far
+            self.hook(1, self.out.tell(), self.total)
+        return data
+
+
+def download_file(url, filename, consume=None):
+    """
+    Download a file with progress indication.
+
+    With `consume`, the bytes are also handed to consume(stream) as they
+    arrive (a file object reading the download), so an archive can be
+    unpacked while it is still downloading.
+    """
     filepath = os.path.join(TEMP_DIR, filename)
     if os.path.exists(filepath):
         print(f"  Using cached: {filename}")
@@ -44,7 +130,20 @@ def download_file(url, filename):
 
     print(f"  Downloading: {filename}...")
     try:
-        urllib.request.urlretrieve(url, filepath)
+        if consume is None:
+            _, headers = urllib.request.urlretrieve(url, filepath, reporthook=metrics.download_hook(filename))
+        else:
+            partial_path = filepath + '.part'
+            with urllib.request.urlopen(url) as response, open(partial_path, 'wb') as out:
+                headers = response.headers
+                stream = TeeReader(response, out, metrics.download_hook(filename))
+                consume(stream)
+                # Whatever consume() didn't read still belongs in the file
+                while stream.read(DOWNLOAD_BLOCK_BYTES):
+                    pass
+            os.replace(partial_path, filepath)
+        # Keep the export's own date; generated headers are dated from it
+        artifacts.set_source_time(filepath, headers.get('Last-Modified'))
         print(f"  Downloaded: {filename}")
         return filepath
     except Exception as e:
@@ -112,134 +211,445 @@ def calculate_difficulty(romanian_text):
     # Cap at 10
     return min(difficulty, 10)
 
-def escape_js_string(s):
-    """Escape a string for use in JavaScript."""
-    if s is None:
-        return ''
-    # Escape backslashes first, then quotes
-    s = s.replace('\\', '\\\\')
-    s = s.replace("'", "\\'")
-    s = s.replace('"', '\\"')
-    s = s.replace('\n', '\\n')
-    s = s.replace('\r', '\\r')
-    return s
+def sentences_url(lang):
+    """Per-language sentence export URL."""
+    return f"https://downloads.tatoeba.org/exports/per_language/{lang}/{lang}_sentences.tsv.bz2"
 
-def load_ron_eng_pairs():
+def parse_sentences(path, label, keep=None):
     """
-    Load Romanian-English sentence pairs.
-    Downloads individual sentence files and links them.
+    Parse a per-language sentence export into {sentence_id: text}, only
+    the ids `keep` accepts when it is given.
     """
-    print("Step 1: Downloading Tatoeba data files...")
-
-    # Download Romanian sentences
-    ron_sentences_path = download_file(
-        "https://downloads.tatoeba.org/exports/per_language/ron/ron_sentences.tsv.bz2",
-        "ron_sentences.tsv.bz2"
-    )
-
-    # Download English sentences
-    eng_sentences_path = download_file(
-        "https://downloads.tatoeba.org/exports/per_language/eng/eng_sentences.tsv.bz2",
-        "eng_sentences.tsv.bz2"
-    )
-
-    # Download links (sentence translations)
-    links_path = download_file(
-        "https://downloads.tatoeba.org/exports/links.tar.bz2",
-        "links.tar.bz2"
-    )
-
-    # If we couldn't get the big files, try a smaller alternative
-    if not all([ron_sentences_path, eng_sentences_path, links_path]):
-        print("  Trying alternative download method...")
-        return load_pairs_alternative()
-
-    print("\nStep 2: Extracting and parsing files...")
-
-    # Extract Romanian sentences
     import bz2
-    import tarfile
 
-    ron_sentences = {}
-    print("  Parsing Romanian sentences...")
-    with bz2.open(ron_sentences_path, 'rt', encoding='utf-8') as f:
+    sentences = {}
+    print(f"  Parsing {label} sentences...")
+    with metrics.stage(f'parse {label.lower()} sentences'), open(path, 'rb') as raw, \
+            bz2.open(raw, 'rt', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, f'{label} sentences', position=metrics.file_position(raw, path)):
             if len(row) >= 3:
                 sentence_id = row[0]
                 text = row[2]
-                if text.strip():
-                    ron_sentences[sentence_id] = text.strip()
-    print(f"    Found {len(ron_sentences)} Romanian sentences")
-
-    # Extract English sentences
-    eng_sentences = {}
-    print("  Parsing English sentences...")
-    with bz2.open(eng_sentences_path, 'rt', encoding='utf-8') as f:
-        reader = csv.reader(f, delimiter='\t')
-        for row in reader:
-            if len(row) >= 3:
-                sentence_id = row[0]
-                text = row[2]
-                if text.strip():
-                    eng_sentences[sentence_id] = text.strip()
-    print(f"    Found {len(eng_sentences)} English sentences")
+                if text.strip() and (keep is None or keep(sentence_id)):
+                    sentences[sentence_id] = text.strip()
+    print(f"    Found {len(sentences)} {label} sentences")
+    return sentences
+
+def extract_links(links_path):
+    """Extract links.csv from the links archive (cached in scripts/temp)."""
+    with open(links_path, 'rb') as f:
+        return unpack_links(f)
+
+def unpack_links(stream):
+    """
+    Extract links.csv from a links archive read from `stream` front to back
+    (a file or a download in progress), unless it is already cached.
+    """
+    import tarfile
 
-    # Extract and parse links
-    print("  Parsing translation links...")
     links_extracted = os.path.join(TEMP_DIR, "links.csv")
     if not os.path.exists(links_extracted):
-        with tarfile.open(links_path, 'r:bz2') as tar:
-            for member in tar.getmembers():
+        with metrics.stage('extract links'), tarfile.open(fileobj=stream, mode='r|bz2') as tar:
+            for member in tar:
                 if 'links' in member.name and member.name.endswith('.csv'):
-                    member.name = 'links.csv'
+                    # Extracted under a temporary name so a cut-off run isn't cached
+                    member.name = 'links.csv.tmp'
                     tar.extract(member, TEMP_DIR)
+                    os.replace(links_extracted + '.tmp', links_extracted)
                     break
+    return links_extracted
 
-    # Build pairs
-    pairs = []
-    seen_ron = set()
-    with open(links_extracted, 'r', encoding='utf-8') as f:
+def prepare_links(links_path):
+    """
+    extract_links(), then parse links.csv into its binary cache while other
+    exports are still downloading (with NumPy; see read_link_chunks).
+    """
+    links_extracted = extract_links(links_path)
+    try:
+        import numpy as np
+    except ImportError:
+        return links_extracted
+    with metrics.stage('parse links'):
+        for chunk in read_link_chunks(links_extracted, np):
+            if chunk is None:
+                break
+            metrics.add_rows(len(chunk))
+    return links_extracted
+
+def join_links(links_path, ron_sentences, targets):
+    """
+    Pair Romanian sentences with their translations, row by row.
+    Keeps the first link per Romanian id and language.
+    """
+    # Sentence ids are unique across languages, so one map finds a row's pair
+    target_lang = {}
+    for lang, sentences in targets.items():
+        target_lang.update(dict.fromkeys(sentences, lang))
+
+    pairs = {lang: [] for lang in targets}
+    seen_ron = {lang: set() for lang in targets}
+    with open(links_path, 'r', encoding='utf-8') as f:
         reader = csv.reader(f, delimiter='\t')
-        for row in reader:
+        for row in metrics.progress(reader, 'links', position=metrics.file_position(f.buffer, links_path)):
             if len(row) >= 2:
                 sent1_id = row[0]
                 sent2_id = row[1]
 
-                # Check if this is a Romanian-English pair
-                if sent1_id in ron_sentences and sent2_id in eng_sentences:
-                    if sent1_id not in seen_ron:
-                        seen_ron.add(sent1_id)
-                        ron_text = ron_sentences[sent1_id]
-                        eng_text = eng_sentences[sent2_id]
-
-                        # Skip very long sentences
-                        if len(ron_text) <= 500:
-                            pairs.append({
-                                'ron_id': sent1_id,
-                                'romanian': ron_text,
-                                'eng_id': sent2_id,
-                                'english': eng_text
-                            })
-
-                # Also check reverse (English -> Romanian)
-                elif sent1_id in eng_sentences and sent2_id in ron_sentences:
-                    if sent2_id not in seen_ron:
-                        seen_ron.add(sent2_id)
-                        ron_text = ron_sentences[sent2_id]
-                        eng_text = eng_sentences[sent1_id]
-
-                        if len(ron_text) <= 500:
-                            pairs.append({
-                                'ron_id': sent2_id,
-                                'romanian': ron_text,
-                                'eng_id': sent1_id,
-                                'english': eng_text
-                            })
-
-    print(f"  Found {len(pairs)} Romanian-English pairs")
+                # Romanian -> other language, or the reverse link
+                if sent1_id in ron_sentences:
+                    ron_id, other_id = sent1_id, sent2_id
+                elif sent2_id in ron_sentences:
+                    ron_id, other_id = sent2_id, sent1_id
+                else:
+                    continue
+
+                lang = target_lang.get(other_id)
+                if lang is None or ron_id in seen_ron[lang]:
+                    continue
+                seen_ron[lang].add(ron_id)
+                ron_text = ron_sentences[ron_id]
+
+                # Skip very long sentences
+                if len(ron_text) <= 500:
+                    pairs[lang].append(Pair(ron_id, ron_text, other_id, targets[lang][other_id]))
+    return pairs
+
+def id_array(sentences, np):
+    """Sentence ids as int64, or None if any id isn't a plain integer."""
+    if not sentences:
+        return np.zeros(0, dtype=np.int64)
+    text = ' '.join(sentences).encode('ascii', 'replace')
+    chars = np.frombuffer(text, dtype=np.uint8)
+    digits = (chars >= ord('0')) & (chars <= ord('9'))
+    if not (digits | (chars == ord(' '))).all():
+        return None
+    # Text lookups go back through str(id), so no leading zeros either
+    starts = np.concatenate(([0], np.flatnonzero(chars == ord(' ')) + 1))
+    starts = starts[starts < len(chars)]
+    zeros = starts[chars[starts] == ord('0')] + 1
+    if digits[zeros[zeros < len(chars)]].any():
+        return None
+    values = np.fromstring(text, dtype=np.int64, sep=' ')
+    return values if values.size == len(sentences) else None
+
+def read_link_chunks(links_path, np):
+    """
+    Yield links.csv as (n, 2) integer arrays, LINKS_CHUNK_ROWS at a time.
+    Yields None for a chunk that isn't two integer columns.
+
+    The parsed ids are cached next to links.csv (links.bin, int32 pairs), so
+    later runs map the binary file instead of parsing text.
+    """
+    import warnings
+
+    cache_path = os.path.splitext(links_path)[0] + '.bin'
+    if os.path.exists(cache_path) and os.path.getmtime(cache_path) >= os.path.getmtime(links_path):
+        links = np.memmap(cache_path, dtype=np.int32, mode='r').reshape(-1, 2)
+        for start in range(0, len(links), LINKS_CHUNK_ROWS):
+            yield links[start:start + LINKS_CHUNK_ROWS]
+        return
+
+    partial_path = cache_path + '.tmp'
+    cache = open(partial_path, 'wb')
+    try:
+        with open(links_path, 'rb') as f:
+            remaining = os.path.getsize(links_path)
+            tail = b''
+            while True:
+                # Links rows are ~16 bytes. Asking for no more than is left
+                # keeps small files from allocating a whole chunk buffer.
+                block = f.read(min(remaining, LINKS_CHUNK_ROWS * 16))
+                remaining -= len(block)
+                if not block and not tail:
+                    break
+                data = tail + block
+                # Split on the last newline so no row spans two chunks
+                cut = data.rfind(b'\n') + 1 if block else len(data)
+                data, tail = data[:cut], data[cut:]
+                if not data:
+                    continue
+                lines = data.count(b'\n') + (not data.endswith(b'\n'))
+                try:
+                    with warnings.catch_warnings():
+                        # Older NumPy stops at non-numeric input with a warning
+                        warnings.simplefilter('ignore', DeprecationWarning)
+                        values = np.fromstring(data, dtype=np.int64, sep=' ')
+                except ValueError:
+                    values = None
+                if values is None or values.size != 2 * lines:
+                    yield None
+                    return
+                links = values.reshape(-1, 2)
+                if cache and links.size:
+                    if links.min() < 0 or links.max() > np.iinfo(np.int32).max:
+                        cache.close()
+                        cache = None
+                    else:
+                        links.astype(np.int32).tofile(cache)
+                yield links
+        if cache:
+            cache.close()
+            os.replace(partial_path, cache_path)
+            cache = None
+    finally:
+        if cache:
+            cache.close()
+        if os.path.exists(partial_path):
+            os.remove(partial_path)
+
+def join_links_numpy(links_path, ron_sentences, targets):
+    """
+    Vectorized join_links(): same pairs in the same order, with the links
+    parsed and matched as NumPy arrays. Only surviving pairs touch Python
+    objects.
+
+    Returns None (so the caller falls back to join_links) when NumPy isn't
+    installed or the ids aren't plain integers.
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+
+    # Language code per sentence id: 1 = Romanian, 2 + i = targets' i-th
+    # language, 0 = anything else. Ids past the table map to its last slot.
+    languages = list(targets)
+    id_sets = [ron_sentences] + [targets[lang] for lang in languages]
+    ids = [id_array(sentences, np) for sentences in id_sets]
+    if any(values is None for values in ids):
+        return None
+    max_id = max((int(values.max()) for values in ids if values.size), default=0)
+    if max_id >= MAX_LOOKUP_ID:
+        return None
+    codes = np.zeros(max_id + 2, dtype=np.int8)
+    # Same precedence as join_links: Romanian first, then the last language
+    for code, values in enumerate(ids[1:], start=2):
+        codes[values] = code
+    codes[ids[0]] = 1
+
+    ron_parts, other_parts, code_parts = [], [], []
+    rows = 0
+    for links in read_link_chunks(links_path, np):
+        if links is None:
+            return None
+        first = links[:, 0]
+        second = links[:, 1]
+        first_code = codes[np.minimum(first, max_id + 1)]
+        second_code = codes[np.minimum(second, max_id + 1)]
+
+        # Romanian -> other language, or the reverse link
+        forward = first_code == 1
+        keep = forward | (second_code == 1)
+        other_code = np.where(forward, second_code, first_code)
+        keep &= other_code >= 2
+        ron_parts.append(np.where(forward, first, second)[keep])
+        other_parts.append(np.where(forward, second, first)[keep])
+        code_parts.append(other_code[keep])
+        rows += len(links)
+
+    metrics.add_rows(rows)
+
+    ron_ids = np.concatenate(ron_parts) if ron_parts else np.zeros(0, dtype=np.int64)
+    other_ids = np.concatenate(other_parts) if other_parts else np.zeros(0, dtype=np.int64)
+    other_codes = np.concatenate(code_parts) if code_parts else np.zeros(0, dtype=np.int8)
+
+    pairs = {}
+    for code, lang in enumerate(languages, start=2):
+        match = other_codes == code
+        lang_ron = ron_ids[match]
+        lang_other = other_ids[match]
+        # First link per Romanian id, in file order
+        _, first_index = np.unique(lang_ron, return_index=True)
+        first_index.sort()
+
+        lang_pairs = []
+        target_sentences = targets[lang]
+        for ron_id, other_id in zip(lang_ron[first_index].tolist(), lang_other[first_index].tolist()):
+            ron_id = str(ron_id)
+            ron_text = ron_sentences[ron_id]
+            # Skip very long sentences
+            if len(ron_text) <= 500:
+                other_id = str(other_id)
+                lang_pairs.append(Pair(ron_id, ron_text, other_id, target_sentences[other_id]))
+        pairs[lang] = lang_pairs
+    return pairs
+
+def fetch(name, url, filename, parse=None, consume=None):
+    """
+    Download (or reuse) one export and parse it in the same thread, as soon
+    as it has arrived. Returns parse(path) (the path without `parse`), or
+    None if the download failed.
+    """
+    with metrics.stage(f'fetch {name}'):
+        path = download_file(url, filename, consume)
+        if path is None or parse is None:
+            return path
+        return parse(path)
+
+def fetch_all(tasks):
+    """
+    fetch() every {name: (url, filename, parse, consume)} at once, a thread
+    each. Downloads wait on the network and bz2 releases the GIL while it
+    decompresses, so parsing one export overlaps downloading the others and
+    the wall time is about the slowest single fetch. Returns {name: result}.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
+        futures = {name: pool.submit(metrics.bind(fetch), name, *task) for name, task in tasks.items()}
+        return {name: future.result() for name, future in futures.items()}
+
+def source_tasks(languages, keep=None, audio=False, parse=True):
+    """
+    fetch_all() tasks for a pair build: the Romanian and paired-language
+    sentences, the links (unpacked while they download) and, with `audio`,
+    the audio export. Without `parse` the tasks only download.
+    """
+    def parser(function, **kwargs):
+        return functools.partial(function, **kwargs) if parse else None
+
+    tasks = {'ron': (sentences_url('ron'), "ron_sentences.tsv.bz2",
+                     parser(parse_sentences, label='Romanian', keep=keep))}
+    for lang in languages:
+        tasks[lang] = (sentences_url(lang), f"{lang}_sentences.tsv.bz2",
+                       parser(parse_sentences, label=PAIR_LANGUAGES[lang].capitalize()))
+    tasks['links'] = (LINKS_URL, "links.tar.bz2", parser(prepare_links), unpack_links)
+    if audio:
+        tasks['audio'] = (AUDIO_URL, "sentences_with_audio.csv", parser(parse_audio_ids))
+    return tasks
+
+def download_sources(languages, audio=False):
+    """
+    Download (or reuse) the exports a pair build reads, all at once.
+    Returns (ron_path, {lang: path}, links_path, audio_path); failed
+    downloads are None.
+    """
+    paths = fetch_all(source_tasks(languages, audio=audio, parse=False))
+    return paths['ron'], {lang: paths[lang] for lang in languages}, paths['links'], paths.get('audio')
+
+def load_sources(languages, keep=None, audio=False):
+    """
+    Steps 1-2 (and 3 with `audio`): download every export at once and parse
+    each as soon as it arrives, then join the links. Returns
+    ({lang: [Pair]}, Romanian sentence ids with audio); the audio ids are
+    None without `audio`.
+    """
+    print(f"Steps 1-{3 if audio else 2}: Downloading and parsing Tatoeba data files...")
+    results = fetch_all(source_tasks(languages, keep, audio))
+    ron_sentences, links_extracted = results['ron'], results['links']
+    targets = {lang: results[lang] for lang in languages}
+
+    # If we couldn't get the big files, try a smaller alternative
+    if any(result is None for result in [ron_sentences, links_extracted, *targets.values()]):
+        print("  Trying alternative download method...")
+        return {lang: load_pairs_alternative() for lang in languages}, (set() if audio else None)
+
+    # Build pairs
+    print("  Joining translation links...")
+    with metrics.stage('join links'):
+        pairs = join_links_numpy(links_extracted, ron_sentences, targets)
+        if pairs is None:
+            pairs = join_links(links_extracted, ron_sentences, targets)
+
+    for lang in languages:
+        print(f"  Found {len(pairs[lang])} Romanian-{PAIR_LANGUAGES[lang].capitalize()} pairs")
+
+    audio_ids = None
+    if audio:
+        # Filter to only Romanian sentences that were paired
+        ron_sentence_ids = set(p.ron_id for lang_pairs in pairs.values() for p in lang_pairs)
+        audio_ids = (results['audio'] or set()).intersection(ron_sentence_ids)
+        print(f"  Found {len(audio_ids)} Romanian sentences with audio")
+    return pairs, audio_ids
+
+def load_ron_pairs(languages=('eng',), keep=None):
+    """
+    Load Romanian sentence pairs for several languages at once.
+    Downloads and parses the per-language sentence files concurrently, then
+    makes a single pass over links.csv and hands each row to the pair it
+    belongs to. With `keep`, only Romanian sentences whose id it accepts
+    are paired.
+
+    Returns {lang: [Pair]}, each pair's other_id and translation in that
+    language.
+    """
+    return load_sources(languages, keep)[0]
+
+def load_pairs_with_audio(languages=('eng',)):
+    """
+    load_ron_pairs() with the audio export fetched and parsed alongside.
+    Returns ({lang: [Pair]}, Romanian sentence ids with audio).
+    """
+    return load_sources(languages, audio=True)
+
+def load_ron_eng_pairs():
+    """
+    Load Romanian-English sentence pairs.
+    Downloads individual sentence files and links them.
+    """
+    return load_ron_pairs(['eng'])['eng']
+
+
+def sample_cache_key(languages, sample_fraction, seed):
+    """What a cached sample depends on: its parameters and the source files."""
+    paths = sorted({path for lang in languages for path in source_paths(lang)})
+    sources = {
+        os.path.basename(path): [os.path.getsize(path), int(os.path.getmtime(path))]
+        for path in paths if os.path.exists(path)
+    }
+    return {'languages': list(languages), 'sample': sample_fraction, 'seed': seed, 'sources': sources}
+
+def load_sampled_pairs(languages, sample_fraction, seed):
+    """
+    load_ron_pairs() over a stable sample of the Romanian sentences. The
+    pairs are cached in scripts/temp/sample until the parameters or the
+    downloaded exports change.
+    """
+    cache_path = os.path.join(
+        sampling.SAMPLE_DIR, f"pairs-{'-'.join(languages)}-{sample_fraction}-seed{seed}.json"
+    )
+    if os.path.exists(cache_path):
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] == sample_cache_key(languages, sample_fraction, seed):
+            print(f"Steps 1-2: Using cached sample {cache_path}")
+            return {lang: [Pair(*row) for row in rows] for lang, rows in cached['pairs'].items()}
+
+    pairs = load_ron_pairs(languages, sampling.sampler(sample_fraction, seed))
+    if any(pairs.values()):
+        os.makedirs(sampling.SAMPLE_DIR, exist_ok=True)
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump({'key': sample_cache_key(languages, sample_fraction, seed), 'pairs': pairs},
+                      f, ensure_ascii=False)
     return pairs
 
+def load_external(languages, budget_mb, workers=1, keep=None, keep_english=False):
+    """
+    Steps 1-5 in external memory (tatoeba_external.py). Returns the build
+    results ({lang: {'pairs', 'count', 'groups'}}) and, with `keep_english`,
+    the directory holding the processed Romanian-English sentences as spill
+    files (read them with tatoeba_external.iter_sentences), or None if the
+    downloads failed.
+    """
+    # Imported here: only --external needs the spill machinery
+    import tatoeba_external
+
+    print("Step 1: Downloading Tatoeba data files...")
+    ron_path, target_paths, links_path, audio_path = download_sources(languages, audio=True)
+    if not all([ron_path, links_path, *target_paths.values()]):
+        return None
+
+    print("\nSteps 2-5: Joining, deduplicating and tiering in external memory...")
+    english_dir = None
+    with tatoeba_external.spill_dir(TEMP_DIR) as spill:
+        results = tatoeba_external.build(spill, ron_path, target_paths, extract_links(links_path),
+                                         audio_path, budget_mb, workers, keep)
+        # Every sentence stays on disk; loading them into memory would
+        # undo the memory budget
+        if keep_english and 'eng' in languages:
+            english_dir = tatoeba_external.keep_sentences(spill, 'eng', os.path.join(TEMP_DIR, 'external-eng'))
+    return results, english_dir
 
 def load_pairs_alternative():
     """Alternative method using sentences_base.tar.bz2"""
@@ -247,21 +657,27 @@ def load_pairs_alternative():
     # Return empty - we'll create manual content if downloads fail
     return []
 
+def parse_audio_ids(audio_path):
+    """Every sentence id in the audio export."""
+    # The format is: audio_id, sentence_id, username, license, url
+    all_audio_ids = set()
+    with metrics.stage('parse audio'), open(audio_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        for row in metrics.progress(reader, 'audio rows'):
+            if len(row) >= 2:
+                all_audio_ids.add(row[1])  # sentence_id is column 2
+    return all_audio_ids
+
 def load_audio_sentences(ron_sentence_ids):
     """Load set of sentence IDs that have audio."""
     print("\nStep 3: Loading audio availability data...")
 
     audio_path = download_file(AUDIO_URL, "sentences_with_audio.csv")
 
-    # The format is: audio_id, sentence_id, username, license, url
     # We need to check if sentence_id is in our Romanian sentences
     all_audio_ids = set()
     if audio_path and os.path.exists(audio_path):
-        with open(audio_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f, delimiter='\t')
-            for row in reader:
-                if len(row) >= 2:
-                    all_audio_ids.add(row[1])  # sentence_id is column 2
+        all_audio_ids = parse_audio_ids(audio_path)
 
     # Filter to only Romanian sentences
     ron_audio_ids = all_audio_ids.intersection(ron_sentence_ids)
@@ -270,14 +686,14 @@ def load_audio_sentences(ron_sentence_ids):
     return ron_audio_ids
 
 def process_sentences(pairs, audio_ids):
-    """Process sentence pairs into the required format."""
+    """Process sentence pairs into Sentence records."""
     print("\nStep 4: Processing sentences...")
 
     sentences = []
     seen_romanian = set()  # Deduplicate by Romanian text
 
     for pair in pairs:
-        romanian = pair['romanian']
+        romanian = pair.romanian
 
         # Skip duplicates
         romanian_normalized = romanian.lower().strip()
@@ -285,7 +701,7 @@ def process_sentences(pairs, audio_ids):
             continue
         seen_romanian.add(romanian_normalized)
 
-        ron_id = pair['ron_id']
+        ron_id = pair.ron_id
         has_audio = ron_id in audio_ids
 
         word_count = len(romanian.split())
@@ -294,15 +710,15 @@ def process_sentences(pairs, audio_ids):
         # Build audio URL if available
         audio_url = f"https://audio.tatoeba.org/sentences/ron/{ron_id}.mp3" if has_audio else None
 
-        sentences.append({
-            'id': f'tat-{ron_id}',
-            'romanian': romanian,
-            'english': pair['english'],
-            'difficulty': difficulty,
-            'wordCount': word_count,
-            'hasAudio': has_audio,
-            'audioUrl': audio_url
-        })
+        sentences.append(Sentence(
+            id=f'tat-{ron_id}',
+            romanian=romanian,
+            translation=pair.translation,
+            difficulty=difficulty,
+            word_count=word_count,
+            has_audio=has_audio,
+            audio_url=audio_url,
+        ))
 
     print(f"  Processed {len(sentences)} unique sentences")
     return sentences
@@ -310,46 +726,56 @@ def process_sentences(pairs, audio_ids):
 def split_by_difficulty(sentences):
     """Split sentences into beginner, intermediate, and advanced groups."""
     # Sort by difficulty first
-    sentences.sort(key=lambda x: (x['difficulty'], x['wordCount']))
-
-    # Prioritize sentences with audio
-    beginner = [s for s in sentences if 1 <= s['difficulty'] <= 3]
-    intermediate = [s for s in sentences if 4 <= s['difficulty'] <= 6]
-    advanced = [s for s in sentences if 7 <= s['difficulty'] <= 10]
-
-    # Sort each group: audio first, then by difficulty
-    for group in [beginner, intermediate, advanced]:
-        group.sort(key=lambda x: (not x['hasAudio'], x['difficulty'], x['wordCount']))
-
-    return {
-        'beginner': beginner[:600],  # Take top 600 (prioritizing audio)
-        'intermediate': intermediate[:600],
-        'advanced': advanced[:600]
-    }
-
-def generate_js_file(sentences, level, filename):
-    """Generate a JavaScript file with the sentences."""
-    filepath = os.path.join(DATA_DIR, filename)
+    sentences.sort(key=lambda x: (x.difficulty, x.word_count))
+
+    groups = {}
+    for level, low, high in TIERS:
+        group = [s for s in sentences if low <= s.difficulty <= high]
+        # Sort each group: audio first, then by difficulty
+        group.sort(key=lambda x: (not x.has_audio, x.difficulty, x.word_count))
+        groups[level] = group[:TIER_SIZE]  # Take the top (prioritizing audio)
+    return groups
+
+def pair_dir(lang):
+    """Output directory for a pair's level files (English stays at the top level)."""
+    return DATA_DIR if lang == 'eng' else os.path.join(DATA_DIR, f"ron-{lang}")
+
+def source_paths(lang='eng'):
+    """The downloaded exports a pair's level files are generated from."""
+    filenames = ["ron_sentences.tsv.bz2", f"{lang}_sentences.tsv.bz2", "links.tar.bz2", "sentences_with_audio.csv"]
+    return [os.path.join(TEMP_DIR, filename) for filename in filenames]
+
+def generate_js_file(sentences, level, filename, lang='eng'):
+    """
+    Generate a JavaScript file with the sentences.
+    The file is only rewritten when its content changes; the header date is
+    the date of the Tatoeba exports, not of the run.
+    """
+    out_dir = pair_dir(lang)
+    os.makedirs(out_dir, exist_ok=True)
+    filepath = os.path.join(out_dir, filename)
+    field = PAIR_LANGUAGES[lang]
+    export_prefix = 'TATOEBA' if lang == 'eng' else f"TATOEBA_{lang.upper()}"
 
-    date_str = datetime.now().strftime('%Y-%m-%d')
+    date_str = artifacts.build_date(artifacts.file_dates(source_paths(lang)))
 
     # Determine difficulty range
     if level == 'beginner':
         diff_range = '1-3'
-        export_name = 'TATOEBA_BEGINNER_EXTENDED'
+        export_name = f'{export_prefix}_BEGINNER_EXTENDED'
     elif level == 'intermediate':
         diff_range = '4-6'
-        export_name = 'TATOEBA_INTERMEDIATE_EXTENDED'
+        export_name = f'{export_prefix}_INTERMEDIATE_EXTENDED'
     else:
         diff_range = '7-10'
-        export_name = 'TATOEBA_ADVANCED_EXTENDED'
+        export_name = f'{export_prefix}_ADVANCED_EXTENDED'
 
-    audio_count = len([s for s in sentences if s['hasAudio']])
+    audio_count = len([s for s in sentences if s.has_audio])
+    # Romanian-English files keep their original header
+    pair_label = '' if lang == 'eng' else f" (Romanian-{field.capitalize()})"
 
-    with open(filepath, 'w', encoding='utf-8') as f:
-        # File header
-        f.write(f'''/**
- * Tatoeba Extended Sentences - {level.capitalize()}
+    header = f'''/**
+ * Tatoeba Extended Sentences - {level.capitalize()}{pair_label}
  * Source: tatoeba.org
  * License: CC-BY 2.0 FR
  * Attribution: https://tatoeba.org
@@ -361,60 +787,202 @@ def generate_js_file(sentences, level, filename):
  */
 
 export const {export_name} = [
-''')
+'''
+
+    js_string, js_bool = js_emit.js_string, js_emit.js_bool
+
+    def render(s):
+        return (f"  {{ id: '{s.id}', romanian: {js_string(s.romanian)}, "
+                f"{field}: {js_string(s.translation)}, difficulty: {s.difficulty}, "
+                f"wordCount: {s.word_count}, hasAudio: {js_bool(s.has_audio)}, "
+                f"audioUrl: {js_string(s.audio_url or None)} }}")
+
+    changed = js_emit.write_module(filepath, header, js_emit.rows(sentences, render), '];\n')
+
+    status = '' if changed else ', unchanged'
+    print(f"  Generated {os.path.relpath(filepath, DATA_DIR)}: {len(sentences)} sentences ({audio_count} with audio{status})")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Process Tatoeba Romanian sentence pairs.")
+    parser.add_argument('--pairs', default='eng',
+                        help=f"comma-separated languages to pair with Romanian, one links pass for all "
+                             f"({','.join(PAIR_LANGUAGES)}; default: eng)")
+    parser.add_argument('--daemon', metavar='ADDRESS',
+                        help="read pairs and audio from a running tatoeba_daemon.py (http://host:port or unix:PATH)")
+    parser.add_argument('--postgres', metavar='DSN',
+                        help="also bulk-load the processed Romanian-English sentences into content_sentences")
+    parser.add_argument('--external', action='store_true',
+                        help="join, dedupe and tier over spill files in scripts/temp/spill (bounded memory)")
+    parser.add_argument('--memory-budget', type=int, default=512, metavar='MB',
+                        help="with --external: memory for partition tables, split across workers (default: 512)")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="with --external: partitions processed in parallel (default: 1)")
+    sampling.add_arguments(parser)
+    metrics.add_arguments(parser)
+    args = parser.parse_args()
+
+    args.pairs = list(dict.fromkeys(lang.strip() for lang in args.pairs.split(',') if lang.strip()))
+    unknown = [lang for lang in args.pairs if lang not in PAIR_LANGUAGES]
+    if unknown or not args.pairs:
+        parser.error(f"--pairs must be from {', '.join(PAIR_LANGUAGES)} (got {', '.join(unknown) or 'nothing'})")
+    if args.daemon and args.pairs != ['eng']:
+        parser.error("--daemon only serves Romanian-English pairs")
+    if args.daemon and args.external:
+        parser.error("--external reads the exports itself; it can't be combined with --daemon")
+    if args.memory_budget < 1 or args.workers < 1:
+        parser.error("--memory-budget and --workers must be at least 1")
+    if args.postgres and 'eng' not in args.pairs:
+        parser.error("--postgres loads the Romanian-English sentences; include eng in --pairs")
+    if args.postgres and args.sample:
+        parser.error("--postgres loads the full build; it can't be combined with --sample")
+    if args.postgres:
+        # Fail now rather than after the whole build
+        import load_postgres
+        if load_postgres.psycopg is None:
+            parser.error(load_postgres.PSYCOPG_MISSING)
+    return args
 
-        # Write each sentence
-        for i, s in enumerate(sentences):
-            romanian_escaped = escape_js_string(s['romanian'])
-            english_escaped = escape_js_string(s['english'])
-            audio_url = f"'{s['audioUrl']}'" if s['audioUrl'] else 'null'
-
-            f.write(f"  {{ id: '{s['id']}', romanian: '{romanian_escaped}', english: '{english_escaped}', difficulty: {s['difficulty']}, wordCount: {s['wordCount']}, hasAudio: {str(s['hasAudio']).lower()}, audioUrl: {audio_url} }}")
-
-            if i < len(sentences) - 1:
-                f.write(',')
-            f.write('\n')
-
-        f.write('];\n')
+def main():
+    global DATA_DIR
 
-    print(f"  Generated {filename}: {len(sentences)} sentences ({audio_count} with audio)")
+    args = parse_args()
+    metrics.configure(args, 'process_tatoeba')
+    languages = args.pairs
+    pair_names = {lang: f"Romanian-{PAIR_LANGUAGES[lang].capitalize()}" for lang in languages}
 
-def main():
     print("=" * 60)
-    print("Tatoeba Romanian-English Sentence Processor")
+    print(f"Tatoeba {', '.join(pair_names.values())} Sentence Processor")
     print("=" * 60)
 
+    if args.sample:
+        # Sampled builds never touch src/data
+        DATA_DIR = sampling.output_dir('process_tatoeba')
+        print(f"\n{sampling.describe(args.sample, args.seed)} -> {DATA_DIR}")
+
     ensure_dirs()
 
     # Load data
-    pairs = load_ron_eng_pairs()
-    if not pairs:
-        print("\nError: No sentence pairs found. Check your internet connection.")
-        sys.exit(1)
-
-    # Get Romanian sentence IDs for audio lookup
-    ron_sentence_ids = set(p['ron_id'] for p in pairs)
-    audio_ids = load_audio_sentences(ron_sentence_ids)
-
-    # Process sentences
-    sentences = process_sentences(pairs, audio_ids)
-
-    # Split by difficulty
-    print("\nStep 5: Splitting by difficulty level...")
-    groups = split_by_difficulty(sentences)
-
-    print(f"  Beginner (1-3): {len(groups['beginner'])} sentences")
-    print(f"  Intermediate (4-6): {len(groups['intermediate'])} sentences")
-    print(f"  Advanced (7-10): {len(groups['advanced'])} sentences")
-
-    # Generate files
-    print("\nStep 6: Generating JavaScript files...")
-    generate_js_file(groups['beginner'], 'beginner', 'beginner_extended.js')
-    generate_js_file(groups['intermediate'], 'intermediate', 'intermediate_extended.js')
-    generate_js_file(groups['advanced'], 'advanced', 'advanced_extended.js')
+    client = None
+    if args.daemon:
+        from tatoeba_daemon import TatoebaClient
+        client = TatoebaClient(args.daemon)
+        print(f"\nSteps 1-3: Loading pairs and audio from {args.daemon}...")
+
+    external = None
+    sentences_by_lang = {}
+    if args.external:
+        keep = sampling.sampler(args.sample, args.seed) if args.sample else None
+        with metrics.stage('external build'):
+            loaded = load_external(languages, args.memory_budget, args.workers, keep,
+                                   keep_english=bool(args.postgres))
+        if loaded is None or not any(result['count'] for result in loaded[0].values()):
+            print("\nError: No sentence pairs found. Check your internet connection.")
+            sys.exit(1)
+        external, english_dir = loaded
+        if english_dir:
+            # Streamed from the spill files, once, by the Postgres loader
+            import tatoeba_external
+            sentences_by_lang['eng'] = tatoeba_external.iter_sentences(english_dir, 'eng')
+    else:
+        audio_ids = None
+        with metrics.stage('load pairs') as stage:
+            if client:
+                pairs = client.pairs()
+                if args.sample:
+                    keep = sampling.sampler(args.sample, args.seed)
+                    pairs = [p for p in pairs if keep(p.ron_id)]
+                pairs_by_lang = {'eng': pairs}
+            elif args.sample:
+                pairs_by_lang = load_sampled_pairs(languages, args.sample, args.seed)
+            else:
+                # The audio export downloads and parses alongside the pairs
+                pairs_by_lang, audio_ids = load_pairs_with_audio(languages)
+            stage.rows = sum(len(pairs) for pairs in pairs_by_lang.values())
+        if not any(pairs_by_lang.values()):
+            print("\nError: No sentence pairs found. Check your internet connection.")
+            sys.exit(1)
+
+        # Get Romanian sentence IDs for audio lookup (shared by every pair)
+        if audio_ids is None:
+            with metrics.stage('load audio'):
+                ron_sentence_ids = set(p.ron_id for pairs in pairs_by_lang.values() for p in pairs)
+                if client:
+                    audio_ids = set(client.audio_map(ron_sentence_ids))
+                    client.close()
+                else:
+                    audio_ids = load_audio_sentences(ron_sentence_ids)
+
+    for lang in languages:
+        if len(languages) > 1:
+            print(f"\n--- {pair_names[lang]} ({pair_dir(lang)}) ---")
+
+        if external:
+            # Already processed and split by tatoeba_external
+            if not external[lang]['count']:
+                print("  No pairs found, skipping")
+                continue
+            groups = external[lang]['groups']
+        else:
+            pairs = pairs_by_lang[lang]
+            if not pairs:
+                print("  No pairs found, skipping")
+                continue
+
+            # Process sentences
+            with metrics.stage(f'{lang} process sentences') as stage:
+                sentences = process_sentences(pairs, audio_ids)
+                stage.rows = len(pairs)
+            sentences_by_lang[lang] = sentences
+
+            # Split by difficulty
+            print("\nStep 5: Splitting by difficulty level...")
+            with metrics.stage(f'{lang} split by difficulty') as stage:
+                groups = split_by_difficulty(sentences)
+                stage.rows = len(sentences)
+
+        print(f"  Beginner (1-3): {len(groups['beginner'])} sentences")
+        print(f"  Intermediate (4-6): {len(groups['intermediate'])} sentences")
+        print(f"  Advanced (7-10): {len(groups['advanced'])} sentences")
+
+        # Generate files
+        print("\nStep 6: Generating JavaScript files...")
+        with metrics.stage(f'{lang} generate js') as stage:
+            generate_js_file(groups['beginner'], 'beginner', 'beginner_extended.js', lang)
+            generate_js_file(groups['intermediate'], 'intermediate', 'intermediate_extended.js', lang)
+            generate_js_file(groups['advanced'], 'advanced', 'advanced_extended.js', lang)
+            stage.rows = sum(len(group) for group in groups.values())
+
+    # The app's search index covers the Romanian-English sentences the app
+    # serves: the level files, read back the way build_sentence_index.py does
+    if 'eng' in languages:
+        # Imported here: the index builder pulls in the dictionary tooling
+        from build_sentence_index import build_sentence_index, load_level_sentences
+
+        print("\nStep 7: Building sentence search index...")
+        with metrics.stage('search index') as stage:
+            stats = build_sentence_index(load_level_sentences(DATA_DIR), search_dir=os.path.join(DATA_DIR, 'search'))
+            stage.rows = stats['sentences']
+        print(f"  {stats['sentences']} sentences, {stats['tokens']} tokens in {stats['shards']} shards")
+
+    if args.postgres and 'eng' in sentences_by_lang:
+        # Imported here: the loader needs psycopg, the default path does not
+        import load_postgres
+
+        print("\nStep 8: Loading sentences into Postgres...")
+        with metrics.stage('postgres') as stage:
+            with load_postgres.connect(args.postgres) as conn:
+                result = load_postgres.load_sentences(conn, sentences_by_lang['eng'])
+            stage.rows = result['rows']
+        load_postgres.report('content_sentences', result)
+        if args.external:
+            shutil.rmtree(english_dir, ignore_errors=True)
+
+    # Sampled builds write outside src/data
+    if not args.sample:
+        print(f"\n  Manifest: {artifacts.refresh()} entries updated")
 
     print("\n" + "=" * 60)
-    print("Done! Extended Tatoeba files have been generated.")
+    print(f"Done! Extended Tatoeba files have been generated{' in ' + DATA_DIR if args.sample else ''}.")
     print("=" * 60)
 
 if __name__ == '__main__':
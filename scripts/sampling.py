@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Deterministic Sampling
+
+Shared --sample/--seed options for quick builds while tuning heuristics
+(calculate_difficulty, the tiering in split_by_difficulty, ...).
+
+    import sampling
+
+    parser = argparse.ArgumentParser()
+    sampling.add_arguments(parser)
+    ...
+    keep = sampling.sampler(args.sample, args.seed)
+    rows = [row for row in rows if keep(row_key(row))]
+
+A key is kept when its seeded hash falls below the sample fraction, so the
+same fraction and seed always keep the same keys, a smaller fraction keeps
+a subset of a larger one, and the sample is uniform over keys (the
+difficulty distribution matches the full build's). Sampled builds write to
+scripts/temp/sample/<script>/, never to src/data.
+"""
+
+import argparse
+import hashlib
+import os
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
+SAMPLE_DIR = os.path.join(TEMP_DIR, "sample")
+
+DEFAULT_SEED = 0
+HASH_BYTES = 8
+
+
+def fraction(value):
+    """argparse type: a sample fraction in (0, 1]."""
+    try:
+        result = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a number: {value}")
+    if not 0 < result <= 1:
+        raise argparse.ArgumentTypeError(f"must be in (0, 1], got {value}")
+    return result
+
+
+def add_arguments(parser):
+    """Add --sample and --seed to an argparse parser."""
+    group = parser.add_argument_group('sampling')
+    group.add_argument('--sample', type=fraction, metavar='FRACTION',
+                       help="quick build from a stable sample of the source (e.g. 0.05) "
+                            "into scripts/temp/sample/")
+    group.add_argument('--seed', type=int, default=DEFAULT_SEED,
+                       help=f"sample seed (default: {DEFAULT_SEED})")
+    return parser
+
+
+def sampler(sample_fraction, seed=DEFAULT_SEED):
+    """
+    A keep(key) predicate for the fraction and seed. Keys are strings (or
+    anything whose str() is stable across runs).
+    """
+    threshold = int(sample_fraction * 2 ** (8 * HASH_BYTES))
+    salt = f"{seed}:".encode('utf-8')
+
+    def keep(key):
+        digest = hashlib.blake2b(salt + str(key).encode('utf-8'), digest_size=HASH_BYTES).digest()
+        return int.from_bytes(digest, 'big') < threshold
+
+    return keep
+
+
+def output_dir(script):
+    """Scratch output directory for a sampled build of `script`."""
+    path = os.path.join(SAMPLE_DIR, script)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def describe(sample_fraction, seed):
+    return f"{sample_fraction:.2%} sample, seed {seed}"
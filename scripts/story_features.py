@@ -0,0 +1,379 @@
+#!/usr/bin/env python3
+"""
+Vectorized Story Difficulty Features
+
+Batch feature extraction for story excerpts. Computes, for all excerpts at
+once with NumPy:
+- Sentence-length distribution (mean, 90th percentile, spread)
+- Mean word length and long-word ratio
+- Type/token ratio
+- Lexical rarity against word frequencies derived from the dictionary shards
+
+The features are mapped to the 1-10 difficulty scale and can be compared
+with the per-excerpt heuristic in process_rostories.calculate_difficulty.
+
+Requires: numpy
+
+Usage:
+    python scripts/story_features.py            # calibration report for stories.js
+    python scripts/process_rostories.py --difficulty features
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+
+import numpy as np
+
+import metrics
+
+from dictionary_shards import DICTIONARY_DIR, fold_diacritics, list_shards, read_shard
+from merge_stories import load_stories
+from process_rostories import calculate_difficulty, get_author_config
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+TEMP_DIR = os.path.join(SCRIPT_DIR, "temp")
+FREQUENCY_CACHE = os.path.join(TEMP_DIR, "dictionary_frequencies.json")
+REPORT_PATH = os.path.join(TEMP_DIR, "difficulty_calibration.json")
+
+# Letters only, so hyphenated clitics ("s-a", "într-o") split into their parts
+TOKEN_RE = re.compile(r"[^\W\d_]+")
+SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+# Separator between excerpts in the joined corpus. Contains a sentence end so
+# no sentence spans two excerpts, and no letters so no token does either.
+DOC_SEPARATOR = "\n.\n"
+
+LONG_WORD_LENGTH = 8
+
+# Reference (center, spread) per feature, calibrated on the stories.js corpus.
+# Fixed constants keep a story's score independent of the batch it is in.
+FEATURE_REFERENCE = {
+    'mean_sentence_length': (19.0, 9.0),
+    'p90_sentence_length': (30.0, 12.0),
+    'mean_word_length': (4.0, 0.3),
+    'long_word_ratio': (0.086, 0.032),
+    'type_token_ratio': (0.62, 0.055),
+    'rarity': (4.5, 0.1),
+}
+
+# How much each standardized feature moves the score away from the author baseline
+FEATURE_WEIGHTS = {
+    'mean_sentence_length': 0.4,
+    'p90_sentence_length': 0.2,
+    'mean_word_length': 0.3,
+    'long_word_ratio': 0.2,
+    'type_token_ratio': 0.2,
+    'rarity': 0.4,
+}
+
+# An excerpt sitting at the reference point scores one level above its author
+# baseline, matching the heuristic's typical adjustment for full-length excerpts
+REFERENCE_OFFSET = 1.0
+
+def _shard_signature(paths):
+    """Cheap fingerprint of the shard set used to invalidate the cache."""
+    return [[os.path.basename(p), os.path.getsize(p), int(os.path.getmtime(p))] for p in paths]
+
+
+def load_dictionary_frequencies(dictionary_dir=DICTIONARY_DIR, use_cache=True):
+    """
+    Derive word frequencies from the dictionary shards.
+
+    The shards carry no corpus counts, so every Romanian occurrence is counted
+    instead: headwords, inflected forms and the Romanian side of usage
+    examples. Common function words occur in thousands of examples, rare
+    literary words only as their own headword, which is the spread rarity
+    scoring needs. The result is cached under scripts/temp.
+    """
+    paths = list(list_shards(dictionary_dir).values())
+    signature = _shard_signature(paths)
+
+    if use_cache and os.path.exists(FREQUENCY_CACHE):
+        with open(FREQUENCY_CACHE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached.get('signature') == signature:
+            return cached['counts']
+
+    print("  Deriving word frequencies from dictionary shards...")
+    counts = {}
+    for path in paths:
+        for entry in read_shard(path):
+            texts = [entry.get('word', '')]
+            texts.extend(v for v in entry.get('forms', {}).values() if isinstance(v, str))
+            texts.extend(ex.get('ro') or '' for ex in entry.get('examples', []))
+            for text in texts:
+                for token in TOKEN_RE.findall(text):
+                    key = fold_diacritics(token)
+                    counts[key] = counts.get(key, 0) + 1
+
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    with open(FREQUENCY_CACHE, 'w', encoding='utf-8') as f:
+        json.dump({'signature': signature, 'counts': counts}, f, ensure_ascii=False)
+
+    print(f"    {len(counts)} distinct words from {len(paths)} shards")
+    return counts
+
+
+def _group_mean(values, groups, n_groups):
+    """Mean of values per group id; 0 for empty groups."""
+    totals = np.bincount(groups, weights=values, minlength=n_groups)
+    counts = np.bincount(groups, minlength=n_groups)
+    return np.divide(totals, counts, out=np.zeros(n_groups), where=counts > 0)
+
+
+def extract_features(texts, frequencies):
+    """
+    Compute difficulty features for all texts at once.
+
+    The excerpts are joined into one corpus and scanned with a single regex
+    pass for tokens and one for sentence ends; everything after that is array
+    arithmetic grouped by document and sentence ids.
+
+    Returns a dict of feature name -> float array (one value per text).
+    """
+    n_docs = len(texts)
+    corpus = DOC_SEPARATOR.join(texts)
+
+    doc_lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=n_docs)
+    doc_starts = np.concatenate(([0], np.cumsum(doc_lengths + len(DOC_SEPARATOR))[:-1]))
+
+    tokens = []
+    token_starts = []
+    for match in TOKEN_RE.finditer(corpus):
+        tokens.append(match.group())
+        token_starts.append(match.start())
+    token_starts = np.asarray(token_starts, dtype=np.int64)
+    n_tokens = len(tokens)
+
+    sentence_ends = np.fromiter(
+        (m.start() for m in SENTENCE_END_RE.finditer(corpus)), dtype=np.int64
+    )
+
+    doc_ids = np.searchsorted(doc_starts, token_starts, side='right') - 1
+    # Sentence ids are global: one boundary per terminator (the separator
+    # contributes one between documents, so sentences never cross excerpts)
+    sentence_ids = np.searchsorted(sentence_ends, token_starts, side='right')
+
+    # Sentence-length distribution per document
+    sentence_lengths = np.bincount(sentence_ids)
+    nonempty = np.flatnonzero(sentence_lengths)
+    sentence_doc = doc_ids[np.searchsorted(sentence_ids, nonempty)]
+    lengths = sentence_lengths[nonempty].astype(np.float64)
+
+    tokens_per_doc = np.bincount(doc_ids, minlength=n_docs)
+    sentences_per_doc = np.bincount(sentence_doc, minlength=n_docs)
+    mean_sentence_length = np.divide(
+        tokens_per_doc, sentences_per_doc,
+        out=np.zeros(n_docs), where=sentences_per_doc > 0
+    )
+    sq_mean = _group_mean(lengths ** 2, sentence_doc, n_docs)
+    sentence_length_std = np.sqrt(np.maximum(sq_mean - mean_sentence_length ** 2, 0))
+
+    # 90th percentile: sort sentences by (doc, length), index into each doc's run
+    order = np.lexsort((lengths, sentence_doc))
+    sorted_lengths = lengths[order]
+    run_starts = np.concatenate(([0], np.cumsum(sentences_per_doc)[:-1]))
+    p90_offset = np.floor(np.maximum(sentences_per_doc - 1, 0) * 0.9).astype(np.int64)
+    p90_sentence_length = np.zeros(n_docs)
+    has_sentences = sentences_per_doc > 0
+    p90_sentence_length[has_sentences] = sorted_lengths[
+        (run_starts + p90_offset)[has_sentences]
+    ]
+
+    # Word length
+    word_lengths = np.fromiter((len(t) for t in tokens), dtype=np.float64, count=n_tokens)
+    mean_word_length = _group_mean(word_lengths, doc_ids, n_docs)
+    long_word_ratio = _group_mean(
+        (word_lengths >= LONG_WORD_LENGTH).astype(np.float64), doc_ids, n_docs
+    )
+
+    # Type/token ratio over normalized tokens
+    folded = {}
+    normalized = np.array(
+        [folded.get(t) or folded.setdefault(t, fold_diacritics(t)) for t in tokens],
+        dtype=object
+    )
+    vocabulary, token_ids = np.unique(normalized, return_inverse=True) if n_tokens else (
+        np.array([], dtype=object), np.array([], dtype=np.int64))
+    doc_types = np.unique(doc_ids * len(vocabulary) + token_ids) // max(len(vocabulary), 1)
+    types_per_doc = np.bincount(doc_types, minlength=n_docs)
+    type_token_ratio = np.divide(
+        types_per_doc, tokens_per_doc,
+        out=np.zeros(n_docs), where=tokens_per_doc > 0
+    )
+
+    # Lexical rarity: -log10 relative frequency, unseen words count once
+    vocab_counts = np.fromiter(
+        (frequencies.get(w, 0) for w in vocabulary), dtype=np.float64, count=len(vocabulary)
+    )
+    total = max(sum(frequencies.values()), 1)
+    vocab_rarity = -np.log10((vocab_counts + 1) / total) if len(vocabulary) else vocab_counts
+    rarity = _group_mean(vocab_rarity[token_ids], doc_ids, n_docs)
+    oov_ratio = _group_mean((vocab_counts[token_ids] == 0).astype(np.float64), doc_ids, n_docs)
+
+    return {
+        'word_count': tokens_per_doc.astype(np.float64),
+        'sentence_count': sentences_per_doc.astype(np.float64),
+        'mean_sentence_length': mean_sentence_length,
+        'p90_sentence_length': p90_sentence_length.astype(np.float64),
+        'sentence_length_std': sentence_length_std,
+        'mean_word_length': mean_word_length,
+        'long_word_ratio': long_word_ratio,
+        'type_token_ratio': type_token_ratio,
+        'rarity': rarity,
+        'oov_ratio': oov_ratio,
+    }
+
+
+def score_features(features, author_bases):
+    """
+    Map features to the 1-10 scale.
+
+    Each weighted feature is standardized against FEATURE_REFERENCE and the
+    sum shifts the author baseline, so the author keeps the role it has in
+    the heuristic while the text itself decides the adjustment.
+    """
+    composite = np.zeros(len(author_bases))
+    for name, weight in FEATURE_WEIGHTS.items():
+        center, spread = FEATURE_REFERENCE[name]
+        composite += weight * (features[name] - center) / spread
+
+    scores = np.asarray(author_bases, dtype=np.float64) + REFERENCE_OFFSET + composite
+    return np.clip(np.rint(scores), 1, 10).astype(np.int64)
+
+
+def score_stories(stories, frequencies=None):
+    """
+    Score a list of story dicts (needing 'excerpt' and 'author').
+
+    Returns (difficulties, features) where difficulties is an int array.
+    """
+    if frequencies is None:
+        frequencies = load_dictionary_frequencies()
+    features = extract_features([s['excerpt'] for s in stories], frequencies)
+    author_bases = [get_author_config(s.get('author', ''))[0]['base_difficulty'] for s in stories]
+    return score_features(features, author_bases), features
+
+
+def _ranks(values):
+    """Average ranks (for Spearman correlation)."""
+    order = np.argsort(values, kind='mergesort')
+    ranks = np.empty(len(values), dtype=np.float64)
+    ranks[order] = np.arange(len(values), dtype=np.float64)
+    # Average tied ranks
+    _, inverse, counts = np.unique(values, return_inverse=True, return_counts=True)
+    sums = np.bincount(inverse, weights=ranks)
+    return sums[inverse] / counts[inverse]
+
+
+def _correlation(a, b):
+    if len(a) < 2 or np.std(a) == 0 or np.std(b) == 0:
+        return 0.0
+    return float(np.corrcoef(a, b)[0, 1])
+
+
+def calibration_report(stories, frequencies=None):
+    """Compare the vectorized scores with the per-excerpt heuristic."""
+    if frequencies is None:
+        frequencies = load_dictionary_frequencies()
+
+    start = time.perf_counter()
+    vectorized, features = score_stories(stories, frequencies)
+    vectorized_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    heuristic = np.array([
+        calculate_difficulty(s['excerpt'], get_author_config(s.get('author', ''))[0]['base_difficulty'])
+        for s in stories
+    ], dtype=np.int64)
+    heuristic_seconds = time.perf_counter() - start
+
+    diff = vectorized - heuristic
+    confusion = np.zeros((10, 10), dtype=np.int64)
+    np.add.at(confusion, (heuristic - 1, vectorized - 1), 1)
+
+    return {
+        'stories': len(stories),
+        'vectorized_seconds': round(vectorized_seconds, 4),
+        'heuristic_seconds': round(heuristic_seconds, 4),
+        'pearson': round(_correlation(heuristic, vectorized), 3),
+        'spearman': round(_correlation(_ranks(heuristic), _ranks(vectorized)), 3),
+        'exact_agreement': round(float(np.mean(diff == 0)), 3) if len(diff) else 0.0,
+        'within_one': round(float(np.mean(np.abs(diff) <= 1)), 3) if len(diff) else 0.0,
+        'mean_abs_diff': round(float(np.mean(np.abs(diff))), 3) if len(diff) else 0.0,
+        'mean_shift': round(float(np.mean(diff)), 3) if len(diff) else 0.0,
+        'heuristic_distribution': np.bincount(heuristic, minlength=11)[1:].tolist(),
+        'vectorized_distribution': np.bincount(vectorized, minlength=11)[1:].tolist(),
+        'confusion': confusion.tolist(),
+        'feature_means': {name: round(float(np.mean(v)), 3) for name, v in features.items()},
+    }
+
+
+def print_report(report):
+    """Print a calibration report."""
+    print(f"  Stories scored: {report['stories']}")
+    print(f"  Vectorized: {report['vectorized_seconds'] * 1000:.1f} ms, "
+          f"heuristic: {report['heuristic_seconds'] * 1000:.1f} ms")
+    print(f"  Pearson: {report['pearson']}, Spearman: {report['spearman']}")
+    print(f"  Exact agreement: {report['exact_agreement']:.1%}, "
+          f"within one level: {report['within_one']:.1%}")
+    print(f"  Mean |diff|: {report['mean_abs_diff']}, mean shift: {report['mean_shift']:+}")
+    print(f"\n  Difficulty  {'heuristic':>10} {'vectorized':>11}")
+    for level in range(10):
+        print(f"  {level + 1:>10}  {report['heuristic_distribution'][level]:>10} "
+              f"{report['vectorized_distribution'][level]:>11}")
+    print("\n  Confusion (rows: heuristic 1-10, columns: vectorized 1-10)")
+    for row in report['confusion']:
+        print("   " + " ".join(f"{n:>4}" for n in row))
+    print("\n  Feature means:")
+    for name, value in report['feature_means'].items():
+        print(f"    {name}: {value}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Calibrate vectorized story difficulty against the heuristic.")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'story_features')
+
+    print("=" * 60)
+    print("Story Difficulty Feature Calibration")
+    print("=" * 60)
+
+    with metrics.stage('load stories') as stage:
+        stories = list(load_stories().values())
+        stage.rows = len(stories)
+    if not stories:
+        print("\nNo stories found in stories.js")
+        sys.exit(1)
+
+    print("\nStep 1: Loading dictionary frequencies...")
+    with metrics.stage('load frequencies') as stage:
+        frequencies = load_dictionary_frequencies()
+        stage.rows = len(frequencies)
+
+    print(f"\nStep 2: Scoring {len(stories)} stories...")
+    with metrics.stage('score stories') as stage:
+        report = calibration_report(stories, frequencies)
+        stage.rows = len(stories)
+    print_report(report)
+
+    os.makedirs(TEMP_DIR, exist_ok=True)
+    with open(REPORT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    print("\n" + "=" * 60)
+    print(f"Done! Report written to {REPORT_PATH}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
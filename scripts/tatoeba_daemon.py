@@ -0,0 +1,429 @@
+#!/usr/bin/env python3
+"""
+Tatoeba Lookup Daemon
+
+Loads the Tatoeba exports once (load_ron_eng_pairs, load_audio_sentences,
+load_sentence_to_audio_map and the normalized-text table used by
+add_audio_to_existing.py) and answers JSON queries over localhost HTTP or a
+Unix socket, so maintenance runs and ad-hoc questions ("which Romanian
+sentences contain X and have audio?") skip the multi-minute decompress and
+parse.
+
+Endpoints (GET with query parameters, or POST a JSON object with the same
+keys for long id lists):
+
+    /health                              counts and load time
+    /pairs                               every pair as [ron_id, romanian, eng_id, english]
+    /sentence?id=123&id=456              sentences by Tatoeba id
+    /text?q=Bună ziua!                   sentences by normalized text
+    /audio?id=123                        sentence id → audio id (no ids: all)
+    /search?contains=casa&audio=1&min=2&max=4&limit=50
+    /sample?n=20&seed=7&audio=1          seeded sample of the filtered sentences
+
+`contains` matches whole words after normalization (no diacritics, case or
+punctuation); several words must all appear. Search results are ordered by
+difficulty, then sentence id.
+
+Usage:
+    python scripts/tatoeba_daemon.py                          # http://127.0.0.1:8765
+    python scripts/tatoeba_daemon.py --socket scripts/temp/tatoeba.sock
+    curl 'http://127.0.0.1:8765/search?contains=pisica&audio=1'
+    python scripts/fix_audio_urls.py --daemon http://127.0.0.1:8765
+    python scripts/add_audio_to_existing.py --daemon unix:scripts/temp/tatoeba.sock
+"""
+
+import argparse
+import bisect
+import http.client
+import json
+import os
+import random
+import socket
+import socketserver
+import sys
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import metrics
+import process_tatoeba
+from add_audio_to_existing import load_romanian_sentences, normalize_text
+from fix_audio_urls import load_sentence_to_audio_map
+from process_tatoeba import calculate_difficulty, load_audio_sentences, load_ron_eng_pairs
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+DEFAULT_ADDRESS = f"http://{DEFAULT_HOST}:{DEFAULT_PORT}"
+
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 10000
+
+
+class TatoebaIndex:
+    """In-memory lookups over the loaded Tatoeba data."""
+
+    def __init__(self, pairs, romanian, audio_ids, sentence_to_audio):
+        """
+        `pairs` comes from load_ron_eng_pairs, `romanian` (normalized text →
+        (id, text)) from load_romanian_sentences, `audio_ids` from
+        load_audio_sentences and `sentence_to_audio` from
+        load_sentence_to_audio_map.
+        """
+        self.pairs = pairs
+        self.audio_ids = audio_ids
+        self.sentence_to_audio = sentence_to_audio
+        self.sentences = {}
+        self.by_text = {}
+        self.words = {}
+        self.load_seconds = None
+
+        for normalized, (sentence_id, text) in romanian.items():
+            self._add(sentence_id, text, normalized)
+        for pair in pairs:
+            record = self.sentences.get(pair.ron_id)
+            if record is None:
+                record = self._add(pair.ron_id, pair.romanian, normalize_text(pair.romanian))
+            record['eng_id'] = pair.other_id
+            record['english'] = pair.translation
+
+        # Results come easiest first; difficulty ranges are bisected slices
+        self.order = sorted(self.sentences, key=self._sort_key)
+        self.audio_order = [i for i in self.order if self.sentences[i]['has_audio']]
+        self.levels = [self.sentences[i]['difficulty'] for i in self.order]
+        self.audio_levels = [self.sentences[i]['difficulty'] for i in self.audio_order]
+
+    def _sort_key(self, sentence_id):
+        return self.sentences[sentence_id]['difficulty'], int(sentence_id)
+
+    def _add(self, sentence_id, text, normalized):
+        record = {
+            'ron_id': sentence_id,
+            'romanian': text,
+            'eng_id': None,
+            'english': None,
+            'difficulty': calculate_difficulty(text),
+            'word_count': len(text.split()),
+            'has_audio': sentence_id in self.audio_ids,
+            'audio_id': self.sentence_to_audio.get(sentence_id),
+        }
+        self.sentences[sentence_id] = record
+        self.by_text.setdefault(normalized, sentence_id)
+        for word in set(normalized.split()):
+            self.words.setdefault(word, set()).add(sentence_id)
+        return record
+
+    @classmethod
+    def load(cls):
+        """Run the script loaders (downloading into scripts/temp if needed)."""
+        start = time.perf_counter()
+        process_tatoeba.ensure_dirs()
+        with metrics.stage('load pairs') as stage:
+            pairs = load_ron_eng_pairs()
+            stage.rows = len(pairs)
+        with metrics.stage('load romanian text') as stage:
+            romanian = load_romanian_sentences()
+            stage.rows = len(romanian)
+
+        ron_ids = {p.ron_id for p in pairs} | {sentence_id for sentence_id, _ in romanian.values()}
+        with metrics.stage('load audio'):
+            audio_ids = load_audio_sentences(ron_ids)
+            sentence_to_audio = load_sentence_to_audio_map(ron_ids)
+        with metrics.stage('build index') as stage:
+            index = cls(pairs, romanian, audio_ids, sentence_to_audio)
+            stage.rows = len(index.sentences)
+        index.load_seconds = round(time.perf_counter() - start, 2)
+        return index
+
+    def health(self):
+        return {
+            'pairs': len(self.pairs),
+            'sentences': len(self.sentences),
+            'with_audio': len(self.audio_ids),
+            'words': len(self.words),
+            'load_seconds': self.load_seconds,
+        }
+
+    def sentence(self, sentence_id):
+        return self.sentences.get(sentence_id)
+
+    def text(self, text):
+        sentence_id = self.by_text.get(normalize_text(text))
+        return self.sentences[sentence_id] if sentence_id else None
+
+    def audio(self, sentence_id):
+        return self.sentence_to_audio.get(sentence_id)
+
+    def filter(self, contains=None, audio=None, min_difficulty=None, max_difficulty=None):
+        """Ids (by difficulty, then id) of sentences matching every given filter."""
+        if not contains:
+            ids, levels = (self.audio_order, self.audio_levels) if audio else (self.order, self.levels)
+            lo = bisect.bisect_left(levels, min_difficulty) if min_difficulty is not None else 0
+            hi = bisect.bisect_right(levels, max_difficulty) if max_difficulty is not None else len(ids)
+            ids = ids[lo:hi]
+            if audio is False:
+                ids = [i for i in ids if not self.sentences[i]['has_audio']]
+            return ids
+
+        words = normalize_text(contains).split()
+        postings = [self.words.get(word, set()) for word in words]
+        if postings and audio:
+            postings.append(self.audio_ids)
+        postings.sort(key=len)
+        found = set.intersection(*postings) if postings else set()
+
+        result = []
+        for sentence_id in found:
+            record = self.sentences[sentence_id]
+            if audio is not None and record['has_audio'] != audio:
+                continue
+            if min_difficulty is not None and record['difficulty'] < min_difficulty:
+                continue
+            if max_difficulty is not None and record['difficulty'] > max_difficulty:
+                continue
+            result.append(sentence_id)
+        return sorted(result, key=self._sort_key)
+
+    def search(self, limit=DEFAULT_LIMIT, **filters):
+        ids = self.filter(**filters)
+        return {'count': len(ids), 'results': [self.sentences[i] for i in ids[:limit]]}
+
+    def sample(self, n, seed=0, **filters):
+        ids = self.filter(**filters)
+        chosen = random.Random(seed).sample(ids, min(n, len(ids)))
+        return {'count': len(ids), 'results': [self.sentences[i] for i in chosen]}
+
+
+def _first(params, name, convert=str, default=None):
+    values = params.get(name)
+    if not values:
+        return default
+    return convert(values[0])
+
+
+def _flag(value):
+    return str(value).lower() in ('1', 'true', 'yes')
+
+
+def _filters(params):
+    return {
+        'contains': _first(params, 'contains'),
+        'audio': _first(params, 'audio', _flag),
+        'min_difficulty': _first(params, 'min', int),
+        'max_difficulty': _first(params, 'max', int),
+    }
+
+
+def _by_key(values, lookup):
+    return {value: lookup(value) for value in values}
+
+
+ROUTES = {
+    '/health': lambda index, params: index.health(),
+    '/pairs': lambda index, params: index.pairs,
+    '/sentence': lambda index, params: _by_key(params.get('id', []), index.sentence),
+    '/text': lambda index, params: _by_key(params.get('q', []), index.text),
+    '/audio': lambda index, params: (_by_key(params['id'], index.audio) if params.get('id')
+                                     else index.sentence_to_audio),
+    '/search': lambda index, params: index.search(
+        min(_first(params, 'limit', int, DEFAULT_LIMIT), MAX_LIMIT), **_filters(params)),
+    '/sample': lambda index, params: index.sample(
+        min(_first(params, 'n', int, 10), MAX_LIMIT), _first(params, 'seed', int, 0), **_filters(params)),
+}
+
+
+class QueryHandler(BaseHTTPRequestHandler):
+    """Routes GET/POST requests to the server's TatoebaIndex."""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out in separate writes; Nagle would hold the body
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.respond(url.path, parse_qs(url.query))
+
+    def do_POST(self):
+        length = int(self.headers.get('Content-Length') or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b'{}')
+        except json.JSONDecodeError as e:
+            self.send_json(400, {'error': f"invalid JSON: {e}"})
+            return
+        params = {key: value if isinstance(value, list) else [value] for key, value in body.items()}
+        self.respond(urlsplit(self.path).path, params)
+
+    def respond(self, path, params):
+        route = ROUTES.get(path.rstrip('/') or '/health')
+        if route is None:
+            self.send_json(404, {'error': f"unknown endpoint {path}", 'endpoints': sorted(ROUTES)})
+            return
+        try:
+            params = {key: [str(v) for v in values] for key, values in params.items()}
+            self.send_json(200, route(self.server.index, params))
+        except ValueError as e:
+            self.send_json(400, {'error': str(e)})
+
+    def send_json(self, status, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def address_string(self):
+        # Unix socket peers have no address
+        return self.client_address[0] if self.client_address else 'unix'
+
+    def log_message(self, format, *args):
+        pass
+
+
+class UnixQueryHandler(QueryHandler):
+    disable_nagle_algorithm = False
+
+
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def make_server(index, host=DEFAULT_HOST, port=DEFAULT_PORT, socket_path=None):
+    """Create (but don't start) a server answering queries from `index`."""
+    if socket_path:
+        if os.path.exists(socket_path):
+            os.remove(socket_path)
+        server = UnixHTTPServer(socket_path, UnixQueryHandler)
+    else:
+        server = ThreadingHTTPServer((host, port), QueryHandler)
+        server.daemon_threads = True
+    server.index = index
+    return server
+
+
+class TCPHTTPConnection(http.client.HTTPConnection):
+    def connect(self):
+        super().connect()
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+
+class UnixHTTPConnection(http.client.HTTPConnection):
+    def __init__(self, path, timeout=None):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = path
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        if self.timeout is not None:
+            self.sock.settimeout(self.timeout)
+        self.sock.connect(self.socket_path)
+
+
+class TatoebaClient:
+    """
+    Client for a running daemon. `address` is "http://host:port" or
+    "unix:/path/to.sock". The connection is kept open between queries.
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, timeout=30):
+        self.address = address
+        self.timeout = timeout
+        self.connection = None
+
+    def _connect(self):
+        if self.address.startswith('unix:'):
+            return UnixHTTPConnection(self.address[len('unix:'):], self.timeout)
+        url = urlsplit(self.address if '//' in self.address else f"http://{self.address}")
+        return TCPHTTPConnection(url.hostname or DEFAULT_HOST, url.port or DEFAULT_PORT, timeout=self.timeout)
+
+    def query(self, endpoint, **params):
+        """POST `params` to an endpoint and return the decoded JSON."""
+        body = json.dumps({k: v for k, v in params.items() if v is not None}, ensure_ascii=False).encode('utf-8')
+        headers = {'Content-Type': 'application/json', 'Content-Length': str(len(body))}
+        for attempt in range(2):
+            if self.connection is None:
+                self.connection = self._connect()
+            try:
+                self.connection.request('POST', endpoint, body, headers)
+                response = self.connection.getresponse()
+                payload = json.loads(response.read())
+                break
+            except (ConnectionError, http.client.HTTPException):
+                # Stale keep-alive connection: reconnect once
+                self.close()
+                if attempt:
+                    raise
+        if response.status != 200:
+            raise RuntimeError(f"{endpoint}: {payload.get('error', response.status)}")
+        return payload
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def health(self):
+        return self.query('/health')
+
+    def pairs(self):
+        """The same list load_ron_eng_pairs() returns."""
+        return [process_tatoeba.Pair(*row) for row in self.query('/pairs')]
+
+    def sentences(self, ids):
+        return self.query('/sentence', id=list(ids))
+
+    def by_text(self, texts):
+        return self.query('/text', q=list(texts))
+
+    def audio_map(self, ids=None):
+        """sentence id → audio id, for `ids` or every Romanian sentence with audio."""
+        result = self.query('/audio', id=list(ids) if ids is not None else None)
+        return {sentence_id: audio_id for sentence_id, audio_id in result.items() if audio_id}
+
+    def search(self, contains=None, audio=None, min=None, max=None, limit=DEFAULT_LIMIT):
+        return self.query('/search', contains=contains, audio=audio, min=min, max=max, limit=limit)
+
+    def sample(self, n, seed=0, contains=None, audio=None, min=None, max=None):
+        return self.query('/sample', n=n, seed=seed, contains=contains, audio=audio, min=min, max=max)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Serve Tatoeba lookups from memory.")
+    parser.add_argument('--host', default=DEFAULT_HOST, help=f"HTTP host (default: {DEFAULT_HOST})")
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help=f"HTTP port (default: {DEFAULT_PORT})")
+    parser.add_argument('--socket', metavar='PATH', help="listen on a Unix socket instead of HTTP")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'tatoeba_daemon')
+
+    print("=" * 60)
+    print("Tatoeba Lookup Daemon")
+    print("=" * 60)
+
+    index = TatoebaIndex.load()
+    if not index.sentences:
+        print("\nError: No Tatoeba data loaded. Check your internet connection.")
+        sys.exit(1)
+
+    stats = index.health()
+    print(f"\n  {stats['sentences']} sentences ({stats['pairs']} pairs, {stats['with_audio']} with audio) "
+          f"loaded in {stats['load_seconds']}s")
+
+    server = make_server(index, args.host, args.port, args.socket)
+    address = f"unix:{args.socket}" if args.socket else f"http://{args.host}:{args.port}"
+    print(f"  Listening on {address} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n  Stopping")
+    finally:
+        server.server_close()
+        if args.socket and os.path.exists(args.socket):
+            os.remove(args.socket)
+
+
+if __name__ == '__main__':
+    main()
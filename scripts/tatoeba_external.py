@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+External-Memory Tatoeba Build
+
+process_tatoeba.py --external: the links join, the Romanian text dedupe
+and the tiering without holding the sentence exports, the links or the
+pair list in memory. Inputs are hash-partitioned into spill files under
+scripts/temp/spill/, each partition is joined and deduplicated on its own
+(--workers in parallel), and the surviving sentences stream into bounded
+per-level heaps.
+
+    exports -> partition by sentence id
+    1. per target partition:    attach each link's translation
+    2. per Romanian partition:  first link per (id, language), audio flag
+    3. per text partition:      first sentence per normalized text
+    -> TIER_SIZE-bounded level heaps, plus a sentence spill for --postgres
+
+"First" always means the lowest links.csv row, which is the order the
+in-memory join produces, so the output is identical to the default path.
+Like join_links(), this relies on sentence ids being unique across
+languages.
+
+--memory-budget sets the partition count: a partition's largest table
+(the target sentences) is sized to fit the budget split across workers.
+Partition counts are capped at MAX_PARTITIONS.
+"""
+
+import csv
+import heapq
+import math
+import multiprocessing
+import os
+import pickle
+import shutil
+import zlib
+from contextlib import contextmanager
+
+import metrics
+from process_tatoeba import PAIR_LANGUAGES, TIER_SIZE, TIERS, Sentence, calculate_difficulty
+
+# Records per pickled batch in a spill file
+SPILL_BATCH = 1024
+# Partition cap: joins write one file per (source, destination) partition
+MAX_PARTITIONS = 64
+# Rough in-memory size of a parsed table relative to the bytes it came from
+BZ2_EXPANSION = 3
+DICT_OVERHEAD = 4
+# Skip very long sentences (as join_links does)
+MAX_ROMANIAN_LENGTH = 500
+
+
+def part_of(key, parts):
+    """Partition of a key; stable across processes and runs."""
+    return zlib.crc32(key.encode('utf-8')) % parts
+
+
+def partition_count(paths, budget_mb, workers):
+    """Partitions needed for one worker's tables to fit its share of the budget."""
+    table_bytes = sum(
+        os.path.getsize(path) * (BZ2_EXPANSION if path.endswith('.bz2') else 1) * DICT_OVERHEAD
+        for path in paths if os.path.exists(path)
+    )
+    per_worker = budget_mb * 2**20 / max(workers, 1)
+    return max(1, min(MAX_PARTITIONS, math.ceil(table_bytes / per_worker)))
+
+
+class SpillWriter:
+    """Buffered, pickled record batches, one file per partition."""
+
+    def __init__(self, pattern, parts):
+        self.pattern = pattern
+        self.buffers = [[] for _ in range(parts)]
+        self.files = {}
+
+    def add(self, part, record):
+        buffer = self.buffers[part]
+        buffer.append(record)
+        if len(buffer) >= SPILL_BATCH:
+            self._flush(part)
+
+    def _flush(self, part):
+        f = self.files.get(part)
+        if f is None:
+            f = self.files[part] = open(self.pattern.format(part=part), 'wb')
+        pickle.dump(self.buffers[part], f, protocol=pickle.HIGHEST_PROTOCOL)
+        self.buffers[part] = []
+
+    def close(self):
+        for part, buffer in enumerate(self.buffers):
+            if buffer:
+                self._flush(part)
+        for f in self.files.values():
+            f.close()
+
+
+def read_spill(path):
+    """Records of a spill file, in write order (nothing if it doesn't exist)."""
+    if not os.path.exists(path):
+        return
+    with open(path, 'rb') as f:
+        while True:
+            try:
+                batch = pickle.load(f)
+            except EOFError:
+                return
+            yield from batch
+
+
+@contextmanager
+def spill_dir(temp_dir):
+    """A fresh spill directory under temp_dir/spill, removed afterwards."""
+    path = os.path.join(temp_dir, 'spill', f"tatoeba-{os.getpid()}")
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path)
+    try:
+        yield path
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def read_export(path, label):
+    """(id, text) rows of a per-language sentence export, as parse_sentences() reads them."""
+    import bz2
+
+    with open(path, 'rb') as raw, bz2.open(raw, 'rt', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        for row in metrics.progress(reader, f'{label} sentences', position=metrics.file_position(raw, path)):
+            if len(row) >= 3 and row[2].strip():
+                yield row[0], row[2].strip()
+
+
+def partition_inputs(spill, parts, ron_path, target_paths, links_path, audio_path, keep=None):
+    """
+    Pass 0: spread the exports over `parts` partitions by sentence id.
+    Each link is written twice, once under each end, keyed by the end that
+    may be the translation. Returns the number of Romanian sentences kept.
+    """
+    romanian = SpillWriter(os.path.join(spill, 'ron-{part}'), parts)
+    kept = 0
+    for sentence_id, text in read_export(ron_path, 'Romanian'):
+        # Long sentences never pair, so drop them before the join
+        if len(text) <= MAX_ROMANIAN_LENGTH and (keep is None or keep(sentence_id)):
+            romanian.add(part_of(sentence_id, parts), (sentence_id, text))
+            kept += 1
+    romanian.close()
+
+    # Languages in --pairs order: a later language wins an id, as in join_links
+    targets = SpillWriter(os.path.join(spill, 'target-{part}'), parts)
+    for lang, path in target_paths.items():
+        for sentence_id, text in read_export(path, PAIR_LANGUAGES[lang].capitalize()):
+            targets.add(part_of(sentence_id, parts), (sentence_id, lang, text))
+    targets.close()
+
+    audio = SpillWriter(os.path.join(spill, 'audio-{part}'), parts)
+    if audio_path and os.path.exists(audio_path):
+        with open(audio_path, 'r', encoding='utf-8') as f:
+            for row in metrics.progress(csv.reader(f, delimiter='\t'), 'audio rows'):
+                if len(row) >= 2:
+                    audio.add(part_of(row[1], parts), row[1])
+    audio.close()
+
+    links = SpillWriter(os.path.join(spill, 'links-{part}'), parts)
+    with open(links_path, 'r', encoding='utf-8') as f:
+        reader = csv.reader(f, delimiter='\t')
+        for row_number, row in enumerate(metrics.progress(
+                reader, 'links', position=metrics.file_position(f.buffer, links_path))):
+            if len(row) >= 2:
+                first, second = row[0], row[1]
+                links.add(part_of(second, parts), (second, first, row_number))
+                links.add(part_of(first, parts), (first, second, row_number))
+    links.close()
+    return kept
+
+
+def join_targets(spill, parts, part):
+    """
+    Pass 1 for one partition: links whose translation end is a target
+    sentence here, with that sentence's language and text, repartitioned
+    by the Romanian end. Returns the number of candidates written.
+    """
+    targets = {sentence_id: (lang, text)
+               for sentence_id, lang, text in read_spill(os.path.join(spill, f'target-{part}'))}
+    out = SpillWriter(os.path.join(spill, f'joined-{{part}}-{part}'), parts)
+    written = 0
+    for other_id, ron_id, row_number in read_spill(os.path.join(spill, f'links-{part}')):
+        target = targets.get(other_id)
+        if target is not None:
+            out.add(part_of(ron_id, parts), (ron_id, target[0], row_number, other_id, target[1]))
+            written += 1
+    out.close()
+    return written
+
+
+def join_romanian(spill, parts, part):
+    """
+    Pass 2 for one partition: the first link per (Romanian id, language)
+    whose Romanian end is here, with its text and audio flag, repartitioned
+    by normalized Romanian text. Returns {lang: pairs}.
+    """
+    romanian = dict(read_spill(os.path.join(spill, f'ron-{part}')))
+    audio_ids = set(read_spill(os.path.join(spill, f'audio-{part}')))
+    first = {}
+    for source in range(parts):
+        for ron_id, lang, row_number, other_id, translation in read_spill(
+                os.path.join(spill, f'joined-{part}-{source}')):
+            if ron_id in romanian:
+                key = (ron_id, lang)
+                best = first.get(key)
+                if best is None or row_number < best[0]:
+                    first[key] = (row_number, translation)
+
+    out = SpillWriter(os.path.join(spill, f'text-{{part}}-{part}'), parts)
+    counts = {}
+    for (ron_id, lang), (row_number, translation) in first.items():
+        text = romanian[ron_id]
+        normalized = text.lower().strip()
+        out.add(part_of(normalized, parts),
+                (lang, normalized, row_number, ron_id, text, translation, ron_id in audio_ids))
+        counts[lang] = counts.get(lang, 0) + 1
+    out.close()
+    return counts
+
+
+def tier_key(sentence, row_number):
+    """split_by_difficulty()'s order: audio first, easiest, shortest, then pair order."""
+    return (not sentence.has_audio, sentence.difficulty, sentence.word_count, row_number)
+
+
+def level_of(difficulty):
+    for level, low, high in TIERS:
+        if low <= difficulty <= high:
+            return level
+    return None
+
+
+def dedupe_texts(spill, parts, part):
+    """
+    Pass 3 for one partition: the first sentence per (language, normalized
+    text), processed as process_sentences() does. Every sentence goes to a
+    per-language spill; only each level's TIER_SIZE best are returned, as
+    {lang: {'count': n, 'levels': {level: [(key, Sentence)]}}}.
+    """
+    first = {}
+    for source in range(parts):
+        for record in read_spill(os.path.join(spill, f'text-{part}-{source}')):
+            key = (record[0], record[1])
+            best = first.get(key)
+            if best is None or record[2] < best[2]:
+                first[key] = record
+
+    writers = {}
+    results = {}
+    for lang, _, row_number, ron_id, romanian, translation, has_audio in first.values():
+        sentence = Sentence(
+            id=f'tat-{ron_id}',
+            romanian=romanian,
+            translation=translation,
+            difficulty=calculate_difficulty(romanian),
+            word_count=len(romanian.split()),
+            has_audio=has_audio,
+            audio_url=f"https://audio.tatoeba.org/sentences/ron/{ron_id}.mp3" if has_audio else None,
+        )
+        if lang not in writers:
+            writers[lang] = SpillWriter(os.path.join(spill, f'sentences-{lang}-{{part}}'), parts)
+            results[lang] = {'count': 0, 'levels': {level: [] for level, _, _ in TIERS}}
+        writers[lang].add(part, sentence)
+        results[lang]['count'] += 1
+
+        level = level_of(sentence.difficulty)
+        if level is not None:
+            # Max-heap of the best TIER_SIZE by negated key
+            heap = results[lang]['levels'][level]
+            entry = (tuple(-value for value in tier_key(sentence, row_number)), sentence)
+            if len(heap) < TIER_SIZE:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    for writer in writers.values():
+        writer.close()
+    for result in results.values():
+        for level, heap in result['levels'].items():
+            result['levels'][level] = [(tuple(-value for value in key), sentence) for key, sentence in heap]
+    return results
+
+
+def _run_pass(args):
+    function, spill, parts, part = args
+    return function(spill, parts, part)
+
+
+def run_partitions(function, spill, parts, workers):
+    """Apply a pass to every partition, in a process pool when workers > 1."""
+    jobs = [(function, spill, parts, part) for part in range(parts)]
+    if workers <= 1 or parts == 1:
+        return [_run_pass(job) for job in jobs]
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('fork' if 'fork' in methods else None)
+    with context.Pool(min(workers, parts)) as pool:
+        return pool.map(_run_pass, jobs)
+
+
+def build(spill, ron_path, target_paths, links_path, audio_path, budget_mb, workers=1, keep=None):
+    """
+    Join, dedupe and tier in external memory. Returns
+    {lang: {'pairs': n, 'count': n, 'groups': {level: [Sentence]}}}, the
+    same groups split_by_difficulty() would return for the in-memory build.
+    """
+    sources = [ron_path, *target_paths.values()]
+    parts = partition_count(sources, budget_mb, workers)
+    print(f"  {parts} partitions for a {budget_mb} MB budget across {workers} worker(s)")
+
+    with metrics.stage('partition inputs'):
+        kept = partition_inputs(spill, parts, ron_path, target_paths, links_path, audio_path, keep)
+    print(f"    {kept} Romanian sentences partitioned")
+
+    with metrics.stage('join targets') as stage:
+        stage.rows = sum(run_partitions(join_targets, spill, parts, workers))
+
+    with metrics.stage('join romanian') as stage:
+        pair_counts = {lang: 0 for lang in target_paths}
+        for counts in run_partitions(join_romanian, spill, parts, workers):
+            for lang, n in counts.items():
+                pair_counts[lang] += n
+        stage.rows = sum(pair_counts.values())
+
+    with metrics.stage('dedupe texts') as stage:
+        results = {lang: {'pairs': pair_counts[lang], 'count': 0, 'groups': {}} for lang in target_paths}
+        candidates = {lang: {level: [] for level, _, _ in TIERS} for lang in target_paths}
+        for partial in run_partitions(dedupe_texts, spill, parts, workers):
+            for lang, result in partial.items():
+                results[lang]['count'] += result['count']
+                for level, entries in result['levels'].items():
+                    candidates[lang][level].extend(entries)
+        for lang, levels in candidates.items():
+            for level, entries in levels.items():
+                best = heapq.nsmallest(TIER_SIZE, entries, key=lambda entry: entry[0])
+                results[lang]['groups'][level] = [sentence for _, sentence in best]
+        stage.rows = sum(result['count'] for result in results.values())
+
+    for lang, result in results.items():
+        print(f"  Found {result['pairs']} Romanian-{PAIR_LANGUAGES[lang].capitalize()} pairs, "
+              f"{result['count']} unique sentences")
+    return results
+
+
+def iter_sentences(spill, lang):
+    """Every processed sentence of a language from the last build() in `spill`."""
+    prefix = f'sentences-{lang}-'
+    for name in sorted(os.listdir(spill)):
+        if name.startswith(prefix):
+            yield from read_spill(os.path.join(spill, name))
+
+
+def keep_sentences(spill, lang, out_dir):
+    """
+    Move a language's sentence spill files out of `spill` so they outlive
+    it; read them back with iter_sentences(out_dir, lang).
+    """
+    shutil.rmtree(out_dir, ignore_errors=True)
+    os.makedirs(out_dir)
+    prefix = f'sentences-{lang}-'
+    for name in os.listdir(spill):
+        if name.startswith(prefix):
+            os.replace(os.path.join(spill, name), os.path.join(out_dir, name))
+    return out_dir
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Story Tokenizer
+
+Tokenizes every story excerpt once at build time and writes a compact
+per-story sidecar to src/data/story-tokens/<story-id>.json:
+
+{
+  "length": 1234,                        // excerpt length the offsets refer to
+  "keys":   ["era", "odata", ...],       // lookup keys (the lemma for inflected forms)
+  "shards": ["e", "o", null, ...],       // dictionary shard per key (null: not in dictionary)
+  "tokens": [start, end, key, ...],      // flat triples, offsets into the excerpt
+  "paragraphs": [start, end, ...]        // flat pairs, offsets into the excerpt
+}
+
+StoryReader renders words from the sidecar and a tapped word costs a single
+shard fetch (or none, when the word isn't in the dictionary).
+
+Usage:
+    python scripts/tokenize_stories.py
+"""
+
+import argparse
+import json
+import os
+import re
+
+import artifacts
+import metrics
+from build_form_index import collect_forms
+from dictionary_shards import build_word_to_shard, fold_diacritics
+from merge_stories import load_stories
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_DIR = os.path.dirname(SCRIPT_DIR)
+TOKENS_DIR = os.path.join(PROJECT_DIR, "src", "data", "story-tokens")
+
+# A word is a run of letters, keeping internal hyphens and apostrophes so
+# clitic forms like "s-a" or "într-o" reach the dictionary whole
+WORD_RE = re.compile(r"[^\W\d_]+(?:[-'’][^\W\d_]+)*")
+PART_SPLIT_RE = re.compile(r"[-'’]")
+PARAGRAPH_RE = re.compile(r"\n\s*\n")
+
+
+def resolve_key(word, word_to_shard, forms=None):
+    """
+    Resolve a surface word to (lookup_key, shard).
+
+    Mirrors the app's lookup order: lowercase first, then without
+    diacritics, then through the inflected form index to the lemma
+    (preferring a form with the exact spelling). Words missing from the
+    dictionary keep their lowercase key and a null shard so the app can
+    skip the fetch.
+    """
+    key = word.lower()
+    if key in word_to_shard:
+        return key, word_to_shard[key]
+    folded = fold_diacritics(key)
+    if folded in word_to_shard:
+        return folded, word_to_shard[folded]
+    candidates = sorted(forms.get(folded, ()), key=lambda c: c[0] != key) if forms else ()
+    for _, lemma in candidates:
+        if lemma.lower() in word_to_shard:
+            return lemma.lower(), word_to_shard[lemma.lower()]
+    return key, None
+
+
+def paragraph_spans(text):
+    """Return (start, end) for each non-blank paragraph (split on blank lines)."""
+    spans = []
+    start = 0
+    for match in PARAGRAPH_RE.finditer(text):
+        if text[start:match.start()].strip():
+            spans.append((start, match.start()))
+        start = match.end()
+    if text[start:].strip():
+        spans.append((start, len(text)))
+    return spans
+
+
+def word_spans(text, word_to_shard, resolved, forms=None):
+    """
+    Yield (start, end) of each word, resolving keys into `resolved`.
+
+    Hyphenated words the dictionary doesn't know ("s-a", "sa-i") are split
+    into their parts so each part can still be looked up.
+    """
+    for match in WORD_RE.finditer(text):
+        word = match.group()
+        if word not in resolved:
+            resolved[word] = resolve_key(word, word_to_shard, forms)
+        if resolved[word][1] is not None or not PART_SPLIT_RE.search(word):
+            yield match.start(), match.end()
+            continue
+
+        offset = match.start()
+        for part in PART_SPLIT_RE.split(word):
+            if part not in resolved:
+                resolved[part] = resolve_key(part, word_to_shard, forms)
+            yield offset, offset + len(part)
+            offset += len(part) + 1
+
+
+def js_offset_map(text):
+    """
+    Map Python string offsets to JS (UTF-16) offsets.
+
+    Returns None when the text has no characters outside the BMP, which is
+    the common case and means the offsets already agree.
+    """
+    if all(ord(c) <= 0xFFFF for c in text):
+        return None
+    offsets = [0]
+    for c in text:
+        offsets.append(offsets[-1] + (2 if ord(c) > 0xFFFF else 1))
+    return offsets
+
+
+def tokenize_excerpt(text, word_to_shard, resolved=None, forms=None):
+    """Build the sidecar structure for one excerpt."""
+    if resolved is None:
+        resolved = {}
+
+    keys = []
+    shards = []
+    key_ids = {}
+    tokens = []
+
+    for start, end in word_spans(text, word_to_shard, resolved, forms):
+        key, shard = resolved[text[start:end]]
+        if key not in key_ids:
+            key_ids[key] = len(keys)
+            keys.append(key)
+            shards.append(shard)
+        tokens.extend((start, end, key_ids[key]))
+
+    paragraphs = []
+    for start, end in paragraph_spans(text):
+        paragraphs.extend((start, end))
+
+    # The app slices with JS string offsets (UTF-16 code units)
+    to_js = js_offset_map(text)
+    if to_js is not None:
+        tokens = [to_js[v] if i % 3 != 2 else v for i, v in enumerate(tokens)]
+        paragraphs = [to_js[v] for v in paragraphs]
+
+    return {
+        'length': len(text.encode('utf-16-le')) // 2,
+        'keys': keys,
+        'shards': shards,
+        'tokens': tokens,
+        'paragraphs': paragraphs,
+    }
+
+
+@artifacts.batch()
+def write_sidecars(stories, word_to_shard, forms=None, tokens_dir=TOKENS_DIR):
+    """Write one sidecar per story, removing sidecars of deleted stories."""
+    os.makedirs(tokens_dir, exist_ok=True)
+
+    resolved = {}
+    stats = {'stories': 0, 'tokens': 0, 'in_dictionary': 0, 'bytes': 0}
+
+    for story in stories.values():
+        sidecar = tokenize_excerpt(story['excerpt'], word_to_shard, resolved, forms)
+        content = json.dumps(sidecar, ensure_ascii=False, separators=(',', ':'))
+        artifacts.write_text(os.path.join(tokens_dir, f"{story['id']}.json"), content + '\n')
+
+        token_keys = sidecar['tokens'][2::3]
+        stats['stories'] += 1
+        stats['tokens'] += len(token_keys)
+        stats['in_dictionary'] += sum(1 for k in token_keys if sidecar['shards'][k] is not None)
+        stats['bytes'] += len(content.encode('utf-8')) + 1
+
+    for name in os.listdir(tokens_dir):
+        if name.endswith('.json') and name[:-5] not in stories:
+            os.remove(os.path.join(tokens_dir, name))
+
+    return stats
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Write per-story token sidecars for tap-to-translate.")
+    metrics.add_arguments(parser)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    metrics.configure(args, 'tokenize_stories')
+
+    print("=" * 60)
+    print("Story Tokenizer")
+    print("=" * 60)
+
+    print("\nStep 1: Loading stories, dictionary headwords and forms...")
+    with metrics.stage('load stories') as stage:
+        stories = load_stories()
+        stage.rows = len(stories)
+    with metrics.stage('load headwords') as stage:
+        word_to_shard = build_word_to_shard()
+        stage.rows = len(word_to_shard)
+    with metrics.stage('load forms') as stage:
+        forms = collect_forms()
+        stage.rows = len(forms)
+    print(f"  {len(stories)} stories, {len(word_to_shard)} headwords, {len(forms)} inflected forms")
+
+    print("\nStep 2: Writing token sidecars...")
+    with metrics.stage('write sidecars') as stage:
+        stats = write_sidecars(stories, word_to_shard, forms)
+        stage.rows = stats['tokens']
+    coverage = stats['in_dictionary'] / max(stats['tokens'], 1)
+    print(f"  {stats['stories']} sidecars, {stats['tokens']} tokens "
+          f"({coverage:.1%} resolve to a dictionary shard)")
+    print(f"  Total size: {stats['bytes'] / 1024:.1f}KB")
+
+    print(f"\n  Manifest: {artifacts.refresh()} entries updated")
+
+    print("\n" + "=" * 60)
+    print(f"Done! Sidecars written to {TOKENS_DIR}")
+    print("=" * 60)
+
+
+if __name__ == '__main__':
+    main()
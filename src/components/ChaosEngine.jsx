@@ -1,4 +1,4 @@
-import React, { useState, useCallback, useMemo } from 'react';
+import React, { useState, useCallback, useMemo, useRef } from 'react';
 import { Shuffle, Clock, Sparkles, ArrowRight, X, Video, ChefHat } from 'lucide-react';
 import ContentEmbed from './ContentEmbed';
 import RecipeCard from './RecipeCard';
@@ -6,6 +6,7 @@ import Timer from './Timer';
 import { useTimer } from '../hooks/useStorage';
 import { getContentBySessionType, getRandomContent, CONTENT_DATABASE } from '../data/content';
 import { getRandomRecipe, ROMANIAN_RECIPES } from '../data/recipes';
+import { loadDeck } from '../data/decks';
 import { useDifficulty } from '../contexts/DifficultyContext';
 import { filterContentByLevel } from '../utils/difficulty';
 import DifficultyToggle from './DifficultyToggle';
@@ -23,6 +24,7 @@ export default function ChaosEngineView({ updateStats }) {
   const [sessionState, setSessionState] = useState('setup'); // 'setup' | 'active' | 'reflection'
   const [reflection, setReflection] = useState('');
   const [mode, setMode] = useState('media'); // 'media' | 'recipe'
+  const deckRef = useRef(null);
 
   // Difficulty context
   const { getEffectiveLevel, recordSession } = useDifficulty();
@@ -54,10 +56,18 @@ export default function ChaosEngineView({ updateStats }) {
 
   const timer = useTimer(sessionDuration, handleSessionComplete);
 
-  const startSession = () => {
+  // Recipes from this session's deck pack, falling back to the level-filtered list
+  const pickRecipe = () => {
+    const ids = new Set((deckRef.current?.recipes || []).map((r) => r.id));
+    const fromDeck = ROMANIAN_RECIPES.filter((r) => ids.has(r.id));
+    const pool = fromDeck.length > 0 ? fromDeck : filteredRecipes;
+    return pool[Math.floor(Math.random() * pool.length)];
+  };
+
+  const startSession = async () => {
     if (mode === 'recipe') {
-      const pool = filteredRecipes;
-      setCurrentRecipe(pool[Math.floor(Math.random() * pool.length)]);
+      deckRef.current = await loadDeck(effectiveLevel).catch(() => null);
+      setCurrentRecipe(pickRecipe());
     } else {
       const pool = filteredChaosContent;
       setCurrentContent(pool[Math.floor(Math.random() * pool.length)]);
@@ -68,8 +78,7 @@ export default function ChaosEngineView({ updateStats }) {
 
   const shuffleContent = () => {
     if (mode === 'recipe') {
-      const pool = filteredRecipes;
-      setCurrentRecipe(pool[Math.floor(Math.random() * pool.length)]);
+      setCurrentRecipe(pickRecipe());
     } else {
       const pool = filteredChaosContent;
       setCurrentContent(pool[Math.floor(Math.random() * pool.length)]);
@@ -97,6 +106,7 @@ export default function ChaosEngineView({ updateStats }) {
     setSessionState('setup');
     setCurrentContent(null);
     setCurrentRecipe(null);
+    deckRef.current = null;
     timer.reset();
   };
 
@@ -2,6 +2,7 @@ import React, { useState, useRef, useCallback, useMemo } from 'react';
 import { Flower2, Check, X, ArrowRight, RotateCcw, Sparkles, BookOpen, MessageSquare, Trash2, ChevronDown, ChevronUp, Volume2, Loader2, Flame, Zap } from 'lucide-react';
 import { getWeightedRandomVocab, VOCABULARY_DATABASE } from '../data/vocabulary';
 import { getRandomSentence, TATOEBA_BEGINNER, TATOEBA_INTERMEDIATE, TATOEBA_ADVANCED } from '../data/tatoeba';
+import { loadDeck } from '../data/decks';
 import { useDifficulty } from '../contexts/DifficultyContext';
 import { filterContentByLevel, normalizeDifficulty } from '../utils/difficulty';
 import DifficultyToggle from './DifficultyToggle';
@@ -102,6 +103,8 @@ export default function ErrorGardenView({ updateStats, errors, setErrors }) {
   const [showEncouragement, setShowEncouragement] = useState(false);
   const [showDefinition, setShowDefinition] = useState(false);
   const inputRef = useRef(null);
+  // Unseen sentences from this session's deck pack
+  const deckRef = useRef([]);
 
   // Difficulty context
   const { getEffectiveLevel, recordAttempt } = useDifficulty();
@@ -181,7 +184,9 @@ export default function ErrorGardenView({ updateStats, errors, setErrors }) {
     setErrors((prev) => prev.filter((e) => e.ro !== ro));
   };
 
-  const startSession = () => {
+  const startSession = async () => {
+    const deck = await loadDeck(effectiveLevel).catch(() => null);
+    deckRef.current = deck ? [...deck.sentences] : [];
     setSessionActive(true);
     setCardsReviewed(0);
     setStreak(0);
@@ -196,9 +201,9 @@ export default function ErrorGardenView({ updateStats, errors, setErrors }) {
 
     let nextItem;
     if (mode === 'sentences') {
-      // Use level-filtered sentences
+      // Deal from the deck pack (pre-shuffled), then fall back to level-filtered sentences
       const pool = filteredSentences.length > 0 ? filteredSentences : ALL_SENTENCES;
-      nextItem = getRandomSentence(pool);
+      nextItem = deckRef.current.pop() || getRandomSentence(pool);
     } else {
       // 50% chance to use error word, otherwise use level-filtered vocab
       if (errors.length > 0 && Math.random() > 0.5) {
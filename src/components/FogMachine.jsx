@@ -6,7 +6,8 @@ import VideoSearch from './VideoSearch';
 import TranscriptPlayer from './TranscriptPlayer';
 import { formatTime } from '../hooks/useStorage';
 import { getRandomContent, getContentByDifficulty, CONTENT_DATABASE } from '../data/content';
-import { getRandomStory, ROMANIAN_STORIES } from '../data/stories';
+import { getRandomStory, STORY_INDEX } from '../data/story-chunks';
+import { loadDeck } from '../data/decks';
 import { TATOEBA_BEGINNER, TATOEBA_INTERMEDIATE, TATOEBA_ADVANCED } from '../data/tatoeba';
 import { useDifficulty } from '../contexts/DifficultyContext';
 import { getDifficultyLabel, filterContentByLevel } from '../utils/difficulty';
@@ -24,6 +25,7 @@ export default function FogMachineView({ updateStats }) {
   const [timeInFog, setTimeInFog] = useState(0);
   const [isRunning, setIsRunning] = useState(false);
   const [mode, setMode] = useState('media'); // 'media' | 'reading' | 'search'
+  const [deck, setDeck] = useState(null); // this session's deck pack, if it loaded
   const [userVideos, setUserVideos] = useState(() => {
     try {
       const saved = localStorage.getItem(USER_VIDEOS_KEY);
@@ -54,11 +56,13 @@ export default function FogMachineView({ updateStats }) {
 
   // Create captions from sentences for TranscriptPlayer
   const transcriptCaptions = useMemo(() => {
-    // Get a random subset of sentences (20 for a session)
-    const shuffled = [...filteredSentences].sort(() => Math.random() - 0.5);
+    // The deck pack's sentences (already shuffled), else a random subset (20 for a session)
+    const shuffled = deck?.sentences.length
+      ? deck.sentences
+      : [...filteredSentences].sort(() => Math.random() - 0.5);
     const selected = shuffled.slice(0, 20);
     return createCaptionsFromSentences(selected, 6); // 6 seconds per sentence
-  }, [filteredSentences]);
+  }, [deck, filteredSentences]);
 
   // Get set of added video IDs for VideoSearch
   const addedVideoIds = new Set([
@@ -101,21 +105,27 @@ export default function FogMachineView({ updateStats }) {
       : getRandomContent((c) => c.sessionTypes.includes('fog_session'));
   }, [fogLevel, allContent]);
 
-  const getFogStory = useCallback(() => {
-    // Get stories matching fog level (within 2 levels)
-    return getRandomStory((s) =>
+  const getFogStory = useCallback((pack = deck) => {
+    // Prefer the deck pack's stories, else any story within 2 levels of the fog level
+    const ids = new Set((pack?.stories || []).map((s) => s.id));
+    return getRandomStory((s) => ids.has(s.id)) || getRandomStory((s) =>
       s.difficulty >= fogLevel - 2 && s.difficulty <= fogLevel + 2
     ) || getRandomStory();
-  }, [fogLevel]);
+  }, [deck, fogLevel]);
 
-  // Filter stories by difficulty for navigation
-  const filteredStories = ROMANIAN_STORIES.filter(
+  // Filter stories by difficulty for navigation (metadata only; StoryReader loads the text)
+  const filteredStories = STORY_INDEX.filter(
     s => s.difficulty >= fogLevel - 2 && s.difficulty <= fogLevel + 2
   );
 
-  const startSession = () => {
+  const startSession = async () => {
+    let pack = null;
+    if (mode === 'reading' || mode === 'transcript') {
+      pack = await loadDeck(fogLevel).catch(() => null);
+      setDeck(pack);
+    }
     if (mode === 'reading') {
-      const story = getFogStory();
+      const story = getFogStory(pack);
       const index = filteredStories.findIndex(s => s.id === story.id);
       setCurrentStory(story);
       setStoryIndex(index >= 0 ? index : 0);
@@ -161,6 +171,7 @@ export default function FogMachineView({ updateStats }) {
     setSessionActive(false);
     setCurrentContent(null);
     setCurrentStory(null);
+    setDeck(null);
     setTimeInFog(0);
   };
 
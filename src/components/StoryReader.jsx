@@ -7,14 +7,27 @@
  * - Word selection for lookup
  * - Difficulty indicator
  * - Genre and author info
+ *
+ * Accepts either a full story or an entry from the story index; the
+ * excerpt is loaded on demand when it isn't present. Words come from the
+ * build-time token sidecar (scripts/tokenize_stories.py) when one exists,
+ * so a lookup goes straight to the right dictionary shard.
  */
 
-import React, { useState, useCallback } from 'react';
+import React, { useState, useCallback, useEffect, useMemo } from 'react';
 import { Book, User, Tag, ChevronLeft, ChevronRight, Eye, EyeOff } from 'lucide-react';
 import { getDifficultyLabel, getDifficultyColor } from '../utils/difficulty';
+import { loadStory } from '../data/story-chunks';
+import WordDefinition from './WordDefinition';
+
+// Per-story token sidecars, loaded lazily by story id
+const TOKEN_SIDECARS = import.meta.glob('../data/story-tokens/*.json');
+
+// A tapped word as shown and selected: lowercase, without punctuation
+const cleanToken = (word) => word.replace(/[.,!?;:"""''()]/g, '').toLowerCase();
 
 function StoryReader({
-  story,
+  story: storyMeta,
   onWordSelect,
   onNext,
   onPrevious,
@@ -23,21 +36,117 @@ function StoryReader({
 }) {
   const [showTranslation, setShowTranslation] = useState(false);
   const [selectedWord, setSelectedWord] = useState(null);
+  const [loadedStory, setLoadedStory] = useState(null);
+  const [sidecar, setSidecar] = useState(null);
+  const [selectedLookup, setSelectedLookup] = useState(null);
+  const [showDefinition, setShowDefinition] = useState(false);
+
+  // Fetch the full record when only index metadata was passed in
+  useEffect(() => {
+    if (storyMeta.excerpt) return;
+    let cancelled = false;
+    setLoadedStory(null);
+    loadStory(storyMeta.id)
+      .then(full => {
+        if (!cancelled) setLoadedStory(full);
+      })
+      .catch(err => console.error(`Failed to load story "${storyMeta.id}"`, err));
+    return () => {
+      cancelled = true;
+    };
+  }, [storyMeta]);
+
+  // Fetch the token sidecar for this story (if it was generated)
+  useEffect(() => {
+    setSidecar(null);
+    const loadSidecar = TOKEN_SIDECARS[`../data/story-tokens/${storyMeta.id}.json`];
+    if (!loadSidecar) return;
+    let cancelled = false;
+    loadSidecar()
+      .then(module => {
+        if (!cancelled) setSidecar(module.default);
+      })
+      .catch(err => console.error(`Failed to load tokens for "${storyMeta.id}"`, err));
+    return () => {
+      cancelled = true;
+    };
+  }, [storyMeta.id]);
+
+  const story = storyMeta.excerpt
+    ? storyMeta
+    : (loadedStory && loadedStory.id === storyMeta.id ? loadedStory : storyMeta);
 
   // Split excerpt into paragraphs
-  const paragraphs = story.excerpt.split('\n\n').filter(p => p.trim());
+  const paragraphs = (story.excerpt || '').split('\n\n').filter(p => p.trim());
 
-  // Handle word click for vocabulary lookup
-  const handleWordClick = useCallback((word, event) => {
+  // Group sidecar tokens by paragraph; ignore a sidecar built from other text
+  const tokenizedParagraphs = useMemo(() => {
+    if (!sidecar || !story.excerpt || sidecar.length !== story.excerpt.length) {
+      return null;
+    }
+    const { tokens, paragraphs: spans } = sidecar;
+    const result = [];
+    let t = 0;
+    for (let p = 0; p < spans.length; p += 2) {
+      const start = spans[p];
+      const end = spans[p + 1];
+      const words = [];
+      while (t < tokens.length && tokens[t] < end) {
+        if (tokens[t] >= start) {
+          words.push([tokens[t], tokens[t + 1], tokens[t + 2]]);
+        }
+        t += 3;
+      }
+      result.push({ start, end, words });
+    }
+    return result;
+  }, [sidecar, story.excerpt]);
+
+  // Handle word click for vocabulary lookup; `lookup` (the sidecar's
+  // dictionary key and shard, often the lemma) only steers the fetch
+  const handleWordClick = useCallback((word, event, lookup = null) => {
     event.stopPropagation();
     // Clean the word (remove punctuation)
-    const cleanWord = word.replace(/[.,!?;:"""''()]/g, '').toLowerCase();
+    const cleanWord = cleanToken(word);
     setSelectedWord(cleanWord);
+    setSelectedLookup(lookup);
     if (onWordSelect) {
-      onWordSelect(cleanWord);
+      onWordSelect(cleanWord, lookup);
     }
   }, [onWordSelect]);
 
+  // Render a paragraph from precomputed token offsets
+  const renderTokenizedParagraph = ({ start, end, words }) => {
+    const parts = [];
+    let cursor = start;
+    for (const [wordStart, wordEnd, keyIndex] of words) {
+      if (wordStart > cursor) {
+        parts.push(<span key={`gap-${cursor}`}>{story.excerpt.slice(cursor, wordStart)}</span>);
+      }
+      const word = story.excerpt.slice(wordStart, wordEnd);
+      const lookup = { key: sidecar.keys[keyIndex], shard: sidecar.shards[keyIndex] };
+      const isSelected = selectedWord === cleanToken(word);
+      parts.push(
+        <span
+          key={wordStart}
+          onClick={(e) => handleWordClick(word, e, lookup)}
+          className={`
+            cursor-pointer transition-colors duration-150
+            hover:bg-warning/30 hover:text-warning
+            ${isSelected ? 'bg-warning/40 text-warning rounded px-0.5' : ''}
+          `}
+        >
+          {word}
+        </span>
+      );
+      cursor = wordEnd;
+    }
+    if (cursor < end) {
+      parts.push(<span key={`gap-${cursor}`}>{story.excerpt.slice(cursor, end)}</span>);
+    }
+    return parts;
+  };
+
   // Render text with clickable words
   const renderClickableText = (text) => {
     const words = text.split(/(\s+)/);
@@ -47,8 +156,7 @@ function StoryReader({
         return <span key={index}>{word}</span>;
       }
 
-      const cleanWord = word.replace(/[.,!?;:"""''()]/g, '').toLowerCase();
-      const isSelected = selectedWord === cleanWord;
+      const isSelected = selectedWord === cleanToken(word);
 
       return (
         <span
@@ -120,22 +228,34 @@ function StoryReader({
       {/* Reading area */}
       <div className="bg-bg-tertiary rounded-lg p-5 mb-4">
         <div className="prose prose-invert prose-lg max-w-none">
-          {paragraphs.map((paragraph, index) => (
-            <p key={index} className="text-text-secondary leading-relaxed mb-4 last:mb-0">
-              {renderClickableText(paragraph)}
-            </p>
-          ))}
+          {!story.excerpt && (
+            <p className="text-text-muted italic">Loading story...</p>
+          )}
+          {tokenizedParagraphs
+            ? tokenizedParagraphs.map((paragraph) => (
+              <p key={paragraph.start} className="text-text-secondary leading-relaxed mb-4 last:mb-0">
+                {renderTokenizedParagraph(paragraph)}
+              </p>
+            ))
+            : paragraphs.map((paragraph, index) => (
+              <p key={index} className="text-text-secondary leading-relaxed mb-4 last:mb-0">
+                {renderClickableText(paragraph)}
+              </p>
+            ))}
         </div>
       </div>
 
       {/* Selected word display */}
       {selectedWord && (
-        <div className="bg-warning/10 border border-warning/30 rounded-lg px-4 py-2 mb-4">
+        <button
+          onClick={() => setShowDefinition(true)}
+          className="w-full text-left bg-warning/10 border border-warning/30 rounded-lg px-4 py-2 mb-4"
+        >
           <span className="text-warning text-sm">
             Selected: <strong>{selectedWord}</strong>
-            <span className="text-text-muted ml-2">(tap to look up in vocabulary)</span>
+            <span className="text-text-muted ml-2">(tap to look up in dictionary)</span>
           </span>
-        </div>
+        </button>
       )}
 
       {/* Translation toggle */}
@@ -200,6 +320,14 @@ function StoryReader({
           <ChevronRight className="w-5 h-5" />
         </button>
       </div>
+
+      {/* Dictionary Modal */}
+      <WordDefinition
+        word={selectedWord}
+        lookup={selectedLookup}
+        isOpen={showDefinition}
+        onClose={() => setShowDefinition(false)}
+      />
     </div>
   );
 }
@@ -3,7 +3,7 @@ import { X, Volume2, BookOpen, Loader2, MessageSquare } from 'lucide-react';
 import { lookupWord, formatPartOfSpeech, formatGender } from '../utils/dictionary';
 import { searchSentencesByWord } from '../data/tatoeba';
 
-function WordDefinition({ word, isOpen, onClose }) {
+function WordDefinition({ word, lookup = null, isOpen, onClose }) {
   const [entry, setEntry] = useState(null);
   const [loading, setLoading] = useState(false);
   const [error, setError] = useState(null);
@@ -23,7 +23,7 @@ function WordDefinition({ word, isOpen, onClose }) {
       setError(null);
 
       try {
-        const result = await lookupWord(word);
+        const result = await lookupWord(word, lookup);
         if (result) {
           setEntry(result);
         } else {
@@ -52,7 +52,7 @@ function WordDefinition({ word, isOpen, onClose }) {
 
     loadDefinition();
     loadSentences();
-  }, [word, isOpen]);
+  }, [word, lookup, isOpen]);
 
   // Speak the word using Web Speech API
   const speakWord = (text) => {
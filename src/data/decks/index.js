@@ -0,0 +1,33 @@
+/**
+ * Deck Packs
+ * Generated by scripts/build_deck_packs.py
+ * Packs: 334 across 10 levels
+ * Per pack (at least): sentences 20, story excerpts 2, recipes 1
+ *
+ * Each pack mixes content within +/- 2 of its level with the same
+ * difficulty spread as the level's other packs, and together a level's
+ * packs cover all of its eligible content. A session costs one small fetch.
+ */
+
+export const PACK_COUNTS = {"1": 26, "2": 47, "3": 50, "4": 46, "5": 44, "6": 44, "7": 24, "8": 22, "9": 22, "10": 9};
+
+const PACK_LOADERS = import.meta.glob('./level-*/*.js');
+
+/**
+ * Load a deck pack for a level (1-10): a given pack number, or a random one
+ * Resolves to { level, sentences, stories, recipes }
+ */
+export async function loadDeck(level, pack = null) {
+  const clamped = Math.min(10, Math.max(1, Math.round(level)));
+  const count = PACK_COUNTS[clamped] || 0;
+  if (count === 0) return null;
+
+  const n = pack === null ? Math.floor(Math.random() * count) : pack % count;
+  const loader = PACK_LOADERS[`./level-${clamped}/${n}.js`];
+  if (!loader) return null;
+
+  const module = await loader();
+  return module.default;
+}
+
+export default loadDeck;
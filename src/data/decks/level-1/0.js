@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1185073","romanian":"Treci la subiect!","english":"Get to the point!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321357"},{"id":"tat-1136986","romanian":"Fii atent!","english":"Be watchful.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952792"},{"id":"tat-1118254","romanian":"Noi nu avem zahăr.","english":"We have no sugar.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6657483"},{"id":"tat-1192782","romanian":"Folosesc Twitter.","english":"I am using Twitter.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364295"},{"id":"tat-1185158","romanian":"Trebuie să studiez.","english":"I need to study.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324156"},{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-1143147","romanian":"Cât costă o cameră?","english":"How much is a room?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068934"},{"id":"tat-13","romanian":"Buna seara!","english":"Good evening!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1186837","romanian":"A plătit 20$ pentru ruj.","english":"He paid $20 for the lipstick.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7309933"},{"id":"tat-1142918","romanian":"Am auzit bomba explodând.","english":"We heard the bomb go off.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066399"},{"id":"tat-708987","romanian":"Lasă-mă să tai morcovii.","english":"Let me cut the carrots.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420387"},{"id":"tat-1119703","romanian":"Vorbești ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342578"},{"id":"tat-706062","romanian":"Mama îşi trezeşte fiica.","english":"The mother wakes up her daughter.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970709"},{"id":"tat-1192833","romanian":"A picotit întreaga zi.","english":"He slumbered out the whole day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360778"},{"id":"tat-1143652","romanian":"Aceasta este gratuită.","english":"This is free.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071965"},{"id":"tat-1136318","romanian":"Studiez istoria artei.","english":"I study art history.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963188"},{"id":"tat-1143126","romanian":"Doctorul este un om cult.","english":"The doctor is a man of culture.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068831"},{"id":"tat-475812","romanian":"Lipsește o furculiță.","english":"There is a fork missing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6223472"},{"id":"tat-1136958","romanian":"Știe că îl iubești?","english":"Does he know that you love him?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960492"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
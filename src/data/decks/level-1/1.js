@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-399606","romanian":"Mulțumesc!","english":"Thank you!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"},{"id":"tat-698969","romanian":"Stai puțin.","english":"Wait a minute.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3410256"},{"id":"tat-705814","romanian":"El mănâncă mult.","english":"He eats a lot.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963908"},{"id":"tat-411900","romanian":"Răzvan tocmai plecă.","english":"Razvan just left.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272077"},{"id":"tat-902150","romanian":"Cred că am înţeles.","english":"I think I understood.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287441"},{"id":"tat-1136579","romanian":"Nu traduceți această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965936"},{"id":"tat-1143116","romanian":"Acest ceas ți-e destinat.","english":"This watch is meant for you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070041"},{"id":"tat-1120161","romanian":"Noi îl cunoaștem.","english":"We know him.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6649770"},{"id":"tat-1059646","romanian":"A fost ocupat.","english":"He has been busy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795785"},{"id":"tat-1031106","romanian":"Îmi place limba occitană.","english":"I like the Occitan language.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10793086"},{"id":"tat-708929","romanian":"Juan se îmbracă.","english":"Juan is getting dressed.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398353"},{"id":"tat-584010","romanian":"Mi-am pierdut codul pin!","english":"I forgot my PIN number!","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7801864"},{"id":"tat-1192832","romanian":"Era consumată de ambiție.","english":"She was consumed with ambition.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360676"},{"id":"tat-20","romanian":"Vorbesti engleza?","english":"Do you speak English?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-1136847","romanian":"I-a cumpărat un pulover.","english":"She bought him a sweater.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966283"},{"id":"tat-487284","romanian":"Îl știu?","english":"Do I know him?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270480"},{"id":"tat-1136826","romanian":"Trebuie să plec chiar acum?","english":"Must I leave at once?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966311"},{"id":"tat-1144317","romanian":"Are pian?","english":"Does she have a piano?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073560"},{"id":"tat-448634","romanian":"Capitala Italiei este Roma.","english":"The capital of Italy is Rome.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5020749"}],"stories":[{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
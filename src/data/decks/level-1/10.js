@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1119730","romanian":"Vorbești araba?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340381"},{"id":"tat-1185094","romanian":"Sunt băiat bun.","english":"I am a good boy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7181129"},{"id":"tat-1153756","romanian":"Trebuie să-mi clătesc gura.","english":"I need to rinse my mouth.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4660319"},{"id":"tat-1192698","romanian":"E fizician.","english":"He is a physicist.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/847246"},{"id":"tat-1153830","romanian":"Totul este în regulă.","english":"Everything is fine.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130018"},{"id":"tat-706147","romanian":"A trecut frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974726"},{"id":"tat-399274","romanian":"Bine ai venit!","english":"Welcome.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335259"},{"id":"tat-1144296","romanian":"Fără el, aș fi neajutorată.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073249"},{"id":"tat-1144343","romanian":"Piața respectivă s-a extins rapid.","english":"That market has been rapidly expanding.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073795"},{"id":"tat-925687","romanian":"Ce veste proastă!","english":"What bad news!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527133"},{"id":"tat-1144718","romanian":"Capitala Albaniei este Tirana.","english":"The capital city of Albania is called Tirana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076581"},{"id":"tat-477022","romanian":"Mulțumesc mult!","english":"Thank you very much!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6245731"},{"id":"tat-1064317","romanian":"Mary este foarte drăguță.","english":"Mary is very pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045042"},{"id":"tat-709046","romanian":"Engleza este o limbă internaţională.","english":"English is an international language.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420340"},{"id":"tat-399615","romanian":"Noapte bună, mamă.","english":"Good night, Mom.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327701"},{"id":"tat-1136900","romanian":"De-abia plouă.","english":"It is hardly raining.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960502"},{"id":"tat-1163888","romanian":"Astăzi este foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196786"},{"id":"tat-399605","romanian":"Vorbești engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-1090366","romanian":"Mă poţi auzi?","english":"Can you hear me?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11523377"},{"id":"tat-1136539","romanian":"Îl poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957077"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-1136892","romanian":"Studiază pentru test.","english":"They are studying for the test.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966024"},{"id":"tat-1136924","romanian":"Înțelege fizica.","english":"He understands physics.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957733"},{"id":"tat-1136619","romanian":"Băiatul plângea în cameră.","english":"The boy was crying in the room.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227573"},{"id":"tat-1133944","romanian":"Cafeaua este amară.","english":"The coffee is bitter.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7074654"},{"id":"tat-864480","romanian":"Noi îi spunem Goro-san.","english":"We call him Goro-san.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817805"},{"id":"tat-698950","romanian":"Aceasta este mama mea.","english":"This is my mother.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2736139"},{"id":"tat-1192772","romanian":"Ce doriți: ceai sau cafea?","english":"Which do you want, tea or coffee?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364282"},{"id":"tat-402116","romanian":"Bun venit!","english":"Welcome.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265824"},{"id":"tat-1149073","romanian":"Migdalul face migdale.","english":"Almonds grow on almond trees.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106102"},{"id":"tat-1059626","romanian":"Presupun că-ți place de ea.","english":"I suppose you like her.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9777847"},{"id":"tat-1278789","romanian":"Voi sunteţi copii.","english":"You are children.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13336351"},{"id":"tat-702068","romanian":"Îmi place să călătoresc.","english":"I like traveling.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-862380","romanian":"Am amânat evenimentul.","english":"We postponed the event.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9459071"},{"id":"tat-1143646","romanian":"Ken joacă tenis?","english":"Does Ken play tennis?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071930"},{"id":"tat-1119732","romanian":"Scuză-mă, vorbești engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144127"},{"id":"tat-1120212","romanian":"Sunt din Egipt.","english":"I am from Egypt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11851441"},{"id":"tat-1119749","romanian":"Vorbiți engleza și scoțiana?","english":"Do you speak English and Scottish Gaelic?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511206"},{"id":"tat-399611","romanian":"Bună seara.","english":"Good evening.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1108729","romanian":"Sunt profesor.","english":"I am a teacher.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759056"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1156691","romanian":"Tragedia este distracția nobililor.","english":"Tragedy is the entertainment of the nobles.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10540794"},{"id":"tat-1130802","romanian":"Răspunde-mi.","english":"Answer me.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11926498"},{"id":"tat-1195295","romanian":"Este funcționar bancar.","english":"He is a bank clerk.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2308938"},{"id":"tat-1143257","romanian":"I-a pus întrebări.","english":"He asked her questions.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068610"},{"id":"tat-448260","romanian":"Ai grijă de tine.","english":"Take care.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4256296"},{"id":"tat-1056804","romanian":"Nimănui nu-i place războiul.","english":"No one loves war.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031604"},{"id":"tat-1089709","romanian":"Nu știam despre planul lui.","english":"I was ignorant of his plan.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11265216"},{"id":"tat-584459","romanian":"Tu din nou?","english":"You again?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807669"},{"id":"tat-1144295","romanian":"Fără el, aș fi neajutorat.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073247"},{"id":"tat-702190","romanian":"Acest peşte miroase urât.","english":"This fish smells bad.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397702"},{"id":"tat-1163899","romanian":"Asculta muzică.","english":"She was listening to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196923"},{"id":"tat-1143269","romanian":"Oamenii sunt în echipă.","english":"The people are on the team.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068650"},{"id":"tat-408004","romanian":"Pentru cine bat clopotele?","english":"For whom do the bells toll?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532040"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-1159808","romanian":"Pune ouăle în frigider.","english":"Put the eggs in the refrigerator.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168184"},{"id":"tat-670694","romanian":"Poţi alege orice.","english":"You may choose what you like.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200802"},{"id":"tat-1119702","romanian":"Vorbiți ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7185558"},{"id":"tat-12","romanian":"Buna dimineata!","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-31","romanian":"Cati ani ai?","english":"How old are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1136543","romanian":"Avea șosetele pe dos.","english":"He had his socks on inside out.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965326"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
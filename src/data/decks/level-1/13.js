@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-1078362","romanian":"Salut, lume!","english":"Hello, world!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9938591"},{"id":"tat-1192820","romanian":"Alerg în fiecare zi.","english":"I run every day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356278"},{"id":"tat-1201124","romanian":"Îmi place Cathy.","english":"I am fond of Cathy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12023720"},{"id":"tat-1136536","romanian":"Rockul este muzica celor tineri.","english":"Rock is the music of the young.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965478"},{"id":"tat-1156696","romanian":"Sunt cetățean american.","english":"I am an American citizen.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11260892"},{"id":"tat-1192813","romanian":"Părea tânăr.","english":"He appeared young.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356214"},{"id":"tat-1056784","romanian":"Majoritatea copiilor urăsc școala.","english":"Most children hate school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031352"},{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-698946","romanian":"Cât costă?","english":"How much is it?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-1136527","romanian":"Făceți-vă temele acum.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965357"},{"id":"tat-399598","romanian":"Vorbești italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314459"},{"id":"tat-399622","romanian":"Bună seara, ce faci?","english":"Good evening, how are you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6360852"},{"id":"tat-408049","romanian":"Studentul acesta este american.","english":"This student is American.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220864"},{"id":"tat-1192842","romanian":"N-ai febră.","english":"You have no fever.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361445"},{"id":"tat-1136671","romanian":"S-a înfășurat în pătură.","english":"She wrapped herself in a blanket.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239804"},{"id":"tat-1136828","romanian":"Râzi în legătură cu ce?","english":"What are you laughing at?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966362"},{"id":"tat-399619","romanian":"Mulțumesc foarte mult!","english":"Thank you very much!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6359653"},{"id":"tat-406044","romanian":"Daniela mi-a telefonat acasă.","english":"Daniela called me at home.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350499"},{"id":"tat-1143117","romanian":"Și pomul era deseori singur.","english":"And the tree was often alone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070043"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-709012","romanian":"Doriţi un loc la fereastră?","english":"Would you like a window seat?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420287"},{"id":"tat-1144711","romanian":"Capitala Poloniei este Varșovia.","english":"The capital of Poland is Warsaw.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076553"},{"id":"tat-1143143","romanian":"Când pot călători?","english":"When can I travel?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068926"},{"id":"tat-584798","romanian":"Mă dor picioarele.","english":"My feet hurt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813828"},{"id":"tat-699676","romanian":"Te iubesc.","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323350"},{"id":"tat-487031","romanian":"Camera mea este foarte mică.","english":"My room is very small.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435954"},{"id":"tat-1119736","romanian":"Vorbești germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144104"},{"id":"tat-986476","romanian":"Te iubesc!","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637108"},{"id":"tat-1143576","romanian":"Îmi place jazzul.","english":"I like jazz music.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7736870"},{"id":"tat-1144707","romanian":"Capitala Olandei este Amsterdam.","english":"The capital city of the Netherlands is Amsterdam.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076528"},{"id":"tat-1089652","romanian":"Ce făceai?","english":"What were you doing?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267869"},{"id":"tat-1136644","romanian":"Ieri și-a cumpărat Mary fusta.","english":"It was yesterday that Mary bought this skirt.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227743"},{"id":"tat-1195255","romanian":"Acest televizor e greu.","english":"This television set is heavy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7175536"},{"id":"tat-923800","romanian":"Prietenia noastră nu a durat.","english":"Our friendship did not last.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10419439"},{"id":"tat-1185135","romanian":"Acest sol e umed.","english":"This soil is moist.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323926"},{"id":"tat-1192712","romanian":"Bărbatul o împinse deoparte.","english":"The man shoved her aside.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2811437"},{"id":"tat-706032","romanian":"Preţurile sunt mari.","english":"Prices are high.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969720"},{"id":"tat-1185077","romanian":"Vei traduce asta în franceză?","english":"Will you translate this into French?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321419"},{"id":"tat-399607","romanian":"Poftă bună!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-399599","romanian":"Vorbiți japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319340"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
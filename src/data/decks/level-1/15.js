@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1136554","romanian":"Trebuie să învățați toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960194"},{"id":"tat-1064275","romanian":"Vin roșu, vă rog.","english":"Red wine, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066144"},{"id":"tat-1136542","romanian":"O puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965557"},{"id":"tat-1089729","romanian":"Ce zi frumoasă!","english":"What a nice day it is!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11275379"},{"id":"tat-1136960","romanian":"Poți culca copiii?","english":"Can you put the children to bed?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958000"},{"id":"tat-448202","romanian":"Lasă-mă.","english":"Go away.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3840680"},{"id":"tat-1059504","romanian":"I se zice Jim.","english":"They call him Jim.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8001955"},{"id":"tat-1147397","romanian":"Vorbesc fluent portugheza.","english":"I speak Portuguese fluently.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12092941"},{"id":"tat-1153892","romanian":"A spus-o din amabilitate.","english":"He did it out of kindness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104038"},{"id":"tat-1119752","romanian":"Vorbiți letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264777"},{"id":"tat-1136663","romanian":"Casa a luat foc.","english":"The house caught fire.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966118"},{"id":"tat-448206","romanian":"Fraților!","english":"My brothers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3864978"},{"id":"tat-610923","romanian":"Micul dejun este gata.","english":"Breakfast is ready.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/767045"},{"id":"tat-1143570","romanian":"Îmi place să dorm.","english":"I like sleeping.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072646"},{"id":"tat-709036","romanian":"A ţintit pasărea.","english":"He aimed at the bird.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420325"},{"id":"tat-1119725","romanian":"Dragostea e de rahat.","english":"Love sucks.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265056"},{"id":"tat-1136616","romanian":"Toate invențiile apar din necesitate.","english":"All inventions grow out of necessity.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965950"},{"id":"tat-1136610","romanian":"Cu ajutorul doctorilor, s-a vindecat.","english":"With the help of doctors, she got over her illness.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966026"},{"id":"tat-699623","romanian":"Am văzut câinele.","english":"I saw the dog.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320070"},{"id":"tat-2","romanian":"Multumesc.","english":"Thank you.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1195248","romanian":"E în bani.","english":"He is in the money.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7171087"},{"id":"tat-448211","romanian":"Respectul este temelia vieții.","english":"Respect is the foundation of life.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3873916"},{"id":"tat-1192719","romanian":"S-a conformat cerinței mele.","english":"She complied with my request.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6655519"},{"id":"tat-708994","romanian":"Amestecă în supă.","english":"Stir the soup.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8353408"},{"id":"tat-1136717","romanian":"Porecla mea este \"Itch\".","english":"I go by the nickname \"Itch.\"","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239594"},{"id":"tat-1136556","romanian":"Nu așa îl văd eu.","english":"That is not my idea of him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959323"},{"id":"tat-1142932","romanian":"Majoritatea pasagerilor din autobuz dormeau.","english":"Most of the passengers on the bus were sleeping.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066665"},{"id":"tat-1163893","romanian":"Un An Nou fericit!","english":"Happy New Year!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196792"},{"id":"tat-1143243","romanian":"Te-a așteptat două ore.","english":"She waited for you for two hours.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068548"},{"id":"tat-1142891","romanian":"Cât e ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065971"},{"id":"tat-1185175","romanian":"Atletul părea imun la oboseală.","english":"The athlete seemed immune to fatigue.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324302"},{"id":"tat-1119745","romanian":"Vorbiți spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342518"},{"id":"tat-399604","romanian":"Vorbiți engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323247"},{"id":"tat-399600","romanian":"Vorbești japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319472"},{"id":"tat-446564","romanian":"Ești ocupat?","english":"Are you busy?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6269572"},{"id":"tat-1168697","romanian":"Am auzit muzica.","english":"I heard the music.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12220460"},{"id":"tat-1159843","romanian":"Îmi place foarte mult.","english":"I like it very much.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167977"},{"id":"tat-698972","romanian":"Am două cărți.","english":"I have two books.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3766465"},{"id":"tat-1059623","romanian":"Poți fi chiar președinte!","english":"You can even be a president!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8037893"},{"id":"tat-1192799","romanian":"Sunt foarte veseli.","english":"They are very cheerful.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351572"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
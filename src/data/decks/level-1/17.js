@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-487322","romanian":"Femeia mănâncă o portocală.","english":"The woman eats an orange.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336244"},{"id":"tat-1090185","romanian":"E fratele meu.","english":"He is my brother.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1996614"},{"id":"tat-448266","romanian":"Are părul scurt.","english":"She has short hair.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4306510"},{"id":"tat-1144715","romanian":"Capitala Serbiei este Belgrad.","english":"The capital city of Serbia is Belgrade.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076564"},{"id":"tat-1144284","romanian":"Are o legătură cu furtul.","english":"He has something to do with the robbery.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7510355"},{"id":"tat-1163902","romanian":"Mă asculți?","english":"Are you listening?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196976"},{"id":"tat-1059492","romanian":"Mi s-a ondulat părul.","english":"My hair got kinky.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10767713"},{"id":"tat-4","romanian":"Nu.","english":"No.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8065106"},{"id":"tat-1143232","romanian":"Fă-o!","english":"Do it!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068477"},{"id":"tat-1059485","romanian":"Aici s-a întâmplat accidentul.","english":"This is where the accident happened.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10299812"},{"id":"tat-406809","romanian":"Cum te numești?","english":"What is your name?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347301"},{"id":"tat-706078","romanian":"Care echipă a câştigat meciul?","english":"Which team won the game?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970911"},{"id":"tat-1153167","romanian":"Arătați bine.","english":"You look fine.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1767044"},{"id":"tat-699683","romanian":"Mi-e dor de tine.","english":"I miss you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323633"},{"id":"tat-1108692","romanian":"Ne vedem mâine!","english":"See you tomorrow.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11747448"},{"id":"tat-19","romanian":"Cat costa?","english":"How much does it cost?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-448190","romanian":"La dracu’ cu tine!","english":"Fuck you!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3796586"},{"id":"tat-1136525","romanian":"Fă-ți temele acum!","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965332"},{"id":"tat-1186844","romanian":"Metodele sale nu sunt ştiinţifice.","english":"His methods are not scientific.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338130"},{"id":"tat-1136917","romanian":"Arăți altfel azi.","english":"You look different today.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960464"}],"stories":[{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1119750","romanian":"Vorbiți suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264927"},{"id":"tat-1151771","romanian":"Azi nu e ziua ta.","english":"Today is not your day.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118740"},{"id":"tat-705788","romanian":"Urmăreşti dezbaterile parlamentare?","english":"Did you listen to the parliamentary debate?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963116"},{"id":"tat-1136900","romanian":"De-abia plouă.","english":"It is hardly raining.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960502"},{"id":"tat-1201140","romanian":"E un bun perdant.","english":"He is a good loser.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12422431"},{"id":"tat-408047","romanian":"Cine știe?","english":"Who knows?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220694"},{"id":"tat-1153853","romanian":"Jack e tăcut acum.","english":"Jack is quiet now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130113"},{"id":"tat-1119751","romanian":"Vorbești suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7172318"},{"id":"tat-487282","romanian":"Am accentuat ideea.","english":"I stressed the point.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270459"},{"id":"tat-408068","romanian":"Ce să fac?!","english":"What can I do?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232794"},{"id":"tat-698973","romanian":"Cartea este mare.","english":"The book is big.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3870973"},{"id":"tat-1144039","romanian":"Îți pot folosi mașina, tată?","english":"May I use your car, Dad?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072667"},{"id":"tat-584835","romanian":"Bineînțeles, el are dreptate.","english":"Of course, he is right.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812373"},{"id":"tat-1136691","romanian":"L-am văzut oprindu-se.","english":"I observed him stop.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221903"},{"id":"tat-1181806","romanian":"Vreau o chitară.","english":"I want a guitar.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12297767"},{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-698974","romanian":"Cartea este albă.","english":"The book is white.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3943121"},{"id":"tat-406013","romanian":"Copacii erau foarte rari.","english":"The trees were very scarce.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350364"},{"id":"tat-30","romanian":"Unde locuiesti?","english":"Where do you live?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-706155","romanian":"Tocmai a plecat.","english":"He left just now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974769"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-1117472","romanian":"Ea este puternică.","english":"She is strong.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817460"},{"id":"tat-1185072","romanian":"O vei invita la petrecere?","english":"Are you going to invite her to the party?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321352"},{"id":"tat-1143149","romanian":"De la ce aeroport plec?","english":"Which airport do I leave from?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068959"},{"id":"tat-1136614","romanian":"Mulțimea a protestat împotriva avortului.","english":"The throng protested against abortion.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966027"},{"id":"tat-1136649","romanian":"Vorbește puțin engleza.","english":"He speaks English a little.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966129"},{"id":"tat-1153809","romanian":"Acesta e un vin excelent.","english":"This is excellent wine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128986"},{"id":"tat-1136744","romanian":"Sună-mă cândva.","english":"Call me sometime.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966175"},{"id":"tat-902146","romanian":"Ești o fată drăguță.","english":"You are a pretty girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287426"},{"id":"tat-1186864","romanian":"Acest ceas trebuie reparat.","english":"This watch needs to be fixed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338255"},{"id":"tat-488786","romanian":"Cât este ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528939"},{"id":"tat-1143190","romanian":"Fața ei este concentrată.","english":"Her face is in focus.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069295"},{"id":"tat-1144308","romanian":"Problema l-a făcut cunoscut.","english":"The matter made his name known.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073372"},{"id":"tat-1185182","romanian":"Și-a afirmat inocența.","english":"He affirmed his innocence.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324346"},{"id":"tat-7","romanian":"Salut!","english":"Hi!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"},{"id":"tat-1064029","romanian":"Pari ocupat.","english":"You look busy.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064319"},{"id":"tat-1201333","romanian":"Cafea sau ceai?","english":"Coffee or tea?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4037739"},{"id":"tat-1153778","romanian":"Paradoxal, are dreptate.","english":"Paradoxically, he is right.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128544"},{"id":"tat-1108729","romanian":"Sunt profesor.","english":"I am a teacher.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759056"},{"id":"tat-1143613","romanian":"Îmi place ciocolata.","english":"I like chocolate.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071626"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1147563","romanian":"Vorbește prea mult.","english":"He talks too much.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095134"},{"id":"tat-583889","romanian":"Mă țin întotdeauna de promisiune.","english":"I always keep my promises.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/870644"},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"},{"id":"tat-1143286","romanian":"Ascult muzică.","english":"I listen to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068676"},{"id":"tat-1153169","romanian":"Mă plimbam pe bulevard.","english":"I was strolling down the avenue.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1778405"},{"id":"tat-399605","romanian":"Vorbești engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-1153821","romanian":"Învăț engleza pe cineva.","english":"I teach English to someone.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129727"},{"id":"tat-411957","romanian":"Îl văd pe Dan.","english":"I see Dan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272287"},{"id":"tat-1144720","romanian":"Capitala Cehiei este Praga.","english":"The capital of Czechia is Prague.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076594"},{"id":"tat-864511","romanian":"Credința este moartea inteligenței.","english":"Belief is the death of intelligence.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6984822"},{"id":"tat-670618","romanian":"Pe ce linie pentru Boston?","english":"What track for Boston?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1346020"},{"id":"tat-1192827","romanian":"Unde îmi pot ridica bagajele?","english":"Where can I pick up my baggage?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12359803"},{"id":"tat-399610","romanian":"Bună dimineața.","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-488788","romanian":"Sumatra este o insulă.","english":"Sumatra is an island.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528949"},{"id":"tat-1151813","romanian":"Cade o frunză.","english":"A leaf is falling.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119103"},{"id":"tat-923805","romanian":"Toată lumea caută fericirea.","english":"Everybody seeks happiness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10421099"},{"id":"tat-1156687","romanian":"Acest ceas este stricat.","english":"This clock is broken.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10308903"},{"id":"tat-708921","romanian":"Leagă-ţi şireturile.","english":"Tie your shoelaces.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397940"},{"id":"tat-1153818","romanian":"Rar iese duminica.","english":"Rarely does he go out on Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129254"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
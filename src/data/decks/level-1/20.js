@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1119738","romanian":"Vorbești turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6355405"},{"id":"tat-1153804","romanian":"Vii la petrecere, da?","english":"Come to the party, will you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128886"},{"id":"tat-1279124","romanian":"Bicicleta mea a dispărut.","english":"My bike disappeared.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13117848"},{"id":"tat-1185180","romanian":"Acum e în spital.","english":"She is in hospital now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324332"},{"id":"tat-399609","romanian":"Bună dimineața la toată lumea.","english":"Good morning, everybody.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325807"},{"id":"tat-923862","romanian":"Mă grăbesc.","english":"I am in a hurry.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444186"},{"id":"tat-902137","romanian":"A început să ningă.","english":"It began to snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287411"},{"id":"tat-1056801","romanian":"Este o persoană agresivă.","english":"He is an aggressive person.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031628"},{"id":"tat-1136710","romanian":"Nimic nou sub soare.","english":"Nothing new under the sun.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212823"},{"id":"tat-698920","romanian":"Îți place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1837147"},{"id":"tat-1136888","romanian":"Era la locul crimei.","english":"She was on the scene of the crime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966017"},{"id":"tat-698967","romanian":"Ea este Li Ying.","english":"She is Li Ying.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3384009"},{"id":"tat-1110606","romanian":"Ma ajutat foarte mult.","english":"It helped me a lot.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3824983"},{"id":"tat-698940","romanian":"Acest roman mă plictisește.","english":"This novel bores me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2233781"},{"id":"tat-986478","romanian":"Te iubesc foarte mult.","english":"I love you very much.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637115"},{"id":"tat-1163899","romanian":"Asculta muzică.","english":"She was listening to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196923"},{"id":"tat-10","romanian":"Noroc!","english":"Cheers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665964"},{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-709933","romanian":"Nimeni nu a încurajat-o.","english":"No one encouraged her.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426774"},{"id":"tat-1136989","romanian":"Are acces la informația înmagazinată.","english":"He has access to the stored information.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952879"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1089727","romanian":"Îmi place matematica.","english":"I like maths.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267471"},{"id":"tat-1147490","romanian":"Închide ușa aia blestemată!","english":"Shut the damned door!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094827"},{"id":"tat-1119727","romanian":"Vorbiți franceza?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235766"},{"id":"tat-986459","romanian":"Contextul este important.","english":"The context is important.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637061"},{"id":"tat-709013","romanian":"Câte mere vrei?","english":"How many apples do you want?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420288"},{"id":"tat-698963","romanian":"Unde te duci?","english":"Where are you going to?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3220541"},{"id":"tat-1128611","romanian":"Ce ai în geantă?","english":"What have you got in your bag?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11912837"},{"id":"tat-1136802","romanian":"Îmi place să cânt.","english":"I like singing.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966355"},{"id":"tat-1059417","romanian":"M-am uitat în dulap.","english":"I looked in the cupboard.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7087756"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-399273","romanian":"Bine ați venit!","english":"Welcome.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334977"},{"id":"tat-1201354","romanian":"Iată autobuzul!","english":"Here comes the bus!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4907596"},{"id":"tat-1136929","romanian":"Problema rămâne de rezolvat.","english":"The problem remains to be solved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957754"},{"id":"tat-446714","romanian":"Mi-a dat niște cărți.","english":"He gave me some books.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6823779"},{"id":"tat-487280","romanian":"Am ratat ceva?","english":"Did I miss anything?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270414"},{"id":"tat-1144673","romanian":"Scuzați-mă, vorbiți engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12075958"},{"id":"tat-1192813","romanian":"Părea tânăr.","english":"He appeared young.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356214"},{"id":"tat-1151783","romanian":"Azi e sâmbătă.","english":"Today is Saturday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119193"},{"id":"tat-584803","romanian":"Fata își spălă părul.","english":"The girl washed her hair.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813833"},{"id":"tat-1119737","romanian":"Vorbiți turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265023"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1153153","romanian":"A explica chestiunea în detaliu.","english":"He explained the matter in detail.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1715495"},{"id":"tat-1136959","romanian":"Vă rog, păstrați restul.","english":"Keep the change, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966081"},{"id":"tat-1149075","romanian":"Piersicul face piersici.","english":"Peaches grow on the peach tree.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106106"},{"id":"tat-1136388","romanian":"Este respectat de toată lumea.","english":"He is respected by everyone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962876"},{"id":"tat-1185108","romanian":"Am fost la Londra.","english":"I have been to London.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195147"},{"id":"tat-923838","romanian":"Anna este o fetiță.","english":"Ann is a little girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10435209"},{"id":"tat-487305","romanian":"Pisica este adorabilă.","english":"The cat is adorable.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270702"},{"id":"tat-1136652","romanian":"Trăim într-o comunitate globală.","english":"We live in a global community.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966120"},{"id":"tat-1168718","romanian":"Bei cafea?","english":"Do you drink coffee?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/693134"},{"id":"tat-1119722","romanian":"El și-a găsit părinții.","english":"He found his parents.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511953"},{"id":"tat-1163913","romanian":"Poți alerga repede?","english":"Can you run fast?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197018"},{"id":"tat-1151810","romanian":"Tom e musulman.","english":"Tom is a Muslim.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119099"},{"id":"tat-399607","romanian":"Poftă bună!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-986499","romanian":"Puteți folosi dicționarul meu.","english":"You may use my dictionary.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637140"},{"id":"tat-1119741","romanian":"Vorbiți klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340242"},{"id":"tat-944584","romanian":"M-am simţit rău.","english":"I felt bad.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/60061"},{"id":"tat-1153834","romanian":"Puteam auzi gemetele bărbatului rănit.","english":"We could hear the groans of the injured man.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130091"},{"id":"tat-1120208","romanian":"Sunt din Brazilia.","english":"I am from Brazil.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11850582"},{"id":"tat-1137004","romanian":"Stați acolo!","english":"Stay there!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952937"},{"id":"tat-706060","romanian":"Tu ești prietenul meu.","english":"You are my friend.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970702"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
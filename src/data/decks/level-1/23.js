@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-712076","romanian":"Trebuie să vii cu mine.","english":"You have to come with me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440714"},{"id":"tat-1163901","romanian":"Asculți?","english":"Are you listening?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196975"},{"id":"tat-399597","romanian":"Vorbiți italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314367"},{"id":"tat-1143601","romanian":"Îmi place tenisul.","english":"I like tennis.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071543"},{"id":"tat-1142946","romanian":"Ești ocupat mâine?","english":"Are you engaged for tomorrow?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066837"},{"id":"tat-708989","romanian":"A cuprins-o teama.","english":"Fear fell upon her.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420389"},{"id":"tat-3","romanian":"Da.","english":"Yes.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1167647"},{"id":"tat-506869","romanian":"La mulți ani!","english":"Happy birthday!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528582"},{"id":"tat-1136355","romanian":"Nu e prost.","english":"He is not stupid.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963115"},{"id":"tat-1192765","romanian":"Mulțumesc pentru instrucțiuni.","english":"Thank you for the lead.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357142"},{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"},{"id":"tat-1143130","romanian":"Calciul lipsește din dieta lui.","english":"Calcium is absent from his diet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068855"},{"id":"tat-582951","romanian":"E puțină apă în găleată.","english":"There is little water in the bucket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665401"},{"id":"tat-698947","romanian":"De ce mă iubești?","english":"Why do you love me?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636872"},{"id":"tat-1119752","romanian":"Vorbiți letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264777"},{"id":"tat-583959","romanian":"Nici în ruptul capului!","english":"Not for all the tea in China!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799491"},{"id":"tat-1186862","romanian":"În sfârșit a făcut bani.","english":"He finally made money.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338232"},{"id":"tat-488770","romanian":"Guus Hiddink este olandez.","english":"Guus Hiddink is Dutch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528884"},{"id":"tat-1108779","romanian":"Ei nu vin astăzi.","english":"They are not coming today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759953"},{"id":"tat-1136580","romanian":"Calitatea traducerii s-a îmbunătățit.","english":"The quality of translation has improved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966078"}],"stories":[{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
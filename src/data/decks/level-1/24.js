@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-706145","romanian":"A traversat frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974711"},{"id":"tat-1059643","romanian":"S-a întins pe pat.","english":"He laid himself on the bed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758837"},{"id":"tat-706130","romanian":"El scrie cărţi.","english":"He writes books.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974452"},{"id":"tat-1142892","romanian":"Câți ani ai?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1143172","romanian":"Explicația lui nu era satisfăcătoare.","english":"His explanation was not satisfactory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069202"},{"id":"tat-1192721","romanian":"A zis ea asta?","english":"She said that?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7136968"},{"id":"tat-448231","romanian":"Sunt bolnav.","english":"I am sick.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3947930"},{"id":"tat-1153810","romanian":"Grăbește-te!","english":"Hurry up.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129000"},{"id":"tat-1136531","romanian":"S-a îmbrăcat cu jacheta roșie.","english":"He put on the red jacket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965117"},{"id":"tat-698951","romanian":"Am 2 frați.","english":"I have two brothers.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2817943"},{"id":"tat-706044","romanian":"Credeam că era drăguţă.","english":"I thought she was pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969871"},{"id":"tat-1151785","romanian":"Azi e vineri.","english":"Today is Friday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119197"},{"id":"tat-1119697","romanian":"Vorbești chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227075"},{"id":"tat-712069","romanian":"Socialism sau barbarism.","english":"Socialism or barbarism.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440421"},{"id":"tat-712096","romanian":"Radioul este stricat.","english":"The radio is broken.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8438352"},{"id":"tat-1136995","romanian":"Sahara este un deșert vast.","english":"The Sahara is a vast desert.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952791"},{"id":"tat-1142940","romanian":"Cine e în spatele intrigii?","english":"Who is behind the plot?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066756"},{"id":"tat-1059423","romanian":"Când pleci de aici?","english":"When do you leave here?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9551350"},{"id":"tat-698949","romanian":"Acela este tatăl nostru.","english":"That is our father.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2637465"},{"id":"tat-1119745","romanian":"Vorbiți spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342518"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
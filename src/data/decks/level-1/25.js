@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1064235","romanian":"Tom are iubită?","english":"Does Tom have a girlfriend?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073102"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-411966","romanian":"Am văzut-o pe Dana.","english":"I saw Dana.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272314"},{"id":"tat-4","romanian":"Nu.","english":"No.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8065106"},{"id":"tat-948496","romanian":"Da, vă rog.","english":"Yes, please.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9690115"},{"id":"tat-1143263","romanian":"Aceea e școala mea.","english":"That is my school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068637"},{"id":"tat-863658","romanian":"Urăsc aceste cuvinte.","english":"I hate these words.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9141319"},{"id":"tat-1192704","romanian":"E nevoie să fie reparat.","english":"It needs to be repaired.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1116325"},{"id":"tat-709037","romanian":"Du-i înapoi cartea asta.","english":"Take this book back to him.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420326"},{"id":"tat-1136381","romanian":"Salut! Bună dimineața!","english":"Hello! Good morning!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962782"},{"id":"tat-1064444","romanian":"Vreau ceva dulce.","english":"I want something sweet.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077411"},{"id":"tat-1119735","romanian":"Vorbiți germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7205590"},{"id":"tat-1119729","romanian":"Vorbiți arabă?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264753"},{"id":"tat-1136628","romanian":"Mi-am pierdut umbrela.","english":"I have lost my umbrella.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227193"},{"id":"tat-1153886","romanian":"Opinia lor contează puțin.","english":"Their opinion matters little.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12103107"},{"id":"tat-1059705","romanian":"Nu e glumă.","english":"It is no joke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795790"},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-1119728","romanian":"Vorbești franceză?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7421603"},{"id":"tat-699632","romanian":"Îţi place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320252"},{"id":"tat-1136844","romanian":"Voi urma planul tău.","english":"I will go along with your plan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966268"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
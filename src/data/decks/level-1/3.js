@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-411959","romanian":"O văd pe Dana.","english":"I see Dana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272293"},{"id":"tat-1142921","romanian":"Strada este deteriorată.","english":"The road is damaged.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066444"},{"id":"tat-405977","romanian":"Poftiți, doamnă, serviți-vă!","english":"Please, madam, help yourself!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350235"},{"id":"tat-1117421","romanian":"Este adevărat?","english":"Is that true?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817570"},{"id":"tat-584410","romanian":"Ei sunt colegii mei.","english":"They are my classmates.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7794377"},{"id":"tat-402116","romanian":"Bun venit!","english":"Welcome.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265824"},{"id":"tat-1197123","romanian":"Cât e până la aeroport?","english":"How far is it to the airport?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3134254"},{"id":"tat-708922","romanian":"Poate o să ningă.","english":"Maybe it will snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397946"},{"id":"tat-689399","romanian":"Crăciun fericit!","english":"Merry Christmas!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1781709"},{"id":"tat-1136624","romanian":"Fetița a izbucnit în lacrimi.","english":"The young girl burst into tears.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966101"},{"id":"tat-1124701","romanian":"Tortul are un gust dulce.","english":"The cake tastes sweet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11873968"},{"id":"tat-1185061","romanian":"Frânghia e foarte slabă.","english":"The string is very weak.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12319365"},{"id":"tat-1192846","romanian":"E un monarh absolut.","english":"He is an absolute monarch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361499"},{"id":"tat-1151761","romanian":"Azi e duminică.","english":"Today is Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118662"},{"id":"tat-1090314","romanian":"Am fraţi.","english":"I have brothers.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3711714"},{"id":"tat-708991","romanian":"Presupun că va întârzia.","english":"I suppose he will be late.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420395"},{"id":"tat-1186855","romanian":"Acceptați American Express?","english":"Do you accept AMEX?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338199"},{"id":"tat-698948","romanian":"Unde locuiești?","english":"Where do you live?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-1192838","romanian":"Tatăl meu e doctor.","english":"My father is a doctor.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361424"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
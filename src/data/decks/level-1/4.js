@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1089733","romanian":"Unde este banca?","english":"Where is the bank?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11266826"},{"id":"tat-1064072","romanian":"Tom pare foarte fericit.","english":"Tom looks very happy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069577"},{"id":"tat-1151780","romanian":"Azi e joi.","english":"Today is Thursday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119184"},{"id":"tat-702210","romanian":"Este o fotografie recentă?","english":"Is it a recent picture?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398717"},{"id":"tat-1159850","romanian":"Azi e foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168080"},{"id":"tat-12","romanian":"Buna dimineata!","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-399624","romanian":"Bună, ce faci?","english":"Hello, how are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6363145"},{"id":"tat-1136849","romanian":"Cât de adânc este lacul?","english":"How deep is the lake?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966273"},{"id":"tat-986457","romanian":"Astăzi este ziua mea.","english":"Today is my birthday.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637054"},{"id":"tat-1143685","romanian":"M-am săturat de asta.","english":"I am fed up with it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072255"},{"id":"tat-1136272","romanian":"Este nesociabil.","english":"He is unsociable.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963275"},{"id":"tat-1136874","romanian":"E destul de supărată.","english":"She is quite angry.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956314"},{"id":"tat-1136548","romanian":"Și-a atribuit eşecul ghinionului.","english":"She ascribed her failure to bad luck.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965103"},{"id":"tat-670692","romanian":"Poți alege orice carte vrei.","english":"You may choose whichever book you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200793"},{"id":"tat-487328","romanian":"Este profesor?","english":"Is he a teacher?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336990"},{"id":"tat-1136913","romanian":"E clar?","english":"Is that clear?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966183"},{"id":"tat-902141","romanian":"Acesta e sfârșitul.","english":"This is the end.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287419"},{"id":"tat-1136789","romanian":"Fata s-a antrenat la paralele.","english":"The girl exercised on the parallel bars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966214"},{"id":"tat-1144743","romanian":"Câștigăm o zi.","english":"We are gaining a day.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12077122"},{"id":"tat-862837","romanian":"Trebuie sa mă gîndesc.","english":"I have to think about it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014517"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1279104","romanian":"Asta e mai frumoasă.","english":"This one is more beautiful.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13113773"},{"id":"tat-1136639","romanian":"Cine a scris această scrisoare?","english":"Who wrote this letter?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966122"},{"id":"tat-399598","romanian":"Vorbești italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314459"},{"id":"tat-1136720","romanian":"I-a pus imaginea în palmă.","english":"She put the picture back in his hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7222279"},{"id":"tat-487034","romanian":"Eu mănânc tăiței.","english":"I am eating noodles.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435962"},{"id":"tat-1136296","romanian":"Am alergat spre ușă.","english":"I ran toward the door.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963200"},{"id":"tat-1136839","romanian":"Ce e dragostea?","english":"What is love?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532441"},{"id":"tat-15","romanian":"Pofta buna!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-1136353","romanian":"Sunteți din Urumqi?","english":"Are you from Urumqi?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963175"},{"id":"tat-1059676","romanian":"Aș vrea niște pește.","english":"I would like some fish.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963768"},{"id":"tat-699630","romanian":"Poţi rezolva această problemă?","english":"Can you solve this problem?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320215"},{"id":"tat-1143133","romanian":"Întotdeauna sunt ajutat de tine.","english":"I am always helped by you.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068889"},{"id":"tat-1136275","romanian":"Poți invita orice persoană dorești.","english":"You may invite any person you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963281"},{"id":"tat-1143615","romanian":"Îmi place rockul.","english":"I love rock.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071631"},{"id":"tat-1192777","romanian":"I-a arătat poza mea.","english":"She showed him my picture.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364287"},{"id":"tat-1142890","romanian":"Ce-i asta?","english":"What is this?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065968"},{"id":"tat-1159835","romanian":"Mulțumesc foarte, foarte mult!","english":"Thank you very, very much!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167856"},{"id":"tat-448259","romanian":"Suntem chit.","english":"We are even.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4250681"},{"id":"tat-1137013","romanian":"Și el învață chineza.","english":"He studies Chinese as well.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952884"},{"id":"tat-1136526","romanian":"Acum fă-ți temele.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965105"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
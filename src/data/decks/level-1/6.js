@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-582947","romanian":"Voiam să devin filozof.","english":"I wanted to become a philosopher.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6547233"},{"id":"tat-1119736","romanian":"Vorbești germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144104"},{"id":"tat-983708","romanian":"Este un cal.","english":"This is a horse.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5754562"},{"id":"tat-1119743","romanian":"Vorbești klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235942"},{"id":"tat-1136629","romanian":"Cariera lui progresează furtunos.","english":"His career is progressing in leaps and bounds.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239750"},{"id":"tat-1136541","romanian":"Îl puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965468"},{"id":"tat-709901","romanian":"Unde se joacă Toni?","english":"Where is Tony playing?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426734"},{"id":"tat-706083","romanian":"Cui i-a păsat?","english":"Who cared?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970932"},{"id":"tat-1185107","romanian":"Și-a îmbrățișat călduros fiul.","english":"He embraced his son warmly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195145"},{"id":"tat-488775","romanian":"Prietena sa este japoneză.","english":"His girlfriend is Japanese.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528911"},{"id":"tat-1136540","romanian":"O poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965189"},{"id":"tat-1201128","romanian":"E beat.","english":"He is drunk.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12056752"},{"id":"tat-406815","romanian":"Cum vă numiți?","english":"What is your name?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347334"},{"id":"tat-1059690","romanian":"Îmi poți da niște bani?","english":"Can you give me some money?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/931482"},{"id":"tat-712088","romanian":"Tom s-a ascuns sub masă.","english":"Tom hid under the table.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440023"},{"id":"tat-986483","romanian":"El știe tot.","english":"He knows everything.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637121"},{"id":"tat-406002","romanian":"Astăzi vremea e frumoasă.","english":"Today the weather is nice.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350319"},{"id":"tat-709020","romanian":"Becul s-a ars.","english":"The light bulb has burned out.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420302"},{"id":"tat-1136512","romanian":"Era cam douăzeci de dolari.","english":"It was about twenty dollars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11961625"},{"id":"tat-698964","romanian":"Fii iubit.","english":"Be loved.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3289391"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
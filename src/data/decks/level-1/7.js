@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1059609","romanian":"Unde ai învățat franceza?","english":"Where did you learn French?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7482507"},{"id":"tat-1059635","romanian":"Răspunsul tău este greșit.","english":"Your reply is wrong.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7874588"},{"id":"tat-1144331","romanian":"Când încep?","english":"When do I get started?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073634"},{"id":"tat-1136553","romanian":"Trebuie să înveți toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965315"},{"id":"tat-1159796","romanian":"Paharul este plin cu apă.","english":"The glass is full of water.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167541"},{"id":"tat-1159855","romanian":"Găsesc limbile străine foarte interesante.","english":"I find foreign languages very interesting.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168137"},{"id":"tat-712079","romanian":"Zăpada acoperea autobuzul.","english":"Snow covered the bus.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440783"},{"id":"tat-1059686","romanian":"Merită văzute ruinele.","english":"The ruins are worth seeing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963708"},{"id":"tat-1064424","romanian":"L-am văzut fugind.","english":"I saw him run away.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076207"},{"id":"tat-1186834","romanian":"Prefer mersul pe bicicletă.","english":"I prefer biking.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7304101"},{"id":"tat-406031","romanian":"Îmi place baclavaua.","english":"I like baclava.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350448"},{"id":"tat-1091943","romanian":"El nu fumează.","english":"He does not smoke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11591700"},{"id":"tat-709895","romanian":"Şi-a ţinut respiraţia.","english":"He held his breath.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426687"},{"id":"tat-1119695","romanian":"Vorbiți chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511123"},{"id":"tat-1185126","romanian":"Nu mă bag.","english":"I am not getting involved.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323861"},{"id":"tat-448202","romanian":"Lasă-mă.","english":"Go away.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3840680"},{"id":"tat-1153865","romanian":"Fulgerele pot fi periculoase.","english":"Lightning can be dangerous.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098350"},{"id":"tat-1119746","romanian":"Vorbești spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7167492"},{"id":"tat-1136557","romanian":"Ținea la fiul ei.","english":"She cared for her son.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965484"},{"id":"tat-1059615","romanian":"Ești roșu la față.","english":"Your face is red.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7883567"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
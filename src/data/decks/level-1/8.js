@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1151776","romanian":"Azi e luni.","english":"Today is Monday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118747"},{"id":"tat-13","romanian":"Buna seara!","english":"Good evening!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1143841","romanian":"Își ține întotdeauna promisiunile.","english":"He always fulfills his promises.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070728"},{"id":"tat-1153784","romanian":"Acum simt la fel.","english":"Now I feel the same.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128604"},{"id":"tat-1136578","romanian":"Nu tradu această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966035"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-411952","romanian":"L-am vizitat pe Dan.","english":"I visited Dan.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272272"},{"id":"tat-862416","romanian":"Fericirea nu se cumpără.","english":"One does not buy happiness.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9462186"},{"id":"tat-1151778","romanian":"Azi e miercuri. Citesc.","english":"Today is Wednesday. I am reading.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119179"},{"id":"tat-1136622","romanian":"Dă-mi o mână de ajutor.","english":"Lend me a hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239816"},{"id":"tat-583829","romanian":"Tom a ajuns ultimul.","english":"Tom was the very last to arrive.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2203704"},{"id":"tat-1064187","romanian":"El are idei ciudate.","english":"He has strange ideas.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066231"},{"id":"tat-708960","romanian":"Ce sporturi îţi plac?","english":"What sports do you like?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420397"},{"id":"tat-1153840","romanian":"Octopusul este în mare.","english":"The octopus is in the sea.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130100"},{"id":"tat-399600","romanian":"Vorbești japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319472"},{"id":"tat-1136594","romanian":"Câinii latră.","english":"Dogs are barking.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966082"},{"id":"tat-1142894","romanian":"Alb?","english":"Is it white?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066019"},{"id":"tat-986454","romanian":"Pisica este cafenie.","english":"The cat is brown.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637038"},{"id":"tat-1147450","romanian":"Ce vârstă aveți?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094234"},{"id":"tat-1108693","romanian":"Pe mâine!","english":"See you tomorrow!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11757270"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
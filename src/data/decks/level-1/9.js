@@ -0,0 +1 @@
+export default {"level":1,"sentences":[{"id":"tat-1195264","romanian":"Vreau să citiți această carte.","english":"I want you to read this book.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7228754"},{"id":"tat-1089714","romanian":"Ea are mulți bani.","english":"She has a lot of money.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11257804"},{"id":"tat-584006","romanian":"Ce gătiți?","english":"What are you cooking?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3168038"},{"id":"tat-1185064","romanian":"Mi-a așteptat răspunsul.","english":"She waited for my reply.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320611"},{"id":"tat-1192699","romanian":"Ne bucurăm că vii.","english":"We are glad you are coming.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/853963"},{"id":"tat-1192845","romanian":"Fața ei s-a albit.","english":"Her face turned pale.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361489"},{"id":"tat-610863","romanian":"Acest suc are gust acru.","english":"This juice tastes sour.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/692737"},{"id":"tat-1119753","romanian":"Vorbești letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7173476"},{"id":"tat-1143208","romanian":"Pretinde că e cinstit.","english":"He claims that he is honest.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069998"},{"id":"tat-698970","romanian":"Viața este scurtă.","english":"Life is short.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3582733"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-487297","romanian":"Eu știu numele său.","english":"I know his name.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270657"},{"id":"tat-1163902","romanian":"Mă asculți?","english":"Are you listening?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196976"},{"id":"tat-705812","romanian":"Mă doare braţul rău.","english":"My arm is hurting badly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963890"},{"id":"tat-698969","romanian":"Stai puțin.","english":"Wait a minute.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3410256"},{"id":"tat-986475","romanian":"Încerci să mă înțelegi?","english":"Try to understand me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637107"},{"id":"tat-1111140","romanian":"Lasă-mă în pace!","english":"Leave me alone!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11790536"},{"id":"tat-1136399","romanian":"Camera are două ferestre.","english":"The room has two windows.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962831"},{"id":"tat-1059516","romanian":"Salut.","english":"Hello!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"},{"id":"tat-1185071","romanian":"Tinde să fie arogant.","english":"He tends to be arrogant.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321261"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
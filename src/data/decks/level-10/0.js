@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-10452045","romanian":"Deși mulți grăiesc vorbe goale în fața ideii de acțiune afirmativă, în realitate, foarte puține minorități sunt angajate.","english":"Although many pay lip service to the idea of affirmative action, in reality, very few minorities get hired.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-584045","romanian":"Să gândim ceea ce nu simţim înseamnă sa ne minţim pe noi înşine, în acelaşi mod în care ii minţim pe ceilalţi când nu spunem ceea ce gândim.","english":"To think what we do not feel is to lie to ourselves, in the same way that we lie to others when we say what we do not think.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262929"},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"},{"id":"tat-12058655","romanian":"Zonele umede adăpostesc o gamă largă de specii de plante, printre care coada-șoricelului, stufărișurile și nuferi.","english":"Wetlands are home to a vast array of plant species, including cattails, reeds, and water lilies.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136687","romanian":"Mai întâi cred că primul lucru pe care îl observă un străin ajuns în China este cu siguranță mărimea țării.","english":"Firstly, I think that the first time each foreigner is in China, the earliest impression is certainly the size of the country.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239573"},{"id":"tat-11673611","romanian":"A doua mea învățătoare la școala primară (1941) a fost o frumoasă blondă pe nume Helena.","english":"My second primary school teacher (1941) was a beautiful blonde named Helena.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536171","romanian":"Sunt o persoană cu defecte, dar acestea sunt defecte de care se poate scăpa ușor.","english":"I am a flawed person, but these are flaws that can easily be fixed.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-487040","romanian":"Noi am trăit în Osaka timp de zece ani înainte de a ne muta in Tokyo.","english":"We had lived in Osaka for ten years before we came to Tokyo.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435976"},{"id":"tat-6709926","romanian":"Tom, un milionar care a făcut avere prin propriile forțe, a trăit într-o sărăcie abjectă când era copil.","english":"Tom, a self-made millionaire, had lived in abject poverty as a child.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1192848","romanian":"Se face din ce în ce mai frig dimineața și seara. Frunzele copacilor vor deveni în curând roșii și galbene.","english":"It is getting colder and colder morning and evening. The leaves of trees will soon turn red or yellow.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361557"},{"id":"tat-4995608","romanian":"Sunt mari diferențe de viteză de bandă largă și de calitate de la o țară la alta.","english":"There are big differences in broadband speed and quality from country to country.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136830","romanian":"Persoanele care călătoresc în străinătate trebuie întotdeauna să se obișnuiască cu mâncăruri noi.","english":"People traveling abroad always have to get used to new food.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966321"},{"id":"tat-12151855","romanian":"Mi-am pierdut portofelul cu niște bani, buletinul de identitate și cardul de student.","english":"I lost my wallet with some money, my ID, and my student card.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-218","romanian":"Colaborarea internationala este esentiala pentru progresul stiintific.","english":"International collaboration is essential for scientific progress.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-2536248","romanian":"Dacă aș vrea să te sperii, ți-aș spune ce am visat acum câteva săptămâni.","english":"If I wanted to scare you, I would tell you what I dreamt about a few weeks ago.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153159","romanian":"Bunicul meu a adunat o avere mare pe piaţa stocurilor şi apoi a pierdut-o în întregime peste noapte.","english":"My grandfather amassed a great fortune in the stock market and then lost it all over night.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1751960"},{"id":"tat-212","romanian":"Rezultatele cercetarii au demonstrat ca teoria initiala era corecta.","english":"The research results demonstrated that the initial theory was correct.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-4993423","romanian":"Opozanții spun că culturile modificate genetic se pot poleniza încrucișat și pot strica alte culturi.","english":"Opponents say genetically engineered crops can cross-pollinate and damage other crops.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143107","romanian":"Jocul shiritori se joacă luând silaba finală a cuvântului spus de persoana dinainte și apoi următoarea persoană caută un cuvânt care începe cu acel sunet.","english":"The game of shiritori is played by taking the final sound of the word spoken by the person before you, and then the next person looks for a word that begins with that sound.","difficulty":10,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070029"},{"id":"tat-6767614","romanian":"În realitate, explicația este un pic mai complicată decât asta, dar ai înțeles esențialul.","english":"In reality, the explanation is a bit more complicated than this, but you get the gist.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-227","romanian":"Conceptul de libertate individuala a evoluat semnificativ de-a lungul istoriei.","english":"The concept of individual freedom has evolved significantly throughout history.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6828262","romanian":"O persoană nu este niciodată prea bătrână pentru a se dezvăța de obiceiurile proaste.","english":"One is never too old to unlearn bad habits.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4994597","romanian":"Teroriștii au promis că eliberează ostaticul dacă președintele poate să stea într-un picior preț de un minut.","english":"The terrorists promised to release the hostage if the president is able to stand on one leg for a minute.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6673370","romanian":"Este posibil să crezi că, comentariul tău a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-10450614","romanian":"Biletele sunt 30 de dolari pentru adulți și 15 de dolari pentru copiii de peste 4 ani.","english":"Tickets are $30 for adults and $15 for children over 4 years old.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1138145","romanian":"Anul trecut în Filipine, cutremurele şi valurile gigantice au produs moartea a mai mult de 6000 de oameni.","english":"Last year in the Philippines, earthquakes and tidal waves resulted in the deaths of more than 6000 people.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-240","romanian":"Epistemologia contemporana pune sub semnul intrebarii pretentia la cunoastere obiectiva absoluta.","english":"Contemporary epistemology questions the claim to absolute objective knowledge.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-239","romanian":"Reconcilierea aparentelor contradictii intre determinism si libertate ramane o provocare filozofica majora.","english":"Reconciling the apparent contradictions between determinism and freedom remains a major philosophical challenge.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-7166713","romanian":"Am fost uimit de îndrăzneala elevului, de a-i pune lectorului o astfel de întrebare personală.","english":"I was amazed at the audacity of the student to ask the lecturer such a personal question.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11663746","romanian":"Toki Pona nu este o limbă care trebuie vorbită, ci doar care trebuie citită și scrisă.","english":"Toki Pona is not a language to be spoken, but only to be read and written.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4303252","romanian":"Noi priveam pasărea mâncând firimiturile; apoi am strănutat, și ea a dispărut într-o clipă.","english":"We were watching the bird eat the crumbs; then I sneezed, and he was gone in a flash.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12111968","romanian":"Dacă măslinii ar cunoaște mâinile care i-au plantat, uleiul lor ar deveni lacrimi.","english":"If olive trees knew the hands that planted them, their oil would become tears.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-226","romanian":"Indiferent de circumstante, trebuie sa ne pastram calmul si sa gandim clar.","english":"Regardless of circumstances, we must stay calm and think clearly.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1193104","romanian":"Au eşuat amândoi în găsirea celei mai serioase probleme cu care s-a confruntat vreodată planeta noastră.","english":"They have both failed to find the most serious problem that has ever faced our planet.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1043821"},{"id":"tat-10830414","romanian":"Au refuzat să-mi plătească salariul pentru că am uitat să completez corect formularele.","english":"They refused to pay my salary because I forgot to fill out the forms correctly.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6871781","romanian":"Acea persoană m-a întrebat cine sunt, dar nu am considerat necesar să îi răspund.","english":"That person asked me who I was, but I did not deem it necessary to answer him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5037534","romanian":"Ce zici despre formarea unui grup pe Facebook cu scopul de a discuta studierea limbilor străine?","english":"What about putting together a group on Facebook so we can discuss studying foreign languages?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-862376","romanian":"Din cauză că lumina călătoreşte mai repede decât sunetul, unii oameni par geniali înainte de a suna stupizi.","english":"It is because light travels faster than sound that some people look brilliant before sounding stupid.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9457136"},{"id":"tat-582948","romanian":"Democrația este cea mai proastă formă de guvernământ, cu excepția tuturor celorlalte care au fost încercate.","english":"Democracy is the worst form of government, except all the others that have been tried.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6569015"}],"stories":[{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."},{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-6599852","romanian":"Din cauza unor circumstanțe neprevăzute, excursia noastră în munți, din acest weekend, va fi anulată.","english":"Due to unforeseen circumstances, our trip to the mountains this weekend will be cancelled.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-225","romanian":"Tehnologia digitala transforma fundamental modul in care comunicam.","english":"Digital technology is fundamentally transforming the way we communicate.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-229","romanian":"Filozofia ne invita sa punem sub semnul intrebarii ceea ce consideram evident.","english":"Philosophy invites us to question what we consider obvious.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-215","romanian":"Prin urmare, trebuie sa luam masuri imediate pentru a rezolva problema.","english":"Therefore, we must take immediate measures to solve the problem.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6637595","romanian":"Din punctul de vedere al designului arhitectural, pot exista mai multe alternative cu privire la această abordare.","english":"From the standpoint of architectural design, there can be more alternatives to this approach.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-11639745","romanian":"Cum poate fi numită această Putere care a creat viața, timpul și atâtea trilioane de stele?","english":"What can be called this Power that created life, time and so many trillions of stars?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1192806","romanian":"După ce a jucat atât de prost tot jocul, echipa a plecat cu coada între picioare.","english":"After playing so badly for the entire game, the team walked off with their tails between their legs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354510"},{"id":"tat-501535","romanian":"Cel care, mai ieri, socotea că îndrumă, conduce — se pomenește dintr-o dată întins țeapăn într-o cutie de lemn, iar cei din jur, dându-și seama că nu mai e bun de nimic, îl ard într-un cuptor.","english":"The one that just yesterday said he was guiding and leading finds himself, out of the blue, lying stiff in a wooden box; the others, after realising that he was worthless, burnt him in a furnace.","difficulty":10,"wordCount":36,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4685148"},{"id":"tat-7187127","romanian":"O galaxie este un grup de stele, praf și gaze și este susținută de către gravitație.","english":"A galaxy is a cluster of stars, dust, and gas which is held together by gravity.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1192775","romanian":"Majoritatea oamenilor spun că cel mai bun mod de a învăţa o limbă străină este să o înveți de la un vorbitor nativ.","english":"Most people say that the best way to learn a foreign language is to learn from a native speaker.","difficulty":9,"wordCount":23,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364285"},{"id":"tat-2536699","romanian":"Într-un dicționar ca acesta ar trebui să existe cel puțin două propoziții cu „frigider”.","english":"In a dictionary like this one there should be at least two sentences with \"fridge\".","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1144346","romanian":"În timp ce în metafizică cea mai simplă cale este să condamne toate metafizicile ca fiind nonsens, cea mai simplă cale în morală este să înalţi practica comună la moralul absolut.","english":"While the easiest way in metaphysics is to condemn all metaphysics as nonsense, the easiest way in morals is to elevate the common practice of the community into a moral absolute.","difficulty":10,"wordCount":31,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073854"},{"id":"tat-7726661","romanian":"Dacă n-ar fi fost zăpadă, am fi putut să ne urcăm pe munte.","english":"If it were not for the snow, we could climb the mountain.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153823","romanian":"Russell a fost un filozof strălucitor, dar chiar și cea mai simplă activitate practică îl depășea.","english":"Russell was a brilliant philosopher, but even the simplest practical task was quite beyond him.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129790"},{"id":"tat-1153812","romanian":"O republică este o națiune al cărei conducător nu este un rege sau o regină, ci un președinte.","english":"A republic is a nation whose head is not a king or queen, but a president.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129049"},{"id":"tat-407952","romanian":"Imediat ce îi contactați pe prietenii dumneavoastră, spuneți-le că se apropie o avalanșă.","english":"As soon as you contact your friends, tell them that an avalanche is coming.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525177"},{"id":"tat-10452012","romanian":"Actualul imn național al Georgiei a fost acceptat în 2004, când Saakashvili a ajuns la putere.","english":"The current national anthem of Georgia was accepted in 2004, when Saakashvili came to power.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-220","romanian":"Responsabilitatea sociala a corporatiilor devine tot mai importanta.","english":"Corporate social responsibility is becoming increasingly important.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-2837196","romanian":"Arată-mi faţa ta şi lasă-mă să-ţi aud glasul, căci glasul tău este dulce, iar faţa ta este încântătoare!","english":"Shew me thy face, let thy voice sound in my ears: for thy voice is sweet, and thy face comely.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-10452185","romanian":"Într-o cafenea din Jakarta, Indonezia, proprietarii doresc să promoveze comunicația, înțelegerea și toleranța angajând oameni fără auz.","english":"At a coffee shop in Jakarta, Indonesia, the owners want to promote communication, understanding and tolerance by employing people who can’t hear.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-7166872","romanian":"Adoptarea unei diete cu conținut scăzut de calorii, vă va crește durata de viață.","english":"Adopting a low calorie diet will increase your lifespan.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2568442","romanian":"E nevoie de înțelepciune pentru a înțelege înțelepciunea: muzica nu înseamnă nimic dacă publicul e surd.","english":"It requires wisdom to understand wisdom: the music is nothing if the audience is deaf.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1192831","romanian":"La acest centru de învățare a limbilor, se predau aproximativ 15 limbi internaționale inclusiv limba engleză.","english":"At this language centre, about 15 international languages are taught, including English.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360495"},{"id":"tat-7115229","romanian":"Dacă se va legaliza vânzarea de organe, atunci eventuale probleme de sănătate pot să apară.","english":"If the sale of organs is legalised, potential health problems may arise.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11674204","romanian":"Prima mea profesoară se numea Iracema. Iracema este, de asemenea, numele uneia dintre surorile mele.","english":"My first teacher was called Iracema. Iracema is also the name of one of my sisters.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-217","romanian":"Experienta ne-a invatat ca rabdarea este cea mai importanta virtute.","english":"Experience has taught us that patience is the most important virtue.","difficulty":8,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5227954","romanian":"Însoțitoarea de zbor l-a zgâlțâit pe Tom ca să-l trezească și i-a spus că avionul aterizase.","english":"The flight attendant shook Tom awake and told him that the plane had landed.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568515","romanian":"De fiecare dată când mă alătur unui nou joc de Warcraft, dau de o nouă echipă de adversari.","english":"Every time I join a new game of Warcraft, I am pitted against a new team of adversaries.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-2034608","romanian":"Precum a demonstrat din abundenţă George Bush, a fi președintele Statelor Unite necesită doar o inteligență moderată.","english":"As George Bush has amply demonstrated, being president of the U.S. requires only a modicum of intelligence.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-11651384","romanian":"Limba română este mai puțin asemănătoare cu portugheza, spaniola, italiana și franceza decât am crezut.","english":"Romanian is less similar to Portuguese, Spanish, Italian, and French than I thought.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5144503","romanian":"Subiectul unei propoziții este, de obicei, o persoană sau un lucru care efectuează acțiunea indicată de verb.","english":"The subject of a sentence is usually a person or a thing performing the action shown by the verb.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-235","romanian":"Dialectica dintre traditie si modernitate defineste in mare masura discursul cultural romanesc actual.","english":"The dialectic between tradition and modernity largely defines current Romanian cultural discourse.","difficulty":10,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-8741689","romanian":"Samuel și Michael vorbeau despre o fată pe care Bryan a cunoscut-o în Brazilia anul trecut.","english":"Samuel and Michael were talking about a girl Bryan met in Brazil last year.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1153771","romanian":"Acel hotel parcurge într-adevăr tot drumul pentru a se asigura că oaspeții săi se simt ca acasă.","english":"That hotel really goes the extra mile to make sure their guests feel at home.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128474"},{"id":"tat-706018","romanian":"Dacă este adevărat că grecii le interziceau femeilor să meargă la teatru, atunci procedau corect; pentru că așa cu siguranța ar fi putut să audă ceva.","english":"If it is true that the Greeks forbade women to go to the play, they acted in a right way; for they would at any rate be able to hear something.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968848"},{"id":"tat-6673371","romanian":"Este posibil să credeți că, comentariul dumneavoastră a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6581888","romanian":"Ar fi trebuit să fii mai atent și să nu te încrezi în el.","english":"You should have known better than to trust him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12517381","romanian":"Igor a descoperit o urmă de bocanc în niște noroi moale, nu departe de cortul său.","english":"Igor discovered a bootprint in some soft dirt not far from his tent.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-1163897","romanian":"Ce amabil din partea lui să ne ajute să ne mutăm într-o zi atât de ploioasă!","english":"How kind of him to help us move on such a rainy day!","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196806"},{"id":"tat-1185121","romanian":"Won-ul este folosit atât în Coreea de Nord, cât și în Coreea de Sud. Simbolul său este \"₩\".","english":"Won is used in both North Korea and South Korea. Its symbol is \"₩\".","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323802"},{"id":"tat-1137975","romanian":"Am putut observa clar că munca grea a început să-și lase amprenta asupra sănătății sale.","english":"I could clearly see that the hard work had begun to tell on his health.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6635545","romanian":"În ciuda faptului că, în medie, femeile sunt mai inteligente decât bărbații, majoritatea geniilor sunt bărbați.","english":"Notwithstanding the fact that on average women are more intelligent than men, most geniuses are men.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12047689","romanian":"Deși e de la sine înțeles, mai bine ar fi să se spună.","english":"While it goes without saying, it would go even better if it was said.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-224","romanian":"Dezvoltarea sustenabila trebuie sa fie prioritatea noastra principala.","english":"Sustainable development must be our main priority.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-238","romanian":"Hermeneutica textelor literare clasice continua sa ofere perspective noi asupra conditiei umane.","english":"The hermeneutics of classic literary texts continues to offer new perspectives on the human condition.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2536724","romanian":"Matematicieni sunt poeți, cu excepția faptului că ei trebuie să dovedească ceea ce creează fantezia lor.","english":"Mathematicians are poets, except that they have to prove what their fantasy creates.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9819149","romanian":"Creșterea incontrolabilă a populației mondiale va duce inevitabil la războaie, crize economice și umanitare.","english":"The uncontrolled growth of world population will inevitably lead to wars, economic and humanitarian crises.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5226154","romanian":"Tom și-a abandonat mașina, care a rămas fără benzină, și a început să meargă pe jos.","english":"Tom abandoned his car that had run out of gasoline and started walking.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-233","romanian":"Progresul autentic presupune nu doar inovatie tehnica, ci si dezvoltare morala.","english":"Authentic progress requires not just technical innovation, but also moral development.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-13619308","romanian":"În legătură cu ce subiect ești în dezacord cu cei mai mulți oameni pe care îi cunoști?","english":"What’s something you disagree on with most people you know?","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-231","romanian":"Arta are capacitatea unica de a transcende barierele culturale si lingvistice.","english":"Art has the unique ability to transcend cultural and linguistic barriers.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-10788926","romanian":"Domnul Smith nu este disponibil. Doriți să vă faceți o programare pentru a veni să-l vedeți?","english":"Mr. Smith is not available. Would you like to make an appointment to come see him?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4993240","romanian":"Experții spun că prețul cafelei crește în primul rând pentru că oamenii sunt dispuși să plătească mai mult.","english":"Experts say coffee prices are rising mainly because people are willing to pay more.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-6764266","romanian":"Pompierii voluntari au luptat împotriva vâlvătăii cu mult curaj, dar cu puțină considerație pentru propria lor siguranță.","english":"The volunteer firefighters fought the blaze bravely, with scant regard for their own safety.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-5233192","romanian":"Crezi că Tom ar considera să se întâlnească cu sora mea mai tânără?","english":"Do you think Tom would consider dating my younger sister?","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"},{"id":"tat-8762418","romanian":"Valurile mă aruncau fără milă dintr-o parte într-alta, în timp ce mă zbăteam să-mi țin răsuflarea.","english":"The waves were tossing me viciously to and fro as I struggled to hold my breath.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-6581970","romanian":"Medalia de Onoare a Congresului este cea mai importantă distincție la care un soldat poate aspira.","english":"The Congressional Medal of Honor is the highest award that any soldier can aspire to.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-864483","romanian":"Fiecare este o lună, și are o parte întunecată pe care nu o arată nimănui niciodată.","english":"Everyone is a moon, and has a dark side which he never shows to anybody.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6827316"},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13612831","romanian":"Tom a spus că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-222","romanian":"Implementarea noilor politici va necesita resurse considerabile.","english":"Implementing the new policies will require considerable resources.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-221","romanian":"Trebuie sa evaluam cu atentie toate optiunile inainte de a decide.","english":"We must carefully evaluate all options before deciding.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-5165096","romanian":"Când vaca zboară la înălțime și boul zboară aproape de sol, probabil că este o tornadă.","english":"When the cow flies high and the ox flies low, there probably is a twister.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568506","romanian":"Un cititor viclean trebuie să fie dispus să cântărească tot ceea ce citește, inclusiv sursele anonime.","english":"An astute reader should be willing to weigh everything they read, including anonymous sources.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1059634","romanian":"Îmi place să merg în parc și să mă uit la copii distrându-se pe terenul de joacă.","english":"I like to go to the park and watch the children in the playground enjoying themselves.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10275429"},{"id":"tat-8762560","romanian":"Când vecinii ei au fost bolnavi, ea a rugat un medic să le dea niște medicamente.","english":"When her neighbours were ill, she asked a doctor to give them some medicine.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-584199","romanian":"Într-un articol recent despre activităţi care să-ţi antreneze mintea, se menţionează Esperanto precum şi Sudoku, ceea ce denotă ca Esperanto devine parte a culturii de masă.","english":"In a recent article about activities to keep your brain young, they mention Esperanto along with Sudoku, which shows that Esperanto is becoming part of popular culture.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803575"},{"id":"tat-216","romanian":"Literatura romana clasica reflecta lupta pentru identitate nationala.","english":"Classic Romanian literature reflects the struggle for national identity.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1143148","romanian":"Dar un om nu este făcut pentru înfrângere. Un om poate fi distrus, dar nu învins.","english":"But a man is not made for defeat. A man can be destroyed but not defeated.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068955"},{"id":"tat-1143142","romanian":"Dacă studenții în ziua de azi ar avea mai mult timp liber, ar putea arăta mai mult interes pentru politică.","english":"If students today had more free time, they might show more interest in politics.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068924"},{"id":"tat-5044147","romanian":"Rata șomajului în Japonia a fost de 3,4 la sută în luna septembrie a anului 2015.","english":"The unemployment rate in Japan was 3.4 percent in September of 2015.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9028832","romanian":"Tom provenea dintr-un mediu umil, dar a devenit unul dintre cei mai bogați oameni din țară.","english":"Tom was from a humble background, but he became one of the richest men in the country.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136714","romanian":"Destul de curând a venit un excavator care a tăiat un drum prin dealul acoperit cu margarete.","english":"Pretty soon along came a steam shovel and dug a road through the hill covered with daisies.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226376"},{"id":"tat-6710378","romanian":"De-a lungul timpului, acțiunea valurilor erodează stâncile și, prin urmare, le face să cadă în ocean.","english":"Over time, wave action undercuts sea cliffs and thereby causes them to fall into the ocean.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6614182","romanian":"Ozonul este o moleculă compusă din trei atomi de oxigen și apare în natură în cantități reduse.","english":"Ozone is a molecule comprised of three oxygen atoms that occurs naturally in small amounts.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1137558","romanian":"Această aplicație vă va lăsa să sincronizaţi fotografiile și muzica dumneavoastră între toate aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-2568461","romanian":"Cel mai lent în a promite este și cel mai credincios promisiunii atunci când o face.","english":"The slowest one to make a promise is the most faithful one in keeping it.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144311","romanian":"A privit șirul de cocori agăţat de tavan, pe care fratele ei Masahiro l-a agățat acolo pentru ea.","english":"She looked at her flight of cranes hanging from the ceiling, which her brother Masahiro had hung there for her.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073447"},{"id":"tat-3629565","romanian":"În aritmetica iubirii, unu plus unu fac totul, pe când doi minus unu este egal cu zero.","english":"In the arithmetic of love, one plus one makes a whole, and two minus one equals zero.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9839372","romanian":"Părtidelor nu li se permite să discute propunerile lor politice în timpul dezbaterii.","english":"Parties are not allowed to discuss their political propositions during the debate.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5131088","romanian":"Să-i dai lui un sfat e ca și cum ai vorbi cu un perete de cărămidă.","english":"Giving advice to him is like talking to a brick wall.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536737","romanian":"Cele mai multe școli au fost concepute nu pentru a transforma societatea, ci pentru a o reproduce.","english":"Most schools were designed not to transform society, but to reproduce it.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-213","romanian":"In ciuda dificultatilor, echipa a reusit sa termine proiectul la timp.","english":"Despite the difficulties, the team managed to finish the project on time.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6581957","romanian":"O parte din studenți care sunt prinși copiind la examene nici măcar nu se jenează.","english":"Some of the college students who are caught cheating on the exams do not even blush.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-10242320","romanian":"Arătau și aveau gust de creveți, dar vă pot asigura că aceia nu erau creveți adevărați.","english":"They looked and tasted like shrimps, but I can assure you those were not real shrimps.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-8773155","romanian":"Layla a intrat într-o depresie profundă în urma pierderii celei mai bune prietene a ei, Salima.","english":"Layla slipped into a deep depression over the loss of her best friend, Salima.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-219","romanian":"Analiza detaliata a datelor a relevat tendinte neasteptate.","english":"Detailed data analysis revealed unexpected trends.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1143211","romanian":"Patru metri din acest material costă nouă franci; deci doi metri costă patru franci și jumătate.","english":"Four metres of this material cost nine francs; therefore, two metres cost four and a half francs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070001"},{"id":"tat-236","romanian":"Interdependenta globala a economiilor impune o regandire fundamentala a relatiilor internationale.","english":"The global interdependence of economies requires a fundamental rethinking of international relations.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-582914","romanian":"Dacă cineva ridică din sprânceană, poate însemna \"Vreau să fac sex cu tine\", dar și \"Ceea ce tocmai ai spus mi se pare o mare prostie.\"","english":"If you raise an eyebrow, it can mean \"I want to have sex with you\", but also \"I find that what you just said is completely idiotic.\"","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6439042"},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-232","romanian":"Intrebarea fundamentala nu este ce stim, ci cum aplicam ceea ce stim.","english":"The fundamental question is not what we know, but how we apply what we know.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-12336953","romanian":"Mi-aș dori să pot vorbi franceza destul de bine pentru a obține o slujbă la acea companie.","english":"I wish I could speak French well enough to get a job at that company.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9839369","romanian":"După ce și-a dat jos ochelarii și și-a desfăcut părul, Mary arăta ca o persoană complet diferită.","english":"After removing her glasses and untying her hair, Mary looked like a completely different person.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9263288","romanian":"Tom mi-a spus că ar fi ușor să o conving pe Mary să doneze niște bani.","english":"Tom told me it would be easy to persuade Mary to donate some money.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136683","romanian":"În general, profesorul controlează clasa stând în picioare în fața elevilor și făcându-le morală în timpul lecției.","english":"The teacher controls the class, usually standing in front of the students and lecturing to them during the lesson.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7217517"}],"stories":[{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"},{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"}],"recipes":[]};
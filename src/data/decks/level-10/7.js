@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-7187048","romanian":"Tom speră să obțină un profit în acest an, chiar dacă profitul va fi unul mic.","english":"Tom hopes to make a profit this year, albeit a small one.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144321","romanian":"Cam acum patru ani, tendonul lui Ahile a început să mă doare și mi s-a spus că e tendinită.","english":"About four years ago my Achilles tendon started to hurt and I was told it was Achilles tendonitis.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073567"},{"id":"tat-5232576","romanian":"Îți amintești perioada când l-am vizitat pe Tom atunci când el încă era adolescent?","english":"Can you remember the time we visited Tom when he was still a teenager?","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-586150","romanian":"Înţeleg perfect italiana, se lăudă ea în timp ce alegea meniul, dar când i-a fost servită mâncarea, nu era nicidecum ce aşteptase.","english":"I understand Italian perfectly, she boasted while choosing a dish from the menu, but when the food was served, it was not at all what she expected.","difficulty":10,"wordCount":22,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7778534"},{"id":"tat-5316056","romanian":"Cel mai periculos lucru pe care Tom l-a făcut vreodată a fost săritura cu coarda elastică.","english":"The most dangerous thing Tom ever tried to do was bungee jumping.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6713884","romanian":"Băuturile pe bază de zahăr nu au valoare nutritivă și contribuie semnificativ la creșterea în greutate.","english":"Sugary drinks have no nutritional value and contribute significantly to weight gain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-583874","romanian":"Motivul principal pentru care prietenii își părăsesc prietenii pe Facebook e din cauza prea multor postări inutile.","english":"The number one reason why friends dump their friends on Facebook is too many useless posts.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/954288"},{"id":"tat-13612858","romanian":"Tom spuse că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1163903","romanian":"Descărcarea Metodei de Introducere cu Tastă Unică pentru Limba Vietnameză va începe în curând.","english":"Your Unikey Vietnamese Input Method download will start shortly.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196981"},{"id":"tat-2534227","romanian":"Terapeutul l-a făcut în sfârșit să vorbească despre cele prin care a trecut în timpul războiului.","english":"The therapist finally got him to open up about what he went through during the war.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136817","romanian":"Dreptul apei este domeniul dreptului care se ocupă cu proprietatea, controlul și utilizarea apei ca resursă.","english":"Water law is the field of law dealing with the ownership, control, and use of water as a resource.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966559"},{"id":"tat-228","romanian":"Paradoxal, cu cat stim mai mult, cu atat devenim mai constienti de ignoranta noastra.","english":"Paradoxically, the more we know, the more aware we become of our ignorance.","difficulty":9,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-8746440","romanian":"Anglia și Scoția au fost unificate la 1 mai 1707, pentru a forma Regatul Marii Britanii.","english":"England and Scotland were unified on May 1, 1707, to form the Kingdom of Great Britain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568518","romanian":"Sarah a avut suficient discernământ pentru a realiza că prietenii ei încercau să-i facă o farsă.","english":"Sarah was discerning enough to realize that her friends were trying to prank her.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-234","romanian":"Complexitatea sistemelor sociale contemporane depaseste adesea capacitatea noastra de intelegere imediata.","english":"The complexity of contemporary social systems often exceeds our capacity for immediate understanding.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-708998","romanian":"Noaptea a fost atât de rece încât, atunci când m-am întors, eram aproape îngheţat.","english":"The night was so chilly that when I returned I was almost frozen.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420255"},{"id":"tat-4974910","romanian":"Ieri nu a fost nici prea cald, nici prea rece. A fost o zi ideală pentru o plimbare.","english":"Yesterday it was neither too warm nor too cold. It was an ideal day for taking a walk.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-4987451","romanian":"Noi credem că este cu adevărat posibil ca cele două sisteme sociale diferite să coexiste în pace.","english":"We believe that peaceful coexistence of the two different social systems is fully possible.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6582958","romanian":"Tom nu avea nici o idee despre ce ar fi trebuit să se facă.","english":"Tom had no idea what needed to be done.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."}],"recipes":[]};
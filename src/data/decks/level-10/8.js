@@ -0,0 +1 @@
+export default {"level":10,"sentences":[{"id":"tat-237","romanian":"Etica responsabilitatii ne cere sa anticipam consecintele actiunilor noastre asupra generatiilor viitoare.","english":"The ethics of responsibility requires us to anticipate the consequences of our actions on future generations.","difficulty":10,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6638268","romanian":"Producția industrială a animalelor, este principalul factor care contribuie la sporirea gazelor cu efect de seră.","english":"The industrial production of livestock is the leading contributor to greenhouse gases.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-230","romanian":"Relatia dintre individ si societate ramane una dintre cele mai complexe chestiuni.","english":"The relationship between individual and society remains one of the most complex issues.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-584323","romanian":"Dacă putem compara o limba maternă cu un copac, care s-a dezvoltat de-a lungul timpului, Esperanto poate fi comparată cu un copac artificial, care a fost creat artificial.","english":"If a natural language can be compared to a tree, which has developed during the course of time, Esperanto can be compared to a plastic tree, which was created artificially.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803499"},{"id":"tat-582926","romanian":"Există oameni atât de flămânzi în lume, încât Dumnezeu nu le poate apărea decât sub formă de pâine.","english":"There are people in the world so hungry, that God cannot appear to them except in the form of bread.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6440496"},{"id":"tat-9028817","romanian":"Se pare că pastilele pe care le-am luat mai devreme au fost eficiente.","english":"It seems that the pills I took earlier were effective.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136694","romanian":"Demis în urma unei lovituri militare în septembrie 2006, fostul prim-ministru al Thailandei s-a reîntors în țară după aproape un an și jumătate de exil.","english":"Deposed in a military coup in September 2006 and having effectively been in exile, the Former premier of Thailand Thaksin has returned after about a year and a half.","difficulty":9,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239539"},{"id":"tat-7361805","romanian":"Casa noastră actuală este prea mică, așa că ne-am decis să ne mutăm.","english":"Our current house is too small, so we decided to move.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4993134","romanian":"Oficialii chinezi spun că creșterea economică a scăzut la minimul ultimilor trei ani din cauza economiei globale.","english":"Chinese officials say economic growth has dropped to a three-year low because of the world economy.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-223","romanian":"Diversitatea culturala contribuie la imbogatirea societatii noastre.","english":"Cultural diversity contributes to the enrichment of our society.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-2536642","romanian":"Cei selecționați vor trebui să se confrunte cu teste medicale și psihologice ample.","english":"Those selected will have to face extensive medical and psychological tests.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4988491","romanian":"Ursul s-a luptat cu vecinul meu până a obosit, apoi cu ultimele puteri a fugit în pădure.","english":"The bear fought with my neighbour until he got tired. Afterwards, with the last of his strength, he fled into the forest.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9408703","romanian":"Tom a spus că a crezut că i se va permite lui Mary să facă asta.","english":"Tom said he thought that Mary might be allowed to do that.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-584098","romanian":"O traducere e ca o femeie. Dacă e frumoasă, nu e fidelă. Dacă e fidelă, nu este cu siguranţă frumoasă.","english":"Translation is like a woman. If it is beautiful, it is not faithful. If it is faithful, it is most certainly not beautiful.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7802396"},{"id":"tat-1153805","romanian":"Atleţii s-au antrenat din greu în fiecare zi pentru a fi în formă maximă la jocurile olimpice de vară.","english":"The athletes trained hard every day to be at their best for the Summer Olympics.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128898"},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-13621234","romanian":"Khan menționează că Hunter este dispărut fără urmă (probabil pentru că nu s-a găsit niciun corp).","english":"Khan mentions that Hunter is M.I.A. (probably because no body was found).","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1192795","romanian":"Teledonul este un program TV francez organizat în fiecare an pentru a colecta fonduri în scopul finanțării de cercetări medicale.","english":"The telethon is a French TV program organized every year to collect funds in order to finance medical research.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351508"},{"id":"tat-211","romanian":"Situatia economica actuala ne obliga sa facem schimbari importante.","english":"The current economic situation forces us to make important changes.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-6918482","romanian":"Am fost prea ocupat să-l ajut pe Tom ca să o mai ajut și pe Mary.","english":"I was too busy helping Tom to help Mary.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."}],"recipes":[]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136717","romanian":"Porecla mea este \"Itch\".","english":"I go by the nickname \"Itch.\"","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239594"},{"id":"tat-1279124","romanian":"Bicicleta mea a dispărut.","english":"My bike disappeared.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13117848"},{"id":"tat-1153161","romanian":"Era obișnuită să trăiască dintr-un venit modest.","english":"She was used to living on a small income.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1752003"},{"id":"tat-1119730","romanian":"Vorbești araba?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340381"},{"id":"tat-1059702","romanian":"Dacă aduni trei cu patru, obții șapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758844"},{"id":"tat-1185071","romanian":"Tinde să fie arogant.","english":"He tends to be arrogant.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321261"},{"id":"tat-1153834","romanian":"Puteam auzi gemetele bărbatului rănit.","english":"We could hear the groans of the injured man.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130091"},{"id":"tat-1059636","romanian":"Ieri am stat într-o întâlnire.","english":"Yesterday I was in a meeting.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9557120"},{"id":"tat-1136557","romanian":"Ținea la fiul ei.","english":"She cared for her son.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965484"},{"id":"tat-1153840","romanian":"Octopusul este în mare.","english":"The octopus is in the sea.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130100"},{"id":"tat-709008","romanian":"Una dintre pisici este neagră, cealaltă este maro.","english":"One of the cats is black, the other is brown.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420282"},{"id":"tat-1153798","romanian":"Indiferent de ce joacă pe ecran, Tom arată grozav.","english":"No matter what he plays on the screen, Tom looks great.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128804"},{"id":"tat-1119745","romanian":"Vorbiți spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342518"},{"id":"tat-1136545","romanian":"Fundul oceanului este studiat de câţiva oameni de știință.","english":"The ocean floor is being studied by some scientists.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965763"},{"id":"tat-1064211","romanian":"Despre ce voiai să vorbești cu mine?","english":"What did you want to talk to me about?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069328"},{"id":"tat-411912","romanian":"Merg la film dacă am timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272128"},{"id":"tat-1119725","romanian":"Dragostea e de rahat.","english":"Love sucks.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265056"},{"id":"tat-1136512","romanian":"Era cam douăzeci de dolari.","english":"It was about twenty dollars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11961625"},{"id":"tat-712079","romanian":"Zăpada acoperea autobuzul.","english":"Snow covered the bus.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440783"},{"id":"tat-487287","romanian":"Ei îi place foarte mult școala sa.","english":"She likes her school a lot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270501"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-610910","romanian":"Îmi dai brânza cremă te rog?","english":"Would you pass me the cream cheese, please?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/752477"},{"id":"tat-1195264","romanian":"Vreau să citiți această carte.","english":"I want you to read this book.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7228754"},{"id":"tat-698962","romanian":"Tu crezi că așa ceva este posibil?","english":"Do you think such a thing is possible?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3160552"},{"id":"tat-706134","romanian":"Lui Robert i se spune \"Bob\".","english":"They call Robert \"Bob\".","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974457"},{"id":"tat-1059686","romanian":"Merită văzute ruinele.","english":"The ruins are worth seeing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963708"},{"id":"tat-1185178","romanian":"Mă durea inima pentru păsările aflate pe moarte.","english":"My heart ached for the dying birds.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324325"},{"id":"tat-1064177","romanian":"Dintr-o dată mama a început să cânte.","english":"Suddenly, my mother started singing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070211"},{"id":"tat-399611","romanian":"Bună seara.","english":"Good evening.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1136525","romanian":"Fă-ți temele acum!","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965332"},{"id":"tat-1151783","romanian":"Azi e sâmbătă.","english":"Today is Saturday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119193"},{"id":"tat-1056804","romanian":"Nimănui nu-i place războiul.","english":"No one loves war.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031604"},{"id":"tat-1136876","romanian":"Tom a observat o schimbare la Mary.","english":"Tom noticed a change in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960285"},{"id":"tat-1108693","romanian":"Pe mâine!","english":"See you tomorrow!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11757270"},{"id":"tat-1153891","romanian":"Felicitările mele mâinilor care au făcut asta posibilă.","english":"My compliments to the hands that made this possible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104030"},{"id":"tat-1120161","romanian":"Noi îl cunoaștem.","english":"We know him.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6649770"},{"id":"tat-1185074","romanian":"Ar putea deveni jucător de baseball.","english":"He may become a baseball player.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321358"},{"id":"tat-1059609","romanian":"Unde ai învățat franceza?","english":"Where did you learn French?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7482507"},{"id":"tat-1143140","romanian":"A depus banii din premiu la bancă.","english":"He deposited the prize money in the bank.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068919"},{"id":"tat-1059626","romanian":"Presupun că-ți place de ea.","english":"I suppose you like her.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9777847"},{"id":"tat-487297","romanian":"Eu știu numele său.","english":"I know his name.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270657"}],"stories":[{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-488766","romanian":"Nu toate browserele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268767"},{"id":"tat-1136707","romanian":"Amândoi și-au mâncat ciocolatele până la ultima îmbucătură.","english":"They both ate their chocolates down to the very last bite.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226212"},{"id":"tat-1153886","romanian":"Opinia lor contează puțin.","english":"Their opinion matters little.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12103107"},{"id":"tat-1136948","romanian":"Am învățat multe din cărțile lui.","english":"I learned a lot from his books.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956892"},{"id":"tat-862826","romanian":"Mai bine mor de foame decât să fur.","english":"I would rather starve than steal.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014504"},{"id":"tat-30","romanian":"Unde locuiesti?","english":"Where do you live?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-1143116","romanian":"Acest ceas ți-e destinat.","english":"This watch is meant for you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070041"},{"id":"tat-923891","romanian":"Camera arată diferit, acum îmi place mai mult.","english":"The room looks different, now I like it more.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10445017"},{"id":"tat-1089714","romanian":"Ea are mulți bani.","english":"She has a lot of money.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11257804"},{"id":"tat-399598","romanian":"Vorbești italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314459"},{"id":"tat-1153157","romanian":"O asemenea abilitate este nativă pentru el.","english":"Such ability is native to him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749170"},{"id":"tat-1153830","romanian":"Totul este în regulă.","english":"Everything is fine.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130018"},{"id":"tat-1057690","romanian":"Efectele au avut impact mai mult asupra familiilor sărace.","english":"The effects have impacted most on poorer families.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11036698"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-1153793","romanian":"Voi lua o cină cu un prieten.","english":"I am going to eat an evening meal with a friend.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128725"},{"id":"tat-402116","romanian":"Bun venit!","english":"Welcome.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265824"},{"id":"tat-928488","romanian":"Desenele lui Lyod reprezintă persoane din secolul al paisprezecelea.","english":"The drawings Lyod has made show people from the 14th century.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5107153"},{"id":"tat-1136995","romanian":"Sahara este un deșert vast.","english":"The Sahara is a vast desert.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952791"},{"id":"tat-1144720","romanian":"Capitala Cehiei este Praga.","english":"The capital of Czechia is Prague.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076594"},{"id":"tat-1136554","romanian":"Trebuie să învățați toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960194"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
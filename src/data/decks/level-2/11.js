@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1278932","romanian":"Nimeni nu e mai sus de el.","english":"No one is above him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13348271"},{"id":"tat-584349","romanian":"Nu lăsa pe mâine ce poţi face poimâine.","english":"Never put off until tomorrow what you can do the day after tomorrow.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798076"},{"id":"tat-1144325","romanian":"Un adevărat gentilom nu își trădează niciodată prietenii.","english":"A true gentleman never betrays his friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073607"},{"id":"tat-709044","romanian":"De-abia plecasem de acasă când a început ploaia.","english":"I had scarcely left home when it began to rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420334"},{"id":"tat-706060","romanian":"Tu ești prietenul meu.","english":"You are my friend.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970702"},{"id":"tat-1192816","romanian":"Yenul e încă scăzut în raport cu dolarul.","english":"The yen is still low against the dollar.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356233"},{"id":"tat-1108692","romanian":"Ne vedem mâine!","english":"See you tomorrow.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11747448"},{"id":"tat-1149073","romanian":"Migdalul face migdale.","english":"Almonds grow on almond trees.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106102"},{"id":"tat-1136671","romanian":"S-a înfășurat în pătură.","english":"She wrapped herself in a blanket.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239804"},{"id":"tat-1059644","romanian":"A fost foarte prietenos cu toată lumea.","english":"He was very friendly to everybody.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795791"},{"id":"tat-1163901","romanian":"Asculți?","english":"Are you listening?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196975"},{"id":"tat-1147446","romanian":"Astăzi am curs de esperanto.","english":"Today I have an Esperanto class.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094147"},{"id":"tat-13","romanian":"Buna seara!","english":"Good evening!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-406013","romanian":"Copacii erau foarte rari.","english":"The trees were very scarce.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350364"},{"id":"tat-708991","romanian":"Presupun că va întârzia.","english":"I suppose he will be late.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420395"},{"id":"tat-1143685","romanian":"M-am săturat de asta.","english":"I am fed up with it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072255"},{"id":"tat-406815","romanian":"Cum vă numiți?","english":"What is your name?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347334"},{"id":"tat-1278889","romanian":"Nu a fost permis nimănui să părăsească camera.","english":"Nobody was allowed to leave the room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13345377"},{"id":"tat-1136578","romanian":"Nu tradu această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966035"},{"id":"tat-1056686","romanian":"Micul dejun este principala masă a zilei.","english":"Breakfast is the most important meal of the day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029785"}],"stories":[{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1119750","romanian":"Vorbiți suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264927"},{"id":"tat-863630","romanian":"Trebuie să îmi fac o asigurare de sănătate.","english":"I need to purchase health insurance.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9133595"},{"id":"tat-702062","romanian":"Călătoria lor a fost amânată din cauza ploii.","english":"Their trip was postponed because of the rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398899"},{"id":"tat-709040","romanian":"Cu excepţia câtorva greşeli, compunerea ta este perfectă.","english":"Your composition is perfect except for a few mistakes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420329"},{"id":"tat-699676","romanian":"Te iubesc.","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323350"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-1185078","romanian":"Noua lege a fost impusă oamenilor de pe insulă.","english":"The new law was enforced on the people of the island.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321427"},{"id":"tat-584006","romanian":"Ce gătiți?","english":"What are you cooking?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3168038"},{"id":"tat-986476","romanian":"Te iubesc!","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637108"},{"id":"tat-1136809","romanian":"Care e mai veche, această carte sau cealaltă?","english":"Which is older, this book or that one?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966358"},{"id":"tat-1136929","romanian":"Problema rămâne de rezolvat.","english":"The problem remains to be solved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957754"},{"id":"tat-1136912","romanian":"Casa mea e aproape de stația de autobuz.","english":"My house is close to a bus stop.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966001"},{"id":"tat-709900","romanian":"Astfel de incidente sunt destul de obişnuite.","english":"Such incidents are quite common.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426733"},{"id":"tat-1059693","romanian":"Trebuie să fiu acolo până la ora 07.00.","english":"I must be there before 7:00.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758791"},{"id":"tat-1144711","romanian":"Capitala Poloniei este Varșovia.","english":"The capital of Poland is Warsaw.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076553"},{"id":"tat-1031106","romanian":"Îmi place limba occitană.","english":"I like the Occitan language.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10793086"},{"id":"tat-1136556","romanian":"Nu așa îl văd eu.","english":"That is not my idea of him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959323"},{"id":"tat-1136612","romanian":"Ca să spunem adevărul, această propoziţie foloseşte modul conjunctiv.","english":"Truth be told, this sentence uses the subjunctive mood.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966006"},{"id":"tat-1119749","romanian":"Vorbiți engleza și scoțiana?","english":"Do you speak English and Scottish Gaelic?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511206"}],"stories":[{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-582951","romanian":"E puțină apă în găleată.","english":"There is little water in the bucket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665401"},{"id":"tat-1192820","romanian":"Alerg în fiecare zi.","english":"I run every day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356278"},{"id":"tat-699630","romanian":"Poţi rezolva această problemă?","english":"Can you solve this problem?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320215"},{"id":"tat-923814","romanian":"Anumite plante cresc bine cu puțină îngrijire.","english":"Some plants grow well with a minimum of care.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10431937"},{"id":"tat-864488","romanian":"Ea știa să citească când avea patru ani.","english":"She could read when she was four.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855675"},{"id":"tat-1192766","romanian":"Acesta este stiloul cu care a scris faimosul romancier.","english":"This is the pen which the famous novelist wrote with.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357144"},{"id":"tat-1143190","romanian":"Fața ei este concentrată.","english":"Her face is in focus.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069295"},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"},{"id":"tat-1124704","romanian":"Dicţionarul de pe birou este al meu.","english":"The dictionary on the desk is mine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11875296"},{"id":"tat-708921","romanian":"Leagă-ţi şireturile.","english":"Tie your shoelaces.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397940"},{"id":"tat-670629","romanian":"A abandonat visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1626134"},{"id":"tat-1279104","romanian":"Asta e mai frumoasă.","english":"This one is more beautiful.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13113773"},{"id":"tat-1192813","romanian":"Părea tânăr.","english":"He appeared young.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356214"},{"id":"tat-1151742","romanian":"La mulți ani de ziua mondială a protecției animalelor!","english":"Happy World Animal Protection Day!","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118279"},{"id":"tat-1153821","romanian":"Învăț engleza pe cineva.","english":"I teach English to someone.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129727"},{"id":"tat-1153809","romanian":"Acesta e un vin excelent.","english":"This is excellent wine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128986"},{"id":"tat-1136894","romanian":"Aceasta este casa în care a crescut Tom.","english":"This is the house where Tom was brought up.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956357"},{"id":"tat-407936","romanian":"Dacă așa vi s-a spus, probabil că e corect.","english":"If this is the way you were told, it is probably correct.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6437718"},{"id":"tat-1143652","romanian":"Aceasta este gratuită.","english":"This is free.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071965"},{"id":"tat-1136386","romanian":"Vestea despre moartea lui s-a răspândit în jur.","english":"The news of his death spread around.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962818"}],"stories":[{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
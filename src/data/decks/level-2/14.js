@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136795","romanian":"Găina a depus un ou în această dimineață.","english":"The chicken laid an egg this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966349"},{"id":"tat-1143230","romanian":"Mă doare brațul unde m-ai lovit.","english":"I have a very sore arm where you hit me.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068473"},{"id":"tat-712069","romanian":"Socialism sau barbarism.","english":"Socialism or barbarism.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440421"},{"id":"tat-670577","romanian":"Vederea slabă este un handicap pentru un atlet.","english":"Poor sight is a handicap to an athlete.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2423585"},{"id":"tat-670675","romanian":"Poţi să-l alegi pe care îl vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200655"},{"id":"tat-1185108","romanian":"Am fost la Londra.","english":"I have been to London.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195147"},{"id":"tat-399604","romanian":"Vorbiți engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323247"},{"id":"tat-864476","romanian":"Orașul a fost distrus în timpul războiului.","english":"The town was destroyed during the war.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6806128"},{"id":"tat-698940","romanian":"Acest roman mă plictisește.","english":"This novel bores me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2233781"},{"id":"tat-1279041","romanian":"Nimeni nu a venit să mă ajute.","english":"Nobody came to help me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13108759"},{"id":"tat-698950","romanian":"Aceasta este mama mea.","english":"This is my mother.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2736139"},{"id":"tat-1118254","romanian":"Noi nu avem zahăr.","english":"We have no sugar.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6657483"},{"id":"tat-31","romanian":"Cati ani ai?","english":"How old are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-1186840","romanian":"Știam că era plastic, dar părea din lemn.","english":"I knew it was plastic but it tasted like wood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7317802"},{"id":"tat-699632","romanian":"Îţi place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320252"},{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-689399","romanian":"Crăciun fericit!","english":"Merry Christmas!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1781709"},{"id":"tat-408059","romanian":"I-am dat cărțile acestui student.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232754"},{"id":"tat-1136901","romanian":"Maşina noastră a rămas fără combustibil după zece minute.","english":"Our car ran out of gas after ten minutes.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966025"}],"stories":[{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
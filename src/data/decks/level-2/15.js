@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1119756","romanian":"În acest oraș, există trei saloane de înfrumusețare.","english":"In this city, there are three beauty salons.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264837"},{"id":"tat-1136540","romanian":"O poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965189"},{"id":"tat-399606","romanian":"Mulțumesc!","english":"Thank you!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"},{"id":"tat-1192790","romanian":"Oamenii promiseseră deja bani pentru proiectul său.","english":"People have already promised money for his project.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350198"},{"id":"tat-1144284","romanian":"Are o legătură cu furtul.","english":"He has something to do with the robbery.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7510355"},{"id":"tat-1136847","romanian":"I-a cumpărat un pulover.","english":"She bought him a sweater.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966283"},{"id":"tat-1144743","romanian":"Câștigăm o zi.","english":"We are gaining a day.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12077122"},{"id":"tat-1064028","romanian":"De îndată ce m-a văzut a izbucnit în plâns.","english":"As soon as she saw me, she burst out crying.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10913317"},{"id":"tat-709037","romanian":"Du-i înapoi cartea asta.","english":"Take this book back to him.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420326"},{"id":"tat-708987","romanian":"Lasă-mă să tai morcovii.","english":"Let me cut the carrots.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420387"},{"id":"tat-1136513","romanian":"Încetează să te mai duci acolo.","english":"Stop going there.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965707"},{"id":"tat-1136625","romanian":"În caz de incendiu sunați la 119.","english":"In case of fire, you should dial 119.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966144"},{"id":"tat-1064186","romanian":"Tom a cumpărat o casă cu șase camere.","english":"Tom bought a house with six rooms.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066256"},{"id":"tat-923800","romanian":"Prietenia noastră nu a durat.","english":"Our friendship did not last.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10419439"},{"id":"tat-1119728","romanian":"Vorbești franceză?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7421603"},{"id":"tat-705817","romanian":"El a jucat un rol foarte important în afacere.","english":"He played an important part in the enterprise.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963911"},{"id":"tat-709046","romanian":"Engleza este o limbă internaţională.","english":"English is an international language.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420340"},{"id":"tat-1143147","romanian":"Cât costă o cameră?","english":"How much is a room?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068934"},{"id":"tat-923855","romanian":"M-am căsătorit cu o poloneză.","english":"I am married to a Polish woman.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442834"},{"id":"tat-1143236","romanian":"Jimmy e cu doi ani mai mic ca mine.","english":"Jimmy is junior to me by two years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068493"}],"stories":[{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."},{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
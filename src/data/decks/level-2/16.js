@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-408013","romanian":"Ce crezi că are de gând Dana?","english":"What do you think Dana has in mind?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532049"},{"id":"tat-1119732","romanian":"Scuză-mă, vorbești engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144127"},{"id":"tat-586093","romanian":"Dorința e pentru cei care cred în îndeplinirea ei.","english":"Wishing is for those who can believe.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7758342"},{"id":"tat-1143615","romanian":"Îmi place rockul.","english":"I love rock.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071631"},{"id":"tat-1136614","romanian":"Mulțimea a protestat împotriva avortului.","english":"The throng protested against abortion.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966027"},{"id":"tat-1143570","romanian":"Îmi place să dorm.","english":"I like sleeping.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072646"},{"id":"tat-1144339","romanian":"Când a sosit autobuzul, s-a urcat în el.","english":"When the bus came, she got on.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073771"},{"id":"tat-1153879","romanian":"Am confirmat telefonic rezervarea la hotel.","english":"We confirmed the hotel reservations by telephone.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12100238"},{"id":"tat-584010","romanian":"Mi-am pierdut codul pin!","english":"I forgot my PIN number!","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7801864"},{"id":"tat-1136572","romanian":"A trecut pe lângă mine fără să mă observe.","english":"He went by me without noticing me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965942"},{"id":"tat-1136892","romanian":"Studiază pentru test.","english":"They are studying for the test.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966024"},{"id":"tat-399273","romanian":"Bine ați venit!","english":"Welcome.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334977"},{"id":"tat-408049","romanian":"Studentul acesta este american.","english":"This student is American.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220864"},{"id":"tat-1136569","romanian":"Prefer să locuiesc la țară decât la oraș.","english":"I prefer living in the country to living in the city.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9017538"},{"id":"tat-708925","romanian":"Doamna Green ne predă muzica.","english":"Miss Green teaches us music.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397994"},{"id":"tat-1119727","romanian":"Vorbiți franceza?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235766"},{"id":"tat-1136610","romanian":"Cu ajutorul doctorilor, s-a vindecat.","english":"With the help of doctors, she got over her illness.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966026"},{"id":"tat-864477","romanian":"Pe câinele nostru l-am numit White.","english":"We named our dog White.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817260"},{"id":"tat-1143120","romanian":"Inversa unei matrice nepătratice este un lucru periculos.","english":"The inverse of a non-square matrix is a dangerous thing.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068786"},{"id":"tat-1119741","romanian":"Vorbiți klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340242"}],"stories":[{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1163913","romanian":"Poți alerga repede?","english":"Can you run fast?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197018"},{"id":"tat-1064255","romanian":"Tom s-a prefăcut că nu aude nimic.","english":"Tom pretended to not hear a thing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073104"},{"id":"tat-1153871","romanian":"Voi face tot ce îmi stă în putere.","english":"I will do everything in my power.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099026"},{"id":"tat-1143131","romanian":"Fă altora ceea ce vrei să îți facă ţie.","english":"Do to others as you would have them do to you.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068861"},{"id":"tat-1119722","romanian":"El și-a găsit părinții.","english":"He found his parents.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511953"},{"id":"tat-488775","romanian":"Prietena sa este japoneză.","english":"His girlfriend is Japanese.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528911"},{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-406033","romanian":"Îmi face plăcere să merg pe jos.","english":"I like to walk.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350454"},{"id":"tat-1192721","romanian":"A zis ea asta?","english":"She said that?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7136968"},{"id":"tat-1136596","romanian":"Mă asigur că judec un om după personalitatea sa.","english":"I make a point of judging a man by his personality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965974"},{"id":"tat-399599","romanian":"Vorbiți japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319340"},{"id":"tat-399610","romanian":"Bună dimineața.","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-708930","romanian":"Biroul lui este foarte aproape de al meu.","english":"His office is very close to mine.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398356"},{"id":"tat-1143172","romanian":"Explicația lui nu era satisfăcătoare.","english":"His explanation was not satisfactory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069202"},{"id":"tat-698947","romanian":"De ce mă iubești?","english":"Why do you love me?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636872"},{"id":"tat-1136527","romanian":"Făceți-vă temele acum.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965357"},{"id":"tat-583839","romanian":"Tom s-a căsătorit cu o femeie mai în vârsta.","english":"Tom married an older woman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2255151"},{"id":"tat-1136802","romanian":"Îmi place să cânt.","english":"I like singing.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966355"},{"id":"tat-583956","romanian":"Orice ai spune, răspunsul e \"nu\".","english":"No matter what you say, the answer is \"no.\"","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799488"},{"id":"tat-862830","romanian":"Prima oară a fost ales de senat în 1984.","english":"He was first elected to the Senate in 1984.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014508"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1059700","romanian":"Sper să merg în Canada anul viitor.","english":"I hope to go to Canada next year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795786"},{"id":"tat-1144707","romanian":"Capitala Olandei este Amsterdam.","english":"The capital city of the Netherlands is Amsterdam.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076528"},{"id":"tat-1143576","romanian":"Îmi place jazzul.","english":"I like jazz music.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7736870"},{"id":"tat-1136710","romanian":"Nimic nou sub soare.","english":"Nothing new under the sun.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212823"},{"id":"tat-923805","romanian":"Toată lumea caută fericirea.","english":"Everybody seeks happiness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10421099"},{"id":"tat-1192827","romanian":"Unde îmi pot ridica bagajele?","english":"Where can I pick up my baggage?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12359803"},{"id":"tat-1089729","romanian":"Ce zi frumoasă!","english":"What a nice day it is!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11275379"},{"id":"tat-1143144","romanian":"E un lac în fața casei mele.","english":"There is a lake in front of my house.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068930"},{"id":"tat-670639","romanian":"Naivul bărbat era extrem de stânjenit în prezenţa ei.","english":"The naive man was utterly embarrassed in her presence.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681128"},{"id":"tat-1278911","romanian":"Sunt pregătit să te ajut.","english":"I am ready to help you.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13347606"},{"id":"tat-706078","romanian":"Care echipă a câştigat meciul?","english":"Which team won the game?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970911"},{"id":"tat-1143566","romanian":"Îmi place mult viața de la oraș.","english":"I really like city life.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072636"},{"id":"tat-1064365","romanian":"Tom și Mary sunt din același oraș.","english":"Tom and Mary are from the same city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074444"},{"id":"tat-1124701","romanian":"Tortul are un gust dulce.","english":"The cake tastes sweet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11873968"},{"id":"tat-1136919","romanian":"Mike a acționat în calitate de președinte al reuniunii.","english":"Mike acted as chairperson of the meeting.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957760"},{"id":"tat-1201354","romanian":"Iată autobuzul!","english":"Here comes the bus!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4907596"},{"id":"tat-698964","romanian":"Fii iubit.","english":"Be loved.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3289391"},{"id":"tat-1064285","romanian":"Ce preferi, vin alb sau vin roșu?","english":"Which do you prefer, white wine or red wine?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11061322"},{"id":"tat-864947","romanian":"Trebuie să găsesc o ieşire din acestă problemă.","english":"I need to find a way out of this problem.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10113453"},{"id":"tat-864480","romanian":"Noi îi spunem Goro-san.","english":"We call him Goro-san.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817805"}],"stories":[{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-983708","romanian":"Este un cal.","english":"This is a horse.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5754562"},{"id":"tat-1142892","romanian":"Câți ani ai?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1163912","romanian":"Tom e cu zece livre mai greu decât Jack.","english":"Tom is ten pounds heavier than Jack.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197016"},{"id":"tat-1192799","romanian":"Sunt foarte veseli.","english":"They are very cheerful.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351572"},{"id":"tat-1153837","romanian":"Amestecă bucuriile uneori cu cea mai serioasă ocupație.","english":"Mingle your joys sometimes with your earnest occupation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130097"},{"id":"tat-583959","romanian":"Nici în ruptul capului!","english":"Not for all the tea in China!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799491"},{"id":"tat-1136977","romanian":"Maşina asta veche e tot timpul stricată.","english":"This old car is always broken.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952911"},{"id":"tat-1186844","romanian":"Metodele sale nu sunt ştiinţifice.","english":"His methods are not scientific.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338130"},{"id":"tat-1136539","romanian":"Îl poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957077"},{"id":"tat-406809","romanian":"Cum te numești?","english":"What is your name?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347301"},{"id":"tat-584851","romanian":"Când a fost tânăr, a muncit cu sârguinţă.","english":"When he was young, he was a hard worker.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812437"},{"id":"tat-1186852","romanian":"Diferențe subtile în ton diferențiază orginalul de copie.","english":"Subtle differences in tone discriminate the original from the copy.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338196"},{"id":"tat-1144295","romanian":"Fără el, aș fi neajutorat.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073247"},{"id":"tat-698973","romanian":"Cartea este mare.","english":"The book is big.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3870973"},{"id":"tat-1119746","romanian":"Vorbești spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7167492"},{"id":"tat-708979","romanian":"În cartierul meu a fost un mare incendiu.","english":"There was a big fire in my neighborhood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420379"},{"id":"tat-1136810","romanian":"Programul nu permite modificări în acest moment.","english":"The program does not allow for changes at this point in time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966290"},{"id":"tat-1090181","romanian":"De ce vrei să cumperi această carte?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4412136"},{"id":"tat-1143158","romanian":"Rapida vulpe maronie nu a sărit peste câinele leneș.","english":"The quick brown fox did not jump over the lazy dog.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069001"},{"id":"tat-10","romanian":"Noroc!","english":"Cheers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665964"}],"stories":[{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136653","romanian":"Mi-a luat mult timp până mi-a trecut răceala.","english":"It took me a long time to get over my cold.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966141"},{"id":"tat-1147397","romanian":"Vorbesc fluent portugheza.","english":"I speak Portuguese fluently.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12092941"},{"id":"tat-1143226","romanian":"Vreau trei bucăți de zahăr în laptele meu.","english":"I want three sugars in my milk.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068445"},{"id":"tat-584004","romanian":"Ea și prietenii ei sunt înnebuniți după muzica.","english":"She and her friends are mad about music.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7117050"},{"id":"tat-1159850","romanian":"Azi e foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168080"},{"id":"tat-407957","romanian":"Numele meu este românesc, al lui e american.","english":"My name is Romanian; his is American.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531992"},{"id":"tat-3","romanian":"Da.","english":"Yes.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1167647"},{"id":"tat-1185251","romanian":"Te rog să te întorci de-ndată.","english":"Please come back at once.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328033"},{"id":"tat-1200899","romanian":"Am plâns și am crezut.","english":"I wept and I believed.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11229733"},{"id":"tat-1059690","romanian":"Îmi poți da niște bani?","english":"Can you give me some money?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/931482"},{"id":"tat-1089733","romanian":"Unde este banca?","english":"Where is the bank?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11266826"},{"id":"tat-487031","romanian":"Camera mea este foarte mică.","english":"My room is very small.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435954"},{"id":"tat-1201128","romanian":"E beat.","english":"He is drunk.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12056752"},{"id":"tat-1133944","romanian":"Cafeaua este amară.","english":"The coffee is bitter.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7074654"},{"id":"tat-706020","romanian":"Formează câte o propoziție cu fiecare dintre aceste cuvinte.","english":"Make a sentence with each of these words.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968869"},{"id":"tat-1143263","romanian":"Aceea e școala mea.","english":"That is my school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068637"},{"id":"tat-1120906","romanian":"El este un conducător auto cu experienţă.","english":"He is an expert driver.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11856429"},{"id":"tat-406031","romanian":"Îmi place baclavaua.","english":"I like baclava.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350448"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-708932","romanian":"Cred că am o carie.","english":"I think I have a cavity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398620"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"},{"id":"tat-670678","romanian":"Poţi s-o alegi pe care o vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200736"},{"id":"tat-488761","romanian":"Autobuzele vor ajunge în stație după cinsprezece minute.","english":"The bus will arrive at the station in fifteen minutes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268740"},{"id":"tat-862770","romanian":"Bunicului meu ii place sa meargă.","english":"My grandfather likes to walk.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014569"},{"id":"tat-411865","romanian":"Vara mă duc la piscină în fiecare zi.","english":"In the summer I go to the pool every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271951"},{"id":"tat-1136962","romanian":"Mi-ar plăcea să îmi cunoști părinții.","english":"I would like you to meet my parents.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956302"},{"id":"tat-1136541","romanian":"Îl puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965468"},{"id":"tat-1059687","romanian":"Nimeni nu ne poate controla.","english":"Nobody can control us.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10681475"},{"id":"tat-1163914","romanian":"Rata criminalității este în scădere în Canada.","english":"The crime rate is decreasing in Canada.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197021"},{"id":"tat-670694","romanian":"Poţi alege orice.","english":"You may choose what you like.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200802"},{"id":"tat-1059516","romanian":"Salut.","english":"Hello!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"},{"id":"tat-1136275","romanian":"Poți invita orice persoană dorești.","english":"You may invite any person you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963281"},{"id":"tat-1186846","romanian":"Ori Tom, ori eu trebuie să plec.","english":"Either Tom or I must go.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338151"},{"id":"tat-698948","romanian":"Unde locuiești?","english":"Where do you live?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-1192772","romanian":"Ce doriți: ceai sau cafea?","english":"Which do you want, tea or coffee?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364282"},{"id":"tat-863658","romanian":"Urăsc aceste cuvinte.","english":"I hate these words.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9141319"},{"id":"tat-1151785","romanian":"Azi e vineri.","english":"Today is Friday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119197"},{"id":"tat-1136399","romanian":"Camera are două ferestre.","english":"The room has two windows.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962831"},{"id":"tat-405977","romanian":"Poftiți, doamnă, serviți-vă!","english":"Please, madam, help yourself!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350235"},{"id":"tat-923884","romanian":"Am petrecut toată seara dansând împreună.","english":"We spent all evening dancing together.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444876"}],"stories":[{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
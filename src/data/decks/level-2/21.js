@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1064070","romanian":"Ce să fac ca să nu mai sughit?","english":"What should I do to stop hiccups?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068880"},{"id":"tat-1186862","romanian":"În sfârșit a făcut bani.","english":"He finally made money.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338232"},{"id":"tat-1064187","romanian":"El are idei ciudate.","english":"He has strange ideas.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066231"},{"id":"tat-1137013","romanian":"Și el învață chineza.","english":"He studies Chinese as well.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952884"},{"id":"tat-1192771","romanian":"A alergat 100 de metri în exact 11 secunde.","english":"He ran 100 meters in 11 seconds flat.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364280"},{"id":"tat-1136408","romanian":"Chemați-mă dacă aveți nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962822"},{"id":"tat-1059485","romanian":"Aici s-a întâmplat accidentul.","english":"This is where the accident happened.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10299812"},{"id":"tat-1119751","romanian":"Vorbești suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7172318"},{"id":"tat-487317","romanian":"Noi adesea dăm peste turiștii japonezi în această zonă.","english":"We often come across Japanese tourists in this area.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335455"},{"id":"tat-610923","romanian":"Micul dejun este gata.","english":"Breakfast is ready.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/767045"},{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-698967","romanian":"Ea este Li Ying.","english":"She is Li Ying.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3384009"},{"id":"tat-1136553","romanian":"Trebuie să înveți toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965315"},{"id":"tat-923862","romanian":"Mă grăbesc.","english":"I am in a hurry.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444186"},{"id":"tat-610863","romanian":"Acest suc are gust acru.","english":"This juice tastes sour.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/692737"},{"id":"tat-411890","romanian":"Când era studentă, mergea des la discotecă.","english":"When she was a student, she used to go to the disco often.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272038"},{"id":"tat-1185133","romanian":"S-a produs vreo schimbare în curenții oceanici?","english":"Has a change in ocean currents occurred?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323897"},{"id":"tat-488782","romanian":"Lisa Lillien este măritată cu Dan Schneider.","english":"Lisa Lillien is married to Dan Schneider.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6352963"},{"id":"tat-1143254","romanian":"Domnul Kinoshita și-a lăsat ochelarii la birou ieri seară.","english":"Mr Kinoshita left his glasses behind in the office yesterday evening.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068562"},{"id":"tat-411957","romanian":"Îl văd pe Dan.","english":"I see Dan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272287"}],"stories":[{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1091943","romanian":"El nu fumează.","english":"He does not smoke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11591700"},{"id":"tat-709901","romanian":"Unde se joacă Toni?","english":"Where is Tony playing?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426734"},{"id":"tat-399615","romanian":"Noapte bună, mamă.","english":"Good night, Mom.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327701"},{"id":"tat-448211","romanian":"Respectul este temelia vieții.","english":"Respect is the foundation of life.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3873916"},{"id":"tat-584344","romanian":"Bună ziua, cum vă pot fi de folos?","english":"Good day, how may I help you?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7797080"},{"id":"tat-399607","romanian":"Poftă bună!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-706094","romanian":"Mi-am lăsat cheia in cameră.","english":"I left my key in my room.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/972152"},{"id":"tat-1136989","romanian":"Are acces la informația înmagazinată.","english":"He has access to the stored information.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952879"},{"id":"tat-1064317","romanian":"Mary este foarte drăguță.","english":"Mary is very pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045042"},{"id":"tat-1056666","romanian":"Ce trebuie să conțină un mic dejun sănătos?","english":"What should a healthy breakfast consist of?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031158"},{"id":"tat-1059638","romanian":"Furtuna ne-a împiedicat să ajungem la timp.","english":"The storm prevented us from arriving on time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/918359"},{"id":"tat-506869","romanian":"La mulți ani!","english":"Happy birthday!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528582"},{"id":"tat-1192781","romanian":"Primul este inferior ultimului în anumite privințe.","english":"The former is inferior to the latter in some respect.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364292"},{"id":"tat-1192742","romanian":"Avionul se apropia de Londra.","english":"The plane was approaching London.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511266"},{"id":"tat-448202","romanian":"Lasă-mă.","english":"Go away.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3840680"},{"id":"tat-1192802","romanian":"Niciunul dintre copacii bătrâni nu a supraviețuit focului.","english":"None of the old trees survived the fire.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353825"},{"id":"tat-1185124","romanian":"Te-ai simțit bine la cină?","english":"Did you have a good time at the dinner?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323857"},{"id":"tat-1143126","romanian":"Doctorul este un om cult.","english":"The doctor is a man of culture.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068831"},{"id":"tat-709020","romanian":"Becul s-a ars.","english":"The light bulb has burned out.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420302"},{"id":"tat-1153757","romanian":"Ne te poți sinucide ținându-ți respirația.","english":"You cannot kill yourself by holding your breath.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5568104"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136849","romanian":"Cât de adânc este lacul?","english":"How deep is the lake?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966273"},{"id":"tat-925687","romanian":"Ce veste proastă!","english":"What bad news!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527133"},{"id":"tat-488788","romanian":"Sumatra este o insulă.","english":"Sumatra is an island.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528949"},{"id":"tat-1153818","romanian":"Rar iese duminica.","english":"Rarely does he go out on Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129254"},{"id":"tat-1185145","romanian":"Concertul va avea loc vara viitoare.","english":"The concert will take place next summer.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324001"},{"id":"tat-1159835","romanian":"Mulțumesc foarte, foarte mult!","english":"Thank you very, very much!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167856"},{"id":"tat-1192707","romanian":"Ai o masă în patio?","english":"Do you have a table in the patio?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1309190"},{"id":"tat-1136530","romanian":"A luat o piatră de pe jos.","english":"He picked up a stone.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964787"},{"id":"tat-862342","romanian":"John a avut o ceartă violentă cu soția sa.","english":"John had a violent quarrel with his wife.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10020874"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-1136689","romanian":"Clasa noastră e formată din 40 de băieți.","english":"Our class consists of 40 boys.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239666"},{"id":"tat-1136673","romanian":"Care este țelul principal al acestei societăți?","english":"What is the chief aim of this society?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966138"},{"id":"tat-706145","romanian":"A traversat frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974711"},{"id":"tat-1137004","romanian":"Stați acolo!","english":"Stay there!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952937"},{"id":"tat-448260","romanian":"Ai grijă de tine.","english":"Take care.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4256296"},{"id":"tat-15","romanian":"Pofta buna!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-1144330","romanian":"Acea petrecere s-a ținut sub auspiciile Ministerului Afacerilor Externe.","english":"That party was held under the auspices of the Foreign Ministry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073626"},{"id":"tat-1136852","romanian":"Jucătorul de șah și-a pus adversarul în șah.","english":"The chess player put his opponent in check.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966267"},{"id":"tat-448266","romanian":"Are părul scurt.","english":"She has short hair.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4306510"},{"id":"tat-702065","romanian":"Agenţia de voiaj ne-a furnizat toate detaliile turului.","english":"The travel company furnished us with all the details of the tour.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398902"}],"stories":[{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
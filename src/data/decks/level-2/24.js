@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-708939","romanian":"Preţurile vor fi din ce în ce mai mari.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398956"},{"id":"tat-1059676","romanian":"Aș vrea niște pește.","english":"I would like some fish.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963768"},{"id":"tat-1143215","romanian":"Vreau să cumpăr un procesor de text.","english":"I want to buy a word processor.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070006"},{"id":"tat-1192699","romanian":"Ne bucurăm că vii.","english":"We are glad you are coming.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/853963"},{"id":"tat-1064072","romanian":"Tom pare foarte fericit.","english":"Tom looks very happy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069577"},{"id":"tat-1108779","romanian":"Ei nu vin astăzi.","english":"They are not coming today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759953"},{"id":"tat-698952","romanian":"Am vrut să cumpăr cartea.","english":"I wanted to buy the book.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2818798"},{"id":"tat-1136647","romanian":"A preluat afacerea după decesul tatălui său.","english":"He took over the business after his father died.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966174"},{"id":"tat-1136550","romanian":"M-am consultat cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964969"},{"id":"tat-1136381","romanian":"Salut! Bună dimineața!","english":"Hello! Good morning!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962782"},{"id":"tat-702210","romanian":"Este o fotografie recentă?","english":"Is it a recent picture?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398717"},{"id":"tat-1163899","romanian":"Asculta muzică.","english":"She was listening to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196923"},{"id":"tat-709933","romanian":"Nimeni nu a încurajat-o.","english":"No one encouraged her.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426774"},{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-584070","romanian":"Nu a fost deloc recunoscător fostului său profesor.","english":"He was not at all thankful to his former teacher.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262775"},{"id":"tat-1153775","romanian":"La ce oră se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1136897","romanian":"Vecinul și-a ițit capul peste zid pentru o clipă.","english":"The neighbor popped his head up over the wall for a moment.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965962"},{"id":"tat-1136789","romanian":"Fata s-a antrenat la paralele.","english":"The girl exercised on the parallel bars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966214"},{"id":"tat-1143138","romanian":"Doctorul mi-a spus să renunț la fumat.","english":"The doctor told me to give up smoking.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068909"},{"id":"tat-2","romanian":"Multumesc.","english":"Thank you.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-706062","romanian":"Mama îşi trezeşte fiica.","english":"The mother wakes up her daughter.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970709"},{"id":"tat-599093","romanian":"Știi cine e blonda înaltă îmbrăcata în verde?","english":"Does anybody know who the tall, blond girl dressed in green is?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1448294"},{"id":"tat-1151761","romanian":"Azi e duminică.","english":"Today is Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118662"},{"id":"tat-1159796","romanian":"Paharul este plin cu apă.","english":"The glass is full of water.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167541"},{"id":"tat-1136272","romanian":"Este nesociabil.","english":"He is unsociable.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963275"},{"id":"tat-1143841","romanian":"Își ține întotdeauna promisiunile.","english":"He always fulfills his promises.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070728"},{"id":"tat-1136526","romanian":"Acum fă-ți temele.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965105"},{"id":"tat-706124","romanian":"Nu avea nicio intenţie să aştepte trei ore.","english":"He had no intention of waiting for three hours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/973116"},{"id":"tat-923926","romanian":"Ce fel de lucruri te întristează?","english":"What sort of things make you feel sad?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/805469"},{"id":"tat-1143248","romanian":"Tom a mâncat un castron cu supă de scoici.","english":"Tom ate a bowl of clam chowder.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068554"},{"id":"tat-1136652","romanian":"Trăim într-o comunitate globală.","english":"We live in a global community.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966120"},{"id":"tat-1142890","romanian":"Ce-i asta?","english":"What is this?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065968"},{"id":"tat-709045","romanian":"M-am întâlnit cu ea seara târziu.","english":"I met her late in the evening.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420335"},{"id":"tat-411952","romanian":"L-am vizitat pe Dan.","english":"I visited Dan.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272272"},{"id":"tat-863673","romanian":"Cât la sută dintre persoane vorbesc trei limbi străine?","english":"What percentage of the people speak three languages?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9105795"},{"id":"tat-1278789","romanian":"Voi sunteţi copii.","english":"You are children.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13336351"},{"id":"tat-1144301","romanian":"Refuz să fiu de acord cu acel plan.","english":"I refuse to consent to that plan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073270"},{"id":"tat-1186849","romanian":"Notele sunt importante, dar nu sunt totul.","english":"Grades are important, but they are not everything.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338192"},{"id":"tat-1142932","romanian":"Majoritatea pasagerilor din autobuz dormeau.","english":"Most of the passengers on the bus were sleeping.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066665"},{"id":"tat-411857","romanian":"Vreți să mergeți la film sau la teatru?","english":"Do you want to go to the movies or to the theater?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271921"}],"stories":[{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1153868","romanian":"A fost deschizător de drumuri în acest domeniu.","english":"She was a pioneer in this field.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098377"},{"id":"tat-1192817","romanian":"Tom își dorea să fi fost mai atent.","english":"Tom wished he had been more careful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356244"},{"id":"tat-705814","romanian":"El mănâncă mult.","english":"He eats a lot.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963908"},{"id":"tat-1143279","romanian":"Există o limită de două bagaje pentru fiecare pasager.","english":"There is a limit of two pieces of luggage for each passenger.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068665"},{"id":"tat-399622","romanian":"Bună seara, ce faci?","english":"Good evening, how are you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6360852"},{"id":"tat-487034","romanian":"Eu mănânc tăiței.","english":"I am eating noodles.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435962"},{"id":"tat-1064272","romanian":"Tatăl ei a murit când ea avea trei ani.","english":"Her father died when she was three.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066162"},{"id":"tat-923822","romanian":"Astăzi profesorul a ales ca subiect \"cultura chinezească\".","english":"Today the teacher chose \"Chinese culture\" as a topic.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10433149"},{"id":"tat-1136915","romanian":"De fapt, știe foarte puține despre această chestiune.","english":"As a matter of fact, he knows very little of the matter.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959366"},{"id":"tat-712088","romanian":"Tom s-a ascuns sub masă.","english":"Tom hid under the table.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440023"},{"id":"tat-1136531","romanian":"S-a îmbrăcat cu jacheta roșie.","english":"He put on the red jacket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965117"},{"id":"tat-1151776","romanian":"Azi e luni.","english":"Today is Monday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118747"},{"id":"tat-1136649","romanian":"Vorbește puțin engleza.","english":"He speaks English a little.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966129"},{"id":"tat-1136823","romanian":"Puteam să alerg mult mai rapid când eram tânăr.","english":"I could run much faster when I was young.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966296"},{"id":"tat-708918","romanian":"Ei nu îi plac şerpii şi matematica.","english":"She does not like snakes and mathematics.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397937"},{"id":"tat-1136913","romanian":"E clar?","english":"Is that clear?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966183"},{"id":"tat-924380","romanian":"Sună-mă dacă ai nevoie de ajutor.","english":"Give me a call if you need help.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735315"},{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-1119695","romanian":"Vorbiți chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511123"},{"id":"tat-1142946","romanian":"Ești ocupat mâine?","english":"Are you engaged for tomorrow?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066837"}],"stories":[{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1144673","romanian":"Scuzați-mă, vorbiți engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12075958"},{"id":"tat-406055","romanian":"Când o întâlnisem în București, Anca era studentă.","english":"When I had met her in Bucharest, Anca was a student.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347370"},{"id":"tat-406051","romanian":"O întâlnesc pe Mihaela în fiecare dimineață, la metrou.","english":"I meet Mihaela every morning at the subway.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347358"},{"id":"tat-1136917","romanian":"Arăți altfel azi.","english":"You look different today.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960464"},{"id":"tat-1064444","romanian":"Vreau ceva dulce.","english":"I want something sweet.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077411"},{"id":"tat-1136720","romanian":"I-a pus imaginea în palmă.","english":"She put the picture back in his hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7222279"},{"id":"tat-709043","romanian":"Am fost fascinat de frumuseţea ei.","english":"I was fascinated by her beauty.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420333"},{"id":"tat-411959","romanian":"O văd pe Dana.","english":"I see Dana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272293"},{"id":"tat-1119753","romanian":"Vorbești letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7173476"},{"id":"tat-1147450","romanian":"Ce vârstă aveți?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094234"},{"id":"tat-708940","romanian":"Preţurile vor creşte din ce în ce mai mult.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419499"},{"id":"tat-1142942","romanian":"Servitoarea a aranjat cuțitele și furculițele pe masă.","english":"The maid arranged the knives and forks on the table.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066763"},{"id":"tat-1136800","romanian":"N-am fost niciodată într-o închisoare.","english":"I have never been inside a jail.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966338"},{"id":"tat-698963","romanian":"Unde te duci?","english":"Where are you going to?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3220541"},{"id":"tat-1136924","romanian":"Înțelege fizica.","english":"He understands physics.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957733"},{"id":"tat-1136659","romanian":"Nu are mai mult de o sută de cărți.","english":"He has no more than one hundred books.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227583"},{"id":"tat-1144039","romanian":"Îți pot folosi mașina, tată?","english":"May I use your car, Dad?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072667"},{"id":"tat-1151810","romanian":"Tom e musulman.","english":"Tom is a Muslim.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119099"},{"id":"tat-1136593","romanian":"Am reușit să trec examenul.","english":"I was able to pass the exam.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966064"},{"id":"tat-923852","romanian":"Cea mai bună prietenă a mea Felicja este aici.","english":"My best friend Felicja is here.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442763"}],"stories":[{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1119752","romanian":"Vorbiți letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264777"},{"id":"tat-1143121","romanian":"Au ajuns în staţie la doar câteva minute distanță.","english":"They got to the station only a few minutes apart.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068791"},{"id":"tat-1143262","romanian":"A profitat de ignoranța mea și m-a înșelat.","english":"He took advantage of my ignorance and deceived me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068634"},{"id":"tat-399274","romanian":"Bine ai venit!","english":"Welcome.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335259"},{"id":"tat-706130","romanian":"El scrie cărţi.","english":"He writes books.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974452"},{"id":"tat-1090185","romanian":"E fratele meu.","english":"He is my brother.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1996614"},{"id":"tat-1136702","romanian":"Comparată cu a ta, mașina mea este mică.","english":"Compared with yours, my car is small.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239624"},{"id":"tat-944584","romanian":"M-am simţit rău.","english":"I felt bad.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/60061"},{"id":"tat-1136801","romanian":"Și-a pierdut toți banii pe care îi avea.","english":"He lost all the money he had.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966361"},{"id":"tat-1192782","romanian":"Folosesc Twitter.","english":"I am using Twitter.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364295"},{"id":"tat-1136774","romanian":"- Sunt profesor. - Și eu sunt.","english":"I am a teacher. \"So am I.\"","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966215"},{"id":"tat-1064097","romanian":"La momentul accidentului aproape toți călătorii din autobuz dormeau.","english":"At the time of the accident, almost all of the passengers on the bus were sleeping.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11071031"},{"id":"tat-1156687","romanian":"Acest ceas este stricat.","english":"This clock is broken.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10308903"},{"id":"tat-1153756","romanian":"Trebuie să-mi clătesc gura.","english":"I need to rinse my mouth.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4660319"},{"id":"tat-1136542","romanian":"O puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965557"},{"id":"tat-1136355","romanian":"Nu e prost.","english":"He is not stupid.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963115"},{"id":"tat-1136674","romanian":"Te voi ajuta dacă este posibil.","english":"I will help you if possible.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239621"},{"id":"tat-1059506","romanian":"A venit să ne vadă ieri.","english":"She came to see us yesterday.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8577246"},{"id":"tat-1090180","romanian":"De ce vrei să cumperi cartea asta?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3639543"},{"id":"tat-670618","romanian":"Pe ce linie pentru Boston?","english":"What track for Boston?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1346020"}],"stories":[{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-986457","romanian":"Astăzi este ziua mea.","english":"Today is my birthday.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637054"},{"id":"tat-706153","romanian":"O răţuşcă urâtă a devenit o lebădă graţioasă.","english":"An ugly duckling became a graceful swan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974759"},{"id":"tat-1168697","romanian":"Am auzit muzica.","english":"I heard the music.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12220460"},{"id":"tat-923905","romanian":"Trebuie să găsesc un apartament de închiriat în Barcelona.","english":"I need to find a flat to rent in Barcelona.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/626893"},{"id":"tat-1056801","romanian":"Este o persoană agresivă.","english":"He is an aggressive person.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031628"},{"id":"tat-411929","romanian":"Am dus hainele la curățat.","english":"I took my clothes to be cleaned.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272197"},{"id":"tat-709935","romanian":"Sărăcia este o povară, dar nu o ruşine.","english":"Poverty is a pain, but no disgrace.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5915496"},{"id":"tat-698969","romanian":"Stai puțin.","english":"Wait a minute.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3410256"},{"id":"tat-1144296","romanian":"Fără el, aș fi neajutorată.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073249"},{"id":"tat-698933","romanian":"Cu ce vă pot fi de folos astăzi, domnule?","english":"How may I help you today, sir?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2157709"},{"id":"tat-1136960","romanian":"Poți culca copiii?","english":"Can you put the children to bed?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958000"},{"id":"tat-1143613","romanian":"Îmi place ciocolata.","english":"I like chocolate.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071626"},{"id":"tat-1143187","romanian":"Tom pare a fi interesat de Mary.","english":"Tom seems to be interested in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069268"},{"id":"tat-12","romanian":"Buna dimineata!","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-1144324","romanian":"I s-a făcut o injecție înainte de operație.","english":"He had an injection prior to the operation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073578"},{"id":"tat-986478","romanian":"Te iubesc foarte mult.","english":"I love you very much.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637115"},{"id":"tat-698970","romanian":"Viața este scurtă.","english":"Life is short.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3582733"},{"id":"tat-408085","romanian":"În primul rând, vreau să vă mulțumesc pentru ospitalitate.","english":"First of all, I would like to thank you for your hospitality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232873"},{"id":"tat-1163907","romanian":"A continuat să plângă cât e noaptea de lungă.","english":"She kept crying all night long.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196991"},{"id":"tat-584835","romanian":"Bineînțeles, el are dreptate.","english":"Of course, he is right.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812373"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
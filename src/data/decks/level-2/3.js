@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1143842","romanian":"Se ține întotdeauna de cuvânt.","english":"He always fulfills his promises.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070729"},{"id":"tat-408047","romanian":"Cine știe?","english":"Who knows?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220694"},{"id":"tat-1153855","romanian":"A fost trimis la închisoare pentru furt.","english":"He was sent to jail for the robbery.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130115"},{"id":"tat-1143219","romanian":"Au fost într-o excursie în străinătate pentru prima oară.","english":"They went on a trip abroad for the first time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070011"},{"id":"tat-1136543","romanian":"Avea șosetele pe dos.","english":"He had his socks on inside out.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965326"},{"id":"tat-1059443","romanian":"Când vine vorba de gătit, nimeni nu mă întrece.","english":"When it comes to cooking, no one can beat me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9509387"},{"id":"tat-1059643","romanian":"S-a întins pe pat.","english":"He laid himself on the bed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758837"},{"id":"tat-488770","romanian":"Guus Hiddink este olandez.","english":"Guus Hiddink is Dutch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528884"},{"id":"tat-1136826","romanian":"Trebuie să plec chiar acum?","english":"Must I leave at once?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966311"},{"id":"tat-1143221","romanian":"Cred că au fost căsătoriți timp de cinci ani.","english":"I think they have been married for five years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049596"},{"id":"tat-1163893","romanian":"Un An Nou fericit!","english":"Happy New Year!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196792"},{"id":"tat-1136573","romanian":"A forțat ușa încuiată cu o rangă.","english":"He pried open the locked door with a crowbar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966044"},{"id":"tat-1143601","romanian":"Îmi place tenisul.","english":"I like tennis.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071543"},{"id":"tat-1136388","romanian":"Este respectat de toată lumea.","english":"He is respected by everyone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962876"},{"id":"tat-1059423","romanian":"Când pleci de aici?","english":"When do you leave here?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9551350"},{"id":"tat-1136907","romanian":"Ai înţeles ce a zis?","english":"Did you understand what he said?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960213"},{"id":"tat-1192698","romanian":"E fizician.","english":"He is a physicist.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/847246"},{"id":"tat-1153780","romanian":"Pari să te gândești la altceva.","english":"You seem to be thinking of something else.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128559"},{"id":"tat-1059417","romanian":"M-am uitat în dulap.","english":"I looked in the cupboard.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7087756"},{"id":"tat-1136964","romanian":"Ieri, s-a dus la școală să studieze.","english":"He went to school to study yesterday.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957826"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
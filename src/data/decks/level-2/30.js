@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-670649","romanian":"Când aduni trei cu patru, obţii şapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974575"},{"id":"tat-1090366","romanian":"Mă poţi auzi?","english":"Can you hear me?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11523377"},{"id":"tat-709036","romanian":"A ţintit pasărea.","english":"He aimed at the bird.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420325"},{"id":"tat-405826","romanian":"Zăpada a acoperit tot orașul peste noapte.","english":"The snow covered the whole city overnight.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350529"},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-399619","romanian":"Mulțumesc foarte mult!","english":"Thank you very much!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6359653"},{"id":"tat-1192804","romanian":"Ken nu a fost aici de astă dimineață.","english":"Ken has not been here since this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353836"},{"id":"tat-1059613","romanian":"Cele mai frumoase fete sunt din Lituania.","english":"The most beautiful girls are from Lithuania.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9569381"},{"id":"tat-1136667","romanian":"Tom a avut ceva probleme la ajustarea setărilor.","english":"Tom had a little trouble adjusting the settings.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227163"},{"id":"tat-698946","romanian":"Cât costă?","english":"How much is it?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-399600","romanian":"Vorbești japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319472"},{"id":"tat-1136692","romanian":"Muncește din greu pentru a-și atinge scopul.","english":"He works hard to achieve his goal.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239729"},{"id":"tat-1090314","romanian":"Am fraţi.","english":"I have brothers.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3711714"},{"id":"tat-1064275","romanian":"Vin roșu, vă rog.","english":"Red wine, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066144"},{"id":"tat-670645","romanian":"Cel mult patruzeci la sută dintre studenţi continuă universitatea.","english":"At most 40 percent of students go on to university.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/935777"},{"id":"tat-1143175","romanian":"Jane ne-a spus că gătitul nu era dificil.","english":"Jane told us that cooking was not difficult.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069208"},{"id":"tat-1185072","romanian":"O vei invita la petrecere?","english":"Are you going to invite her to the party?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321352"},{"id":"tat-1153853","romanian":"Jack e tăcut acum.","english":"Jack is quiet now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130113"},{"id":"tat-699623","romanian":"Am văzut câinele.","english":"I saw the dog.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320070"},{"id":"tat-610807","romanian":"Mă surprinzi mereu cu sosirile tale neașteptate.","english":"You always astonish me with your unexpected arrivals.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/615896"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."},{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136510","romanian":"Mă simt îndatorat moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964318"},{"id":"tat-411897","romanian":"Vă trimisesem deja scrisoarea când mi-ați dat telefon.","english":"I had already sent you the letter when you called.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272065"},{"id":"tat-1136533","romanian":"Profesoara ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965168"},{"id":"tat-1136580","romanian":"Calitatea traducerii s-a îmbunătățit.","english":"The quality of translation has improved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966078"},{"id":"tat-406044","romanian":"Daniela mi-a telefonat acasă.","english":"Daniela called me at home.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350499"},{"id":"tat-1163888","romanian":"Astăzi este foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196786"},{"id":"tat-1136622","romanian":"Dă-mi o mână de ajutor.","english":"Lend me a hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239816"},{"id":"tat-1119745","romanian":"Vorbiți spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342518"},{"id":"tat-488758","romanian":"Vă rugam să așteptați treizeci de minute.","english":"Please wait for thirty minutes.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268731"},{"id":"tat-1201333","romanian":"Cafea sau ceai?","english":"Coffee or tea?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4037739"},{"id":"tat-1117421","romanian":"Este adevărat?","english":"Is that true?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817570"},{"id":"tat-1279321","romanian":"A doua oglindă este agăţată lângă uşă.","english":"A second mirror is hanging next to the door.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13495625"},{"id":"tat-1108729","romanian":"Sunt profesor.","english":"I am a teacher.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759056"},{"id":"tat-1064200","romanian":"Fustele mini nu mai sunt la modă.","english":"Miniskirts have gone out of fashion.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066254"},{"id":"tat-475812","romanian":"Lipsește o furculiță.","english":"There is a fork missing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6223472"},{"id":"tat-862416","romanian":"Fericirea nu se cumpără.","english":"One does not buy happiness.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9462186"},{"id":"tat-1064436","romanian":"El este de două ori mai mare decât ea.","english":"He is twice as old as she is.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077419"},{"id":"tat-708929","romanian":"Juan se îmbracă.","english":"Juan is getting dressed.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398353"},{"id":"tat-706083","romanian":"Cui i-a păsat?","english":"Who cared?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970932"},{"id":"tat-1153162","romanian":"Vrednicia ei este un bun exemplu pentru noi toți.","english":"Her diligence is a good example to us all.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1754261"}],"stories":[{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
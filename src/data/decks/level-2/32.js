@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-487312","romanian":"Eram în căutarea unei locuințe de închiriat.","english":"I was on the hunt for lodgings.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7006421"},{"id":"tat-864492","romanian":"Când am sunat, el deja plecase.","english":"When I called, he had already set off.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6872543"},{"id":"tat-1192712","romanian":"Bărbatul o împinse deoparte.","english":"The man shoved her aside.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2811437"},{"id":"tat-923838","romanian":"Anna este o fetiță.","english":"Ann is a little girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10435209"},{"id":"tat-1153820","romanian":"Stai acasă pentru a putea răspunde la telefon.","english":"Stay home so that you can answer the phone.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129301"},{"id":"tat-448259","romanian":"Suntem chit.","english":"We are even.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4250681"},{"id":"tat-584410","romanian":"Ei sunt colegii mei.","english":"They are my classmates.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7794377"},{"id":"tat-408052","romanian":"Am discutat deja cu acest student.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232108"},{"id":"tat-1089709","romanian":"Nu știam despre planul lui.","english":"I was ignorant of his plan.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11265216"},{"id":"tat-1119736","romanian":"Vorbești germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144104"},{"id":"tat-1144337","romanian":"A rupt logodna într-o criză de mânie.","english":"She broke off her engagement in a fit of anger.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073722"},{"id":"tat-1156696","romanian":"Sunt cetățean american.","english":"I am an American citizen.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11260892"},{"id":"tat-1143243","romanian":"Te-a așteptat două ore.","english":"She waited for you for two hours.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068548"},{"id":"tat-1136661","romanian":"Ne confruntăm cu o alegere dificilă.","english":"We are faced with a difficult choice.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239777"},{"id":"tat-1136723","romanian":"Acolo nefiind taxiuri, a trebuit să merg pe jos.","english":"There being no taxis, I had to walk.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226178"},{"id":"tat-1143208","romanian":"Pretinde că e cinstit.","english":"He claims that he is honest.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069998"},{"id":"tat-923931","romanian":"Animalele sălbatice sunt în pericol de dispariţie.","english":"Wild animals are on the verge of dying out.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/807128"},{"id":"tat-709012","romanian":"Doriţi un loc la fereastră?","english":"Would you like a window seat?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420287"},{"id":"tat-399611","romanian":"Bună seara.","english":"Good evening.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1143134","romanian":"E necugetat din partea ta să crezi asemenea lucru.","english":"It is foolish of you to believe such a thing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068893"}],"stories":[{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."},{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1159843","romanian":"Îmi place foarte mult.","english":"I like it very much.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167977"},{"id":"tat-1153807","romanian":"I-am văzut mașina făcând la dreapta.","english":"I saw his car make a turn to the right.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128946"},{"id":"tat-1185094","romanian":"Sunt băiat bun.","english":"I am a good boy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7181129"},{"id":"tat-1185175","romanian":"Atletul părea imun la oboseală.","english":"The athlete seemed immune to fatigue.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324302"},{"id":"tat-1185249","romanian":"Un măr pe zi ține doctorul departe.","english":"An apple a day keeps the doctor away.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324562"},{"id":"tat-1195248","romanian":"E în bani.","english":"He is in the money.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7171087"},{"id":"tat-1136431","romanian":"A mers pe cal până la mare.","english":"He rode a horse to the sea.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965821"},{"id":"tat-1143149","romanian":"De la ce aeroport plec?","english":"Which airport do I leave from?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068959"},{"id":"tat-582947","romanian":"Voiam să devin filozof.","english":"I wanted to become a philosopher.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6547233"},{"id":"tat-1195295","romanian":"Este funcționar bancar.","english":"He is a bank clerk.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2308938"},{"id":"tat-1064374","romanian":"Tom a cerut-o în căsătorie pe Mary.","english":"Tom asked Mary to marry him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074440"},{"id":"tat-1136548","romanian":"Și-a atribuit eşecul ghinionului.","english":"She ascribed her failure to bad luck.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965103"},{"id":"tat-408060","romanian":"I-am dat cărțile studentului acestuia.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232758"},{"id":"tat-1168718","romanian":"Bei cafea?","english":"Do you drink coffee?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/693134"},{"id":"tat-1136816","romanian":"Trebuie doar să exersezi în fiecare zi.","english":"You have only to practice every day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966330"},{"id":"tat-1136840","romanian":"Tom consideră că Mary e o eroină.","english":"Tom considers Mary to be a heroine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966335"},{"id":"tat-705791","romanian":"Din curiozitate, am deschis cutia.","english":"I opened the box out of curiosity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963139"},{"id":"tat-699627","romanian":"Ieri am mâncat un măr.","english":"Yesterday, I ate an apple.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320082"},{"id":"tat-3","romanian":"Da.","english":"Yes.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1167647"},{"id":"tat-448206","romanian":"Fraților!","english":"My brothers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3864978"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
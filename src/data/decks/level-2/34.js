@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-708960","romanian":"Ce sporturi îţi plac?","english":"What sports do you like?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420397"},{"id":"tat-1056757","romanian":"Spre deosebire de fratele ei, Sienna este foarte introvertită.","english":"Unlike her brother, Sienna is very introverted.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031405"},{"id":"tat-1144331","romanian":"Când încep?","english":"When do I get started?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073634"},{"id":"tat-1192698","romanian":"E fizician.","english":"He is a physicist.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/847246"},{"id":"tat-487304","romanian":"El a fost convins să fie mai rezonabil.","english":"He was persuaded to be more sensible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270699"},{"id":"tat-1185173","romanian":"A zis că trebuie să păstrăm secretul.","english":"He said we must keep the secret.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324299"},{"id":"tat-399609","romanian":"Bună dimineața la toată lumea.","english":"Good morning, everybody.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325807"},{"id":"tat-1136700","romanian":"Mi-a dat ce bani avea la el.","english":"He gave me what money he had with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239591"},{"id":"tat-1117472","romanian":"Ea este puternică.","english":"She is strong.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817460"},{"id":"tat-1201140","romanian":"E un bun perdant.","english":"He is a good loser.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12422431"},{"id":"tat-407963","romanian":"Care este mai completă, prima ediție sau a doua?","english":"Which is more complete, the first edition or the second?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531998"},{"id":"tat-902150","romanian":"Cred că am înţeles.","english":"I think I understood.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287441"},{"id":"tat-1147563","romanian":"Vorbește prea mult.","english":"He talks too much.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095134"},{"id":"tat-1064182","romanian":"Te rog ia loc aici.","english":"Please sit here.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070976"},{"id":"tat-706185","romanian":"Kumi este fata al cărei tată îi plac căinii.","english":"Kumi is the girl whose father likes dogs.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/976233"},{"id":"tat-1059656","romanian":"Ce limbi se vorbesc în Belgia?","english":"What languages do they speak in Belgium?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029005"},{"id":"tat-405844","romanian":"L-am văzut pe Ion la bibliotecă.","english":"I saw John at the library.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350592"},{"id":"tat-706155","romanian":"Tocmai a plecat.","english":"He left just now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974769"},{"id":"tat-1078362","romanian":"Salut, lume!","english":"Hello, world!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9938591"},{"id":"tat-705788","romanian":"Urmăreşti dezbaterile parlamentare?","english":"Did you listen to the parliamentary debate?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963116"}],"stories":[{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1149075","romanian":"Piersicul face piersici.","english":"Peaches grow on the peach tree.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106106"},{"id":"tat-705816","romanian":"Mary s-a ataşat foarte tare de fetiţa aceea.","english":"Mary is very attached to the little girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963910"},{"id":"tat-1119697","romanian":"Vorbești chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227075"},{"id":"tat-1186855","romanian":"Acceptați American Express?","english":"Do you accept AMEX?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338199"},{"id":"tat-1136903","romanian":"Avem nevoie de ceva educație formală în literatură.","english":"We need some formal instruction in literature.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966068"},{"id":"tat-864490","romanian":"El ține legătura cu tot felul de oameni.","english":"He is in touch with all kinds of people.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855690"},{"id":"tat-1279014","romanian":"Toţi au fost amabili cu fata cea nouă.","english":"Everybody was kind to the new girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13353831"},{"id":"tat-1128611","romanian":"Ce ai în geantă?","english":"What have you got in your bag?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11912837"},{"id":"tat-1143143","romanian":"Când pot călători?","english":"When can I travel?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068926"},{"id":"tat-1144314","romanian":"Deficitul de apă este din cauza vremii.","english":"The water shortage is due to the weather.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073464"},{"id":"tat-1059646","romanian":"A fost ocupat.","english":"He has been busy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795785"},{"id":"tat-1153167","romanian":"Arătați bine.","english":"You look fine.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1767044"},{"id":"tat-1136846","romanian":"Tom voia un creion cu mină moale.","english":"Tom wanted a pencil with a softer lead.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966269"},{"id":"tat-902141","romanian":"Acesta e sfârșitul.","english":"This is the end.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287419"},{"id":"tat-1192719","romanian":"S-a conformat cerinței mele.","english":"She complied with my request.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6655519"},{"id":"tat-1186837","romanian":"A plătit 20$ pentru ruj.","english":"He paid $20 for the lipstick.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7309933"},{"id":"tat-862913","romanian":"Aeroportul a fost închis din cauza ceţei.","english":"The airport was closed because of the fog.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10008928"},{"id":"tat-1136594","romanian":"Câinii latră.","english":"Dogs are barking.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966082"},{"id":"tat-408053","romanian":"Am discutat deja cu studentul acesta.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232112"},{"id":"tat-712091","romanian":"De cât timp stă Ken în Kobe?","english":"How long has Ken lived in Kobe?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440065"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
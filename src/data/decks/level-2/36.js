@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-583889","romanian":"Mă țin întotdeauna de promisiune.","english":"I always keep my promises.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/870644"},{"id":"tat-857387","romanian":"Tango-ul este o exprimare verticală a unei dorinţe orizontale.","english":"Tango is the vertical expression of a horizontal desire.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10023982"},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-584785","romanian":"Seara el iese în oraș să bea ceva.","english":"At night he goes out in the city to drink something.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812845"},{"id":"tat-1192743","romanian":"Vecinii sunt OK cu muzica tare la această oră?","english":"Is loud music OK with the neighbors at this hour?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7512007"},{"id":"tat-712094","romanian":"E cel mai bun jucător din echipa noastră.","english":"He is the best player on our team.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440082"},{"id":"tat-1192774","romanian":"Tom putea cu greu să suporte durerea.","english":"Tom could hardly stand the pain.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364284"},{"id":"tat-698949","romanian":"Acela este tatăl nostru.","english":"That is our father.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2637465"},{"id":"tat-1153865","romanian":"Fulgerele pot fi periculoase.","english":"Lightning can be dangerous.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098350"},{"id":"tat-406042","romanian":"La început vă displăcuse ideea, dar acum păreți mulțumiți.","english":"At the beginning you had disliked the idea, but now you seem to be content.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350487"},{"id":"tat-1144308","romanian":"Problema l-a făcut cunoscut.","english":"The matter made his name known.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073372"},{"id":"tat-1136549","romanian":"M-am sfătuit cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958681"},{"id":"tat-1192845","romanian":"Fața ei s-a albit.","english":"Her face turned pale.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361489"},{"id":"tat-1136900","romanian":"De-abia plouă.","english":"It is hardly raining.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960502"},{"id":"tat-1119738","romanian":"Vorbești turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6355405"},{"id":"tat-1059492","romanian":"Mi s-a ondulat părul.","english":"My hair got kinky.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10767713"},{"id":"tat-1144317","romanian":"Are pian?","english":"Does she have a piano?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073560"},{"id":"tat-702190","romanian":"Acest peşte miroase urât.","english":"This fish smells bad.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397702"},{"id":"tat-584840","romanian":"Mobilierul din acest birou este foarte modern.","english":"The furniture in this office is really modern.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812390"},{"id":"tat-1142940","romanian":"Cine e în spatele intrigii?","english":"Who is behind the plot?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066756"}],"stories":[{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1143646","romanian":"Ken joacă tenis?","english":"Does Ken play tennis?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071930"},{"id":"tat-1153768","romanian":"Nu simte nicio reticență în recunoașterea erorilor.","english":"He feels no reluctance in acknowledging errors.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128216"},{"id":"tat-1136266","romanian":"Barca era legată cu o parâmă scurtă.","english":"The boat was tied with a short line.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964628"},{"id":"tat-584803","romanian":"Fata își spălă părul.","english":"The girl washed her hair.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813833"},{"id":"tat-1185135","romanian":"Acest sol e umed.","english":"This soil is moist.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323926"},{"id":"tat-705819","romanian":"Mama mea a plecat ieri la cumpărături în centru.","english":"My mother went shopping downtown yesterday.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963917"},{"id":"tat-1136959","romanian":"Vă rog, păstrați restul.","english":"Keep the change, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966081"},{"id":"tat-1059615","romanian":"Ești roșu la față.","english":"Your face is red.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7883567"},{"id":"tat-1136848","romanian":"Mă întreb cine înoată cel mai repede.","english":"I wonder who can swim fastest.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966289"},{"id":"tat-1064024","romanian":"De îndată ce m-a văzut a început să plângă.","english":"As soon as she saw me, she started to cry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10936810"},{"id":"tat-406035","romanian":"Îți plăcea să mergi la expoziții în România?","english":"Did you enjoy going to exhibits in Romania?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350460"},{"id":"tat-1136744","romanian":"Sună-mă cândva.","english":"Call me sometime.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966175"},{"id":"tat-1192704","romanian":"E nevoie să fie reparat.","english":"It needs to be repaired.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1116325"},{"id":"tat-948496","romanian":"Da, vă rog.","english":"Yes, please.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9690115"},{"id":"tat-406017","romanian":"O ploaie rece a căzut peste oraș.","english":"A cold rain fell over the city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350400"},{"id":"tat-399597","romanian":"Vorbiți italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314367"},{"id":"tat-583918","romanian":"Am o durere de cap teribilă.","english":"I have a bad headache.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798048"},{"id":"tat-487282","romanian":"Am accentuat ideea.","english":"I stressed the point.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270459"},{"id":"tat-709928","romanian":"Această maşină a fost făcută in Japonia.","english":"This car was made in Japan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424464"},{"id":"tat-1136986","romanian":"Fii atent!","english":"Be watchful.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952792"}],"stories":[{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1059635","romanian":"Răspunsul tău este greșit.","english":"Your reply is wrong.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7874588"},{"id":"tat-1185087","romanian":"- Ce fel de senzație? întrebă negustorul.","english":"What kind of feeling? the shopkeeper asked.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321492"},{"id":"tat-1192846","romanian":"E un monarh absolut.","english":"He is an absolute monarch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361499"},{"id":"tat-487284","romanian":"Îl știu?","english":"Do I know him?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270480"},{"id":"tat-1120208","romanian":"Sunt din Brazilia.","english":"I am from Brazil.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11850582"},{"id":"tat-1089652","romanian":"Ce făceai?","english":"What were you doing?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267869"},{"id":"tat-1185107","romanian":"Și-a îmbrățișat călduros fiul.","english":"He embraced his son warmly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195145"},{"id":"tat-1192834","romanian":"În Japonia, noul an școlar începe în aprilie.","english":"The new school year begins in April in Japan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361249"},{"id":"tat-487295","romanian":"Străzile noastre se inundă când plouă.","english":"Our streets flood when we have rain.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270651"},{"id":"tat-583827","romanian":"În fiecare duminică după-amiaza merg la târg.","english":"Every Sunday afternoon, I go to the bazaar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1913109"},{"id":"tat-706044","romanian":"Credeam că era drăguţă.","english":"I thought she was pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969871"},{"id":"tat-399605","romanian":"Vorbești engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-1143210","romanian":"Tom pretindea că nu știe cine e Mary.","english":"Tom pretended not to know who Mary was.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070000"},{"id":"tat-1142918","romanian":"Am auzit bomba explodând.","english":"We heard the bomb go off.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066399"},{"id":"tat-708953","romanian":"Nimănui nu-i pasă de ceea ce crezi.","english":"Nobody cares what you think.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8418403"},{"id":"tat-705790","romanian":"Domnul Suzuki nu este dentist, ci medic.","english":"Mr Suzuki is not a dentist but a physician.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963131"},{"id":"tat-1136758","romanian":"N-am văzut nici măcar un meci.","english":"We did not see a single game.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966190"},{"id":"tat-986454","romanian":"Pisica este cafenie.","english":"The cat is brown.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637038"},{"id":"tat-1136628","romanian":"Mi-am pierdut umbrela.","english":"I have lost my umbrella.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227193"},{"id":"tat-411911","romanian":"Aș merge la film dacă aș avea timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272125"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-408068","romanian":"Ce să fac?!","english":"What can I do?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232794"},{"id":"tat-1143181","romanian":"Știa că nu va putea câștiga.","english":"He knew he could not win.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069238"},{"id":"tat-1136353","romanian":"Sunteți din Urumqi?","english":"Are you from Urumqi?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963175"},{"id":"tat-408090","romanian":"Prietenul nostru a terminat cursa al doilea.","english":"Our friend finished the race in second place.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232893"},{"id":"tat-1064267","romanian":"Ce fel de mâncare îi place lui Tom?","english":"What kind of food does Tom like?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064842"},{"id":"tat-476863","romanian":"Te rugăm să fii politicos.","english":"Please be polite.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5601925"},{"id":"tat-1192842","romanian":"N-ai febră.","english":"You have no fever.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361445"},{"id":"tat-1192844","romanian":"Sunt o mulțime de cărți în camera lui.","english":"There are a lot of books in his room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361457"},{"id":"tat-699683","romanian":"Mi-e dor de tine.","english":"I miss you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323633"},{"id":"tat-1143286","romanian":"Ascult muzică.","english":"I listen to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068676"},{"id":"tat-1143117","romanian":"Și pomul era deseori singur.","english":"And the tree was often alone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070043"},{"id":"tat-698974","romanian":"Cartea este albă.","english":"The book is white.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3943121"},{"id":"tat-902146","romanian":"Ești o fată drăguță.","english":"You are a pretty girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287426"},{"id":"tat-670576","romanian":"Ce se va întâmpla cu ea?","english":"What will happen to her?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2299514"},{"id":"tat-4","romanian":"Nu.","english":"No.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8065106"},{"id":"tat-1136599","romanian":"Te rog să-mi răspunzi fără întârziere.","english":"Please write me a reply soon.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966022"},{"id":"tat-1130802","romanian":"Răspunde-mi.","english":"Answer me.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11926498"},{"id":"tat-1048538","romanian":"La început a făcut Dumnezeu cerul și pământul.","english":"In the beginning God created the heavens and the earth.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10934554"},{"id":"tat-1279158","romanian":"Ceasul meu înaintează cu cinci secunde pe zi.","english":"My clock is running 5 seconds faster every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13123222"},{"id":"tat-862837","romanian":"Trebuie sa mă gîndesc.","english":"I have to think about it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014517"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1119743","romanian":"Vorbești klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235942"},{"id":"tat-1136594","romanian":"Câinii latră.","english":"Dogs are barking.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966082"},{"id":"tat-1136757","romanian":"A răspuns cu nici pe departe un surâs.","english":"She answered with hardly a smile.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966223"},{"id":"tat-1136644","romanian":"Ieri și-a cumpărat Mary fusta.","english":"It was yesterday that Mary bought this skirt.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227743"},{"id":"tat-1163919","romanian":"Sherman s-a întâlnit cu Johnston câteva zile mai târziu.","english":"Sherman met with Johnston a few days later.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197069"},{"id":"tat-709017","romanian":"De ce îţi sunt urechile atât de mari?","english":"Why are your ears so big?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420299"},{"id":"tat-863737","romanian":"Cheltuiește bani și bucură-te de viață!","english":"Spend money and enjoy life!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9086244"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-1197123","romanian":"Cât e până la aeroport?","english":"How far is it to the airport?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3134254"},{"id":"tat-1136509","romanian":"Sunt de acord să merg cu el.","english":"I agree to go with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965688"},{"id":"tat-1136874","romanian":"E destul de supărată.","english":"She is quite angry.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956314"},{"id":"tat-1143269","romanian":"Oamenii sunt în echipă.","english":"The people are on the team.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068650"},{"id":"tat-584459","romanian":"Tu din nou?","english":"You again?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807669"},{"id":"tat-698941","romanian":"Cum se numește acest râu?","english":"What is the name of this river?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2265424"},{"id":"tat-399624","romanian":"Bună, ce faci?","english":"Hello, how are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6363145"},{"id":"tat-1136663","romanian":"Casa a luat foc.","english":"The house caught fire.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966118"},{"id":"tat-1192751","romanian":"Puteți scădea prețul dacă voi cumpăra două?","english":"Could you knock down the price if I buy two?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1429026"},{"id":"tat-1185126","romanian":"Nu mă bag.","english":"I am not getting involved.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323861"},{"id":"tat-1064244","romanian":"Tom a uitat să își ia medicația azi dimineață.","english":"Tom forgot to take his medication this morning.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073232"},{"id":"tat-1064195","romanian":"Cred că Tom și Mary sunt căsătoriți în secret.","english":"I think Tom and Mary are secretly married.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072663"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
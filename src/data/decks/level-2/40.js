@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136621","romanian":"M-a făcut să scriu scrisoarea cu stiloul.","english":"He made me write the letter with a pen.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227767"},{"id":"tat-1143234","romanian":"Tom a cerut un apel de deșteptare.","english":"Tom asked for a wake-up call.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068482"},{"id":"tat-446564","romanian":"Ești ocupat?","english":"Are you busy?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6269572"},{"id":"tat-1159828","romanian":"Casa lui e plină de lucruri utile.","english":"His house is full of convenience.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167796"},{"id":"tat-1153169","romanian":"Mă plimbam pe bulevard.","english":"I was strolling down the avenue.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1778405"},{"id":"tat-1119702","romanian":"Vorbiți ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7185558"},{"id":"tat-1192694","romanian":"Mergi drept înainte până ajungi la biserică.","english":"Go straight ahead until you reach the church.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/678764"},{"id":"tat-1153153","romanian":"A explica chestiunea în detaliu.","english":"He explained the matter in detail.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1715495"},{"id":"tat-1064368","romanian":"Tom și Mary au devenit foarte buni prieteni.","english":"Tom and Mary became very good friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074336"},{"id":"tat-1110606","romanian":"Ma ajutat foarte mult.","english":"It helped me a lot.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3824983"},{"id":"tat-709895","romanian":"Şi-a ţinut respiraţia.","english":"He held his breath.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426687"},{"id":"tat-1192805","romanian":"Nu putem întreba nimic despre vârstă sau probleme fizice.","english":"We cannot ask anything about age or physical problems.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354070"},{"id":"tat-708989","romanian":"A cuprins-o teama.","english":"Fear fell upon her.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420389"},{"id":"tat-1185066","romanian":"Îți este interzis să intri în acest loc.","english":"You are banned from entering this place.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320722"},{"id":"tat-477022","romanian":"Mulțumesc mult!","english":"Thank you very much!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6245731"},{"id":"tat-1136815","romanian":"O serie de accidente rutiere au avut loc recent.","english":"A number of traffic accidents have happened recently.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966350"},{"id":"tat-1064343","romanian":"Tom și Mary vor avea un copil.","english":"Tom and Mary are going to have a baby.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11063518"},{"id":"tat-446714","romanian":"Mi-a dat niște cărți.","english":"He gave me some books.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6823779"},{"id":"tat-1147490","romanian":"Închide ușa aia blestemată!","english":"Shut the damned door!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094827"},{"id":"tat-448190","romanian":"La dracu’ cu tine!","english":"Fuck you!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3796586"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-411949","romanian":"Am vizitat România acum câțiva ani.","english":"I visited Romania a few years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272263"},{"id":"tat-1059689","romanian":"Nu îi e ușor să învețe engleza.","english":"English is not easy for him to learn.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029000"},{"id":"tat-698918","romanian":"Nu are nimic a face cu mine.","english":"That has nothing to do with me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1802122"},{"id":"tat-1185077","romanian":"Vei traduce asta în franceză?","english":"Will you translate this into French?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321419"},{"id":"tat-706032","romanian":"Preţurile sunt mari.","english":"Prices are high.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969720"},{"id":"tat-709035","romanian":"În afară de mine, toată lumea este ocupată.","english":"Everybody is busy except me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420321"},{"id":"tat-487299","romanian":"Puțini studenți știu să citească în latină.","english":"Few students know how to read Latin.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270669"},{"id":"tat-1195255","romanian":"Acest televizor e greu.","english":"This television set is heavy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7175536"},{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-1153804","romanian":"Vii la petrecere, da?","english":"Come to the party, will you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128886"},{"id":"tat-1153778","romanian":"Paradoxal, are dreptate.","english":"Paradoxically, he is right.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128544"},{"id":"tat-864511","romanian":"Credința este moartea inteligenței.","english":"Belief is the death of intelligence.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6984822"},{"id":"tat-1143232","romanian":"Fă-o!","english":"Do it!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068477"},{"id":"tat-670628","romanian":"A renunţat la visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1611173"},{"id":"tat-1143238","romanian":"Mă uitam în jos către fundul văii.","english":"I was looking downward to the bottom of the valley.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068500"},{"id":"tat-1136514","romanian":"Încetați de a vă mai duce acolo.","english":"Stop going there.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/47857"},{"id":"tat-1153810","romanian":"Grăbește-te!","english":"Hurry up.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129000"},{"id":"tat-402116","romanian":"Bun venit!","english":"Welcome.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265824"},{"id":"tat-583829","romanian":"Tom a ajuns ultimul.","english":"Tom was the very last to arrive.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2203704"},{"id":"tat-1136946","romanian":"Sora mea a insistat să meargă cu mine.","english":"My sister insisted on going with me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957798"}],"stories":[{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1163901","romanian":"Asculți?","english":"Are you listening?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196975"},{"id":"tat-1136318","romanian":"Studiez istoria artei.","english":"I study art history.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963188"},{"id":"tat-1192833","romanian":"A picotit întreaga zi.","english":"He slumbered out the whole day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360778"},{"id":"tat-1153892","romanian":"A spus-o din amabilitate.","english":"He did it out of kindness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104038"},{"id":"tat-1136890","romanian":"Ei sunt un poet și un om de stat.","english":"They are a poet and a statesman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957806"},{"id":"tat-1185073","romanian":"Treci la subiect!","english":"Get to the point!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321357"},{"id":"tat-1185067","romanian":"Tom vorbea la telefon de o oră.","english":"Tom has been talking on the phone for an hour.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320872"},{"id":"tat-1143631","romanian":"Îmi place să mă uit la televizor.","english":"I like to watch TV.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071796"},{"id":"tat-925175","romanian":"Plouă dar pentru cât plouă, plouă puţin.","english":"It rains, but for what it does rain, it rains little.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527273"},{"id":"tat-1181806","romanian":"Vreau o chitară.","english":"I want a guitar.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12297767"},{"id":"tat-1136402","romanian":"Conducerea a încercat să liniștească muncitorii oferindu-le un bonus.","english":"Management tried to appease labor by offering them a bonus.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962896"},{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-862829","romanian":"Încă mai aștept să-mi spună ce s-a întîmplat.","english":"I am still waiting to be told what happened.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014507"},{"id":"tat-411885","romanian":"Mi-am adus câteva cărți de citit.","english":"I brought some of my books to read.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272023"},{"id":"tat-584465","romanian":"Mă doare în gât şi îmi curge nasul.","english":"I have a sore throat and runny nose.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807839"},{"id":"tat-709013","romanian":"Câte mere vrei?","english":"How many apples do you want?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420288"},{"id":"tat-1064029","romanian":"Pari ocupat.","english":"You look busy.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064319"},{"id":"tat-1143130","romanian":"Calciul lipsește din dieta lui.","english":"Calcium is absent from his diet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068855"},{"id":"tat-1120212","romanian":"Sunt din Egipt.","english":"I am from Egypt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11851441"},{"id":"tat-1153152","romanian":"Nu e un om care să spună o minciună.","english":"He is not a man to tell a lie.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692344"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
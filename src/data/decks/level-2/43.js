@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1192713","romanian":"A avut timp să-și pregătească oamenii de luptă.","english":"He had time to prepare his men for battle.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2953687"},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-1136839","romanian":"Ce e dragostea?","english":"What is love?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532441"},{"id":"tat-1136624","romanian":"Fetița a izbucnit în lacrimi.","english":"The young girl burst into tears.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966101"},{"id":"tat-1136511","romanian":"Mă simt îndatorată moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965107"},{"id":"tat-1153773","romanian":"Am lucrat pe un contract anual.","english":"I worked on a yearly contract.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128476"},{"id":"tat-986475","romanian":"Încerci să mă înțelegi?","english":"Try to understand me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637107"},{"id":"tat-986483","romanian":"El știe tot.","english":"He knows everything.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637121"},{"id":"tat-488759","romanian":"Această cameră nu este potrivită pentru dormit.","english":"This room is not suitable for sleeping.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268734"},{"id":"tat-1136813","romanian":"Tata și-a ajustat întotdeauna costumele la croitor.","english":"Father always has the tailor make his suits.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966356"},{"id":"tat-487305","romanian":"Pisica este adorabilă.","english":"The cat is adorable.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270702"},{"id":"tat-862378","romanian":"Soția mea a născut un copil săptămâna trecută.","english":"My wife had a baby last week.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9458631"},{"id":"tat-1064302","romanian":"Tom a întrebat-o pe Mary unde locuiește John.","english":"Tom asked Mary where John lived.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11051404"},{"id":"tat-1119735","romanian":"Vorbiți germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7205590"},{"id":"tat-584798","romanian":"Mă dor picioarele.","english":"My feet hurt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813828"},{"id":"tat-1136844","romanian":"Voi urma planul tău.","english":"I will go along with your plan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966268"},{"id":"tat-708922","romanian":"Poate o să ningă.","english":"Maybe it will snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397946"},{"id":"tat-1119750","romanian":"Vorbiți suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264927"},{"id":"tat-411927","romanian":"În weekend am mult de spălat.","english":"Over the weekend I have a lot to wash.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272185"},{"id":"tat-1136651","romanian":"Această propoziție este la prezentul perfect sau trecutul simplu?","english":"Is this sentence in the present perfect or simple past?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239828"}],"stories":[{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1153789","romanian":"L-am găsit pe băiat deja adormit.","english":"I found the boy fast asleep.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128663"},{"id":"tat-408063","romanian":"Avem aceleași intenții, dar nu același mod de operare.","english":"We have the same intentions, but not the same modus operandi.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232774"},{"id":"tat-708921","romanian":"Leagă-ţi şireturile.","english":"Tie your shoelaces.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397940"},{"id":"tat-405835","romanian":"Transmite-i, te rog, salutări doamnei Andreescu!","english":"Please say hello to Mrs. Andreescu!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350559"},{"id":"tat-1185109","romanian":"Toți vom muri mai devreme sau mai târziu.","english":"We all shall die sooner or later.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195149"},{"id":"tat-708965","romanian":"Căţărătorii se treziră înaintea zorilor.","english":"The climbers awoke before daybreak.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420408"},{"id":"tat-1163902","romanian":"Mă asculți?","english":"Are you listening?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196976"},{"id":"tat-1185180","romanian":"Acum e în spital.","english":"She is in hospital now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324332"},{"id":"tat-1192741","romanian":"Tom a avut vremuri grele anul trecut.","english":"Tom had a rough time last year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511264"},{"id":"tat-19","romanian":"Cat costa?","english":"How much does it cost?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-670692","romanian":"Poți alege orice carte vrei.","english":"You may choose whichever book you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200793"},{"id":"tat-902137","romanian":"A început să ningă.","english":"It began to snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287411"},{"id":"tat-1059667","romanian":"Era văzut ca un om învățat în comunitatea noastră.","english":"He passed for a learned man in our community.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11028998"},{"id":"tat-1136579","romanian":"Nu traduceți această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965936"},{"id":"tat-488786","romanian":"Cât este ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528939"},{"id":"tat-1064424","romanian":"L-am văzut fugind.","english":"I saw him run away.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076207"},{"id":"tat-1192731","romanian":"Fratele meu vrea să meargă pe lună cândva.","english":"My brother wants to go to the moon some day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7507022"},{"id":"tat-1064018","romanian":"El a început să se scuze.","english":"He began to make excuses.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10918528"},{"id":"tat-706147","romanian":"A trecut frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974726"},{"id":"tat-1151780","romanian":"Azi e joi.","english":"Today is Thursday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119184"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
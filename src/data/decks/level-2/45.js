@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-487280","romanian":"Am ratat ceva?","english":"Did I miss anything?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270414"},{"id":"tat-584853","romanian":"Casa sa este foarte modernă.","english":"Her house is very modern.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812441"},{"id":"tat-1156691","romanian":"Tragedia este distracția nobililor.","english":"Tragedy is the entertainment of the nobles.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10540794"},{"id":"tat-1136851","romanian":"Te-ai spălat deja pe mâini?","english":"Have you washed your hands yet?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966287"},{"id":"tat-448634","romanian":"Capitala Italiei este Roma.","english":"The capital of Italy is Rome.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5020749"},{"id":"tat-1056784","romanian":"Majoritatea copiilor urăsc școala.","english":"Most children hate school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031352"},{"id":"tat-1064314","romanian":"Cât de des o vede Tom pe Mary?","english":"How often does Tom see Mary?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11060128"},{"id":"tat-1142921","romanian":"Strada este deteriorată.","english":"The road is damaged.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066444"},{"id":"tat-689399","romanian":"Crăciun fericit!","english":"Merry Christmas!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1781709"},{"id":"tat-1136918","romanian":"- A scris ieri o scrisoare? - Da.","english":"Did he write a letter yesterday? \"Yes, he did.\"","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960508"},{"id":"tat-714067","romanian":"Romeo este bărbatul pe care Julieta îl iubeşte.","english":"Romeo is the man Juliet loves.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469893"},{"id":"tat-702068","romanian":"Îmi place să călătoresc.","english":"I like traveling.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-1064235","romanian":"Tom are iubită?","english":"Does Tom have a girlfriend?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073102"},{"id":"tat-698920","romanian":"Îți place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1837147"},{"id":"tat-1097617","romanian":"Sala de şedinţe este ocupate în acest moment.","english":"The meeting room is occupied at the moment.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11654854"},{"id":"tat-1151771","romanian":"Azi nu e ziua ta.","english":"Today is not your day.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118740"},{"id":"tat-1056778","romanian":"Muzica este o parte importantă din viața mea.","english":"Music is an important part of my life.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031363"},{"id":"tat-1142894","romanian":"Alb?","english":"Is it white?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066019"},{"id":"tat-706050","romanian":"Dacă înveţi din greu, vei deveni un student bun.","english":"If you study hard, you will become a good student.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970031"},{"id":"tat-1153792","romanian":"În noaptea aceea, s-a îmbolnăvit, având dureri de stomac.","english":"That night, he became sick with pains in his stomach.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128717"}],"stories":[{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
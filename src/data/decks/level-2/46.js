@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136888","romanian":"Era la locul crimei.","english":"She was on the scene of the crime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966017"},{"id":"tat-1201124","romanian":"Îmi place Cathy.","english":"I am fond of Cathy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12023720"},{"id":"tat-698951","romanian":"Am 2 frați.","english":"I have two brothers.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2817943"},{"id":"tat-399606","romanian":"Mulțumesc!","english":"Thank you!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"},{"id":"tat-1119769","romanian":"Când a murit? \"Nu cu mult timp în urmă.\"","english":"When did he die? \"Not very long ago.\"","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11845708"},{"id":"tat-928490","romanian":"Oamenii deștepți știu cum să facă bani din orice.","english":"Clever people know how to make money out of nothing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5131666"},{"id":"tat-1192765","romanian":"Mulțumesc pentru instrucțiuni.","english":"Thank you for the lead.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357142"},{"id":"tat-1136639","romanian":"Cine a scris această scrisoare?","english":"Who wrote this letter?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966122"},{"id":"tat-407954","romanian":"Mașina mea e Ford, ca și a dumneavoastră.","english":"My car is a Ford, just like yours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525379"},{"id":"tat-1143180","romanian":"Cine ești tu ca să vorbești așa cu mine?","english":"Who are you to talk to me like that?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069234"},{"id":"tat-1136896","romanian":"Sunt atât de bucuros să vizit VNU.","english":"I’m so glad to visit VNU.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966032"},{"id":"tat-1064170","romanian":"Toată lumea în afară de Tom a fost prezentă.","english":"Everyone except Tom was present.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3090030"},{"id":"tat-487328","romanian":"Este profesor?","english":"Is he a teacher?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336990"},{"id":"tat-1143257","romanian":"I-a pus întrebări.","english":"He asked her questions.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068610"},{"id":"tat-1192777","romanian":"I-a arătat poza mea.","english":"She showed him my picture.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364287"},{"id":"tat-986499","romanian":"Puteți folosi dicționarul meu.","english":"You may use my dictionary.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637140"},{"id":"tat-1185252","romanian":"Taro, du-te și spală-te pe dinți.","english":"Taro, go and brush your teeth.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328036"},{"id":"tat-1153784","romanian":"Acum simt la fel.","english":"Now I feel the same.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128604"},{"id":"tat-1064159","romanian":"Casa pe care a construit-o Tom este minunată.","english":"The house Tom built is wonderful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072308"},{"id":"tat-1064193","romanian":"Nu am absolut nimic de făcut.","english":"I have absolutely nothing to do.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066192"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136877","romanian":"Trebuie să ne gândim la comunitate.","english":"We must think about the community.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956374"},{"id":"tat-1185182","romanian":"Și-a afirmat inocența.","english":"He affirmed his innocence.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324346"},{"id":"tat-1064411","romanian":"Îmi aduc aminte de ce a spus el.","english":"I remember what he said.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075722"},{"id":"tat-1151813","romanian":"Cade o frunză.","english":"A leaf is falling.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119103"},{"id":"tat-1143183","romanian":"A fost obligată să renunțe la plan.","english":"She was obliged to give up the plan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069259"},{"id":"tat-1136629","romanian":"Cariera lui progresează furtunos.","english":"His career is progressing in leaps and bounds.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239750"},{"id":"tat-1059705","romanian":"Nu e glumă.","english":"It is no joke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795790"},{"id":"tat-1119729","romanian":"Vorbiți arabă?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264753"},{"id":"tat-1186834","romanian":"Prefer mersul pe bicicletă.","english":"I prefer biking.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7304101"},{"id":"tat-702225","romanian":"Se va despărţi de prietenul ei.","english":"She is going to part from her boyfriend.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398964"},{"id":"tat-670630","romanian":"Probabil, dar el vrea ca să renunţ dintr-odată.","english":"Maybe, but he wants me to stop cold turkey.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1628320"},{"id":"tat-1136969","romanian":"Tom avea intenția să meargă iar la Boston.","english":"Tom felt like going to Boston again.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966185"},{"id":"tat-1143133","romanian":"Întotdeauna sunt ajutat de tine.","english":"I am always helped by you.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068889"},{"id":"tat-1136691","romanian":"L-am văzut oprindu-se.","english":"I observed him stop.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221903"},{"id":"tat-709916","romanian":"Din 50 de aplicanţi, 20 au fost respinşi.","english":"There were 20 failures among 50 applicants.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424371"},{"id":"tat-1136575","romanian":"Sosirea trupelor a condus la exacerbarea violențelor.","english":"The arrival of the troops led to more violence.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966041"},{"id":"tat-1119738","romanian":"Vorbești turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6355405"},{"id":"tat-1136619","romanian":"Băiatul plângea în cameră.","english":"The boy was crying in the room.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227573"},{"id":"tat-709907","romanian":"Gabriel este doar unul dintre îngerii Domnului.","english":"Gabriel is only one of the angels of God.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426741"},{"id":"tat-862380","romanian":"Am amânat evenimentul.","english":"We postponed the event.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9459071"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
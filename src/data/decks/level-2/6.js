@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1151778","romanian":"Azi e miercuri. Citesc.","english":"Today is Wednesday. I am reading.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119179"},{"id":"tat-1185061","romanian":"Frânghia e foarte slabă.","english":"The string is very weak.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12319365"},{"id":"tat-1144343","romanian":"Piața respectivă s-a extins rapid.","english":"That market has been rapidly expanding.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073795"},{"id":"tat-1136863","romanian":"Toată lumea știe că încă este în viață.","english":"Everybody knows for a fact that he is still alive.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966276"},{"id":"tat-1185064","romanian":"Mi-a așteptat răspunsul.","english":"She waited for my reply.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320611"},{"id":"tat-1186864","romanian":"Acest ceas trebuie reparat.","english":"This watch needs to be fixed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338255"},{"id":"tat-411853","romanian":"În Franța ați lucrat la ambasadă sau la consulat?","english":"In France did you work at the embassy or in the consulate?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6262484"},{"id":"tat-1064248","romanian":"Tom nu se sperie aproape niciodată.","english":"Tom almost never gets scared.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073108"},{"id":"tat-698972","romanian":"Am două cărți.","english":"I have two books.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3766465"},{"id":"tat-1185075","romanian":"Îi va lua mult să-și revină?","english":"Will it take long to recover?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321365"},{"id":"tat-1142891","romanian":"Cât e ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065971"},{"id":"tat-712076","romanian":"Trebuie să vii cu mine.","english":"You have to come with me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440714"},{"id":"tat-1064121","romanian":"Tom a fost la plajă săptămâna trecută.","english":"Tom went to the beach last week.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070852"},{"id":"tat-399597","romanian":"Vorbiți italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314367"},{"id":"tat-1058773","romanian":"Declarațiile lui sunt infantile şi adesea mă deranjază.","english":"His statements are childish and they often bother me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11044684"},{"id":"tat-709911","romanian":"John a depus mărturie în ceea ce îl priveşte.","english":"John testified concerning him.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426745"},{"id":"tat-448231","romanian":"Sunt bolnav.","english":"I am sick.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3947930"},{"id":"tat-411878","romanian":"Îmi spăl mașina în fața casei fără probleme.","english":"I wash my car in front of the house without any problems.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271996"},{"id":"tat-1192832","romanian":"Era consumată de ambiție.","english":"She was consumed with ambition.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360676"},{"id":"tat-1136737","romanian":"S-a dus în Italia cu gândul să studieze literatura.","english":"He went to Italy with a view to studying literature.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966251"}],"stories":[{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1136600","romanian":"Vă rog să îmi răspundeți în scurtă vreme.","english":"Please write me a reply soon.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966023"},{"id":"tat-705997","romanian":"Ai avut un weekend plăcut?","english":"Did you have a good weekend?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968585"},{"id":"tat-1143146","romanian":"Fără sfatul meu, ai fi eșuat.","english":"But for my advice, you would have failed.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068933"},{"id":"tat-487284","romanian":"Îl știu?","english":"Do I know him?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270480"},{"id":"tat-1136532","romanian":"Profesorul ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960883"},{"id":"tat-411966","romanian":"Am văzut-o pe Dana.","english":"I saw Dana.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272314"},{"id":"tat-610804","romanian":"După nașterea copilului trebuie să lucrezi jumătate de normă.","english":"After the birth of your child, you should make your work part-time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/614825"},{"id":"tat-1200897","romanian":"Am venit, am văzut, am cucerit.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11216029"},{"id":"tat-1144715","romanian":"Capitala Serbiei este Belgrad.","english":"The capital city of Serbia is Belgrade.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076564"},{"id":"tat-712090","romanian":"Va trebui să facem ceva.","english":"We will have to do something.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440048"},{"id":"tat-20","romanian":"Vorbesti engleza?","english":"Do you speak English?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-1136627","romanian":"Cu toții ne dorim pace.","english":"We all wished for peace.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239780"},{"id":"tat-487322","romanian":"Femeia mănâncă o portocală.","english":"The woman eats an orange.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336244"},{"id":"tat-408004","romanian":"Pentru cine bat clopotele?","english":"For whom do the bells toll?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532040"},{"id":"tat-1159855","romanian":"Găsesc limbile străine foarte interesante.","english":"I find foreign languages very interesting.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168137"},{"id":"tat-1136858","romanian":"Era cât pe ce să explodeze, dar s-a stăpânit.","english":"He was about to explode, but checked himself.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966284"},{"id":"tat-1119703","romanian":"Vorbești ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342578"},{"id":"tat-1059504","romanian":"I se zice Jim.","english":"They call him Jim.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8001955"},{"id":"tat-406002","romanian":"Astăzi vremea e frumoasă.","english":"Today the weather is nice.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350319"},{"id":"tat-1159808","romanian":"Pune ouăle în frigider.","english":"Put the eggs in the refrigerator.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168184"}],"stories":[{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1144718","romanian":"Capitala Albaniei este Tirana.","english":"The capital city of Albania is called Tirana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076581"},{"id":"tat-1136841","romanian":"Conducătorii de autobuze vor face grevă astăzi.","english":"The bus drivers are going on strike today.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966685"},{"id":"tat-1057661","romanian":"L-au dat afară din discotecă fără nicio explicație.","english":"They kicked him out of the disco without any explanation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11037179"},{"id":"tat-1136536","romanian":"Rockul este muzica celor tineri.","english":"Rock is the music of the young.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965478"},{"id":"tat-1136616","romanian":"Toate invențiile apar din necesitate.","english":"All inventions grow out of necessity.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965950"},{"id":"tat-712075","romanian":"Am vizitat Fukuoka acum zece ani.","english":"I visited Fukuoka ten years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440712"},{"id":"tat-1143189","romanian":"A strâns vesela de pe masă după cină.","english":"She cleared the table of the dishes after dinner.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069281"},{"id":"tat-862344","romanian":"În general, bărbaţii sunt mai înalţi decât femeile.","english":"Generally speaking, men are taller than women.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10085812"},{"id":"tat-1143235","romanian":"De ce sunteți, băieți, așa de supărați?","english":"Why are you guys so angry?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068488"},{"id":"tat-712096","romanian":"Radioul este stricat.","english":"The radio is broken.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8438352"},{"id":"tat-1136296","romanian":"Am alergat spre ușă.","english":"I ran toward the door.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963200"},{"id":"tat-1059623","romanian":"Poți fi chiar președinte!","english":"You can even be a president!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8037893"},{"id":"tat-1192838","romanian":"Tatăl meu e doctor.","english":"My father is a doctor.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361424"},{"id":"tat-487300","romanian":"Înțelepciunea nu vine în mod automat cu vârsta.","english":"Wisdom does not automatically come with age.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270672"},{"id":"tat-1130802","romanian":"Răspunde-mi.","english":"Answer me.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11926498"},{"id":"tat-705812","romanian":"Mă doare braţul rău.","english":"My arm is hurting badly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963890"},{"id":"tat-1185174","romanian":"Ne-am mâniat de cuvintele lui.","english":"We got angry at his words.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324301"},{"id":"tat-986459","romanian":"Contextul este important.","english":"The context is important.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637061"},{"id":"tat-1201211","romanian":"Am venit, am văzut, am învins.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12432138"},{"id":"tat-7","romanian":"Salut!","english":"Hi!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"}],"stories":[{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
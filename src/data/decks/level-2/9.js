@@ -0,0 +1 @@
+export default {"level":2,"sentences":[{"id":"tat-1137017","romanian":"Nu toate navigatoarele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952941"},{"id":"tat-1143124","romanian":"Sper că îmi vei răspunde în curând.","english":"I hope you will answer me soon.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068819"},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-1192716","romanian":"Un pantof desperecheat a fost lăsat pe pragul ușii.","english":"An odd shoe was left on the doorstep.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6225612"},{"id":"tat-1238705","romanian":"A fugit un bou în pantaloni scurți.","english":"A bull with short trousers has escaped.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5296592"},{"id":"tat-1111140","romanian":"Lasă-mă în pace!","english":"Leave me alone!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11790536"},{"id":"tat-446564","romanian":"Ești ocupat?","english":"Are you busy?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6269572"},{"id":"tat-1119737","romanian":"Vorbiți turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265023"},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-1136958","romanian":"Știe că îl iubești?","english":"Does he know that you love him?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960492"},{"id":"tat-1163898","romanian":"Nu îi dau niciodată câinelui meu carne nepreparată.","english":"I never feed my dog raw meat.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196922"},{"id":"tat-1089727","romanian":"Îmi place matematica.","english":"I like maths.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267471"},{"id":"tat-1192738","romanian":"Compunerea ta nu este în întregime rea.","english":"Your composition is not altogether bad.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7509671"},{"id":"tat-708994","romanian":"Amestecă în supă.","english":"Stir the soup.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8353408"},{"id":"tat-411900","romanian":"Răzvan tocmai plecă.","english":"Razvan just left.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272077"},{"id":"tat-702061","romanian":"El a ţinut un jurnal în timpul călătoriei.","english":"He kept a diary during the trip.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398898"},{"id":"tat-1185158","romanian":"Trebuie să studiez.","english":"I need to study.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324156"},{"id":"tat-1059501","romanian":"General Motors a dat afară cei 76.000 de muncitori.","english":"General Motors laid off 76,000 workers.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7534514"},{"id":"tat-1163911","romanian":"Tata ia metroul de ora 7 către serviciu.","english":"Father takes the 7:00 subway to work.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196999"},{"id":"tat-1136828","romanian":"Râzi în legătură cu ce?","english":"What are you laughing at?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966362"}],"stories":[{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
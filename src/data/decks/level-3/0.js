@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136841","romanian":"Conducătorii de autobuze vor face grevă astăzi.","english":"The bus drivers are going on strike today.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966685"},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-584004","romanian":"Ea și prietenii ei sunt înnebuniți după muzica.","english":"She and her friends are mad about music.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7117050"},{"id":"tat-708994","romanian":"Amestecă în supă.","english":"Stir the soup.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8353408"},{"id":"tat-1136700","romanian":"Mi-a dat ce bani avea la el.","english":"He gave me what money he had with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239591"},{"id":"tat-584853","romanian":"Casa sa este foarte modernă.","english":"Her house is very modern.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812441"},{"id":"tat-1143226","romanian":"Vreau trei bucăți de zahăr în laptele meu.","english":"I want three sugars in my milk.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068445"},{"id":"tat-1192813","romanian":"Părea tânăr.","english":"He appeared young.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356214"},{"id":"tat-1136399","romanian":"Camera are două ferestre.","english":"The room has two windows.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962831"},{"id":"tat-1136989","romanian":"Are acces la informația înmagazinată.","english":"He has access to the stored information.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952879"},{"id":"tat-1192842","romanian":"N-ai febră.","english":"You have no fever.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361445"},{"id":"tat-1136774","romanian":"- Sunt profesor. - Și eu sunt.","english":"I am a teacher. \"So am I.\"","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966215"},{"id":"tat-986459","romanian":"Contextul este important.","english":"The context is important.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637061"},{"id":"tat-1142942","romanian":"Servitoarea a aranjat cuțitele și furculițele pe masă.","english":"The maid arranged the knives and forks on the table.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066763"},{"id":"tat-1136809","romanian":"Care e mai veche, această carte sau cealaltă?","english":"Which is older, this book or that one?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966358"},{"id":"tat-584459","romanian":"Tu din nou?","english":"You again?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807669"},{"id":"tat-582951","romanian":"E puțină apă în găleată.","english":"There is little water in the bucket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665401"},{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-399605","romanian":"Vorbești engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-1090314","romanian":"Am fraţi.","english":"I have brothers.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3711714"}],"stories":[{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată un împărat şi o împărăteasă. Amândoi erau oameni de treabă şi frumoşi. Ei se iubeau, nevoie mare! Dară erau tot mâhniţi şi amărâţi că nu făceau copii. Toate leacurile ce luase împărăteasa de pe la vraci şi vrăjitoare nu-i folosise întru nimic."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-2","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Atunci fata babei, vicleană cum era, lua ciurul şi fuga în casă la babă şi la moşneag, spunând că ea a tors acele fuse. În zadar fata moşneagului spunea în urmă că acela este lucrul mâinilor sale; căci îndată o apucau de obraz baba şi cu fiică-sa şi trebuia numaidecât să rămâie pe-a lor."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-924380","romanian":"Sună-mă dacă ai nevoie de ajutor.","english":"Give me a call if you need help.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735315"},{"id":"tat-1059623","romanian":"Poți fi chiar președinte!","english":"You can even be a president!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8037893"},{"id":"tat-1119729","romanian":"Vorbiți arabă?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264753"},{"id":"tat-399609","romanian":"Bună dimineața la toată lumea.","english":"Good morning, everybody.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325807"},{"id":"tat-399273","romanian":"Bine ați venit!","english":"Welcome.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334977"},{"id":"tat-1136894","romanian":"Aceasta este casa în care a crescut Tom.","english":"This is the house where Tom was brought up.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956357"},{"id":"tat-1136671","romanian":"S-a înfășurat în pătură.","english":"She wrapped herself in a blanket.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239804"},{"id":"tat-902150","romanian":"Cred că am înţeles.","english":"I think I understood.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287441"},{"id":"tat-1143175","romanian":"Jane ne-a spus că gătitul nu era dificil.","english":"Jane told us that cooking was not difficult.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069208"},{"id":"tat-1185087","romanian":"- Ce fel de senzație? întrebă negustorul.","english":"What kind of feeling? the shopkeeper asked.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321492"},{"id":"tat-1136542","romanian":"O puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965557"},{"id":"tat-1192834","romanian":"În Japonia, noul an școlar începe în aprilie.","english":"The new school year begins in April in Japan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361249"},{"id":"tat-1195295","romanian":"Este funcționar bancar.","english":"He is a bank clerk.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2308938"},{"id":"tat-399600","romanian":"Vorbești japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319472"},{"id":"tat-1192716","romanian":"Un pantof desperecheat a fost lăsat pe pragul ușii.","english":"An odd shoe was left on the doorstep.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6225612"},{"id":"tat-1144305","romanian":"Japonia se compune din patru insule principale.","english":"Japan consists of four main islands.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073340"},{"id":"tat-1201333","romanian":"Cafea sau ceai?","english":"Coffee or tea?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4037739"},{"id":"tat-411952","romanian":"L-am vizitat pe Dan.","english":"I visited Dan.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272272"},{"id":"tat-928490","romanian":"Oamenii deștepți știu cum să facă bani din orice.","english":"Clever people know how to make money out of nothing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5131666"},{"id":"tat-1064255","romanian":"Tom s-a prefăcut că nu aude nimic.","english":"Tom pretended to not hear a thing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073104"}],"stories":[{"id":"story-ro-g-in-reasa-3","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Numaidecât mai-marii ţării ziseră fetei să se gătească de nuntă. Acum altă nevoie. Nici fata nu voia să ia pe tată-său de soţ. Ea zise: – Unde aţi mai auzit, boieri dumneavoastră, batjocură ca aceasta, să ia tatăl de soţie pe fie-sa. – Nu te supăra, domniţă, şi nu fii aşa ţanţoşă."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-departe-departe-3","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":210,"excerpt":"Şi când mi se păru că palatul se şterge de pe faţa pământului, o rupsei la fugă îndărăt, căci ce m-aş fi făcut în aşa pustietate? Şi de ce goneam, de ce palatul se ridica uşor din grădinile fumurii. Lacul e roşu ca sângele. Apune soarele. Mă rezemai de-o salcie scorburoasă şi începui să mă gândesc. Mi-e foame."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
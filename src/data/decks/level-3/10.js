@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-923862","romanian":"Mă grăbesc.","english":"I am in a hurry.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444186"},{"id":"tat-1143189","romanian":"A strâns vesela de pe masă după cină.","english":"She cleared the table of the dishes after dinner.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069281"},{"id":"tat-583889","romanian":"Mă țin întotdeauna de promisiune.","english":"I always keep my promises.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/870644"},{"id":"tat-1144707","romanian":"Capitala Olandei este Amsterdam.","english":"The capital city of the Netherlands is Amsterdam.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076528"},{"id":"tat-1136625","romanian":"În caz de incendiu sunați la 119.","english":"In case of fire, you should dial 119.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966144"},{"id":"tat-448231","romanian":"Sunt bolnav.","english":"I am sick.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3947930"},{"id":"tat-1136518","romanian":"Încet și fără grabă se câștigă cursa.","english":"Slow and steady wins the race.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965773"},{"id":"tat-1151761","romanian":"Azi e duminică.","english":"Today is Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118662"},{"id":"tat-411878","romanian":"Îmi spăl mașina în fața casei fără probleme.","english":"I wash my car in front of the house without any problems.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271996"},{"id":"tat-1185174","romanian":"Ne-am mâniat de cuvintele lui.","english":"We got angry at his words.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324301"},{"id":"tat-708960","romanian":"Ce sporturi îţi plac?","english":"What sports do you like?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420397"},{"id":"tat-698933","romanian":"Cu ce vă pot fi de folos astăzi, domnule?","english":"How may I help you today, sir?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2157709"},{"id":"tat-925175","romanian":"Plouă dar pentru cât plouă, plouă puţin.","english":"It rains, but for what it does rain, it rains little.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527273"},{"id":"tat-1159855","romanian":"Găsesc limbile străine foarte interesante.","english":"I find foreign languages very interesting.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168137"},{"id":"tat-411949","romanian":"Am vizitat România acum câțiva ani.","english":"I visited Romania a few years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272263"},{"id":"tat-1097617","romanian":"Sala de şedinţe este ocupate în acest moment.","english":"The meeting room is occupied at the moment.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11654854"},{"id":"tat-1185094","romanian":"Sunt băiat bun.","english":"I am a good boy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7181129"},{"id":"tat-1136649","romanian":"Vorbește puțin engleza.","english":"He speaks English a little.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966129"},{"id":"tat-709933","romanian":"Nimeni nu a încurajat-o.","english":"No one encouraged her.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426774"},{"id":"tat-488758","romanian":"Vă rugam să așteptați treizeci de minute.","english":"Please wait for thirty minutes.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268731"}],"stories":[{"id":"story-ro-amintiri-din-copil-rie-i-2","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Şi unde nu s-au adunat o mulţime de băieţi şi fete la şcoală, între care eram şi eu, un băiat prizărit, ruşinos şi fricos şi de umbra mea."},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-povestea-lui-harap-alb-2","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Amu cică împăratul acela, aproape de bătrâneţe, căzând la zăcare, a scris către frăţine-său craiului, să-i trimită grabnic pe cel mai vrednic dintre nepoţi, ca să-l lase împărat în locul său după moartea sa. Craiul, primind cartea, îndată chemă tustrei feciorii înaintea sa şi le zise: – Iaca ce-mi scrie frate-meu şi moşul vostru."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
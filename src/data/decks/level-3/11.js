@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1143134","romanian":"E necugetat din partea ta să crezi asemenea lucru.","english":"It is foolish of you to believe such a thing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068893"},{"id":"tat-712069","romanian":"Socialism sau barbarism.","english":"Socialism or barbarism.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440421"},{"id":"tat-1153161","romanian":"Era obișnuită să trăiască dintr-un venit modest.","english":"She was used to living on a small income.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1752003"},{"id":"tat-10","romanian":"Noroc!","english":"Cheers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665964"},{"id":"tat-709901","romanian":"Unde se joacă Toni?","english":"Where is Tony playing?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426734"},{"id":"tat-708989","romanian":"A cuprins-o teama.","english":"Fear fell upon her.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420389"},{"id":"tat-1059693","romanian":"Trebuie să fiu acolo până la ora 07.00.","english":"I must be there before 7:00.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758791"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-1136621","romanian":"M-a făcut să scriu scrisoarea cu stiloul.","english":"He made me write the letter with a pen.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227767"},{"id":"tat-1142947","romanian":"Am nevoie de stilouri, caiete și altele.","english":"I need pens, notebooks and so on.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12067969"},{"id":"tat-1119695","romanian":"Vorbiți chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511123"},{"id":"tat-1163919","romanian":"Sherman s-a întâlnit cu Johnston câteva zile mai târziu.","english":"Sherman met with Johnston a few days later.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197069"},{"id":"tat-1192766","romanian":"Acesta este stiloul cu care a scris faimosul romancier.","english":"This is the pen which the famous novelist wrote with.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357144"},{"id":"tat-706145","romanian":"A traversat frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974711"},{"id":"tat-411857","romanian":"Vreți să mergeți la film sau la teatru?","english":"Do you want to go to the movies or to the theater?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271921"},{"id":"tat-1185109","romanian":"Toți vom muri mai devreme sau mai târziu.","english":"We all shall die sooner or later.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195149"},{"id":"tat-1136266","romanian":"Barca era legată cu o parâmă scurtă.","english":"The boat was tied with a short line.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964628"},{"id":"tat-706130","romanian":"El scrie cărţi.","english":"He writes books.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974452"},{"id":"tat-706062","romanian":"Mama îşi trezeşte fiica.","english":"The mother wakes up her daughter.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970709"},{"id":"tat-1136847","romanian":"I-a cumpărat un pulover.","english":"She bought him a sweater.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966283"}],"stories":[{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"},{"id":"story-ro-d-nil-prepeleac","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Erau odată într-un sat doi fraţi, şi amândoi erau însuraţi. Cel mai mare era harnic, grijuliu şi chiabur, pentru că unde punea el mâna punea şi Dumnezeu mila, dar n-avea copii. Iară cel mai mic era sărac."},{"id":"story-ro-povestea-lui-stan-p-itul-3","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"Ce-a mai fi şi asta? Alţii, că să te ferească Dumnezeu de femeia leneşă, mârşavă şi risipitoare; alţii alte năstruşnicii, încât nu ştii ce să crezi şi ce să nu crezi? Numai nu-i vorbă că am văzut eu şi destui bărbaţi mult mai ticăiţi şi mai chitcăiţi decât cea mai bicisnică femeie."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1143124","romanian":"Sper că îmi vei răspunde în curând.","english":"I hope you will answer me soon.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068819"},{"id":"tat-1192768","romanian":"Pentru ce ai cumpărat acest dicționar costisitor?","english":"What did you buy this expensive dictionary for?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357179"},{"id":"tat-709046","romanian":"Engleza este o limbă internaţională.","english":"English is an international language.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420340"},{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-986475","romanian":"Încerci să mă înțelegi?","english":"Try to understand me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637107"},{"id":"tat-709907","romanian":"Gabriel este doar unul dintre îngerii Domnului.","english":"Gabriel is only one of the angels of God.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426741"},{"id":"tat-408047","romanian":"Cine știe?","english":"Who knows?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220694"},{"id":"tat-1136903","romanian":"Avem nevoie de ceva educație formală în literatură.","english":"We need some formal instruction in literature.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966068"},{"id":"tat-1153756","romanian":"Trebuie să-mi clătesc gura.","english":"I need to rinse my mouth.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4660319"},{"id":"tat-698973","romanian":"Cartea este mare.","english":"The book is big.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3870973"},{"id":"tat-923891","romanian":"Camera arată diferit, acum îmi place mai mult.","english":"The room looks different, now I like it more.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10445017"},{"id":"tat-1278911","romanian":"Sunt pregătit să te ajut.","english":"I am ready to help you.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13347606"},{"id":"tat-4","romanian":"Nu.","english":"No.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8065106"},{"id":"tat-864477","romanian":"Pe câinele nostru l-am numit White.","english":"We named our dog White.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817260"},{"id":"tat-1136969","romanian":"Tom avea intenția să meargă iar la Boston.","english":"Tom felt like going to Boston again.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966185"},{"id":"tat-706147","romanian":"A trecut frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974726"},{"id":"tat-408068","romanian":"Ce să fac?!","english":"What can I do?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232794"},{"id":"tat-448634","romanian":"Capitala Italiei este Roma.","english":"The capital of Italy is Rome.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5020749"},{"id":"tat-862830","romanian":"Prima oară a fost ales de senat în 1984.","english":"He was first elected to the Senate in 1984.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014508"},{"id":"tat-923814","romanian":"Anumite plante cresc bine cu puțină îngrijire.","english":"Some plants grow well with a minimum of care.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10431937"}],"stories":[{"id":"story-ro-porcul-cel-fermecat-3","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"uşa se deschise. Fetele intrară. Când colo, ce să vază? Casa n-avea nici o podoabă; dară în mijloc era o masă o masă mare cu un covor scump pe dânsa, şi deasupra o carte mare deschisă. Fetele, nerăbdătoare, voiră a şti ce zicea în cartea aceea."},{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."},{"id":"story-ro-ivan-turbinc","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Era odată un rus, pe care îl chema Ivan. Şi rusul acela din copilărie se trezise în oaste. Şi slujind el câteva soroace de-a rândul, acuma era bătrân. Şi mai-marii lui, văzându-l că şi-a făcut datoria de ostaş, l-au slobozit din oaste, cu arme cu tot, să se ducă unde-a vrea, dându-i şi două carboave de cheltuială."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
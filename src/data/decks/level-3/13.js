@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1153762","romanian":"Te rog nu ezita să te exprimi liber.","english":"Please feel free to express yourself.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6511815"},{"id":"tat-1056804","romanian":"Nimănui nu-i place războiul.","english":"No one loves war.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031604"},{"id":"tat-1144284","romanian":"Are o legătură cu furtul.","english":"He has something to do with the robbery.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7510355"},{"id":"tat-1143143","romanian":"Când pot călători?","english":"When can I travel?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068926"},{"id":"tat-1153853","romanian":"Jack e tăcut acum.","english":"Jack is quiet now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130113"},{"id":"tat-1143126","romanian":"Doctorul este un om cult.","english":"The doctor is a man of culture.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068831"},{"id":"tat-1200899","romanian":"Am plâns și am crezut.","english":"I wept and I believed.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11229733"},{"id":"tat-448190","romanian":"La dracu’ cu tine!","english":"Fuck you!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3796586"},{"id":"tat-698952","romanian":"Am vrut să cumpăr cartea.","english":"I wanted to buy the book.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2818798"},{"id":"tat-1136549","romanian":"M-am sfătuit cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958681"},{"id":"tat-487328","romanian":"Este profesor?","english":"Is he a teacher?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336990"},{"id":"tat-923884","romanian":"Am petrecut toată seara dansând împreună.","english":"We spent all evening dancing together.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444876"},{"id":"tat-1059686","romanian":"Merită văzute ruinele.","english":"The ruins are worth seeing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963708"},{"id":"tat-986476","romanian":"Te iubesc!","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637108"},{"id":"tat-2","romanian":"Multumesc.","english":"Thank you.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"},{"id":"tat-1192741","romanian":"Tom a avut vremuri grele anul trecut.","english":"Tom had a rough time last year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511264"},{"id":"tat-712075","romanian":"Am vizitat Fukuoka acum zece ani.","english":"I visited Fukuoka ten years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440712"},{"id":"tat-1153768","romanian":"Nu simte nicio reticență în recunoașterea erorilor.","english":"He feels no reluctance in acknowledging errors.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128216"},{"id":"tat-709900","romanian":"Astfel de incidente sunt destul de obişnuite.","english":"Such incidents are quite common.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426733"},{"id":"tat-1136600","romanian":"Vă rog să îmi răspundeți în scurtă vreme.","english":"Please write me a reply soon.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966023"}],"stories":[{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."},{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
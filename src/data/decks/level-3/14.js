@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136901","romanian":"Maşina noastră a rămas fără combustibil după zece minute.","english":"Our car ran out of gas after ten minutes.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966025"},{"id":"tat-1136723","romanian":"Acolo nefiind taxiuri, a trebuit să merg pe jos.","english":"There being no taxis, I had to walk.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226178"},{"id":"tat-584851","romanian":"Când a fost tânăr, a muncit cu sârguinţă.","english":"When he was young, he was a hard worker.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812437"},{"id":"tat-1192827","romanian":"Unde îmi pot ridica bagajele?","english":"Where can I pick up my baggage?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12359803"},{"id":"tat-1163911","romanian":"Tata ia metroul de ora 7 către serviciu.","english":"Father takes the 7:00 subway to work.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196999"},{"id":"tat-583827","romanian":"În fiecare duminică după-amiaza merg la târg.","english":"Every Sunday afternoon, I go to the bazaar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1913109"},{"id":"tat-610923","romanian":"Micul dejun este gata.","english":"Breakfast is ready.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/767045"},{"id":"tat-1136540","romanian":"O poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965189"},{"id":"tat-1153874","romanian":"Ar trebui să facem tot ce putem.","english":"We should do our best.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099422"},{"id":"tat-1143121","romanian":"Au ajuns în staţie la doar câteva minute distanță.","english":"They got to the station only a few minutes apart.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068791"},{"id":"tat-708939","romanian":"Preţurile vor fi din ce în ce mai mari.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398956"},{"id":"tat-1192698","romanian":"E fizician.","english":"He is a physicist.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/847246"},{"id":"tat-1136644","romanian":"Ieri și-a cumpărat Mary fusta.","english":"It was yesterday that Mary bought this skirt.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227743"},{"id":"tat-1120208","romanian":"Sunt din Brazilia.","english":"I am from Brazil.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11850582"},{"id":"tat-1059485","romanian":"Aici s-a întâmplat accidentul.","english":"This is where the accident happened.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10299812"},{"id":"tat-698948","romanian":"Unde locuiești?","english":"Where do you live?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-610910","romanian":"Îmi dai brânza cremă te rog?","english":"Would you pass me the cream cheese, please?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/752477"},{"id":"tat-706032","romanian":"Preţurile sunt mari.","english":"Prices are high.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969720"},{"id":"tat-862913","romanian":"Aeroportul a fost închis din cauza ceţei.","english":"The airport was closed because of the fog.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10008928"},{"id":"tat-1136892","romanian":"Studiază pentru test.","english":"They are studying for the test.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966024"}],"stories":[{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-mo-nichifor-co-cariul-2","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":224,"excerpt":"Două iepe, albe ca zăpada şi iuţi ca focul, se sprijineau mai totdeauna de oiştea căruţei; mai totdeauna, dar nu totdeauna, căci moş Nichifor era şi geambaş de cai, şi când îi venea la socoteală, făcea schimb, ori vindea câte-o iapă chiar în mijlocul drumului, şi atunci rămânea oiştea goală pe de-o parte."},{"id":"story-ro-popa-duhu-3","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Vorba ceea: \"Geasta cu trepădatele, că nu-s departe satele\". Aci era la Socola, aci în Iaşi, aci la monăstirea şi în Târgul-Neamţului profesor, de unde cutriera munţii în sudoarea frunţii, şi mai la tot pasul cânta: Ruinata cetăţuie, ce acopere-acel munte, Şi de unde ochiul vede lucruri multe!"}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1119745","romanian":"Vorbiți spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342518"},{"id":"tat-1279014","romanian":"Toţi au fost amabili cu fata cea nouă.","english":"Everybody was kind to the new girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13353831"},{"id":"tat-448260","romanian":"Ai grijă de tine.","english":"Take care.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4256296"},{"id":"tat-487280","romanian":"Am ratat ceva?","english":"Did I miss anything?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270414"},{"id":"tat-506869","romanian":"La mulți ani!","english":"Happy birthday!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528582"},{"id":"tat-1136647","romanian":"A preluat afacerea după decesul tatălui său.","english":"He took over the business after his father died.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966174"},{"id":"tat-1192802","romanian":"Niciunul dintre copacii bătrâni nu a supraviețuit focului.","english":"None of the old trees survived the fire.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353825"},{"id":"tat-411934","romanian":"Am văzut-o pe Andreea plecând de acasă.","english":"I saw Andrea leaving home.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272215"},{"id":"tat-1144331","romanian":"Când încep?","english":"When do I get started?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073634"},{"id":"tat-487305","romanian":"Pisica este adorabilă.","english":"The cat is adorable.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270702"},{"id":"tat-712094","romanian":"E cel mai bun jucător din echipa noastră.","english":"He is the best player on our team.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440082"},{"id":"tat-1137013","romanian":"Și el învață chineza.","english":"He studies Chinese as well.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952884"},{"id":"tat-1149073","romanian":"Migdalul face migdale.","english":"Almonds grow on almond trees.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106102"},{"id":"tat-1200897","romanian":"Am venit, am văzut, am cucerit.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11216029"},{"id":"tat-1136823","romanian":"Puteam să alerg mult mai rapid când eram tânăr.","english":"I could run much faster when I was young.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966296"},{"id":"tat-698974","romanian":"Cartea este albă.","english":"The book is white.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3943121"},{"id":"tat-702061","romanian":"El a ţinut un jurnal în timpul călătoriei.","english":"He kept a diary during the trip.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398898"},{"id":"tat-1136525","romanian":"Fă-ți temele acum!","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965332"},{"id":"tat-1143183","romanian":"A fost obligată să renunțe la plan.","english":"She was obliged to give up the plan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069259"},{"id":"tat-1136509","romanian":"Sunt de acord să merg cu el.","english":"I agree to go with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965688"}],"stories":[{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-broasca-estoas-cea-fermecat","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"A fost odată un împărat, şi el avea trei feciori. Când le-a venit şi lor vremea de însurătoare, le-a zis împăratul: Poveşti de Petre Ispirescu - Broasca ţestoasă cea fermecată – Dragii mei copii, v-aţi făcut mari; mergeţi de vă căutaţi ursitele, ca să intraţi şi voi în rândul oamenilor."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-2","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Ea priimi mărul cu bucurie. Şi după ce plecă bărbatul în trebile sale, se aşeză pe pragul uşei, curăţi mărul şi-l mâncă. Iepşoara ieşise şi ea din grajd, şi veni la stăpână-sa, că era învăţată la traista cu grăunţe."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1168718","romanian":"Bei cafea?","english":"Do you drink coffee?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/693134"},{"id":"tat-610807","romanian":"Mă surprinzi mereu cu sosirile tale neașteptate.","english":"You always astonish me with your unexpected arrivals.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/615896"},{"id":"tat-1153821","romanian":"Învăț engleza pe cineva.","english":"I teach English to someone.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129727"},{"id":"tat-1192791","romanian":"Tom s-ar putea să mintă despre asta.","english":"Tom may possibly be lying about that.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350289"},{"id":"tat-948496","romanian":"Da, vă rog.","english":"Yes, please.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9690115"},{"id":"tat-1118254","romanian":"Noi nu avem zahăr.","english":"We have no sugar.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6657483"},{"id":"tat-1119727","romanian":"Vorbiți franceza?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235766"},{"id":"tat-1136995","romanian":"Sahara este un deșert vast.","english":"The Sahara is a vast desert.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952791"},{"id":"tat-1185158","romanian":"Trebuie să studiez.","english":"I need to study.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324156"},{"id":"tat-670645","romanian":"Cel mult patruzeci la sută dintre studenţi continuă universitatea.","english":"At most 40 percent of students go on to university.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/935777"},{"id":"tat-1153830","romanian":"Totul este în regulă.","english":"Everything is fine.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130018"},{"id":"tat-1136907","romanian":"Ai înţeles ce a zis?","english":"Did you understand what he said?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960213"},{"id":"tat-488761","romanian":"Autobuzele vor ajunge în stație după cinsprezece minute.","english":"The bus will arrive at the station in fifteen minutes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268740"},{"id":"tat-1064302","romanian":"Tom a întrebat-o pe Mary unde locuiește John.","english":"Tom asked Mary where John lived.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11051404"},{"id":"tat-708918","romanian":"Ei nu îi plac şerpii şi matematica.","english":"She does not like snakes and mathematics.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397937"},{"id":"tat-709043","romanian":"Am fost fascinat de frumuseţea ei.","english":"I was fascinated by her beauty.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420333"},{"id":"tat-1136977","romanian":"Maşina asta veche e tot timpul stricată.","english":"This old car is always broken.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952911"},{"id":"tat-1144325","romanian":"Un adevărat gentilom nu își trădează niciodată prietenii.","english":"A true gentleman never betrays his friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073607"},{"id":"tat-863658","romanian":"Urăsc aceste cuvinte.","english":"I hate these words.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9141319"},{"id":"tat-1185072","romanian":"O vei invita la petrecere?","english":"Are you going to invite her to the party?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321352"}],"stories":[{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-bunicul","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"Se scutură din salcâmi o ploaie de miresme. Poveşti de Barbu Ştefănescu Delavrancea - Bunicul Bunicul stă pe prispă. Se gândeşte. La ce se gândeşte? La nimic. Enumeră florile care cad. Se uită-n fundul grădinii. Se scarpină-n cap. Iar enumeră florile scuturate de adiere. Pletele lui albe şi creţe parcă sunt nişte ciorchini de flori albe; sprincenele, mustăţile, barba…"},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un om. El avea o fată şi un băiat. Şi rămânând văduv de muma copiilor, îl îndemnă ariciul să se însoare a doua oară. Neveste-sei îi sta aceşti copilaşi ca sarea în ochi. Nu era dimineaţă, nu era seară, nu era clipă lăsată de la Dumnezeu să nu-i amărască."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-446564","romanian":"Ești ocupat?","english":"Are you busy?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6269572"},{"id":"tat-1156696","romanian":"Sunt cetățean american.","english":"I am an American citizen.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11260892"},{"id":"tat-584410","romanian":"Ei sunt colegii mei.","english":"They are my classmates.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7794377"},{"id":"tat-487282","romanian":"Am accentuat ideea.","english":"I stressed the point.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270459"},{"id":"tat-408013","romanian":"Ce crezi că are de gând Dana?","english":"What do you think Dana has in mind?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532049"},{"id":"tat-1143570","romanian":"Îmi place să dorm.","english":"I like sleeping.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072646"},{"id":"tat-1143235","romanian":"De ce sunteți, băieți, așa de supărați?","english":"Why are you guys so angry?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068488"},{"id":"tat-1064195","romanian":"Cred că Tom și Mary sunt căsătoriți în secret.","english":"I think Tom and Mary are secretly married.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072663"},{"id":"tat-1185066","romanian":"Îți este interzis să intri în acest loc.","english":"You are banned from entering this place.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320722"},{"id":"tat-857387","romanian":"Tango-ul este o exprimare verticală a unei dorinţe orizontale.","english":"Tango is the vertical expression of a horizontal desire.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10023982"},{"id":"tat-1186834","romanian":"Prefer mersul pe bicicletă.","english":"I prefer biking.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7304101"},{"id":"tat-862403","romanian":"După aceea, nu am vorbit cu ei.","english":"Afterwards, I did not speak with them.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9460600"},{"id":"tat-411853","romanian":"În Franța ați lucrat la ambasadă sau la consulat?","english":"In France did you work at the embassy or in the consulate?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6262484"},{"id":"tat-1153807","romanian":"I-am văzut mașina făcând la dreapta.","english":"I saw his car make a turn to the right.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128946"},{"id":"tat-1064070","romanian":"Ce să fac ca să nu mai sughit?","english":"What should I do to stop hiccups?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068880"},{"id":"tat-944584","romanian":"M-am simţit rău.","english":"I felt bad.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/60061"},{"id":"tat-1156691","romanian":"Tragedia este distracția nobililor.","english":"Tragedy is the entertainment of the nobles.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10540794"},{"id":"tat-1119737","romanian":"Vorbiți turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265023"},{"id":"tat-1143210","romanian":"Tom pretindea că nu știe cine e Mary.","english":"Tom pretended not to know who Mary was.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070000"},{"id":"tat-902141","romanian":"Acesta e sfârșitul.","english":"This is the end.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287419"}],"stories":[{"id":"story-ro-soacra-cu-trei-nurori-3","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Acum deodată, până te-i mai odihni, ia furca în brâu, şi până mâine dimineaţă să găteşti fuioarele aceste de tors, penele de strujit şi mălaiul de pisat. Eu mă las puţin, că mi-a trecut ciolan peste ciolan cu nunta voastră."},{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-sarea-n-bucate-2","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Împăratul se bucură cât un lucru mare când auzi de la fetele lui cele mai mari cât îl iubesc. El socoti că altfel de iubire nu poate să fie decât cea dulce ca mierea şi ca zahărul."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-488786","romanian":"Cât este ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528939"},{"id":"tat-1136663","romanian":"Casa a luat foc.","english":"The house caught fire.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966118"},{"id":"tat-583959","romanian":"Nici în ruptul capului!","english":"Not for all the tea in China!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799491"},{"id":"tat-1136813","romanian":"Tata și-a ajustat întotdeauna costumele la croitor.","english":"Father always has the tailor make his suits.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966356"},{"id":"tat-1185124","romanian":"Te-ai simțit bine la cină?","english":"Did you have a good time at the dinner?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323857"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-1136946","romanian":"Sora mea a insistat să meargă cu mine.","english":"My sister insisted on going with me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957798"},{"id":"tat-1153754","romanian":"N-am întârziat niciodată la școală mai înainte.","english":"I had never been late for school before.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2639577"},{"id":"tat-1064285","romanian":"Ce preferi, vin alb sau vin roșu?","english":"Which do you prefer, white wine or red wine?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11061322"},{"id":"tat-1136624","romanian":"Fetița a izbucnit în lacrimi.","english":"The young girl burst into tears.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966101"},{"id":"tat-1136744","romanian":"Sună-mă cândva.","english":"Call me sometime.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966175"},{"id":"tat-1136802","romanian":"Îmi place să cânt.","english":"I like singing.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966355"},{"id":"tat-698967","romanian":"Ea este Li Ying.","english":"She is Li Ying.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3384009"},{"id":"tat-705790","romanian":"Domnul Suzuki nu este dentist, ci medic.","english":"Mr Suzuki is not a dentist but a physician.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963131"},{"id":"tat-709045","romanian":"M-am întâlnit cu ea seara târziu.","english":"I met her late in the evening.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420335"},{"id":"tat-1143158","romanian":"Rapida vulpe maronie nu a sărit peste câinele leneș.","english":"The quick brown fox did not jump over the lazy dog.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069001"},{"id":"tat-399607","romanian":"Poftă bună!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-1181806","romanian":"Vreau o chitară.","english":"I want a guitar.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12297767"},{"id":"tat-1143131","romanian":"Fă altora ceea ce vrei să îți facă ţie.","english":"Do to others as you would have them do to you.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068861"},{"id":"tat-487312","romanian":"Eram în căutarea unei locuințe de închiriat.","english":"I was on the hunt for lodgings.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7006421"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-2","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Încă fiind acolo, văzu cum înfloreşte pomul, cum îi cade florile şi cum roadele se arată iarăşi. Atunci îi mai veni inima la loc şi se mulţumi a aştepta până a doua zi. în ziua următoare, ia merele de unde nu e. S-a supărat împăratul, nevoie mare, şi porunci ca paznici să se uite să prinză pe hoţi. Dară aşi!"},{"id":"story-ro-z-na-mun-ilor-3","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Cum se duse turturica, simţi, nu ştiu cum, nu ştiu de ce, că îi tâcâia inima. După ce se întoarse acasă, era tot cm galeş. Împăratul văzând că tânjeşte fiu-său cu sănătatea, îl întrebă ce are, iară el răspunse că n-are nimic. Turturica aceea era Zâna Munţilor care se îndrăgostise de frumuseţea lui."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
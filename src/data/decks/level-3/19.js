@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-487297","romanian":"Eu știu numele său.","english":"I know his name.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270657"},{"id":"tat-708929","romanian":"Juan se îmbracă.","english":"Juan is getting dressed.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398353"},{"id":"tat-1143615","romanian":"Îmi place rockul.","english":"I love rock.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071631"},{"id":"tat-705812","romanian":"Mă doare braţul rău.","english":"My arm is hurting badly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963890"},{"id":"tat-1185145","romanian":"Concertul va avea loc vara viitoare.","english":"The concert will take place next summer.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324001"},{"id":"tat-698941","romanian":"Cum se numește acest râu?","english":"What is the name of this river?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2265424"},{"id":"tat-1119746","romanian":"Vorbești spaniola?","english":"Do you speak Spanish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7167492"},{"id":"tat-1143140","romanian":"A depus banii din premiu la bancă.","english":"He deposited the prize money in the bank.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068919"},{"id":"tat-1143566","romanian":"Îmi place mult viața de la oraș.","english":"I really like city life.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072636"},{"id":"tat-1136815","romanian":"O serie de accidente rutiere au avut loc recent.","english":"A number of traffic accidents have happened recently.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966350"},{"id":"tat-705788","romanian":"Urmăreşti dezbaterile parlamentare?","english":"Did you listen to the parliamentary debate?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963116"},{"id":"tat-1136590","romanian":"Prăbușindu-se pe jos, a izbucnit în lacrimi.","english":"On falling down, she burst into tears.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965952"},{"id":"tat-583839","romanian":"Tom s-a căsătorit cu o femeie mai în vârsta.","english":"Tom married an older woman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2255151"},{"id":"tat-1279321","romanian":"A doua oglindă este agăţată lângă uşă.","english":"A second mirror is hanging next to the door.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13495625"},{"id":"tat-1186844","romanian":"Metodele sale nu sunt ştiinţifice.","english":"His methods are not scientific.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338130"},{"id":"tat-1031106","romanian":"Îmi place limba occitană.","english":"I like the Occitan language.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10793086"},{"id":"tat-1119728","romanian":"Vorbești franceză?","english":"Do you speak French?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7421603"},{"id":"tat-1147397","romanian":"Vorbesc fluent portugheza.","english":"I speak Portuguese fluently.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12092941"},{"id":"tat-1136692","romanian":"Muncește din greu pentru a-și atinge scopul.","english":"He works hard to achieve his goal.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239729"},{"id":"tat-1136758","romanian":"N-am văzut nici măcar un meci.","english":"We did not see a single game.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966190"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-ro-ileana-simziana-2","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Dacă văzură şi văzură că nimic nu-i este pe plac, fata cea mare îşi luă inima în dinţi şi-l întrebă într-o zi la masă, că de ce este supărat: – Au purtarea noastră nu-ţi place? îi zise ea. Au supuşii măriei tale sunt răi şi arţăgoşi de-ţi pricinuiesc atâta mâhnire?"},{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-407954","romanian":"Mașina mea e Ford, ca și a dumneavoastră.","english":"My car is a Ford, just like yours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525379"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-1192751","romanian":"Puteți scădea prețul dacă voi cumpăra două?","english":"Could you knock down the price if I buy two?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1429026"},{"id":"tat-408060","romanian":"I-am dat cărțile studentului acestuia.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232758"},{"id":"tat-1201354","romanian":"Iată autobuzul!","english":"Here comes the bus!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4907596"},{"id":"tat-1185107","romanian":"Și-a îmbrățișat călduros fiul.","english":"He embraced his son warmly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195145"},{"id":"tat-1136578","romanian":"Nu tradu această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966035"},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-1185178","romanian":"Mă durea inima pentru păsările aflate pe moarte.","english":"My heart ached for the dying birds.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324325"},{"id":"tat-712096","romanian":"Radioul este stricat.","english":"The radio is broken.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8438352"},{"id":"tat-399611","romanian":"Bună seara.","english":"Good evening.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-1064121","romanian":"Tom a fost la plajă săptămâna trecută.","english":"Tom went to the beach last week.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070852"},{"id":"tat-1153837","romanian":"Amestecă bucuriile uneori cu cea mai serioasă ocupație.","english":"Mingle your joys sometimes with your earnest occupation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130097"},{"id":"tat-923805","romanian":"Toată lumea caută fericirea.","english":"Everybody seeks happiness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10421099"},{"id":"tat-699676","romanian":"Te iubesc.","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323350"},{"id":"tat-699623","romanian":"Am văzut câinele.","english":"I saw the dog.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320070"},{"id":"tat-1153169","romanian":"Mă plimbam pe bulevard.","english":"I was strolling down the avenue.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1778405"},{"id":"tat-1136919","romanian":"Mike a acționat în calitate de președinte al reuniunii.","english":"Mike acted as chairperson of the meeting.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957760"},{"id":"tat-1151742","romanian":"La mulți ani de ziua mondială a protecției animalelor!","english":"Happy World Animal Protection Day!","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118279"},{"id":"tat-708940","romanian":"Preţurile vor creşte din ce în ce mai mult.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419499"}],"stories":[{"id":"story-ro-cinci-p-ini-3","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Mai dreaptă împărţeală decât aceasta nu cred că se mai poate nici la Dumnezeu sfântul… – Ba nu, prietene, zice cel cu două pâni. Eu nu mă ţin că mi-ai făcut parte dreaptă. Haide să ne judecăm, şi cum a zice judecata, aşa să rămâie. – Haide şi la judecată, zise celălalt, dacă nu te mulţămeşti."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-2","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":232,"excerpt":"Se miră şi femeia lui, căci nici ea nu mai văzuse un astfel de ou. Nu ştiau cum să umble mai binişor cu dânsul, ca să nu-l scape jos să se spargă. Unul zicea ca să-l coacă în spuză şi să mănânce toţi dintr-însul; altul zicea ca să-l fiarbă; altul zicea ca să-l păstreze."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1144317","romanian":"Are pian?","english":"Does she have a piano?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073560"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-986454","romanian":"Pisica este cafenie.","english":"The cat is brown.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637038"},{"id":"tat-1090185","romanian":"E fratele meu.","english":"He is my brother.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1996614"},{"id":"tat-487322","romanian":"Femeia mănâncă o portocală.","english":"The woman eats an orange.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336244"},{"id":"tat-1119732","romanian":"Scuză-mă, vorbești engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144127"},{"id":"tat-1143234","romanian":"Tom a cerut un apel de deșteptare.","english":"Tom asked for a wake-up call.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068482"},{"id":"tat-706078","romanian":"Care echipă a câştigat meciul?","english":"Which team won the game?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970911"},{"id":"tat-923855","romanian":"M-am căsătorit cu o poloneză.","english":"I am married to a Polish woman.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442834"},{"id":"tat-1078362","romanian":"Salut, lume!","english":"Hello, world!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9938591"},{"id":"tat-670678","romanian":"Poţi s-o alegi pe care o vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200736"},{"id":"tat-1279158","romanian":"Ceasul meu înaintează cu cinci secunde pe zi.","english":"My clock is running 5 seconds faster every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13123222"},{"id":"tat-699632","romanian":"Îţi place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320252"},{"id":"tat-1153773","romanian":"Am lucrat pe un contract anual.","english":"I worked on a yearly contract.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128476"},{"id":"tat-1143285","romanian":"Am crezut că va veni curând.","english":"I thought he would come soon.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068675"},{"id":"tat-1143147","romanian":"Cât costă o cameră?","english":"How much is a room?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068934"},{"id":"tat-1136918","romanian":"- A scris ieri o scrisoare? - Da.","english":"Did he write a letter yesterday? \"Yes, he did.\"","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960508"},{"id":"tat-1136651","romanian":"Această propoziție este la prezentul perfect sau trecutul simplu?","english":"Is this sentence in the present perfect or simple past?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239828"},{"id":"tat-705816","romanian":"Mary s-a ataşat foarte tare de fetiţa aceea.","english":"Mary is very attached to the little girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963910"},{"id":"tat-1064248","romanian":"Tom nu se sperie aproape niciodată.","english":"Tom almost never gets scared.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073108"}],"stories":[{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-864492","romanian":"Când am sunat, el deja plecase.","english":"When I called, he had already set off.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6872543"},{"id":"tat-1143180","romanian":"Cine ești tu ca să vorbești așa cu mine?","english":"Who are you to talk to me like that?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069234"},{"id":"tat-488770","romanian":"Guus Hiddink este olandez.","english":"Guus Hiddink is Dutch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528884"},{"id":"tat-1143221","romanian":"Cred că au fost căsătoriți timp de cinci ani.","english":"I think they have been married for five years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049596"},{"id":"tat-446714","romanian":"Mi-a dat niște cărți.","english":"He gave me some books.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6823779"},{"id":"tat-1143576","romanian":"Îmi place jazzul.","english":"I like jazz music.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7736870"},{"id":"tat-1136924","romanian":"Înțelege fizica.","english":"He understands physics.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957733"},{"id":"tat-1136579","romanian":"Nu traduceți această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965936"},{"id":"tat-1153891","romanian":"Felicitările mele mâinilor care au făcut asta posibilă.","english":"My compliments to the hands that made this possible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104030"},{"id":"tat-670649","romanian":"Când aduni trei cu patru, obţii şapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974575"},{"id":"tat-584006","romanian":"Ce gătiți?","english":"What are you cooking?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3168038"},{"id":"tat-405844","romanian":"L-am văzut pe Ion la bibliotecă.","english":"I saw John at the library.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350592"},{"id":"tat-1186831","romanian":"Mi-e teamă de ce va spune profesorul.","english":"I am afraid of what the teacher will say.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7295047"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-1143144","romanian":"E un lac în fața casei mele.","english":"There is a lake in front of my house.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068930"},{"id":"tat-1136844","romanian":"Voi urma planul tău.","english":"I will go along with your plan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966268"},{"id":"tat-1136532","romanian":"Profesorul ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960883"},{"id":"tat-1136789","romanian":"Fata s-a antrenat la paralele.","english":"The girl exercised on the parallel bars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966214"},{"id":"tat-1136533","romanian":"Profesoara ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965168"},{"id":"tat-1151778","romanian":"Azi e miercuri. Citesc.","english":"Today is Wednesday. I am reading.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119179"}],"stories":[{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-2","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Trase undiţa: când, ce să vezi? un peşte mare, cu totul şi cu totul din aur. Doară că nu-i căzu leşin de bucurie. Darămite când îl văzu împărăteasa? Ea fu şi mai oleoleo. Găti împărăteasa singură cu mâna ei peştele şi mâncară. Ea îndată se simţi însărcinată."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-sarea-n-bucate","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"A fost odată un împărat. Acest împărat avea trei fete. Rămânând văduv, toată dragostea lui el şi-o aruncase asupra fetelor."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136810","romanian":"Programul nu permite modificări în acest moment.","english":"The program does not allow for changes at this point in time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966290"},{"id":"tat-448202","romanian":"Lasă-mă.","english":"Go away.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3840680"},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-487295","romanian":"Străzile noastre se inundă când plouă.","english":"Our streets flood when we have rain.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270651"},{"id":"tat-1089714","romanian":"Ea are mulți bani.","english":"She has a lot of money.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11257804"},{"id":"tat-399598","romanian":"Vorbești italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314459"},{"id":"tat-1064186","romanian":"Tom a cumpărat o casă cu șase camere.","english":"Tom bought a house with six rooms.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066256"},{"id":"tat-1192712","romanian":"Bărbatul o împinse deoparte.","english":"The man shoved her aside.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2811437"},{"id":"tat-1143230","romanian":"Mă doare brațul unde m-ai lovit.","english":"I have a very sore arm where you hit me.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068473"},{"id":"tat-1059635","romanian":"Răspunsul tău este greșit.","english":"Your reply is wrong.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7874588"},{"id":"tat-1064317","romanian":"Mary este foarte drăguță.","english":"Mary is very pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045042"},{"id":"tat-1136513","romanian":"Încetează să te mai duci acolo.","english":"Stop going there.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965707"},{"id":"tat-1059636","romanian":"Ieri am stat într-o întâlnire.","english":"Yesterday I was in a meeting.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9557120"},{"id":"tat-1059676","romanian":"Aș vrea niște pește.","english":"I would like some fish.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963768"},{"id":"tat-1143149","romanian":"De la ce aeroport plec?","english":"Which airport do I leave from?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068959"},{"id":"tat-1147577","romanian":"Am scris o adresă greșită pe plic.","english":"I wrote a wrong address on the envelope.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095173"},{"id":"tat-670577","romanian":"Vederea slabă este un handicap pentru un atlet.","english":"Poor sight is a handicap to an athlete.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2423585"},{"id":"tat-1153157","romanian":"O asemenea abilitate este nativă pentru el.","english":"Such ability is native to him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749170"},{"id":"tat-1163893","romanian":"Un An Nou fericit!","english":"Happy New Year!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196792"},{"id":"tat-1136915","romanian":"De fapt, știe foarte puține despre această chestiune.","english":"As a matter of fact, he knows very little of the matter.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959366"}],"stories":[{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-praslea","title":"Praslea cel voinic","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":175,"excerpt":"Intr-o imparatie de demult traia un imparat care avea trei fii: doi mari si unul mic, pe care-l chema Praslea. Fratii cei mari erau mandri si rasfatati, dar Praslea era harnic si cuminte. Imparatul avea o gradina cu meri de aur, dar in fiecare noapte venea cineva si fura merele. Nimeni nu stia cine este hotul."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
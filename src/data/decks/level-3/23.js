@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-708953","romanian":"Nimănui nu-i pasă de ceea ce crezi.","english":"Nobody cares what you think.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8418403"},{"id":"tat-1059638","romanian":"Furtuna ne-a împiedicat să ajungem la timp.","english":"The storm prevented us from arriving on time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/918359"},{"id":"tat-864488","romanian":"Ea știa să citească când avea patru ani.","english":"She could read when she was four.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855675"},{"id":"tat-1119722","romanian":"El și-a găsit părinții.","english":"He found his parents.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511953"},{"id":"tat-1111140","romanian":"Lasă-mă în pace!","english":"Leave me alone!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11790536"},{"id":"tat-864511","romanian":"Credința este moartea inteligenței.","english":"Belief is the death of intelligence.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6984822"},{"id":"tat-406055","romanian":"Când o întâlnisem în București, Anca era studentă.","english":"When I had met her in Bucharest, Anca was a student.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347370"},{"id":"tat-1059504","romanian":"I se zice Jim.","english":"They call him Jim.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8001955"},{"id":"tat-399597","romanian":"Vorbiți italiană?","english":"Do you speak Italian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6314367"},{"id":"tat-1119730","romanian":"Vorbești araba?","english":"Do you speak Arabic?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340381"},{"id":"tat-1056757","romanian":"Spre deosebire de fratele ei, Sienna este foarte introvertită.","english":"Unlike her brother, Sienna is very introverted.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031405"},{"id":"tat-863673","romanian":"Cât la sută dintre persoane vorbesc trei limbi străine?","english":"What percentage of the people speak three languages?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9105795"},{"id":"tat-1143652","romanian":"Aceasta este gratuită.","english":"This is free.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071965"},{"id":"tat-1195264","romanian":"Vreau să citiți această carte.","english":"I want you to read this book.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7228754"},{"id":"tat-586093","romanian":"Dorința e pentru cei care cred în îndeplinirea ei.","english":"Wishing is for those who can believe.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7758342"},{"id":"tat-1192833","romanian":"A picotit întreaga zi.","english":"He slumbered out the whole day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360778"},{"id":"tat-702225","romanian":"Se va despărţi de prietenul ei.","english":"She is going to part from her boyfriend.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398964"},{"id":"tat-1185117","romanian":"Am o părere bună despre tânărul candidat.","english":"I have a good opinion of the young candidate.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323560"},{"id":"tat-1153775","romanian":"La ce oră se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1142891","romanian":"Cât e ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065971"}],"stories":[{"id":"story-ro-coto-man-n-zdr-vanu-3","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Nu mult după aceasta, femeia se simţi îngreunată. Atunci să fi văzut bucurie pe casnici, încât nu-i ţinea pământul. Iară când fu la facere, născu un copilaş gras şi frumos şi sănătos. Crescu copilul şi se făcu mare. Nu se despărţea de pisoi nici cât ai da în cremene. Amândoi se jucau, amândoi mâncau la masă, amândoi se culcau."},{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-2","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"– Să ne despărţim unchiaş, dacă tu aşa găseşti de cuviinţă. Dară bine, cine să ne închiză ochii în ceasul cel de pe urmă? – Că bine zici tu, babo; stăi dară; ia să iei tu basmaua mea care am avut-o în ziua de cununie şi eu ştergarul cel vărgăţel ce mi-ai adus de zestre."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-928488","romanian":"Desenele lui Lyod reprezintă persoane din secolul al paisprezecelea.","english":"The drawings Lyod has made show people from the 14th century.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5107153"},{"id":"tat-1136890","romanian":"Ei sunt un poet și un om de stat.","english":"They are a poet and a statesman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957806"},{"id":"tat-670618","romanian":"Pe ce linie pentru Boston?","english":"What track for Boston?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1346020"},{"id":"tat-708987","romanian":"Lasă-mă să tai morcovii.","english":"Let me cut the carrots.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420387"},{"id":"tat-1133944","romanian":"Cafeaua este amară.","english":"The coffee is bitter.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7074654"},{"id":"tat-1153162","romanian":"Vrednicia ei este un bun exemplu pentru noi toți.","english":"Her diligence is a good example to us all.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1754261"},{"id":"tat-407963","romanian":"Care este mai completă, prima ediție sau a doua?","english":"Which is more complete, the first edition or the second?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531998"},{"id":"tat-1192832","romanian":"Era consumată de ambiție.","english":"She was consumed with ambition.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360676"},{"id":"tat-1136661","romanian":"Ne confruntăm cu o alegere dificilă.","english":"We are faced with a difficult choice.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239777"},{"id":"tat-1192772","romanian":"Ce doriți: ceai sau cafea?","english":"Which do you want, tea or coffee?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364282"},{"id":"tat-1144673","romanian":"Scuzați-mă, vorbiți engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12075958"},{"id":"tat-1136526","romanian":"Acum fă-ți temele.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965105"},{"id":"tat-709001","romanian":"Când călătoreşti, este uşor să te rătăceşti.","english":"When traveling, it is easy to get lost.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420261"},{"id":"tat-1120212","romanian":"Sunt din Egipt.","english":"I am from Egypt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11851441"},{"id":"tat-1136795","romanian":"Găina a depus un ou în această dimineață.","english":"The chicken laid an egg this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966349"},{"id":"tat-1119751","romanian":"Vorbești suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7172318"},{"id":"tat-1064272","romanian":"Tatăl ei a murit când ea avea trei ani.","english":"Her father died when she was three.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066162"},{"id":"tat-1185070","romanian":"Mi-e teamă că am luat o răceală.","english":"I worry that I have caught a cold.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321256"},{"id":"tat-1136840","romanian":"Tom consideră că Mary e o eroină.","english":"Tom considers Mary to be a heroine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966335"},{"id":"tat-1119738","romanian":"Vorbești turca?","english":"Do you speak Turkish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6355405"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."},{"id":"story-ro-fata-babei-i-fata-mo-neagului","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":251,"excerpt":"Erau odată un moşneag şi-o babă; şi moşneagul avea o fată, şi baba iar o fată. Fata babei era slută, leneşă, ţâfnoasă şi rea la inimă; dar, pentru că era fata mamei, se alinta cum s-alintă cioara-n laţ, lăsând tot greul pe fata moşneagului. Fata moşneagului însă era frumoasă, harnică, ascultătoare şi bună la inimă."},{"id":"story-ro-f-t-frumos-cel-r-t-cit","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"A fost odată o păreche de oameni, muncitori, de! cum dă Dumnezeu. Toată nădejdea lor era într-o iapă cu care se hrăneau. Şi ar fi voit şi ei să aibă un copilaş, dar fu peste poate. Cercetară în dreapta şi în stânga, ca să afle niscaiva leacuri care să le desfacă făcutul stărpiciunei lor, dară, aşi!"}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1186846","romanian":"Ori Tom, ori eu trebuie să plec.","english":"Either Tom or I must go.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338151"},{"id":"tat-1136596","romanian":"Mă asigur că judec un om după personalitatea sa.","english":"I make a point of judging a man by his personality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965974"},{"id":"tat-1143190","romanian":"Fața ei este concentrată.","english":"Her face is in focus.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069295"},{"id":"tat-599093","romanian":"Știi cine e blonda înaltă îmbrăcata în verde?","english":"Does anybody know who the tall, blond girl dressed in green is?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1448294"},{"id":"tat-1192704","romanian":"E nevoie să fie reparat.","english":"It needs to be repaired.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1116325"},{"id":"tat-1143146","romanian":"Fără sfatul meu, ai fi eșuat.","english":"But for my advice, you would have failed.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068933"},{"id":"tat-902146","romanian":"Ești o fată drăguță.","english":"You are a pretty girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287426"},{"id":"tat-1185071","romanian":"Tinde să fie arogant.","english":"He tends to be arrogant.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321261"},{"id":"tat-1185252","romanian":"Taro, du-te și spală-te pe dinți.","english":"Taro, go and brush your teeth.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328036"},{"id":"tat-399622","romanian":"Bună seara, ce faci?","english":"Good evening, how are you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6360852"},{"id":"tat-1064310","romanian":"L-am văzut pe Tom lovind-o pe Mary.","english":"I saw Tom hit Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045325"},{"id":"tat-925687","romanian":"Ce veste proastă!","english":"What bad news!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527133"},{"id":"tat-1119752","romanian":"Vorbiți letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264777"},{"id":"tat-1056778","romanian":"Muzica este o parte importantă din viața mea.","english":"Music is an important part of my life.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031363"},{"id":"tat-706081","romanian":"Când ar trebui să aduc maşina înapoi?","english":"When should I return the car?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970925"},{"id":"tat-1136800","romanian":"N-am fost niciodată într-o închisoare.","english":"I have never been inside a jail.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966338"},{"id":"tat-712088","romanian":"Tom s-a ascuns sub masă.","english":"Tom hid under the table.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440023"},{"id":"tat-1136702","romanian":"Comparată cu a ta, mașina mea este mică.","english":"Compared with yours, my car is small.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239624"},{"id":"tat-1136913","romanian":"E clar?","english":"Is that clear?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966183"},{"id":"tat-702068","romanian":"Îmi place să călătoresc.","english":"I like traveling.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"}],"stories":[{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat şi o împărăteasă. Ei aveau trei copii. Mai aveau pe lângă palaturile lor o grădină foarte frumoasă. Şi atât de drag îi era florile acestui împărat, încât însuşi cu multă tragere de inimă le plivea şi îngrijăa de grădină. În fundul acestei grădini crescuse un măr cu totul şi cu totul de aur."},{"id":"story-ro-mo-nichifor-co-cariul","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Moş Nichifor nu-i o închipuire din poveşti, ci e un om ca toţi oamenii; el a fost odată, când a fost, trăitor din mahalaua Ţuţuenii din Târgul Neamţului, dinspre satul Vânătorii Neamţului."},{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
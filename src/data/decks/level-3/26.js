@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-405826","romanian":"Zăpada a acoperit tot orașul peste noapte.","english":"The snow covered the whole city overnight.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350529"},{"id":"tat-1059689","romanian":"Nu îi e ușor să învețe engleza.","english":"English is not easy for him to learn.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029000"},{"id":"tat-1143233","romanian":"Ai vrea să mergi la o plimbare?","english":"Would you like to go for a walk?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068480"},{"id":"tat-1059705","romanian":"Nu e glumă.","english":"It is no joke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795790"},{"id":"tat-1119736","romanian":"Vorbești germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144104"},{"id":"tat-702210","romanian":"Este o fotografie recentă?","english":"Is it a recent picture?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398717"},{"id":"tat-1142931","romanian":"Am început cu doi tovarăși de călătorie.","english":"I started with two traveling companions.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066641"},{"id":"tat-487317","romanian":"Noi adesea dăm peste turiștii japonezi în această zonă.","english":"We often come across Japanese tourists in this area.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335455"},{"id":"tat-1151771","romanian":"Azi nu e ziua ta.","english":"Today is not your day.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118740"},{"id":"tat-1136572","romanian":"A trecut pe lângă mine fără să mă observe.","english":"He went by me without noticing me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965942"},{"id":"tat-699630","romanian":"Poţi rezolva această problemă?","english":"Can you solve this problem?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320215"},{"id":"tat-923800","romanian":"Prietenia noastră nu a durat.","english":"Our friendship did not last.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10419439"},{"id":"tat-1136543","romanian":"Avea șosetele pe dos.","english":"He had his socks on inside out.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965326"},{"id":"tat-1064244","romanian":"Tom a uitat să își ia medicația azi dimineață.","english":"Tom forgot to take his medication this morning.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073232"},{"id":"tat-487300","romanian":"Înțelepciunea nu vine în mod automat cu vârsta.","english":"Wisdom does not automatically come with age.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270672"},{"id":"tat-1151783","romanian":"Azi e sâmbătă.","english":"Today is Saturday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119193"},{"id":"tat-1136272","romanian":"Este nesociabil.","english":"He is unsociable.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963275"},{"id":"tat-582947","romanian":"Voiam să devin filozof.","english":"I wanted to become a philosopher.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6547233"},{"id":"tat-1143631","romanian":"Îmi place să mă uit la televizor.","english":"I like to watch TV.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071796"},{"id":"tat-1059702","romanian":"Dacă aduni trei cu patru, obții șapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758844"}],"stories":[{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."},{"id":"story-ro-ion-roat-i-cuza-vod-2","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Atâta-i ajungea capul, atâta făceau şi ei pe vremea lor, Dumnezeu să-i ierte şi să-i odihnească, unde-or fi acolo, că bună inimă mai aveau! Dar să ne întoarcem iar la Divanul ad-hoc."},{"id":"story-ro-mo-ion-roat-i-unirea","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":221,"excerpt":"La 1857, pe când se ferbea Unirea în Iaşi, boierii moldoveni liberali, ca de-alde Costache Hurmuzachi, M. Kogălniceanu şi alţii, au găsit cu cale să cheme la Adunare şi câţiva ţărani fruntaşi, câte unul din fiecare judeţ, spre a lua şi ei parte la facerea acestui măreţ şi nobil act naţional."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
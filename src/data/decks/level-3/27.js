@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136537","romanian":"L-am sondat cu privire la opiniile sale.","english":"I sounded him out about his views.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965088"},{"id":"tat-1059613","romanian":"Cele mai frumoase fete sunt din Lituania.","english":"The most beautiful girls are from Lithuania.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9569381"},{"id":"tat-1159796","romanian":"Paharul este plin cu apă.","english":"The glass is full of water.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167541"},{"id":"tat-1136593","romanian":"Am reușit să trec examenul.","english":"I was able to pass the exam.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966064"},{"id":"tat-406044","romanian":"Daniela mi-a telefonat acasă.","english":"Daniela called me at home.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350499"},{"id":"tat-1108729","romanian":"Sunt profesor.","english":"I am a teacher.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759056"},{"id":"tat-986499","romanian":"Puteți folosi dicționarul meu.","english":"You may use my dictionary.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637140"},{"id":"tat-1192747","romanian":"Te rog du-te la Departamentul de Chirurgie.","english":"Please go to the Surgery Department.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/289686"},{"id":"tat-706083","romanian":"Cui i-a păsat?","english":"Who cared?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970932"},{"id":"tat-487299","romanian":"Puțini studenți știu să citească în latină.","english":"Few students know how to read Latin.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270669"},{"id":"tat-1119735","romanian":"Vorbiți germana?","english":"Do you speak German?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7205590"},{"id":"tat-488782","romanian":"Lisa Lillien este măritată cu Dan Schneider.","english":"Lisa Lillien is married to Dan Schneider.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6352963"},{"id":"tat-1192846","romanian":"E un monarh absolut.","english":"He is an absolute monarch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361499"},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"},{"id":"tat-1136541","romanian":"Îl puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965468"},{"id":"tat-1201211","romanian":"Am venit, am văzut, am învins.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12432138"},{"id":"tat-705791","romanian":"Din curiozitate, am deschis cutia.","english":"I opened the box out of curiosity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963139"},{"id":"tat-862829","romanian":"Încă mai aștept să-mi spună ce s-a întîmplat.","english":"I am still waiting to be told what happened.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014507"},{"id":"tat-1136720","romanian":"I-a pus imaginea în palmă.","english":"She put the picture back in his hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7222279"},{"id":"tat-864947","romanian":"Trebuie să găsesc o ieşire din acestă problemă.","english":"I need to find a way out of this problem.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10113453"}],"stories":[{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."},{"id":"story-ro-ho-u-mp-rat","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat mare şi puternic. Abia la vremea cărunteţei dobândi şi el un copil. Bucuria lui fu nespusă când se văzu şi el tată, şi toată împărăţia lui fu veselă dinpreună cu dânsul, căci acest împărat era bun, drept şi temător de Dumnezeu. Pentru aceasta, el făcu mult bine poporului său."},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1059644","romanian":"A fost foarte prietenos cu toată lumea.","english":"He was very friendly to everybody.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795791"},{"id":"tat-1048538","romanian":"La început a făcut Dumnezeu cerul și pământul.","english":"In the beginning God created the heavens and the earth.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10934554"},{"id":"tat-1059609","romanian":"Unde ai învățat franceza?","english":"Where did you learn French?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7482507"},{"id":"tat-584798","romanian":"Mă dor picioarele.","english":"My feet hurt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813828"},{"id":"tat-706185","romanian":"Kumi este fata al cărei tată îi plac căinii.","english":"Kumi is the girl whose father likes dogs.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/976233"},{"id":"tat-670629","romanian":"A abandonat visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1626134"},{"id":"tat-712091","romanian":"De cât timp stă Ken în Kobe?","english":"How long has Ken lived in Kobe?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440065"},{"id":"tat-902137","romanian":"A început să ningă.","english":"It began to snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287411"},{"id":"tat-477022","romanian":"Mulțumesc mult!","english":"Thank you very much!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6245731"},{"id":"tat-406046","romanian":"Ți-aș oferi o cafea dacă ai timp.","english":"I would offer you a coffee if you had the time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6554810"},{"id":"tat-1059626","romanian":"Presupun că-ți place de ea.","english":"I suppose you like her.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9777847"},{"id":"tat-923926","romanian":"Ce fel de lucruri te întristează?","english":"What sort of things make you feel sad?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/805469"},{"id":"tat-1192724","romanian":"L-am făcut să vopsească poarta săptămâna trecută.","english":"I had him paint the gate last week.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221821"},{"id":"tat-1136858","romanian":"Era cât pe ce să explodeze, dar s-a stăpânit.","english":"He was about to explode, but checked himself.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966284"},{"id":"tat-487031","romanian":"Camera mea este foarte mică.","english":"My room is very small.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435954"},{"id":"tat-708965","romanian":"Căţărătorii se treziră înaintea zorilor.","english":"The climbers awoke before daybreak.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420408"},{"id":"tat-1143646","romanian":"Ken joacă tenis?","english":"Does Ken play tennis?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071930"},{"id":"tat-1151810","romanian":"Tom e musulman.","english":"Tom is a Muslim.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119099"},{"id":"tat-1119741","romanian":"Vorbiți klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6340242"},{"id":"tat-1192799","romanian":"Sunt foarte veseli.","english":"They are very cheerful.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351572"}],"stories":[{"id":"story-ro-porcul-cel-fermecat","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"A fost odată un împărat şi avea trei fete. Şi fiind a merge la bătălie, îşi chemă fetele şi le zise: Poveşti de Petre Ispirescu - Porcul cel fermecat – Iacă, dragele mele, sunt silit să merg la război. Vrăjmaşul s-a sculat cu oaste mare asupra noastră. Cu mare durere mă despart de voi."},{"id":"story-ro-bunica","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"O văz, ca prin vis. Poveşti de Barbu Ştefănescu Delavrancea - Bunica O văz limpede, aşa cum era. Naltă, uscăţivă, cu părul alb şi creţ, cu ochii căprui, cu gura strânsă şi cu buza de sus crestată în dinţi de pieptene, de la nas în jos. Cum deschidea poarta, îi săream înainte."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1192765","romanian":"Mulțumesc pentru instrucțiuni.","english":"Thank you for the lead.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357142"},{"id":"tat-709044","romanian":"De-abia plecasem de acasă când a început ploaia.","english":"I had scarcely left home when it began to rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420334"},{"id":"tat-1159828","romanian":"Casa lui e plină de lucruri utile.","english":"His house is full of convenience.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167796"},{"id":"tat-1059656","romanian":"Ce limbi se vorbesc în Belgia?","english":"What languages do they speak in Belgium?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029005"},{"id":"tat-1059646","romanian":"A fost ocupat.","english":"He has been busy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795785"},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"},{"id":"tat-1153804","romanian":"Vii la petrecere, da?","english":"Come to the party, will you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128886"},{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-1136673","romanian":"Care este țelul principal al acestei societăți?","english":"What is the chief aim of this society?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966138"},{"id":"tat-1143219","romanian":"Au fost într-o excursie în străinătate pentru prima oară.","english":"They went on a trip abroad for the first time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070011"},{"id":"tat-1064374","romanian":"Tom a cerut-o în căsătorie pe Mary.","english":"Tom asked Mary to marry him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074440"},{"id":"tat-1163913","romanian":"Poți alerga repede?","english":"Can you run fast?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197018"},{"id":"tat-584835","romanian":"Bineînțeles, el are dreptate.","english":"Of course, he is right.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812373"},{"id":"tat-1192804","romanian":"Ken nu a fost aici de astă dimineață.","english":"Ken has not been here since this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353836"},{"id":"tat-1185077","romanian":"Vei traduce asta în franceză?","english":"Will you translate this into French?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321419"},{"id":"tat-708921","romanian":"Leagă-ţi şireturile.","english":"Tie your shoelaces.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397940"},{"id":"tat-1136594","romanian":"Câinii latră.","english":"Dogs are barking.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966082"},{"id":"tat-1136910","romanian":"Articolul 6. Președintele va conduce toate reuniunile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11953737"},{"id":"tat-1192743","romanian":"Vecinii sunt OK cu muzica tare la această oră?","english":"Is loud music OK with the neighbors at this hour?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7512007"},{"id":"tat-1108692","romanian":"Ne vedem mâine!","english":"See you tomorrow.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11747448"}],"stories":[{"id":"story-ro-povestea-porcului-2","title":"Povestea porcului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"– Ştiu, măi babă, dacă mi-i spune."},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."},{"id":"story-ro-sult-nica-2","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"II E începutul lui decembrie. A dat Dumnezeu zăpadă nemiluită; şi cade, cade puzderie măruntă şi deasă, ca făina la cernut, vânturată de un crivăţ care te orbeşte. Muşcelele dorm sub zăpadă de trei palme. Pădurile, în depărtare, cu tulpini fumurii, par cercelate cu flori de zarzări şi de corcoduşi."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
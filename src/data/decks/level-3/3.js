@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136575","romanian":"Sosirea trupelor a condus la exacerbarea violențelor.","english":"The arrival of the troops led to more violence.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966041"},{"id":"tat-1059483","romanian":"A venit să ne roage să-l ajutăm.","english":"He came to ask us to help him.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10265378"},{"id":"tat-1151780","romanian":"Azi e joi.","english":"Today is Thursday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119184"},{"id":"tat-1136619","romanian":"Băiatul plângea în cameră.","english":"The boy was crying in the room.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227573"},{"id":"tat-1090181","romanian":"De ce vrei să cumperi această carte?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4412136"},{"id":"tat-1064365","romanian":"Tom și Mary sunt din același oraș.","english":"Tom and Mary are from the same city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074444"},{"id":"tat-1136948","romanian":"Am învățat multe din cărțile lui.","english":"I learned a lot from his books.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956892"},{"id":"tat-698946","romanian":"Cât costă?","english":"How much is it?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-1136897","romanian":"Vecinul și-a ițit capul peste zid pentru o clipă.","english":"The neighbor popped his head up over the wall for a moment.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965962"},{"id":"tat-411957","romanian":"Îl văd pe Dan.","english":"I see Dan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272287"},{"id":"tat-1153820","romanian":"Stai acasă pentru a putea răspunde la telefon.","english":"Stay home so that you can answer the phone.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129301"},{"id":"tat-487034","romanian":"Eu mănânc tăiței.","english":"I am eating noodles.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435962"},{"id":"tat-1156687","romanian":"Acest ceas este stricat.","english":"This clock is broken.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10308903"},{"id":"tat-1144720","romanian":"Capitala Cehiei este Praga.","english":"The capital of Czechia is Prague.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076594"},{"id":"tat-1186837","romanian":"A plătit 20$ pentru ruj.","english":"He paid $20 for the lipstick.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7309933"},{"id":"tat-1130802","romanian":"Răspunde-mi.","english":"Answer me.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11926498"},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-698962","romanian":"Tu crezi că așa ceva este posibil?","english":"Do you think such a thing is possible?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3160552"},{"id":"tat-1144339","romanian":"Când a sosit autobuzul, s-a urcat în el.","english":"When the bus came, she got on.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073771"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-porcul-cel-fermecat-2","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Aşa făcură şi le mergea bine. Vicleanul pizmuia pacea fetelor şi-şi vârî coada. – Surioarele mele, zise fata cea mare, câtu-i ziulica de mare toarcem, coasem, citim. Sunt câteva zile de când ne aflăm singure, n-a mai rămas nici un colţ de grădină pe unde să nu ne fi plimbat."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-3","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Când luă ştergarul să se şteargă pe ochi, ce să vază? Trei picături de sânge pe dânsul. El îşi zise:\"Trebuie să mă întorc acasă, căci Dumnezeu ştie ce va fi păţit baba mea.\" Întinse unchiaşul la drum. Nu mai căuta nici de mâncare, nici de odihnă, şi se întoarse acasă cum plecase. – Ce ţi s-a întâmplat, babo?"}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1064182","romanian":"Te rog ia loc aici.","english":"Please sit here.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070976"},{"id":"tat-1153855","romanian":"A fost trimis la închisoare pentru furt.","english":"He was sent to jail for the robbery.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130115"},{"id":"tat-709036","romanian":"A ţintit pasărea.","english":"He aimed at the bird.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420325"},{"id":"tat-1064444","romanian":"Vreau ceva dulce.","english":"I want something sweet.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077411"},{"id":"tat-709913","romanian":"M-am împiedicat de o piatră scrântindu-mi glezna.","english":"I tripped on a stone, twisting my ankle.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426746"},{"id":"tat-1136614","romanian":"Mulțimea a protestat împotriva avortului.","english":"The throng protested against abortion.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966027"},{"id":"tat-699627","romanian":"Ieri am mâncat un măr.","english":"Yesterday, I ate an apple.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320082"},{"id":"tat-1136410","romanian":"Cheamă-mă dacă ai nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962814"},{"id":"tat-408004","romanian":"Pentru cine bat clopotele?","english":"For whom do the bells toll?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532040"},{"id":"tat-698970","romanian":"Viața este scurtă.","english":"Life is short.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3582733"},{"id":"tat-399610","romanian":"Bună dimineața.","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-1143286","romanian":"Ascult muzică.","english":"I listen to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068676"},{"id":"tat-1136388","romanian":"Este respectat de toată lumea.","english":"He is respected by everyone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962876"},{"id":"tat-1089733","romanian":"Unde este banca?","english":"Where is the bank?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11266826"},{"id":"tat-1144337","romanian":"A rupt logodna într-o criză de mânie.","english":"She broke off her engagement in a fit of anger.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073722"},{"id":"tat-698963","romanian":"Unde te duci?","english":"Where are you going to?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3220541"},{"id":"tat-488766","romanian":"Nu toate browserele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268767"},{"id":"tat-1064436","romanian":"El este de două ori mai mare decât ea.","english":"He is twice as old as she is.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077419"},{"id":"tat-411929","romanian":"Am dus hainele la curățat.","english":"I took my clothes to be cleaned.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272197"},{"id":"tat-1136816","romanian":"Trebuie doar să exersezi în fiecare zi.","english":"You have only to practice every day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966330"}],"stories":[{"id":"story-ro-aleodor-mp-rat-2","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Un lucru numai am să-ţi spui: Vezi tu muntele acela de colo, să nu te ducă păcatele să vânezi p-acolo, că este nevoie de cap. Acel munte este moşia lui Jumătate-de-om-călare-pe-jumătate-de-iepure-şchiop: şi cine calcă pe moşia lui, nu scapă nepedepsit. Acestea zicând, căscă gura de trei ori şi-şi dete sufletul."},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
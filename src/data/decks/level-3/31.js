@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1064097","romanian":"La momentul accidentului aproape toți călătorii din autobuz dormeau.","english":"At the time of the accident, almost all of the passengers on the bus were sleeping.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11071031"},{"id":"tat-1136569","romanian":"Prefer să locuiesc la țară decât la oraș.","english":"I prefer living in the country to living in the city.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9017538"},{"id":"tat-1136652","romanian":"Trăim într-o comunitate globală.","english":"We live in a global community.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966120"},{"id":"tat-1192719","romanian":"S-a conformat cerinței mele.","english":"She complied with my request.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6655519"},{"id":"tat-1108693","romanian":"Pe mâine!","english":"See you tomorrow!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11757270"},{"id":"tat-1136667","romanian":"Tom a avut ceva probleme la ajustarea setărilor.","english":"Tom had a little trouble adjusting the settings.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227163"},{"id":"tat-1192782","romanian":"Folosesc Twitter.","english":"I am using Twitter.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364295"},{"id":"tat-702062","romanian":"Călătoria lor a fost amânată din cauza ploii.","english":"Their trip was postponed because of the rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398899"},{"id":"tat-1163898","romanian":"Nu îi dau niciodată câinelui meu carne nepreparată.","english":"I never feed my dog raw meat.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196922"},{"id":"tat-448211","romanian":"Respectul este temelia vieții.","english":"Respect is the foundation of life.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3873916"},{"id":"tat-705817","romanian":"El a jucat un rol foarte important în afacere.","english":"He played an important part in the enterprise.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963911"},{"id":"tat-1089709","romanian":"Nu știam despre planul lui.","english":"I was ignorant of his plan.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11265216"},{"id":"tat-406017","romanian":"O ploaie rece a căzut peste oraș.","english":"A cold rain fell over the city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350400"},{"id":"tat-1120161","romanian":"Noi îl cunoaștem.","english":"We know him.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6649770"},{"id":"tat-1186852","romanian":"Diferențe subtile în ton diferențiază orginalul de copie.","english":"Subtle differences in tone discriminate the original from the copy.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338196"},{"id":"tat-1153153","romanian":"A explica chestiunea în detaliu.","english":"He explained the matter in detail.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1715495"},{"id":"tat-706000","romanian":"Ai avut un sfârşit de săptămână plăcut?","english":"Did you have a good weekend?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968646"},{"id":"tat-1064424","romanian":"L-am văzut fugind.","english":"I saw him run away.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076207"},{"id":"tat-1059615","romanian":"Ești roșu la față.","english":"Your face is red.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7883567"},{"id":"tat-1186847","romanian":"Recordul lui nu va fi niciodată întrecut.","english":"His record will never be broken.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338182"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-ro-popa-duhu","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"Cine-a întâlnit vrodată în calea sa un popă, îmbrăcat cu straie sărăcuţe, scurt la stat, smolit la faţă, cu capul pleş, mergând cu pas rar, încet şi gânditor, răspunzând îndesat \"sluga dumitale\" cui nu-l trecea cu vederea, căscând cu zgomot când nu-şi găsea omul cu care să stea de vorbă, făcând lungi popasuri prin aleiele ascunse ale grădinilor publice din Iaşi, câte cu o carte în mână, tresărind la cântecul păserelelor şi oprindu-se cu mirare lângă moşinoaiele de furnici, pe care le numea el \"republici înţelepte\", dezmerdând iarba şi florile câmpului, icoane ale vieţii omeneşti, pe care le uda câte c-o lacrimă fierbinte din ochii săi şi apoi, cuprins de foame şi obosit de osteneală şi gândire, îşi lua cătinel drumul spre gazdă, unde-l aştepta sărăcia cu masa întinsă."},{"id":"story-ro-scormon-3","title":"Scormon","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":205,"excerpt":"Îi părea c-a mai văzut adeseori acest câine, dar unde și cum nu-și aducea aminte. Deodată, fața ei se însenină. — Scormon! strigă ea cu bucurie, ca și când ar întâlni un vechi prieten."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-709935","romanian":"Sărăcia este o povară, dar nu o ruşine.","english":"Poverty is a pain, but no disgrace.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5915496"},{"id":"tat-670576","romanian":"Ce se va întâmpla cu ea?","english":"What will happen to her?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2299514"},{"id":"tat-584010","romanian":"Mi-am pierdut codul pin!","english":"I forgot my PIN number!","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7801864"},{"id":"tat-1136510","romanian":"Mă simt îndatorat moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964318"},{"id":"tat-1143186","romanian":"E ciudat că ar trebui să eșuezi.","english":"It is strange that you should fail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069265"},{"id":"tat-1144324","romanian":"I s-a făcut o injecție înainte de operație.","english":"He had an injection prior to the operation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073578"},{"id":"tat-15","romanian":"Pofta buna!","english":"Enjoy your meal!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323587"},{"id":"tat-712079","romanian":"Zăpada acoperea autobuzul.","english":"Snow covered the bus.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440783"},{"id":"tat-1133950","romanian":"M-am aşezat şi am deschis laptopul meu.","english":"I sat down and opened my notebook.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9939356"},{"id":"tat-1143133","romanian":"Întotdeauna sunt ajutat de tine.","english":"I am always helped by you.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068889"},{"id":"tat-1192738","romanian":"Compunerea ta nu este în întregime rea.","english":"Your composition is not altogether bad.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7509671"},{"id":"tat-1159843","romanian":"Îmi place foarte mult.","english":"I like it very much.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167977"},{"id":"tat-706060","romanian":"Tu ești prietenul meu.","english":"You are my friend.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970702"},{"id":"tat-405835","romanian":"Transmite-i, te rog, salutări doamnei Andreescu!","english":"Please say hello to Mrs. Andreescu!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350559"},{"id":"tat-1143841","romanian":"Își ține întotdeauna promisiunile.","english":"He always fulfills his promises.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070728"},{"id":"tat-1136408","romanian":"Chemați-mă dacă aveți nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962822"},{"id":"tat-1144343","romanian":"Piața respectivă s-a extins rapid.","english":"That market has been rapidly expanding.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073795"},{"id":"tat-1185135","romanian":"Acest sol e umed.","english":"This soil is moist.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323926"},{"id":"tat-1064211","romanian":"Despre ce voiai să vorbești cu mine?","english":"What did you want to talk to me about?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069328"},{"id":"tat-698969","romanian":"Stai puțin.","english":"Wait a minute.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3410256"}],"stories":[{"id":"story-ro-popa-duhu-2","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"Mare de inimă, iar de gură şi mai mare, părintele Duhu nu se învrednicise de o viaţă mai bună; dar se vede că nici poftea el una aşa, de vreme ce nu-şi astâmpăra gura cătră mai-marii săi măcar să-l fi picat cu lumânarea."},{"id":"story-ro-ion-roat-i-cuza-vod-3","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Numai atâta, că bătrânii voiau \"Unire\" cu tocmală, iar tinerii \"Unire\" fără socoteală, cum s-a şi făcut."},{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-411865","romanian":"Vara mă duc la piscină în fiecare zi.","english":"In the summer I go to the pool every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271951"},{"id":"tat-1064193","romanian":"Nu am absolut nimic de făcut.","english":"I have absolutely nothing to do.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066192"},{"id":"tat-1136691","romanian":"L-am văzut oprindu-se.","english":"I observed him stop.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221903"},{"id":"tat-19","romanian":"Cat costa?","english":"How much does it cost?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-448266","romanian":"Are părul scurt.","english":"She has short hair.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4306510"},{"id":"tat-1136514","romanian":"Încetați de a vă mai duce acolo.","english":"Stop going there.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/47857"},{"id":"tat-1136839","romanian":"Ce e dragostea?","english":"What is love?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532441"},{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-1144308","romanian":"Problema l-a făcut cunoscut.","english":"The matter made his name known.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073372"},{"id":"tat-1163902","romanian":"Mă asculți?","english":"Are you listening?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196976"},{"id":"tat-1137017","romanian":"Nu toate navigatoarele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952941"},{"id":"tat-1153810","romanian":"Grăbește-te!","english":"Hurry up.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129000"},{"id":"tat-488788","romanian":"Sumatra este o insulă.","english":"Sumatra is an island.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528949"},{"id":"tat-1064309","romanian":"L-am văzut pe Tom sărutând-o pe Mary.","english":"I saw Tom kiss Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045415"},{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-1153792","romanian":"În noaptea aceea, s-a îmbolnăvit, având dureri de stomac.","english":"That night, he became sick with pains in his stomach.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128717"},{"id":"tat-863737","romanian":"Cheltuiește bani și bucură-te de viață!","english":"Spend money and enjoy life!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9086244"},{"id":"tat-1143181","romanian":"Știa că nu va putea câștiga.","english":"He knew he could not win.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069238"},{"id":"tat-862342","romanian":"John a avut o ceartă violentă cu soția sa.","english":"John had a violent quarrel with his wife.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10020874"},{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"}],"stories":[{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-3","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Era o vâlcea împodobită cu fel de fel de floricele, toate înflorite, de părea că dă ghes omului să treacă printre ele."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1119753","romanian":"Vorbești letona?","english":"Do you speak Latvian?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7173476"},{"id":"tat-1136563","romanian":"Clădirea se poate prăbuși în orice moment.","english":"The building may crash at any time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965193"},{"id":"tat-399619","romanian":"Mulțumesc foarte mult!","english":"Thank you very much!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6359653"},{"id":"tat-1136852","romanian":"Jucătorul de șah și-a pus adversarul în șah.","english":"The chess player put his opponent in check.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966267"},{"id":"tat-1144314","romanian":"Deficitul de apă este din cauza vremii.","english":"The water shortage is due to the weather.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073464"},{"id":"tat-1136659","romanian":"Nu are mai mult de o sută de cărți.","english":"He has no more than one hundred books.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227583"},{"id":"tat-1136622","romanian":"Dă-mi o mână de ajutor.","english":"Lend me a hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239816"},{"id":"tat-1153850","romanian":"Vreau un masaj. Am nevoie să mă relaxez.","english":"I want a massage. I need to relax.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130110"},{"id":"tat-1058773","romanian":"Declarațiile lui sunt infantile şi adesea mă deranjază.","english":"His statements are childish and they often bother me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11044684"},{"id":"tat-405977","romanian":"Poftiți, doamnă, serviți-vă!","english":"Please, madam, help yourself!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350235"},{"id":"tat-698947","romanian":"De ce mă iubești?","english":"Why do you love me?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636872"},{"id":"tat-1136556","romanian":"Nu așa îl văd eu.","english":"That is not my idea of him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959323"},{"id":"tat-1136874","romanian":"E destul de supărată.","english":"She is quite angry.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956314"},{"id":"tat-1064159","romanian":"Casa pe care a construit-o Tom este minunată.","english":"The house Tom built is wonderful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072308"},{"id":"tat-709020","romanian":"Becul s-a ars.","english":"The light bulb has burned out.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420302"},{"id":"tat-1143117","romanian":"Și pomul era deseori singur.","english":"And the tree was often alone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070043"},{"id":"tat-1201128","romanian":"E beat.","english":"He is drunk.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12056752"},{"id":"tat-705819","romanian":"Mama mea a plecat ieri la cumpărături în centru.","english":"My mother went shopping downtown yesterday.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963917"},{"id":"tat-583956","romanian":"Orice ai spune, răspunsul e \"nu\".","english":"No matter what you say, the answer is \"no.\"","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799488"},{"id":"tat-1136801","romanian":"Și-a pierdut toți banii pe care îi avea.","english":"He lost all the money he had.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966361"}],"stories":[{"id":"story-ro-norocul-dracului-3","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":238,"excerpt":"Dar unde să adoarmă? Jos, pământul tare şi rece; sus, întuneric adânc; în casă, copiii adorm plângând; în curte Plăviţa pufăie pe nări a foame; şi el, prigonit de gânduri şi de nenoroc. \"Dar mâine? Dacă n-oi avea ce scutura în copaie? Ce mă fac mâine?"},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."},{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
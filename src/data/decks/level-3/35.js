@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1153892","romanian":"A spus-o din amabilitate.","english":"He did it out of kindness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104038"},{"id":"tat-411885","romanian":"Mi-am adus câteva cărți de citit.","english":"I brought some of my books to read.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272023"},{"id":"tat-1163907","romanian":"A continuat să plângă cât e noaptea de lungă.","english":"She kept crying all night long.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196991"},{"id":"tat-1163899","romanian":"Asculta muzică.","english":"She was listening to music.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196923"},{"id":"tat-1197123","romanian":"Cât e până la aeroport?","english":"How far is it to the airport?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3134254"},{"id":"tat-1153151","romanian":"Trebuie să ne trezim devreme mâine dimineață?","english":"Do we have to get up early tomorrow morning?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692258"},{"id":"tat-709037","romanian":"Du-i înapoi cartea asta.","english":"Take this book back to him.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420326"},{"id":"tat-1064200","romanian":"Fustele mini nu mai sunt la modă.","english":"Miniskirts have gone out of fashion.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066254"},{"id":"tat-705792","romanian":"Acest subiect ar trebui discutat in detaliu.","english":"This subject should be discussed in detail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963142"},{"id":"tat-1186862","romanian":"În sfârșit a făcut bani.","english":"He finally made money.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338232"},{"id":"tat-1192742","romanian":"Avionul se apropia de Londra.","english":"The plane was approaching London.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511266"},{"id":"tat-1136959","romanian":"Vă rog, păstrați restul.","english":"Keep the change, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966081"},{"id":"tat-1153757","romanian":"Ne te poți sinucide ținându-ți respirația.","english":"You cannot kill yourself by holding your breath.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5568104"},{"id":"tat-1279041","romanian":"Nimeni nu a venit să mă ajute.","english":"Nobody came to help me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13108759"},{"id":"tat-1136653","romanian":"Mi-a luat mult timp până mi-a trecut răceala.","english":"It took me a long time to get over my cold.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966141"},{"id":"tat-670628","romanian":"A renunţat la visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1611173"},{"id":"tat-488775","romanian":"Prietena sa este japoneză.","english":"His girlfriend is Japanese.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528911"},{"id":"tat-1059423","romanian":"Când pleci de aici?","english":"When do you leave here?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9551350"},{"id":"tat-448259","romanian":"Suntem chit.","english":"We are even.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4250681"},{"id":"tat-1192721","romanian":"A zis ea asta?","english":"She said that?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7136968"}],"stories":[{"id":"story-ro-povestea-lui-stan-p-itul-2","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"Numai, dă! ce să facă bietul om? Cum era să se întindă mai mult, că de-abia acum se prinsese şi el cu mâinile de vatră; şi câte a tras până s-a văzut la casa lui, numai unul Dumnezeu ştie."},{"id":"story-ro-povestea-lui-stan-p-itul","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Era odată un flăcău stătut, pe care-l chema Stan. Şi flăcăul acela din copilăria lui se trezise prin străini, fără să cunoască tată şi mamă şi fără nici o rudă care să-l ocrotească şi să-l ajute."},{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
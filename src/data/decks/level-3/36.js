@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136900","romanian":"De-abia plouă.","english":"It is hardly raining.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960502"},{"id":"tat-1136296","romanian":"Am alergat spre ușă.","english":"I ran toward the door.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963200"},{"id":"tat-1059687","romanian":"Nimeni nu ne poate controla.","english":"Nobody can control us.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10681475"},{"id":"tat-408059","romanian":"I-am dat cărțile acestui student.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232754"},{"id":"tat-1153834","romanian":"Puteam auzi gemetele bărbatului rănit.","english":"We could hear the groans of the injured man.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130091"},{"id":"tat-1143215","romanian":"Vreau să cumpăr un procesor de text.","english":"I want to buy a word processor.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070006"},{"id":"tat-709017","romanian":"De ce îţi sunt urechile atât de mari?","english":"Why are your ears so big?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420299"},{"id":"tat-1278889","romanian":"Nu a fost permis nimănui să părăsească camera.","english":"Nobody was allowed to leave the room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13345377"},{"id":"tat-1153868","romanian":"A fost deschizător de drumuri în acest domeniu.","english":"She was a pioneer in this field.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098377"},{"id":"tat-1119749","romanian":"Vorbiți engleza și scoțiana?","english":"Do you speak English and Scottish Gaelic?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511206"},{"id":"tat-1136850","romanian":"Măcar lasă-mă să te ajut cu masa.","english":"At least let me help with the table.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966285"},{"id":"tat-1136629","romanian":"Cariera lui progresează furtunos.","english":"His career is progressing in leaps and bounds.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239750"},{"id":"tat-1143601","romanian":"Îmi place tenisul.","english":"I like tennis.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071543"},{"id":"tat-1192777","romanian":"I-a arătat poza mea.","english":"She showed him my picture.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364287"},{"id":"tat-1059642","romanian":"Te rog, păstrează cartea asta la îndemână.","english":"Please keep this book at hand.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/938549"},{"id":"tat-411897","romanian":"Vă trimisesem deja scrisoarea când mi-ați dat telefon.","english":"I had already sent you the letter when you called.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272065"},{"id":"tat-1153167","romanian":"Arătați bine.","english":"You look fine.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1767044"},{"id":"tat-1143116","romanian":"Acest ceas ți-e destinat.","english":"This watch is meant for you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070041"},{"id":"tat-1163914","romanian":"Rata criminalității este în scădere în Canada.","english":"The crime rate is decreasing in Canada.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197021"},{"id":"tat-1153809","romanian":"Acesta e un vin excelent.","english":"This is excellent wine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128986"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."},{"id":"story-ro-fata-mo-ului","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":208,"excerpt":"Copiii cutreierau voioşi via părăginită. Un şir, ţinându-se cu amândouă mâinile de mijloc, se încolăcea, strigând de frică să nu-i înhaţe \"mama-gaia\". Fetele începuseră \"de-a ulciorul\". – Cum dai ulciorul? Poveşti de Barbu Ştefănescu Delavrancea - Fata moşului – Cum îl vezi, cu ochii verzi, ş-o lingură de păsat, să nu zacă de vărsat. Sub castani, oamenii stau de vorbă."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
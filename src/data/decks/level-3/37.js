@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-406051","romanian":"O întâlnesc pe Mihaela în fiecare dimineață, la metrou.","english":"I meet Mihaela every morning at the subway.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347358"},{"id":"tat-670639","romanian":"Naivul bărbat era extrem de stânjenit în prezenţa ei.","english":"The naive man was utterly embarrassed in her presence.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681128"},{"id":"tat-1136929","romanian":"Problema rămâne de rezolvat.","english":"The problem remains to be solved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957754"},{"id":"tat-1143130","romanian":"Calciul lipsește din dieta lui.","english":"Calcium is absent from his diet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068855"},{"id":"tat-1153869","romanian":"Stai nemișcat pentru o clipă, te rog.","english":"Hold still for a moment, please.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098378"},{"id":"tat-1056686","romanian":"Micul dejun este principala masă a zilei.","english":"Breakfast is the most important meal of the day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029785"},{"id":"tat-1059690","romanian":"Îmi poți da niște bani?","english":"Can you give me some money?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/931482"},{"id":"tat-702190","romanian":"Acest peşte miroase urât.","english":"This fish smells bad.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397702"},{"id":"tat-1090180","romanian":"De ce vrei să cumperi cartea asta?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3639543"},{"id":"tat-862380","romanian":"Am amânat evenimentul.","english":"We postponed the event.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9459071"},{"id":"tat-1153789","romanian":"L-am găsit pe băiat deja adormit.","english":"I found the boy fast asleep.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128663"},{"id":"tat-709928","romanian":"Această maşină a fost făcută in Japonia.","english":"This car was made in Japan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424464"},{"id":"tat-1185180","romanian":"Acum e în spital.","english":"She is in hospital now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324332"},{"id":"tat-584465","romanian":"Mă doare în gât şi îmi curge nasul.","english":"I have a sore throat and runny nose.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807839"},{"id":"tat-1064413","romanian":"L-am văzut uitându-se la mine.","english":"I saw him looking at me.","difficulty":5,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075735"},{"id":"tat-1185078","romanian":"Noua lege a fost impusă oamenilor de pe insulă.","english":"The new law was enforced on the people of the island.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321427"},{"id":"tat-1142894","romanian":"Alb?","english":"Is it white?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066019"},{"id":"tat-1195248","romanian":"E în bani.","english":"He is in the money.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7171087"},{"id":"tat-1142890","romanian":"Ce-i asta?","english":"What is this?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065968"},{"id":"tat-1163888","romanian":"Astăzi este foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196786"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-amintiri-copilarie","title":"Amintiri din copilarie","author":"Ion Creanga","difficulty":5,"genre":"memoir","wordCount":175,"excerpt":"Stau cateodata si-mi aduc aminte ce vremuri si ce oameni mai erau in partea locului, pe cand eram eu copil. Si, drept sa spun, pare-mi-se ca pe atunci oamenii erau mai sarguitori, mai voiosi si mai buni la suflet decat cei de astazi."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
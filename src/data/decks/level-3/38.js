@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-708925","romanian":"Doamna Green ne predă muzica.","english":"Miss Green teaches us music.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397994"},{"id":"tat-1149075","romanian":"Piersicul face piersici.","english":"Peaches grow on the peach tree.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106106"},{"id":"tat-1136387","romanian":"Fără gravitație, am fi aruncați în spațiu.","english":"Without gravity we would be hurled off into space.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962828"},{"id":"tat-1119702","romanian":"Vorbiți ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7185558"},{"id":"tat-1143842","romanian":"Se ține întotdeauna de cuvânt.","english":"He always fulfills his promises.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070729"},{"id":"tat-1143119","romanian":"Tom va ajunge o oră mai târziu.","english":"Tom will be arriving an hour late.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070045"},{"id":"tat-1192790","romanian":"Oamenii promiseseră deja bani pentru proiectul său.","english":"People have already promised money for his project.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350198"},{"id":"tat-923931","romanian":"Animalele sălbatice sunt în pericol de dispariţie.","english":"Wild animals are on the verge of dying out.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/807128"},{"id":"tat-1185074","romanian":"Ar putea deveni jucător de baseball.","english":"He may become a baseball player.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321358"},{"id":"tat-399274","romanian":"Bine ai venit!","english":"Welcome.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335259"},{"id":"tat-1192781","romanian":"Primul este inferior ultimului în anumite privințe.","english":"The former is inferior to the latter in some respect.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364292"},{"id":"tat-411890","romanian":"Când era studentă, mergea des la discotecă.","english":"When she was a student, she used to go to the disco often.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272038"},{"id":"tat-1089652","romanian":"Ce făceai?","english":"What were you doing?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267869"},{"id":"tat-1143172","romanian":"Explicația lui nu era satisfăcătoare.","english":"His explanation was not satisfactory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069202"},{"id":"tat-1136580","romanian":"Calitatea traducerii s-a îmbunătățit.","english":"The quality of translation has improved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966078"},{"id":"tat-1064343","romanian":"Tom și Mary vor avea un copil.","english":"Tom and Mary are going to have a baby.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11063518"},{"id":"tat-1151785","romanian":"Azi e vineri.","english":"Today is Friday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119197"},{"id":"tat-983708","romanian":"Este un cal.","english":"This is a horse.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5754562"},{"id":"tat-862416","romanian":"Fericirea nu se cumpără.","english":"One does not buy happiness.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9462186"},{"id":"tat-1143263","romanian":"Aceea e școala mea.","english":"That is my school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068637"}],"stories":[{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."},{"id":"story-ro-ion-roat-i-cuza-vod","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":229,"excerpt":"Între ţăranii fruntaşi care au luat parte, împreună cu boierii, cu episcopii şi cu mitropolitul ţării la Divanul ad-hoc din Moldova, în 1857, era şi moş Ion Roată, om cinstit şi cuviincios, cum sunt mai toţi ţăranii români de pretutindeni."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1185173","romanian":"A zis că trebuie să păstrăm secretul.","english":"He said we must keep the secret.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324299"},{"id":"tat-1136826","romanian":"Trebuie să plec chiar acum?","english":"Must I leave at once?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966311"},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"},{"id":"tat-583829","romanian":"Tom a ajuns ultimul.","english":"Tom was the very last to arrive.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2203704"},{"id":"tat-1163901","romanian":"Asculți?","english":"Are you listening?","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196975"},{"id":"tat-708979","romanian":"În cartierul meu a fost un mare incendiu.","english":"There was a big fire in my neighborhood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420379"},{"id":"tat-1201140","romanian":"E un bun perdant.","english":"He is a good loser.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12422431"},{"id":"tat-1186840","romanian":"Știam că era plastic, dar părea din lemn.","english":"I knew it was plastic but it tasted like wood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7317802"},{"id":"tat-1143238","romanian":"Mă uitam în jos către fundul văii.","english":"I was looking downward to the bottom of the valley.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068500"},{"id":"tat-584803","romanian":"Fata își spălă părul.","english":"The girl washed her hair.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813833"},{"id":"tat-702065","romanian":"Agenţia de voiaj ne-a furnizat toate detaliile turului.","english":"The travel company furnished us with all the details of the tour.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398902"},{"id":"tat-1279104","romanian":"Asta e mai frumoasă.","english":"This one is more beautiful.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13113773"},{"id":"tat-1128611","romanian":"Ce ai în geantă?","english":"What have you got in your bag?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11912837"},{"id":"tat-1147490","romanian":"Închide ușa aia blestemată!","english":"Shut the damned door!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094827"},{"id":"tat-1136896","romanian":"Sunt atât de bucuros să vizit VNU.","english":"I’m so glad to visit VNU.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966032"},{"id":"tat-1143685","romanian":"M-am săturat de asta.","english":"I am fed up with it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072255"},{"id":"tat-1192816","romanian":"Yenul e încă scăzut în raport cu dolarul.","english":"The yen is still low against the dollar.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356233"},{"id":"tat-599089","romanian":"Numele tău se află în capul listei.","english":"Your name stands first in the list.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1447346"},{"id":"tat-1108779","romanian":"Ei nu vin astăzi.","english":"They are not coming today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759953"},{"id":"tat-670675","romanian":"Poţi să-l alegi pe care îl vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200655"}],"stories":[{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."},{"id":"story-ro-aleodor-mp-rat-3","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"Pocitania pământului îi zise: – Toţi nelegiuiţii ce-mi calcă hotarul cad în robia mea. – Mai întâi trebuie să ştii, îi răspunse Aleodor, că din nebăgare de seamă şi fără de voia mea am călcat pe coprinsul tău, şi n-am nici un gând rău asupră-ţi."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
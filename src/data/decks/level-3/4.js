@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1064177","romanian":"Dintr-o dată mama a început să cânte.","english":"Suddenly, my mother started singing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070211"},{"id":"tat-699683","romanian":"Mi-e dor de tine.","english":"I miss you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323633"},{"id":"tat-1136689","romanian":"Clasa noastră e formată din 40 de băieți.","english":"Our class consists of 40 boys.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239666"},{"id":"tat-408052","romanian":"Am discutat deja cu acest student.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232108"},{"id":"tat-1159808","romanian":"Pune ouăle în frigider.","english":"Put the eggs in the refrigerator.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168184"},{"id":"tat-1136986","romanian":"Fii atent!","english":"Be watchful.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952792"},{"id":"tat-864476","romanian":"Orașul a fost distrus în timpul războiului.","english":"The town was destroyed during the war.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6806128"},{"id":"tat-698949","romanian":"Acela este tatăl nostru.","english":"That is our father.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2637465"},{"id":"tat-487314","romanian":"Ea va strânge vesela de pe masă.","english":"She will clear the table of the dishes.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334961"},{"id":"tat-1059417","romanian":"M-am uitat în dulap.","english":"I looked in the cupboard.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7087756"},{"id":"tat-923838","romanian":"Anna este o fetiță.","english":"Ann is a little girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10435209"},{"id":"tat-1136851","romanian":"Te-ai spălat deja pe mâini?","english":"Have you washed your hands yet?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966287"},{"id":"tat-1064275","romanian":"Vin roșu, vă rog.","english":"Red wine, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066144"},{"id":"tat-1143120","romanian":"Inversa unei matrice nepătratice este un lucru periculos.","english":"The inverse of a non-square matrix is a dangerous thing.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068786"},{"id":"tat-408085","romanian":"În primul rând, vreau să vă mulțumesc pentru ospitalitate.","english":"First of all, I would like to thank you for your hospitality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232873"},{"id":"tat-1192713","romanian":"A avut timp să-și pregătească oamenii de luptă.","english":"He had time to prepare his men for battle.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2953687"},{"id":"tat-1120906","romanian":"El este un conducător auto cu experienţă.","english":"He is an expert driver.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11856429"},{"id":"tat-31","romanian":"Cati ani ai?","english":"How old are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-487284","romanian":"Îl știu?","english":"Do I know him?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270480"},{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-inul-i-c-me-a","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Inul: – Ştii tu, cămeşă dragă, ce erai odată? Poveşti de Ion Creangă - Inul şi cămeşa – Ce să fiu? Eram ceea ce mă vezi: cămeşă albă, cu care se îmbracă oamenii. – Nu-i aşa!"},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-2","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"După ce-l mai ciocmăni muierea o toană, puse în gând să-i facă voia, căci limbuţia nevestei îl scoase afară din ţâţâni. Se sculă, deci, de dimineaţă, îşi luă copiii şi plecară împreună cu vorba că merge la lemne."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
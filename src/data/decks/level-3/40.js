@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1153793","romanian":"Voi lua o cină cu un prieten.","english":"I am going to eat an evening meal with a friend.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128725"},{"id":"tat-986483","romanian":"El știe tot.","english":"He knows everything.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637121"},{"id":"tat-1143243","romanian":"Te-a așteptat două ore.","english":"She waited for you for two hours.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068548"},{"id":"tat-399605","romanian":"Vorbești engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-706153","romanian":"O răţuşcă urâtă a devenit o lebădă graţioasă.","english":"An ugly duckling became a graceful swan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974759"},{"id":"tat-1136548","romanian":"Și-a atribuit eşecul ghinionului.","english":"She ascribed her failure to bad luck.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965103"},{"id":"tat-1136912","romanian":"Casa mea e aproape de stația de autobuz.","english":"My house is close to a bus stop.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966001"},{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-1136511","romanian":"Mă simt îndatorată moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965107"},{"id":"tat-1143208","romanian":"Pretinde că e cinstit.","english":"He claims that he is honest.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069998"},{"id":"tat-1185108","romanian":"Am fost la Londra.","english":"I have been to London.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195147"},{"id":"tat-706157","romanian":"În această carte se întâmplă multe coincidenţe.","english":"In this book, lots of coincidences happen.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974784"},{"id":"tat-12","romanian":"Buna dimineata!","english":"Good morning!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325821"},{"id":"tat-670692","romanian":"Poți alege orice carte vrei.","english":"You may choose whichever book you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200793"},{"id":"tat-1186849","romanian":"Notele sunt importante, dar nu sunt totul.","english":"Grades are important, but they are not everything.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338192"},{"id":"tat-406042","romanian":"La început vă displăcuse ideea, dar acum păreți mulțumiți.","english":"At the beginning you had disliked the idea, but now you seem to be content.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350487"},{"id":"tat-1136888","romanian":"Era la locul crimei.","english":"She was on the scene of the crime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966017"},{"id":"tat-584840","romanian":"Mobilierul din acest birou este foarte modern.","english":"The furniture in this office is really modern.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812390"},{"id":"tat-1059443","romanian":"Când vine vorba de gătit, nimeni nu mă întrece.","english":"When it comes to cooking, no one can beat me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9509387"},{"id":"tat-986457","romanian":"Astăzi este ziua mea.","english":"Today is my birthday.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637054"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-3","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"– Ba nici râs, nici nimic, începu a zice neguţătorul cel chiabur. Iată două pungi: nu crez să-ţi dea altul mai mult. Şi scoase pungile cu bani, i le puse în mână, luă oul şi plecă. Bietul om rămase înlemnit în loc, uitându-se după neguţător cum se ducea. Nici că-i venea măcar să crează ochilor."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-583918","romanian":"Am o durere de cap teribilă.","english":"I have a bad headache.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798048"},{"id":"tat-1151776","romanian":"Azi e luni.","english":"Today is Monday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118747"},{"id":"tat-1090366","romanian":"Mă poţi auzi?","english":"Can you hear me?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11523377"},{"id":"tat-1057690","romanian":"Efectele au avut impact mai mult asupra familiilor sărace.","english":"The effects have impacted most on poorer families.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11036698"},{"id":"tat-584344","romanian":"Bună ziua, cum vă pot fi de folos?","english":"Good day, how may I help you?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7797080"},{"id":"tat-1136876","romanian":"Tom a observat o schimbare la Mary.","english":"Tom noticed a change in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960285"},{"id":"tat-1119734","romanian":"Vreau să te întreb ceva, domnișoară Ionescu.","english":"I want to ask you something, Ms. Ionescu.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342506"},{"id":"tat-986478","romanian":"Te iubesc foarte mult.","english":"I love you very much.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637115"},{"id":"tat-1144330","romanian":"Acea petrecere s-a ținut sub auspiciile Ministerului Afacerilor Externe.","english":"That party was held under the auspices of the Foreign Ministry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073626"},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-488759","romanian":"Această cameră nu este potrivită pentru dormit.","english":"This room is not suitable for sleeping.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268734"},{"id":"tat-1136958","romanian":"Știe că îl iubești?","english":"Does he know that you love him?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960492"},{"id":"tat-1064170","romanian":"Toată lumea în afară de Tom a fost prezentă.","english":"Everyone except Tom was present.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3090030"},{"id":"tat-1192838","romanian":"Tatăl meu e doctor.","english":"My father is a doctor.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361424"},{"id":"tat-399600","romanian":"Vorbești japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319472"},{"id":"tat-1059501","romanian":"General Motors a dat afară cei 76.000 de muncitori.","english":"General Motors laid off 76,000 workers.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7534514"},{"id":"tat-1136355","romanian":"Nu e prost.","english":"He is not stupid.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963115"},{"id":"tat-709012","romanian":"Doriţi un loc la fereastră?","english":"Would you like a window seat?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420287"},{"id":"tat-402116","romanian":"Bun venit!","english":"Welcome.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265824"},{"id":"tat-1089727","romanian":"Îmi place matematica.","english":"I like maths.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267471"}],"stories":[{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-ro-george-cel-viteaz-3","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Împăratul trimise pe împărăteasa să boteze pruncul, căci el va sta să dea piept cu tălharii, până se va întoarce ea. Împărăteasa se supuse poruncii şi plecă. Când să se întoarcă de la botez, veni până la un loc; aci, stând şi nemaiauzind zăngănitul armelor şi zgomotul luptei, îi dete un fier ars în inimă."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-698964","romanian":"Fii iubit.","english":"Be loved.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3289391"},{"id":"tat-407936","romanian":"Dacă așa vi s-a spus, probabil că e corect.","english":"If this is the way you were told, it is probably correct.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6437718"},{"id":"tat-1064267","romanian":"Ce fel de mâncare îi place lui Tom?","english":"What kind of food does Tom like?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064842"},{"id":"tat-670694","romanian":"Poţi alege orice.","english":"You may choose what you like.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200802"},{"id":"tat-1153865","romanian":"Fulgerele pot fi periculoase.","english":"Lightning can be dangerous.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098350"},{"id":"tat-1056666","romanian":"Ce trebuie să conțină un mic dejun sănătos?","english":"What should a healthy breakfast consist of?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031158"},{"id":"tat-1201354","romanian":"Iată autobuzul!","english":"Here comes the bus!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4907596"},{"id":"tat-1143257","romanian":"I-a pus întrebări.","english":"He asked her questions.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068610"},{"id":"tat-1136828","romanian":"Râzi în legătură cu ce?","english":"What are you laughing at?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966362"},{"id":"tat-864490","romanian":"El ține legătura cu tot felul de oameni.","english":"He is in touch with all kinds of people.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855690"},{"id":"tat-862378","romanian":"Soția mea a născut un copil săptămâna trecută.","english":"My wife had a baby last week.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9458631"},{"id":"tat-862344","romanian":"În general, bărbaţii sunt mai înalţi decât femeile.","english":"Generally speaking, men are taller than women.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10085812"},{"id":"tat-1057661","romanian":"L-au dat afară din discotecă fără nicio explicație.","english":"They kicked him out of the disco without any explanation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11037179"},{"id":"tat-406031","romanian":"Îmi place baclavaua.","english":"I like baclava.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350448"},{"id":"tat-1136639","romanian":"Cine a scris această scrisoare?","english":"Who wrote this letter?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966122"},{"id":"tat-1136656","romanian":"Cina va fi servită la bordul avionului.","english":"Dinner will be served on board the plane.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966176"},{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1056801","romanian":"Este o persoană agresivă.","english":"He is an aggressive person.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031628"},{"id":"tat-1136318","romanian":"Studiez istoria artei.","english":"I study art history.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963188"},{"id":"tat-1142932","romanian":"Majoritatea pasagerilor din autobuz dormeau.","english":"Most of the passengers on the bus were sleeping.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066665"}],"stories":[{"id":"story-ro-g-in-reasa","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"A fost odată un împărat şi o împărăteasă. În căsătoria lor ei au trăit ca fraţii, şi numai o fată au fost făcut. Ca şi mumă-sa, această fată, din naştere, era cu o stea în frunte."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-fata-mo-ului-cea-cuminte-2","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Când, tocmai când era să se dea jos, zări spre răsărit abia licărind o mititică vâlvotaie; se coborî de pe acoperiş şi o luă într-acolo. Se duse, se duse şi la foc nu mai ajunse; dară în drumul ei întâlni o grădină părăginită, care o strigă zicându-i: – Fată mare, fată mare!"}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
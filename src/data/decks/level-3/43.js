@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136960","romanian":"Poți culca copiii?","english":"Can you put the children to bed?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958000"},{"id":"tat-1117421","romanian":"Este adevărat?","english":"Is that true?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817570"},{"id":"tat-1185067","romanian":"Tom vorbea la telefon de o oră.","english":"Tom has been talking on the phone for an hour.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320872"},{"id":"tat-1064024","romanian":"De îndată ce m-a văzut a început să plângă.","english":"As soon as she saw me, she started to cry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10936810"},{"id":"tat-1192845","romanian":"Fața ei s-a albit.","english":"Her face turned pale.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361489"},{"id":"tat-1153879","romanian":"Am confirmat telefonic rezervarea la hotel.","english":"We confirmed the hotel reservations by telephone.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12100238"},{"id":"tat-1153886","romanian":"Opinia lor contează puțin.","english":"Their opinion matters little.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12103107"},{"id":"tat-863630","romanian":"Trebuie să îmi fac o asigurare de sănătate.","english":"I need to purchase health insurance.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9133595"},{"id":"tat-1136553","romanian":"Trebuie să înveți toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965315"},{"id":"tat-1159835","romanian":"Mulțumesc foarte, foarte mult!","english":"Thank you very, very much!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167856"},{"id":"tat-698946","romanian":"Cât costă?","english":"How much is it?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-408090","romanian":"Prietenul nostru a terminat cursa al doilea.","english":"Our friend finished the race in second place.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232893"},{"id":"tat-1136275","romanian":"Poți invita orice persoană dorești.","english":"You may invite any person you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963281"},{"id":"tat-863666","romanian":"Unde crezi că se duc toți banii?","english":"Where do you think all the money goes?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9145912"},{"id":"tat-1151813","romanian":"Cade o frunză.","english":"A leaf is falling.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119103"},{"id":"tat-708991","romanian":"Presupun că va întârzia.","english":"I suppose he will be late.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420395"},{"id":"tat-1064314","romanian":"Cât de des o vede Tom pe Mary?","english":"How often does Tom see Mary?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11060128"},{"id":"tat-708922","romanian":"Poate o să ningă.","english":"Maybe it will snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397946"},{"id":"tat-1192771","romanian":"A alergat 100 de metri în exact 11 secunde.","english":"He ran 100 meters in 11 seconds flat.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364280"},{"id":"tat-1143187","romanian":"Tom pare a fi interesat de Mary.","english":"Tom seems to be interested in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069268"}],"stories":[{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-norocul-dracului-2","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"dacă n-ar fi, n-ar fi lumea cum e. Eu n-am arat, n-am săpat, n-am prăşit, n-am plivit ca ceilalţi? Ba da, şi ogorul meu a ieşit sterp; piatra pe mine m-a bătut; şi, rămas numai cu mâinile, muncesc, şi nimeni nu mă crede; iar când la măsurătoarea muncii, lucrul meu scade, şi făina din copaie scade, şi foamea copiilor creşte\"."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136539","romanian":"Îl poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957077"},{"id":"tat-706134","romanian":"Lui Robert i se spune \"Bob\".","english":"They call Robert \"Bob\".","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974457"},{"id":"tat-709013","romanian":"Câte mere vrei?","english":"How many apples do you want?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420288"},{"id":"tat-1124704","romanian":"Dicţionarul de pe birou este al meu.","english":"The dictionary on the desk is mine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11875296"},{"id":"tat-1064029","romanian":"Pari ocupat.","english":"You look busy.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064319"},{"id":"tat-1136986","romanian":"Fii atent!","english":"Be watchful.","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952792"},{"id":"tat-1136707","romanian":"Amândoi și-au mâncat ciocolatele până la ultima îmbucătură.","english":"They both ate their chocolates down to the very last bite.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226212"},{"id":"tat-1192820","romanian":"Alerg în fiecare zi.","english":"I run every day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356278"},{"id":"tat-714067","romanian":"Romeo este bărbatul pe care Julieta îl iubeşte.","english":"Romeo is the man Juliet loves.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469893"},{"id":"tat-1136627","romanian":"Cu toții ne dorim pace.","english":"We all wished for peace.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239780"},{"id":"tat-1117472","romanian":"Ea este puternică.","english":"She is strong.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817460"},{"id":"tat-1144711","romanian":"Capitala Poloniei este Varșovia.","english":"The capital of Poland is Warsaw.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076553"},{"id":"tat-1185133","romanian":"S-a produs vreo schimbare în curenții oceanici?","english":"Has a change in ocean currents occurred?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323897"},{"id":"tat-1144301","romanian":"Refuz să fiu de acord cu acel plan.","english":"I refuse to consent to that plan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073270"},{"id":"tat-698972","romanian":"Am două cărți.","english":"I have two books.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3766465"},{"id":"tat-1185175","romanian":"Atletul părea imun la oboseală.","english":"The athlete seemed immune to fatigue.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324302"},{"id":"tat-1110606","romanian":"Ma ajutat foarte mult.","english":"It helped me a lot.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3824983"},{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-1153784","romanian":"Acum simt la fel.","english":"Now I feel the same.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128604"},{"id":"tat-1147446","romanian":"Astăzi am curs de esperanto.","english":"Today I have an Esperanto class.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094147"}],"stories":[{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"A fost odată un băiat. El, de la naşterea lui, se pomenise bubos. Ce n-a făcut el ca să se cureţe de bube? dară în deşert. Băieţii la joc şi fetele la horă îl huiduia şi fugeau de dânsul ca de o lepră."},{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."},{"id":"story-ro-z-na-mun-ilor","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat foarte viteaz; toate împărăţiile de prinprejurul împărăţiei sale îi cerea sfaturi: atâta era de drept şi înţelept. Când se isca sfadă între dânşii, la acest împărat mergeau mai întâi la judecată şi, cum zicea el, aşa se şi făcea, fiindcă era judecător drept şi iubitor de pace."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
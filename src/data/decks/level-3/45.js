@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1278932","romanian":"Nimeni nu e mai sus de el.","english":"No one is above him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13348271"},{"id":"tat-408049","romanian":"Studentul acesta este american.","english":"This student is American.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220864"},{"id":"tat-1192817","romanian":"Tom își dorea să fi fost mai atent.","english":"Tom wished he had been more careful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356244"},{"id":"tat-1147563","romanian":"Vorbește prea mult.","english":"He talks too much.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095134"},{"id":"tat-1144715","romanian":"Capitala Serbiei este Belgrad.","english":"The capital city of Serbia is Belgrade.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076564"},{"id":"tat-708930","romanian":"Biroul lui este foarte aproape de al meu.","english":"His office is very close to mine.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398356"},{"id":"tat-1142918","romanian":"Am auzit bomba explodând.","english":"We heard the bomb go off.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066399"},{"id":"tat-406013","romanian":"Copacii erau foarte rari.","english":"The trees were very scarce.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350364"},{"id":"tat-1136616","romanian":"Toate invențiile apar din necesitate.","english":"All inventions grow out of necessity.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965950"},{"id":"tat-706050","romanian":"Dacă înveţi din greu, vei deveni un student bun.","english":"If you study hard, you will become a good student.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970031"},{"id":"tat-399604","romanian":"Vorbiți engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323247"},{"id":"tat-709035","romanian":"În afară de mine, toată lumea este ocupată.","english":"Everybody is busy except me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420321"},{"id":"tat-712076","romanian":"Trebuie să vii cu mine.","english":"You have to come with me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440714"},{"id":"tat-1136402","romanian":"Conducerea a încercat să liniștească muncitorii oferindu-le un bonus.","english":"Management tried to appease labor by offering them a bonus.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962896"},{"id":"tat-1119743","romanian":"Vorbești klingona?","english":"Do you speak Klingon?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7235942"},{"id":"tat-399615","romanian":"Noapte bună, mamă.","english":"Good night, Mom.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327701"},{"id":"tat-1136530","romanian":"A luat o piatră de pe jos.","english":"He picked up a stone.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964787"},{"id":"tat-1153818","romanian":"Rar iese duminica.","english":"Rarely does he go out on Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129254"},{"id":"tat-1192805","romanian":"Nu putem întreba nimic despre vârstă sau probleme fizice.","english":"We cannot ask anything about age or physical problems.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354070"},{"id":"tat-1136854","romanian":"Aș face altfel decât ai făcut tu.","english":"I would do it in a different way than you did.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966286"}],"stories":[{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-3","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Boiul lor era mândru, amândoi aveau pe vino-ncoace, vorba lor, era vorbă cu lipici şi amândoi erau voinici, nevoie mare. Într-o zi se hotărâră să meargă la vânătoare. Împărăteasa se tot ciudea cum să-şi cunoască pe fiul său: fiindcă şi feţele şi îmbrăcăminţile fiind la fel, de multe ori nu putea să deosebească pe unul din altul."},{"id":"story-ro-o-via-pierdut-3","title":"O viață pierdută","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":209,"excerpt":"Cârlanul se opri, nechezând printre dinți, la ușa grajdului. - Stăi, prietene! grăi bătrânul mergând cu hamurile în urma lui. Toate se fac cu vremea. În grajd mai era un cal, loc pentru alți doi și un flăcău, care se trezi din somn când intră bătrânul. - Bună seara, Costane! grăi el trăgănând vorbele. Ai avut noroc la ziuă?"},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
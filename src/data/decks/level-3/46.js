@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1142892","romanian":"Câți ani ai?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1064187","romanian":"El are idei ciudate.","english":"He has strange ideas.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066231"},{"id":"tat-1119769","romanian":"Când a murit? \"Nu cu mult timp în urmă.\"","english":"When did he die? \"Not very long ago.\"","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11845708"},{"id":"tat-1119750","romanian":"Vorbiți suedeza?","english":"Do you speak Swedish?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264927"},{"id":"tat-1136573","romanian":"A forțat ușa încuiată cu o rangă.","english":"He pried open the locked door with a crowbar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966044"},{"id":"tat-1279124","romanian":"Bicicleta mea a dispărut.","english":"My bike disappeared.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13117848"},{"id":"tat-1186864","romanian":"Acest ceas trebuie reparat.","english":"This watch needs to be fixed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338255"},{"id":"tat-1119756","romanian":"În acest oraș, există trei saloane de înfrumusețare.","english":"In this city, there are three beauty salons.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264837"},{"id":"tat-1144296","romanian":"Fără el, aș fi neajutorată.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073249"},{"id":"tat-406033","romanian":"Îmi face plăcere să merg pe jos.","english":"I like to walk.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350454"},{"id":"tat-1144743","romanian":"Câștigăm o zi.","english":"We are gaining a day.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12077122"},{"id":"tat-709916","romanian":"Din 50 de aplicanţi, 20 au fost respinşi.","english":"There were 20 failures among 50 applicants.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424371"},{"id":"tat-689399","romanian":"Crăciun fericit!","english":"Merry Christmas!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1781709"},{"id":"tat-1136527","romanian":"Făceți-vă temele acum.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965357"},{"id":"tat-1136964","romanian":"Ieri, s-a dus la școală să studieze.","english":"He went to school to study yesterday.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957826"},{"id":"tat-1124701","romanian":"Tortul are un gust dulce.","english":"The cake tastes sweet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11873968"},{"id":"tat-1192707","romanian":"Ai o masă în patio?","english":"Do you have a table in the patio?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1309190"},{"id":"tat-406809","romanian":"Cum te numești?","english":"What is your name?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347301"},{"id":"tat-1153836","romanian":"Ar trebui să fi terminat până acum.","english":"He should have finished it by now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130096"},{"id":"tat-407957","romanian":"Numele meu este românesc, al lui e american.","english":"My name is Romanian; his is American.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531992"}],"stories":[{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-3","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"Într-una din zile, moşneagul, fiind foarte amărât de câte-i spunea baba, chemă fata şi-i zise: – Draga tatei, iaca ce-mi tot spune mă-ta de tine: că n-o asculţi, că eşti rea de gură şi înnărăvită şi că nu este de chip să mai stai la casa mea; de-aceea du-te şi tu încotro te-a îndrepta Dumnezeu, ca să nu se mai facă atâta gâlceavă la casa asta, din pricina ta."},{"id":"story-ro-poveste-r-neasc-3","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Cum se auzi cocoşul, duhul pieri ca o nălucă, dară şi băiatul căzu jos de ostenit. De mai ţinea lupta, numai cât ai aţâţa un foc, s-ar fi muiat, şi cine ştie ce se întâmpla. Cum căzu fiul de împărat pe mormântul tătâne-său, acolo şi adormi. Atât era de rupt de oboseală. Când se deşteptă, ce să vedeţi d-voastră?"}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
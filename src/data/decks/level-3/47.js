@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-706155","romanian":"Tocmai a plecat.","english":"He left just now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974769"},{"id":"tat-698950","romanian":"Aceasta este mama mea.","english":"This is my mother.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2736139"},{"id":"tat-1144295","romanian":"Fără el, aș fi neajutorat.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073247"},{"id":"tat-1064072","romanian":"Tom pare foarte fericit.","english":"Tom looks very happy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069577"},{"id":"tat-1136863","romanian":"Toată lumea știe că încă este în viață.","english":"Everybody knows for a fact that he is still alive.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966276"},{"id":"tat-1143191","romanian":"Am știut tot timpul că spunea minciuni.","english":"I knew all along that he was telling a lie.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069296"},{"id":"tat-1159850","romanian":"Azi e foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168080"},{"id":"tat-1064018","romanian":"El a început să se scuze.","english":"He began to make excuses.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10918528"},{"id":"tat-1136431","romanian":"A mers pe cal până la mare.","english":"He rode a horse to the sea.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965821"},{"id":"tat-1136612","romanian":"Ca să spunem adevărul, această propoziţie foloseşte modul conjunctiv.","english":"Truth be told, this sentence uses the subjunctive mood.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966006"},{"id":"tat-923852","romanian":"Cea mai bună prietenă a mea Felicja este aici.","english":"My best friend Felicja is here.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442763"},{"id":"tat-1064028","romanian":"De îndată ce m-a văzut a izbucnit în plâns.","english":"As soon as she saw me, she burst out crying.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10913317"},{"id":"tat-1136554","romanian":"Trebuie să învățați toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960194"},{"id":"tat-1192731","romanian":"Fratele meu vrea să meargă pe lună cândva.","english":"My brother wants to go to the moon some day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7507022"},{"id":"tat-411900","romanian":"Răzvan tocmai plecă.","english":"Razvan just left.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272077"},{"id":"tat-1136536","romanian":"Rockul este muzica celor tineri.","english":"Rock is the music of the young.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965478"},{"id":"tat-1143254","romanian":"Domnul Kinoshita și-a lăsat ochelarii la birou ieri seară.","english":"Mr Kinoshita left his glasses behind in the office yesterday evening.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068562"},{"id":"tat-1153840","romanian":"Octopusul este în mare.","english":"The octopus is in the sea.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130100"},{"id":"tat-13","romanian":"Buna seara!","english":"Good evening!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-7","romanian":"Salut!","english":"Hi!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"}],"stories":[{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-cei-trei-fra-i-mp-ra-i","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un biet om sărac. El avea femeie şi trei copilaşi. Lucra bietul om de da pe brânci, zi şi noapte, orice şi pe unde găsea, şi două în tei nu putea lega şi el. Bieţii copilaşi erau mai mult flămânzi decât sătui."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
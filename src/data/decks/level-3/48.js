@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136512","romanian":"Era cam douăzeci de dolari.","english":"It was about twenty dollars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11961625"},{"id":"tat-862826","romanian":"Mai bine mor de foame decât să fur.","english":"I would rather starve than steal.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014504"},{"id":"tat-1185251","romanian":"Te rog să te întorci de-ndată.","english":"Please come back at once.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328033"},{"id":"tat-1143138","romanian":"Doctorul mi-a spus să renunț la fumat.","english":"The doctor told me to give up smoking.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068909"},{"id":"tat-698920","romanian":"Îți place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1837147"},{"id":"tat-1143232","romanian":"Fă-o!","english":"Do it!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068477"},{"id":"tat-1064235","romanian":"Tom are iubită?","english":"Does Tom have a girlfriend?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073102"},{"id":"tat-1238705","romanian":"A fugit un bou în pantaloni scurți.","english":"A bull with short trousers has escaped.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5296592"},{"id":"tat-712090","romanian":"Va trebui să facem ceva.","english":"We will have to do something.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440048"},{"id":"tat-1185064","romanian":"Mi-a așteptat răspunsul.","english":"She waited for my reply.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320611"},{"id":"tat-1136610","romanian":"Cu ajutorul doctorilor, s-a vindecat.","english":"With the help of doctors, she got over her illness.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966026"},{"id":"tat-1089729","romanian":"Ce zi frumoasă!","english":"What a nice day it is!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11275379"},{"id":"tat-1143236","romanian":"Jimmy e cu doi ani mai mic ca mine.","english":"Jimmy is junior to me by two years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068493"},{"id":"tat-1185073","romanian":"Treci la subiect!","english":"Get to the point!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321357"},{"id":"tat-706094","romanian":"Mi-am lăsat cheia in cameră.","english":"I left my key in my room.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/972152"},{"id":"tat-1119697","romanian":"Vorbești chineza?","english":"Do you speak Chinese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227075"},{"id":"tat-1136381","romanian":"Salut! Bună dimineața!","english":"Hello! Good morning!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962782"},{"id":"tat-411911","romanian":"Aș merge la film dacă aș avea timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272125"},{"id":"tat-610863","romanian":"Acest suc are gust acru.","english":"This juice tastes sour.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/692737"},{"id":"tat-924384","romanian":"Ea vrea să închidă mica sa afacere.","english":"She wants to wind up her small business.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735381"}],"stories":[{"id":"story-ro-povestea-lui-harap-alb","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Amu cică era odată într-o ţară un crai, care avea trei feciori. Şi craiul acela mai avea un frate mai mare, care era împărat într-o altă ţară, mai depărtată. Şi împăratul, fratele craiului, se numea Verde-împărat; şi împăratul Verde nu avea feciori, ci numai fete."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
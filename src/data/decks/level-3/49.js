@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136545","romanian":"Fundul oceanului este studiat de câţiva oameni de știință.","english":"The ocean floor is being studied by some scientists.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965763"},{"id":"tat-1137004","romanian":"Stați acolo!","english":"Stay there!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952937"},{"id":"tat-1185126","romanian":"Nu mă bag.","english":"I am not getting involved.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323861"},{"id":"tat-399606","romanian":"Mulțumesc!","english":"Thank you!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323391"},{"id":"tat-1136353","romanian":"Sunteți din Urumqi?","english":"Are you from Urumqi?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963175"},{"id":"tat-408053","romanian":"Am discutat deja cu studentul acesta.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232112"},{"id":"tat-1143279","romanian":"Există o limită de două bagaje pentru fiecare pasager.","english":"There is a limit of two pieces of luggage for each passenger.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068665"},{"id":"tat-1147450","romanian":"Ce vârstă aveți?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094234"},{"id":"tat-1136737","romanian":"S-a dus în Italia cu gândul să studieze literatura.","english":"He went to Italy with a view to studying literature.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966251"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-705814","romanian":"El mănâncă mult.","english":"He eats a lot.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963908"},{"id":"tat-584785","romanian":"Seara el iese în oraș să bea ceva.","english":"At night he goes out in the city to drink something.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812845"},{"id":"tat-1136628","romanian":"Mi-am pierdut umbrela.","english":"I have lost my umbrella.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227193"},{"id":"tat-1143217","romanian":"Acum am nevoie de o asistentă medicală.","english":"I need a nurse now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070009"},{"id":"tat-411912","romanian":"Merg la film dacă am timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272128"},{"id":"tat-406815","romanian":"Cum vă numiți?","english":"What is your name?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347334"},{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-1136757","romanian":"A răspuns cu nici pe departe un surâs.","english":"She answered with hardly a smile.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966223"},{"id":"tat-706020","romanian":"Formează câte o propoziție cu fiecare dintre aceste cuvinte.","english":"Make a sentence with each of these words.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968869"},{"id":"tat-698940","romanian":"Acest roman mă plictisește.","english":"This novel bores me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2233781"}],"stories":[{"id":"story-ro-z-na-z-nelor-2","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Se duse şi cel mijlociu şi se întoarse şi el cu o soţioară mândră şi frumoasă. Se duse şi cel mic. Cutreieră lumea până ce ajunse la pădurea cea mare unde se lăsase săgeata lui. Bâjbâi el şi orbăcăi p-acolo prin bunget, până ce dete de copaciul în care se înfipsese şi săgeata lui."},{"id":"story-ro-inul-i-c-me-a-2","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":219,"excerpt":"Tortul l-au depănat pe râşchitor, spre a-l face căleap; călepele s-au fert cu leşie, să se înălbească, apoi te-au pus pe vârtelniţă, de pe care au început a le depăna pe mosoare cu letca; de pe mosoare te-au urzit pe urzoi, apoi te-au luat şi te-au învălit pe sulul de dinapoi, punând vergele pintre pături, ca să nu se hrentuiască urzala; şi fuscei pintre rost, ca să nu se încâlcească natra."},{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
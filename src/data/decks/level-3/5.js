@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-399604","romanian":"Vorbiți engleză?","english":"Can you speak English?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323247"},{"id":"tat-1136962","romanian":"Mi-ar plăcea să îmi cunoști părinții.","english":"I would like you to meet my parents.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956302"},{"id":"tat-923905","romanian":"Trebuie să găsesc un apartament de închiriat în Barcelona.","english":"I need to find a flat to rent in Barcelona.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/626893"},{"id":"tat-1136531","romanian":"S-a îmbrăcat cu jacheta roșie.","english":"He put on the red jacket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965117"},{"id":"tat-406002","romanian":"Astăzi vremea e frumoasă.","english":"Today the weather is nice.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350319"},{"id":"tat-1168697","romanian":"Am auzit muzica.","english":"I heard the music.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12220460"},{"id":"tat-408063","romanian":"Avem aceleași intenții, dar nu același mod de operare.","english":"We have the same intentions, but not the same modus operandi.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232774"},{"id":"tat-1064423","romanian":"Știu că el se uită la mine.","english":"I know he is watching me.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076332"},{"id":"tat-1143248","romanian":"Tom a mâncat un castron cu supă de scoici.","english":"Tom ate a bowl of clam chowder.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068554"},{"id":"tat-1143269","romanian":"Oamenii sunt în echipă.","english":"The people are on the team.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068650"},{"id":"tat-1201124","romanian":"Îmi place Cathy.","english":"I am fond of Cathy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12023720"},{"id":"tat-1185061","romanian":"Frânghia e foarte slabă.","english":"The string is very weak.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12319365"},{"id":"tat-1153871","romanian":"Voi face tot ce îmi stă în putere.","english":"I will do everything in my power.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099026"},{"id":"tat-1059516","romanian":"Salut.","english":"Hello!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10834674"},{"id":"tat-923822","romanian":"Astăzi profesorul a ales ca subiect \"cultura chinezească\".","english":"Today the teacher chose \"Chinese culture\" as a topic.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10433149"},{"id":"tat-1142946","romanian":"Ești ocupat mâine?","english":"Are you engaged for tomorrow?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066837"},{"id":"tat-476863","romanian":"Te rugăm să fii politicos.","english":"Please be polite.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5601925"},{"id":"tat-1136848","romanian":"Mă întreb cine înoată cel mai repede.","english":"I wonder who can swim fastest.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966289"},{"id":"tat-1059700","romanian":"Sper să merg în Canada anul viitor.","english":"I hope to go to Canada next year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795786"},{"id":"tat-1142921","romanian":"Strada este deteriorată.","english":"The road is damaged.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066444"}],"stories":[{"id":"story-ro-coto-man-n-zdr-vanu","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată o pereche de oameni. Ei n-aveau copii. Într-o zi, fiind cu voie bună, zise bărbatul către femeie: Poveşti de Petre Ispirescu - Cotoşman năzdrăvanu – Soro, de la mila lui Dumnezeu noi n-avem copii. Să mergem pe câmp şi ce vom găsi, aceea să ne fie copil. – Bine zici dumneata, frate."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-3","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Şi dintr-acel minut, nu ştiu ce făcea el, nu ştiu ce dregea, că se pomenea, fără voia lui, trecând pe la curtea împărătească, ia aşa, numai ca să treacă. El îşi uitase de peşte."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
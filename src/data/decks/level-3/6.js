@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-1136917","romanian":"Arăți altfel azi.","english":"You look different today.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960464"},{"id":"tat-399599","romanian":"Vorbiți japoneză?","english":"Do you speak Japanese?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6319340"},{"id":"tat-1185075","romanian":"Îi va lua mult să-și revină?","english":"Will it take long to recover?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321365"},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-689399","romanian":"Crăciun fericit!","english":"Merry Christmas!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1781709"},{"id":"tat-411966","romanian":"Am văzut-o pe Dana.","english":"I saw Dana.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272314"},{"id":"tat-709911","romanian":"John a depus mărturie în ceea ce îl priveşte.","english":"John testified concerning him.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426745"},{"id":"tat-399624","romanian":"Bună, ce faci?","english":"Hello, how are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6363145"},{"id":"tat-698918","romanian":"Nu are nimic a face cu mine.","english":"That has nothing to do with me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1802122"},{"id":"tat-1185182","romanian":"Și-a afirmat inocența.","english":"He affirmed his innocence.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324346"},{"id":"tat-1192844","romanian":"Sunt o mulțime de cărți în camera lui.","english":"There are a lot of books in his room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361457"},{"id":"tat-20","romanian":"Vorbesti engleza?","english":"Do you speak English?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-862770","romanian":"Bunicului meu ii place sa meargă.","english":"My grandfather likes to walk.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014569"},{"id":"tat-584349","romanian":"Nu lăsa pe mâine ce poţi face poimâine.","english":"Never put off until tomorrow what you can do the day after tomorrow.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798076"},{"id":"tat-1153798","romanian":"Indiferent de ce joacă pe ecran, Tom arată grozav.","english":"No matter what he plays on the screen, Tom looks great.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128804"},{"id":"tat-1136717","romanian":"Porecla mea este \"Itch\".","english":"I go by the nickname \"Itch.\"","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239594"},{"id":"tat-1059506","romanian":"A venit să ne vadă ieri.","english":"She came to see us yesterday.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8577246"},{"id":"tat-1136599","romanian":"Te rog să-mi răspunzi fără întârziere.","english":"Please write me a reply soon.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966022"},{"id":"tat-862837","romanian":"Trebuie sa mă gîndesc.","english":"I have to think about it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014517"},{"id":"tat-1153778","romanian":"Paradoxal, are dreptate.","english":"Paradoxically, he is right.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128544"}],"stories":[{"id":"story-ro-norocul-dracului","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Ba e noroc! Poveşti de Barbu Ştefănescu Delavrancea - Norocul dracului – Ba nu e noroc! – Ba e noroc, muiere! – Ba nu e, mă omule, nu! – Adică, nu muncesc eu, femeie? – Ba munceşti pentru unul, şi noi suntem opt guri, şi cu Plăviţa, nouă."},{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-ro-amintiri-din-copil-rie-i","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":223,"excerpt":"Stau câteodată şi-mi aduc aminte ce vremi şi ce oameni mai erau în părţile noastre pe când începusem şi eu, drăgăliţă-Doamne, a mă ridica băieţaş la casa părinţilor mei, în satul Humuleşti, din târg drept peste apa Neamţului; sat mare şi vesel, împărţit în trei părţi, care se ţin tot de una: Vatra satului, Delenii şi Bejenii."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
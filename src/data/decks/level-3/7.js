@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-709040","romanian":"Cu excepţia câtorva greşeli, compunerea ta este perfectă.","english":"Your composition is perfect except for a few mistakes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420329"},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-13","romanian":"Buna seara!","english":"Good evening!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327229"},{"id":"tat-610804","romanian":"După nașterea copilului trebuie să lucrezi jumătate de normă.","english":"After the birth of your child, you should make your work part-time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/614825"},{"id":"tat-1192774","romanian":"Tom putea cu greu să suporte durerea.","english":"Tom could hardly stand the pain.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364284"},{"id":"tat-1064411","romanian":"Îmi aduc aminte de ce a spus el.","english":"I remember what he said.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075722"},{"id":"tat-1059492","romanian":"Mi s-a ondulat părul.","english":"My hair got kinky.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10767713"},{"id":"tat-1192699","romanian":"Ne bucurăm că vii.","english":"We are glad you are coming.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/853963"},{"id":"tat-448206","romanian":"Fraților!","english":"My brothers!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3864978"},{"id":"tat-30","romanian":"Unde locuiesti?","english":"Where do you live?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-1064368","romanian":"Tom și Mary au devenit foarte buni prieteni.","english":"Tom and Mary became very good friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074336"},{"id":"tat-670630","romanian":"Probabil, dar el vrea ca să renunţ dintr-odată.","english":"Maybe, but he wants me to stop cold turkey.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1628320"},{"id":"tat-1153165","romanian":"Le-am spus să-mi trimită un alt bilet.","english":"I told them to send me another ticket.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1764648"},{"id":"tat-1136710","romanian":"Nimic nou sub soare.","english":"Nothing new under the sun.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212823"},{"id":"tat-1186855","romanian":"Acceptați American Express?","english":"Do you accept AMEX?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338199"},{"id":"tat-1136550","romanian":"M-am consultat cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964969"},{"id":"tat-1136877","romanian":"Trebuie să ne gândim la comunitate.","english":"We must think about the community.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956374"},{"id":"tat-1091943","romanian":"El nu fumează.","english":"He does not smoke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11591700"},{"id":"tat-1192694","romanian":"Mergi drept înainte până ajungi la biserică.","english":"Go straight ahead until you reach the church.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/678764"},{"id":"tat-475812","romanian":"Lipsește o furculiță.","english":"There is a fork missing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6223472"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."},{"id":"story-ro-fata-cu-pieze-rele","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":260,"excerpt":"A fost odată un împărat. El avea doisprezece feciori. Când se punea la masă, copiii stau împrejuru-i cunună deplină. El era totdauna cu voie-bună, fiindcă vedea că trebile îi merg strună. Poveşti de Petre Ispirescu - Fata cu pieze rele Împăraţii, vecinii lui, râvnea la traiul lui cel ticnit."},{"id":"story-ro-cinci-p-ini","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":256,"excerpt":"Doi oameni, cunoscuţi unul cu altul, călătoreau odată, vara, pe un drum. Unul avea în traista sa trei pâni, şi celalalt două pâni. De la o vreme, fiindu-le foame, poposesc la umbra unei răchiţi pletoase, lângă o fântână cu ciutură, scoate fiecare pânile ce avea şi se pun să mănânce împreună, ca să aibă mai mare poftă de mâncare."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
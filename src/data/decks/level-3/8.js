@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-702194","romanian":"Am mâncat până mi s-a făcut rău.","english":"I ate myself sick.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397911"},{"id":"tat-1136557","romanian":"Ținea la fiul ei.","english":"She cared for her son.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965484"},{"id":"tat-411959","romanian":"O văd pe Dana.","english":"I see Dana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272293"},{"id":"tat-709008","romanian":"Una dintre pisici este neagră, cealaltă este maro.","english":"One of the cats is black, the other is brown.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420282"},{"id":"tat-706044","romanian":"Credeam că era drăguţă.","english":"I thought she was pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969871"},{"id":"tat-1278789","romanian":"Voi sunteţi copii.","english":"You are children.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13336351"},{"id":"tat-1153152","romanian":"Nu e un om care să spună o minciună.","english":"He is not a man to tell a lie.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692344"},{"id":"tat-487304","romanian":"El a fost convins să fie mai rezonabil.","english":"He was persuaded to be more sensible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270699"},{"id":"tat-3","romanian":"Da.","english":"Yes.","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1167647"},{"id":"tat-1153780","romanian":"Pari să te gândești la altceva.","english":"You seem to be thinking of something else.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128559"},{"id":"tat-1136846","romanian":"Tom voia un creion cu mină moale.","english":"Tom wanted a pencil with a softer lead.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966269"},{"id":"tat-1144039","romanian":"Îți pot folosi mașina, tată?","english":"May I use your car, Dad?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072667"},{"id":"tat-1195255","romanian":"Acest televizor e greu.","english":"This television set is heavy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7175536"},{"id":"tat-1056784","romanian":"Majoritatea copiilor urăsc școala.","english":"Most children hate school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031352"},{"id":"tat-1143232","romanian":"Fă-o!","english":"Do it!","difficulty":1,"wordCount":1,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068477"},{"id":"tat-584070","romanian":"Nu a fost deloc recunoscător fostului său profesor.","english":"He was not at all thankful to his former teacher.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262775"},{"id":"tat-1143262","romanian":"A profitat de ignoranța mea și m-a înșelat.","english":"He took advantage of my ignorance and deceived me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068634"},{"id":"tat-1163912","romanian":"Tom e cu zece livre mai greu decât Jack.","english":"Tom is ten pounds heavier than Jack.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197016"},{"id":"tat-706124","romanian":"Nu avea nicio intenţie să aştepte trei ore.","english":"He had no intention of waiting for three hours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/973116"},{"id":"tat-1136849","romanian":"Cât de adânc este lacul?","english":"How deep is the lake?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966273"}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-3","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"Tată-său, deznădăjduit, pusese în gând să-l taie; dar fiul său cel mic, Prâslea, veni cu rugăciune către tată-său, şi-i zise: – Tată, atâţia ani l-ai ţinut, ai suferit atâtea necazuri după urma acestui pom, mai lasă-l, rogu-te, şi anul acesta, să-mi încerc şi eu norocul. – Fugi d-aci, nesocotitule, zise împăratul."},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":3,"sentences":[{"id":"tat-406035","romanian":"Îți plăcea să mergi la expoziții în România?","english":"Did you enjoy going to exhibits in Romania?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350460"},{"id":"tat-1143613","romanian":"Îmi place ciocolata.","english":"I like chocolate.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071626"},{"id":"tat-864480","romanian":"Noi îi spunem Goro-san.","english":"We call him Goro-san.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817805"},{"id":"tat-411927","romanian":"În weekend am mult de spălat.","english":"Over the weekend I have a lot to wash.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272185"},{"id":"tat-1142940","romanian":"Cine e în spatele intrigii?","english":"Who is behind the plot?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066756"},{"id":"tat-1136674","romanian":"Te voi ajuta dacă este posibil.","english":"I will help you if possible.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239621"},{"id":"tat-1119703","romanian":"Vorbești ebraica?","english":"Do you speak Hebrew?","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342578"},{"id":"tat-1059643","romanian":"S-a întins pe pat.","english":"He laid himself on the bed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758837"},{"id":"tat-1144718","romanian":"Capitala Albaniei este Tirana.","english":"The capital city of Albania is called Tirana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076581"},{"id":"tat-698951","romanian":"Am 2 frați.","english":"I have two brothers.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2817943"},{"id":"tat-1136909","romanian":"Articolul 6. Președintele va conduce toate întâlnirile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960211"},{"id":"tat-487287","romanian":"Ei îi place foarte mult școala sa.","english":"She likes her school a lot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270501"},{"id":"tat-705997","romanian":"Ai avut un weekend plăcut?","english":"Did you have a good weekend?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968585"},{"id":"tat-709895","romanian":"Şi-a ţinut respiraţia.","english":"He held his breath.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426687"},{"id":"tat-1136386","romanian":"Vestea despre moartea lui s-a răspândit în jur.","english":"The news of his death spread around.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962818"},{"id":"tat-1059667","romanian":"Era văzut ca un om învățat în comunitatea noastră.","english":"He passed for a learned man in our community.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11028998"},{"id":"tat-708932","romanian":"Cred că am o carie.","english":"I think I have a cavity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398620"},{"id":"tat-1185249","romanian":"Un măr pe zi ține doctorul departe.","english":"An apple a day keeps the doctor away.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324562"},{"id":"tat-1119725","romanian":"Dragostea e de rahat.","english":"Love sucks.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265056"},{"id":"tat-1137004","romanian":"Stați acolo!","english":"Stay there!","difficulty":1,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952937"}],"stories":[{"id":"story-ro-pas-rea-m-iastr","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat evlavios şi bun. El avea trei feciori. Pe lângă multe bunătăţi ce făcuse oamenilor din împărăţia lui, a ridicat şi o monastire de care să se ducă pomina. A împodobit-o cu aur, cu pietre nestemate şi cu tot ceea ce meşterii din acea ţară au socotit mai scump şi mai frumos."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-george-cel-viteaz-2","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"Balaurul, văzând una ca aceasta, se repezi şi el asupra împărătesei. Dar împărăteasa dete un ţipet şi se deşteptă. Îi sărise inima de frică şi-i tremurau toate cărnurile. P-aci, p-aci era să şi leşine. Spuse împăratului pocitania de vis, şi rămase şi el înmărmurit de groază."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
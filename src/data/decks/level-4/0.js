@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-670694","romanian":"Poţi alege orice.","english":"You may choose what you like.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200802"},{"id":"tat-1185064","romanian":"Mi-a așteptat răspunsul.","english":"She waited for my reply.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320611"},{"id":"tat-1136653","romanian":"Mi-a luat mult timp până mi-a trecut răceala.","english":"It took me a long time to get over my cold.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966141"},{"id":"tat-1185109","romanian":"Toți vom muri mai devreme sau mai târziu.","english":"We all shall die sooner or later.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195149"},{"id":"tat-1136543","romanian":"Avea șosetele pe dos.","english":"He had his socks on inside out.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965326"},{"id":"tat-1136663","romanian":"Casa a luat foc.","english":"The house caught fire.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966118"},{"id":"tat-1153850","romanian":"Vreau un masaj. Am nevoie să mă relaxez.","english":"I want a massage. I need to relax.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130110"},{"id":"tat-1136651","romanian":"Această propoziție este la prezentul perfect sau trecutul simplu?","english":"Is this sentence in the present perfect or simple past?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239828"},{"id":"tat-1136266","romanian":"Barca era legată cu o parâmă scurtă.","english":"The boat was tied with a short line.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964628"},{"id":"tat-708929","romanian":"Juan se îmbracă.","english":"Juan is getting dressed.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398353"},{"id":"tat-1136989","romanian":"Are acces la informația înmagazinată.","english":"He has access to the stored information.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952879"},{"id":"tat-1192816","romanian":"Yenul e încă scăzut în raport cu dolarul.","english":"The yen is still low against the dollar.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356233"},{"id":"tat-670678","romanian":"Poţi s-o alegi pe care o vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200736"},{"id":"tat-1186849","romanian":"Notele sunt importante, dar nu sunt totul.","english":"Grades are important, but they are not everything.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338192"},{"id":"tat-712091","romanian":"De cât timp stă Ken în Kobe?","english":"How long has Ken lived in Kobe?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440065"},{"id":"tat-1147397","romanian":"Vorbesc fluent portugheza.","english":"I speak Portuguese fluently.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12092941"},{"id":"tat-1142891","romanian":"Cât e ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065971"},{"id":"tat-1143601","romanian":"Îmi place tenisul.","english":"I like tennis.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071543"},{"id":"tat-1136550","romanian":"M-am consultat cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964969"},{"id":"tat-709935","romanian":"Sărăcia este o povară, dar nu o ruşine.","english":"Poverty is a pain, but no disgrace.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5915496"}],"stories":[{"id":"story-ro-ho-u-mp-rat-3","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":216,"excerpt":"De aceea, fătul meu, te-am dat să înveţi toate meşteşugurile. Nu mi-a venit în gând că şi hoţia este un meşteşug. Aceasta îţi rămâne să mai înveţi, după care te vei face un împărat ca Solomon împărat şi cum altul nu va mai fi pe lume. – Ii!"},{"id":"story-ro-departe-departe-3","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":210,"excerpt":"Şi când mi se păru că palatul se şterge de pe faţa pământului, o rupsei la fugă îndărăt, căci ce m-aş fi făcut în aşa pustietate? Şi de ce goneam, de ce palatul se ridica uşor din grădinile fumurii. Lacul e roşu ca sângele. Apune soarele. Mă rezemai de-o salcie scorburoasă şi începui să mă gândesc. Mi-e foame."},{"id":"story-ro-broasca-estoas-cea-fermecat-2","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":230,"excerpt":"Luă şi dânsul nişte haine, numai să nu zică nescine că nu s-a gătit, şi de cheltuială ce pe apă nu curge, şi plecă şi el, ştii, cam în dorul lelii. Dară unde să se ducă? Nici el, iacă, nu ştia."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-2","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Încă fiind acolo, văzu cum înfloreşte pomul, cum îi cade florile şi cum roadele se arată iarăşi. Atunci îi mai veni inima la loc şi se mulţumi a aştepta până a doua zi. în ziua următoare, ia merele de unde nu e. S-a supărat împăratul, nevoie mare, şi porunci ca paznici să se uite să prinză pe hoţi. Dară aşi!"}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-709008","romanian":"Una dintre pisici este neagră, cealaltă este maro.","english":"One of the cats is black, the other is brown.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420282"},{"id":"tat-1278911","romanian":"Sunt pregătit să te ajut.","english":"I am ready to help you.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13347606"},{"id":"tat-1143226","romanian":"Vreau trei bucăți de zahăr în laptele meu.","english":"I want three sugars in my milk.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068445"},{"id":"tat-1136858","romanian":"Era cât pe ce să explodeze, dar s-a stăpânit.","english":"He was about to explode, but checked himself.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966284"},{"id":"tat-399624","romanian":"Bună, ce faci?","english":"Hello, how are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6363145"},{"id":"tat-19","romanian":"Cat costa?","english":"How much does it cost?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2513878"},{"id":"tat-1200897","romanian":"Am venit, am văzut, am cucerit.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11216029"},{"id":"tat-1153892","romanian":"A spus-o din amabilitate.","english":"He did it out of kindness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104038"},{"id":"tat-1278789","romanian":"Voi sunteţi copii.","english":"You are children.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13336351"},{"id":"tat-1201124","romanian":"Îmi place Cathy.","english":"I am fond of Cathy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12023720"},{"id":"tat-1192738","romanian":"Compunerea ta nu este în întregime rea.","english":"Your composition is not altogether bad.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7509671"},{"id":"tat-705790","romanian":"Domnul Suzuki nu este dentist, ci medic.","english":"Mr Suzuki is not a dentist but a physician.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963131"},{"id":"tat-1136841","romanian":"Conducătorii de autobuze vor face grevă astăzi.","english":"The bus drivers are going on strike today.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966685"},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-1279104","romanian":"Asta e mai frumoasă.","english":"This one is more beautiful.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13113773"},{"id":"tat-1144296","romanian":"Fără el, aș fi neajutorată.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073249"},{"id":"tat-1142931","romanian":"Am început cu doi tovarăși de călătorie.","english":"I started with two traveling companions.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066641"},{"id":"tat-1153789","romanian":"L-am găsit pe băiat deja adormit.","english":"I found the boy fast asleep.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128663"},{"id":"tat-986499","romanian":"Puteți folosi dicționarul meu.","english":"You may use my dictionary.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637140"}],"stories":[{"id":"story-ro-bunicul-2","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"– Da. – Tată-moşule, aş vrea să-mi crească şi mie aripi şi să zbor sus de tot, până în slava cerului, zise băiatul netezindu-i barba. – Dacă ţi-o creşte ţie aripi, zise fata, mie să-mi prinzi o presură şi un sticlete. – Da… hî… hî… poi ce fel… şi mie? Fata se întristă."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-3","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Era o vâlcea împodobită cu fel de fel de floricele, toate înflorite, de părea că dă ghes omului să treacă printre ele."},{"id":"story-ro-sarea-n-bucate-2","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Împăratul se bucură cât un lucru mare când auzi de la fetele lui cele mai mari cât îl iubesc. El socoti că altfel de iubire nu poate să fie decât cea dulce ca mierea şi ca zahărul."},{"id":"story-ro-z-na-zorilor-2","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Cu totul alta era Costan: mic la statură, îndesat la făptură, cu braţul de bărbat, cu pumnul îndesat. Al treilea şi cel mai tânăr fecior al împăratului e Petru: înalt, dar subţire, mai mult fată decât fecior. Petru nu face multă vorbă: el râde şi cântă, cântă şi râde de dimineaţă până în seară."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
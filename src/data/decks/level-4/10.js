@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136532","romanian":"Profesorul ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960883"},{"id":"tat-1136353","romanian":"Sunteți din Urumqi?","english":"Are you from Urumqi?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963175"},{"id":"tat-709913","romanian":"M-am împiedicat de o piatră scrântindu-mi glezna.","english":"I tripped on a stone, twisting my ankle.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426746"},{"id":"tat-1192832","romanian":"Era consumată de ambiție.","english":"She was consumed with ambition.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360676"},{"id":"tat-1136789","romanian":"Fata s-a antrenat la paralele.","english":"The girl exercised on the parallel bars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966214"},{"id":"tat-862770","romanian":"Bunicului meu ii place sa meargă.","english":"My grandfather likes to walk.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014569"},{"id":"tat-399615","romanian":"Noapte bună, mamă.","english":"Good night, Mom.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327701"},{"id":"tat-1143243","romanian":"Te-a așteptat două ore.","english":"She waited for you for two hours.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068548"},{"id":"tat-702062","romanian":"Călătoria lor a fost amânată din cauza ploii.","english":"Their trip was postponed because of the rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398899"},{"id":"tat-584798","romanian":"Mă dor picioarele.","english":"My feet hurt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813828"},{"id":"tat-1142947","romanian":"Am nevoie de stilouri, caiete și altele.","english":"I need pens, notebooks and so on.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12067969"},{"id":"tat-1192766","romanian":"Acesta este stiloul cu care a scris faimosul romancier.","english":"This is the pen which the famous novelist wrote with.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357144"},{"id":"tat-584851","romanian":"Când a fost tânăr, a muncit cu sârguinţă.","english":"When he was young, he was a hard worker.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812437"},{"id":"tat-1136720","romanian":"I-a pus imaginea în palmă.","english":"She put the picture back in his hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7222279"},{"id":"tat-1159808","romanian":"Pune ouăle în frigider.","english":"Put the eggs in the refrigerator.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168184"},{"id":"tat-706134","romanian":"Lui Robert i se spune \"Bob\".","english":"They call Robert \"Bob\".","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974457"},{"id":"tat-1278889","romanian":"Nu a fost permis nimănui să părăsească camera.","english":"Nobody was allowed to leave the room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13345377"},{"id":"tat-1064317","romanian":"Mary este foarte drăguță.","english":"Mary is very pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045042"},{"id":"tat-1143236","romanian":"Jimmy e cu doi ani mai mic ca mine.","english":"Jimmy is junior to me by two years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068493"},{"id":"tat-863630","romanian":"Trebuie să îmi fac o asigurare de sănătate.","english":"I need to purchase health insurance.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9133595"}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-comoara-3","title":"Comoara","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"- Dar Ghiță ce face? Întrebă iar Duțu, zâmbind pe sub mustață. - E bine și el! răspunse Ana, care nu înțelegea nici acum batjocura. Au înțeles-o însă vecinii, și peste puțin, așa-i răutatea omenească, sătenii nu-i mai ziceau lui Ghiță, ca mai nainte, Ghiță al Popii, ci Ghiță al Boilor."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."},{"id":"story-ro-greuceanu-3","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Această izbândă o luă drept semn bun, şi Greuceanu, mergând a doua oară la împăratul, grăi cu cuvintele lui mieroase cele următoare: – Mărite doamne, să trăieşti întru mulţi ani pe luminatul scaunul acestei împărăţii."},{"id":"story-ro-porcul-cel-fermecat-3","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"uşa se deschise. Fetele intrară. Când colo, ce să vază? Casa n-avea nici o podoabă; dară în mijloc era o masă o masă mare cu un covor scump pe dânsa, şi deasupra o carte mare deschisă. Fetele, nerăbdătoare, voiră a şti ce zicea în cartea aceea."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
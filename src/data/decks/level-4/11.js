@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1153756","romanian":"Trebuie să-mi clătesc gura.","english":"I need to rinse my mouth.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4660319"},{"id":"tat-1136691","romanian":"L-am văzut oprindu-se.","english":"I observed him stop.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221903"},{"id":"tat-1143140","romanian":"A depus banii din premiu la bancă.","english":"He deposited the prize money in the bank.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068919"},{"id":"tat-1200899","romanian":"Am plâns și am crezut.","english":"I wept and I believed.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11229733"},{"id":"tat-1136758","romanian":"N-am văzut nici măcar un meci.","english":"We did not see a single game.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966190"},{"id":"tat-699683","romanian":"Mi-e dor de tine.","english":"I miss you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323633"},{"id":"tat-1144707","romanian":"Capitala Olandei este Amsterdam.","english":"The capital city of the Netherlands is Amsterdam.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076528"},{"id":"tat-1136549","romanian":"M-am sfătuit cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958681"},{"id":"tat-487282","romanian":"Am accentuat ideea.","english":"I stressed the point.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270459"},{"id":"tat-1192804","romanian":"Ken nu a fost aici de astă dimineață.","english":"Ken has not been here since this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353836"},{"id":"tat-1136590","romanian":"Prăbușindu-se pe jos, a izbucnit în lacrimi.","english":"On falling down, she burst into tears.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965952"},{"id":"tat-708939","romanian":"Preţurile vor fi din ce în ce mai mari.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398956"},{"id":"tat-698950","romanian":"Aceasta este mama mea.","english":"This is my mother.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2736139"},{"id":"tat-1136888","romanian":"Era la locul crimei.","english":"She was on the scene of the crime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966017"},{"id":"tat-1143124","romanian":"Sper că îmi vei răspunde în curând.","english":"I hope you will answer me soon.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068819"},{"id":"tat-863666","romanian":"Unde crezi că se duc toți banii?","english":"Where do you think all the money goes?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9145912"},{"id":"tat-1147446","romanian":"Astăzi am curs de esperanto.","english":"Today I have an Esperanto class.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094147"},{"id":"tat-1136533","romanian":"Profesoara ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965168"},{"id":"tat-702068","romanian":"Îmi place să călătoresc.","english":"I like traveling.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-1186855","romanian":"Acceptați American Express?","english":"Do you accept AMEX?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338199"}],"stories":[{"id":"story-ro-pravoslavnicul-i-sl-ninile-2","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":206,"excerpt":"La urmă, românul, mulţumit, vroi să dea câteva bucăţi de carne pravoslavnicului. Bătrânul îşi făcu cruce, se cutremură şi cu nici un preţ nu voi să primească, zicând c-un glas de mucenic: – Lasă, lasă, omul lui Dumnezeu, că pentru Dumnezeu am muncit. Ei, dar cine-mi fusese omul cu crucile!"},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."},{"id":"story-ro-uer","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"La răspântia căilor singuratice, unde călătorul e minune şi glasul omului poveste, o colibă, dusă pe jumătate în pământ, stă locului neclintită. Poveşti de Barbu Ştefănescu Delavrancea - Şuer Stăpânul lumii e vântul, şi aruncă, ca în bătătură la el, clăi de nori posomorâţi peste întinsul cerului."},{"id":"story-ro-coto-man-n-zdr-vanu-3","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Nu mult după aceasta, femeia se simţi îngreunată. Atunci să fi văzut bucurie pe casnici, încât nu-i ţinea pământul. Iară când fu la facere, născu un copilaş gras şi frumos şi sănătos. Crescu copilul şi se făcu mare. Nu se despărţea de pisoi nici cât ai da în cremene. Amândoi se jucau, amândoi mâncau la masă, amândoi se culcau."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-2","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":232,"excerpt":"Se miră şi femeia lui, căci nici ea nu mai văzuse un astfel de ou. Nu ştiau cum să umble mai binişor cu dânsul, ca să nu-l scape jos să se spargă. Unul zicea ca să-l coacă în spuză şi să mănânce toţi dintr-însul; altul zicea ca să-l fiarbă; altul zicea ca să-l păstreze."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
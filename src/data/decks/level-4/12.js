@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-408063","romanian":"Avem aceleași intenții, dar nu același mod de operare.","english":"We have the same intentions, but not the same modus operandi.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232774"},{"id":"tat-706147","romanian":"A trecut frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974726"},{"id":"tat-406042","romanian":"La început vă displăcuse ideea, dar acum păreți mulțumiți.","english":"At the beginning you had disliked the idea, but now you seem to be content.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350487"},{"id":"tat-583918","romanian":"Am o durere de cap teribilă.","english":"I have a bad headache.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798048"},{"id":"tat-1064248","romanian":"Tom nu se sperie aproape niciodată.","english":"Tom almost never gets scared.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073108"},{"id":"tat-599089","romanian":"Numele tău se află în capul listei.","english":"Your name stands first in the list.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1447346"},{"id":"tat-923852","romanian":"Cea mai bună prietenă a mea Felicja este aici.","english":"My best friend Felicja is here.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442763"},{"id":"tat-1153869","romanian":"Stai nemișcat pentru o clipă, te rog.","english":"Hold still for a moment, please.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098378"},{"id":"tat-1153793","romanian":"Voi lua o cină cu un prieten.","english":"I am going to eat an evening meal with a friend.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128725"},{"id":"tat-1163888","romanian":"Astăzi este foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196786"},{"id":"tat-862829","romanian":"Încă mai aștept să-mi spună ce s-a întîmplat.","english":"I am still waiting to be told what happened.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014507"},{"id":"tat-709012","romanian":"Doriţi un loc la fereastră?","english":"Would you like a window seat?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420287"},{"id":"tat-925175","romanian":"Plouă dar pentru cât plouă, plouă puţin.","english":"It rains, but for what it does rain, it rains little.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527273"},{"id":"tat-1159850","romanian":"Azi e foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168080"},{"id":"tat-1136757","romanian":"A răspuns cu nici pe departe un surâs.","english":"She answered with hardly a smile.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966223"},{"id":"tat-411966","romanian":"Am văzut-o pe Dana.","english":"I saw Dana.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272314"},{"id":"tat-705814","romanian":"El mănâncă mult.","english":"He eats a lot.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963908"},{"id":"tat-1117472","romanian":"Ea este puternică.","english":"She is strong.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11817460"},{"id":"tat-709013","romanian":"Câte mere vrei?","english":"How many apples do you want?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420288"},{"id":"tat-584010","romanian":"Mi-am pierdut codul pin!","english":"I forgot my PIN number!","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7801864"}],"stories":[{"id":"story-ro-z-na-mun-ilor-3","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Cum se duse turturica, simţi, nu ştiu cum, nu ştiu de ce, că îi tâcâia inima. După ce se întoarse acasă, era tot cm galeş. Împăratul văzând că tânjeşte fiu-său cu sănătatea, îl întrebă ce are, iară el răspunse că n-are nimic. Turturica aceea era Zâna Munţilor care se îndrăgostise de frumuseţea lui."},{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."},{"id":"story-ro-norocul-dracului","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Ba e noroc! Poveşti de Barbu Ştefănescu Delavrancea - Norocul dracului – Ba nu e noroc! – Ba e noroc, muiere! – Ba nu e, mă omule, nu! – Adică, nu muncesc eu, femeie? – Ba munceşti pentru unul, şi noi suntem opt guri, şi cu Plăviţa, nouă."},{"id":"story-ro-poveste-r-neasc-2","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Dară feciorul cel mic al împăratului nici nu voi să asculte de unele ca acestea, ci zise: – Duce-mă-voi singur, căci trebuie să fi ştiut tata ce zice, când ne-a poruncit să păzim câte unul singur. Şi astfel, cum veni seara, se duse la locul de pândă."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":222,"excerpt":"A fost odată ca niciodată; că de n-ar fi, nu s-ar mai povesti; de când făcea plopşorul pere şi răchita micşunele; de când se băteau urşii în coade; de când se luau de gât lupii cu mieii de se sărutau, înfrăţindu-se; de când se potcovea puricele la un picior cu nouăzeci şi nouă de oca de fier şi s-arunca în slava cerului de ne aducea poveşti; Poveşti de Petre Ispirescu - Tinereţe fără bătrâneţe şi viaţă fără de moarte De când se scria musca pe părete, Mai mincinos cine nu crede."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
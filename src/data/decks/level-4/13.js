@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1185158","romanian":"Trebuie să studiez.","english":"I need to study.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324156"},{"id":"tat-1090185","romanian":"E fratele meu.","english":"He is my brother.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1996614"},{"id":"tat-698920","romanian":"Îți place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1837147"},{"id":"tat-1136707","romanian":"Amândoi și-au mâncat ciocolatele până la ultima îmbucătură.","english":"They both ate their chocolates down to the very last bite.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226212"},{"id":"tat-1143186","romanian":"E ciudat că ar trebui să eșuezi.","english":"It is strange that you should fail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069265"},{"id":"tat-1136674","romanian":"Te voi ajuta dacă este posibil.","english":"I will help you if possible.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239621"},{"id":"tat-1136387","romanian":"Fără gravitație, am fi aruncați în spațiu.","english":"Without gravity we would be hurled off into space.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962828"},{"id":"tat-487300","romanian":"Înțelepciunea nu vine în mod automat cu vârsta.","english":"Wisdom does not automatically come with age.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270672"},{"id":"tat-698941","romanian":"Cum se numește acest râu?","english":"What is the name of this river?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2265424"},{"id":"tat-1059700","romanian":"Sper să merg în Canada anul viitor.","english":"I hope to go to Canada next year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795786"},{"id":"tat-862380","romanian":"Am amânat evenimentul.","english":"We postponed the event.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9459071"},{"id":"tat-584004","romanian":"Ea și prietenii ei sunt înnebuniți după muzica.","english":"She and her friends are mad about music.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7117050"},{"id":"tat-584803","romanian":"Fata își spălă părul.","english":"The girl washed her hair.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7813833"},{"id":"tat-408049","romanian":"Studentul acesta este american.","english":"This student is American.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6220864"},{"id":"tat-862342","romanian":"John a avut o ceartă violentă cu soția sa.","english":"John had a violent quarrel with his wife.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10020874"},{"id":"tat-1136580","romanian":"Calitatea traducerii s-a îmbunătățit.","english":"The quality of translation has improved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966078"},{"id":"tat-1136774","romanian":"- Sunt profesor. - Și eu sunt.","english":"I am a teacher. \"So am I.\"","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966215"},{"id":"tat-487280","romanian":"Am ratat ceva?","english":"Did I miss anything?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270414"},{"id":"tat-1136625","romanian":"În caz de incendiu sunați la 119.","english":"In case of fire, you should dial 119.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966144"},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-ro-cinci-p-ini-3","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Mai dreaptă împărţeală decât aceasta nu cred că se mai poate nici la Dumnezeu sfântul… – Ba nu, prietene, zice cel cu două pâni. Eu nu mă ţin că mi-ai făcut parte dreaptă. Haide să ne judecăm, şi cum a zice judecata, aşa să rămâie. – Haide şi la judecată, zise celălalt, dacă nu te mulţămeşti."},{"id":"story-ro-o-via-pierdut","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Crivățul șuieră și vâjie izbind în toate părțile stropii sloiți. Pereții caselor, geamurile ferestrilor, scoarța copacilor, grădelele de prin prejurul grădinii, toate deopotrivă sunt învăluite cu o lucie coajă de sloi. În grădina bisericii, pe piața de dinaintea ei, pe ulițile ce se varsă din toate părțile, oamenii, unii pe jos, alții cu trăsura, grăbesc la adăpostul călduros."},{"id":"story-ro-porcul-cel-fermecat-2","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Aşa făcură şi le mergea bine. Vicleanul pizmuia pacea fetelor şi-şi vârî coada. – Surioarele mele, zise fata cea mare, câtu-i ziulica de mare toarcem, coasem, citim. Sunt câteva zile de când ne aflăm singure, n-a mai rămas nici un colţ de grădină pe unde să nu ne fi plimbat."},{"id":"story-ro-borta-v-ntului-2","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":213,"excerpt":"– Mă duceam s’ astup borta vântului ş’ am întâlnit un nebun pe drum şi mi-o dat o nucă şi-a zis să nu zic pân’ a casă nucă, deschide-te. Ce-a mai fi şi asta? Femeia omului vicleană. Ia o nucă ‘n mână şi zice: – Ia să-ţi văd nuca. Îi schimbă nuca omului."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136844","romanian":"Voi urma planul tău.","english":"I will go along with your plan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966268"},{"id":"tat-411865","romanian":"Vara mă duc la piscină în fiecare zi.","english":"In the summer I go to the pool every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271951"},{"id":"tat-408085","romanian":"În primul rând, vreau să vă mulțumesc pentru ospitalitate.","english":"First of all, I would like to thank you for your hospitality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232873"},{"id":"tat-1136813","romanian":"Tata și-a ajustat întotdeauna costumele la croitor.","english":"Father always has the tailor make his suits.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966356"},{"id":"tat-399274","romanian":"Bine ai venit!","english":"Welcome.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335259"},{"id":"tat-1185075","romanian":"Îi va lua mult să-și revină?","english":"Will it take long to recover?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321365"},{"id":"tat-1136815","romanian":"O serie de accidente rutiere au avut loc recent.","english":"A number of traffic accidents have happened recently.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966350"},{"id":"tat-863673","romanian":"Cât la sută dintre persoane vorbesc trei limbi străine?","english":"What percentage of the people speak three languages?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9105795"},{"id":"tat-1238705","romanian":"A fugit un bou în pantaloni scurți.","english":"A bull with short trousers has escaped.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5296592"},{"id":"tat-1153754","romanian":"N-am întârziat niciodată la școală mai înainte.","english":"I had never been late for school before.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2639577"},{"id":"tat-1192799","romanian":"Sunt foarte veseli.","english":"They are very cheerful.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351572"},{"id":"tat-699676","romanian":"Te iubesc.","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323350"},{"id":"tat-1143217","romanian":"Acum am nevoie de o asistentă medicală.","english":"I need a nurse now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070009"},{"id":"tat-1136846","romanian":"Tom voia un creion cu mină moale.","english":"Tom wanted a pencil with a softer lead.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966269"},{"id":"tat-1185126","romanian":"Nu mă bag.","english":"I am not getting involved.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323861"},{"id":"tat-1136530","romanian":"A luat o piatră de pe jos.","english":"He picked up a stone.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964787"},{"id":"tat-1136624","romanian":"Fetița a izbucnit în lacrimi.","english":"The young girl burst into tears.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966101"},{"id":"tat-1124701","romanian":"Tortul are un gust dulce.","english":"The cake tastes sweet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11873968"},{"id":"tat-902146","romanian":"Ești o fată drăguță.","english":"You are a pretty girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287426"},{"id":"tat-1136381","romanian":"Salut! Bună dimineața!","english":"Hello! Good morning!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962782"}],"stories":[{"id":"story-ro-fata-babei-i-fata-mo-neagului","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":251,"excerpt":"Erau odată un moşneag şi-o babă; şi moşneagul avea o fată, şi baba iar o fată. Fata babei era slută, leneşă, ţâfnoasă şi rea la inimă; dar, pentru că era fata mamei, se alinta cum s-alintă cioara-n laţ, lăsând tot greul pe fata moşneagului. Fata moşneagului însă era frumoasă, harnică, ascultătoare şi bună la inimă."},{"id":"story-ro-z-na-z-nelor-3","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Mai se suci, mai se învârti să scape de pacoste, şi nu fu nici un chip. Dacă văzu şi văzu, se hotărî şi el a se duce acasă cu saxanaua în spinare şi o luă la drum. În cale, băgă de seamă că alte şase bufniţe se ţineau după dânsul."},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-rodul-tainic-2","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Împăratul nu credea aşa ceva şi l-a chemat pe Danciu la sine. – N-o să fii nici tu în stare să te urci, i-a zis, şi să ştii că, dacă nu te vei putea urca, dau poruncă să-ţi taie capul."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat şi o împărăteasă. Ei aveau trei copii. Mai aveau pe lângă palaturile lor o grădină foarte frumoasă. Şi atât de drag îi era florile acestui împărat, încât însuşi cu multă tragere de inimă le plivea şi îngrijăa de grădină. În fundul acestei grădini crescuse un măr cu totul şi cu totul de aur."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
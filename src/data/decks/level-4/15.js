@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1064424","romanian":"L-am văzut fugind.","english":"I saw him run away.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076207"},{"id":"tat-712090","romanian":"Va trebui să facem ceva.","english":"We will have to do something.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440048"},{"id":"tat-1153886","romanian":"Opinia lor contează puțin.","english":"Their opinion matters little.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12103107"},{"id":"tat-1136671","romanian":"S-a înfășurat în pătură.","english":"She wrapped herself in a blanket.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239804"},{"id":"tat-1136649","romanian":"Vorbește puțin engleza.","english":"He speaks English a little.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966129"},{"id":"tat-1192747","romanian":"Te rog du-te la Departamentul de Chirurgie.","english":"Please go to the Surgery Department.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/289686"},{"id":"tat-1136737","romanian":"S-a dus în Italia cu gândul să studieze literatura.","english":"He went to Italy with a view to studying literature.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966251"},{"id":"tat-708918","romanian":"Ei nu îi plac şerpii şi matematica.","english":"She does not like snakes and mathematics.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397937"},{"id":"tat-1144673","romanian":"Scuzați-mă, vorbiți engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12075958"},{"id":"tat-1136596","romanian":"Mă asigur că judec un om după personalitatea sa.","english":"I make a point of judging a man by his personality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965974"},{"id":"tat-1136919","romanian":"Mike a acționat în calitate de președinte al reuniunii.","english":"Mike acted as chairperson of the meeting.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957760"},{"id":"tat-1136659","romanian":"Nu are mai mult de o sută de cărți.","english":"He has no more than one hundred books.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227583"},{"id":"tat-1153775","romanian":"La ce oră se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1201140","romanian":"E un bun perdant.","english":"He is a good loser.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12422431"},{"id":"tat-1144039","romanian":"Îți pot folosi mașina, tată?","english":"May I use your car, Dad?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072667"},{"id":"tat-1192820","romanian":"Alerg în fiecare zi.","english":"I run every day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356278"},{"id":"tat-923905","romanian":"Trebuie să găsesc un apartament de închiriat în Barcelona.","english":"I need to find a flat to rent in Barcelona.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/626893"},{"id":"tat-1143215","romanian":"Vreau să cumpăr un procesor de text.","english":"I want to buy a word processor.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070006"},{"id":"tat-1192772","romanian":"Ce doriți: ceai sau cafea?","english":"Which do you want, tea or coffee?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364282"},{"id":"tat-706081","romanian":"Când ar trebui să aduc maşina înapoi?","english":"When should I return the car?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970925"}],"stories":[{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-z-na-mun-ilor-2","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"După ce veniră filosofii, învăţă şi de la dânşii câte în lună şi în soare. Bucuria tatălui său era aşa de mare unde vedea că fiu-său are să fie procopsit ca nici unul din fiii de împăraţi, încât se uita la dânsul ca la soare. Iară el de ce se mărea d-aia se făcea mai cu minte şi mai frumos."},{"id":"story-ro-soacra-cu-trei-nurori-3","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Acum deodată, până te-i mai odihni, ia furca în brâu, şi până mâine dimineaţă să găteşti fuioarele aceste de tors, penele de strujit şi mălaiul de pisat. Eu mă las puţin, că mi-a trecut ciolan peste ciolan cu nunta voastră."},{"id":"story-ro-f-t-frumos-cel-r-t-cit","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"A fost odată o păreche de oameni, muncitori, de! cum dă Dumnezeu. Toată nădejdea lor era într-o iapă cu care se hrăneau. Şi ar fi voit şi ei să aibă un copilaş, dar fu peste poate. Cercetară în dreapta şi în stânga, ca să afle niscaiva leacuri care să le desfacă făcutul stărpiciunei lor, dară, aşi!"},{"id":"story-ro-uer-3","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Kira, zâmbind, răspunde: – Ăl de sus e umbra, mamă; din aşa caier trag ursitorile firul vieţilor de nimic. – Şi de se rupe firul tău, fusul cu tort cade; dar de s-ar rupe firul de umbră, cade şi fusul de pe grinzi?"}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
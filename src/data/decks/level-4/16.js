@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136296","romanian":"Am alergat spre ușă.","english":"I ran toward the door.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963200"},{"id":"tat-1192743","romanian":"Vecinii sunt OK cu muzica tare la această oră?","english":"Is loud music OK with the neighbors at this hour?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7512007"},{"id":"tat-406035","romanian":"Îți plăcea să mergi la expoziții în România?","english":"Did you enjoy going to exhibits in Romania?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350460"},{"id":"tat-1119769","romanian":"Când a murit? \"Nu cu mult timp în urmă.\"","english":"When did he die? \"Not very long ago.\"","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11845708"},{"id":"tat-1136572","romanian":"A trecut pe lângă mine fără să mă observe.","english":"He went by me without noticing me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965942"},{"id":"tat-1142921","romanian":"Strada este deteriorată.","english":"The road is damaged.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066444"},{"id":"tat-411934","romanian":"Am văzut-o pe Andreea plecând de acasă.","english":"I saw Andrea leaving home.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272215"},{"id":"tat-1059667","romanian":"Era văzut ca un om învățat în comunitatea noastră.","english":"He passed for a learned man in our community.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11028998"},{"id":"tat-1059626","romanian":"Presupun că-ți place de ea.","english":"I suppose you like her.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9777847"},{"id":"tat-1144718","romanian":"Capitala Albaniei este Tirana.","english":"The capital city of Albania is called Tirana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076581"},{"id":"tat-1136600","romanian":"Vă rog să îmi răspundeți în scurtă vreme.","english":"Please write me a reply soon.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966023"},{"id":"tat-475812","romanian":"Lipsește o furculiță.","english":"There is a fork missing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6223472"},{"id":"tat-698952","romanian":"Am vrut să cumpăr cartea.","english":"I wanted to buy the book.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2818798"},{"id":"tat-1153809","romanian":"Acesta e un vin excelent.","english":"This is excellent wine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128986"},{"id":"tat-1136977","romanian":"Maşina asta veche e tot timpul stricată.","english":"This old car is always broken.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952911"},{"id":"tat-584785","romanian":"Seara el iese în oraș să bea ceva.","english":"At night he goes out in the city to drink something.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812845"},{"id":"tat-1143191","romanian":"Am știut tot timpul că spunea minciuni.","english":"I knew all along that he was telling a lie.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069296"},{"id":"tat-1136717","romanian":"Porecla mea este \"Itch\".","english":"I go by the nickname \"Itch.\"","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239594"},{"id":"tat-1059615","romanian":"Ești roșu la față.","english":"Your face is red.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7883567"},{"id":"tat-1136802","romanian":"Îmi place să cânt.","english":"I like singing.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966355"}],"stories":[{"id":"story-ro-popa-duhu","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"Cine-a întâlnit vrodată în calea sa un popă, îmbrăcat cu straie sărăcuţe, scurt la stat, smolit la faţă, cu capul pleş, mergând cu pas rar, încet şi gânditor, răspunzând îndesat \"sluga dumitale\" cui nu-l trecea cu vederea, căscând cu zgomot când nu-şi găsea omul cu care să stea de vorbă, făcând lungi popasuri prin aleiele ascunse ale grădinilor publice din Iaşi, câte cu o carte în mână, tresărind la cântecul păserelelor şi oprindu-se cu mirare lângă moşinoaiele de furnici, pe care le numea el \"republici înţelepte\", dezmerdând iarba şi florile câmpului, icoane ale vieţii omeneşti, pe care le uda câte c-o lacrimă fierbinte din ochii săi şi apoi, cuprins de foame şi obosit de osteneală şi gândire, îşi lua cătinel drumul spre gazdă, unde-l aştepta sărăcia cu masa întinsă."},{"id":"story-ro-z-na-z-nelor-2","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Se duse şi cel mijlociu şi se întoarse şi el cu o soţioară mândră şi frumoasă. Se duse şi cel mic. Cutreieră lumea până ce ajunse la pădurea cea mare unde se lăsase săgeata lui. Bâjbâi el şi orbăcăi p-acolo prin bunget, până ce dete de copaciul în care se înfipsese şi săgeata lui."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-2","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Doresc prea mult să văz la masa mea măcar un măr din acest pom care m-a ţinut atâta sumă de bani şi de aceea, iată, mă înduplec şi te las ca să pândeşti, măcar că nu-mi vine a crede că o să izbuteşti."},{"id":"story-ro-gura-satului-3","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"zice una. — Cine altul decât Toderică, îi răspunde alta. — Toderică? Așa umblă gura satului. Nici să visezi din ce scornește o poveste. Pentru ca să vorbim drept, Toderică e Toader, ba chiar Tudoroiu. Lasă că avea din cine să iasă fiindcă și tatăl său, Cosma Florii Cazacului, seamănă cu dânsul."},{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
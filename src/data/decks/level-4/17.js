@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136907","romanian":"Ai înţeles ce a zis?","english":"Did you understand what he said?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960213"},{"id":"tat-1136629","romanian":"Cariera lui progresează furtunos.","english":"His career is progressing in leaps and bounds.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239750"},{"id":"tat-1192765","romanian":"Mulțumesc pentru instrucțiuni.","english":"Thank you for the lead.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357142"},{"id":"tat-406044","romanian":"Daniela mi-a telefonat acasă.","english":"Daniela called me at home.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350499"},{"id":"tat-1064314","romanian":"Cât de des o vede Tom pe Mary?","english":"How often does Tom see Mary?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11060128"},{"id":"tat-1186837","romanian":"A plătit 20$ pentru ruj.","english":"He paid $20 for the lipstick.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7309933"},{"id":"tat-1153161","romanian":"Era obișnuită să trăiască dintr-un venit modest.","english":"She was used to living on a small income.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1752003"},{"id":"tat-411853","romanian":"În Franța ați lucrat la ambasadă sau la consulat?","english":"In France did you work at the embassy or in the consulate?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6262484"},{"id":"tat-1153157","romanian":"O asemenea abilitate este nativă pentru el.","english":"Such ability is native to him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749170"},{"id":"tat-902150","romanian":"Cred că am înţeles.","english":"I think I understood.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287441"},{"id":"tat-1192790","romanian":"Oamenii promiseseră deja bani pentru proiectul său.","english":"People have already promised money for his project.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350198"},{"id":"tat-1136540","romanian":"O poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965189"},{"id":"tat-399622","romanian":"Bună seara, ce faci?","english":"Good evening, how are you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6360852"},{"id":"tat-1153836","romanian":"Ar trebui să fi terminat până acum.","english":"He should have finished it by now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130096"},{"id":"tat-407954","romanian":"Mașina mea e Ford, ca și a dumneavoastră.","english":"My car is a Ford, just like yours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525379"},{"id":"tat-1059483","romanian":"A venit să ne roage să-l ajutăm.","english":"He came to ask us to help him.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10265378"},{"id":"tat-1056686","romanian":"Micul dejun este principala masă a zilei.","english":"Breakfast is the most important meal of the day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029785"},{"id":"tat-709017","romanian":"De ce îţi sunt urechile atât de mari?","english":"Why are your ears so big?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420299"},{"id":"tat-864511","romanian":"Credința este moartea inteligenței.","english":"Belief is the death of intelligence.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6984822"},{"id":"tat-1136622","romanian":"Dă-mi o mână de ajutor.","english":"Lend me a hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239816"}],"stories":[{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-3","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Şi dintr-acel minut, nu ştiu ce făcea el, nu ştiu ce dregea, că se pomenea, fără voia lui, trecând pe la curtea împărătească, ia aşa, numai ca să treacă. El îşi uitase de peşte."},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."},{"id":"story-ro-la-crucea-din-sat","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":224,"excerpt":"Naica Floare n-are vreme. Cuptorul este ars și plăcinta nu e încă întinsă. Multă grabă nu-i prea bună: Marta ar fi trebuit să mai aștepte cu cuptorul. Ea însă umblă cu gândul tot pe la cei din casă; abia apucă să se vadă și ea la masă cu scărmănătorii de pene. Sunt prea veseli: îi aude râzând în casă."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-3","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"– Ba nici râs, nici nimic, începu a zice neguţătorul cel chiabur. Iată două pungi: nu crez să-ţi dea altul mai mult. Şi scoase pungile cu bani, i le puse în mână, luă oul şi plecă. Bietul om rămase înlemnit în loc, uitându-se după neguţător cum se ducea. Nici că-i venea măcar să crează ochilor."},{"id":"story-ro-fata-mo-ului-3","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":257,"excerpt":"Iacă, e un basm cu ghicitoare vorba mea şi, de vreţi, am să vi-l spun, dacă mi-o face poala căpătâi o fată frumoasă. – Mai e vorbă? Vrem, vrem! – Uite, vin’ la mine. – Ba la mine! – Ba la mine, că-ţi caut în cap!"}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
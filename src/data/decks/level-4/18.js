@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1056801","romanian":"Este o persoană agresivă.","english":"He is an aggressive person.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031628"},{"id":"tat-1136995","romanian":"Sahara este un deșert vast.","english":"The Sahara is a vast desert.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952791"},{"id":"tat-1137017","romanian":"Nu toate navigatoarele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952941"},{"id":"tat-1185071","romanian":"Tinde să fie arogant.","english":"He tends to be arrogant.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321261"},{"id":"tat-1143131","romanian":"Fă altora ceea ce vrei să îți facă ţie.","english":"Do to others as you would have them do to you.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068861"},{"id":"tat-1059501","romanian":"General Motors a dat afară cei 76.000 de muncitori.","english":"General Motors laid off 76,000 workers.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7534514"},{"id":"tat-1153871","romanian":"Voi face tot ce îmi stă în putere.","english":"I will do everything in my power.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099026"},{"id":"tat-708960","romanian":"Ce sporturi îţi plac?","english":"What sports do you like?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420397"},{"id":"tat-1153807","romanian":"I-am văzut mașina făcând la dreapta.","english":"I saw his car make a turn to the right.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128946"},{"id":"tat-1136545","romanian":"Fundul oceanului este studiat de câţiva oameni de știință.","english":"The ocean floor is being studied by some scientists.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965763"},{"id":"tat-670577","romanian":"Vederea slabă este un handicap pentru un atlet.","english":"Poor sight is a handicap to an athlete.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2423585"},{"id":"tat-1111140","romanian":"Lasă-mă în pace!","english":"Leave me alone!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11790536"},{"id":"tat-709916","romanian":"Din 50 de aplicanţi, 20 au fost respinşi.","english":"There were 20 failures among 50 applicants.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424371"},{"id":"tat-709001","romanian":"Când călătoreşti, este uşor să te rătăceşti.","english":"When traveling, it is easy to get lost.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420261"},{"id":"tat-670692","romanian":"Poți alege orice carte vrei.","english":"You may choose whichever book you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200793"},{"id":"tat-1143183","romanian":"A fost obligată să renunțe la plan.","english":"She was obliged to give up the plan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069259"},{"id":"tat-712076","romanian":"Trebuie să vii cu mine.","english":"You have to come with me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440714"},{"id":"tat-1136619","romanian":"Băiatul plângea în cameră.","english":"The boy was crying in the room.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227573"},{"id":"tat-1136854","romanian":"Aș face altfel decât ai făcut tu.","english":"I would do it in a different way than you did.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966286"},{"id":"tat-1201333","romanian":"Cafea sau ceai?","english":"Coffee or tea?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4037739"}],"stories":[{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-2","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"– Să ne despărţim unchiaş, dacă tu aşa găseşti de cuviinţă. Dară bine, cine să ne închiză ochii în ceasul cel de pe urmă? – Că bine zici tu, babo; stăi dară; ia să iei tu basmaua mea care am avut-o în ziua de cununie şi eu ştergarul cel vărgăţel ce mi-ai adus de zestre."},{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-scormon","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":222,"excerpt":"Cât e de lung gardul, de la portiță până la cotitura uliței, Sanda l-a măsurat, nici ea singură nu știe de câte ori, cu firul în mână. Jos, lângă portiță, e vârtelnița cu jirebia de tort."},{"id":"story-ro-ion-roat-i-cuza-vod","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":229,"excerpt":"Între ţăranii fruntaşi care au luat parte, împreună cu boierii, cu episcopii şi cu mitropolitul ţării la Divanul ad-hoc din Moldova, în 1857, era şi moş Ion Roată, om cinstit şi cuviincios, cum sunt mai toţi ţăranii români de pretutindeni."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":204,"excerpt":"Era odată un împărat puternic şi mare şi avea pe lângă palaturile sale o grădină frumoasă, bogată de flori şi meşteşugită nevoie mare! Aşa grădină nu se mai văzuse până atunci, p-acolo."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-406815","romanian":"Cum vă numiți?","english":"What is your name?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347334"},{"id":"tat-1151813","romanian":"Cade o frunză.","english":"A leaf is falling.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119103"},{"id":"tat-1143235","romanian":"De ce sunteți, băieți, așa de supărați?","english":"Why are you guys so angry?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068488"},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"},{"id":"tat-448266","romanian":"Are părul scurt.","english":"She has short hair.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4306510"},{"id":"tat-1185178","romanian":"Mă durea inima pentru păsările aflate pe moarte.","english":"My heart ached for the dying birds.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324325"},{"id":"tat-506869","romanian":"La mulți ani!","english":"Happy birthday!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528582"},{"id":"tat-1143175","romanian":"Jane ne-a spus că gătitul nu era dificil.","english":"Jane told us that cooking was not difficult.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069208"},{"id":"tat-925687","romanian":"Ce veste proastă!","english":"What bad news!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527133"},{"id":"tat-1136647","romanian":"A preluat afacerea după decesul tatălui său.","english":"He took over the business after his father died.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966174"},{"id":"tat-1153798","romanian":"Indiferent de ce joacă pe ecran, Tom arată grozav.","english":"No matter what he plays on the screen, Tom looks great.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128804"},{"id":"tat-1136639","romanian":"Cine a scris această scrisoare?","english":"Who wrote this letter?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966122"},{"id":"tat-928490","romanian":"Oamenii deștepți știu cum să facă bani din orice.","english":"Clever people know how to make money out of nothing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5131666"},{"id":"tat-1143126","romanian":"Doctorul este un om cult.","english":"The doctor is a man of culture.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068831"},{"id":"tat-708989","romanian":"A cuprins-o teama.","english":"Fear fell upon her.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420389"},{"id":"tat-1136800","romanian":"N-am fost niciodată într-o închisoare.","english":"I have never been inside a jail.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966338"},{"id":"tat-1136610","romanian":"Cu ajutorul doctorilor, s-a vindecat.","english":"With the help of doctors, she got over her illness.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966026"},{"id":"tat-862403","romanian":"După aceea, nu am vorbit cu ei.","english":"Afterwards, I did not speak with them.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9460600"},{"id":"tat-1064374","romanian":"Tom a cerut-o în căsătorie pe Mary.","english":"Tom asked Mary to marry him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074440"},{"id":"tat-1064186","romanian":"Tom a cumpărat o casă cu șase camere.","english":"Tom bought a house with six rooms.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066256"}],"stories":[{"id":"story-ro-boierul-i-p-cal","title":"Boierul şi Păcală","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"Odată, Păcală stătea la marginea unei păduri. Deodată vede o trăsură venind spre el. Repede se scoală, ia un trunchi mare de copac, şi-l ridică drept în sus. În trăsură era boierul, cucoana şi vizitiul, care mâna caii. Boierul, văzând pe Păcală, spuse vizitiului să oprească trăsura: Poveşti de Ioan Slavici - Boierul şi Păcală – Bună ziua!"},{"id":"story-ro-popa-duhu-2","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"Mare de inimă, iar de gură şi mai mare, părintele Duhu nu se învrednicise de o viaţă mai bună; dar se vede că nici poftea el una aşa, de vreme ce nu-şi astâmpăra gura cătră mai-marii săi măcar să-l fi picat cu lumânarea."},{"id":"story-ro-popa-tanda-3","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":213,"excerpt":"O vorbă și încă ceva, pentru mai bună înțelegere, la protopop, o cale la episcopie, și aici o vorbă bună de la protopop: lucrurile se fac, numai dacă le știm face. Cu mult, cu puțin, părintele Trandafir fu trimis de la Butucani la Sărăceni — pentru buna înțelegere între credincioși. Popă-n Sărăceni? Cine știe ce vrea să zică popă-n Sărăceni!"},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."},{"id":"story-ro-fata-cu-pieze-rele","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":260,"excerpt":"A fost odată un împărat. El avea doisprezece feciori. Când se punea la masă, copiii stau împrejuru-i cunună deplină. El era totdauna cu voie-bună, fiindcă vedea că trebile îi merg strună. Poveşti de Petre Ispirescu - Fata cu pieze rele Împăraţii, vecinii lui, râvnea la traiul lui cel ticnit."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
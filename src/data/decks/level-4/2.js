@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136518","romanian":"Încet și fără grabă se câștigă cursa.","english":"Slow and steady wins the race.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965773"},{"id":"tat-1142946","romanian":"Ești ocupat mâine?","english":"Are you engaged for tomorrow?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066837"},{"id":"tat-902137","romanian":"A început să ningă.","english":"It began to snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287411"},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-709933","romanian":"Nimeni nu a încurajat-o.","english":"No one encouraged her.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426774"},{"id":"tat-1192817","romanian":"Tom își dorea să fi fost mai atent.","english":"Tom wished he had been more careful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356244"},{"id":"tat-1136569","romanian":"Prefer să locuiesc la țară decât la oraș.","english":"I prefer living in the country to living in the city.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9017538"},{"id":"tat-1163914","romanian":"Rata criminalității este în scădere în Canada.","english":"The crime rate is decreasing in Canada.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197021"},{"id":"tat-706060","romanian":"Tu ești prietenul meu.","english":"You are my friend.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970702"},{"id":"tat-1136539","romanian":"Îl poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957077"},{"id":"tat-706050","romanian":"Dacă înveţi din greu, vei deveni un student bun.","english":"If you study hard, you will become a good student.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970031"},{"id":"tat-1143576","romanian":"Îmi place jazzul.","english":"I like jazz music.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7736870"},{"id":"tat-1064436","romanian":"El este de două ori mai mare decât ea.","english":"He is twice as old as she is.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077419"},{"id":"tat-1192716","romanian":"Un pantof desperecheat a fost lăsat pe pragul ușii.","english":"An odd shoe was left on the doorstep.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6225612"},{"id":"tat-1192827","romanian":"Unde îmi pot ridica bagajele?","english":"Where can I pick up my baggage?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12359803"},{"id":"tat-1192741","romanian":"Tom a avut vremuri grele anul trecut.","english":"Tom had a rough time last year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511264"},{"id":"tat-1059689","romanian":"Nu îi e ușor să învețe engleza.","english":"English is not easy for him to learn.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029000"},{"id":"tat-1143117","romanian":"Și pomul era deseori singur.","english":"And the tree was often alone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070043"},{"id":"tat-1059686","romanian":"Merită văzute ruinele.","english":"The ruins are worth seeing.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963708"},{"id":"tat-1064195","romanian":"Cred că Tom și Mary sunt căsătoriți în secret.","english":"I think Tom and Mary are secretly married.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072663"}],"stories":[{"id":"story-ro-pravoslavnicul-i-sl-ninile-3","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"Şi ei abia se potriviseră, spate în spate, cu nasul în velinţele zdrenţuite. Văzând cucernicul bătrân că dorm cu toţii ca nişte bolovani de piatră, începu şi hâţ în dreapta, hâţ în stânga, până descuie uşa omului."},{"id":"story-ro-ivan-turbinc","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Era odată un rus, pe care îl chema Ivan. Şi rusul acela din copilărie se trezise în oaste. Şi slujind el câteva soroace de-a rândul, acuma era bătrân. Şi mai-marii lui, văzându-l că şi-a făcut datoria de ostaş, l-au slobozit din oaste, cu arme cu tot, să se ducă unde-a vrea, dându-i şi două carboave de cheltuială."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-amintiri-din-copil-rie-i","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":223,"excerpt":"Stau câteodată şi-mi aduc aminte ce vremi şi ce oameni mai erau în părţile noastre pe când începusem şi eu, drăgăliţă-Doamne, a mă ridica băieţaş la casa părinţilor mei, în satul Humuleşti, din târg drept peste apa Neamţului; sat mare şi vesel, împărţit în trei părţi, care se ţin tot de una: Vatra satului, Delenii şi Bejenii."},{"id":"story-ro-z-na-zorilor","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"A fost ce-a fost: dacă n-ar fi fost nici nu s-ar povesti. Poveşti de Ioan Slavici - Zâna Zorilor A fost odată un împărat, – un împărat mare şi puternic; împărăţia lui era atât de mare, încât nici nu se ştia unde se începe şi unde se sfârşeşte. Unii ziceau că ar fi fără de margini."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-408053","romanian":"Am discutat deja cu studentul acesta.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232112"},{"id":"tat-1056778","romanian":"Muzica este o parte importantă din viața mea.","english":"Music is an important part of my life.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031363"},{"id":"tat-863737","romanian":"Cheltuiește bani și bucură-te de viață!","english":"Spend money and enjoy life!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9086244"},{"id":"tat-986459","romanian":"Contextul este important.","english":"The context is important.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637061"},{"id":"tat-1089727","romanian":"Îmi place matematica.","english":"I like maths.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11267471"},{"id":"tat-406033","romanian":"Îmi face plăcere să merg pe jos.","english":"I like to walk.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350454"},{"id":"tat-584344","romanian":"Bună ziua, cum vă pot fi de folos?","english":"Good day, how may I help you?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7797080"},{"id":"tat-1192838","romanian":"Tatăl meu e doctor.","english":"My father is a doctor.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361424"},{"id":"tat-1064413","romanian":"L-am văzut uitându-se la mine.","english":"I saw him looking at me.","difficulty":5,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075735"},{"id":"tat-1059492","romanian":"Mi s-a ondulat părul.","english":"My hair got kinky.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10767713"},{"id":"tat-1136901","romanian":"Maşina noastră a rămas fără combustibil după zece minute.","english":"Our car ran out of gas after ten minutes.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966025"},{"id":"tat-702225","romanian":"Se va despărţi de prietenul ei.","english":"She is going to part from her boyfriend.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398964"},{"id":"tat-1142892","romanian":"Câți ani ai?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1136554","romanian":"Trebuie să învățați toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960194"},{"id":"tat-1136628","romanian":"Mi-am pierdut umbrela.","english":"I have lost my umbrella.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227193"},{"id":"tat-1064211","romanian":"Despre ce voiai să vorbești cu mine?","english":"What did you want to talk to me about?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069328"},{"id":"tat-1136556","romanian":"Nu așa îl văd eu.","english":"That is not my idea of him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959323"},{"id":"tat-698940","romanian":"Acest roman mă plictisește.","english":"This novel bores me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2233781"},{"id":"tat-1064310","romanian":"L-am văzut pe Tom lovind-o pe Mary.","english":"I saw Tom hit Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045325"},{"id":"tat-1143219","romanian":"Au fost într-o excursie în străinătate pentru prima oară.","english":"They went on a trip abroad for the first time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070011"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-fata-mo-ului-cea-cuminte-3","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"– Om bun, răspunse fata. După ce intră, fiindu-i frică de mumă-sa vitregă să nu o bată dacă se va întoarce acasă, pentru că întârziase, întrebă dacă nu cumva are trebuinţă de o slujnică. Sânta Vinerea, care locuia înăuntru şi care priimi pe fată, îi răspunse că are trebuinţă de o asemenea fată; ea rămase acolo."},{"id":"story-ro-finul-lui-dumnezeu-3","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":210,"excerpt":"S-o vârât sub aripa lui şi nu s-a văzut. S-aude un vuiet mare; vine pajera. Pajera era mama vântului. – Dragii mamei nu v-a mâncat! – Finul lui D-zeu ne-a scăpat. – Unde-i să-l mănânc de bucurie. – Mă rog, mamă, dacă l-ăi mânca să-l faci înapoi. – Da unde-i? – Îi la răsărit."},{"id":"story-ro-ileana-simziana-2","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Dacă văzură şi văzură că nimic nu-i este pe plac, fata cea mare îşi luă inima în dinţi şi-l întrebă într-o zi la masă, că de ce este supărat: – Au purtarea noastră nu-ţi place? îi zise ea. Au supuşii măriei tale sunt răi şi arţăgoşi de-ţi pricinuiesc atâta mâhnire?"},{"id":"story-ro-norocul-dracului-2","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"dacă n-ar fi, n-ar fi lumea cum e. Eu n-am arat, n-am săpat, n-am prăşit, n-am plivit ca ceilalţi? Ba da, şi ogorul meu a ieşit sterp; piatra pe mine m-a bătut; şi, rămas numai cu mâinile, muncesc, şi nimeni nu mă crede; iar când la măsurătoarea muncii, lucrul meu scade, şi făina din copaie scade, şi foamea copiilor creşte\"."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1185180","romanian":"Acum e în spital.","english":"She is in hospital now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324332"},{"id":"tat-487297","romanian":"Eu știu numele său.","english":"I know his name.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270657"},{"id":"tat-1097617","romanian":"Sala de şedinţe este ocupate în acest moment.","english":"The meeting room is occupied at the moment.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11654854"},{"id":"tat-1144295","romanian":"Fără el, aș fi neajutorat.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073247"},{"id":"tat-1059642","romanian":"Te rog, păstrează cartea asta la îndemână.","english":"Please keep this book at hand.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/938549"},{"id":"tat-1064272","romanian":"Tatăl ei a murit când ea avea trei ani.","english":"Her father died when she was three.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066162"},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-1185252","romanian":"Taro, du-te și spală-te pe dinți.","english":"Taro, go and brush your teeth.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328036"},{"id":"tat-1136848","romanian":"Mă întreb cine înoată cel mai repede.","english":"I wonder who can swim fastest.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966289"},{"id":"tat-1185107","romanian":"Și-a îmbrățișat călduros fiul.","english":"He embraced his son warmly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195145"},{"id":"tat-1136410","romanian":"Cheamă-mă dacă ai nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962814"},{"id":"tat-1143842","romanian":"Se ține întotdeauna de cuvânt.","english":"He always fulfills his promises.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070729"},{"id":"tat-1192802","romanian":"Niciunul dintre copacii bătrâni nu a supraviețuit focului.","english":"None of the old trees survived the fire.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353825"},{"id":"tat-1147490","romanian":"Închide ușa aia blestemată!","english":"Shut the damned door!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094827"},{"id":"tat-1136513","romanian":"Încetează să te mai duci acolo.","english":"Stop going there.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965707"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-1142942","romanian":"Servitoarea a aranjat cuțitele și furculițele pe masă.","english":"The maid arranged the knives and forks on the table.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066763"},{"id":"tat-864480","romanian":"Noi îi spunem Goro-san.","english":"We call him Goro-san.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817805"},{"id":"tat-1143570","romanian":"Îmi place să dorm.","english":"I like sleeping.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072646"},{"id":"tat-1143210","romanian":"Tom pretindea că nu știe cine e Mary.","english":"Tom pretended not to know who Mary was.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070000"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."},{"id":"story-ro-povestea-lui-harap-alb","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Amu cică era odată într-o ţară un crai, care avea trei feciori. Şi craiul acela mai avea un frate mai mare, care era împărat într-o altă ţară, mai depărtată. Şi împăratul, fratele craiului, se numea Verde-împărat; şi împăratul Verde nu avea feciori, ci numai fete."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-3","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":229,"excerpt":"De ce creştea copilul, d-aceea se făcea mai isteţ şi mai îndrăzneţ. Îl deteră pe la şcoli şi filosofi, şi toate învăţăturile pe care alţi copii le învăţa într-un an, el le învăţa într-o lună, astfel încât împăratul murea şi învia de bucurie. Toată împărăţia se fălea că o să aibă un împărat înţelept şi procopsit ca Solomon împărat."},{"id":"story-ro-george-cel-viteaz-3","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Împăratul trimise pe împărăteasa să boteze pruncul, căci el va sta să dea piept cu tălharii, până se va întoarce ea. Împărăteasa se supuse poruncii şi plecă. Când să se întoarcă de la botez, veni până la un loc; aci, stând şi nemaiauzind zăngănitul armelor şi zgomotul luptei, îi dete un fier ars în inimă."},{"id":"story-ro-ho-u-mp-rat-2","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"Cum auzea că în cutare cetate este câte vrun meşter mai dibaci şi că acea meserie nu se află pe la dânsul, îndată îl trimitea să înveţe şi acea meserie. Astfel umblă fiul împăratului din ţară în ţară, ca şi un pribeag, până ce învăţă toate meseriile de pre pământ."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-712096","romanian":"Radioul este stricat.","english":"The radio is broken.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8438352"},{"id":"tat-923855","romanian":"M-am căsătorit cu o poloneză.","english":"I am married to a Polish woman.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442834"},{"id":"tat-1185094","romanian":"Sunt băiat bun.","english":"I am a good boy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7181129"},{"id":"tat-1185078","romanian":"Noua lege a fost impusă oamenilor de pe insulă.","english":"The new law was enforced on the people of the island.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321427"},{"id":"tat-1143116","romanian":"Acest ceas ți-e destinat.","english":"This watch is meant for you.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070041"},{"id":"tat-986476","romanian":"Te iubesc!","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637108"},{"id":"tat-1136386","romanian":"Vestea despre moartea lui s-a răspândit în jur.","english":"The news of his death spread around.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962818"},{"id":"tat-1136509","romanian":"Sunt de acord să merg cu el.","english":"I agree to go with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965688"},{"id":"tat-1186831","romanian":"Mi-e teamă de ce va spune profesorul.","english":"I am afraid of what the teacher will say.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7295047"},{"id":"tat-1143279","romanian":"Există o limită de două bagaje pentru fiecare pasager.","english":"There is a limit of two pieces of luggage for each passenger.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068665"},{"id":"tat-399609","romanian":"Bună dimineața la toată lumea.","english":"Good morning, everybody.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325807"},{"id":"tat-706155","romanian":"Tocmai a plecat.","english":"He left just now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974769"},{"id":"tat-1059635","romanian":"Răspunsul tău este greșit.","english":"Your reply is wrong.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7874588"},{"id":"tat-1143181","romanian":"Știa că nu va putea câștiga.","english":"He knew he could not win.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069238"},{"id":"tat-709928","romanian":"Această maşină a fost făcută in Japonia.","english":"This car was made in Japan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424464"},{"id":"tat-706000","romanian":"Ai avut un sfârşit de săptămână plăcut?","english":"Did you have a good weekend?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968646"},{"id":"tat-1142918","romanian":"Am auzit bomba explodând.","english":"We heard the bomb go off.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066399"},{"id":"tat-1090180","romanian":"De ce vrei să cumperi cartea asta?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3639543"},{"id":"tat-1059504","romanian":"I se zice Jim.","english":"They call him Jim.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8001955"},{"id":"tat-1136894","romanian":"Aceasta este casa în care a crescut Tom.","english":"This is the house where Tom was brought up.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956357"}],"stories":[{"id":"story-ro-coto-man-n-zdr-vanu","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată o pereche de oameni. Ei n-aveau copii. Într-o zi, fiind cu voie bună, zise bărbatul către femeie: Poveşti de Petre Ispirescu - Cotoşman năzdrăvanu – Soro, de la mila lui Dumnezeu noi n-avem copii. Să mergem pe câmp şi ce vom găsi, aceea să ne fie copil. – Bine zici dumneata, frate."},{"id":"story-ro-cinci-p-ini","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":256,"excerpt":"Doi oameni, cunoscuţi unul cu altul, călătoreau odată, vara, pe un drum. Unul avea în traista sa trei pâni, şi celalalt două pâni. De la o vreme, fiindu-le foame, poposesc la umbra unei răchiţi pletoase, lângă o fântână cu ciutură, scoate fiecare pânile ce avea şi se pun să mănânce împreună, ca să aibă mai mare poftă de mâncare."},{"id":"story-ro-coto-man-n-zdr-vanu-2","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Când stăpâna casei făcea la ciorap, pisoiul se juca cu ghemul. Dară nu-l încurca, ferească Dumnezeu. Cum făcea el, cum dregea, se juca aşa de frumuşel, încât ghemul nici nu se desfăşura, nici nu se încurca."},{"id":"story-ro-fata-mo-ului-cea-cuminte","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"A fost odată un om bătrân care avea o fată mare, de se dusese vestea în lume de vrednicia ei. Moşneagul (unchiaşul) se căsători de a doua oară cu o babă, care avea şi ea o fată mare."},{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
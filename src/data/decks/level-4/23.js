@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136557","romanian":"Ținea la fiul ei.","english":"She cared for her son.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965484"},{"id":"tat-1064028","romanian":"De îndată ce m-a văzut a izbucnit în plâns.","english":"As soon as she saw me, she burst out crying.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10913317"},{"id":"tat-706130","romanian":"El scrie cărţi.","english":"He writes books.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974452"},{"id":"tat-1136897","romanian":"Vecinul și-a ițit capul peste zid pentru o clipă.","english":"The neighbor popped his head up over the wall for a moment.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965962"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-1185066","romanian":"Îți este interzis să intri în acest loc.","english":"You are banned from entering this place.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320722"},{"id":"tat-1136723","romanian":"Acolo nefiind taxiuri, a trebuit să merg pe jos.","english":"There being no taxis, I had to walk.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226178"},{"id":"tat-1064235","romanian":"Tom are iubită?","english":"Does Tom have a girlfriend?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073102"},{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-1136847","romanian":"I-a cumpărat un pulover.","english":"She bought him a sweater.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966283"},{"id":"tat-1192844","romanian":"Sunt o mulțime de cărți în camera lui.","english":"There are a lot of books in his room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361457"},{"id":"tat-864488","romanian":"Ea știa să citească când avea patru ani.","english":"She could read when she was four.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855675"},{"id":"tat-408060","romanian":"I-am dat cărțile studentului acestuia.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232758"},{"id":"tat-1136579","romanian":"Nu traduceți această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965936"},{"id":"tat-1064182","romanian":"Te rog ia loc aici.","english":"Please sit here.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070976"},{"id":"tat-1192834","romanian":"În Japonia, noul an școlar începe în aprilie.","english":"The new school year begins in April in Japan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361249"},{"id":"tat-448260","romanian":"Ai grijă de tine.","english":"Take care.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4256296"},{"id":"tat-1147577","romanian":"Am scris o adresă greșită pe plic.","english":"I wrote a wrong address on the envelope.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095173"},{"id":"tat-1064187","romanian":"El are idei ciudate.","english":"He has strange ideas.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066231"},{"id":"tat-1153151","romanian":"Trebuie să ne trezim devreme mâine dimineață?","english":"Do we have to get up early tomorrow morning?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692258"}],"stories":[{"id":"story-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":170,"excerpt":"Ghita era un om simplu care visa la o viata mai buna pentru familia sa. Cand a auzit ca moara de la marginea satului e de inchiriat, a vazut o sansa. \"Hai sa luam moara,\" i-a spus sotiei lui, Ana. \"Vom munci si vom prospera.\" La inceput, totul a mers bine."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."},{"id":"story-ro-spaima-zmeilor-3","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Şi toţi erau mărunţi, care de care mai mic decât cellalt, mai sfredeluş, mai guraliv, mai drăcos şi – asta să nu uităm – mai mâncăcios şi mai hapsân. – Aoleo! zise femeia, care se bălăbănea cu ei. Ăştia-mi scot sufletul şi-mi mănâncă şi urechile. Cine m-a pus să mă tot milogesc?!"},{"id":"story-ro-bunica","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"O văz, ca prin vis. Poveşti de Barbu Ştefănescu Delavrancea - Bunica O văz limpede, aşa cum era. Naltă, uscăţivă, cu părul alb şi creţ, cu ochii căprui, cu gura strânsă şi cu buza de sus crestată în dinţi de pieptene, de la nas în jos. Cum deschidea poarta, îi săream înainte."},{"id":"story-ro-povestea-porcului-2","title":"Povestea porcului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"– Ştiu, măi babă, dacă mi-i spune."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1090181","romanian":"De ce vrei să cumperi această carte?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4412136"},{"id":"tat-709907","romanian":"Gabriel este doar unul dintre îngerii Domnului.","english":"Gabriel is only one of the angels of God.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426741"},{"id":"tat-706124","romanian":"Nu avea nicio intenţie să aştepte trei ore.","english":"He had no intention of waiting for three hours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/973116"},{"id":"tat-1136909","romanian":"Articolul 6. Președintele va conduce toate întâlnirile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960211"},{"id":"tat-1153757","romanian":"Ne te poți sinucide ținându-ți respirația.","english":"You cannot kill yourself by holding your breath.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5568104"},{"id":"tat-1192771","romanian":"A alergat 100 de metri în exact 11 secunde.","english":"He ran 100 meters in 11 seconds flat.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364280"},{"id":"tat-1279041","romanian":"Nimeni nu a venit să mă ajute.","english":"Nobody came to help me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13108759"},{"id":"tat-1136826","romanian":"Trebuie să plec chiar acum?","english":"Must I leave at once?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966311"},{"id":"tat-1136917","romanian":"Arăți altfel azi.","english":"You look different today.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960464"},{"id":"tat-411857","romanian":"Vreți să mergeți la film sau la teatru?","english":"Do you want to go to the movies or to the theater?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271921"},{"id":"tat-986483","romanian":"El știe tot.","english":"He knows everything.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637121"},{"id":"tat-698972","romanian":"Am două cărți.","english":"I have two books.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3766465"},{"id":"tat-1144339","romanian":"Când a sosit autobuzul, s-a urcat în el.","english":"When the bus came, she got on.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073771"},{"id":"tat-1186864","romanian":"Acest ceas trebuie reparat.","english":"This watch needs to be fixed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338255"},{"id":"tat-1279124","romanian":"Bicicleta mea a dispărut.","english":"My bike disappeared.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13117848"},{"id":"tat-705816","romanian":"Mary s-a ataşat foarte tare de fetiţa aceea.","english":"Mary is very attached to the little girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963910"},{"id":"tat-698949","romanian":"Acela este tatăl nostru.","english":"That is our father.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2637465"},{"id":"tat-1185117","romanian":"Am o părere bună despre tânărul candidat.","english":"I have a good opinion of the young candidate.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323560"},{"id":"tat-584835","romanian":"Bineînțeles, el are dreptate.","english":"Of course, he is right.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812373"},{"id":"tat-1143149","romanian":"De la ce aeroport plec?","english":"Which airport do I leave from?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068959"}],"stories":[{"id":"story-ro-spaima-zmeilor-2","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":212,"excerpt":"Petre. Oamenii aceştia sunt adevărată pacoste pe capul meu. Mi s-a înăcrit cu ei! – De ce, sfinte Doamne? întrebă portarul raiului. – Nu vezi, răspunse Tatăl Ceresc, că sunt nesăţioşi?! Tot le-am dat, şi nu se mai mulţumesc."},{"id":"story-ro-broasca-estoas-cea-fermecat","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"A fost odată un împărat, şi el avea trei feciori. Când le-a venit şi lor vremea de însurătoare, le-a zis împăratul: Poveşti de Petre Ispirescu - Broasca ţestoasă cea fermecată – Dragii mei copii, v-aţi făcut mari; mergeţi de vă căutaţi ursitele, ca să intraţi şi voi în rândul oamenilor."},{"id":"story-ro-povestea-lui-harap-alb-2","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Amu cică împăratul acela, aproape de bătrâneţe, căzând la zăcare, a scris către frăţine-său craiului, să-i trimită grabnic pe cel mai vrednic dintre nepoţi, ca să-l lase împărat în locul său după moartea sa. Craiul, primind cartea, îndată chemă tustrei feciorii înaintea sa şi le zise: – Iaca ce-mi scrie frate-meu şi moşul vostru."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-balaurul-cel-cu-apte-capete-2","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Cu aceşti voinici se întovărăşi şi un om verde, pui de român, ştii colea, care auzise de făgăduinţa împăratului şi venise să-şi încerce şi el norocul. Porniră, deci, cu toţii, îşi aleseră un loc aproape de groapă şi se puseră la pândă. Pândiră o zi, pândiră două, pândiră mai multe zile, şi nu se întâmplă nimic."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
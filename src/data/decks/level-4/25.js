@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1153868","romanian":"A fost deschizător de drumuri în acest domeniu.","english":"She was a pioneer in this field.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098377"},{"id":"tat-1149073","romanian":"Migdalul face migdale.","english":"Almonds grow on almond trees.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106102"},{"id":"tat-1064193","romanian":"Nu am absolut nimic de făcut.","english":"I have absolutely nothing to do.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066192"},{"id":"tat-1192712","romanian":"Bărbatul o împinse deoparte.","english":"The man shoved her aside.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2811437"},{"id":"tat-1136511","romanian":"Mă simt îndatorată moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965107"},{"id":"tat-1143172","romanian":"Explicația lui nu era satisfăcătoare.","english":"His explanation was not satisfactory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069202"},{"id":"tat-1153874","romanian":"Ar trebui să facem tot ce putem.","english":"We should do our best.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099422"},{"id":"tat-488758","romanian":"Vă rugam să așteptați treizeci de minute.","english":"Please wait for thirty minutes.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268731"},{"id":"tat-1192707","romanian":"Ai o masă în patio?","english":"Do you have a table in the patio?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1309190"},{"id":"tat-1059636","romanian":"Ieri am stat într-o întâlnire.","english":"Yesterday I was in a meeting.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9557120"},{"id":"tat-706157","romanian":"În această carte se întâmplă multe coincidenţe.","english":"In this book, lots of coincidences happen.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974784"},{"id":"tat-405844","romanian":"L-am văzut pe Ion la bibliotecă.","english":"I saw John at the library.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350592"},{"id":"tat-1136275","romanian":"Poți invita orice persoană dorești.","english":"You may invite any person you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963281"},{"id":"tat-1136652","romanian":"Trăim într-o comunitate globală.","english":"We live in a global community.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966120"},{"id":"tat-1136644","romanian":"Ieri și-a cumpărat Mary fusta.","english":"It was yesterday that Mary bought this skirt.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227743"},{"id":"tat-1195255","romanian":"Acest televizor e greu.","english":"This television set is heavy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7175536"},{"id":"tat-1181806","romanian":"Vreau o chitară.","english":"I want a guitar.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12297767"},{"id":"tat-1163912","romanian":"Tom e cu zece livre mai greu decât Jack.","english":"Tom is ten pounds heavier than Jack.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197016"},{"id":"tat-408052","romanian":"Am discutat deja cu acest student.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232108"},{"id":"tat-923805","romanian":"Toată lumea caută fericirea.","english":"Everybody seeks happiness.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10421099"}],"stories":[{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."},{"id":"story-ro-neghini-2","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– Bine, mătuşă, bine, da’ de unde şi fată? Tu nu ştii că copacii uscaţi nu mai dau de la rădăcină? Şi bătrâna începu să râdă şi să ofteze: \"hi, hi, hi, ooof, of!\" – Ei, toate se întorc, şi apele se întorc de la Dumnezeu, numai tinereţile ba. Ce nu e la timp nu mai e niciodată."},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."},{"id":"story-ro-poveste-r-neasc-3","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Cum se auzi cocoşul, duhul pieri ca o nălucă, dară şi băiatul căzu jos de ostenit. De mai ţinea lupta, numai cât ai aţâţa un foc, s-ar fi muiat, şi cine ştie ce se întâmpla. Cum căzu fiul de împărat pe mormântul tătâne-său, acolo şi adormi. Atât era de rupt de oboseală. Când se deşteptă, ce să vedeţi d-voastră?"},{"id":"story-sara-pe-deal","title":"Sara pe deal","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":110,"excerpt":"Sara pe deal buciumul suna cu jale, Turmele-Loss'n vin, umpland carari si cale, Sufletul meu arde-n iubire ca para, Tu esti departe. Foarte departe, sufletul meu te cheama, Stelele-Loss'n cer scapara-n neagra ceama, Inima mea te asteapta cu dor, Tu nu mai vii."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-584410","romanian":"Ei sunt colegii mei.","english":"They are my classmates.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7794377"},{"id":"tat-1153780","romanian":"Pari să te gândești la altceva.","english":"You seem to be thinking of something else.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128559"},{"id":"tat-1031106","romanian":"Îmi place limba occitană.","english":"I like the Occitan language.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10793086"},{"id":"tat-698962","romanian":"Tu crezi că așa ceva este posibil?","english":"Do you think such a thing is possible?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3160552"},{"id":"tat-1192774","romanian":"Tom putea cu greu să suporte durerea.","english":"Tom could hardly stand the pain.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364284"},{"id":"tat-1143138","romanian":"Doctorul mi-a spus să renunț la fumat.","english":"The doctor told me to give up smoking.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068909"},{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-1136969","romanian":"Tom avea intenția să meargă iar la Boston.","english":"Tom felt like going to Boston again.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966185"},{"id":"tat-1151771","romanian":"Azi nu e ziua ta.","english":"Today is not your day.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118740"},{"id":"tat-488788","romanian":"Sumatra este o insulă.","english":"Sumatra is an island.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528949"},{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-1192724","romanian":"L-am făcut să vopsească poarta săptămâna trecută.","english":"I had him paint the gate last week.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221821"},{"id":"tat-487305","romanian":"Pisica este adorabilă.","english":"The cat is adorable.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270702"},{"id":"tat-1059705","romanian":"Nu e glumă.","english":"It is no joke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795790"},{"id":"tat-1059693","romanian":"Trebuie să fiu acolo până la ora 07.00.","english":"I must be there before 7:00.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758791"},{"id":"tat-1186846","romanian":"Ori Tom, ori eu trebuie să plec.","english":"Either Tom or I must go.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338151"},{"id":"tat-924380","romanian":"Sună-mă dacă ai nevoie de ajutor.","english":"Give me a call if you need help.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735315"},{"id":"tat-1144715","romanian":"Capitala Serbiei este Belgrad.","english":"The capital city of Serbia is Belgrade.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076564"},{"id":"tat-1064070","romanian":"Ce să fac ca să nu mai sughit?","english":"What should I do to stop hiccups?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068880"}],"stories":[{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"},{"id":"story-ro-cele-trei-rodii-aurite","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un împărat, şi avea un fecior; acesta, şezând la fereastră, vede o babă bătrână, care venea cu tivga să ia apă de la fântână."},{"id":"story-ro-ileana-cea-ireat-2","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":205,"excerpt":"Când cei trei feciori ai împăratului vecin primiră vestea că împăratul a pornit în cale şi că s-a depărtat de acasă, ei se înţeleseră între sine şi încălecară, ca să meargă la cetatea cea cu trei fete de împărat să răpească credinţa fetelor şi să-i facă împăratului supărare."},{"id":"story-ro-bunicul","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"Se scutură din salcâmi o ploaie de miresme. Poveşti de Barbu Ştefănescu Delavrancea - Bunicul Bunicul stă pe prispă. Se gândeşte. La ce se gândeşte? La nimic. Enumeră florile care cad. Se uită-n fundul grădinii. Se scarpină-n cap. Iar enumeră florile scuturate de adiere. Pletele lui albe şi creţe parcă sunt nişte ciorchini de flori albe; sprincenele, mustăţile, barba…"},{"id":"story-ro-d-nil-prepeleac","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Erau odată într-un sat doi fraţi, şi amândoi erau însuraţi. Cel mai mare era harnic, grijuliu şi chiabur, pentru că unde punea el mâna punea şi Dumnezeu mila, dar n-avea copii. Iară cel mai mic era sărac."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
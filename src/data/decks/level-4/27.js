@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136510","romanian":"Mă simt îndatorat moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964318"},{"id":"tat-712075","romanian":"Am vizitat Fukuoka acum zece ani.","english":"I visited Fukuoka ten years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440712"},{"id":"tat-1136801","romanian":"Și-a pierdut toți banii pe care îi avea.","english":"He lost all the money he had.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966361"},{"id":"tat-709900","romanian":"Astfel de incidente sunt destul de obişnuite.","english":"Such incidents are quite common.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426733"},{"id":"tat-1144743","romanian":"Câștigăm o zi.","english":"We are gaining a day.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12077122"},{"id":"tat-1143134","romanian":"E necugetat din partea ta să crezi asemenea lucru.","english":"It is foolish of you to believe such a thing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068893"},{"id":"tat-923884","romanian":"Am petrecut toată seara dansând împreună.","english":"We spent all evening dancing together.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444876"},{"id":"tat-706062","romanian":"Mama îşi trezeşte fiica.","english":"The mother wakes up her daughter.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970709"},{"id":"tat-1108692","romanian":"Ne vedem mâine!","english":"See you tomorrow.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11747448"},{"id":"tat-1185124","romanian":"Te-ai simțit bine la cină?","english":"Did you have a good time at the dinner?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323857"},{"id":"tat-670694","romanian":"Poţi alege orice.","english":"You may choose what you like.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200802"},{"id":"tat-1120212","romanian":"Sunt din Egipt.","english":"I am from Egypt.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11851441"},{"id":"tat-582947","romanian":"Voiam să devin filozof.","english":"I wanted to become a philosopher.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6547233"},{"id":"tat-1186840","romanian":"Știam că era plastic, dar părea din lemn.","english":"I knew it was plastic but it tasted like wood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7317802"},{"id":"tat-406046","romanian":"Ți-aș oferi o cafea dacă ai timp.","english":"I would offer you a coffee if you had the time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6554810"},{"id":"tat-31","romanian":"Cati ani ai?","english":"How old are you?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12065991"},{"id":"tat-1278932","romanian":"Nimeni nu e mai sus de el.","english":"No one is above him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13348271"},{"id":"tat-986478","romanian":"Te iubesc foarte mult.","english":"I love you very much.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637115"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-1089714","romanian":"Ea are mulți bani.","english":"She has a lot of money.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11257804"}],"stories":[{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-aleodor-mp-rat-3","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"Pocitania pământului îi zise: – Toţi nelegiuiţii ce-mi calcă hotarul cad în robia mea. – Mai întâi trebuie să ştii, îi răspunse Aleodor, că din nebăgare de seamă şi fără de voia mea am călcat pe coprinsul tău, şi n-am nici un gând rău asupră-ţi."},{"id":"story-ro-fata-mo-ului-2","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":238,"excerpt":"– Puricele. – Eh! grăi moş Doroftei cam supărat, am să v-astup cloanţa la toate. Ghiciţi acuma, de vă taie capul, de nu, să-l tăiaţi voi pe el: Din pulpă născută, pe claie aruncată, de vultur răpită, de babă robită, la domnie-ajunsă, de ţigancă tunsă: călugăraş mă făcui. Ce să fie? Ce să fie?"},{"id":"story-ro-pas-rea-m-iastr","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat evlavios şi bun. El avea trei feciori. Pe lângă multe bunătăţi ce făcuse oamenilor din împărăţia lui, a ridicat şi o monastire de care să se ducă pomina. A împodobit-o cu aur, cu pietre nestemate şi cu tot ceea ce meşterii din acea ţară au socotit mai scump şi mai frumos."},{"id":"story-ro-poveste-2","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":232,"excerpt":"Iar împărăteasa avea haz, căci începea şi ea, adunându-şi lacrimile în pumni, şi-l certa că prea plânge ca o muiere de fiece şi orişicând. Şi începeau: – Ba iar ai plâns. – Ba n-am plâns. – Ba te-am văzut eu. – Şi eu te-am văzut pe tine. – Ba eu am râs. – Şi eu am râs."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
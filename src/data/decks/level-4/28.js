@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1143120","romanian":"Inversa unei matrice nepătratice este un lucru periculos.","english":"The inverse of a non-square matrix is a dangerous thing.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068786"},{"id":"tat-448211","romanian":"Respectul este temelia vieții.","english":"Respect is the foundation of life.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3873916"},{"id":"tat-1059687","romanian":"Nimeni nu ne poate controla.","english":"Nobody can control us.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10681475"},{"id":"tat-1136575","romanian":"Sosirea trupelor a condus la exacerbarea violențelor.","english":"The arrival of the troops led to more violence.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966041"},{"id":"tat-1153773","romanian":"Am lucrat pe un contract anual.","english":"I worked on a yearly contract.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128476"},{"id":"tat-1185135","romanian":"Acest sol e umed.","english":"This soil is moist.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323926"},{"id":"tat-1128611","romanian":"Ce ai în geantă?","english":"What have you got in your bag?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11912837"},{"id":"tat-670629","romanian":"A abandonat visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1626134"},{"id":"tat-1195295","romanian":"Este funcționar bancar.","english":"He is a bank clerk.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2308938"},{"id":"tat-399619","romanian":"Mulțumesc foarte mult!","english":"Thank you very much!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6359653"},{"id":"tat-1136962","romanian":"Mi-ar plăcea să îmi cunoști părinții.","english":"I would like you to meet my parents.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956302"},{"id":"tat-1279104","romanian":"Asta e mai frumoasă.","english":"This one is more beautiful.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13113773"},{"id":"tat-487314","romanian":"Ea va strânge vesela de pe masă.","english":"She will clear the table of the dishes.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334961"},{"id":"tat-610807","romanian":"Mă surprinzi mereu cu sosirile tale neașteptate.","english":"You always astonish me with your unexpected arrivals.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/615896"},{"id":"tat-1147563","romanian":"Vorbește prea mult.","english":"He talks too much.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095134"},{"id":"tat-1136553","romanian":"Trebuie să înveți toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965315"},{"id":"tat-705997","romanian":"Ai avut un weekend plăcut?","english":"Did you have a good weekend?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968585"},{"id":"tat-708991","romanian":"Presupun că va întârzia.","english":"I suppose he will be late.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420395"},{"id":"tat-1151776","romanian":"Azi e luni.","english":"Today is Monday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118747"},{"id":"tat-864947","romanian":"Trebuie să găsesc o ieşire din acestă problemă.","english":"I need to find a way out of this problem.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10113453"}],"stories":[{"id":"story-ro-greuceanu-2","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"Ei erau trişti, bieţii oameni, dară Greuceanu îi mângâie cu nişte vorbe aşa de dulci, încât le mai veni niţică inimă, că era şi meşter la cuvânt Greuceanu nostru. El îşi puse nădejdea în întâmplarea aceasta şi îşi zise:\"îmi voi încerca norocul."},{"id":"story-ro-g-in-reasa-2","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Împăratul nu mai putea de bucurie de această întâmplare. Condurul sta d-a pururea pe masă în cămara împăratului. Oricine voia să-l încerce avea toată voia. Într-una din zile când împăratul ţinea sfat cu boierii cei mari pentru trebile împărăţiei, iacă şi fie-sa că vine şi se juca şi se zbenguia p-acolo prin cămară."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"},{"id":"story-ro-z-na-mun-ilor","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat foarte viteaz; toate împărăţiile de prinprejurul împărăţiei sale îi cerea sfaturi: atâta era de drept şi înţelept. Când se isca sfadă între dânşii, la acest împărat mergeau mai întâi la judecată şi, cum zicea el, aşa se şi făcea, fiindcă era judecător drept şi iubitor de pace."},{"id":"story-ro-sult-nica-2","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"II E începutul lui decembrie. A dat Dumnezeu zăpadă nemiluită; şi cade, cade puzderie măruntă şi deasă, ca făina la cernut, vânturată de un crivăţ care te orbeşte. Muşcelele dorm sub zăpadă de trei palme. Pădurile, în depărtare, cu tulpini fumurii, par cercelate cu flori de zarzări şi de corcoduşi."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
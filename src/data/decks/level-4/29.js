@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-863658","romanian":"Urăsc aceste cuvinte.","english":"I hate these words.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9141319"},{"id":"tat-1163907","romanian":"A continuat să plângă cât e noaptea de lungă.","english":"She kept crying all night long.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196991"},{"id":"tat-1064343","romanian":"Tom și Mary vor avea un copil.","english":"Tom and Mary are going to have a baby.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11063518"},{"id":"tat-1136809","romanian":"Care e mai veche, această carte sau cealaltă?","english":"Which is older, this book or that one?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966358"},{"id":"tat-406055","romanian":"Când o întâlnisem în București, Anca era studentă.","english":"When I had met her in Bucharest, Anca was a student.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347370"},{"id":"tat-411929","romanian":"Am dus hainele la curățat.","english":"I took my clothes to be cleaned.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272197"},{"id":"tat-1059485","romanian":"Aici s-a întâmplat accidentul.","english":"This is where the accident happened.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10299812"},{"id":"tat-1192731","romanian":"Fratele meu vrea să meargă pe lună cândva.","english":"My brother wants to go to the moon some day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7507022"},{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"},{"id":"tat-708932","romanian":"Cred că am o carie.","english":"I think I have a cavity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398620"},{"id":"tat-1153853","romanian":"Jack e tăcut acum.","english":"Jack is quiet now.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130113"},{"id":"tat-1136850","romanian":"Măcar lasă-mă să te ajut cu masa.","english":"At least let me help with the table.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966285"},{"id":"tat-1192781","romanian":"Primul este inferior ultimului în anumite privințe.","english":"The former is inferior to the latter in some respect.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364292"},{"id":"tat-1163893","romanian":"Un An Nou fericit!","english":"Happy New Year!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196792"},{"id":"tat-1153778","romanian":"Paradoxal, are dreptate.","english":"Paradoxically, he is right.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128544"},{"id":"tat-1136539","romanian":"Îl poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957077"},{"id":"tat-1185108","romanian":"Am fost la Londra.","english":"I have been to London.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195147"},{"id":"tat-698967","romanian":"Ea este Li Ying.","english":"She is Li Ying.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3384009"},{"id":"tat-1144343","romanian":"Piața respectivă s-a extins rapid.","english":"That market has been rapidly expanding.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073795"},{"id":"tat-584853","romanian":"Casa sa este foarte modernă.","english":"Her house is very modern.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812441"}],"stories":[{"id":"story-ro-p-cal-n-satul-lui-2","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"– Măi! ziceau vecinele lui Păcală, ce lucru să mai fie şi ăsta? viţeaua asta le întrece pe toate! Ce-i va fi dând oare să mănânce? Ce soi o fi de creşte aşa de frumos?"},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."},{"id":"story-ro-rodul-tainic-3","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Iară dânsa era Mama Vânturilor. Seara, după ce s-a întors, fiul ei a simţit miros de om pământean. – Simt boare de om, zise el mumei sale. Cine a venit şi în ce treburi umblă? Ea îi spuse ce şi cum, toate din fir a păr, precum le aflase de la Danciu."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-3","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"Tată-său, deznădăjduit, pusese în gând să-l taie; dar fiul său cel mic, Prâslea, veni cu rugăciune către tată-său, şi-i zise: – Tată, atâţia ani l-ai ţinut, ai suferit atâtea necazuri după urma acestui pom, mai lasă-l, rogu-te, şi anul acesta, să-mi încerc şi eu norocul. – Fugi d-aci, nesocotitule, zise împăratul."},{"id":"story-ro-povestea-lui-stan-p-itul-3","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"Ce-a mai fi şi asta? Alţii, că să te ferească Dumnezeu de femeia leneşă, mârşavă şi risipitoare; alţii alte năstruşnicii, încât nu ştii ce să crezi şi ce să nu crezi? Numai nu-i vorbă că am văzut eu şi destui bărbaţi mult mai ticăiţi şi mai chitcăiţi decât cea mai bicisnică femeie."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1279014","romanian":"Toţi au fost amabili cu fata cea nouă.","english":"Everybody was kind to the new girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13353831"},{"id":"tat-944584","romanian":"M-am simţit rău.","english":"I felt bad.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/60061"},{"id":"tat-1136959","romanian":"Vă rog, păstrați restul.","english":"Keep the change, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966081"},{"id":"tat-1136896","romanian":"Sunt atât de bucuros să vizit VNU.","english":"I’m so glad to visit VNU.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966032"},{"id":"tat-1185133","romanian":"S-a produs vreo schimbare în curenții oceanici?","english":"Has a change in ocean currents occurred?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323897"},{"id":"tat-408059","romanian":"I-am dat cărțile acestui student.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232754"},{"id":"tat-1143143","romanian":"Când pot călători?","english":"When can I travel?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068926"},{"id":"tat-406002","romanian":"Astăzi vremea e frumoasă.","english":"Today the weather is nice.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350319"},{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-1143144","romanian":"E un lac în fața casei mele.","english":"There is a lake in front of my house.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068930"},{"id":"tat-1143180","romanian":"Cine ești tu ca să vorbești așa cu mine?","english":"Who are you to talk to me like that?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069234"},{"id":"tat-706044","romanian":"Credeam că era drăguţă.","english":"I thought she was pretty.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969871"},{"id":"tat-1136355","romanian":"Nu e prost.","english":"He is not stupid.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963115"},{"id":"tat-1156691","romanian":"Tragedia este distracția nobililor.","english":"Tragedy is the entertainment of the nobles.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10540794"},{"id":"tat-857387","romanian":"Tango-ul este o exprimare verticală a unei dorinţe orizontale.","english":"Tango is the vertical expression of a horizontal desire.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10023982"},{"id":"tat-1064244","romanian":"Tom a uitat să își ia medicația azi dimineață.","english":"Tom forgot to take his medication this morning.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073232"},{"id":"tat-584840","romanian":"Mobilierul din acest birou este foarte modern.","english":"The furniture in this office is really modern.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812390"},{"id":"tat-1163898","romanian":"Nu îi dau niciodată câinelui meu carne nepreparată.","english":"I never feed my dog raw meat.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196922"},{"id":"tat-488770","romanian":"Guus Hiddink este olandez.","english":"Guus Hiddink is Dutch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528884"},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"}],"stories":[{"id":"story-ro-fata-mo-ului","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":208,"excerpt":"Copiii cutreierau voioşi via părăginită. Un şir, ţinându-se cu amândouă mâinile de mijloc, se încolăcea, strigând de frică să nu-i înhaţe \"mama-gaia\". Fetele începuseră \"de-a ulciorul\". – Cum dai ulciorul? Poveşti de Barbu Ştefănescu Delavrancea - Fata moşului – Cum îl vezi, cu ochii verzi, ş-o lingură de păsat, să nu zacă de vărsat. Sub castani, oamenii stau de vorbă."},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-sarea-n-bucate-3","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":235,"excerpt":"Să te duci de la mine cu sarea ta cu tot! Când auzi fata cea mică a împăratului urgia tatălui său, ce cădea pe capul ei, intră în fundul pământului de mâhnire căci se supărase tată-său şi, încumetându-se, zise: – Să mă ierţi, tată, că eu n-am vrut să te supăr."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."},{"id":"story-ro-greuceanu","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":228,"excerpt":"A fost un împărat şi se numea împăratul Roşu. El era foarte mâhnit că, în zilele lui, nişte zmei furaseră soarele şi luna de pe cer."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
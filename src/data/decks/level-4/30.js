@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-406002","romanian":"Astăzi vremea e frumoasă.","english":"Today the weather is nice.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350319"},{"id":"tat-1153792","romanian":"În noaptea aceea, s-a îmbolnăvit, având dureri de stomac.","english":"That night, he became sick with pains in his stomach.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128717"},{"id":"tat-1059646","romanian":"A fost ocupat.","english":"He has been busy.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795785"},{"id":"tat-708925","romanian":"Doamna Green ne predă muzica.","english":"Miss Green teaches us music.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397994"},{"id":"tat-706083","romanian":"Cui i-a păsat?","english":"Who cared?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970932"},{"id":"tat-986457","romanian":"Astăzi este ziua mea.","english":"Today is my birthday.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637054"},{"id":"tat-584459","romanian":"Tu din nou?","english":"You again?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807669"},{"id":"tat-487031","romanian":"Camera mea este foarte mică.","english":"My room is very small.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435954"},{"id":"tat-1143158","romanian":"Rapida vulpe maronie nu a sărit peste câinele leneș.","english":"The quick brown fox did not jump over the lazy dog.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069001"},{"id":"tat-1143189","romanian":"A strâns vesela de pe masă după cină.","english":"She cleared the table of the dishes after dinner.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069281"},{"id":"tat-1064121","romanian":"Tom a fost la plajă săptămâna trecută.","english":"Tom went to the beach last week.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070852"},{"id":"tat-864477","romanian":"Pe câinele nostru l-am numit White.","english":"We named our dog White.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817260"},{"id":"tat-583889","romanian":"Mă țin întotdeauna de promisiune.","english":"I always keep my promises.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/870644"},{"id":"tat-1136964","romanian":"Ieri, s-a dus la școală să studieze.","english":"He went to school to study yesterday.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957826"},{"id":"tat-1136578","romanian":"Nu tradu această propoziție!","english":"Do not translate this sentence!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966035"},{"id":"tat-670630","romanian":"Probabil, dar el vrea ca să renunţ dintr-odată.","english":"Maybe, but he wants me to stop cold turkey.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1628320"},{"id":"tat-1133950","romanian":"M-am aşezat şi am deschis laptopul meu.","english":"I sat down and opened my notebook.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9939356"},{"id":"tat-1136828","romanian":"Râzi în legătură cu ce?","english":"What are you laughing at?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966362"},{"id":"tat-1156687","romanian":"Acest ceas este stricat.","english":"This clock is broken.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10308903"},{"id":"tat-411912","romanian":"Merg la film dacă am timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272128"}],"stories":[{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-3","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Boiul lor era mândru, amândoi aveau pe vino-ncoace, vorba lor, era vorbă cu lipici şi amândoi erau voinici, nevoie mare. Într-o zi se hotărâră să meargă la vânătoare. Împărăteasa se tot ciudea cum să-şi cunoască pe fiul său: fiindcă şi feţele şi îmbrăcăminţile fiind la fel, de multe ori nu putea să deosebească pe unul din altul."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-2","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"Dorinţa ce ai o să-ţi aducă întristare. – Eu nu am venit să te întreb asta, zise împăratul, ci, dacă ai ceva leacuri care să ne facă să avem copii, să-mi dai. – Am, răspunse unchiaşul; dar numai un copil o să faceţi. El o să fie Făt-Frumos şi drăgăstos, şi parte n-o să aveţi de el."},{"id":"story-ro-bunica-2","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":242,"excerpt":"– A fost odată un împărat mare, mare… – Cât de mare? – Mare de tot. Şi-şi iubea împărăteasa ca ochii din cap. Dar copii nu avea. Şi îi părea rău, îi părea rău că nu avea copii… – Bunico, e rău să nu ai copii? – Fireşte că e rău. Casa omului fără copii e casă pustie."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-ro-sarea-n-bucate","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"A fost odată un împărat. Acest împărat avea trei fete. Rămânând văduv, toată dragostea lui el şi-o aruncase asupra fetelor."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1119749","romanian":"Vorbiți engleza și scoțiana?","english":"Do you speak English and Scottish Gaelic?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511206"},{"id":"tat-1153840","romanian":"Octopusul este în mare.","english":"The octopus is in the sea.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130100"},{"id":"tat-1163911","romanian":"Tata ia metroul de ora 7 către serviciu.","english":"Father takes the 7:00 subway to work.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196999"},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-1118254","romanian":"Noi nu avem zahăr.","english":"We have no sugar.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6657483"},{"id":"tat-1064368","romanian":"Tom și Mary au devenit foarte buni prieteni.","english":"Tom and Mary became very good friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074336"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-1185072","romanian":"O vei invita la petrecere?","english":"Are you going to invite her to the party?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321352"},{"id":"tat-1136710","romanian":"Nimic nou sub soare.","english":"Nothing new under the sun.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212823"},{"id":"tat-1059417","romanian":"M-am uitat în dulap.","english":"I looked in the cupboard.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7087756"},{"id":"tat-1136892","romanian":"Studiază pentru test.","english":"They are studying for the test.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966024"},{"id":"tat-1136621","romanian":"M-a făcut să scriu scrisoarea cu stiloul.","english":"He made me write the letter with a pen.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227767"},{"id":"tat-1153818","romanian":"Rar iese duminica.","english":"Rarely does he go out on Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129254"},{"id":"tat-1136948","romanian":"Am învățat multe din cărțile lui.","english":"I learned a lot from his books.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956892"},{"id":"tat-411957","romanian":"Îl văd pe Dan.","english":"I see Dan.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272287"},{"id":"tat-1064177","romanian":"Dintr-o dată mama a început să cânte.","english":"Suddenly, my mother started singing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070211"},{"id":"tat-599093","romanian":"Știi cine e blonda înaltă îmbrăcata în verde?","english":"Does anybody know who the tall, blond girl dressed in green is?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1448294"},{"id":"tat-1136667","romanian":"Tom a avut ceva probleme la ajustarea setărilor.","english":"Tom had a little trouble adjusting the settings.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227163"},{"id":"tat-1059638","romanian":"Furtuna ne-a împiedicat să ajungem la timp.","english":"The storm prevented us from arriving on time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/918359"},{"id":"tat-1136823","romanian":"Puteam să alerg mult mai rapid când eram tânăr.","english":"I could run much faster when I was young.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966296"}],"stories":[{"id":"story-ro-neghini-3","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":235,"excerpt":"– Bine, bine, zise acelaşi glas, văd eu că nu-ţi trebuie copii… Baba îşi luă inima în dinţi şi zise: – Ba-mi trebuie… da’ unde eşti… cine eşti? – Cine sunt? Neghiniţă, gândul lumii. De mic ce sunt, pătrund în urechile oamenilor şi-i ascult cum gândesc."},{"id":"story-ro-la-crucea-din-sat-3","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– I-ai adăpat? – Asta nu se face acum; știi d-ta bine că noi adăpăm boii când se culcă găinile! – Dar caii... Bujor îi taie vorba: – Bade Mitre!"},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-2","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"După ce-l mai ciocmăni muierea o toană, puse în gând să-i facă voia, căci limbuţia nevestei îl scoase afară din ţâţâni. Se sculă, deci, de dimineaţă, îşi luă copiii şi plecară împreună cu vorba că merge la lemne."},{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-923814","romanian":"Anumite plante cresc bine cu puțină îngrijire.","english":"Some plants grow well with a minimum of care.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10431937"},{"id":"tat-1186852","romanian":"Diferențe subtile în ton diferențiază orginalul de copie.","english":"Subtle differences in tone discriminate the original from the copy.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338196"},{"id":"tat-1151780","romanian":"Azi e joi.","english":"Today is Thursday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119184"},{"id":"tat-1143263","romanian":"Aceea e școala mea.","english":"That is my school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068637"},{"id":"tat-1119722","romanian":"El și-a găsit părinții.","english":"He found his parents.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511953"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-1156696","romanian":"Sunt cetățean american.","english":"I am an American citizen.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11260892"},{"id":"tat-862913","romanian":"Aeroportul a fost închis din cauza ceţei.","english":"The airport was closed because of the fog.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10008928"},{"id":"tat-698918","romanian":"Nu are nimic a face cu mine.","english":"That has nothing to do with me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1802122"},{"id":"tat-1064423","romanian":"Știu că el se uită la mine.","english":"I know he is watching me.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076332"},{"id":"tat-1185074","romanian":"Ar putea deveni jucător de baseball.","english":"He may become a baseball player.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321358"},{"id":"tat-584070","romanian":"Nu a fost deloc recunoscător fostului său profesor.","english":"He was not at all thankful to his former teacher.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262775"},{"id":"tat-862830","romanian":"Prima oară a fost ales de senat în 1984.","english":"He was first elected to the Senate in 1984.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014508"},{"id":"tat-448634","romanian":"Capitala Italiei este Roma.","english":"The capital of Italy is Rome.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5020749"},{"id":"tat-1136612","romanian":"Ca să spunem adevărul, această propoziţie foloseşte modul conjunctiv.","english":"Truth be told, this sentence uses the subjunctive mood.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966006"},{"id":"tat-709036","romanian":"A ţintit pasărea.","english":"He aimed at the bird.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420325"},{"id":"tat-1192845","romanian":"Fața ei s-a albit.","english":"Her face turned pale.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361489"},{"id":"tat-712088","romanian":"Tom s-a ascuns sub masă.","english":"Tom hid under the table.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440023"},{"id":"tat-670649","romanian":"Când aduni trei cu patru, obţii şapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974575"}],"stories":[{"id":"story-ro-ion-roat-i-cuza-vod-3","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Numai atâta, că bătrânii voiau \"Unire\" cu tocmală, iar tinerii \"Unire\" fără socoteală, cum s-a şi făcut."},{"id":"story-ro-departe-departe","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"Sub castanii din via părăsită, mai mulţi copilaşi, în cămăşi albe, mă înconjuraseră. Stam pe pământul cald, cu mâinile sub cap, privind adâncul cerului albastru, şi povesteam. Poveşti de Barbu Ştefănescu Delavrancea - Departe, departe O fetiţă îmi sorbea cuvintele, dând într-o parte şi alta, pletele negre ce-i acopereau ochii ei mari şi verzi…"},{"id":"story-ro-scormon-3","title":"Scormon","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":205,"excerpt":"Îi părea c-a mai văzut adeseori acest câine, dar unde și cum nu-și aducea aminte. Deodată, fața ei se însenină. — Scormon! strigă ea cu bucurie, ca și când ar întâlni un vechi prieten."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-2","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":221,"excerpt":"Pentru aceasta ele ca să arate că nu le pasă de nebăgarea lui de seamă, între ele, îl porocleau cu numele de Făt-Frumos al satului. Şi de unde să nu fie aşa!"},{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1120906","romanian":"El este un conducător auto cu experienţă.","english":"He is an expert driver.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11856429"},{"id":"tat-411952","romanian":"L-am vizitat pe Dan.","english":"I visited Dan.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272272"},{"id":"tat-1136526","romanian":"Acum fă-ți temele.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965105"},{"id":"tat-1136890","romanian":"Ei sunt un poet și un om de stat.","english":"They are a poet and a statesman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957806"},{"id":"tat-411959","romanian":"O văd pe Dana.","english":"I see Dana.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272293"},{"id":"tat-1124704","romanian":"Dicţionarul de pe birou este al meu.","english":"The dictionary on the desk is mine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11875296"},{"id":"tat-1136840","romanian":"Tom consideră că Mary e o eroină.","english":"Tom considers Mary to be a heroine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966335"},{"id":"tat-1090366","romanian":"Mă poţi auzi?","english":"Can you hear me?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11523377"},{"id":"tat-708953","romanian":"Nimănui nu-i pasă de ceea ce crezi.","english":"Nobody cares what you think.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8418403"},{"id":"tat-1147450","romanian":"Ce vârstă aveți?","english":"What is your age?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094234"},{"id":"tat-709046","romanian":"Engleza este o limbă internaţională.","english":"English is an international language.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420340"},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-1136542","romanian":"O puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965557"},{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-405835","romanian":"Transmite-i, te rog, salutări doamnei Andreescu!","english":"Please say hello to Mrs. Andreescu!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350559"},{"id":"tat-1153804","romanian":"Vii la petrecere, da?","english":"Come to the party, will you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128886"},{"id":"tat-1143631","romanian":"Îmi place să mă uit la televizor.","english":"I like to watch TV.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071796"},{"id":"tat-1151785","romanian":"Azi e vineri.","english":"Today is Friday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119197"},{"id":"tat-1136673","romanian":"Care este țelul principal al acestei societăți?","english":"What is the chief aim of this society?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966138"},{"id":"tat-1136700","romanian":"Mi-a dat ce bani avea la el.","english":"He gave me what money he had with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239591"}],"stories":[{"id":"story-ion","title":"Ion","author":"Liviu Rebreanu","difficulty":6,"genre":"fiction","wordCount":165,"excerpt":"Ion era un tanar tarani din satul Pripas, din Transilvania. Desi era sarac, el visa sa aiba pamant propriu. Pentru el, pamantul era totul - mai important decat dragostea, mai important decat orice. In sat traiau doua fete: Ana, sarac ca el, pe care o iubea cu adevarat, si Florica, fiica unui gospodar bogat."},{"id":"story-ro-poveste-r-neasc","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":252,"excerpt":"A fost odată un împărat. El avea trei feciori. Când fu la ceasul morţii, îşi chemă feciorii şi le zise: Poveşti de Petre Ispirescu - Poveste ţărănească – Feţii mei, sunt cu sufletul la gură, precum mă vedeţi; un lucru numai vă cei: în cele trei nopţi după înmormântarea mea, să-mi păziţi mormântul, câte unul din voi."},{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"},{"id":"story-ro-cei-trei-fra-i-mp-ra-i","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un biet om sărac. El avea femeie şi trei copilaşi. Lucra bietul om de da pe brânci, zi şi noapte, orice şi pe unde găsea, şi două în tei nu putea lega şi el. Bieţii copilaşi erau mai mult flămânzi decât sătui."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un om. El avea o fată şi un băiat. Şi rămânând văduv de muma copiilor, îl îndemnă ariciul să se însoare a doua oară. Neveste-sei îi sta aceşti copilaşi ca sarea în ochi. Nu era dimineaţă, nu era seară, nu era clipă lăsată de la Dumnezeu să nu-i amărască."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1144337","romanian":"A rupt logodna într-o criză de mânie.","english":"She broke off her engagement in a fit of anger.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073722"},{"id":"tat-1048538","romanian":"La început a făcut Dumnezeu cerul și pământul.","english":"In the beginning God created the heavens and the earth.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10934554"},{"id":"tat-1195264","romanian":"Vreau să citiți această carte.","english":"I want you to read this book.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7228754"},{"id":"tat-1192751","romanian":"Puteți scădea prețul dacă voi cumpăra două?","english":"Could you knock down the price if I buy two?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1429026"},{"id":"tat-399273","romanian":"Bine ați venit!","english":"Welcome.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334977"},{"id":"tat-1143257","romanian":"I-a pus întrebări.","english":"He asked her questions.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068610"},{"id":"tat-706032","romanian":"Preţurile sunt mari.","english":"Prices are high.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969720"},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-1185249","romanian":"Un măr pe zi ține doctorul departe.","english":"An apple a day keeps the doctor away.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324562"},{"id":"tat-1185175","romanian":"Atletul părea imun la oboseală.","english":"The athlete seemed immune to fatigue.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324302"},{"id":"tat-1159828","romanian":"Casa lui e plină de lucruri utile.","english":"His house is full of convenience.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167796"},{"id":"tat-411911","romanian":"Aș merge la film dacă aș avea timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272125"},{"id":"tat-1143269","romanian":"Oamenii sunt în echipă.","english":"The people are on the team.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068650"},{"id":"tat-923926","romanian":"Ce fel de lucruri te întristează?","english":"What sort of things make you feel sad?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/805469"},{"id":"tat-411890","romanian":"Când era studentă, mergea des la discotecă.","english":"When she was a student, she used to go to the disco often.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272038"},{"id":"tat-1143119","romanian":"Tom va ajunge o oră mai târziu.","english":"Tom will be arriving an hour late.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070045"},{"id":"tat-1136874","romanian":"E destul de supărată.","english":"She is quite angry.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956314"},{"id":"tat-1136527","romanian":"Făceți-vă temele acum.","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965357"},{"id":"tat-1143652","romanian":"Aceasta este gratuită.","english":"This is free.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071965"},{"id":"tat-1144324","romanian":"I s-a făcut o injecție înainte de operație.","english":"He had an injection prior to the operation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073578"}],"stories":[{"id":"story-ro-fata-cu-pieze-rele-2","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Se silea bietul împărat, cu toţi cei doisprezece fii ai săi, să facă pace, să fie între oameni bună învoire, să oprească relele ce-l bântuiau, dar geaba, pagubele curgeau gârlă. În cele mai de pe urmă chemă un cetitor de stele să-i spuie ce e pricina de-i merg lucrurile anapoda şi nu poate să dea înainte."},{"id":"story-ro-popa-duhu-3","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Vorba ceea: \"Geasta cu trepădatele, că nu-s departe satele\". Aci era la Socola, aci în Iaşi, aci la monăstirea şi în Târgul-Neamţului profesor, de unde cutriera munţii în sudoarea frunţii, şi mai la tot pasul cânta: Ruinata cetăţuie, ce acopere-acel munte, Şi de unde ochiul vede lucruri multe!"},{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."},{"id":"story-ro-c-lin-nebunul-3","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":209,"excerpt":"– Hai! Şi l-a omorât şi pe acesta ş-a făcut patru căpiţi de carne din capetele lui. Acu, când s-au trezit ei, o-nceput să-i deie de grijă lui Călin Nebunul că să păzească bine focul. Acu el a treia noapte era să fie. Acu iar pe la miezul nopţii s-auzi un huiet mare. Un zmeu era – cu opt capete."},{"id":"story-ro-inul-i-c-me-a","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Inul: – Ştii tu, cămeşă dragă, ce erai odată? Poveşti de Ion Creangă - Inul şi cămeşa – Ce să fiu? Eram ceea ce mă vezi: cămeşă albă, cu care se îmbracă oamenii. – Nu-i aşa!"}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1185145","romanian":"Concertul va avea loc vara viitoare.","english":"The concert will take place next summer.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324001"},{"id":"tat-698947","romanian":"De ce mă iubești?","english":"Why do you love me?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636872"},{"id":"tat-1056784","romanian":"Majoritatea copiilor urăsc școala.","english":"Most children hate school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031352"},{"id":"tat-1153891","romanian":"Felicitările mele mâinilor care au făcut asta posibilă.","english":"My compliments to the hands that made this possible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104030"},{"id":"tat-1110606","romanian":"Ma ajutat foarte mult.","english":"It helped me a lot.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3824983"},{"id":"tat-1185070","romanian":"Mi-e teamă că am luat o răceală.","english":"I worry that I have caught a cold.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321256"},{"id":"tat-1089709","romanian":"Nu știam despre planul lui.","english":"I was ignorant of his plan.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11265216"},{"id":"tat-1136816","romanian":"Trebuie doar să exersezi în fiecare zi.","english":"You have only to practice every day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966330"},{"id":"tat-1143685","romanian":"M-am săturat de asta.","english":"I am fed up with it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072255"},{"id":"tat-446714","romanian":"Mi-a dat niște cărți.","english":"He gave me some books.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6823779"},{"id":"tat-1192805","romanian":"Nu putem întreba nimic despre vârstă sau probleme fizice.","english":"We cannot ask anything about age or physical problems.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354070"},{"id":"tat-1120161","romanian":"Noi îl cunoaștem.","english":"We know him.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6649770"},{"id":"tat-1059623","romanian":"Poți fi chiar președinte!","english":"You can even be a president!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8037893"},{"id":"tat-1201211","romanian":"Am venit, am văzut, am învins.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12432138"},{"id":"tat-1064365","romanian":"Tom și Mary sunt din același oraș.","english":"Tom and Mary are from the same city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074444"},{"id":"tat-411885","romanian":"Mi-am adus câteva cărți de citit.","english":"I brought some of my books to read.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272023"},{"id":"tat-709035","romanian":"În afară de mine, toată lumea este ocupată.","english":"Everybody is busy except me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420321"},{"id":"tat-708940","romanian":"Preţurile vor creşte din ce în ce mai mult.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419499"},{"id":"tat-698970","romanian":"Viața este scurtă.","english":"Life is short.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3582733"},{"id":"tat-488786","romanian":"Cât este ceasul?","english":"What time is it?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528939"}],"stories":[{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"},{"id":"story-ro-mo-nichifor-co-cariul","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Moş Nichifor nu-i o închipuire din poveşti, ci e un om ca toţi oamenii; el a fost odată, când a fost, trăitor din mahalaua Ţuţuenii din Târgul Neamţului, dinspre satul Vânătorii Neamţului."},{"id":"story-ro-ileana-cea-ireat-3","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acuma fata de împărat se apropie de fereastră şi grăi cu glas blând: – Ţi-am zis să mergi pe calea pe care ai venit: spini să-ţi crească-n cale şi flori să-ţi rămână pe urmă. Încă trei zile şi trei nopţi stete feciorul de împărat la fereastra fetei."},{"id":"story-ro-pas-rea-m-iastr-2","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Iară a treia noapte visă împăratul că dacă va aduce cineva pasărea măiastră de pe tărâmul celălalt şi să-i aşeze cuibul în turn, se va putea face monastirea desăvârşit. Spuse fiilor acest vis, iară ei se întreceau care de care să plece mai-nainte, şi să se închine cu slujba la tată-său împăratul."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-3","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Când luă ştergarul să se şteargă pe ochi, ce să vază? Trei picături de sânge pe dânsul. El îşi zise:\"Trebuie să mă întorc acasă, căci Dumnezeu ştie ce va fi păţit baba mea.\" Întinse unchiaşul la drum. Nu mai căuta nici de mâncare, nici de odihnă, şi se întoarse acasă cum plecase. – Ce ţi s-a întâmplat, babo?"}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
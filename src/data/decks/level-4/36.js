@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1153834","romanian":"Puteam auzi gemetele bărbatului rănit.","english":"We could hear the groans of the injured man.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130091"},{"id":"tat-1056757","romanian":"Spre deosebire de fratele ei, Sienna este foarte introvertită.","english":"Unlike her brother, Sienna is very introverted.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031405"},{"id":"tat-1163919","romanian":"Sherman s-a întâlnit cu Johnston câteva zile mai târziu.","english":"Sherman met with Johnston a few days later.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197069"},{"id":"tat-1186844","romanian":"Metodele sale nu sunt ştiinţifice.","english":"His methods are not scientific.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338130"},{"id":"tat-1136548","romanian":"Și-a atribuit eşecul ghinionului.","english":"She ascribed her failure to bad luck.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965103"},{"id":"tat-1064267","romanian":"Ce fel de mâncare îi place lui Tom?","english":"What kind of food does Tom like?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064842"},{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"},{"id":"tat-1057690","romanian":"Efectele au avut impact mai mult asupra familiilor sărace.","english":"The effects have impacted most on poorer families.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11036698"},{"id":"tat-411900","romanian":"Răzvan tocmai plecă.","english":"Razvan just left.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272077"},{"id":"tat-1143841","romanian":"Își ține întotdeauna promisiunile.","english":"He always fulfills his promises.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070728"},{"id":"tat-1136431","romanian":"A mers pe cal până la mare.","english":"He rode a horse to the sea.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965821"},{"id":"tat-487317","romanian":"Noi adesea dăm peste turiștii japonezi în această zonă.","english":"We often come across Japanese tourists in this area.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335455"},{"id":"tat-1136960","romanian":"Poți culca copiii?","english":"Can you put the children to bed?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958000"},{"id":"tat-1153855","romanian":"A fost trimis la închisoare pentru furt.","english":"He was sent to jail for the robbery.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130115"},{"id":"tat-1153865","romanian":"Fulgerele pot fi periculoase.","english":"Lightning can be dangerous.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098350"},{"id":"tat-1136512","romanian":"Era cam douăzeci de dolari.","english":"It was about twenty dollars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11961625"},{"id":"tat-1185073","romanian":"Treci la subiect!","english":"Get to the point!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321357"},{"id":"tat-708930","romanian":"Biroul lui este foarte aproape de al meu.","english":"His office is very close to mine.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398356"},{"id":"tat-583839","romanian":"Tom s-a căsătorit cu o femeie mai în vârsta.","english":"Tom married an older woman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2255151"},{"id":"tat-1059423","romanian":"Când pleci de aici?","english":"When do you leave here?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9551350"}],"stories":[{"id":"story-ro-porcul-cel-fermecat","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"A fost odată un împărat şi avea trei fete. Şi fiind a merge la bătălie, îşi chemă fetele şi le zise: Poveşti de Petre Ispirescu - Porcul cel fermecat – Iacă, dragele mele, sunt silit să merg la război. Vrăjmaşul s-a sculat cu oaste mare asupra noastră. Cu mare durere mă despart de voi."},{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."},{"id":"story-ro-povestea-lui-stan-p-itul","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Era odată un flăcău stătut, pe care-l chema Stan. Şi flăcăul acela din copilăria lui se trezise prin străini, fără să cunoască tată şi mamă şi fără nici o rudă care să-l ocrotească şi să-l ajute."},{"id":"story-ro-popa-tanda-2","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"Minunat om ar fi părintele Trandafir dacă nu l-ar strica un lucru. Este cam greu la vorbă, cam aspru la judecată: prea de-a dreptul, prea verde-fățiș. El nu mai sucește vorba, ci spune drept în față, dacă i s-a pus ceva pe inimă. Nu e bine să fie omul așa. Oamenii se prea supără când le luăm căciula din cap."},{"id":"story-ro-balaurul-cel-cu-apte-capete-3","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Atunci un sânge negru lasă din ea, fiară spurcată, şi curse, şi curse, până ce stinse şi foc şi tot. Acum ce să facă viteazul nostru, ca să nu găsească focul stins, când s-or deştepta tovarăşii lui, căci legătura lor era ca să omoare pe acela care va lăsa să se stingă focul."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-708987","romanian":"Lasă-mă să tai morcovii.","english":"Let me cut the carrots.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420387"},{"id":"tat-1192833","romanian":"A picotit întreaga zi.","english":"He slumbered out the whole day.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360778"},{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-487295","romanian":"Străzile noastre se inundă când plouă.","english":"Our streets flood when we have rain.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270651"},{"id":"tat-702190","romanian":"Acest peşte miroase urât.","english":"This fish smells bad.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397702"},{"id":"tat-408013","romanian":"Ce crezi că are de gând Dana?","english":"What do you think Dana has in mind?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532049"},{"id":"tat-1064200","romanian":"Fustele mini nu mai sunt la modă.","english":"Miniskirts have gone out of fashion.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066254"},{"id":"tat-610804","romanian":"După nașterea copilului trebuie să lucrezi jumătate de normă.","english":"After the birth of your child, you should make your work part-time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/614825"},{"id":"tat-1192719","romanian":"S-a conformat cerinței mele.","english":"She complied with my request.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6655519"},{"id":"tat-1186834","romanian":"Prefer mersul pe bicicletă.","english":"I prefer biking.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7304101"},{"id":"tat-1143133","romanian":"Întotdeauna sunt ajutat de tine.","english":"I am always helped by you.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068889"},{"id":"tat-923891","romanian":"Camera arată diferit, acum îmi place mai mult.","english":"The room looks different, now I like it more.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10445017"},{"id":"tat-1057661","romanian":"L-au dat afară din discotecă fără nicio explicație.","english":"They kicked him out of the disco without any explanation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11037179"},{"id":"tat-1192768","romanian":"Pentru ce ai cumpărat acest dicționar costisitor?","english":"What did you buy this expensive dictionary for?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357179"},{"id":"tat-411897","romanian":"Vă trimisesem deja scrisoarea când mi-ați dat telefon.","english":"I had already sent you the letter when you called.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272065"},{"id":"tat-862416","romanian":"Fericirea nu se cumpără.","english":"One does not buy happiness.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9462186"},{"id":"tat-709037","romanian":"Du-i înapoi cartea asta.","english":"Take this book back to him.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420326"},{"id":"tat-399615","romanian":"Noapte bună, mamă.","english":"Good night, Mom.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6327701"},{"id":"tat-1136903","romanian":"Avem nevoie de ceva educație formală în literatură.","english":"We need some formal instruction in literature.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966068"},{"id":"tat-1059613","romanian":"Cele mai frumoase fete sunt din Lituania.","english":"The most beautiful girls are from Lithuania.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9569381"}],"stories":[{"id":"story-ro-gura-satului","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Nu-i vorbă, răi sunt oamenii, încât mai răi nici n-ar putea să fie. Chiar și acela pe care toată lumea îl știe de bun își are ceasurile de răutate, și nu avem decât să-l atingem unde-l doare pentru ca să-l facem mai dârz decât alții. Dar nenea Mihu tot om bun rămâne."},{"id":"story-ro-uer-2","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":215,"excerpt":"Kira şi-aşteaptă voinicul din haiducie. În coarne de cerb atârnă carabine cu guri largi şi pistoale cu plăsele de argint şi de sidef. Văpaiţa, cu feştilă de câlţi răsuciţi, tremură în colibă o lumină galbenă şi tristă. Flacăra ei slabă joacă, ca şi când ar voi să scape din feştilă, şi aruncă umbra Kirei, de pe perete, sus, pe grinzi."},{"id":"story-ro-george-cel-viteaz-2","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"Balaurul, văzând una ca aceasta, se repezi şi el asupra împărătesei. Dar împărăteasa dete un ţipet şi se deşteptă. Îi sărise inima de frică şi-i tremurau toate cărnurile. P-aci, p-aci era să şi leşine. Spuse împăratului pocitania de vis, şi rămase şi el înmărmurit de groază."},{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-ro-norocul-dracului-3","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":238,"excerpt":"Dar unde să adoarmă? Jos, pământul tare şi rece; sus, întuneric adânc; în casă, copiii adorm plângând; în curte Plăviţa pufăie pe nări a foame; şi el, prigonit de gânduri şi de nenoroc. \"Dar mâine? Dacă n-oi avea ce scutura în copaie? Ce mă fac mâine?"}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
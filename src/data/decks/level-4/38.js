@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1143234","romanian":"Tom a cerut un apel de deșteptare.","english":"Tom asked for a wake-up call.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068482"},{"id":"tat-862344","romanian":"În general, bărbaţii sunt mai înalţi decât femeile.","english":"Generally speaking, men are taller than women.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10085812"},{"id":"tat-1153768","romanian":"Nu simte nicio reticență în recunoașterea erorilor.","english":"He feels no reluctance in acknowledging errors.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128216"},{"id":"tat-1136525","romanian":"Fă-ți temele acum!","english":"Do your homework now.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965332"},{"id":"tat-698963","romanian":"Unde te duci?","english":"Where are you going to?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3220541"},{"id":"tat-709020","romanian":"Becul s-a ars.","english":"The light bulb has burned out.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420302"},{"id":"tat-705792","romanian":"Acest subiect ar trebui discutat in detaliu.","english":"This subject should be discussed in detail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963142"},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-1153756","romanian":"Trebuie să-mi clătesc gura.","english":"I need to rinse my mouth.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4660319"},{"id":"tat-1192742","romanian":"Avionul se apropia de Londra.","english":"The plane was approaching London.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511266"},{"id":"tat-1136318","romanian":"Studiez istoria artei.","english":"I study art history.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963188"},{"id":"tat-1136876","romanian":"Tom a observat o schimbare la Mary.","english":"Tom noticed a change in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960285"},{"id":"tat-1136692","romanian":"Muncește din greu pentru a-și atinge scopul.","english":"He works hard to achieve his goal.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239729"},{"id":"tat-709895","romanian":"Şi-a ţinut respiraţia.","english":"He held his breath.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426687"},{"id":"tat-1151783","romanian":"Azi e sâmbătă.","english":"Today is Saturday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119193"},{"id":"tat-1136627","romanian":"Cu toții ne dorim pace.","english":"We all wished for peace.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239780"},{"id":"tat-670618","romanian":"Pe ce linie pentru Boston?","english":"What track for Boston?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1346020"},{"id":"tat-1185251","romanian":"Te rog să te întorci de-ndată.","english":"Please come back at once.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328033"},{"id":"tat-709044","romanian":"De-abia plecasem de acasă când a început ploaia.","english":"I had scarcely left home when it began to rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420334"},{"id":"tat-1119732","romanian":"Scuză-mă, vorbești engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7144127"}],"stories":[{"id":"story-amintiri-copilarie","title":"Amintiri din copilarie","author":"Ion Creanga","difficulty":5,"genre":"memoir","wordCount":175,"excerpt":"Stau cateodata si-mi aduc aminte ce vremuri si ce oameni mai erau in partea locului, pe cand eram eu copil. Si, drept sa spun, pare-mi-se ca pe atunci oamenii erau mai sarguitori, mai voiosi si mai buni la suflet decat cei de astazi."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-hagi-tudose-3","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"II Aşa m-au judecat şi pe mine, şi n-oi mai uita mai ales ochii mici şi vărgaţi ai ctitorului, care-mi tălmăcea zugrăvelile, înfigând degetul arătător asupra sfinţilor şi oftând parcă ar fi voit să plângă vremile apuse şi credinţele de odinioară. Erau patru. Trei – cu giubele lungi, cu şepci cu cozoroace de lac, crăpate şi şterse de lustru."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-2","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":215,"excerpt":"Căzu în genunche şi se rugă lui Dumnezeu, şi o! minune! deodată răsări, măre, dintr-un colţ al chiliei sale o viţă, şi numaidecât crescu şi se înălţă, până la streaşina casei."}],"recipes":[{"id":"recipe-clatite","title":{"ro":"Clatite","en":"Romanian Crepes"},"description":{"ro":"Clatitele sunt prajituri subtiri servite cu gem, ciocolata sau branza.","en":"Crepes are thin pancakes served with jam, chocolate or cheese."},"difficulty":2,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"200 g"},{"ro":"lapte","en":"milk","amount":"400 ml"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"zahar","en":"sugar","amount":"2 linguri"},{"ro":"sare","en":"salt","amount":"1 varf lingurita"},{"ro":"ulei","en":"oil","amount":"2 linguri"},{"ro":"gem sau ciocolata","en":"jam or chocolate","amount":"pentru umplutura"}],"steps":[{"ro":"Se bate faina cu ouale si zaharul.","en":"Beat flour with eggs and sugar."},{"ro":"Se adauga laptele treptat, amestecand.","en":"Gradually add milk, stirring."},{"ro":"Se adauga uleiul si sarea.","en":"Add oil and salt."},{"ro":"Se incinge tigaia si se ung clatite subtiri.","en":"Heat pan and make thin crepes."},{"ro":"Se intinde umplutura si se ruleaza.","en":"Spread filling and roll up."},{"ro":"Se servesc calde.","en":"Serve warm."}]}]};
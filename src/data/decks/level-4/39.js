@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1151810","romanian":"Tom e musulman.","english":"Tom is a Muslim.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119099"},{"id":"tat-1059656","romanian":"Ce limbi se vorbesc în Belgia?","english":"What languages do they speak in Belgium?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029005"},{"id":"tat-583829","romanian":"Tom a ajuns ultimul.","english":"Tom was the very last to arrive.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2203704"},{"id":"tat-1192713","romanian":"A avut timp să-și pregătească oamenii de luptă.","english":"He had time to prepare his men for battle.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2953687"},{"id":"tat-1143130","romanian":"Calciul lipsește din dieta lui.","english":"Calcium is absent from his diet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068855"},{"id":"tat-20","romanian":"Vorbesti engleza?","english":"Do you speak English?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6323264"},{"id":"tat-488761","romanian":"Autobuzele vor ajunge în stație după cinsprezece minute.","english":"The bus will arrive at the station in fifteen minutes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268740"},{"id":"tat-1159850","romanian":"Azi e foarte cald.","english":"It is very hot today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168080"},{"id":"tat-1144308","romanian":"Problema l-a făcut cunoscut.","english":"The matter made his name known.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073372"},{"id":"tat-1136958","romanian":"Știe că îl iubești?","english":"Does he know that you love him?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960492"},{"id":"tat-1059644","romanian":"A fost foarte prietenos cu toată lumea.","english":"He was very friendly to everybody.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795791"},{"id":"tat-488766","romanian":"Nu toate browserele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268767"},{"id":"tat-709911","romanian":"John a depus mărturie în ceea ce îl priveşte.","english":"John testified concerning him.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426745"},{"id":"tat-1136593","romanian":"Am reușit să trec examenul.","english":"I was able to pass the exam.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966064"},{"id":"tat-1195248","romanian":"E în bani.","english":"He is in the money.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7171087"},{"id":"tat-670675","romanian":"Poţi să-l alegi pe care îl vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200655"},{"id":"tat-583956","romanian":"Orice ai spune, răspunsul e \"nu\".","english":"No matter what you say, the answer is \"no.\"","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799488"},{"id":"tat-706078","romanian":"Care echipă a câştigat meciul?","english":"Which team won the game?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970911"},{"id":"tat-406809","romanian":"Cum te numești?","english":"What is your name?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347301"},{"id":"tat-1143285","romanian":"Am crezut că va veni curând.","english":"I thought he would come soon.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068675"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":221,"excerpt":"La 1857, pe când se ferbea Unirea în Iaşi, boierii moldoveni liberali, ca de-alde Costache Hurmuzachi, M. Kogălniceanu şi alţii, au găsit cu cale să cheme la Adunare şi câţiva ţărani fruntaşi, câte unul din fiecare judeţ, spre a lua şi ei parte la facerea acestui măreţ şi nobil act naţional."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-mo-nichifor-co-cariul-2","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":224,"excerpt":"Două iepe, albe ca zăpada şi iuţi ca focul, se sprijineau mai totdeauna de oiştea căruţei; mai totdeauna, dar nu totdeauna, căci moş Nichifor era şi geambaş de cai, şi când îi venea la socoteală, făcea schimb, ori vindea câte-o iapă chiar în mijlocul drumului, şi atunci rămânea oiştea goală pe de-o parte."},{"id":"story-ro-o-via-pierdut-2","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acum se stânge, încât abia mai rămâne sămânță de lumină… acum se ridică mai lătăreață și mai îndărătnică. Moș Mărian privește, îi ies lacrămile din ochi, i se sloiesc pe gene… De mult s-a-ntunecat și el mereu privește, ca și când ar voi să-și tălmăcească taina vieții din jocul acelei flăcări. În sfârșit, se mișcă."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-2","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":214,"excerpt":"Făt-Voinic, feciorul de împărat. Focul cailor se stâmpără în zărirea celor trei surori şi călăreţii deteră în pas mai încetişor, până ce, veniţi şi sosiţi, se simţiră duşi."}],"recipes":[{"id":"recipe-mamaliga","title":{"ro":"Mamaliga","en":"Romanian Polenta"},"description":{"ro":"Mamaliga este un preparat traditional din faina de porumb, servit ca garnitura sau fel principal.","en":"Mamaliga is a traditional dish made from cornmeal, served as a side or main course."},"difficulty":2,"category":"side","ingredients":[{"ro":"faina de porumb (malai)","en":"cornmeal","amount":"250 g"},{"ro":"apa","en":"water","amount":"1 litru"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"unt","en":"butter","amount":"50 g (optional)"}],"steps":[{"ro":"Se pune apa cu sare la fiert intr-o oala adanca.","en":"Bring salted water to boil in a deep pot."},{"ro":"Cand apa clocoteste, se adauga malaiul treptat, amestecand continuu.","en":"When water boils, gradually add cornmeal, stirring continuously."},{"ro":"Se amesteca cu o lingura de lemn timp de 25-30 minute.","en":"Stir with a wooden spoon for 25-30 minutes."},{"ro":"Mamaliga este gata cand se dezlipeste usor de peretii oalei.","en":"Polenta is ready when it easily comes off the pot walls."},{"ro":"Se rastoarna pe un tocator de lemn si se taie cu ata.","en":"Turn onto a wooden board and cut with string."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-708922","romanian":"Poate o să ningă.","english":"Maybe it will snow.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397946"},{"id":"tat-702061","romanian":"El a ţinut un jurnal în timpul călătoriei.","english":"He kept a diary during the trip.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398898"},{"id":"tat-487312","romanian":"Eram în căutarea unei locuințe de închiriat.","english":"I was on the hunt for lodgings.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7006421"},{"id":"tat-1059643","romanian":"S-a întins pe pat.","english":"He laid himself on the bed.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758837"},{"id":"tat-923822","romanian":"Astăzi profesorul a ales ca subiect \"cultura chinezească\".","english":"Today the teacher chose \"Chinese culture\" as a topic.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10433149"},{"id":"tat-1143187","romanian":"Tom pare a fi interesat de Mary.","english":"Tom seems to be interested in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069268"},{"id":"tat-1143254","romanian":"Domnul Kinoshita și-a lăsat ochelarii la birou ieri seară.","english":"Mr Kinoshita left his glasses behind in the office yesterday evening.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068562"},{"id":"tat-1059443","romanian":"Când vine vorba de gătit, nimeni nu mă întrece.","english":"When it comes to cooking, no one can beat me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9509387"},{"id":"tat-699632","romanian":"Îţi place floarea aceasta?","english":"Do you like this flower?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320252"},{"id":"tat-1136531","romanian":"S-a îmbrăcat cu jacheta roșie.","english":"He put on the red jacket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965117"},{"id":"tat-1143615","romanian":"Îmi place rockul.","english":"I love rock.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071631"},{"id":"tat-1136710","romanian":"Nimic nou sub soare.","english":"Nothing new under the sun.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212823"},{"id":"tat-698951","romanian":"Am 2 frați.","english":"I have two brothers.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2817943"},{"id":"tat-706145","romanian":"A traversat frontiera.","english":"He passed across the border.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974711"},{"id":"tat-702065","romanian":"Agenţia de voiaj ne-a furnizat toate detaliile turului.","english":"The travel company furnished us with all the details of the tour.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398902"},{"id":"tat-1143230","romanian":"Mă doare brațul unde m-ai lovit.","english":"I have a very sore arm where you hit me.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068473"},{"id":"tat-1136402","romanian":"Conducerea a încercat să liniștească muncitorii oferindu-le un bonus.","english":"Management tried to appease labor by offering them a bonus.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962896"},{"id":"tat-706020","romanian":"Formează câte o propoziție cu fiecare dintre aceste cuvinte.","english":"Make a sentence with each of these words.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968869"},{"id":"tat-698973","romanian":"Cartea este mare.","english":"The book is big.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3870973"},{"id":"tat-1136656","romanian":"Cina va fi servită la bordul avionului.","english":"Dinner will be served on board the plane.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966176"}],"stories":[{"id":"story-ro-z-na-z-nelor","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":";A fost odată un împărat mare şi puternic, şi el avea trei feciori. Făcându-se mari, împăratul se gândi fel şi chipuri cum să facă să-şi însoare copiii ca să fie fericiţi. Într-o noapte, nu ştiu ce visă împăratul, că a doua zi, de mânecate, îşi chemă copiii şi se urcă cu dânşii în pălimarul unui turn ce avea în grădină."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-2","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Atunci fata babei, vicleană cum era, lua ciurul şi fuga în casă la babă şi la moşneag, spunând că ea a tors acele fuse. În zadar fata moşneagului spunea în urmă că acela este lucrul mâinilor sale; căci îndată o apucau de obraz baba şi cu fiică-sa şi trebuia numaidecât să rămâie pe-a lor."},{"id":"story-ro-ileana-simziana-3","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"– Oricum, tată, spune-ne şi nouă, că doară nu s-o face gaură în cer, dacă vom şti şi noi ce lucru te amăraşte. Dacă văzu împăratul că-l înteţesc fetele cu rugăciunile, zise: – Iată, copilele mele de ce sunt tot trist."},{"id":"story-praslea","title":"Praslea cel voinic","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":175,"excerpt":"Intr-o imparatie de demult traia un imparat care avea trei fii: doi mari si unul mic, pe care-l chema Praslea. Fratii cei mari erau mandri si rasfatati, dar Praslea era harnic si cuminte. Imparatul avea o gradina cu meri de aur, dar in fiecare noapte venea cineva si fura merele. Nimeni nu stia cine este hotul."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
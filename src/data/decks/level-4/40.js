@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1153152","romanian":"Nu e un om care să spună o minciună.","english":"He is not a man to tell a lie.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692344"},{"id":"tat-986475","romanian":"Încerci să mă înțelegi?","english":"Try to understand me.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637107"},{"id":"tat-411878","romanian":"Îmi spăl mașina în fața casei fără probleme.","english":"I wash my car in front of the house without any problems.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271996"},{"id":"tat-610923","romanian":"Micul dejun este gata.","english":"Breakfast is ready.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/767045"},{"id":"tat-1142932","romanian":"Majoritatea pasagerilor din autobuz dormeau.","english":"Most of the passengers on the bus were sleeping.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066665"},{"id":"tat-1136915","romanian":"De fapt, știe foarte puține despre această chestiune.","english":"As a matter of fact, he knows very little of the matter.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959366"},{"id":"tat-862837","romanian":"Trebuie sa mă gîndesc.","english":"I have to think about it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014517"},{"id":"tat-1137013","romanian":"Și el învață chineza.","english":"He studies Chinese as well.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952884"},{"id":"tat-1136839","romanian":"Ce e dragostea?","english":"What is love?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532441"},{"id":"tat-1153784","romanian":"Acum simt la fel.","english":"Now I feel the same.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128604"},{"id":"tat-1136912","romanian":"Casa mea e aproape de stația de autobuz.","english":"My house is close to a bus stop.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966001"},{"id":"tat-1064302","romanian":"Tom a întrebat-o pe Mary unde locuiește John.","english":"Tom asked Mary where John lived.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11051404"},{"id":"tat-1090185","romanian":"E fratele meu.","english":"He is my brother.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1996614"},{"id":"tat-1090314","romanian":"Am fraţi.","english":"I have brothers.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3711714"},{"id":"tat-1136661","romanian":"Ne confruntăm cu o alegere dificilă.","english":"We are faced with a difficult choice.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239777"},{"id":"tat-582951","romanian":"E puțină apă în găleată.","english":"There is little water in the bucket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665401"},{"id":"tat-699627","romanian":"Ieri am mâncat un măr.","english":"Yesterday, I ate an apple.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320082"},{"id":"tat-487299","romanian":"Puțini studenți știu să citească în latină.","english":"Few students know how to read Latin.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270669"},{"id":"tat-706153","romanian":"O răţuşcă urâtă a devenit o lebădă graţioasă.","english":"An ugly duckling became a graceful swan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974759"},{"id":"tat-1143233","romanian":"Ai vrea să mergi la o plimbare?","english":"Would you like to go for a walk?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068480"}],"stories":[{"id":"story-ro-scormon-2","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Îi mai place afară la uliță. Nu pentru că ar fi trecători, dar afară cântecul vine mai bine. E cald, dar deprinsă e fata la ger și la arșiță. Cu brațele goale, cu poalele aninate în brâu și cu ștergarul în cap, ea nici nu simte vremea lui cuptor; cântă, întinde firul, descurcă jirebia și se pierde în tinerețile ei."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-3","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"Într-una din zile, moşneagul, fiind foarte amărât de câte-i spunea baba, chemă fata şi-i zise: – Draga tatei, iaca ce-mi tot spune mă-ta de tine: că n-o asculţi, că eşti rea de gură şi înnărăvită şi că nu este de chip să mai stai la casa mea; de-aceea du-te şi tu încotro te-a îndrepta Dumnezeu, ca să nu se mai facă atâta gâlceavă la casa asta, din pricina ta."},{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."},{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."},{"id":"story-enigma-otiliei","title":"Enigma Otiliei","author":"George Calinescu","difficulty":6,"genre":"fiction","wordCount":180,"excerpt":"Intr-o seara de vara, Felix Sima sosi in Bucuresti. Era student la Medicina si venise sa locuiasca la unchiul sau, Costache Giurgiuveanu. Casa din strada Antim era mare si veche, cu ziduri groase si ferestre inalte. Cand Felix a intrat in curte, a vazut o fata tanara care citea pe o banca, sub un tei batran."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-923931","romanian":"Animalele sălbatice sunt în pericol de dispariţie.","english":"Wild animals are on the verge of dying out.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/807128"},{"id":"tat-1159843","romanian":"Îmi place foarte mult.","english":"I like it very much.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167977"},{"id":"tat-670645","romanian":"Cel mult patruzeci la sută dintre studenţi continuă universitatea.","english":"At most 40 percent of students go on to university.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/935777"},{"id":"tat-709901","romanian":"Unde se joacă Toni?","english":"Where is Tony playing?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426734"},{"id":"tat-1056666","romanian":"Ce trebuie să conțină un mic dejun sănătos?","english":"What should a healthy breakfast consist of?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031158"},{"id":"tat-1136849","romanian":"Cât de adânc este lacul?","english":"How deep is the lake?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966273"},{"id":"tat-488782","romanian":"Lisa Lillien este măritată cu Dan Schneider.","english":"Lisa Lillien is married to Dan Schneider.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6352963"},{"id":"tat-1064411","romanian":"Îmi aduc aminte de ce a spus el.","english":"I remember what he said.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075722"},{"id":"tat-708965","romanian":"Căţărătorii se treziră înaintea zorilor.","english":"The climbers awoke before daybreak.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420408"},{"id":"tat-862826","romanian":"Mai bine mor de foame decât să fur.","english":"I would rather starve than steal.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014504"},{"id":"tat-1192842","romanian":"N-ai febră.","english":"You have no fever.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361445"},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-712079","romanian":"Zăpada acoperea autobuzul.","english":"Snow covered the bus.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440783"},{"id":"tat-1159855","romanian":"Găsesc limbile străine foarte interesante.","english":"I find foreign languages very interesting.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168137"},{"id":"tat-1059506","romanian":"A venit să ne vadă ieri.","english":"She came to see us yesterday.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8577246"},{"id":"tat-1133944","romanian":"Cafeaua este amară.","english":"The coffee is bitter.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7074654"},{"id":"tat-1091943","romanian":"El nu fumează.","english":"He does not smoke.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11591700"},{"id":"tat-699676","romanian":"Te iubesc.","english":"I love you.","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8323350"},{"id":"tat-584465","romanian":"Mă doare în gât şi îmi curge nasul.","english":"I have a sore throat and runny nose.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807839"},{"id":"tat-406031","romanian":"Îmi place baclavaua.","english":"I like baclava.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350448"}],"stories":[{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."},{"id":"story-ro-povestea-lui-stan-p-itul-2","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"Numai, dă! ce să facă bietul om? Cum era să se întindă mai mult, că de-abia acum se prinsese şi el cu mâinile de vatră; şi câte a tras până s-a văzut la casa lui, numai unul Dumnezeu ştie."},{"id":"story-ro-inul-i-c-me-a-2","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":219,"excerpt":"Tortul l-au depănat pe râşchitor, spre a-l face căleap; călepele s-au fert cu leşie, să se înălbească, apoi te-au pus pe vârtelniţă, de pe care au început a le depăna pe mosoare cu letca; de pe mosoare te-au urzit pe urzoi, apoi te-au luat şi te-au învălit pe sulul de dinapoi, punând vergele pintre pături, ca să nu se hrentuiască urzala; şi fuscei pintre rost, ca să nu se încâlcească natra."},{"id":"story-ro-ileana-simziana","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat. Acel împărat mare şi puternic bătuse pe toţi împăraţii de prinpregiurul lui şi-i supusese, încât îşi întinsese hotarele împărăţiei sale pe unde a înţărcat dracul copiii, şi toţi împăraţii cei bătuţi era îndatoraţi a-i da câte un fiu d-ai săi ca să-i slujească câte zece ani."},{"id":"story-ro-neghini","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"A fost odată o babă, bătrână, bătrână. Abia zărea de bătrână ce era. Şi mâinile îi umblau la ciorap, iar în gândul ei se ruga la Dumnezeu s-o dăruiască cu un copil, că n-avea decât pe unchiaşul ei."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1153821","romanian":"Învăț engleza pe cineva.","english":"I teach English to someone.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129727"},{"id":"tat-923800","romanian":"Prietenia noastră nu a durat.","english":"Our friendship did not last.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10419439"},{"id":"tat-1136408","romanian":"Chemați-mă dacă aveți nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962822"},{"id":"tat-1279321","romanian":"A doua oglindă este agăţată lângă uşă.","english":"A second mirror is hanging next to the door.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13495625"},{"id":"tat-1168697","romanian":"Am auzit muzica.","english":"I heard the music.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12220460"},{"id":"tat-487034","romanian":"Eu mănânc tăiței.","english":"I am eating noodles.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435962"},{"id":"tat-983708","romanian":"Este un cal.","english":"This is a horse.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5754562"},{"id":"tat-476863","romanian":"Te rugăm să fii politicos.","english":"Please be polite.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5601925"},{"id":"tat-1143566","romanian":"Îmi place mult viața de la oraș.","english":"I really like city life.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072636"},{"id":"tat-1143248","romanian":"Tom a mâncat un castron cu supă de scoici.","english":"Tom ate a bowl of clam chowder.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068554"},{"id":"tat-1059702","romanian":"Dacă aduni trei cu patru, obții șapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758844"},{"id":"tat-1153830","romanian":"Totul este în regulă.","english":"Everything is fine.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130018"},{"id":"tat-1159835","romanian":"Mulțumesc foarte, foarte mult!","english":"Thank you very, very much!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167856"},{"id":"tat-1136616","romanian":"Toate invențiile apar din necesitate.","english":"All inventions grow out of necessity.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965950"},{"id":"tat-928488","romanian":"Desenele lui Lyod reprezintă persoane din secolul al paisprezecelea.","english":"The drawings Lyod has made show people from the 14th century.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5107153"},{"id":"tat-712094","romanian":"E cel mai bun jucător din echipa noastră.","english":"He is the best player on our team.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440082"},{"id":"tat-1153165","romanian":"Le-am spus să-mi trimită un alt bilet.","english":"I told them to send me another ticket.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1764648"},{"id":"tat-1144673","romanian":"Scuzați-mă, vorbiți engleza?","english":"Excuse me. Do you speak English?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12075958"},{"id":"tat-405826","romanian":"Zăpada a acoperit tot orașul peste noapte.","english":"The snow covered the whole city overnight.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350529"},{"id":"tat-408004","romanian":"Pentru cine bat clopotele?","english":"For whom do the bells toll?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532040"}],"stories":[{"id":"story-ro-departe-departe-2","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Apoi auzii o uşă trântindu-se, şi alta, şi alta, încet, mai încet, mai încet, până nu ştiu bine dacă mai auzeam sau mi se părea. A cui să fie umbra? Vreo stafie? Înăuntru plânge cineva… se roagă, a leşinat… nu se mai aude. E întuneric. Mi se bate inima. De n-ar fi stafie! Şi ameţii pe marginea lacului."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-3","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":226,"excerpt":"Le dete, deci, voie, şi ei se puseră pe lucru. Pândi în ziua dintâi fiul cel mare; dară păţi ruşinea ce păţise şi ceilalţi pândari din naintea lui. A doua zi pândi şi cel mijlociu; dară nici el nu fu mai breaz, ci se întoarse la tatăl său cu nasul în jos."},{"id":"story-ro-aleodor-mp-rat-2","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Un lucru numai am să-ţi spui: Vezi tu muntele acela de colo, să nu te ducă păcatele să vânezi p-acolo, că este nevoie de cap. Acel munte este moşia lui Jumătate-de-om-călare-pe-jumătate-de-iepure-şchiop: şi cine calcă pe moşia lui, nu scapă nepedepsit. Acestea zicând, căscă gura de trei ori şi-şi dete sufletul."},{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
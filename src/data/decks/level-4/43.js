@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1192704","romanian":"E nevoie să fie reparat.","english":"It needs to be repaired.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1116325"},{"id":"tat-699630","romanian":"Poţi rezolva această problemă?","english":"Can you solve this problem?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320215"},{"id":"tat-706185","romanian":"Kumi este fata al cărei tată îi plac căinii.","english":"Kumi is the girl whose father likes dogs.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/976233"},{"id":"tat-1143221","romanian":"Cred că au fost căsătoriți timp de cinci ani.","english":"I think they have been married for five years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049596"},{"id":"tat-1089733","romanian":"Unde este banca?","english":"Where is the bank?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11266826"},{"id":"tat-670576","romanian":"Ce se va întâmpla cu ea?","english":"What will happen to her?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2299514"},{"id":"tat-705819","romanian":"Mama mea a plecat ieri la cumpărături în centru.","english":"My mother went shopping downtown yesterday.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963917"},{"id":"tat-1185077","romanian":"Vei traduce asta în franceză?","english":"Will you translate this into French?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321419"},{"id":"tat-1192694","romanian":"Mergi drept înainte până ajungi la biserică.","english":"Go straight ahead until you reach the church.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/678764"},{"id":"tat-1136563","romanian":"Clădirea se poate prăbuși în orice moment.","english":"The building may crash at any time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965193"},{"id":"tat-1059690","romanian":"Îmi poți da niște bani?","english":"Can you give me some money?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/931482"},{"id":"tat-1144720","romanian":"Capitala Cehiei este Praga.","english":"The capital of Czechia is Prague.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076594"},{"id":"tat-1144325","romanian":"Un adevărat gentilom nu își trădează niciodată prietenii.","english":"A true gentleman never betrays his friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073607"},{"id":"tat-1136689","romanian":"Clasa noastră e formată din 40 de băieți.","english":"Our class consists of 40 boys.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239666"},{"id":"tat-408090","romanian":"Prietenul nostru a terminat cursa al doilea.","english":"Our friend finished the race in second place.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232893"},{"id":"tat-1143646","romanian":"Ken joacă tenis?","english":"Does Ken play tennis?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071930"},{"id":"tat-1136717","romanian":"Porecla mea este \"Itch\".","english":"I go by the nickname \"Itch.\"","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239594"},{"id":"tat-1136399","romanian":"Camera are două ferestre.","english":"The room has two windows.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962831"},{"id":"tat-712069","romanian":"Socialism sau barbarism.","english":"Socialism or barbarism.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440421"},{"id":"tat-1153162","romanian":"Vrednicia ei este un bun exemplu pentru noi toți.","english":"Her diligence is a good example to us all.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1754261"}],"stories":[{"id":"story-ro-p-dureanca-2","title":"Pădureanca","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Simțind apropierea timpului de secere, pădurile se pun în mișcare colibă cu colibă, sat cu sat se adună, văile pornesc întregi spre câmpia întinsă, și în câteva zile cât ține locul din Mureș până în părțile Orăzii și până la izvoarele Crișurilor nu mai rămân prin sate decât moșnegii neputincioși, babele bătrâne și copiii nevârstnici; setea de viață îi ia și-i duce pe toți la sărbătoarea cea mare ce se ține în fieștecare an o dată pentru împărțirea pânei de toate zilele."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-2","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Ea priimi mărul cu bucurie. Şi după ce plecă bărbatul în trebile sale, se aşeză pe pragul uşei, curăţi mărul şi-l mâncă. Iepşoara ieşise şi ea din grajd, şi veni la stăpână-sa, că era învăţată la traista cu grăunţe."},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."},{"id":"story-ro-bunica-3","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":218,"excerpt":"Măria-ta, să ştii că atunci când or lega rod ăşti doi meri, împărăteasa o să rămână grea şi o să nască un cocon cu totul şi cu totul de aur\"… Piticul se duse, şi împăratul alergă în grădină, şi căută, căută peste tot locul, până dete peste ăi doi meri."},{"id":"story-ro-ho-u-mp-rat","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat mare şi puternic. Abia la vremea cărunteţei dobândi şi el un copil. Bucuria lui fu nespusă când se văzu şi el tată, şi toată împărăţia lui fu veselă dinpreună cu dânsul, căci acest împărat era bun, drept şi temător de Dumnezeu. Pentru aceasta, el făcu mult bine poporului său."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1185182","romanian":"Și-a afirmat inocența.","english":"He affirmed his innocence.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324346"},{"id":"tat-864490","romanian":"El ține legătura cu tot felul de oameni.","english":"He is in touch with all kinds of people.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855690"},{"id":"tat-1136702","romanian":"Comparată cu a ta, mașina mea este mică.","english":"Compared with yours, my car is small.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239624"},{"id":"tat-405977","romanian":"Poftiți, doamnă, serviți-vă!","english":"Please, madam, help yourself!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350235"},{"id":"tat-1192699","romanian":"Ne bucurăm că vii.","english":"We are glad you are coming.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/853963"},{"id":"tat-705791","romanian":"Din curiozitate, am deschis cutia.","english":"I opened the box out of curiosity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963139"},{"id":"tat-864492","romanian":"Când am sunat, el deja plecase.","english":"When I called, he had already set off.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6872543"},{"id":"tat-948496","romanian":"Da, vă rog.","english":"Yes, please.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9690115"},{"id":"tat-1144330","romanian":"Acea petrecere s-a ținut sub auspiciile Ministerului Afacerilor Externe.","english":"That party was held under the auspices of the Foreign Ministry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073626"},{"id":"tat-1064024","romanian":"De îndată ce m-a văzut a început să plângă.","english":"As soon as she saw me, she started to cry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10936810"},{"id":"tat-1279158","romanian":"Ceasul meu înaintează cu cinci secunde pe zi.","english":"My clock is running 5 seconds faster every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13123222"},{"id":"tat-1064444","romanian":"Vreau ceva dulce.","english":"I want something sweet.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077411"},{"id":"tat-610863","romanian":"Acest suc are gust acru.","english":"This juice tastes sour.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/692737"},{"id":"tat-986454","romanian":"Pisica este cafenie.","english":"The cat is brown.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637038"},{"id":"tat-1136877","romanian":"Trebuie să ne gândim la comunitate.","english":"We must think about the community.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956374"},{"id":"tat-1144305","romanian":"Japonia se compune din patru insule principale.","english":"Japan consists of four main islands.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073340"},{"id":"tat-1136540","romanian":"O poți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965189"},{"id":"tat-1144284","romanian":"Are o legătură cu furtul.","english":"He has something to do with the robbery.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7510355"},{"id":"tat-1136851","romanian":"Te-ai spălat deja pe mâini?","english":"Have you washed your hands yet?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966287"},{"id":"tat-1185061","romanian":"Frânghia e foarte slabă.","english":"The string is very weak.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12319365"}],"stories":[{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-2","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":232,"excerpt":"Se spetise bietul om muncind, şi să salte şi el ceva, te-aşi! câtuşi de cât! ferit-a sântul! Ba până într-atâta ajunsese, încât să-l împingă păcatele să se gândească ca să-şi facă seama singur, vezi că dracul n-are de lucru, el nu face biserici ori puţuri pe la răspântii."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-2","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Trase undiţa: când, ce să vezi? un peşte mare, cu totul şi cu totul din aur. Doară că nu-i căzu leşin de bucurie. Darămite când îl văzu împărăteasa? Ea fu şi mai oleoleo. Găti împărăteasa singură cu mâna ei peştele şi mâncară. Ea îndată se simţi însărcinată."},{"id":"story-ro-cele-trei-rodii-aurite-2","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":217,"excerpt":"Un an de zile trecuse de când călătorea; ajunsese prin pustietăţi nelocuite de oameni, şi tot rătăcind în sus şi în jos, două rânduri de haine se rupseră şi le lepădase. Neştiind ce să facă, hotărî a mai merge câtva, şi dacă nu va putea descoperi nimic, să se întoarcă."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1192791","romanian":"Tom s-ar putea să mintă despre asta.","english":"Tom may possibly be lying about that.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350289"},{"id":"tat-1185173","romanian":"A zis că trebuie să păstrăm secretul.","english":"He said we must keep the secret.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324299"},{"id":"tat-714067","romanian":"Romeo este bărbatul pe care Julieta îl iubeşte.","english":"Romeo is the man Juliet loves.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469893"},{"id":"tat-708979","romanian":"În cartierul meu a fost un mare incendiu.","english":"There was a big fire in my neighborhood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420379"},{"id":"tat-1144314","romanian":"Deficitul de apă este din cauza vremii.","english":"The water shortage is due to the weather.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073464"},{"id":"tat-708994","romanian":"Amestecă în supă.","english":"Stir the soup.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8353408"},{"id":"tat-1064285","romanian":"Ce preferi, vin alb sau vin roșu?","english":"Which do you prefer, white wine or red wine?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11061322"},{"id":"tat-1056804","romanian":"Nimănui nu-i place războiul.","english":"No one loves war.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031604"},{"id":"tat-902141","romanian":"Acesta e sfârșitul.","english":"This is the end.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287419"},{"id":"tat-1136918","romanian":"- A scris ieri o scrisoare? - Da.","english":"Did he write a letter yesterday? \"Yes, he did.\"","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960508"},{"id":"tat-1143147","romanian":"Cât costă o cameră?","english":"How much is a room?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068934"},{"id":"tat-1143238","romanian":"Mă uitam în jos către fundul văii.","english":"I was looking downward to the bottom of the valley.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068500"},{"id":"tat-670639","romanian":"Naivul bărbat era extrem de stânjenit în prezenţa ei.","english":"The naive man was utterly embarrassed in her presence.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681128"},{"id":"tat-407963","romanian":"Care este mai completă, prima ediție sau a doua?","english":"Which is more complete, the first edition or the second?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531998"},{"id":"tat-1136536","romanian":"Rockul este muzica celor tineri.","english":"Rock is the music of the young.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965478"},{"id":"tat-705812","romanian":"Mă doare braţul rău.","english":"My arm is hurting badly.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963890"},{"id":"tat-1136388","romanian":"Este respectat de toată lumea.","english":"He is respected by everyone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962876"},{"id":"tat-1136619","romanian":"Băiatul plângea în cameră.","english":"The boy was crying in the room.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227573"},{"id":"tat-1136852","romanian":"Jucătorul de șah și-a pus adversarul în șah.","english":"The chess player put his opponent in check.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966267"},{"id":"tat-1119725","romanian":"Dragostea e de rahat.","english":"Love sucks.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6265056"}],"stories":[{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-3","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"Să nu te sperii, dragul tatei, leul îmi va face groapa, şi tu vei trage pământ peste mine; de moştenire n-am ce să-ţi las decât un frâu de cal. După ce vei rămânea singur, să te sui în pod, să iei frâul, să-l scuturi, şi îndată va veni un cal şi te va învăţa ce să faci."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-2","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":202,"excerpt":"Tot mergând şi minunându-mă, m-am pomenit către mijlocul grădinei. Aici era, ce să-ţi spui? frumuseţea de pe lume. Nişte cărări sucite şi cotite, acoperite cu un fel de iarbă mărunţică, de părea că erau nişte covoare aşternute."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"A fost odată un băiat. El, de la naşterea lui, se pomenise bubos. Ce n-a făcut el ca să se cureţe de bube? dară în deşert. Băieţii la joc şi fetele la horă îl huiduia şi fugeau de dânsul ca de o lepră."},{"id":"story-ro-cele-trei-rodii-aurite-3","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":210,"excerpt":"– Mamă, zise fiul împăratului, caut cele trei rodii aurite, şi dorinţa de a le avea m-a adus p-aici, nu ştii d-ta încotro se află?"}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
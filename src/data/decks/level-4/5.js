@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-407957","romanian":"Numele meu este românesc, al lui e american.","english":"My name is Romanian; his is American.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531992"},{"id":"tat-1143263","romanian":"Aceea e școala mea.","english":"That is my school.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068637"},{"id":"tat-1163913","romanian":"Poți alerga repede?","english":"Can you run fast?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197018"},{"id":"tat-1136810","romanian":"Programul nu permite modificări în acest moment.","english":"The program does not allow for changes at this point in time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966290"},{"id":"tat-30","romanian":"Unde locuiesti?","english":"Where do you live?","difficulty":2,"wordCount":2,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2636873"},{"id":"tat-705817","romanian":"El a jucat un rol foarte important în afacere.","english":"He played an important part in the enterprise.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963911"},{"id":"tat-1136795","romanian":"Găina a depus un ou în această dimineață.","english":"The chicken laid an egg this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966349"},{"id":"tat-1142940","romanian":"Cine e în spatele intrigii?","english":"Who is behind the plot?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066756"},{"id":"tat-406051","romanian":"O întâlnesc pe Mihaela în fiecare dimineață, la metrou.","english":"I meet Mihaela every morning at the subway.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347358"},{"id":"tat-1119756","romanian":"În acest oraș, există trei saloane de înfrumusețare.","english":"In this city, there are three beauty salons.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264837"},{"id":"tat-488759","romanian":"Această cameră nu este potrivită pentru dormit.","english":"This room is not suitable for sleeping.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268734"},{"id":"tat-924384","romanian":"Ea vrea să închidă mica sa afacere.","english":"She wants to wind up her small business.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735381"},{"id":"tat-1120208","romanian":"Sunt din Brazilia.","english":"I am from Brazil.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11850582"},{"id":"tat-1136541","romanian":"Îl puteți folosi oricând.","english":"You can use it anytime.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965468"},{"id":"tat-1192846","romanian":"E un monarh absolut.","english":"He is an absolute monarch.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361499"},{"id":"tat-610910","romanian":"Îmi dai brânza cremă te rog?","english":"Would you pass me the cream cheese, please?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/752477"},{"id":"tat-1064097","romanian":"La momentul accidentului aproape toți călătorii din autobuz dormeau.","english":"At the time of the accident, almost all of the passengers on the bus were sleeping.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11071031"},{"id":"tat-1108779","romanian":"Ei nu vin astăzi.","english":"They are not coming today.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11759953"},{"id":"tat-488775","romanian":"Prietena sa este japoneză.","english":"His girlfriend is Japanese.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528911"},{"id":"tat-586093","romanian":"Dorința e pentru cei care cred în îndeplinirea ei.","english":"Wishing is for those who can believe.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7758342"}],"stories":[{"id":"story-ro-poveste-3","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"De se întâlneau, ea cu el, fiecare cu focul lui, se înţelegeau din ochi, deşi abia se mai vedeau, şi cu glas uscat se luau iute la harţă, parc-ar fi fost necăjiţi unul pe altul. – Ei, ce mai ai şi astăzi? – Măria-ta ce ai? – Ce să am, ale pustii de bătrâneţi."},{"id":"story-ro-g-in-reasa","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"A fost odată un împărat şi o împărăteasă. În căsătoria lor ei au trăit ca fraţii, şi numai o fată au fost făcut. Ca şi mumă-sa, această fată, din naştere, era cu o stea în frunte."},{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat şi o împărăteasă; ei nu făceau copii; umblase pe la toţi vracii şi vrăjitorii, pe la toate babele şi cititori de stele, şi toţi rămaseră de ruşine, căci n-avură ce le face."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
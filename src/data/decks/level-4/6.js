@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1151742","romanian":"La mulți ani de ziua mondială a protecției animalelor!","english":"Happy World Animal Protection Day!","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118279"},{"id":"tat-1185174","romanian":"Ne-am mâniat de cuvintele lui.","english":"We got angry at his words.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324301"},{"id":"tat-1153837","romanian":"Amestecă bucuriile uneori cu cea mai serioasă ocupație.","english":"Mingle your joys sometimes with your earnest occupation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130097"},{"id":"tat-709040","romanian":"Cu excepţia câtorva greşeli, compunerea ta este perfectă.","english":"Your composition is perfect except for a few mistakes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420329"},{"id":"tat-1136946","romanian":"Sora mea a insistat să meargă cu mine.","english":"My sister insisted on going with me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957798"},{"id":"tat-1064072","romanian":"Tom pare foarte fericit.","english":"Tom looks very happy.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069577"},{"id":"tat-1136929","romanian":"Problema rămâne de rezolvat.","english":"The problem remains to be solved.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957754"},{"id":"tat-1136910","romanian":"Articolul 6. Președintele va conduce toate reuniunile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11953737"},{"id":"tat-1186862","romanian":"În sfârșit a făcut bani.","english":"He finally made money.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338232"},{"id":"tat-1143146","romanian":"Fără sfatul meu, ai fi eșuat.","english":"But for my advice, you would have failed.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068933"},{"id":"tat-487322","romanian":"Femeia mănâncă o portocală.","english":"The woman eats an orange.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336244"},{"id":"tat-698974","romanian":"Cartea este albă.","english":"The book is white.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3943121"},{"id":"tat-1153804","romanian":"Vii la petrecere, da?","english":"Come to the party, will you?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128886"},{"id":"tat-1059609","romanian":"Unde ai învățat franceza?","english":"Where did you learn French?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7482507"},{"id":"tat-584349","romanian":"Nu lăsa pe mâine ce poţi face poimâine.","english":"Never put off until tomorrow what you can do the day after tomorrow.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798076"},{"id":"tat-709043","romanian":"Am fost fascinat de frumuseţea ei.","english":"I was fascinated by her beauty.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420333"},{"id":"tat-1185087","romanian":"- Ce fel de senzație? întrebă negustorul.","english":"What kind of feeling? the shopkeeper asked.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321492"},{"id":"tat-698933","romanian":"Cu ce vă pot fi de folos astăzi, domnule?","english":"How may I help you today, sir?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2157709"},{"id":"tat-702210","romanian":"Este o fotografie recentă?","english":"Is it a recent picture?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398717"},{"id":"tat-408068","romanian":"Ce să fac?!","english":"What can I do?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232794"}],"stories":[{"id":"story-ro-popa-tanda","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":229,"excerpt":"Ierte-l Dumnezeu pe dascălul Pintilie! Era cântăreț vestit. Și murăturile foarte mult îi plăceau. Mai ales dacă era cam răgușit, le bea cu gălbenuș de ou și i se dregea organul, încât răsunau ferestrele când cânta Mântuiește, Doamne, norodul tău! Era dascăl în Butucani, bun sat și mare, oameni cu stare și socoteală, pomeni și ospețe de bogat."},{"id":"story-ro-fata-mo-ului-cea-cuminte-2","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Când, tocmai când era să se dea jos, zări spre răsărit abia licărind o mititică vâlvotaie; se coborî de pe acoperiş şi o luă într-acolo. Se duse, se duse şi la foc nu mai ajunse; dară în drumul ei întâlni o grădină părăginită, care o strigă zicându-i: – Fată mare, fată mare!"},{"id":"story-ro-g-in-reasa-3","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Numaidecât mai-marii ţării ziseră fetei să se gătească de nuntă. Acum altă nevoie. Nici fata nu voia să ia pe tată-său de soţ. Ea zise: – Unde aţi mai auzit, boieri dumneavoastră, batjocură ca aceasta, să ia tatăl de soţie pe fie-sa. – Nu te supăra, domniţă, şi nu fii aşa ţanţoşă."},{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."},{"id":"story-ro-z-na-zorilor-3","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"De când a întrebat Petru de treaba ochilor, se părea cum că ochiul cel din stânga plânge mai puţin, iară cel de-a dreapta râde mai mult. Petru îşi întări inima şi mai merse o dată la împăratul. O palma e o palma şi două-s două! Gândi şi făcu. O păţi din nou, cum a mai păţit-o."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
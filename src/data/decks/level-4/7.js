@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1058773","romanian":"Declarațiile lui sunt infantile şi adesea mă deranjază.","english":"His statements are childish and they often bother me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11044684"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-1192777","romanian":"I-a arătat poza mea.","english":"She showed him my picture.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364287"},{"id":"tat-1059676","romanian":"Aș vrea niște pește.","english":"I would like some fish.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10963768"},{"id":"tat-411927","romanian":"În weekend am mult de spălat.","english":"Over the weekend I have a lot to wash.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272185"},{"id":"tat-1136514","romanian":"Încetați de a vă mai duce acolo.","english":"Stop going there.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/47857"},{"id":"tat-709045","romanian":"M-am întâlnit cu ea seara târziu.","english":"I met her late in the evening.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420335"},{"id":"tat-705788","romanian":"Urmăreşti dezbaterile parlamentare?","english":"Did you listen to the parliamentary debate?","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963116"},{"id":"tat-448190","romanian":"La dracu’ cu tine!","english":"Fuck you!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3796586"},{"id":"tat-1064275","romanian":"Vin roșu, vă rog.","english":"Red wine, please.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066144"},{"id":"tat-411949","romanian":"Am vizitat România acum câțiva ani.","english":"I visited Romania a few years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272263"},{"id":"tat-1143613","romanian":"Îmi place ciocolata.","english":"I like chocolate.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071626"},{"id":"tat-706032","romanian":"Preţurile sunt mari.","english":"Prices are high.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969720"},{"id":"tat-487304","romanian":"El a fost convins să fie mai rezonabil.","english":"He was persuaded to be more sensible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270699"},{"id":"tat-702194","romanian":"Am mâncat până mi s-a făcut rău.","english":"I ate myself sick.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397911"},{"id":"tat-1064018","romanian":"El a început să se scuze.","english":"He began to make excuses.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10918528"},{"id":"tat-583827","romanian":"În fiecare duminică după-amiaza merg la târg.","english":"Every Sunday afternoon, I go to the bazaar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1913109"},{"id":"tat-1153153","romanian":"A explica chestiunea în detaliu.","english":"He explained the matter in detail.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1715495"},{"id":"tat-1119734","romanian":"Vreau să te întreb ceva, domnișoară Ionescu.","english":"I want to ask you something, Ms. Ionescu.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342506"},{"id":"tat-1136863","romanian":"Toată lumea știe că încă este în viață.","english":"Everybody knows for a fact that he is still alive.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966276"}],"stories":[{"id":"story-ro-balaurul-cel-cu-apte-capete","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":275,"excerpt":"A fost odată într-o ţară un balaur mare, nevoie de cap. El avea şapte capete, trăia într-o groapă, şi se hrănea numai cu oameni. Când ieşea el la mâncare, toată lumea fugea, se închidea în case şi sta ascunsă până ce-şi potolea foamea cu vreun drumeţ pe care îl trăgea aţa la moarte."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-2","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Ce nu făcu bietul tată-său, ce nu drese ca să-şi dea fata la casa ei, dară ca s-o înduplece, ba. Ei nu-i da inima să-şi lege capul cu nici unul din peţitorii ce veneau să o ceară, deşi toţi erau împăraţi şi fii de împăraţi."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-1136573","romanian":"A forțat ușa încuiată cu o rangă.","english":"He pried open the locked door with a crowbar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966044"},{"id":"tat-1136599","romanian":"Te rog să-mi răspunzi fără întârziere.","english":"Please write me a reply soon.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966022"},{"id":"tat-670628","romanian":"A renunţat la visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1611173"},{"id":"tat-1143262","romanian":"A profitat de ignoranța mea și m-a înșelat.","english":"He took advantage of my ignorance and deceived me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068634"},{"id":"tat-862378","romanian":"Soția mea a născut un copil săptămâna trecută.","english":"My wife had a baby last week.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9458631"},{"id":"tat-1197123","romanian":"Cât e până la aeroport?","english":"How far is it to the airport?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3134254"},{"id":"tat-1151761","romanian":"Azi e duminică.","english":"Today is Sunday.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118662"},{"id":"tat-1186847","romanian":"Recordul lui nu va fi niciodată întrecut.","english":"His record will never be broken.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338182"},{"id":"tat-1144301","romanian":"Refuz să fiu de acord cu acel plan.","english":"I refuse to consent to that plan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073270"},{"id":"tat-1153879","romanian":"Am confirmat telefonic rezervarea la hotel.","english":"We confirmed the hotel reservations by telephone.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12100238"},{"id":"tat-1185067","romanian":"Tom vorbea la telefon de o oră.","english":"Tom has been talking on the phone for an hour.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320872"},{"id":"tat-1153762","romanian":"Te rog nu ezita să te exprimi liber.","english":"Please feel free to express yourself.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6511815"},{"id":"tat-1153169","romanian":"Mă plimbam pe bulevard.","english":"I was strolling down the avenue.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1778405"},{"id":"tat-1089729","romanian":"Ce zi frumoasă!","english":"What a nice day it is!","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11275379"},{"id":"tat-1159796","romanian":"Paharul este plin cu apă.","english":"The glass is full of water.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167541"},{"id":"tat-1143190","romanian":"Fața ei este concentrată.","english":"Her face is in focus.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069295"},{"id":"tat-923838","romanian":"Anna este o fetiță.","english":"Ann is a little girl.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10435209"},{"id":"tat-698970","romanian":"Viața este scurtă.","english":"Life is short.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3582733"},{"id":"tat-406017","romanian":"O ploaie rece a căzut peste oraș.","english":"A cold rain fell over the city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350400"},{"id":"tat-1149075","romanian":"Piersicul face piersici.","english":"Peaches grow on the peach tree.","difficulty":2,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12106106"}],"stories":[{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-3","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Toţi cu totul zicea că aşa i-a fost orânda şi credeau că trebuie să fi căzut asupra capului lui vrun blestem de la Dumnezeu. Ajunsese omul să-şi urască zilele."},{"id":"story-ro-o-via-pierdut-3","title":"O viață pierdută","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":209,"excerpt":"Cârlanul se opri, nechezând printre dinți, la ușa grajdului. - Stăi, prietene! grăi bătrânul mergând cu hamurile în urma lui. Toate se fac cu vremea. În grajd mai era un cal, loc pentru alți doi și un flăcău, care se trezi din somn când intră bătrânul. - Bună seara, Costane! grăi el trăgănând vorbele. Ai avut noroc la ziuă?"},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"A fost odată într-o pustie mare un pustnic, şi petrecea singur singurel. Vecinii săi erau fiarele pădurilor. Şi aşa era de bun la Dumnezeu, încât toate dobitoacele i se închinau, când se întâlneau cu dânsul."},{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-ro-ion-roat-i-cuza-vod-2","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Atâta-i ajungea capul, atâta făceau şi ei pe vremea lor, Dumnezeu să-i ierte şi să-i odihnească, unde-or fi acolo, că bună inimă mai aveau! Dar să ne întoarcem iar la Divanul ad-hoc."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
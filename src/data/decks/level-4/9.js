@@ -0,0 +1 @@
+export default {"level":4,"sentences":[{"id":"tat-864476","romanian":"Orașul a fost distrus în timpul războiului.","english":"The town was destroyed during the war.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6806128"},{"id":"tat-1143208","romanian":"Pretinde că e cinstit.","english":"He claims that he is honest.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069998"},{"id":"tat-1143121","romanian":"Au ajuns în staţie la doar câteva minute distanță.","english":"They got to the station only a few minutes apart.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068791"},{"id":"tat-706094","romanian":"Mi-am lăsat cheia in cameră.","english":"I left my key in my room.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/972152"},{"id":"tat-699623","romanian":"Am văzut câinele.","english":"I saw the dog.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320070"},{"id":"tat-1064159","romanian":"Casa pe care a construit-o Tom este minunată.","english":"The house Tom built is wonderful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072308"},{"id":"tat-487287","romanian":"Ei îi place foarte mult școala sa.","english":"She likes her school a lot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270501"},{"id":"tat-1192721","romanian":"A zis ea asta?","english":"She said that?","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7136968"},{"id":"tat-407936","romanian":"Dacă așa vi s-a spus, probabil că e corect.","english":"If this is the way you were told, it is probably correct.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6437718"},{"id":"tat-583959","romanian":"Nici în ruptul capului!","english":"Not for all the tea in China!","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799491"},{"id":"tat-1064309","romanian":"L-am văzut pe Tom sărutând-o pe Mary.","english":"I saw Tom kiss Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045415"},{"id":"tat-1136537","romanian":"L-am sondat cu privire la opiniile sale.","english":"I sounded him out about his views.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965088"},{"id":"tat-1136614","romanian":"Mulțimea a protestat împotriva avortului.","english":"The throng protested against abortion.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966027"},{"id":"tat-406013","romanian":"Copacii erau foarte rari.","english":"The trees were very scarce.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350364"},{"id":"tat-1153820","romanian":"Stai acasă pentru a putea răspunde la telefon.","english":"Stay home so that you can answer the phone.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129301"},{"id":"tat-1064170","romanian":"Toată lumea în afară de Tom a fost prezentă.","english":"Everyone except Tom was present.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3090030"},{"id":"tat-1143841","romanian":"Își ține întotdeauna promisiunile.","english":"He always fulfills his promises.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070728"},{"id":"tat-1151778","romanian":"Azi e miercuri. Citesc.","english":"Today is Wednesday. I am reading.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12119179"},{"id":"tat-1064255","romanian":"Tom s-a prefăcut că nu aude nimic.","english":"Tom pretended to not hear a thing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073104"},{"id":"tat-1144711","romanian":"Capitala Poloniei este Varșovia.","english":"The capital of Poland is Warsaw.","difficulty":2,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12076553"}],"stories":[{"id":"story-ro-pravoslavnicul-i-sl-ninile","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Era odată un biet creştin sărac şi c-o droaie de copii mărunţi. Toată avuţia lui era gura femeii şi a copiilor, care ţipau de fitece. Guri flămânde, şi pace bună! Poveşti de Barbu Ştefănescu Delavrancea - Pravoslavnicul şi slăninile Bietul creştin, ce făcu, ce drese, s-alese de sfântul crăciun c-un porc gras."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată un împărat şi o împărăteasă. Amândoi erau oameni de treabă şi frumoşi. Ei se iubeau, nevoie mare! Dară erau tot mâhniţi şi amărâţi că nu făceau copii. Toate leacurile ce luase împărăteasa de pe la vraci şi vrăjitoare nu-i folosise întru nimic."},{"id":"story-ro-amintiri-din-copil-rie-i-2","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Şi unde nu s-au adunat o mulţime de băieţi şi fete la şcoală, între care eram şi eu, un băiat prizărit, ruşinos şi fricos şi de umbra mea."},{"id":"story-ro-la-crucea-din-sat-2","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Un nou hohot îl trezește și pe el din astă nepăsare. Ileana a făcut o cunună de pene cu coada dindărăt și a pus-o pe nesimțite în capul lui Bujor. Bujor a simțit, dar se face a nu fi simțit, fiindcă-i place să vadă pe Ileana râzând. Toți râd cu hohot, râde mai ales Ileana."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1192707","romanian":"Ai o masă în patio?","english":"Do you have a table in the patio?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1309190"},{"id":"tat-11089209","romanian":"Tom se va întoarce la Boston cu o zi mai devreme decât mine.","english":"Tom will go back to Boston one day earlier than I will.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5144512","romanian":"O parolă bună ar trebui să fie greu de ghicit, dar ușor de reținut.","english":"A good password should be difficult to guess, but easy to remember.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1147446","romanian":"Astăzi am curs de esperanto.","english":"Today I have an Esperanto class.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094147"},{"id":"tat-1136894","romanian":"Aceasta este casa în care a crescut Tom.","english":"This is the house where Tom was brought up.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956357"},{"id":"tat-709900","romanian":"Astfel de incidente sunt destul de obişnuite.","english":"Such incidents are quite common.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426733"},{"id":"tat-6701448","romanian":"Cel mai mare cusur al rasei umane este incapacitatea noastră de a înțelege funcția exponențială.","english":"The greatest shortcoming of the human race is our inability to understand the exponential function.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192713","romanian":"A avut timp să-și pregătească oamenii de luptă.","english":"He had time to prepare his men for battle.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2953687"},{"id":"tat-708965","romanian":"Căţărătorii se treziră înaintea zorilor.","english":"The climbers awoke before daybreak.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420408"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-670649","romanian":"Când aduni trei cu patru, obţii şapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974575"},{"id":"tat-10787417","romanian":"Una dintre fetițe s-a oprit și s-a întors să se uite la mine.","english":"One of the little girls stopped and turned back to look at me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-1136600","romanian":"Vă rog să îmi răspundeți în scurtă vreme.","english":"Please write me a reply soon.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966023"},{"id":"tat-448260","romanian":"Ai grijă de tine.","english":"Take care.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4256296"},{"id":"tat-698963","romanian":"Unde te duci?","english":"Where are you going to?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3220541"},{"id":"tat-13632868","romanian":"Noua generație pare să aibă o perioadă de atenție mai redusă decât am avut noi.","english":"This new generation seems to have a shorter attention span than we did.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136962","romanian":"Mi-ar plăcea să îmi cunoști părinții.","english":"I would like you to meet my parents.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956302"},{"id":"tat-1136810","romanian":"Programul nu permite modificări în acest moment.","english":"The program does not allow for changes at this point in time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966290"}],"stories":[{"id":"story-ro-inul-i-c-me-a","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Inul: – Ştii tu, cămeşă dragă, ce erai odată? Poveşti de Ion Creangă - Inul şi cămeşa – Ce să fiu? Eram ceea ce mă vezi: cămeşă albă, cu care se îmbracă oamenii. – Nu-i aşa!"},{"id":"story-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":170,"excerpt":"Ghita era un om simplu care visa la o viata mai buna pentru familia sa. Cand a auzit ca moara de la marginea satului e de inchiriat, a vazut o sansa. \"Hai sa luam moara,\" i-a spus sotiei lui, Ana. \"Vom munci si vom prospera.\" La inceput, totul a mers bine."},{"id":"story-ro-sorcova-2","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Nu se pomenea nici de sorcovăială, după cum s-ar fi cuvenit de la moşi, de la strămoşi. Ţi se prindea pleoapă de pleoapă, nară de nară, falcă de falcă, degera oul în găină de ger ce se pornise. – N-am putea duce l-alde biata Bălaşa ceva curmeie de viţă şi vreascuri ujujite?"},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-balaurul-cel-cu-apte-capete-2","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Cu aceşti voinici se întovărăşi şi un om verde, pui de român, ştii colea, care auzise de făgăduinţa împăratului şi venise să-şi încerce şi el norocul. Porniră, deci, cu toţii, îşi aleseră un loc aproape de groapă şi se puseră la pândă. Pândiră o zi, pândiră două, pândiră mai multe zile, şi nu se întâmplă nimic."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-4993454","romanian":"O persoană având indicele de masă corporală de la 25 la 29 e considerată supraponderală.","english":"A person with a BMI of 25 to 29 is considered overweight.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-1136919","romanian":"Mike a acționat în calitate de președinte al reuniunii.","english":"Mike acted as chairperson of the meeting.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957760"},{"id":"tat-7192267","romanian":"El nu era omul care să se lase descurajat de un singur eșec.","english":"He was not a man to be disheartened by a single failure.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136948","romanian":"Am învățat multe din cărțile lui.","english":"I learned a lot from his books.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956892"},{"id":"tat-406042","romanian":"La început vă displăcuse ideea, dar acum păreți mulțumiți.","english":"At the beginning you had disliked the idea, but now you seem to be content.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350487"},{"id":"tat-1144325","romanian":"Un adevărat gentilom nu își trădează niciodată prietenii.","english":"A true gentleman never betrays his friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073607"},{"id":"tat-1185077","romanian":"Vei traduce asta în franceză?","english":"Will you translate this into French?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321419"},{"id":"tat-13563110","romanian":"Cei care se căsătoresc într-o zi ploioasă vor fi fericiți pentru toată viața.","english":"Whoever gets married on a rainy day will be happy for the rest of their life.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583827","romanian":"În fiecare duminică după-amiaza merg la târg.","english":"Every Sunday afternoon, I go to the bazaar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1913109"},{"id":"tat-13632854","romanian":"Există o scădere vizibilă în ceea ce privește respectul pentru autorități și tradiții.","english":"There’s a noticeable decline in respect for authority and tradition.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536357","romanian":"Trebuie să învățăm să trăim împreună ca frații sau vom pieri împreună ca proștii.","english":"We must learn to live together as brothers, or we will perish together as fools.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136536","romanian":"Rockul este muzica celor tineri.","english":"Rock is the music of the young.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965478"},{"id":"tat-1136969","romanian":"Tom avea intenția să meargă iar la Boston.","english":"Tom felt like going to Boston again.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966185"},{"id":"tat-1136758","romanian":"N-am văzut nici măcar un meci.","english":"We did not see a single game.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966190"},{"id":"tat-1059483","romanian":"A venit să ne roage să-l ajutăm.","english":"He came to ask us to help him.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10265378"},{"id":"tat-1136815","romanian":"O serie de accidente rutiere au avut loc recent.","english":"A number of traffic accidents have happened recently.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966350"},{"id":"tat-405835","romanian":"Transmite-i, te rog, salutări doamnei Andreescu!","english":"Please say hello to Mrs. Andreescu!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350559"},{"id":"tat-1192781","romanian":"Primul este inferior ultimului în anumite privințe.","english":"The former is inferior to the latter in some respect.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364292"},{"id":"tat-2536451","romanian":"Ar fi distractiv să vezi cum se schimbă lucrurile de-a lungul anilor.","english":"It would be fun to see how things change over the years.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-2","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":215,"excerpt":"Căzu în genunche şi se rugă lui Dumnezeu, şi o! minune! deodată răsări, măre, dintr-un colţ al chiliei sale o viţă, şi numaidecât crescu şi se înălţă, până la streaşina casei."},{"id":"story-ro-povestea-lui-stan-p-itul","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Era odată un flăcău stătut, pe care-l chema Stan. Şi flăcăul acela din copilăria lui se trezise prin străini, fără să cunoască tată şi mamă şi fără nici o rudă care să-l ocrotească şi să-l ajute."},{"id":"story-ro-borta-v-ntului-2","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":213,"excerpt":"– Mă duceam s’ astup borta vântului ş’ am întâlnit un nebun pe drum şi mi-o dat o nucă şi-a zis să nu zic pân’ a casă nucă, deschide-te. Ce-a mai fi şi asta? Femeia omului vicleană. Ia o nucă ‘n mână şi zice: – Ia să-ţi văd nuca. Îi schimbă nuca omului."},{"id":"story-ro-sult-nica-3","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"– Aşa e omul… un ciocan, încă unul ş-al treilea, până ajungi la tinichea… d-acolo-ncolo… Dumnezeu cu mila… torni, parcă torni într-o pârnaie… Dar Sanda ce-o să zică… că mi-a dat Sfântul muiere harnică, dar rea, topenia pământului!… Înlăuntru s-aud ciocneli de pahare, buşeli de călcâie şi zbârnâitul otova al cobzarului. Trăgeau chindia de curgea ţărâna din pod."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-2","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":232,"excerpt":"Se miră şi femeia lui, căci nici ea nu mai văzuse un astfel de ou. Nu ştiau cum să umble mai binişor cu dânsul, ca să nu-l scape jos să se spargă. Unul zicea ca să-l coacă în spuză şi să mănânce toţi dintr-însul; altul zicea ca să-l fiarbă; altul zicea ca să-l păstreze."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-3","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Şi dintr-acel minut, nu ştiu ce făcea el, nu ştiu ce dregea, că se pomenea, fără voia lui, trecând pe la curtea împărătească, ia aşa, numai ca să treacă. El îşi uitase de peşte."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143120","romanian":"Inversa unei matrice nepătratice este un lucru periculos.","english":"The inverse of a non-square matrix is a dangerous thing.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068786"},{"id":"tat-1185087","romanian":"- Ce fel de senzație? întrebă negustorul.","english":"What kind of feeling? the shopkeeper asked.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321492"},{"id":"tat-584851","romanian":"Când a fost tânăr, a muncit cu sârguinţă.","english":"When he was young, he was a hard worker.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812437"},{"id":"tat-6794408","romanian":"Creierul uman este un lucru minunat. Funcționează până în momentul în care ții un discurs.","english":"The human brain is a wondrous thing. It works until the moment you stand up to make a speech.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-1136512","romanian":"Era cam douăzeci de dolari.","english":"It was about twenty dollars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11961625"},{"id":"tat-1059690","romanian":"Îmi poți da niște bani?","english":"Can you give me some money?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/931482"},{"id":"tat-1136674","romanian":"Te voi ajuta dacă este posibil.","english":"I will help you if possible.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239621"},{"id":"tat-487317","romanian":"Noi adesea dăm peste turiștii japonezi în această zonă.","english":"We often come across Japanese tourists in this area.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335455"},{"id":"tat-1144339","romanian":"Când a sosit autobuzul, s-a urcat în el.","english":"When the bus came, she got on.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073771"},{"id":"tat-5157262","romanian":"Un om egoist nu se gândește la nimic altceva decât la propriile sale sentimente.","english":"A selfish man thinks of nothing but his own feelings.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1064423","romanian":"Știu că el se uită la mine.","english":"I know he is watching me.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076332"},{"id":"tat-610807","romanian":"Mă surprinzi mereu cu sosirile tale neașteptate.","english":"You always astonish me with your unexpected arrivals.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/615896"},{"id":"tat-10787601","romanian":"Ai putea să te rănești dacă ai încerca să faci asta.","english":"You might get hurt if you tried doing that.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-670629","romanian":"A abandonat visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1626134"},{"id":"tat-1136627","romanian":"Cu toții ne dorim pace.","english":"We all wished for peace.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239780"},{"id":"tat-1136692","romanian":"Muncește din greu pentru a-și atinge scopul.","english":"He works hard to achieve his goal.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239729"},{"id":"tat-8760980","romanian":"Preotul a mers de câteva ori prin mijlocul enoriașilor, răspândind miros de tămâie din cădelniță.","english":"The priest walked among the parishioners several times, spreading the smell of incense from the censer.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12047690","romanian":"Dacă lumea ar ști de ce oameni mici este condusă, s-ar răzvrăti imediat.","english":"If the people knew by what small men they are ruled, they would soon rebel.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6538121","romanian":"Deși nu mai este președinte, el continuă să aibă o influență considerabilă printre elita politică.","english":"Though he is no longer president, he still holds considerable sway among the political elite.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-sarea-n-bucate-2","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Împăratul se bucură cât un lucru mare când auzi de la fetele lui cele mai mari cât îl iubesc. El socoti că altfel de iubire nu poate să fie decât cea dulce ca mierea şi ca zahărul."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":208,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti. A fost odată un împărat. Împăratul acesta stăpânea o lume întreagă, şi în lumea asta era un păcurar bătrân şi o păcurăriţă, care aveau trei fete: Ana, Stana şi Lăptiţa."},{"id":"story-ro-g-in-reasa-2","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Împăratul nu mai putea de bucurie de această întâmplare. Condurul sta d-a pururea pe masă în cămara împăratului. Oricine voia să-l încerce avea toată voia. Într-una din zile când împăratul ţinea sfat cu boierii cei mari pentru trebile împărăţiei, iacă şi fie-sa că vine şi se juca şi se zbenguia p-acolo prin cămară."},{"id":"story-ro-scormon","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":222,"excerpt":"Cât e de lung gardul, de la portiță până la cotitura uliței, Sanda l-a măsurat, nici ea singură nu știe de câte ori, cu firul în mână. Jos, lângă portiță, e vârtelnița cu jirebia de tort."},{"id":"story-ro-pas-rea-m-iastr-3","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":7,"genre":"folktale","wordCount":220,"excerpt":"Atunci vulpoiul făcu un semn asupra lui şi îl schimbă în stană de piatră. Văzând împăratul că fiul său cel mare nu se mai întoarce ascultă rugăciunea fiului celui mijlociu, şi îi dete voie să meargă şi dânsul. Acesta, după ce se găti şi îşi luă merinde de drum, porni şi dânsul."},{"id":"story-ro-ion-roat-i-cuza-vod-3","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Numai atâta, că bătrânii voiau \"Unire\" cu tocmală, iar tinerii \"Unire\" fără socoteală, cum s-a şi făcut."},{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
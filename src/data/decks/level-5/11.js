@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1124704","romanian":"Dicţionarul de pe birou este al meu.","english":"The dictionary on the desk is mine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11875296"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-706007","romanian":"Ascultându-l pe Mahler, Lyusya se gândea mereu la moarte şi la viaţa eternă.","english":"Listening to Mahler, Lyusya would always think of death and life eternal.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968825"},{"id":"tat-705790","romanian":"Domnul Suzuki nu este dentist, ci medic.","english":"Mr Suzuki is not a dentist but a physician.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963131"},{"id":"tat-610804","romanian":"După nașterea copilului trebuie să lucrezi jumătate de normă.","english":"After the birth of your child, you should make your work part-time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/614825"},{"id":"tat-708979","romanian":"În cartierul meu a fost un mare incendiu.","english":"There was a big fire in my neighborhood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420379"},{"id":"tat-1136647","romanian":"A preluat afacerea după decesul tatălui său.","english":"He took over the business after his father died.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966174"},{"id":"tat-1153836","romanian":"Ar trebui să fi terminat până acum.","english":"He should have finished it by now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130096"},{"id":"tat-13063081","romanian":"Puii au evoluat din alte păsări care au depus ouă, așa că oul a fost primul.","english":"Chickens evolved from other birds that laid eggs, so the egg came first.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143183","romanian":"A fost obligată să renunțe la plan.","english":"She was obliged to give up the plan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069259"},{"id":"tat-10006115","romanian":"În epoca stalinistă, prizonierii din lagărele de concentrare au devenit sclavi în slujba statului.","english":"During the Stalinist era, prisoners at concentration camps became slaves in service of the state.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6795174","romanian":"Muncitorii din țările nordice au plătit un preț ridicat pentru mutarea producției în regiunile sudice.","english":"The workers of the northern countries have paid a high price for the displacement of production in the southern regions.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-986478","romanian":"Te iubesc foarte mult.","english":"I love you very much.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10637115"},{"id":"tat-708918","romanian":"Ei nu îi plac şerpii şi matematica.","english":"She does not like snakes and mathematics.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397937"},{"id":"tat-670628","romanian":"A renunţat la visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1611173"},{"id":"tat-5158943","romanian":"Ceea ce îi este permis lui Jupiter nu este în mod necesar permis și unui bou.","english":"All that is allowed to Jupiter is not necessarily allowed to an ox.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143131","romanian":"Fă altora ceea ce vrei să îți facă ţie.","english":"Do to others as you would have them do to you.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068861"},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-488766","romanian":"Nu toate browserele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268767"},{"id":"tat-1142918","romanian":"Am auzit bomba explodând.","english":"We heard the bomb go off.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066399"}],"stories":[{"id":"story-ro-fata-mo-ului-3","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":257,"excerpt":"Iacă, e un basm cu ghicitoare vorba mea şi, de vreţi, am să vi-l spun, dacă mi-o face poala căpătâi o fată frumoasă. – Mai e vorbă? Vrem, vrem! – Uite, vin’ la mine. – Ba la mine! – Ba la mine, că-ţi caut în cap!"},{"id":"story-ro-pas-rea-m-iastr","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat evlavios şi bun. El avea trei feciori. Pe lângă multe bunătăţi ce făcuse oamenilor din împărăţia lui, a ridicat şi o monastire de care să se ducă pomina. A împodobit-o cu aur, cu pietre nestemate şi cu tot ceea ce meşterii din acea ţară au socotit mai scump şi mai frumos."},{"id":"story-ro-vasilie-finul-lui-dumnezeu","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste, cuvânt de poveste, în astă sară la noi soseşte pe un pai de secară, să te ţin de vorbă ‘n astă sară."},{"id":"story-ro-poveste","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"O, poveşti, poveşti… lumea toată este o poveste, căci ce-a fost odată ca niciodată o fi fost ca şi astăzi, şi ce este astăzi va fi odată ca niciodată."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-poveste-r-neasc-2","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Dară feciorul cel mic al împăratului nici nu voi să asculte de unele ca acestea, ci zise: – Duce-mă-voi singur, căci trebuie să fi ştiut tata ce zice, când ne-a poruncit să păzim câte unul singur. Şi astfel, cum veni seara, se duse la locul de pândă."},{"id":"story-ro-george-cel-viteaz-2","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"Balaurul, văzând una ca aceasta, se repezi şi el asupra împărătesei. Dar împărăteasa dete un ţipet şi se deşteptă. Îi sărise inima de frică şi-i tremurau toate cărnurile. P-aci, p-aci era să şi leşine. Spuse împăratului pocitania de vis, şi rămase şi el înmărmurit de groază."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
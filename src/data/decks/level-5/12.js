@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1163911","romanian":"Tata ia metroul de ora 7 către serviciu.","english":"Father takes the 7:00 subway to work.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196999"},{"id":"tat-1143149","romanian":"De la ce aeroport plec?","english":"Which airport do I leave from?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068959"},{"id":"tat-488782","romanian":"Lisa Lillien este măritată cu Dan Schneider.","english":"Lisa Lillien is married to Dan Schneider.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6352963"},{"id":"tat-5370019","romanian":"Un intelectual este o persoană care a descoperit ceva mai interesant decât sexul.","english":"An intellectual is a person who has discovered something more interesting than sex.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-408060","romanian":"I-am dat cărțile studentului acestuia.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232758"},{"id":"tat-1059656","romanian":"Ce limbi se vorbesc în Belgia?","english":"What languages do they speak in Belgium?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029005"},{"id":"tat-1059700","romanian":"Sper să merg în Canada anul viitor.","english":"I hope to go to Canada next year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795786"},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"},{"id":"tat-6867575","romanian":"Procurorii în instanță trebuie să-și justifice afirmațiile pentru a demonstra că un suspect este vinovat.","english":"Prosecutors in court have to substantiate their claims in order to prove a suspect is guilty.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568466","romanian":"Opinia e o idee pe care o avem; convingerea - o idee care ne subjugă.","english":"Our opinion is an idea which we have; our conviction an idea which has us.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064182","romanian":"Te rog ia loc aici.","english":"Please sit here.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070976"},{"id":"tat-1064211","romanian":"Despre ce voiai să vorbești cu mine?","english":"What did you want to talk to me about?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069328"},{"id":"tat-1136610","romanian":"Cu ajutorul doctorilor, s-a vindecat.","english":"With the help of doctors, she got over her illness.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966026"},{"id":"tat-12040285","romanian":"Există unele avioane, numite planoare, care nu au deloc motoare, dar zboară foarte bine.","english":"There are some aircraft, called gliders, that have no engines at all, but fly just fine.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185075","romanian":"Îi va lua mult să-și revină?","english":"Will it take long to recover?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321365"},{"id":"tat-1136659","romanian":"Nu are mai mult de o sută de cărți.","english":"He has no more than one hundred books.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227583"},{"id":"tat-1143217","romanian":"Acum am nevoie de o asistentă medicală.","english":"I need a nurse now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070009"},{"id":"tat-708932","romanian":"Cred că am o carie.","english":"I think I have a cavity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398620"},{"id":"tat-12929969","romanian":"Poți să mă consideri romantică, draga mea soră, dar simt amarnic lipsa unui prieten.","english":"You may deem me romantic, my dear sister, but I bitterly feel the want of a friend.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-stan-bolovan","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":220,"excerpt":"Au fost odată, într-o margine de sat, un om, pe nume Stan, şi muierea lui. Ea era tristă mereu şi degeaba încerca soţul ei să afle de ce, că ea nu voia să-i spună, căci, zicea ea, avea să fie şi el trist dacă află."},{"id":"story-ro-sarea-n-bucate","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"A fost odată un împărat. Acest împărat avea trei fete. Rămânând văduv, toată dragostea lui el şi-o aruncase asupra fetelor."},{"id":"story-enigma-otiliei","title":"Enigma Otiliei","author":"George Calinescu","difficulty":6,"genre":"fiction","wordCount":180,"excerpt":"Intr-o seara de vara, Felix Sima sosi in Bucuresti. Era student la Medicina si venise sa locuiasca la unchiul sau, Costache Giurgiuveanu. Casa din strada Antim era mare si veche, cu ziduri groase si ferestre inalte. Cand Felix a intrat in curte, a vazut o fata tanara care citea pe o banca, sub un tei batran."},{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."},{"id":"story-ro-sult-nica-2","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"II E începutul lui decembrie. A dat Dumnezeu zăpadă nemiluită; şi cade, cade puzderie măruntă şi deasă, ca făina la cernut, vânturată de un crivăţ care te orbeşte. Muşcelele dorm sub zăpadă de trei palme. Pădurile, în depărtare, cu tulpini fumurii, par cercelate cu flori de zarzări şi de corcoduşi."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-3","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":229,"excerpt":"De ce creştea copilul, d-aceea se făcea mai isteţ şi mai îndrăzneţ. Îl deteră pe la şcoli şi filosofi, şi toate învăţăturile pe care alţi copii le învăţa într-un an, el le învăţa într-o lună, astfel încât împăratul murea şi învia de bucurie. Toată împărăţia se fălea că o să aibă un împărat înţelept şi procopsit ca Solomon împărat."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-709899","romanian":"Am uitat să opresc televizorul înainte de a ma duce la culcare.","english":"I forgot to turn off the TV before going to bed.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426691"},{"id":"tat-1064310","romanian":"L-am văzut pe Tom lovind-o pe Mary.","english":"I saw Tom hit Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045325"},{"id":"tat-208","romanian":"Trebuie sa gandim pe termen lung, nu doar pe moment.","english":"We must think long-term, not just for the moment.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1153834","romanian":"Puteam auzi gemetele bărbatului rănit.","english":"We could hear the groans of the injured man.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130091"},{"id":"tat-1192704","romanian":"E nevoie să fie reparat.","english":"It needs to be repaired.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1116325"},{"id":"tat-1163898","romanian":"Nu îi dau niciodată câinelui meu carne nepreparată.","english":"I never feed my dog raw meat.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196922"},{"id":"tat-1153780","romanian":"Pari să te gândești la altceva.","english":"You seem to be thinking of something else.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128559"},{"id":"tat-1192790","romanian":"Oamenii promiseseră deja bani pentru proiectul său.","english":"People have already promised money for his project.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350198"},{"id":"tat-1186853","romanian":"- 30 de dolari e mult pentru acea cameră mică, se gândi el.","english":"Thirty dollars is a lot for that small room, he thought.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338197"},{"id":"tat-1136877","romanian":"Trebuie să ne gândim la comunitate.","english":"We must think about the community.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956374"},{"id":"tat-1185252","romanian":"Taro, du-te și spală-te pe dinți.","english":"Taro, go and brush your teeth.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328036"},{"id":"tat-857387","romanian":"Tango-ul este o exprimare verticală a unei dorinţe orizontale.","english":"Tango is the vertical expression of a horizontal desire.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10023982"},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-706020","romanian":"Formează câte o propoziție cu fiecare dintre aceste cuvinte.","english":"Make a sentence with each of these words.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968869"},{"id":"tat-10827564","romanian":"Am găsit un portofel pe jos și i l-am dat agentului de pază.","english":"I found a wallet on the ground and gave it to the security guard.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-923926","romanian":"Ce fel de lucruri te întristează?","english":"What sort of things make you feel sad?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/805469"},{"id":"tat-1279041","romanian":"Nimeni nu a venit să mă ajute.","english":"Nobody came to help me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13108759"},{"id":"tat-864490","romanian":"El ține legătura cu tot felul de oameni.","english":"He is in touch with all kinds of people.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855690"},{"id":"tat-487323","romanian":"Ea a încremenit în picioare ca și cum ar fi văzut o fantomă.","english":"She stood transfixed as if she had seen a ghost.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336252"}],"stories":[{"id":"story-ro-o-via-pierdut-2","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acum se stânge, încât abia mai rămâne sămânță de lumină… acum se ridică mai lătăreață și mai îndărătnică. Moș Mărian privește, îi ies lacrămile din ochi, i se sloiesc pe gene… De mult s-a-ntunecat și el mereu privește, ca și când ar voi să-și tălmăcească taina vieții din jocul acelei flăcări. În sfârșit, se mișcă."},{"id":"story-ro-p-dureanca","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":214,"excerpt":"Fă trei cruci și zi „Doamne-ajută!” când treci pragul casei, fie ca să ieși, fie ca să intri, căci lumea din întâmplări se alcătuiește, iar întâmplarea e noroc ori nenorocire, și nimeni nu știe dacă e rău ori bun ceasul în care a pornit, nici dacă va face ori nu ceea ce-și pune de gând."},{"id":"story-ro-ileana-cea-ireat-3","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acuma fata de împărat se apropie de fereastră şi grăi cu glas blând: – Ţi-am zis să mergi pe calea pe care ai venit: spini să-ţi crească-n cale şi flori să-ţi rămână pe urmă. Încă trei zile şi trei nopţi stete feciorul de împărat la fereastra fetei."},{"id":"story-ro-cinci-p-ini-3","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Mai dreaptă împărţeală decât aceasta nu cred că se mai poate nici la Dumnezeu sfântul… – Ba nu, prietene, zice cel cu două pâni. Eu nu mă ţin că mi-ai făcut parte dreaptă. Haide să ne judecăm, şi cum a zice judecata, aşa să rămâie. – Haide şi la judecată, zise celălalt, dacă nu te mulţămeşti."},{"id":"story-ro-bunica","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"O văz, ca prin vis. Poveşti de Barbu Ştefănescu Delavrancea - Bunica O văz limpede, aşa cum era. Naltă, uscăţivă, cu părul alb şi creţ, cu ochii căprui, cu gura strânsă şi cu buza de sus crestată în dinţi de pieptene, de la nas în jos. Cum deschidea poarta, îi săream înainte."},{"id":"story-ro-limir-mp-rat-3","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":212,"excerpt":"– Mergi – îi zise dar – copila mea, şi nici spine, nici buruiană în cale să nu-ţi găseşti."},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143226","romanian":"Vreau trei bucăți de zahăr în laptele meu.","english":"I want three sugars in my milk.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068445"},{"id":"tat-862826","romanian":"Mai bine mor de foame decât să fur.","english":"I would rather starve than steal.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014504"},{"id":"tat-1153837","romanian":"Amestecă bucuriile uneori cu cea mai serioasă ocupație.","english":"Mingle your joys sometimes with your earnest occupation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130097"},{"id":"tat-1136903","romanian":"Avem nevoie de ceva educație formală în literatură.","english":"We need some formal instruction in literature.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966068"},{"id":"tat-586093","romanian":"Dorința e pentru cei care cred în îndeplinirea ei.","english":"Wishing is for those who can believe.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7758342"},{"id":"tat-411885","romanian":"Mi-am adus câteva cărți de citit.","english":"I brought some of my books to read.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272023"},{"id":"tat-1153165","romanian":"Le-am spus să-mi trimită un alt bilet.","english":"I told them to send me another ticket.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1764648"},{"id":"tat-411966","romanian":"Am văzut-o pe Dana.","english":"I saw Dana.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272314"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-1059667","romanian":"Era văzut ca un om învățat în comunitatea noastră.","english":"He passed for a learned man in our community.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11028998"},{"id":"tat-8881352","romanian":"Am trăit cu o familie adoptivă pentru câteva luni, când eram mai tânăr.","english":"I lived with a foster family for a couple of months when I was younger.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153774","romanian":"Într-un final, Susan îi taie mamei vorba, promite să-i scrie și închide telefonul.","english":"Finally, Susan cuts her mother short, promises to write, and hangs up.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128481"},{"id":"tat-5158990","romanian":"Dacă calci cu fierul de călcat Elveția, ar fi mai mare decât Germania.","english":"If you ironed Switzerland, it would be bigger than Germany.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-407963","romanian":"Care este mai completă, prima ediție sau a doua?","english":"Which is more complete, the first edition or the second?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531998"},{"id":"tat-5025296","romanian":"Cred că ar trebui să îi spui lui Tom ceea ce el vrea să știe.","english":"I think you should tell Tom what he wants to know.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143215","romanian":"Vreau să cumpăr un procesor de text.","english":"I want to buy a word processor.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070006"},{"id":"tat-1144039","romanian":"Îți pot folosi mașina, tată?","english":"May I use your car, Dad?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072667"},{"id":"tat-406017","romanian":"O ploaie rece a căzut peste oraș.","english":"A cold rain fell over the city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350400"},{"id":"tat-2040372","romanian":"Inginerii au aruncat podul în aer pentru că era gata să se prăbușească.","english":"The engineers blew up the bridge because it was about to collapse.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-3","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Era o vâlcea împodobită cu fel de fel de floricele, toate înflorite, de părea că dă ghes omului să treacă printre ele."},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."},{"id":"story-ro-palatul-de-cle-tar-2","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Pe-aşa vremuri se zice că ar fi văcuit împăratul cu stema ruptă din soare, în cel mai frumos palat de cleştar şi peste cel mai înţelept şi mai viteaz norod. Nu era crai pe care împăratul cu stema ruptă din soare să nu-l fi domolit, că nici o oaste duşmană nu putea să-i stea împotrivă."},{"id":"story-ro-hagi-tudose-3","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"II Aşa m-au judecat şi pe mine, şi n-oi mai uita mai ales ochii mici şi vărgaţi ai ctitorului, care-mi tălmăcea zugrăvelile, înfigând degetul arătător asupra sfinţilor şi oftând parcă ar fi voit să plângă vremile apuse şi credinţele de odinioară. Erau patru. Trei – cu giubele lungi, cu şepci cu cozoroace de lac, crăpate şi şterse de lustru."},{"id":"story-ro-ho-u-mp-rat-3","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":216,"excerpt":"De aceea, fătul meu, te-am dat să înveţi toate meşteşugurile. Nu mi-a venit în gând că şi hoţia este un meşteşug. Aceasta îţi rămâne să mai înveţi, după care te vei face un împărat ca Solomon împărat şi cum altul nu va mai fi pe lume. – Ii!"},{"id":"story-ro-vasilie-finul-lui-dumnezeu-3","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Băietul când s-o făcut mare o ‘ntrebat: – Mamă, unde-i tata? Ea i-a spus lui, că nu ştie cine-i. Zice: – Eu mă duc, mamă, să-l cat. – Te-i duce, dragul mamei, da dacă-i pute scoate copacul de aici din pământ. Cum a pus mâna, l-o scos cum aş scoate eu o rădăcină de morcov."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-5078655","romanian":"Acela a fost locul unde cele două armate se vor bate din nou.","english":"That was where the two armies would fight again.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143230","romanian":"Mă doare brațul unde m-ai lovit.","english":"I have a very sore arm where you hit me.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068473"},{"id":"tat-6538116","romanian":"Chiar aș vrea să te ajut, dar am mâinile legate.","english":"I would really like to help you, but my hands are tied.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136795","romanian":"Găina a depus un ou în această dimineață.","english":"The chicken laid an egg this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966349"},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583918","romanian":"Am o durere de cap teribilă.","english":"I have a bad headache.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798048"},{"id":"tat-488775","romanian":"Prietena sa este japoneză.","english":"His girlfriend is Japanese.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6528911"},{"id":"tat-1163914","romanian":"Rata criminalității este în scădere în Canada.","english":"The crime rate is decreasing in Canada.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197021"},{"id":"tat-11270397","romanian":"Mi se pare că am uitat că să închid lumina.","english":"I think that I forgot to turn off the lights.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1143254","romanian":"Domnul Kinoshita și-a lăsat ochelarii la birou ieri seară.","english":"Mr Kinoshita left his glasses behind in the office yesterday evening.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068562"},{"id":"tat-1143212","romanian":"Vasta câmpie se întindea cât vezi cu ochii, punctată cu plantații ici și colo.","english":"The spacious plain spread as far as the eye can see, dotted with groves here and there.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070003"},{"id":"tat-1143279","romanian":"Există o limită de două bagaje pentru fiecare pasager.","english":"There is a limit of two pieces of luggage for each passenger.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068665"},{"id":"tat-11658423","romanian":"Majoritatea zmeurii sunt roșii, dar există și zmeură albă, galbenă și chiar violetă.","english":"Most raspberries are red, but there are also white, yellow, and even purple raspberries.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-411912","romanian":"Merg la film dacă am timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272128"},{"id":"tat-1136702","romanian":"Comparată cu a ta, mașina mea este mică.","english":"Compared with yours, my car is small.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239624"},{"id":"tat-712094","romanian":"E cel mai bun jucător din echipa noastră.","english":"He is the best player on our team.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440082"},{"id":"tat-706000","romanian":"Ai avut un sfârşit de săptămână plăcut?","english":"Did you have a good weekend?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968646"},{"id":"tat-487295","romanian":"Străzile noastre se inundă când plouă.","english":"Our streets flood when we have rain.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270651"},{"id":"tat-709901","romanian":"Unde se joacă Toni?","english":"Where is Tony playing?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426734"}],"stories":[{"id":"story-ro-ileana-cea-ireat","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":215,"excerpt":"A fost odinioară un împărat care avea trei fete, dintre care cea mai mare era frumoasă, cea mijlocie şi mai frumoasă, iar cea mai tânără, Ileana, atâta de frumoasă încât şi Sfântul Soare se oprea în cale ca s-o vadă şi să se desfăteze de frumuseţea ei."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-3","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"Să nu te sperii, dragul tatei, leul îmi va face groapa, şi tu vei trage pământ peste mine; de moştenire n-am ce să-ţi las decât un frâu de cal. După ce vei rămânea singur, să te sui în pod, să iei frâul, să-l scuturi, şi îndată va veni un cal şi te va învăţa ce să faci."},{"id":"story-ro-ion-roat-i-cuza-vod","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":229,"excerpt":"Între ţăranii fruntaşi care au luat parte, împreună cu boierii, cu episcopii şi cu mitropolitul ţării la Divanul ad-hoc din Moldova, în 1857, era şi moş Ion Roată, om cinstit şi cuviincios, cum sunt mai toţi ţăranii români de pretutindeni."},{"id":"story-ro-popa-tanda","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":229,"excerpt":"Ierte-l Dumnezeu pe dascălul Pintilie! Era cântăreț vestit. Și murăturile foarte mult îi plăceau. Mai ales dacă era cam răgușit, le bea cu gălbenuș de ou și i se dregea organul, încât răsunau ferestrele când cânta Mântuiește, Doamne, norodul tău! Era dascăl în Butucani, bun sat și mare, oameni cu stare și socoteală, pomeni și ospețe de bogat."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-3","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"– Ba nici râs, nici nimic, începu a zice neguţătorul cel chiabur. Iată două pungi: nu crez să-ţi dea altul mai mult. Şi scoase pungile cu bani, i le puse în mână, luă oul şi plecă. Bietul om rămase înlemnit în loc, uitându-se după neguţător cum se ducea. Nici că-i venea măcar să crează ochilor."},{"id":"story-ro-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"— Omul să fie mulțumit cu sărăcia sa, căci, dacă e vorba, nu bogăția, ci liniștea colibei tale te face fericit. Dar voi să faceți după cum vă trage inima, și Dumnezeu să vă ajute și să vă acopere cu aripa bunătății sale."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-11790112","romanian":"Dacă această echipă continuă să joace atât de prost, va fi retrogradată din nou.","english":"If this team continues to play this badly, it will be demoted again.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536438","romanian":"Acesta va fi un bun suvenir din călătoria mea în jurul Statelor Unite.","english":"This will be a good souvenir of my trip around the United States.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1119769","romanian":"Când a murit? \"Nu cu mult timp în urmă.\"","english":"When did he die? \"Not very long ago.\"","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11845708"},{"id":"tat-1185175","romanian":"Atletul părea imun la oboseală.","english":"The athlete seemed immune to fatigue.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324302"},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-1108692","romanian":"Ne vedem mâine!","english":"See you tomorrow.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11747448"},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-1057690","romanian":"Efectele au avut impact mai mult asupra familiilor sărace.","english":"The effects have impacted most on poorer families.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11036698"},{"id":"tat-1056757","romanian":"Spre deosebire de fratele ei, Sienna este foarte introvertită.","english":"Unlike her brother, Sienna is very introverted.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031405"},{"id":"tat-1278889","romanian":"Nu a fost permis nimănui să părăsească camera.","english":"Nobody was allowed to leave the room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13345377"},{"id":"tat-1186852","romanian":"Diferențe subtile în ton diferențiază orginalul de copie.","english":"Subtle differences in tone discriminate the original from the copy.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338196"},{"id":"tat-712075","romanian":"Am vizitat Fukuoka acum zece ani.","english":"I visited Fukuoka ten years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440712"},{"id":"tat-13598707","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singur.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185249","romanian":"Un măr pe zi ține doctorul departe.","english":"An apple a day keeps the doctor away.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324562"},{"id":"tat-1064267","romanian":"Ce fel de mâncare îi place lui Tom?","english":"What kind of food does Tom like?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064842"},{"id":"tat-1136689","romanian":"Clasa noastră e formată din 40 de băieți.","english":"Our class consists of 40 boys.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239666"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-6826720","romanian":"Spre deosebire de sora lui, el și-a păstrat credința religioasă insuflată de părinții lui.","english":"Unlike his sister, he has retained the religious faith his parents brought him up in.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4144674","romanian":"Dacă îmi aduc bine aminte, ai fost destul de optimist la acel moment.","english":"If I remember correctly, you were quite optimistic at that time.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-708939","romanian":"Preţurile vor fi din ce în ce mai mari.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398956"}],"stories":[{"id":"story-ro-c-lin-nebunul-3","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":209,"excerpt":"– Hai! Şi l-a omorât şi pe acesta ş-a făcut patru căpiţi de carne din capetele lui. Acu, când s-au trezit ei, o-nceput să-i deie de grijă lui Călin Nebunul că să păzească bine focul. Acu el a treia noapte era să fie. Acu iar pe la miezul nopţii s-auzi un huiet mare. Un zmeu era – cu opt capete."},{"id":"story-ro-poveste-r-neasc-3","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Cum se auzi cocoşul, duhul pieri ca o nălucă, dară şi băiatul căzu jos de ostenit. De mai ţinea lupta, numai cât ai aţâţa un foc, s-ar fi muiat, şi cine ştie ce se întâmpla. Cum căzu fiul de împărat pe mormântul tătâne-său, acolo şi adormi. Atât era de rupt de oboseală. Când se deşteptă, ce să vedeţi d-voastră?"},{"id":"story-ro-departe-departe","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"Sub castanii din via părăsită, mai mulţi copilaşi, în cămăşi albe, mă înconjuraseră. Stam pe pământul cald, cu mâinile sub cap, privind adâncul cerului albastru, şi povesteam. Poveşti de Barbu Ştefănescu Delavrancea - Departe, departe O fetiţă îmi sorbea cuvintele, dând într-o parte şi alta, pletele negre ce-i acopereau ochii ei mari şi verzi…"},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."},{"id":"story-ro-stan-bolovan-3","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"Aflând Stan că anul e de trei zile, iar simbria de şapte saci de galbeni pe zi, se învoi şi plecă cu zmeul. Ajunseră nu departe de casă, iar Stan o zări pe mama zmeului, bătrână şi groaznică la vedere."},{"id":"story-ro-moara-cu-noroc-2","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"Iacă liniștea colibei. — Nu zic, grăi soacra așezată."},{"id":"story-ro-g-in-reasa","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"A fost odată un împărat şi o împărăteasă. În căsătoria lor ei au trăit ca fraţii, şi numai o fată au fost făcut. Ca şi mumă-sa, această fată, din naştere, era cu o stea în frunte."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1136703","romanian":"Senatul a hotărât să fie ales un nou consul şi țara să fie eliberată de inamici.","english":"The Senate decreed that a new consul be chosen and the country be delivered from the enemies.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212781"},{"id":"tat-1291046","romanian":"Dansatoarele par fragile în rochiile lor albe, dar în realitate sunt foarte puternice.","english":"The dancers look delicate in their white dresses, but they are really as strong as horses.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-1143566","romanian":"Îmi place mult viața de la oraș.","english":"I really like city life.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072636"},{"id":"tat-6068363","romanian":"Acești arbori cotiți sunt echilibrați cu precizie pentru motoarele cu turație ridicată și lină.","english":"These crank shafts are precision balanced for smooth high revving engines.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136912","romanian":"Casa mea e aproape de stația de autobuz.","english":"My house is close to a bus stop.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966001"},{"id":"tat-864492","romanian":"Când am sunat, el deja plecase.","english":"When I called, he had already set off.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6872543"},{"id":"tat-706185","romanian":"Kumi este fata al cărei tată îi plac căinii.","english":"Kumi is the girl whose father likes dogs.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/976233"},{"id":"tat-610855","romanian":"La începutul fiecărui sfârşit de săptămână sunt în acelaşi timp obosit şi bucuros.","english":"At the start of every weekend, I am both tired and happy.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/684564"},{"id":"tat-1064177","romanian":"Dintr-o dată mama a început să cânte.","english":"Suddenly, my mother started singing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070211"},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-705817","romanian":"El a jucat un rol foarte important în afacere.","english":"He played an important part in the enterprise.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963911"},{"id":"tat-1136575","romanian":"Sosirea trupelor a condus la exacerbarea violențelor.","english":"The arrival of the troops led to more violence.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966041"},{"id":"tat-1197123","romanian":"Cât e până la aeroport?","english":"How far is it to the airport?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3134254"},{"id":"tat-1186846","romanian":"Ori Tom, ori eu trebuie să plec.","english":"Either Tom or I must go.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338151"},{"id":"tat-706078","romanian":"Care echipă a câştigat meciul?","english":"Which team won the game?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970911"},{"id":"tat-1143234","romanian":"Tom a cerut un apel de deșteptare.","english":"Tom asked for a wake-up call.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068482"},{"id":"tat-1185173","romanian":"A zis că trebuie să păstrăm secretul.","english":"He said we must keep the secret.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324299"}],"stories":[{"id":"story-ro-frumoasa-lumii-3","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":221,"excerpt":"În a treia duminică, când a dus oul, a pus pe gânduri pe jidan. Şi s-a gândit aşa jidanul: l-a întrebat unde şede, să se ducă să vadă de unde are el ouă de aur. Vine jidanul; da’ el ţinea cuşca în colţul casei. Cum a intrat jidanul în casă – el ştia carte – odată şi-aruncă ochii-n fundul casei."},{"id":"story-ro-rodul-tainic-3","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Iară dânsa era Mama Vânturilor. Seara, după ce s-a întors, fiul ei a simţit miros de om pământean. – Simt boare de om, zise el mumei sale. Cine a venit şi în ce treburi umblă? Ea îi spuse ce şi cum, toate din fir a păr, precum le aflase de la Danciu."},{"id":"story-ro-norocul-dracului","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Ba e noroc! Poveşti de Barbu Ştefănescu Delavrancea - Norocul dracului – Ba nu e noroc! – Ba e noroc, muiere! – Ba nu e, mă omule, nu! – Adică, nu muncesc eu, femeie? – Ba munceşti pentru unul, şi noi suntem opt guri, şi cu Plăviţa, nouă."},{"id":"story-luceafarul","title":"Luceafarul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":140,"excerpt":"A fost odata ca-n povesti, A fost ca niciodata, Din rude mari imparatesti, O prea frumoasa fata. Si era una la parinti Si mindra-n toate cele, Cum e Fecioara intre sfinti Si luna intre stele. Din umbra falnicelor bolti Ea pasul si-l indreapta Linga fereastra, unde-Loss'n colti Luceste alba noapte."},{"id":"story-ro-mo-nichifor-co-cariul-2","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":224,"excerpt":"Două iepe, albe ca zăpada şi iuţi ca focul, se sprijineau mai totdeauna de oiştea căruţei; mai totdeauna, dar nu totdeauna, căci moş Nichifor era şi geambaş de cai, şi când îi venea la socoteală, făcea schimb, ori vindea câte-o iapă chiar în mijlocul drumului, şi atunci rămânea oiştea goală pe de-o parte."},{"id":"story-ro-o-via-pierdut","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Crivățul șuieră și vâjie izbind în toate părțile stropii sloiți. Pereții caselor, geamurile ferestrilor, scoarța copacilor, grădelele de prin prejurul grădinii, toate deopotrivă sunt învăluite cu o lucie coajă de sloi. În grădina bisericii, pe piața de dinaintea ei, pe ulițile ce se varsă din toate părțile, oamenii, unii pe jos, alții cu trăsura, grăbesc la adăpostul călduros."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
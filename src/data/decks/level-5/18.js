@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192791","romanian":"Tom s-ar putea să mintă despre asta.","english":"Tom may possibly be lying about that.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350289"},{"id":"tat-1136863","romanian":"Toată lumea știe că încă este în viață.","english":"Everybody knows for a fact that he is still alive.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966276"},{"id":"tat-1059501","romanian":"General Motors a dat afară cei 76.000 de muncitori.","english":"General Motors laid off 76,000 workers.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7534514"},{"id":"tat-709045","romanian":"M-am întâlnit cu ea seara târziu.","english":"I met her late in the evening.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420335"},{"id":"tat-5236279","romanian":"L-am întrebat pe Tom dacă el o poate avea gata până la 2:30.","english":"I asked Tom if he could have it ready by 2:30.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136388","romanian":"Este respectat de toată lumea.","english":"He is respected by everyone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962876"},{"id":"tat-6918496","romanian":"Am crezut că Tom va fi de acord cu mine.","english":"I thought Tom would agree with me.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1144330","romanian":"Acea petrecere s-a ținut sub auspiciile Ministerului Afacerilor Externe.","english":"That party was held under the auspices of the Foreign Ministry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073626"},{"id":"tat-1064195","romanian":"Cred că Tom și Mary sunt căsătoriți în secret.","english":"I think Tom and Mary are secretly married.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072663"},{"id":"tat-698951","romanian":"Am 2 frați.","english":"I have two brothers.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2817943"},{"id":"tat-709035","romanian":"În afară de mine, toată lumea este ocupată.","english":"Everybody is busy except me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420321"},{"id":"tat-670630","romanian":"Probabil, dar el vrea ca să renunţ dintr-odată.","english":"Maybe, but he wants me to stop cold turkey.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1628320"},{"id":"tat-7187074","romanian":"Aceasta este prima dată când guvernul a efectuat o anchetă la nivel național, privind sinuciderile.","english":"This is the first time the government has done a nationwide investigation regarding suicides.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6764268","romanian":"El a crezut că afirmația ei este pur și simplu imposibilă și a consimțit propunerea.","english":"He believed her assertion to be simply impossible and assented to the proposal.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-863630","romanian":"Trebuie să îmi fac o asigurare de sănătate.","english":"I need to purchase health insurance.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9133595"},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-1136621","romanian":"M-a făcut să scriu scrisoarea cu stiloul.","english":"He made me write the letter with a pen.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227767"},{"id":"tat-705816","romanian":"Mary s-a ataşat foarte tare de fetiţa aceea.","english":"Mary is very attached to the little girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963910"},{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-mo-nichifor-co-cariul","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Moş Nichifor nu-i o închipuire din poveşti, ci e un om ca toţi oamenii; el a fost odată, când a fost, trăitor din mahalaua Ţuţuenii din Târgul Neamţului, dinspre satul Vânătorii Neamţului."},{"id":"story-ro-sorcova-3","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":241,"excerpt":"II Zăpada îi pătrunsese în tindă; vântul îi cânta prin crăpăturile uşii parc-ar fi vuit în duba mare; şi Bălaşa era întinsă în pat, învelită c-o plapumă veche, soioasă şi ciuruită cu găuri prin care ieşeau gheomotoacele de lână neagră. Pe picioare îşi trântise două scovergi."},{"id":"story-ro-spaima-zmeilor-2","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":212,"excerpt":"Petre. Oamenii aceştia sunt adevărată pacoste pe capul meu. Mi s-a înăcrit cu ei! – De ce, sfinte Doamne? întrebă portarul raiului. – Nu vezi, răspunse Tatăl Ceresc, că sunt nesăţioşi?! Tot le-am dat, şi nu se mai mulţumesc."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-2","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":206,"excerpt":"La urmă, românul, mulţumit, vroi să dea câteva bucăţi de carne pravoslavnicului. Bătrânul îşi făcu cruce, se cutremură şi cu nici un preţ nu voi să primească, zicând c-un glas de mucenic: – Lasă, lasă, omul lui Dumnezeu, că pentru Dumnezeu am muncit. Ei, dar cine-mi fusese omul cu crucile!"}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
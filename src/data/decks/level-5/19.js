@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5252491","romanian":"Tom și Mary au fost de acord să plece de la petrecere înainte de miezul nopții.","english":"Tom and Mary agreed to leave the party before midnight.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136723","romanian":"Acolo nefiind taxiuri, a trebuit să merg pe jos.","english":"There being no taxis, I had to walk.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226178"},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"},{"id":"tat-1064413","romanian":"L-am văzut uitându-se la mine.","english":"I saw him looking at me.","difficulty":5,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075735"},{"id":"tat-405844","romanian":"L-am văzut pe Ion la bibliotecă.","english":"I saw John at the library.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350592"},{"id":"tat-584465","romanian":"Mă doare în gât şi îmi curge nasul.","english":"I have a sore throat and runny nose.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807839"},{"id":"tat-2568483","romanian":"E mai ușor să te dai la oameni pe Internet decât pe stradă.","english":"It is easier to hit on people on the Internet than in the street.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5233189","romanian":"Ai vreo idee la ce oră va ajunge Tom acasă?","english":"Do you have any idea what time Tom will come home?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-925175","romanian":"Plouă dar pentru cât plouă, plouă puţin.","english":"It rains, but for what it does rain, it rains little.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527273"},{"id":"tat-1153879","romanian":"Am confirmat telefonic rezervarea la hotel.","english":"We confirmed the hotel reservations by telephone.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12100238"},{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923800","romanian":"Prietenia noastră nu a durat.","english":"Our friendship did not last.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10419439"},{"id":"tat-1195264","romanian":"Vreau să citiți această carte.","english":"I want you to read this book.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7228754"},{"id":"tat-1064070","romanian":"Ce să fac ca să nu mai sughit?","english":"What should I do to stop hiccups?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068880"},{"id":"tat-5226266","romanian":"Tom s-a comportat ca și cum ar fi fost fericit, dar în interior era supărat.","english":"Tom acted happy, but deep inside he was sad.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136533","romanian":"Profesoara ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965168"},{"id":"tat-923884","romanian":"Am petrecut toată seara dansând împreună.","english":"We spent all evening dancing together.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444876"},{"id":"tat-1064343","romanian":"Tom și Mary vor avea un copil.","english":"Tom and Mary are going to have a baby.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11063518"},{"id":"tat-1185072","romanian":"O vei invita la petrecere?","english":"Are you going to invite her to the party?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321352"}],"stories":[{"id":"story-ro-flori-a-din-codru-2","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":238,"excerpt":"Cine ştie? vreun împărat ce domneşte în ascuns prin adâncul codrilor… Crâşmarul s-a lăsat de lemne, a luat fata în braţe, a dus-o acasă… şi de aici înainte a fost fata de suflet a lui şi a crâşmăriţei. Aşa a crescut apoi fata la crâşmă."},{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."},{"id":"story-ro-limir-mp-rat","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"A fost ce-a fost… a fost odată o văduvă care avea o fată, Lia, şi văduva era săracă de nu mai ştia cum să-şi înnoade zdrenţele, iar Lia, fata ei, se făcuse harnică de creşteau flori pe unde-i călca piciorul şi da muguri lemnul uscat când ea punea mâna pe el."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-p-dureanca-2","title":"Pădureanca","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Simțind apropierea timpului de secere, pădurile se pun în mișcare colibă cu colibă, sat cu sat se adună, văile pornesc întregi spre câmpia întinsă, și în câteva zile cât ține locul din Mureș până în părțile Orăzii și până la izvoarele Crișurilor nu mai rămân prin sate decât moșnegii neputincioși, babele bătrâne și copiii nevârstnici; setea de viață îi ia și-i duce pe toți la sărbătoarea cea mare ce se ține în fieștecare an o dată pentru împărțirea pânei de toate zilele."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-3","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Când luă ştergarul să se şteargă pe ochi, ce să vază? Trei picături de sânge pe dânsul. El îşi zise:\"Trebuie să mă întorc acasă, căci Dumnezeu ştie ce va fi păţit baba mea.\" Întinse unchiaşul la drum. Nu mai căuta nici de mâncare, nici de odihnă, şi se întoarse acasă cum plecase. – Ce ţi s-a întâmplat, babo?"},{"id":"story-ro-boierul-i-p-cal","title":"Boierul şi Păcală","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"Odată, Păcală stătea la marginea unei păduri. Deodată vede o trăsură venind spre el. Repede se scoală, ia un trunchi mare de copac, şi-l ridică drept în sus. În trăsură era boierul, cucoana şi vizitiul, care mâna caii. Boierul, văzând pe Păcală, spuse vizitiului să oprească trăsura: Poveşti de Ioan Slavici - Boierul şi Păcală – Bună ziua!"}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
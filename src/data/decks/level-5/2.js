@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143685","romanian":"M-am săturat de asta.","english":"I am fed up with it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072255"},{"id":"tat-2536729","romanian":"Să faci calcule este singurul mod social acceptabil de a te masturba în public.","english":"Doing math is the only socially acceptable way to masturbate in public.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1238705","romanian":"A fugit un bou în pantaloni scurți.","english":"A bull with short trousers has escaped.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5296592"},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064302","romanian":"Tom a întrebat-o pe Mary unde locuiește John.","english":"Tom asked Mary where John lived.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11051404"},{"id":"tat-1136556","romanian":"Nu așa îl văd eu.","english":"That is not my idea of him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959323"},{"id":"tat-1143285","romanian":"Am crezut că va veni curând.","english":"I thought he would come soon.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068675"},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064170","romanian":"Toată lumea în afară de Tom a fost prezentă.","english":"Everyone except Tom was present.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3090030"},{"id":"tat-13604225","romanian":"Tom și Mary au spus că au crezut că John va vrea să facă asta.","english":"Tom and Mary said they thought John would be willing to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1144301","romanian":"Refuz să fiu de acord cu acel plan.","english":"I refuse to consent to that plan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073270"},{"id":"tat-13616964","romanian":"Voi puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-408063","romanian":"Avem aceleași intenții, dar nu același mod de operare.","english":"We have the same intentions, but not the same modus operandi.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232774"},{"id":"tat-1143842","romanian":"Se ține întotdeauna de cuvânt.","english":"He always fulfills his promises.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070729"},{"id":"tat-706153","romanian":"O răţuşcă urâtă a devenit o lebădă graţioasă.","english":"An ugly duckling became a graceful swan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974759"},{"id":"tat-1153775","romanian":"La ce oră se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-712091","romanian":"De cât timp stă Ken în Kobe?","english":"How long has Ken lived in Kobe?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440065"},{"id":"tat-4779015","romanian":"Normalul este o iluzie. Ceea ce este normal pentru un păianjen este haos pentru muscă.","english":"Normality is an illusion. What is normal for a spider is chaos for a fly.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-411929","romanian":"Am dus hainele la curățat.","english":"I took my clothes to be cleaned.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272197"}],"stories":[{"id":"story-ro-z-na-mun-ilor-3","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Cum se duse turturica, simţi, nu ştiu cum, nu ştiu de ce, că îi tâcâia inima. După ce se întoarse acasă, era tot cm galeş. Împăratul văzând că tânjeşte fiu-său cu sănătatea, îl întrebă ce are, iară el răspunse că n-are nimic. Turturica aceea era Zâna Munţilor care se îndrăgostise de frumuseţea lui."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-2","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":221,"excerpt":"Pentru aceasta ele ca să arate că nu le pasă de nebăgarea lui de seamă, între ele, îl porocleau cu numele de Făt-Frumos al satului. Şi de unde să nu fie aşa!"},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."},{"id":"story-ro-amintiri-din-copil-rie-i","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":223,"excerpt":"Stau câteodată şi-mi aduc aminte ce vremi şi ce oameni mai erau în părţile noastre pe când începusem şi eu, drăgăliţă-Doamne, a mă ridica băieţaş la casa părinţilor mei, în satul Humuleşti, din târg drept peste apa Neamţului; sat mare şi vesel, împărţit în trei părţi, care se ţin tot de una: Vatra satului, Delenii şi Bejenii."},{"id":"story-ro-palatul-de-cle-tar","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":225,"excerpt":"Cam pe la începutul vremilor, până unde praştia minţii nu azvârle, se povesteşte, aşa, ca din scorneală, că omul era croit din alte foarfeci şi cioplit din altă bardă."},{"id":"story-ro-bunica-2","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":242,"excerpt":"– A fost odată un împărat mare, mare… – Cât de mare? – Mare de tot. Şi-şi iubea împărăteasa ca ochii din cap. Dar copii nu avea. Şi îi părea rău, îi părea rău că nu avea copii… – Bunico, e rău să nu ai copii? – Fireşte că e rău. Casa omului fără copii e casă pustie."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-2","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Încă fiind acolo, văzu cum înfloreşte pomul, cum îi cade florile şi cum roadele se arată iarăşi. Atunci îi mai veni inima la loc şi se mulţumi a aştepta până a doua zi. în ziua următoare, ia merele de unde nu e. S-a supărat împăratul, nevoie mare, şi porunci ca paznici să se uite să prinză pe hoţi. Dară aşi!"}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1136700","romanian":"Mi-a dat ce bani avea la el.","english":"He gave me what money he had with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239591"},{"id":"tat-1064255","romanian":"Tom s-a prefăcut că nu aude nimic.","english":"Tom pretended to not hear a thing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073104"},{"id":"tat-1159796","romanian":"Paharul este plin cu apă.","english":"The glass is full of water.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167541"},{"id":"tat-1192772","romanian":"Ce doriți: ceai sau cafea?","english":"Which do you want, tea or coffee?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364282"},{"id":"tat-1144324","romanian":"I s-a făcut o injecție înainte de operație.","english":"He had an injection prior to the operation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073578"},{"id":"tat-1136402","romanian":"Conducerea a încercat să liniștească muncitorii oferindu-le un bonus.","english":"Management tried to appease labor by offering them a bonus.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962896"},{"id":"tat-1136849","romanian":"Cât de adânc este lacul?","english":"How deep is the lake?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966273"},{"id":"tat-1136890","romanian":"Ei sunt un poet și un om de stat.","english":"They are a poet and a statesman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957806"},{"id":"tat-610910","romanian":"Îmi dai brânza cremă te rog?","english":"Would you pass me the cream cheese, please?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/752477"},{"id":"tat-599089","romanian":"Numele tău se află în capul listei.","english":"Your name stands first in the list.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1447346"},{"id":"tat-1185074","romanian":"Ar putea deveni jucător de baseball.","english":"He may become a baseball player.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321358"},{"id":"tat-1153152","romanian":"Nu e un om care să spună o minciună.","english":"He is not a man to tell a lie.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692344"},{"id":"tat-408090","romanian":"Prietenul nostru a terminat cursa al doilea.","english":"Our friend finished the race in second place.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232893"},{"id":"tat-2568478","romanian":"Am dormit un pic în timpul pauzei de prânz pentru că eram foarte obosit.","english":"I slept a little during lunch break because I was so tired.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185070","romanian":"Mi-e teamă că am luat o răceală.","english":"I worry that I have caught a cold.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321256"},{"id":"tat-1136770","romanian":"Ziua a fost furtunoasă și ceea ce a fost încă și mai rău a fost că fulgera.","english":"The day was stormy, and what was worse still, it was thundering.","difficulty":7,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966198"},{"id":"tat-1138114","romanian":"Nu trebuie să citești o asemenea revistă pentru că îți va face rău.","english":"You must not read such a magazine, as it will do you harm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11658152","romanian":"Girafa este cel mai înalt animal din existență, dar au existat și dinozauri mai înalți.","english":"The giraffe is the tallest animal in existence, but there were even taller dinosaurs.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6824680","romanian":"De acum înainte, această veveriță va fi cunoscută sub numele de \"Cea drăguță\".","english":"This squirrel shall be henceforth known as \"The Cute One.\"","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6908965","romanian":"Tom ar trebuie să mai iasă și să se distreze.","english":"Tom should go out and have some fun.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-2","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"Dorinţa ce ai o să-ţi aducă întristare. – Eu nu am venit să te întreb asta, zise împăratul, ci, dacă ai ceva leacuri care să ne facă să avem copii, să-mi dai. – Am, răspunse unchiaşul; dar numai un copil o să faceţi. El o să fie Făt-Frumos şi drăgăstos, şi parte n-o să aveţi de el."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-ro-departe-departe-3","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":210,"excerpt":"Şi când mi se păru că palatul se şterge de pe faţa pământului, o rupsei la fugă îndărăt, căci ce m-aş fi făcut în aşa pustietate? Şi de ce goneam, de ce palatul se ridica uşor din grădinile fumurii. Lacul e roşu ca sângele. Apune soarele. Mă rezemai de-o salcie scorburoasă şi începui să mă gândesc. Mi-e foame."},{"id":"story-ro-comoara","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":252,"excerpt":"Sănătatea! Binecuvântata de sănătate! Sănătos să fii, și ți-e destul un pumn de mălai, ca nici pe un împărat să nu te dai! Se scula Duțu cu noaptea-n cap și pleca-n cântarul cocoșilor, căci era lung drumul până la linie și ținea să se puie la lucru mai nainte de a se fi luminat de ziuă."},{"id":"story-ro-uer-2","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":215,"excerpt":"Kira şi-aşteaptă voinicul din haiducie. În coarne de cerb atârnă carabine cu guri largi şi pistoale cu plăsele de argint şi de sidef. Văpaiţa, cu feştilă de câlţi răsuciţi, tremură în colibă o lumină galbenă şi tristă. Flacăra ei slabă joacă, ca şi când ar voi să scape din feştilă, şi aruncă umbra Kirei, de pe perete, sus, pe grinzi."},{"id":"story-ro-limir-mp-rat-2","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":203,"excerpt":"Când se scula, văduva stetea mai bucuros afară decât în casă, şi Lia ridica gunoiul din prag, îl ducea la locul lui, apoi intra ca să dereticească prin colibă, cântând voioasă, şi oglindă luminoasă se făcea toate sub mâna ei, încât, împărat de-ai fi fost, ţi-ai fi părăsit palatele ca să stai în coliba văduvei."},{"id":"story-ro-porcul-cel-fermecat-2","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Aşa făcură şi le mergea bine. Vicleanul pizmuia pacea fetelor şi-şi vârî coada. – Surioarele mele, zise fata cea mare, câtu-i ziulica de mare toarcem, coasem, citim. Sunt câteva zile de când ne aflăm singure, n-a mai rămas nici un colţ de grădină pe unde să nu ne fi plimbat."}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
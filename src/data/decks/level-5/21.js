@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-702065","romanian":"Agenţia de voiaj ne-a furnizat toate detaliile turului.","english":"The travel company furnished us with all the details of the tour.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398902"},{"id":"tat-6060858","romanian":"Poate ai putea sa inveti cite ceva de la el.","english":"Perhaps you could learn a thing or two from him.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136813","romanian":"Tata și-a ajustat întotdeauna costumele la croitor.","english":"Father always has the tailor make his suits.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966356"},{"id":"tat-1136549","romanian":"M-am sfătuit cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958681"},{"id":"tat-13603973","romanian":"Tom este cel care mi-a spus că ar trebui să citesc această carte.","english":"Tom is the one who told me that I should read this book.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862342","romanian":"John a avut o ceartă violentă cu soția sa.","english":"John had a violent quarrel with his wife.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10020874"},{"id":"tat-670576","romanian":"Ce se va întâmpla cu ea?","english":"What will happen to her?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2299514"},{"id":"tat-864477","romanian":"Pe câinele nostru l-am numit White.","english":"We named our dog White.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817260"},{"id":"tat-1288424","romanian":"Cei care folosesc furculița s-au aflat din punct de vedere istoric mereu în minoritate.","english":"Fork-users have historically been in the minority.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143133","romanian":"Întotdeauna sunt ajutat de tine.","english":"I am always helped by you.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068889"},{"id":"tat-1059702","romanian":"Dacă aduni trei cu patru, obții șapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758844"},{"id":"tat-1136593","romanian":"Am reușit să trec examenul.","english":"I was able to pass the exam.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966064"},{"id":"tat-6981787","romanian":"El putea să vadă că regele lui va primi șah-mat în cinci mutări.","english":"He could see that his king would be checkmated within five moves.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13619295","romanian":"Tom a trecut cuțitul peste piatra de ascuțit până când a devenit ascuțit ca briciul.","english":"Tom slid the knife across the whetstone until it was razor-sharp.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-708929","romanian":"Juan se îmbracă.","english":"Juan is getting dressed.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398353"},{"id":"tat-1136826","romanian":"Trebuie să plec chiar acum?","english":"Must I leave at once?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966311"},{"id":"tat-702061","romanian":"El a ţinut un jurnal în timpul călătoriei.","english":"He kept a diary during the trip.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398898"},{"id":"tat-1142931","romanian":"Am început cu doi tovarăși de călătorie.","english":"I started with two traveling companions.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066641"},{"id":"tat-1192747","romanian":"Te rog du-te la Departamentul de Chirurgie.","english":"Please go to the Surgery Department.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/289686"},{"id":"tat-1136436","romanian":"Adevărul arde și distruge toate elementele, arătând că acestea îi sunt doar umbră.","english":"Truth burns and destroys all elements, showing that they are merely its shadow.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965909"}],"stories":[{"id":"story-ro-z-na-mun-ilor","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat foarte viteaz; toate împărăţiile de prinprejurul împărăţiei sale îi cerea sfaturi: atâta era de drept şi înţelept. Când se isca sfadă între dânşii, la acest împărat mergeau mai întâi la judecată şi, cum zicea el, aşa se şi făcea, fiindcă era judecător drept şi iubitor de pace."},{"id":"story-ro-frumoasa-lumii-2","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":211,"excerpt":"Alungând-o el prin copac, ea se vârâ-ntr-o bortă… ş-o prinde. El n-a mai stătut către noapte, că s-a temut de draci, ci a luat pasărea ş-a venit acasă ş-a făcut o cuşcă bună ş-a pus pasărea-n cuşcă. Acu el în ziua ceea, era sâmbătă, care-o prins-o, şi duminică dimineaţa s-a ouat un ou. Oul era de aur."},{"id":"story-ro-scormon-3","title":"Scormon","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":205,"excerpt":"Îi părea c-a mai văzut adeseori acest câine, dar unde și cum nu-și aducea aminte. Deodată, fața ei se însenină. — Scormon! strigă ea cu bucurie, ca și când ar întâlni un vechi prieten."},{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-prima-zi","title":"Prima zi de scoala","author":"Contemporary","difficulty":3,"genre":"fiction","wordCount":155,"excerpt":"Maria avea sapte ani si era prima ei zi de scoala. Se trezise de dimineata, entuziasmata dar si putin speriata. \"Ce daca nu-mi voi face prieteni?\" se gandea ea. \"Ce daca profesoara nu ma va placea?\" Mama ei i-a pregatit micul dejun si i-a impletit parul in doua codite. Tata i-a dat ghiozdanul nou, plin de caiete si creioane colorate."},{"id":"story-ro-uer","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"La răspântia căilor singuratice, unde călătorul e minune şi glasul omului poveste, o colibă, dusă pe jumătate în pământ, stă locului neclintită. Poveşti de Barbu Ştefănescu Delavrancea - Şuer Stăpânul lumii e vântul, şi aruncă, ca în bătătură la el, clăi de nori posomorâţi peste întinsul cerului."},{"id":"story-ro-neghini-3","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":235,"excerpt":"– Bine, bine, zise acelaşi glas, văd eu că nu-ţi trebuie copii… Baba îşi luă inima în dinţi şi zise: – Ba-mi trebuie… da’ unde eşti… cine eşti? – Cine sunt? Neghiniţă, gândul lumii. De mic ce sunt, pătrund în urechile oamenilor şi-i ascult cum gândesc."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1192802","romanian":"Niciunul dintre copacii bătrâni nu a supraviețuit focului.","english":"None of the old trees survived the fire.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353825"},{"id":"tat-1136554","romanian":"Trebuie să învățați toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960194"},{"id":"tat-1144284","romanian":"Are o legătură cu furtul.","english":"He has something to do with the robbery.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7510355"},{"id":"tat-6637083","romanian":"Construcția barajului a creat un lac artificial, care a distrus un întreg ecosistem.","english":"The construction of the dam created an artificial lake that destroyed a whole ecosystem.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153793","romanian":"Voi lua o cină cu un prieten.","english":"I am going to eat an evening meal with a friend.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128725"},{"id":"tat-411934","romanian":"Am văzut-o pe Andreea plecând de acasă.","english":"I saw Andrea leaving home.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272215"},{"id":"tat-1136851","romanian":"Te-ai spălat deja pe mâini?","english":"Have you washed your hands yet?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966287"},{"id":"tat-1136532","romanian":"Profesorul ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960883"},{"id":"tat-1136431","romanian":"A mers pe cal până la mare.","english":"He rode a horse to the sea.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965821"},{"id":"tat-6741797","romanian":"Dintre toți jucătorii de baseball faimoși, el se evidențiază ca fiind un geniu.","english":"Of all the famous baseball players, he stands out as a genius.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1279158","romanian":"Ceasul meu înaintează cu cinci secunde pe zi.","english":"My clock is running 5 seconds faster every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13123222"},{"id":"tat-6582845","romanian":"Cei mai mulți dintre țăranii care locuiesc în acest sat uitat-de-lume sunt analfabeți.","english":"Most of the peasants living in this godforsaken village are illiterate.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1059693","romanian":"Trebuie să fiu acolo până la ora 07.00.","english":"I must be there before 7:00.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758791"},{"id":"tat-10744389","romanian":"Am vrut să mă duc acasă și să iau cina cu soția mea.","english":"I wanted to go home and eat dinner with my wife.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136896","romanian":"Sunt atât de bucuros să vizit VNU.","english":"I’m so glad to visit VNU.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966032"},{"id":"tat-1128611","romanian":"Ce ai în geantă?","english":"What have you got in your bag?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11912837"},{"id":"tat-1143233","romanian":"Ai vrea să mergi la o plimbare?","english":"Would you like to go for a walk?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068480"},{"id":"tat-1064159","romanian":"Casa pe care a construit-o Tom este minunată.","english":"The house Tom built is wonderful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072308"},{"id":"tat-13617013","romanian":"Wisconsin este cunoscut pentru produsele sale lactate, nu pentru vacile sale de lapte.","english":"Wisconsin is known for its dairy, not for its dairy cows.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536493","romanian":"Hei, aș putea să nu am niciun ban, dar încă mai am mândrie.","english":"Hey, I may have no money, but I still have my pride.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-cele-trei-rodii-aurite","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un împărat, şi avea un fecior; acesta, şezând la fereastră, vede o babă bătrână, care venea cu tivga să ia apă de la fântână."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-2","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Băiatul lui i-o spus: iaca, tată, din ce pricină. Şi omul s-o sfătuit cu mama fetei, s-o prăpădească din pricina asta. Au tocmit un om, ş-au pus pe fată ‘n căruţă ş-au zis s-o ducă ‘ntr-o pustietate, şi să-i scoată ochii amândoi să-i aducă tătâne-său. Omul a luat-o. După fată se ţinea ş-un căţeluş."},{"id":"story-ro-p-cal-2","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":231,"excerpt":"Negustorul începu a-şi face cruce ca de naiba şi iar îl întrebă: – Dar cu chemarea împreună cum te mai strigă? – Iaca aşa: vino! u! mă! răspunse Păcală. Negustorul începu atunci a râde şi zise: ce prost! Apoi îl mai întrebă: – Dar ce bucate se fac acolo la voi? – Mai mult terciu cu mămăligă mâncăm, zise Păcală."},{"id":"story-ro-coto-man-n-zdr-vanu-2","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Când stăpâna casei făcea la ciorap, pisoiul se juca cu ghemul. Dară nu-l încurca, ferească Dumnezeu. Cum făcea el, cum dregea, se juca aşa de frumuşel, încât ghemul nici nu se desfăşura, nici nu se încurca."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."},{"id":"story-ro-norocul-dracului-3","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":238,"excerpt":"Dar unde să adoarmă? Jos, pământul tare şi rece; sus, întuneric adânc; în casă, copiii adorm plângând; în curte Plăviţa pufăie pe nări a foame; şi el, prigonit de gânduri şi de nenoroc. \"Dar mâine? Dacă n-oi avea ce scutura în copaie? Ce mă fac mâine?"}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
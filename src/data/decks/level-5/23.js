@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-699623","romanian":"Am văzut câinele.","english":"I saw the dog.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320070"},{"id":"tat-13619031","romanian":"Dumneavoastră nu sunteți o picătură în ocean, ci sunteți întregul ocean într-o picătură.","english":"You are not a drop in the ocean, you are the entire ocean in a drop.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7578049","romanian":"Am auzit că Tom plănuiește să se mute la Boston.","english":"I heard that Tom plans to move to Boston.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1200899","romanian":"Am plâns și am crezut.","english":"I wept and I believed.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11229733"},{"id":"tat-7115211","romanian":"Tom era în stare să vadă că o potențială situație periculoasă se putea ivi.","english":"Tom could see that a potentially dangerous situation could arise.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-11740023","romanian":"Când traduceți, este necesar să aveți toată rigoarea și niciun respect pentru original.","english":"When translating, one must have all the rigor and no respect for the original.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136707","romanian":"Amândoi și-au mâncat ciocolatele până la ultima îmbucătură.","english":"They both ate their chocolates down to the very last bite.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226212"},{"id":"tat-1159855","romanian":"Găsesc limbile străine foarte interesante.","english":"I find foreign languages very interesting.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12168137"},{"id":"tat-11487762","romanian":"Genele noastre ne definesc înfățișarea și trăsăturile. Experiențele definesc cine suntem.","english":"Our genetics define our appearances and traits. Our experiences define who we are.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-928488","romanian":"Desenele lui Lyod reprezintă persoane din secolul al paisprezecelea.","english":"The drawings Lyod has made show people from the 14th century.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5107153"},{"id":"tat-408085","romanian":"În primul rând, vreau să vă mulțumesc pentru ospitalitate.","english":"First of all, I would like to thank you for your hospitality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232873"},{"id":"tat-1186840","romanian":"Știam că era plastic, dar părea din lemn.","english":"I knew it was plastic but it tasted like wood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7317802"},{"id":"tat-1136628","romanian":"Mi-am pierdut umbrela.","english":"I have lost my umbrella.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227193"},{"id":"tat-1143221","romanian":"Cred că au fost căsătoriți timp de cinci ani.","english":"I think they have been married for five years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049596"},{"id":"tat-1064314","romanian":"Cât de des o vede Tom pe Mary?","english":"How often does Tom see Mary?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11060128"},{"id":"tat-11475333","romanian":"Ai putea avea te rog grijă de câinele meu mâine?","english":"Would you please look after my dog tomorrow?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136387","romanian":"Fără gravitație, am fi aruncați în spațiu.","english":"Without gravity we would be hurled off into space.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962828"},{"id":"tat-584349","romanian":"Nu lăsa pe mâine ce poţi face poimâine.","english":"Never put off until tomorrow what you can do the day after tomorrow.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798076"},{"id":"tat-1278932","romanian":"Nimeni nu e mai sus de el.","english":"No one is above him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13348271"}],"stories":[{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."},{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."},{"id":"story-ro-fata-mo-ului-2","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":238,"excerpt":"– Puricele. – Eh! grăi moş Doroftei cam supărat, am să v-astup cloanţa la toate. Ghiciţi acuma, de vă taie capul, de nu, să-l tăiaţi voi pe el: Din pulpă născută, pe claie aruncată, de vultur răpită, de babă robită, la domnie-ajunsă, de ţigancă tunsă: călugăraş mă făcui. Ce să fie? Ce să fie?"},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-2","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"După ce-l mai ciocmăni muierea o toană, puse în gând să-i facă voia, căci limbuţia nevestei îl scoase afară din ţâţâni. Se sculă, deci, de dimineaţă, îşi luă copiii şi plecară împreună cu vorba că merge la lemne."},{"id":"story-ro-p-cal-n-satul-lui-3","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Vedeau parcă cele şapte viţeluşe cum se fac viţele, juninci, cum ajung în cele din urmă vaci şi ele, şi cum le vinde Păcală şi pe ele şi se întoarce de la târg cu o spuză de viţeluşe, toate flămânde, toate pornite din fire să se facă viţele, juninci şi vaci în cele din urmă. – Măi!"},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":222,"excerpt":"A fost odată ca niciodată; că de n-ar fi, nu s-ar mai povesti; de când făcea plopşorul pere şi răchita micşunele; de când se băteau urşii în coade; de când se luau de gât lupii cu mieii de se sărutau, înfrăţindu-se; de când se potcovea puricele la un picior cu nouăzeci şi nouă de oca de fier şi s-arunca în slava cerului de ne aducea poveşti; Poveşti de Petre Ispirescu - Tinereţe fără bătrâneţe şi viaţă fără de moarte De când se scria musca pe părete, Mai mincinos cine nu crede."},{"id":"story-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":195,"excerpt":"Era odata un mosneag si o baba care aveau un porc. Porcul acesta era asa de destept incat intelegea tot ce vorbeau oamenii. Intr-o zi, mosneagul a zis: \"Maine o sa taiem porcul, ca vine iarna si ne trebuie carne.\" Porcul a auzit si s-a speriat foarte tare."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
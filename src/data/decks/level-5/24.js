@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1153850","romanian":"Vreau un masaj. Am nevoie să mă relaxez.","english":"I want a massage. I need to relax.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130110"},{"id":"tat-209","romanian":"Comunicarea eficienta este cheia oricarei relatii de succes.","english":"Effective communication is the key to any successful relationship.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-1153868","romanian":"A fost deschizător de drumuri în acest domeniu.","english":"She was a pioneer in this field.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098377"},{"id":"tat-1136563","romanian":"Clădirea se poate prăbuși în orice moment.","english":"The building may crash at any time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965193"},{"id":"tat-1136653","romanian":"Mi-a luat mult timp până mi-a trecut răceala.","english":"It took me a long time to get over my cold.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966141"},{"id":"tat-864476","romanian":"Orașul a fost distrus în timpul războiului.","english":"The town was destroyed during the war.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6806128"},{"id":"tat-411952","romanian":"L-am vizitat pe Dan.","english":"I visited Dan.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272272"},{"id":"tat-1143124","romanian":"Sper că îmi vei răspunde în curând.","english":"I hope you will answer me soon.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068819"},{"id":"tat-1153157","romanian":"O asemenea abilitate este nativă pentru el.","english":"Such ability is native to him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749170"},{"id":"tat-1186862","romanian":"În sfârșit a făcut bani.","english":"He finally made money.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338232"},{"id":"tat-1136596","romanian":"Mă asigur că judec un om după personalitatea sa.","english":"I make a point of judging a man by his personality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965974"},{"id":"tat-1185124","romanian":"Te-ai simțit bine la cină?","english":"Did you have a good time at the dinner?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323857"},{"id":"tat-2536167","romanian":"Fiecare persoană care e singură e singură pentru că se teme de alții.","english":"Every person who is alone is alone because they are afraid of others.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136553","romanian":"Trebuie să înveți toată viața.","english":"You must study your whole life.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965315"},{"id":"tat-5179395","romanian":"Doar ca să te menții în viață este suficient de greu în aceste timpuri.","english":"Just staying alive in these times is hard enough.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-11512231","romanian":"Am simțit că ceva e pe cale să se întâmple.","english":"I sensed something was about to happen.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1143236","romanian":"Jimmy e cu doi ani mai mic ca mine.","english":"Jimmy is junior to me by two years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068493"},{"id":"tat-10788510","romanian":"Știam că Tom ar putea să nu fie în stare să facă asta.","english":"I knew that Tom might not be able to do that.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185109","romanian":"Toți vom muri mai devreme sau mai târziu.","english":"We all shall die sooner or later.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195149"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-george-cel-viteaz-3","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Împăratul trimise pe împărăteasa să boteze pruncul, căci el va sta să dea piept cu tălharii, până se va întoarce ea. Împărăteasa se supuse poruncii şi plecă. Când să se întoarcă de la botez, veni până la un loc; aci, stând şi nemaiauzind zăngănitul armelor şi zgomotul luptei, îi dete un fier ars în inimă."},{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-ro-ho-u-mp-rat-2","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"Cum auzea că în cutare cetate este câte vrun meşter mai dibaci şi că acea meserie nu se află pe la dânsul, îndată îl trimitea să înveţe şi acea meserie. Astfel umblă fiul împăratului din ţară în ţară, ca şi un pribeag, până ce învăţă toate meseriile de pre pământ."},{"id":"story-ro-la-crucea-din-sat","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":224,"excerpt":"Naica Floare n-are vreme. Cuptorul este ars și plăcinta nu e încă întinsă. Multă grabă nu-i prea bună: Marta ar fi trebuit să mai aștepte cu cuptorul. Ea însă umblă cu gândul tot pe la cei din casă; abia apucă să se vadă și ea la masă cu scărmănătorii de pene. Sunt prea veseli: îi aude râzând în casă."},{"id":"story-ro-flori-a-din-codru","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti."},{"id":"story-ro-bunicul","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"Se scutură din salcâmi o ploaie de miresme. Poveşti de Barbu Ştefănescu Delavrancea - Bunicul Bunicul stă pe prispă. Se gândeşte. La ce se gândeşte? La nimic. Enumeră florile care cad. Se uită-n fundul grădinii. Se scarpină-n cap. Iar enumeră florile scuturate de adiere. Pletele lui albe şi creţe parcă sunt nişte ciorchini de flori albe; sprincenele, mustăţile, barba…"}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-4987505","romanian":"După ce s-a despărțit de ea, Simon s-a îndepărtat fără să se uite înapoi.","english":"After splitting up with her, Simon walked away without looking back.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-709911","romanian":"John a depus mărturie în ceea ce îl priveşte.","english":"John testified concerning him.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426745"},{"id":"tat-9813136","romanian":"O pisică este un leu în miniatură care iubește șoarecii, urăște câinii și tolerează oamenii.","english":"A cat is a miniature lion that loves mice, hates dogs and tolerates humans.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1201211","romanian":"Am venit, am văzut, am învins.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12432138"},{"id":"tat-902150","romanian":"Cred că am înţeles.","english":"I think I understood.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10287441"},{"id":"tat-50","romanian":"Imi place sa calatoresc.","english":"I like to travel.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398908"},{"id":"tat-670618","romanian":"Pe ce linie pentru Boston?","english":"What track for Boston?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1346020"},{"id":"tat-1136296","romanian":"Am alergat spre ușă.","english":"I ran toward the door.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963200"},{"id":"tat-1064365","romanian":"Tom și Mary sunt din același oraș.","english":"Tom and Mary are from the same city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074444"},{"id":"tat-1136909","romanian":"Articolul 6. Președintele va conduce toate întâlnirile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960211"},{"id":"tat-8863126","romanian":"Ai putea să spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1056666","romanian":"Ce trebuie să conțină un mic dejun sănătos?","english":"What should a healthy breakfast consist of?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031158"},{"id":"tat-709916","romanian":"Din 50 de aplicanţi, 20 au fost respinşi.","english":"There were 20 failures among 50 applicants.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424371"},{"id":"tat-1064272","romanian":"Tatăl ei a murit când ea avea trei ani.","english":"Her father died when she was three.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066162"},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136612","romanian":"Ca să spunem adevărul, această propoziţie foloseşte modul conjunctiv.","english":"Truth be told, this sentence uses the subjunctive mood.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966006"},{"id":"tat-1136977","romanian":"Maşina asta veche e tot timpul stricată.","english":"This old car is always broken.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952911"},{"id":"tat-709001","romanian":"Când călătoreşti, este uşor să te rătăceşti.","english":"When traveling, it is easy to get lost.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420261"},{"id":"tat-408052","romanian":"Am discutat deja cu acest student.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232108"},{"id":"tat-6537690","romanian":"Ar fi mai bine să lași treaba asta cuiva care știe despre ce este vorba.","english":"It would be best to leave it to a man who knows the ropes.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-hagi-tudose-2","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Îşi freacă mâinile; tuşesc; îşi dreg glasul; apoi, rara-rara, cu nişte paşi lungi şi semeţi, îţi ies înainte, îţi caută prilej de vorbă, toţi cu aceleaşi cuvinte, cu aceeaşi tărăgănire de glas şi cu capul dat pe spate: – Ei, flăcăule, de pe unde?… Ce vânturi?… Pe la noi… ai?… Şi de ce?… Ce zici de biserica noastră?…"},{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-popa-duhu","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"Cine-a întâlnit vrodată în calea sa un popă, îmbrăcat cu straie sărăcuţe, scurt la stat, smolit la faţă, cu capul pleş, mergând cu pas rar, încet şi gânditor, răspunzând îndesat \"sluga dumitale\" cui nu-l trecea cu vederea, căscând cu zgomot când nu-şi găsea omul cu care să stea de vorbă, făcând lungi popasuri prin aleiele ascunse ale grădinilor publice din Iaşi, câte cu o carte în mână, tresărind la cântecul păserelelor şi oprindu-se cu mirare lângă moşinoaiele de furnici, pe care le numea el \"republici înţelepte\", dezmerdând iarba şi florile câmpului, icoane ale vieţii omeneşti, pe care le uda câte c-o lacrimă fierbinte din ochii săi şi apoi, cuprins de foame şi obosit de osteneală şi gândire, îşi lua cătinel drumul spre gazdă, unde-l aştepta sărăcia cu masa întinsă."},{"id":"story-ion","title":"Ion","author":"Liviu Rebreanu","difficulty":6,"genre":"fiction","wordCount":165,"excerpt":"Ion era un tanar tarani din satul Pripas, din Transilvania. Desi era sarac, el visa sa aiba pamant propriu. Pentru el, pamantul era totul - mai important decat dragostea, mai important decat orice. In sat traiau doua fete: Ana, sarac ca el, pe care o iubea cu adevarat, si Florica, fiica unui gospodar bogat."},{"id":"story-praslea","title":"Praslea cel voinic","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":175,"excerpt":"Intr-o imparatie de demult traia un imparat care avea trei fii: doi mari si unul mic, pe care-l chema Praslea. Fratii cei mari erau mandri si rasfatati, dar Praslea era harnic si cuminte. Imparatul avea o gradina cu meri de aur, dar in fiecare noapte venea cineva si fura merele. Nimeni nu stia cine este hotul."},{"id":"story-ro-poveste-r-neasc","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":252,"excerpt":"A fost odată un împărat. El avea trei feciori. Când fu la ceasul morţii, îşi chemă feciorii şi le zise: Poveşti de Petre Ispirescu - Poveste ţărănească – Feţii mei, sunt cu sufletul la gură, precum mă vedeţi; un lucru numai vă cei: în cele trei nopţi după înmormântarea mea, să-mi păziţi mormântul, câte unul din voi."},{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1136709","romanian":"Tom a întrebat-o pe Mary cine crede ea că e cel mai probabil să câștige cursa.","english":"Tom asked Mary who she thought would be the most likely to win the race.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239741"},{"id":"tat-1153807","romanian":"I-am văzut mașina făcând la dreapta.","english":"I saw his car make a turn to the right.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128946"},{"id":"tat-1136897","romanian":"Vecinul și-a ițit capul peste zid pentru o clipă.","english":"The neighbor popped his head up over the wall for a moment.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965962"},{"id":"tat-1136639","romanian":"Cine a scris această scrisoare?","english":"Who wrote this letter?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966122"},{"id":"tat-1136964","romanian":"Ieri, s-a dus la școală să studieze.","english":"He went to school to study yesterday.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957826"},{"id":"tat-1136386","romanian":"Vestea despre moartea lui s-a răspândit în jur.","english":"The news of his death spread around.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962818"},{"id":"tat-12321128","romanian":"De ce ești așa de nervos? Tot ce-am făcut este să-ți mănânc sandvișul.","english":"Why are you so angry? All I did was eat your sandwich.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185174","romanian":"Ne-am mâniat de cuvintele lui.","english":"We got angry at his words.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324301"},{"id":"tat-862380","romanian":"Am amânat evenimentul.","english":"We postponed the event.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9459071"},{"id":"tat-1136266","romanian":"Barca era legată cu o parâmă scurtă.","english":"The boat was tied with a short line.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964628"},{"id":"tat-705786","romanian":"Toată lumea admiră picturile sale.","english":"Everyone admires the pictures painted by him.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963110"},{"id":"tat-1143191","romanian":"Am știut tot timpul că spunea minciuni.","english":"I knew all along that he was telling a lie.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069296"},{"id":"tat-1059636","romanian":"Ieri am stat într-o întâlnire.","english":"Yesterday I was in a meeting.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9557120"},{"id":"tat-4184076","romanian":"Latina este una dintre puținele limbi care necesită o bună cunoaștere a gramaticii.","english":"Latin is one of the few languages that requires a good knowledge of grammar.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-706157","romanian":"În această carte se întâmplă multe coincidenţe.","english":"In this book, lots of coincidences happen.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974784"},{"id":"tat-6867529","romanian":"Datele empirice rezultate din acest experiment, par a fi în concordanță cu ipotezele teoretice.","english":"The empirical data from this experiment seems in line with the theoretical hypotheses.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-944584","romanian":"M-am simţit rău.","english":"I felt bad.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/60061"},{"id":"tat-1048538","romanian":"La început a făcut Dumnezeu cerul și pământul.","english":"In the beginning God created the heavens and the earth.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10934554"},{"id":"tat-1136510","romanian":"Mă simt îndatorat moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964318"}],"stories":[{"id":"story-ro-z-na-z-nelor-2","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Se duse şi cel mijlociu şi se întoarse şi el cu o soţioară mândră şi frumoasă. Se duse şi cel mic. Cutreieră lumea până ce ajunse la pădurea cea mare unde se lăsase săgeata lui. Bâjbâi el şi orbăcăi p-acolo prin bunget, până ce dete de copaciul în care se înfipsese şi săgeata lui."},{"id":"story-ro-coto-man-n-zdr-vanu","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată o pereche de oameni. Ei n-aveau copii. Într-o zi, fiind cu voie bună, zise bărbatul către femeie: Poveşti de Petre Ispirescu - Cotoşman năzdrăvanu – Soro, de la mila lui Dumnezeu noi n-avem copii. Să mergem pe câmp şi ce vom găsi, aceea să ne fie copil. – Bine zici dumneata, frate."},{"id":"story-ro-neghini-2","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– Bine, mătuşă, bine, da’ de unde şi fată? Tu nu ştii că copacii uscaţi nu mai dau de la rădăcină? Şi bătrâna începu să râdă şi să ofteze: \"hi, hi, hi, ooof, of!\" – Ei, toate se întorc, şi apele se întorc de la Dumnezeu, numai tinereţile ba. Ce nu e la timp nu mai e niciodată."},{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-scormon-2","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Îi mai place afară la uliță. Nu pentru că ar fi trecători, dar afară cântecul vine mai bine. E cald, dar deprinsă e fata la ger și la arșiță. Cu brațele goale, cu poalele aninate în brâu și cu ștergarul în cap, ea nici nu simte vremea lui cuptor; cântă, întinde firul, descurcă jirebia și se pierde în tinerețile ei."},{"id":"story-ro-stan-bolovan-2","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":217,"excerpt":"Acolo află că un zmeu vine în fiecare noapte şi le ia câte trei oi, dar şi laptele de la şaptezeci şi şapte de oi, pe care îl ducea zmeoaicei bătrâne, să se scalde în el ca să întinerească."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143180","romanian":"Cine ești tu ca să vorbești așa cu mine?","english":"Who are you to talk to me like that?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069234"},{"id":"tat-207","romanian":"El a reusit sa depaseasca toate obstacolele din calea lui.","english":"He managed to overcome all the obstacles in his way.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-928490","romanian":"Oamenii deștepți știu cum să facă bani din orice.","english":"Clever people know how to make money out of nothing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5131666"},{"id":"tat-2536647","romanian":"Guvernul francez a lansat un joc online care provoacă contribuabilii să echilibreze bugetul național.","english":"The French government has launched an online game that challenges taxpayers to balance the national budget.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-210","romanian":"Istoria ne invata ca nimic nu este permanent.","english":"History teaches us that nothing is permanent.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-411897","romanian":"Vă trimisesem deja scrisoarea când mi-ați dat telefon.","english":"I had already sent you the letter when you called.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272065"},{"id":"tat-1143186","romanian":"E ciudat că ar trebui să eșuezi.","english":"It is strange that you should fail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069265"},{"id":"tat-1192771","romanian":"A alergat 100 de metri în exact 11 secunde.","english":"He ran 100 meters in 11 seconds flat.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364280"},{"id":"tat-1136624","romanian":"Fetița a izbucnit în lacrimi.","english":"The young girl burst into tears.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966101"},{"id":"tat-1151771","romanian":"Azi nu e ziua ta.","english":"Today is not your day.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118740"},{"id":"tat-670645","romanian":"Cel mult patruzeci la sută dintre studenţi continuă universitatea.","english":"At most 40 percent of students go on to university.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/935777"},{"id":"tat-1192774","romanian":"Tom putea cu greu să suporte durerea.","english":"Tom could hardly stand the pain.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364284"},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-862378","romanian":"Soția mea a născut un copil săptămâna trecută.","english":"My wife had a baby last week.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9458631"},{"id":"tat-1136684","romanian":"Ieri am jucat baschet.","english":"We played basketball yesterday.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226757"},{"id":"tat-1143136","romanian":"- 99 copeici, a declarat Dima cu mândrie. Am nevoie de 99 copeici.","english":"99 kopeks, Dima stated proudly. \"I need 99 kopeks.\"","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068904"},{"id":"tat-406046","romanian":"Ți-aș oferi o cafea dacă ai timp.","english":"I would offer you a coffee if you had the time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6554810"},{"id":"tat-1142932","romanian":"Majoritatea pasagerilor din autobuz dormeau.","english":"Most of the passengers on the bus were sleeping.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066665"},{"id":"tat-1153820","romanian":"Stai acasă pentru a putea răspunde la telefon.","english":"Stay home so that you can answer the phone.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129301"},{"id":"tat-1186849","romanian":"Notele sunt importante, dar nu sunt totul.","english":"Grades are important, but they are not everything.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338192"}],"stories":[{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."},{"id":"story-ro-sult-nica","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sultănica D-a stânga Râului Doamnei, razna de satul Domneşti, se vede o casă, albă ca laptele, cu ferestrele încondeiate cu roşu şi albastru."},{"id":"story-ro-fata-cu-pieze-rele-2","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Se silea bietul împărat, cu toţi cei doisprezece fii ai săi, să facă pace, să fie între oameni bună învoire, să oprească relele ce-l bântuiau, dar geaba, pagubele curgeau gârlă. În cele mai de pe urmă chemă un cetitor de stele să-i spuie ce e pricina de-i merg lucrurile anapoda şi nu poate să dea înainte."},{"id":"story-ro-ileana-simziana-3","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"– Oricum, tată, spune-ne şi nouă, că doară nu s-o face gaură în cer, dacă vom şti şi noi ce lucru te amăraşte. Dacă văzu împăratul că-l înteţesc fetele cu rugăciunile, zise: – Iată, copilele mele de ce sunt tot trist."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-2","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Trase undiţa: când, ce să vezi? un peşte mare, cu totul şi cu totul din aur. Doară că nu-i căzu leşin de bucurie. Darămite când îl văzu împărăteasa? Ea fu şi mai oleoleo. Găti împărăteasa singură cu mâna ei peştele şi mâncară. Ea îndată se simţi însărcinată."},{"id":"story-ro-cinci-p-ini","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":256,"excerpt":"Doi oameni, cunoscuţi unul cu altul, călătoreau odată, vara, pe un drum. Unul avea în traista sa trei pâni, şi celalalt două pâni. De la o vreme, fiindu-le foame, poposesc la umbra unei răchiţi pletoase, lângă o fântână cu ciutură, scoate fiecare pânile ce avea şi se pun să mănânce împreună, ca să aibă mai mare poftă de mâncare."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
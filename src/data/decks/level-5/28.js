@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-709012","romanian":"Doriţi un loc la fereastră?","english":"Would you like a window seat?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420287"},{"id":"tat-1136840","romanian":"Tom consideră că Mary e o eroină.","english":"Tom considers Mary to be a heroine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966335"},{"id":"tat-1136513","romanian":"Încetează să te mai duci acolo.","english":"Stop going there.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965707"},{"id":"tat-582951","romanian":"E puțină apă în găleată.","english":"There is little water in the bucket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6665401"},{"id":"tat-1291063","romanian":"Ești destul de mare cât să știi cum să te comporți. Fii cuminte.","english":"You are old enough to know better. Behave yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143283","romanian":"Ar fi trebuit să ai curajul să spui deschis ce crezi că este corect.","english":"You ought to have the courage to speak out what you believe to be right.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068669"},{"id":"tat-1136599","romanian":"Te rog să-mi răspunzi fără întârziere.","english":"Please write me a reply soon.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966022"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-1143631","romanian":"Îmi place să mă uit la televizor.","english":"I like to watch TV.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071796"},{"id":"tat-1153151","romanian":"Trebuie să ne trezim devreme mâine dimineață?","english":"Do we have to get up early tomorrow morning?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692258"},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185078","romanian":"Noua lege a fost impusă oamenilor de pe insulă.","english":"The new law was enforced on the people of the island.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321427"},{"id":"tat-1144296","romanian":"Fără el, aș fi neajutorată.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073249"},{"id":"tat-406055","romanian":"Când o întâlnisem în București, Anca era studentă.","english":"When I had met her in Bucharest, Anca was a student.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347370"},{"id":"tat-1153869","romanian":"Stai nemișcat pentru o clipă, te rog.","english":"Hold still for a moment, please.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098378"},{"id":"tat-1136408","romanian":"Chemați-mă dacă aveți nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962822"},{"id":"tat-1136617","romanian":"Cine va fi responsabil de clasa noastră când domnișoara Smith va părăsi şcoala?","english":"Who will be in charge of our class when Miss Smith leaves school?","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965929"},{"id":"tat-2704846","romanian":"De dimineață până seară el nu face nimic altceva decât să se plângă.","english":"He does nothing but complain from morning till night.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-476863","romanian":"Te rugăm să fii politicos.","english":"Please be polite.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5601925"},{"id":"tat-1136514","romanian":"Încetați de a vă mai duce acolo.","english":"Stop going there.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/47857"}],"stories":[{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-3","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"– Şi tu a mea! grăi al doilea în voinicie către Ana, ridicând-o şi pe ea în şa. Făcând aşa, voinicii porniră spre curtea împărătească. În ziua următoare se făcură nunţile şi apoi trei zile şi trei nopţi întreaga împărăţie răsuna de veselia oaspeţilor…"},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"A fost odată un băiat. El, de la naşterea lui, se pomenise bubos. Ce n-a făcut el ca să se cureţe de bube? dară în deşert. Băieţii la joc şi fetele la horă îl huiduia şi fugeau de dânsul ca de o lepră."},{"id":"story-ro-o-via-pierdut-3","title":"O viață pierdută","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":209,"excerpt":"Cârlanul se opri, nechezând printre dinți, la ușa grajdului. - Stăi, prietene! grăi bătrânul mergând cu hamurile în urma lui. Toate se fac cu vremea. În grajd mai era un cal, loc pentru alți doi și un flăcău, care se trezi din somn când intră bătrânul. - Bună seara, Costane! grăi el trăgănând vorbele. Ai avut noroc la ziuă?"},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-3","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Toţi cu totul zicea că aşa i-a fost orânda şi credeau că trebuie să fi căzut asupra capului lui vrun blestem de la Dumnezeu. Ajunsese omul să-şi urască zilele."},{"id":"story-ro-broasca-estoas-cea-fermecat-2","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":230,"excerpt":"Luă şi dânsul nişte haine, numai să nu zică nescine că nu s-a gătit, şi de cheltuială ce pe apă nu curge, şi plecă şi el, ştii, cam în dorul lelii. Dară unde să se ducă? Nici el, iacă, nu ştia."},{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
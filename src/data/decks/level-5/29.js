@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-411890","romanian":"Când era studentă, mergea des la discotecă.","english":"When she was a student, she used to go to the disco often.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272038"},{"id":"tat-1143175","romanian":"Jane ne-a spus că gătitul nu era dificil.","english":"Jane told us that cooking was not difficult.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069208"},{"id":"tat-10727979","romanian":"Totul s-a întâmplat așa cum ai spus tu că se va întâmpla.","english":"Everything happened just like you said it would.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1144295","romanian":"Fără el, aș fi neajutorat.","english":"Without him, I would be helpless.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073247"},{"id":"tat-1138134","romanian":"Dacă vrei să pari vorbitor nativ, ascultă vorbitori nativi de câte ori este posibil.","english":"If you want to sound like a native speaker, listen to native speakers whenever possible.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143130","romanian":"Calciul lipsește din dieta lui.","english":"Calcium is absent from his diet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068855"},{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1064097","romanian":"La momentul accidentului aproape toți călătorii din autobuz dormeau.","english":"At the time of the accident, almost all of the passengers on the bus were sleeping.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11071031"},{"id":"tat-1136537","romanian":"L-am sondat cu privire la opiniile sale.","english":"I sounded him out about his views.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965088"},{"id":"tat-1058773","romanian":"Declarațiile lui sunt infantile şi adesea mă deranjază.","english":"His statements are childish and they often bother me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11044684"},{"id":"tat-1059609","romanian":"Unde ai învățat franceza?","english":"Where did you learn French?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7482507"},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136673","romanian":"Care este țelul principal al acestei societăți?","english":"What is the chief aim of this society?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966138"},{"id":"tat-4993395","romanian":"Creșterea cererii pentru cafeaua de înaltă calitate a ajutat la mărirea prețului cafelei.","english":"Greater demand for high-quality coffee has helped drive coffee prices higher.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-487287","romanian":"Ei îi place foarte mult școala sa.","english":"She likes her school a lot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270501"},{"id":"tat-1136573","romanian":"A forțat ușa încuiată cu o rangă.","english":"He pried open the locked door with a crowbar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966044"},{"id":"tat-4694533","romanian":"Lunile anului sunt: ianuarie, februarie, martie, aprilie, mai, iunie, iulie, august, septembrie, octombrie, noiembrie, decembrie.","english":"The months of the year are: January, February, March, April, May, June, July, August, September, October, November, December.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064121","romanian":"Tom a fost la plajă săptămâna trecută.","english":"Tom went to the beach last week.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070852"}],"stories":[{"id":"story-ro-z-na-z-nelor","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":";A fost odată un împărat mare şi puternic, şi el avea trei feciori. Făcându-se mari, împăratul se gândi fel şi chipuri cum să facă să-şi însoare copiii ca să fie fericiţi. Într-o noapte, nu ştiu ce visă împăratul, că a doua zi, de mânecate, îşi chemă copiii şi se urcă cu dânşii în pălimarul unui turn ce avea în grădină."},{"id":"story-ro-spaima-zmeilor-3","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Şi toţi erau mărunţi, care de care mai mic decât cellalt, mai sfredeluş, mai guraliv, mai drăcos şi – asta să nu uităm – mai mâncăcios şi mai hapsân. – Aoleo! zise femeia, care se bălăbănea cu ei. Ăştia-mi scot sufletul şi-mi mănâncă şi urechile. Cine m-a pus să mă tot milogesc?!"},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"},{"id":"story-ro-f-t-frumos-cel-r-t-cit-2","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Ea priimi mărul cu bucurie. Şi după ce plecă bărbatul în trebile sale, se aşeză pe pragul uşei, curăţi mărul şi-l mâncă. Iepşoara ieşise şi ea din grajd, şi veni la stăpână-sa, că era învăţată la traista cu grăunţe."},{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată un împărat şi o împărăteasă. Amândoi erau oameni de treabă şi frumoşi. Ei se iubeau, nevoie mare! Dară erau tot mâhniţi şi amărâţi că nu făceau copii. Toate leacurile ce luase împărăteasa de pe la vraci şi vrăjitoare nu-i folosise întru nimic."},{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
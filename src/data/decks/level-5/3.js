@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-2568508","romanian":"Formarea și mișcarea uraganelor sunt capricioase, chiar și cu tehnologia noastră de astăzi.","english":"The formation and movement of hurricanes are capricious, even with our present-day technology.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4989065","romanian":"De când am plecat și până m-am întors a bătut întruna la tobe.","english":"From the moment I left till I came back, he had been hitting the drum without interruption.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-406809","romanian":"Cum te numești?","english":"What is your name?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347301"},{"id":"tat-1136876","romanian":"Tom a observat o schimbare la Mary.","english":"Tom noticed a change in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960285"},{"id":"tat-1186847","romanian":"Recordul lui nu va fi niciodată întrecut.","english":"His record will never be broken.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338182"},{"id":"tat-705791","romanian":"Din curiozitate, am deschis cutia.","english":"I opened the box out of curiosity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963139"},{"id":"tat-9638378","romanian":"Îmi amintesc că am făcut cunoștință cu el la o petrecere anul trecut.","english":"I remember being introduced to him at a party last year.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12013309","romanian":"Pentru mine, ca brazilian, studiul limbii galice este ceva cu adevărat delicios și captivant.","english":"For me, as a Brazilian, studying the Galician language is something truly delicious and captivating.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143238","romanian":"Mă uitam în jos către fundul văii.","english":"I was looking downward to the bottom of the valley.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068500"},{"id":"tat-1136550","romanian":"M-am consultat cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964969"},{"id":"tat-7192998","romanian":"Moartea prematură a soției mele, a tras cortina peste 50 de ani de mariaj fericit.","english":"The untimely death of my wife has brought down the curtain on over 50 years of happily married life.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-709017","romanian":"De ce îţi sunt urechile atât de mari?","english":"Why are your ears so big?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420299"},{"id":"tat-698933","romanian":"Cu ce vă pot fi de folos astăzi, domnule?","english":"How may I help you today, sir?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2157709"},{"id":"tat-7187071","romanian":"Ei și-au format propria asociație la nivel național, Asociația Americană a Persoanelor Pensionate.","english":"They have formed their own nationwide association, the American Association of Retired Persons.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136989","romanian":"Are acces la informația înmagazinată.","english":"He has access to the stored information.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952879"},{"id":"tat-1143121","romanian":"Au ajuns în staţie la doar câteva minute distanță.","english":"They got to the station only a few minutes apart.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068791"},{"id":"tat-1192816","romanian":"Yenul e încă scăzut în raport cu dolarul.","english":"The yen is still low against the dollar.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356233"},{"id":"tat-708956","romanian":"Păstrează banii la loc sigur.","english":"Keep the money in a safe place.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8387478"},{"id":"tat-862829","romanian":"Încă mai aștept să-mi spună ce s-a întîmplat.","english":"I am still waiting to be told what happened.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014507"},{"id":"tat-1064436","romanian":"El este de două ori mai mare decât ea.","english":"He is twice as old as she is.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077419"}],"stories":[{"id":"story-ro-p-cal-3","title":"Păcală","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":227,"excerpt":"– Eu nu te-ntreb asta, om fără cap ce eşti! – Dar ce fel mă-ntrebi? zise Păcală. – Cu ce preţ se vinde chila ori baniţa; câţi lei? – Aşa cum te-nvoieşti; şi câţi lei dai atâta iei. Negustorul, supărat, îl mai întrebă: – Neghiobi ca tine mai sunt acolo-n sat? – U! hu!"},{"id":"story-ro-sarea-n-bucate-3","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":235,"excerpt":"Să te duci de la mine cu sarea ta cu tot! Când auzi fata cea mică a împăratului urgia tatălui său, ce cădea pe capul ei, intră în fundul pământului de mâhnire căci se supărase tată-său şi, încumetându-se, zise: – Să mă ierţi, tată, că eu n-am vrut să te supăr."},{"id":"story-ro-rodul-tainic","title":"Rodul tainic","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"A fost odată un împărat, şi-n curtea acelui împărat se afla un pom atât de înalt, încât nimeni nu era în stare să-i vadă vârful. Pomul acesta înflorea şi dădea rod în fiecare an, dar nici împăratul, nici curtenii lui, nici vreun alt om pământean n-a apucat să vadă poamă din rodul acela."},{"id":"story-ro-greuceanu-3","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Această izbândă o luă drept semn bun, şi Greuceanu, mergând a doua oară la împăratul, grăi cu cuvintele lui mieroase cele următoare: – Mărite doamne, să trăieşti întru mulţi ani pe luminatul scaunul acestei împărăţii."},{"id":"story-ro-ivan-turbinc","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Era odată un rus, pe care îl chema Ivan. Şi rusul acela din copilărie se trezise în oaste. Şi slujind el câteva soroace de-a rândul, acuma era bătrân. Şi mai-marii lui, văzându-l că şi-a făcut datoria de ostaş, l-au slobozit din oaste, cu arme cu tot, să se ducă unde-a vrea, dându-i şi două carboave de cheltuială."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-2","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"– Să ne despărţim unchiaş, dacă tu aşa găseşti de cuviinţă. Dară bine, cine să ne închiză ochii în ceasul cel de pe urmă? – Că bine zici tu, babo; stăi dară; ia să iei tu basmaua mea care am avut-o în ziua de cununie şi eu ştergarul cel vărgăţel ce mi-ai adus de zestre."},{"id":"story-ro-amintiri-din-copil-rie-i-2","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Şi unde nu s-au adunat o mulţime de băieţi şi fete la şcoală, între care eram şi eu, un băiat prizărit, ruşinos şi fricos şi de umbra mea."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
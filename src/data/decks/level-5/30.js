@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059638","romanian":"Furtuna ne-a împiedicat să ajungem la timp.","english":"The storm prevented us from arriving on time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/918359"},{"id":"tat-1147577","romanian":"Am scris o adresă greșită pe plic.","english":"I wrote a wrong address on the envelope.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095173"},{"id":"tat-924380","romanian":"Sună-mă dacă ai nevoie de ajutor.","english":"Give me a call if you need help.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735315"},{"id":"tat-407936","romanian":"Dacă așa vi s-a spus, probabil că e corect.","english":"If this is the way you were told, it is probably correct.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6437718"},{"id":"tat-1153153","romanian":"A explica chestiunea în detaliu.","english":"He explained the matter in detail.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1715495"},{"id":"tat-1064186","romanian":"Tom a cumpărat o casă cu șase camere.","english":"Tom bought a house with six rooms.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066256"},{"id":"tat-1153762","romanian":"Te rog nu ezita să te exprimi liber.","english":"Please feel free to express yourself.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6511815"},{"id":"tat-1192804","romanian":"Ken nu a fost aici de astă dimineață.","english":"Ken has not been here since this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353836"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-702225","romanian":"Se va despărţi de prietenul ei.","english":"She is going to part from her boyfriend.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398964"},{"id":"tat-1059506","romanian":"A venit să ne vadă ieri.","english":"She came to see us yesterday.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8577246"},{"id":"tat-399274","romanian":"Bine ai venit!","english":"Welcome.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335259"},{"id":"tat-13621513","romanian":"A doua zi dimineață, am regretat profund că am stat treaz atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923814","romanian":"Anumite plante cresc bine cu puțină îngrijire.","english":"Some plants grow well with a minimum of care.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10431937"},{"id":"tat-705785","romanian":"În zilele de azi nu este neobișnuit pentru o femeie sa călătorească singură.","english":"Nowadays it is not unusual for a woman to travel alone.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963109"},{"id":"tat-1136531","romanian":"S-a îmbrăcat cu jacheta roșie.","english":"He put on the red jacket.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965117"},{"id":"tat-11657708","romanian":"Obișnuia să cumpere șoricei albi pentru ca boa constrictor-ul ei să-i ucidă și să-i mănânce.","english":"She used to buy white mice for her boa constrictor to kill and eat.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-708930","romanian":"Biroul lui este foarte aproape de al meu.","english":"His office is very close to mine.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398356"},{"id":"tat-13621515","romanian":"A doua zi dimineață, am regretat profund că am stat trează atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-ro-popa-tanda-2","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"Minunat om ar fi părintele Trandafir dacă nu l-ar strica un lucru. Este cam greu la vorbă, cam aspru la judecată: prea de-a dreptul, prea verde-fățiș. El nu mai sucește vorba, ci spune drept în față, dacă i s-a pus ceva pe inimă. Nu e bine să fie omul așa. Oamenii se prea supără când le luăm căciula din cap."},{"id":"story-ro-ileana-simziana-2","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Dacă văzură şi văzură că nimic nu-i este pe plac, fata cea mare îşi luă inima în dinţi şi-l întrebă într-o zi la masă, că de ce este supărat: – Au purtarea noastră nu-ţi place? îi zise ea. Au supuşii măriei tale sunt răi şi arţăgoşi de-ţi pricinuiesc atâta mâhnire?"},{"id":"story-ro-bunica-3","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":218,"excerpt":"Măria-ta, să ştii că atunci când or lega rod ăşti doi meri, împărăteasa o să rămână grea şi o să nască un cocon cu totul şi cu totul de aur\"… Piticul se duse, şi împăratul alergă în grădină, şi căută, căută peste tot locul, până dete peste ăi doi meri."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un om. El avea o fată şi un băiat. Şi rămânând văduv de muma copiilor, îl îndemnă ariciul să se însoare a doua oară. Neveste-sei îi sta aceşti copilaşi ca sarea în ochi. Nu era dimineaţă, nu era seară, nu era clipă lăsată de la Dumnezeu să nu-i amărască."},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."},{"id":"story-ro-sorcova","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sorcova Troienele se ridicau namilă până în tinda creştinului. Vântul spulbera fulgii de zăpadă în vârteje şi stoluri, repezite în lungul uliţelor, sparte la răspântii şi împrăştiate fără căpătâi în largul maidanelor de la Olănita. Pârtia nu se mai cunoştea. Zăpada îţi trecea de glezne şi mai bine."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
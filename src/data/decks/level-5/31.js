@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"},{"id":"tat-1159828","romanian":"Casa lui e plină de lucruri utile.","english":"His house is full of convenience.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167796"},{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-405826","romanian":"Zăpada a acoperit tot orașul peste noapte.","english":"The snow covered the whole city overnight.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350529"},{"id":"tat-1143196","romanian":"Ne-am înțeles să ne abținem de la fumat cât suntem la lucru.","english":"We agreed to refrain from smoking while we are at work.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069326"},{"id":"tat-705819","romanian":"Mama mea a plecat ieri la cumpărături în centru.","english":"My mother went shopping downtown yesterday.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963917"},{"id":"tat-13427370","romanian":"Am auzit că Tom și cu Mary se căsătoresc în octombrie.","english":"I heard that Tom and Mary will get married in October.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1153162","romanian":"Vrednicia ei este un bun exemplu pentru noi toți.","english":"Her diligence is a good example to us all.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1754261"},{"id":"tat-1138032","romanian":"Ar fi fost mai bine să nu te fi dus acolo.","english":"You had better not have gone there.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1185108","romanian":"Am fost la Londra.","english":"I have been to London.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195147"},{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-1163919","romanian":"Sherman s-a întâlnit cu Johnston câteva zile mai târziu.","english":"Sherman met with Johnston a few days later.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197069"},{"id":"tat-670577","romanian":"Vederea slabă este un handicap pentru un atlet.","english":"Poor sight is a handicap to an athlete.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2423585"},{"id":"tat-1143138","romanian":"Doctorul mi-a spus să renunț la fumat.","english":"The doctor told me to give up smoking.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068909"},{"id":"tat-708925","romanian":"Doamna Green ne predă muzica.","english":"Miss Green teaches us music.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397994"},{"id":"tat-13612966","romanian":"Am crezut că vrei să mănânci la acel restaurant chinezesc de pe Park Street.","english":"I thought you wanted to eat at that Chinese restaurant on Park Street.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136518","romanian":"Încet și fără grabă se câștigă cursa.","english":"Slow and steady wins the race.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965773"},{"id":"tat-1192699","romanian":"Ne bucurăm că vii.","english":"We are glad you are coming.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/853963"},{"id":"tat-1186837","romanian":"A plătit 20$ pentru ruj.","english":"He paid $20 for the lipstick.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7309933"},{"id":"tat-1136852","romanian":"Jucătorul de șah și-a pus adversarul în șah.","english":"The chess player put his opponent in check.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966267"}],"stories":[{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"},{"id":"story-ro-povestea-porcului-2","title":"Povestea porcului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"– Ştiu, măi babă, dacă mi-i spune."},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."},{"id":"story-ro-z-na-mun-ilor-2","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"După ce veniră filosofii, învăţă şi de la dânşii câte în lună şi în soare. Bucuria tatălui său era aşa de mare unde vedea că fiu-său are să fie procopsit ca nici unul din fiii de împăraţi, încât se uita la dânsul ca la soare. Iară el de ce se mărea d-aia se făcea mai cu minte şi mai frumos."},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."},{"id":"story-ro-coto-man-n-zdr-vanu-3","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Nu mult după aceasta, femeia se simţi îngreunată. Atunci să fi văzut bucurie pe casnici, încât nu-i ţinea pământul. Iară când fu la facere, născu un copilaş gras şi frumos şi sănătos. Crescu copilul şi se făcu mare. Nu se despărţea de pisoi nici cât ai da în cremene. Amândoi se jucau, amândoi mâncau la masă, amândoi se culcau."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-2","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":214,"excerpt":"Făt-Voinic, feciorul de împărat. Focul cailor se stâmpără în zărirea celor trei surori şi călăreţii deteră în pas mai încetişor, până ce, veniţi şi sosiţi, se simţiră duşi."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-4977405","romanian":"Acest magazin vinde îmbrăcăminte și încălțăminte atât pentru bărbați cât și pentru femei.","english":"This store sells clothes and shoes for both men and women.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192694","romanian":"Mergi drept înainte până ajungi la biserică.","english":"Go straight ahead until you reach the church.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/678764"},{"id":"tat-1153768","romanian":"Nu simte nicio reticență în recunoașterea erorilor.","english":"He feels no reluctance in acknowledging errors.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128216"},{"id":"tat-1192827","romanian":"Unde îmi pot ridica bagajele?","english":"Where can I pick up my baggage?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12359803"},{"id":"tat-923852","romanian":"Cea mai bună prietenă a mea Felicja este aici.","english":"My best friend Felicja is here.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442763"},{"id":"tat-1059417","romanian":"M-am uitat în dulap.","english":"I looked in the cupboard.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7087756"},{"id":"tat-862403","romanian":"După aceea, nu am vorbit cu ei.","english":"Afterwards, I did not speak with them.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9460600"},{"id":"tat-6826727","romanian":"Fericirea, am descoperit, este aproape întotdeauna o revenire dintr-o muncă grea.","english":"Happiness, I have discovered, is nearly always a rebound from hard work.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-487282","romanian":"Am accentuat ideea.","english":"I stressed the point.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270459"},{"id":"tat-1064193","romanian":"Nu am absolut nimic de făcut.","english":"I have absolutely nothing to do.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066192"},{"id":"tat-1059642","romanian":"Te rog, păstrează cartea asta la îndemână.","english":"Please keep this book at hand.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/938549"},{"id":"tat-1143256","romanian":"Fabrica a fost închisă pentru renovare şi va fi deschisă pe 1 septembrie 2007.","english":"The factory is closed for refurbishment and will re-open on 1st September 2007.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068570"},{"id":"tat-1097617","romanian":"Sala de şedinţe este ocupate în acest moment.","english":"The meeting room is occupied at the moment.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11654854"},{"id":"tat-9735774","romanian":"Am folosit lămâile pe care Tom mi le-a dat pentru a face limonadă.","english":"I used the lemons that Tom gave me to make lemonade.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153891","romanian":"Felicitările mele mâinilor care au făcut asta posibilă.","english":"My compliments to the hands that made this possible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104030"},{"id":"tat-1143248","romanian":"Tom a mâncat un castron cu supă de scoici.","english":"Tom ate a bowl of clam chowder.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068554"},{"id":"tat-1279321","romanian":"A doua oglindă este agăţată lângă uşă.","english":"A second mirror is hanging next to the door.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13495625"},{"id":"tat-1163912","romanian":"Tom e cu zece livre mai greu decât Jack.","english":"Tom is ten pounds heavier than Jack.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197016"},{"id":"tat-13619641","romanian":"Taipanul de uscat, un șarpe întâlnit în Australia, este cel mai veninos șarpe din lume.","english":"The inland taipan, a snake found in Australia, is the most venomous snake in the world.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"}],"stories":[{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-cele-trei-rodii-aurite-3","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":210,"excerpt":"– Mamă, zise fiul împăratului, caut cele trei rodii aurite, şi dorinţa de a le avea m-a adus p-aici, nu ştii d-ta încotro se află?"},{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-norocul-dracului-2","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"dacă n-ar fi, n-ar fi lumea cum e. Eu n-am arat, n-am săpat, n-am prăşit, n-am plivit ca ceilalţi? Ba da, şi ogorul meu a ieşit sterp; piatra pe mine m-a bătut; şi, rămas numai cu mâinile, muncesc, şi nimeni nu mă crede; iar când la măsurătoarea muncii, lucrul meu scade, şi făina din copaie scade, şi foamea copiilor creşte\"."},{"id":"story-ro-la-crucea-din-sat-2","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Un nou hohot îl trezește și pe el din astă nepăsare. Ileana a făcut o cunună de pene cu coada dindărăt și a pus-o pe nesimțite în capul lui Bujor. Bujor a simțit, dar se face a nu fi simțit, fiindcă-i place să vadă pe Ileana râzând. Toți râd cu hohot, râde mai ales Ileana."},{"id":"story-ro-f-t-frumos-cel-r-t-cit","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"A fost odată o păreche de oameni, muncitori, de! cum dă Dumnezeu. Toată nădejdea lor era într-o iapă cu care se hrăneau. Şi ar fi voit şi ei să aibă un copilaş, dar fu peste poate. Cercetară în dreapta şi în stânga, ca să afle niscaiva leacuri care să le desfacă făcutul stărpiciunei lor, dară, aşi!"}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1153789","romanian":"L-am găsit pe băiat deja adormit.","english":"I found the boy fast asleep.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128663"},{"id":"tat-2536130","romanian":"America e un loc drăguț în care să fii, dacă ești aici ca să câștigi bani.","english":"America is a lovely place to be, if you are here to earn money.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144337","romanian":"A rupt logodna într-o criză de mânie.","english":"She broke off her engagement in a fit of anger.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073722"},{"id":"tat-708926","romanian":"Ne-am ascuns după un tufiş pentru ca nimeni să nu ne vadă.","english":"We hid behind a bush so that no one would see us.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397998"},{"id":"tat-12085392","romanian":"Se zvonea că bea, dar era dificil de dovedit pentru că bea numai singură.","english":"It was rumored that she drank, but it was hard to prove, as she only drank alone.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136720","romanian":"I-a pus imaginea în palmă.","english":"She put the picture back in his hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7222279"},{"id":"tat-1143134","romanian":"E necugetat din partea ta să crezi asemenea lucru.","english":"It is foolish of you to believe such a thing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068893"},{"id":"tat-205","romanian":"Daca as fi stiut, as fi luat o decizie diferita.","english":"If I had known, I would have made a different decision.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1136614","romanian":"Mulțimea a protestat împotriva avortului.","english":"The throng protested against abortion.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966027"},{"id":"tat-1136901","romanian":"Maşina noastră a rămas fără combustibil după zece minute.","english":"Our car ran out of gas after ten minutes.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966025"},{"id":"tat-2536654","romanian":"Majoritatea descoperirilor științifice nu e altceva decât descoperirea a ceea ce este evident.","english":"Most scientific breakthroughs are nothing else than the discovery of the obvious.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136789","romanian":"Fata s-a antrenat la paralele.","english":"The girl exercised on the parallel bars.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966214"},{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-487314","romanian":"Ea va strânge vesela de pe masă.","english":"She will clear the table of the dishes.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334961"},{"id":"tat-863666","romanian":"Unde crezi că se duc toți banii?","english":"Where do you think all the money goes?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9145912"},{"id":"tat-411949","romanian":"Am vizitat România acum câțiva ani.","english":"I visited Romania a few years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272263"},{"id":"tat-584004","romanian":"Ea și prietenii ei sunt înnebuniți după muzica.","english":"She and her friends are mad about music.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7117050"},{"id":"tat-1136848","romanian":"Mă întreb cine înoată cel mai repede.","english":"I wonder who can swim fastest.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966289"},{"id":"tat-1137017","romanian":"Nu toate navigatoarele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952941"},{"id":"tat-714067","romanian":"Romeo este bărbatul pe care Julieta îl iubeşte.","english":"Romeo is the man Juliet loves.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469893"}],"stories":[{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-2","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":232,"excerpt":"Se spetise bietul om muncind, şi să salte şi el ceva, te-aşi! câtuşi de cât! ferit-a sântul! Ba până într-atâta ajunsese, încât să-l împingă păcatele să se gândească ca să-şi facă seama singur, vezi că dracul n-are de lucru, el nu face biserici ori puţuri pe la răspântii."},{"id":"story-ro-soacra-cu-trei-nurori-3","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Acum deodată, până te-i mai odihni, ia furca în brâu, şi până mâine dimineaţă să găteşti fuioarele aceste de tors, penele de strujit şi mălaiul de pisat. Eu mă las puţin, că mi-a trecut ciolan peste ciolan cu nunta voastră."},{"id":"story-ro-hagi-tudose","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":229,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Hagi-Tudose Dincolo de „Crucea de piatră”, de-a stânga Şoselei Vitanului, se ridică biserica „Sfânta Troiţa”. Mândreţe de biserică. Ce zugrăveli, pe dinăuntru şi pe dinafară, cum arar se mai pomenesc numai la bisericile din vechime."},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-2","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Doresc prea mult să văz la masa mea măcar un măr din acest pom care m-a ţinut atâta sumă de bani şi de aceea, iată, mă înduplec şi te las ca să pândeşti, măcar că nu-mi vine a crede că o să izbuteşti."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-3","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"Tată-său, deznădăjduit, pusese în gând să-l taie; dar fiul său cel mic, Prâslea, veni cu rugăciune către tată-său, şi-i zise: – Tată, atâţia ani l-ai ţinut, ai suferit atâtea necazuri după urma acestui pom, mai lasă-l, rogu-te, şi anul acesta, să-mi încerc şi eu norocul. – Fugi d-aci, nesocotitule, zise împăratul."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-487299","romanian":"Puțini studenți știu să citească în latină.","english":"Few students know how to read Latin.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270669"},{"id":"tat-1136850","romanian":"Măcar lasă-mă să te ajut cu masa.","english":"At least let me help with the table.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966285"},{"id":"tat-1142942","romanian":"Servitoarea a aranjat cuțitele și furculițele pe masă.","english":"The maid arranged the knives and forks on the table.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066763"},{"id":"tat-1143140","romanian":"A depus banii din premiu la bancă.","english":"He deposited the prize money in the bank.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068919"},{"id":"tat-11574532","romanian":"Am doi băieți născuți la patru ani distanță, în aceeași zi din februarie.","english":"I have two sons born four years apart on the same day in February.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862416","romanian":"Fericirea nu se cumpără.","english":"One does not buy happiness.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9462186"},{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-6586236","romanian":"Tocmai i-am spus lui Mary că doream să o ajut să-și curețe garajul.","english":"I just told Mary that I wanted to help her clean the garage.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143146","romanian":"Fără sfatul meu, ai fi eșuat.","english":"But for my advice, you would have failed.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068933"},{"id":"tat-1185117","romanian":"Am o părere bună despre tânărul candidat.","english":"I have a good opinion of the young candidate.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323560"},{"id":"tat-698952","romanian":"Am vrut să cumpăr cartea.","english":"I wanted to buy the book.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2818798"},{"id":"tat-1136828","romanian":"Râzi în legătură cu ce?","english":"What are you laughing at?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966362"},{"id":"tat-6824477","romanian":"Lumea pe care am văzut-o în visul meu era o lume pașnică, lipsită de război.","english":"The world which I saw in my dream was a peaceful world devoid of war.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-923891","romanian":"Camera arată diferit, acum îmi place mai mult.","english":"The room looks different, now I like it more.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10445017"},{"id":"tat-10450497","romanian":"Am mers la supermarket și am cumpărat niște cireșe fiindcă erau la reducere.","english":"I went to the supermarket and bought some cherries because they were on sale.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-406051","romanian":"O întâlnesc pe Mihaela în fiecare dimineață, la metrou.","english":"I meet Mihaela every morning at the subway.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347358"},{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1110606","romanian":"Ma ajutat foarte mult.","english":"It helped me a lot.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3824983"},{"id":"tat-1064248","romanian":"Tom nu se sperie aproape niciodată.","english":"Tom almost never gets scared.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073108"},{"id":"tat-488761","romanian":"Autobuzele vor ajunge în stație după cinsprezece minute.","english":"The bus will arrive at the station in fifteen minutes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268740"}],"stories":[{"id":"story-ro-bunicul-2","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"– Da. – Tată-moşule, aş vrea să-mi crească şi mie aripi şi să zbor sus de tot, până în slava cerului, zise băiatul netezindu-i barba. – Dacă ţi-o creşte ţie aripi, zise fata, mie să-mi prinzi o presură şi un sticlete. – Da… hî… hî… poi ce fel… şi mie? Fata se întristă."},{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."},{"id":"story-ro-d-nil-prepeleac","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Erau odată într-un sat doi fraţi, şi amândoi erau însuraţi. Cel mai mare era harnic, grijuliu şi chiabur, pentru că unde punea el mâna punea şi Dumnezeu mila, dar n-avea copii. Iară cel mai mic era sărac."},{"id":"story-ro-c-lin-nebunul","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":210,"excerpt":"Era odat-un împărat ş-avea trei fete şi erau aşa de frumoase, de la soare te puteai uita, da la dânsele ba. Acu, cele două erau cum erau, da cea mijlocie nici se mai povesteşte frumuseţea ei. Acu câţi feciori de-mpăraţi şi de ghinărari au cerut-o, împăratul n-a vrut să le-o deie."},{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."},{"id":"story-ro-popa-tanda-3","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":213,"excerpt":"O vorbă și încă ceva, pentru mai bună înțelegere, la protopop, o cale la episcopie, și aici o vorbă bună de la protopop: lucrurile se fac, numai dacă le știm face. Cu mult, cu puțin, părintele Trandafir fu trimis de la Butucani la Sărăceni — pentru buna înțelegere între credincioși. Popă-n Sărăceni? Cine știe ce vrea să zică popă-n Sărăceni!"}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
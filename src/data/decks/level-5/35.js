@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-2568484","romanian":"Locuiesc aproape de mare, așa că am de multe ori ocazia să merg la plajă.","english":"I live near the sea, so I often get to go to the beach.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-407957","romanian":"Numele meu este românesc, al lui e american.","english":"My name is Romanian; his is American.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531992"},{"id":"tat-1064368","romanian":"Tom și Mary au devenit foarte buni prieteni.","english":"Tom and Mary became very good friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074336"},{"id":"tat-1136667","romanian":"Tom a avut ceva probleme la ajustarea setărilor.","english":"Tom had a little trouble adjusting the settings.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227163"},{"id":"tat-1064309","romanian":"L-am văzut pe Tom sărutând-o pe Mary.","english":"I saw Tom kiss Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045415"},{"id":"tat-1143172","romanian":"Explicația lui nu era satisfăcătoare.","english":"His explanation was not satisfactory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069202"},{"id":"tat-862344","romanian":"În general, bărbaţii sunt mai înalţi decât femeile.","english":"Generally speaking, men are taller than women.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10085812"},{"id":"tat-1153754","romanian":"N-am întârziat niciodată la școală mai înainte.","english":"I had never been late for school before.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2639577"},{"id":"tat-7578033","romanian":"Mă doare gâtul și am și febră. Poți să-mi dai niște medicamente pentru răceală?","english":"My throat hurts, and I have a fever. Can I have some cold medicine?","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12355737","romanian":"Nu știu ce motiv a fost pentru care nu mi-ai trimis o scrisoare.","english":"I do not know what reason there was why you did not send me a letter.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153809","romanian":"Acesta e un vin excelent.","english":"This is excellent wine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128986"},{"id":"tat-1192716","romanian":"Un pantof desperecheat a fost lăsat pe pragul ușii.","english":"An odd shoe was left on the doorstep.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6225612"},{"id":"tat-5131142","romanian":"În clipa în care l-am văzut, am știut că e supărat pe mine.","english":"The moment I saw him, I knew he was angry with me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7115203","romanian":"Ceea ce ne definește este modul în care ne ridicăm după ce cădem.","english":"What defines us is how well we arise after falling.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-408059","romanian":"I-am dat cărțile acestui student.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232754"},{"id":"tat-1056686","romanian":"Micul dejun este principala masă a zilei.","english":"Breakfast is the most important meal of the day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029785"},{"id":"tat-712068","romanian":"Maşina aceea este a mea.","english":"That car is mine.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440419"},{"id":"tat-1136823","romanian":"Puteam să alerg mult mai rapid când eram tânăr.","english":"I could run much faster when I was young.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966296"},{"id":"tat-709040","romanian":"Cu excepţia câtorva greşeli, compunerea ta este perfectă.","english":"Your composition is perfect except for a few mistakes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420329"},{"id":"tat-1059504","romanian":"I se zice Jim.","english":"They call him Jim.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8001955"}],"stories":[{"id":"story-ro-g-in-reasa-3","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Numaidecât mai-marii ţării ziseră fetei să se gătească de nuntă. Acum altă nevoie. Nici fata nu voia să ia pe tată-său de soţ. Ea zise: – Unde aţi mai auzit, boieri dumneavoastră, batjocură ca aceasta, să ia tatăl de soţie pe fie-sa. – Nu te supăra, domniţă, şi nu fii aşa ţanţoşă."},{"id":"story-ro-rodul-tainic-2","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Împăratul nu credea aşa ceva şi l-a chemat pe Danciu la sine. – N-o să fii nici tu în stare să te urci, i-a zis, şi să ştii că, dacă nu te vei putea urca, dau poruncă să-ţi taie capul."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"A fost odată într-o pustie mare un pustnic, şi petrecea singur singurel. Vecinii săi erau fiarele pădurilor. Şi aşa era de bun la Dumnezeu, încât toate dobitoacele i se închinau, când se întâlneau cu dânsul."},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-porcul-cel-fermecat-3","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"uşa se deschise. Fetele intrară. Când colo, ce să vază? Casa n-avea nici o podoabă; dară în mijloc era o masă o masă mare cu un covor scump pe dânsa, şi deasupra o carte mare deschisă. Fetele, nerăbdătoare, voiră a şti ce zicea în cartea aceea."},{"id":"story-ro-gura-satului-2","title":"Gura satului","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Feciorii, fiindcă sunt doi și feciori, oricât de voinici ar fi, stau sub porunca părintească; Marta însă e una singură, adică nu mai are în casă pe nimeni deopotrivă cu dânsa. Încă pe când era în fașe, Marta avea obiceiul de a pune toată casa în mișcare."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-7707602","romanian":"Ei nu mai aveau mere, așă că am cumpărat niște banane în schimb.","english":"They were all out of apples, so I bought some bananas instead.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13621249","romanian":"Turiștii au început să bâiguie entuziasmați de îndată ce ghidul a menționat fantomele.","english":"The tourists began to gabble excitedly as soon as the guide mentioned ghosts.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153792","romanian":"În noaptea aceea, s-a îmbolnăvit, având dureri de stomac.","english":"That night, he became sick with pains in his stomach.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128717"},{"id":"tat-583839","romanian":"Tom s-a căsătorit cu o femeie mai în vârsta.","english":"Tom married an older woman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2255151"},{"id":"tat-1133950","romanian":"M-am aşezat şi am deschis laptopul meu.","english":"I sat down and opened my notebook.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9939356"},{"id":"tat-1143126","romanian":"Doctorul este un om cult.","english":"The doctor is a man of culture.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068831"},{"id":"tat-4961192","romanian":"Ai putea să o spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1153798","romanian":"Indiferent de ce joacă pe ecran, Tom arată grozav.","english":"No matter what he plays on the screen, Tom looks great.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128804"},{"id":"tat-2568509","romanian":"Când trimiteți o telegramă, concizia este esențială, deoarece veți fi taxat pentru fiecare cuvânt.","english":"When you send a telegram, brevity is essential because you will be charged for every word.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-706081","romanian":"Când ar trebui să aduc maşina înapoi?","english":"When should I return the car?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970925"},{"id":"tat-6578340","romanian":"I-am spus lui Mary să nu facă asta, dar ea tot a făcut-o.","english":"I told Mary not to do that, but she did it anyway.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185178","romanian":"Mă durea inima pentru păsările aflate pe moarte.","english":"My heart ached for the dying birds.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324325"},{"id":"tat-583889","romanian":"Mă țin întotdeauna de promisiune.","english":"I always keep my promises.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/870644"},{"id":"tat-1136530","romanian":"A luat o piatră de pe jos.","english":"He picked up a stone.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964787"},{"id":"tat-1192738","romanian":"Compunerea ta nu este în întregime rea.","english":"Your composition is not altogether bad.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7509671"},{"id":"tat-411865","romanian":"Vara mă duc la piscină în fiecare zi.","english":"In the summer I go to the pool every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271951"},{"id":"tat-1120906","romanian":"El este un conducător auto cu experienţă.","english":"He is an expert driver.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11856429"},{"id":"tat-708942","romanian":"Vino mai aproape de mine.","english":"Come closer to me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419505"},{"id":"tat-1136841","romanian":"Conducătorii de autobuze vor face grevă astăzi.","english":"The bus drivers are going on strike today.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966685"},{"id":"tat-1059626","romanian":"Presupun că-ți place de ea.","english":"I suppose you like her.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9777847"}],"stories":[{"id":"story-ro-v-duvele-3","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Amândouă aveau de la răposaţi acareturi bune, aşezate cu temei, să tot ţie şi să nu mai putrezească; ceva bani cheag, ogrăzi cu pruni şi zarzări, grădini cu flori şi legume, toate ocolite cu garduri-pleturi, să nu vezi prin ele, şi umbrite cu streşini de mărăcini."},{"id":"story-ro-mo-ion-roat-i-unirea","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":221,"excerpt":"La 1857, pe când se ferbea Unirea în Iaşi, boierii moldoveni liberali, ca de-alde Costache Hurmuzachi, M. Kogălniceanu şi alţii, au găsit cu cale să cheme la Adunare şi câţiva ţărani fruntaşi, câte unul din fiecare judeţ, spre a lua şi ei parte la facerea acestui măreţ şi nobil act naţional."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un biet om sărac. El avea femeie şi trei copilaşi. Lucra bietul om de da pe brânci, zi şi noapte, orice şi pe unde găsea, şi două în tei nu putea lega şi el. Bieţii copilaşi erau mai mult flămânzi decât sătui."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-2","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Ce nu făcu bietul tată-său, ce nu drese ca să-şi dea fata la casa ei, dară ca s-o înduplece, ba. Ei nu-i da inima să-şi lege capul cu nici unul din peţitorii ce veneau să o ceară, deşi toţi erau împăraţi şi fii de împăraţi."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-greuceanu","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":228,"excerpt":"A fost un împărat şi se numea împăratul Roşu. El era foarte mâhnit că, în zilele lui, nişte zmei furaseră soarele şi luna de pe cer."}],"recipes":[{"id":"recipe-bulz","title":{"ro":"Bulz","en":"Cheese-filled Polenta Balls"},"description":{"ro":"Bulzul este o specialitate din Ardeal, mamaliga umpluta cu branza.","en":"Bulz is a Transylvanian specialty, polenta filled with cheese."},"difficulty":3,"category":"main","ingredients":[{"ro":"mamaliga","en":"polenta","amount":"500 g"},{"ro":"branza de burduf","en":"sheep cheese","amount":"200 g"},{"ro":"smantana","en":"sour cream","amount":"150 ml"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se face mamaliga si se lasa sa se raceasca putin.","en":"Make polenta and let it cool slightly."},{"ro":"Se formeaza bile din mamaliga.","en":"Form balls from polenta."},{"ro":"Se pune branza in mijlocul fiecarei bile.","en":"Put cheese in the center of each ball."},{"ro":"Se aseaza in tava unsa cu unt.","en":"Place in buttered pan."},{"ro":"Se ung cu ou batut si se coc la cuptor 20 minute.","en":"Brush with beaten egg and bake for 20 minutes."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1064018","romanian":"El a început să se scuze.","english":"He began to make excuses.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10918528"},{"id":"tat-6614173","romanian":"Dl. și dna. Yamada se vor întoarce în țara lor de baștină luna viitoare.","english":"Mr. and Mrs. Yamada will return to their homeland next month.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1090180","romanian":"De ce vrei să cumperi cartea asta?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3639543"},{"id":"tat-408013","romanian":"Ce crezi că are de gând Dana?","english":"What do you think Dana has in mind?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532049"},{"id":"tat-1142940","romanian":"Cine e în spatele intrigii?","english":"Who is behind the plot?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066756"},{"id":"tat-584853","romanian":"Casa sa este foarte modernă.","english":"Her house is very modern.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812441"},{"id":"tat-1192702","romanian":"Mi-era foarte teamă de șerpi.","english":"I was very scared of snakes.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/923909"},{"id":"tat-1136622","romanian":"Dă-mi o mână de ajutor.","english":"Lend me a hand.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239816"},{"id":"tat-863673","romanian":"Cât la sută dintre persoane vorbesc trei limbi străine?","english":"What percentage of the people speak three languages?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9105795"},{"id":"tat-411853","romanian":"În Franța ați lucrat la ambasadă sau la consulat?","english":"In France did you work at the embassy or in the consulate?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6262484"},{"id":"tat-709913","romanian":"M-am împiedicat de o piatră scrântindu-mi glezna.","english":"I tripped on a stone, twisting my ankle.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426746"},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-709928","romanian":"Această maşină a fost făcută in Japonia.","english":"This car was made in Japan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424464"},{"id":"tat-864488","romanian":"Ea știa să citească când avea patru ani.","english":"She could read when she was four.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855675"},{"id":"tat-6637069","romanian":"Friptura a fost arsă din greșeală, dar cu toate acestea a avut un gust spectaculos.","english":"The steak was inadvertently burnt, but nonetheless it tasted spectacular.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13598708","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singură.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-709935","romanian":"Sărăcia este o povară, dar nu o ruşine.","english":"Poverty is a pain, but no disgrace.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5915496"},{"id":"tat-11597600","romanian":"Cleopatra se afla la Roma în ziua în care Iulius Cezar a fost asasinat.","english":"Cleopatra was in Rome the day Julius Caesar was assassinated.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-924384","romanian":"Ea vrea să închidă mica sa afacere.","english":"She wants to wind up her small business.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735381"},{"id":"tat-1136809","romanian":"Care e mai veche, această carte sau cealaltă?","english":"Which is older, this book or that one?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966358"}],"stories":[{"id":"story-scrisoarea-iii","title":"Scrisoarea III","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":145,"excerpt":"Unde-Loss'n ceruri senine Luceafarul rasare, Din negura de vremi acolo moartea a lasat urma, Acolo sufletul se-Loss'ntreaba: \"Ce-Loss'n veacul veacului nu moare?\" Si glasul vremii-Loss'n raspuns sopteste tainic: \"Numai urma.\" Pe cand lumea toata doarme-Loss'n noapte, Trecut-au ani si veacuri, si totusi noi vedem Pe bolta-Loss'nstelata aceleasi stele-Loss'napte Ce-au luminat si Mircea, si Stefan cel Batran."},{"id":"story-ro-greuceanu-2","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"Ei erau trişti, bieţii oameni, dară Greuceanu îi mângâie cu nişte vorbe aşa de dulci, încât le mai veni niţică inimă, că era şi meşter la cuvânt Greuceanu nostru. El îşi puse nădejdea în întâmplarea aceasta şi îşi zise:\"îmi voi încerca norocul."},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-3","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Boiul lor era mândru, amândoi aveau pe vino-ncoace, vorba lor, era vorbă cu lipici şi amândoi erau voinici, nevoie mare. Într-o zi se hotărâră să meargă la vânătoare. Împărăteasa se tot ciudea cum să-şi cunoască pe fiul său: fiindcă şi feţele şi îmbrăcăminţile fiind la fel, de multe ori nu putea să deosebească pe unul din altul."},{"id":"story-ro-fata-mo-ului-cea-cuminte-3","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"– Om bun, răspunse fata. După ce intră, fiindu-i frică de mumă-sa vitregă să nu o bată dacă se va întoarce acasă, pentru că întârziase, întrebă dacă nu cumva are trebuinţă de o slujnică. Sânta Vinerea, care locuia înăuntru şi care priimi pe fată, îi răspunse că are trebuinţă de o asemenea fată; ea rămase acolo."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."},{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."}],"recipes":[{"id":"recipe-ciulama","title":{"ro":"Ciulama de pui","en":"Chicken in White Sauce"},"description":{"ro":"Ciulama este un preparat cremos de pui in sos alb, servit cu mamaliga.","en":"Ciulama is a creamy chicken dish in white sauce, served with polenta."},"difficulty":3,"category":"main","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"ciuperci","en":"mushrooms","amount":"300 g"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"faina","en":"flour","amount":"2 linguri"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"usturoi","en":"garlic","amount":"3 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui si se taie cubulete.","en":"Boil chicken breast and cut into cubes."},{"ro":"Se calesc ciupercile in unt.","en":"Saute mushrooms in butter."},{"ro":"Se adauga faina si se amesteca.","en":"Add flour and stir."},{"ro":"Se toarna smantana si zeama de la pui.","en":"Pour in sour cream and chicken broth."},{"ro":"Se adauga puiul si usturoiul pisat.","en":"Add chicken and crushed garlic."},{"ro":"Se serveste cu mamaliga si patrunjel.","en":"Serve with polenta and parsley."}]}]};
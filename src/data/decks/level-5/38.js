@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-584344","romanian":"Bună ziua, cum vă pot fi de folos?","english":"Good day, how may I help you?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7797080"},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-9952605","romanian":"Tom a spus că este dispus să ne împrumute trei mii de dolari.","english":"Tom said he was willing to lend us three thousand dollars.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-699627","romanian":"Ieri am mâncat un măr.","english":"Yesterday, I ate an apple.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320082"},{"id":"tat-712076","romanian":"Trebuie să vii cu mine.","english":"You have to come with me.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440714"},{"id":"tat-406035","romanian":"Îți plăcea să mergi la expoziții în România?","english":"Did you enjoy going to exhibits in Romania?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350460"},{"id":"tat-862770","romanian":"Bunicului meu ii place sa meargă.","english":"My grandfather likes to walk.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014569"},{"id":"tat-1136672","romanian":"Te-ai juca cu mine?","english":"Would you play with me?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239753"},{"id":"tat-6539915","romanian":"Potrivit unui studiu recent, durata medie de viață a japonezilor este în continuă creștere.","english":"According to a recent study, the average life span of the Japanese is still increasing.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136410","romanian":"Cheamă-mă dacă ai nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962814"},{"id":"tat-862830","romanian":"Prima oară a fost ales de senat în 1984.","english":"He was first elected to the Senate in 1984.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014508"},{"id":"tat-1059687","romanian":"Nimeni nu ne poate controla.","english":"Nobody can control us.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10681475"},{"id":"tat-1192834","romanian":"În Japonia, noul an școlar începe în aprilie.","english":"The new school year begins in April in Japan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361249"},{"id":"tat-7115226","romanian":"Când un înțelept se va ridica din nou, el cu siguranță îmi va urma spusele.","english":"When a Sage shall again arise, he will certainly follow my words.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143117","romanian":"Și pomul era deseori singur.","english":"And the tree was often alone.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070043"},{"id":"tat-923855","romanian":"M-am căsătorit cu o poloneză.","english":"I am married to a Polish woman.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442834"},{"id":"tat-1144305","romanian":"Japonia se compune din patru insule principale.","english":"Japan consists of four main islands.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073340"},{"id":"tat-1192741","romanian":"Tom a avut vremuri grele anul trecut.","english":"Tom had a rough time last year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511264"},{"id":"tat-6582834","romanian":"Tom obișnuia să se ducă în Boston în fiecare vară când era copil.","english":"Tom used to go to Boston every summer when he was a kid.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192817","romanian":"Tom își dorea să fi fost mai atent.","english":"Tom wished he had been more careful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356244"}],"stories":[{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-ro-inul-i-c-me-a-2","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":219,"excerpt":"Tortul l-au depănat pe râşchitor, spre a-l face căleap; călepele s-au fert cu leşie, să se înălbească, apoi te-au pus pe vârtelniţă, de pe care au început a le depăna pe mosoare cu letca; de pe mosoare te-au urzit pe urzoi, apoi te-au luat şi te-au învălit pe sulul de dinapoi, punând vergele pintre pături, ca să nu se hrentuiască urzala; şi fuscei pintre rost, ca să nu se încâlcească natra."},{"id":"story-ro-palatul-de-cle-tar-3","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":268,"excerpt":"Nu trecu cât ai scăpăra din amnar, şi se apropiară de împărat, cu mângâieri şi dezmierdări, odrasla lui, de trei fete, ca trei zâne, surori şi nepoate, care mai de care mai chipeşe şi mai drăgălaşe. Apoi veniră mai-marii tronului şi slugile ohavnice. Toţi cu toţi ieşiră ca dintr-o lacră, să cadă cu mătănii, doară or curma focul împăratului."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."},{"id":"story-ro-popa-duhu-2","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"Mare de inimă, iar de gură şi mai mare, părintele Duhu nu se învrednicise de o viaţă mai bună; dar se vede că nici poftea el una aşa, de vreme ce nu-şi astâmpăra gura cătră mai-marii săi măcar să-l fi picat cu lumânarea."},{"id":"story-ro-fata-mo-ului-cea-cuminte","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"A fost odată un om bătrân care avea o fată mare, de se dusese vestea în lume de vrednicia ei. Moşneagul (unchiaşul) se căsători de a doua oară cu o babă, care avea şi ea o fată mare."},{"id":"story-ro-la-crucea-din-sat-3","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– I-ai adăpat? – Asta nu se face acum; știi d-ta bine că noi adăpăm boii când se culcă găinile! – Dar caii... Bujor îi taie vorba: – Bade Mitre!"}],"recipes":[{"id":"recipe-gogosi","title":{"ro":"Gogosi","en":"Romanian Doughnuts"},"description":{"ro":"Gogosile sunt prajituri pufoase prajite, presarate cu zahar pudra.","en":"Gogosi are fluffy fried pastries dusted with powdered sugar."},"difficulty":3,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"500 g"},{"ro":"lapte","en":"milk","amount":"200 ml"},{"ro":"drojdie","en":"yeast","amount":"25 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"unt","en":"butter","amount":"50 g"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"zahar pudra","en":"powdered sugar","amount":"pentru presarat"}],"steps":[{"ro":"Se dizolva drojdia in lapte cald cu zahar.","en":"Dissolve yeast in warm milk with sugar."},{"ro":"Se amesteca faina cu ouale si untul.","en":"Mix flour with eggs and butter."},{"ro":"Se adauga maiaua si se framanta.","en":"Add yeast mixture and knead."},{"ro":"Se lasa aluatul sa creasca 1 ora.","en":"Let dough rise for 1 hour."},{"ro":"Se taie cercuri si se prajesc in ulei.","en":"Cut circles and fry in oil."},{"ro":"Se presara cu zahar pudra.","en":"Dust with powdered sugar."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-2536598","romanian":"Știi fraza „recoltăm ce semănăm”. Am semănat vânt și aceasta e furtuna mea.","english":"You know the phrase, we reap what we sow. I have sown the wind and this is my storm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143210","romanian":"Tom pretindea că nu știe cine e Mary.","english":"Tom pretended not to know who Mary was.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070000"},{"id":"tat-1136910","romanian":"Articolul 6. Președintele va conduce toate reuniunile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11953737"},{"id":"tat-5345650","romanian":"Merg prin cartierul chinezesc și admir simbolurile frumoase pe care tot nu le înțeleg încă.","english":"I go through Chinatown and admire the beautiful signs that I still do not understand.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1056778","romanian":"Muzica este o parte importantă din viața mea.","english":"Music is an important part of my life.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031363"},{"id":"tat-1153156","romanian":"M-am dus la petrecere pe prezumția că ea va fi acolo.","english":"I went to the party on the presumption that she would be there.","difficulty":7,"wordCount":11,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749169"},{"id":"tat-1136774","romanian":"- Sunt profesor. - Și eu sunt.","english":"I am a teacher. \"So am I.\"","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966215"},{"id":"tat-1143144","romanian":"E un lac în fața casei mele.","english":"There is a lake in front of my house.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068930"},{"id":"tat-1119756","romanian":"În acest oraș, există trei saloane de înfrumusețare.","english":"In this city, there are three beauty salons.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264837"},{"id":"tat-1064401","romanian":"L-am prins furând banii.","english":"I caught him stealing the money.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074556"},{"id":"tat-13616959","romanian":"Tu poți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-488758","romanian":"Vă rugam să așteptați treizeci de minute.","english":"Please wait for thirty minutes.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268731"},{"id":"tat-1136509","romanian":"Sunt de acord să merg cu el.","english":"I agree to go with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965688"},{"id":"tat-487300","romanian":"Înțelepciunea nu vine în mod automat cu vârsta.","english":"Wisdom does not automatically come with age.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270672"},{"id":"tat-1136995","romanian":"Sahara este un deșert vast.","english":"The Sahara is a vast desert.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952791"},{"id":"tat-708991","romanian":"Presupun că va întârzia.","english":"I suppose he will be late.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420395"},{"id":"tat-9622587","romanian":"Atât Tom, cât și eu am vrut să mergem în Australia cu Mary.","english":"Both Tom and I wanted to go to Australia with Mary.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192724","romanian":"L-am făcut să vopsească poarta săptămâna trecută.","english":"I had him paint the gate last week.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221821"},{"id":"tat-1136651","romanian":"Această propoziție este la prezentul perfect sau trecutul simplu?","english":"Is this sentence in the present perfect or simple past?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239828"},{"id":"tat-599093","romanian":"Știi cine e blonda înaltă îmbrăcata în verde?","english":"Does anybody know who the tall, blond girl dressed in green is?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1448294"}],"stories":[{"id":"story-ro-z-na-zorilor","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"A fost ce-a fost: dacă n-ar fi fost nici nu s-ar povesti. Poveşti de Ioan Slavici - Zâna Zorilor A fost odată un împărat, – un împărat mare şi puternic; împărăţia lui era atât de mare, încât nici nu se ştia unde se începe şi unde se sfârşeşte. Unii ziceau că ar fi fără de margini."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-comoara-3","title":"Comoara","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"- Dar Ghiță ce face? Întrebă iar Duțu, zâmbind pe sub mustață. - E bine și el! răspunse Ana, care nu înțelegea nici acum batjocura. Au înțeles-o însă vecinii, și peste puțin, așa-i răutatea omenească, sătenii nu-i mai ziceau lui Ghiță, ca mai nainte, Ghiță al Popii, ci Ghiță al Boilor."},{"id":"story-ro-povestea-lui-stan-p-itul-2","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"Numai, dă! ce să facă bietul om? Cum era să se întindă mai mult, că de-abia acum se prinsese şi el cu mâinile de vatră; şi câte a tras până s-a văzut la casa lui, numai unul Dumnezeu ştie."},{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-f-t-frumos-din-lacrim-2","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":213,"excerpt":"Lungi cearcăne vinete se trăgeau împrejurul ochilor, şi vine albastre se trăgeau pe faţa ei albă ca o marmură vie. Sculată din patul ei, ea se aruncă pe treptele de piatră a unei bolte în zid, în care veghea, deasupra unei candele fumegânde, icoana îmbrăcată în argint a Maicii durerilor."}],"recipes":[{"id":"recipe-ciorba-fasole","title":{"ro":"Ciorba de fasole","en":"Bean Soup"},"description":{"ro":"Ciorba de fasole este o supa consistenta si hranitoare, perfecta pentru zilele reci.","en":"Bean soup is a hearty and nourishing soup, perfect for cold days."},"difficulty":3,"category":"soup","ingredients":[{"ro":"fasole boabe","en":"dried beans","amount":"400 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"morcov","en":"carrot","amount":"1 bucata"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingurita"},{"ro":"cimbru","en":"thyme","amount":"1 lingurita"},{"ro":"otet","en":"vinegar","amount":"2 linguri"}],"steps":[{"ro":"Se pune fasolea la inmuiat peste noapte.","en":"Soak beans overnight."},{"ro":"Se fierbe fasolea pana se inmoaie.","en":"Boil beans until soft."},{"ro":"Se caleste ceapa si se adauga legumele.","en":"Saute onion and add vegetables."},{"ro":"Se adauga fasolea si se continua fierberea.","en":"Add beans and continue boiling."},{"ro":"Se acriseste cu otet si se condimenteaza.","en":"Add vinegar and season."},{"ro":"Se serveste cu ardei iute.","en":"Serve with hot pepper."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-705792","romanian":"Acest subiect ar trebui discutat in detaliu.","english":"This subject should be discussed in detail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963142"},{"id":"tat-1089709","romanian":"Nu știam despre planul lui.","english":"I was ignorant of his plan.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11265216"},{"id":"tat-1136801","romanian":"Și-a pierdut toți banii pe care îi avea.","english":"He lost all the money he had.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966361"},{"id":"tat-5358834","romanian":"Tom a gestionat un bar mic de pe lângă Boston pentru o bună perioadă de timp.","english":"Tom managed a small bar near Boston for quite a long time.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1192742","romanian":"Avionul se apropia de Londra.","english":"The plane was approaching London.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511266"},{"id":"tat-583956","romanian":"Orice ai spune, răspunsul e \"nu\".","english":"No matter what you say, the answer is \"no.\"","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799488"},{"id":"tat-1136661","romanian":"Ne confruntăm cu o alegere dificilă.","english":"We are faced with a difficult choice.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239777"},{"id":"tat-8921739","romanian":"Niciun viitor nu poate compensa ceea ce lăsați să se întâmple în prezent.","english":"No future can compensate for what you let happen in the present.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-702062","romanian":"Călătoria lor a fost amânată din cauza ploii.","english":"Their trip was postponed because of the rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398899"},{"id":"tat-1059613","romanian":"Cele mai frumoase fete sunt din Lituania.","english":"The most beautiful girls are from Lithuania.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9569381"},{"id":"tat-1192844","romanian":"Sunt o mulțime de cărți în camera lui.","english":"There are a lot of books in his room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361457"},{"id":"tat-2568530","romanian":"Pentru el, foamea era un concept abstract; el a avut întotdeauna suficientă mâncare.","english":"To him, hunger was an abstract concept; he always had enough to eat.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143220","romanian":"Rar merg acum la film.","english":"Now I seldom go to the movies.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12016774"},{"id":"tat-1064244","romanian":"Tom a uitat să își ia medicația azi dimineață.","english":"Tom forgot to take his medication this morning.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073232"},{"id":"tat-10792151","romanian":"Dulapul este confecționat din lemn de culoare închisă și are mânere ornamentate din aur.","english":"The wardrobe is made from dark wood and has ornate gold handles.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-204","romanian":"Fiecare experienta ne invata ceva important despre viata.","english":"Every experience teaches us something important about life.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1186844","romanian":"Metodele sale nu sunt ştiinţifice.","english":"His methods are not scientific.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338130"},{"id":"tat-1059443","romanian":"Când vine vorba de gătit, nimeni nu mă întrece.","english":"When it comes to cooking, no one can beat me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9509387"},{"id":"tat-1278911","romanian":"Sunt pregătit să te ajut.","english":"I am ready to help you.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13347606"}],"stories":[{"id":"story-capra-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":200,"excerpt":"Era odata o capra care avea trei iezi. Intr-o zi, capra a plecat sa caute de mancare pentru iezii ei. Inainte de a pleca, capra le-a spus iezilor: \"Dragii mei, nu deschideti usa nimanui pana nu ma intorc."},{"id":"story-ro-finul-lui-dumnezeu","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste – da eu nu-s de pe când poveştile – eu sunt de mai încoace, da m-am dus într-o zi la soacră-mea ş’am găsit un sac de poveşti, şi venind a casă l-am scăpat jos şi s-o despicat sacul şi de-atunci s-o împlut lumea de poveşti ş’ am învăţat şi eu una şi ţ-o spun d-tale."},{"id":"story-sara-pe-deal","title":"Sara pe deal","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":110,"excerpt":"Sara pe deal buciumul suna cu jale, Turmele-Loss'n vin, umpland carari si cale, Sufletul meu arde-n iubire ca para, Tu esti departe. Foarte departe, sufletul meu te cheama, Stelele-Loss'n cer scapara-n neagra ceama, Inima mea te asteapta cu dor, Tu nu mai vii."},{"id":"story-ro-pas-rea-m-iastr-2","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Iară a treia noapte visă împăratul că dacă va aduce cineva pasărea măiastră de pe tărâmul celălalt şi să-i aşeze cuibul în turn, se va putea face monastirea desăvârşit. Spuse fiilor acest vis, iară ei se întreceau care de care să plece mai-nainte, şi să se închine cu slujba la tată-său împăratul."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-2","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Atunci fata babei, vicleană cum era, lua ciurul şi fuga în casă la babă şi la moşneag, spunând că ea a tors acele fuse. În zadar fata moşneagului spunea în urmă că acela este lucrul mâinilor sale; căci îndată o apucau de obraz baba şi cu fiică-sa şi trebuia numaidecât să rămâie pe-a lor."},{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat şi o împărăteasă. Ei aveau trei copii. Mai aveau pe lângă palaturile lor o grădină foarte frumoasă. Şi atât de drag îi era florile acestui împărat, încât însuşi cu multă tragere de inimă le plivea şi îngrijăa de grădină. În fundul acestei grădini crescuse un măr cu totul şi cu totul de aur."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
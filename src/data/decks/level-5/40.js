@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-706050","romanian":"Dacă înveţi din greu, vei deveni un student bun.","english":"If you study hard, you will become a good student.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970031"},{"id":"tat-1059644","romanian":"A fost foarte prietenos cu toată lumea.","english":"He was very friendly to everybody.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795791"},{"id":"tat-12085368","romanian":"Rusia este pur și simplu casa unora dintre cele mai frumoase femei de pe planetă.","english":"Russia is simply home to some of the most beautiful women on the planet.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-584010","romanian":"Mi-am pierdut codul pin!","english":"I forgot my PIN number!","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7801864"},{"id":"tat-1143282","romanian":"Este cel mai înalt băiat.","english":"He is the tallest boy.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068668"},{"id":"tat-864947","romanian":"Trebuie să găsesc o ieşire din acestă problemă.","english":"I need to find a way out of this problem.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10113453"},{"id":"tat-8817097","romanian":"Dacă ai probleme, te voi ajuta să studiezi limba engleză.","english":"If you are having problems, I will help you study English.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1186831","romanian":"Mi-e teamă de ce va spune profesorul.","english":"I am afraid of what the teacher will say.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7295047"},{"id":"tat-13619375","romanian":"Tom a bolborosit o scuză înainte de a se grăbi să prindă autobuzul.","english":"Tom gabbled out an apology before rushing to catch the bus.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-705997","romanian":"Ai avut un weekend plăcut?","english":"Did you have a good weekend?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968585"},{"id":"tat-1168697","romanian":"Am auzit muzica.","english":"I heard the music.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12220460"},{"id":"tat-706134","romanian":"Lui Robert i se spune \"Bob\".","english":"They call Robert \"Bob\".","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974457"},{"id":"tat-1059689","romanian":"Nu îi e ușor să învețe engleza.","english":"English is not easy for him to learn.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029000"},{"id":"tat-13615591","romanian":"Te poți uita în geanta ta? Mi-am pus mobilul acolo.","english":"Can you have a look in your bag? I put my mobile in there.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1143119","romanian":"Tom va ajunge o oră mai târziu.","english":"Tom will be arriving an hour late.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070045"},{"id":"tat-584785","romanian":"Seara el iese în oraș să bea ceva.","english":"At night he goes out in the city to drink something.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812845"},{"id":"tat-706124","romanian":"Nu avea nicio intenţie să aştepte trei ore.","english":"He had no intention of waiting for three hours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/973116"},{"id":"tat-1192743","romanian":"Vecinii sunt OK cu muzica tare la această oră?","english":"Is loud music OK with the neighbors at this hour?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7512007"},{"id":"tat-584840","romanian":"Mobilierul din acest birou este foarte modern.","english":"The furniture in this office is really modern.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812390"}],"stories":[{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."},{"id":"story-ro-finul-lui-dumnezeu-3","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":210,"excerpt":"S-o vârât sub aripa lui şi nu s-a văzut. S-aude un vuiet mare; vine pajera. Pajera era mama vântului. – Dragii mamei nu v-a mâncat! – Finul lui D-zeu ne-a scăpat. – Unde-i să-l mănânc de bucurie. – Mă rog, mamă, dacă l-ăi mânca să-l faci înapoi. – Da unde-i? – Îi la răsărit."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-ro-fata-babei-i-fata-mo-neagului","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":251,"excerpt":"Erau odată un moşneag şi-o babă; şi moşneagul avea o fată, şi baba iar o fată. Fata babei era slută, leneşă, ţâfnoasă şi rea la inimă; dar, pentru că era fata mamei, se alinta cum s-alintă cioara-n laţ, lăsând tot greul pe fata moşneagului. Fata moşneagului însă era frumoasă, harnică, ascultătoare şi bună la inimă."},{"id":"story-ro-z-na-zorilor-2","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Cu totul alta era Costan: mic la statură, îndesat la făptură, cu braţul de bărbat, cu pumnul îndesat. Al treilea şi cel mai tânăr fecior al împăratului e Petru: înalt, dar subţire, mai mult fată decât fecior. Petru nu face multă vorbă: el râde şi cântă, cântă şi râde de dimineaţă până în seară."},{"id":"story-ro-p-cal-n-satul-lui","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"I se urâse şi lui Păcală să tot umble răzleţ prin lume, aşa fără de nici o treabă, numai ca să încurce trebile altora şi să râdă de prostia oamenilor."}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
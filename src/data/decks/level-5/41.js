@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-411878","romanian":"Îmi spăl mașina în fața casei fără probleme.","english":"I wash my car in front of the house without any problems.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271996"},{"id":"tat-9622607","romanian":"Tom și Mary au spus că au plecat devreme pentru că nu se simțeau bine.","english":"Tom and Mary said they left early because they were feeling sick.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-411857","romanian":"Vreți să mergeți la film sau la teatru?","english":"Do you want to go to the movies or to the theater?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271921"},{"id":"tat-1136545","romanian":"Fundul oceanului este studiat de câţiva oameni de știință.","english":"The ocean floor is being studied by some scientists.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965763"},{"id":"tat-862837","romanian":"Trebuie sa mă gîndesc.","english":"I have to think about it.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014517"},{"id":"tat-7115224","romanian":"Ambii sportivi sunt foarte îndârjiți și deseori pot să apară animozități între ei.","english":"Both sportsmen are very competitive and, often, animosities arise between them.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136800","romanian":"N-am fost niciodată într-o închisoare.","english":"I have never been inside a jail.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966338"},{"id":"tat-706028","romanian":"Pune-te în locul ei.","english":"Imagine yourself in her place.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/969664"},{"id":"tat-1153773","romanian":"Am lucrat pe un contract anual.","english":"I worked on a yearly contract.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128476"},{"id":"tat-705789","romanian":"Am cerut să li se permită sa plece.","english":"I demanded that they be allowed to leave.","difficulty":7,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963119"},{"id":"tat-712088","romanian":"Tom s-a ascuns sub masă.","english":"Tom hid under the table.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440023"},{"id":"tat-1153161","romanian":"Era obișnuită să trăiască dintr-un venit modest.","english":"She was used to living on a small income.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1752003"},{"id":"tat-411927","romanian":"În weekend am mult de spălat.","english":"Over the weekend I have a lot to wash.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272185"},{"id":"tat-1136590","romanian":"Prăbușindu-se pe jos, a izbucnit în lacrimi.","english":"On falling down, she burst into tears.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965952"},{"id":"tat-1185067","romanian":"Tom vorbea la telefon de o oră.","english":"Tom has been talking on the phone for an hour.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320872"},{"id":"tat-10313164","romanian":"Algeria ar trebui să devină cea mai sigură țară din Africa de Nord.","english":"Algeria should become the safest country in North Africa.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138098","romanian":"Cu siguranță se poate spune că este cel mai mare pianist al secolului douăzeci.","english":"It may safely be said that he is the greatest pianist of the twentieth century.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-714064","romanian":"Julio se leagănă in hamacul pe care l-am atârnat sub bătrânul stejar.","english":"Julio is swinging in the hammock that I hung under the old oak tree.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469770"},{"id":"tat-698941","romanian":"Cum se numește acest râu?","english":"What is the name of this river?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2265424"},{"id":"tat-1185133","romanian":"S-a produs vreo schimbare în curenții oceanici?","english":"Has a change in ocean currents occurred?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323897"}],"stories":[{"id":"story-ro-borta-v-ntului","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Era un om sărac – sărac, ş-avea o mulţime de copii. Acu era – în vremea foametei şi el a muncit v-o săptămână pe un căuş de grăunţe. Acu s-a dus la râşniţă cu dânsele. După ce le-o râşnit, a ieşit afară cu căuşul cu făină şi s-a pornit o furtună mare şi i-a luat toată făina din căuş."},{"id":"story-ro-fata-mo-ului","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":208,"excerpt":"Copiii cutreierau voioşi via părăginită. Un şir, ţinându-se cu amândouă mâinile de mijloc, se încolăcea, strigând de frică să nu-i înhaţe \"mama-gaia\". Fetele începuseră \"de-a ulciorul\". – Cum dai ulciorul? Poveşti de Barbu Ştefănescu Delavrancea - Fata moşului – Cum îl vezi, cu ochii verzi, ş-o lingură de păsat, să nu zacă de vărsat. Sub castani, oamenii stau de vorbă."},{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-gura-satului-3","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"zice una. — Cine altul decât Toderică, îi răspunde alta. — Toderică? Așa umblă gura satului. Nici să visezi din ce scornește o poveste. Pentru ca să vorbim drept, Toderică e Toader, ba chiar Tudoroiu. Lasă că avea din cine să iasă fiindcă și tatăl său, Cosma Florii Cazacului, seamănă cu dânsul."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-ro-poveste-2","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":232,"excerpt":"Iar împărăteasa avea haz, căci începea şi ea, adunându-şi lacrimile în pumni, şi-l certa că prea plânge ca o muiere de fiece şi orişicând. Şi începeau: – Ba iar ai plâns. – Ba n-am plâns. – Ba te-am văzut eu. – Şi eu te-am văzut pe tine. – Ba eu am râs. – Şi eu am râs."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1192751","romanian":"Puteți scădea prețul dacă voi cumpăra două?","english":"Could you knock down the price if I buy two?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1429026"},{"id":"tat-1136915","romanian":"De fapt, știe foarte puține despre această chestiune.","english":"As a matter of fact, he knows very little of the matter.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959366"},{"id":"tat-7187157","romanian":"Galaxia Calea Lactee este face parte dintr-un grup de aproximativ treizeci și cinci de galaxii.","english":"The Milky Way galaxy is bound in a cluster of about thirty-five galaxies.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1144343","romanian":"Piața respectivă s-a extins rapid.","english":"That market has been rapidly expanding.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073795"},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1143219","romanian":"Au fost într-o excursie în străinătate pentru prima oară.","english":"They went on a trip abroad for the first time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070011"},{"id":"tat-2429205","romanian":"La început am crezut că sunt avantajat având o limbă din familia latină.","english":"At first, I thought I had an advantage because I spoke a Romance language.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192766","romanian":"Acesta este stiloul cu care a scris faimosul romancier.","english":"This is the pen which the famous novelist wrote with.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357144"},{"id":"tat-1136858","romanian":"Era cât pe ce să explodeze, dar s-a stăpânit.","english":"He was about to explode, but checked himself.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966284"},{"id":"tat-1136691","romanian":"L-am văzut oprindu-se.","english":"I observed him stop.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221903"},{"id":"tat-670675","romanian":"Poţi să-l alegi pe care îl vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200655"},{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163907","romanian":"A continuat să plângă cât e noaptea de lungă.","english":"She kept crying all night long.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196991"},{"id":"tat-406033","romanian":"Îmi face plăcere să merg pe jos.","english":"I like to walk.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350454"},{"id":"tat-8979884","romanian":"Am convenit asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-698918","romanian":"Nu are nimic a face cu mine.","english":"That has nothing to do with me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1802122"},{"id":"tat-708961","romanian":"Este adevărat ceea ce spune.","english":"What he says is true.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420399"},{"id":"tat-1143262","romanian":"A profitat de ignoranța mea și m-a înșelat.","english":"He took advantage of my ignorance and deceived me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068634"},{"id":"tat-1119734","romanian":"Vreau să te întreb ceva, domnișoară Ionescu.","english":"I want to ask you something, Ms. Ionescu.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342506"},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-3","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":226,"excerpt":"Le dete, deci, voie, şi ei se puseră pe lucru. Pândi în ziua dintâi fiul cel mare; dară păţi ruşinea ce păţise şi ceilalţi pândari din naintea lui. A doua zi pândi şi cel mijlociu; dară nici el nu fu mai breaz, ci se întoarse la tatăl său cu nasul în jos."},{"id":"story-ro-p-dureanca-3","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Ți-e scris, ți-e scris; nu ți-e scris, nu ți-e scris, și sănătate bună. Socoteala lui Busuioc era făcută: n-avea decât să pună caii la câteva căruțe, să plece la păduri ca să-și aducă oamenii, și apoi ar fi vrut el să știe care-i acela, un om din Curtici, care ar îndrăzni să facă gură."},{"id":"story-ro-povestea-lui-harap-alb-2","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Amu cică împăratul acela, aproape de bătrâneţe, căzând la zăcare, a scris către frăţine-său craiului, să-i trimită grabnic pe cel mai vrednic dintre nepoţi, ca să-l lase împărat în locul său după moartea sa. Craiul, primind cartea, îndată chemă tustrei feciorii înaintea sa şi le zise: – Iaca ce-mi scrie frate-meu şi moşul vostru."},{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-3","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"Şi ei abia se potriviseră, spate în spate, cu nasul în velinţele zdrenţuite. Văzând cucernicul bătrân că dorm cu toţii ca nişte bolovani de piatră, începu şi hâţ în dreapta, hâţ în stânga, până descuie uşa omului."},{"id":"story-ro-ho-u-mp-rat","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat mare şi puternic. Abia la vremea cărunteţei dobândi şi el un copil. Bucuria lui fu nespusă când se văzu şi el tată, şi toată împărăţia lui fu veselă dinpreună cu dânsul, căci acest împărat era bun, drept şi temător de Dumnezeu. Pentru aceasta, el făcu mult bine poporului său."},{"id":"story-amintiri-copilarie","title":"Amintiri din copilarie","author":"Ion Creanga","difficulty":5,"genre":"memoir","wordCount":175,"excerpt":"Stau cateodata si-mi aduc aminte ce vremuri si ce oameni mai erau in partea locului, pe cand eram eu copil. Si, drept sa spun, pare-mi-se ca pe atunci oamenii erau mai sarguitori, mai voiosi si mai buni la suflet decat cei de astazi."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-698931","romanian":"La ce oră te-ai obișnuit să te duci la culcare?","english":"What time are you used to going to bed?","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2135421"},{"id":"tat-1064028","romanian":"De îndată ce m-a văzut a izbucnit în plâns.","english":"As soon as she saw me, she burst out crying.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10913317"},{"id":"tat-5154335","romanian":"Mi-a plăcut plăcere să te cunosc și aștept cu nerăbdare vești de la tine.","english":"It was nice to meet you, and I look forward to hearing from you.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136938","romanian":"Ne-am ridicat toți deodată.","english":"We all stood up at once.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957804"},{"id":"tat-862913","romanian":"Aeroportul a fost închis din cauza ceţei.","english":"The airport was closed because of the fog.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10008928"},{"id":"tat-1064411","romanian":"Îmi aduc aminte de ce a spus el.","english":"I remember what he said.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075722"},{"id":"tat-2536426","romanian":"Cei care locuiesc în case de sticlă nu ar trebui să arunce cu pietre.","english":"Those who live in glass houses should not throw stones.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-709008","romanian":"Una dintre pisici este neagră, cealaltă este maro.","english":"One of the cats is black, the other is brown.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420282"},{"id":"tat-1136816","romanian":"Trebuie doar să exersezi în fiecare zi.","english":"You have only to practice every day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966330"},{"id":"tat-709043","romanian":"Am fost fascinat de frumuseţea ei.","english":"I was fascinated by her beauty.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420333"},{"id":"tat-1136625","romanian":"În caz de incendiu sunați la 119.","english":"In case of fire, you should dial 119.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966144"},{"id":"tat-8636611","romanian":"Am nevoie de aprobarea ta înainte de a pleca mai devreme de la lucru.","english":"I need your approval before I leave work early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-670692","romanian":"Poți alege orice carte vrei.","english":"You may choose whichever book you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200793"},{"id":"tat-1185145","romanian":"Concertul va avea loc vara viitoare.","english":"The concert will take place next summer.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324001"},{"id":"tat-1142947","romanian":"Am nevoie de stilouri, caiete și altele.","english":"I need pens, notebooks and so on.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12067969"},{"id":"tat-1136757","romanian":"A răspuns cu nici pe departe un surâs.","english":"She answered with hardly a smile.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966223"},{"id":"tat-1137565","romanian":"Cu ajutorul acestei aplicații, veți putea sincroniza fotografiile și muzica între aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1090181","romanian":"De ce vrei să cumperi această carte?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4412136"},{"id":"tat-5185437","romanian":"În timpul Evului Mediu, onoarea era de bază pentru viața omului liber și a creștinului.","english":"During the Middle Ages, honor was fundamental to the life of the free man and of the Christian man.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-709046","romanian":"Engleza este o limbă internaţională.","english":"English is an international language.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420340"}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":204,"excerpt":"Era odată un împărat puternic şi mare şi avea pe lângă palaturile sale o grădină frumoasă, bogată de flori şi meşteşugită nevoie mare! Aşa grădină nu se mai văzuse până atunci, p-acolo."},{"id":"story-ro-v-duvele","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"Oamenii, când n-au ce face, se-apucă de gâlceavă. Se dau la vorbă, şi destul e unul s-o apuce anapoda, că cearta e gata. Prostia pândeşte mintea omului cum pândesc lupii razna oilor."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-3","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"Într-una din zile, moşneagul, fiind foarte amărât de câte-i spunea baba, chemă fata şi-i zise: – Draga tatei, iaca ce-mi tot spune mă-ta de tine: că n-o asculţi, că eşti rea de gură şi înnărăvită şi că nu este de chip să mai stai la casa mea; de-aceea du-te şi tu încotro te-a îndrepta Dumnezeu, ca să nu se mai facă atâta gâlceavă la casa asta, din pricina ta."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."},{"id":"story-ro-fata-cu-pieze-rele","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":260,"excerpt":"A fost odată un împărat. El avea doisprezece feciori. Când se punea la masă, copiii stau împrejuru-i cunună deplină. El era totdauna cu voie-bună, fiindcă vedea că trebile îi merg strună. Poveşti de Petre Ispirescu - Fata cu pieze rele Împăraţii, vecinii lui, râvnea la traiul lui cel ticnit."},{"id":"story-ro-balaurul-cel-cu-apte-capete-3","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Atunci un sânge negru lasă din ea, fiară spurcată, şi curse, şi curse, până ce stinse şi foc şi tot. Acum ce să facă viteazul nostru, ca să nu găsească focul stins, când s-or deştepta tovarăşii lui, căci legătura lor era ca să omoare pe acela care va lăsa să se stingă focul."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
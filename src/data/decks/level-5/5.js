@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-487031","romanian":"Camera mea este foarte mică.","english":"My room is very small.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435954"},{"id":"tat-3877969","romanian":"Corpul uman obișnuit conține îndeajuns de multe oase încât să compună un întreg schelet uman.","english":"The average human body contains enough bones to make an entire human skeleton.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-923905","romanian":"Trebuie să găsesc un apartament de închiriat în Barcelona.","english":"I need to find a flat to rent in Barcelona.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/626893"},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1288426","romanian":"Câțiva dintre noi din Westmont de asemenea mergem la Ensanada în acest sfârșit de săptămână!","english":"A group of us from Westmont is going to Ensanada this weekend as well!","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12946182","romanian":"Albinele sunt animale foarte utile pentru că produc miere, ceară și polenizează florile.","english":"Bees are very useful animals because they produce honey, wax, and pollinate flowers.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-702194","romanian":"Am mâncat până mi s-a făcut rău.","english":"I ate myself sick.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397911"},{"id":"tat-1143189","romanian":"A strâns vesela de pe masă după cină.","english":"She cleared the table of the dishes after dinner.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069281"},{"id":"tat-698972","romanian":"Am două cărți.","english":"I have two books.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3766465"},{"id":"tat-1192731","romanian":"Fratele meu vrea să meargă pe lună cândva.","english":"My brother wants to go to the moon some day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7507022"},{"id":"tat-1151742","romanian":"La mulți ani de ziua mondială a protecției animalelor!","english":"Happy World Animal Protection Day!","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118279"},{"id":"tat-923931","romanian":"Animalele sălbatice sunt în pericol de dispariţie.","english":"Wild animals are on the verge of dying out.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/807128"},{"id":"tat-923822","romanian":"Astăzi profesorul a ales ca subiect \"cultura chinezească\".","english":"Today the teacher chose \"Chinese culture\" as a topic.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10433149"},{"id":"tat-1136572","romanian":"A trecut pe lângă mine fără să mă observe.","english":"He went by me without noticing me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965942"},{"id":"tat-1200897","romanian":"Am venit, am văzut, am cucerit.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11216029"},{"id":"tat-1064073","romanian":"El are o memorie bună.","english":"He has a good memory.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068890"},{"id":"tat-411911","romanian":"Aș merge la film dacă aș avea timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272125"},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-12341853","romanian":"Nu ai nimic de făcut decât să te supui regulilor.","english":"There is nothing for you to do but obey the rules.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-ileana-simziana","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat. Acel împărat mare şi puternic bătuse pe toţi împăraţii de prinpregiurul lui şi-i supusese, încât îşi întinsese hotarele împărăţiei sale pe unde a înţărcat dracul copiii, şi toţi împăraţii cei bătuţi era îndatoraţi a-i da câte un fiu d-ai săi ca să-i slujească câte zece ani."},{"id":"story-ro-v-duvele-2","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"Aşa e. Că de ne-om cântări cuvântul cu cântarul şi ne-om măsura privirea cu cotul, ori să numeri câte pahare de vin a băut omul la masa ta ca să nu-l înşeli la a lui, s-a dus prietenia pe copcă, c-aşa e făcută să fie dragostea, fără ştreang de gât şi fără căluş în gură."},{"id":"story-ro-aleodor-mp-rat-3","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"Pocitania pământului îi zise: – Toţi nelegiuiţii ce-mi calcă hotarul cad în robia mea. – Mai întâi trebuie să ştii, îi răspunse Aleodor, că din nebăgare de seamă şi fără de voia mea am călcat pe coprinsul tău, şi n-am nici un gând rău asupră-ţi."},{"id":"story-ro-cele-trei-rodii-aurite-2","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":217,"excerpt":"Un an de zile trecuse de când călătorea; ajunsese prin pustietăţi nelocuite de oameni, şi tot rătăcind în sus şi în jos, două rânduri de haine se rupseră şi le lepădase. Neştiind ce să facă, hotărî a mai merge câtva, şi dacă nu va putea descoperi nimic, să se întoarcă."},{"id":"story-ro-poveste-3","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"De se întâlneau, ea cu el, fiecare cu focul lui, se înţelegeau din ochi, deşi abia se mai vedeau, şi cu glas uscat se luau iute la harţă, parc-ar fi fost necăjiţi unul pe altul. – Ei, ce mai ai şi astăzi? – Măria-ta ce ai? – Ce să am, ale pustii de bătrâneţi."},{"id":"story-ro-capra-cu-trei-iezi-3","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":3,"genre":"folktale","wordCount":208,"excerpt":"Lupul, auzind aceste, se duse la un ferar şi puse să-i ascute limba şi dinţii, pentru a-şi subţia glasul, ş-apoi, întorcându-se, începu iar: Trei iezi cucuieţi Uşa mamei descuieţi! – Ei, vedeţi, zise iarăşi cel mare; dacă mă potrivesc eu vouă? Nu-i mămuca, nu-i mămuca! D-apoi cine-i dacă nu-i ea? Că doar şi eu am urechi! Mă duc să-i deschid."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
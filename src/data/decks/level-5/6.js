@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1142926","romanian":"Acum, vom arăta cum această lemă poate fi folosită în demonstrarea teoremei principale.","english":"Now, we show how this lemma can be used to prove our main theorem.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066559"},{"id":"tat-1136275","romanian":"Poți invita orice persoană dorești.","english":"You may invite any person you like.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963281"},{"id":"tat-1185251","romanian":"Te rog să te întorci de-ndată.","english":"Please come back at once.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328033"},{"id":"tat-1064200","romanian":"Fustele mini nu mai sunt la modă.","english":"Miniskirts have gone out of fashion.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066254"},{"id":"tat-5229148","romanian":"Poliția s-a uitat peste tot și nu a putut găsi nici o urmă a lui Tom.","english":"The police looked everywhere and could find no trace of Tom.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1090173","romanian":"Ai cărţi de citit?","english":"Do you have any books to read?","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1990492"},{"id":"tat-708940","romanian":"Preţurile vor creşte din ce în ce mai mult.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419499"},{"id":"tat-202","romanian":"Cultura romaneasca are radacini adanci in traditiile populare.","english":"Romanian culture has deep roots in folk traditions.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1057661","romanian":"L-au dat afară din discotecă fără nicio explicație.","english":"They kicked him out of the disco without any explanation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11037179"},{"id":"tat-1153871","romanian":"Voi face tot ce îmi stă în putere.","english":"I will do everything in my power.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099026"},{"id":"tat-407954","romanian":"Mașina mea e Ford, ca și a dumneavoastră.","english":"My car is a Ford, just like yours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525379"},{"id":"tat-10790200","romanian":"Tom are o cicatrice pe încheietura mâinii de când a încercat să se sinucidă.","english":"Tom has a scar on his wrist from when he tried to commit suicide.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136656","romanian":"Cina va fi servită la bordul avionului.","english":"Dinner will be served on board the plane.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966176"},{"id":"tat-1153757","romanian":"Ne te poți sinucide ținându-ți respirația.","english":"You cannot kill yourself by holding your breath.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5568104"},{"id":"tat-11622790","romanian":"Ieri l-am cunoscut pe unul dintre cei mai mari actori ai generației noastre.","english":"Yesterday I met one of the greatest actors of our generation.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185066","romanian":"Îți este interzis să intri în acest loc.","english":"You are banned from entering this place.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320722"},{"id":"tat-487280","romanian":"Am ratat ceva?","english":"Did I miss anything?","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270414"},{"id":"tat-1136946","romanian":"Sora mea a insistat să meargă cu mine.","english":"My sister insisted on going with me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957798"},{"id":"tat-1144314","romanian":"Deficitul de apă este din cauza vremii.","english":"The water shortage is due to the weather.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073464"},{"id":"tat-5205062","romanian":"Te gândești serios să urmezi o carieră ca pilot de mașini de curse?","english":"Are you seriously thinking about pursuing a career as a race car driver?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-balaurul-cel-cu-apte-capete","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":275,"excerpt":"A fost odată într-o ţară un balaur mare, nevoie de cap. El avea şapte capete, trăia într-o groapă, şi se hrănea numai cu oameni. Când ieşea el la mâncare, toată lumea fugea, se închidea în case şi sta ascunsă până ce-şi potolea foamea cu vreun drumeţ pe care îl trăgea aţa la moarte."},{"id":"story-ro-popa-duhu-3","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Vorba ceea: \"Geasta cu trepădatele, că nu-s departe satele\". Aci era la Socola, aci în Iaşi, aci la monăstirea şi în Târgul-Neamţului profesor, de unde cutriera munţii în sudoarea frunţii, şi mai la tot pasul cânta: Ruinata cetăţuie, ce acopere-acel munte, Şi de unde ochiul vede lucruri multe!"},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-c-lin-nebunul-2","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"A aruncat şi cel mijlociu şi tot aşa degrabă a ajuns. Da când a aruncat Călin Nebunul, a mers trei luni de zile, zi şi noapte, şi de-abia a ajuns. Acu ei, mergând pe drum, au gătit şi cremenea şi amnarul. De-abia au avut cu ce aţâţa oleacă de foc."},{"id":"story-ro-gura-satului","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Nu-i vorbă, răi sunt oamenii, încât mai răi nici n-ar putea să fie. Chiar și acela pe care toată lumea îl știe de bun își are ceasurile de răutate, și nu avem decât să-l atingem unde-l doare pentru ca să-l facem mai dârz decât alții. Dar nenea Mihu tot om bun rămâne."},{"id":"story-ro-ion-roat-i-cuza-vod-2","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Atâta-i ajungea capul, atâta făceau şi ei pe vremea lor, Dumnezeu să-i ierte şi să-i odihnească, unde-or fi acolo, că bună inimă mai aveau! Dar să ne întoarcem iar la Divanul ad-hoc."},{"id":"story-ro-pravoslavnicul-i-sl-ninile","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Era odată un biet creştin sărac şi c-o droaie de copii mărunţi. Toată avuţia lui era gura femeii şi a copiilor, care ţipau de fitece. Guri flămânde, şi pace bună! Poveşti de Barbu Ştefănescu Delavrancea - Pravoslavnicul şi slăninile Bietul creştin, ce făcu, ce drese, s-alese de sfântul crăciun c-un porc gras."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
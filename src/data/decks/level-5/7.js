@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-399609","romanian":"Bună dimineața la toată lumea.","english":"Good morning, everybody.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6325807"},{"id":"tat-1153874","romanian":"Ar trebui să facem tot ce putem.","english":"We should do our best.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099422"},{"id":"tat-698957","romanian":"Cine este autorul acestei cărți?","english":"Who is the author of this book?","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2970831"},{"id":"tat-584070","romanian":"Nu a fost deloc recunoscător fostului său profesor.","english":"He was not at all thankful to his former teacher.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262775"},{"id":"tat-712090","romanian":"Va trebui să facem ceva.","english":"We will have to do something.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440048"},{"id":"tat-6599793","romanian":"Ți-ar plăcea să vezi cu mine sâmbătă o interpretare live a unei piese?","english":"Would you like to see a live performance of a play with me Saturday?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136907","romanian":"Ai înţeles ce a zis?","english":"Did you understand what he said?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960213"},{"id":"tat-487304","romanian":"El a fost convins să fie mai rezonabil.","english":"He was persuaded to be more sensible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270699"},{"id":"tat-1153855","romanian":"A fost trimis la închisoare pentru furt.","english":"He was sent to jail for the robbery.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130115"},{"id":"tat-12319007","romanian":"Cronica unei morți anunțate este un roman al scriitorului columbian Gabriel García Márquez.","english":"Chronicle of a Death Foretold is a novel by the Colombian writer Gabriel García Márquez.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-923913","romanian":"Trebuie să încurajăm lumea să se alăture campaniei şi să lucreze cu noi.","english":"We have to encourage people to join the campaign and work with us.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681131"},{"id":"tat-706094","romanian":"Mi-am lăsat cheia in cameră.","english":"I left my key in my room.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/972152"},{"id":"tat-12328330","romanian":"Fiecare limbă care se stinge ia cu ea o bucată din istoria umană.","english":"Every language that dies out takes a piece of human history with it.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187050","romanian":"Multe companii de software oferă versiuni gratuite ale produselor lor, dar cu funcționalitate limitată.","english":"Many software companies offer free versions of their products, albeit with limited functionality.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1064424","romanian":"L-am văzut fugind.","english":"I saw him run away.","difficulty":3,"wordCount":3,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076207"},{"id":"tat-670639","romanian":"Naivul bărbat era extrem de stânjenit în prezenţa ei.","english":"The naive man was utterly embarrassed in her presence.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681128"},{"id":"tat-488759","romanian":"Această cameră nu este potrivită pentru dormit.","english":"This room is not suitable for sleeping.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268734"},{"id":"tat-1279014","romanian":"Toţi au fost amabili cu fata cea nouă.","english":"Everybody was kind to the new girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13353831"},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"},{"id":"tat-1143181","romanian":"Știa că nu va putea câștiga.","english":"He knew he could not win.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069238"}],"stories":[{"id":"story-ro-borta-v-ntului-3","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Omul a doua zi se scoală, ia măgarul şi se duce – acasă şi-i zice: măgar, fa bani! Măgarul, de unde? El apuc’ un druc şi ‘ncepe a dişăla măgarul. – Acu nu-l mai iert eu. Se porneşte să ‘ntâlnească pe moşneag şi s’ astupe borta vântului. Întâlneşte pe D-zeu."},{"id":"story-ro-neghini","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"A fost odată o babă, bătrână, bătrână. Abia zărea de bătrână ce era. Şi mâinile îi umblau la ciorap, iar în gândul ei se ruga la Dumnezeu s-o dăruiască cu un copil, că n-avea decât pe unchiaşul ei."},{"id":"story-ro-z-na-zorilor-3","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"De când a întrebat Petru de treaba ochilor, se părea cum că ochiul cel din stânga plânge mai puţin, iară cel de-a dreapta râde mai mult. Petru îşi întări inima şi mai merse o dată la împăratul. O palma e o palma şi două-s două! Gândi şi făcu. O păţi din nou, cum a mai păţit-o."},{"id":"story-ro-broasca-estoas-cea-fermecat","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"A fost odată un împărat, şi el avea trei feciori. Când le-a venit şi lor vremea de însurătoare, le-a zis împăratul: Poveşti de Petre Ispirescu - Broasca ţestoasă cea fermecată – Dragii mei copii, v-aţi făcut mari; mergeţi de vă căutaţi ursitele, ca să intraţi şi voi în rândul oamenilor."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-2","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":202,"excerpt":"Tot mergând şi minunându-mă, m-am pomenit către mijlocul grădinei. Aici era, ce să-ţi spui? frumuseţea de pe lume. Nişte cărări sucite şi cotite, acoperite cu un fel de iarbă mărunţică, de părea că erau nişte covoare aşternute."},{"id":"story-ro-povestea-lui-stan-p-itul-3","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"Ce-a mai fi şi asta? Alţii, că să te ferească Dumnezeu de femeia leneşă, mârşavă şi risipitoare; alţii alte năstruşnicii, încât nu ştii ce să crezi şi ce să nu crezi? Numai nu-i vorbă că am văzut eu şi destui bărbaţi mult mai ticăiţi şi mai chitcăiţi decât cea mai bicisnică femeie."},{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
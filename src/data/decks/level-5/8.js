@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-709907","romanian":"Gabriel este doar unul dintre îngerii Domnului.","english":"Gabriel is only one of the angels of God.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426741"},{"id":"tat-708957","romanian":"Acel copil are prieteni puțini.","english":"That child has few friends.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420267"},{"id":"tat-6838427","romanian":"Înainte de apariția antibioticelor, medicii aveau tratamente eficiente doar pentru un număr limitat de boli.","english":"Before the advent of antibiotics, physicians had effective treatments for but a handful of diseases.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064285","romanian":"Ce preferi, vin alb sau vin roșu?","english":"Which do you prefer, white wine or red wine?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11061322"},{"id":"tat-12001711","romanian":"Camera era în haos. Peste tot erau împrăștiate hârtii, scaunele răsturnate, iar fereastra s-a spart.","english":"The room was in chaos. Papers were strewn everywhere, chairs were overturned, and the window was shattered.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136569","romanian":"Prefer să locuiesc la țară decât la oraș.","english":"I prefer living in the country to living in the city.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9017538"},{"id":"tat-4961201","romanian":"Fii atent: în limba engleză scriem cu litere mari naționalitățile, zilele săptămânii și limbile străine.","english":"Be careful: We capitalize nationalities, days of the week, and languages in English.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192768","romanian":"Pentru ce ai cumpărat acest dicționar costisitor?","english":"What did you buy this expensive dictionary for?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357179"},{"id":"tat-698962","romanian":"Tu crezi că așa ceva este posibil?","english":"Do you think such a thing is possible?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3160552"},{"id":"tat-6595168","romanian":"Bob i-a spus lui Jane să nu se amestece în treburile sale personale.","english":"Bob told Jane not to interfere in his personal affairs.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064024","romanian":"De îndată ce m-a văzut a început să plângă.","english":"As soon as she saw me, she started to cry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10936810"},{"id":"tat-1136644","romanian":"Ieri și-a cumpărat Mary fusta.","english":"It was yesterday that Mary bought this skirt.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227743"},{"id":"tat-408053","romanian":"Am discutat deja cu studentul acesta.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232112"},{"id":"tat-1136616","romanian":"Toate invențiile apar din necesitate.","english":"All inventions grow out of necessity.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965950"},{"id":"tat-12697576","romanian":"Ești ăla care l-ai făcut pe tom sa facă aia?","english":"Are you the one who asked Tom to do that?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-708953","romanian":"Nimănui nu-i pasă de ceea ce crezi.","english":"Nobody cares what you think.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8418403"},{"id":"tat-1143158","romanian":"Rapida vulpe maronie nu a sărit peste câinele leneș.","english":"The quick brown fox did not jump over the lazy dog.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069001"},{"id":"tat-1192805","romanian":"Nu putem întreba nimic despre vârstă sau probleme fizice.","english":"We cannot ask anything about age or physical problems.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354070"},{"id":"tat-1143235","romanian":"De ce sunteți, băieți, așa de supărați?","english":"Why are you guys so angry?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068488"},{"id":"tat-1136899","romanian":"Sora mea va trebui să își termine temele înainte de a pleca la Hokkaido.","english":"My sister will have finished her homework before she goes to Hokkaido.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960229"}],"stories":[{"id":"story-ro-p-cal-n-satul-lui-2","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"– Măi! ziceau vecinele lui Păcală, ce lucru să mai fie şi ăsta? viţeaua asta le întrece pe toate! Ce-i va fi dând oare să mănânce? Ce soi o fi de creşte aşa de frumos?"},{"id":"story-ro-comoara-2","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"Iar dacă erau odată la han, nu puteau să macine-n sec: tot pe timpul cât stătuse-n oștire a luat Duțu și deprinderea de a nu-și trage, când n-are nevoie, nimic de la gură. De ce adecă muncea el toată săptămâna?!"},{"id":"story-ro-ileana-cea-ireat-2","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":205,"excerpt":"Când cei trei feciori ai împăratului vecin primiră vestea că împăratul a pornit în cale şi că s-a depărtat de acasă, ei se înţeleseră între sine şi încălecară, ca să meargă la cetatea cea cu trei fete de împărat să răpească credinţa fetelor şi să-i facă împăratului supărare."},{"id":"story-ro-porcul-cel-fermecat","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"A fost odată un împărat şi avea trei fete. Şi fiind a merge la bătălie, îşi chemă fetele şi le zise: Poveşti de Petre Ispirescu - Porcul cel fermecat – Iacă, dragele mele, sunt silit să merg la război. Vrăjmaşul s-a sculat cu oaste mare asupra noastră. Cu mare durere mă despart de voi."},{"id":"story-ro-z-na-z-nelor-3","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Mai se suci, mai se învârti să scape de pacoste, şi nu fu nici un chip. Dacă văzu şi văzu, se hotărî şi el a se duce acasă cu saxanaua în spinare şi o luă la drum. În cale, băgă de seamă că alte şase bufniţe se ţineau după dânsul."},{"id":"story-ro-aleodor-mp-rat-2","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Un lucru numai am să-ţi spui: Vezi tu muntele acela de colo, să nu te ducă păcatele să vânezi p-acolo, că este nevoie de cap. Acel munte este moşia lui Jumătate-de-om-călare-pe-jumătate-de-iepure-şchiop: şi cine calcă pe moşia lui, nu scapă nepedepsit. Acestea zicând, căscă gura de trei ori şi-şi dete sufletul."},{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
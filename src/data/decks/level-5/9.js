@@ -0,0 +1 @@
+export default {"level":5,"sentences":[{"id":"tat-1143187","romanian":"Tom pare a fi interesat de Mary.","english":"Tom seems to be interested in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069268"},{"id":"tat-1136918","romanian":"- A scris ieri o scrisoare? - Da.","english":"Did he write a letter yesterday? \"Yes, he did.\"","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960508"},{"id":"tat-6825116","romanian":"Artistul a pictat cele mai complicate picturi murale pe peretele vechi, de piatră.","english":"The artist painted the most intricate of murals on the old stone wall.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-709044","romanian":"De-abia plecasem de acasă când a început ploaia.","english":"I had scarcely left home when it began to rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420334"},{"id":"tat-9586394","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosit ca să gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1124701","romanian":"Tortul are un gust dulce.","english":"The cake tastes sweet.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11873968"},{"id":"tat-1064374","romanian":"Tom a cerut-o în căsătorie pe Mary.","english":"Tom asked Mary to marry him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074440"},{"id":"tat-2534180","romanian":"Isadora Duncan a dansat cu atâta grație încât a fost invitată să danseze în Europa.","english":"Isadora Duncan danced with such grace that she was invited to dance in Europe.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-487312","romanian":"Eram în căutarea unei locuințe de închiriat.","english":"I was on the hunt for lodgings.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7006421"},{"id":"tat-670678","romanian":"Poţi s-o alegi pe care o vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200736"},{"id":"tat-863737","romanian":"Cheltuiește bani și bucură-te de viață!","english":"Spend money and enjoy life!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9086244"},{"id":"tat-1136846","romanian":"Tom voia un creion cu mină moale.","english":"Tom wanted a pencil with a softer lead.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966269"},{"id":"tat-2536658","romanian":"Trecutul poate fi doar cunoscut, nu schimbat. Viitorul poate fi doar schimbat, nu cunoscut.","english":"The past can only be known, not changed. The future can only be changed, not known.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136854","romanian":"Aș face altfel decât ai făcut tu.","english":"I would do it in a different way than you did.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966286"},{"id":"tat-2568457","romanian":"Oamenii care iubesc nu se îndoiesc de nimic sau pun la îndoială totul.","english":"People who love doubt nothing, or doubt everything.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136511","romanian":"Mă simt îndatorată moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965107"},{"id":"tat-610863","romanian":"Acest suc are gust acru.","english":"This juice tastes sour.","difficulty":3,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/692737"},{"id":"tat-706150","romanian":"Am găsit camera goală.","english":"I found the room empty.","difficulty":3,"wordCount":4,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974744"},{"id":"tat-203","romanian":"Cu cat inveti mai mult, cu atat realizezi cat de putin stii.","english":"The more you learn, the more you realize how little you know.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1136737","romanian":"S-a dus în Italia cu gândul să studieze literatura.","english":"He went to Italy with a view to studying literature.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966251"}],"stories":[{"id":"story-ro-fata-mo-ului-cea-cuminte-2","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Când, tocmai când era să se dea jos, zări spre răsărit abia licărind o mititică vâlvotaie; se coborî de pe acoperiş şi o luă într-acolo. Se duse, se duse şi la foc nu mai ajunse; dară în drumul ei întâlni o grădină părăginită, care o strigă zicându-i: – Fată mare, fată mare!"},{"id":"story-ro-uer-3","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Kira, zâmbind, răspunde: – Ăl de sus e umbra, mamă; din aşa caier trag ursitorile firul vieţilor de nimic. – Şi de se rupe firul tău, fusul cu tort cade; dar de s-ar rupe firul de umbră, cade şi fusul de pe grinzi?"},{"id":"story-ro-departe-departe-2","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Apoi auzii o uşă trântindu-se, şi alta, şi alta, încet, mai încet, mai încet, până nu ştiu bine dacă mai auzeam sau mi se părea. A cui să fie umbra? Vreo stafie? Înăuntru plânge cineva… se roagă, a leşinat… nu se mai aude. E întuneric. Mi se bate inima. De n-ar fi stafie! Şi ameţii pe marginea lacului."},{"id":"story-testament","title":"Testament","author":"Tudor Arghezi","difficulty":7,"genre":"poetry","wordCount":130,"excerpt":"Nu-Loss'nti voi lasa drept mostenire, fiule, Nici ogoare largi, nici case inalte, Ci doar un nume curat si-Loss'n suflet Cuvinte multe, frumoase si sfinte. Cartea pe care o scriu e toata viata mea, Fiecare litera e o suferinta, Fiecare pagina e o bucurie, Si fiecare rand e o nadejde."},{"id":"story-ro-povestea-lui-harap-alb","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Amu cică era odată într-o ţară un crai, care avea trei feciori. Şi craiul acela mai avea un frate mai mare, care era împărat într-o altă ţară, mai depărtată. Şi împăratul, fratele craiului, se numea Verde-împărat; şi împăratul Verde nu avea feciori, ci numai fete."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat şi o împărăteasă; ei nu făceau copii; umblase pe la toţi vracii şi vrăjitorii, pe la toate babele şi cititori de stele, şi toţi rămaseră de ruşine, căci n-avură ce le face."},{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
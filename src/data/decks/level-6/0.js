@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-406046","romanian":"Ți-aș oferi o cafea dacă ai timp.","english":"I would offer you a coffee if you had the time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6554810"},{"id":"tat-7187050","romanian":"Multe companii de software oferă versiuni gratuite ale produselor lor, dar cu funcționalitate limitată.","english":"Many software companies offer free versions of their products, albeit with limited functionality.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136758","romanian":"N-am văzut nici măcar un meci.","english":"We did not see a single game.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966190"},{"id":"tat-584785","romanian":"Seara el iese în oraș să bea ceva.","english":"At night he goes out in the city to drink something.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812845"},{"id":"tat-1048538","romanian":"La început a făcut Dumnezeu cerul și pământul.","english":"In the beginning God created the heavens and the earth.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10934554"},{"id":"tat-5236279","romanian":"L-am întrebat pe Tom dacă el o poate avea gata până la 2:30.","english":"I asked Tom if he could have it ready by 2:30.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153151","romanian":"Trebuie să ne trezim devreme mâine dimineață?","english":"Do we have to get up early tomorrow morning?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692258"},{"id":"tat-1124704","romanian":"Dicţionarul de pe birou este al meu.","english":"The dictionary on the desk is mine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11875296"},{"id":"tat-1136572","romanian":"A trecut pe lângă mine fără să mă observe.","english":"He went by me without noticing me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965942"},{"id":"tat-406035","romanian":"Îți plăcea să mergi la expoziții în România?","english":"Did you enjoy going to exhibits in Romania?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350460"},{"id":"tat-1056666","romanian":"Ce trebuie să conțină un mic dejun sănătos?","english":"What should a healthy breakfast consist of?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031158"},{"id":"tat-6637595","romanian":"Din punctul de vedere al designului arhitectural, pot exista mai multe alternative cu privire la această abordare.","english":"From the standpoint of architectural design, there can be more alternatives to this approach.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-702061","romanian":"El a ţinut un jurnal în timpul călătoriei.","english":"He kept a diary during the trip.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398898"},{"id":"tat-10313164","romanian":"Algeria ar trebui să devină cea mai sigură țară din Africa de Nord.","english":"Algeria should become the safest country in North Africa.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1064411","romanian":"Îmi aduc aminte de ce a spus el.","english":"I remember what he said.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075722"},{"id":"tat-1143136","romanian":"- 99 copeici, a declarat Dima cu mândrie. Am nevoie de 99 copeici.","english":"99 kopeks, Dima stated proudly. \"I need 99 kopeks.\"","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068904"},{"id":"tat-11651384","romanian":"Limba română este mai puțin asemănătoare cu portugheza, spaniola, italiana și franceza decât am crezut.","english":"Romanian is less similar to Portuguese, Spanish, Italian, and French than I thought.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11674204","romanian":"Prima mea profesoară se numea Iracema. Iracema este, de asemenea, numele uneia dintre surorile mele.","english":"My first teacher was called Iracema. Iracema is also the name of one of my sisters.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-inul-i-c-me-a","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Inul: – Ştii tu, cămeşă dragă, ce erai odată? Poveşti de Ion Creangă - Inul şi cămeşa – Ce să fiu? Eram ceea ce mă vezi: cămeşă albă, cu care se îmbracă oamenii. – Nu-i aşa!"},{"id":"story-ro-f-t-frumos-cel-r-t-cit-2","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Ea priimi mărul cu bucurie. Şi după ce plecă bărbatul în trebile sale, se aşeză pe pragul uşei, curăţi mărul şi-l mâncă. Iepşoara ieşise şi ea din grajd, şi veni la stăpână-sa, că era învăţată la traista cu grăunţe."},{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-z-na-mun-ilor-2","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"După ce veniră filosofii, învăţă şi de la dânşii câte în lună şi în soare. Bucuria tatălui său era aşa de mare unde vedea că fiu-său are să fie procopsit ca nici unul din fiii de împăraţi, încât se uita la dânsul ca la soare. Iară el de ce se mărea d-aia se făcea mai cu minte şi mai frumos."},{"id":"story-ro-ho-u-mp-rat-3","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":216,"excerpt":"De aceea, fătul meu, te-am dat să înveţi toate meşteşugurile. Nu mi-a venit în gând că şi hoţia este un meşteşug. Aceasta îţi rămâne să mai înveţi, după care te vei face un împărat ca Solomon împărat şi cum altul nu va mai fi pe lume. – Ii!"},{"id":"story-ro-sult-nica","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sultănica D-a stânga Râului Doamnei, razna de satul Domneşti, se vede o casă, albă ca laptele, cu ferestrele încondeiate cu roşu şi albastru."},{"id":"story-ro-rodul-tainic-3","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Iară dânsa era Mama Vânturilor. Seara, după ce s-a întors, fiul ei a simţit miros de om pământean. – Simt boare de om, zise el mumei sale. Cine a venit şi în ce treburi umblă? Ea îi spuse ce şi cum, toate din fir a păr, precum le aflase de la Danciu."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-670678","romanian":"Poţi s-o alegi pe care o vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200736"},{"id":"tat-924384","romanian":"Ea vrea să închidă mica sa afacere.","english":"She wants to wind up her small business.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735381"},{"id":"tat-2536248","romanian":"Dacă aș vrea să te sperii, ți-aș spune ce am visat acum câteva săptămâni.","english":"If I wanted to scare you, I would tell you what I dreamt about a few weeks ago.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-584098","romanian":"O traducere e ca o femeie. Dacă e frumoasă, nu e fidelă. Dacă e fidelă, nu este cu siguranţă frumoasă.","english":"Translation is like a woman. If it is beautiful, it is not faithful. If it is faithful, it is most certainly not beautiful.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7802396"},{"id":"tat-1136387","romanian":"Fără gravitație, am fi aruncați în spațiu.","english":"Without gravity we would be hurled off into space.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962828"},{"id":"tat-13063081","romanian":"Puii au evoluat din alte păsări care au depus ouă, așa că oul a fost primul.","english":"Chickens evolved from other birds that laid eggs, so the egg came first.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-709928","romanian":"Această maşină a fost făcută in Japonia.","english":"This car was made in Japan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424464"},{"id":"tat-1153157","romanian":"O asemenea abilitate este nativă pentru el.","english":"Such ability is native to him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749170"},{"id":"tat-584344","romanian":"Bună ziua, cum vă pot fi de folos?","english":"Good day, how may I help you?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7797080"},{"id":"tat-9622587","romanian":"Atât Tom, cât și eu am vrut să mergem în Australia cu Mary.","english":"Both Tom and I wanted to go to Australia with Mary.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1056757","romanian":"Spre deosebire de fratele ei, Sienna este foarte introvertită.","english":"Unlike her brother, Sienna is very introverted.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031405"},{"id":"tat-1185178","romanian":"Mă durea inima pentru păsările aflate pe moarte.","english":"My heart ached for the dying birds.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324325"},{"id":"tat-13598707","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singur.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143262","romanian":"A profitat de ignoranța mea și m-a înșelat.","english":"He took advantage of my ignorance and deceived me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068634"},{"id":"tat-10242320","romanian":"Arătau și aveau gust de creveți, dar vă pot asigura că aceia nu erau creveți adevărați.","english":"They looked and tasted like shrimps, but I can assure you those were not real shrimps.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144325","romanian":"Un adevărat gentilom nu își trădează niciodată prietenii.","english":"A true gentleman never betrays his friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073607"},{"id":"tat-1138032","romanian":"Ar fi fost mai bine să nu te fi dus acolo.","english":"You had better not have gone there.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1138114","romanian":"Nu trebuie să citești o asemenea revistă pentru că îți va face rău.","english":"You must not read such a magazine, as it will do you harm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-488759","romanian":"Această cameră nu este potrivită pentru dormit.","english":"This room is not suitable for sleeping.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268734"}],"stories":[{"id":"story-ro-fata-mo-ului-2","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":238,"excerpt":"– Puricele. – Eh! grăi moş Doroftei cam supărat, am să v-astup cloanţa la toate. Ghiciţi acuma, de vă taie capul, de nu, să-l tăiaţi voi pe el: Din pulpă născută, pe claie aruncată, de vultur răpită, de babă robită, la domnie-ajunsă, de ţigancă tunsă: călugăraş mă făcui. Ce să fie? Ce să fie?"},{"id":"story-sara-pe-deal","title":"Sara pe deal","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":110,"excerpt":"Sara pe deal buciumul suna cu jale, Turmele-Loss'n vin, umpland carari si cale, Sufletul meu arde-n iubire ca para, Tu esti departe. Foarte departe, sufletul meu te cheama, Stelele-Loss'n cer scapara-n neagra ceama, Inima mea te asteapta cu dor, Tu nu mai vii."},{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-ro-fata-cu-pieze-rele","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":260,"excerpt":"A fost odată un împărat. El avea doisprezece feciori. Când se punea la masă, copiii stau împrejuru-i cunună deplină. El era totdauna cu voie-bună, fiindcă vedea că trebile îi merg strună. Poveşti de Petre Ispirescu - Fata cu pieze rele Împăraţii, vecinii lui, râvnea la traiul lui cel ticnit."},{"id":"story-ro-palatul-de-cle-tar","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":225,"excerpt":"Cam pe la începutul vremilor, până unde praştia minţii nu azvârle, se povesteşte, aşa, ca din scorneală, că omul era croit din alte foarfeci şi cioplit din altă bardă."},{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-2","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":215,"excerpt":"Căzu în genunche şi se rugă lui Dumnezeu, şi o! minune! deodată răsări, măre, dintr-un colţ al chiliei sale o viţă, şi numaidecât crescu şi se înălţă, până la streaşina casei."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136841","romanian":"Conducătorii de autobuze vor face grevă astăzi.","english":"The bus drivers are going on strike today.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966685"},{"id":"tat-1059636","romanian":"Ieri am stat într-o întâlnire.","english":"Yesterday I was in a meeting.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9557120"},{"id":"tat-1143215","romanian":"Vreau să cumpăr un procesor de text.","english":"I want to buy a word processor.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070006"},{"id":"tat-1143283","romanian":"Ar fi trebuit să ai curajul să spui deschis ce crezi că este corect.","english":"You ought to have the courage to speak out what you believe to be right.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068669"},{"id":"tat-12517381","romanian":"Igor a descoperit o urmă de bocanc în niște noroi moale, nu departe de cortul său.","english":"Igor discovered a bootprint in some soft dirt not far from his tent.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7187074","romanian":"Aceasta este prima dată când guvernul a efectuat o anchetă la nivel național, privind sinuciderile.","english":"This is the first time the government has done a nationwide investigation regarding suicides.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153754","romanian":"N-am întârziat niciodată la școală mai înainte.","english":"I had never been late for school before.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2639577"},{"id":"tat-1136946","romanian":"Sora mea a insistat să meargă cu mine.","english":"My sister insisted on going with me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957798"},{"id":"tat-11790112","romanian":"Dacă această echipă continuă să joace atât de prost, va fi retrogradată din nou.","english":"If this team continues to play this badly, it will be demoted again.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-408052","romanian":"Am discutat deja cu acest student.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232108"},{"id":"tat-6673370","romanian":"Este posibil să crezi că, comentariul tău a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136408","romanian":"Chemați-mă dacă aveți nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962822"},{"id":"tat-1136823","romanian":"Puteam să alerg mult mai rapid când eram tânăr.","english":"I could run much faster when I was young.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966296"},{"id":"tat-708940","romanian":"Preţurile vor creşte din ce în ce mai mult.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8419499"},{"id":"tat-5025296","romanian":"Cred că ar trebui să îi spui lui Tom ceea ce el vrea să știe.","english":"I think you should tell Tom what he wants to know.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064097","romanian":"La momentul accidentului aproape toți călătorii din autobuz dormeau.","english":"At the time of the accident, almost all of the passengers on the bus were sleeping.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11071031"},{"id":"tat-1136714","romanian":"Destul de curând a venit un excavator care a tăiat un drum prin dealul acoperit cu margarete.","english":"Pretty soon along came a steam shovel and dug a road through the hill covered with daisies.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226376"},{"id":"tat-10787417","romanian":"Una dintre fetițe s-a oprit și s-a întors să se uite la mine.","english":"One of the little girls stopped and turned back to look at me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-928490","romanian":"Oamenii deștepți știu cum să facă bani din orice.","english":"Clever people know how to make money out of nothing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5131666"}],"stories":[{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-2","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":214,"excerpt":"Făt-Voinic, feciorul de împărat. Focul cailor se stâmpără în zărirea celor trei surori şi călăreţii deteră în pas mai încetişor, până ce, veniţi şi sosiţi, se simţiră duşi."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-2","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":232,"excerpt":"Se spetise bietul om muncind, şi să salte şi el ceva, te-aşi! câtuşi de cât! ferit-a sântul! Ba până într-atâta ajunsese, încât să-l împingă păcatele să se gândească ca să-şi facă seama singur, vezi că dracul n-are de lucru, el nu face biserici ori puţuri pe la răspântii."},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."},{"id":"story-ro-frumoasa-lumii-3","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":221,"excerpt":"În a treia duminică, când a dus oul, a pus pe gânduri pe jidan. Şi s-a gândit aşa jidanul: l-a întrebat unde şede, să se ducă să vadă de unde are el ouă de aur. Vine jidanul; da’ el ţinea cuşca în colţul casei. Cum a intrat jidanul în casă – el ştia carte – odată şi-aruncă ochii-n fundul casei."},{"id":"story-ro-stan-bolovan-3","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"Aflând Stan că anul e de trei zile, iar simbria de şapte saci de galbeni pe zi, se învoi şi plecă cu zmeul. Ajunseră nu departe de casă, iar Stan o zări pe mama zmeului, bătrână şi groaznică la vedere."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"A fost odată un băiat. El, de la naşterea lui, se pomenise bubos. Ce n-a făcut el ca să se cureţe de bube? dară în deşert. Băieţii la joc şi fetele la horă îl huiduia şi fugeau de dânsul ca de o lepră."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
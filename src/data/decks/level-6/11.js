@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-5227954","romanian":"Însoțitoarea de zbor l-a zgâlțâit pe Tom ca să-l trezească și i-a spus că avionul aterizase.","english":"The flight attendant shook Tom awake and told him that the plane had landed.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536699","romanian":"Într-un dicționar ca acesta ar trebui să existe cel puțin două propoziții cu „frigider”.","english":"In a dictionary like this one there should be at least two sentences with \"fridge\".","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136918","romanian":"- A scris ieri o scrisoare? - Da.","english":"Did he write a letter yesterday? \"Yes, he did.\"","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960508"},{"id":"tat-1192817","romanian":"Tom își dorea să fi fost mai atent.","english":"Tom wished he had been more careful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356244"},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-2568483","romanian":"E mai ușor să te dai la oameni pe Internet decât pe stradă.","english":"It is easier to hit on people on the Internet than in the street.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11639745","romanian":"Cum poate fi numită această Putere care a creat viața, timpul și atâtea trilioane de stele?","english":"What can be called this Power that created life, time and so many trillions of stars?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-476863","romanian":"Te rugăm să fii politicos.","english":"Please be polite.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5601925"},{"id":"tat-923852","romanian":"Cea mai bună prietenă a mea Felicja este aici.","english":"My best friend Felicja is here.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442763"},{"id":"tat-5157262","romanian":"Un om egoist nu se gândește la nimic altceva decât la propriile sale sentimente.","english":"A selfish man thinks of nothing but his own feelings.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10827564","romanian":"Am găsit un portofel pe jos și i l-am dat agentului de pază.","english":"I found a wallet on the ground and gave it to the security guard.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-864492","romanian":"Când am sunat, el deja plecase.","english":"When I called, he had already set off.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6872543"},{"id":"tat-1153807","romanian":"I-am văzut mașina făcând la dreapta.","english":"I saw his car make a turn to the right.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128946"},{"id":"tat-4993395","romanian":"Creșterea cererii pentru cafeaua de înaltă calitate a ajutat la mărirea prețului cafelei.","english":"Greater demand for high-quality coffee has helped drive coffee prices higher.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-923926","romanian":"Ce fel de lucruri te întristează?","english":"What sort of things make you feel sad?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/805469"},{"id":"tat-1192741","romanian":"Tom a avut vremuri grele anul trecut.","english":"Tom had a rough time last year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511264"},{"id":"tat-1136840","romanian":"Tom consideră că Mary e o eroină.","english":"Tom considers Mary to be a heroine.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966335"},{"id":"tat-862826","romanian":"Mai bine mor de foame decât să fur.","english":"I would rather starve than steal.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014504"},{"id":"tat-4961192","romanian":"Ai putea să o spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-706007","romanian":"Ascultându-l pe Mahler, Lyusya se gândea mereu la moarte şi la viaţa eternă.","english":"Listening to Mahler, Lyusya would always think of death and life eternal.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968825"}],"stories":[{"id":"story-ro-p-dureanca","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":214,"excerpt":"Fă trei cruci și zi „Doamne-ajută!” când treci pragul casei, fie ca să ieși, fie ca să intri, căci lumea din întâmplări se alcătuiește, iar întâmplarea e noroc ori nenorocire, și nimeni nu știe dacă e rău ori bun ceasul în care a pornit, nici dacă va face ori nu ceea ce-și pune de gând."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată un împărat şi o împărăteasă. Amândoi erau oameni de treabă şi frumoşi. Ei se iubeau, nevoie mare! Dară erau tot mâhniţi şi amărâţi că nu făceau copii. Toate leacurile ce luase împărăteasa de pe la vraci şi vrăjitoare nu-i folosise întru nimic."},{"id":"story-ro-hagi-tudose","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":229,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Hagi-Tudose Dincolo de „Crucea de piatră”, de-a stânga Şoselei Vitanului, se ridică biserica „Sfânta Troiţa”. Mândreţe de biserică. Ce zugrăveli, pe dinăuntru şi pe dinafară, cum arar se mai pomenesc numai la bisericile din vechime."},{"id":"story-ro-fata-babei-i-fata-mo-neagului","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":251,"excerpt":"Erau odată un moşneag şi-o babă; şi moşneagul avea o fată, şi baba iar o fată. Fata babei era slută, leneşă, ţâfnoasă şi rea la inimă; dar, pentru că era fata mamei, se alinta cum s-alintă cioara-n laţ, lăsând tot greul pe fata moşneagului. Fata moşneagului însă era frumoasă, harnică, ascultătoare şi bună la inimă."},{"id":"story-ro-broasca-estoas-cea-fermecat-2","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":230,"excerpt":"Luă şi dânsul nişte haine, numai să nu zică nescine că nu s-a gătit, şi de cheltuială ce pe apă nu curge, şi plecă şi el, ştii, cam în dorul lelii. Dară unde să se ducă? Nici el, iacă, nu ştia."},{"id":"story-ro-spaima-zmeilor-3","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Şi toţi erau mărunţi, care de care mai mic decât cellalt, mai sfredeluş, mai guraliv, mai drăcos şi – asta să nu uităm – mai mâncăcios şi mai hapsân. – Aoleo! zise femeia, care se bălăbănea cu ei. Ăştia-mi scot sufletul şi-mi mănâncă şi urechile. Cine m-a pus să mă tot milogesc?!"},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1159828","romanian":"Casa lui e plină de lucruri utile.","english":"His house is full of convenience.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12167796"},{"id":"tat-6918482","romanian":"Am fost prea ocupat să-l ajut pe Tom ca să o mai ajut și pe Mary.","english":"I was too busy helping Tom to help Mary.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136593","romanian":"Am reușit să trec examenul.","english":"I was able to pass the exam.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966064"},{"id":"tat-709017","romanian":"De ce îţi sunt urechile atât de mari?","english":"Why are your ears so big?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420299"},{"id":"tat-11657708","romanian":"Obișnuia să cumpere șoricei albi pentru ca boa constrictor-ul ei să-i ucidă și să-i mănânce.","english":"She used to buy white mice for her boa constrictor to kill and eat.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13619031","romanian":"Dumneavoastră nu sunteți o picătură în ocean, ci sunteți întregul ocean într-o picătură.","english":"You are not a drop in the ocean, you are the entire ocean in a drop.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583827","romanian":"În fiecare duminică după-amiaza merg la târg.","english":"Every Sunday afternoon, I go to the bazaar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1913109"},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9735774","romanian":"Am folosit lămâile pe care Tom mi le-a dat pentru a face limonadă.","english":"I used the lemons that Tom gave me to make lemonade.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153871","romanian":"Voi face tot ce îmi stă în putere.","english":"I will do everything in my power.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099026"},{"id":"tat-670649","romanian":"Când aduni trei cu patru, obţii şapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974575"},{"id":"tat-670629","romanian":"A abandonat visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1626134"},{"id":"tat-208","romanian":"Trebuie sa gandim pe termen lung, nu doar pe moment.","english":"We must think long-term, not just for the moment.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-2034608","romanian":"Precum a demonstrat din abundenţă George Bush, a fi președintele Statelor Unite necesită doar o inteligență moderată.","english":"As George Bush has amply demonstrated, being president of the U.S. requires only a modicum of intelligence.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-11622790","romanian":"Ieri l-am cunoscut pe unul dintre cei mai mari actori ai generației noastre.","english":"Yesterday I met one of the greatest actors of our generation.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136509","romanian":"Sunt de acord să merg cu el.","english":"I agree to go with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965688"},{"id":"tat-11673611","romanian":"A doua mea învățătoare la școala primară (1941) a fost o frumoasă blondă pe nume Helena.","english":"My second primary school teacher (1941) was a beautiful blonde named Helena.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136667","romanian":"Tom a avut ceva probleme la ajustarea setărilor.","english":"Tom had a little trouble adjusting the settings.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227163"},{"id":"tat-923822","romanian":"Astăzi profesorul a ales ca subiect \"cultura chinezească\".","english":"Today the teacher chose \"Chinese culture\" as a topic.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10433149"},{"id":"tat-1143285","romanian":"Am crezut că va veni curând.","english":"I thought he would come soon.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068675"}],"stories":[{"id":"story-ro-p-dureanca-2","title":"Pădureanca","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Simțind apropierea timpului de secere, pădurile se pun în mișcare colibă cu colibă, sat cu sat se adună, văile pornesc întregi spre câmpia întinsă, și în câteva zile cât ține locul din Mureș până în părțile Orăzii și până la izvoarele Crișurilor nu mai rămân prin sate decât moșnegii neputincioși, babele bătrâne și copiii nevârstnici; setea de viață îi ia și-i duce pe toți la sărbătoarea cea mare ce se ține în fieștecare an o dată pentru împărțirea pânei de toate zilele."},{"id":"story-ro-rodul-tainic","title":"Rodul tainic","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"A fost odată un împărat, şi-n curtea acelui împărat se afla un pom atât de înalt, încât nimeni nu era în stare să-i vadă vârful. Pomul acesta înflorea şi dădea rod în fiecare an, dar nici împăratul, nici curtenii lui, nici vreun alt om pământean n-a apucat să vadă poamă din rodul acela."},{"id":"story-ro-coto-man-n-zdr-vanu","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată o pereche de oameni. Ei n-aveau copii. Într-o zi, fiind cu voie bună, zise bărbatul către femeie: Poveşti de Petre Ispirescu - Cotoşman năzdrăvanu – Soro, de la mila lui Dumnezeu noi n-avem copii. Să mergem pe câmp şi ce vom găsi, aceea să ne fie copil. – Bine zici dumneata, frate."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-2","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Băiatul lui i-o spus: iaca, tată, din ce pricină. Şi omul s-o sfătuit cu mama fetei, s-o prăpădească din pricina asta. Au tocmit un om, ş-au pus pe fată ‘n căruţă ş-au zis s-o ducă ‘ntr-o pustietate, şi să-i scoată ochii amândoi să-i aducă tătâne-său. Omul a luat-o. După fată se ţinea ş-un căţeluş."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-2","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":221,"excerpt":"Pentru aceasta ele ca să arate că nu le pasă de nebăgarea lui de seamă, între ele, îl porocleau cu numele de Făt-Frumos al satului. Şi de unde să nu fie aşa!"},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-3","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Era o vâlcea împodobită cu fel de fel de floricele, toate înflorite, de părea că dă ghes omului să treacă printre ele."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-4987505","romanian":"După ce s-a despărțit de ea, Simon s-a îndepărtat fără să se uite înapoi.","english":"After splitting up with her, Simon walked away without looking back.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-708932","romanian":"Cred că am o carie.","english":"I think I have a cavity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398620"},{"id":"tat-2534180","romanian":"Isadora Duncan a dansat cu atâta grație încât a fost invitată să danseze în Europa.","english":"Isadora Duncan danced with such grace that she was invited to dance in Europe.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568457","romanian":"Oamenii care iubesc nu se îndoiesc de nimic sau pun la îndoială totul.","english":"People who love doubt nothing, or doubt everything.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5179395","romanian":"Doar ca să te menții în viață este suficient de greu în aceste timpuri.","english":"Just staying alive in these times is hard enough.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923884","romanian":"Am petrecut toată seara dansând împreună.","english":"We spent all evening dancing together.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10444876"},{"id":"tat-584070","romanian":"Nu a fost deloc recunoscător fostului său profesor.","english":"He was not at all thankful to his former teacher.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262775"},{"id":"tat-7192998","romanian":"Moartea prematură a soției mele, a tras cortina peste 50 de ani de mariaj fericit.","english":"The untimely death of my wife has brought down the curtain on over 50 years of happily married life.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-864477","romanian":"Pe câinele nostru l-am numit White.","english":"We named our dog White.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6817260"},{"id":"tat-698918","romanian":"Nu are nimic a face cu mine.","english":"That has nothing to do with me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1802122"},{"id":"tat-1192747","romanian":"Te rog du-te la Departamentul de Chirurgie.","english":"Please go to the Surgery Department.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/289686"},{"id":"tat-1059700","romanian":"Sper să merg în Canada anul viitor.","english":"I hope to go to Canada next year.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795786"},{"id":"tat-708979","romanian":"În cartierul meu a fost un mare incendiu.","english":"There was a big fire in my neighborhood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420379"},{"id":"tat-406033","romanian":"Îmi face plăcere să merg pe jos.","english":"I like to walk.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350454"},{"id":"tat-1288424","romanian":"Cei care folosesc furculița s-au aflat din punct de vedere istoric mereu în minoritate.","english":"Fork-users have historically been in the minority.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1064267","romanian":"Ce fel de mâncare îi place lui Tom?","english":"What kind of food does Tom like?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11064842"},{"id":"tat-411878","romanian":"Îmi spăl mașina în fața casei fără probleme.","english":"I wash my car in front of the house without any problems.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271996"},{"id":"tat-223","romanian":"Diversitatea culturala contribuie la imbogatirea societatii noastre.","english":"Cultural diversity contributes to the enrichment of our society.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-5165096","romanian":"Când vaca zboară la înălțime și boul zboară aproape de sol, probabil că este o tornadă.","english":"When the cow flies high and the ox flies low, there probably is a twister.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6764266","romanian":"Pompierii voluntari au luptat împotriva vâlvătăii cu mult curaj, dar cu puțină considerație pentru propria lor siguranță.","english":"The volunteer firefighters fought the blaze bravely, with scant regard for their own safety.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-stan-bolovan-2","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":217,"excerpt":"Acolo află că un zmeu vine în fiecare noapte şi le ia câte trei oi, dar şi laptele de la şaptezeci şi şapte de oi, pe care îl ducea zmeoaicei bătrâne, să se scalde în el ca să întinerească."},{"id":"story-ro-la-crucea-din-sat-2","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Un nou hohot îl trezește și pe el din astă nepăsare. Ileana a făcut o cunună de pene cu coada dindărăt și a pus-o pe nesimțite în capul lui Bujor. Bujor a simțit, dar se face a nu fi simțit, fiindcă-i place să vadă pe Ileana râzând. Toți râd cu hohot, râde mai ales Ileana."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"},{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."},{"id":"story-ro-finul-lui-dumnezeu-3","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":210,"excerpt":"S-o vârât sub aripa lui şi nu s-a văzut. S-aude un vuiet mare; vine pajera. Pajera era mama vântului. – Dragii mamei nu v-a mâncat! – Finul lui D-zeu ne-a scăpat. – Unde-i să-l mănânc de bucurie. – Mă rog, mamă, dacă l-ăi mânca să-l faci înapoi. – Da unde-i? – Îi la răsărit."},{"id":"story-ro-popa-duhu-3","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Vorba ceea: \"Geasta cu trepădatele, că nu-s departe satele\". Aci era la Socola, aci în Iaşi, aci la monăstirea şi în Târgul-Neamţului profesor, de unde cutriera munţii în sudoarea frunţii, şi mai la tot pasul cânta: Ruinata cetăţuie, ce acopere-acel munte, Şi de unde ochiul vede lucruri multe!"},{"id":"story-ro-fata-babei-i-fata-mo-neagului-2","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Atunci fata babei, vicleană cum era, lua ciurul şi fuga în casă la babă şi la moşneag, spunând că ea a tors acele fuse. În zadar fata moşneagului spunea în urmă că acela este lucrul mâinilor sale; căci îndată o apucau de obraz baba şi cu fiică-sa şi trebuia numaidecât să rămâie pe-a lor."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-12151855","romanian":"Mi-am pierdut portofelul cu niște bani, buletinul de identitate și cardul de student.","english":"I lost my wallet with some money, my ID, and my student card.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862770","romanian":"Bunicului meu ii place sa meargă.","english":"My grandfather likes to walk.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014569"},{"id":"tat-1136809","romanian":"Care e mai veche, această carte sau cealaltă?","english":"Which is older, this book or that one?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966358"},{"id":"tat-13612831","romanian":"Tom a spus că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1153836","romanian":"Ar trebui să fi terminat până acum.","english":"He should have finished it by now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130096"},{"id":"tat-488766","romanian":"Nu toate browserele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268767"},{"id":"tat-1192694","romanian":"Mergi drept înainte până ajungi la biserică.","english":"Go straight ahead until you reach the church.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/678764"},{"id":"tat-1064018","romanian":"El a început să se scuze.","english":"He began to make excuses.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10918528"},{"id":"tat-1153868","romanian":"A fost deschizător de drumuri în acest domeniu.","english":"She was a pioneer in this field.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098377"},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4694533","romanian":"Lunile anului sunt: ianuarie, februarie, martie, aprilie, mai, iunie, iulie, august, septembrie, octombrie, noiembrie, decembrie.","english":"The months of the year are: January, February, March, April, May, June, July, August, September, October, November, December.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7707602","romanian":"Ei nu mai aveau mere, așă că am cumpărat niște banane în schimb.","english":"They were all out of apples, so I bought some bananas instead.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13616959","romanian":"Tu poți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6826720","romanian":"Spre deosebire de sora lui, el și-a păstrat credința religioasă insuflată de părinții lui.","english":"Unlike his sister, he has retained the religious faith his parents brought him up in.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153891","romanian":"Felicitările mele mâinilor care au făcut asta posibilă.","english":"My compliments to the hands that made this possible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12104030"},{"id":"tat-6828262","romanian":"O persoană nu este niciodată prea bătrână pentru a se dezvăța de obiceiurile proaste.","english":"One is never too old to unlearn bad habits.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5131142","romanian":"În clipa în care l-am văzut, am știut că e supărat pe mine.","english":"The moment I saw him, I knew he was angry with me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-586093","romanian":"Dorința e pentru cei care cred în îndeplinirea ei.","english":"Wishing is for those who can believe.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7758342"},{"id":"tat-407954","romanian":"Mașina mea e Ford, ca și a dumneavoastră.","english":"My car is a Ford, just like yours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525379"},{"id":"tat-706153","romanian":"O răţuşcă urâtă a devenit o lebădă graţioasă.","english":"An ugly duckling became a graceful swan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974759"}],"stories":[{"id":"story-ro-comoara","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":252,"excerpt":"Sănătatea! Binecuvântata de sănătate! Sănătos să fii, și ți-e destul un pumn de mălai, ca nici pe un împărat să nu te dai! Se scula Duțu cu noaptea-n cap și pleca-n cântarul cocoșilor, căci era lung drumul până la linie și ținea să se puie la lucru mai nainte de a se fi luminat de ziuă."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-2","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"După ce-l mai ciocmăni muierea o toană, puse în gând să-i facă voia, căci limbuţia nevestei îl scoase afară din ţâţâni. Se sculă, deci, de dimineaţă, îşi luă copiii şi plecară împreună cu vorba că merge la lemne."},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-norocul-dracului-3","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":238,"excerpt":"Dar unde să adoarmă? Jos, pământul tare şi rece; sus, întuneric adânc; în casă, copiii adorm plângând; în curte Plăviţa pufăie pe nări a foame; şi el, prigonit de gânduri şi de nenoroc. \"Dar mâine? Dacă n-oi avea ce scutura în copaie? Ce mă fac mâine?"},{"id":"story-luceafarul","title":"Luceafarul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":140,"excerpt":"A fost odata ca-n povesti, A fost ca niciodata, Din rude mari imparatesti, O prea frumoasa fata. Si era una la parinti Si mindra-n toate cele, Cum e Fecioara intre sfinti Si luna intre stele. Din umbra falnicelor bolti Ea pasul si-l indreapta Linga fereastra, unde-Loss'n colti Luceste alba noapte."},{"id":"story-ro-greuceanu-3","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Această izbândă o luă drept semn bun, şi Greuceanu, mergând a doua oară la împăratul, grăi cu cuvintele lui mieroase cele următoare: – Mărite doamne, să trăieşti întru mulţi ani pe luminatul scaunul acestei împărăţii."},{"id":"story-ro-greuceanu-2","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"Ei erau trişti, bieţii oameni, dară Greuceanu îi mângâie cu nişte vorbe aşa de dulci, încât le mai veni niţică inimă, că era şi meşter la cuvânt Greuceanu nostru. El îşi puse nădejdea în întâmplarea aceasta şi îşi zise:\"îmi voi încerca norocul."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
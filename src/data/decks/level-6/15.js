@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-12085368","romanian":"Rusia este pur și simplu casa unora dintre cele mai frumoase femei de pe planetă.","english":"Russia is simply home to some of the most beautiful women on the planet.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-411912","romanian":"Merg la film dacă am timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272128"},{"id":"tat-487312","romanian":"Eram în căutarea unei locuințe de închiriat.","english":"I was on the hunt for lodgings.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7006421"},{"id":"tat-9839369","romanian":"După ce și-a dat jos ochelarii și și-a desfăcut părul, Mary arăta ca o persoană complet diferită.","english":"After removing her glasses and untying her hair, Mary looked like a completely different person.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136854","romanian":"Aș face altfel decât ai făcut tu.","english":"I would do it in a different way than you did.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966286"},{"id":"tat-4993240","romanian":"Experții spun că prețul cafelei crește în primul rând pentru că oamenii sunt dispuși să plătească mai mult.","english":"Experts say coffee prices are rising mainly because people are willing to pay more.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-863630","romanian":"Trebuie să îmi fac o asigurare de sănătate.","english":"I need to purchase health insurance.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9133595"},{"id":"tat-1136600","romanian":"Vă rog să îmi răspundeți în scurtă vreme.","english":"Please write me a reply soon.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966023"},{"id":"tat-7166872","romanian":"Adoptarea unei diete cu conținut scăzut de calorii, vă va crește durata de viață.","english":"Adopting a low calorie diet will increase your lifespan.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6825116","romanian":"Artistul a pictat cele mai complicate picturi murale pe peretele vechi, de piatră.","english":"The artist painted the most intricate of murals on the old stone wall.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13619295","romanian":"Tom a trecut cuțitul peste piatra de ascuțit până când a devenit ascuțit ca briciul.","english":"Tom slid the knife across the whetstone until it was razor-sharp.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192844","romanian":"Sunt o mulțime de cărți în camera lui.","english":"There are a lot of books in his room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361457"},{"id":"tat-12946182","romanian":"Albinele sunt animale foarte utile pentru că produc miere, ceară și polenizează florile.","english":"Bees are very useful animals because they produce honey, wax, and pollinate flowers.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136513","romanian":"Încetează să te mai duci acolo.","english":"Stop going there.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965707"},{"id":"tat-1136815","romanian":"O serie de accidente rutiere au avut loc recent.","english":"A number of traffic accidents have happened recently.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966350"},{"id":"tat-7578049","romanian":"Am auzit că Tom plănuiește să se mute la Boston.","english":"I heard that Tom plans to move to Boston.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1186840","romanian":"Știam că era plastic, dar părea din lemn.","english":"I knew it was plastic but it tasted like wood.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7317802"},{"id":"tat-1192804","romanian":"Ken nu a fost aici de astă dimineață.","english":"Ken has not been here since this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353836"},{"id":"tat-6614173","romanian":"Dl. și dna. Yamada se vor întoarce în țara lor de baștină luna viitoare.","english":"Mr. and Mrs. Yamada will return to their homeland next month.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-584840","romanian":"Mobilierul din acest birou este foarte modern.","english":"The furniture in this office is really modern.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812390"}],"stories":[{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."},{"id":"story-scrisoarea-iii","title":"Scrisoarea III","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":145,"excerpt":"Unde-Loss'n ceruri senine Luceafarul rasare, Din negura de vremi acolo moartea a lasat urma, Acolo sufletul se-Loss'ntreaba: \"Ce-Loss'n veacul veacului nu moare?\" Si glasul vremii-Loss'n raspuns sopteste tainic: \"Numai urma.\" Pe cand lumea toata doarme-Loss'n noapte, Trecut-au ani si veacuri, si totusi noi vedem Pe bolta-Loss'nstelata aceleasi stele-Loss'napte Ce-au luminat si Mircea, si Stefan cel Batran."},{"id":"story-ro-povestea-lui-stan-p-itul-3","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"Ce-a mai fi şi asta? Alţii, că să te ferească Dumnezeu de femeia leneşă, mârşavă şi risipitoare; alţii alte năstruşnicii, încât nu ştii ce să crezi şi ce să nu crezi? Numai nu-i vorbă că am văzut eu şi destui bărbaţi mult mai ticăiţi şi mai chitcăiţi decât cea mai bicisnică femeie."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-enigma-otiliei","title":"Enigma Otiliei","author":"George Calinescu","difficulty":6,"genre":"fiction","wordCount":180,"excerpt":"Intr-o seara de vara, Felix Sima sosi in Bucuresti. Era student la Medicina si venise sa locuiasca la unchiul sau, Costache Giurgiuveanu. Casa din strada Antim era mare si veche, cu ziduri groase si ferestre inalte. Cand Felix a intrat in curte, a vazut o fata tanara care citea pe o banca, sub un tei batran."},{"id":"story-ro-z-na-zorilor","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"A fost ce-a fost: dacă n-ar fi fost nici nu s-ar povesti. Poveşti de Ioan Slavici - Zâna Zorilor A fost odată un împărat, – un împărat mare şi puternic; împărăţia lui era atât de mare, încât nici nu se ştia unde se începe şi unde se sfârşeşte. Unii ziceau că ar fi fără de margini."},{"id":"story-ro-o-via-pierdut-3","title":"O viață pierdută","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":209,"excerpt":"Cârlanul se opri, nechezând printre dinți, la ușa grajdului. - Stăi, prietene! grăi bătrânul mergând cu hamurile în urma lui. Toate se fac cu vremea. În grajd mai era un cal, loc pentru alți doi și un flăcău, care se trezi din somn când intră bătrânul. - Bună seara, Costane! grăi el trăgănând vorbele. Ai avut noroc la ziuă?"}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-407957","romanian":"Numele meu este românesc, al lui e american.","english":"My name is Romanian; his is American.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531992"},{"id":"tat-1136617","romanian":"Cine va fi responsabil de clasa noastră când domnișoara Smith va părăsi şcoala?","english":"Who will be in charge of our class when Miss Smith leaves school?","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965929"},{"id":"tat-408063","romanian":"Avem aceleași intenții, dar nu același mod de operare.","english":"We have the same intentions, but not the same modus operandi.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232774"},{"id":"tat-5233189","romanian":"Ai vreo idee la ce oră va ajunge Tom acasă?","english":"Do you have any idea what time Tom will come home?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1059689","romanian":"Nu îi e ușor să învețe engleza.","english":"English is not easy for him to learn.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029000"},{"id":"tat-670577","romanian":"Vederea slabă este un handicap pentru un atlet.","english":"Poor sight is a handicap to an athlete.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2423585"},{"id":"tat-10006115","romanian":"În epoca stalinistă, prizonierii din lagărele de concentrare au devenit sclavi în slujba statului.","english":"During the Stalinist era, prisoners at concentration camps became slaves in service of the state.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923814","romanian":"Anumite plante cresc bine cu puțină îngrijire.","english":"Some plants grow well with a minimum of care.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10431937"},{"id":"tat-6581970","romanian":"Medalia de Onoare a Congresului este cea mai importantă distincție la care un soldat poate aspira.","english":"The Congressional Medal of Honor is the highest award that any soldier can aspire to.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7115203","romanian":"Ceea ce ne definește este modul în care ne ridicăm după ce cădem.","english":"What defines us is how well we arise after falling.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5158990","romanian":"Dacă calci cu fierul de călcat Elveția, ar fi mai mare decât Germania.","english":"If you ironed Switzerland, it would be bigger than Germany.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-864488","romanian":"Ea știa să citească când avea patru ani.","english":"She could read when she was four.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855675"},{"id":"tat-705819","romanian":"Mama mea a plecat ieri la cumpărături în centru.","english":"My mother went shopping downtown yesterday.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963917"},{"id":"tat-584851","romanian":"Când a fost tânăr, a muncit cu sârguinţă.","english":"When he was young, he was a hard worker.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812437"},{"id":"tat-2568515","romanian":"De fiecare dată când mă alătur unui nou joc de Warcraft, dau de o nouă echipă de adversari.","english":"Every time I join a new game of Warcraft, I am pitted against a new team of adversaries.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1059506","romanian":"A venit să ne vadă ieri.","english":"She came to see us yesterday.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8577246"},{"id":"tat-1064248","romanian":"Tom nu se sperie aproape niciodată.","english":"Tom almost never gets scared.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073108"},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"},{"id":"tat-6595168","romanian":"Bob i-a spus lui Jane să nu se amestece în treburile sale personale.","english":"Bob told Jane not to interfere in his personal affairs.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"}],"stories":[{"id":"story-ro-cele-trei-rodii-aurite","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un împărat, şi avea un fecior; acesta, şezând la fereastră, vede o babă bătrână, care venea cu tivga să ia apă de la fântână."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-ho-u-mp-rat-2","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"Cum auzea că în cutare cetate este câte vrun meşter mai dibaci şi că acea meserie nu se află pe la dânsul, îndată îl trimitea să înveţe şi acea meserie. Astfel umblă fiul împăratului din ţară în ţară, ca şi un pribeag, până ce învăţă toate meseriile de pre pământ."},{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat şi o împărăteasă. Ei aveau trei copii. Mai aveau pe lângă palaturile lor o grădină foarte frumoasă. Şi atât de drag îi era florile acestui împărat, încât însuşi cu multă tragere de inimă le plivea şi îngrijăa de grădină. În fundul acestei grădini crescuse un măr cu totul şi cu totul de aur."},{"id":"story-ro-f-t-frumos-cel-r-t-cit","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"A fost odată o păreche de oameni, muncitori, de! cum dă Dumnezeu. Toată nădejdea lor era într-o iapă cu care se hrăneau. Şi ar fi voit şi ei să aibă un copilaş, dar fu peste poate. Cercetară în dreapta şi în stânga, ca să afle niscaiva leacuri care să le desfacă făcutul stărpiciunei lor, dară, aşi!"},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":208,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti. A fost odată un împărat. Împăratul acesta stăpânea o lume întreagă, şi în lumea asta era un păcurar bătrân şi o păcurăriţă, care aveau trei fete: Ana, Stana şi Lăptiţa."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
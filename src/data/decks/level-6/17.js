@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-5345650","romanian":"Merg prin cartierul chinezesc și admir simbolurile frumoase pe care tot nu le înțeleg încă.","english":"I go through Chinatown and admire the beautiful signs that I still do not understand.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192790","romanian":"Oamenii promiseseră deja bani pentru proiectul său.","english":"People have already promised money for his project.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350198"},{"id":"tat-1192742","romanian":"Avionul se apropia de Londra.","english":"The plane was approaching London.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7511266"},{"id":"tat-1064193","romanian":"Nu am absolut nimic de făcut.","english":"I have absolutely nothing to do.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066192"},{"id":"tat-11658423","romanian":"Majoritatea zmeurii sunt roșii, dar există și zmeură albă, galbenă și chiar violetă.","english":"Most raspberries are red, but there are also white, yellow, and even purple raspberries.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583874","romanian":"Motivul principal pentru care prietenii își părăsesc prietenii pe Facebook e din cauza prea multor postări inutile.","english":"The number one reason why friends dump their friends on Facebook is too many useless posts.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/954288"},{"id":"tat-8762418","romanian":"Valurile mă aruncau fără milă dintr-o parte într-alta, în timp ce mă zbăteam să-mi țin răsuflarea.","english":"The waves were tossing me viciously to and fro as I struggled to hold my breath.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-698952","romanian":"Am vrut să cumpăr cartea.","english":"I wanted to buy the book.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2818798"},{"id":"tat-222","romanian":"Implementarea noilor politici va necesita resurse considerabile.","english":"Implementing the new policies will require considerable resources.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-487317","romanian":"Noi adesea dăm peste turiștii japonezi în această zonă.","english":"We often come across Japanese tourists in this area.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6335455"},{"id":"tat-1136896","romanian":"Sunt atât de bucuros să vizit VNU.","english":"I’m so glad to visit VNU.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966032"},{"id":"tat-1136707","romanian":"Amândoi și-au mâncat ciocolatele până la ultima îmbucătură.","english":"They both ate their chocolates down to the very last bite.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226212"},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-9622607","romanian":"Tom și Mary au spus că au plecat devreme pentru că nu se simțeau bine.","english":"Tom and Mary said they left early because they were feeling sick.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064272","romanian":"Tatăl ei a murit când ea avea trei ani.","english":"Her father died when she was three.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066162"},{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-6539915","romanian":"Potrivit unui studiu recent, durata medie de viață a japonezilor este în continuă creștere.","english":"According to a recent study, the average life span of the Japanese is still increasing.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1278932","romanian":"Nimeni nu e mai sus de el.","english":"No one is above him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13348271"},{"id":"tat-1136810","romanian":"Programul nu permite modificări în acest moment.","english":"The program does not allow for changes at this point in time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966290"}],"stories":[{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-3","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Când luă ştergarul să se şteargă pe ochi, ce să vază? Trei picături de sânge pe dânsul. El îşi zise:\"Trebuie să mă întorc acasă, căci Dumnezeu ştie ce va fi păţit baba mea.\" Întinse unchiaşul la drum. Nu mai căuta nici de mâncare, nici de odihnă, şi se întoarse acasă cum plecase. – Ce ţi s-a întâmplat, babo?"},{"id":"story-ro-popa-tanda-2","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"Minunat om ar fi părintele Trandafir dacă nu l-ar strica un lucru. Este cam greu la vorbă, cam aspru la judecată: prea de-a dreptul, prea verde-fățiș. El nu mai sucește vorba, ci spune drept în față, dacă i s-a pus ceva pe inimă. Nu e bine să fie omul așa. Oamenii se prea supără când le luăm căciula din cap."},{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."},{"id":"story-ro-p-dureanca-3","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Ți-e scris, ți-e scris; nu ți-e scris, nu ți-e scris, și sănătate bună. Socoteala lui Busuioc era făcută: n-avea decât să pună caii la câteva căruțe, să plece la păduri ca să-și aducă oamenii, și apoi ar fi vrut el să știe care-i acela, un om din Curtici, care ar îndrăzni să facă gură."},{"id":"story-ro-ileana-simziana-3","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"– Oricum, tată, spune-ne şi nouă, că doară nu s-o face gaură în cer, dacă vom şti şi noi ce lucru te amăraşte. Dacă văzu împăratul că-l înteţesc fetele cu rugăciunile, zise: – Iată, copilele mele de ce sunt tot trist."},{"id":"story-ro-fata-mo-ului-cea-cuminte-2","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Când, tocmai când era să se dea jos, zări spre răsărit abia licărind o mititică vâlvotaie; se coborî de pe acoperiş şi o luă într-acolo. Se duse, se duse şi la foc nu mai ajunse; dară în drumul ei întâlni o grădină părăginită, care o strigă zicându-i: – Fată mare, fată mare!"}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
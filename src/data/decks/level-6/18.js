@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136590","romanian":"Prăbușindu-se pe jos, a izbucnit în lacrimi.","english":"On falling down, she burst into tears.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965952"},{"id":"tat-204","romanian":"Fiecare experienta ne invata ceva important despre viata.","english":"Every experience teaches us something important about life.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1136903","romanian":"Avem nevoie de ceva educație formală în literatură.","english":"We need some formal instruction in literature.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966068"},{"id":"tat-411911","romanian":"Aș merge la film dacă aș avea timp.","english":"I would go to the movies if I had the time.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272125"},{"id":"tat-1278889","romanian":"Nu a fost permis nimănui să părăsească camera.","english":"Nobody was allowed to leave the room.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13345377"},{"id":"tat-4989065","romanian":"De când am plecat și până m-am întors a bătut întruna la tobe.","english":"From the moment I left till I came back, he had been hitting the drum without interruption.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6710378","romanian":"De-a lungul timpului, acțiunea valurilor erodează stâncile și, prin urmare, le face să cadă în ocean.","english":"Over time, wave action undercuts sea cliffs and thereby causes them to fall into the ocean.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4779015","romanian":"Normalul este o iluzie. Ceea ce este normal pentru un păianjen este haos pentru muscă.","english":"Normality is an illusion. What is normal for a spider is chaos for a fly.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143234","romanian":"Tom a cerut un apel de deșteptare.","english":"Tom asked for a wake-up call.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068482"},{"id":"tat-1185109","romanian":"Toți vom muri mai devreme sau mai târziu.","english":"We all shall die sooner or later.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7195149"},{"id":"tat-407952","romanian":"Imediat ce îi contactați pe prietenii dumneavoastră, spuneți-le că se apropie o avalanșă.","english":"As soon as you contact your friends, tell them that an avalanche is coming.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525177"},{"id":"tat-1192771","romanian":"A alergat 100 de metri în exact 11 secunde.","english":"He ran 100 meters in 11 seconds flat.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364280"},{"id":"tat-1143158","romanian":"Rapida vulpe maronie nu a sărit peste câinele leneș.","english":"The quick brown fox did not jump over the lazy dog.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069001"},{"id":"tat-2536426","romanian":"Cei care locuiesc în case de sticlă nu ar trebui să arunce cu pietre.","english":"Those who live in glass houses should not throw stones.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536357","romanian":"Trebuie să învățăm să trăim împreună ca frații sau vom pieri împreună ca proștii.","english":"We must learn to live together as brothers, or we will perish together as fools.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059644","romanian":"A fost foarte prietenos cu toată lumea.","english":"He was very friendly to everybody.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10795791"},{"id":"tat-1153793","romanian":"Voi lua o cină cu un prieten.","english":"I am going to eat an evening meal with a friend.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128725"},{"id":"tat-4144674","romanian":"Dacă îmi aduc bine aminte, ai fost destul de optimist la acel moment.","english":"If I remember correctly, you were quite optimistic at that time.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4303252","romanian":"Noi priveam pasărea mâncând firimiturile; apoi am strănutat, și ea a dispărut într-o clipă.","english":"We were watching the bird eat the crumbs; then I sneezed, and he was gone in a flash.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-487304","romanian":"El a fost convins să fie mai rezonabil.","english":"He was persuaded to be more sensible.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270699"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."},{"id":"story-ro-amintiri-din-copil-rie-i-2","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Şi unde nu s-au adunat o mulţime de băieţi şi fete la şcoală, între care eram şi eu, un băiat prizărit, ruşinos şi fricos şi de umbra mea."},{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."},{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"},{"id":"story-ro-hagi-tudose-2","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Îşi freacă mâinile; tuşesc; îşi dreg glasul; apoi, rara-rara, cu nişte paşi lungi şi semeţi, îţi ies înainte, îţi caută prilej de vorbă, toţi cu aceleaşi cuvinte, cu aceeaşi tărăgănire de glas şi cu capul dat pe spate: – Ei, flăcăule, de pe unde?… Ce vânturi?… Pe la noi… ai?… Şi de ce?… Ce zici de biserica noastră?…"},{"id":"story-ro-z-na-zorilor-2","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Cu totul alta era Costan: mic la statură, îndesat la făptură, cu braţul de bărbat, cu pumnul îndesat. Al treilea şi cel mai tânăr fecior al împăratului e Petru: înalt, dar subţire, mai mult fată decât fecior. Petru nu face multă vorbă: el râde şi cântă, cântă şi râde de dimineaţă până în seară."},{"id":"story-ro-gura-satului","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Nu-i vorbă, răi sunt oamenii, încât mai răi nici n-ar putea să fie. Chiar și acela pe care toată lumea îl știe de bun își are ceasurile de răutate, și nu avem decât să-l atingem unde-l doare pentru ca să-l facem mai dârz decât alții. Dar nenea Mihu tot om bun rămâne."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
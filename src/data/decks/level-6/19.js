@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-13612966","romanian":"Am crezut că vrei să mănânci la acel restaurant chinezesc de pe Park Street.","english":"I thought you wanted to eat at that Chinese restaurant on Park Street.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1142926","romanian":"Acum, vom arăta cum această lemă poate fi folosită în demonstrarea teoremei principale.","english":"Now, we show how this lemma can be used to prove our main theorem.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066559"},{"id":"tat-1192774","romanian":"Tom putea cu greu să suporte durerea.","english":"Tom could hardly stand the pain.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364284"},{"id":"tat-1136709","romanian":"Tom a întrebat-o pe Mary cine crede ea că e cel mai probabil să câștige cursa.","english":"Tom asked Mary who she thought would be the most likely to win the race.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239741"},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136774","romanian":"- Sunt profesor. - Și eu sunt.","english":"I am a teacher. \"So am I.\"","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966215"},{"id":"tat-1143187","romanian":"Tom pare a fi interesat de Mary.","english":"Tom seems to be interested in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069268"},{"id":"tat-1144330","romanian":"Acea petrecere s-a ținut sub auspiciile Ministerului Afacerilor Externe.","english":"That party was held under the auspices of the Foreign Ministry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073626"},{"id":"tat-1136575","romanian":"Sosirea trupelor a condus la exacerbarea violențelor.","english":"The arrival of the troops led to more violence.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966041"},{"id":"tat-1192791","romanian":"Tom s-ar putea să mintă despre asta.","english":"Tom may possibly be lying about that.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350289"},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-708998","romanian":"Noaptea a fost atât de rece încât, atunci când m-am întors, eram aproape îngheţat.","english":"The night was so chilly that when I returned I was almost frozen.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420255"},{"id":"tat-1058773","romanian":"Declarațiile lui sunt infantile şi adesea mă deranjază.","english":"His statements are childish and they often bother me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11044684"},{"id":"tat-1059656","romanian":"Ce limbi se vorbesc în Belgia?","english":"What languages do they speak in Belgium?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029005"},{"id":"tat-1136737","romanian":"S-a dus în Italia cu gândul să studieze literatura.","english":"He went to Italy with a view to studying literature.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966251"},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6638268","romanian":"Producția industrială a animalelor, este principalul factor care contribuie la sporirea gazelor cu efect de seră.","english":"The industrial production of livestock is the leading contributor to greenhouse gases.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-408060","romanian":"I-am dat cărțile studentului acestuia.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232758"},{"id":"tat-5044147","romanian":"Rata șomajului în Japonia a fost de 3,4 la sută în luna septembrie a anului 2015.","english":"The unemployment rate in Japan was 3.4 percent in September of 2015.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-670576","romanian":"Ce se va întâmpla cu ea?","english":"What will happen to her?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2299514"}],"stories":[{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-ro-moara-cu-noroc-2","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"Iacă liniștea colibei. — Nu zic, grăi soacra așezată."},{"id":"story-ro-ion-roat-i-cuza-vod","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":229,"excerpt":"Între ţăranii fruntaşi care au luat parte, împreună cu boierii, cu episcopii şi cu mitropolitul ţării la Divanul ad-hoc din Moldova, în 1857, era şi moş Ion Roată, om cinstit şi cuviincios, cum sunt mai toţi ţăranii români de pretutindeni."},{"id":"story-ro-ileana-cea-ireat-3","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acuma fata de împărat se apropie de fereastră şi grăi cu glas blând: – Ţi-am zis să mergi pe calea pe care ai venit: spini să-ţi crească-n cale şi flori să-ţi rămână pe urmă. Încă trei zile şi trei nopţi stete feciorul de împărat la fereastra fetei."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-amintiri-din-copil-rie-i","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":223,"excerpt":"Stau câteodată şi-mi aduc aminte ce vremi şi ce oameni mai erau în părţile noastre pe când începusem şi eu, drăgăliţă-Doamne, a mă ridica băieţaş la casa părinţilor mei, în satul Humuleşti, din târg drept peste apa Neamţului; sat mare şi vesel, împărţit în trei părţi, care se ţin tot de una: Vatra satului, Delenii şi Bejenii."},{"id":"story-ro-fata-mo-ului-3","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":257,"excerpt":"Iacă, e un basm cu ghicitoare vorba mea şi, de vreţi, am să vi-l spun, dacă mi-o face poala căpătâi o fată frumoasă. – Mai e vorbă? Vrem, vrem! – Uite, vin’ la mine. – Ba la mine! – Ba la mine, că-ţi caut în cap!"}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-8741689","romanian":"Samuel și Michael vorbeau despre o fată pe care Bryan a cunoscut-o în Brazilia anul trecut.","english":"Samuel and Michael were talking about a girl Bryan met in Brazil last year.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-487287","romanian":"Ei îi place foarte mult școala sa.","english":"She likes her school a lot.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270501"},{"id":"tat-2536130","romanian":"America e un loc drăguț în care să fii, dacă ești aici ca să câștigi bani.","english":"America is a lovely place to be, if you are here to earn money.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1153152","romanian":"Nu e un om care să spună o minciună.","english":"He is not a man to tell a lie.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692344"},{"id":"tat-1064365","romanian":"Tom și Mary sunt din același oraș.","english":"Tom and Mary are from the same city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074444"},{"id":"tat-1136800","romanian":"N-am fost niciodată într-o închisoare.","english":"I have never been inside a jail.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966338"},{"id":"tat-670639","romanian":"Naivul bărbat era extrem de stânjenit în prezenţa ei.","english":"The naive man was utterly embarrassed in her presence.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681128"},{"id":"tat-5185437","romanian":"În timpul Evului Mediu, onoarea era de bază pentru viața omului liber și a creștinului.","english":"During the Middle Ages, honor was fundamental to the life of the free man and of the Christian man.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568518","romanian":"Sarah a avut suficient discernământ pentru a realiza că prietenii ei încercau să-i facă o farsă.","english":"Sarah was discerning enough to realize that her friends were trying to prank her.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-698933","romanian":"Cu ce vă pot fi de folos astăzi, domnule?","english":"How may I help you today, sir?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2157709"},{"id":"tat-2568508","romanian":"Formarea și mișcarea uraganelor sunt capricioase, chiar și cu tehnologia noastră de astăzi.","english":"The formation and movement of hurricanes are capricious, even with our present-day technology.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11597600","romanian":"Cleopatra se afla la Roma în ziua în care Iulius Cezar a fost asasinat.","english":"Cleopatra was in Rome the day Julius Caesar was assassinated.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-706157","romanian":"În această carte se întâmplă multe coincidenţe.","english":"In this book, lots of coincidences happen.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974784"},{"id":"tat-1090180","romanian":"De ce vrei să cumperi cartea asta?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3639543"},{"id":"tat-7726661","romanian":"Dacă n-ar fi fost zăpadă, am fi putut să ne urcăm pe munte.","english":"If it were not for the snow, we could climb the mountain.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4184076","romanian":"Latina este una dintre puținele limbi care necesită o bună cunoaștere a gramaticii.","english":"Latin is one of the few languages that requires a good knowledge of grammar.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1278911","romanian":"Sunt pregătit să te ajut.","english":"I am ready to help you.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13347606"},{"id":"tat-1143210","romanian":"Tom pretindea că nu știe cine e Mary.","english":"Tom pretended not to know who Mary was.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070000"},{"id":"tat-1143233","romanian":"Ai vrea să mergi la o plimbare?","english":"Would you like to go for a walk?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068480"},{"id":"tat-1090181","romanian":"De ce vrei să cumperi această carte?","english":"Why do you want to buy this book?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4412136"}],"stories":[{"id":"story-ro-g-in-reasa","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"A fost odată un împărat şi o împărăteasă. În căsătoria lor ei au trăit ca fraţii, şi numai o fată au fost făcut. Ca şi mumă-sa, această fată, din naştere, era cu o stea în frunte."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-3","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"– Şi tu a mea! grăi al doilea în voinicie către Ana, ridicând-o şi pe ea în şa. Făcând aşa, voinicii porniră spre curtea împărătească. În ziua următoare se făcură nunţile şi apoi trei zile şi trei nopţi întreaga împărăţie răsuna de veselia oaspeţilor…"},{"id":"story-ro-neghini-2","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– Bine, mătuşă, bine, da’ de unde şi fată? Tu nu ştii că copacii uscaţi nu mai dau de la rădăcină? Şi bătrâna începu să râdă şi să ofteze: \"hi, hi, hi, ooof, of!\" – Ei, toate se întorc, şi apele se întorc de la Dumnezeu, numai tinereţile ba. Ce nu e la timp nu mai e niciodată."},{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."},{"id":"story-ro-ileana-cea-ireat-2","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":205,"excerpt":"Când cei trei feciori ai împăratului vecin primiră vestea că împăratul a pornit în cale şi că s-a depărtat de acasă, ei se înţeleseră între sine şi încălecară, ca să meargă la cetatea cea cu trei fete de împărat să răpească credinţa fetelor şi să-i facă împăratului supărare."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-fata-mo-ului-cea-cuminte","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"A fost odată un om bătrân care avea o fată mare, de se dusese vestea în lume de vrednicia ei. Moşneagul (unchiaşul) se căsători de a doua oară cu o babă, care avea şi ea o fată mare."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
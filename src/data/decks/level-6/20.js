@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136533","romanian":"Profesoara ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965168"},{"id":"tat-9028817","romanian":"Se pare că pastilele pe care le-am luat mai devreme au fost eficiente.","english":"It seems that the pills I took earlier were effective.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185133","romanian":"S-a produs vreo schimbare în curenții oceanici?","english":"Has a change in ocean currents occurred?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323897"},{"id":"tat-928488","romanian":"Desenele lui Lyod reprezintă persoane din secolul al paisprezecelea.","english":"The drawings Lyod has made show people from the 14th century.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5107153"},{"id":"tat-705816","romanian":"Mary s-a ataşat foarte tare de fetiţa aceea.","english":"Mary is very attached to the little girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963910"},{"id":"tat-1136687","romanian":"Mai întâi cred că primul lucru pe care îl observă un străin ajuns în China este cu siguranță mărimea țării.","english":"Firstly, I think that the first time each foreigner is in China, the earliest impression is certainly the size of the country.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239573"},{"id":"tat-4977405","romanian":"Acest magazin vinde îmbrăcăminte și încălțăminte atât pentru bărbați cât și pentru femei.","english":"This store sells clothes and shoes for both men and women.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862344","romanian":"În general, bărbaţii sunt mai înalţi decât femeile.","english":"Generally speaking, men are taller than women.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10085812"},{"id":"tat-2568461","romanian":"Cel mai lent în a promite este și cel mai credincios promisiunii atunci când o face.","english":"The slowest one to make a promise is the most faithful one in keeping it.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1147577","romanian":"Am scris o adresă greșită pe plic.","english":"I wrote a wrong address on the envelope.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095173"},{"id":"tat-1136813","romanian":"Tata și-a ajustat întotdeauna costumele la croitor.","english":"Father always has the tailor make his suits.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966356"},{"id":"tat-1136894","romanian":"Aceasta este casa în care a crescut Tom.","english":"This is the house where Tom was brought up.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956357"},{"id":"tat-1291063","romanian":"Ești destul de mare cât să știi cum să te comporți. Fii cuminte.","english":"You are old enough to know better. Behave yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143121","romanian":"Au ajuns în staţie la doar câteva minute distanță.","english":"They got to the station only a few minutes apart.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068791"},{"id":"tat-1186852","romanian":"Diferențe subtile în ton diferențiază orginalul de copie.","english":"Subtle differences in tone discriminate the original from the copy.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338196"},{"id":"tat-1291046","romanian":"Dansatoarele par fragile în rochiile lor albe, dar în realitate sunt foarte puternice.","english":"The dancers look delicate in their white dresses, but they are really as strong as horses.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-698931","romanian":"La ce oră te-ai obișnuit să te duci la culcare?","english":"What time are you used to going to bed?","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2135421"},{"id":"tat-9813136","romanian":"O pisică este un leu în miniatură care iubește șoarecii, urăște câinii și tolerează oamenii.","english":"A cat is a miniature lion that loves mice, hates dogs and tolerates humans.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192816","romanian":"Yenul e încă scăzut în raport cu dolarul.","english":"The yen is still low against the dollar.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356233"}],"stories":[{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-comoara-3","title":"Comoara","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"- Dar Ghiță ce face? Întrebă iar Duțu, zâmbind pe sub mustață. - E bine și el! răspunse Ana, care nu înțelegea nici acum batjocura. Au înțeles-o însă vecinii, și peste puțin, așa-i răutatea omenească, sătenii nu-i mai ziceau lui Ghiță, ca mai nainte, Ghiță al Popii, ci Ghiță al Boilor."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-2","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"Dorinţa ce ai o să-ţi aducă întristare. – Eu nu am venit să te întreb asta, zise împăratul, ci, dacă ai ceva leacuri care să ne facă să avem copii, să-mi dai. – Am, răspunse unchiaşul; dar numai un copil o să faceţi. El o să fie Făt-Frumos şi drăgăstos, şi parte n-o să aveţi de el."},{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."},{"id":"story-ro-flori-a-din-codru","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti."},{"id":"story-praslea","title":"Praslea cel voinic","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":175,"excerpt":"Intr-o imparatie de demult traia un imparat care avea trei fii: doi mari si unul mic, pe care-l chema Praslea. Fratii cei mari erau mandri si rasfatati, dar Praslea era harnic si cuminte. Imparatul avea o gradina cu meri de aur, dar in fiecare noapte venea cineva si fura merele. Nimeni nu stia cine este hotul."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
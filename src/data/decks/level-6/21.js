@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-708965","romanian":"Căţărătorii se treziră înaintea zorilor.","english":"The climbers awoke before daybreak.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420408"},{"id":"tat-1143186","romanian":"E ciudat că ar trebui să eșuezi.","english":"It is strange that you should fail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069265"},{"id":"tat-12040285","romanian":"Există unele avioane, numite planoare, care nu au deloc motoare, dar zboară foarte bine.","english":"There are some aircraft, called gliders, that have no engines at all, but fly just fine.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6709926","romanian":"Tom, un milionar care a făcut avere prin propriile forțe, a trăit într-o sărăcie abjectă când era copil.","english":"Tom, a self-made millionaire, had lived in abject poverty as a child.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1143235","romanian":"De ce sunteți, băieți, așa de supărați?","english":"Why are you guys so angry?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068488"},{"id":"tat-706124","romanian":"Nu avea nicio intenţie să aştepte trei ore.","english":"He had no intention of waiting for three hours.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/973116"},{"id":"tat-205","romanian":"Daca as fi stiut, as fi luat o decizie diferita.","english":"If I had known, I would have made a different decision.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1136863","romanian":"Toată lumea știe că încă este în viață.","english":"Everybody knows for a fact that he is still alive.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966276"},{"id":"tat-405835","romanian":"Transmite-i, te rog, salutări doamnei Andreescu!","english":"Please say hello to Mrs. Andreescu!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350559"},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12111968","romanian":"Dacă măslinii ar cunoaște mâinile care i-au plantat, uleiul lor ar deveni lacrimi.","english":"If olive trees knew the hands that planted them, their oil would become tears.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1144324","romanian":"I s-a făcut o injecție înainte de operație.","english":"He had an injection prior to the operation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073578"},{"id":"tat-712090","romanian":"Va trebui să facem ceva.","english":"We will have to do something.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440048"},{"id":"tat-862830","romanian":"Prima oară a fost ales de senat în 1984.","english":"He was first elected to the Senate in 1984.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014508"},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1064211","romanian":"Despre ce voiai să vorbești cu mine?","english":"What did you want to talk to me about?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11069328"},{"id":"tat-6701448","romanian":"Cel mai mare cusur al rasei umane este incapacitatea noastră de a înțelege funcția exponențială.","english":"The greatest shortcoming of the human race is our inability to understand the exponential function.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11475333","romanian":"Ai putea avea te rog grijă de câinele meu mâine?","english":"Would you please look after my dog tomorrow?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136919","romanian":"Mike a acționat în calitate de președinte al reuniunii.","english":"Mike acted as chairperson of the meeting.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957760"},{"id":"tat-6581957","romanian":"O parte din studenți care sunt prinși copiind la examene nici măcar nu se jenează.","english":"Some of the college students who are caught cheating on the exams do not even blush.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-scormon-3","title":"Scormon","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":205,"excerpt":"Îi părea c-a mai văzut adeseori acest câine, dar unde și cum nu-și aducea aminte. Deodată, fața ei se însenină. — Scormon! strigă ea cu bucurie, ca și când ar întâlni un vechi prieten."},{"id":"story-ro-la-crucea-din-sat-3","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– I-ai adăpat? – Asta nu se face acum; știi d-ta bine că noi adăpăm boii când se culcă găinile! – Dar caii... Bujor îi taie vorba: – Bade Mitre!"},{"id":"story-ro-gura-satului-3","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"zice una. — Cine altul decât Toderică, îi răspunde alta. — Toderică? Așa umblă gura satului. Nici să visezi din ce scornește o poveste. Pentru ca să vorbim drept, Toderică e Toader, ba chiar Tudoroiu. Lasă că avea din cine să iasă fiindcă și tatăl său, Cosma Florii Cazacului, seamănă cu dânsul."},{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-ro-pas-rea-m-iastr-3","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":7,"genre":"folktale","wordCount":220,"excerpt":"Atunci vulpoiul făcu un semn asupra lui şi îl schimbă în stană de piatră. Văzând împăratul că fiul său cel mare nu se mai întoarce ascultă rugăciunea fiului celui mijlociu, şi îi dete voie să meargă şi dânsul. Acesta, după ce se găti şi îşi luă merinde de drum, porni şi dânsul."},{"id":"story-ro-mo-ion-roat-i-unirea-2","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Statura, vorba, hrana, îmbrăcămintea şi toate obiceiurile câte le avem noi le au întocmai şi fraţii noştri munteni. Ţări megieşe, am zis, oameni buni; căci numai pârăuaşul Milcov, ce trece pe la Focşani, le desparte."},{"id":"story-ro-pas-rea-m-iastr","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat evlavios şi bun. El avea trei feciori. Pe lângă multe bunătăţi ce făcuse oamenilor din împărăţia lui, a ridicat şi o monastire de care să se ducă pomina. A împodobit-o cu aur, cu pietre nestemate şi cu tot ceea ce meşterii din acea ţară au socotit mai scump şi mai frumos."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
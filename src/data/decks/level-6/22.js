@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1142931","romanian":"Am început cu doi tovarăși de călătorie.","english":"I started with two traveling companions.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066641"},{"id":"tat-1279321","romanian":"A doua oglindă este agăţată lângă uşă.","english":"A second mirror is hanging next to the door.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13495625"},{"id":"tat-1136770","romanian":"Ziua a fost furtunoasă și ceea ce a fost încă și mai rău a fost că fulgera.","english":"The day was stormy, and what was worse still, it was thundering.","difficulty":7,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966198"},{"id":"tat-487295","romanian":"Străzile noastre se inundă când plouă.","english":"Our streets flood when we have rain.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270651"},{"id":"tat-2837196","romanian":"Arată-mi faţa ta şi lasă-mă să-ţi aud glasul, căci glasul tău este dulce, iar faţa ta este încântătoare!","english":"Shew me thy face, let thy voice sound in my ears: for thy voice is sweet, and thy face comely.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-923931","romanian":"Animalele sălbatice sunt în pericol de dispariţie.","english":"Wild animals are on the verge of dying out.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/807128"},{"id":"tat-5229148","romanian":"Poliția s-a uitat peste tot și nu a putut găsi nici o urmă a lui Tom.","english":"The police looked everywhere and could find no trace of Tom.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1279014","romanian":"Toţi au fost amabili cu fata cea nouă.","english":"Everybody was kind to the new girl.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13353831"},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-709907","romanian":"Gabriel este doar unul dintre îngerii Domnului.","english":"Gabriel is only one of the angels of God.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426741"},{"id":"tat-1153820","romanian":"Stai acasă pentru a putea răspunde la telefon.","english":"Stay home so that you can answer the phone.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129301"},{"id":"tat-10452185","romanian":"Într-o cafenea din Jakarta, Indonezia, proprietarii doresc să promoveze comunicația, înțelegerea și toleranța angajând oameni fără auz.","english":"At a coffee shop in Jakarta, Indonesia, the owners want to promote communication, understanding and tolerance by employing people who can’t hear.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-712091","romanian":"De cât timp stă Ken în Kobe?","english":"How long has Ken lived in Kobe?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440065"},{"id":"tat-1144311","romanian":"A privit șirul de cocori agăţat de tavan, pe care fratele ei Masahiro l-a agățat acolo pentru ea.","english":"She looked at her flight of cranes hanging from the ceiling, which her brother Masahiro had hung there for her.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073447"},{"id":"tat-12328330","romanian":"Fiecare limbă care se stinge ia cu ea o bucată din istoria umană.","english":"Every language that dies out takes a piece of human history with it.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064170","romanian":"Toată lumea în afară de Tom a fost prezentă.","english":"Everyone except Tom was present.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3090030"},{"id":"tat-1136757","romanian":"A răspuns cu nici pe departe un surâs.","english":"She answered with hardly a smile.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966223"},{"id":"tat-1059702","romanian":"Dacă aduni trei cu patru, obții șapte.","english":"If you add three and four, you get seven.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758844"},{"id":"tat-2536658","romanian":"Trecutul poate fi doar cunoscut, nu schimbat. Viitorul poate fi doar schimbat, nu cunoscut.","english":"The past can only be known, not changed. The future can only be changed, not known.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143256","romanian":"Fabrica a fost închisă pentru renovare şi va fi deschisă pe 1 septembrie 2007.","english":"The factory is closed for refurbishment and will re-open on 1st September 2007.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068570"}],"stories":[{"id":"story-ro-g-in-reasa-3","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Numaidecât mai-marii ţării ziseră fetei să se gătească de nuntă. Acum altă nevoie. Nici fata nu voia să ia pe tată-său de soţ. Ea zise: – Unde aţi mai auzit, boieri dumneavoastră, batjocură ca aceasta, să ia tatăl de soţie pe fie-sa. – Nu te supăra, domniţă, şi nu fii aşa ţanţoşă."},{"id":"story-ro-prostia-omeneasc-poveste-2","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":268,"excerpt":"– Iată cum. Vezi drobul cel de sare pe horn? – Îl văd. Şi? – De s-a sui mâţa, are să-l trântească drept în capul copilului şi să mi-l omoare! – Vai de mine şi de mine, că bine zici, fata mea; se vede că i s-au sfârşit mititelului zilele!"},{"id":"story-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":170,"excerpt":"Ghita era un om simplu care visa la o viata mai buna pentru familia sa. Cand a auzit ca moara de la marginea satului e de inchiriat, a vazut o sansa. \"Hai sa luam moara,\" i-a spus sotiei lui, Ana. \"Vom munci si vom prospera.\" La inceput, totul a mers bine."},{"id":"story-ro-sult-nica-3","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"– Aşa e omul… un ciocan, încă unul ş-al treilea, până ajungi la tinichea… d-acolo-ncolo… Dumnezeu cu mila… torni, parcă torni într-o pârnaie… Dar Sanda ce-o să zică… că mi-a dat Sfântul muiere harnică, dar rea, topenia pământului!… Înlăuntru s-aud ciocneli de pahare, buşeli de călcâie şi zbârnâitul otova al cobzarului. Trăgeau chindia de curgea ţărâna din pod."},{"id":"story-ro-mo-nichifor-co-cariul-2","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":224,"excerpt":"Două iepe, albe ca zăpada şi iuţi ca focul, se sprijineau mai totdeauna de oiştea căruţei; mai totdeauna, dar nu totdeauna, căci moş Nichifor era şi geambaş de cai, şi când îi venea la socoteală, făcea schimb, ori vindea câte-o iapă chiar în mijlocul drumului, şi atunci rămânea oiştea goală pe de-o parte."},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."},{"id":"story-ro-uer","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"La răspântia căilor singuratice, unde călătorul e minune şi glasul omului poveste, o colibă, dusă pe jumătate în pământ, stă locului neclintită. Poveşti de Barbu Ştefănescu Delavrancea - Şuer Stăpânul lumii e vântul, şi aruncă, ca în bătătură la el, clăi de nori posomorâţi peste întinsul cerului."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
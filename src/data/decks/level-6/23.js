@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136915","romanian":"De fapt, știe foarte puține despre această chestiune.","english":"As a matter of fact, he knows very little of the matter.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11959366"},{"id":"tat-13598708","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singură.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064121","romanian":"Tom a fost la plajă săptămâna trecută.","english":"Tom went to the beach last week.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070852"},{"id":"tat-1120906","romanian":"El este un conducător auto cu experienţă.","english":"He is an expert driver.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11856429"},{"id":"tat-1136912","romanian":"Casa mea e aproape de stația de autobuz.","english":"My house is close to a bus stop.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966001"},{"id":"tat-1153161","romanian":"Era obișnuită să trăiască dintr-un venit modest.","english":"She was used to living on a small income.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1752003"},{"id":"tat-1144321","romanian":"Cam acum patru ani, tendonul lui Ahile a început să mă doare și mi s-a spus că e tendinită.","english":"About four years ago my Achilles tendon started to hurt and I was told it was Achilles tendonitis.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073567"},{"id":"tat-5370019","romanian":"Un intelectual este o persoană care a descoperit ceva mai interesant decât sexul.","english":"An intellectual is a person who has discovered something more interesting than sex.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064024","romanian":"De îndată ce m-a văzut a început să plângă.","english":"As soon as she saw me, she started to cry.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10936810"},{"id":"tat-1136627","romanian":"Cu toții ne dorim pace.","english":"We all wished for peace.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239780"},{"id":"tat-1064028","romanian":"De îndată ce m-a văzut a izbucnit în plâns.","english":"As soon as she saw me, she burst out crying.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10913317"},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536451","romanian":"Ar fi distractiv să vezi cum se schimbă lucrurile de-a lungul anilor.","english":"It would be fun to see how things change over the years.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1185117","romanian":"Am o părere bună despre tânărul candidat.","english":"I have a good opinion of the young candidate.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323560"},{"id":"tat-1192713","romanian":"A avut timp să-și pregătească oamenii de luptă.","english":"He had time to prepare his men for battle.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2953687"},{"id":"tat-699627","romanian":"Ieri am mâncat un măr.","english":"Yesterday, I ate an apple.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8320082"},{"id":"tat-1137558","romanian":"Această aplicație vă va lăsa să sincronizaţi fotografiile și muzica dumneavoastră între toate aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6867575","romanian":"Procurorii în instanță trebuie să-și justifice afirmațiile pentru a demonstra că un suspect este vinovat.","english":"Prosecutors in court have to substantiate their claims in order to prove a suspect is guilty.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-708926","romanian":"Ne-am ascuns după un tufiş pentru ca nimeni să nu ne vadă.","english":"We hid behind a bush so that no one would see us.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397998"},{"id":"tat-11663746","romanian":"Toki Pona nu este o limbă care trebuie vorbită, ci doar care trebuie citită și scrisă.","english":"Toki Pona is not a language to be spoken, but only to be read and written.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-calatorie-tren","title":"Calatorie cu trenul","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Trenul pleaca din Bucuresti la ora sase dimineata. Afara e inca intuneric, dar in vagon e cald si luminos. Ma asez langa fereastra si privesc cum orasul dispare incet in urma. Blocurile gri lasa loc campurilor verzi, apoi dealurilor si muntilor. O doamna in varsta se aseaza langa mine. Poarta o basma colorata si are ochi calzi."},{"id":"story-ro-bunicul-2","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"– Da. – Tată-moşule, aş vrea să-mi crească şi mie aripi şi să zbor sus de tot, până în slava cerului, zise băiatul netezindu-i barba. – Dacă ţi-o creşte ţie aripi, zise fata, mie să-mi prinzi o presură şi un sticlete. – Da… hî… hî… poi ce fel… şi mie? Fata se întristă."},{"id":"story-ro-povestea-porcului-2","title":"Povestea porcului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"– Ştiu, măi babă, dacă mi-i spune."},{"id":"story-ro-departe-departe-3","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":210,"excerpt":"Şi când mi se păru că palatul se şterge de pe faţa pământului, o rupsei la fugă îndărăt, căci ce m-aş fi făcut în aşa pustietate? Şi de ce goneam, de ce palatul se ridica uşor din grădinile fumurii. Lacul e roşu ca sângele. Apune soarele. Mă rezemai de-o salcie scorburoasă şi începui să mă gândesc. Mi-e foame."},{"id":"story-ro-popa-tanda-3","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":213,"excerpt":"O vorbă și încă ceva, pentru mai bună înțelegere, la protopop, o cale la episcopie, și aici o vorbă bună de la protopop: lucrurile se fac, numai dacă le știm face. Cu mult, cu puțin, părintele Trandafir fu trimis de la Butucani la Sărăceni — pentru buna înțelegere între credincioși. Popă-n Sărăceni? Cine știe ce vrea să zică popă-n Sărăceni!"},{"id":"story-ro-sorcova-3","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":241,"excerpt":"II Zăpada îi pătrunsese în tindă; vântul îi cânta prin crăpăturile uşii parc-ar fi vuit în duba mare; şi Bălaşa era întinsă în pat, învelită c-o plapumă veche, soioasă şi ciuruită cu găuri prin care ieşeau gheomotoacele de lână neagră. Pe picioare îşi trântise două scovergi."},{"id":"story-ro-capra-cu-trei-iezi-2","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":219,"excerpt":"– Mergi sănătoasă, mămucă, zise cel mic, cu lacrimi în ochi, şi Dumnezeu să-ţi ajute ca să te întoarne cu bine şi să ne-aduci demâncare. Apoi capra iese şi se duce în treaba ei. Iar iezii închid uşa după dânsa şi trag zăvorul. Dar vorba veche: \"Păreţii au urechi şi fereştile ochi\"."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-5158943","romanian":"Ceea ce îi este permis lui Jupiter nu este în mod necesar permis și unui bou.","english":"All that is allowed to Jupiter is not necessarily allowed to an ox.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1163911","romanian":"Tata ia metroul de ora 7 către serviciu.","english":"Father takes the 7:00 subway to work.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196999"},{"id":"tat-1136907","romanian":"Ai înţeles ce a zis?","english":"Did you understand what he said?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960213"},{"id":"tat-7115224","romanian":"Ambii sportivi sunt foarte îndârjiți și deseori pot să apară animozități între ei.","english":"Both sportsmen are very competitive and, often, animosities arise between them.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6826727","romanian":"Fericirea, am descoperit, este aproape întotdeauna o revenire dintr-o muncă grea.","english":"Happiness, I have discovered, is nearly always a rebound from hard work.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1143144","romanian":"E un lac în fața casei mele.","english":"There is a lake in front of my house.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068930"},{"id":"tat-1153773","romanian":"Am lucrat pe un contract anual.","english":"I worked on a yearly contract.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128476"},{"id":"tat-714064","romanian":"Julio se leagănă in hamacul pe care l-am atârnat sub bătrânul stejar.","english":"Julio is swinging in the hammock that I hung under the old oak tree.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469770"},{"id":"tat-4961201","romanian":"Fii atent: în limba engleză scriem cu litere mari naționalitățile, zilele săptămânii și limbile străine.","english":"Be careful: We capitalize nationalities, days of the week, and languages in English.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5226154","romanian":"Tom și-a abandonat mașina, care a rămas fără benzină, și a început să meargă pe jos.","english":"Tom abandoned his car that had run out of gasoline and started walking.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1138145","romanian":"Anul trecut în Filipine, cutremurele şi valurile gigantice au produs moartea a mai mult de 6000 de oameni.","english":"Last year in the Philippines, earthquakes and tidal waves resulted in the deaths of more than 6000 people.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-487300","romanian":"Înțelepciunea nu vine în mod automat cu vârsta.","english":"Wisdom does not automatically come with age.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270672"},{"id":"tat-1136545","romanian":"Fundul oceanului este studiat de câţiva oameni de știință.","english":"The ocean floor is being studied by some scientists.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965763"},{"id":"tat-408090","romanian":"Prietenul nostru a terminat cursa al doilea.","english":"Our friend finished the race in second place.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232893"},{"id":"tat-1064309","romanian":"L-am văzut pe Tom sărutând-o pe Mary.","english":"I saw Tom kiss Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045415"},{"id":"tat-6713884","romanian":"Băuturile pe bază de zahăr nu au valoare nutritivă și contribuie semnificativ la creșterea în greutate.","english":"Sugary drinks have no nutritional value and contribute significantly to weight gain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1185074","romanian":"Ar putea deveni jucător de baseball.","english":"He may become a baseball player.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321358"},{"id":"tat-1064436","romanian":"El este de două ori mai mare decât ea.","english":"He is twice as old as she is.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11077419"},{"id":"tat-6764268","romanian":"El a crezut că afirmația ei este pur și simplu imposibilă și a consimțit propunerea.","english":"He believed her assertion to be simply impossible and assented to the proposal.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153775","romanian":"La ce oră se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"}],"stories":[{"id":"story-ro-ho-u-mp-rat","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat mare şi puternic. Abia la vremea cărunteţei dobândi şi el un copil. Bucuria lui fu nespusă când se văzu şi el tată, şi toată împărăţia lui fu veselă dinpreună cu dânsul, căci acest împărat era bun, drept şi temător de Dumnezeu. Pentru aceasta, el făcu mult bine poporului său."},{"id":"story-ro-soacra-cu-trei-nurori","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":221,"excerpt":"Era odată o babă, care avea trei feciori nalţi ca nişte brazi şi tari de virtute, dar slabi de minte. Poveşti de Ion Creangă - Soacra cu trei nurori O răzeşie destul de mare, casa bătrânească cu toată pojijia ei, o vie cu livadă frumoasă, vite şi multe păsări alcătuiau gospodăria babei."},{"id":"story-ro-ileana-cea-ireat","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":215,"excerpt":"A fost odinioară un împărat care avea trei fete, dintre care cea mai mare era frumoasă, cea mijlocie şi mai frumoasă, iar cea mai tânără, Ileana, atâta de frumoasă încât şi Sfântul Soare se oprea în cale ca s-o vadă şi să se desfăteze de frumuseţea ei."},{"id":"story-ro-cele-trei-rodii-aurite-2","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":217,"excerpt":"Un an de zile trecuse de când călătorea; ajunsese prin pustietăţi nelocuite de oameni, şi tot rătăcind în sus şi în jos, două rânduri de haine se rupseră şi le lepădase. Neştiind ce să facă, hotărî a mai merge câtva, şi dacă nu va putea descoperi nimic, să se întoarcă."},{"id":"story-ro-popa-duhu","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"Cine-a întâlnit vrodată în calea sa un popă, îmbrăcat cu straie sărăcuţe, scurt la stat, smolit la faţă, cu capul pleş, mergând cu pas rar, încet şi gânditor, răspunzând îndesat \"sluga dumitale\" cui nu-l trecea cu vederea, căscând cu zgomot când nu-şi găsea omul cu care să stea de vorbă, făcând lungi popasuri prin aleiele ascunse ale grădinilor publice din Iaşi, câte cu o carte în mână, tresărind la cântecul păserelelor şi oprindu-se cu mirare lângă moşinoaiele de furnici, pe care le numea el \"republici înţelepte\", dezmerdând iarba şi florile câmpului, icoane ale vieţii omeneşti, pe care le uda câte c-o lacrimă fierbinte din ochii săi şi apoi, cuprins de foame şi obosit de osteneală şi gândire, îşi lua cătinel drumul spre gazdă, unde-l aştepta sărăcia cu masa întinsă."},{"id":"story-ro-bunica-3","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":218,"excerpt":"Măria-ta, să ştii că atunci când or lega rod ăşti doi meri, împărăteasa o să rămână grea şi o să nască un cocon cu totul şi cu totul de aur\"… Piticul se duse, şi împăratul alergă în grădină, şi căută, căută peste tot locul, până dete peste ăi doi meri."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
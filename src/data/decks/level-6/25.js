@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-864947","romanian":"Trebuie să găsesc o ieşire din acestă problemă.","english":"I need to find a way out of this problem.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10113453"},{"id":"tat-6871781","romanian":"Acea persoană m-a întrebat cine sunt, dar nu am considerat necesar să îi răspund.","english":"That person asked me who I was, but I did not deem it necessary to answer him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6581888","romanian":"Ar fi trebuit să fii mai atent și să nu te încrezi în el.","english":"You should have known better than to trust him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7192267","romanian":"El nu era omul care să se lase descurajat de un singur eșec.","english":"He was not a man to be disheartened by a single failure.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6068363","romanian":"Acești arbori cotiți sunt echilibrați cu precizie pentru motoarele cu turație ridicată și lină.","english":"These crank shafts are precision balanced for smooth high revving engines.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136532","romanian":"Profesorul ne-a dat o mulțime de teme pentru acasă.","english":"The teacher gave us a lot of homework.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960883"},{"id":"tat-923891","romanian":"Camera arată diferit, acum îmi place mai mult.","english":"The room looks different, now I like it more.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10445017"},{"id":"tat-9819149","romanian":"Creșterea incontrolabilă a populației mondiale va duce inevitabil la războaie, crize economice și umanitare.","english":"The uncontrolled growth of world population will inevitably lead to wars, economic and humanitarian crises.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-408013","romanian":"Ce crezi că are de gând Dana?","english":"What do you think Dana has in mind?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6532049"},{"id":"tat-1185066","romanian":"Îți este interzis să intri în acest loc.","english":"You are banned from entering this place.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320722"},{"id":"tat-1143119","romanian":"Tom va ajunge o oră mai târziu.","english":"Tom will be arriving an hour late.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070045"},{"id":"tat-10792151","romanian":"Dulapul este confecționat din lemn de culoare închisă și are mânere ornamentate din aur.","english":"The wardrobe is made from dark wood and has ornate gold handles.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10450497","romanian":"Am mers la supermarket și am cumpărat niște cireșe fiindcă erau la reducere.","english":"I went to the supermarket and bought some cherries because they were on sale.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536438","romanian":"Acesta va fi un bun suvenir din călătoria mea în jurul Statelor Unite.","english":"This will be a good souvenir of my trip around the United States.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136897","romanian":"Vecinul și-a ițit capul peste zid pentru o clipă.","english":"The neighbor popped his head up over the wall for a moment.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965962"},{"id":"tat-411857","romanian":"Vreți să mergeți la film sau la teatru?","english":"Do you want to go to the movies or to the theater?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271921"},{"id":"tat-1185075","romanian":"Îi va lua mult să-și revină?","english":"Will it take long to recover?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321365"},{"id":"tat-6582845","romanian":"Cei mai mulți dintre țăranii care locuiesc în acest sat uitat-de-lume sunt analfabeți.","english":"Most of the peasants living in this godforsaken village are illiterate.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192834","romanian":"În Japonia, noul an școlar începe în aprilie.","english":"The new school year begins in April in Japan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361249"},{"id":"tat-1136659","romanian":"Nu are mai mult de o sută de cărți.","english":"He has no more than one hundred books.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227583"}],"stories":[{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-3","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Boiul lor era mândru, amândoi aveau pe vino-ncoace, vorba lor, era vorbă cu lipici şi amândoi erau voinici, nevoie mare. Într-o zi se hotărâră să meargă la vânătoare. Împărăteasa se tot ciudea cum să-şi cunoască pe fiul său: fiindcă şi feţele şi îmbrăcăminţile fiind la fel, de multe ori nu putea să deosebească pe unul din altul."},{"id":"story-ro-fata-mo-ului","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":208,"excerpt":"Copiii cutreierau voioşi via părăginită. Un şir, ţinându-se cu amândouă mâinile de mijloc, se încolăcea, strigând de frică să nu-i înhaţe \"mama-gaia\". Fetele începuseră \"de-a ulciorul\". – Cum dai ulciorul? Poveşti de Barbu Ştefănescu Delavrancea - Fata moşului – Cum îl vezi, cu ochii verzi, ş-o lingură de păsat, să nu zacă de vărsat. Sub castani, oamenii stau de vorbă."},{"id":"story-ro-povestea-porcului","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Cică erau odată o babă şi un moşneag: moşneagul de-o sută de ani, şi baba de nouăzeci; şi amândoi bătrânii aceştia erau albi ca iarna şi posomorâţi ca vremea cea rea din pricină că nu aveau copii. Şi, Doamne!"},{"id":"story-ro-z-na-z-nelor-3","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Mai se suci, mai se învârti să scape de pacoste, şi nu fu nici un chip. Dacă văzu şi văzu, se hotărî şi el a se duce acasă cu saxanaua în spinare şi o luă la drum. În cale, băgă de seamă că alte şase bufniţe se ţineau după dânsul."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-3","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Băietul când s-o făcut mare o ‘ntrebat: – Mamă, unde-i tata? Ea i-a spus lui, că nu ştie cine-i. Zice: – Eu mă duc, mamă, să-l cat. – Te-i duce, dragul mamei, da dacă-i pute scoate copacul de aici din pământ. Cum a pus mâna, l-o scos cum aş scoate eu o rădăcină de morcov."},{"id":"story-ro-neghini","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"A fost odată o babă, bătrână, bătrână. Abia zărea de bătrână ce era. Şi mâinile îi umblau la ciorap, iar în gândul ei se ruga la Dumnezeu s-o dăruiască cu un copil, că n-avea decât pe unchiaşul ei."},{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
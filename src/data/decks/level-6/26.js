@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-2568484","romanian":"Locuiesc aproape de mare, așa că am de multe ori ocazia să merg la plajă.","english":"I live near the sea, so I often get to go to the beach.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-583839","romanian":"Tom s-a căsătorit cu o femeie mai în vârsta.","english":"Tom married an older woman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2255151"},{"id":"tat-487323","romanian":"Ea a încremenit în picioare ca și cum ar fi văzut o fantomă.","english":"She stood transfixed as if she had seen a ghost.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336252"},{"id":"tat-1064368","romanian":"Tom și Mary au devenit foarte buni prieteni.","english":"Tom and Mary became very good friends.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074336"},{"id":"tat-13615591","romanian":"Te poți uita în geanta ta? Mi-am pus mobilul acolo.","english":"Can you have a look in your bag? I put my mobile in there.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136852","romanian":"Jucătorul de șah și-a pus adversarul în șah.","english":"The chess player put his opponent in check.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966267"},{"id":"tat-1144314","romanian":"Deficitul de apă este din cauza vremii.","english":"The water shortage is due to the weather.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073464"},{"id":"tat-1185070","romanian":"Mi-e teamă că am luat o răceală.","english":"I worry that I have caught a cold.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321256"},{"id":"tat-1186853","romanian":"- 30 de dolari e mult pentru acea cameră mică, se gândi el.","english":"Thirty dollars is a lot for that small room, he thought.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338197"},{"id":"tat-224","romanian":"Dezvoltarea sustenabila trebuie sa fie prioritatea noastra principala.","english":"Sustainable development must be our main priority.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1136386","romanian":"Vestea despre moartea lui s-a răspândit în jur.","english":"The news of his death spread around.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962818"},{"id":"tat-1186847","romanian":"Recordul lui nu va fi niciodată întrecut.","english":"His record will never be broken.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338182"},{"id":"tat-2568530","romanian":"Pentru el, foamea era un concept abstract; el a avut întotdeauna suficientă mâncare.","english":"To him, hunger was an abstract concept; he always had enough to eat.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4993423","romanian":"Opozanții spun că culturile modificate genetic se pot poleniza încrucișat și pot strica alte culturi.","english":"Opponents say genetically engineered crops can cross-pollinate and damage other crops.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-584349","romanian":"Nu lăsa pe mâine ce poţi face poimâine.","english":"Never put off until tomorrow what you can do the day after tomorrow.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798076"},{"id":"tat-1064200","romanian":"Fustele mini nu mai sunt la modă.","english":"Miniskirts have gone out of fashion.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066254"},{"id":"tat-1143221","romanian":"Cred că au fost căsătoriți timp de cinci ani.","english":"I think they have been married for five years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049596"},{"id":"tat-1143148","romanian":"Dar un om nu este făcut pentru înfrângere. Un om poate fi distrus, dar nu învins.","english":"But a man is not made for defeat. A man can be destroyed but not defeated.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068955"},{"id":"tat-6637083","romanian":"Construcția barajului a creat un lac artificial, care a distrus un întreg ecosistem.","english":"The construction of the dam created an artificial lake that destroyed a whole ecosystem.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185173","romanian":"A zis că trebuie să păstrăm secretul.","english":"He said we must keep the secret.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324299"}],"stories":[{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."},{"id":"story-ro-borta-v-ntului-3","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Omul a doua zi se scoală, ia măgarul şi se duce – acasă şi-i zice: măgar, fa bani! Măgarul, de unde? El apuc’ un druc şi ‘ncepe a dişăla măgarul. – Acu nu-l mai iert eu. Se porneşte să ‘ntâlnească pe moşneag şi s’ astupe borta vântului. Întâlneşte pe D-zeu."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"},{"id":"story-ro-z-na-z-nelor","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":";A fost odată un împărat mare şi puternic, şi el avea trei feciori. Făcându-se mari, împăratul se gândi fel şi chipuri cum să facă să-şi însoare copiii ca să fie fericiţi. Într-o noapte, nu ştiu ce visă împăratul, că a doua zi, de mânecate, îşi chemă copiii şi se urcă cu dânşii în pălimarul unui turn ce avea în grădină."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."},{"id":"story-ro-p-cal","title":"Păcală","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Un negustor, umblând prin mai multe sate şi oraşe, ca să cumpere grâu, păpuşoi şi altele, într-o zi ajunse la un pod şi când era să treacă văzu un om care se odihnea acolo: acesta era Păcală."},{"id":"story-ro-scormon-2","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Îi mai place afară la uliță. Nu pentru că ar fi trecători, dar afară cântecul vine mai bine. E cald, dar deprinsă e fata la ger și la arșiță. Cu brațele goale, cu poalele aninate în brâu și cu ștergarul în cap, ea nici nu simte vremea lui cuptor; cântă, întinde firul, descurcă jirebia și se pierde în tinerețile ei."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1119756","romanian":"În acest oraș, există trei saloane de înfrumusețare.","english":"In this city, there are three beauty salons.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6264837"},{"id":"tat-6824680","romanian":"De acum înainte, această veveriță va fi cunoscută sub numele de \"Cea drăguță\".","english":"This squirrel shall be henceforth known as \"The Cute One.\"","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6824477","romanian":"Lumea pe care am văzut-o în visul meu era o lume pașnică, lipsită de război.","english":"The world which I saw in my dream was a peaceful world devoid of war.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1185124","romanian":"Te-ai simțit bine la cină?","english":"Did you have a good time at the dinner?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323857"},{"id":"tat-712094","romanian":"E cel mai bun jucător din echipa noastră.","english":"He is the best player on our team.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440082"},{"id":"tat-1153837","romanian":"Amestecă bucuriile uneori cu cea mai serioasă ocupație.","english":"Mingle your joys sometimes with your earnest occupation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130097"},{"id":"tat-1143183","romanian":"A fost obligată să renunțe la plan.","english":"She was obliged to give up the plan.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069259"},{"id":"tat-1288426","romanian":"Câțiva dintre noi din Westmont de asemenea mergem la Ensanada în acest sfârșit de săptămână!","english":"A group of us from Westmont is going to Ensanada this weekend as well!","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-582926","romanian":"Există oameni atât de flămânzi în lume, încât Dumnezeu nu le poate apărea decât sub formă de pâine.","english":"There are people in the world so hungry, that God cannot appear to them except in the form of bread.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6440496"},{"id":"tat-11740023","romanian":"Când traduceți, este necesar să aveți toată rigoarea și niciun respect pentru original.","english":"When translating, one must have all the rigor and no respect for the original.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143230","romanian":"Mă doare brațul unde m-ai lovit.","english":"I have a very sore arm where you hit me.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068473"},{"id":"tat-1136830","romanian":"Persoanele care călătoresc în străinătate trebuie întotdeauna să se obișnuiască cu mâncăruri noi.","english":"People traveling abroad always have to get used to new food.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966321"},{"id":"tat-1185078","romanian":"Noua lege a fost impusă oamenilor de pe insulă.","english":"The new law was enforced on the people of the island.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321427"},{"id":"tat-1279158","romanian":"Ceasul meu înaintează cu cinci secunde pe zi.","english":"My clock is running 5 seconds faster every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13123222"},{"id":"tat-1279041","romanian":"Nimeni nu a venit să mă ajute.","english":"Nobody came to help me.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/13108759"},{"id":"tat-6599793","romanian":"Ți-ar plăcea să vezi cu mine sâmbătă o interpretare live a unei piese?","english":"Would you like to see a live performance of a play with me Saturday?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862403","romanian":"După aceea, nu am vorbit cu ei.","english":"Afterwards, I did not speak with them.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9460600"},{"id":"tat-5037534","romanian":"Ce zici despre formarea unui grup pe Facebook cu scopul de a discuta studierea limbilor străine?","english":"What about putting together a group on Facebook so we can discuss studying foreign languages?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13632854","romanian":"Există o scădere vizibilă în ceea ce privește respectul pentru autorități și tradiții.","english":"There’s a noticeable decline in respect for authority and tradition.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064310","romanian":"L-am văzut pe Tom lovind-o pe Mary.","english":"I saw Tom hit Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045325"}],"stories":[{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-ro-sarea-n-bucate","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"A fost odată un împărat. Acest împărat avea trei fete. Rămânând văduv, toată dragostea lui el şi-o aruncase asupra fetelor."},{"id":"story-ro-prostia-omeneasc-poveste-3","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":204,"excerpt":"– Mulţămesc dumitale, prietene! – Da’ ce faci aici? – Ia, mă trudesc de vro două-trei zile să car pocitul ist de soare în bordeiu, ca să am lumină, şi nici că-l pot… – Bre, ce trudă! zise drumeţul. N-ai vrun topor la îndămână? – Ba am. – Ie-l de coadă, sparge ici, şi soarele va intra singur înlăuntru."},{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-p-cal-n-satul-lui-3","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Vedeau parcă cele şapte viţeluşe cum se fac viţele, juninci, cum ajung în cele din urmă vaci şi ele, şi cum le vinde Păcală şi pe ele şi se întoarce de la târg cu o spuză de viţeluşe, toate flămânde, toate pornite din fire să se facă viţele, juninci şi vaci în cele din urmă. – Măi!"},{"id":"story-ro-neghini-3","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":235,"excerpt":"– Bine, bine, zise acelaşi glas, văd eu că nu-ţi trebuie copii… Baba îşi luă inima în dinţi şi zise: – Ba-mi trebuie… da’ unde eşti… cine eşti? – Cine sunt? Neghiniţă, gândul lumii. De mic ce sunt, pătrund în urechile oamenilor şi-i ascult cum gândesc."},{"id":"story-ro-poveste-r-neasc","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":252,"excerpt":"A fost odată un împărat. El avea trei feciori. Când fu la ceasul morţii, îşi chemă feciorii şi le zise: Poveşti de Petre Ispirescu - Poveste ţărănească – Feţii mei, sunt cu sufletul la gură, precum mă vedeţi; un lucru numai vă cei: în cele trei nopţi după înmormântarea mea, să-mi păziţi mormântul, câte unul din voi."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059501","romanian":"General Motors a dat afară cei 76.000 de muncitori.","english":"General Motors laid off 76,000 workers.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7534514"},{"id":"tat-582948","romanian":"Democrația este cea mai proastă formă de guvernământ, cu excepția tuturor celorlalte care au fost încercate.","english":"Democracy is the worst form of government, except all the others that have been tried.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6569015"},{"id":"tat-709935","romanian":"Sărăcia este o povară, dar nu o ruşine.","english":"Poverty is a pain, but no disgrace.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5915496"},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1064255","romanian":"Tom s-a prefăcut că nu aude nimic.","english":"Tom pretended to not hear a thing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073104"},{"id":"tat-1064343","romanian":"Tom și Mary vor avea un copil.","english":"Tom and Mary are going to have a baby.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11063518"},{"id":"tat-1064070","romanian":"Ce să fac ca să nu mai sughit?","english":"What should I do to stop hiccups?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11068880"},{"id":"tat-406055","romanian":"Când o întâlnisem în București, Anca era studentă.","english":"When I had met her in Bucharest, Anca was a student.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347370"},{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143181","romanian":"Știa că nu va putea câștiga.","english":"He knew he could not win.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069238"},{"id":"tat-1143120","romanian":"Inversa unei matrice nepătratice este un lucru periculos.","english":"The inverse of a non-square matrix is a dangerous thing.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068786"},{"id":"tat-864483","romanian":"Fiecare este o lună, și are o parte întunecată pe care nu o arată nimănui niciodată.","english":"Everyone is a moon, and has a dark side which he never shows to anybody.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6827316"},{"id":"tat-1153774","romanian":"Într-un final, Susan îi taie mamei vorba, promite să-i scrie și închide telefonul.","english":"Finally, Susan cuts her mother short, promises to write, and hangs up.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128481"},{"id":"tat-610807","romanian":"Mă surprinzi mereu cu sosirile tale neașteptate.","english":"You always astonish me with your unexpected arrivals.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/615896"},{"id":"tat-1143217","romanian":"Acum am nevoie de o asistentă medicală.","english":"I need a nurse now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070009"},{"id":"tat-1136410","romanian":"Cheamă-mă dacă ai nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962814"},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6918496","romanian":"Am crezut că Tom va fi de acord cu mine.","english":"I thought Tom would agree with me.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6795174","romanian":"Muncitorii din țările nordice au plătit un preț ridicat pentru mutarea producției în regiunile sudice.","english":"The workers of the northern countries have paid a high price for the displacement of production in the southern regions.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-porcul-cel-fermecat","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"A fost odată un împărat şi avea trei fete. Şi fiind a merge la bătălie, îşi chemă fetele şi le zise: Poveşti de Petre Ispirescu - Porcul cel fermecat – Iacă, dragele mele, sunt silit să merg la război. Vrăjmaşul s-a sculat cu oaste mare asupra noastră. Cu mare durere mă despart de voi."},{"id":"story-ro-borta-v-ntului-2","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":213,"excerpt":"– Mă duceam s’ astup borta vântului ş’ am întâlnit un nebun pe drum şi mi-o dat o nucă şi-a zis să nu zic pân’ a casă nucă, deschide-te. Ce-a mai fi şi asta? Femeia omului vicleană. Ia o nucă ‘n mână şi zice: – Ia să-ţi văd nuca. Îi schimbă nuca omului."},{"id":"story-ro-povestea-lui-harap-alb","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Amu cică era odată într-o ţară un crai, care avea trei feciori. Şi craiul acela mai avea un frate mai mare, care era împărat într-o altă ţară, mai depărtată. Şi împăratul, fratele craiului, se numea Verde-împărat; şi împăratul Verde nu avea feciori, ci numai fete."},{"id":"story-bunicul-si-marea","title":"Bunicul si marea","author":"Contemporary","difficulty":4,"genre":"memoir","wordCount":165,"excerpt":"Bunicul meu a fost pescar toata viata. Traia intr-un satuc mic pe malul Marii Negre, intr-o casuta alba cu obloanele albastre. In fiecare vara, mergeam la el si impreuna ieseam cu barca pe mare. Bunicul ma invata sa arunc plasa, sa citesc semnele cerului, sa respect apa. \"Marea e ca viata,\" imi spunea el. \"Cateodata e linistita si frumoasa."},{"id":"story-ro-o-via-pierdut","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Crivățul șuieră și vâjie izbind în toate părțile stropii sloiți. Pereții caselor, geamurile ferestrilor, scoarța copacilor, grădelele de prin prejurul grădinii, toate deopotrivă sunt învăluite cu o lucie coajă de sloi. În grădina bisericii, pe piața de dinaintea ei, pe ulițile ce se varsă din toate părțile, oamenii, unii pe jos, alții cu trăsura, grăbesc la adăpostul călduros."},{"id":"story-ro-palatul-de-cle-tar-3","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":268,"excerpt":"Nu trecu cât ai scăpăra din amnar, şi se apropiară de împărat, cu mângâieri şi dezmierdări, odrasla lui, de trei fete, ca trei zâne, surori şi nepoate, care mai de care mai chipeşe şi mai drăgălaşe. Apoi veniră mai-marii tronului şi slugile ohavnice. Toţi cu toţi ieşiră ca dintr-o lacră, să cadă cu mătănii, doară or curma focul împăratului."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
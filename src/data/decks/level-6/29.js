@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-5233192","romanian":"Crezi că Tom ar considera să se întâlnească cu sora mea mai tânără?","english":"Do you think Tom would consider dating my younger sister?","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136890","romanian":"Ei sunt un poet și un om de stat.","english":"They are a poet and a statesman.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957806"},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"},{"id":"tat-1059443","romanian":"Când vine vorba de gătit, nimeni nu mă întrece.","english":"When it comes to cooking, no one can beat me.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9509387"},{"id":"tat-862342","romanian":"John a avut o ceartă violentă cu soția sa.","english":"John had a violent quarrel with his wife.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10020874"},{"id":"tat-2568442","romanian":"E nevoie de înțelepciune pentru a înțelege înțelepciunea: muzica nu înseamnă nimic dacă publicul e surd.","english":"It requires wisdom to understand wisdom: the music is nothing if the audience is deaf.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-706094","romanian":"Mi-am lăsat cheia in cameră.","english":"I left my key in my room.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/972152"},{"id":"tat-709008","romanian":"Una dintre pisici este neagră, cealaltă este maro.","english":"One of the cats is black, the other is brown.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420282"},{"id":"tat-1136977","romanian":"Maşina asta veche e tot timpul stricată.","english":"This old car is always broken.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952911"},{"id":"tat-216","romanian":"Literatura romana clasica reflecta lupta pentru identitate nationala.","english":"Classic Romanian literature reflects the struggle for national identity.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-13427370","romanian":"Am auzit că Tom și cu Mary se căsătoresc în octombrie.","english":"I heard that Tom and Mary will get married in October.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12013309","romanian":"Pentru mine, ca brazilian, studiul limbii galice este ceva cu adevărat delicios și captivant.","english":"For me, as a Brazilian, studying the Galician language is something truly delicious and captivating.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923855","romanian":"M-am căsătorit cu o poloneză.","english":"I am married to a Polish woman.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10442834"},{"id":"tat-7187157","romanian":"Galaxia Calea Lactee este face parte dintr-un grup de aproximativ treizeci și cinci de galaxii.","english":"The Milky Way galaxy is bound in a cluster of about thirty-five galaxies.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059613","romanian":"Cele mai frumoase fete sunt din Lituania.","english":"The most beautiful girls are from Lithuania.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9569381"},{"id":"tat-708930","romanian":"Biroul lui este foarte aproape de al meu.","english":"His office is very close to mine.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398356"},{"id":"tat-1153869","romanian":"Stai nemișcat pentru o clipă, te rog.","english":"Hold still for a moment, please.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098378"},{"id":"tat-12697576","romanian":"Ești ăla care l-ai făcut pe tom sa facă aia?","english":"Are you the one who asked Tom to do that?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":222,"excerpt":"A fost odată ca niciodată; că de n-ar fi, nu s-ar mai povesti; de când făcea plopşorul pere şi răchita micşunele; de când se băteau urşii în coade; de când se luau de gât lupii cu mieii de se sărutau, înfrăţindu-se; de când se potcovea puricele la un picior cu nouăzeci şi nouă de oca de fier şi s-arunca în slava cerului de ne aducea poveşti; Poveşti de Petre Ispirescu - Tinereţe fără bătrâneţe şi viaţă fără de moarte De când se scria musca pe părete, Mai mincinos cine nu crede."},{"id":"story-ro-v-duvele-3","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Amândouă aveau de la răposaţi acareturi bune, aşezate cu temei, să tot ţie şi să nu mai putrezească; ceva bani cheag, ogrăzi cu pruni şi zarzări, grădini cu flori şi legume, toate ocolite cu garduri-pleturi, să nu vezi prin ele, şi umbrite cu streşini de mărăcini."},{"id":"story-ro-inul-i-c-me-a-2","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":219,"excerpt":"Tortul l-au depănat pe râşchitor, spre a-l face căleap; călepele s-au fert cu leşie, să se înălbească, apoi te-au pus pe vârtelniţă, de pe care au început a le depăna pe mosoare cu letca; de pe mosoare te-au urzit pe urzoi, apoi te-au luat şi te-au învălit pe sulul de dinapoi, punând vergele pintre pături, ca să nu se hrentuiască urzala; şi fuscei pintre rost, ca să nu se încâlcească natra."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un biet om sărac. El avea femeie şi trei copilaşi. Lucra bietul om de da pe brânci, zi şi noapte, orice şi pe unde găsea, şi două în tei nu putea lega şi el. Bieţii copilaşi erau mai mult flămânzi decât sătui."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-pungu-a-cu-doi-bani","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o babă şi un moşneag. Baba avea o găină, şi moşneagul un cucoş; găina babei se oua de câte două ori pe fiecare zi şi baba mânca o mulţime de ouă; iar moşneagului nu-i da nici unul."},{"id":"story-ro-coto-man-n-zdr-vanu-2","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Când stăpâna casei făcea la ciorap, pisoiul se juca cu ghemul. Dară nu-l încurca, ferească Dumnezeu. Cum făcea el, cum dregea, se juca aşa de frumuşel, încât ghemul nici nu se desfăşura, nici nu se încurca."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-6794408","romanian":"Creierul uman este un lucru minunat. Funcționează până în momentul în care ții un discurs.","english":"The human brain is a wondrous thing. It works until the moment you stand up to make a speech.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192716","romanian":"Un pantof desperecheat a fost lăsat pe pragul ușii.","english":"An odd shoe was left on the doorstep.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6225612"},{"id":"tat-6741797","romanian":"Dintre toți jucătorii de baseball faimoși, el se evidențiază ca fiind un geniu.","english":"Of all the famous baseball players, he stands out as a genius.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7361805","romanian":"Casa noastră actuală este prea mică, așa că ne-am decis să ne mutăm.","english":"Our current house is too small, so we decided to move.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064314","romanian":"Cât de des o vede Tom pe Mary?","english":"How often does Tom see Mary?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11060128"},{"id":"tat-11270397","romanian":"Mi se pare că am uitat că să închid lumina.","english":"I think that I forgot to turn off the lights.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12929969","romanian":"Poți să mă consideri romantică, draga mea soră, dar simt amarnic lipsa unui prieten.","english":"You may deem me romantic, my dear sister, but I bitterly feel the want of a friend.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1200899","romanian":"Am plâns și am crezut.","english":"I wept and I believed.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11229733"},{"id":"tat-1064177","romanian":"Dintr-o dată mama a început să cânte.","english":"Suddenly, my mother started singing.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070211"},{"id":"tat-1064413","romanian":"L-am văzut uitându-se la mine.","english":"I saw him looking at me.","difficulty":5,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075735"},{"id":"tat-706185","romanian":"Kumi este fata al cărei tată îi plac căinii.","english":"Kumi is the girl whose father likes dogs.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/976233"},{"id":"tat-1136651","romanian":"Această propoziție este la prezentul perfect sau trecutul simplu?","english":"Is this sentence in the present perfect or simple past?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239828"},{"id":"tat-12355737","romanian":"Nu știu ce motiv a fost pentru care nu mi-ai trimis o scrisoare.","english":"I do not know what reason there was why you did not send me a letter.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163897","romanian":"Ce amabil din partea lui să ne ajute să ne mutăm într-o zi atât de ploioasă!","english":"How kind of him to help us move on such a rainy day!","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196806"},{"id":"tat-698962","romanian":"Tu crezi că așa ceva este posibil?","english":"Do you think such a thing is possible?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/3160552"},{"id":"tat-1059642","romanian":"Te rog, păstrează cartea asta la îndemână.","english":"Please keep this book at hand.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/938549"},{"id":"tat-1142942","romanian":"Servitoarea a aranjat cuțitele și furculițele pe masă.","english":"The maid arranged the knives and forks on the table.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066763"},{"id":"tat-10788926","romanian":"Domnul Smith nu este disponibil. Doriți să vă faceți o programare pentru a veni să-l vedeți?","english":"Mr. Smith is not available. Would you like to make an appointment to come see him?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143180","romanian":"Cine ești tu ca să vorbești așa cu mine?","english":"Who are you to talk to me like that?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069234"},{"id":"tat-714067","romanian":"Romeo este bărbatul pe care Julieta îl iubeşte.","english":"Romeo is the man Juliet loves.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469893"}],"stories":[{"id":"story-ro-poveste-r-neasc-2","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Dară feciorul cel mic al împăratului nici nu voi să asculte de unele ca acestea, ci zise: – Duce-mă-voi singur, căci trebuie să fi ştiut tata ce zice, când ne-a poruncit să păzim câte unul singur. Şi astfel, cum veni seara, se duse la locul de pândă."},{"id":"story-ro-frumoasa-lumii-2","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":211,"excerpt":"Alungând-o el prin copac, ea se vârâ-ntr-o bortă… ş-o prinde. El n-a mai stătut către noapte, că s-a temut de draci, ci a luat pasărea ş-a venit acasă ş-a făcut o cuşcă bună ş-a pus pasărea-n cuşcă. Acu el în ziua ceea, era sâmbătă, care-o prins-o, şi duminică dimineaţa s-a ouat un ou. Oul era de aur."},{"id":"story-ro-spaima-zmeilor-2","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":212,"excerpt":"Petre. Oamenii aceştia sunt adevărată pacoste pe capul meu. Mi s-a înăcrit cu ei! – De ce, sfinte Doamne? întrebă portarul raiului. – Nu vezi, răspunse Tatăl Ceresc, că sunt nesăţioşi?! Tot le-am dat, şi nu se mai mulţumesc."},{"id":"story-ro-z-na-mun-ilor","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat foarte viteaz; toate împărăţiile de prinprejurul împărăţiei sale îi cerea sfaturi: atâta era de drept şi înţelept. Când se isca sfadă între dânşii, la acest împărat mergeau mai întâi la judecată şi, cum zicea el, aşa se şi făcea, fiindcă era judecător drept şi iubitor de pace."},{"id":"story-ro-cinci-p-ini-3","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Mai dreaptă împărţeală decât aceasta nu cred că se mai poate nici la Dumnezeu sfântul… – Ba nu, prietene, zice cel cu două pâni. Eu nu mă ţin că mi-ai făcut parte dreaptă. Haide să ne judecăm, şi cum a zice judecata, aşa să rămâie. – Haide şi la judecată, zise celălalt, dacă nu te mulţămeşti."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-3","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":226,"excerpt":"Le dete, deci, voie, şi ei se puseră pe lucru. Pândi în ziua dintâi fiul cel mare; dară păţi ruşinea ce păţise şi ceilalţi pândari din naintea lui. A doua zi pândi şi cel mijlociu; dară nici el nu fu mai breaz, ci se întoarse la tatăl său cu nasul în jos."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-2","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Joian, cea! Bourean\". Boii pornesc. Ţăranul mergea pe lângă boi şi-i tot îndemna să meargă mai iute, ca s-ajungă degrabă acasă şi să ieie pelea vulpii. Însă, cum au pornit boii, vulpea a şi început cu picioarele a împinge peştele din car jos. Ţăranul mâna, carul scârţâia, şi peştele din car cădea."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136689","romanian":"Clasa noastră e formată din 40 de băieți.","english":"Our class consists of 40 boys.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239666"},{"id":"tat-706000","romanian":"Ai avut un sfârşit de săptămână plăcut?","english":"Did you have a good weekend?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968646"},{"id":"tat-4993134","romanian":"Oficialii chinezi spun că creșterea economică a scăzut la minimul ultimilor trei ani din cauza economiei globale.","english":"Chinese officials say economic growth has dropped to a three-year low because of the world economy.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1143146","romanian":"Fără sfatul meu, ai fi eșuat.","english":"But for my advice, you would have failed.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068933"},{"id":"tat-5252491","romanian":"Tom și Mary au fost de acord să plece de la petrecere înainte de miezul nopții.","english":"Tom and Mary agreed to leave the party before midnight.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-411890","romanian":"Când era studentă, mergea des la discotecă.","english":"When she was a student, she used to go to the disco often.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272038"},{"id":"tat-1163907","romanian":"A continuat să plângă cât e noaptea de lungă.","english":"She kept crying all night long.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196991"},{"id":"tat-13603973","romanian":"Tom este cel care mi-a spus că ar trebui să citesc această carte.","english":"Tom is the one who told me that I should read this book.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8773155","romanian":"Layla a intrat într-o depresie profundă în urma pierderii celei mai bune prietene a ei, Salima.","english":"Layla slipped into a deep depression over the loss of her best friend, Salima.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-3629565","romanian":"În aritmetica iubirii, unu plus unu fac totul, pe când doi minus unu este egal cu zero.","english":"In the arithmetic of love, one plus one makes a whole, and two minus one equals zero.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-2568466","romanian":"Opinia e o idee pe care o avem; convingerea - o idee care ne subjugă.","english":"Our opinion is an idea which we have; our conviction an idea which has us.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136962","romanian":"Mi-ar plăcea să îmi cunoști părinții.","english":"I would like you to meet my parents.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956302"},{"id":"tat-1185145","romanian":"Concertul va avea loc vara viitoare.","english":"The concert will take place next summer.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324001"},{"id":"tat-1064244","romanian":"Tom a uitat să își ia medicația azi dimineață.","english":"Tom forgot to take his medication this morning.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11073232"},{"id":"tat-599093","romanian":"Știi cine e blonda înaltă îmbrăcata în verde?","english":"Does anybody know who the tall, blond girl dressed in green is?","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1448294"},{"id":"tat-708939","romanian":"Preţurile vor fi din ce în ce mai mari.","english":"The prices are going up higher and higher.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398956"},{"id":"tat-7187071","romanian":"Ei și-au format propria asociație la nivel național, Asociația Americană a Persoanelor Pensionate.","english":"They have formed their own nationwide association, the American Association of Retired Persons.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-modern-bucuresti","title":"O zi in Bucuresti","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":170,"excerpt":"Maria s-a trezit devreme in acea dimineata de primavara. Soarele abia rasarise deasupra orasului si strazile erau inca linistite. Dupa ce a baut cafeaua, Maria a iesit din apartamentul ei din Drumul Taberei si s-a indreptat spre metrou. Trenul era aproape gol la ora aceea, si Maria a gasit un loc la fereastra."},{"id":"story-ro-poveste-3","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"De se întâlneau, ea cu el, fiecare cu focul lui, se înţelegeau din ochi, deşi abia se mai vedeau, şi cu glas uscat se luau iute la harţă, parc-ar fi fost necăjiţi unul pe altul. – Ei, ce mai ai şi astăzi? – Măria-ta ce ai? – Ce să am, ale pustii de bătrâneţi."},{"id":"story-ro-z-na-mun-ilor-3","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Cum se duse turturica, simţi, nu ştiu cum, nu ştiu de ce, că îi tâcâia inima. După ce se întoarse acasă, era tot cm galeş. Împăratul văzând că tânjeşte fiu-său cu sănătatea, îl întrebă ce are, iară el răspunse că n-are nimic. Turturica aceea era Zâna Munţilor care se îndrăgostise de frumuseţea lui."},{"id":"story-ro-fata-mo-ului-cea-cuminte-3","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"– Om bun, răspunse fata. După ce intră, fiindu-i frică de mumă-sa vitregă să nu o bată dacă se va întoarce acasă, pentru că întârziase, întrebă dacă nu cumva are trebuinţă de o slujnică. Sânta Vinerea, care locuia înăuntru şi care priimi pe fată, îi răspunse că are trebuinţă de o asemenea fată; ea rămase acolo."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un om. El avea o fată şi un băiat. Şi rămânând văduv de muma copiilor, îl îndemnă ariciul să se însoare a doua oară. Neveste-sei îi sta aceşti copilaşi ca sarea în ochi. Nu era dimineaţă, nu era seară, nu era clipă lăsată de la Dumnezeu să nu-i amărască."},{"id":"story-ro-sorcova","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sorcova Troienele se ridicau namilă până în tinda creştinului. Vântul spulbera fulgii de zăpadă în vârteje şi stoluri, repezite în lungul uliţelor, sparte la răspântii şi împrăştiate fără căpătâi în largul maidanelor de la Olănita. Pârtia nu se mai cunoştea. Zăpada îţi trecea de glezne şi mai bine."}],"recipes":[{"id":"recipe-ciorba-perisoare","title":{"ro":"Ciorba de perisoare","en":"Meatball Soup"},"description":{"ro":"Ciorba de perisoare este una dintre cele mai populare supe romanesti.","en":"Meatball soup is one of the most popular Romanian soups."},"difficulty":4,"category":"soup","ingredients":[{"ro":"carne tocata","en":"ground meat","amount":"400 g"},{"ro":"orez","en":"rice","amount":"50 g"},{"ro":"morcov","en":"carrot","amount":"2 bucati"},{"ro":"pastarnac","en":"parsnip","amount":"1 bucata"},{"ro":"bors","en":"fermented bran liquid","amount":"200 ml"},{"ro":"leustean","en":"lovage","amount":"1 legatura"},{"ro":"ou","en":"egg","amount":"1 bucata"}],"steps":[{"ro":"Se amesteca carnea cu orezul si oul pentru perisoare.","en":"Mix meat with rice and egg for meatballs."},{"ro":"Se formeaza perisoare mici.","en":"Form small meatballs."},{"ro":"Se pune apa la fiert cu legumele taiate.","en":"Boil water with chopped vegetables."},{"ro":"Se adauga perisoarle si se fierb 20 minute.","en":"Add meatballs and boil for 20 minutes."},{"ro":"Se acriseste cu bors.","en":"Add fermented bran liquid."},{"ro":"Se serveste cu smantana si leustean.","en":"Serve with sour cream and lovage."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-11089209","romanian":"Tom se va întoarce la Boston cu o zi mai devreme decât mine.","english":"Tom will go back to Boston one day earlier than I will.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-705817","romanian":"El a jucat un rol foarte important în afacere.","english":"He played an important part in the enterprise.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963911"},{"id":"tat-1153162","romanian":"Vrednicia ei este un bun exemplu pentru noi toți.","english":"Her diligence is a good example to us all.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1754261"},{"id":"tat-220","romanian":"Responsabilitatea sociala a corporatiilor devine tot mai importanta.","english":"Corporate social responsibility is becoming increasingly important.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1136530","romanian":"A luat o piatră de pe jos.","english":"He picked up a stone.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964787"},{"id":"tat-1185252","romanian":"Taro, du-te și spală-te pe dinți.","english":"Taro, go and brush your teeth.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328036"},{"id":"tat-1186831","romanian":"Mi-e teamă de ce va spune profesorul.","english":"I am afraid of what the teacher will say.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7295047"},{"id":"tat-1143238","romanian":"Mă uitam în jos către fundul văii.","english":"I was looking downward to the bottom of the valley.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068500"},{"id":"tat-1059687","romanian":"Nimeni nu ne poate controla.","english":"Nobody can control us.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10681475"},{"id":"tat-4993454","romanian":"O persoană având indicele de masă corporală de la 25 la 29 e considerată supraponderală.","english":"A person with a BMI of 25 to 29 is considered overweight.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6981787","romanian":"El putea să vadă că regele lui va primi șah-mat în cinci mutări.","english":"He could see that his king would be checkmated within five moves.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-863666","romanian":"Unde crezi că se duc toți banii?","english":"Where do you think all the money goes?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9145912"},{"id":"tat-202","romanian":"Cultura romaneasca are radacini adanci in traditiile populare.","english":"Romanian culture has deep roots in folk traditions.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1192707","romanian":"Ai o masă în patio?","english":"Do you have a table in the patio?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1309190"},{"id":"tat-7578033","romanian":"Mă doare gâtul și am și febră. Poți să-mi dai niște medicamente pentru răceală?","english":"My throat hurts, and I have a fever. Can I have some cold medicine?","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7187127","romanian":"O galaxie este un grup de stele, praf și gaze și este susținută de către gravitație.","english":"A galaxy is a cluster of stars, dust, and gas which is held together by gravity.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1119769","romanian":"Când a murit? \"Nu cu mult timp în urmă.\"","english":"When did he die? \"Not very long ago.\"","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11845708"},{"id":"tat-1153812","romanian":"O republică este o națiune al cărei conducător nu este un rege sau o regină, ci un președinte.","english":"A republic is a nation whose head is not a king or queen, but a president.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129049"},{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-709043","romanian":"Am fost fascinat de frumuseţea ei.","english":"I was fascinated by her beauty.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420333"}],"stories":[{"id":"story-ro-fata-cu-pieze-rele-2","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Se silea bietul împărat, cu toţi cei doisprezece fii ai săi, să facă pace, să fie între oameni bună învoire, să oprească relele ce-l bântuiau, dar geaba, pagubele curgeau gârlă. În cele mai de pe urmă chemă un cetitor de stele să-i spuie ce e pricina de-i merg lucrurile anapoda şi nu poate să dea înainte."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-2","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"– Să ne despărţim unchiaş, dacă tu aşa găseşti de cuviinţă. Dară bine, cine să ne închiză ochii în ceasul cel de pe urmă? – Că bine zici tu, babo; stăi dară; ia să iei tu basmaua mea care am avut-o în ziua de cununie şi eu ştergarul cel vărgăţel ce mi-ai adus de zestre."},{"id":"story-ro-ursul-p-c-lit-de-vulpe","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":201,"excerpt":"Era odată o vulpe vicleană, ca toate vulpile. Ea umblase o noapte întreagă după hrană şi nu găsise nicăiri. Făcându-se ziua albă, vulpea iese la marginea drumului şi se culcă sub o tufă, gândindu-se ce să mai facă, ca să poată găsi ceva de mâncare."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-3","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Toţi cu totul zicea că aşa i-a fost orânda şi credeau că trebuie să fi căzut asupra capului lui vrun blestem de la Dumnezeu. Ajunsese omul să-şi urască zilele."},{"id":"story-ro-george-cel-viteaz-2","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"Balaurul, văzând una ca aceasta, se repezi şi el asupra împărătesei. Dar împărăteasa dete un ţipet şi se deşteptă. Îi sărise inima de frică şi-i tremurau toate cărnurile. P-aci, p-aci era să şi leşine. Spuse împăratului pocitania de vis, şi rămase şi el înmărmurit de groază."},{"id":"story-ro-cinci-p-ini-2","title":"Cinci pâini","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Nu sunt vrednic să vă mulţămesc de binele ce mi-aţi făcut, căci nu vedeam lumea înaintea ochilor de flămând ce eram. Cei doi nu prea voiau să primească, dar, după multă stăruinţă din partea celui al treilea, au primit. De la o vreme, călătorul străin şi-a luat ziua bună de la cei doi şi apoi şi-a căutat de drum."},{"id":"story-testament","title":"Testament","author":"Tudor Arghezi","difficulty":7,"genre":"poetry","wordCount":130,"excerpt":"Nu-Loss'nti voi lasa drept mostenire, fiule, Nici ogoare largi, nici case inalte, Ci doar un nume curat si-Loss'n suflet Cuvinte multe, frumoase si sfinte. Cartea pe care o scriu e toata viata mea, Fiecare litera e o suferinta, Fiecare pagina e o bucurie, Si fiecare rand e o nadejde."}],"recipes":[{"id":"recipe-mici","title":{"ro":"Mititei (Mici)","en":"Grilled Minced Meat Rolls"},"description":{"ro":"Mititei sunt rulouri de carne tocata condimentata, gatite la gratar. Sunt un simbol al bucatariei romanesti.","en":"Mititei are seasoned minced meat rolls cooked on the grill. They are a symbol of Romanian cuisine."},"difficulty":4,"category":"main","ingredients":[{"ro":"carne tocata de vita","en":"ground beef","amount":"500 g"},{"ro":"carne tocata de porc","en":"ground pork","amount":"250 g"},{"ro":"carne tocata de oaie","en":"ground lamb","amount":"250 g"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"cimbru uscat","en":"dried thyme","amount":"2 linguri"},{"ro":"boia de ardei","en":"paprika","amount":"1 lingurita"},{"ro":"bicarbonat de sodiu","en":"baking soda","amount":"1/2 lingurita"},{"ro":"sare","en":"salt","amount":"1 lingurita"},{"ro":"piper negru","en":"black pepper","amount":"1 lingurita"},{"ro":"zeama de carne","en":"beef broth","amount":"100 ml"}],"steps":[{"ro":"Se amesteca toate tipurile de carne intr-un bol mare.","en":"Mix all types of meat in a large bowl."},{"ro":"Se adauga usturoiul pisat, cimbrul, boia, sarea si piperul.","en":"Add the crushed garlic, thyme, paprika, salt and pepper."},{"ro":"Se dizolva bicarbonatul in zeama de carne si se adauga peste amestec.","en":"Dissolve the baking soda in the broth and add to the mixture."},{"ro":"Se framanta bine timp de 10 minute pana compozitia devine omogena.","en":"Knead well for 10 minutes until the mixture becomes homogeneous."},{"ro":"Se acopera si se lasa la frigider cel putin 4 ore, ideal peste noapte.","en":"Cover and refrigerate for at least 4 hours, ideally overnight."},{"ro":"Se formeaza rulouri de aproximativ 8 cm lungime si 2 cm grosime.","en":"Form rolls about 8 cm long and 2 cm thick."},{"ro":"Se gatesc la gratar sau pe grill, intorcandu-se frecvent, timp de 10-15 minute.","en":"Cook on the grill, turning frequently, for 10-15 minutes."},{"ro":"Se servesc calzi cu mustar si paine proaspata.","en":"Serve hot with mustard and fresh bread."}]}]};
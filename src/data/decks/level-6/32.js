@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1192724","romanian":"L-am făcut să vopsească poarta săptămâna trecută.","english":"I had him paint the gate last week.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221821"},{"id":"tat-702194","romanian":"Am mâncat până mi s-a făcut rău.","english":"I ate myself sick.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397911"},{"id":"tat-1143279","romanian":"Există o limită de două bagaje pentru fiecare pasager.","english":"There is a limit of two pieces of luggage for each passenger.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068665"},{"id":"tat-857387","romanian":"Tango-ul este o exprimare verticală a unei dorinţe orizontale.","english":"Tango is the vertical expression of a horizontal desire.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10023982"},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-212","romanian":"Rezultatele cercetarii au demonstrat ca teoria initiala era corecta.","english":"The research results demonstrated that the initial theory was correct.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1144337","romanian":"A rupt logodna într-o criză de mânie.","english":"She broke off her engagement in a fit of anger.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073722"},{"id":"tat-218","romanian":"Colaborarea internationala este esentiala pentru progresul stiintific.","english":"International collaboration is essential for scientific progress.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-706134","romanian":"Lui Robert i se spune \"Bob\".","english":"They call Robert \"Bob\".","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974457"},{"id":"tat-1137565","romanian":"Cu ajutorul acestei aplicații, veți putea sincroniza fotografiile și muzica între aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-411897","romanian":"Vă trimisesem deja scrisoarea când mi-ați dat telefon.","english":"I had already sent you the letter when you called.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272065"},{"id":"tat-5154335","romanian":"Mi-a plăcut plăcere să te cunosc și aștept cu nerăbdare vești de la tine.","english":"It was nice to meet you, and I look forward to hearing from you.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143189","romanian":"A strâns vesela de pe masă după cină.","english":"She cleared the table of the dishes after dinner.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069281"},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583956","romanian":"Orice ai spune, răspunsul e \"nu\".","english":"No matter what you say, the answer is \"no.\"","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7799488"},{"id":"tat-1144301","romanian":"Refuz să fiu de acord cu acel plan.","english":"I refuse to consent to that plan.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073270"},{"id":"tat-1136858","romanian":"Era cât pe ce să explodeze, dar s-a stăpânit.","english":"He was about to explode, but checked himself.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966284"},{"id":"tat-9839372","romanian":"Părtidelor nu li se permite să discute propunerile lor politice în timpul dezbaterii.","english":"Parties are not allowed to discuss their political propositions during the debate.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13619641","romanian":"Taipanul de uscat, un șarpe întâlnit în Australia, este cel mai veninos șarpe din lume.","english":"The inland taipan, a snake found in Australia, is the most venomous snake in the world.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7115226","romanian":"Când un înțelept se va ridica din nou, el cu siguranță îmi va urma spusele.","english":"When a Sage shall again arise, he will certainly follow my words.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-departe-departe","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"Sub castanii din via părăsită, mai mulţi copilaşi, în cămăşi albe, mă înconjuraseră. Stam pe pământul cald, cu mâinile sub cap, privind adâncul cerului albastru, şi povesteam. Poveşti de Barbu Ştefănescu Delavrancea - Departe, departe O fetiţă îmi sorbea cuvintele, dând într-o parte şi alta, pletele negre ce-i acopereau ochii ei mari şi verzi…"},{"id":"story-ro-norocul-dracului","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Ba e noroc! Poveşti de Barbu Ştefănescu Delavrancea - Norocul dracului – Ba nu e noroc! – Ba e noroc, muiere! – Ba nu e, mă omule, nu! – Adică, nu muncesc eu, femeie? – Ba munceşti pentru unul, şi noi suntem opt guri, şi cu Plăviţa, nouă."},{"id":"story-ro-acul-i-barosul","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Acul: Moşule, de ce eşti zurbagiu? Te sfădeşti necontenit cu soră-ta nicovala, ţipaţi şi faceţi larmă, de-mi ţiuie urechile. Eu lucrez toată ziua, şi nime nu-mi aude gura. Poveşti de Ion Creangă - Acul şi barosul – Iaca, mă! da de unde-ai ieşit, Pâcală?"},{"id":"story-ro-z-na-z-nelor-2","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Se duse şi cel mijlociu şi se întoarse şi el cu o soţioară mândră şi frumoasă. Se duse şi cel mic. Cutreieră lumea până ce ajunse la pădurea cea mare unde se lăsase săgeata lui. Bâjbâi el şi orbăcăi p-acolo prin bunget, până ce dete de copaciul în care se înfipsese şi săgeata lui."},{"id":"story-ro-v-duvele","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"Oamenii, când n-au ce face, se-apucă de gâlceavă. Se dau la vorbă, şi destul e unul s-o apuce anapoda, că cearta e gata. Prostia pândeşte mintea omului cum pândesc lupii razna oilor."},{"id":"story-ro-uer-3","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Kira, zâmbind, răspunde: – Ăl de sus e umbra, mamă; din aşa caier trag ursitorile firul vieţilor de nimic. – Şi de se rupe firul tău, fusul cu tort cade; dar de s-ar rupe firul de umbră, cade şi fusul de pe grinzi?"},{"id":"story-ro-soacra-cu-trei-nurori-2","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":228,"excerpt":"Tustrei feciorii babei umblau în cărăuşie şi câştigau mulţi bani. Celui mai mare îi venea vremea de însurat, şi baba, simţind asta, umbla valvârtej să-i găsească mireasă; şi în cincişase sate, abia-abia putu nimeri una după placul ei: nu prea tânără, naltă şi uscăţivă, însă robace şi supusă."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-411949","romanian":"Am vizitat România acum câțiva ani.","english":"I visited Romania a few years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272263"},{"id":"tat-1143138","romanian":"Doctorul mi-a spus să renunț la fumat.","english":"The doctor told me to give up smoking.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068909"},{"id":"tat-6537690","romanian":"Ar fi mai bine să lași treaba asta cuiva care știe despre ce este vorba.","english":"It would be best to leave it to a man who knows the ropes.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13604225","romanian":"Tom și Mary au spus că au crezut că John va vrea să facă asta.","english":"Tom and Mary said they thought John would be willing to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-405826","romanian":"Zăpada a acoperit tot orașul peste noapte.","english":"The snow covered the whole city overnight.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350529"},{"id":"tat-1133950","romanian":"M-am aşezat şi am deschis laptopul meu.","english":"I sat down and opened my notebook.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9939356"},{"id":"tat-13621234","romanian":"Khan menționează că Hunter este dispărut fără urmă (probabil pentru că nu s-a găsit niciun corp).","english":"Khan mentions that Hunter is M.I.A. (probably because no body was found).","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13612858","romanian":"Tom spuse că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13617013","romanian":"Wisconsin este cunoscut pentru produsele sale lactate, nu pentru vacile sale de lapte.","english":"Wisconsin is known for its dairy, not for its dairy cows.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143191","romanian":"Am știut tot timpul că spunea minciuni.","english":"I knew all along that he was telling a lie.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069296"},{"id":"tat-211","romanian":"Situatia economica actuala ne obliga sa facem schimbari importante.","english":"The current economic situation forces us to make important changes.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1153156","romanian":"M-am dus la petrecere pe prezumția că ea va fi acolo.","english":"I went to the party on the presumption that she would be there.","difficulty":7,"wordCount":11,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749169"},{"id":"tat-709900","romanian":"Astfel de incidente sunt destul de obişnuite.","english":"Such incidents are quite common.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426733"},{"id":"tat-1192751","romanian":"Puteți scădea prețul dacă voi cumpăra două?","english":"Could you knock down the price if I buy two?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1429026"},{"id":"tat-4974910","romanian":"Ieri nu a fost nici prea cald, nici prea rece. A fost o zi ideală pentru o plimbare.","english":"Yesterday it was neither too warm nor too cold. It was an ideal day for taking a walk.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-698941","romanian":"Cum se numește acest râu?","english":"What is the name of this river?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2265424"},{"id":"tat-2040372","romanian":"Inginerii au aruncat podul în aer pentru că era gata să se prăbușească.","english":"The engineers blew up the bridge because it was about to collapse.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153798","romanian":"Indiferent de ce joacă pe ecran, Tom arată grozav.","english":"No matter what he plays on the screen, Tom looks great.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128804"},{"id":"tat-1136964","romanian":"Ieri, s-a dus la școală să studieze.","english":"He went to school to study yesterday.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11957826"},{"id":"tat-584465","romanian":"Mă doare în gât şi îmi curge nasul.","english":"I have a sore throat and runny nose.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7807839"}],"stories":[{"id":"story-ro-uer-2","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":215,"excerpt":"Kira şi-aşteaptă voinicul din haiducie. În coarne de cerb atârnă carabine cu guri largi şi pistoale cu plăsele de argint şi de sidef. Văpaiţa, cu feştilă de câlţi răsuciţi, tremură în colibă o lumină galbenă şi tristă. Flacăra ei slabă joacă, ca şi când ar voi să scape din feştilă, şi aruncă umbra Kirei, de pe perete, sus, pe grinzi."},{"id":"story-ro-povestea-lui-stan-p-itul-2","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"Numai, dă! ce să facă bietul om? Cum era să se întindă mai mult, că de-abia acum se prinsese şi el cu mâinile de vatră; şi câte a tras până s-a văzut la casa lui, numai unul Dumnezeu ştie."},{"id":"story-ro-capra-cu-trei-iezi","title":"Capra cu trei iezi","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":209,"excerpt":"Era odată o capră care avea trei iezi. Iedul cel mare şi cu cel mijlociu dau prin băţ de obraznici ce erau; iară cel mic era harnic şi cuminte. Vorba ceea: \"Sunt cinci degete la o mână şi nu samănă toate unul cu altul\"."},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."},{"id":"story-ro-ivan-turbinc-2","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":224,"excerpt":"– N-ai grijă, Petre, zise Dumnezeu. De drumeţul care cântă să nu te temi. Ostaşul acesta e un om bun la inimă şi milostiv. Vezi-l? Are numai două carboave la sufletul său; şi, drept cercare, hai, fă-te tu cerşetor la capătul ist de pod, şi eu la celălalt."},{"id":"story-ro-c-lin-nebunul-3","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":209,"excerpt":"– Hai! Şi l-a omorât şi pe acesta ş-a făcut patru căpiţi de carne din capetele lui. Acu, când s-au trezit ei, o-nceput să-i deie de grijă lui Călin Nebunul că să păzească bine focul. Acu el a treia noapte era să fie. Acu iar pe la miezul nopţii s-auzi un huiet mare. Un zmeu era – cu opt capete."},{"id":"story-ro-poveste-r-neasc-3","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Cum se auzi cocoşul, duhul pieri ca o nălucă, dară şi băiatul căzu jos de ostenit. De mai ţinea lupta, numai cât ai aţâţa un foc, s-ar fi muiat, şi cine ştie ce se întâmpla. Cum căzu fiul de împărat pe mormântul tătâne-său, acolo şi adormi. Atât era de rupt de oboseală. Când se deşteptă, ce să vedeţi d-voastră?"}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
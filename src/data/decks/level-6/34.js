@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5316056","romanian":"Cel mai periculos lucru pe care Tom l-a făcut vreodată a fost săritura cu coarda elastică.","english":"The most dangerous thing Tom ever tried to do was bungee jumping.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9952605","romanian":"Tom a spus că este dispus să ne împrumute trei mii de dolari.","english":"Tom said he was willing to lend us three thousand dollars.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136948","romanian":"Am învățat multe din cărțile lui.","english":"I learned a lot from his books.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956892"},{"id":"tat-1163919","romanian":"Sherman s-a întâlnit cu Johnston câteva zile mai târziu.","english":"Sherman met with Johnston a few days later.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197069"},{"id":"tat-706081","romanian":"Când ar trebui să aduc maşina înapoi?","english":"When should I return the car?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970925"},{"id":"tat-405844","romanian":"L-am văzut pe Ion la bibliotecă.","english":"I saw John at the library.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350592"},{"id":"tat-1143254","romanian":"Domnul Kinoshita și-a lăsat ochelarii la birou ieri seară.","english":"Mr Kinoshita left his glasses behind in the office yesterday evening.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068562"},{"id":"tat-599089","romanian":"Numele tău se află în capul listei.","english":"Your name stands first in the list.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1447346"},{"id":"tat-4987451","romanian":"Noi credem că este cu adevărat posibil ca cele două sisteme sociale diferite să coexiste în pace.","english":"We believe that peaceful coexistence of the two different social systems is fully possible.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-705790","romanian":"Domnul Suzuki nu este dentist, ci medic.","english":"Mr Suzuki is not a dentist but a physician.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963131"},{"id":"tat-1193104","romanian":"Au eşuat amândoi în găsirea celei mai serioase probleme cu care s-a confruntat vreodată planeta noastră.","english":"They have both failed to find the most serious problem that has ever faced our planet.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1043821"},{"id":"tat-1143134","romanian":"E necugetat din partea ta să crezi asemenea lucru.","english":"It is foolish of you to believe such a thing.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068893"},{"id":"tat-12085392","romanian":"Se zvonea că bea, dar era dificil de dovedit pentru că bea numai singură.","english":"It was rumored that she drank, but it was hard to prove, as she only drank alone.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"},{"id":"tat-1136901","romanian":"Maşina noastră a rămas fără combustibil după zece minute.","english":"Our car ran out of gas after ten minutes.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966025"},{"id":"tat-1143196","romanian":"Ne-am înțeles să ne abținem de la fumat cât suntem la lucru.","english":"We agreed to refrain from smoking while we are at work.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069326"},{"id":"tat-8979884","romanian":"Am convenit asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-864490","romanian":"El ține legătura cu tot felul de oameni.","english":"He is in touch with all kinds of people.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6855690"},{"id":"tat-1192731","romanian":"Fratele meu vrea să meargă pe lună cândva.","english":"My brother wants to go to the moon some day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7507022"}],"stories":[{"id":"story-ro-gura-satului-2","title":"Gura satului","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Feciorii, fiindcă sunt doi și feciori, oricât de voinici ar fi, stau sub porunca părintească; Marta însă e una singură, adică nu mai are în casă pe nimeni deopotrivă cu dânsa. Încă pe când era în fașe, Marta avea obiceiul de a pune toată casa în mișcare."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-3","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":229,"excerpt":"De ce creştea copilul, d-aceea se făcea mai isteţ şi mai îndrăzneţ. Îl deteră pe la şcoli şi filosofi, şi toate învăţăturile pe care alţi copii le învăţa într-un an, el le învăţa într-o lună, astfel încât împăratul murea şi învia de bucurie. Toată împărăţia se fălea că o să aibă un împărat înţelept şi procopsit ca Solomon împărat."},{"id":"story-ro-sarea-n-bucate-3","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":235,"excerpt":"Să te duci de la mine cu sarea ta cu tot! Când auzi fata cea mică a împăratului urgia tatălui său, ce cădea pe capul ei, intră în fundul pământului de mâhnire căci se supărase tată-său şi, încumetându-se, zise: – Să mă ierţi, tată, că eu n-am vrut să te supăr."},{"id":"story-ro-mo-nichifor-co-cariul","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Moş Nichifor nu-i o închipuire din poveşti, ci e un om ca toţi oamenii; el a fost odată, când a fost, trăitor din mahalaua Ţuţuenii din Târgul Neamţului, dinspre satul Vânătorii Neamţului."},{"id":"story-ro-acul-i-barosul-2","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":211,"excerpt":"Mergi la croitor, intră în bordeiu, suie-te în palat, ai să mă găseşti. Fetele mă pun în cutiuţe aurite, mă înfing în perinuţe de mătasă şi îngrijesc de mine ca de un mare lucru. – Da’ în stogul de fân nu vrei să te puie, mititelule?"},{"id":"story-fat-frumos","title":"Fat-Frumos din lacrima","author":"Mihai Eminescu","difficulty":4,"genre":"folktale","wordCount":190,"excerpt":"A fost odata ca niciodata, ca de n-ar fi nu s-ar povesti. A fost odata un imparat batran care avea o singura fiica, frumoasa ca luna pe cer. Imparatul dorea foarte mult sa aiba un fiu, dar sotia lui nu putea sa-i dea un mostenitor. Intr-o noapte, imparateasa a plans atat de mult incat lacrimile ei au format un lac."},{"id":"story-ro-povestea-lui-stan-p-itul","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Era odată un flăcău stătut, pe care-l chema Stan. Şi flăcăul acela din copilăria lui se trezise prin străini, fără să cunoască tată şi mamă şi fără nici o rudă care să-l ocrotească şi să-l ajute."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
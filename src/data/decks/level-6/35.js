@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-4988491","romanian":"Ursul s-a luptat cu vecinul meu până a obosit, apoi cu ultimele puteri a fugit în pădure.","english":"The bear fought with my neighbour until he got tired. Afterwards, with the last of his strength, he fled into the forest.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9586394","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosit ca să gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-862376","romanian":"Din cauză că lumina călătoreşte mai repede decât sunetul, unii oameni par geniali înainte de a suna stupizi.","english":"It is because light travels faster than sound that some people look brilliant before sounding stupid.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9457136"},{"id":"tat-708925","romanian":"Doamna Green ne predă muzica.","english":"Miss Green teaches us music.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397994"},{"id":"tat-1136621","romanian":"M-a făcut să scriu scrisoarea cu stiloul.","english":"He made me write the letter with a pen.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7227767"},{"id":"tat-1200897","romanian":"Am venit, am văzut, am cucerit.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11216029"},{"id":"tat-13616964","romanian":"Voi puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-10450614","romanian":"Biletele sunt 30 de dolari pentru adulți și 15 de dolari pentru copiii de peste 4 ani.","english":"Tickets are $30 for adults and $15 for children over 4 years old.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6599852","romanian":"Din cauza unor circumstanțe neprevăzute, excursia noastră în munți, din acest weekend, va fi anulată.","english":"Due to unforeseen circumstances, our trip to the mountains this weekend will be cancelled.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136909","romanian":"Articolul 6. Președintele va conduce toate întâlnirile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960211"},{"id":"tat-2429205","romanian":"La început am crezut că sunt avantajat având o limbă din familia latină.","english":"At first, I thought I had an advantage because I spoke a Romance language.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153789","romanian":"L-am găsit pe băiat deja adormit.","english":"I found the boy fast asleep.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128663"},{"id":"tat-1136402","romanian":"Conducerea a încercat să liniștească muncitorii oferindu-le un bonus.","english":"Management tried to appease labor by offering them a bonus.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962896"},{"id":"tat-3877969","romanian":"Corpul uman obișnuit conține îndeajuns de multe oase încât să compună un întreg schelet uman.","english":"The average human body contains enough bones to make an entire human skeleton.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-488758","romanian":"Vă rugam să așteptați treizeci de minute.","english":"Please wait for thirty minutes.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268731"},{"id":"tat-1136910","romanian":"Articolul 6. Președintele va conduce toate reuniunile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11953737"},{"id":"tat-8817097","romanian":"Dacă ai probleme, te voi ajuta să studiezi limba engleză.","english":"If you are having problems, I will help you study English.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1064302","romanian":"Tom a întrebat-o pe Mary unde locuiește John.","english":"Tom asked Mary where John lived.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11051404"},{"id":"tat-1192766","romanian":"Acesta este stiloul cu care a scris faimosul romancier.","english":"This is the pen which the famous novelist wrote with.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357144"},{"id":"tat-1136569","romanian":"Prefer să locuiesc la țară decât la oraș.","english":"I prefer living in the country to living in the city.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9017538"}],"stories":[{"id":"story-ro-cei-trei-fra-i-mp-ra-i-3","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"– Ba nici râs, nici nimic, începu a zice neguţătorul cel chiabur. Iată două pungi: nu crez să-ţi dea altul mai mult. Şi scoase pungile cu bani, i le puse în mână, luă oul şi plecă. Bietul om rămase înlemnit în loc, uitându-se după neguţător cum se ducea. Nici că-i venea măcar să crează ochilor."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-2","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Ce nu făcu bietul tată-său, ce nu drese ca să-şi dea fata la casa ei, dară ca s-o înduplece, ba. Ei nu-i da inima să-şi lege capul cu nici unul din peţitorii ce veneau să o ceară, deşi toţi erau împăraţi şi fii de împăraţi."},{"id":"story-ro-ion-roat-i-cuza-vod-2","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Atâta-i ajungea capul, atâta făceau şi ei pe vremea lor, Dumnezeu să-i ierte şi să-i odihnească, unde-or fi acolo, că bună inimă mai aveau! Dar să ne întoarcem iar la Divanul ad-hoc."},{"id":"story-ro-inul-i-c-me-a-3","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"Ei, dragă, poate nu ştii că oamenii mai fac pânză şi din sora noastră cânepă, şi din fratele nostru bumbac, ba şi din înghimpătoarea urzică mai fac un fel de pânză. Dar în fabrici se ţes fel de fel de pânzeturi, mult mai uşor şi în timp mult mai scurt. – Bre! multe mai auzi!"},{"id":"story-ro-limir-mp-rat-2","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":203,"excerpt":"Când se scula, văduva stetea mai bucuros afară decât în casă, şi Lia ridica gunoiul din prag, îl ducea la locul lui, apoi intra ca să dereticească prin colibă, cântând voioasă, şi oglindă luminoasă se făcea toate sub mâna ei, încât, împărat de-ai fi fost, ţi-ai fi părăsit palatele ca să stai în coliba văduvei."},{"id":"story-ro-povestea-porcului-3","title":"Povestea porcului","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"Mai ştiu eu? Poate ori Dumnezeu, ori dracul i-a dat în gând ieri noapte de una ca asta. Şi cum ajunge-acasă, zice: – Iaca, măi băbuşcă, ce odor ţi-am adus eu! Numai să-ţi trăiască! Un băiat ochios, sprâncenat şi frumuşel de nu se mai poate. Îţi seamănă ţie, ruptă bucăţică!"},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat şi o împărăteasă; ei nu făceau copii; umblase pe la toţi vracii şi vrăjitorii, pe la toate babele şi cititori de stele, şi toţi rămaseră de ruşine, căci n-avură ce le face."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
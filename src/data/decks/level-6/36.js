@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1143248","romanian":"Tom a mâncat un castron cu supă de scoici.","english":"Tom ate a bowl of clam chowder.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068554"},{"id":"tat-2536642","romanian":"Cei selecționați vor trebui să se confrunte cu teste medicale și psihologice ample.","english":"Those selected will have to face extensive medical and psychological tests.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-411853","romanian":"În Franța ați lucrat la ambasadă sau la consulat?","english":"In France did you work at the embassy or in the consulate?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6262484"},{"id":"tat-2536493","romanian":"Hei, aș putea să nu am niciun ban, dar încă mai am mândrie.","english":"Hey, I may have no money, but I still have my pride.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-702225","romanian":"Se va despărţi de prietenul ei.","english":"She is going to part from her boyfriend.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398964"},{"id":"tat-10790200","romanian":"Tom are o cicatrice pe încheietura mâinii de când a încercat să se sinucidă.","english":"Tom has a scar on his wrist from when he tried to commit suicide.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1142947","romanian":"Am nevoie de stilouri, caiete și altele.","english":"I need pens, notebooks and so on.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12067969"},{"id":"tat-213","romanian":"In ciuda dificultatilor, echipa a reusit sa termine proiectul la timp.","english":"Despite the difficulties, the team managed to finish the project on time.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1136723","romanian":"Acolo nefiind taxiuri, a trebuit să merg pe jos.","english":"There being no taxis, I had to walk.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226178"},{"id":"tat-6060858","romanian":"Poate ai putea sa inveti cite ceva de la el.","english":"Perhaps you could learn a thing or two from him.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5226266","romanian":"Tom s-a comportat ca și cum ar fi fost fericit, dar în interior era supărat.","english":"Tom acted happy, but deep inside he was sad.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-406017","romanian":"O ploaie rece a căzut peste oraș.","english":"A cold rain fell over the city.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350400"},{"id":"tat-1153757","romanian":"Ne te poți sinucide ținându-ți respirația.","english":"You cannot kill yourself by holding your breath.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5568104"},{"id":"tat-670628","romanian":"A renunţat la visul de a fi pilot.","english":"He gave up his dream of becoming a pilot.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1611173"},{"id":"tat-1136537","romanian":"L-am sondat cu privire la opiniile sale.","english":"I sounded him out about his views.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965088"},{"id":"tat-1192795","romanian":"Teledonul este un program TV francez organizat în fiecare an pentru a colecta fonduri în scopul finanțării de cercetări medicale.","english":"The telethon is a French TV program organized every year to collect funds in order to finance medical research.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351508"},{"id":"tat-407936","romanian":"Dacă așa vi s-a spus, probabil că e corect.","english":"If this is the way you were told, it is probably correct.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6437718"},{"id":"tat-5131088","romanian":"Să-i dai lui un sfat e ca și cum ai vorbi cu un perete de cărămidă.","english":"Giving advice to him is like talking to a brick wall.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1059667","romanian":"Era văzut ca un om învățat în comunitatea noastră.","english":"He passed for a learned man in our community.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11028998"},{"id":"tat-210","romanian":"Istoria ne invata ca nimic nu este permanent.","english":"History teaches us that nothing is permanent.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-c-lin-nebunul-2","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"A aruncat şi cel mijlociu şi tot aşa degrabă a ajuns. Da când a aruncat Călin Nebunul, a mers trei luni de zile, zi şi noapte, şi de-abia a ajuns. Acu ei, mergând pe drum, au gătit şi cremenea şi amnarul. De-abia au avut cu ce aţâţa oleacă de foc."},{"id":"story-ro-balaurul-cel-cu-apte-capete-2","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Cu aceşti voinici se întovărăşi şi un om verde, pui de român, ştii colea, care auzise de făgăduinţa împăratului şi venise să-şi încerce şi el norocul. Porniră, deci, cu toţii, îşi aleseră un loc aproape de groapă şi se puseră la pândă. Pândiră o zi, pândiră două, pândiră mai multe zile, şi nu se întâmplă nimic."},{"id":"story-ro-norocul-dracului-2","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"dacă n-ar fi, n-ar fi lumea cum e. Eu n-am arat, n-am săpat, n-am prăşit, n-am plivit ca ceilalţi? Ba da, şi ogorul meu a ieşit sterp; piatra pe mine m-a bătut; şi, rămas numai cu mâinile, muncesc, şi nimeni nu mă crede; iar când la măsurătoarea muncii, lucrul meu scade, şi făina din copaie scade, şi foamea copiilor creşte\"."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-2","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Trase undiţa: când, ce să vezi? un peşte mare, cu totul şi cu totul din aur. Doară că nu-i căzu leşin de bucurie. Darămite când îl văzu împărăteasa? Ea fu şi mai oleoleo. Găti împărăteasa singură cu mâna ei peştele şi mâncară. Ea îndată se simţi însărcinată."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-3","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"Şi ei abia se potriviseră, spate în spate, cu nasul în velinţele zdrenţuite. Văzând cucernicul bătrân că dorm cu toţii ca nişte bolovani de piatră, începu şi hâţ în dreapta, hâţ în stânga, până descuie uşa omului."},{"id":"story-ro-povestea-unui-om-lene-2","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":205,"excerpt":"zise cucoana, înfiorându-se. Păcat, sărmanul, să moară ca un câne fărădelege! Mai bine duceţi-l la moşie la mine; iacătă curtea pe costişa ceea. Eu am acolo un hambar plin cu posmagi, ia aşa pentru împrejurări grele, Doamne fereşte!"},{"id":"story-ro-ion-roat-i-cuza-vod-3","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Numai atâta, că bătrânii voiau \"Unire\" cu tocmală, iar tinerii \"Unire\" fără socoteală, cum s-a şi făcut."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-12336953","romanian":"Mi-aș dori să pot vorbi franceza destul de bine pentru a obține o slujbă la acea companie.","english":"I wish I could speak French well enough to get a job at that company.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-411885","romanian":"Mi-am adus câteva cărți de citit.","english":"I brought some of my books to read.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272023"},{"id":"tat-7166713","romanian":"Am fost uimit de îndrăzneala elevului, de a-i pune lectorului o astfel de întrebare personală.","english":"I was amazed at the audacity of the student to ask the lecturer such a personal question.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13619375","romanian":"Tom a bolborosit o scuză înainte de a se grăbi să prindă autobuzul.","english":"Tom gabbled out an apology before rushing to catch the bus.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153165","romanian":"Le-am spus să-mi trimită un alt bilet.","english":"I told them to send me another ticket.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1764648"},{"id":"tat-9263288","romanian":"Tom mi-a spus că ar fi ușor să o conving pe Mary să doneze niște bani.","english":"Tom told me it would be easy to persuade Mary to donate some money.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-207","romanian":"El a reusit sa depaseasca toate obstacolele din calea lui.","english":"He managed to overcome all the obstacles in his way.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-610910","romanian":"Îmi dai brânza cremă te rog?","english":"Would you pass me the cream cheese, please?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/752477"},{"id":"tat-1136563","romanian":"Clădirea se poate prăbuși în orice moment.","english":"The building may crash at any time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965193"},{"id":"tat-1186849","romanian":"Notele sunt importante, dar nu sunt totul.","english":"Grades are important, but they are not everything.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338192"},{"id":"tat-10727979","romanian":"Totul s-a întâmplat așa cum ai spus tu că se va întâmpla.","english":"Everything happened just like you said it would.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-13619308","romanian":"În legătură cu ce subiect ești în dezacord cu cei mai mulți oameni pe care îi cunoști?","english":"What’s something you disagree on with most people you know?","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-708918","romanian":"Ei nu îi plac şerpii şi matematica.","english":"She does not like snakes and mathematics.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397937"},{"id":"tat-411929","romanian":"Am dus hainele la curățat.","english":"I took my clothes to be cleaned.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272197"},{"id":"tat-583918","romanian":"Am o durere de cap teribilă.","english":"I have a bad headache.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7798048"},{"id":"tat-406042","romanian":"La început vă displăcuse ideea, dar acum păreți mulțumiți.","english":"At the beginning you had disliked the idea, but now you seem to be content.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6350487"},{"id":"tat-862913","romanian":"Aeroportul a fost închis din cauza ceţei.","english":"The airport was closed because of the fog.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10008928"},{"id":"tat-2568509","romanian":"Când trimiteți o telegramă, concizia este esențială, deoarece veți fi taxat pentru fiecare cuvânt.","english":"When you send a telegram, brevity is essential because you will be charged for every word.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-670630","romanian":"Probabil, dar el vrea ca să renunţ dintr-odată.","english":"Maybe, but he wants me to stop cold turkey.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1628320"}],"stories":[{"id":"story-ro-d-nil-prepeleac","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Erau odată într-un sat doi fraţi, şi amândoi erau însuraţi. Cel mai mare era harnic, grijuliu şi chiabur, pentru că unde punea el mâna punea şi Dumnezeu mila, dar n-avea copii. Iară cel mai mic era sărac."},{"id":"story-ro-soacra-cu-trei-nurori-3","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Acum deodată, până te-i mai odihni, ia furca în brâu, şi până mâine dimineaţă să găteşti fuioarele aceste de tors, penele de strujit şi mălaiul de pisat. Eu mă las puţin, că mi-a trecut ciolan peste ciolan cu nunta voastră."},{"id":"story-ro-o-via-pierdut-2","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acum se stânge, încât abia mai rămâne sămânță de lumină… acum se ridică mai lătăreață și mai îndărătnică. Moș Mărian privește, îi ies lacrămile din ochi, i se sloiesc pe gene… De mult s-a-ntunecat și el mereu privește, ca și când ar voi să-și tălmăcească taina vieții din jocul acelei flăcări. În sfârșit, se mișcă."},{"id":"story-ro-rodul-tainic-2","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Împăratul nu credea aşa ceva şi l-a chemat pe Danciu la sine. – N-o să fii nici tu în stare să te urci, i-a zis, şi să ştii că, dacă nu te vei putea urca, dau poruncă să-ţi taie capul."},{"id":"story-ro-acul-i-barosul-3","title":"Acul şi barosul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":203,"excerpt":"Casa, bisericile, corabia, puştile, tunurile şi alte lucruri nenumărate, aşa-i că n-ar fi, de nu eram eu? Tu îmi spui de haine frumoase; eu ţ-oiu spune de casă, de sapă, de secere, de coasă şi de plug. Tu îmi spui mai mult de frumos, eu ţ-oiu spune de cele neapărat trebuincioase."},{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1143140","romanian":"A depus banii din premiu la bancă.","english":"He deposited the prize money in the bank.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068919"},{"id":"tat-13563110","romanian":"Cei care se căsătoresc într-o zi ploioasă vor fi fericiți pentru toată viața.","english":"Whoever gets married on a rainy day will be happy for the rest of their life.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568506","romanian":"Un cititor viclean trebuie să fie dispus să cântărească tot ceea ce citește, inclusiv sursele anonime.","english":"An astute reader should be willing to weigh everything they read, including anonymous sources.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4994597","romanian":"Teroriștii au promis că eliberează ostaticul dacă președintele poate să stea într-un picior preț de un minut.","english":"The terrorists promised to release the hostage if the president is able to stand on one leg for a minute.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2536654","romanian":"Majoritatea descoperirilor științifice nu e altceva decât descoperirea a ceea ce este evident.","english":"Most scientific breakthroughs are nothing else than the discovery of the obvious.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862378","romanian":"Soția mea a născut un copil săptămâna trecută.","english":"My wife had a baby last week.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9458631"},{"id":"tat-862829","romanian":"Încă mai aștept să-mi spună ce s-a întîmplat.","english":"I am still waiting to be told what happened.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10014507"},{"id":"tat-1192806","romanian":"După ce a jucat atât de prost tot jocul, echipa a plecat cu coada între picioare.","english":"After playing so badly for the entire game, the team walked off with their tails between their legs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354510"},{"id":"tat-709913","romanian":"M-am împiedicat de o piatră scrântindu-mi glezna.","english":"I tripped on a stone, twisting my ankle.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426746"},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1136599","romanian":"Te rog să-mi răspunzi fără întârziere.","english":"Please write me a reply soon.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966022"},{"id":"tat-925175","romanian":"Plouă dar pentru cât plouă, plouă puţin.","english":"It rains, but for what it does rain, it rains little.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6527273"},{"id":"tat-9638378","romanian":"Îmi amintesc că am făcut cunoștință cu el la o petrecere anul trecut.","english":"I remember being introduced to him at a party last year.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136647","romanian":"A preluat afacerea după decesul tatălui său.","english":"He took over the business after his father died.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966174"},{"id":"tat-1143124","romanian":"Sper că îmi vei răspunde în curând.","english":"I hope you will answer me soon.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068819"},{"id":"tat-705997","romanian":"Ai avut un weekend plăcut?","english":"Did you have a good weekend?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968585"},{"id":"tat-1059483","romanian":"A venit să ne roage să-l ajutăm.","english":"He came to ask us to help him.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10265378"},{"id":"tat-7115229","romanian":"Dacă se va legaliza vânzarea de organe, atunci eventuale probleme de sănătate pot să apară.","english":"If the sale of organs is legalised, potential health problems may arise.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6586236","romanian":"Tocmai i-am spus lui Mary că doream să o ajut să-și curețe garajul.","english":"I just told Mary that I wanted to help her clean the garage.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136266","romanian":"Barca era legată cu o parâmă scurtă.","english":"The boat was tied with a short line.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964628"}],"stories":[{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"A fost odată într-o pustie mare un pustnic, şi petrecea singur singurel. Vecinii săi erau fiarele pădurilor. Şi aşa era de bun la Dumnezeu, încât toate dobitoacele i se închinau, când se întâlneau cu dânsul."},{"id":"story-la-tara","title":"Vacanta la tara","author":"Contemporary","difficulty":4,"genre":"fiction","wordCount":185,"excerpt":"In fiecare vara, familia Popescu mergea la bunici, la tara. Bunicii locuiau intr-un sat mic din Moldova, infundat printre dealuri verzi. Casa bunicilor era veche, cu acoperis de sindrila si pereti albi. In curte erau pomi fructiferi: meri, peri si ciresi. Bunica facea cea mai buna placinta din toate merele acelea."},{"id":"story-ro-aleodor-mp-rat-3","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"Pocitania pământului îi zise: – Toţi nelegiuiţii ce-mi calcă hotarul cad în robia mea. – Mai întâi trebuie să ştii, îi răspunse Aleodor, că din nebăgare de seamă şi fără de voia mea am călcat pe coprinsul tău, şi n-am nici un gând rău asupră-ţi."},{"id":"story-ro-povestea-lui-harap-alb-2","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Amu cică împăratul acela, aproape de bătrâneţe, căzând la zăcare, a scris către frăţine-său craiului, să-i trimită grabnic pe cel mai vrednic dintre nepoţi, ca să-l lase împărat în locul său după moartea sa. Craiul, primind cartea, îndată chemă tustrei feciorii înaintea sa şi le zise: – Iaca ce-mi scrie frate-meu şi moşul vostru."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-3","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Şi dintr-acel minut, nu ştiu ce făcea el, nu ştiu ce dregea, că se pomenea, fără voia lui, trecând pe la curtea împărătească, ia aşa, numai ca să treacă. El îşi uitase de peşte."},{"id":"story-ro-limir-mp-rat-3","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":212,"excerpt":"– Mergi – îi zise dar – copila mea, şi nici spine, nici buruiană în cale să nu-ţi găseşti."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-2","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":202,"excerpt":"Tot mergând şi minunându-mă, m-am pomenit către mijlocul grădinei. Aici era, ce să-ţi spui? frumuseţea de pe lume. Nişte cărări sucite şi cotite, acoperite cu un fel de iarbă mărunţică, de părea că erau nişte covoare aşternute."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
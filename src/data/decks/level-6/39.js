@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1153792","romanian":"În noaptea aceea, s-a îmbolnăvit, având dureri de stomac.","english":"That night, he became sick with pains in his stomach.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128717"},{"id":"tat-1143566","romanian":"Îmi place mult viața de la oraș.","english":"I really like city life.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12072636"},{"id":"tat-1136656","romanian":"Cina va fi servită la bordul avionului.","english":"Dinner will be served on board the plane.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966176"},{"id":"tat-1144339","romanian":"Când a sosit autobuzul, s-a urcat în el.","english":"When the bus came, she got on.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073771"},{"id":"tat-2536167","romanian":"Fiecare persoană care e singură e singură pentru că se teme de alții.","english":"Every person who is alone is alone because they are afraid of others.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6614182","romanian":"Ozonul este o moleculă compusă din trei atomi de oxigen și apare în natură în cantități reduse.","english":"Ozone is a molecule comprised of three oxygen atoms that occurs naturally in small amounts.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-407963","romanian":"Care este mai completă, prima ediție sau a doua?","english":"Which is more complete, the first edition or the second?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6531998"},{"id":"tat-2536647","romanian":"Guvernul francez a lansat un joc online care provoacă contribuabilii să echilibreze bugetul național.","english":"The French government has launched an online game that challenges taxpayers to balance the national budget.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059638","romanian":"Furtuna ne-a împiedicat să ajungem la timp.","english":"The storm prevented us from arriving on time.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/918359"},{"id":"tat-10452012","romanian":"Actualul imn național al Georgiei a fost acceptat în 2004, când Saakashvili a ajuns la putere.","english":"The current national anthem of Georgia was accepted in 2004, when Saakashvili came to power.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5205062","romanian":"Te gândești serios să urmezi o carieră ca pilot de mașini de curse?","english":"Are you seriously thinking about pursuing a career as a race car driver?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-863673","romanian":"Cât la sută dintre persoane vorbesc trei limbi străine?","english":"What percentage of the people speak three languages?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9105795"},{"id":"tat-5232576","romanian":"Îți amintești perioada când l-am vizitat pe Tom atunci când el încă era adolescent?","english":"Can you remember the time we visited Tom when he was still a teenager?","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136518","romanian":"Încet și fără grabă se câștigă cursa.","english":"Slow and steady wins the race.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965773"},{"id":"tat-1186846","romanian":"Ori Tom, ori eu trebuie să plec.","english":"Either Tom or I must go.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338151"},{"id":"tat-705789","romanian":"Am cerut să li se permită sa plece.","english":"I demanded that they be allowed to leave.","difficulty":7,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963119"},{"id":"tat-709916","romanian":"Din 50 de aplicanţi, 20 au fost respinşi.","english":"There were 20 failures among 50 applicants.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8424371"},{"id":"tat-5144512","romanian":"O parolă bună ar trebui să fie greu de ghicit, dar ușor de reținut.","english":"A good password should be difficult to guess, but easy to remember.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7187048","romanian":"Tom speră să obțină un profit în acest an, chiar dacă profitul va fi unul mic.","english":"Tom hopes to make a profit this year, albeit a small one.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1057661","romanian":"L-au dat afară din discotecă fără nicio explicație.","english":"They kicked him out of the disco without any explanation.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11037179"}],"stories":[{"id":"story-ro-pungu-a-cu-doi-bani-2","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Boierul se uită cu băgare de seamă la cucoş, vede în clonţu-i o punguţă şi zice vezeteului: – Măi! ia dă-te jos şi vezi ce are cucoşul cela în plisc. Vezeteul se dă iute jos din capra trăsurei, şi c-un feliu de meşteşug, prinde cucoşul şi luându-i punguţa din clonţ o dă boieriului."},{"id":"story-ro-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"— Omul să fie mulțumit cu sărăcia sa, căci, dacă e vorba, nu bogăția, ci liniștea colibei tale te face fericit. Dar voi să faceți după cum vă trage inima, și Dumnezeu să vă ajute și să vă acopere cu aripa bunătății sale."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-2","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Încă fiind acolo, văzu cum înfloreşte pomul, cum îi cade florile şi cum roadele se arată iarăşi. Atunci îi mai veni inima la loc şi se mulţumi a aştepta până a doua zi. în ziua următoare, ia merele de unde nu e. S-a supărat împăratul, nevoie mare, şi porunci ca paznici să se uite să prinză pe hoţi. Dară aşi!"},{"id":"story-ro-popa-tanda","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":229,"excerpt":"Ierte-l Dumnezeu pe dascălul Pintilie! Era cântăreț vestit. Și murăturile foarte mult îi plăceau. Mai ales dacă era cam răgușit, le bea cu gălbenuș de ou și i se dregea organul, încât răsunau ferestrele când cânta Mântuiește, Doamne, norodul tău! Era dascăl în Butucani, bun sat și mare, oameni cu stare și socoteală, pomeni și ospețe de bogat."},{"id":"story-ro-la-crucea-din-sat","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":224,"excerpt":"Naica Floare n-are vreme. Cuptorul este ars și plăcinta nu e încă întinsă. Multă grabă nu-i prea bună: Marta ar fi trebuit să mai aștepte cu cuptorul. Ea însă umblă cu gândul tot pe la cei din casă; abia apucă să se vadă și ea la masă cu scărmănătorii de pene. Sunt prea veseli: îi aude râzând în casă."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-2536724","romanian":"Matematicieni sunt poeți, cu excepția faptului că ei trebuie să dovedească ceea ce creează fantezia lor.","english":"Mathematicians are poets, except that they have to prove what their fantasy creates.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143212","romanian":"Vasta câmpie se întindea cât vezi cu ochii, punctată cu plantații ici și colo.","english":"The spacious plain spread as far as the eye can see, dotted with groves here and there.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070003"},{"id":"tat-706020","romanian":"Formează câte o propoziție cu fiecare dintre aceste cuvinte.","english":"Make a sentence with each of these words.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968869"},{"id":"tat-1185121","romanian":"Won-ul este folosit atât în Coreea de Nord, cât și în Coreea de Sud. Simbolul său este \"₩\".","english":"Won is used in both North Korea and South Korea. Its symbol is \"₩\".","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323802"},{"id":"tat-584853","romanian":"Casa sa este foarte modernă.","english":"Her house is very modern.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7812441"},{"id":"tat-411927","romanian":"În weekend am mult de spălat.","english":"Over the weekend I have a lot to wash.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272185"},{"id":"tat-1163912","romanian":"Tom e cu zece livre mai greu decât Jack.","english":"Tom is ten pounds heavier than Jack.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197016"},{"id":"tat-8636611","romanian":"Am nevoie de aprobarea ta înainte de a pleca mai devreme de la lucru.","english":"I need your approval before I leave work early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12321128","romanian":"De ce ești așa de nervos? Tot ce-am făcut este să-ți mănânc sandvișul.","english":"Why are you so angry? All I did was eat your sandwich.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163898","romanian":"Nu îi dau niciodată câinelui meu carne nepreparată.","english":"I never feed my dog raw meat.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196922"},{"id":"tat-1136969","romanian":"Tom avea intenția să meargă iar la Boston.","english":"Tom felt like going to Boston again.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966185"},{"id":"tat-1185251","romanian":"Te rog să te întorci de-ndată.","english":"Please come back at once.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12328033"},{"id":"tat-1143211","romanian":"Patru metri din acest material costă nouă franci; deci doi metri costă patru franci și jumătate.","english":"Four metres of this material cost nine francs; therefore, two metres cost four and a half francs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070001"},{"id":"tat-1153879","romanian":"Am confirmat telefonic rezervarea la hotel.","english":"We confirmed the hotel reservations by telephone.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12100238"},{"id":"tat-487299","romanian":"Puțini studenți știu să citească în latină.","english":"Few students know how to read Latin.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270669"},{"id":"tat-203","romanian":"Cu cat inveti mai mult, cu atat realizezi cat de putin stii.","english":"The more you learn, the more you realize how little you know.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1064423","romanian":"Știu că el se uită la mine.","english":"I know he is watching me.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076332"},{"id":"tat-11658152","romanian":"Girafa este cel mai înalt animal din existență, dar au existat și dinozauri mai înalți.","english":"The giraffe is the tallest animal in existence, but there were even taller dinosaurs.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136573","romanian":"A forțat ușa încuiată cu o rangă.","english":"He pried open the locked door with a crowbar.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966044"},{"id":"tat-923913","romanian":"Trebuie să încurajăm lumea să se alăture campaniei şi să lucreze cu noi.","english":"We have to encourage people to join the campaign and work with us.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681131"}],"stories":[{"id":"story-ro-aleodor-mp-rat-2","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Un lucru numai am să-ţi spui: Vezi tu muntele acela de colo, să nu te ducă păcatele să vânezi p-acolo, că este nevoie de cap. Acel munte este moşia lui Jumătate-de-om-călare-pe-jumătate-de-iepure-şchiop: şi cine calcă pe moşia lui, nu scapă nepedepsit. Acestea zicând, căscă gura de trei ori şi-şi dete sufletul."},{"id":"story-ro-pungu-a-cu-doi-bani-3","title":"Punguţa cu doi bani","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"Baba, cânoasă la inimă, de cuvânt; face cum i-a zis stăpânu-său. Cucoşul, cum vede şi astă mare nedreptate, începe a vărsa la apă; şi toarnă el toată apa cea din fântână pe jaratic, până ce stinge focul de tot, şi se răcoreşte cuptoriul; ba încă face ş-o apăraie prin casă, de s-au îndrăcit de ciudă hârca de la bucătărie."},{"id":"story-ro-pas-rea-m-iastr-2","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Iară a treia noapte visă împăratul că dacă va aduce cineva pasărea măiastră de pe tărâmul celălalt şi să-i aşeze cuibul în turn, se va putea face monastirea desăvârşit. Spuse fiilor acest vis, iară ei se întreceau care de care să plece mai-nainte, şi să se închine cu slujba la tată-său împăratul."},{"id":"story-ro-bunica","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"O văz, ca prin vis. Poveşti de Barbu Ştefănescu Delavrancea - Bunica O văz limpede, aşa cum era. Naltă, uscăţivă, cu părul alb şi creţ, cu ochii căprui, cu gura strânsă şi cu buza de sus crestată în dinţi de pieptene, de la nas în jos. Cum deschidea poarta, îi săream înainte."},{"id":"story-ro-f-t-frumos-din-lacrim-2","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":213,"excerpt":"Lungi cearcăne vinete se trăgeau împrejurul ochilor, şi vine albastre se trăgeau pe faţa ei albă ca o marmură vie. Sculată din patul ei, ea se aruncă pe treptele de piatră a unei bolte în zid, în care veghea, deasupra unei candele fumegânde, icoana îmbrăcată în argint a Maicii durerilor."},{"id":"story-ro-poveste-2","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":232,"excerpt":"Iar împărăteasa avea haz, căci începea şi ea, adunându-şi lacrimile în pumni, şi-l certa că prea plânge ca o muiere de fiece şi orişicând. Şi începeau: – Ba iar ai plâns. – Ba n-am plâns. – Ba te-am văzut eu. – Şi eu te-am văzut pe tine. – Ba eu am râs. – Şi eu am râs."},{"id":"story-ro-finul-lui-dumnezeu","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste – da eu nu-s de pe când poveştile – eu sunt de mai încoace, da m-am dus într-o zi la soacră-mea ş’am găsit un sac de poveşti, şi venind a casă l-am scăpat jos şi s-o despicat sacul şi de-atunci s-o împlut lumea de poveşti ş’ am învăţat şi eu una şi ţ-o spun d-tale."}],"recipes":[{"id":"recipe-placinta-mere","title":{"ro":"Placinta cu mere","en":"Apple Pie"},"description":{"ro":"Placinta cu mere este un desert traditional de toamna.","en":"Apple pie is a traditional autumn dessert."},"difficulty":4,"category":"dessert","ingredients":[{"ro":"foi de placinta","en":"phyllo dough","amount":"400 g"},{"ro":"mere","en":"apples","amount":"1 kg"},{"ro":"zahar","en":"sugar","amount":"150 g"},{"ro":"scortisoara","en":"cinnamon","amount":"2 lingurite"},{"ro":"unt","en":"butter","amount":"100 g"},{"ro":"pesmet","en":"breadcrumbs","amount":"50 g"}],"steps":[{"ro":"Se curata merele si se dau pe razatoare.","en":"Peel apples and grate them."},{"ro":"Se amesteca merele cu zaharul si scortisoara.","en":"Mix apples with sugar and cinnamon."},{"ro":"Se intind foile si se ung cu unt topit.","en":"Spread sheets and brush with melted butter."},{"ro":"Se presara pesmet si se pune umplutura.","en":"Sprinkle breadcrumbs and add filling."},{"ro":"Se ruleaza si se aseaza in tava.","en":"Roll up and place in pan."},{"ro":"Se coace la 180 grade 40 minute.","en":"Bake at 180 degrees for 40 minutes."}]}]};
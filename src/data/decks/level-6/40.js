@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-10744389","romanian":"Am vrut să mă duc acasă și să iau cina cu soția mea.","english":"I wanted to go home and eat dinner with my wife.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136653","romanian":"Mi-a luat mult timp până mi-a trecut răceala.","english":"It took me a long time to get over my cold.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966141"},{"id":"tat-1059693","romanian":"Trebuie să fiu acolo până la ora 07.00.","english":"I must be there before 7:00.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10758791"},{"id":"tat-6578340","romanian":"I-am spus lui Mary să nu facă asta, dar ea tot a făcut-o.","english":"I told Mary not to do that, but she did it anyway.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136816","romanian":"Trebuie doar să exersezi în fiecare zi.","english":"You have only to practice every day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966330"},{"id":"tat-488761","romanian":"Autobuzele vor ajunge în stație după cinsprezece minute.","english":"The bus will arrive at the station in fifteen minutes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6268740"},{"id":"tat-225","romanian":"Tehnologia digitala transforma fundamental modul in care comunicam.","english":"Digital technology is fundamentally transforming the way we communicate.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1192805","romanian":"Nu putem întreba nimic despre vârstă sau probleme fizice.","english":"We cannot ask anything about age or physical problems.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354070"},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153823","romanian":"Russell a fost un filozof strălucitor, dar chiar și cea mai simplă activitate practică îl depășea.","english":"Russell was a brilliant philosopher, but even the simplest practical task was quite beyond him.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129790"},{"id":"tat-215","romanian":"Prin urmare, trebuie sa luam masuri imediate pentru a rezolva problema.","english":"Therefore, we must take immediate measures to solve the problem.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-709035","romanian":"În afară de mine, toată lumea este ocupată.","english":"Everybody is busy except me.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420321"},{"id":"tat-488782","romanian":"Lisa Lillien este măritată cu Dan Schneider.","english":"Lisa Lillien is married to Dan Schneider.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6352963"},{"id":"tat-7115211","romanian":"Tom era în stare să vadă că o potențială situație periculoasă se putea ivi.","english":"Tom could see that a potentially dangerous situation could arise.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143631","romanian":"Îmi place să mă uit la televizor.","english":"I like to watch TV.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12071796"},{"id":"tat-705792","romanian":"Acest subiect ar trebui discutat in detaliu.","english":"This subject should be discussed in detail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963142"},{"id":"tat-2704846","romanian":"De dimineață până seară el nu face nimic altceva decât să se plângă.","english":"He does nothing but complain from morning till night.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-411934","romanian":"Am văzut-o pe Andreea plecând de acasă.","english":"I saw Andrea leaving home.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272215"},{"id":"tat-610804","romanian":"După nașterea copilului trebuie să lucrezi jumătate de normă.","english":"After the birth of your child, you should make your work part-time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/614825"},{"id":"tat-8762560","romanian":"Când vecinii ei au fost bolnavi, ea a rugat un medic să le dea niște medicamente.","english":"When her neighbours were ill, she asked a doctor to give them some medicine.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-porcul-cel-fermecat-3","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"uşa se deschise. Fetele intrară. Când colo, ce să vază? Casa n-avea nici o podoabă; dară în mijloc era o masă o masă mare cu un covor scump pe dânsa, şi deasupra o carte mare deschisă. Fetele, nerăbdătoare, voiră a şti ce zicea în cartea aceea."},{"id":"story-ro-balaurul-cel-cu-apte-capete","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":275,"excerpt":"A fost odată într-o ţară un balaur mare, nevoie de cap. El avea şapte capete, trăia într-o groapă, şi se hrănea numai cu oameni. Când ieşea el la mâncare, toată lumea fugea, se închidea în case şi sta ascunsă până ce-şi potolea foamea cu vreun drumeţ pe care îl trăgea aţa la moarte."},{"id":"story-ro-ursul-p-c-lit-de-vulpe-3","title":"Ursul păcălit de vulpe","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":212,"excerpt":"Ascultă, cumătre: vrei să mănânci peşte? Du-te desară la băltoaga cea din marginea pădurei, vârâ-ţi coada-n apă şi stăi pe loc, fără să te mişti, până despre ziuă; atunci smunceşte vârtos spre mal şi ai să scoţi o mulţime de peşte, poate îndoit şi-ntreit de cât am scos eu."},{"id":"story-ro-balaurul-cel-cu-apte-capete-3","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Atunci un sânge negru lasă din ea, fiară spurcată, şi curse, şi curse, până ce stinse şi foc şi tot. Acum ce să facă viteazul nostru, ca să nu găsească focul stins, când s-or deştepta tovarăşii lui, căci legătura lor era ca să omoare pe acela care va lăsa să se stingă focul."},{"id":"story-ro-ivan-turbinc","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Era odată un rus, pe care îl chema Ivan. Şi rusul acela din copilărie se trezise în oaste. Şi slujind el câteva soroace de-a rândul, acuma era bătrân. Şi mai-marii lui, văzându-l că şi-a făcut datoria de ostaş, l-au slobozit din oaste, cu arme cu tot, să se ducă unde-a vrea, dându-i şi două carboave de cheltuială."},{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."},{"id":"story-ro-mo-ion-roat-i-unirea","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":221,"excerpt":"La 1857, pe când se ferbea Unirea în Iaşi, boierii moldoveni liberali, ca de-alde Costache Hurmuzachi, M. Kogălniceanu şi alţii, au găsit cu cale să cheme la Adunare şi câţiva ţărani fruntaşi, câte unul din fiecare judeţ, spre a lua şi ei parte la facerea acestui măreţ şi nobil act naţional."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136625","romanian":"În caz de incendiu sunați la 119.","english":"In case of fire, you should dial 119.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966144"},{"id":"tat-1136846","romanian":"Tom voia un creion cu mină moale.","english":"Tom wanted a pencil with a softer lead.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966269"},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143175","romanian":"Jane ne-a spus că gătitul nu era dificil.","english":"Jane told us that cooking was not difficult.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069208"},{"id":"tat-1153159","romanian":"Bunicul meu a adunat o avere mare pe piaţa stocurilor şi apoi a pierdut-o în întregime peste noapte.","english":"My grandfather amassed a great fortune in the stock market and then lost it all over night.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1751960"},{"id":"tat-1144305","romanian":"Japonia se compune din patru insule principale.","english":"Japan consists of four main islands.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073340"},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-1064195","romanian":"Cred că Tom și Mary sunt căsătoriți în secret.","english":"I think Tom and Mary are secretly married.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072663"},{"id":"tat-610855","romanian":"La începutul fiecărui sfârşit de săptămână sunt în acelaşi timp obosit şi bucuros.","english":"At the start of every weekend, I am both tired and happy.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/684564"},{"id":"tat-1153805","romanian":"Atleţii s-au antrenat din greu în fiecare zi pentru a fi în formă maximă la jocurile olimpice de vară.","english":"The athletes trained hard every day to be at their best for the Summer Olympics.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128898"},{"id":"tat-10452045","romanian":"Deși mulți grăiesc vorbe goale în fața ideii de acțiune afirmativă, în realitate, foarte puține minorități sunt angajate.","english":"Although many pay lip service to the idea of affirmative action, in reality, very few minorities get hired.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1064186","romanian":"Tom a cumpărat o casă cu șase camere.","english":"Tom bought a house with six rooms.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11066256"},{"id":"tat-1153855","romanian":"A fost trimis la închisoare pentru furt.","english":"He was sent to jail for the robbery.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130115"},{"id":"tat-8881352","romanian":"Am trăit cu o familie adoptivă pentru câteva luni, când eram mai tânăr.","english":"I lived with a foster family for a couple of months when I was younger.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185249","romanian":"Un măr pe zi ține doctorul departe.","english":"An apple a day keeps the doctor away.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324562"},{"id":"tat-9408703","romanian":"Tom a spus că a crezut că i se va permite lui Mary să facă asta.","english":"Tom said he thought that Mary might be allowed to do that.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136674","romanian":"Te voi ajuta dacă este posibil.","english":"I will help you if possible.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239621"},{"id":"tat-13621513","romanian":"A doua zi dimineață, am regretat profund că am stat treaz atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185087","romanian":"- Ce fel de senzație? întrebă negustorul.","english":"What kind of feeling? the shopkeeper asked.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321492"}],"stories":[{"id":"story-ro-povestea-unui-om-lene-3","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":210,"excerpt":"– Da muieţi-s posmagii? zise atunci leneşul cu jumătate de gură, fără să se cârnească din loc. – Ce-a zis? întrebă cucoana pe săteni. – Ce să zică, milostivă cucoană, răspunde unul. Ia întreabă că muieţi-s posmagii? – Vai de mine şi de mine – zise cucoana cu mirare – încă asta n-am auzit!"},{"id":"story-ro-borta-v-ntului","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Era un om sărac – sărac, ş-avea o mulţime de copii. Acu era – în vremea foametei şi el a muncit v-o săptămână pe un căuş de grăunţe. Acu s-a dus la râşniţă cu dânsele. După ce le-o râşnit, a ieşit afară cu căuşul cu făină şi s-a pornit o furtună mare şi i-a luat toată făina din căuş."},{"id":"story-ro-ileana-simziana","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat. Acel împărat mare şi puternic bătuse pe toţi împăraţii de prinpregiurul lui şi-i supusese, încât îşi întinsese hotarele împărăţiei sale pe unde a înţărcat dracul copiii, şi toţi împăraţii cei bătuţi era îndatoraţi a-i da câte un fiu d-ai săi ca să-i slujească câte zece ani."},{"id":"story-ro-sarea-n-bucate-2","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Împăratul se bucură cât un lucru mare când auzi de la fetele lui cele mai mari cât îl iubesc. El socoti că altfel de iubire nu poate să fie decât cea dulce ca mierea şi ca zahărul."},{"id":"story-ro-z-na-zorilor-3","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"De când a întrebat Petru de treaba ochilor, se părea cum că ochiul cel din stânga plânge mai puţin, iară cel de-a dreapta râde mai mult. Petru îşi întări inima şi mai merse o dată la împăratul. O palma e o palma şi două-s două! Gândi şi făcu. O păţi din nou, cum a mai păţit-o."},{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-3","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"Într-una din zile, moşneagul, fiind foarte amărât de câte-i spunea baba, chemă fata şi-i zise: – Draga tatei, iaca ce-mi tot spune mă-ta de tine: că n-o asculţi, că eşti rea de gură şi înnărăvită şi că nu este de chip să mai stai la casa mea; de-aceea du-te şi tu încotro te-a îndrepta Dumnezeu, ca să nu se mai facă atâta gâlceavă la casa asta, din pricina ta."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
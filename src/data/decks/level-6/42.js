@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1192781","romanian":"Primul este inferior ultimului în anumite privințe.","english":"The former is inferior to the latter in some respect.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364292"},{"id":"tat-4995608","romanian":"Sunt mari diferențe de viteză de bandă largă și de calitate de la o țară la alta.","english":"There are big differences in broadband speed and quality from country to country.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-107","romanian":"La ce ora se deschide magazinul?","english":"What time does the store open?","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128503"},{"id":"tat-1136700","romanian":"Mi-a dat ce bani avea la el.","english":"He gave me what money he had with him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239591"},{"id":"tat-705791","romanian":"Din curiozitate, am deschis cutia.","english":"I opened the box out of curiosity.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963139"},{"id":"tat-1136850","romanian":"Măcar lasă-mă să te ajut cu masa.","english":"At least let me help with the table.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966285"},{"id":"tat-2534227","romanian":"Terapeutul l-a făcut în sfârșit să vorbească despre cele prin care a trecut în timpul războiului.","english":"The therapist finally got him to open up about what he went through during the war.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1153850","romanian":"Vreau un masaj. Am nevoie să mă relaxez.","english":"I want a massage. I need to relax.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130110"},{"id":"tat-924380","romanian":"Sună-mă dacă ai nevoie de ajutor.","english":"Give me a call if you need help.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735315"},{"id":"tat-864476","romanian":"Orașul a fost distrus în timpul războiului.","english":"The town was destroyed during the war.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6806128"},{"id":"tat-863737","romanian":"Cheltuiește bani și bucură-te de viață!","english":"Spend money and enjoy life!","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9086244"},{"id":"tat-1056778","romanian":"Muzica este o parte importantă din viața mea.","english":"Music is an important part of my life.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11031363"},{"id":"tat-923905","romanian":"Trebuie să găsesc un apartament de închiriat în Barcelona.","english":"I need to find a flat to rent in Barcelona.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/626893"},{"id":"tat-1136703","romanian":"Senatul a hotărât să fie ales un nou consul şi țara să fie eliberată de inamici.","english":"The Senate decreed that a new consul be chosen and the country be delivered from the enemies.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212781"},{"id":"tat-5358834","romanian":"Tom a gestionat un bar mic de pe lângă Boston pentru o bună perioadă de timp.","english":"Tom managed a small bar near Boston for quite a long time.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136877","romanian":"Trebuie să ne gândim la comunitate.","english":"We must think about the community.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11956374"},{"id":"tat-6673371","romanian":"Este posibil să credeți că, comentariul dumneavoastră a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6538116","romanian":"Chiar aș vrea să te ajut, dar am mâinile legate.","english":"I would really like to help you, but my hands are tied.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-cele-trei-rodii-aurite-3","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":210,"excerpt":"– Mamă, zise fiul împăratului, caut cele trei rodii aurite, şi dorinţa de a le avea m-a adus p-aici, nu ştii d-ta încotro se află?"},{"id":"story-ro-popa-duhu-2","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"Mare de inimă, iar de gură şi mai mare, părintele Duhu nu se învrednicise de o viaţă mai bună; dar se vede că nici poftea el una aşa, de vreme ce nu-şi astâmpăra gura cătră mai-marii săi măcar să-l fi picat cu lumânarea."},{"id":"story-ro-bunicul","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"Se scutură din salcâmi o ploaie de miresme. Poveşti de Barbu Ştefănescu Delavrancea - Bunicul Bunicul stă pe prispă. Se gândeşte. La ce se gândeşte? La nimic. Enumeră florile care cad. Se uită-n fundul grădinii. Se scarpină-n cap. Iar enumeră florile scuturate de adiere. Pletele lui albe şi creţe parcă sunt nişte ciorchini de flori albe; sprincenele, mustăţile, barba…"},{"id":"story-ro-mo-nichifor-co-cariul-3","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":220,"excerpt":"Şi cu încărcat şi cu descărcat, la deal moş Nichifor se da pe jos şi trăgea de-a valma cu iepele. La vale iar se da jos, ca să nu se spetească iepele."},{"id":"story-ro-g-in-reasa-2","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Împăratul nu mai putea de bucurie de această întâmplare. Condurul sta d-a pururea pe masă în cămara împăratului. Oricine voia să-l încerce avea toată voia. Într-una din zile când împăratul ţinea sfat cu boierii cei mari pentru trebile împărăţiei, iacă şi fie-sa că vine şi se juca şi se zbenguia p-acolo prin cămară."},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."},{"id":"story-ro-p-cal-n-satul-lui","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"I se urâse şi lui Păcală să tot umble răzleţ prin lume, aşa fără de nici o treabă, numai ca să încurce trebile altora şi să râdă de prostia oamenilor."}],"recipes":[{"id":"recipe-ciorba-radauteana","title":{"ro":"Ciorba Radauteana","en":"Radauti-style Chicken Soup"},"description":{"ro":"Ciorba radauteana este o supa cremoasa de pui din Bucovina, acrisita cu smantana si usturoi.","en":"Radauti soup is a creamy chicken soup from Bucovina, soured with cream and garlic."},"difficulty":4,"category":"soup","ingredients":[{"ro":"piept de pui","en":"chicken breast","amount":"600 g"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery root","amount":"1/2 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"400 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"2 bucati"},{"ro":"otet","en":"vinegar","amount":"3 linguri"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"}],"steps":[{"ro":"Se fierbe pieptul de pui cu legumele in apa cu sare.","en":"Boil the chicken breast with vegetables in salted water."},{"ro":"Se scoate carnea, se taie cubulete si se pune inapoi in supa.","en":"Remove the meat, cut into cubes and put back in the soup."},{"ro":"Se bate smantana cu galbenusurile.","en":"Beat the sour cream with egg yolks."},{"ro":"Se tempereaza amestecul cu supa calda, apoi se toarna in oala.","en":"Temper the mixture with hot soup, then pour into the pot."},{"ro":"Se acriseste cu otet si se adauga usturoiul pisat.","en":"Add vinegar and crushed garlic."},{"ro":"Se presara patrunjel proaspat tocat la servire.","en":"Sprinkle with fresh chopped parsley when serving."}]}]};
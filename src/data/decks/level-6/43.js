@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1119734","romanian":"Vreau să te întreb ceva, domnișoară Ionescu.","english":"I want to ask you something, Ms. Ionescu.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342506"},{"id":"tat-1136549","romanian":"M-am sfătuit cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11958681"},{"id":"tat-9028832","romanian":"Tom provenea dintr-un mediu umil, dar a devenit unul dintre cei mai bogați oameni din țară.","english":"Tom was from a humble background, but he became one of the richest men in the country.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10830414","romanian":"Au refuzat să-mi plătească salariul pentru că am uitat să completez corect formularele.","english":"They refused to pay my salary because I forgot to fill out the forms correctly.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11574532","romanian":"Am doi băieți născuți la patru ani distanță, în aceeași zi din februarie.","english":"I have two sons born four years apart on the same day in February.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192768","romanian":"Pentru ce ai cumpărat acest dicționar costisitor?","english":"What did you buy this expensive dictionary for?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357179"},{"id":"tat-1136661","romanian":"Ne confruntăm cu o alegere dificilă.","english":"We are faced with a difficult choice.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239777"},{"id":"tat-1136851","romanian":"Te-ai spălat deja pe mâini?","english":"Have you washed your hands yet?","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966287"},{"id":"tat-408085","romanian":"În primul rând, vreau să vă mulțumesc pentru ospitalitate.","english":"First of all, I would like to thank you for your hospitality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232873"},{"id":"tat-1192802","romanian":"Niciunul dintre copacii bătrâni nu a supraviețuit focului.","english":"None of the old trees survived the fire.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12353825"},{"id":"tat-6908965","romanian":"Tom ar trebuie să mai iasă și să se distreze.","english":"Tom should go out and have some fun.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136702","romanian":"Comparată cu a ta, mașina mea este mică.","english":"Compared with yours, my car is small.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239624"},{"id":"tat-5144503","romanian":"Subiectul unei propoziții este, de obicei, o persoană sau un lucru care efectuează acțiunea indicată de verb.","english":"The subject of a sentence is usually a person or a thing performing the action shown by the verb.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-5078655","romanian":"Acela a fost locul unde cele două armate se vor bate din nou.","english":"That was where the two armies would fight again.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6582834","romanian":"Tom obișnuia să se ducă în Boston în fiecare vară când era copil.","english":"Tom used to go to Boston every summer when he was a kid.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192815","romanian":"Romancierul a strâns materiale pentru opera sa.","english":"The novelist gathered materials for his work.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12356217"},{"id":"tat-1064285","romanian":"Ce preferi, vin alb sau vin roșu?","english":"Which do you prefer, white wine or red wine?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11061322"},{"id":"tat-8863126","romanian":"Ai putea să spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-670675","romanian":"Poţi să-l alegi pe care îl vrei.","english":"You may choose whichever you want.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8200655"},{"id":"tat-702062","romanian":"Călătoria lor a fost amânată din cauza ploii.","english":"Their trip was postponed because of the rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398899"}],"stories":[{"id":"story-ro-porcul-cel-fermecat-2","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Aşa făcură şi le mergea bine. Vicleanul pizmuia pacea fetelor şi-şi vârî coada. – Surioarele mele, zise fata cea mare, câtu-i ziulica de mare toarcem, coasem, citim. Sunt câteva zile de când ne aflăm singure, n-a mai rămas nici un colţ de grădină pe unde să nu ne fi plimbat."},{"id":"story-ro-p-cal-n-satul-lui-2","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"– Măi! ziceau vecinele lui Păcală, ce lucru să mai fie şi ăsta? viţeaua asta le întrece pe toate! Ce-i va fi dând oare să mănânce? Ce soi o fi de creşte aşa de frumos?"},{"id":"story-ro-coto-man-n-zdr-vanu-3","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Nu mult după aceasta, femeia se simţi îngreunată. Atunci să fi văzut bucurie pe casnici, încât nu-i ţinea pământul. Iară când fu la facere, născu un copilaş gras şi frumos şi sănătos. Crescu copilul şi se făcu mare. Nu se despărţea de pisoi nici cât ai da în cremene. Amândoi se jucau, amândoi mâncau la masă, amândoi se culcau."},{"id":"story-ro-palatul-de-cle-tar-2","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Pe-aşa vremuri se zice că ar fi văcuit împăratul cu stema ruptă din soare, în cel mai frumos palat de cleştar şi peste cel mai înţelept şi mai viteaz norod. Nu era crai pe care împăratul cu stema ruptă din soare să nu-l fi domolit, că nici o oaste duşmană nu putea să-i stea împotrivă."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-3","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"Să nu te sperii, dragul tatei, leul îmi va face groapa, şi tu vei trage pământ peste mine; de moştenire n-am ce să-ţi las decât un frâu de cal. După ce vei rămânea singur, să te sui în pod, să iei frâul, să-l scuturi, şi îndată va veni un cal şi te va învăţa ce să faci."},{"id":"story-ro-hagi-tudose-3","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"II Aşa m-au judecat şi pe mine, şi n-oi mai uita mai ales ochii mici şi vărgaţi ai ctitorului, care-mi tălmăcea zugrăvelile, înfigând degetul arătător asupra sfinţilor şi oftând parcă ar fi voit să plângă vremile apuse şi credinţele de odinioară. Erau patru. Trei – cu giubele lungi, cu şepci cu cozoroace de lac, crăpate şi şterse de lustru."},{"id":"story-ro-d-nil-prepeleac-2","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Nevasta celui bogat de multe ori făcea zile fripte bărbatului, ca să-l poată descotorosi odată de frate-său. Ea zicea adeseori: – Frate, frate, dar pita-i cu bani, bărbate. – Apoi, dă, măi nevastă, sângele apă nu se face. Dacă nu l-oi ajuta eu, cine să-l ajute? Nevasta, nemaiavând încotro, tăcea şi înghiţea noduri."}],"recipes":[{"id":"recipe-zacusca","title":{"ro":"Zacusca","en":"Romanian Vegetable Spread"},"description":{"ro":"Zacusca este un preparat din legume coapte si conservate, perfect pentru iarna.","en":"Zacusca is a dish made from roasted and preserved vegetables, perfect for winter."},"difficulty":4,"category":"appetizer","ingredients":[{"ro":"vinete","en":"eggplants","amount":"2 kg"},{"ro":"ardei copti","en":"roasted peppers","amount":"1 kg"},{"ro":"ceapa","en":"onion","amount":"500 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"500 g"},{"ro":"ulei de floarea soarelui","en":"sunflower oil","amount":"300 ml"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"2 bucati"}],"steps":[{"ro":"Se coc vinetele si ardeii pe flacara sau la cuptor.","en":"Roast the eggplants and peppers over flame or in the oven."},{"ro":"Se curata de coaja si se lasa la scurs cateva ore.","en":"Peel and let drain for a few hours."},{"ro":"Se toaca vinetele si ardeii fin, manual sau la masina.","en":"Finely chop the eggplants and peppers by hand or machine."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se adauga vinetele, ardeii si rosiile pasate.","en":"Add the eggplants, peppers and crushed tomatoes."},{"ro":"Se fierbe la foc mic 2 ore, amestecand des.","en":"Simmer on low heat for 2 hours, stirring often."},{"ro":"Se pune in borcane sterile si se conserva.","en":"Place in sterilized jars and preserve."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136801","romanian":"Și-a pierdut toți banii pe care îi avea.","english":"He lost all the money he had.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966361"},{"id":"tat-1064374","romanian":"Tom a cerut-o în căsătorie pe Mary.","english":"Tom asked Mary to marry him.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11074440"},{"id":"tat-1056686","romanian":"Micul dejun este principala masă a zilei.","english":"Breakfast is the most important meal of the day.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11029785"},{"id":"tat-13632868","romanian":"Noua generație pare să aibă o perioadă de atenție mai redusă decât am avut noi.","english":"This new generation seems to have a shorter attention span than we did.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12341853","romanian":"Nu ai nimic de făcut decât să te supui regulilor.","english":"There is nothing for you to do but obey the rules.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136431","romanian":"A mers pe cal până la mare.","english":"He rode a horse to the sea.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965821"},{"id":"tat-12058655","romanian":"Zonele umede adăpostesc o gamă largă de specii de plante, printre care coada-șoricelului, stufărișurile și nuferi.","english":"Wetlands are home to a vast array of plant species, including cattails, reeds, and water lilies.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136596","romanian":"Mă asigur că judec un om după personalitatea sa.","english":"I make a point of judging a man by his personality.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965974"},{"id":"tat-12319007","romanian":"Cronica unei morți anunțate este un roman al scriitorului columbian Gabriel García Márquez.","english":"Chronicle of a Death Foretold is a novel by the Colombian writer Gabriel García Márquez.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163914","romanian":"Rata criminalității este în scădere în Canada.","english":"The crime rate is decreasing in Canada.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12197021"},{"id":"tat-1163903","romanian":"Descărcarea Metodei de Introducere cu Tastă Unică pentru Limba Vietnameză va începe în curând.","english":"Your Unikey Vietnamese Input Method download will start shortly.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196981"},{"id":"tat-1153762","romanian":"Te rog nu ezita să te exprimi liber.","english":"Please feel free to express yourself.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6511815"},{"id":"tat-8746440","romanian":"Anglia și Scoția au fost unificate la 1 mai 1707, pentru a forma Regatul Marii Britanii.","english":"England and Scotland were unified on May 1, 1707, to form the Kingdom of Great Britain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-705785","romanian":"În zilele de azi nu este neobișnuit pentru o femeie sa călătorească singură.","english":"Nowadays it is not unusual for a woman to travel alone.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963109"},{"id":"tat-1137017","romanian":"Nu toate navigatoarele de internet sunt sigure.","english":"Not all internet browsers are safe.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11952941"},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153768","romanian":"Nu simte nicio reticență în recunoașterea erorilor.","english":"He feels no reluctance in acknowledging errors.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128216"},{"id":"tat-1238705","romanian":"A fugit un bou în pantaloni scurți.","english":"A bull with short trousers has escaped.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/5296592"},{"id":"tat-1153780","romanian":"Pari să te gândești la altceva.","english":"You seem to be thinking of something else.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128559"},{"id":"tat-6838427","romanian":"Înainte de apariția antibioticelor, medicii aveau tratamente eficiente doar pentru un număr limitat de boli.","english":"Before the advent of antibiotics, physicians had effective treatments for but a handful of diseases.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-poveste","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"O, poveşti, poveşti… lumea toată este o poveste, căci ce-a fost odată ca niciodată o fi fost ca şi astăzi, şi ce este astăzi va fi odată ca niciodată."},{"id":"story-ro-george-cel-viteaz-3","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Împăratul trimise pe împărăteasa să boteze pruncul, căci el va sta să dea piept cu tălharii, până se va întoarce ea. Împărăteasa se supuse poruncii şi plecă. Când să se întoarcă de la botez, veni până la un loc; aci, stând şi nemaiauzind zăngănitul armelor şi zgomotul luptei, îi dete un fier ars în inimă."},{"id":"story-ro-limir-mp-rat","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"A fost ce-a fost… a fost odată o văduvă care avea o fată, Lia, şi văduva era săracă de nu mai ştia cum să-şi înnoade zdrenţele, iar Lia, fata ei, se făcuse harnică de creşteau flori pe unde-i călca piciorul şi da muguri lemnul uscat când ea punea mâna pe el."},{"id":"story-ro-boierul-i-p-cal","title":"Boierul şi Păcală","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"Odată, Păcală stătea la marginea unei păduri. Deodată vede o trăsură venind spre el. Repede se scoală, ia un trunchi mare de copac, şi-l ridică drept în sus. În trăsură era boierul, cucoana şi vizitiul, care mâna caii. Boierul, văzând pe Păcală, spuse vizitiului să oprească trăsura: Poveşti de Ioan Slavici - Boierul şi Păcală – Bună ziua!"},{"id":"story-ro-cinci-p-ini","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":256,"excerpt":"Doi oameni, cunoscuţi unul cu altul, călătoreau odată, vara, pe un drum. Unul avea în traista sa trei pâni, şi celalalt două pâni. De la o vreme, fiindu-le foame, poposesc la umbra unei răchiţi pletoase, lângă o fântână cu ciutură, scoate fiecare pânile ce avea şi se pun să mănânce împreună, ca să aibă mai mare poftă de mâncare."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-2","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Doresc prea mult să văz la masa mea măcar un măr din acest pom care m-a ţinut atâta sumă de bani şi de aceea, iată, mă înduplec şi te las ca să pândeşti, măcar că nu-mi vine a crede că o să izbuteşti."},{"id":"story-ro-ivan-turbinc-3","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":215,"excerpt":"– Bună calea, Ivane, zise Dumnezeu. Dar cânţi, cânţi, nu te-ncurci! – Mulţumesc d-voastră, zise Ivan, tresărind. Dar de unde ştii aşa de bine că mă cheamă Ivan? – D-apoi, dacă n-oi şti eu, cine altul are să ştie? răspunse Dumnezeu. – Dar cine eşti tu, zise Ivan cam zborşit, de te lauzi că ştii toate?"}],"recipes":[{"id":"recipe-ardei-umpluti","title":{"ro":"Ardei umpluti","en":"Stuffed Peppers"},"description":{"ro":"Ardeii umpluti sunt un preparat clasic romanesc, cu umplutura de carne si orez.","en":"Stuffed peppers are a classic Romanian dish with a filling of meat and rice."},"difficulty":4,"category":"main","ingredients":[{"ro":"ardei grasi","en":"bell peppers","amount":"8 bucati"},{"ro":"carne tocata","en":"ground meat","amount":"500 g"},{"ro":"orez","en":"rice","amount":"100 g"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"bulion","en":"tomato paste","amount":"2 linguri"},{"ro":"suc de rosii","en":"tomato juice","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se golesc ardeii si se pastreaza capacele.","en":"Hollow out peppers and keep the caps."},{"ro":"Se amesteca carnea cu orezul fiert pe jumatate si ceapa calita.","en":"Mix meat with half-cooked rice and sauteed onion."},{"ro":"Se umplu ardeii si se pun capacele.","en":"Fill peppers and place the caps on top."},{"ro":"Se aseaza in oala cu bulionul si sucul de rosii.","en":"Place in pot with tomato paste and tomato juice."},{"ro":"Se fierb la foc mic 1 ora.","en":"Simmer on low heat for 1 hour."},{"ro":"Se servesc cu smantana.","en":"Serve with sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136795","romanian":"Găina a depus un ou în această dimineață.","english":"The chicken laid an egg this morning.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966349"},{"id":"tat-709040","romanian":"Cu excepţia câtorva greşeli, compunerea ta este perfectă.","english":"Your composition is perfect except for a few mistakes.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420329"},{"id":"tat-11512231","romanian":"Am simțit că ceva e pe cale să se întâmple.","english":"I sensed something was about to happen.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136550","romanian":"M-am consultat cu sora mea.","english":"I consulted with my sister.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964969"},{"id":"tat-217","romanian":"Experienta ne-a invatat ca rabdarea este cea mai importanta virtute.","english":"Experience has taught us that patience is the most important virtue.","difficulty":8,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1201211","romanian":"Am venit, am văzut, am învins.","english":"I came, I saw, I conquered.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12432138"},{"id":"tat-1064159","romanian":"Casa pe care a construit-o Tom este minunată.","english":"The house Tom built is wonderful.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11072308"},{"id":"tat-708953","romanian":"Nimănui nu-i pasă de ceea ce crezi.","english":"Nobody cares what you think.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8418403"},{"id":"tat-1136683","romanian":"În general, profesorul controlează clasa stând în picioare în fața elevilor și făcându-le morală în timpul lecției.","english":"The teacher controls the class, usually standing in front of the students and lecturing to them during the lesson.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7217517"},{"id":"tat-706050","romanian":"Dacă înveţi din greu, vei deveni un student bun.","english":"If you study hard, you will become a good student.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970031"},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-209","romanian":"Comunicarea eficienta este cheia oricarei relatii de succes.","english":"Effective communication is the key to any successful relationship.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-6867529","romanian":"Datele empirice rezultate din acest experiment, par a fi în concordanță cu ipotezele teoretice.","english":"The empirical data from this experiment seems in line with the theoretical hypotheses.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136436","romanian":"Adevărul arde și distruge toate elementele, arătând că acestea îi sunt doar umbră.","english":"Truth burns and destroys all elements, showing that they are merely its shadow.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965909"},{"id":"tat-1192743","romanian":"Vecinii sunt OK cu muzica tare la această oră?","english":"Is loud music OK with the neighbors at this hour?","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7512007"},{"id":"tat-584004","romanian":"Ea și prietenii ei sunt înnebuniți după muzica.","english":"She and her friends are mad about music.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7117050"},{"id":"tat-1097617","romanian":"Sala de şedinţe este ocupate în acest moment.","english":"The meeting room is occupied at the moment.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11654854"},{"id":"tat-10787601","romanian":"Ai putea să te rănești dacă ai încerca să faci asta.","english":"You might get hurt if you tried doing that.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"},{"id":"tat-8921739","romanian":"Niciun viitor nu poate compensa ceea ce lăsați să se întâmple în prezent.","english":"No future can compensate for what you let happen in the present.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-ileana-simziana-2","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Dacă văzură şi văzură că nimic nu-i este pe plac, fata cea mare îşi luă inima în dinţi şi-l întrebă într-o zi la masă, că de ce este supărat: – Au purtarea noastră nu-ţi place? îi zise ea. Au supuşii măriei tale sunt răi şi arţăgoşi de-ţi pricinuiesc atâta mâhnire?"},{"id":"story-ro-vasilie-finul-lui-dumnezeu","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste, cuvânt de poveste, în astă sară la noi soseşte pe un pai de secară, să te ţin de vorbă ‘n astă sară."},{"id":"story-ro-povestea-lui-harap-alb-3","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"Craiul însă, vrând să-l ispitească, tace molcum şi, pe înserate, se îmbracă pe ascuns într-o piele de urs, apoi încalecă pe cal, iese înaintea fecioru-său pe altă cale şi se bagă sub un pod. Şi când să treacă fiu-său pe acolo, numai iaca la capătul podului îl şi întâmpină un urs mornăind."},{"id":"story-ro-greuceanu","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":228,"excerpt":"A fost un împărat şi se numea împăratul Roşu. El era foarte mâhnit că, în zilele lui, nişte zmei furaseră soarele şi luna de pe cer."},{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-pravoslavnicul-i-sl-ninile","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Era odată un biet creştin sărac şi c-o droaie de copii mărunţi. Toată avuţia lui era gura femeii şi a copiilor, care ţipau de fitece. Guri flămânde, şi pace bună! Poveşti de Barbu Ştefănescu Delavrancea - Pravoslavnicul şi slăninile Bietul creştin, ce făcu, ce drese, s-alese de sfântul crăciun c-un porc gras."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
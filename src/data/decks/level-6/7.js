@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136612","romanian":"Ca să spunem adevărul, această propoziţie foloseşte modul conjunctiv.","english":"Truth be told, this sentence uses the subjunctive mood.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966006"},{"id":"tat-1143131","romanian":"Fă altora ceea ce vrei să îți facă ţie.","english":"Do to others as you would have them do to you.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068861"},{"id":"tat-1136510","romanian":"Mă simt îndatorat moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11964318"},{"id":"tat-408053","romanian":"Am discutat deja cu studentul acesta.","english":"I already talked to this student.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232112"},{"id":"tat-2536171","romanian":"Sunt o persoană cu defecte, dar acestea sunt defecte de care se poate scăpa ușor.","english":"I am a flawed person, but these are flaws that can easily be fixed.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12001711","romanian":"Camera era în haos. Peste tot erau împrăștiate hârtii, scaunele răsturnate, iar fereastra s-a spart.","english":"The room was in chaos. Papers were strewn everywhere, chairs were overturned, and the window was shattered.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12047689","romanian":"Deși e de la sine înțeles, mai bine ar fi să se spună.","english":"While it goes without saying, it would go even better if it was said.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-487314","romanian":"Ea va strânge vesela de pe masă.","english":"She will clear the table of the dishes.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334961"},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-11487762","romanian":"Genele noastre ne definesc înfățișarea și trăsăturile. Experiențele definesc cine suntem.","english":"Our genetics define our appearances and traits. Our experiences define who we are.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1138098","romanian":"Cu siguranță se poate spune că este cel mai mare pianist al secolului douăzeci.","english":"It may safely be said that he is the greatest pianist of the twentieth century.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2568478","romanian":"Am dormit un pic în timpul pauzei de prânz pentru că eram foarte obosit.","english":"I slept a little during lunch break because I was so tired.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136848","romanian":"Mă întreb cine înoată cel mai repede.","english":"I wonder who can swim fastest.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966289"},{"id":"tat-1185067","romanian":"Tom vorbea la telefon de o oră.","english":"Tom has been talking on the phone for an hour.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12320872"},{"id":"tat-411865","romanian":"Vara mă duc la piscină în fiecare zi.","english":"In the summer I go to the pool every day.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6271951"},{"id":"tat-219","romanian":"Analiza detaliata a datelor a relevat tendinte neasteptate.","english":"Detailed data analysis revealed unexpected trends.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-709899","romanian":"Am uitat să opresc televizorul înainte de a ma duce la culcare.","english":"I forgot to turn off the TV before going to bed.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426691"},{"id":"tat-1064182","romanian":"Te rog ia loc aici.","english":"Please sit here.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11070976"},{"id":"tat-1136514","romanian":"Încetați de a vă mai duce acolo.","english":"Stop going there.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/47857"},{"id":"tat-702065","romanian":"Agenţia de voiaj ne-a furnizat toate detaliile turului.","english":"The travel company furnished us with all the details of the tour.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8398902"}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":204,"excerpt":"Era odată un împărat puternic şi mare şi avea pe lângă palaturile sale o grădină frumoasă, bogată de flori şi meşteşugită nevoie mare! Aşa grădină nu se mai văzuse până atunci, p-acolo."},{"id":"story-fata-padurii","title":"Fata din dafin","author":"Traditional","difficulty":4,"genre":"folktale","wordCount":165,"excerpt":"A fost odata un imparat care avea un fiu frumos ca soarele. Printul pleca in fiecare zi la vanatoare in padurea din apropierea castelului. Intr-o zi, pe cand se odihnea sub un dafin batran, a auzit un cantec mai frumos decat orice auzise vreodata."},{"id":"story-ro-comoara-2","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"Iar dacă erau odată la han, nu puteau să macine-n sec: tot pe timpul cât stătuse-n oștire a luat Duțu și deprinderea de a nu-și trage, când n-are nevoie, nimic de la gură. De ce adecă muncea el toată săptămâna?!"},{"id":"story-amintiri-copilarie","title":"Amintiri din copilarie","author":"Ion Creanga","difficulty":5,"genre":"memoir","wordCount":175,"excerpt":"Stau cateodata si-mi aduc aminte ce vremuri si ce oameni mai erau in partea locului, pe cand eram eu copil. Si, drept sa spun, pare-mi-se ca pe atunci oamenii erau mai sarguitori, mai voiosi si mai buni la suflet decat cei de astazi."},{"id":"story-ro-flori-a-din-codru-2","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":238,"excerpt":"Cine ştie? vreun împărat ce domneşte în ascuns prin adâncul codrilor… Crâşmarul s-a lăsat de lemne, a luat fata în braţe, a dus-o acasă… şi de aici înainte a fost fata de suflet a lui şi a crâşmăriţei. Aşa a crescut apoi fata la crâşmă."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-2","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":232,"excerpt":"Se miră şi femeia lui, căci nici ea nu mai văzuse un astfel de ou. Nu ştiau cum să umble mai binişor cu dânsul, ca să nu-l scape jos să se spargă. Unul zicea ca să-l coacă în spuză şi să mănânce toţi dintr-însul; altul zicea ca să-l fiarbă; altul zicea ca să-l păstreze."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-2","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":206,"excerpt":"La urmă, românul, mulţumit, vroi să dea câteva bucăţi de carne pravoslavnicului. Bătrânul îşi făcu cruce, se cutremură şi cu nici un preţ nu voi să primească, zicând c-un glas de mucenic: – Lasă, lasă, omul lui Dumnezeu, că pentru Dumnezeu am muncit. Ei, dar cine-mi fusese omul cu crucile!"}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
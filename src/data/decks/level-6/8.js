@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1136673","romanian":"Care este țelul principal al acestei societăți?","english":"What is the chief aim of this society?","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966138"},{"id":"tat-1185174","romanian":"Ne-am mâniat de cuvintele lui.","english":"We got angry at his words.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12324301"},{"id":"tat-709045","romanian":"M-am întâlnit cu ea seara târziu.","english":"I met her late in the evening.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420335"},{"id":"tat-670645","romanian":"Cel mult patruzeci la sută dintre studenţi continuă universitatea.","english":"At most 40 percent of students go on to university.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/935777"},{"id":"tat-13621515","romanian":"A doua zi dimineață, am regretat profund că am stat trează atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536737","romanian":"Cele mai multe școli au fost concepute nu pentru a transforma societatea, ci pentru a o reproduce.","english":"Most schools were designed not to transform society, but to reproduce it.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-712075","romanian":"Am vizitat Fukuoka acum zece ani.","english":"I visited Fukuoka ten years ago.","difficulty":4,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8440712"},{"id":"tat-1192738","romanian":"Compunerea ta nu este în întregime rea.","english":"Your composition is not altogether bad.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7509671"},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-1147446","romanian":"Astăzi am curs de esperanto.","english":"Today I have an Esperanto class.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12094147"},{"id":"tat-2536729","romanian":"Să faci calcule este singurul mod social acceptabil de a te masturba în public.","english":"Doing math is the only socially acceptable way to masturbate in public.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136899","romanian":"Sora mea va trebui să își termine temele înainte de a pleca la Hokkaido.","english":"My sister will have finished her homework before she goes to Hokkaido.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960229"},{"id":"tat-1137975","romanian":"Am putut observa clar că munca grea a început să-și lase amprenta asupra sănătății sale.","english":"I could clearly see that the hard work had begun to tell on his health.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136511","romanian":"Mă simt îndatorată moral față de ea.","english":"I feel morally indebted to her.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965107"},{"id":"tat-1057690","romanian":"Efectele au avut impact mai mult asupra familiilor sărace.","english":"The effects have impacted most on poorer families.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11036698"},{"id":"tat-10788510","romanian":"Știam că Tom ar putea să nu fie în stare să facă asta.","english":"I knew that Tom might not be able to do that.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6635545","romanian":"În ciuda faptului că, în medie, femeile sunt mai inteligente decât bărbații, majoritatea geniilor sunt bărbați.","english":"Notwithstanding the fact that on average women are more intelligent than men, most geniuses are men.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13621249","romanian":"Turiștii au început să bâiguie entuziasmați de îndată ce ghidul a menționat fantomele.","english":"The tourists began to gabble excitedly as soon as the guide mentioned ghosts.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136692","romanian":"Muncește din greu pentru a-și atinge scopul.","english":"He works hard to achieve his goal.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239729"},{"id":"tat-709001","romanian":"Când călătoreşti, este uşor să te rătăceşti.","english":"When traveling, it is easy to get lost.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420261"}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-3","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"Tată-său, deznădăjduit, pusese în gând să-l taie; dar fiul său cel mic, Prâslea, veni cu rugăciune către tată-său, şi-i zise: – Tată, atâţia ani l-ai ţinut, ai suferit atâtea necazuri după urma acestui pom, mai lasă-l, rogu-te, şi anul acesta, să-mi încerc şi eu norocul. – Fugi d-aci, nesocotitule, zise împăratul."},{"id":"story-ro-c-lin-nebunul","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":210,"excerpt":"Era odat-un împărat ş-avea trei fete şi erau aşa de frumoase, de la soare te puteai uita, da la dânsele ba. Acu, cele două erau cum erau, da cea mijlocie nici se mai povesteşte frumuseţea ei. Acu câţi feciori de-mpăraţi şi de ghinărari au cerut-o, împăratul n-a vrut să le-o deie."},{"id":"story-ro-v-duvele-2","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"Aşa e. Că de ne-om cântări cuvântul cu cântarul şi ne-om măsura privirea cu cotul, ori să numeri câte pahare de vin a băut omul la masa ta ca să nu-l înşeli la a lui, s-a dus prietenia pe copcă, c-aşa e făcută să fie dragostea, fără ştreang de gât şi fără căluş în gură."},{"id":"story-ion","title":"Ion","author":"Liviu Rebreanu","difficulty":6,"genre":"fiction","wordCount":165,"excerpt":"Ion era un tanar tarani din satul Pripas, din Transilvania. Desi era sarac, el visa sa aiba pamant propriu. Pentru el, pamantul era totul - mai important decat dragostea, mai important decat orice. In sat traiau doua fete: Ana, sarac ca el, pe care o iubea cu adevarat, si Florica, fiica unui gospodar bogat."},{"id":"story-ro-d-nil-prepeleac-3","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":206,"excerpt":"– Ia, ştii că nu m-ai învăţat rău? Aşa am să fac. Zicând aceste, se duce la dânsul acasă, îşi ia boii de-o funie şi porneşte cu ei spre târg. Dar, cum am spus, omul nostru era un om de aceia căruia-i mânca câinii din traistă, şi toate trebile, câte le făcea, le făcea pe dos."},{"id":"story-ro-scormon","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":222,"excerpt":"Cât e de lung gardul, de la portiță până la cotitura uliței, Sanda l-a măsurat, nici ea singură nu știe de câte ori, cu firul în mână. Jos, lângă portiță, e vârtelnița cu jirebia de tort."},{"id":"story-ro-broasca-estoas-cea-fermecat","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"A fost odată un împărat, şi el avea trei feciori. Când le-a venit şi lor vremea de însurătoare, le-a zis împăratul: Poveşti de Petre Ispirescu - Broasca ţestoasă cea fermecată – Dragii mei copii, v-aţi făcut mari; mergeţi de vă căutaţi ursitele, ca să intraţi şi voi în rândul oamenilor."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
@@ -0,0 +1 @@
+export default {"level":6,"sentences":[{"id":"tat-1138134","romanian":"Dacă vrei să pari vorbitor nativ, ascultă vorbitori nativi de câte ori este posibil.","english":"If you want to sound like a native speaker, listen to native speakers whenever possible.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-709911","romanian":"John a depus mărturie în ceea ce îl priveşte.","english":"John testified concerning him.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426745"},{"id":"tat-408059","romanian":"I-am dat cărțile acestui student.","english":"I gave the books to this student.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6232754"},{"id":"tat-6767614","romanian":"În realitate, explicația este un pic mai complicată decât asta, dar ai înțeles esențialul.","english":"In reality, the explanation is a bit more complicated than this, but you get the gist.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143226","romanian":"Vreau trei bucăți de zahăr în laptele meu.","english":"I want three sugars in my milk.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068445"},{"id":"tat-1136876","romanian":"Tom a observat o schimbare la Mary.","english":"Tom noticed a change in Mary.","difficulty":4,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960285"},{"id":"tat-709044","romanian":"De-abia plecasem de acasă când a început ploaia.","english":"I had scarcely left home when it began to rain.","difficulty":4,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420334"},{"id":"tat-12047690","romanian":"Dacă lumea ar ști de ce oameni mici este condusă, s-ar răzvrăti imediat.","english":"If the people knew by what small men they are ruled, they would soon rebel.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536598","romanian":"Știi fraza „recoltăm ce semănăm”. Am semănat vânt și aceasta e furtuna mea.","english":"You know the phrase, we reap what we sow. I have sown the wind and this is my storm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-221","romanian":"Trebuie sa evaluam cu atentie toate optiunile inainte de a decide.","english":"We must carefully evaluate all options before deciding.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-6538121","romanian":"Deși nu mai este președinte, el continuă să aibă o influență considerabilă printre elita politică.","english":"Though he is no longer president, he still holds considerable sway among the political elite.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153874","romanian":"Ar trebui să facem tot ce putem.","english":"We should do our best.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099422"},{"id":"tat-406051","romanian":"O întâlnesc pe Mihaela în fiecare dimineață, la metrou.","english":"I meet Mihaela every morning at the subway.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6347358"},{"id":"tat-1143236","romanian":"Jimmy e cu doi ani mai mic ca mine.","english":"Jimmy is junior to me by two years.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068493"},{"id":"tat-6637069","romanian":"Friptura a fost arsă din greșeală, dar cu toate acestea a avut un gust spectaculos.","english":"The steak was inadvertently burnt, but nonetheless it tasted spectacular.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1151742","romanian":"La mulți ani de ziua mondială a protecției animalelor!","english":"Happy World Animal Protection Day!","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12118279"},{"id":"tat-1143219","romanian":"Au fost într-o excursie în străinătate pentru prima oară.","english":"They went on a trip abroad for the first time.","difficulty":4,"wordCount":9,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070011"},{"id":"tat-6582958","romanian":"Tom nu avea nici o idee despre ce ar fi trebuit să se facă.","english":"Tom had no idea what needed to be done.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143842","romanian":"Se ține întotdeauna de cuvânt.","english":"He always fulfills his promises.","difficulty":4,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070729"},{"id":"tat-8760980","romanian":"Preotul a mers de câteva ori prin mijlocul enoriașilor, răspândind miros de tămâie din cădelniță.","english":"The priest walked among the parishioners several times, spreading the smell of incense from the censer.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-prostia-omeneasc-poveste","title":"Prostia omenească (Poveste)","author":"Ion Creanga","difficulty":4,"genre":"folktale","wordCount":202,"excerpt":"A fost odată, când a fost, că, dacă n-ar fi fost, nu s-ar povesti."},{"id":"story-ro-bunica-2","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":242,"excerpt":"– A fost odată un împărat mare, mare… – Cât de mare? – Mare de tot. Şi-şi iubea împărăteasa ca ochii din cap. Dar copii nu avea. Şi îi părea rău, îi părea rău că nu avea copii… – Bunico, e rău să nu ai copii? – Fireşte că e rău. Casa omului fără copii e casă pustie."},{"id":"story-ro-sorcova-2","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Nu se pomenea nici de sorcovăială, după cum s-ar fi cuvenit de la moşi, de la strămoşi. Ţi se prindea pleoapă de pleoapă, nară de nară, falcă de falcă, degera oul în găină de ger ce se pornise. – N-am putea duce l-alde biata Bălaşa ceva curmeie de viţă şi vreascuri ujujite?"},{"id":"story-ro-sult-nica-2","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"II E începutul lui decembrie. A dat Dumnezeu zăpadă nemiluită; şi cade, cade puzderie măruntă şi deasă, ca făina la cernut, vânturată de un crivăţ care te orbeşte. Muşcelele dorm sub zăpadă de trei palme. Pădurile, în depărtare, cu tulpini fumurii, par cercelate cu flori de zarzări şi de corcoduşi."},{"id":"story-ro-stan-bolovan","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":220,"excerpt":"Au fost odată, într-o margine de sat, un om, pe nume Stan, şi muierea lui. Ea era tristă mereu şi degeaba încerca soţul ei să afle de ce, că ea nu voia să-i spună, căci, zicea ea, avea să fie şi el trist dacă află."},{"id":"story-ro-departe-departe-2","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Apoi auzii o uşă trântindu-se, şi alta, şi alta, încet, mai încet, mai încet, până nu ştiu bine dacă mai auzeam sau mi se părea. A cui să fie umbra? Vreo stafie? Înăuntru plânge cineva… se roagă, a leşinat… nu se mai aude. E întuneric. Mi se bate inima. De n-ar fi stafie! Şi ameţii pe marginea lacului."},{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-4993395","romanian":"Creșterea cererii pentru cafeaua de înaltă calitate a ajutat la mărirea prețului cafelei.","english":"Greater demand for high-quality coffee has helped drive coffee prices higher.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187157","romanian":"Galaxia Calea Lactee este face parte dintr-un grup de aproximativ treizeci și cinci de galaxii.","english":"The Milky Way galaxy is bound in a cluster of about thirty-five galaxies.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143148","romanian":"Dar un om nu este făcut pentru înfrângere. Un om poate fi distrus, dar nu învins.","english":"But a man is not made for defeat. A man can be destroyed but not defeated.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068955"},{"id":"tat-1192791","romanian":"Tom s-ar putea să mintă despre asta.","english":"Tom may possibly be lying about that.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12350289"},{"id":"tat-1143196","romanian":"Ne-am înțeles să ne abținem de la fumat cât suntem la lucru.","english":"We agreed to refrain from smoking while we are at work.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069326"},{"id":"tat-3877969","romanian":"Corpul uman obișnuit conține îndeajuns de multe oase încât să compună un întreg schelet uman.","english":"The average human body contains enough bones to make an entire human skeleton.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11740023","romanian":"Când traduceți, este necesar să aveți toată rigoarea și niciun respect pentru original.","english":"When translating, one must have all the rigor and no respect for the original.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-221","romanian":"Trebuie sa evaluam cu atentie toate optiunile inainte de a decide.","english":"We must carefully evaluate all options before deciding.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-11487762","romanian":"Genele noastre ne definesc înfățișarea și trăsăturile. Experiențele definesc cine suntem.","english":"Our genetics define our appearances and traits. Our experiences define who we are.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6764266","romanian":"Pompierii voluntari au luptat împotriva vâlvătăii cu mult curaj, dar cu puțină considerație pentru propria lor siguranță.","english":"The volunteer firefighters fought the blaze bravely, with scant regard for their own safety.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-13632854","romanian":"Există o scădere vizibilă în ceea ce privește respectul pentru autorități și tradiții.","english":"There’s a noticeable decline in respect for authority and tradition.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"},{"id":"tat-212","romanian":"Rezultatele cercetarii au demonstrat ca teoria initiala era corecta.","english":"The research results demonstrated that the initial theory was correct.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-8979884","romanian":"Am convenit asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6710378","romanian":"De-a lungul timpului, acțiunea valurilor erodează stâncile și, prin urmare, le face să cadă în ocean.","english":"Over time, wave action undercuts sea cliffs and thereby causes them to fall into the ocean.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136703","romanian":"Senatul a hotărât să fie ales un nou consul şi țara să fie eliberată de inamici.","english":"The Senate decreed that a new consul be chosen and the country be delivered from the enemies.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212781"},{"id":"tat-11574532","romanian":"Am doi băieți născuți la patru ani distanță, în aceeași zi din februarie.","english":"I have two sons born four years apart on the same day in February.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9622607","romanian":"Tom și Mary au spus că au plecat devreme pentru că nu se simțeau bine.","english":"Tom and Mary said they left early because they were feeling sick.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-924384","romanian":"Ea vrea să închidă mica sa afacere.","english":"She wants to wind up her small business.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9735381"},{"id":"tat-227","romanian":"Conceptul de libertate individuala a evoluat semnificativ de-a lungul istoriei.","english":"The concept of individual freedom has evolved significantly throughout history.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-rodul-tainic-2","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Împăratul nu credea aşa ceva şi l-a chemat pe Danciu la sine. – N-o să fii nici tu în stare să te urci, i-a zis, şi să ştii că, dacă nu te vei putea urca, dau poruncă să-ţi taie capul."},{"id":"story-ro-fata-mo-ului-cea-cuminte-3","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"– Om bun, răspunse fata. După ce intră, fiindu-i frică de mumă-sa vitregă să nu o bată dacă se va întoarce acasă, pentru că întârziase, întrebă dacă nu cumva are trebuinţă de o slujnică. Sânta Vinerea, care locuia înăuntru şi care priimi pe fată, îi răspunse că are trebuinţă de o asemenea fată; ea rămase acolo."},{"id":"story-ro-f-t-frumos-cel-r-t-cit","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"A fost odată o păreche de oameni, muncitori, de! cum dă Dumnezeu. Toată nădejdea lor era într-o iapă cu care se hrăneau. Şi ar fi voit şi ei să aibă un copilaş, dar fu peste poate. Cercetară în dreapta şi în stânga, ca să afle niscaiva leacuri care să le desfacă făcutul stărpiciunei lor, dară, aşi!"},{"id":"story-ro-soacra-cu-trei-nurori-3","title":"Soacra cu trei nurori","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Acum deodată, până te-i mai odihni, ia furca în brâu, şi până mâine dimineaţă să găteşti fuioarele aceste de tors, penele de strujit şi mălaiul de pisat. Eu mă las puţin, că mi-a trecut ciolan peste ciolan cu nunta voastră."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-p-cal-n-satul-lui-3","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Vedeau parcă cele şapte viţeluşe cum se fac viţele, juninci, cum ajung în cele din urmă vaci şi ele, şi cum le vinde Păcală şi pe ele şi se întoarce de la târg cu o spuză de viţeluşe, toate flămânde, toate pornite din fire să se facă viţele, juninci şi vaci în cele din urmă. – Măi!"},{"id":"story-ro-ileana-cea-ireat","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":215,"excerpt":"A fost odinioară un împărat care avea trei fete, dintre care cea mai mare era frumoasă, cea mijlocie şi mai frumoasă, iar cea mai tânără, Ileana, atâta de frumoasă încât şi Sfântul Soare se oprea în cale ca s-o vadă şi să se desfăteze de frumuseţea ei."},{"id":"story-ro-sorcova-2","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Nu se pomenea nici de sorcovăială, după cum s-ar fi cuvenit de la moşi, de la strămoşi. Ţi se prindea pleoapă de pleoapă, nară de nară, falcă de falcă, degera oul în găină de ger ce se pornise. – N-am putea duce l-alde biata Bălaşa ceva curmeie de viţă şi vreascuri ujujite?"},{"id":"story-ro-g-in-reasa-2","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Împăratul nu mai putea de bucurie de această întâmplare. Condurul sta d-a pururea pe masă în cămara împăratului. Oricine voia să-l încerce avea toată voia. Într-una din zile când împăratul ţinea sfat cu boierii cei mari pentru trebile împărăţiei, iacă şi fie-sa că vine şi se juca şi se zbenguia p-acolo prin cămară."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-3","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Era o vâlcea împodobită cu fel de fel de floricele, toate înflorite, de părea că dă ghes omului să treacă printre ele."},{"id":"story-ro-la-crucea-din-sat-2","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Un nou hohot îl trezește și pe el din astă nepăsare. Ileana a făcut o cunună de pene cu coada dindărăt și a pus-o pe nesimțite în capul lui Bujor. Bujor a simțit, dar se face a nu fi simțit, fiindcă-i place să vadă pe Ileana râzând. Toți râd cu hohot, râde mai ales Ileana."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
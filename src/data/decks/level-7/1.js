@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-5131088","romanian":"Să-i dai lui un sfat e ca și cum ai vorbi cu un perete de cărămidă.","english":"Giving advice to him is like talking to a brick wall.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7115211","romanian":"Tom era în stare să vadă că o potențială situație periculoasă se putea ivi.","english":"Tom could see that a potentially dangerous situation could arise.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8881352","romanian":"Am trăit cu o familie adoptivă pentru câteva luni, când eram mai tânăr.","english":"I lived with a foster family for a couple of months when I was younger.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136436","romanian":"Adevărul arde și distruge toate elementele, arătând că acestea îi sunt doar umbră.","english":"Truth burns and destroys all elements, showing that they are merely its shadow.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965909"},{"id":"tat-1059634","romanian":"Îmi place să merg în parc și să mă uit la copii distrându-se pe terenul de joacă.","english":"I like to go to the park and watch the children in the playground enjoying themselves.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10275429"},{"id":"tat-1143212","romanian":"Vasta câmpie se întindea cât vezi cu ochii, punctată cu plantații ici și colo.","english":"The spacious plain spread as far as the eye can see, dotted with groves here and there.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070003"},{"id":"tat-12013309","romanian":"Pentru mine, ca brazilian, studiul limbii galice este ceva cu adevărat delicios și captivant.","english":"For me, as a Brazilian, studying the Galician language is something truly delicious and captivating.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153823","romanian":"Russell a fost un filozof strălucitor, dar chiar și cea mai simplă activitate practică îl depășea.","english":"Russell was a brilliant philosopher, but even the simplest practical task was quite beyond him.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129790"},{"id":"tat-10727979","romanian":"Totul s-a întâmplat așa cum ai spus tu că se va întâmpla.","english":"Everything happened just like you said it would.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-709913","romanian":"M-am împiedicat de o piatră scrântindu-mi glezna.","english":"I tripped on a stone, twisting my ankle.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426746"},{"id":"tat-1136850","romanian":"Măcar lasă-mă să te ajut cu masa.","english":"At least let me help with the table.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966285"},{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"},{"id":"tat-5157262","romanian":"Un om egoist nu se gândește la nimic altceva decât la propriile sale sentimente.","english":"A selfish man thinks of nothing but his own feelings.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-864483","romanian":"Fiecare este o lună, și are o parte întunecată pe care nu o arată nimănui niciodată.","english":"Everyone is a moon, and has a dark side which he never shows to anybody.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6827316"},{"id":"tat-9638378","romanian":"Îmi amintesc că am făcut cunoștință cu el la o petrecere anul trecut.","english":"I remember being introduced to him at a party last year.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4144674","romanian":"Dacă îmi aduc bine aminte, ai fost destul de optimist la acel moment.","english":"If I remember correctly, you were quite optimistic at that time.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5316056","romanian":"Cel mai periculos lucru pe care Tom l-a făcut vreodată a fost săritura cu coarda elastică.","english":"The most dangerous thing Tom ever tried to do was bungee jumping.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5037534","romanian":"Ce zici despre formarea unui grup pe Facebook cu scopul de a discuta studierea limbilor străine?","english":"What about putting together a group on Facebook so we can discuss studying foreign languages?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-scormon-3","title":"Scormon","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":205,"excerpt":"Îi părea c-a mai văzut adeseori acest câine, dar unde și cum nu-și aducea aminte. Deodată, fața ei se însenină. — Scormon! strigă ea cu bucurie, ca și când ar întâlni un vechi prieten."},{"id":"story-ro-v-duvele-3","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Amândouă aveau de la răposaţi acareturi bune, aşezate cu temei, să tot ţie şi să nu mai putrezească; ceva bani cheag, ogrăzi cu pruni şi zarzări, grădini cu flori şi legume, toate ocolite cu garduri-pleturi, să nu vezi prin ele, şi umbrite cu streşini de mărăcini."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":208,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti. A fost odată un împărat. Împăratul acesta stăpânea o lume întreagă, şi în lumea asta era un păcurar bătrân şi o păcurăriţă, care aveau trei fete: Ana, Stana şi Lăptiţa."},{"id":"story-ro-ho-u-mp-rat-3","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":216,"excerpt":"De aceea, fătul meu, te-am dat să înveţi toate meşteşugurile. Nu mi-a venit în gând că şi hoţia este un meşteşug. Aceasta îţi rămâne să mai înveţi, după care te vei face un împărat ca Solomon împărat şi cum altul nu va mai fi pe lume. – Ii!"},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":204,"excerpt":"Era odată un împărat puternic şi mare şi avea pe lângă palaturile sale o grădină frumoasă, bogată de flori şi meşteşugită nevoie mare! Aşa grădină nu se mai văzuse până atunci, p-acolo."},{"id":"story-ro-finul-lui-dumnezeu","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste – da eu nu-s de pe când poveştile – eu sunt de mai încoace, da m-am dus într-o zi la soacră-mea ş’am găsit un sac de poveşti, şi venind a casă l-am scăpat jos şi s-o despicat sacul şi de-atunci s-o împlut lumea de poveşti ş’ am învăţat şi eu una şi ţ-o spun d-tale."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-3","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Şi dintr-acel minut, nu ştiu ce făcea el, nu ştiu ce dregea, că se pomenea, fără voia lui, trecând pe la curtea împărătească, ia aşa, numai ca să treacă. El îşi uitase de peşte."},{"id":"story-ro-spaima-zmeilor-2","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":212,"excerpt":"Petre. Oamenii aceştia sunt adevărată pacoste pe capul meu. Mi s-a înăcrit cu ei! – De ce, sfinte Doamne? întrebă portarul raiului. – Nu vezi, răspunse Tatăl Ceresc, că sunt nesăţioşi?! Tot le-am dat, şi nu se mai mulţumesc."},{"id":"story-ro-neghini-2","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– Bine, mătuşă, bine, da’ de unde şi fată? Tu nu ştii că copacii uscaţi nu mai dau de la rădăcină? Şi bătrâna începu să râdă şi să ofteze: \"hi, hi, hi, ooof, of!\" – Ei, toate se întorc, şi apele se întorc de la Dumnezeu, numai tinereţile ba. Ce nu e la timp nu mai e niciodată."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"A fost odată un băiat. El, de la naşterea lui, se pomenise bubos. Ce n-a făcut el ca să se cureţe de bube? dară în deşert. Băieţii la joc şi fetele la horă îl huiduia şi fugeau de dânsul ca de o lepră."},{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-8773155","romanian":"Layla a intrat într-o depresie profundă în urma pierderii celei mai bune prietene a ei, Salima.","english":"Layla slipped into a deep depression over the loss of her best friend, Salima.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136683","romanian":"În general, profesorul controlează clasa stând în picioare în fața elevilor și făcându-le morală în timpul lecției.","english":"The teacher controls the class, usually standing in front of the students and lecturing to them during the lesson.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7217517"},{"id":"tat-1153850","romanian":"Vreau un masaj. Am nevoie să mă relaxez.","english":"I want a massage. I need to relax.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130110"},{"id":"tat-4694533","romanian":"Lunile anului sunt: ianuarie, februarie, martie, aprilie, mai, iunie, iulie, august, septembrie, octombrie, noiembrie, decembrie.","english":"The months of the year are: January, February, March, April, May, June, July, August, September, October, November, December.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6582845","romanian":"Cei mai mulți dintre țăranii care locuiesc în acest sat uitat-de-lume sunt analfabeți.","english":"Most of the peasants living in this godforsaken village are illiterate.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11673611","romanian":"A doua mea învățătoare la școala primară (1941) a fost o frumoasă blondă pe nume Helena.","english":"My second primary school teacher (1941) was a beautiful blonde named Helena.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143233","romanian":"Ai vrea să mergi la o plimbare?","english":"Would you like to go for a walk?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068480"},{"id":"tat-5185437","romanian":"În timpul Evului Mediu, onoarea era de bază pentru viața omului liber și a creștinului.","english":"During the Middle Ages, honor was fundamental to the life of the free man and of the Christian man.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9622587","romanian":"Atât Tom, cât și eu am vrut să mergem în Australia cu Mary.","english":"Both Tom and I wanted to go to Australia with Mary.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1064423","romanian":"Știu că el se uită la mine.","english":"I know he is watching me.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11076332"},{"id":"tat-10787417","romanian":"Una dintre fetițe s-a oprit și s-a întors să se uite la mine.","english":"One of the little girls stopped and turned back to look at me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6581970","romanian":"Medalia de Onoare a Congresului este cea mai importantă distincție la care un soldat poate aspira.","english":"The Congressional Medal of Honor is the highest award that any soldier can aspire to.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-582926","romanian":"Există oameni atât de flămânzi în lume, încât Dumnezeu nu le poate apărea decât sub formă de pâine.","english":"There are people in the world so hungry, that God cannot appear to them except in the form of bread.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6440496"},{"id":"tat-12341853","romanian":"Nu ai nimic de făcut decât să te supui regulilor.","english":"There is nothing for you to do but obey the rules.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-230","romanian":"Relatia dintre individ si societate ramane una dintre cele mai complexe chestiuni.","english":"The relationship between individual and society remains one of the most complex issues.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6539915","romanian":"Potrivit unui studiu recent, durata medie de viață a japonezilor este în continuă creștere.","english":"According to a recent study, the average life span of the Japanese is still increasing.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7578049","romanian":"Am auzit că Tom plănuiește să se mute la Boston.","english":"I heard that Tom plans to move to Boston.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6673370","romanian":"Este posibil să crezi că, comentariul tău a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6578340","romanian":"I-am spus lui Mary să nu facă asta, dar ea tot a făcut-o.","english":"I told Mary not to do that, but she did it anyway.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."},{"id":"story-praslea","title":"Praslea cel voinic","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":175,"excerpt":"Intr-o imparatie de demult traia un imparat care avea trei fii: doi mari si unul mic, pe care-l chema Praslea. Fratii cei mari erau mandri si rasfatati, dar Praslea era harnic si cuminte. Imparatul avea o gradina cu meri de aur, dar in fiecare noapte venea cineva si fura merele. Nimeni nu stia cine este hotul."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-3","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"Şi ei abia se potriviseră, spate în spate, cu nasul în velinţele zdrenţuite. Văzând cucernicul bătrân că dorm cu toţii ca nişte bolovani de piatră, începu şi hâţ în dreapta, hâţ în stânga, până descuie uşa omului."},{"id":"story-ro-p-cal-n-satul-lui","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"I se urâse şi lui Păcală să tot umble răzleţ prin lume, aşa fără de nici o treabă, numai ca să încurce trebile altora şi să râdă de prostia oamenilor."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată un împărat şi o împărăteasă. Amândoi erau oameni de treabă şi frumoşi. Ei se iubeau, nevoie mare! Dară erau tot mâhniţi şi amărâţi că nu făceau copii. Toate leacurile ce luase împărăteasa de pe la vraci şi vrăjitoare nu-i folosise întru nimic."},{"id":"story-enigma-otiliei","title":"Enigma Otiliei","author":"George Calinescu","difficulty":6,"genre":"fiction","wordCount":180,"excerpt":"Intr-o seara de vara, Felix Sima sosi in Bucuresti. Era student la Medicina si venise sa locuiasca la unchiul sau, Costache Giurgiuveanu. Casa din strada Antim era mare si veche, cu ziduri groase si ferestre inalte. Cand Felix a intrat in curte, a vazut o fata tanara care citea pe o banca, sub un tei batran."},{"id":"story-ro-sult-nica","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sultănica D-a stânga Râului Doamnei, razna de satul Domneşti, se vede o casă, albă ca laptele, cu ferestrele încondeiate cu roşu şi albastru."},{"id":"story-ro-uer-3","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Kira, zâmbind, răspunde: – Ăl de sus e umbra, mamă; din aşa caier trag ursitorile firul vieţilor de nimic. – Şi de se rupe firul tău, fusul cu tort cade; dar de s-ar rupe firul de umbră, cade şi fusul de pe grinzi?"},{"id":"story-ileana-cosanzeana","title":"Ileana Cosanzeana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":170,"excerpt":"Se spune ca Ileana Cosanzeana era cea mai frumoasa fata din toata lumea. Parul ei era de aur topit, ochii erau albastri ca cerul, iar zambetul ei lumina si cea mai intunecata noapte. Ea traia intr-un castel de cristal, pazit de un balaur cu sapte capete."},{"id":"story-ro-popa-duhu-3","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Vorba ceea: \"Geasta cu trepădatele, că nu-s departe satele\". Aci era la Socola, aci în Iaşi, aci la monăstirea şi în Târgul-Neamţului profesor, de unde cutriera munţii în sudoarea frunţii, şi mai la tot pasul cânta: Ruinata cetăţuie, ce acopere-acel munte, Şi de unde ochiul vede lucruri multe!"},{"id":"story-ro-departe-departe-2","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Apoi auzii o uşă trântindu-se, şi alta, şi alta, încet, mai încet, mai încet, până nu ştiu bine dacă mai auzeam sau mi se părea. A cui să fie umbra? Vreo stafie? Înăuntru plânge cineva… se roagă, a leşinat… nu se mai aude. E întuneric. Mi se bate inima. De n-ar fi stafie! Şi ameţii pe marginea lacului."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
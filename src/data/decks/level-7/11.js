@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-1143211","romanian":"Patru metri din acest material costă nouă franci; deci doi metri costă patru franci și jumătate.","english":"Four metres of this material cost nine francs; therefore, two metres cost four and a half francs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070001"},{"id":"tat-1192831","romanian":"La acest centru de învățare a limbilor, se predau aproximativ 15 limbi internaționale inclusiv limba engleză.","english":"At this language centre, about 15 international languages are taught, including English.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360495"},{"id":"tat-6826727","romanian":"Fericirea, am descoperit, este aproape întotdeauna o revenire dintr-o muncă grea.","english":"Happiness, I have discovered, is nearly always a rebound from hard work.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-11622790","romanian":"Ieri l-am cunoscut pe unul dintre cei mai mari actori ai generației noastre.","english":"Yesterday I met one of the greatest actors of our generation.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12328330","romanian":"Fiecare limbă care se stinge ia cu ea o bucată din istoria umană.","english":"Every language that dies out takes a piece of human history with it.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568461","romanian":"Cel mai lent în a promite este și cel mai credincios promisiunii atunci când o face.","english":"The slowest one to make a promise is the most faithful one in keeping it.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1185070","romanian":"Mi-e teamă că am luat o răceală.","english":"I worry that I have caught a cold.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12321256"},{"id":"tat-10450497","romanian":"Am mers la supermarket și am cumpărat niște cireșe fiindcă erau la reducere.","english":"I went to the supermarket and bought some cherries because they were on sale.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-406046","romanian":"Ți-aș oferi o cafea dacă ai timp.","english":"I would offer you a coffee if you had the time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6554810"},{"id":"tat-13612858","romanian":"Tom spuse că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7187050","romanian":"Multe companii de software oferă versiuni gratuite ale produselor lor, dar cu funcționalitate limitată.","english":"Many software companies offer free versions of their products, albeit with limited functionality.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536699","romanian":"Într-un dicționar ca acesta ar trebui să existe cel puțin două propoziții cu „frigider”.","english":"In a dictionary like this one there should be at least two sentences with \"fridge\".","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5232576","romanian":"Îți amintești perioada când l-am vizitat pe Tom atunci când el încă era adolescent?","english":"Can you remember the time we visited Tom when he was still a teenager?","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10313164","romanian":"Algeria ar trebui să devină cea mai sigură țară din Africa de Nord.","english":"Algeria should become the safest country in North Africa.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6713884","romanian":"Băuturile pe bază de zahăr nu au valoare nutritivă și contribuie semnificativ la creșterea în greutate.","english":"Sugary drinks have no nutritional value and contribute significantly to weight gain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-706157","romanian":"În această carte se întâmplă multe coincidenţe.","english":"In this book, lots of coincidences happen.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/974784"},{"id":"tat-13563110","romanian":"Cei care se căsătoresc într-o zi ploioasă vor fi fericiți pentru toată viața.","english":"Whoever gets married on a rainy day will be happy for the rest of their life.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138098","romanian":"Cu siguranță se poate spune că este cel mai mare pianist al secolului douăzeci.","english":"It may safely be said that he is the greatest pianist of the twentieth century.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."},{"id":"story-ro-povestea-lui-harap-alb-2","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Amu cică împăratul acela, aproape de bătrâneţe, căzând la zăcare, a scris către frăţine-său craiului, să-i trimită grabnic pe cel mai vrednic dintre nepoţi, ca să-l lase împărat în locul său după moartea sa. Craiul, primind cartea, îndată chemă tustrei feciorii înaintea sa şi le zise: – Iaca ce-mi scrie frate-meu şi moşul vostru."},{"id":"story-ro-pas-rea-m-iastr-3","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":7,"genre":"folktale","wordCount":220,"excerpt":"Atunci vulpoiul făcu un semn asupra lui şi îl schimbă în stană de piatră. Văzând împăratul că fiul său cel mare nu se mai întoarce ascultă rugăciunea fiului celui mijlociu, şi îi dete voie să meargă şi dânsul. Acesta, după ce se găti şi îşi luă merinde de drum, porni şi dânsul."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-3","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"Să nu te sperii, dragul tatei, leul îmi va face groapa, şi tu vei trage pământ peste mine; de moştenire n-am ce să-ţi las decât un frâu de cal. După ce vei rămânea singur, să te sui în pod, să iei frâul, să-l scuturi, şi îndată va veni un cal şi te va învăţa ce să faci."},{"id":"story-ro-finul-lui-dumnezeu-3","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":210,"excerpt":"S-o vârât sub aripa lui şi nu s-a văzut. S-aude un vuiet mare; vine pajera. Pajera era mama vântului. – Dragii mamei nu v-a mâncat! – Finul lui D-zeu ne-a scăpat. – Unde-i să-l mănânc de bucurie. – Mă rog, mamă, dacă l-ăi mânca să-l faci înapoi. – Da unde-i? – Îi la răsărit."},{"id":"story-ro-g-in-reasa-3","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Numaidecât mai-marii ţării ziseră fetei să se gătească de nuntă. Acum altă nevoie. Nici fata nu voia să ia pe tată-său de soţ. Ea zise: – Unde aţi mai auzit, boieri dumneavoastră, batjocură ca aceasta, să ia tatăl de soţie pe fie-sa. – Nu te supăra, domniţă, şi nu fii aşa ţanţoşă."},{"id":"story-ro-hagi-tudose-3","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"II Aşa m-au judecat şi pe mine, şi n-oi mai uita mai ales ochii mici şi vărgaţi ai ctitorului, care-mi tălmăcea zugrăvelile, înfigând degetul arătător asupra sfinţilor şi oftând parcă ar fi voit să plângă vremile apuse şi credinţele de odinioară. Erau patru. Trei – cu giubele lungi, cu şepci cu cozoroace de lac, crăpate şi şterse de lustru."},{"id":"story-ro-stan-bolovan-3","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"Aflând Stan că anul e de trei zile, iar simbria de şapte saci de galbeni pe zi, se învoi şi plecă cu zmeul. Ajunseră nu departe de casă, iar Stan o zări pe mama zmeului, bătrână şi groaznică la vedere."},{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-poveste-r-neasc-2","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Dară feciorul cel mic al împăratului nici nu voi să asculte de unele ca acestea, ci zise: – Duce-mă-voi singur, căci trebuie să fi ştiut tata ce zice, când ne-a poruncit să păzim câte unul singur. Şi astfel, cum veni seara, se duse la locul de pândă."},{"id":"story-ro-ion-roat-i-cuza-vod-3","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Numai atâta, că bătrânii voiau \"Unire\" cu tocmală, iar tinerii \"Unire\" fără socoteală, cum s-a şi făcut."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-222","romanian":"Implementarea noilor politici va necesita resurse considerabile.","english":"Implementing the new policies will require considerable resources.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1136694","romanian":"Demis în urma unei lovituri militare în septembrie 2006, fostul prim-ministru al Thailandei s-a reîntors în țară după aproape un an și jumătate de exil.","english":"Deposed in a military coup in September 2006 and having effectively been in exile, the Former premier of Thailand Thaksin has returned after about a year and a half.","difficulty":9,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239539"},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-10830414","romanian":"Au refuzat să-mi plătească salariul pentru că am uitat să completez corect formularele.","english":"They refused to pay my salary because I forgot to fill out the forms correctly.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1142926","romanian":"Acum, vom arăta cum această lemă poate fi folosită în demonstrarea teoremei principale.","english":"Now, we show how this lemma can be used to prove our main theorem.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066559"},{"id":"tat-5179395","romanian":"Doar ca să te menții în viață este suficient de greu în aceste timpuri.","english":"Just staying alive in these times is hard enough.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6581888","romanian":"Ar fi trebuit să fii mai atent și să nu te încrezi în el.","english":"You should have known better than to trust him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7115229","romanian":"Dacă se va legaliza vânzarea de organe, atunci eventuale probleme de sănătate pot să apară.","english":"If the sale of organs is legalised, potential health problems may arise.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7192267","romanian":"El nu era omul care să se lase descurajat de un singur eșec.","english":"He was not a man to be disheartened by a single failure.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185117","romanian":"Am o părere bună despre tânărul candidat.","english":"I have a good opinion of the young candidate.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323560"},{"id":"tat-12355737","romanian":"Nu știu ce motiv a fost pentru care nu mi-ai trimis o scrisoare.","english":"I do not know what reason there was why you did not send me a letter.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12319007","romanian":"Cronica unei morți anunțate este un roman al scriitorului columbian Gabriel García Márquez.","english":"Chronicle of a Death Foretold is a novel by the Colombian writer Gabriel García Márquez.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5370019","romanian":"Un intelectual este o persoană care a descoperit ceva mai interesant decât sexul.","english":"An intellectual is a person who has discovered something more interesting than sex.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153774","romanian":"Într-un final, Susan îi taie mamei vorba, promite să-i scrie și închide telefonul.","english":"Finally, Susan cuts her mother short, promises to write, and hangs up.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128481"},{"id":"tat-1192747","romanian":"Te rog du-te la Departamentul de Chirurgie.","english":"Please go to the Surgery Department.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/289686"},{"id":"tat-1064413","romanian":"L-am văzut uitându-se la mine.","english":"I saw him looking at me.","difficulty":5,"wordCount":5,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11075735"},{"id":"tat-4993454","romanian":"O persoană având indicele de masă corporală de la 25 la 29 e considerată supraponderală.","english":"A person with a BMI of 25 to 29 is considered overweight.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-216","romanian":"Literatura romana clasica reflecta lupta pentru identitate nationala.","english":"Classic Romanian literature reflects the struggle for national identity.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":222,"excerpt":"A fost odată ca niciodată; că de n-ar fi, nu s-ar mai povesti; de când făcea plopşorul pere şi răchita micşunele; de când se băteau urşii în coade; de când se luau de gât lupii cu mieii de se sărutau, înfrăţindu-se; de când se potcovea puricele la un picior cu nouăzeci şi nouă de oca de fier şi s-arunca în slava cerului de ne aducea poveşti; Poveşti de Petre Ispirescu - Tinereţe fără bătrâneţe şi viaţă fără de moarte De când se scria musca pe părete, Mai mincinos cine nu crede."},{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."},{"id":"story-ro-z-na-zorilor","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"A fost ce-a fost: dacă n-ar fi fost nici nu s-ar povesti. Poveşti de Ioan Slavici - Zâna Zorilor A fost odată un împărat, – un împărat mare şi puternic; împărăţia lui era atât de mare, încât nici nu se ştia unde se începe şi unde se sfârşeşte. Unii ziceau că ar fi fără de margini."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-3","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"– Şi tu a mea! grăi al doilea în voinicie către Ana, ridicând-o şi pe ea în şa. Făcând aşa, voinicii porniră spre curtea împărătească. În ziua următoare se făcură nunţile şi apoi trei zile şi trei nopţi întreaga împărăţie răsuna de veselia oaspeţilor…"},{"id":"story-ro-borta-v-ntului-3","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Omul a doua zi se scoală, ia măgarul şi se duce – acasă şi-i zice: măgar, fa bani! Măgarul, de unde? El apuc’ un druc şi ‘ncepe a dişăla măgarul. – Acu nu-l mai iert eu. Se porneşte să ‘ntâlnească pe moşneag şi s’ astupe borta vântului. Întâlneşte pe D-zeu."},{"id":"story-ro-norocul-dracului-3","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":238,"excerpt":"Dar unde să adoarmă? Jos, pământul tare şi rece; sus, întuneric adânc; în casă, copiii adorm plângând; în curte Plăviţa pufăie pe nări a foame; şi el, prigonit de gânduri şi de nenoroc. \"Dar mâine? Dacă n-oi avea ce scutura în copaie? Ce mă fac mâine?"},{"id":"story-ro-povestea-lui-harap-alb","title":"Povestea lui Harap-Alb","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Amu cică era odată într-o ţară un crai, care avea trei feciori. Şi craiul acela mai avea un frate mai mare, care era împărat într-o altă ţară, mai depărtată. Şi împăratul, fratele craiului, se numea Verde-împărat; şi împăratul Verde nu avea feciori, ci numai fete."},{"id":"story-sara-pe-deal","title":"Sara pe deal","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":110,"excerpt":"Sara pe deal buciumul suna cu jale, Turmele-Loss'n vin, umpland carari si cale, Sufletul meu arde-n iubire ca para, Tu esti departe. Foarte departe, sufletul meu te cheama, Stelele-Loss'n cer scapara-n neagra ceama, Inima mea te asteapta cu dor, Tu nu mai vii."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-2","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":202,"excerpt":"Tot mergând şi minunându-mă, m-am pomenit către mijlocul grădinei. Aici era, ce să-ţi spui? frumuseţea de pe lume. Nişte cărări sucite şi cotite, acoperite cu un fel de iarbă mărunţică, de părea că erau nişte covoare aşternute."},{"id":"story-ro-coto-man-n-zdr-vanu","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"A fost odată o pereche de oameni. Ei n-aveau copii. Într-o zi, fiind cu voie bună, zise bărbatul către femeie: Poveşti de Petre Ispirescu - Cotoşman năzdrăvanu – Soro, de la mila lui Dumnezeu noi n-avem copii. Să mergem pe câmp şi ce vom găsi, aceea să ne fie copil. – Bine zici dumneata, frate."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
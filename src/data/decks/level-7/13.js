@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-13617013","romanian":"Wisconsin este cunoscut pentru produsele sale lactate, nu pentru vacile sale de lapte.","english":"Wisconsin is known for its dairy, not for its dairy cows.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6582834","romanian":"Tom obișnuia să se ducă în Boston în fiecare vară când era copil.","english":"Tom used to go to Boston every summer when he was a kid.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13632868","romanian":"Noua generație pare să aibă o perioadă de atenție mai redusă decât am avut noi.","english":"This new generation seems to have a shorter attention span than we did.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143285","romanian":"Am crezut că va veni curând.","english":"I thought he would come soon.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068675"},{"id":"tat-8636611","romanian":"Am nevoie de aprobarea ta înainte de a pleca mai devreme de la lucru.","english":"I need your approval before I leave work early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536724","romanian":"Matematicieni sunt poeți, cu excepția faptului că ei trebuie să dovedească ceea ce creează fantezia lor.","english":"Mathematicians are poets, except that they have to prove what their fantasy creates.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5236279","romanian":"L-am întrebat pe Tom dacă el o poate avea gata până la 2:30.","english":"I asked Tom if he could have it ready by 2:30.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192848","romanian":"Se face din ce în ce mai frig dimineața și seara. Frunzele copacilor vor deveni în curând roșii și galbene.","english":"It is getting colder and colder morning and evening. The leaves of trees will soon turn red or yellow.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361557"},{"id":"tat-12321128","romanian":"De ce ești așa de nervos? Tot ce-am făcut este să-ți mănânc sandvișul.","english":"Why are you so angry? All I did was eat your sandwich.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13619308","romanian":"În legătură cu ce subiect ești în dezacord cu cei mai mulți oameni pe care îi cunoști?","english":"What’s something you disagree on with most people you know?","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1288424","romanian":"Cei care folosesc furculița s-au aflat din punct de vedere istoric mereu în minoritate.","english":"Fork-users have historically been in the minority.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-11089209","romanian":"Tom se va întoarce la Boston cu o zi mai devreme decât mine.","english":"Tom will go back to Boston one day earlier than I will.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2534227","romanian":"Terapeutul l-a făcut în sfârșit să vorbească despre cele prin care a trecut în timpul războiului.","english":"The therapist finally got him to open up about what he went through during the war.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7166872","romanian":"Adoptarea unei diete cu conținut scăzut de calorii, vă va crește durata de viață.","english":"Adopting a low calorie diet will increase your lifespan.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8741689","romanian":"Samuel și Michael vorbeau despre o fată pe care Bryan a cunoscut-o în Brazilia anul trecut.","english":"Samuel and Michael were talking about a girl Bryan met in Brazil last year.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4993423","romanian":"Opozanții spun că culturile modificate genetic se pot poleniza încrucișat și pot strica alte culturi.","english":"Opponents say genetically engineered crops can cross-pollinate and damage other crops.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153762","romanian":"Te rog nu ezita să te exprimi liber.","english":"Please feel free to express yourself.","difficulty":5,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6511815"},{"id":"tat-10827564","romanian":"Am găsit un portofel pe jos și i l-am dat agentului de pază.","english":"I found a wallet on the ground and gave it to the security guard.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143119","romanian":"Tom va ajunge o oră mai târziu.","english":"Tom will be arriving an hour late.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070045"}],"stories":[{"id":"story-ro-v-duvele-2","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"Aşa e. Că de ne-om cântări cuvântul cu cântarul şi ne-om măsura privirea cu cotul, ori să numeri câte pahare de vin a băut omul la masa ta ca să nu-l înşeli la a lui, s-a dus prietenia pe copcă, c-aşa e făcută să fie dragostea, fără ştreang de gât şi fără căluş în gură."},{"id":"story-ro-spaima-zmeilor-3","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Şi toţi erau mărunţi, care de care mai mic decât cellalt, mai sfredeluş, mai guraliv, mai drăcos şi – asta să nu uităm – mai mâncăcios şi mai hapsân. – Aoleo! zise femeia, care se bălăbănea cu ei. Ăştia-mi scot sufletul şi-mi mănâncă şi urechile. Cine m-a pus să mă tot milogesc?!"},{"id":"story-ro-z-na-mun-ilor","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat foarte viteaz; toate împărăţiile de prinprejurul împărăţiei sale îi cerea sfaturi: atâta era de drept şi înţelept. Când se isca sfadă între dânşii, la acest împărat mergeau mai întâi la judecată şi, cum zicea el, aşa se şi făcea, fiindcă era judecător drept şi iubitor de pace."},{"id":"story-ro-ho-u-mp-rat","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat mare şi puternic. Abia la vremea cărunteţei dobândi şi el un copil. Bucuria lui fu nespusă când se văzu şi el tată, şi toată împărăţia lui fu veselă dinpreună cu dânsul, căci acest împărat era bun, drept şi temător de Dumnezeu. Pentru aceasta, el făcu mult bine poporului său."},{"id":"story-ro-greuceanu","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":228,"excerpt":"A fost un împărat şi se numea împăratul Roşu. El era foarte mâhnit că, în zilele lui, nişte zmei furaseră soarele şi luna de pe cer."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-neghini","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"A fost odată o babă, bătrână, bătrână. Abia zărea de bătrână ce era. Şi mâinile îi umblau la ciorap, iar în gândul ei se ruga la Dumnezeu s-o dăruiască cu un copil, că n-avea decât pe unchiaşul ei."},{"id":"story-ro-mo-ion-roat-i-unirea","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":221,"excerpt":"La 1857, pe când se ferbea Unirea în Iaşi, boierii moldoveni liberali, ca de-alde Costache Hurmuzachi, M. Kogălniceanu şi alţii, au găsit cu cale să cheme la Adunare şi câţiva ţărani fruntaşi, câte unul din fiecare judeţ, spre a lua şi ei parte la facerea acestui măreţ şi nobil act naţional."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-2","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"Dorinţa ce ai o să-ţi aducă întristare. – Eu nu am venit să te întreb asta, zise împăratul, ci, dacă ai ceva leacuri care să ne facă să avem copii, să-mi dai. – Am, răspunse unchiaşul; dar numai un copil o să faceţi. El o să fie Făt-Frumos şi drăgăstos, şi parte n-o să aveţi de el."},{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-ro-limir-mp-rat-2","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":203,"excerpt":"Când se scula, văduva stetea mai bucuros afară decât în casă, şi Lia ridica gunoiul din prag, îl ducea la locul lui, apoi intra ca să dereticească prin colibă, cântând voioasă, şi oglindă luminoasă se făcea toate sub mâna ei, încât, împărat de-ai fi fost, ţi-ai fi părăsit palatele ca să stai în coliba văduvei."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
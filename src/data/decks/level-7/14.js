@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-6908965","romanian":"Tom ar trebuie să mai iasă și să se distreze.","english":"Tom should go out and have some fun.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13604225","romanian":"Tom și Mary au spus că au crezut că John va vrea să facă asta.","english":"Tom and Mary said they thought John would be willing to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-411934","romanian":"Am văzut-o pe Andreea plecând de acasă.","english":"I saw Andrea leaving home.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6272215"},{"id":"tat-862403","romanian":"După aceea, nu am vorbit cu ei.","english":"Afterwards, I did not speak with them.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9460600"},{"id":"tat-215","romanian":"Prin urmare, trebuie sa luam masuri imediate pentru a rezolva problema.","english":"Therefore, we must take immediate measures to solve the problem.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2536426","romanian":"Cei care locuiesc în case de sticlă nu ar trebui să arunce cu pietre.","english":"Those who live in glass houses should not throw stones.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7187048","romanian":"Tom speră să obțină un profit în acest an, chiar dacă profitul va fi unul mic.","english":"Tom hopes to make a profit this year, albeit a small one.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-226","romanian":"Indiferent de circumstante, trebuie sa ne pastram calmul si sa gandim clar.","english":"Regardless of circumstances, we must stay calm and think clearly.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-5144512","romanian":"O parolă bună ar trebui să fie greu de ghicit, dar ușor de reținut.","english":"A good password should be difficult to guess, but easy to remember.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1142931","romanian":"Am început cu doi tovarăși de călătorie.","english":"I started with two traveling companions.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066641"},{"id":"tat-11657708","romanian":"Obișnuia să cumpere șoricei albi pentru ca boa constrictor-ul ei să-i ucidă și să-i mănânce.","english":"She used to buy white mice for her boa constrictor to kill and eat.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568483","romanian":"E mai ușor să te dai la oameni pe Internet decât pe stradă.","english":"It is easier to hit on people on the Internet than in the street.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11658152","romanian":"Girafa este cel mai înalt animal din existență, dar au existat și dinozauri mai înalți.","english":"The giraffe is the tallest animal in existence, but there were even taller dinosaurs.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7115224","romanian":"Ambii sportivi sunt foarte îndârjiți și deseori pot să apară animozități între ei.","english":"Both sportsmen are very competitive and, often, animosities arise between them.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138145","romanian":"Anul trecut în Filipine, cutremurele şi valurile gigantice au produs moartea a mai mult de 6000 de oameni.","english":"Last year in the Philippines, earthquakes and tidal waves resulted in the deaths of more than 6000 people.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-6767614","romanian":"În realitate, explicația este un pic mai complicată decât asta, dar ai înțeles esențialul.","english":"In reality, the explanation is a bit more complicated than this, but you get the gist.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-3629565","romanian":"În aritmetica iubirii, unu plus unu fac totul, pe când doi minus unu este egal cu zero.","english":"In the arithmetic of love, one plus one makes a whole, and two minus one equals zero.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2429205","romanian":"La început am crezut că sunt avantajat având o limbă din familia latină.","english":"At first, I thought I had an advantage because I spoke a Romance language.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536248","romanian":"Dacă aș vrea să te sperii, ți-aș spune ce am visat acum câteva săptămâni.","english":"If I wanted to scare you, I would tell you what I dreamt about a few weeks ago.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-3","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":217,"excerpt":"Tată-său, deznădăjduit, pusese în gând să-l taie; dar fiul său cel mic, Prâslea, veni cu rugăciune către tată-său, şi-i zise: – Tată, atâţia ani l-ai ţinut, ai suferit atâtea necazuri după urma acestui pom, mai lasă-l, rogu-te, şi anul acesta, să-mi încerc şi eu norocul. – Fugi d-aci, nesocotitule, zise împăratul."},{"id":"story-ro-bunica-2","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":242,"excerpt":"– A fost odată un împărat mare, mare… – Cât de mare? – Mare de tot. Şi-şi iubea împărăteasa ca ochii din cap. Dar copii nu avea. Şi îi părea rău, îi părea rău că nu avea copii… – Bunico, e rău să nu ai copii? – Fireşte că e rău. Casa omului fără copii e casă pustie."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat şi o împărăteasă. Ei aveau trei copii. Mai aveau pe lângă palaturile lor o grădină foarte frumoasă. Şi atât de drag îi era florile acestui împărat, încât însuşi cu multă tragere de inimă le plivea şi îngrijăa de grădină. În fundul acestei grădini crescuse un măr cu totul şi cu totul de aur."},{"id":"story-ro-frumoasa-lumii-3","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":221,"excerpt":"În a treia duminică, când a dus oul, a pus pe gânduri pe jidan. Şi s-a gândit aşa jidanul: l-a întrebat unde şede, să se ducă să vadă de unde are el ouă de aur. Vine jidanul; da’ el ţinea cuşca în colţul casei. Cum a intrat jidanul în casă – el ştia carte – odată şi-aruncă ochii-n fundul casei."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."},{"id":"story-ro-fata-mo-ului-cea-cuminte","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"A fost odată un om bătrân care avea o fată mare, de se dusese vestea în lume de vrednicia ei. Moşneagul (unchiaşul) se căsători de a doua oară cu o babă, care avea şi ea o fată mare."},{"id":"story-ro-la-crucea-din-sat","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":224,"excerpt":"Naica Floare n-are vreme. Cuptorul este ars și plăcinta nu e încă întinsă. Multă grabă nu-i prea bună: Marta ar fi trebuit să mai aștepte cu cuptorul. Ea însă umblă cu gândul tot pe la cei din casă; abia apucă să se vadă și ea la masă cu scărmănătorii de pene. Sunt prea veseli: îi aude râzând în casă."},{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."},{"id":"story-ro-palatul-de-cle-tar","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":225,"excerpt":"Cam pe la începutul vremilor, până unde praştia minţii nu azvârle, se povesteşte, aşa, ca din scorneală, că omul era croit din alte foarfeci şi cioplit din altă bardă."},{"id":"story-ro-fata-cu-pieze-rele-2","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Se silea bietul împărat, cu toţi cei doisprezece fii ai săi, să facă pace, să fie între oameni bună învoire, să oprească relele ce-l bântuiau, dar geaba, pagubele curgeau gârlă. În cele mai de pe urmă chemă un cetitor de stele să-i spuie ce e pricina de-i merg lucrurile anapoda şi nu poate să dea înainte."},{"id":"story-ro-z-na-z-nelor-2","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Se duse şi cel mijlociu şi se întoarse şi el cu o soţioară mândră şi frumoasă. Se duse şi cel mic. Cutreieră lumea până ce ajunse la pădurea cea mare unde se lăsase săgeata lui. Bâjbâi el şi orbăcăi p-acolo prin bunget, până ce dete de copaciul în care se înfipsese şi săgeata lui."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
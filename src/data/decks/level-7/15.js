@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-1064309","romanian":"L-am văzut pe Tom sărutând-o pe Mary.","english":"I saw Tom kiss Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045415"},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6838427","romanian":"Înainte de apariția antibioticelor, medicii aveau tratamente eficiente doar pentru un număr limitat de boli.","english":"Before the advent of antibiotics, physicians had effective treatments for but a handful of diseases.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13598707","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singur.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4995608","romanian":"Sunt mari diferențe de viteză de bandă largă și de calitate de la o țară la alta.","english":"There are big differences in broadband speed and quality from country to country.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-4988491","romanian":"Ursul s-a luptat cu vecinul meu până a obosit, apoi cu ultimele puteri a fugit în pădure.","english":"The bear fought with my neighbour until he got tired. Afterwards, with the last of his strength, he fled into the forest.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-714064","romanian":"Julio se leagănă in hamacul pe care l-am atârnat sub bătrânul stejar.","english":"Julio is swinging in the hammock that I hung under the old oak tree.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469770"},{"id":"tat-229","romanian":"Filozofia ne invita sa punem sub semnul intrebarii ceea ce consideram evident.","english":"Philosophy invites us to question what we consider obvious.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-599089","romanian":"Numele tău se află în capul listei.","english":"Your name stands first in the list.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1447346"},{"id":"tat-4961192","romanian":"Ai putea să o spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-705792","romanian":"Acest subiect ar trebui discutat in detaliu.","english":"This subject should be discussed in detail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963142"},{"id":"tat-584098","romanian":"O traducere e ca o femeie. Dacă e frumoasă, nu e fidelă. Dacă e fidelă, nu este cu siguranţă frumoasă.","english":"Translation is like a woman. If it is beautiful, it is not faithful. If it is faithful, it is most certainly not beautiful.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7802396"},{"id":"tat-2536642","romanian":"Cei selecționați vor trebui să se confrunte cu teste medicale și psihologice ample.","english":"Those selected will have to face extensive medical and psychological tests.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187074","romanian":"Aceasta este prima dată când guvernul a efectuat o anchetă la nivel național, privind sinuciderile.","english":"This is the first time the government has done a nationwide investigation regarding suicides.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8921739","romanian":"Niciun viitor nu poate compensa ceea ce lăsați să se întâmple în prezent.","english":"No future can compensate for what you let happen in the present.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13616964","romanian":"Voi puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9839372","romanian":"Părtidelor nu li se permite să discute propunerile lor politice în timpul dezbaterii.","english":"Parties are not allowed to discuss their political propositions during the debate.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1186853","romanian":"- 30 de dolari e mult pentru acea cameră mică, se gândi el.","english":"Thirty dollars is a lot for that small room, he thought.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338197"},{"id":"tat-6599852","romanian":"Din cauza unor circumstanțe neprevăzute, excursia noastră în munți, din acest weekend, va fi anulată.","english":"Due to unforeseen circumstances, our trip to the mountains this weekend will be cancelled.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-luceafarul","title":"Luceafarul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":140,"excerpt":"A fost odata ca-n povesti, A fost ca niciodata, Din rude mari imparatesti, O prea frumoasa fata. Si era una la parinti Si mindra-n toate cele, Cum e Fecioara intre sfinti Si luna intre stele. Din umbra falnicelor bolti Ea pasul si-l indreapta Linga fereastra, unde-Loss'n colti Luceste alba noapte."},{"id":"story-ro-neghini-3","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":235,"excerpt":"– Bine, bine, zise acelaşi glas, văd eu că nu-ţi trebuie copii… Baba îşi luă inima în dinţi şi zise: – Ba-mi trebuie… da’ unde eşti… cine eşti? – Cine sunt? Neghiniţă, gândul lumii. De mic ce sunt, pătrund în urechile oamenilor şi-i ascult cum gândesc."},{"id":"story-ro-palatul-de-cle-tar-2","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Pe-aşa vremuri se zice că ar fi văcuit împăratul cu stema ruptă din soare, în cel mai frumos palat de cleştar şi peste cel mai înţelept şi mai viteaz norod. Nu era crai pe care împăratul cu stema ruptă din soare să nu-l fi domolit, că nici o oaste duşmană nu putea să-i stea împotrivă."},{"id":"story-ro-z-na-mun-ilor-3","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Cum se duse turturica, simţi, nu ştiu cum, nu ştiu de ce, că îi tâcâia inima. După ce se întoarse acasă, era tot cm galeş. Împăratul văzând că tânjeşte fiu-său cu sănătatea, îl întrebă ce are, iară el răspunse că n-are nimic. Turturica aceea era Zâna Munţilor care se îndrăgostise de frumuseţea lui."},{"id":"story-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":170,"excerpt":"Ghita era un om simplu care visa la o viata mai buna pentru familia sa. Cand a auzit ca moara de la marginea satului e de inchiriat, a vazut o sansa. \"Hai sa luam moara,\" i-a spus sotiei lui, Ana. \"Vom munci si vom prospera.\" La inceput, totul a mers bine."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-2","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"După ce-l mai ciocmăni muierea o toană, puse în gând să-i facă voia, căci limbuţia nevestei îl scoase afară din ţâţâni. Se sculă, deci, de dimineaţă, îşi luă copiii şi plecară împreună cu vorba că merge la lemne."},{"id":"story-ro-pas-rea-m-iastr","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un împărat evlavios şi bun. El avea trei feciori. Pe lângă multe bunătăţi ce făcuse oamenilor din împărăţia lui, a ridicat şi o monastire de care să se ducă pomina. A împodobit-o cu aur, cu pietre nestemate şi cu tot ceea ce meşterii din acea ţară au socotit mai scump şi mai frumos."},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat şi o împărăteasă; ei nu făceau copii; umblase pe la toţi vracii şi vrăjitorii, pe la toate babele şi cititori de stele, şi toţi rămaseră de ruşine, căci n-avură ce le face."},{"id":"story-ro-mo-nichifor-co-cariul-2","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":224,"excerpt":"Două iepe, albe ca zăpada şi iuţi ca focul, se sprijineau mai totdeauna de oiştea căruţei; mai totdeauna, dar nu totdeauna, căci moş Nichifor era şi geambaş de cai, şi când îi venea la socoteală, făcea schimb, ori vindea câte-o iapă chiar în mijlocul drumului, şi atunci rămânea oiştea goală pe de-o parte."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-3","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Toţi cu totul zicea că aşa i-a fost orânda şi credeau că trebuie să fi căzut asupra capului lui vrun blestem de la Dumnezeu. Ajunsese omul să-şi urască zilele."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
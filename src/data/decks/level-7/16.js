@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-1143136","romanian":"- 99 copeici, a declarat Dima cu mândrie. Am nevoie de 99 copeici.","english":"99 kopeks, Dima stated proudly. \"I need 99 kopeks.\"","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068904"},{"id":"tat-10787601","romanian":"Ai putea să te rănești dacă ai încerca să faci asta.","english":"You might get hurt if you tried doing that.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-702194","romanian":"Am mâncat până mi s-a făcut rău.","english":"I ate myself sick.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397911"},{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10006115","romanian":"În epoca stalinistă, prizonierii din lagărele de concentrare au devenit sclavi în slujba statului.","english":"During the Stalinist era, prisoners at concentration camps became slaves in service of the state.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6586236","romanian":"Tocmai i-am spus lui Mary că doream să o ajut să-și curețe garajul.","english":"I just told Mary that I wanted to help her clean the garage.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6824477","romanian":"Lumea pe care am văzut-o în visul meu era o lume pașnică, lipsită de război.","english":"The world which I saw in my dream was a peaceful world devoid of war.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-217","romanian":"Experienta ne-a invatat ca rabdarea este cea mai importanta virtute.","english":"Experience has taught us that patience is the most important virtue.","difficulty":8,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153159","romanian":"Bunicul meu a adunat o avere mare pe piaţa stocurilor şi apoi a pierdut-o în întregime peste noapte.","english":"My grandfather amassed a great fortune in the stock market and then lost it all over night.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1751960"},{"id":"tat-6673371","romanian":"Este posibil să credeți că, comentariul dumneavoastră a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-4987505","romanian":"După ce s-a despărțit de ea, Simon s-a îndepărtat fără să se uite înapoi.","english":"After splitting up with her, Simon walked away without looking back.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6638268","romanian":"Producția industrială a animalelor, este principalul factor care contribuie la sporirea gazelor cu efect de seră.","english":"The industrial production of livestock is the leading contributor to greenhouse gases.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10452045","romanian":"Deși mulți grăiesc vorbe goale în fața ideii de acțiune afirmativă, în realitate, foarte puține minorități sunt angajate.","english":"Although many pay lip service to the idea of affirmative action, in reality, very few minorities get hired.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-6637595","romanian":"Din punctul de vedere al designului arhitectural, pot exista mai multe alternative cu privire la această abordare.","english":"From the standpoint of architectural design, there can be more alternatives to this approach.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-706000","romanian":"Ai avut un sfârşit de săptămână plăcut?","english":"Did you have a good weekend?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968646"},{"id":"tat-6060858","romanian":"Poate ai putea sa inveti cite ceva de la el.","english":"Perhaps you could learn a thing or two from him.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1143186","romanian":"E ciudat că ar trebui să eșuezi.","english":"It is strange that you should fail.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069265"},{"id":"tat-1192775","romanian":"Majoritatea oamenilor spun că cel mai bun mod de a învăţa o limbă străină este să o înveți de la un vorbitor nativ.","english":"Most people say that the best way to learn a foreign language is to learn from a native speaker.","difficulty":9,"wordCount":23,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364285"},{"id":"tat-9813136","romanian":"O pisică este un leu în miniatură care iubește șoarecii, urăște câinii și tolerează oamenii.","english":"A cat is a miniature lion that loves mice, hates dogs and tolerates humans.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-o-via-pierdut-2","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acum se stânge, încât abia mai rămâne sămânță de lumină… acum se ridică mai lătăreață și mai îndărătnică. Moș Mărian privește, îi ies lacrămile din ochi, i se sloiesc pe gene… De mult s-a-ntunecat și el mereu privește, ca și când ar voi să-și tălmăcească taina vieții din jocul acelei flăcări. În sfârșit, se mișcă."},{"id":"story-ro-gura-satului","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Nu-i vorbă, răi sunt oamenii, încât mai răi nici n-ar putea să fie. Chiar și acela pe care toată lumea îl știe de bun își are ceasurile de răutate, și nu avem decât să-l atingem unde-l doare pentru ca să-l facem mai dârz decât alții. Dar nenea Mihu tot om bun rămâne."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"A fost odată un om. El avea o fată şi un băiat. Şi rămânând văduv de muma copiilor, îl îndemnă ariciul să se însoare a doua oară. Neveste-sei îi sta aceşti copilaşi ca sarea în ochi. Nu era dimineaţă, nu era seară, nu era clipă lăsată de la Dumnezeu să nu-i amărască."},{"id":"story-ro-rodul-tainic-3","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Iară dânsa era Mama Vânturilor. Seara, după ce s-a întors, fiul ei a simţit miros de om pământean. – Simt boare de om, zise el mumei sale. Cine a venit şi în ce treburi umblă? Ea îi spuse ce şi cum, toate din fir a păr, precum le aflase de la Danciu."},{"id":"story-ro-cele-trei-rodii-aurite","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un împărat, şi avea un fecior; acesta, şezând la fereastră, vede o babă bătrână, care venea cu tivga să ia apă de la fântână."},{"id":"story-ro-povestea-lui-stan-p-itul","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"Era odată un flăcău stătut, pe care-l chema Stan. Şi flăcăul acela din copilăria lui se trezise prin străini, fără să cunoască tată şi mamă şi fără nici o rudă care să-l ocrotească şi să-l ajute."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-testament","title":"Testament","author":"Tudor Arghezi","difficulty":7,"genre":"poetry","wordCount":130,"excerpt":"Nu-Loss'nti voi lasa drept mostenire, fiule, Nici ogoare largi, nici case inalte, Ci doar un nume curat si-Loss'n suflet Cuvinte multe, frumoase si sfinte. Cartea pe care o scriu e toata viata mea, Fiecare litera e o suferinta, Fiecare pagina e o bucurie, Si fiecare rand e o nadejde."},{"id":"story-ro-mo-nichifor-co-cariul","title":"Moş Nichifor Coţcariul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Moş Nichifor nu-i o închipuire din poveşti, ci e un om ca toţi oamenii; el a fost odată, când a fost, trăitor din mahalaua Ţuţuenii din Târgul Neamţului, dinspre satul Vânătorii Neamţului."},{"id":"story-ro-popa-duhu-2","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"Mare de inimă, iar de gură şi mai mare, părintele Duhu nu se învrednicise de o viaţă mai bună; dar se vede că nici poftea el una aşa, de vreme ce nu-şi astâmpăra gura cătră mai-marii săi măcar să-l fi picat cu lumânarea."},{"id":"story-ro-limir-mp-rat-3","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":212,"excerpt":"– Mergi – îi zise dar – copila mea, şi nici spine, nici buruiană în cale să nu-ţi găseşti."}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
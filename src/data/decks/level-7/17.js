@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-11674204","romanian":"Prima mea profesoară se numea Iracema. Iracema este, de asemenea, numele uneia dintre surorile mele.","english":"My first teacher was called Iracema. Iracema is also the name of one of my sisters.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11663746","romanian":"Toki Pona nu este o limbă care trebuie vorbită, ci doar care trebuie citită și scrisă.","english":"Toki Pona is not a language to be spoken, but only to be read and written.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-6614173","romanian":"Dl. și dna. Yamada se vor întoarce în țara lor de baștină luna viitoare.","english":"Mr. and Mrs. Yamada will return to their homeland next month.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5229148","romanian":"Poliția s-a uitat peste tot și nu a putut găsi nici o urmă a lui Tom.","english":"The police looked everywhere and could find no trace of Tom.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10452012","romanian":"Actualul imn național al Georgiei a fost acceptat în 2004, când Saakashvili a ajuns la putere.","english":"The current national anthem of Georgia was accepted in 2004, when Saakashvili came to power.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13619031","romanian":"Dumneavoastră nu sunteți o picătură în ocean, ci sunteți întregul ocean într-o picătură.","english":"You are not a drop in the ocean, you are the entire ocean in a drop.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136563","romanian":"Clădirea se poate prăbuși în orice moment.","english":"The building may crash at any time.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965193"},{"id":"tat-5158943","romanian":"Ceea ce îi este permis lui Jupiter nu este în mod necesar permis și unui bou.","english":"All that is allowed to Jupiter is not necessarily allowed to an ox.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10788510","romanian":"Știam că Tom ar putea să nu fie în stare să facă asta.","english":"I knew that Tom might not be able to do that.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12058655","romanian":"Zonele umede adăpostesc o gamă largă de specii de plante, printre care coada-șoricelului, stufărișurile și nuferi.","english":"Wetlands are home to a vast array of plant species, including cattails, reeds, and water lilies.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568509","romanian":"Când trimiteți o telegramă, concizia este esențială, deoarece veți fi taxat pentru fiecare cuvânt.","english":"When you send a telegram, brevity is essential because you will be charged for every word.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153754","romanian":"N-am întârziat niciodată la școală mai înainte.","english":"I had never been late for school before.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2639577"},{"id":"tat-705818","romanian":"Am fost foarte impresionat de discursul său.","english":"I was deeply impressed by his speech.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963912"},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-218","romanian":"Colaborarea internationala este esentiala pentru progresul stiintific.","english":"International collaboration is essential for scientific progress.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-11651384","romanian":"Limba română este mai puțin asemănătoare cu portugheza, spaniola, italiana și franceza decât am crezut.","english":"Romanian is less similar to Portuguese, Spanish, Italian, and French than I thought.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11790112","romanian":"Dacă această echipă continuă să joace atât de prost, va fi retrogradată din nou.","english":"If this team continues to play this badly, it will be demoted again.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136537","romanian":"L-am sondat cu privire la opiniile sale.","english":"I sounded him out about his views.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965088"}],"stories":[{"id":"story-ro-norocul-dracului-2","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"dacă n-ar fi, n-ar fi lumea cum e. Eu n-am arat, n-am săpat, n-am prăşit, n-am plivit ca ceilalţi? Ba da, şi ogorul meu a ieşit sterp; piatra pe mine m-a bătut; şi, rămas numai cu mâinile, muncesc, şi nimeni nu mă crede; iar când la măsurătoarea muncii, lucrul meu scade, şi făina din copaie scade, şi foamea copiilor creşte\"."},{"id":"story-ro-inul-i-c-me-a","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Inul: – Ştii tu, cămeşă dragă, ce erai odată? Poveşti de Ion Creangă - Inul şi cămeşa – Ce să fiu? Eram ceea ce mă vezi: cămeşă albă, cu care se îmbracă oamenii. – Nu-i aşa!"},{"id":"story-ro-porcul-cel-fermecat","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"A fost odată un împărat şi avea trei fete. Şi fiind a merge la bătălie, îşi chemă fetele şi le zise: Poveşti de Petre Ispirescu - Porcul cel fermecat – Iacă, dragele mele, sunt silit să merg la război. Vrăjmaşul s-a sculat cu oaste mare asupra noastră. Cu mare durere mă despart de voi."},{"id":"story-ro-uer-2","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":215,"excerpt":"Kira şi-aşteaptă voinicul din haiducie. În coarne de cerb atârnă carabine cu guri largi şi pistoale cu plăsele de argint şi de sidef. Văpaiţa, cu feştilă de câlţi răsuciţi, tremură în colibă o lumină galbenă şi tristă. Flacăra ei slabă joacă, ca şi când ar voi să scape din feştilă, şi aruncă umbra Kirei, de pe perete, sus, pe grinzi."},{"id":"story-ro-ho-u-mp-rat-2","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"Cum auzea că în cutare cetate este câte vrun meşter mai dibaci şi că acea meserie nu se află pe la dânsul, îndată îl trimitea să înveţe şi acea meserie. Astfel umblă fiul împăratului din ţară în ţară, ca şi un pribeag, până ce învăţă toate meseriile de pre pământ."},{"id":"story-ro-ion-roat-i-cuza-vod-2","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Atâta-i ajungea capul, atâta făceau şi ei pe vremea lor, Dumnezeu să-i ierte şi să-i odihnească, unde-or fi acolo, că bună inimă mai aveau! Dar să ne întoarcem iar la Divanul ad-hoc."},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-2","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Doresc prea mult să văz la masa mea măcar un măr din acest pom care m-a ţinut atâta sumă de bani şi de aceea, iată, mă înduplec şi te las ca să pândeşti, măcar că nu-mi vine a crede că o să izbuteşti."},{"id":"story-ro-p-dureanca-2","title":"Pădureanca","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Simțind apropierea timpului de secere, pădurile se pun în mișcare colibă cu colibă, sat cu sat se adună, văile pornesc întregi spre câmpia întinsă, și în câteva zile cât ține locul din Mureș până în părțile Orăzii și până la izvoarele Crișurilor nu mai rămân prin sate decât moșnegii neputincioși, babele bătrâne și copiii nevârstnici; setea de viață îi ia și-i duce pe toți la sărbătoarea cea mare ce se ține în fieștecare an o dată pentru împărțirea pânei de toate zilele."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-2","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Băiatul lui i-o spus: iaca, tată, din ce pricină. Şi omul s-o sfătuit cu mama fetei, s-o prăpădească din pricina asta. Au tocmit un om, ş-au pus pe fată ‘n căruţă ş-au zis s-o ducă ‘ntr-o pustietate, şi să-i scoată ochii amândoi să-i aducă tătâne-său. Omul a luat-o. După fată se ţinea ş-un căţeluş."},{"id":"story-ro-stan-bolovan","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":220,"excerpt":"Au fost odată, într-o margine de sat, un om, pe nume Stan, şi muierea lui. Ea era tristă mereu şi degeaba încerca soţul ei să afle de ce, că ea nu voia să-i spună, căci, zicea ea, avea să fie şi el trist dacă află."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-6867575","romanian":"Procurorii în instanță trebuie să-și justifice afirmațiile pentru a demonstra că un suspect este vinovat.","english":"Prosecutors in court have to substantiate their claims in order to prove a suspect is guilty.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12085368","romanian":"Rusia este pur și simplu casa unora dintre cele mai frumoase femei de pe planetă.","english":"Russia is simply home to some of the most beautiful women on the planet.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1137565","romanian":"Cu ajutorul acestei aplicații, veți putea sincroniza fotografiile și muzica între aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"},{"id":"tat-1153156","romanian":"M-am dus la petrecere pe prezumția că ea va fi acolo.","english":"I went to the party on the presumption that she would be there.","difficulty":7,"wordCount":11,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749169"},{"id":"tat-13621249","romanian":"Turiștii au început să bâiguie entuziasmați de îndată ce ghidul a menționat fantomele.","english":"The tourists began to gabble excitedly as soon as the guide mentioned ghosts.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-583874","romanian":"Motivul principal pentru care prietenii își părăsesc prietenii pe Facebook e din cauza prea multor postări inutile.","english":"The number one reason why friends dump their friends on Facebook is too many useless posts.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/954288"},{"id":"tat-9819149","romanian":"Creșterea incontrolabilă a populației mondiale va duce inevitabil la războaie, crize economice și umanitare.","english":"The uncontrolled growth of world population will inevitably lead to wars, economic and humanitarian crises.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-211","romanian":"Situatia economica actuala ne obliga sa facem schimbari importante.","english":"The current economic situation forces us to make important changes.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1153151","romanian":"Trebuie să ne trezim devreme mâine dimineață?","english":"Do we have to get up early tomorrow morning?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1692258"},{"id":"tat-1133950","romanian":"M-am aşezat şi am deschis laptopul meu.","english":"I sat down and opened my notebook.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9939356"},{"id":"tat-13612831","romanian":"Tom a spus că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-225","romanian":"Tehnologia digitala transforma fundamental modul in care comunicam.","english":"Digital technology is fundamentally transforming the way we communicate.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1106069","romanian":"Am avut o vorbire lungă cu ea.","english":"I had a long talk with her.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9684669"},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5044147","romanian":"Rata șomajului în Japonia a fost de 3,4 la sută în luna septembrie a anului 2015.","english":"The unemployment rate in Japan was 3.4 percent in September of 2015.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568457","romanian":"Oamenii care iubesc nu se îndoiesc de nimic sau pun la îndoială totul.","english":"People who love doubt nothing, or doubt everything.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4989065","romanian":"De când am plecat și până m-am întors a bătut întruna la tobe.","english":"From the moment I left till I came back, he had been hitting the drum without interruption.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138134","romanian":"Dacă vrei să pari vorbitor nativ, ascultă vorbitori nativi de câte ori este posibil.","english":"If you want to sound like a native speaker, listen to native speakers whenever possible.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-bunica","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"O văz, ca prin vis. Poveşti de Barbu Ştefănescu Delavrancea - Bunica O văz limpede, aşa cum era. Naltă, uscăţivă, cu părul alb şi creţ, cu ochii căprui, cu gura strânsă şi cu buza de sus crestată în dinţi de pieptene, de la nas în jos. Cum deschidea poarta, îi săream înainte."},{"id":"story-ro-z-na-mun-ilor-2","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"După ce veniră filosofii, învăţă şi de la dânşii câte în lună şi în soare. Bucuria tatălui său era aşa de mare unde vedea că fiu-său are să fie procopsit ca nici unul din fiii de împăraţi, încât se uita la dânsul ca la soare. Iară el de ce se mărea d-aia se făcea mai cu minte şi mai frumos."},{"id":"story-ro-cinci-p-ini-3","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Mai dreaptă împărţeală decât aceasta nu cred că se mai poate nici la Dumnezeu sfântul… – Ba nu, prietene, zice cel cu două pâni. Eu nu mă ţin că mi-ai făcut parte dreaptă. Haide să ne judecăm, şi cum a zice judecata, aşa să rămâie. – Haide şi la judecată, zise celălalt, dacă nu te mulţămeşti."},{"id":"story-ro-fata-mo-ului-cea-cuminte-2","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":209,"excerpt":"Când, tocmai când era să se dea jos, zări spre răsărit abia licărind o mititică vâlvotaie; se coborî de pe acoperiş şi o luă într-acolo. Se duse, se duse şi la foc nu mai ajunse; dară în drumul ei întâlni o grădină părăginită, care o strigă zicându-i: – Fată mare, fată mare!"},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"A fost odată într-o pustie mare un pustnic, şi petrecea singur singurel. Vecinii săi erau fiarele pădurilor. Şi aşa era de bun la Dumnezeu, încât toate dobitoacele i se închinau, când se întâlneau cu dânsul."},{"id":"story-ro-gura-satului-2","title":"Gura satului","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Feciorii, fiindcă sunt doi și feciori, oricât de voinici ar fi, stau sub porunca părintească; Marta însă e una singură, adică nu mai are în casă pe nimeni deopotrivă cu dânsa. Încă pe când era în fașe, Marta avea obiceiul de a pune toată casa în mișcare."},{"id":"story-ro-departe-departe","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"Sub castanii din via părăsită, mai mulţi copilaşi, în cămăşi albe, mă înconjuraseră. Stam pe pământul cald, cu mâinile sub cap, privind adâncul cerului albastru, şi povesteam. Poveşti de Barbu Ştefănescu Delavrancea - Departe, departe O fetiţă îmi sorbea cuvintele, dând într-o parte şi alta, pletele negre ce-i acopereau ochii ei mari şi verzi…"},{"id":"story-ro-popa-duhu","title":"Popa Duhu","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"Cine-a întâlnit vrodată în calea sa un popă, îmbrăcat cu straie sărăcuţe, scurt la stat, smolit la faţă, cu capul pleş, mergând cu pas rar, încet şi gânditor, răspunzând îndesat \"sluga dumitale\" cui nu-l trecea cu vederea, căscând cu zgomot când nu-şi găsea omul cu care să stea de vorbă, făcând lungi popasuri prin aleiele ascunse ale grădinilor publice din Iaşi, câte cu o carte în mână, tresărind la cântecul păserelelor şi oprindu-se cu mirare lângă moşinoaiele de furnici, pe care le numea el \"republici înţelepte\", dezmerdând iarba şi florile câmpului, icoane ale vieţii omeneşti, pe care le uda câte c-o lacrimă fierbinte din ochii săi şi apoi, cuprins de foame şi obosit de osteneală şi gândire, îşi lua cătinel drumul spre gazdă, unde-l aştepta sărăcia cu masa întinsă."},{"id":"story-ro-greuceanu-3","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Această izbândă o luă drept semn bun, şi Greuceanu, mergând a doua oară la împăratul, grăi cu cuvintele lui mieroase cele următoare: – Mărite doamne, să trăieşti întru mulţi ani pe luminatul scaunul acestei împărăţii."},{"id":"story-ro-comoara-2","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"Iar dacă erau odată la han, nu puteau să macine-n sec: tot pe timpul cât stătuse-n oștire a luat Duțu și deprinderea de a nu-și trage, când n-are nevoie, nimic de la gură. De ce adecă muncea el toată săptămâna?!"}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
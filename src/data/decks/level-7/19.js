@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-1059642","romanian":"Te rog, păstrează cartea asta la îndemână.","english":"Please keep this book at hand.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/938549"},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"},{"id":"tat-209","romanian":"Comunicarea eficienta este cheia oricarei relatii de succes.","english":"Effective communication is the key to any successful relationship.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-582948","romanian":"Democrația este cea mai proastă formă de guvernământ, cu excepția tuturor celorlalte care au fost încercate.","english":"Democracy is the worst form of government, except all the others that have been tried.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6569015"},{"id":"tat-1144311","romanian":"A privit șirul de cocori agăţat de tavan, pe care fratele ei Masahiro l-a agățat acolo pentru ea.","english":"She looked at her flight of cranes hanging from the ceiling, which her brother Masahiro had hung there for her.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073447"},{"id":"tat-207","romanian":"El a reusit sa depaseasca toate obstacolele din calea lui.","english":"He managed to overcome all the obstacles in his way.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-12697576","romanian":"Ești ăla care l-ai făcut pe tom sa facă aia?","english":"Are you the one who asked Tom to do that?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12929969","romanian":"Poți să mă consideri romantică, draga mea soră, dar simt amarnic lipsa unui prieten.","english":"You may deem me romantic, my dear sister, but I bitterly feel the want of a friend.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-224","romanian":"Dezvoltarea sustenabila trebuie sa fie prioritatea noastra principala.","english":"Sustainable development must be our main priority.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-2568515","romanian":"De fiecare dată când mă alătur unui nou joc de Warcraft, dau de o nouă echipă de adversari.","english":"Every time I join a new game of Warcraft, I am pitted against a new team of adversaries.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-13619641","romanian":"Taipanul de uscat, un șarpe întâlnit în Australia, este cel mai veninos șarpe din lume.","english":"The inland taipan, a snake found in Australia, is the most venomous snake in the world.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143283","romanian":"Ar fi trebuit să ai curajul să spui deschis ce crezi că este corect.","english":"You ought to have the courage to speak out what you believe to be right.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068669"},{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153874","romanian":"Ar trebui să facem tot ce putem.","english":"We should do our best.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12099422"},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1144321","romanian":"Cam acum patru ani, tendonul lui Ahile a început să mă doare și mi s-a spus că e tendinită.","english":"About four years ago my Achilles tendon started to hurt and I was told it was Achilles tendonitis.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073567"},{"id":"tat-9586394","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosit ca să gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-610855","romanian":"La începutul fiecărui sfârşit de săptămână sunt în acelaşi timp obosit şi bucuros.","english":"At the start of every weekend, I am both tired and happy.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/684564"},{"id":"tat-1143256","romanian":"Fabrica a fost închisă pentru renovare şi va fi deschisă pe 1 septembrie 2007.","english":"The factory is closed for refurbishment and will re-open on 1st September 2007.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068570"}],"stories":[{"id":"story-ro-borta-v-ntului-2","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":213,"excerpt":"– Mă duceam s’ astup borta vântului ş’ am întâlnit un nebun pe drum şi mi-o dat o nucă şi-a zis să nu zic pân’ a casă nucă, deschide-te. Ce-a mai fi şi asta? Femeia omului vicleană. Ia o nucă ‘n mână şi zice: – Ia să-ţi văd nuca. Îi schimbă nuca omului."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-3","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":213,"excerpt":"Şi astfel ajunsese de poveste. Unii zicea că ştia carte până în glezne, alţii zicea că până în genunchi, iară alţii, până în brâu. De m-ar fi întrebat pe mine, eu le-aş fi spus că ştia carte până în gât."},{"id":"story-ro-o-via-pierdut","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Crivățul șuieră și vâjie izbind în toate părțile stropii sloiți. Pereții caselor, geamurile ferestrilor, scoarța copacilor, grădelele de prin prejurul grădinii, toate deopotrivă sunt învăluite cu o lucie coajă de sloi. În grădina bisericii, pe piața de dinaintea ei, pe ulițile ce se varsă din toate părțile, oamenii, unii pe jos, alții cu trăsura, grăbesc la adăpostul călduros."},{"id":"story-ro-poveste-r-neasc-3","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Cum se auzi cocoşul, duhul pieri ca o nălucă, dară şi băiatul căzu jos de ostenit. De mai ţinea lupta, numai cât ai aţâţa un foc, s-ar fi muiat, şi cine ştie ce se întâmpla. Cum căzu fiul de împărat pe mormântul tătâne-său, acolo şi adormi. Atât era de rupt de oboseală. Când se deşteptă, ce să vedeţi d-voastră?"},{"id":"story-ro-ileana-cea-ireat-3","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acuma fata de împărat se apropie de fereastră şi grăi cu glas blând: – Ţi-am zis să mergi pe calea pe care ai venit: spini să-ţi crească-n cale şi flori să-ţi rămână pe urmă. Încă trei zile şi trei nopţi stete feciorul de împărat la fereastra fetei."},{"id":"story-ro-coto-man-n-zdr-vanu-3","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Nu mult după aceasta, femeia se simţi îngreunată. Atunci să fi văzut bucurie pe casnici, încât nu-i ţinea pământul. Iară când fu la facere, născu un copilaş gras şi frumos şi sănătos. Crescu copilul şi se făcu mare. Nu se despărţea de pisoi nici cât ai da în cremene. Amândoi se jucau, amândoi mâncau la masă, amândoi se culcau."},{"id":"story-ro-fata-babei-i-fata-mo-neagului","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":251,"excerpt":"Erau odată un moşneag şi-o babă; şi moşneagul avea o fată, şi baba iar o fată. Fata babei era slută, leneşă, ţâfnoasă şi rea la inimă; dar, pentru că era fata mamei, se alinta cum s-alintă cioara-n laţ, lăsând tot greul pe fata moşneagului. Fata moşneagului însă era frumoasă, harnică, ascultătoare şi bună la inimă."},{"id":"story-ro-limir-mp-rat","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"A fost ce-a fost… a fost odată o văduvă care avea o fată, Lia, şi văduva era săracă de nu mai ştia cum să-şi înnoade zdrenţele, iar Lia, fata ei, se făcuse harnică de creşteau flori pe unde-i călca piciorul şi da muguri lemnul uscat când ea punea mâna pe el."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-3","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Băietul când s-o făcut mare o ‘ntrebat: – Mamă, unde-i tata? Ea i-a spus lui, că nu ştie cine-i. Zice: – Eu mă duc, mamă, să-l cat. – Te-i duce, dragul mamei, da dacă-i pute scoate copacul de aici din pământ. Cum a pus mâna, l-o scos cum aş scoate eu o rădăcină de morcov."},{"id":"story-ro-inul-i-c-me-a-2","title":"Inul şi cămeşa","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":219,"excerpt":"Tortul l-au depănat pe râşchitor, spre a-l face căleap; călepele s-au fert cu leşie, să se înălbească, apoi te-au pus pe vârtelniţă, de pe care au început a le depăna pe mosoare cu letca; de pe mosoare te-au urzit pe urzoi, apoi te-au luat şi te-au învălit pe sulul de dinapoi, punând vergele pintre pături, ca să nu se hrentuiască urzala; şi fuscei pintre rost, ca să nu se încâlcească natra."},{"id":"story-ro-la-crucea-din-sat-3","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– I-ai adăpat? – Asta nu se face acum; știi d-ta bine că noi adăpăm boii când se culcă găinile! – Dar caii... Bujor îi taie vorba: – Bade Mitre!"}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
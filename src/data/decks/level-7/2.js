@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-12047689","romanian":"Deși e de la sine înțeles, mai bine ar fi să se spună.","english":"While it goes without saying, it would go even better if it was said.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-202","romanian":"Cultura romaneasca are radacini adanci in traditiile populare.","english":"Romanian culture has deep roots in folk traditions.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-2536167","romanian":"Fiecare persoană care e singură e singură pentru că se teme de alții.","english":"Every person who is alone is alone because they are afraid of others.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187071","romanian":"Ei și-au format propria asociație la nivel național, Asociația Americană a Persoanelor Pensionate.","english":"They have formed their own nationwide association, the American Association of Retired Persons.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8817097","romanian":"Dacă ai probleme, te voi ajuta să studiezi limba engleză.","english":"If you are having problems, I will help you study English.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6599793","romanian":"Ți-ar plăcea să vezi cu mine sâmbătă o interpretare live a unei piese?","english":"Would you like to see a live performance of a play with me Saturday?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6918496","romanian":"Am crezut că Tom va fi de acord cu mine.","english":"I thought Tom would agree with me.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1192768","romanian":"Pentru ce ai cumpărat acest dicționar costisitor?","english":"What did you buy this expensive dictionary for?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12357179"},{"id":"tat-10450614","romanian":"Biletele sunt 30 de dolari pentru adulți și 15 de dolari pentru copiii de peste 4 ani.","english":"Tickets are $30 for adults and $15 for children over 4 years old.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-12085392","romanian":"Se zvonea că bea, dar era dificil de dovedit pentru că bea numai singură.","english":"It was rumored that she drank, but it was hard to prove, as she only drank alone.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1192795","romanian":"Teledonul este un program TV francez organizat în fiecare an pentru a colecta fonduri în scopul finanțării de cercetări medicale.","english":"The telethon is a French TV program organized every year to collect funds in order to finance medical research.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351508"},{"id":"tat-5144503","romanian":"Subiectul unei propoziții este, de obicei, o persoană sau un lucru care efectuează acțiunea indicată de verb.","english":"The subject of a sentence is usually a person or a thing performing the action shown by the verb.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136538","romanian":"Am ajuns la un hotel în Roma.","english":"We arrived at a hotel in Rome.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960197"},{"id":"tat-219","romanian":"Analiza detaliata a datelor a relevat tendinte neasteptate.","english":"Detailed data analysis revealed unexpected trends.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-10788926","romanian":"Domnul Smith nu este disponibil. Doriți să vă faceți o programare pentru a veni să-l vedeți?","english":"Mr. Smith is not available. Would you like to make an appointment to come see him?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6764268","romanian":"El a crezut că afirmația ei este pur și simplu imposibilă și a consimțit propunerea.","english":"He believed her assertion to be simply impossible and assented to the proposal.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13598708","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singură.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136817","romanian":"Dreptul apei este domeniul dreptului care se ocupă cu proprietatea, controlul și utilizarea apei ca resursă.","english":"Water law is the field of law dealing with the ownership, control, and use of water as a resource.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966559"},{"id":"tat-6795174","romanian":"Muncitorii din țările nordice au plătit un preț ridicat pentru mutarea producției în regiunile sudice.","english":"The workers of the northern countries have paid a high price for the displacement of production in the southern regions.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1142947","romanian":"Am nevoie de stilouri, caiete și altele.","english":"I need pens, notebooks and so on.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12067969"}],"stories":[{"id":"story-ro-stan-bolovan-2","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":217,"excerpt":"Acolo află că un zmeu vine în fiecare noapte şi le ia câte trei oi, dar şi laptele de la şaptezeci şi şapte de oi, pe care îl ducea zmeoaicei bătrâne, să se scalde în el ca să întinerească."},{"id":"story-ro-bunicul-3","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Biiine, tată, biiine… dar ştii… o, bată-i focul de copii!… Femeia intră în casă. – Să-i bată norocul şi sănătatea, şopti moşul ca şi cum ar fi mustrat pe cineva, şi sărută în creştetul capului şi pe unul, şi pe altul. Şi iar începu râsul, şi jocul, şi cântecul. Se osteni bunicul. Stătu din joc. Copiii începură să-l mângâie."},{"id":"story-ro-george-cel-viteaz-3","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Împăratul trimise pe împărăteasa să boteze pruncul, căci el va sta să dea piept cu tălharii, până se va întoarce ea. Împărăteasa se supuse poruncii şi plecă. Când să se întoarcă de la botez, veni până la un loc; aci, stând şi nemaiauzind zăngănitul armelor şi zgomotul luptei, îi dete un fier ars în inimă."},{"id":"story-ro-amintiri-din-copil-rie-i-2","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Şi unde nu s-au adunat o mulţime de băieţi şi fete la şcoală, între care eram şi eu, un băiat prizărit, ruşinos şi fricos şi de umbra mea."},{"id":"story-ro-f-t-frumos-din-lacrim-2","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":213,"excerpt":"Lungi cearcăne vinete se trăgeau împrejurul ochilor, şi vine albastre se trăgeau pe faţa ei albă ca o marmură vie. Sculată din patul ei, ea se aruncă pe treptele de piatră a unei bolte în zid, în care veghea, deasupra unei candele fumegânde, icoana îmbrăcată în argint a Maicii durerilor."},{"id":"story-ro-palatul-de-cle-tar-3","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":268,"excerpt":"Nu trecu cât ai scăpăra din amnar, şi se apropiară de împărat, cu mângâieri şi dezmierdări, odrasla lui, de trei fete, ca trei zâne, surori şi nepoate, care mai de care mai chipeşe şi mai drăgălaşe. Apoi veniră mai-marii tronului şi slugile ohavnice. Toţi cu toţi ieşiră ca dintr-o lacră, să cadă cu mătănii, doară or curma focul împăratului."},{"id":"story-ro-poveste-3","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"De se întâlneau, ea cu el, fiecare cu focul lui, se înţelegeau din ochi, deşi abia se mai vedeau, şi cu glas uscat se luau iute la harţă, parc-ar fi fost necăjiţi unul pe altul. – Ei, ce mai ai şi astăzi? – Măria-ta ce ai? – Ce să am, ale pustii de bătrâneţi."},{"id":"story-ro-popa-tanda-3","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":213,"excerpt":"O vorbă și încă ceva, pentru mai bună înțelegere, la protopop, o cale la episcopie, și aici o vorbă bună de la protopop: lucrurile se fac, numai dacă le știm face. Cu mult, cu puțin, părintele Trandafir fu trimis de la Butucani la Sărăceni — pentru buna înțelegere între credincioși. Popă-n Sărăceni? Cine știe ce vrea să zică popă-n Sărăceni!"},{"id":"story-ro-bunicul-2","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"– Da. – Tată-moşule, aş vrea să-mi crească şi mie aripi şi să zbor sus de tot, până în slava cerului, zise băiatul netezindu-i barba. – Dacă ţi-o creşte ţie aripi, zise fata, mie să-mi prinzi o presură şi un sticlete. – Da… hî… hî… poi ce fel… şi mie? Fata se întristă."},{"id":"story-ro-cele-trei-rodii-aurite-3","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":210,"excerpt":"– Mamă, zise fiul împăratului, caut cele trei rodii aurite, şi dorinţa de a le avea m-a adus p-aici, nu ştii d-ta încotro se află?"},{"id":"story-ro-sarea-n-bucate-2","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Împăratul se bucură cât un lucru mare când auzi de la fetele lui cele mai mari cât îl iubesc. El socoti că altfel de iubire nu poate să fie decât cea dulce ca mierea şi ca zahărul."}],"recipes":[{"id":"recipe-papanasi","title":{"ro":"Papanasi","en":"Romanian Cheese Doughnuts"},"description":{"ro":"Papanasii sunt gogosi pufoase din branza de vaci, servite cu smantana si dulceata.","en":"Papanasi are fluffy doughnuts made from cottage cheese, served with sour cream and jam."},"difficulty":5,"category":"dessert","ingredients":[{"ro":"branza de vaci","en":"cottage cheese","amount":"500 g"},{"ro":"oua","en":"eggs","amount":"2 bucati"},{"ro":"faina","en":"flour","amount":"150 g"},{"ro":"zahar","en":"sugar","amount":"3 linguri"},{"ro":"gris","en":"semolina","amount":"3 linguri"},{"ro":"bicarbonat","en":"baking soda","amount":"1/2 lingurita"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"ulei pentru prajit","en":"oil for frying","amount":"500 ml"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"},{"ro":"dulceata de afine","en":"blueberry jam","amount":"pentru servire"}],"steps":[{"ro":"Se scurge bine branza de vaci si se paseaza.","en":"Drain the cottage cheese well and mash it."},{"ro":"Se amesteca branza cu ouale, zaharul si coaja de lamaie.","en":"Mix the cheese with eggs, sugar and lemon zest."},{"ro":"Se adauga faina, grisul si bicarbonatul, amestecand usor.","en":"Add flour, semolina and baking soda, mixing gently."},{"ro":"Se formeaza bile mari si bile mici (capacele).","en":"Form large balls and small balls (the caps)."},{"ro":"Se fac gauri in bilele mari cu degetul inmuiat in faina.","en":"Make holes in the large balls with a flour-dipped finger."},{"ro":"Se prajesc in ulei incins pana se rumenesc uniform.","en":"Fry in hot oil until evenly browned."},{"ro":"Se aseaza pe farfurie: gogosile mari, smantana, dulceata si capacelele.","en":"Arrange on plate: large doughnuts, sour cream, jam and the caps."}]}]};
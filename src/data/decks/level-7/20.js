@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-5227954","romanian":"Însoțitoarea de zbor l-a zgâlțâit pe Tom ca să-l trezească și i-a spus că avionul aterizase.","english":"The flight attendant shook Tom awake and told him that the plane had landed.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136909","romanian":"Articolul 6. Președintele va conduce toate întâlnirile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960211"},{"id":"tat-6537690","romanian":"Ar fi mai bine să lași treaba asta cuiva care știe despre ce este vorba.","english":"It would be best to leave it to a man who knows the ropes.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5131142","romanian":"În clipa în care l-am văzut, am știut că e supărat pe mine.","english":"The moment I saw him, I knew he was angry with me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-923913","romanian":"Trebuie să încurajăm lumea să se alăture campaniei şi să lucreze cu noi.","english":"We have to encourage people to join the campaign and work with us.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681131"},{"id":"tat-1136830","romanian":"Persoanele care călătoresc în străinătate trebuie întotdeauna să se obișnuiască cu mâncăruri noi.","english":"People traveling abroad always have to get used to new food.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966321"},{"id":"tat-2568506","romanian":"Un cititor viclean trebuie să fie dispus să cântărească tot ceea ce citește, inclusiv sursele anonime.","english":"An astute reader should be willing to weigh everything they read, including anonymous sources.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1147577","romanian":"Am scris o adresă greșită pe plic.","english":"I wrote a wrong address on the envelope.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12095173"},{"id":"tat-2568518","romanian":"Sarah a avut suficient discernământ pentru a realiza că prietenii ei încercau să-i facă o farsă.","english":"Sarah was discerning enough to realize that her friends were trying to prank her.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-2536729","romanian":"Să faci calcule este singurul mod social acceptabil de a te masturba în public.","english":"Doing math is the only socially acceptable way to masturbate in public.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536357","romanian":"Trebuie să învățăm să trăim împreună ca frații sau vom pieri împreună ca proștii.","english":"We must learn to live together as brothers, or we will perish together as fools.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10792151","romanian":"Dulapul este confecționat din lemn de culoare închisă și are mânere ornamentate din aur.","english":"The wardrobe is made from dark wood and has ornate gold handles.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9735774","romanian":"Am folosit lămâile pe care Tom mi le-a dat pentru a face limonadă.","english":"I used the lemons that Tom gave me to make lemonade.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-708998","romanian":"Noaptea a fost atât de rece încât, atunci când m-am întors, eram aproape îngheţat.","english":"The night was so chilly that when I returned I was almost frozen.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420255"},{"id":"tat-4779015","romanian":"Normalul este o iluzie. Ceea ce este normal pentru un păianjen este haos pentru muscă.","english":"Normality is an illusion. What is normal for a spider is chaos for a fly.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1291063","romanian":"Ești destul de mare cât să știi cum să te comporți. Fii cuminte.","english":"You are old enough to know better. Behave yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136617","romanian":"Cine va fi responsabil de clasa noastră când domnișoara Smith va părăsi şcoala?","english":"Who will be in charge of our class when Miss Smith leaves school?","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965929"},{"id":"tat-6582958","romanian":"Tom nu avea nici o idee despre ce ar fi trebuit să se facă.","english":"Tom had no idea what needed to be done.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-borta-v-ntului","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Era un om sărac – sărac, ş-avea o mulţime de copii. Acu era – în vremea foametei şi el a muncit v-o săptămână pe un căuş de grăunţe. Acu s-a dus la râşniţă cu dânsele. După ce le-o râşnit, a ieşit afară cu căuşul cu făină şi s-a pornit o furtună mare şi i-a luat toată făina din căuş."},{"id":"story-ro-departe-departe-3","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":210,"excerpt":"Şi când mi se păru că palatul se şterge de pe faţa pământului, o rupsei la fugă îndărăt, căci ce m-aş fi făcut în aşa pustietate? Şi de ce goneam, de ce palatul se ridica uşor din grădinile fumurii. Lacul e roşu ca sângele. Apune soarele. Mă rezemai de-o salcie scorburoasă şi începui să mă gândesc. Mi-e foame."},{"id":"story-ro-norocul-dracului","title":"Norocul dracului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":203,"excerpt":"– Ba e noroc! Poveşti de Barbu Ştefănescu Delavrancea - Norocul dracului – Ba nu e noroc! – Ba e noroc, muiere! – Ba nu e, mă omule, nu! – Adică, nu muncesc eu, femeie? – Ba munceşti pentru unul, şi noi suntem opt guri, şi cu Plăviţa, nouă."},{"id":"story-ro-bunica-3","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":218,"excerpt":"Măria-ta, să ştii că atunci când or lega rod ăşti doi meri, împărăteasa o să rămână grea şi o să nască un cocon cu totul şi cu totul de aur\"… Piticul se duse, şi împăratul alergă în grădină, şi căută, căută peste tot locul, până dete peste ăi doi meri."},{"id":"story-ro-aleodor-mp-rat-3","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"Pocitania pământului îi zise: – Toţi nelegiuiţii ce-mi calcă hotarul cad în robia mea. – Mai întâi trebuie să ştii, îi răspunse Aleodor, că din nebăgare de seamă şi fără de voia mea am călcat pe coprinsul tău, şi n-am nici un gând rău asupră-ţi."},{"id":"story-ro-povestea-unui-om-lene","title":"Povestea unui om leneş","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":202,"excerpt":"Cică era odată într-un sat un om grozav de leneş; de leneş ce era nici îmbucătura din gură nu şi-o mesteca. Şi satul, văzând că acest om nu se dă la muncă nici în ruptul capului, hotărî să-l spânzure pentru a nu mai da pildă de lenevire şi altora."},{"id":"story-ro-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"— Omul să fie mulțumit cu sărăcia sa, căci, dacă e vorba, nu bogăția, ci liniștea colibei tale te face fericit. Dar voi să faceți după cum vă trage inima, și Dumnezeu să vă ajute și să vă acopere cu aripa bunătății sale."},{"id":"story-ro-fata-mo-ului","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":208,"excerpt":"Copiii cutreierau voioşi via părăginită. Un şir, ţinându-se cu amândouă mâinile de mijloc, se încolăcea, strigând de frică să nu-i înhaţe \"mama-gaia\". Fetele începuseră \"de-a ulciorul\". – Cum dai ulciorul? Poveşti de Barbu Ştefănescu Delavrancea - Fata moşului – Cum îl vezi, cu ochii verzi, ş-o lingură de păsat, să nu zacă de vărsat. Sub castani, oamenii stau de vorbă."},{"id":"story-ro-popa-tanda-2","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"Minunat om ar fi părintele Trandafir dacă nu l-ar strica un lucru. Este cam greu la vorbă, cam aspru la judecată: prea de-a dreptul, prea verde-fățiș. El nu mai sucește vorba, ci spune drept în față, dacă i s-a pus ceva pe inimă. Nu e bine să fie omul așa. Oamenii se prea supără când le luăm căciula din cap."},{"id":"story-ro-sult-nica-3","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"– Aşa e omul… un ciocan, încă unul ş-al treilea, până ajungi la tinichea… d-acolo-ncolo… Dumnezeu cu mila… torni, parcă torni într-o pârnaie… Dar Sanda ce-o să zică… că mi-a dat Sfântul muiere harnică, dar rea, topenia pământului!… Înlăuntru s-aud ciocneli de pahare, buşeli de călcâie şi zbârnâitul otova al cobzarului. Trăgeau chindia de curgea ţărâna din pod."},{"id":"story-ion","title":"Ion","author":"Liviu Rebreanu","difficulty":6,"genre":"fiction","wordCount":165,"excerpt":"Ion era un tanar tarani din satul Pripas, din Transilvania. Desi era sarac, el visa sa aiba pamant propriu. Pentru el, pamantul era totul - mai important decat dragostea, mai important decat orice. In sat traiau doua fete: Ana, sarac ca el, pe care o iubea cu adevarat, si Florica, fiica unui gospodar bogat."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
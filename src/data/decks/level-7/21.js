@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-6637083","romanian":"Construcția barajului a creat un lac artificial, care a distrus un întreg ecosistem.","english":"The construction of the dam created an artificial lake that destroyed a whole ecosystem.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-203","romanian":"Cu cat inveti mai mult, cu atat realizezi cat de putin stii.","english":"The more you learn, the more you realize how little you know.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1137558","romanian":"Această aplicație vă va lăsa să sincronizaţi fotografiile și muzica dumneavoastră între toate aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5158990","romanian":"Dacă calci cu fierul de călcat Elveția, ar fi mai mare decât Germania.","english":"If you ironed Switzerland, it would be bigger than Germany.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6614182","romanian":"Ozonul este o moleculă compusă din trei atomi de oxigen și apare în natură în cantități reduse.","english":"Ozone is a molecule comprised of three oxygen atoms that occurs naturally in small amounts.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1192806","romanian":"După ce a jucat atât de prost tot jocul, echipa a plecat cu coada între picioare.","english":"After playing so badly for the entire game, the team walked off with their tails between their legs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354510"},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6595168","romanian":"Bob i-a spus lui Jane să nu se amestece în treburile sale personale.","english":"Bob told Jane not to interfere in his personal affairs.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1185121","romanian":"Won-ul este folosit atât în Coreea de Nord, cât și în Coreea de Sud. Simbolul său este \"₩\".","english":"Won is used in both North Korea and South Korea. Its symbol is \"₩\".","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323802"},{"id":"tat-5078655","romanian":"Acela a fost locul unde cele două armate se vor bate din nou.","english":"That was where the two armies would fight again.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-204","romanian":"Fiecare experienta ne invata ceva important despre viata.","english":"Every experience teaches us something important about life.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-487314","romanian":"Ea va strânge vesela de pe masă.","english":"She will clear the table of the dishes.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6334961"},{"id":"tat-2536658","romanian":"Trecutul poate fi doar cunoscut, nu schimbat. Viitorul poate fi doar schimbat, nu cunoscut.","english":"The past can only be known, not changed. The future can only be changed, not known.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12001711","romanian":"Camera era în haos. Peste tot erau împrăștiate hârtii, scaunele răsturnate, iar fereastra s-a spart.","english":"The room was in chaos. Papers were strewn everywhere, chairs were overturned, and the window was shattered.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1291046","romanian":"Dansatoarele par fragile în rochiile lor albe, dar în realitate sunt foarte puternice.","english":"The dancers look delicate in their white dresses, but they are really as strong as horses.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2040372","romanian":"Inginerii au aruncat podul în aer pentru că era gata să se prăbușească.","english":"The engineers blew up the bridge because it was about to collapse.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-1143217","romanian":"Acum am nevoie de o asistentă medicală.","english":"I need a nurse now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070009"},{"id":"tat-6068363","romanian":"Acești arbori cotiți sunt echilibrați cu precizie pentru motoarele cu turație ridicată și lină.","english":"These crank shafts are precision balanced for smooth high revving engines.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8762560","romanian":"Când vecinii ei au fost bolnavi, ea a rugat un medic să le dea niște medicamente.","english":"When her neighbours were ill, she asked a doctor to give them some medicine.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-povestea-porcului-2","title":"Povestea porcului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"– Ştiu, măi babă, dacă mi-i spune."},{"id":"story-ro-z-na-z-nelor","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":";A fost odată un împărat mare şi puternic, şi el avea trei feciori. Făcându-se mari, împăratul se gândi fel şi chipuri cum să facă să-şi însoare copiii ca să fie fericiţi. Într-o noapte, nu ştiu ce visă împăratul, că a doua zi, de mânecate, îşi chemă copiii şi se urcă cu dânşii în pălimarul unui turn ce avea în grădină."},{"id":"story-ro-f-t-frumos-cel-r-t-cit-2","title":"Făt-Frumos cel rătăcit","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":204,"excerpt":"Ea priimi mărul cu bucurie. Şi după ce plecă bărbatul în trebile sale, se aşeză pe pragul uşei, curăţi mărul şi-l mâncă. Iepşoara ieşise şi ea din grajd, şi veni la stăpână-sa, că era învăţată la traista cu grăunţe."},{"id":"story-ro-moara-cu-noroc-2","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"Iacă liniștea colibei. — Nu zic, grăi soacra așezată."},{"id":"story-ro-uer","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"La răspântia căilor singuratice, unde călătorul e minune şi glasul omului poveste, o colibă, dusă pe jumătate în pământ, stă locului neclintită. Poveşti de Barbu Ştefănescu Delavrancea - Şuer Stăpânul lumii e vântul, şi aruncă, ca în bătătură la el, clăi de nori posomorâţi peste întinsul cerului."},{"id":"story-ro-g-in-reasa","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"A fost odată un împărat şi o împărăteasă. În căsătoria lor ei au trăit ca fraţii, şi numai o fată au fost făcut. Ca şi mumă-sa, această fată, din naştere, era cu o stea în frunte."},{"id":"story-ro-broasca-estoas-cea-fermecat-3","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":248,"excerpt":"El era dus cu gândurile. Se uita şi nu mai vedea, tot da cu nuiaua în apă, şi nu ştia ce făcea. Nu mai simţea dacă este, ori nu mai este. Când, iată că o broască ţestoasă ieşise pe luciul apei, şi se uita galeş la dânsul."},{"id":"story-ro-bunicul","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":204,"excerpt":"Se scutură din salcâmi o ploaie de miresme. Poveşti de Barbu Ştefănescu Delavrancea - Bunicul Bunicul stă pe prispă. Se gândeşte. La ce se gândeşte? La nimic. Enumeră florile care cad. Se uită-n fundul grădinii. Se scarpină-n cap. Iar enumeră florile scuturate de adiere. Pletele lui albe şi creţe parcă sunt nişte ciorchini de flori albe; sprincenele, mustăţile, barba…"},{"id":"story-ro-z-na-zorilor-2","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Cu totul alta era Costan: mic la statură, îndesat la făptură, cu braţul de bărbat, cu pumnul îndesat. Al treilea şi cel mai tânăr fecior al împăratului e Petru: înalt, dar subţire, mai mult fată decât fecior. Petru nu face multă vorbă: el râde şi cântă, cântă şi râde de dimineaţă până în seară."},{"id":"story-ro-hagi-tudose","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":229,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Hagi-Tudose Dincolo de „Crucea de piatră”, de-a stânga Şoselei Vitanului, se ridică biserica „Sfânta Troiţa”. Mândreţe de biserică. Ce zugrăveli, pe dinăuntru şi pe dinafară, cum arar se mai pomenesc numai la bisericile din vechime."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
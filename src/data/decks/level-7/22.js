@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-6826720","romanian":"Spre deosebire de sora lui, el și-a păstrat credința religioasă insuflată de părinții lui.","english":"Unlike his sister, he has retained the religious faith his parents brought him up in.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10242320","romanian":"Arătau și aveau gust de creveți, dar vă pot asigura că aceia nu erau creveți adevărați.","english":"They looked and tasted like shrimps, but I can assure you those were not real shrimps.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-210","romanian":"Istoria ne invata ca nimic nu este permanent.","english":"History teaches us that nothing is permanent.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-5165096","romanian":"Când vaca zboară la înălțime și boul zboară aproape de sol, probabil că este o tornadă.","english":"When the cow flies high and the ox flies low, there probably is a twister.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12040285","romanian":"Există unele avioane, numite planoare, care nu au deloc motoare, dar zboară foarte bine.","english":"There are some aircraft, called gliders, that have no engines at all, but fly just fine.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13621515","romanian":"A doua zi dimineață, am regretat profund că am stat trează atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7192998","romanian":"Moartea prematură a soției mele, a tras cortina peste 50 de ani de mariaj fericit.","english":"The untimely death of my wife has brought down the curtain on over 50 years of happily married life.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7115226","romanian":"Când un înțelept se va ridica din nou, el cu siguranță îmi va urma spusele.","english":"When a Sage shall again arise, he will certainly follow my words.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568530","romanian":"Pentru el, foamea era un concept abstract; el a avut întotdeauna suficientă mâncare.","english":"To him, hunger was an abstract concept; he always had enough to eat.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138114","romanian":"Nu trebuie să citești o asemenea revistă pentru că îți va face rău.","english":"You must not read such a magazine, as it will do you harm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8762418","romanian":"Valurile mă aruncau fără milă dintr-o parte într-alta, în timp ce mă zbăteam să-mi țin răsuflarea.","english":"The waves were tossing me viciously to and fro as I struggled to hold my breath.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9028817","romanian":"Se pare că pastilele pe care le-am luat mai devreme au fost eficiente.","english":"It seems that the pills I took earlier were effective.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12151855","romanian":"Mi-am pierdut portofelul cu niște bani, buletinul de identitate și cardul de student.","english":"I lost my wallet with some money, my ID, and my student card.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4303252","romanian":"Noi priveam pasărea mâncând firimiturile; apoi am strănutat, și ea a dispărut într-o clipă.","english":"We were watching the bird eat the crumbs; then I sneezed, and he was gone in a flash.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"},{"id":"tat-863666","romanian":"Unde crezi că se duc toți banii?","english":"Where do you think all the money goes?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9145912"},{"id":"tat-5358834","romanian":"Tom a gestionat un bar mic de pe lângă Boston pentru o bună perioadă de timp.","english":"Tom managed a small bar near Boston for quite a long time.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1186831","romanian":"Mi-e teamă de ce va spune profesorul.","english":"I am afraid of what the teacher will say.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7295047"},{"id":"tat-11270397","romanian":"Mi se pare că am uitat că să închid lumina.","english":"I think that I forgot to turn off the lights.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-205","romanian":"Daca as fi stiut, as fi luat o decizie diferita.","english":"If I had known, I would have made a different decision.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-aleodor-mp-rat-2","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":226,"excerpt":"Un lucru numai am să-ţi spui: Vezi tu muntele acela de colo, să nu te ducă păcatele să vânezi p-acolo, că este nevoie de cap. Acel munte este moşia lui Jumătate-de-om-călare-pe-jumătate-de-iepure-şchiop: şi cine calcă pe moşia lui, nu scapă nepedepsit. Acestea zicând, căscă gura de trei ori şi-şi dete sufletul."},{"id":"story-ro-p-cal-n-satul-lui-2","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"– Măi! ziceau vecinele lui Păcală, ce lucru să mai fie şi ăsta? viţeaua asta le întrece pe toate! Ce-i va fi dând oare să mănânce? Ce soi o fi de creşte aşa de frumos?"},{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-popa-tanda","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":229,"excerpt":"Ierte-l Dumnezeu pe dascălul Pintilie! Era cântăreț vestit. Și murăturile foarte mult îi plăceau. Mai ales dacă era cam răgușit, le bea cu gălbenuș de ou și i se dregea organul, încât răsunau ferestrele când cânta Mântuiește, Doamne, norodul tău! Era dascăl în Butucani, bun sat și mare, oameni cu stare și socoteală, pomeni și ospețe de bogat."},{"id":"story-ro-mo-ion-roat-i-unirea-3","title":"Moş Ion Roată şi Unirea","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Vorba ceea, cucoane: \"Ţăranul, când merge, tropăieşte, şi când vorbeşte, hodorogeşte\", să ierte cinstită faţă dumnevoastră. Eu socot că treaba asta se putea face şi fără de noi; că, dă, noi ştim a învârti sapa, coasa şi secera, dar dumnevoastră învârtiţi condeiul şi, când vreţi, ştiţi a face din alb negru şi din negru alb…"},{"id":"story-ro-c-lin-nebunul","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":210,"excerpt":"Era odat-un împărat ş-avea trei fete şi erau aşa de frumoase, de la soare te puteai uita, da la dânsele ba. Acu, cele două erau cum erau, da cea mijlocie nici se mai povesteşte frumuseţea ei. Acu câţi feciori de-mpăraţi şi de ghinărari au cerut-o, împăratul n-a vrut să le-o deie."},{"id":"story-ro-broasca-estoas-cea-fermecat","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"A fost odată un împărat, şi el avea trei feciori. Când le-a venit şi lor vremea de însurătoare, le-a zis împăratul: Poveşti de Petre Ispirescu - Broasca ţestoasă cea fermecată – Dragii mei copii, v-aţi făcut mari; mergeţi de vă căutaţi ursitele, ca să intraţi şi voi în rândul oamenilor."},{"id":"story-ro-povestea-lui-stan-p-itul-2","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"Numai, dă! ce să facă bietul om? Cum era să se întindă mai mult, că de-abia acum se prinsese şi el cu mâinile de vatră; şi câte a tras până s-a văzut la casa lui, numai unul Dumnezeu ştie."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-3","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Boiul lor era mândru, amândoi aveau pe vino-ncoace, vorba lor, era vorbă cu lipici şi amândoi erau voinici, nevoie mare. Într-o zi se hotărâră să meargă la vânătoare. Împărăteasa se tot ciudea cum să-şi cunoască pe fiul său: fiindcă şi feţele şi îmbrăcăminţile fiind la fel, de multe ori nu putea să deosebească pe unul din altul."},{"id":"story-ro-poveste","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"O, poveşti, poveşti… lumea toată este o poveste, căci ce-a fost odată ca niciodată o fi fost ca şi astăzi, şi ce este astăzi va fi odată ca niciodată."},{"id":"story-ro-balaurul-cel-cu-apte-capete-2","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Cu aceşti voinici se întovărăşi şi un om verde, pui de român, ştii colea, care auzise de făgăduinţa împăratului şi venise să-şi încerce şi el norocul. Porniră, deci, cu toţii, îşi aleseră un loc aproape de groapă şi se puseră la pândă. Pândiră o zi, pândiră două, pândiră mai multe zile, şi nu se întâmplă nimic."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
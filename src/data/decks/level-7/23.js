@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-6825116","romanian":"Artistul a pictat cele mai complicate picturi murale pe peretele vechi, de piatră.","english":"The artist painted the most intricate of murals on the old stone wall.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7578033","romanian":"Mă doare gâtul și am și febră. Poți să-mi dai niște medicamente pentru răceală?","english":"My throat hurts, and I have a fever. Can I have some cold medicine?","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12946182","romanian":"Albinele sunt animale foarte utile pentru că produc miere, ceară și polenizează florile.","english":"Bees are very useful animals because they produce honey, wax, and pollinate flowers.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1193104","romanian":"Au eşuat amândoi în găsirea celei mai serioase probleme cu care s-a confruntat vreodată planeta noastră.","english":"They have both failed to find the most serious problem that has ever faced our planet.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1043821"},{"id":"tat-2536647","romanian":"Guvernul francez a lansat un joc online care provoacă contribuabilii să echilibreze bugetul național.","english":"The French government has launched an online game that challenges taxpayers to balance the national budget.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1153869","romanian":"Stai nemișcat pentru o clipă, te rog.","english":"Hold still for a moment, please.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12098378"},{"id":"tat-407952","romanian":"Imediat ce îi contactați pe prietenii dumneavoastră, spuneți-le că se apropie o avalanșă.","english":"As soon as you contact your friends, tell them that an avalanche is coming.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525177"},{"id":"tat-4994597","romanian":"Teroriștii au promis că eliberează ostaticul dacă președintele poate să stea într-un picior preț de un minut.","english":"The terrorists promised to release the hostage if the president is able to stand on one leg for a minute.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6794408","romanian":"Creierul uman este un lucru minunat. Funcționează până în momentul în care ții un discurs.","english":"The human brain is a wondrous thing. It works until the moment you stand up to make a speech.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13621234","romanian":"Khan menționează că Hunter este dispărut fără urmă (probabil pentru că nu s-a găsit niciun corp).","english":"Khan mentions that Hunter is M.I.A. (probably because no body was found).","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136590","romanian":"Prăbușindu-se pe jos, a izbucnit în lacrimi.","english":"On falling down, she burst into tears.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965952"},{"id":"tat-13619295","romanian":"Tom a trecut cuțitul peste piatra de ascuțit până când a devenit ascuțit ca briciul.","english":"Tom slid the knife across the whetstone until it was razor-sharp.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4993134","romanian":"Oficialii chinezi spun că creșterea economică a scăzut la minimul ultimilor trei ani din cauza economiei globale.","english":"Chinese officials say economic growth has dropped to a three-year low because of the world economy.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-7707602","romanian":"Ei nu mai aveau mere, așă că am cumpărat niște banane în schimb.","english":"They were all out of apples, so I bought some bananas instead.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13427370","romanian":"Am auzit că Tom și cu Mary se căsătoresc în octombrie.","english":"I heard that Tom and Mary will get married in October.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6637069","romanian":"Friptura a fost arsă din greșeală, dar cu toate acestea a avut un gust spectaculos.","english":"The steak was inadvertently burnt, but nonetheless it tasted spectacular.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-2837196","romanian":"Arată-mi faţa ta şi lasă-mă să-ţi aud glasul, căci glasul tău este dulce, iar faţa ta este încântătoare!","english":"Shew me thy face, let thy voice sound in my ears: for thy voice is sweet, and thy face comely.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-poveste-r-neasc","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":252,"excerpt":"A fost odată un împărat. El avea trei feciori. Când fu la ceasul morţii, îşi chemă feciorii şi le zise: Poveşti de Petre Ispirescu - Poveste ţărănească – Feţii mei, sunt cu sufletul la gură, precum mă vedeţi; un lucru numai vă cei: în cele trei nopţi după înmormântarea mea, să-mi păziţi mormântul, câte unul din voi."},{"id":"story-ro-fata-cu-pieze-rele","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":260,"excerpt":"A fost odată un împărat. El avea doisprezece feciori. Când se punea la masă, copiii stau împrejuru-i cunună deplină. El era totdauna cu voie-bună, fiindcă vedea că trebile îi merg strună. Poveşti de Petre Ispirescu - Fata cu pieze rele Împăraţii, vecinii lui, râvnea la traiul lui cel ticnit."},{"id":"story-ro-p-dureanca-3","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Ți-e scris, ți-e scris; nu ți-e scris, nu ți-e scris, și sănătate bună. Socoteala lui Busuioc era făcută: n-avea decât să pună caii la câteva căruțe, să plece la păduri ca să-și aducă oamenii, și apoi ar fi vrut el să știe care-i acela, un om din Curtici, care ar îndrăzni să facă gură."},{"id":"story-ro-scormon-2","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Îi mai place afară la uliță. Nu pentru că ar fi trecători, dar afară cântecul vine mai bine. E cald, dar deprinsă e fata la ger și la arșiță. Cu brațele goale, cu poalele aninate în brâu și cu ștergarul în cap, ea nici nu simte vremea lui cuptor; cântă, întinde firul, descurcă jirebia și se pierde în tinerețile ei."},{"id":"story-ro-sorcova-3","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":241,"excerpt":"II Zăpada îi pătrunsese în tindă; vântul îi cânta prin crăpăturile uşii parc-ar fi vuit în duba mare; şi Bălaşa era întinsă în pat, învelită c-o plapumă veche, soioasă şi ciuruită cu găuri prin care ieşeau gheomotoacele de lână neagră. Pe picioare îşi trântise două scovergi."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-2","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":214,"excerpt":"Încă fiind acolo, văzu cum înfloreşte pomul, cum îi cade florile şi cum roadele se arată iarăşi. Atunci îi mai veni inima la loc şi se mulţumi a aştepta până a doua zi. în ziua următoare, ia merele de unde nu e. S-a supărat împăratul, nevoie mare, şi porunci ca paznici să se uite să prinză pe hoţi. Dară aşi!"},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-2","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":232,"excerpt":"Se miră şi femeia lui, căci nici ea nu mai văzuse un astfel de ou. Nu ştiau cum să umble mai binişor cu dânsul, ca să nu-l scape jos să se spargă. Unul zicea ca să-l coacă în spuză şi să mănânce toţi dintr-însul; altul zicea ca să-l fiarbă; altul zicea ca să-l păstreze."},{"id":"story-ro-fata-cu-pieze-rele-3","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Bietul împărat! Şi acesta îi era copil. N-ar fi vrut, vezi, să piară nici unul. În cele din urmă se lăsă după povaţa filosofilor. Ei ziceau că mai bine este să piară unul şi să scape doisprezece, decât toţi să ajungă ca vai de ei şi de râsul lumii."},{"id":"story-ro-vasilie-finul-lui-dumnezeu","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste, cuvânt de poveste, în astă sară la noi soseşte pe un pai de secară, să te ţin de vorbă ‘n astă sară."},{"id":"story-ro-coto-man-n-zdr-vanu-2","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Când stăpâna casei făcea la ciorap, pisoiul se juca cu ghemul. Dară nu-l încurca, ferească Dumnezeu. Cum făcea el, cum dregea, se juca aşa de frumuşel, încât ghemul nici nu se desfăşura, nici nu se încurca."},{"id":"story-ro-broasca-estoas-cea-fermecat-2","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":230,"excerpt":"Luă şi dânsul nişte haine, numai să nu zică nescine că nu s-a gătit, şi de cheltuială ce pe apă nu curge, şi plecă şi el, ştii, cam în dorul lelii. Dară unde să se ducă? Nici el, iacă, nu ştia."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
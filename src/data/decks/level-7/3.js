@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-487040","romanian":"Noi am trăit în Osaka timp de zece ani înainte de a ne muta in Tokyo.","english":"We had lived in Osaka for ten years before we came to Tokyo.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435976"},{"id":"tat-1144322","romanian":"Am fost în Europa înainte de război.","english":"I went to Europe before the war.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073568"},{"id":"tat-2536493","romanian":"Hei, aș putea să nu am niciun ban, dar încă mai am mândrie.","english":"Hey, I may have no money, but I still have my pride.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10790200","romanian":"Tom are o cicatrice pe încheietura mâinii de când a încercat să se sinucidă.","english":"Tom has a scar on his wrist from when he tried to commit suicide.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143191","romanian":"Am știut tot timpul că spunea minciuni.","english":"I knew all along that he was telling a lie.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069296"},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6538121","romanian":"Deși nu mai este președinte, el continuă să aibă o influență considerabilă printre elita politică.","english":"Though he is no longer president, he still holds considerable sway among the political elite.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536438","romanian":"Acesta va fi un bun suvenir din călătoria mea în jurul Statelor Unite.","english":"This will be a good souvenir of my trip around the United States.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13615591","romanian":"Te poți uita în geanta ta? Mi-am pus mobilul acolo.","english":"Can you have a look in your bag? I put my mobile in there.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-220","romanian":"Responsabilitatea sociala a corporatiilor devine tot mai importanta.","english":"Corporate social responsibility is becoming increasingly important.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-223","romanian":"Diversitatea culturala contribuie la imbogatirea societatii noastre.","english":"Cultural diversity contributes to the enrichment of our society.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-2536130","romanian":"America e un loc drăguț în care să fii, dacă ești aici ca să câștigi bani.","english":"America is a lovely place to be, if you are here to earn money.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4961201","romanian":"Fii atent: în limba engleză scriem cu litere mari naționalitățile, zilele săptămânii și limbile străine.","english":"Be careful: We capitalize nationalities, days of the week, and languages in English.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13619375","romanian":"Tom a bolborosit o scuză înainte de a se grăbi să prindă autobuzul.","english":"Tom gabbled out an apology before rushing to catch the bus.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2034608","romanian":"Precum a demonstrat din abundenţă George Bush, a fi președintele Statelor Unite necesită doar o inteligență moderată.","english":"As George Bush has amply demonstrated, being president of the U.S. requires only a modicum of intelligence.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6918482","romanian":"Am fost prea ocupat să-l ajut pe Tom ca să o mai ajut și pe Mary.","english":"I was too busy helping Tom to help Mary.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9839369","romanian":"După ce și-a dat jos ochelarii și și-a desfăcut părul, Mary arăta ca o persoană complet diferită.","english":"After removing her glasses and untying her hair, Mary looked like a completely different person.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1064310","romanian":"L-am văzut pe Tom lovind-o pe Mary.","english":"I saw Tom hit Mary.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11045325"},{"id":"tat-208","romanian":"Trebuie sa gandim pe termen lung, nu doar pe moment.","english":"We must think long-term, not just for the moment.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-d-nil-prepeleac","title":"Dănilă Prepeleac","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Erau odată într-un sat doi fraţi, şi amândoi erau însuraţi. Cel mai mare era harnic, grijuliu şi chiabur, pentru că unde punea el mâna punea şi Dumnezeu mila, dar n-avea copii. Iară cel mai mic era sărac."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-3","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":226,"excerpt":"Le dete, deci, voie, şi ei se puseră pe lucru. Pândi în ziua dintâi fiul cel mare; dară păţi ruşinea ce păţise şi ceilalţi pândari din naintea lui. A doua zi pândi şi cel mijlociu; dară nici el nu fu mai breaz, ci se întoarse la tatăl său cu nasul în jos."},{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."},{"id":"story-scrisoarea-iii","title":"Scrisoarea III","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":145,"excerpt":"Unde-Loss'n ceruri senine Luceafarul rasare, Din negura de vremi acolo moartea a lasat urma, Acolo sufletul se-Loss'ntreaba: \"Ce-Loss'n veacul veacului nu moare?\" Si glasul vremii-Loss'n raspuns sopteste tainic: \"Numai urma.\" Pe cand lumea toata doarme-Loss'n noapte, Trecut-au ani si veacuri, si totusi noi vedem Pe bolta-Loss'nstelata aceleasi stele-Loss'napte Ce-au luminat si Mircea, si Stefan cel Batran."},{"id":"story-ro-z-na-z-nelor-3","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Mai se suci, mai se învârti să scape de pacoste, şi nu fu nici un chip. Dacă văzu şi văzu, se hotărî şi el a se duce acasă cu saxanaua în spinare şi o luă la drum. În cale, băgă de seamă că alte şase bufniţe se ţineau după dânsul."},{"id":"story-ro-greuceanu-2","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"Ei erau trişti, bieţii oameni, dară Greuceanu îi mângâie cu nişte vorbe aşa de dulci, încât le mai veni niţică inimă, că era şi meşter la cuvânt Greuceanu nostru. El îşi puse nădejdea în întâmplarea aceasta şi îşi zise:\"îmi voi încerca norocul."},{"id":"story-ro-amintiri-din-copil-rie-i","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":223,"excerpt":"Stau câteodată şi-mi aduc aminte ce vremi şi ce oameni mai erau în părţile noastre pe când începusem şi eu, drăgăliţă-Doamne, a mă ridica băieţaş la casa părinţilor mei, în satul Humuleşti, din târg drept peste apa Neamţului; sat mare şi vesel, împărţit în trei părţi, care se ţin tot de una: Vatra satului, Delenii şi Bejenii."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-3","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Mă iau şi eu după glas ş-o plec într-acolo. Când, ce să vezi? stufuleţul se făcea că era înconjurat de nişte iarbă verde, subţirică şi naltă de-mi venea până mai sus de genunchi: firicelul de iarbă şi floricica; astfel încât nu te îndurai să calci peste ele."},{"id":"story-ro-v-duvele","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"Oamenii, când n-au ce face, se-apucă de gâlceavă. Se dau la vorbă, şi destul e unul s-o apuce anapoda, că cearta e gata. Prostia pândeşte mintea omului cum pândesc lupii razna oilor."},{"id":"story-ro-porcul-cel-fermecat-3","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":215,"excerpt":"uşa se deschise. Fetele intrară. Când colo, ce să vază? Casa n-avea nici o podoabă; dară în mijloc era o masă o masă mare cu un covor scump pe dânsa, şi deasupra o carte mare deschisă. Fetele, nerăbdătoare, voiră a şti ce zicea în cartea aceea."},{"id":"story-ro-scormon","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":222,"excerpt":"Cât e de lung gardul, de la portiță până la cotitura uliței, Sanda l-a măsurat, nici ea singură nu știe de câte ori, cu firul în mână. Jos, lângă portiță, e vârtelnița cu jirebia de tort."}],"recipes":[{"id":"recipe-musaca","title":{"ro":"Musaca de vinete","en":"Eggplant Moussaka"},"description":{"ro":"Musacaua de vinete este o mancare populara de vara, facuta din straturi de vinete prajite si carne tocata.","en":"Eggplant moussaka is a popular summer dish made from layers of fried eggplant and minced meat."},"difficulty":5,"category":"main","ingredients":[{"ro":"vinete","en":"eggplants","amount":"1 kg"},{"ro":"carne tocata de porc si vita","en":"mixed ground meat","amount":"500 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"rosii","en":"tomatoes","amount":"400 g"},{"ro":"oua","en":"eggs","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"200 ml"},{"ro":"ulei","en":"oil","amount":"pentru prajit"},{"ro":"sare si piper","en":"salt and pepper","amount":"dupa gust"}],"steps":[{"ro":"Se taie vinetele felii si se prajesc in ulei.","en":"Cut eggplants into slices and fry in oil."},{"ro":"Se caleste ceapa si se adauga carnea tocata.","en":"Saute onion and add the ground meat."},{"ro":"Se adauga rosiile si se lasa sa fiarba 15 minute.","en":"Add tomatoes and simmer for 15 minutes."},{"ro":"Se aseaza straturile: vinete, carne, vinete, carne.","en":"Layer: eggplant, meat, eggplant, meat."},{"ro":"Se bate smantana cu ouale si se toarna deasupra.","en":"Beat sour cream with eggs and pour on top."},{"ro":"Se coace la cuptor 30-40 minute la 180 grade.","en":"Bake in oven for 30-40 minutes at 180 degrees."}]}]};
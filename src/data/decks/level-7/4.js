@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-13063081","romanian":"Puii au evoluat din alte păsări care au depus ouă, așa că oul a fost primul.","english":"Chickens evolved from other birds that laid eggs, so the egg came first.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136410","romanian":"Cheamă-mă dacă ai nevoie de ajutorul meu.","english":"Call on me if you need my assistance.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962814"},{"id":"tat-8760980","romanian":"Preotul a mers de câteva ori prin mijlocul enoriașilor, răspândind miros de tămâie din cădelniță.","english":"The priest walked among the parishioners several times, spreading the smell of incense from the censer.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-705785","romanian":"În zilele de azi nu este neobișnuit pentru o femeie sa călătorească singură.","english":"Nowadays it is not unusual for a woman to travel alone.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963109"},{"id":"tat-706007","romanian":"Ascultându-l pe Mahler, Lyusya se gândea mereu la moarte şi la viaţa eternă.","english":"Listening to Mahler, Lyusya would always think of death and life eternal.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968825"},{"id":"tat-6828262","romanian":"O persoană nu este niciodată prea bătrână pentru a se dezvăța de obiceiurile proaste.","english":"One is never too old to unlearn bad habits.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9028832","romanian":"Tom provenea dintr-un mediu umil, dar a devenit unul dintre cei mai bogați oameni din țară.","english":"Tom was from a humble background, but he became one of the richest men in the country.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1138032","romanian":"Ar fi fost mai bine să nu te fi dus acolo.","english":"You had better not have gone there.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1136687","romanian":"Mai întâi cred că primul lucru pe care îl observă un străin ajuns în China este cu siguranță mărimea țării.","english":"Firstly, I think that the first time each foreigner is in China, the earliest impression is certainly the size of the country.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239573"},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143184","romanian":"Am făcut o scurtă pauză pe drum.","english":"We took a short rest on the way.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069260"},{"id":"tat-7361805","romanian":"Casa noastră actuală este prea mică, așa că ne-am decis să ne mutăm.","english":"Our current house is too small, so we decided to move.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4184076","romanian":"Latina este una dintre puținele limbi care necesită o bună cunoaștere a gramaticii.","english":"Latin is one of the few languages that requires a good knowledge of grammar.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568484","romanian":"Locuiesc aproape de mare, așa că am de multe ori ocazia să merg la plajă.","english":"I live near the sea, so I often get to go to the beach.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13612966","romanian":"Am crezut că vrei să mănânci la acel restaurant chinezesc de pe Park Street.","english":"I thought you wanted to eat at that Chinese restaurant on Park Street.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2568442","romanian":"E nevoie de înțelepciune pentru a înțelege înțelepciunea: muzica nu înseamnă nimic dacă publicul e surd.","english":"It requires wisdom to understand wisdom: the music is nothing if the audience is deaf.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-232","romanian":"Intrebarea fundamentala nu este ce stim, ci cum aplicam ceea ce stim.","english":"The fundamental question is not what we know, but how we apply what we know.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-4993240","romanian":"Experții spun că prețul cafelei crește în primul rând pentru că oamenii sunt dispuși să plătească mai mult.","english":"Experts say coffee prices are rising mainly because people are willing to pay more.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1136854","romanian":"Aș face altfel decât ai făcut tu.","english":"I would do it in a different way than you did.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966286"},{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-3","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"Când luă ştergarul să se şteargă pe ochi, ce să vază? Trei picături de sânge pe dânsul. El îşi zise:\"Trebuie să mă întorc acasă, căci Dumnezeu ştie ce va fi păţit baba mea.\" Întinse unchiaşul la drum. Nu mai căuta nici de mâncare, nici de odihnă, şi se întoarse acasă cum plecase. – Ce ţi s-a întâmplat, babo?"},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-2","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":214,"excerpt":"Făt-Voinic, feciorul de împărat. Focul cailor se stâmpără în zărirea celor trei surori şi călăreţii deteră în pas mai încetişor, până ce, veniţi şi sosiţi, se simţiră duşi."},{"id":"story-ro-copiii-v-duvului-i-iepurele-vulpea-lupul-i-ursul-3","title":"Copiii văduvului şi iepurele vulpea lupul şi ursul","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"Ar putea să mănânce şi ei ceea ce ne-a rămas. – Iată-ne aci şi noi, iată-ne aci. Şi ieşiră de după coşul bordeiului şi mâncară. După ce se sculă tatăl copiilor, vitrega întrebă pe copii cum a nemerit de s-au întors."},{"id":"story-ro-z-na-zorilor-3","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"De când a întrebat Petru de treaba ochilor, se părea cum că ochiul cel din stânga plânge mai puţin, iară cel de-a dreapta râde mai mult. Petru îşi întări inima şi mai merse o dată la împăratul. O palma e o palma şi două-s două! Gândi şi făcu. O păţi din nou, cum a mai păţit-o."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."},{"id":"story-ro-sarea-n-bucate-3","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":235,"excerpt":"Să te duci de la mine cu sarea ta cu tot! Când auzi fata cea mică a împăratului urgia tatălui său, ce cădea pe capul ei, intră în fundul pământului de mâhnire căci se supărase tată-său şi, încumetându-se, zise: – Să mă ierţi, tată, că eu n-am vrut să te supăr."},{"id":"story-ro-flori-a-din-codru-2","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":238,"excerpt":"Cine ştie? vreun împărat ce domneşte în ascuns prin adâncul codrilor… Crâşmarul s-a lăsat de lemne, a luat fata în braţe, a dus-o acasă… şi de aici înainte a fost fata de suflet a lui şi a crâşmăriţei. Aşa a crescut apoi fata la crâşmă."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-2","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":221,"excerpt":"Pentru aceasta ele ca să arate că nu le pasă de nebăgarea lui de seamă, între ele, îl porocleau cu numele de Făt-Frumos al satului. Şi de unde să nu fie aşa!"},{"id":"story-ro-porcul-cel-fermecat-2","title":"Porcul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"Aşa făcură şi le mergea bine. Vicleanul pizmuia pacea fetelor şi-şi vârî coada. – Surioarele mele, zise fata cea mare, câtu-i ziulica de mare toarcem, coasem, citim. Sunt câteva zile de când ne aflăm singure, n-a mai rămas nici un colţ de grădină pe unde să nu ne fi plimbat."},{"id":"story-ro-george-cel-viteaz-2","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":208,"excerpt":"Balaurul, văzând una ca aceasta, se repezi şi el asupra împărătesei. Dar împărăteasa dete un ţipet şi se deşteptă. Îi sărise inima de frică şi-i tremurau toate cărnurile. P-aci, p-aci era să şi leşine. Spuse împăratului pocitania de vis, şi rămase şi el înmărmurit de groază."},{"id":"story-ro-sorcova","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sorcova Troienele se ridicau namilă până în tinda creştinului. Vântul spulbera fulgii de zăpadă în vârteje şi stoluri, repezite în lungul uliţelor, sparte la răspântii şi împrăştiate fără căpătâi în largul maidanelor de la Olănita. Pârtia nu se mai cunoştea. Zăpada îţi trecea de glezne şi mai bine."}],"recipes":[{"id":"recipe-salata-boeuf","title":{"ro":"Salata de boeuf","en":"Romanian Beef Salad"},"description":{"ro":"Salata de boeuf este nelipsita de pe masa de sarbatori.","en":"Beef salad is a must-have at holiday celebrations."},"difficulty":5,"category":"appetizer","ingredients":[{"ro":"carne de vita","en":"beef","amount":"500 g"},{"ro":"piept de pui","en":"chicken breast","amount":"300 g"},{"ro":"cartofi","en":"potatoes","amount":"500 g"},{"ro":"morcovi","en":"carrots","amount":"300 g"},{"ro":"mazare","en":"peas","amount":"200 g"},{"ro":"castraveti murati","en":"pickled cucumbers","amount":"200 g"},{"ro":"maioneza","en":"mayonnaise","amount":"400 g"},{"ro":"mustar","en":"mustard","amount":"2 linguri"}],"steps":[{"ro":"Se fierb carnea, cartofii si morcovii separat.","en":"Boil meat, potatoes and carrots separately."},{"ro":"Se taie totul cubulete mici.","en":"Cut everything into small cubes."},{"ro":"Se adauga mazarea si castravetii taiati.","en":"Add peas and chopped pickles."},{"ro":"Se amesteca maioneza cu mustarul.","en":"Mix mayonnaise with mustard."},{"ro":"Se combina toate ingredientele.","en":"Combine all ingredients."},{"ro":"Se decoreaza si se serveste rece.","en":"Decorate and serve cold."}]}]};
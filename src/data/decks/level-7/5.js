@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-709001","romanian":"Când călătoreşti, este uşor să te rătăceşti.","english":"When traveling, it is easy to get lost.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420261"},{"id":"tat-1143223","romanian":"N-am zis nimic, ceea ce a mâniat-o.","english":"I said nothing, which made her angry.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12049631"},{"id":"tat-705789","romanian":"Am cerut să li se permită sa plece.","english":"I demanded that they be allowed to leave.","difficulty":7,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963119"},{"id":"tat-1136770","romanian":"Ziua a fost furtunoasă și ceea ce a fost încă și mai rău a fost că fulgera.","english":"The day was stormy, and what was worse still, it was thundering.","difficulty":7,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966198"},{"id":"tat-9408703","romanian":"Tom a spus că a crezut că i se va permite lui Mary să facă asta.","english":"Tom said he thought that Mary might be allowed to do that.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-487323","romanian":"Ea a încremenit în picioare ca și cum ar fi văzut o fantomă.","english":"She stood transfixed as if she had seen a ghost.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336252"},{"id":"tat-231","romanian":"Arta are capacitatea unica de a transcende barierele culturale si lingvistice.","english":"Art has the unique ability to transcend cultural and linguistic barriers.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6981787","romanian":"El putea să vadă că regele lui va primi șah-mat în cinci mutări.","english":"He could see that his king would be checkmated within five moves.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11658423","romanian":"Majoritatea zmeurii sunt roșii, dar există și zmeură albă, galbenă și chiar violetă.","english":"Most raspberries are red, but there are also white, yellow, and even purple raspberries.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153812","romanian":"O republică este o națiune al cărei conducător nu este un rege sau o regină, ci un președinte.","english":"A republic is a nation whose head is not a king or queen, but a president.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129049"},{"id":"tat-9263288","romanian":"Tom mi-a spus că ar fi ușor să o conving pe Mary să doneze niște bani.","english":"Tom told me it would be easy to persuade Mary to donate some money.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5154335","romanian":"Mi-a plăcut plăcere să te cunosc și aștept cu nerăbdare vești de la tine.","english":"It was nice to meet you, and I look forward to hearing from you.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-862376","romanian":"Din cauză că lumina călătoreşte mai repede decât sunetul, unii oameni par geniali înainte de a suna stupizi.","english":"It is because light travels faster than sound that some people look brilliant before sounding stupid.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9457136"},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163897","romanian":"Ce amabil din partea lui să ne ajute să ne mutăm într-o zi atât de ploioasă!","english":"How kind of him to help us move on such a rainy day!","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196806"},{"id":"tat-2536598","romanian":"Știi fraza „recoltăm ce semănăm”. Am semănat vânt și aceasta e furtuna mea.","english":"You know the phrase, we reap what we sow. I have sown the wind and this is my storm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10744389","romanian":"Am vrut să mă duc acasă și să iau cina cu soția mea.","english":"I wanted to go home and eat dinner with my wife.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5233189","romanian":"Ai vreo idee la ce oră va ajunge Tom acasă?","english":"Do you have any idea what time Tom will come home?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1192724","romanian":"L-am făcut să vopsească poarta săptămâna trecută.","english":"I had him paint the gate last week.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7221821"},{"id":"tat-6871781","romanian":"Acea persoană m-a întrebat cine sunt, dar nu am considerat necesar să îi răspund.","english":"That person asked me who I was, but I did not deem it necessary to answer him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-povestea-lui-stan-p-itul-3","title":"Povestea lui Stan-Păţitul","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"Ce-a mai fi şi asta? Alţii, că să te ferească Dumnezeu de femeia leneşă, mârşavă şi risipitoare; alţii alte năstruşnicii, încât nu ştii ce să crezi şi ce să nu crezi? Numai nu-i vorbă că am văzut eu şi destui bărbaţi mult mai ticăiţi şi mai chitcăiţi decât cea mai bicisnică femeie."},{"id":"story-ro-amintiri-din-copil-rie-i-3","title":"Amintiri din copilărie I","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":210,"excerpt":"Şi a pus părintele pravilă şi a zis că în toată sâmbăta să se procitească băieţii şi fetele, adică să asculte dascălul pe fiecare de tot ce-a învăţat peste săptămână; şi câte greşeli va face să i le însemne cu cărbune pe ceva, iar la urma urmelor, de fiecare greşeală să-i ardă şcolarului câte un sfânt-Nicolai."},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut-2","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":216,"excerpt":"– Să ne despărţim unchiaş, dacă tu aşa găseşti de cuviinţă. Dară bine, cine să ne închiză ochii în ceasul cel de pe urmă? – Că bine zici tu, babo; stăi dară; ia să iei tu basmaua mea care am avut-o în ziua de cununie şi eu ştergarul cel vărgăţel ce mi-ai adus de zestre."},{"id":"story-ro-frumoasa-lumii-2","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":211,"excerpt":"Alungând-o el prin copac, ea se vârâ-ntr-o bortă… ş-o prinde. El n-a mai stătut către noapte, că s-a temut de draci, ci a luat pasărea ş-a venit acasă ş-a făcut o cuşcă bună ş-a pus pasărea-n cuşcă. Acu el în ziua ceea, era sâmbătă, care-o prins-o, şi duminică dimineaţa s-a ouat un ou. Oul era de aur."},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte-2","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":203,"excerpt":"Trase undiţa: când, ce să vezi? un peşte mare, cu totul şi cu totul din aur. Doară că nu-i căzu leşin de bucurie. Darămite când îl văzu împărăteasa? Ea fu şi mai oleoleo. Găti împărăteasa singură cu mâna ei peştele şi mâncară. Ea îndată se simţi însărcinată."},{"id":"story-ro-cele-trei-rodii-aurite-2","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":217,"excerpt":"Un an de zile trecuse de când călătorea; ajunsese prin pustietăţi nelocuite de oameni, şi tot rătăcind în sus şi în jos, două rânduri de haine se rupseră şi le lepădase. Neştiind ce să facă, hotărî a mai merge câtva, şi dacă nu va putea descoperi nimic, să se întoarcă."},{"id":"story-ro-fata-mo-ului-2","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":238,"excerpt":"– Puricele. – Eh! grăi moş Doroftei cam supărat, am să v-astup cloanţa la toate. Ghiciţi acuma, de vă taie capul, de nu, să-l tăiaţi voi pe el: Din pulpă născută, pe claie aruncată, de vultur răpită, de babă robită, la domnie-ajunsă, de ţigancă tunsă: călugăraş mă făcui. Ce să fie? Ce să fie?"},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-3","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":229,"excerpt":"De ce creştea copilul, d-aceea se făcea mai isteţ şi mai îndrăzneţ. Îl deteră pe la şcoli şi filosofi, şi toate învăţăturile pe care alţi copii le învăţa într-un an, el le învăţa într-o lună, astfel încât împăratul murea şi învia de bucurie. Toată împărăţia se fălea că o să aibă un împărat înţelept şi procopsit ca Solomon împărat."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-2","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":232,"excerpt":"Se spetise bietul om muncind, şi să salte şi el ceva, te-aşi! câtuşi de cât! ferit-a sântul! Ba până într-atâta ajunsese, încât să-l împingă păcatele să se gândească ca să-şi facă seama singur, vezi că dracul n-are de lucru, el nu face biserici ori puţuri pe la răspântii."},{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-9952605","romanian":"Tom a spus că este dispus să ne împrumute trei mii de dolari.","english":"Tom said he was willing to lend us three thousand dollars.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536451","romanian":"Ar fi distractiv să vezi cum se schimbă lucrurile de-a lungul anilor.","english":"It would be fun to see how things change over the years.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-11475333","romanian":"Ai putea avea te rog grijă de câinele meu mâine?","english":"Would you please look after my dog tomorrow?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12517381","romanian":"Igor a descoperit o urmă de bocanc în niște noroi moale, nu departe de cortul său.","english":"Igor discovered a bootprint in some soft dirt not far from his tent.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7166713","romanian":"Am fost uimit de îndrăzneala elevului, de a-i pune lectorului o astfel de întrebare personală.","english":"I was amazed at the audacity of the student to ask the lecturer such a personal question.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1288426","romanian":"Câțiva dintre noi din Westmont de asemenea mergem la Ensanada în acest sfârșit de săptămână!","english":"A group of us from Westmont is going to Ensanada this weekend as well!","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1144305","romanian":"Japonia se compune din patru insule principale.","english":"Japan consists of four main islands.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073340"},{"id":"tat-11597600","romanian":"Cleopatra se afla la Roma în ziua în care Iulius Cezar a fost asasinat.","english":"Cleopatra was in Rome the day Julius Caesar was assassinated.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10452185","romanian":"Într-o cafenea din Jakarta, Indonezia, proprietarii doresc să promoveze comunicația, înțelegerea și toleranța angajând oameni fără auz.","english":"At a coffee shop in Jakarta, Indonesia, the owners want to promote communication, understanding and tolerance by employing people who can’t hear.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2568508","romanian":"Formarea și mișcarea uraganelor sunt capricioase, chiar și cu tehnologia noastră de astăzi.","english":"The formation and movement of hurricanes are capricious, even with our present-day technology.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136656","romanian":"Cina va fi servită la bordul avionului.","english":"Dinner will be served on board the plane.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966176"},{"id":"tat-6709926","romanian":"Tom, un milionar care a făcut avere prin propriile forțe, a trăit într-o sărăcie abjectă când era copil.","english":"Tom, a self-made millionaire, had lived in abject poverty as a child.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-709899","romanian":"Am uitat să opresc televizorul înainte de a ma duce la culcare.","english":"I forgot to turn off the TV before going to bed.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426691"},{"id":"tat-1136559","romanian":"Te poți duce oriunde ai chef.","english":"You can go wherever you want to go.","difficulty":5,"wordCount":6,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11963267"},{"id":"tat-228","romanian":"Paradoxal, cu cat stim mai mult, cu atat devenim mai constienti de ignoranta noastra.","english":"Paradoxically, the more we know, the more aware we become of our ignorance.","difficulty":9,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6701448","romanian":"Cel mai mare cusur al rasei umane este incapacitatea noastră de a înțelege funcția exponențială.","english":"The greatest shortcoming of the human race is our inability to understand the exponential function.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-213","romanian":"In ciuda dificultatilor, echipa a reusit sa termine proiectul la timp.","english":"Despite the difficulties, the team managed to finish the project on time.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-poveste-2","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":232,"excerpt":"Iar împărăteasa avea haz, căci începea şi ea, adunându-şi lacrimile în pumni, şi-l certa că prea plânge ca o muiere de fiece şi orişicând. Şi începeau: – Ba iar ai plâns. – Ba n-am plâns. – Ba te-am văzut eu. – Şi eu te-am văzut pe tine. – Ba eu am râs. – Şi eu am râs."},{"id":"story-ro-ivan-turbinc","title":"Ivan Turbincă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"Era odată un rus, pe care îl chema Ivan. Şi rusul acela din copilărie se trezise în oaste. Şi slujind el câteva soroace de-a rândul, acuma era bătrân. Şi mai-marii lui, văzându-l că şi-a făcut datoria de ostaş, l-au slobozit din oaste, cu arme cu tot, să se ducă unde-a vrea, dându-i şi două carboave de cheltuială."},{"id":"story-ro-balaurul-cel-cu-apte-capete","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":275,"excerpt":"A fost odată într-o ţară un balaur mare, nevoie de cap. El avea şapte capete, trăia într-o groapă, şi se hrănea numai cu oameni. Când ieşea el la mâncare, toată lumea fugea, se închidea în case şi sta ascunsă până ce-şi potolea foamea cu vreun drumeţ pe care îl trăgea aţa la moarte."},{"id":"story-ro-sarea-n-bucate","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":205,"excerpt":"A fost odată un împărat. Acest împărat avea trei fete. Rămânând văduv, toată dragostea lui el şi-o aruncase asupra fetelor."},{"id":"story-ro-c-lin-nebunul-2","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"A aruncat şi cel mijlociu şi tot aşa degrabă a ajuns. Da când a aruncat Călin Nebunul, a mers trei luni de zile, zi şi noapte, şi de-abia a ajuns. Acu ei, mergând pe drum, au gătit şi cremenea şi amnarul. De-abia au avut cu ce aţâţa oleacă de foc."},{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-3","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":218,"excerpt":"Într-una din zile, moşneagul, fiind foarte amărât de câte-i spunea baba, chemă fata şi-i zise: – Draga tatei, iaca ce-mi tot spune mă-ta de tine: că n-o asculţi, că eşti rea de gură şi înnărăvită şi că nu este de chip să mai stai la casa mea; de-aceea du-te şi tu încotro te-a îndrepta Dumnezeu, ca să nu se mai facă atâta gâlceavă la casa asta, din pricina ta."},{"id":"story-ro-c-lin-nebunul-3","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":209,"excerpt":"– Hai! Şi l-a omorât şi pe acesta ş-a făcut patru căpiţi de carne din capetele lui. Acu, când s-au trezit ei, o-nceput să-i deie de grijă lui Călin Nebunul că să păzească bine focul. Acu el a treia noapte era să fie. Acu iar pe la miezul nopţii s-auzi un huiet mare. Un zmeu era – cu opt capete."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-2","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":206,"excerpt":"La urmă, românul, mulţumit, vroi să dea câteva bucăţi de carne pravoslavnicului. Bătrânul îşi făcu cruce, se cutremură şi cu nici un preţ nu voi să primească, zicând c-un glas de mucenic: – Lasă, lasă, omul lui Dumnezeu, că pentru Dumnezeu am muncit. Ei, dar cine-mi fusese omul cu crucile!"},{"id":"story-ro-george-cel-viteaz","title":"George cel viteaz","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":220,"excerpt":"A fost odată un împărat şi o împărăteasă. Zece ani au vieţuit ei în căsătorie şi nu putură face şi ei măcar o stârpitură de copil."},{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
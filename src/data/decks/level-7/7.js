@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-2704846","romanian":"De dimineață până seară el nu face nimic altceva decât să se plângă.","english":"He does nothing but complain from morning till night.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5233192","romanian":"Crezi că Tom ar considera să se întâlnească cu sora mea mai tânără?","english":"Do you think Tom would consider dating my younger sister?","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136387","romanian":"Fără gravitație, am fi aruncați în spațiu.","english":"Without gravity we would be hurled off into space.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11962828"},{"id":"tat-1136518","romanian":"Încet și fără grabă se câștigă cursa.","english":"Slow and steady wins the race.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965773"},{"id":"tat-11639745","romanian":"Cum poate fi numită această Putere care a creat viața, timpul și atâtea trilioane de stele?","english":"What can be called this Power that created life, time and so many trillions of stars?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12047690","romanian":"Dacă lumea ar ști de ce oameni mici este condusă, s-ar răzvrăti imediat.","english":"If the people knew by what small men they are ruled, they would soon rebel.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5252491","romanian":"Tom și Mary au fost de acord să plece de la petrecere înainte de miezul nopții.","english":"Tom and Mary agreed to leave the party before midnight.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5205062","romanian":"Te gândești serios să urmezi o carieră ca pilot de mașini de curse?","english":"Are you seriously thinking about pursuing a career as a race car driver?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-233","romanian":"Progresul autentic presupune nu doar inovatie tehnica, ci si dezvoltare morala.","english":"Authentic progress requires not just technical innovation, but also moral development.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-5226154","romanian":"Tom și-a abandonat mașina, care a rămas fără benzină, și a început să meargă pe jos.","english":"Tom abandoned his car that had run out of gasoline and started walking.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5226266","romanian":"Tom s-a comportat ca și cum ar fi fost fericit, dar în interior era supărat.","english":"Tom acted happy, but deep inside he was sad.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1163903","romanian":"Descărcarea Metodei de Introducere cu Tastă Unică pentru Limba Vietnameză va începe în curând.","english":"Your Unikey Vietnamese Input Method download will start shortly.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196981"},{"id":"tat-1059483","romanian":"A venit să ne roage să-l ajutăm.","english":"He came to ask us to help him.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10265378"},{"id":"tat-13616959","romanian":"Tu poți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6538116","romanian":"Chiar aș vrea să te ajut, dar am mâinile legate.","english":"I would really like to help you, but my hands are tied.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-7187127","romanian":"O galaxie este un grup de stele, praf și gaze și este susținută de către gravitație.","english":"A galaxy is a cluster of stars, dust, and gas which is held together by gravity.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2568478","romanian":"Am dormit un pic în timpul pauzei de prânz pentru că eram foarte obosit.","english":"I slept a little during lunch break because I was so tired.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6635545","romanian":"În ciuda faptului că, în medie, femeile sunt mai inteligente decât bărbații, majoritatea geniilor sunt bărbați.","english":"Notwithstanding the fact that on average women are more intelligent than men, most geniuses are men.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5345650","romanian":"Merg prin cartierul chinezesc și admir simbolurile frumoase pe care tot nu le înțeleg încă.","english":"I go through Chinatown and admire the beautiful signs that I still do not understand.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-o-via-pierdut-3","title":"O viață pierdută","author":"Ioan Slavici","difficulty":5,"genre":"fiction","wordCount":209,"excerpt":"Cârlanul se opri, nechezând printre dinți, la ușa grajdului. - Stăi, prietene! grăi bătrânul mergând cu hamurile în urma lui. Toate se fac cu vremea. În grajd mai era un cal, loc pentru alți doi și un flăcău, care se trezi din somn când intră bătrânul. - Bună seara, Costane! grăi el trăgănând vorbele. Ai avut noroc la ziuă?"},{"id":"story-ro-cei-trei-fra-i-mp-ra-i","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un biet om sărac. El avea femeie şi trei copilaşi. Lucra bietul om de da pe brânci, zi şi noapte, orice şi pe unde găsea, şi două în tei nu putea lega şi el. Bieţii copilaşi erau mai mult flămânzi decât sătui."},{"id":"story-ro-ileana-simziana-3","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"– Oricum, tată, spune-ne şi nouă, că doară nu s-o face gaură în cer, dacă vom şti şi noi ce lucru te amăraşte. Dacă văzu împăratul că-l înteţesc fetele cu rugăciunile, zise: – Iată, copilele mele de ce sunt tot trist."},{"id":"story-ro-fata-mo-ului-3","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":257,"excerpt":"Iacă, e un basm cu ghicitoare vorba mea şi, de vreţi, am să vi-l spun, dacă mi-o face poala căpătâi o fată frumoasă. – Mai e vorbă? Vrem, vrem! – Uite, vin’ la mine. – Ba la mine! – Ba la mine, că-ţi caut în cap!"},{"id":"story-ro-rodul-tainic","title":"Rodul tainic","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"A fost odată un împărat, şi-n curtea acelui împărat se afla un pom atât de înalt, încât nimeni nu era în stare să-i vadă vârful. Pomul acesta înflorea şi dădea rod în fiecare an, dar nici împăratul, nici curtenii lui, nici vreun alt om pământean n-a apucat să vadă poamă din rodul acela."},{"id":"story-ro-comoara-3","title":"Comoara","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"- Dar Ghiță ce face? Întrebă iar Duțu, zâmbind pe sub mustață. - E bine și el! răspunse Ana, care nu înțelegea nici acum batjocura. Au înțeles-o însă vecinii, și peste puțin, așa-i răutatea omenească, sătenii nu-i mai ziceau lui Ghiță, ca mai nainte, Ghiță al Popii, ci Ghiță al Boilor."},{"id":"story-ro-hagi-tudose-2","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Îşi freacă mâinile; tuşesc; îşi dreg glasul; apoi, rara-rara, cu nişte paşi lungi şi semeţi, îţi ies înainte, îţi caută prilej de vorbă, toţi cu aceleaşi cuvinte, cu aceeaşi tărăgănire de glas şi cu capul dat pe spate: – Ei, flăcăule, de pe unde?… Ce vânturi?… Pe la noi… ai?… Şi de ce?… Ce zici de biserica noastră?…"},{"id":"story-ro-voinicul-cel-cu-cartea-n-m-n-n-scut","title":"Voinicul cel cu cartea în mână născut","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":212,"excerpt":"A fost odată o babă şi un unchiaş. Ei până la vreme de bătrâneţe nu avură nici un copil. Ce nu făcură? Ce nu dreseră? Şi ca să aibă şi ei măcar o miarţă de copil, nici cât."},{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-ro-pravoslavnicul-i-sl-ninile","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Era odată un biet creştin sărac şi c-o droaie de copii mărunţi. Toată avuţia lui era gura femeii şi a copiilor, care ţipau de fitece. Guri flămânde, şi pace bună! Poveşti de Barbu Ştefănescu Delavrancea - Pravoslavnicul şi slăninile Bietul creştin, ce făcu, ce drese, s-alese de sfântul crăciun c-un porc gras."},{"id":"story-amintiri-copilarie","title":"Amintiri din copilarie","author":"Ion Creanga","difficulty":5,"genre":"memoir","wordCount":175,"excerpt":"Stau cateodata si-mi aduc aminte ce vremuri si ce oameni mai erau in partea locului, pe cand eram eu copil. Si, drept sa spun, pare-mi-se ca pe atunci oamenii erau mai sarguitori, mai voiosi si mai buni la suflet decat cei de astazi."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-1186847","romanian":"Recordul lui nu va fi niciodată întrecut.","english":"His record will never be broken.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338182"},{"id":"tat-1136709","romanian":"Tom a întrebat-o pe Mary cine crede ea că e cel mai probabil să câștige cursa.","english":"Tom asked Mary who she thought would be the most likely to win the race.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239741"},{"id":"tat-7115203","romanian":"Ceea ce ne definește este modul în care ne ridicăm după ce cădem.","english":"What defines us is how well we arise after falling.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1137975","romanian":"Am putut observa clar că munca grea a început să-și lase amprenta asupra sănătății sale.","english":"I could clearly see that the hard work had begun to tell on his health.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153805","romanian":"Atleţii s-au antrenat din greu în fiecare zi pentru a fi în formă maximă la jocurile olimpice de vară.","english":"The athletes trained hard every day to be at their best for the Summer Olympics.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128898"},{"id":"tat-2536171","romanian":"Sunt o persoană cu defecte, dar acestea sunt defecte de care se poate scăpa ușor.","english":"I am a flawed person, but these are flaws that can easily be fixed.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6741797","romanian":"Dintre toți jucătorii de baseball faimoși, el se evidențiază ca fiind un geniu.","english":"Of all the famous baseball players, he stands out as a genius.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153836","romanian":"Ar trebui să fi terminat până acum.","english":"He should have finished it by now.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12130096"},{"id":"tat-11512231","romanian":"Am simțit că ceva e pe cale să se întâmple.","english":"I sensed something was about to happen.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-698931","romanian":"La ce oră te-ai obișnuit să te duci la culcare?","english":"What time are you used to going to bed?","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2135421"},{"id":"tat-12111968","romanian":"Dacă măslinii ar cunoaște mâinile care i-au plantat, uleiul lor ar deveni lacrimi.","english":"If olive trees knew the hands that planted them, their oil would become tears.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143142","romanian":"Dacă studenții în ziua de azi ar avea mai mult timp liber, ar putea arăta mai mult interes pentru politică.","english":"If students today had more free time, they might show more interest in politics.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068924"},{"id":"tat-4974910","romanian":"Ieri nu a fost nici prea cald, nici prea rece. A fost o zi ideală pentru o plimbare.","english":"Yesterday it was neither too warm nor too cold. It was an ideal day for taking a walk.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8863126","romanian":"Ai putea să spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-4977405","romanian":"Acest magazin vinde îmbrăcăminte și încălțăminte atât pentru bărbați cât și pentru femei.","english":"This store sells clothes and shoes for both men and women.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1119734","romanian":"Vreau să te întreb ceva, domnișoară Ionescu.","english":"I want to ask you something, Ms. Ionescu.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6342506"},{"id":"tat-4987451","romanian":"Noi credem că este cu adevărat posibil ca cele două sisteme sociale diferite să coexiste în pace.","english":"We believe that peaceful coexistence of the two different social systems is fully possible.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-13621513","romanian":"A doua zi dimineață, am regretat profund că am stat treaz atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."},{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"},{"id":"story-ro-sult-nica-2","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":5,"genre":"fiction","wordCount":219,"excerpt":"II E începutul lui decembrie. A dat Dumnezeu zăpadă nemiluită; şi cade, cade puzderie măruntă şi deasă, ca făina la cernut, vânturată de un crivăţ care te orbeşte. Muşcelele dorm sub zăpadă de trei palme. Pădurile, în depărtare, cu tulpini fumurii, par cercelate cu flori de zarzări şi de corcoduşi."},{"id":"story-ro-comoara","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":252,"excerpt":"Sănătatea! Binecuvântata de sănătate! Sănătos să fii, și ți-e destul un pumn de mălai, ca nici pe un împărat să nu te dai! Se scula Duțu cu noaptea-n cap și pleca-n cântarul cocoșilor, căci era lung drumul până la linie și ținea să se puie la lucru mai nainte de a se fi luminat de ziuă."},{"id":"story-ro-gura-satului-3","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"zice una. — Cine altul decât Toderică, îi răspunde alta. — Toderică? Așa umblă gura satului. Nici să visezi din ce scornește o poveste. Pentru ca să vorbim drept, Toderică e Toader, ba chiar Tudoroiu. Lasă că avea din cine să iasă fiindcă și tatăl său, Cosma Florii Cazacului, seamănă cu dânsul."},{"id":"story-ro-boierul-i-p-cal","title":"Boierul şi Păcală","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"Odată, Păcală stătea la marginea unei păduri. Deodată vede o trăsură venind spre el. Repede se scoală, ia un trunchi mare de copac, şi-l ridică drept în sus. În trăsură era boierul, cucoana şi vizitiul, care mâna caii. Boierul, văzând pe Păcală, spuse vizitiului să oprească trăsura: Poveşti de Ioan Slavici - Boierul şi Păcală – Bună ziua!"},{"id":"story-ro-ileana-simziana","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat. Acel împărat mare şi puternic bătuse pe toţi împăraţii de prinpregiurul lui şi-i supusese, încât îşi întinsese hotarele împărăţiei sale pe unde a înţărcat dracul copiii, şi toţi împăraţii cei bătuţi era îndatoraţi a-i da câte un fiu d-ai săi ca să-i slujească câte zece ani."},{"id":"story-ro-ion-roat-i-cuza-vod","title":"Ion Roată şi Cuza-Vodă","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":229,"excerpt":"Între ţăranii fruntaşi care au luat parte, împreună cu boierii, cu episcopii şi cu mitropolitul ţării la Divanul ad-hoc din Moldova, în 1857, era şi moş Ion Roată, om cinstit şi cuviincios, cum sunt mai toţi ţăranii români de pretutindeni."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":206,"excerpt":"A fost odată un ţăran şi-l chema Neagoe. Acest ţăran era om voinic şi harnic. Nu-i păsa lui de nu ştiu cine de ar fi fost."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-2","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":215,"excerpt":"Căzu în genunche şi se rugă lui Dumnezeu, şi o! minune! deodată răsări, măre, dintr-un colţ al chiliei sale o viţă, şi numaidecât crescu şi se înălţă, până la streaşina casei."},{"id":"story-ro-ileana-simziana-2","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":222,"excerpt":"Dacă văzură şi văzură că nimic nu-i este pe plac, fata cea mare îşi luă inima în dinţi şi-l întrebă într-o zi la masă, că de ce este supărat: – Au purtarea noastră nu-ţi place? îi zise ea. Au supuşii măriei tale sunt răi şi arţăgoşi de-ţi pricinuiesc atâta mâhnire?"}],"recipes":[{"id":"recipe-sarmale","title":{"ro":"Sarmale","en":"Stuffed Cabbage Rolls"},"description":{"ro":"Sarmalele sunt un fel de mancare traditional romanesc, facut din carne tocata invelita in frunze de varza murata.","en":"Sarmale are a traditional Romanian dish made of minced meat wrapped in pickled cabbage leaves."},"difficulty":5,"category":"main","ingredients":[{"ro":"varza murata","en":"sauerkraut","amount":"1 capatana"},{"ro":"carne tocata de porc","en":"ground pork","amount":"500 g"},{"ro":"carne tocata de vita","en":"ground beef","amount":"250 g"},{"ro":"orez","en":"rice","amount":"150 g"},{"ro":"ceapa","en":"onion","amount":"2 bucati"},{"ro":"bulion de rosii","en":"tomato paste","amount":"3 linguri"},{"ro":"boia dulce","en":"sweet paprika","amount":"2 linguri"},{"ro":"cimbru uscat","en":"dried thyme","amount":"1 lingurita"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"piper","en":"pepper","amount":"dupa gust"},{"ro":"frunze de dafin","en":"bay leaves","amount":"3 bucati"},{"ro":"smantana","en":"sour cream","amount":"pentru servire"}],"steps":[{"ro":"Se desparte varza in frunze si se spala bine.","en":"Separate the cabbage into leaves and wash well."},{"ro":"Se caleste ceapa tocata in ulei pana devine aurie.","en":"Saute the chopped onion in oil until golden."},{"ro":"Se amesteca carnea tocata cu orezul, ceapa calita, boia si condimentele.","en":"Mix the ground meat with rice, sauteed onion, paprika and seasonings."},{"ro":"Se pune cate o lingura de compozitie pe fiecare frunza de varza si se ruleaza.","en":"Place a spoonful of mixture on each cabbage leaf and roll."},{"ro":"Se aseaza sarmalele in oala, alternand cu straturi de varza tocata.","en":"Arrange the rolls in a pot, alternating with layers of shredded cabbage."},{"ro":"Se adauga bulionul diluat cu apa, foile de dafin si se lasa la fiert incet 3 ore.","en":"Add the tomato paste diluted with water, bay leaves and simmer for 3 hours."},{"ro":"Se servesc calde cu smantana si mamaliga.","en":"Serve hot with sour cream and polenta."}]}]};
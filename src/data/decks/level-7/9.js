@@ -0,0 +1 @@
+export default {"level":7,"sentences":[{"id":"tat-708926","romanian":"Ne-am ascuns după un tufiş pentru ca nimeni să nu ne vadă.","english":"We hid behind a bush so that no one would see us.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397998"},{"id":"tat-6581957","romanian":"O parte din studenți care sunt prinși copiind la examene nici măcar nu se jenează.","english":"Some of the college students who are caught cheating on the exams do not even blush.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136910","romanian":"Articolul 6. Președintele va conduce toate reuniunile.","english":"Article 6. The president shall preside at all meetings.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11953737"},{"id":"tat-2536737","romanian":"Cele mai multe școli au fost concepute nu pentru a transforma societatea, ci pentru a o reproduce.","english":"Most schools were designed not to transform society, but to reproduce it.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136714","romanian":"Destul de curând a venit un excavator care a tăiat un drum prin dealul acoperit cu margarete.","english":"Pretty soon along came a steam shovel and dug a road through the hill covered with daisies.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226376"},{"id":"tat-13603973","romanian":"Tom este cel care mi-a spus că ar trebui să citesc această carte.","english":"Tom is the one who told me that I should read this book.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2534180","romanian":"Isadora Duncan a dansat cu atâta grație încât a fost invitată să danseze în Europa.","english":"Isadora Duncan danced with such grace that she was invited to dance in Europe.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12336953","romanian":"Mi-aș dori să pot vorbi franceza destul de bine pentru a obține o slujbă la acea companie.","english":"I wish I could speak French well enough to get a job at that company.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-6824680","romanian":"De acum înainte, această veveriță va fi cunoscută sub numele de \"Cea drăguță\".","english":"This squirrel shall be henceforth known as \"The Cute One.\"","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1153165","romanian":"Le-am spus să-mi trimită un alt bilet.","english":"I told them to send me another ticket.","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1764648"},{"id":"tat-1153771","romanian":"Acel hotel parcurge într-adevăr tot drumul pentru a se asigura că oaspeții săi se simt ca acasă.","english":"That hotel really goes the extra mile to make sure their guests feel at home.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128474"},{"id":"tat-1136899","romanian":"Sora mea va trebui să își termine temele înainte de a pleca la Hokkaido.","english":"My sister will have finished her homework before she goes to Hokkaido.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960229"},{"id":"tat-2568466","romanian":"Opinia e o idee pe care o avem; convingerea - o idee care ne subjugă.","english":"Our opinion is an idea which we have; our conviction an idea which has us.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7726661","romanian":"Dacă n-ar fi fost zăpadă, am fi putut să ne urcăm pe munte.","english":"If it were not for the snow, we could climb the mountain.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8746440","romanian":"Anglia și Scoția au fost unificate la 1 mai 1707, pentru a forma Regatul Marii Britanii.","english":"England and Scotland were unified on May 1, 1707, to form the Kingdom of Great Britain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-706081","romanian":"Când ar trebui să aduc maşina înapoi?","english":"When should I return the car?","difficulty":5,"wordCount":7,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/970925"},{"id":"tat-6867529","romanian":"Datele empirice rezultate din acest experiment, par a fi în concordanță cu ipotezele teoretice.","english":"The empirical data from this experiment seems in line with the theoretical hypotheses.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5025296","romanian":"Cred că ar trebui să îi spui lui Tom ceea ce el vrea să știe.","english":"I think you should tell Tom what he wants to know.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536654","romanian":"Majoritatea descoperirilor științifice nu e altceva decât descoperirea a ceea ce este evident.","english":"Most scientific breakthroughs are nothing else than the discovery of the obvious.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":230,"excerpt":"A fost odată un flăcăiandru sărman de părinţi. El argăţea pe la unii şi pe la alţii ca să-şi câştige hrana vieţii. Şi fiindcă avea darul de a fi curăţel, toţi flăcăii din sat îl pizmuiau. Ceilalţi argaţi căşunaseră pe dânsul şi-l tot luau peste picior, iară el nu lua aminte la flecăriile lor şi-şi căuta de treaba lui."},{"id":"story-ro-ileana-cea-ireat-2","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":205,"excerpt":"Când cei trei feciori ai împăratului vecin primiră vestea că împăratul a pornit în cale şi că s-a depărtat de acasă, ei se înţeleseră între sine şi încălecară, ca să meargă la cetatea cea cu trei fete de împărat să răpească credinţa fetelor şi să-i facă împăratului supărare."},{"id":"story-ro-flori-a-din-codru","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti."},{"id":"story-ro-cinci-p-ini","title":"Cinci pâini","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":256,"excerpt":"Doi oameni, cunoscuţi unul cu altul, călătoreau odată, vara, pe un drum. Unul avea în traista sa trei pâni, şi celalalt două pâni. De la o vreme, fiindu-le foame, poposesc la umbra unei răchiţi pletoase, lângă o fântână cu ciutură, scoate fiecare pânile ce avea şi se pun să mănânce împreună, ca să aibă mai mare poftă de mâncare."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-2","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Ce nu făcu bietul tată-său, ce nu drese ca să-şi dea fata la casa ei, dară ca s-o înduplece, ba. Ei nu-i da inima să-şi lege capul cu nici unul din peţitorii ce veneau să o ceară, deşi toţi erau împăraţi şi fii de împăraţi."},{"id":"story-ro-aleodor-mp-rat","title":"Aleodor împărat","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat. El ajunsese la cărunteţe, şi nu se învrednicise a avea şi el măcar un copil. Se topea d-a-n picioarele, bietul împărat, să aibă şi el, ca toţi oamenii, măcar o stârpitură de fecior, dară în deşert."},{"id":"story-ro-fata-babei-i-fata-mo-neagului-2","title":"Fata babei şi fata moşneagului","author":"Ion Creanga","difficulty":5,"genre":"folktale","wordCount":227,"excerpt":"Atunci fata babei, vicleană cum era, lua ciurul şi fuga în casă la babă şi la moşneag, spunând că ea a tors acele fuse. În zadar fata moşneagului spunea în urmă că acela este lucrul mâinilor sale; căci îndată o apucau de obraz baba şi cu fiică-sa şi trebuia numaidecât să rămâie pe-a lor."},{"id":"story-ro-balaurul-cel-cu-apte-capete-3","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Atunci un sânge negru lasă din ea, fiară spurcată, şi curse, şi curse, până ce stinse şi foc şi tot. Acum ce să facă viteazul nostru, ca să nu găsească focul stins, când s-or deştepta tovarăşii lui, căci legătura lor era ca să omoare pe acela care va lăsa să se stingă focul."},{"id":"story-ro-cei-trei-fra-i-mp-ra-i-3","title":"Cei trei fraţi împăraţi","author":"Petre Ispirescu","difficulty":5,"genre":"folktale","wordCount":207,"excerpt":"– Ba nici râs, nici nimic, începu a zice neguţătorul cel chiabur. Iată două pungi: nu crez să-ţi dea altul mai mult. Şi scoase pungile cu bani, i le puse în mână, luă oul şi plecă. Bietul om rămase înlemnit în loc, uitându-se după neguţător cum se ducea. Nici că-i venea măcar să crează ochilor."},{"id":"story-ro-p-dureanca","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":214,"excerpt":"Fă trei cruci și zi „Doamne-ajută!” când treci pragul casei, fie ca să ieși, fie ca să intri, căci lumea din întâmplări se alcătuiește, iar întâmplarea e noroc ori nenorocire, și nimeni nu știe dacă e rău ori bun ceasul în care a pornit, nici dacă va face ori nu ceea ce-și pune de gând."},{"id":"story-ro-pas-rea-m-iastr-2","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Iară a treia noapte visă împăratul că dacă va aduce cineva pasărea măiastră de pe tărâmul celălalt şi să-i aşeze cuibul în turn, se va putea face monastirea desăvârşit. Spuse fiilor acest vis, iară ei se întreceau care de care să plece mai-nainte, şi să se închine cu slujba la tată-său împăratul."}],"recipes":[{"id":"recipe-tochitura","title":{"ro":"Tochitura Moldoveneasca","en":"Moldavian Pork Stew"},"description":{"ro":"Tochitura este o mancare traditionala din Moldova, facuta din carne de porc cu sos de rosii si servita cu mamaliga.","en":"Tochitura is a traditional Moldavian dish made with pork in tomato sauce, served with polenta."},"difficulty":5,"category":"main","ingredients":[{"ro":"carne de porc","en":"pork meat","amount":"600 g"},{"ro":"carnati proaspeti","en":"fresh sausages","amount":"200 g"},{"ro":"rosii pasate","en":"crushed tomatoes","amount":"400 g"},{"ro":"vin rosu","en":"red wine","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"4 catei"},{"ro":"ardei iute","en":"hot pepper","amount":"1 bucata"},{"ro":"boia dulce","en":"sweet paprika","amount":"1 lingura"},{"ro":"ulei","en":"oil","amount":"3 linguri"},{"ro":"oua","en":"eggs","amount":"4 bucati"},{"ro":"branza de burduf","en":"sheep cheese","amount":"100 g"}],"steps":[{"ro":"Se taie carnea de porc in cuburi si se prajeste in ulei pana se rumeneste.","en":"Cut the pork into cubes and fry in oil until browned."},{"ro":"Se adauga carnatii taiati felii si se prajesc impreuna cu carnea.","en":"Add the sliced sausages and fry together with the meat."},{"ro":"Se pune boia, usturoiul pisat si ardeiul iute tocat.","en":"Add paprika, crushed garlic and chopped hot pepper."},{"ro":"Se stinge cu vinul rosu si se lasa sa se evapore.","en":"Deglaze with red wine and let it evaporate."},{"ro":"Se adauga rosiile pasate si se lasa la fiert incet 30 minute.","en":"Add the crushed tomatoes and simmer for 30 minutes."},{"ro":"Se fac ochiuri in acelasi ulei in care s-a gatit carnea.","en":"Fry eggs sunny-side up in the same oil used for the meat."},{"ro":"Se serveste tochitura cu mamaliga, ochiuri si branza de burduf.","en":"Serve the stew with polenta, fried eggs and sheep cheese."}]}]};
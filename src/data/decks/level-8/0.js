@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-204","romanian":"Fiecare experienta ne invata ceva important despre viata.","english":"Every experience teaches us something important about life.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-2568457","romanian":"Oamenii care iubesc nu se îndoiesc de nimic sau pun la îndoială totul.","english":"People who love doubt nothing, or doubt everything.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8773155","romanian":"Layla a intrat într-o depresie profundă în urma pierderii celei mai bune prietene a ei, Salima.","english":"Layla slipped into a deep depression over the loss of her best friend, Salima.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-223","romanian":"Diversitatea culturala contribuie la imbogatirea societatii noastre.","english":"Cultural diversity contributes to the enrichment of our society.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-584045","romanian":"Să gândim ceea ce nu simţim înseamnă sa ne minţim pe noi înşine, în acelaşi mod în care ii minţim pe ceilalţi când nu spunem ceea ce gândim.","english":"To think what we do not feel is to lie to ourselves, in the same way that we lie to others when we say what we do not think.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262929"},{"id":"tat-9622607","romanian":"Tom și Mary au spus că au plecat devreme pentru că nu se simțeau bine.","english":"Tom and Mary said they left early because they were feeling sick.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-230","romanian":"Relatia dintre individ si societate ramane una dintre cele mai complexe chestiuni.","english":"The relationship between individual and society remains one of the most complex issues.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1193104","romanian":"Au eşuat amândoi în găsirea celei mai serioase probleme cu care s-a confruntat vreodată planeta noastră.","english":"They have both failed to find the most serious problem that has ever faced our planet.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1043821"},{"id":"tat-13632868","romanian":"Noua generație pare să aibă o perioadă de atenție mai redusă decât am avut noi.","english":"This new generation seems to have a shorter attention span than we did.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13603973","romanian":"Tom este cel care mi-a spus că ar trebui să citesc această carte.","english":"Tom is the one who told me that I should read this book.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12946182","romanian":"Albinele sunt animale foarte utile pentru că produc miere, ceară și polenizează florile.","english":"Bees are very useful animals because they produce honey, wax, and pollinate flowers.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5229148","romanian":"Poliția s-a uitat peste tot și nu a putut găsi nici o urmă a lui Tom.","english":"The police looked everywhere and could find no trace of Tom.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10242320","romanian":"Arătau și aveau gust de creveți, dar vă pot asigura că aceia nu erau creveți adevărați.","english":"They looked and tasted like shrimps, but I can assure you those were not real shrimps.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7187048","romanian":"Tom speră să obțină un profit în acest an, chiar dacă profitul va fi unul mic.","english":"Tom hopes to make a profit this year, albeit a small one.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6578340","romanian":"I-am spus lui Mary să nu facă asta, dar ea tot a făcut-o.","english":"I told Mary not to do that, but she did it anyway.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-3629565","romanian":"În aritmetica iubirii, unu plus unu fac totul, pe când doi minus unu este egal cu zero.","english":"In the arithmetic of love, one plus one makes a whole, and two minus one equals zero.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2536658","romanian":"Trecutul poate fi doar cunoscut, nu schimbat. Viitorul poate fi doar schimbat, nu cunoscut.","english":"The past can only be known, not changed. The future can only be changed, not known.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5025296","romanian":"Cred că ar trebui să îi spui lui Tom ceea ce el vrea să știe.","english":"I think you should tell Tom what he wants to know.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-pas-rea-m-iastr-2","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Iară a treia noapte visă împăratul că dacă va aduce cineva pasărea măiastră de pe tărâmul celălalt şi să-i aşeze cuibul în turn, se va putea face monastirea desăvârşit. Spuse fiilor acest vis, iară ei se întreceau care de care să plece mai-nainte, şi să se închine cu slujba la tată-său împăratul."},{"id":"story-ro-c-lin-nebunul-3","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":209,"excerpt":"– Hai! Şi l-a omorât şi pe acesta ş-a făcut patru căpiţi de carne din capetele lui. Acu, când s-au trezit ei, o-nceput să-i deie de grijă lui Călin Nebunul că să păzească bine focul. Acu el a treia noapte era să fie. Acu iar pe la miezul nopţii s-auzi un huiet mare. Un zmeu era – cu opt capete."},{"id":"story-sara-pe-deal","title":"Sara pe deal","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":110,"excerpt":"Sara pe deal buciumul suna cu jale, Turmele-Loss'n vin, umpland carari si cale, Sufletul meu arde-n iubire ca para, Tu esti departe. Foarte departe, sufletul meu te cheama, Stelele-Loss'n cer scapara-n neagra ceama, Inima mea te asteapta cu dor, Tu nu mai vii."},{"id":"story-ro-ileana-cea-ireat","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":215,"excerpt":"A fost odinioară un împărat care avea trei fete, dintre care cea mai mare era frumoasă, cea mijlocie şi mai frumoasă, iar cea mai tânără, Ileana, atâta de frumoasă încât şi Sfântul Soare se oprea în cale ca s-o vadă şi să se desfăteze de frumuseţea ei."},{"id":"story-ro-poveste-2","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":232,"excerpt":"Iar împărăteasa avea haz, căci începea şi ea, adunându-şi lacrimile în pumni, şi-l certa că prea plânge ca o muiere de fiece şi orişicând. Şi începeau: – Ba iar ai plâns. – Ba n-am plâns. – Ba te-am văzut eu. – Şi eu te-am văzut pe tine. – Ba eu am râs. – Şi eu am râs."},{"id":"story-ro-lupul-cel-n-zdr-van-i-f-t-frumos-3","title":"Lupul cel năzdrăvan şi Făt-Frumos","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":226,"excerpt":"Le dete, deci, voie, şi ei se puseră pe lucru. Pândi în ziua dintâi fiul cel mare; dară păţi ruşinea ce păţise şi ceilalţi pândari din naintea lui. A doua zi pândi şi cel mijlociu; dară nici el nu fu mai breaz, ci se întoarse la tatăl său cu nasul în jos."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-2","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Băiatul lui i-o spus: iaca, tată, din ce pricină. Şi omul s-o sfătuit cu mama fetei, s-o prăpădească din pricina asta. Au tocmit un om, ş-au pus pe fată ‘n căruţă ş-au zis s-o ducă ‘ntr-o pustietate, şi să-i scoată ochii amândoi să-i aducă tătâne-său. Omul a luat-o. După fată se ţinea ş-un căţeluş."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7361805","romanian":"Casa noastră actuală este prea mică, așa că ne-am decis să ne mutăm.","english":"Our current house is too small, so we decided to move.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11512231","romanian":"Am simțit că ceva e pe cale să se întâmple.","english":"I sensed something was about to happen.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13632854","romanian":"Există o scădere vizibilă în ceea ce privește respectul pentru autorități și tradiții.","english":"There’s a noticeable decline in respect for authority and tradition.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143136","romanian":"- 99 copeici, a declarat Dima cu mândrie. Am nevoie de 99 copeici.","english":"99 kopeks, Dima stated proudly. \"I need 99 kopeks.\"","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068904"},{"id":"tat-13612858","romanian":"Tom spuse că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2040372","romanian":"Inginerii au aruncat podul în aer pentru că era gata să se prăbușească.","english":"The engineers blew up the bridge because it was about to collapse.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10788510","romanian":"Știam că Tom ar putea să nu fie în stare să facă asta.","english":"I knew that Tom might not be able to do that.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-205","romanian":"Daca as fi stiut, as fi luat o decizie diferita.","english":"If I had known, I would have made a different decision.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-6539915","romanian":"Potrivit unui studiu recent, durata medie de viață a japonezilor este în continuă creștere.","english":"According to a recent study, the average life span of the Japanese is still increasing.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6918482","romanian":"Am fost prea ocupat să-l ajut pe Tom ca să o mai ajut și pe Mary.","english":"I was too busy helping Tom to help Mary.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4988491","romanian":"Ursul s-a luptat cu vecinul meu până a obosit, apoi cu ultimele puteri a fugit în pădure.","english":"The bear fought with my neighbour until he got tired. Afterwards, with the last of his strength, he fled into the forest.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6826720","romanian":"Spre deosebire de sora lui, el și-a păstrat credința religioasă insuflată de părinții lui.","english":"Unlike his sister, he has retained the religious faith his parents brought him up in.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-234","romanian":"Complexitatea sistemelor sociale contemporane depaseste adesea capacitatea noastra de intelegere imediata.","english":"The complexity of contemporary social systems often exceeds our capacity for immediate understanding.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-10787417","romanian":"Una dintre fetițe s-a oprit și s-a întors să se uite la mine.","english":"One of the little girls stopped and turned back to look at me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-228","romanian":"Paradoxal, cu cat stim mai mult, cu atat devenim mai constienti de ignoranta noastra.","english":"Paradoxically, the more we know, the more aware we become of our ignorance.","difficulty":9,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-216","romanian":"Literatura romana clasica reflecta lupta pentru identitate nationala.","english":"Classic Romanian literature reflects the struggle for national identity.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-4993240","romanian":"Experții spun că prețul cafelei crește în primul rând pentru că oamenii sunt dispuși să plătească mai mult.","english":"Experts say coffee prices are rising mainly because people are willing to pay more.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-departe-departe","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"Sub castanii din via părăsită, mai mulţi copilaşi, în cămăşi albe, mă înconjuraseră. Stam pe pământul cald, cu mâinile sub cap, privind adâncul cerului albastru, şi povesteam. Poveşti de Barbu Ştefănescu Delavrancea - Departe, departe O fetiţă îmi sorbea cuvintele, dând într-o parte şi alta, pletele negre ce-i acopereau ochii ei mari şi verzi…"},{"id":"story-ro-cele-trei-rodii-aurite","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"A fost odată un împărat, şi avea un fecior; acesta, şezând la fereastră, vede o babă bătrână, care venea cu tivga să ia apă de la fântână."},{"id":"story-ro-borta-v-ntului","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Era un om sărac – sărac, ş-avea o mulţime de copii. Acu era – în vremea foametei şi el a muncit v-o săptămână pe un căuş de grăunţe. Acu s-a dus la râşniţă cu dânsele. După ce le-o râşnit, a ieşit afară cu căuşul cu făină şi s-a pornit o furtună mare şi i-a luat toată făina din căuş."},{"id":"story-ro-bunica-3","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":218,"excerpt":"Măria-ta, să ştii că atunci când or lega rod ăşti doi meri, împărăteasa o să rămână grea şi o să nască un cocon cu totul şi cu totul de aur\"… Piticul se duse, şi împăratul alergă în grădină, şi căută, căută peste tot locul, până dete peste ăi doi meri."},{"id":"story-ro-poveste-r-neasc-2","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":208,"excerpt":"Dară feciorul cel mic al împăratului nici nu voi să asculte de unele ca acestea, ci zise: – Duce-mă-voi singur, căci trebuie să fi ştiut tata ce zice, când ne-a poruncit să păzim câte unul singur. Şi astfel, cum veni seara, se duse la locul de pândă."},{"id":"story-scrisoarea-iii","title":"Scrisoarea III","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":145,"excerpt":"Unde-Loss'n ceruri senine Luceafarul rasare, Din negura de vremi acolo moartea a lasat urma, Acolo sufletul se-Loss'ntreaba: \"Ce-Loss'n veacul veacului nu moare?\" Si glasul vremii-Loss'n raspuns sopteste tainic: \"Numai urma.\" Pe cand lumea toata doarme-Loss'n noapte, Trecut-au ani si veacuri, si totusi noi vedem Pe bolta-Loss'nstelata aceleasi stele-Loss'napte Ce-au luminat si Mircea, si Stefan cel Batran."},{"id":"story-ro-neghini-2","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– Bine, mătuşă, bine, da’ de unde şi fată? Tu nu ştii că copacii uscaţi nu mai dau de la rădăcină? Şi bătrâna începu să râdă şi să ofteze: \"hi, hi, hi, ooof, of!\" – Ei, toate se întorc, şi apele se întorc de la Dumnezeu, numai tinereţile ba. Ce nu e la timp nu mai e niciodată."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-1138134","romanian":"Dacă vrei să pari vorbitor nativ, ascultă vorbitori nativi de câte ori este posibil.","english":"If you want to sound like a native speaker, listen to native speakers whenever possible.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10788926","romanian":"Domnul Smith nu este disponibil. Doriți să vă faceți o programare pentru a veni să-l vedeți?","english":"Mr. Smith is not available. Would you like to make an appointment to come see him?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536724","romanian":"Matematicieni sunt poeți, cu excepția faptului că ei trebuie să dovedească ceea ce creează fantezia lor.","english":"Mathematicians are poets, except that they have to prove what their fantasy creates.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2429205","romanian":"La început am crezut că sunt avantajat având o limbă din familia latină.","english":"At first, I thought I had an advantage because I spoke a Romance language.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-217","romanian":"Experienta ne-a invatat ca rabdarea este cea mai importanta virtute.","english":"Experience has taught us that patience is the most important virtue.","difficulty":8,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-7578033","romanian":"Mă doare gâtul și am și febră. Poți să-mi dai niște medicamente pentru răceală?","english":"My throat hurts, and I have a fever. Can I have some cold medicine?","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143256","romanian":"Fabrica a fost închisă pentru renovare şi va fi deschisă pe 1 septembrie 2007.","english":"The factory is closed for refurbishment and will re-open on 1st September 2007.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068570"},{"id":"tat-7166872","romanian":"Adoptarea unei diete cu conținut scăzut de calorii, vă va crește durata de viață.","english":"Adopting a low calorie diet will increase your lifespan.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13604225","romanian":"Tom și Mary au spus că au crezut că John va vrea să facă asta.","english":"Tom and Mary said they thought John would be willing to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568461","romanian":"Cel mai lent în a promite este și cel mai credincios promisiunii atunci când o face.","english":"The slowest one to make a promise is the most faithful one in keeping it.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136770","romanian":"Ziua a fost furtunoasă și ceea ce a fost încă și mai rău a fost că fulgera.","english":"The day was stormy, and what was worse still, it was thundering.","difficulty":7,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966198"},{"id":"tat-12047689","romanian":"Deși e de la sine înțeles, mai bine ar fi să se spună.","english":"While it goes without saying, it would go even better if it was said.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6637069","romanian":"Friptura a fost arsă din greșeală, dar cu toate acestea a avut un gust spectaculos.","english":"The steak was inadvertently burnt, but nonetheless it tasted spectacular.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6764266","romanian":"Pompierii voluntari au luptat împotriva vâlvătăii cu mult curaj, dar cu puțină considerație pentru propria lor siguranță.","english":"The volunteer firefighters fought the blaze bravely, with scant regard for their own safety.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-231","romanian":"Arta are capacitatea unica de a transcende barierele culturale si lingvistice.","english":"Art has the unique ability to transcend cultural and linguistic barriers.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12319007","romanian":"Cronica unei morți anunțate este un roman al scriitorului columbian Gabriel García Márquez.","english":"Chronicle of a Death Foretold is a novel by the Colombian writer Gabriel García Márquez.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6537690","romanian":"Ar fi mai bine să lași treaba asta cuiva care știe despre ce este vorba.","english":"It would be best to leave it to a man who knows the ropes.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11658152","romanian":"Girafa este cel mai înalt animal din existență, dar au existat și dinozauri mai înalți.","english":"The giraffe is the tallest animal in existence, but there were even taller dinosaurs.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-p-cal-n-satul-lui-2","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"– Măi! ziceau vecinele lui Păcală, ce lucru să mai fie şi ăsta? viţeaua asta le întrece pe toate! Ce-i va fi dând oare să mănânce? Ce soi o fi de creşte aşa de frumos?"},{"id":"story-ro-sorcova-2","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Nu se pomenea nici de sorcovăială, după cum s-ar fi cuvenit de la moşi, de la strămoşi. Ţi se prindea pleoapă de pleoapă, nară de nară, falcă de falcă, degera oul în găină de ger ce se pornise. – N-am putea duce l-alde biata Bălaşa ceva curmeie de viţă şi vreascuri ujujite?"},{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-2","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":206,"excerpt":"La urmă, românul, mulţumit, vroi să dea câteva bucăţi de carne pravoslavnicului. Bătrânul îşi făcu cruce, se cutremură şi cu nici un preţ nu voi să primească, zicând c-un glas de mucenic: – Lasă, lasă, omul lui Dumnezeu, că pentru Dumnezeu am muncit. Ei, dar cine-mi fusese omul cu crucile!"},{"id":"story-ro-vasilie-finul-lui-dumnezeu","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste, cuvânt de poveste, în astă sară la noi soseşte pe un pai de secară, să te ţin de vorbă ‘n astă sară."},{"id":"story-ro-ho-u-mp-rat-3","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":216,"excerpt":"De aceea, fătul meu, te-am dat să înveţi toate meşteşugurile. Nu mi-a venit în gând că şi hoţia este un meşteşug. Aceasta îţi rămâne să mai înveţi, după care te vei face un împărat ca Solomon împărat şi cum altul nu va mai fi pe lume. – Ii!"},{"id":"story-ro-boierul-i-p-cal","title":"Boierul şi Păcală","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"Odată, Păcală stătea la marginea unei păduri. Deodată vede o trăsură venind spre el. Repede se scoală, ia un trunchi mare de copac, şi-l ridică drept în sus. În trăsură era boierul, cucoana şi vizitiul, care mâna caii. Boierul, văzând pe Păcală, spuse vizitiului să oprească trăsura: Poveşti de Ioan Slavici - Boierul şi Păcală – Bună ziua!"}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
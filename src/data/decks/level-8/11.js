@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-7166713","romanian":"Am fost uimit de îndrăzneala elevului, de a-i pune lectorului o astfel de întrebare personală.","english":"I was amazed at the audacity of the student to ask the lecturer such a personal question.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12328330","romanian":"Fiecare limbă care se stinge ia cu ea o bucată din istoria umană.","english":"Every language that dies out takes a piece of human history with it.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5144512","romanian":"O parolă bună ar trebui să fie greu de ghicit, dar ușor de reținut.","english":"A good password should be difficult to guess, but easy to remember.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5158990","romanian":"Dacă calci cu fierul de călcat Elveția, ar fi mai mare decât Germania.","english":"If you ironed Switzerland, it would be bigger than Germany.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12047690","romanian":"Dacă lumea ar ști de ce oameni mici este condusă, s-ar răzvrăti imediat.","english":"If the people knew by what small men they are ruled, they would soon rebel.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12040285","romanian":"Există unele avioane, numite planoare, care nu au deloc motoare, dar zboară foarte bine.","english":"There are some aircraft, called gliders, that have no engines at all, but fly just fine.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6538121","romanian":"Deși nu mai este președinte, el continuă să aibă o influență considerabilă printre elita politică.","english":"Though he is no longer president, he still holds considerable sway among the political elite.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143211","romanian":"Patru metri din acest material costă nouă franci; deci doi metri costă patru franci și jumătate.","english":"Four metres of this material cost nine francs; therefore, two metres cost four and a half francs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070001"},{"id":"tat-236","romanian":"Interdependenta globala a economiilor impune o regandire fundamentala a relatiilor internationale.","english":"The global interdependence of economies requires a fundamental rethinking of international relations.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5179395","romanian":"Doar ca să te menții în viață este suficient de greu în aceste timpuri.","english":"Just staying alive in these times is hard enough.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-862376","romanian":"Din cauză că lumina călătoreşte mai repede decât sunetul, unii oameni par geniali înainte de a suna stupizi.","english":"It is because light travels faster than sound that some people look brilliant before sounding stupid.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9457136"},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11673611","romanian":"A doua mea învățătoare la școala primară (1941) a fost o frumoasă blondă pe nume Helena.","english":"My second primary school teacher (1941) was a beautiful blonde named Helena.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12013309","romanian":"Pentru mine, ca brazilian, studiul limbii galice este ceva cu adevărat delicios și captivant.","english":"For me, as a Brazilian, studying the Galician language is something truly delicious and captivating.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6828262","romanian":"O persoană nu este niciodată prea bătrână pentru a se dezvăța de obiceiurile proaste.","english":"One is never too old to unlearn bad habits.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9839372","romanian":"Părtidelor nu li se permite să discute propunerile lor politice în timpul dezbaterii.","english":"Parties are not allowed to discuss their political propositions during the debate.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6581970","romanian":"Medalia de Onoare a Congresului este cea mai importantă distincție la care un soldat poate aspira.","english":"The Congressional Medal of Honor is the highest award that any soldier can aspire to.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7187050","romanian":"Multe companii de software oferă versiuni gratuite ale produselor lor, dar cu funcționalitate limitată.","english":"Many software companies offer free versions of their products, albeit with limited functionality.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-bunica-2","title":"Bunica","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":242,"excerpt":"– A fost odată un împărat mare, mare… – Cât de mare? – Mare de tot. Şi-şi iubea împărăteasa ca ochii din cap. Dar copii nu avea. Şi îi părea rău, îi părea rău că nu avea copii… – Bunico, e rău să nu ai copii? – Fireşte că e rău. Casa omului fără copii e casă pustie."},{"id":"story-ro-poveste","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"O, poveşti, poveşti… lumea toată este o poveste, căci ce-a fost odată ca niciodată o fi fost ca şi astăzi, şi ce este astăzi va fi odată ca niciodată."},{"id":"story-ro-b-iatul-cel-bubos-i-ghigor-ul-2","title":"Băiatul cel bubos şi ghigorţul","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Ce nu făcu bietul tată-său, ce nu drese ca să-şi dea fata la casa ei, dară ca s-o înduplece, ba. Ei nu-i da inima să-şi lege capul cu nici unul din peţitorii ce veneau să o ceară, deşi toţi erau împăraţi şi fii de împăraţi."},{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."},{"id":"story-ro-popa-tanda-3","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":213,"excerpt":"O vorbă și încă ceva, pentru mai bună înțelegere, la protopop, o cale la episcopie, și aici o vorbă bună de la protopop: lucrurile se fac, numai dacă le știm face. Cu mult, cu puțin, părintele Trandafir fu trimis de la Butucani la Sărăceni — pentru buna înțelegere între credincioși. Popă-n Sărăceni? Cine știe ce vrea să zică popă-n Sărăceni!"},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":222,"excerpt":"A fost odată ca niciodată; că de n-ar fi, nu s-ar mai povesti; de când făcea plopşorul pere şi răchita micşunele; de când se băteau urşii în coade; de când se luau de gât lupii cu mieii de se sărutau, înfrăţindu-se; de când se potcovea puricele la un picior cu nouăzeci şi nouă de oca de fier şi s-arunca în slava cerului de ne aducea poveşti; Poveşti de Petre Ispirescu - Tinereţe fără bătrâneţe şi viaţă fără de moarte De când se scria musca pe părete, Mai mincinos cine nu crede."},{"id":"story-ro-v-duvele-2","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"Aşa e. Că de ne-om cântări cuvântul cu cântarul şi ne-om măsura privirea cu cotul, ori să numeri câte pahare de vin a băut omul la masa ta ca să nu-l înşeli la a lui, s-a dus prietenia pe copcă, c-aşa e făcută să fie dragostea, fără ştreang de gât şi fără căluş în gură."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-218","romanian":"Colaborarea internationala este esentiala pentru progresul stiintific.","english":"International collaboration is essential for scientific progress.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-6060858","romanian":"Poate ai putea sa inveti cite ceva de la el.","english":"Perhaps you could learn a thing or two from him.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6635545","romanian":"În ciuda faptului că, în medie, femeile sunt mai inteligente decât bărbații, majoritatea geniilor sunt bărbați.","english":"Notwithstanding the fact that on average women are more intelligent than men, most geniuses are men.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1137975","romanian":"Am putut observa clar că munca grea a început să-și lase amprenta asupra sănătății sale.","english":"I could clearly see that the hard work had begun to tell on his health.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136714","romanian":"Destul de curând a venit un excavator care a tăiat un drum prin dealul acoperit cu margarete.","english":"Pretty soon along came a steam shovel and dug a road through the hill covered with daisies.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226376"},{"id":"tat-208","romanian":"Trebuie sa gandim pe termen lung, nu doar pe moment.","english":"We must think long-term, not just for the moment.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-586150","romanian":"Înţeleg perfect italiana, se lăudă ea în timp ce alegea meniul, dar când i-a fost servită mâncarea, nu era nicidecum ce aşteptase.","english":"I understand Italian perfectly, she boasted while choosing a dish from the menu, but when the food was served, it was not at all what she expected.","difficulty":10,"wordCount":22,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7778534"},{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6599852","romanian":"Din cauza unor circumstanțe neprevăzute, excursia noastră în munți, din acest weekend, va fi anulată.","english":"Due to unforeseen circumstances, our trip to the mountains this weekend will be cancelled.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-5144503","romanian":"Subiectul unei propoziții este, de obicei, o persoană sau un lucru care efectuează acțiunea indicată de verb.","english":"The subject of a sentence is usually a person or a thing performing the action shown by the verb.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6764268","romanian":"El a crezut că afirmația ei este pur și simplu imposibilă și a consimțit propunerea.","english":"He believed her assertion to be simply impossible and assented to the proposal.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153774","romanian":"Într-un final, Susan îi taie mamei vorba, promite să-i scrie și închide telefonul.","english":"Finally, Susan cuts her mother short, promises to write, and hangs up.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128481"},{"id":"tat-10827564","romanian":"Am găsit un portofel pe jos și i l-am dat agentului de pază.","english":"I found a wallet on the ground and gave it to the security guard.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10790200","romanian":"Tom are o cicatrice pe încheietura mâinii de când a încercat să se sinucidă.","english":"Tom has a scar on his wrist from when he tried to commit suicide.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8741689","romanian":"Samuel și Michael vorbeau despre o fată pe care Bryan a cunoscut-o în Brazilia anul trecut.","english":"Samuel and Michael were talking about a girl Bryan met in Brazil last year.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-hagi-tudose-3","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"II Aşa m-au judecat şi pe mine, şi n-oi mai uita mai ales ochii mici şi vărgaţi ai ctitorului, care-mi tălmăcea zugrăvelile, înfigând degetul arătător asupra sfinţilor şi oftând parcă ar fi voit să plângă vremile apuse şi credinţele de odinioară. Erau patru. Trei – cu giubele lungi, cu şepci cu cozoroace de lac, crăpate şi şterse de lustru."},{"id":"story-enigma-otiliei","title":"Enigma Otiliei","author":"George Calinescu","difficulty":6,"genre":"fiction","wordCount":180,"excerpt":"Intr-o seara de vara, Felix Sima sosi in Bucuresti. Era student la Medicina si venise sa locuiasca la unchiul sau, Costache Giurgiuveanu. Casa din strada Antim era mare si veche, cu ziduri groase si ferestre inalte. Cand Felix a intrat in curte, a vazut o fata tanara care citea pe o banca, sub un tei batran."},{"id":"story-ro-c-lin-nebunul-2","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"A aruncat şi cel mijlociu şi tot aşa degrabă a ajuns. Da când a aruncat Călin Nebunul, a mers trei luni de zile, zi şi noapte, şi de-abia a ajuns. Acu ei, mergând pe drum, au gătit şi cremenea şi amnarul. De-abia au avut cu ce aţâţa oleacă de foc."},{"id":"story-ro-greuceanu","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":228,"excerpt":"A fost un împărat şi se numea împăratul Roşu. El era foarte mâhnit că, în zilele lui, nişte zmei furaseră soarele şi luna de pe cer."},{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-cele-trei-rodii-aurite-3","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":210,"excerpt":"– Mamă, zise fiul împăratului, caut cele trei rodii aurite, şi dorinţa de a le avea m-a adus p-aici, nu ştii d-ta încotro se află?"},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-10006115","romanian":"În epoca stalinistă, prizonierii din lagărele de concentrare au devenit sclavi în slujba statului.","english":"During the Stalinist era, prisoners at concentration camps became slaves in service of the state.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143107","romanian":"Jocul shiritori se joacă luând silaba finală a cuvântului spus de persoana dinainte și apoi următoarea persoană caută un cuvânt care începe cu acel sunet.","english":"The game of shiritori is played by taking the final sound of the word spoken by the person before you, and then the next person looks for a word that begins with that sound.","difficulty":10,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070029"},{"id":"tat-5037534","romanian":"Ce zici despre formarea unui grup pe Facebook cu scopul de a discuta studierea limbilor străine?","english":"What about putting together a group on Facebook so we can discuss studying foreign languages?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536357","romanian":"Trebuie să învățăm să trăim împreună ca frații sau vom pieri împreună ca proștii.","english":"We must learn to live together as brothers, or we will perish together as fools.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6867575","romanian":"Procurorii în instanță trebuie să-și justifice afirmațiile pentru a demonstra că un suspect este vinovat.","english":"Prosecutors in court have to substantiate their claims in order to prove a suspect is guilty.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6637083","romanian":"Construcția barajului a creat un lac artificial, care a distrus un întreg ecosistem.","english":"The construction of the dam created an artificial lake that destroyed a whole ecosystem.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12321128","romanian":"De ce ești așa de nervos? Tot ce-am făcut este să-ți mănânc sandvișul.","english":"Why are you so angry? All I did was eat your sandwich.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1288426","romanian":"Câțiva dintre noi din Westmont de asemenea mergem la Ensanada în acest sfârșit de săptămână!","english":"A group of us from Westmont is going to Ensanada this weekend as well!","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11639745","romanian":"Cum poate fi numită această Putere care a creat viața, timpul și atâtea trilioane de stele?","english":"What can be called this Power that created life, time and so many trillions of stars?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-207","romanian":"El a reusit sa depaseasca toate obstacolele din calea lui.","english":"He managed to overcome all the obstacles in his way.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-12341853","romanian":"Nu ai nimic de făcut decât să te supui regulilor.","english":"There is nothing for you to do but obey the rules.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-219","romanian":"Analiza detaliata a datelor a relevat tendinte neasteptate.","english":"Detailed data analysis revealed unexpected trends.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1192806","romanian":"După ce a jucat atât de prost tot jocul, echipa a plecat cu coada între picioare.","english":"After playing so badly for the entire game, the team walked off with their tails between their legs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354510"},{"id":"tat-4993134","romanian":"Oficialii chinezi spun că creșterea economică a scăzut la minimul ultimilor trei ani din cauza economiei globale.","english":"Chinese officials say economic growth has dropped to a three-year low because of the world economy.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-2536171","romanian":"Sunt o persoană cu defecte, dar acestea sunt defecte de care se poate scăpa ușor.","english":"I am a flawed person, but these are flaws that can easily be fixed.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6824477","romanian":"Lumea pe care am văzut-o în visul meu era o lume pașnică, lipsită de război.","english":"The world which I saw in my dream was a peaceful world devoid of war.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-balaurul-cel-cu-apte-capete-3","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Atunci un sânge negru lasă din ea, fiară spurcată, şi curse, şi curse, până ce stinse şi foc şi tot. Acum ce să facă viteazul nostru, ca să nu găsească focul stins, când s-or deştepta tovarăşii lui, căci legătura lor era ca să omoare pe acela care va lăsa să se stingă focul."},{"id":"story-ro-v-duvele","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"Oamenii, când n-au ce face, se-apucă de gâlceavă. Se dau la vorbă, şi destul e unul s-o apuce anapoda, că cearta e gata. Prostia pândeşte mintea omului cum pândesc lupii razna oilor."},{"id":"story-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":170,"excerpt":"Ghita era un om simplu care visa la o viata mai buna pentru familia sa. Cand a auzit ca moara de la marginea satului e de inchiriat, a vazut o sansa. \"Hai sa luam moara,\" i-a spus sotiei lui, Ana. \"Vom munci si vom prospera.\" La inceput, totul a mers bine."},{"id":"story-ro-z-na-mun-ilor-2","title":"Zâna munţilor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"După ce veniră filosofii, învăţă şi de la dânşii câte în lună şi în soare. Bucuria tatălui său era aşa de mare unde vedea că fiu-său are să fie procopsit ca nici unul din fiii de împăraţi, încât se uita la dânsul ca la soare. Iară el de ce se mărea d-aia se făcea mai cu minte şi mai frumos."},{"id":"story-ro-flori-a-din-codru-2","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":238,"excerpt":"Cine ştie? vreun împărat ce domneşte în ascuns prin adâncul codrilor… Crâşmarul s-a lăsat de lemne, a luat fata în braţe, a dus-o acasă… şi de aici înainte a fost fata de suflet a lui şi a crâşmăriţei. Aşa a crescut apoi fata la crâşmă."},{"id":"story-ro-fata-cu-pieze-rele-2","title":"Fata cu pieze rele","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Se silea bietul împărat, cu toţi cei doisprezece fii ai săi, să facă pace, să fie între oameni bună învoire, să oprească relele ce-l bântuiau, dar geaba, pagubele curgeau gârlă. În cele mai de pe urmă chemă un cetitor de stele să-i spuie ce e pricina de-i merg lucrurile anapoda şi nu poate să dea înainte."},{"id":"story-ro-sorcova","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sorcova Troienele se ridicau namilă până în tinda creştinului. Vântul spulbera fulgii de zăpadă în vârteje şi stoluri, repezite în lungul uliţelor, sparte la răspântii şi împrăştiate fără căpătâi în largul maidanelor de la Olănita. Pârtia nu se mai cunoştea. Zăpada îţi trecea de glezne şi mai bine."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
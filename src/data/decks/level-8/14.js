@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-215","romanian":"Prin urmare, trebuie sa luam masuri imediate pentru a rezolva problema.","english":"Therefore, we must take immediate measures to solve the problem.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1143212","romanian":"Vasta câmpie se întindea cât vezi cu ochii, punctată cu plantații ici și colo.","english":"The spacious plain spread as far as the eye can see, dotted with groves here and there.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070003"},{"id":"tat-10787601","romanian":"Ai putea să te rănești dacă ai încerca să faci asta.","english":"You might get hurt if you tried doing that.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1192795","romanian":"Teledonul este un program TV francez organizat în fiecare an pentru a colecta fonduri în scopul finanțării de cercetări medicale.","english":"The telethon is a French TV program organized every year to collect funds in order to finance medical research.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351508"},{"id":"tat-6767614","romanian":"În realitate, explicația este un pic mai complicată decât asta, dar ai înțeles esențialul.","english":"In reality, the explanation is a bit more complicated than this, but you get the gist.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143283","romanian":"Ar fi trebuit să ai curajul să spui deschis ce crezi că este corect.","english":"You ought to have the courage to speak out what you believe to be right.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068669"},{"id":"tat-2568530","romanian":"Pentru el, foamea era un concept abstract; el a avut întotdeauna suficientă mâncare.","english":"To him, hunger was an abstract concept; he always had enough to eat.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6595168","romanian":"Bob i-a spus lui Jane să nu se amestece în treburile sale personale.","english":"Bob told Jane not to interfere in his personal affairs.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13612966","romanian":"Am crezut că vrei să mănânci la acel restaurant chinezesc de pe Park Street.","english":"I thought you wanted to eat at that Chinese restaurant on Park Street.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2568509","romanian":"Când trimiteți o telegramă, concizia este esențială, deoarece veți fi taxat pentru fiecare cuvânt.","english":"When you send a telegram, brevity is essential because you will be charged for every word.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5233189","romanian":"Ai vreo idee la ce oră va ajunge Tom acasă?","english":"Do you have any idea what time Tom will come home?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6795174","romanian":"Muncitorii din țările nordice au plătit un preț ridicat pentru mutarea producției în regiunile sudice.","english":"The workers of the northern countries have paid a high price for the displacement of production in the southern regions.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-714064","romanian":"Julio se leagănă in hamacul pe care l-am atârnat sub bătrânul stejar.","english":"Julio is swinging in the hammock that I hung under the old oak tree.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469770"},{"id":"tat-10452012","romanian":"Actualul imn național al Georgiei a fost acceptat în 2004, când Saakashvili a ajuns la putere.","english":"The current national anthem of Georgia was accepted in 2004, when Saakashvili came to power.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9839369","romanian":"După ce și-a dat jos ochelarii și și-a desfăcut părul, Mary arăta ca o persoană complet diferită.","english":"After removing her glasses and untying her hair, Mary looked like a completely different person.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-237","romanian":"Etica responsabilitatii ne cere sa anticipam consecintele actiunilor noastre asupra generatiilor viitoare.","english":"The ethics of responsibility requires us to anticipate the consequences of our actions on future generations.","difficulty":10,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6637595","romanian":"Din punctul de vedere al designului arhitectural, pot exista mai multe alternative cu privire la această abordare.","english":"From the standpoint of architectural design, there can be more alternatives to this approach.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-8762560","romanian":"Când vecinii ei au fost bolnavi, ea a rugat un medic să le dea niște medicamente.","english":"When her neighbours were ill, she asked a doctor to give them some medicine.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":204,"excerpt":"Era odată un împărat puternic şi mare şi avea pe lângă palaturile sale o grădină frumoasă, bogată de flori şi meşteşugită nevoie mare! Aşa grădină nu se mai văzuse până atunci, p-acolo."},{"id":"story-testament","title":"Testament","author":"Tudor Arghezi","difficulty":7,"genre":"poetry","wordCount":130,"excerpt":"Nu-Loss'nti voi lasa drept mostenire, fiule, Nici ogoare largi, nici case inalte, Ci doar un nume curat si-Loss'n suflet Cuvinte multe, frumoase si sfinte. Cartea pe care o scriu e toata viata mea, Fiecare litera e o suferinta, Fiecare pagina e o bucurie, Si fiecare rand e o nadejde."},{"id":"story-ro-rodul-tainic-2","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Împăratul nu credea aşa ceva şi l-a chemat pe Danciu la sine. – N-o să fii nici tu în stare să te urci, i-a zis, şi să ştii că, dacă nu te vei putea urca, dau poruncă să-ţi taie capul."},{"id":"story-ro-poveste-r-neasc","title":"Poveste ţărănească","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":252,"excerpt":"A fost odată un împărat. El avea trei feciori. Când fu la ceasul morţii, îşi chemă feciorii şi le zise: Poveşti de Petre Ispirescu - Poveste ţărănească – Feţii mei, sunt cu sufletul la gură, precum mă vedeţi; un lucru numai vă cei: în cele trei nopţi după înmormântarea mea, să-mi păziţi mormântul, câte unul din voi."},{"id":"story-ro-frumoasa-lumii-2","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":211,"excerpt":"Alungând-o el prin copac, ea se vârâ-ntr-o bortă… ş-o prinde. El n-a mai stătut către noapte, că s-a temut de draci, ci a luat pasărea ş-a venit acasă ş-a făcut o cuşcă bună ş-a pus pasărea-n cuşcă. Acu el în ziua ceea, era sâmbătă, care-o prins-o, şi duminică dimineaţa s-a ouat un ou. Oul era de aur."},{"id":"story-ro-limir-mp-rat-3","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":212,"excerpt":"– Mergi – îi zise dar – copila mea, şi nici spine, nici buruiană în cale să nu-ţi găseşti."},{"id":"story-ro-cele-trei-rodii-aurite-2","title":"Cele trei rodii aurite","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":217,"excerpt":"Un an de zile trecuse de când călătorea; ajunsese prin pustietăţi nelocuite de oameni, şi tot rătăcind în sus şi în jos, două rânduri de haine se rupseră şi le lepădase. Neştiind ce să facă, hotărî a mai merge câtva, şi dacă nu va putea descoperi nimic, să se întoarcă."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
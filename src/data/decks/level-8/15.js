@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-210","romanian":"Istoria ne invata ca nimic nu este permanent.","english":"History teaches us that nothing is permanent.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-6981787","romanian":"El putea să vadă că regele lui va primi șah-mat în cinci mutări.","english":"He could see that his king would be checkmated within five moves.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138114","romanian":"Nu trebuie să citești o asemenea revistă pentru că îți va face rău.","english":"You must not read such a magazine, as it will do you harm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6701448","romanian":"Cel mai mare cusur al rasei umane este incapacitatea noastră de a înțelege funcția exponențială.","english":"The greatest shortcoming of the human race is our inability to understand the exponential function.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143196","romanian":"Ne-am înțeles să ne abținem de la fumat cât suntem la lucru.","english":"We agreed to refrain from smoking while we are at work.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069326"},{"id":"tat-407952","romanian":"Imediat ce îi contactați pe prietenii dumneavoastră, spuneți-le că se apropie o avalanșă.","english":"As soon as you contact your friends, tell them that an avalanche is coming.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525177"},{"id":"tat-2534227","romanian":"Terapeutul l-a făcut în sfârșit să vorbească despre cele prin care a trecut în timpul războiului.","english":"The therapist finally got him to open up about what he went through during the war.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568478","romanian":"Am dormit un pic în timpul pauzei de prânz pentru că eram foarte obosit.","english":"I slept a little during lunch break because I was so tired.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4961201","romanian":"Fii atent: în limba engleză scriem cu litere mari naționalitățile, zilele săptămânii și limbile străine.","english":"Be careful: We capitalize nationalities, days of the week, and languages in English.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11651384","romanian":"Limba română este mai puțin asemănătoare cu portugheza, spaniola, italiana și franceza decât am crezut.","english":"Romanian is less similar to Portuguese, Spanish, Italian, and French than I thought.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2837196","romanian":"Arată-mi faţa ta şi lasă-mă să-ţi aud glasul, căci glasul tău este dulce, iar faţa ta este încântătoare!","english":"Shew me thy face, let thy voice sound in my ears: for thy voice is sweet, and thy face comely.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1136703","romanian":"Senatul a hotărât să fie ales un nou consul şi țara să fie eliberată de inamici.","english":"The Senate decreed that a new consul be chosen and the country be delivered from the enemies.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212781"},{"id":"tat-2568483","romanian":"E mai ușor să te dai la oameni pe Internet decât pe stradă.","english":"It is easier to hit on people on the Internet than in the street.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136830","romanian":"Persoanele care călătoresc în străinătate trebuie întotdeauna să se obișnuiască cu mâncăruri noi.","english":"People traveling abroad always have to get used to new food.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966321"},{"id":"tat-2536729","romanian":"Să faci calcule este singurul mod social acceptabil de a te masturba în public.","english":"Doing math is the only socially acceptable way to masturbate in public.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136683","romanian":"În general, profesorul controlează clasa stând în picioare în fața elevilor și făcându-le morală în timpul lecției.","english":"The teacher controls the class, usually standing in front of the students and lecturing to them during the lesson.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7217517"},{"id":"tat-240","romanian":"Epistemologia contemporana pune sub semnul intrebarii pretentia la cunoastere obiectiva absoluta.","english":"Contemporary epistemology questions the claim to absolute objective knowledge.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12058655","romanian":"Zonele umede adăpostesc o gamă largă de specii de plante, printre care coada-șoricelului, stufărișurile și nuferi.","english":"Wetlands are home to a vast array of plant species, including cattails, reeds, and water lilies.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-gura-satului-3","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"zice una. — Cine altul decât Toderică, îi răspunde alta. — Toderică? Așa umblă gura satului. Nici să visezi din ce scornește o poveste. Pentru ca să vorbim drept, Toderică e Toader, ba chiar Tudoroiu. Lasă că avea din cine să iasă fiindcă și tatăl său, Cosma Florii Cazacului, seamănă cu dânsul."},{"id":"story-ro-limir-mp-rat-2","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":203,"excerpt":"Când se scula, văduva stetea mai bucuros afară decât în casă, şi Lia ridica gunoiul din prag, îl ducea la locul lui, apoi intra ca să dereticească prin colibă, cântând voioasă, şi oglindă luminoasă se făcea toate sub mâna ei, încât, împărat de-ai fi fost, ţi-ai fi părăsit palatele ca să stai în coliba văduvei."},{"id":"story-ro-stan-bolovan-3","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"Aflând Stan că anul e de trei zile, iar simbria de şapte saci de galbeni pe zi, se învoi şi plecă cu zmeul. Ajunseră nu departe de casă, iar Stan o zări pe mama zmeului, bătrână şi groaznică la vedere."},{"id":"story-ro-sorcova-3","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":241,"excerpt":"II Zăpada îi pătrunsese în tindă; vântul îi cânta prin crăpăturile uşii parc-ar fi vuit în duba mare; şi Bălaşa era întinsă în pat, învelită c-o plapumă veche, soioasă şi ciuruită cu găuri prin care ieşeau gheomotoacele de lână neagră. Pe picioare îşi trântise două scovergi."},{"id":"story-ro-ileana-simziana","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":218,"excerpt":"A fost odată un împărat. Acel împărat mare şi puternic bătuse pe toţi împăraţii de prinpregiurul lui şi-i supusese, încât îşi întinsese hotarele împărăţiei sale pe unde a înţărcat dracul copiii, şi toţi împăraţii cei bătuţi era îndatoraţi a-i da câte un fiu d-ai săi ca să-i slujească câte zece ani."},{"id":"story-ro-uer-2","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":215,"excerpt":"Kira şi-aşteaptă voinicul din haiducie. În coarne de cerb atârnă carabine cu guri largi şi pistoale cu plăsele de argint şi de sidef. Văpaiţa, cu feştilă de câlţi răsuciţi, tremură în colibă o lumină galbenă şi tristă. Flacăra ei slabă joacă, ca şi când ar voi să scape din feştilă, şi aruncă umbra Kirei, de pe perete, sus, pe grinzi."},{"id":"story-ro-pravoslavnicul-i-sl-ninile-3","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"Şi ei abia se potriviseră, spate în spate, cu nasul în velinţele zdrenţuite. Văzând cucernicul bătrân că dorm cu toţii ca nişte bolovani de piatră, începu şi hâţ în dreapta, hâţ în stânga, până descuie uşa omului."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
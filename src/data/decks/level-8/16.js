@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-8817097","romanian":"Dacă ai probleme, te voi ajuta să studiezi limba engleză.","english":"If you are having problems, I will help you study English.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-202","romanian":"Cultura romaneasca are radacini adanci in traditiile populare.","english":"Romanian culture has deep roots in folk traditions.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-4987451","romanian":"Noi credem că este cu adevărat posibil ca cele două sisteme sociale diferite să coexiste în pace.","english":"We believe that peaceful coexistence of the two different social systems is fully possible.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-708998","romanian":"Noaptea a fost atât de rece încât, atunci când m-am întors, eram aproape îngheţat.","english":"The night was so chilly that when I returned I was almost frozen.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420255"},{"id":"tat-1192848","romanian":"Se face din ce în ce mai frig dimineața și seara. Frunzele copacilor vor deveni în curând roșii și galbene.","english":"It is getting colder and colder morning and evening. The leaves of trees will soon turn red or yellow.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361557"},{"id":"tat-6599793","romanian":"Ți-ar plăcea să vezi cu mine sâmbătă o interpretare live a unei piese?","english":"Would you like to see a live performance of a play with me Saturday?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7192267","romanian":"El nu era omul care să se lase descurajat de un singur eșec.","english":"He was not a man to be disheartened by a single failure.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12336953","romanian":"Mi-aș dori să pot vorbi franceza destul de bine pentru a obține o slujbă la acea companie.","english":"I wish I could speak French well enough to get a job at that company.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-235","romanian":"Dialectica dintre traditie si modernitate defineste in mare masura discursul cultural romanesc actual.","english":"The dialectic between tradition and modernity largely defines current Romanian cultural discourse.","difficulty":10,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-11658423","romanian":"Majoritatea zmeurii sunt roșii, dar există și zmeură albă, galbenă și chiar violetă.","english":"Most raspberries are red, but there are also white, yellow, and even purple raspberries.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6581888","romanian":"Ar fi trebuit să fii mai atent și să nu te încrezi în el.","english":"You should have known better than to trust him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1163897","romanian":"Ce amabil din partea lui să ne ajute să ne mutăm într-o zi atât de ploioasă!","english":"How kind of him to help us move on such a rainy day!","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196806"},{"id":"tat-13619031","romanian":"Dumneavoastră nu sunteți o picătură în ocean, ci sunteți întregul ocean într-o picătură.","english":"You are not a drop in the ocean, you are the entire ocean in a drop.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11270397","romanian":"Mi se pare că am uitat că să închid lumina.","english":"I think that I forgot to turn off the lights.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-864483","romanian":"Fiecare este o lună, și are o parte întunecată pe care nu o arată nimănui niciodată.","english":"Everyone is a moon, and has a dark side which he never shows to anybody.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6827316"},{"id":"tat-1136436","romanian":"Adevărul arde și distruge toate elementele, arătând că acestea îi sunt doar umbră.","english":"Truth burns and destroys all elements, showing that they are merely its shadow.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965909"},{"id":"tat-5226266","romanian":"Tom s-a comportat ca și cum ar fi fost fericit, dar în interior era supărat.","english":"Tom acted happy, but deep inside he was sad.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4993454","romanian":"O persoană având indicele de masă corporală de la 25 la 29 e considerată supraponderală.","english":"A person with a BMI of 25 to 29 is considered overweight.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-f-t-frumos-din-lacrim-2","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":213,"excerpt":"Lungi cearcăne vinete se trăgeau împrejurul ochilor, şi vine albastre se trăgeau pe faţa ei albă ca o marmură vie. Sculată din patul ei, ea se aruncă pe treptele de piatră a unei bolte în zid, în care veghea, deasupra unei candele fumegânde, icoana îmbrăcată în argint a Maicii durerilor."},{"id":"story-ro-la-crucea-din-sat-2","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Un nou hohot îl trezește și pe el din astă nepăsare. Ileana a făcut o cunună de pene cu coada dindărăt și a pus-o pe nesimțite în capul lui Bujor. Bujor a simțit, dar se face a nu fi simțit, fiindcă-i place să vadă pe Ileana râzând. Toți râd cu hohot, râde mai ales Ileana."},{"id":"story-ro-c-lin-nebunul","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":210,"excerpt":"Era odat-un împărat ş-avea trei fete şi erau aşa de frumoase, de la soare te puteai uita, da la dânsele ba. Acu, cele două erau cum erau, da cea mijlocie nici se mai povesteşte frumuseţea ei. Acu câţi feciori de-mpăraţi şi de ghinărari au cerut-o, împăratul n-a vrut să le-o deie."},{"id":"story-ro-la-crucea-din-sat","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":224,"excerpt":"Naica Floare n-are vreme. Cuptorul este ars și plăcinta nu e încă întinsă. Multă grabă nu-i prea bună: Marta ar fi trebuit să mai aștepte cu cuptorul. Ea însă umblă cu gândul tot pe la cei din casă; abia apucă să se vadă și ea la masă cu scărmănătorii de pene. Sunt prea veseli: îi aude râzând în casă."},{"id":"story-ro-popa-tanda-2","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"Minunat om ar fi părintele Trandafir dacă nu l-ar strica un lucru. Este cam greu la vorbă, cam aspru la judecată: prea de-a dreptul, prea verde-fățiș. El nu mai sucește vorba, ci spune drept în față, dacă i s-a pus ceva pe inimă. Nu e bine să fie omul așa. Oamenii se prea supără când le luăm căciula din cap."},{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."},{"id":"story-ro-comoara-3","title":"Comoara","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"- Dar Ghiță ce face? Întrebă iar Duțu, zâmbind pe sub mustață. - E bine și el! răspunse Ana, care nu înțelegea nici acum batjocura. Au înțeles-o însă vecinii, și peste puțin, așa-i răutatea omenească, sătenii nu-i mai ziceau lui Ghiță, ca mai nainte, Ghiță al Popii, ci Ghiță al Boilor."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-1136899","romanian":"Sora mea va trebui să își termine temele înainte de a pleca la Hokkaido.","english":"My sister will have finished her homework before she goes to Hokkaido.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960229"},{"id":"tat-1185121","romanian":"Won-ul este folosit atât în Coreea de Nord, cât și în Coreea de Sud. Simbolul său este \"₩\".","english":"Won is used in both North Korea and South Korea. Its symbol is \"₩\".","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323802"},{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6582958","romanian":"Tom nu avea nici o idee despre ce ar fi trebuit să se facă.","english":"Tom had no idea what needed to be done.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5236279","romanian":"L-am întrebat pe Tom dacă el o poate avea gata până la 2:30.","english":"I asked Tom if he could have it ready by 2:30.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1291046","romanian":"Dansatoarele par fragile în rochiile lor albe, dar în realitate sunt foarte puternice.","english":"The dancers look delicate in their white dresses, but they are really as strong as horses.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7115229","romanian":"Dacă se va legaliza vânzarea de organe, atunci eventuale probleme de sănătate pot să apară.","english":"If the sale of organs is legalised, potential health problems may arise.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11740023","romanian":"Când traduceți, este necesar să aveți toată rigoarea și niciun respect pentru original.","english":"When translating, one must have all the rigor and no respect for the original.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192775","romanian":"Majoritatea oamenilor spun că cel mai bun mod de a învăţa o limbă străină este să o înveți de la un vorbitor nativ.","english":"Most people say that the best way to learn a foreign language is to learn from a native speaker.","difficulty":9,"wordCount":23,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364285"},{"id":"tat-2536438","romanian":"Acesta va fi un bun suvenir din călătoria mea în jurul Statelor Unite.","english":"This will be a good souvenir of my trip around the United States.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5316056","romanian":"Cel mai periculos lucru pe care Tom l-a făcut vreodată a fost săritura cu coarda elastică.","english":"The most dangerous thing Tom ever tried to do was bungee jumping.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536654","romanian":"Majoritatea descoperirilor științifice nu e altceva decât descoperirea a ceea ce este evident.","english":"Most scientific breakthroughs are nothing else than the discovery of the obvious.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8746440","romanian":"Anglia și Scoția au fost unificate la 1 mai 1707, pentru a forma Regatul Marii Britanii.","english":"England and Scotland were unified on May 1, 1707, to form the Kingdom of Great Britain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6582845","romanian":"Cei mai mulți dintre țăranii care locuiesc în acest sat uitat-de-lume sunt analfabeți.","english":"Most of the peasants living in this godforsaken village are illiterate.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536451","romanian":"Ar fi distractiv să vezi cum se schimbă lucrurile de-a lungul anilor.","english":"It would be fun to see how things change over the years.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-501535","romanian":"Cel care, mai ieri, socotea că îndrumă, conduce — se pomenește dintr-o dată întins țeapăn într-o cutie de lemn, iar cei din jur, dându-și seama că nu mai e bun de nimic, îl ard într-un cuptor.","english":"The one that just yesterday said he was guiding and leading finds himself, out of the blue, lying stiff in a wooden box; the others, after realising that he was worthless, burnt him in a furnace.","difficulty":10,"wordCount":36,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4685148"},{"id":"tat-2534180","romanian":"Isadora Duncan a dansat cu atâta grație încât a fost invitată să danseze în Europa.","english":"Isadora Duncan danced with such grace that she was invited to dance in Europe.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13063081","romanian":"Puii au evoluat din alte păsări care au depus ouă, așa că oul a fost primul.","english":"Chickens evolved from other birds that laid eggs, so the egg came first.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-4994597","romanian":"Teroriștii au promis că eliberează ostaticul dacă președintele poate să stea într-un picior preț de un minut.","english":"The terrorists promised to release the hostage if the president is able to stand on one leg for a minute.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-ro-p-cal-n-satul-lui-3","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Vedeau parcă cele şapte viţeluşe cum se fac viţele, juninci, cum ajung în cele din urmă vaci şi ele, şi cum le vinde Păcală şi pe ele şi se întoarce de la târg cu o spuză de viţeluşe, toate flămânde, toate pornite din fire să se facă viţele, juninci şi vaci în cele din urmă. – Măi!"},{"id":"story-ro-ileana-cea-ireat-3","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acuma fata de împărat se apropie de fereastră şi grăi cu glas blând: – Ţi-am zis să mergi pe calea pe care ai venit: spini să-ţi crească-n cale şi flori să-ţi rămână pe urmă. Încă trei zile şi trei nopţi stete feciorul de împărat la fereastra fetei."},{"id":"story-ro-p-dureanca-2","title":"Pădureanca","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Simțind apropierea timpului de secere, pădurile se pun în mișcare colibă cu colibă, sat cu sat se adună, văile pornesc întregi spre câmpia întinsă, și în câteva zile cât ține locul din Mureș până în părțile Orăzii și până la izvoarele Crișurilor nu mai rămân prin sate decât moșnegii neputincioși, babele bătrâne și copiii nevârstnici; setea de viață îi ia și-i duce pe toți la sărbătoarea cea mare ce se ține în fieștecare an o dată pentru împărțirea pânei de toate zilele."},{"id":"story-ro-limir-mp-rat","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"A fost ce-a fost… a fost odată o văduvă care avea o fată, Lia, şi văduva era săracă de nu mai ştia cum să-şi înnoade zdrenţele, iar Lia, fata ei, se făcuse harnică de creşteau flori pe unde-i călca piciorul şi da muguri lemnul uscat când ea punea mâna pe el."},{"id":"story-ro-borta-v-ntului-2","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":213,"excerpt":"– Mă duceam s’ astup borta vântului ş’ am întâlnit un nebun pe drum şi mi-o dat o nucă şi-a zis să nu zic pân’ a casă nucă, deschide-te. Ce-a mai fi şi asta? Femeia omului vicleană. Ia o nucă ‘n mână şi zice: – Ia să-ţi văd nuca. Îi schimbă nuca omului."},{"id":"story-ro-spaima-zmeilor-2","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":212,"excerpt":"Petre. Oamenii aceştia sunt adevărată pacoste pe capul meu. Mi s-a înăcrit cu ei! – De ce, sfinte Doamne? întrebă portarul raiului. – Nu vezi, răspunse Tatăl Ceresc, că sunt nesăţioşi?! Tot le-am dat, şi nu se mai mulţumesc."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
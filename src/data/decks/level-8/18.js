@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-13616959","romanian":"Tu poți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-5131142","romanian":"În clipa în care l-am văzut, am știut că e supărat pe mine.","english":"The moment I saw him, I knew he was angry with me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6673370","romanian":"Este posibil să crezi că, comentariul tău a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9028832","romanian":"Tom provenea dintr-un mediu umil, dar a devenit unul dintre cei mai bogați oameni din țară.","english":"Tom was from a humble background, but he became one of the richest men in the country.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-212","romanian":"Rezultatele cercetarii au demonstrat ca teoria initiala era corecta.","english":"The research results demonstrated that the initial theory was correct.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-5158943","romanian":"Ceea ce îi este permis lui Jupiter nu este în mod necesar permis și unui bou.","english":"All that is allowed to Jupiter is not necessarily allowed to an ox.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6908965","romanian":"Tom ar trebuie să mai iasă și să se distreze.","english":"Tom should go out and have some fun.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-1136617","romanian":"Cine va fi responsabil de clasa noastră când domnișoara Smith va părăsi şcoala?","english":"Who will be in charge of our class when Miss Smith leaves school?","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965929"},{"id":"tat-1138098","romanian":"Cu siguranță se poate spune că este cel mai mare pianist al secolului douăzeci.","english":"It may safely be said that he is the greatest pianist of the twentieth century.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-583874","romanian":"Motivul principal pentru care prietenii își părăsesc prietenii pe Facebook e din cauza prea multor postări inutile.","english":"The number one reason why friends dump their friends on Facebook is too many useless posts.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/954288"},{"id":"tat-5185437","romanian":"În timpul Evului Mediu, onoarea era de bază pentru viața omului liber și a creștinului.","english":"During the Middle Ages, honor was fundamental to the life of the free man and of the Christian man.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6871781","romanian":"Acea persoană m-a întrebat cine sunt, dar nu am considerat necesar să îi răspund.","english":"That person asked me who I was, but I did not deem it necessary to answer him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10744389","romanian":"Am vrut să mă duc acasă și să iau cina cu soția mea.","english":"I wanted to go home and eat dinner with my wife.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1142926","romanian":"Acum, vom arăta cum această lemă poate fi folosită în demonstrarea teoremei principale.","english":"Now, we show how this lemma can be used to prove our main theorem.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066559"},{"id":"tat-584199","romanian":"Într-un articol recent despre activităţi care să-ţi antreneze mintea, se menţionează Esperanto precum şi Sudoku, ceea ce denotă ca Esperanto devine parte a culturii de masă.","english":"In a recent article about activities to keep your brain young, they mention Esperanto along with Sudoku, which shows that Esperanto is becoming part of popular culture.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803575"},{"id":"tat-4303252","romanian":"Noi priveam pasărea mâncând firimiturile; apoi am strănutat, și ea a dispărut într-o clipă.","english":"We were watching the bird eat the crumbs; then I sneezed, and he was gone in a flash.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-487040","romanian":"Noi am trăit în Osaka timp de zece ani înainte de a ne muta in Tokyo.","english":"We had lived in Osaka for ten years before we came to Tokyo.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435976"},{"id":"tat-5157262","romanian":"Un om egoist nu se gândește la nimic altceva decât la propriile sale sentimente.","english":"A selfish man thinks of nothing but his own feelings.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":208,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti. A fost odată un împărat. Împăratul acesta stăpânea o lume întreagă, şi în lumea asta era un păcurar bătrân şi o păcurăriţă, care aveau trei fete: Ana, Stana şi Lăptiţa."},{"id":"story-ro-moara-cu-noroc-2","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"Iacă liniștea colibei. — Nu zic, grăi soacra așezată."},{"id":"story-ro-broasca-estoas-cea-fermecat-2","title":"Broasca ţestoasă cea fermecată","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":230,"excerpt":"Luă şi dânsul nişte haine, numai să nu zică nescine că nu s-a gătit, şi de cheltuială ce pe apă nu curge, şi plecă şi el, ştii, cam în dorul lelii. Dară unde să se ducă? Nici el, iacă, nu ştia."},{"id":"story-ro-ileana-simziana-3","title":"Ileana Simziana","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"– Oricum, tată, spune-ne şi nouă, că doară nu s-o face gaură în cer, dacă vom şti şi noi ce lucru te amăraşte. Dacă văzu împăratul că-l înteţesc fetele cu rugăciunile, zise: – Iată, copilele mele de ce sunt tot trist."},{"id":"story-ro-scormon-2","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Îi mai place afară la uliță. Nu pentru că ar fi trecători, dar afară cântecul vine mai bine. E cald, dar deprinsă e fata la ger și la arșiță. Cu brațele goale, cu poalele aninate în brâu și cu ștergarul în cap, ea nici nu simte vremea lui cuptor; cântă, întinde firul, descurcă jirebia și se pierde în tinerețile ei."},{"id":"story-ro-balaurul-cel-cu-apte-capete-2","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Cu aceşti voinici se întovărăşi şi un om verde, pui de român, ştii colea, care auzise de făgăduinţa împăratului şi venise să-şi încerce şi el norocul. Porniră, deci, cu toţii, îşi aleseră un loc aproape de groapă şi se puseră la pândă. Pândiră o zi, pândiră două, pândiră mai multe zile, şi nu se întâmplă nimic."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-10450497","romanian":"Am mers la supermarket și am cumpărat niște cireșe fiindcă erau la reducere.","english":"I went to the supermarket and bought some cherries because they were on sale.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8921739","romanian":"Niciun viitor nu poate compensa ceea ce lăsați să se întâmple în prezent.","english":"No future can compensate for what you let happen in the present.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12517381","romanian":"Igor a descoperit o urmă de bocanc în niște noroi moale, nu departe de cortul său.","english":"Igor discovered a bootprint in some soft dirt not far from his tent.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5226154","romanian":"Tom și-a abandonat mașina, care a rămas fără benzină, și a început să meargă pe jos.","english":"Tom abandoned his car that had run out of gasoline and started walking.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-3877969","romanian":"Corpul uman obișnuit conține îndeajuns de multe oase încât să compună un întreg schelet uman.","english":"The average human body contains enough bones to make an entire human skeleton.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11622790","romanian":"Ieri l-am cunoscut pe unul dintre cei mai mari actori ai generației noastre.","english":"Yesterday I met one of the greatest actors of our generation.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6538116","romanian":"Chiar aș vrea să te ajut, dar am mâinile legate.","english":"I would really like to help you, but my hands are tied.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-4694533","romanian":"Lunile anului sunt: ianuarie, februarie, martie, aprilie, mai, iunie, iulie, august, septembrie, octombrie, noiembrie, decembrie.","english":"The months of the year are: January, February, March, April, May, June, July, August, September, October, November, December.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1144346","romanian":"În timp ce în metafizică cea mai simplă cale este să condamne toate metafizicile ca fiind nonsens, cea mai simplă cale în morală este să înalţi practica comună la moralul absolut.","english":"While the easiest way in metaphysics is to condemn all metaphysics as nonsense, the easiest way in morals is to elevate the common practice of the community into a moral absolute.","difficulty":10,"wordCount":31,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073854"},{"id":"tat-7726661","romanian":"Dacă n-ar fi fost zăpadă, am fi putut să ne urcăm pe munte.","english":"If it were not for the snow, we could climb the mountain.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7115211","romanian":"Tom era în stare să vadă că o potențială situație periculoasă se putea ivi.","english":"Tom could see that a potentially dangerous situation could arise.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13619295","romanian":"Tom a trecut cuțitul peste piatra de ascuțit până când a devenit ascuțit ca briciul.","english":"Tom slid the knife across the whetstone until it was razor-sharp.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4974910","romanian":"Ieri nu a fost nici prea cald, nici prea rece. A fost o zi ideală pentru o plimbare.","english":"Yesterday it was neither too warm nor too cold. It was an ideal day for taking a walk.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-227","romanian":"Conceptul de libertate individuala a evoluat semnificativ de-a lungul istoriei.","english":"The concept of individual freedom has evolved significantly throughout history.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-11475333","romanian":"Ai putea avea te rog grijă de câinele meu mâine?","english":"Would you please look after my dog tomorrow?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13598708","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singură.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-705785","romanian":"În zilele de azi nu este neobișnuit pentru o femeie sa călătorească singură.","english":"Nowadays it is not unusual for a woman to travel alone.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963109"},{"id":"tat-1153159","romanian":"Bunicul meu a adunat o avere mare pe piaţa stocurilor şi apoi a pierdut-o în întregime peste noapte.","english":"My grandfather amassed a great fortune in the stock market and then lost it all over night.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1751960"},{"id":"tat-12111968","romanian":"Dacă măslinii ar cunoaște mâinile care i-au plantat, uleiul lor ar deveni lacrimi.","english":"If olive trees knew the hands that planted them, their oil would become tears.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-luceafarul","title":"Luceafarul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":140,"excerpt":"A fost odata ca-n povesti, A fost ca niciodata, Din rude mari imparatesti, O prea frumoasa fata. Si era una la parinti Si mindra-n toate cele, Cum e Fecioara intre sfinti Si luna intre stele. Din umbra falnicelor bolti Ea pasul si-l indreapta Linga fereastra, unde-Loss'n colti Luceste alba noapte."},{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-bunicul-2","title":"Bunicul","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":202,"excerpt":"– Da. – Tată-moşule, aş vrea să-mi crească şi mie aripi şi să zbor sus de tot, până în slava cerului, zise băiatul netezindu-i barba. – Dacă ţi-o creşte ţie aripi, zise fata, mie să-mi prinzi o presură şi un sticlete. – Da… hî… hî… poi ce fel… şi mie? Fata se întristă."},{"id":"story-ro-p-dureanca","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":214,"excerpt":"Fă trei cruci și zi „Doamne-ajută!” când treci pragul casei, fie ca să ieși, fie ca să intri, căci lumea din întâmplări se alcătuiește, iar întâmplarea e noroc ori nenorocire, și nimeni nu știe dacă e rău ori bun ceasul în care a pornit, nici dacă va face ori nu ceea ce-și pune de gând."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"A fost odată într-o pustie mare un pustnic, şi petrecea singur singurel. Vecinii săi erau fiarele pădurilor. Şi aşa era de bun la Dumnezeu, încât toate dobitoacele i se închinau, când se întâlneau cu dânsul."},{"id":"story-ro-fata-mo-ului-cea-cuminte-3","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"– Om bun, răspunse fata. După ce intră, fiindu-i frică de mumă-sa vitregă să nu o bată dacă se va întoarce acasă, pentru că întârziase, întrebă dacă nu cumva are trebuinţă de o slujnică. Sânta Vinerea, care locuia înăuntru şi care priimi pe fată, îi răspunse că are trebuinţă de o asemenea fată; ea rămase acolo."},{"id":"story-ro-neghini","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":203,"excerpt":"A fost odată o babă, bătrână, bătrână. Abia zărea de bătrână ce era. Şi mâinile îi umblau la ciorap, iar în gândul ei se ruga la Dumnezeu s-o dăruiască cu un copil, că n-avea decât pe unchiaşul ei."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-4995608","romanian":"Sunt mari diferențe de viteză de bandă largă și de calitate de la o țară la alta.","english":"There are big differences in broadband speed and quality from country to country.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-584098","romanian":"O traducere e ca o femeie. Dacă e frumoasă, nu e fidelă. Dacă e fidelă, nu este cu siguranţă frumoasă.","english":"Translation is like a woman. If it is beautiful, it is not faithful. If it is faithful, it is most certainly not beautiful.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7802396"},{"id":"tat-10727979","romanian":"Totul s-a întâmplat așa cum ai spus tu că se va întâmpla.","english":"Everything happened just like you said it would.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-4977405","romanian":"Acest magazin vinde îmbrăcăminte și încălțăminte atât pentru bărbați cât și pentru femei.","english":"This store sells clothes and shoes for both men and women.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-238","romanian":"Hermeneutica textelor literare clasice continua sa ofere perspective noi asupra conditiei umane.","english":"The hermeneutics of classic literary texts continues to offer new perspectives on the human condition.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-13615591","romanian":"Te poți uita în geanta ta? Mi-am pus mobilul acolo.","english":"Can you have a look in your bag? I put my mobile in there.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-610855","romanian":"La începutul fiecărui sfârşit de săptămână sunt în acelaşi timp obosit şi bucuros.","english":"At the start of every weekend, I am both tired and happy.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/684564"},{"id":"tat-705789","romanian":"Am cerut să li se permită sa plece.","english":"I demanded that they be allowed to leave.","difficulty":7,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963119"},{"id":"tat-6586236","romanian":"Tocmai i-am spus lui Mary că doream să o ajut să-și curețe garajul.","english":"I just told Mary that I wanted to help her clean the garage.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192831","romanian":"La acest centru de învățare a limbilor, se predau aproximativ 15 limbi internaționale inclusiv limba engleză.","english":"At this language centre, about 15 international languages are taught, including English.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360495"},{"id":"tat-2034608","romanian":"Precum a demonstrat din abundenţă George Bush, a fi președintele Statelor Unite necesită doar o inteligență moderată.","english":"As George Bush has amply demonstrated, being president of the U.S. requires only a modicum of intelligence.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-582948","romanian":"Democrația este cea mai proastă formă de guvernământ, cu excepția tuturor celorlalte care au fost încercate.","english":"Democracy is the worst form of government, except all the others that have been tried.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6569015"},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6614173","romanian":"Dl. și dna. Yamada se vor întoarce în țara lor de baștină luna viitoare.","english":"Mr. and Mrs. Yamada will return to their homeland next month.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6918496","romanian":"Am crezut că Tom va fi de acord cu mine.","english":"I thought Tom would agree with me.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-7192998","romanian":"Moartea prematură a soției mele, a tras cortina peste 50 de ani de mariaj fericit.","english":"The untimely death of my wife has brought down the curtain on over 50 years of happily married life.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7707602","romanian":"Ei nu mai aveau mere, așă că am cumpărat niște banane în schimb.","english":"They were all out of apples, so I bought some bananas instead.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536699","romanian":"Într-un dicționar ca acesta ar trebui să existe cel puțin două propoziții cu „frigider”.","english":"In a dictionary like this one there should be at least two sentences with \"fridge\".","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5227954","romanian":"Însoțitoarea de zbor l-a zgâlțâit pe Tom ca să-l trezească și i-a spus că avionul aterizase.","english":"The flight attendant shook Tom awake and told him that the plane had landed.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-vasilie-finul-lui-dumnezeu-3","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Băietul când s-o făcut mare o ‘ntrebat: – Mamă, unde-i tata? Ea i-a spus lui, că nu ştie cine-i. Zice: – Eu mă duc, mamă, să-l cat. – Te-i duce, dragul mamei, da dacă-i pute scoate copacul de aici din pământ. Cum a pus mâna, l-o scos cum aş scoate eu o rădăcină de morcov."},{"id":"story-ro-cele-dou-sprezece-fete-de-mp-rat-i-palatul-cel-fer-2","title":"Cele douăsprezece fete de împărat şi palatul cel fermecat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":221,"excerpt":"Pentru aceasta ele ca să arate că nu le pasă de nebăgarea lui de seamă, între ele, îl porocleau cu numele de Făt-Frumos al satului. Şi de unde să nu fie aşa!"},{"id":"story-ro-pas-rea-m-iastr-3","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":7,"genre":"folktale","wordCount":220,"excerpt":"Atunci vulpoiul făcu un semn asupra lui şi îl schimbă în stană de piatră. Văzând împăratul că fiul său cel mare nu se mai întoarce ascultă rugăciunea fiului celui mijlociu, şi îi dete voie să meargă şi dânsul. Acesta, după ce se găti şi îşi luă merinde de drum, porni şi dânsul."},{"id":"story-ro-rodul-tainic-3","title":"Rodul tainic","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Iară dânsa era Mama Vânturilor. Seara, după ce s-a întors, fiul ei a simţit miros de om pământean. – Simt boare de om, zise el mumei sale. Cine a venit şi în ce treburi umblă? Ea îi spuse ce şi cum, toate din fir a păr, precum le aflase de la Danciu."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-3","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":207,"excerpt":"Să nu te sperii, dragul tatei, leul îmi va face groapa, şi tu vei trage pământ peste mine; de moştenire n-am ce să-ţi las decât un frâu de cal. După ce vei rămânea singur, să te sui în pod, să iei frâul, să-l scuturi, şi îndată va veni un cal şi te va învăţa ce să faci."},{"id":"story-ro-ileana-cea-ireat-2","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":205,"excerpt":"Când cei trei feciori ai împăratului vecin primiră vestea că împăratul a pornit în cale şi că s-a depărtat de acasă, ei se înţeleseră între sine şi încălecară, ca să meargă la cetatea cea cu trei fete de împărat să răpească credinţa fetelor şi să-i facă împăratului supărare."},{"id":"story-ro-uer","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"La răspântia căilor singuratice, unde călătorul e minune şi glasul omului poveste, o colibă, dusă pe jumătate în pământ, stă locului neclintită. Poveşti de Barbu Ştefănescu Delavrancea - Şuer Stăpânul lumii e vântul, şi aruncă, ca în bătătură la el, clăi de nori posomorâţi peste întinsul cerului."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
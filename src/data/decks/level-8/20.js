@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-13619375","romanian":"Tom a bolborosit o scuză înainte de a se grăbi să prindă autobuzul.","english":"Tom gabbled out an apology before rushing to catch the bus.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-706018","romanian":"Dacă este adevărat că grecii le interziceau femeilor să meargă la teatru, atunci procedau corect; pentru că așa cu siguranța ar fi putut să audă ceva.","english":"If it is true that the Greeks forbade women to go to the play, they acted in a right way; for they would at any rate be able to hear something.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968848"},{"id":"tat-8863126","romanian":"Ai putea să spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-233","romanian":"Progresul autentic presupune nu doar inovatie tehnica, ci si dezvoltare morala.","english":"Authentic progress requires not just technical innovation, but also moral development.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2568515","romanian":"De fiecare dată când mă alătur unui nou joc de Warcraft, dau de o nouă echipă de adversari.","english":"Every time I join a new game of Warcraft, I am pitted against a new team of adversaries.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-7115203","romanian":"Ceea ce ne definește este modul în care ne ridicăm după ce cădem.","english":"What defines us is how well we arise after falling.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4987505","romanian":"După ce s-a despărțit de ea, Simon s-a îndepărtat fără să se uite înapoi.","english":"After splitting up with her, Simon walked away without looking back.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-203","romanian":"Cu cat inveti mai mult, cu atat realizezi cat de putin stii.","english":"The more you learn, the more you realize how little you know.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-12085392","romanian":"Se zvonea că bea, dar era dificil de dovedit pentru că bea numai singură.","english":"It was rumored that she drank, but it was hard to prove, as she only drank alone.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-224","romanian":"Dezvoltarea sustenabila trebuie sa fie prioritatea noastra principala.","english":"Sustainable development must be our main priority.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-7187074","romanian":"Aceasta este prima dată când guvernul a efectuat o anchetă la nivel național, privind sinuciderile.","english":"This is the first time the government has done a nationwide investigation regarding suicides.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1153812","romanian":"O republică este o națiune al cărei conducător nu este un rege sau o regină, ci un președinte.","english":"A republic is a nation whose head is not a king or queen, but a president.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129049"},{"id":"tat-2536493","romanian":"Hei, aș putea să nu am niciun ban, dar încă mai am mândrie.","english":"Hey, I may have no money, but I still have my pride.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13427370","romanian":"Am auzit că Tom și cu Mary se căsătoresc în octombrie.","english":"I heard that Tom and Mary will get married in October.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2536642","romanian":"Cei selecționați vor trebui să se confrunte cu teste medicale și psihologice ample.","english":"Those selected will have to face extensive medical and psychological tests.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10830414","romanian":"Au refuzat să-mi plătească salariul pentru că am uitat să completez corect formularele.","english":"They refused to pay my salary because I forgot to fill out the forms correctly.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9622587","romanian":"Atât Tom, cât și eu am vrut să mergem în Australia cu Mary.","english":"Both Tom and I wanted to go to Australia with Mary.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536426","romanian":"Cei care locuiesc în case de sticlă nu ar trebui să arunce cu pietre.","english":"Those who live in glass houses should not throw stones.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8762418","romanian":"Valurile mă aruncau fără milă dintr-o parte într-alta, în timp ce mă zbăteam să-mi țin răsuflarea.","english":"The waves were tossing me viciously to and fro as I struggled to hold my breath.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-finul-lui-dumnezeu","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste – da eu nu-s de pe când poveştile – eu sunt de mai încoace, da m-am dus într-o zi la soacră-mea ş’am găsit un sac de poveşti, şi venind a casă l-am scăpat jos şi s-o despicat sacul şi de-atunci s-o împlut lumea de poveşti ş’ am învăţat şi eu una şi ţ-o spun d-tale."},{"id":"story-ro-fata-mo-ului-cea-cuminte","title":"Fata moşului cea cuminte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"A fost odată un om bătrân care avea o fată mare, de se dusese vestea în lume de vrednicia ei. Moşneagul (unchiaşul) se căsători de a doua oară cu o babă, care avea şi ea o fată mare."},{"id":"story-ro-pravoslavnicul-i-sl-ninile","title":"Pravoslavnicul şi slăninile","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Era odată un biet creştin sărac şi c-o droaie de copii mărunţi. Toată avuţia lui era gura femeii şi a copiilor, care ţipau de fitece. Guri flămânde, şi pace bună! Poveşti de Barbu Ştefănescu Delavrancea - Pravoslavnicul şi slăninile Bietul creştin, ce făcu, ce drese, s-alese de sfântul crăciun c-un porc gras."},{"id":"story-ro-stan-bolovan-2","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":217,"excerpt":"Acolo află că un zmeu vine în fiecare noapte şi le ia câte trei oi, dar şi laptele de la şaptezeci şi şapte de oi, pe care îl ducea zmeoaicei bătrâne, să se scalde în el ca să întinerească."},{"id":"story-ro-luceaf-rul-de-ziu-i-luceaf-rul-de-noapte","title":"Luceafărul de ziuă şi luceafărul de noapte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"A fost odată un împărat şi o împărăteasă; ei nu făceau copii; umblase pe la toţi vracii şi vrăjitorii, pe la toate babele şi cititori de stele, şi toţi rămaseră de ruşine, căci n-avură ce le face."},{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"},{"id":"story-ro-gura-satului","title":"Gura satului","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Nu-i vorbă, răi sunt oamenii, încât mai răi nici n-ar putea să fie. Chiar și acela pe care toată lumea îl știe de bun își are ceasurile de răutate, și nu avem decât să-l atingem unde-l doare pentru ca să-l facem mai dârz decât alții. Dar nenea Mihu tot om bun rămâne."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
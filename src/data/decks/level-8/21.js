@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-11790112","romanian":"Dacă această echipă continuă să joace atât de prost, va fi retrogradată din nou.","english":"If this team continues to play this badly, it will be demoted again.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7187157","romanian":"Galaxia Calea Lactee este face parte dintr-un grup de aproximativ treizeci și cinci de galaxii.","english":"The Milky Way galaxy is bound in a cluster of about thirty-five galaxies.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136694","romanian":"Demis în urma unei lovituri militare în septembrie 2006, fostul prim-ministru al Thailandei s-a reîntors în țară după aproape un an și jumătate de exil.","english":"Deposed in a military coup in September 2006 and having effectively been in exile, the Former premier of Thailand Thaksin has returned after about a year and a half.","difficulty":9,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239539"},{"id":"tat-4993395","romanian":"Creșterea cererii pentru cafeaua de înaltă calitate a ajutat la mărirea prețului cafelei.","english":"Greater demand for high-quality coffee has helped drive coffee prices higher.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4184076","romanian":"Latina este una dintre puținele limbi care necesită o bună cunoaștere a gramaticii.","english":"Latin is one of the few languages that requires a good knowledge of grammar.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187071","romanian":"Ei și-au format propria asociație la nivel național, Asociația Americană a Persoanelor Pensionate.","english":"They have formed their own nationwide association, the American Association of Retired Persons.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5233192","romanian":"Crezi că Tom ar considera să se întâlnească cu sora mea mai tânără?","english":"Do you think Tom would consider dating my younger sister?","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13621513","romanian":"A doua zi dimineață, am regretat profund că am stat treaz atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4993423","romanian":"Opozanții spun că culturile modificate genetic se pot poleniza încrucișat și pot strica alte culturi.","english":"Opponents say genetically engineered crops can cross-pollinate and damage other crops.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6581957","romanian":"O parte din studenți care sunt prinși copiind la examene nici măcar nu se jenează.","english":"Some of the college students who are caught cheating on the exams do not even blush.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9263288","romanian":"Tom mi-a spus că ar fi ușor să o conving pe Mary să doneze niște bani.","english":"Tom told me it would be easy to persuade Mary to donate some money.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6638268","romanian":"Producția industrială a animalelor, este principalul factor care contribuie la sporirea gazelor cu efect de seră.","english":"The industrial production of livestock is the leading contributor to greenhouse gases.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1291063","romanian":"Ești destul de mare cât să știi cum să te comporți. Fii cuminte.","english":"You are old enough to know better. Behave yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-239","romanian":"Reconcilierea aparentelor contradictii intre determinism si libertate ramane o provocare filozofica majora.","english":"Reconciling the apparent contradictions between determinism and freedom remains a major philosophical challenge.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-12001711","romanian":"Camera era în haos. Peste tot erau împrăștiate hârtii, scaunele răsturnate, iar fereastra s-a spart.","english":"The room was in chaos. Papers were strewn everywhere, chairs were overturned, and the window was shattered.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1186853","romanian":"- 30 de dolari e mult pentru acea cameră mică, se gândi el.","english":"Thirty dollars is a lot for that small room, he thought.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338197"},{"id":"tat-13619641","romanian":"Taipanul de uscat, un șarpe întâlnit în Australia, este cel mai veninos șarpe din lume.","english":"The inland taipan, a snake found in Australia, is the most venomous snake in the world.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-923913","romanian":"Trebuie să încurajăm lumea să se alăture campaniei şi să lucreze cu noi.","english":"We have to encourage people to join the campaign and work with us.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681131"},{"id":"tat-211","romanian":"Situatia economica actuala ne obliga sa facem schimbari importante.","english":"The current economic situation forces us to make important changes.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."},{"id":"story-ro-scormon","title":"Scormon","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":222,"excerpt":"Cât e de lung gardul, de la portiță până la cotitura uliței, Sanda l-a măsurat, nici ea singură nu știe de câte ori, cu firul în mână. Jos, lângă portiță, e vârtelnița cu jirebia de tort."},{"id":"story-ro-uer-3","title":"Şuer","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Kira, zâmbind, răspunde: – Ăl de sus e umbra, mamă; din aşa caier trag ursitorile firul vieţilor de nimic. – Şi de se rupe firul tău, fusul cu tort cade; dar de s-ar rupe firul de umbră, cade şi fusul de pe grinzi?"},{"id":"story-ro-sarea-n-bucate-3","title":"Sarea în bucate","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":235,"excerpt":"Să te duci de la mine cu sarea ta cu tot! Când auzi fata cea mică a împăratului urgia tatălui său, ce cădea pe capul ei, intră în fundul pământului de mâhnire căci se supărase tată-său şi, încumetându-se, zise: – Să mă ierţi, tată, că eu n-am vrut să te supăr."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-2","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":214,"excerpt":"Făt-Voinic, feciorul de împărat. Focul cailor se stâmpără în zărirea celor trei surori şi călăreţii deteră în pas mai încetişor, până ce, veniţi şi sosiţi, se simţiră duşi."},{"id":"story-ro-borta-v-ntului-3","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Omul a doua zi se scoală, ia măgarul şi se duce – acasă şi-i zice: măgar, fa bani! Măgarul, de unde? El apuc’ un druc şi ‘ncepe a dişăla măgarul. – Acu nu-l mai iert eu. Se porneşte să ‘ntâlnească pe moşneag şi s’ astupe borta vântului. Întâlneşte pe D-zeu."},{"id":"story-ro-comoara-2","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"Iar dacă erau odată la han, nu puteau să macine-n sec: tot pe timpul cât stătuse-n oștire a luat Duțu și deprinderea de a nu-și trage, când n-are nevoie, nimic de la gură. De ce adecă muncea el toată săptămâna?!"}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-698931","romanian":"La ce oră te-ai obișnuit să te duci la culcare?","english":"What time are you used to going to bed?","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2135421"},{"id":"tat-2568508","romanian":"Formarea și mișcarea uraganelor sunt capricioase, chiar și cu tehnologia noastră de astăzi.","english":"The formation and movement of hurricanes are capricious, even with our present-day technology.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13617013","romanian":"Wisconsin este cunoscut pentru produsele sale lactate, nu pentru vacile sale de lapte.","english":"Wisconsin is known for its dairy, not for its dairy cows.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5370019","romanian":"Un intelectual este o persoană care a descoperit ceva mai interesant decât sexul.","english":"An intellectual is a person who has discovered something more interesting than sex.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6713884","romanian":"Băuturile pe bază de zahăr nu au valoare nutritivă și contribuie semnificativ la creșterea în greutate.","english":"Sugary drinks have no nutritional value and contribute significantly to weight gain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136709","romanian":"Tom a întrebat-o pe Mary cine crede ea că e cel mai probabil să câștige cursa.","english":"Tom asked Mary who she thought would be the most likely to win the race.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239741"},{"id":"tat-6673371","romanian":"Este posibil să credeți că, comentariul dumneavoastră a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-12151855","romanian":"Mi-am pierdut portofelul cu niște bani, buletinul de identitate și cardul de student.","english":"I lost my wallet with some money, my ID, and my student card.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-582914","romanian":"Dacă cineva ridică din sprânceană, poate însemna \"Vreau să fac sex cu tine\", dar și \"Ceea ce tocmai ai spus mi se pare o mare prostie.\"","english":"If you raise an eyebrow, it can mean \"I want to have sex with you\", but also \"I find that what you just said is completely idiotic.\"","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6439042"},{"id":"tat-13616964","romanian":"Voi puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13598707","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singur.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13612831","romanian":"Tom a spus că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-10313164","romanian":"Algeria ar trebui să devină cea mai sigură țară din Africa de Nord.","english":"Algeria should become the safest country in North Africa.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5205062","romanian":"Te gândești serios să urmezi o carieră ca pilot de mașini de curse?","english":"Are you seriously thinking about pursuing a career as a race car driver?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6068363","romanian":"Acești arbori cotiți sunt echilibrați cu precizie pentru motoarele cu turație ridicată și lină.","english":"These crank shafts are precision balanced for smooth high revving engines.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136817","romanian":"Dreptul apei este domeniul dreptului care se ocupă cu proprietatea, controlul și utilizarea apei ca resursă.","english":"Water law is the field of law dealing with the ownership, control, and use of water as a resource.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966559"},{"id":"tat-5044147","romanian":"Rata șomajului în Japonia a fost de 3,4 la sută în luna septembrie a anului 2015.","english":"The unemployment rate in Japan was 3.4 percent in September of 2015.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143148","romanian":"Dar un om nu este făcut pentru înfrângere. Un om poate fi distrus, dar nu învins.","english":"But a man is not made for defeat. A man can be destroyed but not defeated.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068955"},{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-706007","romanian":"Ascultându-l pe Mahler, Lyusya se gândea mereu la moarte şi la viaţa eternă.","english":"Listening to Mahler, Lyusya would always think of death and life eternal.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968825"}],"stories":[{"id":"story-ro-comoara","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":252,"excerpt":"Sănătatea! Binecuvântata de sănătate! Sănătos să fii, și ți-e destul un pumn de mălai, ca nici pe un împărat să nu te dai! Se scula Duțu cu noaptea-n cap și pleca-n cântarul cocoșilor, căci era lung drumul până la linie și ținea să se puie la lucru mai nainte de a se fi luminat de ziuă."},{"id":"story-ro-la-crucea-din-sat-3","title":"La crucea din sat","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":201,"excerpt":"– I-ai adăpat? – Asta nu se face acum; știi d-ta bine că noi adăpăm boii când se culcă găinile! – Dar caii... Bujor îi taie vorba: – Bade Mitre!"},{"id":"story-ro-fata-mo-ului-3","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":257,"excerpt":"Iacă, e un basm cu ghicitoare vorba mea şi, de vreţi, am să vi-l spun, dacă mi-o face poala căpătâi o fată frumoasă. – Mai e vorbă? Vrem, vrem! – Uite, vin’ la mine. – Ba la mine! – Ba la mine, că-ţi caut în cap!"},{"id":"story-ro-z-na-z-nelor","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":";A fost odată un împărat mare şi puternic, şi el avea trei feciori. Făcându-se mari, împăratul se gândi fel şi chipuri cum să facă să-şi însoare copiii ca să fie fericiţi. Într-o noapte, nu ştiu ce visă împăratul, că a doua zi, de mânecate, îşi chemă copiii şi se urcă cu dânşii în pălimarul unui turn ce avea în grădină."},{"id":"story-ro-gura-satului-2","title":"Gura satului","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Feciorii, fiindcă sunt doi și feciori, oricât de voinici ar fi, stau sub porunca părintească; Marta însă e una singură, adică nu mai are în casă pe nimeni deopotrivă cu dânsa. Încă pe când era în fașe, Marta avea obiceiul de a pune toată casa în mișcare."},{"id":"story-ro-balaurul-cel-cu-apte-capete","title":"Balaurul cel cu şapte capete","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":275,"excerpt":"A fost odată într-o ţară un balaur mare, nevoie de cap. El avea şapte capete, trăia într-o groapă, şi se hrănea numai cu oameni. Când ieşea el la mâncare, toată lumea fugea, se închidea în case şi sta ascunsă până ce-şi potolea foamea cu vreun drumeţ pe care îl trăgea aţa la moarte."},{"id":"story-ro-greuceanu-3","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Această izbândă o luă drept semn bun, şi Greuceanu, mergând a doua oară la împăratul, grăi cu cuvintele lui mieroase cele următoare: – Mărite doamne, să trăieşti întru mulţi ani pe luminatul scaunul acestei împărăţii."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
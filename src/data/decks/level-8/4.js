@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-209","romanian":"Comunicarea eficienta este cheia oricarei relatii de succes.","english":"Effective communication is the key to any successful relationship.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1138032","romanian":"Ar fi fost mai bine să nu te fi dus acolo.","english":"You had better not have gone there.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2568518","romanian":"Sarah a avut suficient discernământ pentru a realiza că prietenii ei încercau să-i facă o farsă.","english":"Sarah was discerning enough to realize that her friends were trying to prank her.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5252491","romanian":"Tom și Mary au fost de acord să plece de la petrecere înainte de miezul nopții.","english":"Tom and Mary agreed to leave the party before midnight.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7187127","romanian":"O galaxie este un grup de stele, praf și gaze și este susținută de către gravitație.","english":"A galaxy is a cluster of stars, dust, and gas which is held together by gravity.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5358834","romanian":"Tom a gestionat un bar mic de pe lângă Boston pentru o bună perioadă de timp.","english":"Tom managed a small bar near Boston for quite a long time.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-584323","romanian":"Dacă putem compara o limba maternă cu un copac, care s-a dezvoltat de-a lungul timpului, Esperanto poate fi comparată cu un copac artificial, care a fost creat artificial.","english":"If a natural language can be compared to a tree, which has developed during the course of time, Esperanto can be compared to a plastic tree, which was created artificially.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803499"},{"id":"tat-2536130","romanian":"America e un loc drăguț în care să fii, dacă ești aici ca să câștigi bani.","english":"America is a lovely place to be, if you are here to earn money.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12085368","romanian":"Rusia este pur și simplu casa unora dintre cele mai frumoase femei de pe planetă.","english":"Russia is simply home to some of the most beautiful women on the planet.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6582834","romanian":"Tom obișnuia să se ducă în Boston în fiecare vară când era copil.","english":"Tom used to go to Boston every summer when he was a kid.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6709926","romanian":"Tom, un milionar care a făcut avere prin propriile forțe, a trăit într-o sărăcie abjectă când era copil.","english":"Tom, a self-made millionaire, had lived in abject poverty as a child.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1153156","romanian":"M-am dus la petrecere pe prezumția că ea va fi acolo.","english":"I went to the party on the presumption that she would be there.","difficulty":7,"wordCount":11,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749169"},{"id":"tat-220","romanian":"Responsabilitatea sociala a corporatiilor devine tot mai importanta.","english":"Corporate social responsibility is becoming increasingly important.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-221","romanian":"Trebuie sa evaluam cu atentie toate optiunile inainte de a decide.","english":"We must carefully evaluate all options before deciding.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-2568506","romanian":"Un cititor viclean trebuie să fie dispus să cântărească tot ceea ce citește, inclusiv sursele anonime.","english":"An astute reader should be willing to weigh everything they read, including anonymous sources.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-709899","romanian":"Am uitat să opresc televizorul înainte de a ma duce la culcare.","english":"I forgot to turn off the TV before going to bed.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426691"},{"id":"tat-1059634","romanian":"Îmi place să merg în parc și să mă uit la copii distrându-se pe terenul de joacă.","english":"I like to go to the park and watch the children in the playground enjoying themselves.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10275429"},{"id":"tat-6838427","romanian":"Înainte de apariția antibioticelor, medicii aveau tratamente eficiente doar pentru un număr limitat de boli.","english":"Before the advent of antibiotics, physicians had effective treatments for but a handful of diseases.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-greuceanu-2","title":"Greuceanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":219,"excerpt":"Ei erau trişti, bieţii oameni, dară Greuceanu îi mângâie cu nişte vorbe aşa de dulci, încât le mai veni niţică inimă, că era şi meşter la cuvânt Greuceanu nostru. El îşi puse nădejdea în întâmplarea aceasta şi îşi zise:\"îmi voi încerca norocul."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-3","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":201,"excerpt":"Toţi cu totul zicea că aşa i-a fost orânda şi credeau că trebuie să fi căzut asupra capului lui vrun blestem de la Dumnezeu. Ajunsese omul să-şi urască zilele."},{"id":"story-ro-palatul-de-cle-tar","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":225,"excerpt":"Cam pe la începutul vremilor, până unde praştia minţii nu azvârle, se povesteşte, aşa, ca din scorneală, că omul era croit din alte foarfeci şi cioplit din altă bardă."},{"id":"story-ro-stan-bolovan","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":220,"excerpt":"Au fost odată, într-o margine de sat, un om, pe nume Stan, şi muierea lui. Ea era tristă mereu şi degeaba încerca soţul ei să afle de ce, că ea nu voia să-i spună, căci, zicea ea, avea să fie şi el trist dacă află."},{"id":"story-ro-neghini-3","title":"Neghiniţă","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":235,"excerpt":"– Bine, bine, zise acelaşi glas, văd eu că nu-ţi trebuie copii… Baba îşi luă inima în dinţi şi zise: – Ba-mi trebuie… da’ unde eşti… cine eşti? – Cine sunt? Neghiniţă, gândul lumii. De mic ce sunt, pătrund în urechile oamenilor şi-i ascult cum gândesc."},{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-2","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":211,"excerpt":"Dorinţa ce ai o să-ţi aducă întristare. – Eu nu am venit să te întreb asta, zise împăratul, ci, dacă ai ceva leacuri care să ne facă să avem copii, să-mi dai. – Am, răspunse unchiaşul; dar numai un copil o să faceţi. El o să fie Făt-Frumos şi drăgăstos, şi parte n-o să aveţi de el."},{"id":"story-ro-spaima-zmeilor-3","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":204,"excerpt":"Şi toţi erau mărunţi, care de care mai mic decât cellalt, mai sfredeluş, mai guraliv, mai drăcos şi – asta să nu uităm – mai mâncăcios şi mai hapsân. – Aoleo! zise femeia, care se bălăbănea cu ei. Ăştia-mi scot sufletul şi-mi mănâncă şi urechile. Cine m-a pus să mă tot milogesc?!"}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-11574532","romanian":"Am doi băieți născuți la patru ani distanță, în aceeași zi din februarie.","english":"I have two sons born four years apart on the same day in February.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8636611","romanian":"Am nevoie de aprobarea ta înainte de a pleca mai devreme de la lucru.","english":"I need your approval before I leave work early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9638378","romanian":"Îmi amintesc că am făcut cunoștință cu el la o petrecere anul trecut.","english":"I remember being introduced to him at a party last year.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7115226","romanian":"Când un înțelept se va ridica din nou, el cu siguranță îmi va urma spusele.","english":"When a Sage shall again arise, he will certainly follow my words.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6794408","romanian":"Creierul uman este un lucru minunat. Funcționează până în momentul în care ții un discurs.","english":"The human brain is a wondrous thing. It works until the moment you stand up to make a speech.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568442","romanian":"E nevoie de înțelepciune pentru a înțelege înțelepciunea: muzica nu înseamnă nimic dacă publicul e surd.","english":"It requires wisdom to understand wisdom: the music is nothing if the audience is deaf.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6826727","romanian":"Fericirea, am descoperit, este aproape întotdeauna o revenire dintr-o muncă grea.","english":"Happiness, I have discovered, is nearly always a rebound from hard work.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1137565","romanian":"Cu ajutorul acestei aplicații, veți putea sincroniza fotografiile și muzica între aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1144321","romanian":"Cam acum patru ani, tendonul lui Ahile a început să mă doare și mi s-a spus că e tendinită.","english":"About four years ago my Achilles tendon started to hurt and I was told it was Achilles tendonitis.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073567"},{"id":"tat-1153805","romanian":"Atleţii s-au antrenat din greu în fiecare zi pentru a fi în formă maximă la jocurile olimpice de vară.","english":"The athletes trained hard every day to be at their best for the Summer Olympics.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128898"},{"id":"tat-13621249","romanian":"Turiștii au început să bâiguie entuziasmați de îndată ce ghidul a menționat fantomele.","english":"The tourists began to gabble excitedly as soon as the guide mentioned ghosts.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11663746","romanian":"Toki Pona nu este o limbă care trebuie vorbită, ci doar care trebuie citită și scrisă.","english":"Toki Pona is not a language to be spoken, but only to be read and written.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10792151","romanian":"Dulapul este confecționat din lemn de culoare închisă și are mânere ornamentate din aur.","english":"The wardrobe is made from dark wood and has ornate gold handles.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-213","romanian":"In ciuda dificultatilor, echipa a reusit sa termine proiectul la timp.","english":"Despite the difficulties, the team managed to finish the project on time.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-232","romanian":"Intrebarea fundamentala nu este ce stim, ci cum aplicam ceea ce stim.","english":"The fundamental question is not what we know, but how we apply what we know.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-11089209","romanian":"Tom se va întoarce la Boston cu o zi mai devreme decât mine.","english":"Tom will go back to Boston one day earlier than I will.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536598","romanian":"Știi fraza „recoltăm ce semănăm”. Am semănat vânt și aceasta e furtuna mea.","english":"You know the phrase, we reap what we sow. I have sown the wind and this is my storm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-z-na-z-nelor-3","title":"Zâna zânelor","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":220,"excerpt":"Mai se suci, mai se învârti să scape de pacoste, şi nu fu nici un chip. Dacă văzu şi văzu, se hotărî şi el a se duce acasă cu saxanaua în spinare şi o luă la drum. În cale, băgă de seamă că alte şase bufniţe se ţineau după dânsul."},{"id":"story-ro-palatul-de-cle-tar-2","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Pe-aşa vremuri se zice că ar fi văcuit împăratul cu stema ruptă din soare, în cel mai frumos palat de cleştar şi peste cel mai înţelept şi mai viteaz norod. Nu era crai pe care împăratul cu stema ruptă din soare să nu-l fi domolit, că nici o oaste duşmană nu putea să-i stea împotrivă."},{"id":"story-ro-coto-man-n-zdr-vanu-2","title":"Cotoşman năzdrăvanu","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":203,"excerpt":"Când stăpâna casei făcea la ciorap, pisoiul se juca cu ghemul. Dară nu-l încurca, ferească Dumnezeu. Cum făcea el, cum dregea, se juca aşa de frumuşel, încât ghemul nici nu se desfăşura, nici nu se încurca."},{"id":"story-ro-flori-a-din-codru","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti."},{"id":"story-ro-numai-cu-vitele-se-scoate-s-r-cia-din-cas-2","title":"Numai cu vitele se scoate sărăcia din casă","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":232,"excerpt":"Se spetise bietul om muncind, şi să salte şi el ceva, te-aşi! câtuşi de cât! ferit-a sântul! Ba până într-atâta ajunsese, încât să-l împingă păcatele să se gândească ca să-şi facă seama singur, vezi că dracul n-are de lucru, el nu face biserici ori puţuri pe la răspântii."},{"id":"story-ro-finul-lui-dumnezeu-3","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":6,"genre":"poetry","wordCount":210,"excerpt":"S-o vârât sub aripa lui şi nu s-a văzut. S-aude un vuiet mare; vine pajera. Pajera era mama vântului. – Dragii mamei nu v-a mâncat! – Finul lui D-zeu ne-a scăpat. – Unde-i să-l mănânc de bucurie. – Mă rog, mamă, dacă l-ăi mânca să-l faci înapoi. – Da unde-i? – Îi la răsărit."},{"id":"story-ro-sult-nica","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sultănica D-a stânga Râului Doamnei, razna de satul Domneşti, se vede o casă, albă ca laptele, cu ferestrele încondeiate cu roşu şi albastru."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
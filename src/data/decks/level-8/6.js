@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-13621234","romanian":"Khan menționează că Hunter este dispărut fără urmă (probabil pentru că nu s-a găsit niciun corp).","english":"Khan mentions that Hunter is M.I.A. (probably because no body was found).","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568484","romanian":"Locuiesc aproape de mare, așa că am de multe ori ocazia să merg la plajă.","english":"I live near the sea, so I often get to go to the beach.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5165096","romanian":"Când vaca zboară la înălțime și boul zboară aproape de sol, probabil că este o tornadă.","english":"When the cow flies high and the ox flies low, there probably is a twister.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9813136","romanian":"O pisică este un leu în miniatură care iubește șoarecii, urăște câinii și tolerează oamenii.","english":"A cat is a miniature lion that loves mice, hates dogs and tolerates humans.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536167","romanian":"Fiecare persoană care e singură e singură pentru că se teme de alții.","english":"Every person who is alone is alone because they are afraid of others.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9586394","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosit ca să gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5131088","romanian":"Să-i dai lui un sfat e ca și cum ai vorbi cu un perete de cărămidă.","english":"Giving advice to him is like talking to a brick wall.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5078655","romanian":"Acela a fost locul unde cele două armate se vor bate din nou.","english":"That was where the two armies would fight again.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6614182","romanian":"Ozonul este o moleculă compusă din trei atomi de oxigen și apare în natură în cantități reduse.","english":"Ozone is a molecule comprised of three oxygen atoms that occurs naturally in small amounts.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-708926","romanian":"Ne-am ascuns după un tufiş pentru ca nimeni să nu ne vadă.","english":"We hid behind a bush so that no one would see us.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397998"},{"id":"tat-1143142","romanian":"Dacă studenții în ziua de azi ar avea mai mult timp liber, ar putea arăta mai mult interes pentru politică.","english":"If students today had more free time, they might show more interest in politics.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068924"},{"id":"tat-222","romanian":"Implementarea noilor politici va necesita resurse considerabile.","english":"Implementing the new policies will require considerable resources.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11657708","romanian":"Obișnuia să cumpere șoricei albi pentru ca boa constrictor-ul ei să-i ucidă și să-i mănânce.","english":"She used to buy white mice for her boa constrictor to kill and eat.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6710378","romanian":"De-a lungul timpului, acțiunea valurilor erodează stâncile și, prin urmare, le face să cadă în ocean.","english":"Over time, wave action undercuts sea cliffs and thereby causes them to fall into the ocean.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"},{"id":"tat-1288424","romanian":"Cei care folosesc furculița s-au aflat din punct de vedere istoric mereu în minoritate.","english":"Fork-users have historically been in the minority.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ion","title":"Ion","author":"Liviu Rebreanu","difficulty":6,"genre":"fiction","wordCount":165,"excerpt":"Ion era un tanar tarani din satul Pripas, din Transilvania. Desi era sarac, el visa sa aiba pamant propriu. Pentru el, pamantul era totul - mai important decat dragostea, mai important decat orice. In sat traiau doua fete: Ana, sarac ca el, pe care o iubea cu adevarat, si Florica, fiica unui gospodar bogat."},{"id":"story-ro-z-na-zorilor-2","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":210,"excerpt":"Cu totul alta era Costan: mic la statură, îndesat la făptură, cu braţul de bărbat, cu pumnul îndesat. Al treilea şi cel mai tânăr fecior al împăratului e Petru: înalt, dar subţire, mai mult fată decât fecior. Petru nu face multă vorbă: el râde şi cântă, cântă şi râde de dimineaţă până în seară."},{"id":"story-ro-rodul-tainic","title":"Rodul tainic","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"A fost odată un împărat, şi-n curtea acelui împărat se afla un pom atât de înalt, încât nimeni nu era în stare să-i vadă vârful. Pomul acesta înflorea şi dădea rod în fiecare an, dar nici împăratul, nici curtenii lui, nici vreun alt om pământean n-a apucat să vadă poamă din rodul acela."},{"id":"story-ro-fata-mo-ului-2","title":"Fata moşului","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":238,"excerpt":"– Puricele. – Eh! grăi moş Doroftei cam supărat, am să v-astup cloanţa la toate. Ghiciţi acuma, de vă taie capul, de nu, să-l tăiaţi voi pe el: Din pulpă născută, pe claie aruncată, de vultur răpită, de babă robită, la domnie-ajunsă, de ţigancă tunsă: călugăraş mă făcui. Ce să fie? Ce să fie?"},{"id":"story-ro-palatul-de-cle-tar-3","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":268,"excerpt":"Nu trecu cât ai scăpăra din amnar, şi se apropiară de împărat, cu mângâieri şi dezmierdări, odrasla lui, de trei fete, ca trei zâne, surori şi nepoate, care mai de care mai chipeşe şi mai drăgălaşe. Apoi veniră mai-marii tronului şi slugile ohavnice. Toţi cu toţi ieşiră ca dintr-o lacră, să cadă cu mătănii, doară or curma focul împăratului."},{"id":"story-ro-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"— Omul să fie mulțumit cu sărăcia sa, căci, dacă e vorba, nu bogăția, ci liniștea colibei tale te face fericit. Dar voi să faceți după cum vă trage inima, și Dumnezeu să vă ajute și să vă acopere cu aripa bunătății sale."},{"id":"story-ro-ho-u-mp-rat-2","title":"Hoţu împărat","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":238,"excerpt":"Cum auzea că în cutare cetate este câte vrun meşter mai dibaci şi că acea meserie nu se află pe la dânsul, îndată îl trimitea să înveţe şi acea meserie. Astfel umblă fiul împăratului din ţară în ţară, ca şi un pribeag, până ce învăţă toate meseriile de pre pământ."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-2536737","romanian":"Cele mai multe școli au fost concepute nu pentru a transforma societatea, ci pentru a o reproduce.","english":"Most schools were designed not to transform society, but to reproduce it.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9028817","romanian":"Se pare că pastilele pe care le-am luat mai devreme au fost eficiente.","english":"It seems that the pills I took earlier were effective.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5154335","romanian":"Mi-a plăcut plăcere să te cunosc și aștept cu nerăbdare vești de la tine.","english":"It was nice to meet you, and I look forward to hearing from you.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4961192","romanian":"Ai putea să o spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-2704846","romanian":"De dimineață până seară el nu face nimic altceva decât să se plângă.","english":"He does nothing but complain from morning till night.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536248","romanian":"Dacă aș vrea să te sperii, ți-aș spune ce am visat acum câteva săptămâni.","english":"If I wanted to scare you, I would tell you what I dreamt about a few weeks ago.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536647","romanian":"Guvernul francez a lansat un joc online care provoacă contribuabilii să echilibreze bugetul național.","english":"The French government has launched an online game that challenges taxpayers to balance the national budget.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4144674","romanian":"Dacă îmi aduc bine aminte, ai fost destul de optimist la acel moment.","english":"If I remember correctly, you were quite optimistic at that time.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-10450614","romanian":"Biletele sunt 30 de dolari pentru adulți și 15 de dolari pentru copiii de peste 4 ani.","english":"Tickets are $30 for adults and $15 for children over 4 years old.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-582926","romanian":"Există oameni atât de flămânzi în lume, încât Dumnezeu nu le poate apărea decât sub formă de pâine.","english":"There are people in the world so hungry, that God cannot appear to them except in the form of bread.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6440496"},{"id":"tat-13563110","romanian":"Cei care se căsătoresc într-o zi ploioasă vor fi fericiți pentru toată viața.","english":"Whoever gets married on a rainy day will be happy for the rest of their life.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-225","romanian":"Tehnologia digitala transforma fundamental modul in care comunicam.","english":"Digital technology is fundamentally transforming the way we communicate.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1153771","romanian":"Acel hotel parcurge într-adevăr tot drumul pentru a se asigura că oaspeții săi se simt ca acasă.","english":"That hotel really goes the extra mile to make sure their guests feel at home.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128474"},{"id":"tat-13621515","romanian":"A doua zi dimineață, am regretat profund că am stat trează atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9408703","romanian":"Tom a spus că a crezut că i se va permite lui Mary să facă asta.","english":"Tom said he thought that Mary might be allowed to do that.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-8979884","romanian":"Am convenit asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9952605","romanian":"Tom a spus că este dispus să ne împrumute trei mii de dolari.","english":"Tom said he was willing to lend us three thousand dollars.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-hagi-tudose-2","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Îşi freacă mâinile; tuşesc; îşi dreg glasul; apoi, rara-rara, cu nişte paşi lungi şi semeţi, îţi ies înainte, îţi caută prilej de vorbă, toţi cu aceleaşi cuvinte, cu aceeaşi tărăgănire de glas şi cu capul dat pe spate: – Ei, flăcăule, de pe unde?… Ce vânturi?… Pe la noi… ai?… Şi de ce?… Ce zici de biserica noastră?…"},{"id":"story-ro-pr-slea-cel-voinic-i-merele-de-aur-2","title":"Prâslea cel voinic şi merele de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":206,"excerpt":"Doresc prea mult să văz la masa mea măcar un măr din acest pom care m-a ţinut atâta sumă de bani şi de aceea, iată, mă înduplec şi te las ca să pândeşti, măcar că nu-mi vine a crede că o să izbuteşti."},{"id":"story-ro-hagi-tudose","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":229,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Hagi-Tudose Dincolo de „Crucea de piatră”, de-a stânga Şoselei Vitanului, se ridică biserica „Sfânta Troiţa”. Mândreţe de biserică. Ce zugrăveli, pe dinăuntru şi pe dinafară, cum arar se mai pomenesc numai la bisericile din vechime."},{"id":"story-ro-poveste-3","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":219,"excerpt":"De se întâlneau, ea cu el, fiecare cu focul lui, se înţelegeau din ochi, deşi abia se mai vedeau, şi cu glas uscat se luau iute la harţă, parc-ar fi fost necăjiţi unul pe altul. – Ei, ce mai ai şi astăzi? – Măria-ta ce ai? – Ce să am, ale pustii de bătrâneţi."},{"id":"story-ro-v-duvele-3","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Amândouă aveau de la răposaţi acareturi bune, aşezate cu temei, să tot ţie şi să nu mai putrezească; ceva bani cheag, ogrăzi cu pruni şi zarzări, grădini cu flori şi legume, toate ocolite cu garduri-pleturi, să nu vezi prin ele, şi umbrite cu streşini de mărăcini."},{"id":"story-ro-popa-tanda","title":"Popa Tanda","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":229,"excerpt":"Ierte-l Dumnezeu pe dascălul Pintilie! Era cântăreț vestit. Și murăturile foarte mult îi plăceau. Mai ales dacă era cam răgușit, le bea cu gălbenuș de ou și i se dregea organul, încât răsunau ferestrele când cânta Mântuiește, Doamne, norodul tău! Era dascăl în Butucani, bun sat și mare, oameni cu stare și socoteală, pomeni și ospețe de bogat."},{"id":"story-ro-f-t-frumos-cu-p-rul-de-aur-2","title":"Făt-Frumos cu părul de aur","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":215,"excerpt":"Căzu în genunche şi se rugă lui Dumnezeu, şi o! minune! deodată răsări, măre, dintr-un colţ al chiliei sale o viţă, şi numaidecât crescu şi se înălţă, până la streaşina casei."}],"recipes":[{"id":"recipe-drob","title":{"ro":"Drob de miel","en":"Lamb Haggis"},"description":{"ro":"Drobul este preparatul traditional de Paste, facut din organe de miel.","en":"Drob is the traditional Easter dish made from lamb organs."},"difficulty":6,"category":"main","ingredients":[{"ro":"organe de miel","en":"lamb organs","amount":"1 kg"},{"ro":"ceapa verde","en":"green onions","amount":"2 legaturi"},{"ro":"marar","en":"dill","amount":"1 legatura"},{"ro":"patrunjel","en":"parsley","amount":"1 legatura"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"paine alba","en":"white bread","amount":"2 felii"},{"ro":"lapte","en":"milk","amount":"100 ml"}],"steps":[{"ro":"Se fierb organele si se toaca marunt.","en":"Boil organs and chop finely."},{"ro":"Se amesteca cu ceapa, verdeata si painea inmuiata.","en":"Mix with onion, herbs and soaked bread."},{"ro":"Se adauga ouale si se amesteca bine.","en":"Add eggs and mix well."},{"ro":"Se pune in tava si se acopera cu foaie de aluat.","en":"Place in pan and cover with dough sheet."},{"ro":"Se coace la cuptor 1 ora la 180 grade.","en":"Bake in oven for 1 hour at 180 degrees."},{"ro":"Se serveste rece, feliat.","en":"Serve cold, sliced."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-12355737","romanian":"Nu știu ce motiv a fost pentru care nu mi-ai trimis o scrisoare.","english":"I do not know what reason there was why you did not send me a letter.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4989065","romanian":"De când am plecat și până m-am întors a bătut întruna la tobe.","english":"From the moment I left till I came back, he had been hitting the drum without interruption.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6867529","romanian":"Datele empirice rezultate din acest experiment, par a fi în concordanță cu ipotezele teoretice.","english":"The empirical data from this experiment seems in line with the theoretical hypotheses.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6825116","romanian":"Artistul a pictat cele mai complicate picturi murale pe peretele vechi, de piatră.","english":"The artist painted the most intricate of murals on the old stone wall.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-229","romanian":"Filozofia ne invita sa punem sub semnul intrebarii ceea ce consideram evident.","english":"Philosophy invites us to question what we consider obvious.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-7578049","romanian":"Am auzit că Tom plănuiește să se mute la Boston.","english":"I heard that Tom plans to move to Boston.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-11674204","romanian":"Prima mea profesoară se numea Iracema. Iracema este, de asemenea, numele uneia dintre surorile mele.","english":"My first teacher was called Iracema. Iracema is also the name of one of my sisters.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1144311","romanian":"A privit șirul de cocori agăţat de tavan, pe care fratele ei Masahiro l-a agățat acolo pentru ea.","english":"She looked at her flight of cranes hanging from the ceiling, which her brother Masahiro had hung there for her.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073447"},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12697576","romanian":"Ești ăla care l-ai făcut pe tom sa facă aia?","english":"Are you the one who asked Tom to do that?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-10452045","romanian":"Deși mulți grăiesc vorbe goale în fața ideii de acțiune afirmativă, în realitate, foarte puține minorități sunt angajate.","english":"Although many pay lip service to the idea of affirmative action, in reality, very few minorities get hired.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-6741797","romanian":"Dintre toți jucătorii de baseball faimoși, el se evidențiază ca fiind un geniu.","english":"Of all the famous baseball players, he stands out as a genius.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138145","romanian":"Anul trecut în Filipine, cutremurele şi valurile gigantice au produs moartea a mai mult de 6000 de oameni.","english":"Last year in the Philippines, earthquakes and tidal waves resulted in the deaths of more than 6000 people.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-487323","romanian":"Ea a încremenit în picioare ca și cum ar fi văzut o fantomă.","english":"She stood transfixed as if she had seen a ghost.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336252"},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4779015","romanian":"Normalul este o iluzie. Ceea ce este normal pentru un păianjen este haos pentru muscă.","english":"Normality is an illusion. What is normal for a spider is chaos for a fly.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5232576","romanian":"Îți amintești perioada când l-am vizitat pe Tom atunci când el încă era adolescent?","english":"Can you remember the time we visited Tom when he was still a teenager?","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1163903","romanian":"Descărcarea Metodei de Introducere cu Tastă Unică pentru Limba Vietnameză va începe în curând.","english":"Your Unikey Vietnamese Input Method download will start shortly.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196981"},{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."},{"id":"story-ro-ciob-na-ul-cel-iste-sau-urloaiele-blendei-2","title":"Ciobănaşul cel isteţ sau ţurloaiele blendei","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":202,"excerpt":"Tot mergând şi minunându-mă, m-am pomenit către mijlocul grădinei. Aici era, ce să-ţi spui? frumuseţea de pe lume. Nişte cărări sucite şi cotite, acoperite cu un fel de iarbă mărunţică, de părea că erau nişte covoare aşternute."},{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-3","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"– Şi tu a mea! grăi al doilea în voinicie către Ana, ridicând-o şi pe ea în şa. Făcând aşa, voinicii porniră spre curtea împărătească. În ziua următoare se făcură nunţile şi apoi trei zile şi trei nopţi întreaga împărăţie răsuna de veselia oaspeţilor…"},{"id":"story-ro-departe-departe-2","title":"Departe, departe","author":"Barbu Stefanescu Delavrancea","difficulty":6,"genre":"fiction","wordCount":209,"excerpt":"Apoi auzii o uşă trântindu-se, şi alta, şi alta, încet, mai încet, mai încet, până nu ştiu bine dacă mai auzeam sau mi se părea. A cui să fie umbra? Vreo stafie? Înăuntru plânge cineva… se roagă, a leşinat… nu se mai aude. E întuneric. Mi se bate inima. De n-ar fi stafie! Şi ameţii pe marginea lacului."},{"id":"story-ro-sult-nica-3","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"– Aşa e omul… un ciocan, încă unul ş-al treilea, până ajungi la tinichea… d-acolo-ncolo… Dumnezeu cu mila… torni, parcă torni într-o pârnaie… Dar Sanda ce-o să zică… că mi-a dat Sfântul muiere harnică, dar rea, topenia pământului!… Înlăuntru s-aud ciocneli de pahare, buşeli de călcâie şi zbârnâitul otova al cobzarului. Trăgeau chindia de curgea ţărâna din pod."},{"id":"story-ro-z-na-zorilor","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":220,"excerpt":"A fost ce-a fost: dacă n-ar fi fost nici nu s-ar povesti. Poveşti de Ioan Slavici - Zâna Zorilor A fost odată un împărat, – un împărat mare şi puternic; împărăţia lui era atât de mare, încât nici nu se ştia unde se începe şi unde se sfârşeşte. Unii ziceau că ar fi fără de margini."},{"id":"story-ro-o-via-pierdut-2","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":207,"excerpt":"Acum se stânge, încât abia mai rămâne sămânță de lumină… acum se ridică mai lătăreață și mai îndărătnică. Moș Mărian privește, îi ies lacrămile din ochi, i se sloiesc pe gene… De mult s-a-ntunecat și el mereu privește, ca și când ar voi să-și tălmăcească taina vieții din jocul acelei flăcări. În sfârșit, se mișcă."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":8,"sentences":[{"id":"tat-5345650","romanian":"Merg prin cartierul chinezesc și admir simbolurile frumoase pe care tot nu le înțeleg încă.","english":"I go through Chinatown and admire the beautiful signs that I still do not understand.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568466","romanian":"Opinia e o idee pe care o avem; convingerea - o idee care ne subjugă.","english":"Our opinion is an idea which we have; our conviction an idea which has us.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9735774","romanian":"Am folosit lămâile pe care Tom mi le-a dat pentru a face limonadă.","english":"I used the lemons that Tom gave me to make lemonade.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8881352","romanian":"Am trăit cu o familie adoptivă pentru câteva luni, când eram mai tânăr.","english":"I lived with a foster family for a couple of months when I was younger.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11597600","romanian":"Cleopatra se afla la Roma în ziua în care Iulius Cezar a fost asasinat.","english":"Cleopatra was in Rome the day Julius Caesar was assassinated.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8760980","romanian":"Preotul a mers de câteva ori prin mijlocul enoriașilor, răspândind miros de tămâie din cădelniță.","english":"The priest walked among the parishioners several times, spreading the smell of incense from the censer.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-226","romanian":"Indiferent de circumstante, trebuie sa ne pastram calmul si sa gandim clar.","english":"Regardless of circumstances, we must stay calm and think clearly.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-11487762","romanian":"Genele noastre ne definesc înfățișarea și trăsăturile. Experiențele definesc cine suntem.","english":"Our genetics define our appearances and traits. Our experiences define who we are.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"},{"id":"tat-6824680","romanian":"De acum înainte, această veveriță va fi cunoscută sub numele de \"Cea drăguță\".","english":"This squirrel shall be henceforth known as \"The Cute One.\"","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10452185","romanian":"Într-o cafenea din Jakarta, Indonezia, proprietarii doresc să promoveze comunicația, înțelegerea și toleranța angajând oameni fără auz.","english":"At a coffee shop in Jakarta, Indonesia, the owners want to promote communication, understanding and tolerance by employing people who can’t hear.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1153823","romanian":"Russell a fost un filozof strălucitor, dar chiar și cea mai simplă activitate practică îl depășea.","english":"Russell was a brilliant philosopher, but even the simplest practical task was quite beyond him.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129790"},{"id":"tat-1137558","romanian":"Această aplicație vă va lăsa să sincronizaţi fotografiile și muzica dumneavoastră între toate aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7115224","romanian":"Ambii sportivi sunt foarte îndârjiți și deseori pot să apară animozități între ei.","english":"Both sportsmen are very competitive and, often, animosities arise between them.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136687","romanian":"Mai întâi cred că primul lucru pe care îl observă un străin ajuns în China este cu siguranță mărimea țării.","english":"Firstly, I think that the first time each foreigner is in China, the earliest impression is certainly the size of the country.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239573"},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-13619308","romanian":"În legătură cu ce subiect ești în dezacord cu cei mai mulți oameni pe care îi cunoști?","english":"What’s something you disagree on with most people you know?","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-9819149","romanian":"Creșterea incontrolabilă a populației mondiale va duce inevitabil la războaie, crize economice și umanitare.","english":"The uncontrolled growth of world population will inevitably lead to wars, economic and humanitarian crises.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12929969","romanian":"Poți să mă consideri romantică, draga mea soră, dar simt amarnic lipsa unui prieten.","english":"You may deem me romantic, my dear sister, but I bitterly feel the want of a friend.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-tinere-e-f-r-b-tr-ne-e-i-via-f-r-de-moarte-3","title":"Tinereţe fără bătrâneţe şi viaţă fără de moarte","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":229,"excerpt":"De ce creştea copilul, d-aceea se făcea mai isteţ şi mai îndrăzneţ. Îl deteră pe la şcoli şi filosofi, şi toate învăţăturile pe care alţi copii le învăţa într-un an, el le învăţa într-o lună, astfel încât împăratul murea şi învia de bucurie. Toată împărăţia se fălea că o să aibă un împărat înţelept şi procopsit ca Solomon împărat."},{"id":"story-ro-frumoasa-lumii-3","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":221,"excerpt":"În a treia duminică, când a dus oul, a pus pe gânduri pe jidan. Şi s-a gândit aşa jidanul: l-a întrebat unde şede, să se ducă să vadă de unde are el ouă de aur. Vine jidanul; da’ el ţinea cuşca în colţul casei. Cum a intrat jidanul în casă – el ştia carte – odată şi-aruncă ochii-n fundul casei."},{"id":"story-ro-p-cal-n-satul-lui","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"I se urâse şi lui Păcală să tot umble răzleţ prin lume, aşa fără de nici o treabă, numai ca să încurce trebile altora şi să râdă de prostia oamenilor."},{"id":"story-ro-g-in-reasa-2","title":"Găinăreasa","author":"Petre Ispirescu","difficulty":6,"genre":"folktale","wordCount":224,"excerpt":"Împăratul nu mai putea de bucurie de această întâmplare. Condurul sta d-a pururea pe masă în cămara împăratului. Oricine voia să-l încerce avea toată voia. Într-una din zile când împăratul ţinea sfat cu boierii cei mari pentru trebile împărăţiei, iacă şi fie-sa că vine şi se juca şi se zbenguia p-acolo prin cămară."},{"id":"story-ro-p-dureanca-3","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Ți-e scris, ți-e scris; nu ți-e scris, nu ți-e scris, și sănătate bună. Socoteala lui Busuioc era făcută: n-avea decât să pună caii la câteva căruțe, să plece la păduri ca să-și aducă oamenii, și apoi ar fi vrut el să știe care-i acela, un om din Curtici, care ar îndrăzni să facă gură."},{"id":"story-ro-o-via-pierdut","title":"O viață pierdută","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":216,"excerpt":"Crivățul șuieră și vâjie izbind în toate părțile stropii sloiți. Pereții caselor, geamurile ferestrilor, scoarța copacilor, grădelele de prin prejurul grădinii, toate deopotrivă sunt învăluite cu o lucie coajă de sloi. În grădina bisericii, pe piața de dinaintea ei, pe ulițile ce se varsă din toate părțile, oamenii, unii pe jos, alții cu trăsura, grăbesc la adăpostul călduros."},{"id":"story-ro-z-na-zorilor-3","title":"Zâna Zorilor","author":"Ioan Slavici","difficulty":6,"genre":"fiction","wordCount":226,"excerpt":"De când a întrebat Petru de treaba ochilor, se părea cum că ochiul cel din stânga plânge mai puţin, iară cel de-a dreapta râde mai mult. Petru îşi întări inima şi mai merse o dată la împăratul. O palma e o palma şi două-s două! Gândi şi făcu. O păţi din nou, cum a mai păţit-o."}],"recipes":[{"id":"recipe-ciorba-burta","title":{"ro":"Ciorba de Burta","en":"Tripe Soup"},"description":{"ro":"Ciorba de burta este o supa traditionala romaneasca, acrisoara si cremoasa, facuta din burta de vita.","en":"Tripe soup is a traditional Romanian soup, sour and creamy, made from beef tripe."},"difficulty":6,"category":"soup","ingredients":[{"ro":"burta de vita","en":"beef tripe","amount":"1 kg"},{"ro":"morcovi","en":"carrots","amount":"2 bucati"},{"ro":"telina","en":"celery","amount":"1 bucata"},{"ro":"ceapa","en":"onion","amount":"1 bucata"},{"ro":"smantana","en":"sour cream","amount":"300 ml"},{"ro":"galbenusuri","en":"egg yolks","amount":"3 bucati"},{"ro":"otet","en":"vinegar","amount":"100 ml"},{"ro":"usturoi","en":"garlic","amount":"6 catei"},{"ro":"sare","en":"salt","amount":"dupa gust"},{"ro":"ardei iute","en":"hot pepper","amount":"optional"}],"steps":[{"ro":"Se spala bine burta si se fierbe in apa cu sare 3-4 ore pana se inmoaie.","en":"Wash the tripe well and boil in salted water for 3-4 hours until tender."},{"ro":"Se taie burta fiarta in fasii subtiri.","en":"Cut the boiled tripe into thin strips."},{"ro":"In zeama in care a fiert burta se adauga legumele taiate si se fierb.","en":"Add the chopped vegetables to the broth and boil."},{"ro":"Se amesteca smantana cu galbenusurile intr-un bol.","en":"Mix the sour cream with egg yolks in a bowl."},{"ro":"Se adauga treptat cateva linguri de supa calda pentru a tempera amestecul.","en":"Gradually add a few spoons of hot soup to temper the mixture."},{"ro":"Se toarna amestecul in supa, amestecand continuu.","en":"Pour the mixture into the soup, stirring continuously."},{"ro":"Se acriseste cu otet dupa gust si se adauga usturoiul pisat.","en":"Add vinegar to taste and the crushed garlic."},{"ro":"Se serveste calda cu ardei iute si smantana.","en":"Serve hot with hot pepper and sour cream."}]}]};
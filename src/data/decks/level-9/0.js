@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1136830","romanian":"Persoanele care călătoresc în străinătate trebuie întotdeauna să se obișnuiască cu mâncăruri noi.","english":"People traveling abroad always have to get used to new food.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966321"},{"id":"tat-230","romanian":"Relatia dintre individ si societate ramane una dintre cele mai complexe chestiuni.","english":"The relationship between individual and society remains one of the most complex issues.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-6673370","romanian":"Este posibil să crezi că, comentariul tău a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-4993134","romanian":"Oficialii chinezi spun că creșterea economică a scăzut la minimul ultimilor trei ani din cauza economiei globale.","english":"Chinese officials say economic growth has dropped to a three-year low because of the world economy.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-4989065","romanian":"De când am plecat și până m-am întors a bătut întruna la tobe.","english":"From the moment I left till I came back, he had been hitting the drum without interruption.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163897","romanian":"Ce amabil din partea lui să ne ajute să ne mutăm într-o zi atât de ploioasă!","english":"How kind of him to help us move on such a rainy day!","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196806"},{"id":"tat-2536654","romanian":"Majoritatea descoperirilor științifice nu e altceva decât descoperirea a ceea ce este evident.","english":"Most scientific breakthroughs are nothing else than the discovery of the obvious.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6673371","romanian":"Este posibil să credeți că, comentariul dumneavoastră a fost inofensiv, dar mie mi s-a părut foarte ofensator.","english":"You may think your comment was innocuous, but I found it very offensive.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-4987505","romanian":"După ce s-a despărțit de ea, Simon s-a îndepărtat fără să se uite înapoi.","english":"After splitting up with her, Simon walked away without looking back.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-203","romanian":"Cu cat inveti mai mult, cu atat realizezi cat de putin stii.","english":"The more you learn, the more you realize how little you know.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-13619375","romanian":"Tom a bolborosit o scuză înainte de a se grăbi să prindă autobuzul.","english":"Tom gabbled out an apology before rushing to catch the bus.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12697576","romanian":"Ești ăla care l-ai făcut pe tom sa facă aia?","english":"Are you the one who asked Tom to do that?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-237","romanian":"Etica responsabilitatii ne cere sa anticipam consecintele actiunilor noastre asupra generatiilor viitoare.","english":"The ethics of responsibility requires us to anticipate the consequences of our actions on future generations.","difficulty":10,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13612831","romanian":"Tom a spus că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-8636611","romanian":"Am nevoie de aprobarea ta înainte de a pleca mai devreme de la lucru.","english":"I need your approval before I leave work early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5205062","romanian":"Te gândești serios să urmezi o carieră ca pilot de mașini de curse?","english":"Are you seriously thinking about pursuing a career as a race car driver?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6537690","romanian":"Ar fi mai bine să lași treaba asta cuiva care știe despre ce este vorba.","english":"It would be best to leave it to a man who knows the ropes.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5157262","romanian":"Un om egoist nu se gândește la nimic altceva decât la propriile sale sentimente.","english":"A selfish man thinks of nothing but his own feelings.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5158943","romanian":"Ceea ce îi este permis lui Jupiter nu este în mod necesar permis și unui bou.","english":"All that is allowed to Jupiter is not necessarily allowed to an ox.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-v-duvele-3","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Amândouă aveau de la răposaţi acareturi bune, aşezate cu temei, să tot ţie şi să nu mai putrezească; ceva bani cheag, ogrăzi cu pruni şi zarzări, grădini cu flori şi legume, toate ocolite cu garduri-pleturi, să nu vezi prin ele, şi umbrite cu streşini de mărăcini."},{"id":"story-ro-p-dureanca","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":214,"excerpt":"Fă trei cruci și zi „Doamne-ajută!” când treci pragul casei, fie ca să ieși, fie ca să intri, căci lumea din întâmplări se alcătuiește, iar întâmplarea e noroc ori nenorocire, și nimeni nu știe dacă e rău ori bun ceasul în care a pornit, nici dacă va face ori nu ceea ce-și pune de gând."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-5037534","romanian":"Ce zici despre formarea unui grup pe Facebook cu scopul de a discuta studierea limbilor străine?","english":"What about putting together a group on Facebook so we can discuss studying foreign languages?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6824477","romanian":"Lumea pe care am văzut-o în visul meu era o lume pașnică, lipsită de război.","english":"The world which I saw in my dream was a peaceful world devoid of war.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6581957","romanian":"O parte din studenți care sunt prinși copiind la examene nici măcar nu se jenează.","english":"Some of the college students who are caught cheating on the exams do not even blush.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536737","romanian":"Cele mai multe școli au fost concepute nu pentru a transforma societatea, ci pentru a o reproduce.","english":"Most schools were designed not to transform society, but to reproduce it.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-12047690","romanian":"Dacă lumea ar ști de ce oameni mici este condusă, s-ar răzvrăti imediat.","english":"If the people knew by what small men they are ruled, they would soon rebel.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-233","romanian":"Progresul autentic presupune nu doar inovatie tehnica, ci si dezvoltare morala.","english":"Authentic progress requires not just technical innovation, but also moral development.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6828262","romanian":"O persoană nu este niciodată prea bătrână pentru a se dezvăța de obiceiurile proaste.","english":"One is never too old to unlearn bad habits.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4961192","romanian":"Ai putea să o spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-217","romanian":"Experienta ne-a invatat ca rabdarea este cea mai importanta virtute.","english":"Experience has taught us that patience is the most important virtue.","difficulty":8,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6538121","romanian":"Deși nu mai este președinte, el continuă să aibă o influență considerabilă printre elita politică.","english":"Though he is no longer president, he still holds considerable sway among the political elite.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6908965","romanian":"Tom ar trebuie să mai iasă și să se distreze.","english":"Tom should go out and have some fun.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-487323","romanian":"Ea a încremenit în picioare ca și cum ar fi văzut o fantomă.","english":"She stood transfixed as if she had seen a ghost.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6336252"},{"id":"tat-584045","romanian":"Să gândim ceea ce nu simţim înseamnă sa ne minţim pe noi înşine, în acelaşi mod în care ii minţim pe ceilalţi când nu spunem ceea ce gândim.","english":"To think what we do not feel is to lie to ourselves, in the same way that we lie to others when we say what we do not think.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/262929"},{"id":"tat-7115211","romanian":"Tom era în stare să vadă că o potențială situație periculoasă se putea ivi.","english":"Tom could see that a potentially dangerous situation could arise.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5229148","romanian":"Poliția s-a uitat peste tot și nu a putut găsi nici o urmă a lui Tom.","english":"The police looked everywhere and could find no trace of Tom.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11740023","romanian":"Când traduceți, este necesar să aveți toată rigoarea și niciun respect pentru original.","english":"When translating, one must have all the rigor and no respect for the original.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6701448","romanian":"Cel mai mare cusur al rasei umane este incapacitatea noastră de a înțelege funcția exponențială.","english":"The greatest shortcoming of the human race is our inability to understand the exponential function.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192806","romanian":"După ce a jucat atât de prost tot jocul, echipa a plecat cu coada între picioare.","english":"After playing so badly for the entire game, the team walked off with their tails between their legs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12354510"},{"id":"tat-7578049","romanian":"Am auzit că Tom plănuiește să se mute la Boston.","english":"I heard that Tom plans to move to Boston.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-moara-cu-noroc-2","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"Iacă liniștea colibei. — Nu zic, grăi soacra așezată."},{"id":"story-ro-moara-cu-noroc","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"— Omul să fie mulțumit cu sărăcia sa, căci, dacă e vorba, nu bogăția, ci liniștea colibei tale te face fericit. Dar voi să faceți după cum vă trage inima, și Dumnezeu să vă ajute și să vă acopere cu aripa bunătății sale."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
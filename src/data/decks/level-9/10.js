@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1153812","romanian":"O republică este o națiune al cărei conducător nu este un rege sau o regină, ci un președinte.","english":"A republic is a nation whose head is not a king or queen, but a president.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129049"},{"id":"tat-1143283","romanian":"Ar fi trebuit să ai curajul să spui deschis ce crezi că este corect.","english":"You ought to have the courage to speak out what you believe to be right.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068669"},{"id":"tat-2191464","romanian":"El a primit o sumă considerabilă de bani drept compensație pentru rănile suferite.","english":"He received a large sum of money in compensation for his injury.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6764266","romanian":"Pompierii voluntari au luptat împotriva vâlvătăii cu mult curaj, dar cu puțină considerație pentru propria lor siguranță.","english":"The volunteer firefighters fought the blaze bravely, with scant regard for their own safety.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-223","romanian":"Diversitatea culturala contribuie la imbogatirea societatii noastre.","english":"Cultural diversity contributes to the enrichment of our society.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-6981787","romanian":"El putea să vadă că regele lui va primi șah-mat în cinci mutări.","english":"He could see that his king would be checkmated within five moves.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13616960","romanian":"Dumneavoastră puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1192795","romanian":"Teledonul este un program TV francez organizat în fiecare an pentru a colecta fonduri în scopul finanțării de cercetări medicale.","english":"The telethon is a French TV program organized every year to collect funds in order to finance medical research.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12351508"},{"id":"tat-9622587","romanian":"Atât Tom, cât și eu am vrut să mergem în Australia cu Mary.","english":"Both Tom and I wanted to go to Australia with Mary.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9839372","romanian":"Părtidelor nu li se permite să discute propunerile lor politice în timpul dezbaterii.","english":"Parties are not allowed to discuss their political propositions during the debate.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192848","romanian":"Se face din ce în ce mai frig dimineața și seara. Frunzele copacilor vor deveni în curând roșii și galbene.","english":"It is getting colder and colder morning and evening. The leaves of trees will soon turn red or yellow.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12361557"},{"id":"tat-5233192","romanian":"Crezi că Tom ar considera să se întâlnească cu sora mea mai tânără?","english":"Do you think Tom would consider dating my younger sister?","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7192267","romanian":"El nu era omul care să se lase descurajat de un singur eșec.","english":"He was not a man to be disheartened by a single failure.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12085392","romanian":"Se zvonea că bea, dar era dificil de dovedit pentru că bea numai singură.","english":"It was rumored that she drank, but it was hard to prove, as she only drank alone.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5185437","romanian":"În timpul Evului Mediu, onoarea era de bază pentru viața omului liber și a creștinului.","english":"During the Middle Ages, honor was fundamental to the life of the free man and of the Christian man.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-582948","romanian":"Democrația este cea mai proastă formă de guvernământ, cu excepția tuturor celorlalte care au fost încercate.","english":"Democracy is the worst form of government, except all the others that have been tried.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6569015"},{"id":"tat-11597600","romanian":"Cleopatra se afla la Roma în ziua în care Iulius Cezar a fost asasinat.","english":"Cleopatra was in Rome the day Julius Caesar was assassinated.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-923913","romanian":"Trebuie să încurajăm lumea să se alăture campaniei şi să lucreze cu noi.","english":"We have to encourage people to join the campaign and work with us.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/681131"}],"stories":[{"id":"story-ro-sorcova-2","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":228,"excerpt":"Nu se pomenea nici de sorcovăială, după cum s-ar fi cuvenit de la moşi, de la strămoşi. Ţi se prindea pleoapă de pleoapă, nară de nară, falcă de falcă, degera oul în găină de ger ce se pornise. – N-am putea duce l-alde biata Bălaşa ceva curmeie de viţă şi vreascuri ujujite?"},{"id":"story-ro-gura-satului-2","title":"Gura satului","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Feciorii, fiindcă sunt doi și feciori, oricât de voinici ar fi, stau sub porunca părintească; Marta însă e una singură, adică nu mai are în casă pe nimeni deopotrivă cu dânsa. Încă pe când era în fașe, Marta avea obiceiul de a pune toată casa în mișcare."},{"id":"story-ro-sult-nica-3","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"– Aşa e omul… un ciocan, încă unul ş-al treilea, până ajungi la tinichea… d-acolo-ncolo… Dumnezeu cu mila… torni, parcă torni într-o pârnaie… Dar Sanda ce-o să zică… că mi-a dat Sfântul muiere harnică, dar rea, topenia pământului!… Înlăuntru s-aud ciocneli de pahare, buşeli de călcâie şi zbârnâitul otova al cobzarului. Trăgeau chindia de curgea ţărâna din pod."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-6637083","romanian":"Construcția barajului a creat un lac artificial, care a distrus un întreg ecosistem.","english":"The construction of the dam created an artificial lake that destroyed a whole ecosystem.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568508","romanian":"Formarea și mișcarea uraganelor sunt capricioase, chiar și cu tehnologia noastră de astăzi.","english":"The formation and movement of hurricanes are capricious, even with our present-day technology.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153805","romanian":"Atleţii s-au antrenat din greu în fiecare zi pentru a fi în formă maximă la jocurile olimpice de vară.","english":"The athletes trained hard every day to be at their best for the Summer Olympics.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128898"},{"id":"tat-12151855","romanian":"Mi-am pierdut portofelul cu niște bani, buletinul de identitate și cardul de student.","english":"I lost my wallet with some money, my ID, and my student card.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5233189","romanian":"Ai vreo idee la ce oră va ajunge Tom acasă?","english":"Do you have any idea what time Tom will come home?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6581888","romanian":"Ar fi trebuit să fii mai atent și să nu te încrezi în el.","english":"You should have known better than to trust him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7192998","romanian":"Moartea prematură a soției mele, a tras cortina peste 50 de ani de mariaj fericit.","english":"The untimely death of my wife has brought down the curtain on over 50 years of happily married life.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11622790","romanian":"Ieri l-am cunoscut pe unul dintre cei mai mari actori ai generației noastre.","english":"Yesterday I met one of the greatest actors of our generation.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12327631","romanian":"Partea unui verb, care este parțial verb și parțial adjectiv, se numește participiu.","english":"The part of a verb, that is partly a verb and partly an adjective, we call a participle.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-10242320","romanian":"Arătau și aveau gust de creveți, dar vă pot asigura că aceia nu erau creveți adevărați.","english":"They looked and tasted like shrimps, but I can assure you those were not real shrimps.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2040372","romanian":"Inginerii au aruncat podul în aer pentru că era gata să se prăbușească.","english":"The engineers blew up the bridge because it was about to collapse.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9818372","romanian":"Planeta Pământ este o minune a sistemului solar, iar noi suntem virusul care o distruge.","english":"Planet Earth is a wonder of the solar system, meanwhile we are the virus that is destroying it.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-5158990","romanian":"Dacă calci cu fierul de călcat Elveția, ar fi mai mare decât Germania.","english":"If you ironed Switzerland, it would be bigger than Germany.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11574532","romanian":"Am doi băieți născuți la patru ani distanță, în aceeași zi din februarie.","english":"I have two sons born four years apart on the same day in February.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-234","romanian":"Complexitatea sistemelor sociale contemporane depaseste adesea capacitatea noastra de intelegere imediata.","english":"The complexity of contemporary social systems often exceeds our capacity for immediate understanding.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-10450497","romanian":"Am mers la supermarket și am cumpărat niște cireșe fiindcă erau la reducere.","english":"I went to the supermarket and bought some cherries because they were on sale.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1137975","romanian":"Am putut observa clar că munca grea a început să-și lase amprenta asupra sănătății sale.","english":"I could clearly see that the hard work had begun to tell on his health.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9263288","romanian":"Tom mi-a spus că ar fi ușor să o conving pe Mary să doneze niște bani.","english":"Tom told me it would be easy to persuade Mary to donate some money.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-rodul-tainic","title":"Rodul tainic","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"A fost odată un împărat, şi-n curtea acelui împărat se afla un pom atât de înalt, încât nimeni nu era în stare să-i vadă vârful. Pomul acesta înflorea şi dădea rod în fiecare an, dar nici împăratul, nici curtenii lui, nici vreun alt om pământean n-a apucat să vadă poamă din rodul acela."},{"id":"story-ro-limir-mp-rat-2","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":203,"excerpt":"Când se scula, văduva stetea mai bucuros afară decât în casă, şi Lia ridica gunoiul din prag, îl ducea la locul lui, apoi intra ca să dereticească prin colibă, cântând voioasă, şi oglindă luminoasă se făcea toate sub mâna ei, încât, împărat de-ai fi fost, ţi-ai fi părăsit palatele ca să stai în coliba văduvei."},{"id":"story-ro-f-t-frumos-din-lacrim-3","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":219,"excerpt":"Atunci puse să-i facă altul mai greu – îl aruncă în sus aproape de palatul de nori al lunii; căzând din nori, nu se rupse de degetul voinicului. Atunci Făt-Frumos îşi luă ziua bună de la părinţi, ca să se ducă, să se bată el singur cu oştile împăratului ce-l duşmănea pe tată-său."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
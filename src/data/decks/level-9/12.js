@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-9586394","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosit ca să gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-10006115","romanian":"În epoca stalinistă, prizonierii din lagărele de concentrare au devenit sclavi în slujba statului.","english":"During the Stalinist era, prisoners at concentration camps became slaves in service of the state.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-9586396","romanian":"Îmi era foame când am ajuns acasă, dar eram prea obosită ca să mai gătesc ceva.","english":"I was hungry when I got home, but I was too tired to cook anything.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-213","romanian":"In ciuda dificultatilor, echipa a reusit sa termine proiectul la timp.","english":"Despite the difficulties, the team managed to finish the project on time.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-2536248","romanian":"Dacă aș vrea să te sperii, ți-aș spune ce am visat acum câteva săptămâni.","english":"If I wanted to scare you, I would tell you what I dreamt about a few weeks ago.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4988491","romanian":"Ursul s-a luptat cu vecinul meu până a obosit, apoi cu ultimele puteri a fugit în pădure.","english":"The bear fought with my neighbour until he got tired. Afterwards, with the last of his strength, he fled into the forest.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-13427370","romanian":"Am auzit că Tom și cu Mary se căsătoresc în octombrie.","english":"I heard that Tom and Mary will get married in October.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-13604225","romanian":"Tom și Mary au spus că au crezut că John va vrea să facă asta.","english":"Tom and Mary said they thought John would be willing to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-583874","romanian":"Motivul principal pentru care prietenii își părăsesc prietenii pe Facebook e din cauza prea multor postări inutile.","english":"The number one reason why friends dump their friends on Facebook is too many useless posts.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/954288"},{"id":"tat-2536647","romanian":"Guvernul francez a lansat un joc online care provoacă contribuabilii să echilibreze bugetul național.","english":"The French government has launched an online game that challenges taxpayers to balance the national budget.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12001711","romanian":"Camera era în haos. Peste tot erau împrăștiate hârtii, scaunele răsturnate, iar fereastra s-a spart.","english":"The room was in chaos. Papers were strewn everywhere, chairs were overturned, and the window was shattered.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-714064","romanian":"Julio se leagănă in hamacul pe care l-am atârnat sub bătrânul stejar.","english":"Julio is swinging in the hammock that I hung under the old oak tree.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8469770"},{"id":"tat-6539915","romanian":"Potrivit unui studiu recent, durata medie de viață a japonezilor este în continuă creștere.","english":"According to a recent study, the average life span of the Japanese is still increasing.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1143136","romanian":"- 99 copeici, a declarat Dima cu mândrie. Am nevoie de 99 copeici.","english":"99 kopeks, Dima stated proudly. \"I need 99 kopeks.\"","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068904"},{"id":"tat-6710378","romanian":"De-a lungul timpului, acțiunea valurilor erodează stâncile și, prin urmare, le face să cadă în ocean.","english":"Over time, wave action undercuts sea cliffs and thereby causes them to fall into the ocean.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-236","romanian":"Interdependenta globala a economiilor impune o regandire fundamentala a relatiilor internationale.","english":"The global interdependence of economies requires a fundamental rethinking of international relations.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13619308","romanian":"În legătură cu ce subiect ești în dezacord cu cei mai mulți oameni pe care îi cunoști?","english":"What’s something you disagree on with most people you know?","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-7187157","romanian":"Galaxia Calea Lactee este face parte dintr-un grup de aproximativ treizeci și cinci de galaxii.","english":"The Milky Way galaxy is bound in a cluster of about thirty-five galaxies.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"}],"stories":[{"id":"story-luceafarul","title":"Luceafarul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":140,"excerpt":"A fost odata ca-n povesti, A fost ca niciodata, Din rude mari imparatesti, O prea frumoasa fata. Si era una la parinti Si mindra-n toate cele, Cum e Fecioara intre sfinti Si luna intre stele. Din umbra falnicelor bolti Ea pasul si-l indreapta Linga fereastra, unde-Loss'n colti Luceste alba noapte."},{"id":"story-ro-moara-cu-noroc-3","title":"Moara cu noroc","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":203,"excerpt":"Aici în vale e Moara cu noroc. Ori din care parte ar veni, drumețul se bucură când o zărește din culmea dealului pleșuv, căci, venind dinspre locurile rele, ea îl vestește că a scăpat norocos, iară mergând spre ele, la moară poate să găsească ori să aștepte alți drumeți, ca să nu plece singur mai departe."},{"id":"story-ro-frumoasa-lumii-2","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":211,"excerpt":"Alungând-o el prin copac, ea se vârâ-ntr-o bortă… ş-o prinde. El n-a mai stătut către noapte, că s-a temut de draci, ci a luat pasărea ş-a venit acasă ş-a făcut o cuşcă bună ş-a pus pasărea-n cuşcă. Acu el în ziua ceea, era sâmbătă, care-o prins-o, şi duminică dimineaţa s-a ouat un ou. Oul era de aur."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
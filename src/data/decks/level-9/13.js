@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1137558","romanian":"Această aplicație vă va lăsa să sincronizaţi fotografiile și muzica dumneavoastră între toate aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9622607","romanian":"Tom și Mary au spus că au plecat devreme pentru că nu se simțeau bine.","english":"Tom and Mary said they left early because they were feeling sick.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-238","romanian":"Hermeneutica textelor literare clasice continua sa ofere perspective noi asupra conditiei umane.","english":"The hermeneutics of classic literary texts continues to offer new perspectives on the human condition.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-5044147","romanian":"Rata șomajului în Japonia a fost de 3,4 la sută în luna septembrie a anului 2015.","english":"The unemployment rate in Japan was 3.4 percent in September of 2015.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1136683","romanian":"În general, profesorul controlează clasa stând în picioare în fața elevilor și făcându-le morală în timpul lecției.","english":"The teacher controls the class, usually standing in front of the students and lecturing to them during the lesson.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7217517"},{"id":"tat-12047689","romanian":"Deși e de la sine înțeles, mai bine ar fi să se spună.","english":"While it goes without saying, it would go even better if it was said.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6599793","romanian":"Ți-ar plăcea să vezi cu mine sâmbătă o interpretare live a unei piese?","english":"Would you like to see a live performance of a play with me Saturday?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4961201","romanian":"Fii atent: în limba engleză scriem cu litere mari naționalitățile, zilele săptămânii și limbile străine.","english":"Be careful: We capitalize nationalities, days of the week, and languages in English.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13619295","romanian":"Tom a trecut cuțitul peste piatra de ascuțit până când a devenit ascuțit ca briciul.","english":"Tom slid the knife across the whetstone until it was razor-sharp.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-3520579","romanian":"Nu avem nevoie de un nou limbaj auxiliar, limba engleză îndeplinește deja acest rol.","english":"We do not need a new auxiliary language, the English language already fulfills that role.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8961578","romanian":"Dacă aveți probleme cu șobolanii sau șoarecii, îi puteți speria cu ajutorul ultrasunetelor.","english":"If you have rat or mouse problems, you can scare them off with ultrasound.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-209","romanian":"Comunicarea eficienta este cheia oricarei relatii de succes.","english":"Effective communication is the key to any successful relationship.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-4974910","romanian":"Ieri nu a fost nici prea cald, nici prea rece. A fost o zi ideală pentru o plimbare.","english":"Yesterday it was neither too warm nor too cold. It was an ideal day for taking a walk.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-13632868","romanian":"Noua generație pare să aibă o perioadă de atenție mai redusă decât am avut noi.","english":"This new generation seems to have a shorter attention span than we did.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-215","romanian":"Prin urmare, trebuie sa luam masuri imediate pentru a rezolva problema.","english":"Therefore, we must take immediate measures to solve the problem.","difficulty":8,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-224","romanian":"Dezvoltarea sustenabila trebuie sa fie prioritatea noastra principala.","english":"Sustainable development must be our main priority.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-6586236","romanian":"Tocmai i-am spus lui Mary că doream să o ajut să-și curețe garajul.","english":"I just told Mary that I wanted to help her clean the garage.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153774","romanian":"Într-un final, Susan îi taie mamei vorba, promite să-i scrie și închide telefonul.","english":"Finally, Susan cuts her mother short, promises to write, and hangs up.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128481"}],"stories":[{"id":"story-padurea-spanzuratilor","title":"Padurea spanzuratilor","author":"Liviu Rebreanu","difficulty":8,"genre":"fiction","wordCount":155,"excerpt":"Apostol Bologa era ofiter in armata austro-ungara in timpul Primului Razboi Mondial. Desi roman de neam, era obligat sa lupte impotriva fratilor sai. In fiecare zi, dilema il chinuia: sa fie loial juramantului facut sau sa asculte de glasul sangelui? \"Ce inseamna datoria?\" se intreba Apostol. \"Datoria fata de cine?"},{"id":"story-ro-palatul-de-cle-tar-2","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Pe-aşa vremuri se zice că ar fi văcuit împăratul cu stema ruptă din soare, în cel mai frumos palat de cleştar şi peste cel mai înţelept şi mai viteaz norod. Nu era crai pe care împăratul cu stema ruptă din soare să nu-l fi domolit, că nici o oaste duşmană nu putea să-i stea împotrivă."},{"id":"story-ro-pas-rea-m-iastr-3","title":"Pasărea măiastră","author":"Petre Ispirescu","difficulty":7,"genre":"folktale","wordCount":220,"excerpt":"Atunci vulpoiul făcu un semn asupra lui şi îl schimbă în stană de piatră. Văzând împăratul că fiul său cel mare nu se mai întoarce ascultă rugăciunea fiului celui mijlociu, şi îi dete voie să meargă şi dânsul. Acesta, după ce se găti şi îşi luă merinde de drum, porni şi dânsul."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2034608","romanian":"Precum a demonstrat din abundenţă George Bush, a fi președintele Statelor Unite necesită doar o inteligență moderată.","english":"As George Bush has amply demonstrated, being president of the U.S. requires only a modicum of intelligence.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-12517381","romanian":"Igor a descoperit o urmă de bocanc în niște noroi moale, nu departe de cortul său.","english":"Igor discovered a bootprint in some soft dirt not far from his tent.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6826720","romanian":"Spre deosebire de sora lui, el și-a păstrat credința religioasă insuflată de părinții lui.","english":"Unlike his sister, he has retained the religious faith his parents brought him up in.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6582958","romanian":"Tom nu avea nici o idee despre ce ar fi trebuit să se facă.","english":"Tom had no idea what needed to be done.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136436","romanian":"Adevărul arde și distruge toate elementele, arătând că acestea îi sunt doar umbră.","english":"Truth burns and destroys all elements, showing that they are merely its shadow.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965909"},{"id":"tat-6582834","romanian":"Tom obișnuia să se ducă în Boston în fiecare vară când era copil.","english":"Tom used to go to Boston every summer when he was a kid.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536171","romanian":"Sunt o persoană cu defecte, dar acestea sunt defecte de care se poate scăpa ușor.","english":"I am a flawed person, but these are flaws that can easily be fixed.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6614182","romanian":"Ozonul este o moleculă compusă din trei atomi de oxigen și apare în natură în cantități reduse.","english":"Ozone is a molecule comprised of three oxygen atoms that occurs naturally in small amounts.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1153156","romanian":"M-am dus la petrecere pe prezumția că ea va fi acolo.","english":"I went to the party on the presumption that she would be there.","difficulty":7,"wordCount":11,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1749169"},{"id":"tat-222","romanian":"Implementarea noilor politici va necesita resurse considerabile.","english":"Implementing the new policies will require considerable resources.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-2536357","romanian":"Trebuie să învățăm să trăim împreună ca frații sau vom pieri împreună ca proștii.","english":"We must learn to live together as brothers, or we will perish together as fools.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-11651384","romanian":"Limba română este mai puțin asemănătoare cu portugheza, spaniola, italiana și franceza decât am crezut.","english":"Romanian is less similar to Portuguese, Spanish, Italian, and French than I thought.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-235","romanian":"Dialectica dintre traditie si modernitate defineste in mare masura discursul cultural romanesc actual.","english":"The dialectic between tradition and modernity largely defines current Romanian cultural discourse.","difficulty":10,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-1136770","romanian":"Ziua a fost furtunoasă și ceea ce a fost încă și mai rău a fost că fulgera.","english":"The day was stormy, and what was worse still, it was thundering.","difficulty":7,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966198"},{"id":"tat-709899","romanian":"Am uitat să opresc televizorul înainte de a ma duce la culcare.","english":"I forgot to turn off the TV before going to bed.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8426691"},{"id":"tat-9638378","romanian":"Îmi amintesc că am făcut cunoștință cu el la o petrecere anul trecut.","english":"I remember being introduced to him at a party last year.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5025296","romanian":"Cred că ar trebui să îi spui lui Tom ceea ce el vrea să știe.","english":"I think you should tell Tom what he wants to know.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9735774","romanian":"Am folosit lămâile pe care Tom mi le-a dat pentru a face limonadă.","english":"I used the lemons that Tom gave me to make lemonade.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-doi-fe-i-cu-stea-n-frunte-3","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"– Şi tu a mea! grăi al doilea în voinicie către Ana, ridicând-o şi pe ea în şa. Făcând aşa, voinicii porniră spre curtea împărătească. În ziua următoare se făcură nunţile şi apoi trei zile şi trei nopţi întreaga împărăţie răsuna de veselia oaspeţilor…"},{"id":"story-ro-limir-mp-rat","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":232,"excerpt":"A fost ce-a fost… a fost odată o văduvă care avea o fată, Lia, şi văduva era săracă de nu mai ştia cum să-şi înnoade zdrenţele, iar Lia, fata ei, se făcuse harnică de creşteau flori pe unde-i călca piciorul şi da muguri lemnul uscat când ea punea mâna pe el."},{"id":"story-ro-f-t-frumos-din-lacrim","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":233,"excerpt":"În vremea veche, pe când oamenii, cum sunt ei azi, nu erau decât în germenii viitorului, pe când Dumnezeu călca încă cu picioarele sale sfinte pietroasele pustii ale pământului, – în vremea veche trăia un împărat întunecat şi gânditor ca miază-noaptea şi avea o împărăteasă tânără şi zâmbitoare ca miezul luminos al zilei."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
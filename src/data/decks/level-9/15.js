@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-205","romanian":"Daca as fi stiut, as fi luat o decizie diferita.","english":"If I had known, I would have made a different decision.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-7187074","romanian":"Aceasta este prima dată când guvernul a efectuat o anchetă la nivel național, privind sinuciderile.","english":"This is the first time the government has done a nationwide investigation regarding suicides.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9839369","romanian":"După ce și-a dat jos ochelarii și și-a desfăcut părul, Mary arăta ca o persoană complet diferită.","english":"After removing her glasses and untying her hair, Mary looked like a completely different person.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136617","romanian":"Cine va fi responsabil de clasa noastră când domnișoara Smith va părăsi şcoala?","english":"Who will be in charge of our class when Miss Smith leaves school?","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11965929"},{"id":"tat-218","romanian":"Colaborarea internationala este esentiala pentru progresul stiintific.","english":"International collaboration is essential for scientific progress.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-1143196","romanian":"Ne-am înțeles să ne abținem de la fumat cât suntem la lucru.","english":"We agreed to refrain from smoking while we are at work.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12069326"},{"id":"tat-9819149","romanian":"Creșterea incontrolabilă a populației mondiale va duce inevitabil la războaie, crize economice și umanitare.","english":"The uncontrolled growth of world population will inevitably lead to wars, economic and humanitarian crises.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6713884","romanian":"Băuturile pe bază de zahăr nu au valoare nutritivă și contribuie semnificativ la creșterea în greutate.","english":"Sugary drinks have no nutritional value and contribute significantly to weight gain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7726661","romanian":"Dacă n-ar fi fost zăpadă, am fi putut să ne urcăm pe munte.","english":"If it were not for the snow, we could climb the mountain.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11658423","romanian":"Majoritatea zmeurii sunt roșii, dar există și zmeură albă, galbenă și chiar violetă.","english":"Most raspberries are red, but there are also white, yellow, and even purple raspberries.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1163903","romanian":"Descărcarea Metodei de Introducere cu Tastă Unică pentru Limba Vietnameză va începe în curând.","english":"Your Unikey Vietnamese Input Method download will start shortly.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12196981"},{"id":"tat-10313164","romanian":"Algeria ar trebui să devină cea mai sigură țară din Africa de Nord.","english":"Algeria should become the safest country in North Africa.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-240","romanian":"Epistemologia contemporana pune sub semnul intrebarii pretentia la cunoastere obiectiva absoluta.","english":"Contemporary epistemology questions the claim to absolute objective knowledge.","difficulty":10,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12341853","romanian":"Nu ai nimic de făcut decât să te supui regulilor.","english":"There is nothing for you to do but obey the rules.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-7115203","romanian":"Ceea ce ne definește este modul în care ne ridicăm după ce cădem.","english":"What defines us is how well we arise after falling.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10790200","romanian":"Tom are o cicatrice pe încheietura mâinii de când a încercat să se sinucidă.","english":"Tom has a scar on his wrist from when he tried to commit suicide.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12058655","romanian":"Zonele umede adăpostesc o gamă largă de specii de plante, printre care coada-șoricelului, stufărișurile și nuferi.","english":"Wetlands are home to a vast array of plant species, including cattails, reeds, and water lilies.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536237","romanian":"Mulțumesc pentru că mi-ai explicat în sfârșit de ce oamenii mă iau de idiot.","english":"Thanks for having explained to me at last why people take me for an idiot.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12321128","romanian":"De ce ești așa de nervos? Tot ce-am făcut este să-ți mănânc sandvișul.","english":"Why are you so angry? All I did was eat your sandwich.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-testament","title":"Testament","author":"Tudor Arghezi","difficulty":7,"genre":"poetry","wordCount":130,"excerpt":"Nu-Loss'nti voi lasa drept mostenire, fiule, Nici ogoare largi, nici case inalte, Ci doar un nume curat si-Loss'n suflet Cuvinte multe, frumoase si sfinte. Cartea pe care o scriu e toata viata mea, Fiecare litera e o suferinta, Fiecare pagina e o bucurie, Si fiecare rand e o nadejde."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-3","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Băietul când s-o făcut mare o ‘ntrebat: – Mamă, unde-i tata? Ea i-a spus lui, că nu ştie cine-i. Zice: – Eu mă duc, mamă, să-l cat. – Te-i duce, dragul mamei, da dacă-i pute scoate copacul de aici din pământ. Cum a pus mâna, l-o scos cum aş scoate eu o rădăcină de morcov."},{"id":"story-ro-frumoasa-lumii","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":8,"genre":"poetry","wordCount":203,"excerpt":"Apoi poveste, poveste, D-zeu la noi soseşte, că-nainte mult mai este. Era odată un vânător ş-avea trei copii şi era sărac-sărac, cât numai cu-atâta se ţinea, că-mpuşca câte-o păsăruică, o vindea ş-atâta era hrana lui, săracul. Acu era o pădure pe-acolo pe-aproape, de-i zicea Pădurea neagră."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
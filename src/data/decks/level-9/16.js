@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1136714","romanian":"Destul de curând a venit un excavator care a tăiat un drum prin dealul acoperit cu margarete.","english":"Pretty soon along came a steam shovel and dug a road through the hill covered with daisies.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7226376"},{"id":"tat-2536130","romanian":"America e un loc drăguț în care să fii, dacă ești aici ca să câștigi bani.","english":"America is a lovely place to be, if you are here to earn money.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568461","romanian":"Cel mai lent în a promite este și cel mai credincios promisiunii atunci când o face.","english":"The slowest one to make a promise is the most faithful one in keeping it.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6918482","romanian":"Am fost prea ocupat să-l ajut pe Tom ca să o mai ajut și pe Mary.","english":"I was too busy helping Tom to help Mary.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-8881352","romanian":"Am trăit cu o familie adoptivă pentru câteva luni, când eram mai tânăr.","english":"I lived with a foster family for a couple of months when I was younger.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153881","romanian":"Când l-am întrebat dacă știa unde era ea, doar a ridicat din umeri.","english":"When I asked him if he knew where she was he just shrugged his shoulders.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12102623"},{"id":"tat-4694533","romanian":"Lunile anului sunt: ianuarie, februarie, martie, aprilie, mai, iunie, iulie, august, septembrie, octombrie, noiembrie, decembrie.","english":"The months of the year are: January, February, March, April, May, June, July, August, September, October, November, December.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2568509","romanian":"Când trimiteți o telegramă, concizia este esențială, deoarece veți fi taxat pentru fiecare cuvânt.","english":"When you send a telegram, brevity is essential because you will be charged for every word.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6595168","romanian":"Bob i-a spus lui Jane să nu se amestece în treburile sale personale.","english":"Bob told Jane not to interfere in his personal affairs.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7187071","romanian":"Ei și-au format propria asociație la nivel național, Asociația Americană a Persoanelor Pensionate.","english":"They have formed their own nationwide association, the American Association of Retired Persons.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6918496","romanian":"Am crezut că Tom va fi de acord cu mine.","english":"I thought Tom would agree with me.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5154335","romanian":"Mi-a plăcut plăcere să te cunosc și aștept cu nerăbdare vești de la tine.","english":"It was nice to meet you, and I look forward to hearing from you.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-229","romanian":"Filozofia ne invita sa punem sub semnul intrebarii ceea ce consideram evident.","english":"Philosophy invites us to question what we consider obvious.","difficulty":9,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-6538116","romanian":"Chiar aș vrea să te ajut, dar am mâinile legate.","english":"I would really like to help you, but my hands are tied.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6599852","romanian":"Din cauza unor circumstanțe neprevăzute, excursia noastră în munți, din acest weekend, va fi anulată.","english":"Due to unforeseen circumstances, our trip to the mountains this weekend will be cancelled.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4987451","romanian":"Noi credem că este cu adevărat posibil ca cele două sisteme sociale diferite să coexiste în pace.","english":"We believe that peaceful coexistence of the two different social systems is fully possible.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-582926","romanian":"Există oameni atât de flămânzi în lume, încât Dumnezeu nu le poate apărea decât sub formă de pâine.","english":"There are people in the world so hungry, that God cannot appear to them except in the form of bread.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6440496"},{"id":"tat-1144346","romanian":"În timp ce în metafizică cea mai simplă cale este să condamne toate metafizicile ca fiind nonsens, cea mai simplă cale în morală este să înalţi practica comună la moralul absolut.","english":"While the easiest way in metaphysics is to condemn all metaphysics as nonsense, the easiest way in morals is to elevate the common practice of the community into a moral absolute.","difficulty":10,"wordCount":31,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073854"},{"id":"tat-3877969","romanian":"Corpul uman obișnuit conține îndeajuns de multe oase încât să compună un întreg schelet uman.","english":"The average human body contains enough bones to make an entire human skeleton.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-doi-fe-i-cu-stea-n-frunte","title":"Doi feţi cu stea în frunte","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":208,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti. A fost odată un împărat. Împăratul acesta stăpânea o lume întreagă, şi în lumea asta era un păcurar bătrân şi o păcurăriţă, care aveau trei fete: Ana, Stana şi Lăptiţa."},{"id":"story-ro-budulea-taichii","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":8,"genre":"fiction","wordCount":213,"excerpt":"De-mi părea bine? Dar se-nțelege că-mi părea bine!"},{"id":"story-ro-flori-a-din-codru-2","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":238,"excerpt":"Cine ştie? vreun împărat ce domneşte în ascuns prin adâncul codrilor… Crâşmarul s-a lăsat de lemne, a luat fata în braţe, a dus-o acasă… şi de aici înainte a fost fata de suflet a lui şi a crâşmăriţei. Aşa a crescut apoi fata la crâşmă."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-5226154","romanian":"Tom și-a abandonat mașina, care a rămas fără benzină, și a început să meargă pe jos.","english":"Tom abandoned his car that had run out of gasoline and started walking.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12346073","romanian":"Bangladesh și China sunt două țări distincte, cu sisteme culturale, politice și economice diferite.","english":"Bangladesh and China are two distinct countries with different cultural, political, and economic systems.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-202","romanian":"Cultura romaneasca are radacini adanci in traditiile populare.","english":"Romanian culture has deep roots in folk traditions.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1136709","romanian":"Tom a întrebat-o pe Mary cine crede ea că e cel mai probabil să câștige cursa.","english":"Tom asked Mary who she thought would be the most likely to win the race.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239741"},{"id":"tat-10452012","romanian":"Actualul imn național al Georgiei a fost acceptat în 2004, când Saakashvili a ajuns la putere.","english":"The current national anthem of Georgia was accepted in 2004, when Saakashvili came to power.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11508741","romanian":"Tocmai am cumpărat o nouă plantă pentru camera mea. Arată atât de frumos!","english":"I just bought a new plant for my room. It looks so nice!","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4993395","romanian":"Creșterea cererii pentru cafeaua de înaltă calitate a ajutat la mărirea prețului cafelei.","english":"Greater demand for high-quality coffee has helped drive coffee prices higher.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6582845","romanian":"Cei mai mulți dintre țăranii care locuiesc în acest sat uitat-de-lume sunt analfabeți.","english":"Most of the peasants living in this godforsaken village are illiterate.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-708998","romanian":"Noaptea a fost atât de rece încât, atunci când m-am întors, eram aproape îngheţat.","english":"The night was so chilly that when I returned I was almost frozen.","difficulty":8,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8420255"},{"id":"tat-11663746","romanian":"Toki Pona nu este o limbă care trebuie vorbită, ci doar care trebuie citită și scrisă.","english":"Toki Pona is not a language to be spoken, but only to be read and written.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1153823","romanian":"Russell a fost un filozof strălucitor, dar chiar și cea mai simplă activitate practică îl depășea.","english":"Russell was a brilliant philosopher, but even the simplest practical task was quite beyond him.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12129790"},{"id":"tat-2429205","romanian":"La început am crezut că sunt avantajat având o limbă din familia latină.","english":"At first, I thought I had an advantage because I spoke a Romance language.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143107","romanian":"Jocul shiritori se joacă luând silaba finală a cuvântului spus de persoana dinainte și apoi următoarea persoană caută un cuvânt care începe cu acel sunet.","english":"The game of shiritori is played by taking the final sound of the word spoken by the person before you, and then the next person looks for a word that begins with that sound.","difficulty":10,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070029"},{"id":"tat-6871781","romanian":"Acea persoană m-a întrebat cine sunt, dar nu am considerat necesar să îi răspund.","english":"That person asked me who I was, but I did not deem it necessary to answer him.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1059634","romanian":"Îmi place să merg în parc și să mă uit la copii distrându-se pe terenul de joacă.","english":"I like to go to the park and watch the children in the playground enjoying themselves.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/10275429"},{"id":"tat-4779015","romanian":"Normalul este o iluzie. Ceea ce este normal pentru un păianjen este haos pentru muscă.","english":"Normality is an illusion. What is normal for a spider is chaos for a fly.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12317129","romanian":"Pentru că se simțea obosit după plimbarea pe câmp, a tras un pui de somn.","english":"Feeling tired after his walk in the country, he took a nap.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13616964","romanian":"Voi puteți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-2536658","romanian":"Trecutul poate fi doar cunoscut, nu schimbat. Viitorul poate fi doar schimbat, nu cunoscut.","english":"The past can only be known, not changed. The future can only be changed, not known.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4538856","romanian":"S-ar putea să se întâmple înca o dată așa ceva?","english":"Can such a thing happen again?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-budulea-taichii-3","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"Iară Budulea era om cuminte și înțelegea că dascălul nu are altă treabă decât să-și bată capul cu copiii oamenilor. Un singur lucru îl mai punea pe gânduri: parcă tot nu-i venea să creadă că și Huțu are să învețe carte. Când eu începusem a umbla la școală, Huțu era printre băieții de care îmi era frică."},{"id":"story-ro-p-cal-n-satul-lui-3","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Vedeau parcă cele şapte viţeluşe cum se fac viţele, juninci, cum ajung în cele din urmă vaci şi ele, şi cum le vinde Păcală şi pe ele şi se întoarce de la târg cu o spuză de viţeluşe, toate flămânde, toate pornite din fire să se facă viţele, juninci şi vaci în cele din urmă. – Măi!"},{"id":"story-ro-vasilie-finul-lui-dumnezeu","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste, cuvânt de poveste, în astă sară la noi soseşte pe un pai de secară, să te ţin de vorbă ‘n astă sară."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-6581970","romanian":"Medalia de Onoare a Congresului este cea mai importantă distincție la care un soldat poate aspira.","english":"The Congressional Medal of Honor is the highest award that any soldier can aspire to.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-706007","romanian":"Ascultându-l pe Mahler, Lyusya se gândea mereu la moarte şi la viaţa eternă.","english":"Listening to Mahler, Lyusya would always think of death and life eternal.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968825"},{"id":"tat-8979885","romanian":"Ne-am înțeles asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2704846","romanian":"De dimineață până seară el nu face nimic altceva decât să se plângă.","english":"He does nothing but complain from morning till night.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536493","romanian":"Hei, aș putea să nu am niciun ban, dar încă mai am mândrie.","english":"Hey, I may have no money, but I still have my pride.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-584199","romanian":"Într-un articol recent despre activităţi care să-ţi antreneze mintea, se menţionează Esperanto precum şi Sudoku, ceea ce denotă ca Esperanto devine parte a culturii de masă.","english":"In a recent article about activities to keep your brain young, they mention Esperanto along with Sudoku, which shows that Esperanto is becoming part of popular culture.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803575"},{"id":"tat-2536659","romanian":"Întrebarea cheie nu este ceea ce pot obține, ci ceea ce am de pierdut.","english":"The key question is not what can I gain but what do I have to lose.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4303252","romanian":"Noi priveam pasărea mâncând firimiturile; apoi am strănutat, și ea a dispărut într-o clipă.","english":"We were watching the bird eat the crumbs; then I sneezed, and he was gone in a flash.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6060858","romanian":"Poate ai putea sa inveti cite ceva de la el.","english":"Perhaps you could learn a thing or two from him.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-12946182","romanian":"Albinele sunt animale foarte utile pentru că produc miere, ceară și polenizează florile.","english":"Bees are very useful animals because they produce honey, wax, and pollinate flowers.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11674204","romanian":"Prima mea profesoară se numea Iracema. Iracema este, de asemenea, numele uneia dintre surorile mele.","english":"My first teacher was called Iracema. Iracema is also the name of one of my sisters.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143212","romanian":"Vasta câmpie se întindea cât vezi cu ochii, punctată cu plantații ici și colo.","english":"The spacious plain spread as far as the eye can see, dotted with groves here and there.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070003"},{"id":"tat-12013309","romanian":"Pentru mine, ca brazilian, studiul limbii galice este ceva cu adevărat delicios și captivant.","english":"For me, as a Brazilian, studying the Galician language is something truly delicious and captivating.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-8762418","romanian":"Valurile mă aruncau fără milă dintr-o parte într-alta, în timp ce mă zbăteam să-mi țin răsuflarea.","english":"The waves were tossing me viciously to and fro as I struggled to hold my breath.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1144311","romanian":"A privit șirul de cocori agăţat de tavan, pe care fratele ei Masahiro l-a agățat acolo pentru ea.","english":"She looked at her flight of cranes hanging from the ceiling, which her brother Masahiro had hung there for her.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073447"},{"id":"tat-12085368","romanian":"Rusia este pur și simplu casa unora dintre cele mai frumoase femei de pe planetă.","english":"Russia is simply home to some of the most beautiful women on the planet.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1291063","romanian":"Ești destul de mare cât să știi cum să te comporți. Fii cuminte.","english":"You are old enough to know better. Behave yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1153771","romanian":"Acel hotel parcurge într-adevăr tot drumul pentru a se asigura că oaspeții săi se simt ca acasă.","english":"That hotel really goes the extra mile to make sure their guests feel at home.","difficulty":9,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12128474"},{"id":"tat-12929969","romanian":"Poți să mă consideri romantică, draga mea soră, dar simt amarnic lipsa unui prieten.","english":"You may deem me romantic, my dear sister, but I bitterly feel the want of a friend.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-7187048","romanian":"Tom speră să obțină un profit în acest an, chiar dacă profitul va fi unul mic.","english":"Tom hopes to make a profit this year, albeit a small one.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-spaima-zmeilor","title":"Spaima zmeilor","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"A fost odată ce-au fost; a fost un om şi-o femeie, bărbat şi muiere, oameni de treabă, el bun şi ea cuminte, încât li se dusese vestea că trăiesc bine şi toţi se bucurau când treceau pe la casa lor."},{"id":"story-ro-c-lin-nebunul-2","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"A aruncat şi cel mijlociu şi tot aşa degrabă a ajuns. Da când a aruncat Călin Nebunul, a mers trei luni de zile, zi şi noapte, şi de-abia a ajuns. Acu ei, mergând pe drum, au gătit şi cremenea şi amnarul. De-abia au avut cu ce aţâţa oleacă de foc."},{"id":"story-ro-comoara","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":252,"excerpt":"Sănătatea! Binecuvântata de sănătate! Sănătos să fii, și ți-e destul un pumn de mălai, ca nici pe un împărat să nu te dai! Se scula Duțu cu noaptea-n cap și pleca-n cântarul cocoșilor, căci era lung drumul până la linie și ținea să se puie la lucru mai nainte de a se fi luminat de ziuă."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
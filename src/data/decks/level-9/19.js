@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-10788926","romanian":"Domnul Smith nu este disponibil. Doriți să vă faceți o programare pentru a veni să-l vedeți?","english":"Mr. Smith is not available. Would you like to make an appointment to come see him?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-705785","romanian":"În zilele de azi nu este neobișnuit pentru o femeie sa călătorească singură.","english":"Nowadays it is not unusual for a woman to travel alone.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963109"},{"id":"tat-11475333","romanian":"Ai putea avea te rog grijă de câinele meu mâine?","english":"Would you please look after my dog tomorrow?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13621515","romanian":"A doua zi dimineață, am regretat profund că am stat trează atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13563110","romanian":"Cei care se căsătoresc într-o zi ploioasă vor fi fericiți pentru toată viața.","english":"Whoever gets married on a rainy day will be happy for the rest of their life.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4993423","romanian":"Opozanții spun că culturile modificate genetic se pot poleniza încrucișat și pot strica alte culturi.","english":"Opponents say genetically engineered crops can cross-pollinate and damage other crops.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-582914","romanian":"Dacă cineva ridică din sprânceană, poate însemna \"Vreau să fac sex cu tine\", dar și \"Ceea ce tocmai ai spus mi se pare o mare prostie.\"","english":"If you raise an eyebrow, it can mean \"I want to have sex with you\", but also \"I find that what you just said is completely idiotic.\"","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6439042"},{"id":"tat-586211","romanian":"M-am uitat împrejur şi am observat că maşina mea era singura pe sosea.","english":"I looked around and noticed that I was the only car on the road.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7784539"},{"id":"tat-13603973","romanian":"Tom este cel care mi-a spus că ar trebui să citesc această carte.","english":"Tom is the one who told me that I should read this book.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2534180","romanian":"Isadora Duncan a dansat cu atâta grație încât a fost invitată să danseze în Europa.","english":"Isadora Duncan danced with such grace that she was invited to dance in Europe.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11639745","romanian":"Cum poate fi numită această Putere care a creat viața, timpul și atâtea trilioane de stele?","english":"What can be called this Power that created life, time and so many trillions of stars?","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-705789","romanian":"Am cerut să li se permită sa plece.","english":"I demanded that they be allowed to leave.","difficulty":7,"wordCount":8,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/963119"},{"id":"tat-6637595","romanian":"Din punctul de vedere al designului arhitectural, pot exista mai multe alternative cu privire la această abordare.","english":"From the standpoint of architectural design, there can be more alternatives to this approach.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-228","romanian":"Paradoxal, cu cat stim mai mult, cu atat devenim mai constienti de ignoranta noastra.","english":"Paradoxically, the more we know, the more aware we become of our ignorance.","difficulty":9,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6578340","romanian":"I-am spus lui Mary să nu facă asta, dar ea tot a făcut-o.","english":"I told Mary not to do that, but she did it anyway.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4698915","romanian":"Miau miau spuse pisica, ham ham răspunse cățelul, iar micul șoricel chițăi discret.","english":"Meow, meow, said the cat, \"Woof, woof\" replied the puppy and the little mouse squeaked discreetly.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568530","romanian":"Pentru el, foamea era un concept abstract; el a avut întotdeauna suficientă mâncare.","english":"To him, hunger was an abstract concept; he always had enough to eat.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6767614","romanian":"În realitate, explicația este un pic mai complicată decât asta, dar ai înțeles esențialul.","english":"In reality, the explanation is a bit more complicated than this, but you get the gist.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10787601","romanian":"Ai putea să te rănești dacă ai încerca să faci asta.","english":"You might get hurt if you tried doing that.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1136937","romanian":"Vrei, te rog, să mă iei de la hotel vineri pe 11 iulie la ora 10 dimineața?","english":"Would you please pick me up at the hotel on Friday July 11th at 10:00 a.m.?","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11967066"}],"stories":[{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."},{"id":"story-ro-borta-v-ntului","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":203,"excerpt":"Era un om sărac – sărac, ş-avea o mulţime de copii. Acu era – în vremea foametei şi el a muncit v-o săptămână pe un căuş de grăunţe. Acu s-a dus la râşniţă cu dânsele. După ce le-o râşnit, a ieşit afară cu căuşul cu făină şi s-a pornit o furtună mare şi i-a luat toată făina din căuş."},{"id":"story-ro-frumoasa-lumii-3","title":"Frumoasa lumii","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":221,"excerpt":"În a treia duminică, când a dus oul, a pus pe gânduri pe jidan. Şi s-a gândit aşa jidanul: l-a întrebat unde şede, să se ducă să vadă de unde are el ouă de aur. Vine jidanul; da’ el ţinea cuşca în colţul casei. Cum a intrat jidanul în casă – el ştia carte – odată şi-aruncă ochii-n fundul casei."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-8817097","romanian":"Dacă ai probleme, te voi ajuta să studiezi limba engleză.","english":"If you are having problems, I will help you study English.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-7166872","romanian":"Adoptarea unei diete cu conținut scăzut de calorii, vă va crește durata de viață.","english":"Adopting a low calorie diet will increase your lifespan.","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1185121","romanian":"Won-ul este folosit atât în Coreea de Nord, cât și în Coreea de Sud. Simbolul său este \"₩\".","english":"Won is used in both North Korea and South Korea. Its symbol is \"₩\".","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12323802"},{"id":"tat-5131142","romanian":"În clipa în care l-am văzut, am știut că e supărat pe mine.","english":"The moment I saw him, I knew he was angry with me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8746440","romanian":"Anglia și Scoția au fost unificate la 1 mai 1707, pentru a forma Regatul Marii Britanii.","english":"England and Scotland were unified on May 1, 1707, to form the Kingdom of Great Britain.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-226","romanian":"Indiferent de circumstante, trebuie sa ne pastram calmul si sa gandim clar.","english":"Regardless of circumstances, we must stay calm and think clearly.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-7115226","romanian":"Când un înțelept se va ridica din nou, el cu siguranță îmi va urma spusele.","english":"When a Sage shall again arise, he will certainly follow my words.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9028832","romanian":"Tom provenea dintr-un mediu umil, dar a devenit unul dintre cei mai bogați oameni din țară.","english":"Tom was from a humble background, but he became one of the richest men in the country.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-584323","romanian":"Dacă putem compara o limba maternă cu un copac, care s-a dezvoltat de-a lungul timpului, Esperanto poate fi comparată cu un copac artificial, care a fost creat artificial.","english":"If a natural language can be compared to a tree, which has developed during the course of time, Esperanto can be compared to a plastic tree, which was created artificially.","difficulty":10,"wordCount":28,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7803499"},{"id":"tat-9813136","romanian":"O pisică este un leu în miniatură care iubește șoarecii, urăște câinii și tolerează oamenii.","english":"A cat is a miniature lion that loves mice, hates dogs and tolerates humans.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9028817","romanian":"Se pare că pastilele pe care le-am luat mai devreme au fost eficiente.","english":"It seems that the pills I took earlier were effective.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136899","romanian":"Sora mea va trebui să își termine temele înainte de a pleca la Hokkaido.","english":"My sister will have finished her homework before she goes to Hokkaido.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960229"},{"id":"tat-11270397","romanian":"Mi se pare că am uitat că să închid lumina.","english":"I think that I forgot to turn off the lights.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-8921739","romanian":"Niciun viitor nu poate compensa ceea ce lăsați să se întâmple în prezent.","english":"No future can compensate for what you let happen in the present.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568478","romanian":"Am dormit un pic în timpul pauzei de prânz pentru că eram foarte obosit.","english":"I slept a little during lunch break because I was so tired.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6867529","romanian":"Datele empirice rezultate din acest experiment, par a fi în concordanță cu ipotezele teoretice.","english":"The empirical data from this experiment seems in line with the theoretical hypotheses.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536426","romanian":"Cei care locuiesc în case de sticlă nu ar trebui să arunce cu pietre.","english":"Those who live in glass houses should not throw stones.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6824680","romanian":"De acum înainte, această veveriță va fi cunoscută sub numele de \"Cea drăguță\".","english":"This squirrel shall be henceforth known as \"The Cute One.\"","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-216","romanian":"Literatura romana clasica reflecta lupta pentru identitate nationala.","english":"Classic Romanian literature reflects the struggle for national identity.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-c-lin-nebunul","title":"Călin-Nebunul","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":210,"excerpt":"Era odat-un împărat ş-avea trei fete şi erau aşa de frumoase, de la soare te puteai uita, da la dânsele ba. Acu, cele două erau cum erau, da cea mijlocie nici se mai povesteşte frumuseţea ei. Acu câţi feciori de-mpăraţi şi de ghinărari au cerut-o, împăratul n-a vrut să le-o deie."},{"id":"story-ro-palatul-de-cle-tar","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":225,"excerpt":"Cam pe la începutul vremilor, până unde praştia minţii nu azvârle, se povesteşte, aşa, ca din scorneală, că omul era croit din alte foarfeci şi cioplit din altă bardă."},{"id":"story-ro-flori-a-din-codru-3","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":224,"excerpt":"A mers dară vestea în lume şi în ţară cum că la crâşma din codru se bea vinul cel mai bun, crâşmăriţa din codru e cea mai frumoasă crâşmăriţă din ţară, şi cum că Floarea Codrilor e cea mai frumoasă fată din lume."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1138098","romanian":"Cu siguranță se poate spune că este cel mai mare pianist al secolului douăzeci.","english":"It may safely be said that he is the greatest pianist of the twentieth century.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4184076","romanian":"Latina este una dintre puținele limbi care necesită o bună cunoaștere a gramaticii.","english":"Latin is one of the few languages that requires a good knowledge of grammar.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2534227","romanian":"Terapeutul l-a făcut în sfârșit să vorbească despre cele prin care a trecut în timpul războiului.","english":"The therapist finally got him to open up about what he went through during the war.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-501535","romanian":"Cel care, mai ieri, socotea că îndrumă, conduce — se pomenește dintr-o dată întins țeapăn într-o cutie de lemn, iar cei din jur, dându-și seama că nu mai e bun de nimic, îl ard într-un cuptor.","english":"The one that just yesterday said he was guiding and leading finds himself, out of the blue, lying stiff in a wooden box; the others, after realising that he was worthless, burnt him in a furnace.","difficulty":10,"wordCount":36,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/4685148"},{"id":"tat-13063081","romanian":"Puii au evoluat din alte păsări care au depus ouă, așa că oul a fost primul.","english":"Chickens evolved from other birds that laid eggs, so the egg came first.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-10792151","romanian":"Dulapul este confecționat din lemn de culoare închisă și are mânere ornamentate din aur.","english":"The wardrobe is made from dark wood and has ornate gold handles.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4994597","romanian":"Teroriștii au promis că eliberează ostaticul dacă președintele poate să stea într-un picior preț de un minut.","english":"The terrorists promised to release the hostage if the president is able to stand on one leg for a minute.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2536729","romanian":"Să faci calcule este singurul mod social acceptabil de a te masturba în public.","english":"Doing math is the only socially acceptable way to masturbate in public.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-208","romanian":"Trebuie sa gandim pe termen lung, nu doar pe moment.","english":"We must think long-term, not just for the moment.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-2536451","romanian":"Ar fi distractiv să vezi cum se schimbă lucrurile de-a lungul anilor.","english":"It would be fun to see how things change over the years.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-7115224","romanian":"Ambii sportivi sunt foarte îndârjiți și deseori pot să apară animozități între ei.","english":"Both sportsmen are very competitive and, often, animosities arise between them.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136694","romanian":"Demis în urma unei lovituri militare în septembrie 2006, fostul prim-ministru al Thailandei s-a reîntors în țară după aproape un an și jumătate de exil.","english":"Deposed in a military coup in September 2006 and having effectively been in exile, the Former premier of Thailand Thaksin has returned after about a year and a half.","difficulty":9,"wordCount":25,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239539"},{"id":"tat-6638268","romanian":"Producția industrială a animalelor, este principalul factor care contribuie la sporirea gazelor cu efect de seră.","english":"The industrial production of livestock is the leading contributor to greenhouse gases.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2568442","romanian":"E nevoie de înțelepciune pentru a înțelege înțelepciunea: muzica nu înseamnă nimic dacă publicul e surd.","english":"It requires wisdom to understand wisdom: the music is nothing if the audience is deaf.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5180215","romanian":"Oamenii respiră în mod normal de la douăsprezece până la douăzeci de ori pe minut.","english":"People normally breathe 12 to 20 times a minute.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-201","romanian":"Desi era obosit, a continuat sa lucreze pana tarziu in noapte.","english":"Although he was tired, he continued to work late into the night.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-10452185","romanian":"Într-o cafenea din Jakarta, Indonezia, proprietarii doresc să promoveze comunicația, înțelegerea și toleranța angajând oameni fără auz.","english":"At a coffee shop in Jakarta, Indonesia, the owners want to promote communication, understanding and tolerance by employing people who can’t hear.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-5144503","romanian":"Subiectul unei propoziții este, de obicei, o persoană sau un lucru care efectuează acțiunea indicată de verb.","english":"The subject of a sentence is usually a person or a thing performing the action shown by the verb.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-13617013","romanian":"Wisconsin este cunoscut pentru produsele sale lactate, nu pentru vacile sale de lapte.","english":"Wisconsin is known for its dairy, not for its dairy cows.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10788510","romanian":"Știam că Tom ar putea să nu fie în stare să facă asta.","english":"I knew that Tom might not be able to do that.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."},{"id":"story-ro-vasilie-finul-lui-dumnezeu-2","title":"Vasilie-finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Băiatul lui i-o spus: iaca, tată, din ce pricină. Şi omul s-o sfătuit cu mama fetei, s-o prăpădească din pricina asta. Au tocmit un om, ş-au pus pe fată ‘n căruţă ş-au zis s-o ducă ‘ntr-o pustietate, şi să-i scoată ochii amândoi să-i aducă tătâne-său. Omul a luat-o. După fată se ţinea ş-un căţeluş."},{"id":"story-ro-v-duvele-2","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"Aşa e. Că de ne-om cântări cuvântul cu cântarul şi ne-om măsura privirea cu cotul, ori să numeri câte pahare de vin a băut omul la masa ta ca să nu-l înşeli la a lui, s-a dus prietenia pe copcă, c-aşa e făcută să fie dragostea, fără ştreang de gât şi fără căluş în gură."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
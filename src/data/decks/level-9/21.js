@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-204","romanian":"Fiecare experienta ne invata ceva important despre viata.","english":"Every experience teaches us something important about life.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-1185114","romanian":"Terapeutul meu mi-a spus să merg într-un bar și să încep o conversaţie cu un străin absolut.","english":"My therapist told me to go to a bar and strike up a conversation with a complete stranger.","difficulty":8,"wordCount":17,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12322931"},{"id":"tat-239","romanian":"Reconcilierea aparentelor contradictii intre determinism si libertate ramane o provocare filozofica majora.","english":"Reconciling the apparent contradictions between determinism and freedom remains a major philosophical challenge.","difficulty":10,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-5252491","romanian":"Tom și Mary au fost de acord să plece de la petrecere înainte de miezul nopții.","english":"Tom and Mary agreed to leave the party before midnight.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-2536598","romanian":"Știi fraza „recoltăm ce semănăm”. Am semănat vânt și aceasta e furtuna mea.","english":"You know the phrase, we reap what we sow. I have sown the wind and this is my storm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11658152","romanian":"Girafa este cel mai înalt animal din existență, dar au existat și dinozauri mai înalți.","english":"The giraffe is the tallest animal in existence, but there were even taller dinosaurs.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6614173","romanian":"Dl. și dna. Yamada se vor întoarce în țara lor de baștină luna viitoare.","english":"Mr. and Mrs. Yamada will return to their homeland next month.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13621513","romanian":"A doua zi dimineață, am regretat profund că am stat treaz atât de târziu.","english":"I thoroughly regretted staying up so late, come morning.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136703","romanian":"Senatul a hotărât să fie ales un nou consul şi țara să fie eliberată de inamici.","english":"The Senate decreed that a new consul be chosen and the country be delivered from the enemies.","difficulty":7,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7212781"},{"id":"tat-13612858","romanian":"Tom spuse că Mary știa că John s-ar putea să fie nevoit să facă asta singur.","english":"Tom said Mary knew John might need to do that by himself.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7115229","romanian":"Dacă se va legaliza vânzarea de organe, atunci eventuale probleme de sănătate pot să apară.","english":"If the sale of organs is legalised, potential health problems may arise.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-7187050","romanian":"Multe companii de software oferă versiuni gratuite ale produselor lor, dar cu funcționalitate limitată.","english":"Many software companies offer free versions of their products, albeit with limited functionality.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10827564","romanian":"Am găsit un portofel pe jos și i l-am dat agentului de pază.","english":"I found a wallet on the ground and gave it to the security guard.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-231","romanian":"Arta are capacitatea unica de a transcende barierele culturale si lingvistice.","english":"Art has the unique ability to transcend cultural and linguistic barriers.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5316056","romanian":"Cel mai periculos lucru pe care Tom l-a făcut vreodată a fost săritura cu coarda elastică.","english":"The most dangerous thing Tom ever tried to do was bungee jumping.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-219","romanian":"Analiza detaliata a datelor a relevat tendinte neasteptate.","english":"Detailed data analysis revealed unexpected trends.","difficulty":8,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-6591110","romanian":"Te rog să-ți aduci aminte să pui această scrisoare la poștă în drum spre școală.","english":"Please remember to mail this letter on your way to school.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-708926","romanian":"Ne-am ascuns după un tufiş pentru ca nimeni să nu ne vadă.","english":"We hid behind a bush so that no one would see us.","difficulty":7,"wordCount":12,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/8397998"},{"id":"tat-1138032","romanian":"Ar fi fost mai bine să nu te fi dus acolo.","english":"You had better not have gone there.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-1144321","romanian":"Cam acum patru ani, tendonul lui Ahile a început să mă doare și mi s-a spus că e tendinită.","english":"About four years ago my Achilles tendon started to hurt and I was told it was Achilles tendonitis.","difficulty":8,"wordCount":19,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12073567"}],"stories":[{"id":"story-ro-palatul-de-cle-tar-3","title":"Palatul de cleştar","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":268,"excerpt":"Nu trecu cât ai scăpăra din amnar, şi se apropiară de împărat, cu mângâieri şi dezmierdări, odrasla lui, de trei fete, ca trei zâne, surori şi nepoate, care mai de care mai chipeşe şi mai drăgălaşe. Apoi veniră mai-marii tronului şi slugile ohavnice. Toţi cu toţi ieşiră ca dintr-o lacră, să cadă cu mătănii, doară or curma focul împăratului."},{"id":"story-ro-v-duvele","title":"Văduvele","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":210,"excerpt":"Oamenii, când n-au ce face, se-apucă de gâlceavă. Se dau la vorbă, şi destul e unul s-o apuce anapoda, că cearta e gata. Prostia pândeşte mintea omului cum pândesc lupii razna oilor."},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-211","romanian":"Situatia economica actuala ne obliga sa facem schimbari importante.","english":"The current economic situation forces us to make important changes.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-586150","romanian":"Înţeleg perfect italiana, se lăudă ea în timp ce alegea meniul, dar când i-a fost servită mâncarea, nu era nicidecum ce aşteptase.","english":"I understand Italian perfectly, she boasted while choosing a dish from the menu, but when the food was served, it was not at all what she expected.","difficulty":10,"wordCount":22,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7778534"},{"id":"tat-6825116","romanian":"Artistul a pictat cele mai complicate picturi murale pe peretele vechi, de piatră.","english":"The artist painted the most intricate of murals on the old stone wall.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2837196","romanian":"Arată-mi faţa ta şi lasă-mă să-ţi aud glasul, căci glasul tău este dulce, iar faţa ta este încântătoare!","english":"Shew me thy face, let thy voice sound in my ears: for thy voice is sweet, and thy face comely.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-232","romanian":"Intrebarea fundamentala nu este ce stim, ci cum aplicam ceea ce stim.","english":"The fundamental question is not what we know, but how we apply what we know.","difficulty":9,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-6794408","romanian":"Creierul uman este un lucru minunat. Funcționează până în momentul în care ții un discurs.","english":"The human brain is a wondrous thing. It works until the moment you stand up to make a speech.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1288424","romanian":"Cei care folosesc furculița s-au aflat din punct de vedere istoric mereu în minoritate.","english":"Fork-users have historically been in the minority.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2536699","romanian":"Într-un dicționar ca acesta ar trebui să existe cel puțin două propoziții cu „frigider”.","english":"In a dictionary like this one there should be at least two sentences with \"fridge\".","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-3209109","romanian":"S-ar putea să mă înșel, dar cred că Tom vrea să meargă acasă devreme.","english":"I could be wrong, but I think Tom wants to go home early.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-207","romanian":"El a reusit sa depaseasca toate obstacolele din calea lui.","english":"He managed to overcome all the obstacles in his way.","difficulty":7,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-10787417","romanian":"Una dintre fetițe s-a oprit și s-a întors să se uite la mine.","english":"One of the little girls stopped and turned back to look at me.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5078655","romanian":"Acela a fost locul unde cele două armate se vor bate din nou.","english":"That was where the two armies would fight again.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-862376","romanian":"Din cauză că lumina călătoreşte mai repede decât sunetul, unii oameni par geniali înainte de a suna stupizi.","english":"It is because light travels faster than sound that some people look brilliant before sounding stupid.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/9457136"},{"id":"tat-610855","romanian":"La începutul fiecărui sfârşit de săptămână sunt în acelaşi timp obosit şi bucuros.","english":"At the start of every weekend, I am both tired and happy.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/684564"},{"id":"tat-13632991","romanian":"Portretul realizat de el nu a reușit să surprindă natura misterioasă și tulburătoare a frumuseții ei.","english":"His portrait failed to truly capture the mysterious and haunting nature of her beauty.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1186853","romanian":"- 30 de dolari e mult pentru acea cameră mică, se gândi el.","english":"Thirty dollars is a lot for that small room, he thought.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12338197"},{"id":"tat-7707602","romanian":"Ei nu mai aveau mere, așă că am cumpărat niște banane în schimb.","english":"They were all out of apples, so I bought some bananas instead.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5227954","romanian":"Însoțitoarea de zbor l-a zgâlțâit pe Tom ca să-l trezească și i-a spus că avionul aterizase.","english":"The flight attendant shook Tom awake and told him that the plane had landed.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6741797","romanian":"Dintre toți jucătorii de baseball faimoși, el se evidențiază ca fiind un geniu.","english":"Of all the famous baseball players, he stands out as a genius.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-sult-nica","title":"Sultănica","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":223,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sultănica D-a stânga Râului Doamnei, razna de satul Domneşti, se vede o casă, albă ca laptele, cu ferestrele încondeiate cu roşu şi albastru."},{"id":"story-ro-p-dureanca-3","title":"Pădureanca","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":213,"excerpt":"Ți-e scris, ți-e scris; nu ți-e scris, nu ți-e scris, și sănătate bună. Socoteala lui Busuioc era făcută: n-avea decât să pună caii la câteva căruțe, să plece la păduri ca să-și aducă oamenii, și apoi ar fi vrut el să știe care-i acela, un om din Curtici, care ar îndrăzni să facă gură."},{"id":"story-ro-finul-lui-dumnezeu-2","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":201,"excerpt":"Fata s-a dus cu demâncat drept la curtea zmeului. Aşteaptă ei să vie – nu-i! – Eh! mamă, mă duc să-mi caut sora că mi-a luat-o zmeul – a zis finul lui D-zeu! Ş-o făcut el o boambă de fier la ţigani în loc de călăuz şi-o zvârlea şi el mergea după dânsa."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
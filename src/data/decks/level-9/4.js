@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-2568506","romanian":"Un cititor viclean trebuie să fie dispus să cântărească tot ceea ce citește, inclusiv sursele anonime.","english":"An astute reader should be willing to weigh everything they read, including anonymous sources.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-10450614","romanian":"Biletele sunt 30 de dolari pentru adulți și 15 de dolari pentru copiii de peste 4 ani.","english":"Tickets are $30 for adults and $15 for children over 4 years old.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-2536438","romanian":"Acesta va fi un bun suvenir din călătoria mea în jurul Statelor Unite.","english":"This will be a good souvenir of my trip around the United States.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1291046","romanian":"Dansatoarele par fragile în rochiile lor albe, dar în realitate sunt foarte puternice.","english":"The dancers look delicate in their white dresses, but they are really as strong as horses.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13598708","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singură.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-7361805","romanian":"Casa noastră actuală este prea mică, așa că ne-am decis să ne mutăm.","english":"Our current house is too small, so we decided to move.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6635545","romanian":"În ciuda faptului că, în medie, femeile sunt mai inteligente decât bărbații, majoritatea geniilor sunt bărbați.","english":"Notwithstanding the fact that on average women are more intelligent than men, most geniuses are men.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6838427","romanian":"Înainte de apariția antibioticelor, medicii aveau tratamente eficiente doar pentru un număr limitat de boli.","english":"Before the advent of antibiotics, physicians had effective treatments for but a handful of diseases.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1137565","romanian":"Cu ajutorul acestei aplicații, veți putea sincroniza fotografiile și muzica între aparatele dumneavoastră.","english":"This app will let you sync your photos and music between all your devices.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1142926","romanian":"Acum, vom arăta cum această lemă poate fi folosită în demonstrarea teoremei principale.","english":"Now, we show how this lemma can be used to prove our main theorem.","difficulty":7,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12066559"},{"id":"tat-9952605","romanian":"Tom a spus că este dispus să ne împrumute trei mii de dolari.","english":"Tom said he was willing to lend us three thousand dollars.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-227","romanian":"Conceptul de libertate individuala a evoluat semnificativ de-a lungul istoriei.","english":"The concept of individual freedom has evolved significantly throughout history.","difficulty":9,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-6826727","romanian":"Fericirea, am descoperit, este aproape întotdeauna o revenire dintr-o muncă grea.","english":"Happiness, I have discovered, is nearly always a rebound from hard work.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-3629565","romanian":"În aritmetica iubirii, unu plus unu fac totul, pe când doi minus unu este egal cu zero.","english":"In the arithmetic of love, one plus one makes a whole, and two minus one equals zero.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-1136933","romanian":"Se simţea ca și cum ar fi fost în vis.","english":"He felt as if he were in a dream.","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11960496"},{"id":"tat-706018","romanian":"Dacă este adevărat că grecii le interziceau femeilor să meargă la teatru, atunci procedau corect; pentru că așa cu siguranța ar fi putut să audă ceva.","english":"If it is true that the Greeks forbade women to go to the play, they acted in a right way; for they would at any rate be able to hear something.","difficulty":10,"wordCount":26,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/968848"},{"id":"tat-2568518","romanian":"Sarah a avut suficient discernământ pentru a realiza că prietenii ei încercau să-i facă o farsă.","english":"Sarah was discerning enough to realize that her friends were trying to prank her.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12328330","romanian":"Fiecare limbă care se stinge ia cu ea o bucată din istoria umană.","english":"Every language that dies out takes a piece of human history with it.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-12355737","romanian":"Nu știu ce motiv a fost pentru care nu mi-ai trimis o scrisoare.","english":"I do not know what reason there was why you did not send me a letter.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-stan-bolovan-2","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":217,"excerpt":"Acolo află că un zmeu vine în fiecare noapte şi le ia câte trei oi, dar şi laptele de la şaptezeci şi şapte de oi, pe care îl ducea zmeoaicei bătrâne, să se scalde în el ca să întinerească."},{"id":"story-ro-budulea-taichii-2","title":"Budulea Taichii","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":204,"excerpt":"Fluierul îl purta Budulea totdeauna în șerpar; altfel nu l-am văzut de când îl țin minte și nici nu-mi pot închipui un Budulea făr' de fluier în șerpar."},{"id":"story-ro-sorcova-3","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":241,"excerpt":"II Zăpada îi pătrunsese în tindă; vântul îi cânta prin crăpăturile uşii parc-ar fi vuit în duba mare; şi Bălaşa era întinsă în pat, învelită c-o plapumă veche, soioasă şi ciuruită cu găuri prin care ieşeau gheomotoacele de lână neagră. Pe picioare îşi trântise două scovergi."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1153159","romanian":"Bunicul meu a adunat o avere mare pe piaţa stocurilor şi apoi a pierdut-o în întregime peste noapte.","english":"My grandfather amassed a great fortune in the stock market and then lost it all over night.","difficulty":8,"wordCount":18,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1751960"},{"id":"tat-7187127","romanian":"O galaxie este un grup de stele, praf și gaze și este susținută de către gravitație.","english":"A galaxy is a cluster of stars, dust, and gas which is held together by gravity.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-5179395","romanian":"Doar ca să te menții în viață este suficient de greu în aceste timpuri.","english":"Just staying alive in these times is hard enough.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1288426","romanian":"Câțiva dintre noi din Westmont de asemenea mergem la Ensanada în acest sfârșit de săptămână!","english":"A group of us from Westmont is going to Ensanada this weekend as well!","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-12330526","romanian":"Imediat ce am ajuns la gară, m-am dus să-mi vizitez unchiul în biroul lui.","english":"On arriving at the station, I went to see my uncle at his office.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-6867575","romanian":"Procurorii în instanță trebuie să-și justifice afirmațiile pentru a demonstra că un suspect este vinovat.","english":"Prosecutors in court have to substantiate their claims in order to prove a suspect is guilty.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11657708","romanian":"Obișnuia să cumpere șoricei albi pentru ca boa constrictor-ul ei să-i ucidă și să-i mănânce.","english":"She used to buy white mice for her boa constrictor to kill and eat.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6068363","romanian":"Acești arbori cotiți sunt echilibrați cu precizie pentru motoarele cu turație ridicată și lină.","english":"These crank shafts are precision balanced for smooth high revving engines.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10452045","romanian":"Deși mulți grăiesc vorbe goale în fața ideii de acțiune afirmativă, în realitate, foarte puține minorități sunt angajate.","english":"Although many pay lip service to the idea of affirmative action, in reality, very few minorities get hired.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-1138134","romanian":"Dacă vrei să pari vorbitor nativ, ascultă vorbitori nativi de câte ori este posibil.","english":"If you want to sound like a native speaker, listen to native speakers whenever possible.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-4144674","romanian":"Dacă îmi aduc bine aminte, ai fost destul de optimist la acel moment.","english":"If I remember correctly, you were quite optimistic at that time.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2705264","romanian":"Mâine, în drum spre școală, te rog, nu uita să expediezi scrisoarea aceasta.","english":"Please remember to mail this letter on your way to school tomorrow morning.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1143142","romanian":"Dacă studenții în ziua de azi ar avea mai mult timp liber, ar putea arăta mai mult interes pentru politică.","english":"If students today had more free time, they might show more interest in politics.","difficulty":9,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068924"},{"id":"tat-2568515","romanian":"De fiecare dată când mă alătur unui nou joc de Warcraft, dau de o nouă echipă de adversari.","english":"Every time I join a new game of Warcraft, I am pitted against a new team of adversaries.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-2568484","romanian":"Locuiesc aproape de mare, așa că am de multe ori ocazia să merg la plajă.","english":"I live near the sea, so I often get to go to the beach.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-864483","romanian":"Fiecare este o lună, și are o parte întunecată pe care nu o arată nimănui niciodată.","english":"Everyone is a moon, and has a dark side which he never shows to anybody.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6827316"},{"id":"tat-13616959","romanian":"Tu poți avea o priveliște spre munții acoperiți de zăpadă din această casă în copac.","english":"You can get a great view of the snow-capped mountains from this treehouse.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8979884","romanian":"Am convenit asupra unui preț, dar după aceea au vrut 10 dolari în plus.","english":"We agreed on a price, but afterwards they wanted 10 dollars extra.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12048793","romanian":"Drumul până acolo nu este foarte bun, dar ar putea fi și mai rău.","english":"The road to get there is not very good, but it could be worse.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-584098","romanian":"O traducere e ca o femeie. Dacă e frumoasă, nu e fidelă. Dacă e fidelă, nu este cu siguranţă frumoasă.","english":"Translation is like a woman. If it is beautiful, it is not faithful. If it is faithful, it is most certainly not beautiful.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/7802396"}],"stories":[{"id":"story-ro-finul-lui-dumnezeu","title":"Finul-lui-Dumnezeu","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":204,"excerpt":"Poveste, poveste – da eu nu-s de pe când poveştile – eu sunt de mai încoace, da m-am dus într-o zi la soacră-mea ş’am găsit un sac de poveşti, şi venind a casă l-am scăpat jos şi s-o despicat sacul şi de-atunci s-o împlut lumea de poveşti ş’ am învăţat şi eu una şi ţ-o spun d-tale."},{"id":"story-ro-p-cal-n-satul-lui","title":"Păcală în satul lui","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"I se urâse şi lui Păcală să tot umble răzleţ prin lume, aşa fără de nici o treabă, numai ca să încurce trebile altora şi să râdă de prostia oamenilor."},{"id":"story-ro-sorcova","title":"Sorcova","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":205,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Sorcova Troienele se ridicau namilă până în tinda creştinului. Vântul spulbera fulgii de zăpadă în vârteje şi stoluri, repezite în lungul uliţelor, sparte la răspântii şi împrăştiate fără căpătâi în largul maidanelor de la Olănita. Pârtia nu se mai cunoştea. Zăpada îţi trecea de glezne şi mai bine."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-7578033","romanian":"Mă doare gâtul și am și febră. Poți să-mi dai niște medicamente pentru răceală?","english":"My throat hurts, and I have a fever. Can I have some cold medicine?","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1136687","romanian":"Mai întâi cred că primul lucru pe care îl observă un străin ajuns în China este cu siguranță mărimea țării.","english":"Firstly, I think that the first time each foreigner is in China, the earliest impression is certainly the size of the country.","difficulty":8,"wordCount":20,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6239573"},{"id":"tat-210","romanian":"Istoria ne invata ca nimic nu este permanent.","english":"History teaches us that nothing is permanent.","difficulty":7,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-9815683","romanian":"Tom și Mary au spus că s-ar putea să nu fie nevoie să facă asta.","english":"Tom and Mary said they thought they might not need to do that.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6764268","romanian":"El a crezut că afirmația ei este pur și simplu imposibilă și a consimțit propunerea.","english":"He believed her assertion to be simply impossible and assented to the proposal.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143211","romanian":"Patru metri din acest material costă nouă franci; deci doi metri costă patru franci și jumătate.","english":"Four metres of this material cost nine francs; therefore, two metres cost four and a half francs.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12070001"},{"id":"tat-2536724","romanian":"Matematicieni sunt poeți, cu excepția faptului că ei trebuie să dovedească ceea ce creează fantezia lor.","english":"Mathematicians are poets, except that they have to prove what their fantasy creates.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11487762","romanian":"Genele noastre ne definesc înfățișarea și trăsăturile. Experiențele definesc cine suntem.","english":"Our genetics define our appearances and traits. Our experiences define who we are.","difficulty":7,"wordCount":11,"hasAudio":false,"audioUrl":null},{"id":"tat-13632854","romanian":"Există o scădere vizibilă în ceea ce privește respectul pentru autorități și tradiții.","english":"There’s a noticeable decline in respect for authority and tradition.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5144512","romanian":"O parolă bună ar trebui să fie greu de ghicit, dar ușor de reținut.","english":"A good password should be difficult to guess, but easy to remember.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12319007","romanian":"Cronica unei morți anunțate este un roman al scriitorului columbian Gabriel García Márquez.","english":"Chronicle of a Death Foretold is a novel by the Colombian writer Gabriel García Márquez.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1136817","romanian":"Dreptul apei este domeniul dreptului care se ocupă cu proprietatea, controlul și utilizarea apei ca resursă.","english":"Water law is the field of law dealing with the ownership, control, and use of water as a resource.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/11966559"},{"id":"tat-212","romanian":"Rezultatele cercetarii au demonstrat ca teoria initiala era corecta.","english":"The research results demonstrated that the initial theory was correct.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-8863126","romanian":"Ai putea să spui pe litere pentru mine, te rog?","english":"Could you spell that for me, please?","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-13619641","romanian":"Taipanul de uscat, un șarpe întâlnit în Australia, este cel mai veninos șarpe din lume.","english":"The inland taipan, a snake found in Australia, is the most venomous snake in the world.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-4987493","romanian":"Multe propoziții despre care cred că sună bine sunt considerate nenaturale de către vorbitorii nativi.","english":"Many phrases that I think sound fine are considered unnatural by native speakers.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-6709926","romanian":"Tom, un milionar care a făcut avere prin propriile forțe, a trăit într-o sărăcie abjectă când era copil.","english":"Tom, a self-made millionaire, had lived in abject poverty as a child.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-8741689","romanian":"Samuel și Michael vorbeau despre o fată pe care Bryan a cunoscut-o în Brazilia anul trecut.","english":"Samuel and Michael were talking about a girl Bryan met in Brazil last year.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-13615591","romanian":"Te poți uita în geanta ta? Mi-am pus mobilul acolo.","english":"Can you have a look in your bag? I put my mobile in there.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5232576","romanian":"Îți amintești perioada când l-am vizitat pe Tom atunci când el încă era adolescent?","english":"Can you remember the time we visited Tom when he was still a teenager?","difficulty":8,"wordCount":14,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-stan-bolovan","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":220,"excerpt":"Au fost odată, într-o margine de sat, un om, pe nume Stan, şi muierea lui. Ea era tristă mereu şi degeaba încerca soţul ei să afle de ce, că ea nu voia să-i spună, căci, zicea ea, avea să fie şi el trist dacă află."},{"id":"story-ro-comoara-2","title":"Comoara","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"Iar dacă erau odată la han, nu puteau să macine-n sec: tot pe timpul cât stătuse-n oștire a luat Duțu și deprinderea de a nu-și trage, când n-are nevoie, nimic de la gură. De ce adecă muncea el toată săptămâna?!"},{"id":"story-ro-f-t-frumos-din-lacrim-2","title":"Făt-Frumos din lacrimă","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":213,"excerpt":"Lungi cearcăne vinete se trăgeau împrejurul ochilor, şi vine albastre se trăgeau pe faţa ei albă ca o marmură vie. Sculată din patul ei, ea se aruncă pe treptele de piatră a unei bolte în zid, în care veghea, deasupra unei candele fumegânde, icoana îmbrăcată în argint a Maicii durerilor."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-1418733","romanian":"Sora mea cea mică are doi copii, ceea ce înseamnă că am doi nepoți.","english":"My younger sister has two sons, which means I have two nephews.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-5165096","romanian":"Când vaca zboară la înălțime și boul zboară aproape de sol, probabil că este o tornadă.","english":"When the cow flies high and the ox flies low, there probably is a twister.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-407952","romanian":"Imediat ce îi contactați pe prietenii dumneavoastră, spuneți-le că se apropie o avalanșă.","english":"As soon as you contact your friends, tell them that an avalanche is coming.","difficulty":8,"wordCount":13,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6525177"},{"id":"tat-8760980","romanian":"Preotul a mers de câteva ori prin mijlocul enoriașilor, răspândind miros de tămâie din cădelniță.","english":"The priest walked among the parishioners several times, spreading the smell of incense from the censer.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-8773155","romanian":"Layla a intrat într-o depresie profundă în urma pierderii celei mai bune prietene a ei, Salima.","english":"Layla slipped into a deep depression over the loss of her best friend, Salima.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-6710037","romanian":"De obicei, el este direct și sincer și astfel câștigă încrederea celor care îl întâlnesc.","english":"He is usually straightforward and sincere and thereby gains the confidence of those who meet him.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-11790112","romanian":"Dacă această echipă continuă să joace atât de prost, va fi retrogradată din nou.","english":"If this team continues to play this badly, it will be demoted again.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-12040285","romanian":"Există unele avioane, numite planoare, care nu au deloc motoare, dar zboară foarte bine.","english":"There are some aircraft, called gliders, that have no engines at all, but fly just fine.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-10727979","romanian":"Totul s-a întâmplat așa cum ai spus tu că se va întâmpla.","english":"Everything happened just like you said it would.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-10830414","romanian":"Au refuzat să-mi plătească salariul pentru că am uitat să completez corect formularele.","english":"They refused to pay my salary because I forgot to fill out the forms correctly.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1138145","romanian":"Anul trecut în Filipine, cutremurele şi valurile gigantice au produs moartea a mai mult de 6000 de oameni.","english":"Last year in the Philippines, earthquakes and tidal waves resulted in the deaths of more than 6000 people.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-487291","romanian":"De ce a cumpărat o trambulină proprietarul de șaizeci de ani al locuinței unde stau?","english":"Why did my sixty-year-old landlord buy a trampoline?","difficulty":7,"wordCount":15,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6270621"},{"id":"tat-12111968","romanian":"Dacă măslinii ar cunoaște mâinile care i-au plantat, uleiul lor ar deveni lacrimi.","english":"If olive trees knew the hands that planted them, their oil would become tears.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13612966","romanian":"Am crezut că vrei să mănânci la acel restaurant chinezesc de pe Park Street.","english":"I thought you wanted to eat at that Chinese restaurant on Park Street.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-13621249","romanian":"Turiștii au început să bâiguie entuziasmați de îndată ce ghidul a menționat fantomele.","english":"The tourists began to gabble excitedly as soon as the guide mentioned ghosts.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536642","romanian":"Cei selecționați vor trebui să se confrunte cu teste medicale și psihologice ample.","english":"Those selected will have to face extensive medical and psychological tests.","difficulty":8,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2536167","romanian":"Fiecare persoană care e singură e singură pentru că se teme de alții.","english":"Every person who is alone is alone because they are afraid of others.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-13598707","romanian":"Nu mai îmi cere să-ți aduc ceva de băut! Du-te și ia-ți singur.","english":"Stop asking me to bring you a drink! Go and get one yourself.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-1192831","romanian":"La acest centru de învățare a limbilor, se predau aproximativ 15 limbi internaționale inclusiv limba engleză.","english":"At this language centre, about 15 international languages are taught, including English.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12360495"},{"id":"tat-5226266","romanian":"Tom s-a comportat ca și cum ar fi fost fericit, dar în interior era supărat.","english":"Tom acted happy, but deep inside he was sad.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-scrisoarea-iii","title":"Scrisoarea III","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":145,"excerpt":"Unde-Loss'n ceruri senine Luceafarul rasare, Din negura de vremi acolo moartea a lasat urma, Acolo sufletul se-Loss'ntreaba: \"Ce-Loss'n veacul veacului nu moare?\" Si glasul vremii-Loss'n raspuns sopteste tainic: \"Numai urma.\" Pe cand lumea toata doarme-Loss'n noapte, Trecut-au ani si veacuri, si totusi noi vedem Pe bolta-Loss'nstelata aceleasi stele-Loss'napte Ce-au luminat si Mircea, si Stefan cel Batran."},{"id":"story-ro-borta-v-ntului-3","title":"Borta-vântului","author":"Mihai Eminescu","difficulty":7,"genre":"poetry","wordCount":202,"excerpt":"Omul a doua zi se scoală, ia măgarul şi se duce – acasă şi-i zice: măgar, fa bani! Măgarul, de unde? El apuc’ un druc şi ‘ncepe a dişăla măgarul. – Acu nu-l mai iert eu. Se porneşte să ‘ntâlnească pe moşneag şi s’ astupe borta vântului. Întâlneşte pe D-zeu."},{"id":"story-ro-stan-bolovan-3","title":"Stan Bolovan","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":207,"excerpt":"Aflând Stan că anul e de trei zile, iar simbria de şapte saci de galbeni pe zi, se învoi şi plecă cu zmeul. Ajunseră nu departe de casă, iar Stan o zări pe mama zmeului, bătrână şi groaznică la vedere."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-487040","romanian":"Noi am trăit în Osaka timp de zece ani înainte de a ne muta in Tokyo.","english":"We had lived in Osaka for ten years before we came to Tokyo.","difficulty":9,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/6435976"},{"id":"tat-5370019","romanian":"Un intelectual este o persoană care a descoperit ceva mai interesant decât sexul.","english":"An intellectual is a person who has discovered something more interesting than sex.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-4993454","romanian":"O persoană având indicele de masă corporală de la 25 la 29 e considerată supraponderală.","english":"A person with a BMI of 25 to 29 is considered overweight.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1143256","romanian":"Fabrica a fost închisă pentru renovare şi va fi deschisă pe 1 septembrie 2007.","english":"The factory is closed for refurbishment and will re-open on 1st September 2007.","difficulty":7,"wordCount":14,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068570"},{"id":"tat-4993240","romanian":"Experții spun că prețul cafelei crește în primul rând pentru că oamenii sunt dispuși să plătească mai mult.","english":"Experts say coffee prices are rising mainly because people are willing to pay more.","difficulty":8,"wordCount":18,"hasAudio":false,"audioUrl":null},{"id":"tat-4977405","romanian":"Acest magazin vinde îmbrăcăminte și încălțăminte atât pentru bărbați cât și pentru femei.","english":"This store sells clothes and shoes for both men and women.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-2568457","romanian":"Oamenii care iubesc nu se îndoiesc de nimic sau pun la îndoială totul.","english":"People who love doubt nothing, or doubt everything.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-9408703","romanian":"Tom a spus că a crezut că i se va permite lui Mary să facă asta.","english":"Tom said he thought that Mary might be allowed to do that.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-206","romanian":"Problemele complexe necesita solutii creative si inovatoare.","english":"Complex problems require creative and innovative solutions.","difficulty":7,"wordCount":7,"hasAudio":false,"audioUrl":null},{"id":"tat-5236279","romanian":"L-am întrebat pe Tom dacă el o poate avea gata până la 2:30.","english":"I asked Tom if he could have it ready by 2:30.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5345650","romanian":"Merg prin cartierul chinezesc și admir simbolurile frumoase pe care tot nu le înțeleg încă.","english":"I go through Chinatown and admire the beautiful signs that I still do not understand.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-221","romanian":"Trebuie sa evaluam cu atentie toate optiunile inainte de a decide.","english":"We must carefully evaluate all options before deciding.","difficulty":8,"wordCount":9,"hasAudio":false,"audioUrl":null},{"id":"tat-1138114","romanian":"Nu trebuie să citești o asemenea revistă pentru că îți va face rău.","english":"You must not read such a magazine, as it will do you harm.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-11673611","romanian":"A doua mea învățătoare la școala primară (1941) a fost o frumoasă blondă pe nume Helena.","english":"My second primary school teacher (1941) was a beautiful blonde named Helena.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11512231","romanian":"Am simțit că ceva e pe cale să se întâmple.","english":"I sensed something was about to happen.","difficulty":7,"wordCount":10,"hasAudio":false,"audioUrl":null},{"id":"tat-5131088","romanian":"Să-i dai lui un sfat e ca și cum ai vorbi cu un perete de cărămidă.","english":"Giving advice to him is like talking to a brick wall.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-1143148","romanian":"Dar un om nu este făcut pentru înfrângere. Un om poate fi distrus, dar nu învins.","english":"But a man is not made for defeat. A man can be destroyed but not defeated.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12068955"},{"id":"tat-4995608","romanian":"Sunt mari diferențe de viteză de bandă largă și de calitate de la o țară la alta.","english":"There are big differences in broadband speed and quality from country to country.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-7195357","romanian":"Nu mi-am imaginat niciodată că blog-ul meu va deveni atât de popular.","english":"I never for a moment imagined that my blog would become so popular.","difficulty":7,"wordCount":12,"hasAudio":false,"audioUrl":null},{"id":"tat-2568483","romanian":"E mai ușor să te dai la oameni pe Internet decât pe stradă.","english":"It is easier to hit on people on the Internet than in the street.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-flori-a-din-codru","title":"Floriţa din codru","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":218,"excerpt":"A fost ce-a fost; dacă n-ar fi fost, nici nu s-ar povesti."},{"id":"story-ro-poveste","title":"Poveste","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":206,"excerpt":"O, poveşti, poveşti… lumea toată este o poveste, căci ce-a fost odată ca niciodată o fi fost ca şi astăzi, şi ce este astăzi va fi odată ca niciodată."},{"id":"story-ro-hagi-tudose","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":229,"excerpt":"I Poveşti de Barbu Ştefănescu Delavrancea - Hagi-Tudose Dincolo de „Crucea de piatră”, de-a stânga Şoselei Vitanului, se ridică biserica „Sfânta Troiţa”. Mândreţe de biserică. Ce zugrăveli, pe dinăuntru şi pe dinafară, cum arar se mai pomenesc numai la bisericile din vechime."}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
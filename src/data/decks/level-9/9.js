@@ -0,0 +1 @@
+export default {"level":9,"sentences":[{"id":"tat-5358834","romanian":"Tom a gestionat un bar mic de pe lângă Boston pentru o bună perioadă de timp.","english":"Tom managed a small bar near Boston for quite a long time.","difficulty":7,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-12336953","romanian":"Mi-aș dori să pot vorbi franceza destul de bine pentru a obține o slujbă la acea companie.","english":"I wish I could speak French well enough to get a job at that company.","difficulty":8,"wordCount":17,"hasAudio":false,"audioUrl":null},{"id":"tat-13619031","romanian":"Dumneavoastră nu sunteți o picătură în ocean, ci sunteți întregul ocean într-o picătură.","english":"You are not a drop in the ocean, you are the entire ocean in a drop.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-8762560","romanian":"Când vecinii ei au fost bolnavi, ea a rugat un medic să le dea niște medicamente.","english":"When her neighbours were ill, she asked a doctor to give them some medicine.","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-7166713","romanian":"Am fost uimit de îndrăzneala elevului, de a-i pune lectorului o astfel de întrebare personală.","english":"I was amazed at the audacity of the student to ask the lecturer such a personal question.","difficulty":8,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-1193104","romanian":"Au eşuat amândoi în găsirea celei mai serioase probleme cu care s-a confruntat vreodată planeta noastră.","english":"They have both failed to find the most serious problem that has ever faced our planet.","difficulty":8,"wordCount":16,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/1043821"},{"id":"tat-10744389","romanian":"Am vrut să mă duc acasă și să iau cina cu soția mea.","english":"I wanted to go home and eat dinner with my wife.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6637069","romanian":"Friptura a fost arsă din greșeală, dar cu toate acestea a avut un gust spectaculos.","english":"The steak was inadvertently burnt, but nonetheless it tasted spectacular.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-13621234","romanian":"Khan menționează că Hunter este dispărut fără urmă (probabil pentru că nu s-a găsit niciun corp).","english":"Khan mentions that Hunter is M.I.A. (probably because no body was found).","difficulty":8,"wordCount":16,"hasAudio":false,"audioUrl":null},{"id":"tat-11089209","romanian":"Tom se va întoarce la Boston cu o zi mai devreme decât mine.","english":"Tom will go back to Boston one day earlier than I will.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-5214359","romanian":"Cu relațiile tale, tu ar trebui să poți să-i găsești un serviciu lui Tom.","english":"With your connections, you should be able to find a job for Tom.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-2568466","romanian":"Opinia e o idee pe care o avem; convingerea - o idee care ne subjugă.","english":"Our opinion is an idea which we have; our conviction an idea which has us.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-220","romanian":"Responsabilitatea sociala a corporatiilor devine tot mai importanta.","english":"Corporate social responsibility is becoming increasingly important.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null},{"id":"tat-6795174","romanian":"Muncitorii din țările nordice au plătit un preț ridicat pentru mutarea producției în regiunile sudice.","english":"The workers of the northern countries have paid a high price for the displacement of production in the southern regions.","difficulty":7,"wordCount":15,"hasAudio":false,"audioUrl":null},{"id":"tat-9939628","romanian":"Dacă mai mult de un vorbitor de esperanto consideră fraza ilogică, o voi schimba.","english":"If more than one Esperanto speaker finds the phrase illogical, I will change it.","difficulty":7,"wordCount":14,"hasAudio":false,"audioUrl":null},{"id":"tat-1137625","romanian":"A fost foarte amabil să ne lase să facem o fotografie cu el.","english":"He was very gracious to let us take a picture of him.","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-6878207","romanian":"Poți să dai explicații în legătură cu toți banii pe care i-ai cheltuit?","english":"Can you account for all the money you spent?","difficulty":7,"wordCount":13,"hasAudio":false,"audioUrl":null},{"id":"tat-698931","romanian":"La ce oră te-ai obișnuit să te duci la culcare?","english":"What time are you used to going to bed?","difficulty":7,"wordCount":10,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/2135421"},{"id":"tat-1192775","romanian":"Majoritatea oamenilor spun că cel mai bun mod de a învăţa o limbă străină este să o înveți de la un vorbitor nativ.","english":"Most people say that the best way to learn a foreign language is to learn from a native speaker.","difficulty":9,"wordCount":23,"hasAudio":true,"audioUrl":"https://tatoeba.org/en/audio/download/12364285"},{"id":"tat-225","romanian":"Tehnologia digitala transforma fundamental modul in care comunicam.","english":"Digital technology is fundamentally transforming the way we communicate.","difficulty":8,"wordCount":8,"hasAudio":false,"audioUrl":null}],"stories":[{"id":"story-ro-limir-mp-rat-3","title":"Limir-Împărat","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":212,"excerpt":"– Mergi – îi zise dar – copila mea, şi nici spine, nici buruiană în cale să nu-ţi găseşti."},{"id":"story-ro-ileana-cea-ireat","title":"Ileana cea şireată","author":"Ioan Slavici","difficulty":7,"genre":"fiction","wordCount":215,"excerpt":"A fost odinioară un împărat care avea trei fete, dintre care cea mai mare era frumoasă, cea mijlocie şi mai frumoasă, iar cea mai tânără, Ileana, atâta de frumoasă încât şi Sfântul Soare se oprea în cale ca s-o vadă şi să se desfăteze de frumuseţea ei."},{"id":"story-ro-hagi-tudose-2","title":"Hagi-Tudose","author":"Barbu Stefanescu Delavrancea","difficulty":7,"genre":"fiction","wordCount":202,"excerpt":"Îşi freacă mâinile; tuşesc; îşi dreg glasul; apoi, rara-rara, cu nişte paşi lungi şi semeţi, îţi ies înainte, îţi caută prilej de vorbă, toţi cu aceleaşi cuvinte, cu aceeaşi tărăgănire de glas şi cu capul dat pe spate: – Ei, flăcăule, de pe unde?… Ce vânturi?… Pe la noi… ai?… Şi de ce?… Ce zici de biserica noastră?…"}],"recipes":[{"id":"recipe-cozonac","title":{"ro":"Cozonac","en":"Romanian Sweet Bread"},"description":{"ro":"Cozonacul este o paine dulce traditionala, preparata de Paste si Craciun, cu umplutura de nuca sau cacao.","en":"Cozonac is a traditional sweet bread, prepared for Easter and Christmas, with walnut or cocoa filling."},"difficulty":7,"category":"dessert","ingredients":[{"ro":"faina","en":"flour","amount":"1 kg"},{"ro":"lapte","en":"milk","amount":"300 ml"},{"ro":"zahar","en":"sugar","amount":"250 g"},{"ro":"oua","en":"eggs","amount":"6 bucati"},{"ro":"unt","en":"butter","amount":"200 g"},{"ro":"drojdie proaspata","en":"fresh yeast","amount":"50 g"},{"ro":"coaja de lamaie","en":"lemon zest","amount":"1 lamaie"},{"ro":"esenta de rom","en":"rum extract","amount":"2 lingurite"},{"ro":"esenta de vanilie","en":"vanilla extract","amount":"1 lingurita"},{"ro":"nuci macinate","en":"ground walnuts","amount":"300 g"},{"ro":"cacao","en":"cocoa powder","amount":"50 g"},{"ro":"sare","en":"salt","amount":"1/2 lingurita"}],"steps":[{"ro":"Se incalzeste laptele si se dizolva drojdia cu o lingurita de zahar.","en":"Warm the milk and dissolve the yeast with a teaspoon of sugar."},{"ro":"Se amesteca faina cu sarea si se face o gaura in mijloc.","en":"Mix flour with salt and make a well in the center."},{"ro":"Se adauga ouale, zaharul, untul moale si maiaua.","en":"Add eggs, sugar, soft butter and the yeast mixture."},{"ro":"Se framanta aluatul 20-30 minute pana devine elastic.","en":"Knead the dough for 20-30 minutes until elastic."},{"ro":"Se acopera si se lasa la crescut 2 ore intr-un loc cald.","en":"Cover and let rise for 2 hours in a warm place."},{"ro":"Se pregateste umplutura: nuci cu zahar si cacao.","en":"Prepare the filling: walnuts with sugar and cocoa."},{"ro":"Se intinde aluatul, se presara umplutura si se ruleaza.","en":"Roll out the dough, sprinkle with filling and roll up."},{"ro":"Se aseaza in tava unsa si se lasa sa creasca inca 30 minute.","en":"Place in a greased pan and let rise for another 30 minutes."},{"ro":"Se coace la 180 grade C timp de 40-45 minute.","en":"Bake at 180 degrees C for 40-45 minutes."}]}]};
@@ -0,0 +1 @@
+export default [{"word":"baladin","pos":"noun","definitions":["comedian"],"forms":{"plural":"baladini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baladin","accusative-definite-nominative-singular":"baladinul","accusative-indefinite-nominative-plural":"baladini","accusative-definite-nominative-plural":"baladinii","dative-genitive-indefinite-singular":"baladin","dative-definite-genitive-singular":"baladinului","dative-genitive-indefinite-plural":"baladini","dative-definite-genitive-plural":"baladinilor","singular-vocative":"baladinule","plural-vocative":"baladinilor"}},{"word":"balafon","pos":"noun","definitions":["balafon"],"forms":{"plural":"balafoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balafon","accusative-definite-nominative-singular":"balafonul","accusative-indefinite-nominative-plural":"balafoane","accusative-definite-nominative-plural":"balafoanele","dative-genitive-indefinite-singular":"balafon","dative-definite-genitive-singular":"balafonului","dative-genitive-indefinite-plural":"balafoane","dative-definite-genitive-plural":"balafoanelor","singular-vocative":"balafonule","plural-vocative":"balafoanelor"}},{"word":"balafră","pos":"noun","definitions":["gash, scar"],"forms":{"plural":"balafre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balafră","accusative-definite-nominative-singular":"balafra","accusative-indefinite-nominative-plural":"balafre","accusative-definite-nominative-plural":"balafrele","dative-genitive-indefinite-singular":"balafre","dative-definite-genitive-singular":"balafrei","dative-genitive-indefinite-plural":"balafre","dative-definite-genitive-plural":"balafrelor","singular-vocative":"balafră","plural-vocative":"balafrelor"}},{"word":"Bălai","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălai"}},{"word":"bălai","pos":"adj","definitions":["blond"],"pronunciation":"/bəˈlaj/","forms":{"feminine-singular":"bălaie","masculine-plural":"bălai","feminine-neuter-plural":"bălaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălai","error-unrecognized-form-feminine-indefinite-singular":"bălaie","error-unrecognized-form-indefinite-masculine-plural":"bălai","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălaie","definite-error-unrecognized-form-masculine-neuter-singular":"bălaiul","definite-error-unrecognized-form-feminine-singular":"bălaia","definite-error-unrecognized-form-masculine-plural":"bălaii","definite-error-unrecognized-form-feminine-neuter-plural":"bălaiele"}},{"word":"bălăi","pos":"verb","definitions":["to baa, bleat, blat"],"forms":{"canonical":"a bălăi 4th conjugation","present-singular-third-person":"bălăiește","participle-past":"bălăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bălăi","gerund":"bălăind","first-person-indicative-present-singular":"bălăiesc","indicative-present-second-person-singular":"bălăiești","indicative-present-singular-third-person":"bălăiește","first-person-indicative-plural-present":"bălăim","indicative-plural-present-second-person":"bălăiți","indicative-plural-present-third-person":"bălăiesc","first-person-imperfect-indicative-singular":"bălăiam","imperfect-indicative-second-person-singular":"bălăiai","imperfect-indicative-singular-third-person":"bălăia","first-person-imperfect-indicative-plural":"bălăiam","imperfect-indicative-plural-second-person":"bălăiați","imperfect-indicative-plural-third-person":"bălăiau","first-person-indicative-perfect-singular":"bălăii","indicative-perfect-second-person-singular":"bălăiși","indicative-perfect-singular-third-person":"bălăi","first-person-indicative-perfect-plural":"bălăirăm","indicative-perfect-plural-second-person":"bălăirăți","indicative-perfect-plural-third-person":"bălăiră","first-person-indicative-pluperfect-singular":"bălăisem","indicative-pluperfect-second-person-singular":"bălăiseși","indicative-pluperfect-singular-third-person":"bălăise","first-person-indicative-pluperfect-plural":"bălăiserăm","indicative-pluperfect-plural-second-person":"bălăiserăți","indicative-pluperfect-plural-third-person":"bălăiseră","first-person-present-singular-subjunctive":"să bălăiesc","present-second-person-singular-subjunctive":"să bălăiești","present-singular-subjunctive-third-person":"să bălăiască","first-person-plural-present-subjunctive":"să bălăim","plural-present-second-person-subjunctive":"să bălăiți","plural-present-subjunctive-third-person":"să bălăiască","imperative-second-person-singular":"bălăiește","imperative-plural-second-person":"bălăiți","imperative-negative-second-person-singular":"nu bălăi","imperative-negative-plural-second-person":"nu bălăiți"}},{"word":"Bălaia","pos":"name","definitions":["a village in Filipeni, Bacău County, Romania","a village in Tileagd, Bihor County, Romania","a village in Smeeni, Buzău County, Romania"],"gender":"f"},{"word":"bălăiel","pos":"adj","definitions":["diminutive of bălai"],"forms":{"feminine-singular":"bălăielă","masculine-plural":"bălăieli","feminine-neuter-plural":"bălăiele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălăiel","error-unrecognized-form-feminine-indefinite-singular":"bălăielă","error-unrecognized-form-indefinite-masculine-plural":"bălăieli","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălăiele","definite-error-unrecognized-form-masculine-neuter-singular":"bălăielul","definite-error-unrecognized-form-feminine-singular":"bălăiela","definite-error-unrecognized-form-masculine-plural":"bălăielii","definite-error-unrecognized-form-feminine-neuter-plural":"bălăielele"}},{"word":"bălăior","pos":"adj","definitions":["diminutive of bălai"],"pronunciation":"/bə.ləˈjor/","forms":{"feminine-singular":"bălăioară","masculine-plural":"bălăiori","feminine-neuter-plural":"bălăioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălăior","error-unrecognized-form-feminine-indefinite-singular":"bălăioară","error-unrecognized-form-indefinite-masculine-plural":"bălăiori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălăioare","definite-error-unrecognized-form-masculine-neuter-singular":"bălăiorul","definite-error-unrecognized-form-feminine-singular":"bălăioara","definite-error-unrecognized-form-masculine-plural":"bălăiorii","definite-error-unrecognized-form-feminine-neuter-plural":"bălăioarele"}},{"word":"Balaj","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Balaj"}},{"word":"Bălaj","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Bălaj"}},{"word":"balalaică","pos":"noun","definitions":["balalaika"],"forms":{"plural":"balalaici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"balalaică","accusative-definite-nominative-singular":"balalaica","accusative-indefinite-nominative-plural":"balalaici","accusative-definite-nominative-plural":"balalaicile","dative-genitive-indefinite-singular":"balalaici","dative-definite-genitive-singular":"balalaicii","dative-genitive-indefinite-plural":"balalaici","dative-definite-genitive-plural":"balalaicilor","singular-vocative":"balalaică","plural-vocative":"balalaicilor"}},{"word":"Bălălău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălălău"}},{"word":"bălălău","pos":"adj","definitions":["stupid"],"forms":{"feminine-singular":"bălălăă","masculine-plural":"bălălăi","feminine-neuter-plural":"bălălăe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălălău","error-unrecognized-form-feminine-indefinite-singular":"bălălăă","error-unrecognized-form-indefinite-masculine-plural":"bălălăi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălălăe","definite-error-unrecognized-form-masculine-neuter-singular":"bălălăul","definite-error-unrecognized-form-feminine-singular":"bălălăa","definite-error-unrecognized-form-masculine-plural":"bălălăii","definite-error-unrecognized-form-feminine-neuter-plural":"bălălăele"}},{"word":"balama","pos":"noun","definitions":["hinge"],"forms":{"plural":"balamale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"balama","accusative-definite-nominative-singular":"balamaua","accusative-indefinite-nominative-plural":"balamale","accusative-definite-nominative-plural":"balamalele","dative-genitive-indefinite-singular":"balamale","dative-definite-genitive-singular":"balamalei","dative-genitive-indefinite-plural":"balamale","dative-definite-genitive-plural":"balamalelor","singular-vocative":"balama","plural-vocative":"balamalelor"}},{"word":"bălămăluță","pos":"noun","definitions":["diminutive of balama"],"forms":{"plural":"bălămăluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bălămăluță","accusative-definite-nominative-singular":"bălămăluța","accusative-indefinite-nominative-plural":"bălămăluțe","accusative-definite-nominative-plural":"bălămăluțele","dative-genitive-indefinite-singular":"bălămăluțe","dative-definite-genitive-singular":"bălămăluței","dative-genitive-indefinite-plural":"bălămăluțe","dative-definite-genitive-plural":"bălămăluțelor","singular-vocative":"bălămăluță","plural-vocative":"bălămăluțelor"}},{"word":"balamuc","pos":"noun","definitions":["insane asylum, mental hospital"],"forms":{"plural":"balamucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balamuc","accusative-definite-nominative-singular":"balamucul","accusative-indefinite-nominative-plural":"balamucuri","accusative-definite-nominative-plural":"balamucurile","dative-genitive-indefinite-singular":"balamuc","dative-definite-genitive-singular":"balamucului","dative-genitive-indefinite-plural":"balamucuri","dative-definite-genitive-plural":"balamucurilor","singular-vocative":"balamucule","plural-vocative":"balamucurilor"}},{"word":"balamuție","pos":"noun","definitions":["gossip, chit-chat"],"forms":{"plural":"balamuții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"balamuție","accusative-definite-nominative-singular":"balamuția","accusative-indefinite-nominative-plural":"balamuții","accusative-definite-nominative-plural":"balamuțiile","dative-genitive-indefinite-singular":"balamuții","dative-definite-genitive-singular":"balamuției","dative-genitive-indefinite-plural":"balamuții","dative-definite-genitive-plural":"balamuțiilor","singular-vocative":"balamuție","plural-vocative":"balamuțiilor"}},{"word":"balamuțire","pos":"noun","definitions":["slandering, gossip"],"forms":{"plural":"balamuțiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"balamuțire","accusative-definite-nominative-singular":"balamuțirea","accusative-indefinite-nominative-plural":"balamuțiri","accusative-definite-nominative-plural":"balamuțirile","dative-genitive-indefinite-singular":"balamuțiri","dative-definite-genitive-singular":"balamuțirii","dative-genitive-indefinite-plural":"balamuțiri","dative-definite-genitive-plural":"balamuțirilor","singular-vocative":"balamuțire","plural-vocative":"balamuțirilor"}},{"word":"balamuțit","pos":"adj","definitions":["slandered"],"forms":{"feminine-singular":"balamuțită","masculine-plural":"balamuțiți","feminine-neuter-plural":"balamuțite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balamuțit","error-unrecognized-form-feminine-indefinite-singular":"balamuțită","error-unrecognized-form-indefinite-masculine-plural":"balamuțiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"balamuțite","definite-error-unrecognized-form-masculine-neuter-singular":"balamuțitul","definite-error-unrecognized-form-feminine-singular":"balamuțita","definite-error-unrecognized-form-masculine-plural":"balamuțiții","definite-error-unrecognized-form-feminine-neuter-plural":"balamuțitele"}},{"word":"balamuțit","pos":"verb","definitions":["past participle of balamuți"],"forms":{"participle-past":"of balamuți"}},{"word":"balan","pos":"adj","definitions":["obsolete form of bălan"],"forms":{"feminine-singular":"balană","masculine-plural":"balani","feminine-neuter-plural":"balane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balan","error-unrecognized-form-feminine-indefinite-singular":"balană","error-unrecognized-form-indefinite-masculine-plural":"balani","error-unrecognized-form-feminine-indefinite-neuter-plural":"balane","definite-error-unrecognized-form-masculine-neuter-singular":"balanul","definite-error-unrecognized-form-feminine-singular":"balana","definite-error-unrecognized-form-masculine-plural":"balanii","definite-error-unrecognized-form-feminine-neuter-plural":"balanele"}},{"word":"Bălan","pos":"name","definitions":["a surname","a town in Harghita County, Romania","a commune of Sălaj County, Romania","a village in Bălan, Sălaj County, Romania"],"gender":"m","forms":{"dative-genitive":"lui Bălan"}},{"word":"bălan","pos":"adj","definitions":["blond"],"pronunciation":"/bəˈlan/","forms":{"feminine-singular":"bălană","masculine-plural":"bălani","feminine-neuter-plural":"bălane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălan","error-unrecognized-form-feminine-indefinite-singular":"bălană","error-unrecognized-form-indefinite-masculine-plural":"bălani","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălane","definite-error-unrecognized-form-masculine-neuter-singular":"bălanul","definite-error-unrecognized-form-feminine-singular":"bălana","definite-error-unrecognized-form-masculine-plural":"bălanii","definite-error-unrecognized-form-feminine-neuter-plural":"bălanele","alternative":"бэлан"}},{"word":"Bălana","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Fulga"],"gender":"f"},{"word":"Bălăneasa","pos":"name","definitions":["a village in Livezi, Bacău County, Romania"],"gender":"f"},{"word":"Bălănel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănel"}},{"word":"bălănel","pos":"adj","definitions":["diminutive of bălai"],"forms":{"feminine-singular":"bălănelă","masculine-plural":"bălăneli","feminine-neuter-plural":"bălănele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălănel","error-unrecognized-form-feminine-indefinite-singular":"bălănelă","error-unrecognized-form-indefinite-masculine-plural":"bălăneli","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălănele","definite-error-unrecognized-form-masculine-neuter-singular":"bălănelul","definite-error-unrecognized-form-feminine-singular":"bălănela","definite-error-unrecognized-form-masculine-plural":"bălănelii","definite-error-unrecognized-form-feminine-neuter-plural":"bălănelele"}},{"word":"Bălănescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănescu"}},{"word":"Bălănești","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania","a village in Podu Turcului, Bacău County, Romania","a village in Cozieni, Buzău County, Romania","a locality in Răcari, Dâmbovița County, Romania","a commune of Gorj County, Romania"],"gender":"m"},{"word":"balang","pos":"intj","definitions":["sound of a large bell"]},{"word":"balanga","pos":"intj","definitions":["alternative form of balang"]},{"word":"bălăngănire","pos":"noun","definitions":["the sound of a bell"],"forms":{"plural":"bălăngăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bălăngănire","accusative-definite-nominative-singular":"bălăngănirea","accusative-indefinite-nominative-plural":"bălăngăniri","accusative-definite-nominative-plural":"bălăngănirile","dative-genitive-indefinite-singular":"bălăngăniri","dative-definite-genitive-singular":"bălăngănirii","dative-genitive-indefinite-plural":"bălăngăniri","dative-definite-genitive-plural":"bălăngănirilor","singular-vocative":"bălăngănire","plural-vocative":"bălăngănirilor"}},{"word":"bălăngănitor","pos":"adj","definitions":["swaying"],"forms":{"feminine-singular":"bălăngănitoare","masculine-plural":"bălăngănitori","feminine-neuter-plural":"bălăngănitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălăngănitor","error-unrecognized-form-feminine-indefinite-singular":"bălăngănitoare","error-unrecognized-form-indefinite-masculine-plural":"bălăngănitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălăngănitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bălăngănitorul","definite-error-unrecognized-form-feminine-singular":"bălăngănitoarea","definite-error-unrecognized-form-masculine-plural":"bălăngănitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bălăngănitoarele"}},{"word":"Bălani","pos":"name","definitions":["a village in Stănești, Gorj County, Romania"],"gender":"m"},{"word":"balanic","pos":"adj","definitions":["balanic"],"forms":{"feminine-singular":"balanică","masculine-plural":"balanici","feminine-neuter-plural":"balanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balanic","error-unrecognized-form-feminine-indefinite-singular":"balanică","error-unrecognized-form-indefinite-masculine-plural":"balanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balanice","definite-error-unrecognized-form-masculine-neuter-singular":"balanicul","definite-error-unrecognized-form-feminine-singular":"balanica","definite-error-unrecognized-form-masculine-plural":"balanicii","definite-error-unrecognized-form-feminine-neuter-plural":"balanicele"}},{"word":"Bălănică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănică"}},{"word":"bălănică","pos":"adj","definitions":["diminutive of bălan"],"forms":{"plural":"bălănice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"bălănică","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălănice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"bălănica","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"bălănicele"}},{"word":"bălănică","pos":"noun","definitions":["diminutive of -ică"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bălănică","accusative-definite-nominative":"bălănica","dative-genitive-indefinite":"bălănice","dative-definite-genitive":"bălănicei","vocative":"bălănică"}},{"word":"balanită","pos":"noun","definitions":["balanitis"],"pronunciation":"/ba.laˈni.tə/","forms":{"plural":"balanite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balanită","accusative-definite-nominative-singular":"balanita","accusative-indefinite-nominative-plural":"balanite","accusative-definite-nominative-plural":"balanitele","dative-genitive-indefinite-singular":"balanite","dative-definite-genitive-singular":"balanitei","dative-genitive-indefinite-plural":"balanite","dative-definite-genitive-plural":"balanitelor","singular-vocative":"balanită","plural-vocative":"balanitelor"}},{"word":"Bălăniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Bălăniuc"}},{"word":"balano-","pos":"prefix","definitions":["balano-"]},{"word":"Bălănoiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănoiu"}},{"word":"balanopostită","pos":"noun","definitions":["balanoposthitis"],"forms":{"plural":"balanopostite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balanopostită","accusative-definite-nominative-singular":"balanopostita","accusative-indefinite-nominative-plural":"balanopostite","accusative-definite-nominative-plural":"balanopostitele","dative-genitive-indefinite-singular":"balanopostite","dative-definite-genitive-singular":"balanopostitei","dative-genitive-indefinite-plural":"balanopostite","dative-definite-genitive-plural":"balanopostitelor","singular-vocative":"balanopostită","plural-vocative":"balanopostitelor"}},{"word":"balanoprepuțial","pos":"adj","definitions":["balanopreputial"],"forms":{"feminine-singular":"balanoprepuțială","masculine-plural":"balanoprepuțiali","feminine-neuter-plural":"balanoprepuțiale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"balanoprepuțial","error-unrecognized-form-feminine-indefinite-singular":"balanoprepuțială","error-unrecognized-form-indefinite-masculine-plural":"balanoprepuțiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"balanoprepuțiale","definite-error-unrecognized-form-masculine-neuter-singular":"balanoprepuțialul","definite-error-unrecognized-form-feminine-singular":"balanoprepuțiala","definite-error-unrecognized-form-masculine-plural":"balanoprepuțialii","definite-error-unrecognized-form-feminine-neuter-plural":"balanoprepuțialele"}},{"word":"balans","pos":"noun","definitions":["balancing"],"forms":{"plural":"balansuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balans","accusative-definite-nominative-singular":"balansul","accusative-indefinite-nominative-plural":"balansuri","accusative-definite-nominative-plural":"balansurile","dative-genitive-indefinite-singular":"balans","dative-definite-genitive-singular":"balansului","dative-genitive-indefinite-plural":"balansuri","dative-definite-genitive-plural":"balansurilor","singular-vocative":"balansule","plural-vocative":"balansurilor"}},{"word":"balansa","pos":"verb","definitions":["to balance"],"forms":{"canonical":"a balansa 1st conjugation","present-singular-third-person":"balansează","participle-past":"balansat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a balansa","gerund":"balansând","first-person-indicative-present-singular":"balansez","indicative-present-second-person-singular":"balansezi","indicative-present-singular-third-person":"balansează","first-person-indicative-plural-present":"balansăm","indicative-plural-present-second-person":"balansați","indicative-plural-present-third-person":"balansează","first-person-imperfect-indicative-singular":"balansam","imperfect-indicative-second-person-singular":"balansai","imperfect-indicative-singular-third-person":"balansa","first-person-imperfect-indicative-plural":"balansam","imperfect-indicative-plural-second-person":"balansați","imperfect-indicative-plural-third-person":"balansau","first-person-indicative-perfect-singular":"balansai","indicative-perfect-second-person-singular":"balansași","indicative-perfect-singular-third-person":"balansă","first-person-indicative-perfect-plural":"balansarăm","indicative-perfect-plural-second-person":"balansarăți","indicative-perfect-plural-third-person":"balansară","first-person-indicative-pluperfect-singular":"balansasem","indicative-pluperfect-second-person-singular":"balansaseși","indicative-pluperfect-singular-third-person":"balansase","first-person-indicative-pluperfect-plural":"balansaserăm","indicative-pluperfect-plural-second-person":"balansaserăți","indicative-pluperfect-plural-third-person":"balansaseră","first-person-present-singular-subjunctive":"să balansez","present-second-person-singular-subjunctive":"să balansezi","present-singular-subjunctive-third-person":"să balanseze","first-person-plural-present-subjunctive":"să balansăm","plural-present-second-person-subjunctive":"să balansați","plural-present-subjunctive-third-person":"să balanseze","imperative-second-person-singular":"balansează","imperative-plural-second-person":"balansați","imperative-negative-second-person-singular":"nu balansa","imperative-negative-plural-second-person":"nu balansați"}},{"word":"balansare","pos":"noun","definitions":["balancing"],"forms":{"plural":"balansări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"balansare","accusative-definite-nominative-singular":"balansarea","accusative-indefinite-nominative-plural":"balansări","accusative-definite-nominative-plural":"balansările","dative-genitive-indefinite-singular":"balansări","dative-definite-genitive-singular":"balansării","dative-genitive-indefinite-plural":"balansări","dative-definite-genitive-plural":"balansărilor","singular-vocative":"balansare","plural-vocative":"balansărilor"}},{"word":"balansat","pos":"adj","definitions":["balanced"],"forms":{"feminine-singular":"balansată","masculine-plural":"balansați","feminine-neuter-plural":"balansate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balansat","error-unrecognized-form-feminine-indefinite-singular":"balansată","error-unrecognized-form-indefinite-masculine-plural":"balansați","error-unrecognized-form-feminine-indefinite-neuter-plural":"balansate","definite-error-unrecognized-form-masculine-neuter-singular":"balansatul","definite-error-unrecognized-form-feminine-singular":"balansata","definite-error-unrecognized-form-masculine-plural":"balansații","definite-error-unrecognized-form-feminine-neuter-plural":"balansatele"}},{"word":"balansină","pos":"noun","definitions":["balancine"],"forms":{"plural":"balansine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balansină","accusative-definite-nominative-singular":"balansina","accusative-indefinite-nominative-plural":"balansine","accusative-definite-nominative-plural":"balansinele","dative-genitive-indefinite-singular":"balansine","dative-definite-genitive-singular":"balansinei","dative-genitive-indefinite-plural":"balansine","dative-definite-genitive-plural":"balansinelor","singular-vocative":"balansină","plural-vocative":"balansinelor"}},{"word":"balansoar","pos":"noun","definitions":["rocker, rocking chair"],"forms":{"plural":"balansoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balansoar","accusative-definite-nominative-singular":"balansoarul","accusative-indefinite-nominative-plural":"balansoare","accusative-definite-nominative-plural":"balansoarele","dative-genitive-indefinite-singular":"balansoar","dative-definite-genitive-singular":"balansoarului","dative-genitive-indefinite-plural":"balansoare","dative-definite-genitive-plural":"balansoarelor","singular-vocative":"balansoarule","plural-vocative":"balansoarelor"}},{"word":"balansor","pos":"noun","definitions":["swing"],"forms":{"plural":"balansoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balansor","accusative-definite-nominative-singular":"balansorul","accusative-indefinite-nominative-plural":"balansoare","accusative-definite-nominative-plural":"balansoarele","dative-genitive-indefinite-singular":"balansor","dative-definite-genitive-singular":"balansorului","dative-genitive-indefinite-plural":"balansoare","dative-definite-genitive-plural":"balansoarelor","singular-vocative":"balansorule","plural-vocative":"balansoarelor"}},{"word":"balanța","pos":"verb","definitions":["obsolete form of balansa"],"forms":{"canonical":"a balanța 1st conjugation","present-singular-third-person":"balanțează","participle-past":"balanțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a balanța","gerund":"balanțând","first-person-indicative-present-singular":"balanțez","indicative-present-second-person-singular":"balanțezi","indicative-present-singular-third-person":"balanțează","first-person-indicative-plural-present":"balanțăm","indicative-plural-present-second-person":"balanțați","indicative-plural-present-third-person":"balanțează","first-person-imperfect-indicative-singular":"balanțam","imperfect-indicative-second-person-singular":"balanțai","imperfect-indicative-singular-third-person":"balanța","first-person-imperfect-indicative-plural":"balanțam","imperfect-indicative-plural-second-person":"balanțați","imperfect-indicative-plural-third-person":"balanțau","first-person-indicative-perfect-singular":"balanțai","indicative-perfect-second-person-singular":"balanțași","indicative-perfect-singular-third-person":"balanță","first-person-indicative-perfect-plural":"balanțarăm","indicative-perfect-plural-second-person":"balanțarăți","indicative-perfect-plural-third-person":"balanțară","first-person-indicative-pluperfect-singular":"balanțasem","indicative-pluperfect-second-person-singular":"balanțaseși","indicative-pluperfect-singular-third-person":"balanțase","first-person-indicative-pluperfect-plural":"balanțaserăm","indicative-pluperfect-plural-second-person":"balanțaserăți","indicative-pluperfect-plural-third-person":"balanțaseră","first-person-present-singular-subjunctive":"să balanțez","present-second-person-singular-subjunctive":"să balanțezi","present-singular-subjunctive-third-person":"să balanțeze","first-person-plural-present-subjunctive":"să balanțăm","plural-present-second-person-subjunctive":"să balanțați","plural-present-subjunctive-third-person":"să balanțeze","imperative-second-person-singular":"balanțează","imperative-plural-second-person":"balanțați","imperative-negative-second-person-singular":"nu balanța","imperative-negative-plural-second-person":"nu balanțați"}},{"word":"Balanță","pos":"name","definitions":["Libra"]},{"word":"balanță","pos":"noun","definitions":["balance, scales"],"forms":{"plural":"balanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balanță","accusative-definite-nominative-singular":"balanța","accusative-indefinite-nominative-plural":"balanțe","accusative-definite-nominative-plural":"balanțele","dative-genitive-indefinite-singular":"balanțe","dative-definite-genitive-singular":"balanței","dative-genitive-indefinite-plural":"balanțe","dative-definite-genitive-plural":"balanțelor","singular-vocative":"balanță","plural-vocative":"balanțelor"}},{"word":"balanță comercială","pos":"noun","definitions":["trade balance"],"forms":{"plural":"balanțe comerciale"}},{"word":"balanță hidrostatică","pos":"noun","definitions":["hydrostatic balance"]},{"word":"balanțat","pos":"adj","definitions":["obsolete form of balansat"],"forms":{"feminine-singular":"balanțată","masculine-plural":"balanțați","feminine-neuter-plural":"balanțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balanțat","error-unrecognized-form-feminine-indefinite-singular":"balanțată","error-unrecognized-form-indefinite-masculine-plural":"balanțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"balanțate","definite-error-unrecognized-form-masculine-neuter-singular":"balanțatul","definite-error-unrecognized-form-feminine-singular":"balanțata","definite-error-unrecognized-form-masculine-plural":"balanțații","definite-error-unrecognized-form-feminine-neuter-plural":"balanțatele"}},{"word":"balanțier","pos":"noun","definitions":["alternative form of balansier"],"forms":{"plural":"balanțiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balanțier","accusative-definite-nominative-singular":"balanțierul","accusative-indefinite-nominative-plural":"balanțiere","accusative-definite-nominative-plural":"balanțierele","dative-genitive-indefinite-singular":"balanțier","dative-definite-genitive-singular":"balanțierului","dative-genitive-indefinite-plural":"balanțiere","dative-definite-genitive-plural":"balanțierelor","singular-vocative":"balanțierule","plural-vocative":"balanțierelor"}},{"word":"Bălanu","pos":"name","definitions":["a village in Stănești, Giurgiu County, Romania"],"gender":"m"},{"word":"Bălănucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănucă"}},{"word":"bălanul","pos":"noun","definitions":["definite nominative/accusative singular of bălan"]},{"word":"Balanul Nou","pos":"name","definitions":["a village in Rîșcani, Rîșcani Raion, Moldova"],"gender":"m"},{"word":"bălănuț","pos":"adj","definitions":["diminutive of bălan"],"forms":{"feminine-singular":"bălănuță","masculine-plural":"bălănuți","feminine-neuter-plural":"bălănuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălănuț","error-unrecognized-form-feminine-indefinite-singular":"bălănuță","error-unrecognized-form-indefinite-masculine-plural":"bălănuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălănuțe","definite-error-unrecognized-form-masculine-neuter-singular":"bălănuțul","definite-error-unrecognized-form-feminine-singular":"bălănuța","definite-error-unrecognized-form-masculine-plural":"bălănuții","definite-error-unrecognized-form-feminine-neuter-plural":"bălănuțele"}},{"word":"Bălănuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălănuță"}},{"word":"balaoacheș","pos":"adj","definitions":["swarthy"],"forms":{"feminine-singular":"balaoacheșă","masculine-plural":"balaoacheși","feminine-neuter-plural":"balaoacheșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balaoacheș","error-unrecognized-form-feminine-indefinite-singular":"balaoacheșă","error-unrecognized-form-indefinite-masculine-plural":"balaoacheși","error-unrecognized-form-feminine-indefinite-neuter-plural":"balaoacheșe","definite-error-unrecognized-form-masculine-neuter-singular":"balaoacheșul","definite-error-unrecognized-form-feminine-singular":"balaoacheșa","definite-error-unrecognized-form-masculine-plural":"balaoacheșii","definite-error-unrecognized-form-feminine-neuter-plural":"balaoacheșele"}},{"word":"balaoacheș","pos":"noun","definitions":["swarthy person"],"forms":{"plural":"balaoacheși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balaoacheș","accusative-definite-nominative-singular":"balaoacheșul","accusative-indefinite-nominative-plural":"balaoacheși","accusative-definite-nominative-plural":"balaoacheșii","dative-genitive-indefinite-singular":"balaoacheș","dative-definite-genitive-singular":"balaoacheșului","dative-genitive-indefinite-plural":"balaoacheși","dative-definite-genitive-plural":"balaoacheșilor","singular-vocative":"balaoacheșule","plural-vocative":"balaoacheșilor"}},{"word":"balaoacheșă","pos":"noun","definitions":["female equivalent of balaoacheș"],"forms":{"plural":"balaoacheșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balaoacheșă","accusative-definite-nominative-singular":"balaoacheșa","accusative-indefinite-nominative-plural":"balaoacheșe","accusative-definite-nominative-plural":"balaoacheșele","dative-genitive-indefinite-singular":"balaoacheșe","dative-definite-genitive-singular":"balaoacheșei","dative-genitive-indefinite-plural":"balaoacheșe","dative-definite-genitive-plural":"balaoacheșelor","singular-vocative":"balaoacheșă","plural-vocative":"balaoacheșelor"}},{"word":"Bălăria","pos":"name","definitions":["a village in Giurgiu County, Romania. Renamed to Valea Plopilor in 1964."],"gender":"f"},{"word":"Bălărie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălărie"}},{"word":"bălărie","pos":"noun","definitions":["weed","tall grass"],"forms":{"plural":"bălării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bălărie","accusative-definite-nominative-singular":"bălăria","accusative-indefinite-nominative-plural":"bălării","accusative-definite-nominative-plural":"bălăriile","dative-genitive-indefinite-singular":"bălării","dative-definite-genitive-singular":"bălăriei","dative-genitive-indefinite-plural":"bălării","dative-definite-genitive-plural":"bălăriilor","singular-vocative":"bălărie","plural-vocative":"bălăriilor"}},{"word":"bălării","pos":"noun","definitions":["plural of bălărie; weeds"],"gender":"f"},{"word":"balaș","pos":"noun","definitions":["balas"],"forms":{"plural":"balașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balaș","accusative-definite-nominative-singular":"balașul","accusative-indefinite-nominative-plural":"balașuri","accusative-definite-nominative-plural":"balașurile","dative-genitive-indefinite-singular":"balaș","dative-definite-genitive-singular":"balașului","dative-genitive-indefinite-plural":"balașuri","dative-definite-genitive-plural":"balașurilor","singular-vocative":"balașule","plural-vocative":"balașurilor"}},{"word":"Balasan","pos":"name","definitions":["a locality in Băilești, Dolj County, Romania","a surname from Armenian"],"gender":"m"},{"word":"Bălășeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălășeanu"}},{"word":"Bălășescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălășescu"}},{"word":"Bălășești","pos":"name","definitions":["a commune of Galați County, Romania","a village in Bălășești, Galați County, Romania"],"gender":"m"},{"word":"Bălășete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălășete"}},{"word":"Balasinești","pos":"name","definitions":["a village in Balasinești, Briceni Raion, Moldova","a commune of Briceni Raion, Moldova"],"gender":"m"},{"word":"Bălășoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălășoiu"}},{"word":"balast","pos":"noun","definitions":["ballast"],"forms":{"plural":"balasturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balast","accusative-definite-nominative-singular":"balastul","accusative-indefinite-nominative-plural":"balasturi","accusative-definite-nominative-plural":"balasturile","dative-genitive-indefinite-singular":"balast","dative-definite-genitive-singular":"balastului","dative-genitive-indefinite-plural":"balasturi","dative-definite-genitive-plural":"balasturilor","singular-vocative":"balastule","plural-vocative":"balasturilor"}},{"word":"balasta","pos":"verb","definitions":["to ballast"],"forms":{"canonical":"a balasta 1st conjugation","present-singular-third-person":"balastează","participle-past":"balastat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a balasta","gerund":"balastând","first-person-indicative-present-singular":"balastez","indicative-present-second-person-singular":"balastezi","indicative-present-singular-third-person":"balastează","first-person-indicative-plural-present":"balastăm","indicative-plural-present-second-person":"balastați","indicative-plural-present-third-person":"balastează","first-person-imperfect-indicative-singular":"balastam","imperfect-indicative-second-person-singular":"balastai","imperfect-indicative-singular-third-person":"balasta","first-person-imperfect-indicative-plural":"balastam","imperfect-indicative-plural-second-person":"balastați","imperfect-indicative-plural-third-person":"balastau","first-person-indicative-perfect-singular":"balastai","indicative-perfect-second-person-singular":"balastași","indicative-perfect-singular-third-person":"balastă","first-person-indicative-perfect-plural":"balastarăm","indicative-perfect-plural-second-person":"balastarăți","indicative-perfect-plural-third-person":"balastară","first-person-indicative-pluperfect-singular":"balastasem","indicative-pluperfect-second-person-singular":"balastaseși","indicative-pluperfect-singular-third-person":"balastase","first-person-indicative-pluperfect-plural":"balastaserăm","indicative-pluperfect-plural-second-person":"balastaserăți","indicative-pluperfect-plural-third-person":"balastaseră","first-person-present-singular-subjunctive":"să balastez","present-second-person-singular-subjunctive":"să balastezi","present-singular-subjunctive-third-person":"să balasteze","first-person-plural-present-subjunctive":"să balastăm","plural-present-second-person-subjunctive":"să balastați","plural-present-subjunctive-third-person":"să balasteze","imperative-second-person-singular":"balastează","imperative-plural-second-person":"balastați","imperative-negative-second-person-singular":"nu balasta","imperative-negative-plural-second-person":"nu balastați"}},{"word":"balastare","pos":"noun","definitions":["ballasting"],"forms":{"plural":"balastări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"balastare","accusative-definite-nominative-singular":"balastarea","accusative-indefinite-nominative-plural":"balastări","accusative-definite-nominative-plural":"balastările","dative-genitive-indefinite-singular":"balastări","dative-definite-genitive-singular":"balastării","dative-genitive-indefinite-plural":"balastări","dative-definite-genitive-plural":"balastărilor","singular-vocative":"balastare","plural-vocative":"balastărilor"}},{"word":"balastat","pos":"noun","definitions":["ballasting"],"forms":{"plural":"balastaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balastat","accusative-definite-nominative-singular":"balastatul","accusative-indefinite-nominative-plural":"balastaturi","accusative-definite-nominative-plural":"balastaturile","dative-genitive-indefinite-singular":"balastat","dative-definite-genitive-singular":"balastatului","dative-genitive-indefinite-plural":"balastaturi","dative-definite-genitive-plural":"balastaturilor","singular-vocative":"balastatule","plural-vocative":"balastaturilor"}},{"word":"balastat","pos":"verb","definitions":["past participle of balasta"],"forms":{"participle-past":"of balasta"}},{"word":"balastieră","pos":"noun","definitions":["ballast quarry"],"forms":{"plural":"balastiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balastieră","accusative-definite-nominative-singular":"balastiera","accusative-indefinite-nominative-plural":"balastiere","accusative-definite-nominative-plural":"balastierele","dative-genitive-indefinite-singular":"balastiere","dative-definite-genitive-singular":"balastierei","dative-genitive-indefinite-plural":"balastiere","dative-definite-genitive-plural":"balastierelor","singular-vocative":"balastieră","plural-vocative":"balastierelor"}},{"word":"bălăștioagă","pos":"noun","definitions":["puddle"],"forms":{"plural":"bălăștioage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bălăștioagă","accusative-definite-nominative-singular":"bălăștioaga","accusative-indefinite-nominative-plural":"bălăștioage","accusative-definite-nominative-plural":"bălăștioagele","dative-genitive-indefinite-singular":"bălăștioage","dative-definite-genitive-singular":"bălăștioagei","dative-genitive-indefinite-plural":"bălăștioage","dative-definite-genitive-plural":"bălăștioagelor","singular-vocative":"bălăștioagă","plural-vocative":"bălăștioagelor"}},{"word":"Bălata","pos":"name","definitions":["a village in Șoimuș, Hunedoara County, Romania"],"gender":"f"},{"word":"Balatina","pos":"name","definitions":["a village in Balatina, Glodeni Raion, Moldova","a commune of Glodeni Raion, Moldova"],"gender":"f"},{"word":"bălățire","pos":"noun","definitions":["sprawl, stretching"],"forms":{"plural":"bălățiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bălățire","accusative-definite-nominative-singular":"bălățirea","accusative-indefinite-nominative-plural":"bălățiri","accusative-definite-nominative-plural":"bălățirile","dative-genitive-indefinite-singular":"bălățiri","dative-definite-genitive-singular":"bălățirii","dative-genitive-indefinite-plural":"bălățiri","dative-definite-genitive-plural":"bălățirilor","singular-vocative":"bălățire","plural-vocative":"bălățirilor"}},{"word":"bălăuc","pos":"adj","definitions":["diminutive of bălai"],"forms":{"feminine-singular":"bălăucă","masculine-plural":"bălăuci","feminine-neuter-plural":"bălăuce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălăuc","error-unrecognized-form-feminine-indefinite-singular":"bălăucă","error-unrecognized-form-indefinite-masculine-plural":"bălăuci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălăuce","definite-error-unrecognized-form-masculine-neuter-singular":"bălăucul","definite-error-unrecognized-form-feminine-singular":"bălăuca","definite-error-unrecognized-form-masculine-plural":"bălăucii","definite-error-unrecognized-form-feminine-neuter-plural":"bălăucele"}},{"word":"Bălăunțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălăunțescu"}},{"word":"Balaur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balaur"}},{"word":"balaur","pos":"noun","definitions":["dragon","monster"],"forms":{"plural":"balauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balaur","accusative-definite-nominative-singular":"balaurul","accusative-indefinite-nominative-plural":"balauri","accusative-definite-nominative-plural":"balaurii","dative-genitive-indefinite-singular":"balaur","dative-definite-genitive-singular":"balaurului","dative-genitive-indefinite-plural":"balauri","dative-definite-genitive-plural":"balaurilor","singular-vocative":"balaurule","plural-vocative":"balaurilor","alternative":"bălaur"}},{"word":"Balaura","pos":"name","definitions":["a river in Olt, Romania, tributary to the Olteț"],"gender":"f"},{"word":"bălăuraș","pos":"noun","definitions":["diminutive of balaur"],"forms":{"plural":"bălăurași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bălăuraș","accusative-definite-nominative-singular":"bălăurașul","accusative-indefinite-nominative-plural":"bălăurași","accusative-definite-nominative-plural":"bălăurașii","dative-genitive-indefinite-singular":"bălăuraș","dative-definite-genitive-singular":"bălăurașului","dative-genitive-indefinite-plural":"bălăurași","dative-definite-genitive-plural":"bălăurașilor","singular-vocative":"bălăurașule","plural-vocative":"bălăurașilor"}},{"word":"balaurel","pos":"noun","definitions":["diminutive of balaur"],"forms":{"plural":"balaurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balaurel","accusative-definite-nominative-singular":"balaurelul","accusative-indefinite-nominative-plural":"balaurei","accusative-definite-nominative-plural":"balaureii","dative-genitive-indefinite-singular":"balaurel","dative-definite-genitive-singular":"balaurelului","dative-genitive-indefinite-plural":"balaurei","dative-definite-genitive-plural":"balaureilor","singular-vocative":"balaurelule","plural-vocative":"balaureilor"}},{"word":"Bălăurești","pos":"name","definitions":["a village in Bălăurești, Nisporeni Raion, Moldova","a commune of Nisporeni Raion, Moldova"],"gender":"m"},{"word":"Balauru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balauru"}},{"word":"Bălăușeri","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Bălăușeri, Mureș County, Romania"],"gender":"m"},{"word":"bâlbâi","pos":"verb","definitions":["to stutter, stammer"],"forms":{"canonical":"a bâlbâi 4th conjugation","present-singular-third-person":"bâlbâie","participle-past":"bâlbâit","subjunctive-third-person":"bâlbâie","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bâlbâi","gerund":"bâlbâind","first-person-indicative-present-singular":"bâlbâi","indicative-present-second-person-singular":"bâlbâi","indicative-present-singular-third-person":"bâlbâie","first-person-indicative-plural-present":"bâlbâim","indicative-plural-present-second-person":"bâlbâiți","indicative-plural-present-third-person":"bâlbâie","first-person-imperfect-indicative-singular":"bâlbâiam","imperfect-indicative-second-person-singular":"bâlbâiai","imperfect-indicative-singular-third-person":"bâlbâia","first-person-imperfect-indicative-plural":"bâlbâiam","imperfect-indicative-plural-second-person":"bâlbâiați","imperfect-indicative-plural-third-person":"bâlbâiau","first-person-indicative-perfect-singular":"bâlbâii","indicative-perfect-second-person-singular":"bâlbâiși","indicative-perfect-singular-third-person":"bâlbâi","first-person-indicative-perfect-plural":"bâlbâirăm","indicative-perfect-plural-second-person":"bâlbâirăți","indicative-perfect-plural-third-person":"bâlbâiră","first-person-indicative-pluperfect-singular":"bâlbâisem","indicative-pluperfect-second-person-singular":"bâlbâiseși","indicative-pluperfect-singular-third-person":"bâlbâise","first-person-indicative-pluperfect-plural":"bâlbâiserăm","indicative-pluperfect-plural-second-person":"bâlbâiserăți","indicative-pluperfect-plural-third-person":"bâlbâiseră","first-person-present-singular-subjunctive":"să bâlbâi","present-second-person-singular-subjunctive":"să bâlbâi","present-singular-subjunctive-third-person":"să bâlbâie","first-person-plural-present-subjunctive":"să bâlbâim","plural-present-second-person-subjunctive":"să bâlbâiți","plural-present-subjunctive-third-person":"să bâlbâie","imperative-second-person-singular":"bâlbâie","imperative-plural-second-person":"bâlbâiți","imperative-negative-second-person-singular":"nu bâlbâi","imperative-negative-plural-second-person":"nu bâlbâiți","alternative":"bîlbîi"}},{"word":"bâlbâială","pos":"noun","definitions":["stammering, stuttering"],"forms":{"plural":"bâlbâieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâlbâială","accusative-definite-nominative-singular":"bâlbâiala","accusative-indefinite-nominative-plural":"bâlbâiele","accusative-definite-nominative-plural":"bâlbâielele","dative-genitive-indefinite-singular":"bâlbâiele","dative-definite-genitive-singular":"bâlbâielei","dative-genitive-indefinite-plural":"bâlbâiele","dative-definite-genitive-plural":"bâlbâielelor","singular-vocative":"bâlbâială","plural-vocative":"bâlbâielelor","alternative":"bîlbîială"}},{"word":"bâlbâire","pos":"noun","definitions":["stutter"],"forms":{"plural":"bâlbâiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bâlbâire","accusative-definite-nominative-singular":"bâlbâirea","accusative-indefinite-nominative-plural":"bâlbâiri","accusative-definite-nominative-plural":"bâlbâirile","dative-genitive-indefinite-singular":"bâlbâiri","dative-definite-genitive-singular":"bâlbâirii","dative-genitive-indefinite-plural":"bâlbâiri","dative-definite-genitive-plural":"bâlbâirilor","singular-vocative":"bâlbâire","plural-vocative":"bâlbâirilor","alternative":"bîlbîire"}},{"word":"bâlbâit","pos":"adj","definitions":["stuttering"],"forms":{"feminine-singular":"bâlbâită","masculine-plural":"bâlbâiți","feminine-neuter-plural":"bâlbâite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâlbâit","error-unrecognized-form-feminine-indefinite-singular":"bâlbâită","error-unrecognized-form-indefinite-masculine-plural":"bâlbâiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâlbâite","definite-error-unrecognized-form-masculine-neuter-singular":"bâlbâitul","definite-error-unrecognized-form-feminine-singular":"bâlbâita","definite-error-unrecognized-form-masculine-plural":"bâlbâiții","definite-error-unrecognized-form-feminine-neuter-plural":"bâlbâitele","alternative":"bîlbîit"}},{"word":"bâlbâit","pos":"noun","definitions":["stutterer"],"forms":{"plural":"bâlbâiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bâlbâit","accusative-definite-nominative-singular":"bâlbâitul","accusative-indefinite-nominative-plural":"bâlbâiți","accusative-definite-nominative-plural":"bâlbâiții","dative-genitive-indefinite-singular":"bâlbâit","dative-definite-genitive-singular":"bâlbâitului","dative-genitive-indefinite-plural":"bâlbâiți","dative-definite-genitive-plural":"bâlbâiților","singular-vocative":"bâlbâitule","plural-vocative":"bâlbâiților","alternative":"bîlbîit"}},{"word":"bâlbâit","pos":"verb","definitions":["past participle of bâlbâi (“to stutter”)"],"forms":{"alternative":"bîlbîit"}},{"word":"bâlbâitor","pos":"adj","definitions":["which babbles"],"forms":{"feminine-singular":"bâlbâitoare","masculine-plural":"bâlbâitori","feminine-neuter-plural":"bâlbâitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâlbâitor","error-unrecognized-form-feminine-indefinite-singular":"bâlbâitoare","error-unrecognized-form-indefinite-masculine-plural":"bâlbâitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâlbâitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bâlbâitorul","definite-error-unrecognized-form-feminine-singular":"bâlbâitoarea","definite-error-unrecognized-form-masculine-plural":"bâlbâitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bâlbâitoarele","alternative":"bîlbîitor"}},{"word":"bâlbâitură","pos":"noun","definitions":["stutter"],"forms":{"plural":"bâlbâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bâlbâitură","accusative-definite-nominative-singular":"bâlbâitura","accusative-indefinite-nominative-plural":"bâlbâituri","accusative-definite-nominative-plural":"bâlbâiturile","dative-genitive-indefinite-singular":"bâlbâituri","dative-definite-genitive-singular":"bâlbâiturii","dative-genitive-indefinite-plural":"bâlbâituri","dative-definite-genitive-plural":"bâlbâiturilor","singular-vocative":"bâlbâitură","plural-vocative":"bâlbâiturilor","alternative":"bîlbîitură"}},{"word":"balbaș","pos":"noun","definitions":["mead"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"balbaș","accusative-definite-nominative":"balbașul","dative-genitive-indefinite":"balbaș","dative-definite-genitive":"balbașului","vocative":"balbașule"}},{"word":"bălbău","pos":"adj","definitions":["stuttering"],"pronunciation":"/bəlˈbəw/","forms":{"feminine-singular":"bălbaie","masculine-plural":"bălbăi","feminine-neuter-plural":"bălbaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălbău","error-unrecognized-form-feminine-indefinite-singular":"bălbaie","error-unrecognized-form-indefinite-masculine-plural":"bălbăi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălbaie","definite-error-unrecognized-form-masculine-neuter-singular":"bălbăul","definite-error-unrecognized-form-feminine-singular":"bălbaia","definite-error-unrecognized-form-masculine-plural":"bălbăii","definite-error-unrecognized-form-feminine-neuter-plural":"bălbaiele"}},{"word":"bălbuire","pos":"noun","definitions":["stutter"],"forms":{"plural":"bălbuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bălbuire","accusative-definite-nominative-singular":"bălbuirea","accusative-indefinite-nominative-plural":"bălbuiri","accusative-definite-nominative-plural":"bălbuirile","dative-genitive-indefinite-singular":"bălbuiri","dative-definite-genitive-singular":"bălbuirii","dative-genitive-indefinite-plural":"bălbuiri","dative-definite-genitive-plural":"bălbuirilor","singular-vocative":"bălbuire","plural-vocative":"bălbuirilor"}},{"word":"bălbuit","pos":"adj","definitions":["stuttering"],"forms":{"feminine-singular":"bălbuită","masculine-plural":"bălbuiți","feminine-neuter-plural":"bălbuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălbuit","error-unrecognized-form-feminine-indefinite-singular":"bălbuită","error-unrecognized-form-indefinite-masculine-plural":"bălbuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălbuite","definite-error-unrecognized-form-masculine-neuter-singular":"bălbuitul","definite-error-unrecognized-form-feminine-singular":"bălbuita","definite-error-unrecognized-form-masculine-plural":"bălbuiții","definite-error-unrecognized-form-feminine-neuter-plural":"bălbuitele"}},{"word":"bălbuit","pos":"verb","definitions":["past participle of bălbui"],"forms":{"participle-past":"of bălbui"}},{"word":"bâlcă","pos":"noun","definitions":["jug"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bâlcă","accusative-definite-nominative":"bâlcăul","dative-genitive-indefinite":"bâlcă","dative-definite-genitive":"bâlcăului","vocative":"bâlcăule","alternative":"bîlcă"}},{"word":"Bălcaciu","pos":"name","definitions":["a village in Jidvei, Alba County, Romania"],"gender":"m"},{"word":"Balcani","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Balcani, Bacău County, Romania"],"gender":"m"},{"word":"balcaniadă","pos":"noun","definitions":["competition between the Balkan nations"],"forms":{"plural":"balcaniade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balcaniadă","accusative-definite-nominative-singular":"balcaniada","accusative-indefinite-nominative-plural":"balcaniade","accusative-definite-nominative-plural":"balcaniadele","dative-genitive-indefinite-singular":"balcaniade","dative-definite-genitive-singular":"balcaniadei","dative-genitive-indefinite-plural":"balcaniade","dative-definite-genitive-plural":"balcaniadelor","singular-vocative":"balcaniadă","plural-vocative":"balcaniadelor"}},{"word":"balcanic","pos":"adj","definitions":["Balkan"],"pronunciation":"[balˈkanik]","forms":{"feminine-singular":"balcanică","masculine-plural":"balcanici","feminine-neuter-plural":"balcanice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"balcanic","error-unrecognized-form-feminine-indefinite-singular":"balcanică","error-unrecognized-form-indefinite-masculine-plural":"balcanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balcanice","definite-error-unrecognized-form-masculine-neuter-singular":"balcanicul","definite-error-unrecognized-form-feminine-singular":"balcanica","definite-error-unrecognized-form-masculine-plural":"balcanicii","definite-error-unrecognized-form-feminine-neuter-plural":"balcanicele"}},{"word":"balcanism","pos":"noun","definitions":["Balkanism"],"forms":{"plural":"balcanisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balcanism","accusative-definite-nominative-singular":"balcanismul","accusative-indefinite-nominative-plural":"balcanisme","accusative-definite-nominative-plural":"balcanismele","dative-genitive-indefinite-singular":"balcanism","dative-definite-genitive-singular":"balcanismului","dative-genitive-indefinite-plural":"balcanisme","dative-definite-genitive-plural":"balcanismelor","singular-vocative":"balcanismule","plural-vocative":"balcanismelor"}},{"word":"balcanist","pos":"noun","definitions":["Balkanologist"],"forms":{"plural":"balcaniști","feminine":"equivalent balcanistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balcanist","accusative-definite-nominative-singular":"balcanistul","accusative-indefinite-nominative-plural":"balcaniști","accusative-definite-nominative-plural":"balcaniștii","dative-genitive-indefinite-singular":"balcanist","dative-definite-genitive-singular":"balcanistului","dative-genitive-indefinite-plural":"balcaniști","dative-definite-genitive-plural":"balcaniștilor","singular-vocative":"balcanistule","plural-vocative":"balcaniștilor"}},{"word":"balcanistă","pos":"noun","definitions":["female equivalent of balcanist"],"forms":{"plural":"balcaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balcanistă","accusative-definite-nominative-singular":"balcanista","accusative-indefinite-nominative-plural":"balcaniste","accusative-definite-nominative-plural":"balcanistele","dative-genitive-indefinite-singular":"balcaniste","dative-definite-genitive-singular":"balcanistei","dative-genitive-indefinite-plural":"balcaniste","dative-definite-genitive-plural":"balcanistelor","singular-vocative":"balcanistă","plural-vocative":"balcanistelor"}},{"word":"balcanistică","pos":"noun","definitions":["Balkan studies"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"balcanistică","accusative-definite-nominative":"balcanistica","dative-genitive-indefinite":"balcanistice","dative-definite-genitive":"balcanisticei","vocative":"balcanistică"}},{"word":"balcanolog","pos":"noun","definitions":["Balkanologist"],"forms":{"plural":"balcanologi","feminine":"equivalent balcanologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balcanolog","accusative-definite-nominative-singular":"balcanologul","accusative-indefinite-nominative-plural":"balcanologi","accusative-definite-nominative-plural":"balcanologii","dative-genitive-indefinite-singular":"balcanolog","dative-definite-genitive-singular":"balcanologului","dative-genitive-indefinite-plural":"balcanologi","dative-definite-genitive-plural":"balcanologilor","singular-vocative":"balcanologule","plural-vocative":"balcanologilor"}},{"word":"balcanologă","pos":"noun","definitions":["female equivalent of balcanolog"],"forms":{"plural":"balcanologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balcanologă","accusative-definite-nominative-singular":"balcanologa","accusative-indefinite-nominative-plural":"balcanologe","accusative-definite-nominative-plural":"balcanologele","dative-genitive-indefinite-singular":"balcanologe","dative-definite-genitive-singular":"balcanologei","dative-genitive-indefinite-plural":"balcanologe","dative-definite-genitive-plural":"balcanologelor","singular-vocative":"balcanologă","plural-vocative":"balcanologelor"}},{"word":"balcanologie","pos":"noun","definitions":["Balkanology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"balcanologie","accusative-definite-nominative-singular":"balcanologia","accusative-indefinite-nominative-plural":"balcanologii","accusative-definite-nominative-plural":"balcanologiile","dative-genitive-indefinite-singular":"balcanologii","dative-definite-genitive-singular":"balcanologiei","dative-genitive-indefinite-plural":"balcanologii","dative-definite-genitive-plural":"balcanologiilor","singular-vocative":"balcanologie","plural-vocative":"balcanologiilor"}},{"word":"Bălcăuți","pos":"name","definitions":["a village in Bălcăuți, Briceni Raion, Moldova","a commune of Briceni Raion, Moldova","a commune of Suceava County, Romania","a village in Bălcăuți, Suceava County, Romania"],"gender":"m"},{"word":"balcâz","pos":"adj","definitions":["ugly"],"forms":{"feminine-singular":"balcâză","masculine-plural":"balcâzi","feminine-neuter-plural":"balcâze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balcâz","error-unrecognized-form-feminine-indefinite-singular":"balcâză","error-unrecognized-form-indefinite-masculine-plural":"balcâzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"balcâze","definite-error-unrecognized-form-masculine-neuter-singular":"balcâzul","definite-error-unrecognized-form-feminine-singular":"balcâza","definite-error-unrecognized-form-masculine-plural":"balcâzii","definite-error-unrecognized-form-feminine-neuter-plural":"balcâzele","alternative":"balcîz"}},{"word":"Bălceana","pos":"name","definitions":["a village in Bălceana, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"f"},{"word":"Bălcescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălcescu"}},{"word":"Bălcești","pos":"name","definitions":["a village in Beliș, Cluj County, Romania","a village in Căpușu Mare, Cluj County, Romania","a village in Bengești-Ciocadia, Gorj County, Romania","a city in Vâlcea County, Romania"],"gender":"m"},{"word":"bâlci","pos":"noun","definitions":["fair"],"pronunciation":"/bɨlt͡ʃʲ/","forms":{"plural":"bâlciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bâlci","accusative-definite-nominative-singular":"bâlciul","accusative-indefinite-nominative-plural":"bâlciuri","accusative-definite-nominative-plural":"bâlciurile","dative-genitive-indefinite-singular":"bâlci","dative-definite-genitive-singular":"bâlciului","dative-genitive-indefinite-plural":"bâlciuri","dative-definite-genitive-plural":"bâlciurilor","singular-vocative":"bâlciule","plural-vocative":"bâlciurilor","alternative":"bîlci"}},{"word":"balcic","pos":"noun","definitions":["muddy area"],"forms":{"plural":"balcicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balcic","accusative-definite-nominative-singular":"balcicul","accusative-indefinite-nominative-plural":"balcicuri","accusative-definite-nominative-plural":"balcicurile","dative-genitive-indefinite-singular":"balcic","dative-definite-genitive-singular":"balcicului","dative-genitive-indefinite-plural":"balcicuri","dative-definite-genitive-plural":"balcicurilor","singular-vocative":"balcicule","plural-vocative":"balcicurilor"}},{"word":"balcoane","pos":"noun","definitions":["plural of balcon"],"pronunciation":"[balˈko̯a.ne]","gender":"n-p"},{"word":"balcon","pos":"noun","definitions":["balcony","boob, tit"],"pronunciation":"/balˈkon/","examples":[{"ro":"El stă pe balcon.","en":"He is sitting on the balcony."},{"ro":"Are niște balcoane imense!","en":"She has huge tits!"}],"forms":{"plural":"balcoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balcon","accusative-definite-nominative-singular":"balconul","accusative-indefinite-nominative-plural":"balcoane","accusative-definite-nominative-plural":"balcoanele","dative-genitive-indefinite-singular":"balcon","dative-definite-genitive-singular":"balconului","dative-genitive-indefinite-plural":"balcoane","dative-definite-genitive-plural":"balcoanelor","singular-vocative":"balconule","plural-vocative":"balcoanelor"}},{"word":"balconaș","pos":"noun","definitions":["diminutive of balcon; small balcony"],"forms":{"plural":"balconașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balconaș","accusative-definite-nominative-singular":"balconașul","accusative-indefinite-nominative-plural":"balconașe","accusative-definite-nominative-plural":"balconașele","dative-genitive-indefinite-singular":"balconaș","dative-definite-genitive-singular":"balconașului","dative-genitive-indefinite-plural":"balconașe","dative-definite-genitive-plural":"balconașelor","singular-vocative":"balconașule","plural-vocative":"balconașelor"}},{"word":"bâlcos","pos":"adj","definitions":["marshy"],"forms":{"feminine-singular":"bâlcoasă","masculine-plural":"bâlcoși","feminine-neuter-plural":"bâlcoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâlcos","error-unrecognized-form-feminine-indefinite-singular":"bâlcoasă","error-unrecognized-form-indefinite-masculine-plural":"bâlcoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâlcoase","definite-error-unrecognized-form-masculine-neuter-singular":"bâlcosul","definite-error-unrecognized-form-feminine-singular":"bâlcoasa","definite-error-unrecognized-form-masculine-plural":"bâlcoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bâlcoasele","alternative":"bîlcos"}},{"word":"Balda","pos":"name","definitions":["a locality in Sarmașu, Mureș County, Romania"],"gender":"f"},{"word":"bâldâbâc","pos":"intj","definitions":["splash"],"forms":{"alternative":"bîldîbîc"}},{"word":"baldachin","pos":"noun","definitions":["baldaquin"],"forms":{"plural":"baldachine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baldachin","accusative-definite-nominative-singular":"baldachinul","accusative-indefinite-nominative-plural":"baldachine","accusative-definite-nominative-plural":"baldachinele","dative-genitive-indefinite-singular":"baldachin","dative-definite-genitive-singular":"baldachinului","dative-genitive-indefinite-plural":"baldachine","dative-definite-genitive-plural":"baldachinelor","singular-vocative":"baldachinule","plural-vocative":"baldachinelor"}},{"word":"baldahin","pos":"noun","definitions":["alternative form of baldachin"],"forms":{"plural":"baldahine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baldahin","accusative-definite-nominative-singular":"baldahinul","accusative-indefinite-nominative-plural":"baldahine","accusative-definite-nominative-plural":"baldahinele","dative-genitive-indefinite-singular":"baldahin","dative-definite-genitive-singular":"baldahinului","dative-genitive-indefinite-plural":"baldahine","dative-definite-genitive-plural":"baldahinelor","singular-vocative":"baldahinule","plural-vocative":"baldahinelor"}},{"word":"Bâldana","pos":"name","definitions":["a village in Tărtășești, Dâmbovița County, Romania"],"gender":"f","forms":{"alternative":"Bîldana"}},{"word":"baldâr","pos":"noun","definitions":["tripe"],"forms":{"plural":"baldâre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baldâr","accusative-definite-nominative-singular":"baldârul","accusative-indefinite-nominative-plural":"baldâre","accusative-definite-nominative-plural":"baldârele","dative-genitive-indefinite-singular":"baldâr","dative-definite-genitive-singular":"baldârului","dative-genitive-indefinite-plural":"baldâre","dative-definite-genitive-plural":"baldârelor","singular-vocative":"baldârule","plural-vocative":"baldârelor","alternative":"baldîr"}},{"word":"Baldovin","pos":"name","definitions":["a village in Baia de Criș, Hunedoara County, Romania"],"gender":"m"},{"word":"Baldovinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Baldovinescu"}},{"word":"Baldovinești","pos":"name","definitions":["a village in Vădeni, Brăila County, Romania","a commune of Olt County, Romania","a village in Baldovinești, Olt County, Romania","a village in Ciolănești, Teleorman County, Romania"],"gender":"m"},{"word":"bale","pos":"noun","definitions":["slobber, drool, dribble, saliva"],"pronunciation":"/ˈba.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"bale","accusative-definite-nominative":"balele","dative-genitive-indefinite":"bale","dative-definite-genitive":"balelor","vocative":"-"}},{"word":"Bâlea","pos":"name","definitions":["a lake in Sibiu County, Romania"],"pronunciation":"/ˈbɨ.le̯a/"},{"word":"Băleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băleanu"}},{"word":"Băleasa","pos":"name","definitions":["a village in Găvănești, Olt County, Romania"],"gender":"f"},{"word":"balega","pos":"noun","definitions":["definite nominative/accusative singular of balegă"],"gender":"f"},{"word":"Balegă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balegă"}},{"word":"balegă","pos":"noun","definitions":["alternative form of baligă"],"forms":{"plural":"balegi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"balegă","accusative-definite-nominative-singular":"balega","accusative-indefinite-nominative-plural":"balegi","accusative-definite-nominative-plural":"balegile","dative-genitive-indefinite-singular":"balegi","dative-definite-genitive-singular":"balegii","dative-genitive-indefinite-plural":"balegi","dative-definite-genitive-plural":"balegilor","singular-vocative":"balegă","plural-vocative":"balegilor"}},{"word":"bălega","pos":"verb","definitions":["to defecate (about animals)"],"forms":{"canonical":"a bălega 1st conjugation","present-singular-third-person":"bălegă","participle-past":"bălegat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bălega","gerund":"bălegând","first-person-indicative-present-singular":"băleg","indicative-present-second-person-singular":"bălegi","indicative-present-singular-third-person":"bălegă","first-person-indicative-plural-present":"bălegăm","indicative-plural-present-second-person":"bălegați","indicative-plural-present-third-person":"bălegă","first-person-imperfect-indicative-singular":"bălegam","imperfect-indicative-second-person-singular":"bălegai","imperfect-indicative-singular-third-person":"bălega","first-person-imperfect-indicative-plural":"bălegam","imperfect-indicative-plural-second-person":"bălegați","imperfect-indicative-plural-third-person":"bălegau","first-person-indicative-perfect-singular":"bălegai","indicative-perfect-second-person-singular":"bălegași","indicative-perfect-singular-third-person":"bălegă","first-person-indicative-perfect-plural":"bălegarăm","indicative-perfect-plural-second-person":"bălegarăți","indicative-perfect-plural-third-person":"bălegară","first-person-indicative-pluperfect-singular":"bălegasem","indicative-pluperfect-second-person-singular":"bălegaseși","indicative-pluperfect-singular-third-person":"bălegase","first-person-indicative-pluperfect-plural":"bălegaserăm","indicative-pluperfect-plural-second-person":"bălegaserăți","indicative-pluperfect-plural-third-person":"bălegaseră","first-person-present-singular-subjunctive":"să băleg","present-second-person-singular-subjunctive":"să bălegi","present-singular-subjunctive-third-person":"să bălege","first-person-plural-present-subjunctive":"să bălegăm","plural-present-second-person-subjunctive":"să bălegați","plural-present-subjunctive-third-person":"să bălege","imperative-second-person-singular":"bălegă","imperative-plural-second-person":"bălegați","imperative-negative-second-person-singular":"nu bălega","imperative-negative-plural-second-person":"nu bălegați"}},{"word":"bălegar","pos":"noun","definitions":["manure"],"pronunciation":"/bə.le.ˈɡar/","forms":{"plural":"bălegaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bălegar","accusative-definite-nominative-singular":"bălegarul","accusative-indefinite-nominative-plural":"bălegaruri","accusative-definite-nominative-plural":"bălegarurile","dative-genitive-indefinite-singular":"bălegar","dative-definite-genitive-singular":"bălegarului","dative-genitive-indefinite-plural":"bălegaruri","dative-definite-genitive-plural":"bălegarurilor","singular-vocative":"bălegarule","plural-vocative":"bălegarurilor"}},{"word":"bălegar","pos":"noun","definitions":["European dung beetle (Geotrupes stercorarius)"],"pronunciation":"/bə.le.ˈɡar/","forms":{"plural":"bălegari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bălegar","accusative-definite-nominative-singular":"bălegarul","accusative-indefinite-nominative-plural":"bălegari","accusative-definite-nominative-plural":"bălegarii","dative-genitive-indefinite-singular":"bălegar","dative-definite-genitive-singular":"bălegarului","dative-genitive-indefinite-plural":"bălegari","dative-definite-genitive-plural":"bălegarilor","singular-vocative":"bălegarule","plural-vocative":"bălegarilor"}},{"word":"balei","pos":"noun","definitions":["definite genitive/dative singular of bală"],"pronunciation":"[ˈbalej]","gender":"f"},{"word":"baleiaj","pos":"noun","definitions":["scan"],"forms":{"plural":"baleiaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baleiaj","accusative-definite-nominative-singular":"baleiajul","accusative-indefinite-nominative-plural":"baleiaje","accusative-definite-nominative-plural":"baleiajele","dative-genitive-indefinite-singular":"baleiaj","dative-definite-genitive-singular":"baleiajului","dative-genitive-indefinite-plural":"baleiaje","dative-definite-genitive-plural":"baleiajelor","singular-vocative":"baleiajule","plural-vocative":"baleiajelor"}},{"word":"balena","pos":"noun","definitions":["definite nominative/accusative singular of balenă"],"pronunciation":"[baˈlena]","gender":"f"},{"word":"balenă","pos":"noun","definitions":["whale (large sea mammal)"],"pronunciation":"/baˈle.nə/","forms":{"plural":"balene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balenă","accusative-definite-nominative-singular":"balena","accusative-indefinite-nominative-plural":"balene","accusative-definite-nominative-plural":"balenele","dative-genitive-indefinite-singular":"balene","dative-definite-genitive-singular":"balenei","dative-genitive-indefinite-plural":"balene","dative-definite-genitive-plural":"balenelor","singular-vocative":"balenă","plural-vocative":"balenelor"}},{"word":"balenă albastră","pos":"noun","definitions":["blue whale"],"forms":{"plural":"balene albastre"}},{"word":"balenă cu cocoașă","pos":"noun","definitions":["humpback whale"],"forms":{"plural":"balene cu cocoașă"}},{"word":"balene","pos":"noun","definitions":["inflection of balenă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[baˈlene]","gender":"f"},{"word":"Băleni","pos":"name","definitions":["a village in Lazuri de Beiuș, Bihor County, Romania","a commune of Dâmbovița County, Romania","a commune of Galați County, Romania","a village in Băleni, Galați County, Romania"],"gender":"m"},{"word":"Băleni-Români","pos":"name","definitions":["a village in Băleni, Dâmbovița County, Romania"],"gender":"m","forms":{"alternative":"Băleni-Romîni"}},{"word":"Băleni-Sârbi","pos":"name","definitions":["a village in Băleni, Dâmbovița County, Romania"],"gender":"m","forms":{"alternative":"Băleni-Sîrbi"}},{"word":"balenieră","pos":"noun","definitions":["whaler"],"forms":{"plural":"baleniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balenieră","accusative-definite-nominative-singular":"baleniera","accusative-indefinite-nominative-plural":"baleniere","accusative-definite-nominative-plural":"balenierele","dative-genitive-indefinite-singular":"baleniere","dative-definite-genitive-singular":"balenierei","dative-genitive-indefinite-plural":"baleniere","dative-definite-genitive-plural":"balenierelor","singular-vocative":"balenieră","plural-vocative":"balenierelor"}},{"word":"baleno","pos":"noun","definitions":["vocative singular of balenă"],"pronunciation":"[baˈleno]","gender":"f"},{"word":"balercă","pos":"noun","definitions":["firkin"],"forms":{"plural":"balerce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balercă","accusative-definite-nominative-singular":"balerca","accusative-indefinite-nominative-plural":"balerce","accusative-definite-nominative-plural":"balercele","dative-genitive-indefinite-singular":"balerce","dative-definite-genitive-singular":"balercei","dative-genitive-indefinite-plural":"balerce","dative-definite-genitive-plural":"balercelor","singular-vocative":"balercă","plural-vocative":"balercelor"}},{"word":"balercuță","pos":"noun","definitions":["diminutive of balercă; small barrel"],"forms":{"plural":"balercuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balercuță","accusative-definite-nominative-singular":"balercuța","accusative-indefinite-nominative-plural":"balercuțe","accusative-definite-nominative-plural":"balercuțele","dative-genitive-indefinite-singular":"balercuțe","dative-definite-genitive-singular":"balercuței","dative-genitive-indefinite-plural":"balercuțe","dative-definite-genitive-plural":"balercuțelor","singular-vocative":"balercuță","plural-vocative":"balercuțelor"}},{"word":"balerin","pos":"noun","definitions":["ballet dancer"],"forms":{"plural":"balerini","feminine":"equivalent balerină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balerin","accusative-definite-nominative-singular":"balerinul","accusative-indefinite-nominative-plural":"balerini","accusative-definite-nominative-plural":"balerinii","dative-genitive-indefinite-singular":"balerin","dative-definite-genitive-singular":"balerinului","dative-genitive-indefinite-plural":"balerini","dative-definite-genitive-plural":"balerinilor","singular-vocative":"balerinule","plural-vocative":"balerinilor"}},{"word":"balerină","pos":"noun","definitions":["female equivalent of balerin: ballerina"],"pronunciation":"/ba.leˈri.nə/","forms":{"plural":"balerine","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"balerină","accusative-definite-nominative-singular":"balerina","accusative-indefinite-nominative-plural":"balerine","accusative-definite-nominative-plural":"balerinele","dative-genitive-indefinite-singular":"balerine","dative-definite-genitive-singular":"balerinei","dative-genitive-indefinite-plural":"balerine","dative-definite-genitive-plural":"balerinelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"balerine","pos":"noun","definitions":["plural of balerină"],"gender":"f"},{"word":"Bălescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălescu"}},{"word":"Bălescu Mare","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Bâsca Mică"],"gender":"m"},{"word":"Bălescuțu","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Bâsca Mică"],"gender":"m"},{"word":"Bălești","pos":"name","definitions":["a village in Bistra, Alba County, Romania","a commune of Gorj County, Romania","a village in Bălești, Gorj County, Romania","a village in Cozmești, Vaslui County, Romania","a commune of Vrancea County, Romania"],"gender":"m"},{"word":"Bălești-Cătun","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"m"},{"word":"balet","pos":"noun","definitions":["ballet (classical form of dance)"],"forms":{"plural":"balete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balet","accusative-definite-nominative-singular":"baletul","accusative-indefinite-nominative-plural":"balete","accusative-definite-nominative-plural":"baletele","dative-genitive-indefinite-singular":"balet","dative-definite-genitive-singular":"baletului","dative-genitive-indefinite-plural":"balete","dative-definite-genitive-plural":"baletelor","singular-vocative":"baletule","plural-vocative":"baletelor"}},{"word":"baletist","pos":"noun","definitions":["ballet dancer"],"forms":{"plural":"baletiști","feminine":"equivalent baletistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baletist","accusative-definite-nominative-singular":"baletistul","accusative-indefinite-nominative-plural":"baletiști","accusative-definite-nominative-plural":"baletiștii","dative-genitive-indefinite-singular":"baletist","dative-definite-genitive-singular":"baletistului","dative-genitive-indefinite-plural":"baletiști","dative-definite-genitive-plural":"baletiștilor","singular-vocative":"baletistule","plural-vocative":"baletiștilor"}},{"word":"baletistă","pos":"noun","definitions":["female equivalent of baletist: ballerina"],"pronunciation":"/ba.leˈtis.tə/","forms":{"plural":"baletiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"baletistă","accusative-definite-nominative-singular":"baletista","accusative-indefinite-nominative-plural":"baletiste","accusative-definite-nominative-plural":"baletistele","dative-genitive-indefinite-singular":"baletiste","dative-definite-genitive-singular":"baletistei","dative-genitive-indefinite-plural":"baletiste","dative-definite-genitive-plural":"baletistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"baletiste","pos":"noun","definitions":["plural of baletistă"],"gender":"f"},{"word":"Balgiu","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Albina."],"gender":"m"},{"word":"balgiu","pos":"noun","definitions":["honey merchant"],"forms":{"plural":"balgii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balgiu","accusative-definite-nominative-singular":"balgiuul","accusative-indefinite-nominative-plural":"balgii","accusative-definite-nominative-plural":"balgiii","dative-genitive-indefinite-singular":"balgiu","dative-definite-genitive-singular":"balgiuului","dative-genitive-indefinite-plural":"balgii","dative-definite-genitive-plural":"balgiilor","singular-vocative":"balgiuule","plural-vocative":"balgiilor"}},{"word":"Bălgrad","pos":"name","definitions":["Alba Iulia (a city in Alba County, Romania)."],"gender":"f"},{"word":"Bălgrădean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălgrădean"}},{"word":"Bâlhacu","pos":"name","definitions":["a village in C. A. Rosetti, Buzău County, Romania"],"gender":"m","forms":{"alternative":"Bîlhacu"}},{"word":"băliăire","pos":"noun","definitions":["fumbling"],"forms":{"plural":"băliăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"băliăire","accusative-definite-nominative-singular":"băliăirea","accusative-indefinite-nominative-plural":"băliăiri","accusative-definite-nominative-plural":"băliăirile","dative-genitive-indefinite-singular":"băliăiri","dative-definite-genitive-singular":"băliăirii","dative-genitive-indefinite-plural":"băliăiri","dative-definite-genitive-plural":"băliăirilor","singular-vocative":"băliăire","plural-vocative":"băliăirilor"}},{"word":"balic","pos":"noun","definitions":["freshman, first-year student"],"forms":{"plural":"balici","feminine":"equivalent balică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balic","accusative-definite-nominative-singular":"balicul","accusative-indefinite-nominative-plural":"balici","accusative-definite-nominative-plural":"balicii","dative-genitive-indefinite-singular":"balic","dative-definite-genitive-singular":"balicului","dative-genitive-indefinite-plural":"balici","dative-definite-genitive-plural":"balicilor","singular-vocative":"balicule","plural-vocative":"balicilor"}},{"word":"balică","pos":"noun","definitions":["female equivalent of balic"],"forms":{"plural":"balici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"balică","accusative-definite-nominative-singular":"balica","accusative-indefinite-nominative-plural":"balici","accusative-definite-nominative-plural":"balicile","dative-genitive-indefinite-singular":"balici","dative-definite-genitive-singular":"balicii","dative-genitive-indefinite-plural":"balici","dative-definite-genitive-plural":"balicilor","singular-vocative":"balică","plural-vocative":"balicilor"}},{"word":"bâlie","pos":"noun","definitions":["grass"],"forms":{"plural":"bâlii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bâlie","accusative-definite-nominative-singular":"bâlia","accusative-indefinite-nominative-plural":"bâlii","accusative-definite-nominative-plural":"bâliile","dative-genitive-indefinite-singular":"bâlii","dative-definite-genitive-singular":"bâliei","dative-genitive-indefinite-plural":"bâlii","dative-definite-genitive-plural":"bâliilor","singular-vocative":"bâlie","plural-vocative":"bâliilor"}},{"word":"Baliga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baliga"}},{"word":"baliga","pos":"noun","definitions":["definite nominative/accusative singular of baligă"],"gender":"f"},{"word":"baligă","pos":"noun","definitions":["dung (of cows, horses etc.)"],"pronunciation":"[ˈba.li.ɡə]","forms":{"plural":"baligi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"baligă","accusative-definite-nominative-singular":"baliga","accusative-indefinite-nominative-plural":"baligi","accusative-definite-nominative-plural":"baligile","dative-genitive-indefinite-singular":"baligi","dative-definite-genitive-singular":"baligii","dative-genitive-indefinite-plural":"baligi","dative-definite-genitive-plural":"baligilor","singular-vocative":"baligă","plural-vocative":"baligilor","alternative":"balegă"}},{"word":"băliga","pos":"verb","definitions":["to dung, to defecate (about an animal)"],"forms":{"canonical":"a băliga 1st conjugation","present-singular-third-person":"baligă","participle-past":"băligat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a băliga","gerund":"băligând","first-person-indicative-present-singular":"bălig","indicative-present-second-person-singular":"băligi","indicative-present-singular-third-person":"băligă","first-person-indicative-plural-present":"băligăm","indicative-plural-present-second-person":"băligați","indicative-plural-present-third-person":"băligă","first-person-imperfect-indicative-singular":"băligam","imperfect-indicative-second-person-singular":"băligai","imperfect-indicative-singular-third-person":"băliga","first-person-imperfect-indicative-plural":"băligam","imperfect-indicative-plural-second-person":"băligați","imperfect-indicative-plural-third-person":"băligau","first-person-indicative-perfect-singular":"băligai","indicative-perfect-second-person-singular":"băligași","indicative-perfect-singular-third-person":"băligă","first-person-indicative-perfect-plural":"băligarăm","indicative-perfect-plural-second-person":"băligarăți","indicative-perfect-plural-third-person":"băligară","first-person-indicative-pluperfect-singular":"băligasem","indicative-pluperfect-second-person-singular":"băligaseși","indicative-pluperfect-singular-third-person":"băligase","first-person-indicative-pluperfect-plural":"băligaserăm","indicative-pluperfect-plural-second-person":"băligaserăți","indicative-pluperfect-plural-third-person":"băligaseră","first-person-present-singular-subjunctive":"să bălig","present-second-person-singular-subjunctive":"să băligi","present-singular-subjunctive-third-person":"să bălige","first-person-plural-present-subjunctive":"să băligăm","plural-present-second-person-subjunctive":"să băligați","plural-present-subjunctive-third-person":"să bălige","imperative-second-person-singular":"băligă","imperative-plural-second-person":"băligați","imperative-negative-second-person-singular":"nu băliga","imperative-negative-plural-second-person":"nu băligați"}},{"word":"băligar","pos":"noun","definitions":["alternative form of bălegar"],"forms":{"plural":"băligari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băligar","accusative-definite-nominative-singular":"băligarul","accusative-indefinite-nominative-plural":"băligari","accusative-definite-nominative-plural":"băligarii","dative-genitive-indefinite-singular":"băligar","dative-definite-genitive-singular":"băligarului","dative-genitive-indefinite-plural":"băligari","dative-definite-genitive-plural":"băligarilor","singular-vocative":"băligarule","plural-vocative":"băligarilor"}},{"word":"Băligoasa","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Sărățel"],"gender":"f"},{"word":"băliguță","pos":"noun","definitions":["diminutive of baligă"],"forms":{"plural":"băliguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băliguță","accusative-definite-nominative-singular":"băliguța","accusative-indefinite-nominative-plural":"băliguțe","accusative-definite-nominative-plural":"băliguțele","dative-genitive-indefinite-singular":"băliguțe","dative-definite-genitive-singular":"băliguței","dative-genitive-indefinite-plural":"băliguțe","dative-definite-genitive-plural":"băliguțelor","singular-vocative":"băliguță","plural-vocative":"băliguțelor"}},{"word":"Bălilești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bălilești, Argeș County, Romania","a village in Tigveni, Argeș County, Romania"],"gender":"m"},{"word":"balimez","pos":"noun","definitions":["bombard"],"forms":{"plural":"balimezuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balimez","accusative-definite-nominative-singular":"balimezul","accusative-indefinite-nominative-plural":"balimezuri","accusative-definite-nominative-plural":"balimezurile","dative-genitive-indefinite-singular":"balimez","dative-definite-genitive-singular":"balimezului","dative-genitive-indefinite-plural":"balimezuri","dative-definite-genitive-plural":"balimezurilor","singular-vocative":"balimezule","plural-vocative":"balimezurilor"}},{"word":"Bălineanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălineanu"}},{"word":"Bălinești","pos":"name","definitions":["a village in Grămești, Suceava County, Romania"],"gender":"m"},{"word":"Bălinișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălinișteanu"}},{"word":"Balint","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Balint"}},{"word":"Balinț","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Balinț, Timiș County, Romania"],"gender":"m"},{"word":"Balintescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Balintescu"}},{"word":"Bălintescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălintescu"}},{"word":"Balintești","pos":"name","definitions":["a village in Berești-Meria, Galați County, Romania"],"gender":"m"},{"word":"Balintfalău","pos":"name","definitions":["a village in Mureș County, Romania. Renamed to Bolintineni."],"gender":"m"},{"word":"Balinți","pos":"name","definitions":["a village in Havârna, Botoșani County, Romania"],"gender":"m"},{"word":"Balinții Noi","pos":"name","definitions":["a village in Iarova, Soroca Raion, Moldova"],"gender":"m"},{"word":"balistă","pos":"noun","definitions":["ballista"],"pronunciation":"/baˈlis.tə/","forms":{"plural":"baliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balistă","accusative-definite-nominative-singular":"balista","accusative-indefinite-nominative-plural":"baliste","accusative-definite-nominative-plural":"balistele","dative-genitive-indefinite-singular":"baliste","dative-definite-genitive-singular":"balistei","dative-genitive-indefinite-plural":"baliste","dative-definite-genitive-plural":"balistelor","singular-vocative":"balistă","plural-vocative":"balistelor"}},{"word":"balistic","pos":"adj","definitions":["ballistic"],"forms":{"feminine-singular":"balistică","masculine-plural":"balistici","feminine-neuter-plural":"balistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balistic","error-unrecognized-form-feminine-indefinite-singular":"balistică","error-unrecognized-form-indefinite-masculine-plural":"balistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balistice","definite-error-unrecognized-form-masculine-neuter-singular":"balisticul","definite-error-unrecognized-form-feminine-singular":"balistica","definite-error-unrecognized-form-masculine-plural":"balisticii","definite-error-unrecognized-form-feminine-neuter-plural":"balisticele"}},{"word":"balistică","pos":"noun","definitions":["ballistics"],"forms":{"plural":"balistici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"balistică","accusative-definite-nominative-singular":"balistica","accusative-indefinite-nominative-plural":"balistici","accusative-definite-nominative-plural":"balisticile","dative-genitive-indefinite-singular":"balistici","dative-definite-genitive-singular":"balisticii","dative-genitive-indefinite-plural":"balistici","dative-definite-genitive-plural":"balisticilor","singular-vocative":"balistică","plural-vocative":"balisticilor"}},{"word":"balistician","pos":"noun","definitions":["ballistician"],"forms":{"plural":"balisticieni","feminine":"equivalent balisticiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balistician","accusative-definite-nominative-singular":"balisticianul","accusative-indefinite-nominative-plural":"balisticieni","accusative-definite-nominative-plural":"balisticienii","dative-genitive-indefinite-singular":"balistician","dative-definite-genitive-singular":"balisticianului","dative-genitive-indefinite-plural":"balisticieni","dative-definite-genitive-plural":"balisticienilor","singular-vocative":"balisticianule","plural-vocative":"balisticienilor"}},{"word":"balisticiană","pos":"noun","definitions":["female equivalent of balistician"],"forms":{"plural":"balisticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balisticiană","accusative-definite-nominative-singular":"balisticiana","accusative-indefinite-nominative-plural":"balisticiene","accusative-definite-nominative-plural":"balisticienele","dative-genitive-indefinite-singular":"balisticiene","dative-definite-genitive-singular":"balisticienei","dative-genitive-indefinite-plural":"balisticiene","dative-definite-genitive-plural":"balisticienelor","singular-vocative":"balisticiană","plural-vocative":"balisticienelor"}},{"word":"Balița","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balița"}},{"word":"băliuță","pos":"noun","definitions":["diminutive of balie"],"forms":{"plural":"băliuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băliuță","accusative-definite-nominative-singular":"băliuța","accusative-indefinite-nominative-plural":"băliuțe","accusative-definite-nominative-plural":"băliuțele","dative-genitive-indefinite-singular":"băliuțe","dative-definite-genitive-singular":"băliuței","dative-genitive-indefinite-plural":"băliuțe","dative-definite-genitive-plural":"băliuțelor","singular-vocative":"băliuță","plural-vocative":"băliuțelor"}},{"word":"balivernă","pos":"noun","definitions":["nonsense"],"forms":{"plural":"baliverne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balivernă","accusative-definite-nominative-singular":"baliverna","accusative-indefinite-nominative-plural":"baliverne","accusative-definite-nominative-plural":"balivernele","dative-genitive-indefinite-singular":"baliverne","dative-definite-genitive-singular":"balivernei","dative-genitive-indefinite-plural":"baliverne","dative-definite-genitive-plural":"balivernelor","singular-vocative":"balivernă","plural-vocative":"balivernelor"}},{"word":"baliza","pos":"verb","definitions":["to put beacons"],"forms":{"canonical":"a baliza 1st conjugation","present-singular-third-person":"balizează","participle-past":"balizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a baliza","gerund":"balizând","first-person-indicative-present-singular":"balizez","indicative-present-second-person-singular":"balizezi","indicative-present-singular-third-person":"balizează","first-person-indicative-plural-present":"balizăm","indicative-plural-present-second-person":"balizați","indicative-plural-present-third-person":"balizează","first-person-imperfect-indicative-singular":"balizam","imperfect-indicative-second-person-singular":"balizai","imperfect-indicative-singular-third-person":"baliza","first-person-imperfect-indicative-plural":"balizam","imperfect-indicative-plural-second-person":"balizați","imperfect-indicative-plural-third-person":"balizau","first-person-indicative-perfect-singular":"balizai","indicative-perfect-second-person-singular":"balizași","indicative-perfect-singular-third-person":"baliză","first-person-indicative-perfect-plural":"balizarăm","indicative-perfect-plural-second-person":"balizarăți","indicative-perfect-plural-third-person":"balizară","first-person-indicative-pluperfect-singular":"balizasem","indicative-pluperfect-second-person-singular":"balizaseși","indicative-pluperfect-singular-third-person":"balizase","first-person-indicative-pluperfect-plural":"balizaserăm","indicative-pluperfect-plural-second-person":"balizaserăți","indicative-pluperfect-plural-third-person":"balizaseră","first-person-present-singular-subjunctive":"să balizez","present-second-person-singular-subjunctive":"să balizezi","present-singular-subjunctive-third-person":"să balizeze","first-person-plural-present-subjunctive":"să balizăm","plural-present-second-person-subjunctive":"să balizați","plural-present-subjunctive-third-person":"să balizeze","imperative-second-person-singular":"balizează","imperative-plural-second-person":"balizați","imperative-negative-second-person-singular":"nu baliza","imperative-negative-plural-second-person":"nu balizați"}},{"word":"baliză","pos":"noun","definitions":["buoy"],"forms":{"plural":"balize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baliză","accusative-definite-nominative-singular":"baliza","accusative-indefinite-nominative-plural":"balize","accusative-definite-nominative-plural":"balizele","dative-genitive-indefinite-singular":"balize","dative-definite-genitive-singular":"balizei","dative-genitive-indefinite-plural":"balize","dative-definite-genitive-plural":"balizelor","singular-vocative":"baliză","plural-vocative":"balizelor"}},{"word":"balizaj","pos":"noun","definitions":["beaconing"],"forms":{"plural":"balizaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balizaj","accusative-definite-nominative-singular":"balizajul","accusative-indefinite-nominative-plural":"balizaje","accusative-definite-nominative-plural":"balizajele","dative-genitive-indefinite-singular":"balizaj","dative-definite-genitive-singular":"balizajului","dative-genitive-indefinite-plural":"balizaje","dative-definite-genitive-plural":"balizajelor","singular-vocative":"balizajule","plural-vocative":"balizajelor"}},{"word":"balizare","pos":"noun","definitions":["beaconing"],"forms":{"plural":"balizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"balizare","accusative-definite-nominative-singular":"balizarea","accusative-indefinite-nominative-plural":"balizări","accusative-definite-nominative-plural":"balizările","dative-genitive-indefinite-singular":"balizări","dative-definite-genitive-singular":"balizării","dative-genitive-indefinite-plural":"balizări","dative-definite-genitive-plural":"balizărilor","singular-vocative":"balizare","plural-vocative":"balizărilor"}},{"word":"balizor","pos":"noun","definitions":["beacon"],"forms":{"plural":"balizori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balizor","accusative-definite-nominative-singular":"balizorul","accusative-indefinite-nominative-plural":"balizori","accusative-definite-nominative-plural":"balizorii","dative-genitive-indefinite-singular":"balizor","dative-definite-genitive-singular":"balizorului","dative-genitive-indefinite-plural":"balizori","dative-definite-genitive-plural":"balizorilor","singular-vocative":"balizorule","plural-vocative":"balizorilor"}},{"word":"bălmăjeală","pos":"noun","definitions":["mumbling, stammering"],"pronunciation":"/bəl.məˈʒe̯a.lə/","forms":{"plural":"bălmăjeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bălmăjeală","accusative-definite-nominative-singular":"bălmăjeala","accusative-indefinite-nominative-plural":"bălmăjeli","accusative-definite-nominative-plural":"bălmăjelile","dative-genitive-indefinite-singular":"bălmăjeli","dative-definite-genitive-singular":"bălmăjelii","dative-genitive-indefinite-plural":"bălmăjeli","dative-definite-genitive-plural":"bălmăjelilor","singular-vocative":"bălmăjeală","plural-vocative":"bălmăjelilor"}},{"word":"bălmăji","pos":"verb","definitions":["to stammer"],"forms":{"canonical":"a bălmăji 4th conjugation","present-singular-third-person":"bălmăjește","participle-past":"bălmăjit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bălmăji","gerund":"bălmăjind","first-person-indicative-present-singular":"bălmăjesc","indicative-present-second-person-singular":"bălmăjești","indicative-present-singular-third-person":"bălmăjește","first-person-indicative-plural-present":"bălmăjim","indicative-plural-present-second-person":"bălmăjiți","indicative-plural-present-third-person":"bălmăjesc","first-person-imperfect-indicative-singular":"bălmăjeam","imperfect-indicative-second-person-singular":"bălmăjeai","imperfect-indicative-singular-third-person":"bălmăjea","first-person-imperfect-indicative-plural":"bălmăjeam","imperfect-indicative-plural-second-person":"bălmăjeați","imperfect-indicative-plural-third-person":"bălmăjeau","first-person-indicative-perfect-singular":"bălmăjii","indicative-perfect-second-person-singular":"bălmăjiși","indicative-perfect-singular-third-person":"bălmăji","first-person-indicative-perfect-plural":"bălmăjirăm","indicative-perfect-plural-second-person":"bălmăjirăți","indicative-perfect-plural-third-person":"bălmăjiră","first-person-indicative-pluperfect-singular":"bălmăjisem","indicative-pluperfect-second-person-singular":"bălmăjiseși","indicative-pluperfect-singular-third-person":"bălmăjise","first-person-indicative-pluperfect-plural":"bălmăjiserăm","indicative-pluperfect-plural-second-person":"bălmăjiserăți","indicative-pluperfect-plural-third-person":"bălmăjiseră","first-person-present-singular-subjunctive":"să bălmăjesc","present-second-person-singular-subjunctive":"să bălmăjești","present-singular-subjunctive-third-person":"să bălmăjească","first-person-plural-present-subjunctive":"să bălmăjim","plural-present-second-person-subjunctive":"să bălmăjiți","plural-present-subjunctive-third-person":"să bălmăjească","imperative-second-person-singular":"bălmăjește","imperative-plural-second-person":"bălmăjiți","imperative-negative-second-person-singular":"nu bălmăji","imperative-negative-plural-second-person":"nu bălmăjiți"}},{"word":"bălmăjitor","pos":"adj","definitions":["muttering"],"forms":{"feminine-singular":"bălmăjitoare","masculine-plural":"bălmăjitori","feminine-neuter-plural":"bălmăjitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălmăjitor","error-unrecognized-form-feminine-indefinite-singular":"bălmăjitoare","error-unrecognized-form-indefinite-masculine-plural":"bălmăjitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălmăjitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bălmăjitorul","definite-error-unrecognized-form-feminine-singular":"bălmăjitoarea","definite-error-unrecognized-form-masculine-plural":"bălmăjitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bălmăjitoarele"}},{"word":"Balmaz","pos":"name","definitions":["a village in Ciobanovca, Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"bălmoji","pos":"verb","definitions":["alternative form of bălmăji"],"forms":{"canonical":"a bălmoji 4th conjugation","present-singular-third-person":"bălmojește","participle-past":"bălmojit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bălmoji","gerund":"bălmojind","first-person-indicative-present-singular":"bălmojesc","indicative-present-second-person-singular":"bălmojești","indicative-present-singular-third-person":"bălmojește","first-person-indicative-plural-present":"bălmojim","indicative-plural-present-second-person":"bălmojiți","indicative-plural-present-third-person":"bălmojesc","first-person-imperfect-indicative-singular":"bălmojeam","imperfect-indicative-second-person-singular":"bălmojeai","imperfect-indicative-singular-third-person":"bălmojea","first-person-imperfect-indicative-plural":"bălmojeam","imperfect-indicative-plural-second-person":"bălmojeați","imperfect-indicative-plural-third-person":"bălmojeau","first-person-indicative-perfect-singular":"bălmojii","indicative-perfect-second-person-singular":"bălmojiși","indicative-perfect-singular-third-person":"bălmoji","first-person-indicative-perfect-plural":"bălmojirăm","indicative-perfect-plural-second-person":"bălmojirăți","indicative-perfect-plural-third-person":"bălmojiră","first-person-indicative-pluperfect-singular":"bălmojisem","indicative-pluperfect-second-person-singular":"bălmojiseși","indicative-pluperfect-singular-third-person":"bălmojise","first-person-indicative-pluperfect-plural":"bălmojiserăm","indicative-pluperfect-plural-second-person":"bălmojiserăți","indicative-pluperfect-plural-third-person":"bălmojiseră","first-person-present-singular-subjunctive":"să bălmojesc","present-second-person-singular-subjunctive":"să bălmojești","present-singular-subjunctive-third-person":"să bălmojească","first-person-plural-present-subjunctive":"să bălmojim","plural-present-second-person-subjunctive":"să bălmojiți","plural-present-subjunctive-third-person":"să bălmojească","imperative-second-person-singular":"bălmojește","imperative-plural-second-person":"bălmojiți","imperative-negative-second-person-singular":"nu bălmoji","imperative-negative-plural-second-person":"nu bălmojiți"}},{"word":"Balmoș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balmoș"}},{"word":"balmoș","pos":"noun","definitions":["a dish of sheep's cheese with milk and cornmeal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"balmoș","accusative-definite-nominative":"balmoșul","dative-genitive-indefinite":"balmoș","dative-definite-genitive":"balmoșului","vocative":"balmoșule"}},{"word":"Bălmoșești","pos":"name","definitions":["a village in Roșia Montană, Alba County, Romania"],"gender":"m"},{"word":"balmuș","pos":"noun","definitions":["alternative form of balmoș"],"forms":{"plural":"balmușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balmuș","accusative-definite-nominative-singular":"balmușul","accusative-indefinite-nominative-plural":"balmușuri","accusative-definite-nominative-plural":"balmușurile","dative-genitive-indefinite-singular":"balmuș","dative-definite-genitive-singular":"balmușului","dative-genitive-indefinite-plural":"balmușuri","dative-definite-genitive-plural":"balmușurilor","singular-vocative":"balmușule","plural-vocative":"balmușurilor"}},{"word":"Bălmușel","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bălmuș"],"gender":"m"},{"word":"Bălnaca-Groși","pos":"name","definitions":["a village in Șuncuiuș, Bihor County, Romania"],"gender":"f"},{"word":"balnear","pos":"adj","definitions":["balneary"],"forms":{"feminine-singular":"balneară","masculine-plural":"balneari","feminine-neuter-plural":"balneare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balnear","error-unrecognized-form-feminine-indefinite-singular":"balneară","error-unrecognized-form-indefinite-masculine-plural":"balneari","error-unrecognized-form-feminine-indefinite-neuter-plural":"balneare","definite-error-unrecognized-form-masculine-neuter-singular":"balnearul","definite-error-unrecognized-form-feminine-singular":"balneara","definite-error-unrecognized-form-masculine-plural":"balnearii","definite-error-unrecognized-form-feminine-neuter-plural":"balnearele"}},{"word":"balneară","pos":"adj","definitions":["feminine singular of balnear"]},{"word":"balneare","pos":"adj","definitions":["feminine plural of balnear","neuter plural of balnear"]},{"word":"balneari","pos":"adj","definitions":["masculine plural of balnear"]},{"word":"balneoclimatic","pos":"adj","definitions":["balneary"],"forms":{"feminine-singular":"balneoclimatică","masculine-plural":"balneoclimatici","feminine-neuter-plural":"balneoclimatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balneoclimatic","error-unrecognized-form-feminine-indefinite-singular":"balneoclimatică","error-unrecognized-form-indefinite-masculine-plural":"balneoclimatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balneoclimatice","definite-error-unrecognized-form-masculine-neuter-singular":"balneoclimaticul","definite-error-unrecognized-form-feminine-singular":"balneoclimatica","definite-error-unrecognized-form-masculine-plural":"balneoclimaticii","definite-error-unrecognized-form-feminine-neuter-plural":"balneoclimaticele"}},{"word":"balneolog","pos":"noun","definitions":["balneologist"],"forms":{"plural":"balneologi","feminine":"equivalent balneologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balneolog","accusative-definite-nominative-singular":"balneologul","accusative-indefinite-nominative-plural":"balneologi","accusative-definite-nominative-plural":"balneologii","dative-genitive-indefinite-singular":"balneolog","dative-definite-genitive-singular":"balneologului","dative-genitive-indefinite-plural":"balneologi","dative-definite-genitive-plural":"balneologilor","singular-vocative":"balneologule","plural-vocative":"balneologilor"}},{"word":"balneologă","pos":"noun","definitions":["female equivalent of balneolog"],"forms":{"plural":"balneologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balneologă","accusative-definite-nominative-singular":"balneologa","accusative-indefinite-nominative-plural":"balneologe","accusative-definite-nominative-plural":"balneologele","dative-genitive-indefinite-singular":"balneologe","dative-definite-genitive-singular":"balneologei","dative-genitive-indefinite-plural":"balneologe","dative-definite-genitive-plural":"balneologelor","singular-vocative":"balneologă","plural-vocative":"balneologelor"}},{"word":"balneologic","pos":"adj","definitions":["balneological"],"forms":{"feminine-singular":"balneologică","masculine-plural":"balneologici","feminine-neuter-plural":"balneologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balneologic","error-unrecognized-form-feminine-indefinite-singular":"balneologică","error-unrecognized-form-indefinite-masculine-plural":"balneologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balneologice","definite-error-unrecognized-form-masculine-neuter-singular":"balneologicul","definite-error-unrecognized-form-feminine-singular":"balneologica","definite-error-unrecognized-form-masculine-plural":"balneologicii","definite-error-unrecognized-form-feminine-neuter-plural":"balneologicele"}},{"word":"balneologie","pos":"noun","definitions":["balneology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"balneologie","accusative-definite-nominative-singular":"balneologia","accusative-indefinite-nominative-plural":"balneologii","accusative-definite-nominative-plural":"balneologiile","dative-genitive-indefinite-singular":"balneologii","dative-definite-genitive-singular":"balneologiei","dative-genitive-indefinite-plural":"balneologii","dative-definite-genitive-plural":"balneologiilor","singular-vocative":"balneologie","plural-vocative":"balneologiilor"}},{"word":"balneoterapie","pos":"noun","definitions":["balneotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"balneoterapie","accusative-definite-nominative":"balneoterapia","dative-genitive-indefinite":"balneoterapii","dative-definite-genitive":"balneoterapiei","vocative":"balneoterapie"}},{"word":"balo","pos":"noun","definitions":["vocative singular of bală"],"pronunciation":"[ˈbalo]","gender":"f"},{"word":"Băloasa","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Lung"],"gender":"f"},{"word":"Băloescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băloescu"}},{"word":"Balomir","pos":"name","definitions":["a village in Sântămăria-Orlea, Hunedoara County, Romania"],"gender":"m"},{"word":"Balomirean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Balomirean"}},{"word":"Balomireanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Balomireanu"}},{"word":"Balomireasa","pos":"name","definitions":["a village in Stoilești, Vâlcea County, Romania"],"gender":"f"},{"word":"Balomiru de Câmp","pos":"name","definitions":["a village in Șibot, Alba County, Romania"],"gender":"m","forms":{"alternative":"Balomiru de Cîmp"}},{"word":"balon","pos":"noun","definitions":["balloon (child’s toy)","balloon; hot air balloon","ball"],"forms":{"plural":"baloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balon","accusative-definite-nominative-singular":"balonul","accusative-indefinite-nominative-plural":"baloane","accusative-definite-nominative-plural":"baloanele","dative-genitive-indefinite-singular":"balon","dative-definite-genitive-singular":"balonului","dative-genitive-indefinite-plural":"baloane","dative-definite-genitive-plural":"baloanelor","singular-vocative":"balonule","plural-vocative":"baloanelor"}},{"word":"balon cu aer cald","pos":"noun","definitions":["hot-air balloon"],"forms":{"plural":"baloane cu aer cald"}},{"word":"balon de săpun","pos":"noun","definitions":["soap bubble"],"forms":{"plural":"baloane de săpun"}},{"word":"balon dirijabil","pos":"noun","definitions":["dirigible"],"forms":{"plural":"baloane dirijabile"}},{"word":"balona","pos":"verb","definitions":["swell, swell up, bulge"],"forms":{"canonical":"a balona 1st conjugation","present-singular-third-person":"balonează","participle-past":"balonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a balona","gerund":"balonând","first-person-indicative-present-singular":"balonez","indicative-present-second-person-singular":"balonezi","indicative-present-singular-third-person":"balonează","first-person-indicative-plural-present":"balonăm","indicative-plural-present-second-person":"balonați","indicative-plural-present-third-person":"balonează","first-person-imperfect-indicative-singular":"balonam","imperfect-indicative-second-person-singular":"balonai","imperfect-indicative-singular-third-person":"balona","first-person-imperfect-indicative-plural":"balonam","imperfect-indicative-plural-second-person":"balonați","imperfect-indicative-plural-third-person":"balonau","first-person-indicative-perfect-singular":"balonai","indicative-perfect-second-person-singular":"balonași","indicative-perfect-singular-third-person":"balonă","first-person-indicative-perfect-plural":"balonarăm","indicative-perfect-plural-second-person":"balonarăți","indicative-perfect-plural-third-person":"balonară","first-person-indicative-pluperfect-singular":"balonasem","indicative-pluperfect-second-person-singular":"balonaseși","indicative-pluperfect-singular-third-person":"balonase","first-person-indicative-pluperfect-plural":"balonaserăm","indicative-pluperfect-plural-second-person":"balonaserăți","indicative-pluperfect-plural-third-person":"balonaseră","first-person-present-singular-subjunctive":"să balonez","present-second-person-singular-subjunctive":"să balonezi","present-singular-subjunctive-third-person":"să baloneze","first-person-plural-present-subjunctive":"să balonăm","plural-present-second-person-subjunctive":"să balonați","plural-present-subjunctive-third-person":"să baloneze","imperative-second-person-singular":"balonează","imperative-plural-second-person":"balonați","imperative-negative-second-person-singular":"nu balona","imperative-negative-plural-second-person":"nu balonați"}},{"word":"balonare","pos":"noun","definitions":["bloating"],"forms":{"plural":"balonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"balonare","accusative-definite-nominative-singular":"balonarea","accusative-indefinite-nominative-plural":"balonări","accusative-definite-nominative-plural":"balonările","dative-genitive-indefinite-singular":"balonări","dative-definite-genitive-singular":"balonării","dative-genitive-indefinite-plural":"balonări","dative-definite-genitive-plural":"balonărilor","singular-vocative":"balonare","plural-vocative":"balonărilor"}},{"word":"balonaș","pos":"noun","definitions":["diminutive of balon; small balloon"],"forms":{"plural":"balonașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balonaș","accusative-definite-nominative-singular":"balonașul","accusative-indefinite-nominative-plural":"balonașe","accusative-definite-nominative-plural":"balonașele","dative-genitive-indefinite-singular":"balonaș","dative-definite-genitive-singular":"balonașului","dative-genitive-indefinite-plural":"balonașe","dative-definite-genitive-plural":"balonașelor","singular-vocative":"balonașule","plural-vocative":"balonașelor"}},{"word":"balonat","pos":"adj","definitions":["swollen"],"forms":{"feminine-singular":"balonată","masculine-plural":"balonați","feminine-neuter-plural":"balonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balonat","error-unrecognized-form-feminine-indefinite-singular":"balonată","error-unrecognized-form-indefinite-masculine-plural":"balonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"balonate","definite-error-unrecognized-form-masculine-neuter-singular":"balonatul","definite-error-unrecognized-form-feminine-singular":"balonata","definite-error-unrecognized-form-masculine-plural":"balonații","definite-error-unrecognized-form-feminine-neuter-plural":"balonatele"}},{"word":"balonet","pos":"noun","definitions":["ballonet"],"forms":{"plural":"balonete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balonet","accusative-definite-nominative-singular":"balonetul","accusative-indefinite-nominative-plural":"balonete","accusative-definite-nominative-plural":"balonetele","dative-genitive-indefinite-singular":"balonet","dative-definite-genitive-singular":"balonetului","dative-genitive-indefinite-plural":"balonete","dative-definite-genitive-plural":"balonetelor","singular-vocative":"balonetule","plural-vocative":"balonetelor"}},{"word":"balonzaide","pos":"noun","definitions":["alternative form of balonzaid"],"forms":{"plural":"balonzaide","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"balonzaide","accusative-definite-nominative-singular":"balonzaidele","accusative-indefinite-nominative-plural":"balonzaide","accusative-definite-nominative-plural":"balonzaidele","dative-genitive-indefinite-singular":"balonzaide","dative-definite-genitive-singular":"balonzaidelui","dative-genitive-indefinite-plural":"balonzaide","dative-definite-genitive-plural":"balonzaidelor","singular-vocative":"balonzaide","plural-vocative":"balonzaidelor"}},{"word":"baloș","pos":"noun","definitions":["light blue"],"pronunciation":"/ˈba.loʃ/","forms":{"plural":"baloși","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baloș","accusative-definite-nominative-singular":"baloșul","accusative-indefinite-nominative-plural":"baloși","accusative-definite-nominative-plural":"baloșile","dative-genitive-indefinite-singular":"baloș","dative-definite-genitive-singular":"baloșului","dative-genitive-indefinite-plural":"baloși","dative-definite-genitive-plural":"baloșilor","singular-vocative":"baloșule","plural-vocative":"baloșilor"}},{"word":"Bălos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălos"}},{"word":"bălos","pos":"adj","definitions":["drooly"],"pronunciation":"/bəˈlos/","forms":{"feminine-singular":"băloasă","masculine-plural":"băloși","feminine-neuter-plural":"băloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălos","error-unrecognized-form-feminine-indefinite-singular":"băloasă","error-unrecognized-form-indefinite-masculine-plural":"băloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"băloase","definite-error-unrecognized-form-masculine-neuter-singular":"bălosul","definite-error-unrecognized-form-feminine-singular":"băloasa","definite-error-unrecognized-form-masculine-plural":"băloșii","definite-error-unrecognized-form-feminine-neuter-plural":"băloasele"}},{"word":"Baloșani","pos":"name","definitions":["a village in Stejari, Gorj County, Romania"],"gender":"m"},{"word":"băloșel","pos":"noun","definitions":["foetid russula, Russula foetens"],"forms":{"plural":"băloșei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băloșel","accusative-definite-nominative-singular":"băloșelul","accusative-indefinite-nominative-plural":"băloșei","accusative-definite-nominative-plural":"băloșeii","dative-genitive-indefinite-singular":"băloșel","dative-definite-genitive-singular":"băloșelului","dative-genitive-indefinite-plural":"băloșei","dative-definite-genitive-plural":"băloșeilor","singular-vocative":"băloșelule","plural-vocative":"băloșeilor"}},{"word":"Baloșești","pos":"name","definitions":["a village in Tomești, Timiș County, Romania"],"gender":"m"},{"word":"Bălosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălosu"}},{"word":"Bălosu'","pos":"noun","definitions":["penis"],"pronunciation":"/bəˈlo.su/"},{"word":"balot","pos":"noun","definitions":["bundle, package"],"forms":{"plural":"baloturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balot","accusative-definite-nominative-singular":"balotul","accusative-indefinite-nominative-plural":"baloturi","accusative-definite-nominative-plural":"baloturile","dative-genitive-indefinite-singular":"balot","dative-definite-genitive-singular":"balotului","dative-genitive-indefinite-plural":"baloturi","dative-definite-genitive-plural":"baloturilor","singular-vocative":"balotule","plural-vocative":"baloturilor"}},{"word":"Balota","pos":"name","definitions":["a village in Prunișor, Mehedinți County, Romania","a village in Racovița, Vâlcea County, Romania"],"gender":"f"},{"word":"Balota de Jos","pos":"name","definitions":["a village in Murgași, Dolj County, Romania"],"gender":"f"},{"word":"Balota de Sus","pos":"name","definitions":["a village in Murgași, Dolj County, Romania"],"gender":"f"},{"word":"balotaj","pos":"noun","definitions":["ballotage"],"forms":{"plural":"balotaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"balotaj","accusative-definite-nominative-singular":"balotajul","accusative-indefinite-nominative-plural":"balotaje","accusative-definite-nominative-plural":"balotajele","dative-genitive-indefinite-singular":"balotaj","dative-definite-genitive-singular":"balotajului","dative-genitive-indefinite-plural":"balotaje","dative-definite-genitive-plural":"balotajelor","singular-vocative":"balotajule","plural-vocative":"balotajelor"}},{"word":"Baloteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Baloteanu"}},{"word":"Baloteasca","pos":"name","definitions":["a village in Leordeni, Argeș County, Romania"],"gender":"f"},{"word":"Balotescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Balotescu"}},{"word":"Balotești","pos":"name","definitions":["a village in Stănișești, Bacău County, Romania","a commune of Ilfov County, Romania","a village in Balotești, Ilfov County, Romania","a village in Izvoru Bârzii, Mehedinți County, Romania"],"gender":"m"},{"word":"balsa","pos":"noun","definitions":["balsa"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"balsa","accusative-definite-nominative":"balsaul","dative-genitive-indefinite":"balsa","dative-definite-genitive":"balsaului","vocative":"balsaule"}},{"word":"balsam","pos":"noun","definitions":["balsam","unction, balm, salve, unguent"],"pronunciation":"/bal.ˈsam/","forms":{"plural":"balsamuri"}},{"word":"balsam de păr","pos":"noun","definitions":["hair conditioner"],"forms":{"plural":"balsamuri de păr"}},{"word":"balsam de rufe","pos":"noun","definitions":["fabric softener"],"forms":{"plural":"balsamuri de rufe"}},{"word":"bălsăma","pos":"verb","definitions":["to embalm"],"forms":{"canonical":"a bălsăma 1st conjugation","present-singular-third-person":"bălsămează","participle-past":"bălsămat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bălsăma","gerund":"bălsămând","first-person-indicative-present-singular":"bălsămez","indicative-present-second-person-singular":"bălsămezi","indicative-present-singular-third-person":"bălsămează","first-person-indicative-plural-present":"bălsămăm","indicative-plural-present-second-person":"bălsămați","indicative-plural-present-third-person":"bălsămează","first-person-imperfect-indicative-singular":"bălsămam","imperfect-indicative-second-person-singular":"bălsămai","imperfect-indicative-singular-third-person":"bălsăma","first-person-imperfect-indicative-plural":"bălsămam","imperfect-indicative-plural-second-person":"bălsămați","imperfect-indicative-plural-third-person":"bălsămau","first-person-indicative-perfect-singular":"bălsămai","indicative-perfect-second-person-singular":"bălsămași","indicative-perfect-singular-third-person":"bălsămă","first-person-indicative-perfect-plural":"bălsămarăm","indicative-perfect-plural-second-person":"bălsămarăți","indicative-perfect-plural-third-person":"bălsămară","first-person-indicative-pluperfect-singular":"bălsămasem","indicative-pluperfect-second-person-singular":"bălsămaseși","indicative-pluperfect-singular-third-person":"bălsămase","first-person-indicative-pluperfect-plural":"bălsămaserăm","indicative-pluperfect-plural-second-person":"bălsămaserăți","indicative-pluperfect-plural-third-person":"bălsămaseră","first-person-present-singular-subjunctive":"să bălsămez","present-second-person-singular-subjunctive":"să bălsămezi","present-singular-subjunctive-third-person":"să bălsămeze","first-person-plural-present-subjunctive":"să bălsămăm","plural-present-second-person-subjunctive":"să bălsămați","plural-present-subjunctive-third-person":"să bălsămeze","imperative-second-person-singular":"bălsămează","imperative-plural-second-person":"bălsămați","imperative-negative-second-person-singular":"nu bălsăma","imperative-negative-plural-second-person":"nu bălsămați"}},{"word":"bălsămat","pos":"adj","definitions":["embalmed"],"forms":{"feminine-singular":"bălsămată","masculine-plural":"bălsămați","feminine-neuter-plural":"bălsămate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălsămat","error-unrecognized-form-feminine-indefinite-singular":"bălsămată","error-unrecognized-form-indefinite-masculine-plural":"bălsămați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălsămate","definite-error-unrecognized-form-masculine-neuter-singular":"bălsămatul","definite-error-unrecognized-form-feminine-singular":"bălsămata","definite-error-unrecognized-form-masculine-plural":"bălsămații","definite-error-unrecognized-form-feminine-neuter-plural":"bălsămatele"}},{"word":"bălsămi","pos":"verb","definitions":["alternative form of bălsăma"],"forms":{"canonical":"a bălsămi 4th conjugation","present-singular-third-person":"bălsămește","participle-past":"bălsămit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bălsămi","gerund":"bălsămind","first-person-indicative-present-singular":"bălsămesc","indicative-present-second-person-singular":"bălsămești","indicative-present-singular-third-person":"bălsămește","first-person-indicative-plural-present":"bălsămim","indicative-plural-present-second-person":"bălsămiți","indicative-plural-present-third-person":"bălsămesc","first-person-imperfect-indicative-singular":"bălsămeam","imperfect-indicative-second-person-singular":"bălsămeai","imperfect-indicative-singular-third-person":"bălsămea","first-person-imperfect-indicative-plural":"bălsămeam","imperfect-indicative-plural-second-person":"bălsămeați","imperfect-indicative-plural-third-person":"bălsămeau","first-person-indicative-perfect-singular":"bălsămii","indicative-perfect-second-person-singular":"bălsămiși","indicative-perfect-singular-third-person":"bălsămi","first-person-indicative-perfect-plural":"bălsămirăm","indicative-perfect-plural-second-person":"bălsămirăți","indicative-perfect-plural-third-person":"bălsămiră","first-person-indicative-pluperfect-singular":"bălsămisem","indicative-pluperfect-second-person-singular":"bălsămiseși","indicative-pluperfect-singular-third-person":"bălsămise","first-person-indicative-pluperfect-plural":"bălsămiserăm","indicative-pluperfect-plural-second-person":"bălsămiserăți","indicative-pluperfect-plural-third-person":"bălsămiseră","first-person-present-singular-subjunctive":"să bălsămesc","present-second-person-singular-subjunctive":"să bălsămești","present-singular-subjunctive-third-person":"să bălsămească","first-person-plural-present-subjunctive":"să bălsămim","plural-present-second-person-subjunctive":"să bălsămiți","plural-present-subjunctive-third-person":"să bălsămească","imperative-second-person-singular":"bălsămește","imperative-plural-second-person":"bălsămiți","imperative-negative-second-person-singular":"nu bălsămi","imperative-negative-plural-second-person":"nu bălsămiți"}},{"word":"balsamic","pos":"adj","definitions":["balsamic"],"forms":{"feminine-singular":"balsamică","masculine-plural":"balsamici","feminine-neuter-plural":"balsamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balsamic","error-unrecognized-form-feminine-indefinite-singular":"balsamică","error-unrecognized-form-indefinite-masculine-plural":"balsamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"balsamice","definite-error-unrecognized-form-masculine-neuter-singular":"balsamicul","definite-error-unrecognized-form-feminine-singular":"balsamica","definite-error-unrecognized-form-masculine-plural":"balsamicii","definite-error-unrecognized-form-feminine-neuter-plural":"balsamicele"}},{"word":"balsamină","pos":"noun","definitions":["balsam (plant)"],"forms":{"plural":"balsamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balsamină","accusative-definite-nominative-singular":"balsamina","accusative-indefinite-nominative-plural":"balsamine","accusative-definite-nominative-plural":"balsaminele","dative-genitive-indefinite-singular":"balsamine","dative-definite-genitive-singular":"balsaminei","dative-genitive-indefinite-plural":"balsamine","dative-definite-genitive-plural":"balsaminelor","singular-vocative":"balsamină","plural-vocative":"balsaminelor"}},{"word":"bălsămit","pos":"adj","definitions":["alternative form of bălsămat"],"forms":{"feminine-singular":"bălsămită","masculine-plural":"bălsămiți","feminine-neuter-plural":"bălsămite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălsămit","error-unrecognized-form-feminine-indefinite-singular":"bălsămită","error-unrecognized-form-indefinite-masculine-plural":"bălsămiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălsămite","definite-error-unrecognized-form-masculine-neuter-singular":"bălsămitul","definite-error-unrecognized-form-feminine-singular":"bălsămita","definite-error-unrecognized-form-masculine-plural":"bălsămiții","definite-error-unrecognized-form-feminine-neuter-plural":"bălsămitele"}},{"word":"balsamui","pos":"verb","definitions":["to embalm"],"forms":{"canonical":"a balsamui 4th conjugation","present-singular-third-person":"balsamuie","participle-past":"balsamuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a balsamui","gerund":"balsamuind","first-person-indicative-present-singular":"balsamui","indicative-present-second-person-singular":"balsamui","indicative-present-singular-third-person":"balsamuie","first-person-indicative-plural-present":"balsamuim","indicative-plural-present-second-person":"balsamuiți","indicative-plural-present-third-person":"balsamuie","first-person-imperfect-indicative-singular":"balsamuiam","imperfect-indicative-second-person-singular":"balsamuiai","imperfect-indicative-singular-third-person":"balsamuia","first-person-imperfect-indicative-plural":"balsamuiam","imperfect-indicative-plural-second-person":"balsamuiați","imperfect-indicative-plural-third-person":"balsamuiau","first-person-indicative-perfect-singular":"balsamuii","indicative-perfect-second-person-singular":"balsamuiși","indicative-perfect-singular-third-person":"balsamui","first-person-indicative-perfect-plural":"balsamuirăm","indicative-perfect-plural-second-person":"balsamuirăți","indicative-perfect-plural-third-person":"balsamuiră","first-person-indicative-pluperfect-singular":"balsamuisem","indicative-pluperfect-second-person-singular":"balsamuiseși","indicative-pluperfect-singular-third-person":"balsamuise","first-person-indicative-pluperfect-plural":"balsamuiserăm","indicative-pluperfect-plural-second-person":"balsamuiserăți","indicative-pluperfect-plural-third-person":"balsamuiseră","first-person-present-singular-subjunctive":"să balsamui","present-second-person-singular-subjunctive":"să balsamui","present-singular-subjunctive-third-person":"să balsamuie","first-person-plural-present-subjunctive":"să balsamuim","plural-present-second-person-subjunctive":"să balsamuiți","plural-present-subjunctive-third-person":"să balsamuie","imperative-second-person-singular":"balsamuie","imperative-plural-second-person":"balsamuiți","imperative-negative-second-person-singular":"nu balsamui","imperative-negative-plural-second-person":"nu balsamuiți"}},{"word":"Bălșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălșan"}},{"word":"Bălșanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălșanu"}},{"word":"Bălșeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălșeanu"}},{"word":"Bălșoara","pos":"name","definitions":["a village in Mădulari, Vâlcea County, Romania"],"gender":"f"},{"word":"balț","pos":"noun","definitions":["noose, snare","lace, ribbon","veil, shroud","animal with white coloration or spots on its neck"],"forms":{"plural":"balțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"balț","accusative-definite-nominative-singular":"balțul","accusative-indefinite-nominative-plural":"balțuri","accusative-definite-nominative-plural":"balțurile","dative-genitive-indefinite-singular":"balț","dative-definite-genitive-singular":"balțului","dative-genitive-indefinite-plural":"balțuri","dative-definite-genitive-plural":"balțurilor","singular-vocative":"balțule","plural-vocative":"balțurilor"}},{"word":"Balta","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Balta, Mehedinți County, Romania"],"gender":"f"},{"word":"balta","pos":"noun","definitions":["definite nominative/accusative singular of baltă"],"pronunciation":"[ˈbalta]","gender":"f"},{"word":"Baltă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baltă"}},{"word":"baltă","pos":"noun","definitions":["puddle, pond, pool (especially muddy); also swamp"],"pronunciation":"[ˈbal.tə]","forms":{"plural":"bălți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"baltă","accusative-definite-nominative-singular":"balta","accusative-indefinite-nominative-plural":"bălți","accusative-definite-nominative-plural":"bălțile","dative-genitive-indefinite-singular":"bălți","dative-definite-genitive-singular":"bălții","dative-genitive-indefinite-plural":"bălți","dative-definite-genitive-plural":"bălților","singular-vocative":"baltă","plural-vocative":"bălților"}},{"word":"Bâlta","pos":"name","definitions":["a village in Filiași, Dolj County, Romania","a village in Runcu, Gorj County, Romania"],"gender":"f","forms":{"alternative":"Bîlta"}},{"word":"Balta Albă","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Balta Albă, Buzău County, Romania","a neighbourhood of Bucharest, Romania"],"gender":"f"},{"word":"Balta Arsă","pos":"name","definitions":["a village in Corni, Botoșani County, Romania"],"gender":"f"},{"word":"Balta Doamnei","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Balta Doamnei, Prahova County, Romania"],"gender":"f"},{"word":"Balta Neagră","pos":"name","definitions":["a village in Nuci, Ilfov County, Romania"],"gender":"f"},{"word":"Balta Raței","pos":"name","definitions":["a village in Vânători, Vrancea County, Romania"],"gender":"f"},{"word":"Balta Sărată","pos":"name","definitions":["a village in Crângeni, Teleorman County, Romania"],"gender":"f"},{"word":"Balta Tocila","pos":"name","definitions":["a village in Scorțoasa, Buzău County, Romania"],"gender":"f"},{"word":"Balta Verde","pos":"name","definitions":["a village in Podari, Dolj County, Romania","a village in Gogoșu, Mehedinți County, Romania"],"gender":"f"},{"word":"Baltac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baltac"}},{"word":"baltac","pos":"noun","definitions":["alternative form of baltag"],"forms":{"plural":"baltacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"baltac","accusative-definite-nominative-singular":"baltacul","accusative-indefinite-nominative-plural":"baltacuri","accusative-definite-nominative-plural":"baltacurile","dative-genitive-indefinite-singular":"baltac","dative-definite-genitive-singular":"baltacului","dative-genitive-indefinite-plural":"baltacuri","dative-definite-genitive-plural":"baltacurilor","singular-vocative":"baltacule","plural-vocative":"baltacurilor"}},{"word":"bâltâc","pos":"intj","definitions":["synonym of bâldâbâc (“splash”)"],"forms":{"alternative":"bîltîc"}},{"word":"băltac","pos":"noun","definitions":["puddle"],"forms":{"plural":"băltace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltac","accusative-definite-nominative-singular":"băltacul","accusative-indefinite-nominative-plural":"băltace","accusative-definite-nominative-plural":"băltacele","dative-genitive-indefinite-singular":"băltac","dative-definite-genitive-singular":"băltacului","dative-genitive-indefinite-plural":"băltace","dative-definite-genitive-plural":"băltacelor","singular-vocative":"băltacule","plural-vocative":"băltacelor"}},{"word":"băltăcel","pos":"noun","definitions":["alternative form of băltăgel"],"forms":{"plural":"băltăcele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltăcel","accusative-definite-nominative-singular":"băltăcelul","accusative-indefinite-nominative-plural":"băltăcele","accusative-definite-nominative-plural":"băltăcelele","dative-genitive-indefinite-singular":"băltăcel","dative-definite-genitive-singular":"băltăcelului","dative-genitive-indefinite-plural":"băltăcele","dative-definite-genitive-plural":"băltăcelelor","singular-vocative":"băltăcelule","plural-vocative":"băltăcelelor"}},{"word":"Baltag","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baltag"}},{"word":"baltag","pos":"noun","definitions":["long-handled axe"],"forms":{"plural":"baltage","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baltag","accusative-definite-nominative-singular":"baltagul","accusative-indefinite-nominative-plural":"baltage","accusative-definite-nominative-plural":"baltagele","dative-genitive-indefinite-singular":"baltag","dative-definite-genitive-singular":"baltagului","dative-genitive-indefinite-plural":"baltage","dative-definite-genitive-plural":"baltagelor","singular-vocative":"baltagule","plural-vocative":"baltagelor"}},{"word":"Băltăgari","pos":"name","definitions":["a village in Bisoca, Buzău County, Romania"],"gender":"m"},{"word":"băltăgaș","pos":"noun","definitions":["diminutive of baltag"],"forms":{"plural":"băltăgașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltăgaș","accusative-definite-nominative-singular":"băltăgașul","accusative-indefinite-nominative-plural":"băltăgașe","accusative-definite-nominative-plural":"băltăgașele","dative-genitive-indefinite-singular":"băltăgaș","dative-definite-genitive-singular":"băltăgașului","dative-genitive-indefinite-plural":"băltăgașe","dative-definite-genitive-plural":"băltăgașelor","singular-vocative":"băltăgașule","plural-vocative":"băltăgașelor"}},{"word":"băltăgel","pos":"noun","definitions":["diminutive of baltag; small hatchet"],"forms":{"plural":"băltăgele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltăgel","accusative-definite-nominative-singular":"băltăgelul","accusative-indefinite-nominative-plural":"băltăgele","accusative-definite-nominative-plural":"băltăgelele","dative-genitive-indefinite-singular":"băltăgel","dative-definite-genitive-singular":"băltăgelului","dative-genitive-indefinite-plural":"băltăgele","dative-definite-genitive-plural":"băltăgelelor","singular-vocative":"băltăgelule","plural-vocative":"băltăgelelor"}},{"word":"Băltăgești","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania"],"gender":"m"},{"word":"baltagiu","pos":"noun","definitions":["halberdier"],"forms":{"plural":"baltagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baltagiu","accusative-definite-nominative-singular":"baltagiuul","accusative-indefinite-nominative-plural":"baltagii","accusative-definite-nominative-plural":"baltagiii","dative-genitive-indefinite-singular":"baltagiu","dative-definite-genitive-singular":"baltagiuului","dative-genitive-indefinite-plural":"baltagii","dative-definite-genitive-plural":"baltagiilor","singular-vocative":"baltagiuule","plural-vocative":"baltagiilor"}},{"word":"Bâltanele","pos":"name","definitions":["a village in Greci, Mehedinți County, Romania","a village in Prunișor, Mehedinți County, Romania"],"gender":"m","forms":{"alternative":"Bîltanele"}},{"word":"bălțare","pos":"noun","definitions":["variegation"],"forms":{"plural":"bălțari","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bălțare","accusative-definite-nominative-singular":"bălțarea","accusative-indefinite-nominative-plural":"bălțari","accusative-definite-nominative-plural":"bălțarile","dative-genitive-indefinite-singular":"bălțari","dative-definite-genitive-singular":"bălțarii","dative-genitive-indefinite-plural":"bălțari","dative-definite-genitive-plural":"bălțarilor","singular-vocative":"bălțare","plural-vocative":"bălțarilor"}},{"word":"băltăreț","pos":"adj","definitions":["swampy"],"forms":{"feminine-singular":"băltăreață","masculine-plural":"băltăreți","feminine-neuter-plural":"băltărețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băltăreț","error-unrecognized-form-feminine-indefinite-singular":"băltăreață","error-unrecognized-form-indefinite-masculine-plural":"băltăreți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băltărețe","definite-error-unrecognized-form-masculine-neuter-singular":"băltărețul","definite-error-unrecognized-form-feminine-singular":"băltăreața","definite-error-unrecognized-form-masculine-plural":"băltăreții","definite-error-unrecognized-form-feminine-neuter-plural":"băltărețele"}},{"word":"Băltăreți","pos":"name","definitions":["a village in Ulmeni, Buzău County, Romania","a village in Cosmești, Galați County, Romania"],"gender":"m"},{"word":"băltărie","pos":"noun","definitions":["swampy area"],"forms":{"plural":"băltării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"băltărie","accusative-definite-nominative-singular":"băltăria","accusative-indefinite-nominative-plural":"băltării","accusative-definite-nominative-plural":"băltăriile","dative-genitive-indefinite-singular":"băltării","dative-definite-genitive-singular":"băltăriei","dative-genitive-indefinite-plural":"băltării","dative-definite-genitive-plural":"băltăriilor","singular-vocative":"băltărie","plural-vocative":"băltăriilor"}},{"word":"Bălțat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălțat"}},{"word":"bălțat","pos":"adj","definitions":["pied, spotted, motley, specked","striped","variegated"],"pronunciation":"/bəlˈt͡sat/","forms":{"feminine-singular":"bălțată","masculine-plural":"bălțați","feminine-neuter-plural":"bălțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bălțat","error-unrecognized-form-feminine-indefinite-singular":"bălțată","error-unrecognized-form-indefinite-masculine-plural":"bălțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bălțate","definite-error-unrecognized-form-masculine-neuter-singular":"bălțatul","definite-error-unrecognized-form-feminine-singular":"bălțata","definite-error-unrecognized-form-masculine-plural":"bălțații","definite-error-unrecognized-form-feminine-neuter-plural":"bălțatele"}},{"word":"Bălțata","pos":"name","definitions":["a village in Cuca, Argeș County, Romania","a village in Sărata, Bacău County, Romania"],"gender":"f"},{"word":"Bălțata de Sus","pos":"name","definitions":["a village in Bălțata, Criuleni Raion, Moldova"],"gender":"f"},{"word":"Bălțăteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălțăteanu"}},{"word":"Bălțățeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălțățeanu"}},{"word":"băltățel","pos":"adj","definitions":["multicolored, variegated"],"forms":{"feminine-singular":"băltățelă","masculine-plural":"băltățeli","feminine-neuter-plural":"băltățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băltățel","error-unrecognized-form-feminine-indefinite-singular":"băltățelă","error-unrecognized-form-indefinite-masculine-plural":"băltățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"băltățele","definite-error-unrecognized-form-masculine-neuter-singular":"băltățelul","definite-error-unrecognized-form-feminine-singular":"băltățela","definite-error-unrecognized-form-masculine-plural":"băltățelii","definite-error-unrecognized-form-feminine-neuter-plural":"băltățelele"}},{"word":"Băltățeni","pos":"name","definitions":["a village in Tomșani, Vâlcea County, Romania","a village in Băcani, Vaslui County, Romania"],"gender":"m"},{"word":"Bălțătești","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Bălțătești, Neamț County, Romania"],"gender":"m"},{"word":"Bălțați","pos":"name","definitions":["a commune of Iași County, Romania","a village in Bălțați, Iași County, Romania","a village in Scornicești, Olt County, Romania","a village in Tătărăni, Vaslui County, Romania"],"gender":"m"},{"word":"Bălțătoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălțătoiu"}},{"word":"Balțatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Balțatu"}},{"word":"Bălțatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălțatu"}},{"word":"Bălțatul","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Dâmbovița"],"gender":"m"},{"word":"bălțătură","pos":"noun","definitions":["spot (on an animal)"],"forms":{"plural":"bălțături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bălțătură","accusative-definite-nominative-singular":"bălțătura","accusative-indefinite-nominative-plural":"bălțături","accusative-definite-nominative-plural":"bălțăturile","dative-genitive-indefinite-singular":"bălțături","dative-definite-genitive-singular":"bălțăturii","dative-genitive-indefinite-plural":"bălțături","dative-definite-genitive-plural":"bălțăturilor","singular-vocative":"bălțătură","plural-vocative":"bălțăturilor"}},{"word":"băltău","pos":"noun","definitions":["augmentative of baltă"],"pronunciation":"/bəlˈtəw/","forms":{"plural":"băltaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltău","accusative-definite-nominative-singular":"băltăul","accusative-indefinite-nominative-plural":"băltaie","accusative-definite-nominative-plural":"băltaiele","dative-genitive-indefinite-singular":"băltău","dative-definite-genitive-singular":"băltăului","dative-genitive-indefinite-plural":"băltaie","dative-definite-genitive-plural":"băltaielor","singular-vocative":"băltăule","plural-vocative":"băltaielor"}},{"word":"Băltean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băltean"}},{"word":"Bălteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bălteanu"}},{"word":"Bâlteni","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Bâlteni, Gorj County, Romania"],"gender":"m","forms":{"alternative":"Bîlteni"}},{"word":"Bălteni","pos":"name","definitions":["a village in Tigveni, Argeș County, Romania","a village in C. A. Rosetti, Buzău County, Romania","a village in Conțești, Dâmbovița County, Romania","a village in Probota, Iași County, Romania","a village in Periș, Ilfov County, Romania"],"gender":"m"},{"word":"Bălteni-Deal","pos":"name","definitions":["a village in Bălteni, Vaslui County, Romania"],"gender":"m"},{"word":"Băltenii de Jos","pos":"name","definitions":["a village in Beștepe, Tulcea County, Romania"],"gender":"m"},{"word":"Băltenii de Sus","pos":"name","definitions":["a village in Beștepe, Tulcea County, Romania"],"gender":"m"},{"word":"Băltescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băltescu"}},{"word":"Bălțești","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Bălțești, Prahova County, Romania"],"gender":"m"},{"word":"Bălți","pos":"name","definitions":["a city and municipality of Moldova","a county of Romania","a county of Moldova"],"pronunciation":"/ˈbəltsʲ/","gender":"m"},{"word":"baltic","pos":"adj","definitions":["Baltic"],"pronunciation":"[ˈbaltik]","examples":[{"ro":"Lituaniana este o limbă baltică.","en":"Lithuanian is a Baltic language."}],"forms":{"feminine-singular":"baltică","masculine-plural":"baltici","feminine-neuter-plural":"baltice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"baltic","error-unrecognized-form-feminine-indefinite-singular":"baltică","error-unrecognized-form-indefinite-masculine-plural":"baltici","error-unrecognized-form-feminine-indefinite-neuter-plural":"baltice","definite-error-unrecognized-form-masculine-neuter-singular":"balticul","definite-error-unrecognized-form-feminine-singular":"baltica","definite-error-unrecognized-form-masculine-plural":"balticii","definite-error-unrecognized-form-feminine-neuter-plural":"balticele"}},{"word":"băltică","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"băltici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"băltică","accusative-definite-nominative-singular":"băltica","accusative-indefinite-nominative-plural":"băltici","accusative-definite-nominative-plural":"bălticile","dative-genitive-indefinite-singular":"băltici","dative-definite-genitive-singular":"bălticii","dative-genitive-indefinite-plural":"băltici","dative-definite-genitive-plural":"bălticilor","singular-vocative":"băltică","plural-vocative":"bălticilor"}},{"word":"bălțică","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"bălțici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bălțică","accusative-definite-nominative-singular":"bălțica","accusative-indefinite-nominative-plural":"bălțici","accusative-definite-nominative-plural":"bălțicile","dative-genitive-indefinite-singular":"bălțici","dative-definite-genitive-singular":"bălțicii","dative-genitive-indefinite-plural":"bălțici","dative-definite-genitive-plural":"bălțicilor","singular-vocative":"bălțică","plural-vocative":"bălțicilor"}},{"word":"bălticea","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"bălticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bălticea","accusative-definite-nominative-singular":"bălticeaua","accusative-indefinite-nominative-plural":"bălticele","accusative-definite-nominative-plural":"bălticelele","dative-genitive-indefinite-singular":"bălticele","dative-definite-genitive-singular":"bălticelei","dative-genitive-indefinite-plural":"bălticele","dative-definite-genitive-plural":"bălticelelor","singular-vocative":"bălticea","plural-vocative":"bălticelelor"}},{"word":"bălticică","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"bălticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bălticică","accusative-definite-nominative-singular":"bălticica","accusative-indefinite-nominative-plural":"bălticele","accusative-definite-nominative-plural":"bălticelele","dative-genitive-indefinite-singular":"bălticele","dative-definite-genitive-singular":"bălticelei","dative-genitive-indefinite-plural":"bălticele","dative-definite-genitive-plural":"bălticelelor","singular-vocative":"bălticică","plural-vocative":"bălticelelor"}},{"word":"băltig","pos":"noun","definitions":["a puddle."],"forms":{"plural":"băltiguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"băltig","accusative-definite-nominative-singular":"băltigul","accusative-indefinite-nominative-plural":"băltiguri","accusative-definite-nominative-plural":"băltigurile","dative-genitive-indefinite-singular":"băltig","dative-definite-genitive-singular":"băltigului","dative-genitive-indefinite-plural":"băltiguri","dative-definite-genitive-plural":"băltigurilor","singular-vocative":"băltigule","plural-vocative":"băltigurilor"}},{"word":"băltină","pos":"noun","definitions":["swampy area"],"forms":{"plural":"băltine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băltină","accusative-definite-nominative-singular":"băltina","accusative-indefinite-nominative-plural":"băltine","accusative-definite-nominative-plural":"băltinele","dative-genitive-indefinite-singular":"băltine","dative-definite-genitive-singular":"băltinei","dative-genitive-indefinite-plural":"băltine","dative-definite-genitive-plural":"băltinelor","singular-vocative":"băltină","plural-vocative":"băltinelor"}},{"word":"băltiș","pos":"noun","definitions":["swampy area"],"forms":{"plural":"băltișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"băltiș","accusative-definite-nominative-singular":"băltișul","accusative-indefinite-nominative-plural":"băltișuri","accusative-definite-nominative-plural":"băltișurile","dative-genitive-indefinite-singular":"băltiș","dative-definite-genitive-singular":"băltișului","dative-genitive-indefinite-plural":"băltișuri","dative-definite-genitive-plural":"băltișurilor","singular-vocative":"băltișule","plural-vocative":"băltișurilor"}},{"word":"Bâltișoara","pos":"name","definitions":["a village in Runcu, Gorj County, Romania"],"gender":"f","forms":{"alternative":"Bîltișoara"}},{"word":"Băltița","pos":"name","definitions":["a village in Mănești, Prahova County, Romania"],"gender":"f"},{"word":"Băltiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băltiță"}},{"word":"băltiță","pos":"noun","definitions":["diminutive of baltă; small puddle"],"forms":{"plural":"băltițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băltiță","accusative-definite-nominative-singular":"băltița","accusative-indefinite-nominative-plural":"băltițe","accusative-definite-nominative-plural":"băltițele","dative-genitive-indefinite-singular":"băltițe","dative-definite-genitive-singular":"băltiței","dative-genitive-indefinite-plural":"băltițe","dative-definite-genitive-plural":"băltițelor","singular-vocative":"băltiță","plural-vocative":"băltițelor"}},{"word":"balto","pos":"noun","definitions":["vocative singular of baltă"],"pronunciation":"[ˈbalto]","gender":"f"},{"word":"băltoacă","pos":"noun","definitions":["puddle","swamp, marsh, muddy puddle or pool"],"forms":{"plural":"băltoace"}},{"word":"băltoace","pos":"noun","definitions":["plural of băltoacă"]},{"word":"băltoagă","pos":"noun","definitions":["alternative form of băltoacă"],"forms":{"plural":"băltoage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băltoagă","accusative-definite-nominative-singular":"băltoaga","accusative-indefinite-nominative-plural":"băltoage","accusative-definite-nominative-plural":"băltoagele","dative-genitive-indefinite-singular":"băltoage","dative-definite-genitive-singular":"băltoagei","dative-genitive-indefinite-plural":"băltoage","dative-definite-genitive-plural":"băltoagelor","singular-vocative":"băltoagă","plural-vocative":"băltoagelor"}},{"word":"băltoi","pos":"noun","definitions":["augmentative of baltă"],"forms":{"plural":"băltoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băltoi","accusative-definite-nominative-singular":"băltoiul","accusative-indefinite-nominative-plural":"băltoaie","accusative-definite-nominative-plural":"băltoaiele","dative-genitive-indefinite-singular":"băltoi","dative-definite-genitive-singular":"băltoiului","dative-genitive-indefinite-plural":"băltoaie","dative-definite-genitive-plural":"băltoaielor","singular-vocative":"băltoiule","plural-vocative":"băltoaielor"}},{"word":"băltos","pos":"adj","definitions":["marshy, swampy"],"pronunciation":"/bəlˈtos/","forms":{"feminine-singular":"băltoasă","masculine-plural":"băltoși","feminine-neuter-plural":"băltoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băltos","error-unrecognized-form-feminine-indefinite-singular":"băltoasă","error-unrecognized-form-indefinite-masculine-plural":"băltoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"băltoase","definite-error-unrecognized-form-masculine-neuter-singular":"băltosul","definite-error-unrecognized-form-feminine-singular":"băltoasa","definite-error-unrecognized-form-masculine-plural":"băltoșii","definite-error-unrecognized-form-feminine-neuter-plural":"băltoasele"}},{"word":"băltucă","pos":"noun","definitions":["diminutive of baltă; small puddle"],"forms":{"plural":"băltuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"băltucă","accusative-definite-nominative-singular":"băltuca","accusative-indefinite-nominative-plural":"băltuci","accusative-definite-nominative-plural":"băltucile","dative-genitive-indefinite-singular":"băltuci","dative-definite-genitive-singular":"băltucii","dative-genitive-indefinite-plural":"băltuci","dative-definite-genitive-plural":"băltucilor","singular-vocative":"băltucă","plural-vocative":"băltucilor"}},{"word":"bălțuică","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"bălțuici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bălțuică","accusative-definite-nominative-singular":"bălțuica","accusative-indefinite-nominative-plural":"bălțuici","accusative-definite-nominative-plural":"bălțuicile","dative-genitive-indefinite-singular":"bălțuici","dative-definite-genitive-singular":"bălțuicii","dative-genitive-indefinite-plural":"bălțuici","dative-definite-genitive-plural":"bălțuicilor","singular-vocative":"bălțuică","plural-vocative":"bălțuicilor"}},{"word":"băltuță","pos":"noun","definitions":["diminutive of baltă"],"forms":{"plural":"băltuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băltuță","accusative-definite-nominative-singular":"băltuța","accusative-indefinite-nominative-plural":"băltuțe","accusative-definite-nominative-plural":"băltuțele","dative-genitive-indefinite-singular":"băltuțe","dative-definite-genitive-singular":"băltuței","dative-genitive-indefinite-plural":"băltuțe","dative-definite-genitive-plural":"băltuțelor","singular-vocative":"băltuță","plural-vocative":"băltuțelor"}},{"word":"Bălu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bălu"}},{"word":"bălucă","pos":"noun","definitions":["a blonde woman"],"forms":{"plural":"băluce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bălucă","accusative-definite-nominative-singular":"băluca","accusative-indefinite-nominative-plural":"băluce","accusative-definite-nominative-plural":"bălucele","dative-genitive-indefinite-singular":"băluce","dative-definite-genitive-singular":"bălucei","dative-genitive-indefinite-plural":"băluce","dative-definite-genitive-plural":"bălucelor","singular-vocative":"bălucă","plural-vocative":"bălucelor"}},{"word":"Bălușa","pos":"name","definitions":["a village in Odobești, Bacău County, Romania"],"gender":"f"},{"word":"bălușcă","pos":"noun","definitions":["star-of-Bethlehem (Ornithogalum)"],"forms":{"plural":"băluște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bălușcă","accusative-definite-nominative-singular":"bălușca","accusative-indefinite-nominative-plural":"băluște","accusative-definite-nominative-plural":"băluștele","dative-genitive-indefinite-singular":"băluște","dative-definite-genitive-singular":"băluștei","dative-genitive-indefinite-plural":"băluște","dative-definite-genitive-plural":"băluștelor","singular-vocative":"bălușcă","plural-vocative":"băluștelor"}},{"word":"Bălușeni","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Bălușeni, Botoșani County, Romania"],"gender":"m"},{"word":"Bălușenii Noi","pos":"name","definitions":["a village in Bălușeni, Botoșani County, Romania"],"gender":"m"},{"word":"Bălușescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bălușescu"}},{"word":"Bălușești","pos":"name","definitions":["a village in Dagâța, Iași County, Romania","a village in Dochia, Neamț County, Romania","a village in Icușești, Neamț County, Romania"],"gender":"m"},{"word":"balustră","pos":"noun","definitions":["alternative form of balustru"],"forms":{"plural":"balustre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balustră","accusative-definite-nominative-singular":"balustra","accusative-indefinite-nominative-plural":"balustre","accusative-definite-nominative-plural":"balustrele","dative-genitive-indefinite-singular":"balustre","dative-definite-genitive-singular":"balustrei","dative-genitive-indefinite-plural":"balustre","dative-definite-genitive-plural":"balustrelor","singular-vocative":"balustră","plural-vocative":"balustrelor"}},{"word":"balustradă","pos":"noun","definitions":["balustrade (row of balusters)"],"forms":{"plural":"balustrade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"balustradă","accusative-definite-nominative-singular":"balustrada","accusative-indefinite-nominative-plural":"balustrade","accusative-definite-nominative-plural":"balustradele","dative-genitive-indefinite-singular":"balustrade","dative-definite-genitive-singular":"balustradei","dative-genitive-indefinite-plural":"balustrade","dative-definite-genitive-plural":"balustradelor","singular-vocative":"balustradă","plural-vocative":"balustradelor"}},{"word":"balustru","pos":"noun","definitions":["baluster, banister"],"forms":{"plural":"baluștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"balustru","accusative-definite-nominative-singular":"balustrul","accusative-indefinite-nominative-plural":"baluștri","accusative-definite-nominative-plural":"baluștrii","dative-genitive-indefinite-singular":"balustru","dative-definite-genitive-singular":"balustrului","dative-genitive-indefinite-plural":"baluștri","dative-definite-genitive-plural":"baluștrilor","singular-vocative":"balustrule","plural-vocative":"baluștrilor"}},{"word":"Băluț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băluț"}},{"word":"băluț","pos":"adj","definitions":["diminutive of băl"],"forms":{"feminine-singular":"băluță","masculine-plural":"băluți","feminine-neuter-plural":"băluțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băluț","error-unrecognized-form-feminine-indefinite-singular":"băluță","error-unrecognized-form-indefinite-masculine-plural":"băluți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băluțe","definite-error-unrecognized-form-masculine-neuter-singular":"băluțul","definite-error-unrecognized-form-feminine-singular":"băluța","definite-error-unrecognized-form-masculine-plural":"băluții","definite-error-unrecognized-form-feminine-neuter-plural":"băluțele"}},{"word":"Băluța","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"f"},{"word":"Băluțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băluțescu"}},{"word":"Băluțoaia","pos":"name","definitions":["a village in Frâncești, Vâlcea County, Romania"],"gender":"f"},{"word":"Băluțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băluțoiu"}},{"word":"Bâlvănești","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Bâlvănești, Mehedinți County, Romania"],"gender":"m","forms":{"alternative":"Bîlvănești"}},{"word":"Bâlvăneștii de Jos","pos":"name","definitions":["a village in Bâlvănești, Mehedinți County, Romania"],"gender":"m","forms":{"alternative":"Bîlvăneștii de Jos"}},{"word":"balzacian","pos":"adj","definitions":["Balzacian"],"forms":{"feminine-singular":"balzaciană","masculine-plural":"balzacieni","feminine-neuter-plural":"balzaciene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"balzacian","error-unrecognized-form-feminine-indefinite-singular":"balzaciană","error-unrecognized-form-indefinite-masculine-plural":"balzacieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"balzaciene","definite-error-unrecognized-form-masculine-neuter-singular":"balzacianul","definite-error-unrecognized-form-feminine-singular":"balzaciana","definite-error-unrecognized-form-masculine-plural":"balzacienii","definite-error-unrecognized-form-feminine-neuter-plural":"balzacienele"}},{"word":"balzacianism","pos":"noun","definitions":["Balzacian style"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"balzacianism","accusative-definite-nominative":"balzacianismul","dative-genitive-indefinite":"balzacianism","dative-definite-genitive":"balzacianismului","vocative":"balzacianismule"}},{"word":"bam","pos":"intj","definitions":["bang"]},{"word":"bamă","pos":"noun","definitions":["okra (Abelmoschus esculentus)"],"forms":{"plural":"bame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bamă","accusative-definite-nominative-singular":"bama","accusative-indefinite-nominative-plural":"bame","accusative-definite-nominative-plural":"bamele","dative-genitive-indefinite-singular":"bame","dative-definite-genitive-singular":"bamei","dative-genitive-indefinite-plural":"bame","dative-definite-genitive-plural":"bamelor","singular-vocative":"bamă","plural-vocative":"bamelor"}},{"word":"Bambache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Bambache"}},{"word":"bambus","pos":"noun","definitions":["bamboo (plant, cane)"],"forms":{"plural":"bambuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bambus","accusative-definite-nominative-singular":"bambusul","accusative-indefinite-nominative-plural":"bambuși","accusative-definite-nominative-plural":"bambușii","dative-genitive-indefinite-singular":"bambus","dative-definite-genitive-singular":"bambusului","dative-genitive-indefinite-plural":"bambuși","dative-definite-genitive-plural":"bambușilor","singular-vocative":"bambusule","plural-vocative":"bambușilor"}},{"word":"Ban","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ban"}},{"word":"ban","pos":"noun","definitions":["money; coin","ban (unit of currency, one hundredth of a leu)"],"pronunciation":"/ban/","forms":{"plural":"bani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ban","accusative-definite-nominative-singular":"banul","accusative-indefinite-nominative-plural":"bani","accusative-definite-nominative-plural":"banii","dative-genitive-indefinite-singular":"ban","dative-definite-genitive-singular":"banului","dative-genitive-indefinite-plural":"bani","dative-definite-genitive-plural":"banilor","singular-vocative":"banule","plural-vocative":"banilor","alternative":"бан"}},{"word":"bănăcuț","pos":"noun","definitions":["diminutive of bănac"],"forms":{"plural":"bănăcuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bănăcuț","accusative-definite-nominative-singular":"bănăcuțul","accusative-indefinite-nominative-plural":"bănăcuțuri","accusative-definite-nominative-plural":"bănăcuțurile","dative-genitive-indefinite-singular":"bănăcuț","dative-definite-genitive-singular":"bănăcuțului","dative-genitive-indefinite-plural":"bănăcuțuri","dative-definite-genitive-plural":"bănăcuțurilor","singular-vocative":"bănăcuțule","plural-vocative":"bănăcuțurilor"}},{"word":"banal","pos":"adj","definitions":["commonplace"],"forms":{"feminine-singular":"banală","masculine-plural":"banali","feminine-neuter-plural":"banale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"banal","error-unrecognized-form-feminine-indefinite-singular":"banală","error-unrecognized-form-indefinite-masculine-plural":"banali","error-unrecognized-form-feminine-indefinite-neuter-plural":"banale","definite-error-unrecognized-form-masculine-neuter-singular":"banalul","definite-error-unrecognized-form-feminine-singular":"banala","definite-error-unrecognized-form-masculine-plural":"banalii","definite-error-unrecognized-form-feminine-neuter-plural":"banalele"}},{"word":"banalitate","pos":"noun","definitions":["banality"],"forms":{"plural":"banalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"banalitate","accusative-definite-nominative-singular":"banalitatea","accusative-indefinite-nominative-plural":"banalități","accusative-definite-nominative-plural":"banalitățile","dative-genitive-indefinite-singular":"banalități","dative-definite-genitive-singular":"banalității","dative-genitive-indefinite-plural":"banalități","dative-definite-genitive-plural":"banalităților","singular-vocative":"banalitate","plural-vocative":"banalităților"}},{"word":"banaliza","pos":"verb","definitions":["to trivialize"],"pronunciation":"/ba.na.liˈza/","forms":{"canonical":"a banaliza 1st conjugation","present-singular-third-person":"banalizează","participle-past":"banalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a banaliza","gerund":"banalizând","first-person-indicative-present-singular":"banalizez","indicative-present-second-person-singular":"banalizezi","indicative-present-singular-third-person":"banalizează","first-person-indicative-plural-present":"banalizăm","indicative-plural-present-second-person":"banalizați","indicative-plural-present-third-person":"banalizează","first-person-imperfect-indicative-singular":"banalizam","imperfect-indicative-second-person-singular":"banalizai","imperfect-indicative-singular-third-person":"banaliza","first-person-imperfect-indicative-plural":"banalizam","imperfect-indicative-plural-second-person":"banalizați","imperfect-indicative-plural-third-person":"banalizau","first-person-indicative-perfect-singular":"banalizai","indicative-perfect-second-person-singular":"banalizași","indicative-perfect-singular-third-person":"banaliză","first-person-indicative-perfect-plural":"banalizarăm","indicative-perfect-plural-second-person":"banalizarăți","indicative-perfect-plural-third-person":"banalizară","first-person-indicative-pluperfect-singular":"banalizasem","indicative-pluperfect-second-person-singular":"banalizaseși","indicative-pluperfect-singular-third-person":"banalizase","first-person-indicative-pluperfect-plural":"banalizaserăm","indicative-pluperfect-plural-second-person":"banalizaserăți","indicative-pluperfect-plural-third-person":"banalizaseră","first-person-present-singular-subjunctive":"să banalizez","present-second-person-singular-subjunctive":"să banalizezi","present-singular-subjunctive-third-person":"să banalizeze","first-person-plural-present-subjunctive":"să banalizăm","plural-present-second-person-subjunctive":"să banalizați","plural-present-subjunctive-third-person":"să banalizeze","imperative-second-person-singular":"banalizează","imperative-plural-second-person":"banalizați","imperative-negative-second-person-singular":"nu banaliza","imperative-negative-plural-second-person":"nu banalizați"}},{"word":"banalizare","pos":"noun","definitions":["trivialization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"banalizare","accusative-definite-nominative":"banalizarea","dative-genitive-indefinite":"banalizări","dative-definite-genitive":"banalizării","vocative":"banalizare"}},{"word":"banalizat","pos":"noun","definitions":["trivialization"],"forms":{"plural":"banalizaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"banalizat","accusative-definite-nominative-singular":"banalizatul","accusative-indefinite-nominative-plural":"banalizaturi","accusative-definite-nominative-plural":"banalizaturile","dative-genitive-indefinite-singular":"banalizat","dative-definite-genitive-singular":"banalizatului","dative-genitive-indefinite-plural":"banalizaturi","dative-definite-genitive-plural":"banalizaturilor","singular-vocative":"banalizatule","plural-vocative":"banalizaturilor"}},{"word":"banalizat","pos":"verb","definitions":["past participle of banaliza"],"forms":{"participle-past":"of banaliza"}},{"word":"banan","pos":"noun","definitions":["banana (plant)"],"forms":{"plural":"banani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"banan","accusative-definite-nominative-singular":"bananul","accusative-indefinite-nominative-plural":"banani","accusative-definite-nominative-plural":"bananii","dative-genitive-indefinite-singular":"banan","dative-definite-genitive-singular":"bananului","dative-genitive-indefinite-plural":"banani","dative-definite-genitive-plural":"bananilor","singular-vocative":"bananule","plural-vocative":"bananilor"}},{"word":"banana","pos":"noun","definitions":["definite singular nominative/accusative of banană (banana (fruit))"],"gender":"f"},{"word":"banană","pos":"noun","definitions":["banana"],"pronunciation":"/baˈna.nə/","forms":{"plural":"banane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banană","accusative-definite-nominative-singular":"banana","accusative-indefinite-nominative-plural":"banane","accusative-definite-nominative-plural":"bananele","dative-genitive-indefinite-singular":"banane","dative-definite-genitive-singular":"bananei","dative-genitive-indefinite-plural":"banane","dative-definite-genitive-plural":"bananelor","singular-vocative":"banană","plural-vocative":"bananelor"}},{"word":"banana split","pos":"noun","definitions":["banana split"]},{"word":"bananau","pos":"noun","definitions":["cemetery"],"forms":{"plural":"bananaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bananau","accusative-definite-nominative-singular":"bananauul","accusative-indefinite-nominative-plural":"bananaie","accusative-definite-nominative-plural":"bananaiele","dative-genitive-indefinite-singular":"bananau","dative-definite-genitive-singular":"bananauului","dative-genitive-indefinite-plural":"bananaie","dative-definite-genitive-plural":"bananaielor","singular-vocative":"bananauule","plural-vocative":"bananaielor"}},{"word":"banane","pos":"noun","definitions":["plural of banană"],"gender":"f-p"},{"word":"bananier","pos":"noun","definitions":["banana (plant)"],"forms":{"plural":"bananieri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bananier","accusative-definite-nominative-singular":"bananierul","accusative-indefinite-nominative-plural":"bananieri","accusative-definite-nominative-plural":"bananierile","dative-genitive-indefinite-singular":"bananier","dative-definite-genitive-singular":"bananierului","dative-genitive-indefinite-plural":"bananieri","dative-definite-genitive-plural":"bananierilor","singular-vocative":"bananierule","plural-vocative":"bananierilor"}},{"word":"banano","pos":"noun","definitions":["vocative singular of banană"],"pronunciation":"[baˈnano]","gender":"f"},{"word":"bănar","pos":"noun","definitions":["worker in a mint"],"forms":{"plural":"bănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănar","accusative-definite-nominative-singular":"bănarul","accusative-indefinite-nominative-plural":"bănari","accusative-definite-nominative-plural":"bănarii","dative-genitive-indefinite-singular":"bănar","dative-definite-genitive-singular":"bănarului","dative-genitive-indefinite-plural":"bănari","dative-definite-genitive-plural":"bănarilor","singular-vocative":"bănarule","plural-vocative":"bănarilor"}},{"word":"Bănărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bănărescu"}},{"word":"Bănărești","pos":"name","definitions":["a village in Săpata, Argeș County, Romania"],"gender":"m"},{"word":"bănărie","pos":"noun","definitions":["a mint","a large sum of money"],"forms":{"plural":"bănării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bănărie","accusative-definite-nominative-singular":"bănăria","accusative-indefinite-nominative-plural":"bănării","accusative-definite-nominative-plural":"bănăriile","dative-genitive-indefinite-singular":"bănării","dative-definite-genitive-singular":"bănăriei","dative-genitive-indefinite-plural":"bănării","dative-definite-genitive-plural":"bănăriilor","singular-vocative":"bănărie","plural-vocative":"bănăriilor"}},{"word":"bănărit","pos":"noun","definitions":["money"],"forms":{"plural":"bănărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bănărit","accusative-definite-nominative-singular":"bănăritul","accusative-indefinite-nominative-plural":"bănărituri","accusative-definite-nominative-plural":"bănăriturile","dative-genitive-indefinite-singular":"bănărit","dative-definite-genitive-singular":"bănăritului","dative-genitive-indefinite-plural":"bănărituri","dative-definite-genitive-plural":"bănăriturilor","singular-vocative":"bănăritule","plural-vocative":"bănăriturilor"}},{"word":"banat","pos":"noun","definitions":["banat"],"forms":{"plural":"banate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banat","accusative-definite-nominative-singular":"banatul","accusative-indefinite-nominative-plural":"banate","accusative-definite-nominative-plural":"banatele","dative-genitive-indefinite-singular":"banat","dative-definite-genitive-singular":"banatului","dative-genitive-indefinite-plural":"banate","dative-definite-genitive-plural":"banatelor","singular-vocative":"banatule","plural-vocative":"banatelor"}},{"word":"bănat","pos":"noun","definitions":["regret","sorrow, grief"],"forms":{"plural":"bănaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bănat","accusative-definite-nominative-singular":"bănatul","accusative-indefinite-nominative-plural":"bănaturi","accusative-definite-nominative-plural":"bănaturile","dative-genitive-indefinite-singular":"bănat","dative-definite-genitive-singular":"bănatului","dative-genitive-indefinite-plural":"bănaturi","dative-definite-genitive-plural":"bănaturilor","singular-vocative":"bănatule","plural-vocative":"bănaturilor"}},{"word":"Bănățan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bănățan"}},{"word":"Bănățean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bănățean"}},{"word":"bănățean","pos":"adj","definitions":["of, from or relating to Banat"],"forms":{"feminine-singular":"bănățeană","masculine-plural":"bănățeni","feminine-neuter-plural":"bănățene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănățean","error-unrecognized-form-feminine-indefinite-singular":"bănățeană","error-unrecognized-form-indefinite-masculine-plural":"bănățeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănățene","definite-error-unrecognized-form-masculine-neuter-singular":"bănățeanul","definite-error-unrecognized-form-feminine-singular":"bănățeana","definite-error-unrecognized-form-masculine-plural":"bănățenii","definite-error-unrecognized-form-feminine-neuter-plural":"bănățenele"}},{"word":"bănățean","pos":"noun","definitions":["native or inhabitant of Banat (usually male)"],"forms":{"plural":"bănățeni","feminine":"equivalent bănățeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănățean","accusative-definite-nominative-singular":"bănățeanul","accusative-indefinite-nominative-plural":"bănățeni","accusative-definite-nominative-plural":"bănățenii","dative-genitive-indefinite-singular":"bănățean","dative-definite-genitive-singular":"bănățeanului","dative-genitive-indefinite-plural":"bănățeni","dative-definite-genitive-plural":"bănățenilor","singular-vocative":"bănățeanule","plural-vocative":"bănățenilor"}},{"word":"bănățeană","pos":"noun","definitions":["female equivalent of bănățean","Banat dialect of Romanian"],"forms":{"plural":"bănățene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bănățeană","accusative-definite-nominative-singular":"bănățeana","accusative-indefinite-nominative-plural":"bănățene","accusative-definite-nominative-plural":"bănățenele","dative-genitive-indefinite-singular":"bănățene","dative-definite-genitive-singular":"bănățenei","dative-genitive-indefinite-plural":"bănățene","dative-definite-genitive-plural":"bănățenelor","singular-vocative":"bănățeană","plural-vocative":"bănățenelor"}},{"word":"bănățeancă","pos":"noun","definitions":["female equivalent of bănățean"],"forms":{"plural":"bănățence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bănățeancă","accusative-definite-nominative-singular":"bănățeanca","accusative-indefinite-nominative-plural":"bănățence","accusative-definite-nominative-plural":"bănățencele","dative-genitive-indefinite-singular":"bănățence","dative-definite-genitive-singular":"bănățencei","dative-genitive-indefinite-plural":"bănățence","dative-definite-genitive-plural":"bănățencelor","singular-vocative":"bănățeancă","plural-vocative":"bănățencelor"}},{"word":"Bănățeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bănățeanu"}},{"word":"bănățel","pos":"noun","definitions":["diminutive of bănat"],"forms":{"plural":"bănățele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bănățel","accusative-definite-nominative-singular":"bănățelul","accusative-indefinite-nominative-plural":"bănățele","accusative-definite-nominative-plural":"bănățelele","dative-genitive-indefinite-singular":"bănățel","dative-definite-genitive-singular":"bănățelului","dative-genitive-indefinite-plural":"bănățele","dative-definite-genitive-plural":"bănățelelor","singular-vocative":"bănățelule","plural-vocative":"bănățelelor"}},{"word":"bănățenesc","pos":"adj","definitions":["Banat"],"forms":{"feminine-singular":"bănățenească","plural":"bănățenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănățenesc","error-unrecognized-form-feminine-indefinite-singular":"bănățenească","error-unrecognized-form-indefinite-masculine-plural":"bănățenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănățenești","definite-error-unrecognized-form-masculine-neuter-singular":"bănățenescul","definite-error-unrecognized-form-feminine-singular":"bănățeneasca","definite-error-unrecognized-form-masculine-plural":"bănățeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"bănățeneștile"}},{"word":"bănățenește","pos":"adv","definitions":["like in the Banat region","speaking the Banat dialect"]},{"word":"banatit","pos":"noun","definitions":["banatite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banatit","accusative-definite-nominative-singular":"banatitul","accusative-indefinite-nominative-plural":"banatite","accusative-definite-nominative-plural":"banatitele","dative-genitive-indefinite-singular":"banatit","dative-definite-genitive-singular":"banatitului","dative-genitive-indefinite-plural":"banatite","dative-definite-genitive-plural":"banatitelor","singular-vocative":"banatitule","plural-vocative":"banatitelor"}},{"word":"banc","pos":"noun","definitions":["sand bank"],"forms":{"plural":"bancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"banc","accusative-definite-nominative-singular":"bancul","accusative-indefinite-nominative-plural":"bancuri","accusative-definite-nominative-plural":"bancurile","dative-genitive-indefinite-singular":"banc","dative-definite-genitive-singular":"bancului","dative-genitive-indefinite-plural":"bancuri","dative-definite-genitive-plural":"bancurilor","singular-vocative":"bancule","plural-vocative":"bancurilor"}},{"word":"banc de probă","pos":"noun","definitions":["test bench"],"forms":{"plural":"bancuri de probă"}},{"word":"banca","pos":"noun","definitions":["definite nominative/accusative singular of bancă"],"pronunciation":"[ˈbanka]","gender":"f"},{"word":"bancă","pos":"noun","definitions":["bench"],"forms":{"plural":"bănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bancă","accusative-definite-nominative-singular":"banca","accusative-indefinite-nominative-plural":"bănci","accusative-definite-nominative-plural":"băncile","dative-genitive-indefinite-singular":"bănci","dative-definite-genitive-singular":"băncii","dative-genitive-indefinite-plural":"bănci","dative-definite-genitive-plural":"băncilor","singular-vocative":"bancă","plural-vocative":"băncilor"}},{"word":"bancă","pos":"noun","definitions":["bank (financial institution)"],"forms":{"plural":"bănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bancă","accusative-definite-nominative-singular":"banca","accusative-indefinite-nominative-plural":"bănci","accusative-definite-nominative-plural":"băncile","dative-genitive-indefinite-singular":"bănci","dative-definite-genitive-singular":"băncii","dative-genitive-indefinite-plural":"bănci","dative-definite-genitive-plural":"băncilor","singular-vocative":"bancă","plural-vocative":"băncilor"}},{"word":"bancă","pos":"noun","definitions":["jar"],"forms":{"plural":"bănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bancă","accusative-definite-nominative-singular":"banca","accusative-indefinite-nominative-plural":"bănci","accusative-definite-nominative-plural":"băncile","dative-genitive-indefinite-singular":"bănci","dative-definite-genitive-singular":"băncii","dative-genitive-indefinite-plural":"bănci","dative-definite-genitive-plural":"băncilor","singular-vocative":"bancă","plural-vocative":"băncilor"}},{"word":"bancă centrală","pos":"noun","definitions":["central bank"],"forms":{"plural":"bănci centrale"}},{"word":"Banca Centrală Europeană","pos":"name","definitions":["European Central Bank"],"gender":"f"},{"word":"băncădit","pos":"adj","definitions":["upset"],"forms":{"feminine-singular":"băncădită","masculine-plural":"băncădiți","feminine-neuter-plural":"băncădite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băncădit","error-unrecognized-form-feminine-indefinite-singular":"băncădită","error-unrecognized-form-indefinite-masculine-plural":"băncădiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băncădite","definite-error-unrecognized-form-masculine-neuter-singular":"băncăditul","definite-error-unrecognized-form-feminine-singular":"băncădita","definite-error-unrecognized-form-masculine-plural":"băncădiții","definite-error-unrecognized-form-feminine-neuter-plural":"băncăditele"}},{"word":"bancar","pos":"adj","definitions":["bank, banking"],"forms":{"feminine-singular":"bancară","masculine-plural":"bancari","feminine-neuter-plural":"bancare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bancar","error-unrecognized-form-feminine-indefinite-singular":"bancară","error-unrecognized-form-indefinite-masculine-plural":"bancari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bancare","definite-error-unrecognized-form-masculine-neuter-singular":"bancarul","definite-error-unrecognized-form-feminine-singular":"bancara","definite-error-unrecognized-form-masculine-plural":"bancarii","definite-error-unrecognized-form-feminine-neuter-plural":"bancarele"}},{"word":"Bănceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bănceanu"}},{"word":"Băncescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băncescu"}},{"word":"Băncești","pos":"name","definitions":["a village in Mușenița, Suceava County, Romania","a village in Voinești, Vaslui County, Romania"],"gender":"m"},{"word":"bancher","pos":"noun","definitions":["banker"],"forms":{"plural":"bancheri","feminine":"equivalent bancheră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bancher","accusative-definite-nominative-singular":"bancherul","accusative-indefinite-nominative-plural":"bancheri","accusative-definite-nominative-plural":"bancherii","dative-genitive-indefinite-singular":"bancher","dative-definite-genitive-singular":"bancherului","dative-genitive-indefinite-plural":"bancheri","dative-definite-genitive-plural":"bancherilor","singular-vocative":"bancherule","plural-vocative":"bancherilor","alternative":"banchier"}},{"word":"bancheresc","pos":"adj","definitions":["banking"],"forms":{"feminine-singular":"bancherească","plural":"bancherești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bancheresc","error-unrecognized-form-feminine-indefinite-singular":"bancherească","error-unrecognized-form-indefinite-masculine-plural":"bancherești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bancherești","definite-error-unrecognized-form-masculine-neuter-singular":"bancherescul","definite-error-unrecognized-form-feminine-singular":"banchereasca","definite-error-unrecognized-form-masculine-plural":"banchereștii","definite-error-unrecognized-form-feminine-neuter-plural":"banchereștile"}},{"word":"banchet","pos":"noun","definitions":["banquet"],"forms":{"plural":"banchete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banchet","accusative-definite-nominative-singular":"banchetul","accusative-indefinite-nominative-plural":"banchete","accusative-definite-nominative-plural":"banchetele","dative-genitive-indefinite-singular":"banchet","dative-definite-genitive-singular":"banchetului","dative-genitive-indefinite-plural":"banchete","dative-definite-genitive-plural":"banchetelor","singular-vocative":"banchetule","plural-vocative":"banchetelor"}},{"word":"bancheta","pos":"verb","definitions":["to participate in a banquet"],"forms":{"canonical":"a bancheta 1st conjugation","present-singular-third-person":"banchetează","participle-past":"banchetat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bancheta","gerund":"banchetând","first-person-indicative-present-singular":"banchetez","indicative-present-second-person-singular":"banchetezi","indicative-present-singular-third-person":"banchetează","first-person-indicative-plural-present":"banchetăm","indicative-plural-present-second-person":"banchetați","indicative-plural-present-third-person":"banchetează","first-person-imperfect-indicative-singular":"banchetam","imperfect-indicative-second-person-singular":"banchetai","imperfect-indicative-singular-third-person":"bancheta","first-person-imperfect-indicative-plural":"banchetam","imperfect-indicative-plural-second-person":"banchetați","imperfect-indicative-plural-third-person":"banchetau","first-person-indicative-perfect-singular":"banchetai","indicative-perfect-second-person-singular":"banchetași","indicative-perfect-singular-third-person":"banchetă","first-person-indicative-perfect-plural":"banchetarăm","indicative-perfect-plural-second-person":"banchetarăți","indicative-perfect-plural-third-person":"banchetară","first-person-indicative-pluperfect-singular":"banchetasem","indicative-pluperfect-second-person-singular":"banchetaseși","indicative-pluperfect-singular-third-person":"banchetase","first-person-indicative-pluperfect-plural":"banchetaserăm","indicative-pluperfect-plural-second-person":"banchetaserăți","indicative-pluperfect-plural-third-person":"banchetaseră","first-person-present-singular-subjunctive":"să banchetez","present-second-person-singular-subjunctive":"să banchetezi","present-singular-subjunctive-third-person":"să bancheteze","first-person-plural-present-subjunctive":"să banchetăm","plural-present-second-person-subjunctive":"să banchetați","plural-present-subjunctive-third-person":"să bancheteze","imperative-second-person-singular":"banchetează","imperative-plural-second-person":"banchetați","imperative-negative-second-person-singular":"nu bancheta","imperative-negative-plural-second-person":"nu banchetați"}},{"word":"banchetă","pos":"noun","definitions":["bench"],"forms":{"plural":"banchete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banchetă","accusative-definite-nominative-singular":"bancheta","accusative-indefinite-nominative-plural":"banchete","accusative-definite-nominative-plural":"banchetele","dative-genitive-indefinite-singular":"banchete","dative-definite-genitive-singular":"banchetei","dative-genitive-indefinite-plural":"banchete","dative-definite-genitive-plural":"banchetelor","singular-vocative":"banchetă","plural-vocative":"banchetelor"}},{"word":"banchiză","pos":"noun","definitions":["floe"],"forms":{"plural":"banchize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banchiză","accusative-definite-nominative-singular":"banchiza","accusative-indefinite-nominative-plural":"banchize","accusative-definite-nominative-plural":"banchizele","dative-genitive-indefinite-singular":"banchize","dative-definite-genitive-singular":"banchizei","dative-genitive-indefinite-plural":"banchize","dative-definite-genitive-plural":"banchizelor","singular-vocative":"banchiză","plural-vocative":"banchizelor"}},{"word":"Băncilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băncilă"}},{"word":"Băncioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Băncioiu"}},{"word":"Banciu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Banciu"}},{"word":"Bănciucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănciucă"}},{"word":"Bănciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bănciulescu"}},{"word":"bancnotă","pos":"noun","definitions":["banknote"],"pronunciation":"/banˈkno.tə/","forms":{"plural":"bancnote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bancnotă","accusative-definite-nominative-singular":"bancnota","accusative-indefinite-nominative-plural":"bancnote","accusative-definite-nominative-plural":"bancnotele","dative-genitive-indefinite-singular":"bancnote","dative-definite-genitive-singular":"bancnotei","dative-genitive-indefinite-plural":"bancnote","dative-definite-genitive-plural":"bancnotelor","singular-vocative":"bancnotă","plural-vocative":"bancnotelor"}},{"word":"banco","pos":"noun","definitions":["vocative singular of bancă"],"pronunciation":"[ˈbaŋko]","gender":"f"},{"word":"bancomat","pos":"noun","definitions":["ATM, teller, automated teller machine"],"forms":{"plural":"bancomate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bancomat","accusative-definite-nominative-singular":"bancomatul","accusative-indefinite-nominative-plural":"bancomate","accusative-definite-nominative-plural":"bancomatele","dative-genitive-indefinite-singular":"bancomat","dative-definite-genitive-singular":"bancomatului","dative-genitive-indefinite-plural":"bancomate","dative-definite-genitive-plural":"bancomatelor","singular-vocative":"bancomatule","plural-vocative":"bancomatelor"}},{"word":"Bancotă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bancotă"}},{"word":"bancruta","pos":"verb","definitions":["to go bankrupt"],"forms":{"canonical":"a bancruta 1st conjugation","present-singular-third-person":"bancrutează","participle-past":"bancrutat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bancruta","gerund":"bancrutând","first-person-indicative-present-singular":"bancrutez","indicative-present-second-person-singular":"bancrutezi","indicative-present-singular-third-person":"bancrutează","first-person-indicative-plural-present":"bancrutăm","indicative-plural-present-second-person":"bancrutați","indicative-plural-present-third-person":"bancrutează","first-person-imperfect-indicative-singular":"bancrutam","imperfect-indicative-second-person-singular":"bancrutai","imperfect-indicative-singular-third-person":"bancruta","first-person-imperfect-indicative-plural":"bancrutam","imperfect-indicative-plural-second-person":"bancrutați","imperfect-indicative-plural-third-person":"bancrutau","first-person-indicative-perfect-singular":"bancrutai","indicative-perfect-second-person-singular":"bancrutași","indicative-perfect-singular-third-person":"bancrută","first-person-indicative-perfect-plural":"bancrutarăm","indicative-perfect-plural-second-person":"bancrutarăți","indicative-perfect-plural-third-person":"bancrutară","first-person-indicative-pluperfect-singular":"bancrutasem","indicative-pluperfect-second-person-singular":"bancrutaseși","indicative-pluperfect-singular-third-person":"bancrutase","first-person-indicative-pluperfect-plural":"bancrutaserăm","indicative-pluperfect-plural-second-person":"bancrutaserăți","indicative-pluperfect-plural-third-person":"bancrutaseră","first-person-present-singular-subjunctive":"să bancrutez","present-second-person-singular-subjunctive":"să bancrutezi","present-singular-subjunctive-third-person":"să bancruteze","first-person-plural-present-subjunctive":"să bancrutăm","plural-present-second-person-subjunctive":"să bancrutați","plural-present-subjunctive-third-person":"să bancruteze","imperative-second-person-singular":"bancrutează","imperative-plural-second-person":"bancrutați","imperative-negative-second-person-singular":"nu bancruta","imperative-negative-plural-second-person":"nu bancrutați"}},{"word":"bancrută","pos":"noun","definitions":["bankruptcy"],"pronunciation":"/bankˈru.tə/","forms":{"plural":"bancrute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bancrută","accusative-definite-nominative-singular":"bancruta","accusative-indefinite-nominative-plural":"bancrute","accusative-definite-nominative-plural":"bancrutele","dative-genitive-indefinite-singular":"bancrute","dative-definite-genitive-singular":"bancrutei","dative-genitive-indefinite-plural":"bancrute","dative-definite-genitive-plural":"bancrutelor","singular-vocative":"bancrută","plural-vocative":"bancrutelor"}},{"word":"bancrutar","pos":"noun","definitions":["bankrupt person"],"forms":{"plural":"bancrutari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bancrutar","accusative-definite-nominative-singular":"bancrutarul","accusative-indefinite-nominative-plural":"bancrutari","accusative-definite-nominative-plural":"bancrutarii","dative-genitive-indefinite-singular":"bancrutar","dative-definite-genitive-singular":"bancrutarului","dative-genitive-indefinite-plural":"bancrutari","dative-definite-genitive-plural":"bancrutarilor","singular-vocative":"bancrutarule","plural-vocative":"bancrutarilor"}},{"word":"Bancu","pos":"name","definitions":["a surname"]},{"word":"bănculiță","pos":"noun","definitions":["diminutive of bancă"],"forms":{"plural":"bănculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bănculiță","accusative-definite-nominative-singular":"bănculița","accusative-indefinite-nominative-plural":"bănculițe","accusative-definite-nominative-plural":"bănculițele","dative-genitive-indefinite-singular":"bănculițe","dative-definite-genitive-singular":"bănculiței","dative-genitive-indefinite-plural":"bănculițe","dative-definite-genitive-plural":"bănculițelor","singular-vocative":"bănculiță","plural-vocative":"bănculițelor"}},{"word":"Băncuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băncuță"}},{"word":"băncuță","pos":"noun","definitions":["diminutive of bancă; small bench"],"forms":{"plural":"băncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băncuță","accusative-definite-nominative-singular":"băncuța","accusative-indefinite-nominative-plural":"băncuțe","accusative-definite-nominative-plural":"băncuțele","dative-genitive-indefinite-singular":"băncuțe","dative-definite-genitive-singular":"băncuței","dative-genitive-indefinite-plural":"băncuțe","dative-definite-genitive-plural":"băncuțelor","singular-vocative":"băncuță","plural-vocative":"băncuțelor"}},{"word":"băncuță","pos":"noun","definitions":["a 50 bani coin","a small value Austrian coin (10 or 20 kreuzer)"],"forms":{"plural":"băncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băncuță","accusative-definite-nominative-singular":"băncuța","accusative-indefinite-nominative-plural":"băncuțe","accusative-definite-nominative-plural":"băncuțele","dative-genitive-indefinite-singular":"băncuțe","dative-definite-genitive-singular":"băncuței","dative-genitive-indefinite-plural":"băncuțe","dative-definite-genitive-plural":"băncuțelor","singular-vocative":"băncuță","plural-vocative":"băncuțelor"}},{"word":"Band","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Band, Mureș County, Romania"],"gender":"m"},{"word":"banda","pos":"noun","definitions":["definite nominative/accusative singular of bandă"],"pronunciation":"/ˈban.da/","gender":"f","forms":{"alternative":"банда"}},{"word":"bandă","pos":"noun","definitions":["tape, band","lane (lengthwise division of roadway intended for a single line of vehicles)"],"forms":{"plural":"benzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bandă","accusative-definite-nominative-singular":"banda","accusative-indefinite-nominative-plural":"benzi","accusative-definite-nominative-plural":"benzile","dative-genitive-indefinite-singular":"benzi","dative-definite-genitive-singular":"benzii","dative-genitive-indefinite-plural":"benzi","dative-definite-genitive-plural":"benzilor","singular-vocative":"bandă","plural-vocative":"benzilor"}},{"word":"bandă","pos":"noun","definitions":["band, gang"],"forms":{"plural":"bande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bandă","accusative-definite-nominative-singular":"banda","accusative-indefinite-nominative-plural":"bande","accusative-definite-nominative-plural":"bandele","dative-genitive-indefinite-singular":"bande","dative-definite-genitive-singular":"bandei","dative-genitive-indefinite-plural":"bande","dative-definite-genitive-plural":"bandelor","singular-vocative":"bandă","plural-vocative":"bandelor"}},{"word":"bandă adezivă","pos":"noun","definitions":["adhesive tape"],"forms":{"plural":"benzi adezive"}},{"word":"bandă de circulație","pos":"noun","definitions":["lane, side"],"forms":{"plural":"benzi de circulație"}},{"word":"bandă de magnetofon","pos":"noun","definitions":["cassette tape"],"forms":{"plural":"benzi de magnetofon"}},{"word":"bandă de montaj","pos":"noun","definitions":["assembly line"],"forms":{"plural":"benzi de montaj"}},{"word":"bandă de valență","pos":"noun","definitions":["valence band"],"forms":{"plural":"benzi de valență"}},{"word":"bandă desenată","pos":"noun","definitions":["comic strip"],"forms":{"plural":"benzi desenate"}},{"word":"bandă izolantă","pos":"noun","definitions":["electrical tape"],"forms":{"plural":"benzi izolante"}},{"word":"bandă magnetică","pos":"noun","definitions":["magnetic tape"],"forms":{"plural":"benzi magnetice"}},{"word":"bandă rulantă","pos":"noun","definitions":["conveyor belt"],"forms":{"plural":"benzi rulante"}},{"word":"bandaj","pos":"noun","definitions":["bandage"],"pronunciation":"/banˈdaʒ/","forms":{"plural":"bandaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bandaj","accusative-definite-nominative-singular":"bandajul","accusative-indefinite-nominative-plural":"bandaje","accusative-definite-nominative-plural":"bandajele","dative-genitive-indefinite-singular":"bandaj","dative-definite-genitive-singular":"bandajului","dative-genitive-indefinite-plural":"bandaje","dative-definite-genitive-plural":"bandajelor","singular-vocative":"bandajule","plural-vocative":"bandajelor","alternative":"бандаж"}},{"word":"bandaja","pos":"verb","definitions":["to bandage"],"forms":{"canonical":"a bandaja 1st conjugation","present-singular-third-person":"bandajează","participle-past":"bandajat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bandaja","gerund":"bandajând","first-person-indicative-present-singular":"bandajez","indicative-present-second-person-singular":"bandajezi","indicative-present-singular-third-person":"bandajează","first-person-indicative-plural-present":"bandajăm","indicative-plural-present-second-person":"bandajați","indicative-plural-present-third-person":"bandajează","first-person-imperfect-indicative-singular":"bandajam","imperfect-indicative-second-person-singular":"bandajai","imperfect-indicative-singular-third-person":"bandaja","first-person-imperfect-indicative-plural":"bandajam","imperfect-indicative-plural-second-person":"bandajați","imperfect-indicative-plural-third-person":"bandajau","first-person-indicative-perfect-singular":"bandajai","indicative-perfect-second-person-singular":"bandajași","indicative-perfect-singular-third-person":"bandajă","first-person-indicative-perfect-plural":"bandajarăm","indicative-perfect-plural-second-person":"bandajarăți","indicative-perfect-plural-third-person":"bandajară","first-person-indicative-pluperfect-singular":"bandajasem","indicative-pluperfect-second-person-singular":"bandajaseși","indicative-pluperfect-singular-third-person":"bandajase","first-person-indicative-pluperfect-plural":"bandajaserăm","indicative-pluperfect-plural-second-person":"bandajaserăți","indicative-pluperfect-plural-third-person":"bandajaseră","first-person-present-singular-subjunctive":"să bandajez","present-second-person-singular-subjunctive":"să bandajezi","present-singular-subjunctive-third-person":"să bandajeze","first-person-plural-present-subjunctive":"să bandajăm","plural-present-second-person-subjunctive":"să bandajați","plural-present-subjunctive-third-person":"să bandajeze","imperative-second-person-singular":"bandajează","imperative-plural-second-person":"bandajați","imperative-negative-second-person-singular":"nu bandaja","imperative-negative-plural-second-person":"nu bandajați"}},{"word":"bandajare","pos":"noun","definitions":["dressing (of a wound)"],"forms":{"plural":"bandajări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bandajare","accusative-definite-nominative-singular":"bandajarea","accusative-indefinite-nominative-plural":"bandajări","accusative-definite-nominative-plural":"bandajările","dative-genitive-indefinite-singular":"bandajări","dative-definite-genitive-singular":"bandajării","dative-genitive-indefinite-plural":"bandajări","dative-definite-genitive-plural":"bandajărilor","singular-vocative":"bandajare","plural-vocative":"bandajărilor"}},{"word":"bandajat","pos":"noun","definitions":["dressing (of a wound)"],"forms":{"plural":"bandajaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bandajat","accusative-definite-nominative-singular":"bandajatul","accusative-indefinite-nominative-plural":"bandajaturi","accusative-definite-nominative-plural":"bandajaturile","dative-genitive-indefinite-singular":"bandajat","dative-definite-genitive-singular":"bandajatului","dative-genitive-indefinite-plural":"bandajaturi","dative-definite-genitive-plural":"bandajaturilor","singular-vocative":"bandajatule","plural-vocative":"bandajaturilor"}},{"word":"bandajat","pos":"verb","definitions":["past participle of bandaja"],"forms":{"participle-past":"of bandaja"}},{"word":"bande","pos":"noun","definitions":["inflection of bandă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈbande]","gender":"f"},{"word":"Băndean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băndean"}},{"word":"banderilă","pos":"noun","definitions":["banderilla"],"forms":{"plural":"banderile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banderilă","accusative-definite-nominative-singular":"banderila","accusative-indefinite-nominative-plural":"banderile","accusative-definite-nominative-plural":"banderilele","dative-genitive-indefinite-singular":"banderile","dative-definite-genitive-singular":"banderilei","dative-genitive-indefinite-plural":"banderile","dative-definite-genitive-plural":"banderilelor","singular-vocative":"banderilă","plural-vocative":"banderilelor"}},{"word":"banderiu","pos":"noun","definitions":["banner"],"forms":{"plural":"banderii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banderiu","accusative-definite-nominative-singular":"banderiuul","accusative-indefinite-nominative-plural":"banderii","accusative-definite-nominative-plural":"banderiile","dative-genitive-indefinite-singular":"banderiu","dative-definite-genitive-singular":"banderiuului","dative-genitive-indefinite-plural":"banderii","dative-definite-genitive-plural":"banderiilor","singular-vocative":"banderiuule","plural-vocative":"banderiilor"}},{"word":"banderolă","pos":"noun","definitions":["banner"],"forms":{"plural":"banderole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banderolă","accusative-definite-nominative-singular":"banderola","accusative-indefinite-nominative-plural":"banderole","accusative-definite-nominative-plural":"banderolele","dative-genitive-indefinite-singular":"banderole","dative-definite-genitive-singular":"banderolei","dative-genitive-indefinite-plural":"banderole","dative-definite-genitive-plural":"banderolelor","singular-vocative":"banderolă","plural-vocative":"banderolelor"}},{"word":"Băndică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băndică"}},{"word":"bandieră","pos":"noun","definitions":["banner"],"forms":{"plural":"bandiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bandieră","accusative-definite-nominative-singular":"bandiera","accusative-indefinite-nominative-plural":"bandiere","accusative-definite-nominative-plural":"bandierele","dative-genitive-indefinite-singular":"bandiere","dative-definite-genitive-singular":"bandierei","dative-genitive-indefinite-plural":"bandiere","dative-definite-genitive-plural":"bandierelor","singular-vocative":"bandieră","plural-vocative":"bandierelor"}},{"word":"bandit","pos":"noun","definitions":["bandit"],"forms":{"plural":"bandiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bandit","accusative-definite-nominative-singular":"banditul","accusative-indefinite-nominative-plural":"bandiți","accusative-definite-nominative-plural":"bandiții","dative-genitive-indefinite-singular":"bandit","dative-definite-genitive-singular":"banditului","dative-genitive-indefinite-plural":"bandiți","dative-definite-genitive-plural":"bandiților","singular-vocative":"banditule","plural-vocative":"bandiților"}},{"word":"banditesc","pos":"adj","definitions":["thievish, criminal"],"forms":{"feminine-singular":"banditească","plural":"banditești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"banditesc","error-unrecognized-form-feminine-indefinite-singular":"banditească","error-unrecognized-form-indefinite-masculine-plural":"banditești","error-unrecognized-form-feminine-indefinite-neuter-plural":"banditești","definite-error-unrecognized-form-masculine-neuter-singular":"banditescul","definite-error-unrecognized-form-feminine-singular":"banditeasca","definite-error-unrecognized-form-masculine-plural":"banditeștii","definite-error-unrecognized-form-feminine-neuter-plural":"banditeștile"}},{"word":"banditește","pos":"adv","definitions":["like a bandit"]},{"word":"banditism","pos":"noun","definitions":["banditry"],"forms":{"plural":"banditisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banditism","accusative-definite-nominative-singular":"banditismul","accusative-indefinite-nominative-plural":"banditisme","accusative-definite-nominative-plural":"banditismele","dative-genitive-indefinite-singular":"banditism","dative-definite-genitive-singular":"banditismului","dative-genitive-indefinite-plural":"banditisme","dative-definite-genitive-plural":"banditismelor","singular-vocative":"banditismule","plural-vocative":"banditismelor"}},{"word":"bando","pos":"noun","definitions":["vocative singular of bandă"],"pronunciation":"[ˈbando]","gender":"f"},{"word":"Bandoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bandoiu"}},{"word":"Băndoiu","pos":"name","definitions":["a village in Mărașu, Brăila County, Romania","a surname originating as a patronymic"],"gender":"m"},{"word":"bandolieră","pos":"noun","definitions":["obsolete form of bandulieră"],"forms":{"plural":"bandoliere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bandolieră","accusative-definite-nominative-singular":"bandoliera","accusative-indefinite-nominative-plural":"bandoliere","accusative-definite-nominative-plural":"bandolierele","dative-genitive-indefinite-singular":"bandoliere","dative-definite-genitive-singular":"bandolierei","dative-genitive-indefinite-plural":"bandoliere","dative-definite-genitive-plural":"bandolierelor","singular-vocative":"bandolieră","plural-vocative":"bandolierelor"}},{"word":"Bandrabur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bandrabur"}},{"word":"bandraburcă","pos":"noun","definitions":["potato"],"forms":{"plural":"bandraburce","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bandraburcă","accusative-definite-nominative-singular":"bandraburcăul","accusative-indefinite-nominative-plural":"bandraburce","accusative-definite-nominative-plural":"bandraburcei","dative-genitive-indefinite-singular":"bandraburcă","dative-definite-genitive-singular":"bandraburcăului","dative-genitive-indefinite-plural":"bandraburce","dative-definite-genitive-plural":"bandraburcelor","singular-vocative":"bandraburcăule","plural-vocative":"bandraburcelor"}},{"word":"bandulieră","pos":"noun","definitions":["shoulder strap","bandolier"],"forms":{"plural":"banduliere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bandulieră","accusative-definite-nominative-singular":"banduliera","accusative-indefinite-nominative-plural":"banduliere","accusative-definite-nominative-plural":"bandulierele","dative-genitive-indefinite-singular":"banduliere","dative-definite-genitive-singular":"bandulierei","dative-genitive-indefinite-plural":"banduliere","dative-definite-genitive-plural":"bandulierelor","singular-vocative":"bandulieră","plural-vocative":"bandulierelor"}},{"word":"bandură","pos":"noun","definitions":["bandura"],"forms":{"plural":"banduri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bandură","accusative-definite-nominative-singular":"bandura","accusative-indefinite-nominative-plural":"banduri","accusative-definite-nominative-plural":"bandurile","dative-genitive-indefinite-singular":"banduri","dative-definite-genitive-singular":"bandurii","dative-genitive-indefinite-plural":"banduri","dative-definite-genitive-plural":"bandurilor","singular-vocative":"bandură","plural-vocative":"bandurilor"}},{"word":"bandurar","pos":"noun","definitions":["bandurist"],"forms":{"plural":"bandurari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bandurar","accusative-definite-nominative-singular":"bandurarul","accusative-indefinite-nominative-plural":"bandurari","accusative-definite-nominative-plural":"bandurarii","dative-genitive-indefinite-singular":"bandurar","dative-definite-genitive-singular":"bandurarului","dative-genitive-indefinite-plural":"bandurari","dative-definite-genitive-plural":"bandurarilor","singular-vocative":"bandurarule","plural-vocative":"bandurarilor"}},{"word":"băndurică","pos":"noun","definitions":["diminutive of bandură"],"forms":{"plural":"băndurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"băndurică","accusative-definite-nominative-singular":"băndurica","accusative-indefinite-nominative-plural":"băndurici","accusative-definite-nominative-plural":"bănduricile","dative-genitive-indefinite-singular":"băndurici","dative-definite-genitive-singular":"bănduricii","dative-genitive-indefinite-plural":"băndurici","dative-definite-genitive-plural":"bănduricilor","singular-vocative":"băndurică","plural-vocative":"bănduricilor"}},{"word":"bandurist","pos":"noun","definitions":["bandurist"],"forms":{"plural":"banduriști","feminine":"equivalent banduristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bandurist","accusative-definite-nominative-singular":"banduristul","accusative-indefinite-nominative-plural":"banduriști","accusative-definite-nominative-plural":"banduriștii","dative-genitive-indefinite-singular":"bandurist","dative-definite-genitive-singular":"banduristului","dative-genitive-indefinite-plural":"banduriști","dative-definite-genitive-plural":"banduriștilor","singular-vocative":"banduristule","plural-vocative":"banduriștilor"}},{"word":"banduristă","pos":"noun","definitions":["female equivalent of bandurist"],"forms":{"plural":"banduriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banduristă","accusative-definite-nominative-singular":"bandurista","accusative-indefinite-nominative-plural":"banduriste","accusative-definite-nominative-plural":"banduristele","dative-genitive-indefinite-singular":"banduriste","dative-definite-genitive-singular":"banduristei","dative-genitive-indefinite-plural":"banduriste","dative-definite-genitive-plural":"banduristelor","singular-vocative":"banduristă","plural-vocative":"banduristelor"}},{"word":"Băneasa","pos":"name","definitions":["a city in Constanța County, Romania","a commune of Galați County, Romania","a village in Băneasa, Galați County, Romania","a commune of Giurgiu County, Romania","a village in Băneasa, Giurgiu County, Romania"],"gender":"f"},{"word":"băneasă","pos":"noun","definitions":["female equivalent of ban"],"forms":{"plural":"bănease","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băneasă","accusative-definite-nominative-singular":"băneasa","accusative-indefinite-nominative-plural":"bănese","accusative-definite-nominative-plural":"bănesele","dative-genitive-indefinite-singular":"bănese","dative-definite-genitive-singular":"bănesei","dative-genitive-indefinite-plural":"bănese","dative-definite-genitive-plural":"băneselor","singular-vocative":"băneasă","plural-vocative":"băneselor"}},{"word":"bănesc","pos":"adj","definitions":["pecuniary"],"forms":{"feminine-singular":"bănească","plural":"bănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănesc","error-unrecognized-form-feminine-indefinite-singular":"bănească","error-unrecognized-form-indefinite-masculine-plural":"bănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănești","definite-error-unrecognized-form-masculine-neuter-singular":"bănescul","definite-error-unrecognized-form-feminine-singular":"băneasca","definite-error-unrecognized-form-masculine-plural":"băneștii","definite-error-unrecognized-form-feminine-neuter-plural":"băneștile"}},{"word":"Bănescu","pos":"name","definitions":["a surname"],"pronunciation":"[bɘˈnes.ku]","gender":"m","forms":{"dative-genitive":"lui Bănescu"}},{"word":"bănește","pos":"adv","definitions":["moneywise"]},{"word":"Bănești","pos":"name","definitions":["a village in Hălmagiu, Arad County, Romania","a village in Sălcioara, Dâmbovița County, Romania","a village in Iepurești, Giurgiu County, Romania","a commune of Prahova County, Romania","a village in Bănești, Prahova County, Romania"],"gender":"m"},{"word":"Băneștii Noi","pos":"name","definitions":["a village in Bănești, Telenești Raion, Moldova"],"gender":"m"},{"word":"bănet","pos":"noun","definitions":["money (especially in large quantities)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bănet","accusative-definite-nominative":"bănetul","dative-genitive-indefinite":"bănet","dative-definite-genitive":"bănetului","vocative":"bănetule"}},{"word":"bang","pos":"intj","definitions":["bang"]},{"word":"bang sonic","pos":"noun","definitions":["sonic boom"],"forms":{"plural":"banguri sonice"}},{"word":"Bangkok","pos":"name","definitions":["Bangkok (the capital city of Thailand)"]},{"word":"Bangladeș","pos":"name","definitions":["uncommon alternative spelling of Bangladesh"],"gender":"n"},{"word":"bani","pos":"noun","definitions":["plural of ban (money)"],"pronunciation":"/banʲ/","gender":"m-p"},{"word":"băni","pos":"verb","definitions":["to become a ban"],"forms":{"canonical":"a băni 4th conjugation","present-singular-third-person":"bănește","participle-past":"bănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a băni","gerund":"bănind","first-person-indicative-present-singular":"bănesc","indicative-present-second-person-singular":"bănești","indicative-present-singular-third-person":"bănește","first-person-indicative-plural-present":"bănim","indicative-plural-present-second-person":"băniți","indicative-plural-present-third-person":"bănesc","first-person-imperfect-indicative-singular":"băneam","imperfect-indicative-second-person-singular":"băneai","imperfect-indicative-singular-third-person":"bănea","first-person-imperfect-indicative-plural":"băneam","imperfect-indicative-plural-second-person":"băneați","imperfect-indicative-plural-third-person":"băneau","first-person-indicative-perfect-singular":"bănii","indicative-perfect-second-person-singular":"băniși","indicative-perfect-singular-third-person":"băni","first-person-indicative-perfect-plural":"bănirăm","indicative-perfect-plural-second-person":"bănirăți","indicative-perfect-plural-third-person":"băniră","first-person-indicative-pluperfect-singular":"bănisem","indicative-pluperfect-second-person-singular":"băniseși","indicative-pluperfect-singular-third-person":"bănise","first-person-indicative-pluperfect-plural":"băniserăm","indicative-pluperfect-plural-second-person":"băniserăți","indicative-pluperfect-plural-third-person":"băniseră","first-person-present-singular-subjunctive":"să bănesc","present-second-person-singular-subjunctive":"să bănești","present-singular-subjunctive-third-person":"să bănească","first-person-plural-present-subjunctive":"să bănim","plural-present-second-person-subjunctive":"să băniți","plural-present-subjunctive-third-person":"să bănească","imperative-second-person-singular":"bănește","imperative-plural-second-person":"băniți","imperative-negative-second-person-singular":"nu băni","imperative-negative-plural-second-person":"nu băniți"}},{"word":"bani gheață","pos":"noun","definitions":["cash (money in the form of notes/bills and coins)"]},{"word":"bani lichizi","pos":"noun","definitions":["cash (money in the form of notes/bills and coins)"]},{"word":"bani peșin","pos":"noun","definitions":["cash"]},{"word":"bani sunători","pos":"noun","definitions":["cash","species, coins"]},{"word":"Bănia","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Nera","a commune of Caraș-Severin County, Romania","a village in Bănia, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Bănică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănică"}},{"word":"bănică","pos":"noun","definitions":["round-headed rampion (Phyteuma orbiculare)"],"forms":{"plural":"bănici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bănică","accusative-definite-nominative-singular":"bănica","accusative-indefinite-nominative-plural":"bănici","accusative-definite-nominative-plural":"bănicile","dative-genitive-indefinite-singular":"bănici","dative-definite-genitive-singular":"bănicii","dative-genitive-indefinite-plural":"bănici","dative-definite-genitive-plural":"bănicilor","singular-vocative":"bănică","plural-vocative":"bănicilor"}},{"word":"bănicer","pos":"noun","definitions":["diminutive of baniță"],"forms":{"plural":"băniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănicer","accusative-definite-nominative-singular":"bănicerul","accusative-indefinite-nominative-plural":"băniceri","accusative-definite-nominative-plural":"bănicerii","dative-genitive-indefinite-singular":"bănicer","dative-definite-genitive-singular":"bănicerului","dative-genitive-indefinite-plural":"băniceri","dative-definite-genitive-plural":"bănicerilor","singular-vocative":"bănicerule","plural-vocative":"bănicerilor"}},{"word":"Băniceru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băniceru"}},{"word":"Bănicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bănicescu"}},{"word":"Bănicești","pos":"name","definitions":["a village in Valea Danului, Argeș County, Romania"],"gender":"m"},{"word":"bănicioară","pos":"noun","definitions":["diminutive of baniță"],"forms":{"plural":"bănicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bănicioară","accusative-definite-nominative-singular":"bănicioara","accusative-indefinite-nominative-plural":"bănicioare","accusative-definite-nominative-plural":"bănicioarele","dative-genitive-indefinite-singular":"bănicioare","dative-definite-genitive-singular":"bănicioarei","dative-genitive-indefinite-plural":"bănicioare","dative-definite-genitive-plural":"bănicioarelor","singular-vocative":"bănicioară","plural-vocative":"bănicioarelor"}},{"word":"Bănicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bănicioiu"}},{"word":"bănie","pos":"noun","definitions":["residence of a ban"],"forms":{"plural":"bănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bănie","accusative-definite-nominative-singular":"bănia","accusative-indefinite-nominative-plural":"bănii","accusative-definite-nominative-plural":"băniile","dative-genitive-indefinite-singular":"bănii","dative-definite-genitive-singular":"băniei","dative-genitive-indefinite-plural":"bănii","dative-definite-genitive-plural":"băniilor","singular-vocative":"bănie","plural-vocative":"băniilor"}},{"word":"banieră","pos":"noun","definitions":["feudal military banner"],"forms":{"plural":"baniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"banieră","accusative-definite-nominative-singular":"baniera","accusative-indefinite-nominative-plural":"baniere","accusative-definite-nominative-plural":"banierele","dative-genitive-indefinite-singular":"baniere","dative-definite-genitive-singular":"banierei","dative-genitive-indefinite-plural":"baniere","dative-definite-genitive-plural":"banierelor","singular-vocative":"banieră","plural-vocative":"banierelor"}},{"word":"banii","pos":"noun","definitions":["definite nominative/accusative plural of ban"]},{"word":"Bănilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănilă"}},{"word":"banilor","pos":"noun","definitions":["inflection of ban:","definite genitive/dative plural","vocative plural"]},{"word":"Bănișor","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Bănișor, Sălaj County, Romania"],"gender":"m"},{"word":"bănișor","pos":"noun","definitions":["diminutive of ban; small coin"],"forms":{"plural":"bănișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănișor","accusative-definite-nominative-singular":"bănișorul","accusative-indefinite-nominative-plural":"bănișori","accusative-definite-nominative-plural":"bănișorii","dative-genitive-indefinite-singular":"bănișor","dative-definite-genitive-singular":"bănișorului","dative-genitive-indefinite-plural":"bănișori","dative-definite-genitive-plural":"bănișorilor","singular-vocative":"bănișorule","plural-vocative":"bănișorilor"}},{"word":"Bănișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bănișteanu"}},{"word":"Banița","pos":"name","definitions":["a village in Săgeata, Buzău County, Romania"],"pronunciation":"[ˈba.nʲ.t͡sa]"},{"word":"Baniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baniță"}},{"word":"baniță","pos":"noun","definitions":["dry measure for cereals"],"forms":{"plural":"banițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baniță","accusative-definite-nominative-singular":"banița","accusative-indefinite-nominative-plural":"banițe","accusative-definite-nominative-plural":"banițele","dative-genitive-indefinite-singular":"banițe","dative-definite-genitive-singular":"baniței","dative-genitive-indefinite-plural":"banițe","dative-definite-genitive-plural":"banițelor","singular-vocative":"baniță","plural-vocative":"banițelor"}},{"word":"banjo","pos":"noun","definitions":["banjo"],"forms":{"plural":"banjouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"banjo","accusative-definite-nominative-singular":"banjoul","accusative-indefinite-nominative-plural":"banjouri","accusative-definite-nominative-plural":"banjourile","dative-genitive-indefinite-singular":"banjo","dative-definite-genitive-singular":"banjoului","dative-genitive-indefinite-plural":"banjouri","dative-definite-genitive-plural":"banjourilor","singular-vocative":"banjoule","plural-vocative":"banjourilor"}},{"word":"banking","pos":"noun","definitions":["banking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"banking","accusative-definite-nominative":"bankingul","dative-genitive-indefinite":"banking","dative-definite-genitive":"bankingului","vocative":"bankingule"}},{"word":"Banloc","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Banloc, Timiș County, Romania"],"gender":"m"},{"word":"banner","pos":"noun","definitions":["banner (for advertising)"],"forms":{"plural":"bannere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"banner","accusative-definite-nominative-singular":"bannerul","accusative-indefinite-nominative-plural":"bannere","accusative-definite-nominative-plural":"bannerele","dative-genitive-indefinite-singular":"banner","dative-definite-genitive-singular":"bannerului","dative-genitive-indefinite-plural":"bannere","dative-definite-genitive-plural":"bannerelor","singular-vocative":"bannerule","plural-vocative":"bannerelor"}},{"word":"bănos","pos":"adj","definitions":["lucrative"],"forms":{"feminine-singular":"bănoasă","masculine-plural":"bănoși","feminine-neuter-plural":"bănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănos","error-unrecognized-form-feminine-indefinite-singular":"bănoasă","error-unrecognized-form-indefinite-masculine-plural":"bănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănoase","definite-error-unrecognized-form-masculine-neuter-singular":"bănosul","definite-error-unrecognized-form-feminine-singular":"bănoasa","definite-error-unrecognized-form-masculine-plural":"bănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bănoasele"}},{"word":"Banov","pos":"name","definitions":["a village in Poeni, Teleorman County, Romania","a surname"],"gender":"m"},{"word":"Banpotoc","pos":"name","definitions":["a village in Hărău, Hunedoara County, Romania"],"gender":"m"},{"word":"Banta","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Banta"}},{"word":"băntălire","pos":"noun","definitions":["offence"],"forms":{"plural":"băntăliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"băntălire","accusative-definite-nominative-singular":"băntălirea","accusative-indefinite-nominative-plural":"băntăliri","accusative-definite-nominative-plural":"băntălirile","dative-genitive-indefinite-singular":"băntăliri","dative-definite-genitive-singular":"băntălirii","dative-genitive-indefinite-plural":"băntăliri","dative-definite-genitive-plural":"băntălirilor","singular-vocative":"băntălire","plural-vocative":"băntălirilor"}},{"word":"băntălit","pos":"adj","definitions":["offended"],"forms":{"feminine-singular":"băntălită","masculine-plural":"băntăliți","feminine-neuter-plural":"băntălite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băntălit","error-unrecognized-form-feminine-indefinite-singular":"băntălită","error-unrecognized-form-indefinite-masculine-plural":"băntăliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băntălite","definite-error-unrecognized-form-masculine-neuter-singular":"băntălitul","definite-error-unrecognized-form-feminine-singular":"băntălita","definite-error-unrecognized-form-masculine-plural":"băntăliții","definite-error-unrecognized-form-feminine-neuter-plural":"băntălitele"}},{"word":"băntălit","pos":"verb","definitions":["past participle of băntăli"],"forms":{"participle-past":"of băntăli"}},{"word":"Bănțești","pos":"name","definitions":["a village in Mădulari, Vâlcea County, Romania"],"gender":"m"},{"word":"bantoid","pos":"adj","definitions":["Bantoid"],"forms":{"feminine-singular":"bantoidă","masculine-plural":"bantoizi","feminine-neuter-plural":"bantoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bantoid","error-unrecognized-form-feminine-indefinite-singular":"bantoidă","error-unrecognized-form-indefinite-masculine-plural":"bantoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bantoide","definite-error-unrecognized-form-masculine-neuter-singular":"bantoidul","definite-error-unrecognized-form-feminine-singular":"bantoida","definite-error-unrecognized-form-masculine-plural":"bantoizii","definite-error-unrecognized-form-feminine-neuter-plural":"bantoidele"}},{"word":"bantu","pos":"noun","definitions":["Bantu"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bantu","accusative-definite-nominative":"bantul","dative-genitive-indefinite":"bantu","dative-definite-genitive":"bantului","vocative":"bantule"}},{"word":"bântui","pos":"verb","definitions":["to haunt"],"forms":{"canonical":"a bântui 4th conjugation","present-singular-third-person":"bântuie","participle-past":"bântuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bântui","gerund":"bântuind","first-person-indicative-present-singular":"bântui","indicative-present-second-person-singular":"bântui","indicative-present-singular-third-person":"bântuie","first-person-indicative-plural-present":"bântuim","indicative-plural-present-second-person":"bântuiți","indicative-plural-present-third-person":"bântuie","first-person-imperfect-indicative-singular":"bântuiam","imperfect-indicative-second-person-singular":"bântuiai","imperfect-indicative-singular-third-person":"bântuia","first-person-imperfect-indicative-plural":"bântuiam","imperfect-indicative-plural-second-person":"bântuiați","imperfect-indicative-plural-third-person":"bântuiau","first-person-indicative-perfect-singular":"bântuii","indicative-perfect-second-person-singular":"bântuiși","indicative-perfect-singular-third-person":"bântui","first-person-indicative-perfect-plural":"bântuirăm","indicative-perfect-plural-second-person":"bântuirăți","indicative-perfect-plural-third-person":"bântuiră","first-person-indicative-pluperfect-singular":"bântuisem","indicative-pluperfect-second-person-singular":"bântuiseși","indicative-pluperfect-singular-third-person":"bântuise","first-person-indicative-pluperfect-plural":"bântuiserăm","indicative-pluperfect-plural-second-person":"bântuiserăți","indicative-pluperfect-plural-third-person":"bântuiseră","first-person-present-singular-subjunctive":"să bântui","present-second-person-singular-subjunctive":"să bântui","present-singular-subjunctive-third-person":"să bântuie","first-person-plural-present-subjunctive":"să bântuim","plural-present-second-person-subjunctive":"să bântuiți","plural-present-subjunctive-third-person":"să bântuie","imperative-second-person-singular":"bântuie","imperative-plural-second-person":"bântuiți","imperative-negative-second-person-singular":"nu bântui","imperative-negative-plural-second-person":"nu bântuiți","alternative":"bîntui"}},{"word":"bântuială","pos":"noun","definitions":["grief, suffering"],"forms":{"plural":"băntuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bântuială","accusative-definite-nominative-singular":"bântuiala","accusative-indefinite-nominative-plural":"băntuiele","accusative-definite-nominative-plural":"băntuielele","dative-genitive-indefinite-singular":"băntuiele","dative-definite-genitive-singular":"băntuielei","dative-genitive-indefinite-plural":"băntuiele","dative-definite-genitive-plural":"băntuielelor","singular-vocative":"bântuială","plural-vocative":"băntuielelor","alternative":"bîntuială"}},{"word":"bântuire","pos":"noun","definitions":["haunting"],"forms":{"plural":"bântuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bântuire","accusative-definite-nominative-singular":"bântuirea","accusative-indefinite-nominative-plural":"bântuiri","accusative-definite-nominative-plural":"bântuirile","dative-genitive-indefinite-singular":"bântuiri","dative-definite-genitive-singular":"bântuirii","dative-genitive-indefinite-plural":"bântuiri","dative-definite-genitive-plural":"bântuirilor","singular-vocative":"bântuire","plural-vocative":"bântuirilor","alternative":"bîntuire"}},{"word":"bântuit","pos":"adj","definitions":["haunted"],"forms":{"feminine-singular":"bântuită","masculine-plural":"bântuiți","feminine-neuter-plural":"bântuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bântuit","error-unrecognized-form-feminine-indefinite-singular":"bântuită","error-unrecognized-form-indefinite-masculine-plural":"bântuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bântuite","definite-error-unrecognized-form-masculine-neuter-singular":"bântuitul","definite-error-unrecognized-form-feminine-singular":"bântuita","definite-error-unrecognized-form-masculine-plural":"bântuiții","definite-error-unrecognized-form-feminine-neuter-plural":"bântuitele","alternative":"bîntuit"}},{"word":"bântuit","pos":"verb","definitions":["past participle of bântui (“to haunt”)"],"forms":{"alternative":"bîntuit"}},{"word":"bântuitor","pos":"adj","definitions":["haunting"],"forms":{"feminine-singular":"bântuitoare","masculine-plural":"bântuitori","feminine-neuter-plural":"bântuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bântuitor","error-unrecognized-form-feminine-indefinite-singular":"bântuitoare","error-unrecognized-form-indefinite-masculine-plural":"bântuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bântuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bântuitorul","definite-error-unrecognized-form-feminine-singular":"bântuitoarea","definite-error-unrecognized-form-masculine-plural":"bântuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bântuitoarele","alternative":"bîntuitor"}},{"word":"bantustan","pos":"noun","definitions":["bantustan"],"forms":{"plural":"bantustane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bantustan","accusative-definite-nominative-singular":"bantustanul","accusative-indefinite-nominative-plural":"bantustane","accusative-definite-nominative-plural":"bantustanele","dative-genitive-indefinite-singular":"bantustan","dative-definite-genitive-singular":"bantustanului","dative-genitive-indefinite-plural":"bantustane","dative-definite-genitive-plural":"bantustanelor","singular-vocative":"bantustanule","plural-vocative":"bantustanelor"}},{"word":"bantustanizare","pos":"noun","definitions":["bantustanisation, turning into a bantustan"],"forms":{"plural":"bantustanizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bantustanizare","accusative-definite-nominative-singular":"bantustanizarea","accusative-indefinite-nominative-plural":"bantustanizări","accusative-definite-nominative-plural":"bantustanizările","dative-genitive-indefinite-singular":"bantustanizări","dative-definite-genitive-singular":"bantustanizării","dative-genitive-indefinite-plural":"bantustanizări","dative-definite-genitive-plural":"bantustanizărilor","singular-vocative":"bantustanizare","plural-vocative":"bantustanizărilor"}},{"word":"Banu","pos":"name","definitions":["a village in Dumești, Iași County, Romania"],"gender":"m"},{"word":"Bănucu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănucu"}}];
@@ -0,0 +1 @@
+export default [{"word":"bănui","pos":"verb","definitions":["to suppose, to presume, to guess, to suspect","to suspect someone"],"pronunciation":"/bə.nuˈi/","examples":[{"ro":"Bănuiesc că o să întârziem.","en":"I guess we're going to be late."}],"forms":{"canonical":"a bănui 4th conjugation","present-singular-third-person":"bănuiește","participle-past":"bănuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bănui","gerund":"bănuind","first-person-indicative-present-singular":"bănuiesc","indicative-present-second-person-singular":"bănuiești","indicative-present-singular-third-person":"bănuiește","first-person-indicative-plural-present":"bănuim","indicative-plural-present-second-person":"bănuiți","indicative-plural-present-third-person":"bănuiesc","first-person-imperfect-indicative-singular":"bănuiam","imperfect-indicative-second-person-singular":"bănuiai","imperfect-indicative-singular-third-person":"bănuia","first-person-imperfect-indicative-plural":"bănuiam","imperfect-indicative-plural-second-person":"bănuiați","imperfect-indicative-plural-third-person":"bănuiau","first-person-indicative-perfect-singular":"bănuii","indicative-perfect-second-person-singular":"bănuiși","indicative-perfect-singular-third-person":"bănui","first-person-indicative-perfect-plural":"bănuirăm","indicative-perfect-plural-second-person":"bănuirăți","indicative-perfect-plural-third-person":"bănuiră","first-person-indicative-pluperfect-singular":"bănuisem","indicative-pluperfect-second-person-singular":"bănuiseși","indicative-pluperfect-singular-third-person":"bănuise","first-person-indicative-pluperfect-plural":"bănuiserăm","indicative-pluperfect-plural-second-person":"bănuiserăți","indicative-pluperfect-plural-third-person":"bănuiseră","first-person-present-singular-subjunctive":"să bănuiesc","present-second-person-singular-subjunctive":"să bănuiești","present-singular-subjunctive-third-person":"să bănuiască","first-person-plural-present-subjunctive":"să bănuim","plural-present-second-person-subjunctive":"să bănuiți","plural-present-subjunctive-third-person":"să bănuiască","imperative-second-person-singular":"bănuiește","imperative-plural-second-person":"bănuiți","imperative-negative-second-person-singular":"nu bănui","imperative-negative-plural-second-person":"nu bănuiți"}},{"word":"bănuială","pos":"noun","definitions":["suspicion"],"pronunciation":"/bə.nuˈja.lə/","forms":{"plural":"bănuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bănuială","accusative-definite-nominative-singular":"bănuiala","accusative-indefinite-nominative-plural":"bănuieli","accusative-definite-nominative-plural":"bănuielile","dative-genitive-indefinite-singular":"bănuieli","dative-definite-genitive-singular":"bănuielii","dative-genitive-indefinite-plural":"bănuieli","dative-definite-genitive-plural":"bănuielilor","singular-vocative":"bănuială","plural-vocative":"bănuielilor"}},{"word":"bănuielnic","pos":"adj","definitions":["suspicious"],"forms":{"feminine-singular":"bănuielnică","masculine-plural":"bănuielnici","feminine-neuter-plural":"bănuielnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănuielnic","error-unrecognized-form-feminine-indefinite-singular":"bănuielnică","error-unrecognized-form-indefinite-masculine-plural":"bănuielnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănuielnice","definite-error-unrecognized-form-masculine-neuter-singular":"bănuielnicul","definite-error-unrecognized-form-feminine-singular":"bănuielnica","definite-error-unrecognized-form-masculine-plural":"bănuielnicii","definite-error-unrecognized-form-feminine-neuter-plural":"bănuielnicele"}},{"word":"bănuire","pos":"noun","definitions":["supposition"],"forms":{"plural":"bănuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bănuire","accusative-definite-nominative-singular":"bănuirea","accusative-indefinite-nominative-plural":"bănuiri","accusative-definite-nominative-plural":"bănuirile","dative-genitive-indefinite-singular":"bănuiri","dative-definite-genitive-singular":"bănuirii","dative-genitive-indefinite-plural":"bănuiri","dative-definite-genitive-plural":"bănuirilor","singular-vocative":"bănuire","plural-vocative":"bănuirilor"}},{"word":"bănuit","pos":"adj","definitions":["suspect"],"forms":{"feminine-singular":"bănuită","masculine-plural":"bănuiți","feminine-neuter-plural":"bănuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănuit","error-unrecognized-form-feminine-indefinite-singular":"bănuită","error-unrecognized-form-indefinite-masculine-plural":"bănuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănuite","definite-error-unrecognized-form-masculine-neuter-singular":"bănuitul","definite-error-unrecognized-form-feminine-singular":"bănuita","definite-error-unrecognized-form-masculine-plural":"bănuiții","definite-error-unrecognized-form-feminine-neuter-plural":"bănuitele"}},{"word":"bănuit","pos":"noun","definitions":["suspect"],"forms":{"plural":"bănuiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănuit","accusative-definite-nominative-singular":"bănuitul","accusative-indefinite-nominative-plural":"bănuiți","accusative-definite-nominative-plural":"bănuiții","dative-genitive-indefinite-singular":"bănuit","dative-definite-genitive-singular":"bănuitului","dative-genitive-indefinite-plural":"bănuiți","dative-definite-genitive-plural":"bănuiților","singular-vocative":"bănuitule","plural-vocative":"bănuiților"}},{"word":"bănuită","pos":"noun","definitions":["female equivalent of bănuit"],"forms":{"plural":"bănuite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bănuită","accusative-definite-nominative-singular":"bănuita","accusative-indefinite-nominative-plural":"bănuite","accusative-definite-nominative-plural":"bănuitele","dative-genitive-indefinite-singular":"bănuite","dative-definite-genitive-singular":"bănuitei","dative-genitive-indefinite-plural":"bănuite","dative-definite-genitive-plural":"bănuitelor","singular-vocative":"bănuită","plural-vocative":"bănuitelor"}},{"word":"bănuitor","pos":"adj","definitions":["suspicious"],"forms":{"feminine-singular":"bănuitoare","masculine-plural":"bănuitori","feminine-neuter-plural":"bănuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bănuitor","error-unrecognized-form-feminine-indefinite-singular":"bănuitoare","error-unrecognized-form-indefinite-masculine-plural":"bănuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bănuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bănuitorul","definite-error-unrecognized-form-feminine-singular":"bănuitoarea","definite-error-unrecognized-form-masculine-plural":"bănuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bănuitoarele"}},{"word":"banul","pos":"noun","definitions":["definite nominative/accusative singular of ban"],"gender":"m"},{"word":"banul este ochiul dracului","pos":"proverb","definitions":["money is the root of all evil"]},{"word":"Bănulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bănulescu"}},{"word":"bănuleț","pos":"noun","definitions":["diminutive of ban"],"forms":{"plural":"bănuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănuleț","accusative-definite-nominative-singular":"bănulețul","accusative-indefinite-nominative-plural":"bănuleți","accusative-definite-nominative-plural":"bănuleții","dative-genitive-indefinite-singular":"bănuleț","dative-definite-genitive-singular":"bănulețului","dative-genitive-indefinite-plural":"bănuleți","dative-definite-genitive-plural":"bănuleților","singular-vocative":"bănulețule","plural-vocative":"bănuleților"}},{"word":"banului","pos":"noun","definitions":["definite genitive/dative singular of ban"],"gender":"m"},{"word":"Banuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Banuș"}},{"word":"Bănuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănuș"}},{"word":"Bănuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănuț"}},{"word":"bănuț","pos":"noun","definitions":["diminutive of ban; small coin","daisy (Bellis perennis)"],"forms":{"plural":"bănuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănuț","accusative-definite-nominative-singular":"bănuțul","accusative-indefinite-nominative-plural":"bănuți","accusative-definite-nominative-plural":"bănuții","dative-genitive-indefinite-singular":"bănuț","dative-definite-genitive-singular":"bănuțului","dative-genitive-indefinite-plural":"bănuți","dative-definite-genitive-plural":"bănuților","singular-vocative":"bănuțule","plural-vocative":"bănuților"}},{"word":"bănuțel","pos":"noun","definitions":["daisy (Bellis perennis)"],"forms":{"plural":"bănuței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bănuțel","accusative-definite-nominative-singular":"bănuțelul","accusative-indefinite-nominative-plural":"bănuței","accusative-definite-nominative-plural":"bănuțeii","dative-genitive-indefinite-singular":"bănuțel","dative-definite-genitive-singular":"bănuțelului","dative-genitive-indefinite-plural":"bănuței","dative-definite-genitive-plural":"bănuțeilor","singular-vocative":"bănuțelule","plural-vocative":"bănuțeilor"}},{"word":"Bănuțoiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bănuțoiu"}},{"word":"bânzoi","pos":"noun","definitions":["bumblebee"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bânzoi","accusative-definite-nominative":"bânzoiul","dative-genitive-indefinite":"bânzoi","dative-definite-genitive":"bânzoiului","vocative":"bânzoiule","alternative":"bînzoi"}},{"word":"baobab","pos":"noun","definitions":["baobab, monkey bread"],"forms":{"plural":"baobabi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baobab","accusative-definite-nominative-singular":"baobabul","accusative-indefinite-nominative-plural":"baobabi","accusative-definite-nominative-plural":"baobabii","dative-genitive-indefinite-singular":"baobab","dative-definite-genitive-singular":"baobabului","dative-genitive-indefinite-plural":"baobabi","dative-definite-genitive-plural":"baobabilor","singular-vocative":"baobabule","plural-vocative":"baobabilor"}},{"word":"baptism","pos":"noun","definitions":["a Baptist denomination"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"baptism","accusative-definite-nominative":"baptismul","dative-genitive-indefinite":"baptism","dative-definite-genitive":"baptismului","vocative":"baptismule"}},{"word":"baptist","pos":"noun","definitions":["Baptist"],"forms":{"plural":"baptiști","feminine":"equivalent baptistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baptist","accusative-definite-nominative-singular":"baptistul","accusative-indefinite-nominative-plural":"baptiști","accusative-definite-nominative-plural":"baptiștii","dative-genitive-indefinite-singular":"baptist","dative-definite-genitive-singular":"baptistului","dative-genitive-indefinite-plural":"baptiști","dative-definite-genitive-plural":"baptiștilor","singular-vocative":"baptistule","plural-vocative":"baptiștilor"}},{"word":"baptistă","pos":"noun","definitions":["female equivalent of baptist"],"forms":{"plural":"baptiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baptistă","accusative-definite-nominative-singular":"baptista","accusative-indefinite-nominative-plural":"baptiste","accusative-definite-nominative-plural":"baptistele","dative-genitive-indefinite-singular":"baptiste","dative-definite-genitive-singular":"baptistei","dative-genitive-indefinite-plural":"baptiste","dative-definite-genitive-plural":"baptistelor","singular-vocative":"baptistă","plural-vocative":"baptistelor"}},{"word":"baptisteriu","pos":"noun","definitions":["font"],"forms":{"plural":"baptisterii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baptisteriu","accusative-definite-nominative-singular":"baptisteriul","accusative-indefinite-nominative-plural":"baptisterii","accusative-definite-nominative-plural":"baptisteriile","dative-genitive-indefinite-singular":"baptisteriu","dative-definite-genitive-singular":"baptisteriului","dative-genitive-indefinite-plural":"baptisterii","dative-definite-genitive-plural":"baptisteriilor","singular-vocative":"baptisteriule","plural-vocative":"baptisteriilor"}},{"word":"bar","pos":"noun","definitions":["bar (establishment)"],"forms":{"plural":"bari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bar","accusative-definite-nominative-singular":"barul","accusative-indefinite-nominative-plural":"bari","accusative-definite-nominative-plural":"barii","dative-genitive-indefinite-singular":"bar","dative-definite-genitive-singular":"barului","dative-genitive-indefinite-plural":"bari","dative-definite-genitive-plural":"barilor","singular-vocative":"barule","plural-vocative":"barilor"}},{"word":"Bara","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Bara, Timiș County, Romania"],"gender":"f"},{"word":"bara","pos":"verb","definitions":["to bar, to block","to strike through"],"pronunciation":"/baˈra/","forms":{"canonical":"a bara 1st conjugation","present-singular-third-person":"barează","participle-past":"barat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bara","gerund":"barând","first-person-indicative-present-singular":"barez","indicative-present-second-person-singular":"barezi","indicative-present-singular-third-person":"barează","first-person-indicative-plural-present":"barăm","indicative-plural-present-second-person":"barați","indicative-plural-present-third-person":"barează","first-person-imperfect-indicative-singular":"baram","imperfect-indicative-second-person-singular":"barai","imperfect-indicative-singular-third-person":"bara","first-person-imperfect-indicative-plural":"baram","imperfect-indicative-plural-second-person":"barați","imperfect-indicative-plural-third-person":"barau","first-person-indicative-perfect-singular":"barai","indicative-perfect-second-person-singular":"barași","indicative-perfect-singular-third-person":"bară","first-person-indicative-perfect-plural":"bararăm","indicative-perfect-plural-second-person":"bararăți","indicative-perfect-plural-third-person":"barară","first-person-indicative-pluperfect-singular":"barasem","indicative-pluperfect-second-person-singular":"baraseși","indicative-pluperfect-singular-third-person":"barase","first-person-indicative-pluperfect-plural":"baraserăm","indicative-pluperfect-plural-second-person":"baraserăți","indicative-pluperfect-plural-third-person":"baraseră","first-person-present-singular-subjunctive":"să barez","present-second-person-singular-subjunctive":"să barezi","present-singular-subjunctive-third-person":"să bareze","first-person-plural-present-subjunctive":"să barăm","plural-present-second-person-subjunctive":"să barați","plural-present-subjunctive-third-person":"să bareze","imperative-second-person-singular":"barează","imperative-plural-second-person":"barați","imperative-negative-second-person-singular":"nu bara","imperative-negative-plural-second-person":"nu barați"}},{"word":"bară","pos":"noun","definitions":["bar"],"forms":{"plural":"bare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bară","accusative-definite-nominative-singular":"bara","accusative-indefinite-nominative-plural":"bare","accusative-definite-nominative-plural":"barele","dative-genitive-indefinite-singular":"bare","dative-definite-genitive-singular":"barei","dative-genitive-indefinite-plural":"bare","dative-definite-genitive-plural":"barelor","singular-vocative":"bară","plural-vocative":"barelor"}},{"word":"bară fixă","pos":"noun","definitions":["horizontal bar"],"forms":{"plural":"bare fixe"}},{"word":"bară oblică","pos":"noun","definitions":["forward slash ('/' symbol)"],"forms":{"plural":"bare oblice"}},{"word":"bară oblică inversă","pos":"noun","definitions":["backslash ⟨\\⟩"],"forms":{"plural":"bare oblice inverse"}},{"word":"barabă","pos":"noun","definitions":["thief"],"forms":{"plural":"barabe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barabă","accusative-definite-nominative-singular":"baraba","accusative-indefinite-nominative-plural":"barabe","accusative-definite-nominative-plural":"barabele","dative-genitive-indefinite-singular":"barabe","dative-definite-genitive-singular":"barabei","dative-genitive-indefinite-plural":"barabe","dative-definite-genitive-plural":"barabelor","singular-vocative":"barabă","plural-vocative":"barabelor"}},{"word":"Bărăbanț","pos":"name","definitions":["a locality in Alba Iulia, Alba County, Romania"],"gender":"m"},{"word":"Barabas","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Barabas"}},{"word":"Barabaș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Barabaș"}},{"word":"Baraboi","pos":"name","definitions":["a village in Baraboi, Dondușeni Raion, Moldova","a commune of Dondușeni Raion, Moldova"],"gender":"m"},{"word":"baraboi","pos":"noun","definitions":["turnip rooted chervil (Chaerophyllum bulbosum)"],"forms":{"plural":"baraboi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baraboi","accusative-definite-nominative-singular":"baraboiul","accusative-indefinite-nominative-plural":"baraboi","accusative-definite-nominative-plural":"baraboii","dative-genitive-indefinite-singular":"baraboi","dative-definite-genitive-singular":"baraboiului","dative-genitive-indefinite-plural":"baraboi","dative-definite-genitive-plural":"baraboilor","singular-vocative":"baraboiule","plural-vocative":"baraboilor"}},{"word":"baraboiște","pos":"noun","definitions":["potato field"],"forms":{"plural":"baraboiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"baraboiște","accusative-definite-nominative-singular":"baraboiștea","accusative-indefinite-nominative-plural":"baraboiști","accusative-definite-nominative-plural":"baraboiștile","dative-genitive-indefinite-singular":"baraboiști","dative-definite-genitive-singular":"baraboiștii","dative-genitive-indefinite-plural":"baraboiști","dative-definite-genitive-plural":"baraboiștilor","singular-vocative":"baraboiște","plural-vocative":"baraboiștilor"}},{"word":"baraboiștină","pos":"noun","definitions":["potato field"],"forms":{"plural":"baraboiștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baraboiștină","accusative-definite-nominative-singular":"baraboiștina","accusative-indefinite-nominative-plural":"baraboiștine","accusative-definite-nominative-plural":"baraboiștinele","dative-genitive-indefinite-singular":"baraboiștine","dative-definite-genitive-singular":"baraboiștinei","dative-genitive-indefinite-plural":"baraboiștine","dative-definite-genitive-plural":"baraboiștinelor","singular-vocative":"baraboiștină","plural-vocative":"baraboiștinelor"}},{"word":"Barabulă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barabulă"}},{"word":"barabulă","pos":"noun","definitions":["potato","a big nose"],"pronunciation":"/ˌbaraˈbulə/","forms":{"plural":"barabule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barabulă","accusative-definite-nominative-singular":"barabula","accusative-indefinite-nominative-plural":"barabule","accusative-definite-nominative-plural":"barabulele","dative-genitive-indefinite-singular":"barabule","dative-definite-genitive-singular":"barabulei","dative-genitive-indefinite-plural":"barabule","dative-definite-genitive-plural":"barabulelor","singular-vocative":"barabulă","plural-vocative":"barabulelor"}},{"word":"barabuliște","pos":"noun","definitions":["potato field"],"forms":{"plural":"barabuliști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"barabuliște","accusative-definite-nominative-singular":"barabuliștea","accusative-indefinite-nominative-plural":"barabuliști","accusative-definite-nominative-plural":"barabuliștile","dative-genitive-indefinite-singular":"barabuliști","dative-definite-genitive-singular":"barabuliștii","dative-genitive-indefinite-plural":"barabuliști","dative-definite-genitive-plural":"barabuliștilor","singular-vocative":"barabuliște","plural-vocative":"barabuliștilor"}},{"word":"barabușcă","pos":"noun","definitions":["potato"],"forms":{"plural":"barabuște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barabușcă","accusative-definite-nominative-singular":"barabușca","accusative-indefinite-nominative-plural":"barabuște","accusative-definite-nominative-plural":"barabuștele","dative-genitive-indefinite-singular":"barabuște","dative-definite-genitive-singular":"barabuștei","dative-genitive-indefinite-plural":"barabuște","dative-definite-genitive-plural":"barabuștelor","singular-vocative":"barabușcă","plural-vocative":"barabuștelor"}},{"word":"Baracă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baracă"}},{"word":"baracă","pos":"noun","definitions":["shed"],"forms":{"plural":"barăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baracă","accusative-definite-nominative-singular":"baraca","accusative-indefinite-nominative-plural":"barăce","accusative-definite-nominative-plural":"barăcele","dative-genitive-indefinite-singular":"barăce","dative-definite-genitive-singular":"barăcei","dative-genitive-indefinite-plural":"barăce","dative-definite-genitive-plural":"barăcelor","singular-vocative":"baracă","plural-vocative":"barăcelor"}},{"word":"baracament","pos":"noun","definitions":["encampment, camp"],"forms":{"plural":"baracamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baracament","accusative-definite-nominative-singular":"baracamentul","accusative-indefinite-nominative-plural":"baracamente","accusative-definite-nominative-plural":"baracamentele","dative-genitive-indefinite-singular":"baracament","dative-definite-genitive-singular":"baracamentului","dative-genitive-indefinite-plural":"baracamente","dative-definite-genitive-plural":"baracamentelor","singular-vocative":"baracamentule","plural-vocative":"baracamentelor"}},{"word":"Bărăceni","pos":"name","definitions":["a village in Corbii Mari, Dâmbovița County, Romania"],"gender":"m"},{"word":"bărăciune","pos":"noun","definitions":["pond, swamp"],"forms":{"plural":"bărăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bărăciune","accusative-definite-nominative-singular":"bărăciunea","accusative-indefinite-nominative-plural":"bărăciuni","accusative-definite-nominative-plural":"bărăciunile","dative-genitive-indefinite-singular":"bărăciuni","dative-definite-genitive-singular":"bărăciunii","dative-genitive-indefinite-plural":"bărăciuni","dative-definite-genitive-plural":"bărăciunilor","singular-vocative":"bărăciune","plural-vocative":"bărăciunilor"}},{"word":"baracudă mare","pos":"noun","definitions":["great barracuda (Sphyraena barracuda)"],"forms":{"plural":"baracude mari"}},{"word":"bărăcuță","pos":"noun","definitions":["diminutive of baracă"],"forms":{"plural":"bărăcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărăcuță","accusative-definite-nominative-singular":"bărăcuța","accusative-indefinite-nominative-plural":"bărăcuțe","accusative-definite-nominative-plural":"bărăcuțele","dative-genitive-indefinite-singular":"bărăcuțe","dative-definite-genitive-singular":"bărăcuței","dative-genitive-indefinite-plural":"bărăcuțe","dative-definite-genitive-plural":"bărăcuțelor","singular-vocative":"bărăcuță","plural-vocative":"bărăcuțelor"}},{"word":"bărăgan","pos":"noun","definitions":["steppe"],"forms":{"plural":"bărăganuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bărăgan","accusative-definite-nominative-singular":"bărăganul","accusative-indefinite-nominative-plural":"bărăganuri","accusative-definite-nominative-plural":"bărăganurile","dative-genitive-indefinite-singular":"bărăgan","dative-definite-genitive-singular":"bărăganului","dative-genitive-indefinite-plural":"bărăganuri","dative-definite-genitive-plural":"bărăganurilor","singular-vocative":"bărăganule","plural-vocative":"bărăganurilor"}},{"word":"Bărăgănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărăgănescu"}},{"word":"Bărăganu","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Bărăganu, Constanța County, Romania"],"gender":"m"},{"word":"Bărăganul","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Bărăganul, Brăila County, Romania"],"gender":"m"},{"word":"baragladină","pos":"noun","definitions":["Gypsy, Roma"],"forms":{"plural":"bargladine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baragladină","accusative-definite-nominative-singular":"baragladina","accusative-indefinite-nominative-plural":"bargladine","accusative-definite-nominative-plural":"bargladinele","dative-genitive-indefinite-singular":"bargladine","dative-definite-genitive-singular":"bargladinei","dative-genitive-indefinite-plural":"bargladine","dative-definite-genitive-plural":"bargladinelor","singular-vocative":"baragladină","plural-vocative":"bargladinelor"}},{"word":"barai","pos":"verb","definitions":["inflection of bara:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[baˈraj]"},{"word":"bârâi","pos":"verb","definitions":["to nag"],"forms":{"canonical":"a bârâi 4th conjugation","present-singular-third-person":"bârâie","participle-past":"bârâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bârâi","gerund":"bârâind","first-person-indicative-present-singular":"bârâi","indicative-present-second-person-singular":"bârâi","indicative-present-singular-third-person":"bârâie","first-person-indicative-plural-present":"bârâim","indicative-plural-present-second-person":"bârâiți","indicative-plural-present-third-person":"bârâie","first-person-imperfect-indicative-singular":"bârâiam","imperfect-indicative-second-person-singular":"bârâiai","imperfect-indicative-singular-third-person":"bârâia","first-person-imperfect-indicative-plural":"bârâiam","imperfect-indicative-plural-second-person":"bârâiați","imperfect-indicative-plural-third-person":"bârâiau","first-person-indicative-perfect-singular":"bârâii","indicative-perfect-second-person-singular":"bârâiși","indicative-perfect-singular-third-person":"bârâi","first-person-indicative-perfect-plural":"bârâirăm","indicative-perfect-plural-second-person":"bârâirăți","indicative-perfect-plural-third-person":"bârâiră","first-person-indicative-pluperfect-singular":"bârâisem","indicative-pluperfect-second-person-singular":"bârâiseși","indicative-pluperfect-singular-third-person":"bârâise","first-person-indicative-pluperfect-plural":"bârâiserăm","indicative-pluperfect-plural-second-person":"bârâiserăți","indicative-pluperfect-plural-third-person":"bârâiseră","first-person-present-singular-subjunctive":"să bârâi","present-second-person-singular-subjunctive":"să bârâi","present-singular-subjunctive-third-person":"să bârâie","first-person-plural-present-subjunctive":"să bârâim","plural-present-second-person-subjunctive":"să bârâiți","plural-present-subjunctive-third-person":"să bârâie","imperative-second-person-singular":"bârâie","imperative-plural-second-person":"bârâiți","imperative-negative-second-person-singular":"nu bârâi","imperative-negative-plural-second-person":"nu bârâiți","alternative":"bîrîi"}},{"word":"Bărăitaru","pos":"name","definitions":["a village in Drăgănești, Prahova County, Romania"],"gender":"m"},{"word":"baraj","pos":"noun","definitions":["dam, barrage"],"pronunciation":"/baˈraʒ/","forms":{"plural":"baraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baraj","accusative-definite-nominative-singular":"barajul","accusative-indefinite-nominative-plural":"baraje","accusative-definite-nominative-plural":"barajele","dative-genitive-indefinite-singular":"baraj","dative-definite-genitive-singular":"barajului","dative-genitive-indefinite-plural":"baraje","dative-definite-genitive-plural":"barajelor","singular-vocative":"barajule","plural-vocative":"barajelor","alternative":"бараж"}},{"word":"baram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of bara"],"pronunciation":"[baˈram]"},{"word":"baramoiu","pos":"noun","definitions":["party, feast, celebration"],"forms":{"plural":"baramoiuuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"baramoiu","accusative-definite-nominative-singular":"baramoiuul","accusative-indefinite-nominative-plural":"baramoiuuri","accusative-definite-nominative-plural":"baramoiuurile","dative-genitive-indefinite-singular":"baramoiu","dative-definite-genitive-singular":"baramoiuului","dative-genitive-indefinite-plural":"baramoiuuri","dative-definite-genitive-plural":"baramoiuurilor","singular-vocative":"baramoiuule","plural-vocative":"baramoiuurilor"}},{"word":"Bărănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărănescu"}},{"word":"Bărănești","pos":"name","definitions":["a village in Uda, Argeș County, Romania"],"gender":"m"},{"word":"Baranga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baranga"}},{"word":"Barangă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barangă"}},{"word":"bărăni","pos":"verb","definitions":["to insist"],"forms":{"canonical":"a bărăni 4th conjugation","present-singular-third-person":"bărănește","participle-past":"bărănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bărăni","gerund":"bărănind","first-person-indicative-present-singular":"bărănesc","indicative-present-second-person-singular":"bărănești","indicative-present-singular-third-person":"bărănește","first-person-indicative-plural-present":"bărănim","indicative-plural-present-second-person":"bărăniți","indicative-plural-present-third-person":"bărănesc","first-person-imperfect-indicative-singular":"bărăneam","imperfect-indicative-second-person-singular":"bărăneai","imperfect-indicative-singular-third-person":"bărănea","first-person-imperfect-indicative-plural":"bărăneam","imperfect-indicative-plural-second-person":"bărăneați","imperfect-indicative-plural-third-person":"bărăneau","first-person-indicative-perfect-singular":"bărănii","indicative-perfect-second-person-singular":"bărăniși","indicative-perfect-singular-third-person":"bărăni","first-person-indicative-perfect-plural":"bărănirăm","indicative-perfect-plural-second-person":"bărănirăți","indicative-perfect-plural-third-person":"bărăniră","first-person-indicative-pluperfect-singular":"bărănisem","indicative-pluperfect-second-person-singular":"bărăniseși","indicative-pluperfect-singular-third-person":"bărănise","first-person-indicative-pluperfect-plural":"bărăniserăm","indicative-pluperfect-plural-second-person":"bărăniserăți","indicative-pluperfect-plural-third-person":"bărăniseră","first-person-present-singular-subjunctive":"să bărănesc","present-second-person-singular-subjunctive":"să bărănești","present-singular-subjunctive-third-person":"să bărănească","first-person-plural-present-subjunctive":"să bărănim","plural-present-second-person-subjunctive":"să bărăniți","plural-present-subjunctive-third-person":"să bărănească","imperative-second-person-singular":"bărănește","imperative-plural-second-person":"bărăniți","imperative-negative-second-person-singular":"nu bărăni","imperative-negative-plural-second-person":"nu bărăniți"}},{"word":"Baraolt","pos":"name","definitions":["a city in Covasna County, Romania"],"gender":"m"},{"word":"Bărăști","pos":"name","definitions":["a village in Albac, Alba County, Romania","a village in Cicănești, Argeș County, Romania","a village in Cislău, Buzău County, Romania","a commune of Olt County, Romania","a village in Colonești, Olt County, Romania"],"gender":"m"},{"word":"Bărăștii de Cepturi","pos":"name","definitions":["a village in Bărăști, Olt County, Romania"],"gender":"m"},{"word":"Bărăștii de Vede","pos":"name","definitions":["a village in Bărăști, Olt County, Romania"],"gender":"m"},{"word":"Bărăștii Hațegului","pos":"name","definitions":["a village in Sântămăria-Orlea, Hunedoara County, Romania"],"gender":"m"},{"word":"Bărăștii Iliei","pos":"name","definitions":["a village in Brănișca, Hunedoara County, Romania"],"gender":"m"},{"word":"barat","pos":"adj","definitions":["barred"],"pronunciation":"[baˈrat]","forms":{"feminine-singular":"barată","masculine-plural":"barați","feminine-neuter-plural":"barate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"barat","error-unrecognized-form-feminine-indefinite-singular":"barată","error-unrecognized-form-indefinite-masculine-plural":"barați","error-unrecognized-form-feminine-indefinite-neuter-plural":"barate","definite-error-unrecognized-form-masculine-neuter-singular":"baratul","definite-error-unrecognized-form-feminine-singular":"barata","definite-error-unrecognized-form-masculine-plural":"barații","definite-error-unrecognized-form-feminine-neuter-plural":"baratele"}},{"word":"barat","pos":"verb","definitions":["past participle of bara"],"pronunciation":"[baˈrat]"},{"word":"bărat","pos":"noun","definitions":["Catholic monk or priest"],"forms":{"plural":"bărați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărat","accusative-definite-nominative-singular":"băratul","accusative-indefinite-nominative-plural":"bărați","accusative-definite-nominative-plural":"bărații","dative-genitive-indefinite-singular":"bărat","dative-definite-genitive-singular":"băratului","dative-genitive-indefinite-plural":"bărați","dative-definite-genitive-plural":"băraților","singular-vocative":"băratule","plural-vocative":"băraților"}},{"word":"Baratca","pos":"name","definitions":["a village in Bârgăuani, Neamț County, Romania"],"gender":"f"},{"word":"baratcă","pos":"noun","definitions":["alternative form of baracă"],"forms":{"plural":"baratci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"baratcă","accusative-definite-nominative-singular":"baratca","accusative-indefinite-nominative-plural":"baratci","accusative-definite-nominative-plural":"baratcile","dative-genitive-indefinite-singular":"baratci","dative-definite-genitive-singular":"baratcii","dative-genitive-indefinite-plural":"baratci","dative-definite-genitive-plural":"baratcilor","singular-vocative":"baratcă","plural-vocative":"baratcilor"}},{"word":"Barațca","pos":"name","definitions":["a village in Păuliș, Arad County, Romania"],"gender":"f"},{"word":"Barațcoș","pos":"name","definitions":["a village in Lunca de Jos, Harghita County, Romania"],"gender":"m"},{"word":"Bărăteaz","pos":"name","definitions":["a village in Satchinez, Timiș County, Romania"],"gender":"m"},{"word":"baraterie","pos":"noun","definitions":["embezzlement by the captain of a watercraft"],"forms":{"plural":"baraterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"baraterie","accusative-definite-nominative-singular":"barateria","accusative-indefinite-nominative-plural":"baraterii","accusative-definite-nominative-plural":"barateriile","dative-genitive-indefinite-singular":"baraterii","dative-definite-genitive-singular":"barateriei","dative-genitive-indefinite-plural":"baraterii","dative-definite-genitive-plural":"barateriilor","singular-vocative":"baraterie","plural-vocative":"barateriilor"}},{"word":"bărateș","pos":"noun","definitions":["comrade"],"forms":{"plural":"bărateși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărateș","accusative-definite-nominative-singular":"bărateșul","accusative-indefinite-nominative-plural":"bărateși","accusative-definite-nominative-plural":"bărateșii","dative-genitive-indefinite-singular":"bărateș","dative-definite-genitive-singular":"bărateșului","dative-genitive-indefinite-plural":"bărateși","dative-definite-genitive-plural":"bărateșilor","singular-vocative":"bărateșule","plural-vocative":"bărateșilor"}},{"word":"Barați","pos":"name","definitions":["a village in Mărgineni, Bacău County, Romania"],"gender":"m"},{"word":"bărăție","pos":"noun","definitions":["Catholic monastery"],"forms":{"plural":"bărății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bărăție","accusative-definite-nominative-singular":"bărăția","accusative-indefinite-nominative-plural":"bărății","accusative-definite-nominative-plural":"bărățiile","dative-genitive-indefinite-singular":"bărății","dative-definite-genitive-singular":"bărăției","dative-genitive-indefinite-plural":"bărății","dative-definite-genitive-plural":"bărățiilor","singular-vocative":"bărăție","plural-vocative":"bărățiilor"}},{"word":"barba","pos":"noun","definitions":["definite nominative/accusative singular of barbă"],"pronunciation":"[ˈbarba]","gender":"f"},{"word":"Barbă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbă"}},{"word":"barbă","pos":"noun","definitions":["beard","chin"],"pronunciation":"/ˈbaɾ.bə/","forms":{"plural":"bărbi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"barbă","accusative-definite-nominative-singular":"barba","accusative-indefinite-nominative-plural":"bărbi","accusative-definite-nominative-plural":"bărbile","dative-genitive-indefinite-singular":"bărbi","dative-definite-genitive-singular":"bărbii","dative-genitive-indefinite-plural":"bărbi","dative-definite-genitive-plural":"bărbilor","singular-vocative":"barbă","plural-vocative":"bărbilor"}},{"word":"Barbă Albastră","pos":"name","definitions":["Bluebeard"],"gender":"m"},{"word":"barba caprei","pos":"noun","definitions":["yellow stagshorn (Calocera viscosa)"]},{"word":"barba împăratului","pos":"noun","definitions":["marvel of Peru (Mirabilis jalapa)"]},{"word":"barba-ursului","pos":"noun","definitions":["horsetail"]},{"word":"barbacană","pos":"noun","definitions":["barbican"],"forms":{"plural":"barbacane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbacană","accusative-definite-nominative-singular":"barbacana","accusative-indefinite-nominative-plural":"barbacane","accusative-definite-nominative-plural":"barbacanele","dative-genitive-indefinite-singular":"barbacane","dative-definite-genitive-singular":"barbacanei","dative-genitive-indefinite-plural":"barbacane","dative-definite-genitive-plural":"barbacanelor","singular-vocative":"barbacană","plural-vocative":"barbacanelor"}},{"word":"Bărbăcaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bărbăcaru"}},{"word":"Bărbăcioru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbăcioru"}},{"word":"bărbăcuț","pos":"noun","definitions":["alternative form of berbecuț"],"forms":{"plural":"bărbăcuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbăcuț","accusative-definite-nominative-singular":"bărbăcuțul","accusative-indefinite-nominative-plural":"bărbăcuți","accusative-definite-nominative-plural":"bărbăcuții","dative-genitive-indefinite-singular":"bărbăcuț","dative-definite-genitive-singular":"bărbăcuțului","dative-genitive-indefinite-plural":"bărbăcuți","dative-definite-genitive-plural":"bărbăcuților","singular-vocative":"bărbăcuțule","plural-vocative":"bărbăcuților"}},{"word":"Barbados","pos":"name","definitions":["Barbados (an island and country in the Caribbean)"],"gender":"m"},{"word":"Bărbălăi","pos":"name","definitions":["a village in Tătulești, Olt County, Romania"],"gender":"m"},{"word":"bărbălaie","pos":"noun","definitions":["big beard"],"forms":{"plural":"bărbălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bărbălaie","accusative-definite-nominative-singular":"bărbălaiea","accusative-indefinite-nominative-plural":"bărbălăi","accusative-definite-nominative-plural":"bărbălăile","dative-genitive-indefinite-singular":"bărbălăi","dative-definite-genitive-singular":"bărbălăii","dative-genitive-indefinite-plural":"bărbălăi","dative-definite-genitive-plural":"bărbălăilor","singular-vocative":"bărbălaie","plural-vocative":"bărbălăilor"}},{"word":"Bărbălani","pos":"name","definitions":["a village in Cuca, Argeș County, Romania"],"gender":"m"},{"word":"Barbălată","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbălată"}},{"word":"Bărbălătești","pos":"name","definitions":["a village in Valea Iașului, Argeș County, Romania"],"gender":"m"},{"word":"Barbăneagră","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbăneagră"}},{"word":"barbar","pos":"noun","definitions":["barbarian"],"forms":{"plural":"barbari","feminine":"equivalent barbară","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barbar","accusative-definite-nominative-singular":"barbarul","accusative-indefinite-nominative-plural":"barbari","accusative-definite-nominative-plural":"barbarii","dative-genitive-indefinite-singular":"barbar","dative-definite-genitive-singular":"barbarului","dative-genitive-indefinite-plural":"barbari","dative-definite-genitive-plural":"barbarilor","singular-vocative":"barbarule","plural-vocative":"barbarilor"}},{"word":"barbară","pos":"noun","definitions":["female equivalent of barbar"],"forms":{"plural":"barbare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbară","accusative-definite-nominative-singular":"barbara","accusative-indefinite-nominative-plural":"barbare","accusative-definite-nominative-plural":"barbarele","dative-genitive-indefinite-singular":"barbare","dative-definite-genitive-singular":"barbarei","dative-genitive-indefinite-plural":"barbare","dative-definite-genitive-plural":"barbarelor","singular-vocative":"barbară","plural-vocative":"barbarelor"}},{"word":"Barbărasă","pos":"name","definitions":["a surname"],"pronunciation":"/ˈbar.bəˈɾa.sə/","gender":"m","forms":{"dative-genitive":"lui Barbărasă"}},{"word":"barbarie","pos":"noun","definitions":["barbarity"],"forms":{"plural":"barbarii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"barbarie","accusative-definite-nominative-singular":"barbaria","accusative-indefinite-nominative-plural":"barbarii","accusative-definite-nominative-plural":"barbariile","dative-genitive-indefinite-singular":"barbarii","dative-definite-genitive-singular":"barbariei","dative-genitive-indefinite-plural":"barbarii","dative-definite-genitive-plural":"barbariilor","singular-vocative":"barbarie","plural-vocative":"barbariilor"}},{"word":"Bărbărie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbărie"}},{"word":"bărbărie","pos":"noun","definitions":["big beard"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bărbărie","accusative-definite-nominative":"bărbăria","dative-genitive-indefinite":"bărbării","dative-definite-genitive":"bărbăriei","vocative":"bărbărie"}},{"word":"Bărbărigeni","pos":"name","definitions":["a village in Roești, Vâlcea County, Romania"],"gender":"m"},{"word":"barbarism","pos":"noun","definitions":["barbarism"],"forms":{"plural":"barbarisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barbarism","accusative-definite-nominative-singular":"barbarismul","accusative-indefinite-nominative-plural":"barbarisme","accusative-definite-nominative-plural":"barbarismele","dative-genitive-indefinite-singular":"barbarism","dative-definite-genitive-singular":"barbarismului","dative-genitive-indefinite-plural":"barbarisme","dative-definite-genitive-plural":"barbarismelor","singular-vocative":"barbarismule","plural-vocative":"barbarismelor"}},{"word":"barbariza","pos":"verb","definitions":["to barbarize"],"forms":{"canonical":"a barbariza 1st conjugation","present-singular-third-person":"barbarizează","participle-past":"barbarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a barbariza","gerund":"barbarizând","first-person-indicative-present-singular":"barbarizez","indicative-present-second-person-singular":"barbarizezi","indicative-present-singular-third-person":"barbarizează","first-person-indicative-plural-present":"barbarizăm","indicative-plural-present-second-person":"barbarizați","indicative-plural-present-third-person":"barbarizează","first-person-imperfect-indicative-singular":"barbarizam","imperfect-indicative-second-person-singular":"barbarizai","imperfect-indicative-singular-third-person":"barbariza","first-person-imperfect-indicative-plural":"barbarizam","imperfect-indicative-plural-second-person":"barbarizați","imperfect-indicative-plural-third-person":"barbarizau","first-person-indicative-perfect-singular":"barbarizai","indicative-perfect-second-person-singular":"barbarizași","indicative-perfect-singular-third-person":"barbariză","first-person-indicative-perfect-plural":"barbarizarăm","indicative-perfect-plural-second-person":"barbarizarăți","indicative-perfect-plural-third-person":"barbarizară","first-person-indicative-pluperfect-singular":"barbarizasem","indicative-pluperfect-second-person-singular":"barbarizaseși","indicative-pluperfect-singular-third-person":"barbarizase","first-person-indicative-pluperfect-plural":"barbarizaserăm","indicative-pluperfect-plural-second-person":"barbarizaserăți","indicative-pluperfect-plural-third-person":"barbarizaseră","first-person-present-singular-subjunctive":"să barbarizez","present-second-person-singular-subjunctive":"să barbarizezi","present-singular-subjunctive-third-person":"să barbarizeze","first-person-plural-present-subjunctive":"să barbarizăm","plural-present-second-person-subjunctive":"să barbarizați","plural-present-subjunctive-third-person":"să barbarizeze","imperative-second-person-singular":"barbarizează","imperative-plural-second-person":"barbarizați","imperative-negative-second-person-singular":"nu barbariza","imperative-negative-plural-second-person":"nu barbarizați"}},{"word":"barbarizare","pos":"noun","definitions":["barbarization"],"forms":{"plural":"barbarizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"barbarizare","accusative-definite-nominative-singular":"barbarizarea","accusative-indefinite-nominative-plural":"barbarizări","accusative-definite-nominative-plural":"barbarizările","dative-genitive-indefinite-singular":"barbarizări","dative-definite-genitive-singular":"barbarizării","dative-genitive-indefinite-plural":"barbarizări","dative-definite-genitive-plural":"barbarizărilor","singular-vocative":"barbarizare","plural-vocative":"barbarizărilor"}},{"word":"barbarizat","pos":"noun","definitions":["barbarization"],"forms":{"plural":"barbarizaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"barbarizat","accusative-definite-nominative-singular":"barbarizatul","accusative-indefinite-nominative-plural":"barbarizaturi","accusative-definite-nominative-plural":"barbarizaturile","dative-genitive-indefinite-singular":"barbarizat","dative-definite-genitive-singular":"barbarizatului","dative-genitive-indefinite-plural":"barbarizaturi","dative-definite-genitive-plural":"barbarizaturilor","singular-vocative":"barbarizatule","plural-vocative":"barbarizaturilor"}},{"word":"barbarizat","pos":"verb","definitions":["past participle of barbariza"],"forms":{"participle-past":"of barbariza"}},{"word":"Barbăroșă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbăroșă"}},{"word":"Barbăroșie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbăroșie"}},{"word":"Barbăscumpă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbăscumpă"}},{"word":"Barbăsură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbăsură"}},{"word":"Bărbat","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Strei"],"gender":"m"},{"word":"bărbat","pos":"noun","definitions":["man (an adult male)"],"pronunciation":"/bərˈbat/","examples":[{"ro":"Îmi plac bărbații musculoși.","en":"I like muscular men."}],"forms":{"plural":"bărbați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbat","accusative-definite-nominative-singular":"bărbatul","accusative-indefinite-nominative-plural":"bărbați","accusative-definite-nominative-plural":"bărbații","dative-genitive-indefinite-singular":"bărbat","dative-definite-genitive-singular":"bărbatului","dative-genitive-indefinite-plural":"bărbați","dative-definite-genitive-plural":"bărbaților","singular-vocative":"bărbatule","plural-vocative":"bărbaților","alternative":"бэрбат"}},{"word":"bărbat","pos":"adj","definitions":["courageous"],"pronunciation":"/bərˈbat/","forms":{"feminine-singular":"bărbată","masculine-plural":"bărbați","feminine-neuter-plural":"bărbate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărbat","error-unrecognized-form-feminine-indefinite-singular":"bărbată","error-unrecognized-form-indefinite-masculine-plural":"bărbați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărbate","definite-error-unrecognized-form-masculine-neuter-singular":"bărbatul","definite-error-unrecognized-form-feminine-singular":"bărbata","definite-error-unrecognized-form-masculine-plural":"bărbații","definite-error-unrecognized-form-feminine-neuter-plural":"bărbatele","alternative":"бэрбат"}},{"word":"bărbat de stat","pos":"noun","definitions":["statesman"],"forms":{"plural":"bărbați de stat"}},{"word":"bărbat politic","pos":"noun","definitions":["a male politician"],"forms":{"plural":"bărbați politici"}},{"word":"bărbată","pos":"noun","definitions":["female equivalent of bărbat"],"forms":{"plural":"bărbate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbată","accusative-definite-nominative-singular":"bărbata","accusative-indefinite-nominative-plural":"bărbate","accusative-definite-nominative-plural":"bărbatele","dative-genitive-indefinite-singular":"bărbate","dative-definite-genitive-singular":"bărbatei","dative-genitive-indefinite-plural":"bărbate","dative-definite-genitive-plural":"bărbatelor","singular-vocative":"bărbată","plural-vocative":"bărbatelor"}},{"word":"bărbate","pos":"noun","definitions":["vocative singular of bărbat"]},{"word":"bărbătească","pos":"adj","definitions":["feminine singular of bărbătesc"],"pronunciation":"/bər.bəˈte̯as.kə/","gender":"f"},{"word":"bărbățel","pos":"noun","definitions":["diminutive of bărbat; small man"],"forms":{"plural":"bărbăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbățel","accusative-definite-nominative-singular":"bărbățelul","accusative-indefinite-nominative-plural":"bărbățeli","accusative-definite-nominative-plural":"bărbățelii","dative-genitive-indefinite-singular":"bărbățel","dative-definite-genitive-singular":"bărbățelului","dative-genitive-indefinite-plural":"bărbățeli","dative-definite-genitive-plural":"bărbățelilor","singular-vocative":"bărbățelule","plural-vocative":"bărbățelilor"}},{"word":"bărbătesc","pos":"adj","definitions":["manly, masculine"],"pronunciation":"/bər.bəˈtesk/","forms":{"feminine-singular":"bărbătească","plural":"bărbătești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărbătesc","error-unrecognized-form-feminine-indefinite-singular":"bărbătească","error-unrecognized-form-indefinite-masculine-plural":"bărbătești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărbătești","definite-error-unrecognized-form-masculine-neuter-singular":"bărbătescul","definite-error-unrecognized-form-feminine-singular":"bărbăteasca","definite-error-unrecognized-form-masculine-plural":"bărbăteștii","definite-error-unrecognized-form-feminine-neuter-plural":"bărbăteștile"}},{"word":"Bărbătescu","pos":"name","definitions":["a village in Axintele, Ialomița County, Romania"],"gender":"m"},{"word":"bărbătește","pos":"adv","definitions":["in a manly way; like a man","maturely"],"pronunciation":"[bər.bəˈteʃ.te]"},{"word":"Bărbătești","pos":"name","definitions":["a village in Cocu, Argeș County, Romania","a commune of Gorj County, Romania","a village in Bărbătești, Gorj County, Romania","a village in Cucuteni, Iași County, Romania","a commune of Vâlcea County, Romania"],"gender":"m"},{"word":"bărbătești","pos":"adj","definitions":["plural of bărbătesc"],"pronunciation":"[bər.bəˈteʃtʲ]"},{"word":"bărbați","pos":"noun","definitions":["plural of bărbat; men"],"pronunciation":"/bərˈbatsʲ/","gender":"m-p"},{"word":"bărbăție","pos":"noun","definitions":["virility, masculinity","courage","manhood (male genitalia)"],"forms":{"plural":"bărbății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bărbăție","accusative-definite-nominative-singular":"bărbăția","accusative-indefinite-nominative-plural":"bărbății","accusative-definite-nominative-plural":"bărbățiile","dative-genitive-indefinite-singular":"bărbății","dative-definite-genitive-singular":"bărbăției","dative-genitive-indefinite-plural":"bărbății","dative-definite-genitive-plural":"bărbățiilor","singular-vocative":"bărbăție","plural-vocative":"bărbățiilor"}},{"word":"bărbații","pos":"noun","definitions":["definite nominative plural of bărbat: the men","definite accusative plural of bărbat: the men"],"pronunciation":"[bərˈbat͡siː]","gender":"m"},{"word":"bărbaților","pos":"noun","definitions":["definite genitive/dative/vocative plural of bărbat"],"pronunciation":"[bərˈbat͡silor]","gender":"m-p"},{"word":"bărbătoi","pos":"noun","definitions":["augmentative of bărbătoi"],"forms":{"plural":"bărbătoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbătoi","accusative-definite-nominative-singular":"bărbătoiul","accusative-indefinite-nominative-plural":"bărbătoi","accusative-definite-nominative-plural":"bărbătoii","dative-genitive-indefinite-singular":"bărbătoi","dative-definite-genitive-singular":"bărbătoiului","dative-genitive-indefinite-plural":"bărbătoi","dative-definite-genitive-plural":"bărbătoilor","singular-vocative":"bărbătoiule","plural-vocative":"bărbătoilor"}},{"word":"bărbățoi","pos":"noun","definitions":["augmentative of bărbat"],"forms":{"plural":"bărbățoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbățoi","accusative-definite-nominative-singular":"bărbățoiul","accusative-indefinite-nominative-plural":"bărbățoi","accusative-definite-nominative-plural":"bărbățoii","dative-genitive-indefinite-singular":"bărbățoi","dative-definite-genitive-singular":"bărbățoiului","dative-genitive-indefinite-plural":"bărbățoi","dative-definite-genitive-plural":"bărbățoilor","singular-vocative":"bărbățoiule","plural-vocative":"bărbățoilor"}},{"word":"bărbătos","pos":"adj","definitions":["manly"],"pronunciation":"/bər.bəˈtos/","forms":{"feminine-singular":"bărbătoasă","masculine-plural":"bărbătoși","feminine-neuter-plural":"bărbătoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărbătos","error-unrecognized-form-feminine-indefinite-singular":"bărbătoasă","error-unrecognized-form-indefinite-masculine-plural":"bărbătoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărbătoase","definite-error-unrecognized-form-masculine-neuter-singular":"bărbătosul","definite-error-unrecognized-form-feminine-singular":"bărbătoasa","definite-error-unrecognized-form-masculine-plural":"bărbătoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bărbătoasele"}},{"word":"Bărbatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbatu"}},{"word":"bărbatul","pos":"noun","definitions":["definite nominative/accusative singular of bărbat"],"pronunciation":"[bərˈbatul]","gender":"m"},{"word":"bărbatule","pos":"noun","definitions":["vocative singular of bărbat"]},{"word":"bărbatului","pos":"noun","definitions":["definite genitive singular of bărbat: the man","definite dative singular of bărbat: the man"],"pronunciation":"[bərˈbatuluj]","gender":"m"},{"word":"bărbătuș","pos":"noun","definitions":["diminutive of bărbat","the male of some animals"],"pronunciation":"/bər.bəˈtuʃ/","forms":{"plural":"bărbătuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbătuș","accusative-definite-nominative-singular":"bărbătușul","accusative-indefinite-nominative-plural":"bărbătuși","accusative-definite-nominative-plural":"bărbătușii","dative-genitive-indefinite-singular":"bărbătuș","dative-definite-genitive-singular":"bărbătușului","dative-genitive-indefinite-plural":"bărbătuși","dative-definite-genitive-plural":"bărbătușilor","singular-vocative":"bărbătușule","plural-vocative":"bărbătușilor"}},{"word":"Barbeli","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Barbeli"}},{"word":"Barberis","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Barberis"}},{"word":"Barbescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Barbescu"}},{"word":"Bărbescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbescu"}},{"word":"Bărbești","pos":"name","definitions":["a village in Mogoș, Alba County, Romania"],"gender":"m"},{"word":"barbet","pos":"noun","definitions":["barbet (dog)"],"forms":{"plural":"barbeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barbet","accusative-definite-nominative-singular":"barbetul","accusative-indefinite-nominative-plural":"barbeți","accusative-definite-nominative-plural":"barbeții","dative-genitive-indefinite-singular":"barbet","dative-definite-genitive-singular":"barbetului","dative-genitive-indefinite-plural":"barbeți","dative-definite-genitive-plural":"barbeților","singular-vocative":"barbetule","plural-vocative":"barbeților"}},{"word":"barbetă","pos":"noun","definitions":["barbette"],"forms":{"plural":"barbete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbetă","accusative-definite-nominative-singular":"barbeta","accusative-indefinite-nominative-plural":"barbete","accusative-definite-nominative-plural":"barbetele","dative-genitive-indefinite-singular":"barbete","dative-definite-genitive-singular":"barbetei","dative-genitive-indefinite-plural":"barbete","dative-definite-genitive-plural":"barbetelor","singular-vocative":"barbetă","plural-vocative":"barbetelor"}},{"word":"Barbete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Barbete"}},{"word":"bărbi","pos":"noun","definitions":["plural of barbă"]},{"word":"bărbie","pos":"noun","definitions":["chin"],"pronunciation":"[bərˈbi.e]","forms":{"plural":"bărbii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bărbie","accusative-definite-nominative-singular":"bărbia","accusative-indefinite-nominative-plural":"bărbii","accusative-definite-nominative-plural":"bărbiile","dative-genitive-indefinite-singular":"bărbii","dative-definite-genitive-singular":"bărbiei","dative-genitive-indefinite-plural":"bărbii","dative-definite-genitive-plural":"bărbiilor","singular-vocative":"bărbie","plural-vocative":"bărbiilor"}},{"word":"bărbie dublă","pos":"noun","definitions":["double chin"],"forms":{"plural":"bărbii duble"}},{"word":"bărbier","pos":"noun","definitions":["barber"],"forms":{"plural":"bărbieri","feminine":"equivalent bărbiereasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărbier","accusative-definite-nominative-singular":"bărbierul","accusative-indefinite-nominative-plural":"bărbieri","accusative-definite-nominative-plural":"bărbierii","dative-genitive-indefinite-singular":"bărbier","dative-definite-genitive-singular":"bărbierului","dative-genitive-indefinite-plural":"bărbieri","dative-definite-genitive-plural":"bărbierilor","singular-vocative":"bărbierule","plural-vocative":"bărbierilor"}},{"word":"bărbiereală","pos":"noun","definitions":["shaving"],"forms":{"plural":"bărbiereli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbiereală","accusative-definite-nominative-singular":"bărbiereala","accusative-indefinite-nominative-plural":"bărbierele","accusative-definite-nominative-plural":"bărbierelele","dative-genitive-indefinite-singular":"bărbierele","dative-definite-genitive-singular":"bărbierelei","dative-genitive-indefinite-plural":"bărbierele","dative-definite-genitive-plural":"bărbierelelor","singular-vocative":"bărbiereală","plural-vocative":"bărbierelelor"}},{"word":"bărbiereasă","pos":"noun","definitions":["female equivalent of bărbier"],"forms":{"plural":"bărbierese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbiereasă","accusative-definite-nominative-singular":"bărbiereasa","accusative-indefinite-nominative-plural":"bărbierese","accusative-definite-nominative-plural":"bărbieresele","dative-genitive-indefinite-singular":"bărbierese","dative-definite-genitive-singular":"bărbieresei","dative-genitive-indefinite-plural":"bărbierese","dative-definite-genitive-plural":"bărbiereselor","singular-vocative":"bărbiereasă","plural-vocative":"bărbiereselor"}},{"word":"bărbieresc","pos":"adj","definitions":["barber"],"forms":{"feminine-singular":"bărbierească","plural":"bărbierești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărbieresc","error-unrecognized-form-feminine-indefinite-singular":"bărbierească","error-unrecognized-form-indefinite-masculine-plural":"bărbierești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărbierești","definite-error-unrecognized-form-masculine-neuter-singular":"bărbierescul","definite-error-unrecognized-form-feminine-singular":"bărbiereasca","definite-error-unrecognized-form-masculine-plural":"bărbiereștii","definite-error-unrecognized-form-feminine-neuter-plural":"bărbiereștile"}},{"word":"bărbieri","pos":"verb","definitions":["to shave, barber"],"forms":{"canonical":"a bărbieri 4th conjugation","present-singular-third-person":"bărbierește","participle-past":"bărbierit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bărbieri","gerund":"bărbierind","first-person-indicative-present-singular":"bărbieresc","indicative-present-second-person-singular":"bărbierești","indicative-present-singular-third-person":"bărbierește","first-person-indicative-plural-present":"bărbierim","indicative-plural-present-second-person":"bărbieriți","indicative-plural-present-third-person":"bărbieresc","first-person-imperfect-indicative-singular":"bărbieream","imperfect-indicative-second-person-singular":"bărbiereai","imperfect-indicative-singular-third-person":"bărbierea","first-person-imperfect-indicative-plural":"bărbieream","imperfect-indicative-plural-second-person":"bărbiereați","imperfect-indicative-plural-third-person":"bărbiereau","first-person-indicative-perfect-singular":"bărbierii","indicative-perfect-second-person-singular":"bărbieriși","indicative-perfect-singular-third-person":"bărbieri","first-person-indicative-perfect-plural":"bărbierirăm","indicative-perfect-plural-second-person":"bărbierirăți","indicative-perfect-plural-third-person":"bărbieriră","first-person-indicative-pluperfect-singular":"bărbierisem","indicative-pluperfect-second-person-singular":"bărbieriseși","indicative-pluperfect-singular-third-person":"bărbierise","first-person-indicative-pluperfect-plural":"bărbieriserăm","indicative-pluperfect-plural-second-person":"bărbieriserăți","indicative-pluperfect-plural-third-person":"bărbieriseră","first-person-present-singular-subjunctive":"să bărbieresc","present-second-person-singular-subjunctive":"să bărbierești","present-singular-subjunctive-third-person":"să bărbierească","first-person-plural-present-subjunctive":"să bărbierim","plural-present-second-person-subjunctive":"să bărbieriți","plural-present-subjunctive-third-person":"să bărbierească","imperative-second-person-singular":"bărbierește","imperative-plural-second-person":"bărbieriți","imperative-negative-second-person-singular":"nu bărbieri","imperative-negative-plural-second-person":"nu bărbieriți"}},{"word":"bărbierie","pos":"noun","definitions":["barber's shop"],"forms":{"plural":"bărbierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bărbierie","accusative-definite-nominative-singular":"bărbieria","accusative-indefinite-nominative-plural":"bărbierii","accusative-definite-nominative-plural":"bărbieriile","dative-genitive-indefinite-singular":"bărbierii","dative-definite-genitive-singular":"bărbieriei","dative-genitive-indefinite-plural":"bărbierii","dative-definite-genitive-plural":"bărbieriilor","singular-vocative":"bărbierie","plural-vocative":"bărbieriilor"}},{"word":"bărbierire","pos":"noun","definitions":["shaving"],"forms":{"plural":"bărbieriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bărbierire","accusative-definite-nominative-singular":"bărbierirea","accusative-indefinite-nominative-plural":"bărbieriri","accusative-definite-nominative-plural":"bărbieririle","dative-genitive-indefinite-singular":"bărbieriri","dative-definite-genitive-singular":"bărbieririi","dative-genitive-indefinite-plural":"bărbieriri","dative-definite-genitive-plural":"bărbieririlor","singular-vocative":"bărbierire","plural-vocative":"bărbieririlor"}},{"word":"bărbierit","pos":"noun","definitions":["shaving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bărbierit","accusative-definite-nominative":"bărbieritul","dative-genitive-indefinite":"bărbierit","dative-definite-genitive":"bărbieritului","vocative":"bărbieritule"}},{"word":"bărbierit","pos":"verb","definitions":["past participle of bărbieri"],"forms":{"participle-past":"of bărbieri"}},{"word":"bărbieriță","pos":"noun","definitions":["female equivalent of bărbier"],"forms":{"plural":"bărbierițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbieriță","accusative-definite-nominative-singular":"bărbierița","accusative-indefinite-nominative-plural":"bărbierițe","accusative-definite-nominative-plural":"bărbierițele","dative-genitive-indefinite-singular":"bărbierițe","dative-definite-genitive-singular":"bărbieriței","dative-genitive-indefinite-plural":"bărbierițe","dative-definite-genitive-plural":"bărbierițelor","singular-vocative":"bărbieriță","plural-vocative":"bărbierițelor"}},{"word":"Bărbieriu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bărbieriu"}},{"word":"Bărbieru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bărbieru"}},{"word":"bărbii","pos":"noun","definitions":["plural of bărbie"]},{"word":"bărbioară","pos":"noun","definitions":["diminutive of bărbie; small chin"],"forms":{"plural":"bărbioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbioară","accusative-definite-nominative-singular":"bărbioara","accusative-indefinite-nominative-plural":"bărbioare","accusative-definite-nominative-plural":"bărbioarele","dative-genitive-indefinite-singular":"bărbioare","dative-definite-genitive-singular":"bărbioarei","dative-genitive-indefinite-plural":"bărbioare","dative-definite-genitive-plural":"bărbioarelor","singular-vocative":"bărbioară","plural-vocative":"bărbioarelor"}},{"word":"barbișă","pos":"noun","definitions":["goatee"],"forms":{"plural":"barbișe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbișă","accusative-definite-nominative-singular":"barbișa","accusative-indefinite-nominative-plural":"barbișe","accusative-definite-nominative-plural":"barbișele","dative-genitive-indefinite-singular":"barbișe","dative-definite-genitive-singular":"barbișei","dative-genitive-indefinite-plural":"barbișe","dative-definite-genitive-plural":"barbișelor","singular-vocative":"barbișă","plural-vocative":"barbișelor"}},{"word":"bărbișoară","pos":"noun","definitions":["desert madwort: Alyssum turkestanicum"],"forms":{"plural":"bărbișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbișoară","accusative-definite-nominative-singular":"bărbișoara","accusative-indefinite-nominative-plural":"bărbișoare","accusative-definite-nominative-plural":"bărbișoarele","dative-genitive-indefinite-singular":"bărbișoare","dative-definite-genitive-singular":"bărbișoarei","dative-genitive-indefinite-plural":"bărbișoare","dative-definite-genitive-plural":"bărbișoarelor","singular-vocative":"bărbișoară","plural-vocative":"bărbișoarelor"}},{"word":"barbișon","pos":"noun","definitions":["goatee"],"forms":{"plural":"barbișoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barbișon","accusative-definite-nominative-singular":"barbișonul","accusative-indefinite-nominative-plural":"barbișoane","accusative-definite-nominative-plural":"barbișoanele","dative-genitive-indefinite-singular":"barbișon","dative-definite-genitive-singular":"barbișonului","dative-genitive-indefinite-plural":"barbișoane","dative-definite-genitive-plural":"barbișoanelor","singular-vocative":"barbișonule","plural-vocative":"barbișoanelor"}},{"word":"Bărbiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbiță"}},{"word":"bărbiță","pos":"noun","definitions":["bib"],"forms":{"plural":"bărbițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbiță","accusative-definite-nominative-singular":"bărbița","accusative-indefinite-nominative-plural":"bărbițe","accusative-definite-nominative-plural":"bărbițele","dative-genitive-indefinite-singular":"bărbițe","dative-definite-genitive-singular":"bărbiței","dative-genitive-indefinite-plural":"bărbițe","dative-definite-genitive-plural":"bărbițelor","singular-vocative":"bărbiță","plural-vocative":"bărbițelor"}},{"word":"barbituric","pos":"noun","definitions":["barbiturate"],"forms":{"plural":"barbiturici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barbituric","accusative-definite-nominative-singular":"barbituricul","accusative-indefinite-nominative-plural":"barbiturici","accusative-definite-nominative-plural":"barbituricile","dative-genitive-indefinite-singular":"barbituric","dative-definite-genitive-singular":"barbituricului","dative-genitive-indefinite-plural":"barbiturici","dative-definite-genitive-plural":"barbituricilor","singular-vocative":"barbituricule","plural-vocative":"barbituricilor"}},{"word":"barbiturism","pos":"noun","definitions":["barbiturism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"barbiturism","accusative-definite-nominative":"barbiturismul","dative-genitive-indefinite":"barbiturism","dative-definite-genitive":"barbiturismului","vocative":"barbiturismule"}},{"word":"bărbiuță","pos":"noun","definitions":["diminutive of bărbie; small chin"],"forms":{"plural":"bărbiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbiuță","accusative-definite-nominative-singular":"bărbiuța","accusative-indefinite-nominative-plural":"bărbiuțe","accusative-definite-nominative-plural":"bărbiuțele","dative-genitive-indefinite-singular":"bărbiuțe","dative-definite-genitive-singular":"bărbiuței","dative-genitive-indefinite-plural":"bărbiuțe","dative-definite-genitive-plural":"bărbiuțelor","singular-vocative":"bărbiuță","plural-vocative":"bărbiuțelor"}},{"word":"barbo","pos":"noun","definitions":["vocative singular of barbă"],"pronunciation":"[ˈbarbo]","gender":"f"},{"word":"Bărboasa","pos":"name","definitions":["a village in Oncești, Bacău County, Romania"],"gender":"f"},{"word":"bărboasă","pos":"noun","definitions":["female equivalent of bărbos"],"forms":{"plural":"bărboase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărboasă","accusative-definite-nominative-singular":"bărboasa","accusative-indefinite-nominative-plural":"bărboase","accusative-definite-nominative-plural":"bărboasele","dative-genitive-indefinite-singular":"bărboase","dative-definite-genitive-singular":"bărboasei","dative-genitive-indefinite-plural":"bărboase","dative-definite-genitive-plural":"bărboaselor","singular-vocative":"bărboasă","plural-vocative":"bărboaselor"}},{"word":"Bărboi","pos":"name","definitions":["a village in Grecești, Dolj County, Romania"],"gender":"m"},{"word":"bărboi","pos":"noun","definitions":["augmentative of barbă"],"forms":{"plural":"bărboaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bărboi","accusative-definite-nominative-singular":"bărboiul","accusative-indefinite-nominative-plural":"bărboaie","accusative-definite-nominative-plural":"bărboaiele","dative-genitive-indefinite-singular":"bărboi","dative-definite-genitive-singular":"bărboiului","dative-genitive-indefinite-plural":"bărboaie","dative-definite-genitive-plural":"bărboaielor","singular-vocative":"bărboiule","plural-vocative":"bărboaielor"}},{"word":"Bărboieni","pos":"name","definitions":["a village in Bărboieni, Nisporeni Raion, Moldova","a commune of Nisporeni Raion, Moldova"],"gender":"m"},{"word":"barbologie","pos":"noun","definitions":["demagogy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"barbologie","accusative-definite-nominative":"barbologia","dative-genitive-indefinite":"barbologii","dative-definite-genitive":"barbologiei","vocative":"barbologie"}},{"word":"Barboni","pos":"name","definitions":["a surname from Italian"],"gender":"m","forms":{"dative-genitive":"lui Barboni"}},{"word":"Bârborică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bârborică","alternative":"Bîrborică"}},{"word":"Bărbos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbos"}},{"word":"bărbos","pos":"adj","definitions":["bearded, especially when possessing a long, thick beard, beardy"],"pronunciation":"/bərˈbos/","forms":{"feminine-singular":"bărboasă","masculine-plural":"bărboși","feminine-neuter-plural":"bărboase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărbos","error-unrecognized-form-feminine-indefinite-singular":"bărboasă","error-unrecognized-form-indefinite-masculine-plural":"bărboși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărboase","definite-error-unrecognized-form-masculine-neuter-singular":"bărbosul","definite-error-unrecognized-form-feminine-singular":"bărboasa","definite-error-unrecognized-form-masculine-plural":"bărboșii","definite-error-unrecognized-form-feminine-neuter-plural":"bărboasele"}},{"word":"Barboșanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Barboșanu"}},{"word":"Barboși","pos":"name","definitions":["a village in Hoceni, Vaslui County, Romania"],"gender":"m"},{"word":"Bărboși","pos":"name","definitions":["a village in Zau de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"bărboși","pos":"noun","definitions":["plural of bărbos"]},{"word":"Bărbosu","pos":"name","definitions":["a village in Ramna, Caraș-Severin County, Romania","a surname"],"gender":"m"},{"word":"bărbosul","pos":"noun","definitions":["definite nominative/accusative singular of bărbos"]},{"word":"barbotaj","pos":"noun","definitions":["splashing, bubbling"],"forms":{"plural":"barbotaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barbotaj","accusative-definite-nominative-singular":"barbotajul","accusative-indefinite-nominative-plural":"barbotaje","accusative-definite-nominative-plural":"barbotajele","dative-genitive-indefinite-singular":"barbotaj","dative-definite-genitive-singular":"barbotajului","dative-genitive-indefinite-plural":"barbotaje","dative-definite-genitive-plural":"barbotajelor","singular-vocative":"barbotajule","plural-vocative":"barbotajelor"}},{"word":"barbotare","pos":"noun","definitions":["barbotage"],"forms":{"plural":"barbotări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"barbotare","accusative-definite-nominative-singular":"barbotarea","accusative-indefinite-nominative-plural":"barbotări","accusative-definite-nominative-plural":"barbotările","dative-genitive-indefinite-singular":"barbotări","dative-definite-genitive-singular":"barbotării","dative-genitive-indefinite-plural":"barbotări","dative-definite-genitive-plural":"barbotărilor","singular-vocative":"barbotare","plural-vocative":"barbotărilor"}},{"word":"Bărbuceanu","pos":"name","definitions":["a village in Butimanu, Dâmbovița County, Romania","a surname transferred from the place name"],"gender":"m"},{"word":"Bărbucenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbucenescu"}},{"word":"Bărbuceni","pos":"name","definitions":["a village in Prundeni, Vâlcea County, Romania"],"gender":"m"},{"word":"barbugiu","pos":"noun","definitions":["craps player"],"forms":{"plural":"barbugii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barbugiu","accusative-definite-nominative-singular":"barbugiuul","accusative-indefinite-nominative-plural":"barbugii","accusative-definite-nominative-plural":"barbugiii","dative-genitive-indefinite-singular":"barbugiu","dative-definite-genitive-singular":"barbugiuului","dative-genitive-indefinite-plural":"barbugii","dative-definite-genitive-plural":"barbugiilor","singular-vocative":"barbugiuule","plural-vocative":"barbugiilor"}},{"word":"Barbulea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbulea"}},{"word":"Bărbuleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuleanu"}},{"word":"Bărbuleasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Bărbulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbulescu"}},{"word":"Bărbulești","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Bărbulești, Ialomița County, Romania"],"gender":"m"},{"word":"Bărbuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuleț"}},{"word":"Bărbulete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbulete"}},{"word":"Bărbulețu","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Bărbulețu, Dâmbovița County, Romania","a surname"],"gender":"m"},{"word":"barbun","pos":"noun","definitions":["mullet (fish)"],"forms":{"plural":"barbuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barbun","accusative-definite-nominative-singular":"barbunul","accusative-indefinite-nominative-plural":"barbuni","accusative-definite-nominative-plural":"barbunii","dative-genitive-indefinite-singular":"barbun","dative-definite-genitive-singular":"barbunului","dative-genitive-indefinite-plural":"barbuni","dative-definite-genitive-plural":"barbunilor","singular-vocative":"barbunule","plural-vocative":"barbunilor"}},{"word":"bărbunc","pos":"noun","definitions":["a dance","recruitment"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bărbunc","accusative-definite-nominative":"bărbuncul","dative-genitive-indefinite":"bărbunc","dative-definite-genitive":"bărbuncului","vocative":"bărbuncule"}},{"word":"Bărbuncești","pos":"name","definitions":["a village in Tisău, Buzău County, Romania"],"gender":"m"},{"word":"Bărbuneanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuneanu"}},{"word":"barbur","pos":"noun","definitions":["the edge of an axe or knife","a triangular-shaped embroidery on the chest area of a peasant's shirt"],"forms":{"plural":"barburi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barbur","accusative-definite-nominative-singular":"barburul","accusative-indefinite-nominative-plural":"barburi","accusative-definite-nominative-plural":"barburii","dative-genitive-indefinite-singular":"barbur","dative-definite-genitive-singular":"barburului","dative-genitive-indefinite-plural":"barburi","dative-definite-genitive-plural":"barburilor","singular-vocative":"barburule","plural-vocative":"barburilor","alternative-archaic-rare":"barbure"}},{"word":"Barbură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbură"}},{"word":"barbură","pos":"noun","definitions":["the holiday of St. Barbara's day, during which children are anointed with honey, sugar, or the juice of the guelder rose","the guelder rose (Viburnum opulus)"],"forms":{"plural":"barbure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbură","accusative-definite-nominative-singular":"barbura","accusative-indefinite-nominative-plural":"barbure","accusative-definite-nominative-plural":"barburele","dative-genitive-indefinite-singular":"barbure","dative-definite-genitive-singular":"barburei","dative-genitive-indefinite-plural":"barbure","dative-definite-genitive-plural":"barburelor","singular-vocative":"barbură","plural-vocative":"barburelor","alternative":"barboră"}},{"word":"Bărbuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuș"}},{"word":"Bărbușică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbușică"}},{"word":"bărbușoară","pos":"noun","definitions":["spreading wallflower (Erysimum repandum)","diminutive of barbă"],"forms":{"plural":"bărbușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbușoară","accusative-definite-nominative-singular":"bărbușoara","accusative-indefinite-nominative-plural":"bărbușoare","accusative-definite-nominative-plural":"bărbușoarele","dative-genitive-indefinite-singular":"bărbușoare","dative-definite-genitive-singular":"bărbușoarei","dative-genitive-indefinite-plural":"bărbușoare","dative-definite-genitive-plural":"bărbușoarelor","singular-vocative":"bărbușoară","plural-vocative":"bărbușoarelor"}},{"word":"Bărbușoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbușoiu"}},{"word":"Barbut","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbut"}},{"word":"barbut","pos":"noun","definitions":["craps"],"forms":{"plural":"barbuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"barbut","accusative-definite-nominative-singular":"barbutul","accusative-indefinite-nominative-plural":"barbuturi","accusative-definite-nominative-plural":"barbuturile","dative-genitive-indefinite-singular":"barbut","dative-definite-genitive-singular":"barbutului","dative-genitive-indefinite-plural":"barbuturi","dative-definite-genitive-plural":"barbuturilor","singular-vocative":"barbutule","plural-vocative":"barbuturilor"}},{"word":"Barbuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barbuț"}},{"word":"Bărbuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuț"}},{"word":"barbută","pos":"noun","definitions":["19th-century coin worth 2 lei and 10 para"],"forms":{"plural":"barbute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barbută","accusative-definite-nominative-singular":"barbuta","accusative-indefinite-nominative-plural":"barbute","accusative-definite-nominative-plural":"barbutele","dative-genitive-indefinite-singular":"barbute","dative-definite-genitive-singular":"barbutei","dative-genitive-indefinite-plural":"barbute","dative-definite-genitive-plural":"barbutelor","singular-vocative":"barbută","plural-vocative":"barbutelor"}},{"word":"Bărbuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărbuță"}},{"word":"bărbuță","pos":"noun","definitions":["diminutive of barbă; small beard"],"forms":{"plural":"bărbuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărbuță","accusative-definite-nominative-singular":"bărbuța","accusative-indefinite-nominative-plural":"bărbuțe","accusative-definite-nominative-plural":"bărbuțele","dative-genitive-indefinite-singular":"bărbuțe","dative-definite-genitive-singular":"bărbuței","dative-genitive-indefinite-plural":"bărbuțe","dative-definite-genitive-plural":"bărbuțelor","singular-vocative":"bărbuță","plural-vocative":"bărbuțelor"}},{"word":"Bărbuțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărbuțoiu"}},{"word":"bărc","pos":"adj","definitions":["obsolete form of berc"],"forms":{"feminine-singular":"bărcă","masculine-plural":"bărci","feminine-neuter-plural":"bărce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărc","error-unrecognized-form-feminine-indefinite-singular":"bărcă","error-unrecognized-form-indefinite-masculine-plural":"bărci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărce","definite-error-unrecognized-form-masculine-neuter-singular":"bărcul","definite-error-unrecognized-form-feminine-singular":"bărca","definite-error-unrecognized-form-masculine-plural":"bărcii","definite-error-unrecognized-form-feminine-neuter-plural":"bărcele"}},{"word":"barcă","pos":"noun","definitions":["boat (watercraft)"],"forms":{"plural":"bărci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"barcă","accusative-definite-nominative-singular":"barca","accusative-indefinite-nominative-plural":"bărci","accusative-definite-nominative-plural":"bărcile","dative-genitive-indefinite-singular":"bărci","dative-definite-genitive-singular":"bărcii","dative-genitive-indefinite-plural":"bărci","dative-definite-genitive-plural":"bărcilor","singular-vocative":"barcă","plural-vocative":"bărcilor"}},{"word":"barcă cu motor","pos":"noun","definitions":["motorboat"],"forms":{"plural":"bărci cu motor"}},{"word":"barcagiu","pos":"noun","definitions":["boatman"],"forms":{"plural":"barcagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barcagiu","accusative-definite-nominative-singular":"barcagiul","accusative-indefinite-nominative-plural":"barcagii","accusative-definite-nominative-plural":"barcagiii","dative-genitive-indefinite-singular":"barcagiu","dative-definite-genitive-singular":"barcagiului","dative-genitive-indefinite-plural":"barcagii","dative-definite-genitive-plural":"barcagiilor","singular-vocative":"barcagiule","plural-vocative":"barcagiilor"}},{"word":"barcană","pos":"noun","definitions":["barchan"],"forms":{"plural":"barcane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barcană","accusative-definite-nominative-singular":"barcana","accusative-indefinite-nominative-plural":"barcane","accusative-definite-nominative-plural":"barcanele","dative-genitive-indefinite-singular":"barcane","dative-definite-genitive-singular":"barcanei","dative-genitive-indefinite-plural":"barcane","dative-definite-genitive-plural":"barcanelor","singular-vocative":"barcană","plural-vocative":"barcanelor"}},{"word":"Barcanele","pos":"name","definitions":["a village in Păușești, Vâlcea County, Romania"],"gender":"m"},{"word":"Bărcănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărcănescu"}},{"word":"Bărcănești","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Bărcănești, Ialomița County, Romania","a village in Cândești, Neamț County, Romania","a village in Vâlcele, Olt County, Romania","a commune of Prahova County, Romania"],"gender":"m"},{"word":"Bărcăoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărcăoanu"}},{"word":"barcarolă","pos":"noun","definitions":["barcarole"],"forms":{"plural":"barcarole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barcarolă","accusative-definite-nominative-singular":"barcarola","accusative-indefinite-nominative-plural":"barcarole","accusative-definite-nominative-plural":"barcarolele","dative-genitive-indefinite-singular":"barcarole","dative-definite-genitive-singular":"barcarolei","dative-genitive-indefinite-plural":"barcarole","dative-definite-genitive-plural":"barcarolelor","singular-vocative":"barcarolă","plural-vocative":"barcarolelor"}},{"word":"barcaș","pos":"noun","definitions":["boatman"],"forms":{"plural":"barcași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barcaș","accusative-definite-nominative-singular":"barcașul","accusative-indefinite-nominative-plural":"barcași","accusative-definite-nominative-plural":"barcașii","dative-genitive-indefinite-singular":"barcaș","dative-definite-genitive-singular":"barcașului","dative-genitive-indefinite-plural":"barcași","dative-definite-genitive-plural":"barcașilor","singular-vocative":"barcașule","plural-vocative":"barcașilor"}},{"word":"Bărcăuan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărcăuan"}},{"word":"barcaz","pos":"noun","definitions":["longboat"],"forms":{"plural":"barcazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"barcaz","accusative-definite-nominative-singular":"barcazul","accusative-indefinite-nominative-plural":"barcazuri","accusative-definite-nominative-plural":"barcazurile","dative-genitive-indefinite-singular":"barcaz","dative-definite-genitive-singular":"barcazului","dative-genitive-indefinite-plural":"barcazuri","dative-definite-genitive-plural":"barcazurilor","singular-vocative":"barcazule","plural-vocative":"barcazurilor"}},{"word":"Bârcea Mare","pos":"name","definitions":["a village in Simeria, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bîrcea Mare"}},{"word":"Bârcea Mică","pos":"name","definitions":["a village in Deva, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bîrcea Mică"}},{"word":"Barcelona","pos":"name","definitions":["Barcelona (the capital city of Catalonia, Spain)","Barcelona (a province of Catalonia, Spain)"],"gender":"f"},{"word":"barchet","pos":"noun","definitions":["alternative form of barhet"],"forms":{"plural":"barcheturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"barchet","accusative-definite-nominative-singular":"barchetul","accusative-indefinite-nominative-plural":"barcheturi","accusative-definite-nominative-plural":"barcheturile","dative-genitive-indefinite-singular":"barchet","dative-definite-genitive-singular":"barchetului","dative-genitive-indefinite-plural":"barcheturi","dative-definite-genitive-plural":"barcheturilor","singular-vocative":"barchetule","plural-vocative":"barcheturilor"}},{"word":"bărci","pos":"noun","definitions":["inflection of barcă:","indefinite genitive","indefinite nominative plural"]},{"word":"Bărcoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărcoanu"}},{"word":"Bărcut","pos":"name","definitions":["a village in Șoarș, Brașov County, Romania"],"gender":"m"},{"word":"bărcuț","pos":"noun","definitions":["young forest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bărcuț","accusative-definite-nominative":"bărcuțul","dative-genitive-indefinite":"bărcuț","dative-definite-genitive":"bărcuțului","vocative":"bărcuțule"}},{"word":"bărcuță","pos":"noun","definitions":["diminutive of barcă; small boat"],"forms":{"plural":"bărcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărcuță","accusative-definite-nominative-singular":"bărcuța","accusative-indefinite-nominative-plural":"bărcuțe","accusative-definite-nominative-plural":"bărcuțele","dative-genitive-indefinite-singular":"bărcuțe","dative-definite-genitive-singular":"bărcuței","dative-genitive-indefinite-plural":"bărcuțe","dative-definite-genitive-plural":"bărcuțelor","singular-vocative":"bărcuță","plural-vocative":"bărcuțelor"}},{"word":"Bărcuțeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărcuțeanu"}},{"word":"bard","pos":"noun","definitions":["bard"],"forms":{"plural":"barzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bard","accusative-definite-nominative-singular":"bardul","accusative-indefinite-nominative-plural":"barzi","accusative-definite-nominative-plural":"barzii","dative-genitive-indefinite-singular":"bard","dative-definite-genitive-singular":"bardului","dative-genitive-indefinite-plural":"barzi","dative-definite-genitive-plural":"barzilor","singular-vocative":"bardule","plural-vocative":"barzilor"}},{"word":"Bardă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bardă"}},{"word":"bardă","pos":"noun","definitions":["hatchet, tomahawk"],"forms":{"plural":"bărzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bardă","accusative-definite-nominative-singular":"barda","accusative-indefinite-nominative-plural":"bărzi","accusative-definite-nominative-plural":"bărzile","dative-genitive-indefinite-singular":"bărzi","dative-definite-genitive-singular":"bărzii","dative-genitive-indefinite-plural":"bărzi","dative-definite-genitive-plural":"bărzilor","singular-vocative":"bardă","plural-vocative":"bărzilor"}},{"word":"Bârda","pos":"name","definitions":["a village in Malovăț, Mehedinți County, Romania"],"gender":"f","forms":{"alternative":"Bîrda"}},{"word":"Bardac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bardac"}},{"word":"bardac","pos":"noun","definitions":["a jug"],"forms":{"plural":"bardaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bardac","accusative-definite-nominative-singular":"bardacul","accusative-indefinite-nominative-plural":"bardaci","accusative-definite-nominative-plural":"bardacii","dative-genitive-indefinite-singular":"bardac","dative-definite-genitive-singular":"bardacului","dative-genitive-indefinite-plural":"bardaci","dative-definite-genitive-plural":"bardacilor","singular-vocative":"bardacule","plural-vocative":"bardacilor"}},{"word":"bărdăcel","pos":"noun","definitions":["diminutive of bărdac"],"forms":{"plural":"bărdăcele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bărdăcel","accusative-definite-nominative-singular":"bărdăcelul","accusative-indefinite-nominative-plural":"bărdăcele","accusative-definite-nominative-plural":"bărdăcelele","dative-genitive-indefinite-singular":"bărdăcel","dative-definite-genitive-singular":"bărdăcelului","dative-genitive-indefinite-plural":"bărdăcele","dative-definite-genitive-plural":"bărdăcelelor","singular-vocative":"bărdăcelule","plural-vocative":"bărdăcelelor"}},{"word":"bărdăcuț","pos":"noun","definitions":["diminutive of bardac"],"forms":{"plural":"bărdăcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bărdăcuț","accusative-definite-nominative-singular":"bărdăcuțul","accusative-indefinite-nominative-plural":"bărdăcuțe","accusative-definite-nominative-plural":"bărdăcuțele","dative-genitive-indefinite-singular":"bărdăcuț","dative-definite-genitive-singular":"bărdăcuțului","dative-genitive-indefinite-plural":"bărdăcuțe","dative-definite-genitive-plural":"bărdăcuțelor","singular-vocative":"bărdăcuțule","plural-vocative":"bărdăcuțelor"}},{"word":"bărdăcuță","pos":"noun","definitions":["diminutive of bărdacă"],"forms":{"plural":"bărdăcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărdăcuță","accusative-definite-nominative-singular":"bărdăcuța","accusative-indefinite-nominative-plural":"bărdăcuțe","accusative-definite-nominative-plural":"bărdăcuțele","dative-genitive-indefinite-singular":"bărdăcuțe","dative-definite-genitive-singular":"bărdăcuței","dative-genitive-indefinite-plural":"bărdăcuțe","dative-definite-genitive-plural":"bărdăcuțelor","singular-vocative":"bărdăcuță","plural-vocative":"bărdăcuțelor"}},{"word":"bărdăhan","pos":"noun","definitions":["obsolete form of burduhan"],"forms":{"plural":"bărdăhanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bărdăhan","accusative-definite-nominative-singular":"bărdăhanul","accusative-indefinite-nominative-plural":"bărdăhanuri","accusative-definite-nominative-plural":"bărdăhanurile","dative-genitive-indefinite-singular":"bărdăhan","dative-definite-genitive-singular":"bărdăhanului","dative-genitive-indefinite-plural":"bărdăhanuri","dative-definite-genitive-plural":"bărdăhanurilor","singular-vocative":"bărdăhanule","plural-vocative":"bărdăhanurilor"}},{"word":"bărdăhănos","pos":"adj","definitions":["obsolete form of burduhănos"],"forms":{"feminine-singular":"bărdăhănoasă","masculine-plural":"bărdăhănoși","feminine-neuter-plural":"bărdăhănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărdăhănos","error-unrecognized-form-feminine-indefinite-singular":"bărdăhănoasă","error-unrecognized-form-indefinite-masculine-plural":"bărdăhănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărdăhănoase","definite-error-unrecognized-form-masculine-neuter-singular":"bărdăhănosul","definite-error-unrecognized-form-feminine-singular":"bărdăhănoasa","definite-error-unrecognized-form-masculine-plural":"bărdăhănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bărdăhănoasele"}},{"word":"bârdan","pos":"noun","definitions":["paunch, big belly"],"forms":{"plural":"bârdane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bârdan","accusative-definite-nominative-singular":"bârdanul","accusative-indefinite-nominative-plural":"bârdane","accusative-definite-nominative-plural":"bârdanele","dative-genitive-indefinite-singular":"bârdan","dative-definite-genitive-singular":"bârdanului","dative-genitive-indefinite-plural":"bârdane","dative-definite-genitive-plural":"bârdanelor","singular-vocative":"bârdanule","plural-vocative":"bârdanelor","alternative":"bîrdan"}},{"word":"Bărdănică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărdănică"}},{"word":"bărdănire","pos":"noun","definitions":["evisceration"],"forms":{"plural":"bărdăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bărdănire","accusative-definite-nominative-singular":"bărdănirea","accusative-indefinite-nominative-plural":"bărdăniri","accusative-definite-nominative-plural":"bărdănirile","dative-genitive-indefinite-singular":"bărdăniri","dative-definite-genitive-singular":"bărdănirii","dative-genitive-indefinite-plural":"bărdăniri","dative-definite-genitive-plural":"bărdănirilor","singular-vocative":"bărdănire","plural-vocative":"bărdănirilor"}},{"word":"bărdănos","pos":"adj","definitions":["pot-bellied"],"forms":{"feminine-singular":"bărdănoasă","masculine-plural":"bărdănoși","feminine-neuter-plural":"bărdănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărdănos","error-unrecognized-form-feminine-indefinite-singular":"bărdănoasă","error-unrecognized-form-indefinite-masculine-plural":"bărdănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărdănoase","definite-error-unrecognized-form-masculine-neuter-singular":"bărdănosul","definite-error-unrecognized-form-feminine-singular":"bărdănoasa","definite-error-unrecognized-form-masculine-plural":"bărdănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bărdănoasele"}},{"word":"bărdaș","pos":"noun","definitions":["carpenter"],"forms":{"plural":"bărdași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărdaș","accusative-definite-nominative-singular":"bărdașul","accusative-indefinite-nominative-plural":"bărdași","accusative-definite-nominative-plural":"bărdașii","dative-genitive-indefinite-singular":"bărdaș","dative-definite-genitive-singular":"bărdașului","dative-genitive-indefinite-plural":"bărdași","dative-definite-genitive-plural":"bărdașilor","singular-vocative":"bărdașule","plural-vocative":"bărdașilor"}},{"word":"bărdășire","pos":"noun","definitions":["carving"],"forms":{"plural":"bărdășiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bărdășire","accusative-definite-nominative-singular":"bărdășirea","accusative-indefinite-nominative-plural":"bărdășiri","accusative-definite-nominative-plural":"bărdășirile","dative-genitive-indefinite-singular":"bărdășiri","dative-definite-genitive-singular":"bărdășirii","dative-genitive-indefinite-plural":"bărdășiri","dative-definite-genitive-plural":"bărdășirilor","singular-vocative":"bărdășire","plural-vocative":"bărdășirilor"}},{"word":"Bărdeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărdeanu"}},{"word":"Bârdești","pos":"name","definitions":["a village in Lupșa, Alba County, Romania"],"gender":"m","forms":{"alternative":"Bîrdești"}},{"word":"Bărdești","pos":"name","definitions":["a village in Sântana de Mureș, Mureș County, Romania"],"gender":"m"},{"word":"bărdicioară","pos":"noun","definitions":["diminutive of bărdiță"],"forms":{"plural":"bărdicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărdicioară","accusative-definite-nominative-singular":"bărdicioara","accusative-indefinite-nominative-plural":"bărdicioare","accusative-definite-nominative-plural":"bărdicioarele","dative-genitive-indefinite-singular":"bărdicioare","dative-definite-genitive-singular":"bărdicioarei","dative-genitive-indefinite-plural":"bărdicioare","dative-definite-genitive-plural":"bărdicioarelor","singular-vocative":"bărdicioară","plural-vocative":"bărdicioarelor"}},{"word":"bardișă","pos":"noun","definitions":["bardiche"],"forms":{"plural":"bardișe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bardișă","accusative-definite-nominative-singular":"bardișăul","accusative-indefinite-nominative-plural":"bardișe","accusative-definite-nominative-plural":"bardișele","dative-genitive-indefinite-singular":"bardișă","dative-definite-genitive-singular":"bardișăului","dative-genitive-indefinite-plural":"bardișe","dative-definite-genitive-plural":"bardișelor","singular-vocative":"bardișăule","plural-vocative":"bardișelor"}},{"word":"Bărdiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărdiță"}},{"word":"bărdiță","pos":"noun","definitions":["diminutive of bardă; small hatchet"],"forms":{"plural":"bărdițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărdiță","accusative-definite-nominative-singular":"bărdița","accusative-indefinite-nominative-plural":"bărdițe","accusative-definite-nominative-plural":"bărdițele","dative-genitive-indefinite-singular":"bărdițe","dative-definite-genitive-singular":"bărdiței","dative-genitive-indefinite-plural":"bărdițe","dative-definite-genitive-plural":"bărdițelor","singular-vocative":"bărdiță","plural-vocative":"bărdițelor"}},{"word":"bărdoi","pos":"noun","definitions":["augmentative of bardă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bărdoi","accusative-definite-nominative":"bărdoiul","dative-genitive-indefinite":"bărdoi","dative-definite-genitive":"bărdoiului","vocative":"bărdoiule"}},{"word":"bardou","pos":"noun","definitions":["hinny (hybrid offspring of a male horse and a female donkey)"],"pronunciation":"[barˈdow]","forms":{"plural":"bardoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bardou","accusative-definite-nominative-singular":"bardoul","accusative-indefinite-nominative-plural":"bardoi","accusative-definite-nominative-plural":"bardoii","dative-genitive-indefinite-singular":"bardou","dative-definite-genitive-singular":"bardoului","dative-genitive-indefinite-plural":"bardoi","dative-definite-genitive-plural":"bardoilor","singular-vocative":"bardoule","plural-vocative":"bardoilor"}},{"word":"bărdui","pos":"verb","definitions":["to carve"],"forms":{"canonical":"a bărdui 4th conjugation","present-singular-third-person":"bărduiește","participle-past":"bărduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bărdui","gerund":"bărduind","first-person-indicative-present-singular":"bărduiesc","indicative-present-second-person-singular":"bărduiești","indicative-present-singular-third-person":"bărduiește","first-person-indicative-plural-present":"bărduim","indicative-plural-present-second-person":"bărduiți","indicative-plural-present-third-person":"bărduiesc","first-person-imperfect-indicative-singular":"bărduiam","imperfect-indicative-second-person-singular":"bărduiai","imperfect-indicative-singular-third-person":"bărduia","first-person-imperfect-indicative-plural":"bărduiam","imperfect-indicative-plural-second-person":"bărduiați","imperfect-indicative-plural-third-person":"bărduiau","first-person-indicative-perfect-singular":"bărduii","indicative-perfect-second-person-singular":"bărduiși","indicative-perfect-singular-third-person":"bărdui","first-person-indicative-perfect-plural":"bărduirăm","indicative-perfect-plural-second-person":"bărduirăți","indicative-perfect-plural-third-person":"bărduiră","first-person-indicative-pluperfect-singular":"bărduisem","indicative-pluperfect-second-person-singular":"bărduiseși","indicative-pluperfect-singular-third-person":"bărduise","first-person-indicative-pluperfect-plural":"bărduiserăm","indicative-pluperfect-plural-second-person":"bărduiserăți","indicative-pluperfect-plural-third-person":"bărduiseră","first-person-present-singular-subjunctive":"să bărduiesc","present-second-person-singular-subjunctive":"să bărduiești","present-singular-subjunctive-third-person":"să bărduiască","first-person-plural-present-subjunctive":"să bărduim","plural-present-second-person-subjunctive":"să bărduiți","plural-present-subjunctive-third-person":"să bărduiască","imperative-second-person-singular":"bărduiește","imperative-plural-second-person":"bărduiți","imperative-negative-second-person-singular":"nu bărdui","imperative-negative-plural-second-person":"nu bărduiți"}},{"word":"bărduire","pos":"noun","definitions":["carving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bărduire","accusative-definite-nominative":"bărduirea","dative-genitive-indefinite":"bărduiri","dative-definite-genitive":"bărduirii","vocative":"bărduire"}},{"word":"bărduit","pos":"adj","definitions":["carved"],"forms":{"feminine-singular":"bărduită","masculine-plural":"bărduiți","feminine-neuter-plural":"bărduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărduit","error-unrecognized-form-feminine-indefinite-singular":"bărduită","error-unrecognized-form-indefinite-masculine-plural":"bărduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărduite","definite-error-unrecognized-form-masculine-neuter-singular":"bărduitul","definite-error-unrecognized-form-feminine-singular":"bărduita","definite-error-unrecognized-form-masculine-plural":"bărduiții","definite-error-unrecognized-form-feminine-neuter-plural":"bărduitele"}},{"word":"bărduit","pos":"verb","definitions":["past participle of bărdui"],"forms":{"participle-past":"of bărdui"}},{"word":"bare paralele","pos":"noun","definitions":["parallel bars"]},{"word":"băreag","pos":"noun","definitions":["prop"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"băreag","accusative-definite-nominative":"băreagul","dative-genitive-indefinite":"băreag","dative-definite-genitive":"băreagului","vocative":"băreagule"}},{"word":"Băreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băreanu"}},{"word":"barej","pos":"noun","definitions":["alternative form of bariș"],"forms":{"plural":"bareje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barej","accusative-definite-nominative-singular":"barejul","accusative-indefinite-nominative-plural":"bareje","accusative-definite-nominative-plural":"barejele","dative-genitive-indefinite-singular":"barej","dative-definite-genitive-singular":"barejului","dative-genitive-indefinite-plural":"bareje","dative-definite-genitive-plural":"barejelor","singular-vocative":"barejule","plural-vocative":"barejelor"}},{"word":"barem","pos":"adv","definitions":["at least"]},{"word":"baremi","pos":"adv","definitions":["alternative form of barem"]},{"word":"baretă","pos":"noun","definitions":["barrette"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baretă","accusative-definite-nominative-singular":"bareta","accusative-indefinite-nominative-plural":"barete","accusative-definite-nominative-plural":"baretele","dative-genitive-indefinite-singular":"barete","dative-definite-genitive-singular":"baretei","dative-genitive-indefinite-plural":"barete","dative-definite-genitive-plural":"baretelor","singular-vocative":"baretă","plural-vocative":"baretelor"}},{"word":"bârfă","pos":"noun","definitions":["gossip, chit-chat","slander"],"forms":{"plural":"bârfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârfă","accusative-definite-nominative-singular":"bârfa","accusative-indefinite-nominative-plural":"bârfe","accusative-definite-nominative-plural":"bârfele","dative-genitive-indefinite-singular":"bârfe","dative-definite-genitive-singular":"bârfei","dative-genitive-indefinite-plural":"bârfe","dative-definite-genitive-plural":"bârfelor","singular-vocative":"bârfă","plural-vocative":"bârfelor","alternative":"bîrfă"}},{"word":"bârfaș","pos":"noun","definitions":["gossiper"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bârfaș","accusative-definite-nominative":"bârfașul","dative-genitive-indefinite":"bârfaș","dative-definite-genitive":"bârfașului","vocative":"bârfașule"}},{"word":"bârfe","pos":"noun","definitions":["plural of bârfă"]},{"word":"bârfeală","pos":"noun","definitions":["gossip"],"forms":{"plural":"bărfeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârfeală","accusative-definite-nominative-singular":"bârfeala","accusative-indefinite-nominative-plural":"bărfele","accusative-definite-nominative-plural":"bărfelele","dative-genitive-indefinite-singular":"bărfele","dative-definite-genitive-singular":"bărfelei","dative-genitive-indefinite-plural":"bărfele","dative-definite-genitive-plural":"bărfelelor","singular-vocative":"bârfeală","plural-vocative":"bărfelelor","alternative":"bîrfeală"}},{"word":"bârfi","pos":"verb","definitions":["to backbite, to gossip, to tattle"],"forms":{"canonical":"a bârfi 4th conjugation","present-singular-third-person":"bârfește","participle-past":"bârfit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bârfi","gerund":"bârfind","first-person-indicative-present-singular":"bârfesc","indicative-present-second-person-singular":"bârfești","indicative-present-singular-third-person":"bârfește","first-person-indicative-plural-present":"bârfim","indicative-plural-present-second-person":"bârfiți","indicative-plural-present-third-person":"bârfesc","first-person-imperfect-indicative-singular":"bârfeam","imperfect-indicative-second-person-singular":"bârfeai","imperfect-indicative-singular-third-person":"bârfea","first-person-imperfect-indicative-plural":"bârfeam","imperfect-indicative-plural-second-person":"bârfeați","imperfect-indicative-plural-third-person":"bârfeau","first-person-indicative-perfect-singular":"bârfii","indicative-perfect-second-person-singular":"bârfiși","indicative-perfect-singular-third-person":"bârfi","first-person-indicative-perfect-plural":"bârfirăm","indicative-perfect-plural-second-person":"bârfirăți","indicative-perfect-plural-third-person":"bârfiră","first-person-indicative-pluperfect-singular":"bârfisem","indicative-pluperfect-second-person-singular":"bârfiseși","indicative-pluperfect-singular-third-person":"bârfise","first-person-indicative-pluperfect-plural":"bârfiserăm","indicative-pluperfect-plural-second-person":"bârfiserăți","indicative-pluperfect-plural-third-person":"bârfiseră","first-person-present-singular-subjunctive":"să bârfesc","present-second-person-singular-subjunctive":"să bârfești","present-singular-subjunctive-third-person":"să bârfească","first-person-plural-present-subjunctive":"să bârfim","plural-present-second-person-subjunctive":"să bârfiți","plural-present-subjunctive-third-person":"să bârfească","imperative-second-person-singular":"bârfește","imperative-plural-second-person":"bârfiți","imperative-negative-second-person-singular":"nu bârfi","imperative-negative-plural-second-person":"nu bârfiți","alternative":"bîrfi"}},{"word":"bârfire","pos":"noun","definitions":["slandering"],"forms":{"plural":"bârfiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bârfire","accusative-definite-nominative-singular":"bârfirea","accusative-indefinite-nominative-plural":"bârfiri","accusative-definite-nominative-plural":"bârfirile","dative-genitive-indefinite-singular":"bârfiri","dative-definite-genitive-singular":"bârfirii","dative-genitive-indefinite-plural":"bârfiri","dative-definite-genitive-plural":"bârfirilor","singular-vocative":"bârfire","plural-vocative":"bârfirilor","alternative":"bîrfire"}},{"word":"bârfit","pos":"adj","definitions":["gossiped about"],"forms":{"feminine-singular":"bârfită","masculine-plural":"bârfiți","feminine-neuter-plural":"bârfite"}},{"word":"bârfit","pos":"noun","definitions":["gossiping"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bârfit","accusative-definite-nominative":"bârfitul","dative-genitive-indefinite":"bârfit","dative-definite-genitive":"bârfitului","vocative":"bârfitule"}},{"word":"bârfit","pos":"verb","definitions":["past participle of bârfi"]},{"word":"bârfitoare","pos":"adj","definitions":["indefinite feminine singular/plural of bârfitor (“gossiping”)"],"forms":{"alternative":"bîrfitoare"}},{"word":"bârfitoare","pos":"noun","definitions":["female equivalent of bârfitor (“gossiper”)"],"forms":{"plural":"bârfitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"bârfitoare","accusative-definite-nominative-singular":"bârfitoarea","accusative-indefinite-nominative-plural":"bârfitoare","accusative-definite-nominative-plural":"bârfitoarele","dative-genitive-indefinite-singular":"bârfitoare","dative-definite-genitive-singular":"bârfitoarei","dative-genitive-indefinite-plural":"bârfitoare","dative-definite-genitive-plural":"bârfitoarelor","singular-vocative":"bârfitoare","plural-vocative":"bârfitoarelor","alternative":"bîrfitoare"}},{"word":"bârfitor","pos":"adj","definitions":["gossiping"],"forms":{"feminine-singular":"bârfitoare","masculine-plural":"bârfitori","feminine-neuter-plural":"bârfitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bârfitor","error-unrecognized-form-feminine-indefinite-singular":"bârfitoare","error-unrecognized-form-indefinite-masculine-plural":"bârfitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bârfitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bârfitorul","definite-error-unrecognized-form-feminine-singular":"bârfitoarea","definite-error-unrecognized-form-masculine-plural":"bârfitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bârfitoarele","alternative":"bîrfitor"}},{"word":"bârfitor","pos":"noun","definitions":["gossip (someone who gossips)"],"forms":{"plural":"bârfitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bârfitor","accusative-definite-nominative-singular":"bârfitorul","accusative-indefinite-nominative-plural":"bârfitori","accusative-definite-nominative-plural":"bârfitorii","dative-genitive-indefinite-singular":"bârfitor","dative-definite-genitive-singular":"bârfitorului","dative-genitive-indefinite-plural":"bârfitori","dative-definite-genitive-plural":"bârfitorilor","singular-vocative":"bârfitorule","plural-vocative":"bârfitorilor","alternative":"bîrfitor"}},{"word":"bârfitură","pos":"noun","definitions":["gossiping"],"forms":{"plural":"bârfituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bârfitură","accusative-definite-nominative-singular":"bârfitura","accusative-indefinite-nominative-plural":"bârfituri","accusative-definite-nominative-plural":"bârfiturile","dative-genitive-indefinite-singular":"bârfituri","dative-definite-genitive-singular":"bârfiturii","dative-genitive-indefinite-plural":"bârfituri","dative-definite-genitive-plural":"bârfiturilor","singular-vocative":"bârfitură","plural-vocative":"bârfiturilor","alternative":"bîrfitură"}},{"word":"Bârgăoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârgăoanu","alternative":"Bîrgăoanu"}},{"word":"Bărgăoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărgăoanu"}},{"word":"Bârgăuan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârgăuan"}},{"word":"Bârgauani","pos":"name","definitions":["a village in Bârgăuani, Neamț County, Romania"],"gender":"m"},{"word":"Bârgăuani","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Bârgăuani, Neamț County, Romania"],"gender":"m","forms":{"alternative":"Bîrgăuani"}},{"word":"Bârgăuanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârgăuanu","alternative":"Bîrgăuanu"}},{"word":"Bărgăuanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bărgăuanu"}},{"word":"bârgină","pos":"noun","definitions":["beam"],"forms":{"plural":"bârgine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârgină","accusative-definite-nominative-singular":"bârgina","accusative-indefinite-nominative-plural":"bârgine","accusative-definite-nominative-plural":"bârginele","dative-genitive-indefinite-singular":"bârgine","dative-definite-genitive-singular":"bârginei","dative-genitive-indefinite-plural":"bârgine","dative-definite-genitive-plural":"bârginelor","singular-vocative":"bârgină","plural-vocative":"bârginelor","alternative":"bîrgină"}},{"word":"bărgit","pos":"adj","definitions":["shaving"],"forms":{"feminine-singular":"bărgită","masculine-plural":"bărgiți","feminine-neuter-plural":"bărgite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărgit","error-unrecognized-form-feminine-indefinite-singular":"bărgită","error-unrecognized-form-indefinite-masculine-plural":"bărgiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărgite","definite-error-unrecognized-form-masculine-neuter-singular":"bărgitul","definite-error-unrecognized-form-feminine-singular":"bărgita","definite-error-unrecognized-form-masculine-plural":"bărgiții","definite-error-unrecognized-form-feminine-neuter-plural":"bărgitele"}},{"word":"bărgit","pos":"verb","definitions":["past participle of bărgi"],"forms":{"participle-past":"of bărgi"}},{"word":"baric","pos":"adj","definitions":["baric"],"forms":{"feminine-singular":"barică","masculine-plural":"barici","feminine-neuter-plural":"barice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"baric","error-unrecognized-form-feminine-indefinite-singular":"barică","error-unrecognized-form-indefinite-masculine-plural":"barici","error-unrecognized-form-feminine-indefinite-neuter-plural":"barice","definite-error-unrecognized-form-masculine-neuter-singular":"baricul","definite-error-unrecognized-form-feminine-singular":"barica","definite-error-unrecognized-form-masculine-plural":"baricii","definite-error-unrecognized-form-feminine-neuter-plural":"baricele"}},{"word":"baricada","pos":"verb","definitions":["to barricade"],"forms":{"canonical":"a baricada 1st conjugation","present-singular-third-person":"baricadează","participle-past":"baricadat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a baricada","gerund":"baricadând","first-person-indicative-present-singular":"baricadez","indicative-present-second-person-singular":"baricadezi","indicative-present-singular-third-person":"baricadează","first-person-indicative-plural-present":"baricadăm","indicative-plural-present-second-person":"baricadați","indicative-plural-present-third-person":"baricadează","first-person-imperfect-indicative-singular":"baricadam","imperfect-indicative-second-person-singular":"baricadai","imperfect-indicative-singular-third-person":"baricada","first-person-imperfect-indicative-plural":"baricadam","imperfect-indicative-plural-second-person":"baricadați","imperfect-indicative-plural-third-person":"baricadau","first-person-indicative-perfect-singular":"baricadai","indicative-perfect-second-person-singular":"baricadași","indicative-perfect-singular-third-person":"baricadă","first-person-indicative-perfect-plural":"baricadarăm","indicative-perfect-plural-second-person":"baricadarăți","indicative-perfect-plural-third-person":"baricadară","first-person-indicative-pluperfect-singular":"baricadasem","indicative-pluperfect-second-person-singular":"baricadaseși","indicative-pluperfect-singular-third-person":"baricadase","first-person-indicative-pluperfect-plural":"baricadaserăm","indicative-pluperfect-plural-second-person":"baricadaserăți","indicative-pluperfect-plural-third-person":"baricadaseră","first-person-present-singular-subjunctive":"să baricadez","present-second-person-singular-subjunctive":"să baricadezi","present-singular-subjunctive-third-person":"să baricadeze","first-person-plural-present-subjunctive":"să baricadăm","plural-present-second-person-subjunctive":"să baricadați","plural-present-subjunctive-third-person":"să baricadeze","imperative-second-person-singular":"baricadează","imperative-plural-second-person":"baricadați","imperative-negative-second-person-singular":"nu baricada","imperative-negative-plural-second-person":"nu baricadați"}},{"word":"baricadă","pos":"noun","definitions":["barricade"],"forms":{"plural":"baricade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baricadă","accusative-definite-nominative-singular":"baricada","accusative-indefinite-nominative-plural":"baricade","accusative-definite-nominative-plural":"baricadele","dative-genitive-indefinite-singular":"baricade","dative-definite-genitive-singular":"baricadei","dative-genitive-indefinite-plural":"baricade","dative-definite-genitive-plural":"baricadelor","singular-vocative":"baricadă","plural-vocative":"baricadelor"}},{"word":"baricadare","pos":"noun","definitions":["barricading"],"forms":{"plural":"baricadări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"baricadare","accusative-definite-nominative-singular":"baricadarea","accusative-indefinite-nominative-plural":"baricadări","accusative-definite-nominative-plural":"baricadările","dative-genitive-indefinite-singular":"baricadări","dative-definite-genitive-singular":"baricadării","dative-genitive-indefinite-plural":"baricadări","dative-definite-genitive-plural":"baricadărilor","singular-vocative":"baricadare","plural-vocative":"baricadărilor"}},{"word":"baricadat","pos":"noun","definitions":["barricading"],"forms":{"plural":"baricadaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"baricadat","accusative-definite-nominative-singular":"baricadatul","accusative-indefinite-nominative-plural":"baricadaturi","accusative-definite-nominative-plural":"baricadaturile","dative-genitive-indefinite-singular":"baricadat","dative-definite-genitive-singular":"baricadatului","dative-genitive-indefinite-plural":"baricadaturi","dative-definite-genitive-plural":"baricadaturilor","singular-vocative":"baricadatule","plural-vocative":"baricadaturilor"}},{"word":"baricadat","pos":"verb","definitions":["past participle of baricada"],"forms":{"participle-past":"of baricada"}},{"word":"baricentru","pos":"noun","definitions":["barycenter"],"forms":{"plural":"baricentre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baricentru","accusative-definite-nominative-singular":"baricentrul","accusative-indefinite-nominative-plural":"baricentre","accusative-definite-nominative-plural":"baricentrele","dative-genitive-indefinite-singular":"baricentru","dative-definite-genitive-singular":"baricentrului","dative-genitive-indefinite-plural":"baricentre","dative-definite-genitive-plural":"baricentrelor","singular-vocative":"baricentrule","plural-vocative":"baricentrelor"}},{"word":"barie","pos":"noun","definitions":["barye"],"forms":{"plural":"barii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"barie","accusative-definite-nominative-singular":"baria","accusative-indefinite-nominative-plural":"barii","accusative-definite-nominative-plural":"bariile","dative-genitive-indefinite-singular":"barii","dative-definite-genitive-singular":"bariei","dative-genitive-indefinite-plural":"barii","dative-definite-genitive-plural":"bariilor","singular-vocative":"barie","plural-vocative":"bariilor"}},{"word":"barieră","pos":"noun","definitions":["barrier, fence"],"forms":{"plural":"bariere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barieră","accusative-definite-nominative-singular":"bariera","accusative-indefinite-nominative-plural":"bariere","accusative-definite-nominative-plural":"barierele","dative-genitive-indefinite-singular":"bariere","dative-definite-genitive-singular":"barierei","dative-genitive-indefinite-plural":"bariere","dative-definite-genitive-plural":"barierelor","singular-vocative":"barieră","plural-vocative":"barierelor"}},{"word":"baril","pos":"noun","definitions":["barrel"],"forms":{"plural":"barili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baril","accusative-definite-nominative-singular":"barilul","accusative-indefinite-nominative-plural":"barili","accusative-definite-nominative-plural":"barilii","dative-genitive-indefinite-singular":"baril","dative-definite-genitive-singular":"barilului","dative-genitive-indefinite-plural":"barili","dative-definite-genitive-plural":"barililor","singular-vocative":"barilule","plural-vocative":"barililor"}},{"word":"barim","pos":"adv","definitions":["alternative form of barem"]},{"word":"barimetrie","pos":"noun","definitions":["barymetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"barimetrie","accusative-definite-nominative":"barimetria","dative-genitive-indefinite":"barimetrii","dative-definite-genitive":"barimetriei","vocative":"barimetrie"}},{"word":"bariș","pos":"noun","definitions":["barège"],"forms":{"plural":"barișe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bariș","accusative-definite-nominative-singular":"barișul","accusative-indefinite-nominative-plural":"barișe","accusative-definite-nominative-plural":"barișele","dative-genitive-indefinite-singular":"bariș","dative-definite-genitive-singular":"barișului","dative-genitive-indefinite-plural":"barișe","dative-definite-genitive-plural":"barișelor","singular-vocative":"barișule","plural-vocative":"barișelor"}},{"word":"barisferă","pos":"noun","definitions":["barysphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barisferă","accusative-definite-nominative-singular":"barisfera","accusative-indefinite-nominative-plural":"barisfere","accusative-definite-nominative-plural":"barisferele","dative-genitive-indefinite-singular":"barisfere","dative-definite-genitive-singular":"barisferei","dative-genitive-indefinite-plural":"barisfere","dative-definite-genitive-plural":"barisferelor","singular-vocative":"barisferă","plural-vocative":"barisferelor"}},{"word":"barit","pos":"noun","definitions":["baryte"],"forms":{"plural":"barite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barit","accusative-definite-nominative-singular":"baritul","accusative-indefinite-nominative-plural":"barite","accusative-definite-nominative-plural":"baritele","dative-genitive-indefinite-singular":"barit","dative-definite-genitive-singular":"baritului","dative-genitive-indefinite-plural":"barite","dative-definite-genitive-plural":"baritelor","singular-vocative":"baritule","plural-vocative":"baritelor"}},{"word":"barită","pos":"noun","definitions":["barite"],"forms":{"plural":"barite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barită","accusative-definite-nominative-singular":"barita","accusative-indefinite-nominative-plural":"barite","accusative-definite-nominative-plural":"baritele","dative-genitive-indefinite-singular":"barite","dative-definite-genitive-singular":"baritei","dative-genitive-indefinite-plural":"barite","dative-definite-genitive-plural":"baritelor","singular-vocative":"barită","plural-vocative":"baritelor"}},{"word":"baritină","pos":"noun","definitions":["barite"],"forms":{"plural":"baritine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baritină","accusative-definite-nominative-singular":"baritina","accusative-indefinite-nominative-plural":"baritine","accusative-definite-nominative-plural":"baritinele","dative-genitive-indefinite-singular":"baritine","dative-definite-genitive-singular":"baritinei","dative-genitive-indefinite-plural":"baritine","dative-definite-genitive-plural":"baritinelor","singular-vocative":"baritină","plural-vocative":"baritinelor"}},{"word":"bariton","pos":"noun","definitions":["baritone"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bariton","accusative-definite-nominative":"baritonul","dative-genitive-indefinite":"bariton","dative-definite-genitive":"baritonului","vocative":"baritonule"}},{"word":"bariu","pos":"noun","definitions":["barium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bariu","accusative-definite-nominative":"bariul","dative-genitive-indefinite":"bariu","dative-definite-genitive":"bariului","vocative":"bariule"}},{"word":"bariz","pos":"noun","definitions":["alternative form of bariș"],"forms":{"plural":"barizuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bariz","accusative-definite-nominative-singular":"barizul","accusative-indefinite-nominative-plural":"barizuri","accusative-definite-nominative-plural":"barizurile","dative-genitive-indefinite-singular":"bariz","dative-definite-genitive-singular":"barizului","dative-genitive-indefinite-plural":"barizuri","dative-definite-genitive-plural":"barizurilor","singular-vocative":"barizule","plural-vocative":"barizurilor"}},{"word":"barjă","pos":"noun","definitions":["barge (boat)"],"forms":{"plural":"barje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barjă","accusative-definite-nominative-singular":"barja","accusative-indefinite-nominative-plural":"barje","accusative-definite-nominative-plural":"barjele","dative-genitive-indefinite-singular":"barje","dative-definite-genitive-singular":"barjei","dative-genitive-indefinite-plural":"barje","dative-definite-genitive-plural":"barjelor","singular-vocative":"barjă","plural-vocative":"barjelor"}},{"word":"Bârjoveni","pos":"name","definitions":["a village in Secuieni, Neamț County, Romania"],"gender":"m"},{"word":"Bârla","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bârla, Argeș County, Romania","a village in Mărișelu, Bistrița-Năsăud County, Romania"],"gender":"f","forms":{"alternative":"Bîrla"}},{"word":"Bârlad","pos":"name","definitions":["a city in Vaslui County, Romania","a river in Romania, tributary to the Siret"],"pronunciation":"/bɨrˈlad/","gender":"m","forms":{"alternative":"Bîrlad"}},{"word":"bârlădean","pos":"adj","definitions":["of, from or relating to Bârlad"],"forms":{"feminine-singular":"bârlădeană","masculine-plural":"bârlădeni","feminine-neuter-plural":"bârlădene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bârlădean","error-unrecognized-form-feminine-indefinite-singular":"bârlădeană","error-unrecognized-form-indefinite-masculine-plural":"bârlădeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bârlădene","definite-error-unrecognized-form-masculine-neuter-singular":"bârlădeanul","definite-error-unrecognized-form-feminine-singular":"bârlădeana","definite-error-unrecognized-form-masculine-plural":"bârlădenii","definite-error-unrecognized-form-feminine-neuter-plural":"bârlădenele","alternative":"bîrlădean"}},{"word":"bârlădean","pos":"noun","definitions":["native or inhabitant of Bârlad (usually male)"],"forms":{"plural":"bârlădeni","feminine":"equivalent bârlădeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bârlădean","accusative-definite-nominative-singular":"bârlădeanul","accusative-indefinite-nominative-plural":"bârlădeni","accusative-definite-nominative-plural":"bârlădenii","dative-genitive-indefinite-singular":"bârlădean","dative-definite-genitive-singular":"bârlădeanului","dative-genitive-indefinite-plural":"bârlădeni","dative-definite-genitive-plural":"bârlădenilor","singular-vocative":"bârlădeanule","plural-vocative":"bârlădenilor","alternative":"bîrlădean"}},{"word":"bărlădean","pos":"adj","definitions":["alternative form of bârlădean (“of, from or relating to Bârlad”)"],"forms":{"feminine-singular":"bărlădeană","masculine-plural":"bărlădeni","feminine-neuter-plural":"bărlădene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărlădean","error-unrecognized-form-feminine-indefinite-singular":"bărlădeană","error-unrecognized-form-indefinite-masculine-plural":"bărlădeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărlădene","definite-error-unrecognized-form-masculine-neuter-singular":"bărlădeanul","definite-error-unrecognized-form-feminine-singular":"bărlădeana","definite-error-unrecognized-form-masculine-plural":"bărlădenii","definite-error-unrecognized-form-feminine-neuter-plural":"bărlădenele"}},{"word":"bărlădean","pos":"noun","definitions":["alternative form of bârlădean (“native or inhabitant of Bârlad”)"],"forms":{"plural":"bârlădeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărlădean","accusative-definite-nominative-singular":"bărlădeanul","accusative-indefinite-nominative-plural":"bărlădeni","accusative-definite-nominative-plural":"bărlădenii","dative-genitive-indefinite-singular":"bărlădean","dative-definite-genitive-singular":"bărlădeanului","dative-genitive-indefinite-plural":"bărlădeni","dative-definite-genitive-plural":"bărlădenilor","singular-vocative":"bărlădeanule","plural-vocative":"bărlădenilor"}},{"word":"bârlădeană","pos":"noun","definitions":["female equivalent of bârlădean"],"forms":{"plural":"bârlădene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârlădeană","accusative-definite-nominative-singular":"bârlădeana","accusative-indefinite-nominative-plural":"bârlădene","accusative-definite-nominative-plural":"bârlădenele","dative-genitive-indefinite-singular":"bârlădene","dative-definite-genitive-singular":"bârlădenei","dative-genitive-indefinite-plural":"bârlădene","dative-definite-genitive-plural":"bârlădenelor","singular-vocative":"bârlădeană","plural-vocative":"bârlădenelor","alternative":"bîrlădeană"}},{"word":"bârlădeancă","pos":"noun","definitions":["female equivalent of bârlădean"],"forms":{"plural":"bârlădence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârlădeancă","accusative-definite-nominative-singular":"bârlădeanca","accusative-indefinite-nominative-plural":"bârlădence","accusative-definite-nominative-plural":"bârlădencele","dative-genitive-indefinite-singular":"bârlădence","dative-definite-genitive-singular":"bârlădencei","dative-genitive-indefinite-plural":"bârlădence","dative-definite-genitive-plural":"bârlădencelor","singular-vocative":"bârlădeancă","plural-vocative":"bârlădencelor","alternative":"bîrlădeancă"}},{"word":"bărlădeancă","pos":"noun","definitions":["female equivalent of bărlădean"],"forms":{"plural":"bărlădence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărlădeancă","accusative-definite-nominative-singular":"bărlădeanca","accusative-indefinite-nominative-plural":"bărlădence","accusative-definite-nominative-plural":"bărlădencele","dative-genitive-indefinite-singular":"bărlădence","dative-definite-genitive-singular":"bărlădencei","dative-genitive-indefinite-plural":"bărlădence","dative-definite-genitive-plural":"bărlădencelor","singular-vocative":"bărlădeancă","plural-vocative":"bărlădencelor"}},{"word":"Bârlădeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârlădeanu","alternative":"Bîrlădeanu"}},{"word":"Bârlădianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârlădianu","alternative":"Bîrlădianu"}},{"word":"Bârlălești","pos":"name","definitions":["a village in Epureni, Vaslui County, Romania"],"gender":"m","forms":{"alternative":"Bîrlălești"}},{"word":"Bârlea","pos":"name","definitions":["a village in Cornești, Cluj County, Romania"],"gender":"f","forms":{"alternative":"Bîrlea"}},{"word":"Bârlescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bârlescu","alternative":"Bîrlescu"}},{"word":"Bârlești","pos":"name","definitions":["a village in Bistra, Alba County, Romania","a village in Mogoș, Alba County, Romania","a village in Scărișoara, Alba County, Romania","a village in Erbiceni, Iași County, Romania"],"gender":"m","forms":{"alternative":"Bîrlești"}},{"word":"Bârlești-Cătun","pos":"name","definitions":["a village in Mogoș, Alba County, Romania"],"gender":"m","forms":{"alternative":"Bîrlești-Cătun"}},{"word":"Bârlibaș","pos":"name","definitions":["a village in Sânpetru de Câmpie, Mureș County, Romania"],"gender":"m","forms":{"alternative":"Bîrlibaș"}},{"word":"Bârlibășoaia","pos":"name","definitions":["a village in Albești, Mureș County, Romania"],"gender":"f","forms":{"alternative":"Bîrlibășoaia"}},{"word":"bârliga","pos":"verb","definitions":["to raise the tail"],"forms":{"canonical":"a bârliga 1st conjugation","present-singular-third-person":"bârligă","participle-past":"bârligat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bârliga","gerund":"bârligând","first-person-indicative-present-singular":"bârlig","indicative-present-second-person-singular":"bârligi","indicative-present-singular-third-person":"bârligă","first-person-indicative-plural-present":"bârligăm","indicative-plural-present-second-person":"bârligați","indicative-plural-present-third-person":"bârligă","first-person-imperfect-indicative-singular":"bârligam","imperfect-indicative-second-person-singular":"bârligai","imperfect-indicative-singular-third-person":"bârliga","first-person-imperfect-indicative-plural":"bârligam","imperfect-indicative-plural-second-person":"bârligați","imperfect-indicative-plural-third-person":"bârligau","first-person-indicative-perfect-singular":"bârligai","indicative-perfect-second-person-singular":"bârligași","indicative-perfect-singular-third-person":"bârligă","first-person-indicative-perfect-plural":"bârligarăm","indicative-perfect-plural-second-person":"bârligarăți","indicative-perfect-plural-third-person":"bârligară","first-person-indicative-pluperfect-singular":"bârligasem","indicative-pluperfect-second-person-singular":"bârligaseși","indicative-pluperfect-singular-third-person":"bârligase","first-person-indicative-pluperfect-plural":"bârligaserăm","indicative-pluperfect-plural-second-person":"bârligaserăți","indicative-pluperfect-plural-third-person":"bârligaseră","first-person-present-singular-subjunctive":"să bârlig","present-second-person-singular-subjunctive":"să bârligi","present-singular-subjunctive-third-person":"să bârlige","first-person-plural-present-subjunctive":"să bârligăm","plural-present-second-person-subjunctive":"să bârligați","plural-present-subjunctive-third-person":"să bârlige","imperative-second-person-singular":"bârligă","imperative-plural-second-person":"bârligați","imperative-negative-second-person-singular":"nu bârliga","imperative-negative-plural-second-person":"nu bârligați","alternative":"bîrliga"}},{"word":"bârloc","pos":"noun","definitions":["obsolete form of bârlog"],"forms":{"plural":"bârlocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bârloc","accusative-definite-nominative-singular":"bârlocul","accusative-indefinite-nominative-plural":"bârlocuri","accusative-definite-nominative-plural":"bârlocurile","dative-genitive-indefinite-singular":"bârloc","dative-definite-genitive-singular":"bârlocului","dative-genitive-indefinite-plural":"bârlocuri","dative-definite-genitive-plural":"bârlocurilor","singular-vocative":"bârlocule","plural-vocative":"bârlocurilor","alternative":"bîrloc"}},{"word":"Bârlog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bârlog","alternative":"Bîrlog"}},{"word":"bârlog","pos":"noun","definitions":["cave","den"],"pronunciation":"/bɨrˈloɡ/","forms":{"plural":"bârloguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bârlog","accusative-definite-nominative-singular":"bârlogul","accusative-indefinite-nominative-plural":"bârloguri","accusative-definite-nominative-plural":"bârlogurile","dative-genitive-indefinite-singular":"bârlog","dative-definite-genitive-singular":"bârlogului","dative-genitive-indefinite-plural":"bârloguri","dative-definite-genitive-plural":"bârlogurilor","singular-vocative":"bârlogule","plural-vocative":"bârlogurilor","alternative":"bîrlog"}},{"word":"bârlogel","pos":"noun","definitions":["diminutive of bârlog"],"forms":{"plural":"bârlogele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bârlogel","accusative-definite-nominative-singular":"bârlogelul","accusative-indefinite-nominative-plural":"bârlogele","accusative-definite-nominative-plural":"bârlogelele","dative-genitive-indefinite-singular":"bârlogel","dative-definite-genitive-singular":"bârlogelului","dative-genitive-indefinite-plural":"bârlogele","dative-definite-genitive-plural":"bârlogelelor","singular-vocative":"bârlogelule","plural-vocative":"bârlogelelor","alternative":"bîrlogel"}},{"word":"Bârlogeni","pos":"name","definitions":["a village in Stângăceaua, Mehedinți County, Romania"],"gender":"m","forms":{"alternative":"Bîrlogeni"}},{"word":"Bârlogu","pos":"name","definitions":["a village in Negrași, Argeș County, Romania","a village in Stoenești, Vâlcea County, Romania"],"gender":"m","forms":{"alternative":"Bîrlogu"}},{"word":"bârlogul","pos":"noun","definitions":["definite nominative/accusative singular of bârlog"]},{"word":"bârlogului","pos":"noun","definitions":["definite genitive/dative singular of bârlog"]},{"word":"Bârloi","pos":"name","definitions":["a village in Bogați, Argeș County, Romania"],"gender":"m","forms":{"alternative":"Bîrloi"}},{"word":"bârlugă","pos":"noun","definitions":["stone loach"],"forms":{"plural":"bârlugi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bârlugă","accusative-definite-nominative-singular":"bârluga","accusative-indefinite-nominative-plural":"bârlugi","accusative-definite-nominative-plural":"bârlugile","dative-genitive-indefinite-singular":"bârlugi","dative-definite-genitive-singular":"bârlugii","dative-genitive-indefinite-plural":"bârlugi","dative-definite-genitive-plural":"bârlugilor","singular-vocative":"bârlugă","plural-vocative":"bârlugilor"}},{"word":"Bârlui","pos":"name","definitions":["a river in Olt, Romania, tributary to the Olteț"],"gender":"m","forms":{"alternative":"Bîrlui"}},{"word":"barman","pos":"noun","definitions":["barman, bartender"],"pronunciation":"/ˈbar.man/","forms":{"plural":"barmani","feminine":"equivalent barmaniță","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barman","accusative-definite-nominative-singular":"barmanul","accusative-indefinite-nominative-plural":"barmani","accusative-definite-nominative-plural":"barmanii","dative-genitive-indefinite-singular":"barman","dative-definite-genitive-singular":"barmanului","dative-genitive-indefinite-plural":"barmani","dative-definite-genitive-plural":"barmanilor","singular-vocative":"barmanule","plural-vocative":"barmanilor"}},{"word":"barmani","pos":"noun","definitions":["plural of barman"],"gender":"m"},{"word":"barmaniță","pos":"noun","definitions":["female equivalent of barman: barmaid"],"pronunciation":"/ˈbar.ma.ni.t͡sə/","forms":{"plural":"barmanițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"barmaniță","accusative-definite-nominative-singular":"barmanița","accusative-indefinite-nominative-plural":"barmanițe","accusative-definite-nominative-plural":"barmanițele","dative-genitive-indefinite-singular":"barmanițe","dative-definite-genitive-singular":"barmaniței","dative-genitive-indefinite-plural":"barmanițe","dative-definite-genitive-plural":"barmanițelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"barmanițe","pos":"noun","definitions":["plural of barmaniță"],"gender":"f"},{"word":"Barna","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barna"}},{"word":"Bârna","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Bârna, Timiș County, Romania"],"gender":"f","forms":{"alternative":"Bîrna"}},{"word":"bârna","pos":"noun","definitions":["definite nominative/accusative singular of bârnă"]},{"word":"Bârnă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bârnă","alternative":"Bîrnă"}},{"word":"bârnă","pos":"noun","definitions":["beam"],"forms":{"plural":"bârne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârnă","accusative-definite-nominative-singular":"bârna","accusative-indefinite-nominative-plural":"bârne","accusative-definite-nominative-plural":"bârnele","dative-genitive-indefinite-singular":"bârne","dative-definite-genitive-singular":"bârnei","dative-genitive-indefinite-plural":"bârne","dative-definite-genitive-plural":"bârnelor","singular-vocative":"bârnă","plural-vocative":"bârnelor","alternative":"bîrnă"}},{"word":"bârnăcea","pos":"noun","definitions":["diminutive of bârnace"],"forms":{"plural":"bârnăcele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bârnăcea","accusative-definite-nominative-singular":"bârnăceaua","accusative-indefinite-nominative-plural":"bârnăcele","accusative-definite-nominative-plural":"bârnăcelele","dative-genitive-indefinite-singular":"bârnăcele","dative-definite-genitive-singular":"bârnăcelei","dative-genitive-indefinite-plural":"bârnăcele","dative-definite-genitive-plural":"bârnăcelelor","singular-vocative":"bârnăcea","plural-vocative":"bârnăcelelor","alternative":"bîrnăcea"}},{"word":"bărnaci","pos":"adj","definitions":["swarthy"],"forms":{"feminine-singular":"bărnace","masculine-plural":"bărnaci","feminine-neuter-plural":"bărnace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărnaci","error-unrecognized-form-feminine-indefinite-singular":"bărnace","error-unrecognized-form-indefinite-masculine-plural":"bărnaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărnace","definite-error-unrecognized-form-masculine-neuter-singular":"bărnaciul","definite-error-unrecognized-form-feminine-singular":"bărnacea","definite-error-unrecognized-form-masculine-plural":"bărnacii","definite-error-unrecognized-form-feminine-neuter-plural":"bărnacele"}},{"word":"bărnăcuț","pos":"adj","definitions":["brunette"],"forms":{"feminine-singular":"bărnăcuță","masculine-plural":"bărnăcuți","feminine-neuter-plural":"bărnăcuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bărnăcuț","error-unrecognized-form-feminine-indefinite-singular":"bărnăcuță","error-unrecognized-form-indefinite-masculine-plural":"bărnăcuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bărnăcuțe","definite-error-unrecognized-form-masculine-neuter-singular":"bărnăcuțul","definite-error-unrecognized-form-feminine-singular":"bărnăcuța","definite-error-unrecognized-form-masculine-plural":"bărnăcuții","definite-error-unrecognized-form-feminine-neuter-plural":"bărnăcuțele"}},{"word":"Bârnadu","pos":"name","definitions":["a village in Bicaz-Chei, Neamț County, Romania"],"gender":"m","forms":{"alternative":"Bîrnadu"}},{"word":"Bărnești","pos":"name","definitions":["a village in Pârjol, Bacău County, Romania"],"gender":"m"},{"word":"bârneț","pos":"noun","definitions":["alternative form of brâneț"],"forms":{"plural":"bârnețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bârneț","accusative-definite-nominative-singular":"bârnețul","accusative-indefinite-nominative-plural":"bârnețe","accusative-definite-nominative-plural":"bârnețele","dative-genitive-indefinite-singular":"bârneț","dative-definite-genitive-singular":"bârnețului","dative-genitive-indefinite-plural":"bârnețe","dative-definite-genitive-plural":"bârnețelor","singular-vocative":"bârnețule","plural-vocative":"bârnețelor","alternative":"bîrneț"}},{"word":"Bărnoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bărnoi"}},{"word":"Bârnoiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bârnoiu","alternative":"Bîrnoiu"}},{"word":"Bărnoiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărnoiu"}},{"word":"Bârnova","pos":"name","definitions":["a commune of Iași County, Romania","a village in Bârnova, Iași County, Romania"],"gender":"f","forms":{"alternative":"Bîrnova"}},{"word":"Bărnuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărnuț"}},{"word":"baroană","pos":"noun","definitions":["baroness"],"forms":{"plural":"baroane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baroană","accusative-definite-nominative-singular":"baroana","accusative-indefinite-nominative-plural":"baroane","accusative-definite-nominative-plural":"baroanele","dative-genitive-indefinite-singular":"baroane","dative-definite-genitive-singular":"baroanei","dative-genitive-indefinite-plural":"baroane","dative-definite-genitive-plural":"baroanelor","singular-vocative":"baroană","plural-vocative":"baroanelor"}},{"word":"baroc","pos":"adj","definitions":["baroque"],"forms":{"feminine-singular":"barocă","masculine-plural":"baroci","feminine-neuter-plural":"baroce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"baroc","error-unrecognized-form-feminine-indefinite-singular":"barocă","error-unrecognized-form-indefinite-masculine-plural":"baroci","error-unrecognized-form-feminine-indefinite-neuter-plural":"baroce","definite-error-unrecognized-form-masculine-neuter-singular":"barocul","definite-error-unrecognized-form-feminine-singular":"baroca","definite-error-unrecognized-form-masculine-plural":"barocii","definite-error-unrecognized-form-feminine-neuter-plural":"barocele"}},{"word":"barograf","pos":"noun","definitions":["barograph"],"forms":{"plural":"barografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barograf","accusative-definite-nominative-singular":"barograful","accusative-indefinite-nominative-plural":"barografe","accusative-definite-nominative-plural":"barografele","dative-genitive-indefinite-singular":"barograf","dative-definite-genitive-singular":"barografului","dative-genitive-indefinite-plural":"barografe","dative-definite-genitive-plural":"barografelor","singular-vocative":"barografule","plural-vocative":"barografelor"}},{"word":"barogramă","pos":"noun","definitions":["barogram"],"forms":{"plural":"barograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barogramă","accusative-definite-nominative-singular":"barograma","accusative-indefinite-nominative-plural":"barograme","accusative-definite-nominative-plural":"barogramele","dative-genitive-indefinite-singular":"barograme","dative-definite-genitive-singular":"barogramei","dative-genitive-indefinite-plural":"barograme","dative-definite-genitive-plural":"barogramelor","singular-vocative":"barogramă","plural-vocative":"barogramelor"}},{"word":"baroi","pos":"noun","definitions":["a Roma person"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"baroi","accusative-definite-nominative":"baroiul","dative-genitive-indefinite":"baroi","dative-definite-genitive":"baroiului","vocative":"baroiule"}},{"word":"Băroiu","pos":"name","definitions":["a village in Tetoiu, Vâlcea County, Romania","a surname originating as a patronymic"],"gender":"m"},{"word":"barometric","pos":"adj","definitions":["barometric"],"forms":{"feminine-singular":"barometrică","masculine-plural":"barometrici","feminine-neuter-plural":"barometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"barometric","error-unrecognized-form-feminine-indefinite-singular":"barometrică","error-unrecognized-form-indefinite-masculine-plural":"barometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"barometrice","definite-error-unrecognized-form-masculine-neuter-singular":"barometricul","definite-error-unrecognized-form-feminine-singular":"barometrica","definite-error-unrecognized-form-masculine-plural":"barometricii","definite-error-unrecognized-form-feminine-neuter-plural":"barometricele"}},{"word":"barometru","pos":"noun","definitions":["barometer"],"forms":{"plural":"barometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barometru","accusative-definite-nominative-singular":"barometrul","accusative-indefinite-nominative-plural":"barometre","accusative-definite-nominative-plural":"barometrele","dative-genitive-indefinite-singular":"barometru","dative-definite-genitive-singular":"barometrului","dative-genitive-indefinite-plural":"barometre","dative-definite-genitive-plural":"barometrelor","singular-vocative":"barometrule","plural-vocative":"barometrelor"}},{"word":"barometru aneroid","pos":"noun","definitions":["aneroid barometer"],"forms":{"plural":"barometre aneroide"}},{"word":"baron","pos":"noun","definitions":["baron"],"forms":{"plural":"baroni","feminine":"equivalent baroneasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baron","accusative-definite-nominative-singular":"baronul","accusative-indefinite-nominative-plural":"baroni","accusative-definite-nominative-plural":"baronii","dative-genitive-indefinite-singular":"baron","dative-definite-genitive-singular":"baronului","dative-genitive-indefinite-plural":"baroni","dative-definite-genitive-plural":"baronilor","singular-vocative":"baronule","plural-vocative":"baronilor"}},{"word":"Baroncea Nouă","pos":"name","definitions":["a village in Baroncea, Drochia Raion, Moldova"],"gender":"f"},{"word":"baroneasă","pos":"noun","definitions":["female equivalent of baron: baroness"],"forms":{"plural":"baronese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baroneasă","accusative-definite-nominative-singular":"baroneasa","accusative-indefinite-nominative-plural":"baronese","accusative-definite-nominative-plural":"baronesele","dative-genitive-indefinite-singular":"baronese","dative-definite-genitive-singular":"baronesei","dative-genitive-indefinite-plural":"baronese","dative-definite-genitive-plural":"baroneselor","singular-vocative":"baroneasă","plural-vocative":"baroneselor"}},{"word":"Baronescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Baronescu"}},{"word":"baronet","pos":"noun","definitions":["baronet"],"forms":{"plural":"baroneți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baronet","accusative-definite-nominative-singular":"baronetul","accusative-indefinite-nominative-plural":"baroneți","accusative-definite-nominative-plural":"baroneții","dative-genitive-indefinite-singular":"baronet","dative-definite-genitive-singular":"baronetului","dative-genitive-indefinite-plural":"baroneți","dative-definite-genitive-plural":"baroneților","singular-vocative":"baronetule","plural-vocative":"baroneților"}},{"word":"baronie","pos":"noun","definitions":["barony"],"forms":{"plural":"baronii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"baronie","accusative-definite-nominative-singular":"baronia","accusative-indefinite-nominative-plural":"baronii","accusative-definite-nominative-plural":"baroniile","dative-genitive-indefinite-singular":"baronii","dative-definite-genitive-singular":"baroniei","dative-genitive-indefinite-plural":"baronii","dative-definite-genitive-plural":"baroniilor","singular-vocative":"baronie","plural-vocative":"baroniilor"}},{"word":"baroniță","pos":"noun","definitions":["female equivalent of baron"],"forms":{"plural":"baronițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baroniță","accusative-definite-nominative-singular":"baronița","accusative-indefinite-nominative-plural":"baronițe","accusative-definite-nominative-plural":"baronițele","dative-genitive-indefinite-singular":"baronițe","dative-definite-genitive-singular":"baroniței","dative-genitive-indefinite-plural":"baronițe","dative-definite-genitive-plural":"baronițelor","singular-vocative":"baroniță","plural-vocative":"baronițelor"}},{"word":"baros","pos":"noun","definitions":["sledgehammer"],"forms":{"plural":"barosuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"baros","accusative-definite-nominative-singular":"barosul","accusative-indefinite-nominative-plural":"barosuri","accusative-definite-nominative-plural":"barosurile","dative-genitive-indefinite-singular":"baros","dative-definite-genitive-singular":"barosului","dative-genitive-indefinite-plural":"barosuri","dative-definite-genitive-plural":"barosurilor","singular-vocative":"barosule","plural-vocative":"barosurilor"}},{"word":"Barosan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barosan"}},{"word":"barosan","pos":"noun","definitions":["important or rich person"],"forms":{"plural":"barosani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"barosan","accusative-definite-nominative-singular":"barosanul","accusative-indefinite-nominative-plural":"barosani","accusative-definite-nominative-plural":"barosanii","dative-genitive-indefinite-singular":"barosan","dative-definite-genitive-singular":"barosanului","dative-genitive-indefinite-plural":"barosani","dative-definite-genitive-plural":"barosanilor","singular-vocative":"barosanule","plural-vocative":"barosanilor"}},{"word":"baroscop","pos":"noun","definitions":["baroscope"],"forms":{"plural":"baroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baroscop","accusative-definite-nominative-singular":"baroscopul","accusative-indefinite-nominative-plural":"baroscoape","accusative-definite-nominative-plural":"baroscoapele","dative-genitive-indefinite-singular":"baroscop","dative-definite-genitive-singular":"baroscopului","dative-genitive-indefinite-plural":"baroscoape","dative-definite-genitive-plural":"baroscoapelor","singular-vocative":"baroscopule","plural-vocative":"baroscoapelor"}},{"word":"Barosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barosu"}},{"word":"barot","pos":"noun","definitions":["gunpowder"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"barot","accusative-definite-nominative":"barotul","dative-genitive-indefinite":"barot","dative-definite-genitive":"barotului","vocative":"barotule"}},{"word":"barotermograf","pos":"noun","definitions":["barothermograph"],"forms":{"plural":"barotermografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barotermograf","accusative-definite-nominative-singular":"barotermograful","accusative-indefinite-nominative-plural":"barotermografe","accusative-definite-nominative-plural":"barotermografele","dative-genitive-indefinite-singular":"barotermograf","dative-definite-genitive-singular":"barotermografului","dative-genitive-indefinite-plural":"barotermografe","dative-definite-genitive-plural":"barotermografelor","singular-vocative":"barotermografule","plural-vocative":"barotermografelor"}},{"word":"barou","pos":"noun","definitions":["bar"],"forms":{"plural":"barouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barou","accusative-definite-nominative-singular":"baroul","accusative-indefinite-nominative-plural":"barouri","accusative-definite-nominative-plural":"barourile","dative-genitive-indefinite-singular":"barou","dative-definite-genitive-singular":"baroului","dative-genitive-indefinite-plural":"barouri","dative-definite-genitive-plural":"barourilor","singular-vocative":"baroule","plural-vocative":"barourilor"}},{"word":"Bârsa","pos":"name","definitions":["a commune of Arad County, Romania","a village in Bârsa, Arad County, Romania","a village in Someș-Odorhei, Sălaj County, Romania"],"gender":"f","forms":{"alternative":"Bîrsa"}},{"word":"bârsă","pos":"noun","definitions":["standard, sheth (of a plough)"],"forms":{"plural":"bârse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bârsă","accusative-definite-nominative-singular":"bârsa","accusative-indefinite-nominative-plural":"bârse","accusative-definite-nominative-plural":"bârsele","dative-genitive-indefinite-singular":"bârse","dative-definite-genitive-singular":"bârsei","dative-genitive-indefinite-plural":"bârse","dative-definite-genitive-plural":"bârselor","singular-vocative":"bârsă","plural-vocative":"bârselor","alternative":"bîrsă"}},{"word":"bârsan","pos":"adj","definitions":["related to Țara Bârsei region of Romania"],"forms":{"feminine-singular":"bârsană","masculine-plural":"bârsani","feminine-neuter-plural":"bârsane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bârsan","error-unrecognized-form-feminine-indefinite-singular":"bârsană","error-unrecognized-form-indefinite-masculine-plural":"bârsani","error-unrecognized-form-feminine-indefinite-neuter-plural":"bârsane","definite-error-unrecognized-form-masculine-neuter-singular":"bârsanul","definite-error-unrecognized-form-feminine-singular":"bârsana","definite-error-unrecognized-form-masculine-plural":"bârsanii","definite-error-unrecognized-form-feminine-neuter-plural":"bârsanele","alternative":"bîrsan"}},{"word":"Bârsana","pos":"name","definitions":["a village in Șugag, Alba County, Romania","a commune of Maramureș County, Romania","a village in Bârsana, Maramureș County, Romania"],"gender":"f","forms":{"alternative":"Bîrsana"}},{"word":"bârsănel","pos":"noun","definitions":["diminutive of bârsan"],"forms":{"plural":"bârsănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bârsănel","accusative-definite-nominative-singular":"bârsănelul","accusative-indefinite-nominative-plural":"bârsănei","accusative-definite-nominative-plural":"bârsăneii","dative-genitive-indefinite-singular":"bârsănel","dative-definite-genitive-singular":"bârsănelului","dative-genitive-indefinite-plural":"bârsănei","dative-definite-genitive-plural":"bârsăneilor","singular-vocative":"bârsănelule","plural-vocative":"bârsăneilor"}},{"word":"Bârsănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bârsănescu","alternative":"Bîrsănescu"}},{"word":"Bârsănești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Bârsănești, Bacău County, Romania","a village in Durnești, Botoșani County, Romania"],"gender":"m","forms":{"alternative":"Bîrsănești"}},{"word":"Bârsășteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bârsășteanu","alternative":"Bîrsășteanu"}},{"word":"Bârsău","pos":"name","definitions":["a village in Hărău, Hunedoara County, Romania","a commune of Satu Mare County, Romania"],"gender":"m","forms":{"alternative":"Bîrsău"}},{"word":"Bârsău de Jos","pos":"name","definitions":["a village in Bârsău, Satu Mare County, Romania"],"gender":"m","forms":{"alternative":"Bîrsău de Jos"}},{"word":"Bârsău de Sus","pos":"name","definitions":["a village in Bârsău, Satu Mare County, Romania"],"gender":"m","forms":{"alternative":"Bîrsău de Sus"}},{"word":"Bârsău Mare","pos":"name","definitions":["a village in Gâlgău, Sălaj County, Romania"],"gender":"m","forms":{"alternative":"Bîrsău Mare"}},{"word":"Bârsăuța","pos":"name","definitions":["a village in Ileanda, Sălaj County, Romania"],"gender":"f","forms":{"alternative":"Bîrsăuța"}},{"word":"Bârsescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bârsescu","alternative":"Bîrsescu"}},{"word":"Bârsești","pos":"name","definitions":["a locality in Târgu Jiu, Gorj County, Romania","a village in Budești, Vâlcea County, Romania","a village in Mihăești, Vâlcea County, Romania","a commune of Vrancea County, Romania","a village in Bârsești, Vrancea County, Romania"],"gender":"m","forms":{"alternative":"Bîrsești"}},{"word":"Bârseștii de Jos","pos":"name","definitions":["a village in Tigveni, Argeș County, Romania","a village in Beciu, Teleorman County, Romania"],"gender":"m","forms":{"alternative":"Bîrseștii de Jos"}},{"word":"Bârseștii de Sus","pos":"name","definitions":["a village in Tigveni, Argeș County, Romania","a village in Sprâncenata, Olt County, Romania"],"gender":"m","forms":{"alternative":"Bîrseștii de Sus"}},{"word":"Bârsoiu","pos":"name","definitions":["a village in Stoilești, Vâlcea County, Romania"],"gender":"m","forms":{"alternative":"Bîrsoiu"}},{"word":"barșon","pos":"noun","definitions":["red velvet"],"forms":{"plural":"barșoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"barșon","accusative-definite-nominative-singular":"barșonul","accusative-indefinite-nominative-plural":"barșoane","accusative-definite-nominative-plural":"barșoanele","dative-genitive-indefinite-singular":"barșon","dative-definite-genitive-singular":"barșonului","dative-genitive-indefinite-plural":"barșoane","dative-definite-genitive-plural":"barșoanelor","singular-vocative":"barșonule","plural-vocative":"barșoanelor"}},{"word":"bărtăculă","pos":"noun","definitions":["bag"],"forms":{"plural":"bărtăcule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bărtăculă","accusative-definite-nominative-singular":"bărtăcula","accusative-indefinite-nominative-plural":"bărtăcule","accusative-definite-nominative-plural":"bărtăculele","dative-genitive-indefinite-singular":"bărtăcule","dative-definite-genitive-singular":"bărtăculei","dative-genitive-indefinite-plural":"bărtăcule","dative-definite-genitive-plural":"bărtăculelor","singular-vocative":"bărtăculă","plural-vocative":"bărtăculelor"}},{"word":"Bărtăluș-Mocani","pos":"name","definitions":["a village in Puiești, Vaslui County, Romania"],"gender":"m"},{"word":"Bărtăluș-Răzeși","pos":"name","definitions":["a village in Puiești, Vaslui County, Romania"],"gender":"m"},{"word":"Bărtășești","pos":"name","definitions":["a village in Ungureni, Bacău County, Romania"],"gender":"m"},{"word":"Barticești","pos":"name","definitions":["a village in Botești, Neamț County, Romania"],"gender":"m"},{"word":"Bartolomei","pos":"name","definitions":["a surname","a male given name"],"gender":"m","forms":{"dative-genitive":"lui Bartolomei"}},{"word":"Bartolomeu","pos":"name","definitions":["a male given name, equivalent to English Bartholomew","Bartholomew (one of the apostles)"],"gender":"m","forms":{"dative-genitive":"lui Bartolomeu"}},{"word":"barutană","pos":"noun","definitions":["powder mill, gunpowder warehouse"],"forms":{"plural":"barutane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barutană","accusative-definite-nominative-singular":"barutana","accusative-indefinite-nominative-plural":"barutane","accusative-definite-nominative-plural":"barutanele","dative-genitive-indefinite-singular":"barutane","dative-definite-genitive-singular":"barutanei","dative-genitive-indefinite-plural":"barutane","dative-definite-genitive-plural":"barutanelor","singular-vocative":"barutană","plural-vocative":"barutanelor"}},{"word":"barz","pos":"adj","definitions":["of mixed colors, spotted"],"pronunciation":"/barz/","forms":{"feminine-singular":"barză","masculine-plural":"barzi","feminine-neuter-plural":"barze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"barz","error-unrecognized-form-feminine-indefinite-singular":"barză","error-unrecognized-form-indefinite-masculine-plural":"barji","error-unrecognized-form-feminine-indefinite-neuter-plural":"barze","definite-error-unrecognized-form-masculine-neuter-singular":"barzul","definite-error-unrecognized-form-feminine-singular":"barza","definite-error-unrecognized-form-masculine-plural":"barjii","definite-error-unrecognized-form-feminine-neuter-plural":"barzele"}},{"word":"Bârz","pos":"name","definitions":["a village in Dalboșeț, Caraș-Severin County, Romania"],"gender":"m","forms":{"alternative":"Bîrz"}},{"word":"Barza","pos":"name","definitions":["a village in Dănești, Gorj County, Romania","a village in Crișcior, Hunedoara County, Romania","a village in Tufeni, Olt County, Romania","a village in Budești, Vâlcea County, Romania"],"gender":"f"},{"word":"barza","pos":"noun","definitions":["definite nominative/accusative singular of barză"],"pronunciation":"[ˈbarza]","gender":"f"},{"word":"Barză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Barză"}},{"word":"barză","pos":"noun","definitions":["stork"],"pronunciation":"/ˈbar.zə/","forms":{"plural":"berze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"barză","accusative-definite-nominative-singular":"barza","accusative-indefinite-nominative-plural":"berze","accusative-definite-nominative-plural":"berzele","dative-genitive-indefinite-singular":"berze","dative-definite-genitive-singular":"berzei","dative-genitive-indefinite-plural":"berze","dative-definite-genitive-plural":"berzelor","singular-vocative":"barză","plural-vocative":"berzelor","alternative":"bardăș"}},{"word":"barză","pos":"adj","definitions":["feminine singular of barz"],"pronunciation":"/ˈbar.zə/","forms":{"alternative":"bardăș"}},{"word":"Bârza","pos":"name","definitions":["a village in Topleț, Caraș-Severin County, Romania","a village in Sânger, Mureș County, Romania","a commune of Olt County, Romania","a village in Bârza, Olt County, Romania"],"gender":"f","forms":{"alternative":"Bîrza"}},{"word":"barză albă","pos":"noun","definitions":["white stork (Ciconia ciconia)"],"forms":{"plural":"berze albe"}},{"word":"barză neagră","pos":"noun","definitions":["black stork (Ciconia nigra)"],"forms":{"plural":"berze negre"}},{"word":"barză-albă","pos":"noun","definitions":["white stork (large wading bird, Ciconia ciconia)"],"forms":{"plural":"berze-albe"}},{"word":"barză-neagră","pos":"noun","definitions":["black stork (Ciconia nigra)"],"forms":{"plural":"berze-negre"}},{"word":"Bârzan","pos":"name","definitions":["a village in Lupșa, Alba County, Romania"],"gender":"m","forms":{"alternative":"Bîrzan"}},{"word":"bărzăun","pos":"noun","definitions":["European hornet (Vespa crabro)","bumblebee"],"forms":{"plural":"bărzăuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărzăun","accusative-definite-nominative-singular":"bărzăunul","accusative-indefinite-nominative-plural":"bărzăuni","accusative-definite-nominative-plural":"bărzăunii","dative-genitive-indefinite-singular":"bărzăun","dative-definite-genitive-singular":"bărzăunului","dative-genitive-indefinite-plural":"bărzăuni","dative-definite-genitive-plural":"bărzăunilor","singular-vocative":"bărzăunule","plural-vocative":"bărzăunilor"}},{"word":"Bârzava","pos":"name","definitions":["Bârzava (a river in Romania)","Bârzava (a commune of Arad County, Romania)"],"forms":{"alternative":"Bîrzava"}},{"word":"Bârzeiu","pos":"name","definitions":["a village in Berlești, Gorj County, Romania"],"gender":"m","forms":{"alternative":"Bîrzeiu"}},{"word":"Bârzeiu de Gilort","pos":"name","definitions":["a village in Albeni, Gorj County, Romania"],"gender":"m","forms":{"alternative":"Bîrzeiu de Gilort"}},{"word":"Bârzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bârzescu","alternative":"Bîrzescu"}},{"word":"Bârzești","pos":"name","definitions":["a village in Archiș, Arad County, Romania","a village in Vulturești, Argeș County, Romania","a village in Ștefan cel Mare, Vaslui County, Romania","a village in Bărbătești, Vâlcea County, Romania"],"gender":"m","forms":{"alternative":"Bîrzești"}},{"word":"bârzgan","pos":"noun","definitions":["European hornet (Vespa crabro)"],"forms":{"plural":"bârzgani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bârzgan","accusative-definite-nominative-singular":"bârzganul","accusative-indefinite-nominative-plural":"bârzgani","accusative-definite-nominative-plural":"bârzganii","dative-genitive-indefinite-singular":"bârzgan","dative-definite-genitive-singular":"bârzganului","dative-genitive-indefinite-plural":"bârzgani","dative-definite-genitive-plural":"bârzganilor","singular-vocative":"bârzganule","plural-vocative":"bârzganilor","alternative":"bîrzgan"}},{"word":"Bârzilă","pos":"name","definitions":["a surname from Aromanian"],"gender":"m","forms":{"dative-genitive":"lui Bârzilă"}},{"word":"Bărzila","pos":"name","definitions":["a village in Păcureți, Prahova County, Romania"],"gender":"f"},{"word":"barzo","pos":"noun","definitions":["vocative singular of barză"],"pronunciation":"[ˈbarzo]","gender":"f"},{"word":"barzoi","pos":"noun","definitions":["borzoi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"barzoi","accusative-definite-nominative":"barzoiul","dative-genitive-indefinite":"barzoi","dative-definite-genitive":"barzoiului","vocative":"barzoiule"}},{"word":"Bărzoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bărzoi"}},{"word":"bărzoi","pos":"noun","definitions":["male stork"],"forms":{"plural":"bărzoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bărzoi","accusative-definite-nominative-singular":"bărzoiul","accusative-indefinite-nominative-plural":"bărzoi","accusative-definite-nominative-plural":"bărzoii","dative-genitive-indefinite-singular":"bărzoi","dative-definite-genitive-singular":"bărzoiului","dative-genitive-indefinite-plural":"bărzoi","dative-definite-genitive-plural":"bărzoilor","singular-vocative":"bărzoiule","plural-vocative":"bărzoilor"}},{"word":"Bârzulești","pos":"name","definitions":["a village in Sănduleni, Bacău County, Romania"],"gender":"m","forms":{"alternative":"Bîrzulești"}},{"word":"bas","pos":"noun","definitions":["bass"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bas","accusative-definite-nominative":"basul","dative-genitive-indefinite":"bas","dative-definite-genitive":"basului","vocative":"basule"}},{"word":"băs","pos":"verb","definitions":["inflection of băși:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Basamac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Basamac"}},{"word":"Basarabasa","pos":"name","definitions":["a village in Vața de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"Basarabca","pos":"name","definitions":["a village in Mocra, Transnistria, Moldova"],"gender":"f"},{"word":"basarabean","pos":"adj","definitions":["Bessarabian (of, from or relating to Bessarabia)"],"forms":{"feminine-singular":"basarabeană","masculine-plural":"basarabeni","feminine-neuter-plural":"basarabene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"basarabean","error-unrecognized-form-feminine-indefinite-singular":"basarabeană","error-unrecognized-form-indefinite-masculine-plural":"basarabeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"basarabene","definite-error-unrecognized-form-masculine-neuter-singular":"basarabeanul","definite-error-unrecognized-form-feminine-singular":"basarabeana","definite-error-unrecognized-form-masculine-plural":"basarabenii","definite-error-unrecognized-form-feminine-neuter-plural":"basarabenele"}},{"word":"basarabean","pos":"noun","definitions":["Bessarabian (native or inhabitant of Bessarabia) (usually male)"],"forms":{"plural":"basarabeni","feminine":"equivalent basarabeancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"basarabean","accusative-definite-nominative-singular":"basarabeanul","accusative-indefinite-nominative-plural":"basarabeni","accusative-definite-nominative-plural":"basarabenii","dative-genitive-indefinite-singular":"basarabean","dative-definite-genitive-singular":"basarabeanului","dative-genitive-indefinite-plural":"basarabeni","dative-definite-genitive-plural":"basarabenilor","singular-vocative":"basarabeanule","plural-vocative":"basarabenilor"}},{"word":"basarabeancă","pos":"noun","definitions":["female equivalent of basarabean"],"forms":{"plural":"basarabence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basarabeancă","accusative-definite-nominative-singular":"basarabeanca","accusative-indefinite-nominative-plural":"basarabence","accusative-definite-nominative-plural":"basarabencele","dative-genitive-indefinite-singular":"basarabence","dative-definite-genitive-singular":"basarabencei","dative-genitive-indefinite-plural":"basarabence","dative-definite-genitive-plural":"basarabencelor","singular-vocative":"basarabeancă","plural-vocative":"basarabencelor"}},{"word":"Basarabeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Basarabeanu"}},{"word":"Basarabeasca","pos":"name","definitions":["a city and district of Moldova"],"pronunciation":"/basaraˈbe̯aska/","gender":"f"},{"word":"Basarabescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Basarabescu"}},{"word":"Basarabi","pos":"name","definitions":["a village in Calafat, Dolj County, Romania","a village in Preutești, Suceava County, Romania","a town in Constanța County, Dobruja, in eastern Romania. The official name of Murfatlar between 1921 and 1965, and from 1975 to 2007."],"gender":"m"},{"word":"Băsășteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băsășteanu"}},{"word":"Băsăști","pos":"name","definitions":["a village in Pârjol, Bacău County, Romania"],"gender":"m"},{"word":"basc","pos":"adj","definitions":["Basque"],"forms":{"feminine-singular":"bască","masculine-plural":"baști","feminine-neuter-plural":"baște","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"basc","error-unrecognized-form-feminine-indefinite-singular":"bască","error-unrecognized-form-indefinite-masculine-plural":"baști","error-unrecognized-form-feminine-indefinite-neuter-plural":"baște","definite-error-unrecognized-form-masculine-neuter-singular":"bascul","definite-error-unrecognized-form-feminine-singular":"basca","definite-error-unrecognized-form-masculine-plural":"baștii","definite-error-unrecognized-form-feminine-neuter-plural":"baștele"}},{"word":"basc","pos":"noun","definitions":["Basque"],"forms":{"plural":"basci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"basc","accusative-definite-nominative-singular":"bascul","accusative-indefinite-nominative-plural":"basci","accusative-definite-nominative-plural":"bascii","dative-genitive-indefinite-singular":"basc","dative-definite-genitive-singular":"bascului","dative-genitive-indefinite-plural":"basci","dative-definite-genitive-plural":"bascilor","singular-vocative":"bascule","plural-vocative":"bascilor"}},{"word":"basca","pos":"noun","definitions":["definite nominative/accusative singular of bască"],"pronunciation":"[ˈbaska]","gender":"f"},{"word":"bască","pos":"noun","definitions":["beret"],"pronunciation":"/ˈbas.kə/","forms":{"plural":"băști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bască","accusative-definite-nominative-singular":"basca","accusative-indefinite-nominative-plural":"băști","accusative-definite-nominative-plural":"băștile","dative-genitive-indefinite-singular":"băști","dative-definite-genitive-singular":"băștii","dative-genitive-indefinite-plural":"băști","dative-definite-genitive-plural":"băștilor","singular-vocative":"bască","plural-vocative":"băștilor","alternative":"basc"}},{"word":"bască","pos":"noun","definitions":["Basque (language)"],"pronunciation":"/ˈbas.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bască","accusative-definite-nominative":"basca","dative-genitive-indefinite":"basce","dative-definite-genitive":"bascei","vocative":"bască"}},{"word":"bască","pos":"adj","definitions":["nominative/accusative feminine singular of basc"],"pronunciation":"/ˈbas.kə/"},{"word":"bașcă","pos":"noun","definitions":["fortification"],"forms":{"plural":"băști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bașcă","accusative-definite-nominative-singular":"bașca","accusative-indefinite-nominative-plural":"băște","accusative-definite-nominative-plural":"băștele","dative-genitive-indefinite-singular":"băște","dative-definite-genitive-singular":"băștei","dative-genitive-indefinite-plural":"băște","dative-definite-genitive-plural":"băștelor","singular-vocative":"bașcă","plural-vocative":"băștelor"}},{"word":"Bâsca Chiojdului","pos":"name","definitions":["a village in Chiojdu, Buzău County, Romania"],"gender":"f","forms":{"alternative":"Bîsca Chiojdului"}},{"word":"Bâsca Mică","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Bâsca Roziliei"],"gender":"f","forms":{"alternative":"Bîsca Mică"}},{"word":"Bâsca Rozilei","pos":"name","definitions":["a village in Nehoiu, Buzău County, Romania"],"gender":"f","forms":{"alternative":"Bîsca Rozilei"}},{"word":"băscăcărățel","pos":"adj","definitions":["diminutive of băscăcărat"],"forms":{"feminine-singular":"băscăcărățelă","masculine-plural":"băscăcărățeli","feminine-neuter-plural":"băscăcărățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băscăcărățel","error-unrecognized-form-feminine-indefinite-singular":"băscăcărățelă","error-unrecognized-form-indefinite-masculine-plural":"băscăcărățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"băscăcărățele","definite-error-unrecognized-form-masculine-neuter-singular":"băscăcărățelul","definite-error-unrecognized-form-feminine-singular":"băscăcărățela","definite-error-unrecognized-form-masculine-plural":"băscăcărățelii","definite-error-unrecognized-form-feminine-neuter-plural":"băscăcărățelele"}},{"word":"Bașcalia","pos":"name","definitions":["a village in Bașcalia, Basarabeasca Raion, Moldova","a commune of Basarabeasca Raion, Moldova"],"gender":"f"},{"word":"bășcălie","pos":"noun","definitions":["mockery"],"forms":{"plural":"bășcălii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bășcălie","accusative-definite-nominative-singular":"bășcălia","accusative-indefinite-nominative-plural":"bășcălii","accusative-definite-nominative-plural":"bășcăliile","dative-genitive-indefinite-singular":"bășcălii","dative-definite-genitive-singular":"bășcăliei","dative-genitive-indefinite-plural":"bășcălii","dative-definite-genitive-plural":"bășcăliilor","singular-vocative":"bășcălie","plural-vocative":"bășcăliilor"}},{"word":"bășcălios","pos":"adj","definitions":["mocking"],"forms":{"feminine-singular":"bășcălioasă","masculine-plural":"bășcălioși","feminine-neuter-plural":"bășcălioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bășcălios","error-unrecognized-form-feminine-indefinite-singular":"bășcălioasă","error-unrecognized-form-indefinite-masculine-plural":"bășcălioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bășcălioase","definite-error-unrecognized-form-masculine-neuter-singular":"bășcăliosul","definite-error-unrecognized-form-feminine-singular":"bășcălioasa","definite-error-unrecognized-form-masculine-plural":"bășcălioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bășcălioasele"}},{"word":"bășcăneață","pos":"noun","definitions":["a small bag"],"forms":{"plural":"bășcănețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bășcăneață","accusative-definite-nominative-singular":"bășcăneața","accusative-indefinite-nominative-plural":"bășcănețe","accusative-definite-nominative-plural":"bășcănețele","dative-genitive-indefinite-singular":"bășcănețe","dative-definite-genitive-singular":"bășcăneței","dative-genitive-indefinite-plural":"bășcănețe","dative-definite-genitive-plural":"bășcănețelor","singular-vocative":"bășcăneață","plural-vocative":"bășcănețelor"}},{"word":"bascea","pos":"noun","definitions":["garden"],"forms":{"plural":"bascele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bascea","accusative-definite-nominative-singular":"basceaua","accusative-indefinite-nominative-plural":"bascele","accusative-definite-nominative-plural":"bascelele","dative-genitive-indefinite-singular":"bascele","dative-definite-genitive-singular":"bascelei","dative-genitive-indefinite-plural":"bascele","dative-definite-genitive-plural":"bascelelor","singular-vocative":"bascea","plural-vocative":"bascelelor"}},{"word":"Băsceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Băsceanu"}},{"word":"Bâscenii de Jos","pos":"name","definitions":["a village in Calvini, Buzău County, Romania"],"gender":"m","forms":{"canonical-masculine":"Bâncenii de Jos","alternative":"Bîscenii de Jos"}},{"word":"Bâscenii de Sus","pos":"name","definitions":["a village in Calvini, Buzău County, Romania"],"gender":"m","forms":{"alternative":"Bîscenii de Sus"}},{"word":"baschet","pos":"noun","definitions":["basketball (sport)","sneaker (shoe)"],"forms":{"plural":"bascheți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baschet","accusative-definite-nominative-singular":"baschetul","accusative-indefinite-nominative-plural":"bascheți","accusative-definite-nominative-plural":"bascheții","dative-genitive-indefinite-singular":"baschet","dative-definite-genitive-singular":"baschetului","dative-genitive-indefinite-plural":"bascheți","dative-definite-genitive-plural":"bascheților","singular-vocative":"baschetule","plural-vocative":"bascheților"}},{"word":"baschetbal","pos":"noun","definitions":["basketball"],"pronunciation":"/ˈbas.ket.bal/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"baschetbal","accusative-definite-nominative":"baschetbalul","dative-genitive-indefinite":"baschetbal","dative-definite-genitive":"baschetbalului","vocative":"baschetbalule"}},{"word":"baschetbalist","pos":"noun","definitions":["basketball player"],"forms":{"plural":"baschetbaliști","feminine":"equivalent baschetbalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baschetbalist","accusative-definite-nominative-singular":"baschetbalistul","accusative-indefinite-nominative-plural":"baschetbalisti","accusative-definite-nominative-plural":"baschetbalistii","dative-genitive-indefinite-singular":"baschetbalist","dative-definite-genitive-singular":"baschetbalistului","dative-genitive-indefinite-plural":"baschetbalisti","dative-definite-genitive-plural":"baschetbalistilor","singular-vocative":"baschetbalistule","plural-vocative":"baschetbalistilor"}},{"word":"baschetbalistă","pos":"noun","definitions":["female equivalent of baschetbalist"],"forms":{"plural":"baschetbaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baschetbalistă","accusative-definite-nominative-singular":"baschetbalista","accusative-indefinite-nominative-plural":"baschetbaliste","accusative-definite-nominative-plural":"baschetbalistele","dative-genitive-indefinite-singular":"baschetbaliste","dative-definite-genitive-singular":"baschetbalistei","dative-genitive-indefinite-plural":"baschetbaliste","dative-definite-genitive-plural":"baschetbalistelor","singular-vocative":"baschetbalistă","plural-vocative":"baschetbalistelor"}},{"word":"Bașchioi","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Nicolae Bălcescu."],"gender":"m"},{"word":"bașchiolă","pos":"noun","definitions":["mockery"],"forms":{"plural":"bașchioale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bașchiolă","accusative-definite-nominative-singular":"bașchiola","accusative-indefinite-nominative-plural":"bașchioale","accusative-definite-nominative-plural":"bașchioalele","dative-genitive-indefinite-singular":"bașchioale","dative-definite-genitive-singular":"bașchioalei","dative-genitive-indefinite-plural":"bașchioale","dative-definite-genitive-plural":"bașchioalelor","singular-vocative":"bașchiolă","plural-vocative":"bașchioalelor"}},{"word":"bașchir","pos":"adj","definitions":["Bashkir"],"forms":{"feminine-singular":"bașchiră","masculine-plural":"bașchiri","feminine-neuter-plural":"bașchire","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bașchir","error-unrecognized-form-feminine-indefinite-singular":"bașchiră","error-unrecognized-form-indefinite-masculine-plural":"bașchiri","error-unrecognized-form-feminine-indefinite-neuter-plural":"bașchire","definite-error-unrecognized-form-masculine-neuter-singular":"bașchirul","definite-error-unrecognized-form-feminine-singular":"bașchira","definite-error-unrecognized-form-masculine-plural":"bașchirii","definite-error-unrecognized-form-feminine-neuter-plural":"bașchirele","alternative":"bașkir"}},{"word":"bașchir","pos":"noun","definitions":["a Bashkir man"],"forms":{"plural":"bașchiri","feminine":"equivalent bașchiră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bașchir","accusative-definite-nominative-singular":"bașchirul","accusative-indefinite-nominative-plural":"bașchiri","accusative-definite-nominative-plural":"bașchirii","dative-genitive-indefinite-singular":"bașchir","dative-definite-genitive-singular":"bașchirului","dative-genitive-indefinite-plural":"bașchiri","dative-definite-genitive-plural":"bașchirilor","singular-vocative":"bașchirule","plural-vocative":"bașchirilor","alternative":"bașkir"}},{"word":"Bașchiria","pos":"name","definitions":["Bashkiria, Bashkortostan (a republic and federal subject of Russia)"],"gender":"f","forms":{"alternative":"Bașkiria"}},{"word":"basco","pos":"noun","definitions":["vocative singular of bască"],"pronunciation":"[ˈbasko]","gender":"f"},{"word":"Bascov","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bascov, Argeș County, Romania"],"gender":"m"},{"word":"Bașcov","pos":"name","definitions":["a village in Sopot, Dolj County, Romania"],"gender":"m"},{"word":"Bascoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bascoveanu"}},{"word":"Bascovele","pos":"name","definitions":["a village in Cotmeana, Argeș County, Romania"],"gender":"m"},{"word":"Bâscoveni","pos":"name","definitions":["a village in Gălăteni, Teleorman County, Romania"],"gender":"m","forms":{"alternative":"Bîscoveni"}},{"word":"bascula","pos":"verb","definitions":["to topple, to tip over"],"forms":{"canonical":"a bascula 1st conjugation","present-singular-third-person":"basculează","participle-past":"basculat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bascula","gerund":"basculând","first-person-indicative-present-singular":"basculez","indicative-present-second-person-singular":"basculezi","indicative-present-singular-third-person":"basculează","first-person-indicative-plural-present":"basculăm","indicative-plural-present-second-person":"basculați","indicative-plural-present-third-person":"basculează","first-person-imperfect-indicative-singular":"basculam","imperfect-indicative-second-person-singular":"basculai","imperfect-indicative-singular-third-person":"bascula","first-person-imperfect-indicative-plural":"basculam","imperfect-indicative-plural-second-person":"basculați","imperfect-indicative-plural-third-person":"basculau","first-person-indicative-perfect-singular":"basculai","indicative-perfect-second-person-singular":"basculași","indicative-perfect-singular-third-person":"basculă","first-person-indicative-perfect-plural":"bascularăm","indicative-perfect-plural-second-person":"bascularăți","indicative-perfect-plural-third-person":"basculară","first-person-indicative-pluperfect-singular":"basculasem","indicative-pluperfect-second-person-singular":"basculaseși","indicative-pluperfect-singular-third-person":"basculase","first-person-indicative-pluperfect-plural":"basculaserăm","indicative-pluperfect-plural-second-person":"basculaserăți","indicative-pluperfect-plural-third-person":"basculaseră","first-person-present-singular-subjunctive":"să basculez","present-second-person-singular-subjunctive":"să basculezi","present-singular-subjunctive-third-person":"să basculeze","first-person-plural-present-subjunctive":"să basculăm","plural-present-second-person-subjunctive":"să basculați","plural-present-subjunctive-third-person":"să basculeze","imperative-second-person-singular":"basculează","imperative-plural-second-person":"basculați","imperative-negative-second-person-singular":"nu bascula","imperative-negative-plural-second-person":"nu basculați"}},{"word":"basculă","pos":"noun","definitions":["lever/hinge mechanism","bascule (steel block on which the barrels are hinged) (in a hunting rifle)"],"pronunciation":"/basˈku.lə/","forms":{"plural":"bascule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basculă","accusative-definite-nominative-singular":"bascula","accusative-indefinite-nominative-plural":"bascule","accusative-definite-nominative-plural":"basculele","dative-genitive-indefinite-singular":"bascule","dative-definite-genitive-singular":"basculei","dative-genitive-indefinite-plural":"bascule","dative-definite-genitive-plural":"basculelor","singular-vocative":"basculă","plural-vocative":"basculelor"}},{"word":"basculant","pos":"adj","definitions":["tilting, toppling"],"forms":{"feminine-singular":"basculantă","masculine-plural":"basculanți","feminine-neuter-plural":"basculante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"basculant","error-unrecognized-form-feminine-indefinite-singular":"basculantă","error-unrecognized-form-indefinite-masculine-plural":"basculanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"basculante","definite-error-unrecognized-form-masculine-neuter-singular":"basculantul","definite-error-unrecognized-form-feminine-singular":"basculanta","definite-error-unrecognized-form-masculine-plural":"basculanții","definite-error-unrecognized-form-feminine-neuter-plural":"basculantele"}},{"word":"basculantă","pos":"noun","definitions":["dump truck"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basculantă","accusative-definite-nominative-singular":"basculanta","accusative-indefinite-nominative-plural":"basculante","accusative-definite-nominative-plural":"basculantele","dative-genitive-indefinite-singular":"basculante","dative-definite-genitive-singular":"basculantei","dative-genitive-indefinite-plural":"basculante","dative-definite-genitive-plural":"basculantelor","singular-vocative":"basculantă","plural-vocative":"basculantelor"}},{"word":"Bâsculița","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Bâsca Mare"],"gender":"f","forms":{"alternative":"Bîsculița"}},{"word":"baseball","pos":"noun","definitions":["baseball"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"baseball","accusative-definite-nominative":"baseballul","dative-genitive-indefinite":"baseball","dative-definite-genitive":"baseballului","vocative":"baseballule"}},{"word":"baseballistă","pos":"noun","definitions":["female equivalent of baseballist"],"forms":{"plural":"baseballiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baseballistă","accusative-definite-nominative-singular":"baseballista","accusative-indefinite-nominative-plural":"baseballiste","accusative-definite-nominative-plural":"baseballistele","dative-genitive-indefinite-singular":"baseballiste","dative-definite-genitive-singular":"baseballistei","dative-genitive-indefinite-plural":"baseballiste","dative-definite-genitive-plural":"baseballistelor","singular-vocative":"baseballistă","plural-vocative":"baseballistelor"}},{"word":"basedowiană","pos":"noun","definitions":["female equivalent of basedowian"],"forms":{"plural":"basedowiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basedowiană","accusative-definite-nominative-singular":"basedowiana","accusative-indefinite-nominative-plural":"basedowiane","accusative-definite-nominative-plural":"basedowianele","dative-genitive-indefinite-singular":"basedowiane","dative-definite-genitive-singular":"basedowianei","dative-genitive-indefinite-plural":"basedowiane","dative-definite-genitive-plural":"basedowianelor","singular-vocative":"basedowiană","plural-vocative":"basedowianelor"}},{"word":"Băsești","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Băsești, Maramureș County, Romania"],"gender":"m"},{"word":"baset","pos":"noun","definitions":["basset (dog)"],"forms":{"plural":"baseți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baset","accusative-definite-nominative-singular":"basetul","accusative-indefinite-nominative-plural":"baseți","accusative-definite-nominative-plural":"baseții","dative-genitive-indefinite-singular":"baset","dative-definite-genitive-singular":"basetului","dative-genitive-indefinite-plural":"baseți","dative-definite-genitive-plural":"baseților","singular-vocative":"basetule","plural-vocative":"baseților"}},{"word":"Bașeu","pos":"name","definitions":["a village in Hudești, Botoșani County, Romania"],"gender":"m"},{"word":"Basgan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Basgan"}},{"word":"băși","pos":"verb","definitions":["to fart, flatulate, break wind"],"pronunciation":"/bəˈʃi/","forms":{"canonical":"a băși 4th conjugation","present-singular-third-person":"bese","participle-past":"bășit","table-tags":"conjugation-4","inflection-template":"ro-conj-2\n","infinitive":"a băși","gerund":"bășind","first-person-indicative-present-singular":"băs","indicative-present-second-person-singular":"beși","indicative-present-singular-third-person":"bese","first-person-indicative-plural-present":"bășim","indicative-plural-present-second-person":"bășiți","indicative-plural-present-third-person":"băs","first-person-imperfect-indicative-singular":"bășeam","imperfect-indicative-second-person-singular":"bășeai","imperfect-indicative-singular-third-person":"bășea","first-person-imperfect-indicative-plural":"bășeam","imperfect-indicative-plural-second-person":"bășeați","imperfect-indicative-plural-third-person":"bășeau","first-person-indicative-perfect-singular":"bășii","indicative-perfect-second-person-singular":"bășiși","indicative-perfect-singular-third-person":"băși","first-person-indicative-perfect-plural":"bășirăm","indicative-perfect-plural-second-person":"bășirăți","indicative-perfect-plural-third-person":"bășiră","first-person-indicative-pluperfect-singular":"bășisem","indicative-pluperfect-second-person-singular":"bășiseși","indicative-pluperfect-singular-third-person":"bășise","first-person-indicative-pluperfect-plural":"bășiserăm","indicative-pluperfect-plural-second-person":"bășiserăți","indicative-pluperfect-plural-third-person":"bășiseră","first-person-present-singular-subjunctive":"să băs","present-second-person-singular-subjunctive":"să beși","present-singular-subjunctive-third-person":"să bese","first-person-plural-present-subjunctive":"să bășim","plural-present-second-person-subjunctive":"să bășiți","plural-present-subjunctive-third-person":"să bese","imperative-second-person-singular":"bese","imperative-plural-second-person":"bășiți","imperative-negative-second-person-singular":"nu băși","imperative-negative-plural-second-person":"nu bășiți"}},{"word":"bașibuzuc","pos":"noun","definitions":["bashi-bazouk"],"forms":{"plural":"bașibuzuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bașibuzuc","accusative-definite-nominative-singular":"bașibuzucul","accusative-indefinite-nominative-plural":"bașibuzuci","accusative-definite-nominative-plural":"bașibuzucii","dative-genitive-indefinite-singular":"bașibuzuc","dative-definite-genitive-singular":"bașibuzucului","dative-genitive-indefinite-plural":"bașibuzuci","dative-definite-genitive-plural":"bașibuzucilor","singular-vocative":"bașibuzucule","plural-vocative":"bașibuzucilor"}},{"word":"bășica","pos":"verb","definitions":["to blister; form blisters"],"forms":{"canonical":"a bășica 1st conjugation","present-singular-third-person":"bășică","participle-past":"bășicat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bășica","gerund":"bășicând","first-person-indicative-present-singular":"bășic","indicative-present-second-person-singular":"bășici","indicative-present-singular-third-person":"bășică","first-person-indicative-plural-present":"bășicăm","indicative-plural-present-second-person":"bășicați","indicative-plural-present-third-person":"bășică","first-person-imperfect-indicative-singular":"bășicam","imperfect-indicative-second-person-singular":"bășicai","imperfect-indicative-singular-third-person":"bășica","first-person-imperfect-indicative-plural":"bășicam","imperfect-indicative-plural-second-person":"bășicați","imperfect-indicative-plural-third-person":"bășicau","first-person-indicative-perfect-singular":"bășicai","indicative-perfect-second-person-singular":"bășicași","indicative-perfect-singular-third-person":"bășică","first-person-indicative-perfect-plural":"bășicarăm","indicative-perfect-plural-second-person":"bășicarăți","indicative-perfect-plural-third-person":"bășicară","first-person-indicative-pluperfect-singular":"bășicasem","indicative-pluperfect-second-person-singular":"bășicaseși","indicative-pluperfect-singular-third-person":"bășicase","first-person-indicative-pluperfect-plural":"bășicaserăm","indicative-pluperfect-plural-second-person":"bășicaserăți","indicative-pluperfect-plural-third-person":"bășicaseră","first-person-present-singular-subjunctive":"să bășic","present-second-person-singular-subjunctive":"să bășici","present-singular-subjunctive-third-person":"să bășice","first-person-plural-present-subjunctive":"să bășicăm","plural-present-second-person-subjunctive":"să bășicați","plural-present-subjunctive-third-person":"să bășice","imperative-second-person-singular":"bășică","imperative-plural-second-person":"bășicați","imperative-negative-second-person-singular":"nu bășica","imperative-negative-plural-second-person":"nu bășicați","alternative-regional":"beșica"}},{"word":"Bășică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bășică"}},{"word":"bășică","pos":"noun","definitions":["blister, bleb","pustule","bladder"],"forms":{"plural":"bășici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bășică","accusative-definite-nominative-singular":"bășica","accusative-indefinite-nominative-plural":"bășici","accusative-definite-nominative-plural":"bășicile","dative-genitive-indefinite-singular":"bășici","dative-definite-genitive-singular":"bășicii","dative-genitive-indefinite-plural":"bășici","dative-definite-genitive-plural":"bășicilor","singular-vocative":"bășică","plural-vocative":"bășicilor","alternative-regional":"beșică"}},{"word":"bășica fierii","pos":"noun","definitions":["gallbladder"]},{"word":"bășicare","pos":"noun","definitions":["blistering"],"forms":{"plural":"bășicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bășicare","accusative-definite-nominative-singular":"bășicarea","accusative-indefinite-nominative-plural":"bășicări","accusative-definite-nominative-plural":"bășicările","dative-genitive-indefinite-singular":"bășicări","dative-definite-genitive-singular":"bășicării","dative-genitive-indefinite-plural":"bășicări","dative-definite-genitive-plural":"bășicărilor","singular-vocative":"bășicare","plural-vocative":"bășicărilor"}},{"word":"bășicat","pos":"adj","definitions":["blistered"],"forms":{"feminine-singular":"bășicată","masculine-plural":"bășicați","feminine-neuter-plural":"bășicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bășicat","error-unrecognized-form-feminine-indefinite-singular":"bășicată","error-unrecognized-form-indefinite-masculine-plural":"bășicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bășicate","definite-error-unrecognized-form-masculine-neuter-singular":"bășicatul","definite-error-unrecognized-form-feminine-singular":"bășicata","definite-error-unrecognized-form-masculine-plural":"bășicații","definite-error-unrecognized-form-feminine-neuter-plural":"bășicatele"}},{"word":"bășicățel","pos":"adj","definitions":["diminutive of bășicat"],"forms":{"feminine-singular":"bășicățelă","masculine-plural":"bășicățeli","feminine-neuter-plural":"bășicățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bășicățel","error-unrecognized-form-feminine-indefinite-singular":"bășicățelă","error-unrecognized-form-indefinite-masculine-plural":"bășicățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"bășicățele","definite-error-unrecognized-form-masculine-neuter-singular":"bășicățelul","definite-error-unrecognized-form-feminine-singular":"bășicățela","definite-error-unrecognized-form-masculine-plural":"bășicățelii","definite-error-unrecognized-form-feminine-neuter-plural":"bășicățelele"}},{"word":"bășicătură","pos":"noun","definitions":["blistering"],"forms":{"plural":"bășicături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bășicătură","accusative-definite-nominative-singular":"bășicătura","accusative-indefinite-nominative-plural":"bășicături","accusative-definite-nominative-plural":"bășicăturile","dative-genitive-indefinite-singular":"bășicături","dative-definite-genitive-singular":"bășicăturii","dative-genitive-indefinite-plural":"bășicături","dative-definite-genitive-plural":"bășicăturilor","singular-vocative":"bășicătură","plural-vocative":"bășicăturilor"}},{"word":"bășicoasă","pos":"noun","definitions":["bladder-senna (Colutea arborescens)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bășicoasă","accusative-definite-nominative-singular":"bășicoasa","accusative-indefinite-nominative-plural":"bășicoase","accusative-definite-nominative-plural":"bășicoasele","dative-genitive-indefinite-singular":"bășicoase","dative-definite-genitive-singular":"bășicoasei","dative-genitive-indefinite-plural":"bășicoase","dative-definite-genitive-plural":"bășicoaselor","singular-vocative":"bășicoasă","plural-vocative":"bășicoaselor"}},{"word":"bășicos","pos":"adj","definitions":["blistery"],"forms":{"feminine-singular":"bășicoasă","masculine-plural":"bășicoși","feminine-neuter-plural":"bășicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bășicos","error-unrecognized-form-feminine-indefinite-singular":"bășicoasă","error-unrecognized-form-indefinite-masculine-plural":"bășicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bășicoase","definite-error-unrecognized-form-masculine-neuter-singular":"bășicosul","definite-error-unrecognized-form-feminine-singular":"bășicoasa","definite-error-unrecognized-form-masculine-plural":"bășicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bășicoasele"}},{"word":"bășicos","pos":"noun","definitions":["bastard"],"forms":{"plural":"bășicoși"}},{"word":"bășicuță","pos":"noun","definitions":["diminutive of bășică; small bladder"],"forms":{"plural":"bășicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bășicuță","accusative-definite-nominative-singular":"bășicuța","accusative-indefinite-nominative-plural":"bășicuțe","accusative-definite-nominative-plural":"bășicuțele","dative-genitive-indefinite-singular":"bășicuțe","dative-definite-genitive-singular":"bășicuței","dative-genitive-indefinite-plural":"bășicuțe","dative-definite-genitive-plural":"bășicuțelor","singular-vocative":"bășicuță","plural-vocative":"bășicuțelor"}},{"word":"basidie","pos":"noun","definitions":["basidium"],"forms":{"plural":"basidii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"basidie","accusative-definite-nominative-singular":"basidia","accusative-indefinite-nominative-plural":"basidii","accusative-definite-nominative-plural":"basidiile","dative-genitive-indefinite-singular":"basidii","dative-definite-genitive-singular":"basidiei","dative-genitive-indefinite-plural":"basidii","dative-definite-genitive-plural":"basidiilor","singular-vocative":"basidie","plural-vocative":"basidiilor"}},{"word":"basidiomicetă","pos":"noun","definitions":["basidiomycete"],"forms":{"plural":"basidiomicete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basidiomicetă","accusative-definite-nominative-singular":"basidiomiceta","accusative-indefinite-nominative-plural":"basidiomicete","accusative-definite-nominative-plural":"basidiomicetele","dative-genitive-indefinite-singular":"basidiomicete","dative-definite-genitive-singular":"basidiomicetei","dative-genitive-indefinite-plural":"basidiomicete","dative-definite-genitive-plural":"basidiomicetelor","singular-vocative":"basidiomicetă","plural-vocative":"basidiomicetelor"}},{"word":"basidiospor","pos":"noun","definitions":["basidiospore"],"forms":{"plural":"basidiospori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"basidiospor","accusative-definite-nominative-singular":"basidiosporul","accusative-indefinite-nominative-plural":"basidiospori","accusative-definite-nominative-plural":"basidiosporii","dative-genitive-indefinite-singular":"basidiospor","dative-definite-genitive-singular":"basidiosporului","dative-genitive-indefinite-plural":"basidiospori","dative-definite-genitive-plural":"basidiosporilor","singular-vocative":"basidiosporule","plural-vocative":"basidiosporilor"}},{"word":"Basiliade","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Basiliade"}},{"word":"basin","pos":"noun","definitions":["obsolete form of bazin"],"forms":{"plural":"basinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"basin","accusative-definite-nominative-singular":"basinul","accusative-indefinite-nominative-plural":"basinuri","accusative-definite-nominative-plural":"basinurile","dative-genitive-indefinite-singular":"basin","dative-definite-genitive-singular":"basinului","dative-genitive-indefinite-plural":"basinuri","dative-definite-genitive-plural":"basinurilor","singular-vocative":"basinule","plural-vocative":"basinurilor"}},{"word":"bășina","pos":"noun","definitions":["definite nominative/accusative singular of bășină"],"gender":"f"},{"word":"bășină","pos":"noun","definitions":["a passing of wind"],"pronunciation":"/bəˈʃinə/","forms":{"plural":"bășini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bășină","accusative-definite-nominative-singular":"bășina","accusative-indefinite-nominative-plural":"bășini","accusative-definite-nominative-plural":"bășinile","dative-genitive-indefinite-singular":"bășini","dative-definite-genitive-singular":"bășinii","dative-genitive-indefinite-plural":"bășini","dative-definite-genitive-plural":"bășinilor","singular-vocative":"bășină","plural-vocative":"bășinilor","alternative":"beșină"}},{"word":"bășina-porcului","pos":"noun","definitions":["puffball (several species of mushrooms in the Lycoperdon genus)"],"forms":{"plural":"bășinile-porcului"}},{"word":"bășinică","pos":"noun","definitions":["diminutive of bășină"],"forms":{"plural":"bășinici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bășinică","accusative-definite-nominative-singular":"bășinica","accusative-indefinite-nominative-plural":"bășinici","accusative-definite-nominative-plural":"bășinicile","dative-genitive-indefinite-singular":"bășinici","dative-definite-genitive-singular":"bășinicii","dative-genitive-indefinite-plural":"bășinici","dative-definite-genitive-plural":"bășinicilor","singular-vocative":"bășinică","plural-vocative":"bășinicilor"}},{"word":"bășiniță","pos":"noun","definitions":["diminutive of bășină"],"forms":{"plural":"bășinițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bășiniță","accusative-definite-nominative-singular":"bășinița","accusative-indefinite-nominative-plural":"bășinițe","accusative-definite-nominative-plural":"bășinițele","dative-genitive-indefinite-singular":"bășinițe","dative-definite-genitive-singular":"bășiniței","dative-genitive-indefinite-plural":"bășinițe","dative-definite-genitive-plural":"bășinițelor","singular-vocative":"bășiniță","plural-vocative":"bășinițelor"}},{"word":"bășinos","pos":"adj","definitions":["farty"],"forms":{"feminine-singular":"bășinoasă","masculine-plural":"bășinoși","feminine-neuter-plural":"bășinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bășinos","error-unrecognized-form-feminine-indefinite-singular":"bășinoasă","error-unrecognized-form-indefinite-masculine-plural":"bășinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bășinoase","definite-error-unrecognized-form-masculine-neuter-singular":"bășinosul","definite-error-unrecognized-form-feminine-singular":"bășinoasa","definite-error-unrecognized-form-masculine-plural":"bășinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bășinoasele"}},{"word":"bășinos","pos":"noun","definitions":["a weak man, a coward"],"forms":{"plural":"bășinoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bășinos","accusative-definite-nominative-singular":"bășinosul","accusative-indefinite-nominative-plural":"bășinoși","accusative-definite-nominative-plural":"bășinoșii","dative-genitive-indefinite-singular":"bășinos","dative-definite-genitive-singular":"bășinosului","dative-genitive-indefinite-plural":"bășinoși","dative-definite-genitive-plural":"bășinoșilor","singular-vocative":"bășinosule","plural-vocative":"bășinoșilor"}},{"word":"bășinuță","pos":"noun","definitions":["diminutive of bășină"],"forms":{"plural":"bășinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bășinuță","accusative-definite-nominative-singular":"bășinuța","accusative-indefinite-nominative-plural":"bășinuțe","accusative-definite-nominative-plural":"bășinuțele","dative-genitive-indefinite-singular":"bășinuțe","dative-definite-genitive-singular":"bășinuței","dative-genitive-indefinite-plural":"bășinuțe","dative-definite-genitive-plural":"bășinuțelor","singular-vocative":"bășinuță","plural-vocative":"bășinuțelor"}},{"word":"basist","pos":"noun","definitions":["bassist"],"forms":{"plural":"basiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"basist","accusative-definite-nominative-singular":"basistul","accusative-indefinite-nominative-plural":"basiști","accusative-definite-nominative-plural":"basiștii","dative-genitive-indefinite-singular":"basist","dative-definite-genitive-singular":"basistului","dative-genitive-indefinite-plural":"basiști","dative-definite-genitive-plural":"basiștilor","singular-vocative":"basistule","plural-vocative":"basiștilor"}},{"word":"bașkir","pos":"noun","definitions":["Bashkir"],"forms":{"plural":"bașkiri","feminine":"equivalent bașkiră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bașkir","accusative-definite-nominative-singular":"bașkirul","accusative-indefinite-nominative-plural":"bașkiri","accusative-definite-nominative-plural":"bașkirii","dative-genitive-indefinite-singular":"bașkir","dative-definite-genitive-singular":"bașkirului","dative-genitive-indefinite-plural":"bașkiri","dative-definite-genitive-plural":"bașkirilor","singular-vocative":"bașkirule","plural-vocative":"bașkirilor"}},{"word":"bașkiră","pos":"noun","definitions":["female equivalent of bașkir"],"forms":{"plural":"bașkire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bașkiră","accusative-definite-nominative-singular":"bașkira","accusative-indefinite-nominative-plural":"bașkire","accusative-definite-nominative-plural":"bașkirele","dative-genitive-indefinite-singular":"bașkire","dative-definite-genitive-singular":"bașkirei","dative-genitive-indefinite-plural":"bașkire","dative-definite-genitive-plural":"bașkirelor","singular-vocative":"bașkiră","plural-vocative":"bașkirelor"}},{"word":"basm","pos":"noun","definitions":["fairy tale, fiction, yarn (folktale)"],"pronunciation":"/basm/","forms":{"plural":"basme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"basm","accusative-definite-nominative-singular":"basmul","accusative-indefinite-nominative-plural":"basme","accusative-definite-nominative-plural":"basmele","dative-genitive-indefinite-singular":"basm","dative-definite-genitive-singular":"basmului","dative-genitive-indefinite-plural":"basme","dative-definite-genitive-plural":"basmelor","singular-vocative":"basmule","plural-vocative":"basmelor"}},{"word":"Basma","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"basma","pos":"noun","definitions":["kerchief"],"pronunciation":"[basˈma]","forms":{"plural":"basmale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"basma","accusative-definite-nominative-singular":"basmaua","accusative-indefinite-nominative-plural":"basmale","accusative-definite-nominative-plural":"basmalele","dative-genitive-indefinite-singular":"basmale","dative-definite-genitive-singular":"basmalei","dative-genitive-indefinite-plural":"basmale","dative-definite-genitive-plural":"basmalelor","singular-vocative":"basma","plural-vocative":"basmalelor"}},{"word":"băsma","pos":"noun","definitions":["alternative form of basma"],"forms":{"plural":"băsmale","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"băsma","accusative-definite-nominative-singular":"băsmaua","accusative-indefinite-nominative-plural":"băsmale","accusative-definite-nominative-plural":"băsmalele","dative-genitive-indefinite-singular":"băsmale","dative-definite-genitive-singular":"băsmalei","dative-genitive-indefinite-plural":"băsmale","dative-definite-genitive-plural":"băsmalelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"băsmăluță","pos":"noun","definitions":["diminutive of basma; small kerchief"],"forms":{"plural":"băsmăluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băsmăluță","accusative-definite-nominative-singular":"băsmăluța","accusative-indefinite-nominative-plural":"băsmăluțe","accusative-definite-nominative-plural":"băsmăluțele","dative-genitive-indefinite-singular":"băsmăluțe","dative-definite-genitive-singular":"băsmăluței","dative-genitive-indefinite-plural":"băsmăluțe","dative-definite-genitive-plural":"băsmăluțelor","singular-vocative":"băsmăluță","plural-vocative":"băsmăluțelor"}},{"word":"basmangiu","pos":"noun","definitions":["kerchief maker or seller"],"forms":{"plural":"basmangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"basmangiu","accusative-definite-nominative-singular":"basmangiul","accusative-indefinite-nominative-plural":"basmangii","accusative-definite-nominative-plural":"basmangiii","dative-genitive-indefinite-singular":"basmangiu","dative-definite-genitive-singular":"basmangiului","dative-genitive-indefinite-plural":"basmangii","dative-definite-genitive-plural":"basmangiilor","singular-vocative":"basmangiule","plural-vocative":"basmangiilor"}},{"word":"băsmire","pos":"noun","definitions":["fiction, fairytale, story"],"forms":{"plural":"băsmiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"băsmire","accusative-definite-nominative-singular":"băsmirea","accusative-indefinite-nominative-plural":"băsmiri","accusative-definite-nominative-plural":"băsmirile","dative-genitive-indefinite-singular":"băsmiri","dative-definite-genitive-singular":"băsmirii","dative-genitive-indefinite-plural":"băsmiri","dative-definite-genitive-plural":"băsmirilor","singular-vocative":"băsmire","plural-vocative":"băsmirilor"}},{"word":"băsmit","pos":"adj","definitions":["story, fabrication"],"forms":{"feminine-singular":"băsmită","masculine-plural":"băsmiți","feminine-neuter-plural":"băsmite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băsmit","error-unrecognized-form-feminine-indefinite-singular":"băsmită","error-unrecognized-form-indefinite-masculine-plural":"băsmiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băsmite","definite-error-unrecognized-form-masculine-neuter-singular":"băsmitul","definite-error-unrecognized-form-feminine-singular":"băsmita","definite-error-unrecognized-form-masculine-plural":"băsmiții","definite-error-unrecognized-form-feminine-neuter-plural":"băsmitele"}},{"word":"băsmit","pos":"verb","definitions":["past participle of băsmi"],"forms":{"participle-past":"of băsmi"}},{"word":"băsmui","pos":"verb","definitions":["to make up a story"],"forms":{"canonical":"a băsmui 4th conjugation","present-singular-third-person":"băsmuie","participle-past":"băsmuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a băsmui","gerund":"băsmuind","first-person-indicative-present-singular":"băsmui","indicative-present-second-person-singular":"băsmui","indicative-present-singular-third-person":"băsmuie","first-person-indicative-plural-present":"băsmuim","indicative-plural-present-second-person":"băsmuiți","indicative-plural-present-third-person":"băsmuie","first-person-imperfect-indicative-singular":"băsmuiam","imperfect-indicative-second-person-singular":"băsmuiai","imperfect-indicative-singular-third-person":"băsmuia","first-person-imperfect-indicative-plural":"băsmuiam","imperfect-indicative-plural-second-person":"băsmuiați","imperfect-indicative-plural-third-person":"băsmuiau","first-person-indicative-perfect-singular":"băsmuii","indicative-perfect-second-person-singular":"băsmuiși","indicative-perfect-singular-third-person":"băsmui","first-person-indicative-perfect-plural":"băsmuirăm","indicative-perfect-plural-second-person":"băsmuirăți","indicative-perfect-plural-third-person":"băsmuiră","first-person-indicative-pluperfect-singular":"băsmuisem","indicative-pluperfect-second-person-singular":"băsmuiseși","indicative-pluperfect-singular-third-person":"băsmuise","first-person-indicative-pluperfect-plural":"băsmuiserăm","indicative-pluperfect-plural-second-person":"băsmuiserăți","indicative-pluperfect-plural-third-person":"băsmuiseră","first-person-present-singular-subjunctive":"să băsmui","present-second-person-singular-subjunctive":"să băsmui","present-singular-subjunctive-third-person":"să băsmuie","first-person-plural-present-subjunctive":"să băsmuim","plural-present-second-person-subjunctive":"să băsmuiți","plural-present-subjunctive-third-person":"să băsmuie","imperative-second-person-singular":"băsmuie","imperative-plural-second-person":"băsmuiți","imperative-negative-second-person-singular":"nu băsmui","imperative-negative-plural-second-person":"nu băsmuiți"}},{"word":"băsmuială","pos":"noun","definitions":["tall tale"],"forms":{"plural":"băsmuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băsmuială","accusative-definite-nominative-singular":"băsmuiala","accusative-indefinite-nominative-plural":"băsmuiele","accusative-definite-nominative-plural":"băsmuielele","dative-genitive-indefinite-singular":"băsmuiele","dative-definite-genitive-singular":"băsmuielei","dative-genitive-indefinite-plural":"băsmuiele","dative-definite-genitive-plural":"băsmuielelor","singular-vocative":"băsmuială","plural-vocative":"băsmuielelor"}},{"word":"basnă","pos":"noun","definitions":["false story"],"forms":{"plural":"basne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"basnă","accusative-definite-nominative-singular":"basna","accusative-indefinite-nominative-plural":"basne","accusative-definite-nominative-plural":"basnele","dative-genitive-indefinite-singular":"basne","dative-definite-genitive-singular":"basnei","dative-genitive-indefinite-plural":"basne","dative-definite-genitive-plural":"basnelor","singular-vocative":"basnă","plural-vocative":"basnelor"}},{"word":"băsnar","pos":"noun","definitions":["person who fabricates stories"],"forms":{"plural":"băsnari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băsnar","accusative-definite-nominative-singular":"băsnarul","accusative-indefinite-nominative-plural":"băsnari","accusative-definite-nominative-plural":"băsnarii","dative-genitive-indefinite-singular":"băsnar","dative-definite-genitive-singular":"băsnarului","dative-genitive-indefinite-plural":"băsnari","dative-definite-genitive-plural":"băsnarilor","singular-vocative":"băsnarule","plural-vocative":"băsnarilor"}},{"word":"băsnaș","pos":"noun","definitions":["liar","storyteller"],"forms":{"plural":"băsnași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băsnaș","accusative-definite-nominative-singular":"băsnașul","accusative-indefinite-nominative-plural":"băsnași","accusative-definite-nominative-plural":"băsnașii","dative-genitive-indefinite-singular":"băsnaș","dative-definite-genitive-singular":"băsnașului","dative-genitive-indefinite-plural":"băsnași","dative-definite-genitive-plural":"băsnașilor","singular-vocative":"băsnașule","plural-vocative":"băsnașilor"}},{"word":"băsni","pos":"verb","definitions":["to invent, fabricate a story"],"pronunciation":"/bəsˈni/","forms":{"canonical":"a băsni 4th conjugation","present-singular-third-person":"băsnește","participle-past":"băsnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a băsni","gerund":"băsnind","first-person-indicative-present-singular":"băsnesc","indicative-present-second-person-singular":"băsnești","indicative-present-singular-third-person":"băsnește","first-person-indicative-plural-present":"băsnim","indicative-plural-present-second-person":"băsniți","indicative-plural-present-third-person":"băsnesc","first-person-imperfect-indicative-singular":"băsneam","imperfect-indicative-second-person-singular":"băsneai","imperfect-indicative-singular-third-person":"băsnea","first-person-imperfect-indicative-plural":"băsneam","imperfect-indicative-plural-second-person":"băsneați","imperfect-indicative-plural-third-person":"băsneau","first-person-indicative-perfect-singular":"băsnii","indicative-perfect-second-person-singular":"băsniși","indicative-perfect-singular-third-person":"băsni","first-person-indicative-perfect-plural":"băsnirăm","indicative-perfect-plural-second-person":"băsnirăți","indicative-perfect-plural-third-person":"băsniră","first-person-indicative-pluperfect-singular":"băsnisem","indicative-pluperfect-second-person-singular":"băsniseși","indicative-pluperfect-singular-third-person":"băsnise","first-person-indicative-pluperfect-plural":"băsniserăm","indicative-pluperfect-plural-second-person":"băsniserăți","indicative-pluperfect-plural-third-person":"băsniseră","first-person-present-singular-subjunctive":"să băsnesc","present-second-person-singular-subjunctive":"să băsnești","present-singular-subjunctive-third-person":"să băsnească","first-person-plural-present-subjunctive":"să băsnim","plural-present-second-person-subjunctive":"să băsniți","plural-present-subjunctive-third-person":"să băsnească","imperative-second-person-singular":"băsnește","imperative-plural-second-person":"băsniți","imperative-negative-second-person-singular":"nu băsni","imperative-negative-plural-second-person":"nu băsniți"}},{"word":"băsnire","pos":"noun","definitions":["story, fabrication"],"forms":{"plural":"băsniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"băsnire","accusative-definite-nominative-singular":"băsnirea","accusative-indefinite-nominative-plural":"băsniri","accusative-definite-nominative-plural":"băsnirile","dative-genitive-indefinite-singular":"băsniri","dative-definite-genitive-singular":"băsnirii","dative-genitive-indefinite-plural":"băsniri","dative-definite-genitive-plural":"băsnirilor","singular-vocative":"băsnire","plural-vocative":"băsnirilor"}},{"word":"băsnit","pos":"noun","definitions":["fabrication"],"forms":{"plural":"băsnituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"băsnit","accusative-definite-nominative-singular":"băsnitul","accusative-indefinite-nominative-plural":"băsnituri","accusative-definite-nominative-plural":"băsniturile","dative-genitive-indefinite-singular":"băsnit","dative-definite-genitive-singular":"băsnitului","dative-genitive-indefinite-plural":"băsnituri","dative-definite-genitive-plural":"băsniturilor","singular-vocative":"băsnitule","plural-vocative":"băsniturilor"}},{"word":"băsnit","pos":"verb","definitions":["past participle of băsni"],"forms":{"participle-past":"of băsni"}},{"word":"băsnitor","pos":"adj","definitions":["contriving"],"forms":{"feminine-singular":"băsnitoare","masculine-plural":"băsnitori","feminine-neuter-plural":"băsnitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băsnitor","error-unrecognized-form-feminine-indefinite-singular":"băsnitoare","error-unrecognized-form-indefinite-masculine-plural":"băsnitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"băsnitoare","definite-error-unrecognized-form-masculine-neuter-singular":"băsnitorul","definite-error-unrecognized-form-feminine-singular":"băsnitoarea","definite-error-unrecognized-form-masculine-plural":"băsnitorii","definite-error-unrecognized-form-feminine-neuter-plural":"băsnitoarele"}},{"word":"băsnitor","pos":"noun","definitions":["contriver"],"forms":{"plural":"băsnitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băsnitor","accusative-definite-nominative-singular":"băsnitorul","accusative-indefinite-nominative-plural":"băsnitori","accusative-definite-nominative-plural":"băsnitorii","dative-genitive-indefinite-singular":"băsnitor","dative-definite-genitive-singular":"băsnitorului","dative-genitive-indefinite-plural":"băsnitori","dative-definite-genitive-plural":"băsnitorilor","singular-vocative":"băsnitorule","plural-vocative":"băsnitorilor"}},{"word":"bașoaldă","pos":"noun","definitions":["unkempt woman"],"forms":{"plural":"bașoalde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bașoaldă","accusative-definite-nominative-singular":"bașoalda","accusative-indefinite-nominative-plural":"bașoalde","accusative-definite-nominative-plural":"bașoaldele","dative-genitive-indefinite-singular":"bașoalde","dative-definite-genitive-singular":"bașoaldei","dative-genitive-indefinite-plural":"bașoalde","dative-definite-genitive-plural":"bașoaldelor","singular-vocative":"bașoaldă","plural-vocative":"bașoaldelor"}},{"word":"Bășoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bășoiu"}},{"word":"bason","pos":"noun","definitions":["bassoon"],"forms":{"plural":"basoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bason","accusative-definite-nominative-singular":"basonul","accusative-indefinite-nominative-plural":"basoane","accusative-definite-nominative-plural":"basoanele","dative-genitive-indefinite-singular":"bason","dative-definite-genitive-singular":"basonului","dative-genitive-indefinite-plural":"basoane","dative-definite-genitive-plural":"basoanelor","singular-vocative":"basonule","plural-vocative":"basoanelor"}},{"word":"basorelief","pos":"noun","definitions":["bas relief"],"forms":{"plural":"basoreliefuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"basorelief","accusative-definite-nominative-singular":"basorelieful","accusative-indefinite-nominative-plural":"basoreliefuri","accusative-definite-nominative-plural":"basoreliefurile","dative-genitive-indefinite-singular":"basorelief","dative-definite-genitive-singular":"basoreliefului","dative-genitive-indefinite-plural":"basoreliefuri","dative-definite-genitive-plural":"basoreliefurilor","singular-vocative":"basoreliefule","plural-vocative":"basoreliefurilor"}},{"word":"basoreliev","pos":"noun","definitions":["alternative form of basorelief"],"forms":{"plural":"basorelievuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"basoreliev","accusative-definite-nominative-singular":"basorelievul","accusative-indefinite-nominative-plural":"basorelievuri","accusative-definite-nominative-plural":"basorelievurile","dative-genitive-indefinite-singular":"basoreliev","dative-definite-genitive-singular":"basorelievului","dative-genitive-indefinite-plural":"basorelievuri","dative-definite-genitive-plural":"basorelievurilor","singular-vocative":"basorelievule","plural-vocative":"basorelievurilor"}},{"word":"Bașpunar","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania. Renamed to Fântâna Mare.","a village in Tulcea County, Dobruja, in eastern Romania. Renamed to Fântâna Mare."],"gender":"m"},{"word":"basrelief","pos":"noun","definitions":["alternative form of basorelief"],"forms":{"plural":"basreliefuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"basrelief","accusative-definite-nominative-singular":"basrelieful","accusative-indefinite-nominative-plural":"basreliefuri","accusative-definite-nominative-plural":"basreliefurile","dative-genitive-indefinite-singular":"basrelief","dative-definite-genitive-singular":"basreliefului","dative-genitive-indefinite-plural":"basreliefuri","dative-definite-genitive-plural":"basreliefurilor","singular-vocative":"basreliefule","plural-vocative":"basreliefurilor"}},{"word":"basta","pos":"adv","definitions":["enough"]},{"word":"Bașta","pos":"name","definitions":["a village in Secuieni, Neamț County, Romania"],"gender":"f"},{"word":"baștă","pos":"noun","definitions":["alternative form of bașcă"],"forms":{"plural":"baște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"baștă","accusative-definite-nominative-singular":"bașta","accusative-indefinite-nominative-plural":"baște","accusative-definite-nominative-plural":"baștele","dative-genitive-indefinite-singular":"baște","dative-definite-genitive-singular":"baștei","dative-genitive-indefinite-plural":"baște","dative-definite-genitive-plural":"baștelor","singular-vocative":"baștă","plural-vocative":"baștelor"}},{"word":"Baștan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Baștan"}},{"word":"baștan","pos":"adj","definitions":["rich"],"forms":{"feminine-singular":"baștană","masculine-plural":"baștani","feminine-neuter-plural":"baștane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"baștan","error-unrecognized-form-feminine-indefinite-singular":"baștană","error-unrecognized-form-indefinite-masculine-plural":"baștani","error-unrecognized-form-feminine-indefinite-neuter-plural":"baștane","definite-error-unrecognized-form-masculine-neuter-singular":"baștanul","definite-error-unrecognized-form-feminine-singular":"baștana","definite-error-unrecognized-form-masculine-plural":"baștanii","definite-error-unrecognized-form-feminine-neuter-plural":"baștanele"}},{"word":"baștan","pos":"noun","definitions":["a rich person"],"forms":{"plural":"baștani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baștan","accusative-definite-nominative-singular":"baștanul","accusative-indefinite-nominative-plural":"baștani","accusative-definite-nominative-plural":"baștanii","dative-genitive-indefinite-singular":"baștan","dative-definite-genitive-singular":"baștanului","dative-genitive-indefinite-plural":"baștani","dative-definite-genitive-plural":"baștanilor","singular-vocative":"baștanule","plural-vocative":"baștanilor"}},{"word":"baștani","pos":"noun","definitions":["plural of baștan"]},{"word":"bastard","pos":"noun","definitions":["bastard"],"forms":{"plural":"bastarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bastard","accusative-definite-nominative-singular":"bastardul","accusative-indefinite-nominative-plural":"bastarzi","accusative-definite-nominative-plural":"bastarzii","dative-genitive-indefinite-singular":"bastard","dative-definite-genitive-singular":"bastardului","dative-genitive-indefinite-plural":"bastarzi","dative-definite-genitive-plural":"bastarzilor","singular-vocative":"bastardule","plural-vocative":"bastarzilor"}},{"word":"bastardă","pos":"noun","definitions":["female equivalent of bastard"],"forms":{"plural":"bastarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bastardă","accusative-definite-nominative-singular":"bastarda","accusative-indefinite-nominative-plural":"bastarde","accusative-definite-nominative-plural":"bastardele","dative-genitive-indefinite-singular":"bastarde","dative-definite-genitive-singular":"bastardei","dative-genitive-indefinite-plural":"bastarde","dative-definite-genitive-plural":"bastardelor","singular-vocative":"bastardă","plural-vocative":"bastardelor"}},{"word":"bastardare","pos":"noun","definitions":["hybridization"],"forms":{"plural":"bastardări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bastardare","accusative-definite-nominative-singular":"bastardarea","accusative-indefinite-nominative-plural":"bastardări","accusative-definite-nominative-plural":"bastardările","dative-genitive-indefinite-singular":"bastardări","dative-definite-genitive-singular":"bastardării","dative-genitive-indefinite-plural":"bastardări","dative-definite-genitive-plural":"bastardărilor","singular-vocative":"bastardare","plural-vocative":"bastardărilor"}},{"word":"bastarn","pos":"adj","definitions":["Bastarnian (tribe)"],"forms":{"feminine-singular":"bastarnă","masculine-plural":"bastarni","feminine-neuter-plural":"bastarne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bastarn","error-unrecognized-form-feminine-indefinite-singular":"bastarnă","error-unrecognized-form-indefinite-masculine-plural":"bastarni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bastarne","definite-error-unrecognized-form-masculine-neuter-singular":"bastarnul","definite-error-unrecognized-form-feminine-singular":"bastarna","definite-error-unrecognized-form-masculine-plural":"bastarnii","definite-error-unrecognized-form-feminine-neuter-plural":"bastarnele"}},{"word":"bastarn","pos":"noun","definitions":["Bastarnian (tribe)"],"forms":{"plural":"bastarni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bastarn","accusative-definite-nominative-singular":"bastarnul","accusative-indefinite-nominative-plural":"bastarni","accusative-definite-nominative-plural":"bastarnii","dative-genitive-indefinite-singular":"bastarn","dative-definite-genitive-singular":"bastarnului","dative-genitive-indefinite-plural":"bastarni","dative-definite-genitive-plural":"bastarnilor","singular-vocative":"bastarnule","plural-vocative":"bastarnilor"}},{"word":"bastarnă","pos":"noun","definitions":["female equivalent of bastarn"],"forms":{"plural":"bastarne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bastarnă","accusative-definite-nominative-singular":"bastarna","accusative-indefinite-nominative-plural":"bastarne","accusative-definite-nominative-plural":"bastarnele","dative-genitive-indefinite-singular":"bastarne","dative-definite-genitive-singular":"bastarnei","dative-genitive-indefinite-plural":"bastarne","dative-definite-genitive-plural":"bastarnelor","singular-vocative":"bastarnă","plural-vocative":"bastarnelor"}},{"word":"băști","pos":"noun","definitions":["plural of bască"],"gender":"f-p"},{"word":"bastiment","pos":"noun","definitions":["warship"],"forms":{"plural":"bastimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bastiment","accusative-definite-nominative-singular":"bastimentul","accusative-indefinite-nominative-plural":"bastimente","accusative-definite-nominative-plural":"bastimentele","dative-genitive-indefinite-singular":"bastiment","dative-definite-genitive-singular":"bastimentului","dative-genitive-indefinite-plural":"bastimente","dative-definite-genitive-plural":"bastimentelor","singular-vocative":"bastimentule","plural-vocative":"bastimentelor"}},{"word":"Baștină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baștină"}},{"word":"baștină","pos":"noun","definitions":["origin (especially a place where one was born, is from, or lived all their life)"],"forms":{"plural":"baștini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"baștină","accusative-definite-nominative-singular":"baștina","accusative-indefinite-nominative-plural":"baștini","accusative-definite-nominative-plural":"baștinile","dative-genitive-indefinite-singular":"baștini","dative-definite-genitive-singular":"baștinii","dative-genitive-indefinite-plural":"baștini","dative-definite-genitive-plural":"baștinilor","singular-vocative":"baștină","plural-vocative":"baștinilor"}},{"word":"băștinaș","pos":"adj","definitions":["indigenous, native, autochthonous, aboriginal"],"forms":{"feminine-singular":"băștinașă","masculine-plural":"băștinași","feminine-neuter-plural":"băștinașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băștinaș","error-unrecognized-form-feminine-indefinite-singular":"băștinașă","error-unrecognized-form-indefinite-masculine-plural":"băștinași","error-unrecognized-form-feminine-indefinite-neuter-plural":"băștinașe","definite-error-unrecognized-form-masculine-neuter-singular":"băștinașul","definite-error-unrecognized-form-feminine-singular":"băștinașa","definite-error-unrecognized-form-masculine-plural":"băștinașii","definite-error-unrecognized-form-feminine-neuter-plural":"băștinașele"}},{"word":"băștinaș","pos":"noun","definitions":["native, aborigine"],"forms":{"plural":"băștinași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băștinaș","accusative-definite-nominative-singular":"băștinașul","accusative-indefinite-nominative-plural":"băștinași","accusative-definite-nominative-plural":"băștinașii","dative-genitive-indefinite-singular":"băștinaș","dative-definite-genitive-singular":"băștinașului","dative-genitive-indefinite-plural":"băștinași","dative-definite-genitive-plural":"băștinașilor","singular-vocative":"băștinașule","plural-vocative":"băștinașilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"băștinașă","pos":"noun","definitions":["female equivalent of băștinaș"],"forms":{"plural":"băștinașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băștinașă","accusative-definite-nominative-singular":"băștinașa","accusative-indefinite-nominative-plural":"băștinașe","accusative-definite-nominative-plural":"băștinașele","dative-genitive-indefinite-singular":"băștinașe","dative-definite-genitive-singular":"băștinașei","dative-genitive-indefinite-plural":"băștinașe","dative-definite-genitive-plural":"băștinașelor","singular-vocative":"băștinașă","plural-vocative":"băștinașelor"}},{"word":"bastion","pos":"noun","definitions":["stronghold"],"forms":{"plural":"bastioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bastion","accusative-definite-nominative-singular":"bastionul","accusative-indefinite-nominative-plural":"bastioane","accusative-definite-nominative-plural":"bastioanele","dative-genitive-indefinite-singular":"bastion","dative-definite-genitive-singular":"bastionului","dative-genitive-indefinite-plural":"bastioane","dative-definite-genitive-plural":"bastioanelor","singular-vocative":"bastionule","plural-vocative":"bastioanelor"}},{"word":"Baston","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Baston"}},{"word":"baston","pos":"noun","definitions":["walking stick"],"forms":{"plural":"bastoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baston","accusative-definite-nominative-singular":"bastonul","accusative-indefinite-nominative-plural":"bastoane","accusative-definite-nominative-plural":"bastoanele","dative-genitive-indefinite-singular":"baston","dative-definite-genitive-singular":"bastonului","dative-genitive-indefinite-plural":"bastoane","dative-definite-genitive-plural":"bastoanelor","singular-vocative":"bastonule","plural-vocative":"bastoanelor"}},{"word":"bastonache","pos":"noun","definitions":["chocolate bar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bastonache","accusative-definite-nominative":"bastonacheul","dative-genitive-indefinite":"bastonache","dative-definite-genitive":"bastonacheului","vocative":"bastonacheule"}},{"word":"bastonadă","pos":"noun","definitions":["flopping"],"forms":{"plural":"bastonade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bastonadă","accusative-definite-nominative-singular":"bastonada","accusative-indefinite-nominative-plural":"bastonade","accusative-definite-nominative-plural":"bastonadele","dative-genitive-indefinite-singular":"bastonade","dative-definite-genitive-singular":"bastonadei","dative-genitive-indefinite-plural":"bastonade","dative-definite-genitive-plural":"bastonadelor","singular-vocative":"bastonadă","plural-vocative":"bastonadelor"}},{"word":"bastonaș","pos":"noun","definitions":["diminutive of baston; small cane, stick"],"forms":{"plural":"bastonașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bastonaș","accusative-definite-nominative-singular":"bastonașul","accusative-indefinite-nominative-plural":"bastonașe","accusative-definite-nominative-plural":"bastonașele","dative-genitive-indefinite-singular":"bastonaș","dative-definite-genitive-singular":"bastonașului","dative-genitive-indefinite-plural":"bastonașe","dative-definite-genitive-plural":"bastonașelor","singular-vocative":"bastonașule","plural-vocative":"bastonașelor"}},{"word":"bastonel","pos":"noun","definitions":["diminutive of baston"],"forms":{"plural":"bastonele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bastonel","accusative-definite-nominative-singular":"bastonelul","accusative-indefinite-nominative-plural":"bastonele","accusative-definite-nominative-plural":"bastonelele","dative-genitive-indefinite-singular":"bastonel","dative-definite-genitive-singular":"bastonelului","dative-genitive-indefinite-plural":"bastonele","dative-definite-genitive-plural":"bastonelelor","singular-vocative":"bastonelule","plural-vocative":"bastonelelor"}},{"word":"Bâstroe","pos":"name","definitions":["alternative form of Bîstroe"],"gender":"n"},{"word":"Bașturescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bașturescu"}},{"word":"bat","pos":"verb","definitions":["inflection of bate:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"bât","pos":"adj","definitions":["old (about people)"],"forms":{"feminine-singular":"bâtă","masculine-plural":"bâți","feminine-neuter-plural":"bâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bât","error-unrecognized-form-feminine-indefinite-singular":"bâtă","error-unrecognized-form-indefinite-masculine-plural":"bâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâte","definite-error-unrecognized-form-masculine-neuter-singular":"bâtul","definite-error-unrecognized-form-feminine-singular":"bâta","definite-error-unrecognized-form-masculine-plural":"bâții","definite-error-unrecognized-form-feminine-neuter-plural":"bâtele","alternative":"bît"}},{"word":"bât","pos":"noun","definitions":["grandfather"],"forms":{"plural":"bâți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bât","accusative-definite-nominative-singular":"bâtul","accusative-indefinite-nominative-plural":"bâți","accusative-definite-nominative-plural":"bâții","dative-genitive-indefinite-singular":"bât","dative-definite-genitive-singular":"bâtului","dative-genitive-indefinite-plural":"bâți","dative-definite-genitive-plural":"bâților","singular-vocative":"bâtule","plural-vocative":"bâților","alternative":"bît"}},{"word":"băț","pos":"noun","definitions":["stick (long piece of wood), rod"],"forms":{"plural":"bețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băț","accusative-definite-nominative-singular":"bățul","accusative-indefinite-nominative-plural":"bețe","accusative-definite-nominative-plural":"bețele","dative-genitive-indefinite-singular":"băț","dative-definite-genitive-singular":"bățului","dative-genitive-indefinite-plural":"bețe","dative-definite-genitive-plural":"bețelor","singular-vocative":"bățule","plural-vocative":"bețelor"}},{"word":"Bata","pos":"name","definitions":["a commune of Arad County, Romania","a village in Bata, Arad County, Romania"],"gender":"f"},{"word":"bată","pos":"noun","definitions":["belt, girdle"],"pronunciation":"[ˈbatə]","forms":{"plural":"bete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bată","accusative-definite-nominative-singular":"bata","accusative-indefinite-nominative-plural":"bete","accusative-definite-nominative-plural":"betele","dative-genitive-indefinite-singular":"bete","dative-definite-genitive-singular":"betei","dative-genitive-indefinite-plural":"bete","dative-definite-genitive-plural":"betelor","singular-vocative":"bată","plural-vocative":"betelor"}},{"word":"bată","pos":"verb","definitions":["third-person singular/plural present subjunctive of bate"],"pronunciation":"[ˈbatə]"},{"word":"Bâtă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bâtă","alternative":"Bîtă"}},{"word":"bâtă","pos":"noun","definitions":["club, cudgel, cosh","hopelessly bad at something"],"examples":[{"ro":"Dar Matei (contabilul) era bâtă la capitolul dragoste, nesimțitor ca un lemn cioplit în formă de statuie.","en":"But Matei (the accountant) was incompetent when it came to love, unfeeling as a piece of wood wrought in the shape of a statue."},{"ro":"Cei din unitatea lui au hotărât să-l lase în baza de instrucție pentru că nu știe să tragă cu arma, e bâtă.","en":"His unit chose to leave him behind at the training base because he can’t shoot, really can’t shoot."},{"ro":"[…]a încercat să-l învețe limba bască pe cumnatul său. Au renunțat. Guille era bâtă la limbi străine.","en":"[…] he tried to teach his brother-in-law Basque. They gave up. Guille was hopeless when it came to foreign languages."}],"forms":{"plural":"bâte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtă","accusative-definite-nominative-singular":"bâta","accusative-indefinite-nominative-plural":"bâte","accusative-definite-nominative-plural":"bâtele","dative-genitive-indefinite-singular":"bâte","dative-definite-genitive-singular":"bâtei","dative-genitive-indefinite-plural":"bâte","dative-definite-genitive-plural":"bâtelor","singular-vocative":"bâtă","plural-vocative":"bâtelor","alternative":"bîtă"}},{"word":"bâtă","pos":"noun","definitions":["female equivalent of bât:","grandmother","old woman"],"forms":{"plural":"bâte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtă","accusative-definite-nominative-singular":"bâta","accusative-indefinite-nominative-plural":"bâte","accusative-definite-nominative-plural":"bâtele","dative-genitive-indefinite-singular":"bâte","dative-definite-genitive-singular":"bâtei","dative-genitive-indefinite-plural":"bâte","dative-definite-genitive-plural":"bâtelor","singular-vocative":"bâtă","plural-vocative":"bâtelor","alternative":"bîtă"}},{"word":"bâța","pos":"intj","definitions":["alternative form of bâț"],"forms":{"alternative":"bîța"}},{"word":"bâtă de baseball","pos":"noun","definitions":["baseball bat"],"forms":{"plural":"bâte de baseball"}},{"word":"Bătăcui","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătăcui"}},{"word":"bâțâi","pos":"verb","definitions":["to fidget one’s body, be restless"],"forms":{"canonical":"a bâțâi 4th conjugation","present-singular-third-person":"bâțâie","participle-past":"bâțâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bâțâi","gerund":"bâțâind","first-person-indicative-present-singular":"bâțâi","indicative-present-second-person-singular":"bâțâi","indicative-present-singular-third-person":"bâțâie","first-person-indicative-plural-present":"bâțâim","indicative-plural-present-second-person":"bâțâiți","indicative-plural-present-third-person":"bâțâie","first-person-imperfect-indicative-singular":"bâțâiam","imperfect-indicative-second-person-singular":"bâțâiai","imperfect-indicative-singular-third-person":"bâțâia","first-person-imperfect-indicative-plural":"bâțâiam","imperfect-indicative-plural-second-person":"bâțâiați","imperfect-indicative-plural-third-person":"bâțâiau","first-person-indicative-perfect-singular":"bâțâii","indicative-perfect-second-person-singular":"bâțâiși","indicative-perfect-singular-third-person":"bâțâi","first-person-indicative-perfect-plural":"bâțâirăm","indicative-perfect-plural-second-person":"bâțâirăți","indicative-perfect-plural-third-person":"bâțâiră","first-person-indicative-pluperfect-singular":"bâțâisem","indicative-pluperfect-second-person-singular":"bâțâiseși","indicative-pluperfect-singular-third-person":"bâțâise","first-person-indicative-pluperfect-plural":"bâțâiserăm","indicative-pluperfect-plural-second-person":"bâțâiserăți","indicative-pluperfect-plural-third-person":"bâțâiseră","first-person-present-singular-subjunctive":"să bâțâi","present-second-person-singular-subjunctive":"să bâțâi","present-singular-subjunctive-third-person":"să bâțâie","first-person-plural-present-subjunctive":"să bâțâim","plural-present-second-person-subjunctive":"să bâțâiți","plural-present-subjunctive-third-person":"să bâțâie","imperative-second-person-singular":"bâțâie","imperative-plural-second-person":"bâțâiți","imperative-negative-second-person-singular":"nu bâțâi","imperative-negative-plural-second-person":"nu bâțâiți","alternative":"bîțîi"}},{"word":"bătăi","pos":"noun","definitions":["plural of bătaie"],"gender":"f-p"},{"word":"bâțâială","pos":"noun","definitions":["fidgeting"],"forms":{"plural":"bâțâieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâțâială","accusative-definite-nominative-singular":"bâțâiala","accusative-indefinite-nominative-plural":"bâțâiele","accusative-definite-nominative-plural":"bâțâielele","dative-genitive-indefinite-singular":"bâțâiele","dative-definite-genitive-singular":"bâțâielei","dative-genitive-indefinite-plural":"bâțâiele","dative-definite-genitive-plural":"bâțâielelor","singular-vocative":"bâțâială","plural-vocative":"bâțâielelor","alternative":"bîțîială"}},{"word":"bătăiaș","pos":"noun","definitions":["beater (person who drives game towards shooters in a hunting party)"],"forms":{"plural":"bătăiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătăiaș","accusative-definite-nominative-singular":"bătăiașul","accusative-indefinite-nominative-plural":"bătăiași","accusative-definite-nominative-plural":"bătăiașii","dative-genitive-indefinite-singular":"bătăiaș","dative-definite-genitive-singular":"bătăiașului","dative-genitive-indefinite-plural":"bătăiași","dative-definite-genitive-plural":"bătăiașilor","singular-vocative":"bătăiașule","plural-vocative":"bătăiașilor"}},{"word":"bătaie","pos":"noun","definitions":["beating","fight, scuffle, scrimmage (informal, spontaneous, mutual physical aggression)","range, reach of a device","beat, stroke, rhythmical movement","knock (such as on the door)"],"pronunciation":"/bəˈta.je/","examples":[{"ro":"a îi da o bătaie","en":"to give someone a beating"},{"ro":"a îi trage o bătaie","en":"to give someone a beating"},{"ro":"a lua la bătaie","en":"to begin beating"}],"forms":{"plural":"bătăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"bătaie","accusative-definite-nominative-singular":"bătaia","accusative-indefinite-nominative-plural":"bătăi","accusative-definite-nominative-plural":"bătăile","dative-genitive-indefinite-singular":"bătăi","dative-definite-genitive-singular":"bătăii","dative-genitive-indefinite-plural":"bătăi","dative-definite-genitive-plural":"bătăilor","singular-vocative":"bătaie","plural-vocative":"bătăilor"}},{"word":"bătaie de cap","pos":"noun","definitions":["headache, bother (unpleasant challenge)"],"examples":[{"ro":"a da bătăi de cap","en":"to cause headaches, be problematic"},{"ro":"Am fost înfășat în scutece și am dat părinților grijă și bătaie de cap.","en":"I was wrapped in swaddling clothes and brought upon my parents worry and bother. (Wisdom of Solomon 7:4)"},{"ro":"Sper să nu vă dau prea multă bătaie de cap cu geamantanele mele și cu mine.","en":"I hope I won’t bring you too much of a headache with my suitcases and myself."}],"forms":{"plural":"bătăi de cap"}},{"word":"bătăios","pos":"adj","definitions":["combative"],"forms":{"feminine-singular":"bătăioasă","masculine-plural":"bătăioși","feminine-neuter-plural":"bătăioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătăios","error-unrecognized-form-feminine-indefinite-singular":"bătăioasă","error-unrecognized-form-indefinite-masculine-plural":"bătăioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătăioase","definite-error-unrecognized-form-masculine-neuter-singular":"bătăiosul","definite-error-unrecognized-form-feminine-singular":"bătăioasa","definite-error-unrecognized-form-masculine-plural":"bătăioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bătăioasele"}},{"word":"Bătăiosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătăiosu"}},{"word":"bătăit","pos":"noun","definitions":["battle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bătăit","accusative-definite-nominative":"bătăitul","dative-genitive-indefinite":"bătăit","dative-definite-genitive":"bătăitului","vocative":"bătăitule"}},{"word":"bătăiță","pos":"noun","definitions":["diminutive of bătaie; small fight"],"forms":{"plural":"bătăițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătăiță","accusative-definite-nominative-singular":"bătăița","accusative-indefinite-nominative-plural":"bătăițe","accusative-definite-nominative-plural":"bătăițele","dative-genitive-indefinite-singular":"bătăițe","dative-definite-genitive-singular":"bătăiței","dative-genitive-indefinite-plural":"bătăițe","dative-definite-genitive-plural":"bătăițelor","singular-vocative":"bătăiță","plural-vocative":"bătăițelor"}},{"word":"bătăiuță","pos":"noun","definitions":["diminutive of bătaie"],"forms":{"plural":"bătăiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătăiuță","accusative-definite-nominative-singular":"bătăiuța","accusative-indefinite-nominative-plural":"bătăiuțe","accusative-definite-nominative-plural":"bătăiuțele","dative-genitive-indefinite-singular":"bătăiuțe","dative-definite-genitive-singular":"bătăiuței","dative-genitive-indefinite-plural":"bătăiuțe","dative-definite-genitive-plural":"bătăiuțelor","singular-vocative":"bătăiuță","plural-vocative":"bătăiuțelor"}},{"word":"bataj","pos":"noun","definitions":["threshing"],"forms":{"plural":"bataje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bataj","accusative-definite-nominative-singular":"batajul","accusative-indefinite-nominative-plural":"bataje","accusative-definite-nominative-plural":"batajele","dative-genitive-indefinite-singular":"bataj","dative-definite-genitive-singular":"batajului","dative-genitive-indefinite-plural":"bataje","dative-definite-genitive-plural":"batajelor","singular-vocative":"batajule","plural-vocative":"batajelor"}},{"word":"batal","pos":"noun","definitions":["wether"],"forms":{"plural":"batali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batal","accusative-definite-nominative-singular":"batalul","accusative-indefinite-nominative-plural":"batali","accusative-definite-nominative-plural":"batalii","dative-genitive-indefinite-singular":"batal","dative-definite-genitive-singular":"batalului","dative-genitive-indefinite-plural":"batali","dative-definite-genitive-plural":"batalilor","singular-vocative":"batalule","plural-vocative":"batalilor"}},{"word":"batalama","pos":"noun","definitions":["obsolete form of patalama"],"forms":{"plural":"batalamale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"batalama","accusative-definite-nominative-singular":"batalamaua","accusative-indefinite-nominative-plural":"batalamale","accusative-definite-nominative-plural":"batalamalele","dative-genitive-indefinite-singular":"batalamale","dative-definite-genitive-singular":"batalamalei","dative-genitive-indefinite-plural":"batalamale","dative-definite-genitive-plural":"batalamalelor","singular-vocative":"batalama","plural-vocative":"batalamalelor"}},{"word":"bătălan","pos":"noun","definitions":["brawler"],"forms":{"plural":"bătălani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătălan","accusative-definite-nominative-singular":"bătălanul","accusative-indefinite-nominative-plural":"bătălani","accusative-definite-nominative-plural":"bătălanii","dative-genitive-indefinite-singular":"bătălan","dative-definite-genitive-singular":"bătălanului","dative-genitive-indefinite-plural":"bătălani","dative-definite-genitive-plural":"bătălanilor","singular-vocative":"bătălanule","plural-vocative":"bătălanilor"}},{"word":"bătălie","pos":"noun","definitions":["battle"],"forms":{"plural":"bătălii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bătălie","accusative-definite-nominative-singular":"bătălia","accusative-indefinite-nominative-plural":"bătălii","accusative-definite-nominative-plural":"bătăliile","dative-genitive-indefinite-singular":"bătălii","dative-definite-genitive-singular":"bătăliei","dative-genitive-indefinite-plural":"bătălii","dative-definite-genitive-plural":"bătăliilor","singular-vocative":"bătălie","plural-vocative":"bătăliilor"}},{"word":"batalion","pos":"noun","definitions":["battalion"],"forms":{"plural":"batalioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batalion","accusative-definite-nominative-singular":"batalionul","accusative-indefinite-nominative-plural":"batalioane","accusative-definite-nominative-plural":"batalioanele","dative-genitive-indefinite-singular":"batalion","dative-definite-genitive-singular":"batalionului","dative-genitive-indefinite-plural":"batalioane","dative-definite-genitive-plural":"batalioanelor","singular-vocative":"batalionule","plural-vocative":"batalioanelor"}},{"word":"Batalu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Batalu"}},{"word":"Bataluri","pos":"name","definitions":["a village in Albești, Ialomița County, Romania"],"gender":"m"},{"word":"Bățanii Mari","pos":"name","definitions":["a village in Bățani, Covasna County, Romania"],"gender":"m"},{"word":"Bățanii Mici","pos":"name","definitions":["a village in Bățani, Covasna County, Romania"],"gender":"m"},{"word":"Bătănoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bătănoiu"}},{"word":"batant","pos":"adj","definitions":["swinging"],"forms":{"feminine-singular":"batantă","masculine-plural":"batanți","feminine-neuter-plural":"batante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batant","error-unrecognized-form-feminine-indefinite-singular":"batantă","error-unrecognized-form-indefinite-masculine-plural":"batanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"batante","definite-error-unrecognized-form-masculine-neuter-singular":"batantul","definite-error-unrecognized-form-feminine-singular":"batanta","definite-error-unrecognized-form-masculine-plural":"batanții","definite-error-unrecognized-form-feminine-neuter-plural":"batantele"}},{"word":"batâr","pos":"adv","definitions":["alternative form of batăr"],"forms":{"alternative":"batîr"}},{"word":"Batăr","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Batăr, Bihor County, Romania"],"gender":"m"},{"word":"batăr","pos":"adv","definitions":["at the very least"],"pronunciation":"/ˈba.tər/"},{"word":"Bătarci","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Bătarci, Satu Mare County, Romania"],"gender":"m"},{"word":"batardou","pos":"noun","definitions":["batardeau"],"forms":{"plural":"batardouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batardou","accusative-definite-nominative-singular":"batardoul","accusative-indefinite-nominative-plural":"batardouri","accusative-definite-nominative-plural":"batardourile","dative-genitive-indefinite-singular":"batardou","dative-definite-genitive-singular":"batardoului","dative-genitive-indefinite-plural":"batardouri","dative-definite-genitive-plural":"batardourilor","singular-vocative":"batardoule","plural-vocative":"batardourilor"}},{"word":"Bătăreni","pos":"name","definitions":["a village in Colonești, Olt County, Romania"],"gender":"m"},{"word":"Batariuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Batariuc"}},{"word":"Bătășani","pos":"name","definitions":["a village in Valea Mare, Vâlcea County, Romania"],"gender":"m"},{"word":"batat","pos":"noun","definitions":["sweet potato"],"pronunciation":"/baˈtat/","forms":{"plural":"batați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batat","accusative-definite-nominative-singular":"batatul","accusative-indefinite-nominative-plural":"batați","accusative-definite-nominative-plural":"batații","dative-genitive-indefinite-singular":"batat","dative-definite-genitive-singular":"batatului","dative-genitive-indefinite-plural":"batați","dative-definite-genitive-plural":"bataților","singular-vocative":"batatule","plural-vocative":"bataților","alternative":"батат"}},{"word":"batată","pos":"noun","definitions":["batata"],"forms":{"plural":"batate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batată","accusative-definite-nominative-singular":"batata","accusative-indefinite-nominative-plural":"batate","accusative-definite-nominative-plural":"batatele","dative-genitive-indefinite-singular":"batate","dative-definite-genitive-singular":"batatei","dative-genitive-indefinite-plural":"batate","dative-definite-genitive-plural":"batatelor","singular-vocative":"batată","plural-vocative":"batatelor"}},{"word":"bătător","pos":"noun","definitions":["carpet beater (stick used to beat carpets and other things to clean off dust)"],"forms":{"plural":"bătătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bătător","accusative-definite-nominative-singular":"bătătorul","accusative-indefinite-nominative-plural":"bătătoare","accusative-definite-nominative-plural":"bătătoarele","dative-genitive-indefinite-singular":"bătător","dative-definite-genitive-singular":"bătătorului","dative-genitive-indefinite-plural":"bătătoare","dative-definite-genitive-plural":"bătătoarelor","singular-vocative":"bătătorule","plural-vocative":"bătătoarelor"}},{"word":"bătători","pos":"verb","definitions":["to tread"],"forms":{"canonical":"a bătători 4th conjugation","present-singular-third-person":"bătătorește","participle-past":"bătătorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bătători","gerund":"bătătorind","first-person-indicative-present-singular":"bătătoresc","indicative-present-second-person-singular":"bătătorești","indicative-present-singular-third-person":"bătătorește","first-person-indicative-plural-present":"bătătorim","indicative-plural-present-second-person":"bătătoriți","indicative-plural-present-third-person":"bătătoresc","first-person-imperfect-indicative-singular":"bătătoream","imperfect-indicative-second-person-singular":"bătătoreai","imperfect-indicative-singular-third-person":"bătătorea","first-person-imperfect-indicative-plural":"bătătoream","imperfect-indicative-plural-second-person":"bătătoreați","imperfect-indicative-plural-third-person":"bătătoreau","first-person-indicative-perfect-singular":"bătătorii","indicative-perfect-second-person-singular":"bătătoriși","indicative-perfect-singular-third-person":"bătători","first-person-indicative-perfect-plural":"bătătorirăm","indicative-perfect-plural-second-person":"bătătorirăți","indicative-perfect-plural-third-person":"bătătoriră","first-person-indicative-pluperfect-singular":"bătătorisem","indicative-pluperfect-second-person-singular":"bătătoriseși","indicative-pluperfect-singular-third-person":"bătătorise","first-person-indicative-pluperfect-plural":"bătătoriserăm","indicative-pluperfect-plural-second-person":"bătătoriserăți","indicative-pluperfect-plural-third-person":"bătătoriseră","first-person-present-singular-subjunctive":"să bătătoresc","present-second-person-singular-subjunctive":"să bătătorești","present-singular-subjunctive-third-person":"să bătătorească","first-person-plural-present-subjunctive":"să bătătorim","plural-present-second-person-subjunctive":"să bătătoriți","plural-present-subjunctive-third-person":"să bătătorească","imperative-second-person-singular":"bătătorește","imperative-plural-second-person":"bătătoriți","imperative-negative-second-person-singular":"nu bătători","imperative-negative-plural-second-person":"nu bătătoriți"}},{"word":"bătătorit","pos":"adj","definitions":["beaten (about soil)"],"forms":{"feminine-singular":"bătătorită","masculine-plural":"bătătoriți","feminine-neuter-plural":"bătătorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătătorit","error-unrecognized-form-feminine-indefinite-singular":"bătătorită","error-unrecognized-form-indefinite-masculine-plural":"bătătoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătătorite","definite-error-unrecognized-form-masculine-neuter-singular":"bătătoritul","definite-error-unrecognized-form-feminine-singular":"bătătorita","definite-error-unrecognized-form-masculine-plural":"bătătoriții","definite-error-unrecognized-form-feminine-neuter-plural":"bătătoritele"}},{"word":"bătătorniță","pos":"noun","definitions":["hoary ragwort (Jacobaea erucifolia)"],"forms":{"plural":"bătătornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătătorniță","accusative-definite-nominative-singular":"bătătornița","accusative-indefinite-nominative-plural":"bătătornițe","accusative-definite-nominative-plural":"bătătornițele","dative-genitive-indefinite-singular":"bătătornițe","dative-definite-genitive-singular":"bătătorniței","dative-genitive-indefinite-plural":"bătătornițe","dative-definite-genitive-plural":"bătătornițelor","singular-vocative":"bătătorniță","plural-vocative":"bătătornițelor"}},{"word":"bătătură","pos":"noun","definitions":["callus, callosity","weft, woof","yard (especially in rural areas)"],"forms":{"plural":"bătături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bătătură","accusative-definite-nominative-singular":"bătătura","accusative-indefinite-nominative-plural":"bătături","accusative-definite-nominative-plural":"bătăturile","dative-genitive-indefinite-singular":"bătături","dative-definite-genitive-singular":"bătăturii","dative-genitive-indefinite-plural":"bătături","dative-definite-genitive-plural":"bătăturilor","singular-vocative":"bătătură","plural-vocative":"bătăturilor"}},{"word":"Bătătura Cailor","pos":"name","definitions":["a river in Romania, tributary to the Cormoș"],"gender":"f","forms":{"canonical-feminine":"Bătătură Cailor"}},{"word":"bătăturat","pos":"noun","definitions":["beaten (about soil)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bătăturat","accusative-definite-nominative":"bătăturatul","dative-genitive-indefinite":"bătăturat","dative-definite-genitive":"bătăturatului","vocative":"bătăturatule"}},{"word":"bătăturat","pos":"verb","definitions":["past participle of bătătura"],"forms":{"participle-past":"of bătătura"}},{"word":"bătături","pos":"verb","definitions":["alternative form of bătători"],"forms":{"canonical":"a bătături 4th conjugation","present-singular-third-person":"bătăturește","participle-past":"bătăturit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bătături","gerund":"bătăturind","first-person-indicative-present-singular":"bătăturesc","indicative-present-second-person-singular":"bătăturești","indicative-present-singular-third-person":"bătăturește","first-person-indicative-plural-present":"bătăturim","indicative-plural-present-second-person":"bătăturiți","indicative-plural-present-third-person":"bătăturesc","first-person-imperfect-indicative-singular":"bătătuream","imperfect-indicative-second-person-singular":"bătătureai","imperfect-indicative-singular-third-person":"bătăturea","first-person-imperfect-indicative-plural":"bătătuream","imperfect-indicative-plural-second-person":"bătătureați","imperfect-indicative-plural-third-person":"bătătureau","first-person-indicative-perfect-singular":"bătăturii","indicative-perfect-second-person-singular":"bătăturiși","indicative-perfect-singular-third-person":"bătături","first-person-indicative-perfect-plural":"bătăturirăm","indicative-perfect-plural-second-person":"bătăturirăți","indicative-perfect-plural-third-person":"bătăturiră","first-person-indicative-pluperfect-singular":"bătăturisem","indicative-pluperfect-second-person-singular":"bătăturiseși","indicative-pluperfect-singular-third-person":"bătăturise","first-person-indicative-pluperfect-plural":"bătăturiserăm","indicative-pluperfect-plural-second-person":"bătăturiserăți","indicative-pluperfect-plural-third-person":"bătăturiseră","first-person-present-singular-subjunctive":"să bătăturesc","present-second-person-singular-subjunctive":"să bătăturești","present-singular-subjunctive-third-person":"să bătăturească","first-person-plural-present-subjunctive":"să bătăturim","plural-present-second-person-subjunctive":"să bătăturiți","plural-present-subjunctive-third-person":"să bătăturească","imperative-second-person-singular":"bătăturește","imperative-plural-second-person":"bătăturiți","imperative-negative-second-person-singular":"nu bătături","imperative-negative-plural-second-person":"nu bătăturiți"}},{"word":"Bătăuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătăuș"}},{"word":"bătăuș","pos":"adj","definitions":["brawling"],"forms":{"feminine-singular":"bătăușă","masculine-plural":"bătăuși","feminine-neuter-plural":"bătăușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătăuș","error-unrecognized-form-feminine-indefinite-singular":"bătăușă","error-unrecognized-form-indefinite-masculine-plural":"bătăuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătăușe","definite-error-unrecognized-form-masculine-neuter-singular":"bătăușul","definite-error-unrecognized-form-feminine-singular":"bătăușa","definite-error-unrecognized-form-masculine-plural":"bătăușii","definite-error-unrecognized-form-feminine-neuter-plural":"bătăușele"}},{"word":"bătăuș","pos":"noun","definitions":["brawler, bully","ruff (Calidris pugnax)"],"forms":{"plural":"bătăuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătăuș","accusative-definite-nominative-singular":"bătăușul","accusative-indefinite-nominative-plural":"bătăuși","accusative-definite-nominative-plural":"bătăușii","dative-genitive-indefinite-singular":"bătăuș","dative-definite-genitive-singular":"bătăușului","dative-genitive-indefinite-plural":"bătăuși","dative-definite-genitive-plural":"bătăușilor","singular-vocative":"bătăușule","plural-vocative":"bătăușilor"}},{"word":"bătăușă","pos":"noun","definitions":["female equivalent of bătăuș"],"forms":{"plural":"bătăușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătăușă","accusative-definite-nominative-singular":"bătăușa","accusative-indefinite-nominative-plural":"bătăușe","accusative-definite-nominative-plural":"bătăușele","dative-genitive-indefinite-singular":"bătăușe","dative-definite-genitive-singular":"bătăușei","dative-genitive-indefinite-plural":"bătăușe","dative-definite-genitive-plural":"bătăușelor","singular-vocative":"bătăușă","plural-vocative":"bătăușelor"}},{"word":"Bătăușu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătăușu"}},{"word":"batav","pos":"noun","definitions":["Batavian"],"forms":{"plural":"batavi","feminine":"equivalent batavă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batav","accusative-definite-nominative-singular":"batavul","accusative-indefinite-nominative-plural":"batavi","accusative-definite-nominative-plural":"batavii","dative-genitive-indefinite-singular":"batav","dative-definite-genitive-singular":"batavului","dative-genitive-indefinite-plural":"batavi","dative-definite-genitive-plural":"batavilor","singular-vocative":"batavule","plural-vocative":"batavilor"}},{"word":"batavă","pos":"noun","definitions":["female equivalent of batav"],"forms":{"plural":"batave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batavă","accusative-definite-nominative-singular":"batava","accusative-indefinite-nominative-plural":"batave","accusative-definite-nominative-plural":"batavele","dative-genitive-indefinite-singular":"batave","dative-definite-genitive-singular":"batavei","dative-genitive-indefinite-plural":"batave","dative-definite-genitive-plural":"batavelor","singular-vocative":"batavă","plural-vocative":"batavelor"}},{"word":"Bâtcari","pos":"name","definitions":["a village in Nistorești, Vrancea County, Romania"],"gender":"m","forms":{"alternative":"Bîtcari"}},{"word":"bătculiță","pos":"noun","definitions":["diminutive of batcă"],"forms":{"plural":"bătculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătculiță","accusative-definite-nominative-singular":"bătculița","accusative-indefinite-nominative-plural":"bătculițe","accusative-definite-nominative-plural":"bătculițele","dative-genitive-indefinite-singular":"bătculițe","dative-definite-genitive-singular":"bătculiței","dative-genitive-indefinite-plural":"bătculițe","dative-definite-genitive-plural":"bătculițelor","singular-vocative":"bătculiță","plural-vocative":"bătculițelor"}},{"word":"bâtcuță","pos":"noun","definitions":["diminutive of bâtcă"],"forms":{"plural":"bâtcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtcuță","accusative-definite-nominative-singular":"bâtcuța","accusative-indefinite-nominative-plural":"bâtcuțe","accusative-definite-nominative-plural":"bâtcuțele","dative-genitive-indefinite-singular":"bâtcuțe","dative-definite-genitive-singular":"bâtcuței","dative-genitive-indefinite-plural":"bâtcuțe","dative-definite-genitive-plural":"bâtcuțelor","singular-vocative":"bâtcuță","plural-vocative":"bâtcuțelor","alternative":"bîtcuță"}},{"word":"bate","pos":"verb","definitions":["to beat (repeatedly hit for various purposes)","to beat (give a beating)","to have a fight","to defeat","to beat"],"pronunciation":"/ˈba.te/","examples":[{"ro":"a bate la ușă","en":"to knock on the door"},{"ro":"a bate untul","en":"to churn butter"},{"ro":"a bate la mașină","en":"to type on a typewriter"}],"forms":{"canonical":"a bate 3rd conjugation","present-singular-third-person":"bate","participle-past":"bătut","subjunctive-third-person":"bată","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a bate","gerund":"bătând","first-person-indicative-present-singular":"bat","indicative-present-second-person-singular":"bați","indicative-present-singular-third-person":"bate","first-person-indicative-plural-present":"batem","indicative-plural-present-second-person":"bateți","indicative-plural-present-third-person":"bat","first-person-imperfect-indicative-singular":"băteam","imperfect-indicative-second-person-singular":"băteai","imperfect-indicative-singular-third-person":"bătea","first-person-imperfect-indicative-plural":"băteam","imperfect-indicative-plural-second-person":"băteați","imperfect-indicative-plural-third-person":"băteau","first-person-indicative-perfect-singular":"bătui","indicative-perfect-second-person-singular":"bătuși","indicative-perfect-singular-third-person":"bătu","first-person-indicative-perfect-plural":"băturăm","indicative-perfect-plural-second-person":"băturăți","indicative-perfect-plural-third-person":"bătură","first-person-indicative-pluperfect-singular":"bătusem","indicative-pluperfect-second-person-singular":"bătuseși","indicative-pluperfect-singular-third-person":"bătuse","first-person-indicative-pluperfect-plural":"bătuserăm","indicative-pluperfect-plural-second-person":"bătuserăți","indicative-pluperfect-plural-third-person":"bătuseră","first-person-present-singular-subjunctive":"să bat","present-second-person-singular-subjunctive":"să bați","present-singular-subjunctive-third-person":"să bată","first-person-plural-present-subjunctive":"să batem","plural-present-second-person-subjunctive":"să bateți","plural-present-subjunctive-third-person":"să bată","imperative-second-person-singular":"bate","imperative-plural-second-person":"bateți","imperative-negative-second-person-singular":"nu bate","imperative-negative-plural-second-person":"nu bateți","alternative":"бате"}},{"word":"bate apa-n piuă","pos":"verb","definitions":["to talk pointlessly"],"forms":{"canonical":"bate apa-n piuă 3rd conjugation","present-singular-third-person":"bate apa-n piuă","participle-past":"bătut apa-n piuă","subjunctive-third-person":"bată apa-n piuă"}},{"word":"bate fierul cât e cald","pos":"proverb","definitions":["strike the iron while it's hot"]},{"word":"bate la cap","pos":"verb","definitions":["to pester","synonym of i se urca la cap (“to go to one’s head”)"],"forms":{"canonical":"a bate la cap 3rd conjugation","present-singular-third-person":"bate la cap","participle-past":"bătut la cap","subjunctive-third-person":"bată la cap","alternative":"îi bate capul"}},{"word":"bate la ochi","pos":"verb","definitions":["to be very obvious"],"forms":{"canonical":"a bate la ochi 3rd conjugation","present-singular-third-person":"bate la ochi","participle-past":"bătut la ochi","subjunctive-third-person":"bată la ochi"}},{"word":"bate la tălpi","pos":"verb","definitions":["to bastinado"],"forms":{"canonical":"a bate la tălpi 3rd conjugation","present-singular-third-person":"bate la tălpi","participle-past":"bătut la tălpi","subjunctive-third-person":"bată la tălpi"}},{"word":"bate palma","pos":"verb","definitions":["to seal the deal"],"forms":{"canonical":"a bate palma 3rd conjugation","present-singular-third-person":"bate palma","participle-past":"bătut palma","subjunctive-third-person":"bată palma"}},{"word":"batel","pos":"noun","definitions":["a small ship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"batel","accusative-definite-nominative":"batelul","dative-genitive-indefinite":"batel","dative-definite-genitive":"batelului","vocative":"batelule"}},{"word":"batem","pos":"verb","definitions":["first-person plural present indicative/subjunctive of bate"],"pronunciation":"[ˈbatem]"},{"word":"batere","pos":"noun","definitions":["the act of beating, a pounding"],"forms":{"plural":"bateri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"batere","accusative-definite-nominative-singular":"baterea","accusative-indefinite-nominative-plural":"bateri","accusative-definite-nominative-plural":"baterile","dative-genitive-indefinite-singular":"bateri","dative-definite-genitive-singular":"baterii","dative-genitive-indefinite-plural":"bateri","dative-definite-genitive-plural":"baterilor","singular-vocative":"batere","plural-vocative":"baterilor"}},{"word":"bateri","pos":"noun","definitions":["inflection of batere:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈbaterʲ]","gender":"f"},{"word":"baterie","pos":"noun","definitions":["battery"],"forms":{"plural":"baterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"baterie","accusative-definite-nominative-singular":"bateria","accusative-indefinite-nominative-plural":"baterii","accusative-definite-nominative-plural":"bateriile","dative-genitive-indefinite-singular":"baterii","dative-definite-genitive-singular":"bateriei","dative-genitive-indefinite-plural":"baterii","dative-definite-genitive-plural":"bateriilor","singular-vocative":"baterie","plural-vocative":"bateriilor"}},{"word":"baterie alcalină","pos":"noun","definitions":["alkaline battery"],"forms":{"plural":"baterii alcaline"}},{"word":"baterie solară","pos":"noun","definitions":["solar battery"],"forms":{"plural":"baterii solare"}},{"word":"baterist","pos":"noun","definitions":["drummer"],"forms":{"plural":"bateriști","feminine":"equivalent bateristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baterist","accusative-definite-nominative-singular":"bateristul","accusative-indefinite-nominative-plural":"bateristi","accusative-definite-nominative-plural":"bateristii","dative-genitive-indefinite-singular":"baterist","dative-definite-genitive-singular":"bateristului","dative-genitive-indefinite-plural":"bateristi","dative-definite-genitive-plural":"bateristilor","singular-vocative":"bateristule","plural-vocative":"bateristilor"}},{"word":"bateristă","pos":"noun","definitions":["female equivalent of baterist"],"forms":{"plural":"bateriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bateristă","accusative-definite-nominative-singular":"baterista","accusative-indefinite-nominative-plural":"bateriste","accusative-definite-nominative-plural":"bateristele","dative-genitive-indefinite-singular":"bateriste","dative-definite-genitive-singular":"bateristei","dative-genitive-indefinite-plural":"bateriste","dative-definite-genitive-plural":"bateristelor","singular-vocative":"bateristă","plural-vocative":"bateristelor"}},{"word":"Bătești","pos":"name","definitions":["a village in Brazi, Prahova County, Romania","a village in Făget, Timiș County, Romania"],"gender":"m"},{"word":"batgiocura","pos":"verb","definitions":["alternative form of batjocori"],"forms":{"canonical":"a batgiocura 1st conjugation","present-singular-third-person":"batgiocurează","participle-past":"batgiocurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a batgiocura","gerund":"batgiocurând","first-person-indicative-present-singular":"batgiocurez","indicative-present-second-person-singular":"batgiocurezi","indicative-present-singular-third-person":"batgiocurează","first-person-indicative-plural-present":"batgiocurăm","indicative-plural-present-second-person":"batgiocurați","indicative-plural-present-third-person":"batgiocurează","first-person-imperfect-indicative-singular":"batgiocuram","imperfect-indicative-second-person-singular":"batgiocurai","imperfect-indicative-singular-third-person":"batgiocura","first-person-imperfect-indicative-plural":"batgiocuram","imperfect-indicative-plural-second-person":"batgiocurați","imperfect-indicative-plural-third-person":"batgiocurau","first-person-indicative-perfect-singular":"batgiocurai","indicative-perfect-second-person-singular":"batgiocurași","indicative-perfect-singular-third-person":"batgiocură","first-person-indicative-perfect-plural":"batgiocurarăm","indicative-perfect-plural-second-person":"batgiocurarăți","indicative-perfect-plural-third-person":"batgiocurară","first-person-indicative-pluperfect-singular":"batgiocurasem","indicative-pluperfect-second-person-singular":"batgiocuraseși","indicative-pluperfect-singular-third-person":"batgiocurase","first-person-indicative-pluperfect-plural":"batgiocuraserăm","indicative-pluperfect-plural-second-person":"batgiocuraserăți","indicative-pluperfect-plural-third-person":"batgiocuraseră","first-person-present-singular-subjunctive":"să batgiocurez","present-second-person-singular-subjunctive":"să batgiocurezi","present-singular-subjunctive-third-person":"să batgiocureze","first-person-plural-present-subjunctive":"să batgiocurăm","plural-present-second-person-subjunctive":"să batgiocurați","plural-present-subjunctive-third-person":"să batgiocureze","imperative-second-person-singular":"batgiocurează","imperative-plural-second-person":"batgiocurați","imperative-negative-second-person-singular":"nu batgiocura","imperative-negative-plural-second-person":"nu batgiocurați"}},{"word":"bathonian","pos":"adj","definitions":["Bathonian"],"forms":{"feminine-singular":"bathoniană","masculine-plural":"bathonieni","feminine-neuter-plural":"bathoniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bathonian","error-unrecognized-form-feminine-indefinite-singular":"bathoniană","error-unrecognized-form-indefinite-masculine-plural":"bathonieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bathoniene","definite-error-unrecognized-form-masculine-neuter-singular":"bathonianul","definite-error-unrecognized-form-feminine-singular":"bathoniana","definite-error-unrecognized-form-masculine-plural":"bathonienii","definite-error-unrecognized-form-feminine-neuter-plural":"bathonienele"}},{"word":"bathonian","pos":"noun","definitions":["Bathonian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bathonian","accusative-definite-nominative":"bathonianul","dative-genitive-indefinite":"bathonian","dative-definite-genitive":"bathonianului","vocative":"bathonianule"}},{"word":"bați","pos":"verb","definitions":["second-person plural present indicative of bate: you pl: hit, beat, defeat","second-person plural imperative of bate: hit!"],"pronunciation":"[bat͡sʲ]"},{"word":"batial","pos":"adj","definitions":["bathyal"],"forms":{"feminine-singular":"batială","masculine-plural":"batiali","feminine-neuter-plural":"batiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batial","error-unrecognized-form-feminine-indefinite-singular":"batială","error-unrecognized-form-indefinite-masculine-plural":"batiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"batiale","definite-error-unrecognized-form-masculine-neuter-singular":"batialul","definite-error-unrecognized-form-feminine-singular":"batiala","definite-error-unrecognized-form-masculine-plural":"batialii","definite-error-unrecognized-form-feminine-neuter-plural":"batialele"}},{"word":"batic","pos":"noun","definitions":["headscarf, kerchief","batik"],"forms":{"plural":"baticuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"batic","accusative-definite-nominative-singular":"baticul","accusative-indefinite-nominative-plural":"baticuri","accusative-definite-nominative-plural":"baticurile","dative-genitive-indefinite-singular":"batic","dative-definite-genitive-singular":"baticului","dative-genitive-indefinite-plural":"baticuri","dative-definite-genitive-plural":"baticurilor","singular-vocative":"baticule","plural-vocative":"baticurilor"}},{"word":"Batîc","pos":"name","definitions":["a village in Geamăna, Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"bâtic","pos":"noun","definitions":["diminutive of bât"],"forms":{"plural":"bâtici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bâtic","accusative-definite-nominative-singular":"bâticul","accusative-indefinite-nominative-plural":"bâtici","accusative-definite-nominative-plural":"bâticii","dative-genitive-indefinite-singular":"bâtic","dative-definite-genitive-singular":"bâticului","dative-genitive-indefinite-plural":"bâtici","dative-definite-genitive-plural":"bâticilor","singular-vocative":"bâticule","plural-vocative":"bâticilor","alternative":"bîtic"}},{"word":"bâtică","pos":"noun","definitions":["diminutive of bâtă (“cudgel”)"],"forms":{"plural":"bâtice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtică","accusative-definite-nominative-singular":"bâtica","accusative-indefinite-nominative-plural":"bâtice","accusative-definite-nominative-plural":"bâticele","dative-genitive-indefinite-singular":"bâtice","dative-definite-genitive-singular":"bâticei","dative-genitive-indefinite-plural":"bâtice","dative-definite-genitive-plural":"bâticelor","singular-vocative":"bâtică","plural-vocative":"bâticelor","alternative":"bîtică"}},{"word":"bâtică","pos":"noun","definitions":["diminutive of bâtă (“grandmother, old woman”)"],"forms":{"plural":"bâtice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtică","accusative-definite-nominative-singular":"bâtica","accusative-indefinite-nominative-plural":"bâtice","accusative-definite-nominative-plural":"bâticele","dative-genitive-indefinite-singular":"bâtice","dative-definite-genitive-singular":"bâticei","dative-genitive-indefinite-plural":"bâtice","dative-definite-genitive-plural":"bâticelor","singular-vocative":"bâtică","plural-vocative":"bâticelor","alternative":"bîtică"}},{"word":"Bătică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătică"}},{"word":"bâticea","pos":"noun","definitions":["diminutive of bâtică (“small cudgel”)"],"forms":{"plural":"bâticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bâticea","accusative-definite-nominative-singular":"bâticeaua","accusative-indefinite-nominative-plural":"bâticele","accusative-definite-nominative-plural":"bâticelele","dative-genitive-indefinite-singular":"bâticele","dative-definite-genitive-singular":"bâticelei","dative-genitive-indefinite-plural":"bâticele","dative-definite-genitive-plural":"bâticelelor","singular-vocative":"bâticea","plural-vocative":"bâticelelor","alternative":"bîticea"}},{"word":"bâticel","pos":"noun","definitions":["diminutive of bât (“cudgel”)"],"forms":{"plural":"bâticele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bâticel","accusative-definite-nominative-singular":"bâticelul","accusative-indefinite-nominative-plural":"bâticele","accusative-definite-nominative-plural":"bâticelele","dative-genitive-indefinite-singular":"bâticel","dative-definite-genitive-singular":"bâticelului","dative-genitive-indefinite-plural":"bâticele","dative-definite-genitive-plural":"bâticelelor","singular-vocative":"bâticelule","plural-vocative":"bâticelelor","alternative":"bîticel"}},{"word":"bâticuță","pos":"noun","definitions":["diminutive of bâtică (“small cudgel”)"],"forms":{"plural":"bâticuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâticuță","accusative-definite-nominative-singular":"bâticuța","accusative-indefinite-nominative-plural":"bâticuțe","accusative-definite-nominative-plural":"bâticuțele","dative-genitive-indefinite-singular":"bâticuțe","dative-definite-genitive-singular":"bâticuței","dative-genitive-indefinite-plural":"bâticuțe","dative-definite-genitive-plural":"bâticuțelor","singular-vocative":"bâticuță","plural-vocative":"bâticuțelor","alternative":"bîticuță"}},{"word":"batigrafic","pos":"adj","definitions":["bathygraphic"],"forms":{"feminine-singular":"batigrafică","masculine-plural":"batigrafici","feminine-neuter-plural":"batigrafice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batigrafic","error-unrecognized-form-feminine-indefinite-singular":"batigrafică","error-unrecognized-form-indefinite-masculine-plural":"batigrafici","error-unrecognized-form-feminine-indefinite-neuter-plural":"batigrafice","definite-error-unrecognized-form-masculine-neuter-singular":"batigraficul","definite-error-unrecognized-form-feminine-singular":"batigrafica","definite-error-unrecognized-form-masculine-plural":"batigraficii","definite-error-unrecognized-form-feminine-neuter-plural":"batigraficele"}},{"word":"batigrafie","pos":"noun","definitions":["bathygraphy"],"forms":{"plural":"batigrafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"batigrafie","accusative-definite-nominative-singular":"batigrafia","accusative-indefinite-nominative-plural":"batigrafii","accusative-definite-nominative-plural":"batigrafiile","dative-genitive-indefinite-singular":"batigrafii","dative-definite-genitive-singular":"batigrafiei","dative-genitive-indefinite-plural":"batigrafii","dative-definite-genitive-plural":"batigrafiilor","singular-vocative":"batigrafie","plural-vocative":"batigrafiilor"}},{"word":"batimetric","pos":"adj","definitions":["bathymetric"],"forms":{"feminine-singular":"batimetrică","masculine-plural":"batimetrici","feminine-neuter-plural":"batimetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batimetric","error-unrecognized-form-feminine-indefinite-singular":"batimetrică","error-unrecognized-form-indefinite-masculine-plural":"batimetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"batimetrice","definite-error-unrecognized-form-masculine-neuter-singular":"batimetricul","definite-error-unrecognized-form-feminine-singular":"batimetrica","definite-error-unrecognized-form-masculine-plural":"batimetricii","definite-error-unrecognized-form-feminine-neuter-plural":"batimetricele"}},{"word":"batimetrie","pos":"noun","definitions":["bathymetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"batimetrie","accusative-definite-nominative":"batimetria","dative-genitive-indefinite":"batimetrii","dative-definite-genitive":"batimetriei","vocative":"batimetrie"}},{"word":"batimetru","pos":"noun","definitions":["bathometer"],"forms":{"plural":"batimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batimetru","accusative-definite-nominative-singular":"batimetrul","accusative-indefinite-nominative-plural":"batimetre","accusative-definite-nominative-plural":"batimetrele","dative-genitive-indefinite-singular":"batimetru","dative-definite-genitive-singular":"batimetrului","dative-genitive-indefinite-plural":"batimetre","dative-definite-genitive-plural":"batimetrelor","singular-vocative":"batimetrule","plural-vocative":"batimetrelor"}},{"word":"Bătineanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătineanu"}},{"word":"Bătinești","pos":"name","definitions":["a village in Țifești, Vrancea County, Romania"],"gender":"m"},{"word":"batipelagic","pos":"adj","definitions":["bathypelagic"],"forms":{"feminine-singular":"batipelagică","masculine-plural":"batipelagici","feminine-neuter-plural":"batipelagice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batipelagic","error-unrecognized-form-feminine-indefinite-singular":"batipelagică","error-unrecognized-form-indefinite-masculine-plural":"batipelagici","error-unrecognized-form-feminine-indefinite-neuter-plural":"batipelagice","definite-error-unrecognized-form-masculine-neuter-singular":"batipelagicul","definite-error-unrecognized-form-feminine-singular":"batipelagica","definite-error-unrecognized-form-masculine-plural":"batipelagicii","definite-error-unrecognized-form-feminine-neuter-plural":"batipelagicele"}},{"word":"batiplancton","pos":"noun","definitions":["bathyplankton"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"batiplancton","accusative-definite-nominative":"batiplanctonul","dative-genitive-indefinite":"batiplancton","dative-definite-genitive":"batiplanctonului","vocative":"batiplanctonule"}},{"word":"Batîr","pos":"name","definitions":["a village in Batîr, Cimișlia Raion, Moldova","a commune of Cimișlia Raion, Moldova"],"gender":"m"},{"word":"batiscaf","pos":"noun","definitions":["bathyscaphe"],"forms":{"plural":"batiscafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"batiscaf","accusative-definite-nominative-singular":"batiscaful","accusative-indefinite-nominative-plural":"batiscafuri","accusative-definite-nominative-plural":"batiscafurile","dative-genitive-indefinite-singular":"batiscaf","dative-definite-genitive-singular":"batiscafului","dative-genitive-indefinite-plural":"batiscafuri","dative-definite-genitive-plural":"batiscafurilor","singular-vocative":"batiscafule","plural-vocative":"batiscafurilor"}},{"word":"batisferă","pos":"noun","definitions":["bathysphere"],"forms":{"plural":"batisfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batisferă","accusative-definite-nominative-singular":"batisfera","accusative-indefinite-nominative-plural":"batisfere","accusative-definite-nominative-plural":"batisferele","dative-genitive-indefinite-singular":"batisfere","dative-definite-genitive-singular":"batisferei","dative-genitive-indefinite-plural":"batisfere","dative-definite-genitive-plural":"batisferelor","singular-vocative":"batisferă","plural-vocative":"batisferelor"}},{"word":"batist","pos":"noun","definitions":["batiste, cambric"],"pronunciation":"/baˈtist/","forms":{"plural":"batisturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"batist","accusative-definite-nominative-singular":"batistul","accusative-indefinite-nominative-plural":"batisturi","accusative-definite-nominative-plural":"batisturile","dative-genitive-indefinite-singular":"batist","dative-definite-genitive-singular":"batistului","dative-genitive-indefinite-plural":"batisturi","dative-definite-genitive-plural":"batisturilor","singular-vocative":"batistule","plural-vocative":"batisturilor"}},{"word":"batista","pos":"noun","definitions":["definite nominative/accusative singular of batistă (“handkerchief”)"],"pronunciation":"/baˈtis.ta/"},{"word":"Batistă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Batistă"}},{"word":"batistă","pos":"noun","definitions":["handkerchief","batiste"],"pronunciation":"/baˈtis.tə/","forms":{"plural":"batiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batistă","accusative-definite-nominative-singular":"batista","accusative-indefinite-nominative-plural":"batiste","accusative-definite-nominative-plural":"batistele","dative-genitive-indefinite-singular":"batiste","dative-definite-genitive-singular":"batistei","dative-genitive-indefinite-plural":"batiste","dative-definite-genitive-plural":"batistelor","singular-vocative":"batistă","plural-vocative":"batistelor"}},{"word":"batiște","pos":"noun","definitions":["yard"],"forms":{"plural":"batiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"batiște","accusative-definite-nominative-singular":"batiștea","accusative-indefinite-nominative-plural":"batiști","accusative-definite-nominative-plural":"batiștile","dative-genitive-indefinite-singular":"batiști","dative-definite-genitive-singular":"batiștii","dative-genitive-indefinite-plural":"batiști","dative-definite-genitive-plural":"batiștilor","singular-vocative":"batiște","plural-vocative":"batiștilor"}},{"word":"batistuță","pos":"noun","definitions":["diminutive of batistă"],"forms":{"plural":"batistuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batistuță","accusative-definite-nominative-singular":"batistuța","accusative-indefinite-nominative-plural":"batistuțe","accusative-definite-nominative-plural":"batistuțele","dative-genitive-indefinite-singular":"batistuțe","dative-definite-genitive-singular":"batistuței","dative-genitive-indefinite-plural":"batistuțe","dative-definite-genitive-plural":"batistuțelor","singular-vocative":"batistuță","plural-vocative":"batistuțelor"}},{"word":"batitermograf","pos":"noun","definitions":["bathythermograph"],"forms":{"plural":"batitermografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batitermograf","accusative-definite-nominative-singular":"batitermograful","accusative-indefinite-nominative-plural":"batitermografe","accusative-definite-nominative-plural":"batitermografele","dative-genitive-indefinite-singular":"batitermograf","dative-definite-genitive-singular":"batitermografului","dative-genitive-indefinite-plural":"batitermografe","dative-definite-genitive-plural":"batitermografelor","singular-vocative":"batitermografule","plural-vocative":"batitermografelor"}},{"word":"batiu","pos":"noun","definitions":["frame"],"forms":{"plural":"batiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batiu","accusative-definite-nominative-singular":"batiul","accusative-indefinite-nominative-plural":"batiuri","accusative-definite-nominative-plural":"batiurile","dative-genitive-indefinite-singular":"batiu","dative-definite-genitive-singular":"batiului","dative-genitive-indefinite-plural":"batiuri","dative-definite-genitive-plural":"batiurilor","singular-vocative":"batiule","plural-vocative":"batiurilor"}},{"word":"batiușca","pos":"noun","definitions":["priest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"batiușca","accusative-definite-nominative":"batiușcaul","dative-genitive-indefinite":"batiușca","dative-definite-genitive":"batiușcaului","vocative":"batiușcaule"}},{"word":"batjocoră","pos":"noun","definitions":["alternative form of batjocură"],"forms":{"plural":"batjocori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"batjocoră","accusative-definite-nominative-singular":"batjocora","accusative-indefinite-nominative-plural":"batjocori","accusative-definite-nominative-plural":"batjocorile","dative-genitive-indefinite-singular":"batjocori","dative-definite-genitive-singular":"batjocorii","dative-genitive-indefinite-plural":"batjocori","dative-definite-genitive-plural":"batjocorilor","singular-vocative":"batjocoră","plural-vocative":"batjocorilor"}},{"word":"batjocori","pos":"verb","definitions":["to make fun of, mock, ridicule"],"forms":{"canonical":"a batjocori 4th conjugation","present-singular-third-person":"batjocorește","participle-past":"batjocorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a batjocori","gerund":"batjocorind","first-person-indicative-present-singular":"batjocoresc","indicative-present-second-person-singular":"batjocorești","indicative-present-singular-third-person":"batjocorește","first-person-indicative-plural-present":"batjocorim","indicative-plural-present-second-person":"batjocoriți","indicative-plural-present-third-person":"batjocoresc","first-person-imperfect-indicative-singular":"batjocoream","imperfect-indicative-second-person-singular":"batjocoreai","imperfect-indicative-singular-third-person":"batjocorea","first-person-imperfect-indicative-plural":"batjocoream","imperfect-indicative-plural-second-person":"batjocoreați","imperfect-indicative-plural-third-person":"batjocoreau","first-person-indicative-perfect-singular":"batjocorii","indicative-perfect-second-person-singular":"batjocoriși","indicative-perfect-singular-third-person":"batjocori","first-person-indicative-perfect-plural":"batjocorirăm","indicative-perfect-plural-second-person":"batjocorirăți","indicative-perfect-plural-third-person":"batjocoriră","first-person-indicative-pluperfect-singular":"batjocorisem","indicative-pluperfect-second-person-singular":"batjocoriseși","indicative-pluperfect-singular-third-person":"batjocorise","first-person-indicative-pluperfect-plural":"batjocoriserăm","indicative-pluperfect-plural-second-person":"batjocoriserăți","indicative-pluperfect-plural-third-person":"batjocoriseră","first-person-present-singular-subjunctive":"să batjocoresc","present-second-person-singular-subjunctive":"să batjocorești","present-singular-subjunctive-third-person":"să batjocorească","first-person-plural-present-subjunctive":"să batjocorim","plural-present-second-person-subjunctive":"să batjocoriți","plural-present-subjunctive-third-person":"să batjocorească","imperative-second-person-singular":"batjocorește","imperative-plural-second-person":"batjocoriți","imperative-negative-second-person-singular":"nu batjocori","imperative-negative-plural-second-person":"nu batjocoriți","alternative":"batjocuri"}},{"word":"batjocorire","pos":"noun","definitions":["mocking, mockery"],"forms":{"plural":"batjocoriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"batjocorire","accusative-definite-nominative-singular":"batjocorirea","accusative-indefinite-nominative-plural":"batjocoriri","accusative-definite-nominative-plural":"batjocoririle","dative-genitive-indefinite-singular":"batjocoriri","dative-definite-genitive-singular":"batjocoririi","dative-genitive-indefinite-plural":"batjocoriri","dative-definite-genitive-plural":"batjocoririlor","singular-vocative":"batjocorire","plural-vocative":"batjocoririlor"}},{"word":"batjocorit","pos":"adj","definitions":["mocked, defamed"],"forms":{"feminine-singular":"batjocorită","masculine-plural":"batjocoriți","feminine-neuter-plural":"batjocorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batjocorit","error-unrecognized-form-feminine-indefinite-singular":"batjocorită","error-unrecognized-form-indefinite-masculine-plural":"batjocoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"batjocorite","definite-error-unrecognized-form-masculine-neuter-singular":"batjocoritul","definite-error-unrecognized-form-feminine-singular":"batjocorita","definite-error-unrecognized-form-masculine-plural":"batjocoriții","definite-error-unrecognized-form-feminine-neuter-plural":"batjocoritele"}},{"word":"batjocorit","pos":"verb","definitions":["past participle of batjocori"],"forms":{"participle-past":"of batjocori"}},{"word":"batjocoritor","pos":"adj","definitions":["mocking"],"forms":{"feminine-singular":"batjocoritoare","masculine-plural":"batjocoritori","feminine-neuter-plural":"batjocoritoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batjocoritor","error-unrecognized-form-feminine-indefinite-singular":"batjocoritoare","error-unrecognized-form-indefinite-masculine-plural":"batjocoritori","error-unrecognized-form-feminine-indefinite-neuter-plural":"batjocoritoare","definite-error-unrecognized-form-masculine-neuter-singular":"batjocoritorul","definite-error-unrecognized-form-feminine-singular":"batjocoritoarea","definite-error-unrecognized-form-masculine-plural":"batjocoritorii","definite-error-unrecognized-form-feminine-neuter-plural":"batjocoritoarele"}},{"word":"batjocoros","pos":"adj","definitions":["mocking"],"forms":{"feminine-singular":"batjocoroasă","masculine-plural":"batjocoroși","feminine-neuter-plural":"batjocoroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batjocoros","error-unrecognized-form-feminine-indefinite-singular":"batjocoroasă","error-unrecognized-form-indefinite-masculine-plural":"batjocoroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"batjocoroase","definite-error-unrecognized-form-masculine-neuter-singular":"batjocorosul","definite-error-unrecognized-form-feminine-singular":"batjocoroasa","definite-error-unrecognized-form-masculine-plural":"batjocoroșii","definite-error-unrecognized-form-feminine-neuter-plural":"batjocoroasele"}},{"word":"batjocoros","pos":"noun","definitions":["mocker"],"forms":{"plural":"batjocoroși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batjocoros","accusative-definite-nominative-singular":"batjocorosul","accusative-indefinite-nominative-plural":"batjocoroși","accusative-definite-nominative-plural":"batjocoroșii","dative-genitive-indefinite-singular":"batjocoros","dative-definite-genitive-singular":"batjocorosului","dative-genitive-indefinite-plural":"batjocoroși","dative-definite-genitive-plural":"batjocoroșilor","singular-vocative":"batjocorosule","plural-vocative":"batjocoroșilor"}},{"word":"batjocura","pos":"verb","definitions":["alternative form of batjocori"],"forms":{"canonical":"a batjocura 1st conjugation","present-singular-third-person":"batjocurează","participle-past":"batjocurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a batjocura","gerund":"batjocurând","first-person-indicative-present-singular":"batjocurez","indicative-present-second-person-singular":"batjocurezi","indicative-present-singular-third-person":"batjocurează","first-person-indicative-plural-present":"batjocurăm","indicative-plural-present-second-person":"batjocurați","indicative-plural-present-third-person":"batjocurează","first-person-imperfect-indicative-singular":"batjocuram","imperfect-indicative-second-person-singular":"batjocurai","imperfect-indicative-singular-third-person":"batjocura","first-person-imperfect-indicative-plural":"batjocuram","imperfect-indicative-plural-second-person":"batjocurați","imperfect-indicative-plural-third-person":"batjocurau","first-person-indicative-perfect-singular":"batjocurai","indicative-perfect-second-person-singular":"batjocurași","indicative-perfect-singular-third-person":"batjocură","first-person-indicative-perfect-plural":"batjocurarăm","indicative-perfect-plural-second-person":"batjocurarăți","indicative-perfect-plural-third-person":"batjocurară","first-person-indicative-pluperfect-singular":"batjocurasem","indicative-pluperfect-second-person-singular":"batjocuraseși","indicative-pluperfect-singular-third-person":"batjocurase","first-person-indicative-pluperfect-plural":"batjocuraserăm","indicative-pluperfect-plural-second-person":"batjocuraserăți","indicative-pluperfect-plural-third-person":"batjocuraseră","first-person-present-singular-subjunctive":"să batjocurez","present-second-person-singular-subjunctive":"să batjocurezi","present-singular-subjunctive-third-person":"să batjocureze","first-person-plural-present-subjunctive":"să batjocurăm","plural-present-second-person-subjunctive":"să batjocurați","plural-present-subjunctive-third-person":"să batjocureze","imperative-second-person-singular":"batjocurează","imperative-plural-second-person":"batjocurați","imperative-negative-second-person-singular":"nu batjocura","imperative-negative-plural-second-person":"nu batjocurați"}},{"word":"batjocură","pos":"noun","definitions":["derision, ridicule, mocking"],"forms":{"plural":"batjocuri"}},{"word":"batjocuri","pos":"verb","definitions":["alternative form of batjocori"],"forms":{"canonical":"a batjocuri 4th conjugation","present-singular-third-person":"batjocurește","participle-past":"batjocurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a batjocuri","gerund":"batjocurind","first-person-indicative-present-singular":"batjocuresc","indicative-present-second-person-singular":"batjocurești","indicative-present-singular-third-person":"batjocurește","first-person-indicative-plural-present":"batjocurim","indicative-plural-present-second-person":"batjocuriți","indicative-plural-present-third-person":"batjocuresc","first-person-imperfect-indicative-singular":"batjocuream","imperfect-indicative-second-person-singular":"batjocureai","imperfect-indicative-singular-third-person":"batjocurea","first-person-imperfect-indicative-plural":"batjocuream","imperfect-indicative-plural-second-person":"batjocureați","imperfect-indicative-plural-third-person":"batjocureau","first-person-indicative-perfect-singular":"batjocurii","indicative-perfect-second-person-singular":"batjocuriși","indicative-perfect-singular-third-person":"batjocuri","first-person-indicative-perfect-plural":"batjocurirăm","indicative-perfect-plural-second-person":"batjocurirăți","indicative-perfect-plural-third-person":"batjocuriră","first-person-indicative-pluperfect-singular":"batjocurisem","indicative-pluperfect-second-person-singular":"batjocuriseși","indicative-pluperfect-singular-third-person":"batjocurise","first-person-indicative-pluperfect-plural":"batjocuriserăm","indicative-pluperfect-plural-second-person":"batjocuriserăți","indicative-pluperfect-plural-third-person":"batjocuriseră","first-person-present-singular-subjunctive":"să batjocuresc","present-second-person-singular-subjunctive":"să batjocurești","present-singular-subjunctive-third-person":"să batjocurească","first-person-plural-present-subjunctive":"să batjocurim","plural-present-second-person-subjunctive":"să batjocuriți","plural-present-subjunctive-third-person":"să batjocurească","imperative-second-person-singular":"batjocurește","imperative-plural-second-person":"batjocuriți","imperative-negative-second-person-singular":"nu batjocuri","imperative-negative-plural-second-person":"nu batjocuriți"}},{"word":"batjocurie","pos":"noun","definitions":["derision, ridicule, mocking"],"forms":{"plural":"batjocurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"batjocurie","accusative-definite-nominative-singular":"batjocuria","accusative-indefinite-nominative-plural":"batjocurii","accusative-definite-nominative-plural":"batjocuriile","dative-genitive-indefinite-singular":"batjocurii","dative-definite-genitive-singular":"batjocuriei","dative-genitive-indefinite-plural":"batjocurii","dative-definite-genitive-plural":"batjocuriilor","singular-vocative":"batjocurie","plural-vocative":"batjocuriilor"}},{"word":"batjocurire","pos":"noun","definitions":["obsolete form of batjocorire"],"forms":{"plural":"batjocuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"batjocurire","accusative-definite-nominative-singular":"batjocurirea","accusative-indefinite-nominative-plural":"batjocuriri","accusative-definite-nominative-plural":"batjocuririle","dative-genitive-indefinite-singular":"batjocuriri","dative-definite-genitive-singular":"batjocuririi","dative-genitive-indefinite-plural":"batjocuriri","dative-definite-genitive-plural":"batjocuririlor","singular-vocative":"batjocurire","plural-vocative":"batjocuririlor"}},{"word":"bâtlagă","pos":"noun","definitions":["small barrel"],"forms":{"plural":"bâtlage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtlagă","accusative-definite-nominative-singular":"bâtlaga","accusative-indefinite-nominative-plural":"bâtlage","accusative-definite-nominative-plural":"bâtlagele","dative-genitive-indefinite-singular":"bâtlage","dative-definite-genitive-singular":"bâtlagei","dative-genitive-indefinite-plural":"bâtlage","dative-definite-genitive-plural":"bâtlagelor","singular-vocative":"bâtlagă","plural-vocative":"bâtlagelor","alternative":"bîtlagă"}},{"word":"bâtlăgel","pos":"noun","definitions":["diminutive of bâtlag"],"forms":{"plural":"bâtlăgele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bâtlăgel","accusative-definite-nominative-singular":"bâtlăgelul","accusative-indefinite-nominative-plural":"bâtlăgele","accusative-definite-nominative-plural":"bâtlăgelele","dative-genitive-indefinite-singular":"bâtlăgel","dative-definite-genitive-singular":"bâtlăgelului","dative-genitive-indefinite-plural":"bâtlăgele","dative-definite-genitive-plural":"bâtlăgelelor","singular-vocative":"bâtlăgelule","plural-vocative":"bâtlăgelelor","alternative":"bîtlăgel"}},{"word":"Bâtlan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bâtlan","alternative":"Bîtlan"}},{"word":"bâtlan","pos":"noun","definitions":["heron"],"pronunciation":"/bɨtˈlan/","forms":{"plural":"bâtlani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bâtlan","accusative-definite-nominative-singular":"bâtlanul","accusative-indefinite-nominative-plural":"bâtlani","accusative-definite-nominative-plural":"bâtlanii","dative-genitive-indefinite-singular":"bâtlan","dative-definite-genitive-singular":"bâtlanului","dative-genitive-indefinite-plural":"bâtlani","dative-definite-genitive-plural":"bâtlanilor","singular-vocative":"bâtlanule","plural-vocative":"bâtlanilor","alternative":"bîtlan"}},{"word":"bâtlan-de-stuf","pos":"noun","definitions":["Eurasian bittern (Botaurus stellaris)"],"forms":{"plural":"bâtlani-de-stuf"}},{"word":"bâtlănaș","pos":"noun","definitions":["diminutive of bâtlan; small heron"],"forms":{"plural":"bâtlănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bâtlănaș","accusative-definite-nominative-singular":"bâtlănașul","accusative-indefinite-nominative-plural":"bâtlănași","accusative-definite-nominative-plural":"bâtlănașii","dative-genitive-indefinite-singular":"bâtlănaș","dative-definite-genitive-singular":"bâtlănașului","dative-genitive-indefinite-plural":"bâtlănași","dative-definite-genitive-plural":"bâtlănașilor","singular-vocative":"bâtlănașule","plural-vocative":"bâtlănașilor","alternative":"bîtlănaș"}},{"word":"bâtlani","pos":"noun","definitions":["plural of bâtlan"],"gender":"m"},{"word":"bătlog","pos":"noun","definitions":["net for fishing; bow net; eelpout net"],"forms":{"plural":"bătloage","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bătlog","accusative-definite-nominative-singular":"bătlogul","accusative-indefinite-nominative-plural":"bătloage","accusative-definite-nominative-plural":"bătloagele","dative-genitive-indefinite-singular":"bătlog","dative-definite-genitive-singular":"bătlogului","dative-genitive-indefinite-plural":"bătloage","dative-definite-genitive-plural":"bătloagelor","singular-vocative":"bătlogule","plural-vocative":"bătloagelor"}},{"word":"batman","pos":"noun","definitions":["batsman"],"forms":{"plural":"batmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batman","accusative-definite-nominative-singular":"batmanul","accusative-indefinite-nominative-plural":"batmani","accusative-definite-nominative-plural":"batmanii","dative-genitive-indefinite-singular":"batman","dative-definite-genitive-singular":"batmanului","dative-genitive-indefinite-plural":"batmani","dative-definite-genitive-plural":"batmanilor","singular-vocative":"batmanule","plural-vocative":"batmanilor"}},{"word":"batoane","pos":"noun","definitions":["plural of baton"],"pronunciation":"/baˈto̯a.ne/"},{"word":"Batoc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Batoc"}},{"word":"batoc","pos":"noun","definitions":["alternative form of batog"],"forms":{"plural":"batocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"batoc","accusative-definite-nominative-singular":"batocul","accusative-indefinite-nominative-plural":"batocuri","accusative-definite-nominative-plural":"batocurile","dative-genitive-indefinite-singular":"batoc","dative-definite-genitive-singular":"batocului","dative-genitive-indefinite-plural":"batocuri","dative-definite-genitive-plural":"batocurilor","singular-vocative":"batocule","plural-vocative":"batocurilor"}},{"word":"batofobie","pos":"noun","definitions":["bathophobia"],"forms":{"plural":"batofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"batofobie","accusative-definite-nominative-singular":"batofobia","accusative-indefinite-nominative-plural":"batofobii","accusative-definite-nominative-plural":"batofobiile","dative-genitive-indefinite-singular":"batofobii","dative-definite-genitive-singular":"batofobiei","dative-genitive-indefinite-plural":"batofobii","dative-definite-genitive-plural":"batofobiilor","singular-vocative":"batofobie","plural-vocative":"batofobiilor"}},{"word":"batog","pos":"noun","definitions":["salted and smoked fish"],"forms":{"plural":"batoguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"batog","accusative-definite-nominative-singular":"batogul","accusative-indefinite-nominative-plural":"batoguri","accusative-definite-nominative-plural":"batogurile","dative-genitive-indefinite-singular":"batog","dative-definite-genitive-singular":"batogului","dative-genitive-indefinite-plural":"batoguri","dative-definite-genitive-plural":"batogurilor","singular-vocative":"batogule","plural-vocative":"batogurilor"}},{"word":"Batogu","pos":"name","definitions":["a village in Cireșu, Brăila County, Romania","a village in Murgești, Buzău County, Romania"],"gender":"m"},{"word":"bățoinat","pos":"adj","definitions":["daring, bold"],"forms":{"feminine-singular":"bățoinată","masculine-plural":"bățoinați","feminine-neuter-plural":"bățoinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bățoinat","error-unrecognized-form-feminine-indefinite-singular":"bățoinată","error-unrecognized-form-indefinite-masculine-plural":"bățoinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bățoinate","definite-error-unrecognized-form-masculine-neuter-singular":"bățoinatul","definite-error-unrecognized-form-feminine-singular":"bățoinata","definite-error-unrecognized-form-masculine-plural":"bățoinații","definite-error-unrecognized-form-feminine-neuter-plural":"bățoinatele"}},{"word":"batojit","pos":"adj","definitions":["exhausted"],"forms":{"feminine-singular":"batojită","masculine-plural":"batojiți","feminine-neuter-plural":"batojite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"batojit","error-unrecognized-form-feminine-indefinite-singular":"batojită","error-unrecognized-form-indefinite-masculine-plural":"batojiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"batojite","definite-error-unrecognized-form-masculine-neuter-singular":"batojitul","definite-error-unrecognized-form-feminine-singular":"batojita","definite-error-unrecognized-form-masculine-plural":"batojiții","definite-error-unrecognized-form-feminine-neuter-plural":"batojitele"}},{"word":"bătojit","pos":"adj","definitions":["exhausted"],"forms":{"feminine-singular":"bătojită","masculine-plural":"bătojiți","feminine-neuter-plural":"bătojite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătojit","error-unrecognized-form-feminine-indefinite-singular":"bătojită","error-unrecognized-form-indefinite-masculine-plural":"bătojiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătojite","definite-error-unrecognized-form-masculine-neuter-singular":"bătojitul","definite-error-unrecognized-form-feminine-singular":"bătojita","definite-error-unrecognized-form-masculine-plural":"bătojiții","definite-error-unrecognized-form-feminine-neuter-plural":"bătojitele"}},{"word":"batolit","pos":"noun","definitions":["batholith"],"forms":{"plural":"batoliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batolit","accusative-definite-nominative-singular":"batolitul","accusative-indefinite-nominative-plural":"batoliți","accusative-definite-nominative-plural":"batoliții","dative-genitive-indefinite-singular":"batolit","dative-definite-genitive-singular":"batolitului","dative-genitive-indefinite-plural":"batoliți","dative-definite-genitive-plural":"batoliților","singular-vocative":"batolitule","plural-vocative":"batoliților"}},{"word":"batometru","pos":"noun","definitions":["Nansen bottle"],"forms":{"plural":"batometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"batometru","accusative-definite-nominative-singular":"batometruul","accusative-indefinite-nominative-plural":"batometre","accusative-definite-nominative-plural":"batometrele","dative-genitive-indefinite-singular":"batometru","dative-definite-genitive-singular":"batometruului","dative-genitive-indefinite-plural":"batometre","dative-definite-genitive-plural":"batometrelor","singular-vocative":"batometruule","plural-vocative":"batometrelor"}},{"word":"baton","pos":"noun","definitions":["bar, stick"],"pronunciation":"/baˈton/","examples":[{"ro":"baton de ciocolată","en":"chocolate bar"}],"forms":{"plural":"batoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"baton","accusative-definite-nominative-singular":"batonul","accusative-indefinite-nominative-plural":"batoane","accusative-definite-nominative-plural":"batoanele","dative-genitive-indefinite-singular":"baton","dative-definite-genitive-singular":"batonului","dative-genitive-indefinite-plural":"batoane","dative-definite-genitive-plural":"batoanelor","singular-vocative":"batonule","plural-vocative":"batoanelor"}},{"word":"Batoș","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Batoș, Mureș County, Romania"],"gender":"m"},{"word":"bățos","pos":"adj","definitions":["stiff"],"forms":{"feminine-singular":"bățoasă","masculine-plural":"bățoși","feminine-neuter-plural":"bățoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bățos","error-unrecognized-form-feminine-indefinite-singular":"bățoasă","error-unrecognized-form-indefinite-masculine-plural":"bățoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bățoase","definite-error-unrecognized-form-masculine-neuter-singular":"bățosul","definite-error-unrecognized-form-feminine-singular":"bățoasa","definite-error-unrecognized-form-masculine-plural":"bățoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bățoasele"}},{"word":"batoză","pos":"noun","definitions":["thresher"],"forms":{"plural":"batoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"batoză","accusative-definite-nominative-singular":"batoza","accusative-indefinite-nominative-plural":"batoze","accusative-definite-nominative-plural":"batozele","dative-genitive-indefinite-singular":"batoze","dative-definite-genitive-singular":"batozei","dative-genitive-indefinite-plural":"batoze","dative-definite-genitive-plural":"batozelor","singular-vocative":"batoză","plural-vocative":"batozelor"}},{"word":"batozar","pos":"noun","definitions":["thresher operator"],"forms":{"plural":"batozari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batozar","accusative-definite-nominative-singular":"batozarul","accusative-indefinite-nominative-plural":"batozari","accusative-definite-nominative-plural":"batozarii","dative-genitive-indefinite-singular":"batozar","dative-definite-genitive-singular":"batozarului","dative-genitive-indefinite-plural":"batozari","dative-definite-genitive-plural":"batozarilor","singular-vocative":"batozarule","plural-vocative":"batozarilor"}},{"word":"batracian","pos":"noun","definitions":["amphibian, batrachian"],"forms":{"plural":"batracieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"batracian","accusative-definite-nominative-singular":"batracianul","accusative-indefinite-nominative-plural":"batracieni","accusative-definite-nominative-plural":"batracienii","dative-genitive-indefinite-singular":"batracian","dative-definite-genitive-singular":"batracianului","dative-genitive-indefinite-plural":"batracieni","dative-definite-genitive-plural":"batracienilor","singular-vocative":"batracianule","plural-vocative":"batracienilor"}},{"word":"Bătrâioara","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Prahova"],"gender":"f"},{"word":"bătrâior","pos":"adj","definitions":["diminutive of bătrân (adjective)"],"forms":{"feminine-singular":"bătrâioră","masculine-plural":"bătrâiori","feminine-neuter-plural":"bătrâiore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrâior","error-unrecognized-form-feminine-indefinite-singular":"bătrâioră","error-unrecognized-form-indefinite-masculine-plural":"bătrâiori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrâiore","definite-error-unrecognized-form-masculine-neuter-singular":"bătrâiorul","definite-error-unrecognized-form-feminine-singular":"bătrâiora","definite-error-unrecognized-form-masculine-plural":"bătrâiorii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrâiorele","alternative":"bătrîior"}},{"word":"Bătrân","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrân"}},{"word":"bătrân","pos":"adj","definitions":["old"],"pronunciation":"/bəˈtrɨn/","forms":{"feminine-singular":"bătrână","masculine-plural":"bătrâni","feminine-neuter-plural":"bătrâne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrân","error-unrecognized-form-feminine-indefinite-singular":"bătrână","error-unrecognized-form-indefinite-masculine-plural":"bătrâni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrâne","definite-error-unrecognized-form-masculine-neuter-singular":"bătrânul","definite-error-unrecognized-form-feminine-singular":"bătrâna","definite-error-unrecognized-form-masculine-plural":"bătrânii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrânele","alternative":"bătrîn"}},{"word":"bătrân","pos":"noun","definitions":["old man"],"pronunciation":"/bəˈtrɨn/","forms":{"plural":"bătrâni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătrân","accusative-definite-nominative-singular":"bătrânul","accusative-indefinite-nominative-plural":"bătrâni","accusative-definite-nominative-plural":"bătrânii","dative-genitive-indefinite-singular":"bătrân","dative-definite-genitive-singular":"bătrânului","dative-genitive-indefinite-plural":"bătrâni","dative-definite-genitive-plural":"bătrânilor","singular-vocative":"bătrânule","plural-vocative":"bătrânilor","alternative":"bătrîn"}},{"word":"Bătrâna","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Bătrâna, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bătrîna"}},{"word":"bătrâna","pos":"adj","definitions":["definite nominative/accusative feminine singular of bătrân"],"forms":{"alternative":"bătrîna"}},{"word":"bătrâna","pos":"noun","definitions":["definite nominative/accusative singular of bătrână"],"forms":{"alternative":"bătrîna"}},{"word":"bătrână","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of bătrân"],"pronunciation":"/bəˈtrɨ.nə/","forms":{"alternative":"bătrînă"}},{"word":"bătrână","pos":"noun","definitions":["female equivalent of bătrân: old woman"],"pronunciation":"/bəˈtrɨ.nə/","forms":{"plural":"bătrâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătrână","accusative-definite-nominative-singular":"bătrâna","accusative-indefinite-nominative-plural":"bătrâne","accusative-definite-nominative-plural":"bătrânele","dative-genitive-indefinite-singular":"bătrâne","dative-definite-genitive-singular":"bătrânei","dative-genitive-indefinite-plural":"bătrâne","dative-definite-genitive-plural":"bătrânelor","singular-vocative":"bătrână","plural-vocative":"bătrânelor","alternative":"bătrînă"}},{"word":"Bătrâna Mare","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sadu"],"gender":"f"},{"word":"Bătrâna Mică","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Sadu"],"gender":"f","forms":{"canonical-feminine":"Bătrână Mică"}},{"word":"bătrâncior","pos":"adj","definitions":["diminutive of bătrân (adjective)"],"forms":{"feminine-singular":"bătrâncioră","masculine-plural":"bătrânciori","feminine-neuter-plural":"bătrânciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrâncior","error-unrecognized-form-feminine-indefinite-singular":"bătrâncioră","error-unrecognized-form-indefinite-masculine-plural":"bătrânciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrânciore","definite-error-unrecognized-form-masculine-neuter-singular":"bătrânciorul","definite-error-unrecognized-form-feminine-singular":"bătrânciora","definite-error-unrecognized-form-masculine-plural":"bătrânciorii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrânciorele","alternative":"bătrîncior"}},{"word":"bătrânei","pos":"noun","definitions":["definite genitive/dative singular of bătrână"]},{"word":"bătrânel","pos":"adj","definitions":["diminutive of bătrân (“old”)"],"forms":{"feminine-singular":"bătrânică","masculine-plural":"bătrânei","feminine-neuter-plural":"bătrânici","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrânel","error-unrecognized-form-feminine-indefinite-singular":"bătrânică","error-unrecognized-form-indefinite-masculine-plural":"bătrânei","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrânici","definite-error-unrecognized-form-masculine-neuter-singular":"bătrânelul","definite-error-unrecognized-form-feminine-singular":"bătrânica","definite-error-unrecognized-form-masculine-plural":"bătrâneii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrânicile","alternative":"bătrînel"}},{"word":"bătrânel","pos":"noun","definitions":["diminutive of bătrân (“old man”)"],"forms":{"plural":"bătrânei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bătrânel","accusative-definite-nominative-singular":"bătrânelul","accusative-indefinite-nominative-plural":"bătrânei","accusative-definite-nominative-plural":"bătrâneii","dative-genitive-indefinite-singular":"bătrânel","dative-definite-genitive-singular":"bătrânelului","dative-genitive-indefinite-plural":"bătrânei","dative-definite-genitive-plural":"bătrâneilor","singular-vocative":"bătrânelule","plural-vocative":"bătrâneilor","alternative":"bătrînel"}},{"word":"bătrânesc","pos":"adj","definitions":["old-fashioned"],"forms":{"feminine-singular":"bătrânească","plural":"bătrânești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrânesc","error-unrecognized-form-feminine-indefinite-singular":"bătrânească","error-unrecognized-form-indefinite-masculine-plural":"bătrânești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrânești","definite-error-unrecognized-form-masculine-neuter-singular":"bătrânescul","definite-error-unrecognized-form-feminine-singular":"bătrâneasca","definite-error-unrecognized-form-masculine-plural":"bătrâneștii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrâneștile","alternative":"bătrînesc"}},{"word":"bătrânește","pos":"adv","definitions":["in the manner of old people"],"forms":{"alternative":"bătrînește"}},{"word":"Bătrânești","pos":"name","definitions":["a village in Gorbănești, Botoșani County, Romania","a village in Icușești, Neamț County, Romania"],"gender":"m","forms":{"alternative":"Bătrînești"}},{"word":"bătrânet","pos":"noun","definitions":["old people (collectively)"],"pronunciation":"/bə.trɨˈnet/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bătrânet","accusative-definite-nominative":"bătrânetul","dative-genitive-indefinite":"bătrânet","dative-definite-genitive":"bătrânetului","vocative":"bătrânetule","alternative":"bătrînet"}},{"word":"bătrâneță","pos":"noun","definitions":["obsolete form of bătrânețe"],"forms":{"plural":"bătrâneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bătrâneță","accusative-definite-nominative-singular":"bătrâneța","accusative-indefinite-nominative-plural":"bătrâneți","accusative-definite-nominative-plural":"bătrânețile","dative-genitive-indefinite-singular":"bătrâneți","dative-definite-genitive-singular":"bătrâneții","dative-genitive-indefinite-plural":"bătrâneți","dative-definite-genitive-plural":"bătrâneților","singular-vocative":"bătrâneță","plural-vocative":"bătrâneților","alternative":"bătrîneță"}},{"word":"bătrânețe","pos":"noun","definitions":["old age"],"forms":{"plural":"bătrâneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bătrânețe","accusative-definite-nominative-singular":"bătrânețea","accusative-indefinite-nominative-plural":"bătrâneți","accusative-definite-nominative-plural":"bătrânețile","dative-genitive-indefinite-singular":"bătrâneți","dative-definite-genitive-singular":"bătrâneții","dative-genitive-indefinite-plural":"bătrâneți","dative-definite-genitive-plural":"bătrâneților","singular-vocative":"bătrânețe","plural-vocative":"bătrâneților","alternative":"bătrînețe"}},{"word":"Bătrâni","pos":"name","definitions":["a village in Moșoaia, Argeș County, Romania","a commune of Prahova County, Romania","a village in Bătrâni, Prahova County, Romania"],"gender":"m","forms":{"alternative":"Bătrîni"}},{"word":"bătrâni","pos":"adj","definitions":["indefinite masculine plural of bătrân"],"pronunciation":"/bəˈtrɨnʲ/","forms":{"alternative":"bătrîni"}},{"word":"bătrâni","pos":"noun","definitions":["indefinite plural of bătrân"],"pronunciation":"/bəˈtrɨnʲ/","forms":{"alternative":"bătrîni"}},{"word":"bătrânică","pos":"noun","definitions":["small old lady"],"forms":{"plural":"bătrânele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătrânică","accusative-definite-nominative-singular":"bătrânica","accusative-indefinite-nominative-plural":"bătrânele","accusative-definite-nominative-plural":"bătrânelele","dative-genitive-indefinite-singular":"bătrânele","dative-definite-genitive-singular":"bătrânelei","dative-genitive-indefinite-plural":"bătrânele","dative-definite-genitive-plural":"bătrânelelor","singular-vocative":"bătrânică","plural-vocative":"bătrânelelor","alternative":"bătrînică"}},{"word":"bătrânicios","pos":"adj","definitions":["old-looking"],"forms":{"feminine-singular":"bătrânicioasă","masculine-plural":"bătrânicioși","feminine-neuter-plural":"bătrânicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrânicios","error-unrecognized-form-feminine-indefinite-singular":"bătrânicioasă","error-unrecognized-form-indefinite-masculine-plural":"bătrânicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrânicioase","definite-error-unrecognized-form-masculine-neuter-singular":"bătrâniciosul","definite-error-unrecognized-form-feminine-singular":"bătrânicioasa","definite-error-unrecognized-form-masculine-plural":"bătrânicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrânicioasele","alternative":"bătrînicios"}},{"word":"bătrânime","pos":"noun","definitions":["old people (collectively)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bătrânime","accusative-definite-nominative":"bătrânimea","dative-genitive-indefinite":"bătrânimi","dative-definite-genitive":"bătrânimii","vocative":"bătrânime","alternative":"bătrînime"}},{"word":"bătrânior","pos":"adj","definitions":["alternative form of bătrâior"],"forms":{"feminine-singular":"bătrânioră","masculine-plural":"bătrâniori","feminine-neuter-plural":"bătrâniore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrânior","error-unrecognized-form-feminine-indefinite-singular":"bătrânioră","error-unrecognized-form-indefinite-masculine-plural":"bătrâniori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrâniore","definite-error-unrecognized-form-masculine-neuter-singular":"bătrâniorul","definite-error-unrecognized-form-feminine-singular":"bătrâniora","definite-error-unrecognized-form-masculine-plural":"bătrâniorii","definite-error-unrecognized-form-feminine-neuter-plural":"bătrâniorele"}},{"word":"bătrâniș","pos":"noun","definitions":["butterweed, Canadian horseweed (Erigeron canadensis)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bătrâniș","accusative-definite-nominative":"bătrânișul","dative-genitive-indefinite":"bătrâniș","dative-definite-genitive":"bătrânișului","vocative":"bătrânișule","alternative":"bătrîniș"}},{"word":"Bătrânu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrânu","alternative":"Bătrînu"}},{"word":"Bătrânuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrânuț","alternative":"Bătrînuț"}},{"word":"bătrănuț","pos":"adj","definitions":["diminutive of bătrân"],"forms":{"feminine-singular":"bătrănuță","masculine-plural":"bătrănuți","feminine-neuter-plural":"bătrănuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătrănuț","error-unrecognized-form-feminine-indefinite-singular":"bătrănuță","error-unrecognized-form-indefinite-masculine-plural":"bătrănuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătrănuțe","definite-error-unrecognized-form-masculine-neuter-singular":"bătrănuțul","definite-error-unrecognized-form-feminine-singular":"bătrănuța","definite-error-unrecognized-form-masculine-plural":"bătrănuții","definite-error-unrecognized-form-feminine-neuter-plural":"bătrănuțele"}},{"word":"Bătrîn","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrîn"}},{"word":"Bătrîna","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrîna"}},{"word":"Bătrîneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bătrîneanu"}},{"word":"Bătrînescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bătrînescu"}},{"word":"Bătrînică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrînică"}},{"word":"Bătrînu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrînu"}},{"word":"Bătrînuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătrînuț"}},{"word":"bătucătură","pos":"noun","definitions":["callus"],"forms":{"plural":"bătucături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bătucătură","accusative-definite-nominative-singular":"bătucătura","accusative-indefinite-nominative-plural":"bătucături","accusative-definite-nominative-plural":"bătucăturile","dative-genitive-indefinite-singular":"bătucături","dative-definite-genitive-singular":"bătucăturii","dative-genitive-indefinite-plural":"bătucături","dative-definite-genitive-plural":"bătucăturilor","singular-vocative":"bătucătură","plural-vocative":"bătucăturilor"}},{"word":"bătucit","pos":"adj","definitions":["beaten (about soil)"],"forms":{"feminine-singular":"bătucită","masculine-plural":"bătuciți","feminine-neuter-plural":"bătucite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătucit","error-unrecognized-form-feminine-indefinite-singular":"bătucită","error-unrecognized-form-indefinite-masculine-plural":"bătuciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătucite","definite-error-unrecognized-form-masculine-neuter-singular":"bătucitul","definite-error-unrecognized-form-feminine-singular":"bătucita","definite-error-unrecognized-form-masculine-plural":"bătuciții","definite-error-unrecognized-form-feminine-neuter-plural":"bătucitele"}},{"word":"Bățul","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Dămuc"],"gender":"m"},{"word":"bățuleț","pos":"noun","definitions":["diminutive of băț"],"forms":{"plural":"bățulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bățuleț","accusative-definite-nominative-singular":"bățulețul","accusative-indefinite-nominative-plural":"bățulețe","accusative-definite-nominative-plural":"bățulețele","dative-genitive-indefinite-singular":"bățuleț","dative-definite-genitive-singular":"bățulețului","dative-genitive-indefinite-plural":"bățulețe","dative-definite-genitive-plural":"bățulețelor","singular-vocative":"bățulețule","plural-vocative":"bățulețelor"}},{"word":"băturoi","pos":"noun","definitions":["callus, callosity"],"forms":{"plural":"băturoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"băturoi","accusative-definite-nominative-singular":"băturoiul","accusative-indefinite-nominative-plural":"băturoaie","accusative-definite-nominative-plural":"băturoaiele","dative-genitive-indefinite-singular":"băturoi","dative-definite-genitive-singular":"băturoiului","dative-genitive-indefinite-plural":"băturoaie","dative-definite-genitive-plural":"băturoaielor","singular-vocative":"băturoiule","plural-vocative":"băturoaielor"}},{"word":"bătut","pos":"adj","definitions":["beaten","defeated"],"pronunciation":"/bəˈtut/","forms":{"feminine-singular":"bătută","masculine-plural":"bătuți","feminine-neuter-plural":"bătute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bătut","error-unrecognized-form-feminine-indefinite-singular":"bătută","error-unrecognized-form-indefinite-masculine-plural":"bătuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bătute","definite-error-unrecognized-form-masculine-neuter-singular":"bătutul","definite-error-unrecognized-form-feminine-singular":"bătuta","definite-error-unrecognized-form-masculine-plural":"bătuții","definite-error-unrecognized-form-feminine-neuter-plural":"bătutele"}},{"word":"bătut","pos":"verb","definitions":["past participle of bate"],"pronunciation":"/bəˈtut/","forms":{"participle-past":"of bate"}},{"word":"bătuț","pos":"noun","definitions":["diminutive of bât"],"forms":{"plural":"bătuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bătuț","accusative-definite-nominative-singular":"bătuțul","accusative-indefinite-nominative-plural":"bătuțe","accusative-definite-nominative-plural":"bătuțele","dative-genitive-indefinite-singular":"bătuț","dative-definite-genitive-singular":"bătuțului","dative-genitive-indefinite-plural":"bătuțe","dative-definite-genitive-plural":"bătuțelor","singular-vocative":"bătuțule","plural-vocative":"bătuțelor"}},{"word":"bătut în cuie","pos":"adj","definitions":["set in stone"],"forms":{"feminine-singular":"bătută în cuie","masculine-plural":"bătuți în cuie","feminine-neuter-plural":"bătute în cuie"}},{"word":"bâtuță","pos":"noun","definitions":["diminutive of bâtă (“cudgel”)"],"forms":{"plural":"bâtuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâtuță","accusative-definite-nominative-singular":"bâtuța","accusative-indefinite-nominative-plural":"bâtuțe","accusative-definite-nominative-plural":"bâtuțele","dative-genitive-indefinite-singular":"bâtuțe","dative-definite-genitive-singular":"bâtuței","dative-genitive-indefinite-plural":"bâtuțe","dative-definite-genitive-plural":"bâtuțelor","singular-vocative":"bâtuță","plural-vocative":"bâtuțelor","alternative":"bîtuță"}},{"word":"bătută","pos":"noun","definitions":["schnitzel"],"forms":{"plural":"bătute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bătută","accusative-definite-nominative-singular":"bătuta","accusative-indefinite-nominative-plural":"bătute","accusative-definite-nominative-plural":"bătutele","dative-genitive-indefinite-singular":"bătute","dative-definite-genitive-singular":"bătutei","dative-genitive-indefinite-plural":"bătute","dative-definite-genitive-plural":"bătutelor","singular-vocative":"bătută","plural-vocative":"bătutelor"}},{"word":"Bătutu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bătutu"}},{"word":"bau","pos":"intj","definitions":["the cry of a wolf","boo, a loud exclamation intended to scare someone"]},{"word":"baubau","pos":"noun","definitions":["imaginary creature used to scare small children, bogeyman."]},{"word":"băubil","pos":"adj","definitions":["drinkable"],"pronunciation":"/bəˈu.bil/","forms":{"feminine-singular":"băubilă","masculine-plural":"băubili","feminine-neuter-plural":"băubile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băubil","error-unrecognized-form-feminine-indefinite-singular":"băubilă","error-unrecognized-form-indefinite-masculine-plural":"băubili","error-unrecognized-form-feminine-indefinite-neuter-plural":"băubile","definite-error-unrecognized-form-masculine-neuter-singular":"băubilul","definite-error-unrecognized-form-feminine-singular":"băubila","definite-error-unrecognized-form-masculine-plural":"băubilii","definite-error-unrecognized-form-feminine-neuter-plural":"băubilele"}},{"word":"baudelairian","pos":"noun","definitions":["Baudelairean"],"forms":{"plural":"baudelairieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"baudelairian","accusative-definite-nominative-singular":"baudelairianul","accusative-indefinite-nominative-plural":"baudelairieni","accusative-definite-nominative-plural":"baudelairienii","dative-genitive-indefinite-singular":"baudelairian","dative-definite-genitive-singular":"baudelairianului","dative-genitive-indefinite-plural":"baudelairieni","dative-definite-genitive-plural":"baudelairienilor","singular-vocative":"baudelairianule","plural-vocative":"baudelairienilor"}},{"word":"băuna","pos":"verb","definitions":["to yell, howl"],"forms":{"canonical":"a băuna 1st conjugation","present-singular-third-person":"not attested","participle-past":"băunat","alternative":"băuni"}},{"word":"Baurci","pos":"name","definitions":["a village in Chircăieștii Noi, Căușeni Raion, Moldova","a village in Baurci, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"m"},{"word":"Baurci-Moldoveni","pos":"name","definitions":["a village in Baurci-Moldoveni, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"băut","pos":"verb","definitions":["past participle of bea"],"pronunciation":"/bəˈut/"},{"word":"băut","pos":"adj","definitions":["having drunken","having been drunken","drunk, intoxicated"],"pronunciation":"/bəˈut/","forms":{"feminine-singular":"băută","masculine-plural":"băuți","feminine-neuter-plural":"băute","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"băut","error-unrecognized-form-feminine-indefinite-singular":"băută","error-unrecognized-form-indefinite-masculine-plural":"băuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"băute","definite-error-unrecognized-form-masculine-neuter-singular":"băutul","definite-error-unrecognized-form-feminine-singular":"băuta","definite-error-unrecognized-form-masculine-plural":"băuții","definite-error-unrecognized-form-feminine-neuter-plural":"băutele"}},{"word":"băută","pos":"noun","definitions":["booze-up, a party or session with much drinking"],"forms":{"plural":"băute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băută","accusative-definite-nominative-singular":"băuta","accusative-indefinite-nominative-plural":"băute","accusative-definite-nominative-plural":"băutele","dative-genitive-indefinite-singular":"băute","dative-definite-genitive-singular":"băutei","dative-genitive-indefinite-plural":"băute","dative-definite-genitive-plural":"băutelor","singular-vocative":"băută","plural-vocative":"băutelor"}},{"word":"Băuțar","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Băuțar, Caraș-Severin County, Romania"],"gender":"m"},{"word":"băutoare","pos":"noun","definitions":["female equivalent of băutor"],"forms":{"plural":"băutoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"băutoare","accusative-definite-nominative-singular":"băutoarea","accusative-indefinite-nominative-plural":"băutoare","accusative-definite-nominative-plural":"băutoarele","dative-genitive-indefinite-singular":"băutoare","dative-definite-genitive-singular":"băutoarei","dative-genitive-indefinite-plural":"băutoare","dative-definite-genitive-plural":"băutoarelor","singular-vocative":"băutoare","plural-vocative":"băutoarelor"}},{"word":"băutor","pos":"noun","definitions":["drinker","boozer, tippler"],"pronunciation":"/bə.uˈtor/","forms":{"plural":"băutori","feminine":"equivalent băutoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"băutor","accusative-definite-nominative-singular":"băutorul","accusative-indefinite-nominative-plural":"băutori","accusative-definite-nominative-plural":"băutorii","dative-genitive-indefinite-singular":"băutor","dative-definite-genitive-singular":"băutorului","dative-genitive-indefinite-plural":"băutori","dative-definite-genitive-plural":"băutorilor","singular-vocative":"băutorule","plural-vocative":"băutorilor"}},{"word":"băutor","pos":"adj","definitions":["boozy, inclined to drinking"],"pronunciation":"/bə.uˈtor/","forms":{"feminine-singular":"băutoare","masculine-plural":"băutori","feminine-neuter-plural":"băutoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băutor","error-unrecognized-form-feminine-indefinite-singular":"băutoare","error-unrecognized-form-indefinite-masculine-plural":"băutori","error-unrecognized-form-feminine-indefinite-neuter-plural":"băutoare","definite-error-unrecognized-form-masculine-neuter-singular":"băutorul","definite-error-unrecognized-form-feminine-singular":"băutoarea","definite-error-unrecognized-form-masculine-plural":"băutorii","definite-error-unrecognized-form-feminine-neuter-plural":"băutoarele"}},{"word":"Băutoru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Băutoru"}},{"word":"băutură","pos":"noun","definitions":["beverage, drink"],"pronunciation":"/bə.uˈtu.rə/","forms":{"plural":"băuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"băutură","accusative-definite-nominative-singular":"băutura","accusative-indefinite-nominative-plural":"băuturi","accusative-definite-nominative-plural":"băuturile","dative-genitive-indefinite-singular":"băuturi","dative-definite-genitive-singular":"băuturii","dative-genitive-indefinite-plural":"băuturi","dative-definite-genitive-plural":"băuturilor","singular-vocative":"băutură","plural-vocative":"băuturilor","alternative":"beutură"}},{"word":"băutură carbogazoasă","pos":"noun","definitions":["soda"],"forms":{"plural":"băuturi carbogazoase"}},{"word":"băutură răcoritoare","pos":"noun","definitions":["soda, soft drink"],"forms":{"plural":"băuturi răcoritoare"}},{"word":"băuturi","pos":"noun","definitions":["plural of băutură"],"gender":"f-p"},{"word":"băuturică","pos":"noun","definitions":["diminutive of băutură; small drink"],"forms":{"plural":"băuturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"băuturică","accusative-definite-nominative-singular":"băuturica","accusative-indefinite-nominative-plural":"băuturice","accusative-definite-nominative-plural":"băuturicele","dative-genitive-indefinite-singular":"băuturice","dative-definite-genitive-singular":"băuturicei","dative-genitive-indefinite-plural":"băuturice","dative-definite-genitive-plural":"băuturicelor","singular-vocative":"băuturică","plural-vocative":"băuturicelor"}},{"word":"bauxită","pos":"noun","definitions":["bauxite"],"forms":{"plural":"bauxite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bauxită","accusative-definite-nominative-singular":"bauxita","accusative-indefinite-nominative-plural":"bauxite","accusative-definite-nominative-plural":"bauxitele","dative-genitive-indefinite-singular":"bauxite","dative-definite-genitive-singular":"bauxitei","dative-genitive-indefinite-plural":"bauxite","dative-definite-genitive-plural":"bauxitelor","singular-vocative":"bauxită","plural-vocative":"bauxitelor"}},{"word":"bavarez","pos":"adj","definitions":["Bavarian"],"forms":{"feminine-singular":"bavareză","masculine-plural":"bavarezi","feminine-neuter-plural":"bavareze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bavarez","error-unrecognized-form-feminine-indefinite-singular":"bavareză","error-unrecognized-form-indefinite-masculine-plural":"bavarezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bavareze","definite-error-unrecognized-form-masculine-neuter-singular":"bavarezul","definite-error-unrecognized-form-feminine-singular":"bavareza","definite-error-unrecognized-form-masculine-plural":"bavarezii","definite-error-unrecognized-form-feminine-neuter-plural":"bavarezele"}},{"word":"bavarez","pos":"noun","definitions":["Bavarian"],"forms":{"plural":"bavarezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bavarez","accusative-definite-nominative-singular":"bavarezul","accusative-indefinite-nominative-plural":"bavarezi","accusative-definite-nominative-plural":"bavarezii","dative-genitive-indefinite-singular":"bavarez","dative-definite-genitive-singular":"bavarezului","dative-genitive-indefinite-plural":"bavarezi","dative-definite-genitive-plural":"bavarezilor","singular-vocative":"bavarezule","plural-vocative":"bavarezilor"}},{"word":"bavareză","pos":"noun","definitions":["female equivalent of bavarez","Bavarian dialect"],"forms":{"plural":"bavareze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bavareză","accusative-definite-nominative-singular":"bavareza","accusative-indefinite-nominative-plural":"bavareze","accusative-definite-nominative-plural":"bavarezele","dative-genitive-indefinite-singular":"bavareze","dative-definite-genitive-singular":"bavarezei","dative-genitive-indefinite-plural":"bavareze","dative-definite-genitive-plural":"bavarezelor","singular-vocative":"bavareză","plural-vocative":"bavarezelor"}},{"word":"bâvaș","pos":"adj","definitions":["wild (about horses)"],"forms":{"feminine-singular":"bâvașă","masculine-plural":"bâvași","feminine-neuter-plural":"bâvașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâvaș","error-unrecognized-form-feminine-indefinite-singular":"bâvașă","error-unrecognized-form-indefinite-masculine-plural":"bâvași","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâvașe","definite-error-unrecognized-form-masculine-neuter-singular":"bâvașul","definite-error-unrecognized-form-feminine-singular":"bâvașa","definite-error-unrecognized-form-masculine-plural":"bâvașii","definite-error-unrecognized-form-feminine-neuter-plural":"bâvașele"}},{"word":"bavetă","pos":"noun","definitions":["bib"],"forms":{"plural":"bavete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bavetă","accusative-definite-nominative-singular":"baveta","accusative-indefinite-nominative-plural":"bavete","accusative-definite-nominative-plural":"bavetele","dative-genitive-indefinite-singular":"bavete","dative-definite-genitive-singular":"bavetei","dative-genitive-indefinite-plural":"bavete","dative-definite-genitive-plural":"bavetelor","singular-vocative":"bavetă","plural-vocative":"bavetelor"}},{"word":"bavețică","pos":"noun","definitions":["diminutive of bavetă; small bib"],"forms":{"plural":"bavețele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bavețică","accusative-definite-nominative-singular":"bavețica","accusative-indefinite-nominative-plural":"bavețice","accusative-definite-nominative-plural":"bavețicele","dative-genitive-indefinite-singular":"bavețice","dative-definite-genitive-singular":"bavețicei","dative-genitive-indefinite-plural":"bavețice","dative-definite-genitive-plural":"bavețicelor","singular-vocative":"bavețică","plural-vocative":"bavețicelor"}},{"word":"bax","pos":"noun","definitions":["box, bundle"],"forms":{"plural":"baxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bax","accusative-definite-nominative-singular":"baxul","accusative-indefinite-nominative-plural":"baxuri","accusative-definite-nominative-plural":"baxurile","dative-genitive-indefinite-singular":"bax","dative-definite-genitive-singular":"baxului","dative-genitive-indefinite-plural":"baxuri","dative-definite-genitive-plural":"baxurilor","singular-vocative":"baxule","plural-vocative":"baxurilor"}},{"word":"Băxani","pos":"name","definitions":["a village in Băxani, Soroca Raion, Moldova","a commune of Soroca Raion, Moldova"],"gender":"m"},{"word":"bâz","pos":"intj","definitions":["buzz (sound made by some insects’ flight)"],"forms":{"alternative":"bîz"}},{"word":"baza","pos":"verb","definitions":["to be based on (be grounded in)","to rely on (put one’s trust)"],"pronunciation":"/baˈza/","examples":[{"ro":"Distilarea se bazează pe diferența între punctele de fierbere.","en":"Distillation is based on the difference between boiling points."}],"forms":{"canonical":"a baza 1st conjugation","present-singular-third-person":"bazează","participle-past":"bazat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a baza","gerund":"bazând","first-person-indicative-present-singular":"bazez","indicative-present-second-person-singular":"bazezi","indicative-present-singular-third-person":"bazează","first-person-indicative-plural-present":"bazăm","indicative-plural-present-second-person":"bazați","indicative-plural-present-third-person":"bazează","first-person-imperfect-indicative-singular":"bazam","imperfect-indicative-second-person-singular":"bazai","imperfect-indicative-singular-third-person":"baza","first-person-imperfect-indicative-plural":"bazam","imperfect-indicative-plural-second-person":"bazați","imperfect-indicative-plural-third-person":"bazau","first-person-indicative-perfect-singular":"bazai","indicative-perfect-second-person-singular":"bazași","indicative-perfect-singular-third-person":"bază","first-person-indicative-perfect-plural":"bazarăm","indicative-perfect-plural-second-person":"bazarăți","indicative-perfect-plural-third-person":"bazară","first-person-indicative-pluperfect-singular":"bazasem","indicative-pluperfect-second-person-singular":"bazaseși","indicative-pluperfect-singular-third-person":"bazase","first-person-indicative-pluperfect-plural":"bazaserăm","indicative-pluperfect-plural-second-person":"bazaserăți","indicative-pluperfect-plural-third-person":"bazaseră","first-person-present-singular-subjunctive":"să bazez","present-second-person-singular-subjunctive":"să bazezi","present-singular-subjunctive-third-person":"să bazeze","first-person-plural-present-subjunctive":"să bazăm","plural-present-second-person-subjunctive":"să bazați","plural-present-subjunctive-third-person":"să bazeze","imperative-second-person-singular":"bazează","imperative-plural-second-person":"bazați","imperative-negative-second-person-singular":"nu baza","imperative-negative-plural-second-person":"nu bazați","alternative":"база"}},{"word":"baza","pos":"noun","definitions":["definite nominative/accusative singular of bază"],"pronunciation":"/ˈba.za/","forms":{"alternative":"база"}},{"word":"bază","pos":"noun","definitions":["base","foundation","bottom","root","basis"],"pronunciation":"/ˈba.zə/","forms":{"plural":"baze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bază","accusative-definite-nominative-singular":"baza","accusative-indefinite-nominative-plural":"baze","accusative-definite-nominative-plural":"bazele","dative-genitive-indefinite-singular":"baze","dative-definite-genitive-singular":"bazei","dative-genitive-indefinite-plural":"baze","dative-definite-genitive-plural":"bazelor","singular-vocative":"-","plural-vocative":"-","alternative":"базэ"}},{"word":"bază aeriană","pos":"noun","definitions":["air base"],"forms":{"plural":"baze aeriene"}},{"word":"bază de date ierarhică","pos":"noun","definitions":["hierarchical database"],"forms":{"plural":"baze de date ierarhice"}},{"word":"bază de date relațională","pos":"noun","definitions":["relational database"],"forms":{"plural":"baze de date relaționale"}},{"word":"bază navală","pos":"noun","definitions":["naval base"],"forms":{"plural":"baze navale"}},{"word":"bazaconie","pos":"noun","definitions":["a bizarre thing, an unbelievable thing"],"forms":{"plural":"bazaconii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bazaconie","accusative-definite-nominative-singular":"bazaconia","accusative-indefinite-nominative-plural":"bazaconii","accusative-definite-nominative-plural":"bazaconiile","dative-genitive-indefinite-singular":"bazaconii","dative-definite-genitive-singular":"bazaconiei","dative-genitive-indefinite-plural":"bazaconii","dative-definite-genitive-plural":"bazaconiilor","singular-vocative":"bazaconie","plural-vocative":"bazaconiilor"}},{"word":"bâzâi","pos":"verb","definitions":["to buzz","to weep","to pester, to bother"],"forms":{"canonical":"a bâzâi 4th conjugation","present-singular-third-person":"bâzâie","participle-past":"bâzâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bâzâi","gerund":"bâzâind","first-person-indicative-present-singular":"bâzâi","indicative-present-second-person-singular":"bâzâi","indicative-present-singular-third-person":"bâzâie","first-person-indicative-plural-present":"bâzâim","indicative-plural-present-second-person":"bâzâiți","indicative-plural-present-third-person":"bâzâie","first-person-imperfect-indicative-singular":"bâzâiam","imperfect-indicative-second-person-singular":"bâzâiai","imperfect-indicative-singular-third-person":"bâzâia","first-person-imperfect-indicative-plural":"bâzâiam","imperfect-indicative-plural-second-person":"bâzâiați","imperfect-indicative-plural-third-person":"bâzâiau","first-person-indicative-perfect-singular":"bâzâii","indicative-perfect-second-person-singular":"bâzâiși","indicative-perfect-singular-third-person":"bâzâi","first-person-indicative-perfect-plural":"bâzâirăm","indicative-perfect-plural-second-person":"bâzâirăți","indicative-perfect-plural-third-person":"bâzâiră","first-person-indicative-pluperfect-singular":"bâzâisem","indicative-pluperfect-second-person-singular":"bâzâiseși","indicative-pluperfect-singular-third-person":"bâzâise","first-person-indicative-pluperfect-plural":"bâzâiserăm","indicative-pluperfect-plural-second-person":"bâzâiserăți","indicative-pluperfect-plural-third-person":"bâzâiseră","first-person-present-singular-subjunctive":"să bâzâi","present-second-person-singular-subjunctive":"să bâzâi","present-singular-subjunctive-third-person":"să bâzâie","first-person-plural-present-subjunctive":"să bâzâim","plural-present-second-person-subjunctive":"să bâzâiți","plural-present-subjunctive-third-person":"să bâzâie","imperative-second-person-singular":"bâzâie","imperative-plural-second-person":"bâzâiți","imperative-negative-second-person-singular":"nu bâzâi","imperative-negative-plural-second-person":"nu bâzâiți","alternative":"bîzîi"}},{"word":"bâzăi","pos":"verb","definitions":["alternative form of bâzâi"],"forms":{"canonical":"a bâzăi 4th conjugation","present-singular-third-person":"bâzăie","participle-past":"bâzăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bâzăi","gerund":"bâzăind","first-person-indicative-present-singular":"bâzăi","indicative-present-second-person-singular":"bâzăi","indicative-present-singular-third-person":"bâzăie","first-person-indicative-plural-present":"bâzăim","indicative-plural-present-second-person":"bâzăiți","indicative-plural-present-third-person":"bâzăie","first-person-imperfect-indicative-singular":"bâzăiam","imperfect-indicative-second-person-singular":"bâzăiai","imperfect-indicative-singular-third-person":"bâzăia","first-person-imperfect-indicative-plural":"bâzăiam","imperfect-indicative-plural-second-person":"bâzăiați","imperfect-indicative-plural-third-person":"bâzăiau","first-person-indicative-perfect-singular":"bâzăii","indicative-perfect-second-person-singular":"bâzăiși","indicative-perfect-singular-third-person":"bâzăi","first-person-indicative-perfect-plural":"bâzăirăm","indicative-perfect-plural-second-person":"bâzăirăți","indicative-perfect-plural-third-person":"bâzăiră","first-person-indicative-pluperfect-singular":"bâzăisem","indicative-pluperfect-second-person-singular":"bâzăiseși","indicative-pluperfect-singular-third-person":"bâzăise","first-person-indicative-pluperfect-plural":"bâzăiserăm","indicative-pluperfect-plural-second-person":"bâzăiserăți","indicative-pluperfect-plural-third-person":"bâzăiseră","first-person-present-singular-subjunctive":"să bâzăi","present-second-person-singular-subjunctive":"să bâzăi","present-singular-subjunctive-third-person":"să bâzăie","first-person-plural-present-subjunctive":"să bâzăim","plural-present-second-person-subjunctive":"să bâzăiți","plural-present-subjunctive-third-person":"să bâzăie","imperative-second-person-singular":"bâzăie","imperative-plural-second-person":"bâzăiți","imperative-negative-second-person-singular":"nu bâzăi","imperative-negative-plural-second-person":"nu bâzăiți","alternative":"bîzăi"}},{"word":"bâzâială","pos":"noun","definitions":["buzzing"],"forms":{"plural":"bâzăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bâzâială","accusative-definite-nominative-singular":"bâzâiala","accusative-indefinite-nominative-plural":"bâzăiele","accusative-definite-nominative-plural":"bâzăielele","dative-genitive-indefinite-singular":"bâzăiele","dative-definite-genitive-singular":"bâzăielei","dative-genitive-indefinite-plural":"bâzăiele","dative-definite-genitive-plural":"bâzăielelor","singular-vocative":"bâzâială","plural-vocative":"bâzăielelor","alternative":"bîzîială"}},{"word":"bâzâit","pos":"noun","definitions":["buzz"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bâzâit","accusative-definite-nominative":"bâzâitul","dative-genitive-indefinite":"bâzâit","dative-definite-genitive":"bâzâitului","vocative":"bâzâitule","alternative":"bîzîit"}},{"word":"bâzâit","pos":"verb","definitions":["past participle of bâzâi"],"forms":{"alternative":"bîzîit"}},{"word":"bâzâitor","pos":"adj","definitions":["buzzing"],"forms":{"feminine-singular":"bâzâitoare","masculine-plural":"bâzâitori","feminine-neuter-plural":"bâzâitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâzâitor","error-unrecognized-form-feminine-indefinite-singular":"bâzâitoare","error-unrecognized-form-indefinite-masculine-plural":"bâzâitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâzâitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bâzâitorul","definite-error-unrecognized-form-feminine-singular":"bâzâitoarea","definite-error-unrecognized-form-masculine-plural":"bâzâitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bâzâitoarele","alternative":"bîzîitor"}},{"word":"bâzâitură","pos":"noun","definitions":["buzz"],"forms":{"plural":"bâzâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bâzâitură","accusative-definite-nominative-singular":"bâzâitura","accusative-indefinite-nominative-plural":"bâzâituri","accusative-definite-nominative-plural":"bâzâiturile","dative-genitive-indefinite-singular":"bâzâituri","dative-definite-genitive-singular":"bâzâiturii","dative-genitive-indefinite-plural":"bâzâituri","dative-definite-genitive-plural":"bâzâiturilor","singular-vocative":"bâzâitură","plural-vocative":"bâzâiturilor","alternative":"bîzîitură"}},{"word":"bazal","pos":"adj","definitions":["basal"],"forms":{"feminine-singular":"bazală","masculine-plural":"bazali","feminine-neuter-plural":"bazale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazal","error-unrecognized-form-feminine-indefinite-singular":"bazală","error-unrecognized-form-indefinite-masculine-plural":"bazali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazale","definite-error-unrecognized-form-masculine-neuter-singular":"bazalul","definite-error-unrecognized-form-feminine-singular":"bazala","definite-error-unrecognized-form-masculine-plural":"bazalii","definite-error-unrecognized-form-feminine-neuter-plural":"bazalele"}},{"word":"bazalt","pos":"noun","definitions":["basalt"],"forms":{"plural":"bazalturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bazalt","accusative-definite-nominative-singular":"bazaltul","accusative-indefinite-nominative-plural":"bazalturi","accusative-definite-nominative-plural":"bazalturile","dative-genitive-indefinite-singular":"bazalt","dative-definite-genitive-singular":"bazaltului","dative-genitive-indefinite-plural":"bazalturi","dative-definite-genitive-plural":"bazalturilor","singular-vocative":"bazaltule","plural-vocative":"bazalturilor"}},{"word":"bazaltic","pos":"adj","definitions":["basaltic"],"forms":{"feminine-singular":"bazaltică","masculine-plural":"bazaltici","feminine-neuter-plural":"bazaltice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazaltic","error-unrecognized-form-feminine-indefinite-singular":"bazaltică","error-unrecognized-form-indefinite-masculine-plural":"bazaltici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazaltice","definite-error-unrecognized-form-masculine-neuter-singular":"bazalticul","definite-error-unrecognized-form-feminine-singular":"bazaltica","definite-error-unrecognized-form-masculine-plural":"bazalticii","definite-error-unrecognized-form-feminine-neuter-plural":"bazalticele"}},{"word":"bazaltină","pos":"noun","definitions":["basaltine"],"forms":{"plural":"bazaltine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bazaltină","accusative-definite-nominative-singular":"bazaltina","accusative-indefinite-nominative-plural":"bazaltine","accusative-definite-nominative-plural":"bazaltinele","dative-genitive-indefinite-singular":"bazaltine","dative-definite-genitive-singular":"bazaltinei","dative-genitive-indefinite-plural":"bazaltine","dative-definite-genitive-plural":"bazaltinelor","singular-vocative":"bazaltină","plural-vocative":"bazaltinelor"}},{"word":"bazam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of baza"],"pronunciation":"[baˈzam]"},{"word":"bazament","pos":"noun","definitions":["base (of a structure), pedestal"],"forms":{"plural":"bazamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazament","accusative-definite-nominative-singular":"bazamentul","accusative-indefinite-nominative-plural":"bazamente","accusative-definite-nominative-plural":"bazamentele","dative-genitive-indefinite-singular":"bazament","dative-definite-genitive-singular":"bazamentului","dative-genitive-indefinite-plural":"bazamente","dative-definite-genitive-plural":"bazamentelor","singular-vocative":"bazamentule","plural-vocative":"bazamentelor"}},{"word":"bazaochi","pos":"adj","definitions":["cross-eyed"],"forms":{"feminine-singular":"bazaoche","masculine-plural":"bazaochi","feminine-neuter-plural":"bazaoche","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazaochi","error-unrecognized-form-feminine-indefinite-singular":"bazaoche","error-unrecognized-form-indefinite-masculine-plural":"bazaochi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazaoche","definite-error-unrecognized-form-masculine-neuter-singular":"bazaochiul","definite-error-unrecognized-form-feminine-singular":"bazaochea","definite-error-unrecognized-form-masculine-plural":"bazaochii","definite-error-unrecognized-form-feminine-neuter-plural":"bazaochele"}},{"word":"bazar","pos":"noun","definitions":["bazaar"],"forms":{"plural":"bazaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazar","accusative-definite-nominative-singular":"bazarul","accusative-indefinite-nominative-plural":"bazare","accusative-definite-nominative-plural":"bazarele","dative-genitive-indefinite-singular":"bazar","dative-definite-genitive-singular":"bazarului","dative-genitive-indefinite-plural":"bazare","dative-definite-genitive-plural":"bazarelor","singular-vocative":"bazarule","plural-vocative":"bazarelor"}},{"word":"Bazarghian","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Rariștea."],"gender":"m"},{"word":"Bazaschioi","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Ștefan cel Mare."],"gender":"m"},{"word":"bazat","pos":"verb","definitions":["past participle of baza"],"forms":{"participle-past":"of baza"}},{"word":"băzăuc","pos":"adj","definitions":["crazy"],"forms":{"feminine-singular":"băzăucă","masculine-plural":"băzăuci","feminine-neuter-plural":"băzăuce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"băzăuc","error-unrecognized-form-feminine-indefinite-singular":"băzăucă","error-unrecognized-form-indefinite-masculine-plural":"băzăuci","error-unrecognized-form-feminine-indefinite-neuter-plural":"băzăuce","definite-error-unrecognized-form-masculine-neuter-singular":"băzăucul","definite-error-unrecognized-form-feminine-singular":"băzăuca","definite-error-unrecognized-form-masculine-plural":"băzăucii","definite-error-unrecognized-form-feminine-neuter-plural":"băzăucele"}},{"word":"Băzăvani","pos":"name","definitions":["a village in Samarinești, Gorj County, Romania"],"gender":"m"},{"word":"Bâzdâc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bâzdâc","alternative":"Bîzdîc"}},{"word":"bâzdâc","pos":"noun","definitions":["whim, caprice","penis, vulva."],"forms":{"plural":"bâzdâcuri","alternative":"bîzdîc"}},{"word":"bâzdâcos","pos":"adj","definitions":["huffy, thin-skinned"],"forms":{"feminine-singular":"bâzdâcoasă","masculine-plural":"bâzdâcoși","feminine-neuter-plural":"bâzdâcoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bâzdâcos","error-unrecognized-form-feminine-indefinite-singular":"bâzdâcoasă","error-unrecognized-form-indefinite-masculine-plural":"bâzdâcoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bâzdâcoase","definite-error-unrecognized-form-masculine-neuter-singular":"bâzdâcosul","definite-error-unrecognized-form-feminine-singular":"bâzdâcoasa","definite-error-unrecognized-form-masculine-plural":"bâzdâcoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bâzdâcoasele","alternative":"bîzdîcos"}},{"word":"bâzdâcuri","pos":"noun","definitions":["plural of bâzdâc"]},{"word":"bâzdâganie","pos":"noun","definitions":["critter","gizmo"],"forms":{"plural":"bâzdâganii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bâzdâganie","accusative-definite-nominative-singular":"bâzdâgania","accusative-indefinite-nominative-plural":"bâzdâganii","accusative-definite-nominative-plural":"bâzdâganiile","dative-genitive-indefinite-singular":"bâzdâganii","dative-definite-genitive-singular":"bâzdâganiei","dative-genitive-indefinite-plural":"bâzdâganii","dative-definite-genitive-plural":"bâzdâganiilor","singular-vocative":"bâzdâganie","plural-vocative":"bâzdâganiilor","alternative":"bîzdîganie"}},{"word":"bâzdâgău","pos":"noun","definitions":["rolling pin"],"forms":{"plural":"bâzdâgae","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bâzdâgău","accusative-definite-nominative-singular":"bâzdâgăuul","accusative-indefinite-nominative-plural":"bâzdâgae","accusative-definite-nominative-plural":"bâzdâgaele","dative-genitive-indefinite-singular":"bâzdâgău","dative-definite-genitive-singular":"bâzdâgăuului","dative-genitive-indefinite-plural":"bâzdâgae","dative-definite-genitive-plural":"bâzdâgaelor","singular-vocative":"bâzdâgăuule","plural-vocative":"bâzdâgaelor","alternative":"bîzdîgău"}},{"word":"Bâzdâna","pos":"name","definitions":["a village in Calopăr, Dolj County, Romania"],"gender":"f","forms":{"alternative":"Bîzdîna"}},{"word":"bazea","pos":"noun","definitions":["bombasine"],"forms":{"plural":"bazele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bazea","accusative-definite-nominative-singular":"bazeaua","accusative-indefinite-nominative-plural":"bazele","accusative-definite-nominative-plural":"bazelele","dative-genitive-indefinite-singular":"bazele","dative-definite-genitive-singular":"bazelei","dative-genitive-indefinite-plural":"bazele","dative-definite-genitive-plural":"bazelelor","singular-vocative":"bazea","plural-vocative":"bazelelor"}},{"word":"bazedovian","pos":"adj","definitions":["having the characteristics of Graves' disease"],"forms":{"feminine-singular":"bazedoviană","masculine-plural":"bazedovieni","feminine-neuter-plural":"bazedoviene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazedovian","error-unrecognized-form-feminine-indefinite-singular":"bazedoviană","error-unrecognized-form-indefinite-masculine-plural":"bazedovieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazedoviene","definite-error-unrecognized-form-masculine-neuter-singular":"bazedovianul","definite-error-unrecognized-form-feminine-singular":"bazedoviana","definite-error-unrecognized-form-masculine-plural":"bazedovienii","definite-error-unrecognized-form-feminine-neuter-plural":"bazedovienele"}},{"word":"Băzești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"Bazgan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bazgan"}},{"word":"Baziaș","pos":"name","definitions":["a village in Socol, Caraș-Severin County, Romania"],"gender":"f"},{"word":"bazic","pos":"adj","definitions":["basic"],"pronunciation":"/ˈba.zik/","forms":{"feminine-singular":"bazică","masculine-plural":"bazici","feminine-neuter-plural":"bazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazic","error-unrecognized-form-feminine-indefinite-singular":"bazică","error-unrecognized-form-indefinite-masculine-plural":"bazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazice","definite-error-unrecognized-form-masculine-neuter-singular":"bazicul","definite-error-unrecognized-form-feminine-singular":"bazica","definite-error-unrecognized-form-masculine-plural":"bazicii","definite-error-unrecognized-form-feminine-neuter-plural":"bazicele"}},{"word":"bazicitate","pos":"noun","definitions":["basicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"bazicitate","accusative-definite-nominative":"bazicitatea","dative-genitive-indefinite":"bazicități","dative-definite-genitive":"bazicității","vocative":"-"}},{"word":"bazidie","pos":"noun","definitions":["basidium"],"forms":{"plural":"bazidii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bazidie","accusative-definite-nominative-singular":"bazidia","accusative-indefinite-nominative-plural":"bazidii","accusative-definite-nominative-plural":"bazidiile","dative-genitive-indefinite-singular":"bazidii","dative-definite-genitive-singular":"bazidiei","dative-genitive-indefinite-plural":"bazidii","dative-definite-genitive-plural":"bazidiilor","singular-vocative":"bazidie","plural-vocative":"bazidiilor"}},{"word":"bazidiospor","pos":"noun","definitions":["basidiospore"],"forms":{"plural":"bazidiospori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bazidiospor","accusative-definite-nominative-singular":"bazidiosporul","accusative-indefinite-nominative-plural":"bazidiospori","accusative-definite-nominative-plural":"bazidiosporii","dative-genitive-indefinite-singular":"bazidiospor","dative-definite-genitive-singular":"bazidiosporului","dative-genitive-indefinite-plural":"bazidiospori","dative-definite-genitive-plural":"bazidiosporilor","singular-vocative":"bazidiosporule","plural-vocative":"bazidiosporilor"}},{"word":"bazilar","pos":"adj","definitions":["basilar"],"forms":{"feminine-singular":"bazilară","masculine-plural":"bazilari","feminine-neuter-plural":"bazilare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazilar","error-unrecognized-form-feminine-indefinite-singular":"bazilară","error-unrecognized-form-indefinite-masculine-plural":"bazilari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazilare","definite-error-unrecognized-form-masculine-neuter-singular":"bazilarul","definite-error-unrecognized-form-feminine-singular":"bazilara","definite-error-unrecognized-form-masculine-plural":"bazilarii","definite-error-unrecognized-form-feminine-neuter-plural":"bazilarele"}},{"word":"Bazilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bazilescu"}},{"word":"bazileu","pos":"noun","definitions":["basileus"],"forms":{"plural":"bazilei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bazileu","accusative-definite-nominative-singular":"bazileuul","accusative-indefinite-nominative-plural":"bazilei","accusative-definite-nominative-plural":"bazileii","dative-genitive-indefinite-singular":"bazileu","dative-definite-genitive-singular":"bazileuului","dative-genitive-indefinite-plural":"bazilei","dative-definite-genitive-plural":"bazileilor","singular-vocative":"bazileuule","plural-vocative":"bazileilor"}},{"word":"bazilică","pos":"noun","definitions":["basilica"],"forms":{"plural":"bazilici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bazilică","accusative-definite-nominative-singular":"bazilica","accusative-indefinite-nominative-plural":"bazilici","accusative-definite-nominative-plural":"bazilicile","dative-genitive-indefinite-singular":"bazilici","dative-definite-genitive-singular":"bazilicii","dative-genitive-indefinite-plural":"bazilici","dative-definite-genitive-plural":"bazilicilor","singular-vocative":"bazilică","plural-vocative":"bazilicilor"}},{"word":"bazilical","pos":"adj","definitions":["basilican"],"forms":{"feminine-singular":"bazilicală","masculine-plural":"bazilicali","feminine-neuter-plural":"bazilicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bazilical","error-unrecognized-form-feminine-indefinite-singular":"bazilicală","error-unrecognized-form-indefinite-masculine-plural":"bazilicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bazilicale","definite-error-unrecognized-form-masculine-neuter-singular":"bazilicalul","definite-error-unrecognized-form-feminine-singular":"bazilicala","definite-error-unrecognized-form-masculine-plural":"bazilicalii","definite-error-unrecognized-form-feminine-neuter-plural":"bazilicalele"}},{"word":"bazilicale","pos":"noun","definitions":["alternative form of vasilicale"],"forms":{"plural":"bazilicale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"bazilicale","accusative-definite-nominative-singular":"bazilicalea","accusative-indefinite-nominative-plural":"bazilicale","accusative-definite-nominative-plural":"bazilicalele","dative-genitive-indefinite-singular":"bazilicale","dative-definite-genitive-singular":"bazilicalei","dative-genitive-indefinite-plural":"bazilicale","dative-definite-genitive-plural":"bazilicalelor","singular-vocative":"bazilicale","plural-vocative":"bazilicalelor"}},{"word":"bazilisc","pos":"noun","definitions":["basilisk"],"forms":{"plural":"baziliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bazilisc","accusative-definite-nominative-singular":"baziliscul","accusative-indefinite-nominative-plural":"baziliști","accusative-definite-nominative-plural":"baziliștii","dative-genitive-indefinite-singular":"bazilisc","dative-definite-genitive-singular":"baziliscului","dative-genitive-indefinite-plural":"baziliști","dative-definite-genitive-plural":"baziliștilor","singular-vocative":"baziliscule","plural-vocative":"baziliștilor"}},{"word":"Baziliuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Baziliuc"}},{"word":"bazin","pos":"noun","definitions":["basin","reservoir","swimming pool","pelvis"],"forms":{"plural":"bazine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazin","accusative-definite-nominative-singular":"bazinul","accusative-indefinite-nominative-plural":"bazine","accusative-definite-nominative-plural":"bazinele","dative-genitive-indefinite-singular":"bazin","dative-definite-genitive-singular":"bazinului","dative-genitive-indefinite-plural":"bazine","dative-definite-genitive-plural":"bazinelor","singular-vocative":"bazinule","plural-vocative":"bazinelor"}},{"word":"bazin de înot","pos":"noun","definitions":["swimming pool"],"forms":{"plural":"bazine de înot"}},{"word":"bazin hidrografic","pos":"noun","definitions":["river basin"],"forms":{"plural":"bazine hidrografice"}},{"word":"bazinaș","pos":"noun","definitions":["diminutive of bazin; small basin"],"forms":{"plural":"bazinașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazinaș","accusative-definite-nominative-singular":"bazinașul","accusative-indefinite-nominative-plural":"bazinașe","accusative-definite-nominative-plural":"bazinașele","dative-genitive-indefinite-singular":"bazinaș","dative-definite-genitive-singular":"bazinașului","dative-genitive-indefinite-plural":"bazinașe","dative-definite-genitive-plural":"bazinașelor","singular-vocative":"bazinașule","plural-vocative":"bazinașelor"}},{"word":"bazinet","pos":"noun","definitions":["basin"],"forms":{"plural":"bazinete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazinet","accusative-definite-nominative-singular":"bazinetul","accusative-indefinite-nominative-plural":"bazinete","accusative-definite-nominative-plural":"bazinetele","dative-genitive-indefinite-singular":"bazinet","dative-definite-genitive-singular":"bazinetului","dative-genitive-indefinite-plural":"bazinete","dative-definite-genitive-plural":"bazinetelor","singular-vocative":"bazinetule","plural-vocative":"bazinetelor"}},{"word":"Bazna","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Bazna, Sibiu County, Romania"],"gender":"f"},{"word":"bazofil","pos":"noun","definitions":["basophil"],"forms":{"plural":"bazofile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazofil","accusative-definite-nominative-singular":"bazofilul","accusative-indefinite-nominative-plural":"bazofile","accusative-definite-nominative-plural":"bazofilele","dative-genitive-indefinite-singular":"bazofil","dative-definite-genitive-singular":"bazofilului","dative-genitive-indefinite-plural":"bazofile","dative-definite-genitive-plural":"bazofilelor","singular-vocative":"bazofilule","plural-vocative":"bazofilelor"}},{"word":"bazofilie","pos":"noun","definitions":["basophilia"],"forms":{"plural":"bazofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bazofilie","accusative-definite-nominative-singular":"bazofilieul","accusative-indefinite-nominative-plural":"bazofilii","accusative-definite-nominative-plural":"bazofiliile","dative-genitive-indefinite-singular":"bazofilie","dative-definite-genitive-singular":"bazofilieului","dative-genitive-indefinite-plural":"bazofilii","dative-definite-genitive-plural":"bazofiliilor","singular-vocative":"bazofilieule","plural-vocative":"bazofiliilor"}},{"word":"bazofobie","pos":"noun","definitions":["basophobia"],"forms":{"plural":"bazofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bazofobie","accusative-definite-nominative-singular":"bazofobia","accusative-indefinite-nominative-plural":"bazofobii","accusative-definite-nominative-plural":"bazofobiile","dative-genitive-indefinite-singular":"bazofobii","dative-definite-genitive-singular":"bazofobiei","dative-genitive-indefinite-plural":"bazofobii","dative-definite-genitive-plural":"bazofobiilor","singular-vocative":"bazofobie","plural-vocative":"bazofobiilor"}},{"word":"bâzoi","pos":"noun","definitions":["wasp"],"forms":{"plural":"bâzoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bâzoi","accusative-definite-nominative-singular":"bâzoiul","accusative-indefinite-nominative-plural":"bâzoaie","accusative-definite-nominative-plural":"bâzoaiele","dative-genitive-indefinite-singular":"bâzoi","dative-definite-genitive-singular":"bâzoiului","dative-genitive-indefinite-plural":"bâzoaie","dative-definite-genitive-plural":"bâzoaielor","singular-vocative":"bâzoiule","plural-vocative":"bâzoaielor","alternative":"bîzoi"}},{"word":"bazooka","pos":"noun","definitions":["bazooka"],"forms":{"plural":"bazooka"}},{"word":"Bazoșu Nou","pos":"name","definitions":["a village in Bucovăț, Timiș County, Romania"],"gender":"m"},{"word":"bâzu","pos":"noun","definitions":["penis"],"pronunciation":"/ˈbɨ.zu/","forms":{"alternative":"bîzu"}},{"word":"BC","pos":"name","definitions":["abbreviation of Bacău: a county of Romania"]},{"word":"bd.","pos":"noun","definitions":["abbreviation of bulevard (“boulevard”); also b-dul."]},{"word":"bdelion","pos":"noun","definitions":["bdellium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bdelion","accusative-definite-nominative":"bdelionul","dative-genitive-indefinite":"bdelion","dative-definite-genitive":"bdelionului","vocative":"bdelionule"}},{"word":"be","pos":"intj","definitions":["baa (sound made by sheep or goats)"]},{"word":"bea","pos":"verb","definitions":["to drink"],"pronunciation":"/be̯a/","forms":{"canonical":"a bea 2nd conjugation","present-singular-third-person":"bea","participle-past":"băut","subjunctive-third-person":"bea","regional-subjunctive-third-person":"beie","table-tags":"conjugation-2","inflection-template":"ro-conj-2","infinitive":"a bea","gerund":"bând","first-person-indicative-present-singular":"beau","indicative-present-second-person-singular":"bei","indicative-present-singular-third-person":"bea","first-person-indicative-plural-present":"bem","indicative-plural-present-second-person":"beți","indicative-plural-present-third-person":"beau","first-person-imperfect-indicative-singular":"beam","imperfect-indicative-second-person-singular":"beai","imperfect-indicative-singular-third-person":"bea","first-person-imperfect-indicative-plural":"beam","imperfect-indicative-plural-second-person":"beați","imperfect-indicative-plural-third-person":"beau","first-person-indicative-perfect-singular":"băui","indicative-perfect-second-person-singular":"băuși","indicative-perfect-singular-third-person":"bău","first-person-indicative-perfect-plural":"băurăm","indicative-perfect-plural-second-person":"băurăți","indicative-perfect-plural-third-person":"băură","first-person-indicative-pluperfect-singular":"băusem","indicative-pluperfect-second-person-singular":"băuseși","indicative-pluperfect-singular-third-person":"băuse","first-person-indicative-pluperfect-plural":"băuserăm","indicative-pluperfect-plural-second-person":"băuserăți","indicative-pluperfect-plural-third-person":"băuseră","first-person-present-singular-subjunctive":"să beau","present-second-person-singular-subjunctive":"să bei","present-singular-subjunctive-third-person":"să bea","first-person-plural-present-subjunctive":"să bem","plural-present-second-person-subjunctive":"să beți","plural-present-subjunctive-third-person":"să bea","imperative-second-person-singular":"bea","imperative-plural-second-person":"beți","imperative-negative-second-person-singular":"nu bea","imperative-negative-plural-second-person":"nu beți"}},{"word":"bea tutun","pos":"verb","definitions":["to smoke tobacco"],"forms":{"canonical":"a bea tutun 2nd conjugation","present-singular-third-person":"bea tutun","participle-past":"băut tutun","subjunctive-third-person":"bea tutun","regional-subjunctive-third-person":"beie tutun"}},{"word":"beai","pos":"verb","definitions":["second-person singular imperfect indicative of bea"],"pronunciation":"[be̯aj]"},{"word":"beam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of bea"],"pronunciation":"[be̯am]"},{"word":"beamter","pos":"noun","definitions":["office clerk"],"forms":{"plural":"beamteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beamter","accusative-definite-nominative-singular":"beamterul","accusative-indefinite-nominative-plural":"beamteri","accusative-definite-nominative-plural":"beamterii","dative-genitive-indefinite-singular":"beamter","dative-definite-genitive-singular":"beamterului","dative-genitive-indefinite-plural":"beamteri","dative-definite-genitive-plural":"beamterilor","singular-vocative":"beamterule","plural-vocative":"beamterilor"}},{"word":"beat","pos":"adj","definitions":["drunk, drunken, intoxicated; tipsy"],"pronunciation":"[be̯at]","forms":{"feminine-singular":"beată","masculine-plural":"beți","feminine-neuter-plural":"bete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beat","error-unrecognized-form-feminine-indefinite-singular":"beată","error-unrecognized-form-indefinite-masculine-plural":"beți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bete","definite-error-unrecognized-form-masculine-neuter-singular":"beatul","definite-error-unrecognized-form-feminine-singular":"beata","definite-error-unrecognized-form-masculine-plural":"beții","definite-error-unrecognized-form-feminine-neuter-plural":"betele"}},{"word":"beat","pos":"noun","definitions":["beat"],"pronunciation":"[bit]","examples":[{"ro":"Nu mint, doar că tu nu înțelegi ce vreau să transmit pe beat.","en":"I ain't lying, you just don't understand what I'm tryna convey on the beat."}],"forms":{"plural":"beaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beat","accusative-definite-nominative-singular":"beatul","accusative-indefinite-nominative-plural":"beaturi","accusative-definite-nominative-plural":"beaturile","dative-genitive-indefinite-singular":"beat","dative-definite-genitive-singular":"beatului","dative-genitive-indefinite-plural":"beaturi","dative-definite-genitive-plural":"beaturilor","singular-vocative":"beatule","plural-vocative":"beaturilor"}},{"word":"beata","pos":"adj","definitions":["definite nominative/accusative feminine singular of beat"],"pronunciation":"[ˈbe̯a.ta]"},{"word":"beatifica","pos":"verb","definitions":["to beatify"],"forms":{"canonical":"a beatifica 1st conjugation","present-singular-third-person":"beatifică","participle-past":"beatificat","subjunctive-third-person":"beatifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a beatifica","gerund":"beatificând","first-person-indicative-present-singular":"beatific","indicative-present-second-person-singular":"beatifici","indicative-present-singular-third-person":"beatifică","first-person-indicative-plural-present":"beatificăm","indicative-plural-present-second-person":"beatificați","indicative-plural-present-third-person":"beatifică","first-person-imperfect-indicative-singular":"beatificam","imperfect-indicative-second-person-singular":"beatificai","imperfect-indicative-singular-third-person":"beatifica","first-person-imperfect-indicative-plural":"beatificam","imperfect-indicative-plural-second-person":"beatificați","imperfect-indicative-plural-third-person":"beatificau","first-person-indicative-perfect-singular":"beatificai","indicative-perfect-second-person-singular":"beatificași","indicative-perfect-singular-third-person":"beatifică","first-person-indicative-perfect-plural":"beatificarăm","indicative-perfect-plural-second-person":"beatificarăți","indicative-perfect-plural-third-person":"beatificară","first-person-indicative-pluperfect-singular":"beatificasem","indicative-pluperfect-second-person-singular":"beatificaseși","indicative-pluperfect-singular-third-person":"beatificase","first-person-indicative-pluperfect-plural":"beatificaserăm","indicative-pluperfect-plural-second-person":"beatificaserăți","indicative-pluperfect-plural-third-person":"beatificaseră","first-person-present-singular-subjunctive":"să beatific","present-second-person-singular-subjunctive":"să beatifici","present-singular-subjunctive-third-person":"să beatifice","first-person-plural-present-subjunctive":"să beatificăm","plural-present-second-person-subjunctive":"să beatificați","plural-present-subjunctive-third-person":"să beatifice","imperative-second-person-singular":"beatifică","imperative-plural-second-person":"beatificați","imperative-negative-second-person-singular":"nu beatifica","imperative-negative-plural-second-person":"nu beatificați"}},{"word":"beatificare","pos":"noun","definitions":["beatification"],"forms":{"plural":"beatificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"beatificare","accusative-definite-nominative-singular":"beatificarea","accusative-indefinite-nominative-plural":"beatificări","accusative-definite-nominative-plural":"beatificările","dative-genitive-indefinite-singular":"beatificări","dative-definite-genitive-singular":"beatificării","dative-genitive-indefinite-plural":"beatificări","dative-definite-genitive-plural":"beatificărilor","singular-vocative":"beatificare","plural-vocative":"beatificărilor"}},{"word":"beatitudine","pos":"noun","definitions":["blissfulness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"beatitudine","accusative-definite-nominative":"beatitudinea","dative-genitive-indefinite":"beatitudine","dative-definite-genitive":"beatitudinei","vocative":"beatitudine"}},{"word":"beatnic","pos":"noun","definitions":["beatnik"],"forms":{"plural":"beatnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beatnic","accusative-definite-nominative-singular":"beatnicul","accusative-indefinite-nominative-plural":"beatnici","accusative-definite-nominative-plural":"beatnicii","dative-genitive-indefinite-singular":"beatnic","dative-definite-genitive-singular":"beatnicului","dative-genitive-indefinite-plural":"beatnici","dative-definite-genitive-plural":"beatnicilor","singular-vocative":"beatnicule","plural-vocative":"beatnicilor"}},{"word":"Beatrice","pos":"name","definitions":["a female given name from Beatrice"],"gender":"f"},{"word":"beau","pos":"verb","definitions":["inflection of bea:","first-person singular present indicative/subjunctive","third-person plural present/imperfect indicative"],"pronunciation":"/be̯aw/"},{"word":"Beba Veche","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Beba Veche, Timiș County, Romania"],"gender":"f"},{"word":"bebe","pos":"noun","definitions":["baby, infant"],"pronunciation":"/ˈbe.be/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bebe","accusative-definite-nominative":"bebeul","dative-genitive-indefinite":"bebe","dative-definite-genitive":"bebeului","vocative":"bebeule"}},{"word":"bebeluș","pos":"noun","definitions":["infant (very young human being)"],"pronunciation":"/be.beˈluʃ/","forms":{"plural":"bebeluși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bebeluș","accusative-definite-nominative-singular":"bebelușul","accusative-indefinite-nominative-plural":"bebeluși","accusative-definite-nominative-plural":"bebelușii","dative-genitive-indefinite-singular":"bebeluș","dative-definite-genitive-singular":"bebelușului","dative-genitive-indefinite-plural":"bebeluși","dative-definite-genitive-plural":"bebelușilor","singular-vocative":"bebelușule","plural-vocative":"bebelușilor","alternative":"бебелуш"}},{"word":"Bebeșelea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bebeșelea"}},{"word":"bebi","pos":"noun","definitions":["baby"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bebi","accusative-definite-nominative":"bebiul","dative-genitive-indefinite":"bebi","dative-definite-genitive":"bebiului","vocative":"bebiule"}},{"word":"bec","pos":"noun","definitions":["lightbulb"],"forms":{"plural":"becuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bec","accusative-definite-nominative-singular":"becul","accusative-indefinite-nominative-plural":"becuri","accusative-definite-nominative-plural":"becurile","dative-genitive-indefinite-singular":"bec","dative-definite-genitive-singular":"becului","dative-genitive-indefinite-plural":"becuri","dative-definite-genitive-plural":"becurilor","singular-vocative":"becule","plural-vocative":"becurilor"}},{"word":"becar","pos":"noun","definitions":["natural (sign)"],"forms":{"plural":"becari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"becar","accusative-definite-nominative-singular":"becarul","accusative-indefinite-nominative-plural":"becari","accusative-definite-nominative-plural":"becarii","dative-genitive-indefinite-singular":"becar","dative-definite-genitive-singular":"becarului","dative-genitive-indefinite-plural":"becari","dative-definite-genitive-plural":"becarilor","singular-vocative":"becarule","plural-vocative":"becarilor"}},{"word":"Becaș","pos":"name","definitions":["a village in Praid, Harghita County, Romania"],"gender":"m"},{"word":"becață","pos":"noun","definitions":["snipe"],"forms":{"plural":"becațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"becață","accusative-definite-nominative-singular":"becața","accusative-indefinite-nominative-plural":"becațe","accusative-definite-nominative-plural":"becațele","dative-genitive-indefinite-singular":"becațe","dative-definite-genitive-singular":"becaței","dative-genitive-indefinite-plural":"becațe","dative-definite-genitive-plural":"becațelor","singular-vocative":"becață","plural-vocative":"becațelor"}},{"word":"becațină","pos":"noun","definitions":["snipe"],"forms":{"plural":"becaține","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"becațină","accusative-definite-nominative-singular":"becațina","accusative-indefinite-nominative-plural":"becaține","accusative-definite-nominative-plural":"becaținele","dative-genitive-indefinite-singular":"becaține","dative-definite-genitive-singular":"becaținei","dative-genitive-indefinite-plural":"becaține","dative-definite-genitive-plural":"becaținelor","singular-vocative":"becațină","plural-vocative":"becaținelor"}},{"word":"becațină comună","pos":"noun","definitions":["common snipe (Gallinago gallinago)"],"forms":{"plural":"becaține comune"}},{"word":"becațină mare","pos":"noun","definitions":["great snipe (Gallinago media)"],"forms":{"plural":"becaține mari"}},{"word":"becațină mică","pos":"noun","definitions":["jacksnipe (Lymnocryptes minimus)"],"forms":{"plural":"becaține mici"}},{"word":"becciu","pos":"noun","definitions":["night watchman"],"pronunciation":"/bekˈt͡ʃiw/","forms":{"plural":"beccii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"becciu","accusative-definite-nominative-singular":"becciul","accusative-indefinite-nominative-plural":"beccii","accusative-definite-nominative-plural":"becciii","dative-genitive-indefinite-singular":"becciu","dative-definite-genitive-singular":"becciului","dative-genitive-indefinite-plural":"beccii","dative-definite-genitive-plural":"becciilor","singular-vocative":"becciule","plural-vocative":"becciilor"}},{"word":"Beceni","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Beceni, Buzău County, Romania"],"gender":"m"},{"word":"becer","pos":"noun","definitions":["pâtissier"],"forms":{"plural":"beceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"becer","accusative-definite-nominative-singular":"becerul","accusative-indefinite-nominative-plural":"beceri","accusative-definite-nominative-plural":"becerii","dative-genitive-indefinite-singular":"becer","dative-definite-genitive-singular":"becerului","dative-genitive-indefinite-plural":"beceri","dative-definite-genitive-plural":"becerilor","singular-vocative":"becerule","plural-vocative":"becerilor"}},{"word":"Becerescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Becerescu"}},{"word":"becerie","pos":"noun","definitions":["royal kitchen"],"forms":{"plural":"becerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"becerie","accusative-definite-nominative-singular":"beceria","accusative-indefinite-nominative-plural":"becerii","accusative-definite-nominative-plural":"beceriile","dative-genitive-indefinite-singular":"becerii","dative-definite-genitive-singular":"beceriei","dative-genitive-indefinite-plural":"becerii","dative-definite-genitive-plural":"beceriilor","singular-vocative":"becerie","plural-vocative":"beceriilor"}},{"word":"Becescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Becescu"}},{"word":"Becheanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Becheanu"}},{"word":"Becheni","pos":"name","definitions":["a village in Roșia de Amaradia, Gorj County, Romania","a village in Săuca, Satu Mare County, Romania"],"gender":"m"},{"word":"Becher","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Becher"}},{"word":"becher","pos":"noun","definitions":["bachelor"],"forms":{"plural":"becheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"becher","accusative-definite-nominative-singular":"becherul","accusative-indefinite-nominative-plural":"becheri","accusative-definite-nominative-plural":"becherii","dative-genitive-indefinite-singular":"becher","dative-definite-genitive-singular":"becherului","dative-genitive-indefinite-plural":"becheri","dative-definite-genitive-plural":"becherilor","singular-vocative":"becherule","plural-vocative":"becherilor"}},{"word":"becheraș","pos":"noun","definitions":["diminutive of becher; small bachelor"],"forms":{"plural":"becherași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"becheraș","accusative-definite-nominative-singular":"becherașul","accusative-indefinite-nominative-plural":"becherași","accusative-definite-nominative-plural":"becherașii","dative-genitive-indefinite-singular":"becheraș","dative-definite-genitive-singular":"becherașului","dative-genitive-indefinite-plural":"becherași","dative-definite-genitive-plural":"becherașilor","singular-vocative":"becherașule","plural-vocative":"becherașilor"}},{"word":"Becherescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Becherescu"}},{"word":"becherie","pos":"noun","definitions":["bachelordom"],"forms":{"plural":"becherii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"becherie","accusative-definite-nominative-singular":"becheria","accusative-indefinite-nominative-plural":"becherii","accusative-definite-nominative-plural":"becheriile","dative-genitive-indefinite-singular":"becherii","dative-definite-genitive-singular":"becheriei","dative-genitive-indefinite-plural":"becherii","dative-definite-genitive-plural":"becheriilor","singular-vocative":"becherie","plural-vocative":"becheriilor"}},{"word":"Becheriu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Becheriu"}},{"word":"becheroi","pos":"noun","definitions":["bachelor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"becheroi","accusative-definite-nominative":"becheroiul","dative-genitive-indefinite":"becheroi","dative-definite-genitive":"becheroiului","vocative":"becheroiule"}},{"word":"Becheru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Becheru"}},{"word":"Bechet","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bechet"}},{"word":"beci","pos":"noun","definitions":["cellar","prison, jail"],"forms":{"plural":"beciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beci","accusative-definite-nominative-singular":"beciul","accusative-indefinite-nominative-plural":"beciuri","accusative-definite-nominative-plural":"beciurile","dative-genitive-indefinite-singular":"beci","dative-definite-genitive-singular":"beciului","dative-genitive-indefinite-plural":"beciuri","dative-definite-genitive-plural":"beciurilor","singular-vocative":"beciule","plural-vocative":"beciurilor"}},{"word":"Becicherecu Mic","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Becicherecu Mic, Timiș County, Romania"],"gender":"m"},{"word":"becisnic","pos":"adj","definitions":["incompetent","weak, helpless, sickly"],"forms":{"feminine-singular":"becisnică","masculine-plural":"becisnici","feminine-neuter-plural":"becisnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"becisnic","error-unrecognized-form-feminine-indefinite-singular":"becisnică","error-unrecognized-form-indefinite-masculine-plural":"becisnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"becisnice","definite-error-unrecognized-form-masculine-neuter-singular":"becisnicul","definite-error-unrecognized-form-feminine-singular":"becisnica","definite-error-unrecognized-form-masculine-plural":"becisnicii","definite-error-unrecognized-form-feminine-neuter-plural":"becisnicele"}},{"word":"becisnică","pos":"noun","definitions":["female equivalent of becisnic"],"forms":{"plural":"becisnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"becisnică","accusative-definite-nominative-singular":"becisnica","accusative-indefinite-nominative-plural":"becisnice","accusative-definite-nominative-plural":"becisnicele","dative-genitive-indefinite-singular":"becisnice","dative-definite-genitive-singular":"becisnicei","dative-genitive-indefinite-plural":"becisnice","dative-definite-genitive-plural":"becisnicelor","singular-vocative":"becisnică","plural-vocative":"becisnicelor"}},{"word":"becisnicie","pos":"noun","definitions":["frailty, weakness"],"forms":{"plural":"becisnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"becisnicie","accusative-definite-nominative-singular":"becisnicia","accusative-indefinite-nominative-plural":"becisnicii","accusative-definite-nominative-plural":"becisniciile","dative-genitive-indefinite-singular":"becisnicii","dative-definite-genitive-singular":"becisniciei","dative-genitive-indefinite-plural":"becisnicii","dative-definite-genitive-plural":"becisniciilor","singular-vocative":"becisnicie","plural-vocative":"becisniciilor"}},{"word":"Beciu","pos":"name","definitions":["a river in Vrancea County, Romania, tributary to the Slimnic","a village in Scorțoasa, Buzău County, Romania","a commune of Teleorman County, Romania","a village in Beciu, Teleorman County, Romania","a village in Vârteșcoiu, Vrancea County, Romania"],"gender":"m"},{"word":"beciului","pos":"noun","definitions":["definite genitive/dative singular of beci"]},{"word":"Beclean","pos":"name","definitions":["a town in Bistrița-Năsăud County, Romania","a commune of Brașov County, Romania","a village in Beclean, Brașov County, Romania"],"gender":"m"},{"word":"becquerelit","pos":"noun","definitions":["becquerelite"],"forms":{"plural":"becquerelite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"becquerelit","accusative-definite-nominative-singular":"becquerelitul","accusative-indefinite-nominative-plural":"becquerelite","accusative-definite-nominative-plural":"becquerelitele","dative-genitive-indefinite-singular":"becquerelit","dative-definite-genitive-singular":"becquerelitului","dative-genitive-indefinite-plural":"becquerelite","dative-definite-genitive-plural":"becquerelitelor","singular-vocative":"becquerelitule","plural-vocative":"becquerelitelor"}},{"word":"Becșani","pos":"name","definitions":["a village in Fârtățești, Vâlcea County, Romania"],"gender":"m"},{"word":"Becșenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Becșenescu"}},{"word":"Becter","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Furca, later merged into Curcani."],"gender":"m"},{"word":"Beculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Beculescu"}},{"word":"Beculești","pos":"name","definitions":["a village in Ciomăgești, Argeș County, Romania","a village in Cârlogani, Olt County, Romania"],"gender":"m"},{"word":"Becuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Becuț"}},{"word":"bedarniță","pos":"noun","definitions":["tricksy person"],"forms":{"plural":"bedarnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bedarniță","accusative-definite-nominative-singular":"bedarnița","accusative-indefinite-nominative-plural":"bedarnițe","accusative-definite-nominative-plural":"bedarnițele","dative-genitive-indefinite-singular":"bedarnițe","dative-definite-genitive-singular":"bedarniței","dative-genitive-indefinite-plural":"bedarnițe","dative-definite-genitive-plural":"bedarnițelor","singular-vocative":"bedarniță","plural-vocative":"bedarnițelor"}},{"word":"bedaș","pos":"noun","definitions":["a poor person"],"forms":{"plural":"bedași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bedaș","accusative-definite-nominative-singular":"bedașul","accusative-indefinite-nominative-plural":"bedași","accusative-definite-nominative-plural":"bedașii","dative-genitive-indefinite-singular":"bedaș","dative-definite-genitive-singular":"bedașului","dative-genitive-indefinite-plural":"bedași","dative-definite-genitive-plural":"bedașilor","singular-vocative":"bedașule","plural-vocative":"bedașilor"}},{"word":"Bedeciu","pos":"name","definitions":["a village in Mănăstireni, Cluj County, Romania"],"gender":"m"},{"word":"Bedeleu","pos":"name","definitions":["a village in Alba County, Livezile, Romania. Renamed to Izvoarele in 1925."],"gender":"m"},{"word":"Bedeni","pos":"name","definitions":["a village in Gălești, Mureș County, Romania"],"gender":"m"},{"word":"bederniță","pos":"noun","definitions":["obsolete form of nabederniță"],"forms":{"plural":"bedernițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bederniță","accusative-definite-nominative-singular":"bedernița","accusative-indefinite-nominative-plural":"bedernițe","accusative-definite-nominative-plural":"bedernițele","dative-genitive-indefinite-singular":"bedernițe","dative-definite-genitive-singular":"bederniței","dative-genitive-indefinite-plural":"bedernițe","dative-definite-genitive-plural":"bedernițelor","singular-vocative":"bederniță","plural-vocative":"bedernițelor"}},{"word":"Bedițeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bedițeanu"}},{"word":"Bedje","pos":"name","definitions":["a village in Tulcea County, in eastern Romania. Renamed to Satu Nou."],"gender":"m"},{"word":"Bedreag","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bedreag"}},{"word":"bedui","pos":"verb","definitions":["to suspect"],"forms":{"canonical":"a bedui 4th conjugation","present-singular-third-person":"beduie","participle-past":"beduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bedui","gerund":"beduind","first-person-indicative-present-singular":"bedui","indicative-present-second-person-singular":"bedui","indicative-present-singular-third-person":"beduie","first-person-indicative-plural-present":"beduim","indicative-plural-present-second-person":"beduiți","indicative-plural-present-third-person":"beduie","first-person-imperfect-indicative-singular":"beduiam","imperfect-indicative-second-person-singular":"beduiai","imperfect-indicative-singular-third-person":"beduia","first-person-imperfect-indicative-plural":"beduiam","imperfect-indicative-plural-second-person":"beduiați","imperfect-indicative-plural-third-person":"beduiau","first-person-indicative-perfect-singular":"beduii","indicative-perfect-second-person-singular":"beduiși","indicative-perfect-singular-third-person":"bedui","first-person-indicative-perfect-plural":"beduirăm","indicative-perfect-plural-second-person":"beduirăți","indicative-perfect-plural-third-person":"beduiră","first-person-indicative-pluperfect-singular":"beduisem","indicative-pluperfect-second-person-singular":"beduiseși","indicative-pluperfect-singular-third-person":"beduise","first-person-indicative-pluperfect-plural":"beduiserăm","indicative-pluperfect-plural-second-person":"beduiserăți","indicative-pluperfect-plural-third-person":"beduiseră","first-person-present-singular-subjunctive":"să bedui","present-second-person-singular-subjunctive":"să bedui","present-singular-subjunctive-third-person":"să beduie","first-person-plural-present-subjunctive":"să beduim","plural-present-second-person-subjunctive":"să beduiți","plural-present-subjunctive-third-person":"să beduie","imperative-second-person-singular":"beduie","imperative-plural-second-person":"beduiți","imperative-negative-second-person-singular":"nu bedui","imperative-negative-plural-second-person":"nu beduiți"}},{"word":"beduin","pos":"noun","definitions":["bedouin"],"forms":{"plural":"beduini","feminine":"equivalent beduină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beduin","accusative-definite-nominative-singular":"beduinul","accusative-indefinite-nominative-plural":"beduini","accusative-definite-nominative-plural":"beduinii","dative-genitive-indefinite-singular":"beduin","dative-definite-genitive-singular":"beduinului","dative-genitive-indefinite-plural":"beduini","dative-definite-genitive-plural":"beduinilor","singular-vocative":"beduinule","plural-vocative":"beduinilor"}},{"word":"beduină","pos":"noun","definitions":["female equivalent of beduin"],"forms":{"plural":"beduine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beduină","accusative-definite-nominative-singular":"beduina","accusative-indefinite-nominative-plural":"beduine","accusative-definite-nominative-plural":"beduinele","dative-genitive-indefinite-singular":"beduine","dative-definite-genitive-singular":"beduinei","dative-genitive-indefinite-plural":"beduine","dative-definite-genitive-plural":"beduinelor","singular-vocative":"beduină","plural-vocative":"beduinelor"}},{"word":"bee","pos":"intj","definitions":["obsolete form of behehe"]},{"word":"beefsteak","pos":"noun","definitions":["obsolete form of biftec"],"forms":{"plural":"beefsteakuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beefsteak","accusative-definite-nominative-singular":"beefsteakul","accusative-indefinite-nominative-plural":"beefsteakuri","accusative-definite-nominative-plural":"beefsteakurile","dative-genitive-indefinite-singular":"beefsteak","dative-definite-genitive-singular":"beefsteakului","dative-genitive-indefinite-plural":"beefsteakuri","dative-definite-genitive-plural":"beefsteakurilor","singular-vocative":"beefsteakule","plural-vocative":"beefsteakurilor"}},{"word":"beep","pos":"noun","definitions":["beep"],"pronunciation":"/bip/","forms":{"plural":"beep-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beep","accusative-definite-nominative-singular":"beep-ul","accusative-indefinite-nominative-plural":"beep-uri","accusative-definite-nominative-plural":"beep-urile","dative-genitive-indefinite-singular":"beep","dative-definite-genitive-singular":"beep-ului","dative-genitive-indefinite-plural":"beep-uri","dative-definite-genitive-plural":"beep-urilor","singular-vocative":"beep-ule","plural-vocative":"beep-urilor"}},{"word":"beethovenian","pos":"adj","definitions":["Beethovenian"],"forms":{"feminine-singular":"beethoveniană","masculine-plural":"beethovenieni","feminine-neuter-plural":"beethoveniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beethovenian","error-unrecognized-form-feminine-indefinite-singular":"beethoveniană","error-unrecognized-form-indefinite-masculine-plural":"beethovenieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"beethoveniene","definite-error-unrecognized-form-masculine-neuter-singular":"beethovenianul","definite-error-unrecognized-form-feminine-singular":"beethoveniana","definite-error-unrecognized-form-masculine-plural":"beethovenienii","definite-error-unrecognized-form-feminine-neuter-plural":"beethovenienele"}},{"word":"befel","pos":"noun","definitions":["command, order"],"forms":{"plural":"befeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"befel","accusative-definite-nominative-singular":"befelul","accusative-indefinite-nominative-plural":"befeluri","accusative-definite-nominative-plural":"befelurile","dative-genitive-indefinite-singular":"befel","dative-definite-genitive-singular":"befelului","dative-genitive-indefinite-plural":"befeluri","dative-definite-genitive-plural":"befelurilor","singular-vocative":"befelule","plural-vocative":"befelurilor"}},{"word":"Bega Luncanilor","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"f"},{"word":"Began","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Began"}},{"word":"Begheiu Mic","pos":"name","definitions":["a village in Făget, Timiș County, Romania"],"gender":"m"},{"word":"beglerbeg","pos":"noun","definitions":["alternative form of beilerbei"],"forms":{"plural":"beglerbegi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beglerbeg","accusative-definite-nominative-singular":"beglerbegul","accusative-indefinite-nominative-plural":"beglerbegi","accusative-definite-nominative-plural":"beglerbegii","dative-genitive-indefinite-singular":"beglerbeg","dative-definite-genitive-singular":"beglerbegului","dative-genitive-indefinite-plural":"beglerbegi","dative-definite-genitive-plural":"beglerbegilor","singular-vocative":"beglerbegule","plural-vocative":"beglerbegilor"}},{"word":"beglerbei","pos":"noun","definitions":["alternative form of beilerbei"],"forms":{"plural":"beglerbei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beglerbei","accusative-definite-nominative-singular":"beglerbeiul","accusative-indefinite-nominative-plural":"beglerbei","accusative-definite-nominative-plural":"beglerbeii","dative-genitive-indefinite-singular":"beglerbei","dative-definite-genitive-singular":"beglerbeiului","dative-genitive-indefinite-plural":"beglerbei","dative-definite-genitive-plural":"beglerbeilor","singular-vocative":"beglerbeiule","plural-vocative":"beglerbeilor"}},{"word":"begonie","pos":"noun","definitions":["begonia"],"forms":{"plural":"begonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"begonie","accusative-definite-nominative-singular":"begonia","accusative-indefinite-nominative-plural":"begonii","accusative-definite-nominative-plural":"begoniile","dative-genitive-indefinite-singular":"begonii","dative-definite-genitive-singular":"begoniei","dative-genitive-indefinite-plural":"begonii","dative-definite-genitive-plural":"begoniilor","singular-vocative":"begonie","plural-vocative":"begoniilor"}},{"word":"behăi","pos":"verb","definitions":["to baa, bleat, blat"],"forms":{"canonical":"a behăi 4th conjugation","present-singular-third-person":"behăie","participle-past":"behăit"}},{"word":"behăire","pos":"noun","definitions":["bleat"],"forms":{"plural":"behăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"behăire","accusative-definite-nominative-singular":"behăirea","accusative-indefinite-nominative-plural":"behăiri","accusative-definite-nominative-plural":"behăirile","dative-genitive-indefinite-singular":"behăiri","dative-definite-genitive-singular":"behăirii","dative-genitive-indefinite-plural":"behăiri","dative-definite-genitive-plural":"behăirilor","singular-vocative":"behăire","plural-vocative":"behăirilor"}},{"word":"behăit","pos":"noun","definitions":["bleat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"behăit","accusative-definite-nominative":"behăitul","dative-genitive-indefinite":"behăit","dative-definite-genitive":"behăitului","vocative":"behăitule"}},{"word":"behăit","pos":"verb","definitions":["past participle of behăi"],"forms":{"participle-past":"of behăi"}},{"word":"behăitor","pos":"adj","definitions":["bleating"],"forms":{"feminine-singular":"behăitoare","masculine-plural":"behăitori","feminine-neuter-plural":"behăitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"behăitor","error-unrecognized-form-feminine-indefinite-singular":"behăitoare","error-unrecognized-form-indefinite-masculine-plural":"behăitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"behăitoare","definite-error-unrecognized-form-masculine-neuter-singular":"behăitorul","definite-error-unrecognized-form-feminine-singular":"behăitoarea","definite-error-unrecognized-form-masculine-plural":"behăitorii","definite-error-unrecognized-form-feminine-neuter-plural":"behăitoarele"}},{"word":"behăitură","pos":"noun","definitions":["bleat"],"forms":{"plural":"behăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"behăitură","accusative-definite-nominative-singular":"behăitura","accusative-indefinite-nominative-plural":"behăituri","accusative-definite-nominative-plural":"behăiturile","dative-genitive-indefinite-singular":"behăituri","dative-definite-genitive-singular":"behăiturii","dative-genitive-indefinite-plural":"behăituri","dative-definite-genitive-plural":"behăiturilor","singular-vocative":"behăitură","plural-vocative":"behăiturilor"}},{"word":"behaviorism","pos":"noun","definitions":["behaviorism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"behaviorism","accusative-definite-nominative":"behaviorismul","dative-genitive-indefinite":"behaviorism","dative-definite-genitive":"behaviorismului","vocative":"behaviorismule"}},{"word":"behaviorist","pos":"adj","definitions":["behaviourist"],"forms":{"feminine-singular":"behavioristă","masculine-plural":"behavioriști","feminine-neuter-plural":"behavioriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"behaviorist","error-unrecognized-form-feminine-indefinite-singular":"behavioristă","error-unrecognized-form-indefinite-masculine-plural":"behavioriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"behavioriste","definite-error-unrecognized-form-masculine-neuter-singular":"behavioristul","definite-error-unrecognized-form-feminine-singular":"behaviorista","definite-error-unrecognized-form-masculine-plural":"behavioriștii","definite-error-unrecognized-form-feminine-neuter-plural":"behavioristele"}},{"word":"behehe","pos":"intj","definitions":["baa (sound made by sheep or goats)"]},{"word":"bei","pos":"noun","definitions":["bey"],"pronunciation":"/ˈbej/","forms":{"plural":"bei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bei","accusative-definite-nominative-singular":"beiul","accusative-indefinite-nominative-plural":"bei","accusative-definite-nominative-plural":"beii","dative-genitive-indefinite-singular":"bei","dative-definite-genitive-singular":"beiului","dative-genitive-indefinite-plural":"bei","dative-definite-genitive-plural":"beilor","singular-vocative":"beiule","plural-vocative":"beilor"}},{"word":"bei","pos":"verb","definitions":["second-person singular present indicative/subjunctive of bea (“to drink”)"],"pronunciation":"/ˈbej/"},{"word":"Beibugeac","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Plopul.","a lake in Dobruja, in eastern Romania"],"gender":"m"},{"word":"Beica","pos":"name","definitions":["a river in Mureș, Romania, tributary to the Mureș"],"gender":"f"},{"word":"Beica de Jos","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Beica de Jos, Mureș County, Romania"],"gender":"f"},{"word":"Beica de Sus","pos":"name","definitions":["a village in Beica de Jos, Mureș County, Romania"],"gender":"f"},{"word":"beicache","pos":"noun","definitions":["diminutive of bei"],"forms":{"plural":"beicachi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beicache","accusative-definite-nominative-singular":"beicacheul","accusative-indefinite-nominative-plural":"beicachi","accusative-definite-nominative-plural":"beicachii","dative-genitive-indefinite-singular":"beicache","dative-definite-genitive-singular":"beicacheului","dative-genitive-indefinite-plural":"beicachi","dative-definite-genitive-plural":"beicachilor","singular-vocative":"beicacheule","plural-vocative":"beicachilor"}},{"word":"Beidaud","pos":"name","definitions":["a village in Tulcea County, Dobruja, in eastern Romania"],"gender":"m"},{"word":"Beijing","pos":"name","definitions":["Beijing (a direct-administered municipality, the capital city of China)"],"pronunciation":"[bejˈʒiŋ]","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Beijing","accusative-definite-nominative":"Beijingul","dative-genitive-indefinite":"Beijing","dative-definite-genitive":"Beijingului","vocative":"Beijingule"}},{"word":"beilerbei","pos":"noun","definitions":["governor of an Ottoman province"],"forms":{"plural":"beilerbei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beilerbei","accusative-definite-nominative-singular":"beilerbeiul","accusative-indefinite-nominative-plural":"beilerbei","accusative-definite-nominative-plural":"beilerbeii","dative-genitive-indefinite-singular":"beilerbei","dative-definite-genitive-singular":"beilerbeiului","dative-genitive-indefinite-plural":"beilerbei","dative-definite-genitive-plural":"beilerbeilor","singular-vocative":"beilerbeiule","plural-vocative":"beilerbeilor"}},{"word":"Beilic","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Viile."],"gender":"m"},{"word":"beilicciu","pos":"noun","definitions":["Ottoman clerk in charge with forced purchase of sheep at a fixed price"],"forms":{"plural":"beiliccii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beilicciu","accusative-definite-nominative-singular":"beilicciuul","accusative-indefinite-nominative-plural":"beiliccii","accusative-definite-nominative-plural":"beilicciii","dative-genitive-indefinite-singular":"beilicciu","dative-definite-genitive-singular":"beilicciuului","dative-genitive-indefinite-plural":"beiliccii","dative-definite-genitive-plural":"beilicciilor","singular-vocative":"beilicciuule","plural-vocative":"beilicciilor"}},{"word":"beiugă","pos":"noun","definitions":["seal, stamp"],"forms":{"plural":"beiugi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"beiugă","accusative-definite-nominative-singular":"beiuga","accusative-indefinite-nominative-plural":"beiugi","accusative-definite-nominative-plural":"beiugile","dative-genitive-indefinite-singular":"beiugi","dative-definite-genitive-singular":"beiugii","dative-genitive-indefinite-plural":"beiugi","dative-definite-genitive-plural":"beiugilor","singular-vocative":"beiugă","plural-vocative":"beiugilor"}},{"word":"Beiuș","pos":"name","definitions":["a town in Bihor County, Romania"],"pronunciation":"/beˈjuʃ/","gender":"m"},{"word":"Beiușan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Beiușan"}},{"word":"Beiușanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Beiușanu"}},{"word":"Beiușele","pos":"name","definitions":["a village in Curățele, Bihor County, Romania"],"gender":"m"},{"word":"Beizadea","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"beizadea","pos":"noun","definitions":["son of a prince or king","son of a politician or businessman"],"forms":{"plural":"beizadele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"beizadea","accusative-definite-nominative-singular":"beizadeaua","accusative-indefinite-nominative-plural":"beizadele","accusative-definite-nominative-plural":"beizadelele","dative-genitive-indefinite-singular":"beizadele","dative-definite-genitive-singular":"beizadelei","dative-genitive-indefinite-plural":"beizadele","dative-definite-genitive-plural":"beizadelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"beizadesc","pos":"adj","definitions":["princely"],"forms":{"feminine-singular":"beizadească","plural":"beizadești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beizadesc","error-unrecognized-form-feminine-indefinite-singular":"beizadească","error-unrecognized-form-indefinite-masculine-plural":"beizadești","error-unrecognized-form-feminine-indefinite-neuter-plural":"beizadești","definite-error-unrecognized-form-masculine-neuter-singular":"beizadescul","definite-error-unrecognized-form-feminine-singular":"beizadeasca","definite-error-unrecognized-form-masculine-plural":"beizadeștii","definite-error-unrecognized-form-feminine-neuter-plural":"beizadeștile"}},{"word":"bej","pos":"adj","definitions":["beige"],"pronunciation":"/beʒ/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bej","error-unrecognized-form-feminine-indefinite-singular":"bej","error-unrecognized-form-indefinite-masculine-plural":"bej","error-unrecognized-form-feminine-indefinite-neuter-plural":"bej","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Bejan","pos":"name","definitions":["a village in Șoimuș, Hunedoara County, Romania","a surname"],"gender":"m"},{"word":"Bejan-Târnăvița","pos":"name","definitions":["a village in Șoimuș, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bejan-Tîrnăvița"}},{"word":"bejănar","pos":"noun","definitions":["alternative form of băjenar"],"forms":{"plural":"bejănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bejănar","accusative-definite-nominative-singular":"bejănarul","accusative-indefinite-nominative-plural":"bejănari","accusative-definite-nominative-plural":"bejănarii","dative-genitive-indefinite-singular":"bejănar","dative-definite-genitive-singular":"bejănarului","dative-genitive-indefinite-plural":"bejănari","dative-definite-genitive-plural":"bejănarilor","singular-vocative":"bejănarule","plural-vocative":"bejănarilor"}},{"word":"bejănări","pos":"verb","definitions":["alternative form of băjenări"],"forms":{"canonical":"a bejănări 4th conjugation","present-singular-third-person":"bejănărește","participle-past":"bejănărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bejănări","gerund":"bejănărind","first-person-indicative-present-singular":"bejănăresc","indicative-present-second-person-singular":"bejănărești","indicative-present-singular-third-person":"bejănărește","first-person-indicative-plural-present":"bejănărim","indicative-plural-present-second-person":"bejănăriți","indicative-plural-present-third-person":"bejănăresc","first-person-imperfect-indicative-singular":"bejănăream","imperfect-indicative-second-person-singular":"bejănăreai","imperfect-indicative-singular-third-person":"bejănărea","first-person-imperfect-indicative-plural":"bejănăream","imperfect-indicative-plural-second-person":"bejănăreați","imperfect-indicative-plural-third-person":"bejănăreau","first-person-indicative-perfect-singular":"bejănării","indicative-perfect-second-person-singular":"bejănăriși","indicative-perfect-singular-third-person":"bejănări","first-person-indicative-perfect-plural":"bejănărirăm","indicative-perfect-plural-second-person":"bejănărirăți","indicative-perfect-plural-third-person":"bejănăriră","first-person-indicative-pluperfect-singular":"bejănărisem","indicative-pluperfect-second-person-singular":"bejănăriseși","indicative-pluperfect-singular-third-person":"bejănărise","first-person-indicative-pluperfect-plural":"bejănăriserăm","indicative-pluperfect-plural-second-person":"bejănăriserăți","indicative-pluperfect-plural-third-person":"bejănăriseră","first-person-present-singular-subjunctive":"să bejănăresc","present-second-person-singular-subjunctive":"să bejănărești","present-singular-subjunctive-third-person":"să bejănărească","first-person-plural-present-subjunctive":"să bejănărim","plural-present-second-person-subjunctive":"să bejănăriți","plural-present-subjunctive-third-person":"să bejănărească","imperative-second-person-singular":"bejănărește","imperative-plural-second-person":"bejănăriți","imperative-negative-second-person-singular":"nu bejănări","imperative-negative-plural-second-person":"nu bejănăriți"}},{"word":"bejănărie","pos":"noun","definitions":["alternative form of băjenărie"],"forms":{"plural":"bejănării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bejănărie","accusative-definite-nominative-singular":"bejănăria","accusative-indefinite-nominative-plural":"bejănării","accusative-definite-nominative-plural":"bejănăriile","dative-genitive-indefinite-singular":"bejănării","dative-definite-genitive-singular":"bejănăriei","dative-genitive-indefinite-plural":"bejănării","dative-definite-genitive-plural":"bejănăriilor","singular-vocative":"bejănărie","plural-vocative":"bejănăriilor"}},{"word":"bejănărit","pos":"noun","definitions":["alternative form of băjenărit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bejănărit","accusative-definite-nominative":"bejănăritul","dative-genitive-indefinite":"bejănărit","dative-definite-genitive":"bejănăritului","vocative":"bejănăritule"}},{"word":"bejăni","pos":"verb","definitions":["alternative form of băjeni"],"forms":{"canonical":"a bejăni 4th conjugation","present-singular-third-person":"bejănește","participle-past":"bejănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bejăni","gerund":"bejănind","first-person-indicative-present-singular":"bejănesc","indicative-present-second-person-singular":"bejănești","indicative-present-singular-third-person":"bejănește","first-person-indicative-plural-present":"bejănim","indicative-plural-present-second-person":"bejăniți","indicative-plural-present-third-person":"bejănesc","first-person-imperfect-indicative-singular":"bejăneam","imperfect-indicative-second-person-singular":"bejăneai","imperfect-indicative-singular-third-person":"bejănea","first-person-imperfect-indicative-plural":"bejăneam","imperfect-indicative-plural-second-person":"bejăneați","imperfect-indicative-plural-third-person":"bejăneau","first-person-indicative-perfect-singular":"bejănii","indicative-perfect-second-person-singular":"bejăniși","indicative-perfect-singular-third-person":"bejăni","first-person-indicative-perfect-plural":"bejănirăm","indicative-perfect-plural-second-person":"bejănirăți","indicative-perfect-plural-third-person":"bejăniră","first-person-indicative-pluperfect-singular":"bejănisem","indicative-pluperfect-second-person-singular":"bejăniseși","indicative-pluperfect-singular-third-person":"bejănise","first-person-indicative-pluperfect-plural":"bejăniserăm","indicative-pluperfect-plural-second-person":"bejăniserăți","indicative-pluperfect-plural-third-person":"bejăniseră","first-person-present-singular-subjunctive":"să bejănesc","present-second-person-singular-subjunctive":"să bejănești","present-singular-subjunctive-third-person":"să bejănească","first-person-plural-present-subjunctive":"să bejănim","plural-present-second-person-subjunctive":"să bejăniți","plural-present-subjunctive-third-person":"să bejănească","imperative-second-person-singular":"bejănește","imperative-plural-second-person":"bejăniți","imperative-negative-second-person-singular":"nu bejăni","imperative-negative-plural-second-person":"nu bejăniți"}},{"word":"bejanie","pos":"noun","definitions":["alternative form of băjenie"],"forms":{"plural":"bejanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bejanie","accusative-definite-nominative-singular":"bejania","accusative-indefinite-nominative-plural":"bejanii","accusative-definite-nominative-plural":"bejaniile","dative-genitive-indefinite-singular":"bejanii","dative-definite-genitive-singular":"bejaniei","dative-genitive-indefinite-plural":"bejanii","dative-definite-genitive-plural":"bejaniilor","singular-vocative":"bejanie","plural-vocative":"bejaniilor"}},{"word":"bejenar","pos":"noun","definitions":["alternative form of băjenar"],"forms":{"plural":"bejenari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bejenar","accusative-definite-nominative-singular":"bejenarul","accusative-indefinite-nominative-plural":"bejenari","accusative-definite-nominative-plural":"bejenarii","dative-genitive-indefinite-singular":"bejenar","dative-definite-genitive-singular":"bejenarului","dative-genitive-indefinite-plural":"bejenari","dative-definite-genitive-plural":"bejenarilor","singular-vocative":"bejenarule","plural-vocative":"bejenarilor"}},{"word":"bejenerie","pos":"noun","definitions":["alternative form of băjenărie"],"forms":{"plural":"bejenerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bejenerie","accusative-definite-nominative-singular":"bejeneria","accusative-indefinite-nominative-plural":"bejenerii","accusative-definite-nominative-plural":"bejeneriile","dative-genitive-indefinite-singular":"bejenerii","dative-definite-genitive-singular":"bejeneriei","dative-genitive-indefinite-plural":"bejenerii","dative-definite-genitive-plural":"bejeneriilor","singular-vocative":"bejenerie","plural-vocative":"bejeneriilor"}},{"word":"Bejenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bejenescu"}},{"word":"Bejenești","pos":"name","definitions":["a village in Laza, Vaslui County, Romania"],"gender":"m"},{"word":"bejeni","pos":"verb","definitions":["alternative form of băjeni"],"forms":{"canonical":"a bejeni 4th conjugation","present-singular-third-person":"bejenește","participle-past":"bejenit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bejeni","gerund":"bejenind","first-person-indicative-present-singular":"bejenesc","indicative-present-second-person-singular":"bejenești","indicative-present-singular-third-person":"bejenește","first-person-indicative-plural-present":"bejenim","indicative-plural-present-second-person":"bejeniți","indicative-plural-present-third-person":"bejenesc","first-person-imperfect-indicative-singular":"bejeneam","imperfect-indicative-second-person-singular":"bejeneai","imperfect-indicative-singular-third-person":"bejenea","first-person-imperfect-indicative-plural":"bejeneam","imperfect-indicative-plural-second-person":"bejeneați","imperfect-indicative-plural-third-person":"bejeneau","first-person-indicative-perfect-singular":"bejenii","indicative-perfect-second-person-singular":"bejeniși","indicative-perfect-singular-third-person":"bejeni","first-person-indicative-perfect-plural":"bejenirăm","indicative-perfect-plural-second-person":"bejenirăți","indicative-perfect-plural-third-person":"bejeniră","first-person-indicative-pluperfect-singular":"bejenisem","indicative-pluperfect-second-person-singular":"bejeniseși","indicative-pluperfect-singular-third-person":"bejenise","first-person-indicative-pluperfect-plural":"bejeniserăm","indicative-pluperfect-plural-second-person":"bejeniserăți","indicative-pluperfect-plural-third-person":"bejeniseră","first-person-present-singular-subjunctive":"să bejenesc","present-second-person-singular-subjunctive":"să bejenești","present-singular-subjunctive-third-person":"să bejenească","first-person-plural-present-subjunctive":"să bejenim","plural-present-second-person-subjunctive":"să bejeniți","plural-present-subjunctive-third-person":"să bejenească","imperative-second-person-singular":"bejenește","imperative-plural-second-person":"bejeniți","imperative-negative-second-person-singular":"nu bejeni","imperative-negative-plural-second-person":"nu bejeniți"}},{"word":"bejenie","pos":"noun","definitions":["alternative form of băjenie"],"forms":{"plural":"bejenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bejenie","accusative-definite-nominative-singular":"bejenia","accusative-indefinite-nominative-plural":"bejenii","accusative-definite-nominative-plural":"bejeniile","dative-genitive-indefinite-singular":"bejenii","dative-definite-genitive-singular":"bejeniei","dative-genitive-indefinite-plural":"bejenii","dative-definite-genitive-plural":"bejeniilor","singular-vocative":"bejenie","plural-vocative":"bejeniilor"}},{"word":"Bejna","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Valea Mare"],"gender":"f"},{"word":"Bela","pos":"name","definitions":["a locality in Pucioasa, Dâmbovița County, Romania"],"gender":"f"},{"word":"belacoasă","pos":"noun","definitions":["silk cloth"],"forms":{"plural":"belacoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belacoasă","accusative-definite-nominative-singular":"belacoasa","accusative-indefinite-nominative-plural":"belacoase","accusative-definite-nominative-plural":"belacoasele","dative-genitive-indefinite-singular":"belacoase","dative-definite-genitive-singular":"belacoasei","dative-genitive-indefinite-plural":"belacoase","dative-definite-genitive-plural":"belacoaselor","singular-vocative":"belacoasă","plural-vocative":"belacoaselor"}},{"word":"Belacurencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Belacurencu"}},{"word":"beladonă","pos":"noun","definitions":["deadly nightshade"],"forms":{"plural":"beladone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beladonă","accusative-definite-nominative-singular":"beladona","accusative-indefinite-nominative-plural":"beladone","accusative-definite-nominative-plural":"beladonele","dative-genitive-indefinite-singular":"beladone","dative-definite-genitive-singular":"beladonei","dative-genitive-indefinite-plural":"beladone","dative-definite-genitive-plural":"beladonelor","singular-vocative":"beladonă","plural-vocative":"beladonelor"}},{"word":"belaliu","pos":"adj","definitions":["hard, difficult"],"forms":{"feminine-singular":"belalie","plural":"belalii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belaliu","error-unrecognized-form-feminine-indefinite-singular":"belalie","error-unrecognized-form-indefinite-masculine-plural":"belalii","error-unrecognized-form-feminine-indefinite-neuter-plural":"belalii","definite-error-unrecognized-form-masculine-neuter-singular":"belaliul","definite-error-unrecognized-form-feminine-singular":"belalia","definite-error-unrecognized-form-masculine-plural":"belaliii","definite-error-unrecognized-form-feminine-neuter-plural":"belaliile"}},{"word":"Belareca","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Cerna"],"gender":"f"},{"word":"Belarus","pos":"name","definitions":["Belarus (a country in Eastern Europe)"],"pronunciation":"/be.laˈrus/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Belarus","accusative-definite-nominative":"Belarusul","dative-genitive-indefinite":"Belarus","dative-definite-genitive":"Belarusului","vocative":"Belarusule"}},{"word":"belarusă","pos":"noun","definitions":["female equivalent of belarus"],"forms":{"plural":"belaruse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belarusă","accusative-definite-nominative-singular":"belarusa","accusative-indefinite-nominative-plural":"belaruse","accusative-definite-nominative-plural":"belarusele","dative-genitive-indefinite-singular":"belaruse","dative-definite-genitive-singular":"belarusei","dative-genitive-indefinite-plural":"belaruse","dative-definite-genitive-plural":"belaruselor","singular-vocative":"belarusă","plural-vocative":"belaruselor"}},{"word":"belatru","pos":"noun","definitions":["fop, dandy"],"forms":{"plural":"belatre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belatru","accusative-definite-nominative-singular":"belatruul","accusative-indefinite-nominative-plural":"belatre","accusative-definite-nominative-plural":"belatrele","dative-genitive-indefinite-singular":"belatru","dative-definite-genitive-singular":"belatruului","dative-genitive-indefinite-plural":"belatre","dative-definite-genitive-plural":"belatrelor","singular-vocative":"belatruule","plural-vocative":"belatrelor"}},{"word":"belcanto","pos":"noun","definitions":["bel canto"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"belcanto","accusative-definite-nominative":"belcantoul","dative-genitive-indefinite":"belcanto","dative-definite-genitive":"belcantoului","vocative":"belcantoule"}},{"word":"Belcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Belcescu"}},{"word":"Belcești","pos":"name","definitions":["a commune of Iași County, Romania","a village in Belcești, Iași County, Romania","a village in Pogonești, Vaslui County, Romania"],"gender":"m"},{"word":"belceu","pos":"noun","definitions":["a cradle"],"forms":{"plural":"belceuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belceu","accusative-definite-nominative-singular":"belceuul","accusative-indefinite-nominative-plural":"belceuri","accusative-definite-nominative-plural":"belceurile","dative-genitive-indefinite-singular":"belceu","dative-definite-genitive-singular":"belceuului","dative-genitive-indefinite-plural":"belceuri","dative-definite-genitive-plural":"belceurilor","singular-vocative":"belceuule","plural-vocative":"belceurilor"}},{"word":"Belcinu","pos":"name","definitions":["a village in Calopăr, Dolj County, Romania"],"gender":"m"},{"word":"Belciug","pos":"name","definitions":["a village in Drăgănești, Prahova County, Romania","a village in Necșești, Teleorman County, Romania"],"gender":"m"},{"word":"belciug","pos":"noun","definitions":["loop, hook","nose ring (for pigs, livestock, etc.)"],"pronunciation":"/belˈt͡ʃjuɡ/","forms":{"plural":"belciuge","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belciug","accusative-definite-nominative-singular":"belciugul","accusative-indefinite-nominative-plural":"belciuge","accusative-definite-nominative-plural":"belciugele","dative-genitive-indefinite-singular":"belciug","dative-definite-genitive-singular":"belciugului","dative-genitive-indefinite-plural":"belciuge","dative-definite-genitive-plural":"belciugelor","singular-vocative":"belciugule","plural-vocative":"belciugelor"}},{"word":"belciugat","pos":"adj","definitions":["spiraled"],"forms":{"feminine-singular":"belciugată","masculine-plural":"belciugați","feminine-neuter-plural":"belciugate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belciugat","error-unrecognized-form-feminine-indefinite-singular":"belciugată","error-unrecognized-form-indefinite-masculine-plural":"belciugați","error-unrecognized-form-feminine-indefinite-neuter-plural":"belciugate","definite-error-unrecognized-form-masculine-neuter-singular":"belciugatul","definite-error-unrecognized-form-feminine-singular":"belciugata","definite-error-unrecognized-form-masculine-plural":"belciugații","definite-error-unrecognized-form-feminine-neuter-plural":"belciugatele"}},{"word":"Belciugatele","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Belciugatele, Călărași County, Romania"],"gender":"m"},{"word":"Belciugele","pos":"name","definitions":["a village in Măicănești, Vrancea County, Romania"],"gender":"f"},{"word":"Belciuneasa","pos":"name","definitions":["a village in Stănișești, Bacău County, Romania"],"gender":"f"},{"word":"Beldan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Beldan"}},{"word":"Beldescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Beldescu"}},{"word":"Beldie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beldie"}},{"word":"Beldimănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Beldimănescu"}},{"word":"beldioară","pos":"noun","definitions":["diminutive of beldie"],"forms":{"plural":"beldioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beldioară","accusative-definite-nominative-singular":"beldioara","accusative-indefinite-nominative-plural":"beldioare","accusative-definite-nominative-plural":"beldioarele","dative-genitive-indefinite-singular":"beldioare","dative-definite-genitive-singular":"beldioarei","dative-genitive-indefinite-plural":"beldioare","dative-definite-genitive-plural":"beldioarelor","singular-vocative":"beldioară","plural-vocative":"beldioarelor"}},{"word":"Beldiu","pos":"name","definitions":["a village in Teiuș, Alba County, Romania"],"gender":"m"},{"word":"bele-arte","pos":"noun","definitions":["beaux-arts, fine arts"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"bele-arte","accusative-definite-nominative":"bele-artele","dative-genitive-indefinite":"bele-arte","dative-definite-genitive":"bele-artelor","vocative":"-"}},{"word":"belea","pos":"noun","definitions":["trouble, misfortune, mischief"],"pronunciation":"[beˈle̯a]","forms":{"plural":"belele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"belea","accusative-definite-nominative-singular":"beleaua","accusative-indefinite-nominative-plural":"belele","accusative-definite-nominative-plural":"belelele","dative-genitive-indefinite-singular":"belele","dative-definite-genitive-singular":"belelei","dative-genitive-indefinite-plural":"belele","dative-definite-genitive-plural":"belelelor","singular-vocative":"belea","plural-vocative":"belelelor"}},{"word":"belea","pos":"verb","definitions":["third-person singular imperfect indicative of beli"],"pronunciation":"[beˈle̯a]"},{"word":"Beleagă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beleagă"}},{"word":"beleajă","pos":"noun","definitions":["simple-minded, stupid"],"forms":{"plural":"beleaje","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beleajă","accusative-definite-nominative-singular":"beleajăul","accusative-indefinite-nominative-plural":"beleaje","accusative-definite-nominative-plural":"beleajei","dative-genitive-indefinite-singular":"beleajă","dative-definite-genitive-singular":"beleajăului","dative-genitive-indefinite-plural":"beleaje","dative-definite-genitive-plural":"beleajelor","singular-vocative":"beleajăule","plural-vocative":"beleajelor"}},{"word":"Beleavinți","pos":"name","definitions":["a village in Beleavinți, Briceni Raion, Moldova","a commune of Briceni Raion, Moldova"],"gender":"m"},{"word":"Belecciu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Belecciu"}},{"word":"Beleghet","pos":"name","definitions":["a village in Agăș, Bacău County, Romania"],"gender":"m"},{"word":"belele","pos":"noun","definitions":["plural of belea"],"gender":"f-p"},{"word":"belemnit","pos":"noun","definitions":["belemnite"],"forms":{"plural":"belemniți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"belemnit","accusative-definite-nominative-singular":"belemnitul","accusative-indefinite-nominative-plural":"belemniți","accusative-definite-nominative-plural":"belemniții","dative-genitive-indefinite-singular":"belemnit","dative-definite-genitive-singular":"belemnitului","dative-genitive-indefinite-plural":"belemniți","dative-definite-genitive-plural":"belemniților","singular-vocative":"belemnitule","plural-vocative":"belemniților"}},{"word":"belengher","pos":"noun","definitions":["penis"],"pronunciation":"/beˈlen.ɡer/","forms":{"plural":"belenghere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belengher","accusative-definite-nominative-singular":"belengherul","accusative-indefinite-nominative-plural":"belenghere","accusative-definite-nominative-plural":"belengherele","dative-genitive-indefinite-singular":"belengher","dative-definite-genitive-singular":"belengherului","dative-genitive-indefinite-plural":"belenghere","dative-definite-genitive-plural":"belengherelor","singular-vocative":"belengherule","plural-vocative":"belengherelor"}},{"word":"belesc","pos":"verb","definitions":["inflection of beli:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Beleți","pos":"name","definitions":["a village in Beleți-Negrești, Argeș County, Romania"],"gender":"m"},{"word":"Beleți-Negrești","pos":"name","definitions":["a commune of Argeș County, Romania"],"gender":"m"},{"word":"beletrist","pos":"noun","definitions":["belletrist"],"forms":{"plural":"beletriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beletrist","accusative-definite-nominative-singular":"beletristul","accusative-indefinite-nominative-plural":"beletriști","accusative-definite-nominative-plural":"beletriștii","dative-genitive-indefinite-singular":"beletrist","dative-definite-genitive-singular":"beletristului","dative-genitive-indefinite-plural":"beletriști","dative-definite-genitive-plural":"beletriștilor","singular-vocative":"beletristule","plural-vocative":"beletriștilor"}},{"word":"beletristic","pos":"adj","definitions":["belletristic"],"forms":{"feminine-singular":"beletristică","masculine-plural":"beletristici","feminine-neuter-plural":"beletristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beletristic","error-unrecognized-form-feminine-indefinite-singular":"beletristică","error-unrecognized-form-indefinite-masculine-plural":"beletristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"beletristice","definite-error-unrecognized-form-masculine-neuter-singular":"beletristicul","definite-error-unrecognized-form-feminine-singular":"beletristica","definite-error-unrecognized-form-masculine-plural":"beletristicii","definite-error-unrecognized-form-feminine-neuter-plural":"beletristicele"}},{"word":"beletristică","pos":"noun","definitions":["fiction, belles-lettres"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"beletristică","accusative-definite-nominative":"beletristica","dative-genitive-indefinite":"beletristici","dative-definite-genitive":"beletristicii","vocative":"beletristică"}},{"word":"Beleuți","pos":"name","definitions":["a village in Natalievca, Fălești Raion, Moldova"],"gender":"m"},{"word":"beleuz","pos":"adj","definitions":["simpleton"],"forms":{"feminine-singular":"beleuză","masculine-plural":"beleuzi","feminine-neuter-plural":"beleuze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beleuz","error-unrecognized-form-feminine-indefinite-singular":"beleuză","error-unrecognized-form-indefinite-masculine-plural":"beleuzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"beleuze","definite-error-unrecognized-form-masculine-neuter-singular":"beleuzul","definite-error-unrecognized-form-feminine-singular":"beleuza","definite-error-unrecognized-form-masculine-plural":"beleuzii","definite-error-unrecognized-form-feminine-neuter-plural":"beleuzele"}},{"word":"Beleuzu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beleuzu"}},{"word":"Belfegor","pos":"noun","definitions":["Belphegor (demon associated with one of the seven deadly sins)","penis"],"pronunciation":"/bel.feˈɡor/"},{"word":"belfer","pos":"noun","definitions":["teacher"],"forms":{"plural":"belferi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"belfer","accusative-definite-nominative-singular":"belferul","accusative-indefinite-nominative-plural":"belferi","accusative-definite-nominative-plural":"belferii","dative-genitive-indefinite-singular":"belfer","dative-definite-genitive-singular":"belferului","dative-genitive-indefinite-plural":"belferi","dative-definite-genitive-plural":"belferilor","singular-vocative":"belferule","plural-vocative":"belferilor"}},{"word":"belge","pos":"noun","definitions":["head"],"forms":{"plural":"belgi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"belge","accusative-definite-nominative-singular":"belgea","accusative-indefinite-nominative-plural":"belgi","accusative-definite-nominative-plural":"belgile","dative-genitive-indefinite-singular":"belgi","dative-definite-genitive-singular":"belgii","dative-genitive-indefinite-plural":"belgi","dative-definite-genitive-plural":"belgilor","singular-vocative":"belge","plural-vocative":"belgilor"}},{"word":"belghiță","pos":"noun","definitions":["European bitterling (Rhodeus amarus)"],"forms":{"plural":"belghițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belghiță","accusative-definite-nominative-singular":"belghița","accusative-indefinite-nominative-plural":"belghițe","accusative-definite-nominative-plural":"belghițele","dative-genitive-indefinite-singular":"belghițe","dative-definite-genitive-singular":"belghiței","dative-genitive-indefinite-plural":"belghițe","dative-definite-genitive-plural":"belghițelor","singular-vocative":"belghiță","plural-vocative":"belghițelor"}},{"word":"Belgia","pos":"name","definitions":["Belgium (a country in Western Europe that has borders with the Netherlands, Germany, Luxembourg and France)"],"pronunciation":"/ˈbel.d͡ʒi.(j)a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Belgie","accusative-definite-nominative":"Belgia","dative-genitive-indefinite":"Belgii","dative-definite-genitive":"Belgiei","vocative":"Belgie"}},{"word":"belgian","pos":"adj","definitions":["from or pertaining to Belgium"],"forms":{"feminine-singular":"belgiană","masculine-plural":"belgieni","feminine-neuter-plural":"belgiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belgian","error-unrecognized-form-feminine-indefinite-singular":"belgiană","error-unrecognized-form-indefinite-masculine-plural":"belgieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"belgiene","definite-error-unrecognized-form-masculine-neuter-singular":"belgianul","definite-error-unrecognized-form-feminine-singular":"belgiana","definite-error-unrecognized-form-masculine-plural":"belgienii","definite-error-unrecognized-form-feminine-neuter-plural":"belgienele"}},{"word":"belgian","pos":"noun","definitions":["male inhabitant of Belgium"],"forms":{"plural":"belgieni","feminine":"equivalent belgiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"belgian","accusative-definite-nominative-singular":"belgianul","accusative-indefinite-nominative-plural":"belgieni","accusative-definite-nominative-plural":"belgienii","dative-genitive-indefinite-singular":"belgian","dative-definite-genitive-singular":"belgianului","dative-genitive-indefinite-plural":"belgieni","dative-definite-genitive-plural":"belgienilor","singular-vocative":"belgianule","plural-vocative":"belgienilor"}},{"word":"belgiană","pos":"noun","definitions":["female equivalent of belgian"],"forms":{"plural":"belgiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belgiană","accusative-definite-nominative-singular":"belgiana","accusative-indefinite-nominative-plural":"belgiene","accusative-definite-nominative-plural":"belgienele","dative-genitive-indefinite-singular":"belgiene","dative-definite-genitive-singular":"belgienei","dative-genitive-indefinite-plural":"belgiene","dative-definite-genitive-plural":"belgienelor","singular-vocative":"belgiană","plural-vocative":"belgienelor"}},{"word":"belgiancă","pos":"noun","definitions":["female equivalent of belgian"],"forms":{"plural":"belgience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belgiancă","accusative-definite-nominative-singular":"belgianca","accusative-indefinite-nominative-plural":"belgience","accusative-definite-nominative-plural":"belgiencele","dative-genitive-indefinite-singular":"belgience","dative-definite-genitive-singular":"belgiencei","dative-genitive-indefinite-plural":"belgience","dative-definite-genitive-plural":"belgiencelor","singular-vocative":"belgiancă","plural-vocative":"belgiencelor"}},{"word":"Belgrad","pos":"name","definitions":["Belgrade (the capital city of Serbia)"]},{"word":"belgrădean","pos":"adj","definitions":["of, from or relating to Belgrade"],"forms":{"feminine-singular":"belgrădeană","masculine-plural":"belgrădeni","feminine-neuter-plural":"belgrădene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belgrădean","error-unrecognized-form-feminine-indefinite-singular":"belgrădeană","error-unrecognized-form-indefinite-masculine-plural":"belgrădeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"belgrădene","definite-error-unrecognized-form-masculine-neuter-singular":"belgrădeanul","definite-error-unrecognized-form-feminine-singular":"belgrădeana","definite-error-unrecognized-form-masculine-plural":"belgrădenii","definite-error-unrecognized-form-feminine-neuter-plural":"belgrădenele"}},{"word":"belgrădean","pos":"noun","definitions":["native or inhabitant of Belgrade (usually male)"],"forms":{"plural":"belgrădeni","feminine":"equivalent belgrădeancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"belgrădean","accusative-definite-nominative-singular":"belgrădeanul","accusative-indefinite-nominative-plural":"belgrădeni","accusative-definite-nominative-plural":"belgrădenii","dative-genitive-indefinite-singular":"belgrădean","dative-definite-genitive-singular":"belgrădeanului","dative-genitive-indefinite-plural":"belgrădeni","dative-definite-genitive-plural":"belgrădenilor","singular-vocative":"belgrădeanule","plural-vocative":"belgrădenilor"}},{"word":"belgrădeancă","pos":"noun","definitions":["female equivalent of belgrădean"],"forms":{"plural":"belgrădence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belgrădeancă","accusative-definite-nominative-singular":"belgrădeanca","accusative-indefinite-nominative-plural":"belgrădence","accusative-definite-nominative-plural":"belgrădencele","dative-genitive-indefinite-singular":"belgrădence","dative-definite-genitive-singular":"belgrădencei","dative-genitive-indefinite-plural":"belgrădence","dative-definite-genitive-plural":"belgrădencelor","singular-vocative":"belgrădeancă","plural-vocative":"belgrădencelor"}},{"word":"Belgun","pos":"name","definitions":["a surname","a village in Bobicești, Olt County, Romania"],"gender":"m"},{"word":"beli","pos":"verb","definitions":["to skin, flay, excoriate","to rob; to fleece"],"forms":{"canonical":"a beli 4th conjugation","present-singular-third-person":"belește","participle-past":"belit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a beli","gerund":"belind","first-person-indicative-present-singular":"belesc","indicative-present-second-person-singular":"belești","indicative-present-singular-third-person":"belește","first-person-indicative-plural-present":"belim","indicative-plural-present-second-person":"beliți","indicative-plural-present-third-person":"belesc","first-person-imperfect-indicative-singular":"beleam","imperfect-indicative-second-person-singular":"beleai","imperfect-indicative-singular-third-person":"belea","first-person-imperfect-indicative-plural":"beleam","imperfect-indicative-plural-second-person":"beleați","imperfect-indicative-plural-third-person":"beleau","first-person-indicative-perfect-singular":"belii","indicative-perfect-second-person-singular":"beliși","indicative-perfect-singular-third-person":"beli","first-person-indicative-perfect-plural":"belirăm","indicative-perfect-plural-second-person":"belirăți","indicative-perfect-plural-third-person":"beliră","first-person-indicative-pluperfect-singular":"belisem","indicative-pluperfect-second-person-singular":"beliseși","indicative-pluperfect-singular-third-person":"belise","first-person-indicative-pluperfect-plural":"beliserăm","indicative-pluperfect-plural-second-person":"beliserăți","indicative-pluperfect-plural-third-person":"beliseră","first-person-present-singular-subjunctive":"să belesc","present-second-person-singular-subjunctive":"să belești","present-singular-subjunctive-third-person":"să belească","first-person-plural-present-subjunctive":"să belim","plural-present-second-person-subjunctive":"să beliți","plural-present-subjunctive-third-person":"să belească","imperative-second-person-singular":"belește","imperative-plural-second-person":"beliți","imperative-negative-second-person-singular":"nu beli","imperative-negative-plural-second-person":"nu beliți"}},{"word":"beli pula","pos":"verb","definitions":["to be in serious trouble; to be fucked"],"pronunciation":"/beˈli ˈpu.la/","examples":[{"ro":"Cu noua lege, micii comercianți au belit pula.","en":"With the new law, small business owners are fucked."}],"forms":{"canonical":"a beli pula 4th conjugation","present-singular-third-person":"belește pula","participle-past":"belit pula","table-tags":"conjugation-4","inflection-template":"ro-conj-phrase","infinitive":"a beli pula","gerund":"belind pula","first-person-indicative-present-singular":"belesc pula","indicative-present-second-person-singular":"belești pula","indicative-present-singular-third-person":"belește pula","first-person-indicative-plural-present":"belim pula","indicative-plural-present-second-person":"beliți pula","indicative-plural-present-third-person":"belesc pula","first-person-imperfect-indicative-singular":"beleam pula","imperfect-indicative-second-person-singular":"beleai pula","imperfect-indicative-singular-third-person":"belea pula","first-person-imperfect-indicative-plural":"beleam pula","imperfect-indicative-plural-second-person":"beleați pula","imperfect-indicative-plural-third-person":"beleau pula","first-person-indicative-perfect-singular":"belii pula","indicative-perfect-second-person-singular":"beliși pula","indicative-perfect-singular-third-person":"beli pula","first-person-indicative-perfect-plural":"belirăm pula","indicative-perfect-plural-second-person":"belirăți pula","indicative-perfect-plural-third-person":"beliră pula","first-person-indicative-pluperfect-singular":"belisem pula","indicative-pluperfect-second-person-singular":"beliseși pula","indicative-pluperfect-singular-third-person":"belise pula","first-person-indicative-pluperfect-plural":"beliserăm pula","indicative-pluperfect-plural-second-person":"beliserăți pula","indicative-pluperfect-plural-third-person":"beliseră pula","first-person-present-singular-subjunctive":"să belesc pula","present-second-person-singular-subjunctive":"să belești pula","present-singular-subjunctive-third-person":"să belească pula","first-person-plural-present-subjunctive":"să belim pula","plural-present-second-person-subjunctive":"să beliți pula","plural-present-subjunctive-third-person":"să belească pula","imperative-second-person-singular":"belește pula","imperative-plural-second-person":"beliți pula","imperative-negative-second-person-singular":"nu beli pula","imperative-negative-plural-second-person":"nu beliți pula"}},{"word":"belicism","pos":"noun","definitions":["warmongering"],"forms":{"plural":"belicisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belicism","accusative-definite-nominative-singular":"belicismul","accusative-indefinite-nominative-plural":"belicisme","accusative-definite-nominative-plural":"belicismele","dative-genitive-indefinite-singular":"belicism","dative-definite-genitive-singular":"belicismului","dative-genitive-indefinite-plural":"belicisme","dative-definite-genitive-plural":"belicismelor","singular-vocative":"belicismule","plural-vocative":"belicismelor"}},{"word":"belicist","pos":"adj","definitions":["warmonger"],"forms":{"feminine-singular":"belicistă","masculine-plural":"beliciști","feminine-neuter-plural":"beliciste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belicist","error-unrecognized-form-feminine-indefinite-singular":"belicistă","error-unrecognized-form-indefinite-masculine-plural":"beliciști","error-unrecognized-form-feminine-indefinite-neuter-plural":"beliciste","definite-error-unrecognized-form-masculine-neuter-singular":"belicistul","definite-error-unrecognized-form-feminine-singular":"belicista","definite-error-unrecognized-form-masculine-plural":"beliciștii","definite-error-unrecognized-form-feminine-neuter-plural":"belicistele"}},{"word":"belicos","pos":"adj","definitions":["bellicose"],"forms":{"feminine-singular":"belicoasă","masculine-plural":"belicoși","feminine-neuter-plural":"belicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belicos","error-unrecognized-form-feminine-indefinite-singular":"belicoasă","error-unrecognized-form-indefinite-masculine-plural":"belicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"belicoase","definite-error-unrecognized-form-masculine-neuter-singular":"belicosul","definite-error-unrecognized-form-feminine-singular":"belicoasa","definite-error-unrecognized-form-masculine-plural":"belicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"belicoasele"}},{"word":"Beliga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beliga"}},{"word":"Beligan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beligan"}},{"word":"beligerant","pos":"adj","definitions":["belligerent"],"forms":{"feminine-singular":"beligerantă","masculine-plural":"beligeranți","feminine-neuter-plural":"beligerante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beligerant","error-unrecognized-form-feminine-indefinite-singular":"beligerantă","error-unrecognized-form-indefinite-masculine-plural":"beligeranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"beligerante","definite-error-unrecognized-form-masculine-neuter-singular":"beligerantul","definite-error-unrecognized-form-feminine-singular":"beligeranta","definite-error-unrecognized-form-masculine-plural":"beligeranții","definite-error-unrecognized-form-feminine-neuter-plural":"beligerantele"}},{"word":"beligeranță","pos":"noun","definitions":["belligerence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beligeranță","accusative-definite-nominative-singular":"beligeranța","accusative-indefinite-nominative-plural":"beligeranțe","accusative-definite-nominative-plural":"beligeranțele","dative-genitive-indefinite-singular":"beligeranțe","dative-definite-genitive-singular":"beligeranței","dative-genitive-indefinite-plural":"beligeranțe","dative-definite-genitive-plural":"beligeranțelor","singular-vocative":"beligeranță","plural-vocative":"beligeranțelor"}},{"word":"belim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of beli"],"pronunciation":"[beˈlim]"},{"word":"Belin","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Belin, Covasna County, Romania"],"gender":"m"},{"word":"Belin-Vale","pos":"name","definitions":["a village in Belin, Covasna County, Romania"],"gender":"m"},{"word":"Belindescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Belindescu"}},{"word":"belinograf","pos":"noun","definitions":["wirephoto, telephotograph equipment"],"forms":{"plural":"belinografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"belinograf","accusative-definite-nominative-singular":"belinograful","accusative-indefinite-nominative-plural":"belinografe","accusative-definite-nominative-plural":"belinografele","dative-genitive-indefinite-singular":"belinograf","dative-definite-genitive-singular":"belinografului","dative-genitive-indefinite-plural":"belinografe","dative-definite-genitive-plural":"belinografelor","singular-vocative":"belinografule","plural-vocative":"belinografelor"}},{"word":"belinogramă","pos":"noun","definitions":["wirephoto, telephotograph (photographic image transmitted by wire)"],"forms":{"plural":"belinograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belinogramă","accusative-definite-nominative-singular":"belinograma","accusative-indefinite-nominative-plural":"belinograme","accusative-definite-nominative-plural":"belinogramele","dative-genitive-indefinite-singular":"belinograme","dative-definite-genitive-singular":"belinogramei","dative-genitive-indefinite-plural":"belinograme","dative-definite-genitive-plural":"belinogramelor","singular-vocative":"belinogramă","plural-vocative":"belinogramelor"}},{"word":"Belinț","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Belinț, Timiș County, Romania"],"gender":"m"},{"word":"Belinul Mare","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Olt"],"gender":"m"},{"word":"beliș","pos":"noun","definitions":["lining textile"],"forms":{"plural":"belișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beliș","accusative-definite-nominative-singular":"belișul","accusative-indefinite-nominative-plural":"belișuri","accusative-definite-nominative-plural":"belișurile","dative-genitive-indefinite-singular":"beliș","dative-definite-genitive-singular":"belișului","dative-genitive-indefinite-plural":"belișuri","dative-definite-genitive-plural":"belișurilor","singular-vocative":"belișule","plural-vocative":"belișurilor"}},{"word":"belit","pos":"adj","definitions":["skinned"],"forms":{"feminine-singular":"belită","masculine-plural":"beliți","feminine-neuter-plural":"belite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"belit","error-unrecognized-form-feminine-indefinite-singular":"belită","error-unrecognized-form-indefinite-masculine-plural":"beliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"belite","definite-error-unrecognized-form-masculine-neuter-singular":"belitul","definite-error-unrecognized-form-feminine-singular":"belita","definite-error-unrecognized-form-masculine-plural":"beliții","definite-error-unrecognized-form-feminine-neuter-plural":"belitele"}},{"word":"belit","pos":"verb","definitions":["past participle of beli"],"forms":{"participle-past":"of beli"}},{"word":"belită","pos":"noun","definitions":["bellite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belită","accusative-definite-nominative-singular":"belita","accusative-indefinite-nominative-plural":"belite","accusative-definite-nominative-plural":"belitele","dative-genitive-indefinite-singular":"belite","dative-definite-genitive-singular":"belitei","dative-genitive-indefinite-plural":"belite","dative-definite-genitive-plural":"belitelor","singular-vocative":"belită","plural-vocative":"belitelor"}},{"word":"belitoare","pos":"noun","definitions":["abattoir (arranged place where animals are slaughtered to obtain meat, under sanitary-veterinary control)"],"pronunciation":"/beliˈto̯are/","forms":{"plural":"belitori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"belitoare","accusative-definite-nominative-singular":"belitoarea","accusative-indefinite-nominative-plural":"belitori","accusative-definite-nominative-plural":"belitorile","dative-genitive-indefinite-singular":"belitori","dative-definite-genitive-singular":"belitorii","dative-genitive-indefinite-plural":"belitori","dative-definite-genitive-plural":"belitorilor","singular-vocative":"belitoare","plural-vocative":"belitorilor"}},{"word":"belitură","pos":"noun","definitions":["scratch"],"forms":{"plural":"belituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"belitură","accusative-definite-nominative-singular":"belitura","accusative-indefinite-nominative-plural":"belituri","accusative-definite-nominative-plural":"beliturile","dative-genitive-indefinite-singular":"belituri","dative-definite-genitive-singular":"beliturii","dative-genitive-indefinite-plural":"belituri","dative-definite-genitive-plural":"beliturilor","singular-vocative":"belitură","plural-vocative":"beliturilor"}},{"word":"Belize","pos":"name","definitions":["Belize (an English-speaking country in Central America, formerly called British Honduras)"],"pronunciation":"/beˈli.ze/"},{"word":"Bellu","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Bellu"}}];
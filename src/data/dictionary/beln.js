@@ -0,0 +1 @@
+export default [{"word":"belniță","pos":"noun","definitions":["common bleak (Alburnus alburnus)","spirlin (Alburnoides bipunctatus)"],"forms":{"plural":"belnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belniță","accusative-definite-nominative-singular":"belnița","accusative-indefinite-nominative-plural":"belnițe","accusative-definite-nominative-plural":"belnițele","dative-genitive-indefinite-singular":"belnițe","dative-definite-genitive-singular":"belniței","dative-genitive-indefinite-plural":"belnițe","dative-definite-genitive-plural":"belnițelor","singular-vocative":"belniță","plural-vocative":"belnițelor"}},{"word":"Belobreșca","pos":"name","definitions":["a village in Pojejena, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Belodedici","pos":"name","definitions":["a surname from Serbo-Croatian"],"gender":"m","forms":{"dative-genitive":"lui Belodedici"}},{"word":"belotă","pos":"noun","definitions":["belote"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"belotă","accusative-definite-nominative":"belota","dative-genitive-indefinite":"belote","dative-definite-genitive":"belotei","vocative":"belotă"}},{"word":"Belotinț","pos":"name","definitions":["a village in Conop, Arad County, Romania"],"gender":"m"},{"word":"belșiță","pos":"noun","definitions":["Indian shot (Canna indica)"],"forms":{"plural":"belșițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"belșiță","accusative-definite-nominative-singular":"belșița","accusative-indefinite-nominative-plural":"belșițe","accusative-definite-nominative-plural":"belșițele","dative-genitive-indefinite-singular":"belșițe","dative-definite-genitive-singular":"belșiței","dative-genitive-indefinite-plural":"belșițe","dative-definite-genitive-plural":"belșițelor","singular-vocative":"belșiță","plural-vocative":"belșițelor"}},{"word":"belșug","pos":"noun","definitions":["abundance"],"forms":{"plural":"belșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"belșug","accusative-definite-nominative-singular":"belșugul","accusative-indefinite-nominative-plural":"belșuguri","accusative-definite-nominative-plural":"belșugurile","dative-genitive-indefinite-singular":"belșug","dative-definite-genitive-singular":"belșugului","dative-genitive-indefinite-plural":"belșuguri","dative-definite-genitive-plural":"belșugurilor","singular-vocative":"belșugule","plural-vocative":"belșugurilor"}},{"word":"beltea","pos":"noun","definitions":["alternative form of peltea"],"forms":{"plural":"beltele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"beltea","accusative-definite-nominative-singular":"belteaua","accusative-indefinite-nominative-plural":"beltele","accusative-definite-nominative-plural":"beltelele","dative-genitive-indefinite-singular":"beltele","dative-definite-genitive-singular":"beltelei","dative-genitive-indefinite-plural":"beltele","dative-definite-genitive-plural":"beltelelor","singular-vocative":"beltea","plural-vocative":"beltelelor"}},{"word":"Belulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Belulescu"}},{"word":"belvedere","pos":"noun","definitions":["belvedere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"belvedere","accusative-definite-nominative":"belvederea","dative-genitive-indefinite":"belvedere","dative-definite-genitive":"belvederei","vocative":"belvedere"}},{"word":"Belzeni","pos":"name","definitions":["a village in Dragomirești, Vaslui County, Romania"],"gender":"m"},{"word":"bem","pos":"verb","definitions":["first-person plural present indicative/subjunctive of bea"],"pronunciation":"[bem]"},{"word":"bemol","pos":"noun","definitions":["bemol"],"forms":{"plural":"bemoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bemol","accusative-definite-nominative-singular":"bemolul","accusative-indefinite-nominative-plural":"bemoli","accusative-definite-nominative-plural":"bemolii","dative-genitive-indefinite-singular":"bemol","dative-definite-genitive-singular":"bemolului","dative-genitive-indefinite-plural":"bemoli","dative-definite-genitive-plural":"bemolilor","singular-vocative":"bemolule","plural-vocative":"bemolilor"}},{"word":"bemoliza","pos":"verb","definitions":["To flatten"],"forms":{"canonical":"a bemoliza 1st conjugation","present-singular-third-person":"bemolizează","participle-past":"bemolizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bemoliza","gerund":"bemolizând","first-person-indicative-present-singular":"bemolizez","indicative-present-second-person-singular":"bemolizezi","indicative-present-singular-third-person":"bemolizează","first-person-indicative-plural-present":"bemolizăm","indicative-plural-present-second-person":"bemolizați","indicative-plural-present-third-person":"bemolizează","first-person-imperfect-indicative-singular":"bemolizam","imperfect-indicative-second-person-singular":"bemolizai","imperfect-indicative-singular-third-person":"bemoliza","first-person-imperfect-indicative-plural":"bemolizam","imperfect-indicative-plural-second-person":"bemolizați","imperfect-indicative-plural-third-person":"bemolizau","first-person-indicative-perfect-singular":"bemolizai","indicative-perfect-second-person-singular":"bemolizași","indicative-perfect-singular-third-person":"bemoliză","first-person-indicative-perfect-plural":"bemolizarăm","indicative-perfect-plural-second-person":"bemolizarăți","indicative-perfect-plural-third-person":"bemolizară","first-person-indicative-pluperfect-singular":"bemolizasem","indicative-pluperfect-second-person-singular":"bemolizaseși","indicative-pluperfect-singular-third-person":"bemolizase","first-person-indicative-pluperfect-plural":"bemolizaserăm","indicative-pluperfect-plural-second-person":"bemolizaserăți","indicative-pluperfect-plural-third-person":"bemolizaseră","first-person-present-singular-subjunctive":"să bemolizez","present-second-person-singular-subjunctive":"să bemolizezi","present-singular-subjunctive-third-person":"să bemolizeze","first-person-plural-present-subjunctive":"să bemolizăm","plural-present-second-person-subjunctive":"să bemolizați","plural-present-subjunctive-third-person":"să bemolizeze","imperative-second-person-singular":"bemolizează","imperative-plural-second-person":"bemolizați","imperative-negative-second-person-singular":"nu bemoliza","imperative-negative-plural-second-person":"nu bemolizați"}},{"word":"benă","pos":"noun","definitions":["dumpster"],"forms":{"plural":"bene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benă","accusative-definite-nominative-singular":"bena","accusative-indefinite-nominative-plural":"bene","accusative-definite-nominative-plural":"benele","dative-genitive-indefinite-singular":"bene","dative-definite-genitive-singular":"benei","dative-genitive-indefinite-plural":"bene","dative-definite-genitive-plural":"benelor","singular-vocative":"benă","plural-vocative":"benelor"}},{"word":"Bencecu de Jos","pos":"name","definitions":["a village in Pișchia, Timiș County, Romania"],"gender":"m","forms":{"canonical-masculine":"Benecu de Jos"}},{"word":"Bencecu de Sus","pos":"name","definitions":["a village in Pișchia, Timiș County, Romania"],"gender":"m"},{"word":"Benchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Benchescu"}},{"word":"benchet","pos":"noun","definitions":["feast"],"forms":{"plural":"benchete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"benchet","accusative-definite-nominative-singular":"benchetul","accusative-indefinite-nominative-plural":"benchete","accusative-definite-nominative-plural":"benchetele","dative-genitive-indefinite-singular":"benchet","dative-definite-genitive-singular":"benchetului","dative-genitive-indefinite-plural":"benchete","dative-definite-genitive-plural":"benchetelor","singular-vocative":"benchetule","plural-vocative":"benchetelor"}},{"word":"benchetui","pos":"verb","definitions":["to banquet"],"forms":{"canonical":"a benchetui 4th conjugation","present-singular-third-person":"benchetuiește","participle-past":"benchetuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a benchetui","gerund":"benchetuind","first-person-indicative-present-singular":"benchetuiesc","indicative-present-second-person-singular":"benchetuiești","indicative-present-singular-third-person":"benchetuiește","first-person-indicative-plural-present":"benchetuim","indicative-plural-present-second-person":"benchetuiți","indicative-plural-present-third-person":"benchetuiesc","first-person-imperfect-indicative-singular":"benchetuiam","imperfect-indicative-second-person-singular":"benchetuiai","imperfect-indicative-singular-third-person":"benchetuia","first-person-imperfect-indicative-plural":"benchetuiam","imperfect-indicative-plural-second-person":"benchetuiați","imperfect-indicative-plural-third-person":"benchetuiau","first-person-indicative-perfect-singular":"benchetuii","indicative-perfect-second-person-singular":"benchetuiși","indicative-perfect-singular-third-person":"benchetui","first-person-indicative-perfect-plural":"benchetuirăm","indicative-perfect-plural-second-person":"benchetuirăți","indicative-perfect-plural-third-person":"benchetuiră","first-person-indicative-pluperfect-singular":"benchetuisem","indicative-pluperfect-second-person-singular":"benchetuiseși","indicative-pluperfect-singular-third-person":"benchetuise","first-person-indicative-pluperfect-plural":"benchetuiserăm","indicative-pluperfect-plural-second-person":"benchetuiserăți","indicative-pluperfect-plural-third-person":"benchetuiseră","first-person-present-singular-subjunctive":"să benchetuiesc","present-second-person-singular-subjunctive":"să benchetuiești","present-singular-subjunctive-third-person":"să benchetuiască","first-person-plural-present-subjunctive":"să benchetuim","plural-present-second-person-subjunctive":"să benchetuiți","plural-present-subjunctive-third-person":"să benchetuiască","imperative-second-person-singular":"benchetuiește","imperative-plural-second-person":"benchetuiți","imperative-negative-second-person-singular":"nu benchetui","imperative-negative-plural-second-person":"nu benchetuiți"}},{"word":"benchetuială","pos":"noun","definitions":["party, feast, celebration"],"forms":{"plural":"benchetuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benchetuială","accusative-definite-nominative-singular":"benchetuiala","accusative-indefinite-nominative-plural":"benchetuiele","accusative-definite-nominative-plural":"benchetuielele","dative-genitive-indefinite-singular":"benchetuiele","dative-definite-genitive-singular":"benchetuielei","dative-genitive-indefinite-plural":"benchetuiele","dative-definite-genitive-plural":"benchetuielelor","singular-vocative":"benchetuială","plural-vocative":"benchetuielelor"}},{"word":"benchi","pos":"noun","definitions":["alternative form of zbenghi"],"forms":{"plural":"benchiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"benchi","accusative-definite-nominative-singular":"benchiul","accusative-indefinite-nominative-plural":"benchiuri","accusative-definite-nominative-plural":"benchiurile","dative-genitive-indefinite-singular":"benchi","dative-definite-genitive-singular":"benchiului","dative-genitive-indefinite-plural":"benchiuri","dative-definite-genitive-plural":"benchiurilor","singular-vocative":"benchiule","plural-vocative":"benchiurilor"}},{"word":"benchișor","pos":"noun","definitions":["diminutive of benchi"],"forms":{"plural":"benchișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"benchișor","accusative-definite-nominative-singular":"benchișorul","accusative-indefinite-nominative-plural":"benchișoare","accusative-definite-nominative-plural":"benchișoarele","dative-genitive-indefinite-singular":"benchișor","dative-definite-genitive-singular":"benchișorului","dative-genitive-indefinite-plural":"benchișoare","dative-definite-genitive-plural":"benchișoarelor","singular-vocative":"benchișorule","plural-vocative":"benchișoarelor"}},{"word":"Bender","pos":"name","definitions":["a surname from Turkish"],"gender":"m","forms":{"dative-genitive":"lui Bender"}},{"word":"Bender","pos":"name","definitions":["Bender (a city and municipality of Moldova, under de-facto control of Transnistria)"],"gender":"m"},{"word":"Bendescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bendescu"}},{"word":"bendeu","pos":"noun","definitions":["stomach, belly, abdomen"],"pronunciation":"/benˈdew/","examples":[{"ro":"Nașul are o centură care stă să-i pleznească peste bendeu, dar sare dezinvolt din trenul care oprește la capăt de linie.","en":"The ticket inspector has a belt ready to burst over his belly, but he jauntily jumps off the train that stops at the end of the line."}],"forms":{"plural":"bendeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bendeu","accusative-definite-nominative-singular":"bendeul","accusative-indefinite-nominative-plural":"bendeie","accusative-definite-nominative-plural":"bendeiele","dative-genitive-indefinite-singular":"bendeu","dative-definite-genitive-singular":"bendeului","dative-genitive-indefinite-plural":"bendeie","dative-definite-genitive-plural":"bendeielor","singular-vocative":"bendeule","plural-vocative":"bendeielor"}},{"word":"bendiță","pos":"noun","definitions":["alternative form of bentiță"],"forms":{"plural":"bendițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bendiță","accusative-definite-nominative-singular":"bendița","accusative-indefinite-nominative-plural":"bendițe","accusative-definite-nominative-plural":"bendițele","dative-genitive-indefinite-singular":"bendițe","dative-definite-genitive-singular":"bendiței","dative-genitive-indefinite-plural":"bendițe","dative-definite-genitive-plural":"bendițelor","singular-vocative":"bendiță","plural-vocative":"bendițelor"}},{"word":"Benea din Gruiu","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Latorița"],"gender":"f"},{"word":"Benedek","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Benedek"}},{"word":"benedictin","pos":"adj","definitions":["Benedictine"],"forms":{"feminine-singular":"benedictină","masculine-plural":"benedictini","feminine-neuter-plural":"benedictine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benedictin","error-unrecognized-form-feminine-indefinite-singular":"benedictină","error-unrecognized-form-indefinite-masculine-plural":"benedictini","error-unrecognized-form-feminine-indefinite-neuter-plural":"benedictine","definite-error-unrecognized-form-masculine-neuter-singular":"benedictinul","definite-error-unrecognized-form-feminine-singular":"benedictina","definite-error-unrecognized-form-masculine-plural":"benedictinii","definite-error-unrecognized-form-feminine-neuter-plural":"benedictinele"}},{"word":"benedictină","pos":"noun","definitions":["female equivalent of benedictin"],"forms":{"plural":"benedictine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benedictină","accusative-definite-nominative-singular":"benedictina","accusative-indefinite-nominative-plural":"benedictine","accusative-definite-nominative-plural":"benedictinele","dative-genitive-indefinite-singular":"benedictine","dative-definite-genitive-singular":"benedictinei","dative-genitive-indefinite-plural":"benedictine","dative-definite-genitive-plural":"benedictinelor","singular-vocative":"benedictină","plural-vocative":"benedictinelor"}},{"word":"benedicțiune","pos":"noun","definitions":["blessing (some kind of divine or supernatural aid, or reward)"],"forms":{"plural":"benedicțiuni"}},{"word":"benefic","pos":"adj","definitions":["beneficial"],"pronunciation":"/beˈne.fik/","forms":{"feminine-singular":"benefică","masculine-plural":"benefici","feminine-neuter-plural":"benefice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benefic","error-unrecognized-form-feminine-indefinite-singular":"benefică","error-unrecognized-form-indefinite-masculine-plural":"benefici","error-unrecognized-form-feminine-indefinite-neuter-plural":"benefice","definite-error-unrecognized-form-masculine-neuter-singular":"beneficul","definite-error-unrecognized-form-feminine-singular":"benefica","definite-error-unrecognized-form-masculine-plural":"beneficii","definite-error-unrecognized-form-feminine-neuter-plural":"beneficele"}},{"word":"beneficia","pos":"verb","definitions":["to benefit"],"forms":{"canonical":"a beneficia 1st conjugation","present-singular-third-person":"beneficiează","participle-past":"beneficiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a beneficia","gerund":"beneficiind","first-person-indicative-present-singular":"beneficiez","indicative-present-second-person-singular":"beneficiezi","indicative-present-singular-third-person":"beneficiază","first-person-indicative-plural-present":"beneficiem","indicative-plural-present-second-person":"beneficiați","indicative-plural-present-third-person":"beneficiază","first-person-imperfect-indicative-singular":"beneficiam","imperfect-indicative-second-person-singular":"beneficiai","imperfect-indicative-singular-third-person":"beneficia","first-person-imperfect-indicative-plural":"beneficiam","imperfect-indicative-plural-second-person":"beneficiați","imperfect-indicative-plural-third-person":"beneficiau","first-person-indicative-perfect-singular":"beneficiai","indicative-perfect-second-person-singular":"beneficiași","indicative-perfect-singular-third-person":"beneficie","first-person-indicative-perfect-plural":"beneficiarăm","indicative-perfect-plural-second-person":"beneficiarăți","indicative-perfect-plural-third-person":"beneficiară","first-person-indicative-pluperfect-singular":"beneficiasem","indicative-pluperfect-second-person-singular":"beneficiaseși","indicative-pluperfect-singular-third-person":"beneficiase","first-person-indicative-pluperfect-plural":"beneficiaserăm","indicative-pluperfect-plural-second-person":"beneficiaserăți","indicative-pluperfect-plural-third-person":"beneficiaseră","first-person-present-singular-subjunctive":"să beneficiez","present-second-person-singular-subjunctive":"să beneficiezi","present-singular-subjunctive-third-person":"să beneficieze","first-person-plural-present-subjunctive":"să beneficiem","plural-present-second-person-subjunctive":"să beneficiați","plural-present-subjunctive-third-person":"să beneficieze","imperative-second-person-singular":"beneficiază","imperative-plural-second-person":"beneficiați","imperative-negative-second-person-singular":"nu beneficia","imperative-negative-plural-second-person":"nu beneficiați"}},{"word":"beneficiar","pos":"noun","definitions":["beneficiary"],"forms":{"plural":"beneficiari","feminine":"equivalent beneficiară","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beneficiar","accusative-definite-nominative-singular":"beneficiarul","accusative-indefinite-nominative-plural":"beneficiari","accusative-definite-nominative-plural":"beneficiarii","dative-genitive-indefinite-singular":"beneficiar","dative-definite-genitive-singular":"beneficiarului","dative-genitive-indefinite-plural":"beneficiari","dative-definite-genitive-plural":"beneficiarilor","singular-vocative":"beneficiarule","plural-vocative":"beneficiarilor"}},{"word":"beneficiară","pos":"noun","definitions":["female equivalent of beneficiar"],"forms":{"plural":"beneficiare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beneficiară","accusative-definite-nominative-singular":"beneficiara","accusative-indefinite-nominative-plural":"beneficiare","accusative-definite-nominative-plural":"beneficiarele","dative-genitive-indefinite-singular":"beneficiare","dative-definite-genitive-singular":"beneficiarei","dative-genitive-indefinite-plural":"beneficiare","dative-definite-genitive-plural":"beneficiarelor","singular-vocative":"beneficiară","plural-vocative":"beneficiarelor"}},{"word":"beneficiere","pos":"noun","definitions":["benefiting"],"forms":{"plural":"beneficieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"beneficiere","accusative-definite-nominative-singular":"beneficierea","accusative-indefinite-nominative-plural":"beneficieri","accusative-definite-nominative-plural":"beneficierile","dative-genitive-indefinite-singular":"beneficieri","dative-definite-genitive-singular":"beneficierii","dative-genitive-indefinite-plural":"beneficieri","dative-definite-genitive-plural":"beneficierilor","singular-vocative":"beneficiere","plural-vocative":"beneficierilor"}},{"word":"beneficiu","pos":"noun","definitions":["benefit"],"forms":{"plural":"beneficii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"beneficiu","accusative-definite-nominative-singular":"beneficiul","accusative-indefinite-nominative-plural":"beneficii","accusative-definite-nominative-plural":"beneficiile","dative-genitive-indefinite-singular":"beneficiu","dative-definite-genitive-singular":"beneficiului","dative-genitive-indefinite-plural":"beneficii","dative-definite-genitive-plural":"beneficiilor","singular-vocative":"beneficiule","plural-vocative":"beneficiilor"}},{"word":"Beneș","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Rezu Mare","a river in Bistrița-Năsăud, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"Benesat","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Benesat, Sălaj County, Romania"],"gender":"m"},{"word":"Benescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Benescu"}},{"word":"Benești","pos":"name","definitions":["a village in Beliu, Arad County, Romania","a village in Stănișești, Bacău County, Romania","a village in Drăgotești, Dolj County, Romania","a village in Alțina, Sibiu County, Romania","a village in Tanacu, Vaslui County, Romania"],"gender":"m"},{"word":"benevol","pos":"adj","definitions":["voluntary"],"forms":{"feminine-singular":"benevolă","masculine-plural":"benevoli","feminine-neuter-plural":"benevole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benevol","error-unrecognized-form-feminine-indefinite-singular":"benevolă","error-unrecognized-form-indefinite-masculine-plural":"benevoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"benevole","definite-error-unrecognized-form-masculine-neuter-singular":"benevolul","definite-error-unrecognized-form-feminine-singular":"benevola","definite-error-unrecognized-form-masculine-plural":"benevolii","definite-error-unrecognized-form-feminine-neuter-plural":"benevolele"}},{"word":"benga","pos":"noun","definitions":["the devil"]},{"word":"bengal","pos":"adj","definitions":["Bengal"],"pronunciation":"/beŋˈɡal/","forms":{"feminine-singular":"bengală","masculine-plural":"bengali","feminine-neuter-plural":"bengale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bengal","error-unrecognized-form-feminine-indefinite-singular":"bengală","error-unrecognized-form-indefinite-masculine-plural":"bengali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bengale","definite-error-unrecognized-form-masculine-neuter-singular":"bengalul","definite-error-unrecognized-form-feminine-singular":"bengala","definite-error-unrecognized-form-masculine-plural":"bengalii","definite-error-unrecognized-form-feminine-neuter-plural":"bengalele"}},{"word":"bengalez","pos":"adj","definitions":["Bengali"],"pronunciation":"[beŋɡaˈlez]","forms":{"feminine-singular":"bengaleză","masculine-plural":"bengalezi","feminine-neuter-plural":"bengaleze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bengalez","error-unrecognized-form-feminine-indefinite-singular":"bengaleză","error-unrecognized-form-indefinite-masculine-plural":"bengalezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bengaleze","definite-error-unrecognized-form-masculine-neuter-singular":"bengalezul","definite-error-unrecognized-form-feminine-singular":"bengaleza","definite-error-unrecognized-form-masculine-plural":"bengalezii","definite-error-unrecognized-form-feminine-neuter-plural":"bengalezele"}},{"word":"bengaleză","pos":"noun","definitions":["female equivalent of bengalez"],"forms":{"plural":"bengaleze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bengaleză","accusative-definite-nominative-singular":"bengaleza","accusative-indefinite-nominative-plural":"bengaleze","accusative-definite-nominative-plural":"bengalezele","dative-genitive-indefinite-singular":"bengaleze","dative-definite-genitive-singular":"bengalezei","dative-genitive-indefinite-plural":"bengaleze","dative-definite-genitive-plural":"bengalezelor","singular-vocative":"bengaleză","plural-vocative":"bengalezelor"}},{"word":"bengali","pos":"adj","definitions":["Bengali"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bengali","error-unrecognized-form-feminine-indefinite-singular":"bengali","error-unrecognized-form-indefinite-masculine-plural":"bengali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bengali","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Bengescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bengescu"}},{"word":"Bengești","pos":"name","definitions":["a village in Bengești-Ciocadia, Gorj County, Romania"],"gender":"m"},{"word":"Bengești-Ciocadia","pos":"name","definitions":["a commune of Gorj County, Romania"],"gender":"f"},{"word":"benghi","pos":"noun","definitions":["alternative form of zbenghi"],"forms":{"plural":"benghiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"benghi","accusative-definite-nominative-singular":"benghiul","accusative-indefinite-nominative-plural":"benghiuri","accusative-definite-nominative-plural":"benghiurile","dative-genitive-indefinite-singular":"benghi","dative-definite-genitive-singular":"benghiului","dative-genitive-indefinite-plural":"benghiuri","dative-definite-genitive-plural":"benghiurilor","singular-vocative":"benghiule","plural-vocative":"benghiurilor"}},{"word":"bengos","pos":"adj","definitions":["excellent, formidable, great"],"forms":{"feminine-singular":"bengoasă","masculine-plural":"bengoși","feminine-neuter-plural":"bengoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bengos","error-unrecognized-form-feminine-indefinite-singular":"bengoasă","error-unrecognized-form-indefinite-masculine-plural":"bengoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bengoase","definite-error-unrecognized-form-masculine-neuter-singular":"bengosul","definite-error-unrecognized-form-feminine-singular":"bengoasa","definite-error-unrecognized-form-masculine-plural":"bengoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bengoasele"}},{"word":"bengulaș","pos":"noun","definitions":["foreigner"],"forms":{"plural":"bengulași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bengulaș","accusative-definite-nominative-singular":"bengulașul","accusative-indefinite-nominative-plural":"bengulași","accusative-definite-nominative-plural":"bengulașii","dative-genitive-indefinite-singular":"bengulaș","dative-definite-genitive-singular":"bengulașului","dative-genitive-indefinite-plural":"bengulași","dative-definite-genitive-plural":"bengulașilor","singular-vocative":"bengulașule","plural-vocative":"bengulașilor"}},{"word":"Bengulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bengulescu"}},{"word":"benguț","pos":"adj","definitions":["strange"],"forms":{"feminine-singular":"benguță","masculine-plural":"benguți","feminine-neuter-plural":"benguțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benguț","error-unrecognized-form-feminine-indefinite-singular":"benguță","error-unrecognized-form-indefinite-masculine-plural":"benguți","error-unrecognized-form-feminine-indefinite-neuter-plural":"benguțe","definite-error-unrecognized-form-masculine-neuter-singular":"benguțul","definite-error-unrecognized-form-feminine-singular":"benguța","definite-error-unrecognized-form-masculine-plural":"benguții","definite-error-unrecognized-form-feminine-neuter-plural":"benguțele"}},{"word":"Beniamin","pos":"name","definitions":["a male given name, equivalent to English Benjamin"],"pronunciation":"[ˈbe.nja.min]","gender":"m","forms":{"dative-genitive":"lui Beniamin"}},{"word":"Benic","pos":"name","definitions":["a village in Galda de Jos, Alba County, Romania"],"gender":"m"},{"word":"benic","pos":"noun","definitions":["dotted satin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"benic","accusative-definite-nominative":"benicul","dative-genitive-indefinite":"benic","dative-definite-genitive":"benicului","vocative":"benicule"}},{"word":"benign","pos":"adj","definitions":["benign"],"forms":{"feminine-singular":"benignă","masculine-plural":"benigni","feminine-neuter-plural":"benigne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benign","error-unrecognized-form-feminine-indefinite-singular":"benignă","error-unrecognized-form-indefinite-masculine-plural":"benigni","error-unrecognized-form-feminine-indefinite-neuter-plural":"benigne","definite-error-unrecognized-form-masculine-neuter-singular":"benignul","definite-error-unrecognized-form-feminine-singular":"benigna","definite-error-unrecognized-form-masculine-plural":"benignii","definite-error-unrecognized-form-feminine-neuter-plural":"benignele"}},{"word":"benignitate","pos":"noun","definitions":["benignity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"benignitate","accusative-definite-nominative":"benignitatea","dative-genitive-indefinite":"benignități","dative-definite-genitive":"benignității","vocative":"benignitate"}},{"word":"Benin","pos":"name","definitions":["Benin (a country in West Africa, formerly Dahomey)"]},{"word":"beninez","pos":"adj","definitions":["Beninese"],"forms":{"feminine-singular":"benineză","masculine-plural":"beninezi","feminine-neuter-plural":"benineze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beninez","error-unrecognized-form-feminine-indefinite-singular":"benineză","error-unrecognized-form-indefinite-masculine-plural":"beninezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"benineze","definite-error-unrecognized-form-masculine-neuter-singular":"beninezul","definite-error-unrecognized-form-feminine-singular":"benineza","definite-error-unrecognized-form-masculine-plural":"beninezii","definite-error-unrecognized-form-feminine-neuter-plural":"beninezele"}},{"word":"beninez","pos":"noun","definitions":["Beninese"],"forms":{"plural":"beninezi","feminine":"equivalent benineză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beninez","accusative-definite-nominative-singular":"beninezul","accusative-indefinite-nominative-plural":"beninezi","accusative-definite-nominative-plural":"beninezii","dative-genitive-indefinite-singular":"beninez","dative-definite-genitive-singular":"beninezului","dative-genitive-indefinite-plural":"beninezi","dative-definite-genitive-plural":"beninezilor","singular-vocative":"beninezule","plural-vocative":"beninezilor"}},{"word":"benineză","pos":"noun","definitions":["female equivalent of beninez"],"forms":{"plural":"benineze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benineză","accusative-definite-nominative-singular":"benineza","accusative-indefinite-nominative-plural":"benineze","accusative-definite-nominative-plural":"beninezele","dative-genitive-indefinite-singular":"benineze","dative-definite-genitive-singular":"beninezei","dative-genitive-indefinite-plural":"benineze","dative-definite-genitive-plural":"beninezelor","singular-vocative":"benineză","plural-vocative":"beninezelor"}},{"word":"beniș","pos":"noun","definitions":["alternative form of biniș"],"forms":{"plural":"benișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beniș","accusative-definite-nominative-singular":"benișul","accusative-indefinite-nominative-plural":"benișuri","accusative-definite-nominative-plural":"benișurile","dative-genitive-indefinite-singular":"beniș","dative-definite-genitive-singular":"benișului","dative-genitive-indefinite-plural":"benișuri","dative-definite-genitive-plural":"benișurilor","singular-vocative":"benișule","plural-vocative":"benișurilor"}},{"word":"Beniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Beniuc"}},{"word":"benjamin","pos":"noun","definitions":["youngest child (in a family)"],"forms":{"plural":"benjamini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benjamin","accusative-definite-nominative-singular":"benjaminul","accusative-indefinite-nominative-plural":"benjamini","accusative-definite-nominative-plural":"benjaminii","dative-genitive-indefinite-singular":"benjamin","dative-definite-genitive-singular":"benjaminului","dative-genitive-indefinite-plural":"benjamini","dative-definite-genitive-plural":"benjaminilor","singular-vocative":"benjaminule","plural-vocative":"benjaminilor"}},{"word":"benoar","pos":"noun","definitions":["baignoire"],"forms":{"plural":"benoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"benoar","accusative-definite-nominative-singular":"benoarul","accusative-indefinite-nominative-plural":"benoare","accusative-definite-nominative-plural":"benoarele","dative-genitive-indefinite-singular":"benoar","dative-definite-genitive-singular":"benoarului","dative-genitive-indefinite-plural":"benoare","dative-definite-genitive-plural":"benoarelor","singular-vocative":"benoarule","plural-vocative":"benoarelor"}},{"word":"Bențid","pos":"name","definitions":["a village in Șimonești, Harghita County, Romania"],"gender":"m"},{"word":"bentiță","pos":"noun","definitions":["diminutive of bantă; small cuff"],"forms":{"plural":"bentițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bentiță","accusative-definite-nominative-singular":"bentița","accusative-indefinite-nominative-plural":"bentițe","accusative-definite-nominative-plural":"bentițele","dative-genitive-indefinite-singular":"bentițe","dative-definite-genitive-singular":"bentiței","dative-genitive-indefinite-plural":"bentițe","dative-definite-genitive-plural":"bentițelor","singular-vocative":"bentiță","plural-vocative":"bentițelor"}},{"word":"Bentoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bentoiu"}},{"word":"bentonic","pos":"adj","definitions":["benthonic"],"forms":{"feminine-singular":"bentonică","masculine-plural":"bentonici","feminine-neuter-plural":"bentonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bentonic","error-unrecognized-form-feminine-indefinite-singular":"bentonică","error-unrecognized-form-indefinite-masculine-plural":"bentonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bentonice","definite-error-unrecognized-form-masculine-neuter-singular":"bentonicul","definite-error-unrecognized-form-feminine-singular":"bentonica","definite-error-unrecognized-form-masculine-plural":"bentonicii","definite-error-unrecognized-form-feminine-neuter-plural":"bentonicele"}},{"word":"bentonit","pos":"noun","definitions":["bentonite"],"forms":{"plural":"bentonite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bentonit","accusative-definite-nominative-singular":"bentonitul","accusative-indefinite-nominative-plural":"bentonite","accusative-definite-nominative-plural":"bentonitele","dative-genitive-indefinite-singular":"bentonit","dative-definite-genitive-singular":"bentonitului","dative-genitive-indefinite-plural":"bentonite","dative-definite-genitive-plural":"bentonitelor","singular-vocative":"bentonitule","plural-vocative":"bentonitelor"}},{"word":"bentonită","pos":"noun","definitions":["alternative form of bentonit"],"forms":{"plural":"bentonite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bentonită","accusative-definite-nominative-singular":"bentonita","accusative-indefinite-nominative-plural":"bentonite","accusative-definite-nominative-plural":"bentonitele","dative-genitive-indefinite-singular":"bentonite","dative-definite-genitive-singular":"bentonitei","dative-genitive-indefinite-plural":"bentonite","dative-definite-genitive-plural":"bentonitelor","singular-vocative":"bentonită","plural-vocative":"bentonitelor"}},{"word":"bentos","pos":"noun","definitions":["benthos"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bentos","accusative-definite-nominative":"bentosul","dative-genitive-indefinite":"bentos","dative-definite-genitive":"bentosului","vocative":"bentosule"}},{"word":"benzaldehidă","pos":"noun","definitions":["benzaldehyde"],"forms":{"plural":"benzaldehide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benzaldehidă","accusative-definite-nominative-singular":"benzaldehida","accusative-indefinite-nominative-plural":"benzaldehide","accusative-definite-nominative-plural":"benzaldehidele","dative-genitive-indefinite-singular":"benzaldehide","dative-definite-genitive-singular":"benzaldehidei","dative-genitive-indefinite-plural":"benzaldehide","dative-definite-genitive-plural":"benzaldehidelor","singular-vocative":"benzaldehidă","plural-vocative":"benzaldehidelor"}},{"word":"benzedrină","pos":"noun","definitions":["benzedrine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"benzedrină","accusative-definite-nominative":"benzedrina","dative-genitive-indefinite":"benzedrine","dative-definite-genitive":"benzedrinei","vocative":"benzedrină"}},{"word":"benzen","pos":"noun","definitions":["benzene"],"forms":{"plural":"benzeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benzen","accusative-definite-nominative-singular":"benzenul","accusative-indefinite-nominative-plural":"benzeni","accusative-definite-nominative-plural":"benzenii","dative-genitive-indefinite-singular":"benzen","dative-definite-genitive-singular":"benzenului","dative-genitive-indefinite-plural":"benzeni","dative-definite-genitive-plural":"benzenilor","singular-vocative":"benzenule","plural-vocative":"benzenilor"}},{"word":"benzenic","pos":"adj","definitions":["benzenic"],"forms":{"feminine-singular":"benzenică","masculine-plural":"benzenici","feminine-neuter-plural":"benzenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benzenic","error-unrecognized-form-feminine-indefinite-singular":"benzenică","error-unrecognized-form-indefinite-masculine-plural":"benzenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"benzenice","definite-error-unrecognized-form-masculine-neuter-singular":"benzenicul","definite-error-unrecognized-form-feminine-singular":"benzenica","definite-error-unrecognized-form-masculine-plural":"benzenicii","definite-error-unrecognized-form-feminine-neuter-plural":"benzenicele"}},{"word":"benzenism","pos":"noun","definitions":["benzolism"],"forms":{"plural":"benzenisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"benzenism","accusative-definite-nominative-singular":"benzenismul","accusative-indefinite-nominative-plural":"benzenisme","accusative-definite-nominative-plural":"benzenismele","dative-genitive-indefinite-singular":"benzenism","dative-definite-genitive-singular":"benzenismului","dative-genitive-indefinite-plural":"benzenisme","dative-definite-genitive-plural":"benzenismelor","singular-vocative":"benzenismule","plural-vocative":"benzenismelor"}},{"word":"benzi","pos":"noun","definitions":["inflection of bandă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[benzʲ]","gender":"f"},{"word":"benzi desenate","pos":"noun","definitions":["comics"]},{"word":"benzidină","pos":"noun","definitions":["benzidine"],"forms":{"plural":"benzidine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benzidină","accusative-definite-nominative-singular":"benzidina","accusative-indefinite-nominative-plural":"benzidine","accusative-definite-nominative-plural":"benzidinele","dative-genitive-indefinite-singular":"benzidine","dative-definite-genitive-singular":"benzidinei","dative-genitive-indefinite-plural":"benzidine","dative-definite-genitive-plural":"benzidinelor","singular-vocative":"benzidină","plural-vocative":"benzidinelor"}},{"word":"benzil","pos":"noun","definitions":["benzyl"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"benzil","accusative-definite-nominative":"benzilul","dative-genitive-indefinite":"benzil","dative-definite-genitive":"benzilului","vocative":"benzilule"}},{"word":"benzile","pos":"noun","definitions":["definite nominative/accusative plural of bandă"],"pronunciation":"[ˈbenzile]","gender":"f"},{"word":"benzina","pos":"noun","definitions":["definite nominative/accusative singular of benzină"],"pronunciation":"[benˈzina]","gender":"f"},{"word":"benzină","pos":"noun","definitions":["gas, gasoline, petrol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"benzină","accusative-definite-nominative":"benzina","dative-genitive-indefinite":"benzine","dative-definite-genitive":"benzinei","vocative":"benzină"}},{"word":"benzinar","pos":"noun","definitions":["a pump attendant","a gas station owner","a gas-powered car"],"forms":{"plural":"benzinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benzinar","accusative-definite-nominative-singular":"benzinarul","accusative-indefinite-nominative-plural":"benzinari","accusative-definite-nominative-plural":"benzinarii","dative-genitive-indefinite-singular":"benzinar","dative-definite-genitive-singular":"benzinarului","dative-genitive-indefinite-plural":"benzinari","dative-definite-genitive-plural":"benzinarilor","singular-vocative":"benzinarule","plural-vocative":"benzinarilor"}},{"word":"benzinărie","pos":"noun","definitions":["gas station"],"pronunciation":"/benˌzi.nəˈri.e/","forms":{"plural":"benzinării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"benzinărie","accusative-definite-nominative-singular":"benzinăria","accusative-indefinite-nominative-plural":"benzinării","accusative-definite-nominative-plural":"benzinăriile","dative-genitive-indefinite-singular":"benzinării","dative-definite-genitive-singular":"benzinăriei","dative-genitive-indefinite-plural":"benzinării","dative-definite-genitive-plural":"benzinăriilor","singular-vocative":"benzinărie","plural-vocative":"benzinăriilor"}},{"word":"benzine","pos":"noun","definitions":["indefinite genitive/dative singular of benzină"],"pronunciation":"[benˈzine]","gender":"f"},{"word":"benzino","pos":"noun","definitions":["vocative singular of benzină"],"pronunciation":"[benˈzino]","gender":"f"},{"word":"benzoat","pos":"noun","definitions":["benzoate"],"forms":{"plural":"benzoați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benzoat","accusative-definite-nominative-singular":"benzoatul","accusative-indefinite-nominative-plural":"benzoați","accusative-definite-nominative-plural":"benzoații","dative-genitive-indefinite-singular":"benzoat","dative-definite-genitive-singular":"benzoatului","dative-genitive-indefinite-plural":"benzoați","dative-definite-genitive-plural":"benzoaților","singular-vocative":"benzoatule","plural-vocative":"benzoaților"}},{"word":"benzoat de sodiu","pos":"noun","definitions":["sodium benzoate"]},{"word":"benzoe","pos":"noun","definitions":["benzoin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"benzoe","accusative-definite-nominative":"benzoea","dative-genitive-indefinite":"benzoei","dative-definite-genitive":"benzoeii","vocative":"benzoe"}},{"word":"benzofenonă","pos":"noun","definitions":["benzophenone"],"forms":{"plural":"benzofenone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benzofenonă","accusative-definite-nominative-singular":"benzofenona","accusative-indefinite-nominative-plural":"benzofenone","accusative-definite-nominative-plural":"benzofenonele","dative-genitive-indefinite-singular":"benzofenone","dative-definite-genitive-singular":"benzofenonei","dative-genitive-indefinite-plural":"benzofenone","dative-definite-genitive-plural":"benzofenonelor","singular-vocative":"benzofenonă","plural-vocative":"benzofenonelor"}},{"word":"benzoic","pos":"adj","definitions":["benzoic"],"forms":{"feminine-singular":"benzoică","masculine-plural":"benzoici","feminine-neuter-plural":"benzoice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"benzoic","error-unrecognized-form-feminine-indefinite-singular":"benzoică","error-unrecognized-form-indefinite-masculine-plural":"benzoici","error-unrecognized-form-feminine-indefinite-neuter-plural":"benzoice","definite-error-unrecognized-form-masculine-neuter-singular":"benzoicul","definite-error-unrecognized-form-feminine-singular":"benzoica","definite-error-unrecognized-form-masculine-plural":"benzoicii","definite-error-unrecognized-form-feminine-neuter-plural":"benzoicele"}},{"word":"benzoil","pos":"noun","definitions":["benzoyl"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"benzoil","accusative-definite-nominative":"benzoilul","dative-genitive-indefinite":"benzoil","dative-definite-genitive":"benzoilului","vocative":"benzoilule"}},{"word":"benzoilare","pos":"noun","definitions":["benzoylation"],"forms":{"plural":"benzoilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"benzoilare","accusative-definite-nominative-singular":"benzoilarea","accusative-indefinite-nominative-plural":"benzoilări","accusative-definite-nominative-plural":"benzoilările","dative-genitive-indefinite-singular":"benzoilări","dative-definite-genitive-singular":"benzoilării","dative-genitive-indefinite-plural":"benzoilări","dative-definite-genitive-plural":"benzoilărilor","singular-vocative":"benzoilare","plural-vocative":"benzoilărilor"}},{"word":"benzol","pos":"noun","definitions":["benzene"],"forms":{"plural":"benzoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benzol","accusative-definite-nominative-singular":"benzolul","accusative-indefinite-nominative-plural":"benzoli","accusative-definite-nominative-plural":"benzolii","dative-genitive-indefinite-singular":"benzol","dative-definite-genitive-singular":"benzolului","dative-genitive-indefinite-plural":"benzoli","dative-definite-genitive-plural":"benzolilor","singular-vocative":"benzolule","plural-vocative":"benzolilor"}},{"word":"benzolism","pos":"noun","definitions":["benzolism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"benzolism","accusative-definite-nominative-singular":"benzolismul","accusative-indefinite-nominative-plural":"benzolisme","accusative-definite-nominative-plural":"benzolismele","dative-genitive-indefinite-singular":"benzolism","dative-definite-genitive-singular":"benzolismului","dative-genitive-indefinite-plural":"benzolisme","dative-definite-genitive-plural":"benzolismelor","singular-vocative":"benzolismule","plural-vocative":"benzolismelor"}},{"word":"benzonaftol","pos":"noun","definitions":["benzonaphthol"],"forms":{"plural":"benzonaftoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"benzonaftol","accusative-definite-nominative-singular":"benzonaftolul","accusative-indefinite-nominative-plural":"benzonaftoli","accusative-definite-nominative-plural":"benzonaftolii","dative-genitive-indefinite-singular":"benzonaftol","dative-definite-genitive-singular":"benzonaftolului","dative-genitive-indefinite-plural":"benzonaftoli","dative-definite-genitive-plural":"benzonaftolilor","singular-vocative":"benzonaftolule","plural-vocative":"benzonaftolilor"}},{"word":"benzopirină","pos":"noun","definitions":["benzopyrine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benzopirină","accusative-definite-nominative-singular":"benzopirina","accusative-indefinite-nominative-plural":"benzopirine","accusative-definite-nominative-plural":"benzopirinele","dative-genitive-indefinite-singular":"benzopirine","dative-definite-genitive-singular":"benzopirinei","dative-genitive-indefinite-plural":"benzopirine","dative-definite-genitive-plural":"benzopirinelor","singular-vocative":"benzopirină","plural-vocative":"benzopirinelor"}},{"word":"benzopurpurină","pos":"noun","definitions":["benzopurpurine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"benzopurpurină","accusative-definite-nominative-singular":"benzopurpurina","accusative-indefinite-nominative-plural":"benzopurpurine","accusative-definite-nominative-plural":"benzopurpurinele","dative-genitive-indefinite-singular":"benzopurpurine","dative-definite-genitive-singular":"benzopurpurinei","dative-genitive-indefinite-plural":"benzopurpurine","dative-definite-genitive-plural":"benzopurpurinelor","singular-vocative":"benzopurpurină","plural-vocative":"benzopurpurinelor"}},{"word":"beoțian","pos":"adj","definitions":["Boeotian (Pertaining to Boeotia)"],"forms":{"feminine-singular":"beoțiană","masculine-plural":"beoțieni","feminine-neuter-plural":"beoțiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beoțian","error-unrecognized-form-feminine-indefinite-singular":"beoțiană","error-unrecognized-form-indefinite-masculine-plural":"beoțieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"beoțiene","definite-error-unrecognized-form-masculine-neuter-singular":"beoțianul","definite-error-unrecognized-form-feminine-singular":"beoțiana","definite-error-unrecognized-form-masculine-plural":"beoțienii","definite-error-unrecognized-form-feminine-neuter-plural":"beoțienele"}},{"word":"Berar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Berar"}},{"word":"berar","pos":"noun","definitions":["brewer"],"forms":{"plural":"berari","feminine":"equivalent berăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berar","accusative-definite-nominative-singular":"berarul","accusative-indefinite-nominative-plural":"berari","accusative-definite-nominative-plural":"berarii","dative-genitive-indefinite-singular":"berar","dative-definite-genitive-singular":"berarului","dative-genitive-indefinite-plural":"berari","dative-definite-genitive-plural":"berarilor","singular-vocative":"berarule","plural-vocative":"berarilor"}},{"word":"berăreasă","pos":"noun","definitions":["female equivalent of berar"],"forms":{"plural":"berărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berăreasă","accusative-definite-nominative-singular":"berăreasa","accusative-indefinite-nominative-plural":"berărese","accusative-definite-nominative-plural":"berăresele","dative-genitive-indefinite-singular":"berărese","dative-definite-genitive-singular":"berăresei","dative-genitive-indefinite-plural":"berărese","dative-definite-genitive-plural":"berăreselor","singular-vocative":"berăreasă","plural-vocative":"berăreselor"}},{"word":"berărie","pos":"noun","definitions":["beer parlour, beerhouse"],"pronunciation":"/be.rəˈri.e/","forms":{"plural":"berării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"berărie","accusative-definite-nominative-singular":"berăria","accusative-indefinite-nominative-plural":"berării","accusative-definite-nominative-plural":"berăriile","dative-genitive-indefinite-singular":"berării","dative-definite-genitive-singular":"berăriei","dative-genitive-indefinite-plural":"berării","dative-definite-genitive-plural":"berăriilor","singular-vocative":"berărie","plural-vocative":"berăriilor"}},{"word":"berăriță","pos":"noun","definitions":["female equivalent of berar"],"forms":{"plural":"berărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berăriță","accusative-definite-nominative-singular":"berărița","accusative-indefinite-nominative-plural":"berărițe","accusative-definite-nominative-plural":"berărițele","dative-genitive-indefinite-singular":"berărițe","dative-definite-genitive-singular":"berăriței","dative-genitive-indefinite-plural":"berărițe","dative-definite-genitive-plural":"berărițelor","singular-vocative":"berăriță","plural-vocative":"berărițelor"}},{"word":"Berariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Berariu"}},{"word":"Beraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Beraru"}},{"word":"berbant","pos":"noun","definitions":["rake, lecher, libertine, womanizer"],"forms":{"plural":"berbanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbant","accusative-definite-nominative-singular":"berbantul","accusative-indefinite-nominative-plural":"berbanți","accusative-definite-nominative-plural":"berbanții","dative-genitive-indefinite-singular":"berbant","dative-definite-genitive-singular":"berbantului","dative-genitive-indefinite-plural":"berbanți","dative-definite-genitive-plural":"berbanților","singular-vocative":"berbantule","plural-vocative":"berbanților"}},{"word":"berbăntărie","pos":"noun","definitions":["debauchery"],"forms":{"plural":"berbăntării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"berbăntărie","accusative-definite-nominative-singular":"berbăntăria","accusative-indefinite-nominative-plural":"berbăntării","accusative-definite-nominative-plural":"berbăntăriile","dative-genitive-indefinite-singular":"berbăntării","dative-definite-genitive-singular":"berbăntăriei","dative-genitive-indefinite-plural":"berbăntării","dative-definite-genitive-plural":"berbăntăriilor","singular-vocative":"berbăntărie","plural-vocative":"berbăntăriilor"}},{"word":"berbănție","pos":"noun","definitions":["debauchery"],"forms":{"plural":"berbănții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"berbănție","accusative-definite-nominative-singular":"berbănția","accusative-indefinite-nominative-plural":"berbănții","accusative-definite-nominative-plural":"berbănțiile","dative-genitive-indefinite-singular":"berbănții","dative-definite-genitive-singular":"berbănției","dative-genitive-indefinite-plural":"berbănții","dative-definite-genitive-plural":"berbănțiilor","singular-vocative":"berbănție","plural-vocative":"berbănțiilor"}},{"word":"berbantlâc","pos":"noun","definitions":["debauchery"],"forms":{"plural":"berbantlâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"berbantlâc","accusative-definite-nominative-singular":"berbantlâcul","accusative-indefinite-nominative-plural":"berbantlâcuri","accusative-definite-nominative-plural":"berbantlâcurile","dative-genitive-indefinite-singular":"berbantlâc","dative-definite-genitive-singular":"berbantlâcului","dative-genitive-indefinite-plural":"berbantlâcuri","dative-definite-genitive-plural":"berbantlâcurilor","singular-vocative":"berbantlâcule","plural-vocative":"berbantlâcurilor","alternative":"berbantlîc"}},{"word":"Berbec","pos":"name","definitions":["Aries (constellation)","Aries (zodiac sign)"],"gender":"m"},{"word":"berbec","pos":"noun","definitions":["ram (the male sheep)","ram (the siege weapon)","a motherfucker, a bastard","a stupid man"],"forms":{"plural":"berbeci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbec","accusative-definite-nominative-singular":"berbecul","accusative-indefinite-nominative-plural":"berbeci","accusative-definite-nominative-plural":"berbecii","dative-genitive-indefinite-singular":"berbec","dative-definite-genitive-singular":"berbecului","dative-genitive-indefinite-plural":"berbeci","dative-definite-genitive-plural":"berbecilor","singular-vocative":"berbecule","plural-vocative":"berbecilor","alternative":"berbece"}},{"word":"Berbecar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Berbecar"}},{"word":"berbecar","pos":"noun","definitions":["ram herder"],"forms":{"plural":"berbecari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbecar","accusative-definite-nominative-singular":"berbecarul","accusative-indefinite-nominative-plural":"berbecari","accusative-definite-nominative-plural":"berbecarii","dative-genitive-indefinite-singular":"berbecar","dative-definite-genitive-singular":"berbecarului","dative-genitive-indefinite-plural":"berbecari","dative-definite-genitive-plural":"berbecarilor","singular-vocative":"berbecarule","plural-vocative":"berbecarilor"}},{"word":"berbecărie","pos":"noun","definitions":["ram enclosure"],"forms":{"plural":"berbecării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"berbecărie","accusative-definite-nominative-singular":"berbecăria","accusative-indefinite-nominative-plural":"berbecării","accusative-definite-nominative-plural":"berbecăriile","dative-genitive-indefinite-singular":"berbecării","dative-definite-genitive-singular":"berbecăriei","dative-genitive-indefinite-plural":"berbecării","dative-definite-genitive-plural":"berbecăriilor","singular-vocative":"berbecărie","plural-vocative":"berbecăriilor"}},{"word":"Berbecariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Berbecariu"}},{"word":"Berbecaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Berbecaru"}},{"word":"Berbecaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berbecaș"}},{"word":"Berbece","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berbece"}},{"word":"berbece","pos":"noun","definitions":["alternative form of berbec"],"forms":{"plural":"berbeci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbece","accusative-definite-nominative-singular":"berbeceul","accusative-indefinite-nominative-plural":"berbeci","accusative-definite-nominative-plural":"berbecii","dative-genitive-indefinite-singular":"berbece","dative-definite-genitive-singular":"berbeceului","dative-genitive-indefinite-plural":"berbeci","dative-definite-genitive-plural":"berbecilor","singular-vocative":"berbeceule","plural-vocative":"berbecilor"}},{"word":"Berbecel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berbecel"}},{"word":"berbecel","pos":"noun","definitions":["diminutive of berbec; small ram"],"forms":{"plural":"berbecei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbecel","accusative-definite-nominative-singular":"berbecelul","accusative-indefinite-nominative-plural":"berbeceli","accusative-definite-nominative-plural":"berbecelii","dative-genitive-indefinite-singular":"berbecel","dative-definite-genitive-singular":"berbecelului","dative-genitive-indefinite-plural":"berbeceli","dative-definite-genitive-plural":"berbecelilor","singular-vocative":"berbecelule","plural-vocative":"berbecelilor"}},{"word":"berbecesc","pos":"adj","definitions":["ramlike"],"forms":{"feminine-singular":"berbecească","plural":"berbecești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"berbecesc","error-unrecognized-form-feminine-indefinite-singular":"berbecească","error-unrecognized-form-indefinite-masculine-plural":"berbecești","error-unrecognized-form-feminine-indefinite-neuter-plural":"berbecești","definite-error-unrecognized-form-masculine-neuter-singular":"berbecescul","definite-error-unrecognized-form-feminine-singular":"berbeceasca","definite-error-unrecognized-form-masculine-plural":"berbeceștii","definite-error-unrecognized-form-feminine-neuter-plural":"berbeceștile"}},{"word":"berbeci","pos":"verb","definitions":["to hit, to ram"],"forms":{"canonical":"a berbeci 4th conjugation","present-singular-third-person":"berbecește","participle-past":"berbecit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a berbeci","gerund":"berbecind","first-person-indicative-present-singular":"berbecesc","indicative-present-second-person-singular":"berbecești","indicative-present-singular-third-person":"berbecește","first-person-indicative-plural-present":"berbecim","indicative-plural-present-second-person":"berbeciți","indicative-plural-present-third-person":"berbecesc","first-person-imperfect-indicative-singular":"berbeceam","imperfect-indicative-second-person-singular":"berbeceai","imperfect-indicative-singular-third-person":"berbecea","first-person-imperfect-indicative-plural":"berbeceam","imperfect-indicative-plural-second-person":"berbeceați","imperfect-indicative-plural-third-person":"berbeceau","first-person-indicative-perfect-singular":"berbecii","indicative-perfect-second-person-singular":"berbeciși","indicative-perfect-singular-third-person":"berbeci","first-person-indicative-perfect-plural":"berbecirăm","indicative-perfect-plural-second-person":"berbecirăți","indicative-perfect-plural-third-person":"berbeciră","first-person-indicative-pluperfect-singular":"berbecisem","indicative-pluperfect-second-person-singular":"berbeciseși","indicative-pluperfect-singular-third-person":"berbecise","first-person-indicative-pluperfect-plural":"berbeciserăm","indicative-pluperfect-plural-second-person":"berbeciserăți","indicative-pluperfect-plural-third-person":"berbeciseră","first-person-present-singular-subjunctive":"să berbecesc","present-second-person-singular-subjunctive":"să berbecești","present-singular-subjunctive-third-person":"să berbecească","first-person-plural-present-subjunctive":"să berbecim","plural-present-second-person-subjunctive":"să berbeciți","plural-present-subjunctive-third-person":"să berbecească","imperative-second-person-singular":"berbecește","imperative-plural-second-person":"berbeciți","imperative-negative-second-person-singular":"nu berbeci","imperative-negative-plural-second-person":"nu berbeciți"}},{"word":"Berbecuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berbecuț"}},{"word":"berbecuț","pos":"noun","definitions":["diminutive of berbec; small ram"],"forms":{"plural":"berbecuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berbecuț","accusative-definite-nominative-singular":"berbecuțul","accusative-indefinite-nominative-plural":"berbecuți","accusative-definite-nominative-plural":"berbecuții","dative-genitive-indefinite-singular":"berbecuț","dative-definite-genitive-singular":"berbecuțului","dative-genitive-indefinite-plural":"berbecuți","dative-definite-genitive-plural":"berbecuților","singular-vocative":"berbecuțule","plural-vocative":"berbecuților"}},{"word":"Berbeniciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Berbeniciuc"}},{"word":"berber","pos":"adj","definitions":["Berber"],"forms":{"feminine-singular":"berberă","masculine-plural":"berberi","feminine-neuter-plural":"berbere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"berber","error-unrecognized-form-feminine-indefinite-singular":"berberă","error-unrecognized-form-indefinite-masculine-plural":"berberi","error-unrecognized-form-feminine-indefinite-neuter-plural":"berbere","definite-error-unrecognized-form-masculine-neuter-singular":"berberul","definite-error-unrecognized-form-feminine-singular":"berbera","definite-error-unrecognized-form-masculine-plural":"berberii","definite-error-unrecognized-form-feminine-neuter-plural":"berberele"}},{"word":"berberă","pos":"noun","definitions":["female equivalent of berber","Berber language"],"forms":{"plural":"berbere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berberă","accusative-definite-nominative-singular":"berbera","accusative-indefinite-nominative-plural":"berbere","accusative-definite-nominative-plural":"berberele","dative-genitive-indefinite-singular":"berbere","dative-definite-genitive-singular":"berberei","dative-genitive-indefinite-plural":"berbere","dative-definite-genitive-plural":"berberelor","singular-vocative":"berberă","plural-vocative":"berberelor"}},{"word":"Berbescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Berbescu"}},{"word":"Berbești","pos":"name","definitions":["a village in Giulești, Maramureș County, Romania","a city in Vâlcea County, Romania","a village in Laloșu, Vâlcea County, Romania"],"gender":"m"},{"word":"berbință","pos":"noun","definitions":["alternative form of bărbânță"],"forms":{"plural":"berbințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berbință","accusative-definite-nominative-singular":"berbința","accusative-indefinite-nominative-plural":"berbințe","accusative-definite-nominative-plural":"berbințele","dative-genitive-indefinite-singular":"berbințe","dative-definite-genitive-singular":"berbinței","dative-genitive-indefinite-plural":"berbințe","dative-definite-genitive-plural":"berbințelor","singular-vocative":"berbință","plural-vocative":"berbințelor"}},{"word":"berc","pos":"noun","definitions":["grove"],"forms":{"plural":"bercuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"berc","accusative-definite-nominative-singular":"bercul","accusative-indefinite-nominative-plural":"bercuri","accusative-definite-nominative-plural":"bercurile","dative-genitive-indefinite-singular":"berc","dative-definite-genitive-singular":"bercului","dative-genitive-indefinite-plural":"bercuri","dative-definite-genitive-plural":"bercurilor","singular-vocative":"bercule","plural-vocative":"bercurilor"}},{"word":"Bercea","pos":"name","definitions":["a village in Sânmihaiu Almașului, Sălaj County, Romania"],"gender":"f"},{"word":"Berceni","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in Berceni, Ilfov County, Romania","a commune of Prahova County, Romania","a village in Berceni, Prahova County, Romania","a neighbourhood of Bucharest, Romania"],"gender":"m"},{"word":"Bercescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bercescu"}},{"word":"Bercești","pos":"name","definitions":["a village in Cozieni, Buzău County, Romania","a village in Novaci, Gorj County, Romania"],"gender":"m"},{"word":"berceuse","pos":"noun","definitions":["berceuse"],"forms":{"plural":"berceuse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"berceuse","accusative-definite-nominative-singular":"berceusea","accusative-indefinite-nominative-plural":"berceuse","accusative-definite-nominative-plural":"berceusele","dative-genitive-indefinite-singular":"berceuse","dative-definite-genitive-singular":"berceusei","dative-genitive-indefinite-plural":"berceuse","dative-definite-genitive-plural":"berceuselor","singular-vocative":"berceuse","plural-vocative":"berceuselor"}},{"word":"Berchesan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berchesan"}},{"word":"Berchez","pos":"name","definitions":["a village in Remetea Chioarului, Maramureș County, Romania"],"gender":"m"},{"word":"Berchezoaia","pos":"name","definitions":["a village in Remetea Chioarului, Maramureș County, Romania"],"gender":"f"},{"word":"Berchieșu","pos":"name","definitions":["a village in Frata, Cluj County, Romania"],"gender":"m"},{"word":"Berchiș","pos":"name","definitions":["a village in Cluj County, Romania. Renamed to Borzești in 1925."],"gender":"m"},{"word":"Berchișești","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Berchișești, Suceava County, Romania"],"gender":"m"},{"word":"Bercioiu","pos":"name","definitions":["a village in Budești, Vâlcea County, Romania"],"gender":"m"},{"word":"Bercu","pos":"name","definitions":["a village in Bretea Română, Hunedoara County, Romania","a village in Lazuri, Satu Mare County, Romania"],"gender":"m"},{"word":"Bercu Nou","pos":"name","definitions":["a village in Micula, Satu Mare County, Romania"],"gender":"m"},{"word":"Bercuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bercuț"}},{"word":"bercuț","pos":"noun","definitions":["diminutive of berc"],"forms":{"plural":"bercuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bercuț","accusative-definite-nominative-singular":"bercuțul","accusative-indefinite-nominative-plural":"bercuțuri","accusative-definite-nominative-plural":"bercuțurile","dative-genitive-indefinite-singular":"bercuț","dative-definite-genitive-singular":"bercuțului","dative-genitive-indefinite-plural":"bercuțuri","dative-definite-genitive-plural":"bercuțurilor","singular-vocative":"bercuțule","plural-vocative":"bercuțurilor"}},{"word":"Berdilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berdilă"}},{"word":"bere","pos":"noun","definitions":["beer"],"pronunciation":"/ˈbe.re/","examples":[{"ro":"Vrem trei beri, te rog.","en":"We want three beers, please."}],"forms":{"plural":"beri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bere","accusative-definite-nominative-singular":"berea","accusative-indefinite-nominative-plural":"beri","accusative-definite-nominative-plural":"berile","dative-genitive-indefinite-singular":"beri","dative-definite-genitive-singular":"berii","dative-genitive-indefinite-plural":"beri","dative-definite-genitive-plural":"berilor","singular-vocative":"bere","plural-vocative":"berilor"}},{"word":"bere","pos":"noun","definitions":["(the act of) drinking"],"pronunciation":"/ˈbe.re/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bere","accusative-definite-nominative":"berea","dative-genitive-indefinite":"beri","dative-definite-genitive":"berii","vocative":"bere"}},{"word":"bere blondă","pos":"noun","definitions":["lager"],"forms":{"plural":"beri blonde"}},{"word":"bere de ghimber","pos":"noun","definitions":["ginger beer"],"forms":{"plural":"beri de ghimber"}},{"word":"bere de ghimbir","pos":"noun","definitions":["ginger beer"],"forms":{"plural":"beri de ghimbir"}},{"word":"Berea","pos":"name","definitions":["a village in Ciumești, Satu Mare County, Romania"],"gender":"f"},{"word":"berea","pos":"noun","definitions":["definite nominative/accusative singular of bere"]},{"word":"Bereasa","pos":"name","definitions":["a village in Dănești, Vaslui County, Romania"],"gender":"f"},{"word":"berechet","pos":"noun","definitions":["abundance, galore"],"forms":{"plural":"berecheturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"berechet","accusative-definite-nominative-singular":"berechetul","accusative-indefinite-nominative-plural":"berecheturi","accusative-definite-nominative-plural":"berecheturile","dative-genitive-indefinite-singular":"berechet","dative-definite-genitive-singular":"berechetului","dative-genitive-indefinite-plural":"berecheturi","dative-definite-genitive-plural":"berecheturilor","singular-vocative":"berechetule","plural-vocative":"berecheturilor"}},{"word":"Berechiu","pos":"name","definitions":["a village in Apateu, Arad County, Romania","a village in Sânnicolau Român, Bihor County, Romania"],"gender":"m"},{"word":"Berecuța","pos":"name","definitions":["a village in Birda, Timiș County, Romania"],"gender":"f"},{"word":"beregată","pos":"noun","definitions":["throat, larynx","Adam's apple"],"pronunciation":"[bereˈɡatə]","forms":{"plural":"beregate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beregată","accusative-definite-nominative-singular":"beregata","accusative-indefinite-nominative-plural":"beregate","accusative-definite-nominative-plural":"beregatele","dative-genitive-indefinite-singular":"beregate","dative-definite-genitive-singular":"beregatei","dative-genitive-indefinite-plural":"beregate","dative-definite-genitive-plural":"beregatelor","singular-vocative":"beregată","plural-vocative":"beregatelor"}},{"word":"beregate","pos":"noun","definitions":["plural of beregată"],"pronunciation":"[bereˈɡate]","gender":"f"},{"word":"beregăți","pos":"verb","definitions":["to strangle"],"forms":{"canonical":"a beregăți 4th conjugation","present-singular-third-person":"beregățește","participle-past":"beregățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a beregăți","gerund":"beregățind","first-person-indicative-present-singular":"beregățesc","indicative-present-second-person-singular":"beregățești","indicative-present-singular-third-person":"beregățește","first-person-indicative-plural-present":"beregățim","indicative-plural-present-second-person":"beregățiți","indicative-plural-present-third-person":"beregățesc","first-person-imperfect-indicative-singular":"beregățeam","imperfect-indicative-second-person-singular":"beregățeai","imperfect-indicative-singular-third-person":"beregățea","first-person-imperfect-indicative-plural":"beregățeam","imperfect-indicative-plural-second-person":"beregățeați","imperfect-indicative-plural-third-person":"beregățeau","first-person-indicative-perfect-singular":"beregății","indicative-perfect-second-person-singular":"beregățiși","indicative-perfect-singular-third-person":"beregăți","first-person-indicative-perfect-plural":"beregățirăm","indicative-perfect-plural-second-person":"beregățirăți","indicative-perfect-plural-third-person":"beregățiră","first-person-indicative-pluperfect-singular":"beregățisem","indicative-pluperfect-second-person-singular":"beregățiseși","indicative-pluperfect-singular-third-person":"beregățise","first-person-indicative-pluperfect-plural":"beregățiserăm","indicative-pluperfect-plural-second-person":"beregățiserăți","indicative-pluperfect-plural-third-person":"beregățiseră","first-person-present-singular-subjunctive":"să beregățesc","present-second-person-singular-subjunctive":"să beregățești","present-singular-subjunctive-third-person":"să beregățească","first-person-plural-present-subjunctive":"să beregățim","plural-present-second-person-subjunctive":"să beregățiți","plural-present-subjunctive-third-person":"să beregățească","imperative-second-person-singular":"beregățește","imperative-plural-second-person":"beregățiți","imperative-negative-second-person-singular":"nu beregăți","imperative-negative-plural-second-person":"nu beregățiți"}},{"word":"beregătui","pos":"verb","definitions":["to strangle"],"forms":{"canonical":"a beregătui 4th conjugation","present-singular-third-person":"beregătuiește","participle-past":"beregătuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a beregătui","gerund":"beregătuind","first-person-indicative-present-singular":"beregătuiesc","indicative-present-second-person-singular":"beregătuiești","indicative-present-singular-third-person":"beregătuiește","first-person-indicative-plural-present":"beregătuim","indicative-plural-present-second-person":"beregătuiți","indicative-plural-present-third-person":"beregătuiesc","first-person-imperfect-indicative-singular":"beregătuiam","imperfect-indicative-second-person-singular":"beregătuiai","imperfect-indicative-singular-third-person":"beregătuia","first-person-imperfect-indicative-plural":"beregătuiam","imperfect-indicative-plural-second-person":"beregătuiați","imperfect-indicative-plural-third-person":"beregătuiau","first-person-indicative-perfect-singular":"beregătuii","indicative-perfect-second-person-singular":"beregătuiși","indicative-perfect-singular-third-person":"beregătui","first-person-indicative-perfect-plural":"beregătuirăm","indicative-perfect-plural-second-person":"beregătuirăți","indicative-perfect-plural-third-person":"beregătuiră","first-person-indicative-pluperfect-singular":"beregătuisem","indicative-pluperfect-second-person-singular":"beregătuiseși","indicative-pluperfect-singular-third-person":"beregătuise","first-person-indicative-pluperfect-plural":"beregătuiserăm","indicative-pluperfect-plural-second-person":"beregătuiserăți","indicative-pluperfect-plural-third-person":"beregătuiseră","first-person-present-singular-subjunctive":"să beregătuiesc","present-second-person-singular-subjunctive":"să beregătuiești","present-singular-subjunctive-third-person":"să beregătuiască","first-person-plural-present-subjunctive":"să beregătuim","plural-present-second-person-subjunctive":"să beregătuiți","plural-present-subjunctive-third-person":"să beregătuiască","imperative-second-person-singular":"beregătuiește","imperative-plural-second-person":"beregătuiți","imperative-negative-second-person-singular":"nu beregătui","imperative-negative-plural-second-person":"nu beregătuiți"}},{"word":"beregătuire","pos":"noun","definitions":["strangulation"],"forms":{"plural":"beregătuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"beregătuire","accusative-definite-nominative-singular":"beregătuirea","accusative-indefinite-nominative-plural":"beregătuiri","accusative-definite-nominative-plural":"beregătuirile","dative-genitive-indefinite-singular":"beregătuiri","dative-definite-genitive-singular":"beregătuirii","dative-genitive-indefinite-plural":"beregătuiri","dative-definite-genitive-plural":"beregătuirilor","singular-vocative":"beregătuire","plural-vocative":"beregătuirilor"}},{"word":"Beregheanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Beregheanu"}},{"word":"Beregsău","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega Veche"],"gender":"m"},{"word":"Beregsău Mare","pos":"name","definitions":["a village in Săcălaz, Timiș County, Romania"],"gender":"m"},{"word":"Beregsău Mic","pos":"name","definitions":["a village in Săcălaz, Timiș County, Romania"],"gender":"m"},{"word":"Berendești","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Vârciorog"],"gender":"m"},{"word":"Bereni","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Bereni, Mureș County, Romania"],"gender":"m"},{"word":"Berescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Berescu"}},{"word":"Bereșescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bereșescu"}},{"word":"Bereșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bereșteanu"}},{"word":"Berești","pos":"name","definitions":["a village in Sascut, Bacău County, Romania","a city in Galați County, Romania","a village in Hănțești, Suceava County, Romania","a village in Lăpușata, Vâlcea County, Romania"],"gender":"m"},{"word":"Berești-Bistrița","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Berești-Bistrița, Bacău County, Romania"],"gender":"f"},{"word":"Berești-Meria","pos":"name","definitions":["a commune of Galați County, Romania","a village in Berești-Meria, Galați County, Romania"],"gender":"f"},{"word":"Berești-Tazlău","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Berești-Tazlău, Bacău County, Romania"],"gender":"m"},{"word":"Bereștieanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bereștieanu"}},{"word":"beret","pos":"noun","definitions":["alternative form of beretă"],"forms":{"plural":"berete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"beret","accusative-definite-nominative-singular":"beretul","accusative-indefinite-nominative-plural":"berete","accusative-definite-nominative-plural":"beretele","dative-genitive-indefinite-singular":"beret","dative-definite-genitive-singular":"beretului","dative-genitive-indefinite-plural":"berete","dative-definite-genitive-plural":"beretelor","singular-vocative":"beretule","plural-vocative":"beretelor"}},{"word":"beretă","pos":"noun","definitions":["beret"],"forms":{"plural":"berete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beretă","accusative-definite-nominative-singular":"bereta","accusative-indefinite-nominative-plural":"berete","accusative-definite-nominative-plural":"beretele","dative-genitive-indefinite-singular":"berete","dative-definite-genitive-singular":"beretei","dative-genitive-indefinite-plural":"berete","dative-definite-genitive-plural":"beretelor","singular-vocative":"beretă","plural-vocative":"beretelor","alternative":"beret"}},{"word":"Berevoescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Berevoescu"}},{"word":"Berevoești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Berevoești, Argeș County, Romania","a village in Fieni, Dâmbovița County, Romania"],"gender":"m"},{"word":"Berezeni","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Berezeni, Vaslui County, Romania"],"gender":"m"},{"word":"Berezlogi","pos":"name","definitions":["a village in Berezlogi, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova","a village in Sirețel, Iași County, Romania"],"gender":"m"},{"word":"bereznic","pos":"noun","definitions":["forester"],"forms":{"plural":"bereznici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bereznic","accusative-definite-nominative-singular":"bereznicul","accusative-indefinite-nominative-plural":"bereznici","accusative-definite-nominative-plural":"bereznicii","dative-genitive-indefinite-singular":"bereznic","dative-definite-genitive-singular":"bereznicului","dative-genitive-indefinite-plural":"bereznici","dative-definite-genitive-plural":"bereznicilor","singular-vocative":"bereznicule","plural-vocative":"bereznicilor"}},{"word":"Berezovca","pos":"name","definitions":["a village in Calarașovca, Ocnița Raion, Moldova"],"gender":"f"},{"word":"Berezovschi","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Berezovschi"}},{"word":"berg","pos":"adj","definitions":["obsolete form of berc"],"forms":{"feminine-singular":"bergă","masculine-plural":"bergi","feminine-neuter-plural":"berge","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"berg","error-unrecognized-form-feminine-indefinite-singular":"bergă","error-unrecognized-form-indefinite-masculine-plural":"bergi","error-unrecognized-form-feminine-indefinite-neuter-plural":"berge","definite-error-unrecognized-form-masculine-neuter-singular":"bergul","definite-error-unrecognized-form-feminine-singular":"berga","definite-error-unrecognized-form-masculine-plural":"bergii","definite-error-unrecognized-form-feminine-neuter-plural":"bergele"}},{"word":"bergamot","pos":"adj","definitions":["alternative form of pergamut"],"forms":{"feminine-singular":"bergamotă","masculine-plural":"bergamoți","feminine-neuter-plural":"bergamote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bergamot","error-unrecognized-form-feminine-indefinite-singular":"bergamotă","error-unrecognized-form-indefinite-masculine-plural":"bergamoți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bergamote","definite-error-unrecognized-form-masculine-neuter-singular":"bergamotul","definite-error-unrecognized-form-feminine-singular":"bergamota","definite-error-unrecognized-form-masculine-plural":"bergamoții","definite-error-unrecognized-form-feminine-neuter-plural":"bergamotele"}},{"word":"bergamut","pos":"adj","definitions":["alternative form of pergamut"],"forms":{"feminine-singular":"bergamută","masculine-plural":"bergamuți","feminine-neuter-plural":"bergamute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bergamut","error-unrecognized-form-feminine-indefinite-singular":"bergamută","error-unrecognized-form-indefinite-masculine-plural":"bergamuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bergamute","definite-error-unrecognized-form-masculine-neuter-singular":"bergamutul","definite-error-unrecognized-form-feminine-singular":"bergamuta","definite-error-unrecognized-form-masculine-plural":"bergamuții","definite-error-unrecognized-form-feminine-neuter-plural":"bergamutele"}},{"word":"bergeretă","pos":"noun","definitions":["bergerette"],"forms":{"plural":"bergerete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bergeretă","accusative-definite-nominative-singular":"bergereta","accusative-indefinite-nominative-plural":"bergerete","accusative-definite-nominative-plural":"bergeretele","dative-genitive-indefinite-singular":"bergerete","dative-definite-genitive-singular":"bergeretei","dative-genitive-indefinite-plural":"bergerete","dative-definite-genitive-plural":"bergeretelor","singular-vocative":"bergeretă","plural-vocative":"bergeretelor"}},{"word":"Berghin","pos":"name","definitions":["a commune of Alba County, Romania","a village in Berghin, Alba County, Romania"],"gender":"m"},{"word":"bergsonian","pos":"adj","definitions":["Bergsonian"],"forms":{"feminine-singular":"bergsoniană","masculine-plural":"bergsonieni","feminine-neuter-plural":"bergsoniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bergsonian","error-unrecognized-form-feminine-indefinite-singular":"bergsoniană","error-unrecognized-form-indefinite-masculine-plural":"bergsonieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bergsoniene","definite-error-unrecognized-form-masculine-neuter-singular":"bergsonianul","definite-error-unrecognized-form-feminine-singular":"bergsoniana","definite-error-unrecognized-form-masculine-plural":"bergsonienii","definite-error-unrecognized-form-feminine-neuter-plural":"bergsonienele"}},{"word":"bergsonism","pos":"noun","definitions":["Bergsonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bergsonism","accusative-definite-nominative":"bergsonismul","dative-genitive-indefinite":"bergsonism","dative-definite-genitive":"bergsonismului","vocative":"bergsonismule"}},{"word":"beri","pos":"noun","definitions":["plural of bere"],"pronunciation":"[berʲ]","gender":"f-p"},{"word":"beri-beri","pos":"noun","definitions":["beriberi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"beri-beri","accusative-definite-nominative":"beri-beriul","dative-genitive-indefinite":"beri-beri","dative-definite-genitive":"beri-beriului","vocative":"beri-beriule"}},{"word":"Beria de Jos","pos":"name","definitions":["a village in Oporelu, Olt County, Romania"],"gender":"f"},{"word":"Beria de Sus","pos":"name","definitions":["a village in Oporelu, Olt County, Romania"],"gender":"f"},{"word":"Berian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berian"}},{"word":"beril","pos":"noun","definitions":["beryl"],"forms":{"plural":"beriluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"beril","accusative-definite-nominative-singular":"berilul","accusative-indefinite-nominative-plural":"beriluri","accusative-definite-nominative-plural":"berilurile","dative-genitive-indefinite-singular":"beril","dative-definite-genitive-singular":"berilului","dative-genitive-indefinite-plural":"beriluri","dative-definite-genitive-plural":"berilurilor","singular-vocative":"berilule","plural-vocative":"berilurilor"}},{"word":"beriliu","pos":"noun","definitions":["beryllium (chemical element)"],"pronunciation":"/beˈriliw/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"beriliu","accusative-definite-nominative":"beriliul","dative-genitive-indefinite":"beriliu","dative-definite-genitive":"beriliului","vocative":"beriliule"}},{"word":"Berindan","pos":"name","definitions":["a village in Odoreu, Satu Mare County, Romania"],"gender":"m"},{"word":"Berindei","pos":"name","definitions":["a village in Dăneasa, Olt County, Romania"],"gender":"m"},{"word":"Berindei","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berindei"}},{"word":"Berindești","pos":"name","definitions":["a village in Corbeni, Argeș County, Romania"],"gender":"m"},{"word":"Berindia","pos":"name","definitions":["a village in Buteni, Arad County, Romania"],"gender":"f"},{"word":"Berini","pos":"name","definitions":["a village in Sacoșu Turcesc, Timiș County, Romania"],"gender":"m"},{"word":"Beriozchi","pos":"name","definitions":["a village in Anenii Noi, Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"Berislăvești","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Berislăvești, Vâlcea County, Romania"],"gender":"m"},{"word":"Berișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berișteanu"}},{"word":"Berivoaia","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Dâmbovnic"],"gender":"f"},{"word":"Berivoi","pos":"name","definitions":["a surname","a river in Brașov County, Romania, tributary to the Racovița","a village in Recea, Brașov County, Romania"],"gender":"m"},{"word":"berjeră","pos":"noun","definitions":["wing chair"],"forms":{"plural":"berjere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berjeră","accusative-definite-nominative-singular":"berjera","accusative-indefinite-nominative-plural":"berjere","accusative-definite-nominative-plural":"berjerele","dative-genitive-indefinite-singular":"berjere","dative-definite-genitive-singular":"berjerei","dative-genitive-indefinite-plural":"berjere","dative-definite-genitive-plural":"berjerelor","singular-vocative":"berjeră","plural-vocative":"berjerelor"}},{"word":"berkeleism","pos":"noun","definitions":["Berkeleianism"],"forms":{"plural":"berkeleisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"berkeleism","accusative-definite-nominative-singular":"berkeleismul","accusative-indefinite-nominative-plural":"berkeleisme","accusative-definite-nominative-plural":"berkeleismele","dative-genitive-indefinite-singular":"berkeleism","dative-definite-genitive-singular":"berkeleismului","dative-genitive-indefinite-plural":"berkeleisme","dative-definite-genitive-plural":"berkeleismelor","singular-vocative":"berkeleismule","plural-vocative":"berkeleismelor"}},{"word":"berkeliu","pos":"noun","definitions":["berkelium (transuranic chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"berkeliu","accusative-definite-nominative":"berkeliul","dative-genitive-indefinite":"berkeliu","dative-definite-genitive":"berkeliului","vocative":"berkeliule"}},{"word":"berleș","pos":"noun","definitions":["lining"],"forms":{"plural":"berleșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"berleș","accusative-definite-nominative-singular":"berleșul","accusative-indefinite-nominative-plural":"berleșuri","accusative-definite-nominative-plural":"berleșurile","dative-genitive-indefinite-singular":"berleș","dative-definite-genitive-singular":"berleșului","dative-genitive-indefinite-plural":"berleșuri","dative-definite-genitive-plural":"berleșurilor","singular-vocative":"berleșule","plural-vocative":"berleșurilor"}},{"word":"Berlescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Berlescu"}},{"word":"Berlești","pos":"name","definitions":["a village in Ianca, Brăila County, Romania","a commune of Gorj County, Romania","a village in Berlești, Gorj County, Romania"],"gender":"m"},{"word":"Berlin","pos":"name","definitions":["Berlin (the capital and largest city of Germany)","Berlin (a state of Germany, containing the capital city)"],"pronunciation":"/ber.ˈlin/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative":"Berlin","accusative-definite-nominative":"Berlinul","dative-genitive-indefinite":"Berlin","dative-definite-genitive":"Berlinului","vocative":"Berlinule"}},{"word":"berlină","pos":"noun","definitions":["berline"],"forms":{"plural":"berline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berlină","accusative-definite-nominative-singular":"berlina","accusative-indefinite-nominative-plural":"berline","accusative-definite-nominative-plural":"berlinele","dative-genitive-indefinite-singular":"berline","dative-definite-genitive-singular":"berlinei","dative-genitive-indefinite-plural":"berline","dative-definite-genitive-plural":"berlinelor","singular-vocative":"berlină","plural-vocative":"berlinelor"}},{"word":"berlinez","pos":"adj","definitions":["Berliner"],"forms":{"feminine-singular":"berlineză","masculine-plural":"berlinezi","feminine-neuter-plural":"berlineze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"berlinez","error-unrecognized-form-feminine-indefinite-singular":"berlineză","error-unrecognized-form-indefinite-masculine-plural":"berlinezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"berlineze","definite-error-unrecognized-form-masculine-neuter-singular":"berlinezul","definite-error-unrecognized-form-feminine-singular":"berlineza","definite-error-unrecognized-form-masculine-plural":"berlinezii","definite-error-unrecognized-form-feminine-neuter-plural":"berlinezele"}},{"word":"berlinez","pos":"noun","definitions":["Berliner"],"forms":{"plural":"berlinezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"berlinez","accusative-definite-nominative-singular":"berlinezul","accusative-indefinite-nominative-plural":"berlinezi","accusative-definite-nominative-plural":"berlinezii","dative-genitive-indefinite-singular":"berlinez","dative-definite-genitive-singular":"berlinezului","dative-genitive-indefinite-plural":"berlinezi","dative-definite-genitive-plural":"berlinezilor","singular-vocative":"berlinezule","plural-vocative":"berlinezilor"}},{"word":"berlineză","pos":"noun","definitions":["female equivalent of berlinez"],"forms":{"plural":"berlineze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"berlineză","accusative-definite-nominative-singular":"berlineza","accusative-indefinite-nominative-plural":"berlineze","accusative-definite-nominative-plural":"berlinezele","dative-genitive-indefinite-singular":"berlineze","dative-definite-genitive-singular":"berlinezei","dative-genitive-indefinite-plural":"berlineze","dative-definite-genitive-plural":"berlinezelor","singular-vocative":"berlineză","plural-vocative":"berlinezelor"}},{"word":"Berliște","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Berliște, Caraș-Severin County, Romania"],"gender":"m"},{"word":"bermă","pos":"noun","definitions":["berm"],"forms":{"plural":"berme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bermă","accusative-definite-nominative-singular":"berma","accusative-indefinite-nominative-plural":"berme","accusative-definite-nominative-plural":"bermele","dative-genitive-indefinite-singular":"berme","dative-definite-genitive-singular":"bermei","dative-genitive-indefinite-plural":"berme","dative-definite-genitive-plural":"bermelor","singular-vocative":"bermă","plural-vocative":"bermelor"}},{"word":"bermudă","pos":"noun","definitions":["Bermuda shorts"],"forms":{"plural":"bermude","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bermudă","accusative-definite-nominative-singular":"bermuda","accusative-indefinite-nominative-plural":"bermude","accusative-definite-nominative-plural":"bermudele","dative-genitive-indefinite-singular":"bermude","dative-definite-genitive-singular":"bermudei","dative-genitive-indefinite-plural":"bermude","dative-definite-genitive-plural":"bermudelor","singular-vocative":"bermudă","plural-vocative":"bermudelor"}},{"word":"Bernadea","pos":"name","definitions":["a village in Bahnea, Mureș County, Romania"],"gender":"f"},{"word":"bernardin","pos":"noun","definitions":["Bernardine (monk)"],"forms":{"plural":"bernardini","feminine":"equivalent bernardină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bernardin","accusative-definite-nominative-singular":"bernardinul","accusative-indefinite-nominative-plural":"bernardini","accusative-definite-nominative-plural":"bernardinii","dative-genitive-indefinite-singular":"bernardin","dative-definite-genitive-singular":"bernardinului","dative-genitive-indefinite-plural":"bernardini","dative-definite-genitive-plural":"bernardinilor","singular-vocative":"bernardinule","plural-vocative":"bernardinilor"}},{"word":"bernardină","pos":"noun","definitions":["female equivalent of bernardin"],"forms":{"plural":"bernardine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bernardină","accusative-definite-nominative-singular":"bernardina","accusative-indefinite-nominative-plural":"bernardine","accusative-definite-nominative-plural":"bernardinele","dative-genitive-indefinite-singular":"bernardine","dative-definite-genitive-singular":"bernardinei","dative-genitive-indefinite-plural":"bernardine","dative-definite-genitive-plural":"bernardinelor","singular-vocative":"bernardină","plural-vocative":"bernardinelor"}},{"word":"Berneanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Berneanu"}},{"word":"Bernescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bernescu"}},{"word":"bernevici","pos":"noun","definitions":["alternative form of berneveci"],"forms":{"plural":"bernevici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bernevici","accusative-definite-nominative-singular":"berneviciul","accusative-indefinite-nominative-plural":"bernevici","accusative-definite-nominative-plural":"bernevicii","dative-genitive-indefinite-singular":"bernevici","dative-definite-genitive-singular":"berneviciului","dative-genitive-indefinite-plural":"bernevici","dative-definite-genitive-plural":"bernevicilor","singular-vocative":"berneviciule","plural-vocative":"bernevicilor"}},{"word":"bernivici","pos":"noun","definitions":["alternative form of berneveci"],"forms":{"plural":"bernivici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bernivici","accusative-definite-nominative-singular":"berniviciul","accusative-indefinite-nominative-plural":"bernivici","accusative-definite-nominative-plural":"bernivicii","dative-genitive-indefinite-singular":"bernivici","dative-definite-genitive-singular":"berniviciului","dative-genitive-indefinite-plural":"bernivici","dative-definite-genitive-plural":"bernivicilor","singular-vocative":"berniviciule","plural-vocative":"bernivicilor"}},{"word":"bernsteinian","pos":"adj","definitions":["Bernsteinian"],"forms":{"feminine-singular":"bernsteiniană","masculine-plural":"bernsteinieni","feminine-neuter-plural":"bernsteiniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bernsteinian","error-unrecognized-form-feminine-indefinite-singular":"bernsteiniană","error-unrecognized-form-indefinite-masculine-plural":"bernsteinieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bernsteiniene","definite-error-unrecognized-form-masculine-neuter-singular":"bernsteinianul","definite-error-unrecognized-form-feminine-singular":"bernsteiniana","definite-error-unrecognized-form-masculine-plural":"bernsteinienii","definite-error-unrecognized-form-feminine-neuter-plural":"bernsteinienele"}},{"word":"bernsteinian","pos":"noun","definitions":["Bernsteinian"],"forms":{"plural":"bernsteinieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bernsteinian","accusative-definite-nominative-singular":"bernsteinianul","accusative-indefinite-nominative-plural":"bernsteinieni","accusative-definite-nominative-plural":"bernsteinienii","dative-genitive-indefinite-singular":"bernsteinian","dative-definite-genitive-singular":"bernsteinianului","dative-genitive-indefinite-plural":"bernsteinieni","dative-definite-genitive-plural":"bernsteinienilor","singular-vocative":"bernsteinianule","plural-vocative":"bernsteinienilor"}},{"word":"bernsteiniană","pos":"noun","definitions":["female equivalent of bernsteinian"],"forms":{"plural":"bernsteiniane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bernsteiniană","accusative-definite-nominative-singular":"bernsteiniana","accusative-indefinite-nominative-plural":"bernsteiniane","accusative-definite-nominative-plural":"bernsteinianele","dative-genitive-indefinite-singular":"bernsteiniane","dative-definite-genitive-singular":"bernsteinianei","dative-genitive-indefinite-plural":"bernsteiniane","dative-definite-genitive-plural":"bernsteinianelor","singular-vocative":"bernsteiniană","plural-vocative":"bernsteinianelor"}},{"word":"bernsteinist","pos":"adj","definitions":["Bernsteinian"],"forms":{"feminine-singular":"bernsteinistă","masculine-plural":"bernsteiniști","feminine-neuter-plural":"bernsteiniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bernsteinist","error-unrecognized-form-feminine-indefinite-singular":"bernsteinistă","error-unrecognized-form-indefinite-masculine-plural":"bernsteiniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"bernsteiniste","definite-error-unrecognized-form-masculine-neuter-singular":"bernsteinistul","definite-error-unrecognized-form-feminine-singular":"bernsteinista","definite-error-unrecognized-form-masculine-plural":"bernsteiniștii","definite-error-unrecognized-form-feminine-neuter-plural":"bernsteinistele"}},{"word":"bernsteinist","pos":"noun","definitions":["Bernsteinian"],"forms":{"plural":"bernsteiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bernsteinist","accusative-definite-nominative-singular":"bernsteinistul","accusative-indefinite-nominative-plural":"bernsteiniști","accusative-definite-nominative-plural":"bernsteiniștii","dative-genitive-indefinite-singular":"bernsteinist","dative-definite-genitive-singular":"bernsteinistului","dative-genitive-indefinite-plural":"bernsteiniști","dative-definite-genitive-plural":"bernsteiniștilor","singular-vocative":"bernsteinistule","plural-vocative":"bernsteiniștilor"}},{"word":"bernsteinistă","pos":"noun","definitions":["female equivalent of bernsteinist"],"forms":{"plural":"bernsteiniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bernsteinistă","accusative-definite-nominative-singular":"bernsteinista","accusative-indefinite-nominative-plural":"bernsteiniste","accusative-definite-nominative-plural":"bernsteinistele","dative-genitive-indefinite-singular":"bernsteiniste","dative-definite-genitive-singular":"bernsteinistei","dative-genitive-indefinite-plural":"bernsteiniste","dative-definite-genitive-plural":"bernsteinistelor","singular-vocative":"bernsteinistă","plural-vocative":"bernsteinistelor"}},{"word":"bersalier","pos":"noun","definitions":["bersagliere"],"forms":{"plural":"bersalieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bersalier","accusative-definite-nominative-singular":"bersalierul","accusative-indefinite-nominative-plural":"bersalieri","accusative-definite-nominative-plural":"bersalierii","dative-genitive-indefinite-singular":"bersalier","dative-definite-genitive-singular":"bersalierului","dative-genitive-indefinite-plural":"bersalieri","dative-definite-genitive-plural":"bersalierilor","singular-vocative":"bersalierule","plural-vocative":"bersalierilor"}},{"word":"bersalieri","pos":"noun","definitions":["plural of bersalier"]},{"word":"Bertalan","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Bertalan"}},{"word":"Bertea","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Vărbilău","a commune of Prahova County, Romania","a village in Bertea, Prahova County, Romania","a surname"],"gender":"f"},{"word":"Bertescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bertescu"}},{"word":"Berteșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berteșteanu"}},{"word":"Berteștii de Jos","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Berteștii de Jos, Brăila County, Romania"],"gender":"m"},{"word":"Berteștii de Sus","pos":"name","definitions":["a village in Berteștii de Jos, Brăila County, Romania"],"gender":"m"},{"word":"bertilonaj","pos":"noun","definitions":["bertillonage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bertilonaj","accusative-definite-nominative":"bertilonajul","dative-genitive-indefinite":"bertilonaj","dative-definite-genitive":"bertilonajului","vocative":"bertilonajule"}},{"word":"berton","pos":"noun","definitions":["foldboat"],"forms":{"plural":"bertoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"berton","accusative-definite-nominative-singular":"bertonul","accusative-indefinite-nominative-plural":"bertoane","accusative-definite-nominative-plural":"bertoanele","dative-genitive-indefinite-singular":"berton","dative-definite-genitive-singular":"bertonului","dative-genitive-indefinite-plural":"bertoane","dative-definite-genitive-plural":"bertoanelor","singular-vocative":"bertonule","plural-vocative":"bertoanelor"}},{"word":"Berveni","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Berveni, Satu Mare County, Romania"],"gender":"m"},{"word":"Berza Veche","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Prut"],"gender":"f"},{"word":"Berzan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berzan"}},{"word":"Berzasca","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Danube","a commune of Caraș-Severin County, Romania","a village in Berzasca, Caraș-Severin County, Romania"],"gender":"f"},{"word":"berze","pos":"noun","definitions":["plural of barză"]},{"word":"berze-albe","pos":"noun","definitions":["plural of barză-albă"],"gender":"f"},{"word":"berze-negre","pos":"noun","definitions":["plural of barză-neagră"],"gender":"f"},{"word":"Berzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Berzescu"}},{"word":"Berzovia","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Berzovia, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Berzunțanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berzunțanu"}},{"word":"Berzunțeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Berzunțeanu"}},{"word":"Berzunțiul Negru","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Moreni"],"gender":"m"},{"word":"Beșa","pos":"name","definitions":["a village in Mureș County, Romania. Renamed to Stejărenii in 1960."],"gender":"m"},{"word":"besactea","pos":"noun","definitions":["a small box"],"forms":{"plural":"besactele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"besactea","accusative-definite-nominative-singular":"besacteaua","accusative-indefinite-nominative-plural":"besactele","accusative-definite-nominative-plural":"besactelele","dative-genitive-indefinite-singular":"besactele","dative-definite-genitive-singular":"besactelei","dative-genitive-indefinite-plural":"besactele","dative-definite-genitive-plural":"besactelelor","singular-vocative":"besactea","plural-vocative":"besactelelor"}},{"word":"besăcteluță","pos":"noun","definitions":["diminutive of besactea"],"forms":{"plural":"besăcteluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"besăcteluță","accusative-definite-nominative-singular":"besăcteluța","accusative-indefinite-nominative-plural":"besăcteluțe","accusative-definite-nominative-plural":"besăcteluțele","dative-genitive-indefinite-singular":"besăcteluțe","dative-definite-genitive-singular":"besăcteluței","dative-genitive-indefinite-plural":"besăcteluțe","dative-definite-genitive-plural":"besăcteluțelor","singular-vocative":"besăcteluță","plural-vocative":"besăcteluțelor"}},{"word":"beșăl","pos":"noun","definitions":["rest, repose"],"forms":{"plural":"beșaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"beșăl","accusative-definite-nominative-singular":"beșălul","accusative-indefinite-nominative-plural":"beșaie","accusative-definite-nominative-plural":"beșaiele","dative-genitive-indefinite-singular":"beșăl","dative-definite-genitive-singular":"beșălului","dative-genitive-indefinite-plural":"beșaie","dative-definite-genitive-plural":"beșaielor","singular-vocative":"beșălule","plural-vocative":"beșaielor"}},{"word":"Beșalma","pos":"name","definitions":["a village in Beșalma, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"f"},{"word":"beșamel","pos":"noun","definitions":["béchamel sauce"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"beșamel","accusative-definite-nominative":"beșamelul","dative-genitive-indefinite":"beșamel","dative-definite-genitive":"beșamelului","vocative":"beșamelule"}},{"word":"Beșaul","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Conacu."],"gender":"m"},{"word":"beschie","pos":"noun","definitions":["kind of large saw used in cutting wood and boards"],"forms":{"plural":"beschii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"beschie","accusative-definite-nominative-singular":"beschia","accusative-indefinite-nominative-plural":"beschii","accusative-definite-nominative-plural":"beschiile","dative-genitive-indefinite-singular":"beschii","dative-definite-genitive-singular":"beschiei","dative-genitive-indefinite-plural":"beschii","dative-definite-genitive-plural":"beschiilor","singular-vocative":"beschie","plural-vocative":"beschiilor"}},{"word":"beseadă","pos":"noun","definitions":["chat, conversation"],"forms":{"plural":"beseade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beseadă","accusative-definite-nominative-singular":"beseada","accusative-indefinite-nominative-plural":"beseade","accusative-definite-nominative-plural":"beseadele","dative-genitive-indefinite-singular":"beseade","dative-definite-genitive-singular":"beseadei","dative-genitive-indefinite-plural":"beseade","dative-definite-genitive-plural":"beseadelor","singular-vocative":"beseadă","plural-vocative":"beseadelor","alternative":"băsadă"}},{"word":"besectea","pos":"noun","definitions":["alternative form of besactea"],"forms":{"plural":"besectele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"besectea","accusative-definite-nominative-singular":"besecteaua","accusative-indefinite-nominative-plural":"besectele","accusative-definite-nominative-plural":"besectelele","dative-genitive-indefinite-singular":"besectele","dative-definite-genitive-singular":"besectelei","dative-genitive-indefinite-plural":"besectele","dative-definite-genitive-plural":"besectelelor","singular-vocative":"besectea","plural-vocative":"besectelelor"}},{"word":"Beșeneu","pos":"name","definitions":["a village in Covasna County, Romania. Renamed to Pădureni in 1964."],"gender":"m"},{"word":"beserecă","pos":"noun","definitions":["obsolete form of biserică"],"forms":{"plural":"besereci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"beserecă","accusative-definite-nominative-singular":"besereca","accusative-indefinite-nominative-plural":"besereci","accusative-definite-nominative-plural":"beserecile","dative-genitive-indefinite-singular":"besereci","dative-definite-genitive-singular":"beserecii","dative-genitive-indefinite-plural":"besereci","dative-definite-genitive-plural":"beserecilor","singular-vocative":"beserecă","plural-vocative":"beserecilor"}},{"word":"Beșghioz","pos":"name","definitions":["a village in Beșghioz, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"m"},{"word":"beșica","pos":"verb","definitions":["alternative form of bășica"],"forms":{"canonical":"a beșica 1st conjugation","present-singular-third-person":"beșică","participle-past":"beșicat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a beșica","gerund":"beșicând","first-person-indicative-present-singular":"beșic","indicative-present-second-person-singular":"beșici","indicative-present-singular-third-person":"beșică","first-person-indicative-plural-present":"beșicăm","indicative-plural-present-second-person":"beșicați","indicative-plural-present-third-person":"beșică","first-person-imperfect-indicative-singular":"beșicam","imperfect-indicative-second-person-singular":"beșicai","imperfect-indicative-singular-third-person":"beșica","first-person-imperfect-indicative-plural":"beșicam","imperfect-indicative-plural-second-person":"beșicați","imperfect-indicative-plural-third-person":"beșicau","first-person-indicative-perfect-singular":"beșicai","indicative-perfect-second-person-singular":"beșicași","indicative-perfect-singular-third-person":"beșică","first-person-indicative-perfect-plural":"beșicarăm","indicative-perfect-plural-second-person":"beșicarăți","indicative-perfect-plural-third-person":"beșicară","first-person-indicative-pluperfect-singular":"beșicasem","indicative-pluperfect-second-person-singular":"beșicaseși","indicative-pluperfect-singular-third-person":"beșicase","first-person-indicative-pluperfect-plural":"beșicaserăm","indicative-pluperfect-plural-second-person":"beșicaserăți","indicative-pluperfect-plural-third-person":"beșicaseră","first-person-present-singular-subjunctive":"să beșic","present-second-person-singular-subjunctive":"să beșici","present-singular-subjunctive-third-person":"să beșice","first-person-plural-present-subjunctive":"să beșicăm","plural-present-second-person-subjunctive":"să beșicați","plural-present-subjunctive-third-person":"să beșice","imperative-second-person-singular":"beșică","imperative-plural-second-person":"beșicați","imperative-negative-second-person-singular":"nu beșica","imperative-negative-plural-second-person":"nu beșicați"}},{"word":"Beșică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beșică"}},{"word":"beșică","pos":"noun","definitions":["alternative form of bășică"],"forms":{"plural":"beșici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"beșică","accusative-definite-nominative-singular":"beșica","accusative-indefinite-nominative-plural":"beșici","accusative-definite-nominative-plural":"beșicile","dative-genitive-indefinite-singular":"beșici","dative-definite-genitive-singular":"beșicii","dative-genitive-indefinite-plural":"beșici","dative-definite-genitive-plural":"beșicilor","singular-vocative":"beșică","plural-vocative":"beșicilor"}},{"word":"beșicare","pos":"noun","definitions":["alternative form of bășicare"],"forms":{"plural":"beșicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"beșicare","accusative-definite-nominative-singular":"beșicarea","accusative-indefinite-nominative-plural":"beșicări","accusative-definite-nominative-plural":"beșicările","dative-genitive-indefinite-singular":"beșicări","dative-definite-genitive-singular":"beșicării","dative-genitive-indefinite-plural":"beșicări","dative-definite-genitive-plural":"beșicărilor","singular-vocative":"beșicare","plural-vocative":"beșicărilor"}},{"word":"beșicat","pos":"adj","definitions":["alternative form of bășicat"],"forms":{"feminine-singular":"beșicată","masculine-plural":"beșicați","feminine-neuter-plural":"beșicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beșicat","error-unrecognized-form-feminine-indefinite-singular":"beșicată","error-unrecognized-form-indefinite-masculine-plural":"beșicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"beșicate","definite-error-unrecognized-form-masculine-neuter-singular":"beșicatul","definite-error-unrecognized-form-feminine-singular":"beșicata","definite-error-unrecognized-form-masculine-plural":"beșicații","definite-error-unrecognized-form-feminine-neuter-plural":"beșicatele"}},{"word":"beșicos","pos":"adj","definitions":["alternative form of bășicos"],"forms":{"feminine-singular":"beșicoasă","masculine-plural":"beșicoși","feminine-neuter-plural":"beșicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beșicos","error-unrecognized-form-feminine-indefinite-singular":"beșicoasă","error-unrecognized-form-indefinite-masculine-plural":"beșicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"beșicoase","definite-error-unrecognized-form-masculine-neuter-singular":"beșicosul","definite-error-unrecognized-form-feminine-singular":"beșicoasa","definite-error-unrecognized-form-masculine-plural":"beșicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"beșicoasele"}},{"word":"beșicuță","pos":"noun","definitions":["alternative form of bășicuță"],"forms":{"plural":"beșicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beșicuță","accusative-definite-nominative-singular":"beșicuța","accusative-indefinite-nominative-plural":"beșicuțe","accusative-definite-nominative-plural":"beșicuțele","dative-genitive-indefinite-singular":"beșicuțe","dative-definite-genitive-singular":"beșicuței","dative-genitive-indefinite-plural":"beșicuțe","dative-definite-genitive-plural":"beșicuțelor","singular-vocative":"beșicuță","plural-vocative":"beșicuțelor"}},{"word":"Beșimbac","pos":"name","definitions":["a village in Viștea, Brașov County, Romania. Renamed to Olteț in 1928."],"gender":"m"},{"word":"Beșinău","pos":"name","definitions":["a village in Ohaba, Alba County, Romania. Renamed to Secășel."],"gender":"m"},{"word":"Beșineu","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Heidendorf in 1925 and later Viișoara in 1950."],"gender":"m"},{"word":"Beșleaga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beșleaga"}},{"word":"Beșleagă","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Beșleagă"}},{"word":"beșleagă","pos":"noun","definitions":["Ottoman cavalry captain"],"forms":{"plural":"beșlegi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beșleagă","accusative-definite-nominative-singular":"beșleagăul","accusative-indefinite-nominative-plural":"beșlegi","accusative-definite-nominative-plural":"beșlegii","dative-genitive-indefinite-singular":"beșleagă","dative-definite-genitive-singular":"beșleagăului","dative-genitive-indefinite-plural":"beșlegi","dative-definite-genitive-plural":"beșlegilor","singular-vocative":"beșleagăule","plural-vocative":"beșlegilor"}},{"word":"beșli-aga","pos":"noun","definitions":["alternative form of beșleagă"],"forms":{"plural":"beșli-agale","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beșli-aga","accusative-definite-nominative-singular":"beșli-agaul","accusative-indefinite-nominative-plural":"beșli-agale","accusative-definite-nominative-plural":"beșli-agalei","dative-genitive-indefinite-singular":"beșli-aga","dative-definite-genitive-singular":"beșli-agaului","dative-genitive-indefinite-plural":"beșli-agale","dative-definite-genitive-plural":"beșli-agalelor","singular-vocative":"beșli-agaule","plural-vocative":"beșli-agalelor"}},{"word":"beșlic","pos":"noun","definitions":["five-para coin"],"forms":{"plural":"beșlici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beșlic","accusative-definite-nominative-singular":"beșlicul","accusative-indefinite-nominative-plural":"beșlici","accusative-definite-nominative-plural":"beșlicii","dative-genitive-indefinite-singular":"beșlic","dative-definite-genitive-singular":"beșlicului","dative-genitive-indefinite-plural":"beșlici","dative-definite-genitive-plural":"beșlicilor","singular-vocative":"beșlicule","plural-vocative":"beșlicilor"}},{"word":"Beșlii","pos":"name","definitions":["a village in Mânzălești, Buzău County, Romania"],"gender":"m"},{"word":"Beșliu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Beșliu"}},{"word":"beșliu","pos":"noun","definitions":["Ottoman cavalry soldier"],"forms":{"plural":"beșlii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"beșliu","accusative-definite-nominative-singular":"beșliul","accusative-indefinite-nominative-plural":"beșlii","accusative-definite-nominative-plural":"beșliii","dative-genitive-indefinite-singular":"beșliu","dative-definite-genitive-singular":"beșliului","dative-genitive-indefinite-plural":"beșlii","dative-definite-genitive-plural":"beșliilor","singular-vocative":"beșliule","plural-vocative":"beșliilor"}},{"word":"besmetic","pos":"adj","definitions":["obsolete form of bezmetic"],"forms":{"feminine-singular":"besmetică","masculine-plural":"besmetici","feminine-neuter-plural":"besmetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"besmetic","error-unrecognized-form-feminine-indefinite-singular":"besmetică","error-unrecognized-form-indefinite-masculine-plural":"besmetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"besmetice","definite-error-unrecognized-form-masculine-neuter-singular":"besmeticul","definite-error-unrecognized-form-feminine-singular":"besmetica","definite-error-unrecognized-form-masculine-plural":"besmeticii","definite-error-unrecognized-form-feminine-neuter-plural":"besmeticele"}},{"word":"best-seller","pos":"noun","definitions":["bestseller"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"best-seller","accusative-definite-nominative":"best-sellerul","dative-genitive-indefinite":"best-seller","dative-definite-genitive":"best-sellerului","vocative":"best-sellerule"}},{"word":"Beștamac","pos":"name","definitions":["a village in Beștemac, Leova Raion, Moldova","a commune of Leova Raion, Moldova"],"gender":"m"},{"word":"beștea","pos":"noun","definitions":["a blister, sore, or pustule on the tongue"],"forms":{"plural":"beștele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"beștea","accusative-definite-nominative-singular":"beșteaua","accusative-indefinite-nominative-plural":"beștele","accusative-definite-nominative-plural":"beștelele","dative-genitive-indefinite-singular":"beștele","dative-definite-genitive-singular":"beștelei","dative-genitive-indefinite-plural":"beștele","dative-definite-genitive-plural":"beștelelor","singular-vocative":"beștea","plural-vocative":"beștelelor"}},{"word":"beșteleală","pos":"noun","definitions":["scolding"],"forms":{"plural":"beșteleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beșteleală","accusative-definite-nominative-singular":"beșteleala","accusative-indefinite-nominative-plural":"beștelele","accusative-definite-nominative-plural":"beștelelele","dative-genitive-indefinite-singular":"beștelele","dative-definite-genitive-singular":"beștelelei","dative-genitive-indefinite-plural":"beștelele","dative-definite-genitive-plural":"beștelelelor","singular-vocative":"beșteleală","plural-vocative":"beștelelelor"}},{"word":"beșteli","pos":"verb","definitions":["to scold"],"forms":{"canonical":"a beșteli 4th conjugation","present-singular-third-person":"beștelește","participle-past":"beștelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a beșteli","gerund":"beștelind","first-person-indicative-present-singular":"beștelesc","indicative-present-second-person-singular":"beștelești","indicative-present-singular-third-person":"beștelește","first-person-indicative-plural-present":"beștelim","indicative-plural-present-second-person":"beșteliți","indicative-plural-present-third-person":"beștelesc","first-person-imperfect-indicative-singular":"beșteleam","imperfect-indicative-second-person-singular":"beșteleai","imperfect-indicative-singular-third-person":"beștelea","first-person-imperfect-indicative-plural":"beșteleam","imperfect-indicative-plural-second-person":"beșteleați","imperfect-indicative-plural-third-person":"beșteleau","first-person-indicative-perfect-singular":"beștelii","indicative-perfect-second-person-singular":"beșteliși","indicative-perfect-singular-third-person":"beșteli","first-person-indicative-perfect-plural":"beștelirăm","indicative-perfect-plural-second-person":"beștelirăți","indicative-perfect-plural-third-person":"beșteliră","first-person-indicative-pluperfect-singular":"beștelisem","indicative-pluperfect-second-person-singular":"beșteliseși","indicative-pluperfect-singular-third-person":"beștelise","first-person-indicative-pluperfect-plural":"beșteliserăm","indicative-pluperfect-plural-second-person":"beșteliserăți","indicative-pluperfect-plural-third-person":"beșteliseră","first-person-present-singular-subjunctive":"să beștelesc","present-second-person-singular-subjunctive":"să beștelești","present-singular-subjunctive-third-person":"să beștelească","first-person-plural-present-subjunctive":"să beștelim","plural-present-second-person-subjunctive":"să beșteliți","plural-present-subjunctive-third-person":"să beștelească","imperative-second-person-singular":"beștelește","imperative-plural-second-person":"beșteliți","imperative-negative-second-person-singular":"nu beșteli","imperative-negative-plural-second-person":"nu beșteliți"}},{"word":"beștelire","pos":"noun","definitions":["rebuke"],"forms":{"plural":"beșteliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"beștelire","accusative-definite-nominative-singular":"beștelirea","accusative-indefinite-nominative-plural":"beșteliri","accusative-definite-nominative-plural":"beștelirile","dative-genitive-indefinite-singular":"beșteliri","dative-definite-genitive-singular":"beștelirii","dative-genitive-indefinite-plural":"beșteliri","dative-definite-genitive-plural":"beștelirilor","singular-vocative":"beștelire","plural-vocative":"beștelirilor"}},{"word":"Beștemac","pos":"name","definitions":["a village in Beștemac, Leova Raion, Moldova","a commune of Leova Raion, Moldova"],"gender":"m"},{"word":"Beștepe","pos":"name","definitions":["a village in Tulcea County, Dobruja, in eastern Romania"],"gender":"m"},{"word":"bestia","pos":"noun","definitions":["definite nominative/accusative singular of bestie"]},{"word":"bestial","pos":"adj","definitions":["bestial, animal","cool"],"pronunciation":"[bes.tiˈal]","forms":{"feminine-singular":"bestială","masculine-plural":"bestiali","feminine-neuter-plural":"bestiale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bestial","error-unrecognized-form-feminine-indefinite-singular":"bestială","error-unrecognized-form-indefinite-masculine-plural":"bestiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bestiale","definite-error-unrecognized-form-masculine-neuter-singular":"bestialul","definite-error-unrecognized-form-feminine-singular":"bestiala","definite-error-unrecognized-form-masculine-plural":"bestialii","definite-error-unrecognized-form-feminine-neuter-plural":"bestialele"}},{"word":"bestialitate","pos":"noun","definitions":["beastliness"],"pronunciation":"[bes.ti.a.liˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"bestialitate","accusative-definite-nominative":"bestialitatea","dative-genitive-indefinite":"bestialități","dative-definite-genitive":"bestialității","vocative":"bestialitate"}},{"word":"bestializa","pos":"verb","definitions":["to bestialize"],"forms":{"canonical":"a bestializa 1st conjugation","present-singular-third-person":"bestializează","participle-past":"bestializat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bestializa","gerund":"bestializând","first-person-indicative-present-singular":"bestializez","indicative-present-second-person-singular":"bestializezi","indicative-present-singular-third-person":"bestializează","first-person-indicative-plural-present":"bestializăm","indicative-plural-present-second-person":"bestializați","indicative-plural-present-third-person":"bestializează","first-person-imperfect-indicative-singular":"bestializam","imperfect-indicative-second-person-singular":"bestializai","imperfect-indicative-singular-third-person":"bestializa","first-person-imperfect-indicative-plural":"bestializam","imperfect-indicative-plural-second-person":"bestializați","imperfect-indicative-plural-third-person":"bestializau","first-person-indicative-perfect-singular":"bestializai","indicative-perfect-second-person-singular":"bestializași","indicative-perfect-singular-third-person":"bestializă","first-person-indicative-perfect-plural":"bestializarăm","indicative-perfect-plural-second-person":"bestializarăți","indicative-perfect-plural-third-person":"bestializară","first-person-indicative-pluperfect-singular":"bestializasem","indicative-pluperfect-second-person-singular":"bestializaseși","indicative-pluperfect-singular-third-person":"bestializase","first-person-indicative-pluperfect-plural":"bestializaserăm","indicative-pluperfect-plural-second-person":"bestializaserăți","indicative-pluperfect-plural-third-person":"bestializaseră","first-person-present-singular-subjunctive":"să bestializez","present-second-person-singular-subjunctive":"să bestializezi","present-singular-subjunctive-third-person":"să bestializeze","first-person-plural-present-subjunctive":"să bestializăm","plural-present-second-person-subjunctive":"să bestializați","plural-present-subjunctive-third-person":"să bestializeze","imperative-second-person-singular":"bestializează","imperative-plural-second-person":"bestializați","imperative-negative-second-person-singular":"nu bestializa","imperative-negative-plural-second-person":"nu bestializați"}},{"word":"bestializare","pos":"noun","definitions":["bestialization"],"forms":{"plural":"bestializări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bestializare","accusative-definite-nominative-singular":"bestializarea","accusative-indefinite-nominative-plural":"bestializări","accusative-definite-nominative-plural":"bestializările","dative-genitive-indefinite-singular":"bestializări","dative-definite-genitive-singular":"bestializării","dative-genitive-indefinite-plural":"bestializări","dative-definite-genitive-plural":"bestializărilor","singular-vocative":"bestializare","plural-vocative":"bestializărilor"}},{"word":"bestiar","pos":"noun","definitions":["bestiary"],"forms":{"plural":"bestiare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bestiar","accusative-definite-nominative-singular":"bestiarul","accusative-indefinite-nominative-plural":"bestiare","accusative-definite-nominative-plural":"bestiarele","dative-genitive-indefinite-singular":"bestiar","dative-definite-genitive-singular":"bestiarului","dative-genitive-indefinite-plural":"bestiare","dative-definite-genitive-plural":"bestiarelor","singular-vocative":"bestiarule","plural-vocative":"bestiarelor"}},{"word":"bestie","pos":"noun","definitions":["beast, wild animal"],"forms":{"plural":"bestii"}},{"word":"bet","pos":"adj","definitions":["obsolete form of biet"],"forms":{"feminine-singular":"betă","masculine-plural":"beți","feminine-neuter-plural":"bete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bet","error-unrecognized-form-feminine-indefinite-singular":"betă","error-unrecognized-form-indefinite-masculine-plural":"beți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bete","definite-error-unrecognized-form-masculine-neuter-singular":"betul","definite-error-unrecognized-form-feminine-singular":"beta","definite-error-unrecognized-form-masculine-plural":"beții","definite-error-unrecognized-form-feminine-neuter-plural":"betele"}},{"word":"Beta","pos":"name","definitions":["a village in Mugeni, Harghita County, Romania"],"gender":"f"},{"word":"beta","pos":"noun","definitions":["beta (Greek letter)"],"forms":{"plural":"beta","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"beta","accusative-definite-nominative-singular":"betaul","accusative-indefinite-nominative-plural":"beta","accusative-definite-nominative-plural":"betai","dative-genitive-indefinite-singular":"beta","dative-definite-genitive-singular":"betaului","dative-genitive-indefinite-plural":"beta","dative-definite-genitive-plural":"betalor","singular-vocative":"betaule","plural-vocative":"betalor"}},{"word":"betaină","pos":"noun","definitions":["betaine"],"forms":{"plural":"betaine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betaină","accusative-definite-nominative-singular":"betaina","accusative-indefinite-nominative-plural":"betaine","accusative-definite-nominative-plural":"betainele","dative-genitive-indefinite-singular":"betaine","dative-definite-genitive-singular":"betainei","dative-genitive-indefinite-plural":"betaine","dative-definite-genitive-plural":"betainelor","singular-vocative":"betaină","plural-vocative":"betainelor"}},{"word":"bețârc","pos":"noun","definitions":["county"],"forms":{"plural":"bețârcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bețârc","accusative-definite-nominative-singular":"bețârcul","accusative-indefinite-nominative-plural":"bețârcuri","accusative-definite-nominative-plural":"bețârcurile","dative-genitive-indefinite-singular":"bețârc","dative-definite-genitive-singular":"bețârcului","dative-genitive-indefinite-plural":"bețârcuri","dative-definite-genitive-plural":"bețârcurilor","singular-vocative":"bețârcule","plural-vocative":"bețârcurilor"}},{"word":"betatron","pos":"noun","definitions":["betatron"],"forms":{"plural":"betatroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"betatron","accusative-definite-nominative-singular":"betatronul","accusative-indefinite-nominative-plural":"betatroane","accusative-definite-nominative-plural":"betatroanele","dative-genitive-indefinite-singular":"betatron","dative-definite-genitive-singular":"betatronului","dative-genitive-indefinite-plural":"betatroane","dative-definite-genitive-plural":"betatroanelor","singular-vocative":"betatronule","plural-vocative":"betatroanelor"}},{"word":"bete","pos":"adj","definitions":["feminine/neuter plural of beat"],"pronunciation":"/ˈbe.te/","gender":"f-p"},{"word":"Beteag","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beteag"}},{"word":"beteag","pos":"adj","definitions":["ill, sick","crippled"],"pronunciation":"/beˈte̯aɡ/","forms":{"feminine-singular":"beteagă","masculine-plural":"betegi","feminine-neuter-plural":"betege","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beteag","error-unrecognized-form-feminine-indefinite-singular":"beteagă","error-unrecognized-form-indefinite-masculine-plural":"betegi","error-unrecognized-form-feminine-indefinite-neuter-plural":"betege","definite-error-unrecognized-form-masculine-neuter-singular":"beteagul","definite-error-unrecognized-form-feminine-singular":"beteaga","definite-error-unrecognized-form-masculine-plural":"betegii","definite-error-unrecognized-form-feminine-neuter-plural":"betegele"}},{"word":"beteagă","pos":"noun","definitions":["female equivalent of beteag"],"forms":{"plural":"betege","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beteagă","accusative-definite-nominative-singular":"beteaga","accusative-indefinite-nominative-plural":"beteage","accusative-definite-nominative-plural":"beteagele","dative-genitive-indefinite-singular":"beteage","dative-definite-genitive-singular":"beteagei","dative-genitive-indefinite-plural":"beteage","dative-definite-genitive-plural":"beteagelor","singular-vocative":"beteagă","plural-vocative":"beteagelor"}},{"word":"Beteagu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beteagu"}},{"word":"beteală","pos":"noun","definitions":["tinsel"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"beteală","accusative-definite-nominative":"beteala","dative-genitive-indefinite":"beteli","dative-definite-genitive":"betelii","vocative":"beteală"}},{"word":"betegeală","pos":"noun","definitions":["lameness, disability"],"forms":{"plural":"betegeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betegeală","accusative-definite-nominative-singular":"betegeala","accusative-indefinite-nominative-plural":"betegele","accusative-definite-nominative-plural":"betegelele","dative-genitive-indefinite-singular":"betegele","dative-definite-genitive-singular":"betegelei","dative-genitive-indefinite-plural":"betegele","dative-definite-genitive-plural":"betegelelor","singular-vocative":"betegeală","plural-vocative":"betegelelor"}},{"word":"betegie","pos":"noun","definitions":["infirmity"],"forms":{"plural":"betegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"betegie","accusative-definite-nominative-singular":"betegia","accusative-indefinite-nominative-plural":"betegii","accusative-definite-nominative-plural":"betegiile","dative-genitive-indefinite-singular":"betegii","dative-definite-genitive-singular":"betegiei","dative-genitive-indefinite-plural":"betegii","dative-definite-genitive-plural":"betegiilor","singular-vocative":"betegie","plural-vocative":"betegiilor"}},{"word":"betegos","pos":"adj","definitions":["sickly"],"forms":{"feminine-singular":"betegoasă","masculine-plural":"betegoși","feminine-neuter-plural":"betegoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"betegos","error-unrecognized-form-feminine-indefinite-singular":"betegoasă","error-unrecognized-form-indefinite-masculine-plural":"betegoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"betegoase","definite-error-unrecognized-form-masculine-neuter-singular":"betegosul","definite-error-unrecognized-form-feminine-singular":"betegoasa","definite-error-unrecognized-form-masculine-plural":"betegoșii","definite-error-unrecognized-form-feminine-neuter-plural":"betegoasele"}},{"word":"Betegosul","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Zăbala"],"gender":"m"},{"word":"betejeală","pos":"noun","definitions":["alternative form of betegeală"],"forms":{"plural":"betejeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betejeală","accusative-definite-nominative-singular":"betejeala","accusative-indefinite-nominative-plural":"betejele","accusative-definite-nominative-plural":"betejelele","dative-genitive-indefinite-singular":"betejele","dative-definite-genitive-singular":"betejelei","dative-genitive-indefinite-plural":"betejele","dative-definite-genitive-plural":"betejelelor","singular-vocative":"betejeală","plural-vocative":"betejelelor"}},{"word":"beteji","pos":"verb","definitions":["to cripple"],"pronunciation":"/be.teˈʒi/","forms":{"canonical":"a beteji 4th conjugation","present-singular-third-person":"betejește","participle-past":"betejit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a beteji","gerund":"betejind","first-person-indicative-present-singular":"betejesc","indicative-present-second-person-singular":"betejești","indicative-present-singular-third-person":"betejește","first-person-indicative-plural-present":"betejim","indicative-plural-present-second-person":"betejiți","indicative-plural-present-third-person":"betejesc","first-person-imperfect-indicative-singular":"betejeam","imperfect-indicative-second-person-singular":"betejeai","imperfect-indicative-singular-third-person":"betejea","first-person-imperfect-indicative-plural":"betejeam","imperfect-indicative-plural-second-person":"betejeați","imperfect-indicative-plural-third-person":"betejeau","first-person-indicative-perfect-singular":"betejii","indicative-perfect-second-person-singular":"betejiși","indicative-perfect-singular-third-person":"beteji","first-person-indicative-perfect-plural":"betejirăm","indicative-perfect-plural-second-person":"betejirăți","indicative-perfect-plural-third-person":"betejiră","first-person-indicative-pluperfect-singular":"betejisem","indicative-pluperfect-second-person-singular":"betejiseși","indicative-pluperfect-singular-third-person":"betejise","first-person-indicative-pluperfect-plural":"betejiserăm","indicative-pluperfect-plural-second-person":"betejiserăți","indicative-pluperfect-plural-third-person":"betejiseră","first-person-present-singular-subjunctive":"să betejesc","present-second-person-singular-subjunctive":"să betejești","present-singular-subjunctive-third-person":"să betejească","first-person-plural-present-subjunctive":"să betejim","plural-present-second-person-subjunctive":"să betejiți","plural-present-subjunctive-third-person":"să betejească","imperative-second-person-singular":"betejește","imperative-plural-second-person":"betejiți","imperative-negative-second-person-singular":"nu beteji","imperative-negative-plural-second-person":"nu betejiți","alternative":"betegi"}},{"word":"betejitură","pos":"noun","definitions":["infirmity"],"forms":{"plural":"betejituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"betejitură","accusative-definite-nominative-singular":"betejitura","accusative-indefinite-nominative-plural":"betejituri","accusative-definite-nominative-plural":"betejiturile","dative-genitive-indefinite-singular":"betejituri","dative-definite-genitive-singular":"betejiturii","dative-genitive-indefinite-plural":"betejituri","dative-definite-genitive-plural":"betejiturilor","singular-vocative":"betejitură","plural-vocative":"betejiturilor"}},{"word":"betel","pos":"noun","definitions":["betel"],"forms":{"plural":"beteli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"betel","accusative-definite-nominative-singular":"betelul","accusative-indefinite-nominative-plural":"beteli","accusative-definite-nominative-plural":"betelii","dative-genitive-indefinite-singular":"betel","dative-definite-genitive-singular":"betelului","dative-genitive-indefinite-plural":"beteli","dative-definite-genitive-plural":"betelilor","singular-vocative":"betelule","plural-vocative":"betelilor"}},{"word":"betelie","pos":"noun","definitions":["waistband"],"forms":{"plural":"betelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"betelie","accusative-definite-nominative-singular":"betelia","accusative-indefinite-nominative-plural":"betelii","accusative-definite-nominative-plural":"beteliile","dative-genitive-indefinite-singular":"betelii","dative-definite-genitive-singular":"beteliei","dative-genitive-indefinite-plural":"betelii","dative-definite-genitive-plural":"beteliilor","singular-vocative":"betelie","plural-vocative":"beteliilor"}},{"word":"Betești","pos":"name","definitions":["a locality in Cristuru Secuiesc, Harghita County, Romania"],"gender":"m"},{"word":"Bețești","pos":"name","definitions":["a village in Rediu, Neamț County, Romania"],"gender":"m"},{"word":"beteșug","pos":"noun","definitions":["lameness","disease"],"forms":{"plural":"beteșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"beteșug","accusative-definite-nominative-singular":"beteșugul","accusative-indefinite-nominative-plural":"beteșuge","accusative-definite-nominative-plural":"beteșugele","dative-genitive-indefinite-singular":"beteșug","dative-definite-genitive-singular":"beteșugului","dative-genitive-indefinite-plural":"beteșuge","dative-definite-genitive-plural":"beteșugelor","singular-vocative":"beteșugule","plural-vocative":"beteșugelor"}},{"word":"Bethausen","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Bethausen, Timiș County, Romania"],"gender":"m"},{"word":"beți","pos":"verb","definitions":["second-person plural present indicative/subjunctive of bea"],"pronunciation":"/bet͡sʲ/"},{"word":"beția adâncurilor","pos":"noun","definitions":["rapture of the deep"]},{"word":"beție","pos":"noun","definitions":["drunkenness, intoxication, inebriation (the state of being drunk)","drunkenness (the vice of being a drunkard)","intoxication (elation)","carousal (occasion involving drinking)"],"pronunciation":"/beˈt͡si.e/","forms":{"plural":"beții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"beție","accusative-definite-nominative-singular":"beția","accusative-indefinite-nominative-plural":"beții","accusative-definite-nominative-plural":"bețiile","dative-genitive-indefinite-singular":"beții","dative-definite-genitive-singular":"beției","dative-genitive-indefinite-plural":"beții","dative-definite-genitive-plural":"bețiilor","singular-vocative":"beție","plural-vocative":"bețiilor"}},{"word":"bețigaș","pos":"noun","definitions":["diminutive of băț"],"forms":{"plural":"bețigașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bețigaș","accusative-definite-nominative-singular":"bețigașul","accusative-indefinite-nominative-plural":"bețigașe","accusative-definite-nominative-plural":"bețigașele","dative-genitive-indefinite-singular":"bețigaș","dative-definite-genitive-singular":"bețigașului","dative-genitive-indefinite-plural":"bețigașe","dative-definite-genitive-plural":"bețigașelor","singular-vocative":"bețigașule","plural-vocative":"bețigașelor"}},{"word":"bețișor","pos":"noun","definitions":["diminutive of băț; small stick"],"forms":{"plural":"bețișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bețișor","accusative-definite-nominative-singular":"bețișorul","accusative-indefinite-nominative-plural":"bețișore","accusative-definite-nominative-plural":"bețișorele","dative-genitive-indefinite-singular":"bețișor","dative-definite-genitive-singular":"bețișorului","dative-genitive-indefinite-plural":"bețișore","dative-definite-genitive-plural":"bețișorelor","singular-vocative":"bețișorule","plural-vocative":"bețișorelor"}},{"word":"betiță","pos":"noun","definitions":["diminutive of bată"],"forms":{"plural":"betițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betiță","accusative-definite-nominative-singular":"betița","accusative-indefinite-nominative-plural":"betițe","accusative-definite-nominative-plural":"betițele","dative-genitive-indefinite-singular":"betițe","dative-definite-genitive-singular":"betiței","dative-genitive-indefinite-plural":"betițe","dative-definite-genitive-plural":"betițelor","singular-vocative":"betiță","plural-vocative":"betițelor"}},{"word":"bețiv","pos":"adj","definitions":["inclined to drinking often"],"pronunciation":"[beˈt͡siv]","forms":{"feminine-singular":"bețivă","masculine-plural":"bețivi","feminine-neuter-plural":"bețive","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bețiv","error-unrecognized-form-feminine-indefinite-singular":"bețivă","error-unrecognized-form-indefinite-masculine-plural":"bețivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bețive","definite-error-unrecognized-form-masculine-neuter-singular":"bețivul","definite-error-unrecognized-form-feminine-singular":"bețiva","definite-error-unrecognized-form-masculine-plural":"bețivii","definite-error-unrecognized-form-feminine-neuter-plural":"bețivele","alternative":"бецив"}},{"word":"bețiv","pos":"noun","definitions":["drunk, drunkard, tipper, boozer, bibber"],"pronunciation":"[beˈt͡siv]","forms":{"plural":"bețivi","feminine":"equivalent bețivă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bețiv","accusative-definite-nominative-singular":"bețivul","accusative-indefinite-nominative-plural":"bețivi","accusative-definite-nominative-plural":"bețivii","dative-genitive-indefinite-singular":"bețiv","dative-definite-genitive-singular":"bețivului","dative-genitive-indefinite-plural":"bețivi","dative-definite-genitive-plural":"bețivilor","singular-vocative":"bețivule","plural-vocative":"bețivilor","alternative":"бецив"}},{"word":"bețivă","pos":"noun","definitions":["female equivalent of bețiv"],"forms":{"plural":"bețive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bețivă","accusative-definite-nominative-singular":"bețiva","accusative-indefinite-nominative-plural":"bețive","accusative-definite-nominative-plural":"bețivele","dative-genitive-indefinite-singular":"bețive","dative-definite-genitive-singular":"bețivei","dative-genitive-indefinite-plural":"bețive","dative-definite-genitive-plural":"bețivelor","singular-vocative":"bețivă","plural-vocative":"bețivelor"}},{"word":"bețivan","pos":"adj","definitions":["inclined to drinking heavily"],"pronunciation":"/be.t͡siˈvan/","forms":{"feminine-singular":"bețivană","masculine-plural":"bețivani","feminine-neuter-plural":"bețivane","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bețivan","error-unrecognized-form-feminine-indefinite-singular":"bețivană","error-unrecognized-form-indefinite-masculine-plural":"bețivani","error-unrecognized-form-feminine-indefinite-neuter-plural":"bețivane","definite-error-unrecognized-form-masculine-neuter-singular":"bețivanul","definite-error-unrecognized-form-feminine-singular":"bețivana","definite-error-unrecognized-form-masculine-plural":"bețivanii","definite-error-unrecognized-form-feminine-neuter-plural":"bețivanele"}},{"word":"bețivan","pos":"noun","definitions":["a major drunkard"],"pronunciation":"/be.t͡siˈvan/","forms":{"plural":"bețivani","feminine":"equivalent bețivană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bețivan","accusative-definite-nominative-singular":"bețivanul","accusative-indefinite-nominative-plural":"bețivani","accusative-definite-nominative-plural":"bețivanii","dative-genitive-indefinite-singular":"bețivan","dative-definite-genitive-singular":"bețivanului","dative-genitive-indefinite-plural":"bețivani","dative-definite-genitive-plural":"bețivanilor","singular-vocative":"bețivanule","plural-vocative":"bețivanilor"}},{"word":"bețivană","pos":"noun","definitions":["female equivalent of bețivan"],"forms":{"plural":"bețivane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bețivană","accusative-definite-nominative-singular":"bețivana","accusative-indefinite-nominative-plural":"bețivane","accusative-definite-nominative-plural":"bețivanele","dative-genitive-indefinite-singular":"bețivane","dative-definite-genitive-singular":"bețivanei","dative-genitive-indefinite-plural":"bețivane","dative-definite-genitive-plural":"bețivanelor","singular-vocative":"bețivană","plural-vocative":"bețivanelor"}},{"word":"bețivănărie","pos":"noun","definitions":["party"],"forms":{"plural":"bețivănării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bețivănărie","accusative-definite-nominative-singular":"bețivănăria","accusative-indefinite-nominative-plural":"bețivănării","accusative-definite-nominative-plural":"bețivănăriile","dative-genitive-indefinite-singular":"bețivănării","dative-definite-genitive-singular":"bețivănăriei","dative-genitive-indefinite-plural":"bețivănării","dative-definite-genitive-plural":"bețivănăriilor","singular-vocative":"bețivănărie","plural-vocative":"bețivănăriilor"}},{"word":"bețivi","pos":"verb","definitions":["to party, drinking to much alcohol"],"forms":{"canonical":"a bețivi 4th conjugation","present-singular-third-person":"bețivește","participle-past":"bețivit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bețivi","gerund":"bețivind","first-person-indicative-present-singular":"bețivesc","indicative-present-second-person-singular":"bețivești","indicative-present-singular-third-person":"bețivește","first-person-indicative-plural-present":"bețivim","indicative-plural-present-second-person":"bețiviți","indicative-plural-present-third-person":"bețivesc","first-person-imperfect-indicative-singular":"bețiveam","imperfect-indicative-second-person-singular":"bețiveai","imperfect-indicative-singular-third-person":"bețivea","first-person-imperfect-indicative-plural":"bețiveam","imperfect-indicative-plural-second-person":"bețiveați","imperfect-indicative-plural-third-person":"bețiveau","first-person-indicative-perfect-singular":"bețivii","indicative-perfect-second-person-singular":"bețiviși","indicative-perfect-singular-third-person":"bețivi","first-person-indicative-perfect-plural":"bețivirăm","indicative-perfect-plural-second-person":"bețivirăți","indicative-perfect-plural-third-person":"bețiviră","first-person-indicative-pluperfect-singular":"bețivisem","indicative-pluperfect-second-person-singular":"bețiviseși","indicative-pluperfect-singular-third-person":"bețivise","first-person-indicative-pluperfect-plural":"bețiviserăm","indicative-pluperfect-plural-second-person":"bețiviserăți","indicative-pluperfect-plural-third-person":"bețiviseră","first-person-present-singular-subjunctive":"să bețivesc","present-second-person-singular-subjunctive":"să bețivești","present-singular-subjunctive-third-person":"să bețivească","first-person-plural-present-subjunctive":"să bețivim","plural-present-second-person-subjunctive":"să bețiviți","plural-present-subjunctive-third-person":"să bețivească","imperative-second-person-singular":"bețivește","imperative-plural-second-person":"bețiviți","imperative-negative-second-person-singular":"nu bețivi","imperative-negative-plural-second-person":"nu bețiviți"}},{"word":"Bețivoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bețivoiu"}},{"word":"Bețivu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bețivu"}},{"word":"Betleem","pos":"name","definitions":["Bethlehem (a city in the West Bank, Palestine)"],"gender":"m"},{"word":"beton","pos":"noun","definitions":["concrete"],"forms":{"plural":"betoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"beton","accusative-definite-nominative-singular":"betonul","accusative-indefinite-nominative-plural":"betoane","accusative-definite-nominative-plural":"betoanele","dative-genitive-indefinite-singular":"beton","dative-definite-genitive-singular":"betonului","dative-genitive-indefinite-plural":"betoane","dative-definite-genitive-plural":"betoanelor","singular-vocative":"betonule","plural-vocative":"betoanelor"}},{"word":"beton","pos":"adj","definitions":["cool, awesome, lit, dope, insane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"beton","error-unrecognized-form-feminine-indefinite-singular":"beton","error-unrecognized-form-indefinite-masculine-plural":"beton","error-unrecognized-form-feminine-indefinite-neuter-plural":"beton","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"beton armat","pos":"noun","definitions":["reinforced concrete"]},{"word":"betona","pos":"verb","definitions":["to concrete"],"forms":{"canonical":"a betona 1st conjugation","present-singular-third-person":"betonează","participle-past":"betonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a betona","gerund":"betonând","first-person-indicative-present-singular":"betonez","indicative-present-second-person-singular":"betonezi","indicative-present-singular-third-person":"betonează","first-person-indicative-plural-present":"betonăm","indicative-plural-present-second-person":"betonați","indicative-plural-present-third-person":"betonează","first-person-imperfect-indicative-singular":"betonam","imperfect-indicative-second-person-singular":"betonai","imperfect-indicative-singular-third-person":"betona","first-person-imperfect-indicative-plural":"betonam","imperfect-indicative-plural-second-person":"betonați","imperfect-indicative-plural-third-person":"betonau","first-person-indicative-perfect-singular":"betonai","indicative-perfect-second-person-singular":"betonași","indicative-perfect-singular-third-person":"betonă","first-person-indicative-perfect-plural":"betonarăm","indicative-perfect-plural-second-person":"betonarăți","indicative-perfect-plural-third-person":"betonară","first-person-indicative-pluperfect-singular":"betonasem","indicative-pluperfect-second-person-singular":"betonaseși","indicative-pluperfect-singular-third-person":"betonase","first-person-indicative-pluperfect-plural":"betonaserăm","indicative-pluperfect-plural-second-person":"betonaserăți","indicative-pluperfect-plural-third-person":"betonaseră","first-person-present-singular-subjunctive":"să betonez","present-second-person-singular-subjunctive":"să betonezi","present-singular-subjunctive-third-person":"să betoneze","first-person-plural-present-subjunctive":"să betonăm","plural-present-second-person-subjunctive":"să betonați","plural-present-subjunctive-third-person":"să betoneze","imperative-second-person-singular":"betonează","imperative-plural-second-person":"betonați","imperative-negative-second-person-singular":"nu betona","imperative-negative-plural-second-person":"nu betonați"}},{"word":"betonaj","pos":"noun","definitions":["concrete work"],"forms":{"plural":"betonaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"betonaj","accusative-definite-nominative-singular":"betonajul","accusative-indefinite-nominative-plural":"betonaje","accusative-definite-nominative-plural":"betonajele","dative-genitive-indefinite-singular":"betonaj","dative-definite-genitive-singular":"betonajului","dative-genitive-indefinite-plural":"betonaje","dative-definite-genitive-plural":"betonajelor","singular-vocative":"betonajule","plural-vocative":"betonajelor"}},{"word":"betonare","pos":"noun","definitions":["concreting"],"forms":{"plural":"betonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"betonare","accusative-definite-nominative-singular":"betonarea","accusative-indefinite-nominative-plural":"betonări","accusative-definite-nominative-plural":"betonările","dative-genitive-indefinite-singular":"betonări","dative-definite-genitive-singular":"betonării","dative-genitive-indefinite-plural":"betonări","dative-definite-genitive-plural":"betonărilor","singular-vocative":"betonare","plural-vocative":"betonărilor"}},{"word":"betonat","pos":"adj","definitions":["having concrete on it"],"forms":{"feminine-singular":"betonată","masculine-plural":"betonați","feminine-neuter-plural":"betonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"betonat","error-unrecognized-form-feminine-indefinite-singular":"betonată","error-unrecognized-form-indefinite-masculine-plural":"betonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"betonate","definite-error-unrecognized-form-masculine-neuter-singular":"betonatul","definite-error-unrecognized-form-feminine-singular":"betonata","definite-error-unrecognized-form-masculine-plural":"betonații","definite-error-unrecognized-form-feminine-neuter-plural":"betonatele"}},{"word":"betonat","pos":"verb","definitions":["past participle of betona"],"forms":{"participle-past":"of betona"}},{"word":"betonică","pos":"noun","definitions":["betony (Stachys officinalis)"],"forms":{"plural":"betonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"betonică","accusative-definite-nominative-singular":"betonica","accusative-indefinite-nominative-plural":"betonici","accusative-definite-nominative-plural":"betonicile","dative-genitive-indefinite-singular":"betonici","dative-definite-genitive-singular":"betonicii","dative-genitive-indefinite-plural":"betonici","dative-definite-genitive-plural":"betonicilor","singular-vocative":"betonică","plural-vocative":"betonicilor"}},{"word":"betonier","pos":"noun","definitions":["concreter"],"forms":{"plural":"betonieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"betonier","accusative-definite-nominative-singular":"betonierul","accusative-indefinite-nominative-plural":"betonieri","accusative-definite-nominative-plural":"betonierii","dative-genitive-indefinite-singular":"betonier","dative-definite-genitive-singular":"betonierului","dative-genitive-indefinite-plural":"betonieri","dative-definite-genitive-plural":"betonierilor","singular-vocative":"betonierule","plural-vocative":"betonierilor"}},{"word":"betonieră","pos":"noun","definitions":["cement mixer"],"forms":{"plural":"betoniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betonieră","accusative-definite-nominative-singular":"betoniera","accusative-indefinite-nominative-plural":"betoniere","accusative-definite-nominative-plural":"betonierele","dative-genitive-indefinite-singular":"betoniere","dative-definite-genitive-singular":"betonierei","dative-genitive-indefinite-plural":"betoniere","dative-definite-genitive-plural":"betonierelor","singular-vocative":"betonieră","plural-vocative":"betonierelor"}},{"word":"betonist","pos":"noun","definitions":["concreter"],"forms":{"plural":"betoniști","feminine":"equivalent betonistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"betonist","accusative-definite-nominative-singular":"betonistul","accusative-indefinite-nominative-plural":"betoniști","accusative-definite-nominative-plural":"betoniștii","dative-genitive-indefinite-singular":"betonist","dative-definite-genitive-singular":"betonistului","dative-genitive-indefinite-plural":"betoniști","dative-definite-genitive-plural":"betoniștilor","singular-vocative":"betonistule","plural-vocative":"betoniștilor"}},{"word":"betonistă","pos":"noun","definitions":["female equivalent of betonist"],"forms":{"plural":"betoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"betonistă","accusative-definite-nominative-singular":"betonista","accusative-indefinite-nominative-plural":"betoniste","accusative-definite-nominative-plural":"betonistele","dative-genitive-indefinite-singular":"betoniste","dative-definite-genitive-singular":"betonistei","dative-genitive-indefinite-plural":"betoniste","dative-definite-genitive-plural":"betonistelor","singular-vocative":"betonistă","plural-vocative":"betonistelor"}},{"word":"Beuca","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Beuca, Teleorman County, Romania"],"gender":"f"},{"word":"Beudiu","pos":"name","definitions":["a village in Nușeni, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"beuță","pos":"noun","definitions":["a rounded white pebble found in the rivers"],"forms":{"plural":"beuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beuță","accusative-definite-nominative-singular":"beuța","accusative-indefinite-nominative-plural":"beuțe","accusative-definite-nominative-plural":"beuțele","dative-genitive-indefinite-singular":"beuțe","dative-definite-genitive-singular":"beuței","dative-genitive-indefinite-plural":"beuțe","dative-definite-genitive-plural":"beuțelor","singular-vocative":"beuță","plural-vocative":"beuțelor"}},{"word":"Beutură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beutură"}},{"word":"beutură","pos":"noun","definitions":["alternative form of băutură"],"forms":{"plural":"beuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"beutură","accusative-definite-nominative-singular":"beutura","accusative-indefinite-nominative-plural":"beuturi","accusative-definite-nominative-plural":"beuturile","dative-genitive-indefinite-singular":"beuturi","dative-definite-genitive-singular":"beuturii","dative-genitive-indefinite-plural":"beuturi","dative-definite-genitive-plural":"beuturilor","singular-vocative":"beutură","plural-vocative":"beuturilor"}},{"word":"bevatron","pos":"noun","definitions":["bevatron"],"forms":{"plural":"bevatroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bevatron","accusative-definite-nominative-singular":"bevatronul","accusative-indefinite-nominative-plural":"bevatroane","accusative-definite-nominative-plural":"bevatroanele","dative-genitive-indefinite-singular":"bevatron","dative-definite-genitive-singular":"bevatronului","dative-genitive-indefinite-plural":"bevatroane","dative-definite-genitive-plural":"bevatroanelor","singular-vocative":"bevatronule","plural-vocative":"bevatroanelor"}},{"word":"bez","pos":"adv","definitions":["without"]},{"word":"bezaconic","pos":"adj","definitions":["outlaw"],"forms":{"feminine-singular":"bezaconică","masculine-plural":"bezaconici","feminine-neuter-plural":"bezaconice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bezaconic","error-unrecognized-form-feminine-indefinite-singular":"bezaconică","error-unrecognized-form-indefinite-masculine-plural":"bezaconici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bezaconice","definite-error-unrecognized-form-masculine-neuter-singular":"bezaconicul","definite-error-unrecognized-form-feminine-singular":"bezaconica","definite-error-unrecognized-form-masculine-plural":"bezaconicii","definite-error-unrecognized-form-feminine-neuter-plural":"bezaconicele"}},{"word":"bezaconie","pos":"noun","definitions":["obsolete form of bazaconie"],"forms":{"plural":"bezaconii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bezaconie","accusative-definite-nominative-singular":"bezaconia","accusative-indefinite-nominative-plural":"bezaconii","accusative-definite-nominative-plural":"bezaconiile","dative-genitive-indefinite-singular":"bezaconii","dative-definite-genitive-singular":"bezaconiei","dative-genitive-indefinite-plural":"bezaconii","dative-definite-genitive-plural":"bezaconiilor","singular-vocative":"bezaconie","plural-vocative":"bezaconiilor"}},{"word":"bezaconui","pos":"verb","definitions":["to commit crimes"],"forms":{"canonical":"a bezaconui 4th conjugation","present-singular-third-person":"bezaconuiește","participle-past":"bezaconuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bezaconui","gerund":"bezaconuind","first-person-indicative-present-singular":"bezaconuiesc","indicative-present-second-person-singular":"bezaconuiești","indicative-present-singular-third-person":"bezaconuiește","first-person-indicative-plural-present":"bezaconuim","indicative-plural-present-second-person":"bezaconuiți","indicative-plural-present-third-person":"bezaconuiesc","first-person-imperfect-indicative-singular":"bezaconuiam","imperfect-indicative-second-person-singular":"bezaconuiai","imperfect-indicative-singular-third-person":"bezaconuia","first-person-imperfect-indicative-plural":"bezaconuiam","imperfect-indicative-plural-second-person":"bezaconuiați","imperfect-indicative-plural-third-person":"bezaconuiau","first-person-indicative-perfect-singular":"bezaconuii","indicative-perfect-second-person-singular":"bezaconuiși","indicative-perfect-singular-third-person":"bezaconui","first-person-indicative-perfect-plural":"bezaconuirăm","indicative-perfect-plural-second-person":"bezaconuirăți","indicative-perfect-plural-third-person":"bezaconuiră","first-person-indicative-pluperfect-singular":"bezaconuisem","indicative-pluperfect-second-person-singular":"bezaconuiseși","indicative-pluperfect-singular-third-person":"bezaconuise","first-person-indicative-pluperfect-plural":"bezaconuiserăm","indicative-pluperfect-plural-second-person":"bezaconuiserăți","indicative-pluperfect-plural-third-person":"bezaconuiseră","first-person-present-singular-subjunctive":"să bezaconuiesc","present-second-person-singular-subjunctive":"să bezaconuiești","present-singular-subjunctive-third-person":"să bezaconuiască","first-person-plural-present-subjunctive":"să bezaconuim","plural-present-second-person-subjunctive":"să bezaconuiți","plural-present-subjunctive-third-person":"să bezaconuiască","imperative-second-person-singular":"bezaconuiește","imperative-plural-second-person":"bezaconuiți","imperative-negative-second-person-singular":"nu bezaconui","imperative-negative-plural-second-person":"nu bezaconuiți"}},{"word":"bezbojnic","pos":"noun","definitions":["atheist"],"forms":{"plural":"bezbojnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bezbojnic","accusative-definite-nominative-singular":"bezbojnicul","accusative-indefinite-nominative-plural":"bezbojnici","accusative-definite-nominative-plural":"bezbojnicii","dative-genitive-indefinite-singular":"bezbojnic","dative-definite-genitive-singular":"bezbojnicului","dative-genitive-indefinite-plural":"bezbojnici","dative-definite-genitive-plural":"bezbojnicilor","singular-vocative":"bezbojnicule","plural-vocative":"bezbojnicilor"}},{"word":"Bezdead","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Bezdead, Dâmbovița County, Romania"],"gender":"m"},{"word":"Bezded","pos":"name","definitions":["a village in Gârbou, Sălaj County, Romania"],"gender":"m"},{"word":"Bezdedeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bezdedeanu"}},{"word":"bezea","pos":"noun","definitions":["meringue","marshmallow"],"forms":{"plural":"bezele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bezea","accusative-definite-nominative-singular":"bezeaua","accusative-indefinite-nominative-plural":"bezele","accusative-definite-nominative-plural":"bezelele","dative-genitive-indefinite-singular":"bezele","dative-definite-genitive-singular":"bezelei","dative-genitive-indefinite-plural":"bezele","dative-definite-genitive-plural":"bezelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Bezeda","pos":"name","definitions":["a village in Bogdănești, Briceni Raion, Moldova"],"gender":"f"},{"word":"Bezeni","pos":"name","definitions":["a village in Izvoare, Florești Raion, Moldova"],"gender":"m"},{"word":"bezglasie","pos":"noun","definitions":["muteness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bezglasie","accusative-definite-nominative":"bezglasia","dative-genitive-indefinite":"bezglasii","dative-definite-genitive":"bezglasiei","vocative":"bezglasie"}},{"word":"Bezid","pos":"name","definitions":["a locality in Sângeorgiu de Pădure, Mureș County, Romania"],"gender":"m"},{"word":"Bezidu Nou","pos":"name","definitions":["a locality in Sângeorgiu de Pădure, Mureș County, Romania"],"gender":"m"},{"word":"Bezman","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bezman"}},{"word":"bezmetec","pos":"adj","definitions":["alternative form of bezmetic"],"forms":{"feminine-singular":"bezmetecă","masculine-plural":"bezmeteci","feminine-neuter-plural":"bezmetece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bezmetec","error-unrecognized-form-feminine-indefinite-singular":"bezmetecă","error-unrecognized-form-indefinite-masculine-plural":"bezmeteci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bezmetece","definite-error-unrecognized-form-masculine-neuter-singular":"bezmetecul","definite-error-unrecognized-form-feminine-singular":"bezmeteca","definite-error-unrecognized-form-masculine-plural":"bezmetecii","definite-error-unrecognized-form-feminine-neuter-plural":"bezmetecele"}},{"word":"bezmetecie","pos":"noun","definitions":["confusion"],"forms":{"plural":"bezmetecii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bezmetecie","accusative-definite-nominative-singular":"bezmetecia","accusative-indefinite-nominative-plural":"bezmetecii","accusative-definite-nominative-plural":"bezmeteciile","dative-genitive-indefinite-singular":"bezmetecii","dative-definite-genitive-singular":"bezmeteciei","dative-genitive-indefinite-plural":"bezmetecii","dative-definite-genitive-plural":"bezmeteciilor","singular-vocative":"bezmetecie","plural-vocative":"bezmeteciilor"}},{"word":"bezmetic","pos":"noun","definitions":["madman"],"pronunciation":"/bezˈme.tik/","forms":{"plural":"bezmetici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bezmetic","accusative-definite-nominative-singular":"bezmeticul","accusative-indefinite-nominative-plural":"bezmetici","accusative-definite-nominative-plural":"bezmeticii","dative-genitive-indefinite-singular":"bezmetic","dative-definite-genitive-singular":"bezmeticului","dative-genitive-indefinite-plural":"bezmetici","dative-definite-genitive-plural":"bezmeticilor","singular-vocative":"bezmeticule","plural-vocative":"bezmeticilor"}},{"word":"bezmetic","pos":"adj","definitions":["crazy, senseless","bewildered or incapable of acting rationally"],"pronunciation":"/bezˈme.tik/","forms":{"feminine-singular":"bezmetică","masculine-plural":"bezmetici","feminine-neuter-plural":"bezmetice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bezmetic","error-unrecognized-form-feminine-indefinite-singular":"bezmetică","error-unrecognized-form-indefinite-masculine-plural":"bezmetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bezmetice","definite-error-unrecognized-form-masculine-neuter-singular":"bezmeticul","definite-error-unrecognized-form-feminine-singular":"bezmetica","definite-error-unrecognized-form-masculine-plural":"bezmeticii","definite-error-unrecognized-form-feminine-neuter-plural":"bezmeticele"}},{"word":"bezmetici","pos":"noun","definitions":["plural of bezmetic"]},{"word":"Beznă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Beznă"}},{"word":"beznă","pos":"noun","definitions":["pitch darkness","abyss, Tartarus, pit of Hell"],"pronunciation":"/ˈbez.nə/","examples":[{"ro":"Near-synonym: întuneric","en":null}],"forms":{"plural":"bezne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"beznă","accusative-definite-nominative-singular":"bezna","accusative-indefinite-nominative-plural":"bezne","accusative-definite-nominative-plural":"beznele","dative-genitive-indefinite-singular":"bezne","dative-definite-genitive-singular":"beznei","dative-genitive-indefinite-plural":"bezne","dative-definite-genitive-plural":"beznelor","singular-vocative":"beznă","plural-vocative":"beznelor"}},{"word":"Beznea","pos":"name","definitions":["a village in Bratca, Bihor County, Romania","a surname"],"gender":"f"},{"word":"bezoar","pos":"noun","definitions":["bezoar"],"forms":{"plural":"bezoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bezoar","accusative-definite-nominative-singular":"bezoarul","accusative-indefinite-nominative-plural":"bezoare","accusative-definite-nominative-plural":"bezoarele","dative-genitive-indefinite-singular":"bezoar","dative-definite-genitive-singular":"bezoarului","dative-genitive-indefinite-plural":"bezoare","dative-definite-genitive-plural":"bezoarelor","singular-vocative":"bezoarule","plural-vocative":"bezoarelor"}},{"word":"bezrebărnic","pos":"adj","definitions":["incorruptible"],"forms":{"feminine-singular":"bezrebărnică","masculine-plural":"bezrebărnici","feminine-neuter-plural":"bezrebărnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bezrebărnic","error-unrecognized-form-feminine-indefinite-singular":"bezrebărnică","error-unrecognized-form-indefinite-masculine-plural":"bezrebărnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bezrebărnice","definite-error-unrecognized-form-masculine-neuter-singular":"bezrebărnicul","definite-error-unrecognized-form-feminine-singular":"bezrebărnica","definite-error-unrecognized-form-masculine-plural":"bezrebărnicii","definite-error-unrecognized-form-feminine-neuter-plural":"bezrebărnicele"}},{"word":"BH","pos":"name","definitions":["abbreviation of Bihor: a county of Romania"]},{"word":"bhutaneză","pos":"noun","definitions":["female equivalent of bhutanez"],"forms":{"plural":"bhutaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bhutaneză","accusative-definite-nominative-singular":"bhutaneza","accusative-indefinite-nominative-plural":"bhutaneze","accusative-definite-nominative-plural":"bhutanezele","dative-genitive-indefinite-singular":"bhutaneze","dative-definite-genitive-singular":"bhutanezei","dative-genitive-indefinite-plural":"bhutaneze","dative-definite-genitive-plural":"bhutanezelor","singular-vocative":"bhutaneză","plural-vocative":"bhutanezelor"}},{"word":"bi-metalist","pos":"adj","definitions":["bimetallist"],"forms":{"feminine-singular":"bi-metalistă","masculine-plural":"bi-metaliști","feminine-neuter-plural":"bi-metaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bi-metalist","error-unrecognized-form-feminine-indefinite-singular":"bi-metalistă","error-unrecognized-form-indefinite-masculine-plural":"bi-metaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"bi-metaliste","definite-error-unrecognized-form-masculine-neuter-singular":"bi-metalistul","definite-error-unrecognized-form-feminine-singular":"bi-metalista","definite-error-unrecognized-form-masculine-plural":"bi-metaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"bi-metalistele"}},{"word":"bi-metalist","pos":"noun","definitions":["bimetallist"],"forms":{"plural":"bi-metaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bi-metalist","accusative-definite-nominative-singular":"bi-metalistul","accusative-indefinite-nominative-plural":"bi-metaliști","accusative-definite-nominative-plural":"bi-metaliștii","dative-genitive-indefinite-singular":"bi-metalist","dative-definite-genitive-singular":"bi-metalistului","dative-genitive-indefinite-plural":"bi-metaliști","dative-definite-genitive-plural":"bi-metaliștilor","singular-vocative":"bi-metalistule","plural-vocative":"bi-metaliștilor"}},{"word":"biacid","pos":"adj","definitions":["biacid"],"forms":{"feminine-singular":"biacidă","masculine-plural":"biacizi","feminine-neuter-plural":"biacide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biacid","error-unrecognized-form-feminine-indefinite-singular":"biacidă","error-unrecognized-form-indefinite-masculine-plural":"biacizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"biacide","definite-error-unrecognized-form-masculine-neuter-singular":"biacidul","definite-error-unrecognized-form-feminine-singular":"biacida","definite-error-unrecognized-form-masculine-plural":"biacizii","definite-error-unrecognized-form-feminine-neuter-plural":"biacidele"}},{"word":"Bianca","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"bianual","pos":"adj","definitions":["biannual"],"pronunciation":"/ˌbi.a.nuˈal/","forms":{"feminine-singular":"bianuală","masculine-plural":"bianuali","feminine-neuter-plural":"bianuale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bianual","error-unrecognized-form-feminine-indefinite-singular":"bianuală","error-unrecognized-form-indefinite-masculine-plural":"bianuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bianuale","definite-error-unrecognized-form-masculine-neuter-singular":"bianualul","definite-error-unrecognized-form-feminine-singular":"bianuala","definite-error-unrecognized-form-masculine-plural":"bianualii","definite-error-unrecognized-form-feminine-neuter-plural":"bianualele"}},{"word":"biată","pos":"adj","definitions":["nominative/accusative feminine singular of biet"],"pronunciation":"/ˈbja.tə/"},{"word":"biatlon","pos":"noun","definitions":["biathlon"],"forms":{"plural":"biatloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biatlon","accusative-definite-nominative-singular":"biatlonul","accusative-indefinite-nominative-plural":"biatloane","accusative-definite-nominative-plural":"biatloanele","dative-genitive-indefinite-singular":"biatlon","dative-definite-genitive-singular":"biatlonului","dative-genitive-indefinite-plural":"biatloane","dative-definite-genitive-plural":"biatloanelor","singular-vocative":"biatlonule","plural-vocative":"biatloanelor"}},{"word":"biatlonist","pos":"noun","definitions":["biathlete"],"forms":{"plural":"biatloniști","feminine":"equivalent biatlonistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biatlonist","accusative-definite-nominative-singular":"biatlonistul","accusative-indefinite-nominative-plural":"biatloniști","accusative-definite-nominative-plural":"biatloniștii","dative-genitive-indefinite-singular":"biatlonist","dative-definite-genitive-singular":"biatlonistului","dative-genitive-indefinite-plural":"biatloniști","dative-definite-genitive-plural":"biatloniștilor","singular-vocative":"biatlonistule","plural-vocative":"biatloniștilor"}},{"word":"biatlonistă","pos":"noun","definitions":["female equivalent of biatlonist"],"forms":{"plural":"biatloniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biatlonistă","accusative-definite-nominative-singular":"biatlonista","accusative-indefinite-nominative-plural":"biatloniste","accusative-definite-nominative-plural":"biatlonistele","dative-genitive-indefinite-singular":"biatloniste","dative-definite-genitive-singular":"biatlonistei","dative-genitive-indefinite-plural":"biatloniste","dative-definite-genitive-plural":"biatlonistelor","singular-vocative":"biatlonistă","plural-vocative":"biatlonistelor"}},{"word":"biatomic","pos":"adj","definitions":["biatomic, diatomic"],"forms":{"feminine-singular":"biatomică","masculine-plural":"biatomici","feminine-neuter-plural":"biatomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biatomic","error-unrecognized-form-feminine-indefinite-singular":"biatomică","error-unrecognized-form-indefinite-masculine-plural":"biatomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biatomice","definite-error-unrecognized-form-masculine-neuter-singular":"biatomicul","definite-error-unrecognized-form-feminine-singular":"biatomica","definite-error-unrecognized-form-masculine-plural":"biatomicii","definite-error-unrecognized-form-feminine-neuter-plural":"biatomicele"}},{"word":"biaxial","pos":"adj","definitions":["biaxial"],"forms":{"feminine-singular":"biaxială","masculine-plural":"biaxiali","feminine-neuter-plural":"biaxiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biaxial","error-unrecognized-form-feminine-indefinite-singular":"biaxială","error-unrecognized-form-indefinite-masculine-plural":"biaxiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"biaxiale","definite-error-unrecognized-form-masculine-neuter-singular":"biaxialul","definite-error-unrecognized-form-feminine-singular":"biaxiala","definite-error-unrecognized-form-masculine-plural":"biaxialii","definite-error-unrecognized-form-feminine-neuter-plural":"biaxialele"}},{"word":"Biban","pos":"name","definitions":["a village in Pădina, Mehedinți County, Romania"],"gender":"m"},{"word":"biban","pos":"noun","definitions":["perch, bass"],"pronunciation":"/biˈban/","forms":{"plural":"bibani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biban","accusative-definite-nominative-singular":"bibanul","accusative-indefinite-nominative-plural":"bibani","accusative-definite-nominative-plural":"bibanii","dative-genitive-indefinite-singular":"biban","dative-definite-genitive-singular":"bibanului","dative-genitive-indefinite-plural":"bibani","dative-definite-genitive-plural":"bibanilor","singular-vocative":"bibanule","plural-vocative":"bibanilor"}},{"word":"bibană","pos":"noun","definitions":["female buffalo"],"forms":{"plural":"bibane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibană","accusative-definite-nominative-singular":"bibana","accusative-indefinite-nominative-plural":"bibane","accusative-definite-nominative-plural":"bibanele","dative-genitive-indefinite-singular":"bibane","dative-definite-genitive-singular":"bibanei","dative-genitive-indefinite-plural":"bibane","dative-definite-genitive-plural":"bibanelor","singular-vocative":"bibană","plural-vocative":"bibanelor"}},{"word":"bibazic","pos":"adj","definitions":["dibasic"],"forms":{"feminine-singular":"bibazică","masculine-plural":"bibazici","feminine-neuter-plural":"bibazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bibazic","error-unrecognized-form-feminine-indefinite-singular":"bibazică","error-unrecognized-form-indefinite-masculine-plural":"bibazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bibazice","definite-error-unrecognized-form-masculine-neuter-singular":"bibazicul","definite-error-unrecognized-form-feminine-singular":"bibazica","definite-error-unrecognized-form-masculine-plural":"bibazicii","definite-error-unrecognized-form-feminine-neuter-plural":"bibazicele"}},{"word":"bibelou","pos":"noun","definitions":["knick-knack, trinket"],"forms":{"plural":"bibelouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bibelou","accusative-definite-nominative-singular":"bibeloul","accusative-indefinite-nominative-plural":"bibelouri","accusative-definite-nominative-plural":"bibelourile","dative-genitive-indefinite-singular":"bibelou","dative-definite-genitive-singular":"bibeloului","dative-genitive-indefinite-plural":"bibelouri","dative-definite-genitive-plural":"bibelourilor","singular-vocative":"bibeloule","plural-vocative":"bibelourilor"}},{"word":"biber","pos":"noun","definitions":["beaver"],"forms":{"plural":"biberi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biber","accusative-definite-nominative-singular":"biberul","accusative-indefinite-nominative-plural":"biberi","accusative-definite-nominative-plural":"biberii","dative-genitive-indefinite-singular":"biber","dative-definite-genitive-singular":"biberului","dative-genitive-indefinite-plural":"biberi","dative-definite-genitive-plural":"biberilor","singular-vocative":"biberule","plural-vocative":"biberilor"}},{"word":"biberon","pos":"noun","definitions":["baby bottle","penis"],"forms":{"plural":"biberoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biberon","accusative-definite-nominative-singular":"biberonul","accusative-indefinite-nominative-plural":"biberoane","accusative-definite-nominative-plural":"biberoanele","dative-genitive-indefinite-singular":"biberon","dative-definite-genitive-singular":"biberonului","dative-genitive-indefinite-plural":"biberoane","dative-definite-genitive-plural":"biberoanelor","singular-vocative":"biberonule","plural-vocative":"biberoanelor"}},{"word":"Bibescu","pos":"name","definitions":["a surname"],"pronunciation":"[biˈbesku]","gender":"m","forms":{"dative-genitive":"lui Bibescu"}},{"word":"Bibești","pos":"name","definitions":["a village in Săulești, Gorj County, Romania"],"gender":"m"},{"word":"bibic","pos":"noun","definitions":["darling"],"forms":{"plural":"bibici","feminine":"equivalent bibică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibic","accusative-definite-nominative-singular":"bibicul","accusative-indefinite-nominative-plural":"bibici","accusative-definite-nominative-plural":"bibicii","dative-genitive-indefinite-singular":"bibic","dative-definite-genitive-singular":"bibicului","dative-genitive-indefinite-plural":"bibici","dative-definite-genitive-plural":"bibicilor","singular-vocative":"bibicule","plural-vocative":"bibicilor"}},{"word":"bibic","pos":"noun","definitions":["northern lapwing"],"forms":{"plural":"bibici"}},{"word":"bibică","pos":"noun","definitions":["female equivalent of bibic"],"forms":{"plural":"bibice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibică","accusative-definite-nominative-singular":"bibica","accusative-indefinite-nominative-plural":"bibice","accusative-definite-nominative-plural":"bibicele","dative-genitive-indefinite-singular":"bibice","dative-definite-genitive-singular":"bibicei","dative-genitive-indefinite-plural":"bibice","dative-definite-genitive-plural":"bibicelor","singular-vocative":"bibică","plural-vocative":"bibicelor"}},{"word":"Bibicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bibicescu"}},{"word":"Bibicu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bibicu"}},{"word":"Bibilică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bibilică"}},{"word":"bibilică","pos":"noun","definitions":["guinea fowl (Numida meleagris)","fritillary (any of several bulbous perennial plants, of the genus Fritillaria)"],"pronunciation":"/bi.biˈli.kə/","forms":{"plural":"bibilici","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bibilică","accusative-definite-nominative-singular":"bibilica","accusative-indefinite-nominative-plural":"bibilici","accusative-definite-nominative-plural":"bibilicile","dative-genitive-indefinite-singular":"bibilici","dative-definite-genitive-singular":"bibilicii","dative-genitive-indefinite-plural":"bibilici","dative-definite-genitive-plural":"bibilicilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bibilici","pos":"noun","definitions":["plural of bibilică"],"gender":"f"},{"word":"bibiloaică","pos":"noun","definitions":["female guinea fowl"],"forms":{"plural":"bibiloaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibiloaică","accusative-definite-nominative-singular":"bibiloaica","accusative-indefinite-nominative-plural":"bibiloaice","accusative-definite-nominative-plural":"bibiloaicele","dative-genitive-indefinite-singular":"bibiloaice","dative-definite-genitive-singular":"bibiloaicei","dative-genitive-indefinite-plural":"bibiloaice","dative-definite-genitive-plural":"bibiloaicelor","singular-vocative":"bibiloaică","plural-vocative":"bibiloaicelor"}},{"word":"bibiloi","pos":"noun","definitions":["male guinea fowl"],"forms":{"plural":"bibiloi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibiloi","accusative-definite-nominative-singular":"bibiloiul","accusative-indefinite-nominative-plural":"bibiloi","accusative-definite-nominative-plural":"bibiloii","dative-genitive-indefinite-singular":"bibiloi","dative-definite-genitive-singular":"bibiloiului","dative-genitive-indefinite-plural":"bibiloi","dative-definite-genitive-plural":"bibiloilor","singular-vocative":"bibiloiule","plural-vocative":"bibiloilor"}},{"word":"Bibirești","pos":"name","definitions":["a village in Ungureni, Bacău County, Romania"],"gender":"m"},{"word":"Biblia ebraică","pos":"name","definitions":["Hebrew Bible"],"pronunciation":"/ˈbi.bli.a eˈbra.i.kə/"},{"word":"biblic","pos":"adj","definitions":["scriptural"],"forms":{"feminine-singular":"biblică","masculine-plural":"biblici","feminine-neuter-plural":"biblice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biblic","error-unrecognized-form-feminine-indefinite-singular":"biblică","error-unrecognized-form-indefinite-masculine-plural":"biblici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biblice","definite-error-unrecognized-form-masculine-neuter-singular":"biblicul","definite-error-unrecognized-form-feminine-singular":"biblica","definite-error-unrecognized-form-masculine-plural":"biblicii","definite-error-unrecognized-form-feminine-neuter-plural":"biblicele"}},{"word":"biblicist","pos":"noun","definitions":["biblicist"],"forms":{"plural":"bibliciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biblicist","accusative-definite-nominative-singular":"biblicistul","accusative-indefinite-nominative-plural":"bibliciști","accusative-definite-nominative-plural":"bibliciștii","dative-genitive-indefinite-singular":"biblicist","dative-definite-genitive-singular":"biblicistului","dative-genitive-indefinite-plural":"bibliciști","dative-definite-genitive-plural":"bibliciștilor","singular-vocative":"biblicistule","plural-vocative":"bibliciștilor"}},{"word":"Biblie","pos":"name","definitions":["Bible (Christian holy book)"],"gender":"f","forms":{"plural":"Biblii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"Biblie","accusative-definite-nominative-singular":"Biblia","accusative-indefinite-nominative-plural":"Biblii","accusative-definite-nominative-plural":"Bibliile","dative-genitive-indefinite-singular":"Biblii","dative-definite-genitive-singular":"Bibliei","dative-genitive-indefinite-plural":"Biblii","dative-definite-genitive-plural":"Bibliilor","singular-vocative":"Biblie","plural-vocative":"Bibliilor"}},{"word":"biblie","pos":"noun","definitions":["Bible"],"pronunciation":"/ˈbi.bli.e/","forms":{"plural":"biblii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biblie","accusative-definite-nominative-singular":"biblia","accusative-indefinite-nominative-plural":"biblii","accusative-definite-nominative-plural":"bibliile","dative-genitive-indefinite-singular":"biblii","dative-definite-genitive-singular":"bibliei","dative-genitive-indefinite-plural":"biblii","dative-definite-genitive-plural":"bibliilor","singular-vocative":"biblie","plural-vocative":"bibliilor"}},{"word":"bibliobuz","pos":"noun","definitions":["bookmobile"],"forms":{"plural":"bibliobuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bibliobuz","accusative-definite-nominative-singular":"bibliobuzul","accusative-indefinite-nominative-plural":"bibliobuze","accusative-definite-nominative-plural":"bibliobuzele","dative-genitive-indefinite-singular":"bibliobuz","dative-definite-genitive-singular":"bibliobuzului","dative-genitive-indefinite-plural":"bibliobuze","dative-definite-genitive-plural":"bibliobuzelor","singular-vocative":"bibliobuzule","plural-vocative":"bibliobuzelor"}},{"word":"bibliofag","pos":"noun","definitions":["bibliophage"],"forms":{"plural":"bibliofagi","feminine":"equivalent bibliofagă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibliofag","accusative-definite-nominative-singular":"bibliofagul","accusative-indefinite-nominative-plural":"bibliofagi","accusative-definite-nominative-plural":"bibliofagii","dative-genitive-indefinite-singular":"bibliofag","dative-definite-genitive-singular":"bibliofagului","dative-genitive-indefinite-plural":"bibliofagi","dative-definite-genitive-plural":"bibliofagilor","singular-vocative":"bibliofagule","plural-vocative":"bibliofagilor"}},{"word":"bibliofagă","pos":"noun","definitions":["female equivalent of bibliofag"],"forms":{"plural":"bibliofage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliofagă","accusative-definite-nominative-singular":"bibliofaga","accusative-indefinite-nominative-plural":"bibliofage","accusative-definite-nominative-plural":"bibliofagele","dative-genitive-indefinite-singular":"bibliofage","dative-definite-genitive-singular":"bibliofagei","dative-genitive-indefinite-plural":"bibliofage","dative-definite-genitive-plural":"bibliofagelor","singular-vocative":"bibliofagă","plural-vocative":"bibliofagelor"}},{"word":"bibliofil","pos":"noun","definitions":["bibliophile"],"forms":{"plural":"bibliofili","feminine":"equivalent bibliofilă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibliofil","accusative-definite-nominative-singular":"bibliofilul","accusative-indefinite-nominative-plural":"bibliofili","accusative-definite-nominative-plural":"bibliofilii","dative-genitive-indefinite-singular":"bibliofil","dative-definite-genitive-singular":"bibliofilului","dative-genitive-indefinite-plural":"bibliofili","dative-definite-genitive-plural":"bibliofililor","singular-vocative":"bibliofilule","plural-vocative":"bibliofililor"}},{"word":"bibliofilă","pos":"noun","definitions":["female equivalent of bibliofil"],"forms":{"plural":"bibliofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliofilă","accusative-definite-nominative-singular":"bibliofila","accusative-indefinite-nominative-plural":"bibliofile","accusative-definite-nominative-plural":"bibliofilele","dative-genitive-indefinite-singular":"bibliofile","dative-definite-genitive-singular":"bibliofilei","dative-genitive-indefinite-plural":"bibliofile","dative-definite-genitive-plural":"bibliofilelor","singular-vocative":"bibliofilă","plural-vocative":"bibliofilelor"}},{"word":"bibliofilie","pos":"noun","definitions":["bibliophily"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bibliofilie","accusative-definite-nominative":"bibliofilia","dative-genitive-indefinite":"bibliofilii","dative-definite-genitive":"bibliofiliei","vocative":"bibliofilie"}},{"word":"bibliofilistic","pos":"adj","definitions":["bibliophilic"],"forms":{"feminine-singular":"bibliofilistică","masculine-plural":"bibliofilistici","feminine-neuter-plural":"bibliofilistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bibliofilistic","error-unrecognized-form-feminine-indefinite-singular":"bibliofilistică","error-unrecognized-form-indefinite-masculine-plural":"bibliofilistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bibliofilistice","definite-error-unrecognized-form-masculine-neuter-singular":"bibliofilisticul","definite-error-unrecognized-form-feminine-singular":"bibliofilistica","definite-error-unrecognized-form-masculine-plural":"bibliofilisticii","definite-error-unrecognized-form-feminine-neuter-plural":"bibliofilisticele"}},{"word":"bibliofilm","pos":"noun","definitions":["bibliofilm"],"forms":{"plural":"bibliofilme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bibliofilm","accusative-definite-nominative-singular":"bibliofilmul","accusative-indefinite-nominative-plural":"bibliofilme","accusative-definite-nominative-plural":"bibliofilmele","dative-genitive-indefinite-singular":"bibliofilm","dative-definite-genitive-singular":"bibliofilmului","dative-genitive-indefinite-plural":"bibliofilme","dative-definite-genitive-plural":"bibliofilmelor","singular-vocative":"bibliofilmule","plural-vocative":"bibliofilmelor"}},{"word":"bibliofob","pos":"noun","definitions":["bibliophobe"],"forms":{"plural":"bibliofobi","feminine":"equivalent bibliofobă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibliofob","accusative-definite-nominative-singular":"bibliofobul","accusative-indefinite-nominative-plural":"bibliofobi","accusative-definite-nominative-plural":"bibliofobii","dative-genitive-indefinite-singular":"bibliofob","dative-definite-genitive-singular":"bibliofobului","dative-genitive-indefinite-plural":"bibliofobi","dative-definite-genitive-plural":"bibliofobilor","singular-vocative":"bibliofobule","plural-vocative":"bibliofobilor"}},{"word":"bibliofobă","pos":"noun","definitions":["female equivalent of bibliofob"],"forms":{"plural":"bibliofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliofobă","accusative-definite-nominative-singular":"bibliofoba","accusative-indefinite-nominative-plural":"bibliofobe","accusative-definite-nominative-plural":"bibliofobele","dative-genitive-indefinite-singular":"bibliofobe","dative-definite-genitive-singular":"bibliofobei","dative-genitive-indefinite-plural":"bibliofobe","dative-definite-genitive-plural":"bibliofobelor","singular-vocative":"bibliofobă","plural-vocative":"bibliofobelor"}},{"word":"bibliofobie","pos":"noun","definitions":["bibliophobia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bibliofobie","accusative-definite-nominative":"bibliofobia","dative-genitive-indefinite":"bibliofobii","dative-definite-genitive":"bibliofobiei","vocative":"bibliofobie"}},{"word":"bibliograf","pos":"noun","definitions":["bibliographer"],"forms":{"plural":"bibliografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibliograf","accusative-definite-nominative-singular":"bibliograful","accusative-indefinite-nominative-plural":"bibliografi","accusative-definite-nominative-plural":"bibliografii","dative-genitive-indefinite-singular":"bibliograf","dative-definite-genitive-singular":"bibliografului","dative-genitive-indefinite-plural":"bibliografi","dative-definite-genitive-plural":"bibliografilor","singular-vocative":"bibliografule","plural-vocative":"bibliografilor"}},{"word":"bibliografic","pos":"adj","definitions":["bibliographic"],"forms":{"feminine-singular":"bibliografică","masculine-plural":"bibliografici","feminine-neuter-plural":"bibliografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bibliografic","error-unrecognized-form-feminine-indefinite-singular":"bibliografică","error-unrecognized-form-indefinite-masculine-plural":"bibliografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bibliografice","definite-error-unrecognized-form-masculine-neuter-singular":"bibliograficul","definite-error-unrecognized-form-feminine-singular":"bibliografica","definite-error-unrecognized-form-masculine-plural":"bibliograficii","definite-error-unrecognized-form-feminine-neuter-plural":"bibliograficele"}},{"word":"bibliografie","pos":"noun","definitions":["bibliography"],"forms":{"plural":"bibliografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bibliografie","accusative-definite-nominative-singular":"bibliografia","accusative-indefinite-nominative-plural":"bibliografii","accusative-definite-nominative-plural":"bibliografiile","dative-genitive-indefinite-singular":"bibliografii","dative-definite-genitive-singular":"bibliografiei","dative-genitive-indefinite-plural":"bibliografii","dative-definite-genitive-plural":"bibliografiilor","singular-vocative":"bibliografie","plural-vocative":"bibliografiilor"}},{"word":"bibliolatrie","pos":"noun","definitions":["bibliolatry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bibliolatrie","accusative-definite-nominative":"bibliolatria","dative-genitive-indefinite":"bibliolatrii","dative-definite-genitive":"bibliolatriei","vocative":"bibliolatrie"}},{"word":"bibliolog","pos":"noun","definitions":["bibliologist"],"forms":{"plural":"bibliologi","feminine":"equivalent bibliologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bibliolog","accusative-definite-nominative-singular":"bibliologul","accusative-indefinite-nominative-plural":"bibliologi","accusative-definite-nominative-plural":"bibliologii","dative-genitive-indefinite-singular":"bibliolog","dative-definite-genitive-singular":"bibliologului","dative-genitive-indefinite-plural":"bibliologi","dative-definite-genitive-plural":"bibliologilor","singular-vocative":"bibliologule","plural-vocative":"bibliologilor"}},{"word":"bibliologă","pos":"noun","definitions":["female equivalent of bibliolog"],"forms":{"plural":"bibliologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliologă","accusative-definite-nominative-singular":"bibliologa","accusative-indefinite-nominative-plural":"bibliologe","accusative-definite-nominative-plural":"bibliologele","dative-genitive-indefinite-singular":"bibliologe","dative-definite-genitive-singular":"bibliologei","dative-genitive-indefinite-plural":"bibliologe","dative-definite-genitive-plural":"bibliologelor","singular-vocative":"bibliologă","plural-vocative":"bibliologelor"}},{"word":"bibliologic","pos":"adj","definitions":["bibliological"],"forms":{"feminine-singular":"bibliologică","masculine-plural":"bibliologici","feminine-neuter-plural":"bibliologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bibliologic","error-unrecognized-form-feminine-indefinite-singular":"bibliologică","error-unrecognized-form-indefinite-masculine-plural":"bibliologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bibliologice","definite-error-unrecognized-form-masculine-neuter-singular":"bibliologicul","definite-error-unrecognized-form-feminine-singular":"bibliologica","definite-error-unrecognized-form-masculine-plural":"bibliologicii","definite-error-unrecognized-form-feminine-neuter-plural":"bibliologicele"}},{"word":"bibliologie","pos":"noun","definitions":["bibliology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bibliologie","accusative-definite-nominative":"bibliologia","dative-genitive-indefinite":"bibliologii","dative-definite-genitive":"bibliologiei","vocative":"bibliologie"}},{"word":"biblioman","pos":"noun","definitions":["bibliomaniac"],"forms":{"plural":"bibliomani","feminine":"equivalent bibliomană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biblioman","accusative-definite-nominative-singular":"bibliomanul","accusative-indefinite-nominative-plural":"bibliomani","accusative-definite-nominative-plural":"bibliomanii","dative-genitive-indefinite-singular":"biblioman","dative-definite-genitive-singular":"bibliomanului","dative-genitive-indefinite-plural":"bibliomani","dative-definite-genitive-plural":"bibliomanilor","singular-vocative":"bibliomanule","plural-vocative":"bibliomanilor"}},{"word":"bibliomană","pos":"noun","definitions":["female equivalent of biblioman"],"forms":{"plural":"bibliomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliomană","accusative-definite-nominative-singular":"bibliomana","accusative-indefinite-nominative-plural":"bibliomane","accusative-definite-nominative-plural":"bibliomanele","dative-genitive-indefinite-singular":"bibliomane","dative-definite-genitive-singular":"bibliomanei","dative-genitive-indefinite-plural":"bibliomane","dative-definite-genitive-plural":"bibliomanelor","singular-vocative":"bibliomană","plural-vocative":"bibliomanelor"}},{"word":"bibliomanie","pos":"noun","definitions":["bibliomania"],"forms":{"plural":"bibliomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bibliomanie","accusative-definite-nominative-singular":"bibliomania","accusative-indefinite-nominative-plural":"bibliomanii","accusative-definite-nominative-plural":"bibliomaniile","dative-genitive-indefinite-singular":"bibliomanii","dative-definite-genitive-singular":"bibliomaniei","dative-genitive-indefinite-plural":"bibliomanii","dative-definite-genitive-plural":"bibliomaniilor","singular-vocative":"bibliomanie","plural-vocative":"bibliomaniilor"}},{"word":"biblioraft","pos":"noun","definitions":["arch file"],"forms":{"plural":"bibliorafturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"biblioraft","accusative-definite-nominative-singular":"biblioraftul","accusative-indefinite-nominative-plural":"bibliorafturi","accusative-definite-nominative-plural":"bibliorafturile","dative-genitive-indefinite-singular":"biblioraft","dative-definite-genitive-singular":"biblioraftului","dative-genitive-indefinite-plural":"bibliorafturi","dative-definite-genitive-plural":"bibliorafturilor","singular-vocative":"biblioraftule","plural-vocative":"bibliorafturilor"}},{"word":"biblioteca","pos":"noun","definitions":["definite nominative/accusative singular of bibliotecă"],"pronunciation":"[bib.li.oˈte.ka]","gender":"f"},{"word":"bibliotecă","pos":"noun","definitions":["library","bookcase"],"pronunciation":"/bi.bli.oˈte.kə/","forms":{"plural":"biblioteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bibliotecă","accusative-definite-nominative-singular":"biblioteca","accusative-indefinite-nominative-plural":"biblioteci","accusative-definite-nominative-plural":"bibliotecile","dative-genitive-indefinite-singular":"biblioteci","dative-definite-genitive-singular":"bibliotecii","dative-genitive-indefinite-plural":"biblioteci","dative-definite-genitive-plural":"bibliotecilor","singular-vocative":"bibliotecă","plural-vocative":"bibliotecilor"}},{"word":"bibliotecă volantă","pos":"noun","definitions":["mobile library"],"forms":{"plural":"biblioteci volante"}},{"word":"bibliotecar","pos":"noun","definitions":["librarian"],"pronunciation":"/bi.bli.o.teˈkar/","forms":{"plural":"bibliotecari","feminine":"equivalent bibliotecară"}},{"word":"bibliotecar","pos":"adj","definitions":["library (attributive)"],"pronunciation":"/bi.bli.o.teˈkar/","forms":{"feminine-singular":"bibliotecară","masculine-plural":"bibliotecari","feminine-neuter-plural":"bibliotecare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bibliotecar","error-unrecognized-form-feminine-indefinite-singular":"bibliotecară","error-unrecognized-form-indefinite-masculine-plural":"bibliotecari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bibliotecare","definite-error-unrecognized-form-masculine-neuter-singular":"bibliotecarul","definite-error-unrecognized-form-feminine-singular":"bibliotecara","definite-error-unrecognized-form-masculine-plural":"bibliotecarii","definite-error-unrecognized-form-feminine-neuter-plural":"bibliotecarele"}},{"word":"bibliotecară","pos":"noun","definitions":["female equivalent of bibliotecar"],"forms":{"plural":"bibliotecare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliotecară","accusative-definite-nominative-singular":"bibliotecara","accusative-indefinite-nominative-plural":"bibliotecare","accusative-definite-nominative-plural":"bibliotecarele","dative-genitive-indefinite-singular":"bibliotecare","dative-definite-genitive-singular":"bibliotecarei","dative-genitive-indefinite-plural":"bibliotecare","dative-definite-genitive-plural":"bibliotecarelor","singular-vocative":"bibliotecară","plural-vocative":"bibliotecarelor"}},{"word":"bibliotecari","pos":"noun","definitions":["plural of bibliotecar"],"gender":"m"},{"word":"bibliotecari","pos":"adj","definitions":["masculine plural of bibliotecar"]},{"word":"biblioteci","pos":"noun","definitions":["inflection of bibliotecă:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"biblioteconomic","pos":"adj","definitions":["library science"],"forms":{"feminine-singular":"biblioteconomică","masculine-plural":"biblioteconomici","feminine-neuter-plural":"biblioteconomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biblioteconomic","error-unrecognized-form-feminine-indefinite-singular":"biblioteconomică","error-unrecognized-form-indefinite-masculine-plural":"biblioteconomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biblioteconomice","definite-error-unrecognized-form-masculine-neuter-singular":"biblioteconomicul","definite-error-unrecognized-form-feminine-singular":"biblioteconomica","definite-error-unrecognized-form-masculine-plural":"biblioteconomicii","definite-error-unrecognized-form-feminine-neuter-plural":"biblioteconomicele"}},{"word":"biblioteconomie","pos":"noun","definitions":["library science, librarianship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biblioteconomie","accusative-definite-nominative":"biblioteconomia","dative-genitive-indefinite":"biblioteconomii","dative-definite-genitive":"biblioteconomiei","vocative":"biblioteconomie"}},{"word":"bibliotecuță","pos":"noun","definitions":["diminutive of bibliotecă"],"forms":{"plural":"bibliotecuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bibliotecuță","accusative-definite-nominative-singular":"bibliotecuța","accusative-indefinite-nominative-plural":"bibliotecuțe","accusative-definite-nominative-plural":"bibliotecuțele","dative-genitive-indefinite-singular":"bibliotecuțe","dative-definite-genitive-singular":"bibliotecuței","dative-genitive-indefinite-plural":"bibliotecuțe","dative-definite-genitive-plural":"bibliotecuțelor","singular-vocative":"bibliotecuță","plural-vocative":"bibliotecuțelor"}},{"word":"biblist","pos":"noun","definitions":["biblist"],"forms":{"plural":"bibliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biblist","accusative-definite-nominative-singular":"biblistul","accusative-indefinite-nominative-plural":"bibliști","accusative-definite-nominative-plural":"bibliștii","dative-genitive-indefinite-singular":"biblist","dative-definite-genitive-singular":"biblistului","dative-genitive-indefinite-plural":"bibliști","dative-definite-genitive-plural":"bibliștilor","singular-vocative":"biblistule","plural-vocative":"bibliștilor"}},{"word":"biblistă","pos":"noun","definitions":["female equivalent of biblist"],"forms":{"plural":"bibliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biblistă","accusative-definite-nominative-singular":"biblista","accusative-indefinite-nominative-plural":"bibliste","accusative-definite-nominative-plural":"biblistele","dative-genitive-indefinite-singular":"bibliste","dative-definite-genitive-singular":"biblistei","dative-genitive-indefinite-plural":"bibliste","dative-definite-genitive-plural":"biblistelor","singular-vocative":"biblistă","plural-vocative":"biblistelor"}},{"word":"biboarcă","pos":"noun","definitions":["female buffalo"],"forms":{"plural":"biboarce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biboarcă","accusative-definite-nominative-singular":"biboarca","accusative-indefinite-nominative-plural":"biboarce","accusative-definite-nominative-plural":"biboarcele","dative-genitive-indefinite-singular":"biboarce","dative-definite-genitive-singular":"biboarcei","dative-genitive-indefinite-plural":"biboarce","dative-definite-genitive-plural":"biboarcelor","singular-vocative":"biboarcă","plural-vocative":"biboarcelor"}},{"word":"Biborțeni","pos":"name","definitions":["a village in Baraolt, Covasna County, Romania"],"gender":"m"},{"word":"Bibulești","pos":"name","definitions":["a village in Dănciulești, Gorj County, Romania"],"gender":"m"},{"word":"Bic","pos":"name","definitions":["a locality in Șimleu Silvaniei, Sălaj County, Romania"],"gender":"m"},{"word":"Bica","pos":"name","definitions":["a village in Mănăstireni, Cluj County, Romania"],"gender":"f"},{"word":"Bicăcel","pos":"name","definitions":["a village in Lăzăreni, Bihor County, Romania"],"gender":"m"},{"word":"Bicaci","pos":"name","definitions":["a village in Gepiu, Bihor County, Romania"],"gender":"m"},{"word":"Bicăjel","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bicaz"],"gender":"m"},{"word":"Bicălatu","pos":"name","definitions":["a locality in Huedin, Cluj County, Romania"],"gender":"m"},{"word":"bicameral","pos":"adj","definitions":["bicameral"],"forms":{"feminine-singular":"bicamerală","masculine-plural":"bicamerali","feminine-neuter-plural":"bicamerale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicameral","error-unrecognized-form-feminine-indefinite-singular":"bicamerală","error-unrecognized-form-indefinite-masculine-plural":"bicamerali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicamerale","definite-error-unrecognized-form-masculine-neuter-singular":"bicameralul","definite-error-unrecognized-form-feminine-singular":"bicamerala","definite-error-unrecognized-form-masculine-plural":"bicameralii","definite-error-unrecognized-form-feminine-neuter-plural":"bicameralele"}},{"word":"bicameralism","pos":"noun","definitions":["bicameralism"],"forms":{"plural":"bicameralisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bicameralism","accusative-definite-nominative-singular":"bicameralismul","accusative-indefinite-nominative-plural":"bicameralisme","accusative-definite-nominative-plural":"bicameralismele","dative-genitive-indefinite-singular":"bicameralism","dative-definite-genitive-singular":"bicameralismului","dative-genitive-indefinite-plural":"bicameralisme","dative-definite-genitive-plural":"bicameralismelor","singular-vocative":"bicameralismule","plural-vocative":"bicameralismelor"}},{"word":"bicamerism","pos":"noun","definitions":["bicameralism"],"forms":{"plural":"bicamerisme","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicamerism","accusative-definite-nominative-singular":"bicamerismul","accusative-indefinite-nominative-plural":"bicamerisme","accusative-definite-nominative-plural":"bicamerismei","dative-genitive-indefinite-singular":"bicamerism","dative-definite-genitive-singular":"bicamerismului","dative-genitive-indefinite-plural":"bicamerisme","dative-definite-genitive-plural":"bicamerismelor","singular-vocative":"bicamerismule","plural-vocative":"bicamerismelor"}},{"word":"Bican","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bican"}},{"word":"bicarbonat","pos":"noun","definitions":["bicarbonate"],"forms":{"plural":"bicarbonați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicarbonat","accusative-definite-nominative-singular":"bicarbonatul","accusative-indefinite-nominative-plural":"bicarbonați","accusative-definite-nominative-plural":"bicarbonații","dative-genitive-indefinite-singular":"bicarbonat","dative-definite-genitive-singular":"bicarbonatului","dative-genitive-indefinite-plural":"bicarbonați","dative-definite-genitive-plural":"bicarbonaților","singular-vocative":"bicarbonatule","plural-vocative":"bicarbonaților"}},{"word":"bicarbonat de sodiu","pos":"noun","definitions":["sodium bicarbonate"]},{"word":"bicarbură","pos":"noun","definitions":["dicarbide"],"forms":{"plural":"bicarburi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bicarbură","accusative-definite-nominative-singular":"bicarbura","accusative-indefinite-nominative-plural":"bicarburi","accusative-definite-nominative-plural":"bicarburile","dative-genitive-indefinite-singular":"bicarburi","dative-definite-genitive-singular":"bicarburii","dative-genitive-indefinite-plural":"bicarburi","dative-definite-genitive-plural":"bicarburilor","singular-vocative":"bicarbură","plural-vocative":"bicarburilor"}},{"word":"bicarpelar","pos":"adj","definitions":["bicarpellary (having two carpels)"],"forms":{"feminine-singular":"bicarpelară","masculine-plural":"bicarpelari","feminine-neuter-plural":"bicarpelare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicarpelar","error-unrecognized-form-feminine-indefinite-singular":"bicarpelară","error-unrecognized-form-indefinite-masculine-plural":"bicarpelari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicarpelare","definite-error-unrecognized-form-masculine-neuter-singular":"bicarpelarul","definite-error-unrecognized-form-feminine-singular":"bicarpelara","definite-error-unrecognized-form-masculine-plural":"bicarpelarii","definite-error-unrecognized-form-feminine-neuter-plural":"bicarpelarele"}},{"word":"bicaș","pos":"noun","definitions":["flint"],"forms":{"plural":"bicași","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bicaș","accusative-definite-nominative-singular":"bicașul","accusative-indefinite-nominative-plural":"bicași","accusative-definite-nominative-plural":"bicașile","dative-genitive-indefinite-singular":"bicaș","dative-definite-genitive-singular":"bicașului","dative-genitive-indefinite-plural":"bicași","dative-definite-genitive-plural":"bicașilor","singular-vocative":"bicașule","plural-vocative":"bicașilor"}},{"word":"bicășel","pos":"noun","definitions":["diminutive of bicaș"],"forms":{"plural":"bicășei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicășel","accusative-definite-nominative-singular":"bicășelul","accusative-indefinite-nominative-plural":"bicășei","accusative-definite-nominative-plural":"bicășeii","dative-genitive-indefinite-singular":"bicășel","dative-definite-genitive-singular":"bicășelului","dative-genitive-indefinite-plural":"bicășei","dative-definite-genitive-plural":"bicășeilor","singular-vocative":"bicășelule","plural-vocative":"bicășeilor"}},{"word":"Bicașu","pos":"name","definitions":["a village in Hodac, Mureș County, Romania"],"gender":"m"},{"word":"bicașuț","pos":"noun","definitions":["pebble"],"forms":{"plural":"bicașuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicașuț","accusative-definite-nominative-singular":"bicașuțul","accusative-indefinite-nominative-plural":"bicașuți","accusative-definite-nominative-plural":"bicașuții","dative-genitive-indefinite-singular":"bicașuț","dative-definite-genitive-singular":"bicașuțului","dative-genitive-indefinite-plural":"bicașuți","dative-definite-genitive-plural":"bicașuților","singular-vocative":"bicașuțule","plural-vocative":"bicașuților"}},{"word":"Bicău","pos":"name","definitions":["a village in Pomi, Satu Mare County, Romania"],"gender":"m"},{"word":"Bicaz","pos":"name","definitions":["a town in Neamț County, Romania"],"pronunciation":"/biˈkaz/","gender":"m"},{"word":"Bicaz","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Bicaz, Maramureș County, Romania"],"pronunciation":"/biˈkaz/","gender":"m"},{"word":"Bicaz-Chei","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Bicaz-Chei, Neamț County, Romania"],"gender":"m"},{"word":"Bicazu Ardelean","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Bicazu Ardelean, Neamț County, Romania"],"gender":"m"},{"word":"bicefal","pos":"adj","definitions":["bicephalous"],"forms":{"feminine-singular":"bicefală","masculine-plural":"bicefali","feminine-neuter-plural":"bicefale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicefal","error-unrecognized-form-feminine-indefinite-singular":"bicefală","error-unrecognized-form-indefinite-masculine-plural":"bicefali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicefale","definite-error-unrecognized-form-masculine-neuter-singular":"bicefalul","definite-error-unrecognized-form-feminine-singular":"bicefala","definite-error-unrecognized-form-masculine-plural":"bicefalii","definite-error-unrecognized-form-feminine-neuter-plural":"bicefalele"}},{"word":"bicefalic","pos":"adj","definitions":["bicephalic"],"forms":{"feminine-singular":"bicefalică","masculine-plural":"bicefalici","feminine-neuter-plural":"bicefalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicefalic","error-unrecognized-form-feminine-indefinite-singular":"bicefalică","error-unrecognized-form-indefinite-masculine-plural":"bicefalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicefalice","definite-error-unrecognized-form-masculine-neuter-singular":"bicefalicul","definite-error-unrecognized-form-feminine-singular":"bicefalica","definite-error-unrecognized-form-masculine-plural":"bicefalicii","definite-error-unrecognized-form-feminine-neuter-plural":"bicefalicele"}},{"word":"bicefalie","pos":"noun","definitions":["bicephaly"],"forms":{"plural":"bicefalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bicefalie","accusative-definite-nominative-singular":"bicefalia","accusative-indefinite-nominative-plural":"bicefalii","accusative-definite-nominative-plural":"bicefaliile","dative-genitive-indefinite-singular":"bicefalii","dative-definite-genitive-singular":"bicefaliei","dative-genitive-indefinite-plural":"bicefalii","dative-definite-genitive-plural":"bicefaliilor","singular-vocative":"bicefalie","plural-vocative":"bicefaliilor"}},{"word":"bicentenar","pos":"noun","definitions":["bicentennial"],"forms":{"plural":"bicentenari","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bicentenar","accusative-definite-nominative-singular":"bicentenarul","accusative-indefinite-nominative-plural":"bicentenari","accusative-definite-nominative-plural":"bicentenarile","dative-genitive-indefinite-singular":"bicentenar","dative-definite-genitive-singular":"bicentenarului","dative-genitive-indefinite-plural":"bicentenari","dative-definite-genitive-plural":"bicentenarilor","singular-vocative":"bicentenarule","plural-vocative":"bicentenarilor"}},{"word":"biceps","pos":"noun","definitions":["biceps; any two-headed muscle","the biceps brachii"],"forms":{"plural":"bicepși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biceps","accusative-definite-nominative-singular":"bicepsul","accusative-indefinite-nominative-plural":"bicepși","accusative-definite-nominative-plural":"bicepșii","dative-genitive-indefinite-singular":"biceps","dative-definite-genitive-singular":"bicepsului","dative-genitive-indefinite-plural":"bicepși","dative-definite-genitive-plural":"bicepșilor","singular-vocative":"bicepsule","plural-vocative":"bicepșilor"}},{"word":"Bicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bicescu"}},{"word":"Biceștii de Jos","pos":"name","definitions":["a village in Dumitrești, Vrancea County, Romania"],"gender":"m"},{"word":"Biceștii de Sus","pos":"name","definitions":["a village in Dumitrești, Vrancea County, Romania"],"gender":"m"},{"word":"Bicfalău","pos":"name","definitions":["a village in Ozun, Covasna County, Romania"],"gender":"m"},{"word":"bicher","pos":"noun","definitions":["cheerful man"],"forms":{"plural":"bicheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicher","accusative-definite-nominative-singular":"bicherul","accusative-indefinite-nominative-plural":"bicheri","accusative-definite-nominative-plural":"bicherii","dative-genitive-indefinite-singular":"bicher","dative-definite-genitive-singular":"bicherului","dative-genitive-indefinite-plural":"bicheri","dative-definite-genitive-plural":"bicherilor","singular-vocative":"bicherule","plural-vocative":"bicherilor"}},{"word":"bicheraș","pos":"noun","definitions":["diminutive of bicher"],"forms":{"plural":"bicherași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicheraș","accusative-definite-nominative-singular":"bicherașul","accusative-indefinite-nominative-plural":"bicherași","accusative-definite-nominative-plural":"bicherașii","dative-genitive-indefinite-singular":"bicheraș","dative-definite-genitive-singular":"bicherașului","dative-genitive-indefinite-plural":"bicherași","dative-definite-genitive-plural":"bicherașilor","singular-vocative":"bicherașule","plural-vocative":"bicherașilor"}},{"word":"Bichești","pos":"name","definitions":["a village in Boghești, Vrancea County, Romania"],"gender":"m"},{"word":"Bichigean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bichigean"}},{"word":"Bichigeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bichigeanu"}},{"word":"Bichigi","pos":"name","definitions":["a village in Făget, Timiș County, Romania"],"gender":"m"},{"word":"Bichigiu","pos":"name","definitions":["a village in Telciu, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"bichiri","pos":"verb","definitions":["obsolete form of bicheri"],"forms":{"canonical":"a bichiri 4th conjugation","present-singular-third-person":"bichirește","participle-past":"bichirit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bichiri","gerund":"bichirind","first-person-indicative-present-singular":"bichiresc","indicative-present-second-person-singular":"bichirești","indicative-present-singular-third-person":"bichirește","first-person-indicative-plural-present":"bichirim","indicative-plural-present-second-person":"bichiriți","indicative-plural-present-third-person":"bichiresc","first-person-imperfect-indicative-singular":"bichiream","imperfect-indicative-second-person-singular":"bichireai","imperfect-indicative-singular-third-person":"bichirea","first-person-imperfect-indicative-plural":"bichiream","imperfect-indicative-plural-second-person":"bichireați","imperfect-indicative-plural-third-person":"bichireau","first-person-indicative-perfect-singular":"bichirii","indicative-perfect-second-person-singular":"bichiriși","indicative-perfect-singular-third-person":"bichiri","first-person-indicative-perfect-plural":"bichirirăm","indicative-perfect-plural-second-person":"bichirirăți","indicative-perfect-plural-third-person":"bichiriră","first-person-indicative-pluperfect-singular":"bichirisem","indicative-pluperfect-second-person-singular":"bichiriseși","indicative-pluperfect-singular-third-person":"bichirise","first-person-indicative-pluperfect-plural":"bichiriserăm","indicative-pluperfect-plural-second-person":"bichiriserăți","indicative-pluperfect-plural-third-person":"bichiriseră","first-person-present-singular-subjunctive":"să bichiresc","present-second-person-singular-subjunctive":"să bichirești","present-singular-subjunctive-third-person":"să bichirească","first-person-plural-present-subjunctive":"să bichirim","plural-present-second-person-subjunctive":"să bichiriți","plural-present-subjunctive-third-person":"să bichirească","imperative-second-person-singular":"bichirește","imperative-plural-second-person":"bichiriți","imperative-negative-second-person-singular":"nu bichiri","imperative-negative-plural-second-person":"nu bichiriți"}},{"word":"Bichiș","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Bichiș, Mureș County, Romania"],"gender":"m"},{"word":"bici","pos":"noun","definitions":["whip, horsewhip, scourge"],"forms":{"plural":"bice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bici","accusative-definite-nominative-singular":"biciul","accusative-indefinite-nominative-plural":"bice","accusative-definite-nominative-plural":"bicele","dative-genitive-indefinite-singular":"bici","dative-definite-genitive-singular":"biciului","dative-genitive-indefinite-plural":"bice","dative-definite-genitive-plural":"bicelor","singular-vocative":"biciule","plural-vocative":"bicelor"}},{"word":"bicicaș","pos":"noun","definitions":["pickpocket, thief"],"forms":{"plural":"bicicași","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bicicaș","accusative-definite-nominative-singular":"bicicașul","accusative-indefinite-nominative-plural":"bicicași","accusative-definite-nominative-plural":"bicicașile","dative-genitive-indefinite-singular":"bicicaș","dative-definite-genitive-singular":"bicicașului","dative-genitive-indefinite-plural":"bicicași","dative-definite-genitive-plural":"bicicașilor","singular-vocative":"bicicașule","plural-vocative":"bicicașilor"}},{"word":"bicicleta","pos":"noun","definitions":["definite nominative/accusative singular of bicicletă"],"pronunciation":"[bit͡ʃiˈkleta]","gender":"f"},{"word":"bicicletă","pos":"noun","definitions":["bicycle"],"pronunciation":"/bi.t͡ʃiˈkle.tə/","forms":{"plural":"biciclete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bicicletă","accusative-definite-nominative-singular":"bicicleta","accusative-indefinite-nominative-plural":"biciclete","accusative-definite-nominative-plural":"bicicletele","dative-genitive-indefinite-singular":"biciclete","dative-definite-genitive-singular":"bicicletei","dative-genitive-indefinite-plural":"biciclete","dative-definite-genitive-plural":"bicicletelor","singular-vocative":"bicicletă","plural-vocative":"bicicletelor"}},{"word":"biciclic","pos":"adj","definitions":["bicyclic"],"forms":{"feminine-singular":"biciclică","masculine-plural":"biciclici","feminine-neuter-plural":"biciclice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biciclic","error-unrecognized-form-feminine-indefinite-singular":"biciclică","error-unrecognized-form-indefinite-masculine-plural":"biciclici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biciclice","definite-error-unrecognized-form-masculine-neuter-singular":"biciclicul","definite-error-unrecognized-form-feminine-singular":"biciclica","definite-error-unrecognized-form-masculine-plural":"biciclicii","definite-error-unrecognized-form-feminine-neuter-plural":"biciclicele"}},{"word":"biciclist","pos":"noun","definitions":["bicyclist"],"forms":{"plural":"bicicliști","feminine":"equivalent biciclistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biciclist","accusative-definite-nominative-singular":"biciclistul","accusative-indefinite-nominative-plural":"bicicliști","accusative-definite-nominative-plural":"bicicliștii","dative-genitive-indefinite-singular":"biciclist","dative-definite-genitive-singular":"biciclistului","dative-genitive-indefinite-plural":"bicicliști","dative-definite-genitive-plural":"bicicliștilor","singular-vocative":"biciclistule","plural-vocative":"bicicliștilor"}},{"word":"biciclistă","pos":"noun","definitions":["female equivalent of biciclist"],"forms":{"plural":"bicicliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biciclistă","accusative-definite-nominative-singular":"biciclista","accusative-indefinite-nominative-plural":"bicicliste","accusative-definite-nominative-plural":"biciclistele","dative-genitive-indefinite-singular":"bicicliste","dative-definite-genitive-singular":"biciclistei","dative-genitive-indefinite-plural":"bicicliste","dative-definite-genitive-plural":"biciclistelor","singular-vocative":"biciclistă","plural-vocative":"biciclistelor"}},{"word":"biciclu","pos":"noun","definitions":["bicycle"],"forms":{"plural":"bicicle","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biciclu","accusative-definite-nominative-singular":"biciclul","accusative-indefinite-nominative-plural":"bicicle","accusative-definite-nominative-plural":"biciclele","dative-genitive-indefinite-singular":"biciclu","dative-definite-genitive-singular":"biciclului","dative-genitive-indefinite-plural":"bicicle","dative-definite-genitive-plural":"biciclelor","singular-vocative":"biciclule","plural-vocative":"biciclelor"}},{"word":"bicisnic","pos":"adj","definitions":["alternative form of becisnic"],"forms":{"feminine-singular":"bicisnică","masculine-plural":"bicisnici","feminine-neuter-plural":"bicisnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicisnic","error-unrecognized-form-feminine-indefinite-singular":"bicisnică","error-unrecognized-form-indefinite-masculine-plural":"bicisnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicisnice","definite-error-unrecognized-form-masculine-neuter-singular":"bicisnicul","definite-error-unrecognized-form-feminine-singular":"bicisnica","definite-error-unrecognized-form-masculine-plural":"bicisnicii","definite-error-unrecognized-form-feminine-neuter-plural":"bicisnicele"}},{"word":"bicisnică","pos":"noun","definitions":["female equivalent of bicisnic"],"forms":{"plural":"bicisnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bicisnică","accusative-definite-nominative-singular":"bicisnica","accusative-indefinite-nominative-plural":"bicisnice","accusative-definite-nominative-plural":"bicisnicele","dative-genitive-indefinite-singular":"bicisnice","dative-definite-genitive-singular":"bicisnicei","dative-genitive-indefinite-plural":"bicisnice","dative-definite-genitive-plural":"bicisnicelor","singular-vocative":"bicisnică","plural-vocative":"bicisnicelor"}},{"word":"bicisnicie","pos":"noun","definitions":["alternative form of becisnicie"],"forms":{"plural":"bicisnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bicisnicie","accusative-definite-nominative-singular":"bicisnicia","accusative-indefinite-nominative-plural":"bicisnicii","accusative-definite-nominative-plural":"bicisniciile","dative-genitive-indefinite-singular":"bicisnicii","dative-definite-genitive-singular":"bicisniciei","dative-genitive-indefinite-plural":"bicisnicii","dative-definite-genitive-plural":"bicisniciilor","singular-vocative":"bicisnicie","plural-vocative":"bicisniciilor"}},{"word":"bicișor","pos":"noun","definitions":["diminutive of bici"],"forms":{"plural":"bicișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bicișor","accusative-definite-nominative-singular":"bicișorul","accusative-indefinite-nominative-plural":"bicișoare","accusative-definite-nominative-plural":"bicișoarele","dative-genitive-indefinite-singular":"bicișor","dative-definite-genitive-singular":"bicișorului","dative-genitive-indefinite-plural":"bicișoare","dative-definite-genitive-plural":"bicișoarelor","singular-vocative":"bicișorule","plural-vocative":"bicișoarelor"}},{"word":"bicitoc","pos":"noun","definitions":["pumpkin"],"forms":{"plural":"bicitoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicitoc","accusative-definite-nominative-singular":"bicitocul","accusative-indefinite-nominative-plural":"bicitoci","accusative-definite-nominative-plural":"bicitocii","dative-genitive-indefinite-singular":"bicitoc","dative-definite-genitive-singular":"bicitocului","dative-genitive-indefinite-plural":"bicitoci","dative-definite-genitive-plural":"bicitocilor","singular-vocative":"bicitocule","plural-vocative":"bicitocilor"}},{"word":"biciui","pos":"verb","definitions":["to whip"],"forms":{"canonical":"a biciui 4th conjugation","present-singular-third-person":"biciuiește","participle-past":"biciuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a biciui","gerund":"biciuind","first-person-indicative-present-singular":"biciuiesc","indicative-present-second-person-singular":"biciuiești","indicative-present-singular-third-person":"biciuiește","first-person-indicative-plural-present":"biciuim","indicative-plural-present-second-person":"biciuiți","indicative-plural-present-third-person":"biciuiesc","first-person-imperfect-indicative-singular":"biciuiam","imperfect-indicative-second-person-singular":"biciuiai","imperfect-indicative-singular-third-person":"biciuia","first-person-imperfect-indicative-plural":"biciuiam","imperfect-indicative-plural-second-person":"biciuiați","imperfect-indicative-plural-third-person":"biciuiau","first-person-indicative-perfect-singular":"biciuii","indicative-perfect-second-person-singular":"biciuiși","indicative-perfect-singular-third-person":"biciui","first-person-indicative-perfect-plural":"biciuirăm","indicative-perfect-plural-second-person":"biciuirăți","indicative-perfect-plural-third-person":"biciuiră","first-person-indicative-pluperfect-singular":"biciuisem","indicative-pluperfect-second-person-singular":"biciuiseși","indicative-pluperfect-singular-third-person":"biciuise","first-person-indicative-pluperfect-plural":"biciuiserăm","indicative-pluperfect-plural-second-person":"biciuiserăți","indicative-pluperfect-plural-third-person":"biciuiseră","first-person-present-singular-subjunctive":"să biciuiesc","present-second-person-singular-subjunctive":"să biciuiești","present-singular-subjunctive-third-person":"să biciuiască","first-person-plural-present-subjunctive":"să biciuim","plural-present-second-person-subjunctive":"să biciuiți","plural-present-subjunctive-third-person":"să biciuiască","imperative-second-person-singular":"biciuiește","imperative-plural-second-person":"biciuiți","imperative-negative-second-person-singular":"nu biciui","imperative-negative-plural-second-person":"nu biciuiți"}},{"word":"biciuială","pos":"noun","definitions":["whipping"],"forms":{"plural":"biciueli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biciuială","accusative-definite-nominative-singular":"biciuiala","accusative-indefinite-nominative-plural":"biciuele","accusative-definite-nominative-plural":"biciuelele","dative-genitive-indefinite-singular":"biciuele","dative-definite-genitive-singular":"biciuelei","dative-genitive-indefinite-plural":"biciuele","dative-definite-genitive-plural":"biciuelelor","singular-vocative":"biciuială","plural-vocative":"biciuelelor"}},{"word":"biciuire","pos":"noun","definitions":["whipping"],"forms":{"plural":"biciuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biciuire","accusative-definite-nominative-singular":"biciuirea","accusative-indefinite-nominative-plural":"biciuiri","accusative-definite-nominative-plural":"biciuirile","dative-genitive-indefinite-singular":"biciuiri","dative-definite-genitive-singular":"biciuirii","dative-genitive-indefinite-plural":"biciuiri","dative-definite-genitive-plural":"biciuirilor","singular-vocative":"biciuire","plural-vocative":"biciuirilor"}},{"word":"biciuit","pos":"adj","definitions":["whipped"],"forms":{"feminine-singular":"biciuită","masculine-plural":"biciuiți","feminine-neuter-plural":"biciuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biciuit","error-unrecognized-form-feminine-indefinite-singular":"biciuită","error-unrecognized-form-indefinite-masculine-plural":"biciuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"biciuite","definite-error-unrecognized-form-masculine-neuter-singular":"biciuitul","definite-error-unrecognized-form-feminine-singular":"biciuita","definite-error-unrecognized-form-masculine-plural":"biciuiții","definite-error-unrecognized-form-feminine-neuter-plural":"biciuitele"}},{"word":"biciuit","pos":"verb","definitions":["past participle of biciui"],"forms":{"participle-past":"of biciui"}},{"word":"biciuitor","pos":"adj","definitions":["lashing"],"forms":{"feminine-singular":"biciuitoare","masculine-plural":"biciuitori","feminine-neuter-plural":"biciuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biciuitor","error-unrecognized-form-feminine-indefinite-singular":"biciuitoare","error-unrecognized-form-indefinite-masculine-plural":"biciuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"biciuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"biciuitorul","definite-error-unrecognized-form-feminine-singular":"biciuitoarea","definite-error-unrecognized-form-masculine-plural":"biciuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"biciuitoarele"}},{"word":"biciuitură","pos":"noun","definitions":["whipping"],"forms":{"plural":"biciuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biciuitură","accusative-definite-nominative-singular":"biciuitura","accusative-indefinite-nominative-plural":"biciuituri","accusative-definite-nominative-plural":"biciuiturile","dative-genitive-indefinite-singular":"biciuituri","dative-definite-genitive-singular":"biciuiturii","dative-genitive-indefinite-plural":"biciuituri","dative-definite-genitive-plural":"biciuiturilor","singular-vocative":"biciuitură","plural-vocative":"biciuiturilor"}},{"word":"biciuleț","pos":"noun","definitions":["diminutive of bici"],"forms":{"plural":"biciulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biciuleț","accusative-definite-nominative-singular":"biciulețul","accusative-indefinite-nominative-plural":"biciulețe","accusative-definite-nominative-plural":"biciulețele","dative-genitive-indefinite-singular":"biciuleț","dative-definite-genitive-singular":"biciulețului","dative-genitive-indefinite-plural":"biciulețe","dative-definite-genitive-plural":"biciulețelor","singular-vocative":"biciulețule","plural-vocative":"biciulețelor"}},{"word":"biciușca","pos":"noun","definitions":["definite nominative/accusative singular of biciușcă"]},{"word":"biciușcă","pos":"noun","definitions":["quirt"],"forms":{"plural":"biciuști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biciușcă","accusative-definite-nominative-singular":"biciușca","accusative-indefinite-nominative-plural":"biciuște","accusative-definite-nominative-plural":"biciuștele","dative-genitive-indefinite-singular":"biciuște","dative-definite-genitive-singular":"biciuștei","dative-genitive-indefinite-plural":"biciuște","dative-definite-genitive-plural":"biciuștelor","singular-vocative":"biciușcă","plural-vocative":"biciuștelor"}},{"word":"biciușcuță","pos":"noun","definitions":["diminutive of biciușcă"],"forms":{"plural":"biciușcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biciușcuță","accusative-definite-nominative-singular":"biciușcuța","accusative-indefinite-nominative-plural":"biciușcuțe","accusative-definite-nominative-plural":"biciușcuțele","dative-genitive-indefinite-singular":"biciușcuțe","dative-definite-genitive-singular":"biciușcuței","dative-genitive-indefinite-plural":"biciușcuțe","dative-definite-genitive-plural":"biciușcuțelor","singular-vocative":"biciușcuță","plural-vocative":"biciușcuțelor"}},{"word":"biciușor","pos":"noun","definitions":["diminutive of bici"],"forms":{"plural":"biciușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biciușor","accusative-definite-nominative-singular":"biciușorul","accusative-indefinite-nominative-plural":"biciușoare","accusative-definite-nominative-plural":"biciușoarele","dative-genitive-indefinite-singular":"biciușor","dative-definite-genitive-singular":"biciușorului","dative-genitive-indefinite-plural":"biciușoare","dative-definite-genitive-plural":"biciușoarelor","singular-vocative":"biciușorule","plural-vocative":"biciușoarelor"}},{"word":"biciutcă","pos":"noun","definitions":["diminutive of bici"],"forms":{"plural":"biciutcăe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biciutcă","accusative-definite-nominative-singular":"biciutca","accusative-indefinite-nominative-plural":"biciutcăe","accusative-definite-nominative-plural":"biciutcăele","dative-genitive-indefinite-singular":"biciutcăe","dative-definite-genitive-singular":"biciutcăei","dative-genitive-indefinite-plural":"biciutcăe","dative-definite-genitive-plural":"biciutcăelor","singular-vocative":"biciutcă","plural-vocative":"biciutcăelor"}}];
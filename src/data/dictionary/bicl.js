@@ -0,0 +1 @@
+export default [{"word":"bicla","pos":"noun","definitions":["definite nominative/accusative singular of biclă"],"pronunciation":"[ˈbi.kla]","gender":"f"},{"word":"biclă","pos":"noun","definitions":["bike, bicycle"],"pronunciation":"/ˈbi.klə/","forms":{"plural":"bicle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biclă","accusative-definite-nominative-singular":"bicla","accusative-indefinite-nominative-plural":"bicle","accusative-definite-nominative-plural":"biclele","dative-genitive-indefinite-singular":"bicle","dative-definite-genitive-singular":"biclei","dative-genitive-indefinite-plural":"bicle","dative-definite-genitive-plural":"biclelor","singular-vocative":"biclă","plural-vocative":"biclelor"}},{"word":"biclorură","pos":"noun","definitions":["bichloride"],"forms":{"plural":"bicloruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biclorură","accusative-definite-nominative-singular":"biclorura","accusative-indefinite-nominative-plural":"bicloruri","accusative-definite-nominative-plural":"biclorurile","dative-genitive-indefinite-singular":"bicloruri","dative-definite-genitive-singular":"biclorurii","dative-genitive-indefinite-plural":"bicloruri","dative-definite-genitive-plural":"biclorurilor","singular-vocative":"biclorură","plural-vocative":"biclorurilor"}},{"word":"Bicoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bicoiu"}},{"word":"bicolor","pos":"adj","definitions":["bicolor"],"forms":{"feminine-singular":"bicoloră","masculine-plural":"bicolori","feminine-neuter-plural":"bicolore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicolor","error-unrecognized-form-feminine-indefinite-singular":"bicoloră","error-unrecognized-form-indefinite-masculine-plural":"bicolori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicolore","definite-error-unrecognized-form-masculine-neuter-singular":"bicolorul","definite-error-unrecognized-form-feminine-singular":"bicolora","definite-error-unrecognized-form-masculine-plural":"bicolorii","definite-error-unrecognized-form-feminine-neuter-plural":"bicolorele"}},{"word":"biconcav","pos":"adj","definitions":["biconcave"],"forms":{"feminine-singular":"biconcavă","masculine-plural":"biconcavi","feminine-neuter-plural":"biconcave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biconcav","error-unrecognized-form-feminine-indefinite-singular":"biconcavă","error-unrecognized-form-indefinite-masculine-plural":"biconcavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"biconcave","definite-error-unrecognized-form-masculine-neuter-singular":"biconcavul","definite-error-unrecognized-form-feminine-singular":"biconcava","definite-error-unrecognized-form-masculine-plural":"biconcavii","definite-error-unrecognized-form-feminine-neuter-plural":"biconcavele"}},{"word":"biconcavitate","pos":"noun","definitions":["biconcavity"],"forms":{"plural":"biconcavitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biconcavitate","accusative-definite-nominative-singular":"biconcavitatea","accusative-indefinite-nominative-plural":"biconcavitatăți","accusative-definite-nominative-plural":"biconcavitatățile","dative-genitive-indefinite-singular":"biconcavitatăți","dative-definite-genitive-singular":"biconcavitatății","dative-genitive-indefinite-plural":"biconcavitatăți","dative-definite-genitive-plural":"biconcavitatăților","singular-vocative":"biconcavitate","plural-vocative":"biconcavitatăților"}},{"word":"biconvex","pos":"adj","definitions":["biconvex"],"forms":{"feminine-singular":"biconvexă","masculine-plural":"biconvecși","feminine-neuter-plural":"biconvexe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biconvex","error-unrecognized-form-feminine-indefinite-singular":"biconvexă","error-unrecognized-form-indefinite-masculine-plural":"biconvecși","error-unrecognized-form-feminine-indefinite-neuter-plural":"biconvexe","definite-error-unrecognized-form-masculine-neuter-singular":"biconvexul","definite-error-unrecognized-form-feminine-singular":"biconvexa","definite-error-unrecognized-form-masculine-plural":"biconvecșii","definite-error-unrecognized-form-feminine-neuter-plural":"biconvexele"}},{"word":"biconvexitate","pos":"noun","definitions":["biconvexity"],"forms":{"plural":"biconvexitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biconvexitate","accusative-definite-nominative-singular":"biconvexitatea","accusative-indefinite-nominative-plural":"biconvexitatăți","accusative-definite-nominative-plural":"biconvexitatățile","dative-genitive-indefinite-singular":"biconvexitatăți","dative-definite-genitive-singular":"biconvexitatății","dative-genitive-indefinite-plural":"biconvexitatăți","dative-definite-genitive-plural":"biconvexitatăților","singular-vocative":"biconvexitate","plural-vocative":"biconvexitatăților"}},{"word":"bicorn","pos":"noun","definitions":["bicorn (hat)"],"forms":{"plural":"bicornuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bicorn","accusative-definite-nominative-singular":"bicornul","accusative-indefinite-nominative-plural":"bicornuri","accusative-definite-nominative-plural":"bicornurile","dative-genitive-indefinite-singular":"bicorn","dative-definite-genitive-singular":"bicornului","dative-genitive-indefinite-plural":"bicornuri","dative-definite-genitive-plural":"bicornurilor","singular-vocative":"bicornule","plural-vocative":"bicornurilor"}},{"word":"bicotidian","pos":"adj","definitions":["twice daily"],"forms":{"feminine-singular":"bicotidiană","masculine-plural":"bicotidieni","feminine-neuter-plural":"bicotidiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicotidian","error-unrecognized-form-feminine-indefinite-singular":"bicotidiană","error-unrecognized-form-indefinite-masculine-plural":"bicotidieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicotidiene","definite-error-unrecognized-form-masculine-neuter-singular":"bicotidianul","definite-error-unrecognized-form-feminine-singular":"bicotidiana","definite-error-unrecognized-form-masculine-plural":"bicotidienii","definite-error-unrecognized-form-feminine-neuter-plural":"bicotidienele"}},{"word":"bicromat","pos":"noun","definitions":["bichromate"],"forms":{"plural":"bicromați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bicromat","accusative-definite-nominative-singular":"bicromatul","accusative-indefinite-nominative-plural":"bicromați","accusative-definite-nominative-plural":"bicromații","dative-genitive-indefinite-singular":"bicromat","dative-definite-genitive-singular":"bicromatului","dative-genitive-indefinite-plural":"bicromați","dative-definite-genitive-plural":"bicromaților","singular-vocative":"bicromatule","plural-vocative":"bicromaților"}},{"word":"bicromat de potasiu","pos":"noun","definitions":["potassium dichromate"]},{"word":"bicromic","pos":"adj","definitions":["bichromic"],"forms":{"feminine-singular":"bicromică","masculine-plural":"bicromici","feminine-neuter-plural":"bicromice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicromic","error-unrecognized-form-feminine-indefinite-singular":"bicromică","error-unrecognized-form-indefinite-masculine-plural":"bicromici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicromice","definite-error-unrecognized-form-masculine-neuter-singular":"bicromicul","definite-error-unrecognized-form-feminine-singular":"bicromica","definite-error-unrecognized-form-masculine-plural":"bicromicii","definite-error-unrecognized-form-feminine-neuter-plural":"bicromicele"}},{"word":"Biculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Biculescu"}},{"word":"bicuspid","pos":"adj","definitions":["bicuspid"],"forms":{"feminine-singular":"bicuspidă","masculine-plural":"bicuspizi","feminine-neuter-plural":"bicuspide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bicuspid","error-unrecognized-form-feminine-indefinite-singular":"bicuspidă","error-unrecognized-form-indefinite-masculine-plural":"bicuspizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bicuspide","definite-error-unrecognized-form-masculine-neuter-singular":"bicuspidul","definite-error-unrecognized-form-feminine-singular":"bicuspida","definite-error-unrecognized-form-masculine-plural":"bicuspizii","definite-error-unrecognized-form-feminine-neuter-plural":"bicuspidele"}},{"word":"Bicuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bicuț"}},{"word":"bicuță","pos":"noun","definitions":["heifer"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bicuță","accusative-definite-nominative":"bicuța","dative-genitive-indefinite":"bicuțe","dative-definite-genitive":"bicuței","vocative":"bicuță"}},{"word":"bidă","pos":"noun","definitions":["joke, jest"],"forms":{"plural":"bide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bidă","accusative-definite-nominative-singular":"bida","accusative-indefinite-nominative-plural":"bide","accusative-definite-nominative-plural":"bidele","dative-genitive-indefinite-singular":"bide","dative-definite-genitive-singular":"bidei","dative-genitive-indefinite-plural":"bide","dative-definite-genitive-plural":"bidelor","singular-vocative":"bidă","plural-vocative":"bidelor"}},{"word":"bideu","pos":"noun","definitions":["bidet"],"pronunciation":"/biˈdew/","forms":{"plural":"bideuri","table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"bideu","accusative-definite-nominative-singular":"bideul","accusative-indefinite-nominative-plural":"bideuri","accusative-definite-nominative-plural":"bideurile","dative-genitive-indefinite-singular":"bideu","dative-definite-genitive-singular":"bideului","dative-genitive-indefinite-plural":"bideuri","dative-definite-genitive-plural":"bideurilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bidibiu","pos":"noun","definitions":["alternative form of bidiviu"],"forms":{"plural":"bidibii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bidibiu","accusative-definite-nominative-singular":"bidibiuul","accusative-indefinite-nominative-plural":"bidibii","accusative-definite-nominative-plural":"bidibiii","dative-genitive-indefinite-singular":"bidibiu","dative-definite-genitive-singular":"bidibiuului","dative-genitive-indefinite-plural":"bidibii","dative-definite-genitive-plural":"bidibiilor","singular-vocative":"bidibiuule","plural-vocative":"bidibiilor"}},{"word":"bididel","pos":"noun","definitions":["young and fast horse"],"forms":{"plural":"bididei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bididel","accusative-definite-nominative-singular":"bididelul","accusative-indefinite-nominative-plural":"bididei","accusative-definite-nominative-plural":"bidideii","dative-genitive-indefinite-singular":"bididel","dative-definite-genitive-singular":"bididelului","dative-genitive-indefinite-plural":"bididei","dative-definite-genitive-plural":"bidideilor","singular-vocative":"bididelule","plural-vocative":"bidideilor"}},{"word":"bididiu","pos":"noun","definitions":["alternative form of bidiviu"],"forms":{"plural":"bididii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bididiu","accusative-definite-nominative-singular":"bididiuul","accusative-indefinite-nominative-plural":"bididii","accusative-definite-nominative-plural":"bididiii","dative-genitive-indefinite-singular":"bididiu","dative-definite-genitive-singular":"bididiuului","dative-genitive-indefinite-plural":"bididii","dative-definite-genitive-plural":"bididiilor","singular-vocative":"bididiuule","plural-vocative":"bididiilor"}},{"word":"bidiganie","pos":"noun","definitions":["wild beast"],"forms":{"plural":"bidigănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bidiganie","accusative-definite-nominative-singular":"bidiganiea","accusative-indefinite-nominative-plural":"bidigănii","accusative-definite-nominative-plural":"bidigăniile","dative-genitive-indefinite-singular":"bidigănii","dative-definite-genitive-singular":"bidigăniii","dative-genitive-indefinite-plural":"bidigănii","dative-definite-genitive-plural":"bidigăniilor","singular-vocative":"bidiganie","plural-vocative":"bidigăniilor"}},{"word":"Bidigești","pos":"name","definitions":["a village in Ciuruleasa, Alba County, Romania"],"gender":"m"},{"word":"bidinar","pos":"noun","definitions":["brushmaker"],"forms":{"plural":"bidinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bidinar","accusative-definite-nominative-singular":"bidinarul","accusative-indefinite-nominative-plural":"bidinari","accusative-definite-nominative-plural":"bidinarii","dative-genitive-indefinite-singular":"bidinar","dative-definite-genitive-singular":"bidinarului","dative-genitive-indefinite-plural":"bidinari","dative-definite-genitive-plural":"bidinarilor","singular-vocative":"bidinarule","plural-vocative":"bidinarilor"}},{"word":"bidinăreasă","pos":"noun","definitions":["female equivalent of bidinar"],"forms":{"plural":"bidinărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bidinăreasă","accusative-definite-nominative-singular":"bidinăreasa","accusative-indefinite-nominative-plural":"bidinărese","accusative-definite-nominative-plural":"bidinăresele","dative-genitive-indefinite-singular":"bidinărese","dative-definite-genitive-singular":"bidinăresei","dative-genitive-indefinite-plural":"bidinărese","dative-definite-genitive-plural":"bidinăreselor","singular-vocative":"bidinăreasă","plural-vocative":"bidinăreselor"}},{"word":"bidinea","pos":"noun","definitions":["brush"],"forms":{"plural":"bidinele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bidinea","accusative-definite-nominative-singular":"bidineaua","accusative-indefinite-nominative-plural":"bidinele","accusative-definite-nominative-plural":"bidinelele","dative-genitive-indefinite-singular":"bidinele","dative-definite-genitive-singular":"bidinelei","dative-genitive-indefinite-plural":"bidinele","dative-definite-genitive-plural":"bidinelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bidineluță","pos":"noun","definitions":["diminutive of bidinea"],"forms":{"plural":"bidineluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bidineluță","accusative-definite-nominative-singular":"bidineluța","accusative-indefinite-nominative-plural":"bidineluțe","accusative-definite-nominative-plural":"bidineluțele","dative-genitive-indefinite-singular":"bidineluțe","dative-definite-genitive-singular":"bidineluței","dative-genitive-indefinite-plural":"bidineluțe","dative-definite-genitive-plural":"bidineluțelor","singular-vocative":"bidineluță","plural-vocative":"bidineluțelor"}},{"word":"Bidiviu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bidiviu"}},{"word":"bidiviu","pos":"noun","definitions":["young and fast horse"],"forms":{"plural":"bidivii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bidiviu","accusative-definite-nominative-singular":"bidiviul","accusative-indefinite-nominative-plural":"bidivii","accusative-definite-nominative-plural":"bidiviii","dative-genitive-indefinite-singular":"bidiviu","dative-definite-genitive-singular":"bidiviului","dative-genitive-indefinite-plural":"bidivii","dative-definite-genitive-plural":"bidiviilor","singular-vocative":"bidiviule","plural-vocative":"bidiviilor"}},{"word":"bidoane","pos":"noun","definitions":["plural of bidon"],"gender":"n"},{"word":"bidon","pos":"noun","definitions":["can, tin, canister","a canteen (a water bottle used by a soldier)","a water bottle","jugs, cans, breasts"],"pronunciation":"/biˈdon/","forms":{"plural":"bidoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bidon","accusative-definite-nominative-singular":"bidonul","accusative-indefinite-nominative-plural":"bidoane","accusative-definite-nominative-plural":"bidoanele","dative-genitive-indefinite-singular":"bidon","dative-definite-genitive-singular":"bidonului","dative-genitive-indefinite-plural":"bidoane","dative-definite-genitive-plural":"bidoanelor","singular-vocative":"bidonule","plural-vocative":"bidoanelor"}},{"word":"bidonvil","pos":"noun","definitions":["slum"],"forms":{"plural":"bidonviluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bidonvil","accusative-definite-nominative-singular":"bidonvilul","accusative-indefinite-nominative-plural":"bidonviluri","accusative-definite-nominative-plural":"bidonvilurile","dative-genitive-indefinite-singular":"bidonvil","dative-definite-genitive-singular":"bidonvilului","dative-genitive-indefinite-plural":"bidonviluri","dative-definite-genitive-plural":"bidonvilurilor","singular-vocative":"bidonvilule","plural-vocative":"bidonvilurilor"}},{"word":"bidonville","pos":"noun","definitions":["shantytown, slum"],"forms":{"plural":"bidonville-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bidonville","accusative-definite-nominative-singular":"bidonvilleul","accusative-indefinite-nominative-plural":"bidonville-uri","accusative-definite-nominative-plural":"bidonville-urile","dative-genitive-indefinite-singular":"bidonville","dative-definite-genitive-singular":"bidonvilleului","dative-genitive-indefinite-plural":"bidonville-uri","dative-definite-genitive-plural":"bidonville-urilor","singular-vocative":"bidonvilleule","plural-vocative":"bidonville-urilor"}},{"word":"Bidulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bidulescu"}},{"word":"biduș","pos":"adj","definitions":["stinky"],"forms":{"feminine-singular":"bidușă","masculine-plural":"biduși","feminine-neuter-plural":"bidușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biduș","error-unrecognized-form-feminine-indefinite-singular":"bidușă","error-unrecognized-form-indefinite-masculine-plural":"biduși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bidușe","definite-error-unrecognized-form-masculine-neuter-singular":"bidușul","definite-error-unrecognized-form-feminine-singular":"bidușa","definite-error-unrecognized-form-masculine-plural":"bidușii","definite-error-unrecognized-form-feminine-neuter-plural":"bidușele"}},{"word":"bielă","pos":"noun","definitions":["connecting rod, conrod"],"forms":{"plural":"biele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bielă","accusative-definite-nominative-singular":"biela","accusative-indefinite-nominative-plural":"biele","accusative-definite-nominative-plural":"bielele","dative-genitive-indefinite-singular":"biele","dative-definite-genitive-singular":"bielei","dative-genitive-indefinite-plural":"biele","dative-definite-genitive-plural":"bielelor","singular-vocative":"bielă","plural-vocative":"bielelor"}},{"word":"bieletă","pos":"noun","definitions":["a small connecting rod"],"forms":{"plural":"bielete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bieletă","accusative-definite-nominative-singular":"bieleta","accusative-indefinite-nominative-plural":"bielete","accusative-definite-nominative-plural":"bieletele","dative-genitive-indefinite-singular":"bielete","dative-definite-genitive-singular":"bieletei","dative-genitive-indefinite-plural":"bielete","dative-definite-genitive-plural":"bieletelor","singular-vocative":"bieletă","plural-vocative":"bieletelor"}},{"word":"bielorus","pos":"adj","definitions":["Belarusian"],"forms":{"feminine-singular":"bielorusă","masculine-plural":"bieloruși","feminine-neuter-plural":"bieloruse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bielorus","error-unrecognized-form-feminine-indefinite-singular":"bielorusă","error-unrecognized-form-indefinite-masculine-plural":"bieloruși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bieloruse","definite-error-unrecognized-form-masculine-neuter-singular":"bielorusul","definite-error-unrecognized-form-feminine-singular":"bielorusa","definite-error-unrecognized-form-masculine-plural":"bielorușii","definite-error-unrecognized-form-feminine-neuter-plural":"bielorusele"}},{"word":"bielorus","pos":"noun","definitions":["Belarusian"],"forms":{"plural":"bieloruși","feminine":"equivalent bielorusă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bielorus","accusative-definite-nominative-singular":"bielorusul","accusative-indefinite-nominative-plural":"bieloruși","accusative-definite-nominative-plural":"bielorușii","dative-genitive-indefinite-singular":"bielorus","dative-definite-genitive-singular":"bielorusului","dative-genitive-indefinite-plural":"bieloruși","dative-definite-genitive-plural":"bielorușilor","singular-vocative":"bielorusule","plural-vocative":"bielorușilor"}},{"word":"bielorusă","pos":"noun","definitions":["female equivalent of bielorus"],"forms":{"plural":"bieloruse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bielorusă","accusative-definite-nominative-singular":"bielorusa","accusative-indefinite-nominative-plural":"bieloruse","accusative-definite-nominative-plural":"bielorusele","dative-genitive-indefinite-singular":"bieloruse","dative-definite-genitive-singular":"bielorusei","dative-genitive-indefinite-plural":"bieloruse","dative-definite-genitive-plural":"bieloruselor","singular-vocative":"bielorusă","plural-vocative":"bieloruselor"}},{"word":"Bielorusia","pos":"name","definitions":["Belarus"],"gender":"f"},{"word":"bielșug","pos":"noun","definitions":["alternative form of belșug"],"forms":{"plural":"bielșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bielșug","accusative-definite-nominative-singular":"bielșugul","accusative-indefinite-nominative-plural":"bielșuguri","accusative-definite-nominative-plural":"bielșugurile","dative-genitive-indefinite-singular":"bielșug","dative-definite-genitive-singular":"bielșugului","dative-genitive-indefinite-plural":"bielșuguri","dative-definite-genitive-plural":"bielșugurilor","singular-vocative":"bielșugule","plural-vocative":"bielșugurilor"}},{"word":"bienal","pos":"noun","definitions":["biennial"],"forms":{"plural":"bienali","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bienal","accusative-definite-nominative-singular":"biena","accusative-indefinite-nominative-plural":"bienali","accusative-definite-nominative-plural":"bienalile","dative-genitive-indefinite-singular":"bienali","dative-definite-genitive-singular":"bienalii","dative-genitive-indefinite-plural":"bienali","dative-definite-genitive-plural":"bienalilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bienală","pos":"noun","definitions":["biennial (event)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bienală","accusative-definite-nominative-singular":"bienala","accusative-indefinite-nominative-plural":"bienale","accusative-definite-nominative-plural":"bienalele","dative-genitive-indefinite-singular":"bienale","dative-definite-genitive-singular":"bienalei","dative-genitive-indefinite-plural":"bienale","dative-definite-genitive-plural":"bienalelor","singular-vocative":"bienală","plural-vocative":"bienalelor"}},{"word":"bieniu","pos":"noun","definitions":["biennium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bieniu","accusative-definite-nominative":"bieniuul","dative-genitive-indefinite":"bieniu","dative-definite-genitive":"bieniuului","vocative":"bieniuule"}},{"word":"Biertan","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Biertan, Sibiu County, Romania"],"gender":"m"},{"word":"Biești","pos":"name","definitions":["a village in Biești, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"m"},{"word":"biet","pos":"adj","definitions":["poor, unhappy, sad"],"pronunciation":"/bjet/","examples":[{"ro":"Bietul băiat!","en":"Poor boy!"}],"forms":{"feminine-singular":"biată","masculine-plural":"bieți","feminine-neuter-plural":"biete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biet","error-unrecognized-form-feminine-indefinite-singular":"biată","error-unrecognized-form-indefinite-masculine-plural":"bieți","error-unrecognized-form-feminine-indefinite-neuter-plural":"biete","definite-error-unrecognized-form-masculine-neuter-singular":"bietul","definite-error-unrecognized-form-feminine-singular":"biata","definite-error-unrecognized-form-masculine-plural":"bieții","definite-error-unrecognized-form-feminine-neuter-plural":"bietele"}},{"word":"biete","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of biet"],"pronunciation":"/ˈbje.te/"},{"word":"bieți","pos":"adj","definitions":["nominative/accusative masculine plural of biet"],"pronunciation":"/ˈbjetsʲ/"},{"word":"bietuc","pos":"adj","definitions":["diminutive of biet"],"forms":{"feminine-singular":"bietucă","masculine-plural":"bietuci","feminine-neuter-plural":"bietuce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bietuc","error-unrecognized-form-feminine-indefinite-singular":"bietucă","error-unrecognized-form-indefinite-masculine-plural":"bietuci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bietuce","definite-error-unrecognized-form-masculine-neuter-singular":"bietucul","definite-error-unrecognized-form-feminine-singular":"bietuca","definite-error-unrecognized-form-masculine-plural":"bietucii","definite-error-unrecognized-form-feminine-neuter-plural":"bietucele"}},{"word":"bietuleț","pos":"adj","definitions":["diminutive of biet"],"forms":{"feminine-singular":"bietuleață","masculine-plural":"bietuleți","feminine-neuter-plural":"bietulețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bietuleț","error-unrecognized-form-feminine-indefinite-singular":"bietuleață","error-unrecognized-form-indefinite-masculine-plural":"bietuleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bietulețe","definite-error-unrecognized-form-masculine-neuter-singular":"bietulețul","definite-error-unrecognized-form-feminine-singular":"bietuleața","definite-error-unrecognized-form-masculine-plural":"bietuleții","definite-error-unrecognized-form-feminine-neuter-plural":"bietulețele"}},{"word":"bifa","pos":"verb","definitions":["to put a checkmark"],"forms":{"canonical":"a bifa 1st conjugation","present-singular-third-person":"bifează","participle-past":"bifat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bifa","gerund":"bifând","first-person-indicative-present-singular":"bifez","indicative-present-second-person-singular":"bifezi","indicative-present-singular-third-person":"bifează","first-person-indicative-plural-present":"bifăm","indicative-plural-present-second-person":"bifați","indicative-plural-present-third-person":"bifează","first-person-imperfect-indicative-singular":"bifam","imperfect-indicative-second-person-singular":"bifai","imperfect-indicative-singular-third-person":"bifa","first-person-imperfect-indicative-plural":"bifam","imperfect-indicative-plural-second-person":"bifați","imperfect-indicative-plural-third-person":"bifau","first-person-indicative-perfect-singular":"bifai","indicative-perfect-second-person-singular":"bifași","indicative-perfect-singular-third-person":"bifă","first-person-indicative-perfect-plural":"bifarăm","indicative-perfect-plural-second-person":"bifarăți","indicative-perfect-plural-third-person":"bifară","first-person-indicative-pluperfect-singular":"bifasem","indicative-pluperfect-second-person-singular":"bifaseși","indicative-pluperfect-singular-third-person":"bifase","first-person-indicative-pluperfect-plural":"bifaserăm","indicative-pluperfect-plural-second-person":"bifaserăți","indicative-pluperfect-plural-third-person":"bifaseră","first-person-present-singular-subjunctive":"să bifez","present-second-person-singular-subjunctive":"să bifezi","present-singular-subjunctive-third-person":"să bifeze","first-person-plural-present-subjunctive":"să bifăm","plural-present-second-person-subjunctive":"să bifați","plural-present-subjunctive-third-person":"să bifeze","imperative-second-person-singular":"bifează","imperative-plural-second-person":"bifați","imperative-negative-second-person-singular":"nu bifa","imperative-negative-plural-second-person":"nu bifați"}},{"word":"bifă","pos":"noun","definitions":["check mark","a boolean variable"],"forms":{"plural":"bife","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bifă","accusative-definite-nominative-singular":"bifa","accusative-indefinite-nominative-plural":"bife","accusative-definite-nominative-plural":"bifele","dative-genitive-indefinite-singular":"bife","dative-definite-genitive-singular":"bifei","dative-genitive-indefinite-plural":"bife","dative-definite-genitive-plural":"bifelor","singular-vocative":"bifă","plural-vocative":"bifelor"}},{"word":"bifare","pos":"noun","definitions":["checkmarking"],"forms":{"plural":"bifări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bifare","accusative-definite-nominative-singular":"bifarea","accusative-indefinite-nominative-plural":"bifări","accusative-definite-nominative-plural":"bifările","dative-genitive-indefinite-singular":"bifări","dative-definite-genitive-singular":"bifării","dative-genitive-indefinite-plural":"bifări","dative-definite-genitive-plural":"bifărilor","singular-vocative":"bifare","plural-vocative":"bifărilor"}},{"word":"bifat","pos":"noun","definitions":["checkmarked"],"forms":{"plural":"bifaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bifat","accusative-definite-nominative-singular":"bifatul","accusative-indefinite-nominative-plural":"bifaturi","accusative-definite-nominative-plural":"bifaturile","dative-genitive-indefinite-singular":"bifat","dative-definite-genitive-singular":"bifatului","dative-genitive-indefinite-plural":"bifaturi","dative-definite-genitive-plural":"bifaturilor","singular-vocative":"bifatule","plural-vocative":"bifaturilor"}},{"word":"bifat","pos":"verb","definitions":["past participle of bifa"],"forms":{"participle-past":"of bifa"}},{"word":"bifazat","pos":"adj","definitions":["biphase"],"forms":{"feminine-singular":"bifazată","masculine-plural":"bifazați","feminine-neuter-plural":"bifazate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifazat","error-unrecognized-form-feminine-indefinite-singular":"bifazată","error-unrecognized-form-indefinite-masculine-plural":"bifazați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifazate","definite-error-unrecognized-form-masculine-neuter-singular":"bifazatul","definite-error-unrecognized-form-feminine-singular":"bifazata","definite-error-unrecognized-form-masculine-plural":"bifazații","definite-error-unrecognized-form-feminine-neuter-plural":"bifazatele"}},{"word":"bifazic","pos":"adj","definitions":["biphasic"],"forms":{"feminine-singular":"bifazică","masculine-plural":"bifazici","feminine-neuter-plural":"bifazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifazic","error-unrecognized-form-feminine-indefinite-singular":"bifazică","error-unrecognized-form-indefinite-masculine-plural":"bifazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifazice","definite-error-unrecognized-form-masculine-neuter-singular":"bifazicul","definite-error-unrecognized-form-feminine-singular":"bifazica","definite-error-unrecognized-form-masculine-plural":"bifazicii","definite-error-unrecognized-form-feminine-neuter-plural":"bifazicele"}},{"word":"bifid","pos":"adj","definitions":["bifid"],"forms":{"feminine-singular":"bifidă","masculine-plural":"bifizi","feminine-neuter-plural":"bifide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifid","error-unrecognized-form-feminine-indefinite-singular":"bifidă","error-unrecognized-form-indefinite-masculine-plural":"bifizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifide","definite-error-unrecognized-form-masculine-neuter-singular":"bifidul","definite-error-unrecognized-form-feminine-singular":"bifida","definite-error-unrecognized-form-masculine-plural":"bifizii","definite-error-unrecognized-form-feminine-neuter-plural":"bifidele"}},{"word":"bifilar","pos":"adj","definitions":["bifilar"],"forms":{"feminine-singular":"bifilară","masculine-plural":"bifilari","feminine-neuter-plural":"bifilare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifilar","error-unrecognized-form-feminine-indefinite-singular":"bifilară","error-unrecognized-form-indefinite-masculine-plural":"bifilari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifilare","definite-error-unrecognized-form-masculine-neuter-singular":"bifilarul","definite-error-unrecognized-form-feminine-singular":"bifilara","definite-error-unrecognized-form-masculine-plural":"bifilarii","definite-error-unrecognized-form-feminine-neuter-plural":"bifilarele"}},{"word":"biflor","pos":"adj","definitions":["biflorous"],"forms":{"feminine-singular":"bifloră","masculine-plural":"biflori","feminine-neuter-plural":"biflore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biflor","error-unrecognized-form-feminine-indefinite-singular":"bifloră","error-unrecognized-form-indefinite-masculine-plural":"biflori","error-unrecognized-form-feminine-indefinite-neuter-plural":"biflore","definite-error-unrecognized-form-masculine-neuter-singular":"biflorul","definite-error-unrecognized-form-feminine-singular":"biflora","definite-error-unrecognized-form-masculine-plural":"biflorii","definite-error-unrecognized-form-feminine-neuter-plural":"biflorele"}},{"word":"bifocal","pos":"adj","definitions":["bifocal"],"forms":{"feminine-singular":"bifocală","masculine-plural":"bifocali","feminine-neuter-plural":"bifocale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifocal","error-unrecognized-form-feminine-indefinite-singular":"bifocală","error-unrecognized-form-indefinite-masculine-plural":"bifocali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifocale","definite-error-unrecognized-form-masculine-neuter-singular":"bifocalul","definite-error-unrecognized-form-feminine-singular":"bifocala","definite-error-unrecognized-form-masculine-plural":"bifocalii","definite-error-unrecognized-form-feminine-neuter-plural":"bifocalele"}},{"word":"bifoliat","pos":"adj","definitions":["bifoliate"],"forms":{"feminine-singular":"bifoliată","masculine-plural":"bifoliați","feminine-neuter-plural":"bifoliate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifoliat","error-unrecognized-form-feminine-indefinite-singular":"bifoliată","error-unrecognized-form-indefinite-masculine-plural":"bifoliați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifoliate","definite-error-unrecognized-form-masculine-neuter-singular":"bifoliatul","definite-error-unrecognized-form-feminine-singular":"bifoliata","definite-error-unrecognized-form-masculine-plural":"bifoliații","definite-error-unrecognized-form-feminine-neuter-plural":"bifoliatele"}},{"word":"bifoliolat","pos":"adj","definitions":["bifoliate"],"forms":{"feminine-singular":"bifoliolată","masculine-plural":"bifoliolați","feminine-neuter-plural":"bifoliolate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bifoliolat","error-unrecognized-form-feminine-indefinite-singular":"bifoliolată","error-unrecognized-form-indefinite-masculine-plural":"bifoliolați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bifoliolate","definite-error-unrecognized-form-masculine-neuter-singular":"bifoliolatul","definite-error-unrecognized-form-feminine-singular":"bifoliolata","definite-error-unrecognized-form-masculine-plural":"bifoliolații","definite-error-unrecognized-form-feminine-neuter-plural":"bifoliolatele"}},{"word":"biftec","pos":"noun","definitions":["beefsteak"],"forms":{"plural":"biftecuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biftec","accusative-definite-nominative-singular":"biftecul","accusative-indefinite-nominative-plural":"biftece","accusative-definite-nominative-plural":"biftecele","dative-genitive-indefinite-singular":"biftec","dative-definite-genitive-singular":"biftecului","dative-genitive-indefinite-plural":"biftece","dative-definite-genitive-plural":"biftecelor","singular-vocative":"biftecule","plural-vocative":"biftecelor"}},{"word":"bifurca","pos":"verb","definitions":["to bifurcate, fork, branch, split"],"forms":{"canonical":"a bifurca 1st conjugation","present-singular-third-person":"bifurcă","participle-past":"bifurcat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bifurca","gerund":"bifurcând","first-person-indicative-present-singular":"bifurc","indicative-present-second-person-singular":"bifurci","indicative-present-singular-third-person":"bifurcă","first-person-indicative-plural-present":"bifurcăm","indicative-plural-present-second-person":"bifurcați","indicative-plural-present-third-person":"bifurcă","first-person-imperfect-indicative-singular":"bifurcam","imperfect-indicative-second-person-singular":"bifurcai","imperfect-indicative-singular-third-person":"bifurca","first-person-imperfect-indicative-plural":"bifurcam","imperfect-indicative-plural-second-person":"bifurcați","imperfect-indicative-plural-third-person":"bifurcau","first-person-indicative-perfect-singular":"bifurcai","indicative-perfect-second-person-singular":"bifurcași","indicative-perfect-singular-third-person":"bifurcă","first-person-indicative-perfect-plural":"bifurcarăm","indicative-perfect-plural-second-person":"bifurcarăți","indicative-perfect-plural-third-person":"bifurcară","first-person-indicative-pluperfect-singular":"bifurcasem","indicative-pluperfect-second-person-singular":"bifurcaseși","indicative-pluperfect-singular-third-person":"bifurcase","first-person-indicative-pluperfect-plural":"bifurcaserăm","indicative-pluperfect-plural-second-person":"bifurcaserăți","indicative-pluperfect-plural-third-person":"bifurcaseră","first-person-present-singular-subjunctive":"să bifurc","present-second-person-singular-subjunctive":"să bifurci","present-singular-subjunctive-third-person":"să bifurce","first-person-plural-present-subjunctive":"să bifurcăm","plural-present-second-person-subjunctive":"să bifurcați","plural-present-subjunctive-third-person":"să bifurce","imperative-second-person-singular":"bifurcă","imperative-plural-second-person":"bifurcați","imperative-negative-second-person-singular":"nu bifurca","imperative-negative-plural-second-person":"nu bifurcați"}},{"word":"bifurcai","pos":"verb","definitions":["inflection of bifurca:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[bifurˈkaj]"},{"word":"bifurcam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of bifurca"],"pronunciation":"[bifurˈkam]"},{"word":"bifurcare","pos":"noun","definitions":["bifurcation"],"forms":{"plural":"bifurcări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bifurcare","accusative-definite-nominative-singular":"bifurcarea","accusative-indefinite-nominative-plural":"bifurcări","accusative-definite-nominative-plural":"bifurcările","dative-genitive-indefinite-singular":"bifurcări","dative-definite-genitive-singular":"bifurcării","dative-genitive-indefinite-plural":"bifurcări","dative-definite-genitive-plural":"bifurcărilor","singular-vocative":"bifurcare","plural-vocative":"bifurcărilor"}},{"word":"bifurcase","pos":"verb","definitions":["third-person singular pluperfect indicative of bifurca"],"pronunciation":"[bifurˈkase]"},{"word":"bifurcație","pos":"noun","definitions":["fork"],"forms":{"plural":"bifurcații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bifurcație","accusative-definite-nominative-singular":"bifurcația","accusative-indefinite-nominative-plural":"bifurcații","accusative-definite-nominative-plural":"bifurcațiile","dative-genitive-indefinite-singular":"bifurcații","dative-definite-genitive-singular":"bifurcației","dative-genitive-indefinite-plural":"bifurcații","dative-definite-genitive-plural":"bifurcațiilor","singular-vocative":"bifurcație","plural-vocative":"bifurcațiilor"}},{"word":"bifurce","pos":"verb","definitions":["third-person singular/plural present subjunctive of bifurca"],"pronunciation":"[biˈfurt͡ʃe]"},{"word":"bifurci","pos":"verb","definitions":["second-person singular present indicative/subjunctive of bifurca"],"pronunciation":"[biˈfurt͡ʃʲ]"},{"word":"Big Bang","pos":"name","definitions":["Big Bang"],"gender":"n"},{"word":"biga","pos":"noun","definitions":["definite nominative/accusative singular of bigă"],"pronunciation":"[ˈbiɡa]","gender":"f"},{"word":"bigă","pos":"noun","definitions":["chariot (vehicle used in warfare)"],"forms":{"plural":"bigi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bigă","accusative-definite-nominative-singular":"biga","accusative-indefinite-nominative-plural":"bigi","accusative-definite-nominative-plural":"bigile","dative-genitive-indefinite-singular":"bigi","dative-definite-genitive-singular":"bigii","dative-genitive-indefinite-plural":"bigi","dative-definite-genitive-plural":"bigilor","singular-vocative":"bigă","plural-vocative":"bigilor"}},{"word":"bigam","pos":"noun","definitions":["bigamist"],"forms":{"plural":"bigami","feminine":"equivalent bigamă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bigam","accusative-definite-nominative-singular":"bigamul","accusative-indefinite-nominative-plural":"bigami","accusative-definite-nominative-plural":"bigamii","dative-genitive-indefinite-singular":"bigam","dative-definite-genitive-singular":"bigamului","dative-genitive-indefinite-plural":"bigami","dative-definite-genitive-plural":"bigamilor","singular-vocative":"bigamule","plural-vocative":"bigamilor"}},{"word":"bigamă","pos":"noun","definitions":["female equivalent of bigam"],"forms":{"plural":"bigame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bigamă","accusative-definite-nominative-singular":"bigama","accusative-indefinite-nominative-plural":"bigame","accusative-definite-nominative-plural":"bigamele","dative-genitive-indefinite-singular":"bigame","dative-definite-genitive-singular":"bigamei","dative-genitive-indefinite-plural":"bigame","dative-definite-genitive-plural":"bigamelor","singular-vocative":"bigamă","plural-vocative":"bigamelor"}},{"word":"bigamie","pos":"noun","definitions":["bigamy"],"forms":{"plural":"bigamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bigamie","accusative-definite-nominative-singular":"bigamia","accusative-indefinite-nominative-plural":"bigamii","accusative-definite-nominative-plural":"bigamiile","dative-genitive-indefinite-singular":"bigamii","dative-definite-genitive-singular":"bigamiei","dative-genitive-indefinite-plural":"bigamii","dative-definite-genitive-plural":"bigamiilor","singular-vocative":"bigamie","plural-vocative":"bigamiilor"}},{"word":"Bigan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bigan"}},{"word":"Bigăr","pos":"name","definitions":["a village in Berzasca, Caraș-Severin County, Romania"],"gender":"m"},{"word":"bigband","pos":"noun","definitions":["big band"],"forms":{"plural":"bigbanduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bigband","accusative-definite-nominative-singular":"bigbandul","accusative-indefinite-nominative-plural":"bigbanduri","accusative-definite-nominative-plural":"bigbandurile","dative-genitive-indefinite-singular":"bigband","dative-definite-genitive-singular":"bigbandului","dative-genitive-indefinite-plural":"bigbanduri","dative-definite-genitive-plural":"bigbandurilor","singular-vocative":"bigbandule","plural-vocative":"bigbandurilor"}},{"word":"bigeminism","pos":"noun","definitions":["bigeminy"],"forms":{"plural":"bigeminisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bigeminism","accusative-definite-nominative-singular":"bigeminismul","accusative-indefinite-nominative-plural":"bigeminisme","accusative-definite-nominative-plural":"bigeminismele","dative-genitive-indefinite-singular":"bigeminism","dative-definite-genitive-singular":"bigeminismului","dative-genitive-indefinite-plural":"bigeminisme","dative-definite-genitive-plural":"bigeminismelor","singular-vocative":"bigeminismule","plural-vocative":"bigeminismelor"}},{"word":"bighimot","pos":"noun","definitions":["hippopotamus"],"forms":{"plural":"bighimoți"}},{"word":"bighistan","pos":"noun","definitions":["party, feast, celebration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bighistan","accusative-definite-nominative":"bighistanul","dative-genitive-indefinite":"bighistan","dative-definite-genitive":"bighistanului","vocative":"bighistanule"}},{"word":"bigi","pos":"noun","definitions":["inflection of bigă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[bid͡ʒʲ]","gender":"f"},{"word":"bignonia","pos":"noun","definitions":["bignonia"]},{"word":"bigo","pos":"noun","definitions":["vocative singular of bigă"],"pronunciation":"[ˈbiɡo]","gender":"f"},{"word":"bigot","pos":"noun","definitions":["bigot"],"forms":{"plural":"bigoți","feminine":"equivalent bigotă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bigot","accusative-definite-nominative-singular":"bigotul","accusative-indefinite-nominative-plural":"bigoți","accusative-definite-nominative-plural":"bigoții","dative-genitive-indefinite-singular":"bigot","dative-definite-genitive-singular":"bigotului","dative-genitive-indefinite-plural":"bigoți","dative-definite-genitive-plural":"bigoților","singular-vocative":"bigotule","plural-vocative":"bigoților"}},{"word":"bigotă","pos":"noun","definitions":["female equivalent of bigot"],"forms":{"plural":"bigote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bigotă","accusative-definite-nominative-singular":"bigota","accusative-indefinite-nominative-plural":"bigote","accusative-definite-nominative-plural":"bigotele","dative-genitive-indefinite-singular":"bigote","dative-definite-genitive-singular":"bigotei","dative-genitive-indefinite-plural":"bigote","dative-definite-genitive-plural":"bigotelor","singular-vocative":"bigotă","plural-vocative":"bigotelor"}},{"word":"bigoterie","pos":"noun","definitions":["bigotry"],"forms":{"plural":"bigoterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bigoterie","accusative-definite-nominative-singular":"bigoteria","accusative-indefinite-nominative-plural":"bigoterii","accusative-definite-nominative-plural":"bigoteriile","dative-genitive-indefinite-singular":"bigoterii","dative-definite-genitive-singular":"bigoteriei","dative-genitive-indefinite-plural":"bigoterii","dative-definite-genitive-plural":"bigoteriilor","singular-vocative":"bigoterie","plural-vocative":"bigoteriilor"}},{"word":"bigoți","pos":"noun","definitions":["plural of bigot"]},{"word":"bigotism","pos":"noun","definitions":["bigotry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bigotism","accusative-definite-nominative-singular":"bigotismul","accusative-indefinite-nominative-plural":"bigotisme","accusative-definite-nominative-plural":"bigotismele","dative-genitive-indefinite-singular":"bigotism","dative-definite-genitive-singular":"bigotismului","dative-genitive-indefinite-plural":"bigotisme","dative-definite-genitive-plural":"bigotismelor","singular-vocative":"bigotismule","plural-vocative":"bigotismelor"}},{"word":"bigudiu","pos":"noun","definitions":["curler"],"forms":{"plural":"bigudiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bigudiu","accusative-definite-nominative-singular":"bigudiul","accusative-indefinite-nominative-plural":"bigudiuri","accusative-definite-nominative-plural":"bigudiurile","dative-genitive-indefinite-singular":"bigudiu","dative-definite-genitive-singular":"bigudiului","dative-genitive-indefinite-plural":"bigudiuri","dative-definite-genitive-plural":"bigudiurilor","singular-vocative":"bigudiule","plural-vocative":"bigudiurilor"}},{"word":"biguină","pos":"noun","definitions":["biguine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"biguină","accusative-definite-nominative":"biguina","dative-genitive-indefinite":"biguine","dative-definite-genitive":"biguinei","vocative":"biguină"}},{"word":"Biharia","pos":"name","definitions":["a village in Gârda de Sus, Alba County, Romania","a commune of Bihor County, Romania","a village in Biharia, Bihor County, Romania"],"gender":"f"},{"word":"bihindisi","pos":"verb","definitions":["alternative form of bindisi"],"forms":{"canonical":"a bihindisi 4th conjugation","present-singular-third-person":"bihindisește","participle-past":"bihindisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bihindisi","gerund":"bihindisind","first-person-indicative-present-singular":"bihindisesc","indicative-present-second-person-singular":"bihindisești","indicative-present-singular-third-person":"bihindisește","first-person-indicative-plural-present":"bihindisim","indicative-plural-present-second-person":"bihindisiți","indicative-plural-present-third-person":"bihindisesc","first-person-imperfect-indicative-singular":"bihindiseam","imperfect-indicative-second-person-singular":"bihindiseai","imperfect-indicative-singular-third-person":"bihindisea","first-person-imperfect-indicative-plural":"bihindiseam","imperfect-indicative-plural-second-person":"bihindiseați","imperfect-indicative-plural-third-person":"bihindiseau","first-person-indicative-perfect-singular":"bihindisii","indicative-perfect-second-person-singular":"bihindisiși","indicative-perfect-singular-third-person":"bihindisi","first-person-indicative-perfect-plural":"bihindisirăm","indicative-perfect-plural-second-person":"bihindisirăți","indicative-perfect-plural-third-person":"bihindisiră","first-person-indicative-pluperfect-singular":"bihindisisem","indicative-pluperfect-second-person-singular":"bihindisiseși","indicative-pluperfect-singular-third-person":"bihindisise","first-person-indicative-pluperfect-plural":"bihindisiserăm","indicative-pluperfect-plural-second-person":"bihindisiserăți","indicative-pluperfect-plural-third-person":"bihindisiseră","first-person-present-singular-subjunctive":"să bihindisesc","present-second-person-singular-subjunctive":"să bihindisești","present-singular-subjunctive-third-person":"să bihindisească","first-person-plural-present-subjunctive":"să bihindisim","plural-present-second-person-subjunctive":"să bihindisiți","plural-present-subjunctive-third-person":"să bihindisească","imperative-second-person-singular":"bihindisește","imperative-plural-second-person":"bihindisiți","imperative-negative-second-person-singular":"nu bihindisi","imperative-negative-plural-second-person":"nu bihindisiți"}},{"word":"Bihor","pos":"name","definitions":["Bihor (a county of Romania)"],"pronunciation":"/biˈhor/","gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Bihor","accusative-definite-nominative":"Bihorul","dative-genitive-indefinite":"Bihor","dative-definite-genitive":"Bihorului","vocative":"Bihorule"}},{"word":"bihorean","pos":"adj","definitions":["of, from or relating to Bihor"],"forms":{"feminine-singular":"bihoreană","masculine-plural":"bihoreni","feminine-neuter-plural":"bihorene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bihorean","error-unrecognized-form-feminine-indefinite-singular":"bihoreană","error-unrecognized-form-indefinite-masculine-plural":"bihoreni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bihorene","definite-error-unrecognized-form-masculine-neuter-singular":"bihoreanul","definite-error-unrecognized-form-feminine-singular":"bihoreana","definite-error-unrecognized-form-masculine-plural":"bihorenii","definite-error-unrecognized-form-feminine-neuter-plural":"bihorenele"}},{"word":"bihorean","pos":"noun","definitions":["native or inhabitant of Bihor (usually male)"],"forms":{"plural":"bihoreni","feminine":"equivalent bihoreană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bihorean","accusative-definite-nominative-singular":"bihoreanul","accusative-indefinite-nominative-plural":"bihoreni","accusative-definite-nominative-plural":"bihorenii","dative-genitive-indefinite-singular":"bihorean","dative-definite-genitive-singular":"bihoreanului","dative-genitive-indefinite-plural":"bihoreni","dative-definite-genitive-plural":"bihorenilor","singular-vocative":"bihoreanule","plural-vocative":"bihorenilor"}},{"word":"bihoreană","pos":"noun","definitions":["female equivalent of bihorean"],"forms":{"plural":"bihorene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bihoreană","accusative-definite-nominative-singular":"bihoreana","accusative-indefinite-nominative-plural":"bihorene","accusative-definite-nominative-plural":"bihorenele","dative-genitive-indefinite-singular":"bihorene","dative-definite-genitive-singular":"bihorenei","dative-genitive-indefinite-plural":"bihorene","dative-definite-genitive-plural":"bihorenelor","singular-vocative":"bihoreană","plural-vocative":"bihorenelor"}},{"word":"bihoreancă","pos":"noun","definitions":["female equivalent of bihorean"],"forms":{"plural":"bihorence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bihoreancă","accusative-definite-nominative-singular":"bihoreanca","accusative-indefinite-nominative-plural":"bihorence","accusative-definite-nominative-plural":"bihorencele","dative-genitive-indefinite-singular":"bihorence","dative-definite-genitive-singular":"bihorencei","dative-genitive-indefinite-plural":"bihorence","dative-definite-genitive-plural":"bihorencelor","singular-vocative":"bihoreancă","plural-vocative":"bihorencelor"}},{"word":"Bihoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bihoreanu"}},{"word":"bijecție","pos":"noun","definitions":["bijection"],"forms":{"plural":"bijecții"}},{"word":"bijectiv","pos":"adj","definitions":["bijective"],"forms":{"feminine-singular":"bijectivă","masculine-plural":"bijectivi","feminine-neuter-plural":"bijective","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bijectiv","error-unrecognized-form-feminine-indefinite-singular":"bijectivă","error-unrecognized-form-indefinite-masculine-plural":"bijectivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bijective","definite-error-unrecognized-form-masculine-neuter-singular":"bijectivul","definite-error-unrecognized-form-feminine-singular":"bijectiva","definite-error-unrecognized-form-masculine-plural":"bijectivii","definite-error-unrecognized-form-feminine-neuter-plural":"bijectivele"}},{"word":"biju","pos":"noun","definitions":["jewel"],"forms":{"plural":"bijuuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"biju","accusative-definite-nominative-singular":"bijuul","accusative-indefinite-nominative-plural":"bijuuri","accusative-definite-nominative-plural":"bijuurile","dative-genitive-indefinite-singular":"biju","dative-definite-genitive-singular":"bijuului","dative-genitive-indefinite-plural":"bijuuri","dative-definite-genitive-plural":"bijuurilor","singular-vocative":"bijuule","plural-vocative":"bijuurilor"}},{"word":"bijuterie","pos":"noun","definitions":["jewel (valuable object for ornamentation)","jeweller's; jewellery shop"],"forms":{"plural":"bijuterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bijuterie","accusative-definite-nominative-singular":"bijuteria","accusative-indefinite-nominative-plural":"bijuterii","accusative-definite-nominative-plural":"bijuteriile","dative-genitive-indefinite-singular":"bijuterii","dative-definite-genitive-singular":"bijuteriei","dative-genitive-indefinite-plural":"bijuterii","dative-definite-genitive-plural":"bijuteriilor","singular-vocative":"bijuterie","plural-vocative":"bijuteriilor"}},{"word":"bijutier","pos":"noun","definitions":["jeweler"],"forms":{"plural":"bijutieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bijutier","accusative-definite-nominative-singular":"bijutierul","accusative-indefinite-nominative-plural":"bijutieri","accusative-definite-nominative-plural":"bijutierii","dative-genitive-indefinite-singular":"bijutier","dative-definite-genitive-singular":"bijutierului","dative-genitive-indefinite-plural":"bijutieri","dative-definite-genitive-plural":"bijutierilor","singular-vocative":"bijutierule","plural-vocative":"bijutierilor"}},{"word":"biker","pos":"noun","definitions":["biker"],"forms":{"plural":"bikeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biker","accusative-definite-nominative-singular":"bikerul","accusative-indefinite-nominative-plural":"bikeri","accusative-definite-nominative-plural":"bikerii","dative-genitive-indefinite-singular":"biker","dative-definite-genitive-singular":"bikerului","dative-genitive-indefinite-plural":"bikeri","dative-definite-genitive-plural":"bikerilor","singular-vocative":"bikerule","plural-vocative":"bikerilor"}},{"word":"bikini","pos":"noun","definitions":["bikini"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bikini","accusative-definite-nominative":"bikiniul","dative-genitive-indefinite":"bikini","dative-definite-genitive":"bikiniului","vocative":"bikiniule"}},{"word":"bikiniană","pos":"noun","definitions":["female equivalent of bikinian"],"forms":{"plural":"bikiniene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bikiniană","accusative-definite-nominative-singular":"bikiniana","accusative-indefinite-nominative-plural":"bikiniene","accusative-definite-nominative-plural":"bikinienele","dative-genitive-indefinite-singular":"bikiniene","dative-definite-genitive-singular":"bikinienei","dative-genitive-indefinite-plural":"bikiniene","dative-definite-genitive-plural":"bikinienelor","singular-vocative":"bikiniană","plural-vocative":"bikinienelor"}},{"word":"Bila","pos":"name","definitions":["a village in Schitu, Giurgiu County, Romania"],"gender":"f"},{"word":"bila","pos":"noun","definitions":["definite nominative/accusative singular of bilă"],"pronunciation":"[ˈbila]","gender":"f"},{"word":"Bilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bilă"}},{"word":"bilă","pos":"noun","definitions":["bile"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bilă","accusative-definite-nominative":"bila","dative-genitive-indefinite":"bile","dative-definite-genitive":"bilei","vocative":"bilă"}},{"word":"bilă","pos":"noun","definitions":["small, hard ball","ball"],"examples":[{"ro":"Mânca-mi-ai bilele!","en":"Suck my balls!"}],"forms":{"plural":"bile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bilă","accusative-definite-nominative-singular":"bila","accusative-indefinite-nominative-plural":"bile","accusative-definite-nominative-plural":"bilele","dative-genitive-indefinite-singular":"bile","dative-definite-genitive-singular":"bilei","dative-genitive-indefinite-plural":"bile","dative-definite-genitive-plural":"bilelor","singular-vocative":"bilă","plural-vocative":"bilelor"}},{"word":"bilă","pos":"noun","definitions":["thin tree trunk used in construction"],"forms":{"plural":"bile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bilă","accusative-definite-nominative-singular":"bila","accusative-indefinite-nominative-plural":"bile","accusative-definite-nominative-plural":"bilele","dative-genitive-indefinite-singular":"bile","dative-definite-genitive-singular":"bilei","dative-genitive-indefinite-plural":"bile","dative-definite-genitive-plural":"bilelor","singular-vocative":"bilă","plural-vocative":"bilelor"}},{"word":"bilă de popice","pos":"noun","definitions":["bowling ball"],"forms":{"plural":"bile de popice"}},{"word":"bilă neagră","pos":"noun","definitions":["blackball"],"forms":{"plural":"bile negre"}},{"word":"bilabial","pos":"adj","definitions":["bilabial"],"forms":{"feminine-singular":"bilabială","masculine-plural":"bilabiali","feminine-neuter-plural":"bilabiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilabial","error-unrecognized-form-feminine-indefinite-singular":"bilabială","error-unrecognized-form-indefinite-masculine-plural":"bilabiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilabiale","definite-error-unrecognized-form-masculine-neuter-singular":"bilabialul","definite-error-unrecognized-form-feminine-singular":"bilabiala","definite-error-unrecognized-form-masculine-plural":"bilabialii","definite-error-unrecognized-form-feminine-neuter-plural":"bilabialele"}},{"word":"bilabială","pos":"noun","definitions":["bilabial"],"forms":{"plural":"bilabiale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bilabială","accusative-definite-nominative-singular":"bilabiala","accusative-indefinite-nominative-plural":"bilabiale","accusative-definite-nominative-plural":"bilabialele","dative-genitive-indefinite-singular":"bilabiale","dative-definite-genitive-singular":"bilabialei","dative-genitive-indefinite-plural":"bilabiale","dative-definite-genitive-plural":"bilabialelor","singular-vocative":"bilabială","plural-vocative":"bilabialelor"}},{"word":"bilabiat","pos":"adj","definitions":["bilabiate"],"forms":{"feminine-singular":"bilabiată","masculine-plural":"bilabiați","feminine-neuter-plural":"bilabiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilabiat","error-unrecognized-form-feminine-indefinite-singular":"bilabiată","error-unrecognized-form-indefinite-masculine-plural":"bilabiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilabiate","definite-error-unrecognized-form-masculine-neuter-singular":"bilabiatul","definite-error-unrecognized-form-feminine-singular":"bilabiata","definite-error-unrecognized-form-masculine-plural":"bilabiații","definite-error-unrecognized-form-feminine-neuter-plural":"bilabiatele"}},{"word":"Bilaler","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Dorobanțu."],"gender":"m"},{"word":"Bilănești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"bilanț","pos":"noun","definitions":["balance sheet"],"forms":{"plural":"bilanțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bilanț","accusative-definite-nominative-singular":"bilanțul","accusative-indefinite-nominative-plural":"bilanțuri","accusative-definite-nominative-plural":"bilanțurile","dative-genitive-indefinite-singular":"bilanț","dative-definite-genitive-singular":"bilanțului","dative-genitive-indefinite-plural":"bilanțuri","dative-definite-genitive-plural":"bilanțurilor","singular-vocative":"bilanțule","plural-vocative":"bilanțurilor"}},{"word":"bilanțier","pos":"adj","definitions":["balance sheet"],"forms":{"feminine-singular":"bilanțieră","masculine-plural":"bilanțieri","feminine-neuter-plural":"bilanțiere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilanțier","error-unrecognized-form-feminine-indefinite-singular":"bilanțieră","error-unrecognized-form-indefinite-masculine-plural":"bilanțieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilanțiere","definite-error-unrecognized-form-masculine-neuter-singular":"bilanțierul","definite-error-unrecognized-form-feminine-singular":"bilanțiera","definite-error-unrecognized-form-masculine-plural":"bilanțierii","definite-error-unrecognized-form-feminine-neuter-plural":"bilanțierele"}},{"word":"bilanțier","pos":"noun","definitions":["balance sheet book"],"forms":{"plural":"bilanțieri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bilanțier","accusative-definite-nominative-singular":"bilanțierul","accusative-indefinite-nominative-plural":"bilanțieri","accusative-definite-nominative-plural":"bilanțierile","dative-genitive-indefinite-singular":"bilanțier","dative-definite-genitive-singular":"bilanțierului","dative-genitive-indefinite-plural":"bilanțieri","dative-definite-genitive-plural":"bilanțierilor","singular-vocative":"bilanțierule","plural-vocative":"bilanțierilor"}},{"word":"bilateral","pos":"adj","definitions":["two-way"],"forms":{"feminine-singular":"bilaterală","masculine-plural":"bilaterali","feminine-neuter-plural":"bilaterale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilateral","error-unrecognized-form-feminine-indefinite-singular":"bilaterală","error-unrecognized-form-indefinite-masculine-plural":"bilaterali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilaterale","definite-error-unrecognized-form-masculine-neuter-singular":"bilateralul","definite-error-unrecognized-form-feminine-singular":"bilaterala","definite-error-unrecognized-form-masculine-plural":"bilateralii","definite-error-unrecognized-form-feminine-neuter-plural":"bilateralele"}},{"word":"bilateralism","pos":"noun","definitions":["bilateralism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bilateralism","accusative-definite-nominative":"bilateralismul","dative-genitive-indefinite":"bilateralism","dative-definite-genitive":"bilateralismului","vocative":"bilateralismule"}},{"word":"Bilbor","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Bilbor, Harghita County, Romania"],"gender":"m"},{"word":"Bilca","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Bilca, Suceava County, Romania"],"gender":"f"},{"word":"Bilca Mică","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Bilca Mare"],"gender":"f"},{"word":"Bilca Tulbure","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Bilca"],"gender":"f"},{"word":"Bilcești","pos":"name","definitions":["a village in Valea Mare Pravăț, Argeș County, Romania"],"gender":"m"},{"word":"Bilciurești","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Bilciurești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Bîldescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîldescu"}},{"word":"bildungsroman","pos":"noun","definitions":["bildungsroman"],"forms":{"plural":"bildungsromane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bildungsroman","accusative-definite-nominative-singular":"bildungsromanul","accusative-indefinite-nominative-plural":"bildungsromane","accusative-definite-nominative-plural":"bildungsromanele","dative-genitive-indefinite-singular":"bildungsroman","dative-definite-genitive-singular":"bildungsromanului","dative-genitive-indefinite-plural":"bildungsromane","dative-definite-genitive-plural":"bildungsromanelor","singular-vocative":"bildungsromanule","plural-vocative":"bildungsromanelor"}},{"word":"bildungsromanesc","pos":"adj","definitions":["bildungsroman"],"forms":{"feminine-singular":"bildungsromanească","plural":"bildungsromanești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bildungsromanesc","error-unrecognized-form-feminine-indefinite-singular":"bildungsromanească","error-unrecognized-form-indefinite-masculine-plural":"bildungsromanești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bildungsromanești","definite-error-unrecognized-form-masculine-neuter-singular":"bildungsromanescul","definite-error-unrecognized-form-feminine-singular":"bildungsromaneasca","definite-error-unrecognized-form-masculine-plural":"bildungsromaneștii","definite-error-unrecognized-form-feminine-neuter-plural":"bildungsromaneștile"}},{"word":"bile","pos":"noun","definitions":["inflection of bilă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈbile]","gender":"f"},{"word":"Biled","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Biled, Timiș County, Romania"],"gender":"m"},{"word":"Bilegan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bilegan"}},{"word":"Bilencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Bilencu"}},{"word":"bilet","pos":"noun","definitions":["ticket (proof of payment that entitles the holder to admission, entry etc.)","note (short message on a small piece of paper)"],"pronunciation":"/biˈlet/","forms":{"plural":"bilete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bilet","accusative-definite-nominative-singular":"biletul","accusative-indefinite-nominative-plural":"bilete","accusative-definite-nominative-plural":"biletele","dative-genitive-indefinite-singular":"bilet","dative-definite-genitive-singular":"biletului","dative-genitive-indefinite-plural":"bilete","dative-definite-genitive-plural":"biletelor","singular-vocative":"biletule","plural-vocative":"biletelor","alternative-dated-humorous":"belet"}},{"word":"bilet de adio","pos":"noun","definitions":["suicide note"],"forms":{"plural":"bilete de adio"}},{"word":"bilet de bancă","pos":"noun","definitions":["banknote"],"forms":{"plural":"bilete de bancă"}},{"word":"bilet de identitate","pos":"noun","definitions":["identity card"],"forms":{"plural":"bilete de identitate"}},{"word":"bilet de ordin","pos":"noun","definitions":["alternative form of bilet la ordin (“promissory note”)"],"forms":{"plural":"bilete de ordin"}},{"word":"bilet doar dus","pos":"noun","definitions":["one-way ticket"],"forms":{"plural":"bilete doar dus"}},{"word":"bilet dus-întors","pos":"noun","definitions":["return ticket"],"forms":{"plural":"bilete dus-întors"}},{"word":"bilet la ordin","pos":"noun","definitions":["promissory note"],"forms":{"plural":"bilete la ordin","alternative":"bilet de ordin"}},{"word":"bilete","pos":"noun","definitions":["plural of bilet"]},{"word":"bilete dus-întors","pos":"noun","definitions":["plural of bilet dus-întors"]},{"word":"bilețel","pos":"noun","definitions":["diminutive of bilet; small note"],"forms":{"plural":"bilețele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bilețel","accusative-definite-nominative-singular":"bilețelul","accusative-indefinite-nominative-plural":"bilețele","accusative-definite-nominative-plural":"bilețelele","dative-genitive-indefinite-singular":"bilețel","dative-definite-genitive-singular":"bilețelului","dative-genitive-indefinite-plural":"bilețele","dative-definite-genitive-plural":"bilețelelor","singular-vocative":"bilețelule","plural-vocative":"bilețelelor"}},{"word":"bilezic","pos":"noun","definitions":["bangle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bilezic","accusative-definite-nominative":"bilezicul","dative-genitive-indefinite":"bilezic","dative-definite-genitive":"bilezicului","vocative":"bilezicule"}},{"word":"Bilghez","pos":"name","definitions":["a village in Nușfalău, Sălaj County, Romania"],"gender":"m"},{"word":"biliar","pos":"adj","definitions":["biliary"],"forms":{"feminine-singular":"biliară","masculine-plural":"biliari","feminine-neuter-plural":"biliare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biliar","error-unrecognized-form-feminine-indefinite-singular":"biliară","error-unrecognized-form-indefinite-masculine-plural":"biliari","error-unrecognized-form-feminine-indefinite-neuter-plural":"biliare","definite-error-unrecognized-form-masculine-neuter-singular":"biliarul","definite-error-unrecognized-form-feminine-singular":"biliara","definite-error-unrecognized-form-masculine-plural":"biliarii","definite-error-unrecognized-form-feminine-neuter-plural":"biliarele"}},{"word":"biliard","pos":"noun","definitions":["billiards, pool"],"forms":{"plural":"biliarde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biliard","accusative-definite-nominative-singular":"biliardul","accusative-indefinite-nominative-plural":"biliarde","accusative-definite-nominative-plural":"biliardele","dative-genitive-indefinite-singular":"biliard","dative-definite-genitive-singular":"biliardului","dative-genitive-indefinite-plural":"biliarde","dative-definite-genitive-plural":"biliardelor","singular-vocative":"biliardule","plural-vocative":"biliardelor"}},{"word":"biliargiu","pos":"noun","definitions":["billiards player"],"forms":{"plural":"biliargii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biliargiu","accusative-definite-nominative-singular":"biliargiuul","accusative-indefinite-nominative-plural":"biliargii","accusative-definite-nominative-plural":"biliargiii","dative-genitive-indefinite-singular":"biliargiu","dative-definite-genitive-singular":"biliargiuului","dative-genitive-indefinite-plural":"biliargii","dative-definite-genitive-plural":"biliargiilor","singular-vocative":"biliargiuule","plural-vocative":"biliargiilor"}},{"word":"Bilicenii Noi","pos":"name","definitions":["a village in Bilicenii Noi, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"Bilicenii Vechi","pos":"name","definitions":["a village in Bilicenii Vechi, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"biligeneză","pos":"noun","definitions":["biligenesis"],"forms":{"plural":"biligeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biligeneză","accusative-definite-nominative-singular":"biligeneza","accusative-indefinite-nominative-plural":"biligeneze","accusative-definite-nominative-plural":"biligenezele","dative-genitive-indefinite-singular":"biligeneze","dative-definite-genitive-singular":"biligenezei","dative-genitive-indefinite-plural":"biligeneze","dative-definite-genitive-plural":"biligenezelor","singular-vocative":"biligeneză","plural-vocative":"biligenezelor"}},{"word":"bilingv","pos":"adj","definitions":["bilingual"],"forms":{"feminine-singular":"bilingvă","masculine-plural":"bilingvi","feminine-neuter-plural":"bilingve","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilingv","error-unrecognized-form-feminine-indefinite-singular":"bilingvă","error-unrecognized-form-indefinite-masculine-plural":"bilingvi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilingve","definite-error-unrecognized-form-masculine-neuter-singular":"bilingvul","definite-error-unrecognized-form-feminine-singular":"bilingva","definite-error-unrecognized-form-masculine-plural":"bilingvii","definite-error-unrecognized-form-feminine-neuter-plural":"bilingvele"}},{"word":"bilingv","pos":"noun","definitions":["bilingual (a bilingual person)"],"forms":{"plural":"bilingvi","feminine":"equivalent bilingvă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bilingv","accusative-definite-nominative-singular":"bilingvul","accusative-indefinite-nominative-plural":"bilingvi","accusative-definite-nominative-plural":"bilingvii","dative-genitive-indefinite-singular":"bilingv","dative-definite-genitive-singular":"bilingvului","dative-genitive-indefinite-plural":"bilingvi","dative-definite-genitive-plural":"bilingvilor","singular-vocative":"bilingvule","plural-vocative":"bilingvilor"}},{"word":"bilingvism","pos":"noun","definitions":["bilingualism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bilingvism","accusative-definite-nominative":"bilingvismul","dative-genitive-indefinite":"bilingvism","dative-definite-genitive":"bilingvismului","vocative":"bilingvismule"}},{"word":"bilion","pos":"noun","definitions":["trillion"],"forms":{"plural":"bilioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bilion","accusative-definite-nominative-singular":"bilionul","accusative-indefinite-nominative-plural":"bilioane","accusative-definite-nominative-plural":"bilioanele","dative-genitive-indefinite-singular":"bilion","dative-definite-genitive-singular":"bilionului","dative-genitive-indefinite-plural":"bilioane","dative-definite-genitive-plural":"bilioanelor","singular-vocative":"bilionule","plural-vocative":"bilioanelor"}},{"word":"bilios","pos":"adj","definitions":["bilious"],"forms":{"feminine-singular":"bilioasă","masculine-plural":"bilioși","feminine-neuter-plural":"bilioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilios","error-unrecognized-form-feminine-indefinite-singular":"bilioasă","error-unrecognized-form-indefinite-masculine-plural":"bilioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilioase","definite-error-unrecognized-form-masculine-neuter-singular":"biliosul","definite-error-unrecognized-form-feminine-singular":"bilioasa","definite-error-unrecognized-form-masculine-plural":"bilioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bilioasele"}},{"word":"bilire","pos":"noun","definitions":["whitening"],"forms":{"plural":"biliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bilire","accusative-definite-nominative-singular":"bilirea","accusative-indefinite-nominative-plural":"biliri","accusative-definite-nominative-plural":"bilirile","dative-genitive-indefinite-singular":"biliri","dative-definite-genitive-singular":"bilirii","dative-genitive-indefinite-plural":"biliri","dative-definite-genitive-plural":"bilirilor","singular-vocative":"bilire","plural-vocative":"bilirilor"}},{"word":"bilirubină","pos":"noun","definitions":["bilirubin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bilirubină","accusative-definite-nominative-singular":"bilirubina","accusative-indefinite-nominative-plural":"bilirubine","accusative-definite-nominative-plural":"bilirubinele","dative-genitive-indefinite-singular":"bilirubine","dative-definite-genitive-singular":"bilirubinei","dative-genitive-indefinite-plural":"bilirubine","dative-definite-genitive-plural":"bilirubinelor","singular-vocative":"bilirubină","plural-vocative":"bilirubinelor"}},{"word":"bilirubinemie","pos":"noun","definitions":["bilirubinemia"],"forms":{"plural":"bilirubinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bilirubinemie","accusative-definite-nominative-singular":"bilirubinemia","accusative-indefinite-nominative-plural":"bilirubinemii","accusative-definite-nominative-plural":"bilirubinemiile","dative-genitive-indefinite-singular":"bilirubinemii","dative-definite-genitive-singular":"bilirubinemiei","dative-genitive-indefinite-plural":"bilirubinemii","dative-definite-genitive-plural":"bilirubinemiilor","singular-vocative":"bilirubinemie","plural-vocative":"bilirubinemiilor"}},{"word":"bilit","pos":"adj","definitions":["whitened"],"forms":{"feminine-singular":"bilită","masculine-plural":"biliți","feminine-neuter-plural":"bilite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilit","error-unrecognized-form-feminine-indefinite-singular":"bilită","error-unrecognized-form-indefinite-masculine-plural":"biliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilite","definite-error-unrecognized-form-masculine-neuter-singular":"bilitul","definite-error-unrecognized-form-feminine-singular":"bilita","definite-error-unrecognized-form-masculine-plural":"biliții","definite-error-unrecognized-form-feminine-neuter-plural":"bilitele"}},{"word":"bilite","pos":"adj","definitions":["inflection of bilit:","indefinite feminine singular genitive/dative","indefinite feminine/neuter plural"]},{"word":"biliverdină","pos":"noun","definitions":["biliverdin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biliverdină","accusative-definite-nominative-singular":"biliverdina","accusative-indefinite-nominative-plural":"biliverdine","accusative-definite-nominative-plural":"biliverdinele","dative-genitive-indefinite-singular":"biliverdine","dative-definite-genitive-singular":"biliverdinei","dative-genitive-indefinite-plural":"biliverdine","dative-definite-genitive-plural":"biliverdinelor","singular-vocative":"biliverdină","plural-vocative":"biliverdinelor"}},{"word":"bilo","pos":"noun","definitions":["vocative singular of bilă"],"pronunciation":"[ˈbilo]","gender":"f"},{"word":"bilobat","pos":"adj","definitions":["bilobed"],"forms":{"feminine-singular":"bilobată","masculine-plural":"bilobați","feminine-neuter-plural":"bilobate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilobat","error-unrecognized-form-feminine-indefinite-singular":"bilobată","error-unrecognized-form-indefinite-masculine-plural":"bilobați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilobate","definite-error-unrecognized-form-masculine-neuter-singular":"bilobatul","definite-error-unrecognized-form-feminine-singular":"bilobata","definite-error-unrecognized-form-masculine-plural":"bilobații","definite-error-unrecognized-form-feminine-neuter-plural":"bilobatele"}},{"word":"bilocular","pos":"adj","definitions":["bilocular"],"forms":{"feminine-singular":"biloculară","masculine-plural":"biloculari","feminine-neuter-plural":"biloculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilocular","error-unrecognized-form-feminine-indefinite-singular":"biloculară","error-unrecognized-form-indefinite-masculine-plural":"biloculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"biloculare","definite-error-unrecognized-form-masculine-neuter-singular":"bilocularul","definite-error-unrecognized-form-feminine-singular":"biloculara","definite-error-unrecognized-form-masculine-plural":"bilocularii","definite-error-unrecognized-form-feminine-neuter-plural":"bilocularele"}},{"word":"bilșug","pos":"noun","definitions":["alternative form of belșug"],"forms":{"plural":"bilșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bilșug","accusative-definite-nominative-singular":"bilșugul","accusative-indefinite-nominative-plural":"bilșuguri","accusative-definite-nominative-plural":"bilșugurile","dative-genitive-indefinite-singular":"bilșug","dative-definite-genitive-singular":"bilșugului","dative-genitive-indefinite-plural":"bilșuguri","dative-definite-genitive-plural":"bilșugurilor","singular-vocative":"bilșugule","plural-vocative":"bilșugurilor"}},{"word":"Bilț","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Bilț"}},{"word":"Bîltănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîltănescu"}},{"word":"Bîlteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîlteanu"}},{"word":"bilunar","pos":"adj","definitions":["bi-monthly"],"forms":{"feminine-singular":"bilunară","masculine-plural":"bilunari","feminine-neuter-plural":"bilunare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bilunar","error-unrecognized-form-feminine-indefinite-singular":"bilunară","error-unrecognized-form-indefinite-masculine-plural":"bilunari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bilunare","definite-error-unrecognized-form-masculine-neuter-singular":"bilunarul","definite-error-unrecognized-form-feminine-singular":"bilunara","definite-error-unrecognized-form-masculine-plural":"bilunarii","definite-error-unrecognized-form-feminine-neuter-plural":"bilunarele"}},{"word":"Bîlvănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîlvănescu"}},{"word":"biman","pos":"adj","definitions":["two-handed"],"forms":{"feminine-singular":"bimană","masculine-plural":"bimani","feminine-neuter-plural":"bimane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biman","error-unrecognized-form-feminine-indefinite-singular":"bimană","error-unrecognized-form-indefinite-masculine-plural":"bimani","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimane","definite-error-unrecognized-form-masculine-neuter-singular":"bimanul","definite-error-unrecognized-form-feminine-singular":"bimana","definite-error-unrecognized-form-masculine-plural":"bimanii","definite-error-unrecognized-form-feminine-neuter-plural":"bimanele"}},{"word":"bimanitate","pos":"noun","definitions":["two-handedness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"bimanitate","accusative-definite-nominative":"bimanitatea","dative-genitive-indefinite":"bimanități","dative-definite-genitive":"bimanității","vocative":"-"}},{"word":"bimbașă","pos":"noun","definitions":["Ottoman commander of a thousand soldiers"],"forms":{"plural":"bimbași","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"bimbașă","accusative-definite-nominative-singular":"bimbașa","accusative-indefinite-nominative-plural":"bimbași","accusative-definite-nominative-plural":"bimbașii","dative-genitive-indefinite-singular":"bimbașă","dative-definite-genitive-singular":"bimbașei","dative-genitive-indefinite-plural":"bimbași","dative-definite-genitive-plural":"bimbașilor","singular-vocative":"bimbașă","plural-vocative":"bimbașilor"}},{"word":"bimensual","pos":"adj","definitions":["bimonthly"],"forms":{"feminine-singular":"bimensuală","masculine-plural":"bimensuali","feminine-neuter-plural":"bimensuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimensual","error-unrecognized-form-feminine-indefinite-singular":"bimensuală","error-unrecognized-form-indefinite-masculine-plural":"bimensuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimensuale","definite-error-unrecognized-form-masculine-neuter-singular":"bimensualul","definite-error-unrecognized-form-feminine-singular":"bimensuala","definite-error-unrecognized-form-masculine-plural":"bimensualii","definite-error-unrecognized-form-feminine-neuter-plural":"bimensualele"}},{"word":"bimestru","pos":"noun","definitions":["bimester (term of two months)"],"forms":{"plural":"bimestre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bimestru","accusative-definite-nominative-singular":"bimestruul","accusative-indefinite-nominative-plural":"bimestre","accusative-definite-nominative-plural":"bimestrele","dative-genitive-indefinite-singular":"bimestru","dative-definite-genitive-singular":"bimestruului","dative-genitive-indefinite-plural":"bimestre","dative-definite-genitive-plural":"bimestrelor","singular-vocative":"bimestruule","plural-vocative":"bimestrelor"}},{"word":"bimetal","pos":"noun","definitions":["bimetallic"],"forms":{"plural":"bimetale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bimetal","accusative-definite-nominative-singular":"bimetalul","accusative-indefinite-nominative-plural":"bimetale","accusative-definite-nominative-plural":"bimetalele","dative-genitive-indefinite-singular":"bimetal","dative-definite-genitive-singular":"bimetalului","dative-genitive-indefinite-plural":"bimetale","dative-definite-genitive-plural":"bimetalelor","singular-vocative":"bimetalule","plural-vocative":"bimetalelor"}},{"word":"bimetalic","pos":"adj","definitions":["bimetallic"],"forms":{"feminine-singular":"bimetalică","masculine-plural":"bimetalici","feminine-neuter-plural":"bimetalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimetalic","error-unrecognized-form-feminine-indefinite-singular":"bimetalică","error-unrecognized-form-indefinite-masculine-plural":"bimetalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimetalice","definite-error-unrecognized-form-masculine-neuter-singular":"bimetalicul","definite-error-unrecognized-form-feminine-singular":"bimetalica","definite-error-unrecognized-form-masculine-plural":"bimetalicii","definite-error-unrecognized-form-feminine-neuter-plural":"bimetalicele"}},{"word":"bimetalism","pos":"noun","definitions":["bimetallism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bimetalism","accusative-definite-nominative":"bimetalismul","dative-genitive-indefinite":"bimetalism","dative-definite-genitive":"bimetalismului","vocative":"bimetalismule"}},{"word":"bimetalist","pos":"adj","definitions":["bimetallist"],"forms":{"feminine-singular":"bimetalistă","masculine-plural":"bimetaliști","feminine-neuter-plural":"bimetaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimetalist","error-unrecognized-form-feminine-indefinite-singular":"bimetalistă","error-unrecognized-form-indefinite-masculine-plural":"bimetaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimetaliste","definite-error-unrecognized-form-masculine-neuter-singular":"bimetalistul","definite-error-unrecognized-form-feminine-singular":"bimetalista","definite-error-unrecognized-form-masculine-plural":"bimetaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"bimetalistele"}},{"word":"bimilenar","pos":"adj","definitions":["bimillenary"],"forms":{"feminine-singular":"bimilenară","masculine-plural":"bimilenari","feminine-neuter-plural":"bimilenare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimilenar","error-unrecognized-form-feminine-indefinite-singular":"bimilenară","error-unrecognized-form-indefinite-masculine-plural":"bimilenari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimilenare","definite-error-unrecognized-form-masculine-neuter-singular":"bimilenarul","definite-error-unrecognized-form-feminine-singular":"bimilenara","definite-error-unrecognized-form-masculine-plural":"bimilenarii","definite-error-unrecognized-form-feminine-neuter-plural":"bimilenarele"}},{"word":"bimileniu","pos":"noun","definitions":["bimillennium"],"forms":{"plural":"bimilenii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bimileniu","accusative-definite-nominative-singular":"bimileniul","accusative-indefinite-nominative-plural":"bimilenii","accusative-definite-nominative-plural":"bimileniile","dative-genitive-indefinite-singular":"bimileniu","dative-definite-genitive-singular":"bimileniului","dative-genitive-indefinite-plural":"bimilenii","dative-definite-genitive-plural":"bimileniilor","singular-vocative":"bimileniule","plural-vocative":"bimileniilor"}},{"word":"bimolecular","pos":"adj","definitions":["bimolecular"],"forms":{"feminine-singular":"bimoleculară","masculine-plural":"bimoleculari","feminine-neuter-plural":"bimoleculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimolecular","error-unrecognized-form-feminine-indefinite-singular":"bimoleculară","error-unrecognized-form-indefinite-masculine-plural":"bimoleculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimoleculare","definite-error-unrecognized-form-masculine-neuter-singular":"bimolecularul","definite-error-unrecognized-form-feminine-singular":"bimoleculara","definite-error-unrecognized-form-masculine-plural":"bimolecularii","definite-error-unrecognized-form-feminine-neuter-plural":"bimolecularele"}},{"word":"bimotor","pos":"adj","definitions":["twin-engine"],"forms":{"feminine-singular":"bimotoare","masculine-plural":"bimotori","feminine-neuter-plural":"bimotoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bimotor","error-unrecognized-form-feminine-indefinite-singular":"bimotoare","error-unrecognized-form-indefinite-masculine-plural":"bimotori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bimotoare","definite-error-unrecognized-form-masculine-neuter-singular":"bimotorul","definite-error-unrecognized-form-feminine-singular":"bimotoarea","definite-error-unrecognized-form-masculine-plural":"bimotorii","definite-error-unrecognized-form-feminine-neuter-plural":"bimotoarele"}},{"word":"bimotor","pos":"noun","definitions":["twin-engine plane"],"forms":{"plural":"bimotoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bimotor","accusative-definite-nominative-singular":"bimotorul","accusative-indefinite-nominative-plural":"bimotoare","accusative-definite-nominative-plural":"bimotoarele","dative-genitive-indefinite-singular":"bimotor","dative-definite-genitive-singular":"bimotorului","dative-genitive-indefinite-plural":"bimotoare","dative-definite-genitive-plural":"bimotoarelor","singular-vocative":"bimotorule","plural-vocative":"bimotoarelor"}},{"word":"bimpașă","pos":"noun","definitions":["alternative form of bímbașă"],"forms":{"plural":"bimpași","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"bimpașă","accusative-definite-nominative-singular":"bimpașa","accusative-indefinite-nominative-plural":"bimpași","accusative-definite-nominative-plural":"bimpașii","dative-genitive-indefinite-singular":"bimpașă","dative-definite-genitive-singular":"bimpașei","dative-genitive-indefinite-plural":"bimpași","dative-definite-genitive-plural":"bimpașilor","singular-vocative":"bimpașă","plural-vocative":"bimpașilor"}},{"word":"bina","pos":"noun","definitions":["building","building under construction"],"forms":{"plural":"binale","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bina","accusative-definite-nominative-singular":"binaua","accusative-indefinite-nominative-plural":"binale","accusative-definite-nominative-plural":"binalele","dative-genitive-indefinite-singular":"binale","dative-definite-genitive-singular":"binalei","dative-genitive-indefinite-plural":"binale","dative-definite-genitive-plural":"binalelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"binagiu","pos":"noun","definitions":["building industry entrepreneur"],"forms":{"plural":"binagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"binagiu","accusative-definite-nominative-singular":"binagiuul","accusative-indefinite-nominative-plural":"binagii","accusative-definite-nominative-plural":"binagiii","dative-genitive-indefinite-singular":"binagiu","dative-definite-genitive-singular":"binagiuului","dative-genitive-indefinite-plural":"binagii","dative-definite-genitive-plural":"binagiilor","singular-vocative":"binagiuule","plural-vocative":"binagiilor"}},{"word":"binar","pos":"adj","definitions":["binary"],"pronunciation":"/biˈnar/","forms":{"feminine-singular":"binară","masculine-plural":"binari","feminine-neuter-plural":"binare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"binar","error-unrecognized-form-feminine-indefinite-singular":"binară","error-unrecognized-form-indefinite-masculine-plural":"binari","error-unrecognized-form-feminine-indefinite-neuter-plural":"binare","definite-error-unrecognized-form-masculine-neuter-singular":"binarul","definite-error-unrecognized-form-feminine-singular":"binara","definite-error-unrecognized-form-masculine-plural":"binarii","definite-error-unrecognized-form-feminine-neuter-plural":"binarele"}},{"word":"binară","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of binar"]},{"word":"binaritate","pos":"noun","definitions":["binarity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"binaritate","accusative-definite-nominative":"binaritatea","dative-genitive-indefinite":"binarități","dative-definite-genitive":"binarității","vocative":"-"}},{"word":"bind","pos":"noun","definitions":["flag"],"forms":{"plural":"binduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bind","accusative-definite-nominative-singular":"bindul","accusative-indefinite-nominative-plural":"binduri","accusative-definite-nominative-plural":"bindurile","dative-genitive-indefinite-singular":"bind","dative-definite-genitive-singular":"bindului","dative-genitive-indefinite-plural":"binduri","dative-definite-genitive-plural":"bindurilor","singular-vocative":"bindule","plural-vocative":"bindurilor"}},{"word":"bindeu","pos":"noun","definitions":["animal stomach"],"forms":{"plural":"bindee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bindeu","accusative-definite-nominative-singular":"bindeuul","accusative-indefinite-nominative-plural":"bindee","accusative-definite-nominative-plural":"bindeele","dative-genitive-indefinite-singular":"bindeu","dative-definite-genitive-singular":"bindeuului","dative-genitive-indefinite-plural":"bindee","dative-definite-genitive-plural":"bindeelor","singular-vocative":"bindeuule","plural-vocative":"bindeelor"}},{"word":"bindisi","pos":"verb","definitions":["to care (about something or someone)"],"forms":{"canonical":"a bindisi 4th conjugation","present-singular-third-person":"bindisește","participle-past":"bindisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bindisi","gerund":"bindisind","first-person-indicative-present-singular":"bindisesc","indicative-present-second-person-singular":"bindisești","indicative-present-singular-third-person":"bindisește","first-person-indicative-plural-present":"bindisim","indicative-plural-present-second-person":"bindisiți","indicative-plural-present-third-person":"bindisesc","first-person-imperfect-indicative-singular":"bindiseam","imperfect-indicative-second-person-singular":"bindiseai","imperfect-indicative-singular-third-person":"bindisea","first-person-imperfect-indicative-plural":"bindiseam","imperfect-indicative-plural-second-person":"bindiseați","imperfect-indicative-plural-third-person":"bindiseau","first-person-indicative-perfect-singular":"bindisii","indicative-perfect-second-person-singular":"bindisiși","indicative-perfect-singular-third-person":"bindisi","first-person-indicative-perfect-plural":"bindisirăm","indicative-perfect-plural-second-person":"bindisirăți","indicative-perfect-plural-third-person":"bindisiră","first-person-indicative-pluperfect-singular":"bindisisem","indicative-pluperfect-second-person-singular":"bindisiseși","indicative-pluperfect-singular-third-person":"bindisise","first-person-indicative-pluperfect-plural":"bindisiserăm","indicative-pluperfect-plural-second-person":"bindisiserăți","indicative-pluperfect-plural-third-person":"bindisiseră","first-person-present-singular-subjunctive":"să bindisesc","present-second-person-singular-subjunctive":"să bindisești","present-singular-subjunctive-third-person":"să bindisească","first-person-plural-present-subjunctive":"să bindisim","plural-present-second-person-subjunctive":"să bindisiți","plural-present-subjunctive-third-person":"să bindisească","imperative-second-person-singular":"bindisește","imperative-plural-second-person":"bindisiți","imperative-negative-second-person-singular":"nu bindisi","imperative-negative-plural-second-person":"nu bindisiți"}},{"word":"bine","pos":"adv","definitions":["well"],"pronunciation":"/ˈbi.ne/"},{"word":"bine","pos":"adj","definitions":["handsome"],"pronunciation":"/ˈbi.ne/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bine","error-unrecognized-form-feminine-indefinite-singular":"bine","error-unrecognized-form-indefinite-masculine-plural":"bine","error-unrecognized-form-feminine-indefinite-neuter-plural":"bine","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"bine","pos":"noun","definitions":["good","wellbeing"],"pronunciation":"/ˈbi.ne/"},{"word":"binecrescut","pos":"adj","definitions":["maidenly"],"forms":{"feminine-singular":"binecrescută","masculine-plural":"binecrescuți","feminine-neuter-plural":"binecrescute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binecrescut","error-unrecognized-form-feminine-indefinite-singular":"binecrescută","error-unrecognized-form-indefinite-masculine-plural":"binecrescuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"binecrescute","definite-error-unrecognized-form-masculine-neuter-singular":"binecrescutul","definite-error-unrecognized-form-feminine-singular":"binecrescuta","definite-error-unrecognized-form-masculine-plural":"binecrescuții","definite-error-unrecognized-form-feminine-neuter-plural":"binecrescutele"}},{"word":"binecuvânta","pos":"verb","definitions":["to bless","to praise"],"forms":{"canonical":"a binecuvânta 1st conjugation","present-singular-third-person":"binecuvântează","participle-past":"binecuvântat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a binecuvânta","gerund":"binecuvântând","first-person-indicative-present-singular":"binecuvântez","indicative-present-second-person-singular":"binecuvântezi","indicative-present-singular-third-person":"binecuvântează","first-person-indicative-plural-present":"binecuvântăm","indicative-plural-present-second-person":"binecuvântați","indicative-plural-present-third-person":"binecuvântează","first-person-imperfect-indicative-singular":"binecuvântam","imperfect-indicative-second-person-singular":"binecuvântai","imperfect-indicative-singular-third-person":"binecuvânta","first-person-imperfect-indicative-plural":"binecuvântam","imperfect-indicative-plural-second-person":"binecuvântați","imperfect-indicative-plural-third-person":"binecuvântau","first-person-indicative-perfect-singular":"binecuvântai","indicative-perfect-second-person-singular":"binecuvântași","indicative-perfect-singular-third-person":"binecuvântă","first-person-indicative-perfect-plural":"binecuvântarăm","indicative-perfect-plural-second-person":"binecuvântarăți","indicative-perfect-plural-third-person":"binecuvântară","first-person-indicative-pluperfect-singular":"binecuvântasem","indicative-pluperfect-second-person-singular":"binecuvântaseși","indicative-pluperfect-singular-third-person":"binecuvântase","first-person-indicative-pluperfect-plural":"binecuvântaserăm","indicative-pluperfect-plural-second-person":"binecuvântaserăți","indicative-pluperfect-plural-third-person":"binecuvântaseră","first-person-present-singular-subjunctive":"să binecuvântez","present-second-person-singular-subjunctive":"să binecuvântezi","present-singular-subjunctive-third-person":"să binecuvânteze","first-person-plural-present-subjunctive":"să binecuvântăm","plural-present-second-person-subjunctive":"să binecuvântați","plural-present-subjunctive-third-person":"să binecuvânteze","imperative-second-person-singular":"binecuvântează","imperative-plural-second-person":"binecuvântați","imperative-negative-second-person-singular":"nu binecuvânta","imperative-negative-plural-second-person":"nu binecuvântați","alternative-obsolete":"binecuvênta","alternative":"binecuvînta"}},{"word":"binecuvântare","pos":"noun","definitions":["blessing (some kind of divine or supernatural aid, or reward)"],"pronunciation":"/bi.ne.ku.vɨnˈta.re/","forms":{"plural":"binecuvântări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"binecuvântare","accusative-definite-nominative-singular":"binecuvântarea","accusative-indefinite-nominative-plural":"binecuvântări","accusative-definite-nominative-plural":"binecuvântările","dative-genitive-indefinite-singular":"binecuvântări","dative-definite-genitive-singular":"binecuvântării","dative-genitive-indefinite-plural":"binecuvântări","dative-definite-genitive-plural":"binecuvântărilor","singular-vocative":"binecuvântare","plural-vocative":"binecuvântărilor","alternative":"binecuvêntare"}},{"word":"binecuvântat","pos":"adj","definitions":["blessed"],"forms":{"feminine-singular":"binecuvântată","masculine-plural":"binecuvântați","feminine-neuter-plural":"binecuvântate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binecuvântat","error-unrecognized-form-feminine-indefinite-singular":"binecuvântată","error-unrecognized-form-indefinite-masculine-plural":"binecuvântați","error-unrecognized-form-feminine-indefinite-neuter-plural":"binecuvântate","definite-error-unrecognized-form-masculine-neuter-singular":"binecuvântatul","definite-error-unrecognized-form-feminine-singular":"binecuvântata","definite-error-unrecognized-form-masculine-plural":"binecuvântații","definite-error-unrecognized-form-feminine-neuter-plural":"binecuvântatele","alternative":"binecuvîntat"}},{"word":"binefăcătoare","pos":"noun","definitions":["female equivalent of binefăcător"],"forms":{"plural":"binefăcătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"binefăcătoare","accusative-definite-nominative-singular":"binefăcătoarea","accusative-indefinite-nominative-plural":"binefăcătoare","accusative-definite-nominative-plural":"binefăcătoarele","dative-genitive-indefinite-singular":"binefăcătoare","dative-definite-genitive-singular":"binefăcătoarei","dative-genitive-indefinite-plural":"binefăcătoare","dative-definite-genitive-plural":"binefăcătoarelor","singular-vocative":"binefăcătoare","plural-vocative":"binefăcătoarelor"}},{"word":"binefăcător","pos":"noun","definitions":["benefactor, conferrer","do-gooder"],"pronunciation":"/ˌbi.ne.fə.kəˈtor/","forms":{"plural":"binefăcători","feminine":"equivalent binefăcătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"binefăcător","accusative-definite-nominative-singular":"binefăcătorul","accusative-indefinite-nominative-plural":"binefăcători","accusative-definite-nominative-plural":"binefăcătorii","dative-genitive-indefinite-singular":"binefăcător","dative-definite-genitive-singular":"binefăcătorului","dative-genitive-indefinite-plural":"binefăcători","dative-definite-genitive-plural":"binefăcătorilor","singular-vocative":"binefăcătorule","plural-vocative":"binefăcătorilor","alternative":"бинефэкэтор"}},{"word":"binefăcător","pos":"adj","definitions":["beneficent, charitable"],"pronunciation":"/ˌbi.ne.fə.kəˈtor/","forms":{"feminine-singular":"binefăcătoare","masculine-plural":"binefăcători","feminine-neuter-plural":"binefăcătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binefăcător","error-unrecognized-form-feminine-indefinite-singular":"binefăcătoare","error-unrecognized-form-indefinite-masculine-plural":"binefăcători","error-unrecognized-form-feminine-indefinite-neuter-plural":"binefăcătoare","definite-error-unrecognized-form-masculine-neuter-singular":"binefăcătorul","definite-error-unrecognized-form-feminine-singular":"binefăcătoarea","definite-error-unrecognized-form-masculine-plural":"binefăcătorii","definite-error-unrecognized-form-feminine-neuter-plural":"binefăcătoarele","alternative":"бинефэкэтор"}},{"word":"bineface","pos":"verb","definitions":["to do a good deed"],"forms":{"canonical":"a bineface 3rd conjugation","present-singular-third-person":"bineface","participle-past":"binefăcut","subjunctive-third-person":"binefacă","table-tags":"conjugation-3","inflection-template":"ro-conj-2","infinitive":"a bineface","gerund":"binefăcând","first-person-indicative-present-singular":"binefac","indicative-present-second-person-singular":"binefaci","indicative-present-singular-third-person":"bineface","first-person-indicative-plural-present":"binefacem","indicative-plural-present-second-person":"binefaceți","indicative-plural-present-third-person":"binefac","first-person-imperfect-indicative-singular":"binefăceam","imperfect-indicative-second-person-singular":"binefăceai","imperfect-indicative-singular-third-person":"binefăcea","first-person-imperfect-indicative-plural":"binefăceam","imperfect-indicative-plural-second-person":"binefăceați","imperfect-indicative-plural-third-person":"binefăceau","first-person-indicative-perfect-singular":"binefăcui","indicative-perfect-second-person-singular":"binefăcuși","indicative-perfect-singular-third-person":"binefăcu","first-person-indicative-perfect-plural":"binefăcurăm","indicative-perfect-plural-second-person":"binefăcurăți","indicative-perfect-plural-third-person":"binefăcură","first-person-indicative-pluperfect-singular":"binefăcusem","indicative-pluperfect-second-person-singular":"binefăcuseși","indicative-pluperfect-singular-third-person":"binefăcuse","first-person-indicative-pluperfect-plural":"binefăcuserăm","indicative-pluperfect-plural-second-person":"binefăcuserăți","indicative-pluperfect-plural-third-person":"binefăcuseră","first-person-present-singular-subjunctive":"să binefac","present-second-person-singular-subjunctive":"să binefaci","present-singular-subjunctive-third-person":"să binefacă","first-person-plural-present-subjunctive":"să binefacem","plural-present-second-person-subjunctive":"să binefaceți","plural-present-subjunctive-third-person":"să binefacă","imperative-second-person-singular":"binefă","imperative-plural-second-person":"binefaceți","imperative-negative-second-person-singular":"nu bineface","imperative-negative-plural-second-person":"nu binefaceți"}},{"word":"binefacere","pos":"noun","definitions":["benefaction (act of doing good)"],"pronunciation":"/bi.neˈfa.t͡ʃe.re/","forms":{"plural":"binefaceri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"binefacere","accusative-definite-nominative-singular":"binefacerea","accusative-indefinite-nominative-plural":"binefaceri","accusative-definite-nominative-plural":"binefacerile","dative-genitive-indefinite-singular":"binefaceri","dative-definite-genitive-singular":"binefacerii","dative-genitive-indefinite-plural":"binefaceri","dative-definite-genitive-plural":"binefacerilor","singular-vocative":"binefacere","plural-vocative":"binefacerilor"}},{"word":"binefaptă","pos":"noun","definitions":["benefaction"],"forms":{"plural":"binefapte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"binefaptă","accusative-definite-nominative-singular":"binefapta","accusative-indefinite-nominative-plural":"binefapte","accusative-definite-nominative-plural":"binefaptele","dative-genitive-indefinite-singular":"binefapte","dative-definite-genitive-singular":"binefaptei","dative-genitive-indefinite-plural":"binefapte","dative-definite-genitive-plural":"binefaptelor","singular-vocative":"binefaptă","plural-vocative":"binefaptelor"}},{"word":"bineînțeles","pos":"adv","definitions":["certainly; of course; naturally"],"pronunciation":"/bi.ne.ɨn.tseˈles/","forms":{"alternative-syncope":"bine-nțeles"}},{"word":"binemerita","pos":"verb","definitions":["to deserve"],"forms":{"canonical":"a binemerita 1st conjugation","present-singular-third-person":"binemerită","participle-past":"binemeritat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a binemerita","gerund":"binemeritând","first-person-indicative-present-singular":"binemerit","indicative-present-second-person-singular":"binemeriți","indicative-present-singular-third-person":"binemerită","first-person-indicative-plural-present":"binemerităm","indicative-plural-present-second-person":"binemeritați","indicative-plural-present-third-person":"binemerită","first-person-imperfect-indicative-singular":"binemeritam","imperfect-indicative-second-person-singular":"binemeritai","imperfect-indicative-singular-third-person":"binemerita","first-person-imperfect-indicative-plural":"binemeritam","imperfect-indicative-plural-second-person":"binemeritați","imperfect-indicative-plural-third-person":"binemeritau","first-person-indicative-perfect-singular":"binemeritai","indicative-perfect-second-person-singular":"binemeritași","indicative-perfect-singular-third-person":"binemerită","first-person-indicative-perfect-plural":"binemeritarăm","indicative-perfect-plural-second-person":"binemeritarăți","indicative-perfect-plural-third-person":"binemeritară","first-person-indicative-pluperfect-singular":"binemeritasem","indicative-pluperfect-second-person-singular":"binemeritaseși","indicative-pluperfect-singular-third-person":"binemeritase","first-person-indicative-pluperfect-plural":"binemeritaserăm","indicative-pluperfect-plural-second-person":"binemeritaserăți","indicative-pluperfect-plural-third-person":"binemeritaseră","first-person-present-singular-subjunctive":"să binemerit","present-second-person-singular-subjunctive":"să binemeriți","present-singular-subjunctive-third-person":"să binemerite","first-person-plural-present-subjunctive":"să binemerităm","plural-present-second-person-subjunctive":"să binemeritați","plural-present-subjunctive-third-person":"să binemerite","imperative-second-person-singular":"binemerită","imperative-plural-second-person":"binemeritați","imperative-negative-second-person-singular":"nu binemerita","imperative-negative-plural-second-person":"nu binemeritați"}},{"word":"binemeritat","pos":"adj","definitions":["well-deserved"],"forms":{"feminine-singular":"binemeritată","masculine-plural":"binemeritați","feminine-neuter-plural":"binemeritate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binemeritat","error-unrecognized-form-feminine-indefinite-singular":"binemeritată","error-unrecognized-form-indefinite-masculine-plural":"binemeritați","error-unrecognized-form-feminine-indefinite-neuter-plural":"binemeritate","definite-error-unrecognized-form-masculine-neuter-singular":"binemeritatul","definite-error-unrecognized-form-feminine-singular":"binemeritata","definite-error-unrecognized-form-masculine-plural":"binemeritații","definite-error-unrecognized-form-feminine-neuter-plural":"binemeritatele"}},{"word":"binemeritat","pos":"verb","definitions":["past participle of binemerita"],"forms":{"participle-past":"of binemerita"}},{"word":"binețe","pos":"noun","definitions":["greeting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"binețe","accusative-definite-nominative":"binețea","dative-genitive-indefinite":"binețe","dative-definite-genitive":"bineței","vocative":"binețe"}},{"word":"binevenit","pos":"adj","definitions":["welcome"],"forms":{"feminine-singular":"binevenită","masculine-plural":"bineveniți","feminine-neuter-plural":"binevenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binevenit","error-unrecognized-form-feminine-indefinite-singular":"binevenită","error-unrecognized-form-indefinite-masculine-plural":"bineveniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"binevenite","definite-error-unrecognized-form-masculine-neuter-singular":"binevenitul","definite-error-unrecognized-form-feminine-singular":"binevenita","definite-error-unrecognized-form-masculine-plural":"bineveniții","definite-error-unrecognized-form-feminine-neuter-plural":"binevenitele"}},{"word":"binevesti","pos":"verb","definitions":["to teach, to spread ideas or religious doctrines"],"forms":{"canonical":"a binevesti 4th conjugation","present-singular-third-person":"binevestește","participle-past":"binevestit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a binevesti","gerund":"binevestind","first-person-indicative-present-singular":"binevestesc","indicative-present-second-person-singular":"binevestești","indicative-present-singular-third-person":"binevestește","first-person-indicative-plural-present":"binevestim","indicative-plural-present-second-person":"binevestiți","indicative-plural-present-third-person":"binevestesc","first-person-imperfect-indicative-singular":"binevesteam","imperfect-indicative-second-person-singular":"binevesteai","imperfect-indicative-singular-third-person":"binevestea","first-person-imperfect-indicative-plural":"binevesteam","imperfect-indicative-plural-second-person":"binevesteați","imperfect-indicative-plural-third-person":"binevesteau","first-person-indicative-perfect-singular":"binevestii","indicative-perfect-second-person-singular":"binevestiși","indicative-perfect-singular-third-person":"binevesti","first-person-indicative-perfect-plural":"binevestirăm","indicative-perfect-plural-second-person":"binevestirăți","indicative-perfect-plural-third-person":"binevestiră","first-person-indicative-pluperfect-singular":"binevestisem","indicative-pluperfect-second-person-singular":"binevestiseși","indicative-pluperfect-singular-third-person":"binevestise","first-person-indicative-pluperfect-plural":"binevestiserăm","indicative-pluperfect-plural-second-person":"binevestiserăți","indicative-pluperfect-plural-third-person":"binevestiseră","first-person-present-singular-subjunctive":"să binevestesc","present-second-person-singular-subjunctive":"să binevestești","present-singular-subjunctive-third-person":"să binevestească","first-person-plural-present-subjunctive":"să binevestim","plural-present-second-person-subjunctive":"să binevestiți","plural-present-subjunctive-third-person":"să binevestească","imperative-second-person-singular":"binevestește","imperative-plural-second-person":"binevestiți","imperative-negative-second-person-singular":"nu binevesti","imperative-negative-plural-second-person":"nu binevestiți"}},{"word":"binevestit","pos":"noun","definitions":["sermon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"binevestit","accusative-definite-nominative":"binevestitul","dative-genitive-indefinite":"binevestit","dative-definite-genitive":"binevestitului","vocative":"binevestitule"}},{"word":"binevestit","pos":"verb","definitions":["past participle of binevesti"],"forms":{"participle-past":"of binevesti"}},{"word":"binevestitor","pos":"adj","definitions":["bringing a good news"],"forms":{"feminine-singular":"binevestitoare","masculine-plural":"binevestitori","feminine-neuter-plural":"binevestitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binevestitor","error-unrecognized-form-feminine-indefinite-singular":"binevestitoare","error-unrecognized-form-indefinite-masculine-plural":"binevestitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"binevestitoare","definite-error-unrecognized-form-masculine-neuter-singular":"binevestitorul","definite-error-unrecognized-form-feminine-singular":"binevestitoarea","definite-error-unrecognized-form-masculine-plural":"binevestitorii","definite-error-unrecognized-form-feminine-neuter-plural":"binevestitoarele"}},{"word":"binevoi","pos":"verb","definitions":["to be willing to"],"pronunciation":"/bi.ne.voˈi/","forms":{"canonical":"a binevoi 4th conjugation","present-singular-third-person":"binevoiește","participle-past":"binevoit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a binevoi","gerund":"binevoind","first-person-indicative-present-singular":"binevoiesc","indicative-present-second-person-singular":"binevoiești","indicative-present-singular-third-person":"binevoiește","first-person-indicative-plural-present":"binevoim","indicative-plural-present-second-person":"binevoiți","indicative-plural-present-third-person":"binevoiesc","first-person-imperfect-indicative-singular":"binevoiam","imperfect-indicative-second-person-singular":"binevoiai","imperfect-indicative-singular-third-person":"binevoia","first-person-imperfect-indicative-plural":"binevoiam","imperfect-indicative-plural-second-person":"binevoiați","imperfect-indicative-plural-third-person":"binevoiau","first-person-indicative-perfect-singular":"binevoii","indicative-perfect-second-person-singular":"binevoiși","indicative-perfect-singular-third-person":"binevoi","first-person-indicative-perfect-plural":"binevoirăm","indicative-perfect-plural-second-person":"binevoirăți","indicative-perfect-plural-third-person":"binevoiră","first-person-indicative-pluperfect-singular":"binevoisem","indicative-pluperfect-second-person-singular":"binevoiseși","indicative-pluperfect-singular-third-person":"binevoise","first-person-indicative-pluperfect-plural":"binevoiserăm","indicative-pluperfect-plural-second-person":"binevoiserăți","indicative-pluperfect-plural-third-person":"binevoiseră","first-person-present-singular-subjunctive":"să binevoiesc","present-second-person-singular-subjunctive":"să binevoiești","present-singular-subjunctive-third-person":"să binevoiască","first-person-plural-present-subjunctive":"să binevoim","plural-present-second-person-subjunctive":"să binevoiți","plural-present-subjunctive-third-person":"să binevoiască","imperative-second-person-singular":"binevoiește","imperative-plural-second-person":"binevoiți","imperative-negative-second-person-singular":"nu binevoi","imperative-negative-plural-second-person":"nu binevoiți"}},{"word":"binevoitoare","pos":"noun","definitions":["female equivalent of binevoitor"],"forms":{"plural":"binevoitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"binevoitoare","accusative-definite-nominative-singular":"binevoitoarea","accusative-indefinite-nominative-plural":"binevoitoare","accusative-definite-nominative-plural":"binevoitoarele","dative-genitive-indefinite-singular":"binevoitoare","dative-definite-genitive-singular":"binevoitoarei","dative-genitive-indefinite-plural":"binevoitoare","dative-definite-genitive-plural":"binevoitoarelor","singular-vocative":"binevoitoare","plural-vocative":"binevoitoarelor"}},{"word":"binevoitor","pos":"adj","definitions":["benevolent"],"forms":{"feminine-singular":"binevoitoare","masculine-plural":"binevoitori","feminine-neuter-plural":"binevoitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binevoitor","error-unrecognized-form-feminine-indefinite-singular":"binevoitoare","error-unrecognized-form-indefinite-masculine-plural":"binevoitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"binevoitoare","definite-error-unrecognized-form-masculine-neuter-singular":"binevoitorul","definite-error-unrecognized-form-feminine-singular":"binevoitoarea","definite-error-unrecognized-form-masculine-plural":"binevoitorii","definite-error-unrecognized-form-feminine-neuter-plural":"binevoitoarele"}},{"word":"binevoitor","pos":"noun","definitions":["benevolent person"],"forms":{"plural":"binevoitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"binevoitor","accusative-definite-nominative-singular":"binevoitorul","accusative-indefinite-nominative-plural":"binevoitori","accusative-definite-nominative-plural":"binevoitorii","dative-genitive-indefinite-singular":"binevoitor","dative-definite-genitive-singular":"binevoitorului","dative-genitive-indefinite-plural":"binevoitori","dative-definite-genitive-plural":"binevoitorilor","singular-vocative":"binevoitorule","plural-vocative":"binevoitorilor"}},{"word":"Biniș","pos":"name","definitions":["a village in Doclin, Caraș-Severin County, Romania"],"gender":"m"},{"word":"biniș","pos":"noun","definitions":["a robe worn by boyars"],"forms":{"plural":"binișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"biniș","accusative-definite-nominative-singular":"binișul","accusative-indefinite-nominative-plural":"binișuri","accusative-definite-nominative-plural":"binișurile","dative-genitive-indefinite-singular":"biniș","dative-definite-genitive-singular":"binișului","dative-genitive-indefinite-plural":"binișuri","dative-definite-genitive-plural":"binișurilor","singular-vocative":"binișule","plural-vocative":"binișurilor"}},{"word":"binișel","pos":"noun","definitions":["diminutive of biniș"],"forms":{"plural":"binișele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"binișel","accusative-definite-nominative-singular":"binișelul","accusative-indefinite-nominative-plural":"binișele","accusative-definite-nominative-plural":"binișelele","dative-genitive-indefinite-singular":"binișel","dative-definite-genitive-singular":"binișelului","dative-genitive-indefinite-plural":"binișele","dative-definite-genitive-plural":"binișelelor","singular-vocative":"binișelule","plural-vocative":"binișelelor"}},{"word":"binișliu","pos":"noun","definitions":["courtier"],"forms":{"plural":"binișlii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"binișliu","accusative-definite-nominative-singular":"binișliuul","accusative-indefinite-nominative-plural":"binișlii","accusative-definite-nominative-plural":"binișliii","dative-genitive-indefinite-singular":"binișliu","dative-definite-genitive-singular":"binișliuului","dative-genitive-indefinite-plural":"binișlii","dative-definite-genitive-plural":"binișliilor","singular-vocative":"binișliuule","plural-vocative":"binișliilor"}},{"word":"Binișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Binișor"}},{"word":"binișor","pos":"adv","definitions":["diminutive of bine"]},{"word":"binocla","pos":"verb","definitions":["to use a binocular","to stare"],"forms":{"canonical":"a binocla 1st conjugation","present-singular-third-person":"binoclează","participle-past":"binoclat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a binocla","gerund":"binoclând","first-person-indicative-present-singular":"binoclez","indicative-present-second-person-singular":"binoclezi","indicative-present-singular-third-person":"binoclează","first-person-indicative-plural-present":"binoclăm","indicative-plural-present-second-person":"binoclați","indicative-plural-present-third-person":"binoclează","first-person-imperfect-indicative-singular":"binoclam","imperfect-indicative-second-person-singular":"binoclai","imperfect-indicative-singular-third-person":"binocla","first-person-imperfect-indicative-plural":"binoclam","imperfect-indicative-plural-second-person":"binoclați","imperfect-indicative-plural-third-person":"binoclau","first-person-indicative-perfect-singular":"binoclai","indicative-perfect-second-person-singular":"binoclași","indicative-perfect-singular-third-person":"binoclă","first-person-indicative-perfect-plural":"binoclarăm","indicative-perfect-plural-second-person":"binoclarăți","indicative-perfect-plural-third-person":"binoclară","first-person-indicative-pluperfect-singular":"binoclasem","indicative-pluperfect-second-person-singular":"binoclaseși","indicative-pluperfect-singular-third-person":"binoclase","first-person-indicative-pluperfect-plural":"binoclaserăm","indicative-pluperfect-plural-second-person":"binoclaserăți","indicative-pluperfect-plural-third-person":"binoclaseră","first-person-present-singular-subjunctive":"să binoclez","present-second-person-singular-subjunctive":"să binoclezi","present-singular-subjunctive-third-person":"să binocleze","first-person-plural-present-subjunctive":"să binoclăm","plural-present-second-person-subjunctive":"să binoclați","plural-present-subjunctive-third-person":"să binocleze","imperative-second-person-singular":"binoclează","imperative-plural-second-person":"binoclați","imperative-negative-second-person-singular":"nu binocla","imperative-negative-plural-second-person":"nu binoclați"}},{"word":"binoclu","pos":"noun","definitions":["binocular"],"forms":{"plural":"binocluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"binoclu","accusative-definite-nominative-singular":"binoclul","accusative-indefinite-nominative-plural":"binocluri","accusative-definite-nominative-plural":"binoclurile","dative-genitive-indefinite-singular":"binoclu","dative-definite-genitive-singular":"binoclului","dative-genitive-indefinite-plural":"binocluri","dative-definite-genitive-plural":"binoclurilor","singular-vocative":"binoclule","plural-vocative":"binoclurilor"}},{"word":"binocular","pos":"adj","definitions":["binocular"],"forms":{"feminine-singular":"binoculară","masculine-plural":"binoculari","feminine-neuter-plural":"binoculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binocular","error-unrecognized-form-feminine-indefinite-singular":"binoculară","error-unrecognized-form-indefinite-masculine-plural":"binoculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"binoculare","definite-error-unrecognized-form-masculine-neuter-singular":"binocularul","definite-error-unrecognized-form-feminine-singular":"binoculara","definite-error-unrecognized-form-masculine-plural":"binocularii","definite-error-unrecognized-form-feminine-neuter-plural":"binocularele"}},{"word":"binom","pos":"noun","definitions":["binomial"],"forms":{"plural":"binoame"}},{"word":"binomial","pos":"adj","definitions":["binomial"],"forms":{"feminine-singular":"binomială","masculine-plural":"binomiali","feminine-neuter-plural":"binomiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"binomial","error-unrecognized-form-feminine-indefinite-singular":"binomială","error-unrecognized-form-indefinite-masculine-plural":"binomiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"binomiale","definite-error-unrecognized-form-masculine-neuter-singular":"binomialul","definite-error-unrecognized-form-feminine-singular":"binomiala","definite-error-unrecognized-form-masculine-plural":"binomialii","definite-error-unrecognized-form-feminine-neuter-plural":"binomialele"}},{"word":"binormală","pos":"noun","definitions":["binormal"],"forms":{"plural":"binormale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"binormală","accusative-definite-nominative-singular":"binormala","accusative-indefinite-nominative-plural":"binormale","accusative-definite-nominative-plural":"binormalele","dative-genitive-indefinite-singular":"binormale","dative-definite-genitive-singular":"binormalei","dative-genitive-indefinite-plural":"binormale","dative-definite-genitive-plural":"binormalelor","singular-vocative":"binormală","plural-vocative":"binormalelor"}},{"word":"bintă","pos":"noun","definitions":["bitt, bollard"],"forms":{"plural":"binte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bintă","accusative-definite-nominative-singular":"binta","accusative-indefinite-nominative-plural":"binte","accusative-definite-nominative-plural":"bintele","dative-genitive-indefinite-singular":"binte","dative-definite-genitive-singular":"bintei","dative-genitive-indefinite-plural":"binte","dative-definite-genitive-plural":"bintelor","singular-vocative":"bintă","plural-vocative":"bintelor"}},{"word":"bintătui","pos":"verb","definitions":["to punish"],"forms":{"canonical":"a bintătui 4th conjugation","present-singular-third-person":"bintătuiește","participle-past":"bintătuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bintătui","gerund":"bintătuind","first-person-indicative-present-singular":"bintătuiesc","indicative-present-second-person-singular":"bintătuiești","indicative-present-singular-third-person":"bintătuiește","first-person-indicative-plural-present":"bintătuim","indicative-plural-present-second-person":"bintătuiți","indicative-plural-present-third-person":"bintătuiesc","first-person-imperfect-indicative-singular":"bintătuiam","imperfect-indicative-second-person-singular":"bintătuiai","imperfect-indicative-singular-third-person":"bintătuia","first-person-imperfect-indicative-plural":"bintătuiam","imperfect-indicative-plural-second-person":"bintătuiați","imperfect-indicative-plural-third-person":"bintătuiau","first-person-indicative-perfect-singular":"bintătuii","indicative-perfect-second-person-singular":"bintătuiși","indicative-perfect-singular-third-person":"bintătui","first-person-indicative-perfect-plural":"bintătuirăm","indicative-perfect-plural-second-person":"bintătuirăți","indicative-perfect-plural-third-person":"bintătuiră","first-person-indicative-pluperfect-singular":"bintătuisem","indicative-pluperfect-second-person-singular":"bintătuiseși","indicative-pluperfect-singular-third-person":"bintătuise","first-person-indicative-pluperfect-plural":"bintătuiserăm","indicative-pluperfect-plural-second-person":"bintătuiserăți","indicative-pluperfect-plural-third-person":"bintătuiseră","first-person-present-singular-subjunctive":"să bintătuiesc","present-second-person-singular-subjunctive":"să bintătuiești","present-singular-subjunctive-third-person":"să bintătuiască","first-person-plural-present-subjunctive":"să bintătuim","plural-present-second-person-subjunctive":"să bintătuiți","plural-present-subjunctive-third-person":"să bintătuiască","imperative-second-person-singular":"bintătuiește","imperative-plural-second-person":"bintătuiți","imperative-negative-second-person-singular":"nu bintătui","imperative-negative-plural-second-person":"nu bintătuiți"}},{"word":"bioacumulare","pos":"noun","definitions":["bioaccumulation"],"forms":{"plural":"bioacumulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bioacumulare","accusative-definite-nominative-singular":"bioacumularea","accusative-indefinite-nominative-plural":"bioacumulări","accusative-definite-nominative-plural":"bioacumulările","dative-genitive-indefinite-singular":"bioacumulări","dative-definite-genitive-singular":"bioacumulării","dative-genitive-indefinite-plural":"bioacumulări","dative-definite-genitive-plural":"bioacumulărilor","singular-vocative":"bioacumulare","plural-vocative":"bioacumulărilor"}},{"word":"bioacustic","pos":"adj","definitions":["bioacoustic"],"forms":{"feminine-singular":"bioacustică","masculine-plural":"bioacustici","feminine-neuter-plural":"bioacustice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioacustic","error-unrecognized-form-feminine-indefinite-singular":"bioacustică","error-unrecognized-form-indefinite-masculine-plural":"bioacustici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioacustice","definite-error-unrecognized-form-masculine-neuter-singular":"bioacusticul","definite-error-unrecognized-form-feminine-singular":"bioacustica","definite-error-unrecognized-form-masculine-plural":"bioacusticii","definite-error-unrecognized-form-feminine-neuter-plural":"bioacusticele"}},{"word":"bioacustică","pos":"noun","definitions":["bioacoustics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"bioacustică","accusative-definite-nominative":"bioacustica","dative-genitive-indefinite":"bioacustici","dative-definite-genitive":"bioacusticii","vocative":"bioacustică"}},{"word":"bioamplificator","pos":"noun","definitions":["bioamplifier"],"forms":{"plural":"bioamplificatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bioamplificator","accusative-definite-nominative-singular":"bioamplificatorul","accusative-indefinite-nominative-plural":"bioamplificatore","accusative-definite-nominative-plural":"bioamplificatorele","dative-genitive-indefinite-singular":"bioamplificator","dative-definite-genitive-singular":"bioamplificatorului","dative-genitive-indefinite-plural":"bioamplificatore","dative-definite-genitive-plural":"bioamplificatorelor","singular-vocative":"bioamplificatorule","plural-vocative":"bioamplificatorelor"}},{"word":"bioastronautică","pos":"noun","definitions":["bioastronautics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"bioastronautică","accusative-definite-nominative":"bioastronautica","dative-genitive-indefinite":"bioastronautici","dative-definite-genitive":"bioastronauticii","vocative":"bioastronautică"}},{"word":"biobibliografic","pos":"adj","definitions":["biobibliographical"],"forms":{"feminine-singular":"biobibliografică","masculine-plural":"biobibliografici","feminine-neuter-plural":"biobibliografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biobibliografic","error-unrecognized-form-feminine-indefinite-singular":"biobibliografică","error-unrecognized-form-indefinite-masculine-plural":"biobibliografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biobibliografice","definite-error-unrecognized-form-masculine-neuter-singular":"biobibliograficul","definite-error-unrecognized-form-feminine-singular":"biobibliografica","definite-error-unrecognized-form-masculine-plural":"biobibliograficii","definite-error-unrecognized-form-feminine-neuter-plural":"biobibliograficele"}},{"word":"biobibliografie","pos":"noun","definitions":["biobibliography"],"forms":{"plural":"biobibliografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biobibliografie","accusative-definite-nominative-singular":"biobibliografia","accusative-indefinite-nominative-plural":"biobibliografii","accusative-definite-nominative-plural":"biobibliografiile","dative-genitive-indefinite-singular":"biobibliografii","dative-definite-genitive-singular":"biobibliografiei","dative-genitive-indefinite-plural":"biobibliografii","dative-definite-genitive-plural":"biobibliografiilor","singular-vocative":"biobibliografie","plural-vocative":"biobibliografiilor"}},{"word":"biocatalizator","pos":"noun","definitions":["biocatalyst"],"forms":{"plural":"biocatalizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biocatalizator","accusative-definite-nominative-singular":"biocatalizatorul","accusative-indefinite-nominative-plural":"biocatalizatori","accusative-definite-nominative-plural":"biocatalizatorii","dative-genitive-indefinite-singular":"biocatalizator","dative-definite-genitive-singular":"biocatalizatorului","dative-genitive-indefinite-plural":"biocatalizatori","dative-definite-genitive-plural":"biocatalizatorilor","singular-vocative":"biocatalizatorule","plural-vocative":"biocatalizatorilor"}},{"word":"biocenologie","pos":"noun","definitions":["biocenology"],"forms":{"plural":"biocenologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biocenologie","accusative-definite-nominative-singular":"biocenologia","accusative-indefinite-nominative-plural":"biocenologii","accusative-definite-nominative-plural":"biocenologiile","dative-genitive-indefinite-singular":"biocenologii","dative-definite-genitive-singular":"biocenologiei","dative-genitive-indefinite-plural":"biocenologii","dative-definite-genitive-plural":"biocenologiilor","singular-vocative":"biocenologie","plural-vocative":"biocenologiilor"}},{"word":"biocenotic","pos":"adj","definitions":["biocenotic"],"forms":{"feminine-singular":"biocenotică","masculine-plural":"biocenotici","feminine-neuter-plural":"biocenotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biocenotic","error-unrecognized-form-feminine-indefinite-singular":"biocenotică","error-unrecognized-form-indefinite-masculine-plural":"biocenotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biocenotice","definite-error-unrecognized-form-masculine-neuter-singular":"biocenoticul","definite-error-unrecognized-form-feminine-singular":"biocenotica","definite-error-unrecognized-form-masculine-plural":"biocenoticii","definite-error-unrecognized-form-feminine-neuter-plural":"biocenoticele"}},{"word":"biocenoză","pos":"noun","definitions":["biocoenose"],"forms":{"plural":"biocenoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biocenoză","accusative-definite-nominative-singular":"biocenoza","accusative-indefinite-nominative-plural":"biocenoze","accusative-definite-nominative-plural":"biocenozele","dative-genitive-indefinite-singular":"biocenoze","dative-definite-genitive-singular":"biocenozei","dative-genitive-indefinite-plural":"biocenoze","dative-definite-genitive-plural":"biocenozelor","singular-vocative":"biocenoză","plural-vocative":"biocenozelor"}},{"word":"biochimic","pos":"adj","definitions":["biochemical"],"pronunciation":"/ˌbi.oˈci.mik/","forms":{"feminine-singular":"biochimică","masculine-plural":"biochimici","feminine-neuter-plural":"biochimice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"biochimic","error-unrecognized-form-feminine-indefinite-singular":"biochimică","error-unrecognized-form-indefinite-masculine-plural":"biochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biochimice","definite-error-unrecognized-form-masculine-neuter-singular":"biochimicul","definite-error-unrecognized-form-feminine-singular":"biochimica","definite-error-unrecognized-form-masculine-plural":"biochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"biochimicele"}},{"word":"biochimie","pos":"noun","definitions":["biochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biochimie","accusative-definite-nominative":"biochimia","dative-genitive-indefinite":"biochimii","dative-definite-genitive":"biochimiei","vocative":"biochimie"}},{"word":"biochimist","pos":"noun","definitions":["biochemist"],"pronunciation":"/bi.o.kiˈmist/","forms":{"plural":"biochimiști","feminine":"equivalent biochimistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biochimist","accusative-definite-nominative-singular":"biochimistul","accusative-indefinite-nominative-plural":"biochimiști","accusative-definite-nominative-plural":"biochimiștii","dative-genitive-indefinite-singular":"biochimist","dative-definite-genitive-singular":"biochimistului","dative-genitive-indefinite-plural":"biochimiști","dative-definite-genitive-plural":"biochimiștilor","singular-vocative":"biochimistule","plural-vocative":"biochimiștilor"}},{"word":"biochimistă","pos":"noun","definitions":["female equivalent of biochimist"],"pronunciation":"/bi.o.kiˈmis.tə/","forms":{"plural":"biochimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"biochimistă","accusative-definite-nominative-singular":"biochimista","accusative-indefinite-nominative-plural":"biochimiste","accusative-definite-nominative-plural":"biochimistele","dative-genitive-indefinite-singular":"biochimiste","dative-definite-genitive-singular":"biochimistei","dative-genitive-indefinite-plural":"biochimiste","dative-definite-genitive-plural":"biochimistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"biochimiste","pos":"noun","definitions":["plural of biochimistă"],"gender":"f"},{"word":"biochimiști","pos":"noun","definitions":["plural of biochimist"],"gender":"m"},{"word":"biocibernetic","pos":"noun","definitions":["biocybernetic"],"forms":{"plural":"biocibernetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"biocibernetic","accusative-definite-nominative-singular":"biociberneti","accusative-indefinite-nominative-plural":"biocibernetici","accusative-definite-nominative-plural":"biociberneticile","dative-genitive-indefinite-singular":"biocibernetici","dative-definite-genitive-singular":"biociberneticii","dative-genitive-indefinite-plural":"biocibernetici","dative-definite-genitive-plural":"biociberneticilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"biocibernetică","pos":"noun","definitions":["biocybernetics"],"forms":{"plural":"biocibernetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biocibernetică","accusative-definite-nominative-singular":"biocibernetica","accusative-indefinite-nominative-plural":"biocibernetici","accusative-definite-nominative-plural":"biociberneticile","dative-genitive-indefinite-singular":"biocibernetici","dative-definite-genitive-singular":"biociberneticii","dative-genitive-indefinite-plural":"biocibernetici","dative-definite-genitive-plural":"biociberneticilor","singular-vocative":"biocibernetică","plural-vocative":"biociberneticilor"}},{"word":"biociclu","pos":"noun","definitions":["biocycle"],"forms":{"plural":"biocicluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biociclu","accusative-definite-nominative-singular":"biocicluul","accusative-indefinite-nominative-plural":"biocicluri","accusative-definite-nominative-plural":"biociclurile","dative-genitive-indefinite-singular":"biociclu","dative-definite-genitive-singular":"biocicluului","dative-genitive-indefinite-plural":"biocicluri","dative-definite-genitive-plural":"biociclurilor","singular-vocative":"biocicluule","plural-vocative":"biociclurilor"}},{"word":"biocinetic","pos":"noun","definitions":["biokinetic"],"forms":{"plural":"biocinetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"biocinetic","accusative-definite-nominative-singular":"biocineti","accusative-indefinite-nominative-plural":"biocinetici","accusative-definite-nominative-plural":"biocineticile","dative-genitive-indefinite-singular":"biocinetici","dative-definite-genitive-singular":"biocineticii","dative-genitive-indefinite-plural":"biocinetici","dative-definite-genitive-plural":"biocineticilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"biocinetică","pos":"noun","definitions":["biokinetics"],"forms":{"plural":"biocinetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biocinetică","accusative-definite-nominative-singular":"biocinetica","accusative-indefinite-nominative-plural":"biocinetici","accusative-definite-nominative-plural":"biocineticile","dative-genitive-indefinite-singular":"biocinetici","dative-definite-genitive-singular":"biocineticii","dative-genitive-indefinite-plural":"biocinetici","dative-definite-genitive-plural":"biocineticilor","singular-vocative":"biocinetică","plural-vocative":"biocineticilor"}},{"word":"bioclimatic","pos":"adj","definitions":["bioclimatic"],"forms":{"feminine-singular":"bioclimatică","masculine-plural":"bioclimatici","feminine-neuter-plural":"bioclimatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioclimatic","error-unrecognized-form-feminine-indefinite-singular":"bioclimatică","error-unrecognized-form-indefinite-masculine-plural":"bioclimatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioclimatice","definite-error-unrecognized-form-masculine-neuter-singular":"bioclimaticul","definite-error-unrecognized-form-feminine-singular":"bioclimatica","definite-error-unrecognized-form-masculine-plural":"bioclimaticii","definite-error-unrecognized-form-feminine-neuter-plural":"bioclimaticele"}},{"word":"bioclimatolog","pos":"noun","definitions":["bioclimatologist"],"forms":{"plural":"bioclimatologi","feminine":"equivalent bioclimatologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bioclimatolog","accusative-definite-nominative-singular":"bioclimatologul","accusative-indefinite-nominative-plural":"bioclimatologi","accusative-definite-nominative-plural":"bioclimatologii","dative-genitive-indefinite-singular":"bioclimatolog","dative-definite-genitive-singular":"bioclimatologului","dative-genitive-indefinite-plural":"bioclimatologi","dative-definite-genitive-plural":"bioclimatologilor","singular-vocative":"bioclimatologule","plural-vocative":"bioclimatologilor"}},{"word":"bioclimatologă","pos":"noun","definitions":["female equivalent of bioclimatolog"],"forms":{"plural":"bioclimatologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bioclimatologă","accusative-definite-nominative-singular":"bioclimatologa","accusative-indefinite-nominative-plural":"bioclimatologe","accusative-definite-nominative-plural":"bioclimatologele","dative-genitive-indefinite-singular":"bioclimatologe","dative-definite-genitive-singular":"bioclimatologei","dative-genitive-indefinite-plural":"bioclimatologe","dative-definite-genitive-plural":"bioclimatologelor","singular-vocative":"bioclimatologă","plural-vocative":"bioclimatologelor"}},{"word":"bioclimatologie","pos":"noun","definitions":["bioclimatology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bioclimatologie","accusative-definite-nominative":"bioclimatologia","dative-genitive-indefinite":"bioclimatologii","dative-definite-genitive":"bioclimatologiei","vocative":"bioclimatologie"}},{"word":"biocombustibil","pos":"noun","definitions":["biofuel"],"forms":{"plural":"biocombustibili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biocombustibil","accusative-definite-nominative-singular":"biocombustibilul","accusative-indefinite-nominative-plural":"biocombustibili","accusative-definite-nominative-plural":"biocombustibilii","dative-genitive-indefinite-singular":"biocombustibil","dative-definite-genitive-singular":"biocombustibilului","dative-genitive-indefinite-plural":"biocombustibili","dative-definite-genitive-plural":"biocombustibililor","singular-vocative":"biocombustibilule","plural-vocative":"biocombustibililor"}},{"word":"biocompatibil","pos":"adj","definitions":["biocompatible"],"forms":{"feminine-singular":"biocompatibilă","masculine-plural":"biocompatibili","feminine-neuter-plural":"biocompatibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biocompatibil","error-unrecognized-form-feminine-indefinite-singular":"biocompatibilă","error-unrecognized-form-indefinite-masculine-plural":"biocompatibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"biocompatibile","definite-error-unrecognized-form-masculine-neuter-singular":"biocompatibilul","definite-error-unrecognized-form-feminine-singular":"biocompatibila","definite-error-unrecognized-form-masculine-plural":"biocompatibilii","definite-error-unrecognized-form-feminine-neuter-plural":"biocompatibilele"}},{"word":"biocomplex","pos":"noun","definitions":["biocomplex"],"forms":{"plural":"biocomplexe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biocomplex","accusative-definite-nominative-singular":"biocomplexul","accusative-indefinite-nominative-plural":"biocomplexe","accusative-definite-nominative-plural":"biocomplexele","dative-genitive-indefinite-singular":"biocomplex","dative-definite-genitive-singular":"biocomplexului","dative-genitive-indefinite-plural":"biocomplexe","dative-definite-genitive-plural":"biocomplexelor","singular-vocative":"biocomplexule","plural-vocative":"biocomplexelor"}},{"word":"biocrom","pos":"noun","definitions":["biochrome"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"biocrom","accusative-definite-nominative":"biocromul","dative-genitive-indefinite":"biocrom","dative-definite-genitive":"biocromului","vocative":"biocromule"}},{"word":"biodegradabil","pos":"adj","definitions":["biodegradable"],"forms":{"feminine-singular":"biodegradabilă","masculine-plural":"biodegradabili","feminine-neuter-plural":"biodegradabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biodegradabil","error-unrecognized-form-feminine-indefinite-singular":"biodegradabilă","error-unrecognized-form-indefinite-masculine-plural":"biodegradabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"biodegradabile","definite-error-unrecognized-form-masculine-neuter-singular":"biodegradabilul","definite-error-unrecognized-form-feminine-singular":"biodegradabila","definite-error-unrecognized-form-masculine-plural":"biodegradabilii","definite-error-unrecognized-form-feminine-neuter-plural":"biodegradabilele"}},{"word":"biodegradare","pos":"noun","definitions":["biodegradation"]},{"word":"biodetector","pos":"noun","definitions":["biodetector"],"forms":{"plural":"biodetectoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biodetector","accusative-definite-nominative-singular":"biodetectorul","accusative-indefinite-nominative-plural":"biodetectoare","accusative-definite-nominative-plural":"biodetectoarele","dative-genitive-indefinite-singular":"biodetector","dative-definite-genitive-singular":"biodetectorului","dative-genitive-indefinite-plural":"biodetectoare","dative-definite-genitive-plural":"biodetectoarelor","singular-vocative":"biodetectorule","plural-vocative":"biodetectoarelor"}},{"word":"biodeteriorare","pos":"noun","definitions":["biodeterioration"],"forms":{"plural":"biodeteriorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biodeteriorare","accusative-definite-nominative-singular":"biodeteriorarea","accusative-indefinite-nominative-plural":"biodeteriorări","accusative-definite-nominative-plural":"biodeteriorările","dative-genitive-indefinite-singular":"biodeteriorări","dative-definite-genitive-singular":"biodeteriorării","dative-genitive-indefinite-plural":"biodeteriorări","dative-definite-genitive-plural":"biodeteriorărilor","singular-vocative":"biodeteriorare","plural-vocative":"biodeteriorărilor"}},{"word":"biodinamic","pos":"adj","definitions":["biodynamic"],"forms":{"feminine-singular":"biodinamică","masculine-plural":"biodinamici","feminine-neuter-plural":"biodinamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biodinamic","error-unrecognized-form-feminine-indefinite-singular":"biodinamică","error-unrecognized-form-indefinite-masculine-plural":"biodinamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biodinamice","definite-error-unrecognized-form-masculine-neuter-singular":"biodinamicul","definite-error-unrecognized-form-feminine-singular":"biodinamica","definite-error-unrecognized-form-masculine-plural":"biodinamicii","definite-error-unrecognized-form-feminine-neuter-plural":"biodinamicele"}},{"word":"biodinamică","pos":"noun","definitions":["biodynamics"],"forms":{"plural":"biodinamici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biodinamică","accusative-definite-nominative-singular":"biodinamica","accusative-indefinite-nominative-plural":"biodinamici","accusative-definite-nominative-plural":"biodinamicile","dative-genitive-indefinite-singular":"biodinamici","dative-definite-genitive-singular":"biodinamicii","dative-genitive-indefinite-plural":"biodinamici","dative-definite-genitive-plural":"biodinamicilor","singular-vocative":"biodinamică","plural-vocative":"biodinamicilor"}},{"word":"biodiversitate","pos":"noun","definitions":["biodiversity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"biodiversitate","accusative-definite-nominative":"biodiversitatea","dative-genitive-indefinite":"biodiversități","dative-definite-genitive":"biodiversității","vocative":"-"}},{"word":"bioelectric","pos":"adj","definitions":["bioelectric"],"forms":{"feminine-singular":"bioelectrică","masculine-plural":"bioelectrici","feminine-neuter-plural":"bioelectrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioelectric","error-unrecognized-form-feminine-indefinite-singular":"bioelectrică","error-unrecognized-form-indefinite-masculine-plural":"bioelectrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioelectrice","definite-error-unrecognized-form-masculine-neuter-singular":"bioelectricul","definite-error-unrecognized-form-feminine-singular":"bioelectrica","definite-error-unrecognized-form-masculine-plural":"bioelectricii","definite-error-unrecognized-form-feminine-neuter-plural":"bioelectricele"}},{"word":"bioelectricitate","pos":"noun","definitions":["bioelectricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"bioelectricitate","accusative-definite-nominative":"bioelectricitatea","dative-genitive-indefinite":"bioelectricități","dative-definite-genitive":"bioelectricității","vocative":"-"}},{"word":"bioelectronică","pos":"noun","definitions":["bioelectronics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bioelectronică","accusative-definite-nominative":"bioelectronica","dative-genitive-indefinite":"bioelectronice","dative-definite-genitive":"bioelectronicei","vocative":"bioelectronică"}},{"word":"bioelement","pos":"noun","definitions":["bioelement"],"forms":{"plural":"bioelemente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bioelement","accusative-definite-nominative-singular":"bioelementul","accusative-indefinite-nominative-plural":"bioelemente","accusative-definite-nominative-plural":"bioelementele","dative-genitive-indefinite-singular":"bioelement","dative-definite-genitive-singular":"bioelementului","dative-genitive-indefinite-plural":"bioelemente","dative-definite-genitive-plural":"bioelementelor","singular-vocative":"bioelementule","plural-vocative":"bioelementelor"}},{"word":"bioenergetic","pos":"adj","definitions":["bioenergetic"],"forms":{"feminine-singular":"bioenergetică","masculine-plural":"bioenergetici","feminine-neuter-plural":"bioenergetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioenergetic","error-unrecognized-form-feminine-indefinite-singular":"bioenergetică","error-unrecognized-form-indefinite-masculine-plural":"bioenergetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioenergetice","definite-error-unrecognized-form-masculine-neuter-singular":"bioenergeticul","definite-error-unrecognized-form-feminine-singular":"bioenergetica","definite-error-unrecognized-form-masculine-plural":"bioenergeticii","definite-error-unrecognized-form-feminine-neuter-plural":"bioenergeticele"}},{"word":"bioenergetică","pos":"noun","definitions":["bioenergetics"],"forms":{"plural":"bioenergetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bioenergetică","accusative-definite-nominative-singular":"bioenergetica","accusative-indefinite-nominative-plural":"bioenergetici","accusative-definite-nominative-plural":"bioenergeticile","dative-genitive-indefinite-singular":"bioenergetici","dative-definite-genitive-singular":"bioenergeticii","dative-genitive-indefinite-plural":"bioenergetici","dative-definite-genitive-plural":"bioenergeticilor","singular-vocative":"bioenergetică","plural-vocative":"bioenergeticilor"}},{"word":"bioenergie","pos":"noun","definitions":["bioenergy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bioenergie","accusative-definite-nominative":"bioenergia","dative-genitive-indefinite":"bioenergii","dative-definite-genitive":"bioenergiei","vocative":"bioenergie"}},{"word":"bioetică","pos":"noun","definitions":["bioethics"],"forms":{"plural":"bioetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"bioetică","accusative-definite-nominative":"bioetica","dative-genitive-indefinite":"bioetici","dative-definite-genitive":"bioeticii","vocative":"bioetică"}},{"word":"biofil","pos":"adj","definitions":["biophilic"],"forms":{"feminine-singular":"biofilă","masculine-plural":"biofili","feminine-neuter-plural":"biofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biofil","error-unrecognized-form-feminine-indefinite-singular":"biofilă","error-unrecognized-form-indefinite-masculine-plural":"biofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"biofile","definite-error-unrecognized-form-masculine-neuter-singular":"biofilul","definite-error-unrecognized-form-feminine-singular":"biofila","definite-error-unrecognized-form-masculine-plural":"biofilii","definite-error-unrecognized-form-feminine-neuter-plural":"biofilele"}},{"word":"biofiltru","pos":"noun","definitions":["biofilter"],"forms":{"plural":"biofiltre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biofiltru","accusative-definite-nominative-singular":"biofiltrul","accusative-indefinite-nominative-plural":"biofiltre","accusative-definite-nominative-plural":"biofiltrele","dative-genitive-indefinite-singular":"biofiltru","dative-definite-genitive-singular":"biofiltrului","dative-genitive-indefinite-plural":"biofiltre","dative-definite-genitive-plural":"biofiltrelor","singular-vocative":"biofiltrule","plural-vocative":"biofiltrelor"}},{"word":"biofizic","pos":"adj","definitions":["biophysical"],"forms":{"feminine-singular":"biofizică","masculine-plural":"biofizici","feminine-neuter-plural":"biofizice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biofizic","error-unrecognized-form-feminine-indefinite-singular":"biofizică","error-unrecognized-form-indefinite-masculine-plural":"biofizici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biofizice","definite-error-unrecognized-form-masculine-neuter-singular":"biofizicul","definite-error-unrecognized-form-feminine-singular":"biofizica","definite-error-unrecognized-form-masculine-plural":"biofizicii","definite-error-unrecognized-form-feminine-neuter-plural":"biofizicele"}},{"word":"biofizică","pos":"noun","definitions":["biophysics"],"pronunciation":"[bi.oˈfi.zi.kə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"biofizică","accusative-definite-nominative":"biofizica","dative-genitive-indefinite":"biofizici","dative-definite-genitive":"biofizicii","vocative":"biofizică"}},{"word":"biofizician","pos":"noun","definitions":["biophysicist"],"pronunciation":"[bi.o.fi.ziˈt͡ʃjan]","forms":{"plural":"biofizicieni","feminine":"equivalent biofiziciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biofizician","accusative-definite-nominative-singular":"biofizicianul","accusative-indefinite-nominative-plural":"biofizicieni","accusative-definite-nominative-plural":"biofizicienii","dative-genitive-indefinite-singular":"biofizician","dative-definite-genitive-singular":"biofizicianului","dative-genitive-indefinite-plural":"biofizicieni","dative-definite-genitive-plural":"biofizicienilor","singular-vocative":"biofizicianule","plural-vocative":"biofizicienilor"}},{"word":"biofiziciană","pos":"noun","definitions":["female equivalent of biofizician"],"forms":{"plural":"biofiziciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biofiziciană","accusative-definite-nominative-singular":"biofiziciana","accusative-indefinite-nominative-plural":"biofiziciene","accusative-definite-nominative-plural":"biofizicienele","dative-genitive-indefinite-singular":"biofiziciene","dative-definite-genitive-singular":"biofizicienei","dative-genitive-indefinite-plural":"biofiziciene","dative-definite-genitive-plural":"biofizicienelor","singular-vocative":"biofiziciană","plural-vocative":"biofizicienelor"}},{"word":"biofoton","pos":"noun","definitions":["biophoton"],"forms":{"plural":"biofotoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biofoton","accusative-definite-nominative-singular":"biofotonul","accusative-indefinite-nominative-plural":"biofotoni","accusative-definite-nominative-plural":"biofotonii","dative-genitive-indefinite-singular":"biofoton","dative-definite-genitive-singular":"biofotonului","dative-genitive-indefinite-plural":"biofotoni","dative-definite-genitive-plural":"biofotonilor","singular-vocative":"biofotonule","plural-vocative":"biofotonilor"}},{"word":"biogaz","pos":"noun","definitions":["biogas"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"biogaz","accusative-definite-nominative":"biogazul","dative-genitive-indefinite":"biogaz","dative-definite-genitive":"biogazului","vocative":"biogazule"}},{"word":"biogen","pos":"adj","definitions":["biogenic"],"forms":{"feminine-singular":"biogenă","masculine-plural":"biogeni","feminine-neuter-plural":"biogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biogen","error-unrecognized-form-feminine-indefinite-singular":"biogenă","error-unrecognized-form-indefinite-masculine-plural":"biogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"biogene","definite-error-unrecognized-form-masculine-neuter-singular":"biogenul","definite-error-unrecognized-form-feminine-singular":"biogena","definite-error-unrecognized-form-masculine-plural":"biogenii","definite-error-unrecognized-form-feminine-neuter-plural":"biogenele"}},{"word":"biogenetic","pos":"adj","definitions":["biogenetic"],"forms":{"feminine-singular":"biogenetică","masculine-plural":"biogenetici","feminine-neuter-plural":"biogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biogenetic","error-unrecognized-form-feminine-indefinite-singular":"biogenetică","error-unrecognized-form-indefinite-masculine-plural":"biogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"biogeneticul","definite-error-unrecognized-form-feminine-singular":"biogenetica","definite-error-unrecognized-form-masculine-plural":"biogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"biogeneticele"}},{"word":"biogenetică","pos":"adj","definitions":["nominative/accusative feminine singular of biogenetic"]},{"word":"biogenetică","pos":"noun","definitions":["biogenetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"biogenetică","accusative-definite-nominative":"biogenetica","dative-genitive-indefinite":"biogenetici","dative-definite-genitive":"biogeneticii","vocative":"biogenetică"}},{"word":"biogeneza","pos":"noun","definitions":["nominative/accusative definite singular of biogeneză"],"gender":"f"},{"word":"biogeneză","pos":"noun","definitions":["biogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biogeneză","accusative-definite-nominative-singular":"biogeneza","accusative-indefinite-nominative-plural":"biogeneze","accusative-definite-nominative-plural":"biogenezele","dative-genitive-indefinite-singular":"biogeneze","dative-definite-genitive-singular":"biogenezei","dative-genitive-indefinite-plural":"biogeneze","dative-definite-genitive-plural":"biogenezelor","singular-vocative":"biogeneză","plural-vocative":"biogenezelor"}},{"word":"biogenezo","pos":"noun","definitions":["vocative singular of biogeneză"],"gender":"f"},{"word":"biogenie","pos":"noun","definitions":["biogenesis"],"forms":{"plural":"biogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biogenie","accusative-definite-nominative-singular":"biogenia","accusative-indefinite-nominative-plural":"biogenii","accusative-definite-nominative-plural":"biogeniile","dative-genitive-indefinite-singular":"biogenii","dative-definite-genitive-singular":"biogeniei","dative-genitive-indefinite-plural":"biogenii","dative-definite-genitive-plural":"biogeniilor","singular-vocative":"biogenie","plural-vocative":"biogeniilor"}},{"word":"biogeocenologie","pos":"noun","definitions":["biogeocenology"],"forms":{"plural":"biogeocenologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biogeocenologie","accusative-definite-nominative-singular":"biogeocenologia","accusative-indefinite-nominative-plural":"biogeocenologii","accusative-definite-nominative-plural":"biogeocenologiile","dative-genitive-indefinite-singular":"biogeocenologii","dative-definite-genitive-singular":"biogeocenologiei","dative-genitive-indefinite-plural":"biogeocenologii","dative-definite-genitive-plural":"biogeocenologiilor","singular-vocative":"biogeocenologie","plural-vocative":"biogeocenologiilor"}},{"word":"biogeochimic","pos":"adj","definitions":["biogeochemical"],"forms":{"feminine-singular":"biogeochimică","masculine-plural":"biogeochimici","feminine-neuter-plural":"biogeochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biogeochimic","error-unrecognized-form-feminine-indefinite-singular":"biogeochimică","error-unrecognized-form-indefinite-masculine-plural":"biogeochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biogeochimice","definite-error-unrecognized-form-masculine-neuter-singular":"biogeochimicul","definite-error-unrecognized-form-feminine-singular":"biogeochimica","definite-error-unrecognized-form-masculine-plural":"biogeochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"biogeochimicele"}},{"word":"biogeochimie","pos":"noun","definitions":["biogeochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biogeochimie","accusative-definite-nominative-singular":"biogeochimia","accusative-indefinite-nominative-plural":"biogeochimii","accusative-definite-nominative-plural":"biogeochimiile","dative-genitive-indefinite-singular":"biogeochimii","dative-definite-genitive-singular":"biogeochimiei","dative-genitive-indefinite-plural":"biogeochimii","dative-definite-genitive-plural":"biogeochimiilor","singular-vocative":"biogeochimie","plural-vocative":"biogeochimiilor"}},{"word":"biogeograf","pos":"noun","definitions":["biogeographer"],"forms":{"plural":"biogeografi","feminine":"equivalent biogeografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biogeograf","accusative-definite-nominative-singular":"biogeograful","accusative-indefinite-nominative-plural":"biogeografi","accusative-definite-nominative-plural":"biogeografii","dative-genitive-indefinite-singular":"biogeograf","dative-definite-genitive-singular":"biogeografului","dative-genitive-indefinite-plural":"biogeografi","dative-definite-genitive-plural":"biogeografilor","singular-vocative":"biogeografule","plural-vocative":"biogeografilor"}},{"word":"biogeografă","pos":"noun","definitions":["female equivalent of biogeograf"],"forms":{"plural":"biogeografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biogeografă","accusative-definite-nominative-singular":"biogeografa","accusative-indefinite-nominative-plural":"biogeografe","accusative-definite-nominative-plural":"biogeografele","dative-genitive-indefinite-singular":"biogeografe","dative-definite-genitive-singular":"biogeografei","dative-genitive-indefinite-plural":"biogeografe","dative-definite-genitive-plural":"biogeografelor","singular-vocative":"biogeografă","plural-vocative":"biogeografelor"}},{"word":"biogeografic","pos":"adj","definitions":["biogeographic"],"forms":{"feminine-singular":"biogeografică","masculine-plural":"biogeografici","feminine-neuter-plural":"biogeografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biogeografic","error-unrecognized-form-feminine-indefinite-singular":"biogeografică","error-unrecognized-form-indefinite-masculine-plural":"biogeografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biogeografice","definite-error-unrecognized-form-masculine-neuter-singular":"biogeograficul","definite-error-unrecognized-form-feminine-singular":"biogeografica","definite-error-unrecognized-form-masculine-plural":"biogeograficii","definite-error-unrecognized-form-feminine-neuter-plural":"biogeograficele"}},{"word":"biogeografie","pos":"noun","definitions":["biogeography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biogeografie","accusative-definite-nominative":"biogeografia","dative-genitive-indefinite":"biogeografii","dative-definite-genitive":"biogeografiei","vocative":"biogeografie"}},{"word":"bioglifă","pos":"noun","definitions":["bioglyph"],"forms":{"plural":"bioglife","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bioglifă","accusative-definite-nominative-singular":"bioglifa","accusative-indefinite-nominative-plural":"bioglife","accusative-definite-nominative-plural":"bioglifele","dative-genitive-indefinite-singular":"bioglife","dative-definite-genitive-singular":"bioglifei","dative-genitive-indefinite-plural":"bioglife","dative-definite-genitive-plural":"bioglifelor","singular-vocative":"bioglifă","plural-vocative":"bioglifelor"}},{"word":"biograf","pos":"noun","definitions":["biographer"],"forms":{"plural":"biografi","feminine":"equivalent biografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biograf","accusative-definite-nominative-singular":"biograful","accusative-indefinite-nominative-plural":"biografi","accusative-definite-nominative-plural":"biografii","dative-genitive-indefinite-singular":"biograf","dative-definite-genitive-singular":"biografului","dative-genitive-indefinite-plural":"biografi","dative-definite-genitive-plural":"biografilor","singular-vocative":"biografule","plural-vocative":"biografilor"}},{"word":"biografă","pos":"noun","definitions":["female equivalent of biograf"],"forms":{"plural":"biografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biografă","accusative-definite-nominative-singular":"biografa","accusative-indefinite-nominative-plural":"biografe","accusative-definite-nominative-plural":"biografele","dative-genitive-indefinite-singular":"biografe","dative-definite-genitive-singular":"biografei","dative-genitive-indefinite-plural":"biografe","dative-definite-genitive-plural":"biografelor","singular-vocative":"biografă","plural-vocative":"biografelor"}},{"word":"biografic","pos":"adj","definitions":["biographical"],"forms":{"feminine-singular":"biografică","masculine-plural":"biografici","feminine-neuter-plural":"biografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biografic","error-unrecognized-form-feminine-indefinite-singular":"biografică","error-unrecognized-form-indefinite-masculine-plural":"biografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biografice","definite-error-unrecognized-form-masculine-neuter-singular":"biograficul","definite-error-unrecognized-form-feminine-singular":"biografica","definite-error-unrecognized-form-masculine-plural":"biograficii","definite-error-unrecognized-form-feminine-neuter-plural":"biograficele"}},{"word":"biografica","pos":"adj","definitions":["definite nominative/accusative feminine singular of biografic"],"pronunciation":"/bi.oˈɡra.fi.ka/","gender":"f-s","forms":{"alternative":"биографика"}},{"word":"biografică","pos":"adj","definitions":["nominative/accusative feminine singular of biografic"],"pronunciation":"/bi.oˈɡra.fi.kə/","gender":"f-s","forms":{"alternative":"биографикэ"}},{"word":"biografici","pos":"adj","definitions":["nominative/accusative masculine plural of biografic"],"gender":"m-p"},{"word":"biografie","pos":"noun","definitions":["biography"],"forms":{"plural":"biografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biografie","accusative-definite-nominative-singular":"biografia","accusative-indefinite-nominative-plural":"biografii","accusative-definite-nominative-plural":"biografiile","dative-genitive-indefinite-singular":"biografii","dative-definite-genitive-singular":"biografiei","dative-genitive-indefinite-plural":"biografii","dative-definite-genitive-plural":"biografiilor","singular-vocative":"biografie","plural-vocative":"biografiilor"}},{"word":"bioinformatică","pos":"noun","definitions":["bioinformatics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"bioinformatică","accusative-definite-nominative":"bioinformatica","dative-genitive-indefinite":"bioinformatici","dative-definite-genitive":"bioinformaticii","vocative":"bioinformatică"}},{"word":"bioinginer","pos":"noun","definitions":["bioengineer"],"forms":{"plural":"bioingineri","feminine":"equivalent bioingineră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bioinginer","accusative-definite-nominative-singular":"bioinginerul","accusative-indefinite-nominative-plural":"bioingineri","accusative-definite-nominative-plural":"bioinginerii","dative-genitive-indefinite-singular":"bioinginer","dative-definite-genitive-singular":"bioinginerului","dative-genitive-indefinite-plural":"bioingineri","dative-definite-genitive-plural":"bioinginerilor","singular-vocative":"bioinginerule","plural-vocative":"bioinginerilor"}},{"word":"bioingineră","pos":"noun","definitions":["female equivalent of bioinginer"],"forms":{"plural":"bioinginere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bioingineră","accusative-definite-nominative-singular":"bioinginera","accusative-indefinite-nominative-plural":"bioinginere","accusative-definite-nominative-plural":"bioinginerele","dative-genitive-indefinite-singular":"bioinginere","dative-definite-genitive-singular":"bioinginerei","dative-genitive-indefinite-plural":"bioinginere","dative-definite-genitive-plural":"bioinginerelor","singular-vocative":"bioingineră","plural-vocative":"bioinginerelor"}},{"word":"bioinginerie","pos":"noun","definitions":["bioengineering"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bioinginerie","accusative-definite-nominative":"bioingineria","dative-genitive-indefinite":"bioinginerii","dative-definite-genitive":"bioingineriei","vocative":"bioinginerie"}},{"word":"Biolan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Biolan"}},{"word":"biolog","pos":"noun","definitions":["biologist"],"pronunciation":"/bi.oˈloɡ/","forms":{"plural":"biologi","feminine":"equivalent biologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biolog","accusative-definite-nominative-singular":"biologul","accusative-indefinite-nominative-plural":"biologi","accusative-definite-nominative-plural":"biologii","dative-genitive-indefinite-singular":"biolog","dative-definite-genitive-singular":"biologului","dative-genitive-indefinite-plural":"biologi","dative-definite-genitive-plural":"biologilor","singular-vocative":"biologule","plural-vocative":"biologilor"}},{"word":"biologa","pos":"noun","definitions":["definite nominative/accusative singular of biologă"]},{"word":"biologă","pos":"noun","definitions":["female equivalent of biolog"],"pronunciation":"/bi.oˈlo.ɡə/","forms":{"plural":"biologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"biologă","accusative-definite-nominative-singular":"biologa","accusative-indefinite-nominative-plural":"biologe","accusative-definite-nominative-plural":"biologele","dative-genitive-indefinite-singular":"biologe","dative-definite-genitive-singular":"biologei","dative-genitive-indefinite-plural":"biologe","dative-definite-genitive-plural":"biologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"biologe","pos":"noun","definitions":["plural of biologă"],"gender":"f-p"},{"word":"biologi","pos":"noun","definitions":["plural of biolog"],"gender":"m"},{"word":"biologia","pos":"noun","definitions":["definite nominative/accusative singular of biologie"],"gender":"f","forms":{"alternative":"биолоӂия"}},{"word":"biologic","pos":"adj","definitions":["biologic, biological"],"pronunciation":"/ˌbi.oˈlo.d͡ʒik/","forms":{"feminine-singular":"biologică","masculine-plural":"biologici","feminine-neuter-plural":"biologice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"biologic","error-unrecognized-form-feminine-indefinite-singular":"biologică","error-unrecognized-form-indefinite-masculine-plural":"biologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biologice","definite-error-unrecognized-form-masculine-neuter-singular":"biologicul","definite-error-unrecognized-form-feminine-singular":"biologica","definite-error-unrecognized-form-masculine-plural":"biologicii","definite-error-unrecognized-form-feminine-neuter-plural":"biologicele","alternative":"биолоӂик"}},{"word":"biologică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of biologic"]},{"word":"biologici","pos":"adj","definitions":["nominative/accusative masculine plural of biologic"],"gender":"m-p"},{"word":"biologie","pos":"noun","definitions":["biology"],"pronunciation":"/bi.o.loˈd͡ʒi.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biologie","accusative-definite-nominative":"biologia","dative-genitive-indefinite":"biologii","dative-definite-genitive":"biologiei","vocative":"biologie","alternative":"биолоӂие"}},{"word":"biologie chimică","pos":"noun","definitions":["chemical biology"]},{"word":"biologie marină","pos":"noun","definitions":["marine biology"]},{"word":"biologie moleculară","pos":"noun","definitions":["molecular biology"]},{"word":"biologism","pos":"noun","definitions":["biologism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"biologism","accusative-definite-nominative":"biologismul","dative-genitive-indefinite":"biologism","dative-definite-genitive":"biologismului","vocative":"biologismule"}},{"word":"biologizant","pos":"adj","definitions":["biologizing"],"forms":{"feminine-singular":"biologizantă","masculine-plural":"biologizanți","feminine-neuter-plural":"biologizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biologizant","error-unrecognized-form-feminine-indefinite-singular":"biologizantă","error-unrecognized-form-indefinite-masculine-plural":"biologizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"biologizante","definite-error-unrecognized-form-masculine-neuter-singular":"biologizantul","definite-error-unrecognized-form-feminine-singular":"biologizanta","definite-error-unrecognized-form-masculine-plural":"biologizanții","definite-error-unrecognized-form-feminine-neuter-plural":"biologizantele"}},{"word":"bioluminescent","pos":"adj","definitions":["bioluminescent"],"forms":{"feminine-singular":"bioluminescentă","masculine-plural":"bioluminescenți","feminine-neuter-plural":"bioluminescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioluminescent","error-unrecognized-form-feminine-indefinite-singular":"bioluminescentă","error-unrecognized-form-indefinite-masculine-plural":"bioluminescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioluminescente","definite-error-unrecognized-form-masculine-neuter-singular":"bioluminescentul","definite-error-unrecognized-form-feminine-singular":"bioluminescenta","definite-error-unrecognized-form-masculine-plural":"bioluminescenții","definite-error-unrecognized-form-feminine-neuter-plural":"bioluminescentele"}},{"word":"bioluminescență","pos":"noun","definitions":["bioluminescence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bioluminescență","accusative-definite-nominative":"bioluminescența","dative-genitive-indefinite":"bioluminescențe","dative-definite-genitive":"bioluminescenței","vocative":"bioluminescență"}},{"word":"bioluminiscent","pos":"adj","definitions":["alternative form of bioluminescent"],"forms":{"feminine-singular":"bioluminiscentă","masculine-plural":"bioluminiscenți","feminine-neuter-plural":"bioluminiscente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bioluminiscent","error-unrecognized-form-feminine-indefinite-singular":"bioluminiscentă","error-unrecognized-form-indefinite-masculine-plural":"bioluminiscenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioluminiscente","definite-error-unrecognized-form-masculine-neuter-singular":"bioluminiscentul","definite-error-unrecognized-form-feminine-singular":"bioluminiscenta","definite-error-unrecognized-form-masculine-plural":"bioluminiscenții","definite-error-unrecognized-form-feminine-neuter-plural":"bioluminiscentele"}},{"word":"bioluminiscență","pos":"noun","definitions":["alternative form of bioluminescență"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bioluminiscență","accusative-definite-nominative":"bioluminiscența","dative-genitive-indefinite":"bioluminiscențe","dative-definite-genitive":"bioluminiscenței","vocative":"bioluminiscență"}},{"word":"biom","pos":"noun","definitions":["biome"],"forms":{"plural":"biomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biom","accusative-definite-nominative-singular":"biomul","accusative-indefinite-nominative-plural":"biomuri","accusative-definite-nominative-plural":"biomurii","dative-genitive-indefinite-singular":"biom","dative-definite-genitive-singular":"biomului","dative-genitive-indefinite-plural":"biomuri","dative-definite-genitive-plural":"biomurilor","singular-vocative":"biomule","plural-vocative":"biomurilor"}},{"word":"biomagnetism","pos":"noun","definitions":["biomagnetism"],"forms":{"plural":"biomagnetisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biomagnetism","accusative-definite-nominative-singular":"biomagnetismul","accusative-indefinite-nominative-plural":"biomagnetisme","accusative-definite-nominative-plural":"biomagnetismele","dative-genitive-indefinite-singular":"biomagnetism","dative-definite-genitive-singular":"biomagnetismului","dative-genitive-indefinite-plural":"biomagnetisme","dative-definite-genitive-plural":"biomagnetismelor","singular-vocative":"biomagnetismule","plural-vocative":"biomagnetismelor"}},{"word":"biomasa","pos":"noun","definitions":["definite nominative/accusative singular of biomasă"],"pronunciation":"[bioˈmasa]","gender":"f"},{"word":"biomasă","pos":"noun","definitions":["biomass"],"forms":{"plural":"biomase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biomasă","accusative-definite-nominative-singular":"biomasa","accusative-indefinite-nominative-plural":"biomase","accusative-definite-nominative-plural":"biomasele","dative-genitive-indefinite-singular":"biomase","dative-definite-genitive-singular":"biomasei","dative-genitive-indefinite-plural":"biomase","dative-definite-genitive-plural":"biomaselor","singular-vocative":"biomasă","plural-vocative":"biomaselor"}},{"word":"biomase","pos":"noun","definitions":["plural of biomasă"]},{"word":"biomaso","pos":"noun","definitions":["vocative singular of biomasă"],"pronunciation":"[bioˈmaso]","gender":"f"},{"word":"biomatematic","pos":"adj","definitions":["biomathematical"],"forms":{"feminine-singular":"biomatematică","masculine-plural":"biomatematici","feminine-neuter-plural":"biomatematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biomatematic","error-unrecognized-form-feminine-indefinite-singular":"biomatematică","error-unrecognized-form-indefinite-masculine-plural":"biomatematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biomatematice","definite-error-unrecognized-form-masculine-neuter-singular":"biomatematicul","definite-error-unrecognized-form-feminine-singular":"biomatematica","definite-error-unrecognized-form-masculine-plural":"biomatematicii","definite-error-unrecognized-form-feminine-neuter-plural":"biomatematicele"}},{"word":"biomatematică","pos":"noun","definitions":["biomathematics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biomatematică","accusative-definite-nominative-singular":"biomatematica","accusative-indefinite-nominative-plural":"biomatematice","accusative-definite-nominative-plural":"biomatematicele","dative-genitive-indefinite-singular":"biomatematice","dative-definite-genitive-singular":"biomatematicei","dative-genitive-indefinite-plural":"biomatematice","dative-definite-genitive-plural":"biomatematicelor","singular-vocative":"biomatematică","plural-vocative":"biomatematicelor"}},{"word":"biomatematician","pos":"noun","definitions":["biomathematician"],"forms":{"plural":"biomatematicieni","feminine":"equivalent biomatematiciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biomatematician","accusative-definite-nominative-singular":"biomatematicianul","accusative-indefinite-nominative-plural":"biomatematicieni","accusative-definite-nominative-plural":"biomatematicienii","dative-genitive-indefinite-singular":"biomatematician","dative-definite-genitive-singular":"biomatematicianului","dative-genitive-indefinite-plural":"biomatematicieni","dative-definite-genitive-plural":"biomatematicienilor","singular-vocative":"biomatematicianule","plural-vocative":"biomatematicienilor"}},{"word":"biomatematiciană","pos":"noun","definitions":["female equivalent of biomatematician"],"forms":{"plural":"biomatematiciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biomatematiciană","accusative-definite-nominative-singular":"biomatematiciana","accusative-indefinite-nominative-plural":"biomatematiciene","accusative-definite-nominative-plural":"biomatematicienele","dative-genitive-indefinite-singular":"biomatematiciene","dative-definite-genitive-singular":"biomatematicienei","dative-genitive-indefinite-plural":"biomatematiciene","dative-definite-genitive-plural":"biomatematicienelor","singular-vocative":"biomatematiciană","plural-vocative":"biomatematicienelor"}},{"word":"biomecanic","pos":"adj","definitions":["biomechanical."],"forms":{"feminine-singular":"biomecanică","masculine-plural":"biomecanici","feminine-neuter-plural":"biomecanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biomecanic","error-unrecognized-form-feminine-indefinite-singular":"biomecanică","error-unrecognized-form-indefinite-masculine-plural":"biomecanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biomecanice","definite-error-unrecognized-form-masculine-neuter-singular":"biomecanicul","definite-error-unrecognized-form-feminine-singular":"biomecanica","definite-error-unrecognized-form-masculine-plural":"biomecanicii","definite-error-unrecognized-form-feminine-neuter-plural":"biomecanicele"}},{"word":"biomecanică","pos":"noun","definitions":["biomechanics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biomecanică","accusative-definite-nominative-singular":"biomecanica","accusative-indefinite-nominative-plural":"biomecanice","accusative-definite-nominative-plural":"biomecanicele","dative-genitive-indefinite-singular":"biomecanice","dative-definite-genitive-singular":"biomecanicei","dative-genitive-indefinite-plural":"biomecanice","dative-definite-genitive-plural":"biomecanicelor","singular-vocative":"biomecanică","plural-vocative":"biomecanicelor"}},{"word":"biomedical","pos":"adj","definitions":["biomedical"],"forms":{"feminine-singular":"biomedicală","masculine-plural":"biomedicali","feminine-neuter-plural":"biomedicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biomedical","error-unrecognized-form-feminine-indefinite-singular":"biomedicală","error-unrecognized-form-indefinite-masculine-plural":"biomedicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"biomedicale","definite-error-unrecognized-form-masculine-neuter-singular":"biomedicalul","definite-error-unrecognized-form-feminine-singular":"biomedicala","definite-error-unrecognized-form-masculine-plural":"biomedicalii","definite-error-unrecognized-form-feminine-neuter-plural":"biomedicalele"}},{"word":"biomedicină","pos":"noun","definitions":["biomedicine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"biomedicină","accusative-definite-nominative":"biomedicina","dative-genitive-indefinite":"biomedicine","dative-definite-genitive":"biomedicinei","vocative":"biomedicină"}},{"word":"biometan","pos":"noun","definitions":["biomethane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"biometan","accusative-definite-nominative":"biometanul","dative-genitive-indefinite":"biometan","dative-definite-genitive":"biometanului","vocative":"biometanule"}},{"word":"biometeorolog","pos":"noun","definitions":["biometeorologist"],"forms":{"plural":"biometeorologi","feminine":"equivalent biometeorologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biometeorolog","accusative-definite-nominative-singular":"biometeorologul","accusative-indefinite-nominative-plural":"biometeorologi","accusative-definite-nominative-plural":"biometeorologii","dative-genitive-indefinite-singular":"biometeorolog","dative-definite-genitive-singular":"biometeorologului","dative-genitive-indefinite-plural":"biometeorologi","dative-definite-genitive-plural":"biometeorologilor","singular-vocative":"biometeorologule","plural-vocative":"biometeorologilor"}},{"word":"biometeorologă","pos":"noun","definitions":["female equivalent of biometeorolog"],"forms":{"plural":"biometeorologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biometeorologă","accusative-definite-nominative-singular":"biometeorologa","accusative-indefinite-nominative-plural":"biometeorologe","accusative-definite-nominative-plural":"biometeorologele","dative-genitive-indefinite-singular":"biometeorologe","dative-definite-genitive-singular":"biometeorologei","dative-genitive-indefinite-plural":"biometeorologe","dative-definite-genitive-plural":"biometeorologelor","singular-vocative":"biometeorologă","plural-vocative":"biometeorologelor"}},{"word":"biometeorologic","pos":"adj","definitions":["biometeorological"],"forms":{"feminine-singular":"biometeorologică","masculine-plural":"biometeorologici","feminine-neuter-plural":"biometeorologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biometeorologic","error-unrecognized-form-feminine-indefinite-singular":"biometeorologică","error-unrecognized-form-indefinite-masculine-plural":"biometeorologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biometeorologice","definite-error-unrecognized-form-masculine-neuter-singular":"biometeorologicul","definite-error-unrecognized-form-feminine-singular":"biometeorologica","definite-error-unrecognized-form-masculine-plural":"biometeorologicii","definite-error-unrecognized-form-feminine-neuter-plural":"biometeorologicele"}},{"word":"biometeorologie","pos":"noun","definitions":["biometeorology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biometeorologie","accusative-definite-nominative":"biometeorologia","dative-genitive-indefinite":"biometeorologii","dative-definite-genitive":"biometeorologiei","vocative":"biometeorologie"}},{"word":"biometrie","pos":"noun","definitions":["biometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biometrie","accusative-definite-nominative":"biometria","dative-genitive-indefinite":"biometrii","dative-definite-genitive":"biometriei","vocative":"biometrie"}},{"word":"biomicină","pos":"noun","definitions":["aureomycin"],"forms":{"plural":"biomicine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biomicină","accusative-definite-nominative-singular":"biomicina","accusative-indefinite-nominative-plural":"biomicine","accusative-definite-nominative-plural":"biomicinele","dative-genitive-indefinite-singular":"biomicine","dative-definite-genitive-singular":"biomicinei","dative-genitive-indefinite-plural":"biomicine","dative-definite-genitive-plural":"biomicinelor","singular-vocative":"biomicină","plural-vocative":"biomicinelor"}},{"word":"biomicroscop","pos":"noun","definitions":["biomicroscope"],"forms":{"plural":"biomicroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biomicroscop","accusative-definite-nominative-singular":"biomicroscopul","accusative-indefinite-nominative-plural":"biomicroscoape","accusative-definite-nominative-plural":"biomicroscoapele","dative-genitive-indefinite-singular":"biomicroscop","dative-definite-genitive-singular":"biomicroscopului","dative-genitive-indefinite-plural":"biomicroscoape","dative-definite-genitive-plural":"biomicroscoapelor","singular-vocative":"biomicroscopule","plural-vocative":"biomicroscoapelor"}},{"word":"biomicroscopie","pos":"noun","definitions":["biomicroscopy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biomicroscopie","accusative-definite-nominative":"biomicroscopia","dative-genitive-indefinite":"biomicroscopii","dative-definite-genitive":"biomicroscopiei","vocative":"biomicroscopie"}},{"word":"bionic","pos":"adj","definitions":["bionic"],"forms":{"feminine-singular":"bionică","masculine-plural":"bionici","feminine-neuter-plural":"bionice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bionic","error-unrecognized-form-feminine-indefinite-singular":"bionică","error-unrecognized-form-indefinite-masculine-plural":"bionici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bionice","definite-error-unrecognized-form-masculine-neuter-singular":"bionicul","definite-error-unrecognized-form-feminine-singular":"bionica","definite-error-unrecognized-form-masculine-plural":"bionicii","definite-error-unrecognized-form-feminine-neuter-plural":"bionicele"}},{"word":"bionică","pos":"noun","definitions":["bionics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bionică","accusative-definite-nominative-singular":"bionica","accusative-indefinite-nominative-plural":"bionice","accusative-definite-nominative-plural":"bionicele","dative-genitive-indefinite-singular":"bionice","dative-definite-genitive-singular":"bionicei","dative-genitive-indefinite-plural":"bionice","dative-definite-genitive-plural":"bionicelor","singular-vocative":"bionică","plural-vocative":"bionicelor"}},{"word":"bionistă","pos":"noun","definitions":["female equivalent of bionist"],"forms":{"plural":"bioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bionistă","accusative-definite-nominative-singular":"bionista","accusative-indefinite-nominative-plural":"bioniste","accusative-definite-nominative-plural":"bionistele","dative-genitive-indefinite-singular":"bioniste","dative-definite-genitive-singular":"bionistei","dative-genitive-indefinite-plural":"bioniste","dative-definite-genitive-plural":"bionistelor","singular-vocative":"bionistă","plural-vocative":"bionistelor"}},{"word":"bionomie","pos":"noun","definitions":["bionomics"],"forms":{"plural":"bionomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bionomie","accusative-definite-nominative-singular":"bionomia","accusative-indefinite-nominative-plural":"bionomii","accusative-definite-nominative-plural":"bionomiile","dative-genitive-indefinite-singular":"bionomii","dative-definite-genitive-singular":"bionomiei","dative-genitive-indefinite-plural":"bionomii","dative-definite-genitive-plural":"bionomiilor","singular-vocative":"bionomie","plural-vocative":"bionomiilor"}},{"word":"bioplasmă","pos":"noun","definitions":["bioplasm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bioplasmă","accusative-definite-nominative-singular":"bioplasma","accusative-indefinite-nominative-plural":"bioplasme","accusative-definite-nominative-plural":"bioplasmele","dative-genitive-indefinite-singular":"bioplasme","dative-definite-genitive-singular":"bioplasmei","dative-genitive-indefinite-plural":"bioplasme","dative-definite-genitive-plural":"bioplasmelor","singular-vocative":"bioplasmă","plural-vocative":"bioplasmelor"}},{"word":"biopoieză","pos":"noun","definitions":["biopoiesis"],"forms":{"plural":"biopoieze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biopoieză","accusative-definite-nominative-singular":"biopoieza","accusative-indefinite-nominative-plural":"biopoieze","accusative-definite-nominative-plural":"biopoiezele","dative-genitive-indefinite-singular":"biopoieze","dative-definite-genitive-singular":"biopoiezei","dative-genitive-indefinite-plural":"biopoieze","dative-definite-genitive-plural":"biopoiezelor","singular-vocative":"biopoieză","plural-vocative":"biopoiezelor"}},{"word":"biopolitică","pos":"noun","definitions":["biopolitics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biopolitică","accusative-definite-nominative-singular":"biopolitica","accusative-indefinite-nominative-plural":"biopolitice","accusative-definite-nominative-plural":"biopoliticele","dative-genitive-indefinite-singular":"biopolitice","dative-definite-genitive-singular":"biopoliticei","dative-genitive-indefinite-plural":"biopolitice","dative-definite-genitive-plural":"biopoliticelor","singular-vocative":"biopolitică","plural-vocative":"biopoliticelor"}},{"word":"biopotențial","pos":"noun","definitions":["biopotential"],"forms":{"plural":"biopotențiale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biopotențial","accusative-definite-nominative-singular":"biopotențialul","accusative-indefinite-nominative-plural":"biopotențiale","accusative-definite-nominative-plural":"biopotențialele","dative-genitive-indefinite-singular":"biopotențial","dative-definite-genitive-singular":"biopotențialului","dative-genitive-indefinite-plural":"biopotențiale","dative-definite-genitive-plural":"biopotențialelor","singular-vocative":"biopotențialule","plural-vocative":"biopotențialelor"}},{"word":"biopsic","pos":"adj","definitions":["biopsy"],"forms":{"feminine-singular":"biopsică","masculine-plural":"biopsici","feminine-neuter-plural":"biopsice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biopsic","error-unrecognized-form-feminine-indefinite-singular":"biopsică","error-unrecognized-form-indefinite-masculine-plural":"biopsici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biopsice","definite-error-unrecognized-form-masculine-neuter-singular":"biopsicul","definite-error-unrecognized-form-feminine-singular":"biopsica","definite-error-unrecognized-form-masculine-plural":"biopsicii","definite-error-unrecognized-form-feminine-neuter-plural":"biopsicele"}},{"word":"biopsie","pos":"noun","definitions":["biopsy"],"forms":{"plural":"biopsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biopsie","accusative-definite-nominative-singular":"biopsia","accusative-indefinite-nominative-plural":"biopsii","accusative-definite-nominative-plural":"biopsiile","dative-genitive-indefinite-singular":"biopsii","dative-definite-genitive-singular":"biopsiei","dative-genitive-indefinite-plural":"biopsii","dative-definite-genitive-plural":"biopsiilor","singular-vocative":"biopsie","plural-vocative":"biopsiilor"}},{"word":"bioritm","pos":"noun","definitions":["biorhythm"],"forms":{"plural":"bioritmuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bioritm","accusative-definite-nominative-singular":"bioritmul","accusative-indefinite-nominative-plural":"bioritmuri","accusative-definite-nominative-plural":"bioritmurile","dative-genitive-indefinite-singular":"bioritm","dative-definite-genitive-singular":"bioritmului","dative-genitive-indefinite-plural":"bioritmuri","dative-definite-genitive-plural":"bioritmurilor","singular-vocative":"bioritmule","plural-vocative":"bioritmurilor"}},{"word":"bios","pos":"adj","definitions":["fruitful"],"forms":{"feminine-singular":"bioasă","masculine-plural":"bioși","feminine-neuter-plural":"bioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bios","error-unrecognized-form-feminine-indefinite-singular":"bioasă","error-unrecognized-form-indefinite-masculine-plural":"bioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bioase","definite-error-unrecognized-form-masculine-neuter-singular":"biosul","definite-error-unrecognized-form-feminine-singular":"bioasa","definite-error-unrecognized-form-masculine-plural":"bioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bioasele"}},{"word":"biosatelit","pos":"noun","definitions":["biosatellite"],"forms":{"plural":"biosateliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biosatelit","accusative-definite-nominative-singular":"biosatelitul","accusative-indefinite-nominative-plural":"biosateliți","accusative-definite-nominative-plural":"biosateliții","dative-genitive-indefinite-singular":"biosatelit","dative-definite-genitive-singular":"biosatelitului","dative-genitive-indefinite-plural":"biosateliți","dative-definite-genitive-plural":"biosateliților","singular-vocative":"biosatelitule","plural-vocative":"biosateliților"}},{"word":"biosferă","pos":"noun","definitions":["biosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biosferă","accusative-definite-nominative-singular":"biosfera","accusative-indefinite-nominative-plural":"biosfere","accusative-definite-nominative-plural":"biosferele","dative-genitive-indefinite-singular":"biosfere","dative-definite-genitive-singular":"biosferei","dative-genitive-indefinite-plural":"biosfere","dative-definite-genitive-plural":"biosferelor","singular-vocative":"biosferă","plural-vocative":"biosferelor"}},{"word":"biosime","pos":"noun","definitions":["fertility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"biosime","accusative-definite-nominative":"biosimea","dative-genitive-indefinite":"biosimi","dative-definite-genitive":"biosimii","vocative":"-"}},{"word":"biosinteză","pos":"noun","definitions":["biosynthesis"],"forms":{"plural":"biosinteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biosinteză","accusative-definite-nominative-singular":"biosinteza","accusative-indefinite-nominative-plural":"biosinteze","accusative-definite-nominative-plural":"biosintezele","dative-genitive-indefinite-singular":"biosinteze","dative-definite-genitive-singular":"biosintezei","dative-genitive-indefinite-plural":"biosinteze","dative-definite-genitive-plural":"biosintezelor","singular-vocative":"biosinteză","plural-vocative":"biosintezelor"}},{"word":"biosintezo","pos":"noun","definitions":["vocative singular of biosinteză"],"gender":"f"},{"word":"biosistem","pos":"noun","definitions":["biosystem"],"forms":{"plural":"biosisteme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biosistem","accusative-definite-nominative-singular":"biosistemul","accusative-indefinite-nominative-plural":"biosisteme","accusative-definite-nominative-plural":"biosistemele","dative-genitive-indefinite-singular":"biosistem","dative-definite-genitive-singular":"biosistemului","dative-genitive-indefinite-plural":"biosisteme","dative-definite-genitive-plural":"biosistemelor","singular-vocative":"biosistemule","plural-vocative":"biosistemelor"}},{"word":"biosociologic","pos":"adj","definitions":["biosociological"],"forms":{"feminine-singular":"biosociologică","masculine-plural":"biosociologici","feminine-neuter-plural":"biosociologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biosociologic","error-unrecognized-form-feminine-indefinite-singular":"biosociologică","error-unrecognized-form-indefinite-masculine-plural":"biosociologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biosociologice","definite-error-unrecognized-form-masculine-neuter-singular":"biosociologicul","definite-error-unrecognized-form-feminine-singular":"biosociologica","definite-error-unrecognized-form-masculine-plural":"biosociologicii","definite-error-unrecognized-form-feminine-neuter-plural":"biosociologicele"}},{"word":"biosociologie","pos":"noun","definitions":["biosociology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biosociologie","accusative-definite-nominative":"biosociologia","dative-genitive-indefinite":"biosociologii","dative-definite-genitive":"biosociologiei","vocative":"biosociologie"}},{"word":"biospeolog","pos":"noun","definitions":["biospeleologist"],"forms":{"plural":"biospeologi","feminine":"equivalent biospeologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biospeolog","accusative-definite-nominative-singular":"biospeologul","accusative-indefinite-nominative-plural":"biospeologi","accusative-definite-nominative-plural":"biospeologii","dative-genitive-indefinite-singular":"biospeolog","dative-definite-genitive-singular":"biospeologului","dative-genitive-indefinite-plural":"biospeologi","dative-definite-genitive-plural":"biospeologilor","singular-vocative":"biospeologule","plural-vocative":"biospeologilor"}},{"word":"biospeologă","pos":"noun","definitions":["female equivalent of biospeolog"],"forms":{"plural":"biospeologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biospeologă","accusative-definite-nominative-singular":"biospeologa","accusative-indefinite-nominative-plural":"biospeologe","accusative-definite-nominative-plural":"biospeologele","dative-genitive-indefinite-singular":"biospeologe","dative-definite-genitive-singular":"biospeologei","dative-genitive-indefinite-plural":"biospeologe","dative-definite-genitive-plural":"biospeologelor","singular-vocative":"biospeologă","plural-vocative":"biospeologelor"}},{"word":"biospeologic","pos":"adj","definitions":["biospeleological"],"forms":{"feminine-singular":"biospeologică","masculine-plural":"biospeologici","feminine-neuter-plural":"biospeologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biospeologic","error-unrecognized-form-feminine-indefinite-singular":"biospeologică","error-unrecognized-form-indefinite-masculine-plural":"biospeologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biospeologice","definite-error-unrecognized-form-masculine-neuter-singular":"biospeologicul","definite-error-unrecognized-form-feminine-singular":"biospeologica","definite-error-unrecognized-form-masculine-plural":"biospeologicii","definite-error-unrecognized-form-feminine-neuter-plural":"biospeologicele"}},{"word":"biospeologie","pos":"noun","definitions":["biospeleology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biospeologie","accusative-definite-nominative":"biospeologia","dative-genitive-indefinite":"biospeologii","dative-definite-genitive":"biospeologiei","vocative":"biospeologie"}},{"word":"biostatistic","pos":"adj","definitions":["biostatistical"],"forms":{"feminine-singular":"biostatistică","masculine-plural":"biostatistici","feminine-neuter-plural":"biostatistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biostatistic","error-unrecognized-form-feminine-indefinite-singular":"biostatistică","error-unrecognized-form-indefinite-masculine-plural":"biostatistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biostatistice","definite-error-unrecognized-form-masculine-neuter-singular":"biostatisticul","definite-error-unrecognized-form-feminine-singular":"biostatistica","definite-error-unrecognized-form-masculine-plural":"biostatisticii","definite-error-unrecognized-form-feminine-neuter-plural":"biostatisticele"}},{"word":"biostatistică","pos":"noun","definitions":["biostatistics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"biostatistică","accusative-definite-nominative":"biostatistica","dative-genitive-indefinite":"biostatistici","dative-definite-genitive":"biostatisticii","vocative":"biostatistică"}},{"word":"biostazie","pos":"noun","definitions":["biostasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biostazie","accusative-definite-nominative":"biostazia","dative-genitive-indefinite":"biostazii","dative-definite-genitive":"biostaziei","vocative":"biostazie"}},{"word":"bioștiință","pos":"noun","definitions":["bioscience"],"forms":{"plural":"bioștiințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bioștiință","accusative-definite-nominative-singular":"bioștiința","accusative-indefinite-nominative-plural":"bioștiințe","accusative-definite-nominative-plural":"bioștiințele","dative-genitive-indefinite-singular":"bioștiințe","dative-definite-genitive-singular":"bioștiinței","dative-genitive-indefinite-plural":"bioștiințe","dative-definite-genitive-plural":"bioștiințelor","singular-vocative":"bioștiințo","plural-vocative":"bioștiințo"}},{"word":"biostimula","pos":"verb","definitions":["to biostimulate"],"forms":{"canonical":"a biostimula 1st conjugation","present-singular-third-person":"biostimulează","participle-past":"biostimulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a biostimula","gerund":"biostimulând","first-person-indicative-present-singular":"biostimulez","indicative-present-second-person-singular":"biostimulezi","indicative-present-singular-third-person":"biostimulează","first-person-indicative-plural-present":"biostimulăm","indicative-plural-present-second-person":"biostimulați","indicative-plural-present-third-person":"biostimulează","first-person-imperfect-indicative-singular":"biostimulam","imperfect-indicative-second-person-singular":"biostimulai","imperfect-indicative-singular-third-person":"biostimula","first-person-imperfect-indicative-plural":"biostimulam","imperfect-indicative-plural-second-person":"biostimulați","imperfect-indicative-plural-third-person":"biostimulau","first-person-indicative-perfect-singular":"biostimulai","indicative-perfect-second-person-singular":"biostimulași","indicative-perfect-singular-third-person":"biostimulă","first-person-indicative-perfect-plural":"biostimularăm","indicative-perfect-plural-second-person":"biostimularăți","indicative-perfect-plural-third-person":"biostimulară","first-person-indicative-pluperfect-singular":"biostimulasem","indicative-pluperfect-second-person-singular":"biostimulaseși","indicative-pluperfect-singular-third-person":"biostimulase","first-person-indicative-pluperfect-plural":"biostimulaserăm","indicative-pluperfect-plural-second-person":"biostimulaserăți","indicative-pluperfect-plural-third-person":"biostimulaseră","first-person-present-singular-subjunctive":"să biostimulez","present-second-person-singular-subjunctive":"să biostimulezi","present-singular-subjunctive-third-person":"să biostimuleze","first-person-plural-present-subjunctive":"să biostimulăm","plural-present-second-person-subjunctive":"să biostimulați","plural-present-subjunctive-third-person":"să biostimuleze","imperative-second-person-singular":"biostimulează","imperative-plural-second-person":"biostimulați","imperative-negative-second-person-singular":"nu biostimula","imperative-negative-plural-second-person":"nu biostimulați"}},{"word":"biostimulare","pos":"noun","definitions":["biostimulation"],"forms":{"plural":"biostimulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biostimulare","accusative-definite-nominative-singular":"biostimularea","accusative-indefinite-nominative-plural":"biostimulări","accusative-definite-nominative-plural":"biostimulările","dative-genitive-indefinite-singular":"biostimulări","dative-definite-genitive-singular":"biostimulării","dative-genitive-indefinite-plural":"biostimulări","dative-definite-genitive-plural":"biostimulărilor","singular-vocative":"biostimulare","plural-vocative":"biostimulărilor"}},{"word":"biostimulator","pos":"noun","definitions":["biostimulator"],"forms":{"plural":"biostimulatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biostimulator","accusative-definite-nominative-singular":"biostimulatorul","accusative-indefinite-nominative-plural":"biostimulatori","accusative-definite-nominative-plural":"biostimulatorii","dative-genitive-indefinite-singular":"biostimulator","dative-definite-genitive-singular":"biostimulatorului","dative-genitive-indefinite-plural":"biostimulatori","dative-definite-genitive-plural":"biostimulatorilor","singular-vocative":"biostimulatorule","plural-vocative":"biostimulatorilor"}},{"word":"biostimulatoriu","pos":"adj","definitions":["alternative form of biostimulator"],"forms":{"feminine-singular":"biostimulatorie","plural":"biostimulatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biostimulatoriu","error-unrecognized-form-feminine-indefinite-singular":"biostimulatorie","error-unrecognized-form-indefinite-masculine-plural":"biostimulatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"biostimulatorii","definite-error-unrecognized-form-masculine-neuter-singular":"biostimulatoriul","definite-error-unrecognized-form-feminine-singular":"biostimulatoria","definite-error-unrecognized-form-masculine-plural":"biostimulatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"biostimulatoriile"}},{"word":"biostimulent","pos":"noun","definitions":["biostimulant"],"forms":{"plural":"biostimulenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biostimulent","accusative-definite-nominative-singular":"biostimulentul","accusative-indefinite-nominative-plural":"biostimulenți","accusative-definite-nominative-plural":"biostimulenții","dative-genitive-indefinite-singular":"biostimulent","dative-definite-genitive-singular":"biostimulentului","dative-genitive-indefinite-plural":"biostimulenți","dative-definite-genitive-plural":"biostimulenților","singular-vocative":"biostimulentule","plural-vocative":"biostimulenților"}},{"word":"biostratigrafie","pos":"noun","definitions":["biostratigraphy"],"forms":{"plural":"biostratigrafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biostratigrafie","accusative-definite-nominative-singular":"biostratigrafia","accusative-indefinite-nominative-plural":"biostratigrafii","accusative-definite-nominative-plural":"biostratigrafiile","dative-genitive-indefinite-singular":"biostratigrafii","dative-definite-genitive-singular":"biostratigrafiei","dative-genitive-indefinite-plural":"biostratigrafii","dative-definite-genitive-plural":"biostratigrafiilor","singular-vocative":"biostratigrafie","plural-vocative":"biostratigrafiilor"}},{"word":"biot","pos":"noun","definitions":["biot (“abampere”)"],"forms":{"plural":"bioți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biot","accusative-definite-nominative-singular":"biotul","accusative-indefinite-nominative-plural":"bioți","accusative-definite-nominative-plural":"bioții","dative-genitive-indefinite-singular":"biot","dative-definite-genitive-singular":"biotului","dative-genitive-indefinite-plural":"bioți","dative-definite-genitive-plural":"bioților","singular-vocative":"biotule","plural-vocative":"bioților"}},{"word":"biotaxie","pos":"noun","definitions":["biotaxis"],"forms":{"plural":"biotaxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biotaxie","accusative-definite-nominative-singular":"biotaxia","accusative-indefinite-nominative-plural":"biotaxii","accusative-definite-nominative-plural":"biotaxiile","dative-genitive-indefinite-singular":"biotaxii","dative-definite-genitive-singular":"biotaxiei","dative-genitive-indefinite-plural":"biotaxii","dative-definite-genitive-plural":"biotaxiilor","singular-vocative":"biotaxie","plural-vocative":"biotaxiilor"}},{"word":"biotehnic","pos":"adj","definitions":["biotechnical"],"forms":{"feminine-singular":"biotehnică","masculine-plural":"biotehnici","feminine-neuter-plural":"biotehnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biotehnic","error-unrecognized-form-feminine-indefinite-singular":"biotehnică","error-unrecognized-form-indefinite-masculine-plural":"biotehnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biotehnice","definite-error-unrecognized-form-masculine-neuter-singular":"biotehnicul","definite-error-unrecognized-form-feminine-singular":"biotehnica","definite-error-unrecognized-form-masculine-plural":"biotehnicii","definite-error-unrecognized-form-feminine-neuter-plural":"biotehnicele"}},{"word":"biotehnică","pos":"noun","definitions":["biotechnics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biotehnică","accusative-definite-nominative-singular":"biotehnica","accusative-indefinite-nominative-plural":"biotehnice","accusative-definite-nominative-plural":"biotehnicele","dative-genitive-indefinite-singular":"biotehnice","dative-definite-genitive-singular":"biotehnicei","dative-genitive-indefinite-plural":"biotehnice","dative-definite-genitive-plural":"biotehnicelor","singular-vocative":"biotehnică","plural-vocative":"biotehnicelor"}},{"word":"biotehnician","pos":"noun","definitions":["biotechnician"],"forms":{"plural":"biotehnicieni","feminine":"equivalent biotehniciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biotehnician","accusative-definite-nominative-singular":"biotehnicianul","accusative-indefinite-nominative-plural":"biotehnicieni","accusative-definite-nominative-plural":"biotehnicienii","dative-genitive-indefinite-singular":"biotehnician","dative-definite-genitive-singular":"biotehnicianului","dative-genitive-indefinite-plural":"biotehnicieni","dative-definite-genitive-plural":"biotehnicienilor","singular-vocative":"biotehnicianule","plural-vocative":"biotehnicienilor"}},{"word":"biotehniciană","pos":"noun","definitions":["female equivalent of biotehnician"],"forms":{"plural":"biotehniciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"biotehniciană","accusative-definite-nominative-singular":"biotehniciana","accusative-indefinite-nominative-plural":"biotehniciene","accusative-definite-nominative-plural":"biotehnicienele","dative-genitive-indefinite-singular":"biotehniciene","dative-definite-genitive-singular":"biotehnicienei","dative-genitive-indefinite-plural":"biotehniciene","dative-definite-genitive-plural":"biotehnicienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"biotehniciene","pos":"noun","definitions":["plural of biotehniciană"],"gender":"f"},{"word":"biotehnicieni","pos":"noun","definitions":["plural of biotehnician"],"gender":"m"},{"word":"biotehnologie","pos":"noun","definitions":["biotechnology"],"forms":{"plural":"biotehnologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biotehnologie","accusative-definite-nominative-singular":"biotehnologia","accusative-indefinite-nominative-plural":"biotehnologii","accusative-definite-nominative-plural":"biotehnologiile","dative-genitive-indefinite-singular":"biotehnologii","dative-definite-genitive-singular":"biotehnologiei","dative-genitive-indefinite-plural":"biotehnologii","dative-definite-genitive-plural":"biotehnologiilor","singular-vocative":"biotehnologie","plural-vocative":"biotehnologiilor"}},{"word":"biotelemetric","pos":"adj","definitions":["biotelemetric"],"forms":{"feminine-singular":"biotelemetrică","masculine-plural":"biotelemetrici","feminine-neuter-plural":"biotelemetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biotelemetric","error-unrecognized-form-feminine-indefinite-singular":"biotelemetrică","error-unrecognized-form-indefinite-masculine-plural":"biotelemetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biotelemetrice","definite-error-unrecognized-form-masculine-neuter-singular":"biotelemetricul","definite-error-unrecognized-form-feminine-singular":"biotelemetrica","definite-error-unrecognized-form-masculine-plural":"biotelemetricii","definite-error-unrecognized-form-feminine-neuter-plural":"biotelemetricele"}},{"word":"biotelemetrie","pos":"noun","definitions":["biotelemetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biotelemetrie","accusative-definite-nominative":"biotelemetria","dative-genitive-indefinite":"biotelemetrii","dative-definite-genitive":"biotelemetriei","vocative":"biotelemetrie"}},{"word":"bioterapie","pos":"noun","definitions":["biotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bioterapie","accusative-definite-nominative":"bioterapia","dative-genitive-indefinite":"bioterapii","dative-definite-genitive":"bioterapiei","vocative":"bioterapie"}},{"word":"biotic","pos":"adj","definitions":["biotic"],"pronunciation":"/biˈo.tik/","forms":{"feminine-singular":"biotică","masculine-plural":"biotici","feminine-neuter-plural":"biotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biotic","error-unrecognized-form-feminine-indefinite-singular":"biotică","error-unrecognized-form-indefinite-masculine-plural":"biotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biotice","definite-error-unrecognized-form-masculine-neuter-singular":"bioticul","definite-error-unrecognized-form-feminine-singular":"biotica","definite-error-unrecognized-form-masculine-plural":"bioticii","definite-error-unrecognized-form-feminine-neuter-plural":"bioticele"}},{"word":"biotină","pos":"noun","definitions":["biotin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biotină","accusative-definite-nominative-singular":"biotina","accusative-indefinite-nominative-plural":"biotine","accusative-definite-nominative-plural":"biotinele","dative-genitive-indefinite-singular":"biotine","dative-definite-genitive-singular":"biotinei","dative-genitive-indefinite-plural":"biotine","dative-definite-genitive-plural":"biotinelor","singular-vocative":"biotină","plural-vocative":"biotinelor"}},{"word":"biotip","pos":"noun","definitions":["biotype"],"forms":{"plural":"biotipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"biotip","accusative-definite-nominative-singular":"biotipul","accusative-indefinite-nominative-plural":"biotipuri","accusative-definite-nominative-plural":"biotipurile","dative-genitive-indefinite-singular":"biotip","dative-definite-genitive-singular":"biotipului","dative-genitive-indefinite-plural":"biotipuri","dative-definite-genitive-plural":"biotipurilor","singular-vocative":"biotipule","plural-vocative":"biotipurilor"}},{"word":"biotipologie","pos":"noun","definitions":["biotypology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"biotipologie","accusative-definite-nominative":"biotipologia","dative-genitive-indefinite":"biotipologii","dative-definite-genitive":"biotipologiei","vocative":"biotipologie"}},{"word":"biotit","pos":"noun","definitions":["biotite"],"forms":{"plural":"biotite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biotit","accusative-definite-nominative-singular":"biotitul","accusative-indefinite-nominative-plural":"biotite","accusative-definite-nominative-plural":"biotitele","dative-genitive-indefinite-singular":"biotit","dative-definite-genitive-singular":"biotitului","dative-genitive-indefinite-plural":"biotite","dative-definite-genitive-plural":"biotitelor","singular-vocative":"biotitule","plural-vocative":"biotitelor"}},{"word":"biotop","pos":"noun","definitions":["biotope"],"forms":{"plural":"biotopuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"biotop","accusative-definite-nominative-singular":"biotopul","accusative-indefinite-nominative-plural":"biotopuri","accusative-definite-nominative-plural":"biotopurile","dative-genitive-indefinite-singular":"biotop","dative-definite-genitive-singular":"biotopului","dative-genitive-indefinite-plural":"biotopuri","dative-definite-genitive-plural":"biotopurilor","singular-vocative":"biotopule","plural-vocative":"biotopurilor"}},{"word":"biovular","pos":"adj","definitions":["biovular"],"forms":{"feminine-singular":"biovulară","masculine-plural":"biovulari","feminine-neuter-plural":"biovulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biovular","error-unrecognized-form-feminine-indefinite-singular":"biovulară","error-unrecognized-form-indefinite-masculine-plural":"biovulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"biovulare","definite-error-unrecognized-form-masculine-neuter-singular":"biovularul","definite-error-unrecognized-form-feminine-singular":"biovulara","definite-error-unrecognized-form-masculine-plural":"biovularii","definite-error-unrecognized-form-feminine-neuter-plural":"biovularele"}},{"word":"biovulat","pos":"adj","definitions":["biovulate"],"forms":{"feminine-singular":"biovulată","masculine-plural":"biovulați","feminine-neuter-plural":"biovulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biovulat","error-unrecognized-form-feminine-indefinite-singular":"biovulată","error-unrecognized-form-indefinite-masculine-plural":"biovulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"biovulate","definite-error-unrecognized-form-masculine-neuter-singular":"biovulatul","definite-error-unrecognized-form-feminine-singular":"biovulata","definite-error-unrecognized-form-masculine-plural":"biovulații","definite-error-unrecognized-form-feminine-neuter-plural":"biovulatele"}},{"word":"bioxid","pos":"noun","definitions":["dated form of dioxid"],"pronunciation":"/bi.okˈsid/","forms":{"plural":"bioxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bioxid","accusative-definite-nominative-singular":"bioxidul","accusative-indefinite-nominative-plural":"bioxizi","accusative-definite-nominative-plural":"bioxizii","dative-genitive-indefinite-singular":"bioxid","dative-definite-genitive-singular":"bioxidului","dative-genitive-indefinite-plural":"bioxizi","dative-definite-genitive-plural":"bioxizilor","singular-vocative":"bioxidule","plural-vocative":"bioxizilor"}},{"word":"bioxid de carbon","pos":"noun","definitions":["carbon dioxide"]},{"word":"bip","pos":"noun","definitions":["beep","prearranged missed call","bleep censor"],"pronunciation":"/ˈbip/","forms":{"plural":"bipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bip","accusative-definite-nominative-singular":"bipul","accusative-indefinite-nominative-plural":"bipuri","accusative-definite-nominative-plural":"bipurile","dative-genitive-indefinite-singular":"bip","dative-definite-genitive-singular":"bipului","dative-genitive-indefinite-plural":"bipuri","dative-definite-genitive-plural":"bipurilor","singular-vocative":"bipule","plural-vocative":"bipurilor"}},{"word":"bipac","pos":"noun","definitions":["bipack"],"forms":{"plural":"bipacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bipac","accusative-definite-nominative-singular":"bipacul","accusative-indefinite-nominative-plural":"bipacuri","accusative-definite-nominative-plural":"bipacurile","dative-genitive-indefinite-singular":"bipac","dative-definite-genitive-singular":"bipacului","dative-genitive-indefinite-plural":"bipacuri","dative-definite-genitive-plural":"bipacurilor","singular-vocative":"bipacule","plural-vocative":"bipacurilor"}},{"word":"bipăi","pos":"verb","definitions":["to beep"],"forms":{"canonical":"a bipăi 4th conjugation","present-singular-third-person":"bipăie","participle-past":"bipăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bipăi","gerund":"bipăind","first-person-indicative-present-singular":"bipăi","indicative-present-second-person-singular":"bipăi","indicative-present-singular-third-person":"bipăie","first-person-indicative-plural-present":"bipăim","indicative-plural-present-second-person":"bipăiți","indicative-plural-present-third-person":"bipăie","first-person-imperfect-indicative-singular":"bipăiam","imperfect-indicative-second-person-singular":"bipăiai","imperfect-indicative-singular-third-person":"bipăia","first-person-imperfect-indicative-plural":"bipăiam","imperfect-indicative-plural-second-person":"bipăiați","imperfect-indicative-plural-third-person":"bipăiau","first-person-indicative-perfect-singular":"bipăii","indicative-perfect-second-person-singular":"bipăiși","indicative-perfect-singular-third-person":"bipăi","first-person-indicative-perfect-plural":"bipăirăm","indicative-perfect-plural-second-person":"bipăirăți","indicative-perfect-plural-third-person":"bipăiră","first-person-indicative-pluperfect-singular":"bipăisem","indicative-pluperfect-second-person-singular":"bipăiseși","indicative-pluperfect-singular-third-person":"bipăise","first-person-indicative-pluperfect-plural":"bipăiserăm","indicative-pluperfect-plural-second-person":"bipăiserăți","indicative-pluperfect-plural-third-person":"bipăiseră","first-person-present-singular-subjunctive":"să bipăi","present-second-person-singular-subjunctive":"să bipăi","present-singular-subjunctive-third-person":"să bipăie","first-person-plural-present-subjunctive":"să bipăim","plural-present-second-person-subjunctive":"să bipăiți","plural-present-subjunctive-third-person":"să bipăie","imperative-second-person-singular":"bipăie","imperative-plural-second-person":"bipăiți","imperative-negative-second-person-singular":"nu bipăi","imperative-negative-plural-second-person":"nu bipăiți"}},{"word":"bipal","pos":"adj","definitions":["two-bladed (of a propeller etc)"],"forms":{"feminine-singular":"bipală","masculine-plural":"bipali","feminine-neuter-plural":"bipale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipal","error-unrecognized-form-feminine-indefinite-singular":"bipală","error-unrecognized-form-indefinite-masculine-plural":"bipali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipale","definite-error-unrecognized-form-masculine-neuter-singular":"bipalul","definite-error-unrecognized-form-feminine-singular":"bipala","definite-error-unrecognized-form-masculine-plural":"bipalii","definite-error-unrecognized-form-feminine-neuter-plural":"bipalele"}},{"word":"bipartid","pos":"adj","definitions":["bipartite"],"forms":{"feminine-singular":"bipartidă","masculine-plural":"bipartizi","feminine-neuter-plural":"bipartide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipartid","error-unrecognized-form-feminine-indefinite-singular":"bipartidă","error-unrecognized-form-indefinite-masculine-plural":"bipartizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipartide","definite-error-unrecognized-form-masculine-neuter-singular":"bipartidul","definite-error-unrecognized-form-feminine-singular":"bipartida","definite-error-unrecognized-form-masculine-plural":"bipartizii","definite-error-unrecognized-form-feminine-neuter-plural":"bipartidele"}},{"word":"bipartit","pos":"adj","definitions":["bipartite"],"forms":{"feminine-singular":"bipartită","masculine-plural":"bipartiți","feminine-neuter-plural":"bipartite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipartit","error-unrecognized-form-feminine-indefinite-singular":"bipartită","error-unrecognized-form-indefinite-masculine-plural":"bipartiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipartite","definite-error-unrecognized-form-masculine-neuter-singular":"bipartitul","definite-error-unrecognized-form-feminine-singular":"bipartita","definite-error-unrecognized-form-masculine-plural":"bipartiții","definite-error-unrecognized-form-feminine-neuter-plural":"bipartitele"}},{"word":"bipartiție","pos":"noun","definitions":["bipartition"],"forms":{"plural":"bipartiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bipartiție","accusative-definite-nominative-singular":"bipartiția","accusative-indefinite-nominative-plural":"bipartiții","accusative-definite-nominative-plural":"bipartițiile","dative-genitive-indefinite-singular":"bipartiții","dative-definite-genitive-singular":"bipartiției","dative-genitive-indefinite-plural":"bipartiții","dative-definite-genitive-plural":"bipartițiilor","singular-vocative":"bipartiție","plural-vocative":"bipartițiilor"}},{"word":"bipătrat","pos":"adj","definitions":["biquadratic"],"forms":{"feminine-singular":"bipătrată","masculine-plural":"bipătrați","feminine-neuter-plural":"bipătrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipătrat","error-unrecognized-form-feminine-indefinite-singular":"bipătrată","error-unrecognized-form-indefinite-masculine-plural":"bipătrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipătrate","definite-error-unrecognized-form-masculine-neuter-singular":"bipătratul","definite-error-unrecognized-form-feminine-singular":"bipătrata","definite-error-unrecognized-form-masculine-plural":"bipătrații","definite-error-unrecognized-form-feminine-neuter-plural":"bipătratele"}},{"word":"biped","pos":"adj","definitions":["biped"],"forms":{"feminine-singular":"bipedă","masculine-plural":"bipezi","feminine-neuter-plural":"bipede","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biped","error-unrecognized-form-feminine-indefinite-singular":"bipedă","error-unrecognized-form-indefinite-masculine-plural":"bipezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipede","definite-error-unrecognized-form-masculine-neuter-singular":"bipedul","definite-error-unrecognized-form-feminine-singular":"bipeda","definite-error-unrecognized-form-masculine-plural":"bipezii","definite-error-unrecognized-form-feminine-neuter-plural":"bipedele"}},{"word":"bipenat","pos":"adj","definitions":["bipinnate"],"forms":{"feminine-singular":"bipenată","masculine-plural":"bipenați","feminine-neuter-plural":"bipenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipenat","error-unrecognized-form-feminine-indefinite-singular":"bipenată","error-unrecognized-form-indefinite-masculine-plural":"bipenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipenate","definite-error-unrecognized-form-masculine-neuter-singular":"bipenatul","definite-error-unrecognized-form-feminine-singular":"bipenata","definite-error-unrecognized-form-masculine-plural":"bipenații","definite-error-unrecognized-form-feminine-neuter-plural":"bipenatele"}},{"word":"biplan","pos":"noun","definitions":["biplane"],"forms":{"plural":"biplane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biplan","accusative-definite-nominative-singular":"biplanul","accusative-indefinite-nominative-plural":"biplane","accusative-definite-nominative-plural":"biplanele","dative-genitive-indefinite-singular":"biplan","dative-definite-genitive-singular":"biplanului","dative-genitive-indefinite-plural":"biplane","dative-definite-genitive-plural":"biplanelor","singular-vocative":"biplanule","plural-vocative":"biplanelor"}},{"word":"bipolar","pos":"adj","definitions":["bipolar"],"forms":{"feminine-singular":"bipolară","masculine-plural":"bipolari","feminine-neuter-plural":"bipolare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bipolar","error-unrecognized-form-feminine-indefinite-singular":"bipolară","error-unrecognized-form-indefinite-masculine-plural":"bipolari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bipolare","definite-error-unrecognized-form-masculine-neuter-singular":"bipolarul","definite-error-unrecognized-form-feminine-singular":"bipolara","definite-error-unrecognized-form-masculine-plural":"bipolarii","definite-error-unrecognized-form-feminine-neuter-plural":"bipolarele"}},{"word":"bipolaritate","pos":"noun","definitions":["bipolarity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bipolaritate","accusative-definite-nominative-singular":"bipolaritatea","accusative-indefinite-nominative-plural":"bipolarități","accusative-definite-nominative-plural":"bipolaritățile","dative-genitive-indefinite-singular":"bipolarități","dative-definite-genitive-singular":"bipolarității","dative-genitive-indefinite-plural":"bipolarități","dative-definite-genitive-plural":"bipolarităților","singular-vocative":"bipolaritate","plural-vocative":"bipolarităților"}},{"word":"bir","pos":"noun","definitions":["tribute","tax"],"forms":{"plural":"biruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bir","accusative-definite-nominative-singular":"birul","accusative-indefinite-nominative-plural":"bire","accusative-definite-nominative-plural":"birele","dative-genitive-indefinite-singular":"bir","dative-definite-genitive-singular":"birului","dative-genitive-indefinite-plural":"bire","dative-definite-genitive-plural":"birelor","singular-vocative":"birule","plural-vocative":"birelor"}},{"word":"birăiaș","pos":"noun","definitions":["diminutive of birău"],"forms":{"plural":"birăiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birăiaș","accusative-definite-nominative-singular":"birăiașul","accusative-indefinite-nominative-plural":"birăiași","accusative-definite-nominative-plural":"birăiașii","dative-genitive-indefinite-singular":"birăiaș","dative-definite-genitive-singular":"birăiașului","dative-genitive-indefinite-plural":"birăiași","dative-definite-genitive-plural":"birăiașilor","singular-vocative":"birăiașule","plural-vocative":"birăiașilor"}},{"word":"birar","pos":"noun","definitions":["taxman"],"forms":{"plural":"birari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birar","accusative-definite-nominative-singular":"birarul","accusative-indefinite-nominative-plural":"birari","accusative-definite-nominative-plural":"birarii","dative-genitive-indefinite-singular":"birar","dative-definite-genitive-singular":"birarului","dative-genitive-indefinite-plural":"birari","dative-definite-genitive-plural":"birarilor","singular-vocative":"birarule","plural-vocative":"birarilor"}},{"word":"birărie","pos":"noun","definitions":["tax collection"],"forms":{"plural":"birării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"birărie","accusative-definite-nominative-singular":"birăria","accusative-indefinite-nominative-plural":"birării","accusative-definite-nominative-plural":"birăriile","dative-genitive-indefinite-singular":"birării","dative-definite-genitive-singular":"birăriei","dative-genitive-indefinite-plural":"birării","dative-definite-genitive-plural":"birăriilor","singular-vocative":"birărie","plural-vocative":"birăriilor"}},{"word":"Birău","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Birău"}},{"word":"birău","pos":"noun","definitions":["mayor of a village"],"forms":{"plural":"birăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birău","accusative-definite-nominative-singular":"birăuul","accusative-indefinite-nominative-plural":"birăi","accusative-definite-nominative-plural":"birăii","dative-genitive-indefinite-singular":"birău","dative-definite-genitive-singular":"birăuului","dative-genitive-indefinite-plural":"birăi","dative-definite-genitive-plural":"birăilor","singular-vocative":"birăuule","plural-vocative":"birăilor"}},{"word":"Birăuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Birăuț"}},{"word":"Birceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Birceanu"}},{"word":"Birchiș","pos":"name","definitions":["a commune of Arad County, Romania","a village in Birchiș, Arad County, Romania"],"gender":"m"},{"word":"Bircii","pos":"name","definitions":["a village in Bengești-Ciocadia, Gorj County, Romania","a village in Scornicești, Olt County, Romania"],"gender":"m"},{"word":"Birda","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Birda, Timiș County, Romania"],"gender":"f"},{"word":"Birdanca","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bârzava"],"gender":"f"},{"word":"bireactor","pos":"noun","definitions":["twinjet"],"forms":{"plural":"bireactoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bireactor","accusative-definite-nominative-singular":"bireactorul","accusative-indefinite-nominative-plural":"bireactoare","accusative-definite-nominative-plural":"bireactoarele","dative-genitive-indefinite-singular":"bireactor","dative-definite-genitive-singular":"bireactorului","dative-genitive-indefinite-plural":"bireactoare","dative-definite-genitive-plural":"bireactoarelor","singular-vocative":"bireactorule","plural-vocative":"bireactoarelor"}},{"word":"birefringent","pos":"adj","definitions":["birefringent"],"forms":{"feminine-singular":"birefringentă","masculine-plural":"birefringenți","feminine-neuter-plural":"birefringente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birefringent","error-unrecognized-form-feminine-indefinite-singular":"birefringentă","error-unrecognized-form-indefinite-masculine-plural":"birefringenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"birefringente","definite-error-unrecognized-form-masculine-neuter-singular":"birefringentul","definite-error-unrecognized-form-feminine-singular":"birefringenta","definite-error-unrecognized-form-masculine-plural":"birefringenții","definite-error-unrecognized-form-feminine-neuter-plural":"birefringentele"}},{"word":"birefringență","pos":"noun","definitions":["birefringence"],"forms":{"plural":"birefringențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birefringență","accusative-definite-nominative-singular":"birefringența","accusative-indefinite-nominative-plural":"birefringențe","accusative-definite-nominative-plural":"birefringențele","dative-genitive-indefinite-singular":"birefringențe","dative-definite-genitive-singular":"birefringenței","dative-genitive-indefinite-plural":"birefringențe","dative-definite-genitive-plural":"birefringențelor","singular-vocative":"birefringență","plural-vocative":"birefringențelor"}},{"word":"biremă","pos":"noun","definitions":["Bireme"],"forms":{"plural":"bireme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biremă","accusative-definite-nominative-singular":"birema","accusative-indefinite-nominative-plural":"bireme","accusative-definite-nominative-plural":"biremele","dative-genitive-indefinite-singular":"bireme","dative-definite-genitive-singular":"biremei","dative-genitive-indefinite-plural":"bireme","dative-definite-genitive-plural":"biremelor","singular-vocative":"biremă","plural-vocative":"biremelor"}},{"word":"bireșar","pos":"noun","definitions":["servant"],"forms":{"plural":"bireșari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bireșar","accusative-definite-nominative-singular":"bireșarul","accusative-indefinite-nominative-plural":"bireșari","accusative-definite-nominative-plural":"bireșarii","dative-genitive-indefinite-singular":"bireșar","dative-definite-genitive-singular":"bireșarului","dative-genitive-indefinite-plural":"bireșari","dative-definite-genitive-plural":"bireșarilor","singular-vocative":"bireșarule","plural-vocative":"bireșarilor"}},{"word":"Bîrgăoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrgăoanu"}},{"word":"Bîrgăuan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrgăuan"}}];
@@ -0,0 +1 @@
+export default [{"word":"Bîrgăuanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrgăuanu"}},{"word":"Bîrgoan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrgoan"}},{"word":"Bîrgoanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrgoanu"}},{"word":"birin","pos":"noun","definitions":["coverlet, counterpane, bedspread"],"forms":{"plural":"birinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"birin","accusative-definite-nominative-singular":"birinul","accusative-indefinite-nominative-plural":"birinuri","accusative-definite-nominative-plural":"birinurile","dative-genitive-indefinite-singular":"birin","dative-definite-genitive-singular":"birinului","dative-genitive-indefinite-plural":"birinuri","dative-definite-genitive-plural":"birinurilor","singular-vocative":"birinule","plural-vocative":"birinurilor"}},{"word":"biriș","pos":"noun","definitions":["mercenary, servant"],"forms":{"plural":"biriși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biriș","accusative-definite-nominative-singular":"birișul","accusative-indefinite-nominative-plural":"biriși","accusative-definite-nominative-plural":"birișii","dative-genitive-indefinite-singular":"biriș","dative-definite-genitive-singular":"birișului","dative-genitive-indefinite-plural":"biriși","dative-definite-genitive-plural":"birișilor","singular-vocative":"birișule","plural-vocative":"birișilor"}},{"word":"birjă","pos":"noun","definitions":["hansom"],"forms":{"plural":"birje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birjă","accusative-definite-nominative-singular":"birja","accusative-indefinite-nominative-plural":"birje","accusative-definite-nominative-plural":"birjele","dative-genitive-indefinite-singular":"birje","dative-definite-genitive-singular":"birjei","dative-genitive-indefinite-plural":"birje","dative-definite-genitive-plural":"birjelor","singular-vocative":"birjă","plural-vocative":"birjelor"}},{"word":"birjar","pos":"noun","definitions":["Hansom cab driver"],"forms":{"plural":"birjari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birjar","accusative-definite-nominative-singular":"birjarul","accusative-indefinite-nominative-plural":"birjari","accusative-definite-nominative-plural":"birjarii","dative-genitive-indefinite-singular":"birjar","dative-definite-genitive-singular":"birjarului","dative-genitive-indefinite-plural":"birjari","dative-definite-genitive-plural":"birjarilor","singular-vocative":"birjarule","plural-vocative":"birjarilor"}},{"word":"birjăresc","pos":"adj","definitions":["Hansom cab driver"],"forms":{"feminine-singular":"birjărească","plural":"birjărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birjăresc","error-unrecognized-form-feminine-indefinite-singular":"birjărească","error-unrecognized-form-indefinite-masculine-plural":"birjărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"birjărești","definite-error-unrecognized-form-masculine-neuter-singular":"birjărescul","definite-error-unrecognized-form-feminine-singular":"birjăreasca","definite-error-unrecognized-form-masculine-plural":"birjăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"birjăreștile"}},{"word":"birjărește","pos":"adv","definitions":["like a Hansom cab driver","uncivilized, inappropriate"]},{"word":"birjărie","pos":"noun","definitions":["Hansom cab driving"],"forms":{"plural":"birjării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"birjărie","accusative-definite-nominative-singular":"birjăria","accusative-indefinite-nominative-plural":"birjării","accusative-definite-nominative-plural":"birjăriile","dative-genitive-indefinite-singular":"birjării","dative-definite-genitive-singular":"birjăriei","dative-genitive-indefinite-plural":"birjării","dative-definite-genitive-plural":"birjăriilor","singular-vocative":"birjărie","plural-vocative":"birjăriilor"}},{"word":"Birjaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Birjaru"}},{"word":"birje","pos":"noun","definitions":["cowbell"],"forms":{"plural":"birji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"birje","accusative-definite-nominative-singular":"birjea","accusative-indefinite-nominative-plural":"birji","accusative-definite-nominative-plural":"birjile","dative-genitive-indefinite-singular":"birji","dative-definite-genitive-singular":"birjii","dative-genitive-indefinite-plural":"birji","dative-definite-genitive-plural":"birjilor","singular-vocative":"birje","plural-vocative":"birjilor"}},{"word":"Bîrjoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrjoveanu"}},{"word":"Bîrlădeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrlădeanu"}},{"word":"Bîrlădeni","pos":"name","definitions":["a village in Bîrlădeni, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"m"},{"word":"Bîrlea","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"Bîrleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîrleanu"}},{"word":"Bîrlescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîrlescu"}},{"word":"Bîrlete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîrlete"}},{"word":"birlic","pos":"noun","definitions":["ace (playing card)"],"forms":{"plural":"birlici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birlic","accusative-definite-nominative-singular":"birlicul","accusative-indefinite-nominative-plural":"birlici","accusative-definite-nominative-plural":"birlicii","dative-genitive-indefinite-singular":"birlic","dative-definite-genitive-singular":"birlicului","dative-genitive-indefinite-plural":"birlici","dative-definite-genitive-plural":"birlicilor","singular-vocative":"birlicule","plural-vocative":"birlicilor"}},{"word":"birlicel","pos":"noun","definitions":["diminutive of birlic"],"forms":{"plural":"birlicei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birlicel","accusative-definite-nominative-singular":"birlicelul","accusative-indefinite-nominative-plural":"birlicei","accusative-definite-nominative-plural":"birliceii","dative-genitive-indefinite-singular":"birlicel","dative-definite-genitive-singular":"birlicelului","dative-genitive-indefinite-plural":"birlicei","dative-definite-genitive-plural":"birliceilor","singular-vocative":"birlicelule","plural-vocative":"birliceilor"}},{"word":"Bîrlodeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrlodeanu"}},{"word":"Bîrlog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîrlog"}},{"word":"Bîrlogeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrlogeanu"}},{"word":"Bîrloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîrloiu"}},{"word":"birman","pos":"noun","definitions":["Burmese person"],"pronunciation":"/birˈman/","forms":{"plural":"birmani","feminine":"equivalent birmană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birman","accusative-definite-nominative-singular":"birmanul","accusative-indefinite-nominative-plural":"birmani","accusative-definite-nominative-plural":"birmanii","dative-genitive-indefinite-singular":"birman","dative-definite-genitive-singular":"birmanului","dative-genitive-indefinite-plural":"birmani","dative-definite-genitive-plural":"birmanilor","singular-vocative":"birmanule","plural-vocative":"birmanilor"}},{"word":"birman","pos":"adj","definitions":["Burmese"],"pronunciation":"/birˈman/","forms":{"feminine-singular":"birmană","masculine-plural":"birmani","feminine-neuter-plural":"birmane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birman","error-unrecognized-form-feminine-indefinite-singular":"birmană","error-unrecognized-form-indefinite-masculine-plural":"birmani","error-unrecognized-form-feminine-indefinite-neuter-plural":"birmane","definite-error-unrecognized-form-masculine-neuter-singular":"birmanul","definite-error-unrecognized-form-feminine-singular":"birmana","definite-error-unrecognized-form-masculine-plural":"birmanii","definite-error-unrecognized-form-feminine-neuter-plural":"birmanele"}},{"word":"birmană","pos":"noun","definitions":["female equivalent of birman"],"forms":{"plural":"birmane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birmană","accusative-definite-nominative-singular":"birmana","accusative-indefinite-nominative-plural":"birmane","accusative-definite-nominative-plural":"birmanele","dative-genitive-indefinite-singular":"birmane","dative-definite-genitive-singular":"birmanei","dative-genitive-indefinite-plural":"birmane","dative-definite-genitive-plural":"birmanelor","singular-vocative":"birmană","plural-vocative":"birmanelor"}},{"word":"birmanez","pos":"adj","definitions":["Burmese"],"forms":{"feminine-singular":"birmaneză","masculine-plural":"birmanezi","feminine-neuter-plural":"birmaneze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birmanez","error-unrecognized-form-feminine-indefinite-singular":"birmaneză","error-unrecognized-form-indefinite-masculine-plural":"birmanezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"birmaneze","definite-error-unrecognized-form-masculine-neuter-singular":"birmanezul","definite-error-unrecognized-form-feminine-singular":"birmaneza","definite-error-unrecognized-form-masculine-plural":"birmanezii","definite-error-unrecognized-form-feminine-neuter-plural":"birmanezele"}},{"word":"birmaneză","pos":"noun","definitions":["female equivalent of birmanez"],"forms":{"plural":"birmaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birmaneză","accusative-definite-nominative-singular":"birmaneza","accusative-indefinite-nominative-plural":"birmaneze","accusative-definite-nominative-plural":"birmanezele","dative-genitive-indefinite-singular":"birmaneze","dative-definite-genitive-singular":"birmanezei","dative-genitive-indefinite-plural":"birmaneze","dative-definite-genitive-plural":"birmanezelor","singular-vocative":"birmaneză","plural-vocative":"birmanezelor"}},{"word":"Birmania","pos":"name","definitions":["Myanmar (a country in Southeast Asia)"],"gender":"f"},{"word":"Bîrnea","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"birnic","pos":"noun","definitions":["taxpayer"],"forms":{"plural":"birnici","feminine":"equivalent birnică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birnic","accusative-definite-nominative-singular":"birnicul","accusative-indefinite-nominative-plural":"birnici","accusative-definite-nominative-plural":"birnicii","dative-genitive-indefinite-singular":"birnic","dative-definite-genitive-singular":"birnicului","dative-genitive-indefinite-plural":"birnici","dative-definite-genitive-plural":"birnicilor","singular-vocative":"birnicule","plural-vocative":"birnicilor"}},{"word":"birnică","pos":"noun","definitions":["female equivalent of birnic"],"forms":{"plural":"birnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birnică","accusative-definite-nominative-singular":"birnica","accusative-indefinite-nominative-plural":"birnice","accusative-definite-nominative-plural":"birnicele","dative-genitive-indefinite-singular":"birnice","dative-definite-genitive-singular":"birnicei","dative-genitive-indefinite-plural":"birnice","dative-definite-genitive-plural":"birnicelor","singular-vocative":"birnică","plural-vocative":"birnicelor"}},{"word":"Birnicu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Birnicu"}},{"word":"Bîrnova","pos":"name","definitions":["a village in Bîrnova, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"f"},{"word":"Bîrnoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrnoveanu"}},{"word":"birocrat","pos":"noun","definitions":["bureaucrat"],"forms":{"plural":"birocrați","feminine":"equivalent birocrată","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birocrat","accusative-definite-nominative-singular":"birocratul","accusative-indefinite-nominative-plural":"birocrați","accusative-definite-nominative-plural":"birocrații","dative-genitive-indefinite-singular":"birocrat","dative-definite-genitive-singular":"birocratului","dative-genitive-indefinite-plural":"birocrați","dative-definite-genitive-plural":"birocraților","singular-vocative":"birocratule","plural-vocative":"birocraților"}},{"word":"birocrată","pos":"noun","definitions":["female equivalent of birocrat"],"forms":{"plural":"birocrate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birocrată","accusative-definite-nominative-singular":"birocrata","accusative-indefinite-nominative-plural":"birocrate","accusative-definite-nominative-plural":"birocratele","dative-genitive-indefinite-singular":"birocrate","dative-definite-genitive-singular":"birocratei","dative-genitive-indefinite-plural":"birocrate","dative-definite-genitive-plural":"birocratelor","singular-vocative":"birocrată","plural-vocative":"birocratelor"}},{"word":"birocratic","pos":"adj","definitions":["bureaucratic"],"forms":{"feminine-singular":"birocratică","masculine-plural":"birocratici","feminine-neuter-plural":"birocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birocratic","error-unrecognized-form-feminine-indefinite-singular":"birocratică","error-unrecognized-form-indefinite-masculine-plural":"birocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"birocratice","definite-error-unrecognized-form-masculine-neuter-singular":"birocraticul","definite-error-unrecognized-form-feminine-singular":"birocratica","definite-error-unrecognized-form-masculine-plural":"birocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"birocraticele"}},{"word":"birocrație","pos":"noun","definitions":["bureaucracy"],"forms":{"plural":"birocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"birocrație","accusative-definite-nominative-singular":"birocrația","accusative-indefinite-nominative-plural":"birocrații","accusative-definite-nominative-plural":"birocrațiile","dative-genitive-indefinite-singular":"birocrații","dative-definite-genitive-singular":"birocrației","dative-genitive-indefinite-plural":"birocrații","dative-definite-genitive-plural":"birocrațiilor","singular-vocative":"birocrație","plural-vocative":"birocrațiilor"}},{"word":"birocratism","pos":"noun","definitions":["bureaucratism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"birocratism","accusative-definite-nominative":"birocratismul","dative-genitive-indefinite":"birocratism","dative-definite-genitive":"birocratismului","vocative":"birocratismule"}},{"word":"birocratiza","pos":"verb","definitions":["to bureaucratize"],"forms":{"canonical":"a birocratiza 1st conjugation","present-singular-third-person":"birocratizează","participle-past":"birocratizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a birocratiza","gerund":"birocratizând","first-person-indicative-present-singular":"birocratizez","indicative-present-second-person-singular":"birocratizezi","indicative-present-singular-third-person":"birocratizează","first-person-indicative-plural-present":"birocratizăm","indicative-plural-present-second-person":"birocratizați","indicative-plural-present-third-person":"birocratizează","first-person-imperfect-indicative-singular":"birocratizam","imperfect-indicative-second-person-singular":"birocratizai","imperfect-indicative-singular-third-person":"birocratiza","first-person-imperfect-indicative-plural":"birocratizam","imperfect-indicative-plural-second-person":"birocratizați","imperfect-indicative-plural-third-person":"birocratizau","first-person-indicative-perfect-singular":"birocratizai","indicative-perfect-second-person-singular":"birocratizași","indicative-perfect-singular-third-person":"birocratiză","first-person-indicative-perfect-plural":"birocratizarăm","indicative-perfect-plural-second-person":"birocratizarăți","indicative-perfect-plural-third-person":"birocratizară","first-person-indicative-pluperfect-singular":"birocratizasem","indicative-pluperfect-second-person-singular":"birocratizaseși","indicative-pluperfect-singular-third-person":"birocratizase","first-person-indicative-pluperfect-plural":"birocratizaserăm","indicative-pluperfect-plural-second-person":"birocratizaserăți","indicative-pluperfect-plural-third-person":"birocratizaseră","first-person-present-singular-subjunctive":"să birocratizez","present-second-person-singular-subjunctive":"să birocratizezi","present-singular-subjunctive-third-person":"să birocratizeze","first-person-plural-present-subjunctive":"să birocratizăm","plural-present-second-person-subjunctive":"să birocratizați","plural-present-subjunctive-third-person":"să birocratizeze","imperative-second-person-singular":"birocratizează","imperative-plural-second-person":"birocratizați","imperative-negative-second-person-singular":"nu birocratiza","imperative-negative-plural-second-person":"nu birocratizați"}},{"word":"birocratizare","pos":"noun","definitions":["bureaucratization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"birocratizare","accusative-definite-nominative":"birocratizarea","dative-genitive-indefinite":"birocratizare","dative-definite-genitive":"birocratizarei","vocative":"birocratizare"}},{"word":"birocratizat","pos":"adj","definitions":["bureaucratized"],"forms":{"feminine-singular":"birocratizată","masculine-plural":"birocratizați","feminine-neuter-plural":"birocratizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"birocratizat","error-unrecognized-form-feminine-indefinite-singular":"birocratizată","error-unrecognized-form-indefinite-masculine-plural":"birocratizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"birocratizate","definite-error-unrecognized-form-masculine-neuter-singular":"birocratizatul","definite-error-unrecognized-form-feminine-singular":"birocratizata","definite-error-unrecognized-form-masculine-plural":"birocratizații","definite-error-unrecognized-form-feminine-neuter-plural":"birocratizatele"}},{"word":"birotică","pos":"noun","definitions":["office automation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"birotică","accusative-definite-nominative":"birotica","dative-genitive-indefinite":"birotice","dative-definite-genitive":"biroticei","vocative":"birotică"}},{"word":"birou","pos":"noun","definitions":["bureau","desk","office","study"],"pronunciation":"/biˈrow/","forms":{"plural":"birouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"birou","accusative-definite-nominative-singular":"biroul","accusative-indefinite-nominative-plural":"birouri","accusative-definite-nominative-plural":"birourile","dative-genitive-indefinite-singular":"birou","dative-definite-genitive-singular":"biroului","dative-genitive-indefinite-plural":"birouri","dative-definite-genitive-plural":"birourilor","singular-vocative":"biroule","plural-vocative":"birourilor"}},{"word":"birou politic","pos":"noun","definitions":["politburo"],"forms":{"plural":"birouri politice"}},{"word":"biroul","pos":"noun","definitions":["definite nominative/accusative singular of birou"]},{"word":"biroului","pos":"noun","definitions":["definite dative/genitive singular of birou"]},{"word":"birouri","pos":"noun","definitions":["plural of birou"]},{"word":"birourile","pos":"noun","definitions":["definite nominative/accusative plural of birou"]},{"word":"birourilor","pos":"noun","definitions":["inflection of birou:","definite genitive/dative plural","vocative plural"]},{"word":"birșag","pos":"noun","definitions":["fine"],"forms":{"plural":"birșaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"birșag","accusative-definite-nominative-singular":"birșagul","accusative-indefinite-nominative-plural":"birșaguri","accusative-definite-nominative-plural":"birșagurile","dative-genitive-indefinite-singular":"birșag","dative-definite-genitive-singular":"birșagului","dative-genitive-indefinite-plural":"birșaguri","dative-definite-genitive-plural":"birșagurilor","singular-vocative":"birșagule","plural-vocative":"birșagurilor"}},{"word":"birșăgălui","pos":"verb","definitions":["to fine"],"forms":{"canonical":"a birșăgălui 4th conjugation","present-singular-third-person":"birșăgăluie","participle-past":"birșăgăluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a birșăgălui","gerund":"birșăgăluind","first-person-indicative-present-singular":"birșăgălui","indicative-present-second-person-singular":"birșăgălui","indicative-present-singular-third-person":"birșăgăluie","first-person-indicative-plural-present":"birșăgăluim","indicative-plural-present-second-person":"birșăgăluiți","indicative-plural-present-third-person":"birșăgăluie","first-person-imperfect-indicative-singular":"birșăgăluiam","imperfect-indicative-second-person-singular":"birșăgăluiai","imperfect-indicative-singular-third-person":"birșăgăluia","first-person-imperfect-indicative-plural":"birșăgăluiam","imperfect-indicative-plural-second-person":"birșăgăluiați","imperfect-indicative-plural-third-person":"birșăgăluiau","first-person-indicative-perfect-singular":"birșăgăluii","indicative-perfect-second-person-singular":"birșăgăluiși","indicative-perfect-singular-third-person":"birșăgălui","first-person-indicative-perfect-plural":"birșăgăluirăm","indicative-perfect-plural-second-person":"birșăgăluirăți","indicative-perfect-plural-third-person":"birșăgăluiră","first-person-indicative-pluperfect-singular":"birșăgăluisem","indicative-pluperfect-second-person-singular":"birșăgăluiseși","indicative-pluperfect-singular-third-person":"birșăgăluise","first-person-indicative-pluperfect-plural":"birșăgăluiserăm","indicative-pluperfect-plural-second-person":"birșăgăluiserăți","indicative-pluperfect-plural-third-person":"birșăgăluiseră","first-person-present-singular-subjunctive":"să birșăgălui","present-second-person-singular-subjunctive":"să birșăgălui","present-singular-subjunctive-third-person":"să birșăgăluie","first-person-plural-present-subjunctive":"să birșăgăluim","plural-present-second-person-subjunctive":"să birșăgăluiți","plural-present-subjunctive-third-person":"să birșăgăluie","imperative-second-person-singular":"birșăgăluie","imperative-plural-second-person":"birșăgăluiți","imperative-negative-second-person-singular":"nu birșăgălui","imperative-negative-plural-second-person":"nu birșăgăluiți"}},{"word":"Bîrsănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîrsănescu"}},{"word":"Bîrsășteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîrsășteanu"}},{"word":"Birt","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Birt"}},{"word":"birt","pos":"noun","definitions":["diner, eatery","pub, tavern","inn"],"pronunciation":"/ˈbirt/","forms":{"plural":"birturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"birt","accusative-definite-nominative-singular":"birtul","accusative-indefinite-nominative-plural":"birturi","accusative-definite-nominative-plural":"birturile","dative-genitive-indefinite-singular":"birt","dative-definite-genitive-singular":"birtului","dative-genitive-indefinite-plural":"birturi","dative-definite-genitive-plural":"birturilor","singular-vocative":"birtule","plural-vocative":"birturilor"}},{"word":"birtă","pos":"noun","definitions":["taxation"],"forms":{"plural":"birte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birtă","accusative-definite-nominative-singular":"birta","accusative-indefinite-nominative-plural":"birte","accusative-definite-nominative-plural":"birtele","dative-genitive-indefinite-singular":"birte","dative-definite-genitive-singular":"birtei","dative-genitive-indefinite-plural":"birte","dative-definite-genitive-plural":"birtelor","singular-vocative":"birtă","plural-vocative":"birtelor"}},{"word":"Birtan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Birtan"}},{"word":"Birtaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Birtaru"}},{"word":"Birtaș","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Birtaș"}},{"word":"birtaș","pos":"noun","definitions":["innkeeper"],"forms":{"plural":"birtași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birtaș","accusative-definite-nominative-singular":"birtașul","accusative-indefinite-nominative-plural":"birtași","accusative-definite-nominative-plural":"birtașii","dative-genitive-indefinite-singular":"birtaș","dative-definite-genitive-singular":"birtașului","dative-genitive-indefinite-plural":"birtași","dative-definite-genitive-plural":"birtașilor","singular-vocative":"birtașule","plural-vocative":"birtașilor"}},{"word":"birtășiță","pos":"noun","definitions":["female innkeeper"],"forms":{"plural":"birtășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birtășiță","accusative-definite-nominative-singular":"birtășița","accusative-indefinite-nominative-plural":"birtășițe","accusative-definite-nominative-plural":"birtășițele","dative-genitive-indefinite-singular":"birtășițe","dative-definite-genitive-singular":"birtășiței","dative-genitive-indefinite-plural":"birtășițe","dative-definite-genitive-plural":"birtășițelor","singular-vocative":"birtășiță","plural-vocative":"birtășițelor"}},{"word":"birtășoaică","pos":"noun","definitions":["female innkeeper"],"forms":{"plural":"birtășoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"birtășoaică","accusative-definite-nominative-singular":"birtășoaica","accusative-indefinite-nominative-plural":"birtășoaice","accusative-definite-nominative-plural":"birtășoaicele","dative-genitive-indefinite-singular":"birtășoaice","dative-definite-genitive-singular":"birtășoaicei","dative-genitive-indefinite-plural":"birtășoaice","dative-definite-genitive-plural":"birtășoaicelor","singular-vocative":"birtășoaică","plural-vocative":"birtășoaicelor"}},{"word":"Birtin","pos":"name","definitions":["a village in Vadu Crișului, Bihor County, Romania","a village in Vața de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"birtoc","pos":"noun","definitions":["real estate property"],"forms":{"plural":"birtocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"birtoc","accusative-definite-nominative-singular":"birtocul","accusative-indefinite-nominative-plural":"birtocuri","accusative-definite-nominative-plural":"birtocurile","dative-genitive-indefinite-singular":"birtoc","dative-definite-genitive-singular":"birtocului","dative-genitive-indefinite-plural":"birtocuri","dative-definite-genitive-plural":"birtocurilor","singular-vocative":"birtocule","plural-vocative":"birtocurilor"}},{"word":"birtocaș","pos":"noun","definitions":["owner"],"forms":{"plural":"birtocași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"birtocaș","accusative-definite-nominative-singular":"birtocașul","accusative-indefinite-nominative-plural":"birtocași","accusative-definite-nominative-plural":"birtocașii","dative-genitive-indefinite-singular":"birtocaș","dative-definite-genitive-singular":"birtocașului","dative-genitive-indefinite-plural":"birtocași","dative-definite-genitive-plural":"birtocașilor","singular-vocative":"birtocașule","plural-vocative":"birtocașilor"}},{"word":"birui","pos":"verb","definitions":["to defeat, vanquish, subdue, be victorious over"],"forms":{"canonical":"a birui 4th conjugation","present-singular-third-person":"biruiește","participle-past":"biruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a birui","gerund":"biruind","first-person-indicative-present-singular":"biruiesc","indicative-present-second-person-singular":"biruiești","indicative-present-singular-third-person":"biruiește","first-person-indicative-plural-present":"biruim","indicative-plural-present-second-person":"biruiți","indicative-plural-present-third-person":"biruiesc","first-person-imperfect-indicative-singular":"biruiam","imperfect-indicative-second-person-singular":"biruiai","imperfect-indicative-singular-third-person":"biruia","first-person-imperfect-indicative-plural":"biruiam","imperfect-indicative-plural-second-person":"biruiați","imperfect-indicative-plural-third-person":"biruiau","first-person-indicative-perfect-singular":"biruii","indicative-perfect-second-person-singular":"biruiși","indicative-perfect-singular-third-person":"birui","first-person-indicative-perfect-plural":"biruirăm","indicative-perfect-plural-second-person":"biruirăți","indicative-perfect-plural-third-person":"biruiră","first-person-indicative-pluperfect-singular":"biruisem","indicative-pluperfect-second-person-singular":"biruiseși","indicative-pluperfect-singular-third-person":"biruise","first-person-indicative-pluperfect-plural":"biruiserăm","indicative-pluperfect-plural-second-person":"biruiserăți","indicative-pluperfect-plural-third-person":"biruiseră","first-person-present-singular-subjunctive":"să biruiesc","present-second-person-singular-subjunctive":"să biruiești","present-singular-subjunctive-third-person":"să biruiască","first-person-plural-present-subjunctive":"să biruim","plural-present-second-person-subjunctive":"să biruiți","plural-present-subjunctive-third-person":"să biruiască","imperative-second-person-singular":"biruiește","imperative-plural-second-person":"biruiți","imperative-negative-second-person-singular":"nu birui","imperative-negative-plural-second-person":"nu biruiți"}},{"word":"Biruința","pos":"name","definitions":["a village in Topraisar, Constanța County, Romania"],"gender":"f"},{"word":"biruința","pos":"noun","definitions":["definite nominative/accusative singular of biruință"]},{"word":"biruință","pos":"noun","definitions":["victory, triumph"],"pronunciation":"/bi.ruˈin.t͡sə/","forms":{"plural":"biruințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biruință","accusative-definite-nominative-singular":"biruința","accusative-indefinite-nominative-plural":"biruințe","accusative-definite-nominative-plural":"biruințele","dative-genitive-indefinite-singular":"biruințe","dative-definite-genitive-singular":"biruinței","dative-genitive-indefinite-plural":"biruințe","dative-definite-genitive-plural":"biruințelor","singular-vocative":"biruință","plural-vocative":"biruințelor"}},{"word":"biruințe","pos":"noun","definitions":["plural of biruință"]},{"word":"biruire","pos":"noun","definitions":["victory"],"forms":{"plural":"biruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biruire","accusative-definite-nominative-singular":"biruirea","accusative-indefinite-nominative-plural":"biruiri","accusative-definite-nominative-plural":"biruirile","dative-genitive-indefinite-singular":"biruiri","dative-definite-genitive-singular":"biruirii","dative-genitive-indefinite-plural":"biruiri","dative-definite-genitive-plural":"biruirilor","singular-vocative":"biruire","plural-vocative":"biruirilor"}},{"word":"biruit","pos":"adj","definitions":["defeated"],"forms":{"feminine-singular":"biruită","masculine-plural":"biruiți","feminine-neuter-plural":"biruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biruit","error-unrecognized-form-feminine-indefinite-singular":"biruită","error-unrecognized-form-indefinite-masculine-plural":"biruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"biruite","definite-error-unrecognized-form-masculine-neuter-singular":"biruitul","definite-error-unrecognized-form-feminine-singular":"biruita","definite-error-unrecognized-form-masculine-plural":"biruiții","definite-error-unrecognized-form-feminine-neuter-plural":"biruitele"}},{"word":"biruit","pos":"verb","definitions":["past participle of birui"],"forms":{"participle-past":"of birui"}},{"word":"biruitoare","pos":"noun","definitions":["female equivalent of biruitor"],"forms":{"plural":"biruitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"biruitoare","accusative-definite-nominative-singular":"biruitoarea","accusative-indefinite-nominative-plural":"biruitoare","accusative-definite-nominative-plural":"biruitoarele","dative-genitive-indefinite-singular":"biruitoare","dative-definite-genitive-singular":"biruitoarei","dative-genitive-indefinite-plural":"biruitoare","dative-definite-genitive-plural":"biruitoarelor","singular-vocative":"biruitoare","plural-vocative":"biruitoarelor"}},{"word":"biruitor","pos":"adj","definitions":["conquering"],"forms":{"feminine-singular":"biruitoare","masculine-plural":"biruitori","feminine-neuter-plural":"biruitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biruitor","error-unrecognized-form-feminine-indefinite-singular":"biruitoare","error-unrecognized-form-indefinite-masculine-plural":"biruitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"biruitoare","definite-error-unrecognized-form-masculine-neuter-singular":"biruitorul","definite-error-unrecognized-form-feminine-singular":"biruitoarea","definite-error-unrecognized-form-masculine-plural":"biruitorii","definite-error-unrecognized-form-feminine-neuter-plural":"biruitoarele"}},{"word":"biruitor","pos":"noun","definitions":["conqueror"],"forms":{"plural":"biruitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biruitor","accusative-definite-nominative-singular":"biruitorul","accusative-indefinite-nominative-plural":"biruitori","accusative-definite-nominative-plural":"biruitorii","dative-genitive-indefinite-singular":"biruitor","dative-definite-genitive-singular":"biruitorului","dative-genitive-indefinite-plural":"biruitori","dative-definite-genitive-plural":"biruitorilor","singular-vocative":"biruitorule","plural-vocative":"biruitorilor"}},{"word":"birușcă","pos":"noun","definitions":["tax"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"birușcă","accusative-definite-nominative":"birușca","dative-genitive-indefinite":"birușce","dative-definite-genitive":"birușcei","vocative":"birușcă"}},{"word":"Bîrzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bîrzescu"}},{"word":"Bîrzilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîrzilă"}},{"word":"bis","pos":"noun","definitions":["bis, encore, repeat"],"forms":{"plural":"bisuri"}},{"word":"bisa","pos":"verb","definitions":["to repeat; to perform an encore"],"forms":{"canonical":"a bisa 1st conjugation","present-singular-third-person":"bisează","participle-past":"bisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bisa","gerund":"bisând","first-person-indicative-present-singular":"bisez","indicative-present-second-person-singular":"bisezi","indicative-present-singular-third-person":"bisează","first-person-indicative-plural-present":"bisăm","indicative-plural-present-second-person":"bisați","indicative-plural-present-third-person":"bisează","first-person-imperfect-indicative-singular":"bisam","imperfect-indicative-second-person-singular":"bisai","imperfect-indicative-singular-third-person":"bisa","first-person-imperfect-indicative-plural":"bisam","imperfect-indicative-plural-second-person":"bisați","imperfect-indicative-plural-third-person":"bisau","first-person-indicative-perfect-singular":"bisai","indicative-perfect-second-person-singular":"bisași","indicative-perfect-singular-third-person":"bisă","first-person-indicative-perfect-plural":"bisarăm","indicative-perfect-plural-second-person":"bisarăți","indicative-perfect-plural-third-person":"bisară","first-person-indicative-pluperfect-singular":"bisasem","indicative-pluperfect-second-person-singular":"bisaseși","indicative-pluperfect-singular-third-person":"bisase","first-person-indicative-pluperfect-plural":"bisaserăm","indicative-pluperfect-plural-second-person":"bisaserăți","indicative-pluperfect-plural-third-person":"bisaseră","first-person-present-singular-subjunctive":"să bisez","present-second-person-singular-subjunctive":"să bisezi","present-singular-subjunctive-third-person":"să biseze","first-person-plural-present-subjunctive":"să bisăm","plural-present-second-person-subjunctive":"să bisați","plural-present-subjunctive-third-person":"să biseze","imperative-second-person-singular":"bisează","imperative-plural-second-person":"bisați","imperative-negative-second-person-singular":"nu bisa","imperative-negative-plural-second-person":"nu bisați"}},{"word":"bisanual","pos":"adj","definitions":["biennial"],"forms":{"feminine-singular":"bisanuală","masculine-plural":"bisanuali","feminine-neuter-plural":"bisanuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisanual","error-unrecognized-form-feminine-indefinite-singular":"bisanuală","error-unrecognized-form-indefinite-masculine-plural":"bisanuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisanuale","definite-error-unrecognized-form-masculine-neuter-singular":"bisanualul","definite-error-unrecognized-form-feminine-singular":"bisanuala","definite-error-unrecognized-form-masculine-plural":"bisanualii","definite-error-unrecognized-form-feminine-neuter-plural":"bisanualele"}},{"word":"bisăptămânal","pos":"adj","definitions":["biweekly"],"forms":{"feminine-singular":"bisăptămânală","masculine-plural":"bisăptămânali","feminine-neuter-plural":"bisăptămânale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisăptămânal","error-unrecognized-form-feminine-indefinite-singular":"bisăptămânală","error-unrecognized-form-indefinite-masculine-plural":"bisăptămânali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisăptămânale","definite-error-unrecognized-form-masculine-neuter-singular":"bisăptămânalul","definite-error-unrecognized-form-feminine-singular":"bisăptămânala","definite-error-unrecognized-form-masculine-plural":"bisăptămânalii","definite-error-unrecognized-form-feminine-neuter-plural":"bisăptămânalele"}},{"word":"Bîscoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bîscoveanu"}},{"word":"biscuit","pos":"noun","definitions":["biscuit, cookie","biscuit (white earthenware)"],"pronunciation":"/bis.kuˈit/","forms":{"plural":"biscuiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biscuit","accusative-definite-nominative-singular":"biscuitul","accusative-indefinite-nominative-plural":"biscuiți","accusative-definite-nominative-plural":"biscuiții","dative-genitive-indefinite-singular":"biscuit","dative-definite-genitive-singular":"biscuitului","dative-genitive-indefinite-plural":"biscuiți","dative-definite-genitive-plural":"biscuiților","singular-vocative":"biscuitule","plural-vocative":"biscuiților","alternative-dated":"biscot","alternative-proscribed":"biscuite"}},{"word":"biscuite","pos":"noun","definitions":["alternative form of biscuit"],"gender":"m"},{"word":"bisect","pos":"adj","definitions":["bissextil"],"forms":{"feminine-singular":"bisectă","masculine-plural":"bisecți","feminine-neuter-plural":"bisecte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisect","error-unrecognized-form-feminine-indefinite-singular":"bisectă","error-unrecognized-form-indefinite-masculine-plural":"bisecți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisecte","definite-error-unrecognized-form-masculine-neuter-singular":"bisectul","definite-error-unrecognized-form-feminine-singular":"bisecta","definite-error-unrecognized-form-masculine-plural":"bisecții","definite-error-unrecognized-form-feminine-neuter-plural":"bisectele"}},{"word":"bisectoare","pos":"noun","definitions":["bisector"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"bisectoare","accusative-definite-nominative-singular":"bisectoarea","accusative-indefinite-nominative-plural":"bisectoare","accusative-definite-nominative-plural":"bisectoarele","dative-genitive-indefinite-singular":"bisectoare","dative-definite-genitive-singular":"bisectoarei","dative-genitive-indefinite-plural":"bisectoare","dative-definite-genitive-plural":"bisectoarelor","singular-vocative":"bisectoare","plural-vocative":"bisectoarelor"}},{"word":"bisector","pos":"adj","definitions":["bisecting"],"forms":{"feminine-singular":"bisectoare","masculine-plural":"bisectori","feminine-neuter-plural":"bisectoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisector","error-unrecognized-form-feminine-indefinite-singular":"bisectoare","error-unrecognized-form-indefinite-masculine-plural":"bisectori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisectoare","definite-error-unrecognized-form-masculine-neuter-singular":"bisectorul","definite-error-unrecognized-form-feminine-singular":"bisectoarea","definite-error-unrecognized-form-masculine-plural":"bisectorii","definite-error-unrecognized-form-feminine-neuter-plural":"bisectoarele"}},{"word":"bisecular","pos":"adj","definitions":["bicentennial"],"forms":{"feminine-singular":"biseculară","masculine-plural":"biseculari","feminine-neuter-plural":"biseculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisecular","error-unrecognized-form-feminine-indefinite-singular":"biseculară","error-unrecognized-form-indefinite-masculine-plural":"biseculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"biseculare","definite-error-unrecognized-form-masculine-neuter-singular":"bisecularul","definite-error-unrecognized-form-feminine-singular":"biseculara","definite-error-unrecognized-form-masculine-plural":"bisecularii","definite-error-unrecognized-form-feminine-neuter-plural":"bisecularele"}},{"word":"Biserica","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Neagra Șarului"],"gender":"f"},{"word":"biserica","pos":"noun","definitions":["definite nominative/accusative singular of biserică"]},{"word":"biserică","pos":"noun","definitions":["church"],"pronunciation":"/biˈse.ri.kə/","forms":{"plural":"biserici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"biserică","accusative-definite-nominative-singular":"biserica","accusative-indefinite-nominative-plural":"biserici","accusative-definite-nominative-plural":"bisericile","dative-genitive-indefinite-singular":"biserici","dative-definite-genitive-singular":"bisericii","dative-genitive-indefinite-plural":"biserici","dative-definite-genitive-plural":"bisericilor","singular-vocative":"biserică","plural-vocative":"bisericilor","alternative-obsolete":"băsearecă","alternative":"бисерикэ"}},{"word":"Biserica Anglicană","pos":"name","definitions":["Church of England"],"gender":"f"},{"word":"Biserica Angliei","pos":"name","definitions":["the Church of England"],"gender":"f"},{"word":"Biserică Catolică","pos":"name","definitions":["Catholic Church"],"gender":"f"},{"word":"biserică de stat","pos":"noun","definitions":["established church"],"forms":{"plural":"biserici de stat"}},{"word":"Biserică Latină","pos":"name","definitions":["Latin Church"],"gender":"f"},{"word":"Biserica Ortodoxă Greacă","pos":"name","definitions":["Greek Orthodox Church"],"gender":"f"},{"word":"Biserica Ortodoxă Răsăriteană","pos":"name","definitions":["Eastern Orthodox Church"],"gender":"f"},{"word":"Biserica Ortodoxă Română","pos":"name","definitions":["Romanian Orthodox Church"],"gender":"f"},{"word":"Biserica Ortodoxă Rusă","pos":"name","definitions":["Russian Orthodox Church"],"gender":"f"},{"word":"biserică parohială","pos":"noun","definitions":["parish church"],"forms":{"plural":"biserici parohiale"}},{"word":"biserică pravoslavnică","pos":"noun","definitions":["Orthodox Church"],"forms":{"plural":"biserici pravoslavnice"}},{"word":"Biserica Scoției","pos":"name","definitions":["Church of Scotland"],"gender":"f"},{"word":"Bisericani","pos":"name","definitions":["a village in Bucium, Alba County, Romania","a village in Lupeni, Harghita County, Romania","a village in Alexandru cel Bun, Neamț County, Romania"],"gender":"m"},{"word":"bisericesc","pos":"adj","definitions":["ecclesiastical, churchly, churchical"],"pronunciation":"/bi.se.riˈt͡ʃesk/","forms":{"feminine-singular":"bisericească","plural":"bisericești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisericesc","error-unrecognized-form-feminine-indefinite-singular":"bisericească","error-unrecognized-form-indefinite-masculine-plural":"bisericești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisericești","definite-error-unrecognized-form-masculine-neuter-singular":"bisericescul","definite-error-unrecognized-form-feminine-singular":"bisericeasca","definite-error-unrecognized-form-masculine-plural":"bisericeștii","definite-error-unrecognized-form-feminine-neuter-plural":"bisericeștile"}},{"word":"bisericește","pos":"adv","definitions":["ecclesiastically"]},{"word":"biserici","pos":"noun","definitions":["inflection of biserică:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"Bisericii","pos":"name","definitions":["a river in Olt, Romania, tributary to the Geamărtălui","a river in Vrancea, Romania, tributary to the Râmnicel"],"gender":"m"},{"word":"bisericii","pos":"noun","definitions":["definite genitive/dative singular of biserică"]},{"word":"bisericoasă","pos":"noun","definitions":["female equivalent of bisericos"],"forms":{"plural":"bisericoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bisericoasă","accusative-definite-nominative-singular":"bisericoasa","accusative-indefinite-nominative-plural":"bisericoase","accusative-definite-nominative-plural":"bisericoasele","dative-genitive-indefinite-singular":"bisericoase","dative-definite-genitive-singular":"bisericoasei","dative-genitive-indefinite-plural":"bisericoase","dative-definite-genitive-plural":"bisericoaselor","singular-vocative":"bisericoasă","plural-vocative":"bisericoaselor"}},{"word":"bisericos","pos":"adj","definitions":["pious, churchy"],"pronunciation":"/bi.se.riˈkos/","forms":{"feminine-singular":"bisericoasă","masculine-plural":"bisericoși","feminine-neuter-plural":"bisericoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisericos","error-unrecognized-form-feminine-indefinite-singular":"bisericoasă","error-unrecognized-form-indefinite-masculine-plural":"bisericoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisericoase","definite-error-unrecognized-form-masculine-neuter-singular":"bisericosul","definite-error-unrecognized-form-feminine-singular":"bisericoasa","definite-error-unrecognized-form-masculine-plural":"bisericoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bisericoasele"}},{"word":"bisericuță","pos":"noun","definitions":["clique"],"pronunciation":"/bi.se.riˈku.t͡sə/","forms":{"plural":"bisericuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bisericuță","accusative-definite-nominative-singular":"bisericuța","accusative-indefinite-nominative-plural":"bisericuțe","accusative-definite-nominative-plural":"bisericuțele","dative-genitive-indefinite-singular":"bisericuțe","dative-definite-genitive-singular":"bisericuței","dative-genitive-indefinite-plural":"bisericuțe","dative-definite-genitive-plural":"bisericuțelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bisextil","pos":"adj","definitions":["bissextil"],"forms":{"feminine-singular":"bisextilă","masculine-plural":"bisextili","feminine-neuter-plural":"bisextile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisextil","error-unrecognized-form-feminine-indefinite-singular":"bisextilă","error-unrecognized-form-indefinite-masculine-plural":"bisextili","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisextile","definite-error-unrecognized-form-masculine-neuter-singular":"bisextilul","definite-error-unrecognized-form-feminine-singular":"bisextila","definite-error-unrecognized-form-masculine-plural":"bisextilii","definite-error-unrecognized-form-feminine-neuter-plural":"bisextilele"}},{"word":"bisexual","pos":"adj","definitions":["bisexual"],"pronunciation":"/ˌbi.se.ksuˈal/","forms":{"feminine-singular":"bisexuală","masculine-plural":"bisexuali","feminine-neuter-plural":"bisexuale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisexual","error-unrecognized-form-feminine-indefinite-singular":"bisexuală","error-unrecognized-form-indefinite-masculine-plural":"bisexuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisexuale","definite-error-unrecognized-form-masculine-neuter-singular":"bisexualul","definite-error-unrecognized-form-feminine-singular":"bisexuala","definite-error-unrecognized-form-masculine-plural":"bisexualii","definite-error-unrecognized-form-feminine-neuter-plural":"bisexualele"}},{"word":"bisexual","pos":"noun","definitions":["bisexual"],"pronunciation":"/ˌbi.se.ksuˈal/","forms":{"plural":"bisexuali","feminine":"equivalent bisexuală","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bisexual","accusative-definite-nominative-singular":"bisexualul","accusative-indefinite-nominative-plural":"bisexuali","accusative-definite-nominative-plural":"bisexualii","dative-genitive-indefinite-singular":"bisexual","dative-definite-genitive-singular":"bisexualului","dative-genitive-indefinite-plural":"bisexuali","dative-definite-genitive-plural":"bisexualilor","singular-vocative":"bisexualule","plural-vocative":"bisexualilor"}},{"word":"bisexuală","pos":"noun","definitions":["female equivalent of bisexual"],"forms":{"plural":"bisexuale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bisexuală","accusative-definite-nominative-singular":"bisexuala","accusative-indefinite-nominative-plural":"bisexuale","accusative-definite-nominative-plural":"bisexualele","dative-genitive-indefinite-singular":"bisexuale","dative-definite-genitive-singular":"bisexualei","dative-genitive-indefinite-plural":"bisexuale","dative-definite-genitive-plural":"bisexualelor","singular-vocative":"bisexuală","plural-vocative":"bisexualelor"}},{"word":"bisexuali","pos":"noun","definitions":["plural of bisexual"],"gender":"m"},{"word":"bisexualitate","pos":"noun","definitions":["bisexuality"],"pronunciation":"[biseksualiˈtate]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"bisexualitate","accusative-definite-nominative":"bisexualitatea","dative-genitive-indefinite":"bisexualități","dative-definite-genitive":"bisexualității","vocative":"bisexualitate","alternative":"бисексуалитате"}},{"word":"bisexualitatea","pos":"noun","definitions":["definite nominative/accusative singular of bisexualitate"],"pronunciation":"/biseksualiˈtate̯a/","gender":"f"},{"word":"bisexualității","pos":"noun","definitions":["definite genitive/dative singular of bisexualitate"],"pronunciation":"/biseksualiˈtət͡si/","gender":"f"},{"word":"bisexuat","pos":"adj","definitions":["bisexual (of plants and animals)"],"forms":{"feminine-singular":"bisexuată","masculine-plural":"bisexuați","feminine-neuter-plural":"bisexuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisexuat","error-unrecognized-form-feminine-indefinite-singular":"bisexuată","error-unrecognized-form-indefinite-masculine-plural":"bisexuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisexuate","definite-error-unrecognized-form-masculine-neuter-singular":"bisexuatul","definite-error-unrecognized-form-feminine-singular":"bisexuata","definite-error-unrecognized-form-masculine-plural":"bisexuații","definite-error-unrecognized-form-feminine-neuter-plural":"bisexuatele"}},{"word":"bisilabic","pos":"adj","definitions":["dissyllabic"],"forms":{"feminine-singular":"bisilabică","masculine-plural":"bisilabici","feminine-neuter-plural":"bisilabice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisilabic","error-unrecognized-form-feminine-indefinite-singular":"bisilabică","error-unrecognized-form-indefinite-masculine-plural":"bisilabici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisilabice","definite-error-unrecognized-form-masculine-neuter-singular":"bisilabicul","definite-error-unrecognized-form-feminine-singular":"bisilabica","definite-error-unrecognized-form-masculine-plural":"bisilabicii","definite-error-unrecognized-form-feminine-neuter-plural":"bisilabicele"}},{"word":"bisimetric","pos":"adj","definitions":["bisymmetric"],"forms":{"feminine-singular":"bisimetrică","masculine-plural":"bisimetrici","feminine-neuter-plural":"bisimetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisimetric","error-unrecognized-form-feminine-indefinite-singular":"bisimetrică","error-unrecognized-form-indefinite-masculine-plural":"bisimetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisimetrice","definite-error-unrecognized-form-masculine-neuter-singular":"bisimetricul","definite-error-unrecognized-form-feminine-singular":"bisimetrica","definite-error-unrecognized-form-masculine-plural":"bisimetricii","definite-error-unrecognized-form-feminine-neuter-plural":"bisimetricele"}},{"word":"bismut","pos":"noun","definitions":["bismuth"],"pronunciation":"/ˈbis.mut/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bismut","accusative-definite-nominative":"bismutul","dative-genitive-indefinite":"bismut","dative-definite-genitive":"bismutului","vocative":"bismutule"}},{"word":"bismutat","pos":"noun","definitions":["bismuthate"],"forms":{"plural":"bismutați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bismutat","accusative-definite-nominative-singular":"bismutatul","accusative-indefinite-nominative-plural":"bismutați","accusative-definite-nominative-plural":"bismutații","dative-genitive-indefinite-singular":"bismutat","dative-definite-genitive-singular":"bismutatului","dative-genitive-indefinite-plural":"bismutați","dative-definite-genitive-plural":"bismutaților","singular-vocative":"bismutatule","plural-vocative":"bismutaților"}},{"word":"bismutil","pos":"noun","definitions":["bismuthyl"],"forms":{"plural":"bismutili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bismutil","accusative-definite-nominative-singular":"bismutilul","accusative-indefinite-nominative-plural":"bismutili","accusative-definite-nominative-plural":"bismutilii","dative-genitive-indefinite-singular":"bismutil","dative-definite-genitive-singular":"bismutilului","dative-genitive-indefinite-plural":"bismutili","dative-definite-genitive-plural":"bismutililor","singular-vocative":"bismutilule","plural-vocative":"bismutililor"}},{"word":"bismutină","pos":"noun","definitions":["bismuthine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bismutină","accusative-definite-nominative-singular":"bismutina","accusative-indefinite-nominative-plural":"bismutine","accusative-definite-nominative-plural":"bismutinele","dative-genitive-indefinite-singular":"bismutine","dative-definite-genitive-singular":"bismutinei","dative-genitive-indefinite-plural":"bismutine","dative-definite-genitive-plural":"bismutinelor","singular-vocative":"bismutină","plural-vocative":"bismutinelor"}},{"word":"bismutism","pos":"noun","definitions":["bismuthism"],"forms":{"plural":"bismutisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bismutism","accusative-definite-nominative-singular":"bismutismul","accusative-indefinite-nominative-plural":"bismutisme","accusative-definite-nominative-plural":"bismutismele","dative-genitive-indefinite-singular":"bismutism","dative-definite-genitive-singular":"bismutismului","dative-genitive-indefinite-plural":"bismutisme","dative-definite-genitive-plural":"bismutismelor","singular-vocative":"bismutismule","plural-vocative":"bismutismelor"}},{"word":"bismutit","pos":"noun","definitions":["bismuthite"],"forms":{"plural":"bismutite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bismutit","accusative-definite-nominative-singular":"bismutitul","accusative-indefinite-nominative-plural":"bismutite","accusative-definite-nominative-plural":"bismutitele","dative-genitive-indefinite-singular":"bismutit","dative-definite-genitive-singular":"bismutitului","dative-genitive-indefinite-plural":"bismutite","dative-definite-genitive-plural":"bismutitelor","singular-vocative":"bismutitule","plural-vocative":"bismutitelor"}},{"word":"bișniță","pos":"noun","definitions":["small-scale illegal business, swindle","ticket scalping, ticket resale"],"forms":{"plural":"bișnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bișniță","accusative-definite-nominative-singular":"bișnița","accusative-indefinite-nominative-plural":"bișnițe","accusative-definite-nominative-plural":"bișnițele","dative-genitive-indefinite-singular":"bișnițe","dative-definite-genitive-singular":"bișniței","dative-genitive-indefinite-plural":"bișnițe","dative-definite-genitive-plural":"bișnițelor","singular-vocative":"bișniță","plural-vocative":"bișnițelor"}},{"word":"bișnițar","pos":"noun","definitions":["scalper"],"forms":{"plural":"bișnițari","feminine":"equivalent bișnițară","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bișnițar","accusative-definite-nominative-singular":"bișnițarul","accusative-indefinite-nominative-plural":"bișnițari","accusative-definite-nominative-plural":"bișnițarii","dative-genitive-indefinite-singular":"bișnițar","dative-definite-genitive-singular":"bișnițarului","dative-genitive-indefinite-plural":"bișnițari","dative-definite-genitive-plural":"bișnițarilor","singular-vocative":"bișnițarule","plural-vocative":"bișnițarilor"}},{"word":"bișnițară","pos":"noun","definitions":["female equivalent of bișnițar"],"forms":{"plural":"bișnițare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bișnițară","accusative-definite-nominative-singular":"bișnițara","accusative-indefinite-nominative-plural":"bișnițare","accusative-definite-nominative-plural":"bișnițarele","dative-genitive-indefinite-singular":"bișnițare","dative-definite-genitive-singular":"bișnițarei","dative-genitive-indefinite-plural":"bișnițare","dative-definite-genitive-plural":"bișnițarelor","singular-vocative":"bișnițară","plural-vocative":"bișnițarelor"}},{"word":"Bisoca","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Bisoca, Buzău County, Romania"],"gender":"f"},{"word":"Bisoceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bisoceanu"}},{"word":"Bisocuța","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Plavățu"],"gender":"f"},{"word":"biștar","pos":"noun","definitions":["money"],"forms":{"plural":"biștari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"biștar","accusative-definite-nominative-singular":"biștarul","accusative-indefinite-nominative-plural":"biștari","accusative-definite-nominative-plural":"biștarii","dative-genitive-indefinite-singular":"biștar","dative-definite-genitive-singular":"biștarului","dative-genitive-indefinite-plural":"biștari","dative-definite-genitive-plural":"biștarilor","singular-vocative":"biștarule","plural-vocative":"biștarilor"}},{"word":"Bistra","pos":"name","definitions":["a commune of Alba County, Romania","a village in Bistra, Alba County, Romania","a village in Popești, Bihor County, Romania","a commune of Maramureș County, Romania","a village in Bistra, Maramureș County, Romania"],"gender":"f"},{"word":"Bistra Boului","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bistra"],"gender":"f"},{"word":"Bistra Mare","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bistra"],"gender":"f"},{"word":"Bistra Mărului","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bistra"],"gender":"f"},{"word":"Bistra Mică","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bistra"],"gender":"f"},{"word":"Bistra Mureșului","pos":"name","definitions":["a village in Deda, Mureș County, Romania"],"gender":"f"},{"word":"Bistra Orășenilor","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"f"},{"word":"Bistra Roșie","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bistra Mărului"],"gender":"f"},{"word":"Bistreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bistreanu"}},{"word":"Bistreț","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Bistreț, Dolj County, Romania"],"gender":"m"},{"word":"Bistrețu","pos":"name","definitions":["a village in Devesel, Mehedinți County, Romania"],"gender":"m"},{"word":"Bistrețu Nou","pos":"name","definitions":["a village in Bistreț, Dolj County, Romania"],"gender":"m"},{"word":"Bistriceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bistriceanu"}},{"word":"Bistricioara","pos":"name","definitions":["a village in Ceahlău, Neamț County, Romania"],"gender":"f"},{"word":"Bistrița","pos":"name","definitions":["a city in Bistrița-Năsăud County, Romania","a village in Hinova, Mehedinți County, Romania","a village in Alexandru cel Bun, Neamț County, Romania","a village in Costești, Vâlcea County, Romania"],"pronunciation":"/ˈbistrit͡sa/","gender":"f"},{"word":"Bistrița Bârgăului","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Bistrița Bârgăului, Bistrița-Năsăud County, Romania"],"gender":"f","forms":{"alternative":"Bistrița Bîrgăului"}},{"word":"Bistrița Nouă","pos":"name","definitions":["a village in Piatra-Olt, Olt County, Romania"],"gender":"f"},{"word":"Bistrița-Năsăud","pos":"name","definitions":["a county of Romania"],"pronunciation":"/ˈbistrit͡sa nəsəˈud/","gender":"n"},{"word":"Bistrițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bistrițan"}},{"word":"Bistrițean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bistrițean"}},{"word":"bistrițean","pos":"adj","definitions":["of, from or relating to Bistrița"],"forms":{"feminine-singular":"bistrițeană","masculine-plural":"bistrițeni","feminine-neuter-plural":"bistrițene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bistrițean","error-unrecognized-form-feminine-indefinite-singular":"bistrițeană","error-unrecognized-form-indefinite-masculine-plural":"bistrițeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bistrițene","definite-error-unrecognized-form-masculine-neuter-singular":"bistrițeanul","definite-error-unrecognized-form-feminine-singular":"bistrițeana","definite-error-unrecognized-form-masculine-plural":"bistrițenii","definite-error-unrecognized-form-feminine-neuter-plural":"bistrițenele"}},{"word":"bistrițean","pos":"noun","definitions":["native or inhabitant of Bistrița (usually male)"],"forms":{"plural":"bistrițeni","feminine":"equivalent bistrițeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bistrițean","accusative-definite-nominative-singular":"bistrițeanul","accusative-indefinite-nominative-plural":"bistrițeni","accusative-definite-nominative-plural":"bistrițenii","dative-genitive-indefinite-singular":"bistrițean","dative-definite-genitive-singular":"bistrițeanului","dative-genitive-indefinite-plural":"bistrițeni","dative-definite-genitive-plural":"bistrițenilor","singular-vocative":"bistrițeanule","plural-vocative":"bistrițenilor"}},{"word":"bistrițeană","pos":"noun","definitions":["female equivalent of bistrițean"],"forms":{"plural":"bistrițene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bistrițeană","accusative-definite-nominative-singular":"bistrițeana","accusative-indefinite-nominative-plural":"bistrițene","accusative-definite-nominative-plural":"bistrițenele","dative-genitive-indefinite-singular":"bistrițene","dative-definite-genitive-singular":"bistrițenei","dative-genitive-indefinite-plural":"bistrițene","dative-definite-genitive-plural":"bistrițenelor","singular-vocative":"bistrițeană","plural-vocative":"bistrițenelor"}},{"word":"bistrițeancă","pos":"noun","definitions":["female equivalent of bistrițean"],"forms":{"plural":"bistrițence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bistrițeancă","accusative-definite-nominative-singular":"bistrițeanca","accusative-indefinite-nominative-plural":"bistrițence","accusative-definite-nominative-plural":"bistrițencele","dative-genitive-indefinite-singular":"bistrițence","dative-definite-genitive-singular":"bistrițencei","dative-genitive-indefinite-plural":"bistrițence","dative-definite-genitive-plural":"bistrițencelor","singular-vocative":"bistrițeancă","plural-vocative":"bistrițencelor"}},{"word":"Bistrițeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bistrițeanu"}},{"word":"bistro","pos":"noun","definitions":["alternative form of bistrou"],"forms":{"plural":"bistrouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bistro","accusative-definite-nominative-singular":"bistroul","accusative-indefinite-nominative-plural":"bistrouri","accusative-definite-nominative-plural":"bistrourile","dative-genitive-indefinite-singular":"bistro","dative-definite-genitive-singular":"bistroului","dative-genitive-indefinite-plural":"bistrouri","dative-definite-genitive-plural":"bistrourilor","singular-vocative":"bistroule","plural-vocative":"bistrourilor"}},{"word":"Bîstroe","pos":"name","definitions":["Bystroye (a canal in Ukraine)"],"gender":"n","forms":{"alternative":"Bâstroe"}},{"word":"bistrou","pos":"noun","definitions":["bistro"],"forms":{"plural":"bistrouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bistrou","accusative-definite-nominative-singular":"bistroul","accusative-indefinite-nominative-plural":"bistrouri","accusative-definite-nominative-plural":"bistrourile","dative-genitive-indefinite-singular":"bistrou","dative-definite-genitive-singular":"bistroului","dative-genitive-indefinite-plural":"bistrouri","dative-definite-genitive-plural":"bistrourilor","singular-vocative":"bistroule","plural-vocative":"bistrourilor"}},{"word":"bisturiu","pos":"noun","definitions":["scalpel, bistoury"],"pronunciation":"/bis.tuˈri.u/","forms":{"plural":"bisturie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bisturiu","accusative-definite-nominative-singular":"bisturiul","accusative-indefinite-nominative-plural":"bisturie","accusative-definite-nominative-plural":"bisturiele","dative-genitive-indefinite-singular":"bisturiu","dative-definite-genitive-singular":"bisturiului","dative-genitive-indefinite-plural":"bisturie","dative-definite-genitive-plural":"bisturielor","singular-vocative":"bisturiule","plural-vocative":"bisturielor"}},{"word":"bisulc","pos":"adj","definitions":["cloven (animal hoofs)"],"forms":{"feminine-singular":"bisulcă","masculine-plural":"bisulci","feminine-neuter-plural":"bisulce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bisulc","error-unrecognized-form-feminine-indefinite-singular":"bisulcă","error-unrecognized-form-indefinite-masculine-plural":"bisulci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bisulce","definite-error-unrecognized-form-masculine-neuter-singular":"bisulcul","definite-error-unrecognized-form-feminine-singular":"bisulca","definite-error-unrecognized-form-masculine-plural":"bisulcii","definite-error-unrecognized-form-feminine-neuter-plural":"bisulcele"}},{"word":"bisulfat","pos":"noun","definitions":["bisulfate"],"forms":{"plural":"bisulfați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bisulfat","accusative-definite-nominative-singular":"bisulfatul","accusative-indefinite-nominative-plural":"bisulfați","accusative-definite-nominative-plural":"bisulfații","dative-genitive-indefinite-singular":"bisulfat","dative-definite-genitive-singular":"bisulfatului","dative-genitive-indefinite-plural":"bisulfați","dative-definite-genitive-plural":"bisulfaților","singular-vocative":"bisulfatule","plural-vocative":"bisulfaților"}},{"word":"bisulfit","pos":"noun","definitions":["bisulfite"],"forms":{"plural":"bisulfiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bisulfit","accusative-definite-nominative-singular":"bisulfitul","accusative-indefinite-nominative-plural":"bisulfiți","accusative-definite-nominative-plural":"bisulfiții","dative-genitive-indefinite-singular":"bisulfit","dative-definite-genitive-singular":"bisulfitului","dative-genitive-indefinite-plural":"bisulfiți","dative-definite-genitive-plural":"bisulfiților","singular-vocative":"bisulfitule","plural-vocative":"bisulfiților"}},{"word":"bisulfură","pos":"noun","definitions":["disulfide"],"forms":{"plural":"bisulfuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bisulfură","accusative-definite-nominative-singular":"bisulfura","accusative-indefinite-nominative-plural":"bisulfuri","accusative-definite-nominative-plural":"bisulfurile","dative-genitive-indefinite-singular":"bisulfuri","dative-definite-genitive-singular":"bisulfurii","dative-genitive-indefinite-plural":"bisulfuri","dative-definite-genitive-plural":"bisulfurilor","singular-vocative":"bisulfură","plural-vocative":"bisulfurilor"}},{"word":"bit","pos":"noun","definitions":["bit"],"forms":{"plural":"biți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bit","accusative-definite-nominative-singular":"bitul","accusative-indefinite-nominative-plural":"biți","accusative-definite-nominative-plural":"biții","dative-genitive-indefinite-singular":"bit","dative-definite-genitive-singular":"bitului","dative-genitive-indefinite-plural":"biți","dative-definite-genitive-plural":"biților","singular-vocative":"bitule","plural-vocative":"biților"}},{"word":"Bita","pos":"name","definitions":["a village in Reci, Covasna County, Romania"],"gender":"f"},{"word":"biță","pos":"noun","definitions":["alternative form of bădiță"],"forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"biță","accusative-definite-nominative":"bița","dative-genitive-indefinite":"biță","dative-definite-genitive":"biței","vocative":"biță"}},{"word":"Bîtă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîtă"}},{"word":"Bițan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bițan"}},{"word":"Bitănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bitănescu"}},{"word":"Bitang","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bitang"}},{"word":"bitang","pos":"noun","definitions":["bastard, illegitimate child"],"forms":{"plural":"bitangi","feminine":"equivalent bitangă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bitang","accusative-definite-nominative-singular":"bitangul","accusative-indefinite-nominative-plural":"bitangi","accusative-definite-nominative-plural":"bitangii","dative-genitive-indefinite-singular":"bitang","dative-definite-genitive-singular":"bitangului","dative-genitive-indefinite-plural":"bitangi","dative-definite-genitive-plural":"bitangilor","singular-vocative":"bitangule","plural-vocative":"bitangilor"}},{"word":"bitangă","pos":"noun","definitions":["female equivalent of bitang"],"forms":{"plural":"bitange","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bitangă","accusative-definite-nominative-singular":"bitanga","accusative-indefinite-nominative-plural":"bitange","accusative-definite-nominative-plural":"bitangele","dative-genitive-indefinite-singular":"bitange","dative-definite-genitive-singular":"bitangei","dative-genitive-indefinite-plural":"bitange","dative-definite-genitive-plural":"bitangelor","singular-vocative":"bitangă","plural-vocative":"bitangelor"}},{"word":"bitcoin","pos":"noun","definitions":["bitcoin"],"pronunciation":"/ˈbit.kojn/","forms":{"plural":"bitcoini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bitcoin","accusative-definite-nominative-singular":"bitcoinul","accusative-indefinite-nominative-plural":"bitcoini","accusative-definite-nominative-plural":"bitcoinii","dative-genitive-indefinite-singular":"bitcoin","dative-definite-genitive-singular":"bitcoinului","dative-genitive-indefinite-plural":"bitcoini","dative-definite-genitive-plural":"bitcoinilor","singular-vocative":"bitcoinule","plural-vocative":"bitcoinilor"}},{"word":"biter","pos":"noun","definitions":["bitters"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"biter","accusative-definite-nominative":"biterul","dative-genitive-indefinite":"biter","dative-definite-genitive":"biterului","vocative":"biterule"}},{"word":"Bițică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bițică"}},{"word":"Bițina-Pământeni","pos":"name","definitions":["a village in Movilița, Ialomița County, Romania"],"gender":"f","forms":{"alternative":"Bițina-Pămînteni"}},{"word":"Bițina-Ungureni","pos":"name","definitions":["a village in Movilița, Ialomița County, Romania"],"gender":"f"},{"word":"Bîtlan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîtlan"}},{"word":"bîtlan","pos":"noun","definitions":["Formerly standard spelling of bâtlan which was introduced in 1953 and deprecated in 1993."],"forms":{"plural":"bîtlani"}},{"word":"Bițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bițoiu"}},{"word":"Bitoleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bitoleanu"}},{"word":"bitonalism","pos":"noun","definitions":["bitonalism"],"forms":{"plural":"bitonalisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bitonalism","accusative-definite-nominative-singular":"bitonalismul","accusative-indefinite-nominative-plural":"bitonalisme","accusative-definite-nominative-plural":"bitonalismele","dative-genitive-indefinite-singular":"bitonalism","dative-definite-genitive-singular":"bitonalismului","dative-genitive-indefinite-plural":"bitonalisme","dative-definite-genitive-plural":"bitonalismelor","singular-vocative":"bitonalismule","plural-vocative":"bitonalismelor"}},{"word":"bitonalitate","pos":"noun","definitions":["bitonality"],"forms":{"plural":"bitonalitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bitonalitate","accusative-definite-nominative-singular":"bitonalitatea","accusative-indefinite-nominative-plural":"bitonalitatăți","accusative-definite-nominative-plural":"bitonalitatățile","dative-genitive-indefinite-singular":"bitonalitatăți","dative-definite-genitive-singular":"bitonalitatății","dative-genitive-indefinite-plural":"bitonalitatăți","dative-definite-genitive-plural":"bitonalitatăților","singular-vocative":"bitonalitate","plural-vocative":"bitonalitatăților"}},{"word":"bitum","pos":"noun","definitions":["bitumen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bitum","accusative-definite-nominative":"bitumul","dative-genitive-indefinite":"bitum","dative-definite-genitive":"bitumului","vocative":"bitumule"}},{"word":"bituma","pos":"verb","definitions":["to asphalt"],"forms":{"canonical":"a bituma 1st conjugation","present-singular-third-person":"bitumează","participle-past":"bitumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bituma","gerund":"bitumând","first-person-indicative-present-singular":"bitumez","indicative-present-second-person-singular":"bitumezi","indicative-present-singular-third-person":"bitumează","first-person-indicative-plural-present":"bitumăm","indicative-plural-present-second-person":"bitumați","indicative-plural-present-third-person":"bitumează","first-person-imperfect-indicative-singular":"bitumam","imperfect-indicative-second-person-singular":"bitumai","imperfect-indicative-singular-third-person":"bituma","first-person-imperfect-indicative-plural":"bitumam","imperfect-indicative-plural-second-person":"bitumați","imperfect-indicative-plural-third-person":"bitumau","first-person-indicative-perfect-singular":"bitumai","indicative-perfect-second-person-singular":"bitumași","indicative-perfect-singular-third-person":"bitumă","first-person-indicative-perfect-plural":"bitumarăm","indicative-perfect-plural-second-person":"bitumarăți","indicative-perfect-plural-third-person":"bitumară","first-person-indicative-pluperfect-singular":"bitumasem","indicative-pluperfect-second-person-singular":"bitumaseși","indicative-pluperfect-singular-third-person":"bitumase","first-person-indicative-pluperfect-plural":"bitumaserăm","indicative-pluperfect-plural-second-person":"bitumaserăți","indicative-pluperfect-plural-third-person":"bitumaseră","first-person-present-singular-subjunctive":"să bitumez","present-second-person-singular-subjunctive":"să bitumezi","present-singular-subjunctive-third-person":"să bitumeze","first-person-plural-present-subjunctive":"să bitumăm","plural-present-second-person-subjunctive":"să bitumați","plural-present-subjunctive-third-person":"să bitumeze","imperative-second-person-singular":"bitumează","imperative-plural-second-person":"bitumați","imperative-negative-second-person-singular":"nu bituma","imperative-negative-plural-second-person":"nu bitumați"}},{"word":"bitumaj","pos":"noun","definitions":["asphalting"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bitumaj","accusative-definite-nominative":"bitumajul","dative-genitive-indefinite":"bitumaj","dative-definite-genitive":"bitumajului","vocative":"bitumajule"}},{"word":"bitumare","pos":"noun","definitions":["asphalting"],"forms":{"plural":"bitumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bitumare","accusative-definite-nominative-singular":"bitumarea","accusative-indefinite-nominative-plural":"bitumări","accusative-definite-nominative-plural":"bitumările","dative-genitive-indefinite-singular":"bitumări","dative-definite-genitive-singular":"bitumării","dative-genitive-indefinite-plural":"bitumări","dative-definite-genitive-plural":"bitumărilor","singular-vocative":"bitumare","plural-vocative":"bitumărilor"}},{"word":"bitumen","pos":"noun","definitions":["bitumen"],"pronunciation":"/biˈtu.men/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bitumen","accusative-definite-nominative":"bitumenul","dative-genitive-indefinite":"bitumen","dative-definite-genitive":"bitumenului","vocative":"bitumenule"}},{"word":"bituminifer","pos":"adj","definitions":["bituminiferous"],"forms":{"feminine-singular":"bituminiferă","masculine-plural":"bituminiferi","feminine-neuter-plural":"bituminifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bituminifer","error-unrecognized-form-feminine-indefinite-singular":"bituminiferă","error-unrecognized-form-indefinite-masculine-plural":"bituminiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bituminifere","definite-error-unrecognized-form-masculine-neuter-singular":"bituminiferul","definite-error-unrecognized-form-feminine-singular":"bituminifera","definite-error-unrecognized-form-masculine-plural":"bituminiferii","definite-error-unrecognized-form-feminine-neuter-plural":"bituminiferele"}},{"word":"bituminizare","pos":"noun","definitions":["bituminization"],"forms":{"plural":"bituminizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bituminizare","accusative-definite-nominative-singular":"bituminizarea","accusative-indefinite-nominative-plural":"bituminizări","accusative-definite-nominative-plural":"bituminizările","dative-genitive-indefinite-singular":"bituminizări","dative-definite-genitive-singular":"bituminizării","dative-genitive-indefinite-plural":"bituminizări","dative-definite-genitive-plural":"bituminizărilor","singular-vocative":"bituminizare","plural-vocative":"bituminizărilor"}},{"word":"bituminos","pos":"adj","definitions":["bituminous"],"pronunciation":"/bi.tu.miˈnos/","forms":{"feminine-singular":"bituminoasă","masculine-plural":"bituminoși","feminine-neuter-plural":"bituminoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bituminos","error-unrecognized-form-feminine-indefinite-singular":"bituminoasă","error-unrecognized-form-indefinite-masculine-plural":"bituminoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bituminoase","definite-error-unrecognized-form-masculine-neuter-singular":"bituminosul","definite-error-unrecognized-form-feminine-singular":"bituminoasa","definite-error-unrecognized-form-masculine-plural":"bituminoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bituminoasele"}},{"word":"Biucavăș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Pârâul cu Fagi"],"gender":"m"},{"word":"Biulbiul-Mare","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Ciocârlia de Sus."],"gender":"m"},{"word":"Biulbiul-Mic","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Ciocârlia de Jos."],"gender":"m"},{"word":"biunivoc","pos":"adj","definitions":["biunivocal, bijective"],"forms":{"feminine-singular":"biunivocă","masculine-plural":"biunivoci","feminine-neuter-plural":"biunivoce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biunivoc","error-unrecognized-form-feminine-indefinite-singular":"biunivocă","error-unrecognized-form-indefinite-masculine-plural":"biunivoci","error-unrecognized-form-feminine-indefinite-neuter-plural":"biunivoce","definite-error-unrecognized-form-masculine-neuter-singular":"biunivocul","definite-error-unrecognized-form-feminine-singular":"biunivoca","definite-error-unrecognized-form-masculine-plural":"biunivocii","definite-error-unrecognized-form-feminine-neuter-plural":"biunivocele"}},{"word":"biunivocitate","pos":"noun","definitions":["bijection"],"forms":{"plural":"biunivocitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"biunivocitate","accusative-definite-nominative-singular":"biunivocitatea","accusative-indefinite-nominative-plural":"biunivocitatăți","accusative-definite-nominative-plural":"biunivocitatățile","dative-genitive-indefinite-singular":"biunivocitatăți","dative-definite-genitive-singular":"biunivocitatății","dative-genitive-indefinite-plural":"biunivocitatăți","dative-definite-genitive-plural":"biunivocitatăților","singular-vocative":"biunivocitate","plural-vocative":"biunivocitatăților"}},{"word":"biuretă","pos":"noun","definitions":["burette"],"forms":{"plural":"biurete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"biuretă","accusative-definite-nominative-singular":"biureta","accusative-indefinite-nominative-plural":"biurete","accusative-definite-nominative-plural":"biuretele","dative-genitive-indefinite-singular":"biurete","dative-definite-genitive-singular":"biuretei","dative-genitive-indefinite-plural":"biurete","dative-definite-genitive-plural":"biuretelor","singular-vocative":"biuretă","plural-vocative":"biuretelor"}},{"word":"biurocratic","pos":"adj","definitions":["obsolete form of birocratic"],"forms":{"feminine-singular":"biurocratică","masculine-plural":"biurocratici","feminine-neuter-plural":"biurocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biurocratic","error-unrecognized-form-feminine-indefinite-singular":"biurocratică","error-unrecognized-form-indefinite-masculine-plural":"biurocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"biurocratice","definite-error-unrecognized-form-masculine-neuter-singular":"biurocraticul","definite-error-unrecognized-form-feminine-singular":"biurocratica","definite-error-unrecognized-form-masculine-plural":"biurocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"biurocraticele"}},{"word":"biurocrație","pos":"noun","definitions":["obsolete form of birocrație"],"forms":{"plural":"biurocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"biurocrație","accusative-definite-nominative-singular":"biurocrația","accusative-indefinite-nominative-plural":"biurocrații","accusative-definite-nominative-plural":"biurocrațiile","dative-genitive-indefinite-singular":"biurocrații","dative-definite-genitive-singular":"biurocrației","dative-genitive-indefinite-plural":"biurocrații","dative-definite-genitive-plural":"biurocrațiilor","singular-vocative":"biurocrație","plural-vocative":"biurocrațiilor"}},{"word":"biurou","pos":"noun","definitions":["obsolete form of birou"],"forms":{"plural":"biurouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"biurou","accusative-definite-nominative-singular":"biurouul","accusative-indefinite-nominative-plural":"biurouri","accusative-definite-nominative-plural":"biurourile","dative-genitive-indefinite-singular":"biurou","dative-definite-genitive-singular":"biurouului","dative-genitive-indefinite-plural":"biurouri","dative-definite-genitive-plural":"biurourilor","singular-vocative":"biurouule","plural-vocative":"biurourilor"}},{"word":"Biușa","pos":"name","definitions":["a village in Benesat, Sălaj County, Romania"],"gender":"f"},{"word":"biv","pos":"adj","definitions":["ex-, former (preceding a medieval rank in Wallachia or Moldavia)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"biv","error-unrecognized-form-feminine-indefinite-singular":"biv","error-unrecognized-form-indefinite-masculine-plural":"biv","error-unrecognized-form-feminine-indefinite-neuter-plural":"biv","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"bivalent","pos":"adj","definitions":["bivalent"],"pronunciation":"/bi.vaˈlent/","forms":{"feminine-singular":"bivalentă","masculine-plural":"bivalenți","feminine-neuter-plural":"bivalente","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bivalent","error-unrecognized-form-feminine-indefinite-singular":"bivalentă","error-unrecognized-form-indefinite-masculine-plural":"bivalenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bivalente","definite-error-unrecognized-form-masculine-neuter-singular":"bivalentul","definite-error-unrecognized-form-feminine-singular":"bivalenta","definite-error-unrecognized-form-masculine-plural":"bivalenții","definite-error-unrecognized-form-feminine-neuter-plural":"bivalentele"}},{"word":"bivalență","pos":"noun","definitions":["bivalence"],"forms":{"plural":"bivalențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bivalență","accusative-definite-nominative-singular":"bivalența","accusative-indefinite-nominative-plural":"bivalențe","accusative-definite-nominative-plural":"bivalențele","dative-genitive-indefinite-singular":"bivalențe","dative-definite-genitive-singular":"bivalenței","dative-genitive-indefinite-plural":"bivalențe","dative-definite-genitive-plural":"bivalențelor","singular-vocative":"bivalență","plural-vocative":"bivalențelor"}},{"word":"bivalv","pos":"adj","definitions":["bivalve"],"forms":{"feminine-singular":"bivalvă","masculine-plural":"bivalvi","feminine-neuter-plural":"bivalve","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bivalv","error-unrecognized-form-feminine-indefinite-singular":"bivalvă","error-unrecognized-form-indefinite-masculine-plural":"bivalvi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bivalve","definite-error-unrecognized-form-masculine-neuter-singular":"bivalvul","definite-error-unrecognized-form-feminine-singular":"bivalva","definite-error-unrecognized-form-masculine-plural":"bivalvii","definite-error-unrecognized-form-feminine-neuter-plural":"bivalvele"}},{"word":"Bivol","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bivol"}},{"word":"bivol","pos":"noun","definitions":["buffalo"],"forms":{"plural":"bivoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bivol","accusative-definite-nominative-singular":"bivolul","accusative-indefinite-nominative-plural":"bivoli","accusative-definite-nominative-plural":"bivolii","dative-genitive-indefinite-singular":"bivol","dative-definite-genitive-singular":"bivolului","dative-genitive-indefinite-plural":"bivoli","dative-definite-genitive-plural":"bivolilor","singular-vocative":"bivolule","plural-vocative":"bivolilor"}},{"word":"bivol african","pos":"noun","definitions":["African buffalo (Syncerus caffer)"],"forms":{"plural":"bivoli africani"}},{"word":"bivol indian","pos":"noun","definitions":["water buffalo (Bubalus bubalus)"],"forms":{"plural":"bivoli indieni"}},{"word":"bivolă","pos":"noun","definitions":["female buffalo"],"forms":{"plural":"bivole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bivolă","accusative-definite-nominative-singular":"bivola","accusative-indefinite-nominative-plural":"bivole","accusative-definite-nominative-plural":"bivolele","dative-genitive-indefinite-singular":"bivole","dative-definite-genitive-singular":"bivolei","dative-genitive-indefinite-plural":"bivole","dative-definite-genitive-plural":"bivolelor","singular-vocative":"bivolă","plural-vocative":"bivolelor"}},{"word":"Bivolan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bivolan"}},{"word":"bivolar","pos":"noun","definitions":["a person who tends a water buffalo herd"],"forms":{"plural":"bivolari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bivolar","accusative-definite-nominative-singular":"bivolarul","accusative-indefinite-nominative-plural":"bivolari","accusative-definite-nominative-plural":"bivolarii","dative-genitive-indefinite-singular":"bivolar","dative-definite-genitive-singular":"bivolarului","dative-genitive-indefinite-plural":"bivolari","dative-definite-genitive-plural":"bivolarilor","singular-vocative":"bivolarule","plural-vocative":"bivolarilor"}},{"word":"Bivolari","pos":"name","definitions":["a village in Dobârceni, Botoșani County, Romania","a commune of Iași County, Romania","a village in Bivolari, Iași County, Romania"],"gender":"m"},{"word":"bivolari","pos":"noun","definitions":["plural of bivolar"]},{"word":"Bivolăria","pos":"name","definitions":["a locality in Vicovu de Sus, Suceava County, Romania"],"gender":"f"},{"word":"bivolărie","pos":"noun","definitions":["buffalo farm"],"forms":{"plural":"bivolării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bivolărie","accusative-definite-nominative-singular":"bivolăria","accusative-indefinite-nominative-plural":"bivolării","accusative-definite-nominative-plural":"bivolăriile","dative-genitive-indefinite-singular":"bivolării","dative-definite-genitive-singular":"bivolăriei","dative-genitive-indefinite-plural":"bivolării","dative-definite-genitive-plural":"bivolăriilor","singular-vocative":"bivolărie","plural-vocative":"bivolăriilor"}},{"word":"Bivolariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bivolariu"}},{"word":"Bivolaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bivolaru"}},{"word":"bivolaș","pos":"noun","definitions":["diminutive of bivol"],"forms":{"plural":"bivolași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bivolaș","accusative-definite-nominative-singular":"bivolașul","accusative-indefinite-nominative-plural":"bivolași","accusative-definite-nominative-plural":"bivolașii","dative-genitive-indefinite-singular":"bivolaș","dative-definite-genitive-singular":"bivolașului","dative-genitive-indefinite-plural":"bivolași","dative-definite-genitive-plural":"bivolașilor","singular-vocative":"bivolașule","plural-vocative":"bivolașilor"}},{"word":"bivolesc","pos":"adj","definitions":["buffalo-like"],"forms":{"feminine-singular":"bivolească","plural":"bivolești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bivolesc","error-unrecognized-form-feminine-indefinite-singular":"bivolească","error-unrecognized-form-indefinite-masculine-plural":"bivolești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bivolești","definite-error-unrecognized-form-masculine-neuter-singular":"bivolescul","definite-error-unrecognized-form-feminine-singular":"bivoleasca","definite-error-unrecognized-form-masculine-plural":"bivoleștii","definite-error-unrecognized-form-feminine-neuter-plural":"bivoleștile"}},{"word":"bivoli","pos":"noun","definitions":["plural of bivol"],"gender":"m"},{"word":"bivoliță","pos":"noun","definitions":["female buffalo"],"forms":{"plural":"bivolițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bivoliță","accusative-definite-nominative-singular":"bivolița","accusative-indefinite-nominative-plural":"bivolițe","accusative-definite-nominative-plural":"bivolițele","dative-genitive-indefinite-singular":"bivolițe","dative-definite-genitive-singular":"bivoliței","dative-genitive-indefinite-plural":"bivolițe","dative-definite-genitive-plural":"bivolițelor","singular-vocative":"bivoliță","plural-vocative":"bivolițelor"}},{"word":"bivoltin","pos":"adj","definitions":["bivoltine"],"forms":{"feminine-singular":"bivoltină","masculine-plural":"bivoltini","feminine-neuter-plural":"bivoltine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bivoltin","error-unrecognized-form-feminine-indefinite-singular":"bivoltină","error-unrecognized-form-indefinite-masculine-plural":"bivoltini","error-unrecognized-form-feminine-indefinite-neuter-plural":"bivoltine","definite-error-unrecognized-form-masculine-neuter-singular":"bivoltinul","definite-error-unrecognized-form-feminine-singular":"bivoltina","definite-error-unrecognized-form-masculine-plural":"bivoltinii","definite-error-unrecognized-form-feminine-neuter-plural":"bivoltinele"}},{"word":"Bivolu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bivolu"}},{"word":"Bivolu Mare","pos":"name","definitions":["a village in Botoșani County, Romania. Renamed to Viișoara in 1964."],"gender":"m"},{"word":"Bivolu Mic","pos":"name","definitions":["a village in Botoșani County, Romania. Renamed to Viișoara Mică in 1964."],"gender":"m"},{"word":"bivuac","pos":"noun","definitions":["bivouac"],"forms":{"plural":"bivuacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bivuac","accusative-definite-nominative-singular":"bivuacul","accusative-indefinite-nominative-plural":"bivuacuri","accusative-definite-nominative-plural":"bivuacurile","dative-genitive-indefinite-singular":"bivuac","dative-definite-genitive-singular":"bivuacului","dative-genitive-indefinite-plural":"bivuacuri","dative-definite-genitive-plural":"bivuacurilor","singular-vocative":"bivuacule","plural-vocative":"bivuacurilor"}},{"word":"bivuaca","pos":"verb","definitions":["to bivouac"],"forms":{"canonical":"a bivuaca 1st conjugation","present-singular-third-person":"bivuachează","participle-past":"bivuacat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bivuaca","gerund":"bivuacând","first-person-indicative-present-singular":"bivuachez","indicative-present-second-person-singular":"bivuachezi","indicative-present-singular-third-person":"bivuachează","first-person-indicative-plural-present":"bivuacăm","indicative-plural-present-second-person":"bivuacați","indicative-plural-present-third-person":"bivuachează","first-person-imperfect-indicative-singular":"bivuacam","imperfect-indicative-second-person-singular":"bivuacai","imperfect-indicative-singular-third-person":"bivuaca","first-person-imperfect-indicative-plural":"bivuacam","imperfect-indicative-plural-second-person":"bivuacați","imperfect-indicative-plural-third-person":"bivuacau","first-person-indicative-perfect-singular":"bivuacai","indicative-perfect-second-person-singular":"bivuacași","indicative-perfect-singular-third-person":"bivuacă","first-person-indicative-perfect-plural":"bivuacarăm","indicative-perfect-plural-second-person":"bivuacarăți","indicative-perfect-plural-third-person":"bivuacară","first-person-indicative-pluperfect-singular":"bivuacasem","indicative-pluperfect-second-person-singular":"bivuacaseși","indicative-pluperfect-singular-third-person":"bivuacase","first-person-indicative-pluperfect-plural":"bivuacaserăm","indicative-pluperfect-plural-second-person":"bivuacaserăți","indicative-pluperfect-plural-third-person":"bivuacaseră","first-person-present-singular-subjunctive":"să bivuachez","present-second-person-singular-subjunctive":"să bivuachezi","present-singular-subjunctive-third-person":"să bivuacheze","first-person-plural-present-subjunctive":"să bivuacăm","plural-present-second-person-subjunctive":"să bivuacați","plural-present-subjunctive-third-person":"să bivuacheze","imperative-second-person-singular":"bivuachează","imperative-plural-second-person":"bivuacați","imperative-negative-second-person-singular":"nu bivuaca","imperative-negative-plural-second-person":"nu bivuacați"}},{"word":"bix","pos":"noun","definitions":["cigarette stump"],"forms":{"plural":"bixuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bix","accusative-definite-nominative-singular":"bixul","accusative-indefinite-nominative-plural":"bixuri","accusative-definite-nominative-plural":"bixurile","dative-genitive-indefinite-singular":"bix","dative-definite-genitive-singular":"bixului","dative-genitive-indefinite-plural":"bixuri","dative-definite-genitive-plural":"bixurilor","singular-vocative":"bixule","plural-vocative":"bixurilor"}},{"word":"Bixad","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Bixad, Covasna County, Romania","a commune of Satu Mare County, Romania","a village in Bixad, Satu Mare County, Romania"],"gender":"f"},{"word":"bizam","pos":"noun","definitions":["muskrat"],"forms":{"plural":"bizami","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bizam","accusative-definite-nominative-singular":"bizamul","accusative-indefinite-nominative-plural":"bizami","accusative-definite-nominative-plural":"bizamii","dative-genitive-indefinite-singular":"bizam","dative-definite-genitive-singular":"bizamului","dative-genitive-indefinite-plural":"bizami","dative-definite-genitive-plural":"bizamilor","singular-vocative":"bizamule","plural-vocative":"bizamilor"}},{"word":"Bizanț","pos":"name","definitions":["Byzantium (an ancient Greek city situated on the Bosporus in modern Turkey, renamed Constantinople in 330 C.E.; modern Istanbul)"],"gender":"n","forms":{"alternative":"Bizanțiu"}},{"word":"bizantin","pos":"adj","definitions":["Byzantine"],"forms":{"feminine-singular":"bizantină","masculine-plural":"bizantini","feminine-neuter-plural":"bizantine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bizantin","error-unrecognized-form-feminine-indefinite-singular":"bizantină","error-unrecognized-form-indefinite-masculine-plural":"bizantini","error-unrecognized-form-feminine-indefinite-neuter-plural":"bizantine","definite-error-unrecognized-form-masculine-neuter-singular":"bizantinul","definite-error-unrecognized-form-feminine-singular":"bizantina","definite-error-unrecognized-form-masculine-plural":"bizantinii","definite-error-unrecognized-form-feminine-neuter-plural":"bizantinele"}},{"word":"bizantină","pos":"noun","definitions":["female equivalent of bizantin"],"forms":{"plural":"bizantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bizantină","accusative-definite-nominative-singular":"bizantina","accusative-indefinite-nominative-plural":"bizantine","accusative-definite-nominative-plural":"bizantinele","dative-genitive-indefinite-singular":"bizantine","dative-definite-genitive-singular":"bizantinei","dative-genitive-indefinite-plural":"bizantine","dative-definite-genitive-plural":"bizantinelor","singular-vocative":"bizantină","plural-vocative":"bizantinelor"}},{"word":"bizantinism","pos":"noun","definitions":["tendency to adopt overcomplicated solutions."],"forms":{"plural":"bizantinisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bizantinism","accusative-definite-nominative-singular":"bizantinismul","accusative-indefinite-nominative-plural":"bizantinisme","accusative-definite-nominative-plural":"bizantinismele","dative-genitive-indefinite-singular":"bizantinism","dative-definite-genitive-singular":"bizantinismului","dative-genitive-indefinite-plural":"bizantinisme","dative-definite-genitive-plural":"bizantinismelor","singular-vocative":"bizantinismule","plural-vocative":"bizantinismelor"}},{"word":"bizantinist","pos":"noun","definitions":["Byzantinist"],"forms":{"plural":"bizantiniști","feminine":"equivalent bizantinistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bizantinist","accusative-definite-nominative-singular":"bizantinistul","accusative-indefinite-nominative-plural":"bizantiniști","accusative-definite-nominative-plural":"bizantiniștii","dative-genitive-indefinite-singular":"bizantinist","dative-definite-genitive-singular":"bizantinistului","dative-genitive-indefinite-plural":"bizantiniști","dative-definite-genitive-plural":"bizantiniștilor","singular-vocative":"bizantinistule","plural-vocative":"bizantiniștilor"}},{"word":"bizantinistă","pos":"noun","definitions":["female equivalent of bizantinist"],"forms":{"plural":"bizantiniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bizantinistă","accusative-definite-nominative-singular":"bizantinista","accusative-indefinite-nominative-plural":"bizantiniste","accusative-definite-nominative-plural":"bizantinistele","dative-genitive-indefinite-singular":"bizantiniste","dative-definite-genitive-singular":"bizantinistei","dative-genitive-indefinite-plural":"bizantiniste","dative-definite-genitive-plural":"bizantinistelor","singular-vocative":"bizantinistă","plural-vocative":"bizantinistelor"}},{"word":"bizantinistică","pos":"noun","definitions":["Byzantine studies"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bizantinistică","accusative-definite-nominative":"bizantinistica","dative-genitive-indefinite":"bizantinistice","dative-definite-genitive":"bizantinisticei","vocative":"bizantinistică"}},{"word":"bizantinolog","pos":"noun","definitions":["Byzantinologist"],"forms":{"plural":"bizantinologi","feminine":"equivalent bizantinologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bizantinolog","accusative-definite-nominative-singular":"bizantinologul","accusative-indefinite-nominative-plural":"bizantinologi","accusative-definite-nominative-plural":"bizantinologii","dative-genitive-indefinite-singular":"bizantinolog","dative-definite-genitive-singular":"bizantinologului","dative-genitive-indefinite-plural":"bizantinologi","dative-definite-genitive-plural":"bizantinologilor","singular-vocative":"bizantinologule","plural-vocative":"bizantinologilor"}},{"word":"bizantinologă","pos":"noun","definitions":["female equivalent of bizantinolog"],"forms":{"plural":"bizantinologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bizantinologă","accusative-definite-nominative-singular":"bizantinologa","accusative-indefinite-nominative-plural":"bizantinologe","accusative-definite-nominative-plural":"bizantinologele","dative-genitive-indefinite-singular":"bizantinologe","dative-definite-genitive-singular":"bizantinologei","dative-genitive-indefinite-plural":"bizantinologe","dative-definite-genitive-plural":"bizantinologelor","singular-vocative":"bizantinologă","plural-vocative":"bizantinologelor"}},{"word":"bizantinologie","pos":"noun","definitions":["Byzantinology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bizantinologie","accusative-definite-nominative-singular":"bizantinologia","accusative-indefinite-nominative-plural":"bizantinologii","accusative-definite-nominative-plural":"bizantinologiile","dative-genitive-indefinite-singular":"bizantinologii","dative-definite-genitive-singular":"bizantinologiei","dative-genitive-indefinite-plural":"bizantinologii","dative-definite-genitive-plural":"bizantinologiilor","singular-vocative":"bizantinologie","plural-vocative":"bizantinologiilor"}},{"word":"Bizanțiu","pos":"name","definitions":["alternative form of Bizanț"],"gender":"n"},{"word":"bizar","pos":"adj","definitions":["bizarre"],"forms":{"feminine-singular":"bizară","masculine-plural":"bizari","feminine-neuter-plural":"bizare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bizar","error-unrecognized-form-feminine-indefinite-singular":"bizară","error-unrecognized-form-indefinite-masculine-plural":"bizari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bizare","definite-error-unrecognized-form-masculine-neuter-singular":"bizarul","definite-error-unrecognized-form-feminine-singular":"bizara","definite-error-unrecognized-form-masculine-plural":"bizarii","definite-error-unrecognized-form-feminine-neuter-plural":"bizarele"}},{"word":"bizarerie","pos":"noun","definitions":["oddness"],"forms":{"plural":"bizarerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bizarerie","accusative-definite-nominative-singular":"bizareria","accusative-indefinite-nominative-plural":"bizarerii","accusative-definite-nominative-plural":"bizareriile","dative-genitive-indefinite-singular":"bizarerii","dative-definite-genitive-singular":"bizareriei","dative-genitive-indefinite-plural":"bizarerii","dative-definite-genitive-plural":"bizareriilor","singular-vocative":"bizarerie","plural-vocative":"bizareriilor"}},{"word":"Bîzdîc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîzdîc"}},{"word":"Bizdidel","pos":"name","definitions":["a river in Dâmbovița, Romania, tributary to the Ialomița"],"gender":"m"},{"word":"Bîzdoacă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bîzdoacă"}},{"word":"Bizighești","pos":"name","definitions":["a village in Garoafa, Vrancea County, Romania"],"gender":"m"},{"word":"bizon","pos":"noun","definitions":["American bison (Bison bison)"],"pronunciation":"/biˈzon/","forms":{"plural":"bizoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bizon","accusative-definite-nominative-singular":"bizonul","accusative-indefinite-nominative-plural":"bizoni","accusative-definite-nominative-plural":"bizonii","dative-genitive-indefinite-singular":"bizon","dative-definite-genitive-singular":"bizonului","dative-genitive-indefinite-plural":"bizoni","dative-definite-genitive-plural":"bizonilor","singular-vocative":"bizonule","plural-vocative":"bizonilor"}},{"word":"bizon american","pos":"noun","definitions":["American bison (Bison bison)"],"forms":{"plural":"bizoni americani"}},{"word":"bizou","pos":"noun","definitions":["bevel"],"forms":{"plural":"bizouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bizou","accusative-definite-nominative-singular":"bizouul","accusative-indefinite-nominative-plural":"bizouri","accusative-definite-nominative-plural":"bizourile","dative-genitive-indefinite-singular":"bizou","dative-definite-genitive-singular":"bizouului","dative-genitive-indefinite-plural":"bizouri","dative-definite-genitive-plural":"bizourilor","singular-vocative":"bizouule","plural-vocative":"bizourilor"}},{"word":"bizui","pos":"verb","definitions":["to rely on","to dare","to entrust"],"pronunciation":"/bi.zuˈi/","forms":{"canonical":"a bizui 4th conjugation","literary-present-singular-third-person":"bizuie","alternative-present-singular-third-person":"bizuiește","participle-past":"bizuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bizui","gerund":"bizuind","first-person-indicative-present-singular":"bizui","indicative-present-second-person-singular":"bizui","indicative-present-singular-third-person":"bizuie","first-person-indicative-plural-present":"bizuim","indicative-plural-present-second-person":"bizuiți","indicative-plural-present-third-person":"bizuie","first-person-imperfect-indicative-singular":"bizuiam","imperfect-indicative-second-person-singular":"bizuiai","imperfect-indicative-singular-third-person":"bizuia","first-person-imperfect-indicative-plural":"bizuiam","imperfect-indicative-plural-second-person":"bizuiați","imperfect-indicative-plural-third-person":"bizuiau","first-person-indicative-perfect-singular":"bizuii","indicative-perfect-second-person-singular":"bizuiși","indicative-perfect-singular-third-person":"bizui","first-person-indicative-perfect-plural":"bizuirăm","indicative-perfect-plural-second-person":"bizuirăți","indicative-perfect-plural-third-person":"bizuiră","first-person-indicative-pluperfect-singular":"bizuisem","indicative-pluperfect-second-person-singular":"bizuiseși","indicative-pluperfect-singular-third-person":"bizuise","first-person-indicative-pluperfect-plural":"bizuiserăm","indicative-pluperfect-plural-second-person":"bizuiserăți","indicative-pluperfect-plural-third-person":"bizuiseră","first-person-present-singular-subjunctive":"să bizui","present-second-person-singular-subjunctive":"să bizui","present-singular-subjunctive-third-person":"să bizuie","first-person-plural-present-subjunctive":"să bizuim","plural-present-second-person-subjunctive":"să bizuiți","plural-present-subjunctive-third-person":"să bizuie","imperative-second-person-singular":"bizuie","imperative-plural-second-person":"bizuiți","imperative-negative-second-person-singular":"nu bizui","imperative-negative-plural-second-person":"nu bizuiți"}},{"word":"bizuință","pos":"noun","definitions":["confidence"],"forms":{"plural":"bizuințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bizuință","accusative-definite-nominative-singular":"bizuința","accusative-indefinite-nominative-plural":"bizuințe","accusative-definite-nominative-plural":"bizuințele","dative-genitive-indefinite-singular":"bizuințe","dative-definite-genitive-singular":"bizuinței","dative-genitive-indefinite-plural":"bizuințe","dative-definite-genitive-plural":"bizuințelor","singular-vocative":"bizuință","plural-vocative":"bizuințelor"}},{"word":"bizuire","pos":"noun","definitions":["reliance"],"forms":{"plural":"bizuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bizuire","accusative-definite-nominative-singular":"bizuirea","accusative-indefinite-nominative-plural":"bizuiri","accusative-definite-nominative-plural":"bizuirile","dative-genitive-indefinite-singular":"bizuiri","dative-definite-genitive-singular":"bizuirii","dative-genitive-indefinite-plural":"bizuiri","dative-definite-genitive-plural":"bizuirilor","singular-vocative":"bizuire","plural-vocative":"bizuirilor"}},{"word":"bizunie","pos":"noun","definitions":["alternative form of vizunie"],"forms":{"plural":"bizunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bizunie","accusative-definite-nominative-singular":"bizunia","accusative-indefinite-nominative-plural":"bizunii","accusative-definite-nominative-plural":"bizuniile","dative-genitive-indefinite-singular":"bizunii","dative-definite-genitive-singular":"bizuniei","dative-genitive-indefinite-plural":"bizunii","dative-definite-genitive-plural":"bizuniilor","singular-vocative":"bizunie","plural-vocative":"bizuniilor"}},{"word":"Bizușa-Băi","pos":"name","definitions":["a village in Ileanda, Sălaj County, Romania"],"gender":"f"},{"word":"bl.","pos":"noun","definitions":["abbreviation of bloc (“block of flats”)"]},{"word":"bla-bla","pos":"intj","definitions":["blah, chit-chat"]},{"word":"blâdă","pos":"noun","definitions":["defaimation"],"forms":{"plural":"blâde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blâdă","accusative-definite-nominative-singular":"blâda","accusative-indefinite-nominative-plural":"blâde","accusative-definite-nominative-plural":"blâdele","dative-genitive-indefinite-singular":"blâde","dative-definite-genitive-singular":"blâdei","dative-genitive-indefinite-plural":"blâde","dative-definite-genitive-plural":"blâdelor","singular-vocative":"blâdă","plural-vocative":"blâdelor","alternative":"blîdă"}},{"word":"blâdnic","pos":"adj","definitions":["lewd, lecherous"],"forms":{"feminine-singular":"blâdnică","masculine-plural":"blâdnici","feminine-neuter-plural":"blâdnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blâdnic","error-unrecognized-form-feminine-indefinite-singular":"blâdnică","error-unrecognized-form-indefinite-masculine-plural":"blâdnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"blâdnice","definite-error-unrecognized-form-masculine-neuter-singular":"blâdnicul","definite-error-unrecognized-form-feminine-singular":"blâdnica","definite-error-unrecognized-form-masculine-plural":"blâdnicii","definite-error-unrecognized-form-feminine-neuter-plural":"blâdnicele","alternative":"blîdnic"}},{"word":"Blaga","pos":"name","definitions":["a surname","a village in Dealu Morii, Bacău County, Romania","a village in Schitu Duca, Iași County, Romania"],"gender":"f"},{"word":"blagă","pos":"noun","definitions":["wealth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"blagă","accusative-definite-nominative":"blagăul","dative-genitive-indefinite":"blagă","dative-definite-genitive":"blagăului","vocative":"blagăule"}},{"word":"Blăgăilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blăgăilă"}},{"word":"Blăgescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Blăgescu"}},{"word":"Blăgești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Blăgești, Bacău County, Romania","a locality in Pașcani, Iași County, Romania","a commune of Vaslui County, Romania","a village in Blăgești, Vaslui County, Romania"],"gender":"m"},{"word":"blagoboreț","pos":"noun","definitions":["fighter against God"],"forms":{"plural":"blagoboreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blagoboreț","accusative-definite-nominative-singular":"blagoborețul","accusative-indefinite-nominative-plural":"blagoboreți","accusative-definite-nominative-plural":"blagoboreții","dative-genitive-indefinite-singular":"blagoboreț","dative-definite-genitive-singular":"blagoborețului","dative-genitive-indefinite-plural":"blagoboreți","dative-definite-genitive-plural":"blagoboreților","singular-vocative":"blagoborețule","plural-vocative":"blagoboreților"}},{"word":"blagocestie","pos":"noun","definitions":["piety"],"forms":{"plural":"blagocestii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagocestie","accusative-definite-nominative-singular":"blagocestia","accusative-indefinite-nominative-plural":"blagocestii","accusative-definite-nominative-plural":"blagocestiile","dative-genitive-indefinite-singular":"blagocestii","dative-definite-genitive-singular":"blagocestiei","dative-genitive-indefinite-plural":"blagocestii","dative-definite-genitive-plural":"blagocestiilor","singular-vocative":"blagocestie","plural-vocative":"blagocestiilor"}},{"word":"blagocestiv","pos":"adj","definitions":["pious"],"forms":{"feminine-singular":"blagocestivă","masculine-plural":"blagocestivi","feminine-neuter-plural":"blagocestive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blagocestiv","error-unrecognized-form-feminine-indefinite-singular":"blagocestivă","error-unrecognized-form-indefinite-masculine-plural":"blagocestivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"blagocestive","definite-error-unrecognized-form-masculine-neuter-singular":"blagocestivul","definite-error-unrecognized-form-feminine-singular":"blagocestiva","definite-error-unrecognized-form-masculine-plural":"blagocestivii","definite-error-unrecognized-form-feminine-neuter-plural":"blagocestivele"}},{"word":"blagodarenie","pos":"noun","definitions":["gratitude"],"forms":{"plural":"blagodarenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagodarenie","accusative-definite-nominative-singular":"blagodarenia","accusative-indefinite-nominative-plural":"blagodarenii","accusative-definite-nominative-plural":"blagodareniile","dative-genitive-indefinite-singular":"blagodarenii","dative-definite-genitive-singular":"blagodareniei","dative-genitive-indefinite-plural":"blagodarenii","dative-definite-genitive-plural":"blagodareniilor","singular-vocative":"blagodarenie","plural-vocative":"blagodareniilor"}},{"word":"blagodari","pos":"verb","definitions":["to thank"],"forms":{"canonical":"a blagodari 4th conjugation","present-singular-third-person":"blagodarește","participle-past":"blagodarit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blagodari","gerund":"blagodarind","first-person-indicative-present-singular":"blagodaresc","indicative-present-second-person-singular":"blagodarești","indicative-present-singular-third-person":"blagodarește","first-person-indicative-plural-present":"blagodarim","indicative-plural-present-second-person":"blagodariți","indicative-plural-present-third-person":"blagodaresc","first-person-imperfect-indicative-singular":"blagodaream","imperfect-indicative-second-person-singular":"blagodareai","imperfect-indicative-singular-third-person":"blagodarea","first-person-imperfect-indicative-plural":"blagodaream","imperfect-indicative-plural-second-person":"blagodareați","imperfect-indicative-plural-third-person":"blagodareau","first-person-indicative-perfect-singular":"blagodarii","indicative-perfect-second-person-singular":"blagodariși","indicative-perfect-singular-third-person":"blagodari","first-person-indicative-perfect-plural":"blagodarirăm","indicative-perfect-plural-second-person":"blagodarirăți","indicative-perfect-plural-third-person":"blagodariră","first-person-indicative-pluperfect-singular":"blagodarisem","indicative-pluperfect-second-person-singular":"blagodariseși","indicative-pluperfect-singular-third-person":"blagodarise","first-person-indicative-pluperfect-plural":"blagodariserăm","indicative-pluperfect-plural-second-person":"blagodariserăți","indicative-pluperfect-plural-third-person":"blagodariseră","first-person-present-singular-subjunctive":"să blagodaresc","present-second-person-singular-subjunctive":"să blagodarești","present-singular-subjunctive-third-person":"să blagodarească","first-person-plural-present-subjunctive":"să blagodarim","plural-present-second-person-subjunctive":"să blagodariți","plural-present-subjunctive-third-person":"să blagodarească","imperative-second-person-singular":"blagodarește","imperative-plural-second-person":"blagodariți","imperative-negative-second-person-singular":"nu blagodari","imperative-negative-plural-second-person":"nu blagodariți"}},{"word":"blagoiavlenie","pos":"noun","definitions":["Epiphany"],"forms":{"plural":"blagoiavlenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagoiavlenie","accusative-definite-nominative-singular":"blagoiavlenia","accusative-indefinite-nominative-plural":"blagoiavlenii","accusative-definite-nominative-plural":"blagoiavleniile","dative-genitive-indefinite-singular":"blagoiavlenii","dative-definite-genitive-singular":"blagoiavleniei","dative-genitive-indefinite-plural":"blagoiavlenii","dative-definite-genitive-plural":"blagoiavleniilor","singular-vocative":"blagoiavlenie","plural-vocative":"blagoiavleniilor"}},{"word":"blagonoseț","pos":"noun","definitions":["benefactor"],"forms":{"plural":"blagonoseți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blagonoseț","accusative-definite-nominative-singular":"blagonosețul","accusative-indefinite-nominative-plural":"blagonoseți","accusative-definite-nominative-plural":"blagonoseții","dative-genitive-indefinite-singular":"blagonoseț","dative-definite-genitive-singular":"blagonosețului","dative-genitive-indefinite-plural":"blagonoseți","dative-definite-genitive-plural":"blagonoseților","singular-vocative":"blagonosețule","plural-vocative":"blagonoseților"}},{"word":"blagopriemnic","pos":"noun","definitions":["hospitable"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"blagopriemnic","accusative-definite-nominative":"blagopriemnicul","dative-genitive-indefinite":"blagopriemnic","dative-definite-genitive":"blagopriemnicului","vocative":"blagopriemnicule"}},{"word":"blagorecenie","pos":"noun","definitions":["theory"],"forms":{"plural":"blagorecenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagorecenie","accusative-definite-nominative-singular":"blagorecenia","accusative-indefinite-nominative-plural":"blagorecenii","accusative-definite-nominative-plural":"blagoreceniile","dative-genitive-indefinite-singular":"blagorecenii","dative-definite-genitive-singular":"blagoreceniei","dative-genitive-indefinite-plural":"blagorecenii","dative-definite-genitive-plural":"blagoreceniilor","singular-vocative":"blagorecenie","plural-vocative":"blagoreceniilor"}},{"word":"blagorodnic","pos":"adj","definitions":["noble"],"forms":{"feminine-singular":"blagorodnică","masculine-plural":"blagorodnici","feminine-neuter-plural":"blagorodnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blagorodnic","error-unrecognized-form-feminine-indefinite-singular":"blagorodnică","error-unrecognized-form-indefinite-masculine-plural":"blagorodnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"blagorodnice","definite-error-unrecognized-form-masculine-neuter-singular":"blagorodnicul","definite-error-unrecognized-form-feminine-singular":"blagorodnica","definite-error-unrecognized-form-masculine-plural":"blagorodnicii","definite-error-unrecognized-form-feminine-neuter-plural":"blagorodnicele"}},{"word":"blagorodnicie","pos":"noun","definitions":["nobility"],"forms":{"plural":"blagorodnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagorodnicie","accusative-definite-nominative-singular":"blagorodnicia","accusative-indefinite-nominative-plural":"blagorodnicii","accusative-definite-nominative-plural":"blagorodniciile","dative-genitive-indefinite-singular":"blagorodnicii","dative-definite-genitive-singular":"blagorodniciei","dative-genitive-indefinite-plural":"blagorodnicii","dative-definite-genitive-plural":"blagorodniciilor","singular-vocative":"blagorodnicie","plural-vocative":"blagorodniciilor"}},{"word":"blagorojdenie","pos":"noun","definitions":["birth in a noble family"],"forms":{"plural":"blagorojdenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagorojdenie","accusative-definite-nominative-singular":"blagorojdenia","accusative-indefinite-nominative-plural":"blagorojdenii","accusative-definite-nominative-plural":"blagorojdeniile","dative-genitive-indefinite-singular":"blagorojdenii","dative-definite-genitive-singular":"blagorojdeniei","dative-genitive-indefinite-plural":"blagorojdenii","dative-definite-genitive-plural":"blagorojdeniilor","singular-vocative":"blagorojdenie","plural-vocative":"blagorojdeniilor"}},{"word":"blagoslovenie","pos":"noun","definitions":["blessing"],"forms":{"plural":"blagoslovenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagoslovenie","accusative-definite-nominative-singular":"blagoslovenia","accusative-indefinite-nominative-plural":"blagoslovenii","accusative-definite-nominative-plural":"blagosloveniile","dative-genitive-indefinite-singular":"blagoslovenii","dative-definite-genitive-singular":"blagosloveniei","dative-genitive-indefinite-plural":"blagoslovenii","dative-definite-genitive-plural":"blagosloveniilor","singular-vocative":"blagoslovenie","plural-vocative":"blagosloveniilor"}},{"word":"blagoslovi","pos":"verb","definitions":["to bless"],"forms":{"canonical":"a blagoslovi 4th conjugation","present-singular-third-person":"blagoslovește","participle-past":"blagoslovit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blagoslovi","gerund":"blagoslovind","first-person-indicative-present-singular":"blagoslovesc","indicative-present-second-person-singular":"blagoslovești","indicative-present-singular-third-person":"blagoslovește","first-person-indicative-plural-present":"blagoslovim","indicative-plural-present-second-person":"blagosloviți","indicative-plural-present-third-person":"blagoslovesc","first-person-imperfect-indicative-singular":"blagosloveam","imperfect-indicative-second-person-singular":"blagosloveai","imperfect-indicative-singular-third-person":"blagoslovea","first-person-imperfect-indicative-plural":"blagosloveam","imperfect-indicative-plural-second-person":"blagosloveați","imperfect-indicative-plural-third-person":"blagosloveau","first-person-indicative-perfect-singular":"blagoslovii","indicative-perfect-second-person-singular":"blagosloviși","indicative-perfect-singular-third-person":"blagoslovi","first-person-indicative-perfect-plural":"blagoslovirăm","indicative-perfect-plural-second-person":"blagoslovirăți","indicative-perfect-plural-third-person":"blagosloviră","first-person-indicative-pluperfect-singular":"blagoslovisem","indicative-pluperfect-second-person-singular":"blagosloviseși","indicative-pluperfect-singular-third-person":"blagoslovise","first-person-indicative-pluperfect-plural":"blagosloviserăm","indicative-pluperfect-plural-second-person":"blagosloviserăți","indicative-pluperfect-plural-third-person":"blagosloviseră","first-person-present-singular-subjunctive":"să blagoslovesc","present-second-person-singular-subjunctive":"să blagoslovești","present-singular-subjunctive-third-person":"să blagoslovească","first-person-plural-present-subjunctive":"să blagoslovim","plural-present-second-person-subjunctive":"să blagosloviți","plural-present-subjunctive-third-person":"să blagoslovească","imperative-second-person-singular":"blagoslovește","imperative-plural-second-person":"blagosloviți","imperative-negative-second-person-singular":"nu blagoslovi","imperative-negative-plural-second-person":"nu blagosloviți"}},{"word":"blagoslovire","pos":"noun","definitions":["blessing"],"forms":{"plural":"blagosloviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blagoslovire","accusative-definite-nominative-singular":"blagoslovirea","accusative-indefinite-nominative-plural":"blagosloviri","accusative-definite-nominative-plural":"blagoslovirile","dative-genitive-indefinite-singular":"blagosloviri","dative-definite-genitive-singular":"blagoslovirii","dative-genitive-indefinite-plural":"blagosloviri","dative-definite-genitive-plural":"blagoslovirilor","singular-vocative":"blagoslovire","plural-vocative":"blagoslovirilor"}},{"word":"blagoslovit","pos":"adj","definitions":["blessed"],"forms":{"feminine-singular":"blagoslovită","masculine-plural":"blagosloviți","feminine-neuter-plural":"blagoslovite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blagoslovit","error-unrecognized-form-feminine-indefinite-singular":"blagoslovită","error-unrecognized-form-indefinite-masculine-plural":"blagosloviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"blagoslovite","definite-error-unrecognized-form-masculine-neuter-singular":"blagoslovitul","definite-error-unrecognized-form-feminine-singular":"blagoslovita","definite-error-unrecognized-form-masculine-plural":"blagosloviții","definite-error-unrecognized-form-feminine-neuter-plural":"blagoslovitele"}},{"word":"Blagoveștenie","pos":"noun","definitions":["Annunciation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"blagoveștenie","accusative-definite-nominative":"blagoveștenia","dative-genitive-indefinite":"blagoveștenii","dative-definite-genitive":"blagoveșteniei","vocative":"blagoveștenie"}},{"word":"blagoveștenie","pos":"name","definitions":["alternative letter-case form of Blagoveștenie"],"gender":"f","forms":{"plural":"blagoveștenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagoveștenie","accusative-definite-nominative-singular":"blagoveștenia","accusative-indefinite-nominative-plural":"blagoveștenii","accusative-definite-nominative-plural":"blagoveșteniile","dative-genitive-indefinite-singular":"blagoveștenii","dative-definite-genitive-singular":"blagoveșteniei","dative-genitive-indefinite-plural":"blagoveștenii","dative-definite-genitive-plural":"blagoveșteniilor","singular-vocative":"blagoveștenie","plural-vocative":"blagoveșteniilor"}},{"word":"blagovonie","pos":"noun","definitions":["scent, fragrance"],"forms":{"plural":"blagovonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blagovonie","accusative-definite-nominative-singular":"blagovonia","accusative-indefinite-nominative-plural":"blagovonii","accusative-definite-nominative-plural":"blagovoniile","dative-genitive-indefinite-singular":"blagovonii","dative-definite-genitive-singular":"blagovoniei","dative-genitive-indefinite-plural":"blagovonii","dative-definite-genitive-plural":"blagovoniilor","singular-vocative":"blagovonie","plural-vocative":"blagovoniilor"}},{"word":"Blăguț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blăguț"}},{"word":"Blahnița","pos":"name","definitions":["a river in Mehedinți, Romania, tributary to the Danube","a river in Gorj, Romania, tributary to the Gilort"],"gender":"f"},{"word":"Blahnița de Jos","pos":"name","definitions":["a village in Târgu Cărbunești, Gorj County, Romania"],"gender":"f"},{"word":"Blahnița de Sus","pos":"name","definitions":["a village in Săcelu, Gorj County, Romania"],"gender":"f"},{"word":"blaihuire","pos":"noun","definitions":["depigmentation"],"forms":{"plural":"blăihuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blaihuire","accusative-definite-nominative-singular":"blaihuirea","accusative-indefinite-nominative-plural":"blăihuiri","accusative-definite-nominative-plural":"blăihuirile","dative-genitive-indefinite-singular":"blăihuiri","dative-definite-genitive-singular":"blăihuirii","dative-genitive-indefinite-plural":"blăihuiri","dative-definite-genitive-plural":"blăihuirilor","singular-vocative":"blaihuire","plural-vocative":"blăihuirilor"}},{"word":"Blaj","pos":"name","definitions":["a city in Alba County, Romania","a village in Voineasa, Olt County, Romania"],"pronunciation":"/blaʒ/","gender":"f"},{"word":"Blaja","pos":"name","definitions":["a village in Tășnad, Satu Mare County, Romania"],"gender":"f"},{"word":"Blăjanca","pos":"name","definitions":["a river in Buzău County, Romania, tributary to the Buzău"],"gender":"f"},{"word":"Blăjani","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Blăjani, Buzău County, Romania"],"gender":"m"},{"word":"blăjean","pos":"adj","definitions":["of, from or relating to Blaj"],"forms":{"feminine-singular":"blăjeană","masculine-plural":"blăjeni","feminine-neuter-plural":"blăjene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blăjean","error-unrecognized-form-feminine-indefinite-singular":"blăjeană","error-unrecognized-form-indefinite-masculine-plural":"blăjeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"blăjene","definite-error-unrecognized-form-masculine-neuter-singular":"blăjeanul","definite-error-unrecognized-form-feminine-singular":"blăjeana","definite-error-unrecognized-form-masculine-plural":"blăjenii","definite-error-unrecognized-form-feminine-neuter-plural":"blăjenele"}},{"word":"blăjean","pos":"noun","definitions":["native or inhabitant of Blaj"],"forms":{"plural":"blăjeni","feminine":"equivalent blăjeancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blăjean","accusative-definite-nominative-singular":"blăjeanul","accusative-indefinite-nominative-plural":"blăjeni","accusative-definite-nominative-plural":"blăjenii","dative-genitive-indefinite-singular":"blăjean","dative-definite-genitive-singular":"blăjeanului","dative-genitive-indefinite-plural":"blăjeni","dative-definite-genitive-plural":"blăjenilor","singular-vocative":"blăjeanule","plural-vocative":"blăjenilor"}},{"word":"blăjeancă","pos":"noun","definitions":["female equivalent of blăjean"],"forms":{"plural":"blăjence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blăjeancă","accusative-definite-nominative-singular":"blăjeanca","accusative-indefinite-nominative-plural":"blăjence","accusative-definite-nominative-plural":"blăjencele","dative-genitive-indefinite-singular":"blăjence","dative-definite-genitive-singular":"blăjencei","dative-genitive-indefinite-plural":"blăjence","dative-definite-genitive-plural":"blăjencelor","singular-vocative":"blăjeancă","plural-vocative":"blăjencelor"}},{"word":"Blăjel","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Blăjel, Sibiu County, Romania"],"gender":"m"},{"word":"Blăjeni","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Blăjeni, Hunedoara County, Romania"],"gender":"m"},{"word":"Blăjeni-Vulcan","pos":"name","definitions":["a village in Blăjeni, Hunedoara County, Romania"],"gender":"m"},{"word":"blajenie","pos":"noun","definitions":["blissfulness"],"forms":{"plural":"blajenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blajenie","accusative-definite-nominative-singular":"blajenia","accusative-indefinite-nominative-plural":"blajenii","accusative-definite-nominative-plural":"blajeniile","dative-genitive-indefinite-singular":"blajenii","dative-definite-genitive-singular":"blajeniei","dative-genitive-indefinite-plural":"blajenii","dative-definite-genitive-plural":"blajeniilor","singular-vocative":"blajenie","plural-vocative":"blajeniilor"}},{"word":"Blăjenii de Jos","pos":"name","definitions":["a village in Șintereag, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Blăjenii de Sus","pos":"name","definitions":["a village in Șintereag, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"blăjenilor","pos":"noun","definitions":["definite genitive/dative plural of blăjean"]},{"word":"Blajin","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blajin"}},{"word":"blajin","pos":"adj","definitions":["kind, gentle, soft, sweet, calm, mild, benign"],"pronunciation":"/blaˈʒin/","forms":{"feminine-singular":"blajină","masculine-plural":"blajini","feminine-neuter-plural":"blajine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blajin","error-unrecognized-form-feminine-indefinite-singular":"blajină","error-unrecognized-form-indefinite-masculine-plural":"blajini","error-unrecognized-form-feminine-indefinite-neuter-plural":"blajine","definite-error-unrecognized-form-masculine-neuter-singular":"blajinul","definite-error-unrecognized-form-feminine-singular":"blajina","definite-error-unrecognized-form-masculine-plural":"blajinii","definite-error-unrecognized-form-feminine-neuter-plural":"blajinele"}},{"word":"blajinătate","pos":"noun","definitions":["gentleness, mildness, softheartedness, meekness"],"pronunciation":"/blaʒinəˈtate/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"blajinătate","accusative-definite-nominative":"blajinătatea","dative-genitive-indefinite":"blajinătăți","dative-definite-genitive":"blajinătății","vocative":"blajinătate"}},{"word":"blajinie","pos":"noun","definitions":["gentleness, mildness, softheartedness, meekness"],"forms":{"plural":"blajinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blajinie","accusative-definite-nominative-singular":"blajinia","accusative-indefinite-nominative-plural":"blajinii","accusative-definite-nominative-plural":"blajiniile","dative-genitive-indefinite-singular":"blajinii","dative-definite-genitive-singular":"blajiniei","dative-genitive-indefinite-plural":"blajinii","dative-definite-genitive-plural":"blajiniilor","singular-vocative":"blajinie","plural-vocative":"blajiniilor"}},{"word":"Blajova","pos":"name","definitions":["a village in Nițchidorf, Timiș County, Romania"],"gender":"f"},{"word":"Blaju","pos":"name","definitions":["a village in Tigveni, Argeș County, Romania"],"gender":"m"},{"word":"blam","pos":"noun","definitions":["public disapproval, condemnation"],"forms":{"plural":"blamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blam","accusative-definite-nominative-singular":"blamul","accusative-indefinite-nominative-plural":"blamuri","accusative-definite-nominative-plural":"blamurile","dative-genitive-indefinite-singular":"blam","dative-definite-genitive-singular":"blamului","dative-genitive-indefinite-plural":"blamuri","dative-definite-genitive-plural":"blamurilor","singular-vocative":"blamule","plural-vocative":"blamurilor"}},{"word":"blăm","pos":"intj","definitions":["obsolete form of umbla"]},{"word":"blama","pos":"verb","definitions":["to blame"],"forms":{"canonical":"a blama 1st conjugation","present-singular-third-person":"blamează","participle-past":"blamat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a blama","gerund":"blamând","first-person-indicative-present-singular":"blamez","indicative-present-second-person-singular":"blamezi","indicative-present-singular-third-person":"blamează","first-person-indicative-plural-present":"blamăm","indicative-plural-present-second-person":"blamați","indicative-plural-present-third-person":"blamează","first-person-imperfect-indicative-singular":"blamam","imperfect-indicative-second-person-singular":"blamai","imperfect-indicative-singular-third-person":"blama","first-person-imperfect-indicative-plural":"blamam","imperfect-indicative-plural-second-person":"blamați","imperfect-indicative-plural-third-person":"blamau","first-person-indicative-perfect-singular":"blamai","indicative-perfect-second-person-singular":"blamași","indicative-perfect-singular-third-person":"blamă","first-person-indicative-perfect-plural":"blamarăm","indicative-perfect-plural-second-person":"blamarăți","indicative-perfect-plural-third-person":"blamară","first-person-indicative-pluperfect-singular":"blamasem","indicative-pluperfect-second-person-singular":"blamaseși","indicative-pluperfect-singular-third-person":"blamase","first-person-indicative-pluperfect-plural":"blamaserăm","indicative-pluperfect-plural-second-person":"blamaserăți","indicative-pluperfect-plural-third-person":"blamaseră","first-person-present-singular-subjunctive":"să blamez","present-second-person-singular-subjunctive":"să blamezi","present-singular-subjunctive-third-person":"să blameze","first-person-plural-present-subjunctive":"să blamăm","plural-present-second-person-subjunctive":"să blamați","plural-present-subjunctive-third-person":"să blameze","imperative-second-person-singular":"blamează","imperative-plural-second-person":"blamați","imperative-negative-second-person-singular":"nu blama","imperative-negative-plural-second-person":"nu blamați"}},{"word":"blamabil","pos":"adj","definitions":["blamable"],"forms":{"feminine-singular":"blamabilă","masculine-plural":"blamabili","feminine-neuter-plural":"blamabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blamabil","error-unrecognized-form-feminine-indefinite-singular":"blamabilă","error-unrecognized-form-indefinite-masculine-plural":"blamabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"blamabile","definite-error-unrecognized-form-masculine-neuter-singular":"blamabilul","definite-error-unrecognized-form-feminine-singular":"blamabila","definite-error-unrecognized-form-masculine-plural":"blamabilii","definite-error-unrecognized-form-feminine-neuter-plural":"blamabilele"}},{"word":"blamare","pos":"noun","definitions":["blaming"],"forms":{"plural":"blamări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blamare","accusative-definite-nominative-singular":"blamarea","accusative-indefinite-nominative-plural":"blamări","accusative-definite-nominative-plural":"blamările","dative-genitive-indefinite-singular":"blamări","dative-definite-genitive-singular":"blamării","dative-genitive-indefinite-plural":"blamări","dative-definite-genitive-plural":"blamărilor","singular-vocative":"blamare","plural-vocative":"blamărilor"}},{"word":"blamat","pos":"adj","definitions":["blamed"],"forms":{"feminine-singular":"blamată","masculine-plural":"blamați","feminine-neuter-plural":"blamate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blamat","error-unrecognized-form-feminine-indefinite-singular":"blamată","error-unrecognized-form-indefinite-masculine-plural":"blamați","error-unrecognized-form-feminine-indefinite-neuter-plural":"blamate","definite-error-unrecognized-form-masculine-neuter-singular":"blamatul","definite-error-unrecognized-form-feminine-singular":"blamata","definite-error-unrecognized-form-masculine-plural":"blamații","definite-error-unrecognized-form-feminine-neuter-plural":"blamatele"}},{"word":"blana","pos":"noun","definitions":["definite nominative/accusative singular of blană"]},{"word":"Blană","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blană"}},{"word":"blană","pos":"noun","definitions":["fur","hide, pelt (preserved animal skin with hair)","fur coat","pubic hair","thick wooden board"],"pronunciation":"/ˈbla.nə/","examples":[{"ro":"Căprioara îl linge, și limba ei subțire culcă ușor blana moale, mătăsoasă a iedului.","en":"The doe licks [the fawn], and its thin tongue delicately smoothens the soft, silky fur of the fawn."},{"ro":"Un sfredel mare se aude rozând țesăturile uscate ale blănii bătrâne de stejar…","en":"A great auger is heard gnawing at the dry fibers of the old oak board…"}],"forms":{"plural":"blăni","error-unknown-tag-plural":"blănuri","archaic-plural":"blane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blană","accusative-definite-nominative-singular":"blana","accusative-indefinite-nominative-plural":"blănie","accusative-definite-nominative-plural":"blăniele","dative-genitive-indefinite-singular":"blănie","dative-definite-genitive-singular":"blăniei","dative-genitive-indefinite-plural":"blănie","dative-definite-genitive-plural":"blănielor","singular-vocative":"blană","plural-vocative":"blănielor"}},{"word":"blană","pos":"adj","definitions":["cool, awesome, lit, dope, insane"],"pronunciation":"/ˈbla.nə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blană","error-unrecognized-form-feminine-indefinite-singular":"blană","error-unrecognized-form-indefinite-masculine-plural":"blană","error-unrecognized-form-feminine-indefinite-neuter-plural":"blană","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"blănar","pos":"noun","definitions":["furrier, peltmonger"],"pronunciation":"/bləˈnar/","forms":{"plural":"blănari","feminine":"equivalent blănăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blănar","accusative-definite-nominative-singular":"blănarul","accusative-indefinite-nominative-plural":"blănari","accusative-definite-nominative-plural":"blănarii","dative-genitive-indefinite-singular":"blănar","dative-definite-genitive-singular":"blănarului","dative-genitive-indefinite-plural":"blănari","dative-definite-genitive-plural":"blănarilor","singular-vocative":"blănarule","plural-vocative":"blănarilor"}},{"word":"blănăreală","pos":"noun","definitions":["beating, punching"],"forms":{"plural":"blănăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blănăreală","accusative-definite-nominative-singular":"blănăreala","accusative-indefinite-nominative-plural":"blănărele","accusative-definite-nominative-plural":"blănărelele","dative-genitive-indefinite-singular":"blănărele","dative-definite-genitive-singular":"blănărelei","dative-genitive-indefinite-plural":"blănărele","dative-definite-genitive-plural":"blănărelelor","singular-vocative":"blănăreală","plural-vocative":"blănărelelor"}},{"word":"blănăreasă","pos":"noun","definitions":["female equivalent of blănar"],"pronunciation":"/blə.nəˈre̯a.sə/","forms":{"plural":"blănărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"blănăreasă","accusative-definite-nominative-singular":"blănăreasa","accusative-indefinite-nominative-plural":"blănărese","accusative-definite-nominative-plural":"blănăresele","dative-genitive-indefinite-singular":"blănărese","dative-definite-genitive-singular":"blănăresei","dative-genitive-indefinite-plural":"blănărese","dative-definite-genitive-plural":"blănăreselor","singular-vocative":"-","plural-vocative":"-"}},{"word":"blănărese","pos":"noun","definitions":["plural of blănăreasă"],"gender":"f"},{"word":"blănari","pos":"noun","definitions":["plural of blănar"],"gender":"m"},{"word":"blănărie","pos":"noun","definitions":["furrier's"],"forms":{"plural":"blănării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blănărie","accusative-definite-nominative-singular":"blănăria","accusative-indefinite-nominative-plural":"blănării","accusative-definite-nominative-plural":"blănăriile","dative-genitive-indefinite-singular":"blănării","dative-definite-genitive-singular":"blănăriei","dative-genitive-indefinite-plural":"blănării","dative-definite-genitive-plural":"blănăriilor","singular-vocative":"blănărie","plural-vocative":"blănăriilor"}},{"word":"Blănariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Blănariu"}},{"word":"Blănaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Blănaru"}},{"word":"blanc","pos":"noun","definitions":["white space"],"forms":{"plural":"blancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blanc","accusative-definite-nominative-singular":"blancul","accusative-indefinite-nominative-plural":"blancuri","accusative-definite-nominative-plural":"blancurile","dative-genitive-indefinite-singular":"blanc","dative-definite-genitive-singular":"blancului","dative-genitive-indefinite-plural":"blancuri","dative-definite-genitive-plural":"blancurilor","singular-vocative":"blancule","plural-vocative":"blancurilor"}},{"word":"blanchetă","pos":"noun","definitions":["a form"],"forms":{"plural":"blanchete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blanchetă","accusative-definite-nominative-singular":"blancheta","accusative-indefinite-nominative-plural":"blanchete","accusative-definite-nominative-plural":"blanchetele","dative-genitive-indefinite-singular":"blanchete","dative-definite-genitive-singular":"blanchetei","dative-genitive-indefinite-plural":"blanchete","dative-definite-genitive-plural":"blanchetelor","singular-vocative":"blanchetă","plural-vocative":"blanchetelor"}},{"word":"blând","pos":"adj","definitions":["mild","tame","gentle, harmless, kind","calm"],"pronunciation":"/blɨnd/","forms":{"feminine-singular":"blândă","masculine-plural":"blânzi","feminine-neuter-plural":"blânde","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"blând","error-unrecognized-form-feminine-indefinite-singular":"blândă","error-unrecognized-form-indefinite-masculine-plural":"blânzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"blânde","definite-error-unrecognized-form-masculine-neuter-singular":"blândul","definite-error-unrecognized-form-feminine-singular":"blânda","definite-error-unrecognized-form-masculine-plural":"blânzii","definite-error-unrecognized-form-feminine-neuter-plural":"blândele","alternative":"blînd"}},{"word":"blând ca un miel","pos":"adj","definitions":["very gentle"],"forms":{"feminine-singular":"blândă ca un miel","masculine-plural":"blânzi ca niște miei","feminine-neuter-plural":"blânde ca niște miei"}},{"word":"blândă","pos":"noun","definitions":["hives, urticaria, nettle-rash"],"forms":{"plural":"blânde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blândă","accusative-definite-nominative-singular":"blânda","accusative-indefinite-nominative-plural":"blânde","accusative-definite-nominative-plural":"blândele","dative-genitive-indefinite-singular":"blânde","dative-definite-genitive-singular":"blândei","dative-genitive-indefinite-plural":"blânde","dative-definite-genitive-plural":"blândelor","singular-vocative":"blândă","plural-vocative":"blândelor","alternative":"blîndă"}},{"word":"Blândești","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Blândești, Botoșani County, Romania"],"gender":"m","forms":{"alternative":"Blîndești"}},{"word":"blândețe","pos":"noun","definitions":["kindness","gentleness","meekness","amenity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"blândețe","accusative-definite-nominative":"blândețea","dative-genitive-indefinite":"blândeți","dative-definite-genitive":"blândeții","vocative":"blândețe","alternative":"blîndețe"}},{"word":"Blandiana","pos":"name","definitions":["a commune of Alba County, Romania","a village in Blandiana, Alba County, Romania"],"gender":"f"},{"word":"blândișor","pos":"adj","definitions":["diminutive of blând"],"pronunciation":"/blɨn.diˈʃor/","forms":{"feminine-singular":"blândișoară","masculine-plural":"blândișori","feminine-neuter-plural":"blândișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blândișor","error-unrecognized-form-feminine-indefinite-singular":"blândișoară","error-unrecognized-form-indefinite-masculine-plural":"blândișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"blândișoare","definite-error-unrecognized-form-masculine-neuter-singular":"blândișorul","definite-error-unrecognized-form-feminine-singular":"blândișoara","definite-error-unrecognized-form-masculine-plural":"blândișorii","definite-error-unrecognized-form-feminine-neuter-plural":"blândișoarele","alternative":"blîndișor"}},{"word":"Blându","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blându","alternative":"Blîndu"}},{"word":"blăndură","pos":"noun","definitions":["an old thing"],"forms":{"plural":"blăndure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blăndură","accusative-definite-nominative-singular":"blăndura","accusative-indefinite-nominative-plural":"blăndure","accusative-definite-nominative-plural":"blăndurele","dative-genitive-indefinite-singular":"blăndure","dative-definite-genitive-singular":"blăndurei","dative-genitive-indefinite-plural":"blăndure","dative-definite-genitive-plural":"blăndurelor","singular-vocative":"blăndură","plural-vocative":"blăndurelor"}},{"word":"blăneală","pos":"noun","definitions":["beating"],"forms":{"plural":"blăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blăneală","accusative-definite-nominative-singular":"blăneala","accusative-indefinite-nominative-plural":"blănele","accusative-definite-nominative-plural":"blănelele","dative-genitive-indefinite-singular":"blănele","dative-definite-genitive-singular":"blănelei","dative-genitive-indefinite-plural":"blănele","dative-definite-genitive-plural":"blănelelor","singular-vocative":"blăneală","plural-vocative":"blănelelor"}},{"word":"Blăneasa","pos":"name","definitions":["a river in Galați, Romania, tributary to the Bârlad"],"gender":"f"},{"word":"blăni","pos":"verb","definitions":["to cover with boards"],"forms":{"canonical":"a blăni 4th conjugation","present-singular-third-person":"blănește","participle-past":"blănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blăni","gerund":"blănind","first-person-indicative-present-singular":"blănesc","indicative-present-second-person-singular":"blănești","indicative-present-singular-third-person":"blănește","first-person-indicative-plural-present":"blănim","indicative-plural-present-second-person":"blăniți","indicative-plural-present-third-person":"blănesc","first-person-imperfect-indicative-singular":"blăneam","imperfect-indicative-second-person-singular":"blăneai","imperfect-indicative-singular-third-person":"blănea","first-person-imperfect-indicative-plural":"blăneam","imperfect-indicative-plural-second-person":"blăneați","imperfect-indicative-plural-third-person":"blăneau","first-person-indicative-perfect-singular":"blănii","indicative-perfect-second-person-singular":"blăniși","indicative-perfect-singular-third-person":"blăni","first-person-indicative-perfect-plural":"blănirăm","indicative-perfect-plural-second-person":"blănirăți","indicative-perfect-plural-third-person":"blăniră","first-person-indicative-pluperfect-singular":"blănisem","indicative-pluperfect-second-person-singular":"blăniseși","indicative-pluperfect-singular-third-person":"blănise","first-person-indicative-pluperfect-plural":"blăniserăm","indicative-pluperfect-plural-second-person":"blăniserăți","indicative-pluperfect-plural-third-person":"blăniseră","first-person-present-singular-subjunctive":"să blănesc","present-second-person-singular-subjunctive":"să blănești","present-singular-subjunctive-third-person":"să blănească","first-person-plural-present-subjunctive":"să blănim","plural-present-second-person-subjunctive":"să blăniți","plural-present-subjunctive-third-person":"să blănească","imperative-second-person-singular":"blănește","imperative-plural-second-person":"blăniți","imperative-negative-second-person-singular":"nu blăni","imperative-negative-plural-second-person":"nu blăniți"}},{"word":"blănișoară","pos":"noun","definitions":["diminutive of blană"],"forms":{"plural":"blănișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blănișoară","accusative-definite-nominative-singular":"blănișoara","accusative-indefinite-nominative-plural":"blănișoare","accusative-definite-nominative-plural":"blănișoarele","dative-genitive-indefinite-singular":"blănișoare","dative-definite-genitive-singular":"blănișoarei","dative-genitive-indefinite-plural":"blănișoare","dative-definite-genitive-plural":"blănișoarelor","singular-vocative":"blănișoară","plural-vocative":"blănișoarelor"}},{"word":"blănit","pos":"adj","definitions":["obsolete form of îmblănit"],"forms":{"feminine-singular":"blănită","masculine-plural":"blăniți","feminine-neuter-plural":"blănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blănit","error-unrecognized-form-feminine-indefinite-singular":"blănită","error-unrecognized-form-indefinite-masculine-plural":"blăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"blănite","definite-error-unrecognized-form-masculine-neuter-singular":"blănitul","definite-error-unrecognized-form-feminine-singular":"blănita","definite-error-unrecognized-form-masculine-plural":"blăniții","definite-error-unrecognized-form-feminine-neuter-plural":"blănitele"}},{"word":"blănita","pos":"adj","definitions":["definite nominative/accusative feminine singular of blănit"]},{"word":"blănită","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of blănit"]},{"word":"blănița","pos":"noun","definitions":["definite nominative/accusative singular of blăniță"]},{"word":"Blăniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blăniță"}},{"word":"blăniță","pos":"noun","definitions":["diminutive of blană; small fur"],"forms":{"plural":"blănițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blăniță","accusative-definite-nominative-singular":"blănița","accusative-indefinite-nominative-plural":"blănițe","accusative-definite-nominative-plural":"blănițele","dative-genitive-indefinite-singular":"blănițe","dative-definite-genitive-singular":"blăniței","dative-genitive-indefinite-plural":"blănițe","dative-definite-genitive-plural":"blănițelor","singular-vocative":"blăniță","plural-vocative":"blănițelor"}},{"word":"Blănoiu","pos":"name","definitions":["a village in Racovița, Vâlcea County, Romania"],"gender":"m"},{"word":"blănos","pos":"adj","definitions":["furry"],"forms":{"feminine-singular":"blănoasă","masculine-plural":"blănoși","feminine-neuter-plural":"blănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blănos","error-unrecognized-form-feminine-indefinite-singular":"blănoasă","error-unrecognized-form-indefinite-masculine-plural":"blănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"blănoase","definite-error-unrecognized-form-masculine-neuter-singular":"blănosul","definite-error-unrecognized-form-feminine-singular":"blănoasa","definite-error-unrecognized-form-masculine-plural":"blănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"blănoasele"}},{"word":"blanquism","pos":"noun","definitions":["Blanquism"],"forms":{"plural":"blanquisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blanquism","accusative-definite-nominative-singular":"blanquismul","accusative-indefinite-nominative-plural":"blanquisme","accusative-definite-nominative-plural":"blanquismele","dative-genitive-indefinite-singular":"blanquism","dative-definite-genitive-singular":"blanquismului","dative-genitive-indefinite-plural":"blanquisme","dative-definite-genitive-plural":"blanquismelor","singular-vocative":"blanquismule","plural-vocative":"blanquismelor"}},{"word":"blanquist","pos":"adj","definitions":["Blanquist"],"forms":{"feminine-singular":"blanquistă","masculine-plural":"blanquiști","feminine-neuter-plural":"blanquiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blanquist","error-unrecognized-form-feminine-indefinite-singular":"blanquistă","error-unrecognized-form-indefinite-masculine-plural":"blanquiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"blanquiste","definite-error-unrecognized-form-masculine-neuter-singular":"blanquistul","definite-error-unrecognized-form-feminine-singular":"blanquista","definite-error-unrecognized-form-masculine-plural":"blanquiștii","definite-error-unrecognized-form-feminine-neuter-plural":"blanquistele"}},{"word":"blănui","pos":"verb","definitions":["to fur"],"forms":{"canonical":"a blănui 4th conjugation","present-singular-third-person":"blănuiește","participle-past":"blănuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blănui","gerund":"blănuind","first-person-indicative-present-singular":"blănuiesc","indicative-present-second-person-singular":"blănuiești","indicative-present-singular-third-person":"blănuiește","first-person-indicative-plural-present":"blănuim","indicative-plural-present-second-person":"blănuiți","indicative-plural-present-third-person":"blănuiesc","first-person-imperfect-indicative-singular":"blănuiam","imperfect-indicative-second-person-singular":"blănuiai","imperfect-indicative-singular-third-person":"blănuia","first-person-imperfect-indicative-plural":"blănuiam","imperfect-indicative-plural-second-person":"blănuiați","imperfect-indicative-plural-third-person":"blănuiau","first-person-indicative-perfect-singular":"blănuii","indicative-perfect-second-person-singular":"blănuiși","indicative-perfect-singular-third-person":"blănui","first-person-indicative-perfect-plural":"blănuirăm","indicative-perfect-plural-second-person":"blănuirăți","indicative-perfect-plural-third-person":"blănuiră","first-person-indicative-pluperfect-singular":"blănuisem","indicative-pluperfect-second-person-singular":"blănuiseși","indicative-pluperfect-singular-third-person":"blănuise","first-person-indicative-pluperfect-plural":"blănuiserăm","indicative-pluperfect-plural-second-person":"blănuiserăți","indicative-pluperfect-plural-third-person":"blănuiseră","first-person-present-singular-subjunctive":"să blănuiesc","present-second-person-singular-subjunctive":"să blănuiești","present-singular-subjunctive-third-person":"să blănuiască","first-person-plural-present-subjunctive":"să blănuim","plural-present-second-person-subjunctive":"să blănuiți","plural-present-subjunctive-third-person":"să blănuiască","imperative-second-person-singular":"blănuiește","imperative-plural-second-person":"blănuiți","imperative-negative-second-person-singular":"nu blănui","imperative-negative-plural-second-person":"nu blănuiți"}},{"word":"blănuță","pos":"noun","definitions":["diminutive of blană"],"forms":{"plural":"blănuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blănuță","accusative-definite-nominative-singular":"blănuța","accusative-indefinite-nominative-plural":"blănuțe","accusative-definite-nominative-plural":"blănuțele","dative-genitive-indefinite-singular":"blănuțe","dative-definite-genitive-singular":"blănuței","dative-genitive-indefinite-plural":"blănuțe","dative-definite-genitive-plural":"blănuțelor","singular-vocative":"blănuță","plural-vocative":"blănuțelor"}},{"word":"Blânzi","pos":"name","definitions":["a village in Corod, Galați County, Romania"],"gender":"m","forms":{"alternative":"Blînzi"}},{"word":"blânzie","pos":"noun","definitions":["synonym of blândețe (“gentleness”)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blânzie","accusative-definite-nominative-singular":"blânzia","accusative-indefinite-nominative-plural":"blânzii","accusative-definite-nominative-plural":"blânziile","dative-genitive-indefinite-singular":"blânzii","dative-definite-genitive-singular":"blânziei","dative-genitive-indefinite-plural":"blânzii","dative-definite-genitive-plural":"blânziilor","singular-vocative":"blânzie","plural-vocative":"blânziilor","alternative":"blînzie"}},{"word":"blasfem","pos":"verb","definitions":["first-person singular present indicative/subjunctive of blasfema"],"pronunciation":"[blaˈsfem]"},{"word":"blasfema","pos":"verb","definitions":["to blaspheme"],"pronunciation":"/blas.feˈma/","forms":{"canonical":"a blasfema 1st conjugation","present-singular-third-person":"blasfemă","participle-past":"blasfemat","subjunctive-third-person":"blasfeme","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a blasfema","gerund":"blasfemând","first-person-indicative-present-singular":"blasfem","indicative-present-second-person-singular":"blasfemi","indicative-present-singular-third-person":"blasfemă","first-person-indicative-plural-present":"blasfemăm","indicative-plural-present-second-person":"blasfemați","indicative-plural-present-third-person":"blasfemă","first-person-imperfect-indicative-singular":"blasfemam","imperfect-indicative-second-person-singular":"blasfemai","imperfect-indicative-singular-third-person":"blasfema","first-person-imperfect-indicative-plural":"blasfemam","imperfect-indicative-plural-second-person":"blasfemați","imperfect-indicative-plural-third-person":"blasfemau","first-person-indicative-perfect-singular":"blasfemai","indicative-perfect-second-person-singular":"blasfemași","indicative-perfect-singular-third-person":"blasfemă","first-person-indicative-perfect-plural":"blasfemarăm","indicative-perfect-plural-second-person":"blasfemarăți","indicative-perfect-plural-third-person":"blasfemară","first-person-indicative-pluperfect-singular":"blasfemasem","indicative-pluperfect-second-person-singular":"blasfemaseși","indicative-pluperfect-singular-third-person":"blasfemase","first-person-indicative-pluperfect-plural":"blasfemaserăm","indicative-pluperfect-plural-second-person":"blasfemaserăți","indicative-pluperfect-plural-third-person":"blasfemaseră","first-person-present-singular-subjunctive":"să blasfem","present-second-person-singular-subjunctive":"să blasfemi","present-singular-subjunctive-third-person":"să blasfeme","first-person-plural-present-subjunctive":"să blasfemăm","plural-present-second-person-subjunctive":"să blasfemați","plural-present-subjunctive-third-person":"să blasfeme","imperative-second-person-singular":"blasfemă","imperative-plural-second-person":"blasfemați","imperative-negative-second-person-singular":"nu blasfema","imperative-negative-plural-second-person":"nu blasfemați"}},{"word":"blasfemai","pos":"verb","definitions":["second-person singular imperfect indicative of blasfema","first-person singular perfect indicative of blasfema"],"pronunciation":"[blasfeˈmaj]"},{"word":"blasfemam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of blasfema"],"pronunciation":"[blasfeˈmam]"},{"word":"blasfemase","pos":"verb","definitions":["third-person singular pluperfect indicative of blasfema"],"pronunciation":"[blasfeˈmase]"},{"word":"blasfematoare","pos":"noun","definitions":["female equivalent of blasfemator"],"forms":{"plural":"blasfematoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"blasfematoare","accusative-definite-nominative-singular":"blasfematoarea","accusative-indefinite-nominative-plural":"blasfematoare","accusative-definite-nominative-plural":"blasfematoarele","dative-genitive-indefinite-singular":"blasfematoare","dative-definite-genitive-singular":"blasfematoarei","dative-genitive-indefinite-plural":"blasfematoare","dative-definite-genitive-plural":"blasfematoarelor","singular-vocative":"blasfematoare","plural-vocative":"blasfematoarelor"}},{"word":"blasfemator","pos":"noun","definitions":["blasphemer"],"forms":{"plural":"blasfematori","feminine":"equivalent blasfematoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blasfemator","accusative-definite-nominative-singular":"blasfematorul","accusative-indefinite-nominative-plural":"blasfematori","accusative-definite-nominative-plural":"blasfematorii","dative-genitive-indefinite-singular":"blasfemator","dative-definite-genitive-singular":"blasfematorului","dative-genitive-indefinite-plural":"blasfematori","dative-definite-genitive-plural":"blasfematorilor","singular-vocative":"blasfematorule","plural-vocative":"blasfematorilor"}},{"word":"blasfeme","pos":"verb","definitions":["third-person singular/plural present subjunctive of blasfema"],"pronunciation":"[blaˈsfeme]"},{"word":"blasfemi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of blasfema"],"pronunciation":"[blaˈsfemʲ]"},{"word":"blasfemie","pos":"noun","definitions":["blasphemy"],"pronunciation":"/blasfeˈmi.e/","forms":{"plural":"blasfemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blasfemie","accusative-definite-nominative-singular":"blasfemia","accusative-indefinite-nominative-plural":"blasfemii","accusative-definite-nominative-plural":"blasfemiile","dative-genitive-indefinite-singular":"blasfemii","dative-definite-genitive-singular":"blasfemiei","dative-genitive-indefinite-plural":"blasfemii","dative-definite-genitive-plural":"blasfemiilor","singular-vocative":"blasfemie","plural-vocative":"blasfemiilor"}},{"word":"blăstăm","pos":"noun","definitions":["obsolete form of blestem"],"forms":{"plural":"blăstăme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blăstăm","accusative-definite-nominative-singular":"blăstămul","accusative-indefinite-nominative-plural":"blăstăme","accusative-definite-nominative-plural":"blăstămele","dative-genitive-indefinite-singular":"blăstăm","dative-definite-genitive-singular":"blăstămului","dative-genitive-indefinite-plural":"blăstăme","dative-definite-genitive-plural":"blăstămelor","singular-vocative":"blăstămule","plural-vocative":"blăstămelor"}},{"word":"blăstăma","pos":"verb","definitions":["obsolete form of blestema"],"forms":{"canonical":"a blăstăma 1st conjugation","present-singular-third-person":"blastămă","participle-past":"blăstămat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a blăstăma","gerund":"blăstămând","first-person-indicative-present-singular":"blăstăm","indicative-present-second-person-singular":"blăstămi","indicative-present-singular-third-person":"blăstămă","first-person-indicative-plural-present":"blăstămăm","indicative-plural-present-second-person":"blăstămați","indicative-plural-present-third-person":"blăstămă","first-person-imperfect-indicative-singular":"blăstămam","imperfect-indicative-second-person-singular":"blăstămai","imperfect-indicative-singular-third-person":"blăstăma","first-person-imperfect-indicative-plural":"blăstămam","imperfect-indicative-plural-second-person":"blăstămați","imperfect-indicative-plural-third-person":"blăstămau","first-person-indicative-perfect-singular":"blăstămai","indicative-perfect-second-person-singular":"blăstămași","indicative-perfect-singular-third-person":"blăstămă","first-person-indicative-perfect-plural":"blăstămarăm","indicative-perfect-plural-second-person":"blăstămarăți","indicative-perfect-plural-third-person":"blăstămară","first-person-indicative-pluperfect-singular":"blăstămasem","indicative-pluperfect-second-person-singular":"blăstămaseși","indicative-pluperfect-singular-third-person":"blăstămase","first-person-indicative-pluperfect-plural":"blăstămaserăm","indicative-pluperfect-plural-second-person":"blăstămaserăți","indicative-pluperfect-plural-third-person":"blăstămaseră","first-person-present-singular-subjunctive":"să blăstăm","present-second-person-singular-subjunctive":"să blăstămi","present-singular-subjunctive-third-person":"să blăstăme","first-person-plural-present-subjunctive":"să blăstămăm","plural-present-second-person-subjunctive":"să blăstămați","plural-present-subjunctive-third-person":"să blăstăme","imperative-second-person-singular":"blăstămă","imperative-plural-second-person":"blăstămați","imperative-negative-second-person-singular":"nu blăstăma","imperative-negative-plural-second-person":"nu blăstămați"}},{"word":"blastemă","pos":"noun","definitions":["blastema"],"forms":{"plural":"blasteme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blastemă","accusative-definite-nominative-singular":"blastema","accusative-indefinite-nominative-plural":"blasteme","accusative-definite-nominative-plural":"blastemele","dative-genitive-indefinite-singular":"blasteme","dative-definite-genitive-singular":"blastemei","dative-genitive-indefinite-plural":"blasteme","dative-definite-genitive-plural":"blastemelor","singular-vocative":"blastemă","plural-vocative":"blastemelor"}},{"word":"blăstema","pos":"verb","definitions":["obsolete form of blestema"],"forms":{"canonical":"a blăstema 1st conjugation","present-singular-third-person":"blăstemă","participle-past":"blăstemat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a blăstema","gerund":"blăstemând","first-person-indicative-present-singular":"blăstem","indicative-present-second-person-singular":"blăstemi","indicative-present-singular-third-person":"blăstemă","first-person-indicative-plural-present":"blăstemăm","indicative-plural-present-second-person":"blăstemați","indicative-plural-present-third-person":"blăstemă","first-person-imperfect-indicative-singular":"blăstemam","imperfect-indicative-second-person-singular":"blăstemai","imperfect-indicative-singular-third-person":"blăstema","first-person-imperfect-indicative-plural":"blăstemam","imperfect-indicative-plural-second-person":"blăstemați","imperfect-indicative-plural-third-person":"blăstemau","first-person-indicative-perfect-singular":"blăstemai","indicative-perfect-second-person-singular":"blăstemași","indicative-perfect-singular-third-person":"blăstemă","first-person-indicative-perfect-plural":"blăstemarăm","indicative-perfect-plural-second-person":"blăstemarăți","indicative-perfect-plural-third-person":"blăstemară","first-person-indicative-pluperfect-singular":"blăstemasem","indicative-pluperfect-second-person-singular":"blăstemaseși","indicative-pluperfect-singular-third-person":"blăstemase","first-person-indicative-pluperfect-plural":"blăstemaserăm","indicative-pluperfect-plural-second-person":"blăstemaserăți","indicative-pluperfect-plural-third-person":"blăstemaseră","first-person-present-singular-subjunctive":"să blăstem","present-second-person-singular-subjunctive":"să blăstemi","present-singular-subjunctive-third-person":"să blăsteme","first-person-plural-present-subjunctive":"să blăstemăm","plural-present-second-person-subjunctive":"să blăstemați","plural-present-subjunctive-third-person":"să blăsteme","imperative-second-person-singular":"blăstemă","imperative-plural-second-person":"blăstemați","imperative-negative-second-person-singular":"nu blăstema","imperative-negative-plural-second-person":"nu blăstemați"}},{"word":"blastocel","pos":"noun","definitions":["blastocoel"],"forms":{"plural":"blastocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blastocel","accusative-definite-nominative-singular":"blastocelul","accusative-indefinite-nominative-plural":"blastocele","accusative-definite-nominative-plural":"blastocelele","dative-genitive-indefinite-singular":"blastocel","dative-definite-genitive-singular":"blastocelului","dative-genitive-indefinite-plural":"blastocele","dative-definite-genitive-plural":"blastocelelor","singular-vocative":"blastocelule","plural-vocative":"blastocelelor"}},{"word":"blastocist","pos":"noun","definitions":["blastocyst"],"forms":{"plural":"blastociste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blastocist","accusative-definite-nominative-singular":"blastocistul","accusative-indefinite-nominative-plural":"blastociste","accusative-definite-nominative-plural":"blastocistele","dative-genitive-indefinite-singular":"blastocist","dative-definite-genitive-singular":"blastocistului","dative-genitive-indefinite-plural":"blastociste","dative-definite-genitive-plural":"blastocistelor","singular-vocative":"blastocistule","plural-vocative":"blastocistelor"}},{"word":"blastocit","pos":"noun","definitions":["blastocyte"],"forms":{"plural":"blastocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blastocit","accusative-definite-nominative-singular":"blastocitul","accusative-indefinite-nominative-plural":"blastocite","accusative-definite-nominative-plural":"blastocitele","dative-genitive-indefinite-singular":"blastocit","dative-definite-genitive-singular":"blastocitului","dative-genitive-indefinite-plural":"blastocite","dative-definite-genitive-plural":"blastocitelor","singular-vocative":"blastocitule","plural-vocative":"blastocitelor"}},{"word":"blastoderm","pos":"noun","definitions":["blastoderm"],"forms":{"plural":"blastoderme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blastoderm","accusative-definite-nominative-singular":"blastodermul","accusative-indefinite-nominative-plural":"blastoderme","accusative-definite-nominative-plural":"blastodermele","dative-genitive-indefinite-singular":"blastoderm","dative-definite-genitive-singular":"blastodermului","dative-genitive-indefinite-plural":"blastoderme","dative-definite-genitive-plural":"blastodermelor","singular-vocative":"blastodermule","plural-vocative":"blastodermelor"}},{"word":"blastodermic","pos":"adj","definitions":["blastodermic"],"forms":{"feminine-singular":"blastodermică","masculine-plural":"blastodermici","feminine-neuter-plural":"blastodermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blastodermic","error-unrecognized-form-feminine-indefinite-singular":"blastodermică","error-unrecognized-form-indefinite-masculine-plural":"blastodermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"blastodermice","definite-error-unrecognized-form-masculine-neuter-singular":"blastodermicul","definite-error-unrecognized-form-feminine-singular":"blastodermica","definite-error-unrecognized-form-masculine-plural":"blastodermicii","definite-error-unrecognized-form-feminine-neuter-plural":"blastodermicele"}},{"word":"blastogeneză","pos":"noun","definitions":["blastogenesis"],"forms":{"plural":"blastogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blastogeneză","accusative-definite-nominative-singular":"blastogeneza","accusative-indefinite-nominative-plural":"blastogeneze","accusative-definite-nominative-plural":"blastogenezele","dative-genitive-indefinite-singular":"blastogeneze","dative-definite-genitive-singular":"blastogenezei","dative-genitive-indefinite-plural":"blastogeneze","dative-definite-genitive-plural":"blastogenezelor","singular-vocative":"blastogeneză","plural-vocative":"blastogenezelor"}},{"word":"blastom","pos":"noun","definitions":["blastoma"],"forms":{"plural":"blastomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blastom","accusative-definite-nominative-singular":"blastomul","accusative-indefinite-nominative-plural":"blastomuri","accusative-definite-nominative-plural":"blastomurile","dative-genitive-indefinite-singular":"blastom","dative-definite-genitive-singular":"blastomului","dative-genitive-indefinite-plural":"blastomuri","dative-definite-genitive-plural":"blastomurilor","singular-vocative":"blastomule","plural-vocative":"blastomurilor"}},{"word":"blastomer","pos":"noun","definitions":["blastomere"],"forms":{"plural":"blastomere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blastomer","accusative-definite-nominative-singular":"blastomerul","accusative-indefinite-nominative-plural":"blastomere","accusative-definite-nominative-plural":"blastomerele","dative-genitive-indefinite-singular":"blastomer","dative-definite-genitive-singular":"blastomerului","dative-genitive-indefinite-plural":"blastomere","dative-definite-genitive-plural":"blastomerelor","singular-vocative":"blastomerule","plural-vocative":"blastomerelor"}},{"word":"blastomicoză","pos":"noun","definitions":["blastomycosis"],"forms":{"plural":"blastomicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blastomicoză","accusative-definite-nominative-singular":"blastomicoza","accusative-indefinite-nominative-plural":"blastomicoze","accusative-definite-nominative-plural":"blastomicozele","dative-genitive-indefinite-singular":"blastomicoze","dative-definite-genitive-singular":"blastomicozei","dative-genitive-indefinite-plural":"blastomicoze","dative-definite-genitive-plural":"blastomicozelor","singular-vocative":"blastomicoză","plural-vocative":"blastomicozelor"}},{"word":"blastopor","pos":"noun","definitions":["blastopore"],"forms":{"plural":"blastopori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blastopor","accusative-definite-nominative-singular":"blastoporul","accusative-indefinite-nominative-plural":"blastopori","accusative-definite-nominative-plural":"blastoporii","dative-genitive-indefinite-singular":"blastopor","dative-definite-genitive-singular":"blastoporului","dative-genitive-indefinite-plural":"blastopori","dative-definite-genitive-plural":"blastoporilor","singular-vocative":"blastoporule","plural-vocative":"blastoporilor"}},{"word":"blastulă","pos":"noun","definitions":["blastula"],"forms":{"plural":"blastule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blastulă","accusative-definite-nominative-singular":"blastula","accusative-indefinite-nominative-plural":"blastule","accusative-definite-nominative-plural":"blastulele","dative-genitive-indefinite-singular":"blastule","dative-definite-genitive-singular":"blastulei","dative-genitive-indefinite-plural":"blastule","dative-definite-genitive-plural":"blastulelor","singular-vocative":"blastulă","plural-vocative":"blastulelor"}},{"word":"blat","pos":"noun","definitions":["sheet, layer"],"forms":{"plural":"blaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blat","accusative-definite-nominative-singular":"blatul","accusative-indefinite-nominative-plural":"blaturi","accusative-definite-nominative-plural":"blaturile","dative-genitive-indefinite-singular":"blat","dative-definite-genitive-singular":"blatului","dative-genitive-indefinite-plural":"blaturi","dative-definite-genitive-plural":"blaturilor","singular-vocative":"blatule","plural-vocative":"blaturilor"}},{"word":"blat","pos":"noun","definitions":["illegal activity, particularly travelling on a train without a ticket.","match fixing"],"forms":{"plural":"blaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blat","accusative-definite-nominative-singular":"blatul","accusative-indefinite-nominative-plural":"blaturi","accusative-definite-nominative-plural":"blaturile","dative-genitive-indefinite-singular":"blat","dative-definite-genitive-singular":"blatului","dative-genitive-indefinite-plural":"blaturi","dative-definite-genitive-plural":"blaturilor","singular-vocative":"blatule","plural-vocative":"blaturilor"}},{"word":"blatist","pos":"noun","definitions":["fare dodger"],"forms":{"plural":"blatiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blatist","accusative-definite-nominative-singular":"blatistul","accusative-indefinite-nominative-plural":"blatiști","accusative-definite-nominative-plural":"blatiștii","dative-genitive-indefinite-singular":"blatist","dative-definite-genitive-singular":"blatistului","dative-genitive-indefinite-plural":"blatiști","dative-definite-genitive-plural":"blatiștilor","singular-vocative":"blatistule","plural-vocative":"blatiștilor"}},{"word":"blaza","pos":"verb","definitions":["to get bored, indiferent"],"forms":{"canonical":"a blaza 1st conjugation","present-singular-third-person":"blazează","participle-past":"blazat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a blaza","gerund":"blazând","first-person-indicative-present-singular":"blazez","indicative-present-second-person-singular":"blazezi","indicative-present-singular-third-person":"blazează","first-person-indicative-plural-present":"blazăm","indicative-plural-present-second-person":"blazați","indicative-plural-present-third-person":"blazează","first-person-imperfect-indicative-singular":"blazam","imperfect-indicative-second-person-singular":"blazai","imperfect-indicative-singular-third-person":"blaza","first-person-imperfect-indicative-plural":"blazam","imperfect-indicative-plural-second-person":"blazați","imperfect-indicative-plural-third-person":"blazau","first-person-indicative-perfect-singular":"blazai","indicative-perfect-second-person-singular":"blazași","indicative-perfect-singular-third-person":"blază","first-person-indicative-perfect-plural":"blazarăm","indicative-perfect-plural-second-person":"blazarăți","indicative-perfect-plural-third-person":"blazară","first-person-indicative-pluperfect-singular":"blazasem","indicative-pluperfect-second-person-singular":"blazaseși","indicative-pluperfect-singular-third-person":"blazase","first-person-indicative-pluperfect-plural":"blazaserăm","indicative-pluperfect-plural-second-person":"blazaserăți","indicative-pluperfect-plural-third-person":"blazaseră","first-person-present-singular-subjunctive":"să blazez","present-second-person-singular-subjunctive":"să blazezi","present-singular-subjunctive-third-person":"să blazeze","first-person-plural-present-subjunctive":"să blazăm","plural-present-second-person-subjunctive":"să blazați","plural-present-subjunctive-third-person":"să blazeze","imperative-second-person-singular":"blazează","imperative-plural-second-person":"blazați","imperative-negative-second-person-singular":"nu blaza","imperative-negative-plural-second-person":"nu blazați"}},{"word":"blazare","pos":"noun","definitions":["indifference"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"blazare","accusative-definite-nominative":"blazarea","dative-genitive-indefinite":"blazări","dative-definite-genitive":"blazării","vocative":"blazare"}},{"word":"blazat","pos":"adj","definitions":["blasé"],"forms":{"feminine-singular":"blazată","masculine-plural":"blazați","feminine-neuter-plural":"blazate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blazat","error-unrecognized-form-feminine-indefinite-singular":"blazată","error-unrecognized-form-indefinite-masculine-plural":"blazați","error-unrecognized-form-feminine-indefinite-neuter-plural":"blazate","definite-error-unrecognized-form-masculine-neuter-singular":"blazatul","definite-error-unrecognized-form-feminine-singular":"blazata","definite-error-unrecognized-form-masculine-plural":"blazații","definite-error-unrecognized-form-feminine-neuter-plural":"blazatele"}},{"word":"blazat","pos":"verb","definitions":["past participle of blaza"],"forms":{"participle-past":"of blaza"}},{"word":"blazer","pos":"noun","definitions":["blazer"],"forms":{"plural":"blazere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blazer","accusative-definite-nominative-singular":"blazerul","accusative-indefinite-nominative-plural":"blazere","accusative-definite-nominative-plural":"blazerele","dative-genitive-indefinite-singular":"blazer","dative-definite-genitive-singular":"blazerului","dative-genitive-indefinite-plural":"blazere","dative-definite-genitive-plural":"blazerelor","singular-vocative":"blazerule","plural-vocative":"blazerelor"}},{"word":"blazon","pos":"noun","definitions":["blazon"],"forms":{"plural":"blazoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blazon","accusative-definite-nominative-singular":"blazonul","accusative-indefinite-nominative-plural":"blazoane","accusative-definite-nominative-plural":"blazoanele","dative-genitive-indefinite-singular":"blazon","dative-definite-genitive-singular":"blazonului","dative-genitive-indefinite-plural":"blazoane","dative-definite-genitive-plural":"blazoanelor","singular-vocative":"blazonule","plural-vocative":"blazoanelor"}},{"word":"bleagă","pos":"adj","definitions":["feminine form of bleg."]},{"word":"bleah","pos":"noun","definitions":["alternative form of bleau"],"forms":{"plural":"bleahuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bleah","accusative-definite-nominative-singular":"bleahul","accusative-indefinite-nominative-plural":"bleahuri","accusative-definite-nominative-plural":"bleahurile","dative-genitive-indefinite-singular":"bleah","dative-definite-genitive-singular":"bleahului","dative-genitive-indefinite-plural":"bleahuri","dative-definite-genitive-plural":"bleahurilor","singular-vocative":"bleahule","plural-vocative":"bleahurilor"}},{"word":"Bleandă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bleandă"}},{"word":"bleandă","pos":"noun","definitions":["hit, shove"],"forms":{"plural":"blende","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bleandă","accusative-definite-nominative-singular":"bleanda","accusative-indefinite-nominative-plural":"blende","accusative-definite-nominative-plural":"blendele","dative-genitive-indefinite-singular":"blende","dative-definite-genitive-singular":"blendei","dative-genitive-indefinite-plural":"blende","dative-definite-genitive-plural":"blendelor","singular-vocative":"bleandă","plural-vocative":"blendelor"}},{"word":"bleasc","pos":"noun","definitions":["the soul of an animal","saliva"],"forms":{"plural":"bleascuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bleasc","accusative-definite-nominative-singular":"bleascul","accusative-indefinite-nominative-plural":"bleascuri","accusative-definite-nominative-plural":"bleascurile","dative-genitive-indefinite-singular":"bleasc","dative-definite-genitive-singular":"bleascului","dative-genitive-indefinite-plural":"bleascuri","dative-definite-genitive-plural":"bleascurilor","singular-vocative":"bleascule","plural-vocative":"bleascurilor"}},{"word":"bleav","pos":"noun","definitions":["alternative form of bleau"],"forms":{"plural":"bleavuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bleav","accusative-definite-nominative-singular":"bleavul","accusative-indefinite-nominative-plural":"bleavuri","accusative-definite-nominative-plural":"bleavurile","dative-genitive-indefinite-singular":"bleav","dative-definite-genitive-singular":"bleavului","dative-genitive-indefinite-plural":"bleavuri","dative-definite-genitive-plural":"bleavurilor","singular-vocative":"bleavule","plural-vocative":"bleavurilor"}},{"word":"blefarită","pos":"noun","definitions":["blepharitis"],"forms":{"plural":"blefarite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blefarită","accusative-definite-nominative-singular":"blefarita","accusative-indefinite-nominative-plural":"blefarite","accusative-definite-nominative-plural":"blefaritele","dative-genitive-indefinite-singular":"blefarite","dative-definite-genitive-singular":"blefaritei","dative-genitive-indefinite-plural":"blefarite","dative-definite-genitive-plural":"blefaritelor","singular-vocative":"blefarită","plural-vocative":"blefaritelor"}},{"word":"blefaroconjunctivită","pos":"noun","definitions":["blepharoconjunctivitis"],"forms":{"plural":"blefaroconjunctivite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blefaroconjunctivită","accusative-definite-nominative-singular":"blefaroconjunctivita","accusative-indefinite-nominative-plural":"blefaroconjunctivite","accusative-definite-nominative-plural":"blefaroconjunctivitele","dative-genitive-indefinite-singular":"blefaroconjunctivite","dative-definite-genitive-singular":"blefaroconjunctivitei","dative-genitive-indefinite-plural":"blefaroconjunctivite","dative-definite-genitive-plural":"blefaroconjunctivitelor","singular-vocative":"blefaroconjunctivită","plural-vocative":"blefaroconjunctivitelor"}},{"word":"blefarofimoză","pos":"noun","definitions":["blepharophimosis"],"forms":{"plural":"blefarofimoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blefarofimoză","accusative-definite-nominative-singular":"blefarofimoza","accusative-indefinite-nominative-plural":"blefarofimoze","accusative-definite-nominative-plural":"blefarofimozele","dative-genitive-indefinite-singular":"blefarofimoze","dative-definite-genitive-singular":"blefarofimozei","dative-genitive-indefinite-plural":"blefarofimoze","dative-definite-genitive-plural":"blefarofimozelor","singular-vocative":"blefarofimoză","plural-vocative":"blefarofimozelor"}},{"word":"blefaroplastie","pos":"noun","definitions":["blepharoplasty"],"forms":{"plural":"blefaroplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blefaroplastie","accusative-definite-nominative-singular":"blefaroplastia","accusative-indefinite-nominative-plural":"blefaroplastii","accusative-definite-nominative-plural":"blefaroplastiile","dative-genitive-indefinite-singular":"blefaroplastii","dative-definite-genitive-singular":"blefaroplastiei","dative-genitive-indefinite-plural":"blefaroplastii","dative-definite-genitive-plural":"blefaroplastiilor","singular-vocative":"blefaroplastie","plural-vocative":"blefaroplastiilor"}},{"word":"blefaroptoză","pos":"noun","definitions":["blepharoptosis"],"forms":{"plural":"blefaroptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blefaroptoză","accusative-definite-nominative-singular":"blefaroptoza","accusative-indefinite-nominative-plural":"blefaroptoze","accusative-definite-nominative-plural":"blefaroptozele","dative-genitive-indefinite-singular":"blefaroptoze","dative-definite-genitive-singular":"blefaroptozei","dative-genitive-indefinite-plural":"blefaroptoze","dative-definite-genitive-plural":"blefaroptozelor","singular-vocative":"blefaroptoză","plural-vocative":"blefaroptozelor"}},{"word":"blefarospasm","pos":"noun","definitions":["blepharospasm"],"forms":{"plural":"blefarospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blefarospasm","accusative-definite-nominative-singular":"blefarospasmul","accusative-indefinite-nominative-plural":"blefarospasme","accusative-definite-nominative-plural":"blefarospasmele","dative-genitive-indefinite-singular":"blefarospasm","dative-definite-genitive-singular":"blefarospasmului","dative-genitive-indefinite-plural":"blefarospasme","dative-definite-genitive-plural":"blefarospasmelor","singular-vocative":"blefarospasmule","plural-vocative":"blefarospasmelor"}},{"word":"blefarostat","pos":"noun","definitions":["blepharostat"],"forms":{"plural":"blefarostaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blefarostat","accusative-definite-nominative-singular":"blefarostatul","accusative-indefinite-nominative-plural":"blefarostaturi","accusative-definite-nominative-plural":"blefarostaturile","dative-genitive-indefinite-singular":"blefarostat","dative-definite-genitive-singular":"blefarostatului","dative-genitive-indefinite-plural":"blefarostaturi","dative-definite-genitive-plural":"blefarostaturilor","singular-vocative":"blefarostatule","plural-vocative":"blefarostaturilor"}},{"word":"bleg","pos":"adj","definitions":["soft, shy, silly, dull, weak, foolish, sheepish","going down, droopy"],"pronunciation":"/bleɡ/","forms":{"feminine-singular":"bleagă","masculine-plural":"blegi","feminine-neuter-plural":"blege","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bleg","error-unrecognized-form-feminine-indefinite-singular":"bleagă","error-unrecognized-form-indefinite-masculine-plural":"blegi","error-unrecognized-form-feminine-indefinite-neuter-plural":"blege","definite-error-unrecognized-form-masculine-neuter-singular":"blegul","definite-error-unrecognized-form-feminine-singular":"bleaga","definite-error-unrecognized-form-masculine-plural":"blegii","definite-error-unrecognized-form-feminine-neuter-plural":"blegele"}},{"word":"Blegescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Blegescu"}},{"word":"blehăire","pos":"noun","definitions":["bark (dog's)"],"forms":{"plural":"blehăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blehăire","accusative-definite-nominative-singular":"blehăirea","accusative-indefinite-nominative-plural":"blehăiri","accusative-definite-nominative-plural":"blehăirile","dative-genitive-indefinite-singular":"blehăiri","dative-definite-genitive-singular":"blehăirii","dative-genitive-indefinite-plural":"blehăiri","dative-definite-genitive-plural":"blehăirilor","singular-vocative":"blehăire","plural-vocative":"blehăirilor"}},{"word":"blehariță","pos":"noun","definitions":["European bitterling (Rhodeus amarus)"],"forms":{"plural":"bleharițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blehariță","accusative-definite-nominative-singular":"bleharița","accusative-indefinite-nominative-plural":"bleharițe","accusative-definite-nominative-plural":"bleharițele","dative-genitive-indefinite-singular":"bleharițe","dative-definite-genitive-singular":"blehariței","dative-genitive-indefinite-plural":"bleharițe","dative-definite-genitive-plural":"bleharițelor","singular-vocative":"blehariță","plural-vocative":"bleharițelor"}},{"word":"Blejani","pos":"name","definitions":["a village in Vedea, Argeș County, Romania","a village in Scundu, Vâlcea County, Romania"],"gender":"m"},{"word":"Blejești","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Blejești, Teleorman County, Romania"],"gender":"m"},{"word":"Blejoi","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Blejoi, Prahova County, Romania"],"gender":"m"},{"word":"blendă","pos":"noun","definitions":["blende"],"forms":{"plural":"blende","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blendă","accusative-definite-nominative-singular":"blenda","accusative-indefinite-nominative-plural":"blende","accusative-definite-nominative-plural":"blendele","dative-genitive-indefinite-singular":"blende","dative-definite-genitive-singular":"blendei","dative-genitive-indefinite-plural":"blende","dative-definite-genitive-plural":"blendelor","singular-vocative":"blendă","plural-vocative":"blendelor"}},{"word":"blenoragic","pos":"adj","definitions":["gonorrheal"],"forms":{"feminine-singular":"blenoragică","masculine-plural":"blenoragici","feminine-neuter-plural":"blenoragice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blenoragic","error-unrecognized-form-feminine-indefinite-singular":"blenoragică","error-unrecognized-form-indefinite-masculine-plural":"blenoragici","error-unrecognized-form-feminine-indefinite-neuter-plural":"blenoragice","definite-error-unrecognized-form-masculine-neuter-singular":"blenoragicul","definite-error-unrecognized-form-feminine-singular":"blenoragica","definite-error-unrecognized-form-masculine-plural":"blenoragicii","definite-error-unrecognized-form-feminine-neuter-plural":"blenoragicele"}},{"word":"blenoragie","pos":"noun","definitions":["gonorrhea"],"forms":{"plural":"blenoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blenoragie","accusative-definite-nominative-singular":"blenoragia","accusative-indefinite-nominative-plural":"blenoragii","accusative-definite-nominative-plural":"blenoragiile","dative-genitive-indefinite-singular":"blenoragii","dative-definite-genitive-singular":"blenoragiei","dative-genitive-indefinite-plural":"blenoragii","dative-definite-genitive-plural":"blenoragiilor","singular-vocative":"blenoragie","plural-vocative":"blenoragiilor"}},{"word":"blenoree","pos":"noun","definitions":["blennorrhea"],"forms":{"plural":"blenoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"blenoree","accusative-definite-nominative-singular":"blenoreea","accusative-indefinite-nominative-plural":"blenoree","accusative-definite-nominative-plural":"blenoreele","dative-genitive-indefinite-singular":"blenoree","dative-definite-genitive-singular":"blenoreei","dative-genitive-indefinite-plural":"blenoree","dative-definite-genitive-plural":"blenoreelor","singular-vocative":"blenoree","plural-vocative":"blenoreelor"}},{"word":"bleoazgă","pos":"noun","definitions":["marc"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bleoazgă","accusative-definite-nominative":"bleoazga","dative-genitive-indefinite":"bleoazge","dative-definite-genitive":"bleoazgei","vocative":"bleoazgă"}},{"word":"bleojdire","pos":"noun","definitions":["lethargy"],"forms":{"plural":"bleojdiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bleojdire","accusative-definite-nominative-singular":"bleojdirea","accusative-indefinite-nominative-plural":"bleojdiri","accusative-definite-nominative-plural":"bleojdirile","dative-genitive-indefinite-singular":"bleojdiri","dative-definite-genitive-singular":"bleojdirii","dative-genitive-indefinite-plural":"bleojdiri","dative-definite-genitive-plural":"bleojdirilor","singular-vocative":"bleojdire","plural-vocative":"bleojdirilor"}},{"word":"bleorcoteală","pos":"noun","definitions":["splashing, playing with water"],"forms":{"plural":"bleorcoteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bleorcoteală","accusative-definite-nominative-singular":"bleorcoteala","accusative-indefinite-nominative-plural":"bleorcotele","accusative-definite-nominative-plural":"bleorcotelele","dative-genitive-indefinite-singular":"bleorcotele","dative-definite-genitive-singular":"bleorcotelei","dative-genitive-indefinite-plural":"bleorcotele","dative-definite-genitive-plural":"bleorcotelelor","singular-vocative":"bleorcoteală","plural-vocative":"bleorcotelelor"}},{"word":"bleorcoti","pos":"verb","definitions":["to splash with the hands in water"],"forms":{"canonical":"a bleorcoti 4th conjugation","present-singular-third-person":"bleorcotie","participle-past":"bleorcotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bleorcoti","gerund":"bleorcotind","first-person-indicative-present-singular":"bleorcot","indicative-present-second-person-singular":"bleorcoți","indicative-present-singular-third-person":"bleorcote","first-person-indicative-plural-present":"bleorcotim","indicative-plural-present-second-person":"bleorcotiți","indicative-plural-present-third-person":"bleorcot","first-person-imperfect-indicative-singular":"bleorcoteam","imperfect-indicative-second-person-singular":"bleorcoteai","imperfect-indicative-singular-third-person":"bleorcotea","first-person-imperfect-indicative-plural":"bleorcoteam","imperfect-indicative-plural-second-person":"bleorcoteați","imperfect-indicative-plural-third-person":"bleorcoteau","first-person-indicative-perfect-singular":"bleorcotii","indicative-perfect-second-person-singular":"bleorcotiși","indicative-perfect-singular-third-person":"bleorcoti","first-person-indicative-perfect-plural":"bleorcotirăm","indicative-perfect-plural-second-person":"bleorcotirăți","indicative-perfect-plural-third-person":"bleorcotiră","first-person-indicative-pluperfect-singular":"bleorcotisem","indicative-pluperfect-second-person-singular":"bleorcotiseși","indicative-pluperfect-singular-third-person":"bleorcotise","first-person-indicative-pluperfect-plural":"bleorcotiserăm","indicative-pluperfect-plural-second-person":"bleorcotiserăți","indicative-pluperfect-plural-third-person":"bleorcotiseră","first-person-present-singular-subjunctive":"să bleorcot","present-second-person-singular-subjunctive":"să bleorcoți","present-singular-subjunctive-third-person":"să bleorcotă","first-person-plural-present-subjunctive":"să bleorcotim","plural-present-second-person-subjunctive":"să bleorcotiți","plural-present-subjunctive-third-person":"să bleorcotă","imperative-second-person-singular":"bleorcote","imperative-plural-second-person":"bleorcotiți","imperative-negative-second-person-singular":"nu bleorcoti","imperative-negative-plural-second-person":"nu bleorcotiți"}},{"word":"bleot","pos":"adj","definitions":["stupid"],"forms":{"feminine-singular":"bleotă","masculine-plural":"bleoți","feminine-neuter-plural":"bleote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bleot","error-unrecognized-form-feminine-indefinite-singular":"bleotă","error-unrecognized-form-indefinite-masculine-plural":"bleoți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bleote","definite-error-unrecognized-form-masculine-neuter-singular":"bleotul","definite-error-unrecognized-form-feminine-singular":"bleota","definite-error-unrecognized-form-masculine-plural":"bleoții","definite-error-unrecognized-form-feminine-neuter-plural":"bleotele"}},{"word":"bleoție","pos":"noun","definitions":["stupidity"],"forms":{"plural":"bleoții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bleoție","accusative-definite-nominative-singular":"bleoția","accusative-indefinite-nominative-plural":"bleoții","accusative-definite-nominative-plural":"bleoțiile","dative-genitive-indefinite-singular":"bleoții","dative-definite-genitive-singular":"bleoției","dative-genitive-indefinite-plural":"bleoții","dative-definite-genitive-plural":"bleoțiilor","singular-vocative":"bleoție","plural-vocative":"bleoțiilor"}},{"word":"bleotocăreală","pos":"noun","definitions":["chatter"],"forms":{"plural":"bleotocăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bleotocăreală","accusative-definite-nominative-singular":"bleotocăreala","accusative-indefinite-nominative-plural":"bleotocărele","accusative-definite-nominative-plural":"bleotocărelele","dative-genitive-indefinite-singular":"bleotocărele","dative-definite-genitive-singular":"bleotocărelei","dative-genitive-indefinite-plural":"bleotocărele","dative-definite-genitive-plural":"bleotocărelelor","singular-vocative":"bleotocăreală","plural-vocative":"bleotocărelelor"}},{"word":"blescăire","pos":"noun","definitions":["muddying"],"forms":{"plural":"blescăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blescăire","accusative-definite-nominative-singular":"blescăirea","accusative-indefinite-nominative-plural":"blescăiri","accusative-definite-nominative-plural":"blescăirile","dative-genitive-indefinite-singular":"blescăiri","dative-definite-genitive-singular":"blescăirii","dative-genitive-indefinite-plural":"blescăiri","dative-definite-genitive-plural":"blescăirilor","singular-vocative":"blescăire","plural-vocative":"blescăirilor"}},{"word":"bleșcuță","pos":"noun","definitions":["sheet (of metal)"],"forms":{"plural":"bleșcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bleșcuță","accusative-definite-nominative-singular":"bleșcuța","accusative-indefinite-nominative-plural":"bleșcuțe","accusative-definite-nominative-plural":"bleșcuțele","dative-genitive-indefinite-singular":"bleșcuțe","dative-definite-genitive-singular":"bleșcuței","dative-genitive-indefinite-plural":"bleșcuțe","dative-definite-genitive-plural":"bleșcuțelor","singular-vocative":"bleșcuță","plural-vocative":"bleșcuțelor"}},{"word":"blestem","pos":"noun","definitions":["curse"],"forms":{"plural":"blesteme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blestem","accusative-definite-nominative-singular":"blestemul","accusative-indefinite-nominative-plural":"blesteme","accusative-definite-nominative-plural":"blestemele","dative-genitive-indefinite-singular":"blestem","dative-definite-genitive-singular":"blestemului","dative-genitive-indefinite-plural":"blesteme","dative-definite-genitive-plural":"blestemelor","singular-vocative":"blestemule","plural-vocative":"blestemelor"}},{"word":"blestem","pos":"verb","definitions":["first-person singular present indicative/subjunctive of blestema"]},{"word":"blestema","pos":"verb","definitions":["to curse; to shame","to damn","to swear; to blaspheme"],"forms":{"canonical":"a blestema 1st conjugation","present-singular-third-person":"blestemă","participle-past":"blestemat","subjunctive-third-person":"blesteme","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a blestema","gerund":"blestemând","first-person-indicative-present-singular":"blestem","indicative-present-second-person-singular":"blestemi","indicative-present-singular-third-person":"blestemă","first-person-indicative-plural-present":"blestemăm","indicative-plural-present-second-person":"blestemați","indicative-plural-present-third-person":"blestemă","first-person-imperfect-indicative-singular":"blestemam","imperfect-indicative-second-person-singular":"blestemai","imperfect-indicative-singular-third-person":"blestema","first-person-imperfect-indicative-plural":"blestemam","imperfect-indicative-plural-second-person":"blestemați","imperfect-indicative-plural-third-person":"blestemau","first-person-indicative-perfect-singular":"blestemai","indicative-perfect-second-person-singular":"blestemași","indicative-perfect-singular-third-person":"blestemă","first-person-indicative-perfect-plural":"blestemarăm","indicative-perfect-plural-second-person":"blestemarăți","indicative-perfect-plural-third-person":"blestemară","first-person-indicative-pluperfect-singular":"blestemasem","indicative-pluperfect-second-person-singular":"blestemaseși","indicative-pluperfect-singular-third-person":"blestemase","first-person-indicative-pluperfect-plural":"blestemaserăm","indicative-pluperfect-plural-second-person":"blestemaserăți","indicative-pluperfect-plural-third-person":"blestemaseră","first-person-present-singular-subjunctive":"să blestem","present-second-person-singular-subjunctive":"să blestemi","present-singular-subjunctive-third-person":"să blesteme","first-person-plural-present-subjunctive":"să blestemăm","plural-present-second-person-subjunctive":"să blestemați","plural-present-subjunctive-third-person":"să blesteme","imperative-second-person-singular":"blestemă","imperative-plural-second-person":"blestemați","imperative-negative-second-person-singular":"nu blestema","imperative-negative-plural-second-person":"nu blestemați","alternative-regional":"blăstema"}},{"word":"blestemăciune","pos":"noun","definitions":["a wicked thing"],"forms":{"plural":"blestemăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blestemăciune","accusative-definite-nominative-singular":"blestemăciunea","accusative-indefinite-nominative-plural":"blestemăciuni","accusative-definite-nominative-plural":"blestemăciunile","dative-genitive-indefinite-singular":"blestemăciuni","dative-definite-genitive-singular":"blestemăciunii","dative-genitive-indefinite-plural":"blestemăciuni","dative-definite-genitive-plural":"blestemăciunilor","singular-vocative":"blestemăciune","plural-vocative":"blestemăciunilor"}},{"word":"blestemare","pos":"noun","definitions":["damning, cursing"],"forms":{"plural":"blestemări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blestemare","accusative-definite-nominative-singular":"blestemarea","accusative-indefinite-nominative-plural":"blestemări","accusative-definite-nominative-plural":"blestemările","dative-genitive-indefinite-singular":"blestemări","dative-definite-genitive-singular":"blestemării","dative-genitive-indefinite-plural":"blestemări","dative-definite-genitive-plural":"blestemărilor","singular-vocative":"blestemare","plural-vocative":"blestemărilor"}},{"word":"blestemat","pos":"adj","definitions":["cursed","accursed, damned","abominable","hateful"],"pronunciation":"/bles.teˈmat/","forms":{"feminine-singular":"blestemată","masculine-plural":"blestemați","feminine-neuter-plural":"blestemate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blestemat","error-unrecognized-form-feminine-indefinite-singular":"blestemată","error-unrecognized-form-indefinite-masculine-plural":"blestemați","error-unrecognized-form-feminine-indefinite-neuter-plural":"blestemate","definite-error-unrecognized-form-masculine-neuter-singular":"blestematul","definite-error-unrecognized-form-feminine-singular":"blestemata","definite-error-unrecognized-form-masculine-plural":"blestemații","definite-error-unrecognized-form-feminine-neuter-plural":"blestematele"}},{"word":"blestemat","pos":"verb","definitions":["past participle of blestema"],"pronunciation":"/bles.teˈmat/","forms":{"participle-past":"of blestema"}},{"word":"blestemățesc","pos":"adj","definitions":["accursed"],"forms":{"feminine-singular":"blestemățească","plural":"blestemățești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blestemățesc","error-unrecognized-form-feminine-indefinite-singular":"blestemățească","error-unrecognized-form-indefinite-masculine-plural":"blestemățești","error-unrecognized-form-feminine-indefinite-neuter-plural":"blestemățești","definite-error-unrecognized-form-masculine-neuter-singular":"blestemățescul","definite-error-unrecognized-form-feminine-singular":"blestemățeasca","definite-error-unrecognized-form-masculine-plural":"blestemățeștii","definite-error-unrecognized-form-feminine-neuter-plural":"blestemățeștile"}},{"word":"blestemăție","pos":"noun","definitions":["swear word","depravation"],"forms":{"plural":"blestemății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blestemăție","accusative-definite-nominative-singular":"blestemăția","accusative-indefinite-nominative-plural":"blestemății","accusative-definite-nominative-plural":"blestemățiile","dative-genitive-indefinite-singular":"blestemății","dative-definite-genitive-singular":"blestemăției","dative-genitive-indefinite-plural":"blestemății","dative-definite-genitive-plural":"blestemățiilor","singular-vocative":"blestemăție","plural-vocative":"blestemățiilor"}},{"word":"blestemul dimensionalității","pos":"noun","definitions":["curse of dimensionality"],"examples":[{"ro":"Acest fenomen este numit blestemul dimensionalității (engl. the curse of dimensionality), termen care a fost folosit pentru prima dată de Bellman [7].","en":"This phenomenon is called the curse of dimensionality (engl. the curse of dimensionality), a term that was first used by Bellman [7]."}]},{"word":"Bleșteni","pos":"name","definitions":["a village in Bleșteni, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"bleu","pos":"adj","definitions":["light blue"],"pronunciation":"/blø/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bleu","error-unrecognized-form-feminine-indefinite-singular":"bleu","error-unrecognized-form-indefinite-masculine-plural":"bleu","error-unrecognized-form-feminine-indefinite-neuter-plural":"bleu","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"bleu","pos":"noun","definitions":["light blue"],"pronunciation":"/blø/","forms":{"plural":"bleu-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bleu","accusative-definite-nominative-singular":"bleu-ul","accusative-indefinite-nominative-plural":"bleu-uri","accusative-definite-nominative-plural":"bleu-urile","dative-genitive-indefinite-singular":"bleu","dative-definite-genitive-singular":"bleu-ului","dative-genitive-indefinite-plural":"bleu-uri","dative-definite-genitive-plural":"bleu-urilor","singular-vocative":"bleu-ule","plural-vocative":"bleu-urilor"}},{"word":"bleumarin","pos":"noun","definitions":["navy blue"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bleumarin","accusative-definite-nominative":"bleumarinul","dative-genitive-indefinite":"bleumarin","dative-definite-genitive":"bleumarinului","vocative":"bleumarinule"}},{"word":"Blid","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blid"}},{"word":"blid","pos":"noun","definitions":["dish, bowl, container or receptacle for food"],"forms":{"plural":"blide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blid","accusative-definite-nominative-singular":"blidul","accusative-indefinite-nominative-plural":"blide","accusative-definite-nominative-plural":"blidele","dative-genitive-indefinite-singular":"blid","dative-definite-genitive-singular":"blidului","dative-genitive-indefinite-plural":"blide","dative-definite-genitive-plural":"blidelor","singular-vocative":"blidule","plural-vocative":"blidelor"}},{"word":"Blidar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Blidar"}},{"word":"blidar","pos":"noun","definitions":["bowlmaker"],"forms":{"plural":"blidari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blidar","accusative-definite-nominative-singular":"blidarul","accusative-indefinite-nominative-plural":"blidari","accusative-definite-nominative-plural":"blidarii","dative-genitive-indefinite-singular":"blidar","dative-definite-genitive-singular":"blidarului","dative-genitive-indefinite-plural":"blidari","dative-definite-genitive-plural":"blidarilor","singular-vocative":"blidarule","plural-vocative":"blidarilor"}},{"word":"Blidăreasa","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Anieș"],"gender":"f"},{"word":"Blidărești","pos":"name","definitions":["a village in Bobâlna, Cluj County, Romania"],"gender":"m"},{"word":"Blidari","pos":"name","definitions":["a village in Căiuți, Bacău County, Romania","a village in Cobia, Dâmbovița County, Romania","a village in Bălănești, Gorj County, Romania","a locality in Baia Mare, Maramureș County, Romania","a village in Golești, Vâlcea County, Romania"],"gender":"m"},{"word":"blidari","pos":"noun","definitions":["plural of blidar"]},{"word":"Blidariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Blidariu"}},{"word":"Blidaru","pos":"name","definitions":["a village in Greci, Mehedinți County, Romania"],"gender":"m"},{"word":"blidarul","pos":"noun","definitions":["definite nominative/accusative singular of blidar"]},{"word":"blidarului","pos":"noun","definitions":["definite genitive/dative singular of blidar"]},{"word":"blidăruș","pos":"noun","definitions":["diminutive of blidar"],"forms":{"plural":"blidărușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blidăruș","accusative-definite-nominative-singular":"blidărușul","accusative-indefinite-nominative-plural":"blidărușe","accusative-definite-nominative-plural":"blidărușele","dative-genitive-indefinite-singular":"blidăruș","dative-definite-genitive-singular":"blidărușului","dative-genitive-indefinite-plural":"blidărușe","dative-definite-genitive-plural":"blidărușelor","singular-vocative":"blidărușule","plural-vocative":"blidărușelor"}},{"word":"Blidești","pos":"name","definitions":["a village in Roșia Montană, Alba County, Romania"],"gender":"m"},{"word":"Blidireasa","pos":"name","definitions":["a village in Ibănești, Mureș County, Romania"],"gender":"f"},{"word":"blidișel","pos":"noun","definitions":["diminutive of blid"],"forms":{"plural":"blidișele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blidișel","accusative-definite-nominative-singular":"blidișelul","accusative-indefinite-nominative-plural":"blidișele","accusative-definite-nominative-plural":"blidișelele","dative-genitive-indefinite-singular":"blidișel","dative-definite-genitive-singular":"blidișelului","dative-genitive-indefinite-plural":"blidișele","dative-definite-genitive-plural":"blidișelelor","singular-vocative":"blidișelule","plural-vocative":"blidișelelor"}},{"word":"Blidul","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Urlătoarea"],"gender":"m"},{"word":"Blidul Popii","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Fântâneaua Rece"],"gender":"m"},{"word":"bliduț","pos":"noun","definitions":["diminutive of blid"],"forms":{"plural":"bliduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bliduț","accusative-definite-nominative-singular":"bliduțul","accusative-indefinite-nominative-plural":"bliduțe","accusative-definite-nominative-plural":"bliduțele","dative-genitive-indefinite-singular":"bliduț","dative-definite-genitive-singular":"bliduțului","dative-genitive-indefinite-plural":"bliduțe","dative-definite-genitive-plural":"bliduțelor","singular-vocative":"bliduțule","plural-vocative":"bliduțelor"}},{"word":"Blijnii Hutor","pos":"name","definitions":["a village in Blijnii Hutor, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"m"},{"word":"blimp","pos":"noun","definitions":["blimp"],"forms":{"plural":"blimpuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blimp","accusative-definite-nominative-singular":"blimpul","accusative-indefinite-nominative-plural":"blimpuri","accusative-definite-nominative-plural":"blimpurile","dative-genitive-indefinite-singular":"blimp","dative-definite-genitive-singular":"blimpului","dative-genitive-indefinite-plural":"blimpuri","dative-definite-genitive-plural":"blimpurilor","singular-vocative":"blimpule","plural-vocative":"blimpurilor"}},{"word":"blinda","pos":"verb","definitions":["to armor; to reinforce"],"forms":{"canonical":"a blinda 1st conjugation","present-singular-third-person":"blindează","participle-past":"blindat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a blinda","gerund":"blindând","first-person-indicative-present-singular":"blindez","indicative-present-second-person-singular":"blindezi","indicative-present-singular-third-person":"blindează","first-person-indicative-plural-present":"blindăm","indicative-plural-present-second-person":"blindați","indicative-plural-present-third-person":"blindează","first-person-imperfect-indicative-singular":"blindam","imperfect-indicative-second-person-singular":"blindai","imperfect-indicative-singular-third-person":"blinda","first-person-imperfect-indicative-plural":"blindam","imperfect-indicative-plural-second-person":"blindați","imperfect-indicative-plural-third-person":"blindau","first-person-indicative-perfect-singular":"blindai","indicative-perfect-second-person-singular":"blindași","indicative-perfect-singular-third-person":"blindă","first-person-indicative-perfect-plural":"blindarăm","indicative-perfect-plural-second-person":"blindarăți","indicative-perfect-plural-third-person":"blindară","first-person-indicative-pluperfect-singular":"blindasem","indicative-pluperfect-second-person-singular":"blindaseși","indicative-pluperfect-singular-third-person":"blindase","first-person-indicative-pluperfect-plural":"blindaserăm","indicative-pluperfect-plural-second-person":"blindaserăți","indicative-pluperfect-plural-third-person":"blindaseră","first-person-present-singular-subjunctive":"să blindez","present-second-person-singular-subjunctive":"să blindezi","present-singular-subjunctive-third-person":"să blindeze","first-person-plural-present-subjunctive":"să blindăm","plural-present-second-person-subjunctive":"să blindați","plural-present-subjunctive-third-person":"să blindeze","imperative-second-person-singular":"blindează","imperative-plural-second-person":"blindați","imperative-negative-second-person-singular":"nu blinda","imperative-negative-plural-second-person":"nu blindați"}},{"word":"blindaj","pos":"noun","definitions":["armor"],"forms":{"plural":"blindaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blindaj","accusative-definite-nominative-singular":"blindajul","accusative-indefinite-nominative-plural":"blindaje","accusative-definite-nominative-plural":"blindajele","dative-genitive-indefinite-singular":"blindaj","dative-definite-genitive-singular":"blindajului","dative-genitive-indefinite-plural":"blindaje","dative-definite-genitive-plural":"blindajelor","singular-vocative":"blindajule","plural-vocative":"blindajelor"}},{"word":"blindare","pos":"noun","definitions":["armoring"],"forms":{"plural":"blindări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blindare","accusative-definite-nominative-singular":"blindarea","accusative-indefinite-nominative-plural":"blindări","accusative-definite-nominative-plural":"blindările","dative-genitive-indefinite-singular":"blindări","dative-definite-genitive-singular":"blindării","dative-genitive-indefinite-plural":"blindări","dative-definite-genitive-plural":"blindărilor","singular-vocative":"blindare","plural-vocative":"blindărilor"}},{"word":"blindat","pos":"adj","definitions":["armored"],"forms":{"feminine-singular":"blindată","masculine-plural":"blindați","feminine-neuter-plural":"blindate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blindat","error-unrecognized-form-feminine-indefinite-singular":"blindată","error-unrecognized-form-indefinite-masculine-plural":"blindați","error-unrecognized-form-feminine-indefinite-neuter-plural":"blindate","definite-error-unrecognized-form-masculine-neuter-singular":"blindatul","definite-error-unrecognized-form-feminine-singular":"blindata","definite-error-unrecognized-form-masculine-plural":"blindații","definite-error-unrecognized-form-feminine-neuter-plural":"blindatele"}},{"word":"Blindești","pos":"name","definitions":["a village in Sculeni, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Blîndu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Blîndu"}},{"word":"blinie","pos":"noun","definitions":["blini"],"forms":{"plural":"blinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"blinie","accusative-definite-nominative-singular":"blinia","accusative-indefinite-nominative-plural":"blinii","accusative-definite-nominative-plural":"bliniile","dative-genitive-indefinite-singular":"blinii","dative-definite-genitive-singular":"bliniei","dative-genitive-indefinite-plural":"blinii","dative-definite-genitive-plural":"bliniilor","singular-vocative":"blinie","plural-vocative":"bliniilor"}},{"word":"blister","pos":"noun","definitions":["blister"],"forms":{"plural":"blistere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blister","accusative-definite-nominative-singular":"blisterul","accusative-indefinite-nominative-plural":"blistere","accusative-definite-nominative-plural":"blisterele","dative-genitive-indefinite-singular":"blister","dative-definite-genitive-singular":"blisterului","dative-genitive-indefinite-plural":"blistere","dative-definite-genitive-plural":"blisterelor","singular-vocative":"blisterule","plural-vocative":"blisterelor"}},{"word":"bliț","pos":"noun","definitions":["flash"],"forms":{"plural":"blițuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bliț","accusative-definite-nominative-singular":"blițul","accusative-indefinite-nominative-plural":"blițuri","accusative-definite-nominative-plural":"blițurile","dative-genitive-indefinite-singular":"bliț","dative-definite-genitive-singular":"blițului","dative-genitive-indefinite-plural":"blițuri","dative-definite-genitive-plural":"blițurilor","singular-vocative":"blițule","plural-vocative":"blițurilor"}},{"word":"blitzkrieg","pos":"noun","definitions":["blitzkrieg"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"blitzkrieg","accusative-definite-nominative":"blitzkriegul","dative-genitive-indefinite":"blitzkrieg","dative-definite-genitive":"blitzkriegului","vocative":"blitzkriegule"}},{"word":"bloc","pos":"noun","definitions":["block (a big chunk of solid matter)","a heap or an ensemble of objects of the same type that form a unity","apartment building","bloc"],"pronunciation":"/ˈblok/","examples":[{"ro":"bloc de gheață","en":"block of ice"},{"ro":"bloc de desen","en":"drawing block"}],"forms":{"plural":"blocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bloc","accusative-definite-nominative-singular":"blocul","accusative-indefinite-nominative-plural":"blocuri","accusative-definite-nominative-plural":"blocurile","dative-genitive-indefinite-singular":"bloc","dative-definite-genitive-singular":"blocului","dative-genitive-indefinite-plural":"blocuri","dative-definite-genitive-plural":"blocurilor","singular-vocative":"blocule","plural-vocative":"blocurilor"}},{"word":"bloc cardiac","pos":"noun","definitions":["heart block"]},{"word":"bloc motor","pos":"noun","definitions":["engine block"]},{"word":"bloca","pos":"verb","definitions":["to block; to obstruct"],"pronunciation":"/bloˈka/","forms":{"canonical":"a bloca 1st conjugation","present-singular-third-person":"blochează","participle-past":"blocat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bloca","gerund":"blocând","first-person-indicative-present-singular":"blochez","indicative-present-second-person-singular":"blochezi","indicative-present-singular-third-person":"blochează","first-person-indicative-plural-present":"blocăm","indicative-plural-present-second-person":"blocați","indicative-plural-present-third-person":"blochează","first-person-imperfect-indicative-singular":"blocam","imperfect-indicative-second-person-singular":"blocai","imperfect-indicative-singular-third-person":"bloca","first-person-imperfect-indicative-plural":"blocam","imperfect-indicative-plural-second-person":"blocați","imperfect-indicative-plural-third-person":"blocau","first-person-indicative-perfect-singular":"blocai","indicative-perfect-second-person-singular":"blocași","indicative-perfect-singular-third-person":"blocă","first-person-indicative-perfect-plural":"blocarăm","indicative-perfect-plural-second-person":"blocarăți","indicative-perfect-plural-third-person":"blocară","first-person-indicative-pluperfect-singular":"blocasem","indicative-pluperfect-second-person-singular":"blocaseși","indicative-pluperfect-singular-third-person":"blocase","first-person-indicative-pluperfect-plural":"blocaserăm","indicative-pluperfect-plural-second-person":"blocaserăți","indicative-pluperfect-plural-third-person":"blocaseră","first-person-present-singular-subjunctive":"să blochez","present-second-person-singular-subjunctive":"să blochezi","present-singular-subjunctive-third-person":"să blocheze","first-person-plural-present-subjunctive":"să blocăm","plural-present-second-person-subjunctive":"să blocați","plural-present-subjunctive-third-person":"să blocheze","imperative-second-person-singular":"blochează","imperative-plural-second-person":"blocați","imperative-negative-second-person-singular":"nu bloca","imperative-negative-plural-second-person":"nu blocați"}},{"word":"blocadă","pos":"noun","definitions":["blockade (systematic diplomatic, military or economic measures to isolate cities, states or blocs)"],"pronunciation":"/bloˈka.də/","forms":{"plural":"blocade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blocadă","accusative-definite-nominative-singular":"blocada","accusative-indefinite-nominative-plural":"blocade","accusative-definite-nominative-plural":"blocadele","dative-genitive-indefinite-singular":"blocade","dative-definite-genitive-singular":"blocadei","dative-genitive-indefinite-plural":"blocade","dative-definite-genitive-plural":"blocadelor","singular-vocative":"blocadă","plural-vocative":"blocadelor"}},{"word":"blocaj","pos":"noun","definitions":["jam","ballast (Coarse gravel or similar material laid to form a bed for roads or railroads.)","blockade"],"forms":{"plural":"blocaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"blocaj","accusative-definite-nominative-singular":"blocajul","accusative-indefinite-nominative-plural":"blocaje","accusative-definite-nominative-plural":"blocajele","dative-genitive-indefinite-singular":"blocaj","dative-definite-genitive-singular":"blocajului","dative-genitive-indefinite-plural":"blocaje","dative-definite-genitive-plural":"blocajelor","singular-vocative":"blocajule","plural-vocative":"blocajelor"}},{"word":"blocare","pos":"noun","definitions":["locking"],"forms":{"plural":"blocări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"blocare","accusative-definite-nominative-singular":"blocarea","accusative-indefinite-nominative-plural":"blocări","accusative-definite-nominative-plural":"blocările","dative-genitive-indefinite-singular":"blocări","dative-definite-genitive-singular":"blocării","dative-genitive-indefinite-plural":"blocări","dative-definite-genitive-plural":"blocărilor","singular-vocative":"blocare","plural-vocative":"blocărilor"}},{"word":"blocase","pos":"verb","definitions":["third-person singular pluperfect indicative of bloca"],"pronunciation":"[bloˈkase]"},{"word":"blocat","pos":"noun","definitions":["locking"],"forms":{"plural":"blocaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blocat","accusative-definite-nominative-singular":"blocatul","accusative-indefinite-nominative-plural":"blocaturi","accusative-definite-nominative-plural":"blocaturile","dative-genitive-indefinite-singular":"blocat","dative-definite-genitive-singular":"blocatului","dative-genitive-indefinite-plural":"blocaturi","dative-definite-genitive-plural":"blocaturilor","singular-vocative":"blocatule","plural-vocative":"blocaturilor"}},{"word":"blocat","pos":"verb","definitions":["past participle of bloca"],"forms":{"participle-past":"of bloca"}},{"word":"blocdiagramă","pos":"noun","definitions":["block diagram"],"forms":{"plural":"blocdiagrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blocdiagramă","accusative-definite-nominative-singular":"blocdiagrama","accusative-indefinite-nominative-plural":"blocdiagrame","accusative-definite-nominative-plural":"blocdiagramele","dative-genitive-indefinite-singular":"blocdiagrame","dative-definite-genitive-singular":"blocdiagramei","dative-genitive-indefinite-plural":"blocdiagrame","dative-definite-genitive-plural":"blocdiagramelor","singular-vocative":"blocdiagramă","plural-vocative":"blocdiagramelor"}},{"word":"blochaus","pos":"noun","definitions":["apartment building"],"forms":{"plural":"blochausuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blochaus","accusative-definite-nominative-singular":"blochausul","accusative-indefinite-nominative-plural":"blochausuri","accusative-definite-nominative-plural":"blochausurile","dative-genitive-indefinite-singular":"blochaus","dative-definite-genitive-singular":"blochausului","dative-genitive-indefinite-plural":"blochausuri","dative-definite-genitive-plural":"blochausurilor","singular-vocative":"blochausule","plural-vocative":"blochausurilor"}},{"word":"blocnotes","pos":"noun","definitions":["notebook"],"forms":{"plural":"blocnotesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blocnotes","accusative-definite-nominative-singular":"blocnotesul","accusative-indefinite-nominative-plural":"blocnotesuri","accusative-definite-nominative-plural":"blocnotesurile","dative-genitive-indefinite-singular":"blocnotes","dative-definite-genitive-singular":"blocnotesului","dative-genitive-indefinite-plural":"blocnotesuri","dative-definite-genitive-plural":"blocnotesurilor","singular-vocative":"blocnotesule","plural-vocative":"blocnotesurilor"}},{"word":"Blocul Răsăritean","pos":"name","definitions":["Eastern Bloc"],"gender":"n"},{"word":"blocuri","pos":"noun","definitions":["plural of bloc"],"gender":"n-p"},{"word":"blocus","pos":"noun","definitions":["obsolete form of bloc"],"forms":{"plural":"blocusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blocus","accusative-definite-nominative-singular":"blocusul","accusative-indefinite-nominative-plural":"blocusuri","accusative-definite-nominative-plural":"blocusurile","dative-genitive-indefinite-singular":"blocus","dative-definite-genitive-singular":"blocusului","dative-genitive-indefinite-plural":"blocusuri","dative-definite-genitive-plural":"blocusurilor","singular-vocative":"blocusule","plural-vocative":"blocusurilor"}},{"word":"blodărie","pos":"noun","definitions":["embroidery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"blodărie","accusative-definite-nominative":"blodăria","dative-genitive-indefinite":"blodării","dative-definite-genitive":"blodăriei","vocative":"blodărie"}},{"word":"blodogori","pos":"verb","definitions":["to speak a foreign tongue that cannot be understood"],"forms":{"canonical":"a blodogori 4th conjugation","present-singular-third-person":"blodogorește","participle-past":"blodogorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blodogori","gerund":"blodogorind","first-person-indicative-present-singular":"blodogoresc","indicative-present-second-person-singular":"blodogorești","indicative-present-singular-third-person":"blodogorește","first-person-indicative-plural-present":"blodogorim","indicative-plural-present-second-person":"blodogoriți","indicative-plural-present-third-person":"blodogoresc","first-person-imperfect-indicative-singular":"blodogoream","imperfect-indicative-second-person-singular":"blodogoreai","imperfect-indicative-singular-third-person":"blodogorea","first-person-imperfect-indicative-plural":"blodogoream","imperfect-indicative-plural-second-person":"blodogoreați","imperfect-indicative-plural-third-person":"blodogoreau","first-person-indicative-perfect-singular":"blodogorii","indicative-perfect-second-person-singular":"blodogoriși","indicative-perfect-singular-third-person":"blodogori","first-person-indicative-perfect-plural":"blodogorirăm","indicative-perfect-plural-second-person":"blodogorirăți","indicative-perfect-plural-third-person":"blodogoriră","first-person-indicative-pluperfect-singular":"blodogorisem","indicative-pluperfect-second-person-singular":"blodogoriseși","indicative-pluperfect-singular-third-person":"blodogorise","first-person-indicative-pluperfect-plural":"blodogoriserăm","indicative-pluperfect-plural-second-person":"blodogoriserăți","indicative-pluperfect-plural-third-person":"blodogoriseră","first-person-present-singular-subjunctive":"să blodogoresc","present-second-person-singular-subjunctive":"să blodogorești","present-singular-subjunctive-third-person":"să blodogorească","first-person-plural-present-subjunctive":"să blodogorim","plural-present-second-person-subjunctive":"să blodogoriți","plural-present-subjunctive-third-person":"să blodogorească","imperative-second-person-singular":"blodogorește","imperative-plural-second-person":"blodogoriți","imperative-negative-second-person-singular":"nu blodogori","imperative-negative-plural-second-person":"nu blodogoriți"}},{"word":"blogger","pos":"noun","definitions":["blogger"],"pronunciation":"/ˈblo.ɡər/","forms":{"plural":"bloggeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blogger","accusative-definite-nominative-singular":"bloggerul","accusative-indefinite-nominative-plural":"bloggeri","accusative-definite-nominative-plural":"bloggerii","dative-genitive-indefinite-singular":"blogger","dative-definite-genitive-singular":"bloggerului","dative-genitive-indefinite-plural":"bloggeri","dative-definite-genitive-plural":"bloggerilor","singular-vocative":"bloggerule","plural-vocative":"bloggerilor"}},{"word":"bloggeri","pos":"noun","definitions":["plural of blogger"],"gender":"m"},{"word":"blojăritură","pos":"noun","definitions":["fabrication, fable"],"forms":{"plural":"blojărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"blojăritură","accusative-definite-nominative-singular":"blojăritura","accusative-indefinite-nominative-plural":"blojărituri","accusative-definite-nominative-plural":"blojăriturile","dative-genitive-indefinite-singular":"blojărituri","dative-definite-genitive-singular":"blojăriturii","dative-genitive-indefinite-plural":"blojărituri","dative-definite-genitive-plural":"blojăriturilor","singular-vocative":"blojăritură","plural-vocative":"blojăriturilor"}},{"word":"blojeritor","pos":"noun","definitions":["slanderer"],"forms":{"plural":"blojeritori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"blojeritor","accusative-definite-nominative-singular":"blojeritorul","accusative-indefinite-nominative-plural":"blojeritori","accusative-definite-nominative-plural":"blojeritorii","dative-genitive-indefinite-singular":"blojeritor","dative-definite-genitive-singular":"blojeritorului","dative-genitive-indefinite-plural":"blojeritori","dative-definite-genitive-plural":"blojeritorilor","singular-vocative":"blojeritorule","plural-vocative":"blojeritorilor"}},{"word":"Blojița","pos":"name","definitions":["a river in Maramureș County, Romania, tributary to the Bloaja"],"gender":"f"},{"word":"blojitură","pos":"noun","definitions":["dirt, filth, grime"],"forms":{"plural":"blojituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"blojitură","accusative-definite-nominative-singular":"blojitura","accusative-indefinite-nominative-plural":"blojituri","accusative-definite-nominative-plural":"blojiturile","dative-genitive-indefinite-singular":"blojituri","dative-definite-genitive-singular":"blojiturii","dative-genitive-indefinite-plural":"blojituri","dative-definite-genitive-plural":"blojiturilor","singular-vocative":"blojitură","plural-vocative":"blojiturilor"}},{"word":"blonci","pos":"noun","definitions":["knot"],"forms":{"plural":"blonciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blonci","accusative-definite-nominative-singular":"blonciul","accusative-indefinite-nominative-plural":"blonciuri","accusative-definite-nominative-plural":"blonciurile","dative-genitive-indefinite-singular":"blonci","dative-definite-genitive-singular":"blonciului","dative-genitive-indefinite-plural":"blonciuri","dative-definite-genitive-plural":"blonciurilor","singular-vocative":"blonciule","plural-vocative":"blonciurilor"}},{"word":"blond","pos":"adj","definitions":["blond"],"pronunciation":"/blond/","forms":{"feminine-singular":"blondă","masculine-plural":"blonzi","feminine-neuter-plural":"blonde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blond","error-unrecognized-form-feminine-indefinite-singular":"blondă","error-unrecognized-form-indefinite-masculine-plural":"blonzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"blonde","definite-error-unrecognized-form-masculine-neuter-singular":"blondul","definite-error-unrecognized-form-feminine-singular":"blonda","definite-error-unrecognized-form-masculine-plural":"blonzii","definite-error-unrecognized-form-feminine-neuter-plural":"blondele"}},{"word":"blondă","pos":"noun","definitions":["blonde"],"forms":{"plural":"blonde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blondă","accusative-definite-nominative-singular":"blonda","accusative-indefinite-nominative-plural":"blonde","accusative-definite-nominative-plural":"blondele","dative-genitive-indefinite-singular":"blonde","dative-definite-genitive-singular":"blondei","dative-genitive-indefinite-plural":"blonde","dative-definite-genitive-plural":"blondelor","singular-vocative":"blondă","plural-vocative":"blondelor"}},{"word":"blondețe","pos":"noun","definitions":["blondeness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"blondețe","accusative-definite-nominative":"blondețea","dative-genitive-indefinite":"blondeți","dative-definite-genitive":"blondeții","vocative":"blondețe"}},{"word":"blondin","pos":"adj","definitions":["blond"],"forms":{"feminine-singular":"blondină","masculine-plural":"blondini","feminine-neuter-plural":"blondine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blondin","error-unrecognized-form-feminine-indefinite-singular":"blondină","error-unrecognized-form-indefinite-masculine-plural":"blondini","error-unrecognized-form-feminine-indefinite-neuter-plural":"blondine","definite-error-unrecognized-form-masculine-neuter-singular":"blondinul","definite-error-unrecognized-form-feminine-singular":"blondina","definite-error-unrecognized-form-masculine-plural":"blondinii","definite-error-unrecognized-form-feminine-neuter-plural":"blondinele"}},{"word":"blondină","pos":"noun","definitions":["female equivalent of blondin"],"forms":{"plural":"blondine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"blondină","accusative-definite-nominative-singular":"blondina","accusative-indefinite-nominative-plural":"blondine","accusative-definite-nominative-plural":"blondinele","dative-genitive-indefinite-singular":"blondine","dative-definite-genitive-singular":"blondinei","dative-genitive-indefinite-plural":"blondine","dative-definite-genitive-plural":"blondinelor","singular-vocative":"blondină","plural-vocative":"blondinelor"}},{"word":"blonzi","pos":"verb","definitions":["to become blond"],"forms":{"canonical":"a blonzi 4th conjugation","present-singular-third-person":"blonzește","participle-past":"blonzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a blonzi","gerund":"blonzind","first-person-indicative-present-singular":"blonzesc","indicative-present-second-person-singular":"blonzești","indicative-present-singular-third-person":"blonzește","first-person-indicative-plural-present":"blonzim","indicative-plural-present-second-person":"blonziți","indicative-plural-present-third-person":"blonzesc","first-person-imperfect-indicative-singular":"blonzeam","imperfect-indicative-second-person-singular":"blonzeai","imperfect-indicative-singular-third-person":"blonzea","first-person-imperfect-indicative-plural":"blonzeam","imperfect-indicative-plural-second-person":"blonzeați","imperfect-indicative-plural-third-person":"blonzeau","first-person-indicative-perfect-singular":"blonzii","indicative-perfect-second-person-singular":"blonziși","indicative-perfect-singular-third-person":"blonzi","first-person-indicative-perfect-plural":"blonzirăm","indicative-perfect-plural-second-person":"blonzirăți","indicative-perfect-plural-third-person":"blonziră","first-person-indicative-pluperfect-singular":"blonzisem","indicative-pluperfect-second-person-singular":"blonziseși","indicative-pluperfect-singular-third-person":"blonzise","first-person-indicative-pluperfect-plural":"blonziserăm","indicative-pluperfect-plural-second-person":"blonziserăți","indicative-pluperfect-plural-third-person":"blonziseră","first-person-present-singular-subjunctive":"să blonzesc","present-second-person-singular-subjunctive":"să blonzești","present-singular-subjunctive-third-person":"să blonzească","first-person-plural-present-subjunctive":"să blonzim","plural-present-second-person-subjunctive":"să blonziți","plural-present-subjunctive-third-person":"să blonzească","imperative-second-person-singular":"blonzește","imperative-plural-second-person":"blonziți","imperative-negative-second-person-singular":"nu blonzi","imperative-negative-plural-second-person":"nu blonziți"}}];
@@ -0,0 +1 @@
+export default [{"word":"blonziu","pos":"adj","definitions":["blondish"],"forms":{"feminine-singular":"blonzie","plural":"blonzii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"blonziu","error-unrecognized-form-feminine-indefinite-singular":"blonzie","error-unrecognized-form-indefinite-masculine-plural":"blonzii","error-unrecognized-form-feminine-indefinite-neuter-plural":"blonzii","definite-error-unrecognized-form-masculine-neuter-singular":"blonziul","definite-error-unrecognized-form-feminine-singular":"blonzia","definite-error-unrecognized-form-masculine-plural":"blonziii","definite-error-unrecognized-form-feminine-neuter-plural":"blonziile"}},{"word":"blucă","pos":"noun","definitions":["a small snowball"],"forms":{"plural":"bluci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"blucă","accusative-definite-nominative-singular":"bluca","accusative-indefinite-nominative-plural":"bluci","accusative-definite-nominative-plural":"blucile","dative-genitive-indefinite-singular":"bluci","dative-definite-genitive-singular":"blucii","dative-genitive-indefinite-plural":"bluci","dative-definite-genitive-plural":"blucilor","singular-vocative":"blucă","plural-vocative":"blucilor"}},{"word":"bluejeans","pos":"noun","definitions":["blue jeans"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bluejeans","accusative-definite-nominative":"bluejeansul","dative-genitive-indefinite":"bluejeans","dative-definite-genitive":"bluejeansului","vocative":"bluejeansule"}},{"word":"blues","pos":"noun","definitions":["blues (a musical genre of African American origin)","blues (a blues composition)"],"forms":{"plural":"bluesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blues","accusative-definite-nominative-singular":"bluesul","accusative-indefinite-nominative-plural":"bluesuri","accusative-definite-nominative-plural":"bluesurile","dative-genitive-indefinite-singular":"blues","dative-definite-genitive-singular":"bluesului","dative-genitive-indefinite-plural":"bluesuri","dative-definite-genitive-plural":"bluesurilor","singular-vocative":"bluesule","plural-vocative":"bluesurilor"}},{"word":"bluf","pos":"noun","definitions":["bluff"],"forms":{"plural":"blufuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bluf","accusative-definite-nominative-singular":"bluful","accusative-indefinite-nominative-plural":"blufuri","accusative-definite-nominative-plural":"blufurile","dative-genitive-indefinite-singular":"bluf","dative-definite-genitive-singular":"blufului","dative-genitive-indefinite-plural":"blufuri","dative-definite-genitive-plural":"blufurilor","singular-vocative":"blufule","plural-vocative":"blufurilor"}},{"word":"bluff","pos":"noun","definitions":["bluff"],"forms":{"plural":"bluffuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bluff","accusative-definite-nominative-singular":"blufful","accusative-indefinite-nominative-plural":"bluffuri","accusative-definite-nominative-plural":"bluffurile","dative-genitive-indefinite-singular":"bluff","dative-definite-genitive-singular":"bluffului","dative-genitive-indefinite-plural":"bluffuri","dative-definite-genitive-plural":"bluffurilor","singular-vocative":"bluffule","plural-vocative":"bluffurilor"}},{"word":"blugi","pos":"noun","definitions":["jeans"],"forms":{"singular":"blug","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"blugi","accusative-definite-nominative":"blugii","dative-genitive-indefinite":"blugi","dative-definite-genitive":"blugilor","vocative":"blugilor"}},{"word":"Blujdescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Blujdescu"}},{"word":"blum","pos":"noun","definitions":["bloom"],"forms":{"plural":"blumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"blum","accusative-definite-nominative-singular":"blumul","accusative-indefinite-nominative-plural":"blumuri","accusative-definite-nominative-plural":"blumurile","dative-genitive-indefinite-singular":"blum","dative-definite-genitive-singular":"blumului","dative-genitive-indefinite-plural":"blumuri","dative-definite-genitive-plural":"blumurilor","singular-vocative":"blumule","plural-vocative":"blumurilor"}},{"word":"bluza","pos":"noun","definitions":["definite nominative/accusative singular of bluză"],"pronunciation":"[ˈbluza]","gender":"f"},{"word":"bluză","pos":"noun","definitions":["blouse (an outer garment, usually loose, that is similar to a shirt)"],"forms":{"plural":"bluze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bluză","accusative-definite-nominative-singular":"bluza","accusative-indefinite-nominative-plural":"bluze","accusative-definite-nominative-plural":"bluzele","dative-genitive-indefinite-singular":"bluze","dative-definite-genitive-singular":"bluzei","dative-genitive-indefinite-plural":"bluze","dative-definite-genitive-plural":"bluzelor","singular-vocative":"bluză","plural-vocative":"bluzelor"}},{"word":"bluzar","pos":"noun","definitions":["worker"],"forms":{"plural":"bluzari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bluzar","accusative-definite-nominative-singular":"bluzarul","accusative-indefinite-nominative-plural":"bluzari","accusative-definite-nominative-plural":"bluzarii","dative-genitive-indefinite-singular":"bluzar","dative-definite-genitive-singular":"bluzarului","dative-genitive-indefinite-plural":"bluzari","dative-definite-genitive-plural":"bluzarilor","singular-vocative":"bluzarule","plural-vocative":"bluzarilor"}},{"word":"bluziță","pos":"noun","definitions":["diminutive of bluză"],"forms":{"plural":"bluzițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bluziță","accusative-definite-nominative-singular":"bluzița","accusative-indefinite-nominative-plural":"bluzițe","accusative-definite-nominative-plural":"bluzițele","dative-genitive-indefinite-singular":"bluzițe","dative-definite-genitive-singular":"bluziței","dative-genitive-indefinite-plural":"bluzițe","dative-definite-genitive-plural":"bluzițelor","singular-vocative":"bluziță","plural-vocative":"bluzițelor"}},{"word":"bluzo","pos":"noun","definitions":["vocative singular of bluză"],"pronunciation":"[ˈbluzo]","gender":"f"},{"word":"bluzon","pos":"noun","definitions":["blouson"],"forms":{"plural":"bluzoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bluzon","accusative-definite-nominative-singular":"bluzonul","accusative-indefinite-nominative-plural":"bluzoane","accusative-definite-nominative-plural":"bluzoanele","dative-genitive-indefinite-singular":"bluzon","dative-definite-genitive-singular":"bluzonului","dative-genitive-indefinite-plural":"bluzoane","dative-definite-genitive-plural":"bluzoanelor","singular-vocative":"bluzonule","plural-vocative":"bluzoanelor"}},{"word":"bluzuliță","pos":"noun","definitions":["diminutive of bluză"],"forms":{"plural":"bluzulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bluzuliță","accusative-definite-nominative-singular":"bluzulița","accusative-indefinite-nominative-plural":"bluzulițe","accusative-definite-nominative-plural":"bluzulițele","dative-genitive-indefinite-singular":"bluzulițe","dative-definite-genitive-singular":"bluzuliței","dative-genitive-indefinite-plural":"bluzulițe","dative-definite-genitive-plural":"bluzulițelor","singular-vocative":"bluzuliță","plural-vocative":"bluzulițelor"}},{"word":"BN","pos":"name","definitions":["initialism of Bistrița-Năsăud: a county of Romania"]},{"word":"bn","pos":"adv","definitions":["abbreviation of bine (“well”)"]},{"word":"bn","pos":"adj","definitions":["abbreviation of bine (“good”)"]},{"word":"boa","pos":"noun","definitions":["boa constrictor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"boa","accusative-definite-nominative":"boaul","dative-genitive-indefinite":"boa","dative-definite-genitive":"boaului","vocative":"boaule"}},{"word":"Boabă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boabă"}},{"word":"boabă","pos":"noun","definitions":["a grain, seed, berry"],"forms":{"plural":"boabe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boabă","accusative-definite-nominative-singular":"boaba","accusative-indefinite-nominative-plural":"boabe","accusative-definite-nominative-plural":"boabele","dative-genitive-indefinite-singular":"boabe","dative-definite-genitive-singular":"boabei","dative-genitive-indefinite-plural":"boabe","dative-definite-genitive-plural":"boabelor","singular-vocative":"boabă","plural-vocative":"boabelor"}},{"word":"boabab","pos":"noun","definitions":["alternative form of baobab"],"forms":{"plural":"boababi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boabab","accusative-definite-nominative-singular":"boababul","accusative-indefinite-nominative-plural":"boababi","accusative-definite-nominative-plural":"boababii","dative-genitive-indefinite-singular":"boabab","dative-definite-genitive-singular":"boababului","dative-genitive-indefinite-plural":"boababi","dative-definite-genitive-plural":"boababilor","singular-vocative":"boababule","plural-vocative":"boababilor"}},{"word":"boabe","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of bob"]},{"word":"boabele","pos":"noun","definitions":["definite nominative/accusative plural of bob"]},{"word":"boabelor","pos":"noun","definitions":["definite genitive/dative plural of bob"]},{"word":"boacă","pos":"noun","definitions":["zilch"],"forms":{"plural":"boace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boacă","accusative-definite-nominative-singular":"boaca","accusative-indefinite-nominative-plural":"boace","accusative-definite-nominative-plural":"boacele","dative-genitive-indefinite-singular":"boace","dative-definite-genitive-singular":"boacei","dative-genitive-indefinite-plural":"boace","dative-definite-genitive-plural":"boacelor","singular-vocative":"boacă","plural-vocative":"boacelor"}},{"word":"boacănă","pos":"noun","definitions":["blunder, mistake"],"pronunciation":"/ˈbo̯a.kə.nə/","forms":{"plural":"boacăne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boacănă","accusative-definite-nominative-singular":"boacăna","accusative-indefinite-nominative-plural":"boacăne","accusative-definite-nominative-plural":"boacănele","dative-genitive-indefinite-singular":"boacăne","dative-definite-genitive-singular":"boacănei","dative-genitive-indefinite-plural":"boacăne","dative-definite-genitive-plural":"boacănelor","singular-vocative":"boacănă","plural-vocative":"boacănelor"}},{"word":"boace","pos":"noun","definitions":["voice","word, term"],"pronunciation":"/ˈbo̯at͡ʃe/","forms":{"plural":"boci"}},{"word":"boactăr","pos":"noun","definitions":["night watchman"],"forms":{"plural":"boactări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boactăr","accusative-definite-nominative-singular":"boactărul","accusative-indefinite-nominative-plural":"boactări","accusative-definite-nominative-plural":"boactării","dative-genitive-indefinite-singular":"boactăr","dative-definite-genitive-singular":"boactărului","dative-genitive-indefinite-plural":"boactări","dative-definite-genitive-plural":"boactărilor","singular-vocative":"boactărule","plural-vocative":"boactărilor"}},{"word":"boacter","pos":"noun","definitions":["night watchman, railway guard","municipal officer responsible for collecting taxes","canton keeper","policeman","village drummer or town crier"],"pronunciation":"/ˈbo̯ak.ter/","examples":[{"ro":"“Dacă umbli cu 25-ul de noapte, după ora 22:00, nu uita să compostezi, e plin de boacteri!”","en":"“If you're taking the night bus number 25 after 10 PM, don’t forget to validate your ticket—it’s full of ticket inspectors!”"}],"forms":{"plural":"boacteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boacter","accusative-definite-nominative-singular":"boacterul","accusative-indefinite-nominative-plural":"boacteri","accusative-definite-nominative-plural":"boacterii","dative-genitive-indefinite-singular":"boacter","dative-definite-genitive-singular":"boacterului","dative-genitive-indefinite-plural":"boacteri","dative-definite-genitive-plural":"boacterilor","singular-vocative":"boacterule","plural-vocative":"boacterilor"}},{"word":"boaită","pos":"noun","definitions":["a cow"],"forms":{"plural":"boaite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boaită","accusative-definite-nominative-singular":"boaita","accusative-indefinite-nominative-plural":"boaite","accusative-definite-nominative-plural":"boaitele","dative-genitive-indefinite-singular":"boaite","dative-definite-genitive-singular":"boaitei","dative-genitive-indefinite-plural":"boaite","dative-definite-genitive-plural":"boaitelor","singular-vocative":"boaită","plural-vocative":"boaitelor"}},{"word":"boala","pos":"noun","definitions":["definite nominative/accusative singular of boală"],"pronunciation":"/ˈbo̯a.la/","gender":"f"},{"word":"boală","pos":"noun","definitions":["disease, sickness, illness"],"pronunciation":"[ˈbo̯alə]","examples":[{"ro":"o boală contagioasă","en":"a contagious disease"}],"forms":{"plural":"boli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boală","accusative-definite-nominative-singular":"boala","accusative-indefinite-nominative-plural":"boli","accusative-definite-nominative-plural":"bolile","dative-genitive-indefinite-singular":"boli","dative-definite-genitive-singular":"bolii","dative-genitive-indefinite-plural":"boli","dative-definite-genitive-plural":"bolilor","singular-vocative":"boală","plural-vocative":"bolilor"}},{"word":"boala Alzheimer","pos":"noun","definitions":["Alzheimer's disease"]},{"word":"boală lipicioasă","pos":"noun","definitions":["contagious disease"],"examples":[{"ro":"Mi se pare că guturaiul este o boală lipicioasă și drept să-ți spun nu aș vrea să ne înfățișăm în tribunal amîndoi guturăioși.","en":"It seems to me that common cold is a contagious disease and to be honest I don't want to appear in court sick."},{"ro":"Zaltukin a murit de ciumă, voind să dovedească că boala de care mureau soldații cu miile în curți și pe maidanuri nu era nici ciumă, nici boală lipicioasă.","en":"Zaltukin died of the plague, wanting to demonstrate that the disease of which the soldiers were dying by their thousands in the courtyards and the fields was neither plague, nor a contagious disease."}],"forms":{"plural":"boli lipicioase"}},{"word":"boala lui Parkinson","pos":"noun","definitions":["Parkinson's disease"]},{"word":"boala papagalilor","pos":"noun","definitions":["parrot disease"]},{"word":"boala Parkinson","pos":"noun","definitions":["Parkinson's disease"]},{"word":"boală profesională","pos":"noun","definitions":["occupational disease"],"forms":{"plural":"boli profesionale"}},{"word":"boala somnului","pos":"noun","definitions":["sleeping sickness"]},{"word":"boală transmisă sexual","pos":"noun","definitions":["sexually transmitted disease"],"forms":{"plural":"boli transmise sexual"}},{"word":"boaltă","pos":"noun","definitions":["alternative form of boltă"],"forms":{"plural":"boalte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boaltă","accusative-definite-nominative-singular":"boalta","accusative-indefinite-nominative-plural":"boalte","accusative-definite-nominative-plural":"boaltele","dative-genitive-indefinite-singular":"boalte","dative-definite-genitive-singular":"boaltei","dative-genitive-indefinite-plural":"boalte","dative-definite-genitive-plural":"boaltelor","singular-vocative":"boaltă","plural-vocative":"boaltelor"}},{"word":"Boambă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boambă"}},{"word":"boambă","pos":"noun","definitions":["bean"],"forms":{"plural":"boambe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boambă","accusative-definite-nominative-singular":"boamba","accusative-indefinite-nominative-plural":"boambe","accusative-definite-nominative-plural":"boambele","dative-genitive-indefinite-singular":"boambe","dative-definite-genitive-singular":"boambei","dative-genitive-indefinite-plural":"boambe","dative-definite-genitive-plural":"boambelor","singular-vocative":"boambă","plural-vocative":"boambelor"}},{"word":"Boancă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boancă"}},{"word":"Boanghină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boanghină"}},{"word":"boanghină","pos":"noun","definitions":["a Hungarian, Magyar"],"forms":{"plural":"boanghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boanghină","accusative-definite-nominative-singular":"boanghina","accusative-indefinite-nominative-plural":"boanghine","accusative-definite-nominative-plural":"boanghinele","dative-genitive-indefinite-singular":"boanghine","dative-definite-genitive-singular":"boanghinei","dative-genitive-indefinite-plural":"boanghine","dative-definite-genitive-plural":"boanghinelor","singular-vocative":"boanghină","plural-vocative":"boanghinelor"}},{"word":"Boar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boar"}},{"word":"boar","pos":"noun","definitions":["cowherd"],"forms":{"plural":"boari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boar","accusative-definite-nominative-singular":"boarul","accusative-indefinite-nominative-plural":"boari","accusative-definite-nominative-plural":"boarii","dative-genitive-indefinite-singular":"boar","dative-definite-genitive-singular":"boarului","dative-genitive-indefinite-plural":"boari","dative-definite-genitive-plural":"boarilor","singular-vocative":"boarule","plural-vocative":"boarilor","alternative":"bouar"}},{"word":"Boarca","pos":"name","definitions":["a village in Râmnicelu, Brăila County, Romania"],"gender":"f"},{"word":"board","pos":"noun","definitions":["board (of an organization)"],"forms":{"plural":"boarduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"board","accusative-definite-nominative-singular":"boardul","accusative-indefinite-nominative-plural":"boarduri","accusative-definite-nominative-plural":"boardurile","dative-genitive-indefinite-singular":"board","dative-definite-genitive-singular":"boardului","dative-genitive-indefinite-plural":"boarduri","dative-definite-genitive-plural":"boardurilor","singular-vocative":"boardule","plural-vocative":"boardurilor"}},{"word":"boare","pos":"noun","definitions":["breeze","scent, fragrance, sweet smell","exhalation of breath; by extension, stench, malodor","heat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"boare","accusative-definite-nominative":"boarea","dative-genitive-indefinite":"boare","dative-definite-genitive":"boarei","vocative":"boare"}},{"word":"boarfă","pos":"noun","definitions":["old clothes, rag","prostitute, whore"],"forms":{"plural":"boarfe"}},{"word":"Boariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boariu"}},{"word":"boarță","pos":"noun","definitions":["European bitterling (Rhodeus amarus)"],"forms":{"plural":"boarțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boarță","accusative-definite-nominative-singular":"boarța","accusative-indefinite-nominative-plural":"boarțe","accusative-definite-nominative-plural":"boarțele","dative-genitive-indefinite-singular":"boarțe","dative-definite-genitive-singular":"boarței","dative-genitive-indefinite-plural":"boarțe","dative-definite-genitive-plural":"boarțelor","singular-vocative":"boarță","plural-vocative":"boarțelor"}},{"word":"Boaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boaru"}},{"word":"boașă","pos":"noun","definitions":["alternative form of boș"],"forms":{"plural":"boașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boașă","accusative-definite-nominative-singular":"boașa","accusative-indefinite-nominative-plural":"boașe","accusative-definite-nominative-plural":"boașele","dative-genitive-indefinite-singular":"boașe","dative-definite-genitive-singular":"boașei","dative-genitive-indefinite-plural":"boașe","dative-definite-genitive-plural":"boașelor","singular-vocative":"boașă","plural-vocative":"boașelor"}},{"word":"boașe","pos":"noun","definitions":["plural of boș"],"pronunciation":"[ˈbo̯a.ʃe]","gender":"n-p"},{"word":"boașele","pos":"noun","definitions":["definite nominative/accusative plural of boș"],"pronunciation":"/ˈbo̯a.ʃe.le/"},{"word":"boașelor","pos":"noun","definitions":["definite genitive/dative plural of boș"],"pronunciation":"[ˈbo̯a.ʃe.loɾ]","gender":"n"},{"word":"Boasgic","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Dunărea."],"gender":"m"},{"word":"Boată","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boată"}},{"word":"boată","pos":"noun","definitions":["obsolete form of botă"],"forms":{"plural":"boate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boată","accusative-definite-nominative-singular":"boata","accusative-indefinite-nominative-plural":"boate","accusative-definite-nominative-plural":"boatele","dative-genitive-indefinite-singular":"boate","dative-definite-genitive-singular":"boatei","dative-genitive-indefinite-plural":"boate","dative-definite-genitive-plural":"boatelor","singular-vocative":"boată","plural-vocative":"boatelor"}},{"word":"boață","pos":"noun","definitions":["mischief"],"forms":{"plural":"boațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boață","accusative-definite-nominative-singular":"boața","accusative-indefinite-nominative-plural":"boațe","accusative-definite-nominative-plural":"boațele","dative-genitive-indefinite-singular":"boațe","dative-definite-genitive-singular":"boaței","dative-genitive-indefinite-plural":"boațe","dative-definite-genitive-plural":"boațelor","singular-vocative":"boață","plural-vocative":"boațelor"}},{"word":"Bob","pos":"name","definitions":["a surname"],"pronunciation":"/ˈbob/","gender":"m","forms":{"dative-genitive":"lui Bob"}},{"word":"Bob","pos":"name","definitions":["a male given name from English"],"pronunciation":"/ˈbob/","gender":"m","forms":{"dative-genitive":"lui Bob"}},{"word":"bob","pos":"noun","definitions":["a type of bean, field bean, horse bean, broad bean","a grain","any seed, pit, stone, berry"],"pronunciation":"/ˈbob/","forms":{"plural":"boabe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bob","accusative-definite-nominative-singular":"bobul","accusative-indefinite-nominative-plural":"boabe","accusative-definite-nominative-plural":"boabele","dative-genitive-indefinite-singular":"bob","dative-definite-genitive-singular":"bobului","dative-genitive-indefinite-plural":"boabe","dative-definite-genitive-plural":"boabelor","singular-vocative":"bobule","plural-vocative":"boabelor"}},{"word":"bob","pos":"noun","definitions":["bobsleigh"],"pronunciation":"/ˈbob/","forms":{"plural":"boburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bob","accusative-definite-nominative-singular":"bobul","accusative-indefinite-nominative-plural":"boburi","accusative-definite-nominative-plural":"boburile","dative-genitive-indefinite-singular":"bob","dative-definite-genitive-singular":"bobului","dative-genitive-indefinite-plural":"boburi","dative-definite-genitive-plural":"boburilor","singular-vocative":"bobule","plural-vocative":"boburilor"}},{"word":"Bobaia","pos":"name","definitions":["a village in Aninoasa, Gorj County, Romania","a village in Boșorod, Hunedoara County, Romania"],"gender":"f"},{"word":"bobaică","pos":"noun","definitions":["alternative form of băbaică"],"forms":{"plural":"bobăici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobaică","accusative-definite-nominative-singular":"bobaica","accusative-indefinite-nominative-plural":"bobăice","accusative-definite-nominative-plural":"bobăicele","dative-genitive-indefinite-singular":"bobăice","dative-definite-genitive-singular":"bobăicei","dative-genitive-indefinite-plural":"bobăice","dative-definite-genitive-plural":"bobăicelor","singular-vocative":"bobaică","plural-vocative":"bobăicelor"}},{"word":"Bobaița","pos":"name","definitions":["a village in Malovăț, Mehedinți County, Romania"],"gender":"f"},{"word":"bobală","pos":"noun","definitions":["dregs (sediment of wine or vinegar)"],"forms":{"plural":"bobale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobală","accusative-definite-nominative-singular":"bobala","accusative-indefinite-nominative-plural":"bobale","accusative-definite-nominative-plural":"bobalele","dative-genitive-indefinite-singular":"bobale","dative-definite-genitive-singular":"bobalei","dative-genitive-indefinite-plural":"bobale","dative-definite-genitive-plural":"bobalelor","singular-vocative":"bobală","plural-vocative":"bobalelor"}},{"word":"Bobâlna","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Bobâlna, Cluj County, Romania","a village in Rapoltu Mare, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bobîlna"}},{"word":"Bobar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bobar"}},{"word":"Bobărești","pos":"name","definitions":["a village in Sohodol, Alba County, Romania","a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"Bobariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bobariu"}},{"word":"Bobârnac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobârnac","alternative":"Bobîrnac"}},{"word":"bobârnac","pos":"noun","definitions":["fillip, flick of the nose"],"forms":{"plural":"bobârnace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobârnac","accusative-definite-nominative-singular":"bobârnacul","accusative-indefinite-nominative-plural":"bobârnace","accusative-definite-nominative-plural":"bobârnacele","dative-genitive-indefinite-singular":"bobârnac","dative-definite-genitive-singular":"bobârnacului","dative-genitive-indefinite-plural":"bobârnace","dative-definite-genitive-plural":"bobârnacelor","singular-vocative":"bobârnacule","plural-vocative":"bobârnacelor","alternative":"bobîrnac"}},{"word":"Bobaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bobaru"}},{"word":"Bobe","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Bobe"}},{"word":"Bobeanu","pos":"name","definitions":["a village in Drăgotești, Dolj County, Romania"],"gender":"m"},{"word":"Bobeica","pos":"name","definitions":["a village in Bobeica, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova","a village in Izvoarele Sucevei, Suceava County, Romania","a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobeica"}},{"word":"Bobeică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobeică"}},{"word":"bobeică","pos":"noun","definitions":["a valley bottom"],"forms":{"plural":"bobeici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bobeică","accusative-definite-nominative-singular":"bobeica","accusative-indefinite-nominative-plural":"bobeici","accusative-definite-nominative-plural":"bobeicile","dative-genitive-indefinite-singular":"bobeici","dative-definite-genitive-singular":"bobeicii","dative-genitive-indefinite-plural":"bobeici","dative-definite-genitive-plural":"bobeicilor","singular-vocative":"bobeică","plural-vocative":"bobeicilor"}},{"word":"bober","pos":"noun","definitions":["bobsledder"],"forms":{"plural":"boberi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bober","accusative-definite-nominative-singular":"boberul","accusative-indefinite-nominative-plural":"boberi","accusative-definite-nominative-plural":"boberii","dative-genitive-indefinite-singular":"bober","dative-definite-genitive-singular":"boberului","dative-genitive-indefinite-plural":"boberi","dative-definite-genitive-plural":"boberilor","singular-vocative":"boberule","plural-vocative":"boberilor"}},{"word":"bober","pos":"noun","definitions":["beaver"],"forms":{"plural":"boberi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bober","accusative-definite-nominative-singular":"boberul","accusative-indefinite-nominative-plural":"boberi","accusative-definite-nominative-plural":"boberii","dative-genitive-indefinite-singular":"bober","dative-definite-genitive-singular":"boberului","dative-genitive-indefinite-plural":"boberi","dative-definite-genitive-plural":"boberilor","singular-vocative":"boberule","plural-vocative":"boberilor"}},{"word":"Bobescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bobescu"}},{"word":"Bobești","pos":"name","definitions":["a village in Duda-Epureni, Vaslui County, Romania"],"gender":"m"},{"word":"Bobicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bobicescu"}},{"word":"Bobicești","pos":"name","definitions":["a commune of Olt County, Romania","a village in Bobicești, Olt County, Romania","a village in Predeal-Sărari, Prahova County, Romania"],"gender":"m"},{"word":"bobicuță","pos":"noun","definitions":["diminutive of bobică"],"forms":{"plural":"bobicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobicuță","accusative-definite-nominative-singular":"bobicuța","accusative-indefinite-nominative-plural":"bobicuțe","accusative-definite-nominative-plural":"bobicuțele","dative-genitive-indefinite-singular":"bobicuțe","dative-definite-genitive-singular":"bobicuței","dative-genitive-indefinite-plural":"bobicuțe","dative-definite-genitive-plural":"bobicuțelor","singular-vocative":"bobicuță","plural-vocative":"bobicuțelor"}},{"word":"bobina","pos":"verb","definitions":["to wind onto a bobbin"],"forms":{"canonical":"a bobina 1st conjugation","present-singular-third-person":"bobinează","participle-past":"bobinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bobina","gerund":"bobinând","first-person-indicative-present-singular":"bobinez","indicative-present-second-person-singular":"bobinezi","indicative-present-singular-third-person":"bobinează","first-person-indicative-plural-present":"bobinăm","indicative-plural-present-second-person":"bobinați","indicative-plural-present-third-person":"bobinează","first-person-imperfect-indicative-singular":"bobinam","imperfect-indicative-second-person-singular":"bobinai","imperfect-indicative-singular-third-person":"bobina","first-person-imperfect-indicative-plural":"bobinam","imperfect-indicative-plural-second-person":"bobinați","imperfect-indicative-plural-third-person":"bobinau","first-person-indicative-perfect-singular":"bobinai","indicative-perfect-second-person-singular":"bobinași","indicative-perfect-singular-third-person":"bobină","first-person-indicative-perfect-plural":"bobinarăm","indicative-perfect-plural-second-person":"bobinarăți","indicative-perfect-plural-third-person":"bobinară","first-person-indicative-pluperfect-singular":"bobinasem","indicative-pluperfect-second-person-singular":"bobinaseși","indicative-pluperfect-singular-third-person":"bobinase","first-person-indicative-pluperfect-plural":"bobinaserăm","indicative-pluperfect-plural-second-person":"bobinaserăți","indicative-pluperfect-plural-third-person":"bobinaseră","first-person-present-singular-subjunctive":"să bobinez","present-second-person-singular-subjunctive":"să bobinezi","present-singular-subjunctive-third-person":"să bobineze","first-person-plural-present-subjunctive":"să bobinăm","plural-present-second-person-subjunctive":"să bobinați","plural-present-subjunctive-third-person":"să bobineze","imperative-second-person-singular":"bobinează","imperative-plural-second-person":"bobinați","imperative-negative-second-person-singular":"nu bobina","imperative-negative-plural-second-person":"nu bobinați"}},{"word":"Bobină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobină"}},{"word":"bobină","pos":"noun","definitions":["coil"],"forms":{"plural":"bobine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobină","accusative-definite-nominative-singular":"bobina","accusative-indefinite-nominative-plural":"bobine","accusative-definite-nominative-plural":"bobinele","dative-genitive-indefinite-singular":"bobine","dative-definite-genitive-singular":"bobinei","dative-genitive-indefinite-plural":"bobine","dative-definite-genitive-plural":"bobinelor","singular-vocative":"bobină","plural-vocative":"bobinelor"}},{"word":"bobinaj","pos":"noun","definitions":["winding onto a bobbin"],"forms":{"plural":"bobinaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobinaj","accusative-definite-nominative-singular":"bobinajul","accusative-indefinite-nominative-plural":"bobinaje","accusative-definite-nominative-plural":"bobinajele","dative-genitive-indefinite-singular":"bobinaj","dative-definite-genitive-singular":"bobinajului","dative-genitive-indefinite-plural":"bobinaje","dative-definite-genitive-plural":"bobinajelor","singular-vocative":"bobinajule","plural-vocative":"bobinajelor"}},{"word":"bobinatoare","pos":"noun","definitions":["female equivalent of bobinator"],"forms":{"plural":"bobinatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"bobinatoare","accusative-definite-nominative-singular":"bobinatoarea","accusative-indefinite-nominative-plural":"bobinatoare","accusative-definite-nominative-plural":"bobinatoarele","dative-genitive-indefinite-singular":"bobinatoare","dative-definite-genitive-singular":"bobinatoarei","dative-genitive-indefinite-plural":"bobinatoare","dative-definite-genitive-plural":"bobinatoarelor","singular-vocative":"bobinatoare","plural-vocative":"bobinatoarelor"}},{"word":"bobinator","pos":"noun","definitions":["reeler, spooler"],"forms":{"plural":"bobinatori","feminine":"equivalent bobinatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bobinator","accusative-definite-nominative-singular":"bobinatorul","accusative-indefinite-nominative-plural":"bobinatori","accusative-definite-nominative-plural":"bobinatorii","dative-genitive-indefinite-singular":"bobinator","dative-definite-genitive-singular":"bobinatorului","dative-genitive-indefinite-plural":"bobinatori","dative-definite-genitive-plural":"bobinatorilor","singular-vocative":"bobinatorule","plural-vocative":"bobinatorilor"}},{"word":"Bobîrnac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobîrnac"}},{"word":"bobișor","pos":"noun","definitions":["diminutive of bob"],"forms":{"plural":"bobișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobișor","accusative-definite-nominative-singular":"bobișorul","accusative-indefinite-nominative-plural":"bobișoare","accusative-definite-nominative-plural":"bobișoarele","dative-genitive-indefinite-singular":"bobișor","dative-definite-genitive-singular":"bobișorului","dative-genitive-indefinite-plural":"bobișoare","dative-definite-genitive-plural":"bobișoarelor","singular-vocative":"bobișorule","plural-vocative":"bobișoarelor"}},{"word":"bobiște","pos":"noun","definitions":["bean field"],"forms":{"plural":"bobiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bobiște","accusative-definite-nominative-singular":"bobiștea","accusative-indefinite-nominative-plural":"bobiști","accusative-definite-nominative-plural":"bobiștile","dative-genitive-indefinite-singular":"bobiști","dative-definite-genitive-singular":"bobiștii","dative-genitive-indefinite-plural":"bobiști","dative-definite-genitive-plural":"bobiștilor","singular-vocative":"bobiște","plural-vocative":"bobiștilor"}},{"word":"Bobișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bobișteanu"}},{"word":"bobiță","pos":"noun","definitions":["diminutive of boabă; small seed"],"forms":{"plural":"bobițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobiță","accusative-definite-nominative-singular":"bobița","accusative-indefinite-nominative-plural":"bobițe","accusative-definite-nominative-plural":"bobițele","dative-genitive-indefinite-singular":"bobițe","dative-definite-genitive-singular":"bobiței","dative-genitive-indefinite-plural":"bobițe","dative-definite-genitive-plural":"bobițelor","singular-vocative":"bobiță","plural-vocative":"bobițelor"}},{"word":"boboană","pos":"noun","definitions":["spell, superstition"],"forms":{"plural":"boboane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boboană","accusative-definite-nominative-singular":"boboana","accusative-indefinite-nominative-plural":"boboane","accusative-definite-nominative-plural":"boboanele","dative-genitive-indefinite-singular":"boboane","dative-definite-genitive-singular":"boboanei","dative-genitive-indefinite-plural":"boboane","dative-definite-genitive-plural":"boboanelor","singular-vocative":"boboană","plural-vocative":"boboanelor"}},{"word":"Boboc","pos":"name","definitions":["a village in Cochirleanca, Buzău County, Romania"],"gender":"m"},{"word":"boboc","pos":"noun","definitions":["bud (newly formed leaf or flower that has not yet unfolded)","duckling or gosling","rookie","freshman"],"pronunciation":"/boˈbok/","forms":{"plural":"boboci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boboc","accusative-definite-nominative-singular":"bobocul","accusative-indefinite-nominative-plural":"boboci","accusative-definite-nominative-plural":"bobocii","dative-genitive-indefinite-singular":"boboc","dative-definite-genitive-singular":"bobocului","dative-genitive-indefinite-plural":"boboci","dative-definite-genitive-plural":"bobocilor","singular-vocative":"bobocule","plural-vocative":"bobocilor"}},{"word":"Bobocel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bobocel"}},{"word":"bobocel","pos":"noun","definitions":["diminutive of boboc; small duckling or gosling"],"forms":{"plural":"bobocei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bobocel","accusative-definite-nominative-singular":"bobocelul","accusative-indefinite-nominative-plural":"boboceli","accusative-definite-nominative-plural":"bobocelii","dative-genitive-indefinite-singular":"bobocel","dative-definite-genitive-singular":"bobocelului","dative-genitive-indefinite-plural":"boboceli","dative-definite-genitive-plural":"bobocelilor","singular-vocative":"bobocelule","plural-vocative":"bobocelilor"}},{"word":"Bobocescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bobocescu"}},{"word":"Boboci","pos":"name","definitions":["a village in Dragodana, Dâmbovița County, Romania","a village in Jugureni, Prahova County, Romania"],"gender":"m"},{"word":"boboci","pos":"noun","definitions":["plural of boboc"]},{"word":"Bobocica","pos":"name","definitions":["a village in Enichioi, Cantemir Raion, Moldova"],"gender":"f"},{"word":"bobocică","pos":"noun","definitions":["diminutive of boboc"],"forms":{"plural":"bobocici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bobocică","accusative-definite-nominative-singular":"bobocica","accusative-indefinite-nominative-plural":"bobocici","accusative-definite-nominative-plural":"bobocicile","dative-genitive-indefinite-singular":"bobocici","dative-definite-genitive-singular":"bobocicii","dative-genitive-indefinite-plural":"bobocici","dative-definite-genitive-plural":"bobocicilor","singular-vocative":"bobocică","plural-vocative":"bobocicilor"}},{"word":"Bobohalma","pos":"name","definitions":["a village in Târnăveni, Mureș County, Romania"],"gender":"f"},{"word":"Boboiești","pos":"name","definitions":["a village in Ciuperceni, Gorj County, Romania","a village in Pipirig, Neamț County, Romania"],"gender":"m"},{"word":"bobonoșag","pos":"noun","definitions":["spell"],"forms":{"plural":"bobonoșaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bobonoșag","accusative-definite-nominative-singular":"bobonoșagul","accusative-indefinite-nominative-plural":"bobonoșaguri","accusative-definite-nominative-plural":"bobonoșagurile","dative-genitive-indefinite-singular":"bobonoșag","dative-definite-genitive-singular":"bobonoșagului","dative-genitive-indefinite-plural":"bobonoșaguri","dative-definite-genitive-plural":"bobonoșagurilor","singular-vocative":"bobonoșagule","plural-vocative":"bobonoșagurilor"}},{"word":"bobornic","pos":"noun","definitions":["European brooklime (Veronica beccabunga)"],"forms":{"plural":"bobornici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bobornic","accusative-definite-nominative-singular":"bobornicul","accusative-indefinite-nominative-plural":"bobornici","accusative-definite-nominative-plural":"bobornicii","dative-genitive-indefinite-singular":"bobornic","dative-definite-genitive-singular":"bobornicului","dative-genitive-indefinite-plural":"bobornici","dative-definite-genitive-plural":"bobornicilor","singular-vocative":"bobornicule","plural-vocative":"bobornicilor"}},{"word":"Boboș","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania"],"gender":"m"},{"word":"boboșare","pos":"noun","definitions":["inflation, swelling"],"forms":{"plural":"boboșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boboșare","accusative-definite-nominative-singular":"boboșarea","accusative-indefinite-nominative-plural":"boboșări","accusative-definite-nominative-plural":"boboșările","dative-genitive-indefinite-singular":"boboșări","dative-definite-genitive-singular":"boboșării","dative-genitive-indefinite-plural":"boboșări","dative-definite-genitive-plural":"boboșărilor","singular-vocative":"boboșare","plural-vocative":"boboșărilor"}},{"word":"boboșor","pos":"adj","definitions":["diminutive of boboș"],"forms":{"feminine-singular":"boboșoră","masculine-plural":"boboșori","feminine-neuter-plural":"boboșore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boboșor","error-unrecognized-form-feminine-indefinite-singular":"boboșoră","error-unrecognized-form-indefinite-masculine-plural":"boboșori","error-unrecognized-form-feminine-indefinite-neuter-plural":"boboșore","definite-error-unrecognized-form-masculine-neuter-singular":"boboșorul","definite-error-unrecognized-form-feminine-singular":"boboșora","definite-error-unrecognized-form-masculine-plural":"boboșorii","definite-error-unrecognized-form-feminine-neuter-plural":"boboșorele"}},{"word":"bobot","pos":"noun","definitions":["random, happenstance"],"forms":{"plural":"bobote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobot","accusative-definite-nominative-singular":"bobotul","accusative-indefinite-nominative-plural":"bobote","accusative-definite-nominative-plural":"bobotele","dative-genitive-indefinite-singular":"bobot","dative-definite-genitive-singular":"bobotului","dative-genitive-indefinite-plural":"bobote","dative-definite-genitive-plural":"bobotelor","singular-vocative":"bobotule","plural-vocative":"bobotelor"}},{"word":"Bobota","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Bobota, Sălaj County, Romania"],"gender":"f"},{"word":"bobota","pos":"noun","definitions":["definite nominative/accusative singular of bobotă"]},{"word":"bobotă","pos":"noun","definitions":["alternative form of bobot"],"forms":{"plural":"bobote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bobotă","accusative-definite-nominative-singular":"bobota","accusative-indefinite-nominative-plural":"bobote","accusative-definite-nominative-plural":"bobotele","dative-genitive-indefinite-singular":"bobote","dative-definite-genitive-singular":"bobotei","dative-genitive-indefinite-plural":"bobote","dative-definite-genitive-plural":"bobotelor","singular-vocative":"bobotă","plural-vocative":"bobotelor"}},{"word":"bobotaie","pos":"noun","definitions":["blaze"],"forms":{"plural":"bobotăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bobotaie","accusative-definite-nominative-singular":"bobotaiea","accusative-indefinite-nominative-plural":"bobotăi","accusative-definite-nominative-plural":"bobotăile","dative-genitive-indefinite-singular":"bobotăi","dative-definite-genitive-singular":"bobotăii","dative-genitive-indefinite-plural":"bobotăi","dative-definite-genitive-plural":"bobotăilor","singular-vocative":"bobotaie","plural-vocative":"bobotăilor"}},{"word":"Bobotan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bobotan"}},{"word":"Bobotează","pos":"name","definitions":["Epiphany"],"forms":{"alternative":"bobotează"}},{"word":"bobotează","pos":"noun","definitions":["Epiphany"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bobotează","accusative-definite-nominative":"boboteaza","dative-genitive-indefinite":"boboteaze","dative-definite-genitive":"boboteazei","vocative":"bobotează"}},{"word":"boboti","pos":"verb","definitions":["to blaze"],"forms":{"canonical":"a boboti 4th conjugation","present-singular-third-person":"bobotește","participle-past":"bobotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boboti","gerund":"bobotind","first-person-indicative-present-singular":"bobotesc","indicative-present-second-person-singular":"bobotești","indicative-present-singular-third-person":"bobotește","first-person-indicative-plural-present":"bobotim","indicative-plural-present-second-person":"bobotiți","indicative-plural-present-third-person":"bobotesc","first-person-imperfect-indicative-singular":"boboteam","imperfect-indicative-second-person-singular":"boboteai","imperfect-indicative-singular-third-person":"bobotea","first-person-imperfect-indicative-plural":"boboteam","imperfect-indicative-plural-second-person":"boboteați","imperfect-indicative-plural-third-person":"boboteau","first-person-indicative-perfect-singular":"bobotii","indicative-perfect-second-person-singular":"bobotiși","indicative-perfect-singular-third-person":"boboti","first-person-indicative-perfect-plural":"bobotirăm","indicative-perfect-plural-second-person":"bobotirăți","indicative-perfect-plural-third-person":"bobotiră","first-person-indicative-pluperfect-singular":"bobotisem","indicative-pluperfect-second-person-singular":"bobotiseși","indicative-pluperfect-singular-third-person":"bobotise","first-person-indicative-pluperfect-plural":"bobotiserăm","indicative-pluperfect-plural-second-person":"bobotiserăți","indicative-pluperfect-plural-third-person":"bobotiseră","first-person-present-singular-subjunctive":"să bobotesc","present-second-person-singular-subjunctive":"să bobotești","present-singular-subjunctive-third-person":"să bobotească","first-person-plural-present-subjunctive":"să bobotim","plural-present-second-person-subjunctive":"să bobotiți","plural-present-subjunctive-third-person":"să bobotească","imperative-second-person-singular":"bobotește","imperative-plural-second-person":"bobotiți","imperative-negative-second-person-singular":"nu boboti","imperative-negative-plural-second-person":"nu bobotiți"}},{"word":"bobotire","pos":"noun","definitions":["inflammation"],"forms":{"plural":"bobotiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bobotire","accusative-definite-nominative-singular":"bobotirea","accusative-indefinite-nominative-plural":"bobotiri","accusative-definite-nominative-plural":"bobotirile","dative-genitive-indefinite-singular":"bobotiri","dative-definite-genitive-singular":"bobotirii","dative-genitive-indefinite-plural":"bobotiri","dative-definite-genitive-plural":"bobotirilor","singular-vocative":"bobotire","plural-vocative":"bobotirilor"}},{"word":"bobou","pos":"noun","definitions":["wool textile"],"forms":{"plural":"bobouă","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobou","accusative-definite-nominative-singular":"bobouul","accusative-indefinite-nominative-plural":"bobouă","accusative-definite-nominative-plural":"bobouăle","dative-genitive-indefinite-singular":"bobou","dative-definite-genitive-singular":"bobouului","dative-genitive-indefinite-plural":"bobouă","dative-definite-genitive-plural":"bobouălor","singular-vocative":"bobouule","plural-vocative":"bobouălor"}},{"word":"bobric","pos":"noun","definitions":["kidney"],"forms":{"plural":"bobrici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bobric","accusative-definite-nominative-singular":"bobricul","accusative-indefinite-nominative-plural":"bobrici","accusative-definite-nominative-plural":"bobricii","dative-genitive-indefinite-singular":"bobric","dative-definite-genitive-singular":"bobricului","dative-genitive-indefinite-plural":"bobrici","dative-definite-genitive-plural":"bobricilor","singular-vocative":"bobricule","plural-vocative":"bobricilor"}},{"word":"bobslei","pos":"noun","definitions":["bobsleigh (winter sport)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bobslei","accusative-definite-nominative":"bobsleiul","dative-genitive-indefinite":"bobslei","dative-definite-genitive":"bobsleiului","vocative":"bobsleiule","alternative":"bobsleigh"}},{"word":"bobsleigh","pos":"noun","definitions":["bobsleigh"],"forms":{"plural":"bobsleigh-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobsleigh","accusative-definite-nominative-singular":"bobsleigh-ul","accusative-indefinite-nominative-plural":"bobsleigh-uri","accusative-definite-nominative-plural":"bobsleigh-urile","dative-genitive-indefinite-singular":"bobsleigh","dative-definite-genitive-singular":"bobsleigh-ului","dative-genitive-indefinite-plural":"bobsleigh-uri","dative-definite-genitive-plural":"bobsleigh-urilor","singular-vocative":"bobsleigh-ule","plural-vocative":"bobsleigh-urilor","alternative":"bobslei"}},{"word":"Bobu","pos":"name","definitions":["a village in Scoarța, Gorj County, Romania","a village in Osica de Jos, Olt County, Romania"],"gender":"m"},{"word":"bobul","pos":"noun","definitions":["definite nominative/accusative singular of bob"]},{"word":"Bobulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bobulescu"}},{"word":"Bobulești","pos":"name","definitions":["a locality in Ștefănești, Botoșani County, Romania"],"gender":"m"},{"word":"bobuleț","pos":"noun","definitions":["diminutive of bob; small grain"],"forms":{"plural":"bobulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bobuleț","accusative-definite-nominative-singular":"bobulețul","accusative-indefinite-nominative-plural":"bobulețe","accusative-definite-nominative-plural":"bobulețele","dative-genitive-indefinite-singular":"bobuleț","dative-definite-genitive-singular":"bobulețului","dative-genitive-indefinite-plural":"bobulețe","dative-definite-genitive-plural":"bobulețelor","singular-vocative":"bobulețule","plural-vocative":"bobulețelor"}},{"word":"Bobulișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bobulișteanu"}},{"word":"bobului","pos":"noun","definitions":["definite genitive/dative singular of bob"]},{"word":"boburi","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of bob"]},{"word":"bobușor","pos":"noun","definitions":["Vicia dumetorum","earthnut pea (Lathyrus tuberosus)"],"forms":{"plural":"bobușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bobușor","accusative-definite-nominative-singular":"bobușorul","accusative-indefinite-nominative-plural":"bobușori","accusative-definite-nominative-plural":"bobușorii","dative-genitive-indefinite-singular":"bobușor","dative-definite-genitive-singular":"bobușorului","dative-genitive-indefinite-plural":"bobușori","dative-definite-genitive-plural":"bobușorilor","singular-vocative":"bobușorule","plural-vocative":"bobușorilor"}},{"word":"boc","pos":"noun","definitions":["sound of a hammer"],"forms":{"plural":"bocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boc","accusative-definite-nominative-singular":"bocul","accusative-indefinite-nominative-plural":"bocuri","accusative-definite-nominative-plural":"bocurile","dative-genitive-indefinite-singular":"boc","dative-definite-genitive-singular":"bocului","dative-genitive-indefinite-plural":"bocuri","dative-definite-genitive-plural":"bocurilor","singular-vocative":"bocule","plural-vocative":"bocurilor"}},{"word":"Boca","pos":"name","definitions":["a village in Samarinești, Gorj County, Romania"],"gender":"f"},{"word":"bocal","pos":"noun","definitions":["alternative form of pocal"],"forms":{"plural":"bocaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bocal","accusative-definite-nominative-singular":"bocalul","accusative-indefinite-nominative-plural":"bocaluri","accusative-definite-nominative-plural":"bocalurile","dative-genitive-indefinite-singular":"bocal","dative-definite-genitive-singular":"bocalului","dative-genitive-indefinite-plural":"bocaluri","dative-definite-genitive-plural":"bocalurilor","singular-vocative":"bocalule","plural-vocative":"bocalurilor"}},{"word":"bocanc","pos":"noun","definitions":["brogue","boot (heavy duty laced boot extending above the ankle)"],"forms":{"plural":"bocanci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bocanc","accusative-definite-nominative-singular":"bocancul","accusative-indefinite-nominative-plural":"bocanci","accusative-definite-nominative-plural":"bocancii","dative-genitive-indefinite-singular":"bocanc","dative-definite-genitive-singular":"bocancului","dative-genitive-indefinite-plural":"bocanci","dative-definite-genitive-plural":"bocancilor","singular-vocative":"bocancule","plural-vocative":"bocancilor","alternative":"bocancă"}},{"word":"bocancă","pos":"noun","definitions":["obsolete form of bocanc"],"forms":{"plural":"bocănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bocancă","accusative-definite-nominative-singular":"bocanca","accusative-indefinite-nominative-plural":"bocănce","accusative-definite-nominative-plural":"bocăncele","dative-genitive-indefinite-singular":"bocănce","dative-definite-genitive-singular":"bocăncei","dative-genitive-indefinite-plural":"bocănce","dative-definite-genitive-plural":"bocăncelor","singular-vocative":"bocancă","plural-vocative":"bocăncelor"}},{"word":"Bocancea-Schit","pos":"name","definitions":["a village in Dumbrăvița, Sîngerei Raion, Moldova"],"gender":"f"},{"word":"Bocăneală","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bocăneală"}},{"word":"bocăneală","pos":"noun","definitions":["thumping"],"forms":{"plural":"bocăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bocăneală","accusative-definite-nominative-singular":"bocăneala","accusative-indefinite-nominative-plural":"bocănele","accusative-definite-nominative-plural":"bocănelele","dative-genitive-indefinite-singular":"bocănele","dative-definite-genitive-singular":"bocănelei","dative-genitive-indefinite-plural":"bocănele","dative-definite-genitive-plural":"bocănelelor","singular-vocative":"bocăneală","plural-vocative":"bocănelelor"}},{"word":"Bocani","pos":"name","definitions":["a village in Bocani, Fălești Raion, Moldova","a commune of Fălești Raion, Moldova"],"gender":"m"},{"word":"bocăni","pos":"verb","definitions":["to thump"],"forms":{"canonical":"a bocăni 4th conjugation","present-singular-third-person":"bocănește","participle-past":"bocănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bocăni","gerund":"bocănind","first-person-indicative-present-singular":"bocănesc","indicative-present-second-person-singular":"bocănești","indicative-present-singular-third-person":"bocănește","first-person-indicative-plural-present":"bocănim","indicative-plural-present-second-person":"bocăniți","indicative-plural-present-third-person":"bocănesc","first-person-imperfect-indicative-singular":"bocăneam","imperfect-indicative-second-person-singular":"bocăneai","imperfect-indicative-singular-third-person":"bocănea","first-person-imperfect-indicative-plural":"bocăneam","imperfect-indicative-plural-second-person":"bocăneați","imperfect-indicative-plural-third-person":"bocăneau","first-person-indicative-perfect-singular":"bocănii","indicative-perfect-second-person-singular":"bocăniși","indicative-perfect-singular-third-person":"bocăni","first-person-indicative-perfect-plural":"bocănirăm","indicative-perfect-plural-second-person":"bocănirăți","indicative-perfect-plural-third-person":"bocăniră","first-person-indicative-pluperfect-singular":"bocănisem","indicative-pluperfect-second-person-singular":"bocăniseși","indicative-pluperfect-singular-third-person":"bocănise","first-person-indicative-pluperfect-plural":"bocăniserăm","indicative-pluperfect-plural-second-person":"bocăniserăți","indicative-pluperfect-plural-third-person":"bocăniseră","first-person-present-singular-subjunctive":"să bocănesc","present-second-person-singular-subjunctive":"să bocănești","present-singular-subjunctive-third-person":"să bocănească","first-person-plural-present-subjunctive":"să bocănim","plural-present-second-person-subjunctive":"să bocăniți","plural-present-subjunctive-third-person":"să bocănească","imperative-second-person-singular":"bocănește","imperative-plural-second-person":"bocăniți","imperative-negative-second-person-singular":"nu bocăni","imperative-negative-plural-second-person":"nu bocăniți"}},{"word":"bocănit","pos":"noun","definitions":["a thump"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bocănit","accusative-definite-nominative":"bocănitul","dative-genitive-indefinite":"bocănit","dative-definite-genitive":"bocănitului","vocative":"bocănitule"}},{"word":"bocănit","pos":"verb","definitions":["past participle of bocăni"],"forms":{"participle-past":"of bocăni"}},{"word":"bocănitură","pos":"noun","definitions":["thump"],"forms":{"plural":"bocănituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bocănitură","accusative-definite-nominative-singular":"bocănitura","accusative-indefinite-nominative-plural":"bocăniture","accusative-definite-nominative-plural":"bocăniturele","dative-genitive-indefinite-singular":"bocăniture","dative-definite-genitive-singular":"bocăniturei","dative-genitive-indefinite-plural":"bocăniture","dative-definite-genitive-plural":"bocăniturelor","singular-vocative":"bocănitură","plural-vocative":"bocăniturelor"}},{"word":"bocaport","pos":"noun","definitions":["hatchway"],"forms":{"plural":"bocaporți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bocaport","accusative-definite-nominative-singular":"bocaportul","accusative-indefinite-nominative-plural":"bocaporți","accusative-definite-nominative-plural":"bocaporții","dative-genitive-indefinite-singular":"bocaport","dative-definite-genitive-singular":"bocaportului","dative-genitive-indefinite-plural":"bocaporți","dative-definite-genitive-plural":"bocaporților","singular-vocative":"bocaportule","plural-vocative":"bocaporților"}},{"word":"bocar","pos":"noun","definitions":["raft"],"forms":{"plural":"bocare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bocar","accusative-definite-nominative-singular":"bocarul","accusative-indefinite-nominative-plural":"bocare","accusative-definite-nominative-plural":"bocarele","dative-genitive-indefinite-singular":"bocar","dative-definite-genitive-singular":"bocarului","dative-genitive-indefinite-plural":"bocare","dative-definite-genitive-plural":"bocarelor","singular-vocative":"bocarule","plural-vocative":"bocarelor"}},{"word":"boccaccesc","pos":"adj","definitions":["Boccaccian (pertaining to or reminiscing Giovanni Boccaccio and his works)","licentious, indecent, lascivious"],"pronunciation":"/bo.ka(k)ˈtʃesk/","forms":{"feminine-singular":"boccaccească","plural":"boccaccești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boccaccesc","error-unrecognized-form-feminine-indefinite-singular":"boccaccească","error-unrecognized-form-indefinite-masculine-plural":"boccaccești","error-unrecognized-form-feminine-indefinite-neuter-plural":"boccaccești","definite-error-unrecognized-form-masculine-neuter-singular":"boccaccescul","definite-error-unrecognized-form-feminine-singular":"boccacceasca","definite-error-unrecognized-form-masculine-plural":"boccacceștii","definite-error-unrecognized-form-feminine-neuter-plural":"boccacceștile"}},{"word":"bocce","pos":"noun","definitions":["bocce"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bocce","accusative-definite-nominative":"bocceul","dative-genitive-indefinite":"bocce","dative-definite-genitive":"bocceului","vocative":"bocceule"}},{"word":"boccea","pos":"noun","definitions":["bundle, a cloth tied up for carrying things other than cloths","shawl or wrap towel having the frequent purpose of tieing up","a larger headscarf","tobacco bale"],"pronunciation":"/bokˈt͡ʃe̯a/","forms":{"plural":"boccele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"boccea","accusative-definite-nominative-singular":"bocceaua","accusative-indefinite-nominative-plural":"boccele","accusative-definite-nominative-plural":"boccelele","dative-genitive-indefinite-singular":"boccele","dative-definite-genitive-singular":"boccelei","dative-genitive-indefinite-plural":"boccele","dative-definite-genitive-plural":"boccelelor","singular-vocative":"-","plural-vocative":"-","alternative-obsolete":"botcea"}},{"word":"bocceagiu","pos":"noun","definitions":["alternative form of boccegiu"],"forms":{"plural":"bocceagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bocceagiu","accusative-definite-nominative-singular":"bocceagiuul","accusative-indefinite-nominative-plural":"bocceagii","accusative-definite-nominative-plural":"bocceagiii","dative-genitive-indefinite-singular":"bocceagiu","dative-definite-genitive-singular":"bocceagiuului","dative-genitive-indefinite-plural":"bocceagii","dative-definite-genitive-plural":"bocceagiilor","singular-vocative":"bocceagiuule","plural-vocative":"bocceagiilor"}},{"word":"boccealâc","pos":"noun","definitions":["bundle"],"forms":{"plural":"boccealâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boccealâc","accusative-definite-nominative-singular":"boccealâcul","accusative-indefinite-nominative-plural":"boccealâcuri","accusative-definite-nominative-plural":"boccealâcurile","dative-genitive-indefinite-singular":"boccealâc","dative-definite-genitive-singular":"boccealâcului","dative-genitive-indefinite-plural":"boccealâcuri","dative-definite-genitive-plural":"boccealâcurilor","singular-vocative":"boccealâcule","plural-vocative":"boccealâcurilor","alternative":"boccealîc"}},{"word":"boccegiu","pos":"noun","definitions":["itinerant haberdasher"],"forms":{"plural":"boccegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"boccegiu","accusative-definite-nominative-singular":"boccegiul","accusative-indefinite-nominative-plural":"boccegii","accusative-definite-nominative-plural":"boccegiii","dative-genitive-indefinite-singular":"boccegiu","dative-definite-genitive-singular":"boccegiului","dative-genitive-indefinite-plural":"boccegii","dative-definite-genitive-plural":"boccegiilor","singular-vocative":"boccegiule","plural-vocative":"boccegiilor"}},{"word":"bocceluță","pos":"noun","definitions":["diminutive of boccea; small bundle"],"forms":{"plural":"bocceluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bocceluță","accusative-definite-nominative-singular":"bocceluța","accusative-indefinite-nominative-plural":"bocceluțe","accusative-definite-nominative-plural":"bocceluțele","dative-genitive-indefinite-singular":"bocceluțe","dative-definite-genitive-singular":"bocceluței","dative-genitive-indefinite-plural":"bocceluțe","dative-definite-genitive-plural":"bocceluțelor","singular-vocative":"bocceluță","plural-vocative":"bocceluțelor"}},{"word":"bocciu","pos":"adj","definitions":["ugly (about people)"],"forms":{"feminine-singular":"boccie","plural":"boccii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bocciu","error-unrecognized-form-feminine-indefinite-singular":"boccie","error-unrecognized-form-indefinite-masculine-plural":"boccii","error-unrecognized-form-feminine-indefinite-neuter-plural":"boccii","definite-error-unrecognized-form-masculine-neuter-singular":"bocciul","definite-error-unrecognized-form-feminine-singular":"boccia","definite-error-unrecognized-form-masculine-plural":"bocciii","definite-error-unrecognized-form-feminine-neuter-plural":"bocciile"}},{"word":"boceală","pos":"noun","definitions":["weeping"],"forms":{"plural":"boceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boceală","accusative-definite-nominative-singular":"boceala","accusative-indefinite-nominative-plural":"bocele","accusative-definite-nominative-plural":"bocelele","dative-genitive-indefinite-singular":"bocele","dative-definite-genitive-singular":"bocelei","dative-genitive-indefinite-plural":"bocele","dative-definite-genitive-plural":"bocelelor","singular-vocative":"boceală","plural-vocative":"bocelelor"}},{"word":"Boceni","pos":"name","definitions":["a village in Tâmna, Mehedinți County, Romania"],"gender":"m"},{"word":"bocesc","pos":"verb","definitions":["inflection of boci:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"Bocești","pos":"name","definitions":["a village in Mogoș, Alba County, Romania"],"gender":"m"},{"word":"bocet","pos":"noun","definitions":["wail, wailing; lament, cry","dirge","keen (prolonged wail for a dead person)"],"forms":{"plural":"bocete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bocet","accusative-definite-nominative-singular":"bocetul","accusative-indefinite-nominative-plural":"bocete","accusative-definite-nominative-plural":"bocetele","dative-genitive-indefinite-singular":"bocet","dative-definite-genitive-singular":"bocetului","dative-genitive-indefinite-plural":"bocete","dative-definite-genitive-plural":"bocetelor","singular-vocative":"bocetule","plural-vocative":"bocetelor"}},{"word":"boci","pos":"verb","definitions":["to bemoan, bewail, lament, mourn for"],"forms":{"canonical":"a boci 4th conjugation","present-singular-third-person":"bocește","participle-past":"bocit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boci","gerund":"bocind","first-person-indicative-present-singular":"bocesc","indicative-present-second-person-singular":"bocești","indicative-present-singular-third-person":"bocește","first-person-indicative-plural-present":"bocim","indicative-plural-present-second-person":"bociți","indicative-plural-present-third-person":"bocesc","first-person-imperfect-indicative-singular":"boceam","imperfect-indicative-second-person-singular":"boceai","imperfect-indicative-singular-third-person":"bocea","first-person-imperfect-indicative-plural":"boceam","imperfect-indicative-plural-second-person":"boceați","imperfect-indicative-plural-third-person":"boceau","first-person-indicative-perfect-singular":"bocii","indicative-perfect-second-person-singular":"bociși","indicative-perfect-singular-third-person":"boci","first-person-indicative-perfect-plural":"bocirăm","indicative-perfect-plural-second-person":"bocirăți","indicative-perfect-plural-third-person":"bociră","first-person-indicative-pluperfect-singular":"bocisem","indicative-pluperfect-second-person-singular":"bociseși","indicative-pluperfect-singular-third-person":"bocise","first-person-indicative-pluperfect-plural":"bociserăm","indicative-pluperfect-plural-second-person":"bociserăți","indicative-pluperfect-plural-third-person":"bociseră","first-person-present-singular-subjunctive":"să bocesc","present-second-person-singular-subjunctive":"să bocești","present-singular-subjunctive-third-person":"să bocească","first-person-plural-present-subjunctive":"să bocim","plural-present-second-person-subjunctive":"să bociți","plural-present-subjunctive-third-person":"să bocească","imperative-second-person-singular":"bocește","imperative-plural-second-person":"bociți","imperative-negative-second-person-singular":"nu boci","imperative-negative-plural-second-person":"nu bociți"}},{"word":"Bocicău","pos":"name","definitions":["a village in Tarna Mare, Satu Mare County, Romania"],"gender":"m"},{"word":"Bocicăuți","pos":"name","definitions":["a village in Bălcăuți, Briceni Raion, Moldova"],"gender":"m"},{"word":"Bocicoel","pos":"name","definitions":["a village in Bogdan Vodă, Maramureș County, Romania"],"gender":"m"},{"word":"Bocicoiu Mare","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Bocicoiu Mare, Maramureș County, Romania"],"gender":"m"},{"word":"bocioacă","pos":"noun","definitions":["pommel (knob)"],"forms":{"plural":"bocioace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bocioacă","accusative-definite-nominative-singular":"bocioacăul","accusative-indefinite-nominative-plural":"bocioace","accusative-definite-nominative-plural":"bocioacele","dative-genitive-indefinite-singular":"bocioacă","dative-definite-genitive-singular":"bocioacăului","dative-genitive-indefinite-plural":"bocioace","dative-definite-genitive-plural":"bocioacelor","singular-vocative":"bocioacăule","plural-vocative":"bocioacelor"}},{"word":"bocire","pos":"noun","definitions":["beweiling, lamenting, mourning"],"forms":{"plural":"bociri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bocire","accusative-definite-nominative-singular":"bocirea","accusative-indefinite-nominative-plural":"bociri","accusative-definite-nominative-plural":"bocirile","dative-genitive-indefinite-singular":"bociri","dative-definite-genitive-singular":"bocirii","dative-genitive-indefinite-plural":"bociri","dative-definite-genitive-plural":"bocirilor","singular-vocative":"bocire","plural-vocative":"bocirilor"}},{"word":"bocit","pos":"noun","definitions":["lamentation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bocit","accusative-definite-nominative":"bocitul","dative-genitive-indefinite":"bocit","dative-definite-genitive":"bocitului","vocative":"bocitule"}},{"word":"bocit","pos":"verb","definitions":["past participle of boci"],"forms":{"participle-past":"of boci"}},{"word":"bocitoare","pos":"noun","definitions":["wailer (person, assumed to be female, hired to publicly mourn at a funeral)"],"forms":{"plural":"bocitoare","masculine":"equivalent bocitor"}},{"word":"bocitor","pos":"adj","definitions":["howler"],"forms":{"feminine-singular":"bocitoare","masculine-plural":"bocitori","feminine-neuter-plural":"bocitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bocitor","error-unrecognized-form-feminine-indefinite-singular":"bocitoare","error-unrecognized-form-indefinite-masculine-plural":"bocitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bocitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bocitorul","definite-error-unrecognized-form-feminine-singular":"bocitoarea","definite-error-unrecognized-form-masculine-plural":"bocitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bocitoarele"}},{"word":"bociuluț","pos":"noun","definitions":["diminutive of boci"],"forms":{"plural":"bociuluți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bociuluț","accusative-definite-nominative-singular":"bociuluțul","accusative-indefinite-nominative-plural":"bociuluți","accusative-definite-nominative-plural":"bociuluții","dative-genitive-indefinite-singular":"bociuluț","dative-definite-genitive-singular":"bociuluțului","dative-genitive-indefinite-plural":"bociuluți","dative-definite-genitive-plural":"bociuluților","singular-vocative":"bociuluțule","plural-vocative":"bociuluților"}},{"word":"bocluc","pos":"noun","definitions":["alternative form of bucluc"],"forms":{"plural":"boclucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bocluc","accusative-definite-nominative-singular":"boclucul","accusative-indefinite-nominative-plural":"boclucuri","accusative-definite-nominative-plural":"boclucurile","dative-genitive-indefinite-singular":"bocluc","dative-definite-genitive-singular":"boclucului","dative-genitive-indefinite-plural":"boclucuri","dative-definite-genitive-plural":"boclucurilor","singular-vocative":"boclucule","plural-vocative":"boclucurilor"}},{"word":"bocnă","pos":"adv","definitions":["frozen stiff"]},{"word":"Bocoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bocoiu"}},{"word":"bocotan","pos":"adj","definitions":["obsolete form of bogătan"],"forms":{"feminine-singular":"bocotană","masculine-plural":"bocotani","feminine-neuter-plural":"bocotane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bocotan","error-unrecognized-form-feminine-indefinite-singular":"bocotană","error-unrecognized-form-indefinite-masculine-plural":"bocotani","error-unrecognized-form-feminine-indefinite-neuter-plural":"bocotane","definite-error-unrecognized-form-masculine-neuter-singular":"bocotanul","definite-error-unrecognized-form-feminine-singular":"bocotana","definite-error-unrecognized-form-masculine-plural":"bocotanii","definite-error-unrecognized-form-feminine-neuter-plural":"bocotanele"}},{"word":"Bocșa","pos":"name","definitions":["a city in Caraș-Severin County, Romania","a commune of Sălaj County, Romania","a village in Bocșa, Sălaj County, Romania","a village in Măciuca, Vâlcea County, Romania"],"gender":"f"},{"word":"bocșa","pos":"noun","definitions":["definite nominative/accusative singular of bocșă"]},{"word":"bocșă","pos":"noun","definitions":["charcoal kiln"],"forms":{"plural":"bocșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bocșă","accusative-definite-nominative-singular":"bocșa","accusative-indefinite-nominative-plural":"bocșe","accusative-definite-nominative-plural":"bocșele","dative-genitive-indefinite-singular":"bocșe","dative-definite-genitive-singular":"bocșei","dative-genitive-indefinite-plural":"bocșe","dative-definite-genitive-plural":"bocșelor","singular-vocative":"bocșă","plural-vocative":"bocșelor"}},{"word":"Bocșa Mare","pos":"name","definitions":["a village in Certeju de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"Bocșa Mică","pos":"name","definitions":["a village in Certeju de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"Bocșel","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Zalău"],"gender":"m"},{"word":"bocșer","pos":"noun","definitions":["a kiln worker"],"forms":{"plural":"bocșeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bocșer","accusative-definite-nominative-singular":"bocșerul","accusative-indefinite-nominative-plural":"bocșeri","accusative-definite-nominative-plural":"bocșerii","dative-genitive-indefinite-singular":"bocșer","dative-definite-genitive-singular":"bocșerului","dative-genitive-indefinite-plural":"bocșeri","dative-definite-genitive-plural":"bocșerilor","singular-vocative":"bocșerule","plural-vocative":"bocșerilor"}},{"word":"Bocsig","pos":"name","definitions":["a commune of Arad County, Romania","a village in Bocsig, Arad County, Romania"],"gender":"m"},{"word":"Bocșița","pos":"name","definitions":["a village in Hereclean, Sălaj County, Romania"],"gender":"f"},{"word":"Bocșitura","pos":"name","definitions":["a locality in Cugir, Alba County, Romania"],"gender":"f"},{"word":"boctărie","pos":"noun","definitions":["a small railway station"],"forms":{"plural":"boctării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"boctărie","accusative-definite-nominative-singular":"boctăria","accusative-indefinite-nominative-plural":"boctării","accusative-definite-nominative-plural":"boctăriile","dative-genitive-indefinite-singular":"boctării","dative-definite-genitive-singular":"boctăriei","dative-genitive-indefinite-plural":"boctării","dative-definite-genitive-plural":"boctăriilor","singular-vocative":"boctărie","plural-vocative":"boctăriilor"}},{"word":"Bod","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Bod, Brașov County, Romania"],"gender":"m"},{"word":"Bodăiești","pos":"name","definitions":["a village in Melinești, Dolj County, Romania"],"gender":"m"},{"word":"Bodăieștii de Sus","pos":"name","definitions":["a village in Melinești, Dolj County, Romania"],"gender":"m"},{"word":"Bodaproste","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bodaproste"}},{"word":"bodaproste","pos":"intj","definitions":["alternative form of bogdaproste"]},{"word":"bodârlău","pos":"noun","definitions":["loon (bird)"],"forms":{"plural":"bodârlăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bodârlău","accusative-definite-nominative-singular":"bodârlăuul","accusative-indefinite-nominative-plural":"bodârlăi","accusative-definite-nominative-plural":"bodârlăii","dative-genitive-indefinite-singular":"bodârlău","dative-definite-genitive-singular":"bodârlăuului","dative-genitive-indefinite-plural":"bodârlăi","dative-definite-genitive-plural":"bodârlăilor","singular-vocative":"bodârlăuule","plural-vocative":"bodârlăilor","alternative":"bodîrlău"}},{"word":"bodârlău cu ferăstrău","pos":"noun","definitions":["goosander (Mergus merganser)"]},{"word":"Bodeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bodeanu"}},{"word":"Bodeasa","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania","a village in Săveni, Botoșani County, Romania"],"gender":"f"},{"word":"bodegă","pos":"noun","definitions":["pub, tavern"],"forms":{"plural":"bodegi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bodegă","accusative-definite-nominative-singular":"bodega","accusative-indefinite-nominative-plural":"bodegi","accusative-definite-nominative-plural":"bodegile","dative-genitive-indefinite-singular":"bodegi","dative-definite-genitive-singular":"bodegii","dative-genitive-indefinite-plural":"bodegi","dative-definite-genitive-plural":"bodegilor","singular-vocative":"bodegă","plural-vocative":"bodegilor"}},{"word":"Bodeni","pos":"name","definitions":["a village in Rotari, Transnistria, Moldova"],"gender":"m"},{"word":"Bodescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bodescu"}},{"word":"Bodeștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bodeștean"}},{"word":"Bodeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bodeșteanu"}},{"word":"Bodești","pos":"name","definitions":["a village in Vadu Moților, Alba County, Romania","a village in Hălmagiu, Arad County, Romania","a village in Scânteia, Iași County, Romania","a commune of Neamț County, Romania","a village in Bodești, Neamț County, Romania"],"gender":"m"},{"word":"Bodeștii de Jos","pos":"name","definitions":["a village in Bodești, Neamț County, Romania"],"gender":"m"},{"word":"Bodhaza","pos":"name","definitions":["a town in Cluj County, Romania. Renamed to Boteni in 1925."],"gender":"f"},{"word":"bodicec","pos":"noun","definitions":["body check (in ice hockey)"],"forms":{"plural":"bodicecuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bodicec","accusative-definite-nominative-singular":"bodicecul","accusative-indefinite-nominative-plural":"bodicecuri","accusative-definite-nominative-plural":"bodicecurile","dative-genitive-indefinite-singular":"bodicec","dative-definite-genitive-singular":"bodicecului","dative-genitive-indefinite-plural":"bodicecuri","dative-definite-genitive-plural":"bodicecurilor","singular-vocative":"bodicecule","plural-vocative":"bodicecurilor"}},{"word":"bodigard","pos":"noun","definitions":["alternative form of bodyguard"],"forms":{"plural":"bodigarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bodigard","accusative-definite-nominative-singular":"bodigardul","accusative-indefinite-nominative-plural":"bodigarzi","accusative-definite-nominative-plural":"bodigarzii","dative-genitive-indefinite-singular":"bodigard","dative-definite-genitive-singular":"bodigardului","dative-genitive-indefinite-plural":"bodigarzi","dative-definite-genitive-plural":"bodigarzilor","singular-vocative":"bodigardule","plural-vocative":"bodigarzilor"}},{"word":"bodigarzi","pos":"noun","definitions":["plural of bodigard"],"gender":"m-p"},{"word":"Bodinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bodinescu"}},{"word":"Bodinești","pos":"name","definitions":["a village in Vintilă Vodă, Buzău County, Romania"],"gender":"m"},{"word":"Bodișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bodișteanu"}},{"word":"Bodnar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bodnar"}},{"word":"Bodnăraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bodnăraș"}},{"word":"Bodnăreni","pos":"name","definitions":["a village in Arbore, Suceava County, Romania"],"gender":"m"},{"word":"Bodnărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bodnărescu"}},{"word":"Bodnariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bodnariu"}},{"word":"Bodnariuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Bodnariuc"}},{"word":"Bodnaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bodnaru"}},{"word":"Bodoc","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Bodoc, Covasna County, Romania"],"gender":"m"},{"word":"Bodocan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bodocan"}},{"word":"Bodogaia","pos":"name","definitions":["a village in Secuieni, Harghita County, Romania"],"gender":"f"},{"word":"bodogăneală","pos":"noun","definitions":["mutter"],"forms":{"plural":"bodogăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bodogăneală","accusative-definite-nominative-singular":"bodogăneala","accusative-indefinite-nominative-plural":"bodogăneli","accusative-definite-nominative-plural":"bodogănelile","dative-genitive-indefinite-singular":"bodogăneli","dative-definite-genitive-singular":"bodogănelii","dative-genitive-indefinite-plural":"bodogăneli","dative-definite-genitive-plural":"bodogănelilor","singular-vocative":"bodogăneală","plural-vocative":"bodogănelilor"}},{"word":"bodogăni","pos":"verb","definitions":["to blather","to grumble, to complain"],"forms":{"canonical":"a bodogăni 4th conjugation","present-singular-third-person":"bodogănește","participle-past":"bodogănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bodogăni","gerund":"bodogănind","first-person-indicative-present-singular":"bodogănesc","indicative-present-second-person-singular":"bodogănești","indicative-present-singular-third-person":"bodogănește","first-person-indicative-plural-present":"bodogănim","indicative-plural-present-second-person":"bodogăniți","indicative-plural-present-third-person":"bodogănesc","first-person-imperfect-indicative-singular":"bodogăneam","imperfect-indicative-second-person-singular":"bodogăneai","imperfect-indicative-singular-third-person":"bodogănea","first-person-imperfect-indicative-plural":"bodogăneam","imperfect-indicative-plural-second-person":"bodogăneați","imperfect-indicative-plural-third-person":"bodogăneau","first-person-indicative-perfect-singular":"bodogănii","indicative-perfect-second-person-singular":"bodogăniși","indicative-perfect-singular-third-person":"bodogăni","first-person-indicative-perfect-plural":"bodogănirăm","indicative-perfect-plural-second-person":"bodogănirăți","indicative-perfect-plural-third-person":"bodogăniră","first-person-indicative-pluperfect-singular":"bodogănisem","indicative-pluperfect-second-person-singular":"bodogăniseși","indicative-pluperfect-singular-third-person":"bodogănise","first-person-indicative-pluperfect-plural":"bodogăniserăm","indicative-pluperfect-plural-second-person":"bodogăniserăți","indicative-pluperfect-plural-third-person":"bodogăniseră","first-person-present-singular-subjunctive":"să bodogănesc","present-second-person-singular-subjunctive":"să bodogănești","present-singular-subjunctive-third-person":"să bodogănească","first-person-plural-present-subjunctive":"să bodogănim","plural-present-second-person-subjunctive":"să bodogăniți","plural-present-subjunctive-third-person":"să bodogănească","imperative-second-person-singular":"bodogănește","imperative-plural-second-person":"bodogăniți","imperative-negative-second-person-singular":"nu bodogăni","imperative-negative-plural-second-person":"nu bodogăniți"}},{"word":"Bodoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bodoiu"}},{"word":"Bodolan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bodolan"}},{"word":"Bodoș","pos":"name","definitions":["a village in Baraolt, Covasna County, Romania"],"gender":"m"},{"word":"Bodrești","pos":"name","definitions":["a village in Ciuruleasa, Alba County, Romania"],"gender":"m"},{"word":"bodrogăni","pos":"verb","definitions":["obsolete form of bodogăni"],"forms":{"canonical":"a bodrogăni 4th conjugation","present-singular-third-person":"bodrogănește","participle-past":"bodrogănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bodrogăni","gerund":"bodrogănind","first-person-indicative-present-singular":"bodrogănesc","indicative-present-second-person-singular":"bodrogănești","indicative-present-singular-third-person":"bodrogănește","first-person-indicative-plural-present":"bodrogănim","indicative-plural-present-second-person":"bodrogăniți","indicative-plural-present-third-person":"bodrogănesc","first-person-imperfect-indicative-singular":"bodrogăneam","imperfect-indicative-second-person-singular":"bodrogăneai","imperfect-indicative-singular-third-person":"bodrogănea","first-person-imperfect-indicative-plural":"bodrogăneam","imperfect-indicative-plural-second-person":"bodrogăneați","imperfect-indicative-plural-third-person":"bodrogăneau","first-person-indicative-perfect-singular":"bodrogănii","indicative-perfect-second-person-singular":"bodrogăniși","indicative-perfect-singular-third-person":"bodrogăni","first-person-indicative-perfect-plural":"bodrogănirăm","indicative-perfect-plural-second-person":"bodrogănirăți","indicative-perfect-plural-third-person":"bodrogăniră","first-person-indicative-pluperfect-singular":"bodrogănisem","indicative-pluperfect-second-person-singular":"bodrogăniseși","indicative-pluperfect-singular-third-person":"bodrogănise","first-person-indicative-pluperfect-plural":"bodrogăniserăm","indicative-pluperfect-plural-second-person":"bodrogăniserăți","indicative-pluperfect-plural-third-person":"bodrogăniseră","first-person-present-singular-subjunctive":"să bodrogănesc","present-second-person-singular-subjunctive":"să bodrogănești","present-singular-subjunctive-third-person":"să bodrogănească","first-person-plural-present-subjunctive":"să bodrogănim","plural-present-second-person-subjunctive":"să bodrogăniți","plural-present-subjunctive-third-person":"să bodrogănească","imperative-second-person-singular":"bodrogănește","imperative-plural-second-person":"bodrogăniți","imperative-negative-second-person-singular":"nu bodrogăni","imperative-negative-plural-second-person":"nu bodrogăniți"}},{"word":"Bodrogu Nou","pos":"name","definitions":["a village in Zădăreni, Arad County, Romania"],"gender":"m"},{"word":"Bodrogu Vechi","pos":"name","definitions":["a village in Pecica, Arad County, Romania"],"gender":"m"},{"word":"body","pos":"noun","definitions":["bodysuit"],"forms":{"plural":"body-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"body","accusative-definite-nominative-singular":"body-ul","accusative-indefinite-nominative-plural":"body-uri","accusative-definite-nominative-plural":"body-urile","dative-genitive-indefinite-singular":"body","dative-definite-genitive-singular":"body-ului","dative-genitive-indefinite-plural":"body-uri","dative-definite-genitive-plural":"body-urilor","singular-vocative":"body-ule","plural-vocative":"body-urilor"}},{"word":"body building","pos":"noun","definitions":["bodybuilding"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"body building","accusative-definite-nominative":"body buildingul","dative-genitive-indefinite":"body building","dative-definite-genitive":"body buildingului","vocative":"body buildingule"}},{"word":"bodyguard","pos":"noun","definitions":["bodyguard"],"forms":{"plural":"bodyguarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bodyguard","accusative-definite-nominative-singular":"bodyguardul","accusative-indefinite-nominative-plural":"bodyguarzi","accusative-definite-nominative-plural":"bodyguarzii","dative-genitive-indefinite-singular":"bodyguard","dative-definite-genitive-singular":"bodyguardului","dative-genitive-indefinite-plural":"bodyguarzi","dative-definite-genitive-plural":"bodyguarzilor","singular-vocative":"bodyguardule","plural-vocative":"bodyguarzilor","alternative":"bodigard"}},{"word":"bodyguarzi","pos":"noun","definitions":["plural of bodyguard"],"gender":"m-p"},{"word":"boem","pos":"noun","definitions":["Bohemian"],"pronunciation":"/boˈem/","forms":{"plural":"boemi","feminine":"equivalent boemă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boem","accusative-definite-nominative-singular":"boemul","accusative-indefinite-nominative-plural":"boemi","accusative-definite-nominative-plural":"boemii","dative-genitive-indefinite-singular":"boem","dative-definite-genitive-singular":"boemului","dative-genitive-indefinite-plural":"boemi","dative-definite-genitive-plural":"boemilor","singular-vocative":"boemule","plural-vocative":"boemilor"}},{"word":"boem","pos":"adj","definitions":["Bohemian"],"pronunciation":"/boˈem/","forms":{"feminine-singular":"boemă","masculine-plural":"boemi","feminine-neuter-plural":"boeme","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"boem","error-unrecognized-form-feminine-indefinite-singular":"boemă","error-unrecognized-form-indefinite-masculine-plural":"boemi","error-unrecognized-form-feminine-indefinite-neuter-plural":"boeme","definite-error-unrecognized-form-masculine-neuter-singular":"boemul","definite-error-unrecognized-form-feminine-singular":"boema","definite-error-unrecognized-form-masculine-plural":"boemii","definite-error-unrecognized-form-feminine-neuter-plural":"boemele"}},{"word":"boem","pos":"noun","definitions":["bohemian"],"pronunciation":"/boˈem/","forms":{"plural":"boemi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boem","accusative-definite-nominative-singular":"boemul","accusative-indefinite-nominative-plural":"boemi","accusative-definite-nominative-plural":"boemii","dative-genitive-indefinite-singular":"boem","dative-definite-genitive-singular":"boemului","dative-genitive-indefinite-plural":"boemi","dative-definite-genitive-plural":"boemilor","singular-vocative":"boemule","plural-vocative":"boemilor"}},{"word":"boem","pos":"adj","definitions":["bohemian"],"pronunciation":"/boˈem/","forms":{"feminine-singular":"boemă","masculine-plural":"boemi","feminine-neuter-plural":"boeme","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"boem","error-unrecognized-form-feminine-indefinite-singular":"boemă","error-unrecognized-form-indefinite-masculine-plural":"boemi","error-unrecognized-form-feminine-indefinite-neuter-plural":"boeme","definite-error-unrecognized-form-masculine-neuter-singular":"boemul","definite-error-unrecognized-form-feminine-singular":"boema","definite-error-unrecognized-form-masculine-plural":"boemii","definite-error-unrecognized-form-feminine-neuter-plural":"boemele"}},{"word":"boemă","pos":"noun","definitions":["female equivalent of boem"],"forms":{"plural":"boeme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boemă","accusative-definite-nominative-singular":"boema","accusative-indefinite-nominative-plural":"boeme","accusative-definite-nominative-plural":"boemele","dative-genitive-indefinite-singular":"boeme","dative-definite-genitive-singular":"boemei","dative-genitive-indefinite-plural":"boeme","dative-definite-genitive-plural":"boemelor","singular-vocative":"boemă","plural-vocative":"boemelor"}},{"word":"Boemia","pos":"name","definitions":["Bohemia (a cultural region in the west of the former Czechoslovakia and present-day Czech Republic)"],"pronunciation":"[boˈe.mi.a]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Boemia","dative-definite-genitive":"Boemiei"}},{"word":"boemoaică","pos":"noun","definitions":["female equivalent of boem"],"forms":{"plural":"boemoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boemoaică","accusative-definite-nominative-singular":"boemoaica","accusative-indefinite-nominative-plural":"boemoaice","accusative-definite-nominative-plural":"boemoaicele","dative-genitive-indefinite-singular":"boemoaice","dative-definite-genitive-singular":"boemoaicei","dative-genitive-indefinite-plural":"boemoaice","dative-definite-genitive-plural":"boemoaicelor","singular-vocative":"boemoaică","plural-vocative":"boemoaicelor"}},{"word":"Boer","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boer"}},{"word":"Boerescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boerescu"}},{"word":"Boeriu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boeriu"}},{"word":"Boeru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boeru"}},{"word":"bogacie","pos":"noun","definitions":["luggage"],"forms":{"plural":"bogacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bogacie","accusative-definite-nominative-singular":"bogacia","accusative-indefinite-nominative-plural":"bogacii","accusative-definite-nominative-plural":"bogaciile","dative-genitive-indefinite-singular":"bogacii","dative-definite-genitive-singular":"bogaciei","dative-genitive-indefinite-plural":"bogacii","dative-definite-genitive-plural":"bogaciilor","singular-vocative":"bogacie","plural-vocative":"bogaciilor"}},{"word":"Bogănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bogănescu"}},{"word":"bogasier","pos":"noun","definitions":["cloth merchant"],"forms":{"plural":"bogasieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogasier","accusative-definite-nominative-singular":"bogasierul","accusative-indefinite-nominative-plural":"bogasieri","accusative-definite-nominative-plural":"bogasierii","dative-genitive-indefinite-singular":"bogasier","dative-definite-genitive-singular":"bogasierului","dative-genitive-indefinite-plural":"bogasieri","dative-definite-genitive-plural":"bogasierilor","singular-vocative":"bogasierule","plural-vocative":"bogasierilor"}},{"word":"bogasierie","pos":"noun","definitions":["cloth commerce"],"forms":{"plural":"bogasierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bogasierie","accusative-definite-nominative-singular":"bogasieria","accusative-indefinite-nominative-plural":"bogasierii","accusative-definite-nominative-plural":"bogasieriile","dative-genitive-indefinite-singular":"bogasierii","dative-definite-genitive-singular":"bogasieriei","dative-genitive-indefinite-plural":"bogasierii","dative-definite-genitive-plural":"bogasieriilor","singular-vocative":"bogasierie","plural-vocative":"bogasieriilor"}},{"word":"bogasiu","pos":"noun","definitions":["a kind of twilled high-quality cotton used for garments, or particularly their linings"],"forms":{"plural":"bogasiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bogasiu","accusative-definite-nominative-singular":"bogasiul","accusative-indefinite-nominative-plural":"bogasiuri","accusative-definite-nominative-plural":"bogasiurile","dative-genitive-indefinite-singular":"bogasiu","dative-definite-genitive-singular":"bogasiului","dative-genitive-indefinite-plural":"bogasiuri","dative-definite-genitive-plural":"bogasiurilor","singular-vocative":"bogasiule","plural-vocative":"bogasiurilor"}},{"word":"Bogat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogat"}},{"word":"bogat","pos":"adj","definitions":["rich, wealthy","luxurious, expensive"],"pronunciation":"/boˈɡat/","forms":{"feminine-singular":"bogată","masculine-plural":"bogați","feminine-neuter-plural":"bogate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogat","error-unrecognized-form-feminine-indefinite-singular":"bogată","error-unrecognized-form-indefinite-masculine-plural":"bogați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogate","definite-error-unrecognized-form-masculine-neuter-singular":"bogatul","definite-error-unrecognized-form-feminine-singular":"bogata","definite-error-unrecognized-form-masculine-plural":"bogații","definite-error-unrecognized-form-feminine-neuter-plural":"bogatele","alternative":"богат"}},{"word":"bogat","pos":"adv","definitions":["richly, fully, amply"],"pronunciation":"/boˈɡat/","forms":{"alternative":"богат"}},{"word":"bogat","pos":"noun","definitions":["a rich or wealthy person"],"pronunciation":"/boˈɡat/","forms":{"plural":"bogați","feminine":"equivalent bogată","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogat","accusative-definite-nominative-singular":"bogatul","accusative-indefinite-nominative-plural":"bogați","accusative-definite-nominative-plural":"bogații","dative-genitive-indefinite-singular":"bogat","dative-definite-genitive-singular":"bogatului","dative-genitive-indefinite-plural":"bogați","dative-definite-genitive-plural":"bogaților","singular-vocative":"bogatule","plural-vocative":"bogaților","alternative":"богат"}},{"word":"Bogata","pos":"name","definitions":["a village in Dofteana, Bacău County, Romania","a village in Grădiștea, Călărași County, Romania","a village in Călărași, Cluj County, Romania","a commune of Mureș County, Romania","a village in Bogata, Mureș County, Romania"],"gender":"f"},{"word":"bogata","pos":"noun","definitions":["definite nominative/accusative singular of bogată"]},{"word":"bogată","pos":"noun","definitions":["female equivalent of bogat"],"forms":{"plural":"bogate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bogată","accusative-definite-nominative-singular":"bogata","accusative-indefinite-nominative-plural":"bogate","accusative-definite-nominative-plural":"bogatele","dative-genitive-indefinite-singular":"bogate","dative-definite-genitive-singular":"bogatei","dative-genitive-indefinite-plural":"bogate","dative-definite-genitive-plural":"bogatelor","singular-vocative":"bogată","plural-vocative":"bogatelor"}},{"word":"Bogata de Jos","pos":"name","definitions":["a village in Vad, Cluj County, Romania"],"gender":"f"},{"word":"Bogata de Sus","pos":"name","definitions":["a village in Vad, Cluj County, Romania"],"gender":"f"},{"word":"Bogata Olteană","pos":"name","definitions":["a village in Hoghiz, Brașov County, Romania"],"gender":"f"},{"word":"Bogătan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogătan"}},{"word":"bogătan","pos":"noun","definitions":["rich person"],"forms":{"plural":"bogătani","feminine":"equivalent bogătană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogătan","accusative-definite-nominative-singular":"bogătanul","accusative-indefinite-nominative-plural":"bogătani","accusative-definite-nominative-plural":"bogătanii","dative-genitive-indefinite-singular":"bogătan","dative-definite-genitive-singular":"bogătanului","dative-genitive-indefinite-plural":"bogătani","dative-definite-genitive-plural":"bogătanilor","singular-vocative":"bogătanule","plural-vocative":"bogătanilor"}},{"word":"bogătană","pos":"noun","definitions":["female equivalent of bogătan"],"forms":{"plural":"bogătane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bogătană","accusative-definite-nominative-singular":"bogătana","accusative-indefinite-nominative-plural":"bogătane","accusative-definite-nominative-plural":"bogătanele","dative-genitive-indefinite-singular":"bogătane","dative-definite-genitive-singular":"bogătanei","dative-genitive-indefinite-plural":"bogătane","dative-definite-genitive-plural":"bogătanelor","singular-vocative":"bogătană","plural-vocative":"bogătanelor"}},{"word":"bogătancă","pos":"noun","definitions":["a rich woman"],"forms":{"plural":"bogătance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bogătancă","accusative-definite-nominative-singular":"bogătanca","accusative-indefinite-nominative-plural":"bogătance","accusative-definite-nominative-plural":"bogătancele","dative-genitive-indefinite-singular":"bogătance","dative-definite-genitive-singular":"bogătancei","dative-genitive-indefinite-plural":"bogătance","dative-definite-genitive-plural":"bogătancelor","singular-vocative":"bogătancă","plural-vocative":"bogătancelor"}},{"word":"bogatâr","pos":"noun","definitions":["bogatyr"],"forms":{"plural":"bogatâri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogatâr","accusative-definite-nominative-singular":"bogatârul","accusative-indefinite-nominative-plural":"bogatâri","accusative-definite-nominative-plural":"bogatârii","dative-genitive-indefinite-singular":"bogatâr","dative-definite-genitive-singular":"bogatârului","dative-genitive-indefinite-plural":"bogatâri","dative-definite-genitive-plural":"bogatârilor","singular-vocative":"bogatârule","plural-vocative":"bogatârilor","alternative":"bogatîr"}},{"word":"bogătar","pos":"noun","definitions":["rich person"],"forms":{"plural":"bogătari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogătar","accusative-definite-nominative-singular":"bogătarul","accusative-indefinite-nominative-plural":"bogătari","accusative-definite-nominative-plural":"bogătarii","dative-genitive-indefinite-singular":"bogătar","dative-definite-genitive-singular":"bogătarului","dative-genitive-indefinite-plural":"bogătari","dative-definite-genitive-plural":"bogătarilor","singular-vocative":"bogătarule","plural-vocative":"bogătarilor"}},{"word":"bogătaș","pos":"noun","definitions":["rich man"],"forms":{"plural":"bogătași","feminine":"equivalent bogătașă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogătaș","accusative-definite-nominative-singular":"bogătașul","accusative-indefinite-nominative-plural":"bogătași","accusative-definite-nominative-plural":"bogătașii","dative-genitive-indefinite-singular":"bogătaș","dative-definite-genitive-singular":"bogătașului","dative-genitive-indefinite-plural":"bogătași","dative-definite-genitive-plural":"bogătașilor","singular-vocative":"bogătașule","plural-vocative":"bogătașilor"}},{"word":"bogătașă","pos":"noun","definitions":["female equivalent of bogătaș"],"forms":{"plural":"bogătașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bogătașă","accusative-definite-nominative-singular":"bogătașa","accusative-indefinite-nominative-plural":"bogătașe","accusative-definite-nominative-plural":"bogătașele","dative-genitive-indefinite-singular":"bogătașe","dative-definite-genitive-singular":"bogătașei","dative-genitive-indefinite-plural":"bogătașe","dative-definite-genitive-plural":"bogătașelor","singular-vocative":"bogătașă","plural-vocative":"bogătașelor"}},{"word":"bogătate","pos":"noun","definitions":["wealth, richness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bogătate","accusative-definite-nominative-singular":"bogătatea","accusative-indefinite-nominative-plural":"bogătăți","accusative-definite-nominative-plural":"bogătățile","dative-genitive-indefinite-singular":"bogătăți","dative-definite-genitive-singular":"bogătății","dative-genitive-indefinite-plural":"bogătăți","dative-definite-genitive-plural":"bogătăților","singular-vocative":"bogătate","plural-vocative":"bogătăților"}},{"word":"Bogățeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bogățeanu"}},{"word":"bogățel","pos":"noun","definitions":["diminutive of bogat"],"forms":{"plural":"bogăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogățel","accusative-definite-nominative-singular":"bogățelul","accusative-indefinite-nominative-plural":"bogăței","accusative-definite-nominative-plural":"bogățeii","dative-genitive-indefinite-singular":"bogățel","dative-definite-genitive-singular":"bogățelului","dative-genitive-indefinite-plural":"bogăței","dative-definite-genitive-plural":"bogățeilor","singular-vocative":"bogățelule","plural-vocative":"bogățeilor"}},{"word":"Bogați","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bogați, Argeș County, Romania"],"gender":"m"},{"word":"bogați","pos":"noun","definitions":["plural of bogat"],"gender":"m"},{"word":"bogățică","pos":"adj","definitions":["diminutive of bogat"],"forms":{"plural":"bogățice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"bogățică","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogățice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"bogățica","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"bogățicele"}},{"word":"bogățică","pos":"noun","definitions":["diminutive of -ică"],"forms":{"plural":"bogățele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bogățică","accusative-definite-nominative-singular":"bogățica","accusative-indefinite-nominative-plural":"bogățele","accusative-definite-nominative-plural":"bogățelele","dative-genitive-indefinite-singular":"bogățele","dative-definite-genitive-singular":"bogățelei","dative-genitive-indefinite-plural":"bogățele","dative-definite-genitive-plural":"bogățelelor","singular-vocative":"bogățică","plural-vocative":"bogățelelor"}},{"word":"bogăție","pos":"noun","definitions":["wealth, richness","abundance, ampleness"],"forms":{"plural":"bogății","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bogăție","accusative-definite-nominative-singular":"bogăția","accusative-indefinite-nominative-plural":"bogății","accusative-definite-nominative-plural":"bogățiile","dative-genitive-indefinite-singular":"bogății","dative-definite-genitive-singular":"bogăției","dative-genitive-indefinite-plural":"bogății","dative-definite-genitive-plural":"bogățiilor","singular-vocative":"bogăție","plural-vocative":"bogățiilor"}},{"word":"bogăție naturală","pos":"noun","definitions":["natural resource"],"forms":{"plural":"bogății naturale"}},{"word":"bogătoi","pos":"noun","definitions":["augmentative of bogat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bogătoi","accusative-definite-nominative":"bogătoiul","dative-genitive-indefinite":"bogătoi","dative-definite-genitive":"bogătoiului","vocative":"bogătoiule"}},{"word":"Bogătoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bogătoiu"}},{"word":"Bogatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogatu"}},{"word":"Bogatu Român","pos":"name","definitions":["a village in Păuca, Sibiu County, Romania"],"gender":"m","forms":{"alternative":"Bogatu Romîn"}},{"word":"bogaz","pos":"noun","definitions":["inlet"],"forms":{"plural":"bogazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bogaz","accusative-definite-nominative-singular":"bogazul","accusative-indefinite-nominative-plural":"bogazuri","accusative-definite-nominative-plural":"bogazurile","dative-genitive-indefinite-singular":"bogaz","dative-definite-genitive-singular":"bogazului","dative-genitive-indefinite-plural":"bogazuri","dative-definite-genitive-plural":"bogazurilor","singular-vocative":"bogazule","plural-vocative":"bogazurilor"}},{"word":"Bogazchioi","pos":"name","definitions":["Cernavodă"],"gender":"f"},{"word":"Bogdan","pos":"name","definitions":["a male given name"],"pronunciation":"[boɡˈdan]","gender":"m","forms":{"dative-genitive":"lui Bogdan"}},{"word":"bogdan","pos":"noun","definitions":["a Moldavian"],"pronunciation":"[boɡˈdan]","forms":{"plural":"bogdani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogdan","accusative-definite-nominative-singular":"bogdanul","accusative-indefinite-nominative-plural":"bogdani","accusative-definite-nominative-plural":"bogdanii","dative-genitive-indefinite-singular":"bogdan","dative-definite-genitive-singular":"bogdanului","dative-genitive-indefinite-plural":"bogdani","dative-definite-genitive-plural":"bogdanilor","singular-vocative":"bogdanule","plural-vocative":"bogdanilor"}},{"word":"Bogdan Vodă","pos":"name","definitions":["a village in Săucești, Bacău County, Romania","a commune of Maramureș County, Romania","a village in Bogdan Vodă, Maramureș County, Romania"],"gender":"m"},{"word":"Bogdana","pos":"name","definitions":["a village in Ștefan cel Mare, Bacău County, Romania","a village in Dragoș Vodă, Călărași County, Romania","a village in Buciumi, Sălaj County, Romania","a commune of Teleorman County, Romania","a village in Bogdana, Teleorman County, Romania"],"gender":"f"},{"word":"Bogdana-Voloseni","pos":"name","definitions":["a village in Stănilești, Vaslui County, Romania"],"gender":"f"},{"word":"Bogdănaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogdănaș"}},{"word":"Bogdand","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Bogdand, Satu Mare County, Romania"],"gender":"m"},{"word":"Bogdănel","pos":"name","definitions":["a diminutive of the male given name Bogdan"],"gender":"m","forms":{"dative-genitive":"lui Bogdănel"}},{"word":"bogdănesc","pos":"adj","definitions":["Moldavian"],"forms":{"feminine-singular":"bogdănească","plural":"bogdănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogdănesc","error-unrecognized-form-feminine-indefinite-singular":"bogdănească","error-unrecognized-form-indefinite-masculine-plural":"bogdănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogdănești","definite-error-unrecognized-form-masculine-neuter-singular":"bogdănescul","definite-error-unrecognized-form-feminine-singular":"bogdăneasca","definite-error-unrecognized-form-masculine-plural":"bogdăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"bogdăneștile"}},{"word":"Bogdănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bogdănescu"}},{"word":"Bogdănești","pos":"name","definitions":["a village in Mogoș, Alba County, Romania","a village in Vidra, Alba County, Romania","a commune of Bacău County, Romania","a village in Bogdănești, Bacău County, Romania","a village in Scorțeni, Bacău County, Romania"],"gender":"m"},{"word":"Bogdănița","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Bogdănița, Vaslui County, Romania"],"gender":"f"},{"word":"bogdanliu","pos":"noun","definitions":["Moldavian"],"forms":{"plural":"bogdanlii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogdanliu","accusative-definite-nominative-singular":"bogdanliuul","accusative-indefinite-nominative-plural":"bogdanlii","accusative-definite-nominative-plural":"bogdanliii","dative-genitive-indefinite-singular":"bogdanliu","dative-definite-genitive-singular":"bogdanliuului","dative-genitive-indefinite-plural":"bogdanlii","dative-definite-genitive-plural":"bogdanliilor","singular-vocative":"bogdanliuule","plural-vocative":"bogdanliilor"}},{"word":"Bogdănoiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bogdănoiu"}},{"word":"Bogdanovca","pos":"name","definitions":["a village in Iserlia, Basarabeasca Raion, Moldova"],"gender":"f"},{"word":"Bogdanovca Nouă","pos":"name","definitions":["a village in Cimișlia, Cimișlia Raion, Moldova"],"gender":"f"},{"word":"Bogdanovca Veche","pos":"name","definitions":["a village in Cimișlia, Cimișlia Raion, Moldova"],"gender":"f"},{"word":"bogdaproste","pos":"intj","definitions":["thank you"]},{"word":"bogdaprosti","pos":"verb","definitions":["to thank"],"forms":{"canonical":"a bogdaprosti 4th conjugation","present-singular-third-person":"bogdaprostie","participle-past":"bogdaprostit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bogdaprosti","gerund":"bogdaprostind","first-person-indicative-present-singular":"bogdaprost","indicative-present-second-person-singular":"bogdaproști","indicative-present-singular-third-person":"bogdaproste","first-person-indicative-plural-present":"bogdaprostim","indicative-plural-present-second-person":"bogdaprostiți","indicative-plural-present-third-person":"bogdaprost","first-person-imperfect-indicative-singular":"bogdaprosteam","imperfect-indicative-second-person-singular":"bogdaprosteai","imperfect-indicative-singular-third-person":"bogdaprostea","first-person-imperfect-indicative-plural":"bogdaprosteam","imperfect-indicative-plural-second-person":"bogdaprosteați","imperfect-indicative-plural-third-person":"bogdaprosteau","first-person-indicative-perfect-singular":"bogdaprostii","indicative-perfect-second-person-singular":"bogdaprostiși","indicative-perfect-singular-third-person":"bogdaprosti","first-person-indicative-perfect-plural":"bogdaprostirăm","indicative-perfect-plural-second-person":"bogdaprostirăți","indicative-perfect-plural-third-person":"bogdaprostiră","first-person-indicative-pluperfect-singular":"bogdaprostisem","indicative-pluperfect-second-person-singular":"bogdaprostiseși","indicative-pluperfect-singular-third-person":"bogdaprostise","first-person-indicative-pluperfect-plural":"bogdaprostiserăm","indicative-pluperfect-plural-second-person":"bogdaprostiserăți","indicative-pluperfect-plural-third-person":"bogdaprostiseră","first-person-present-singular-subjunctive":"să bogdaprost","present-second-person-singular-subjunctive":"să bogdaproști","present-singular-subjunctive-third-person":"să bogdaprostă","first-person-plural-present-subjunctive":"să bogdaprostim","plural-present-second-person-subjunctive":"să bogdaprostiți","plural-present-subjunctive-third-person":"să bogdaprostă","imperative-second-person-singular":"bogdaproste","imperative-plural-second-person":"bogdaprostiți","imperative-negative-second-person-singular":"nu bogdaprosti","imperative-negative-plural-second-person":"nu bogdaprostiți"}},{"word":"Bogea","pos":"name","definitions":["a village in Almăj, Dolj County, Romania"],"gender":"f"},{"word":"Bogești","pos":"name","definitions":["a village in Pogana, Vaslui County, Romania"],"gender":"m"},{"word":"boghecuță","pos":"noun","definitions":["diminutive of bogheacă"],"forms":{"plural":"boghecuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boghecuță","accusative-definite-nominative-singular":"boghecuța","accusative-indefinite-nominative-plural":"boghecuțe","accusative-definite-nominative-plural":"boghecuțele","dative-genitive-indefinite-singular":"boghecuțe","dative-definite-genitive-singular":"boghecuței","dative-genitive-indefinite-plural":"boghecuțe","dative-definite-genitive-plural":"boghecuțelor","singular-vocative":"boghecuță","plural-vocative":"boghecuțelor"}},{"word":"Boghenii Noi","pos":"name","definitions":["a commune of Ungheni Raion, Moldova","a village in Boghenii Noi, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Boghenii Vechi","pos":"name","definitions":["a village in Boghenii Noi, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Boghești","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Boghești, Vrancea County, Romania"],"gender":"m"},{"word":"Bogheștii de Sus","pos":"name","definitions":["a village in Boghești, Vrancea County, Romania"],"gender":"m"},{"word":"boghet","pos":"adj","definitions":["having a topknot (about birds)"],"forms":{"feminine-singular":"boghetă","masculine-plural":"bogheți","feminine-neuter-plural":"boghete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boghet","error-unrecognized-form-feminine-indefinite-singular":"boghetă","error-unrecognized-form-indefinite-masculine-plural":"bogheți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boghete","definite-error-unrecognized-form-masculine-neuter-singular":"boghetul","definite-error-unrecognized-form-feminine-singular":"bogheta","definite-error-unrecognized-form-masculine-plural":"bogheții","definite-error-unrecognized-form-feminine-neuter-plural":"boghetele"}},{"word":"Boghiceni","pos":"name","definitions":["a village in Boghiceni, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"m"},{"word":"Boghină","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Boghină"}},{"word":"Boghiș","pos":"name","definitions":["a village in Doba, Satu Mare County, Romania","a commune of Sălaj County, Romania","a village in Boghiș, Sălaj County, Romania"],"gender":"m"},{"word":"boghiță","pos":"noun","definitions":["diminutive of boaghe"],"forms":{"plural":"boghițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boghiță","accusative-definite-nominative-singular":"boghița","accusative-indefinite-nominative-plural":"boghițe","accusative-definite-nominative-plural":"boghițele","dative-genitive-indefinite-singular":"boghițe","dative-definite-genitive-singular":"boghiței","dative-genitive-indefinite-plural":"boghițe","dative-definite-genitive-plural":"boghițelor","singular-vocative":"boghiță","plural-vocative":"boghițelor"}},{"word":"boghiu","pos":"noun","definitions":["bogie (one of two sets of wheels under a locomotive or railcar)"],"forms":{"plural":"boghiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boghiu","accusative-definite-nominative-singular":"boghiuul","accusative-indefinite-nominative-plural":"boghiuri","accusative-definite-nominative-plural":"boghiurile","dative-genitive-indefinite-singular":"boghiu","dative-definite-genitive-singular":"boghiuului","dative-genitive-indefinite-plural":"boghiuri","dative-definite-genitive-plural":"boghiurilor","singular-vocative":"boghiuule","plural-vocative":"boghiurilor"}},{"word":"boglar","pos":"noun","definitions":["celery-leaved buttercup, Ranunculus sceleratus"],"forms":{"plural":"boglari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boglar","accusative-definite-nominative-singular":"boglarul","accusative-indefinite-nominative-plural":"boglari","accusative-definite-nominative-plural":"boglarii","dative-genitive-indefinite-singular":"boglar","dative-definite-genitive-singular":"boglarului","dative-genitive-indefinite-plural":"boglari","dative-definite-genitive-plural":"boglarilor","singular-vocative":"boglarule","plural-vocative":"boglarilor"}},{"word":"boglari","pos":"noun","definitions":["celery-leaved buttercup, Ranunculus sceleratus (a flowering plant in the genus Ranunculus)"],"forms":{"plural":"boglari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boglari","accusative-definite-nominative-singular":"boglariul","accusative-indefinite-nominative-plural":"boglari","accusative-definite-nominative-plural":"boglarii","dative-genitive-indefinite-singular":"boglari","dative-definite-genitive-singular":"boglariului","dative-genitive-indefinite-plural":"boglari","dative-definite-genitive-plural":"boglarilor","singular-vocative":"boglariule","plural-vocative":"boglarilor"}},{"word":"Boglești","pos":"name","definitions":["a village in Ciuruleasa, Alba County, Romania"],"gender":"m"},{"word":"bogoboreț","pos":"noun","definitions":["fighter against God"],"forms":{"plural":"bogoboreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogoboreț","accusative-definite-nominative-singular":"bogoborețul","accusative-indefinite-nominative-plural":"bogoboreți","accusative-definite-nominative-plural":"bogoboreții","dative-genitive-indefinite-singular":"bogoboreț","dative-definite-genitive-singular":"bogoborețului","dative-genitive-indefinite-plural":"bogoboreți","dative-definite-genitive-plural":"bogoboreților","singular-vocative":"bogoborețule","plural-vocative":"bogoboreților"}},{"word":"Bogodinț","pos":"name","definitions":["a village in Sasca Montană, Caraș-Severin County, Romania"],"gender":"m"},{"word":"bogomil","pos":"noun","definitions":["Bogomil"],"forms":{"plural":"bogomili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogomil","accusative-definite-nominative-singular":"bogomilul","accusative-indefinite-nominative-plural":"bogomili","accusative-definite-nominative-plural":"bogomilii","dative-genitive-indefinite-singular":"bogomil","dative-definite-genitive-singular":"bogomilului","dative-genitive-indefinite-plural":"bogomili","dative-definite-genitive-plural":"bogomililor","singular-vocative":"bogomilule","plural-vocative":"bogomililor"}},{"word":"bogomilic","pos":"adj","definitions":["Bogomil (attributive)"],"forms":{"feminine-singular":"bogomilică","masculine-plural":"bogomilici","feminine-neuter-plural":"bogomilice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogomilic","error-unrecognized-form-feminine-indefinite-singular":"bogomilică","error-unrecognized-form-indefinite-masculine-plural":"bogomilici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogomilice","definite-error-unrecognized-form-masculine-neuter-singular":"bogomilicul","definite-error-unrecognized-form-feminine-singular":"bogomilica","definite-error-unrecognized-form-masculine-plural":"bogomilicii","definite-error-unrecognized-form-feminine-neuter-plural":"bogomilicele"}},{"word":"bogomilism","pos":"noun","definitions":["Bogomilism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bogomilism","accusative-definite-nominative":"bogomilismul","dative-genitive-indefinite":"bogomilism","dative-definite-genitive":"bogomilismului","vocative":"bogomilismule"}},{"word":"bogonoseț","pos":"noun","definitions":["God-fearing person"],"forms":{"plural":"bogonoseți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogonoseț","accusative-definite-nominative-singular":"bogonosețul","accusative-indefinite-nominative-plural":"bogonoseți","accusative-definite-nominative-plural":"bogonoseții","dative-genitive-indefinite-singular":"bogonoseț","dative-definite-genitive-singular":"bogonosețului","dative-genitive-indefinite-plural":"bogonoseți","dative-definite-genitive-plural":"bogonoseților","singular-vocative":"bogonosețule","plural-vocative":"bogonoseților"}},{"word":"bogonosnic","pos":"adj","definitions":["God-fearing person"],"forms":{"feminine-singular":"bogonosnică","masculine-plural":"bogonosnici","feminine-neuter-plural":"bogonosnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogonosnic","error-unrecognized-form-feminine-indefinite-singular":"bogonosnică","error-unrecognized-form-indefinite-masculine-plural":"bogonosnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogonosnice","definite-error-unrecognized-form-masculine-neuter-singular":"bogonosnicul","definite-error-unrecognized-form-feminine-singular":"bogonosnica","definite-error-unrecognized-form-masculine-plural":"bogonosnicii","definite-error-unrecognized-form-feminine-neuter-plural":"bogonosnicele"}},{"word":"bogorecenie","pos":"noun","definitions":["theory"],"forms":{"plural":"bogorecenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bogorecenie","accusative-definite-nominative-singular":"bogorecenia","accusative-indefinite-nominative-plural":"bogorecenii","accusative-definite-nominative-plural":"bogoreceniile","dative-genitive-indefinite-singular":"bogorecenii","dative-definite-genitive-singular":"bogoreceniei","dative-genitive-indefinite-plural":"bogorecenii","dative-definite-genitive-plural":"bogoreceniilor","singular-vocative":"bogorecenie","plural-vocative":"bogoreceniilor"}},{"word":"bogoslov","pos":"noun","definitions":["theologian"],"forms":{"plural":"bogoslovi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bogoslov","accusative-definite-nominative-singular":"bogoslovul","accusative-indefinite-nominative-plural":"bogoslovi","accusative-definite-nominative-plural":"bogoslovii","dative-genitive-indefinite-singular":"bogoslov","dative-definite-genitive-singular":"bogoslovului","dative-genitive-indefinite-plural":"bogoslovi","dative-definite-genitive-plural":"bogoslovilor","singular-vocative":"bogoslovule","plural-vocative":"bogoslovilor"}},{"word":"bogoslovesc","pos":"adj","definitions":["theological"],"forms":{"feminine-singular":"bogoslovească","plural":"bogoslovești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bogoslovesc","error-unrecognized-form-feminine-indefinite-singular":"bogoslovească","error-unrecognized-form-indefinite-masculine-plural":"bogoslovești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bogoslovești","definite-error-unrecognized-form-masculine-neuter-singular":"bogoslovescul","definite-error-unrecognized-form-feminine-singular":"bogosloveasca","definite-error-unrecognized-form-masculine-plural":"bogosloveștii","definite-error-unrecognized-form-feminine-neuter-plural":"bogosloveștile"}},{"word":"bogoslovie","pos":"noun","definitions":["theology"],"forms":{"plural":"bogoslovii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bogoslovie","accusative-definite-nominative-singular":"bogoslovia","accusative-indefinite-nominative-plural":"bogoslovii","accusative-definite-nominative-plural":"bogosloviile","dative-genitive-indefinite-singular":"bogoslovii","dative-definite-genitive-singular":"bogosloviei","dative-genitive-indefinite-plural":"bogoslovii","dative-definite-genitive-plural":"bogosloviilor","singular-vocative":"bogoslovie","plural-vocative":"bogosloviilor"}},{"word":"Boguleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boguleanu"}},{"word":"Bogza","pos":"name","definitions":["a village in Sihlea, Vrancea County, Romania"],"gender":"f"},{"word":"Bogzeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bogzeanu"}},{"word":"Bogzești","pos":"name","definitions":["a village in Secuieni, Neamț County, Romania"],"gender":"m"},{"word":"Boholț","pos":"name","definitions":["a village in Beclean, Brașov County, Romania","a village in Șoimuș, Hunedoara County, Romania"],"gender":"m"},{"word":"Boholțan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boholțan"}},{"word":"Boholțeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boholțeanu"}},{"word":"Bohorel","pos":"name","definitions":["a village in Negomir, Gorj County, Romania"],"gender":"m"},{"word":"Bohotin","pos":"name","definitions":["a village in Răducăneni, Iași County, Romania"],"gender":"m"},{"word":"Bohotineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bohotineanu"}},{"word":"bohriu","pos":"noun","definitions":["bohrium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bohriu","accusative-definite-nominative":"bohriul","dative-genitive-indefinite":"bohriu","dative-definite-genitive":"bohriului","vocative":"bohriule"}},{"word":"boi","pos":"noun","definitions":["stature, appearance, mien, habitus"],"pronunciation":"/boj/","forms":{"plural":"boiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boi","accusative-definite-nominative-singular":"boiul","accusative-indefinite-nominative-plural":"boiuri","accusative-definite-nominative-plural":"boiurile","dative-genitive-indefinite-singular":"boi","dative-definite-genitive-singular":"boiului","dative-genitive-indefinite-plural":"boiuri","dative-definite-genitive-plural":"boiurilor","singular-vocative":"boiule","plural-vocative":"boiurilor","alternative":"бой"}},{"word":"boi","pos":"verb","definitions":["to paint","to put on make-up","to fool"],"pronunciation":"/boj/","forms":{"canonical":"a boi 4th conjugation","present-singular-third-person":"boiește","participle-past":"boit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boi","gerund":"boind","first-person-indicative-present-singular":"boiesc","indicative-present-second-person-singular":"boiești","indicative-present-singular-third-person":"boiește","first-person-indicative-plural-present":"boim","indicative-plural-present-second-person":"boiți","indicative-plural-present-third-person":"boiesc","first-person-imperfect-indicative-singular":"boiam","imperfect-indicative-second-person-singular":"boiai","imperfect-indicative-singular-third-person":"boia","first-person-imperfect-indicative-plural":"boiam","imperfect-indicative-plural-second-person":"boiați","imperfect-indicative-plural-third-person":"boiau","first-person-indicative-perfect-singular":"boii","indicative-perfect-second-person-singular":"boiși","indicative-perfect-singular-third-person":"boi","first-person-indicative-perfect-plural":"boirăm","indicative-perfect-plural-second-person":"boirăți","indicative-perfect-plural-third-person":"boiră","first-person-indicative-pluperfect-singular":"boisem","indicative-pluperfect-second-person-singular":"boiseși","indicative-pluperfect-singular-third-person":"boise","first-person-indicative-pluperfect-plural":"boiserăm","indicative-pluperfect-plural-second-person":"boiserăți","indicative-pluperfect-plural-third-person":"boiseră","first-person-present-singular-subjunctive":"să boiesc","present-second-person-singular-subjunctive":"să boiești","present-singular-subjunctive-third-person":"să boiască","first-person-plural-present-subjunctive":"să boim","plural-present-second-person-subjunctive":"să boiți","plural-present-subjunctive-third-person":"să boiască","imperative-second-person-singular":"boiește","imperative-plural-second-person":"boiți","imperative-negative-second-person-singular":"nu boi","imperative-negative-plural-second-person":"nu boiți","alternative":"бой"}},{"word":"boi","pos":"noun","definitions":["plural of bou"],"pronunciation":"/boj/","gender":"m","forms":{"alternative":"бой"}},{"word":"Boia","pos":"name","definitions":["a village in Jupânești, Gorj County, Romania"],"gender":"f"},{"word":"boia","pos":"noun","definitions":["paint","paprika (powder used as a spice)"],"pronunciation":"/boˈja/","forms":{"plural":"boiele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ia","accusative-indefinite-nominative-singular":"boia","accusative-definite-nominative-singular":"boiaua","accusative-indefinite-nominative-plural":"boiele","accusative-definite-nominative-plural":"boielele","dative-genitive-indefinite-singular":"boiele","dative-definite-genitive-singular":"boielei","dative-genitive-indefinite-plural":"boiele","dative-definite-genitive-plural":"boielelor","singular-vocative":"boia","plural-vocative":"boielelor"}},{"word":"Boia Bârzii","pos":"name","definitions":["a village in Vețel, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Boia Bîrzii"}},{"word":"Boia Mare","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Boia"],"gender":"f"},{"word":"Boia Mică","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Boia"],"gender":"f"},{"word":"boiai","pos":"verb","definitions":["second-person singular imperfect indicative of boi"],"pronunciation":"[boˈjaj]"},{"word":"boială","pos":"noun","definitions":["painting (of an object)"],"forms":{"plural":"boieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boială","accusative-definite-nominative-singular":"boiala","accusative-indefinite-nominative-plural":"boieli","accusative-definite-nominative-plural":"boielile","dative-genitive-indefinite-singular":"boieli","dative-definite-genitive-singular":"boielii","dative-genitive-indefinite-plural":"boieli","dative-definite-genitive-plural":"boielilor","singular-vocative":"boială","plural-vocative":"boielilor"}},{"word":"boiamă","pos":"noun","definitions":["many oxen"],"forms":{"plural":"boiame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boiamă","accusative-definite-nominative-singular":"boiama","accusative-indefinite-nominative-plural":"boiame","accusative-definite-nominative-plural":"boiamele","dative-genitive-indefinite-singular":"boiame","dative-definite-genitive-singular":"boiamei","dative-genitive-indefinite-plural":"boiame","dative-definite-genitive-plural":"boiamelor","singular-vocative":"boiamă","plural-vocative":"boiamelor"}},{"word":"boiangerie","pos":"noun","definitions":["dyeing of houses"],"forms":{"plural":"boiangerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"boiangerie","accusative-definite-nominative-singular":"boiangeria","accusative-indefinite-nominative-plural":"boiangerii","accusative-definite-nominative-plural":"boiangeriile","dative-genitive-indefinite-singular":"boiangerii","dative-definite-genitive-singular":"boiangeriei","dative-genitive-indefinite-plural":"boiangerii","dative-definite-genitive-plural":"boiangeriilor","singular-vocative":"boiangerie","plural-vocative":"boiangeriilor"}},{"word":"boiangilâc","pos":"noun","definitions":["paint, dye"],"forms":{"plural":"boiangilâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boiangilâc","accusative-definite-nominative-singular":"boiangilâcul","accusative-indefinite-nominative-plural":"boiangilâcuri","accusative-definite-nominative-plural":"boiangilâcurile","dative-genitive-indefinite-singular":"boiangilâc","dative-definite-genitive-singular":"boiangilâcului","dative-genitive-indefinite-plural":"boiangilâcuri","dative-definite-genitive-plural":"boiangilâcurilor","singular-vocative":"boiangilâcule","plural-vocative":"boiangilâcurilor","alternative":"boiangilîc"}},{"word":"Boiangiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boiangiu"}},{"word":"boiangiu","pos":"noun","definitions":["dyer"],"forms":{"plural":"boiangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boiangiu","accusative-definite-nominative-singular":"boiangiul","accusative-indefinite-nominative-plural":"boiangii","accusative-definite-nominative-plural":"boiangiii","dative-genitive-indefinite-singular":"boiangiu","dative-definite-genitive-singular":"boiangiului","dative-genitive-indefinite-plural":"boiangii","dative-definite-genitive-plural":"boiangiilor","singular-vocative":"boiangiule","plural-vocative":"boiangiilor"}},{"word":"boianior","pos":"noun","definitions":["minnow (Phoxinus phoxinus)"],"forms":{"plural":"boianiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boianior","accusative-definite-nominative-singular":"boianiorul","accusative-indefinite-nominative-plural":"boianiori","accusative-definite-nominative-plural":"boianiorii","dative-genitive-indefinite-singular":"boianior","dative-definite-genitive-singular":"boianiorului","dative-genitive-indefinite-plural":"boianiori","dative-definite-genitive-plural":"boianiorilor","singular-vocative":"boianiorule","plural-vocative":"boianiorilor"}},{"word":"Boianu Mare","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Boianu Mare, Bihor County, Romania"],"gender":"m"},{"word":"boiarnic","pos":"noun","definitions":["boyar"],"forms":{"plural":"boiarnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boiarnic","accusative-definite-nominative-singular":"boiarnicul","accusative-indefinite-nominative-plural":"boiarnici","accusative-definite-nominative-plural":"boiarnicii","dative-genitive-indefinite-singular":"boiarnic","dative-definite-genitive-singular":"boiarnicului","dative-genitive-indefinite-plural":"boiarnici","dative-definite-genitive-plural":"boiarnicilor","singular-vocative":"boiarnicule","plural-vocative":"boiarnicilor"}},{"word":"Boicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boicescu"}},{"word":"Boiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Boiciuc"}},{"word":"boicot","pos":"noun","definitions":["boycott"],"pronunciation":"/bojˈkot/","forms":{"plural":"boicoturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boicot","accusative-definite-nominative-singular":"boicotul","accusative-indefinite-nominative-plural":"boicoturi","accusative-definite-nominative-plural":"boicoturile","dative-genitive-indefinite-singular":"boicot","dative-definite-genitive-singular":"boicotului","dative-genitive-indefinite-plural":"boicoturi","dative-definite-genitive-plural":"boicoturilor","singular-vocative":"boicotule","plural-vocative":"boicoturilor","alternative":"бойкот"}},{"word":"boicota","pos":"verb","definitions":["to boycott"],"forms":{"canonical":"a boicota 1st conjugation","present-singular-third-person":"boicotează","participle-past":"boicotat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a boicota","gerund":"boicotând","first-person-indicative-present-singular":"boicotez","indicative-present-second-person-singular":"boicotezi","indicative-present-singular-third-person":"boicotează","first-person-indicative-plural-present":"boicotăm","indicative-plural-present-second-person":"boicotați","indicative-plural-present-third-person":"boicotează","first-person-imperfect-indicative-singular":"boicotam","imperfect-indicative-second-person-singular":"boicotai","imperfect-indicative-singular-third-person":"boicota","first-person-imperfect-indicative-plural":"boicotam","imperfect-indicative-plural-second-person":"boicotați","imperfect-indicative-plural-third-person":"boicotau","first-person-indicative-perfect-singular":"boicotai","indicative-perfect-second-person-singular":"boicotași","indicative-perfect-singular-third-person":"boicotă","first-person-indicative-perfect-plural":"boicotarăm","indicative-perfect-plural-second-person":"boicotarăți","indicative-perfect-plural-third-person":"boicotară","first-person-indicative-pluperfect-singular":"boicotasem","indicative-pluperfect-second-person-singular":"boicotaseși","indicative-pluperfect-singular-third-person":"boicotase","first-person-indicative-pluperfect-plural":"boicotaserăm","indicative-pluperfect-plural-second-person":"boicotaserăți","indicative-pluperfect-plural-third-person":"boicotaseră","first-person-present-singular-subjunctive":"să boicotez","present-second-person-singular-subjunctive":"să boicotezi","present-singular-subjunctive-third-person":"să boicoteze","first-person-plural-present-subjunctive":"să boicotăm","plural-present-second-person-subjunctive":"să boicotați","plural-present-subjunctive-third-person":"să boicoteze","imperative-second-person-singular":"boicotează","imperative-plural-second-person":"boicotați","imperative-negative-second-person-singular":"nu boicota","imperative-negative-plural-second-person":"nu boicotați"}},{"word":"boicotare","pos":"noun","definitions":["boycotting"],"forms":{"plural":"boicotări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boicotare","accusative-definite-nominative-singular":"boicotarea","accusative-indefinite-nominative-plural":"boicotări","accusative-definite-nominative-plural":"boicotările","dative-genitive-indefinite-singular":"boicotări","dative-definite-genitive-singular":"boicotării","dative-genitive-indefinite-plural":"boicotări","dative-definite-genitive-plural":"boicotărilor","singular-vocative":"boicotare","plural-vocative":"boicotărilor"}},{"word":"boicotat","pos":"adj","definitions":["boycotted"],"forms":{"feminine-singular":"boicotată","masculine-plural":"boicotați","feminine-neuter-plural":"boicotate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boicotat","error-unrecognized-form-feminine-indefinite-singular":"boicotată","error-unrecognized-form-indefinite-masculine-plural":"boicotați","error-unrecognized-form-feminine-indefinite-neuter-plural":"boicotate","definite-error-unrecognized-form-masculine-neuter-singular":"boicotatul","definite-error-unrecognized-form-feminine-singular":"boicotata","definite-error-unrecognized-form-masculine-plural":"boicotații","definite-error-unrecognized-form-feminine-neuter-plural":"boicotatele"}},{"word":"boicotat","pos":"verb","definitions":["past participle of boicota"],"forms":{"participle-past":"of boicota"}},{"word":"boicuș","pos":"noun","definitions":["European penduline tit (Remiz pendulinus)"],"forms":{"plural":"boicuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boicuș","accusative-definite-nominative-singular":"boicușul","accusative-indefinite-nominative-plural":"boicuși","accusative-definite-nominative-plural":"boicușii","dative-genitive-indefinite-singular":"boicuș","dative-definite-genitive-singular":"boicușului","dative-genitive-indefinite-plural":"boicuși","dative-definite-genitive-plural":"boicușilor","singular-vocative":"boicușule","plural-vocative":"boicușilor"}},{"word":"boiele","pos":"noun","definitions":["plural of boia"]},{"word":"boiengioaie","pos":"noun","definitions":["dyer's woad (Isatis tinctoria, a plant whose leaves are used to make blue dye)"],"forms":{"plural":"boiengioaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"boiengioaie","accusative-definite-nominative-singular":"boiengioaiea","accusative-indefinite-nominative-plural":"boiengioaie","accusative-definite-nominative-plural":"boiengioaiele","dative-genitive-indefinite-singular":"boiengioaie","dative-definite-genitive-singular":"boiengioaiei","dative-genitive-indefinite-plural":"boiengioaie","dative-definite-genitive-plural":"boiengioaielor","singular-vocative":"boiengioaie","plural-vocative":"boiengioaielor"}},{"word":"boienuț","pos":"noun","definitions":["diminutive of boian"],"forms":{"plural":"boienuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boienuț","accusative-definite-nominative-singular":"boienuțul","accusative-indefinite-nominative-plural":"boienuți","accusative-definite-nominative-plural":"boienuții","dative-genitive-indefinite-singular":"boienuț","dative-definite-genitive-singular":"boienuțului","dative-genitive-indefinite-plural":"boienuți","dative-definite-genitive-plural":"boienuților","singular-vocative":"boienuțule","plural-vocative":"boienuților"}},{"word":"Boier","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boier"}},{"word":"boier","pos":"noun","definitions":["boyar (a form of nobility or aristocracy), landowner, magnate"],"forms":{"plural":"boieri","feminine":"equivalent boiereasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boier","accusative-definite-nominative-singular":"boierul","accusative-indefinite-nominative-plural":"boieri","accusative-definite-nominative-plural":"boierii","dative-genitive-indefinite-singular":"boier","dative-definite-genitive-singular":"boierului","dative-genitive-indefinite-plural":"boieri","dative-definite-genitive-plural":"boierilor","singular-vocative":"boierule","plural-vocative":"boierilor"}},{"word":"Boieraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boieraș"}},{"word":"boieraș","pos":"noun","definitions":["diminutive of boier"],"forms":{"plural":"boierași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boieraș","accusative-definite-nominative-singular":"boierașul","accusative-indefinite-nominative-plural":"boierași","accusative-definite-nominative-plural":"boierașii","dative-genitive-indefinite-singular":"boieraș","dative-definite-genitive-singular":"boierașului","dative-genitive-indefinite-plural":"boierași","dative-definite-genitive-plural":"boierașilor","singular-vocative":"boierașule","plural-vocative":"boierașilor"}},{"word":"boieratic","pos":"adj","definitions":["haughty"],"forms":{"feminine-singular":"boieratică","masculine-plural":"boieratici","feminine-neuter-plural":"boieratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boieratic","error-unrecognized-form-feminine-indefinite-singular":"boieratică","error-unrecognized-form-indefinite-masculine-plural":"boieratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"boieratice","definite-error-unrecognized-form-masculine-neuter-singular":"boieraticul","definite-error-unrecognized-form-feminine-singular":"boieratica","definite-error-unrecognized-form-masculine-plural":"boieraticii","definite-error-unrecognized-form-feminine-neuter-plural":"boieraticele"}},{"word":"boiereasă","pos":"noun","definitions":["female equivalent of boier"],"forms":{"plural":"boierese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boiereasă","accusative-definite-nominative-singular":"boiereasa","accusative-indefinite-nominative-plural":"boierese","accusative-definite-nominative-plural":"boieresele","dative-genitive-indefinite-singular":"boierese","dative-definite-genitive-singular":"boieresei","dative-genitive-indefinite-plural":"boierese","dative-definite-genitive-plural":"boiereselor","singular-vocative":"boiereasă","plural-vocative":"boiereselor"}},{"word":"Boiereni","pos":"name","definitions":["a village in Târgu Lăpuș, Maramureș County, Romania"],"gender":"m"},{"word":"boieresc","pos":"adj","definitions":["boyar-like"],"forms":{"feminine-singular":"boierească","plural":"boierești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boieresc","error-unrecognized-form-feminine-indefinite-singular":"boierească","error-unrecognized-form-indefinite-masculine-plural":"boierești","error-unrecognized-form-feminine-indefinite-neuter-plural":"boierești","definite-error-unrecognized-form-masculine-neuter-singular":"boierescul","definite-error-unrecognized-form-feminine-singular":"boiereasca","definite-error-unrecognized-form-masculine-plural":"boiereștii","definite-error-unrecognized-form-feminine-neuter-plural":"boiereștile"}},{"word":"boierește","pos":"adv","definitions":["like a boyar"]},{"word":"boieri","pos":"verb","definitions":["to make a boyar","to adopt a new, comfortable lifestyle or habits","to become, be made a boyar"],"pronunciation":"/bo.jeˈri/","forms":{"canonical":"a boieri 4th conjugation","present-singular-third-person":"boierește","participle-past":"boierit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boieri","gerund":"boierind","first-person-indicative-present-singular":"boieresc","indicative-present-second-person-singular":"boierești","indicative-present-singular-third-person":"boierește","first-person-indicative-plural-present":"boierim","indicative-plural-present-second-person":"boieriți","indicative-plural-present-third-person":"boieresc","first-person-imperfect-indicative-singular":"boieream","imperfect-indicative-second-person-singular":"boiereai","imperfect-indicative-singular-third-person":"boierea","first-person-imperfect-indicative-plural":"boieream","imperfect-indicative-plural-second-person":"boiereați","imperfect-indicative-plural-third-person":"boiereau","first-person-indicative-perfect-singular":"boierii","indicative-perfect-second-person-singular":"boieriși","indicative-perfect-singular-third-person":"boieri","first-person-indicative-perfect-plural":"boierirăm","indicative-perfect-plural-second-person":"boierirăți","indicative-perfect-plural-third-person":"boieriră","first-person-indicative-pluperfect-singular":"boierisem","indicative-pluperfect-second-person-singular":"boieriseși","indicative-pluperfect-singular-third-person":"boierise","first-person-indicative-pluperfect-plural":"boieriserăm","indicative-pluperfect-plural-second-person":"boieriserăți","indicative-pluperfect-plural-third-person":"boieriseră","first-person-present-singular-subjunctive":"să boieresc","present-second-person-singular-subjunctive":"să boierești","present-singular-subjunctive-third-person":"să boierească","first-person-plural-present-subjunctive":"să boierim","plural-present-second-person-subjunctive":"să boieriți","plural-present-subjunctive-third-person":"să boierească","imperative-second-person-singular":"boierește","imperative-plural-second-person":"boieriți","imperative-negative-second-person-singular":"nu boieri","imperative-negative-plural-second-person":"nu boieriți"}},{"word":"boieri","pos":"noun","definitions":["indefinite plural of boier"],"pronunciation":"/boˈjerʲ/"},{"word":"boierie","pos":"noun","definitions":["lordliness"],"forms":{"plural":"boierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"boierie","accusative-definite-nominative-singular":"boieria","accusative-indefinite-nominative-plural":"boierii","accusative-definite-nominative-plural":"boieriile","dative-genitive-indefinite-singular":"boierii","dative-definite-genitive-singular":"boieriei","dative-genitive-indefinite-plural":"boierii","dative-definite-genitive-plural":"boieriilor","singular-vocative":"boierie","plural-vocative":"boieriilor"}},{"word":"boierime","pos":"noun","definitions":["nobility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boierime","accusative-definite-nominative-singular":"boierimea","accusative-indefinite-nominative-plural":"boierimi","accusative-definite-nominative-plural":"boierimile","dative-genitive-indefinite-singular":"boierimi","dative-definite-genitive-singular":"boierimii","dative-genitive-indefinite-plural":"boierimi","dative-definite-genitive-plural":"boierimilor","singular-vocative":"boierime","plural-vocative":"boierimilor"}},{"word":"boierinaș","pos":"noun","definitions":["alternative form of boiernaș"],"forms":{"plural":"boierinași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boierinaș","accusative-definite-nominative-singular":"boierinașul","accusative-indefinite-nominative-plural":"boierinași","accusative-definite-nominative-plural":"boierinașii","dative-genitive-indefinite-singular":"boierinaș","dative-definite-genitive-singular":"boierinașului","dative-genitive-indefinite-plural":"boierinași","dative-definite-genitive-plural":"boierinașilor","singular-vocative":"boierinașule","plural-vocative":"boierinașilor"}},{"word":"boierire","pos":"noun","definitions":["becoming a boyar"],"forms":{"plural":"boieriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boierire","accusative-definite-nominative-singular":"boierirea","accusative-indefinite-nominative-plural":"boieriri","accusative-definite-nominative-plural":"boieririle","dative-genitive-indefinite-singular":"boieriri","dative-definite-genitive-singular":"boieririi","dative-genitive-indefinite-plural":"boieriri","dative-definite-genitive-plural":"boieririlor","singular-vocative":"boierire","plural-vocative":"boieririlor"}},{"word":"boierișag","pos":"noun","definitions":["a boyar's property"],"forms":{"plural":"boierișaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boierișag","accusative-definite-nominative-singular":"boierișagul","accusative-indefinite-nominative-plural":"boierișaguri","accusative-definite-nominative-plural":"boierișagurile","dative-genitive-indefinite-singular":"boierișag","dative-definite-genitive-singular":"boierișagului","dative-genitive-indefinite-plural":"boierișaguri","dative-definite-genitive-plural":"boierișagurilor","singular-vocative":"boierișagule","plural-vocative":"boierișagurilor"}},{"word":"boierism","pos":"noun","definitions":["lordliness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"boierism","accusative-definite-nominative":"boierismul","dative-genitive-indefinite":"boierism","dative-definite-genitive":"boierismului","vocative":"boierismule"}},{"word":"boierit","pos":"noun","definitions":["being given the title of boyar"],"forms":{"plural":"boierituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boierit","accusative-definite-nominative-singular":"boieritul","accusative-indefinite-nominative-plural":"boierituri","accusative-definite-nominative-plural":"boieriturile","dative-genitive-indefinite-singular":"boierit","dative-definite-genitive-singular":"boieritului","dative-genitive-indefinite-plural":"boierituri","dative-definite-genitive-plural":"boieriturilor","singular-vocative":"boieritule","plural-vocative":"boieriturilor"}},{"word":"boierit","pos":"verb","definitions":["past participle of boieri"],"forms":{"participle-past":"of boieri"}},{"word":"boieriță","pos":"noun","definitions":["female equivalent of boier","boyar's wife"],"forms":{"plural":"boierițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boieriță","accusative-definite-nominative-singular":"boierița","accusative-indefinite-nominative-plural":"boierițe","accusative-definite-nominative-plural":"boierițele","dative-genitive-indefinite-singular":"boierițe","dative-definite-genitive-singular":"boieriței","dative-genitive-indefinite-plural":"boierițe","dative-definite-genitive-plural":"boierițelor","singular-vocative":"boieriță","plural-vocative":"boierițelor"}},{"word":"Boieriu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boieriu"}},{"word":"boiernaș","pos":"noun","definitions":["low ranking boyar"],"forms":{"plural":"boiernași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boiernaș","accusative-definite-nominative-singular":"boiernașul","accusative-indefinite-nominative-plural":"boiernași","accusative-definite-nominative-plural":"boiernașii","dative-genitive-indefinite-singular":"boiernaș","dative-definite-genitive-singular":"boiernașului","dative-genitive-indefinite-plural":"boiernași","dative-definite-genitive-plural":"boiernașilor","singular-vocative":"boiernașule","plural-vocative":"boiernașilor"}},{"word":"boieroaică","pos":"noun","definitions":["female equivalent of boier"],"forms":{"plural":"boieroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boieroaică","accusative-definite-nominative-singular":"boieroaica","accusative-indefinite-nominative-plural":"boieroaice","accusative-definite-nominative-plural":"boieroaicele","dative-genitive-indefinite-singular":"boieroaice","dative-definite-genitive-singular":"boieroaicei","dative-genitive-indefinite-plural":"boieroaice","dative-definite-genitive-plural":"boieroaicelor","singular-vocative":"boieroaică","plural-vocative":"boieroaicelor"}},{"word":"boieroaie","pos":"noun","definitions":["female equivalent of boier"],"forms":{"plural":"boieroaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"boieroaie","accusative-definite-nominative-singular":"boieroaiea","accusative-indefinite-nominative-plural":"boieroaie","accusative-definite-nominative-plural":"boieroaiele","dative-genitive-indefinite-singular":"boieroaie","dative-definite-genitive-singular":"boieroaiei","dative-genitive-indefinite-plural":"boieroaie","dative-definite-genitive-plural":"boieroaielor","singular-vocative":"boieroaie","plural-vocative":"boieroaielor"}},{"word":"boieros","pos":"adj","definitions":["haughty"],"forms":{"feminine-singular":"boieroasă","masculine-plural":"boieroși","feminine-neuter-plural":"boieroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boieros","error-unrecognized-form-feminine-indefinite-singular":"boieroasă","error-unrecognized-form-indefinite-masculine-plural":"boieroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"boieroase","definite-error-unrecognized-form-masculine-neuter-singular":"boierosul","definite-error-unrecognized-form-feminine-singular":"boieroasa","definite-error-unrecognized-form-masculine-plural":"boieroșii","definite-error-unrecognized-form-feminine-neuter-plural":"boieroasele"}},{"word":"Boieru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boieru"}},{"word":"boieș","pos":"noun","definitions":["cowherd"],"forms":{"plural":"boieși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boieș","accusative-definite-nominative-singular":"boieșul","accusative-indefinite-nominative-plural":"boieși","accusative-definite-nominative-plural":"boieșii","dative-genitive-indefinite-singular":"boieș","dative-definite-genitive-singular":"boieșului","dative-genitive-indefinite-plural":"boieși","dative-definite-genitive-plural":"boieșilor","singular-vocative":"boieșule","plural-vocative":"boieșilor"}},{"word":"boiesc","pos":"adj","definitions":["oxlike"],"forms":{"feminine-singular":"boiască","plural":"boiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boiesc","error-unrecognized-form-feminine-indefinite-singular":"boiască","error-unrecognized-form-indefinite-masculine-plural":"boiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"boiești","definite-error-unrecognized-form-masculine-neuter-singular":"boiescul","definite-error-unrecognized-form-feminine-singular":"boiasca","definite-error-unrecognized-form-masculine-plural":"boieștii","definite-error-unrecognized-form-feminine-neuter-plural":"boieștile"}},{"word":"boiler","pos":"noun","definitions":["water heater"],"forms":{"plural":"boilere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boiler","accusative-definite-nominative-singular":"boilerul","accusative-indefinite-nominative-plural":"boilere","accusative-definite-nominative-plural":"boilerele","dative-genitive-indefinite-singular":"boiler","dative-definite-genitive-singular":"boilerului","dative-genitive-indefinite-plural":"boilere","dative-definite-genitive-plural":"boilerelor","singular-vocative":"boilerule","plural-vocative":"boilerelor"}},{"word":"boim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of boi"],"pronunciation":"[boˈim]"},{"word":"Boinești","pos":"name","definitions":["a village in Bixad, Satu Mare County, Romania"],"gender":"m"},{"word":"Boingeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boingeanu"}},{"word":"boinic","pos":"adj","definitions":["fighting"],"forms":{"feminine-singular":"boinică","masculine-plural":"boinici","feminine-neuter-plural":"boinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boinic","error-unrecognized-form-feminine-indefinite-singular":"boinică","error-unrecognized-form-indefinite-masculine-plural":"boinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"boinice","definite-error-unrecognized-form-masculine-neuter-singular":"boinicul","definite-error-unrecognized-form-feminine-singular":"boinica","definite-error-unrecognized-form-masculine-plural":"boinicii","definite-error-unrecognized-form-feminine-neuter-plural":"boinicele"}},{"word":"boinic","pos":"noun","definitions":["fighter"],"forms":{"plural":"boinici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boinic","accusative-definite-nominative-singular":"boinicul","accusative-indefinite-nominative-plural":"boinici","accusative-definite-nominative-plural":"boinicii","dative-genitive-indefinite-singular":"boinic","dative-definite-genitive-singular":"boinicului","dative-genitive-indefinite-plural":"boinici","dative-definite-genitive-plural":"boinicilor","singular-vocative":"boinicule","plural-vocative":"boinicilor"}},{"word":"Boinița","pos":"name","definitions":["a village in Dalboșeț, Caraș-Severin County, Romania"],"gender":"f"},{"word":"boiniță","pos":"noun","definitions":["battleground"],"forms":{"plural":"boinițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boiniță","accusative-definite-nominative-singular":"boinița","accusative-indefinite-nominative-plural":"boinițe","accusative-definite-nominative-plural":"boinițele","dative-genitive-indefinite-singular":"boinițe","dative-definite-genitive-singular":"boiniței","dative-genitive-indefinite-plural":"boinițe","dative-definite-genitive-plural":"boinițelor","singular-vocative":"boiniță","plural-vocative":"boinițelor"}},{"word":"boire","pos":"noun","definitions":["painting, dyeing","putting on make-up"],"forms":{"plural":"boiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boire","accusative-definite-nominative-singular":"boirea","accusative-indefinite-nominative-plural":"boiri","accusative-definite-nominative-plural":"boirile","dative-genitive-indefinite-singular":"boiri","dative-definite-genitive-singular":"boirii","dative-genitive-indefinite-plural":"boiri","dative-definite-genitive-plural":"boirilor","singular-vocative":"boire","plural-vocative":"boirilor"}},{"word":"boișcă","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"boiște","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boișcă","accusative-definite-nominative-singular":"boișcăul","accusative-indefinite-nominative-plural":"boiște","accusative-definite-nominative-plural":"boiștei","dative-genitive-indefinite-singular":"boișcă","dative-definite-genitive-singular":"boișcăului","dative-genitive-indefinite-plural":"boiște","dative-definite-genitive-plural":"boiștelor","singular-vocative":"boișcăule","plural-vocative":"boiștelor"}},{"word":"boiscar","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"boiscari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boiscar","accusative-definite-nominative-singular":"boiscarul","accusative-indefinite-nominative-plural":"boiscari","accusative-definite-nominative-plural":"boiscarii","dative-genitive-indefinite-singular":"boiscar","dative-definite-genitive-singular":"boiscarului","dative-genitive-indefinite-plural":"boiscari","dative-definite-genitive-plural":"boiscarilor","singular-vocative":"boiscarule","plural-vocative":"boiscarilor"}},{"word":"boise","pos":"verb","definitions":["third-person singular pluperfect indicative of boi"],"pronunciation":"[boˈise]"},{"word":"Boișoara","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Boișoara, Vâlcea County, Romania"],"gender":"f"},{"word":"Boișorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boișorean"}},{"word":"Boișoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boișoreanu"}},{"word":"Boiștea","pos":"name","definitions":["a village in Căiuți, Bacău County, Romania","a village in Petricani, Neamț County, Romania"],"gender":"f"},{"word":"Boiștea de Jos","pos":"name","definitions":["a village in Coțofănești, Bacău County, Romania"],"gender":"f"},{"word":"boiștean","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"boișteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boiștean","accusative-definite-nominative-singular":"boișteanul","accusative-indefinite-nominative-plural":"boișteni","accusative-definite-nominative-plural":"boiștenii","dative-genitive-indefinite-singular":"boiștean","dative-definite-genitive-singular":"boișteanului","dative-genitive-indefinite-plural":"boișteni","dative-definite-genitive-plural":"boiștenilor","singular-vocative":"boișteanule","plural-vocative":"boiștenilor"}},{"word":"Boișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boișteanu"}},{"word":"boit","pos":"adj","definitions":["painted"],"pronunciation":"[boˈit]","forms":{"feminine-singular":"boită","masculine-plural":"boiți","feminine-neuter-plural":"boite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boit","error-unrecognized-form-feminine-indefinite-singular":"boită","error-unrecognized-form-indefinite-masculine-plural":"boiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boite","definite-error-unrecognized-form-masculine-neuter-singular":"boitul","definite-error-unrecognized-form-feminine-singular":"boita","definite-error-unrecognized-form-masculine-plural":"boiții","definite-error-unrecognized-form-feminine-neuter-plural":"boitele"}},{"word":"boit","pos":"verb","definitions":["past participle of boi"],"pronunciation":"[boˈit]","forms":{"participle-past":"of boi"}},{"word":"Boițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boițan"}},{"word":"boitar","pos":"noun","definitions":["swineherd's help"],"forms":{"plural":"boitari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boitar","accusative-definite-nominative-singular":"boitarul","accusative-indefinite-nominative-plural":"boitari","accusative-definite-nominative-plural":"boitarii","dative-genitive-indefinite-singular":"boitar","dative-definite-genitive-singular":"boitarului","dative-genitive-indefinite-plural":"boitari","dative-definite-genitive-plural":"boitarilor","singular-vocative":"boitarule","plural-vocative":"boitarilor"}},{"word":"Boițeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boițeanu"}},{"word":"Boitor","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Boitor"}},{"word":"Boiu","pos":"name","definitions":["a village in Albești, Mureș County, Romania"],"pronunciation":"/boˈju/","gender":"m"},{"word":"Boiu","pos":"name","definitions":["a village in Ciumeghiu, Bihor County, Romania","a village in Rapoltu Mare, Hunedoara County, Romania"],"pronunciation":"/boˈju/","gender":"m"},{"word":"Boiu de Jos","pos":"name","definitions":["a village in Gurasada, Hunedoara County, Romania"],"gender":"m"},{"word":"Boiu de Sus","pos":"name","definitions":["a village in Gurasada, Hunedoara County, Romania"],"gender":"m"},{"word":"Boiu Mare","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Boiu Mare, Maramureș County, Romania"],"gender":"m"},{"word":"boiuri","pos":"noun","definitions":["plural of boi"],"gender":"m-p"},{"word":"Boj-Cătun","pos":"name","definitions":["a village in Cojocna, Cluj County, Romania"],"gender":"m"},{"word":"bojdeucă","pos":"noun","definitions":["cottage, shack, shanty"],"forms":{"plural":"bojdeuce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bojdeucă","accusative-definite-nominative-singular":"bojdeuca","accusative-indefinite-nominative-plural":"bojdeuce","accusative-definite-nominative-plural":"bojdeucele","dative-genitive-indefinite-singular":"bojdeuce","dative-definite-genitive-singular":"bojdeucei","dative-genitive-indefinite-plural":"bojdeuce","dative-definite-genitive-plural":"bojdeucelor","singular-vocative":"bojdeucă","plural-vocative":"bojdeucelor"}},{"word":"Bojenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bojenescu"}},{"word":"Bojila","pos":"name","definitions":["a village in Mădârjac, Iași County, Romania"],"gender":"f"},{"word":"Bojinu","pos":"name","definitions":["a village in Crușet, Gorj County, Romania"],"gender":"m"},{"word":"Bojneag","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bojneag"}},{"word":"bojniță","pos":"noun","definitions":["temple or shrine"],"forms":{"plural":"bojnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bojniță","accusative-definite-nominative-singular":"bojnița","accusative-indefinite-nominative-plural":"bojnițe","accusative-definite-nominative-plural":"bojnițele","dative-genitive-indefinite-singular":"bojnițe","dative-definite-genitive-singular":"bojniței","dative-genitive-indefinite-plural":"bojnițe","dative-definite-genitive-plural":"bojnițelor","singular-vocative":"bojniță","plural-vocative":"bojnițelor"}},{"word":"bojoc","pos":"noun","definitions":["lung"],"forms":{"plural":"bojoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bojoc","accusative-definite-nominative-singular":"bojocul","accusative-indefinite-nominative-plural":"bojoci","accusative-definite-nominative-plural":"bojocii","dative-genitive-indefinite-singular":"bojoc","dative-definite-genitive-singular":"bojocului","dative-genitive-indefinite-plural":"bojoci","dative-definite-genitive-plural":"bojocilor","singular-vocative":"bojocule","plural-vocative":"bojocilor"}},{"word":"bojog","pos":"noun","definitions":["alternative form of bojoc"],"forms":{"plural":"bojogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bojog","accusative-definite-nominative-singular":"bojogul","accusative-indefinite-nominative-plural":"bojogi","accusative-definite-nominative-plural":"bojogii","dative-genitive-indefinite-singular":"bojog","dative-definite-genitive-singular":"bojogului","dative-genitive-indefinite-plural":"bojogi","dative-definite-genitive-plural":"bojogilor","singular-vocative":"bojogule","plural-vocative":"bojogilor"}},{"word":"bojogar","pos":"noun","definitions":["thief, rogue"],"forms":{"plural":"bojogari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bojogar","accusative-definite-nominative-singular":"bojogarul","accusative-indefinite-nominative-plural":"bojogari","accusative-definite-nominative-plural":"bojogarii","dative-genitive-indefinite-singular":"bojogar","dative-definite-genitive-singular":"bojogarului","dative-genitive-indefinite-plural":"bojogari","dative-definite-genitive-plural":"bojogarilor","singular-vocative":"bojogarule","plural-vocative":"bojogarilor"}},{"word":"bojogări","pos":"verb","definitions":["to steal"],"forms":{"canonical":"a bojogări 4th conjugation","present-singular-third-person":"bojogărie","participle-past":"bojogărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bojogări","gerund":"bojogărind","first-person-indicative-present-singular":"bojogăr","indicative-present-second-person-singular":"bojogări","indicative-present-singular-third-person":"bojogăre","first-person-indicative-plural-present":"bojogărim","indicative-plural-present-second-person":"bojogăriți","indicative-plural-present-third-person":"bojogăr","first-person-imperfect-indicative-singular":"bojogăream","imperfect-indicative-second-person-singular":"bojogăreai","imperfect-indicative-singular-third-person":"bojogărea","first-person-imperfect-indicative-plural":"bojogăream","imperfect-indicative-plural-second-person":"bojogăreați","imperfect-indicative-plural-third-person":"bojogăreau","first-person-indicative-perfect-singular":"bojogării","indicative-perfect-second-person-singular":"bojogăriși","indicative-perfect-singular-third-person":"bojogări","first-person-indicative-perfect-plural":"bojogărirăm","indicative-perfect-plural-second-person":"bojogărirăți","indicative-perfect-plural-third-person":"bojogăriră","first-person-indicative-pluperfect-singular":"bojogărisem","indicative-pluperfect-second-person-singular":"bojogăriseși","indicative-pluperfect-singular-third-person":"bojogărise","first-person-indicative-pluperfect-plural":"bojogăriserăm","indicative-pluperfect-plural-second-person":"bojogăriserăți","indicative-pluperfect-plural-third-person":"bojogăriseră","first-person-present-singular-subjunctive":"să bojogăr","present-second-person-singular-subjunctive":"să bojogări","present-singular-subjunctive-third-person":"să bojogără","first-person-plural-present-subjunctive":"să bojogărim","plural-present-second-person-subjunctive":"să bojogăriți","plural-present-subjunctive-third-person":"să bojogără","imperative-second-person-singular":"bojogăre","imperative-plural-second-person":"bojogăriți","imperative-negative-second-person-singular":"nu bojogări","imperative-negative-plural-second-person":"nu bojogăriți"}},{"word":"Bojoiu","pos":"name","definitions":["a village in Robănești, Dolj County, Romania"],"gender":"m"},{"word":"bol","pos":"noun","definitions":["bowl"],"forms":{"plural":"boluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bol","accusative-definite-nominative-singular":"bolul","accusative-indefinite-nominative-plural":"boluri","accusative-definite-nominative-plural":"bolurile","dative-genitive-indefinite-singular":"bol","dative-definite-genitive-singular":"bolului","dative-genitive-indefinite-plural":"boluri","dative-definite-genitive-plural":"bolurilor","singular-vocative":"bolule","plural-vocative":"bolurilor"}},{"word":"bolând","pos":"adj","definitions":["crazy","stupid"],"pronunciation":"/bo.ˈlɨnd/","forms":{"feminine-singular":"bolândă","masculine-plural":"bolânzi","feminine-neuter-plural":"bolânde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolând","error-unrecognized-form-feminine-indefinite-singular":"bolândă","error-unrecognized-form-indefinite-masculine-plural":"bolânzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolânde","definite-error-unrecognized-form-masculine-neuter-singular":"bolândul","definite-error-unrecognized-form-feminine-singular":"bolânda","definite-error-unrecognized-form-masculine-plural":"bolânzii","definite-error-unrecognized-form-feminine-neuter-plural":"bolândele","alternative":"bolînd"}},{"word":"bolândatic","pos":"adj","definitions":["a bit crazy"],"forms":{"feminine-singular":"bolândatică","masculine-plural":"bolândatici","feminine-neuter-plural":"bolândatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolândatic","error-unrecognized-form-feminine-indefinite-singular":"bolândatică","error-unrecognized-form-indefinite-masculine-plural":"bolândatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolândatice","definite-error-unrecognized-form-masculine-neuter-singular":"bolândaticul","definite-error-unrecognized-form-feminine-singular":"bolândatica","definite-error-unrecognized-form-masculine-plural":"bolândaticii","definite-error-unrecognized-form-feminine-neuter-plural":"bolândaticele"}},{"word":"bolânzie","pos":"noun","definitions":["insanity"],"forms":{"plural":"bolânzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bolânzie","accusative-definite-nominative-singular":"bolânzia","accusative-indefinite-nominative-plural":"bolânzii","accusative-definite-nominative-plural":"bolânziile","dative-genitive-indefinite-singular":"bolânzii","dative-definite-genitive-singular":"bolânziei","dative-genitive-indefinite-plural":"bolânzii","dative-definite-genitive-plural":"bolânziilor","singular-vocative":"bolânzie","plural-vocative":"bolânziilor","alternative":"bolînzie"}},{"word":"bolard","pos":"noun","definitions":["bollard"],"forms":{"plural":"bolarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolard","accusative-definite-nominative-singular":"bolardul","accusative-indefinite-nominative-plural":"bolardi","accusative-definite-nominative-plural":"bolardii","dative-genitive-indefinite-singular":"bolard","dative-definite-genitive-singular":"bolardului","dative-genitive-indefinite-plural":"bolardi","dative-definite-genitive-plural":"bolardilor","singular-vocative":"bolardule","plural-vocative":"bolardilor"}},{"word":"Bolătău","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Cracăul Alb","a village in Zemeș, Bacău County, Romania"],"gender":"m"},{"word":"Bolați","pos":"name","definitions":["a village in Rebricea, Vaslui County, Romania"],"gender":"m"},{"word":"bolboană","pos":"noun","definitions":["obsolete form of bulboană"],"forms":{"plural":"bolboane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolboană","accusative-definite-nominative-singular":"bolboana","accusative-indefinite-nominative-plural":"bolboane","accusative-definite-nominative-plural":"bolboanele","dative-genitive-indefinite-singular":"bolboane","dative-definite-genitive-singular":"bolboanei","dative-genitive-indefinite-plural":"bolboane","dative-definite-genitive-plural":"bolboanelor","singular-vocative":"bolboană","plural-vocative":"bolboanelor"}},{"word":"Bolboasa","pos":"name","definitions":["a village in Bolboși, Gorj County, Romania"],"gender":"f"},{"word":"Bolboceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bolboceanu"}},{"word":"Bolbocești","pos":"name","definitions":["a village in Albeni, Gorj County, Romania"],"gender":"m"},{"word":"bolbore","pos":"noun","definitions":["stuttering"],"forms":{"plural":"bolbori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolbore","accusative-definite-nominative-singular":"bolboreul","accusative-indefinite-nominative-plural":"bolbori","accusative-definite-nominative-plural":"bolborii","dative-genitive-indefinite-singular":"bolbore","dative-definite-genitive-singular":"bolboreului","dative-genitive-indefinite-plural":"bolbori","dative-definite-genitive-plural":"bolborilor","singular-vocative":"bolboreule","plural-vocative":"bolborilor"}},{"word":"Bolboros","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolboros"}},{"word":"bolboroseală","pos":"noun","definitions":["gobbledygook"],"forms":{"plural":"bolboroseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bolboroseală","accusative-definite-nominative-singular":"bolboroseala","accusative-indefinite-nominative-plural":"bolboroseli","accusative-definite-nominative-plural":"bolboroselile","dative-genitive-indefinite-singular":"bolboroseli","dative-definite-genitive-singular":"bolboroselii","dative-genitive-indefinite-plural":"bolboroseli","dative-definite-genitive-plural":"bolboroselilor","singular-vocative":"bolboroseală","plural-vocative":"bolboroselilor"}},{"word":"bolborosi","pos":"verb","definitions":["to bubble"],"forms":{"canonical":"a bolborosi 4th conjugation","present-singular-third-person":"bolborosește","participle-past":"bolborosit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bolborosi","gerund":"bolborosind","first-person-indicative-present-singular":"bolborosesc","indicative-present-second-person-singular":"bolborosești","indicative-present-singular-third-person":"bolborosește","first-person-indicative-plural-present":"bolborosim","indicative-plural-present-second-person":"bolborosiți","indicative-plural-present-third-person":"bolborosesc","first-person-imperfect-indicative-singular":"bolboroseam","imperfect-indicative-second-person-singular":"bolboroseai","imperfect-indicative-singular-third-person":"bolborosea","first-person-imperfect-indicative-plural":"bolboroseam","imperfect-indicative-plural-second-person":"bolboroseați","imperfect-indicative-plural-third-person":"bolboroseau","first-person-indicative-perfect-singular":"bolborosii","indicative-perfect-second-person-singular":"bolborosiși","indicative-perfect-singular-third-person":"bolborosi","first-person-indicative-perfect-plural":"bolborosirăm","indicative-perfect-plural-second-person":"bolborosirăți","indicative-perfect-plural-third-person":"bolborosiră","first-person-indicative-pluperfect-singular":"bolborosisem","indicative-pluperfect-second-person-singular":"bolborosiseși","indicative-pluperfect-singular-third-person":"bolborosise","first-person-indicative-pluperfect-plural":"bolborosiserăm","indicative-pluperfect-plural-second-person":"bolborosiserăți","indicative-pluperfect-plural-third-person":"bolborosiseră","first-person-present-singular-subjunctive":"să bolborosesc","present-second-person-singular-subjunctive":"să bolborosești","present-singular-subjunctive-third-person":"să bolborosească","first-person-plural-present-subjunctive":"să bolborosim","plural-present-second-person-subjunctive":"să bolborosiți","plural-present-subjunctive-third-person":"să bolborosească","imperative-second-person-singular":"bolborosește","imperative-plural-second-person":"bolborosiți","imperative-negative-second-person-singular":"nu bolborosi","imperative-negative-plural-second-person":"nu bolborosiți"}},{"word":"bolborosire","pos":"noun","definitions":["stammering"],"forms":{"plural":"bolborosiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bolborosire","accusative-definite-nominative-singular":"bolborosirea","accusative-indefinite-nominative-plural":"bolborosiri","accusative-definite-nominative-plural":"bolborosirile","dative-genitive-indefinite-singular":"bolborosiri","dative-definite-genitive-singular":"bolborosirii","dative-genitive-indefinite-plural":"bolborosiri","dative-definite-genitive-plural":"bolborosirilor","singular-vocative":"bolborosire","plural-vocative":"bolborosirilor"}},{"word":"bolborosit","pos":"noun","definitions":["muttered"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bolborosit","accusative-definite-nominative":"bolborositul","dative-genitive-indefinite":"bolborosit","dative-definite-genitive":"bolborositului","vocative":"bolborositule"}},{"word":"bolborosit","pos":"verb","definitions":["past participle of bolborosi"],"forms":{"participle-past":"of bolborosi"}},{"word":"bolborositură","pos":"noun","definitions":["stammering"],"forms":{"plural":"bolborosituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bolborositură","accusative-definite-nominative-singular":"bolborositura","accusative-indefinite-nominative-plural":"bolborosituri","accusative-definite-nominative-plural":"bolborositurile","dative-genitive-indefinite-singular":"bolborosituri","dative-definite-genitive-singular":"bolborositurii","dative-genitive-indefinite-plural":"bolborosituri","dative-definite-genitive-plural":"bolborositurilor","singular-vocative":"bolborositură","plural-vocative":"bolborositurilor"}},{"word":"Bolboșescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bolboșescu"}},{"word":"Bolboși","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Bolboși, Gorj County, Romania"],"gender":"m"},{"word":"bolboțel","pos":"adj","definitions":["fatty"],"forms":{"feminine-singular":"bolboțelă","masculine-plural":"bolboțeli","feminine-neuter-plural":"bolboțele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolboțel","error-unrecognized-form-feminine-indefinite-singular":"bolboțelă","error-unrecognized-form-indefinite-masculine-plural":"bolboțeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolboțele","definite-error-unrecognized-form-masculine-neuter-singular":"bolboțelul","definite-error-unrecognized-form-feminine-singular":"bolboțela","definite-error-unrecognized-form-masculine-plural":"bolboțelii","definite-error-unrecognized-form-feminine-neuter-plural":"bolboțelele"}},{"word":"bolbură","pos":"noun","definitions":["alternative form of volbură"],"forms":{"plural":"bolburi"}},{"word":"Bolculești","pos":"name","definitions":["a village in Valea Danului, Argeș County, Romania"],"gender":"m"},{"word":"bolcuță","pos":"noun","definitions":["diminutive of boalcă"],"forms":{"plural":"bolcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolcuță","accusative-definite-nominative-singular":"bolcuța","accusative-indefinite-nominative-plural":"bolcuțe","accusative-definite-nominative-plural":"bolcuțele","dative-genitive-indefinite-singular":"bolcuțe","dative-definite-genitive-singular":"bolcuței","dative-genitive-indefinite-plural":"bolcuțe","dative-definite-genitive-plural":"bolcuțelor","singular-vocative":"bolcuță","plural-vocative":"bolcuțelor"}},{"word":"Bold","pos":"name","definitions":["a village in Manoleasa, Botoșani County, Romania"],"gender":"m"},{"word":"bold","pos":"noun","definitions":["pin"],"forms":{"plural":"bolduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bold","accusative-definite-nominative-singular":"boldul","accusative-indefinite-nominative-plural":"bolduri","accusative-definite-nominative-plural":"boldurile","dative-genitive-indefinite-singular":"bold","dative-definite-genitive-singular":"boldului","dative-genitive-indefinite-plural":"bolduri","dative-definite-genitive-plural":"boldurilor","singular-vocative":"boldule","plural-vocative":"boldurilor"}},{"word":"Bolda","pos":"name","definitions":["a village in Beltiug, Satu Mare County, Romania"],"gender":"f"},{"word":"Boldan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boldan"}},{"word":"boldan","pos":"noun","definitions":["inaccessible mountain peak"],"forms":{"plural":"boldane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boldan","accusative-definite-nominative-singular":"boldanul","accusative-indefinite-nominative-plural":"boldane","accusative-definite-nominative-plural":"boldanele","dative-genitive-indefinite-singular":"boldan","dative-definite-genitive-singular":"boldanului","dative-genitive-indefinite-plural":"boldane","dative-definite-genitive-plural":"boldanelor","singular-vocative":"boldanule","plural-vocative":"boldanelor"}},{"word":"boldărie","pos":"noun","definitions":["pin"],"forms":{"plural":"boldării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"boldărie","accusative-definite-nominative-singular":"boldăria","accusative-indefinite-nominative-plural":"boldării","accusative-definite-nominative-plural":"boldăriile","dative-genitive-indefinite-singular":"boldării","dative-definite-genitive-singular":"boldăriei","dative-genitive-indefinite-plural":"boldării","dative-definite-genitive-plural":"boldăriilor","singular-vocative":"boldărie","plural-vocative":"boldăriilor"}},{"word":"boldeicuță","pos":"noun","definitions":["diminutive of boldeică"],"forms":{"plural":"boldeicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boldeicuță","accusative-definite-nominative-singular":"boldeicuța","accusative-indefinite-nominative-plural":"boldeicuțe","accusative-definite-nominative-plural":"boldeicuțele","dative-genitive-indefinite-singular":"boldeicuțe","dative-definite-genitive-singular":"boldeicuței","dative-genitive-indefinite-plural":"boldeicuțe","dative-definite-genitive-plural":"boldeicuțelor","singular-vocative":"boldeicuță","plural-vocative":"boldeicuțelor"}},{"word":"Boldescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boldescu"}},{"word":"Boldești","pos":"name","definitions":["a city in Prahova County, Romania"],"pronunciation":"/bolˈdeʃtʲ/","gender":"n"},{"word":"Boldești-Gradiștea","pos":"name","definitions":["a commune of Prahova County, Romania"],"gender":"f"},{"word":"Boldești-Grădiștea","pos":"name","definitions":["a commune of Prahova County, Romania"],"gender":"f"},{"word":"Boldești-Scăeni","pos":"name","definitions":["a city in Prahova County, Romania"],"gender":"m"},{"word":"boldi","pos":"verb","definitions":["to goad"],"forms":{"canonical":"a boldi 4th conjugation","present-singular-third-person":"boldește","participle-past":"boldit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boldi","gerund":"boldind","first-person-indicative-present-singular":"boldesc","indicative-present-second-person-singular":"boldești","indicative-present-singular-third-person":"boldește","first-person-indicative-plural-present":"boldim","indicative-plural-present-second-person":"boldiți","indicative-plural-present-third-person":"boldesc","first-person-imperfect-indicative-singular":"boldeam","imperfect-indicative-second-person-singular":"boldeai","imperfect-indicative-singular-third-person":"boldea","first-person-imperfect-indicative-plural":"boldeam","imperfect-indicative-plural-second-person":"boldeați","imperfect-indicative-plural-third-person":"boldeau","first-person-indicative-perfect-singular":"boldii","indicative-perfect-second-person-singular":"boldiși","indicative-perfect-singular-third-person":"boldi","first-person-indicative-perfect-plural":"boldirăm","indicative-perfect-plural-second-person":"boldirăți","indicative-perfect-plural-third-person":"boldiră","first-person-indicative-pluperfect-singular":"boldisem","indicative-pluperfect-second-person-singular":"boldiseși","indicative-pluperfect-singular-third-person":"boldise","first-person-indicative-pluperfect-plural":"boldiserăm","indicative-pluperfect-plural-second-person":"boldiserăți","indicative-pluperfect-plural-third-person":"boldiseră","first-person-present-singular-subjunctive":"să boldesc","present-second-person-singular-subjunctive":"să boldești","present-singular-subjunctive-third-person":"să boldească","first-person-plural-present-subjunctive":"să boldim","plural-present-second-person-subjunctive":"să boldiți","plural-present-subjunctive-third-person":"să boldească","imperative-second-person-singular":"boldește","imperative-plural-second-person":"boldiți","imperative-negative-second-person-singular":"nu boldi","imperative-negative-plural-second-person":"nu boldiți"}},{"word":"Boldijar","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Boldijar"}},{"word":"boldiș","pos":"adv","definitions":["askance"]},{"word":"Boldișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boldișor"}},{"word":"boldișor","pos":"noun","definitions":["diminutive of bold"],"forms":{"plural":"boldișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boldișor","accusative-definite-nominative-singular":"boldișorul","accusative-indefinite-nominative-plural":"boldișoare","accusative-definite-nominative-plural":"boldișoarele","dative-genitive-indefinite-singular":"boldișor","dative-definite-genitive-singular":"boldișorului","dative-genitive-indefinite-plural":"boldișoare","dative-definite-genitive-plural":"boldișoarelor","singular-vocative":"boldișorule","plural-vocative":"boldișoarelor"}},{"word":"Boldișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boldișteanu"}},{"word":"boldițel","pos":"adj","definitions":["diminutive of boldit"],"forms":{"feminine-singular":"boldițelă","masculine-plural":"boldițeli","feminine-neuter-plural":"boldițele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boldițel","error-unrecognized-form-feminine-indefinite-singular":"boldițelă","error-unrecognized-form-indefinite-masculine-plural":"boldițeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"boldițele","definite-error-unrecognized-form-masculine-neuter-singular":"boldițelul","definite-error-unrecognized-form-feminine-singular":"boldițela","definite-error-unrecognized-form-masculine-plural":"boldițelii","definite-error-unrecognized-form-feminine-neuter-plural":"boldițelele"}},{"word":"boldodină","pos":"noun","definitions":["pinhead"],"forms":{"plural":"boldodine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boldodină","accusative-definite-nominative-singular":"boldodina","accusative-indefinite-nominative-plural":"boldodine","accusative-definite-nominative-plural":"boldodinele","dative-genitive-indefinite-singular":"boldodine","dative-definite-genitive-singular":"boldodinei","dative-genitive-indefinite-plural":"boldodine","dative-definite-genitive-plural":"boldodinelor","singular-vocative":"boldodină","plural-vocative":"boldodinelor"}},{"word":"Boldu","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Boldu, Buzău County, Romania"],"gender":"m"},{"word":"boldul","pos":"noun","definitions":["definite nominative/accusative singular of bold"]},{"word":"Boldur","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Boldur, Timiș County, Romania"],"gender":"m"},{"word":"boldurel","pos":"noun","definitions":["diminutive of bold"],"forms":{"plural":"boldurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boldurel","accusative-definite-nominative-singular":"boldurelul","accusative-indefinite-nominative-plural":"boldurele","accusative-definite-nominative-plural":"boldurelele","dative-genitive-indefinite-singular":"boldurel","dative-definite-genitive-singular":"boldurelului","dative-genitive-indefinite-plural":"boldurele","dative-definite-genitive-plural":"boldurelelor","singular-vocative":"boldurelule","plural-vocative":"boldurelelor"}},{"word":"Boldurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boldurescu"}},{"word":"Boldurești","pos":"name","definitions":["a village in Boldurești, Nisporeni Raion, Moldova","a commune of Nisporeni Raion, Moldova"],"gender":"m"},{"word":"bolduri","pos":"noun","definitions":["plural of bold"]},{"word":"Bolduț","pos":"name","definitions":["a village in Ceanu Mare, Cluj County, Romania"],"gender":"m"},{"word":"bolduț","pos":"noun","definitions":["diminutive of bold"],"forms":{"plural":"bolduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolduț","accusative-definite-nominative-singular":"bolduțul","accusative-indefinite-nominative-plural":"bolduțe","accusative-definite-nominative-plural":"bolduțele","dative-genitive-indefinite-singular":"bolduț","dative-definite-genitive-singular":"bolduțului","dative-genitive-indefinite-plural":"bolduțe","dative-definite-genitive-plural":"bolduțelor","singular-vocative":"bolduțule","plural-vocative":"bolduțelor"}},{"word":"Boleac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boleac"}},{"word":"boleaznă","pos":"noun","definitions":["a contagious disease"],"forms":{"plural":"bolezne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boleaznă","accusative-definite-nominative-singular":"boleazna","accusative-indefinite-nominative-plural":"bolezne","accusative-definite-nominative-plural":"boleznele","dative-genitive-indefinite-singular":"bolezne","dative-definite-genitive-singular":"boleznei","dative-genitive-indefinite-plural":"bolezne","dative-definite-genitive-plural":"boleznelor","singular-vocative":"boleaznă","plural-vocative":"boleznelor"}},{"word":"bolero","pos":"noun","definitions":["bolero"],"forms":{"plural":"bolerouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bolero","accusative-definite-nominative-singular":"boleroul","accusative-indefinite-nominative-plural":"bolerouri","accusative-definite-nominative-plural":"bolerourile","dative-genitive-indefinite-singular":"bolero","dative-definite-genitive-singular":"boleroului","dative-genitive-indefinite-plural":"bolerouri","dative-definite-genitive-plural":"bolerourilor","singular-vocative":"boleroule","plural-vocative":"bolerourilor"}},{"word":"bolerou","pos":"noun","definitions":["alternative form of bolero"],"forms":{"plural":"bolerouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolerou","accusative-definite-nominative-singular":"boleroul","accusative-indefinite-nominative-plural":"bolerouri","accusative-definite-nominative-plural":"bolerourile","dative-genitive-indefinite-singular":"bolerou","dative-definite-genitive-singular":"boleroului","dative-genitive-indefinite-plural":"bolerouri","dative-definite-genitive-plural":"bolerourilor","singular-vocative":"boleroule","plural-vocative":"bolerourilor"}},{"word":"boleșniță","pos":"noun","definitions":["a contagious disease"],"forms":{"plural":"boleșnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boleșniță","accusative-definite-nominative-singular":"boleșnița","accusative-indefinite-nominative-plural":"boleșnițe","accusative-definite-nominative-plural":"boleșnițele","dative-genitive-indefinite-singular":"boleșnițe","dative-definite-genitive-singular":"boleșniței","dative-genitive-indefinite-plural":"boleșnițe","dative-definite-genitive-plural":"boleșnițelor","singular-vocative":"boleșniță","plural-vocative":"boleșnițelor"}},{"word":"bolfă","pos":"noun","definitions":["caruncle"],"forms":{"plural":"bolfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolfă","accusative-definite-nominative-singular":"bolfa","accusative-indefinite-nominative-plural":"bolfe","accusative-definite-nominative-plural":"bolfele","dative-genitive-indefinite-singular":"bolfe","dative-definite-genitive-singular":"bolfei","dative-genitive-indefinite-plural":"bolfe","dative-definite-genitive-plural":"bolfelor","singular-vocative":"bolfă","plural-vocative":"bolfelor"}},{"word":"bolfușoară","pos":"noun","definitions":["diminutive of bolfă"],"forms":{"plural":"bolfușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolfușoară","accusative-definite-nominative-singular":"bolfușoara","accusative-indefinite-nominative-plural":"bolfușoare","accusative-definite-nominative-plural":"bolfușoarele","dative-genitive-indefinite-singular":"bolfușoare","dative-definite-genitive-singular":"bolfușoarei","dative-genitive-indefinite-plural":"bolfușoare","dative-definite-genitive-plural":"bolfușoarelor","singular-vocative":"bolfușoară","plural-vocative":"bolfușoarelor"}},{"word":"boli","pos":"noun","definitions":["plural of boală"],"pronunciation":"[bolʲ]","gender":"f-p"},{"word":"boli","pos":"verb","definitions":["to ail"],"pronunciation":"[boˈli]","forms":{"canonical":"a boli 4th conjugation","present-singular-third-person":"bolește","participle-past":"bolit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boli","gerund":"bolind","first-person-indicative-present-singular":"bolesc","indicative-present-second-person-singular":"bolești","indicative-present-singular-third-person":"bolește","first-person-indicative-plural-present":"bolim","indicative-plural-present-second-person":"boliți","indicative-plural-present-third-person":"bolesc","first-person-imperfect-indicative-singular":"boleam","imperfect-indicative-second-person-singular":"boleai","imperfect-indicative-singular-third-person":"bolea","first-person-imperfect-indicative-plural":"boleam","imperfect-indicative-plural-second-person":"boleați","imperfect-indicative-plural-third-person":"boleau","first-person-indicative-perfect-singular":"bolii","indicative-perfect-second-person-singular":"boliși","indicative-perfect-singular-third-person":"boli","first-person-indicative-perfect-plural":"bolirăm","indicative-perfect-plural-second-person":"bolirăți","indicative-perfect-plural-third-person":"boliră","first-person-indicative-pluperfect-singular":"bolisem","indicative-pluperfect-second-person-singular":"boliseși","indicative-pluperfect-singular-third-person":"bolise","first-person-indicative-pluperfect-plural":"boliserăm","indicative-pluperfect-plural-second-person":"boliserăți","indicative-pluperfect-plural-third-person":"boliseră","first-person-present-singular-subjunctive":"să bolesc","present-second-person-singular-subjunctive":"să bolești","present-singular-subjunctive-third-person":"să bolească","first-person-plural-present-subjunctive":"să bolim","plural-present-second-person-subjunctive":"să boliți","plural-present-subjunctive-third-person":"să bolească","imperative-second-person-singular":"bolește","imperative-plural-second-person":"boliți","imperative-negative-second-person-singular":"nu boli","imperative-negative-plural-second-person":"nu boliți"}},{"word":"bolid","pos":"noun","definitions":["bolide","fast car"],"forms":{"plural":"bolizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolid","accusative-definite-nominative-singular":"bolidul","accusative-indefinite-nominative-plural":"bolizi","accusative-definite-nominative-plural":"bolizii","dative-genitive-indefinite-singular":"bolid","dative-definite-genitive-singular":"bolidului","dative-genitive-indefinite-plural":"bolizi","dative-definite-genitive-plural":"bolizilor","singular-vocative":"bolidule","plural-vocative":"bolizilor"}},{"word":"bolindeț","pos":"noun","definitions":["alternative form of colindeț"],"forms":{"plural":"bolindețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolindeț","accusative-definite-nominative-singular":"bolindețul","accusative-indefinite-nominative-plural":"bolindețe","accusative-definite-nominative-plural":"bolindețele","dative-genitive-indefinite-singular":"bolindeț","dative-definite-genitive-singular":"bolindețului","dative-genitive-indefinite-plural":"bolindețe","dative-definite-genitive-plural":"bolindețelor","singular-vocative":"bolindețule","plural-vocative":"bolindețelor"}},{"word":"Bolintin-Deal","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Bolintin-Deal, Giurgiu County, Romania"],"gender":"f"},{"word":"Bolintin-Vale","pos":"name","definitions":["a town in Giurgiu County, Romania"],"pronunciation":"/bolinˌtin ˈvale/","gender":"m"},{"word":"Bolintineanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolintineanu"}},{"word":"Bolintineni","pos":"name","definitions":["a village in Păsăreni, Mureș County, Romania"],"gender":"m"},{"word":"Bolintinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bolintinescu"}},{"word":"bolire","pos":"noun","definitions":["lying in bed due to an illness"],"forms":{"plural":"boliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bolire","accusative-definite-nominative-singular":"bolirea","accusative-indefinite-nominative-plural":"boliri","accusative-definite-nominative-plural":"bolirile","dative-genitive-indefinite-singular":"boliri","dative-definite-genitive-singular":"bolirii","dative-genitive-indefinite-plural":"boliri","dative-definite-genitive-plural":"bolirilor","singular-vocative":"bolire","plural-vocative":"bolirilor"}},{"word":"boliște","pos":"noun","definitions":["epidemic"],"forms":{"plural":"boliști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boliște","accusative-definite-nominative-singular":"boliștea","accusative-indefinite-nominative-plural":"boliști","accusative-definite-nominative-plural":"boliștile","dative-genitive-indefinite-singular":"boliști","dative-definite-genitive-singular":"boliștii","dative-genitive-indefinite-plural":"boliști","dative-definite-genitive-plural":"boliștilor","singular-vocative":"boliște","plural-vocative":"boliștilor"}},{"word":"bolivar","pos":"noun","definitions":["bolívar"],"forms":{"plural":"bolivari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolivar","accusative-definite-nominative-singular":"bolivarul","accusative-indefinite-nominative-plural":"bolivari","accusative-definite-nominative-plural":"bolivarii","dative-genitive-indefinite-singular":"bolivar","dative-definite-genitive-singular":"bolivarului","dative-genitive-indefinite-plural":"bolivari","dative-definite-genitive-plural":"bolivarilor","singular-vocative":"bolivarule","plural-vocative":"bolivarilor"}},{"word":"Bolivia","pos":"name","definitions":["Bolivia (a country in South America)"],"gender":"f"},{"word":"bolivian","pos":"noun","definitions":["Bolivian"],"pronunciation":"/bo.li.viˈan/","forms":{"plural":"bolivieni","feminine":"equivalent boliviană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolivian","accusative-definite-nominative-singular":"bolivianul","accusative-indefinite-nominative-plural":"bolivieni","accusative-definite-nominative-plural":"bolivienii","dative-genitive-indefinite-singular":"bolivian","dative-definite-genitive-singular":"bolivianului","dative-genitive-indefinite-plural":"bolivieni","dative-definite-genitive-plural":"bolivienilor","singular-vocative":"bolivianule","plural-vocative":"bolivienilor"}},{"word":"bolivian","pos":"adj","definitions":["Bolivian"],"pronunciation":"/bo.li.viˈan/","forms":{"feminine-singular":"boliviană","masculine-plural":"bolivieni","feminine-neuter-plural":"boliviene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolivian","error-unrecognized-form-feminine-indefinite-singular":"boliviană","error-unrecognized-form-indefinite-masculine-plural":"bolivieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"boliviene","definite-error-unrecognized-form-masculine-neuter-singular":"bolivianul","definite-error-unrecognized-form-feminine-singular":"boliviana","definite-error-unrecognized-form-masculine-plural":"bolivienii","definite-error-unrecognized-form-feminine-neuter-plural":"bolivienele"}},{"word":"boliviană","pos":"noun","definitions":["female equivalent of bolivian"],"forms":{"plural":"boliviene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boliviană","accusative-definite-nominative-singular":"boliviana","accusative-indefinite-nominative-plural":"boliviene","accusative-definite-nominative-plural":"bolivienele","dative-genitive-indefinite-singular":"boliviene","dative-definite-genitive-singular":"bolivienei","dative-genitive-indefinite-plural":"boliviene","dative-definite-genitive-plural":"bolivienelor","singular-vocative":"boliviană","plural-vocative":"bolivienelor"}},{"word":"bolivieni","pos":"noun","definitions":["plural of bolivian"]},{"word":"bolmoji","pos":"verb","definitions":["alternative form of bălmăji"],"forms":{"canonical":"a bolmoji 4th conjugation","present-singular-third-person":"bolmojește","participle-past":"bolmojit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bolmoji","gerund":"bolmojind","first-person-indicative-present-singular":"bolmojesc","indicative-present-second-person-singular":"bolmojești","indicative-present-singular-third-person":"bolmojește","first-person-indicative-plural-present":"bolmojim","indicative-plural-present-second-person":"bolmojiți","indicative-plural-present-third-person":"bolmojesc","first-person-imperfect-indicative-singular":"bolmojeam","imperfect-indicative-second-person-singular":"bolmojeai","imperfect-indicative-singular-third-person":"bolmojea","first-person-imperfect-indicative-plural":"bolmojeam","imperfect-indicative-plural-second-person":"bolmojeați","imperfect-indicative-plural-third-person":"bolmojeau","first-person-indicative-perfect-singular":"bolmojii","indicative-perfect-second-person-singular":"bolmojiși","indicative-perfect-singular-third-person":"bolmoji","first-person-indicative-perfect-plural":"bolmojirăm","indicative-perfect-plural-second-person":"bolmojirăți","indicative-perfect-plural-third-person":"bolmojiră","first-person-indicative-pluperfect-singular":"bolmojisem","indicative-pluperfect-second-person-singular":"bolmojiseși","indicative-pluperfect-singular-third-person":"bolmojise","first-person-indicative-pluperfect-plural":"bolmojiserăm","indicative-pluperfect-plural-second-person":"bolmojiserăți","indicative-pluperfect-plural-third-person":"bolmojiseră","first-person-present-singular-subjunctive":"să bolmojesc","present-second-person-singular-subjunctive":"să bolmojești","present-singular-subjunctive-third-person":"să bolmojească","first-person-plural-present-subjunctive":"să bolmojim","plural-present-second-person-subjunctive":"să bolmojiți","plural-present-subjunctive-third-person":"să bolmojească","imperative-second-person-singular":"bolmojește","imperative-plural-second-person":"bolmojiți","imperative-negative-second-person-singular":"nu bolmoji","imperative-negative-plural-second-person":"nu bolmojiți"}},{"word":"bolnav","pos":"adj","definitions":["sick, ill"],"pronunciation":"/bolˈnav/","forms":{"feminine-singular":"bolnavă","masculine-plural":"bolnavi","feminine-neuter-plural":"bolnave","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolnav","error-unrecognized-form-feminine-indefinite-singular":"bolnavă","error-unrecognized-form-indefinite-masculine-plural":"bolnavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolnave","definite-error-unrecognized-form-masculine-neuter-singular":"bolnavul","definite-error-unrecognized-form-feminine-singular":"bolnava","definite-error-unrecognized-form-masculine-plural":"bolnavii","definite-error-unrecognized-form-feminine-neuter-plural":"bolnavele"}},{"word":"bolnavă","pos":"noun","definitions":["female equivalent of bolnav"],"forms":{"plural":"bolnave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolnavă","accusative-definite-nominative-singular":"bolnava","accusative-indefinite-nominative-plural":"bolnave","accusative-definite-nominative-plural":"bolnavele","dative-genitive-indefinite-singular":"bolnave","dative-definite-genitive-singular":"bolnavei","dative-genitive-indefinite-plural":"bolnave","dative-definite-genitive-plural":"bolnavelor","singular-vocative":"bolnavă","plural-vocative":"bolnavelor"}},{"word":"bolnăvi","pos":"verb","definitions":["to become ill"],"forms":{"canonical":"a bolnăvi 4th conjugation","present-singular-third-person":"bolnăvește","participle-past":"bolnăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bolnăvi","gerund":"bolnăvind","first-person-indicative-present-singular":"bolnăvesc","indicative-present-second-person-singular":"bolnăvești","indicative-present-singular-third-person":"bolnăvește","first-person-indicative-plural-present":"bolnăvim","indicative-plural-present-second-person":"bolnăviți","indicative-plural-present-third-person":"bolnăvesc","first-person-imperfect-indicative-singular":"bolnăveam","imperfect-indicative-second-person-singular":"bolnăveai","imperfect-indicative-singular-third-person":"bolnăvea","first-person-imperfect-indicative-plural":"bolnăveam","imperfect-indicative-plural-second-person":"bolnăveați","imperfect-indicative-plural-third-person":"bolnăveau","first-person-indicative-perfect-singular":"bolnăvii","indicative-perfect-second-person-singular":"bolnăviși","indicative-perfect-singular-third-person":"bolnăvi","first-person-indicative-perfect-plural":"bolnăvirăm","indicative-perfect-plural-second-person":"bolnăvirăți","indicative-perfect-plural-third-person":"bolnăviră","first-person-indicative-pluperfect-singular":"bolnăvisem","indicative-pluperfect-second-person-singular":"bolnăviseși","indicative-pluperfect-singular-third-person":"bolnăvise","first-person-indicative-pluperfect-plural":"bolnăviserăm","indicative-pluperfect-plural-second-person":"bolnăviserăți","indicative-pluperfect-plural-third-person":"bolnăviseră","first-person-present-singular-subjunctive":"să bolnăvesc","present-second-person-singular-subjunctive":"să bolnăvești","present-singular-subjunctive-third-person":"să bolnăvească","first-person-plural-present-subjunctive":"să bolnăvim","plural-present-second-person-subjunctive":"să bolnăviți","plural-present-subjunctive-third-person":"să bolnăvească","imperative-second-person-singular":"bolnăvește","imperative-plural-second-person":"bolnăviți","imperative-negative-second-person-singular":"nu bolnăvi","imperative-negative-plural-second-person":"nu bolnăviți"}},{"word":"bolnăvicios","pos":"adj","definitions":["sickly, frail"],"pronunciation":"[bol.nə.viˈt͡ʃjos]","forms":{"feminine-singular":"bolnăvicioasă","masculine-plural":"bolnăvicioși","feminine-neuter-plural":"bolnăvicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolnăvicios","error-unrecognized-form-feminine-indefinite-singular":"bolnăvicioasă","error-unrecognized-form-indefinite-masculine-plural":"bolnăvicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolnăvicioase","definite-error-unrecognized-form-masculine-neuter-singular":"bolnăviciosul","definite-error-unrecognized-form-feminine-singular":"bolnăvicioasa","definite-error-unrecognized-form-masculine-plural":"bolnăvicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bolnăvicioasele"}},{"word":"bolnăvior","pos":"adj","definitions":["diminutive of bolnav"],"pronunciation":"/bol.nəˈvjor/","forms":{"feminine-singular":"bolnăvioară","masculine-plural":"bolnăviori","feminine-neuter-plural":"bolnăvioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolnăvior","error-unrecognized-form-feminine-indefinite-singular":"bolnăvioară","error-unrecognized-form-indefinite-masculine-plural":"bolnăviori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolnăvioare","definite-error-unrecognized-form-masculine-neuter-singular":"bolnăviorul","definite-error-unrecognized-form-feminine-singular":"bolnăvioara","definite-error-unrecognized-form-masculine-plural":"bolnăviorii","definite-error-unrecognized-form-feminine-neuter-plural":"bolnăvioarele"}},{"word":"Bolnavu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolnavu"}},{"word":"bolnicereasă","pos":"noun","definitions":["nurse"],"forms":{"plural":"bolnicerese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolnicereasă","accusative-definite-nominative-singular":"bolnicereasa","accusative-indefinite-nominative-plural":"bolnicerese","accusative-definite-nominative-plural":"bolniceresele","dative-genitive-indefinite-singular":"bolnicerese","dative-definite-genitive-singular":"bolniceresei","dative-genitive-indefinite-plural":"bolnicerese","dative-definite-genitive-plural":"bolnicereselor","singular-vocative":"bolnicereasă","plural-vocative":"bolnicereselor"}},{"word":"bolniță","pos":"noun","definitions":["hospital"],"forms":{"plural":"bolnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolniță","accusative-definite-nominative-singular":"bolnița","accusative-indefinite-nominative-plural":"bolnițe","accusative-definite-nominative-plural":"bolnițele","dative-genitive-indefinite-singular":"bolnițe","dative-definite-genitive-singular":"bolniței","dative-genitive-indefinite-plural":"bolnițe","dative-definite-genitive-plural":"bolnițelor","singular-vocative":"bolniță","plural-vocative":"bolnițelor"}},{"word":"boloboacă","pos":"noun","definitions":["alternative form of poloboc"],"forms":{"plural":"boloboace"}},{"word":"boloboc","pos":"noun","definitions":["alternative form of poloboc"],"forms":{"plural":"boloboace"}},{"word":"bolobocel","pos":"noun","definitions":["alternative form of polobocel"],"forms":{"plural":"bolobocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolobocel","accusative-definite-nominative-singular":"bolobocelul","accusative-indefinite-nominative-plural":"bolobocele","accusative-definite-nominative-plural":"bolobocelele","dative-genitive-indefinite-singular":"bolobocel","dative-definite-genitive-singular":"bolobocelului","dative-genitive-indefinite-plural":"bolobocele","dative-definite-genitive-plural":"bolobocelelor","singular-vocative":"bolobocelule","plural-vocative":"bolobocelelor"}},{"word":"Bolocan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolocan"}},{"word":"bolocănel","pos":"noun","definitions":["diminutive of bolocan"],"forms":{"plural":"bolocănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolocănel","accusative-definite-nominative-singular":"bolocănelul","accusative-indefinite-nominative-plural":"bolocănei","accusative-definite-nominative-plural":"bolocăneii","dative-genitive-indefinite-singular":"bolocănel","dative-definite-genitive-singular":"bolocănelului","dative-genitive-indefinite-plural":"bolocănei","dative-definite-genitive-plural":"bolocăneilor","singular-vocative":"bolocănelule","plural-vocative":"bolocăneilor"}},{"word":"Bologaia","pos":"name","definitions":["a village in Pogăceaua, Mureș County, Romania"],"gender":"f"},{"word":"Bologan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bologan"}},{"word":"Bologheanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bologheanu"}},{"word":"Bolohan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolohan"}},{"word":"bolohan","pos":"noun","definitions":["obsolete form of bolovan"],"forms":{"plural":"bolohani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolohan","accusative-definite-nominative-singular":"bolohanul","accusative-indefinite-nominative-plural":"bolohani","accusative-definite-nominative-plural":"bolohanii","dative-genitive-indefinite-singular":"bolohan","dative-definite-genitive-singular":"bolohanului","dative-genitive-indefinite-plural":"bolohani","dative-definite-genitive-plural":"bolohanilor","singular-vocative":"bolohanule","plural-vocative":"bolohanilor"}},{"word":"bolohoniță","pos":"noun","definitions":["mute woman"],"forms":{"plural":"bolohonițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolohoniță","accusative-definite-nominative-singular":"bolohonița","accusative-indefinite-nominative-plural":"bolohonițe","accusative-definite-nominative-plural":"bolohonițele","dative-genitive-indefinite-singular":"bolohonițe","dative-definite-genitive-singular":"bolohoniței","dative-genitive-indefinite-plural":"bolohonițe","dative-definite-genitive-plural":"bolohonițelor","singular-vocative":"bolohoniță","plural-vocative":"bolohonițelor"}},{"word":"bolometric","pos":"adj","definitions":["bolometric"],"forms":{"feminine-singular":"bolometrică","masculine-plural":"bolometrici","feminine-neuter-plural":"bolometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolometric","error-unrecognized-form-feminine-indefinite-singular":"bolometrică","error-unrecognized-form-indefinite-masculine-plural":"bolometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolometrice","definite-error-unrecognized-form-masculine-neuter-singular":"bolometricul","definite-error-unrecognized-form-feminine-singular":"bolometrica","definite-error-unrecognized-form-masculine-plural":"bolometricii","definite-error-unrecognized-form-feminine-neuter-plural":"bolometricele"}},{"word":"bolometru","pos":"noun","definitions":["bolometer"],"forms":{"plural":"bolometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolometru","accusative-definite-nominative-singular":"bolometrul","accusative-indefinite-nominative-plural":"bolometre","accusative-definite-nominative-plural":"bolometrele","dative-genitive-indefinite-singular":"bolometru","dative-definite-genitive-singular":"bolometrului","dative-genitive-indefinite-plural":"bolometre","dative-definite-genitive-plural":"bolometrelor","singular-vocative":"bolometrule","plural-vocative":"bolometrelor"}},{"word":"bolonciag","pos":"noun","definitions":["insanity"],"forms":{"plural":"bolonciaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bolonciag","accusative-definite-nominative-singular":"bolonciagul","accusative-indefinite-nominative-plural":"bolonciaguri","accusative-definite-nominative-plural":"bolonciagurile","dative-genitive-indefinite-singular":"bolonciag","dative-definite-genitive-singular":"bolonciagului","dative-genitive-indefinite-plural":"bolonciaguri","dative-definite-genitive-plural":"bolonciagurilor","singular-vocative":"bolonciagule","plural-vocative":"bolonciagurilor"}},{"word":"Bolotești","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Bolotești, Vrancea County, Romania"],"gender":"m"},{"word":"Bolovan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolovan"}},{"word":"bolovan","pos":"noun","definitions":["boulder, large stone or rock, mass of stone"],"forms":{"plural":"bolovani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolovan","accusative-definite-nominative-singular":"bolovanul","accusative-indefinite-nominative-plural":"bolovani","accusative-definite-nominative-plural":"bolovanii","dative-genitive-indefinite-singular":"bolovan","dative-definite-genitive-singular":"bolovanului","dative-genitive-indefinite-plural":"bolovani","dative-definite-genitive-plural":"bolovanilor","singular-vocative":"bolovanule","plural-vocative":"bolovanilor","alternative":"bolohan"}},{"word":"bolovănel","pos":"noun","definitions":["diminutive of bolovan; small boulder"],"forms":{"plural":"bolovănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolovănel","accusative-definite-nominative-singular":"bolovănelul","accusative-indefinite-nominative-plural":"bolovăneli","accusative-definite-nominative-plural":"bolovănelii","dative-genitive-indefinite-singular":"bolovănel","dative-definite-genitive-singular":"bolovănelului","dative-genitive-indefinite-plural":"bolovăneli","dative-definite-genitive-plural":"bolovănelilor","singular-vocative":"bolovănelule","plural-vocative":"bolovănelilor"}},{"word":"Bolovănești","pos":"name","definitions":["a village in Ceru-Băcăinți, Alba County, Romania","a village in Mușătești, Argeș County, Romania"],"gender":"m"},{"word":"Bolovani","pos":"name","definitions":["a village in Cornățelu, Dâmbovița County, Romania"],"gender":"m"},{"word":"bolovani","pos":"noun","definitions":["plural of bolovan"]},{"word":"Bolovăniș","pos":"name","definitions":["a village in Ghimeș-Făget, Bacău County, Romania"],"gender":"m"},{"word":"bolovăniș","pos":"noun","definitions":["rocky area"],"forms":{"plural":"bolovănișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bolovăniș","accusative-definite-nominative-singular":"bolovănișul","accusative-indefinite-nominative-plural":"bolovănișuri","accusative-definite-nominative-plural":"bolovănișurile","dative-genitive-indefinite-singular":"bolovăniș","dative-definite-genitive-singular":"bolovănișului","dative-genitive-indefinite-plural":"bolovănișuri","dative-definite-genitive-plural":"bolovănișurilor","singular-vocative":"bolovănișule","plural-vocative":"bolovănișurilor"}},{"word":"bolovănos","pos":"adj","definitions":["rough"],"forms":{"feminine-singular":"bolovănoasă","masculine-plural":"bolovănoși","feminine-neuter-plural":"bolovănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolovănos","error-unrecognized-form-feminine-indefinite-singular":"bolovănoasă","error-unrecognized-form-indefinite-masculine-plural":"bolovănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolovănoase","definite-error-unrecognized-form-masculine-neuter-singular":"bolovănosul","definite-error-unrecognized-form-feminine-singular":"bolovănoasa","definite-error-unrecognized-form-masculine-plural":"bolovănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bolovănoasele"}},{"word":"Bolovanul","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Budac","a river in Suceava, Romania, tributary to the Râșcuța"],"gender":"m"},{"word":"Bolozan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolozan"}},{"word":"bolozan","pos":"noun","definitions":["a boat"],"forms":{"plural":"bolozane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bolozan","accusative-definite-nominative-singular":"bolozanul","accusative-indefinite-nominative-plural":"bolozane","accusative-definite-nominative-plural":"bolozanele","dative-genitive-indefinite-singular":"bolozan","dative-definite-genitive-singular":"bolozanului","dative-genitive-indefinite-plural":"bolozane","dative-definite-genitive-plural":"bolozanelor","singular-vocative":"bolozanule","plural-vocative":"bolozanelor"}},{"word":"bolșevic","pos":"noun","definitions":["Bolshevik"],"forms":{"plural":"bolșevici","feminine":"equivalent bolșevică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolșevic","accusative-definite-nominative-singular":"bolșevicul","accusative-indefinite-nominative-plural":"bolșevici","accusative-definite-nominative-plural":"bolșevicii","dative-genitive-indefinite-singular":"bolșevic","dative-definite-genitive-singular":"bolșevicului","dative-genitive-indefinite-plural":"bolșevici","dative-definite-genitive-plural":"bolșevicilor","singular-vocative":"bolșevicule","plural-vocative":"bolșevicilor"}},{"word":"bolșevică","pos":"noun","definitions":["female equivalent of bolșevic"],"forms":{"plural":"bolșevice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolșevică","accusative-definite-nominative-singular":"bolșevica","accusative-indefinite-nominative-plural":"bolșevice","accusative-definite-nominative-plural":"bolșevicele","dative-genitive-indefinite-singular":"bolșevice","dative-definite-genitive-singular":"bolșevicei","dative-genitive-indefinite-plural":"bolșevice","dative-definite-genitive-plural":"bolșevicelor","singular-vocative":"bolșevică","plural-vocative":"bolșevicelor"}},{"word":"bolșevism","pos":"noun","definitions":["Bolshevism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bolșevism","accusative-definite-nominative":"bolșevismul","dative-genitive-indefinite":"bolșevism","dative-definite-genitive":"bolșevismului","vocative":"bolșevismule"}},{"word":"bolșeviza","pos":"verb","definitions":["to bolshevize"],"forms":{"canonical":"a bolșeviza 1st conjugation","present-singular-third-person":"bolșevizează","participle-past":"bolșevizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bolșeviza","gerund":"bolșevizând","first-person-indicative-present-singular":"bolșevizez","indicative-present-second-person-singular":"bolșevizezi","indicative-present-singular-third-person":"bolșevizează","first-person-indicative-plural-present":"bolșevizăm","indicative-plural-present-second-person":"bolșevizați","indicative-plural-present-third-person":"bolșevizează","first-person-imperfect-indicative-singular":"bolșevizam","imperfect-indicative-second-person-singular":"bolșevizai","imperfect-indicative-singular-third-person":"bolșeviza","first-person-imperfect-indicative-plural":"bolșevizam","imperfect-indicative-plural-second-person":"bolșevizați","imperfect-indicative-plural-third-person":"bolșevizau","first-person-indicative-perfect-singular":"bolșevizai","indicative-perfect-second-person-singular":"bolșevizași","indicative-perfect-singular-third-person":"bolșeviză","first-person-indicative-perfect-plural":"bolșevizarăm","indicative-perfect-plural-second-person":"bolșevizarăți","indicative-perfect-plural-third-person":"bolșevizară","first-person-indicative-pluperfect-singular":"bolșevizasem","indicative-pluperfect-second-person-singular":"bolșevizaseși","indicative-pluperfect-singular-third-person":"bolșevizase","first-person-indicative-pluperfect-plural":"bolșevizaserăm","indicative-pluperfect-plural-second-person":"bolșevizaserăți","indicative-pluperfect-plural-third-person":"bolșevizaseră","first-person-present-singular-subjunctive":"să bolșevizez","present-second-person-singular-subjunctive":"să bolșevizezi","present-singular-subjunctive-third-person":"să bolșevizeze","first-person-plural-present-subjunctive":"să bolșevizăm","plural-present-second-person-subjunctive":"să bolșevizați","plural-present-subjunctive-third-person":"să bolșevizeze","imperative-second-person-singular":"bolșevizează","imperative-plural-second-person":"bolșevizați","imperative-negative-second-person-singular":"nu bolșeviza","imperative-negative-plural-second-person":"nu bolșevizați"}},{"word":"bolșevizare","pos":"noun","definitions":["Bolshevization"],"forms":{"plural":"bolșevizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bolșevizare","accusative-definite-nominative-singular":"bolșevizarea","accusative-indefinite-nominative-plural":"bolșevizări","accusative-definite-nominative-plural":"bolșevizările","dative-genitive-indefinite-singular":"bolșevizări","dative-definite-genitive-singular":"bolșevizării","dative-genitive-indefinite-plural":"bolșevizări","dative-definite-genitive-plural":"bolșevizărilor","singular-vocative":"bolșevizare","plural-vocative":"bolșevizărilor"}},{"word":"bolșevizat","pos":"adj","definitions":["bolshevized"],"forms":{"feminine-singular":"bolșevizată","masculine-plural":"bolșevizați","feminine-neuter-plural":"bolșevizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolșevizat","error-unrecognized-form-feminine-indefinite-singular":"bolșevizată","error-unrecognized-form-indefinite-masculine-plural":"bolșevizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolșevizate","definite-error-unrecognized-form-masculine-neuter-singular":"bolșevizatul","definite-error-unrecognized-form-feminine-singular":"bolșevizata","definite-error-unrecognized-form-masculine-plural":"bolșevizații","definite-error-unrecognized-form-feminine-neuter-plural":"bolșevizatele"}},{"word":"bolșevizat","pos":"verb","definitions":["past participle of bolșeviza"],"forms":{"participle-past":"of bolșeviza"}},{"word":"bolț","pos":"noun","definitions":["bolt"],"forms":{"plural":"bolțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bolț","accusative-definite-nominative-singular":"bolțul","accusative-indefinite-nominative-plural":"bolțuri","accusative-definite-nominative-plural":"bolțurile","dative-genitive-indefinite-singular":"bolț","dative-definite-genitive-singular":"bolțului","dative-genitive-indefinite-plural":"bolțuri","dative-definite-genitive-plural":"bolțurilor","singular-vocative":"bolțule","plural-vocative":"bolțurilor"}},{"word":"boltă","pos":"noun","definitions":["arch","vault","cupola, dome"],"forms":{"plural":"bolte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boltă","accusative-definite-nominative-singular":"bolta","accusative-indefinite-nominative-plural":"bolte","accusative-definite-nominative-plural":"boltele","dative-genitive-indefinite-singular":"bolte","dative-definite-genitive-singular":"boltei","dative-genitive-indefinite-plural":"bolte","dative-definite-genitive-plural":"boltelor","singular-vocative":"boltă","plural-vocative":"boltelor"}},{"word":"boltă cerească","pos":"noun","definitions":["welkin, firmament"]},{"word":"bolțar","pos":"noun","definitions":["cinder block"],"forms":{"plural":"bolțari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bolțar","accusative-definite-nominative-singular":"bolțarul","accusative-indefinite-nominative-plural":"bolțari","accusative-definite-nominative-plural":"bolțarii","dative-genitive-indefinite-singular":"bolțar","dative-definite-genitive-singular":"bolțarului","dative-genitive-indefinite-plural":"bolțari","dative-definite-genitive-plural":"bolțarilor","singular-vocative":"bolțarule","plural-vocative":"bolțarilor"}},{"word":"boltaș","pos":"noun","definitions":["shopkeeper"],"forms":{"plural":"boltași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boltaș","accusative-definite-nominative-singular":"boltașul","accusative-indefinite-nominative-plural":"boltași","accusative-definite-nominative-plural":"boltașii","dative-genitive-indefinite-singular":"boltaș","dative-definite-genitive-singular":"boltașului","dative-genitive-indefinite-plural":"boltași","dative-definite-genitive-plural":"boltașilor","singular-vocative":"boltașule","plural-vocative":"boltașilor"}},{"word":"Boltașu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boltașu"}},{"word":"bolte","pos":"noun","definitions":["plural of boltă"]},{"word":"bolteală","pos":"noun","definitions":["vault"],"forms":{"plural":"bolteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bolteală","accusative-definite-nominative-singular":"bolteala","accusative-indefinite-nominative-plural":"boltele","accusative-definite-nominative-plural":"boltelele","dative-genitive-indefinite-singular":"boltele","dative-definite-genitive-singular":"boltelei","dative-genitive-indefinite-plural":"boltele","dative-definite-genitive-plural":"boltelelor","singular-vocative":"bolteală","plural-vocative":"boltelelor"}},{"word":"bolti","pos":"verb","definitions":["to build an arch, a vault or a dome"],"forms":{"canonical":"a bolti 4th conjugation","present-singular-third-person":"boltește","participle-past":"boltit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bolti","gerund":"boltind","first-person-indicative-present-singular":"boltesc","indicative-present-second-person-singular":"boltești","indicative-present-singular-third-person":"boltește","first-person-indicative-plural-present":"boltim","indicative-plural-present-second-person":"boltiți","indicative-plural-present-third-person":"boltesc","first-person-imperfect-indicative-singular":"bolteam","imperfect-indicative-second-person-singular":"bolteai","imperfect-indicative-singular-third-person":"boltea","first-person-imperfect-indicative-plural":"bolteam","imperfect-indicative-plural-second-person":"bolteați","imperfect-indicative-plural-third-person":"bolteau","first-person-indicative-perfect-singular":"boltii","indicative-perfect-second-person-singular":"boltiși","indicative-perfect-singular-third-person":"bolti","first-person-indicative-perfect-plural":"boltirăm","indicative-perfect-plural-second-person":"boltirăți","indicative-perfect-plural-third-person":"boltiră","first-person-indicative-pluperfect-singular":"boltisem","indicative-pluperfect-second-person-singular":"boltiseși","indicative-pluperfect-singular-third-person":"boltise","first-person-indicative-pluperfect-plural":"boltiserăm","indicative-pluperfect-plural-second-person":"boltiserăți","indicative-pluperfect-plural-third-person":"boltiseră","first-person-present-singular-subjunctive":"să boltesc","present-second-person-singular-subjunctive":"să boltești","present-singular-subjunctive-third-person":"să boltească","first-person-plural-present-subjunctive":"să boltim","plural-present-second-person-subjunctive":"să boltiți","plural-present-subjunctive-third-person":"să boltească","imperative-second-person-singular":"boltește","imperative-plural-second-person":"boltiți","imperative-negative-second-person-singular":"nu bolti","imperative-negative-plural-second-person":"nu boltiți"}},{"word":"boltire","pos":"noun","definitions":["vaulting"],"forms":{"plural":"boltiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boltire","accusative-definite-nominative-singular":"boltirea","accusative-indefinite-nominative-plural":"boltiri","accusative-definite-nominative-plural":"boltirile","dative-genitive-indefinite-singular":"boltiri","dative-definite-genitive-singular":"boltirii","dative-genitive-indefinite-plural":"boltiri","dative-definite-genitive-plural":"boltirilor","singular-vocative":"boltire","plural-vocative":"boltirilor"}},{"word":"boltiș","pos":"noun","definitions":["vault, arch"],"forms":{"plural":"boltișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boltiș","accusative-definite-nominative-singular":"boltișul","accusative-indefinite-nominative-plural":"boltișuri","accusative-definite-nominative-plural":"boltișurile","dative-genitive-indefinite-singular":"boltiș","dative-definite-genitive-singular":"boltișului","dative-genitive-indefinite-plural":"boltișuri","dative-definite-genitive-plural":"boltișurilor","singular-vocative":"boltișule","plural-vocative":"boltișurilor"}},{"word":"boltișoară","pos":"noun","definitions":["diminutive of boltă"],"forms":{"plural":"boltișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boltișoară","accusative-definite-nominative-singular":"boltișoara","accusative-indefinite-nominative-plural":"boltișoare","accusative-definite-nominative-plural":"boltișoarele","dative-genitive-indefinite-singular":"boltișoare","dative-definite-genitive-singular":"boltișoarei","dative-genitive-indefinite-plural":"boltișoare","dative-definite-genitive-plural":"boltișoarelor","singular-vocative":"boltișoară","plural-vocative":"boltișoarelor"}},{"word":"boltit","pos":"adj","definitions":["vaulted"],"forms":{"feminine-singular":"boltită","masculine-plural":"boltiți","feminine-neuter-plural":"boltite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boltit","error-unrecognized-form-feminine-indefinite-singular":"boltită","error-unrecognized-form-indefinite-masculine-plural":"boltiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boltite","definite-error-unrecognized-form-masculine-neuter-singular":"boltitul","definite-error-unrecognized-form-feminine-singular":"boltita","definite-error-unrecognized-form-masculine-plural":"boltiții","definite-error-unrecognized-form-feminine-neuter-plural":"boltitele"}},{"word":"boltiță","pos":"noun","definitions":["diminutive of boltă; small vault"],"forms":{"plural":"boltițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boltiță","accusative-definite-nominative-singular":"boltița","accusative-indefinite-nominative-plural":"boltițe","accusative-definite-nominative-plural":"boltițele","dative-genitive-indefinite-singular":"boltițe","dative-definite-genitive-singular":"boltiței","dative-genitive-indefinite-plural":"boltițe","dative-definite-genitive-plural":"boltițelor","singular-vocative":"boltiță","plural-vocative":"boltițelor"}},{"word":"boltitură","pos":"noun","definitions":["vault"],"forms":{"plural":"boltituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boltitură","accusative-definite-nominative-singular":"boltitura","accusative-indefinite-nominative-plural":"boltituri","accusative-definite-nominative-plural":"boltiturile","dative-genitive-indefinite-singular":"boltituri","dative-definite-genitive-singular":"boltiturii","dative-genitive-indefinite-plural":"boltituri","dative-definite-genitive-plural":"boltiturilor","singular-vocative":"boltitură","plural-vocative":"boltiturilor"}},{"word":"Bolțun","pos":"name","definitions":["a village in Bolțun, Nisporeni Raion, Moldova","a commune of Nisporeni Raion, Moldova"],"gender":"m"},{"word":"bolund","pos":"adj","definitions":["alternative form of bolând"],"forms":{"feminine-singular":"bolundă","masculine-plural":"bolunzi","feminine-neuter-plural":"bolunde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bolund","error-unrecognized-form-feminine-indefinite-singular":"bolundă","error-unrecognized-form-indefinite-masculine-plural":"bolunzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bolunde","definite-error-unrecognized-form-masculine-neuter-singular":"bolundul","definite-error-unrecognized-form-feminine-singular":"bolunda","definite-error-unrecognized-form-masculine-plural":"bolunzii","definite-error-unrecognized-form-feminine-neuter-plural":"bolundele"}},{"word":"Bolundești","pos":"name","definitions":["a village in Bucium, Alba County, Romania. Renamed to Valea Poienii in 1964."],"gender":"m"},{"word":"Bolunduț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bolunduț"}},{"word":"Bolvășnicioara","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Vârciorova"],"gender":"f"},{"word":"Bolvașnița","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Bolvașnița, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Bolvașnița Mare","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bolvașnița"],"gender":"f"},{"word":"bomba","pos":"verb","definitions":["to bulge","to cause to bulge"],"pronunciation":"/bomˈba/","forms":{"canonical":"a bomba 1st conjugation","present-singular-third-person":"bombează","participle-past":"bombat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bomba","gerund":"bombând","first-person-indicative-present-singular":"bombez","indicative-present-second-person-singular":"bombezi","indicative-present-singular-third-person":"bombează","first-person-indicative-plural-present":"bombăm","indicative-plural-present-second-person":"bombați","indicative-plural-present-third-person":"bombează","first-person-imperfect-indicative-singular":"bombam","imperfect-indicative-second-person-singular":"bombai","imperfect-indicative-singular-third-person":"bomba","first-person-imperfect-indicative-plural":"bombam","imperfect-indicative-plural-second-person":"bombați","imperfect-indicative-plural-third-person":"bombau","first-person-indicative-perfect-singular":"bombai","indicative-perfect-second-person-singular":"bombași","indicative-perfect-singular-third-person":"bombă","first-person-indicative-perfect-plural":"bombarăm","indicative-perfect-plural-second-person":"bombarăți","indicative-perfect-plural-third-person":"bombară","first-person-indicative-pluperfect-singular":"bombasem","indicative-pluperfect-second-person-singular":"bombaseși","indicative-pluperfect-singular-third-person":"bombase","first-person-indicative-pluperfect-plural":"bombaserăm","indicative-pluperfect-plural-second-person":"bombaserăți","indicative-pluperfect-plural-third-person":"bombaseră","first-person-present-singular-subjunctive":"să bombez","present-second-person-singular-subjunctive":"să bombezi","present-singular-subjunctive-third-person":"să bombeze","first-person-plural-present-subjunctive":"să bombăm","plural-present-second-person-subjunctive":"să bombați","plural-present-subjunctive-third-person":"să bombeze","imperative-second-person-singular":"bombează","imperative-plural-second-person":"bombați","imperative-negative-second-person-singular":"nu bomba","imperative-negative-plural-second-person":"nu bombați"}},{"word":"bombă","pos":"noun","definitions":["bomb (explosive device)"],"pronunciation":"/ˈbom.bə/","forms":{"plural":"bombe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bombă","accusative-definite-nominative-singular":"bomba","accusative-indefinite-nominative-plural":"bombe","accusative-definite-nominative-plural":"bombele","dative-genitive-indefinite-singular":"bombe","dative-definite-genitive-singular":"bombei","dative-genitive-indefinite-plural":"bombe","dative-definite-genitive-plural":"bombelor","singular-vocative":"bombă","plural-vocative":"bombelor"}},{"word":"bombă atomică","pos":"noun","definitions":["atomic bomb"],"forms":{"plural":"bombe atomice"}},{"word":"bombă cu cuie","pos":"noun","definitions":["nail bomb"],"forms":{"plural":"bombe cu cuie"}},{"word":"bombă cu hidrogen","pos":"noun","definitions":["H-bomb"],"forms":{"plural":"bombe cu hidrogen"}},{"word":"bombă H","pos":"noun","definitions":["H-bomb","hydrogen bomb"],"forms":{"plural":"bombe H"}},{"word":"bombă meteorologică","pos":"noun","definitions":["meteorological bomb"],"forms":{"plural":"bombe meteorologice"}},{"word":"bombă nucleară","pos":"noun","definitions":["nuclear bomb"],"forms":{"plural":"bombe nucleare"}},{"word":"bombă vulcanică","pos":"noun","definitions":["volcanic bomb"],"forms":{"plural":"bombe vulcanice"}},{"word":"bombai","pos":"verb","definitions":["inflection of bomba:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[bomˈbaj]"},{"word":"bombăială","pos":"noun","definitions":["grumbling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bombăială","accusative-definite-nominative":"bombăiala","dative-genitive-indefinite":"bombăiale","dative-definite-genitive":"bombăialei","vocative":"bombăială"}},{"word":"bombăire","pos":"noun","definitions":["mumbling"],"forms":{"plural":"bombăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bombăire","accusative-definite-nominative-singular":"bombăirea","accusative-indefinite-nominative-plural":"bombăiri","accusative-definite-nominative-plural":"bombăirile","dative-genitive-indefinite-singular":"bombăiri","dative-definite-genitive-singular":"bombăirii","dative-genitive-indefinite-plural":"bombăiri","dative-definite-genitive-plural":"bombăirilor","singular-vocative":"bombăire","plural-vocative":"bombăirilor"}},{"word":"bombăitură","pos":"noun","definitions":["mumble"],"forms":{"plural":"bombăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bombăitură","accusative-definite-nominative-singular":"bombăitura","accusative-indefinite-nominative-plural":"bombăituri","accusative-definite-nominative-plural":"bombăiturile","dative-genitive-indefinite-singular":"bombăituri","dative-definite-genitive-singular":"bombăiturii","dative-genitive-indefinite-plural":"bombăituri","dative-definite-genitive-plural":"bombăiturilor","singular-vocative":"bombăitură","plural-vocative":"bombăiturilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"bombăneală","pos":"noun","definitions":["grumbling"],"forms":{"plural":"bombăneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bombăneală","accusative-definite-nominative-singular":"bombăneala","accusative-indefinite-nominative-plural":"bombăneli","accusative-definite-nominative-plural":"bombănelile","dative-genitive-indefinite-singular":"bombăneli","dative-definite-genitive-singular":"bombănelii","dative-genitive-indefinite-plural":"bombăneli","dative-definite-genitive-plural":"bombănelilor","singular-vocative":"bombăneală","plural-vocative":"bombănelilor"}},{"word":"bombăni","pos":"verb","definitions":["to mumble"],"forms":{"canonical":"a bombăni 4th conjugation","present-singular-third-person":"bombănește","participle-past":"bombănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bombăni","gerund":"bombănind","first-person-indicative-present-singular":"bombănesc","indicative-present-second-person-singular":"bombănești","indicative-present-singular-third-person":"bombănește","first-person-indicative-plural-present":"bombănim","indicative-plural-present-second-person":"bombăniți","indicative-plural-present-third-person":"bombănesc","first-person-imperfect-indicative-singular":"bombăneam","imperfect-indicative-second-person-singular":"bombăneai","imperfect-indicative-singular-third-person":"bombănea","first-person-imperfect-indicative-plural":"bombăneam","imperfect-indicative-plural-second-person":"bombăneați","imperfect-indicative-plural-third-person":"bombăneau","first-person-indicative-perfect-singular":"bombănii","indicative-perfect-second-person-singular":"bombăniși","indicative-perfect-singular-third-person":"bombăni","first-person-indicative-perfect-plural":"bombănirăm","indicative-perfect-plural-second-person":"bombănirăți","indicative-perfect-plural-third-person":"bombăniră","first-person-indicative-pluperfect-singular":"bombănisem","indicative-pluperfect-second-person-singular":"bombăniseși","indicative-pluperfect-singular-third-person":"bombănise","first-person-indicative-pluperfect-plural":"bombăniserăm","indicative-pluperfect-plural-second-person":"bombăniserăți","indicative-pluperfect-plural-third-person":"bombăniseră","first-person-present-singular-subjunctive":"să bombănesc","present-second-person-singular-subjunctive":"să bombănești","present-singular-subjunctive-third-person":"să bombănească","first-person-plural-present-subjunctive":"să bombănim","plural-present-second-person-subjunctive":"să bombăniți","plural-present-subjunctive-third-person":"să bombănească","imperative-second-person-singular":"bombănește","imperative-plural-second-person":"bombăniți","imperative-negative-second-person-singular":"nu bombăni","imperative-negative-plural-second-person":"nu bombăniți"}},{"word":"bombănire","pos":"noun","definitions":["mumbling"],"forms":{"plural":"bombăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bombănire","accusative-definite-nominative-singular":"bombănirea","accusative-indefinite-nominative-plural":"bombăniri","accusative-definite-nominative-plural":"bombănirile","dative-genitive-indefinite-singular":"bombăniri","dative-definite-genitive-singular":"bombănirii","dative-genitive-indefinite-plural":"bombăniri","dative-definite-genitive-plural":"bombănirilor","singular-vocative":"bombănire","plural-vocative":"bombănirilor"}},{"word":"bombănit","pos":"adj","definitions":["mumbling"],"forms":{"feminine-singular":"bombănită","masculine-plural":"bombăniți","feminine-neuter-plural":"bombănite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bombănit","error-unrecognized-form-feminine-indefinite-singular":"bombănită","error-unrecognized-form-indefinite-masculine-plural":"bombăniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bombănite","definite-error-unrecognized-form-masculine-neuter-singular":"bombănitul","definite-error-unrecognized-form-feminine-singular":"bombănita","definite-error-unrecognized-form-masculine-plural":"bombăniții","definite-error-unrecognized-form-feminine-neuter-plural":"bombănitele"}},{"word":"bombănit","pos":"verb","definitions":["past participle of bombăni"],"forms":{"participle-past":"of bombăni"}},{"word":"bombănitor","pos":"adj","definitions":["grumbling"],"forms":{"feminine-singular":"bombănitoare","masculine-plural":"bombănitori","feminine-neuter-plural":"bombănitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bombănitor","error-unrecognized-form-feminine-indefinite-singular":"bombănitoare","error-unrecognized-form-indefinite-masculine-plural":"bombănitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bombănitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bombănitorul","definite-error-unrecognized-form-feminine-singular":"bombănitoarea","definite-error-unrecognized-form-masculine-plural":"bombănitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bombănitoarele"}},{"word":"bombănitură","pos":"noun","definitions":["mumble"],"forms":{"plural":"bombănituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bombănitură","accusative-definite-nominative-singular":"bombănitura","accusative-indefinite-nominative-plural":"bombănituri","accusative-definite-nominative-plural":"bombăniturile","dative-genitive-indefinite-singular":"bombănituri","dative-definite-genitive-singular":"bombăniturii","dative-genitive-indefinite-plural":"bombănituri","dative-definite-genitive-plural":"bombăniturilor","singular-vocative":"bombănitură","plural-vocative":"bombăniturilor"}},{"word":"bombar","pos":"noun","definitions":["European hornet (Vespa crabro)"],"forms":{"plural":"bombari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bombar","accusative-definite-nominative-singular":"bombarul","accusative-indefinite-nominative-plural":"bombari","accusative-definite-nominative-plural":"bombarii","dative-genitive-indefinite-singular":"bombar","dative-definite-genitive-singular":"bombarului","dative-genitive-indefinite-plural":"bombari","dative-definite-genitive-plural":"bombarilor","singular-vocative":"bombarule","plural-vocative":"bombarilor"}},{"word":"bombarda","pos":"verb","definitions":["to bomb"],"forms":{"canonical":"a bombarda 1st conjugation","present-singular-third-person":"bombardează","participle-past":"bombardat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bombarda","gerund":"bombardând","first-person-indicative-present-singular":"bombardez","indicative-present-second-person-singular":"bombardezi","indicative-present-singular-third-person":"bombardează","first-person-indicative-plural-present":"bombardăm","indicative-plural-present-second-person":"bombardați","indicative-plural-present-third-person":"bombardează","first-person-imperfect-indicative-singular":"bombardam","imperfect-indicative-second-person-singular":"bombardai","imperfect-indicative-singular-third-person":"bombarda","first-person-imperfect-indicative-plural":"bombardam","imperfect-indicative-plural-second-person":"bombardați","imperfect-indicative-plural-third-person":"bombardau","first-person-indicative-perfect-singular":"bombardai","indicative-perfect-second-person-singular":"bombardași","indicative-perfect-singular-third-person":"bombardă","first-person-indicative-perfect-plural":"bombardarăm","indicative-perfect-plural-second-person":"bombardarăți","indicative-perfect-plural-third-person":"bombardară","first-person-indicative-pluperfect-singular":"bombardasem","indicative-pluperfect-second-person-singular":"bombardaseși","indicative-pluperfect-singular-third-person":"bombardase","first-person-indicative-pluperfect-plural":"bombardaserăm","indicative-pluperfect-plural-second-person":"bombardaserăți","indicative-pluperfect-plural-third-person":"bombardaseră","first-person-present-singular-subjunctive":"să bombardez","present-second-person-singular-subjunctive":"să bombardezi","present-singular-subjunctive-third-person":"să bombardeze","first-person-plural-present-subjunctive":"să bombardăm","plural-present-second-person-subjunctive":"să bombardați","plural-present-subjunctive-third-person":"să bombardeze","imperative-second-person-singular":"bombardează","imperative-plural-second-person":"bombardați","imperative-negative-second-person-singular":"nu bombarda","imperative-negative-plural-second-person":"nu bombardați"}},{"word":"bombardă","pos":"noun","definitions":["bombard"],"forms":{"plural":"bombarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bombardă","accusative-definite-nominative-singular":"bombarda","accusative-indefinite-nominative-plural":"bombarde","accusative-definite-nominative-plural":"bombardele","dative-genitive-indefinite-singular":"bombarde","dative-definite-genitive-singular":"bombardei","dative-genitive-indefinite-plural":"bombarde","dative-definite-genitive-plural":"bombardelor","singular-vocative":"bombardă","plural-vocative":"bombardelor"}},{"word":"bombardament","pos":"noun","definitions":["bombardment"],"pronunciation":"/bom.bar.daˈment/","forms":{"plural":"bombardamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bombardament","accusative-definite-nominative-singular":"bombardamentul","accusative-indefinite-nominative-plural":"bombardamente","accusative-definite-nominative-plural":"bombardamentele","dative-genitive-indefinite-singular":"bombardament","dative-definite-genitive-singular":"bombardamentului","dative-genitive-indefinite-plural":"bombardamente","dative-definite-genitive-plural":"bombardamentelor","singular-vocative":"bombardamentule","plural-vocative":"bombardamentelor"}},{"word":"bombardamente","pos":"noun","definitions":["plural of bombardament"]},{"word":"bombardare","pos":"noun","definitions":["bombing"],"forms":{"plural":"bombardări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bombardare","accusative-definite-nominative-singular":"bombardarea","accusative-indefinite-nominative-plural":"bombardări","accusative-definite-nominative-plural":"bombardările","dative-genitive-indefinite-singular":"bombardări","dative-definite-genitive-singular":"bombardării","dative-genitive-indefinite-plural":"bombardări","dative-definite-genitive-plural":"bombardărilor","singular-vocative":"bombardare","plural-vocative":"bombardărilor"}},{"word":"bombardier","pos":"noun","definitions":["bomber"],"pronunciation":"/bom.bar.diˈer/","forms":{"plural":"bombardiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bombardier","accusative-definite-nominative-singular":"bombardierul","accusative-indefinite-nominative-plural":"bombardiere","accusative-definite-nominative-plural":"bombardierele","dative-genitive-indefinite-singular":"bombardier","dative-definite-genitive-singular":"bombardierului","dative-genitive-indefinite-plural":"bombardiere","dative-definite-genitive-plural":"bombardierelor","singular-vocative":"bombardierule","plural-vocative":"bombardierelor","alternative":"бомбардиер"}},{"word":"bombardier","pos":"noun","definitions":["bomber pilot","cocalar, chav"],"pronunciation":"/bom.bar.diˈer/","examples":[{"ro":"Un nou termen peiorativ – bombardier – s-a impus în ultimii doi-trei ani în limbajul colocvial-argotic, înlocuind etichetări mai vechi parțial echivalente, dintre care cea mai apropiată pare a fi, în opinia multor vorbitori, cocalar.","en":"A new derogatory word – bombardier – was imposed during the past two-three years in the colloquial-slang language, replacing older, partially equivalent labels, out of which the closest seems to be, in the opinion of many speakers, cocalar."}],"forms":{"plural":"bombardieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bombardier","accusative-definite-nominative-singular":"bombardierul","accusative-indefinite-nominative-plural":"bombardieri","accusative-definite-nominative-plural":"bombardierii","dative-genitive-indefinite-singular":"bombardier","dative-definite-genitive-singular":"bombardierului","dative-genitive-indefinite-plural":"bombardieri","dative-definite-genitive-plural":"bombardierilor","singular-vocative":"bombardierule","plural-vocative":"bombardierilor","alternative":"бомбардиер"}},{"word":"bombardon","pos":"noun","definitions":["bombardon"],"pronunciation":"/bom.barˈdon/","forms":{"plural":"bombardoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bombardon","accusative-definite-nominative-singular":"bombardonul","accusative-indefinite-nominative-plural":"bombardoane","accusative-definite-nominative-plural":"bombardoanele","dative-genitive-indefinite-singular":"bombardon","dative-definite-genitive-singular":"bombardonului","dative-genitive-indefinite-plural":"bombardoane","dative-definite-genitive-plural":"bombardoanelor","singular-vocative":"bombardonule","plural-vocative":"bombardoanelor"}},{"word":"bombare","pos":"noun","definitions":["bulging"],"forms":{"plural":"bombări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bombare","accusative-definite-nominative-singular":"bombarea","accusative-indefinite-nominative-plural":"bombări","accusative-definite-nominative-plural":"bombările","dative-genitive-indefinite-singular":"bombări","dative-definite-genitive-singular":"bombării","dative-genitive-indefinite-plural":"bombări","dative-definite-genitive-plural":"bombărilor","singular-vocative":"bombare","plural-vocative":"bombărilor"}},{"word":"bombast","pos":"adj","definitions":["bombastic"],"forms":{"feminine-singular":"bombastă","masculine-plural":"bombaști","feminine-neuter-plural":"bombaste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bombast","error-unrecognized-form-feminine-indefinite-singular":"bombastă","error-unrecognized-form-indefinite-masculine-plural":"bombaști","error-unrecognized-form-feminine-indefinite-neuter-plural":"bombaste","definite-error-unrecognized-form-masculine-neuter-singular":"bombastul","definite-error-unrecognized-form-feminine-singular":"bombasta","definite-error-unrecognized-form-masculine-plural":"bombaștii","definite-error-unrecognized-form-feminine-neuter-plural":"bombastele"}},{"word":"bombastic","pos":"adj","definitions":["bombastic"],"forms":{"feminine-singular":"bombastică","masculine-plural":"bombastici","feminine-neuter-plural":"bombastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bombastic","error-unrecognized-form-feminine-indefinite-singular":"bombastică","error-unrecognized-form-indefinite-masculine-plural":"bombastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bombastice","definite-error-unrecognized-form-masculine-neuter-singular":"bombasticul","definite-error-unrecognized-form-feminine-singular":"bombastica","definite-error-unrecognized-form-masculine-plural":"bombasticii","definite-error-unrecognized-form-feminine-neuter-plural":"bombasticele"}},{"word":"bombasticism","pos":"noun","definitions":["magniloquence"],"forms":{"plural":"bombasticisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bombasticism","accusative-definite-nominative-singular":"bombasticismul","accusative-indefinite-nominative-plural":"bombasticisme","accusative-definite-nominative-plural":"bombasticismele","dative-genitive-indefinite-singular":"bombasticism","dative-definite-genitive-singular":"bombasticismului","dative-genitive-indefinite-plural":"bombasticisme","dative-definite-genitive-plural":"bombasticismelor","singular-vocative":"bombasticismule","plural-vocative":"bombasticismelor"}},{"word":"bombat","pos":"adj","definitions":["bulging"],"pronunciation":"[bomˈbat]","forms":{"feminine-singular":"bombată","masculine-plural":"bombați","feminine-neuter-plural":"bombate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bombat","error-unrecognized-form-feminine-indefinite-singular":"bombată","error-unrecognized-form-indefinite-masculine-plural":"bombați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bombate","definite-error-unrecognized-form-masculine-neuter-singular":"bombatul","definite-error-unrecognized-form-feminine-singular":"bombata","definite-error-unrecognized-form-masculine-plural":"bombații","definite-error-unrecognized-form-feminine-neuter-plural":"bombatele"}},{"word":"bombat","pos":"verb","definitions":["past participle of bomba"],"pronunciation":"[bomˈbat]"},{"word":"bombe","pos":"noun","definitions":["inflection of bombă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈbombe]","gender":"f"},{"word":"bombe cu cuie","pos":"noun","definitions":["plural of bombă cu cuie"]},{"word":"bombeu","pos":"noun","definitions":["the tip of a shoe"],"forms":{"plural":"bombeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bombeu","accusative-definite-nominative-singular":"bombeuul","accusative-indefinite-nominative-plural":"bombeuri","accusative-definite-nominative-plural":"bombeurile","dative-genitive-indefinite-singular":"bombeu","dative-definite-genitive-singular":"bombeuului","dative-genitive-indefinite-plural":"bombeuri","dative-definite-genitive-plural":"bombeurilor","singular-vocative":"bombeuule","plural-vocative":"bombeurilor"}},{"word":"bombez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of bomba"],"pronunciation":"[bomˈbez]"},{"word":"bombiță","pos":"noun","definitions":["diminutive of bombă; small bomb"],"forms":{"plural":"bombițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bombiță","accusative-definite-nominative-singular":"bombița","accusative-indefinite-nominative-plural":"bombițe","accusative-definite-nominative-plural":"bombițele","dative-genitive-indefinite-singular":"bombițe","dative-definite-genitive-singular":"bombiței","dative-genitive-indefinite-plural":"bombițe","dative-definite-genitive-plural":"bombițelor","singular-vocative":"bombiță","plural-vocative":"bombițelor"}},{"word":"bombo","pos":"noun","definitions":["vocative singular of bombă"],"pronunciation":"[ˈbombo]","gender":"f"},{"word":"bomboană","pos":"noun","definitions":["candy (including chocolate), bonbon"],"pronunciation":"/bomˈbo̯a.nə/","forms":{"plural":"bomboane","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bomboană","accusative-definite-nominative-singular":"bomboana","accusative-indefinite-nominative-plural":"bomboane","accusative-definite-nominative-plural":"bomboanele","dative-genitive-indefinite-singular":"bomboane","dative-definite-genitive-singular":"bomboanei","dative-genitive-indefinite-plural":"bomboane","dative-definite-genitive-plural":"bomboanelor","singular-vocative":"-","plural-vocative":"-","alternative":"bombónă","alternative-dated":"bombon"}},{"word":"bomboană de mentă","pos":"noun","definitions":["mint-flavored candy"],"forms":{"plural":"bomboane de mentă"}},{"word":"bomboane","pos":"noun","definitions":["plural of bomboană (“piece of candy”); candy (collective noun)"],"gender":"n-p"},{"word":"bomboanță","pos":"noun","definitions":["candy"],"forms":{"plural":"bomboanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bomboanță","accusative-definite-nominative-singular":"bomboanța","accusative-indefinite-nominative-plural":"bomboanțe","accusative-definite-nominative-plural":"bomboanțele","dative-genitive-indefinite-singular":"bomboanțe","dative-definite-genitive-singular":"bomboanței","dative-genitive-indefinite-plural":"bomboanțe","dative-definite-genitive-plural":"bomboanțelor","singular-vocative":"bomboanță","plural-vocative":"bomboanțelor"}},{"word":"bombónă","pos":"noun","definitions":["Obsolete spelling of bomboană which was deprecated in 1904."],"forms":{"plural":"bombóne"}},{"word":"bombonar","pos":"noun","definitions":["candymaker"],"forms":{"plural":"bombonari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bombonar","accusative-definite-nominative-singular":"bombonarul","accusative-indefinite-nominative-plural":"bombonari","accusative-definite-nominative-plural":"bombonarii","dative-genitive-indefinite-singular":"bombonar","dative-definite-genitive-singular":"bombonarului","dative-genitive-indefinite-plural":"bombonari","dative-definite-genitive-plural":"bombonarilor","singular-vocative":"bombonarule","plural-vocative":"bombonarilor"}},{"word":"bombóne","pos":"noun","definitions":["plural of bombónă"]},{"word":"bombonea","pos":"noun","definitions":["diminutive of bomboană"],"forms":{"plural":"bombonele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bombonea","accusative-definite-nominative-singular":"bomboneaua","accusative-indefinite-nominative-plural":"bombonele","accusative-definite-nominative-plural":"bombonelele","dative-genitive-indefinite-singular":"bombonele","dative-definite-genitive-singular":"bombonelei","dative-genitive-indefinite-plural":"bombonele","dative-definite-genitive-plural":"bombonelelor","singular-vocative":"bombonea","plural-vocative":"bombonelelor"}},{"word":"Bombonel","pos":"name","definitions":["a male given name of uncommon usage, most common as a nickname, stage name, pet name or fictional name","Nickname for Adrian Năstase (born 1950), 59th Prime Minister of Romania"],"pronunciation":"/bom.boˈnel/","gender":"m"},{"word":"bombonel","pos":"noun","definitions":["little piece of candy","male lover","nice and naive man"],"pronunciation":"/bom.boˈnel/","forms":{"plural":"bombonei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bombonel","accusative-definite-nominative-singular":"bombonelul","accusative-indefinite-nominative-plural":"bombonei","accusative-definite-nominative-plural":"bomboneii","dative-genitive-indefinite-singular":"bombonel","dative-definite-genitive-singular":"bombonelului","dative-genitive-indefinite-plural":"bombonei","dative-definite-genitive-plural":"bomboneilor","singular-vocative":"bombonelule","plural-vocative":"bomboneilor","alternative":"бомбонел"}},{"word":"bombonerie","pos":"noun","definitions":["candy shop"],"forms":{"plural":"bombonerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bombonerie","accusative-definite-nominative-singular":"bomboneria","accusative-indefinite-nominative-plural":"bombonerii","accusative-definite-nominative-plural":"bomboneriile","dative-genitive-indefinite-singular":"bombonerii","dative-definite-genitive-singular":"bomboneriei","dative-genitive-indefinite-plural":"bombonerii","dative-definite-genitive-plural":"bomboneriilor","singular-vocative":"bombonerie","plural-vocative":"bomboneriilor"}},{"word":"bombonică","pos":"noun","definitions":["diminutive of bomboană"],"forms":{"plural":"bombonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bombonică","accusative-definite-nominative-singular":"bombonica","accusative-indefinite-nominative-plural":"bombonici","accusative-definite-nominative-plural":"bombonicile","dative-genitive-indefinite-singular":"bombonici","dative-definite-genitive-singular":"bombonicii","dative-genitive-indefinite-plural":"bombonici","dative-definite-genitive-plural":"bombonicilor","singular-vocative":"bombonică","plural-vocative":"bombonicilor"}},{"word":"bombonieră","pos":"noun","definitions":["candy box"],"forms":{"plural":"bomboniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bombonieră","accusative-definite-nominative-singular":"bomboniera","accusative-indefinite-nominative-plural":"bomboniere","accusative-definite-nominative-plural":"bombonierele","dative-genitive-indefinite-singular":"bomboniere","dative-definite-genitive-singular":"bombonierei","dative-genitive-indefinite-plural":"bomboniere","dative-definite-genitive-plural":"bombonierelor","singular-vocative":"bombonieră","plural-vocative":"bombonierelor"}},{"word":"bomfaier","pos":"noun","definitions":["hacksaw"],"pronunciation":"/bomˈfa.jer/","forms":{"plural":"bomfaiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bomfaier","accusative-definite-nominative-singular":"bomfaierul","accusative-indefinite-nominative-plural":"bomfaiere","accusative-definite-nominative-plural":"bomfaierele","dative-genitive-indefinite-singular":"bomfaier","dative-definite-genitive-singular":"bomfaierului","dative-genitive-indefinite-plural":"bomfaiere","dative-definite-genitive-plural":"bomfaierelor","singular-vocative":"bomfaierule","plural-vocative":"bomfaierelor"}},{"word":"bomfaiere","pos":"noun","definitions":["plural of bomfaier"]},{"word":"bompres","pos":"noun","definitions":["bowsprit"],"forms":{"plural":"bomprese","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bompres","accusative-definite-nominative-singular":"bompresul","accusative-indefinite-nominative-plural":"bomprese","accusative-definite-nominative-plural":"bompresele","dative-genitive-indefinite-singular":"bompres","dative-definite-genitive-singular":"bompresului","dative-genitive-indefinite-plural":"bomprese","dative-definite-genitive-plural":"bompreselor","singular-vocative":"bompresule","plural-vocative":"bompreselor"}},{"word":"bon","pos":"noun","definitions":["voucher, ticket, coupon"],"forms":{"plural":"bonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bon","accusative-definite-nominative-singular":"bonul","accusative-indefinite-nominative-plural":"bonuri","accusative-definite-nominative-plural":"bonurile","dative-genitive-indefinite-singular":"bon","dative-definite-genitive-singular":"bonului","dative-genitive-indefinite-plural":"bonuri","dative-definite-genitive-plural":"bonurilor","singular-vocative":"bonule","plural-vocative":"bonurilor"}},{"word":"bon de tezaur","pos":"noun","definitions":["Treasury bill"],"forms":{"plural":"bonuri de tezaur"}},{"word":"bonă","pos":"noun","definitions":["nanny (nursemaid)"],"forms":{"plural":"bone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bonă","accusative-definite-nominative-singular":"bona","accusative-indefinite-nominative-plural":"bone","accusative-definite-nominative-plural":"bonele","dative-genitive-indefinite-singular":"bone","dative-definite-genitive-singular":"bonei","dative-genitive-indefinite-plural":"bone","dative-definite-genitive-plural":"bonelor","singular-vocative":"bonă","plural-vocative":"bonelor"}},{"word":"bonăi","pos":"verb","definitions":["to buzz, to mumble"],"forms":{"canonical":"a bonăi 4th conjugation","present-singular-third-person":"bonăește","participle-past":"bonăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bonăi","gerund":"bonăind","first-person-indicative-present-singular":"bonăiesc","indicative-present-second-person-singular":"bonăiești","indicative-present-singular-third-person":"bonăiește","first-person-indicative-plural-present":"bonăim","indicative-plural-present-second-person":"bonăiți","indicative-plural-present-third-person":"bonăiesc","first-person-imperfect-indicative-singular":"bonăiam","imperfect-indicative-second-person-singular":"bonăiai","imperfect-indicative-singular-third-person":"bonăia","first-person-imperfect-indicative-plural":"bonăiam","imperfect-indicative-plural-second-person":"bonăiați","imperfect-indicative-plural-third-person":"bonăiau","first-person-indicative-perfect-singular":"bonăii","indicative-perfect-second-person-singular":"bonăiși","indicative-perfect-singular-third-person":"bonăi","first-person-indicative-perfect-plural":"bonăirăm","indicative-perfect-plural-second-person":"bonăirăți","indicative-perfect-plural-third-person":"bonăiră","first-person-indicative-pluperfect-singular":"bonăisem","indicative-pluperfect-second-person-singular":"bonăiseși","indicative-pluperfect-singular-third-person":"bonăise","first-person-indicative-pluperfect-plural":"bonăiserăm","indicative-pluperfect-plural-second-person":"bonăiserăți","indicative-pluperfect-plural-third-person":"bonăiseră","first-person-present-singular-subjunctive":"să bonăiesc","present-second-person-singular-subjunctive":"să bonăiești","present-singular-subjunctive-third-person":"să bonăiască","first-person-plural-present-subjunctive":"să bonăim","plural-present-second-person-subjunctive":"să bonăiți","plural-present-subjunctive-third-person":"să bonăiască","imperative-second-person-singular":"bonăiește","imperative-plural-second-person":"bonăiți","imperative-negative-second-person-singular":"nu bonăi","imperative-negative-plural-second-person":"nu bonăiți"}},{"word":"bonăit","pos":"noun","definitions":["buzz"],"forms":{"plural":"bonăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bonăit","accusative-definite-nominative-singular":"bonăitul","accusative-indefinite-nominative-plural":"bonăituri","accusative-definite-nominative-plural":"bonăiturile","dative-genitive-indefinite-singular":"bonăit","dative-definite-genitive-singular":"bonăitului","dative-genitive-indefinite-plural":"bonăituri","dative-definite-genitive-plural":"bonăiturilor","singular-vocative":"bonăitule","plural-vocative":"bonăiturilor"}},{"word":"bonăit","pos":"verb","definitions":["past participle of bonăi"],"forms":{"participle-past":"of bonăi"}},{"word":"bonapartism","pos":"noun","definitions":["bonapartism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bonapartism","accusative-definite-nominative-singular":"bonapartismul","accusative-indefinite-nominative-plural":"bonapartisme","accusative-definite-nominative-plural":"bonapartismele","dative-genitive-indefinite-singular":"bonapartism","dative-definite-genitive-singular":"bonapartismului","dative-genitive-indefinite-plural":"bonapartisme","dative-definite-genitive-plural":"bonapartismelor","singular-vocative":"bonapartismule","plural-vocative":"bonapartismelor"}},{"word":"bonapartist","pos":"noun","definitions":["Bonapartist"],"forms":{"plural":"bonapartiști","feminine":"equivalent bonapartistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bonapartist","accusative-definite-nominative-singular":"bonapartistul","accusative-indefinite-nominative-plural":"bonapartiști","accusative-definite-nominative-plural":"bonapartiștii","dative-genitive-indefinite-singular":"bonapartist","dative-definite-genitive-singular":"bonapartistului","dative-genitive-indefinite-plural":"bonapartiști","dative-definite-genitive-plural":"bonapartiștilor","singular-vocative":"bonapartistule","plural-vocative":"bonapartiștilor"}},{"word":"bonapartistă","pos":"noun","definitions":["female equivalent of bonapartist"],"forms":{"plural":"bonapartiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bonapartistă","accusative-definite-nominative-singular":"bonapartista","accusative-indefinite-nominative-plural":"bonapartiste","accusative-definite-nominative-plural":"bonapartistele","dative-genitive-indefinite-singular":"bonapartiste","dative-definite-genitive-singular":"bonapartistei","dative-genitive-indefinite-plural":"bonapartiste","dative-definite-genitive-plural":"bonapartistelor","singular-vocative":"bonapartistă","plural-vocative":"bonapartistelor"}},{"word":"bonbon","pos":"noun","definitions":["obsolete form of bomboană"],"forms":{"plural":"bonboane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bonbon","accusative-definite-nominative-singular":"bonbonul","accusative-indefinite-nominative-plural":"bonboane","accusative-definite-nominative-plural":"bonboanele","dative-genitive-indefinite-singular":"bonbon","dative-definite-genitive-singular":"bonbonului","dative-genitive-indefinite-plural":"bonboane","dative-definite-genitive-plural":"bonboanelor","singular-vocative":"bonbonule","plural-vocative":"bonboanelor"}},{"word":"boncănit","pos":"noun","definitions":["the cry of a deer during the mating season"],"forms":{"plural":"boncănituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boncănit","accusative-definite-nominative-singular":"boncănitul","accusative-indefinite-nominative-plural":"boncănituri","accusative-definite-nominative-plural":"boncăniturile","dative-genitive-indefinite-singular":"boncănit","dative-definite-genitive-singular":"boncănitului","dative-genitive-indefinite-plural":"boncănituri","dative-definite-genitive-plural":"boncăniturilor","singular-vocative":"boncănitule","plural-vocative":"boncăniturilor"}},{"word":"Boncescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boncescu"}},{"word":"Boncești","pos":"name","definitions":["a locality in Câmpeni, Alba County, Romania"],"gender":"m"},{"word":"Bonciu","pos":"name","definitions":["a village in Băbeni, Vâlcea County, Romania","a surname from Bulgarian"],"gender":"m"},{"word":"Boncotă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boncotă"}},{"word":"bondă","pos":"noun","definitions":["obsolete form of bundă"],"forms":{"plural":"bonde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bondă","accusative-definite-nominative-singular":"bonda","accusative-indefinite-nominative-plural":"bonde","accusative-definite-nominative-plural":"bondele","dative-genitive-indefinite-singular":"bonde","dative-definite-genitive-singular":"bondei","dative-genitive-indefinite-plural":"bonde","dative-definite-genitive-plural":"bondelor","singular-vocative":"bondă","plural-vocative":"bondelor"}},{"word":"Bondar","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bondar"}},{"word":"bondar","pos":"noun","definitions":["Bombus terrestris, bumblebee"],"pronunciation":"[bonˈdar]","forms":{"plural":"bondari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bondar","accusative-definite-nominative-singular":"bondarul","accusative-indefinite-nominative-plural":"bondari","accusative-definite-nominative-plural":"bondarii","dative-genitive-indefinite-singular":"bondar","dative-definite-genitive-singular":"bondarului","dative-genitive-indefinite-plural":"bondari","dative-definite-genitive-plural":"bondarilor","singular-vocative":"bondarule","plural-vocative":"bondarilor"}},{"word":"bondăraș","pos":"noun","definitions":["diminutive of bondar; small bumblebee"],"forms":{"plural":"bondărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bondăraș","accusative-definite-nominative-singular":"bondărașul","accusative-indefinite-nominative-plural":"bondărași","accusative-definite-nominative-plural":"bondărașii","dative-genitive-indefinite-singular":"bondăraș","dative-definite-genitive-singular":"bondărașului","dative-genitive-indefinite-plural":"bondărași","dative-definite-genitive-plural":"bondărașilor","singular-vocative":"bondărașule","plural-vocative":"bondărașilor"}},{"word":"Bondarencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Bondarencu"}},{"word":"Bondăreț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bondăreț"}},{"word":"Bondareuca","pos":"name","definitions":["a village in Zgărdești, Telenești Raion, Moldova"],"gender":"f"},{"word":"bondari","pos":"noun","definitions":["plural of bondar"]},{"word":"bondărime","pos":"noun","definitions":["bumblebees"],"forms":{"plural":"bondărimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bondărime","accusative-definite-nominative-singular":"bondărimea","accusative-indefinite-nominative-plural":"bondărimi","accusative-definite-nominative-plural":"bondărimile","dative-genitive-indefinite-singular":"bondărimi","dative-definite-genitive-singular":"bondărimii","dative-genitive-indefinite-plural":"bondărimi","dative-definite-genitive-plural":"bondărimilor","singular-vocative":"bondărime","plural-vocative":"bondărimilor"}},{"word":"Bondariu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bondariu"}},{"word":"bondăroi","pos":"noun","definitions":["augmentative of bondar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bondăroi","accusative-definite-nominative":"bondăroiul","dative-genitive-indefinite":"bondăroi","dative-definite-genitive":"bondăroiului","vocative":"bondăroiule"}},{"word":"bondiță","pos":"noun","definitions":["obsolete form of bundiță"],"forms":{"plural":"bondițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bondiță","accusative-definite-nominative-singular":"bondița","accusative-indefinite-nominative-plural":"bondițe","accusative-definite-nominative-plural":"bondițele","dative-genitive-indefinite-singular":"bondițe","dative-definite-genitive-singular":"bondiței","dative-genitive-indefinite-plural":"bondițe","dative-definite-genitive-plural":"bondițelor","singular-vocative":"bondiță","plural-vocative":"bondițelor"}},{"word":"Bondoc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bondoc"}},{"word":"bondoc","pos":"adj","definitions":["stocky"],"forms":{"feminine-singular":"bondocă","masculine-plural":"bondoci","feminine-neuter-plural":"bondoce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bondoc","error-unrecognized-form-feminine-indefinite-singular":"bondocă","error-unrecognized-form-indefinite-masculine-plural":"bondoci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bondoce","definite-error-unrecognized-form-masculine-neuter-singular":"bondocul","definite-error-unrecognized-form-feminine-singular":"bondoca","definite-error-unrecognized-form-masculine-plural":"bondocii","definite-error-unrecognized-form-feminine-neuter-plural":"bondocele"}},{"word":"bondoc","pos":"noun","definitions":["stocky person"],"forms":{"plural":"bondoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bondoc","accusative-definite-nominative-singular":"bondocul","accusative-indefinite-nominative-plural":"bondoci","accusative-definite-nominative-plural":"bondocii","dative-genitive-indefinite-singular":"bondoc","dative-definite-genitive-singular":"bondocului","dative-genitive-indefinite-plural":"bondoci","dative-definite-genitive-plural":"bondocilor","singular-vocative":"bondocule","plural-vocative":"bondocilor"}},{"word":"bondocel","pos":"adj","definitions":["diminutive of bondoc"],"forms":{"feminine-singular":"bondocelă","masculine-plural":"bondoceli","feminine-neuter-plural":"bondocele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bondocel","error-unrecognized-form-feminine-indefinite-singular":"bondocelă","error-unrecognized-form-indefinite-masculine-plural":"bondoceli","error-unrecognized-form-feminine-indefinite-neuter-plural":"bondocele","definite-error-unrecognized-form-masculine-neuter-singular":"bondocelul","definite-error-unrecognized-form-feminine-singular":"bondocela","definite-error-unrecognized-form-masculine-plural":"bondocelii","definite-error-unrecognized-form-feminine-neuter-plural":"bondocelele"}},{"word":"Bondoci","pos":"name","definitions":["a village in Copăceni, Vâlcea County, Romania"],"gender":"m"},{"word":"bondoci","pos":"noun","definitions":["plural of bondoc"]},{"word":"Bondrea","pos":"name","definitions":["a village in Cezieni, Olt County, Romania"],"gender":"f"},{"word":"Bondreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bondreanu"}},{"word":"bondreț","pos":"noun","definitions":["a larva"],"forms":{"plural":"bondreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bondreț","accusative-definite-nominative-singular":"bondrețul","accusative-indefinite-nominative-plural":"bondreți","accusative-definite-nominative-plural":"bondreții","dative-genitive-indefinite-singular":"bondreț","dative-definite-genitive-singular":"bondrețului","dative-genitive-indefinite-plural":"bondreți","dative-definite-genitive-plural":"bondreților","singular-vocative":"bondrețule","plural-vocative":"bondreților"}},{"word":"Bondrilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bondrilă"}},{"word":"Bone","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Bone"}},{"word":"bonetă","pos":"noun","definitions":["cap"],"forms":{"plural":"bonete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bonetă","accusative-definite-nominative-singular":"boneta","accusative-indefinite-nominative-plural":"bonete","accusative-definite-nominative-plural":"bonetele","dative-genitive-indefinite-singular":"bonete","dative-definite-genitive-singular":"bonetei","dative-genitive-indefinite-plural":"bonete","dative-definite-genitive-plural":"bonetelor","singular-vocative":"bonetă","plural-vocative":"bonetelor"}},{"word":"bonetă frigiană","pos":"noun","definitions":["Phrygian cap"],"forms":{"plural":"bonete frigiene"}},{"word":"bonețel","pos":"noun","definitions":["diminutive of bonet"],"forms":{"plural":"bonețele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bonețel","accusative-definite-nominative-singular":"bonețelul","accusative-indefinite-nominative-plural":"bonețele","accusative-definite-nominative-plural":"bonețelele","dative-genitive-indefinite-singular":"bonețel","dative-definite-genitive-singular":"bonețelului","dative-genitive-indefinite-plural":"bonețele","dative-definite-genitive-plural":"bonețelelor","singular-vocative":"bonețelule","plural-vocative":"bonețelelor"}},{"word":"bonețică","pos":"noun","definitions":["diminutive of bonetă; small cap"],"forms":{"plural":"bonețele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bonețică","accusative-definite-nominative-singular":"bonețica","accusative-indefinite-nominative-plural":"bonețice","accusative-definite-nominative-plural":"bonețicele","dative-genitive-indefinite-singular":"bonețice","dative-definite-genitive-singular":"bonețicei","dative-genitive-indefinite-plural":"bonețice","dative-definite-genitive-plural":"bonețicelor","singular-vocative":"bonețică","plural-vocative":"bonețicelor"}},{"word":"bongar","pos":"noun","definitions":["obsolete form of bondar"],"forms":{"plural":"bongari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bongar","accusative-definite-nominative-singular":"bongarul","accusative-indefinite-nominative-plural":"bongari","accusative-definite-nominative-plural":"bongarii","dative-genitive-indefinite-singular":"bongar","dative-definite-genitive-singular":"bongarului","dative-genitive-indefinite-plural":"bongari","dative-definite-genitive-plural":"bongarilor","singular-vocative":"bongarule","plural-vocative":"bongarilor"}},{"word":"bonguță","pos":"noun","definitions":["diminutive of boangă"],"forms":{"plural":"bonguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bonguță","accusative-definite-nominative-singular":"bonguța","accusative-indefinite-nominative-plural":"bonguțe","accusative-definite-nominative-plural":"bonguțele","dative-genitive-indefinite-singular":"bonguțe","dative-definite-genitive-singular":"bonguței","dative-genitive-indefinite-plural":"bonguțe","dative-definite-genitive-plural":"bonguțelor","singular-vocative":"bonguță","plural-vocative":"bonguțelor"}},{"word":"bonifica","pos":"verb","definitions":["to discount"],"forms":{"canonical":"a bonifica 1st conjugation","present-singular-third-person":"bonifică","participle-past":"bonificat","subjunctive-third-person":"bonifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bonifica","gerund":"bonificând","first-person-indicative-present-singular":"bonific","indicative-present-second-person-singular":"bonifici","indicative-present-singular-third-person":"bonifică","first-person-indicative-plural-present":"bonificăm","indicative-plural-present-second-person":"bonificați","indicative-plural-present-third-person":"bonifică","first-person-imperfect-indicative-singular":"bonificam","imperfect-indicative-second-person-singular":"bonificai","imperfect-indicative-singular-third-person":"bonifica","first-person-imperfect-indicative-plural":"bonificam","imperfect-indicative-plural-second-person":"bonificați","imperfect-indicative-plural-third-person":"bonificau","first-person-indicative-perfect-singular":"bonificai","indicative-perfect-second-person-singular":"bonificași","indicative-perfect-singular-third-person":"bonifică","first-person-indicative-perfect-plural":"bonificarăm","indicative-perfect-plural-second-person":"bonificarăți","indicative-perfect-plural-third-person":"bonificară","first-person-indicative-pluperfect-singular":"bonificasem","indicative-pluperfect-second-person-singular":"bonificaseși","indicative-pluperfect-singular-third-person":"bonificase","first-person-indicative-pluperfect-plural":"bonificaserăm","indicative-pluperfect-plural-second-person":"bonificaserăți","indicative-pluperfect-plural-third-person":"bonificaseră","first-person-present-singular-subjunctive":"să bonific","present-second-person-singular-subjunctive":"să bonifici","present-singular-subjunctive-third-person":"să bonifice","first-person-plural-present-subjunctive":"să bonificăm","plural-present-second-person-subjunctive":"să bonificați","plural-present-subjunctive-third-person":"să bonifice","imperative-second-person-singular":"bonifică","imperative-plural-second-person":"bonificați","imperative-negative-second-person-singular":"nu bonifica","imperative-negative-plural-second-person":"nu bonificați"}},{"word":"bonificare","pos":"noun","definitions":["bonification"],"forms":{"plural":"bonificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bonificare","accusative-definite-nominative-singular":"bonificarea","accusative-indefinite-nominative-plural":"bonificări","accusative-definite-nominative-plural":"bonificările","dative-genitive-indefinite-singular":"bonificări","dative-definite-genitive-singular":"bonificării","dative-genitive-indefinite-plural":"bonificări","dative-definite-genitive-plural":"bonificărilor","singular-vocative":"bonificare","plural-vocative":"bonificărilor"}},{"word":"bonificație","pos":"noun","definitions":["allowance"],"forms":{"plural":"bonificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bonificație","accusative-definite-nominative-singular":"bonificația","accusative-indefinite-nominative-plural":"bonificații","accusative-definite-nominative-plural":"bonificațiile","dative-genitive-indefinite-singular":"bonificații","dative-definite-genitive-singular":"bonificației","dative-genitive-indefinite-plural":"bonificații","dative-definite-genitive-plural":"bonificațiilor","singular-vocative":"bonificație","plural-vocative":"bonificațiilor"}},{"word":"bonitate","pos":"noun","definitions":["creditworthiness"],"forms":{"plural":"bonități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bonitate","accusative-definite-nominative-singular":"bonitatea","accusative-indefinite-nominative-plural":"bonități","accusative-definite-nominative-plural":"bonitățile","dative-genitive-indefinite-singular":"bonități","dative-definite-genitive-singular":"bonității","dative-genitive-indefinite-plural":"bonități","dative-definite-genitive-plural":"bonităților","singular-vocative":"bonitate","plural-vocative":"bonităților"}},{"word":"bonjur","pos":"intj","definitions":["good day"]},{"word":"bonom","pos":"noun","definitions":["fellow, chap"],"forms":{"plural":"bonomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bonom","accusative-definite-nominative-singular":"bonomul","accusative-indefinite-nominative-plural":"bonomi","accusative-definite-nominative-plural":"bonomii","dative-genitive-indefinite-singular":"bonom","dative-definite-genitive-singular":"bonomului","dative-genitive-indefinite-plural":"bonomi","dative-definite-genitive-plural":"bonomilor","singular-vocative":"bonomule","plural-vocative":"bonomilor"}},{"word":"bonomie","pos":"noun","definitions":["bonhomie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bonomie","accusative-definite-nominative":"bonomia","dative-genitive-indefinite":"bonomii","dative-definite-genitive":"bonomiei","vocative":"bonomie"}},{"word":"bont","pos":"adj","definitions":["dull, blunt"],"pronunciation":"/bont/","forms":{"feminine-singular":"boantă","masculine-plural":"bonți","feminine-neuter-plural":"boante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bont","error-unrecognized-form-feminine-indefinite-singular":"boantă","error-unrecognized-form-indefinite-masculine-plural":"bonți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boante","definite-error-unrecognized-form-masculine-neuter-singular":"bontul","definite-error-unrecognized-form-feminine-singular":"boanta","definite-error-unrecognized-form-masculine-plural":"bonții","definite-error-unrecognized-form-feminine-neuter-plural":"boantele"}},{"word":"Bonț","pos":"name","definitions":["a village in Fizeșu Gherlii, Cluj County, Romania"],"gender":"m"},{"word":"Bontăieni","pos":"name","definitions":["a village in Șisești, Maramureș County, Romania"],"gender":"m"},{"word":"bontănire","pos":"noun","definitions":["hammering"],"forms":{"plural":"bontăniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bontănire","accusative-definite-nominative-singular":"bontănirea","accusative-indefinite-nominative-plural":"bontăniri","accusative-definite-nominative-plural":"bontănirile","dative-genitive-indefinite-singular":"bontăniri","dative-definite-genitive-singular":"bontănirii","dative-genitive-indefinite-plural":"bontăniri","dative-definite-genitive-plural":"bontănirilor","singular-vocative":"bontănire","plural-vocative":"bontănirilor"}},{"word":"bontănitură","pos":"noun","definitions":["knock"],"forms":{"plural":"bontănituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bontănitură","accusative-definite-nominative-singular":"bontănitura","accusative-indefinite-nominative-plural":"bontănituri","accusative-definite-nominative-plural":"bontăniturile","dative-genitive-indefinite-singular":"bontănituri","dative-definite-genitive-singular":"bontăniturii","dative-genitive-indefinite-plural":"bontănituri","dative-definite-genitive-plural":"bontăniturilor","singular-vocative":"bontănitură","plural-vocative":"bontăniturilor"}},{"word":"bontaș","pos":"noun","definitions":["rebel"],"pronunciation":"/bonˈtaʃ/","forms":{"plural":"bontași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bontaș","accusative-definite-nominative-singular":"bontașul","accusative-indefinite-nominative-plural":"bontași","accusative-definite-nominative-plural":"bontașii","dative-genitive-indefinite-singular":"bontaș","dative-definite-genitive-singular":"bontașului","dative-genitive-indefinite-plural":"bontași","dative-definite-genitive-plural":"bontașilor","singular-vocative":"bontașule","plural-vocative":"bontașilor"}},{"word":"Bonțești","pos":"name","definitions":["a village in Gurahonț, Arad County, Romania","a village in Cârligele, Vrancea County, Romania"],"gender":"m"},{"word":"Bonțida","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Bonțida, Cluj County, Romania"],"gender":"f"},{"word":"Bonțidean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bonțidean"}},{"word":"Bonțideanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bonțideanu"}},{"word":"Bontu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bontu"}},{"word":"bonul","pos":"noun","definitions":["definite nominative/accusative singular of bon"]},{"word":"bonului","pos":"noun","definitions":["definite genitive/dative singular of bon"]},{"word":"bonuri","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of bon"]},{"word":"bonurile","pos":"noun","definitions":["definite nominative/accusative plural of bon"]},{"word":"bonurilor","pos":"noun","definitions":["definite genitive/dative plural of bon"]},{"word":"bonus","pos":"noun","definitions":["bonus"],"forms":{"plural":"bonusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bonus","accusative-definite-nominative-singular":"bonusul","accusative-indefinite-nominative-plural":"bonusuri","accusative-definite-nominative-plural":"bonusurile","dative-genitive-indefinite-singular":"bonus","dative-definite-genitive-singular":"bonusului","dative-genitive-indefinite-plural":"bonusuri","dative-definite-genitive-plural":"bonusurilor","singular-vocative":"bonusule","plural-vocative":"bonusurilor"}},{"word":"bonz","pos":"noun","definitions":["bonze, a Buddhist priest"],"forms":{"plural":"bonzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bonz","accusative-definite-nominative-singular":"bonzul","accusative-indefinite-nominative-plural":"bonzi","accusative-definite-nominative-plural":"bonzii","dative-genitive-indefinite-singular":"bonz","dative-definite-genitive-singular":"bonzului","dative-genitive-indefinite-plural":"bonzi","dative-definite-genitive-plural":"bonzilor","singular-vocative":"bonzule","plural-vocative":"bonzilor"}},{"word":"bonzălău","pos":"noun","definitions":["horsefly, gadfly"],"forms":{"plural":"bonzălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bonzălău","accusative-definite-nominative-singular":"bonzălăuul","accusative-indefinite-nominative-plural":"bonzălăi","accusative-definite-nominative-plural":"bonzălăii","dative-genitive-indefinite-singular":"bonzălău","dative-definite-genitive-singular":"bonzălăuului","dative-genitive-indefinite-plural":"bonzălăi","dative-definite-genitive-plural":"bonzălăilor","singular-vocative":"bonzălăuule","plural-vocative":"bonzălăilor"}},{"word":"bonzăraș","pos":"noun","definitions":["diminutive of bonzar"],"forms":{"plural":"bonzărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bonzăraș","accusative-definite-nominative-singular":"bonzărașul","accusative-indefinite-nominative-plural":"bonzărași","accusative-definite-nominative-plural":"bonzărașii","dative-genitive-indefinite-singular":"bonzăraș","dative-definite-genitive-singular":"bonzărașului","dative-genitive-indefinite-plural":"bonzărași","dative-definite-genitive-plural":"bonzărașilor","singular-vocative":"bonzărașule","plural-vocative":"bonzărașilor"}},{"word":"bonzăroi","pos":"noun","definitions":["European hornet (Vespa crabro)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bonzăroi","accusative-definite-nominative":"bonzăroiul","dative-genitive-indefinite":"bonzăroi","dative-definite-genitive":"bonzăroiului","vocative":"bonzăroiule"}},{"word":"boom","pos":"noun","definitions":["boom"],"forms":{"plural":"boomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boom","accusative-definite-nominative-singular":"boomul","accusative-indefinite-nominative-plural":"boomuri","accusative-definite-nominative-plural":"boomurile","dative-genitive-indefinite-singular":"boom","dative-definite-genitive-singular":"boomului","dative-genitive-indefinite-plural":"boomuri","dative-definite-genitive-plural":"boomurilor","singular-vocative":"boomule","plural-vocative":"boomurilor"}},{"word":"Booveni","pos":"name","definitions":["a village in Drănic, Dolj County, Romania"],"gender":"m"},{"word":"BOR","pos":"name","definitions":["initialism of Biserica Ortodoxă Română (Romanian Orthodox Church)"]},{"word":"bor","pos":"noun","definitions":["boron (chemical element)"],"pronunciation":"/bor/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bor","accusative-definite-nominative":"borul","dative-genitive-indefinite":"bor","dative-definite-genitive":"borului","vocative":"borule"}},{"word":"bor","pos":"noun","definitions":["brim (of a hat)"],"pronunciation":"/bor/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bor","accusative-definite-nominative-singular":"borul","accusative-indefinite-nominative-plural":"boruri","accusative-definite-nominative-plural":"borurile","dative-genitive-indefinite-singular":"bor","dative-definite-genitive-singular":"borului","dative-genitive-indefinite-plural":"boruri","dative-definite-genitive-plural":"borurilor","singular-vocative":"borule","plural-vocative":"borurilor"}},{"word":"bora","pos":"verb","definitions":["third-person singular imperfect indicative of borî"],"pronunciation":"[boˈra]"},{"word":"borabăr","pos":"noun","definitions":["tramp"],"forms":{"plural":"borabări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borabăr","accusative-definite-nominative-singular":"borabărul","accusative-indefinite-nominative-plural":"borabări","accusative-definite-nominative-plural":"borabării","dative-genitive-indefinite-singular":"borabăr","dative-definite-genitive-singular":"borabărului","dative-genitive-indefinite-plural":"borabări","dative-definite-genitive-plural":"borabărilor","singular-vocative":"borabărule","plural-vocative":"borabărilor"}},{"word":"boracit","pos":"noun","definitions":["boracite"],"forms":{"plural":"boracituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"boracit","accusative-definite-nominative-singular":"boracitul","accusative-indefinite-nominative-plural":"boracituri","accusative-definite-nominative-plural":"boraciturile","dative-genitive-indefinite-singular":"boracit","dative-definite-genitive-singular":"boracitului","dative-genitive-indefinite-plural":"boracituri","dative-definite-genitive-plural":"boraciturilor","singular-vocative":"boracitule","plural-vocative":"boraciturilor"}},{"word":"boram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of borî"],"pronunciation":"[boˈram]"},{"word":"borană","pos":"noun","definitions":["storm, tempest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"borană","accusative-definite-nominative":"borana","dative-genitive-indefinite":"borane","dative-definite-genitive":"boranei","vocative":"borană"}},{"word":"borândăit","pos":"adj","definitions":["chewed"],"forms":{"feminine-singular":"borândăită","masculine-plural":"borândăiți","feminine-neuter-plural":"borândăite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borândăit","error-unrecognized-form-feminine-indefinite-singular":"borândăită","error-unrecognized-form-indefinite-masculine-plural":"borândăiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"borândăite","definite-error-unrecognized-form-masculine-neuter-singular":"borândăitul","definite-error-unrecognized-form-feminine-singular":"borândăita","definite-error-unrecognized-form-masculine-plural":"borândăiții","definite-error-unrecognized-form-feminine-neuter-plural":"borândăitele","alternative":"borîndăit"}},{"word":"borândăit","pos":"verb","definitions":["past participle of borândăi"],"forms":{"participle-past":"of borândăi","alternative":"borîndăit"}},{"word":"Borănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Borănescu"}},{"word":"Borănești","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Borănești, Ialomița County, Romania"],"gender":"m"},{"word":"Borangic","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borangic"}},{"word":"borangic","pos":"noun","definitions":["silk"],"forms":{"plural":"borangicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borangic","accusative-definite-nominative-singular":"borangicul","accusative-indefinite-nominative-plural":"borangicuri","accusative-definite-nominative-plural":"borangicurile","dative-genitive-indefinite-singular":"borangic","dative-definite-genitive-singular":"borangicului","dative-genitive-indefinite-plural":"borangicuri","dative-definite-genitive-plural":"borangicurilor","singular-vocative":"borangicule","plural-vocative":"borangicurilor"}},{"word":"borâre","pos":"noun","definitions":["vomiting"],"forms":{"plural":"borâri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"borâre","accusative-definite-nominative-singular":"borârea","accusative-indefinite-nominative-plural":"borâri","accusative-definite-nominative-plural":"borârile","dative-genitive-indefinite-singular":"borâri","dative-definite-genitive-singular":"borârii","dative-genitive-indefinite-plural":"borâri","dative-definite-genitive-plural":"borârilor","singular-vocative":"borâre","plural-vocative":"borârilor","alternative":"borîre"}},{"word":"Borăscu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borăscu"}},{"word":"borat","pos":"noun","definitions":["borate"],"forms":{"plural":"borați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borat","accusative-definite-nominative-singular":"boratul","accusative-indefinite-nominative-plural":"borați","accusative-definite-nominative-plural":"borații","dative-genitive-indefinite-singular":"borat","dative-definite-genitive-singular":"boratului","dative-genitive-indefinite-plural":"borați","dative-definite-genitive-plural":"boraților","singular-vocative":"boratule","plural-vocative":"boraților"}},{"word":"borât","pos":"adj","definitions":["disgusting, detestable"],"forms":{"feminine-singular":"borâtă","masculine-plural":"borâți","feminine-neuter-plural":"borâte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borât","error-unrecognized-form-feminine-indefinite-singular":"borâtă","error-unrecognized-form-indefinite-masculine-plural":"borâți","error-unrecognized-form-feminine-indefinite-neuter-plural":"borâte","definite-error-unrecognized-form-masculine-neuter-singular":"borâtul","definite-error-unrecognized-form-feminine-singular":"borâta","definite-error-unrecognized-form-masculine-plural":"borâții","definite-error-unrecognized-form-feminine-neuter-plural":"borâtele","alternative":"borît"}},{"word":"Borâtu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borâtu","alternative":"Borîtu"}},{"word":"borâtură","pos":"noun","definitions":["vomit"],"forms":{"plural":"borâturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borâtură","accusative-definite-nominative-singular":"borâtura","accusative-indefinite-nominative-plural":"borâture","accusative-definite-nominative-plural":"borâturele","dative-genitive-indefinite-singular":"borâture","dative-definite-genitive-singular":"borâturei","dative-genitive-indefinite-plural":"borâture","dative-definite-genitive-plural":"borâturelor","singular-vocative":"borâtură","plural-vocative":"borâturelor","alternative":"borîtură"}},{"word":"borax","pos":"noun","definitions":["borax"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"borax","accusative-definite-nominative":"boraxul","dative-genitive-indefinite":"borax","dative-definite-genitive":"boraxului","vocative":"boraxule"}},{"word":"Borbil","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borbil"}},{"word":"borbolină","pos":"noun","definitions":["club, bludgeon"],"forms":{"plural":"borboline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borbolină","accusative-definite-nominative-singular":"borbolina","accusative-indefinite-nominative-plural":"borboline","accusative-definite-nominative-plural":"borbolinele","dative-genitive-indefinite-singular":"borboline","dative-definite-genitive-singular":"borbolinei","dative-genitive-indefinite-plural":"borboline","dative-definite-genitive-plural":"borbolinelor","singular-vocative":"borbolină","plural-vocative":"borbolinelor"}},{"word":"borborigme","pos":"noun","definitions":["borborygmus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"borborigme","accusative-definite-nominative":"borborigmele","dative-genitive-indefinite":"borborigme","dative-definite-genitive":"borborigmelor","vocative":"borborigmelor"}},{"word":"Borcan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borcan"}},{"word":"borcan","pos":"noun","definitions":["jar","jarful"],"pronunciation":"/borˈkan/","forms":{"plural":"borcane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borcan","accusative-definite-nominative-singular":"borcanul","accusative-indefinite-nominative-plural":"borcane","accusative-definite-nominative-plural":"borcanele","dative-genitive-indefinite-singular":"borcan","dative-definite-genitive-singular":"borcanului","dative-genitive-indefinite-plural":"borcane","dative-definite-genitive-plural":"borcanelor","singular-vocative":"borcanule","plural-vocative":"borcanelor","alternative":"боркан"}},{"word":"Borcănaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borcănaș"}},{"word":"borcănaș","pos":"noun","definitions":["diminutive of borcan; small jar"],"forms":{"plural":"borcănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borcănaș","accusative-definite-nominative-singular":"borcănașul","accusative-indefinite-nominative-plural":"borcănașe","accusative-definite-nominative-plural":"borcănașele","dative-genitive-indefinite-singular":"borcănaș","dative-definite-genitive-singular":"borcănașului","dative-genitive-indefinite-plural":"borcănașe","dative-definite-genitive-plural":"borcănașelor","singular-vocative":"borcănașule","plural-vocative":"borcănașelor"}},{"word":"borcănat","pos":"adj","definitions":["inflated"],"forms":{"feminine-singular":"borcănată","masculine-plural":"borcănați","feminine-neuter-plural":"borcănate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borcănat","error-unrecognized-form-feminine-indefinite-singular":"borcănată","error-unrecognized-form-indefinite-masculine-plural":"borcănați","error-unrecognized-form-feminine-indefinite-neuter-plural":"borcănate","definite-error-unrecognized-form-masculine-neuter-singular":"borcănatul","definite-error-unrecognized-form-feminine-singular":"borcănata","definite-error-unrecognized-form-masculine-plural":"borcănații","definite-error-unrecognized-form-feminine-neuter-plural":"borcănatele"}},{"word":"borcane","pos":"noun","definitions":["plural of borcan"]},{"word":"borcăneci","pos":"noun","definitions":["diminutive of borcan"],"forms":{"plural":"borcănece","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borcăneci","accusative-definite-nominative-singular":"borcăneciul","accusative-indefinite-nominative-plural":"borcănece","accusative-definite-nominative-plural":"borcănecele","dative-genitive-indefinite-singular":"borcăneci","dative-definite-genitive-singular":"borcăneciului","dative-genitive-indefinite-plural":"borcănece","dative-definite-genitive-plural":"borcănecelor","singular-vocative":"borcăneciule","plural-vocative":"borcănecelor"}},{"word":"borcănel","pos":"noun","definitions":["diminutive of borcan"],"forms":{"plural":"borcănele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borcănel","accusative-definite-nominative-singular":"borcănelul","accusative-indefinite-nominative-plural":"borcănele","accusative-definite-nominative-plural":"borcănelele","dative-genitive-indefinite-singular":"borcănel","dative-definite-genitive-singular":"borcănelului","dative-genitive-indefinite-plural":"borcănele","dative-definite-genitive-plural":"borcănelelor","singular-vocative":"borcănelule","plural-vocative":"borcănelelor"}},{"word":"Borcănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Borcănescu"}},{"word":"borcănos","pos":"adj","definitions":["big (about the nose)"],"forms":{"feminine-singular":"borcănoasă","masculine-plural":"borcănoși","feminine-neuter-plural":"borcănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borcănos","error-unrecognized-form-feminine-indefinite-singular":"borcănoasă","error-unrecognized-form-indefinite-masculine-plural":"borcănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"borcănoase","definite-error-unrecognized-form-masculine-neuter-singular":"borcănosul","definite-error-unrecognized-form-feminine-singular":"borcănoasa","definite-error-unrecognized-form-masculine-plural":"borcănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"borcănoasele"}},{"word":"Borcea","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Borcea, Călărași County, Romania","a surname from Bulgarian"],"gender":"f"},{"word":"Borceag","pos":"name","definitions":["a village in Borceag, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"borceag","pos":"noun","definitions":["vetch"],"forms":{"plural":"borceaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borceag","accusative-definite-nominative-singular":"borceagul","accusative-indefinite-nominative-plural":"borceaguri","accusative-definite-nominative-plural":"borceagurile","dative-genitive-indefinite-singular":"borceag","dative-definite-genitive-singular":"borceagului","dative-genitive-indefinite-plural":"borceaguri","dative-definite-genitive-plural":"borceagurilor","singular-vocative":"borceagule","plural-vocative":"borceagurilor"}},{"word":"Borcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Borcescu"}},{"word":"borci","pos":"noun","definitions":["jimsonweed"],"forms":{"plural":"borcii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borci","accusative-definite-nominative-singular":"borciul","accusative-indefinite-nominative-plural":"borcii","accusative-definite-nominative-plural":"borciii","dative-genitive-indefinite-singular":"borci","dative-definite-genitive-singular":"borciului","dative-genitive-indefinite-plural":"borcii","dative-definite-genitive-plural":"borciilor","singular-vocative":"borciule","plural-vocative":"borciilor"}},{"word":"Borcilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borcilă"}},{"word":"Borcut","pos":"name","definitions":["a village in Târgu Lăpuș, Maramureș County, Romania"],"gender":"m"},{"word":"borcut","pos":"noun","definitions":["mineral water"],"forms":{"plural":"borcuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borcut","accusative-definite-nominative-singular":"borcutul","accusative-indefinite-nominative-plural":"borcuturi","accusative-definite-nominative-plural":"borcuturile","dative-genitive-indefinite-singular":"borcut","dative-definite-genitive-singular":"borcutului","dative-genitive-indefinite-plural":"borcuturi","dative-definite-genitive-plural":"borcuturilor","singular-vocative":"borcutule","plural-vocative":"borcuturilor"}},{"word":"Borcuțean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Borcuțean"}},{"word":"Borcutul","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Neagra Șarului","a river in Maramureș, Romania, tributary to the Săsar"],"gender":"m"},{"word":"Bord","pos":"name","definitions":["a village in Cucerdea, Mureș County, Romania"],"gender":"m"},{"word":"bord","pos":"noun","definitions":["side of a ship's deck"],"forms":{"plural":"borduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bord","accusative-definite-nominative-singular":"bordul","accusative-indefinite-nominative-plural":"borduri","accusative-definite-nominative-plural":"bordurile","dative-genitive-indefinite-singular":"bord","dative-definite-genitive-singular":"bordului","dative-genitive-indefinite-plural":"borduri","dative-definite-genitive-plural":"bordurilor","singular-vocative":"bordule","plural-vocative":"bordurilor"}},{"word":"bordaj","pos":"noun","definitions":["planking"],"forms":{"plural":"bordaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bordaj","accusative-definite-nominative-singular":"bordajul","accusative-indefinite-nominative-plural":"bordaje","accusative-definite-nominative-plural":"bordajele","dative-genitive-indefinite-singular":"bordaj","dative-definite-genitive-singular":"bordajului","dative-genitive-indefinite-plural":"bordaje","dative-definite-genitive-plural":"bordajelor","singular-vocative":"bordajule","plural-vocative":"bordajelor"}},{"word":"bordan","pos":"noun","definitions":["boulder"],"forms":{"plural":"bordani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bordan","accusative-definite-nominative-singular":"bordanul","accusative-indefinite-nominative-plural":"bordani","accusative-definite-nominative-plural":"bordanii","dative-genitive-indefinite-singular":"bordan","dative-definite-genitive-singular":"bordanului","dative-genitive-indefinite-plural":"bordani","dative-definite-genitive-plural":"bordanilor","singular-vocative":"bordanule","plural-vocative":"bordanilor"}},{"word":"Bordean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bordean"}},{"word":"Bordeasca Nouă","pos":"name","definitions":["a village in Tătăranu, Vrancea County, Romania"],"gender":"f"},{"word":"Bordeasca Veche","pos":"name","definitions":["a village in Tătăranu, Vrancea County, Romania"],"gender":"f"},{"word":"Bordei","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordei"}},{"word":"bordei","pos":"noun","definitions":["cottage"],"forms":{"plural":"bordeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bordei","accusative-definite-nominative-singular":"bordeiul","accusative-indefinite-nominative-plural":"bordeie","accusative-definite-nominative-plural":"bordeiele","dative-genitive-indefinite-singular":"bordei","dative-definite-genitive-singular":"bordeiului","dative-genitive-indefinite-plural":"bordeie","dative-definite-genitive-plural":"bordeielor","singular-vocative":"bordeiule","plural-vocative":"bordeielor"}},{"word":"Bordei Verde","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Bordei Verde, Brăila County, Romania"],"gender":"m"},{"word":"Bordeianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordeianu"}},{"word":"Bordeiaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordeiaș"}},{"word":"bordeiaș","pos":"noun","definitions":["diminutive of bordei; small hut"],"forms":{"plural":"bordeiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bordeiaș","accusative-definite-nominative-singular":"bordeiașul","accusative-indefinite-nominative-plural":"bordeiașe","accusative-definite-nominative-plural":"bordeiașele","dative-genitive-indefinite-singular":"bordeiaș","dative-definite-genitive-singular":"bordeiașului","dative-genitive-indefinite-plural":"bordeiașe","dative-definite-genitive-plural":"bordeiașelor","singular-vocative":"bordeiașule","plural-vocative":"bordeiașelor"}},{"word":"Bordeiașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordeiașu"}},{"word":"Bordeieni","pos":"name","definitions":["a village in Godeni, Argeș County, Romania"],"gender":"m"},{"word":"Bordeiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordeiu"}},{"word":"bordel","pos":"noun","definitions":["bordello, brothel"],"forms":{"plural":"bordeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bordel","accusative-definite-nominative-singular":"bordelul","accusative-indefinite-nominative-plural":"bordeluri","accusative-definite-nominative-plural":"bordelurile","dative-genitive-indefinite-singular":"bordel","dative-definite-genitive-singular":"bordelului","dative-genitive-indefinite-plural":"bordeluri","dative-definite-genitive-plural":"bordelurilor","singular-vocative":"bordelule","plural-vocative":"bordelurilor"}},{"word":"Bordenii Mari","pos":"name","definitions":["a village in Scorțeni, Prahova County, Romania"],"gender":"m"},{"word":"Bordenii Mici","pos":"name","definitions":["a village in Scorțeni, Prahova County, Romania"],"gender":"m"},{"word":"borderou","pos":"noun","definitions":["bordereau"],"forms":{"plural":"borderouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borderou","accusative-definite-nominative-singular":"borderouul","accusative-indefinite-nominative-plural":"borderouri","accusative-definite-nominative-plural":"borderourile","dative-genitive-indefinite-singular":"borderou","dative-definite-genitive-singular":"borderouului","dative-genitive-indefinite-plural":"borderouri","dative-definite-genitive-plural":"borderourilor","singular-vocative":"borderouule","plural-vocative":"borderourilor"}},{"word":"Bordescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bordescu"}},{"word":"Bordești","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Bordești, Vrancea County, Romania"],"gender":"m"},{"word":"Bordeștii de Jos","pos":"name","definitions":["a village in Bordești, Vrancea County, Romania"],"gender":"m"},{"word":"Bordeștii Poieni","pos":"name","definitions":["a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"bordeuț","pos":"noun","definitions":["diminutive of bordei"],"forms":{"plural":"bordeuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bordeuț","accusative-definite-nominative-singular":"bordeuțul","accusative-indefinite-nominative-plural":"bordeuțe","accusative-definite-nominative-plural":"bordeuțele","dative-genitive-indefinite-singular":"bordeuț","dative-definite-genitive-singular":"bordeuțului","dative-genitive-indefinite-plural":"bordeuțe","dative-definite-genitive-plural":"bordeuțelor","singular-vocative":"bordeuțule","plural-vocative":"bordeuțelor"}},{"word":"bordiaș","pos":"adj","definitions":["hutter"],"forms":{"feminine-singular":"bordiașă","masculine-plural":"bordiași","feminine-neuter-plural":"bordiașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bordiaș","error-unrecognized-form-feminine-indefinite-singular":"bordiașă","error-unrecognized-form-indefinite-masculine-plural":"bordiași","error-unrecognized-form-feminine-indefinite-neuter-plural":"bordiașe","definite-error-unrecognized-form-masculine-neuter-singular":"bordiașul","definite-error-unrecognized-form-feminine-singular":"bordiașa","definite-error-unrecognized-form-masculine-plural":"bordiașii","definite-error-unrecognized-form-feminine-neuter-plural":"bordiașele"}},{"word":"Bordică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bordică"}},{"word":"bordicen","pos":"noun","definitions":["giant being"],"forms":{"plural":"bordiceni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bordicen","accusative-definite-nominative-singular":"bordicenul","accusative-indefinite-nominative-plural":"bordiceni","accusative-definite-nominative-plural":"bordicenii","dative-genitive-indefinite-singular":"bordicen","dative-definite-genitive-singular":"bordicenului","dative-genitive-indefinite-plural":"bordiceni","dative-definite-genitive-plural":"bordicenilor","singular-vocative":"bordicenule","plural-vocative":"bordicenilor"}},{"word":"bordios","pos":"adj","definitions":["obsolete form of burduhos"],"forms":{"feminine-singular":"bordioasă","masculine-plural":"bordioși","feminine-neuter-plural":"bordioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bordios","error-unrecognized-form-feminine-indefinite-singular":"bordioasă","error-unrecognized-form-indefinite-masculine-plural":"bordioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bordioase","definite-error-unrecognized-form-masculine-neuter-singular":"bordiosul","definite-error-unrecognized-form-feminine-singular":"bordioasa","definite-error-unrecognized-form-masculine-plural":"bordioșii","definite-error-unrecognized-form-feminine-neuter-plural":"bordioasele"}},{"word":"bordo","pos":"adj","definitions":["claret (colour)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bordo","error-unrecognized-form-feminine-indefinite-singular":"bordo","error-unrecognized-form-indefinite-masculine-plural":"bordo","error-unrecognized-form-feminine-indefinite-neuter-plural":"bordo","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Bordoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bordoiu"}},{"word":"Bordoșiu","pos":"name","definitions":["a village in Fântânele, Mureș County, Romania"],"gender":"m"},{"word":"bordură","pos":"noun","definitions":["border","curb (at the edge of a road)"],"forms":{"plural":"borduri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bordură","accusative-definite-nominative-singular":"bordura","accusative-indefinite-nominative-plural":"borduri","accusative-definite-nominative-plural":"bordurile","dative-genitive-indefinite-singular":"borduri","dative-definite-genitive-singular":"bordurii","dative-genitive-indefinite-plural":"borduri","dative-definite-genitive-plural":"bordurilor","singular-vocative":"bordură","plural-vocative":"bordurilor"}},{"word":"borduș","pos":"noun","definitions":["diminutive of bordei"],"forms":{"plural":"bordușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borduș","accusative-definite-nominative-singular":"bordușul","accusative-indefinite-nominative-plural":"bordușe","accusative-definite-nominative-plural":"bordușele","dative-genitive-indefinite-singular":"borduș","dative-definite-genitive-singular":"bordușului","dative-genitive-indefinite-plural":"bordușe","dative-definite-genitive-plural":"bordușelor","singular-vocative":"bordușule","plural-vocative":"bordușelor"}},{"word":"Bordușani","pos":"name","definitions":["a village in Săgeata, Buzău County, Romania","a commune of Ialomița County, Romania","a village in Bordușani, Ialomița County, Romania"],"gender":"m"},{"word":"Bordușelu","pos":"name","definitions":["a village in Ciochina, Ialomița County, Romania"],"gender":"m"},{"word":"boreal","pos":"adj","definitions":["northern, boreal"],"forms":{"feminine-singular":"boreală","masculine-plural":"boreali","feminine-neuter-plural":"boreale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boreal","error-unrecognized-form-feminine-indefinite-singular":"boreală","error-unrecognized-form-indefinite-masculine-plural":"boreali","error-unrecognized-form-feminine-indefinite-neuter-plural":"boreale","definite-error-unrecognized-form-masculine-neuter-singular":"borealul","definite-error-unrecognized-form-feminine-singular":"boreala","definite-error-unrecognized-form-masculine-plural":"borealii","definite-error-unrecognized-form-feminine-neuter-plural":"borealele"}},{"word":"boreală","pos":"noun","definitions":["vomiting"],"forms":{"plural":"boreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boreală","accusative-definite-nominative-singular":"boreala","accusative-indefinite-nominative-plural":"borele","accusative-definite-nominative-plural":"borelele","dative-genitive-indefinite-singular":"borele","dative-definite-genitive-singular":"borelei","dative-genitive-indefinite-plural":"borele","dative-definite-genitive-plural":"borelelor","singular-vocative":"boreală","plural-vocative":"borelelor"}},{"word":"boreasă","pos":"noun","definitions":["wife"],"forms":{"plural":"borese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boreasă","accusative-definite-nominative-singular":"boreasa","accusative-indefinite-nominative-plural":"borese","accusative-definite-nominative-plural":"boresele","dative-genitive-indefinite-singular":"borese","dative-definite-genitive-singular":"boresei","dative-genitive-indefinite-plural":"borese","dative-definite-genitive-plural":"boreselor","singular-vocative":"boreasă","plural-vocative":"boreselor"}},{"word":"borfar","pos":"noun","definitions":["thief"],"forms":{"plural":"borfari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borfar","accusative-definite-nominative-singular":"borfarul","accusative-indefinite-nominative-plural":"borfari","accusative-definite-nominative-plural":"borfarii","dative-genitive-indefinite-singular":"borfar","dative-definite-genitive-singular":"borfarului","dative-genitive-indefinite-plural":"borfari","dative-definite-genitive-plural":"borfarilor","singular-vocative":"borfarule","plural-vocative":"borfarilor"}},{"word":"borfaș","pos":"noun","definitions":["thief"],"forms":{"plural":"borfași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borfaș","accusative-definite-nominative-singular":"borfașul","accusative-indefinite-nominative-plural":"borfași","accusative-definite-nominative-plural":"borfașii","dative-genitive-indefinite-singular":"borfaș","dative-definite-genitive-singular":"borfașului","dative-genitive-indefinite-plural":"borfași","dative-definite-genitive-plural":"borfașilor","singular-vocative":"borfașule","plural-vocative":"borfașilor"}},{"word":"borfășie","pos":"noun","definitions":["thievery"],"forms":{"plural":"borfășii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"borfășie","accusative-definite-nominative-singular":"borfășia","accusative-indefinite-nominative-plural":"borfășii","accusative-definite-nominative-plural":"borfășiile","dative-genitive-indefinite-singular":"borfășii","dative-definite-genitive-singular":"borfășiei","dative-genitive-indefinite-plural":"borfășii","dative-definite-genitive-plural":"borfășiilor","singular-vocative":"borfășie","plural-vocative":"borfășiilor"}},{"word":"borfoi","pos":"noun","definitions":["a sluggish man"],"forms":{"plural":"borfoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borfoi","accusative-definite-nominative-singular":"borfoiul","accusative-indefinite-nominative-plural":"borfoi","accusative-definite-nominative-plural":"borfoii","dative-genitive-indefinite-singular":"borfoi","dative-definite-genitive-singular":"borfoiului","dative-genitive-indefinite-plural":"borfoi","dative-definite-genitive-plural":"borfoilor","singular-vocative":"borfoiule","plural-vocative":"borfoilor"}},{"word":"Borhidan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borhidan"}},{"word":"Borhot","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borhot"}},{"word":"borhot","pos":"noun","definitions":["marc"],"forms":{"plural":"borhoturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borhot","accusative-definite-nominative-singular":"borhotul","accusative-indefinite-nominative-plural":"borhoturi","accusative-definite-nominative-plural":"borhoturile","dative-genitive-indefinite-singular":"borhot","dative-definite-genitive-singular":"borhotului","dative-genitive-indefinite-plural":"borhoturi","dative-definite-genitive-plural":"borhoturilor","singular-vocative":"borhotule","plural-vocative":"borhoturilor"}},{"word":"bori","pos":"verb","definitions":["obsolete form of borî"],"forms":{"canonical":"a bori 4th conjugation","present-singular-third-person":"borește","participle-past":"borit","subjunctive-third-person":"borască","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bori","gerund":"borind","first-person-indicative-present-singular":"bor","indicative-present-second-person-singular":"bori","indicative-present-singular-third-person":"bore","first-person-indicative-plural-present":"borim","indicative-plural-present-second-person":"boriți","indicative-plural-present-third-person":"bor","first-person-imperfect-indicative-singular":"boream","imperfect-indicative-second-person-singular":"boreai","imperfect-indicative-singular-third-person":"borea","first-person-imperfect-indicative-plural":"boream","imperfect-indicative-plural-second-person":"boreați","imperfect-indicative-plural-third-person":"boreau","first-person-indicative-perfect-singular":"borii","indicative-perfect-second-person-singular":"boriși","indicative-perfect-singular-third-person":"bori","first-person-indicative-perfect-plural":"borirăm","indicative-perfect-plural-second-person":"borirăți","indicative-perfect-plural-third-person":"boriră","first-person-indicative-pluperfect-singular":"borisem","indicative-pluperfect-second-person-singular":"boriseși","indicative-pluperfect-singular-third-person":"borise","first-person-indicative-pluperfect-plural":"boriserăm","indicative-pluperfect-plural-second-person":"boriserăți","indicative-pluperfect-plural-third-person":"boriseră","first-person-present-singular-subjunctive":"să bor","present-second-person-singular-subjunctive":"să bori","present-singular-subjunctive-third-person":"să boră","first-person-plural-present-subjunctive":"să borim","plural-present-second-person-subjunctive":"să boriți","plural-present-subjunctive-third-person":"să boră","imperative-second-person-singular":"bore","imperative-plural-second-person":"boriți","imperative-negative-second-person-singular":"nu bori","imperative-negative-plural-second-person":"nu boriți"}},{"word":"borî","pos":"verb","definitions":["to vomit"],"pronunciation":"[boˈrɨ]","forms":{"canonical":"a borî 4th conjugation","present-singular-third-person":"borăște","participle-past":"borât","table-tags":"conjugation-4","inflection-template":"ro-conj-î-ăsc","infinitive":"a borî","gerund":"borând","first-person-indicative-present-singular":"borăsc","indicative-present-second-person-singular":"borăști","indicative-present-singular-third-person":"borăște","first-person-indicative-plural-present":"borâm","indicative-plural-present-second-person":"borâți","indicative-plural-present-third-person":"borăsc","first-person-imperfect-indicative-singular":"boram","imperfect-indicative-second-person-singular":"borai","imperfect-indicative-singular-third-person":"bora","first-person-imperfect-indicative-plural":"boram","imperfect-indicative-plural-second-person":"borați","imperfect-indicative-plural-third-person":"borau","first-person-indicative-perfect-singular":"borâi","indicative-perfect-second-person-singular":"borâși","indicative-perfect-singular-third-person":"borî","first-person-indicative-perfect-plural":"borârăm","indicative-perfect-plural-second-person":"borârăți","indicative-perfect-plural-third-person":"borâră","first-person-indicative-pluperfect-singular":"borâsem","indicative-pluperfect-second-person-singular":"borâseși","indicative-pluperfect-singular-third-person":"borâse","first-person-indicative-pluperfect-plural":"borâserăm","indicative-pluperfect-plural-second-person":"borâserăți","indicative-pluperfect-plural-third-person":"borâseră","first-person-present-singular-subjunctive":"să borăsc","present-second-person-singular-subjunctive":"să borăști","present-singular-subjunctive-third-person":"să borască","first-person-plural-present-subjunctive":"să borâm","plural-present-second-person-subjunctive":"să borâți","plural-present-subjunctive-third-person":"să borască","imperative-second-person-singular":"borăște","imperative-plural-second-person":"borâți","imperative-negative-second-person-singular":"nu borî","imperative-negative-plural-second-person":"nu borâți"}},{"word":"boric","pos":"adj","definitions":["boric"],"forms":{"feminine-singular":"borică","masculine-plural":"borici","feminine-neuter-plural":"borice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boric","error-unrecognized-form-feminine-indefinite-singular":"borică","error-unrecognized-form-indefinite-masculine-plural":"borici","error-unrecognized-form-feminine-indefinite-neuter-plural":"borice","definite-error-unrecognized-form-masculine-neuter-singular":"boricul","definite-error-unrecognized-form-feminine-singular":"borica","definite-error-unrecognized-form-masculine-plural":"boricii","definite-error-unrecognized-form-feminine-neuter-plural":"boricele"}},{"word":"boricat","pos":"adj","definitions":["boric"],"forms":{"feminine-singular":"boricată","masculine-plural":"boricați","feminine-neuter-plural":"boricate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boricat","error-unrecognized-form-feminine-indefinite-singular":"boricată","error-unrecognized-form-indefinite-masculine-plural":"boricați","error-unrecognized-form-feminine-indefinite-neuter-plural":"boricate","definite-error-unrecognized-form-masculine-neuter-singular":"boricatul","definite-error-unrecognized-form-feminine-singular":"boricata","definite-error-unrecognized-form-masculine-plural":"boricații","definite-error-unrecognized-form-feminine-neuter-plural":"boricatele"}},{"word":"Boriceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boriceanu"}},{"word":"Borisov","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Borisov"}},{"word":"borit","pos":"noun","definitions":["breeze"],"forms":{"plural":"borituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borit","accusative-definite-nominative-singular":"boritul","accusative-indefinite-nominative-plural":"borituri","accusative-definite-nominative-plural":"boriturile","dative-genitive-indefinite-singular":"borit","dative-definite-genitive-singular":"boritului","dative-genitive-indefinite-plural":"borituri","dative-definite-genitive-plural":"boriturilor","singular-vocative":"boritule","plural-vocative":"boriturilor"}},{"word":"borit","pos":"verb","definitions":["past participle of bori"],"forms":{"participle-past":"of bori"}},{"word":"Borla","pos":"name","definitions":["a village in Bocșa, Sălaj County, Romania"],"gender":"f"},{"word":"Borleasa","pos":"name","definitions":["a village in Târlișua, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Borlești","pos":"name","definitions":["a locality in Câmpeni, Alba County, Romania","a village in Merișani, Argeș County, Romania","a commune of Neamț County, Romania","a village in Borlești, Neamț County, Romania","a village in Pomi, Satu Mare County, Romania"],"gender":"m"},{"word":"Borlova","pos":"name","definitions":["a village in Turnu Ruieni, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Borlovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Borlovan"}},{"word":"Borloveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Borloveanu"}},{"word":"Borlovenii Noi","pos":"name","definitions":["a village in Prigor, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Borlovenii Vechi","pos":"name","definitions":["a village in Prigor, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Borlovița","pos":"name","definitions":["a river in Caraș-Severin County, Romania, tributary to the Borlova"],"gender":"f"},{"word":"bormașină","pos":"noun","definitions":["drill (tool)"],"forms":{"plural":"bormașini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bormașină","accusative-definite-nominative-singular":"bormașina","accusative-indefinite-nominative-plural":"bormașini","accusative-definite-nominative-plural":"bormașinile","dative-genitive-indefinite-singular":"bormașini","dative-definite-genitive-singular":"bormașinii","dative-genitive-indefinite-plural":"bormașini","dative-definite-genitive-plural":"bormașinilor","singular-vocative":"bormașină","plural-vocative":"bormașinilor"}},{"word":"borna","pos":"verb","definitions":["to put milestones or bollards"],"forms":{"canonical":"a borna 1st conjugation","present-singular-third-person":"bornează","participle-past":"bornat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a borna","gerund":"bornând","first-person-indicative-present-singular":"bornez","indicative-present-second-person-singular":"bornezi","indicative-present-singular-third-person":"bornează","first-person-indicative-plural-present":"bornăm","indicative-plural-present-second-person":"bornați","indicative-plural-present-third-person":"bornează","first-person-imperfect-indicative-singular":"bornam","imperfect-indicative-second-person-singular":"bornai","imperfect-indicative-singular-third-person":"borna","first-person-imperfect-indicative-plural":"bornam","imperfect-indicative-plural-second-person":"bornați","imperfect-indicative-plural-third-person":"bornau","first-person-indicative-perfect-singular":"bornai","indicative-perfect-second-person-singular":"bornași","indicative-perfect-singular-third-person":"bornă","first-person-indicative-perfect-plural":"bornarăm","indicative-perfect-plural-second-person":"bornarăți","indicative-perfect-plural-third-person":"bornară","first-person-indicative-pluperfect-singular":"bornasem","indicative-pluperfect-second-person-singular":"bornaseși","indicative-pluperfect-singular-third-person":"bornase","first-person-indicative-pluperfect-plural":"bornaserăm","indicative-pluperfect-plural-second-person":"bornaserăți","indicative-pluperfect-plural-third-person":"bornaseră","first-person-present-singular-subjunctive":"să bornez","present-second-person-singular-subjunctive":"să bornezi","present-singular-subjunctive-third-person":"să borneze","first-person-plural-present-subjunctive":"să bornăm","plural-present-second-person-subjunctive":"să bornați","plural-present-subjunctive-third-person":"să borneze","imperative-second-person-singular":"bornează","imperative-plural-second-person":"bornați","imperative-negative-second-person-singular":"nu borna","imperative-negative-plural-second-person":"nu bornați"}},{"word":"bornă","pos":"noun","definitions":["bollard"],"forms":{"plural":"borne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bornă","accusative-definite-nominative-singular":"borna","accusative-indefinite-nominative-plural":"borne","accusative-definite-nominative-plural":"bornele","dative-genitive-indefinite-singular":"borne","dative-definite-genitive-singular":"bornei","dative-genitive-indefinite-plural":"borne","dative-definite-genitive-plural":"bornelor","singular-vocative":"bornă","plural-vocative":"bornelor"}},{"word":"bornaj","pos":"noun","definitions":["putting milestones"],"forms":{"plural":"bornaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bornaj","accusative-definite-nominative-singular":"bornajul","accusative-indefinite-nominative-plural":"bornaje","accusative-definite-nominative-plural":"bornajele","dative-genitive-indefinite-singular":"bornaj","dative-definite-genitive-singular":"bornajului","dative-genitive-indefinite-plural":"bornaje","dative-definite-genitive-plural":"bornajelor","singular-vocative":"bornajule","plural-vocative":"bornajelor"}},{"word":"bornare","pos":"noun","definitions":["putting milestones"],"forms":{"plural":"bornări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bornare","accusative-definite-nominative-singular":"bornarea","accusative-indefinite-nominative-plural":"bornări","accusative-definite-nominative-plural":"bornările","dative-genitive-indefinite-singular":"bornări","dative-definite-genitive-singular":"bornării","dative-genitive-indefinite-plural":"bornări","dative-definite-genitive-plural":"bornărilor","singular-vocative":"bornare","plural-vocative":"bornărilor"}},{"word":"bornat","pos":"adj","definitions":["having milestones or bollards"],"forms":{"feminine-singular":"bornată","masculine-plural":"bornați","feminine-neuter-plural":"bornate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bornat","error-unrecognized-form-feminine-indefinite-singular":"bornată","error-unrecognized-form-indefinite-masculine-plural":"bornați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bornate","definite-error-unrecognized-form-masculine-neuter-singular":"bornatul","definite-error-unrecognized-form-feminine-singular":"bornata","definite-error-unrecognized-form-masculine-plural":"bornații","definite-error-unrecognized-form-feminine-neuter-plural":"bornatele"}},{"word":"bornat","pos":"verb","definitions":["past participle of borna"],"forms":{"participle-past":"of borna"}},{"word":"bornău","pos":"noun","definitions":["nose"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bornău","accusative-definite-nominative":"bornăul","dative-genitive-indefinite":"bornău","dative-definite-genitive":"bornăului","vocative":"bornăule"}},{"word":"borneol","pos":"noun","definitions":["borneol"],"forms":{"plural":"borneoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borneol","accusative-definite-nominative-singular":"borneolul","accusative-indefinite-nominative-plural":"borneoluri","accusative-definite-nominative-plural":"borneolurile","dative-genitive-indefinite-singular":"borneol","dative-definite-genitive-singular":"borneolului","dative-genitive-indefinite-plural":"borneoluri","dative-definite-genitive-plural":"borneolurilor","singular-vocative":"borneolule","plural-vocative":"borneolurilor"}},{"word":"borneu","pos":"noun","definitions":["haversack"],"forms":{"plural":"bornee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borneu","accusative-definite-nominative-singular":"borneuul","accusative-indefinite-nominative-plural":"bornee","accusative-definite-nominative-plural":"borneele","dative-genitive-indefinite-singular":"borneu","dative-definite-genitive-singular":"borneuului","dative-genitive-indefinite-plural":"bornee","dative-definite-genitive-plural":"borneelor","singular-vocative":"borneuule","plural-vocative":"borneelor"}},{"word":"Bornholm","pos":"name","definitions":["Bornholm (an island and municipality of Denmark in the Baltic Sea)"],"gender":"?"},{"word":"bornit","pos":"noun","definitions":["bornite"],"forms":{"plural":"borniți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bornit","accusative-definite-nominative-singular":"bornitul","accusative-indefinite-nominative-plural":"borniți","accusative-definite-nominative-plural":"borniții","dative-genitive-indefinite-singular":"bornit","dative-definite-genitive-singular":"bornitului","dative-genitive-indefinite-plural":"borniți","dative-definite-genitive-plural":"borniților","singular-vocative":"bornitule","plural-vocative":"borniților"}},{"word":"borniță","pos":"noun","definitions":["a hovel"],"forms":{"plural":"bornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borniță","accusative-definite-nominative-singular":"bornița","accusative-indefinite-nominative-plural":"bornițe","accusative-definite-nominative-plural":"bornițele","dative-genitive-indefinite-singular":"bornițe","dative-definite-genitive-singular":"borniței","dative-genitive-indefinite-plural":"bornițe","dative-definite-genitive-plural":"bornițelor","singular-vocative":"borniță","plural-vocative":"bornițelor"}},{"word":"bornut","pos":"noun","definitions":["snuff"],"forms":{"plural":"bornuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bornut","accusative-definite-nominative-singular":"bornutul","accusative-indefinite-nominative-plural":"bornuturi","accusative-definite-nominative-plural":"bornuturile","dative-genitive-indefinite-singular":"bornut","dative-definite-genitive-singular":"bornutului","dative-genitive-indefinite-plural":"bornuturi","dative-definite-genitive-plural":"bornuturilor","singular-vocative":"bornutule","plural-vocative":"bornuturilor"}},{"word":"boroacă","pos":"noun","definitions":["goby"],"forms":{"plural":"boroace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boroacă","accusative-definite-nominative-singular":"boroaca","accusative-indefinite-nominative-plural":"boroace","accusative-definite-nominative-plural":"boroacele","dative-genitive-indefinite-singular":"boroace","dative-definite-genitive-singular":"boroacei","dative-genitive-indefinite-plural":"boroace","dative-definite-genitive-plural":"boroacelor","singular-vocative":"boroacă","plural-vocative":"boroacelor"}},{"word":"boroacă","pos":"noun","definitions":["tumor, swelling"],"forms":{"plural":"boroace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boroacă","accusative-definite-nominative-singular":"boroaca","accusative-indefinite-nominative-plural":"boroace","accusative-definite-nominative-plural":"boroacele","dative-genitive-indefinite-singular":"boroace","dative-definite-genitive-singular":"boroacei","dative-genitive-indefinite-plural":"boroace","dative-definite-genitive-plural":"boroacelor","singular-vocative":"boroacă","plural-vocative":"boroacelor"}},{"word":"Boroaia","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Boroaia, Suceava County, Romania"],"gender":"f"},{"word":"boroană","pos":"noun","definitions":["harrow"],"forms":{"plural":"boroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boroană","accusative-definite-nominative-singular":"boroanăul","accusative-indefinite-nominative-plural":"boroane","accusative-definite-nominative-plural":"boroanele","dative-genitive-indefinite-singular":"boroană","dative-definite-genitive-singular":"boroanăului","dative-genitive-indefinite-plural":"boroane","dative-definite-genitive-plural":"boroanelor","singular-vocative":"boroanăule","plural-vocative":"boroanelor"}},{"word":"Borobănești","pos":"name","definitions":["a village in Valea Danului, Argeș County, Romania"],"gender":"m"},{"word":"boroboață","pos":"noun","definitions":["blunder"],"forms":{"plural":"boroboațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boroboață","accusative-definite-nominative-singular":"boroboața","accusative-indefinite-nominative-plural":"boroboațe","accusative-definite-nominative-plural":"boroboațele","dative-genitive-indefinite-singular":"boroboațe","dative-definite-genitive-singular":"boroboaței","dative-genitive-indefinite-plural":"boroboațe","dative-definite-genitive-plural":"boroboațelor","singular-vocative":"boroboață","plural-vocative":"boroboațelor"}},{"word":"borobotit","pos":"adj","definitions":["crowded"],"forms":{"feminine-singular":"borobotită","masculine-plural":"borobotiți","feminine-neuter-plural":"borobotite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borobotit","error-unrecognized-form-feminine-indefinite-singular":"borobotită","error-unrecognized-form-indefinite-masculine-plural":"borobotiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"borobotite","definite-error-unrecognized-form-masculine-neuter-singular":"borobotitul","definite-error-unrecognized-form-feminine-singular":"borobotita","definite-error-unrecognized-form-masculine-plural":"borobotiții","definite-error-unrecognized-form-feminine-neuter-plural":"borobotitele"}},{"word":"Borod","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Borod, Bihor County, Romania"],"gender":"m"},{"word":"Borodești","pos":"name","definitions":["a village in Pochidia, Vaslui County, Romania"],"gender":"m"},{"word":"Boroești","pos":"name","definitions":["a village in Bărăști, Olt County, Romania"],"gender":"m"},{"word":"Borogani","pos":"name","definitions":["a village in Borogani, Leova Raion, Moldova","a commune of Leova Raion, Moldova"],"gender":"m"},{"word":"Boroghină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boroghină"}},{"word":"Boroianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boroianu"}},{"word":"Boroleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boroleanu"}},{"word":"Boroș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Boroș"}},{"word":"Boroșan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boroșan"}},{"word":"Boroseni","pos":"name","definitions":["a village in Elizavetovca, Dondușeni Raion, Moldova"],"gender":"m"},{"word":"Boroșeni","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Șomuzul Mare"],"gender":"m"},{"word":"Borosenii Noi","pos":"name","definitions":["a village in Borosenii Noi, Rîșcani Raion, Moldova"],"gender":"m"},{"word":"Boroșești","pos":"name","definitions":["a village in Scânteia, Iași County, Romania","a village in Sutești, Vâlcea County, Romania"],"gender":"m"},{"word":"Boroșianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boroșianu"}},{"word":"boroslan","pos":"noun","definitions":["ivy","lilac"],"forms":{"plural":"boroslani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boroslan","accusative-definite-nominative-singular":"boroslanul","accusative-indefinite-nominative-plural":"boroslani","accusative-definite-nominative-plural":"boroslanii","dative-genitive-indefinite-singular":"boroslan","dative-definite-genitive-singular":"boroslanului","dative-genitive-indefinite-plural":"boroslani","dative-definite-genitive-plural":"boroslanilor","singular-vocative":"boroslanule","plural-vocative":"boroslanilor"}},{"word":"Boroșneu Mare","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Boroșneu Mare, Covasna County, Romania"],"gender":"m"},{"word":"Boroșneu Mic","pos":"name","definitions":["a village in Boroșneu Mare, Covasna County, Romania"],"gender":"m"},{"word":"Borosoaia","pos":"name","definitions":["a village in Plugari, Iași County, Romania"],"gender":"f"},{"word":"Boroșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boroșoiu"}},{"word":"boroștean","pos":"noun","definitions":["ivy","laurel","lilac"],"forms":{"plural":"boroșteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boroștean","accusative-definite-nominative-singular":"boroșteanul","accusative-indefinite-nominative-plural":"boroșteni","accusative-definite-nominative-plural":"boroștenii","dative-genitive-indefinite-singular":"boroștean","dative-definite-genitive-singular":"boroșteanului","dative-genitive-indefinite-plural":"boroșteni","dative-definite-genitive-plural":"boroștenilor","singular-vocative":"boroșteanule","plural-vocative":"boroștenilor"}},{"word":"Boroșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boroșteanu"}},{"word":"Boroșteni","pos":"name","definitions":["a village in Peștișani, Gorj County, Romania"],"gender":"m"},{"word":"borosuc","pos":"noun","definitions":["silk"],"forms":{"plural":"borosuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"borosuc","accusative-definite-nominative-singular":"borosucul","accusative-indefinite-nominative-plural":"borosuci","accusative-definite-nominative-plural":"borosucii","dative-genitive-indefinite-singular":"borosuc","dative-definite-genitive-singular":"borosucului","dative-genitive-indefinite-plural":"borosuci","dative-definite-genitive-plural":"borosucilor","singular-vocative":"borosucule","plural-vocative":"borosucilor"}},{"word":"Borovăț","pos":"name","definitions":["a forest in Mehedinți County, Romania"]},{"word":"Borovinești","pos":"name","definitions":["a village in Valea Iașului, Argeș County, Romania"],"gender":"m"},{"word":"Borozel","pos":"name","definitions":["a village in Borod, Bihor County, Romania"],"gender":"m"},{"word":"Borș","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Borș, Bihor County, Romania"],"gender":"m"},{"word":"borș","pos":"noun","definitions":["liquid fermented wheat or barley bran","soured soup","borscht","blood"],"forms":{"plural":"borșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borș","accusative-definite-nominative-singular":"borșul","accusative-indefinite-nominative-plural":"borșuri","accusative-definite-nominative-plural":"borșurile","dative-genitive-indefinite-singular":"borș","dative-definite-genitive-singular":"borșului","dative-genitive-indefinite-plural":"borșuri","dative-definite-genitive-plural":"borșurilor","singular-vocative":"borșule","plural-vocative":"borșurilor"}},{"word":"Borșa","pos":"name","definitions":["a village in Săcădat, Bihor County, Romania","a commune of Cluj County, Romania","a village in Borșa, Cluj County, Romania","a village in Vlădeni, Iași County, Romania","a town in Maramureș County, Romania"],"gender":"f"},{"word":"Borșa-Cătun","pos":"name","definitions":["a village in Borșa, Cluj County, Romania"],"gender":"m"},{"word":"Borșa-Crestaia","pos":"name","definitions":["a village in Borșa, Cluj County, Romania"],"gender":"f"},{"word":"Borșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Borșan"}},{"word":"Borșani","pos":"name","definitions":["a village in Coțofănești, Bacău County, Romania"],"gender":"m"},{"word":"Borșanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Borșanu"}},{"word":"Borsec","pos":"name","definitions":["a town in Harghita County, Romania"],"gender":"m"},{"word":"Borșeni","pos":"name","definitions":["a village in Războieni, Neamț County, Romania"],"gender":"m"},{"word":"borsetă","pos":"noun","definitions":["handbag (British), purse (US)"],"forms":{"plural":"borsete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borsetă","accusative-definite-nominative-singular":"borseta","accusative-indefinite-nominative-plural":"borsete","accusative-definite-nominative-plural":"borsetele","dative-genitive-indefinite-singular":"borsete","dative-definite-genitive-singular":"borsetei","dative-genitive-indefinite-plural":"borsete","dative-definite-genitive-plural":"borsetelor","singular-vocative":"borsetă","plural-vocative":"borsetelor"}},{"word":"borși","pos":"verb","definitions":["to ferment"],"forms":{"canonical":"a borși 4th conjugation","present-singular-third-person":"borșie","participle-past":"borșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a borși","gerund":"borșind","first-person-indicative-present-singular":"borș","indicative-present-second-person-singular":"borși","indicative-present-singular-third-person":"borșe","first-person-indicative-plural-present":"borșim","indicative-plural-present-second-person":"borșiți","indicative-plural-present-third-person":"borș","first-person-imperfect-indicative-singular":"borșeam","imperfect-indicative-second-person-singular":"borșeai","imperfect-indicative-singular-third-person":"borșea","first-person-imperfect-indicative-plural":"borșeam","imperfect-indicative-plural-second-person":"borșeați","imperfect-indicative-plural-third-person":"borșeau","first-person-indicative-perfect-singular":"borșii","indicative-perfect-second-person-singular":"borșiși","indicative-perfect-singular-third-person":"borși","first-person-indicative-perfect-plural":"borșirăm","indicative-perfect-plural-second-person":"borșirăți","indicative-perfect-plural-third-person":"borșiră","first-person-indicative-pluperfect-singular":"borșisem","indicative-pluperfect-second-person-singular":"borșiseși","indicative-pluperfect-singular-third-person":"borșise","first-person-indicative-pluperfect-plural":"borșiserăm","indicative-pluperfect-plural-second-person":"borșiserăți","indicative-pluperfect-plural-third-person":"borșiseră","first-person-present-singular-subjunctive":"să borș","present-second-person-singular-subjunctive":"să borși","present-singular-subjunctive-third-person":"să borșă","first-person-plural-present-subjunctive":"să borșim","plural-present-second-person-subjunctive":"să borșiți","plural-present-subjunctive-third-person":"să borșă","imperative-second-person-singular":"borșe","imperative-plural-second-person":"borșiți","imperative-negative-second-person-singular":"nu borși","imperative-negative-plural-second-person":"nu borșiți"}},{"word":"borșică","pos":"noun","definitions":["juniper"],"forms":{"plural":"borșici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"borșică","accusative-definite-nominative-singular":"borșica","accusative-indefinite-nominative-plural":"borșici","accusative-definite-nominative-plural":"borșicile","dative-genitive-indefinite-singular":"borșici","dative-definite-genitive-singular":"borșicii","dative-genitive-indefinite-plural":"borșici","dative-definite-genitive-plural":"borșicilor","singular-vocative":"borșică","plural-vocative":"borșicilor"}},{"word":"borșișor","pos":"noun","definitions":["Sempervivum marmoreum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"borșișor","accusative-definite-nominative":"borșișorul","dative-genitive-indefinite":"borșișor","dative-definite-genitive":"borșișorului","vocative":"borșișorule"}},{"word":"borșit","pos":"adj","definitions":["fermented"],"forms":{"feminine-singular":"borșită","masculine-plural":"borșiți","feminine-neuter-plural":"borșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borșit","error-unrecognized-form-feminine-indefinite-singular":"borșită","error-unrecognized-form-indefinite-masculine-plural":"borșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"borșite","definite-error-unrecognized-form-masculine-neuter-singular":"borșitul","definite-error-unrecognized-form-feminine-singular":"borșita","definite-error-unrecognized-form-masculine-plural":"borșiții","definite-error-unrecognized-form-feminine-neuter-plural":"borșitele"}},{"word":"borșit","pos":"verb","definitions":["past participle of borși"],"forms":{"participle-past":"of borși"}},{"word":"borț","pos":"noun","definitions":["belly of a pregnant woman"],"forms":{"plural":"borțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"borț","accusative-definite-nominative-singular":"borțul","accusative-indefinite-nominative-plural":"borțuri","accusative-definite-nominative-plural":"borțurile","dative-genitive-indefinite-singular":"borț","dative-definite-genitive-singular":"borțului","dative-genitive-indefinite-plural":"borțuri","dative-definite-genitive-plural":"borțurilor","singular-vocative":"borțule","plural-vocative":"borțurilor"}},{"word":"Borta","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borta"}},{"word":"borta","pos":"noun","definitions":["definite nominative/accusative singular of bortă"],"pronunciation":"[ˈborta]","gender":"f"},{"word":"Bortă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bortă"}},{"word":"bortă","pos":"noun","definitions":["hole, pit"],"pronunciation":"/ˈbor.tə/","forms":{"plural":"borte","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bortă","accusative-definite-nominative-singular":"borta","accusative-indefinite-nominative-plural":"borte","accusative-definite-nominative-plural":"bortele","dative-genitive-indefinite-singular":"borte","dative-definite-genitive-singular":"bortei","dative-genitive-indefinite-plural":"borte","dative-definite-genitive-plural":"bortelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Bortan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bortan"}},{"word":"Bortaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bortaș"}},{"word":"borte","pos":"noun","definitions":["inflection of bordă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈborte]","gender":"f"},{"word":"borteică","pos":"noun","definitions":["a small basket"],"forms":{"plural":"borteici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"borteică","accusative-definite-nominative-singular":"borteica","accusative-indefinite-nominative-plural":"borteici","accusative-definite-nominative-plural":"borteicile","dative-genitive-indefinite-singular":"borteici","dative-definite-genitive-singular":"borteicii","dative-genitive-indefinite-plural":"borteici","dative-definite-genitive-plural":"borteicilor","singular-vocative":"borteică","plural-vocative":"borteicilor"}},{"word":"bortelire","pos":"noun","definitions":["hole, piercing"],"forms":{"plural":"borteliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bortelire","accusative-definite-nominative-singular":"bortelirea","accusative-indefinite-nominative-plural":"borteliri","accusative-definite-nominative-plural":"bortelirile","dative-genitive-indefinite-singular":"borteliri","dative-definite-genitive-singular":"bortelirii","dative-genitive-indefinite-plural":"borteliri","dative-definite-genitive-plural":"bortelirilor","singular-vocative":"bortelire","plural-vocative":"bortelirilor"}},{"word":"bortelit","pos":"adj","definitions":["holed"],"forms":{"feminine-singular":"bortelită","masculine-plural":"borteliți","feminine-neuter-plural":"bortelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bortelit","error-unrecognized-form-feminine-indefinite-singular":"bortelită","error-unrecognized-form-indefinite-masculine-plural":"borteliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bortelite","definite-error-unrecognized-form-masculine-neuter-singular":"bortelitul","definite-error-unrecognized-form-feminine-singular":"bortelita","definite-error-unrecognized-form-masculine-plural":"borteliții","definite-error-unrecognized-form-feminine-neuter-plural":"bortelitele"}},{"word":"Bortică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bortică"}},{"word":"borticea","pos":"noun","definitions":["diminutive of bortă"],"forms":{"plural":"borticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"borticea","accusative-definite-nominative-singular":"borticeaua","accusative-indefinite-nominative-plural":"borticele","accusative-definite-nominative-plural":"borticelele","dative-genitive-indefinite-singular":"borticele","dative-definite-genitive-singular":"borticelei","dative-genitive-indefinite-plural":"borticele","dative-definite-genitive-plural":"borticelelor","singular-vocative":"borticea","plural-vocative":"borticelelor"}},{"word":"borticică","pos":"noun","definitions":["diminutive of bortă"],"forms":{"plural":"borticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borticică","accusative-definite-nominative-singular":"borticica","accusative-indefinite-nominative-plural":"borticele","accusative-definite-nominative-plural":"borticelele","dative-genitive-indefinite-singular":"borticele","dative-definite-genitive-singular":"borticelei","dative-genitive-indefinite-plural":"borticele","dative-definite-genitive-plural":"borticelelor","singular-vocative":"borticică","plural-vocative":"borticelelor"}},{"word":"bortire","pos":"noun","definitions":["perforation"],"forms":{"plural":"bortiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bortire","accusative-definite-nominative-singular":"bortirea","accusative-indefinite-nominative-plural":"bortiri","accusative-definite-nominative-plural":"bortirile","dative-genitive-indefinite-singular":"bortiri","dative-definite-genitive-singular":"bortirii","dative-genitive-indefinite-plural":"bortiri","dative-definite-genitive-plural":"bortirilor","singular-vocative":"bortire","plural-vocative":"bortirilor"}},{"word":"bortiță","pos":"noun","definitions":["diminutive of bortă"],"forms":{"plural":"bortițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bortiță","accusative-definite-nominative-singular":"bortița","accusative-indefinite-nominative-plural":"bortițe","accusative-definite-nominative-plural":"bortițele","dative-genitive-indefinite-singular":"bortițe","dative-definite-genitive-singular":"bortiței","dative-genitive-indefinite-plural":"bortițe","dative-definite-genitive-plural":"bortițelor","singular-vocative":"bortiță","plural-vocative":"bortițelor"}},{"word":"bortitură","pos":"noun","definitions":["a hole"],"forms":{"plural":"bortituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bortitură","accusative-definite-nominative-singular":"bortitura","accusative-indefinite-nominative-plural":"bortituri","accusative-definite-nominative-plural":"bortiturile","dative-genitive-indefinite-singular":"bortituri","dative-definite-genitive-singular":"bortiturii","dative-genitive-indefinite-plural":"bortituri","dative-definite-genitive-plural":"bortiturilor","singular-vocative":"bortitură","plural-vocative":"bortiturilor"}},{"word":"borțoasă","pos":"adj","definitions":["nominative/accusative feminine singular of borțos"],"pronunciation":"/borˈt͡so̯a.sə/"},{"word":"borțoasă","pos":"noun","definitions":["pregnant woman"],"pronunciation":"/borˈt͡so̯a.sə/","forms":{"plural":"borțoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"borțoasă","accusative-definite-nominative-singular":"borțoasa","accusative-indefinite-nominative-plural":"borțoase","accusative-definite-nominative-plural":"borțoasele","dative-genitive-indefinite-singular":"borțoase","dative-definite-genitive-singular":"borțoasei","dative-genitive-indefinite-plural":"borțoase","dative-definite-genitive-plural":"borțoaselor","singular-vocative":"borțoasă","plural-vocative":"borțoaselor"}},{"word":"bortos","pos":"adj","definitions":["obsolete form of burtos"],"forms":{"feminine-singular":"bortoasă","masculine-plural":"bortoși","feminine-neuter-plural":"bortoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bortos","error-unrecognized-form-feminine-indefinite-singular":"bortoasă","error-unrecognized-form-indefinite-masculine-plural":"bortoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bortoase","definite-error-unrecognized-form-masculine-neuter-singular":"bortosul","definite-error-unrecognized-form-feminine-singular":"bortoasa","definite-error-unrecognized-form-masculine-plural":"bortoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bortoasele"}},{"word":"borțos","pos":"adj","definitions":["potbellied","pregnant"],"pronunciation":"/borˈt͡sos/","forms":{"feminine-singular":"borțoasă","masculine-plural":"borțoși","feminine-neuter-plural":"borțoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borțos","error-unrecognized-form-feminine-indefinite-singular":"borțoasă","error-unrecognized-form-indefinite-masculine-plural":"borțoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"borțoase","definite-error-unrecognized-form-masculine-neuter-singular":"borțosul","definite-error-unrecognized-form-feminine-singular":"borțoasa","definite-error-unrecognized-form-masculine-plural":"borțoșii","definite-error-unrecognized-form-feminine-neuter-plural":"borțoasele"}},{"word":"borțoșel","pos":"adj","definitions":["diminutive of borțos"],"forms":{"feminine-singular":"borțoșelă","masculine-plural":"borțoșeli","feminine-neuter-plural":"borțoșele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borțoșel","error-unrecognized-form-feminine-indefinite-singular":"borțoșelă","error-unrecognized-form-indefinite-masculine-plural":"borțoșeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"borțoșele","definite-error-unrecognized-form-masculine-neuter-singular":"borțoșelul","definite-error-unrecognized-form-feminine-singular":"borțoșela","definite-error-unrecognized-form-masculine-plural":"borțoșelii","definite-error-unrecognized-form-feminine-neuter-plural":"borțoșelele"}},{"word":"Borțosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borțosu"}},{"word":"bortură","pos":"noun","definitions":["a hollow (sunken area in something solid, such as in the trunk of a tree)"],"forms":{"plural":"borturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bortură","accusative-definite-nominative-singular":"bortura","accusative-indefinite-nominative-plural":"borturi","accusative-definite-nominative-plural":"borturile","dative-genitive-indefinite-singular":"borturi","dative-definite-genitive-singular":"borturii","dative-genitive-indefinite-plural":"borturi","dative-definite-genitive-plural":"borturilor","singular-vocative":"bortură","plural-vocative":"borturilor"}},{"word":"borturos","pos":"adj","definitions":["hollow (about trees)"],"forms":{"feminine-singular":"borturoasă","masculine-plural":"borturoși","feminine-neuter-plural":"borturoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borturos","error-unrecognized-form-feminine-indefinite-singular":"borturoasă","error-unrecognized-form-indefinite-masculine-plural":"borturoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"borturoase","definite-error-unrecognized-form-masculine-neuter-singular":"borturosul","definite-error-unrecognized-form-feminine-singular":"borturoasa","definite-error-unrecognized-form-masculine-plural":"borturoșii","definite-error-unrecognized-form-feminine-neuter-plural":"borturoasele"}},{"word":"Boruga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boruga"}},{"word":"Borugă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Borugă"}},{"word":"Borugi","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Borumlaca","pos":"name","definitions":["a village in Suplacu de Barcău, Bihor County, Romania"],"gender":"f"},{"word":"Borungea","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Poenița and later merged into Petroșani."],"gender":"f"},{"word":"borură","pos":"noun","definitions":["boride"],"forms":{"plural":"boruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"borură","accusative-definite-nominative-singular":"borura","accusative-indefinite-nominative-plural":"boruri","accusative-definite-nominative-plural":"borurile","dative-genitive-indefinite-singular":"boruri","dative-definite-genitive-singular":"borurii","dative-genitive-indefinite-plural":"boruri","dative-definite-genitive-plural":"borurilor","singular-vocative":"borură","plural-vocative":"borurilor"}},{"word":"boruri","pos":"noun","definitions":["plural of bor"],"gender":"n"},{"word":"borus","pos":"noun","definitions":["sledgehammer"],"forms":{"plural":"boruse","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"borus","accusative-definite-nominative-singular":"borusul","accusative-indefinite-nominative-plural":"boruse","accusative-definite-nominative-plural":"borusele","dative-genitive-indefinite-singular":"borus","dative-definite-genitive-singular":"borusului","dative-genitive-indefinite-plural":"boruse","dative-definite-genitive-plural":"boruselor","singular-vocative":"borusule","plural-vocative":"boruselor"}},{"word":"Borviz","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Olt"],"gender":"m"},{"word":"borviz","pos":"noun","definitions":["mineral water"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"borviz","accusative-definite-nominative":"borvizul","dative-genitive-indefinite":"borviz","dative-definite-genitive":"borvizului","vocative":"borvizule"}},{"word":"Borvizu","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Jidanul","a river in Harghita, Romania, tributary to the Cașin"],"gender":"m"},{"word":"Borza","pos":"name","definitions":["a village in Creaca, Sălaj County, Romania"],"gender":"f"},{"word":"Borzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Borzescu"}},{"word":"Borzești","pos":"name","definitions":["a locality in Onești, Bacău County, Romania","a village in Ungureni, Botoșani County, Romania","a village in Iara, Cluj County, Romania"],"gender":"m"},{"word":"Borzontul Mare","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș"],"gender":"m"},{"word":"Borzontul Mic","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș"],"gender":"m"},{"word":"borzoș","pos":"adj","definitions":["ruffled"],"forms":{"feminine-singular":"borzoșă","masculine-plural":"borzoși","feminine-neuter-plural":"borzoșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"borzoș","error-unrecognized-form-feminine-indefinite-singular":"borzoșă","error-unrecognized-form-indefinite-masculine-plural":"borzoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"borzoșe","definite-error-unrecognized-form-masculine-neuter-singular":"borzoșul","definite-error-unrecognized-form-feminine-singular":"borzoșa","definite-error-unrecognized-form-masculine-plural":"borzoșii","definite-error-unrecognized-form-feminine-neuter-plural":"borzoșele"}},{"word":"bos","pos":"noun","definitions":["alternative form of boss"],"forms":{"plural":"boși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bos","accusative-definite-nominative-singular":"bosul","accusative-indefinite-nominative-plural":"boși","accusative-definite-nominative-plural":"boșii","dative-genitive-indefinite-singular":"bos","dative-definite-genitive-singular":"bosului","dative-genitive-indefinite-plural":"boși","dative-definite-genitive-plural":"boșilor","singular-vocative":"bosule","plural-vocative":"boșilor"}},{"word":"Boș","pos":"name","definitions":["a village in Hunedoara, Hunedoara County, Romania"],"gender":"m"},{"word":"boș","pos":"noun","definitions":["ball"],"pronunciation":"[boʃ]","forms":{"plural":"boașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boș","accusative-definite-nominative-singular":"boșul","accusative-indefinite-nominative-plural":"boașe","accusative-definite-nominative-plural":"boașele","dative-genitive-indefinite-singular":"boș","dative-definite-genitive-singular":"boșului","dative-genitive-indefinite-plural":"boașe","dative-definite-genitive-plural":"boașelor","singular-vocative":"boșule","plural-vocative":"boașelor","alternative":"boașă"}},{"word":"bosaj","pos":"noun","definitions":["bossage"],"forms":{"plural":"bosaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bosaj","accusative-definite-nominative-singular":"bosajul","accusative-indefinite-nominative-plural":"bosaje","accusative-definite-nominative-plural":"bosajele","dative-genitive-indefinite-singular":"bosaj","dative-definite-genitive-singular":"bosajului","dative-genitive-indefinite-plural":"bosaje","dative-definite-genitive-plural":"bosajelor","singular-vocative":"bosajule","plural-vocative":"bosajelor"}},{"word":"boșar","pos":"noun","definitions":["variety of melon"],"forms":{"plural":"boșari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boșar","accusative-definite-nominative-singular":"boșarul","accusative-indefinite-nominative-plural":"boșari","accusative-definite-nominative-plural":"boșarii","dative-genitive-indefinite-singular":"boșar","dative-definite-genitive-singular":"boșarului","dative-genitive-indefinite-plural":"boșari","dative-definite-genitive-plural":"boșarilor","singular-vocative":"boșarule","plural-vocative":"boșarilor"}},{"word":"boșcă","pos":"noun","definitions":["a small barrel"],"forms":{"plural":"boști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boșcă","accusative-definite-nominative-singular":"boșca","accusative-indefinite-nominative-plural":"boște","accusative-definite-nominative-plural":"boștele","dative-genitive-indefinite-singular":"boște","dative-definite-genitive-singular":"boștei","dative-genitive-indefinite-plural":"boște","dative-definite-genitive-plural":"boștelor","singular-vocative":"boșcă","plural-vocative":"boștelor"}},{"word":"boscăire","pos":"noun","definitions":["stammering"],"forms":{"plural":"boscăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boscăire","accusative-definite-nominative-singular":"boscăirea","accusative-indefinite-nominative-plural":"boscăiri","accusative-definite-nominative-plural":"boscăirile","dative-genitive-indefinite-singular":"boscăiri","dative-definite-genitive-singular":"boscăirii","dative-genitive-indefinite-plural":"boscăiri","dative-definite-genitive-plural":"boscăirilor","singular-vocative":"boscăire","plural-vocative":"boscăirilor"}},{"word":"boscăit","pos":"adj","definitions":["muttered"],"forms":{"feminine-singular":"boscăită","masculine-plural":"boscăiți","feminine-neuter-plural":"boscăite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boscăit","error-unrecognized-form-feminine-indefinite-singular":"boscăită","error-unrecognized-form-indefinite-masculine-plural":"boscăiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boscăite","definite-error-unrecognized-form-masculine-neuter-singular":"boscăitul","definite-error-unrecognized-form-feminine-singular":"boscăita","definite-error-unrecognized-form-masculine-plural":"boscăiții","definite-error-unrecognized-form-feminine-neuter-plural":"boscăitele"}},{"word":"boscăit","pos":"verb","definitions":["past participle of boscăi"],"forms":{"participle-past":"of boscăi"}},{"word":"Boșcana","pos":"name","definitions":["a village in Boșcana, Criuleni Raion, Moldova","a commune of Criuleni Raion, Moldova"],"gender":"f"},{"word":"boscar","pos":"noun","definitions":["conjurer, magician"],"forms":{"plural":"boscari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boscar","accusative-definite-nominative-singular":"boscarul","accusative-indefinite-nominative-plural":"boscari","accusative-definite-nominative-plural":"boscarii","dative-genitive-indefinite-singular":"boscar","dative-definite-genitive-singular":"boscarului","dative-genitive-indefinite-plural":"boscari","dative-definite-genitive-plural":"boscarilor","singular-vocative":"boscarule","plural-vocative":"boscarilor"}},{"word":"boscărie","pos":"noun","definitions":["magic trick"],"forms":{"plural":"boscării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"boscărie","accusative-definite-nominative-singular":"boscăria","accusative-indefinite-nominative-plural":"boscării","accusative-definite-nominative-plural":"boscăriile","dative-genitive-indefinite-singular":"boscării","dative-definite-genitive-singular":"boscăriei","dative-genitive-indefinite-plural":"boscării","dative-definite-genitive-plural":"boscăriilor","singular-vocative":"boscărie","plural-vocative":"boscăriilor"}},{"word":"boșcaș","pos":"noun","definitions":["groschen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"boșcaș","accusative-definite-nominative":"boșcașul","dative-genitive-indefinite":"boșcaș","dative-definite-genitive":"boșcașului","vocative":"boșcașule"}},{"word":"bosceluță","pos":"noun","definitions":["diminutive of boșcea"],"forms":{"plural":"bosceluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bosceluță","accusative-definite-nominative-singular":"bosceluța","accusative-indefinite-nominative-plural":"bosceluțe","accusative-definite-nominative-plural":"bosceluțele","dative-genitive-indefinite-singular":"bosceluțe","dative-definite-genitive-singular":"bosceluței","dative-genitive-indefinite-plural":"bosceluțe","dative-definite-genitive-plural":"bosceluțelor","singular-vocative":"bosceluță","plural-vocative":"bosceluțelor"}},{"word":"Boscencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Boscencu"}},{"word":"boschet","pos":"noun","definitions":["bosket, thicket"],"pronunciation":"/bosˈket/","forms":{"plural":"boschete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boschet","accusative-definite-nominative-singular":"boschetul","accusative-indefinite-nominative-plural":"boschete","accusative-definite-nominative-plural":"boschetele","dative-genitive-indefinite-singular":"boschet","dative-definite-genitive-singular":"boschetului","dative-genitive-indefinite-plural":"boschete","dative-definite-genitive-plural":"boschetelor","singular-vocative":"boschetule","plural-vocative":"boschetelor"}},{"word":"boschetar","pos":"noun","definitions":["hobo, homeless person"],"forms":{"plural":"boschetari","feminine":"equivalent boschetară","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boschetar","accusative-definite-nominative-singular":"boschetarul","accusative-indefinite-nominative-plural":"boschetari","accusative-definite-nominative-plural":"boschetarii","dative-genitive-indefinite-singular":"boschetar","dative-definite-genitive-singular":"boschetarului","dative-genitive-indefinite-plural":"boschetari","dative-definite-genitive-plural":"boschetarilor","singular-vocative":"boschetarule","plural-vocative":"boschetarilor"}},{"word":"boschetară","pos":"noun","definitions":["female equivalent of boschetar"],"forms":{"plural":"boschetare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boschetară","accusative-definite-nominative-singular":"boschetara","accusative-indefinite-nominative-plural":"boschetare","accusative-definite-nominative-plural":"boschetarele","dative-genitive-indefinite-singular":"boschetare","dative-definite-genitive-singular":"boschetarei","dative-genitive-indefinite-plural":"boschetare","dative-definite-genitive-plural":"boschetarelor","singular-vocative":"boschetară","plural-vocative":"boschetarelor"}},{"word":"boschetari","pos":"noun","definitions":["plural of boschetar"],"gender":"m-p"},{"word":"boschete","pos":"noun","definitions":["plural of boschet"],"gender":"m-p"},{"word":"boschină","pos":"noun","definitions":["grape pomace"],"forms":{"plural":"boschine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boschină","accusative-definite-nominative-singular":"boschina","accusative-indefinite-nominative-plural":"boschine","accusative-definite-nominative-plural":"boschinele","dative-genitive-indefinite-singular":"boschine","dative-definite-genitive-singular":"boschinei","dative-genitive-indefinite-plural":"boschine","dative-definite-genitive-plural":"boschinelor","singular-vocative":"boschină","plural-vocative":"boschinelor"}},{"word":"boscodire","pos":"noun","definitions":["planning"],"forms":{"plural":"boscodiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"boscodire","accusative-definite-nominative-singular":"boscodirea","accusative-indefinite-nominative-plural":"boscodiri","accusative-definite-nominative-plural":"boscodirile","dative-genitive-indefinite-singular":"boscodiri","dative-definite-genitive-singular":"boscodirii","dative-genitive-indefinite-plural":"boscodiri","dative-definite-genitive-plural":"boscodirilor","singular-vocative":"boscodire","plural-vocative":"boscodirilor"}},{"word":"boscodit","pos":"adj","definitions":["planned"],"forms":{"feminine-singular":"boscodită","masculine-plural":"boscodiți","feminine-neuter-plural":"boscodite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boscodit","error-unrecognized-form-feminine-indefinite-singular":"boscodită","error-unrecognized-form-indefinite-masculine-plural":"boscodiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boscodite","definite-error-unrecognized-form-masculine-neuter-singular":"boscoditul","definite-error-unrecognized-form-feminine-singular":"boscodita","definite-error-unrecognized-form-masculine-plural":"boscodiții","definite-error-unrecognized-form-feminine-neuter-plural":"boscoditele"}},{"word":"boscodit","pos":"verb","definitions":["past participle of boscodi"],"forms":{"participle-past":"of boscodi"}},{"word":"bosconiță","pos":"noun","definitions":["witch"],"forms":{"plural":"bosconițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bosconiță","accusative-definite-nominative-singular":"bosconița","accusative-indefinite-nominative-plural":"bosconițe","accusative-definite-nominative-plural":"bosconițele","dative-genitive-indefinite-singular":"bosconițe","dative-definite-genitive-singular":"bosconiței","dative-genitive-indefinite-plural":"bosconițe","dative-definite-genitive-plural":"bosconițelor","singular-vocative":"bosconiță","plural-vocative":"bosconițelor"}},{"word":"boscoroade","pos":"noun","definitions":["gobbledygook"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"boscoroade","accusative-definite-nominative":"boscoroadele","dative-genitive-indefinite":"boscoroade","dative-definite-genitive":"boscoroadelor","vocative":"-"}},{"word":"boscorodeală","pos":"noun","definitions":["muttering"],"forms":{"plural":"boscorodeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boscorodeală","accusative-definite-nominative-singular":"boscorodeala","accusative-indefinite-nominative-plural":"boscorodeli","accusative-definite-nominative-plural":"boscorodelile","dative-genitive-indefinite-singular":"boscorodeli","dative-definite-genitive-singular":"boscorodelii","dative-genitive-indefinite-plural":"boscorodeli","dative-definite-genitive-plural":"boscorodelilor","singular-vocative":"boscorodeală","plural-vocative":"boscorodelilor"}},{"word":"Boscoteni","pos":"name","definitions":["a village in Frumușica, Botoșani County, Romania"],"gender":"m"},{"word":"Bosfor","pos":"name","definitions":["Bosphorus"],"gender":"n"},{"word":"Bosia","pos":"name","definitions":["a village in Vultureni, Bacău County, Romania","a village in Ungheni, Iași County, Romania"],"gender":"f"},{"word":"Boșilcești","pos":"name","definitions":["a village in Telega, Prahova County, Romania"],"gender":"m"},{"word":"boșiman","pos":"noun","definitions":["Bushman"],"forms":{"plural":"boșimani","feminine":"equivalent boșimană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boșiman","accusative-definite-nominative-singular":"boșimanul","accusative-indefinite-nominative-plural":"boșimani","accusative-definite-nominative-plural":"boșimanii","dative-genitive-indefinite-singular":"boșiman","dative-definite-genitive-singular":"boșimanului","dative-genitive-indefinite-plural":"boșimani","dative-definite-genitive-plural":"boșimanilor","singular-vocative":"boșimanule","plural-vocative":"boșimanilor"}},{"word":"boșimană","pos":"noun","definitions":["female equivalent of boșiman"],"forms":{"plural":"boșimane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boșimană","accusative-definite-nominative-singular":"boșimana","accusative-indefinite-nominative-plural":"boșimane","accusative-definite-nominative-plural":"boșimanele","dative-genitive-indefinite-singular":"boșimane","dative-definite-genitive-singular":"boșimanei","dative-genitive-indefinite-plural":"boșimane","dative-definite-genitive-plural":"boșimanelor","singular-vocative":"boșimană","plural-vocative":"boșimanelor"}},{"word":"Bosînceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bosînceanu"}},{"word":"bosma","pos":"noun","definitions":["prank"],"forms":{"plural":"bosmale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"bosma","accusative-definite-nominative-singular":"bosmaua","accusative-indefinite-nominative-plural":"bosmale","accusative-definite-nominative-plural":"bosmalele","dative-genitive-indefinite-singular":"bosmale","dative-definite-genitive-singular":"bosmalei","dative-genitive-indefinite-plural":"bosmale","dative-definite-genitive-plural":"bosmalelor","singular-vocative":"bosma","plural-vocative":"bosmalelor"}},{"word":"bosnat","pos":"adj","definitions":["grumpy (about people)"],"forms":{"feminine-singular":"bosnată","masculine-plural":"bosnați","feminine-neuter-plural":"bosnate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bosnat","error-unrecognized-form-feminine-indefinite-singular":"bosnată","error-unrecognized-form-indefinite-masculine-plural":"bosnați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bosnate","definite-error-unrecognized-form-masculine-neuter-singular":"bosnatul","definite-error-unrecognized-form-feminine-singular":"bosnata","definite-error-unrecognized-form-masculine-plural":"bosnații","definite-error-unrecognized-form-feminine-neuter-plural":"bosnatele"}},{"word":"Boșneag","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Danube","a surname from Serbo-Croatian"],"gender":"m"},{"word":"Boșneagu","pos":"name","definitions":["a village in Dorobanțu, Călărași County, Romania","a surname"],"gender":"m"},{"word":"bosnean","pos":"adj","definitions":["obsolete form of bosniac"],"forms":{"feminine-singular":"bosneană","masculine-plural":"bosneni","feminine-neuter-plural":"bosnene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bosnean","error-unrecognized-form-feminine-indefinite-singular":"bosneană","error-unrecognized-form-indefinite-masculine-plural":"bosneni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bosnene","definite-error-unrecognized-form-masculine-neuter-singular":"bosneanul","definite-error-unrecognized-form-feminine-singular":"bosneana","definite-error-unrecognized-form-masculine-plural":"bosnenii","definite-error-unrecognized-form-feminine-neuter-plural":"bosnenele"}},{"word":"Boșnegeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boșnegeanu"}},{"word":"Bosnia și Herțegovina","pos":"name","definitions":["Bosnia and Herzegovina (a country on the Balkan Peninsula in Southeast Europe)"],"pronunciation":"/ˈbos.ni.a ʃi her.tse.ɡoˈvi.na/","gender":"f"},{"word":"bosniac","pos":"adj","definitions":["Bosnian"],"forms":{"feminine-singular":"bosniacă","masculine-plural":"bosniaci","feminine-neuter-plural":"bosniace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bosniac","error-unrecognized-form-feminine-indefinite-singular":"bosniacă","error-unrecognized-form-indefinite-masculine-plural":"bosniaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"bosniace","definite-error-unrecognized-form-masculine-neuter-singular":"bosniacul","definite-error-unrecognized-form-feminine-singular":"bosniaca","definite-error-unrecognized-form-masculine-plural":"bosniacii","definite-error-unrecognized-form-feminine-neuter-plural":"bosniacele"}},{"word":"bosniac","pos":"noun","definitions":["Bosnian"],"forms":{"plural":"bosniaci","feminine":"equivalent bosniacă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bosniac","accusative-definite-nominative-singular":"bosniacul","accusative-indefinite-nominative-plural":"bosniaci","accusative-definite-nominative-plural":"bosniacii","dative-genitive-indefinite-singular":"bosniac","dative-definite-genitive-singular":"bosniacului","dative-genitive-indefinite-plural":"bosniaci","dative-definite-genitive-plural":"bosniacilor","singular-vocative":"bosniacule","plural-vocative":"bosniacilor"}},{"word":"bosniacă","pos":"noun","definitions":["female equivalent of bosniac"],"forms":{"plural":"bosniace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bosniacă","accusative-definite-nominative-singular":"bosniaca","accusative-indefinite-nominative-plural":"bosniace","accusative-definite-nominative-plural":"bosniacele","dative-genitive-indefinite-singular":"bosniace","dative-definite-genitive-singular":"bosniacei","dative-genitive-indefinite-plural":"bosniace","dative-definite-genitive-plural":"bosniacelor","singular-vocative":"bosniacă","plural-vocative":"bosniacelor"}},{"word":"Bosoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bosoiu"}},{"word":"bosolire","pos":"noun","definitions":["cramming, stuffing"],"forms":{"plural":"bosoliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bosolire","accusative-definite-nominative-singular":"bosolirea","accusative-indefinite-nominative-plural":"bosoliri","accusative-definite-nominative-plural":"bosolirile","dative-genitive-indefinite-singular":"bosoliri","dative-definite-genitive-singular":"bosolirii","dative-genitive-indefinite-plural":"bosoliri","dative-definite-genitive-plural":"bosolirilor","singular-vocative":"bosolire","plural-vocative":"bosolirilor"}},{"word":"bosolit","pos":"adj","definitions":["cramped"],"forms":{"feminine-singular":"bosolită","masculine-plural":"bosoliți","feminine-neuter-plural":"bosolite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bosolit","error-unrecognized-form-feminine-indefinite-singular":"bosolită","error-unrecognized-form-indefinite-masculine-plural":"bosoliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bosolite","definite-error-unrecognized-form-masculine-neuter-singular":"bosolitul","definite-error-unrecognized-form-feminine-singular":"bosolita","definite-error-unrecognized-form-masculine-plural":"bosoliții","definite-error-unrecognized-form-feminine-neuter-plural":"bosolitele"}},{"word":"bosolit","pos":"verb","definitions":["past participle of bosoli"],"forms":{"participle-past":"of bosoli"}},{"word":"bosorcaie","pos":"noun","definitions":["witch"],"forms":{"plural":"bosorcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bosorcaie","accusative-definite-nominative-singular":"bosorcaiea","accusative-indefinite-nominative-plural":"bosorcăi","accusative-definite-nominative-plural":"bosorcăile","dative-genitive-indefinite-singular":"bosorcăi","dative-definite-genitive-singular":"bosorcăii","dative-genitive-indefinite-plural":"bosorcăi","dative-definite-genitive-plural":"bosorcăilor","singular-vocative":"bosorcaie","plural-vocative":"bosorcăilor"}},{"word":"bosorcoi","pos":"noun","definitions":["witch"],"forms":{"plural":"boscoroi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bosorcoi","accusative-definite-nominative-singular":"bosorcoiul","accusative-indefinite-nominative-plural":"boscoroi","accusative-definite-nominative-plural":"boscoroii","dative-genitive-indefinite-singular":"bosorcoi","dative-definite-genitive-singular":"bosorcoiului","dative-genitive-indefinite-plural":"boscoroi","dative-definite-genitive-plural":"boscoroilor","singular-vocative":"bosorcoiule","plural-vocative":"boscoroilor"}},{"word":"boșoroagă","pos":"noun","definitions":["female equivalent of boșorog"],"forms":{"plural":"boșoroage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boșoroagă","accusative-definite-nominative-singular":"boșoroaga","accusative-indefinite-nominative-plural":"boșoroage","accusative-definite-nominative-plural":"boșoroagele","dative-genitive-indefinite-singular":"boșoroage","dative-definite-genitive-singular":"boșoroagei","dative-genitive-indefinite-plural":"boșoroage","dative-definite-genitive-plural":"boșoroagelor","singular-vocative":"boșoroagă","plural-vocative":"boșoroagelor"}},{"word":"boșorog","pos":"adj","definitions":["suffering from a hernia","old, aged, decrepit"],"pronunciation":"/bo.ʃoˈroɡ/","forms":{"feminine-singular":"boșoroagă","masculine-plural":"boșorogi","feminine-neuter-plural":"boșoroage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boșorog","error-unrecognized-form-feminine-indefinite-singular":"boșoroagă","error-unrecognized-form-indefinite-masculine-plural":"boșorogi","error-unrecognized-form-feminine-indefinite-neuter-plural":"boșoroage","definite-error-unrecognized-form-masculine-neuter-singular":"boșorogul","definite-error-unrecognized-form-feminine-singular":"boșoroaga","definite-error-unrecognized-form-masculine-plural":"boșorogii","definite-error-unrecognized-form-feminine-neuter-plural":"boșoroagele"}},{"word":"boșorog","pos":"noun","definitions":["person suffering from a hernia","an old or decrepit person"],"pronunciation":"/bo.ʃoˈroɡ/","forms":{"plural":"boșorogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boșorog","accusative-definite-nominative-singular":"boșorogul","accusative-indefinite-nominative-plural":"boșorogi","accusative-definite-nominative-plural":"boșorogii","dative-genitive-indefinite-singular":"boșorog","dative-definite-genitive-singular":"boșorogului","dative-genitive-indefinite-plural":"boșorogi","dative-definite-genitive-plural":"boșorogilor","singular-vocative":"boșorogule","plural-vocative":"boșorogilor"}},{"word":"boșorogeală","pos":"noun","definitions":["decrepitude"],"forms":{"plural":"boșorogeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boșorogeală","accusative-definite-nominative-singular":"boșorogeala","accusative-indefinite-nominative-plural":"boșorogeli","accusative-definite-nominative-plural":"boșorogelile","dative-genitive-indefinite-singular":"boșorogeli","dative-definite-genitive-singular":"boșorogelii","dative-genitive-indefinite-plural":"boșorogeli","dative-definite-genitive-plural":"boșorogelilor","singular-vocative":"boșorogeală","plural-vocative":"boșorogelilor"}},{"word":"boșorogi","pos":"verb","definitions":["to herniate"],"forms":{"canonical":"a boșorogi 4th conjugation","present-singular-third-person":"boșorogește","participle-past":"boșorogit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boșorogi","gerund":"boșorogind","first-person-indicative-present-singular":"boșorogesc","indicative-present-second-person-singular":"boșorogești","indicative-present-singular-third-person":"boșorogește","first-person-indicative-plural-present":"boșorogim","indicative-plural-present-second-person":"boșorogiți","indicative-plural-present-third-person":"boșorogesc","first-person-imperfect-indicative-singular":"boșorogeam","imperfect-indicative-second-person-singular":"boșorogeai","imperfect-indicative-singular-third-person":"boșorogea","first-person-imperfect-indicative-plural":"boșorogeam","imperfect-indicative-plural-second-person":"boșorogeați","imperfect-indicative-plural-third-person":"boșorogeau","first-person-indicative-perfect-singular":"boșorogii","indicative-perfect-second-person-singular":"boșorogiși","indicative-perfect-singular-third-person":"boșorogi","first-person-indicative-perfect-plural":"boșorogirăm","indicative-perfect-plural-second-person":"boșorogirăți","indicative-perfect-plural-third-person":"boșorogiră","first-person-indicative-pluperfect-singular":"boșorogisem","indicative-pluperfect-second-person-singular":"boșorogiseși","indicative-pluperfect-singular-third-person":"boșorogise","first-person-indicative-pluperfect-plural":"boșorogiserăm","indicative-pluperfect-plural-second-person":"boșorogiserăți","indicative-pluperfect-plural-third-person":"boșorogiseră","first-person-present-singular-subjunctive":"să boșorogesc","present-second-person-singular-subjunctive":"să boșorogești","present-singular-subjunctive-third-person":"să boșorogească","first-person-plural-present-subjunctive":"să boșorogim","plural-present-second-person-subjunctive":"să boșorogiți","plural-present-subjunctive-third-person":"să boșorogească","imperative-second-person-singular":"boșorogește","imperative-plural-second-person":"boșorogiți","imperative-negative-second-person-singular":"nu boșorogi","imperative-negative-plural-second-person":"nu boșorogiți"}},{"word":"Boșoteni","pos":"name","definitions":["a village in Berești-Tazlău, Bacău County, Romania"],"gender":"m"},{"word":"boss","pos":"noun","definitions":["boss"],"pronunciation":"/bos/","forms":{"plural":"boși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boss","accusative-definite-nominative-singular":"bossul","accusative-indefinite-nominative-plural":"boși","accusative-definite-nominative-plural":"boșii","dative-genitive-indefinite-singular":"boss","dative-definite-genitive-singular":"bossului","dative-genitive-indefinite-plural":"boși","dative-definite-genitive-plural":"boșilor","singular-vocative":"bossule","plural-vocative":"boșilor"}},{"word":"bossism","pos":"noun","definitions":["bossism"],"forms":{"plural":"bossisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bossism","accusative-definite-nominative-singular":"bossismul","accusative-indefinite-nominative-plural":"bossisme","accusative-definite-nominative-plural":"bossismele","dative-genitive-indefinite-singular":"bossism","dative-definite-genitive-singular":"bossismului","dative-genitive-indefinite-plural":"bossisme","dative-definite-genitive-plural":"bossismelor","singular-vocative":"bossismule","plural-vocative":"bossismelor"}},{"word":"Bostan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bostan"}},{"word":"bostan","pos":"noun","definitions":["pumpkin","watermelon"],"forms":{"plural":"bostani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bostan","accusative-definite-nominative-singular":"bostanul","accusative-indefinite-nominative-plural":"bostani","accusative-definite-nominative-plural":"bostanii","dative-genitive-indefinite-singular":"bostan","dative-definite-genitive-singular":"bostanului","dative-genitive-indefinite-plural":"bostani","dative-definite-genitive-plural":"bostanilor","singular-vocative":"bostanule","plural-vocative":"bostanilor"}},{"word":"bostană","pos":"noun","definitions":["watermelon field"],"forms":{"plural":"bostane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bostană","accusative-definite-nominative-singular":"bostana","accusative-indefinite-nominative-plural":"bostane","accusative-definite-nominative-plural":"bostanele","dative-genitive-indefinite-singular":"bostane","dative-definite-genitive-singular":"bostanei","dative-genitive-indefinite-plural":"bostane","dative-definite-genitive-plural":"bostanelor","singular-vocative":"bostană","plural-vocative":"bostanelor"}},{"word":"bostănar","pos":"noun","definitions":["watermelon grower"],"forms":{"plural":"bostănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bostănar","accusative-definite-nominative-singular":"bostănarul","accusative-indefinite-nominative-plural":"bostănari","accusative-definite-nominative-plural":"bostănarii","dative-genitive-indefinite-singular":"bostănar","dative-definite-genitive-singular":"bostănarului","dative-genitive-indefinite-plural":"bostănari","dative-definite-genitive-plural":"bostănarilor","singular-vocative":"bostănarule","plural-vocative":"bostănarilor"}},{"word":"bostănărie","pos":"noun","definitions":["melon field"],"forms":{"plural":"bostănării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bostănărie","accusative-definite-nominative-singular":"bostănăria","accusative-indefinite-nominative-plural":"bostănării","accusative-definite-nominative-plural":"bostănăriile","dative-genitive-indefinite-singular":"bostănării","dative-definite-genitive-singular":"bostănăriei","dative-genitive-indefinite-plural":"bostănării","dative-definite-genitive-plural":"bostănăriilor","singular-vocative":"bostănărie","plural-vocative":"bostănăriilor"}},{"word":"Bostănaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bostănaru"}},{"word":"bostănaș","pos":"noun","definitions":["diminutive of bostan"],"forms":{"plural":"bostănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bostănaș","accusative-definite-nominative-singular":"bostănașul","accusative-indefinite-nominative-plural":"bostănași","accusative-definite-nominative-plural":"bostănașii","dative-genitive-indefinite-singular":"bostănaș","dative-definite-genitive-singular":"bostănașului","dative-genitive-indefinite-plural":"bostănași","dative-definite-genitive-plural":"bostănașilor","singular-vocative":"bostănașule","plural-vocative":"bostănașilor"}},{"word":"bostănel","pos":"noun","definitions":["diminutive of bostan; small pumpkin"],"forms":{"plural":"bostănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bostănel","accusative-definite-nominative-singular":"bostănelul","accusative-indefinite-nominative-plural":"bostăneli","accusative-definite-nominative-plural":"bostănelii","dative-genitive-indefinite-singular":"bostănel","dative-definite-genitive-singular":"bostănelului","dative-genitive-indefinite-plural":"bostăneli","dative-definite-genitive-plural":"bostănelilor","singular-vocative":"bostănelule","plural-vocative":"bostănelilor"}},{"word":"Bostănești","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania"],"gender":"m"},{"word":"Bostangiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bostangiu"}},{"word":"bostangiu","pos":"noun","definitions":["bostanji"],"forms":{"plural":"bostangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bostangiu","accusative-definite-nominative-singular":"bostangiul","accusative-indefinite-nominative-plural":"bostangii","accusative-definite-nominative-plural":"bostangiii","dative-genitive-indefinite-singular":"bostangiu","dative-definite-genitive-singular":"bostangiului","dative-genitive-indefinite-plural":"bostangii","dative-definite-genitive-plural":"bostangiilor","singular-vocative":"bostangiule","plural-vocative":"bostangiilor"}},{"word":"bostănoasă","pos":"noun","definitions":["Cucurbitaceae"],"forms":{"plural":"bostănoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bostănoasă","accusative-definite-nominative-singular":"bostănoasa","accusative-indefinite-nominative-plural":"bostănoase","accusative-definite-nominative-plural":"bostănoasele","dative-genitive-indefinite-singular":"bostănoase","dative-definite-genitive-singular":"bostănoasei","dative-genitive-indefinite-plural":"bostănoase","dative-definite-genitive-plural":"bostănoaselor","singular-vocative":"bostănoasă","plural-vocative":"bostănoaselor"}},{"word":"Boșteni","pos":"name","definitions":["a locality in Pașcani, Iași County, Romania"],"gender":"m"},{"word":"Boștină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boștină"}},{"word":"boștină","pos":"noun","definitions":["honeycomb leftovers","marc"],"forms":{"plural":"boștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boștină","accusative-definite-nominative-singular":"boștina","accusative-indefinite-nominative-plural":"boștine","accusative-definite-nominative-plural":"boștinele","dative-genitive-indefinite-singular":"boștine","dative-definite-genitive-singular":"boștinei","dative-genitive-indefinite-plural":"boștine","dative-definite-genitive-plural":"boștinelor","singular-vocative":"boștină","plural-vocative":"boștinelor"}},{"word":"Boștinaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Boștinaru"}},{"word":"Bosuioc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bosuioc"}},{"word":"bosuioc","pos":"noun","definitions":["alternative form of busuioc"],"forms":{"plural":"bosuioace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bosuioc","accusative-definite-nominative-singular":"bosuiocul","accusative-indefinite-nominative-plural":"bosuioace","accusative-definite-nominative-plural":"bosuioacele","dative-genitive-indefinite-singular":"bosuioc","dative-definite-genitive-singular":"bosuiocului","dative-genitive-indefinite-plural":"bosuioace","dative-definite-genitive-plural":"bosuioacelor","singular-vocative":"bosuiocule","plural-vocative":"bosuioacelor"}},{"word":"boșul","pos":"noun","definitions":["definite nominative/accusative singular of boș"],"pronunciation":"[ˈboʃul]","gender":"n"},{"word":"boșului","pos":"noun","definitions":["definite genitive/dative singular of boș"],"pronunciation":"[ˈboʃuluj]","gender":"n"},{"word":"bosumfla","pos":"verb","definitions":["to sulk, pout"],"pronunciation":"/bo.sumˈfla/","forms":{"canonical":"a bosumfla 1st conjugation","present-singular-third-person":"bosumflă","participle-past":"bosumfla","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bosumfla","gerund":"bosumflând","first-person-indicative-present-singular":"bosumflu","indicative-present-second-person-singular":"bosumfli","indicative-present-singular-third-person":"bosumflă","first-person-indicative-plural-present":"bosumflăm","indicative-plural-present-second-person":"bosumflați","indicative-plural-present-third-person":"bosumflă","first-person-imperfect-indicative-singular":"bosumflam","imperfect-indicative-second-person-singular":"bosumflai","imperfect-indicative-singular-third-person":"bosumfla","first-person-imperfect-indicative-plural":"bosumflam","imperfect-indicative-plural-second-person":"bosumflați","imperfect-indicative-plural-third-person":"bosumflau","first-person-indicative-perfect-singular":"bosumflai","indicative-perfect-second-person-singular":"bosumflași","indicative-perfect-singular-third-person":"bosumflă","first-person-indicative-perfect-plural":"bosumflarăm","indicative-perfect-plural-second-person":"bosumflarăți","indicative-perfect-plural-third-person":"bosumflară","first-person-indicative-pluperfect-singular":"bosumflasem","indicative-pluperfect-second-person-singular":"bosumflaseși","indicative-pluperfect-singular-third-person":"bosumflase","first-person-indicative-pluperfect-plural":"bosumflaserăm","indicative-pluperfect-plural-second-person":"bosumflaserăți","indicative-pluperfect-plural-third-person":"bosumflaseră","first-person-present-singular-subjunctive":"să bosumflu","present-second-person-singular-subjunctive":"să bosumfli","present-singular-subjunctive-third-person":"să bosumfle","first-person-plural-present-subjunctive":"să bosumflăm","plural-present-second-person-subjunctive":"să bosumflați","plural-present-subjunctive-third-person":"să bosumfle","imperative-second-person-singular":"bosumflă","imperative-plural-second-person":"bosumflați","imperative-negative-second-person-singular":"nu bosumfla","imperative-negative-plural-second-person":"nu bosumflați"}},{"word":"bosumflare","pos":"noun","definitions":["pout"],"forms":{"plural":"bosumflări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bosumflare","accusative-definite-nominative-singular":"bosumflarea","accusative-indefinite-nominative-plural":"bosumflări","accusative-definite-nominative-plural":"bosumflările","dative-genitive-indefinite-singular":"bosumflări","dative-definite-genitive-singular":"bosumflării","dative-genitive-indefinite-plural":"bosumflări","dative-definite-genitive-plural":"bosumflărilor","singular-vocative":"bosumflare","plural-vocative":"bosumflărilor"}},{"word":"bosumflat","pos":"adj","definitions":["grouched, grouchy, miffed, petulant"],"pronunciation":"/bo.sumˈflat/","forms":{"feminine-singular":"bosumflată","masculine-plural":"bosumflați","feminine-neuter-plural":"bosumflate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bosumflat","error-unrecognized-form-feminine-indefinite-singular":"bosumflată","error-unrecognized-form-indefinite-masculine-plural":"bosumflați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bosumflate","definite-error-unrecognized-form-masculine-neuter-singular":"bosumflatul","definite-error-unrecognized-form-feminine-singular":"bosumflata","definite-error-unrecognized-form-masculine-plural":"bosumflații","definite-error-unrecognized-form-feminine-neuter-plural":"bosumflatele"}},{"word":"Bot","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bot"}},{"word":"bot","pos":"noun","definitions":["snout, mouth","mouth","bump","hump","blowjob"],"pronunciation":"/bot/","forms":{"plural":"boturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bot","accusative-definite-nominative-singular":"botul","accusative-indefinite-nominative-plural":"boturi","accusative-definite-nominative-plural":"boturile","dative-genitive-indefinite-singular":"bot","dative-definite-genitive-singular":"botului","dative-genitive-indefinite-plural":"boturi","dative-definite-genitive-plural":"boturilor","singular-vocative":"botule","plural-vocative":"boturilor","alternative":"бот"}},{"word":"bot","pos":"noun","definitions":["bot"],"pronunciation":"/bot/","forms":{"plural":"boți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bot","accusative-definite-nominative-singular":"botul","accusative-indefinite-nominative-plural":"boți","accusative-definite-nominative-plural":"boții","dative-genitive-indefinite-singular":"bot","dative-definite-genitive-singular":"botului","dative-genitive-indefinite-plural":"boți","dative-definite-genitive-plural":"boților","singular-vocative":"botule","plural-vocative":"boților","alternative":"бот"}},{"word":"Bota","pos":"name","definitions":["a village in Ungureni, Bacău County, Romania"],"gender":"f"},{"word":"botă","pos":"noun","definitions":["club, cudgel"],"forms":{"plural":"bote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botă","accusative-definite-nominative-singular":"bota","accusative-indefinite-nominative-plural":"bote","accusative-definite-nominative-plural":"botele","dative-genitive-indefinite-singular":"bote","dative-definite-genitive-singular":"botei","dative-genitive-indefinite-plural":"bote","dative-definite-genitive-plural":"botelor","singular-vocative":"botă","plural-vocative":"botelor"}},{"word":"botâncă","pos":"noun","definitions":["French marigold (Tagetes patula)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"botâncă","accusative-definite-nominative":"botânca","dative-genitive-indefinite":"botânce","dative-definite-genitive":"botâncei","vocative":"botâncă","alternative":"botîncă"}},{"word":"botanic","pos":"adj","definitions":["botanical, botanic"],"pronunciation":"/boˈta.nik/","forms":{"feminine-singular":"botanică","masculine-plural":"botanici","feminine-neuter-plural":"botanice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"botanic","error-unrecognized-form-feminine-indefinite-singular":"botanică","error-unrecognized-form-indefinite-masculine-plural":"botanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"botanice","definite-error-unrecognized-form-masculine-neuter-singular":"botanicul","definite-error-unrecognized-form-feminine-singular":"botanica","definite-error-unrecognized-form-masculine-plural":"botanicii","definite-error-unrecognized-form-feminine-neuter-plural":"botanicele"}},{"word":"botanica","pos":"noun","definitions":["definite nominative/accusative singular of botanică"],"pronunciation":"[boˈtanika]","gender":"f"},{"word":"botanică","pos":"noun","definitions":["botany (scientific study of plants)"],"pronunciation":"/boˈta.ni.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"botanică","accusative-definite-nominative":"botanica","dative-genitive-indefinite":"botanici","dative-definite-genitive":"botanicii","vocative":"botanică"}},{"word":"botanică","pos":"adj","definitions":["nominative/accusative feminine singular of botanic"],"pronunciation":"/boˈta.ni.kə/"},{"word":"botanici","pos":"noun","definitions":["indefinite genitive/dative singular of botanică"],"pronunciation":"[boˈtanit͡ʃʲ]","gender":"f"},{"word":"botanico","pos":"noun","definitions":["vocative singular of botanică"],"pronunciation":"[boˈtaniko]","gender":"f"},{"word":"botanist","pos":"noun","definitions":["botanist"],"pronunciation":"/bo.taˈnist/","forms":{"plural":"botaniști","feminine":"equivalent botanistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botanist","accusative-definite-nominative-singular":"botanista","accusative-indefinite-nominative-plural":"botaniști","accusative-definite-nominative-plural":"botaniștii","dative-genitive-indefinite-singular":"botanist","dative-definite-genitive-singular":"botanistaui","dative-genitive-indefinite-plural":"botaniști","dative-definite-genitive-plural":"botaniștilor","singular-vocative":"botanistae","plural-vocative":"botaniștilor"}},{"word":"botanista","pos":"noun","definitions":["definite nominative/accusative singular of botanistă"]},{"word":"botanistă","pos":"noun","definitions":["female equivalent of botanist"],"pronunciation":"/bo.taˈnis.tə/","forms":{"plural":"botaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"botanistă","accusative-definite-nominative-singular":"botanista","accusative-indefinite-nominative-plural":"botaniste","accusative-definite-nominative-plural":"botanistele","dative-genitive-indefinite-singular":"botaniste","dative-definite-genitive-singular":"botanistei","dative-genitive-indefinite-plural":"botaniste","dative-definite-genitive-plural":"botanistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"botaniste","pos":"noun","definitions":["plural of botanistă"],"gender":"f"},{"word":"botaniști","pos":"noun","definitions":["plural of botanist"],"gender":"m"},{"word":"botaniza","pos":"verb","definitions":["to botanize"],"forms":{"canonical":"a botaniza 1st conjugation","present-singular-third-person":"botanizează","participle-past":"botanizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a botaniza","gerund":"botanizând","first-person-indicative-present-singular":"botanizez","indicative-present-second-person-singular":"botanizezi","indicative-present-singular-third-person":"botanizează","first-person-indicative-plural-present":"botanizăm","indicative-plural-present-second-person":"botanizați","indicative-plural-present-third-person":"botanizează","first-person-imperfect-indicative-singular":"botanizam","imperfect-indicative-second-person-singular":"botanizai","imperfect-indicative-singular-third-person":"botaniza","first-person-imperfect-indicative-plural":"botanizam","imperfect-indicative-plural-second-person":"botanizați","imperfect-indicative-plural-third-person":"botanizau","first-person-indicative-perfect-singular":"botanizai","indicative-perfect-second-person-singular":"botanizași","indicative-perfect-singular-third-person":"botaniză","first-person-indicative-perfect-plural":"botanizarăm","indicative-perfect-plural-second-person":"botanizarăți","indicative-perfect-plural-third-person":"botanizară","first-person-indicative-pluperfect-singular":"botanizasem","indicative-pluperfect-second-person-singular":"botanizaseși","indicative-pluperfect-singular-third-person":"botanizase","first-person-indicative-pluperfect-plural":"botanizaserăm","indicative-pluperfect-plural-second-person":"botanizaserăți","indicative-pluperfect-plural-third-person":"botanizaseră","first-person-present-singular-subjunctive":"să botanizez","present-second-person-singular-subjunctive":"să botanizezi","present-singular-subjunctive-third-person":"să botanizeze","first-person-plural-present-subjunctive":"să botanizăm","plural-present-second-person-subjunctive":"să botanizați","plural-present-subjunctive-third-person":"să botanizeze","imperative-second-person-singular":"botanizează","imperative-plural-second-person":"botanizați","imperative-negative-second-person-singular":"nu botaniza","imperative-negative-plural-second-person":"nu botanizați"}},{"word":"botanizare","pos":"noun","definitions":["botanizing"],"forms":{"plural":"botanizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"botanizare","accusative-definite-nominative-singular":"botanizarea","accusative-indefinite-nominative-plural":"botanizări","accusative-definite-nominative-plural":"botanizările","dative-genitive-indefinite-singular":"botanizări","dative-definite-genitive-singular":"botanizării","dative-genitive-indefinite-plural":"botanizări","dative-definite-genitive-plural":"botanizărilor","singular-vocative":"botanizare","plural-vocative":"botanizărilor"}},{"word":"botanizat","pos":"adj","definitions":["botanized"],"forms":{"feminine-singular":"botanizată","masculine-plural":"botanizați","feminine-neuter-plural":"botanizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botanizat","error-unrecognized-form-feminine-indefinite-singular":"botanizată","error-unrecognized-form-indefinite-masculine-plural":"botanizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"botanizate","definite-error-unrecognized-form-masculine-neuter-singular":"botanizatul","definite-error-unrecognized-form-feminine-singular":"botanizata","definite-error-unrecognized-form-masculine-plural":"botanizații","definite-error-unrecognized-form-feminine-neuter-plural":"botanizatele"}},{"word":"botanizat","pos":"verb","definitions":["past participle of botaniza"],"forms":{"participle-past":"of botaniza"}},{"word":"Botar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Botar"}},{"word":"botar","pos":"noun","definitions":["barrelmaker"],"forms":{"plural":"botari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botar","accusative-definite-nominative-singular":"botarul","accusative-indefinite-nominative-plural":"botari","accusative-definite-nominative-plural":"botarii","dative-genitive-indefinite-singular":"botar","dative-definite-genitive-singular":"botarului","dative-genitive-indefinite-plural":"botari","dative-definite-genitive-plural":"botarilor","singular-vocative":"botarule","plural-vocative":"botarilor"}},{"word":"Boțârcani","pos":"name","definitions":["a village in Topoloveni, Argeș County, Romania"],"gender":"m","forms":{"alternative":"Boțîrcani"}},{"word":"Botaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Botaru"}},{"word":"Botean","pos":"name","definitions":["a village in Ineu, Bihor County, Romania"],"gender":"m"},{"word":"Boteanu","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Râușorul"],"gender":"m"},{"word":"botei","pos":"noun","definitions":["herd"],"forms":{"plural":"boteie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"botei","accusative-definite-nominative-singular":"boteiul","accusative-indefinite-nominative-plural":"boteie","accusative-definite-nominative-plural":"boteiele","dative-genitive-indefinite-singular":"botei","dative-definite-genitive-singular":"boteiului","dative-genitive-indefinite-plural":"boteie","dative-definite-genitive-plural":"boteielor","singular-vocative":"boteiule","plural-vocative":"boteielor"}},{"word":"boteiaș","pos":"noun","definitions":["diminutive of botei"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"boteiaș","accusative-definite-nominative":"boteiașul","dative-genitive-indefinite":"boteiaș","dative-definite-genitive":"boteiașului","vocative":"boteiașule"}},{"word":"botejune","pos":"noun","definitions":["baptism"],"forms":{"plural":"botejuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"botejune","accusative-definite-nominative-singular":"botejunea","accusative-indefinite-nominative-plural":"botejuni","accusative-definite-nominative-plural":"botejunile","dative-genitive-indefinite-singular":"botejuni","dative-definite-genitive-singular":"botejunii","dative-genitive-indefinite-plural":"botejuni","dative-definite-genitive-plural":"botejunilor","singular-vocative":"botejune","plural-vocative":"botejunilor","alternative":"botegiune"}},{"word":"botelnic","pos":"noun","definitions":["muzzle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"botelnic","accusative-definite-nominative":"botelnicul","dative-genitive-indefinite":"botelnic","dative-definite-genitive":"botelnicului","vocative":"botelnicule"}},{"word":"botelniță","pos":"noun","definitions":["muzzle"],"forms":{"plural":"botelnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botelniță","accusative-definite-nominative-singular":"botelnița","accusative-indefinite-nominative-plural":"botelnițe","accusative-definite-nominative-plural":"botelnițele","dative-genitive-indefinite-singular":"botelnițe","dative-definite-genitive-singular":"botelniței","dative-genitive-indefinite-plural":"botelnițe","dative-definite-genitive-plural":"botelnițelor","singular-vocative":"botelniță","plural-vocative":"botelnițelor"}},{"word":"Boteni","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Boteni, Argeș County, Romania","a village in Mociu, Cluj County, Romania","a village in Conțești, Dâmbovița County, Romania","a village in Sinești, Ialomița County, Romania"],"gender":"m"},{"word":"Botescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Botescu"}},{"word":"Boțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boțescu"}},{"word":"Boteșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Boteșteanu"}},{"word":"Botești","pos":"name","definitions":["a locality in Câmpeni, Alba County, Romania","a village in Scărișoara, Alba County, Romania","a village in Zlatna, Alba County, Romania","a village in Ungureni, Bacău County, Romania","a commune of Neamț County, Romania"],"gender":"m"},{"word":"Boțești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Boțești, Argeș County, Romania","a village in Girov, Neamț County, Romania","a commune of Vaslui County, Romania","a village in Boțești, Vaslui County, Romania"],"gender":"m"},{"word":"boteț","pos":"noun","definitions":["diminutive of bot"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"boteț","accusative-definite-nominative":"botețul","dative-genitive-indefinite":"boteț","dative-definite-genitive":"botețului","vocative":"botețule"}},{"word":"Botez","pos":"name","definitions":["a village in Ațintiș, Mureș County, Romania"],"gender":"m"},{"word":"botez","pos":"noun","definitions":["baptism"],"pronunciation":"[boˈtez]","forms":{"plural":"botezuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"botez","accusative-definite-nominative-singular":"botezul","accusative-indefinite-nominative-plural":"botezuri","accusative-definite-nominative-plural":"botezurile","dative-genitive-indefinite-singular":"botez","dative-definite-genitive-singular":"botezului","dative-genitive-indefinite-plural":"botezuri","dative-definite-genitive-plural":"botezurilor","singular-vocative":"botezule","plural-vocative":"botezurilor"}},{"word":"botez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of boteza (to baptise)"],"pronunciation":"[boˈtez]"},{"word":"boteza","pos":"verb","definitions":["to baptize","to sprinkle holy water on believers or their houses","to godfather / godmother at somebody's baptism"],"pronunciation":"[bo.teˈza]","forms":{"canonical":"a boteza 1st conjugation","present-singular-third-person":"botează","participle-past":"botezat","subjunctive-third-person":"boteze","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a boteza","gerund":"botezând","first-person-indicative-present-singular":"botez","indicative-present-second-person-singular":"botezi","indicative-present-singular-third-person":"botează","first-person-indicative-plural-present":"botezăm","indicative-plural-present-second-person":"botezați","indicative-plural-present-third-person":"botează","first-person-imperfect-indicative-singular":"botezam","imperfect-indicative-second-person-singular":"botezai","imperfect-indicative-singular-third-person":"boteza","first-person-imperfect-indicative-plural":"botezam","imperfect-indicative-plural-second-person":"botezați","imperfect-indicative-plural-third-person":"botezau","first-person-indicative-perfect-singular":"botezai","indicative-perfect-second-person-singular":"botezași","indicative-perfect-singular-third-person":"boteză","first-person-indicative-perfect-plural":"botezarăm","indicative-perfect-plural-second-person":"botezarăți","indicative-perfect-plural-third-person":"botezară","first-person-indicative-pluperfect-singular":"botezasem","indicative-pluperfect-second-person-singular":"botezaseși","indicative-pluperfect-singular-third-person":"botezase","first-person-indicative-pluperfect-plural":"botezaserăm","indicative-pluperfect-plural-second-person":"botezaserăți","indicative-pluperfect-plural-third-person":"botezaseră","first-person-present-singular-subjunctive":"să botez","present-second-person-singular-subjunctive":"să botezi","present-singular-subjunctive-third-person":"să boteze","first-person-plural-present-subjunctive":"să botezăm","plural-present-second-person-subjunctive":"să botezați","plural-present-subjunctive-third-person":"să boteze","imperative-second-person-singular":"botează","imperative-plural-second-person":"botezați","imperative-negative-second-person-singular":"nu boteza","imperative-negative-plural-second-person":"nu botezați"}},{"word":"Botezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botezan"}},{"word":"botezare","pos":"noun","definitions":["christening"],"forms":{"plural":"botezări"}},{"word":"Botezat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Botezat"}},{"word":"botezat","pos":"verb","definitions":["past participle of boteza"],"pronunciation":"/bo.teˈzat/"},{"word":"botezat","pos":"adj","definitions":["baptized"],"pronunciation":"/bo.teˈzat/","forms":{"feminine-singular":"botezată","masculine-plural":"botezați","feminine-neuter-plural":"botezate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botezat","error-unrecognized-form-feminine-indefinite-singular":"botezată","error-unrecognized-form-indefinite-masculine-plural":"botezați","error-unrecognized-form-feminine-indefinite-neuter-plural":"botezate","definite-error-unrecognized-form-masculine-neuter-singular":"botezatul","definite-error-unrecognized-form-feminine-singular":"botezata","definite-error-unrecognized-form-masculine-plural":"botezații","definite-error-unrecognized-form-feminine-neuter-plural":"botezatele"}},{"word":"botezătoare","pos":"noun","definitions":["baptismal font"],"forms":{"plural":"botezători","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"botezătoare","accusative-definite-nominative-singular":"botezătoarea","accusative-indefinite-nominative-plural":"botezători","accusative-definite-nominative-plural":"botezătorile","dative-genitive-indefinite-singular":"botezători","dative-definite-genitive-singular":"botezătorii","dative-genitive-indefinite-plural":"botezători","dative-definite-genitive-plural":"botezătorilor","singular-vocative":"botezătoare","plural-vocative":"botezătorilor"}},{"word":"botezător","pos":"noun","definitions":["baptizer"],"examples":[{"ro":"Ioan Botezătorul","en":"John the Baptizer"}],"forms":{"plural":"botezători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botezător","accusative-definite-nominative-singular":"botezătorul","accusative-indefinite-nominative-plural":"botezători","accusative-definite-nominative-plural":"botezătorii","dative-genitive-indefinite-singular":"botezător","dative-definite-genitive-singular":"botezătorului","dative-genitive-indefinite-plural":"botezători","dative-definite-genitive-plural":"botezătorilor","singular-vocative":"botezătorule","plural-vocative":"botezătorilor"}},{"word":"Botezatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Botezatu"}},{"word":"botezuri","pos":"noun","definitions":["plural of botez (“baptisms”)"],"pronunciation":"[boˈte.zurʲ]","gender":"n-p"},{"word":"botfor","pos":"noun","definitions":["hunting or riding boots"],"forms":{"plural":"botfori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botfor","accusative-definite-nominative-singular":"botforul","accusative-indefinite-nominative-plural":"botfori","accusative-definite-nominative-plural":"botforii","dative-genitive-indefinite-singular":"botfor","dative-definite-genitive-singular":"botforului","dative-genitive-indefinite-plural":"botfori","dative-definite-genitive-plural":"botforilor","singular-vocative":"botforule","plural-vocative":"botforilor"}},{"word":"Botgros","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Botgros"}},{"word":"botgros","pos":"noun","definitions":["hawfinch"],"pronunciation":"/botˈɡros/","forms":{"plural":"botgroși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botgros","accusative-definite-nominative-singular":"botgrosul","accusative-indefinite-nominative-plural":"botgroși","accusative-definite-nominative-plural":"botgroșii","dative-genitive-indefinite-singular":"botgros","dative-definite-genitive-singular":"botgrosului","dative-genitive-indefinite-plural":"botgroși","dative-definite-genitive-plural":"botgroșilor","singular-vocative":"botgrosule","plural-vocative":"botgroșilor"}},{"word":"botgroși","pos":"noun","definitions":["plural of botgros"],"gender":"m"},{"word":"Bothavaș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Trotuș"],"gender":"m"},{"word":"boți","pos":"verb","definitions":["to crumple"],"forms":{"canonical":"a boți 4th conjugation","present-singular-third-person":"boțește","participle-past":"boțit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a boți","gerund":"boțind","first-person-indicative-present-singular":"boțesc","indicative-present-second-person-singular":"boțești","indicative-present-singular-third-person":"boțește","first-person-indicative-plural-present":"boțim","indicative-plural-present-second-person":"boțiți","indicative-plural-present-third-person":"boțesc","first-person-imperfect-indicative-singular":"boțeam","imperfect-indicative-second-person-singular":"boțeai","imperfect-indicative-singular-third-person":"boțea","first-person-imperfect-indicative-plural":"boțeam","imperfect-indicative-plural-second-person":"boțeați","imperfect-indicative-plural-third-person":"boțeau","first-person-indicative-perfect-singular":"boții","indicative-perfect-second-person-singular":"boțiși","indicative-perfect-singular-third-person":"boți","first-person-indicative-perfect-plural":"boțirăm","indicative-perfect-plural-second-person":"boțirăți","indicative-perfect-plural-third-person":"boțiră","first-person-indicative-pluperfect-singular":"boțisem","indicative-pluperfect-second-person-singular":"boțiseși","indicative-pluperfect-singular-third-person":"boțise","first-person-indicative-pluperfect-plural":"boțiserăm","indicative-pluperfect-plural-second-person":"boțiserăți","indicative-pluperfect-plural-third-person":"boțiseră","first-person-present-singular-subjunctive":"să boțesc","present-second-person-singular-subjunctive":"să boțești","present-singular-subjunctive-third-person":"să boțească","first-person-plural-present-subjunctive":"să boțim","plural-present-second-person-subjunctive":"să boțiți","plural-present-subjunctive-third-person":"să boțească","imperative-second-person-singular":"boțește","imperative-plural-second-person":"boțiți","imperative-negative-second-person-singular":"nu boți","imperative-negative-plural-second-person":"nu boțiți"}},{"word":"botică","pos":"noun","definitions":["diminutive of botă"],"forms":{"plural":"botici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"botică","accusative-definite-nominative-singular":"botica","accusative-indefinite-nominative-plural":"botici","accusative-definite-nominative-plural":"boticile","dative-genitive-indefinite-singular":"botici","dative-definite-genitive-singular":"boticii","dative-genitive-indefinite-plural":"botici","dative-definite-genitive-plural":"boticilor","singular-vocative":"botică","plural-vocative":"boticilor"}},{"word":"boticuță","pos":"noun","definitions":["diminutive of -ică"],"forms":{"plural":"boticuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boticuță","accusative-definite-nominative-singular":"boticuța","accusative-indefinite-nominative-plural":"boticuțe","accusative-definite-nominative-plural":"boticuțele","dative-genitive-indefinite-singular":"boticuțe","dative-definite-genitive-singular":"boticuței","dative-genitive-indefinite-plural":"boticuțe","dative-definite-genitive-plural":"boticuțelor","singular-vocative":"boticuță","plural-vocative":"boticuțelor"}},{"word":"Boțilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boțilă"}},{"word":"botină","pos":"noun","definitions":["women's boot"],"forms":{"plural":"botine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botină","accusative-definite-nominative-singular":"botina","accusative-indefinite-nominative-plural":"botine","accusative-definite-nominative-plural":"botinele","dative-genitive-indefinite-singular":"botine","dative-definite-genitive-singular":"botinei","dative-genitive-indefinite-plural":"botine","dative-definite-genitive-plural":"botinelor","singular-vocative":"botină","plural-vocative":"botinelor"}},{"word":"Botineștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botineștean"}},{"word":"Botîneștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botîneștean"}},{"word":"Botineșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botineșteanu"}},{"word":"Botinești","pos":"name","definitions":["a village in Bârna, Timiș County, Romania"],"gender":"m"},{"word":"botișor","pos":"noun","definitions":["diminutive of bot; small snout"],"forms":{"plural":"botișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"botișor","accusative-definite-nominative-singular":"botișorul","accusative-indefinite-nominative-plural":"botișore","accusative-definite-nominative-plural":"botișorele","dative-genitive-indefinite-singular":"botișor","dative-definite-genitive-singular":"botișorului","dative-genitive-indefinite-plural":"botișore","dative-definite-genitive-plural":"botișorelor","singular-vocative":"botișorule","plural-vocative":"botișorelor"}},{"word":"boțișor","pos":"noun","definitions":["diminutive of boț; small snout"],"forms":{"plural":"boțișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boțișor","accusative-definite-nominative-singular":"boțișorul","accusative-indefinite-nominative-plural":"boțișore","accusative-definite-nominative-plural":"boțișorele","dative-genitive-indefinite-singular":"boțișor","dative-definite-genitive-singular":"boțișorului","dative-genitive-indefinite-plural":"boțișore","dative-definite-genitive-plural":"boțișorelor","singular-vocative":"boțișorule","plural-vocative":"boțișorelor"}},{"word":"boțit","pos":"adj","definitions":["crumpled"],"forms":{"feminine-singular":"boțită","masculine-plural":"boțiți","feminine-neuter-plural":"boțite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"boțit","error-unrecognized-form-feminine-indefinite-singular":"boțită","error-unrecognized-form-indefinite-masculine-plural":"boțiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"boțite","definite-error-unrecognized-form-masculine-neuter-singular":"boțitul","definite-error-unrecognized-form-feminine-singular":"boțita","definite-error-unrecognized-form-masculine-plural":"boțiții","definite-error-unrecognized-form-feminine-neuter-plural":"boțitele"}},{"word":"botiță","pos":"noun","definitions":["diminutive of botă"],"forms":{"plural":"botițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botiță","accusative-definite-nominative-singular":"botița","accusative-indefinite-nominative-plural":"botițe","accusative-definite-nominative-plural":"botițele","dative-genitive-indefinite-singular":"botițe","dative-definite-genitive-singular":"botiței","dative-genitive-indefinite-plural":"botițe","dative-definite-genitive-plural":"botițelor","singular-vocative":"botiță","plural-vocative":"botițelor"}},{"word":"boțitură","pos":"noun","definitions":["fold"],"forms":{"plural":"boțituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"boțitură","accusative-definite-nominative-singular":"boțitura","accusative-indefinite-nominative-plural":"boțituri","accusative-definite-nominative-plural":"boțiturile","dative-genitive-indefinite-singular":"boțituri","dative-definite-genitive-singular":"boțiturii","dative-genitive-indefinite-plural":"boțituri","dative-definite-genitive-plural":"boțiturilor","singular-vocative":"boțitură","plural-vocative":"boțiturilor"}},{"word":"Botiz","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Vaser","a commune of Satu Mare County, Romania","a village in Botiz, Satu Mare County, Romania"],"gender":"m"},{"word":"Botiza","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Botiza, Maramureș County, Romania"],"gender":"f"},{"word":"boțman","pos":"noun","definitions":["boatswain"],"forms":{"plural":"boțmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boțman","accusative-definite-nominative-singular":"boțmanul","accusative-indefinite-nominative-plural":"boțmani","accusative-definite-nominative-plural":"boțmanii","dative-genitive-indefinite-singular":"boțman","dative-definite-genitive-singular":"boțmanului","dative-genitive-indefinite-plural":"boțmani","dative-definite-genitive-plural":"boțmanilor","singular-vocative":"boțmanule","plural-vocative":"boțmanilor"}},{"word":"Botnărești","pos":"name","definitions":["a village in Botnărești, Anenii Noi Raion, Moldova","a commune of Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"Botnăreștii Noi","pos":"name","definitions":["a village in Chirca, Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"botniță","pos":"noun","definitions":["muzzle"],"forms":{"plural":"botnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botniță","accusative-definite-nominative-singular":"botnița","accusative-indefinite-nominative-plural":"botnițe","accusative-definite-nominative-plural":"botnițele","dative-genitive-indefinite-singular":"botnițe","dative-definite-genitive-singular":"botniței","dative-genitive-indefinite-plural":"botnițe","dative-definite-genitive-plural":"botnițelor","singular-vocative":"botniță","plural-vocative":"botnițelor"}},{"word":"Boțoaia","pos":"name","definitions":["a village in Dănești, Vaslui County, Romania"],"gender":"f"},{"word":"Botoi","pos":"name","definitions":["a village in Dragomirești, Vaslui County, Romania"],"gender":"m"},{"word":"Botorani","pos":"name","definitions":["a village in Măciuca, Vâlcea County, Romania"],"gender":"m"},{"word":"Botoroaga","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Botoroaga, Teleorman County, Romania"],"gender":"f"},{"word":"Botorog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Botorog"}},{"word":"Botorogi","pos":"name","definitions":["a village in Dănești, Gorj County, Romania"],"gender":"m"},{"word":"botos","pos":"adj","definitions":["bigmouthed"],"forms":{"feminine-singular":"botoasă","masculine-plural":"botoși","feminine-neuter-plural":"botoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botos","error-unrecognized-form-feminine-indefinite-singular":"botoasă","error-unrecognized-form-indefinite-masculine-plural":"botoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"botoase","definite-error-unrecognized-form-masculine-neuter-singular":"botosul","definite-error-unrecognized-form-feminine-singular":"botoasa","definite-error-unrecognized-form-masculine-plural":"botoșii","definite-error-unrecognized-form-feminine-neuter-plural":"botoasele"}},{"word":"Botoș","pos":"name","definitions":["a village in Ciocănești, Suceava County, Romania"],"gender":"m"},{"word":"botoș","pos":"noun","definitions":["tick"],"forms":{"plural":"botoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botoș","accusative-definite-nominative-singular":"botoșul","accusative-indefinite-nominative-plural":"botoși","accusative-definite-nominative-plural":"botoșii","dative-genitive-indefinite-singular":"botoș","dative-definite-genitive-singular":"botoșului","dative-genitive-indefinite-plural":"botoși","dative-definite-genitive-plural":"botoșilor","singular-vocative":"botoșule","plural-vocative":"botoșilor"}},{"word":"Botoșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botoșan"}},{"word":"Botoșana","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Botoșana, Suceava County, Romania"],"gender":"f"},{"word":"botoșănean","pos":"noun","definitions":["native or inhabitant of the city of Botoşani or surrounding Botoşani, Romania (usually male)"],"forms":{"plural":"botoșăneni","feminine":"equivalent botoșăneană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botoșănean","accusative-definite-nominative-singular":"botoșăneanul","accusative-indefinite-nominative-plural":"botoșăneni","accusative-definite-nominative-plural":"botoșănenii","dative-genitive-indefinite-singular":"botoșănean","dative-definite-genitive-singular":"botoșăneanului","dative-genitive-indefinite-plural":"botoșăneni","dative-definite-genitive-plural":"botoșănenilor","singular-vocative":"botoșăneanule","plural-vocative":"botoșănenilor"}},{"word":"botoșăneană","pos":"noun","definitions":["female equivalent of botoșănean"],"forms":{"plural":"botoșănene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botoșăneană","accusative-definite-nominative-singular":"botoșăneana","accusative-indefinite-nominative-plural":"botoșănene","accusative-definite-nominative-plural":"botoșănenele","dative-genitive-indefinite-singular":"botoșănene","dative-definite-genitive-singular":"botoșănenei","dative-genitive-indefinite-plural":"botoșănene","dative-definite-genitive-plural":"botoșănenelor","singular-vocative":"botoșăneană","plural-vocative":"botoșănenelor"}},{"word":"botoșăneancă","pos":"noun","definitions":["female equivalent of botoșănean"],"forms":{"plural":"botoșănence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botoșăneancă","accusative-definite-nominative-singular":"botoșăneanca","accusative-indefinite-nominative-plural":"botoșănence","accusative-definite-nominative-plural":"botoșănencele","dative-genitive-indefinite-singular":"botoșănence","dative-definite-genitive-singular":"botoșănencei","dative-genitive-indefinite-plural":"botoșănence","dative-definite-genitive-plural":"botoșănencelor","singular-vocative":"botoșăneancă","plural-vocative":"botoșănencelor"}},{"word":"Botoșăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botoșăneanu"}},{"word":"Botoșani","pos":"name","definitions":["a city in Botoșani County, Romania","a county of Romania"],"pronunciation":"/botoˈʃanʲ/","gender":"m","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Botoșani","accusative-definite-nominative":"Botoșaniul","dative-genitive-indefinite":"Botoșani","dative-definite-genitive":"Botoșaniului","vocative":"Botoșaniule"}},{"word":"Botoșanița Mare","pos":"name","definitions":["a village in Calafindești, Suceava County, Romania"],"gender":"f"},{"word":"Botoșanița Mică","pos":"name","definitions":["a village in Grămești, Suceava County, Romania"],"gender":"f"},{"word":"botoșare","pos":"noun","definitions":["trouble, vexation"],"forms":{"plural":"botoșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"botoșare","accusative-definite-nominative-singular":"botoșarea","accusative-indefinite-nominative-plural":"botoșări","accusative-definite-nominative-plural":"botoșările","dative-genitive-indefinite-singular":"botoșări","dative-definite-genitive-singular":"botoșării","dative-genitive-indefinite-plural":"botoșări","dative-definite-genitive-plural":"botoșărilor","singular-vocative":"botoșare","plural-vocative":"botoșărilor"}},{"word":"botoșat","pos":"adj","definitions":["upset"],"forms":{"feminine-singular":"botoșată","masculine-plural":"botoșați","feminine-neuter-plural":"botoșate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botoșat","error-unrecognized-form-feminine-indefinite-singular":"botoșată","error-unrecognized-form-indefinite-masculine-plural":"botoșați","error-unrecognized-form-feminine-indefinite-neuter-plural":"botoșate","definite-error-unrecognized-form-masculine-neuter-singular":"botoșatul","definite-error-unrecognized-form-feminine-singular":"botoșata","definite-error-unrecognized-form-masculine-plural":"botoșații","definite-error-unrecognized-form-feminine-neuter-plural":"botoșatele"}},{"word":"botoșel","pos":"noun","definitions":["bootee"],"forms":{"plural":"botoșei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botoșel","accusative-definite-nominative-singular":"botoșelul","accusative-indefinite-nominative-plural":"botoșei","accusative-definite-nominative-plural":"botoșeii","dative-genitive-indefinite-singular":"botoșel","dative-definite-genitive-singular":"botoșelului","dative-genitive-indefinite-plural":"botoșei","dative-definite-genitive-plural":"botoșeilor","singular-vocative":"botoșelule","plural-vocative":"botoșeilor"}},{"word":"Botoșești-Paia","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Botoșești-Paia, Dolj County, Romania"],"gender":"f"},{"word":"botoși","pos":"noun","definitions":["a kind of moccasin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"botoși","accusative-definite-nominative":"botoșii","dative-genitive-indefinite":"botoși","dative-definite-genitive":"botoșilor","vocative":"botoșilor"}},{"word":"Botoșineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botoșineanu"}},{"word":"Botoșneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Botoșneanu"}},{"word":"botridie","pos":"noun","definitions":["bothridia"],"forms":{"plural":"botridii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"botridie","accusative-definite-nominative-singular":"botridia","accusative-indefinite-nominative-plural":"botridii","accusative-definite-nominative-plural":"botridiile","dative-genitive-indefinite-singular":"botridii","dative-definite-genitive-singular":"botridiei","dative-genitive-indefinite-plural":"botridii","dative-definite-genitive-plural":"botridiilor","singular-vocative":"botridie","plural-vocative":"botridiilor"}},{"word":"botriocefal","pos":"noun","definitions":["bothriocephalidean"],"forms":{"plural":"botriocefali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botriocefal","accusative-definite-nominative-singular":"botriocefalul","accusative-indefinite-nominative-plural":"botriocefali","accusative-definite-nominative-plural":"botriocefalii","dative-genitive-indefinite-singular":"botriocefal","dative-definite-genitive-singular":"botriocefalului","dative-genitive-indefinite-plural":"botriocefali","dative-definite-genitive-plural":"botriocefalilor","singular-vocative":"botriocefalule","plural-vocative":"botriocefalilor"}},{"word":"botriocefaloză","pos":"noun","definitions":["botriocephalosis"],"forms":{"plural":"botriocefaloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botriocefaloză","accusative-definite-nominative-singular":"botriocefaloza","accusative-indefinite-nominative-plural":"botriocefaloze","accusative-definite-nominative-plural":"botriocefalozele","dative-genitive-indefinite-singular":"botriocefaloze","dative-definite-genitive-singular":"botriocefalozei","dative-genitive-indefinite-plural":"botriocefaloze","dative-definite-genitive-plural":"botriocefalozelor","singular-vocative":"botriocefaloză","plural-vocative":"botriocefalozelor"}},{"word":"botriomicoză","pos":"noun","definitions":["botryomycosis"],"forms":{"plural":"botriomicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"botriomicoză","accusative-definite-nominative-singular":"botriomicoza","accusative-indefinite-nominative-plural":"botriomicoze","accusative-definite-nominative-plural":"botriomicozele","dative-genitive-indefinite-singular":"botriomicoze","dative-definite-genitive-singular":"botriomicozei","dative-genitive-indefinite-plural":"botriomicoze","dative-definite-genitive-plural":"botriomicozelor","singular-vocative":"botriomicoză","plural-vocative":"botriomicozelor"}},{"word":"botroș","pos":"noun","definitions":["bullfinch (Pyrrhula pyrrhula)"],"pronunciation":"/boˈtroʃ/","forms":{"plural":"botroși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"botroș","accusative-definite-nominative-singular":"botroșul","accusative-indefinite-nominative-plural":"botroși","accusative-definite-nominative-plural":"botroșii","dative-genitive-indefinite-singular":"botroș","dative-definite-genitive-singular":"botroșului","dative-genitive-indefinite-plural":"botroși","dative-definite-genitive-plural":"botroșilor","singular-vocative":"botroșule","plural-vocative":"botroșilor"}},{"word":"botroși","pos":"noun","definitions":["plural of botroș"],"gender":"m"},{"word":"Botswana","pos":"name","definitions":["Botswana (a country in Southern Africa)"]},{"word":"botul","pos":"noun","definitions":["definite nominative/accusative singular of bot"]},{"word":"botuleț","pos":"noun","definitions":["diminutive of bot"],"forms":{"plural":"botulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"botuleț","accusative-definite-nominative-singular":"botulețul","accusative-indefinite-nominative-plural":"botulețe","accusative-definite-nominative-plural":"botulețele","dative-genitive-indefinite-singular":"botuleț","dative-definite-genitive-singular":"botulețului","dative-genitive-indefinite-plural":"botulețe","dative-definite-genitive-plural":"botulețelor","singular-vocative":"botulețule","plural-vocative":"botulețelor"}},{"word":"botulic","pos":"adj","definitions":["botulinic"],"forms":{"feminine-singular":"botulică","masculine-plural":"botulici","feminine-neuter-plural":"botulice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botulic","error-unrecognized-form-feminine-indefinite-singular":"botulică","error-unrecognized-form-indefinite-masculine-plural":"botulici","error-unrecognized-form-feminine-indefinite-neuter-plural":"botulice","definite-error-unrecognized-form-masculine-neuter-singular":"botulicul","definite-error-unrecognized-form-feminine-singular":"botulica","definite-error-unrecognized-form-masculine-plural":"botulicii","definite-error-unrecognized-form-feminine-neuter-plural":"botulicele"}},{"word":"botulinic","pos":"adj","definitions":["related to botulinum"],"forms":{"feminine-singular":"botulinică","masculine-plural":"botulinici","feminine-neuter-plural":"botulinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"botulinic","error-unrecognized-form-feminine-indefinite-singular":"botulinică","error-unrecognized-form-indefinite-masculine-plural":"botulinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"botulinice","definite-error-unrecognized-form-masculine-neuter-singular":"botulinicul","definite-error-unrecognized-form-feminine-singular":"botulinica","definite-error-unrecognized-form-masculine-plural":"botulinicii","definite-error-unrecognized-form-feminine-neuter-plural":"botulinicele"}},{"word":"botulism","pos":"noun","definitions":["botulism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"botulism","accusative-definite-nominative":"botulismul","dative-genitive-indefinite":"botulism","dative-definite-genitive":"botulismului","vocative":"botulismule"}},{"word":"boturi","pos":"noun","definitions":["plural of bot"]},{"word":"Botușel","pos":"name","definitions":["a village in Fundu Moldovei, Suceava County, Romania"],"gender":"m"},{"word":"botușor","pos":"noun","definitions":["diminutive of bot"],"forms":{"plural":"botușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"botușor","accusative-definite-nominative-singular":"botușorul","accusative-indefinite-nominative-plural":"botușoare","accusative-definite-nominative-plural":"botușoarele","dative-genitive-indefinite-singular":"botușor","dative-definite-genitive-singular":"botușorului","dative-genitive-indefinite-plural":"botușoare","dative-definite-genitive-plural":"botușoarelor","singular-vocative":"botușorule","plural-vocative":"botușoarelor"}},{"word":"boțuț","pos":"noun","definitions":["common stinkhorn mushroom (Phallus impudicus)."],"forms":{"plural":"boțuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boțuț","accusative-definite-nominative-singular":"boțuțul","accusative-indefinite-nominative-plural":"boțuți","accusative-definite-nominative-plural":"boțuții","dative-genitive-indefinite-singular":"boțuț","dative-definite-genitive-singular":"boțuțului","dative-genitive-indefinite-plural":"boțuți","dative-definite-genitive-plural":"boțuților","singular-vocative":"boțuțule","plural-vocative":"boțuților"}},{"word":"Bou","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bou"}},{"word":"bou","pos":"noun","definitions":["ox","idiot"],"pronunciation":"/bow/","forms":{"plural":"boi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"bou","accusative-definite-nominative-singular":"boul","accusative-indefinite-nominative-plural":"boi","accusative-definite-nominative-plural":"boii","dative-genitive-indefinite-singular":"bou","dative-definite-genitive-singular":"boului","dative-genitive-indefinite-plural":"boi","dative-definite-genitive-plural":"boilor","singular-vocative":"boule","plural-vocative":"boilor","alternative":"боу"}},{"word":"bou de mare","pos":"noun","definitions":["Atlantic stargazer (Uranoscopus scaber)"],"forms":{"plural":"boi de mare"}},{"word":"bou moscat","pos":"noun","definitions":["musk ox"],"forms":{"plural":"boi moscați"}},{"word":"bou-de-baltă","pos":"noun","definitions":["Eurasian bittern (Botaurus stellaris)"],"forms":{"plural":"boi-de-baltă"}},{"word":"bouar","pos":"noun","definitions":["alternative form of boar"],"forms":{"plural":"bouari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bouar","accusative-definite-nominative-singular":"bouarul","accusative-indefinite-nominative-plural":"bouari","accusative-definite-nominative-plural":"bouarii","dative-genitive-indefinite-singular":"bouar","dative-definite-genitive-singular":"bouarului","dative-genitive-indefinite-plural":"bouari","dative-definite-genitive-plural":"bouarilor","singular-vocative":"bouarule","plural-vocative":"bouarilor"}},{"word":"Bouariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bouariu"}},{"word":"Bouaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bouaru"}},{"word":"Boul","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Mușa","a river in Suceava, Romania, tributary to the Suceava","a river in Bacău, Romania, tributary to the Tazlăul Mare"],"gender":"m"},{"word":"boul","pos":"noun","definitions":["definite nominative/accusative singular of bou"],"pronunciation":"[ˈbo.ul]","gender":"m"},{"word":"Boul Mare","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Pârâul Boului"],"gender":"m"},{"word":"Boul Mic","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Pârâul Boului"],"gender":"m"},{"word":"boulangism","pos":"noun","definitions":["Boulangism"],"forms":{"plural":"boulangisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"boulangism","accusative-definite-nominative-singular":"boulangismul","accusative-indefinite-nominative-plural":"boulangisme","accusative-definite-nominative-plural":"boulangismele","dative-genitive-indefinite-singular":"boulangism","dative-definite-genitive-singular":"boulangismului","dative-genitive-indefinite-plural":"boulangisme","dative-definite-genitive-plural":"boulangismelor","singular-vocative":"boulangismule","plural-vocative":"boulangismelor"}},{"word":"boule","pos":"noun","definitions":["vocative singular of bou"],"pronunciation":"[ˈbo.ule]","gender":"m"},{"word":"Boulean","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Boulean"}},{"word":"boulean","pos":"noun","definitions":["diminutive of bou"],"forms":{"plural":"bouleni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boulean","accusative-definite-nominative-singular":"bouleanul","accusative-indefinite-nominative-plural":"bouleni","accusative-definite-nominative-plural":"boulenii","dative-genitive-indefinite-singular":"boulean","dative-definite-genitive-singular":"bouleanului","dative-genitive-indefinite-plural":"bouleni","dative-definite-genitive-plural":"boulenilor","singular-vocative":"bouleanule","plural-vocative":"boulenilor"}},{"word":"Bouleanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bouleanu"}},{"word":"Boulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Boulescu"}},{"word":"Bouleț","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Cracăul Alb"],"gender":"m"},{"word":"bouleț","pos":"noun","definitions":["diminutive of bou"],"forms":{"plural":"bouleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bouleț","accusative-definite-nominative-singular":"boulețul","accusative-indefinite-nominative-plural":"bouleți","accusative-definite-nominative-plural":"bouleții","dative-genitive-indefinite-singular":"bouleț","dative-definite-genitive-singular":"boulețului","dative-genitive-indefinite-plural":"bouleți","dative-definite-genitive-plural":"bouleților","singular-vocative":"boulețule","plural-vocative":"bouleților"}},{"word":"Boulețu","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Teleajen"],"gender":"m"},{"word":"Boulețul Mare","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bouleț"],"gender":"m"},{"word":"Boulețul Mic","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bouleț"],"gender":"m"},{"word":"Boului","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"boului","pos":"noun","definitions":["definite genitive/dative singular of bou"]},{"word":"Bounegru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bounegru"}},{"word":"Bour","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bour"}},{"word":"bour","pos":"noun","definitions":["aurochs (Bos primigenius)","wild bull","wisent (Bison bonasus)","the old emblem of Moldova (with the head of a wisent)"],"forms":{"plural":"bouri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bour","accusative-definite-nominative-singular":"bourul","accusative-indefinite-nominative-plural":"bouri","accusative-definite-nominative-plural":"bourii","dative-genitive-indefinite-singular":"bour","dative-definite-genitive-singular":"bourului","dative-genitive-indefinite-plural":"bouri","dative-definite-genitive-plural":"bourilor","singular-vocative":"bourule","plural-vocative":"bourilor","alternative-archaic":"buăr"}},{"word":"Boura","pos":"name","definitions":["a village in Forăști, Suceava County, Romania"],"gender":"f"},{"word":"bourean","pos":"adj","definitions":["wiesent-like"],"forms":{"feminine-singular":"boureană","masculine-plural":"boureni","feminine-neuter-plural":"bourene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bourean","error-unrecognized-form-feminine-indefinite-singular":"boureană","error-unrecognized-form-indefinite-masculine-plural":"boureni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bourene","definite-error-unrecognized-form-masculine-neuter-singular":"boureanul","definite-error-unrecognized-form-feminine-singular":"boureana","definite-error-unrecognized-form-masculine-plural":"bourenii","definite-error-unrecognized-form-feminine-neuter-plural":"bourenele"}},{"word":"Bourel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bourel"}},{"word":"bourel","pos":"noun","definitions":["diminutive of bour; small aurochs"],"forms":{"plural":"bourei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bourel","accusative-definite-nominative-singular":"bourelul","accusative-indefinite-nominative-plural":"boureli","accusative-definite-nominative-plural":"bourelii","dative-genitive-indefinite-singular":"bourel","dative-definite-genitive-singular":"bourelului","dative-genitive-indefinite-plural":"boureli","dative-definite-genitive-plural":"bourelilor","singular-vocative":"bourelule","plural-vocative":"bourelilor"}},{"word":"Boureni","pos":"name","definitions":["a village in Afumați, Dolj County, Romania","a village in Balș, Iași County, Romania","a village in Moțca, Iași County, Romania"],"gender":"m"},{"word":"bouresc","pos":"adj","definitions":["wiesent-like"],"forms":{"feminine-singular":"bourească","plural":"bourești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bouresc","error-unrecognized-form-feminine-indefinite-singular":"bourească","error-unrecognized-form-indefinite-masculine-plural":"bourești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bourești","definite-error-unrecognized-form-masculine-neuter-singular":"bourescul","definite-error-unrecognized-form-feminine-singular":"boureasca","definite-error-unrecognized-form-masculine-plural":"boureștii","definite-error-unrecognized-form-feminine-neuter-plural":"boureștile"}},{"word":"Bourețu","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Valea Rea"],"gender":"m"},{"word":"bouroaică","pos":"noun","definitions":["feminine of bour"],"forms":{"plural":"bouroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bouroaică","accusative-definite-nominative-singular":"bouroaica","accusative-indefinite-nominative-plural":"bouroaice","accusative-definite-nominative-plural":"bouroaicele","dative-genitive-indefinite-singular":"bouroaice","dative-definite-genitive-singular":"bouroaicei","dative-genitive-indefinite-plural":"bouroaice","dative-definite-genitive-plural":"bouroaicelor","singular-vocative":"bouroaică","plural-vocative":"bouroaicelor"}},{"word":"Bouroșu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bouroșu"}},{"word":"Bouru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bouru"}},{"word":"Bouruc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bouruc"}},{"word":"boușor","pos":"noun","definitions":["diminutive of bou"],"forms":{"plural":"boușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boușor","accusative-definite-nominative-singular":"boușorul","accusative-indefinite-nominative-plural":"boușori","accusative-definite-nominative-plural":"boușorii","dative-genitive-indefinite-singular":"boușor","dative-definite-genitive-singular":"boușorului","dative-genitive-indefinite-plural":"boușori","dative-definite-genitive-plural":"boușorilor","singular-vocative":"boușorule","plural-vocative":"boușorilor"}},{"word":"Boușori","pos":"name","definitions":["a village in Solești, Vaslui County, Romania"],"gender":"m"},{"word":"boușori","pos":"noun","definitions":["plural of boușor"]},{"word":"bouț","pos":"noun","definitions":["diminutive of bou; small ox"],"forms":{"plural":"bouți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bouț","accusative-definite-nominative-singular":"bouțul","accusative-indefinite-nominative-plural":"bouți","accusative-definite-nominative-plural":"bouții","dative-genitive-indefinite-singular":"bouț","dative-definite-genitive-singular":"bouțului","dative-genitive-indefinite-plural":"bouți","dative-definite-genitive-plural":"bouților","singular-vocative":"bouțule","plural-vocative":"bouților"}},{"word":"Bouțu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bouțu"}},{"word":"bovarism","pos":"noun","definitions":["bovarysm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bovarism","accusative-definite-nominative":"bovarismul","dative-genitive-indefinite":"bovarism","dative-definite-genitive":"bovarismului","vocative":"bovarismule"}},{"word":"bovid","pos":"noun","definitions":["alternative form of bovideu"],"forms":{"plural":"bovide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bovid","accusative-definite-nominative-singular":"bovidul","accusative-indefinite-nominative-plural":"bovide","accusative-definite-nominative-plural":"bovidele","dative-genitive-indefinite-singular":"bovid","dative-definite-genitive-singular":"bovidului","dative-genitive-indefinite-plural":"bovide","dative-definite-genitive-plural":"bovidelor","singular-vocative":"bovidule","plural-vocative":"bovidelor"}},{"word":"bovideu","pos":"noun","definitions":["bovid"],"forms":{"plural":"bovidee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bovideu","accusative-definite-nominative-singular":"bovideul","accusative-indefinite-nominative-plural":"bovidee","accusative-definite-nominative-plural":"bovideele","dative-genitive-indefinite-singular":"bovideu","dative-definite-genitive-singular":"bovideului","dative-genitive-indefinite-plural":"bovidee","dative-definite-genitive-plural":"bovideelor","singular-vocative":"bovideule","plural-vocative":"bovideelor"}},{"word":"bovin","pos":"adj","definitions":["bovine"],"pronunciation":"/boˈvin/","forms":{"feminine-singular":"bovină","masculine-plural":"bovini","feminine-neuter-plural":"bovine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bovin","error-unrecognized-form-feminine-indefinite-singular":"bovină","error-unrecognized-form-indefinite-masculine-plural":"bovini","error-unrecognized-form-feminine-indefinite-neuter-plural":"bovine","definite-error-unrecognized-form-masculine-neuter-singular":"bovinul","definite-error-unrecognized-form-feminine-singular":"bovina","definite-error-unrecognized-form-masculine-plural":"bovinii","definite-error-unrecognized-form-feminine-neuter-plural":"bovinele"}},{"word":"bovină","pos":"noun","definitions":["bovine"],"forms":{"plural":"bovine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bovină","accusative-definite-nominative-singular":"bovina","accusative-indefinite-nominative-plural":"bovine","accusative-definite-nominative-plural":"bovinele","dative-genitive-indefinite-singular":"bovine","dative-definite-genitive-singular":"bovinei","dative-genitive-indefinite-plural":"bovine","dative-definite-genitive-plural":"bovinelor","singular-vocative":"bovină","plural-vocative":"bovinelor"}},{"word":"bovindou","pos":"noun","definitions":["bow window, bay window"],"forms":{"plural":"bovindouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bovindou","accusative-definite-nominative-singular":"bovindoul","accusative-indefinite-nominative-plural":"bovindouri","accusative-definite-nominative-plural":"bovindourile","dative-genitive-indefinite-singular":"bovindou","dative-definite-genitive-singular":"bovindoului","dative-genitive-indefinite-plural":"bovindouri","dative-definite-genitive-plural":"bovindourilor","singular-vocative":"bovindoule","plural-vocative":"bovindourilor"}},{"word":"bowling","pos":"noun","definitions":["bowling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bowling","accusative-definite-nominative":"bowlingul","dative-genitive-indefinite":"bowling","dative-definite-genitive":"bowlingului","vocative":"bowlingule"}},{"word":"box","pos":"noun","definitions":["boxing (the sport of)","a kind of sword"],"pronunciation":"/ˈboks/","forms":{"plural":"boxuri"}},{"word":"box","pos":"noun","definitions":["bovine leather"],"pronunciation":"/ˈboks/"},{"word":"box","pos":"noun","definitions":["a breed of bulldog"],"pronunciation":"/ˈboks/"},{"word":"box-office","pos":"noun","definitions":["box office"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"box-office","accusative-definite-nominative":"box-officeul","dative-genitive-indefinite":"box-office","dative-definite-genitive":"box-officeului","vocative":"box-officeule"}},{"word":"boxa","pos":"verb","definitions":["to box"],"forms":{"canonical":"a boxa 1st conjugation","present-singular-third-person":"boxează","participle-past":"boxat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a boxa","gerund":"boxând","first-person-indicative-present-singular":"boxez","indicative-present-second-person-singular":"boxezi","indicative-present-singular-third-person":"boxează","first-person-indicative-plural-present":"boxăm","indicative-plural-present-second-person":"boxați","indicative-plural-present-third-person":"boxează","first-person-imperfect-indicative-singular":"boxam","imperfect-indicative-second-person-singular":"boxai","imperfect-indicative-singular-third-person":"boxa","first-person-imperfect-indicative-plural":"boxam","imperfect-indicative-plural-second-person":"boxați","imperfect-indicative-plural-third-person":"boxau","first-person-indicative-perfect-singular":"boxai","indicative-perfect-second-person-singular":"boxași","indicative-perfect-singular-third-person":"boxă","first-person-indicative-perfect-plural":"boxarăm","indicative-perfect-plural-second-person":"boxarăți","indicative-perfect-plural-third-person":"boxară","first-person-indicative-pluperfect-singular":"boxasem","indicative-pluperfect-second-person-singular":"boxaseși","indicative-pluperfect-singular-third-person":"boxase","first-person-indicative-pluperfect-plural":"boxaserăm","indicative-pluperfect-plural-second-person":"boxaserăți","indicative-pluperfect-plural-third-person":"boxaseră","first-person-present-singular-subjunctive":"să boxez","present-second-person-singular-subjunctive":"să boxezi","present-singular-subjunctive-third-person":"să boxeze","first-person-plural-present-subjunctive":"să boxăm","plural-present-second-person-subjunctive":"să boxați","plural-present-subjunctive-third-person":"să boxeze","imperative-second-person-singular":"boxează","imperative-plural-second-person":"boxați","imperative-negative-second-person-singular":"nu boxa","imperative-negative-plural-second-person":"nu boxați"}},{"word":"boxă","pos":"noun","definitions":["stall","compartment, cubicle","storage space"],"forms":{"plural":"boxe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"boxă","accusative-definite-nominative-singular":"boxa","accusative-indefinite-nominative-plural":"boxe","accusative-definite-nominative-plural":"boxele","dative-genitive-indefinite-singular":"boxe","dative-definite-genitive-singular":"boxei","dative-genitive-indefinite-plural":"boxe","dative-definite-genitive-plural":"boxelor","singular-vocative":"boxă","plural-vocative":"boxelor"}},{"word":"boxer","pos":"noun","definitions":["boxer (participant in a boxing match)"],"pronunciation":"/ˈbok.ser/","forms":{"plural":"boxeri","feminine":"equivalent boxeră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boxer","accusative-definite-nominative-singular":"boxerul","accusative-indefinite-nominative-plural":"boxeri","accusative-definite-nominative-plural":"boxerii","dative-genitive-indefinite-singular":"boxer","dative-definite-genitive-singular":"boxerului","dative-genitive-indefinite-plural":"boxeri","dative-definite-genitive-plural":"boxerilor","singular-vocative":"boxerule","plural-vocative":"boxerilor"}},{"word":"boxer","pos":"noun","definitions":["boxer (breed of dog)"],"forms":{"plural":"boxeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boxer","accusative-definite-nominative-singular":"boxerul","accusative-indefinite-nominative-plural":"boxeri","accusative-definite-nominative-plural":"boxerii","dative-genitive-indefinite-singular":"boxer","dative-definite-genitive-singular":"boxerului","dative-genitive-indefinite-plural":"boxeri","dative-definite-genitive-plural":"boxerilor","singular-vocative":"boxerule","plural-vocative":"boxerilor"}},{"word":"boxeri","pos":"noun","definitions":["nominative/accusative/genitive/dative indefinite plural of boxer"],"gender":"m"},{"word":"boxuri","pos":"noun","definitions":["plural of box"],"gender":"n"},{"word":"Boz","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Mureș","a village in Doștat, Alba County, Romania","a village in Brănișca, Hunedoara County, Romania"],"gender":"m"},{"word":"boz","pos":"noun","definitions":["dwarf elder (Sambucus ebulus)"],"forms":{"plural":"boji","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"boz","accusative-definite-nominative-singular":"bozul","accusative-indefinite-nominative-plural":"boji","accusative-definite-nominative-plural":"bojii","dative-genitive-indefinite-singular":"boz","dative-definite-genitive-singular":"bozului","dative-genitive-indefinite-plural":"boji","dative-definite-genitive-plural":"bojilor","singular-vocative":"bozule","plural-vocative":"bojilor"}},{"word":"boza","pos":"noun","definitions":["boza"],"forms":{"plural":"bozale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"boza","accusative-definite-nominative-singular":"bozaua","accusative-indefinite-nominative-plural":"bozale","accusative-definite-nominative-plural":"bozalele","dative-genitive-indefinite-singular":"bozale","dative-definite-genitive-singular":"bozalei","dative-genitive-indefinite-plural":"bozale","dative-definite-genitive-plural":"bozalelor","singular-vocative":"boza","plural-vocative":"bozalelor"}},{"word":"bozafer","pos":"adj","definitions":["gray"],"forms":{"feminine-singular":"bozaferă","masculine-plural":"bozaferi","feminine-neuter-plural":"bozafere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bozafer","error-unrecognized-form-feminine-indefinite-singular":"bozaferă","error-unrecognized-form-indefinite-masculine-plural":"bozaferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bozafere","definite-error-unrecognized-form-masculine-neuter-singular":"bozaferul","definite-error-unrecognized-form-feminine-singular":"bozafera","definite-error-unrecognized-form-masculine-plural":"bozaferii","definite-error-unrecognized-form-feminine-neuter-plural":"bozaferele"}},{"word":"bozăire","pos":"noun","definitions":["souring"],"forms":{"plural":"bozăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bozăire","accusative-definite-nominative-singular":"bozăirea","accusative-indefinite-nominative-plural":"bozăiri","accusative-definite-nominative-plural":"bozăirile","dative-genitive-indefinite-singular":"bozăiri","dative-definite-genitive-singular":"bozăirii","dative-genitive-indefinite-plural":"bozăiri","dative-definite-genitive-plural":"bozăirilor","singular-vocative":"bozăire","plural-vocative":"bozăirilor"}},{"word":"Bozânta Mare","pos":"name","definitions":["a village in Tăuții-Măgherăuș, Maramureș County, Romania"],"gender":"f","forms":{"alternative":"Bozînta Mare"}},{"word":"Bozânta Mică","pos":"name","definitions":["a village in Recea, Maramureș County, Romania"],"gender":"f","forms":{"alternative":"Bozînta Mică"}},{"word":"bozărie","pos":"noun","definitions":["area where dwarf elders grow"],"forms":{"plural":"bozării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bozărie","accusative-definite-nominative-singular":"bozăria","accusative-indefinite-nominative-plural":"bozării","accusative-definite-nominative-plural":"bozăriile","dative-genitive-indefinite-singular":"bozării","dative-definite-genitive-singular":"bozăriei","dative-genitive-indefinite-plural":"bozării","dative-definite-genitive-plural":"bozăriilor","singular-vocative":"bozărie","plural-vocative":"bozăriilor"}},{"word":"Bozdogescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bozdogescu"}},{"word":"Bozed","pos":"name","definitions":["a village in Ceuașu de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"Bozeni","pos":"name","definitions":["a village in Corunca, Mureș County, Romania"],"gender":"m"},{"word":"Bozeș","pos":"name","definitions":["a village in Geoagiu, Hunedoara County, Romania"],"gender":"m"},{"word":"Bozgan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bozgan"}},{"word":"bozgoi","pos":"noun","definitions":["European hornet (Vespa crabro)"],"forms":{"plural":"bozgoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bozgoi","accusative-definite-nominative-singular":"bozgoiul","accusative-indefinite-nominative-plural":"bozgoi","accusative-definite-nominative-plural":"bozgoii","dative-genitive-indefinite-singular":"bozgoi","dative-definite-genitive-singular":"bozgoiului","dative-genitive-indefinite-plural":"bozgoi","dative-definite-genitive-plural":"bozgoilor","singular-vocative":"bozgoiule","plural-vocative":"bozgoilor"}},{"word":"bozgor","pos":"noun","definitions":["a Hungarian, Magyar"],"forms":{"plural":"bozgori","feminine":"equivalent bozgoroaică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bozgor","accusative-definite-nominative-singular":"bozgorul","accusative-indefinite-nominative-plural":"bozgori","accusative-definite-nominative-plural":"bozgorii","dative-genitive-indefinite-singular":"bozgor","dative-definite-genitive-singular":"bozgorului","dative-genitive-indefinite-plural":"bozgori","dative-definite-genitive-plural":"bozgorilor","singular-vocative":"bozgorule","plural-vocative":"bozgorilor"}},{"word":"bozgun","pos":"noun","definitions":["war"],"forms":{"plural":"bozgunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bozgun","accusative-definite-nominative-singular":"bozgunul","accusative-indefinite-nominative-plural":"bozgunuri","accusative-definite-nominative-plural":"bozgunurile","dative-genitive-indefinite-singular":"bozgun","dative-definite-genitive-singular":"bozgunului","dative-genitive-indefinite-plural":"bozgunuri","dative-definite-genitive-plural":"bozgunurilor","singular-vocative":"bozgunule","plural-vocative":"bozgunurilor"}},{"word":"bozie","pos":"noun","definitions":["dwarf elder (Sambucus ebulus)"],"forms":{"plural":"bozii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bozie","accusative-definite-nominative-singular":"bozia","accusative-indefinite-nominative-plural":"bozii","accusative-definite-nominative-plural":"boziile","dative-genitive-indefinite-singular":"bozii","dative-definite-genitive-singular":"boziei","dative-genitive-indefinite-plural":"bozii","dative-definite-genitive-plural":"boziilor","singular-vocative":"bozie","plural-vocative":"boziilor"}},{"word":"Bozieni","pos":"name","definitions":["a village in Săveni, Botoșani County, Romania","a commune of Neamț County, Romania","a village in Bozieni, Neamț County, Romania","a village in Fântânele, Prahova County, Romania"],"gender":"m"},{"word":"Bozienii de Sus","pos":"name","definitions":["a village in Ruginoasa, Neamț County, Romania"],"gender":"m"},{"word":"Bozieș","pos":"name","definitions":["a village in Chiochiș, Bistrița-Năsăud County, Romania","a village in Boghiș, Sălaj County, Romania"],"gender":"m"},{"word":"bozișor","pos":"noun","definitions":["diminutive of ro"],"forms":{"plural":"bozișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bozișor","accusative-definite-nominative-singular":"bozișorul","accusative-indefinite-nominative-plural":"bozișori","accusative-definite-nominative-plural":"bozișorii","dative-genitive-indefinite-singular":"bozișor","dative-definite-genitive-singular":"bozișorului","dative-genitive-indefinite-plural":"bozișori","dative-definite-genitive-plural":"bozișorilor","singular-vocative":"bozișorule","plural-vocative":"bozișorilor"}},{"word":"Bozna","pos":"name","definitions":["a village in Treznea, Sălaj County, Romania"],"gender":"f"},{"word":"bozoaie","pos":"noun","definitions":["pagan goddess"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bozoaie","accusative-definite-nominative":"bozoaia","dative-genitive-indefinite":"bozoaii","dative-definite-genitive":"bozoaiei","vocative":"bozoaie"}},{"word":"Bozovici","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Bozovici, Caraș-Severin County, Romania"],"gender":"m"},{"word":"bozului","pos":"noun","definitions":["definite genitive/dative singular of boz"]},{"word":"BR","pos":"name","definitions":["abbreviation of Brăila: a county of Romania"]}];
@@ -0,0 +1 @@
+export default [{"word":"Brabeți","pos":"name","definitions":["a village in Bârla, Argeș County, Romania","a village in Daneți, Dolj County, Romania"],"gender":"m"},{"word":"brăbin","pos":"noun","definitions":["hill mustard, Turkish rocket, Turkish warty-cabbage (Bunias orientalis)"],"pronunciation":"/brəˈbin/","forms":{"plural":"brăbini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brăbin","accusative-definite-nominative-singular":"brăbinul","accusative-indefinite-nominative-plural":"brăbini","accusative-definite-nominative-plural":"brăbinii","dative-genitive-indefinite-singular":"brăbin","dative-definite-genitive-singular":"brăbinului","dative-genitive-indefinite-plural":"brăbini","dative-definite-genitive-plural":"brăbinilor","singular-vocative":"brăbinule","plural-vocative":"brăbinilor"}},{"word":"Brabova","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Brabova, Dolj County, Romania"],"gender":"f"},{"word":"brac","pos":"noun","definitions":["defective goods, leftovers, waste"],"examples":[{"ro":"Pe când luna strălucește peste-a tomurilor bracuri\n Într-o clipă-l poartă gândul îndărăt cu mii de veacuri\n La-nceput pe când ființă nu era nici neființă\n Pe când totul era lipsă de viață și voință […]","en":"The moon looks in and sheds its beams a pile of ancient books upon\n He sets his mind to roving back across a thousand ages gone\n Into the time are things began, when being and not being still\n Did not exist to plague man’s mind, and there was neither life nor will […]"}],"forms":{"plural":"bracuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brac","accusative-definite-nominative-singular":"bracul","accusative-indefinite-nominative-plural":"bracuri","accusative-definite-nominative-plural":"bracurile","dative-genitive-indefinite-singular":"brac","dative-definite-genitive-singular":"bracului","dative-genitive-indefinite-plural":"bracuri","dative-definite-genitive-plural":"bracurilor","singular-vocative":"bracule","plural-vocative":"bracurilor"}},{"word":"brăcăcel","pos":"noun","definitions":["diminutive of brăcaci"],"forms":{"plural":"brăcăcele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brăcăcel","accusative-definite-nominative-singular":"brăcăcelul","accusative-indefinite-nominative-plural":"brăcăcele","accusative-definite-nominative-plural":"brăcăcelele","dative-genitive-indefinite-singular":"brăcăcel","dative-definite-genitive-singular":"brăcăcelului","dative-genitive-indefinite-plural":"brăcăcele","dative-definite-genitive-plural":"brăcăcelelor","singular-vocative":"brăcăcelule","plural-vocative":"brăcăcelelor"}},{"word":"Brăcăcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brăcăcescu"}},{"word":"brăcăcică","pos":"noun","definitions":["diminutive of brăcaci"],"forms":{"plural":"brăcăcici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brăcăcică","accusative-definite-nominative-singular":"brăcăcica","accusative-indefinite-nominative-plural":"brăcăcici","accusative-definite-nominative-plural":"brăcăcicile","dative-genitive-indefinite-singular":"brăcăcici","dative-definite-genitive-singular":"brăcăcicii","dative-genitive-indefinite-plural":"brăcăcici","dative-definite-genitive-plural":"brăcăcicilor","singular-vocative":"brăcăcică","plural-vocative":"brăcăcicilor"}},{"word":"Bracaciu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bracaciu"}},{"word":"brace","pos":"noun","definitions":["underwear, undergarments, drawers, unmentionables"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"brace","accusative-definite-nominative":"bracele","dative-genitive-indefinite":"brace","dative-definite-genitive":"bracelor","vocative":"bracelor","alternative":"braci"}},{"word":"brăcinar","pos":"noun","definitions":["waistband"],"forms":{"plural":"brăcinare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brăcinar","accusative-definite-nominative-singular":"brăcinarul","accusative-indefinite-nominative-plural":"brăcinare","accusative-definite-nominative-plural":"brăcinarele","dative-genitive-indefinite-singular":"brăcinar","dative-definite-genitive-singular":"brăcinarului","dative-genitive-indefinite-plural":"brăcinare","dative-definite-genitive-plural":"brăcinarelor","singular-vocative":"brăcinarule","plural-vocative":"brăcinarelor"}},{"word":"brăcire","pos":"noun","definitions":["belt, girdle, cord"],"forms":{"plural":"brăciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brăcire","accusative-definite-nominative-singular":"brăcirea","accusative-indefinite-nominative-plural":"brăciri","accusative-definite-nominative-plural":"brăcirile","dative-genitive-indefinite-singular":"brăciri","dative-definite-genitive-singular":"brăcirii","dative-genitive-indefinite-plural":"brăciri","dative-definite-genitive-plural":"brăcirilor","singular-vocative":"brăcire","plural-vocative":"brăcirilor","alternative":"brăcile"}},{"word":"bracona","pos":"verb","definitions":["to poach"],"forms":{"canonical":"a bracona 1st conjugation","present-singular-third-person":"braconează","participle-past":"braconat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bracona","gerund":"braconând","first-person-indicative-present-singular":"braconez","indicative-present-second-person-singular":"braconezi","indicative-present-singular-third-person":"braconează","first-person-indicative-plural-present":"braconăm","indicative-plural-present-second-person":"braconați","indicative-plural-present-third-person":"braconează","first-person-imperfect-indicative-singular":"braconam","imperfect-indicative-second-person-singular":"braconai","imperfect-indicative-singular-third-person":"bracona","first-person-imperfect-indicative-plural":"braconam","imperfect-indicative-plural-second-person":"braconați","imperfect-indicative-plural-third-person":"braconau","first-person-indicative-perfect-singular":"braconai","indicative-perfect-second-person-singular":"braconași","indicative-perfect-singular-third-person":"braconă","first-person-indicative-perfect-plural":"braconarăm","indicative-perfect-plural-second-person":"braconarăți","indicative-perfect-plural-third-person":"braconară","first-person-indicative-pluperfect-singular":"braconasem","indicative-pluperfect-second-person-singular":"braconaseși","indicative-pluperfect-singular-third-person":"braconase","first-person-indicative-pluperfect-plural":"braconaserăm","indicative-pluperfect-plural-second-person":"braconaserăți","indicative-pluperfect-plural-third-person":"braconaseră","first-person-present-singular-subjunctive":"să braconez","present-second-person-singular-subjunctive":"să braconezi","present-singular-subjunctive-third-person":"să braconeze","first-person-plural-present-subjunctive":"să braconăm","plural-present-second-person-subjunctive":"să braconați","plural-present-subjunctive-third-person":"să braconeze","imperative-second-person-singular":"braconează","imperative-plural-second-person":"braconați","imperative-negative-second-person-singular":"nu bracona","imperative-negative-plural-second-person":"nu braconați"}},{"word":"braconaj","pos":"noun","definitions":["poaching"],"forms":{"plural":"braconaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"braconaj","accusative-definite-nominative-singular":"braconajul","accusative-indefinite-nominative-plural":"braconaje","accusative-definite-nominative-plural":"braconajele","dative-genitive-indefinite-singular":"braconaj","dative-definite-genitive-singular":"braconajului","dative-genitive-indefinite-plural":"braconaje","dative-definite-genitive-plural":"braconajelor","singular-vocative":"braconajule","plural-vocative":"braconajelor"}},{"word":"braconier","pos":"noun","definitions":["poacher"],"forms":{"plural":"braconieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"braconier","accusative-definite-nominative-singular":"braconierul","accusative-indefinite-nominative-plural":"braconieri","accusative-definite-nominative-plural":"braconierii","dative-genitive-indefinite-singular":"braconier","dative-definite-genitive-singular":"braconierului","dative-genitive-indefinite-plural":"braconieri","dative-definite-genitive-plural":"braconierilor","singular-vocative":"braconierule","plural-vocative":"braconierilor"}},{"word":"bracteal","pos":"adj","definitions":["bracteal"],"forms":{"feminine-singular":"bracteală","masculine-plural":"bracteali","feminine-neuter-plural":"bracteale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bracteal","error-unrecognized-form-feminine-indefinite-singular":"bracteală","error-unrecognized-form-indefinite-masculine-plural":"bracteali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bracteale","definite-error-unrecognized-form-masculine-neuter-singular":"bractealul","definite-error-unrecognized-form-feminine-singular":"bracteala","definite-error-unrecognized-form-masculine-plural":"bractealii","definite-error-unrecognized-form-feminine-neuter-plural":"bractealele"}},{"word":"bractee","pos":"noun","definitions":["bract"],"forms":{"plural":"bractee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"bractee","accusative-definite-nominative-singular":"bracteea","accusative-indefinite-nominative-plural":"bractee","accusative-definite-nominative-plural":"bracteele","dative-genitive-indefinite-singular":"bractee","dative-definite-genitive-singular":"bracteei","dative-genitive-indefinite-plural":"bractee","dative-definite-genitive-plural":"bracteelor","singular-vocative":"bractee","plural-vocative":"bracteelor"}},{"word":"bracteolă","pos":"noun","definitions":["bracteole"],"forms":{"plural":"bracteole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bracteolă","accusative-definite-nominative-singular":"bracteola","accusative-indefinite-nominative-plural":"bracteole","accusative-definite-nominative-plural":"bracteolele","dative-genitive-indefinite-singular":"bracteole","dative-definite-genitive-singular":"bracteolei","dative-genitive-indefinite-plural":"bracteole","dative-definite-genitive-plural":"bracteolelor","singular-vocative":"bracteolă","plural-vocative":"bracteolelor"}},{"word":"Brad","pos":"name","definitions":["a village in Berești-Bistrița, Bacău County, Romania","a village in Filipeni, Bacău County, Romania","a village in Negri, Bacău County, Romania","a city in Hunedoara County, Romania"],"pronunciation":"/brad/","gender":"m"},{"word":"brad","pos":"noun","definitions":["fir, Abies alba.","pine tree.","pine wood."],"forms":{"plural":"brazi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brad","accusative-definite-nominative-singular":"bradul","accusative-indefinite-nominative-plural":"brazi","accusative-definite-nominative-plural":"brazii","dative-genitive-indefinite-singular":"brad","dative-definite-genitive-singular":"bradului","dative-genitive-indefinite-plural":"brazi","dative-definite-genitive-plural":"brazilor","singular-vocative":"bradule","plural-vocative":"brazilor"}},{"word":"brad de Crăciun","pos":"noun","definitions":["Christmas tree"],"forms":{"plural":"brazi de Crăciun"}},{"word":"Brădăcești","pos":"name","definitions":["a village in Nereju, Vrancea County, Romania"],"gender":"m"},{"word":"Bradan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bradan"}},{"word":"brădănaș","pos":"noun","definitions":["diminutive of brădan"],"forms":{"plural":"brădănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădănaș","accusative-definite-nominative-singular":"brădănașul","accusative-indefinite-nominative-plural":"brădănași","accusative-definite-nominative-plural":"brădănașii","dative-genitive-indefinite-singular":"brădănaș","dative-definite-genitive-singular":"brădănașului","dative-genitive-indefinite-plural":"brădănași","dative-definite-genitive-plural":"brădănașilor","singular-vocative":"brădănașule","plural-vocative":"brădănașilor"}},{"word":"Brădățan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brădățan"}},{"word":"Brădățel","pos":"name","definitions":["a village in Pucheni, Dâmbovița County, Romania","a village in Burjuc, Hunedoara County, Romania","a village in Horodniceni, Suceava County, Romania"],"gender":"m"},{"word":"brădățel","pos":"noun","definitions":["diminutive of brădet"],"forms":{"plural":"brădățele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brădățel","accusative-definite-nominative-singular":"brădățelul","accusative-indefinite-nominative-plural":"brădățele","accusative-definite-nominative-plural":"brădățelele","dative-genitive-indefinite-singular":"brădățel","dative-definite-genitive-singular":"brădățelului","dative-genitive-indefinite-plural":"brădățele","dative-definite-genitive-plural":"brădățelelor","singular-vocative":"brădățelule","plural-vocative":"brădățelelor"}},{"word":"Brădean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brădean"}},{"word":"Brădeana","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"f"},{"word":"Brădeanca","pos":"name","definitions":["a village in Jirlău, Brăila County, Romania","a village in Vernești, Buzău County, Romania"],"gender":"f"},{"word":"Brădeanu","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Brădeanu, Buzău County, Romania"],"gender":"m"},{"word":"Brădeni","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Brădeni, Sibiu County, Romania"],"gender":"m"},{"word":"Brădescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brădescu"}},{"word":"Brădești","pos":"name","definitions":["a village in Râmeț, Alba County, Romania","a commune of Dolj County, Romania","a village in Brădești, Dolj County, Romania","a commune of Harghita County, Romania","a village in Brădești, Harghita County, Romania"],"gender":"m"},{"word":"Brădeștii Bătrâni","pos":"name","definitions":["a village in Brădești, Dolj County, Romania"],"gender":"m","forms":{"alternative":"Brădeștii Bătrîni"}},{"word":"Brădet","pos":"name","definitions":["a village in Almașu Mare, Alba County, Romania","a village in Buntești, Bihor County, Romania","a village in Întorsura Buzăului, Covasna County, Romania","a village in Mătăsari, Gorj County, Romania","a village in Starchiojd, Prahova County, Romania"],"gender":"m"},{"word":"brădet","pos":"noun","definitions":["pine or fir forest"],"forms":{"plural":"brădeturi"}},{"word":"brădeț","pos":"noun","definitions":["diminutive of brad"],"forms":{"plural":"brădeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădeț","accusative-definite-nominative-singular":"brădețul","accusative-indefinite-nominative-plural":"brădeți","accusative-definite-nominative-plural":"brădeții","dative-genitive-indefinite-singular":"brădeț","dative-definite-genitive-singular":"brădețului","dative-genitive-indefinite-plural":"brădeți","dative-definite-genitive-plural":"brădeților","singular-vocative":"brădețule","plural-vocative":"brădeților"}},{"word":"Brădețel","pos":"name","definitions":["a village in Mătăsari, Gorj County, Romania"],"gender":"m"},{"word":"Brădețelu","pos":"name","definitions":["a village in Ibănești, Mureș County, Romania"],"gender":"m"},{"word":"Brădetu","pos":"name","definitions":["a village in Brăduleț, Argeș County, Romania","a village in Nistorești, Vrancea County, Romania"],"gender":"m"},{"word":"brădetul","pos":"noun","definitions":["definite nominative/accusative singular of brădet"]},{"word":"bradiartrie","pos":"noun","definitions":["bradyarthria"],"forms":{"plural":"bradiartrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bradiartrie","accusative-definite-nominative-singular":"bradiartria","accusative-indefinite-nominative-plural":"bradiartrii","accusative-definite-nominative-plural":"bradiartriile","dative-genitive-indefinite-singular":"bradiartrii","dative-definite-genitive-singular":"bradiartriei","dative-genitive-indefinite-plural":"bradiartrii","dative-definite-genitive-plural":"bradiartriilor","singular-vocative":"bradiartrie","plural-vocative":"bradiartriilor"}},{"word":"bradicardic","pos":"adj","definitions":["bradycardiac"],"forms":{"feminine-singular":"bradicardică","masculine-plural":"bradicardici","feminine-neuter-plural":"bradicardice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bradicardic","error-unrecognized-form-feminine-indefinite-singular":"bradicardică","error-unrecognized-form-indefinite-masculine-plural":"bradicardici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bradicardice","definite-error-unrecognized-form-masculine-neuter-singular":"bradicardicul","definite-error-unrecognized-form-feminine-singular":"bradicardica","definite-error-unrecognized-form-masculine-plural":"bradicardicii","definite-error-unrecognized-form-feminine-neuter-plural":"bradicardicele"}},{"word":"bradicardie","pos":"noun","definitions":["bradycardia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bradicardie","accusative-definite-nominative":"bradicardia","dative-genitive-indefinite":"bradicardii","dative-definite-genitive":"bradicardiei","vocative":"bradicardie"}},{"word":"Brădiceni","pos":"name","definitions":["a village in Peștișani, Gorj County, Romania"],"gender":"m"},{"word":"Brădicești","pos":"name","definitions":["a village in Dolhești, Iași County, Romania"],"gender":"m"},{"word":"bradichinezie","pos":"noun","definitions":["bradykinesia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bradichinezie","accusative-definite-nominative":"bradichinezia","dative-genitive-indefinite":"bradichinezii","dative-definite-genitive":"bradichineziei","vocative":"bradichinezie"}},{"word":"bradifagie","pos":"noun","definitions":["bradyphagia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bradifagie","accusative-definite-nominative":"bradifagia","dative-genitive-indefinite":"bradifagii","dative-definite-genitive":"bradifagiei","vocative":"bradifagie"}},{"word":"bradifazie","pos":"noun","definitions":["bradyphasia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bradifazie","accusative-definite-nominative-singular":"bradifazia","accusative-indefinite-nominative-plural":"bradifazii","accusative-definite-nominative-plural":"bradifaziile","dative-genitive-indefinite-singular":"bradifazii","dative-definite-genitive-singular":"bradifaziei","dative-genitive-indefinite-plural":"bradifazii","dative-definite-genitive-plural":"bradifaziilor","singular-vocative":"bradifazie","plural-vocative":"bradifaziilor"}},{"word":"bradilalie","pos":"noun","definitions":["bradylalia"],"forms":{"plural":"bradilalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bradilalie","accusative-definite-nominative-singular":"bradilalia","accusative-indefinite-nominative-plural":"bradilalii","accusative-definite-nominative-plural":"bradilaliile","dative-genitive-indefinite-singular":"bradilalii","dative-definite-genitive-singular":"bradilaliei","dative-genitive-indefinite-plural":"bradilalii","dative-definite-genitive-plural":"bradilaliilor","singular-vocative":"bradilalie","plural-vocative":"bradilaliilor"}},{"word":"brădioara","pos":"noun","definitions":["definite nominative/accusative singular of brădioară"],"gender":"f"},{"word":"brădioară","pos":"noun","definitions":["hazel grouse (Tetrastes bonasia)"],"pronunciation":"/brə.diˈo̯a.rə/","forms":{"plural":"brădioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brădioară","accusative-definite-nominative-singular":"brădioara","accusative-indefinite-nominative-plural":"brădioare","accusative-definite-nominative-plural":"brădioarele","dative-genitive-indefinite-singular":"brădioare","dative-definite-genitive-singular":"brădioarei","dative-genitive-indefinite-plural":"brădioare","dative-definite-genitive-plural":"brădioarelor","singular-vocative":"brădioară","plural-vocative":"brădioarelor"}},{"word":"brădioare","pos":"noun","definitions":["inflection of brădioară:","indefinite genitive/dative singular","indefinite nominative/accusative/genitive/dative plural"],"gender":"f"},{"word":"bradipepsie","pos":"noun","definitions":["bradypepsia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bradipepsie","accusative-definite-nominative-singular":"bradipepsia","accusative-indefinite-nominative-plural":"bradipepsii","accusative-definite-nominative-plural":"bradipepsiile","dative-genitive-indefinite-singular":"bradipepsii","dative-definite-genitive-singular":"bradipepsiei","dative-genitive-indefinite-plural":"bradipepsii","dative-definite-genitive-plural":"bradipepsiilor","singular-vocative":"bradipepsie","plural-vocative":"bradipepsiilor"}},{"word":"bradipsihie","pos":"noun","definitions":["bradypsychia"],"forms":{"plural":"bradipsihii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bradipsihie","accusative-definite-nominative-singular":"bradipsihia","accusative-indefinite-nominative-plural":"bradipsihii","accusative-definite-nominative-plural":"bradipsihiile","dative-genitive-indefinite-singular":"bradipsihii","dative-definite-genitive-singular":"bradipsihiei","dative-genitive-indefinite-plural":"bradipsihii","dative-definite-genitive-plural":"bradipsihiilor","singular-vocative":"bradipsihie","plural-vocative":"bradipsihiilor"}},{"word":"Brădiș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brădiș"}},{"word":"brădiș","pos":"noun","definitions":["fir tree grove"],"forms":{"plural":"brădișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brădiș","accusative-definite-nominative-singular":"brădișul","accusative-indefinite-nominative-plural":"brădișuri","accusative-definite-nominative-plural":"brădișurile","dative-genitive-indefinite-singular":"brădiș","dative-definite-genitive-singular":"brădișului","dative-genitive-indefinite-plural":"brădișuri","dative-definite-genitive-plural":"brădișurilor","singular-vocative":"brădișule","plural-vocative":"brădișurilor"}},{"word":"bradiseismic","pos":"adj","definitions":["bradyseismic"],"forms":{"feminine-singular":"bradiseismică","masculine-plural":"bradiseismici","feminine-neuter-plural":"bradiseismice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bradiseismic","error-unrecognized-form-feminine-indefinite-singular":"bradiseismică","error-unrecognized-form-indefinite-masculine-plural":"bradiseismici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bradiseismice","definite-error-unrecognized-form-masculine-neuter-singular":"bradiseismicul","definite-error-unrecognized-form-feminine-singular":"bradiseismica","definite-error-unrecognized-form-masculine-plural":"bradiseismicii","definite-error-unrecognized-form-feminine-neuter-plural":"bradiseismicele"}},{"word":"Brădișor","pos":"name","definitions":["a village in Berislăvești, Vâlcea County, Romania","a river in Hunedoara, Romania, tributary to the Valea Satului","a river in Vâlcea, Romania, tributary to the Coisca"],"gender":"m"},{"word":"brădișor","pos":"noun","definitions":["diminutive of brad; small fir"],"forms":{"plural":"brădișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădișor","accusative-definite-nominative-singular":"brădișorul","accusative-indefinite-nominative-plural":"brădișori","accusative-definite-nominative-plural":"brădișorii","dative-genitive-indefinite-singular":"brădișor","dative-definite-genitive-singular":"brădișorului","dative-genitive-indefinite-plural":"brădișori","dative-definite-genitive-plural":"brădișorilor","singular-vocative":"brădișorule","plural-vocative":"brădișorilor"}},{"word":"Brădișoru de Jos","pos":"name","definitions":["a village in Oravița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Brădișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brădișteanu"}},{"word":"braditrofie","pos":"noun","definitions":["bradytrophy"],"forms":{"plural":"braditrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"braditrofie","accusative-definite-nominative-singular":"braditrofia","accusative-indefinite-nominative-plural":"braditrofii","accusative-definite-nominative-plural":"braditrofiile","dative-genitive-indefinite-singular":"braditrofii","dative-definite-genitive-singular":"braditrofiei","dative-genitive-indefinite-plural":"braditrofii","dative-definite-genitive-plural":"braditrofiilor","singular-vocative":"braditrofie","plural-vocative":"braditrofiilor"}},{"word":"Bradu","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bradu, Argeș County, Romania","a village in Grințieș, Neamț County, Romania","a village in Avrig, Sibiu County, Romania"],"gender":"m"},{"word":"Bradu-Clocotici","pos":"name","definitions":["a village in Racovița, Vâlcea County, Romania"],"gender":"m"},{"word":"brăducean","pos":"noun","definitions":["diminutive of brad"],"forms":{"plural":"brăduceni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brăducean","accusative-definite-nominative-singular":"brăduceanul","accusative-indefinite-nominative-plural":"brăduceni","accusative-definite-nominative-plural":"brăducenii","dative-genitive-indefinite-singular":"brăducean","dative-definite-genitive-singular":"brăduceanului","dative-genitive-indefinite-plural":"brăduceni","dative-definite-genitive-plural":"brăducenilor","singular-vocative":"brăduceanule","plural-vocative":"brăducenilor"}},{"word":"brădui","pos":"noun","definitions":["diminutive of brad"],"forms":{"plural":"brădui","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădui","accusative-definite-nominative-singular":"brăduiul","accusative-indefinite-nominative-plural":"brădui","accusative-definite-nominative-plural":"brăduii","dative-genitive-indefinite-singular":"brădui","dative-definite-genitive-singular":"brăduiului","dative-genitive-indefinite-plural":"brădui","dative-definite-genitive-plural":"brăduilor","singular-vocative":"brăduiule","plural-vocative":"brăduilor"}},{"word":"brăduiță","pos":"noun","definitions":["European black pine (Pinus nigra)"],"forms":{"plural":"brăduițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brăduiță","accusative-definite-nominative-singular":"brăduița","accusative-indefinite-nominative-plural":"brăduițe","accusative-definite-nominative-plural":"brăduițele","dative-genitive-indefinite-singular":"brăduițe","dative-definite-genitive-singular":"brăduiței","dative-genitive-indefinite-plural":"brăduițe","dative-definite-genitive-plural":"brăduițelor","singular-vocative":"brăduiță","plural-vocative":"brăduițelor"}},{"word":"bradul","pos":"noun","definitions":["definite nominative/accusative singular of brad"]},{"word":"Bradul Înalt","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea Cheii"],"gender":"m"},{"word":"Brăduleț","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Brăduleț, Argeș County, Romania"],"gender":"m"},{"word":"brăduleț","pos":"noun","definitions":["diminutive of brad; small fir"],"forms":{"plural":"brăduleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brăduleț","accusative-definite-nominative-singular":"brădulețul","accusative-indefinite-nominative-plural":"brăduleți","accusative-definite-nominative-plural":"brăduleții","dative-genitive-indefinite-singular":"brăduleț","dative-definite-genitive-singular":"brădulețului","dative-genitive-indefinite-plural":"brăduleți","dative-definite-genitive-plural":"brăduleților","singular-vocative":"brădulețule","plural-vocative":"brăduleților"}},{"word":"bradului","pos":"noun","definitions":["definite genitive/dative singular of brad"]},{"word":"brădușcan","pos":"noun","definitions":["diminutive of brad"],"forms":{"plural":"brădușcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădușcan","accusative-definite-nominative-singular":"brădușcanul","accusative-indefinite-nominative-plural":"brădușcani","accusative-definite-nominative-plural":"brădușcanii","dative-genitive-indefinite-singular":"brădușcan","dative-definite-genitive-singular":"brădușcanului","dative-genitive-indefinite-plural":"brădușcani","dative-definite-genitive-plural":"brădușcanilor","singular-vocative":"brădușcanule","plural-vocative":"brădușcanilor"}},{"word":"brădușcare","pos":"noun","definitions":["diminutive of brad"],"forms":{"plural":"brădușcari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădușcare","accusative-definite-nominative-singular":"brădușcareul","accusative-indefinite-nominative-plural":"brădușcari","accusative-definite-nominative-plural":"brădușcarii","dative-genitive-indefinite-singular":"brădușcare","dative-definite-genitive-singular":"brădușcareului","dative-genitive-indefinite-plural":"brădușcari","dative-definite-genitive-plural":"brădușcarilor","singular-vocative":"brădușcareule","plural-vocative":"brădușcarilor"}},{"word":"brădușor","pos":"noun","definitions":["common bladderwort (Utricularia vulgaris)"],"forms":{"plural":"brădușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brădușor","accusative-definite-nominative-singular":"brădușorul","accusative-indefinite-nominative-plural":"brădușori","accusative-definite-nominative-plural":"brădușorii","dative-genitive-indefinite-singular":"brădușor","dative-definite-genitive-singular":"brădușorului","dative-genitive-indefinite-plural":"brădușori","dative-definite-genitive-plural":"brădușorilor","singular-vocative":"brădușorule","plural-vocative":"brădușorilor"}},{"word":"Brăduț","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Brăduț, Covasna County, Romania"],"gender":"m"},{"word":"brăduț","pos":"noun","definitions":["diminutive of brad; small fir"],"forms":{"plural":"brăduți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brăduț","accusative-definite-nominative-singular":"brăduțul","accusative-indefinite-nominative-plural":"brăduți","accusative-definite-nominative-plural":"brăduții","dative-genitive-indefinite-singular":"brăduț","dative-definite-genitive-singular":"brăduțului","dative-genitive-indefinite-plural":"brăduți","dative-definite-genitive-plural":"brăduților","singular-vocative":"brăduțule","plural-vocative":"brăduților"}},{"word":"Brăești","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Brăești, Botoșani County, Romania","a commune of Buzău County, Romania","a village in Brăești, Buzău County, Romania","a commune of Iași County, Romania"],"gender":"m"},{"word":"Brăete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brăete"}},{"word":"Braga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Braga"}},{"word":"Bragă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bragă"}},{"word":"bragă","pos":"noun","definitions":["millet beer"],"forms":{"plural":"brăgi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bragă","accusative-definite-nominative-singular":"braga","accusative-indefinite-nominative-plural":"brăgi","accusative-definite-nominative-plural":"brăgile","dative-genitive-indefinite-singular":"brăgi","dative-definite-genitive-singular":"brăgii","dative-genitive-indefinite-plural":"brăgi","dative-definite-genitive-plural":"brăgilor","singular-vocative":"bragă","plural-vocative":"brăgilor"}},{"word":"Bragadireanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bragadireanu"}},{"word":"Bragadiru","pos":"name","definitions":["a town in Ilfov County, Romania","a commune of Teleorman County, Romania","a village in Bragadiru, Teleorman County, Romania"],"gender":"m"},{"word":"bragagerie","pos":"noun","definitions":["millet beer shop"],"forms":{"plural":"bragagerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bragagerie","accusative-definite-nominative-singular":"bragageria","accusative-indefinite-nominative-plural":"bragagerii","accusative-definite-nominative-plural":"bragageriile","dative-genitive-indefinite-singular":"bragagerii","dative-definite-genitive-singular":"bragageriei","dative-genitive-indefinite-plural":"bragagerii","dative-definite-genitive-plural":"bragageriilor","singular-vocative":"bragagerie","plural-vocative":"bragageriilor"}},{"word":"Bragagiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bragagiu"}},{"word":"bragagiu","pos":"noun","definitions":["millet beer producer or salesman"],"forms":{"plural":"bragagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bragagiu","accusative-definite-nominative-singular":"bragagiuul","accusative-indefinite-nominative-plural":"bragagii","accusative-definite-nominative-plural":"bragagiii","dative-genitive-indefinite-singular":"bragagiu","dative-definite-genitive-singular":"bragagiuului","dative-genitive-indefinite-plural":"bragagii","dative-definite-genitive-plural":"bragagiilor","singular-vocative":"bragagiuule","plural-vocative":"bragagiilor"}},{"word":"Brăgan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brăgan"}},{"word":"Brăgăreasa","pos":"name","definitions":["a village in Scutelnici, Buzău County, Romania"],"gender":"f"},{"word":"Braghină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Braghină"}},{"word":"Brâgleasa","pos":"name","definitions":["a village in Dumbrava, Mehedinți County, Romania"],"gender":"f","forms":{"alternative":"Brîgleasa"}},{"word":"brahagiu","pos":"noun","definitions":["obsolete form of bragagiu"],"forms":{"plural":"brahagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brahagiu","accusative-definite-nominative-singular":"brahagiuul","accusative-indefinite-nominative-plural":"brahagii","accusative-definite-nominative-plural":"brahagiii","dative-genitive-indefinite-singular":"brahagiu","dative-definite-genitive-singular":"brahagiuului","dative-genitive-indefinite-plural":"brahagii","dative-definite-genitive-plural":"brahagiilor","singular-vocative":"brahagiuule","plural-vocative":"brahagiilor"}},{"word":"Brăhășești","pos":"name","definitions":["a commune of Galați County, Romania","a village in Brăhășești, Galați County, Romania"],"gender":"m"},{"word":"Brăhășoaia","pos":"name","definitions":["a village in Ștefan cel Mare, Vaslui County, Romania"],"gender":"f"},{"word":"brahial","pos":"adj","definitions":["brachial"],"forms":{"feminine-singular":"brahială","masculine-plural":"brahiali","feminine-neuter-plural":"brahiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brahial","error-unrecognized-form-feminine-indefinite-singular":"brahială","error-unrecognized-form-indefinite-masculine-plural":"brahiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"brahiale","definite-error-unrecognized-form-masculine-neuter-singular":"brahialul","definite-error-unrecognized-form-feminine-singular":"brahiala","definite-error-unrecognized-form-masculine-plural":"brahialii","definite-error-unrecognized-form-feminine-neuter-plural":"brahialele"}},{"word":"brahialgie","pos":"noun","definitions":["brachialgia"],"forms":{"plural":"brahialgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brahialgie","accusative-definite-nominative-singular":"brahialgia","accusative-indefinite-nominative-plural":"brahialgii","accusative-definite-nominative-plural":"brahialgiile","dative-genitive-indefinite-singular":"brahialgii","dative-definite-genitive-singular":"brahialgiei","dative-genitive-indefinite-plural":"brahialgii","dative-definite-genitive-plural":"brahialgiilor","singular-vocative":"brahialgie","plural-vocative":"brahialgiilor"}},{"word":"brahiblast","pos":"noun","definitions":["brachyblast"],"forms":{"plural":"brahiblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brahiblast","accusative-definite-nominative-singular":"brahiblastul","accusative-indefinite-nominative-plural":"brahiblaste","accusative-definite-nominative-plural":"brahiblastele","dative-genitive-indefinite-singular":"brahiblast","dative-definite-genitive-singular":"brahiblastului","dative-genitive-indefinite-plural":"brahiblaste","dative-definite-genitive-plural":"brahiblastelor","singular-vocative":"brahiblastule","plural-vocative":"brahiblastelor"}},{"word":"brahicefal","pos":"adj","definitions":["brachycephalic"],"forms":{"feminine-singular":"brahicefală","masculine-plural":"brahicefali","feminine-neuter-plural":"brahicefale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brahicefal","error-unrecognized-form-feminine-indefinite-singular":"brahicefală","error-unrecognized-form-indefinite-masculine-plural":"brahicefali","error-unrecognized-form-feminine-indefinite-neuter-plural":"brahicefale","definite-error-unrecognized-form-masculine-neuter-singular":"brahicefalul","definite-error-unrecognized-form-feminine-singular":"brahicefala","definite-error-unrecognized-form-masculine-plural":"brahicefalii","definite-error-unrecognized-form-feminine-neuter-plural":"brahicefalele"}},{"word":"brahicefal","pos":"noun","definitions":["brachycephalic"],"forms":{"plural":"brahicefali","feminine":"equivalent brahicefală","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brahicefal","accusative-definite-nominative-singular":"brahicefalul","accusative-indefinite-nominative-plural":"brahicefali","accusative-definite-nominative-plural":"brahicefalii","dative-genitive-indefinite-singular":"brahicefal","dative-definite-genitive-singular":"brahicefalului","dative-genitive-indefinite-plural":"brahicefali","dative-definite-genitive-plural":"brahicefalilor","singular-vocative":"brahicefalule","plural-vocative":"brahicefalilor"}},{"word":"brahicefală","pos":"noun","definitions":["female equivalent of brahicefal"],"forms":{"plural":"brahicefale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brahicefală","accusative-definite-nominative-singular":"brahicefala","accusative-indefinite-nominative-plural":"brahicefale","accusative-definite-nominative-plural":"brahicefalele","dative-genitive-indefinite-singular":"brahicefale","dative-definite-genitive-singular":"brahicefalei","dative-genitive-indefinite-plural":"brahicefale","dative-definite-genitive-plural":"brahicefalelor","singular-vocative":"brahicefală","plural-vocative":"brahicefalelor"}},{"word":"brahicefalie","pos":"noun","definitions":["brachycephaly"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brahicefalie","accusative-definite-nominative-singular":"brahicefalia","accusative-indefinite-nominative-plural":"brahicefalii","accusative-definite-nominative-plural":"brahicefaliile","dative-genitive-indefinite-singular":"brahicefalii","dative-definite-genitive-singular":"brahicefaliei","dative-genitive-indefinite-plural":"brahicefalii","dative-definite-genitive-plural":"brahicefaliilor","singular-vocative":"brahicefalie","plural-vocative":"brahicefaliilor"}},{"word":"brahidactilie","pos":"noun","definitions":["brachydactyly"],"forms":{"plural":"brahidactilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brahidactilie","accusative-definite-nominative-singular":"brahidactilia","accusative-indefinite-nominative-plural":"brahidactilii","accusative-definite-nominative-plural":"brahidactiliile","dative-genitive-indefinite-singular":"brahidactilii","dative-definite-genitive-singular":"brahidactiliei","dative-genitive-indefinite-plural":"brahidactilii","dative-definite-genitive-plural":"brahidactiliilor","singular-vocative":"brahidactilie","plural-vocative":"brahidactiliilor"}},{"word":"brahilogie","pos":"noun","definitions":["brachyology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"brahilogie","accusative-definite-nominative":"brahilogia","dative-genitive-indefinite":"brahilogii","dative-definite-genitive":"brahilogiei","vocative":"brahilogie"}},{"word":"brahiocefalic","pos":"adj","definitions":["brachiocephalic"],"forms":{"feminine-singular":"brahiocefalică","masculine-plural":"brahiocefalici","feminine-neuter-plural":"brahiocefalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brahiocefalic","error-unrecognized-form-feminine-indefinite-singular":"brahiocefalică","error-unrecognized-form-indefinite-masculine-plural":"brahiocefalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"brahiocefalice","definite-error-unrecognized-form-masculine-neuter-singular":"brahiocefalicul","definite-error-unrecognized-form-feminine-singular":"brahiocefalica","definite-error-unrecognized-form-masculine-plural":"brahiocefalicii","definite-error-unrecognized-form-feminine-neuter-plural":"brahiocefalicele"}},{"word":"brahiopod","pos":"noun","definitions":["brachiopod"],"forms":{"plural":"brahiopode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brahiopod","accusative-definite-nominative-singular":"brahiopodul","accusative-indefinite-nominative-plural":"brahiopode","accusative-definite-nominative-plural":"brahiopodele","dative-genitive-indefinite-singular":"brahiopod","dative-definite-genitive-singular":"brahiopodului","dative-genitive-indefinite-plural":"brahiopode","dative-definite-genitive-plural":"brahiopodelor","singular-vocative":"brahiopodule","plural-vocative":"brahiopodelor"}},{"word":"brahistocronă","pos":"noun","definitions":["brachistochrone"],"forms":{"plural":"brahistocrone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brahistocronă","accusative-definite-nominative-singular":"brahistocrona","accusative-indefinite-nominative-plural":"brahistocrone","accusative-definite-nominative-plural":"brahistocronele","dative-genitive-indefinite-singular":"brahistocrone","dative-definite-genitive-singular":"brahistocronei","dative-genitive-indefinite-plural":"brahistocrone","dative-definite-genitive-plural":"brahistocronelor","singular-vocative":"brahistocronă","plural-vocative":"brahistocronelor"}},{"word":"brahman","pos":"noun","definitions":["brahmin"],"forms":{"plural":"brahmani","feminine":"equivalent brahmană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brahman","accusative-definite-nominative-singular":"brahmanul","accusative-indefinite-nominative-plural":"brahmani","accusative-definite-nominative-plural":"brahmanii","dative-genitive-indefinite-singular":"brahman","dative-definite-genitive-singular":"brahmanului","dative-genitive-indefinite-plural":"brahmani","dative-definite-genitive-plural":"brahmanilor","singular-vocative":"brahmanule","plural-vocative":"brahmanilor"}},{"word":"brahmană","pos":"noun","definitions":["female equivalent of brahman"],"forms":{"plural":"brahmane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brahmană","accusative-definite-nominative-singular":"brahmana","accusative-indefinite-nominative-plural":"brahmane","accusative-definite-nominative-plural":"brahmanele","dative-genitive-indefinite-singular":"brahmane","dative-definite-genitive-singular":"brahmanei","dative-genitive-indefinite-plural":"brahmane","dative-definite-genitive-plural":"brahmanelor","singular-vocative":"brahmană","plural-vocative":"brahmanelor"}},{"word":"brahmanic","pos":"adj","definitions":["Brahmanical"],"forms":{"feminine-singular":"brahmanică","masculine-plural":"brahmanici","feminine-neuter-plural":"brahmanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brahmanic","error-unrecognized-form-feminine-indefinite-singular":"brahmanică","error-unrecognized-form-indefinite-masculine-plural":"brahmanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"brahmanice","definite-error-unrecognized-form-masculine-neuter-singular":"brahmanicul","definite-error-unrecognized-form-feminine-singular":"brahmanica","definite-error-unrecognized-form-masculine-plural":"brahmanicii","definite-error-unrecognized-form-feminine-neuter-plural":"brahmanicele"}},{"word":"brahmanism","pos":"noun","definitions":["Brahmanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brahmanism","accusative-definite-nominative-singular":"brahmanismul","accusative-indefinite-nominative-plural":"brahmanisme","accusative-definite-nominative-plural":"brahmanismele","dative-genitive-indefinite-singular":"brahmanism","dative-definite-genitive-singular":"brahmanismului","dative-genitive-indefinite-plural":"brahmanisme","dative-definite-genitive-plural":"brahmanismelor","singular-vocative":"brahmanismule","plural-vocative":"brahmanismelor"}},{"word":"brahmin","pos":"noun","definitions":["brahmin"],"forms":{"plural":"brahmini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brahmin","accusative-definite-nominative-singular":"brahminul","accusative-indefinite-nominative-plural":"brahmini","accusative-definite-nominative-plural":"brahminii","dative-genitive-indefinite-singular":"brahmin","dative-definite-genitive-singular":"brahminului","dative-genitive-indefinite-plural":"brahmini","dative-definite-genitive-plural":"brahminilor","singular-vocative":"brahminule","plural-vocative":"brahminilor"}},{"word":"Braicău","pos":"name","definitions":["a village in Sudarca, Dondușeni Raion, Moldova"],"gender":"m"},{"word":"Brăiești","pos":"name","definitions":["a village in Cornu Luncii, Suceava County, Romania"],"gender":"m"},{"word":"Brăila","pos":"name","definitions":["a city in Brăila County, Romania","a county of Romania"],"pronunciation":"/brəˈila/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative":"Brăila","accusative-definite-nominative":"Brăilaua","dative-genitive-indefinite":"Brăilale","dative-definite-genitive":"Brăilalei","vocative":"Brăila"}},{"word":"Brăilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brăilă"}},{"word":"Brăilean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brăilean"}},{"word":"brăilean","pos":"noun","definitions":["native or inhabitant of Brăila (usually male)"],"forms":{"plural":"brăileni","feminine":"equivalent brăileană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brăilean","accusative-definite-nominative-singular":"brăileanul","accusative-indefinite-nominative-plural":"brăileni","accusative-definite-nominative-plural":"brăilenii","dative-genitive-indefinite-singular":"brăilean","dative-definite-genitive-singular":"brăileanului","dative-genitive-indefinite-plural":"brăileni","dative-definite-genitive-plural":"brăilenilor","singular-vocative":"brăileanule","plural-vocative":"brăilenilor"}},{"word":"brăileană","pos":"noun","definitions":["female equivalent of brăilean"],"forms":{"plural":"brăilene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brăileană","accusative-definite-nominative-singular":"brăileana","accusative-indefinite-nominative-plural":"brăilene","accusative-definite-nominative-plural":"brăilenele","dative-genitive-indefinite-singular":"brăilene","dative-definite-genitive-singular":"brăilenei","dative-genitive-indefinite-plural":"brăilene","dative-definite-genitive-plural":"brăilenelor","singular-vocative":"brăileană","plural-vocative":"brăilenelor"}},{"word":"brăileancă","pos":"noun","definitions":["female equivalent of brăilean"],"forms":{"plural":"brăilence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brăileancă","accusative-definite-nominative-singular":"brăileanca","accusative-indefinite-nominative-plural":"brăilence","accusative-definite-nominative-plural":"brăilencele","dative-genitive-indefinite-singular":"brăilence","dative-definite-genitive-singular":"brăilencei","dative-genitive-indefinite-plural":"brăilence","dative-definite-genitive-plural":"brăilencelor","singular-vocative":"brăileancă","plural-vocative":"brăilencelor"}},{"word":"Brăileanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brăileanu"}},{"word":"Brăileni","pos":"name","definitions":["a village in Bascov, Argeș County, Romania"],"gender":"m"},{"word":"Brăilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brăilescu"}},{"word":"Brăiloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brăiloiu"}},{"word":"brain drain","pos":"noun","definitions":["brain drain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brain drain","accusative-definite-nominative":"brain drainul","dative-genitive-indefinite":"brain drain","dative-definite-genitive":"brain drainului","vocative":"brain drainule"}},{"word":"brainstorming","pos":"noun","definitions":["brainstorming"],"forms":{"plural":"brainstorminguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brainstorming","accusative-definite-nominative-singular":"brainstormingul","accusative-indefinite-nominative-plural":"brainstorminguri","accusative-definite-nominative-plural":"brainstormingurile","dative-genitive-indefinite-singular":"brainstorming","dative-definite-genitive-singular":"brainstormingului","dative-genitive-indefinite-plural":"brainstorminguri","dative-definite-genitive-plural":"brainstormingurilor","singular-vocative":"brainstormingule","plural-vocative":"brainstormingurilor"}},{"word":"Brăișoru","pos":"name","definitions":["a village in Sâncraiu, Cluj County, Romania"],"gender":"m"},{"word":"Brăișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brăișteanu"}},{"word":"braișvanț","pos":"noun","definitions":["breitschwanz, broadtail"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"braișvanț","accusative-definite-nominative":"braișvanțul","dative-genitive-indefinite":"braișvanț","dative-definite-genitive":"braișvanțului","vocative":"braișvanțule"}},{"word":"brambureală","pos":"noun","definitions":["mess"],"forms":{"plural":"brambureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brambureală","accusative-definite-nominative-singular":"brambureala","accusative-indefinite-nominative-plural":"brambureli","accusative-definite-nominative-plural":"bramburelile","dative-genitive-indefinite-singular":"brambureli","dative-definite-genitive-singular":"bramburelii","dative-genitive-indefinite-plural":"brambureli","dative-definite-genitive-plural":"bramburelilor","singular-vocative":"brambureală","plural-vocative":"bramburelilor"}},{"word":"bramburi","pos":"verb","definitions":["to confuse, to make disorder"],"forms":{"canonical":"a bramburi 4th conjugation","present-singular-third-person":"bramburește","participle-past":"bramburit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bramburi","gerund":"bramburind","first-person-indicative-present-singular":"bramburesc","indicative-present-second-person-singular":"bramburești","indicative-present-singular-third-person":"bramburește","first-person-indicative-plural-present":"bramburim","indicative-plural-present-second-person":"bramburiți","indicative-plural-present-third-person":"bramburesc","first-person-imperfect-indicative-singular":"brambuream","imperfect-indicative-second-person-singular":"brambureai","imperfect-indicative-singular-third-person":"bramburea","first-person-imperfect-indicative-plural":"brambuream","imperfect-indicative-plural-second-person":"brambureați","imperfect-indicative-plural-third-person":"brambureau","first-person-indicative-perfect-singular":"bramburii","indicative-perfect-second-person-singular":"bramburiși","indicative-perfect-singular-third-person":"bramburi","first-person-indicative-perfect-plural":"bramburirăm","indicative-perfect-plural-second-person":"bramburirăți","indicative-perfect-plural-third-person":"bramburiră","first-person-indicative-pluperfect-singular":"bramburisem","indicative-pluperfect-second-person-singular":"bramburiseși","indicative-pluperfect-singular-third-person":"bramburise","first-person-indicative-pluperfect-plural":"bramburiserăm","indicative-pluperfect-plural-second-person":"bramburiserăți","indicative-pluperfect-plural-third-person":"bramburiseră","first-person-present-singular-subjunctive":"să bramburesc","present-second-person-singular-subjunctive":"să bramburești","present-singular-subjunctive-third-person":"să bramburească","first-person-plural-present-subjunctive":"să bramburim","plural-present-second-person-subjunctive":"să bramburiți","plural-present-subjunctive-third-person":"să bramburească","imperative-second-person-singular":"bramburește","imperative-plural-second-person":"bramburiți","imperative-negative-second-person-singular":"nu bramburi","imperative-negative-plural-second-person":"nu bramburiți"}},{"word":"bramburire","pos":"noun","definitions":["mess"],"forms":{"plural":"bramburiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bramburire","accusative-definite-nominative-singular":"bramburirea","accusative-indefinite-nominative-plural":"bramburiri","accusative-definite-nominative-plural":"bramburirile","dative-genitive-indefinite-singular":"bramburiri","dative-definite-genitive-singular":"bramburirii","dative-genitive-indefinite-plural":"bramburiri","dative-definite-genitive-plural":"bramburirilor","singular-vocative":"bramburire","plural-vocative":"bramburirilor"}},{"word":"bramin","pos":"noun","definitions":["obsolete form of brahman"],"forms":{"plural":"bramini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bramin","accusative-definite-nominative-singular":"braminul","accusative-indefinite-nominative-plural":"bramini","accusative-definite-nominative-plural":"braminii","dative-genitive-indefinite-singular":"bramin","dative-definite-genitive-singular":"braminului","dative-genitive-indefinite-plural":"bramini","dative-definite-genitive-plural":"braminilor","singular-vocative":"braminule","plural-vocative":"braminilor"}},{"word":"Bran","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Bran, Brașov County, Romania","a village in Golăiești, Iași County, Romania"],"gender":"m"},{"word":"brână","pos":"noun","definitions":["alternative form of brâu"],"forms":{"plural":"brâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brână","accusative-definite-nominative-singular":"brâna","accusative-indefinite-nominative-plural":"brâne","accusative-definite-nominative-plural":"brânele","dative-genitive-indefinite-singular":"brâne","dative-definite-genitive-singular":"brânei","dative-genitive-indefinite-plural":"brâne","dative-definite-genitive-plural":"brânelor","singular-vocative":"brână","plural-vocative":"brânelor","alternative":"brînă"}},{"word":"brânaș","pos":"noun","definitions":["diminutive of brână"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brânaș","accusative-definite-nominative":"brânașul","dative-genitive-indefinite":"brânaș","dative-definite-genitive":"brânașului","vocative":"brânașule"}},{"word":"brâncă","pos":"noun","definitions":["hand, paw"],"pronunciation":"/ˈbrɨn.kə/","forms":{"plural":"brânci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brâncă","accusative-definite-nominative-singular":"brânca","accusative-indefinite-nominative-plural":"brânci","accusative-definite-nominative-plural":"brâncile","dative-genitive-indefinite-singular":"brânci","dative-definite-genitive-singular":"brâncii","dative-genitive-indefinite-plural":"brânci","dative-definite-genitive-plural":"brâncilor","singular-vocative":"brâncă","plural-vocative":"brâncilor","alternative":"brîncă"}},{"word":"brâncă","pos":"noun","definitions":["Saint Anthony's fire, erysipelas","Salicornia herbacea"],"pronunciation":"/ˈbrɨn.kə/","forms":{"plural":"brânci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brâncă","accusative-definite-nominative-singular":"brânca","accusative-indefinite-nominative-plural":"brânci","accusative-definite-nominative-plural":"brâncile","dative-genitive-indefinite-singular":"brânci","dative-definite-genitive-singular":"brâncii","dative-genitive-indefinite-plural":"brânci","dative-definite-genitive-plural":"brâncilor","singular-vocative":"brâncă","plural-vocative":"brâncilor","alternative":"brîncă"}},{"word":"brânca ursului","pos":"noun","definitions":["hogweed (Heracleum spp.)"]},{"word":"brânca-ursului","pos":"noun","definitions":["hogweed (Heracleum sphondylium)"]},{"word":"brancardă","pos":"noun","definitions":["stretcher"],"forms":{"plural":"brancarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brancardă","accusative-definite-nominative-singular":"brancarda","accusative-indefinite-nominative-plural":"brancarde","accusative-definite-nominative-plural":"brancardele","dative-genitive-indefinite-singular":"brancarde","dative-definite-genitive-singular":"brancardei","dative-genitive-indefinite-plural":"brancarde","dative-definite-genitive-plural":"brancardelor","singular-vocative":"brancardă","plural-vocative":"brancardelor"}},{"word":"brancardier","pos":"noun","definitions":["stretcher-bearer"],"pronunciation":"/ˌbraŋkardiˈer/","forms":{"plural":"brancardieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brancardier","accusative-definite-nominative-singular":"brancardierul","accusative-indefinite-nominative-plural":"brancardieri","accusative-definite-nominative-plural":"brancardierii","dative-genitive-indefinite-singular":"brancardier","dative-definite-genitive-singular":"brancardierului","dative-genitive-indefinite-plural":"brancardieri","dative-definite-genitive-plural":"brancardierilor","singular-vocative":"brancardierule","plural-vocative":"brancardierilor"}},{"word":"brancardieră","pos":"noun","definitions":["female equivalent of brancardier"],"forms":{"plural":"brancardiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brancardieră","accusative-definite-nominative-singular":"brancardiera","accusative-indefinite-nominative-plural":"brancardiere","accusative-definite-nominative-plural":"brancardierele","dative-genitive-indefinite-singular":"brancardiere","dative-definite-genitive-singular":"brancardierei","dative-genitive-indefinite-plural":"brancardiere","dative-definite-genitive-plural":"brancardierelor","singular-vocative":"brancardieră","plural-vocative":"brancardierelor"}},{"word":"Brânceni","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Brânceni, Teleorman County, Romania"],"gender":"m","forms":{"alternative":"Brînceni"}},{"word":"brânci","pos":"noun","definitions":["obsolete form of brâncă"],"forms":{"plural":"brânci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brânci","accusative-definite-nominative-singular":"brânciul","accusative-indefinite-nominative-plural":"brânci","accusative-definite-nominative-plural":"brâncii","dative-genitive-indefinite-singular":"brânci","dative-definite-genitive-singular":"brânciului","dative-genitive-indefinite-plural":"brânci","dative-definite-genitive-plural":"brâncilor","singular-vocative":"brânciule","plural-vocative":"brâncilor","alternative":"brînci"}},{"word":"branciog","pos":"noun","definitions":["low fertility chalky soil"],"forms":{"plural":"brancioguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"branciog","accusative-definite-nominative-singular":"branciogul","accusative-indefinite-nominative-plural":"brancioguri","accusative-definite-nominative-plural":"branciogurile","dative-genitive-indefinite-singular":"branciog","dative-definite-genitive-singular":"branciogului","dative-genitive-indefinite-plural":"brancioguri","dative-definite-genitive-plural":"branciogurilor","singular-vocative":"branciogule","plural-vocative":"branciogurilor"}},{"word":"Brâncoveanca","pos":"name","definitions":["a village in Plopii-Slăvitești, Teleorman County, Romania"],"gender":"f","forms":{"alternative":"Brîncoveanca"}},{"word":"Brâncoveanu","pos":"name","definitions":["a surname","a village in Odobești, Dâmbovița County, Romania"],"gender":"m","forms":{"alternative":"Brîncoveanu"}},{"word":"brâncovenesc","pos":"adj","definitions":["Relating to Wallachian ruler Constantin Brâncoveanu or his times.","Belonging to an art style associated with the reign of Constantin Brâncoveanu."],"pronunciation":"/brɨn.ko.veˈnesk/","examples":[{"ro":"stil brâncovenesc","en":"Brâncovenesc style"}],"forms":{"feminine-singular":"brâncovenească","plural":"brâncovenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brâncovenesc","error-unrecognized-form-feminine-indefinite-singular":"brâncovenească","error-unrecognized-form-indefinite-masculine-plural":"brâncovenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"brâncovenești","definite-error-unrecognized-form-masculine-neuter-singular":"brâncovenescul","definite-error-unrecognized-form-feminine-singular":"brâncoveneasca","definite-error-unrecognized-form-masculine-plural":"brâncoveneștii","definite-error-unrecognized-form-feminine-neuter-plural":"brâncoveneștile","alternative":"brîncovenesc"}},{"word":"Brâncovenești","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Brâncovenești, Mureș County, Romania"],"gender":"m","forms":{"alternative":"Brîncovenești"}},{"word":"Brâncoveni","pos":"name","definitions":["a commune of Olt County, Romania","a village in Brâncoveni, Olt County, Romania"],"gender":"m","forms":{"alternative":"Brîncoveni"}},{"word":"brânculiță","pos":"noun","definitions":["tumble mustard, hedge mustard (Sisymbrium officinale)"],"forms":{"plural":"brânculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brânculiță","accusative-definite-nominative-singular":"brânculița","accusative-indefinite-nominative-plural":"brânculițe","accusative-definite-nominative-plural":"brânculițele","dative-genitive-indefinite-singular":"brânculițe","dative-definite-genitive-singular":"brânculiței","dative-genitive-indefinite-plural":"brânculițe","dative-definite-genitive-plural":"brânculițelor","singular-vocative":"brânculiță","plural-vocative":"brânculițelor","alternative":"brînculiță"}},{"word":"Brâncuși","pos":"name","definitions":["a surname","Constantin Brâncuși, Romanian plastic artist."],"pronunciation":"/brɨnˈkuʃʲ/","gender":"m","forms":{"alternative":"Brîncuși"}},{"word":"brâncușian","pos":"adj","definitions":["Of or pertaining to the Romanian sculptor Constantin Brâncuși or in the style of Brâncuși."],"forms":{"feminine-singular":"brâncușiană","masculine-plural":"brâncușieni","feminine-neuter-plural":"brâncușiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brâncușian","error-unrecognized-form-feminine-indefinite-singular":"brâncușiană","error-unrecognized-form-indefinite-masculine-plural":"brâncușieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"brâncușiene","definite-error-unrecognized-form-masculine-neuter-singular":"brâncușianul","definite-error-unrecognized-form-feminine-singular":"brâncușiana","definite-error-unrecognized-form-masculine-plural":"brâncușienii","definite-error-unrecognized-form-feminine-neuter-plural":"brâncușienele","alternative":"brîncușian"}},{"word":"brand","pos":"noun","definitions":["brand"],"forms":{"plural":"branduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brand","accusative-definite-nominative-singular":"brandul","accusative-indefinite-nominative-plural":"branduri","accusative-definite-nominative-plural":"brandurile","dative-genitive-indefinite-singular":"brand","dative-definite-genitive-singular":"brandului","dative-genitive-indefinite-plural":"branduri","dative-definite-genitive-plural":"brandurilor","singular-vocative":"brandule","plural-vocative":"brandurilor"}},{"word":"Brânduș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brânduș","alternative":"Brînduș"}},{"word":"Brândușa","pos":"name","definitions":["a village in Bistreț, Dolj County, Romania"],"gender":"f","forms":{"alternative":"Brîndușa"}},{"word":"brândușa","pos":"noun","definitions":["definite nominative/accusative singular of brândușă"]},{"word":"Brândușă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brândușă","alternative":"Brîndușă"}},{"word":"brândușă","pos":"noun","definitions":["crocus (plant of genus Crocus)"],"forms":{"plural":"brândușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brândușă","accusative-definite-nominative-singular":"brândușa","accusative-indefinite-nominative-plural":"brândușe","accusative-definite-nominative-plural":"brândușele","dative-genitive-indefinite-singular":"brândușe","dative-definite-genitive-singular":"brândușei","dative-genitive-indefinite-plural":"brândușe","dative-definite-genitive-plural":"brândușelor","singular-vocative":"brândușă","plural-vocative":"brândușelor","alternative":"brîndușă"}},{"word":"brândușă de munte","pos":"noun","definitions":["spring crocus (Crocus vernus)"],"forms":{"plural":"brândușe de munte"}},{"word":"brândușă de toamnă","pos":"noun","definitions":["autumn crocus (Colchicum autumnale)"],"forms":{"plural":"brândușe de toamnă"}},{"word":"brândușea","pos":"noun","definitions":["diminutive of brândușă; small crocus"],"forms":{"plural":"brândușele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"brândușea","accusative-definite-nominative-singular":"brândușeaua","accusative-indefinite-nominative-plural":"brândușele","accusative-definite-nominative-plural":"brândușelele","dative-genitive-indefinite-singular":"brândușele","dative-definite-genitive-singular":"brândușelei","dative-genitive-indefinite-plural":"brândușele","dative-definite-genitive-plural":"brândușelelor","singular-vocative":"-","plural-vocative":"-","alternative":"brîndușea"}},{"word":"Brândușel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brândușel","alternative":"Brîndușel"}},{"word":"Brândușescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brândușescu","alternative":"Brîndușescu"}},{"word":"brândușiță","pos":"noun","definitions":["diminutive of brândușă; small crocus"],"forms":{"plural":"brândușițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brândușiță","accusative-definite-nominative-singular":"brândușița","accusative-indefinite-nominative-plural":"brândușițe","accusative-definite-nominative-plural":"brândușițele","dative-genitive-indefinite-singular":"brândușițe","dative-definite-genitive-singular":"brândușiței","dative-genitive-indefinite-plural":"brândușițe","dative-definite-genitive-plural":"brândușițelor","singular-vocative":"brândușiță","plural-vocative":"brândușițelor","alternative":"brîndușiță"}},{"word":"Brândușoiu","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Brândușoiu","alternative":"Brîndușoiu"}},{"word":"brandy","pos":"noun","definitions":["brandy"],"forms":{"plural":"brandy-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brandy","accusative-definite-nominative-singular":"brandyul","accusative-indefinite-nominative-plural":"brandy-uri","accusative-definite-nominative-plural":"brandy-urile","dative-genitive-indefinite-singular":"brandy","dative-definite-genitive-singular":"brandyului","dative-genitive-indefinite-plural":"brandy-uri","dative-definite-genitive-plural":"brandy-urilor","singular-vocative":"brandyule","plural-vocative":"brandy-urilor"}},{"word":"Brăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brăneanu"}},{"word":"Brăneasa","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Valea Ursului"],"gender":"f"},{"word":"Branescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Branescu"}},{"word":"Brănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brănescu"}},{"word":"Brănești","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Brănești, Dâmbovița County, Romania","a village in Vlădești, Galați County, Romania","a commune of Gorj County, Romania","a village in Brănești, Gorj County, Romania"],"gender":"m"},{"word":"Braneț","pos":"name","definitions":["a village in Bârza, Olt County, Romania"],"gender":"m"},{"word":"branhial","pos":"adj","definitions":["branchial"],"forms":{"feminine-singular":"branhială","masculine-plural":"branhiali","feminine-neuter-plural":"branhiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"branhial","error-unrecognized-form-feminine-indefinite-singular":"branhială","error-unrecognized-form-indefinite-masculine-plural":"branhiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"branhiale","definite-error-unrecognized-form-masculine-neuter-singular":"branhialul","definite-error-unrecognized-form-feminine-singular":"branhiala","definite-error-unrecognized-form-masculine-plural":"branhialii","definite-error-unrecognized-form-feminine-neuter-plural":"branhialele"}},{"word":"branhie","pos":"noun","definitions":["gill"],"forms":{"plural":"branhii"}},{"word":"branhiopod","pos":"noun","definitions":["branchiopod"],"forms":{"plural":"branhiopode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"branhiopod","accusative-definite-nominative-singular":"branhiopodul","accusative-indefinite-nominative-plural":"branhiopode","accusative-definite-nominative-plural":"branhiopodele","dative-genitive-indefinite-singular":"branhiopod","dative-definite-genitive-singular":"branhiopodului","dative-genitive-indefinite-plural":"branhiopode","dative-definite-genitive-plural":"branhiopodelor","singular-vocative":"branhiopodule","plural-vocative":"branhiopodelor"}},{"word":"branhiozaur","pos":"noun","definitions":["branchiosaur"],"forms":{"plural":"branhiozauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"branhiozaur","accusative-definite-nominative-singular":"branhiozaurul","accusative-indefinite-nominative-plural":"branhiozauri","accusative-definite-nominative-plural":"branhiozaurii","dative-genitive-indefinite-singular":"branhiozaur","dative-definite-genitive-singular":"branhiozaurului","dative-genitive-indefinite-plural":"branhiozauri","dative-definite-genitive-plural":"branhiozaurilor","singular-vocative":"branhiozaurule","plural-vocative":"branhiozaurilor"}},{"word":"brăni","pos":"verb","definitions":["to stop"],"forms":{"canonical":"a brăni 4th conjugation","present-singular-third-person":"brănie","participle-past":"brănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a brăni","gerund":"brănind","first-person-indicative-present-singular":"brăn","indicative-present-second-person-singular":"brăni","indicative-present-singular-third-person":"brăne","first-person-indicative-plural-present":"brănim","indicative-plural-present-second-person":"brăniți","indicative-plural-present-third-person":"brăn","first-person-imperfect-indicative-singular":"brăneam","imperfect-indicative-second-person-singular":"brăneai","imperfect-indicative-singular-third-person":"brănea","first-person-imperfect-indicative-plural":"brăneam","imperfect-indicative-plural-second-person":"brăneați","imperfect-indicative-plural-third-person":"brăneau","first-person-indicative-perfect-singular":"brănii","indicative-perfect-second-person-singular":"brăniși","indicative-perfect-singular-third-person":"brăni","first-person-indicative-perfect-plural":"brănirăm","indicative-perfect-plural-second-person":"brănirăți","indicative-perfect-plural-third-person":"brăniră","first-person-indicative-pluperfect-singular":"brănisem","indicative-pluperfect-second-person-singular":"brăniseși","indicative-pluperfect-singular-third-person":"brănise","first-person-indicative-pluperfect-plural":"brăniserăm","indicative-pluperfect-plural-second-person":"brăniserăți","indicative-pluperfect-plural-third-person":"brăniseră","first-person-present-singular-subjunctive":"să brăn","present-second-person-singular-subjunctive":"să brăni","present-singular-subjunctive-third-person":"să brănă","first-person-plural-present-subjunctive":"să brănim","plural-present-second-person-subjunctive":"să brăniți","plural-present-subjunctive-third-person":"să brănă","imperative-second-person-singular":"brăne","imperative-plural-second-person":"brăniți","imperative-negative-second-person-singular":"nu brăni","imperative-negative-plural-second-person":"nu brăniți"}},{"word":"Brănișca","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Brănișca, Hunedoara County, Romania"],"gender":"f"},{"word":"Brănișcan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brănișcan"}},{"word":"brânișor","pos":"noun","definitions":["diminutive of brână"],"forms":{"plural":"brânișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brânișor","accusative-definite-nominative-singular":"brânișorul","accusative-indefinite-nominative-plural":"brânișoare","accusative-definite-nominative-plural":"brânișoarele","dative-genitive-indefinite-singular":"brânișor","dative-definite-genitive-singular":"brânișorului","dative-genitive-indefinite-plural":"brânișoare","dative-definite-genitive-plural":"brânișoarelor","singular-vocative":"brânișorule","plural-vocative":"brânișoarelor","alternative":"brînișor"}},{"word":"Brăniștari","pos":"name","definitions":["a village in Călugăreni, Giurgiu County, Romania"],"gender":"m"},{"word":"Braniște","pos":"name","definitions":["a village in Filiași, Dolj County, Romania","a village in Daneți, Dolj County, Romania","a village in Podari, Dolj County, Romania"],"gender":"m"},{"word":"braniște","pos":"noun","definitions":["forest reserve"],"forms":{"plural":"braniști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"braniște","accusative-definite-nominative-singular":"braniștea","accusative-indefinite-nominative-plural":"braniști","accusative-definite-nominative-plural":"braniștile","dative-genitive-indefinite-singular":"braniști","dative-definite-genitive-singular":"braniștii","dative-genitive-indefinite-plural":"braniști","dative-definite-genitive-plural":"braniștilor","singular-vocative":"braniște","plural-vocative":"braniștilor"}},{"word":"Braniștea","pos":"name","definitions":["a village in Uda, Argeș County, Romania","a commune of Bistrița-Năsăud County, Romania","a village in Braniștea, Bistrița-Năsăud County, Romania","a commune of Dâmbovița County, Romania","a village in Braniștea, Dâmbovița County, Romania"],"gender":"f"},{"word":"Brăniștea","pos":"name","definitions":["a village in Nicorești, Galați County, Romania"],"gender":"f"},{"word":"Brănișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brănișteanu"}},{"word":"Brănoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Brănoaia"}},{"word":"Brănoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brănoiu"}},{"word":"branșa","pos":"verb","definitions":["to connect"],"forms":{"canonical":"a branșa 1st conjugation","present-singular-third-person":"branșează","participle-past":"branșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a branșa","gerund":"branșând","first-person-indicative-present-singular":"branșez","indicative-present-second-person-singular":"branșezi","indicative-present-singular-third-person":"branșează","first-person-indicative-plural-present":"branșăm","indicative-plural-present-second-person":"branșați","indicative-plural-present-third-person":"branșează","first-person-imperfect-indicative-singular":"branșam","imperfect-indicative-second-person-singular":"branșai","imperfect-indicative-singular-third-person":"branșa","first-person-imperfect-indicative-plural":"branșam","imperfect-indicative-plural-second-person":"branșați","imperfect-indicative-plural-third-person":"branșau","first-person-indicative-perfect-singular":"branșai","indicative-perfect-second-person-singular":"branșași","indicative-perfect-singular-third-person":"branșă","first-person-indicative-perfect-plural":"branșarăm","indicative-perfect-plural-second-person":"branșarăți","indicative-perfect-plural-third-person":"branșară","first-person-indicative-pluperfect-singular":"branșasem","indicative-pluperfect-second-person-singular":"branșaseși","indicative-pluperfect-singular-third-person":"branșase","first-person-indicative-pluperfect-plural":"branșaserăm","indicative-pluperfect-plural-second-person":"branșaserăți","indicative-pluperfect-plural-third-person":"branșaseră","first-person-present-singular-subjunctive":"să branșez","present-second-person-singular-subjunctive":"să branșezi","present-singular-subjunctive-third-person":"să branșeze","first-person-plural-present-subjunctive":"să branșăm","plural-present-second-person-subjunctive":"să branșați","plural-present-subjunctive-third-person":"să branșeze","imperative-second-person-singular":"branșează","imperative-plural-second-person":"branșați","imperative-negative-second-person-singular":"nu branșa","imperative-negative-plural-second-person":"nu branșați"}},{"word":"branșă","pos":"noun","definitions":["branch"],"forms":{"plural":"branșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"branșă","accusative-definite-nominative-singular":"branșa","accusative-indefinite-nominative-plural":"branșe","accusative-definite-nominative-plural":"branșele","dative-genitive-indefinite-singular":"branșe","dative-definite-genitive-singular":"branșei","dative-genitive-indefinite-plural":"branșe","dative-definite-genitive-plural":"branșelor","singular-vocative":"branșă","plural-vocative":"branșelor"}},{"word":"branșament","pos":"noun","definitions":["branching"],"forms":{"plural":"branșamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"branșament","accusative-definite-nominative-singular":"branșamentul","accusative-indefinite-nominative-plural":"branșamente","accusative-definite-nominative-plural":"branșamentele","dative-genitive-indefinite-singular":"branșament","dative-definite-genitive-singular":"branșamentului","dative-genitive-indefinite-plural":"branșamente","dative-definite-genitive-plural":"branșamentelor","singular-vocative":"branșamentule","plural-vocative":"branșamentelor"}},{"word":"brânt","pos":"noun","definitions":["inflammation or gangrene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brânt","accusative-definite-nominative":"brântul","dative-genitive-indefinite":"brânt","dative-definite-genitive":"brântului","vocative":"brântule","alternative":"brant"}},{"word":"brânuț","pos":"noun","definitions":["diminutive of brână"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brânuț","accusative-definite-nominative":"brânuțul","dative-genitive-indefinite":"brânuț","dative-definite-genitive":"brânuțului","vocative":"brânuțule"}},{"word":"brânza","pos":"noun","definitions":["definite nominative/accusative singular of brânză"]},{"word":"Brânză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brânză","alternative":"Brînză"}},{"word":"brânză","pos":"noun","definitions":["cheese","type of cheese"],"pronunciation":"/ˈbrɨn.zə/","forms":{"plural":"brânzeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"brânză","accusative-definite-nominative-singular":"brânza","accusative-indefinite-nominative-plural":"brânzeturi","accusative-definite-nominative-plural":"brânzeturile","dative-genitive-indefinite-singular":"brânze","dative-definite-genitive-singular":"brânzei","dative-genitive-indefinite-plural":"brânzeturi","dative-definite-genitive-plural":"brânzeturilor","singular-vocative":"-","plural-vocative":"-","alternative":"brînză"}},{"word":"brânzar","pos":"noun","definitions":["cheesemaker, cheesemonger"],"forms":{"plural":"brânzari","feminine":"equivalent brânzăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brânzar","accusative-definite-nominative-singular":"brânzarul","accusative-indefinite-nominative-plural":"brânzari","accusative-definite-nominative-plural":"brânzarii","dative-genitive-indefinite-singular":"brânzar","dative-definite-genitive-singular":"brânzarului","dative-genitive-indefinite-plural":"brânzari","dative-definite-genitive-plural":"brânzarilor","singular-vocative":"brânzarule","plural-vocative":"brânzarilor","alternative":"brînzar"}},{"word":"brânzăreasă","pos":"noun","definitions":["female equivalent of brânzar (“cheesemaker”)"],"forms":{"plural":"brânzărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brânzăreasă","accusative-definite-nominative-singular":"brânzăreasa","accusative-indefinite-nominative-plural":"brânzărese","accusative-definite-nominative-plural":"brânzăresele","dative-genitive-indefinite-singular":"brânzărese","dative-definite-genitive-singular":"brânzăresei","dative-genitive-indefinite-plural":"brânzărese","dative-definite-genitive-plural":"brânzăreselor","singular-vocative":"brânzăreasă","plural-vocative":"brânzăreselor","alternative":"brînzăreasă"}},{"word":"Brânzari","pos":"name","definitions":["a village in Micești, Argeș County, Romania"],"gender":"m","forms":{"alternative":"Brînzari"}},{"word":"brânzari","pos":"noun","definitions":["plural of brânzar"]},{"word":"brânzărie","pos":"noun","definitions":["cheese shop"],"forms":{"plural":"brânzării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brânzărie","accusative-definite-nominative-singular":"brânzăria","accusative-indefinite-nominative-plural":"brânzării","accusative-definite-nominative-plural":"brânzăriile","dative-genitive-indefinite-singular":"brânzării","dative-definite-genitive-singular":"brânzăriei","dative-genitive-indefinite-plural":"brânzării","dative-definite-genitive-plural":"brânzăriilor","singular-vocative":"brânzărie","plural-vocative":"brânzăriilor","alternative":"brînzărie"}},{"word":"Brânzaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Brânzaru","alternative":"Brînzaru"}},{"word":"Brânzaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brânzaș","alternative":"Brînzaș"}},{"word":"brânze","pos":"noun","definitions":["indefinite genitive/dative singular of brânză"]},{"word":"brânzei","pos":"noun","definitions":["definite genitive/dative singular of brânză"]},{"word":"Brânzeni","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"m","forms":{"alternative":"Brînzeni"}},{"word":"brânzeturi","pos":"noun","definitions":["indefinite plural of brânză (“cheese”)","indefinite plural of brânzet (“cheese type”)"]},{"word":"brânzeturile","pos":"noun","definitions":["definite nominative/accusative plural of brânză"]},{"word":"brânzeturilor","pos":"noun","definitions":["definite genitive/dative plural of brânză"]},{"word":"brânzi","pos":"verb","definitions":["to curd"],"forms":{"canonical":"a brânzi 4th conjugation","present-singular-third-person":"brânzește","participle-past":"brânzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a brânzi","gerund":"brânzind","first-person-indicative-present-singular":"brânz","indicative-present-second-person-singular":"brânzi","indicative-present-singular-third-person":"brânze","first-person-indicative-plural-present":"brânzim","indicative-plural-present-second-person":"brânziți","indicative-plural-present-third-person":"brânz","first-person-imperfect-indicative-singular":"brânzeam","imperfect-indicative-second-person-singular":"brânzeai","imperfect-indicative-singular-third-person":"brânzea","first-person-imperfect-indicative-plural":"brânzeam","imperfect-indicative-plural-second-person":"brânzeați","imperfect-indicative-plural-third-person":"brânzeau","first-person-indicative-perfect-singular":"brânzii","indicative-perfect-second-person-singular":"brânziși","indicative-perfect-singular-third-person":"brânzi","first-person-indicative-perfect-plural":"brânzirăm","indicative-perfect-plural-second-person":"brânzirăți","indicative-perfect-plural-third-person":"brânziră","first-person-indicative-pluperfect-singular":"brânzisem","indicative-pluperfect-second-person-singular":"brânziseși","indicative-pluperfect-singular-third-person":"brânzise","first-person-indicative-pluperfect-plural":"brânziserăm","indicative-pluperfect-plural-second-person":"brânziserăți","indicative-pluperfect-plural-third-person":"brânziseră","first-person-present-singular-subjunctive":"să brânz","present-second-person-singular-subjunctive":"să brânzi","present-singular-subjunctive-third-person":"să brânză","first-person-plural-present-subjunctive":"să brânzim","plural-present-second-person-subjunctive":"să brânziți","plural-present-subjunctive-third-person":"să brânză","imperative-second-person-singular":"brânze","imperative-plural-second-person":"brânziți","imperative-negative-second-person-singular":"nu brânzi","imperative-negative-plural-second-person":"nu brânziți","alternative":"brînzi"}},{"word":"brânzică","pos":"noun","definitions":["diminutive of brânză"],"forms":{"plural":"brânzici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brânzică","accusative-definite-nominative-singular":"brânzica","accusative-indefinite-nominative-plural":"brânzici","accusative-definite-nominative-plural":"brânzicile","dative-genitive-indefinite-singular":"brânzici","dative-definite-genitive-singular":"brânzicii","dative-genitive-indefinite-plural":"brânzici","dative-definite-genitive-plural":"brânzicilor","singular-vocative":"brânzică","plural-vocative":"brânzicilor","alternative":"brînzică"}},{"word":"Brânzilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brânzilă","alternative":"Brînzilă"}},{"word":"brânzișoară","pos":"noun","definitions":["diminutive of brânză"],"forms":{"plural":"brânzișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brânzișoară","accusative-definite-nominative-singular":"brânzișoara","accusative-indefinite-nominative-plural":"brânzișoare","accusative-definite-nominative-plural":"brânzișoarele","dative-genitive-indefinite-singular":"brânzișoare","dative-definite-genitive-singular":"brânzișoarei","dative-genitive-indefinite-plural":"brânzișoare","dative-definite-genitive-plural":"brânzișoarelor","singular-vocative":"brânzișoară","plural-vocative":"brânzișoarelor","alternative":"brînzișoară"}},{"word":"brânzit","pos":"adj","definitions":["curded, coagulated"],"forms":{"feminine-singular":"brânzită","masculine-plural":"brânziți","feminine-neuter-plural":"brânzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brânzit","error-unrecognized-form-feminine-indefinite-singular":"brânzită","error-unrecognized-form-indefinite-masculine-plural":"brânziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"brânzite","definite-error-unrecognized-form-masculine-neuter-singular":"brânzitul","definite-error-unrecognized-form-feminine-singular":"brânzita","definite-error-unrecognized-form-masculine-plural":"brânziții","definite-error-unrecognized-form-feminine-neuter-plural":"brânzitele","alternative":"brînzit"}},{"word":"brânzit","pos":"verb","definitions":["past participle of brânzi"],"forms":{"alternative":"brînzit"}},{"word":"Brânzoaică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brânzoaică","alternative":"Brînzoaică"}},{"word":"brânzoaică","pos":"noun","definitions":["cheese pastry, cheese pie"],"forms":{"plural":"brânzoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brânzoaică","accusative-definite-nominative-singular":"brânzoaica","accusative-indefinite-nominative-plural":"brânzoaice","accusative-definite-nominative-plural":"brânzoaicele","dative-genitive-indefinite-singular":"brânzoaice","dative-definite-genitive-singular":"brânzoaicei","dative-genitive-indefinite-plural":"brânzoaice","dative-definite-genitive-plural":"brânzoaicelor","singular-vocative":"brânzoaică","plural-vocative":"brânzoaicelor","alternative":"brînzoaică"}},{"word":"brânzoaice","pos":"noun","definitions":["definite nominative/accusative plural of brânzoaică"]},{"word":"Brânzoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brânzoi","alternative":"Brînzoi"}},{"word":"brânzos","pos":"adj","definitions":["cheese-like"],"forms":{"feminine-singular":"brânzoasă","masculine-plural":"brânzoși","feminine-neuter-plural":"brânzoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brânzos","error-unrecognized-form-feminine-indefinite-singular":"brânzoasă","error-unrecognized-form-indefinite-masculine-plural":"brânzoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"brânzoase","definite-error-unrecognized-form-masculine-neuter-singular":"brânzosul","definite-error-unrecognized-form-feminine-singular":"brânzoasa","definite-error-unrecognized-form-masculine-plural":"brânzoșii","definite-error-unrecognized-form-feminine-neuter-plural":"brânzoasele","alternative":"brînzos"}},{"word":"bras","pos":"noun","definitions":["breaststroke"],"forms":{"plural":"brasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bras","accusative-definite-nominative-singular":"brasul","accusative-indefinite-nominative-plural":"brasuri","accusative-definite-nominative-plural":"brasurile","dative-genitive-indefinite-singular":"bras","dative-definite-genitive-singular":"brasului","dative-genitive-indefinite-plural":"brasuri","dative-definite-genitive-plural":"brasurilor","singular-vocative":"brasule","plural-vocative":"brasurilor"}},{"word":"brasaj","pos":"noun","definitions":["brewing"],"pronunciation":"/braˈsaʒ/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brasaj","accusative-definite-nominative":"brasajul","dative-genitive-indefinite":"brasaj","dative-definite-genitive":"brasajului","vocative":"brasajule","alternative":"брасаж"}},{"word":"brasardă","pos":"noun","definitions":["brassard"],"forms":{"plural":"brasarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brasardă","accusative-definite-nominative-singular":"brasarda","accusative-indefinite-nominative-plural":"brasarde","accusative-definite-nominative-plural":"brasardele","dative-genitive-indefinite-singular":"brasarde","dative-definite-genitive-singular":"brasardei","dative-genitive-indefinite-plural":"brasarde","dative-definite-genitive-plural":"brasardelor","singular-vocative":"brasardă","plural-vocative":"brasardelor"}},{"word":"braserie","pos":"noun","definitions":["brewery","beer bar, alehouse"],"forms":{"plural":"braserii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"braserie","accusative-definite-nominative-singular":"braseria","accusative-indefinite-nominative-plural":"braserii","accusative-definite-nominative-plural":"braseriile","dative-genitive-indefinite-singular":"braserii","dative-definite-genitive-singular":"braseriei","dative-genitive-indefinite-plural":"braserii","dative-definite-genitive-plural":"braseriilor","singular-vocative":"braserie","plural-vocative":"braseriilor"}},{"word":"Brășeu","pos":"name","definitions":["a village in Zam, Hunedoara County, Romania"],"gender":"m"},{"word":"brasieră","pos":"noun","definitions":["brassiere"],"forms":{"plural":"brasiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brasieră","accusative-definite-nominative-singular":"brasiera","accusative-indefinite-nominative-plural":"brasiere","accusative-definite-nominative-plural":"brasierele","dative-genitive-indefinite-singular":"brasiere","dative-definite-genitive-singular":"brasierei","dative-genitive-indefinite-plural":"brasiere","dative-definite-genitive-plural":"brasierelor","singular-vocative":"brasieră","plural-vocative":"brasierelor"}},{"word":"brasist","pos":"noun","definitions":["breaststroker"],"forms":{"plural":"brasiști","feminine":"equivalent brasistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brasist","accusative-definite-nominative-singular":"brasistul","accusative-indefinite-nominative-plural":"brasiști","accusative-definite-nominative-plural":"brasiștii","dative-genitive-indefinite-singular":"brasist","dative-definite-genitive-singular":"brasistului","dative-genitive-indefinite-plural":"brasiști","dative-definite-genitive-plural":"brasiștilor","singular-vocative":"brasistule","plural-vocative":"brasiștilor"}},{"word":"brasistă","pos":"noun","definitions":["female equivalent of brasist"],"forms":{"plural":"brasiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brasistă","accusative-definite-nominative-singular":"brasista","accusative-indefinite-nominative-plural":"brasiste","accusative-definite-nominative-plural":"brasistele","dative-genitive-indefinite-singular":"brasiste","dative-definite-genitive-singular":"brasistei","dative-genitive-indefinite-plural":"brasiste","dative-definite-genitive-plural":"brasistelor","singular-vocative":"brasistă","plural-vocative":"brasistelor"}},{"word":"Braslă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Braslă"}},{"word":"Brașoavă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brașoavă"}},{"word":"brașoavă","pos":"noun","definitions":["lie"],"forms":{"plural":"brașoave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brașoavă","accusative-definite-nominative-singular":"brașoava","accusative-indefinite-nominative-plural":"brașoave","accusative-definite-nominative-plural":"brașoavele","dative-genitive-indefinite-singular":"brașoave","dative-definite-genitive-singular":"brașoavei","dative-genitive-indefinite-plural":"brașoave","dative-definite-genitive-plural":"brașoavelor","singular-vocative":"brașoavă","plural-vocative":"brașoavelor"}},{"word":"Brașov","pos":"name","definitions":["Brașov (the capital city of Brașov County in Transylvania, in central Romania)","Brașov (a county in Transylvania, in central Romania)"],"pronunciation":"/braˈʃov/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"Brașov","accusative-definite-nominative":"Brașovul","dative-genitive-indefinite":"Brașov","dative-definite-genitive":"Brașovului","vocative":"Brașovule"}},{"word":"Brașovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brașovan"}},{"word":"Brașovean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brașovean"}},{"word":"brașovean","pos":"noun","definitions":["native or inhabitant of the city of Brașov or surrounding Brașov County, Romania (usually male)"],"forms":{"plural":"brașoveni","feminine":"equivalent brașoveană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brașovean","accusative-definite-nominative-singular":"brașoveanul","accusative-indefinite-nominative-plural":"brașoveni","accusative-definite-nominative-plural":"brașovenii","dative-genitive-indefinite-singular":"brașovean","dative-definite-genitive-singular":"brașoveanului","dative-genitive-indefinite-plural":"brașoveni","dative-definite-genitive-plural":"brașovenilor","singular-vocative":"brașoveanule","plural-vocative":"brașovenilor"}},{"word":"brașoveană","pos":"noun","definitions":["female equivalent of brașovean"],"forms":{"plural":"brașovene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brașoveană","accusative-definite-nominative-singular":"brașoveana","accusative-indefinite-nominative-plural":"brașovene","accusative-definite-nominative-plural":"brașovenele","dative-genitive-indefinite-singular":"brașovene","dative-definite-genitive-singular":"brașovenei","dative-genitive-indefinite-plural":"brașovene","dative-definite-genitive-plural":"brașovenelor","singular-vocative":"brașoveană","plural-vocative":"brașovenelor"}},{"word":"brașoveancă","pos":"noun","definitions":["female equivalent of brașovean"],"forms":{"plural":"brașovence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brașoveancă","accusative-definite-nominative-singular":"brașoveanca","accusative-indefinite-nominative-plural":"brașovence","accusative-definite-nominative-plural":"brașovencele","dative-genitive-indefinite-singular":"brașovence","dative-definite-genitive-singular":"brașovencei","dative-genitive-indefinite-plural":"brașovence","dative-definite-genitive-plural":"brașovencelor","singular-vocative":"brașoveancă","plural-vocative":"brașovencelor"}},{"word":"Brașoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brașoveanu"}},{"word":"brașovenesc","pos":"adj","definitions":["from Brașov, typical for the city of Brașov"],"forms":{"feminine-singular":"brașovenească","plural":"brașovenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brașovenesc","error-unrecognized-form-feminine-indefinite-singular":"brașovenească","error-unrecognized-form-indefinite-masculine-plural":"brașovenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"brașovenești","definite-error-unrecognized-form-masculine-neuter-singular":"brașovenescul","definite-error-unrecognized-form-feminine-singular":"brașoveneasca","definite-error-unrecognized-form-masculine-plural":"brașoveneștii","definite-error-unrecognized-form-feminine-neuter-plural":"brașoveneștile"}},{"word":"brașovenie","pos":"noun","definitions":["shop selling wares from Brașov"],"forms":{"plural":"brașovenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brașovenie","accusative-definite-nominative-singular":"brașovenia","accusative-indefinite-nominative-plural":"brașovenii","accusative-definite-nominative-plural":"brașoveniile","dative-genitive-indefinite-singular":"brașovenii","dative-definite-genitive-singular":"brașoveniei","dative-genitive-indefinite-plural":"brașovenii","dative-definite-genitive-plural":"brașoveniilor","singular-vocative":"brașovenie","plural-vocative":"brașoveniilor"}},{"word":"Brașovianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brașovianu"}},{"word":"Brastavățu","pos":"name","definitions":["a commune of Olt County, Romania","a village in Brastavățu, Olt County, Romania"],"gender":"m"},{"word":"brat","pos":"noun","definitions":["brother","monk"],"forms":{"plural":"brați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brat","accusative-definite-nominative-singular":"bratul","accusative-indefinite-nominative-plural":"brați","accusative-definite-nominative-plural":"brații","dative-genitive-indefinite-singular":"brat","dative-definite-genitive-singular":"bratului","dative-genitive-indefinite-plural":"brați","dative-definite-genitive-plural":"braților","singular-vocative":"bratule","plural-vocative":"braților"}},{"word":"braț","pos":"noun","definitions":["arm"],"pronunciation":"/brat͡s/","forms":{"plural":"brațe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"braț","accusative-definite-nominative-singular":"brațul","accusative-indefinite-nominative-plural":"brațe","accusative-definite-nominative-plural":"brațele","dative-genitive-indefinite-singular":"braț","dative-definite-genitive-singular":"brațului","dative-genitive-indefinite-plural":"brațe","dative-definite-genitive-plural":"brațelor","singular-vocative":"brațule","plural-vocative":"brațelor"}},{"word":"brățară","pos":"noun","definitions":["bracelet","armlet","bangle"],"forms":{"plural":"brățări"}},{"word":"brățăruie","pos":"noun","definitions":["diminutive of brățară"],"forms":{"plural":"brățărui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"brățăruie","accusative-definite-nominative-singular":"brățăruia","accusative-indefinite-nominative-plural":"brățărui","accusative-definite-nominative-plural":"brățăruile","dative-genitive-indefinite-singular":"brățărui","dative-definite-genitive-singular":"brățăruii","dative-genitive-indefinite-plural":"brățărui","dative-definite-genitive-plural":"brățăruilor","singular-vocative":"brățăruie","plural-vocative":"brățăruilor"}},{"word":"brățăruță","pos":"noun","definitions":["diminutive of brățară"],"forms":{"plural":"brățăruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brățăruță","accusative-definite-nominative-singular":"brățăruța","accusative-indefinite-nominative-plural":"brățăruțe","accusative-definite-nominative-plural":"brățăruțele","dative-genitive-indefinite-singular":"brățăruțe","dative-definite-genitive-singular":"brățăruței","dative-genitive-indefinite-plural":"brățăruțe","dative-definite-genitive-plural":"brățăruțelor","singular-vocative":"brățăruță","plural-vocative":"brățăruțelor"}},{"word":"Brătășanca","pos":"name","definitions":["a village in Filipeștii de Târg, Prahova County, Romania"],"gender":"f"},{"word":"Brătășani","pos":"name","definitions":["a village in Trivalea-Moșteni, Teleorman County, Romania"],"gender":"m"},{"word":"Brătășanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brătășanu"}},{"word":"Brătășanul","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Vedea"],"gender":"m"},{"word":"Bratca","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Bratca, Bihor County, Romania"],"gender":"f"},{"word":"Bratcov","pos":"name","definitions":["a river in Romania, tributary to the Vedea"],"gender":"m"},{"word":"Bratcovu","pos":"name","definitions":["a village in Stejaru, Teleorman County, Romania"],"gender":"m"},{"word":"Bratcu","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Jiu"],"gender":"m"},{"word":"brațe","pos":"noun","definitions":["plural of braț"]},{"word":"brățea","pos":"noun","definitions":["obsolete form of brățară"],"forms":{"plural":"brățele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"brățea","accusative-definite-nominative-singular":"brățeaua","accusative-indefinite-nominative-plural":"brățele","accusative-definite-nominative-plural":"brățelele","dative-genitive-indefinite-singular":"brățele","dative-definite-genitive-singular":"brățelei","dative-genitive-indefinite-plural":"brățele","dative-definite-genitive-plural":"brățelelor","singular-vocative":"brățea","plural-vocative":"brățelelor"}},{"word":"Brăteasca","pos":"name","definitions":["a village in Merișani, Argeș County, Romania"],"gender":"f"},{"word":"Brateiu","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Brateiu, Sibiu County, Romania"],"gender":"m"},{"word":"Brăteni","pos":"name","definitions":["a village in Sânmihaiu de Câmpie, Bistrița-Năsăud County, Romania","a village in Dobârceni, Botoșani County, Romania"],"gender":"m"},{"word":"Brateș","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Brateș, Covasna County, Romania","a village in Tarcău, Neamț County, Romania"],"gender":"m"},{"word":"brățesc","pos":"adj","definitions":["monachal, monastic"],"forms":{"feminine-singular":"brățească","plural":"brățești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brățesc","error-unrecognized-form-feminine-indefinite-singular":"brățească","error-unrecognized-form-indefinite-masculine-plural":"brățești","error-unrecognized-form-feminine-indefinite-neuter-plural":"brățești","definite-error-unrecognized-form-masculine-neuter-singular":"brățescul","definite-error-unrecognized-form-feminine-singular":"brățeasca","definite-error-unrecognized-form-masculine-plural":"brățeștii","definite-error-unrecognized-form-feminine-neuter-plural":"brățeștile"}},{"word":"Brătescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brătescu"}},{"word":"Brătești","pos":"name","definitions":["a village in Albeștii de Argeș, Argeș County, Romania","a village in Bârsănești, Bacău County, Romania","a village in Răbăgani, Bihor County, Romania","a village in Căpreni, Gorj County, Romania","a village in Stolniceni-Prăjescu, Iași County, Romania"],"gender":"m"},{"word":"Brăteștii de Jos","pos":"name","definitions":["a village in Văcărești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Brateșu Vechi","pos":"name","definitions":["a village in Surdila-Greci, Brăila County, Romania"],"gender":"m"},{"word":"Brateșul","pos":"name","definitions":["a village in Bala, Mehedinți County, Romania"],"gender":"m"},{"word":"Bratfalău","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Brăteni."],"gender":"f"},{"word":"Brătfălean","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brătfălean"}},{"word":"Bratia din Deal","pos":"name","definitions":["a village in Galicea, Vâlcea County, Romania"],"gender":"f"},{"word":"Bratia din Vale","pos":"name","definitions":["a village in Galicea, Vâlcea County, Romania"],"gender":"f"},{"word":"Brătianovca","pos":"name","definitions":["a village in Sărata-Galbenă, Hîncești Raion, Moldova"],"gender":"f"},{"word":"Brătianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brătianu"}},{"word":"Brătieni","pos":"name","definitions":["a village in Argeș County, Romania. Renamed to Brăduleț."],"gender":"m"},{"word":"Brătila","pos":"name","definitions":["a village in Helegiu, Bacău County, Romania"],"gender":"f"},{"word":"Brătilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brătilă"}},{"word":"Brătilești","pos":"name","definitions":["a village in Brăești, Buzău County, Romania"],"gender":"m"},{"word":"Bratilov","pos":"name","definitions":["a river in Giurgiu, Romania, tributary to the Milcovăț"],"gender":"m"},{"word":"Bratiloveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bratiloveanu"}},{"word":"Bratilovu","pos":"name","definitions":["a village in Baia de Aramă, Mehedinți County, Romania"],"gender":"m"},{"word":"Brătioara","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Bratia"],"gender":"f"},{"word":"brățișel","pos":"noun","definitions":["diminutive of braț"],"forms":{"plural":"brățișele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brățișel","accusative-definite-nominative-singular":"brățișelul","accusative-indefinite-nominative-plural":"brățișele","accusative-definite-nominative-plural":"brățișelele","dative-genitive-indefinite-singular":"brățișel","dative-definite-genitive-singular":"brățișelului","dative-genitive-indefinite-plural":"brățișele","dative-definite-genitive-plural":"brățișelelor","singular-vocative":"brățișelule","plural-vocative":"brățișelelor"}},{"word":"brățișor","pos":"noun","definitions":["diminutive of braț; small arm"],"forms":{"plural":"brățișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brățișor","accusative-definite-nominative-singular":"brățișorul","accusative-indefinite-nominative-plural":"brățișore","accusative-definite-nominative-plural":"brățișorele","dative-genitive-indefinite-singular":"brățișor","dative-definite-genitive-singular":"brățișorului","dative-genitive-indefinite-plural":"brățișore","dative-definite-genitive-plural":"brățișorelor","singular-vocative":"brățișorule","plural-vocative":"brățișorelor"}},{"word":"Brativoești","pos":"name","definitions":["a village in Bala, Mehedinți County, Romania"],"gender":"m"},{"word":"Brătoaia","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Dâmbovicioara"],"gender":"f"},{"word":"brățoi","pos":"noun","definitions":["augmentative of braț"],"forms":{"plural":"brățoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brățoi","accusative-definite-nominative-singular":"brățoiul","accusative-indefinite-nominative-plural":"brățoaie","accusative-definite-nominative-plural":"brățoaiele","dative-genitive-indefinite-singular":"brățoi","dative-definite-genitive-singular":"brățoiului","dative-genitive-indefinite-plural":"brățoaie","dative-definite-genitive-plural":"brățoaielor","singular-vocative":"brățoiule","plural-vocative":"brățoaielor"}},{"word":"Brătoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brătoiu"}},{"word":"Bratova","pos":"name","definitions":["a village in Târnova, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Bratovești","pos":"name","definitions":["a village in Titești, Vâlcea County, Romania"],"gender":"m"},{"word":"Bratovoești","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Bratovoești, Dolj County, Romania"],"gender":"m"},{"word":"Bratu","pos":"name","definitions":["a surname"],"gender":"m"},{"word":"brățucă","pos":"noun","definitions":["diminutive of braț"],"forms":{"plural":"brățuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brățucă","accusative-definite-nominative-singular":"brățuca","accusative-indefinite-nominative-plural":"brățuci","accusative-definite-nominative-plural":"brățucile","dative-genitive-indefinite-singular":"brățuci","dative-definite-genitive-singular":"brățucii","dative-genitive-indefinite-plural":"brățuci","dative-definite-genitive-plural":"brățucilor","singular-vocative":"brățucă","plural-vocative":"brățucilor"}},{"word":"Brătucu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brătucu"}},{"word":"Brătuia","pos":"name","definitions":["a village in Dănești, Gorj County, Romania"],"gender":"f"},{"word":"Brătuianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brătuianu"}},{"word":"brațul","pos":"noun","definitions":["definite nominative/accusative singular of braț"]},{"word":"Brațul Șoimului","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Șoimu"],"gender":"m"},{"word":"Bratulea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bratulea"}},{"word":"Brătuleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brătuleanu"}},{"word":"Brătuleni","pos":"name","definitions":["a village in Miroslava, Iași County, Romania"],"gender":"m"},{"word":"Brătulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brătulescu"}},{"word":"Brătulești","pos":"name","definitions":["a village in Corod, Galați County, Romania","a village in Strunga, Iași County, Romania"],"gender":"m"},{"word":"Brătușeni","pos":"name","definitions":["a village in Brătușeni, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Brătușenii Noi","pos":"name","definitions":["a village in Brătușeni, Edineț Raion, Moldova"],"gender":"m"},{"word":"brâu","pos":"noun","definitions":["girdle, belt; thong"],"pronunciation":"/brɨw/","forms":{"plural":"brâie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâu","accusative-definite-nominative-singular":"brâul","accusative-indefinite-nominative-plural":"brâie","accusative-definite-nominative-plural":"brâiele","dative-genitive-indefinite-singular":"brâu","dative-definite-genitive-singular":"brâului","dative-genitive-indefinite-plural":"brâie","dative-definite-genitive-plural":"brâielor","singular-vocative":"brâule","plural-vocative":"brâielor","alternative-common":"brână","alternative":"brîu"}},{"word":"brâu","pos":"noun","definitions":["folk dance"],"pronunciation":"/brɨw/","forms":{"plural":"brâuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâu","accusative-definite-nominative-singular":"brâul","accusative-indefinite-nominative-plural":"brâuri","accusative-definite-nominative-plural":"brâurile","dative-genitive-indefinite-singular":"brâu","dative-definite-genitive-singular":"brâului","dative-genitive-indefinite-plural":"brâuri","dative-definite-genitive-plural":"brâurilor","singular-vocative":"brâule","plural-vocative":"brâurilor","alternative-common":"brână","alternative":"brîu"}},{"word":"brâuleț","pos":"noun","definitions":["diminutive of brâu; small belt"],"forms":{"plural":"brâulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâuleț","accusative-definite-nominative-singular":"brâulețul","accusative-indefinite-nominative-plural":"brâulețe","accusative-definite-nominative-plural":"brâulețele","dative-genitive-indefinite-singular":"brâuleț","dative-definite-genitive-singular":"brâulețului","dative-genitive-indefinite-plural":"brâulețe","dative-definite-genitive-plural":"brâulețelor","singular-vocative":"brâulețule","plural-vocative":"brâulețelor","alternative":"brîuleț"}},{"word":"braunit","pos":"noun","definitions":["braunite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"braunit","accusative-definite-nominative-singular":"braunitul","accusative-indefinite-nominative-plural":"braunite","accusative-definite-nominative-plural":"braunitele","dative-genitive-indefinite-singular":"braunit","dative-definite-genitive-singular":"braunitului","dative-genitive-indefinite-plural":"braunite","dative-definite-genitive-plural":"braunitelor","singular-vocative":"braunitule","plural-vocative":"braunitelor"}},{"word":"brâușor","pos":"noun","definitions":["diminutive of brâu"],"forms":{"plural":"brâușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâușor","accusative-definite-nominative-singular":"brâușorul","accusative-indefinite-nominative-plural":"brâușoare","accusative-definite-nominative-plural":"brâușoarele","dative-genitive-indefinite-singular":"brâușor","dative-definite-genitive-singular":"brâușorului","dative-genitive-indefinite-plural":"brâușoare","dative-definite-genitive-plural":"brâușoarelor","singular-vocative":"brâușorule","plural-vocative":"brâușoarelor","alternative":"brîușor"}},{"word":"brâuț","pos":"noun","definitions":["diminutive of brâu (“girdle”)"],"pronunciation":"/brɨˈut͡s/","forms":{"plural":"brâuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brâuț","accusative-definite-nominative-singular":"brâuțul","accusative-indefinite-nominative-plural":"brâuțe","accusative-definite-nominative-plural":"brâuțele","dative-genitive-indefinite-singular":"brâuț","dative-definite-genitive-singular":"brâuțului","dative-genitive-indefinite-plural":"brâuțe","dative-definite-genitive-plural":"brâuțelor","singular-vocative":"brâuțule","plural-vocative":"brâuțelor","alternative":"brîuț"}},{"word":"brav","pos":"adj","definitions":["brave, courageous"],"pronunciation":"/brav/","forms":{"feminine-singular":"bravă","masculine-plural":"bravi","feminine-neuter-plural":"brave","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"brav","error-unrecognized-form-feminine-indefinite-singular":"bravă","error-unrecognized-form-indefinite-masculine-plural":"bravi","error-unrecognized-form-feminine-indefinite-neuter-plural":"brave","definite-error-unrecognized-form-masculine-neuter-singular":"bravul","definite-error-unrecognized-form-feminine-singular":"brava","definite-error-unrecognized-form-masculine-plural":"bravii","definite-error-unrecognized-form-feminine-neuter-plural":"bravele"}},{"word":"brava","pos":"verb","definitions":["to challenge, defy"],"forms":{"canonical":"a brava 1st conjugation","present-singular-third-person":"bravează","participle-past":"bravat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a brava","gerund":"bravând","first-person-indicative-present-singular":"bravez","indicative-present-second-person-singular":"bravezi","indicative-present-singular-third-person":"bravează","first-person-indicative-plural-present":"bravăm","indicative-plural-present-second-person":"bravați","indicative-plural-present-third-person":"bravează","first-person-imperfect-indicative-singular":"bravam","imperfect-indicative-second-person-singular":"bravai","imperfect-indicative-singular-third-person":"brava","first-person-imperfect-indicative-plural":"bravam","imperfect-indicative-plural-second-person":"bravați","imperfect-indicative-plural-third-person":"bravau","first-person-indicative-perfect-singular":"bravai","indicative-perfect-second-person-singular":"bravași","indicative-perfect-singular-third-person":"bravă","first-person-indicative-perfect-plural":"bravarăm","indicative-perfect-plural-second-person":"bravarăți","indicative-perfect-plural-third-person":"bravară","first-person-indicative-pluperfect-singular":"bravasem","indicative-pluperfect-second-person-singular":"bravaseși","indicative-pluperfect-singular-third-person":"bravase","first-person-indicative-pluperfect-plural":"bravaserăm","indicative-pluperfect-plural-second-person":"bravaserăți","indicative-pluperfect-plural-third-person":"bravaseră","first-person-present-singular-subjunctive":"să bravez","present-second-person-singular-subjunctive":"să bravezi","present-singular-subjunctive-third-person":"să braveze","first-person-plural-present-subjunctive":"să bravăm","plural-present-second-person-subjunctive":"să bravați","plural-present-subjunctive-third-person":"să braveze","imperative-second-person-singular":"bravează","imperative-plural-second-person":"bravați","imperative-negative-second-person-singular":"nu brava","imperative-negative-plural-second-person":"nu bravați"}},{"word":"bravadă","pos":"noun","definitions":["bravado"],"forms":{"plural":"bravade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bravadă","accusative-definite-nominative-singular":"bravada","accusative-indefinite-nominative-plural":"bravade","accusative-definite-nominative-plural":"bravadele","dative-genitive-indefinite-singular":"bravade","dative-definite-genitive-singular":"bravadei","dative-genitive-indefinite-plural":"bravade","dative-definite-genitive-plural":"bravadelor","singular-vocative":"bravadă","plural-vocative":"bravadelor"}},{"word":"Braviceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Braviceanu"}},{"word":"Brăviceni","pos":"name","definitions":["a village in Brăviceni, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"m"},{"word":"bravisimo","pos":"intj","definitions":["alternative form of bravissimo"]},{"word":"bravissimo","pos":"intj","definitions":["bravissimo"]},{"word":"bravo","pos":"intj","definitions":["bravo"]},{"word":"bravos","pos":"intj","definitions":["alternative form of bravo"]},{"word":"Bravu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bravu"}},{"word":"bravură","pos":"noun","definitions":["bravery"],"forms":{"plural":"bravuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bravură","accusative-definite-nominative-singular":"bravura","accusative-indefinite-nominative-plural":"bravuri","accusative-definite-nominative-plural":"bravurile","dative-genitive-indefinite-singular":"bravuri","dative-definite-genitive-singular":"bravurii","dative-genitive-indefinite-plural":"bravuri","dative-definite-genitive-plural":"bravurilor","singular-vocative":"bravură","plural-vocative":"bravurilor"}},{"word":"brazda","pos":"noun","definitions":["definite nominative/accusative singular of brazdă"],"gender":"f"},{"word":"Brazdă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brazdă"}},{"word":"brazdă","pos":"noun","definitions":["furrow"],"forms":{"plural":"brazde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brazdă","accusative-definite-nominative-singular":"brazda","accusative-indefinite-nominative-plural":"brazde","accusative-definite-nominative-plural":"brazdele","dative-genitive-indefinite-singular":"brazde","dative-definite-genitive-singular":"brazdei","dative-genitive-indefinite-plural":"brazde","dative-definite-genitive-plural":"brazdelor","singular-vocative":"brazdă","plural-vocative":"brazdelor"}},{"word":"brăzda","pos":"verb","definitions":["to furrow, indent, groove, ridge, flute","to notch","to plough","to mark, score, tally"],"forms":{"canonical":"a brăzda 1st conjugation","present-singular-third-person":"brăzdează","participle-past":"brăzdat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a brăzda","gerund":"brăzdând","first-person-indicative-present-singular":"brăzdez","indicative-present-second-person-singular":"brăzdezi","indicative-present-singular-third-person":"brăzdează","first-person-indicative-plural-present":"brăzdăm","indicative-plural-present-second-person":"brăzdați","indicative-plural-present-third-person":"brăzdează","first-person-imperfect-indicative-singular":"brăzdam","imperfect-indicative-second-person-singular":"brăzdai","imperfect-indicative-singular-third-person":"brăzda","first-person-imperfect-indicative-plural":"brăzdam","imperfect-indicative-plural-second-person":"brăzdați","imperfect-indicative-plural-third-person":"brăzdau","first-person-indicative-perfect-singular":"brăzdai","indicative-perfect-second-person-singular":"brăzdași","indicative-perfect-singular-third-person":"brăzdă","first-person-indicative-perfect-plural":"brăzdarăm","indicative-perfect-plural-second-person":"brăzdarăți","indicative-perfect-plural-third-person":"brăzdară","first-person-indicative-pluperfect-singular":"brăzdasem","indicative-pluperfect-second-person-singular":"brăzdaseși","indicative-pluperfect-singular-third-person":"brăzdase","first-person-indicative-pluperfect-plural":"brăzdaserăm","indicative-pluperfect-plural-second-person":"brăzdaserăți","indicative-pluperfect-plural-third-person":"brăzdaseră","first-person-present-singular-subjunctive":"să brăzdez","present-second-person-singular-subjunctive":"să brăzdezi","present-singular-subjunctive-third-person":"să brăzdeze","first-person-plural-present-subjunctive":"să brăzdăm","plural-present-second-person-subjunctive":"să brăzdați","plural-present-subjunctive-third-person":"să brăzdeze","imperative-second-person-singular":"brăzdează","imperative-plural-second-person":"brăzdați","imperative-negative-second-person-singular":"nu brăzda","imperative-negative-plural-second-person":"nu brăzdați"}},{"word":"brăzdar","pos":"noun","definitions":["plowshare"],"forms":{"plural":"brăzdare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brăzdar","accusative-definite-nominative-singular":"brăzdarul","accusative-indefinite-nominative-plural":"brăzdare","accusative-definite-nominative-plural":"brăzdarele","dative-genitive-indefinite-singular":"brăzdar","dative-definite-genitive-singular":"brăzdarului","dative-genitive-indefinite-plural":"brăzdare","dative-definite-genitive-plural":"brăzdarelor","singular-vocative":"brăzdarule","plural-vocative":"brăzdarelor"}},{"word":"brăzdare","pos":"noun","definitions":["furrowing","striation"],"forms":{"plural":"brăzdări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brăzdare","accusative-definite-nominative-singular":"brăzdarea","accusative-indefinite-nominative-plural":"brăzdări","accusative-definite-nominative-plural":"brăzdările","dative-genitive-indefinite-singular":"brăzdări","dative-definite-genitive-singular":"brăzdării","dative-genitive-indefinite-plural":"brăzdări","dative-definite-genitive-plural":"brăzdărilor","singular-vocative":"brăzdare","plural-vocative":"brăzdărilor"}},{"word":"brăzdat","pos":"adj","definitions":["wrinkled"],"forms":{"feminine-singular":"brăzdată","masculine-plural":"brăzdați","feminine-neuter-plural":"brăzdate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brăzdat","error-unrecognized-form-feminine-indefinite-singular":"brăzdată","error-unrecognized-form-indefinite-masculine-plural":"brăzdați","error-unrecognized-form-feminine-indefinite-neuter-plural":"brăzdate","definite-error-unrecognized-form-masculine-neuter-singular":"brăzdatul","definite-error-unrecognized-form-feminine-singular":"brăzdata","definite-error-unrecognized-form-masculine-plural":"brăzdații","definite-error-unrecognized-form-feminine-neuter-plural":"brăzdatele"}},{"word":"brăzdătură","pos":"noun","definitions":["furrow"],"forms":{"plural":"brăzdături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brăzdătură","accusative-definite-nominative-singular":"brăzdătura","accusative-indefinite-nominative-plural":"brăzdături","accusative-definite-nominative-plural":"brăzdăturile","dative-genitive-indefinite-singular":"brăzdături","dative-definite-genitive-singular":"brăzdăturii","dative-genitive-indefinite-plural":"brăzdături","dative-definite-genitive-plural":"brăzdăturilor","singular-vocative":"brăzdătură","plural-vocative":"brăzdăturilor"}},{"word":"brăzdiță","pos":"noun","definitions":["diminutive of brazdă"],"forms":{"plural":"brăzdițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brăzdiță","accusative-definite-nominative-singular":"brăzdița","accusative-indefinite-nominative-plural":"brăzdițe","accusative-definite-nominative-plural":"brăzdițele","dative-genitive-indefinite-singular":"brăzdițe","dative-definite-genitive-singular":"brăzdiței","dative-genitive-indefinite-plural":"brăzdițe","dative-definite-genitive-plural":"brăzdițelor","singular-vocative":"brăzdiță","plural-vocative":"brăzdițelor"}},{"word":"brăzdui","pos":"verb","definitions":["to furrow"],"forms":{"canonical":"a brăzdui 4th conjugation","present-singular-third-person":"brăzduiește","participle-past":"brăzduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a brăzdui","gerund":"brăzduind","first-person-indicative-present-singular":"brăzduiesc","indicative-present-second-person-singular":"brăzduiești","indicative-present-singular-third-person":"brăzduiește","first-person-indicative-plural-present":"brăzduim","indicative-plural-present-second-person":"brăzduiți","indicative-plural-present-third-person":"brăzduiesc","first-person-imperfect-indicative-singular":"brăzduiam","imperfect-indicative-second-person-singular":"brăzduiai","imperfect-indicative-singular-third-person":"brăzduia","first-person-imperfect-indicative-plural":"brăzduiam","imperfect-indicative-plural-second-person":"brăzduiați","imperfect-indicative-plural-third-person":"brăzduiau","first-person-indicative-perfect-singular":"brăzduii","indicative-perfect-second-person-singular":"brăzduiși","indicative-perfect-singular-third-person":"brăzdui","first-person-indicative-perfect-plural":"brăzduirăm","indicative-perfect-plural-second-person":"brăzduirăți","indicative-perfect-plural-third-person":"brăzduiră","first-person-indicative-pluperfect-singular":"brăzduisem","indicative-pluperfect-second-person-singular":"brăzduiseși","indicative-pluperfect-singular-third-person":"brăzduise","first-person-indicative-pluperfect-plural":"brăzduiserăm","indicative-pluperfect-plural-second-person":"brăzduiserăți","indicative-pluperfect-plural-third-person":"brăzduiseră","first-person-present-singular-subjunctive":"să brăzduiesc","present-second-person-singular-subjunctive":"să brăzduiești","present-singular-subjunctive-third-person":"să brăzduiască","first-person-plural-present-subjunctive":"să brăzduim","plural-present-second-person-subjunctive":"să brăzduiți","plural-present-subjunctive-third-person":"să brăzduiască","imperative-second-person-singular":"brăzduiește","imperative-plural-second-person":"brăzduiți","imperative-negative-second-person-singular":"nu brăzdui","imperative-negative-plural-second-person":"nu brăzduiți"}},{"word":"brăzduire","pos":"noun","definitions":["furrowing"],"forms":{"plural":"brăzduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brăzduire","accusative-definite-nominative-singular":"brăzduirea","accusative-indefinite-nominative-plural":"brăzduiri","accusative-definite-nominative-plural":"brăzduirile","dative-genitive-indefinite-singular":"brăzduiri","dative-definite-genitive-singular":"brăzduirii","dative-genitive-indefinite-plural":"brăzduiri","dative-definite-genitive-plural":"brăzduirilor","singular-vocative":"brăzduire","plural-vocative":"brăzduirilor"}},{"word":"brăzduit","pos":"adj","definitions":["wrinkled"],"forms":{"feminine-singular":"brăzduită","masculine-plural":"brăzduiți","feminine-neuter-plural":"brăzduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brăzduit","error-unrecognized-form-feminine-indefinite-singular":"brăzduită","error-unrecognized-form-indefinite-masculine-plural":"brăzduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"brăzduite","definite-error-unrecognized-form-masculine-neuter-singular":"brăzduitul","definite-error-unrecognized-form-feminine-singular":"brăzduita","definite-error-unrecognized-form-masculine-plural":"brăzduiții","definite-error-unrecognized-form-feminine-neuter-plural":"brăzduitele"}},{"word":"brăzduit","pos":"verb","definitions":["past participle of brăzdui"],"forms":{"participle-past":"of brăzdui"}},{"word":"brăzduță","pos":"noun","definitions":["diminutive of brazdă"],"forms":{"plural":"brăzduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brăzduță","accusative-definite-nominative-singular":"brăzduța","accusative-indefinite-nominative-plural":"brăzduțe","accusative-definite-nominative-plural":"brăzduțele","dative-genitive-indefinite-singular":"brăzduțe","dative-definite-genitive-singular":"brăzduței","dative-genitive-indefinite-plural":"brăzduțe","dative-definite-genitive-plural":"brăzduțelor","singular-vocative":"brăzduță","plural-vocative":"brăzduțelor"}},{"word":"Brăzești","pos":"name","definitions":["a village in Baia de Arieș, Alba County, Romania"],"gender":"m"},{"word":"Brazi","pos":"name","definitions":["a village in Râu de Mori, Hunedoara County, Romania","a commune of Prahova County, Romania"],"gender":"m"},{"word":"brazi","pos":"noun","definitions":["plural of brad"]},{"word":"Brazii","pos":"name","definitions":["a commune of Arad County, Romania","a village in Brazii, Arad County, Romania","a village in Radulești, Ialomița County, Romania"],"gender":"m"},{"word":"brazii","pos":"noun","definitions":["definite nominative/accusative plural of brad"]},{"word":"Brazii de Jos","pos":"name","definitions":["a village in Brazi, Prahova County, Romania"],"gender":"m"},{"word":"Brazii de Sus","pos":"name","definitions":["a village in Brazi, Prahova County, Romania"],"gender":"m"},{"word":"Brazilia","pos":"name","definitions":["Brazil (a large Portuguese-speaking country in South America)"],"pronunciation":"[bra.zi.li.a]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Brazilia","dative-definite-genitive":"Braziliei"}},{"word":"brazilian","pos":"adj","definitions":["Brazilian"],"pronunciation":"[bra.zi.liˈan]","forms":{"feminine-singular":"braziliană","masculine-plural":"brazilieni","feminine-neuter-plural":"braziliene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brazilian","error-unrecognized-form-feminine-indefinite-singular":"braziliană","error-unrecognized-form-indefinite-masculine-plural":"brazilieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"braziliene","definite-error-unrecognized-form-masculine-neuter-singular":"brazilianul","definite-error-unrecognized-form-feminine-singular":"braziliana","definite-error-unrecognized-form-masculine-plural":"brazilienii","definite-error-unrecognized-form-feminine-neuter-plural":"brazilienele"}},{"word":"brazilian","pos":"noun","definitions":["Brazilian"],"pronunciation":"[bra.zi.liˈan]","forms":{"plural":"brazilieni","feminine":"equivalent braziliancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brazilian","accusative-definite-nominative-singular":"brazilianul","accusative-indefinite-nominative-plural":"brazilieni","accusative-definite-nominative-plural":"brazilienii","dative-genitive-indefinite-singular":"brazilian","dative-definite-genitive-singular":"brazilianului","dative-genitive-indefinite-plural":"brazilieni","dative-definite-genitive-plural":"brazilienilor","singular-vocative":"brazilianule","plural-vocative":"brazilienilor"}},{"word":"braziliană","pos":"noun","definitions":["female equivalent of brazilian"],"forms":{"plural":"braziliene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"braziliană","accusative-definite-nominative-singular":"braziliana","accusative-indefinite-nominative-plural":"braziliene","accusative-definite-nominative-plural":"brazilienele","dative-genitive-indefinite-singular":"braziliene","dative-definite-genitive-singular":"brazilienei","dative-genitive-indefinite-plural":"braziliene","dative-definite-genitive-plural":"brazilienelor","singular-vocative":"braziliană","plural-vocative":"brazilienelor"}},{"word":"braziliancă","pos":"noun","definitions":["female equivalent of brazilian"],"forms":{"plural":"brazilience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"braziliancă","accusative-definite-nominative-singular":"brazilianca","accusative-indefinite-nominative-plural":"brazilience","accusative-definite-nominative-plural":"braziliencele","dative-genitive-indefinite-singular":"brazilience","dative-definite-genitive-singular":"braziliencei","dative-genitive-indefinite-plural":"brazilience","dative-definite-genitive-plural":"braziliencelor","singular-vocative":"braziliancă","plural-vocative":"braziliencelor"}},{"word":"brazilor","pos":"noun","definitions":["definite genitive/dative plural of brad"]},{"word":"Brâznic","pos":"name","definitions":["a village in Ilia, Hunedoara County, Romania"],"gender":"m","forms":{"alternative":"Brîznic"}},{"word":"brazură","pos":"noun","definitions":["soldering"],"forms":{"plural":"brazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brazură","accusative-definite-nominative-singular":"brazura","accusative-indefinite-nominative-plural":"brazuri","accusative-definite-nominative-plural":"brazurile","dative-genitive-indefinite-singular":"brazuri","dative-definite-genitive-singular":"brazurii","dative-genitive-indefinite-plural":"brazuri","dative-definite-genitive-plural":"brazurilor","singular-vocative":"brazură","plural-vocative":"brazurilor"}},{"word":"bre","pos":"intj","definitions":["hey, dude","wow"],"pronunciation":"/bre/"},{"word":"brea","pos":"intj","definitions":["obsolete form of bre"]},{"word":"breabăn","pos":"noun","definitions":["Carpathian toothwort (Cardamine glanduligera; synonyms: Dentaria glandulosa, Cardamine glandulosa)","fumewort (Corydalis marshalliana or Corydalis solida)","any of various species of the genus Anemone"],"pronunciation":"/ˈbre̯a.bən/","forms":{"plural":"brebeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"breabăn","accusative-definite-nominative-singular":"breabănul","accusative-indefinite-nominative-plural":"brebeni","accusative-definite-nominative-plural":"brebenii","dative-genitive-indefinite-singular":"breabăn","dative-definite-genitive-singular":"breabănului","dative-genitive-indefinite-plural":"brebeni","dative-definite-genitive-plural":"brebenilor","singular-vocative":"breabănule","plural-vocative":"brebenilor"}},{"word":"breanc","pos":"noun","definitions":["shard"],"forms":{"plural":"breancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"breanc","accusative-definite-nominative-singular":"breancul","accusative-indefinite-nominative-plural":"breancuri","accusative-definite-nominative-plural":"breancurile","dative-genitive-indefinite-singular":"breanc","dative-definite-genitive-singular":"breancului","dative-genitive-indefinite-plural":"breancuri","dative-definite-genitive-plural":"breancurilor","singular-vocative":"breancule","plural-vocative":"breancurilor"}},{"word":"Breanova","pos":"name","definitions":["a village in Morozeni, Orhei Raion, Moldova"],"gender":"f"},{"word":"breaslă","pos":"noun","definitions":["guild"],"forms":{"plural":"bresle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"breaslă","accusative-definite-nominative-singular":"breasla","accusative-indefinite-nominative-plural":"bresle","accusative-definite-nominative-plural":"breslele","dative-genitive-indefinite-singular":"bresle","dative-definite-genitive-singular":"breslei","dative-genitive-indefinite-plural":"bresle","dative-definite-genitive-plural":"breslelor","singular-vocative":"breaslă","plural-vocative":"breslelor"}},{"word":"Breasta","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Breasta, Dolj County, Romania"],"gender":"f"},{"word":"breaz","pos":"adj","definitions":["white-striped (about animals)","smart, bright (about humans)"],"forms":{"feminine-singular":"brează","masculine-plural":"breji","feminine-neuter-plural":"breze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"breaz","error-unrecognized-form-feminine-indefinite-singular":"brează","error-unrecognized-form-indefinite-masculine-plural":"breji","error-unrecognized-form-feminine-indefinite-neuter-plural":"breze","definite-error-unrecognized-form-masculine-neuter-singular":"breazul","definite-error-unrecognized-form-feminine-singular":"breaza","definite-error-unrecognized-form-masculine-plural":"brejii","definite-error-unrecognized-form-feminine-neuter-plural":"brezele"}},{"word":"Breaza","pos":"name","definitions":["Breaza (a city in Muntenia, in southern Romania)"],"gender":"f"},{"word":"Breaza de Jos","pos":"name","definitions":["a city in Prahova County, Romania"],"gender":"f"},{"word":"Breaza de Sus","pos":"name","definitions":["a locality in Breaza, Prahova County, Romania","a village in Breaza, Suceava County, Romania"],"gender":"f"},{"word":"Breazova","pos":"name","definitions":["a village in Sarmizegetusa, Hunedoara County, Romania","a village in Margina, Timiș County, Romania"],"gender":"f"},{"word":"Breazu","pos":"name","definitions":["a village in Rediu, Iași County, Romania"],"gender":"m"},{"word":"breazul","pos":"noun","definitions":["definite nominative/accusative singular of breaz"]},{"word":"Breb","pos":"name","definitions":["a village in Ocna Șugatag, Maramureș County, Romania"],"gender":"m"},{"word":"breb","pos":"noun","definitions":["European beaver (Castor fiber)"],"forms":{"plural":"brebi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"breb","accusative-definite-nominative-singular":"brebul","accusative-indefinite-nominative-plural":"brebi","accusative-definite-nominative-plural":"brebii","dative-genitive-indefinite-singular":"breb","dative-definite-genitive-singular":"brebului","dative-genitive-indefinite-plural":"brebi","dative-definite-genitive-plural":"brebilor","singular-vocative":"brebule","plural-vocative":"brebilor"}},{"word":"Breban","pos":"name","definitions":["a surname"],"pronunciation":"/breˈban/","gender":"m","forms":{"dative-genitive":"lui Breban"}},{"word":"brebenea","pos":"noun","definitions":["synonym of breabăn"],"pronunciation":"/bre.beˈne̯a/","forms":{"plural":"brebenele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"brebenea","accusative-definite-nominative-singular":"brebeneaua","accusative-indefinite-nominative-plural":"brebenele","accusative-definite-nominative-plural":"brebenelele","dative-genitive-indefinite-singular":"brebenele","dative-definite-genitive-singular":"brebenelei","dative-genitive-indefinite-plural":"brebenele","dative-definite-genitive-plural":"brebenelelor","singular-vocative":"brebenea","plural-vocative":"brebenelelor"}},{"word":"Brebenei","pos":"name","definitions":["a village in Brănești, Gorj County, Romania"],"gender":"m"},{"word":"brebenei","pos":"noun","definitions":["plural of brebenel"]},{"word":"Brebenel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brebenel"}},{"word":"brebenel","pos":"noun","definitions":["fumewort, spring fumewort, bird in the bush (Corydalis solida)","Marshall's corydalis (Corydalis cava subsp. marschalliana, syn. Corydalis marshalliana)"],"pronunciation":"/bre.beˈnel/","forms":{"plural":"brebenei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brebenel","accusative-definite-nominative-singular":"brebenelul","accusative-indefinite-nominative-plural":"brebenei","accusative-definite-nominative-plural":"brebeneii","dative-genitive-indefinite-singular":"brebenel","dative-definite-genitive-singular":"brebenelului","dative-genitive-indefinite-plural":"brebenei","dative-definite-genitive-plural":"brebeneilor","singular-vocative":"brebenelule","plural-vocative":"brebeneilor"}},{"word":"Brebeni","pos":"name","definitions":["a village in Ion Corvin, Constanța County, Romania","a village in Cernești, Maramureș County, Romania","a commune of Olt County, Romania","a village in Brebeni, Olt County, Romania"],"gender":"m"},{"word":"brebenoc","pos":"noun","definitions":["periwinkle"],"forms":{"plural":"brebenoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brebenoc","accusative-definite-nominative-singular":"brebenocul","accusative-indefinite-nominative-plural":"brebenoci","accusative-definite-nominative-plural":"brebenocii","dative-genitive-indefinite-singular":"brebenoc","dative-definite-genitive-singular":"brebenocului","dative-genitive-indefinite-plural":"brebenoci","dative-definite-genitive-plural":"brebenocilor","singular-vocative":"brebenocule","plural-vocative":"brebenocilor","alternative-regional":"bărbănoc"}},{"word":"Brebi","pos":"name","definitions":["a village in Creaca, Sălaj County, Romania"],"gender":"m"},{"word":"brebi","pos":"noun","definitions":["plural of breb"]},{"word":"Brebina","pos":"name","definitions":["a village in Baia de Aramă, Mehedinți County, Romania","a village in Scrioaștea, Teleorman County, Romania"],"gender":"f"},{"word":"Brebina Mare","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Brebina"],"gender":"f"},{"word":"Brebina Mică","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Brebina"],"gender":"f"},{"word":"Breboaia","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Mara"],"gender":"f"},{"word":"Brebu","pos":"name","definitions":["a village in Lopătari, Buzău County, Romania","a commune of Caraș-Severin County, Romania","a village in Brebu, Caraș-Severin County, Romania","a village in Runcu, Dâmbovița County, Romania","a commune of Prahova County, Romania"],"gender":"m"},{"word":"Brebu Mânăstirei","pos":"name","definitions":["a village in Brebu, Prahova County, Romania"],"gender":"m","forms":{"alternative":"Brebu Mînăstirei"}},{"word":"Brebu Megieșesc","pos":"name","definitions":["a village in Brebu, Prahova County, Romania"],"gender":"m"},{"word":"Brebu Nou","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Brebu Nou, Caraș-Severin County, Romania"],"gender":"m"},{"word":"brebul","pos":"noun","definitions":["definite nominative/accusative singular of breb"]},{"word":"Brebulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brebulescu"}},{"word":"brebului","pos":"noun","definitions":["definite genitive/dative singular of breb"]},{"word":"bregmă","pos":"noun","definitions":["bregma"],"forms":{"plural":"bregme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bregmă","accusative-definite-nominative-singular":"bregma","accusative-indefinite-nominative-plural":"bregme","accusative-definite-nominative-plural":"bregmele","dative-genitive-indefinite-singular":"bregme","dative-definite-genitive-singular":"bregmei","dative-genitive-indefinite-plural":"bregme","dative-definite-genitive-plural":"bregmelor","singular-vocative":"bregmă","plural-vocative":"bregmelor"}},{"word":"bregmatic","pos":"adj","definitions":["bregmatic"],"forms":{"feminine-singular":"bregmatică","masculine-plural":"bregmatici","feminine-neuter-plural":"bregmatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bregmatic","error-unrecognized-form-feminine-indefinite-singular":"bregmatică","error-unrecognized-form-indefinite-masculine-plural":"bregmatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bregmatice","definite-error-unrecognized-form-masculine-neuter-singular":"bregmaticul","definite-error-unrecognized-form-feminine-singular":"bregmatica","definite-error-unrecognized-form-masculine-plural":"bregmaticii","definite-error-unrecognized-form-feminine-neuter-plural":"bregmaticele"}},{"word":"brehnace","pos":"noun","definitions":["goshawk"],"forms":{"plural":"brehnăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brehnace","accusative-definite-nominative-singular":"brehnacea","accusative-indefinite-nominative-plural":"brehnăci","accusative-definite-nominative-plural":"brehnăcile","dative-genitive-indefinite-singular":"brehnăci","dative-definite-genitive-singular":"brehnăcii","dative-genitive-indefinite-plural":"brehnăci","dative-definite-genitive-plural":"brehnăcilor","singular-vocative":"brehnace","plural-vocative":"brehnăcilor"}},{"word":"Brehuiești","pos":"name","definitions":["a village in Vlădeni, Botoșani County, Romania"],"gender":"m"},{"word":"Brejbeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brejbeanu"}},{"word":"Brejeni","pos":"name","definitions":["a village in Ciuciuieni, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"brelan","pos":"noun","definitions":["Three of a kind, gleek"],"forms":{"plural":"brelanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brelan","accusative-definite-nominative-singular":"brelanul","accusative-indefinite-nominative-plural":"brelanuri","accusative-definite-nominative-plural":"brelanurile","dative-genitive-indefinite-singular":"brelan","dative-definite-genitive-singular":"brelanului","dative-genitive-indefinite-plural":"brelanuri","dative-definite-genitive-plural":"brelanurilor","singular-vocative":"brelanule","plural-vocative":"brelanurilor"}},{"word":"breloc","pos":"noun","definitions":["charm, keyring"],"forms":{"plural":"brelocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"breloc","accusative-definite-nominative-singular":"brelocul","accusative-indefinite-nominative-plural":"brelocuri","accusative-definite-nominative-plural":"brelocurile","dative-genitive-indefinite-singular":"breloc","dative-definite-genitive-singular":"brelocului","dative-genitive-indefinite-plural":"brelocuri","dative-definite-genitive-plural":"brelocurilor","singular-vocative":"brelocule","plural-vocative":"brelocurilor"}},{"word":"breșă","pos":"noun","definitions":["breach"],"forms":{"plural":"breșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"breșă","accusative-definite-nominative-singular":"breșa","accusative-indefinite-nominative-plural":"breșe","accusative-definite-nominative-plural":"breșele","dative-genitive-indefinite-singular":"breșe","dative-definite-genitive-singular":"breșei","dative-genitive-indefinite-plural":"breșe","dative-definite-genitive-plural":"breșelor","singular-vocative":"breșă","plural-vocative":"breșelor"}},{"word":"Brescioara","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Breaza"],"gender":"f"},{"word":"Breșfelean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Breșfelean"}},{"word":"breslaș","pos":"noun","definitions":["guildsman"],"forms":{"plural":"breslași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"breslaș","accusative-definite-nominative-singular":"breslașul","accusative-indefinite-nominative-plural":"breslași","accusative-definite-nominative-plural":"breslașii","dative-genitive-indefinite-singular":"breslaș","dative-definite-genitive-singular":"breslașului","dative-genitive-indefinite-plural":"breslași","dative-definite-genitive-plural":"breslașilor","singular-vocative":"breslașule","plural-vocative":"breslașilor"}},{"word":"Breslașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Breslașu"}},{"word":"Bresniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bresniceanu"}},{"word":"Breștea","pos":"name","definitions":["a village in Denta, Timiș County, Romania"],"gender":"f"},{"word":"Bresteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bresteanu"}},{"word":"Brestelnic","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Brestovăț","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Brestovăț, Timiș County, Romania"],"gender":"m"},{"word":"Bretan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bretan"}},{"word":"Brețcu","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Brețcu, Covasna County, Romania"],"gender":"m"},{"word":"Bretea","pos":"name","definitions":["a village in Șieu-Odorhei, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"bretea","pos":"noun","definitions":["suspenders","strap","alternative form of bretelă (“diamond crossover”)"],"pronunciation":"/breˈte̯a/","forms":{"plural":"bretele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bretea","accusative-definite-nominative-singular":"breteaua","accusative-indefinite-nominative-plural":"bretele","accusative-definite-nominative-plural":"bretelele","dative-genitive-indefinite-singular":"bretele","dative-definite-genitive-singular":"bretelei","dative-genitive-indefinite-plural":"bretele","dative-definite-genitive-plural":"bretelelor","singular-vocative":"bretea","plural-vocative":"bretelelor","alternative":"bretelă"}},{"word":"Bretea Mureșană","pos":"name","definitions":["a village in Ilia, Hunedoara County, Romania"],"gender":"f"},{"word":"Bretea Română","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Bretea Română, Hunedoara County, Romania"],"gender":"f","forms":{"alternative":"Bretea Romînă"}},{"word":"Bretea Streiului","pos":"name","definitions":["a village in Bretea Română, Hunedoara County, Romania"],"gender":"f"},{"word":"bretelă","pos":"noun","definitions":["diamond crossover","communication trench (perpendicular connection between two parallel trenches in trench warfare)","alternative form of bretea (“strap”)"],"pronunciation":"/breˈte.lə/","forms":{"plural":"bretele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bretelă","accusative-definite-nominative-singular":"bretela","accusative-indefinite-nominative-plural":"bretele","accusative-definite-nominative-plural":"bretelele","dative-genitive-indefinite-singular":"bretele","dative-definite-genitive-singular":"bretelei","dative-genitive-indefinite-plural":"bretele","dative-definite-genitive-plural":"bretelelor","singular-vocative":"bretelă","plural-vocative":"bretelelor","alternative":"bretea"}},{"word":"bretele","pos":"noun","definitions":["inflection of bretea and bretelă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"/breˈte.le/"},{"word":"bretesă","pos":"noun","definitions":["brattice"],"forms":{"plural":"bretese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bretesă","accusative-definite-nominative-singular":"bretesa","accusative-indefinite-nominative-plural":"bretese","accusative-definite-nominative-plural":"bretesele","dative-genitive-indefinite-singular":"bretese","dative-definite-genitive-singular":"bretesei","dative-genitive-indefinite-plural":"bretese","dative-definite-genitive-plural":"breteselor","singular-vocative":"bretesă","plural-vocative":"breteselor"}},{"word":"breton","pos":"adj","definitions":["Breton (of, from or relating to the region of Brittany, France)"],"pronunciation":"/breˈton/","forms":{"feminine-singular":"bretonă","masculine-plural":"bretoni","feminine-neuter-plural":"bretone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"breton","error-unrecognized-form-feminine-indefinite-singular":"bretonă","error-unrecognized-form-indefinite-masculine-plural":"bretoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bretone","definite-error-unrecognized-form-masculine-neuter-singular":"bretonul","definite-error-unrecognized-form-feminine-singular":"bretona","definite-error-unrecognized-form-masculine-plural":"bretonii","definite-error-unrecognized-form-feminine-neuter-plural":"bretonele"}},{"word":"breton","pos":"noun","definitions":["Breton (native or inhabitant of the region of Brittany, France) (usually male)"],"pronunciation":"/breˈton/","forms":{"plural":"bretoni"}},{"word":"breton","pos":"noun","definitions":["bangs, fringe"],"pronunciation":"/breˈton/","forms":{"plural":"bretoane"}},{"word":"bretonă","pos":"noun","definitions":["female equivalent of breton"],"forms":{"plural":"bretone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bretonă","accusative-definite-nominative-singular":"bretona","accusative-indefinite-nominative-plural":"bretone","accusative-definite-nominative-plural":"bretonele","dative-genitive-indefinite-singular":"bretone","dative-definite-genitive-singular":"bretonei","dative-genitive-indefinite-plural":"bretone","dative-definite-genitive-plural":"bretonelor","singular-vocative":"bretonă","plural-vocative":"bretonelor"}},{"word":"brevă","pos":"noun","definitions":["an official papal document, less solemn than a bull"],"forms":{"plural":"breve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brevă","accusative-definite-nominative-singular":"breva","accusative-indefinite-nominative-plural":"breve","accusative-definite-nominative-plural":"brevele","dative-genitive-indefinite-singular":"breve","dative-definite-genitive-singular":"brevei","dative-genitive-indefinite-plural":"breve","dative-definite-genitive-plural":"brevelor","singular-vocative":"brevă","plural-vocative":"brevelor"}},{"word":"brevet","pos":"noun","definitions":["patent","warrant"],"forms":{"plural":"brevete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brevet","accusative-definite-nominative-singular":"brevetul","accusative-indefinite-nominative-plural":"brevete","accusative-definite-nominative-plural":"brevetele","dative-genitive-indefinite-singular":"brevet","dative-definite-genitive-singular":"brevetului","dative-genitive-indefinite-plural":"brevete","dative-definite-genitive-plural":"brevetelor","singular-vocative":"brevetule","plural-vocative":"brevetelor"}},{"word":"brevet de invenție","pos":"noun","definitions":["patent"],"forms":{"plural":"brevete de invenție"}},{"word":"breveta","pos":"verb","definitions":["to patent"],"forms":{"canonical":"a breveta 1st conjugation","present-singular-third-person":"brevetează","participle-past":"brevetat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a breveta","gerund":"brevetând","first-person-indicative-present-singular":"brevetez","indicative-present-second-person-singular":"brevetezi","indicative-present-singular-third-person":"brevetează","first-person-indicative-plural-present":"brevetăm","indicative-plural-present-second-person":"brevetați","indicative-plural-present-third-person":"brevetează","first-person-imperfect-indicative-singular":"brevetam","imperfect-indicative-second-person-singular":"brevetai","imperfect-indicative-singular-third-person":"breveta","first-person-imperfect-indicative-plural":"brevetam","imperfect-indicative-plural-second-person":"brevetați","imperfect-indicative-plural-third-person":"brevetau","first-person-indicative-perfect-singular":"brevetai","indicative-perfect-second-person-singular":"brevetași","indicative-perfect-singular-third-person":"brevetă","first-person-indicative-perfect-plural":"brevetarăm","indicative-perfect-plural-second-person":"brevetarăți","indicative-perfect-plural-third-person":"brevetară","first-person-indicative-pluperfect-singular":"brevetasem","indicative-pluperfect-second-person-singular":"brevetaseși","indicative-pluperfect-singular-third-person":"brevetase","first-person-indicative-pluperfect-plural":"brevetaserăm","indicative-pluperfect-plural-second-person":"brevetaserăți","indicative-pluperfect-plural-third-person":"brevetaseră","first-person-present-singular-subjunctive":"să brevetez","present-second-person-singular-subjunctive":"să brevetezi","present-singular-subjunctive-third-person":"să breveteze","first-person-plural-present-subjunctive":"să brevetăm","plural-present-second-person-subjunctive":"să brevetați","plural-present-subjunctive-third-person":"să breveteze","imperative-second-person-singular":"brevetează","imperative-plural-second-person":"brevetați","imperative-negative-second-person-singular":"nu breveta","imperative-negative-plural-second-person":"nu brevetați"}},{"word":"brevetare","pos":"noun","definitions":["patenting"],"forms":{"plural":"brevetări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brevetare","accusative-definite-nominative-singular":"brevetarea","accusative-indefinite-nominative-plural":"brevetări","accusative-definite-nominative-plural":"brevetările","dative-genitive-indefinite-singular":"brevetări","dative-definite-genitive-singular":"brevetării","dative-genitive-indefinite-plural":"brevetări","dative-definite-genitive-plural":"brevetărilor","singular-vocative":"brevetare","plural-vocative":"brevetărilor"}},{"word":"brevetat","pos":"adj","definitions":["patented"],"forms":{"feminine-singular":"brevetată","masculine-plural":"brevetați","feminine-neuter-plural":"brevetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brevetat","error-unrecognized-form-feminine-indefinite-singular":"brevetată","error-unrecognized-form-indefinite-masculine-plural":"brevetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"brevetate","definite-error-unrecognized-form-masculine-neuter-singular":"brevetatul","definite-error-unrecognized-form-feminine-singular":"brevetata","definite-error-unrecognized-form-masculine-plural":"brevetații","definite-error-unrecognized-form-feminine-neuter-plural":"brevetatele"}},{"word":"breviar","pos":"noun","definitions":["summary"],"forms":{"plural":"breviare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"breviar","accusative-definite-nominative-singular":"breviarul","accusative-indefinite-nominative-plural":"breviare","accusative-definite-nominative-plural":"breviarele","dative-genitive-indefinite-singular":"breviar","dative-definite-genitive-singular":"breviarului","dative-genitive-indefinite-plural":"breviare","dative-definite-genitive-plural":"breviarelor","singular-vocative":"breviarule","plural-vocative":"breviarelor"}},{"word":"brevilin","pos":"adj","definitions":["short-limbed"],"forms":{"feminine-singular":"brevilină","masculine-plural":"brevilini","feminine-neuter-plural":"breviline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brevilin","error-unrecognized-form-feminine-indefinite-singular":"brevilină","error-unrecognized-form-indefinite-masculine-plural":"brevilini","error-unrecognized-form-feminine-indefinite-neuter-plural":"breviline","definite-error-unrecognized-form-masculine-neuter-singular":"brevilinul","definite-error-unrecognized-form-feminine-singular":"brevilina","definite-error-unrecognized-form-masculine-plural":"brevilinii","definite-error-unrecognized-form-feminine-neuter-plural":"brevilinele"}},{"word":"brevilin","pos":"noun","definitions":["short-limbed person"],"forms":{"plural":"brevilini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brevilin","accusative-definite-nominative-singular":"brevilinul","accusative-indefinite-nominative-plural":"brevilini","accusative-definite-nominative-plural":"brevilinii","dative-genitive-indefinite-singular":"brevilin","dative-definite-genitive-singular":"brevilinului","dative-genitive-indefinite-plural":"brevilini","dative-definite-genitive-plural":"brevilinilor","singular-vocative":"brevilinule","plural-vocative":"brevilinilor"}},{"word":"brevilină","pos":"noun","definitions":["female equivalent of brevilin"],"forms":{"plural":"breviline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brevilină","accusative-definite-nominative-singular":"brevilina","accusative-indefinite-nominative-plural":"breviline","accusative-definite-nominative-plural":"brevilinele","dative-genitive-indefinite-singular":"breviline","dative-definite-genitive-singular":"brevilinei","dative-genitive-indefinite-plural":"breviline","dative-definite-genitive-plural":"brevilinelor","singular-vocative":"brevilină","plural-vocative":"brevilinelor"}},{"word":"brevilocvent","pos":"adj","definitions":["concise"],"forms":{"feminine-singular":"brevilocventă","masculine-plural":"brevilocvenți","feminine-neuter-plural":"brevilocvente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brevilocvent","error-unrecognized-form-feminine-indefinite-singular":"brevilocventă","error-unrecognized-form-indefinite-masculine-plural":"brevilocvenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"brevilocvente","definite-error-unrecognized-form-masculine-neuter-singular":"brevilocventul","definite-error-unrecognized-form-feminine-singular":"brevilocventa","definite-error-unrecognized-form-masculine-plural":"brevilocvenții","definite-error-unrecognized-form-feminine-neuter-plural":"brevilocventele"}},{"word":"brevilocvență","pos":"noun","definitions":["conciseness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"brevilocvență","accusative-definite-nominative":"brevilocvența","dative-genitive-indefinite":"brevilocvențe","dative-definite-genitive":"brevilocvenței","vocative":"brevilocvență"}},{"word":"brevitate","pos":"noun","definitions":["shortness, brevity, concision"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"brevitate","accusative-definite-nominative":"brevitatea","dative-genitive-indefinite":"brevități","dative-definite-genitive":"brevității","vocative":"-"}},{"word":"Brexit","pos":"name","definitions":["Brexit"],"gender":"n"},{"word":"Brezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brezan"}},{"word":"Brezeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brezeanu"}},{"word":"Breznicioara","pos":"name","definitions":["a village in Stângăceaua, Mehedinți County, Romania"],"gender":"f"},{"word":"Breznița-Motru","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Breznița-Motru, Mehedinți County, Romania"],"gender":"f"},{"word":"Breznița-Ocol","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Breznița-Ocol, Mehedinți County, Romania"],"gender":"f"},{"word":"Brezoaele","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Brezoaele, Dâmbovița County, Romania"],"gender":"m"},{"word":"Brezoaia","pos":"name","definitions":["a village in Brezoaele, Dâmbovița County, Romania"],"gender":"f"},{"word":"Brezoi","pos":"name","definitions":["a town in Vâlcea County, Romania"],"gender":"m"},{"word":"Brezoianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brezoianu"}},{"word":"Brezon","pos":"name","definitions":["a village in Forotic, Caraș-Severin County, Romania"],"gender":"m"},{"word":"bria","pos":"verb","definitions":["to shine, to sparkle"],"forms":{"canonical":"a bria 1st conjugation","present-singular-third-person":"briază","participle-past":"briat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bria","gerund":"briind","first-person-indicative-present-singular":"briez","indicative-present-second-person-singular":"briezi","indicative-present-singular-third-person":"briază","first-person-indicative-plural-present":"briem","indicative-plural-present-second-person":"briați","indicative-plural-present-third-person":"briază","first-person-imperfect-indicative-singular":"briam","imperfect-indicative-second-person-singular":"briai","imperfect-indicative-singular-third-person":"bria","first-person-imperfect-indicative-plural":"briam","imperfect-indicative-plural-second-person":"briați","imperfect-indicative-plural-third-person":"briau","first-person-indicative-perfect-singular":"briai","indicative-perfect-second-person-singular":"briași","indicative-perfect-singular-third-person":"brie","first-person-indicative-perfect-plural":"briarăm","indicative-perfect-plural-second-person":"briarăți","indicative-perfect-plural-third-person":"briară","first-person-indicative-pluperfect-singular":"briasem","indicative-pluperfect-second-person-singular":"briaseși","indicative-pluperfect-singular-third-person":"briase","first-person-indicative-pluperfect-plural":"briaserăm","indicative-pluperfect-plural-second-person":"briaserăți","indicative-pluperfect-plural-third-person":"briaseră","first-person-present-singular-subjunctive":"să briez","present-second-person-singular-subjunctive":"să briezi","present-singular-subjunctive-third-person":"să brieze","first-person-plural-present-subjunctive":"să briem","plural-present-second-person-subjunctive":"să briați","plural-present-subjunctive-third-person":"să brieze","imperative-second-person-singular":"briază","imperative-plural-second-person":"briați","imperative-negative-second-person-singular":"nu bria","imperative-negative-plural-second-person":"nu briați"}},{"word":"briant","pos":"adj","definitions":["brilliant"],"forms":{"feminine-singular":"briantă","masculine-plural":"brianți","feminine-neuter-plural":"briante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"briant","error-unrecognized-form-feminine-indefinite-singular":"briantă","error-unrecognized-form-indefinite-masculine-plural":"brianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"briante","definite-error-unrecognized-form-masculine-neuter-singular":"briantul","definite-error-unrecognized-form-feminine-singular":"brianta","definite-error-unrecognized-form-masculine-plural":"brianții","definite-error-unrecognized-form-feminine-neuter-plural":"briantele"}},{"word":"brianță","pos":"noun","definitions":["brilliance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brianță","accusative-definite-nominative-singular":"brianța","accusative-indefinite-nominative-plural":"brianțe","accusative-definite-nominative-plural":"brianțele","dative-genitive-indefinite-singular":"brianțe","dative-definite-genitive-singular":"brianței","dative-genitive-indefinite-plural":"brianțe","dative-definite-genitive-plural":"brianțelor","singular-vocative":"brianță","plural-vocative":"brianțelor"}},{"word":"briantină","pos":"noun","definitions":["brilliantine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"briantină","accusative-definite-nominative-singular":"briantina","accusative-indefinite-nominative-plural":"briantine","accusative-definite-nominative-plural":"briantinele","dative-genitive-indefinite-singular":"briantine","dative-definite-genitive-singular":"briantinei","dative-genitive-indefinite-plural":"briantine","dative-definite-genitive-plural":"briantinelor","singular-vocative":"briantină","plural-vocative":"briantinelor"}},{"word":"briboi","pos":"noun","definitions":["wood cranesbill (Geranium silvaticum)"],"forms":{"plural":"briboi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"briboi","accusative-definite-nominative-singular":"briboiul","accusative-indefinite-nominative-plural":"briboi","accusative-definite-nominative-plural":"briboii","dative-genitive-indefinite-singular":"briboi","dative-definite-genitive-singular":"briboiului","dative-genitive-indefinite-plural":"briboi","dative-definite-genitive-plural":"briboilor","singular-vocative":"briboiule","plural-vocative":"briboilor"}},{"word":"bric","pos":"noun","definitions":["A brig, a two-masted vessel type."],"forms":{"plural":"bricuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bric","accusative-definite-nominative-singular":"bricul","accusative-indefinite-nominative-plural":"bricuri","accusative-definite-nominative-plural":"bricurile","dative-genitive-indefinite-singular":"bric","dative-definite-genitive-singular":"bricului","dative-genitive-indefinite-plural":"bricuri","dative-definite-genitive-plural":"bricurilor","singular-vocative":"bricule","plural-vocative":"bricurilor"}},{"word":"bric-à-brac","pos":"noun","definitions":["bric-a-brac shop"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bric-à-brac","accusative-definite-nominative":"bric-à-bracul","dative-genitive-indefinite":"bric-à-brac","dative-definite-genitive":"bric-à-bracului","vocative":"bric-à-bracule"}},{"word":"brică","pos":"noun","definitions":["brig"],"forms":{"plural":"bricuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brică","accusative-definite-nominative-singular":"bricăul","accusative-indefinite-nominative-plural":"bricăuri","accusative-definite-nominative-plural":"bricăurile","dative-genitive-indefinite-singular":"brică","dative-definite-genitive-singular":"bricăului","dative-genitive-indefinite-plural":"bricăuri","dative-definite-genitive-plural":"bricăurilor","singular-vocative":"bricăule","plural-vocative":"bricăurilor"}},{"word":"bricabrac","pos":"noun","definitions":["bric-a-brac"],"forms":{"plural":"bricabracuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bricabrac","accusative-definite-nominative-singular":"bricabracul","accusative-indefinite-nominative-plural":"bricabracuri","accusative-definite-nominative-plural":"bricabracurile","dative-genitive-indefinite-singular":"bricabrac","dative-definite-genitive-singular":"bricabracului","dative-genitive-indefinite-plural":"bricabracuri","dative-definite-genitive-plural":"bricabracurilor","singular-vocative":"bricabracule","plural-vocative":"bricabracurilor"}},{"word":"brice","pos":"noun","definitions":["indefinite plural of brici"],"pronunciation":"[ˈbrit͡ʃe]","gender":"n"},{"word":"Briceag","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Briceag"}},{"word":"briceag","pos":"noun","definitions":["pocketknife"],"forms":{"plural":"bricege","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"briceag","accusative-definite-nominative-singular":"briceagul","accusative-indefinite-nominative-plural":"bricege","accusative-definite-nominative-plural":"bricegele","dative-genitive-indefinite-singular":"briceag","dative-definite-genitive-singular":"briceagului","dative-genitive-indefinite-plural":"bricege","dative-definite-genitive-plural":"bricegelor","singular-vocative":"briceagule","plural-vocative":"bricegelor"}},{"word":"bricegel","pos":"noun","definitions":["diminutive of briceag"],"forms":{"plural":"bricegele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bricegel","accusative-definite-nominative-singular":"bricegelul","accusative-indefinite-nominative-plural":"bricegele","accusative-definite-nominative-plural":"bricegelele","dative-genitive-indefinite-singular":"bricegel","dative-definite-genitive-singular":"bricegelului","dative-genitive-indefinite-plural":"bricegele","dative-definite-genitive-plural":"bricegelelor","singular-vocative":"bricegelule","plural-vocative":"bricegelelor"}},{"word":"briceguț","pos":"noun","definitions":["diminutive of briceag"],"forms":{"plural":"briceguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"briceguț","accusative-definite-nominative-singular":"briceguțul","accusative-indefinite-nominative-plural":"briceguțe","accusative-definite-nominative-plural":"briceguțele","dative-genitive-indefinite-singular":"briceguț","dative-definite-genitive-singular":"briceguțului","dative-genitive-indefinite-plural":"briceguțe","dative-definite-genitive-plural":"briceguțelor","singular-vocative":"briceguțule","plural-vocative":"briceguțelor"}},{"word":"Briceni","pos":"name","definitions":["a city and district of Moldova","a village in Briceni, Dondușeni Raion, Moldova","a commune of Dondușeni Raion, Moldova"],"pronunciation":"/briˈt͡ʃenʲ/","gender":"m"},{"word":"bricer","pos":"noun","definitions":["knifegrinder"],"forms":{"plural":"briceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bricer","accusative-definite-nominative-singular":"bricerul","accusative-indefinite-nominative-plural":"briceri","accusative-definite-nominative-plural":"bricerii","dative-genitive-indefinite-singular":"bricer","dative-definite-genitive-singular":"bricerului","dative-genitive-indefinite-plural":"briceri","dative-definite-genitive-plural":"bricerilor","singular-vocative":"bricerule","plural-vocative":"bricerilor"}},{"word":"brichetă","pos":"noun","definitions":["lighter"],"forms":{"plural":"brichete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brichetă","accusative-definite-nominative-singular":"bricheta","accusative-indefinite-nominative-plural":"brichete","accusative-definite-nominative-plural":"brichetele","dative-genitive-indefinite-singular":"brichete","dative-definite-genitive-singular":"brichetei","dative-genitive-indefinite-plural":"brichete","dative-definite-genitive-plural":"brichetelor","singular-vocative":"brichetă","plural-vocative":"brichetelor"}},{"word":"brichetaj","pos":"noun","definitions":["briquetage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brichetaj","accusative-definite-nominative":"brichetajul","dative-genitive-indefinite":"brichetaj","dative-definite-genitive":"brichetajului","vocative":"brichetajule"}},{"word":"brichetare","pos":"noun","definitions":["briquetting"],"forms":{"plural":"brichetări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brichetare","accusative-definite-nominative-singular":"brichetarea","accusative-indefinite-nominative-plural":"brichetări","accusative-definite-nominative-plural":"brichetările","dative-genitive-indefinite-singular":"brichetări","dative-definite-genitive-singular":"brichetării","dative-genitive-indefinite-plural":"brichetări","dative-definite-genitive-plural":"brichetărilor","singular-vocative":"brichetare","plural-vocative":"brichetărilor"}},{"word":"brichetat","pos":"noun","definitions":["briquetting"],"forms":{"plural":"brichetaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brichetat","accusative-definite-nominative-singular":"brichetatul","accusative-indefinite-nominative-plural":"brichetaturi","accusative-definite-nominative-plural":"brichetaturile","dative-genitive-indefinite-singular":"brichetat","dative-definite-genitive-singular":"brichetatului","dative-genitive-indefinite-plural":"brichetaturi","dative-definite-genitive-plural":"brichetaturilor","singular-vocative":"brichetatule","plural-vocative":"brichetaturilor"}},{"word":"brichetat","pos":"verb","definitions":["past participle of bricheta"],"forms":{"participle-past":"of bricheta"}},{"word":"brichinire","pos":"noun","definitions":["admonition"],"forms":{"plural":"brichiniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brichinire","accusative-definite-nominative-singular":"brichinirea","accusative-indefinite-nominative-plural":"brichiniri","accusative-definite-nominative-plural":"brichinirile","dative-genitive-indefinite-singular":"brichiniri","dative-definite-genitive-singular":"brichinirii","dative-genitive-indefinite-plural":"brichiniri","dative-definite-genitive-plural":"brichinirilor","singular-vocative":"brichinire","plural-vocative":"brichinirilor"}},{"word":"Brici","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brici"}},{"word":"brici","pos":"noun","definitions":["razor"],"pronunciation":"/brit͡ʃʲ/","forms":{"plural":"brice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brici","accusative-definite-nominative-singular":"briciul","accusative-indefinite-nominative-plural":"brice","accusative-definite-nominative-plural":"bricele","dative-genitive-indefinite-singular":"brici","dative-definite-genitive-singular":"briciului","dative-genitive-indefinite-plural":"brice","dative-definite-genitive-plural":"bricelor","singular-vocative":"briciule","plural-vocative":"bricelor"}},{"word":"bricicar","pos":"noun","definitions":["obsolete form of brișcar"],"forms":{"plural":"bricicari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bricicar","accusative-definite-nominative-singular":"bricicarul","accusative-indefinite-nominative-plural":"bricicari","accusative-definite-nominative-plural":"bricicarii","dative-genitive-indefinite-singular":"bricicar","dative-definite-genitive-singular":"bricicarului","dative-genitive-indefinite-plural":"bricicari","dative-definite-genitive-plural":"bricicarilor","singular-vocative":"bricicarule","plural-vocative":"bricicarilor"}},{"word":"bricinăriță","pos":"noun","definitions":["old woman"],"forms":{"plural":"bricinărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bricinăriță","accusative-definite-nominative-singular":"bricinărița","accusative-indefinite-nominative-plural":"bricinărițe","accusative-definite-nominative-plural":"bricinărițele","dative-genitive-indefinite-singular":"bricinărițe","dative-definite-genitive-singular":"bricinăriței","dative-genitive-indefinite-plural":"bricinărițe","dative-definite-genitive-plural":"bricinărițelor","singular-vocative":"bricinăriță","plural-vocative":"bricinărițelor"}},{"word":"Briciu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Briciu"}},{"word":"briciul lui Occam","pos":"noun","definitions":["Occam's razor"]},{"word":"bricola","pos":"verb","definitions":["to do DIY"],"forms":{"canonical":"a bricola 1st conjugation","present-singular-third-person":"bricolează","participle-past":"bricolat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bricola","gerund":"bricolând","first-person-indicative-present-singular":"bricolez","indicative-present-second-person-singular":"bricolezi","indicative-present-singular-third-person":"bricolează","first-person-indicative-plural-present":"bricolăm","indicative-plural-present-second-person":"bricolați","indicative-plural-present-third-person":"bricolează","first-person-imperfect-indicative-singular":"bricolam","imperfect-indicative-second-person-singular":"bricolai","imperfect-indicative-singular-third-person":"bricola","first-person-imperfect-indicative-plural":"bricolam","imperfect-indicative-plural-second-person":"bricolați","imperfect-indicative-plural-third-person":"bricolau","first-person-indicative-perfect-singular":"bricolai","indicative-perfect-second-person-singular":"bricolași","indicative-perfect-singular-third-person":"bricolă","first-person-indicative-perfect-plural":"bricolarăm","indicative-perfect-plural-second-person":"bricolarăți","indicative-perfect-plural-third-person":"bricolară","first-person-indicative-pluperfect-singular":"bricolasem","indicative-pluperfect-second-person-singular":"bricolaseși","indicative-pluperfect-singular-third-person":"bricolase","first-person-indicative-pluperfect-plural":"bricolaserăm","indicative-pluperfect-plural-second-person":"bricolaserăți","indicative-pluperfect-plural-third-person":"bricolaseră","first-person-present-singular-subjunctive":"să bricolez","present-second-person-singular-subjunctive":"să bricolezi","present-singular-subjunctive-third-person":"să bricoleze","first-person-plural-present-subjunctive":"să bricolăm","plural-present-second-person-subjunctive":"să bricolați","plural-present-subjunctive-third-person":"să bricoleze","imperative-second-person-singular":"bricolează","imperative-plural-second-person":"bricolați","imperative-negative-second-person-singular":"nu bricola","imperative-negative-plural-second-person":"nu bricolați"}},{"word":"bricolă","pos":"noun","definitions":["bricole (catapult)"],"forms":{"plural":"bricole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bricolă","accusative-definite-nominative-singular":"bricola","accusative-indefinite-nominative-plural":"bricole","accusative-definite-nominative-plural":"bricolele","dative-genitive-indefinite-singular":"bricole","dative-definite-genitive-singular":"bricolei","dative-genitive-indefinite-plural":"bricole","dative-definite-genitive-plural":"bricolelor","singular-vocative":"bricolă","plural-vocative":"bricolelor"}},{"word":"bricolaj","pos":"noun","definitions":["DIY, do-it-yourself"],"forms":{"plural":"bricolaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bricolaj","accusative-definite-nominative-singular":"bricolajul","accusative-indefinite-nominative-plural":"bricolaje","accusative-definite-nominative-plural":"bricolajele","dative-genitive-indefinite-singular":"bricolaj","dative-definite-genitive-singular":"bricolajului","dative-genitive-indefinite-plural":"bricolaje","dative-definite-genitive-plural":"bricolajelor","singular-vocative":"bricolajule","plural-vocative":"bricolajelor"}},{"word":"bridă","pos":"noun","definitions":["bridle"],"forms":{"plural":"bride","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bridă","accusative-definite-nominative-singular":"brida","accusative-indefinite-nominative-plural":"bride","accusative-definite-nominative-plural":"bridele","dative-genitive-indefinite-singular":"bride","dative-definite-genitive-singular":"bridei","dative-genitive-indefinite-plural":"bride","dative-definite-genitive-plural":"bridelor","singular-vocative":"bridă","plural-vocative":"bridelor"}},{"word":"bridge","pos":"noun","definitions":["bridge (card game)","a game of bridge"],"forms":{"plural":"bridge-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bridge","accusative-definite-nominative-singular":"bridge-ul","accusative-indefinite-nominative-plural":"bridge-uri","accusative-definite-nominative-plural":"bridge-urile","dative-genitive-indefinite-singular":"bridge","dative-definite-genitive-singular":"bridge-ului","dative-genitive-indefinite-plural":"bridge-uri","dative-definite-genitive-plural":"bridge-urilor","singular-vocative":"bridge-ule","plural-vocative":"bridge-urilor"}},{"word":"bridgist","pos":"noun","definitions":["bridge player"],"forms":{"plural":"bridgiști","feminine":"equivalent bridgistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bridgist","accusative-definite-nominative-singular":"bridgistul","accusative-indefinite-nominative-plural":"bridgisti","accusative-definite-nominative-plural":"bridgistii","dative-genitive-indefinite-singular":"bridgist","dative-definite-genitive-singular":"bridgistului","dative-genitive-indefinite-plural":"bridgisti","dative-definite-genitive-plural":"bridgistilor","singular-vocative":"bridgistule","plural-vocative":"bridgistilor"}},{"word":"bridgistă","pos":"noun","definitions":["female equivalent of bridgist"],"forms":{"plural":"bridgiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bridgistă","accusative-definite-nominative-singular":"bridgista","accusative-indefinite-nominative-plural":"bridgiste","accusative-definite-nominative-plural":"bridgistele","dative-genitive-indefinite-singular":"bridgiste","dative-definite-genitive-singular":"bridgistei","dative-genitive-indefinite-plural":"bridgiste","dative-definite-genitive-plural":"bridgistelor","singular-vocative":"bridgistă","plural-vocative":"bridgistelor"}},{"word":"brie","pos":"noun","definitions":["brie (variety of French cheese)"],"pronunciation":"/bri/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brie","accusative-definite-nominative":"brieul","dative-genitive-indefinite":"brie","dative-definite-genitive":"brieului","vocative":"brieule"}},{"word":"briefing","pos":"noun","definitions":["briefing"],"pronunciation":"/ˈbri.fiŋɡ/","forms":{"plural":"briefinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"briefing","accusative-definite-nominative-singular":"briefingul","accusative-indefinite-nominative-plural":"briefinguri","accusative-definite-nominative-plural":"briefingurile","dative-genitive-indefinite-singular":"briefing","dative-definite-genitive-singular":"briefingului","dative-genitive-indefinite-plural":"briefinguri","dative-definite-genitive-plural":"briefingurilor","singular-vocative":"briefingule","plural-vocative":"briefingurilor"}},{"word":"brif","pos":"noun","definitions":["letter"],"forms":{"plural":"brifuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brif","accusative-definite-nominative-singular":"briful","accusative-indefinite-nominative-plural":"brifuri","accusative-definite-nominative-plural":"brifurile","dative-genitive-indefinite-singular":"brif","dative-definite-genitive-singular":"brifului","dative-genitive-indefinite-plural":"brifuri","dative-definite-genitive-plural":"brifurilor","singular-vocative":"brifule","plural-vocative":"brifurilor"}},{"word":"brigadă","pos":"noun","definitions":["brigade"],"forms":{"plural":"brigăzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brigadă","accusative-definite-nominative-singular":"brigada","accusative-indefinite-nominative-plural":"brigade","accusative-definite-nominative-plural":"brigadele","dative-genitive-indefinite-singular":"brigade","dative-definite-genitive-singular":"brigadei","dative-genitive-indefinite-plural":"brigade","dative-definite-genitive-plural":"brigadelor","singular-vocative":"brigadă","plural-vocative":"brigadelor"}},{"word":"brigadier","pos":"noun","definitions":["brigadier (military)","forester (forestry)","brigadier general"],"pronunciation":"/bri.ɡa.diˈer/","forms":{"plural":"brigadieri","feminine":"equivalent brigadieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brigadier","accusative-definite-nominative-singular":"brigadierul","accusative-indefinite-nominative-plural":"brigadieri","accusative-definite-nominative-plural":"brigadierii","dative-genitive-indefinite-singular":"brigadier","dative-definite-genitive-singular":"brigadierului","dative-genitive-indefinite-plural":"brigadieri","dative-definite-genitive-plural":"brigadierilor","singular-vocative":"brigadierule","plural-vocative":"brigadierilor"}},{"word":"brigadieră","pos":"noun","definitions":["female equivalent of brigadier"],"forms":{"plural":"brigadiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brigadieră","accusative-definite-nominative-singular":"brigadiera","accusative-indefinite-nominative-plural":"brigadiere","accusative-definite-nominative-plural":"brigadierele","dative-genitive-indefinite-singular":"brigadiere","dative-definite-genitive-singular":"brigadierei","dative-genitive-indefinite-plural":"brigadiere","dative-definite-genitive-plural":"brigadierelor","singular-vocative":"brigadieră","plural-vocative":"brigadierelor"}},{"word":"brigand","pos":"noun","definitions":["brigand"],"forms":{"plural":"briganzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brigand","accusative-definite-nominative-singular":"brigandul","accusative-indefinite-nominative-plural":"briganzi","accusative-definite-nominative-plural":"briganzii","dative-genitive-indefinite-singular":"brigand","dative-definite-genitive-singular":"brigandului","dative-genitive-indefinite-plural":"briganzi","dative-definite-genitive-plural":"briganzilor","singular-vocative":"brigandule","plural-vocative":"briganzilor"}},{"word":"brigandaj","pos":"noun","definitions":["brigandage"],"forms":{"plural":"brigandaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brigandaj","accusative-definite-nominative-singular":"brigandajul","accusative-indefinite-nominative-plural":"brigandaje","accusative-definite-nominative-plural":"brigandajele","dative-genitive-indefinite-singular":"brigandaj","dative-definite-genitive-singular":"brigandajului","dative-genitive-indefinite-plural":"brigandaje","dative-definite-genitive-plural":"brigandajelor","singular-vocative":"brigandajule","plural-vocative":"brigandajelor"}},{"word":"brigantină","pos":"noun","definitions":["brigantine"],"forms":{"plural":"brigantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brigantină","accusative-definite-nominative-singular":"brigantina","accusative-indefinite-nominative-plural":"brigantine","accusative-definite-nominative-plural":"brigantinele","dative-genitive-indefinite-singular":"brigantine","dative-definite-genitive-singular":"brigantinei","dative-genitive-indefinite-plural":"brigantine","dative-definite-genitive-plural":"brigantinelor","singular-vocative":"brigantină","plural-vocative":"brigantinelor"}},{"word":"Brîglezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brîglezan"}},{"word":"Brîglezean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brîglezean"}},{"word":"brilănțel","pos":"noun","definitions":["diminutive of briliant; small brilliant"],"forms":{"plural":"brilănțele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brilănțel","accusative-definite-nominative-singular":"brilănțelul","accusative-indefinite-nominative-plural":"brilănțele","accusative-definite-nominative-plural":"brilănțelele","dative-genitive-indefinite-singular":"brilănțel","dative-definite-genitive-singular":"brilănțelului","dative-genitive-indefinite-plural":"brilănțele","dative-definite-genitive-plural":"brilănțelelor","singular-vocative":"brilănțelule","plural-vocative":"brilănțelelor"}},{"word":"briliant","pos":"noun","definitions":["brilliant"],"forms":{"plural":"briliante","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"briliant","accusative-definite-nominative-singular":"briliantul","accusative-indefinite-nominative-plural":"briliante","accusative-definite-nominative-plural":"briliantele","dative-genitive-indefinite-singular":"briliant","dative-definite-genitive-singular":"briliantului","dative-genitive-indefinite-plural":"briliante","dative-definite-genitive-plural":"briliantelor","singular-vocative":"briliantule","plural-vocative":"briliantelor"}},{"word":"briliantin","pos":"adj","definitions":["brilliant"],"forms":{"feminine-singular":"briliantină","masculine-plural":"briliantini","feminine-neuter-plural":"briliantine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"briliantin","error-unrecognized-form-feminine-indefinite-singular":"briliantină","error-unrecognized-form-indefinite-masculine-plural":"briliantini","error-unrecognized-form-feminine-indefinite-neuter-plural":"briliantine","definite-error-unrecognized-form-masculine-neuter-singular":"briliantinul","definite-error-unrecognized-form-feminine-singular":"briliantina","definite-error-unrecognized-form-masculine-plural":"briliantinii","definite-error-unrecognized-form-feminine-neuter-plural":"briliantinele"}},{"word":"briliantină","pos":"noun","definitions":["alternative form of briantină"],"forms":{"plural":"briliantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"briliantină","accusative-definite-nominative-singular":"briliantina","accusative-indefinite-nominative-plural":"briliantine","accusative-definite-nominative-plural":"briliantinele","dative-genitive-indefinite-singular":"briliantine","dative-definite-genitive-singular":"briliantinei","dative-genitive-indefinite-plural":"briliantine","dative-definite-genitive-plural":"briliantinelor","singular-vocative":"briliantină","plural-vocative":"briliantinelor"}},{"word":"Brîncuși","pos":"name","definitions":["Formerly standard spelling of Brâncuși which was introduced in 1953 and deprecated in 1993."],"gender":"m"},{"word":"brîncușian","pos":"adj","definitions":["Formerly standard spelling of brâncușian which was introduced in 1953 and deprecated in 1993."],"forms":{"feminine-singular":"brîncușiană","masculine-plural":"brîncușieni","feminine-neuter-plural":"brîncușiene"}},{"word":"Brîndușa","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brîndușa"}},{"word":"Brîndușă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brîndușă"}},{"word":"Brîndușel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brîndușel"}},{"word":"Brîndușoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brîndușoiu"}},{"word":"Brînza","pos":"name","definitions":["a village in Brînza, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova","a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînza"}},{"word":"Brînză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînză"}},{"word":"brînză","pos":"noun","definitions":["Formerly standard spelling of brânză which was introduced in 1953 and deprecated in 1993."],"forms":{"plural":"brînzeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"brînză","accusative-definite-nominative-singular":"brînza","accusative-indefinite-nominative-plural":"brînzeturi","accusative-definite-nominative-plural":"brînzeturile","dative-genitive-indefinite-singular":"brînze","dative-definite-genitive-singular":"brînzei","dative-genitive-indefinite-plural":"brînzeturi","dative-definite-genitive-plural":"brînzeturilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Brînzan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînzan"}},{"word":"Brînzănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brînzănescu"}},{"word":"Brînzanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînzanu"}},{"word":"Brînzaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Brînzaru"}},{"word":"Brînzaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînzaș"}},{"word":"Brînzea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînzea"}},{"word":"Brînzeni","pos":"name","definitions":["a village in Brînzeni, Edineț Raion, Moldova","a village in Camenca, Glodeni Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Brînzenii Noi","pos":"name","definitions":["a village in Brînzenii Noi, Telenești Raion, Moldova"],"gender":"m"},{"word":"Brînzenii Vechi","pos":"name","definitions":["a village in Brînzenii Noi, Telenești Raion, Moldova"],"gender":"m"},{"word":"Brînzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brînzescu"}},{"word":"Brînzilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brînzilă"}},{"word":"Brînzoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Brînzoi"}},{"word":"briofită","pos":"noun","definitions":["bryophyte"],"forms":{"plural":"briofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"briofită","accusative-definite-nominative-singular":"briofita","accusative-indefinite-nominative-plural":"briofite","accusative-definite-nominative-plural":"briofitele","dative-genitive-indefinite-singular":"briofite","dative-definite-genitive-singular":"briofitei","dative-genitive-indefinite-plural":"briofite","dative-definite-genitive-plural":"briofitelor","singular-vocative":"briofită","plural-vocative":"briofitelor"}},{"word":"briologic","pos":"adj","definitions":["bryological"],"forms":{"feminine-singular":"briologică","masculine-plural":"briologici","feminine-neuter-plural":"briologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"briologic","error-unrecognized-form-feminine-indefinite-singular":"briologică","error-unrecognized-form-indefinite-masculine-plural":"briologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"briologice","definite-error-unrecognized-form-masculine-neuter-singular":"briologicul","definite-error-unrecognized-form-feminine-singular":"briologica","definite-error-unrecognized-form-masculine-plural":"briologicii","definite-error-unrecognized-form-feminine-neuter-plural":"briologicele"}},{"word":"briologie","pos":"noun","definitions":["bryology"],"forms":{"plural":"briologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"briologie","accusative-definite-nominative-singular":"briologia","accusative-indefinite-nominative-plural":"briologii","accusative-definite-nominative-plural":"briologiile","dative-genitive-indefinite-singular":"briologii","dative-definite-genitive-singular":"briologiei","dative-genitive-indefinite-plural":"briologii","dative-definite-genitive-plural":"briologiilor","singular-vocative":"briologie","plural-vocative":"briologiilor"}},{"word":"brioșă","pos":"noun","definitions":["muffin"],"forms":{"plural":"brioșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brioșă","accusative-definite-nominative-singular":"brioșa","accusative-indefinite-nominative-plural":"brioșe","accusative-definite-nominative-plural":"brioșele","dative-genitive-indefinite-singular":"brioșe","dative-definite-genitive-singular":"brioșei","dative-genitive-indefinite-plural":"brioșe","dative-definite-genitive-plural":"brioșelor","singular-vocative":"brioșă","plural-vocative":"brioșelor"}},{"word":"briozoar","pos":"noun","definitions":["bryozoan"],"forms":{"plural":"briozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"briozoar","accusative-definite-nominative-singular":"briozoarul","accusative-indefinite-nominative-plural":"briozoare","accusative-definite-nominative-plural":"briozoarele","dative-genitive-indefinite-singular":"briozoar","dative-definite-genitive-singular":"briozoarului","dative-genitive-indefinite-plural":"briozoare","dative-definite-genitive-plural":"briozoarelor","singular-vocative":"briozoarule","plural-vocative":"briozoarelor"}},{"word":"Brișcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brișcă"}},{"word":"brișcă","pos":"noun","definitions":["pocketknife"],"forms":{"plural":"briște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brișcă","accusative-definite-nominative-singular":"brișca","accusative-indefinite-nominative-plural":"briște","accusative-definite-nominative-plural":"briștele","dative-genitive-indefinite-singular":"briște","dative-definite-genitive-singular":"briștei","dative-genitive-indefinite-plural":"briște","dative-definite-genitive-plural":"briștelor","singular-vocative":"brișcă","plural-vocative":"briștelor"}},{"word":"brișcar","pos":"noun","definitions":["pocketknife maker or seller"],"forms":{"plural":"brișcari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brișcar","accusative-definite-nominative-singular":"brișcarul","accusative-indefinite-nominative-plural":"brișcari","accusative-definite-nominative-plural":"brișcarii","dative-genitive-indefinite-singular":"brișcar","dative-definite-genitive-singular":"brișcarului","dative-genitive-indefinite-plural":"brișcari","dative-definite-genitive-plural":"brișcarilor","singular-vocative":"brișcarule","plural-vocative":"brișcarilor"}},{"word":"Brișcariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Brișcariu"}},{"word":"Brișcaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Brișcaru"}},{"word":"brișculiță","pos":"noun","definitions":["diminutive of brișcă"],"forms":{"plural":"brișculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brișculiță","accusative-definite-nominative-singular":"brișculița","accusative-indefinite-nominative-plural":"brișculițe","accusative-definite-nominative-plural":"brișculițele","dative-genitive-indefinite-singular":"brișculițe","dative-definite-genitive-singular":"brișculiței","dative-genitive-indefinite-plural":"brișculițe","dative-definite-genitive-plural":"brișculițelor","singular-vocative":"brișculiță","plural-vocative":"brișculițelor"}},{"word":"brișcuță","pos":"noun","definitions":["diminutive of brișcă"],"forms":{"plural":"brișcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brișcuță","accusative-definite-nominative-singular":"brișcuța","accusative-indefinite-nominative-plural":"brișcuțe","accusative-definite-nominative-plural":"brișcuțele","dative-genitive-indefinite-singular":"brișcuțe","dative-definite-genitive-singular":"brișcuței","dative-genitive-indefinite-plural":"brișcuțe","dative-definite-genitive-plural":"brișcuțelor","singular-vocative":"brișcuță","plural-vocative":"brișcuțelor"}},{"word":"bristol","pos":"noun","definitions":["Bristol board"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bristol","accusative-definite-nominative":"bristolul","dative-genitive-indefinite":"bristol","dative-definite-genitive":"bristolului","vocative":"bristolule"}},{"word":"brită","pos":"noun","definitions":["pocketknife"],"forms":{"plural":"briți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brită","accusative-definite-nominative-singular":"brita","accusative-indefinite-nominative-plural":"brițe","accusative-definite-nominative-plural":"brițele","dative-genitive-indefinite-singular":"brițe","dative-definite-genitive-singular":"briței","dative-genitive-indefinite-plural":"brițe","dative-definite-genitive-plural":"brițelor","singular-vocative":"brită","plural-vocative":"brițelor"}},{"word":"britani","pos":"noun","definitions":["Britons"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"britani","accusative-definite-nominative-singular":"britaniul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-i","dative-genitive-indefinite-singular":"britani","dative-definite-genitive-singular":"britaniului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"britaniule","plural-vocative":"-lor"}},{"word":"britanic","pos":"adj","definitions":["British"],"pronunciation":"/briˈta.nik/","forms":{"feminine-singular":"britanică","masculine-plural":"britanici","feminine-neuter-plural":"britanice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"britanic","error-unrecognized-form-feminine-indefinite-singular":"britanică","error-unrecognized-form-indefinite-masculine-plural":"britanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"britanice","definite-error-unrecognized-form-masculine-neuter-singular":"britanicul","definite-error-unrecognized-form-feminine-singular":"britanica","definite-error-unrecognized-form-masculine-plural":"britanicii","definite-error-unrecognized-form-feminine-neuter-plural":"britanicele"}},{"word":"britanică","pos":"noun","definitions":["female equivalent of britanic"],"forms":{"plural":"britanice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"britanică","accusative-definite-nominative-singular":"britanica","accusative-indefinite-nominative-plural":"britanice","accusative-definite-nominative-plural":"britanicele","dative-genitive-indefinite-singular":"britanice","dative-definite-genitive-singular":"britanicei","dative-genitive-indefinite-plural":"britanice","dative-definite-genitive-plural":"britanicelor","singular-vocative":"britanică","plural-vocative":"britanicelor"}},{"word":"britanice","pos":"noun","definitions":["inflection of britanică:","indefinite nominative/accusative plural","indefinite genitive/dative singular","indefinite genitive/dative plural"]},{"word":"britanici","pos":"adj","definitions":["masculine plural of britanic"],"pronunciation":"/briˈta.nit͡ʃʲ/","gender":"m-p"},{"word":"Brițcani","pos":"name","definitions":["a village in Dulcești, Neamț County, Romania"],"gender":"m"},{"word":"brituță","pos":"noun","definitions":["diminutive of brită"],"forms":{"plural":"brituțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brituță","accusative-definite-nominative-singular":"brituța","accusative-indefinite-nominative-plural":"brituțe","accusative-definite-nominative-plural":"brituțele","dative-genitive-indefinite-singular":"brituțe","dative-definite-genitive-singular":"brituței","dative-genitive-indefinite-plural":"brituțe","dative-definite-genitive-plural":"brituțelor","singular-vocative":"brituță","plural-vocative":"brituțelor"}},{"word":"briză","pos":"noun","definitions":["breeze (light, gentle wind)"],"forms":{"plural":"brize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"briză","accusative-definite-nominative-singular":"briza","accusative-indefinite-nominative-plural":"brize","accusative-definite-nominative-plural":"brizele","dative-genitive-indefinite-singular":"brize","dative-definite-genitive-singular":"brizei","dative-genitive-indefinite-plural":"brize","dative-definite-genitive-plural":"brizelor","singular-vocative":"briză","plural-vocative":"brizelor"}},{"word":"brizant","pos":"noun","definitions":["breaker"],"forms":{"plural":"brizanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brizant","accusative-definite-nominative-singular":"brizantul","accusative-indefinite-nominative-plural":"brizanți","accusative-definite-nominative-plural":"brizanții","dative-genitive-indefinite-singular":"brizant","dative-definite-genitive-singular":"brizantului","dative-genitive-indefinite-plural":"brizanți","dative-definite-genitive-plural":"brizanților","singular-vocative":"brizantule","plural-vocative":"brizanților"}},{"word":"brizanță","pos":"noun","definitions":["brisance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"brizanță","accusative-definite-nominative":"brizanța","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"brizanță"}},{"word":"brizbiz","pos":"noun","definitions":["brise-bise"],"forms":{"plural":"brizbize","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brizbiz","accusative-definite-nominative-singular":"brizbizul","accusative-indefinite-nominative-plural":"brizbize","accusative-definite-nominative-plural":"brizbizele","dative-genitive-indefinite-singular":"brizbiz","dative-definite-genitive-singular":"brizbizului","dative-genitive-indefinite-plural":"brizbize","dative-definite-genitive-plural":"brizbizelor","singular-vocative":"brizbizule","plural-vocative":"brizbizelor"}},{"word":"brizbriz","pos":"noun","definitions":["obsolete form of brizbiz"],"forms":{"plural":"brizbrizuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brizbriz","accusative-definite-nominative-singular":"brizbrizul","accusative-indefinite-nominative-plural":"brizbrizuri","accusative-definite-nominative-plural":"brizbrizurile","dative-genitive-indefinite-singular":"brizbriz","dative-definite-genitive-singular":"brizbrizului","dative-genitive-indefinite-plural":"brizbrizuri","dative-definite-genitive-plural":"brizbrizurilor","singular-vocative":"brizbrizule","plural-vocative":"brizbrizurilor"}},{"word":"brizură","pos":"noun","definitions":["chip (small broken piece of material)"],"forms":{"plural":"brizuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brizură","accusative-definite-nominative-singular":"brizura","accusative-indefinite-nominative-plural":"brizuri","accusative-definite-nominative-plural":"brizurile","dative-genitive-indefinite-singular":"brizuri","dative-definite-genitive-singular":"brizurii","dative-genitive-indefinite-plural":"brizuri","dative-definite-genitive-plural":"brizurilor","singular-vocative":"brizură","plural-vocative":"brizurilor"}},{"word":"Broasca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Broasca"}},{"word":"Broască","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Broască"}},{"word":"broască","pos":"noun","definitions":["frog","lock (for a door)","prickly pear"],"forms":{"plural":"broaște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broască","accusative-definite-nominative-singular":"broasca","accusative-indefinite-nominative-plural":"broaște","accusative-definite-nominative-plural":"broaștele","dative-genitive-indefinite-singular":"broaște","dative-definite-genitive-singular":"broaștei","dative-genitive-indefinite-plural":"broaște","dative-definite-genitive-plural":"broaștelor","singular-vocative":"broască","plural-vocative":"broaștelor"}},{"word":"broască râioasă","pos":"noun","definitions":["toad"],"forms":{"plural":"broaște râioase"}},{"word":"broască-țestoasă","pos":"noun","definitions":["tortoise, turtle"],"forms":{"plural":"broaște-țestoase"}},{"word":"broatec","pos":"noun","definitions":["alternative form of brotac"],"forms":{"plural":"broateci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broatec","accusative-definite-nominative-singular":"broatecul","accusative-indefinite-nominative-plural":"broateci","accusative-definite-nominative-plural":"broatecii","dative-genitive-indefinite-singular":"broatec","dative-definite-genitive-singular":"broatecului","dative-genitive-indefinite-plural":"broateci","dative-definite-genitive-plural":"broatecilor","singular-vocative":"broatecule","plural-vocative":"broatecilor"}},{"word":"broboadă","pos":"noun","definitions":["kerchief"],"forms":{"plural":"broboade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broboadă","accusative-definite-nominative-singular":"broboada","accusative-indefinite-nominative-plural":"broboade","accusative-definite-nominative-plural":"broboadele","dative-genitive-indefinite-singular":"broboade","dative-definite-genitive-singular":"broboadei","dative-genitive-indefinite-plural":"broboade","dative-definite-genitive-plural":"broboadelor","singular-vocative":"broboadă","plural-vocative":"broboadelor"}},{"word":"Broboană","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Broboană"}},{"word":"broboană","pos":"noun","definitions":["a sweatdrop"],"forms":{"plural":"broboane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broboană","accusative-definite-nominative-singular":"broboana","accusative-indefinite-nominative-plural":"broboane","accusative-definite-nominative-plural":"broboanele","dative-genitive-indefinite-singular":"broboane","dative-definite-genitive-singular":"broboanei","dative-genitive-indefinite-plural":"broboane","dative-definite-genitive-plural":"broboanelor","singular-vocative":"broboană","plural-vocative":"broboanelor"}},{"word":"brobodealnic","pos":"noun","definitions":["kerchief"],"forms":{"plural":"brobodealnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brobodealnic","accusative-definite-nominative-singular":"brobodealnicul","accusative-indefinite-nominative-plural":"brobodealnice","accusative-definite-nominative-plural":"brobodealnicele","dative-genitive-indefinite-singular":"brobodealnic","dative-definite-genitive-singular":"brobodealnicului","dative-genitive-indefinite-plural":"brobodealnice","dative-definite-genitive-plural":"brobodealnicelor","singular-vocative":"brobodealnicule","plural-vocative":"brobodealnicelor"}},{"word":"brobodică","pos":"noun","definitions":["diminutive of broboadă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"brobodică","accusative-definite-nominative":"brobodica","dative-genitive-indefinite":"brobodice","dative-definite-genitive":"brobodicei","vocative":"brobodică"}},{"word":"brobona","pos":"verb","definitions":["alternative form of broboni"],"forms":{"canonical":"a brobona 1st conjugation","present-singular-third-person":"brobonează","participle-past":"brobonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a brobona","gerund":"brobonând","first-person-indicative-present-singular":"brobonez","indicative-present-second-person-singular":"brobonezi","indicative-present-singular-third-person":"brobonează","first-person-indicative-plural-present":"brobonăm","indicative-plural-present-second-person":"brobonați","indicative-plural-present-third-person":"brobonează","first-person-imperfect-indicative-singular":"brobonam","imperfect-indicative-second-person-singular":"brobonai","imperfect-indicative-singular-third-person":"brobona","first-person-imperfect-indicative-plural":"brobonam","imperfect-indicative-plural-second-person":"brobonați","imperfect-indicative-plural-third-person":"brobonau","first-person-indicative-perfect-singular":"brobonai","indicative-perfect-second-person-singular":"brobonași","indicative-perfect-singular-third-person":"brobonă","first-person-indicative-perfect-plural":"brobonarăm","indicative-perfect-plural-second-person":"brobonarăți","indicative-perfect-plural-third-person":"brobonară","first-person-indicative-pluperfect-singular":"brobonasem","indicative-pluperfect-second-person-singular":"brobonaseși","indicative-pluperfect-singular-third-person":"brobonase","first-person-indicative-pluperfect-plural":"brobonaserăm","indicative-pluperfect-plural-second-person":"brobonaserăți","indicative-pluperfect-plural-third-person":"brobonaseră","first-person-present-singular-subjunctive":"să brobonez","present-second-person-singular-subjunctive":"să brobonezi","present-singular-subjunctive-third-person":"să broboneze","first-person-plural-present-subjunctive":"să brobonăm","plural-present-second-person-subjunctive":"să brobonați","plural-present-subjunctive-third-person":"să broboneze","imperative-second-person-singular":"brobonează","imperative-plural-second-person":"brobonați","imperative-negative-second-person-singular":"nu brobona","imperative-negative-plural-second-person":"nu brobonați"}},{"word":"brobonea","pos":"noun","definitions":["diminutive of broboană"],"forms":{"plural":"brobonele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"brobonea","accusative-definite-nominative-singular":"broboneaua","accusative-indefinite-nominative-plural":"brobonele","accusative-definite-nominative-plural":"brobonelele","dative-genitive-indefinite-singular":"brobonele","dative-definite-genitive-singular":"brobonelei","dative-genitive-indefinite-plural":"brobonele","dative-definite-genitive-plural":"brobonelelor","singular-vocative":"brobonea","plural-vocative":"brobonelelor"}},{"word":"broboni","pos":"verb","definitions":["to cover one's face with sweatdrops"],"forms":{"canonical":"a broboni 4th conjugation","present-singular-third-person":"brobonește","participle-past":"brobonit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a broboni","gerund":"brobonind","first-person-indicative-present-singular":"brobonesc","indicative-present-second-person-singular":"brobonești","indicative-present-singular-third-person":"brobonește","first-person-indicative-plural-present":"brobonim","indicative-plural-present-second-person":"broboniți","indicative-plural-present-third-person":"brobonesc","first-person-imperfect-indicative-singular":"broboneam","imperfect-indicative-second-person-singular":"broboneai","imperfect-indicative-singular-third-person":"brobonea","first-person-imperfect-indicative-plural":"broboneam","imperfect-indicative-plural-second-person":"broboneați","imperfect-indicative-plural-third-person":"broboneau","first-person-indicative-perfect-singular":"brobonii","indicative-perfect-second-person-singular":"broboniși","indicative-perfect-singular-third-person":"broboni","first-person-indicative-perfect-plural":"brobonirăm","indicative-perfect-plural-second-person":"brobonirăți","indicative-perfect-plural-third-person":"broboniră","first-person-indicative-pluperfect-singular":"brobonisem","indicative-pluperfect-second-person-singular":"broboniseși","indicative-pluperfect-singular-third-person":"brobonise","first-person-indicative-pluperfect-plural":"broboniserăm","indicative-pluperfect-plural-second-person":"broboniserăți","indicative-pluperfect-plural-third-person":"broboniseră","first-person-present-singular-subjunctive":"să brobonesc","present-second-person-singular-subjunctive":"să brobonești","present-singular-subjunctive-third-person":"să brobonească","first-person-plural-present-subjunctive":"să brobonim","plural-present-second-person-subjunctive":"să broboniți","plural-present-subjunctive-third-person":"să brobonească","imperative-second-person-singular":"brobonește","imperative-plural-second-person":"broboniți","imperative-negative-second-person-singular":"nu broboni","imperative-negative-plural-second-person":"nu broboniți"}},{"word":"brobonică","pos":"noun","definitions":["diminutive of broboană"],"forms":{"plural":"brobonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brobonică","accusative-definite-nominative-singular":"brobonica","accusative-indefinite-nominative-plural":"brobonici","accusative-definite-nominative-plural":"brobonicile","dative-genitive-indefinite-singular":"brobonici","dative-definite-genitive-singular":"brobonicii","dative-genitive-indefinite-plural":"brobonici","dative-definite-genitive-plural":"brobonicilor","singular-vocative":"brobonică","plural-vocative":"brobonicilor"}},{"word":"broborigme","pos":"noun","definitions":["borborygmus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"broborigme","accusative-definite-nominative":"broborigmele","dative-genitive-indefinite":"broborigme","dative-definite-genitive":"broborigmelor","vocative":"-"}},{"word":"brocard","pos":"noun","definitions":["obsolete form of brocart"],"forms":{"plural":"brocarduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brocard","accusative-definite-nominative-singular":"brocardul","accusative-indefinite-nominative-plural":"brocarduri","accusative-definite-nominative-plural":"brocardurile","dative-genitive-indefinite-singular":"brocard","dative-definite-genitive-singular":"brocardului","dative-genitive-indefinite-plural":"brocarduri","dative-definite-genitive-plural":"brocardurilor","singular-vocative":"brocardule","plural-vocative":"brocardurilor"}},{"word":"brocart","pos":"noun","definitions":["brocade"],"forms":{"plural":"brocarturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brocart","accusative-definite-nominative-singular":"brocartul","accusative-indefinite-nominative-plural":"brocarturi","accusative-definite-nominative-plural":"brocarturile","dative-genitive-indefinite-singular":"brocart","dative-definite-genitive-singular":"brocartului","dative-genitive-indefinite-plural":"brocarturi","dative-definite-genitive-plural":"brocarturilor","singular-vocative":"brocartule","plural-vocative":"brocarturilor"}},{"word":"brocat","pos":"noun","definitions":["alternative form of brocart"],"forms":{"plural":"brocaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brocat","accusative-definite-nominative-singular":"brocatul","accusative-indefinite-nominative-plural":"brocaturi","accusative-definite-nominative-plural":"brocaturile","dative-genitive-indefinite-singular":"brocat","dative-definite-genitive-singular":"brocatului","dative-genitive-indefinite-plural":"brocaturi","dative-definite-genitive-plural":"brocaturilor","singular-vocative":"brocatule","plural-vocative":"brocaturilor"}},{"word":"broccoli","pos":"noun","definitions":["broccoli"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"broccoli","accusative-definite-nominative":"broccoliul","dative-genitive-indefinite":"broccoli","dative-definite-genitive":"broccoliului","vocative":"broccoliule"}},{"word":"brod","pos":"noun","definitions":["ford (location where a stream is shallow)"],"forms":{"plural":"broduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"brod","accusative-definite-nominative-singular":"brodul","accusative-indefinite-nominative-plural":"broduri","accusative-definite-nominative-plural":"brodurile","dative-genitive-indefinite-singular":"brod","dative-definite-genitive-singular":"brodului","dative-genitive-indefinite-plural":"broduri","dative-definite-genitive-plural":"brodurilor","singular-vocative":"brodule","plural-vocative":"brodurilor"}},{"word":"broda","pos":"verb","definitions":["to spin a yarn, concoct a story, make up, embellish","to embroider"],"forms":{"canonical":"a broda 1st conjugation","present-singular-third-person":"brodează","participle-past":"brodat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a broda","gerund":"brodând","first-person-indicative-present-singular":"brodez","indicative-present-second-person-singular":"brodezi","indicative-present-singular-third-person":"brodează","first-person-indicative-plural-present":"brodăm","indicative-plural-present-second-person":"brodați","indicative-plural-present-third-person":"brodează","first-person-imperfect-indicative-singular":"brodam","imperfect-indicative-second-person-singular":"brodai","imperfect-indicative-singular-third-person":"broda","first-person-imperfect-indicative-plural":"brodam","imperfect-indicative-plural-second-person":"brodați","imperfect-indicative-plural-third-person":"brodau","first-person-indicative-perfect-singular":"brodai","indicative-perfect-second-person-singular":"brodași","indicative-perfect-singular-third-person":"brodă","first-person-indicative-perfect-plural":"brodarăm","indicative-perfect-plural-second-person":"brodarăți","indicative-perfect-plural-third-person":"brodară","first-person-indicative-pluperfect-singular":"brodasem","indicative-pluperfect-second-person-singular":"brodaseși","indicative-pluperfect-singular-third-person":"brodase","first-person-indicative-pluperfect-plural":"brodaserăm","indicative-pluperfect-plural-second-person":"brodaserăți","indicative-pluperfect-plural-third-person":"brodaseră","first-person-present-singular-subjunctive":"să brodez","present-second-person-singular-subjunctive":"să brodezi","present-singular-subjunctive-third-person":"să brodeze","first-person-plural-present-subjunctive":"să brodăm","plural-present-second-person-subjunctive":"să brodați","plural-present-subjunctive-third-person":"să brodeze","imperative-second-person-singular":"brodează","imperative-plural-second-person":"brodați","imperative-negative-second-person-singular":"nu broda","imperative-negative-plural-second-person":"nu brodați"}},{"word":"brodai","pos":"verb","definitions":["inflection of broda:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[broˈdaj]"},{"word":"brodare","pos":"noun","definitions":["embroidery"],"forms":{"plural":"brodări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brodare","accusative-definite-nominative-singular":"brodarea","accusative-indefinite-nominative-plural":"brodări","accusative-definite-nominative-plural":"brodările","dative-genitive-indefinite-singular":"brodări","dative-definite-genitive-singular":"brodării","dative-genitive-indefinite-plural":"brodări","dative-definite-genitive-plural":"brodărilor","singular-vocative":"brodare","plural-vocative":"brodărilor"}},{"word":"brodărel","pos":"noun","definitions":["diminutive of brudar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"brodărel","accusative-definite-nominative":"brodărelul","dative-genitive-indefinite":"brodărel","dative-definite-genitive":"brodărelului","vocative":"brodărelule"}},{"word":"brodat","pos":"adj","definitions":["decorated with embroidery"],"pronunciation":"[broˈdat]","forms":{"feminine-singular":"brodată","masculine-plural":"brodați","feminine-neuter-plural":"brodate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brodat","error-unrecognized-form-feminine-indefinite-singular":"brodată","error-unrecognized-form-indefinite-masculine-plural":"brodați","error-unrecognized-form-feminine-indefinite-neuter-plural":"brodate","definite-error-unrecognized-form-masculine-neuter-singular":"brodatul","definite-error-unrecognized-form-feminine-singular":"brodata","definite-error-unrecognized-form-masculine-plural":"brodații","definite-error-unrecognized-form-feminine-neuter-plural":"brodatele"}},{"word":"brodat","pos":"verb","definitions":["past participle of broda"],"pronunciation":"[broˈdat]"},{"word":"Brodeală","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brodeală"}},{"word":"brodeală","pos":"noun","definitions":["embroidery"],"forms":{"plural":"brodeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"brodeală","accusative-definite-nominative-singular":"brodeala","accusative-indefinite-nominative-plural":"brodeli","accusative-definite-nominative-plural":"brodelile","dative-genitive-indefinite-singular":"brodeli","dative-definite-genitive-singular":"brodelii","dative-genitive-indefinite-plural":"brodeli","dative-definite-genitive-plural":"brodelilor","singular-vocative":"brodeală","plural-vocative":"brodelilor"}},{"word":"broderie","pos":"noun","definitions":["embroidery"],"forms":{"plural":"broderii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"broderie","accusative-definite-nominative-singular":"broderia","accusative-indefinite-nominative-plural":"broderii","accusative-definite-nominative-plural":"broderiile","dative-genitive-indefinite-singular":"broderii","dative-definite-genitive-singular":"broderiei","dative-genitive-indefinite-plural":"broderii","dative-definite-genitive-plural":"broderiilor","singular-vocative":"broderie","plural-vocative":"broderiilor"}},{"word":"brodez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of broda"],"pronunciation":"[broˈdez]"},{"word":"brodeză","pos":"noun","definitions":["embroideress"],"forms":{"plural":"brodeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brodeză","accusative-definite-nominative-singular":"brodeza","accusative-indefinite-nominative-plural":"brodeze","accusative-definite-nominative-plural":"brodezele","dative-genitive-indefinite-singular":"brodeze","dative-definite-genitive-singular":"brodezei","dative-genitive-indefinite-plural":"brodeze","dative-definite-genitive-plural":"brodezelor","singular-vocative":"brodeză","plural-vocative":"brodezelor"}},{"word":"Brodina","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Brodina, Suceava County, Romania","a village in Izvoarele Sucevei, Suceava County, Romania"],"gender":"f"},{"word":"Brodina de Jos","pos":"name","definitions":["a village in Brodina, Suceava County, Romania"],"gender":"f"},{"word":"Brodinișoara","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Brodina"],"gender":"f"},{"word":"broker","pos":"noun","definitions":["broker"],"forms":{"plural":"brokeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broker","accusative-definite-nominative-singular":"brokerul","accusative-indefinite-nominative-plural":"brokeri","accusative-definite-nominative-plural":"brokerii","dative-genitive-indefinite-singular":"broker","dative-definite-genitive-singular":"brokerului","dative-genitive-indefinite-plural":"brokeri","dative-definite-genitive-plural":"brokerilor","singular-vocative":"brokerule","plural-vocative":"brokerilor"}},{"word":"brokeraj","pos":"noun","definitions":["brokerage"],"forms":{"plural":"brokeraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brokeraj","accusative-definite-nominative-singular":"brokerajul","accusative-indefinite-nominative-plural":"brokeraje","accusative-definite-nominative-plural":"brokerajele","dative-genitive-indefinite-singular":"brokeraj","dative-definite-genitive-singular":"brokerajului","dative-genitive-indefinite-plural":"brokeraje","dative-definite-genitive-plural":"brokerajelor","singular-vocative":"brokerajule","plural-vocative":"brokerajelor"}},{"word":"brom","pos":"noun","definitions":["bromine"],"pronunciation":"/brom/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"brom","accusative-definite-nominative":"bromul","dative-genitive-indefinite":"brom","dative-definite-genitive":"bromului","vocative":"bromule"}},{"word":"bromat","pos":"noun","definitions":["bromate"],"forms":{"plural":"bromați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bromat","accusative-definite-nominative-singular":"bromatul","accusative-indefinite-nominative-plural":"bromați","accusative-definite-nominative-plural":"bromații","dative-genitive-indefinite-singular":"bromat","dative-definite-genitive-singular":"bromatului","dative-genitive-indefinite-plural":"bromați","dative-definite-genitive-plural":"bromaților","singular-vocative":"bromatule","plural-vocative":"bromaților"}},{"word":"bromhidric","pos":"adj","definitions":["hydrobromic"],"forms":{"feminine-singular":"bromhidrică","masculine-plural":"bromhidrici","feminine-neuter-plural":"bromhidrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bromhidric","error-unrecognized-form-feminine-indefinite-singular":"bromhidrică","error-unrecognized-form-indefinite-masculine-plural":"bromhidrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bromhidrice","definite-error-unrecognized-form-masculine-neuter-singular":"bromhidricul","definite-error-unrecognized-form-feminine-singular":"bromhidrica","definite-error-unrecognized-form-masculine-plural":"bromhidricii","definite-error-unrecognized-form-feminine-neuter-plural":"bromhidricele"}},{"word":"bromhidroză","pos":"noun","definitions":["bromidrosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bromhidroză","accusative-definite-nominative":"bromhidroza","dative-genitive-indefinite":"bromhidroze","dative-definite-genitive":"bromhidrozei","vocative":"bromhidroză"}},{"word":"bromic","pos":"adj","definitions":["bromic"],"forms":{"feminine-singular":"bromică","masculine-plural":"bromici","feminine-neuter-plural":"bromice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bromic","error-unrecognized-form-feminine-indefinite-singular":"bromică","error-unrecognized-form-indefinite-masculine-plural":"bromici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bromice","definite-error-unrecognized-form-masculine-neuter-singular":"bromicul","definite-error-unrecognized-form-feminine-singular":"bromica","definite-error-unrecognized-form-masculine-plural":"bromicii","definite-error-unrecognized-form-feminine-neuter-plural":"bromicele"}},{"word":"bromism","pos":"noun","definitions":["bromism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bromism","accusative-definite-nominative":"bromismul","dative-genitive-indefinite":"bromism","dative-definite-genitive":"bromismului","vocative":"bromismule"}},{"word":"bromoform","pos":"noun","definitions":["bromoform"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bromoform","accusative-definite-nominative":"bromoformul","dative-genitive-indefinite":"bromoform","dative-definite-genitive":"bromoformului","vocative":"bromoformule"}},{"word":"bromură","pos":"noun","definitions":["bromide"],"forms":{"plural":"bromuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bromură","accusative-definite-nominative-singular":"bromura","accusative-indefinite-nominative-plural":"bromuri","accusative-definite-nominative-plural":"bromurile","dative-genitive-indefinite-singular":"bromuri","dative-definite-genitive-singular":"bromurii","dative-genitive-indefinite-plural":"bromuri","dative-definite-genitive-plural":"bromurilor","singular-vocative":"bromură","plural-vocative":"bromurilor"}},{"word":"bromurare","pos":"noun","definitions":["bromination"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"bromurare","accusative-definite-nominative":"bromurarea","dative-genitive-indefinite":"bromurare","dative-definite-genitive":"bromurarei","vocative":"bromurare"}},{"word":"bronhial","pos":"adj","definitions":["bronchial"],"forms":{"feminine-singular":"bronhială","masculine-plural":"bronhiali","feminine-neuter-plural":"bronhiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bronhial","error-unrecognized-form-feminine-indefinite-singular":"bronhială","error-unrecognized-form-indefinite-masculine-plural":"bronhiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bronhiale","definite-error-unrecognized-form-masculine-neuter-singular":"bronhialul","definite-error-unrecognized-form-feminine-singular":"bronhiala","definite-error-unrecognized-form-masculine-plural":"bronhialii","definite-error-unrecognized-form-feminine-neuter-plural":"bronhialele"}},{"word":"bronhic","pos":"adj","definitions":["bronchial"],"forms":{"feminine-singular":"bronhică","masculine-plural":"bronhici","feminine-neuter-plural":"bronhice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bronhic","error-unrecognized-form-feminine-indefinite-singular":"bronhică","error-unrecognized-form-indefinite-masculine-plural":"bronhici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bronhice","definite-error-unrecognized-form-masculine-neuter-singular":"bronhicul","definite-error-unrecognized-form-feminine-singular":"bronhica","definite-error-unrecognized-form-masculine-plural":"bronhicii","definite-error-unrecognized-form-feminine-neuter-plural":"bronhicele"}},{"word":"bronhie","pos":"noun","definitions":["bronchus"],"forms":{"plural":"bronhii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhie","accusative-definite-nominative-singular":"bronhia","accusative-indefinite-nominative-plural":"bronhii","accusative-definite-nominative-plural":"bronhiile","dative-genitive-indefinite-singular":"bronhii","dative-definite-genitive-singular":"bronhiei","dative-genitive-indefinite-plural":"bronhii","dative-definite-genitive-plural":"bronhiilor","singular-vocative":"bronhie","plural-vocative":"bronhiilor"}},{"word":"bronhiolă","pos":"noun","definitions":["bronchiole"],"forms":{"plural":"bronhiole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bronhiolă","accusative-definite-nominative-singular":"bronhiola","accusative-indefinite-nominative-plural":"bronhiole","accusative-definite-nominative-plural":"bronhiolele","dative-genitive-indefinite-singular":"bronhiole","dative-definite-genitive-singular":"bronhiolei","dative-genitive-indefinite-plural":"bronhiole","dative-definite-genitive-plural":"bronhiolelor","singular-vocative":"bronhiolă","plural-vocative":"bronhiolelor"}},{"word":"bronhodilatație","pos":"noun","definitions":["bronchodilation"],"forms":{"plural":"bronhodilatații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhodilatație","accusative-definite-nominative-singular":"bronhodilatația","accusative-indefinite-nominative-plural":"bronhodilatații","accusative-definite-nominative-plural":"bronhodilatațiile","dative-genitive-indefinite-singular":"bronhodilatații","dative-definite-genitive-singular":"bronhodilatației","dative-genitive-indefinite-plural":"bronhodilatații","dative-definite-genitive-plural":"bronhodilatațiilor","singular-vocative":"bronhodilatație","plural-vocative":"bronhodilatațiilor"}},{"word":"bronhofonie","pos":"noun","definitions":["bronchophony"],"forms":{"plural":"bronhofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhofonie","accusative-definite-nominative-singular":"bronhofonia","accusative-indefinite-nominative-plural":"bronhofonii","accusative-definite-nominative-plural":"bronhofoniile","dative-genitive-indefinite-singular":"bronhofonii","dative-definite-genitive-singular":"bronhofoniei","dative-genitive-indefinite-plural":"bronhofonii","dative-definite-genitive-plural":"bronhofoniilor","singular-vocative":"bronhofonie","plural-vocative":"bronhofoniilor"}},{"word":"bronhografie","pos":"noun","definitions":["bronchography"],"forms":{"plural":"bronhografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhografie","accusative-definite-nominative-singular":"bronhografia","accusative-indefinite-nominative-plural":"bronhografii","accusative-definite-nominative-plural":"bronhografiile","dative-genitive-indefinite-singular":"bronhografii","dative-definite-genitive-singular":"bronhografiei","dative-genitive-indefinite-plural":"bronhografii","dative-definite-genitive-plural":"bronhografiilor","singular-vocative":"bronhografie","plural-vocative":"bronhografiilor"}},{"word":"bronhopneumonie","pos":"noun","definitions":["bronchopneumonia"],"forms":{"plural":"bronhopneumonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhopneumonie","accusative-definite-nominative-singular":"bronhopneumonia","accusative-indefinite-nominative-plural":"bronhopneumonii","accusative-definite-nominative-plural":"bronhopneumoniile","dative-genitive-indefinite-singular":"bronhopneumonii","dative-definite-genitive-singular":"bronhopneumoniei","dative-genitive-indefinite-plural":"bronhopneumonii","dative-definite-genitive-plural":"bronhopneumoniilor","singular-vocative":"bronhopneumonie","plural-vocative":"bronhopneumoniilor"}},{"word":"bronhoree","pos":"noun","definitions":["bronchorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bronhoree","accusative-definite-nominative":"bronhoreea","dative-genitive-indefinite":"bronhorei","dative-definite-genitive":"bronhoreii","vocative":"bronhoree"}},{"word":"bronhoscop","pos":"noun","definitions":["bronchoscope"],"forms":{"plural":"bronhoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bronhoscop","accusative-definite-nominative-singular":"bronhoscopul","accusative-indefinite-nominative-plural":"bronhoscoape","accusative-definite-nominative-plural":"bronhoscoapele","dative-genitive-indefinite-singular":"bronhoscop","dative-definite-genitive-singular":"bronhoscopului","dative-genitive-indefinite-plural":"bronhoscoape","dative-definite-genitive-plural":"bronhoscoapelor","singular-vocative":"bronhoscopule","plural-vocative":"bronhoscoapelor"}},{"word":"bronhoscopie","pos":"noun","definitions":["bronchoscopy"],"forms":{"plural":"bronhoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhoscopie","accusative-definite-nominative-singular":"bronhoscopia","accusative-indefinite-nominative-plural":"bronhoscopii","accusative-definite-nominative-plural":"bronhoscopiile","dative-genitive-indefinite-singular":"bronhoscopii","dative-definite-genitive-singular":"bronhoscopiei","dative-genitive-indefinite-plural":"bronhoscopii","dative-definite-genitive-plural":"bronhoscopiilor","singular-vocative":"bronhoscopie","plural-vocative":"bronhoscopiilor"}},{"word":"bronhospasm","pos":"noun","definitions":["bronchospasm"],"forms":{"plural":"bronhospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bronhospasm","accusative-definite-nominative-singular":"bronhospasmul","accusative-indefinite-nominative-plural":"bronhospasme","accusative-definite-nominative-plural":"bronhospasmele","dative-genitive-indefinite-singular":"bronhospasm","dative-definite-genitive-singular":"bronhospasmului","dative-genitive-indefinite-plural":"bronhospasme","dative-definite-genitive-plural":"bronhospasmelor","singular-vocative":"bronhospasmule","plural-vocative":"bronhospasmelor"}},{"word":"bronhotomie","pos":"noun","definitions":["bronchotomy"],"forms":{"plural":"bronhotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronhotomie","accusative-definite-nominative-singular":"bronhotomia","accusative-indefinite-nominative-plural":"bronhotomii","accusative-definite-nominative-plural":"bronhotomiile","dative-genitive-indefinite-singular":"bronhotomii","dative-definite-genitive-singular":"bronhotomiei","dative-genitive-indefinite-plural":"bronhotomii","dative-definite-genitive-plural":"bronhotomiilor","singular-vocative":"bronhotomie","plural-vocative":"bronhotomiilor"}},{"word":"bronșectazie","pos":"noun","definitions":["bronchiectasis"],"forms":{"plural":"bronșectazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bronșectazie","accusative-definite-nominative-singular":"bronșectazia","accusative-indefinite-nominative-plural":"bronșectazii","accusative-definite-nominative-plural":"bronșectaziile","dative-genitive-indefinite-singular":"bronșectazii","dative-definite-genitive-singular":"bronșectaziei","dative-genitive-indefinite-plural":"bronșectazii","dative-definite-genitive-plural":"bronșectaziilor","singular-vocative":"bronșectazie","plural-vocative":"bronșectaziilor"}},{"word":"bronșită","pos":"noun","definitions":["bronchitis"],"forms":{"plural":"bronșite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bronșită","accusative-definite-nominative-singular":"bronșita","accusative-indefinite-nominative-plural":"bronșite","accusative-definite-nominative-plural":"bronșitele","dative-genitive-indefinite-singular":"bronșite","dative-definite-genitive-singular":"bronșitei","dative-genitive-indefinite-plural":"bronșite","dative-definite-genitive-plural":"bronșitelor","singular-vocative":"bronșită","plural-vocative":"bronșitelor"}},{"word":"bronșitic","pos":"adj","definitions":["bronchitic"],"forms":{"feminine-singular":"bronșitică","masculine-plural":"bronșitici","feminine-neuter-plural":"bronșitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bronșitic","error-unrecognized-form-feminine-indefinite-singular":"bronșitică","error-unrecognized-form-indefinite-masculine-plural":"bronșitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bronșitice","definite-error-unrecognized-form-masculine-neuter-singular":"bronșiticul","definite-error-unrecognized-form-feminine-singular":"bronșitica","definite-error-unrecognized-form-masculine-plural":"bronșiticii","definite-error-unrecognized-form-feminine-neuter-plural":"bronșiticele"}},{"word":"brontofobie","pos":"noun","definitions":["brontophobia"],"forms":{"plural":"brontofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brontofobie","accusative-definite-nominative-singular":"brontofobia","accusative-indefinite-nominative-plural":"brontofobii","accusative-definite-nominative-plural":"brontofobiile","dative-genitive-indefinite-singular":"brontofobii","dative-definite-genitive-singular":"brontofobiei","dative-genitive-indefinite-plural":"brontofobii","dative-definite-genitive-plural":"brontofobiilor","singular-vocative":"brontofobie","plural-vocative":"brontofobiilor"}}];
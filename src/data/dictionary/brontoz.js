@@ -0,0 +1 @@
+export default [{"word":"brontozaur","pos":"noun","definitions":["brontosaur"],"forms":{"plural":"brontozauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brontozaur","accusative-definite-nominative-singular":"brontozaurul","accusative-indefinite-nominative-plural":"brontozauri","accusative-definite-nominative-plural":"brontozaurii","dative-genitive-indefinite-singular":"brontozaur","dative-definite-genitive-singular":"brontozaurului","dative-genitive-indefinite-plural":"brontozauri","dative-definite-genitive-plural":"brontozaurilor","singular-vocative":"brontozaurule","plural-vocative":"brontozaurilor"}},{"word":"bronz","pos":"noun","definitions":["bronze"],"pronunciation":"/bronz/","forms":{"plural":"bronzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bronz","accusative-definite-nominative-singular":"bronzul","accusative-indefinite-nominative-plural":"bronzuri","accusative-definite-nominative-plural":"bronzurile","dative-genitive-indefinite-singular":"bronz","dative-definite-genitive-singular":"bronzului","dative-genitive-indefinite-plural":"bronzuri","dative-definite-genitive-plural":"bronzurilor","singular-vocative":"bronzule","plural-vocative":"bronzurilor"}},{"word":"bronza","pos":"verb","definitions":["to tan","to bronze (to apply a layer of bronze or bronze color)"],"forms":{"canonical":"a bronza 1st conjugation","present-singular-third-person":"bronzează","participle-past":"bronzat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bronza","gerund":"bronzând","first-person-indicative-present-singular":"bronzez","indicative-present-second-person-singular":"bronzezi","indicative-present-singular-third-person":"bronzează","first-person-indicative-plural-present":"bronzăm","indicative-plural-present-second-person":"bronzați","indicative-plural-present-third-person":"bronzează","first-person-imperfect-indicative-singular":"bronzam","imperfect-indicative-second-person-singular":"bronzai","imperfect-indicative-singular-third-person":"bronza","first-person-imperfect-indicative-plural":"bronzam","imperfect-indicative-plural-second-person":"bronzați","imperfect-indicative-plural-third-person":"bronzau","first-person-indicative-perfect-singular":"bronzai","indicative-perfect-second-person-singular":"bronzași","indicative-perfect-singular-third-person":"bronză","first-person-indicative-perfect-plural":"bronzarăm","indicative-perfect-plural-second-person":"bronzarăți","indicative-perfect-plural-third-person":"bronzară","first-person-indicative-pluperfect-singular":"bronzasem","indicative-pluperfect-second-person-singular":"bronzaseși","indicative-pluperfect-singular-third-person":"bronzase","first-person-indicative-pluperfect-plural":"bronzaserăm","indicative-pluperfect-plural-second-person":"bronzaserăți","indicative-pluperfect-plural-third-person":"bronzaseră","first-person-present-singular-subjunctive":"să bronzez","present-second-person-singular-subjunctive":"să bronzezi","present-singular-subjunctive-third-person":"să bronzeze","first-person-plural-present-subjunctive":"să bronzăm","plural-present-second-person-subjunctive":"să bronzați","plural-present-subjunctive-third-person":"să bronzeze","imperative-second-person-singular":"bronzează","imperative-plural-second-person":"bronzați","imperative-negative-second-person-singular":"nu bronza","imperative-negative-plural-second-person":"nu bronzați"}},{"word":"bronzaj","pos":"noun","definitions":["tanning"],"forms":{"plural":"bronzaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bronzaj","accusative-definite-nominative-singular":"bronzajul","accusative-indefinite-nominative-plural":"bronzaje","accusative-definite-nominative-plural":"bronzajele","dative-genitive-indefinite-singular":"bronzaj","dative-definite-genitive-singular":"bronzajului","dative-genitive-indefinite-plural":"bronzaje","dative-definite-genitive-plural":"bronzajelor","singular-vocative":"bronzajule","plural-vocative":"bronzajelor"}},{"word":"bronzare","pos":"noun","definitions":["tanning (one's skin)"],"forms":{"plural":"bronzări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bronzare","accusative-definite-nominative-singular":"bronzarea","accusative-indefinite-nominative-plural":"bronzări","accusative-definite-nominative-plural":"bronzările","dative-genitive-indefinite-singular":"bronzări","dative-definite-genitive-singular":"bronzării","dative-genitive-indefinite-plural":"bronzări","dative-definite-genitive-plural":"bronzărilor","singular-vocative":"bronzare","plural-vocative":"bronzărilor"}},{"word":"bronzat","pos":"adj","definitions":["brown (about things)","tanned (about humans)"],"forms":{"feminine-singular":"bronzată","masculine-plural":"bronzați","feminine-neuter-plural":"bronzate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bronzat","error-unrecognized-form-feminine-indefinite-singular":"bronzată","error-unrecognized-form-indefinite-masculine-plural":"bronzați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bronzate","definite-error-unrecognized-form-masculine-neuter-singular":"bronzatul","definite-error-unrecognized-form-feminine-singular":"bronzata","definite-error-unrecognized-form-masculine-plural":"bronzații","definite-error-unrecognized-form-feminine-neuter-plural":"bronzatele"}},{"word":"bronzit","pos":"noun","definitions":["bronzite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bronzit","accusative-definite-nominative":"bronzitul","dative-genitive-indefinite":"bronzit","dative-definite-genitive":"bronzitului","vocative":"bronzitule"}},{"word":"bronzului","pos":"noun","definitions":["definite genitive/dative singular of bronz"]},{"word":"bronzuri","pos":"noun","definitions":["plural of bronz"]},{"word":"broșa","pos":"verb","definitions":["to sew"],"forms":{"canonical":"a broșa 1st conjugation","present-singular-third-person":"broșează","participle-past":"broșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a broșa","gerund":"broșând","first-person-indicative-present-singular":"broșez","indicative-present-second-person-singular":"broșezi","indicative-present-singular-third-person":"broșează","first-person-indicative-plural-present":"broșăm","indicative-plural-present-second-person":"broșați","indicative-plural-present-third-person":"broșează","first-person-imperfect-indicative-singular":"broșam","imperfect-indicative-second-person-singular":"broșai","imperfect-indicative-singular-third-person":"broșa","first-person-imperfect-indicative-plural":"broșam","imperfect-indicative-plural-second-person":"broșați","imperfect-indicative-plural-third-person":"broșau","first-person-indicative-perfect-singular":"broșai","indicative-perfect-second-person-singular":"broșași","indicative-perfect-singular-third-person":"broșă","first-person-indicative-perfect-plural":"broșarăm","indicative-perfect-plural-second-person":"broșarăți","indicative-perfect-plural-third-person":"broșară","first-person-indicative-pluperfect-singular":"broșasem","indicative-pluperfect-second-person-singular":"broșaseși","indicative-pluperfect-singular-third-person":"broșase","first-person-indicative-pluperfect-plural":"broșaserăm","indicative-pluperfect-plural-second-person":"broșaserăți","indicative-pluperfect-plural-third-person":"broșaseră","first-person-present-singular-subjunctive":"să broșez","present-second-person-singular-subjunctive":"să broșezi","present-singular-subjunctive-third-person":"să broșeze","first-person-plural-present-subjunctive":"să broșăm","plural-present-second-person-subjunctive":"să broșați","plural-present-subjunctive-third-person":"să broșeze","imperative-second-person-singular":"broșează","imperative-plural-second-person":"broșați","imperative-negative-second-person-singular":"nu broșa","imperative-negative-plural-second-person":"nu broșați"}},{"word":"broșă","pos":"noun","definitions":["brooch"],"forms":{"plural":"broșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broșă","accusative-definite-nominative-singular":"broșa","accusative-indefinite-nominative-plural":"broșe","accusative-definite-nominative-plural":"broșele","dative-genitive-indefinite-singular":"broșe","dative-definite-genitive-singular":"broșei","dative-genitive-indefinite-plural":"broșe","dative-definite-genitive-plural":"broșelor","singular-vocative":"broșă","plural-vocative":"broșelor"}},{"word":"broșare","pos":"noun","definitions":["broaching"],"forms":{"plural":"broșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"broșare","accusative-definite-nominative-singular":"broșarea","accusative-indefinite-nominative-plural":"broșări","accusative-definite-nominative-plural":"broșările","dative-genitive-indefinite-singular":"broșări","dative-definite-genitive-singular":"broșării","dative-genitive-indefinite-plural":"broșări","dative-definite-genitive-plural":"broșărilor","singular-vocative":"broșare","plural-vocative":"broșărilor"}},{"word":"broșat","pos":"noun","definitions":["softcover"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"broșat","accusative-definite-nominative":"broșatul","dative-genitive-indefinite":"broșat","dative-definite-genitive":"broșatului","vocative":"broșatule"}},{"word":"broșat","pos":"verb","definitions":["past participle of broșa"],"forms":{"participle-past":"of broșa"}},{"word":"broscănesc","pos":"adj","definitions":["froglike"],"forms":{"feminine-singular":"broscănească","plural":"broscănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"broscănesc","error-unrecognized-form-feminine-indefinite-singular":"broscănească","error-unrecognized-form-indefinite-masculine-plural":"broscănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"broscănești","definite-error-unrecognized-form-masculine-neuter-singular":"broscănescul","definite-error-unrecognized-form-feminine-singular":"broscăneasca","definite-error-unrecognized-form-masculine-plural":"broscăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"broscăneștile"}},{"word":"broscar","pos":"noun","definitions":["wop; a person of Italian descent"],"forms":{"plural":"broscari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broscar","accusative-definite-nominative-singular":"broscarul","accusative-indefinite-nominative-plural":"broscari","accusative-definite-nominative-plural":"broscarii","dative-genitive-indefinite-singular":"broscar","dative-definite-genitive-singular":"broscarului","dative-genitive-indefinite-plural":"broscari","dative-definite-genitive-plural":"broscarilor","singular-vocative":"broscarule","plural-vocative":"broscarilor"}},{"word":"broscăresc","pos":"adj","definitions":["frog-like"],"forms":{"feminine-singular":"broscărească","plural":"broscărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"broscăresc","error-unrecognized-form-feminine-indefinite-singular":"broscărească","error-unrecognized-form-indefinite-masculine-plural":"broscărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"broscărești","definite-error-unrecognized-form-masculine-neuter-singular":"broscărescul","definite-error-unrecognized-form-feminine-singular":"broscăreasca","definite-error-unrecognized-form-masculine-plural":"broscăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"broscăreștile"}},{"word":"Broscari","pos":"name","definitions":["a village in Olt County, Romania. Renamed to Fântânele in 1964."],"gender":"m"},{"word":"Broscăria","pos":"name","definitions":["a river in Iași, Romania, tributary to the Recea"],"gender":"f"},{"word":"broscărie","pos":"noun","definitions":["frog pond"],"forms":{"plural":"broscării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"broscărie","accusative-definite-nominative-singular":"broscăria","accusative-indefinite-nominative-plural":"broscării","accusative-definite-nominative-plural":"broscăriile","dative-genitive-indefinite-singular":"broscării","dative-definite-genitive-singular":"broscăriei","dative-genitive-indefinite-plural":"broscării","dative-definite-genitive-plural":"broscăriilor","singular-vocative":"broscărie","plural-vocative":"broscăriilor"}},{"word":"broscărime","pos":"noun","definitions":["frogkind"],"forms":{"plural":"broscărimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"broscărime","accusative-definite-nominative-singular":"broscărimea","accusative-indefinite-nominative-plural":"broscărimi","accusative-definite-nominative-plural":"broscărimile","dative-genitive-indefinite-singular":"broscărimi","dative-definite-genitive-singular":"broscărimii","dative-genitive-indefinite-plural":"broscărimi","dative-definite-genitive-plural":"broscărimilor","singular-vocative":"broscărime","plural-vocative":"broscărimilor"}},{"word":"broscariță","pos":"noun","definitions":["marsh arrowgrass (Triglochin palustris)"],"forms":{"plural":"broscarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broscariță","accusative-definite-nominative-singular":"broscarița","accusative-indefinite-nominative-plural":"broscarițe","accusative-definite-nominative-plural":"broscarițele","dative-genitive-indefinite-singular":"broscarițe","dative-definite-genitive-singular":"broscariței","dative-genitive-indefinite-plural":"broscarițe","dative-definite-genitive-plural":"broscarițelor","singular-vocative":"broscariță","plural-vocative":"broscarițelor"}},{"word":"Broscaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Broscaru"}},{"word":"Broscăuți","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Broscăuți, Botoșani County, Romania"],"gender":"m"},{"word":"broscoaică","pos":"noun","definitions":["augmentative of broască"],"forms":{"plural":"broscoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broscoaică","accusative-definite-nominative-singular":"broscoaica","accusative-indefinite-nominative-plural":"broscoaice","accusative-definite-nominative-plural":"broscoaicele","dative-genitive-indefinite-singular":"broscoaice","dative-definite-genitive-singular":"broscoaicei","dative-genitive-indefinite-plural":"broscoaice","dative-definite-genitive-plural":"broscoaicelor","singular-vocative":"broscoaică","plural-vocative":"broscoaicelor"}},{"word":"Broscoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Broscoi"}},{"word":"broscoi","pos":"noun","definitions":["augmentative of broască","male frog"],"forms":{"plural":"broscoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broscoi","accusative-definite-nominative-singular":"broscoiul","accusative-indefinite-nominative-plural":"broscoi","accusative-definite-nominative-plural":"broscoii","dative-genitive-indefinite-singular":"broscoi","dative-definite-genitive-singular":"broscoiului","dative-genitive-indefinite-plural":"broscoi","dative-definite-genitive-plural":"broscoilor","singular-vocative":"broscoiule","plural-vocative":"broscoilor"}},{"word":"Broscoșești","pos":"name","definitions":["a village in Lunca Banului, Vaslui County, Romania"],"gender":"m"},{"word":"brosculiță","pos":"noun","definitions":["diminutive of broască"],"forms":{"plural":"brosculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brosculiță","accusative-definite-nominative-singular":"brosculița","accusative-indefinite-nominative-plural":"brosculițe","accusative-definite-nominative-plural":"brosculițele","dative-genitive-indefinite-singular":"brosculițe","dative-definite-genitive-singular":"brosculiței","dative-genitive-indefinite-plural":"brosculițe","dative-definite-genitive-plural":"brosculițelor","singular-vocative":"brosculiță","plural-vocative":"brosculițelor"}},{"word":"broscuț","pos":"noun","definitions":["male frog offspring"],"forms":{"plural":"broscuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broscuț","accusative-definite-nominative-singular":"broscuțul","accusative-indefinite-nominative-plural":"broscuți","accusative-definite-nominative-plural":"broscuții","dative-genitive-indefinite-singular":"broscuț","dative-definite-genitive-singular":"broscuțului","dative-genitive-indefinite-plural":"broscuți","dative-definite-genitive-plural":"broscuților","singular-vocative":"broscuțule","plural-vocative":"broscuților"}},{"word":"Broscuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Broscuță"}},{"word":"broscuță","pos":"noun","definitions":["diminutive of broască; small frog"],"forms":{"plural":"broscuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broscuță","accusative-definite-nominative-singular":"broscuța","accusative-indefinite-nominative-plural":"broscuțe","accusative-definite-nominative-plural":"broscuțele","dative-genitive-indefinite-singular":"broscuțe","dative-definite-genitive-singular":"broscuței","dative-genitive-indefinite-plural":"broscuțe","dative-definite-genitive-plural":"broscuțelor","singular-vocative":"broscuță","plural-vocative":"broscuțelor"}},{"word":"broșetă","pos":"noun","definitions":["brochette"],"forms":{"plural":"broșete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broșetă","accusative-definite-nominative-singular":"broșeta","accusative-indefinite-nominative-plural":"broșete","accusative-definite-nominative-plural":"broșetele","dative-genitive-indefinite-singular":"broșete","dative-definite-genitive-singular":"broșetei","dative-genitive-indefinite-plural":"broșete","dative-definite-genitive-plural":"broșetelor","singular-vocative":"broșetă","plural-vocative":"broșetelor"}},{"word":"broștean","pos":"noun","definitions":["diminutive of broască"],"forms":{"plural":"broșteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"broștean","accusative-definite-nominative-singular":"broșteanul","accusative-indefinite-nominative-plural":"broșteni","accusative-definite-nominative-plural":"broștenii","dative-genitive-indefinite-singular":"broștean","dative-definite-genitive-singular":"broșteanului","dative-genitive-indefinite-plural":"broșteni","dative-definite-genitive-plural":"broștenilor","singular-vocative":"broșteanule","plural-vocative":"broștenilor"}},{"word":"Broșteanca","pos":"name","definitions":["a village in Bogdana, Teleorman County, Romania"],"gender":"f"},{"word":"Broșteni","pos":"name","definitions":["a village in Costești, Argeș County, Romania","a village in Aninoasa, Argeș County, Romania","a village in Durnești, Botoșani County, Romania","a village in Oravița, Caraș-Severin County, Romania","a village in Bezdead, Dâmbovița County, Romania"],"gender":"m"},{"word":"Broștenii de Sus","pos":"name","definitions":["a village in Plopșoru, Gorj County, Romania"],"gender":"m"},{"word":"broștesc","pos":"adj","definitions":["froglike"],"forms":{"feminine-singular":"broștească","plural":"broștești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"broștesc","error-unrecognized-form-feminine-indefinite-singular":"broștească","error-unrecognized-form-indefinite-masculine-plural":"broștești","error-unrecognized-form-feminine-indefinite-neuter-plural":"broștești","definite-error-unrecognized-form-masculine-neuter-singular":"broștescul","definite-error-unrecognized-form-feminine-singular":"broșteasca","definite-error-unrecognized-form-masculine-plural":"broșteștii","definite-error-unrecognized-form-feminine-neuter-plural":"broșteștile"}},{"word":"broștime","pos":"noun","definitions":["frogkind"],"forms":{"plural":"broștimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"broștime","accusative-definite-nominative-singular":"broștimea","accusative-indefinite-nominative-plural":"broștimi","accusative-definite-nominative-plural":"broștimile","dative-genitive-indefinite-singular":"broștimi","dative-definite-genitive-singular":"broștimii","dative-genitive-indefinite-plural":"broștimi","dative-definite-genitive-plural":"broștimilor","singular-vocative":"broștime","plural-vocative":"broștimilor"}},{"word":"broșură","pos":"noun","definitions":["brochure"],"forms":{"plural":"broșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"broșură","accusative-definite-nominative-singular":"broșura","accusative-indefinite-nominative-plural":"broșuri","accusative-definite-nominative-plural":"broșurile","dative-genitive-indefinite-singular":"broșuri","dative-definite-genitive-singular":"broșurii","dative-genitive-indefinite-plural":"broșuri","dative-definite-genitive-plural":"broșurilor","singular-vocative":"broșură","plural-vocative":"broșurilor"}},{"word":"broșurică","pos":"noun","definitions":["diminutive of broșură; small brochure"],"forms":{"plural":"broșurele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"broșurică","accusative-definite-nominative-singular":"broșurica","accusative-indefinite-nominative-plural":"broșurice","accusative-definite-nominative-plural":"broșuricele","dative-genitive-indefinite-singular":"broșurice","dative-definite-genitive-singular":"broșuricei","dative-genitive-indefinite-plural":"broșurice","dative-definite-genitive-plural":"broșuricelor","singular-vocative":"broșurică","plural-vocative":"broșuricelor"}},{"word":"Brotac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brotac"}},{"word":"brotac","pos":"noun","definitions":["European tree frog (Hyla arborea)"],"forms":{"plural":"brotaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brotac","accusative-definite-nominative-singular":"brotacul","accusative-indefinite-nominative-plural":"brotaci","accusative-definite-nominative-plural":"brotacii","dative-genitive-indefinite-singular":"brotac","dative-definite-genitive-singular":"brotacului","dative-genitive-indefinite-plural":"brotaci","dative-definite-genitive-plural":"brotacilor","singular-vocative":"brotacule","plural-vocative":"brotacilor","alternative":"broatec"}},{"word":"Brotăcel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brotăcel"}},{"word":"brotăcel","pos":"noun","definitions":["diminutive of brotac; small frog"],"forms":{"plural":"brotăcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brotăcel","accusative-definite-nominative-singular":"brotăcelul","accusative-indefinite-nominative-plural":"brotăceli","accusative-definite-nominative-plural":"brotăcelii","dative-genitive-indefinite-singular":"brotăcel","dative-definite-genitive-singular":"brotăcelului","dative-genitive-indefinite-plural":"brotăceli","dative-definite-genitive-plural":"brotăcelilor","singular-vocative":"brotăcelule","plural-vocative":"brotăcelilor"}},{"word":"Brotăcelu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brotăcelu"}},{"word":"brotăcime","pos":"noun","definitions":["frogkind"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"brotăcime","accusative-definite-nominative":"brotăcimea","dative-genitive-indefinite":"brotăcimi","dative-definite-genitive":"brotăcimii","vocative":"brotăcime"}},{"word":"brotan","pos":"noun","definitions":["European tree frog (Hyla arborea)"],"forms":{"plural":"brotani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brotan","accusative-definite-nominative-singular":"brotanul","accusative-indefinite-nominative-plural":"brotani","accusative-definite-nominative-plural":"brotanii","dative-genitive-indefinite-singular":"brotan","dative-definite-genitive-singular":"brotanului","dative-genitive-indefinite-plural":"brotani","dative-definite-genitive-plural":"brotanilor","singular-vocative":"brotanule","plural-vocative":"brotanilor"}},{"word":"broticiu","pos":"adj","definitions":["frog-like green"],"forms":{"feminine-singular":"broticie","plural":"broticii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"broticiu","error-unrecognized-form-feminine-indefinite-singular":"broticie","error-unrecognized-form-indefinite-masculine-plural":"broticii","error-unrecognized-form-feminine-indefinite-neuter-plural":"broticii","definite-error-unrecognized-form-masculine-neuter-singular":"broticiul","definite-error-unrecognized-form-feminine-singular":"broticia","definite-error-unrecognized-form-masculine-plural":"broticiii","definite-error-unrecognized-form-feminine-neuter-plural":"broticiile"}},{"word":"brotire","pos":"noun","definitions":["befriendment"],"forms":{"plural":"brotiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brotire","accusative-definite-nominative-singular":"brotirea","accusative-indefinite-nominative-plural":"brotiri","accusative-definite-nominative-plural":"brotirile","dative-genitive-indefinite-singular":"brotiri","dative-definite-genitive-singular":"brotirii","dative-genitive-indefinite-plural":"brotiri","dative-definite-genitive-plural":"brotirilor","singular-vocative":"brotire","plural-vocative":"brotirilor"}},{"word":"Brotuna","pos":"name","definitions":["a village in Vața de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"brownian","pos":"adj","definitions":["Brownian"],"forms":{"feminine-singular":"browniană","masculine-plural":"brownieni","feminine-neuter-plural":"browniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brownian","error-unrecognized-form-feminine-indefinite-singular":"browniană","error-unrecognized-form-indefinite-masculine-plural":"brownieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"browniene","definite-error-unrecognized-form-masculine-neuter-singular":"brownianul","definite-error-unrecognized-form-feminine-singular":"browniana","definite-error-unrecognized-form-masculine-plural":"brownienii","definite-error-unrecognized-form-feminine-neuter-plural":"brownienele"}},{"word":"browning","pos":"noun","definitions":["Browning (gun)"],"forms":{"plural":"browninguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"browning","accusative-definite-nominative-singular":"browningul","accusative-indefinite-nominative-plural":"browninguri","accusative-definite-nominative-plural":"browningurile","dative-genitive-indefinite-singular":"browning","dative-definite-genitive-singular":"browningului","dative-genitive-indefinite-plural":"browninguri","dative-definite-genitive-plural":"browningurilor","singular-vocative":"browningule","plural-vocative":"browningurilor"}},{"word":"brr","pos":"intj","definitions":["brr"]},{"word":"bruceloză","pos":"noun","definitions":["brucellosis"],"forms":{"plural":"bruceloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bruceloză","accusative-definite-nominative-singular":"bruceloza","accusative-indefinite-nominative-plural":"bruceloze","accusative-definite-nominative-plural":"brucelozele","dative-genitive-indefinite-singular":"bruceloze","dative-definite-genitive-singular":"brucelozei","dative-genitive-indefinite-plural":"bruceloze","dative-definite-genitive-plural":"brucelozelor","singular-vocative":"bruceloză","plural-vocative":"brucelozelor"}},{"word":"brucină","pos":"noun","definitions":["brucine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brucină","accusative-definite-nominative-singular":"brucina","accusative-indefinite-nominative-plural":"brucine","accusative-definite-nominative-plural":"brucinele","dative-genitive-indefinite-singular":"brucine","dative-definite-genitive-singular":"brucinei","dative-genitive-indefinite-plural":"brucine","dative-definite-genitive-plural":"brucinelor","singular-vocative":"brucină","plural-vocative":"brucinelor"}},{"word":"brudar","pos":"noun","definitions":["drawbridge operator"],"forms":{"plural":"brudari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brudar","accusative-definite-nominative-singular":"brudarul","accusative-indefinite-nominative-plural":"brudari","accusative-definite-nominative-plural":"brudarii","dative-genitive-indefinite-singular":"brudar","dative-definite-genitive-singular":"brudarului","dative-genitive-indefinite-plural":"brudari","dative-definite-genitive-plural":"brudarilor","singular-vocative":"brudarule","plural-vocative":"brudarilor"}},{"word":"Brudiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brudiu"}},{"word":"brudiu","pos":"adj","definitions":["young"],"forms":{"feminine-singular":"brudie","plural":"brudii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brudiu","error-unrecognized-form-feminine-indefinite-singular":"brudie","error-unrecognized-form-indefinite-masculine-plural":"brudii","error-unrecognized-form-feminine-indefinite-neuter-plural":"brudii","definite-error-unrecognized-form-masculine-neuter-singular":"brudiul","definite-error-unrecognized-form-feminine-singular":"brudia","definite-error-unrecognized-form-masculine-plural":"brudiii","definite-error-unrecognized-form-feminine-neuter-plural":"brudiile"}},{"word":"brudnic","pos":"adj","definitions":["young (about a person)"],"forms":{"feminine-singular":"brudnică","masculine-plural":"brudnici","feminine-neuter-plural":"brudnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brudnic","error-unrecognized-form-feminine-indefinite-singular":"brudnică","error-unrecognized-form-indefinite-masculine-plural":"brudnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"brudnice","definite-error-unrecognized-form-masculine-neuter-singular":"brudnicul","definite-error-unrecognized-form-feminine-singular":"brudnica","definite-error-unrecognized-form-masculine-plural":"brudnicii","definite-error-unrecognized-form-feminine-neuter-plural":"brudnicele"}},{"word":"bruduț","pos":"noun","definitions":["diminutive of brud"],"forms":{"plural":"bruduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bruduț","accusative-definite-nominative-singular":"bruduțul","accusative-indefinite-nominative-plural":"bruduțe","accusative-definite-nominative-plural":"bruduțele","dative-genitive-indefinite-singular":"bruduț","dative-definite-genitive-singular":"bruduțului","dative-genitive-indefinite-plural":"bruduțe","dative-definite-genitive-plural":"bruduțelor","singular-vocative":"bruduțule","plural-vocative":"bruduțelor"}},{"word":"bruftuială","pos":"noun","definitions":["beating, spanking"],"forms":{"plural":"bruftuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bruftuială","accusative-definite-nominative-singular":"bruftuiala","accusative-indefinite-nominative-plural":"bruftuiele","accusative-definite-nominative-plural":"bruftuielele","dative-genitive-indefinite-singular":"bruftuiele","dative-definite-genitive-singular":"bruftuielei","dative-genitive-indefinite-plural":"bruftuiele","dative-definite-genitive-plural":"bruftuielelor","singular-vocative":"bruftuială","plural-vocative":"bruftuielelor"}},{"word":"bruftului","pos":"verb","definitions":["alternative form of bruftui"],"forms":{"canonical":"a bruftului 4th conjugation","present-singular-third-person":"bruftuluiește","participle-past":"bruftuluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bruftului","gerund":"bruftuluind","first-person-indicative-present-singular":"bruftuluiesc","indicative-present-second-person-singular":"bruftuluiești","indicative-present-singular-third-person":"bruftuluiește","first-person-indicative-plural-present":"bruftuluim","indicative-plural-present-second-person":"bruftuluiți","indicative-plural-present-third-person":"bruftuluiesc","first-person-imperfect-indicative-singular":"bruftuluiam","imperfect-indicative-second-person-singular":"bruftuluiai","imperfect-indicative-singular-third-person":"bruftuluia","first-person-imperfect-indicative-plural":"bruftuluiam","imperfect-indicative-plural-second-person":"bruftuluiați","imperfect-indicative-plural-third-person":"bruftuluiau","first-person-indicative-perfect-singular":"bruftuluii","indicative-perfect-second-person-singular":"bruftuluiși","indicative-perfect-singular-third-person":"bruftului","first-person-indicative-perfect-plural":"bruftuluirăm","indicative-perfect-plural-second-person":"bruftuluirăți","indicative-perfect-plural-third-person":"bruftuluiră","first-person-indicative-pluperfect-singular":"bruftuluisem","indicative-pluperfect-second-person-singular":"bruftuluiseși","indicative-pluperfect-singular-third-person":"bruftuluise","first-person-indicative-pluperfect-plural":"bruftuluiserăm","indicative-pluperfect-plural-second-person":"bruftuluiserăți","indicative-pluperfect-plural-third-person":"bruftuluiseră","first-person-present-singular-subjunctive":"să bruftuluiesc","present-second-person-singular-subjunctive":"să bruftuluiești","present-singular-subjunctive-third-person":"să bruftuluiască","first-person-plural-present-subjunctive":"să bruftuluim","plural-present-second-person-subjunctive":"să bruftuluiți","plural-present-subjunctive-third-person":"să bruftuluiască","imperative-second-person-singular":"bruftuluiește","imperative-plural-second-person":"bruftuluiți","imperative-negative-second-person-singular":"nu bruftului","imperative-negative-plural-second-person":"nu bruftuluiți"}},{"word":"bruftuluială","pos":"noun","definitions":["alternative form of bruftuială"],"forms":{"plural":"bruftuluieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bruftuluială","accusative-definite-nominative-singular":"bruftuluiala","accusative-indefinite-nominative-plural":"bruftuluiele","accusative-definite-nominative-plural":"bruftuluielele","dative-genitive-indefinite-singular":"bruftuluiele","dative-definite-genitive-singular":"bruftuluielei","dative-genitive-indefinite-plural":"bruftuluiele","dative-definite-genitive-plural":"bruftuluielelor","singular-vocative":"bruftuluială","plural-vocative":"bruftuluielelor"}},{"word":"bruia","pos":"verb","definitions":["to jam (block or confuse a broadcast signal)","to talk over someone"],"pronunciation":"[bruˈja]","forms":{"canonical":"a bruia 1st conjugation","present-singular-third-person":"bruiază","participle-past":"bruiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bruia","gerund":"bruind","first-person-indicative-present-singular":"bruiez","indicative-present-second-person-singular":"bruiezi","indicative-present-singular-third-person":"bruiază","first-person-indicative-plural-present":"bruiem","indicative-plural-present-second-person":"bruiați","indicative-plural-present-third-person":"bruiază","first-person-imperfect-indicative-singular":"bruiam","imperfect-indicative-second-person-singular":"bruiai","imperfect-indicative-singular-third-person":"bruia","first-person-imperfect-indicative-plural":"bruiam","imperfect-indicative-plural-second-person":"bruiați","imperfect-indicative-plural-third-person":"bruiau","first-person-indicative-perfect-singular":"bruiai","indicative-perfect-second-person-singular":"bruiași","indicative-perfect-singular-third-person":"bruie","first-person-indicative-perfect-plural":"bruiarăm","indicative-perfect-plural-second-person":"bruiarăți","indicative-perfect-plural-third-person":"bruiară","first-person-indicative-pluperfect-singular":"bruiasem","indicative-pluperfect-second-person-singular":"bruiaseși","indicative-pluperfect-singular-third-person":"bruiase","first-person-indicative-pluperfect-plural":"bruiaserăm","indicative-pluperfect-plural-second-person":"bruiaserăți","indicative-pluperfect-plural-third-person":"bruiaseră","first-person-present-singular-subjunctive":"să bruiez","present-second-person-singular-subjunctive":"să bruiezi","present-singular-subjunctive-third-person":"să bruieze","first-person-plural-present-subjunctive":"să bruiem","plural-present-second-person-subjunctive":"să bruiați","plural-present-subjunctive-third-person":"să bruieze","imperative-second-person-singular":"bruiază","imperative-plural-second-person":"bruiați","imperative-negative-second-person-singular":"nu bruia","imperative-negative-plural-second-person":"nu bruiați"}},{"word":"bruiaj","pos":"noun","definitions":["jamming"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bruiaj","accusative-definite-nominative-singular":"bruiajul","accusative-indefinite-nominative-plural":"bruiaje","accusative-definite-nominative-plural":"bruiajele","dative-genitive-indefinite-singular":"bruiaj","dative-definite-genitive-singular":"bruiajului","dative-genitive-indefinite-plural":"bruiaje","dative-definite-genitive-plural":"bruiajelor","singular-vocative":"bruiajule","plural-vocative":"bruiajelor"}},{"word":"bruiat","pos":"adj","definitions":["noisy (about a radio transmission)"],"forms":{"feminine-singular":"bruiată","masculine-plural":"bruiați","feminine-neuter-plural":"bruiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bruiat","error-unrecognized-form-feminine-indefinite-singular":"bruiată","error-unrecognized-form-indefinite-masculine-plural":"bruiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bruiate","definite-error-unrecognized-form-masculine-neuter-singular":"bruiatul","definite-error-unrecognized-form-feminine-singular":"bruiata","definite-error-unrecognized-form-masculine-plural":"bruiații","definite-error-unrecognized-form-feminine-neuter-plural":"bruiatele"}},{"word":"bruie","pos":"verb","definitions":["third-person singular simple perfect indicative of bruia"],"pronunciation":"[bruˈje]"},{"word":"bruiere","pos":"noun","definitions":["jamming"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"bruiere","accusative-definite-nominative":"bruierea","dative-genitive-indefinite":"bruiere","dative-definite-genitive":"bruierei","vocative":"bruiere"}},{"word":"bruion","pos":"noun","definitions":["draft"],"forms":{"plural":"bruioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bruion","accusative-definite-nominative-singular":"bruionul","accusative-indefinite-nominative-plural":"bruioane","accusative-definite-nominative-plural":"bruioanele","dative-genitive-indefinite-singular":"bruion","dative-definite-genitive-singular":"bruionului","dative-genitive-indefinite-plural":"bruioane","dative-definite-genitive-plural":"bruioanelor","singular-vocative":"bruionule","plural-vocative":"bruioanelor"}},{"word":"Bruma","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bruma"}},{"word":"bruma","pos":"verb","definitions":["to have frost form","to form frost, become covered in hoarfrost, rime"],"forms":{"canonical":"a bruma 1st conjugation","present-singular-third-person":"brumează","participle-past":"brumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bruma","gerund":"brumând","first-person-indicative-present-singular":"-","indicative-present-second-person-singular":"-","indicative-present-singular-third-person":"brumează","first-person-indicative-plural-present":"-","indicative-plural-present-second-person":"-","indicative-plural-present-third-person":"brumează","first-person-imperfect-indicative-singular":"-","imperfect-indicative-second-person-singular":"-","imperfect-indicative-singular-third-person":"bruma","first-person-imperfect-indicative-plural":"-","imperfect-indicative-plural-second-person":"-","imperfect-indicative-plural-third-person":"brumau","first-person-indicative-perfect-singular":"-","indicative-perfect-second-person-singular":"-","indicative-perfect-singular-third-person":"brumă","first-person-indicative-perfect-plural":"-","indicative-perfect-plural-second-person":"-","indicative-perfect-plural-third-person":"brumară","first-person-indicative-pluperfect-singular":"-","indicative-pluperfect-second-person-singular":"-","indicative-pluperfect-singular-third-person":"brumase","first-person-indicative-pluperfect-plural":"-","indicative-pluperfect-plural-second-person":"-","indicative-pluperfect-plural-third-person":"brumaseră","first-person-present-singular-subjunctive":"-","present-second-person-singular-subjunctive":"-","present-singular-subjunctive-third-person":"să brumeze","first-person-plural-present-subjunctive":"-","plural-present-second-person-subjunctive":"-","plural-present-subjunctive-third-person":"să brumeze","imperative-second-person-singular":"-","imperative-plural-second-person":"-","imperative-negative-second-person-singular":"-","imperative-negative-plural-second-person":"-"}},{"word":"Brumă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brumă"}},{"word":"brumă","pos":"noun","definitions":["frost (cover of minute ice crystals)","rime, hoarfrost"],"pronunciation":"/ˈbru.mə/","forms":{"plural":"brume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brumă","accusative-definite-nominative-singular":"bruma","accusative-indefinite-nominative-plural":"brume","accusative-definite-nominative-plural":"brumele","dative-genitive-indefinite-singular":"brume","dative-definite-genitive-singular":"brumei","dative-genitive-indefinite-plural":"brume","dative-definite-genitive-plural":"brumelor","singular-vocative":"brumă","plural-vocative":"brumelor"}},{"word":"Brumar","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brumar"}},{"word":"brumar","pos":"noun","definitions":["November (eleventh month of the Gregorian calendar)"],"pronunciation":"/bruˈmar/"},{"word":"brumărea","pos":"noun","definitions":["fall phlox (Phlox paniculata)","annual phlox (Phlox drummondii)"],"forms":{"plural":"brumărele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"brumărea","accusative-definite-nominative-singular":"brumăreaua","accusative-indefinite-nominative-plural":"brumărele","accusative-definite-nominative-plural":"brumărelele","dative-genitive-indefinite-singular":"brumărele","dative-definite-genitive-singular":"brumărelei","dative-genitive-indefinite-plural":"brumărele","dative-definite-genitive-plural":"brumărelelor","singular-vocative":"brumărea","plural-vocative":"brumărelelor"}},{"word":"brumărel","pos":"noun","definitions":["October (tenth month of the Gregorian calendar)"],"pronunciation":"/bruməˈrel/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"brumărel","accusative-definite-nominative":"brumărelul","dative-genitive-indefinite":"brumărel","dative-definite-genitive":"brumărelului","vocative":"brumărelule"}},{"word":"brumăriță","pos":"noun","definitions":["alpine accentor, (Prunella collaris)","dunnock, hedge sparrow (Prunella modularis)"],"forms":{"plural":"brumărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brumăriță","accusative-definite-nominative-singular":"brumărița","accusative-indefinite-nominative-plural":"brumărițe","accusative-definite-nominative-plural":"brumărițele","dative-genitive-indefinite-singular":"brumărițe","dative-definite-genitive-singular":"brumăriței","dative-genitive-indefinite-plural":"brumărițe","dative-definite-genitive-plural":"brumărițelor","singular-vocative":"brumăriță","plural-vocative":"brumărițelor"}},{"word":"brumăriță de pădure","pos":"noun","definitions":["dunnock (Prunella modularis)"],"forms":{"plural":"brumărițe de pădure"}},{"word":"brumăriță de stâncă","pos":"noun","definitions":["alpine accentor (Prunella collaris)"],"forms":{"plural":"brumărițe de stâncă"}},{"word":"Brumariu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brumariu"}},{"word":"brumăriu","pos":"adj","definitions":["gray, grayish"],"pronunciation":"/bru.məˈriw/","forms":{"feminine-singular":"brumărie","plural":"brumării","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brumăriu","error-unrecognized-form-feminine-indefinite-singular":"brumărie","error-unrecognized-form-indefinite-masculine-plural":"brumării","error-unrecognized-form-feminine-indefinite-neuter-plural":"brumării","definite-error-unrecognized-form-masculine-neuter-singular":"brumăriul","definite-error-unrecognized-form-feminine-singular":"brumăria","definite-error-unrecognized-form-masculine-plural":"brumăriii","definite-error-unrecognized-form-feminine-neuter-plural":"brumăriile"}},{"word":"Brumaru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brumaru"}},{"word":"brumat","pos":"adj","definitions":["hoary"],"forms":{"feminine-singular":"brumată","masculine-plural":"brumați","feminine-neuter-plural":"brumate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brumat","error-unrecognized-form-feminine-indefinite-singular":"brumată","error-unrecognized-form-indefinite-masculine-plural":"brumați","error-unrecognized-form-feminine-indefinite-neuter-plural":"brumate","definite-error-unrecognized-form-masculine-neuter-singular":"brumatul","definite-error-unrecognized-form-feminine-singular":"brumata","definite-error-unrecognized-form-masculine-plural":"brumații","definite-error-unrecognized-form-feminine-neuter-plural":"brumatele"}},{"word":"brumat","pos":"verb","definitions":["past participle of bruma"],"forms":{"participle-past":"of bruma"}},{"word":"brumatec","pos":"adj","definitions":["obsolete form of brumatic"],"forms":{"feminine-singular":"brumatecă","masculine-plural":"brumateci","feminine-neuter-plural":"brumatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brumatec","error-unrecognized-form-feminine-indefinite-singular":"brumatecă","error-unrecognized-form-indefinite-masculine-plural":"brumateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"brumatece","definite-error-unrecognized-form-masculine-neuter-singular":"brumatecul","definite-error-unrecognized-form-feminine-singular":"brumateca","definite-error-unrecognized-form-masculine-plural":"brumatecii","definite-error-unrecognized-form-feminine-neuter-plural":"brumatecele"}},{"word":"brumatic","pos":"adj","definitions":["frosty"],"forms":{"feminine-singular":"brumatică","masculine-plural":"brumatici","feminine-neuter-plural":"brumatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brumatic","error-unrecognized-form-feminine-indefinite-singular":"brumatică","error-unrecognized-form-indefinite-masculine-plural":"brumatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"brumatice","definite-error-unrecognized-form-masculine-neuter-singular":"brumaticul","definite-error-unrecognized-form-feminine-singular":"brumatica","definite-error-unrecognized-form-masculine-plural":"brumaticii","definite-error-unrecognized-form-feminine-neuter-plural":"brumaticele"}},{"word":"brumos","pos":"adj","definitions":["brumous"],"forms":{"feminine-singular":"brumoasă","masculine-plural":"brumoși","feminine-neuter-plural":"brumoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brumos","error-unrecognized-form-feminine-indefinite-singular":"brumoasă","error-unrecognized-form-indefinite-masculine-plural":"brumoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"brumoase","definite-error-unrecognized-form-masculine-neuter-singular":"brumosul","definite-error-unrecognized-form-feminine-singular":"brumoasa","definite-error-unrecognized-form-masculine-plural":"brumoșii","definite-error-unrecognized-form-feminine-neuter-plural":"brumoasele"}},{"word":"brumuliță","pos":"noun","definitions":["diminutive of brumă"],"forms":{"plural":"brumulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brumuliță","accusative-definite-nominative-singular":"brumulița","accusative-indefinite-nominative-plural":"brumulițe","accusative-definite-nominative-plural":"brumulițele","dative-genitive-indefinite-singular":"brumulițe","dative-definite-genitive-singular":"brumuliței","dative-genitive-indefinite-plural":"brumulițe","dative-definite-genitive-plural":"brumulițelor","singular-vocative":"brumuliță","plural-vocative":"brumulițelor"}},{"word":"brun","pos":"adj","definitions":["brown (color/colour)","brown- or dark-haired"],"pronunciation":"/brun/","forms":{"feminine-singular":"brună","masculine-plural":"bruni","feminine-neuter-plural":"brune","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"brun","error-unrecognized-form-feminine-indefinite-singular":"brună","error-unrecognized-form-indefinite-masculine-plural":"bruni","error-unrecognized-form-feminine-indefinite-neuter-plural":"brune","definite-error-unrecognized-form-masculine-neuter-singular":"brunul","definite-error-unrecognized-form-feminine-singular":"bruna","definite-error-unrecognized-form-masculine-plural":"brunii","definite-error-unrecognized-form-feminine-neuter-plural":"brunele"}},{"word":"bruna","pos":"verb","definitions":["to burnish"],"pronunciation":"/bruˈna/","forms":{"canonical":"a bruna 1st conjugation","present-singular-third-person":"brunează","participle-past":"brunat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bruna","gerund":"brunând","first-person-indicative-present-singular":"brunez","indicative-present-second-person-singular":"brunezi","indicative-present-singular-third-person":"brunează","first-person-indicative-plural-present":"brunăm","indicative-plural-present-second-person":"brunați","indicative-plural-present-third-person":"brunează","first-person-imperfect-indicative-singular":"brunam","imperfect-indicative-second-person-singular":"brunai","imperfect-indicative-singular-third-person":"bruna","first-person-imperfect-indicative-plural":"brunam","imperfect-indicative-plural-second-person":"brunați","imperfect-indicative-plural-third-person":"brunau","first-person-indicative-perfect-singular":"brunai","indicative-perfect-second-person-singular":"brunași","indicative-perfect-singular-third-person":"brună","first-person-indicative-perfect-plural":"brunarăm","indicative-perfect-plural-second-person":"brunarăți","indicative-perfect-plural-third-person":"brunară","first-person-indicative-pluperfect-singular":"brunasem","indicative-pluperfect-second-person-singular":"brunaseși","indicative-pluperfect-singular-third-person":"brunase","first-person-indicative-pluperfect-plural":"brunaserăm","indicative-pluperfect-plural-second-person":"brunaserăți","indicative-pluperfect-plural-third-person":"brunaseră","first-person-present-singular-subjunctive":"să brunez","present-second-person-singular-subjunctive":"să brunezi","present-singular-subjunctive-third-person":"să bruneze","first-person-plural-present-subjunctive":"să brunăm","plural-present-second-person-subjunctive":"să brunați","plural-present-subjunctive-third-person":"să bruneze","imperative-second-person-singular":"brunează","imperative-plural-second-person":"brunați","imperative-negative-second-person-singular":"nu bruna","imperative-negative-plural-second-person":"nu brunați"}},{"word":"brunare","pos":"noun","definitions":["burnishing"],"forms":{"plural":"brunări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brunare","accusative-definite-nominative-singular":"brunarea","accusative-indefinite-nominative-plural":"brunări","accusative-definite-nominative-plural":"brunările","dative-genitive-indefinite-singular":"brunări","dative-definite-genitive-singular":"brunării","dative-genitive-indefinite-plural":"brunări","dative-definite-genitive-plural":"brunărilor","singular-vocative":"brunare","plural-vocative":"brunărilor"}},{"word":"brunch","pos":"noun","definitions":["brunch"],"forms":{"plural":"brunch-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"brunch","accusative-definite-nominative-singular":"brunchul","accusative-indefinite-nominative-plural":"brunch-uri","accusative-definite-nominative-plural":"brunch-urile","dative-genitive-indefinite-singular":"brunch","dative-definite-genitive-singular":"brunchului","dative-genitive-indefinite-plural":"brunch-uri","dative-definite-genitive-plural":"brunch-urilor","singular-vocative":"brunchule","plural-vocative":"brunch-urilor"}},{"word":"brune","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of brun"],"pronunciation":"/ˈbru.ne/"},{"word":"brunei","pos":"adj","definitions":["definite genitive/dative feminine singular of brun"],"pronunciation":"[ˈbru.nej]"},{"word":"brunet","pos":"adj","definitions":["brunette"],"forms":{"feminine-singular":"brunetă","masculine-plural":"bruneți","feminine-neuter-plural":"brunete","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brunet","error-unrecognized-form-feminine-indefinite-singular":"brunetă","error-unrecognized-form-indefinite-masculine-plural":"bruneți","error-unrecognized-form-feminine-indefinite-neuter-plural":"brunete","definite-error-unrecognized-form-masculine-neuter-singular":"brunetul","definite-error-unrecognized-form-feminine-singular":"bruneta","definite-error-unrecognized-form-masculine-plural":"bruneții","definite-error-unrecognized-form-feminine-neuter-plural":"brunetele"}},{"word":"bruni","pos":"adj","definitions":["nominative/accusative masculine plural of brun"],"pronunciation":"/brunʲ/"},{"word":"brusc","pos":"adj","definitions":["sudden"],"pronunciation":"/brusk/","forms":{"feminine-singular":"bruscă","masculine-plural":"bruști","feminine-neuter-plural":"bruște","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brusc","error-unrecognized-form-feminine-indefinite-singular":"bruscă","error-unrecognized-form-indefinite-masculine-plural":"bruști","error-unrecognized-form-feminine-indefinite-neuter-plural":"bruște","definite-error-unrecognized-form-masculine-neuter-singular":"bruscul","definite-error-unrecognized-form-feminine-singular":"brusca","definite-error-unrecognized-form-masculine-plural":"bruștii","definite-error-unrecognized-form-feminine-neuter-plural":"bruștele"}},{"word":"brusca","pos":"verb","definitions":["to shove","to rush (an operation)"],"forms":{"canonical":"a brusca 1st conjugation","present-singular-third-person":"bruschează","participle-past":"bruscat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a brusca","gerund":"bruscând","first-person-indicative-present-singular":"bruschez","indicative-present-second-person-singular":"bruschezi","indicative-present-singular-third-person":"bruschează","first-person-indicative-plural-present":"bruscăm","indicative-plural-present-second-person":"bruscați","indicative-plural-present-third-person":"bruschează","first-person-imperfect-indicative-singular":"bruscam","imperfect-indicative-second-person-singular":"bruscai","imperfect-indicative-singular-third-person":"brusca","first-person-imperfect-indicative-plural":"bruscam","imperfect-indicative-plural-second-person":"bruscați","imperfect-indicative-plural-third-person":"bruscau","first-person-indicative-perfect-singular":"bruscai","indicative-perfect-second-person-singular":"bruscași","indicative-perfect-singular-third-person":"bruscă","first-person-indicative-perfect-plural":"bruscarăm","indicative-perfect-plural-second-person":"bruscarăți","indicative-perfect-plural-third-person":"bruscară","first-person-indicative-pluperfect-singular":"bruscasem","indicative-pluperfect-second-person-singular":"bruscaseși","indicative-pluperfect-singular-third-person":"bruscase","first-person-indicative-pluperfect-plural":"bruscaserăm","indicative-pluperfect-plural-second-person":"bruscaserăți","indicative-pluperfect-plural-third-person":"bruscaseră","first-person-present-singular-subjunctive":"să bruschez","present-second-person-singular-subjunctive":"să bruschezi","present-singular-subjunctive-third-person":"să bruscheze","first-person-plural-present-subjunctive":"să bruscăm","plural-present-second-person-subjunctive":"să bruscați","plural-present-subjunctive-third-person":"să bruscheze","imperative-second-person-singular":"bruschează","imperative-plural-second-person":"bruscați","imperative-negative-second-person-singular":"nu brusca","imperative-negative-plural-second-person":"nu bruscați"}},{"word":"bruscare","pos":"noun","definitions":["shoving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bruscare","accusative-definite-nominative":"bruscarea","dative-genitive-indefinite":"bruscări","dative-definite-genitive":"bruscării","vocative":"bruscare"}},{"word":"bruschețe","pos":"noun","definitions":["suddenness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"bruschețe","accusative-definite-nominative":"bruschețea","dative-genitive-indefinite":"bruschețe","dative-definite-genitive":"bruscheței","vocative":"bruschețe"}},{"word":"brușel","pos":"noun","definitions":["diminutive of bruș"],"forms":{"plural":"brușei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brușel","accusative-definite-nominative-singular":"brușelul","accusative-indefinite-nominative-plural":"brușei","accusative-definite-nominative-plural":"brușeii","dative-genitive-indefinite-singular":"brușel","dative-definite-genitive-singular":"brușelului","dative-genitive-indefinite-plural":"brușei","dative-definite-genitive-plural":"brușeilor","singular-vocative":"brușelule","plural-vocative":"brușeilor"}},{"word":"brusin","pos":"noun","definitions":["rust"],"forms":{"plural":"brusini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brusin","accusative-definite-nominative-singular":"brusinul","accusative-indefinite-nominative-plural":"brusini","accusative-definite-nominative-plural":"brusinii","dative-genitive-indefinite-singular":"brusin","dative-definite-genitive-singular":"brusinului","dative-genitive-indefinite-plural":"brusini","dative-definite-genitive-plural":"brusinilor","singular-vocative":"brusinule","plural-vocative":"brusinilor"}},{"word":"bruștin","pos":"noun","definitions":["amber (fossil resin)"],"pronunciation":"/ˈbruʃ.tin/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bruștin","accusative-definite-nominative":"bruștinul","dative-genitive-indefinite":"bruștin","dative-definite-genitive":"bruștinului","vocative":"bruștinule"}},{"word":"Brustur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brustur"}},{"word":"brustur","pos":"noun","definitions":["alternative form of brusture"],"forms":{"plural":"brusturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brustur","accusative-definite-nominative-singular":"brusturul","accusative-indefinite-nominative-plural":"brusturi","accusative-definite-nominative-plural":"brusturii","dative-genitive-indefinite-singular":"brustur","dative-definite-genitive-singular":"brusturului","dative-genitive-indefinite-plural":"brusturi","dative-definite-genitive-plural":"brusturilor","singular-vocative":"brusturule","plural-vocative":"brusturilor"}},{"word":"brusturaș","pos":"noun","definitions":["diminutive of brusture"],"forms":{"plural":"brusturași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brusturaș","accusative-definite-nominative-singular":"brusturașul","accusative-indefinite-nominative-plural":"brusturași","accusative-definite-nominative-plural":"brusturașii","dative-genitive-indefinite-singular":"brusturaș","dative-definite-genitive-singular":"brusturașului","dative-genitive-indefinite-plural":"brusturași","dative-definite-genitive-plural":"brusturașilor","singular-vocative":"brusturașule","plural-vocative":"brusturașilor"}},{"word":"Brusturatu","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Tazlăul Mare"],"gender":"m"},{"word":"Brusture","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Brusture"}},{"word":"brusture","pos":"noun","definitions":["burdock"],"forms":{"plural":"brusturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"brusture","accusative-definite-nominative-singular":"brusturele","accusative-indefinite-nominative-plural":"brusturi","accusative-definite-nominative-plural":"brusturii","dative-genitive-indefinite-singular":"brusture","dative-definite-genitive-singular":"brusturelui","dative-genitive-indefinite-plural":"brusturi","dative-definite-genitive-plural":"brusturilor","singular-vocative":"brusture","plural-vocative":"brusturilor","alternative":"brustur"}},{"word":"Brustureanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Brustureanu"}},{"word":"brusturel","pos":"noun","definitions":["diminutive of brusture"],"forms":{"plural":"brusturei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brusturel","accusative-definite-nominative-singular":"brusturelul","accusative-indefinite-nominative-plural":"brusturei","accusative-definite-nominative-plural":"brustureii","dative-genitive-indefinite-singular":"brusturel","dative-definite-genitive-singular":"brusturelului","dative-genitive-indefinite-plural":"brusturei","dative-definite-genitive-plural":"brustureilor","singular-vocative":"brusturelule","plural-vocative":"brustureilor"}},{"word":"Brusturescu","pos":"name","definitions":["a river in Arad, Romania, tributary to the Zimbru"],"gender":"m"},{"word":"Brusturetul","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea Cheii"],"gender":"m"},{"word":"Brusturi","pos":"name","definitions":["a village in Hălmagiu, Arad County, Romania","a commune of Bihor County, Romania","a village in Brusturi, Bihor County, Romania","a village in Finiș, Bihor County, Romania","a commune of Neamț County, Romania"],"gender":"m"},{"word":"brusturi","pos":"noun","definitions":["plural of brusture"]},{"word":"brusturilor","pos":"noun","definitions":["definite genitive/dative plural of brustur"]},{"word":"Brusturoasa","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Brusturoasa, Bacău County, Romania"],"gender":"f"},{"word":"brușuleț","pos":"noun","definitions":["diminutive of bruș"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"brușuleț","accusative-definite-nominative":"brușulețul","dative-genitive-indefinite":"brușuleț","dative-definite-genitive":"brușulețului","vocative":"brușulețule"}},{"word":"brușuț","pos":"noun","definitions":["diminutive of bruș"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"brușuț","accusative-definite-nominative":"brușuțul","dative-genitive-indefinite":"brușuț","dative-definite-genitive":"brușuțului","vocative":"brușuțule"}},{"word":"brut","pos":"adj","definitions":["gross (as opposed to net)"],"forms":{"feminine-singular":"brută","masculine-plural":"bruți","feminine-neuter-plural":"brute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brut","error-unrecognized-form-feminine-indefinite-singular":"brută","error-unrecognized-form-indefinite-masculine-plural":"bruți","error-unrecognized-form-feminine-indefinite-neuter-plural":"brute","definite-error-unrecognized-form-masculine-neuter-singular":"brutul","definite-error-unrecognized-form-feminine-singular":"bruta","definite-error-unrecognized-form-masculine-plural":"bruții","definite-error-unrecognized-form-feminine-neuter-plural":"brutele"}},{"word":"brută","pos":"noun","definitions":["brute"],"forms":{"plural":"brute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brută","accusative-definite-nominative-singular":"bruta","accusative-indefinite-nominative-plural":"brute","accusative-definite-nominative-plural":"brutele","dative-genitive-indefinite-singular":"brute","dative-definite-genitive-singular":"brutei","dative-genitive-indefinite-plural":"brute","dative-definite-genitive-plural":"brutelor","singular-vocative":"brută","plural-vocative":"brutelor"}},{"word":"brutal","pos":"adj","definitions":["brutal"],"pronunciation":"/bruˈtal/","forms":{"feminine-singular":"brutală","masculine-plural":"brutali","feminine-neuter-plural":"brutale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"brutal","error-unrecognized-form-feminine-indefinite-singular":"brutală","error-unrecognized-form-indefinite-masculine-plural":"brutali","error-unrecognized-form-feminine-indefinite-neuter-plural":"brutale","definite-error-unrecognized-form-masculine-neuter-singular":"brutalul","definite-error-unrecognized-form-feminine-singular":"brutala","definite-error-unrecognized-form-masculine-plural":"brutalii","definite-error-unrecognized-form-feminine-neuter-plural":"brutalele"}},{"word":"brutalitate","pos":"noun","definitions":["brutality"],"forms":{"plural":"brutalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brutalitate","accusative-definite-nominative-singular":"brutalitatea","accusative-indefinite-nominative-plural":"brutalități","accusative-definite-nominative-plural":"brutalitățile","dative-genitive-indefinite-singular":"brutalități","dative-definite-genitive-singular":"brutalității","dative-genitive-indefinite-plural":"brutalități","dative-definite-genitive-plural":"brutalităților","singular-vocative":"brutalitate","plural-vocative":"brutalităților"}},{"word":"brutaliza","pos":"verb","definitions":["to brutalise"],"forms":{"canonical":"a brutaliza 1st conjugation","present-singular-third-person":"brutalizează","participle-past":"brutalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a brutaliza","gerund":"brutalizând","first-person-indicative-present-singular":"brutalizez","indicative-present-second-person-singular":"brutalizezi","indicative-present-singular-third-person":"brutalizează","first-person-indicative-plural-present":"brutalizăm","indicative-plural-present-second-person":"brutalizați","indicative-plural-present-third-person":"brutalizează","first-person-imperfect-indicative-singular":"brutalizam","imperfect-indicative-second-person-singular":"brutalizai","imperfect-indicative-singular-third-person":"brutaliza","first-person-imperfect-indicative-plural":"brutalizam","imperfect-indicative-plural-second-person":"brutalizați","imperfect-indicative-plural-third-person":"brutalizau","first-person-indicative-perfect-singular":"brutalizai","indicative-perfect-second-person-singular":"brutalizași","indicative-perfect-singular-third-person":"brutaliză","first-person-indicative-perfect-plural":"brutalizarăm","indicative-perfect-plural-second-person":"brutalizarăți","indicative-perfect-plural-third-person":"brutalizară","first-person-indicative-pluperfect-singular":"brutalizasem","indicative-pluperfect-second-person-singular":"brutalizaseși","indicative-pluperfect-singular-third-person":"brutalizase","first-person-indicative-pluperfect-plural":"brutalizaserăm","indicative-pluperfect-plural-second-person":"brutalizaserăți","indicative-pluperfect-plural-third-person":"brutalizaseră","first-person-present-singular-subjunctive":"să brutalizez","present-second-person-singular-subjunctive":"să brutalizezi","present-singular-subjunctive-third-person":"să brutalizeze","first-person-plural-present-subjunctive":"să brutalizăm","plural-present-second-person-subjunctive":"să brutalizați","plural-present-subjunctive-third-person":"să brutalizeze","imperative-second-person-singular":"brutalizează","imperative-plural-second-person":"brutalizați","imperative-negative-second-person-singular":"nu brutaliza","imperative-negative-plural-second-person":"nu brutalizați"}},{"word":"brutalizare","pos":"noun","definitions":["brutalization"],"forms":{"plural":"brutalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"brutalizare","accusative-definite-nominative-singular":"brutalizarea","accusative-indefinite-nominative-plural":"brutalizări","accusative-definite-nominative-plural":"brutalizările","dative-genitive-indefinite-singular":"brutalizări","dative-definite-genitive-singular":"brutalizării","dative-genitive-indefinite-plural":"brutalizări","dative-definite-genitive-plural":"brutalizărilor","singular-vocative":"brutalizare","plural-vocative":"brutalizărilor"}},{"word":"brutalizat","pos":"adj","definitions":["brutalised"],"forms":{"feminine-singular":"brutalizată","masculine-plural":"brutalizați","feminine-neuter-plural":"brutalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"brutalizat","error-unrecognized-form-feminine-indefinite-singular":"brutalizată","error-unrecognized-form-indefinite-masculine-plural":"brutalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"brutalizate","definite-error-unrecognized-form-masculine-neuter-singular":"brutalizatul","definite-error-unrecognized-form-feminine-singular":"brutalizata","definite-error-unrecognized-form-masculine-plural":"brutalizații","definite-error-unrecognized-form-feminine-neuter-plural":"brutalizatele"}},{"word":"brutalizat","pos":"verb","definitions":["past participle of brutaliza"],"forms":{"participle-past":"of brutaliza"}},{"word":"brutar","pos":"noun","definitions":["baker, breadmaker"],"forms":{"plural":"brutari","feminine":"equivalent brutăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"brutar","accusative-definite-nominative-singular":"brutarul","accusative-indefinite-nominative-plural":"brutari","accusative-definite-nominative-plural":"brutarii","dative-genitive-indefinite-singular":"brutar","dative-definite-genitive-singular":"brutarului","dative-genitive-indefinite-plural":"brutari","dative-definite-genitive-plural":"brutarilor","singular-vocative":"brutarule","plural-vocative":"brutarilor"}},{"word":"brutăreasă","pos":"noun","definitions":["female equivalent of brutar"],"forms":{"plural":"brutărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brutăreasă","accusative-definite-nominative-singular":"brutăreasa","accusative-indefinite-nominative-plural":"brutărese","accusative-definite-nominative-plural":"brutăresele","dative-genitive-indefinite-singular":"brutărese","dative-definite-genitive-singular":"brutăresei","dative-genitive-indefinite-plural":"brutărese","dative-definite-genitive-plural":"brutăreselor","singular-vocative":"brutăreasă","plural-vocative":"brutăreselor"}},{"word":"brutărie","pos":"noun","definitions":["bakery","bakeshop, bakehouse"],"forms":{"plural":"brutării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"brutărie","accusative-definite-nominative-singular":"brutăria","accusative-indefinite-nominative-plural":"brutării","accusative-definite-nominative-plural":"brutăriile","dative-genitive-indefinite-singular":"brutării","dative-definite-genitive-singular":"brutăriei","dative-genitive-indefinite-plural":"brutării","dative-definite-genitive-plural":"brutăriilor","singular-vocative":"brutărie","plural-vocative":"brutăriilor"}},{"word":"brutăriță","pos":"noun","definitions":["female equivalent of brutar"],"forms":{"plural":"brutărite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"brutăriță","accusative-definite-nominative-singular":"brutărița","accusative-indefinite-nominative-plural":"brutărite","accusative-definite-nominative-plural":"brutăritele","dative-genitive-indefinite-singular":"brutărite","dative-definite-genitive-singular":"brutăritei","dative-genitive-indefinite-plural":"brutărite","dative-definite-genitive-plural":"brutăritelor","singular-vocative":"brutăriță","plural-vocative":"brutăritelor"}},{"word":"Brutaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Brutaru"}},{"word":"Bruteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bruteanu"}},{"word":"bruto","pos":"adv","definitions":["gross"]},{"word":"bruxeleză","pos":"noun","definitions":["female equivalent of bruxelez"],"forms":{"plural":"bruxeleze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bruxeleză","accusative-definite-nominative-singular":"bruxeleza","accusative-indefinite-nominative-plural":"bruxeleze","accusative-definite-nominative-plural":"bruxelezele","dative-genitive-indefinite-singular":"bruxeleze","dative-definite-genitive-singular":"bruxelezei","dative-genitive-indefinite-plural":"bruxeleze","dative-definite-genitive-plural":"bruxelezelor","singular-vocative":"bruxeleză","plural-vocative":"bruxelezelor"}},{"word":"Bruxelles","pos":"name","definitions":["Brussels (the capital city of Belgium)"]},{"word":"bruxelleză","pos":"noun","definitions":["female equivalent of bruxellez"],"forms":{"plural":"bruxelleze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bruxelleză","accusative-definite-nominative-singular":"bruxelleza","accusative-indefinite-nominative-plural":"bruxelleze","accusative-definite-nominative-plural":"bruxellezele","dative-genitive-indefinite-singular":"bruxelleze","dative-definite-genitive-singular":"bruxellezei","dative-genitive-indefinite-plural":"bruxelleze","dative-definite-genitive-plural":"bruxellezelor","singular-vocative":"bruxelleză","plural-vocative":"bruxellezelor"}},{"word":"BT","pos":"name","definitions":["abbreviation of Botoșani: a county of Romania"]},{"word":"BTS","pos":"noun","definitions":["initialism of boală cu transmitere sexuală (“STD, sexually transmitted disease”)"],"forms":{"plural":"BTS-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"BTS","accusative-definite-nominative-singular":"BTS-ul","accusative-indefinite-nominative-plural":"BTS-uri","accusative-definite-nominative-plural":"BTS-urile","dative-genitive-indefinite-singular":"BTS","dative-definite-genitive-singular":"BTS-ului","dative-genitive-indefinite-plural":"BTS-uri","dative-definite-genitive-plural":"BTS-urilor","singular-vocative":"BTS-ule","plural-vocative":"BTS-urilor"}},{"word":"bu","pos":"intj","definitions":["sound made by an ox","hoot; sound made by an owl"]},{"word":"Bubă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bubă"}},{"word":"bubă","pos":"noun","definitions":["swelling, bump","abscess, boil, lesion","a minor wound or injury, such as a cut"],"forms":{"plural":"bube","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubă","accusative-definite-nominative-singular":"buba","accusative-indefinite-nominative-plural":"bube","accusative-definite-nominative-plural":"bubele","dative-genitive-indefinite-singular":"bube","dative-definite-genitive-singular":"bubei","dative-genitive-indefinite-plural":"bube","dative-definite-genitive-plural":"bubelor","singular-vocative":"bubă","plural-vocative":"bubelor"}},{"word":"bubalină","pos":"noun","definitions":["buffalo"],"forms":{"plural":"bubaline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubalină","accusative-definite-nominative-singular":"bubalina","accusative-indefinite-nominative-plural":"bubaline","accusative-definite-nominative-plural":"bubalinele","dative-genitive-indefinite-singular":"bubaline","dative-definite-genitive-singular":"bubalinei","dative-genitive-indefinite-plural":"bubaline","dative-definite-genitive-plural":"bubalinelor","singular-vocative":"bubalină","plural-vocative":"bubalinelor"}},{"word":"buberic","pos":"noun","definitions":["figwort (Scrophularia nodosa)"],"forms":{"plural":"buberici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buberic","accusative-definite-nominative-singular":"bubericul","accusative-indefinite-nominative-plural":"buberici","accusative-definite-nominative-plural":"bubericii","dative-genitive-indefinite-singular":"buberic","dative-definite-genitive-singular":"bubericului","dative-genitive-indefinite-plural":"buberici","dative-definite-genitive-plural":"bubericilor","singular-vocative":"bubericule","plural-vocative":"bubericilor"}},{"word":"Bubești","pos":"name","definitions":["a village in Arieșeni, Alba County, Romania"],"gender":"m"},{"word":"bubiță","pos":"noun","definitions":["diminutive of bubă; small swelling, abscess"],"forms":{"plural":"bubițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubiță","accusative-definite-nominative-singular":"bubița","accusative-indefinite-nominative-plural":"bubițe","accusative-definite-nominative-plural":"bubițele","dative-genitive-indefinite-singular":"bubițe","dative-definite-genitive-singular":"bubiței","dative-genitive-indefinite-plural":"bubițe","dative-definite-genitive-plural":"bubițelor","singular-vocative":"bubiță","plural-vocative":"bubițelor"}},{"word":"Buboi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buboi"}},{"word":"buboi","pos":"noun","definitions":["furuncle, boil, abscess"],"forms":{"plural":"buboaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buboi","accusative-definite-nominative-singular":"buboiul","accusative-indefinite-nominative-plural":"buboaie","accusative-definite-nominative-plural":"buboaiele","dative-genitive-indefinite-singular":"buboi","dative-definite-genitive-singular":"buboiului","dative-genitive-indefinite-plural":"buboaie","dative-definite-genitive-plural":"buboaielor","singular-vocative":"buboiule","plural-vocative":"buboaielor"}},{"word":"Buboiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buboiu"}},{"word":"bubon","pos":"noun","definitions":["bubo"],"forms":{"plural":"buboane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bubon","accusative-definite-nominative-singular":"bubonul","accusative-indefinite-nominative-plural":"buboane","accusative-definite-nominative-plural":"buboanele","dative-genitive-indefinite-singular":"bubon","dative-definite-genitive-singular":"bubonului","dative-genitive-indefinite-plural":"buboane","dative-definite-genitive-plural":"buboanelor","singular-vocative":"bubonule","plural-vocative":"buboanelor"}},{"word":"bubonic","pos":"adj","definitions":["bubonic"],"forms":{"feminine-singular":"bubonică","masculine-plural":"bubonici","feminine-neuter-plural":"bubonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bubonic","error-unrecognized-form-feminine-indefinite-singular":"bubonică","error-unrecognized-form-indefinite-masculine-plural":"bubonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bubonice","definite-error-unrecognized-form-masculine-neuter-singular":"bubonicul","definite-error-unrecognized-form-feminine-singular":"bubonica","definite-error-unrecognized-form-masculine-plural":"bubonicii","definite-error-unrecognized-form-feminine-neuter-plural":"bubonicele"}},{"word":"bubonică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of bubonic"]},{"word":"bubos","pos":"adj","definitions":["full of swellings"],"forms":{"feminine-singular":"buboasă","masculine-plural":"buboși","feminine-neuter-plural":"buboase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bubos","error-unrecognized-form-feminine-indefinite-singular":"buboasă","error-unrecognized-form-indefinite-masculine-plural":"buboși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buboase","definite-error-unrecognized-form-masculine-neuter-singular":"bubosul","definite-error-unrecognized-form-feminine-singular":"buboasa","definite-error-unrecognized-form-masculine-plural":"buboșii","definite-error-unrecognized-form-feminine-neuter-plural":"buboasele"}},{"word":"Bubosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bubosu"}},{"word":"bubui","pos":"verb","definitions":["to thunder"],"forms":{"canonical":"a bubui 4th conjugation","present-singular-third-person":"bubuie","participle-past":"bubuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bubui","gerund":"bubuind","first-person-indicative-present-singular":"bubui","indicative-present-second-person-singular":"bubui","indicative-present-singular-third-person":"bubuie","first-person-indicative-plural-present":"bubuim","indicative-plural-present-second-person":"bubuiți","indicative-plural-present-third-person":"bubuie","first-person-imperfect-indicative-singular":"bubuiam","imperfect-indicative-second-person-singular":"bubuiai","imperfect-indicative-singular-third-person":"bubuia","first-person-imperfect-indicative-plural":"bubuiam","imperfect-indicative-plural-second-person":"bubuiați","imperfect-indicative-plural-third-person":"bubuiau","first-person-indicative-perfect-singular":"bubuii","indicative-perfect-second-person-singular":"bubuiși","indicative-perfect-singular-third-person":"bubui","first-person-indicative-perfect-plural":"bubuirăm","indicative-perfect-plural-second-person":"bubuirăți","indicative-perfect-plural-third-person":"bubuiră","first-person-indicative-pluperfect-singular":"bubuisem","indicative-pluperfect-second-person-singular":"bubuiseși","indicative-pluperfect-singular-third-person":"bubuise","first-person-indicative-pluperfect-plural":"bubuiserăm","indicative-pluperfect-plural-second-person":"bubuiserăți","indicative-pluperfect-plural-third-person":"bubuiseră","first-person-present-singular-subjunctive":"să bubui","present-second-person-singular-subjunctive":"să bubui","present-singular-subjunctive-third-person":"să bubuie","first-person-plural-present-subjunctive":"să bubuim","plural-present-second-person-subjunctive":"să bubuiți","plural-present-subjunctive-third-person":"să bubuie","imperative-second-person-singular":"bubuie","imperative-plural-second-person":"bubuiți","imperative-negative-second-person-singular":"nu bubui","imperative-negative-plural-second-person":"nu bubuiți"}},{"word":"Bubuianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bubuianu"}},{"word":"Bubuieci","pos":"name","definitions":["a village in Bubuieci, Chișinău, Moldova","a commune of Chișinău, Moldova"],"gender":"m"},{"word":"Bubuioc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bubuioc"}},{"word":"bubuioc","pos":"noun","definitions":["perch"],"forms":{"plural":"bubuioci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bubuioc","accusative-definite-nominative-singular":"bubuiocul","accusative-indefinite-nominative-plural":"bubuioci","accusative-definite-nominative-plural":"bubuiocii","dative-genitive-indefinite-singular":"bubuioc","dative-definite-genitive-singular":"bubuiocului","dative-genitive-indefinite-plural":"bubuioci","dative-definite-genitive-plural":"bubuiocilor","singular-vocative":"bubuiocule","plural-vocative":"bubuiocilor"}},{"word":"bubuire","pos":"noun","definitions":["boom"],"forms":{"plural":"bubuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bubuire","accusative-definite-nominative-singular":"bubuirea","accusative-indefinite-nominative-plural":"bubuiri","accusative-definite-nominative-plural":"bubuirile","dative-genitive-indefinite-singular":"bubuiri","dative-definite-genitive-singular":"bubuirii","dative-genitive-indefinite-plural":"bubuiri","dative-definite-genitive-plural":"bubuirilor","singular-vocative":"bubuire","plural-vocative":"bubuirilor"}},{"word":"bubuit","pos":"noun","definitions":["rumble"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bubuit","accusative-definite-nominative":"bubuitul","dative-genitive-indefinite":"bubuit","dative-definite-genitive":"bubuitului","vocative":"bubuitule"}},{"word":"bubuit","pos":"verb","definitions":["past participle of bubui"],"forms":{"participle-past":"of bubui"}},{"word":"bubuitor","pos":"adj","definitions":["thundering"],"forms":{"feminine-singular":"bubuitoare","masculine-plural":"bubuitori","feminine-neuter-plural":"bubuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bubuitor","error-unrecognized-form-feminine-indefinite-singular":"bubuitoare","error-unrecognized-form-indefinite-masculine-plural":"bubuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bubuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"bubuitorul","definite-error-unrecognized-form-feminine-singular":"bubuitoarea","definite-error-unrecognized-form-masculine-plural":"bubuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"bubuitoarele"}},{"word":"bubuitură","pos":"noun","definitions":["bang"],"pronunciation":"/bu.bu.iˈtu.rə/","forms":{"plural":"bubuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bubuitură","accusative-definite-nominative-singular":"bubuitura","accusative-indefinite-nominative-plural":"bubuituri","accusative-definite-nominative-plural":"bubuiturile","dative-genitive-indefinite-singular":"bubuituri","dative-definite-genitive-singular":"bubuiturii","dative-genitive-indefinite-plural":"bubuituri","dative-definite-genitive-plural":"bubuiturilor","singular-vocative":"bubuitură","plural-vocative":"bubuiturilor"}},{"word":"bubuliță","pos":"noun","definitions":["diminutive of bubă; small boil"],"forms":{"plural":"bubulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubuliță","accusative-definite-nominative-singular":"bubulița","accusative-indefinite-nominative-plural":"bubulițe","accusative-definite-nominative-plural":"bubulițele","dative-genitive-indefinite-singular":"bubulițe","dative-definite-genitive-singular":"bubuliței","dative-genitive-indefinite-plural":"bubulițe","dative-definite-genitive-plural":"bubulițelor","singular-vocative":"bubuliță","plural-vocative":"bubulițelor"}},{"word":"buburos","pos":"adj","definitions":["full of swellings"],"forms":{"feminine-singular":"buburoasă","masculine-plural":"buburoși","feminine-neuter-plural":"buburoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buburos","error-unrecognized-form-feminine-indefinite-singular":"buburoasă","error-unrecognized-form-indefinite-masculine-plural":"buburoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buburoase","definite-error-unrecognized-form-masculine-neuter-singular":"buburosul","definite-error-unrecognized-form-feminine-singular":"buburoasa","definite-error-unrecognized-form-masculine-plural":"buburoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buburoasele"}},{"word":"Buburuz","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buburuz"}},{"word":"buburuză","pos":"noun","definitions":["ladybug"],"forms":{"plural":"buburuze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buburuză","accusative-definite-nominative-singular":"buburuza","accusative-indefinite-nominative-plural":"buburuze","accusative-definite-nominative-plural":"buburuzele","dative-genitive-indefinite-singular":"buburuze","dative-definite-genitive-singular":"buburuzei","dative-genitive-indefinite-plural":"buburuze","dative-definite-genitive-plural":"buburuzelor","singular-vocative":"buburuză","plural-vocative":"buburuzelor"}},{"word":"bubușoară","pos":"noun","definitions":["diminutive of bubă"],"forms":{"plural":"bubușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubușoară","accusative-definite-nominative-singular":"bubușoara","accusative-indefinite-nominative-plural":"bubușoare","accusative-definite-nominative-plural":"bubușoarele","dative-genitive-indefinite-singular":"bubușoare","dative-definite-genitive-singular":"bubușoarei","dative-genitive-indefinite-plural":"bubușoare","dative-definite-genitive-plural":"bubușoarelor","singular-vocative":"bubușoară","plural-vocative":"bubușoarelor"}},{"word":"bubuță","pos":"noun","definitions":["diminutive of bubă"],"forms":{"plural":"bubuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bubuță","accusative-definite-nominative-singular":"bubuța","accusative-indefinite-nominative-plural":"bubuțe","accusative-definite-nominative-plural":"bubuțele","dative-genitive-indefinite-singular":"bubuțe","dative-definite-genitive-singular":"bubuței","dative-genitive-indefinite-plural":"bubuțe","dative-definite-genitive-plural":"bubuțelor","singular-vocative":"bubuță","plural-vocative":"bubuțelor"}},{"word":"buc","pos":"noun","definitions":["chaff"],"pronunciation":"[buk]","forms":{"plural":"buci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buc","accusative-definite-nominative-singular":"bucul","accusative-indefinite-nominative-plural":"buci","accusative-definite-nominative-plural":"bucii","dative-genitive-indefinite-singular":"buc","dative-definite-genitive-singular":"bucului","dative-genitive-indefinite-plural":"buci","dative-definite-genitive-plural":"bucilor","singular-vocative":"bucule","plural-vocative":"bucilor"}},{"word":"buca","pos":"noun","definitions":["definite nominative/accusative singular of bucă"],"pronunciation":"[ˈbu.ka]","gender":"f"},{"word":"Bucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucă"}},{"word":"bucă","pos":"noun","definitions":["asscheek, butt-cheek, buttock","cheek (of the face)"],"pronunciation":"/ˈbu.kə/","forms":{"plural":"buci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bucă","accusative-definite-nominative-singular":"buca","accusative-indefinite-nominative-plural":"buci","accusative-definite-nominative-plural":"bucile","dative-genitive-indefinite-singular":"buci","dative-definite-genitive-singular":"bucii","dative-genitive-indefinite-plural":"buci","dative-definite-genitive-plural":"bucilor","singular-vocative":"bucă","plural-vocative":"bucilor","alternative":"букэ"}},{"word":"bucăcioară","pos":"noun","definitions":["diminutive of bucată"],"forms":{"plural":"bucăcioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucăcioară","accusative-definite-nominative-singular":"bucăcioara","accusative-indefinite-nominative-plural":"bucăcioare","accusative-definite-nominative-plural":"bucăcioarele","dative-genitive-indefinite-singular":"bucăcioare","dative-definite-genitive-singular":"bucăcioarei","dative-genitive-indefinite-plural":"bucăcioare","dative-definite-genitive-plural":"bucăcioarelor","singular-vocative":"bucăcioară","plural-vocative":"bucăcioarelor"}},{"word":"bucal","pos":"adj","definitions":["buccal"],"forms":{"feminine-singular":"bucală","masculine-plural":"bucali","feminine-neuter-plural":"bucale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucal","error-unrecognized-form-feminine-indefinite-singular":"bucală","error-unrecognized-form-indefinite-masculine-plural":"bucali","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucale","definite-error-unrecognized-form-masculine-neuter-singular":"bucalul","definite-error-unrecognized-form-feminine-singular":"bucala","definite-error-unrecognized-form-masculine-plural":"bucalii","definite-error-unrecognized-form-feminine-neuter-plural":"bucalele"}},{"word":"bucălai","pos":"adj","definitions":["fatty"],"forms":{"feminine-singular":"bucălaie","masculine-plural":"bucălai","feminine-neuter-plural":"bucălaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucălai","error-unrecognized-form-feminine-indefinite-singular":"bucălaie","error-unrecognized-form-indefinite-masculine-plural":"bucălai","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucălaie","definite-error-unrecognized-form-masculine-neuter-singular":"bucălaiul","definite-error-unrecognized-form-feminine-singular":"bucălaia","definite-error-unrecognized-form-masculine-plural":"bucălaii","definite-error-unrecognized-form-feminine-neuter-plural":"bucălaiele"}},{"word":"bucălaie","pos":"adj","definitions":["having a black snout"],"forms":{"masculine-plural":"bucălaii","feminine-neuter-plural":"bucălaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucălaie","error-unrecognized-form-feminine-indefinite-singular":"bucălaie","error-unrecognized-form-indefinite-masculine-plural":"bucălaii","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucălaie","definite-error-unrecognized-form-masculine-neuter-singular":"bucălaiele","definite-error-unrecognized-form-feminine-singular":"bucălaia","definite-error-unrecognized-form-masculine-plural":"bucălaiii","definite-error-unrecognized-form-feminine-neuter-plural":"bucălaiele"}},{"word":"bucălat","pos":"adj","definitions":["chubby-faced"],"forms":{"feminine-singular":"bucălată","masculine-plural":"bucălați","feminine-neuter-plural":"bucălate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucălat","error-unrecognized-form-feminine-indefinite-singular":"bucălată","error-unrecognized-form-indefinite-masculine-plural":"bucălați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucălate","definite-error-unrecognized-form-masculine-neuter-singular":"bucălatul","definite-error-unrecognized-form-feminine-singular":"bucălata","definite-error-unrecognized-form-masculine-plural":"bucălații","definite-error-unrecognized-form-feminine-neuter-plural":"bucălatele"}},{"word":"Bucălău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucălău"}},{"word":"bucăliță","pos":"noun","definitions":["diminutive of bucălaie"],"forms":{"plural":"bucălițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucăliță","accusative-definite-nominative-singular":"bucălița","accusative-indefinite-nominative-plural":"bucălițe","accusative-definite-nominative-plural":"bucălițele","dative-genitive-indefinite-singular":"bucălițe","dative-definite-genitive-singular":"bucăliței","dative-genitive-indefinite-plural":"bucălițe","dative-definite-genitive-plural":"bucălițelor","singular-vocative":"bucăliță","plural-vocative":"bucălițelor"}},{"word":"bucăliu","pos":"adj","definitions":["fatty"],"forms":{"feminine-singular":"bucălie","plural":"bucălii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucăliu","error-unrecognized-form-feminine-indefinite-singular":"bucălie","error-unrecognized-form-indefinite-masculine-plural":"bucălii","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucălii","definite-error-unrecognized-form-masculine-neuter-singular":"bucăliul","definite-error-unrecognized-form-feminine-singular":"bucălia","definite-error-unrecognized-form-masculine-plural":"bucăliii","definite-error-unrecognized-form-feminine-neuter-plural":"bucăliile"}},{"word":"Bucan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucan"}},{"word":"Bucaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bucaru"}},{"word":"Bucată","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucată"}},{"word":"bucată","pos":"noun","definitions":["piece, bit, fragment, morsel","(type) of food"],"pronunciation":"/buˈka.tə/","forms":{"plural":"bucăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bucată","accusative-definite-nominative-singular":"bucata","accusative-indefinite-nominative-plural":"bucăți","accusative-definite-nominative-plural":"bucățile","dative-genitive-indefinite-singular":"bucăți","dative-definite-genitive-singular":"bucății","dative-genitive-indefinite-plural":"bucăți","dative-definite-genitive-plural":"bucăților","singular-vocative":"bucată","plural-vocative":"bucăților"}},{"word":"bucătar","pos":"noun","definitions":["cook"],"forms":{"plural":"bucătari","feminine":"equivalent bucătăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucătar","accusative-definite-nominative-singular":"bucătarul","accusative-indefinite-nominative-plural":"bucătari","accusative-definite-nominative-plural":"bucătarii","dative-genitive-indefinite-singular":"bucătar","dative-definite-genitive-singular":"bucătarului","dative-genitive-indefinite-plural":"bucătari","dative-definite-genitive-plural":"bucătarilor","singular-vocative":"bucătarule","plural-vocative":"bucătarilor"}},{"word":"bucătăreasă","pos":"noun","definitions":["cook"],"forms":{"plural":"bucătărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucătăreasă","accusative-definite-nominative-singular":"bucătăreasa","accusative-indefinite-nominative-plural":"bucătărese","accusative-definite-nominative-plural":"bucătăresele","dative-genitive-indefinite-singular":"bucătărese","dative-definite-genitive-singular":"bucătăresei","dative-genitive-indefinite-plural":"bucătărese","dative-definite-genitive-plural":"bucătăreselor","singular-vocative":"bucătăreasă","plural-vocative":"bucătăreselor"}},{"word":"bucătări","pos":"verb","definitions":["to cook"],"forms":{"canonical":"a bucătări 4th conjugation","present-singular-third-person":"bucătărește","participle-past":"bucătărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bucătări","gerund":"bucătărind","first-person-indicative-present-singular":"bucătăresc","indicative-present-second-person-singular":"bucătărești","indicative-present-singular-third-person":"bucătărește","first-person-indicative-plural-present":"bucătărim","indicative-plural-present-second-person":"bucătăriți","indicative-plural-present-third-person":"bucătăresc","first-person-imperfect-indicative-singular":"bucătăream","imperfect-indicative-second-person-singular":"bucătăreai","imperfect-indicative-singular-third-person":"bucătărea","first-person-imperfect-indicative-plural":"bucătăream","imperfect-indicative-plural-second-person":"bucătăreați","imperfect-indicative-plural-third-person":"bucătăreau","first-person-indicative-perfect-singular":"bucătării","indicative-perfect-second-person-singular":"bucătăriși","indicative-perfect-singular-third-person":"bucătări","first-person-indicative-perfect-plural":"bucătărirăm","indicative-perfect-plural-second-person":"bucătărirăți","indicative-perfect-plural-third-person":"bucătăriră","first-person-indicative-pluperfect-singular":"bucătărisem","indicative-pluperfect-second-person-singular":"bucătăriseși","indicative-pluperfect-singular-third-person":"bucătărise","first-person-indicative-pluperfect-plural":"bucătăriserăm","indicative-pluperfect-plural-second-person":"bucătăriserăți","indicative-pluperfect-plural-third-person":"bucătăriseră","first-person-present-singular-subjunctive":"să bucătăresc","present-second-person-singular-subjunctive":"să bucătărești","present-singular-subjunctive-third-person":"să bucătărească","first-person-plural-present-subjunctive":"să bucătărim","plural-present-second-person-subjunctive":"să bucătăriți","plural-present-subjunctive-third-person":"să bucătărească","imperative-second-person-singular":"bucătărește","imperative-plural-second-person":"bucătăriți","imperative-negative-second-person-singular":"nu bucătări","imperative-negative-plural-second-person":"nu bucătăriți"}},{"word":"bucătărie","pos":"noun","definitions":["kitchen (room)","cuisine"],"pronunciation":"/bukətəˈrije/","forms":{"plural":"bucătării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bucătărie","accusative-definite-nominative-singular":"bucătăria","accusative-indefinite-nominative-plural":"bucătării","accusative-definite-nominative-plural":"bucătăriile","dative-genitive-indefinite-singular":"bucătării","dative-definite-genitive-singular":"bucătăriei","dative-genitive-indefinite-plural":"bucătării","dative-definite-genitive-plural":"bucătăriilor","singular-vocative":"bucătărie","plural-vocative":"bucătăriilor"}},{"word":"bucătărie de campanie","pos":"noun","definitions":["field kitchen"],"forms":{"plural":"bucătării de campanie"}},{"word":"bucătărioară","pos":"noun","definitions":["diminutive of bucătărie; small kitchen"],"forms":{"plural":"bucătărioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucătărioară","accusative-definite-nominative-singular":"bucătărioara","accusative-indefinite-nominative-plural":"bucătărioare","accusative-definite-nominative-plural":"bucătărioarele","dative-genitive-indefinite-singular":"bucătărioare","dative-definite-genitive-singular":"bucătărioarei","dative-genitive-indefinite-plural":"bucătărioare","dative-definite-genitive-plural":"bucătărioarelor","singular-vocative":"bucătărioară","plural-vocative":"bucătărioarelor"}},{"word":"Bucătariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bucătariu"}},{"word":"Bucătaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bucătaru"}},{"word":"Bucățea","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"bucățea","pos":"noun","definitions":["diminutive of bucată"],"pronunciation":"/bu.kəˈt͡se̯a/","forms":{"plural":"bucățele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bucățea","accusative-definite-nominative-singular":"bucățeaua","accusative-indefinite-nominative-plural":"bucățele","accusative-definite-nominative-plural":"bucățelele","dative-genitive-indefinite-singular":"bucățele","dative-definite-genitive-singular":"bucățelei","dative-genitive-indefinite-plural":"bucățele","dative-definite-genitive-plural":"bucățelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"bucățel","pos":"noun","definitions":["velvet bentgrass (Agrostis canina)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bucățel","accusative-definite-nominative":"bucățelul","dative-genitive-indefinite":"bucățel","dative-definite-genitive":"bucățelului","vocative":"bucățelule"}},{"word":"bucățeli","pos":"verb","definitions":["to cut or rip to pieces"],"forms":{"canonical":"a bucățeli 4th conjugation","present-singular-third-person":"bucățelește","participle-past":"bucățelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bucățeli","gerund":"bucățelind","first-person-indicative-present-singular":"bucățelesc","indicative-present-second-person-singular":"bucățelești","indicative-present-singular-third-person":"bucățelește","first-person-indicative-plural-present":"bucățelim","indicative-plural-present-second-person":"bucățeliți","indicative-plural-present-third-person":"bucățelesc","first-person-imperfect-indicative-singular":"bucățeleam","imperfect-indicative-second-person-singular":"bucățeleai","imperfect-indicative-singular-third-person":"bucățelea","first-person-imperfect-indicative-plural":"bucățeleam","imperfect-indicative-plural-second-person":"bucățeleați","imperfect-indicative-plural-third-person":"bucățeleau","first-person-indicative-perfect-singular":"bucățelii","indicative-perfect-second-person-singular":"bucățeliși","indicative-perfect-singular-third-person":"bucățeli","first-person-indicative-perfect-plural":"bucățelirăm","indicative-perfect-plural-second-person":"bucățelirăți","indicative-perfect-plural-third-person":"bucățeliră","first-person-indicative-pluperfect-singular":"bucățelisem","indicative-pluperfect-second-person-singular":"bucățeliseși","indicative-pluperfect-singular-third-person":"bucățelise","first-person-indicative-pluperfect-plural":"bucățeliserăm","indicative-pluperfect-plural-second-person":"bucățeliserăți","indicative-pluperfect-plural-third-person":"bucățeliseră","first-person-present-singular-subjunctive":"să bucățelesc","present-second-person-singular-subjunctive":"să bucățelești","present-singular-subjunctive-third-person":"să bucățelească","first-person-plural-present-subjunctive":"să bucățelim","plural-present-second-person-subjunctive":"să bucățeliți","plural-present-subjunctive-third-person":"să bucățelească","imperative-second-person-singular":"bucățelește","imperative-plural-second-person":"bucățeliți","imperative-negative-second-person-singular":"nu bucățeli","imperative-negative-plural-second-person":"nu bucățeliți"}},{"word":"bucăți","pos":"verb","definitions":["to divide in pieces"],"pronunciation":"/bu.kəˈt͡si/","forms":{"canonical":"a bucăți 4th conjugation","present-singular-third-person":"bucățește","participle-past":"bucățit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bucăți","gerund":"bucățind","first-person-indicative-present-singular":"bucățesc","indicative-present-second-person-singular":"bucățești","indicative-present-singular-third-person":"bucățește","first-person-indicative-plural-present":"bucățim","indicative-plural-present-second-person":"bucățiți","indicative-plural-present-third-person":"bucățesc","first-person-imperfect-indicative-singular":"bucățeam","imperfect-indicative-second-person-singular":"bucățeai","imperfect-indicative-singular-third-person":"bucățea","first-person-imperfect-indicative-plural":"bucățeam","imperfect-indicative-plural-second-person":"bucățeați","imperfect-indicative-plural-third-person":"bucățeau","first-person-indicative-perfect-singular":"bucății","indicative-perfect-second-person-singular":"bucățiși","indicative-perfect-singular-third-person":"bucăți","first-person-indicative-perfect-plural":"bucățirăm","indicative-perfect-plural-second-person":"bucățirăți","indicative-perfect-plural-third-person":"bucățiră","first-person-indicative-pluperfect-singular":"bucățisem","indicative-pluperfect-second-person-singular":"bucățiseși","indicative-pluperfect-singular-third-person":"bucățise","first-person-indicative-pluperfect-plural":"bucățiserăm","indicative-pluperfect-plural-second-person":"bucățiserăți","indicative-pluperfect-plural-third-person":"bucățiseră","first-person-present-singular-subjunctive":"să bucățesc","present-second-person-singular-subjunctive":"să bucățești","present-singular-subjunctive-third-person":"să bucățească","first-person-plural-present-subjunctive":"să bucățim","plural-present-second-person-subjunctive":"să bucățiți","plural-present-subjunctive-third-person":"să bucățească","imperative-second-person-singular":"bucățește","imperative-plural-second-person":"bucățiți","imperative-negative-second-person-singular":"nu bucăți","imperative-negative-plural-second-person":"nu bucățiți"}},{"word":"bucăți","pos":"noun","definitions":["plural of bucată"],"pronunciation":"/buˈkət͡sʲ/","gender":"f-p"},{"word":"Bucățică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucățică"}},{"word":"bucățică","pos":"noun","definitions":["diminutive of bucată; a small piece, bit; fragment, morsel, smidgen"],"forms":{"plural":"bucățele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucățică","accusative-definite-nominative-singular":"bucățica","accusative-indefinite-nominative-plural":"bucățele","accusative-definite-nominative-plural":"bucățelele","dative-genitive-indefinite-singular":"bucățele","dative-definite-genitive-singular":"bucățelei","dative-genitive-indefinite-plural":"bucățele","dative-definite-genitive-plural":"bucățelelor","singular-vocative":"bucățică","plural-vocative":"bucățelelor","alternative":"bucățea"}},{"word":"bucățoi","pos":"noun","definitions":["a large piece"],"forms":{"plural":"bucățoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucățoi","accusative-definite-nominative-singular":"bucățoiul","accusative-indefinite-nominative-plural":"bucățoaie","accusative-definite-nominative-plural":"bucățoaiele","dative-genitive-indefinite-singular":"bucățoi","dative-definite-genitive-singular":"bucățoiului","dative-genitive-indefinite-plural":"bucățoaie","dative-definite-genitive-plural":"bucățoaielor","singular-vocative":"bucățoiule","plural-vocative":"bucățoaielor"}},{"word":"Bucătură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucătură"}},{"word":"bucătură","pos":"noun","definitions":["mouthful"],"forms":{"plural":"bucături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bucătură","accusative-definite-nominative-singular":"bucătura","accusative-indefinite-nominative-plural":"bucături","accusative-definite-nominative-plural":"bucăturile","dative-genitive-indefinite-singular":"bucături","dative-definite-genitive-singular":"bucăturii","dative-genitive-indefinite-plural":"bucături","dative-definite-genitive-plural":"bucăturilor","singular-vocative":"bucătură","plural-vocative":"bucăturilor"}},{"word":"bucăturică","pos":"noun","definitions":["diminutive of bucătură"],"forms":{"plural":"bucăturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bucăturică","accusative-definite-nominative-singular":"bucăturica","accusative-indefinite-nominative-plural":"bucăturici","accusative-definite-nominative-plural":"bucăturicile","dative-genitive-indefinite-singular":"bucăturici","dative-definite-genitive-singular":"bucăturicii","dative-genitive-indefinite-plural":"bucăturici","dative-definite-genitive-plural":"bucăturicilor","singular-vocative":"bucăturică","plural-vocative":"bucăturicilor"}},{"word":"bucăturiță","pos":"noun","definitions":["diminutive of bucătură"],"forms":{"plural":"bucăturițăe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucăturiță","accusative-definite-nominative-singular":"bucăturița","accusative-indefinite-nominative-plural":"bucăturițăe","accusative-definite-nominative-plural":"bucăturițăele","dative-genitive-indefinite-singular":"bucăturițăe","dative-definite-genitive-singular":"bucăturițăei","dative-genitive-indefinite-plural":"bucăturițăe","dative-definite-genitive-plural":"bucăturițăelor","singular-vocative":"bucăturiță","plural-vocative":"bucăturițăelor"}},{"word":"buccea","pos":"noun","definitions":["obsolete form of bucea"],"forms":{"plural":"buccele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"buccea","accusative-definite-nominative-singular":"bucceaua","accusative-indefinite-nominative-plural":"buccele","accusative-definite-nominative-plural":"buccelele","dative-genitive-indefinite-singular":"buccele","dative-definite-genitive-singular":"buccelei","dative-genitive-indefinite-plural":"buccele","dative-definite-genitive-plural":"buccelelor","singular-vocative":"buccea","plural-vocative":"buccelelor"}},{"word":"buccinator","pos":"noun","definitions":["buccinator"],"forms":{"plural":"buccinatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buccinator","accusative-definite-nominative-singular":"buccinatorul","accusative-indefinite-nominative-plural":"buccinatori","accusative-definite-nominative-plural":"buccinatorii","dative-genitive-indefinite-singular":"buccinator","dative-definite-genitive-singular":"buccinatorului","dative-genitive-indefinite-plural":"buccinatori","dative-definite-genitive-plural":"buccinatorilor","singular-vocative":"buccinatorule","plural-vocative":"buccinatorilor"}},{"word":"bucciu","pos":"adj","definitions":["obsolete form of bocciu"],"forms":{"feminine-singular":"buccie","plural":"buccii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucciu","error-unrecognized-form-feminine-indefinite-singular":"buccie","error-unrecognized-form-indefinite-masculine-plural":"buccii","error-unrecognized-form-feminine-indefinite-neuter-plural":"buccii","definite-error-unrecognized-form-masculine-neuter-singular":"bucciul","definite-error-unrecognized-form-feminine-singular":"buccia","definite-error-unrecognized-form-masculine-plural":"bucciii","definite-error-unrecognized-form-feminine-neuter-plural":"bucciile"}},{"word":"bucea","pos":"noun","definitions":["metal lining inside the hub of a wheel on a vehicle","coupler"],"forms":{"plural":"bucele","alternative":"buccea"}},{"word":"Buceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buceanu"}},{"word":"Buceava-Șoimuș","pos":"name","definitions":["a village in Brazii, Arad County, Romania"],"gender":"f"},{"word":"Buceloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buceloiu"}},{"word":"bucentaur","pos":"noun","definitions":["bucentaur"],"forms":{"plural":"bucentauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucentaur","accusative-definite-nominative-singular":"bucentaurul","accusative-indefinite-nominative-plural":"bucentauri","accusative-definite-nominative-plural":"bucentaurii","dative-genitive-indefinite-singular":"bucentaur","dative-definite-genitive-singular":"bucentaurului","dative-genitive-indefinite-plural":"bucentauri","dative-definite-genitive-plural":"bucentaurilor","singular-vocative":"bucentaurule","plural-vocative":"bucentaurilor"}},{"word":"Bucerdea Grânoasă","pos":"name","definitions":["a commune of Alba County, Romania","a village in Bucerdea Grânoasă, Alba County, Romania"],"gender":"f","forms":{"alternative":"Bucerdea Grînoasă"}},{"word":"Bucerdea Vânoasă","pos":"name","definitions":["a village in Ighiu, Alba County, Romania"],"gender":"f","forms":{"alternative":"Bucerdea Vînoasă"}},{"word":"Buceș-Vulcan","pos":"name","definitions":["a village in Buceș, Hunedoara County, Romania"],"gender":"f"},{"word":"Bucești","pos":"name","definitions":["a village in Ivești, Galați County, Romania"],"gender":"m"},{"word":"bucfăraș","pos":"noun","definitions":["letter"],"forms":{"plural":"bucfărașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucfăraș","accusative-definite-nominative-singular":"bucfărașul","accusative-indefinite-nominative-plural":"bucfărașe","accusative-definite-nominative-plural":"bucfărașele","dative-genitive-indefinite-singular":"bucfăraș","dative-definite-genitive-singular":"bucfărașului","dative-genitive-indefinite-plural":"bucfărașe","dative-definite-genitive-plural":"bucfărașelor","singular-vocative":"bucfărașule","plural-vocative":"bucfărașelor"}},{"word":"bucfărel","pos":"noun","definitions":["letter"],"forms":{"plural":"bucfărele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucfărel","accusative-definite-nominative-singular":"bucfărelul","accusative-indefinite-nominative-plural":"bucfărele","accusative-definite-nominative-plural":"bucfărelele","dative-genitive-indefinite-singular":"bucfărel","dative-definite-genitive-singular":"bucfărelului","dative-genitive-indefinite-plural":"bucfărele","dative-definite-genitive-plural":"bucfărelelor","singular-vocative":"bucfărelule","plural-vocative":"bucfărelelor"}},{"word":"Buche","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buche"}},{"word":"buche","pos":"noun","definitions":["letter"],"forms":{"plural":"buchi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buche","accusative-definite-nominative-singular":"buchea","accusative-indefinite-nominative-plural":"buchi","accusative-definite-nominative-plural":"buchile","dative-genitive-indefinite-singular":"buchi","dative-definite-genitive-singular":"buchii","dative-genitive-indefinite-plural":"buchi","dative-definite-genitive-plural":"buchilor","singular-vocative":"buche","plural-vocative":"buchilor"}},{"word":"buchea","pos":"noun","definitions":["obsolete form of buche"],"forms":{"plural":"buchele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"buchea","accusative-definite-nominative-singular":"bucheaua","accusative-indefinite-nominative-plural":"buchele","accusative-definite-nominative-plural":"buchelele","dative-genitive-indefinite-singular":"buchele","dative-definite-genitive-singular":"buchelei","dative-genitive-indefinite-plural":"buchele","dative-definite-genitive-plural":"buchelelor","singular-vocative":"buchea","plural-vocative":"buchelelor"}},{"word":"buchelar","pos":"noun","definitions":["wallet"],"forms":{"plural":"buchelare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buchelar","accusative-definite-nominative-singular":"buchelarul","accusative-indefinite-nominative-plural":"buchelare","accusative-definite-nominative-plural":"buchelarele","dative-genitive-indefinite-singular":"buchelar","dative-definite-genitive-singular":"buchelarului","dative-genitive-indefinite-plural":"buchelare","dative-definite-genitive-plural":"buchelarelor","singular-vocative":"buchelarule","plural-vocative":"buchelarelor"}},{"word":"bucher","pos":"noun","definitions":["alphabetarian"],"forms":{"plural":"bucheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucher","accusative-definite-nominative-singular":"bucherul","accusative-indefinite-nominative-plural":"bucheri","accusative-definite-nominative-plural":"bucherii","dative-genitive-indefinite-singular":"bucher","dative-definite-genitive-singular":"bucherului","dative-genitive-indefinite-plural":"bucheri","dative-definite-genitive-plural":"bucherilor","singular-vocative":"bucherule","plural-vocative":"bucherilor"}},{"word":"buchereală","pos":"noun","definitions":["cramming"],"forms":{"plural":"buchereli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"buchereală","accusative-definite-nominative-singular":"buchereala","accusative-indefinite-nominative-plural":"buchereli","accusative-definite-nominative-plural":"bucherelile","dative-genitive-indefinite-singular":"buchereli","dative-definite-genitive-singular":"bucherelii","dative-genitive-indefinite-plural":"buchereli","dative-definite-genitive-plural":"bucherelilor","singular-vocative":"buchereală","plural-vocative":"bucherelilor"}},{"word":"bucheresc","pos":"adj","definitions":["old-fashioned"],"forms":{"feminine-singular":"bucherească","plural":"bucherești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucheresc","error-unrecognized-form-feminine-indefinite-singular":"bucherească","error-unrecognized-form-indefinite-masculine-plural":"bucherești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucherești","definite-error-unrecognized-form-masculine-neuter-singular":"bucherescul","definite-error-unrecognized-form-feminine-singular":"buchereasca","definite-error-unrecognized-form-masculine-plural":"buchereștii","definite-error-unrecognized-form-feminine-neuter-plural":"buchereștile"}},{"word":"bucherie","pos":"noun","definitions":["basic literacy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bucherie","accusative-definite-nominative":"bucheria","dative-genitive-indefinite":"bucherii","dative-definite-genitive":"bucheriei","vocative":"bucherie"}},{"word":"bucherire","pos":"noun","definitions":["reading syllable by syllable"],"forms":{"plural":"bucheriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bucherire","accusative-definite-nominative-singular":"bucherirea","accusative-indefinite-nominative-plural":"bucheriri","accusative-definite-nominative-plural":"bucheririle","dative-genitive-indefinite-singular":"bucheriri","dative-definite-genitive-singular":"bucheririi","dative-genitive-indefinite-plural":"bucheriri","dative-definite-genitive-plural":"bucheririlor","singular-vocative":"bucherire","plural-vocative":"bucheririlor"}},{"word":"Bucheru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucheru"}},{"word":"buchet","pos":"noun","definitions":["bouquet"],"forms":{"plural":"buchete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buchet","accusative-definite-nominative-singular":"buchetul","accusative-indefinite-nominative-plural":"buchete","accusative-definite-nominative-plural":"buchetele","dative-genitive-indefinite-singular":"buchet","dative-definite-genitive-singular":"buchetului","dative-genitive-indefinite-plural":"buchete","dative-definite-genitive-plural":"buchetelor","singular-vocative":"buchetule","plural-vocative":"buchetelor"}},{"word":"buchețel","pos":"noun","definitions":["diminutive of buchet; small bouquet"],"forms":{"plural":"buchețele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buchețel","accusative-definite-nominative-singular":"buchețelul","accusative-indefinite-nominative-plural":"buchețele","accusative-definite-nominative-plural":"buchețelele","dative-genitive-indefinite-singular":"buchețel","dative-definite-genitive-singular":"buchețelului","dative-genitive-indefinite-plural":"buchețele","dative-definite-genitive-plural":"buchețelelor","singular-vocative":"buchețelule","plural-vocative":"buchețelelor"}},{"word":"buchetieră","pos":"noun","definitions":["flower girl"],"forms":{"plural":"buchetiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buchetieră","accusative-definite-nominative-singular":"buchetiera","accusative-indefinite-nominative-plural":"buchetiere","accusative-definite-nominative-plural":"buchetierele","dative-genitive-indefinite-singular":"buchetiere","dative-definite-genitive-singular":"buchetierei","dative-genitive-indefinite-plural":"buchetiere","dative-definite-genitive-plural":"buchetierelor","singular-vocative":"buchetieră","plural-vocative":"buchetierelor"}},{"word":"Buchila","pos":"name","definitions":["a village in Nicolae Bălcescu, Bacău County, Romania"],"gender":"f"},{"word":"Buchilași","pos":"name","definitions":["a village in Râfov, Prahova County, Romania"],"gender":"m"},{"word":"buchinist","pos":"noun","definitions":["bookseller"],"forms":{"plural":"buchiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buchinist","accusative-definite-nominative-singular":"buchinistul","accusative-indefinite-nominative-plural":"buchiniști","accusative-definite-nominative-plural":"buchiniștii","dative-genitive-indefinite-singular":"buchinist","dative-definite-genitive-singular":"buchinistului","dative-genitive-indefinite-plural":"buchiniști","dative-definite-genitive-plural":"buchiniștilor","singular-vocative":"buchinistule","plural-vocative":"buchiniștilor"}},{"word":"buchisa","pos":"verb","definitions":["alternative form of buchisi"],"forms":{"canonical":"a buchisa 1st conjugation","present-singular-third-person":"buchisează","participle-past":"buchisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a buchisa","gerund":"buchisând","first-person-indicative-present-singular":"buchisez","indicative-present-second-person-singular":"buchisezi","indicative-present-singular-third-person":"buchisează","first-person-indicative-plural-present":"buchisăm","indicative-plural-present-second-person":"buchisați","indicative-plural-present-third-person":"buchisează","first-person-imperfect-indicative-singular":"buchisam","imperfect-indicative-second-person-singular":"buchisai","imperfect-indicative-singular-third-person":"buchisa","first-person-imperfect-indicative-plural":"buchisam","imperfect-indicative-plural-second-person":"buchisați","imperfect-indicative-plural-third-person":"buchisau","first-person-indicative-perfect-singular":"buchisai","indicative-perfect-second-person-singular":"buchisași","indicative-perfect-singular-third-person":"buchisă","first-person-indicative-perfect-plural":"buchisarăm","indicative-perfect-plural-second-person":"buchisarăți","indicative-perfect-plural-third-person":"buchisară","first-person-indicative-pluperfect-singular":"buchisasem","indicative-pluperfect-second-person-singular":"buchisaseși","indicative-pluperfect-singular-third-person":"buchisase","first-person-indicative-pluperfect-plural":"buchisaserăm","indicative-pluperfect-plural-second-person":"buchisaserăți","indicative-pluperfect-plural-third-person":"buchisaseră","first-person-present-singular-subjunctive":"să buchisez","present-second-person-singular-subjunctive":"să buchisezi","present-singular-subjunctive-third-person":"să buchiseze","first-person-plural-present-subjunctive":"să buchisăm","plural-present-second-person-subjunctive":"să buchisați","plural-present-subjunctive-third-person":"să buchiseze","imperative-second-person-singular":"buchisează","imperative-plural-second-person":"buchisați","imperative-negative-second-person-singular":"nu buchisa","imperative-negative-plural-second-person":"nu buchisați"}},{"word":"buchiseală","pos":"noun","definitions":["swotting"],"forms":{"plural":"buchiseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"buchiseală","accusative-definite-nominative-singular":"buchiseala","accusative-indefinite-nominative-plural":"buchiseli","accusative-definite-nominative-plural":"buchiselile","dative-genitive-indefinite-singular":"buchiseli","dative-definite-genitive-singular":"buchiselii","dative-genitive-indefinite-plural":"buchiseli","dative-definite-genitive-plural":"buchiselilor","singular-vocative":"buchiseală","plural-vocative":"buchiselilor"}},{"word":"buchisi","pos":"verb","definitions":["to do something painstakingly"],"forms":{"canonical":"a buchisi 4th conjugation","present-singular-third-person":"buchisește","participle-past":"buchisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buchisi","gerund":"buchisind","first-person-indicative-present-singular":"buchisesc","indicative-present-second-person-singular":"buchisești","indicative-present-singular-third-person":"buchisește","first-person-indicative-plural-present":"buchisim","indicative-plural-present-second-person":"buchisiți","indicative-plural-present-third-person":"buchisesc","first-person-imperfect-indicative-singular":"buchiseam","imperfect-indicative-second-person-singular":"buchiseai","imperfect-indicative-singular-third-person":"buchisea","first-person-imperfect-indicative-plural":"buchiseam","imperfect-indicative-plural-second-person":"buchiseați","imperfect-indicative-plural-third-person":"buchiseau","first-person-indicative-perfect-singular":"buchisii","indicative-perfect-second-person-singular":"buchisiși","indicative-perfect-singular-third-person":"buchisi","first-person-indicative-perfect-plural":"buchisirăm","indicative-perfect-plural-second-person":"buchisirăți","indicative-perfect-plural-third-person":"buchisiră","first-person-indicative-pluperfect-singular":"buchisisem","indicative-pluperfect-second-person-singular":"buchisiseși","indicative-pluperfect-singular-third-person":"buchisise","first-person-indicative-pluperfect-plural":"buchisiserăm","indicative-pluperfect-plural-second-person":"buchisiserăți","indicative-pluperfect-plural-third-person":"buchisiseră","first-person-present-singular-subjunctive":"să buchisesc","present-second-person-singular-subjunctive":"să buchisești","present-singular-subjunctive-third-person":"să buchisească","first-person-plural-present-subjunctive":"să buchisim","plural-present-second-person-subjunctive":"să buchisiți","plural-present-subjunctive-third-person":"să buchisească","imperative-second-person-singular":"buchisește","imperative-plural-second-person":"buchisiți","imperative-negative-second-person-singular":"nu buchisi","imperative-negative-plural-second-person":"nu buchisiți"}},{"word":"buci","pos":"noun","definitions":["plural of bucă"],"pronunciation":"[butʃʲ]","gender":"f"},{"word":"buciardă","pos":"noun","definitions":["boucharde"],"forms":{"plural":"buciarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buciardă","accusative-definite-nominative-singular":"buciarda","accusative-indefinite-nominative-plural":"buciarde","accusative-definite-nominative-plural":"buciardele","dative-genitive-indefinite-singular":"buciarde","dative-definite-genitive-singular":"buciardei","dative-genitive-indefinite-plural":"buciarde","dative-definite-genitive-plural":"buciardelor","singular-vocative":"buciardă","plural-vocative":"buciardelor"}},{"word":"Bucicani","pos":"name","definitions":["a village in Predești, Dolj County, Romania"],"gender":"m"},{"word":"bucile","pos":"noun","definitions":["definite nominative/accusative plural of bucă"],"pronunciation":"/ˈbu.t͡ʃi.le/","gender":"f-p"},{"word":"Bucin","pos":"name","definitions":["a village in Joseni, Harghita County, Romania","a village in Praid, Harghita County, Romania"],"gender":"m"},{"word":"bucin","pos":"noun","definitions":["alternative form of bucium"],"forms":{"plural":"bucine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucin","accusative-definite-nominative-singular":"bucinul","accusative-indefinite-nominative-plural":"bucine","accusative-definite-nominative-plural":"bucinele","dative-genitive-indefinite-singular":"bucin","dative-definite-genitive-singular":"bucinului","dative-genitive-indefinite-plural":"bucine","dative-definite-genitive-plural":"bucinelor","singular-vocative":"bucinule","plural-vocative":"bucinelor"}},{"word":"bucinar","pos":"noun","definitions":["chimney sweep"],"forms":{"plural":"bucinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucinar","accusative-definite-nominative-singular":"bucinarul","accusative-indefinite-nominative-plural":"bucinari","accusative-definite-nominative-plural":"bucinarii","dative-genitive-indefinite-singular":"bucinar","dative-definite-genitive-singular":"bucinarului","dative-genitive-indefinite-plural":"bucinari","dative-definite-genitive-plural":"bucinarilor","singular-vocative":"bucinarule","plural-vocative":"bucinarilor"}},{"word":"buciniș","pos":"noun","definitions":["hemlock"],"forms":{"plural":"buciniși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buciniș","accusative-definite-nominative-singular":"bucinișul","accusative-indefinite-nominative-plural":"buciniși","accusative-definite-nominative-plural":"bucinișii","dative-genitive-indefinite-singular":"buciniș","dative-definite-genitive-singular":"bucinișului","dative-genitive-indefinite-plural":"buciniși","dative-definite-genitive-plural":"bucinișilor","singular-vocative":"bucinișule","plural-vocative":"bucinișilor"}},{"word":"Bucinișu","pos":"name","definitions":["a commune of Olt County, Romania","a village in Bucinișu, Olt County, Romania"],"gender":"m"},{"word":"Bucinișu Mic","pos":"name","definitions":["a village in Bucinișu, Olt County, Romania"],"gender":"m"},{"word":"buciuc","pos":"noun","definitions":["an Ottoman flag"],"forms":{"plural":"buciucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"buciuc","accusative-definite-nominative-singular":"buciucul","accusative-indefinite-nominative-plural":"buciucuri","accusative-definite-nominative-plural":"buciucurile","dative-genitive-indefinite-singular":"buciuc","dative-definite-genitive-singular":"buciucului","dative-genitive-indefinite-plural":"buciucuri","dative-definite-genitive-plural":"buciucurilor","singular-vocative":"buciucule","plural-vocative":"buciucurilor"}},{"word":"buciucaș","pos":"noun","definitions":["flagbearer"],"forms":{"plural":"buciucași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buciucaș","accusative-definite-nominative-singular":"buciucașul","accusative-indefinite-nominative-plural":"buciucași","accusative-definite-nominative-plural":"buciucașii","dative-genitive-indefinite-singular":"buciucaș","dative-definite-genitive-singular":"buciucașului","dative-genitive-indefinite-plural":"buciucași","dative-definite-genitive-plural":"buciucașilor","singular-vocative":"buciucașule","plural-vocative":"buciucașilor"}},{"word":"Bucium","pos":"name","definitions":["a commune of Alba County, Romania","a village in Bucium, Alba County, Romania","a village in Ceica, Bihor County, Romania","a village in Șinca, Brașov County, Romania","a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"bucium","pos":"noun","definitions":["horn, trumpet, alphorn","stump, trunk, bole, block, stock (of a tree)"],"forms":{"plural":"buciume","alternative":"bucin"}},{"word":"Bucium-Orlea","pos":"name","definitions":["a village in Sântămăria-Orlea, Hunedoara County, Romania"],"gender":"f"},{"word":"Bucium-Sat","pos":"name","definitions":["a village in Bucium, Alba County, Romania"],"gender":"m"},{"word":"buciuma","pos":"verb","definitions":["to blow the horn","to announce"],"forms":{"canonical":"a buciuma 1st conjugation","present-singular-third-person":"buciumă","participle-past":"buciumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a buciuma","gerund":"buciumând","first-person-indicative-present-singular":"bucium","indicative-present-second-person-singular":"buciumi","indicative-present-singular-third-person":"buciumă","first-person-indicative-plural-present":"buciumăm","indicative-plural-present-second-person":"buciumați","indicative-plural-present-third-person":"buciumă","first-person-imperfect-indicative-singular":"buciumam","imperfect-indicative-second-person-singular":"buciumai","imperfect-indicative-singular-third-person":"buciuma","first-person-imperfect-indicative-plural":"buciumam","imperfect-indicative-plural-second-person":"buciumați","imperfect-indicative-plural-third-person":"buciumau","first-person-indicative-perfect-singular":"buciumai","indicative-perfect-second-person-singular":"buciumași","indicative-perfect-singular-third-person":"buciumă","first-person-indicative-perfect-plural":"buciumarăm","indicative-perfect-plural-second-person":"buciumarăți","indicative-perfect-plural-third-person":"buciumară","first-person-indicative-pluperfect-singular":"buciumasem","indicative-pluperfect-second-person-singular":"buciumaseși","indicative-pluperfect-singular-third-person":"buciumase","first-person-indicative-pluperfect-plural":"buciumaserăm","indicative-pluperfect-plural-second-person":"buciumaserăți","indicative-pluperfect-plural-third-person":"buciumaseră","first-person-present-singular-subjunctive":"să bucium","present-second-person-singular-subjunctive":"să buciumi","present-singular-subjunctive-third-person":"să buciume","first-person-plural-present-subjunctive":"să buciumăm","plural-present-second-person-subjunctive":"să buciumați","plural-present-subjunctive-third-person":"să buciume","imperative-second-person-singular":"buciumă","imperative-plural-second-person":"buciumați","imperative-negative-second-person-singular":"nu buciuma","imperative-negative-plural-second-person":"nu buciumați","alternative-archaic":"bucina"}},{"word":"Buciuman","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buciuman"}},{"word":"Buciumanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buciumanu"}},{"word":"buciumare","pos":"noun","definitions":["blowing a horn"],"forms":{"plural":"buciumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buciumare","accusative-definite-nominative-singular":"buciumarea","accusative-indefinite-nominative-plural":"buciumări","accusative-definite-nominative-plural":"buciumările","dative-genitive-indefinite-singular":"buciumări","dative-definite-genitive-singular":"buciumării","dative-genitive-indefinite-plural":"buciumări","dative-definite-genitive-plural":"buciumărilor","singular-vocative":"buciumare","plural-vocative":"buciumărilor"}},{"word":"Buciumaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buciumaș"}},{"word":"buciumaș","pos":"noun","definitions":["trumpeter"],"forms":{"plural":"buciumași","feminine":"equivalent buciumașă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buciumaș","accusative-definite-nominative-singular":"buciumașul","accusative-indefinite-nominative-plural":"buciumași","accusative-definite-nominative-plural":"buciumașii","dative-genitive-indefinite-singular":"buciumaș","dative-definite-genitive-singular":"buciumașului","dative-genitive-indefinite-plural":"buciumași","dative-definite-genitive-plural":"buciumașilor","singular-vocative":"buciumașule","plural-vocative":"buciumașilor"}},{"word":"buciumașă","pos":"noun","definitions":["female equivalent of buciumaș"],"forms":{"plural":"buciumașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buciumașă","accusative-definite-nominative-singular":"buciumașa","accusative-indefinite-nominative-plural":"buciumașe","accusative-definite-nominative-plural":"buciumașele","dative-genitive-indefinite-singular":"buciumașe","dative-definite-genitive-singular":"buciumașei","dative-genitive-indefinite-plural":"buciumașe","dative-definite-genitive-plural":"buciumașelor","singular-vocative":"buciumașă","plural-vocative":"buciumașelor"}},{"word":"Buciumean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buciumean"}},{"word":"Buciumeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buciumeanu"}},{"word":"buciumel","pos":"noun","definitions":["diminutive of bucium"],"forms":{"plural":"buciumei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buciumel","accusative-definite-nominative-singular":"buciumelul","accusative-indefinite-nominative-plural":"buciumei","accusative-definite-nominative-plural":"buciumeii","dative-genitive-indefinite-singular":"buciumel","dative-definite-genitive-singular":"buciumelului","dative-genitive-indefinite-plural":"buciumei","dative-definite-genitive-plural":"buciumeilor","singular-vocative":"buciumelule","plural-vocative":"buciumeilor"}},{"word":"Buciumeneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buciumeneanu"}},{"word":"Buciumeni","pos":"name","definitions":["a village in Budești, Călărași County, Romania","a commune of Dâmbovița County, Romania","a village in Buciumeni, Dâmbovița County, Romania","a commune of Galați County, Romania","a village in Buciumeni, Galați County, Romania"],"gender":"m"},{"word":"Buciumi","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Buciumi, Bacău County, Romania","a locality in Șomcuta Mare, Maramureș County, Romania","a commune of Sălaj County, Romania","a village in Buciumi, Sălaj County, Romania"],"gender":"m"},{"word":"Buciușca","pos":"name","definitions":["a village in Saharna Nouă, Rezina Raion, Moldova"],"gender":"f"},{"word":"bucla","pos":"verb","definitions":["to loop"],"forms":{"canonical":"a bucla 1st conjugation","present-singular-third-person":"buclează","participle-past":"buclat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bucla","gerund":"buclând","first-person-indicative-present-singular":"buclez","indicative-present-second-person-singular":"buclezi","indicative-present-singular-third-person":"buclează","first-person-indicative-plural-present":"buclăm","indicative-plural-present-second-person":"buclați","indicative-plural-present-third-person":"buclează","first-person-imperfect-indicative-singular":"buclam","imperfect-indicative-second-person-singular":"buclai","imperfect-indicative-singular-third-person":"bucla","first-person-imperfect-indicative-plural":"buclam","imperfect-indicative-plural-second-person":"buclați","imperfect-indicative-plural-third-person":"buclau","first-person-indicative-perfect-singular":"buclai","indicative-perfect-second-person-singular":"buclași","indicative-perfect-singular-third-person":"buclă","first-person-indicative-perfect-plural":"buclarăm","indicative-perfect-plural-second-person":"buclarăți","indicative-perfect-plural-third-person":"buclară","first-person-indicative-pluperfect-singular":"buclasem","indicative-pluperfect-second-person-singular":"buclaseși","indicative-pluperfect-singular-third-person":"buclase","first-person-indicative-pluperfect-plural":"buclaserăm","indicative-pluperfect-plural-second-person":"buclaserăți","indicative-pluperfect-plural-third-person":"buclaseră","first-person-present-singular-subjunctive":"să buclez","present-second-person-singular-subjunctive":"să buclezi","present-singular-subjunctive-third-person":"să bucleze","first-person-plural-present-subjunctive":"să buclăm","plural-present-second-person-subjunctive":"să buclați","plural-present-subjunctive-third-person":"să bucleze","imperative-second-person-singular":"buclează","imperative-plural-second-person":"buclați","imperative-negative-second-person-singular":"nu bucla","imperative-negative-plural-second-person":"nu buclați"}},{"word":"buclă","pos":"noun","definitions":["lock of hair"],"forms":{"plural":"bucle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buclă","accusative-definite-nominative-singular":"bucla","accusative-indefinite-nominative-plural":"bucle","accusative-definite-nominative-plural":"buclele","dative-genitive-indefinite-singular":"bucle","dative-definite-genitive-singular":"buclei","dative-genitive-indefinite-plural":"bucle","dative-definite-genitive-plural":"buclelor","singular-vocative":"buclă","plural-vocative":"buclelor"}},{"word":"buclaj","pos":"noun","definitions":["loop"],"forms":{"plural":"buclaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buclaj","accusative-definite-nominative-singular":"buclajul","accusative-indefinite-nominative-plural":"buclaje","accusative-definite-nominative-plural":"buclajele","dative-genitive-indefinite-singular":"buclaj","dative-definite-genitive-singular":"buclajului","dative-genitive-indefinite-plural":"buclaje","dative-definite-genitive-plural":"buclajelor","singular-vocative":"buclajule","plural-vocative":"buclajelor"}},{"word":"buclare","pos":"noun","definitions":["loop"],"forms":{"plural":"buclări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buclare","accusative-definite-nominative-singular":"buclarea","accusative-indefinite-nominative-plural":"buclări","accusative-definite-nominative-plural":"buclările","dative-genitive-indefinite-singular":"buclări","dative-definite-genitive-singular":"buclării","dative-genitive-indefinite-plural":"buclări","dative-definite-genitive-plural":"buclărilor","singular-vocative":"buclare","plural-vocative":"buclărilor"}},{"word":"buclat","pos":"adj","definitions":["curled"],"forms":{"feminine-singular":"buclată","masculine-plural":"buclați","feminine-neuter-plural":"buclate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buclat","error-unrecognized-form-feminine-indefinite-singular":"buclată","error-unrecognized-form-indefinite-masculine-plural":"buclați","error-unrecognized-form-feminine-indefinite-neuter-plural":"buclate","definite-error-unrecognized-form-masculine-neuter-singular":"buclatul","definite-error-unrecognized-form-feminine-singular":"buclata","definite-error-unrecognized-form-masculine-plural":"buclații","definite-error-unrecognized-form-feminine-neuter-plural":"buclatele"}},{"word":"buclie","pos":"noun","definitions":["hip flask"],"forms":{"plural":"buclii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"buclie","accusative-definite-nominative-singular":"buclia","accusative-indefinite-nominative-plural":"buclii","accusative-definite-nominative-plural":"bucliile","dative-genitive-indefinite-singular":"buclii","dative-definite-genitive-singular":"bucliei","dative-genitive-indefinite-plural":"buclii","dative-definite-genitive-plural":"bucliilor","singular-vocative":"buclie","plural-vocative":"bucliilor"}},{"word":"bucluc","pos":"noun","definitions":["trouble"],"forms":{"plural":"buclucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bucluc","accusative-definite-nominative-singular":"buclucul","accusative-indefinite-nominative-plural":"buclucuri","accusative-definite-nominative-plural":"buclucurile","dative-genitive-indefinite-singular":"bucluc","dative-definite-genitive-singular":"buclucului","dative-genitive-indefinite-plural":"buclucuri","dative-definite-genitive-plural":"buclucurilor","singular-vocative":"buclucule","plural-vocative":"buclucurilor"}},{"word":"buclucar","pos":"noun","definitions":["troublesome person"],"forms":{"plural":"buclucari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buclucar","accusative-definite-nominative-singular":"buclucarul","accusative-indefinite-nominative-plural":"buclucari","accusative-definite-nominative-plural":"buclucarii","dative-genitive-indefinite-singular":"buclucar","dative-definite-genitive-singular":"buclucarului","dative-genitive-indefinite-plural":"buclucari","dative-definite-genitive-plural":"buclucarilor","singular-vocative":"buclucarule","plural-vocative":"buclucarilor"}},{"word":"buclucăriță","pos":"noun","definitions":["female equivalent of buclucar"],"forms":{"plural":"buclucărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buclucăriță","accusative-definite-nominative-singular":"buclucărița","accusative-indefinite-nominative-plural":"buclucărițe","accusative-definite-nominative-plural":"buclucărițele","dative-genitive-indefinite-singular":"buclucărițe","dative-definite-genitive-singular":"buclucăriței","dative-genitive-indefinite-plural":"buclucărițe","dative-definite-genitive-plural":"buclucărițelor","singular-vocative":"buclucăriță","plural-vocative":"buclucărițelor"}},{"word":"buclucaș","pos":"adj","definitions":["troublesome"],"forms":{"feminine-singular":"buclucașă","masculine-plural":"buclucași","feminine-neuter-plural":"buclucașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buclucaș","error-unrecognized-form-feminine-indefinite-singular":"buclucașă","error-unrecognized-form-indefinite-masculine-plural":"buclucași","error-unrecognized-form-feminine-indefinite-neuter-plural":"buclucașe","definite-error-unrecognized-form-masculine-neuter-singular":"buclucașul","definite-error-unrecognized-form-feminine-singular":"buclucașa","definite-error-unrecognized-form-masculine-plural":"buclucașii","definite-error-unrecognized-form-feminine-neuter-plural":"buclucașele"}},{"word":"buclucașă","pos":"noun","definitions":["female equivalent of buclucaș"],"forms":{"plural":"buclucașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buclucașă","accusative-definite-nominative-singular":"buclucașa","accusative-indefinite-nominative-plural":"buclucașe","accusative-definite-nominative-plural":"buclucașele","dative-genitive-indefinite-singular":"buclucașe","dative-definite-genitive-singular":"buclucașei","dative-genitive-indefinite-plural":"buclucașe","dative-definite-genitive-plural":"buclucașelor","singular-vocative":"buclucașă","plural-vocative":"buclucașelor"}},{"word":"buco","pos":"noun","definitions":["vocative singular of bucă"],"pronunciation":"[ˈbuko]","gender":"f"},{"word":"bucoavnă","pos":"noun","definitions":["primer"],"forms":{"plural":"bucoavne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucoavnă","accusative-definite-nominative-singular":"bucoavna","accusative-indefinite-nominative-plural":"bucoavne","accusative-definite-nominative-plural":"bucoavnele","dative-genitive-indefinite-singular":"bucoavne","dative-definite-genitive-singular":"bucoavnei","dative-genitive-indefinite-plural":"bucoavne","dative-definite-genitive-plural":"bucoavnelor","singular-vocative":"bucoavnă","plural-vocative":"bucoavnelor"}},{"word":"bucolic","pos":"adj","definitions":["bucolic"],"forms":{"feminine-singular":"bucolică","masculine-plural":"bucolici","feminine-neuter-plural":"bucolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucolic","error-unrecognized-form-feminine-indefinite-singular":"bucolică","error-unrecognized-form-indefinite-masculine-plural":"bucolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucolice","definite-error-unrecognized-form-masculine-neuter-singular":"bucolicul","definite-error-unrecognized-form-feminine-singular":"bucolica","definite-error-unrecognized-form-masculine-plural":"bucolicii","definite-error-unrecognized-form-feminine-neuter-plural":"bucolicele"}},{"word":"bucolică","pos":"noun","definitions":["bucolic poem"],"forms":{"plural":"bucolice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucolică","accusative-definite-nominative-singular":"bucolica","accusative-indefinite-nominative-plural":"bucolice","accusative-definite-nominative-plural":"bucolicele","dative-genitive-indefinite-singular":"bucolice","dative-definite-genitive-singular":"bucolicei","dative-genitive-indefinite-plural":"bucolice","dative-definite-genitive-plural":"bucolicelor","singular-vocative":"bucolică","plural-vocative":"bucolicelor"}},{"word":"bucolism","pos":"noun","definitions":["bucolicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bucolism","accusative-definite-nominative":"bucolismul","dative-genitive-indefinite":"bucolism","dative-definite-genitive":"bucolismului","vocative":"bucolismule"}},{"word":"Bucos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucos"}},{"word":"Bucoșnița","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Bucoșnița, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Bucov","pos":"name","definitions":["Bucov (a commune of Prahova County, Romania)"]},{"word":"Bucova","pos":"name","definitions":["a village in Băuțar, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Bucovanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucovanu"}},{"word":"Bucovăț","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Bucovăț, Dolj County, Romania","a commune of Timiș County, Romania","a village in Bucovăț, Timiș County, Romania","a village in Dumbrava, Timiș County, Romania"],"gender":"m"},{"word":"Bucoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucoveanu"}},{"word":"Bucovel","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Teleajen"],"gender":"m"},{"word":"Bucovicior","pos":"name","definitions":["a village in Vela, Dolj County, Romania"],"gender":"m"},{"word":"Bucovina","pos":"name","definitions":["Bukovina (a historical region of Eastern Europe on the northern slopes of the northeastern Carpathian Mountains and adjoining plains, currently split between Romania and Ukraine)"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Bucovină","accusative-definite-nominative":"Bucovina","dative-genitive-indefinite":"Bucovine","dative-definite-genitive":"Bucovinei","vocative":"Bucovină"}},{"word":"bucovinean","pos":"noun","definitions":["native or inhabitant of the geographic region of Bukovina, split between Romania and Ukraine (usually male)"],"forms":{"plural":"bucovineni","feminine":"equivalent bucovineană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucovinean","accusative-definite-nominative-singular":"bucovineanul","accusative-indefinite-nominative-plural":"bucovineni","accusative-definite-nominative-plural":"bucovinenii","dative-genitive-indefinite-singular":"bucovinean","dative-definite-genitive-singular":"bucovineanului","dative-genitive-indefinite-plural":"bucovineni","dative-definite-genitive-plural":"bucovinenilor","singular-vocative":"bucovineanule","plural-vocative":"bucovinenilor"}},{"word":"bucovineană","pos":"noun","definitions":["female equivalent of bucovinean"],"forms":{"plural":"bucovinene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucovineană","accusative-definite-nominative-singular":"bucovineana","accusative-indefinite-nominative-plural":"bucovinene","accusative-definite-nominative-plural":"bucovinenele","dative-genitive-indefinite-singular":"bucovinene","dative-definite-genitive-singular":"bucovinenei","dative-genitive-indefinite-plural":"bucovinene","dative-definite-genitive-plural":"bucovinenelor","singular-vocative":"bucovineană","plural-vocative":"bucovinenelor"}},{"word":"bucovineancă","pos":"noun","definitions":["female equivalent of bucovinean"],"forms":{"plural":"bucovinence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucovineancă","accusative-definite-nominative-singular":"bucovineanca","accusative-indefinite-nominative-plural":"bucovinence","accusative-definite-nominative-plural":"bucovinencele","dative-genitive-indefinite-singular":"bucovinence","dative-definite-genitive-singular":"bucovinencei","dative-genitive-indefinite-plural":"bucovinence","dative-definite-genitive-plural":"bucovinencelor","singular-vocative":"bucovineancă","plural-vocative":"bucovinencelor"}},{"word":"Bucovineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucovineanu"}},{"word":"Bucovița","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Bistra"],"gender":"f"},{"word":"bucraniu","pos":"noun","definitions":["bucranium"],"forms":{"plural":"bucranii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucraniu","accusative-definite-nominative-singular":"bucraniuul","accusative-indefinite-nominative-plural":"bucranii","accusative-definite-nominative-plural":"bucraniile","dative-genitive-indefinite-singular":"bucraniu","dative-definite-genitive-singular":"bucraniuului","dative-genitive-indefinite-plural":"bucranii","dative-definite-genitive-plural":"bucraniilor","singular-vocative":"bucraniuule","plural-vocative":"bucraniilor"}},{"word":"Bucșa","pos":"name","definitions":["a village in Răchitoasa, Bacău County, Romania","a village in Valea Ciorii, Ialomița County, Romania"],"gender":"f"},{"word":"Bucșă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucșă"}},{"word":"bucșă","pos":"noun","definitions":["fitting, coupling"],"forms":{"plural":"bucșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucșă","accusative-definite-nominative-singular":"bucșa","accusative-indefinite-nominative-plural":"bucșe","accusative-definite-nominative-plural":"bucșele","dative-genitive-indefinite-singular":"bucșe","dative-definite-genitive-singular":"bucșei","dative-genitive-indefinite-plural":"bucșe","dative-definite-genitive-plural":"bucșelor","singular-vocative":"bucșă","plural-vocative":"bucșelor"}},{"word":"Bucșana","pos":"name","definitions":["a village in Prigoria, Gorj County, Romania"],"gender":"f"},{"word":"Bucșani","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Bucșani, Dâmbovița County, Romania","a commune of Giurgiu County, Romania","a village in Bucșani, Giurgiu County, Romania","a village in Ionești, Vâlcea County, Romania"],"gender":"m"},{"word":"Bucșenești","pos":"name","definitions":["a village in Corbeni, Argeș County, Romania"],"gender":"m"},{"word":"Bucșenești-Lotași","pos":"name","definitions":["a village in Țițești, Argeș County, Romania"],"gender":"m"},{"word":"Bucșești","pos":"name","definitions":["a village in Poduri, Bacău County, Romania"],"gender":"m"},{"word":"Bucșinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bucșinescu"}},{"word":"Bucșoaia","pos":"name","definitions":["a locality in Frasin, Suceava County, Romania"],"gender":"f"},{"word":"Bucșoiu","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea Glăjăriei"],"gender":"m"},{"word":"bucule","pos":"noun","definitions":["vocative singular of buc"],"pronunciation":"[ˈbukule]","gender":"m"},{"word":"Buculeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buculeanu"}},{"word":"Buculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buculescu"}},{"word":"Bucur","pos":"name","definitions":["a male given name","a surname","a river in Bistrița-Năsăud County, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"bucur","pos":"verb","definitions":["first-person singular present indicative/subjunctive of bucura"]},{"word":"Bucura","pos":"name","definitions":["a village in Vânju Mare, Mehedinți County, Romania"],"gender":"f"},{"word":"bucura","pos":"verb","definitions":["to delight, to cheer, to indulge","be / become glad or happy"],"examples":[{"ro":"Cred că aș avea ceva care te va bucura.","en":"I think I might have something that will cheer you up."}],"forms":{"canonical":"a bucura 1st conjugation","present-singular-third-person":"bucură","participle-past":"bucurat","subjunctive-third-person":"bucure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bucura","gerund":"bucurând","first-person-indicative-present-singular":"bucur","indicative-present-second-person-singular":"bucuri","indicative-present-singular-third-person":"bucură","first-person-indicative-plural-present":"bucurăm","indicative-plural-present-second-person":"bucurați","indicative-plural-present-third-person":"bucură","first-person-imperfect-indicative-singular":"bucuram","imperfect-indicative-second-person-singular":"bucurai","imperfect-indicative-singular-third-person":"bucura","first-person-imperfect-indicative-plural":"bucuram","imperfect-indicative-plural-second-person":"bucurați","imperfect-indicative-plural-third-person":"bucurau","first-person-indicative-perfect-singular":"bucurai","indicative-perfect-second-person-singular":"bucurași","indicative-perfect-singular-third-person":"bucură","first-person-indicative-perfect-plural":"bucurarăm","indicative-perfect-plural-second-person":"bucurarăți","indicative-perfect-plural-third-person":"bucurară","first-person-indicative-pluperfect-singular":"bucurasem","indicative-pluperfect-second-person-singular":"bucuraseși","indicative-pluperfect-singular-third-person":"bucurase","first-person-indicative-pluperfect-plural":"bucuraserăm","indicative-pluperfect-plural-second-person":"bucuraserăți","indicative-pluperfect-plural-third-person":"bucuraseră","first-person-present-singular-subjunctive":"să bucur","present-second-person-singular-subjunctive":"să bucuri","present-singular-subjunctive-third-person":"să bucure","first-person-plural-present-subjunctive":"să bucurăm","plural-present-second-person-subjunctive":"să bucurați","plural-present-subjunctive-third-person":"să bucure","imperative-second-person-singular":"bucură","imperative-plural-second-person":"bucurați","imperative-negative-second-person-singular":"nu bucura","imperative-negative-plural-second-person":"nu bucurați"}},{"word":"bucurând","pos":"verb","definitions":["gerund of bucura"],"pronunciation":"/bu.kuˈrɨnd/","forms":{"alternative":"bucurînd"}},{"word":"Bucuraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucuraș"}},{"word":"bucurat","pos":"verb","definitions":["past participle of bucura"],"forms":{"participle-past":"of bucura"}},{"word":"Bucureasa","pos":"name","definitions":["a village in Dănești, Gorj County, Romania"],"gender":"f"},{"word":"Bucureasa Mare","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Lotru"],"gender":"f"},{"word":"Bucureasa Mică","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Bucureasa Mare"],"gender":"f"},{"word":"Bucureșci","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Bucureșci, Hunedoara County, Romania"],"gender":"m"},{"word":"Bucurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bucurescu"}},{"word":"Bucureștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucureștean"}},{"word":"bucureștean","pos":"adj","definitions":["Bucharestian (of, from or relating to the city of Bucharest, capital of Romania)"],"pronunciation":"/bu.ku.reʃˈte̯an/","forms":{"feminine-singular":"bucureșteană","masculine-plural":"bucureșteni","feminine-neuter-plural":"bucureștene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucureștean","error-unrecognized-form-feminine-indefinite-singular":"bucureșteană","error-unrecognized-form-indefinite-masculine-plural":"bucureșteni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucureștene","definite-error-unrecognized-form-masculine-neuter-singular":"bucureșteanul","definite-error-unrecognized-form-feminine-singular":"bucureșteana","definite-error-unrecognized-form-masculine-plural":"bucureștenii","definite-error-unrecognized-form-feminine-neuter-plural":"bucureștenele"}},{"word":"bucureștean","pos":"noun","definitions":["Bucharestian (native or inhabitant of the city of Bucharest, capital of Romania) (usually male)"],"pronunciation":"/bu.ku.reʃˈte̯an/","forms":{"plural":"bucureșteni","feminine":"equivalent bucureșteancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bucureștean","accusative-definite-nominative-singular":"bucureșteanul","accusative-indefinite-nominative-plural":"bucureșteni","accusative-definite-nominative-plural":"bucureștenii","dative-genitive-indefinite-singular":"bucureștean","dative-definite-genitive-singular":"bucureșteanului","dative-genitive-indefinite-plural":"bucureșteni","dative-definite-genitive-plural":"bucureștenilor","singular-vocative":"bucureșteanule","plural-vocative":"bucureștenilor"}},{"word":"bucureșteană","pos":"noun","definitions":["female equivalent of bucureștean"],"forms":{"plural":"bucureștene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucureșteană","accusative-definite-nominative-singular":"bucureșteana","accusative-indefinite-nominative-plural":"bucureștene","accusative-definite-nominative-plural":"bucureștenele","dative-genitive-indefinite-singular":"bucureștene","dative-definite-genitive-singular":"bucureștenei","dative-genitive-indefinite-plural":"bucureștene","dative-definite-genitive-plural":"bucureștenelor","singular-vocative":"bucureșteană","plural-vocative":"bucureștenelor"}},{"word":"bucureșteancă","pos":"noun","definitions":["female equivalent of bucureștean"],"forms":{"plural":"bucureștence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucureșteancă","accusative-definite-nominative-singular":"bucureșteanca","accusative-indefinite-nominative-plural":"bucureștence","accusative-definite-nominative-plural":"bucureștencele","dative-genitive-indefinite-singular":"bucureștence","dative-definite-genitive-singular":"bucureștencei","dative-genitive-indefinite-plural":"bucureștence","dative-definite-genitive-plural":"bucureștencelor","singular-vocative":"bucureșteancă","plural-vocative":"bucureștencelor"}},{"word":"Bucureșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucureșteanu"}},{"word":"bucureșteni","pos":"adj","definitions":["masculine plural of bucureștean"],"pronunciation":"/ˌbu.ku.reʃˈtenʲ/","gender":"m-p"},{"word":"București","pos":"name","definitions":["Bucharest (the capital city of Romania)"],"pronunciation":"/bu.kuˈreʃtʲ/","gender":"m","forms":{"accusative-definite-nominative":"Bucureștiul","dative-definite-genitive":"Bucureștiului","vocative":"Bucureștiule","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"București","dative-genitive-indefinite":"București","alternative":"Букурешть"}},{"word":"Bucureștianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bucureștianu"}},{"word":"Bucureștii Noi","pos":"name","definitions":["a neighbourhood of Bucharest, Romania"],"gender":"m"},{"word":"Bucuria","pos":"name","definitions":["a village in Bucuria, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"f"},{"word":"Bucurică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucurică"}},{"word":"Bucurie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bucurie"}},{"word":"bucurie","pos":"noun","definitions":["happiness (emotion of being happy)"],"pronunciation":"/bu.kuˈri.e/","forms":{"plural":"bucurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bucurie","accusative-definite-nominative-singular":"bucuria","accusative-indefinite-nominative-plural":"bucurii","accusative-definite-nominative-plural":"bucuriile","dative-genitive-indefinite-singular":"bucurii","dative-definite-genitive-singular":"bucuriei","dative-genitive-indefinite-plural":"bucurii","dative-definite-genitive-plural":"bucuriilor","singular-vocative":"bucurie","plural-vocative":"bucuriilor"}},{"word":"Bucuroaia","pos":"name","definitions":["a village in Copăcel, Bihor County, Romania"],"gender":"f"},{"word":"Bucuroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bucuroiu"}},{"word":"bucuros","pos":"adj","definitions":["glad"],"pronunciation":"/bu.kuˈros/","forms":{"feminine-singular":"bucuroasă","masculine-plural":"bucuroși","feminine-neuter-plural":"bucuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bucuros","error-unrecognized-form-feminine-indefinite-singular":"bucuroasă","error-unrecognized-form-indefinite-masculine-plural":"bucuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bucuroase","definite-error-unrecognized-form-masculine-neuter-singular":"bucurosul","definite-error-unrecognized-form-feminine-singular":"bucuroasa","definite-error-unrecognized-form-masculine-plural":"bucuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"bucuroasele","alternative":"букурос"}},{"word":"Bucuru","pos":"name","definitions":["a locality in Cugir, Alba County, Romania"],"gender":"m"},{"word":"bucuță","pos":"noun","definitions":["diminutive of bucă"],"forms":{"plural":"bucuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bucuță","accusative-definite-nominative-singular":"bucuța","accusative-indefinite-nominative-plural":"bucuțe","accusative-definite-nominative-plural":"bucuțele","dative-genitive-indefinite-singular":"bucuțe","dative-definite-genitive-singular":"bucuței","dative-genitive-indefinite-plural":"bucuțe","dative-definite-genitive-plural":"bucuțelor","singular-vocative":"bucuță","plural-vocative":"bucuțelor"}},{"word":"bucvariu","pos":"noun","definitions":["primer"],"forms":{"plural":"bucvarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bucvariu","accusative-definite-nominative-singular":"bucvariul","accusative-indefinite-nominative-plural":"bucvarii","accusative-definite-nominative-plural":"bucvariile","dative-genitive-indefinite-singular":"bucvariu","dative-definite-genitive-singular":"bucvariului","dative-genitive-indefinite-plural":"bucvarii","dative-definite-genitive-plural":"bucvariilor","singular-vocative":"bucvariule","plural-vocative":"bucvariilor"}},{"word":"Buda","pos":"name","definitions":["a village in Buda, Călărași Raion, Moldova","a commune of Călărași Raion, Moldova","a river in Argeș, Romania, tributary to the Argeș","a river in Bacău, Romania, tributary to the Bistrița","a river in Vaslui, Romania, tributary to the Horoiata"],"gender":"f"},{"word":"buda","pos":"verb","definitions":["to express dissatisfaction by displaying an indifferent or sulky attitude"],"pronunciation":"/buˈda/","forms":{"canonical":"a buda 1st conjugation","present-singular-third-person":"budează","participle-past":"budat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a buda","gerund":"budând","first-person-indicative-present-singular":"budez","indicative-present-second-person-singular":"budezi","indicative-present-singular-third-person":"budează","first-person-indicative-plural-present":"budăm","indicative-plural-present-second-person":"budați","indicative-plural-present-third-person":"budează","first-person-imperfect-indicative-singular":"budam","imperfect-indicative-second-person-singular":"budai","imperfect-indicative-singular-third-person":"buda","first-person-imperfect-indicative-plural":"budam","imperfect-indicative-plural-second-person":"budați","imperfect-indicative-plural-third-person":"budau","first-person-indicative-perfect-singular":"budai","indicative-perfect-second-person-singular":"budași","indicative-perfect-singular-third-person":"budă","first-person-indicative-perfect-plural":"budarăm","indicative-perfect-plural-second-person":"budarăți","indicative-perfect-plural-third-person":"budară","first-person-indicative-pluperfect-singular":"budasem","indicative-pluperfect-second-person-singular":"budaseși","indicative-pluperfect-singular-third-person":"budase","first-person-indicative-pluperfect-plural":"budaserăm","indicative-pluperfect-plural-second-person":"budaserăți","indicative-pluperfect-plural-third-person":"budaseră","first-person-present-singular-subjunctive":"să budez","present-second-person-singular-subjunctive":"să budezi","present-singular-subjunctive-third-person":"să budeze","first-person-plural-present-subjunctive":"să budăm","plural-present-second-person-subjunctive":"să budați","plural-present-subjunctive-third-person":"să budeze","imperative-second-person-singular":"budează","imperative-plural-second-person":"budați","imperative-negative-second-person-singular":"nu buda","imperative-negative-plural-second-person":"nu budați"}},{"word":"buda","pos":"noun","definitions":["nominative/accusative definite singular of budă"],"pronunciation":"/ˈbu.da/","gender":"f"},{"word":"Budă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Budă"}},{"word":"budă","pos":"noun","definitions":["toilet, outhouse, latrine"],"pronunciation":"/ˈbu.də/","forms":{"plural":"bude","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"budă","accusative-definite-nominative-singular":"buda","accusative-indefinite-nominative-plural":"bude","accusative-definite-nominative-plural":"budele","dative-genitive-indefinite-singular":"bude","dative-definite-genitive-singular":"budei","dative-genitive-indefinite-plural":"bude","dative-definite-genitive-plural":"budelor","singular-vocative":"budă","plural-vocative":"budelor","alternative":"будэ"}},{"word":"Buda Crăciunești","pos":"name","definitions":["a village in Cislău, Buzău County, Romania"],"gender":"f"},{"word":"budăcică","pos":"noun","definitions":["diminutive of budacă"],"forms":{"plural":"budăcicici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"budăcică","accusative-definite-nominative-singular":"budăcica","accusative-indefinite-nominative-plural":"budăcicice","accusative-definite-nominative-plural":"budăcicicele","dative-genitive-indefinite-singular":"budăcicice","dative-definite-genitive-singular":"budăcicicei","dative-genitive-indefinite-plural":"budăcicice","dative-definite-genitive-plural":"budăcicicelor","singular-vocative":"budăcică","plural-vocative":"budăcicicelor"}},{"word":"Budacu de Jos","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Budacu de Jos, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Budacu de Sus","pos":"name","definitions":["a village in Dumitrița, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"budai","pos":"verb","definitions":["inflection of buda:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[buˈdaj]"},{"word":"Budăi","pos":"name","definitions":["a village in Budăi, Taraclia Raion, Moldova","a village in Budăi, Telenești Raion, Moldova","a village in Step-Soci, Orhei Raion, Moldova","a village in Țipala, Ialoveni Raion, Moldova","a commune of Taraclia Raion, Moldova"],"gender":"m"},{"word":"Budăiești","pos":"name","definitions":["a village in Albac, Alba County, Romania"],"gender":"m"},{"word":"budala","pos":"noun","definitions":["fool"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"budala","accusative-definite-nominative":"budalaul","dative-genitive-indefinite":"budala","dative-definite-genitive":"budalaului","vocative":"budalaule"}},{"word":"budalaș","pos":"noun","definitions":["diminutive of budala"],"forms":{"plural":"budalași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"budalaș","accusative-definite-nominative-singular":"budalașul","accusative-indefinite-nominative-plural":"budalași","accusative-definite-nominative-plural":"budalașii","dative-genitive-indefinite-singular":"budalaș","dative-definite-genitive-singular":"budalașului","dative-genitive-indefinite-plural":"budalași","dative-definite-genitive-plural":"budalașilor","singular-vocative":"budalașule","plural-vocative":"budalașilor"}},{"word":"Budănești","pos":"name","definitions":["a village in Ilovăț, Mehedinți County, Romania"],"gender":"m"},{"word":"Budapesta","pos":"name","definitions":["Budapest (the capital city of Hungary)"],"gender":"f","forms":{"dative-genitive":"Budapestei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Budapestă","accusative-definite-nominative":"Budapesta","dative-genitive-indefinite":"Budapeste","dative-definite-genitive":"Budapestei","vocative":"Budapestă"}},{"word":"Budapestei","pos":"name","definitions":["genitive/dative singular of Budapesta"],"gender":"f"},{"word":"Budatelec","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Budești in 1925."],"gender":"m"},{"word":"bude","pos":"noun","definitions":["inflection of budă:","genitive/dative indefinite singular","nominative/accusative/genitive/dative indefinite plural"],"gender":"f"},{"word":"Budean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budean"}},{"word":"Budeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budeanu"}},{"word":"Budeasa","pos":"name","definitions":["a commune of Argeș County, Romania"],"gender":"f"},{"word":"Budeasa Mare","pos":"name","definitions":["a village in Budeasa, Argeș County, Romania"],"gender":"f"},{"word":"Budeasa Mică","pos":"name","definitions":["a village in Budeasa, Argeș County, Romania"],"gender":"f"},{"word":"budei","pos":"noun","definitions":["genitive/dative definite singular of budă"],"gender":"f"},{"word":"Budele","pos":"name","definitions":["a village in Tetoiu, Vâlcea County, Romania"],"gender":"m"},{"word":"budele","pos":"noun","definitions":["nominative/accusative definite plural of budă"],"gender":"f"},{"word":"budelor","pos":"noun","definitions":["inflection of budă:","genitive/dative definite plural","vocative plural"],"gender":"f"},{"word":"Budeni","pos":"name","definitions":["a village in Zlatna, Alba County, Romania","a village in Comana, Giurgiu County, Romania","a village in Dolhasca, Suceava County, Romania"],"gender":"m"},{"word":"Budeș","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Olt"],"gender":"m"},{"word":"Budescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Budescu"}},{"word":"Budeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budeșteanu"}},{"word":"Budești","pos":"name","definitions":["a village in Pleșcuța, Arad County, Romania","a village in Plopana, Bacău County, Romania","a commune of Bistrița-Năsăud County, Romania","a village in Budești, Bistrița-Năsăud County, Romania","a village in Chiliile, Buzău County, Romania"],"gender":"m"},{"word":"Budești-Fânațe","pos":"name","definitions":["a village in Budești, Bistrița-Năsăud County, Romania"],"gender":"m","forms":{"alternative":"Budești-Fînațe"}},{"word":"budget","pos":"noun","definitions":["alternative form of buget"],"forms":{"plural":"budgete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"budget","accusative-definite-nominative-singular":"budgetul","accusative-indefinite-nominative-plural":"budgete","accusative-definite-nominative-plural":"budgetele","dative-genitive-indefinite-singular":"budget","dative-definite-genitive-singular":"budgetului","dative-genitive-indefinite-plural":"budgete","dative-definite-genitive-plural":"budgetelor","singular-vocative":"budgetule","plural-vocative":"budgetelor"}},{"word":"budgetar","pos":"adj","definitions":["alternative form of bugetar"],"forms":{"feminine-singular":"budgetară","masculine-plural":"budgetari","feminine-neuter-plural":"budgetare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"budgetar","error-unrecognized-form-feminine-indefinite-singular":"budgetară","error-unrecognized-form-indefinite-masculine-plural":"budgetari","error-unrecognized-form-feminine-indefinite-neuter-plural":"budgetare","definite-error-unrecognized-form-masculine-neuter-singular":"budgetarul","definite-error-unrecognized-form-feminine-singular":"budgetara","definite-error-unrecognized-form-masculine-plural":"budgetarii","definite-error-unrecognized-form-feminine-neuter-plural":"budgetarele"}},{"word":"Budieni","pos":"name","definitions":["a village in Scoarța, Gorj County, Romania"],"gender":"m"},{"word":"budihace","pos":"noun","definitions":["an ugly being"],"forms":{"plural":"budihace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"budihace","accusative-definite-nominative-singular":"budihacea","accusative-indefinite-nominative-plural":"budihace","accusative-definite-nominative-plural":"budihacele","dative-genitive-indefinite-singular":"budihace","dative-definite-genitive-singular":"budihacei","dative-genitive-indefinite-plural":"budihace","dative-definite-genitive-plural":"budihacelor","singular-vocative":"budihace","plural-vocative":"budihacelor"}},{"word":"Budila","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Budila, Brașov County, Romania"],"gender":"f"},{"word":"Budileanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budileanu"}},{"word":"Budilianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budilianu"}},{"word":"budincă","pos":"noun","definitions":["pudding (sweet dessert dish)"],"pronunciation":"/buˈdin.kə/","forms":{"plural":"budinci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"budincă","accusative-definite-nominative-singular":"budinca","accusative-indefinite-nominative-plural":"budinci","accusative-definite-nominative-plural":"budincile","dative-genitive-indefinite-singular":"budinci","dative-definite-genitive-singular":"budincii","dative-genitive-indefinite-plural":"budinci","dative-definite-genitive-plural":"budincilor","singular-vocative":"budincă","plural-vocative":"budincilor"}},{"word":"Budislavu","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Boia Mică"],"gender":"m"},{"word":"budism","pos":"noun","definitions":["Buddhism"],"pronunciation":"/bu.ˈdism/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"budism","accusative-definite-nominative":"budismul","dative-genitive-indefinite":"budism","dative-definite-genitive":"budismului","vocative":"budismule"}},{"word":"budist","pos":"noun","definitions":["Buddhist"],"forms":{"plural":"budiști","feminine":"equivalent budistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"budist","accusative-definite-nominative-singular":"budistul","accusative-indefinite-nominative-plural":"budiști","accusative-definite-nominative-plural":"budiștii","dative-genitive-indefinite-singular":"budist","dative-definite-genitive-singular":"budistului","dative-genitive-indefinite-plural":"budiști","dative-definite-genitive-plural":"budiștilor","singular-vocative":"budistule","plural-vocative":"budiștilor"}},{"word":"budistă","pos":"noun","definitions":["female equivalent of budist"],"forms":{"plural":"budiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"budistă","accusative-definite-nominative-singular":"budista","accusative-indefinite-nominative-plural":"budiste","accusative-definite-nominative-plural":"budistele","dative-genitive-indefinite-singular":"budiste","dative-definite-genitive-singular":"budistei","dative-genitive-indefinite-plural":"budiste","dative-definite-genitive-plural":"budistelor","singular-vocative":"budistă","plural-vocative":"budistelor"}},{"word":"Budișteanca","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Argeș"],"gender":"f"},{"word":"Budișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Budișteanu"}},{"word":"Budișteni","pos":"name","definitions":["a village in Leordeni, Argeș County, Romania","a village in Costești, Buzău County, Romania"],"gender":"m"},{"word":"Budiu Mic","pos":"name","definitions":["a village in Crăciunești, Mureș County, Romania"],"gender":"m"},{"word":"budo","pos":"noun","definitions":["vocative singular of budă"],"gender":"f"},{"word":"budoar","pos":"noun","definitions":["boudoir"],"forms":{"plural":"budoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"budoar","accusative-definite-nominative-singular":"budoarul","accusative-indefinite-nominative-plural":"budoare","accusative-definite-nominative-plural":"budoarele","dative-genitive-indefinite-singular":"budoar","dative-definite-genitive-singular":"budoarului","dative-genitive-indefinite-plural":"budoare","dative-definite-genitive-plural":"budoarelor","singular-vocative":"budoarule","plural-vocative":"budoarelor"}},{"word":"budoinai","pos":"noun","definitions":["weed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"budoinai","accusative-definite-nominative":"budoinaiul","dative-genitive-indefinite":"budoinai","dative-definite-genitive":"budoinaiului","vocative":"budoinaiule"}},{"word":"Budoș","pos":"name","definitions":["a river in Covasna County, Romania, tributary to the Pârâul lui Floriș","a river in Covasna County, Romania, tributary to the Pădureni","a river in Covasna County, Romania, tributary to the Balvanyos"],"gender":"m"},{"word":"Budu Cantemir","pos":"name","definitions":["a village in Stănilești, Vaslui County, Romania"],"gender":"m"},{"word":"buduar","pos":"noun","definitions":["obsolete form of budoar"],"forms":{"plural":"buduare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buduar","accusative-definite-nominative-singular":"buduarul","accusative-indefinite-nominative-plural":"buduare","accusative-definite-nominative-plural":"buduarele","dative-genitive-indefinite-singular":"buduar","dative-definite-genitive-singular":"buduarului","dative-genitive-indefinite-plural":"buduare","dative-definite-genitive-plural":"buduarelor","singular-vocative":"buduarule","plural-vocative":"buduarelor"}},{"word":"budugări","pos":"verb","definitions":["to rummage"],"forms":{"canonical":"a budugări 4th conjugation","present-singular-third-person":"budugărie","participle-past":"budugărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a budugări","gerund":"budugărind","first-person-indicative-present-singular":"budugăr","indicative-present-second-person-singular":"budugări","indicative-present-singular-third-person":"budugăre","first-person-indicative-plural-present":"budugărim","indicative-plural-present-second-person":"budugăriți","indicative-plural-present-third-person":"budugăr","first-person-imperfect-indicative-singular":"budugăream","imperfect-indicative-second-person-singular":"budugăreai","imperfect-indicative-singular-third-person":"budugărea","first-person-imperfect-indicative-plural":"budugăream","imperfect-indicative-plural-second-person":"budugăreați","imperfect-indicative-plural-third-person":"budugăreau","first-person-indicative-perfect-singular":"budugării","indicative-perfect-second-person-singular":"budugăriși","indicative-perfect-singular-third-person":"budugări","first-person-indicative-perfect-plural":"budugărirăm","indicative-perfect-plural-second-person":"budugărirăți","indicative-perfect-plural-third-person":"budugăriră","first-person-indicative-pluperfect-singular":"budugărisem","indicative-pluperfect-second-person-singular":"budugăriseși","indicative-pluperfect-singular-third-person":"budugărise","first-person-indicative-pluperfect-plural":"budugăriserăm","indicative-pluperfect-plural-second-person":"budugăriserăți","indicative-pluperfect-plural-third-person":"budugăriseră","first-person-present-singular-subjunctive":"să budugăr","present-second-person-singular-subjunctive":"să budugări","present-singular-subjunctive-third-person":"să budugără","first-person-plural-present-subjunctive":"să budugărim","plural-present-second-person-subjunctive":"să budugăriți","plural-present-subjunctive-third-person":"să budugără","imperative-second-person-singular":"budugăre","imperative-plural-second-person":"budugăriți","imperative-negative-second-person-singular":"nu budugări","imperative-negative-plural-second-person":"nu budugăriți"}},{"word":"budugărire","pos":"noun","definitions":["rummage"],"forms":{"plural":"budugăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"budugărire","accusative-definite-nominative-singular":"budugărirea","accusative-indefinite-nominative-plural":"budugăriri","accusative-definite-nominative-plural":"budugăririle","dative-genitive-indefinite-singular":"budugăriri","dative-definite-genitive-singular":"budugăririi","dative-genitive-indefinite-plural":"budugăriri","dative-definite-genitive-plural":"budugăririlor","singular-vocative":"budugărire","plural-vocative":"budugăririlor"}},{"word":"Buduhala","pos":"name","definitions":["a village in Telești, Gorj County, Romania"],"gender":"f"},{"word":"buduhaliță","pos":"noun","definitions":["monster"],"forms":{"plural":"buduhalițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buduhaliță","accusative-definite-nominative-singular":"buduhalița","accusative-indefinite-nominative-plural":"buduhalițe","accusative-definite-nominative-plural":"buduhalițele","dative-genitive-indefinite-singular":"buduhalițe","dative-definite-genitive-singular":"buduhaliței","dative-genitive-indefinite-plural":"buduhalițe","dative-definite-genitive-plural":"buduhalițelor","singular-vocative":"buduhaliță","plural-vocative":"buduhalițelor"}},{"word":"Buduile","pos":"name","definitions":["a village in Bozioru, Buzău County, Romania"],"gender":"m"},{"word":"budulan","pos":"adj","definitions":["ugly (about people)"],"forms":{"feminine-singular":"budulană","masculine-plural":"budulani","feminine-neuter-plural":"budulane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"budulan","error-unrecognized-form-feminine-indefinite-singular":"budulană","error-unrecognized-form-indefinite-masculine-plural":"budulani","error-unrecognized-form-feminine-indefinite-neuter-plural":"budulane","definite-error-unrecognized-form-masculine-neuter-singular":"budulanul","definite-error-unrecognized-form-feminine-singular":"budulana","definite-error-unrecognized-form-masculine-plural":"budulanii","definite-error-unrecognized-form-feminine-neuter-plural":"budulanele"}},{"word":"buduli","pos":"verb","definitions":["to rummage"],"forms":{"canonical":"a buduli 4th conjugation","present-singular-third-person":"budulește","participle-past":"budulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buduli","gerund":"budulind","first-person-indicative-present-singular":"budulesc","indicative-present-second-person-singular":"budulești","indicative-present-singular-third-person":"budulește","first-person-indicative-plural-present":"budulim","indicative-plural-present-second-person":"buduliți","indicative-plural-present-third-person":"budulesc","first-person-imperfect-indicative-singular":"buduleam","imperfect-indicative-second-person-singular":"buduleai","imperfect-indicative-singular-third-person":"budulea","first-person-imperfect-indicative-plural":"buduleam","imperfect-indicative-plural-second-person":"buduleați","imperfect-indicative-plural-third-person":"buduleau","first-person-indicative-perfect-singular":"budulii","indicative-perfect-second-person-singular":"buduliși","indicative-perfect-singular-third-person":"buduli","first-person-indicative-perfect-plural":"budulirăm","indicative-perfect-plural-second-person":"budulirăți","indicative-perfect-plural-third-person":"buduliră","first-person-indicative-pluperfect-singular":"budulisem","indicative-pluperfect-second-person-singular":"buduliseși","indicative-pluperfect-singular-third-person":"budulise","first-person-indicative-pluperfect-plural":"buduliserăm","indicative-pluperfect-plural-second-person":"buduliserăți","indicative-pluperfect-plural-third-person":"buduliseră","first-person-present-singular-subjunctive":"să budulesc","present-second-person-singular-subjunctive":"să budulești","present-singular-subjunctive-third-person":"să budulească","first-person-plural-present-subjunctive":"să budulim","plural-present-second-person-subjunctive":"să buduliți","plural-present-subjunctive-third-person":"să budulească","imperative-second-person-singular":"budulește","imperative-plural-second-person":"buduliți","imperative-negative-second-person-singular":"nu buduli","imperative-negative-plural-second-person":"nu buduliți"}},{"word":"Budulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Budulică"}},{"word":"Budunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Budunescu"}},{"word":"Budurăști","pos":"name","definitions":["a village in Stoenești, Vâlcea County, Romania"],"gender":"m"},{"word":"Budureasa","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Budureasa, Bihor County, Romania"],"gender":"f"},{"word":"Budurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Budurescu"}},{"word":"Budurleni","pos":"name","definitions":["a village in Teaca, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Buduruș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buduruș"}},{"word":"Buduslău","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Buduslău, Bihor County, Romania"],"gender":"m"},{"word":"budușlău","pos":"noun","definitions":["vagabond"],"forms":{"plural":"budușlăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"budușlău","accusative-definite-nominative-singular":"budușlăuul","accusative-indefinite-nominative-plural":"budușlăi","accusative-definite-nominative-plural":"budușlăii","dative-genitive-indefinite-singular":"budușlău","dative-definite-genitive-singular":"budușlăuului","dative-genitive-indefinite-plural":"budușlăi","dative-definite-genitive-plural":"budușlăilor","singular-vocative":"budușlăuule","plural-vocative":"budușlăilor"}},{"word":"Buescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buescu"}},{"word":"Buești","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Buești, Ialomița County, Romania"],"gender":"m"},{"word":"buf","pos":"noun","definitions":["owl"],"pronunciation":"[buf]","forms":{"plural":"bufi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buf","accusative-definite-nominative-singular":"buful","accusative-indefinite-nominative-plural":"bufi","accusative-definite-nominative-plural":"bufii","dative-genitive-indefinite-singular":"buf","dative-definite-genitive-singular":"bufului","dative-genitive-indefinite-plural":"bufi","dative-definite-genitive-plural":"bufilor","singular-vocative":"bufule","plural-vocative":"bufilor","alternative":"buh"}},{"word":"bufă","pos":"noun","definitions":["alternative form of buhă"],"pronunciation":"[ˈbu.fə]","forms":{"plural":"bufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufă","accusative-definite-nominative-singular":"bufa","accusative-indefinite-nominative-plural":"bufe","accusative-definite-nominative-plural":"bufele","dative-genitive-indefinite-singular":"bufe","dative-definite-genitive-singular":"bufei","dative-genitive-indefinite-plural":"bufe","dative-definite-genitive-plural":"bufelor","singular-vocative":"bufă","plural-vocative":"bufelor","alternative":"buhă"}},{"word":"bufal","pos":"noun","definitions":["buffalo"],"pronunciation":"/buˈfal/","forms":{"plural":"bufali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bufal","accusative-definite-nominative-singular":"bufalul","accusative-indefinite-nominative-plural":"bufali","accusative-definite-nominative-plural":"bufalii","dative-genitive-indefinite-singular":"bufal","dative-definite-genitive-singular":"bufalului","dative-genitive-indefinite-plural":"bufali","dative-definite-genitive-plural":"bufalilor","singular-vocative":"bufalule","plural-vocative":"bufalilor"}},{"word":"bufali","pos":"noun","definitions":["indefinite plural of bufal"],"pronunciation":"[buˈfalʲ]","gender":"m-p"},{"word":"bufant","pos":"adj","definitions":["bouffant"],"forms":{"feminine-singular":"bufantă","masculine-plural":"bufanți","feminine-neuter-plural":"bufante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bufant","error-unrecognized-form-feminine-indefinite-singular":"bufantă","error-unrecognized-form-indefinite-masculine-plural":"bufanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bufante","definite-error-unrecognized-form-masculine-neuter-singular":"bufantul","definite-error-unrecognized-form-feminine-singular":"bufanta","definite-error-unrecognized-form-masculine-plural":"bufanții","definite-error-unrecognized-form-feminine-neuter-plural":"bufantele"}},{"word":"bufari","pos":"noun","definitions":["primer"],"forms":{"plural":"bufarii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bufari","accusative-definite-nominative-singular":"bufariul","accusative-indefinite-nominative-plural":"bufarii","accusative-definite-nominative-plural":"bufariile","dative-genitive-indefinite-singular":"bufari","dative-definite-genitive-singular":"bufariului","dative-genitive-indefinite-plural":"bufarii","dative-definite-genitive-plural":"bufariilor","singular-vocative":"bufariule","plural-vocative":"bufariilor"}},{"word":"bufet","pos":"noun","definitions":["sideboard, dresser (a piece of furniture)"],"forms":{"plural":"bufete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bufet","accusative-definite-nominative-singular":"bufetul","accusative-indefinite-nominative-plural":"bufete","accusative-definite-nominative-plural":"bufetele","dative-genitive-indefinite-singular":"bufet","dative-definite-genitive-singular":"bufetului","dative-genitive-indefinite-plural":"bufete","dative-definite-genitive-plural":"bufetelor","singular-vocative":"bufetule","plural-vocative":"bufetelor"}},{"word":"bufet expres","pos":"noun","definitions":["snack bar"],"forms":{"plural":"bufete expres"}},{"word":"bufetier","pos":"noun","definitions":["barkeeper"],"forms":{"plural":"bufetieri","feminine":"equivalent bufetieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bufetier","accusative-definite-nominative-singular":"bufetierul","accusative-indefinite-nominative-plural":"bufetieri","accusative-definite-nominative-plural":"bufetierii","dative-genitive-indefinite-singular":"bufetier","dative-definite-genitive-singular":"bufetierului","dative-genitive-indefinite-plural":"bufetieri","dative-definite-genitive-plural":"bufetierilor","singular-vocative":"bufetierule","plural-vocative":"bufetierilor"}},{"word":"bufetieră","pos":"noun","definitions":["female equivalent of bufetier"],"forms":{"plural":"bufetiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufetieră","accusative-definite-nominative-singular":"bufetiera","accusative-indefinite-nominative-plural":"bufetiere","accusative-definite-nominative-plural":"bufetierele","dative-genitive-indefinite-singular":"bufetiere","dative-definite-genitive-singular":"bufetierei","dative-genitive-indefinite-plural":"bufetiere","dative-definite-genitive-plural":"bufetierelor","singular-vocative":"bufetieră","plural-vocative":"bufetierelor"}},{"word":"bufeu","pos":"noun","definitions":["surge of temperature"],"forms":{"plural":"bufeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bufeu","accusative-definite-nominative-singular":"bufeuul","accusative-indefinite-nominative-plural":"bufeuri","accusative-definite-nominative-plural":"bufeurile","dative-genitive-indefinite-singular":"bufeu","dative-definite-genitive-singular":"bufeuului","dative-genitive-indefinite-plural":"bufeuri","dative-definite-genitive-plural":"bufeurilor","singular-vocative":"bufeuule","plural-vocative":"bufeurilor"}},{"word":"buflei","pos":"noun","definitions":["plump"],"forms":{"plural":"buflei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buflei","accusative-definite-nominative-singular":"bufleiul","accusative-indefinite-nominative-plural":"buflei","accusative-definite-nominative-plural":"bufleii","dative-genitive-indefinite-singular":"buflei","dative-definite-genitive-singular":"bufleiului","dative-genitive-indefinite-plural":"buflei","dative-definite-genitive-plural":"bufleilor","singular-vocative":"bufleiule","plural-vocative":"bufleilor"}},{"word":"Bufli","pos":"name","definitions":["a surname"],"gender":"m"},{"word":"bufnă","pos":"noun","definitions":["owl"],"pronunciation":"/ˈbuf.nə/","forms":{"plural":"bufne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufnă","accusative-definite-nominative-singular":"bufna","accusative-indefinite-nominative-plural":"bufne","accusative-definite-nominative-plural":"bufnele","dative-genitive-indefinite-singular":"bufne","dative-definite-genitive-singular":"bufnei","dative-genitive-indefinite-plural":"bufne","dative-definite-genitive-plural":"bufnelor","singular-vocative":"bufnă","plural-vocative":"bufnelor","alternative":"buhnă"}},{"word":"bufne","pos":"noun","definitions":["plural of bufnă"]},{"word":"bufneală","pos":"noun","definitions":["thumping"],"forms":{"plural":"bufneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufneală","accusative-definite-nominative-singular":"bufneala","accusative-indefinite-nominative-plural":"bufnele","accusative-definite-nominative-plural":"bufnelele","dative-genitive-indefinite-singular":"bufnele","dative-definite-genitive-singular":"bufnelei","dative-genitive-indefinite-plural":"bufnele","dative-definite-genitive-plural":"bufnelelor","singular-vocative":"bufneală","plural-vocative":"bufnelelor"}},{"word":"bufnet","pos":"noun","definitions":["thud"],"forms":{"plural":"bufnete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bufnet","accusative-definite-nominative-singular":"bufnetul","accusative-indefinite-nominative-plural":"bufnete","accusative-definite-nominative-plural":"bufnetele","dative-genitive-indefinite-singular":"bufnet","dative-definite-genitive-singular":"bufnetului","dative-genitive-indefinite-plural":"bufnete","dative-definite-genitive-plural":"bufnetelor","singular-vocative":"bufnetule","plural-vocative":"bufnetelor"}},{"word":"bufni","pos":"verb","definitions":["to thump"],"forms":{"canonical":"a bufni 4th conjugation","present-singular-third-person":"bufnește","participle-past":"bufnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bufni","gerund":"bufnind","first-person-indicative-present-singular":"bufnesc","indicative-present-second-person-singular":"bufnești","indicative-present-singular-third-person":"bufnește","first-person-indicative-plural-present":"bufnim","indicative-plural-present-second-person":"bufniți","indicative-plural-present-third-person":"bufnesc","first-person-imperfect-indicative-singular":"bufneam","imperfect-indicative-second-person-singular":"bufneai","imperfect-indicative-singular-third-person":"bufnea","first-person-imperfect-indicative-plural":"bufneam","imperfect-indicative-plural-second-person":"bufneați","imperfect-indicative-plural-third-person":"bufneau","first-person-indicative-perfect-singular":"bufnii","indicative-perfect-second-person-singular":"bufniși","indicative-perfect-singular-third-person":"bufni","first-person-indicative-perfect-plural":"bufnirăm","indicative-perfect-plural-second-person":"bufnirăți","indicative-perfect-plural-third-person":"bufniră","first-person-indicative-pluperfect-singular":"bufnisem","indicative-pluperfect-second-person-singular":"bufniseși","indicative-pluperfect-singular-third-person":"bufnise","first-person-indicative-pluperfect-plural":"bufniserăm","indicative-pluperfect-plural-second-person":"bufniserăți","indicative-pluperfect-plural-third-person":"bufniseră","first-person-present-singular-subjunctive":"să bufnesc","present-second-person-singular-subjunctive":"să bufnești","present-singular-subjunctive-third-person":"să bufnească","first-person-plural-present-subjunctive":"să bufnim","plural-present-second-person-subjunctive":"să bufniți","plural-present-subjunctive-third-person":"să bufnească","imperative-second-person-singular":"bufnește","imperative-plural-second-person":"bufniți","imperative-negative-second-person-singular":"nu bufni","imperative-negative-plural-second-person":"nu bufniți"}},{"word":"bufniță","pos":"noun","definitions":["owl (any bird of the order Strigiformes)","a shrewish woman, harpy"],"pronunciation":"/ˈbuf.ni.t͡sə/","forms":{"plural":"bufnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufniță","accusative-definite-nominative-singular":"bufnița","accusative-indefinite-nominative-plural":"bufnițe","accusative-definite-nominative-plural":"bufnițele","dative-genitive-indefinite-singular":"bufnițe","dative-definite-genitive-singular":"bufniței","dative-genitive-indefinite-plural":"bufnițe","dative-definite-genitive-plural":"bufnițelor","singular-vocative":"bufniță","plural-vocative":"bufnițelor"}},{"word":"bufniță polară","pos":"noun","definitions":["snowy owl (Bubo scandiacus)"],"forms":{"plural":"bufnițe polare"}},{"word":"bufnițe","pos":"noun","definitions":["plural of bufniță"]},{"word":"bufnitură","pos":"noun","definitions":["thud"],"forms":{"plural":"bufnituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufnitură","accusative-definite-nominative-singular":"bufnitura","accusative-indefinite-nominative-plural":"bufniture","accusative-definite-nominative-plural":"bufniturele","dative-genitive-indefinite-singular":"bufniture","dative-definite-genitive-singular":"bufniturei","dative-genitive-indefinite-plural":"bufniture","dative-definite-genitive-plural":"bufniturelor","singular-vocative":"bufnitură","plural-vocative":"bufniturelor"}},{"word":"bufon","pos":"noun","definitions":["a fool; a type of comic, similar to a court jester"],"pronunciation":"/buˈfon/","forms":{"plural":"bufoni","feminine":"equivalent bufonă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bufon","accusative-definite-nominative-singular":"bufonul","accusative-indefinite-nominative-plural":"bufoni","accusative-definite-nominative-plural":"bufonii","dative-genitive-indefinite-singular":"bufon","dative-definite-genitive-singular":"bufonului","dative-genitive-indefinite-plural":"bufoni","dative-definite-genitive-plural":"bufonilor","singular-vocative":"bufonule","plural-vocative":"bufonilor"}},{"word":"bufona","pos":"verb","definitions":["to buffoon"],"forms":{"canonical":"a bufona 1st conjugation","present-singular-third-person":"bufonează","participle-past":"bufonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bufona","gerund":"bufonând","first-person-indicative-present-singular":"bufonez","indicative-present-second-person-singular":"bufonezi","indicative-present-singular-third-person":"bufonează","first-person-indicative-plural-present":"bufonăm","indicative-plural-present-second-person":"bufonați","indicative-plural-present-third-person":"bufonează","first-person-imperfect-indicative-singular":"bufonam","imperfect-indicative-second-person-singular":"bufonai","imperfect-indicative-singular-third-person":"bufona","first-person-imperfect-indicative-plural":"bufonam","imperfect-indicative-plural-second-person":"bufonați","imperfect-indicative-plural-third-person":"bufonau","first-person-indicative-perfect-singular":"bufonai","indicative-perfect-second-person-singular":"bufonași","indicative-perfect-singular-third-person":"bufonă","first-person-indicative-perfect-plural":"bufonarăm","indicative-perfect-plural-second-person":"bufonarăți","indicative-perfect-plural-third-person":"bufonară","first-person-indicative-pluperfect-singular":"bufonasem","indicative-pluperfect-second-person-singular":"bufonaseși","indicative-pluperfect-singular-third-person":"bufonase","first-person-indicative-pluperfect-plural":"bufonaserăm","indicative-pluperfect-plural-second-person":"bufonaserăți","indicative-pluperfect-plural-third-person":"bufonaseră","first-person-present-singular-subjunctive":"să bufonez","present-second-person-singular-subjunctive":"să bufonezi","present-singular-subjunctive-third-person":"să bufoneze","first-person-plural-present-subjunctive":"să bufonăm","plural-present-second-person-subjunctive":"să bufonați","plural-present-subjunctive-third-person":"să bufoneze","imperative-second-person-singular":"bufonează","imperative-plural-second-person":"bufonați","imperative-negative-second-person-singular":"nu bufona","imperative-negative-plural-second-person":"nu bufonați"}},{"word":"bufonadă","pos":"noun","definitions":["buffoonery"],"forms":{"plural":"bufonade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bufonadă","accusative-definite-nominative-singular":"bufonada","accusative-indefinite-nominative-plural":"bufonade","accusative-definite-nominative-plural":"bufonadele","dative-genitive-indefinite-singular":"bufonade","dative-definite-genitive-singular":"bufonadei","dative-genitive-indefinite-plural":"bufonade","dative-definite-genitive-plural":"bufonadelor","singular-vocative":"bufonadă","plural-vocative":"bufonadelor"}},{"word":"bufonerie","pos":"noun","definitions":["buffoonery"],"forms":{"plural":"bufonerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bufonerie","accusative-definite-nominative-singular":"bufoneria","accusative-indefinite-nominative-plural":"bufonerii","accusative-definite-nominative-plural":"bufoneriile","dative-genitive-indefinite-singular":"bufonerii","dative-definite-genitive-singular":"bufoneriei","dative-genitive-indefinite-plural":"bufonerii","dative-definite-genitive-plural":"bufoneriilor","singular-vocative":"bufonerie","plural-vocative":"bufoneriilor"}},{"word":"bufoni","pos":"noun","definitions":["indefinite plural of bufon"],"pronunciation":"[buˈfonʲ]","gender":"m"},{"word":"Buftea","pos":"name","definitions":["a town in Ilfov County, Romania","a surname"],"gender":"f"},{"word":"Buga","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buga"}},{"word":"Bugă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bugă"}},{"word":"Bugeac","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania","Budjak"],"gender":"m"},{"word":"Bugeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bugeanu"}},{"word":"buged","pos":"adj","definitions":["with swollen or puffed up cheeks"],"pronunciation":"/ˈbu.d͡ʒed/","forms":{"feminine-singular":"bugedă","masculine-plural":"bugezi","feminine-neuter-plural":"bugede","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buged","error-unrecognized-form-feminine-indefinite-singular":"bugedă","error-unrecognized-form-indefinite-masculine-plural":"bugezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bugede","definite-error-unrecognized-form-masculine-neuter-singular":"bugedul","definite-error-unrecognized-form-feminine-singular":"bugeda","definite-error-unrecognized-form-masculine-plural":"bugezii","definite-error-unrecognized-form-feminine-neuter-plural":"bugedele","alternative":"buget"}},{"word":"Bugescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bugescu"}},{"word":"buget","pos":"noun","definitions":["budget"],"forms":{"plural":"bugete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buget","accusative-definite-nominative-singular":"bugetul","accusative-indefinite-nominative-plural":"bugete","accusative-definite-nominative-plural":"bugetele","dative-genitive-indefinite-singular":"buget","dative-definite-genitive-singular":"bugetului","dative-genitive-indefinite-plural":"bugete","dative-definite-genitive-plural":"bugetelor","singular-vocative":"bugetule","plural-vocative":"bugetelor"}},{"word":"bugetar","pos":"adj","definitions":["budgetary"],"pronunciation":"/bu.d͡ʒeˈtar/","forms":{"feminine-singular":"bugetară","masculine-plural":"bugetari","feminine-neuter-plural":"bugetare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bugetar","error-unrecognized-form-feminine-indefinite-singular":"bugetară","error-unrecognized-form-indefinite-masculine-plural":"bugetari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bugetare","definite-error-unrecognized-form-masculine-neuter-singular":"bugetarul","definite-error-unrecognized-form-feminine-singular":"bugetara","definite-error-unrecognized-form-masculine-plural":"bugetarii","definite-error-unrecognized-form-feminine-neuter-plural":"bugetarele"}},{"word":"bugetar","pos":"noun","definitions":["state employee, civil servant"],"pronunciation":"/bu.d͡ʒeˈtar/","forms":{"plural":"bugetari","feminine":"equivalent bugetară"}},{"word":"bugetară","pos":"noun","definitions":["female equivalent of bugetar"],"forms":{"plural":"bugetare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bugetară","accusative-definite-nominative-singular":"bugetara","accusative-indefinite-nominative-plural":"bugetare","accusative-definite-nominative-plural":"bugetarele","dative-genitive-indefinite-singular":"bugetare","dative-definite-genitive-singular":"bugetarei","dative-genitive-indefinite-plural":"bugetare","dative-definite-genitive-plural":"bugetarelor","singular-vocative":"bugetară","plural-vocative":"bugetarelor"}},{"word":"bugetivor","pos":"adj","definitions":["budget-hungry"],"forms":{"feminine-singular":"bugetivoră","masculine-plural":"bugetivori","feminine-neuter-plural":"bugetivore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bugetivor","error-unrecognized-form-feminine-indefinite-singular":"bugetivoră","error-unrecognized-form-indefinite-masculine-plural":"bugetivori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bugetivore","definite-error-unrecognized-form-masculine-neuter-singular":"bugetivorul","definite-error-unrecognized-form-feminine-singular":"bugetivora","definite-error-unrecognized-form-masculine-plural":"bugetivorii","definite-error-unrecognized-form-feminine-neuter-plural":"bugetivorele"}},{"word":"Bughea de Jos","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bughea de Jos, Argeș County, Romania","a village in Gura Vitioarei, Prahova County, Romania"],"gender":"f"},{"word":"Bughea de Sus","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Bughea de Sus, Argeș County, Romania","a village in Teișani, Prahova County, Romania"],"gender":"f"},{"word":"Bugheanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bugheanu"}},{"word":"buginit","pos":"adj","definitions":["sleeping"],"forms":{"feminine-singular":"buginită","masculine-plural":"buginiți","feminine-neuter-plural":"buginite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buginit","error-unrecognized-form-feminine-indefinite-singular":"buginită","error-unrecognized-form-indefinite-masculine-plural":"buginiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"buginite","definite-error-unrecognized-form-masculine-neuter-singular":"buginitul","definite-error-unrecognized-form-feminine-singular":"buginita","definite-error-unrecognized-form-masculine-plural":"buginiții","definite-error-unrecognized-form-feminine-neuter-plural":"buginitele"}},{"word":"buginit","pos":"verb","definitions":["past participle of bugini"],"forms":{"participle-past":"of bugini"}},{"word":"Bugnar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bugnar"}},{"word":"Bugnariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bugnariu"}},{"word":"Bugnaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bugnaru"}},{"word":"buh","pos":"noun","definitions":["alternative form of buf"],"pronunciation":"[buh]","forms":{"plural":"buhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buh","accusative-definite-nominative-singular":"buhul","accusative-indefinite-nominative-plural":"buhi","accusative-definite-nominative-plural":"buhii","dative-genitive-indefinite-singular":"buh","dative-definite-genitive-singular":"buhului","dative-genitive-indefinite-plural":"buhi","dative-definite-genitive-plural":"buhilor","singular-vocative":"buhule","plural-vocative":"buhilor","alternative":"buf"}},{"word":"Buha","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buha"}},{"word":"Buhă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhă"}},{"word":"buhă","pos":"noun","definitions":["owl"],"pronunciation":"[ˈbu.hə]","forms":{"plural":"buhe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buhă","accusative-definite-nominative-singular":"buha","accusative-indefinite-nominative-plural":"buhe","accusative-definite-nominative-plural":"buhele","dative-genitive-indefinite-singular":"buhe","dative-definite-genitive-singular":"buhei","dative-genitive-indefinite-plural":"buhe","dative-definite-genitive-plural":"buhelor","singular-vocative":"buhă","plural-vocative":"buhelor","alternative":"bufă"}},{"word":"Buhăceni","pos":"name","definitions":["a village in Trușești, Botoșani County, Romania"],"gender":"m"},{"word":"Buhăeni","pos":"name","definitions":["a village in Andrieșeni, Iași County, Romania"],"gender":"m"},{"word":"Buhăescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buhăescu"}},{"word":"Buhai","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhai"}},{"word":"buhai","pos":"noun","definitions":["bull (uncastrated male of cattle)","common twayblade (Neottia ovata)"],"pronunciation":"/buˈhaj/","forms":{"plural":"buhai","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buhai","accusative-definite-nominative-singular":"buhaiul","accusative-indefinite-nominative-plural":"buhai","accusative-definite-nominative-plural":"buhaii","dative-genitive-indefinite-singular":"buhai","dative-definite-genitive-singular":"buhaiului","dative-genitive-indefinite-plural":"buhai","dative-definite-genitive-plural":"buhailor","singular-vocative":"buhaiule","plural-vocative":"buhailor"}},{"word":"buhai de baltă","pos":"noun","definitions":["Eurasian bittern (Botaurus stellaris)"],"forms":{"plural":"buhai-de-baltă"}},{"word":"buhăiaș","pos":"noun","definitions":["calf"],"forms":{"plural":"buhăieși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buhăiaș","accusative-definite-nominative-singular":"buhăiașul","accusative-indefinite-nominative-plural":"buhăieși","accusative-definite-nominative-plural":"buhăieșii","dative-genitive-indefinite-singular":"buhăiaș","dative-definite-genitive-singular":"buhăiașului","dative-genitive-indefinite-plural":"buhăieși","dative-definite-genitive-plural":"buhăieșilor","singular-vocative":"buhăiașule","plural-vocative":"buhăieșilor"}},{"word":"Buhăiești","pos":"name","definitions":["a village in Vulturești, Vaslui County, Romania"],"gender":"m"},{"word":"buhăit","pos":"adj","definitions":["bloated, bulging"],"forms":{"feminine-singular":"buhăită","masculine-plural":"buhăiți","feminine-neuter-plural":"buhăite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buhăit","error-unrecognized-form-feminine-indefinite-singular":"buhăită","error-unrecognized-form-indefinite-masculine-plural":"buhăiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"buhăite","definite-error-unrecognized-form-masculine-neuter-singular":"buhăitul","definite-error-unrecognized-form-feminine-singular":"buhăita","definite-error-unrecognized-form-masculine-plural":"buhăiții","definite-error-unrecognized-form-feminine-neuter-plural":"buhăitele"}},{"word":"buhăit","pos":"verb","definitions":["past participle of buhăi"],"forms":{"participle-past":"of buhăi"}},{"word":"Buhalnița","pos":"name","definitions":["a river in Iași, Romania, tributary to the Bahlui","a river in Neamț, Romania, tributary to the Bistrița","a village in Ceplenița, Iași County, Romania","a village in Hangu, Neamț County, Romania"],"gender":"f"},{"word":"buhalniță","pos":"noun","definitions":["fog, mist"],"forms":{"plural":"buhalnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buhalniță","accusative-definite-nominative-singular":"buhalnița","accusative-indefinite-nominative-plural":"buhalnițe","accusative-definite-nominative-plural":"buhalnițele","dative-genitive-indefinite-singular":"buhalnițe","dative-definite-genitive-singular":"buhalniței","dative-genitive-indefinite-plural":"buhalnițe","dative-definite-genitive-plural":"buhalnițelor","singular-vocative":"buhalniță","plural-vocative":"buhalnițelor"}},{"word":"Buharu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Buharu"}},{"word":"buhav","pos":"adj","definitions":["alternative form of puhav"],"forms":{"feminine-singular":"buhavă","masculine-plural":"buhavi","feminine-neuter-plural":"buhave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buhav","error-unrecognized-form-feminine-indefinite-singular":"buhavă","error-unrecognized-form-indefinite-masculine-plural":"buhavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"buhave","definite-error-unrecognized-form-masculine-neuter-singular":"buhavul","definite-error-unrecognized-form-feminine-singular":"buhava","definite-error-unrecognized-form-masculine-plural":"buhavii","definite-error-unrecognized-form-feminine-neuter-plural":"buhavele"}},{"word":"Buhnă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhnă"}},{"word":"buhnă","pos":"noun","definitions":["alternative form of bufnă"],"forms":{"plural":"buhne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buhnă","accusative-definite-nominative-singular":"buhna","accusative-indefinite-nominative-plural":"buhne","accusative-definite-nominative-plural":"buhnele","dative-genitive-indefinite-singular":"buhne","dative-definite-genitive-singular":"buhnei","dative-genitive-indefinite-plural":"buhne","dative-definite-genitive-plural":"buhnelor","singular-vocative":"buhnă","plural-vocative":"buhnelor"}},{"word":"Buhnilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhnilă"}},{"word":"Buhocel","pos":"name","definitions":["a village in Buhoci, Bacău County, Romania"],"gender":"m"},{"word":"buhos","pos":"adj","definitions":["unkempt, dishevelled"],"forms":{"feminine-singular":"buhoasă","masculine-plural":"buhoși","feminine-neuter-plural":"buhoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buhos","error-unrecognized-form-feminine-indefinite-singular":"buhoasă","error-unrecognized-form-indefinite-masculine-plural":"buhoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buhoase","definite-error-unrecognized-form-masculine-neuter-singular":"buhosul","definite-error-unrecognized-form-feminine-singular":"buhoasa","definite-error-unrecognized-form-masculine-plural":"buhoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buhoasele"}},{"word":"Buhosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhosu"}},{"word":"Buhuceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buhuceanu"}},{"word":"buhuhu","pos":"intj","definitions":["hoot (cry made by an owl)"]},{"word":"buhur","pos":"noun","definitions":["a type of cloth"],"forms":{"plural":"buhururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"buhur","accusative-definite-nominative-singular":"buhurul","accusative-indefinite-nominative-plural":"buhururi","accusative-definite-nominative-plural":"buhururile","dative-genitive-indefinite-singular":"buhur","dative-definite-genitive-singular":"buhurului","dative-genitive-indefinite-plural":"buhururi","dative-definite-genitive-plural":"buhururilor","singular-vocative":"buhurule","plural-vocative":"buhururilor"}},{"word":"buhurdar","pos":"noun","definitions":["censer"],"forms":{"plural":"buhurdaruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"buhurdar","accusative-definite-nominative-singular":"buhurdarul","accusative-indefinite-nominative-plural":"buhurdaruri","accusative-definite-nominative-plural":"buhurdarurile","dative-genitive-indefinite-singular":"buhurdar","dative-definite-genitive-singular":"buhurdarului","dative-genitive-indefinite-plural":"buhurdaruri","dative-definite-genitive-plural":"buhurdarurilor","singular-vocative":"buhurdarule","plural-vocative":"buhurdarurilor"}},{"word":"buhușean","pos":"adj","definitions":["of, from or relating to Buhuși"],"forms":{"feminine-singular":"buhușeană","masculine-plural":"buhușeni","feminine-neuter-plural":"buhușene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buhușean","error-unrecognized-form-feminine-indefinite-singular":"buhușeană","error-unrecognized-form-indefinite-masculine-plural":"buhușeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"buhușene","definite-error-unrecognized-form-masculine-neuter-singular":"buhușeanul","definite-error-unrecognized-form-feminine-singular":"buhușeana","definite-error-unrecognized-form-masculine-plural":"buhușenii","definite-error-unrecognized-form-feminine-neuter-plural":"buhușenele"}},{"word":"buhușean","pos":"noun","definitions":["native or inhabitant of Buhuși"],"forms":{"plural":"buhușeni","feminine":"equivalent buhușeancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buhușean","accusative-definite-nominative-singular":"buhușeanul","accusative-indefinite-nominative-plural":"buhușeni","accusative-definite-nominative-plural":"buhușenii","dative-genitive-indefinite-singular":"buhușean","dative-definite-genitive-singular":"buhușeanului","dative-genitive-indefinite-plural":"buhușeni","dative-definite-genitive-plural":"buhușenilor","singular-vocative":"buhușeanule","plural-vocative":"buhușenilor"}},{"word":"buhușeancă","pos":"noun","definitions":["female equivalent of buhușean"],"forms":{"plural":"buhușence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buhușeancă","accusative-definite-nominative-singular":"buhușeanca","accusative-indefinite-nominative-plural":"buhușence","accusative-definite-nominative-plural":"buhușencele","dative-genitive-indefinite-singular":"buhușence","dative-definite-genitive-singular":"buhușencei","dative-genitive-indefinite-plural":"buhușence","dative-definite-genitive-plural":"buhușencelor","singular-vocative":"buhușeancă","plural-vocative":"buhușencelor"}},{"word":"Buhuși","pos":"name","definitions":["a town in Bacău County, Romania"],"gender":"m"},{"word":"Buia","pos":"name","definitions":["a village in Șeica Mare, Sibiu County, Romania"],"gender":"f"},{"word":"Buiac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buiac"}},{"word":"buiastru","pos":"adj","definitions":["obsolete form of buiestru"],"forms":{"feminine-singular":"buiastră","masculine-plural":"buiaștri","feminine-neuter-plural":"buiastre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buiastru","error-unrecognized-form-feminine-indefinite-singular":"buiastră","error-unrecognized-form-indefinite-masculine-plural":"buiaștri","error-unrecognized-form-feminine-indefinite-neuter-plural":"buiastre","definite-error-unrecognized-form-masculine-neuter-singular":"buiastrul","definite-error-unrecognized-form-feminine-singular":"buiastra","definite-error-unrecognized-form-masculine-plural":"buiaștrii","definite-error-unrecognized-form-feminine-neuter-plural":"buiastrele"}},{"word":"Buica","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buica"}},{"word":"Buicănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buicănescu"}},{"word":"Buicani","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"m"},{"word":"Buicești","pos":"name","definitions":["a village in Butoiești, Mehedinți County, Romania","a village in Priseaca, Olt County, Romania"],"gender":"m"},{"word":"buici","pos":"verb","definitions":["alternative form of buieci"],"forms":{"canonical":"a buici 4th conjugation","present-singular-third-person":"buicește","participle-past":"buicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buici","gerund":"buicind","first-person-indicative-present-singular":"buicesc","indicative-present-second-person-singular":"buicești","indicative-present-singular-third-person":"buicește","first-person-indicative-plural-present":"buicim","indicative-plural-present-second-person":"buiciți","indicative-plural-present-third-person":"buicesc","first-person-imperfect-indicative-singular":"buiceam","imperfect-indicative-second-person-singular":"buiceai","imperfect-indicative-singular-third-person":"buicea","first-person-imperfect-indicative-plural":"buiceam","imperfect-indicative-plural-second-person":"buiceați","imperfect-indicative-plural-third-person":"buiceau","first-person-indicative-perfect-singular":"buicii","indicative-perfect-second-person-singular":"buiciși","indicative-perfect-singular-third-person":"buici","first-person-indicative-perfect-plural":"buicirăm","indicative-perfect-plural-second-person":"buicirăți","indicative-perfect-plural-third-person":"buiciră","first-person-indicative-pluperfect-singular":"buicisem","indicative-pluperfect-second-person-singular":"buiciseși","indicative-pluperfect-singular-third-person":"buicise","first-person-indicative-pluperfect-plural":"buiciserăm","indicative-pluperfect-plural-second-person":"buiciserăți","indicative-pluperfect-plural-third-person":"buiciseră","first-person-present-singular-subjunctive":"să buicesc","present-second-person-singular-subjunctive":"să buicești","present-singular-subjunctive-third-person":"să buicească","first-person-plural-present-subjunctive":"să buicim","plural-present-second-person-subjunctive":"să buiciți","plural-present-subjunctive-third-person":"să buicească","imperative-second-person-singular":"buicește","imperative-plural-second-person":"buiciți","imperative-negative-second-person-singular":"nu buici","imperative-negative-plural-second-person":"nu buiciți"}},{"word":"Buiculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buiculescu"}},{"word":"buicuță","pos":"noun","definitions":["diminutive of buică"],"forms":{"plural":"buicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buicuță","accusative-definite-nominative-singular":"buicuța","accusative-indefinite-nominative-plural":"buicuțe","accusative-definite-nominative-plural":"buicuțele","dative-genitive-indefinite-singular":"buicuțe","dative-definite-genitive-singular":"buicuței","dative-genitive-indefinite-plural":"buicuțe","dative-definite-genitive-plural":"buicuțelor","singular-vocative":"buicuță","plural-vocative":"buicuțelor"}},{"word":"buiecel","pos":"adj","definitions":["diminutive of buiac"],"forms":{"feminine-singular":"buiecelă","masculine-plural":"buieceli","feminine-neuter-plural":"buiecele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buiecel","error-unrecognized-form-feminine-indefinite-singular":"buiecelă","error-unrecognized-form-indefinite-masculine-plural":"buieceli","error-unrecognized-form-feminine-indefinite-neuter-plural":"buiecele","definite-error-unrecognized-form-masculine-neuter-singular":"buiecelul","definite-error-unrecognized-form-feminine-singular":"buiecela","definite-error-unrecognized-form-masculine-plural":"buiecelii","definite-error-unrecognized-form-feminine-neuter-plural":"buiecelele"}},{"word":"buiecie","pos":"noun","definitions":["vanity"],"forms":{"plural":"buiecii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"buiecie","accusative-definite-nominative-singular":"buiecia","accusative-indefinite-nominative-plural":"buiecii","accusative-definite-nominative-plural":"buieciile","dative-genitive-indefinite-singular":"buiecii","dative-definite-genitive-singular":"buieciei","dative-genitive-indefinite-plural":"buiecii","dative-definite-genitive-plural":"buieciilor","singular-vocative":"buiecie","plural-vocative":"buieciilor"}},{"word":"buiecime","pos":"noun","definitions":["vanity (excessive pride)"],"forms":{"plural":"buiecimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buiecime","accusative-definite-nominative-singular":"buiecimea","accusative-indefinite-nominative-plural":"buiecimi","accusative-definite-nominative-plural":"buiecimile","dative-genitive-indefinite-singular":"buiecimi","dative-definite-genitive-singular":"buiecimii","dative-genitive-indefinite-plural":"buiecimi","dative-definite-genitive-plural":"buiecimilor","singular-vocative":"buiecime","plural-vocative":"buiecimilor"}},{"word":"buiecitură","pos":"noun","definitions":["prosperity"],"forms":{"plural":"buiecituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"buiecitură","accusative-definite-nominative-singular":"buiecitura","accusative-indefinite-nominative-plural":"buiecituri","accusative-definite-nominative-plural":"buieciturile","dative-genitive-indefinite-singular":"buiecituri","dative-definite-genitive-singular":"buieciturii","dative-genitive-indefinite-plural":"buiecituri","dative-definite-genitive-plural":"buieciturilor","singular-vocative":"buiecitură","plural-vocative":"buieciturilor"}},{"word":"buiestraș","pos":"adj","definitions":["ambling","impetuous"],"forms":{"feminine-singular":"buiestrașă","masculine-plural":"buiestrași","feminine-neuter-plural":"buiestrașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buiestraș","error-unrecognized-form-feminine-indefinite-singular":"buiestrașă","error-unrecognized-form-indefinite-masculine-plural":"buiestrași","error-unrecognized-form-feminine-indefinite-neuter-plural":"buiestrașe","definite-error-unrecognized-form-masculine-neuter-singular":"buiestrașul","definite-error-unrecognized-form-feminine-singular":"buiestrașa","definite-error-unrecognized-form-masculine-plural":"buiestrașii","definite-error-unrecognized-form-feminine-neuter-plural":"buiestrașele"}},{"word":"buiestru","pos":"adj","definitions":["ambling, or walking using both legs on one side at the same time","impetuous, excessive"],"pronunciation":"/buˈjes.tru/","forms":{"feminine-singular":"buiastră","masculine-plural":"buieștri","feminine-neuter-plural":"buiestre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buiestru","error-unrecognized-form-feminine-indefinite-singular":"buiastră","error-unrecognized-form-indefinite-masculine-plural":"buieștri","error-unrecognized-form-feminine-indefinite-neuter-plural":"buiestre","definite-error-unrecognized-form-masculine-neuter-singular":"buiestrul","definite-error-unrecognized-form-feminine-singular":"buiastra","definite-error-unrecognized-form-masculine-plural":"buieștrii","definite-error-unrecognized-form-feminine-neuter-plural":"buiestrele"}},{"word":"buiestru","pos":"noun","definitions":["the gait, pace, or movement of a horse in this fashion"],"pronunciation":"/buˈjes.tru/"},{"word":"buimac","pos":"adj","definitions":["disoriented, confused, bewildered, dismayed"],"forms":{"feminine-singular":"buimacă","masculine-plural":"buimaci","feminine-neuter-plural":"buimace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buimac","error-unrecognized-form-feminine-indefinite-singular":"buimacă","error-unrecognized-form-indefinite-masculine-plural":"buimaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"buimace","definite-error-unrecognized-form-masculine-neuter-singular":"buimacul","definite-error-unrecognized-form-feminine-singular":"buimaca","definite-error-unrecognized-form-masculine-plural":"buimacii","definite-error-unrecognized-form-feminine-neuter-plural":"buimacele"}},{"word":"buimăceală","pos":"noun","definitions":["dizziness"],"forms":{"plural":"buimăceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"buimăceală","accusative-definite-nominative-singular":"buimăceala","accusative-indefinite-nominative-plural":"buimăceli","accusative-definite-nominative-plural":"buimăcelile","dative-genitive-indefinite-singular":"buimăceli","dative-definite-genitive-singular":"buimăcelii","dative-genitive-indefinite-plural":"buimăceli","dative-definite-genitive-plural":"buimăcelilor","singular-vocative":"buimăceală","plural-vocative":"buimăcelilor"}},{"word":"Buimăceni","pos":"name","definitions":["a village in Albești, Botoșani County, Romania"],"gender":"m"},{"word":"buimăci","pos":"verb","definitions":["to astound"],"forms":{"canonical":"a buimăci 4th conjugation","present-singular-third-person":"buimăcește","participle-past":"buimăcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buimăci","gerund":"buimăcind","first-person-indicative-present-singular":"buimăcesc","indicative-present-second-person-singular":"buimăcești","indicative-present-singular-third-person":"buimăcește","first-person-indicative-plural-present":"buimăcim","indicative-plural-present-second-person":"buimăciți","indicative-plural-present-third-person":"buimăcesc","first-person-imperfect-indicative-singular":"buimăceam","imperfect-indicative-second-person-singular":"buimăceai","imperfect-indicative-singular-third-person":"buimăcea","first-person-imperfect-indicative-plural":"buimăceam","imperfect-indicative-plural-second-person":"buimăceați","imperfect-indicative-plural-third-person":"buimăceau","first-person-indicative-perfect-singular":"buimăcii","indicative-perfect-second-person-singular":"buimăciși","indicative-perfect-singular-third-person":"buimăci","first-person-indicative-perfect-plural":"buimăcirăm","indicative-perfect-plural-second-person":"buimăcirăți","indicative-perfect-plural-third-person":"buimăciră","first-person-indicative-pluperfect-singular":"buimăcisem","indicative-pluperfect-second-person-singular":"buimăciseși","indicative-pluperfect-singular-third-person":"buimăcise","first-person-indicative-pluperfect-plural":"buimăciserăm","indicative-pluperfect-plural-second-person":"buimăciserăți","indicative-pluperfect-plural-third-person":"buimăciseră","first-person-present-singular-subjunctive":"să buimăcesc","present-second-person-singular-subjunctive":"să buimăcești","present-singular-subjunctive-third-person":"să buimăcească","first-person-plural-present-subjunctive":"să buimăcim","plural-present-second-person-subjunctive":"să buimăciți","plural-present-subjunctive-third-person":"să buimăcească","imperative-second-person-singular":"buimăcește","imperative-plural-second-person":"buimăciți","imperative-negative-second-person-singular":"nu buimăci","imperative-negative-plural-second-person":"nu buimăciți"}},{"word":"buimăcie","pos":"noun","definitions":["dizziness"],"forms":{"plural":"buimăci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"buimăcie","accusative-definite-nominative-singular":"buimăcia","accusative-indefinite-nominative-plural":"buimăci","accusative-definite-nominative-plural":"buimăcile","dative-genitive-indefinite-singular":"buimăci","dative-definite-genitive-singular":"buimăcii","dative-genitive-indefinite-plural":"buimăci","dative-definite-genitive-plural":"buimăcilor","singular-vocative":"buimăcie","plural-vocative":"buimăcilor"}},{"word":"buimăcire","pos":"noun","definitions":["disorientedness, confusion"],"forms":{"plural":"buimăciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buimăcire","accusative-definite-nominative-singular":"buimăcirea","accusative-indefinite-nominative-plural":"buimăciri","accusative-definite-nominative-plural":"buimăcirile","dative-genitive-indefinite-singular":"buimăciri","dative-definite-genitive-singular":"buimăcirii","dative-genitive-indefinite-plural":"buimăciri","dative-definite-genitive-plural":"buimăcirilor","singular-vocative":"buimăcire","plural-vocative":"buimăcirilor"}},{"word":"buimăcit","pos":"adj","definitions":["astounded, bewildered"],"forms":{"feminine-singular":"buimăcită","masculine-plural":"buimăciți","feminine-neuter-plural":"buimăcite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buimăcit","error-unrecognized-form-feminine-indefinite-singular":"buimăcită","error-unrecognized-form-indefinite-masculine-plural":"buimăciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"buimăcite","definite-error-unrecognized-form-masculine-neuter-singular":"buimăcitul","definite-error-unrecognized-form-feminine-singular":"buimăcita","definite-error-unrecognized-form-masculine-plural":"buimăciții","definite-error-unrecognized-form-feminine-neuter-plural":"buimăcitele"}},{"word":"buimăcit","pos":"verb","definitions":["past participle of buimăci"],"forms":{"participle-past":"of buimăci"}},{"word":"buimatic","pos":"adj","definitions":["disoriented, confused"],"forms":{"feminine-singular":"buimatică","masculine-plural":"buimatici","feminine-neuter-plural":"buimatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buimatic","error-unrecognized-form-feminine-indefinite-singular":"buimatică","error-unrecognized-form-indefinite-masculine-plural":"buimatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"buimatice","definite-error-unrecognized-form-masculine-neuter-singular":"buimaticul","definite-error-unrecognized-form-feminine-singular":"buimatica","definite-error-unrecognized-form-masculine-plural":"buimaticii","definite-error-unrecognized-form-feminine-neuter-plural":"buimaticele"}},{"word":"Buinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buinoiu"}},{"word":"Bujan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujan"}},{"word":"bujdă","pos":"noun","definitions":["hut, shanty, hovel"],"forms":{"plural":"bujde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bujdă","accusative-definite-nominative-singular":"bujda","accusative-indefinite-nominative-plural":"bujde","accusative-definite-nominative-plural":"bujdele","dative-genitive-indefinite-singular":"bujde","dative-definite-genitive-singular":"bujdei","dative-genitive-indefinite-plural":"bujde","dative-definite-genitive-plural":"bujdelor","singular-vocative":"bujdă","plural-vocative":"bujdelor"}},{"word":"Bujdei","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujdei"}},{"word":"bujdi","pos":"verb","definitions":["to rush"],"forms":{"canonical":"a bujdi 4th conjugation","present-singular-third-person":"bujdește","participle-past":"bujdit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bujdi","gerund":"bujdind","first-person-indicative-present-singular":"bujdesc","indicative-present-second-person-singular":"bujdești","indicative-present-singular-third-person":"bujdește","first-person-indicative-plural-present":"bujdim","indicative-plural-present-second-person":"bujdiți","indicative-plural-present-third-person":"bujdesc","first-person-imperfect-indicative-singular":"bujdeam","imperfect-indicative-second-person-singular":"bujdeai","imperfect-indicative-singular-third-person":"bujdea","first-person-imperfect-indicative-plural":"bujdeam","imperfect-indicative-plural-second-person":"bujdeați","imperfect-indicative-plural-third-person":"bujdeau","first-person-indicative-perfect-singular":"bujdii","indicative-perfect-second-person-singular":"bujdiși","indicative-perfect-singular-third-person":"bujdi","first-person-indicative-perfect-plural":"bujdirăm","indicative-perfect-plural-second-person":"bujdirăți","indicative-perfect-plural-third-person":"bujdiră","first-person-indicative-pluperfect-singular":"bujdisem","indicative-pluperfect-second-person-singular":"bujdiseși","indicative-pluperfect-singular-third-person":"bujdise","first-person-indicative-pluperfect-plural":"bujdiserăm","indicative-pluperfect-plural-second-person":"bujdiserăți","indicative-pluperfect-plural-third-person":"bujdiseră","first-person-present-singular-subjunctive":"să bujdesc","present-second-person-singular-subjunctive":"să bujdești","present-singular-subjunctive-third-person":"să bujdească","first-person-plural-present-subjunctive":"să bujdim","plural-present-second-person-subjunctive":"să bujdiți","plural-present-subjunctive-third-person":"să bujdească","imperative-second-person-singular":"bujdește","imperative-plural-second-person":"bujdiți","imperative-negative-second-person-singular":"nu bujdi","imperative-negative-plural-second-person":"nu bujdiți"}},{"word":"Bujeniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujeniță"}},{"word":"bujeniță","pos":"noun","definitions":["smoked meat"],"forms":{"plural":"bujenițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bujeniță","accusative-definite-nominative-singular":"bujenița","accusative-indefinite-nominative-plural":"bujenițe","accusative-definite-nominative-plural":"bujenițele","dative-genitive-indefinite-singular":"bujenițe","dative-definite-genitive-singular":"bujeniței","dative-genitive-indefinite-plural":"bujenițe","dative-definite-genitive-plural":"bujenițelor","singular-vocative":"bujeniță","plural-vocative":"bujenițelor","alternative":"буженицэ"}},{"word":"bujie","pos":"noun","definitions":["spark plug"],"forms":{"plural":"bujii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bujie","accusative-definite-nominative-singular":"bujia","accusative-indefinite-nominative-plural":"bujii","accusative-definite-nominative-plural":"bujiile","dative-genitive-indefinite-singular":"bujii","dative-definite-genitive-singular":"bujiei","dative-genitive-indefinite-plural":"bujii","dative-definite-genitive-plural":"bujiilor","singular-vocative":"bujie","plural-vocative":"bujiilor"}},{"word":"Bujiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujiță"}},{"word":"Bujor","pos":"name","definitions":["a village in Vârvoru de Jos, Dolj County, Romania","a village in Miheșu de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"bujor","pos":"noun","definitions":["peony"],"pronunciation":"/buˈʒor/","forms":{"plural":"bujori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bujor","accusative-definite-nominative-singular":"bujorul","accusative-indefinite-nominative-plural":"bujori","accusative-definite-nominative-plural":"bujorii","dative-genitive-indefinite-singular":"bujor","dative-definite-genitive-singular":"bujorului","dative-genitive-indefinite-plural":"bujori","dative-definite-genitive-plural":"bujorilor","singular-vocative":"bujorule","plural-vocative":"bujorilor"}},{"word":"bujor de munte","pos":"noun","definitions":["Rhododendron myrtifolium"]},{"word":"bujor românesc","pos":"noun","definitions":["Paeonia peregrina"],"forms":{"plural":"bujori românești"}},{"word":"Bujor-Hodaie","pos":"name","definitions":["a village in Zau de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"Bujoranu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujoranu"}},{"word":"bujoraș","pos":"noun","definitions":["peony"],"forms":{"plural":"bujorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bujoraș","accusative-definite-nominative-singular":"bujorașul","accusative-indefinite-nominative-plural":"bujorași","accusative-definite-nominative-plural":"bujorașii","dative-genitive-indefinite-singular":"bujoraș","dative-definite-genitive-singular":"bujorașului","dative-genitive-indefinite-plural":"bujorași","dative-definite-genitive-plural":"bujorașilor","singular-vocative":"bujorașule","plural-vocative":"bujorașilor"}},{"word":"Bujorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bujorean"}},{"word":"Bujoreanca","pos":"name","definitions":["a village in Cornești, Dâmbovița County, Romania"],"gender":"f"},{"word":"Bujoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bujoreanu"}},{"word":"Bujorel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujorel"}},{"word":"bujorel","pos":"noun","definitions":["diminutive of bujor; small peony"],"forms":{"plural":"bujorei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bujorel","accusative-definite-nominative-singular":"bujorelul","accusative-indefinite-nominative-plural":"bujoreli","accusative-definite-nominative-plural":"bujorelii","dative-genitive-indefinite-singular":"bujorel","dative-definite-genitive-singular":"bujorelului","dative-genitive-indefinite-plural":"bujoreli","dative-definite-genitive-plural":"bujorelilor","singular-vocative":"bujorelule","plural-vocative":"bujorelilor"}},{"word":"Bujoreni","pos":"name","definitions":["a village in Buzoești, Argeș County, Romania","a commune of Teleorman County, Romania","a village in Bujoreni, Teleorman County, Romania","a commune of Vâlcea County, Romania","a village in Bujoreni, Vâlcea County, Romania"],"gender":"m"},{"word":"Bujorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bujorescu"}},{"word":"Bujorianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujorianu"}},{"word":"Bujorică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujorică"}}];
@@ -0,0 +1 @@
+export default [{"word":"bujorilor","pos":"noun","definitions":["definite genitive/dative plural of bujor"]},{"word":"Bujoriu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bujoriu"}},{"word":"Bujoru","pos":"name","definitions":["a village in Dobra, Hunedoara County, Romania","a commune of Teleorman County, Romania","a village in Bujoru, Teleorman County, Romania","a village in Călmățuiu, Teleorman County, Romania"],"gender":"m"},{"word":"bujorul","pos":"noun","definitions":["definite nominative/accusative singular of bujor"]},{"word":"bujorului","pos":"noun","definitions":["definite genitive/dative singular of bujor"]},{"word":"bulă","pos":"noun","definitions":["bubble"],"forms":{"plural":"bule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulă","accusative-definite-nominative-singular":"bula","accusative-indefinite-nominative-plural":"bule","accusative-definite-nominative-plural":"bulele","dative-genitive-indefinite-singular":"bule","dative-definite-genitive-singular":"bulei","dative-genitive-indefinite-plural":"bule","dative-definite-genitive-plural":"bulelor","singular-vocative":"bulă","plural-vocative":"bulelor"}},{"word":"bulă papală","pos":"noun","definitions":["papal bull"],"forms":{"plural":"bule papale"}},{"word":"Bulăiești","pos":"name","definitions":["a village in Bulăiești, Orhei Raion, Moldova","a commune of Orhei Raion, Moldova"],"gender":"m"},{"word":"bulan","pos":"noun","definitions":["good luck","leg"],"forms":{"plural":"bulane","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulan","accusative-definite-nominative-singular":"bulanul","accusative-indefinite-nominative-plural":"bulani","accusative-definite-nominative-plural":"bulanii","dative-genitive-indefinite-singular":"bulan","dative-definite-genitive-singular":"bulanului","dative-genitive-indefinite-plural":"bulani","dative-definite-genitive-plural":"bulanilor","singular-vocative":"bulanule","plural-vocative":"bulanilor"}},{"word":"bulangioaică","pos":"noun","definitions":["female equivalent of bulangiu"],"forms":{"plural":"bulangioaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"bulangioaică","accusative-definite-nominative-singular":"bulangioaica","accusative-indefinite-nominative-plural":"bulangioaice","accusative-definite-nominative-plural":"bulangioaicele","dative-genitive-indefinite-singular":"bulangioaice","dative-definite-genitive-singular":"bulangioaicei","dative-genitive-indefinite-plural":"bulangioaice","dative-definite-genitive-plural":"bulangioaicelor","singular-vocative":"bulgangioaico","plural-vocative":"bulangioaicelor"}},{"word":"bulangiu","pos":"noun","definitions":["faggot","jackass"],"pronunciation":"/bu.lanˈdʒiw/","forms":{"plural":"bulangii","feminine":"equivalent bulangioaică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulangiu","accusative-definite-nominative-singular":"bulangiul","accusative-indefinite-nominative-plural":"bulangii","accusative-definite-nominative-plural":"bulangiii","dative-genitive-indefinite-singular":"bulangiu","dative-definite-genitive-singular":"bulangiului","dative-genitive-indefinite-plural":"bulangii","dative-definite-genitive-plural":"bulangiilor","singular-vocative":"bulangiule","plural-vocative":"bulangiilor"}},{"word":"Bulat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulat"}},{"word":"bulău","pos":"noun","definitions":["prison"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bulău","accusative-definite-nominative":"bulăul","dative-genitive-indefinite":"bulău","dative-definite-genitive":"bulăului","vocative":"bulăule"}},{"word":"bulb","pos":"noun","definitions":["bulb"],"forms":{"plural":"bulbi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulb","accusative-definite-nominative-singular":"bulbul","accusative-indefinite-nominative-plural":"bulbi","accusative-definite-nominative-plural":"bulbii","dative-genitive-indefinite-singular":"bulb","dative-definite-genitive-singular":"bulbului","dative-genitive-indefinite-plural":"bulbi","dative-definite-genitive-plural":"bulbilor","singular-vocative":"bulbule","plural-vocative":"bulbilor"}},{"word":"bulbac","pos":"noun","definitions":["foreigner"],"forms":{"plural":"bulbaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulbac","accusative-definite-nominative-singular":"bulbacul","accusative-indefinite-nominative-plural":"bulbaci","accusative-definite-nominative-plural":"bulbacii","dative-genitive-indefinite-singular":"bulbac","dative-definite-genitive-singular":"bulbacului","dative-genitive-indefinite-plural":"bulbaci","dative-definite-genitive-plural":"bulbacilor","singular-vocative":"bulbacule","plural-vocative":"bulbacilor"}},{"word":"bulbar","pos":"adj","definitions":["bulbar"],"forms":{"feminine-singular":"bulbară","masculine-plural":"bulbari","feminine-neuter-plural":"bulbare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulbar","error-unrecognized-form-feminine-indefinite-singular":"bulbară","error-unrecognized-form-indefinite-masculine-plural":"bulbari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulbare","definite-error-unrecognized-form-masculine-neuter-singular":"bulbarul","definite-error-unrecognized-form-feminine-singular":"bulbara","definite-error-unrecognized-form-masculine-plural":"bulbarii","definite-error-unrecognized-form-feminine-neuter-plural":"bulbarele"}},{"word":"bulbifer","pos":"adj","definitions":["bulbiferous"],"forms":{"feminine-singular":"bulbiferă","masculine-plural":"bulbiferi","feminine-neuter-plural":"bulbifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulbifer","error-unrecognized-form-feminine-indefinite-singular":"bulbiferă","error-unrecognized-form-indefinite-masculine-plural":"bulbiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulbifere","definite-error-unrecognized-form-masculine-neuter-singular":"bulbiferul","definite-error-unrecognized-form-feminine-singular":"bulbifera","definite-error-unrecognized-form-masculine-plural":"bulbiferii","definite-error-unrecognized-form-feminine-neuter-plural":"bulbiferele"}},{"word":"bulbiform","pos":"adj","definitions":["bulbiform"],"forms":{"feminine-singular":"bulbiformă","masculine-plural":"bulbiformi","feminine-neuter-plural":"bulbiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulbiform","error-unrecognized-form-feminine-indefinite-singular":"bulbiformă","error-unrecognized-form-indefinite-masculine-plural":"bulbiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulbiforme","definite-error-unrecognized-form-masculine-neuter-singular":"bulbiformul","definite-error-unrecognized-form-feminine-singular":"bulbiforma","definite-error-unrecognized-form-masculine-plural":"bulbiformii","definite-error-unrecognized-form-feminine-neuter-plural":"bulbiformele"}},{"word":"bulbil","pos":"noun","definitions":["bulbil"],"forms":{"plural":"bulbili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulbil","accusative-definite-nominative-singular":"bulbilul","accusative-indefinite-nominative-plural":"bulbili","accusative-definite-nominative-plural":"bulbilii","dative-genitive-indefinite-singular":"bulbil","dative-definite-genitive-singular":"bulbilului","dative-genitive-indefinite-plural":"bulbili","dative-definite-genitive-plural":"bulbililor","singular-vocative":"bulbilule","plural-vocative":"bulbililor"}},{"word":"Bulboaca","pos":"name","definitions":["a village in Bulboaca, Anenii Noi Raion, Moldova","a village in Bulboaca, Briceni Raion, Moldova","a commune of Anenii Noi Raion, Moldova","a commune of Briceni Raion, Moldova","a village in Deleni, Vaslui County, Romania"],"gender":"f"},{"word":"Bulboacă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulboacă"}},{"word":"bulboacă","pos":"noun","definitions":["whirlpool, vortex"],"forms":{"plural":"bulboace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulboacă","accusative-definite-nominative-singular":"bulboaca","accusative-indefinite-nominative-plural":"bulboace","accusative-definite-nominative-plural":"bulboacele","dative-genitive-indefinite-singular":"bulboace","dative-definite-genitive-singular":"bulboacei","dative-genitive-indefinite-plural":"bulboace","dative-definite-genitive-plural":"bulboacelor","singular-vocative":"bulboacă","plural-vocative":"bulboacelor"}},{"word":"bulboană","pos":"noun","definitions":["eddy, vortex"],"forms":{"plural":"bulboane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulboană","accusative-definite-nominative-singular":"bulboana","accusative-indefinite-nominative-plural":"bulboane","accusative-definite-nominative-plural":"bulboanele","dative-genitive-indefinite-singular":"bulboane","dative-definite-genitive-singular":"bulboanei","dative-genitive-indefinite-plural":"bulboane","dative-definite-genitive-plural":"bulboanelor","singular-vocative":"bulboană","plural-vocative":"bulboanelor"}},{"word":"Bulboci","pos":"name","definitions":["a village in Bulboci, Soroca Raion, Moldova","a commune of Soroca Raion, Moldova"],"gender":"m"},{"word":"Bulbocii Noi","pos":"name","definitions":["a village in Bulboci, Soroca Raion, Moldova"],"gender":"m"},{"word":"bulbos","pos":"adj","definitions":["bulbous"],"forms":{"feminine-singular":"bulboasă","masculine-plural":"bulboși","feminine-neuter-plural":"bulboase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulbos","error-unrecognized-form-feminine-indefinite-singular":"bulboasă","error-unrecognized-form-indefinite-masculine-plural":"bulboși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulboase","definite-error-unrecognized-form-masculine-neuter-singular":"bulbosul","definite-error-unrecognized-form-feminine-singular":"bulboasa","definite-error-unrecognized-form-masculine-plural":"bulboșii","definite-error-unrecognized-form-feminine-neuter-plural":"bulboasele"}},{"word":"Bulbuc","pos":"name","definitions":["a village in Ceru-Băcăinți, Alba County, Romania"],"gender":"m"},{"word":"bulbuc","pos":"noun","definitions":["bubble"],"forms":{"plural":"bulbuci"}},{"word":"bulbuca","pos":"verb","definitions":["to goggle, ogle"],"pronunciation":"[bul.buˈka]","forms":{"canonical":"a bulbuca 1st conjugation","present-singular-third-person":"bulbucă","participle-past":"bulbucat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bulbuca","gerund":"bulbucând","first-person-indicative-present-singular":"bulbuc","indicative-present-second-person-singular":"bulbuci","indicative-present-singular-third-person":"bulbucă","first-person-indicative-plural-present":"bulbucăm","indicative-plural-present-second-person":"bulbucați","indicative-plural-present-third-person":"bulbucă","first-person-imperfect-indicative-singular":"bulbucam","imperfect-indicative-second-person-singular":"bulbucai","imperfect-indicative-singular-third-person":"bulbuca","first-person-imperfect-indicative-plural":"bulbucam","imperfect-indicative-plural-second-person":"bulbucați","imperfect-indicative-plural-third-person":"bulbucau","first-person-indicative-perfect-singular":"bulbucai","indicative-perfect-second-person-singular":"bulbucași","indicative-perfect-singular-third-person":"bulbucă","first-person-indicative-perfect-plural":"bulbucarăm","indicative-perfect-plural-second-person":"bulbucarăți","indicative-perfect-plural-third-person":"bulbucară","first-person-indicative-pluperfect-singular":"bulbucasem","indicative-pluperfect-second-person-singular":"bulbucaseși","indicative-pluperfect-singular-third-person":"bulbucase","first-person-indicative-pluperfect-plural":"bulbucaserăm","indicative-pluperfect-plural-second-person":"bulbucaserăți","indicative-pluperfect-plural-third-person":"bulbucaseră","first-person-present-singular-subjunctive":"să bulbuc","present-second-person-singular-subjunctive":"să bulbuci","present-singular-subjunctive-third-person":"să bulbuce","first-person-plural-present-subjunctive":"să bulbucăm","plural-present-second-person-subjunctive":"să bulbucați","plural-present-subjunctive-third-person":"să bulbuce","imperative-second-person-singular":"bulbucă","imperative-plural-second-person":"bulbucați","imperative-negative-second-person-singular":"nu bulbuca","imperative-negative-plural-second-person":"nu bulbucați"}},{"word":"Bulbucan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bulbucan"}},{"word":"Bulbucani","pos":"name","definitions":["a village in Gropnița, Iași County, Romania"],"gender":"m"},{"word":"bulbucat","pos":"adj","definitions":["bulging"],"forms":{"feminine-singular":"bulbucată","masculine-plural":"bulbucați","feminine-neuter-plural":"bulbucate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulbucat","error-unrecognized-form-feminine-indefinite-singular":"bulbucată","error-unrecognized-form-indefinite-masculine-plural":"bulbucați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulbucate","definite-error-unrecognized-form-masculine-neuter-singular":"bulbucatul","definite-error-unrecognized-form-feminine-singular":"bulbucata","definite-error-unrecognized-form-masculine-plural":"bulbucații","definite-error-unrecognized-form-feminine-neuter-plural":"bulbucatele"}},{"word":"Bulbucata","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Bulbucata, Giurgiu County, Romania"],"gender":"f"},{"word":"bulbucătură","pos":"noun","definitions":["swelling"],"forms":{"plural":"bulbucături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bulbucătură","accusative-definite-nominative-singular":"bulbucătura","accusative-indefinite-nominative-plural":"bulbucături","accusative-definite-nominative-plural":"bulbucăturile","dative-genitive-indefinite-singular":"bulbucături","dative-definite-genitive-singular":"bulbucăturii","dative-genitive-indefinite-plural":"bulbucături","dative-definite-genitive-plural":"bulbucăturilor","singular-vocative":"bulbucătură","plural-vocative":"bulbucăturilor"}},{"word":"bulbuceală","pos":"noun","definitions":["bubbling"],"forms":{"plural":"bulbuceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bulbuceală","accusative-definite-nominative-singular":"bulbuceala","accusative-indefinite-nominative-plural":"bulbuceli","accusative-definite-nominative-plural":"bulbucelile","dative-genitive-indefinite-singular":"bulbuceli","dative-definite-genitive-singular":"bulbucelii","dative-genitive-indefinite-plural":"bulbuceli","dative-definite-genitive-plural":"bulbucelilor","singular-vocative":"bulbuceală","plural-vocative":"bulbucelilor"}},{"word":"bulbucel","pos":"noun","definitions":["diminutive of bulbuc"],"forms":{"plural":"bulbucei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulbucel","accusative-definite-nominative-singular":"bulbucelul","accusative-indefinite-nominative-plural":"bulbucei","accusative-definite-nominative-plural":"bulbuceii","dative-genitive-indefinite-singular":"bulbucel","dative-definite-genitive-singular":"bulbucelului","dative-genitive-indefinite-plural":"bulbucei","dative-definite-genitive-plural":"bulbuceilor","singular-vocative":"bulbucelule","plural-vocative":"bulbuceilor"}},{"word":"Bulbuceni","pos":"name","definitions":["a village in Căpreni, Gorj County, Romania"],"gender":"m"},{"word":"bulbuci","pos":"verb","definitions":["to make bubbles"],"forms":{"canonical":"a bulbuci 4th conjugation","present-singular-third-person":"bulbucie","participle-past":"bulbucit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a bulbuci","gerund":"bulbucind","first-person-indicative-present-singular":"bulbuc","indicative-present-second-person-singular":"bulbuci","indicative-present-singular-third-person":"bulbuce","first-person-indicative-plural-present":"bulbucim","indicative-plural-present-second-person":"bulbuciți","indicative-plural-present-third-person":"bulbuc","first-person-imperfect-indicative-singular":"bulbuceam","imperfect-indicative-second-person-singular":"bulbuceai","imperfect-indicative-singular-third-person":"bulbucea","first-person-imperfect-indicative-plural":"bulbuceam","imperfect-indicative-plural-second-person":"bulbuceați","imperfect-indicative-plural-third-person":"bulbuceau","first-person-indicative-perfect-singular":"bulbucii","indicative-perfect-second-person-singular":"bulbuciși","indicative-perfect-singular-third-person":"bulbuci","first-person-indicative-perfect-plural":"bulbucirăm","indicative-perfect-plural-second-person":"bulbucirăți","indicative-perfect-plural-third-person":"bulbuciră","first-person-indicative-pluperfect-singular":"bulbucisem","indicative-pluperfect-second-person-singular":"bulbuciseși","indicative-pluperfect-singular-third-person":"bulbucise","first-person-indicative-pluperfect-plural":"bulbuciserăm","indicative-pluperfect-plural-second-person":"bulbuciserăți","indicative-pluperfect-plural-third-person":"bulbuciseră","first-person-present-singular-subjunctive":"să bulbuc","present-second-person-singular-subjunctive":"să bulbuci","present-singular-subjunctive-third-person":"să bulbucă","first-person-plural-present-subjunctive":"să bulbucim","plural-present-second-person-subjunctive":"să bulbuciți","plural-present-subjunctive-third-person":"să bulbucă","imperative-second-person-singular":"bulbuce","imperative-plural-second-person":"bulbuciți","imperative-negative-second-person-singular":"nu bulbuci","imperative-negative-plural-second-person":"nu bulbuciți"}},{"word":"bulbucuț","pos":"noun","definitions":["diminutive of bulbuc"],"forms":{"plural":"bulbucuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulbucuț","accusative-definite-nominative-singular":"bulbucuțul","accusative-indefinite-nominative-plural":"bulbucuți","accusative-definite-nominative-plural":"bulbucuții","dative-genitive-indefinite-singular":"bulbucuț","dative-definite-genitive-singular":"bulbucuțului","dative-genitive-indefinite-plural":"bulbucuți","dative-definite-genitive-plural":"bulbucuților","singular-vocative":"bulbucuțule","plural-vocative":"bulbucuților"}},{"word":"Bulcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulcă"}},{"word":"Bulci","pos":"name","definitions":["a village in Bata, Arad County, Romania"],"gender":"m"},{"word":"buldog","pos":"noun","definitions":["bulldog"],"forms":{"plural":"buldogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buldog","accusative-definite-nominative-singular":"buldogul","accusative-indefinite-nominative-plural":"buldogi","accusative-definite-nominative-plural":"buldogii","dative-genitive-indefinite-singular":"buldog","dative-definite-genitive-singular":"buldogului","dative-genitive-indefinite-plural":"buldogi","dative-definite-genitive-plural":"buldogilor","singular-vocative":"buldogule","plural-vocative":"buldogilor"}},{"word":"buldog american","pos":"noun","definitions":["American Bulldog"],"forms":{"plural":"buldogi americani"}},{"word":"buldozer","pos":"noun","definitions":["bulldozer"],"forms":{"plural":"buldozere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buldozer","accusative-definite-nominative-singular":"buldozerul","accusative-indefinite-nominative-plural":"buldozere","accusative-definite-nominative-plural":"buldozerele","dative-genitive-indefinite-singular":"buldozer","dative-definite-genitive-singular":"buldozerului","dative-genitive-indefinite-plural":"buldozere","dative-definite-genitive-plural":"buldozerelor","singular-vocative":"buldozerule","plural-vocative":"buldozerelor"}},{"word":"buldozerist","pos":"adj","definitions":["bulldozer operator"],"forms":{"feminine-singular":"buldozeristă","masculine-plural":"buldozeriști","feminine-neuter-plural":"buldozeriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buldozerist","error-unrecognized-form-feminine-indefinite-singular":"buldozeristă","error-unrecognized-form-indefinite-masculine-plural":"buldozeriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"buldozeriste","definite-error-unrecognized-form-masculine-neuter-singular":"buldozeristul","definite-error-unrecognized-form-feminine-singular":"buldozerista","definite-error-unrecognized-form-masculine-plural":"buldozeriștii","definite-error-unrecognized-form-feminine-neuter-plural":"buldozeristele"}},{"word":"buldozeristă","pos":"noun","definitions":["female equivalent of buldozerist"],"forms":{"plural":"buldozeriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buldozeristă","accusative-definite-nominative-singular":"buldozerista","accusative-indefinite-nominative-plural":"buldozeriste","accusative-definite-nominative-plural":"buldozeristele","dative-genitive-indefinite-singular":"buldozeriste","dative-definite-genitive-singular":"buldozeristei","dative-genitive-indefinite-plural":"buldozeriste","dative-definite-genitive-plural":"buldozeristelor","singular-vocative":"buldozeristă","plural-vocative":"buldozeristelor"}},{"word":"Bulduș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulduș"}},{"word":"Buleandră","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buleandră"}},{"word":"buleandră","pos":"noun","definitions":["old, threadbare cloth","promiscuous woman, prostitute"],"forms":{"plural":"bulendre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buleandră","accusative-definite-nominative-singular":"buleandra","accusative-indefinite-nominative-plural":"bulendre","accusative-definite-nominative-plural":"bulendrele","dative-genitive-indefinite-singular":"bulendre","dative-definite-genitive-singular":"bulendrei","dative-genitive-indefinite-plural":"bulendre","dative-definite-genitive-plural":"bulendrelor","singular-vocative":"buleandră","plural-vocative":"bulendrelor"}},{"word":"bulet","pos":"noun","definitions":["fetlock"],"forms":{"plural":"buleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulet","accusative-definite-nominative-singular":"buletul","accusative-indefinite-nominative-plural":"buleți","accusative-definite-nominative-plural":"buleții","dative-genitive-indefinite-singular":"bulet","dative-definite-genitive-singular":"buletului","dative-genitive-indefinite-plural":"buleți","dative-definite-genitive-plural":"buleților","singular-vocative":"buletule","plural-vocative":"buleților"}},{"word":"Buleteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buleteanu"}},{"word":"buletin","pos":"noun","definitions":["bulletin","ID card"],"forms":{"plural":"buletine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buletin","accusative-definite-nominative-singular":"buletinul","accusative-indefinite-nominative-plural":"buletine","accusative-definite-nominative-plural":"buletinele","dative-genitive-indefinite-singular":"buletin","dative-definite-genitive-singular":"buletinului","dative-genitive-indefinite-plural":"buletine","dative-definite-genitive-plural":"buletinelor","singular-vocative":"buletinule","plural-vocative":"buletinelor"}},{"word":"buletin de vot","pos":"noun","definitions":["ballot paper"],"forms":{"plural":"buletine de vot"}},{"word":"buletin meteorologic","pos":"noun","definitions":["weather report"],"forms":{"plural":"buletine meteorologice"}},{"word":"bulevard","pos":"noun","definitions":["boulevard (broad, landscaped thoroughfare)"],"pronunciation":"/bu.leˈvard/","forms":{"plural":"bulevarde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulevard","accusative-definite-nominative-singular":"bulevardul","accusative-indefinite-nominative-plural":"bulevarde","accusative-definite-nominative-plural":"bulevardele","dative-genitive-indefinite-singular":"bulevard","dative-definite-genitive-singular":"bulevardului","dative-genitive-indefinite-plural":"bulevarde","dative-definite-genitive-plural":"bulevardelor","singular-vocative":"bulevardule","plural-vocative":"bulevardelor"}},{"word":"bulevardier","pos":"noun","definitions":["boulevardier"],"forms":{"plural":"bulevardieri","feminine":"equivalent bulevardieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulevardier","accusative-definite-nominative-singular":"bulevardierul","accusative-indefinite-nominative-plural":"bulevardieri","accusative-definite-nominative-plural":"bulevardierii","dative-genitive-indefinite-singular":"bulevardier","dative-definite-genitive-singular":"bulevardierului","dative-genitive-indefinite-plural":"bulevardieri","dative-definite-genitive-plural":"bulevardierilor","singular-vocative":"bulevardierule","plural-vocative":"bulevardierilor"}},{"word":"bulevardieră","pos":"noun","definitions":["female equivalent of bulevardier"],"forms":{"plural":"bulevardiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulevardieră","accusative-definite-nominative-singular":"bulevardiera","accusative-indefinite-nominative-plural":"bulevardiere","accusative-definite-nominative-plural":"bulevardierele","dative-genitive-indefinite-singular":"bulevardiere","dative-definite-genitive-singular":"bulevardierei","dative-genitive-indefinite-plural":"bulevardiere","dative-definite-genitive-plural":"bulevardierelor","singular-vocative":"bulevardieră","plural-vocative":"bulevardierelor"}},{"word":"bulevardistă","pos":"noun","definitions":["female equivalent of bulevardist"],"forms":{"plural":"bulevardiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulevardistă","accusative-definite-nominative-singular":"bulevardista","accusative-indefinite-nominative-plural":"bulevardiste","accusative-definite-nominative-plural":"bulevardistele","dative-genitive-indefinite-singular":"bulevardiste","dative-definite-genitive-singular":"bulevardistei","dative-genitive-indefinite-plural":"bulevardiste","dative-definite-genitive-plural":"bulevardistelor","singular-vocative":"bulevardistă","plural-vocative":"bulevardistelor"}},{"word":"Bulgar","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Bulgar"}},{"word":"bulgar","pos":"adj","definitions":["Bulgarian"],"pronunciation":"[bulˈɡar]","forms":{"feminine-singular":"bulgară","masculine-plural":"bulgari","feminine-neuter-plural":"bulgare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulgar","error-unrecognized-form-feminine-indefinite-singular":"bulgară","error-unrecognized-form-indefinite-masculine-plural":"bulgari","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulgare","definite-error-unrecognized-form-masculine-neuter-singular":"bulgarul","definite-error-unrecognized-form-feminine-singular":"bulgara","definite-error-unrecognized-form-masculine-plural":"bulgarii","definite-error-unrecognized-form-feminine-neuter-plural":"bulgarele"}},{"word":"bulgar","pos":"noun","definitions":["a Bulgarian man"],"pronunciation":"[bulˈɡar]","forms":{"plural":"bulgari","feminine":"equivalent bulgară","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulgar","accusative-definite-nominative-singular":"bulgarul","accusative-indefinite-nominative-plural":"bulgari","accusative-definite-nominative-plural":"bulgarii","dative-genitive-indefinite-singular":"bulgar","dative-definite-genitive-singular":"bulgarului","dative-genitive-indefinite-plural":"bulgari","dative-definite-genitive-plural":"bulgarilor","singular-vocative":"bulgarule","plural-vocative":"bulgarilor"}},{"word":"Bulgăr","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulgăr"}},{"word":"bulgăr","pos":"noun","definitions":["alternative form of bulgăre"],"forms":{"plural":"bulgări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulgăr","accusative-definite-nominative-singular":"bulgărul","accusative-indefinite-nominative-plural":"bulgări","accusative-definite-nominative-plural":"bulgării","dative-genitive-indefinite-singular":"bulgăr","dative-definite-genitive-singular":"bulgărului","dative-genitive-indefinite-plural":"bulgări","dative-definite-genitive-plural":"bulgărilor","singular-vocative":"bulgărule","plural-vocative":"bulgărilor"}},{"word":"bulgara","pos":"noun","definitions":["definite nominative/accusative singular of bulgară"],"pronunciation":"[bulˈɡara]","gender":"f"},{"word":"bulgară","pos":"adj","definitions":["feminine singular nominative/accusative of bulgar (“Bulgarian”)"],"pronunciation":"[bulˈɡa.rə]"},{"word":"bulgară","pos":"noun","definitions":["female equivalent of bulgar (“Bulgarian”)"],"pronunciation":"[bulˈɡa.rə]","forms":{"plural":"bulgare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulgară","accusative-definite-nominative-singular":"bulgara","accusative-indefinite-nominative-plural":"bulgare","accusative-definite-nominative-plural":"bulgarele","dative-genitive-indefinite-singular":"bulgare","dative-definite-genitive-singular":"bulgarei","dative-genitive-indefinite-plural":"bulgare","dative-definite-genitive-plural":"bulgarelor","singular-vocative":"bulgară","plural-vocative":"bulgarelor"}},{"word":"bulgară","pos":"noun","definitions":["Bulgarian (language)"],"pronunciation":"[bulˈɡa.rə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bulgară","accusative-definite-nominative":"bulgara","dative-genitive-indefinite":"bulgare","dative-definite-genitive":"bulgarei","vocative":"bulgară"}},{"word":"bulgăraș","pos":"noun","definitions":["diminutive of bulgăr; small snowball"],"forms":{"plural":"bulgărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulgăraș","accusative-definite-nominative-singular":"bulgărașul","accusative-indefinite-nominative-plural":"bulgărași","accusative-definite-nominative-plural":"bulgărașii","dative-genitive-indefinite-singular":"bulgăraș","dative-definite-genitive-singular":"bulgărașului","dative-genitive-indefinite-plural":"bulgărași","dative-definite-genitive-plural":"bulgărașilor","singular-vocative":"bulgărașule","plural-vocative":"bulgărașilor"}},{"word":"Bulgărașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulgărașu"}},{"word":"bulgare","pos":"adj","definitions":["feminine/neuter plural of bulgar"],"pronunciation":"/bulˈɡa.re/","gender":"f-p"},{"word":"Bulgăre","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulgăre"}},{"word":"bulgăre","pos":"noun","definitions":["clod","snowball"],"forms":{"plural":"bulgări","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"bulgăre","accusative-definite-nominative-singular":"bulgărele","accusative-indefinite-nominative-plural":"bulgări","accusative-definite-nominative-plural":"bulgării","dative-genitive-indefinite-singular":"bulgăre","dative-definite-genitive-singular":"bulgărelui","dative-genitive-indefinite-plural":"bulgări","dative-definite-genitive-plural":"bulgărilor","singular-vocative":"bulgăre","plural-vocative":"bulgărilor"}},{"word":"bulgăre de zăpadă","pos":"noun","definitions":["snowball"],"forms":{"plural":"bulgări de zăpadă"}},{"word":"bulgărească","pos":"adj","definitions":["feminine singular of bulgăresc"],"pronunciation":"[bulɡəˈre̯as.kə]","gender":"f"},{"word":"bulgărel","pos":"noun","definitions":["diminutive of bulgăr"],"forms":{"plural":"bulgărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulgărel","accusative-definite-nominative-singular":"bulgărelul","accusative-indefinite-nominative-plural":"bulgărei","accusative-definite-nominative-plural":"bulgăreii","dative-genitive-indefinite-singular":"bulgărel","dative-definite-genitive-singular":"bulgărelului","dative-genitive-indefinite-plural":"bulgărei","dative-definite-genitive-plural":"bulgăreilor","singular-vocative":"bulgărelule","plural-vocative":"bulgăreilor"}},{"word":"Bulgăreni","pos":"name","definitions":["a village in Lupeni, Harghita County, Romania"],"gender":"m"},{"word":"bulgăresc","pos":"adj","definitions":["Bulgarian"],"pronunciation":"[bulɡəˈresk]","examples":[{"ro":"mâncare bulgărească","en":"Bulgarian food"}],"forms":{"feminine-singular":"bulgărească","plural":"bulgărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulgăresc","error-unrecognized-form-feminine-indefinite-singular":"bulgărească","error-unrecognized-form-indefinite-masculine-plural":"bulgărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulgărești","definite-error-unrecognized-form-masculine-neuter-singular":"bulgărescul","definite-error-unrecognized-form-feminine-singular":"bulgăreasca","definite-error-unrecognized-form-masculine-plural":"bulgăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"bulgăreștile"}},{"word":"Bulgărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bulgărescu"}},{"word":"bulgărește","pos":"adv","definitions":["like a Bulgarian","in Bulgarian (the language)"],"pronunciation":"[bul.ɡəˈreʃ.te]","examples":[{"ro":"Știi să vorbești bulgărește?","en":"Do you know how to speak (in) Bulgarian?"}]},{"word":"bulgărești","pos":"adj","definitions":["plural of bulgăresc"],"pronunciation":"[bulɡəˈreʃtʲ]"},{"word":"Bulgari","pos":"name","definitions":["a village in Sălățig, Sălaj County, Romania"],"gender":"m"},{"word":"bulgari","pos":"noun","definitions":["plural of bulgar"]},{"word":"bulgări","pos":"verb","definitions":["to throw snowballs towards someone"],"forms":{"canonical":"a bulgări 4th conjugation","present-singular-third-person":"bulgărește","participle-past":"bulgărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bulgări","gerund":"bulgărind","first-person-indicative-present-singular":"bulgăresc","indicative-present-second-person-singular":"bulgărești","indicative-present-singular-third-person":"bulgărește","first-person-indicative-plural-present":"bulgărim","indicative-plural-present-second-person":"bulgăriți","indicative-plural-present-third-person":"bulgăresc","first-person-imperfect-indicative-singular":"bulgăream","imperfect-indicative-second-person-singular":"bulgăreai","imperfect-indicative-singular-third-person":"bulgărea","first-person-imperfect-indicative-plural":"bulgăream","imperfect-indicative-plural-second-person":"bulgăreați","imperfect-indicative-plural-third-person":"bulgăreau","first-person-indicative-perfect-singular":"bulgării","indicative-perfect-second-person-singular":"bulgăriși","indicative-perfect-singular-third-person":"bulgări","first-person-indicative-perfect-plural":"bulgărirăm","indicative-perfect-plural-second-person":"bulgărirăți","indicative-perfect-plural-third-person":"bulgăriră","first-person-indicative-pluperfect-singular":"bulgărisem","indicative-pluperfect-second-person-singular":"bulgăriseși","indicative-pluperfect-singular-third-person":"bulgărise","first-person-indicative-pluperfect-plural":"bulgăriserăm","indicative-pluperfect-plural-second-person":"bulgăriserăți","indicative-pluperfect-plural-third-person":"bulgăriseră","first-person-present-singular-subjunctive":"să bulgăresc","present-second-person-singular-subjunctive":"să bulgărești","present-singular-subjunctive-third-person":"să bulgărească","first-person-plural-present-subjunctive":"să bulgărim","plural-present-second-person-subjunctive":"să bulgăriți","plural-present-subjunctive-third-person":"să bulgărească","imperative-second-person-singular":"bulgărește","imperative-plural-second-person":"bulgăriți","imperative-negative-second-person-singular":"nu bulgări","imperative-negative-plural-second-person":"nu bulgăriți"}},{"word":"Bulgaria","pos":"name","definitions":["Bulgaria (a country in Southeast Europe)"],"pronunciation":"/bulˈɡa.rja/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Bulgarie","accusative-definite-nominative":"Bulgaria","dative-genitive-indefinite":"Bulgarii","dative-definite-genitive":"Bulgariei","vocative":"Bulgarie"}},{"word":"bulgărie","pos":"noun","definitions":["kitchen garden"],"forms":{"plural":"bulgării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bulgărie","accusative-definite-nominative-singular":"bulgăria","accusative-indefinite-nominative-plural":"bulgării","accusative-definite-nominative-plural":"bulgăriile","dative-genitive-indefinite-singular":"bulgării","dative-definite-genitive-singular":"bulgăriei","dative-genitive-indefinite-plural":"bulgării","dative-definite-genitive-plural":"bulgăriilor","singular-vocative":"bulgărie","plural-vocative":"bulgăriilor"}},{"word":"bulgăriilor","pos":"noun","definitions":["definite genitive/dative plural of bulgărie"]},{"word":"bulgărime","pos":"noun","definitions":["Bulgarians"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"bulgărime","accusative-definite-nominative":"bulgărimea","dative-genitive-indefinite":"bulgărimi","dative-definite-genitive":"bulgărimii","vocative":"bulgărime"}},{"word":"bulgărism","pos":"noun","definitions":["a loanword from Bulgarian"],"forms":{"plural":"bulgărisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulgărism","accusative-definite-nominative-singular":"bulgărismul","accusative-indefinite-nominative-plural":"bulgărisme","accusative-definite-nominative-plural":"bulgărismele","dative-genitive-indefinite-singular":"bulgărism","dative-definite-genitive-singular":"bulgărismului","dative-genitive-indefinite-plural":"bulgărisme","dative-definite-genitive-plural":"bulgărismelor","singular-vocative":"bulgărismule","plural-vocative":"bulgărismelor"}},{"word":"bulgăriță","pos":"noun","definitions":["female equivalent of bulgar"],"forms":{"plural":"bulgărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulgăriță","accusative-definite-nominative-singular":"bulgărița","accusative-indefinite-nominative-plural":"bulgărițe","accusative-definite-nominative-plural":"bulgărițele","dative-genitive-indefinite-singular":"bulgărițe","dative-definite-genitive-singular":"bulgăriței","dative-genitive-indefinite-plural":"bulgărițe","dative-definite-genitive-plural":"bulgărițelor","singular-vocative":"bulgăriță","plural-vocative":"bulgărițelor"}},{"word":"Bulgariu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Bulgariu"}},{"word":"bulgariza","pos":"verb","definitions":["to Bulgarianize"],"forms":{"canonical":"a bulgariza 1st conjugation","present-singular-third-person":"bulgarizează","participle-past":"bulgarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bulgariza","gerund":"bulgarizând","first-person-indicative-present-singular":"bulgarizez","indicative-present-second-person-singular":"bulgarizezi","indicative-present-singular-third-person":"bulgarizează","first-person-indicative-plural-present":"bulgarizăm","indicative-plural-present-second-person":"bulgarizați","indicative-plural-present-third-person":"bulgarizează","first-person-imperfect-indicative-singular":"bulgarizam","imperfect-indicative-second-person-singular":"bulgarizai","imperfect-indicative-singular-third-person":"bulgariza","first-person-imperfect-indicative-plural":"bulgarizam","imperfect-indicative-plural-second-person":"bulgarizați","imperfect-indicative-plural-third-person":"bulgarizau","first-person-indicative-perfect-singular":"bulgarizai","indicative-perfect-second-person-singular":"bulgarizași","indicative-perfect-singular-third-person":"bulgariză","first-person-indicative-perfect-plural":"bulgarizarăm","indicative-perfect-plural-second-person":"bulgarizarăți","indicative-perfect-plural-third-person":"bulgarizară","first-person-indicative-pluperfect-singular":"bulgarizasem","indicative-pluperfect-second-person-singular":"bulgarizaseși","indicative-pluperfect-singular-third-person":"bulgarizase","first-person-indicative-pluperfect-plural":"bulgarizaserăm","indicative-pluperfect-plural-second-person":"bulgarizaserăți","indicative-pluperfect-plural-third-person":"bulgarizaseră","first-person-present-singular-subjunctive":"să bulgarizez","present-second-person-singular-subjunctive":"să bulgarizezi","present-singular-subjunctive-third-person":"să bulgarizeze","first-person-plural-present-subjunctive":"să bulgarizăm","plural-present-second-person-subjunctive":"să bulgarizați","plural-present-subjunctive-third-person":"să bulgarizeze","imperative-second-person-singular":"bulgarizează","imperative-plural-second-person":"bulgarizați","imperative-negative-second-person-singular":"nu bulgariza","imperative-negative-plural-second-person":"nu bulgarizați"}},{"word":"bulgarizat","pos":"noun","definitions":["Bulgarization"],"forms":{"plural":"bulgarizaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bulgarizat","accusative-definite-nominative-singular":"bulgarizatul","accusative-indefinite-nominative-plural":"bulgarizaturi","accusative-definite-nominative-plural":"bulgarizaturile","dative-genitive-indefinite-singular":"bulgarizat","dative-definite-genitive-singular":"bulgarizatului","dative-genitive-indefinite-plural":"bulgarizaturi","dative-definite-genitive-plural":"bulgarizaturilor","singular-vocative":"bulgarizatule","plural-vocative":"bulgarizaturilor"}},{"word":"bulgarizat","pos":"verb","definitions":["past participle of bulgariza"],"forms":{"participle-past":"of bulgariza"}},{"word":"bulgaro","pos":"noun","definitions":["vocative singular of bulgară"],"pronunciation":"[bulˈɡaro]","gender":"f"},{"word":"bulgăroaică","pos":"noun","definitions":["female equivalent of bulgar"],"forms":{"plural":"bulgăroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulgăroaică","accusative-definite-nominative-singular":"bulgăroaica","accusative-indefinite-nominative-plural":"bulgăroaice","accusative-definite-nominative-plural":"bulgăroaicele","dative-genitive-indefinite-singular":"bulgăroaice","dative-definite-genitive-singular":"bulgăroaicei","dative-genitive-indefinite-plural":"bulgăroaice","dative-definite-genitive-plural":"bulgăroaicelor","singular-vocative":"bulgăroaică","plural-vocative":"bulgăroaicelor"}},{"word":"bulgăroi","pos":"noun","definitions":["augmentative of bulgar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"bulgăroi","accusative-definite-nominative":"bulgăroiul","dative-genitive-indefinite":"bulgăroi","dative-definite-genitive":"bulgăroiului","vocative":"bulgăroiule"}},{"word":"Bulgaru","pos":"name","definitions":["a surname originating as an ethnonym"],"pronunciation":"/bulˈɡa.ru/","gender":"m","forms":{"dative-genitive":"lui Bulgaru"}},{"word":"Bulgăruș","pos":"name","definitions":["a village in Lenauheim, Timiș County, Romania"],"gender":"m"},{"word":"bulgur","pos":"noun","definitions":["bulgur"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bulgur","accusative-definite-nominative":"bulgurul","dative-genitive-indefinite":"bulgur","dative-definite-genitive":"bulgurului","vocative":"bulgurule"}},{"word":"Bulhac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulhac"}},{"word":"bulhac","pos":"noun","definitions":["a puddle"],"forms":{"plural":"bulhace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulhac","accusative-definite-nominative-singular":"bulhacul","accusative-indefinite-nominative-plural":"bulhace","accusative-definite-nominative-plural":"bulhacele","dative-genitive-indefinite-singular":"bulhac","dative-definite-genitive-singular":"bulhacului","dative-genitive-indefinite-plural":"bulhace","dative-definite-genitive-plural":"bulhacelor","singular-vocative":"bulhacule","plural-vocative":"bulhacelor"}},{"word":"buli","pos":"verb","definitions":["to deteriorate"],"forms":{"canonical":"a buli 4th conjugation","present-singular-third-person":"bulește","participle-past":"bulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buli","gerund":"bulind","first-person-indicative-present-singular":"bulesc","indicative-present-second-person-singular":"bulești","indicative-present-singular-third-person":"bulește","first-person-indicative-plural-present":"bulim","indicative-plural-present-second-person":"buliți","indicative-plural-present-third-person":"bulesc","first-person-imperfect-indicative-singular":"buleam","imperfect-indicative-second-person-singular":"buleai","imperfect-indicative-singular-third-person":"bulea","first-person-imperfect-indicative-plural":"buleam","imperfect-indicative-plural-second-person":"buleați","imperfect-indicative-plural-third-person":"buleau","first-person-indicative-perfect-singular":"bulii","indicative-perfect-second-person-singular":"buliși","indicative-perfect-singular-third-person":"buli","first-person-indicative-perfect-plural":"bulirăm","indicative-perfect-plural-second-person":"bulirăți","indicative-perfect-plural-third-person":"buliră","first-person-indicative-pluperfect-singular":"bulisem","indicative-pluperfect-second-person-singular":"buliseși","indicative-pluperfect-singular-third-person":"bulise","first-person-indicative-pluperfect-plural":"buliserăm","indicative-pluperfect-plural-second-person":"buliserăți","indicative-pluperfect-plural-third-person":"buliseră","first-person-present-singular-subjunctive":"să bulesc","present-second-person-singular-subjunctive":"să bulești","present-singular-subjunctive-third-person":"să bulească","first-person-plural-present-subjunctive":"să bulim","plural-present-second-person-subjunctive":"să buliți","plural-present-subjunctive-third-person":"să bulească","imperative-second-person-singular":"bulește","imperative-plural-second-person":"buliți","imperative-negative-second-person-singular":"nu buli","imperative-negative-plural-second-person":"nu buliți"}},{"word":"Bulibașa","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bulibașa"}},{"word":"bulibașă","pos":"noun","definitions":["leader of a group of Gypsies"],"forms":{"plural":"bulibași"}},{"word":"bulibășeală","pos":"noun","definitions":["disorder"],"forms":{"plural":"bulibășeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulibășeală","accusative-definite-nominative-singular":"bulibășeala","accusative-indefinite-nominative-plural":"bulibășele","accusative-definite-nominative-plural":"bulibășelele","dative-genitive-indefinite-singular":"bulibășele","dative-definite-genitive-singular":"bulibășelei","dative-genitive-indefinite-plural":"bulibășele","dative-definite-genitive-plural":"bulibășelelor","singular-vocative":"bulibășeală","plural-vocative":"bulibășelelor"}},{"word":"bulibăși","pos":"verb","definitions":["to mix up, to confuse"],"forms":{"canonical":"a bulibăși 4th conjugation","present-singular-third-person":"bulibășește","participle-past":"bulibășit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bulibăși","gerund":"bulibășind","first-person-indicative-present-singular":"bulibășesc","indicative-present-second-person-singular":"bulibășești","indicative-present-singular-third-person":"bulibășește","first-person-indicative-plural-present":"bulibășim","indicative-plural-present-second-person":"bulibășiți","indicative-plural-present-third-person":"bulibășesc","first-person-imperfect-indicative-singular":"bulibășeam","imperfect-indicative-second-person-singular":"bulibășeai","imperfect-indicative-singular-third-person":"bulibășea","first-person-imperfect-indicative-plural":"bulibășeam","imperfect-indicative-plural-second-person":"bulibășeați","imperfect-indicative-plural-third-person":"bulibășeau","first-person-indicative-perfect-singular":"bulibășii","indicative-perfect-second-person-singular":"bulibășiși","indicative-perfect-singular-third-person":"bulibăși","first-person-indicative-perfect-plural":"bulibășirăm","indicative-perfect-plural-second-person":"bulibășirăți","indicative-perfect-plural-third-person":"bulibășiră","first-person-indicative-pluperfect-singular":"bulibășisem","indicative-pluperfect-second-person-singular":"bulibășiseși","indicative-pluperfect-singular-third-person":"bulibășise","first-person-indicative-pluperfect-plural":"bulibășiserăm","indicative-pluperfect-plural-second-person":"bulibășiserăți","indicative-pluperfect-plural-third-person":"bulibășiseră","first-person-present-singular-subjunctive":"să bulibășesc","present-second-person-singular-subjunctive":"să bulibășești","present-singular-subjunctive-third-person":"să bulibășească","first-person-plural-present-subjunctive":"să bulibășim","plural-present-second-person-subjunctive":"să bulibășiți","plural-present-subjunctive-third-person":"să bulibășească","imperative-second-person-singular":"bulibășește","imperative-plural-second-person":"bulibășiți","imperative-negative-second-person-singular":"nu bulibăși","imperative-negative-plural-second-person":"nu bulibășiți"}},{"word":"Bulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulică"}},{"word":"Buligan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buligan"}},{"word":"Buligescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buligescu"}},{"word":"bulimic","pos":"adj","definitions":["bulimic"],"forms":{"feminine-singular":"bulimică","masculine-plural":"bulimici","feminine-neuter-plural":"bulimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulimic","error-unrecognized-form-feminine-indefinite-singular":"bulimică","error-unrecognized-form-indefinite-masculine-plural":"bulimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulimice","definite-error-unrecognized-form-masculine-neuter-singular":"bulimicul","definite-error-unrecognized-form-feminine-singular":"bulimica","definite-error-unrecognized-form-masculine-plural":"bulimicii","definite-error-unrecognized-form-feminine-neuter-plural":"bulimicele"}},{"word":"bulimică","pos":"noun","definitions":["female equivalent of bulimic"],"forms":{"plural":"bulimice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulimică","accusative-definite-nominative-singular":"bulimica","accusative-indefinite-nominative-plural":"bulimice","accusative-definite-nominative-plural":"bulimicele","dative-genitive-indefinite-singular":"bulimice","dative-definite-genitive-singular":"bulimicei","dative-genitive-indefinite-plural":"bulimice","dative-definite-genitive-plural":"bulimicelor","singular-vocative":"bulimică","plural-vocative":"bulimicelor"}},{"word":"bulimie","pos":"noun","definitions":["bulimia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bulimie","accusative-definite-nominative":"bulimia","dative-genitive-indefinite":"bulimii","dative-definite-genitive":"bulimiei","vocative":"bulimie"}},{"word":"bulin","pos":"noun","definitions":["pill, tablet (such as for medicine)","spot, dot (design on clothing)"],"forms":{"plural":"buline","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulin","accusative-definite-nominative-singular":"bulinul","accusative-indefinite-nominative-plural":"buline","accusative-definite-nominative-plural":"bulinele","dative-genitive-indefinite-singular":"bulin","dative-definite-genitive-singular":"bulinului","dative-genitive-indefinite-plural":"buline","dative-definite-genitive-plural":"bulinelor","singular-vocative":"bulinule","plural-vocative":"bulinelor","alternative":"bulină"}},{"word":"bulină","pos":"noun","definitions":["bowline"],"forms":{"plural":"buline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulină","accusative-definite-nominative-singular":"bulina","accusative-indefinite-nominative-plural":"buline","accusative-definite-nominative-plural":"bulinele","dative-genitive-indefinite-singular":"buline","dative-definite-genitive-singular":"bulinei","dative-genitive-indefinite-plural":"buline","dative-definite-genitive-plural":"bulinelor","singular-vocative":"bulină","plural-vocative":"bulinelor"}},{"word":"bulion","pos":"noun","definitions":["bouillon, broth","a tomato sauce or paste"],"forms":{"plural":"bulioane"}},{"word":"bulldog american","pos":"noun","definitions":["alternative form of buldog american"],"forms":{"plural":"bulldogi americani"}},{"word":"bulon","pos":"noun","definitions":["bolt (metal part)","penis"],"pronunciation":"/buˈlon/","forms":{"plural":"buloane","alternative":"булон"}},{"word":"bulona","pos":"verb","definitions":["To bolt (on)"],"forms":{"canonical":"a bulona 1st conjugation","present-singular-third-person":"bulonează","participle-past":"bulonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bulona","gerund":"bulonând","first-person-indicative-present-singular":"bulonez","indicative-present-second-person-singular":"bulonezi","indicative-present-singular-third-person":"bulonează","first-person-indicative-plural-present":"bulonăm","indicative-plural-present-second-person":"bulonați","indicative-plural-present-third-person":"bulonează","first-person-imperfect-indicative-singular":"bulonam","imperfect-indicative-second-person-singular":"bulonai","imperfect-indicative-singular-third-person":"bulona","first-person-imperfect-indicative-plural":"bulonam","imperfect-indicative-plural-second-person":"bulonați","imperfect-indicative-plural-third-person":"bulonau","first-person-indicative-perfect-singular":"bulonai","indicative-perfect-second-person-singular":"bulonași","indicative-perfect-singular-third-person":"bulonă","first-person-indicative-perfect-plural":"bulonarăm","indicative-perfect-plural-second-person":"bulonarăți","indicative-perfect-plural-third-person":"bulonară","first-person-indicative-pluperfect-singular":"bulonasem","indicative-pluperfect-second-person-singular":"bulonaseși","indicative-pluperfect-singular-third-person":"bulonase","first-person-indicative-pluperfect-plural":"bulonaserăm","indicative-pluperfect-plural-second-person":"bulonaserăți","indicative-pluperfect-plural-third-person":"bulonaseră","first-person-present-singular-subjunctive":"să bulonez","present-second-person-singular-subjunctive":"să bulonezi","present-singular-subjunctive-third-person":"să buloneze","first-person-plural-present-subjunctive":"să bulonăm","plural-present-second-person-subjunctive":"să bulonați","plural-present-subjunctive-third-person":"să buloneze","imperative-second-person-singular":"bulonează","imperative-plural-second-person":"bulonați","imperative-negative-second-person-singular":"nu bulona","imperative-negative-plural-second-person":"nu bulonați"}},{"word":"bulonaj","pos":"noun","definitions":["bolting"],"forms":{"plural":"bulonaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulonaj","accusative-definite-nominative-singular":"bulonajul","accusative-indefinite-nominative-plural":"bulonaje","accusative-definite-nominative-plural":"bulonajele","dative-genitive-indefinite-singular":"bulonaj","dative-definite-genitive-singular":"bulonajului","dative-genitive-indefinite-plural":"bulonaje","dative-definite-genitive-plural":"bulonajelor","singular-vocative":"bulonajule","plural-vocative":"bulonajelor"}},{"word":"bulubașă","pos":"noun","definitions":["obsolete form of bulucbașă"],"forms":{"plural":"bulubași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulubașă","accusative-definite-nominative-singular":"bulubașăul","accusative-indefinite-nominative-plural":"bulubași","accusative-definite-nominative-plural":"bulubașii","dative-genitive-indefinite-singular":"bulubașă","dative-definite-genitive-singular":"bulubașăului","dative-genitive-indefinite-plural":"bulubași","dative-definite-genitive-plural":"bulubașilor","singular-vocative":"bulubașăule","plural-vocative":"bulubașilor"}},{"word":"buluc","pos":"noun","definitions":["company","a band, gang of armed men","a large crowd","pile, heap"],"forms":{"plural":"bulucuri"}},{"word":"bulucbaș","pos":"noun","definitions":["obsolete form of bulucbașă"],"forms":{"plural":"bulucbași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulucbaș","accusative-definite-nominative-singular":"bulucbașul","accusative-indefinite-nominative-plural":"bulucbași","accusative-definite-nominative-plural":"bulucbașii","dative-genitive-indefinite-singular":"bulucbaș","dative-definite-genitive-singular":"bulucbașului","dative-genitive-indefinite-plural":"bulucbași","dative-definite-genitive-plural":"bulucbașilor","singular-vocative":"bulucbașule","plural-vocative":"bulucbașilor"}},{"word":"bulucbașă","pos":"noun","definitions":["commander of a company"],"forms":{"plural":"bulucbași","table-tags":"no-table-tags","accusative-indefinite-nominative-singular":"bulucbașă","accusative-definite-nominative-singular":"bulucbașa","accusative-indefinite-nominative-plural":"bulucbași","accusative-definite-nominative-plural":"bulucbașii","dative-genitive-indefinite-singular":"bulucbașă","dative-definite-genitive-singular":"bulucbașei","dative-genitive-indefinite-plural":"bulucbași","dative-definite-genitive-plural":"bulucbașilor","singular-vocative":"bulucbașă","plural-vocative":"bulucbașilor"}},{"word":"buluceală","pos":"noun","definitions":["stacking, accumulation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"buluceală","accusative-definite-nominative":"buluceala","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"buluceală"}},{"word":"buluci","pos":"verb","definitions":["to crowd, to crowd together","to cram, to crowd","to gather, come together"],"pronunciation":"/bu.luˈt͡ʃi/","forms":{"canonical":"a buluci 4th conjugation","present-singular-third-person":"bulucește","participle-past":"bulucit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buluci","gerund":"bulucind","first-person-indicative-present-singular":"bulucesc","indicative-present-second-person-singular":"bulucești","indicative-present-singular-third-person":"bulucește","first-person-indicative-plural-present":"bulucim","indicative-plural-present-second-person":"buluciți","indicative-plural-present-third-person":"bulucesc","first-person-imperfect-indicative-singular":"buluceam","imperfect-indicative-second-person-singular":"buluceai","imperfect-indicative-singular-third-person":"bulucea","first-person-imperfect-indicative-plural":"buluceam","imperfect-indicative-plural-second-person":"buluceați","imperfect-indicative-plural-third-person":"buluceau","first-person-indicative-perfect-singular":"bulucii","indicative-perfect-second-person-singular":"buluciși","indicative-perfect-singular-third-person":"buluci","first-person-indicative-perfect-plural":"bulucirăm","indicative-perfect-plural-second-person":"bulucirăți","indicative-perfect-plural-third-person":"buluciră","first-person-indicative-pluperfect-singular":"bulucisem","indicative-pluperfect-second-person-singular":"buluciseși","indicative-pluperfect-singular-third-person":"bulucise","first-person-indicative-pluperfect-plural":"buluciserăm","indicative-pluperfect-plural-second-person":"buluciserăți","indicative-pluperfect-plural-third-person":"buluciseră","first-person-present-singular-subjunctive":"să bulucesc","present-second-person-singular-subjunctive":"să bulucești","present-singular-subjunctive-third-person":"să bulucească","first-person-plural-present-subjunctive":"să bulucim","plural-present-second-person-subjunctive":"să buluciți","plural-present-subjunctive-third-person":"să bulucească","imperative-second-person-singular":"bulucește","imperative-plural-second-person":"buluciți","imperative-negative-second-person-singular":"nu buluci","imperative-negative-plural-second-person":"nu buluciți"}},{"word":"Bulugheană","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulugheană"}},{"word":"bulugheană","pos":"noun","definitions":["potato"],"forms":{"plural":"bulughene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bulugheană","accusative-definite-nominative-singular":"bulugheana","accusative-indefinite-nominative-plural":"bulughene","accusative-definite-nominative-plural":"bulughenele","dative-genitive-indefinite-singular":"bulughene","dative-definite-genitive-singular":"bulughenei","dative-genitive-indefinite-plural":"bulughene","dative-definite-genitive-plural":"bulughenelor","singular-vocative":"bulugheană","plural-vocative":"bulughenelor"}},{"word":"Bulumac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulumac"}},{"word":"bulumac","pos":"noun","definitions":["fencepost"],"forms":{"plural":"bulumaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulumac","accusative-definite-nominative-singular":"bulumacul","accusative-indefinite-nominative-plural":"bulumaci","accusative-definite-nominative-plural":"bulumacii","dative-genitive-indefinite-singular":"bulumac","dative-definite-genitive-singular":"bulumacului","dative-genitive-indefinite-plural":"bulumaci","dative-definite-genitive-plural":"bulumacilor","singular-vocative":"bulumacule","plural-vocative":"bulumacilor"}},{"word":"bulvan","pos":"noun","definitions":["alternative form of bălvan"],"forms":{"plural":"bulvani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulvan","accusative-definite-nominative-singular":"bulvanul","accusative-indefinite-nominative-plural":"bulvani","accusative-definite-nominative-plural":"bulvanii","dative-genitive-indefinite-singular":"bulvan","dative-definite-genitive-singular":"bulvanului","dative-genitive-indefinite-plural":"bulvani","dative-definite-genitive-plural":"bulvanilor","singular-vocative":"bulvanule","plural-vocative":"bulvanilor"}},{"word":"bulversa","pos":"verb","definitions":["to upset"],"forms":{"canonical":"a bulversa 1st conjugation","present-singular-third-person":"bulversează","participle-past":"bulversat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bulversa","gerund":"bulversând","first-person-indicative-present-singular":"bulversez","indicative-present-second-person-singular":"bulversezi","indicative-present-singular-third-person":"bulversează","first-person-indicative-plural-present":"bulversăm","indicative-plural-present-second-person":"bulversați","indicative-plural-present-third-person":"bulversează","first-person-imperfect-indicative-singular":"bulversam","imperfect-indicative-second-person-singular":"bulversai","imperfect-indicative-singular-third-person":"bulversa","first-person-imperfect-indicative-plural":"bulversam","imperfect-indicative-plural-second-person":"bulversați","imperfect-indicative-plural-third-person":"bulversau","first-person-indicative-perfect-singular":"bulversai","indicative-perfect-second-person-singular":"bulversași","indicative-perfect-singular-third-person":"bulversă","first-person-indicative-perfect-plural":"bulversarăm","indicative-perfect-plural-second-person":"bulversarăți","indicative-perfect-plural-third-person":"bulversară","first-person-indicative-pluperfect-singular":"bulversasem","indicative-pluperfect-second-person-singular":"bulversaseși","indicative-pluperfect-singular-third-person":"bulversase","first-person-indicative-pluperfect-plural":"bulversaserăm","indicative-pluperfect-plural-second-person":"bulversaserăți","indicative-pluperfect-plural-third-person":"bulversaseră","first-person-present-singular-subjunctive":"să bulversez","present-second-person-singular-subjunctive":"să bulversezi","present-singular-subjunctive-third-person":"să bulverseze","first-person-plural-present-subjunctive":"să bulversăm","plural-present-second-person-subjunctive":"să bulversați","plural-present-subjunctive-third-person":"să bulverseze","imperative-second-person-singular":"bulversează","imperative-plural-second-person":"bulversați","imperative-negative-second-person-singular":"nu bulversa","imperative-negative-plural-second-person":"nu bulversați"}},{"word":"bulversare","pos":"noun","definitions":["upheaval"],"forms":{"plural":"bulversări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bulversare","accusative-definite-nominative-singular":"bulversarea","accusative-indefinite-nominative-plural":"bulversări","accusative-definite-nominative-plural":"bulversările","dative-genitive-indefinite-singular":"bulversări","dative-definite-genitive-singular":"bulversării","dative-genitive-indefinite-plural":"bulversări","dative-definite-genitive-plural":"bulversărilor","singular-vocative":"bulversare","plural-vocative":"bulversărilor"}},{"word":"bulversat","pos":"adj","definitions":["upset"],"forms":{"feminine-singular":"bulversată","masculine-plural":"bulversați","feminine-neuter-plural":"bulversate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bulversat","error-unrecognized-form-feminine-indefinite-singular":"bulversată","error-unrecognized-form-indefinite-masculine-plural":"bulversați","error-unrecognized-form-feminine-indefinite-neuter-plural":"bulversate","definite-error-unrecognized-form-masculine-neuter-singular":"bulversatul","definite-error-unrecognized-form-feminine-singular":"bulversata","definite-error-unrecognized-form-masculine-plural":"bulversații","definite-error-unrecognized-form-feminine-neuter-plural":"bulversatele"}},{"word":"Bulz","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulz"}},{"word":"bulz","pos":"noun","definitions":["unboiled lump of cankered cereals","clod, ball, lump"],"forms":{"canonical-masculine":"bulz n bulz","plural":"bulzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bulz","accusative-definite-nominative-singular":"bulzul","accusative-indefinite-nominative-plural":"bulzuri","accusative-definite-nominative-plural":"bulzurile","dative-genitive-indefinite-singular":"bulz","dative-definite-genitive-singular":"bulzului","dative-genitive-indefinite-plural":"bulzuri","dative-definite-genitive-plural":"bulzurilor","singular-vocative":"bulzule","plural-vocative":"bulzurilor","alternative":"bulg"}},{"word":"Bulzan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulzan"}},{"word":"Bulzești","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Bulzești, Dolj County, Romania"],"gender":"m"},{"word":"Bulzeștii de Jos","pos":"name","definitions":["a village in Bulzeștii de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"Bulzeștii de Sus","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Bulzeștii de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"bulziș","pos":"adv","definitions":["crowdedly"]},{"word":"bulzișor","pos":"noun","definitions":["diminutive of bulz"],"forms":{"plural":"bulzișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bulzișor","accusative-definite-nominative-singular":"bulzișorul","accusative-indefinite-nominative-plural":"bulzișori","accusative-definite-nominative-plural":"bulzișorii","dative-genitive-indefinite-singular":"bulzișor","dative-definite-genitive-singular":"bulzișorului","dative-genitive-indefinite-plural":"bulzișori","dative-definite-genitive-plural":"bulzișorilor","singular-vocative":"bulzișorule","plural-vocative":"bulzișorilor"}},{"word":"bulzoc","pos":"noun","definitions":["clod, lump, ball"],"forms":{"plural":"bulzoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bulzoc","accusative-definite-nominative-singular":"bulzocul","accusative-indefinite-nominative-plural":"bulzoace","accusative-definite-nominative-plural":"bulzoacele","dative-genitive-indefinite-singular":"bulzoc","dative-definite-genitive-singular":"bulzocului","dative-genitive-indefinite-plural":"bulzoace","dative-definite-genitive-plural":"bulzoacelor","singular-vocative":"bulzocule","plural-vocative":"bulzoacelor"}},{"word":"Bulzu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bulzu"}},{"word":"bulzului","pos":"noun","definitions":["definite genitive/dative singular of bulz"]},{"word":"bulzurilor","pos":"noun","definitions":["definite genitive/dative plural of bulz"]},{"word":"bum","pos":"intj","definitions":["boom"]},{"word":"bumașcă","pos":"noun","definitions":["Russian banknote"],"pronunciation":"/buˈmaʃ.kə/","forms":{"plural":"bumăști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumașcă","accusative-definite-nominative-singular":"bumașca","accusative-indefinite-nominative-plural":"bumăște","accusative-definite-nominative-plural":"bumăștele","dative-genitive-indefinite-singular":"bumăște","dative-definite-genitive-singular":"bumăștei","dative-genitive-indefinite-plural":"bumăște","dative-definite-genitive-plural":"bumăștelor","singular-vocative":"bumașcă","plural-vocative":"bumăștelor"}},{"word":"bumb","pos":"noun","definitions":["button (for clothing)"],"pronunciation":"/bumb/","forms":{"plural":"bumbi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumb","accusative-definite-nominative-singular":"bumbul","accusative-indefinite-nominative-plural":"bumbi","accusative-definite-nominative-plural":"bumbii","dative-genitive-indefinite-singular":"bumb","dative-definite-genitive-singular":"bumbului","dative-genitive-indefinite-plural":"bumbi","dative-definite-genitive-plural":"bumbilor","singular-vocative":"bumbule","plural-vocative":"bumbilor"}},{"word":"Bumbac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bumbac"}},{"word":"bumbac","pos":"noun","definitions":["cotton"],"pronunciation":"[bumˈbak]","forms":{"plural":"bumbaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbac","accusative-definite-nominative-singular":"bumbacul","accusative-indefinite-nominative-plural":"bumbaci","accusative-definite-nominative-plural":"bumbacii","dative-genitive-indefinite-singular":"bumbac","dative-definite-genitive-singular":"bumbacului","dative-genitive-indefinite-plural":"bumbaci","dative-definite-genitive-plural":"bumbacilor","singular-vocative":"bumbacule","plural-vocative":"bumbacilor"}},{"word":"bumbac","pos":"noun","definitions":["cotton"],"pronunciation":"[bumˈbak]","forms":{"plural":"bumbacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bumbac","accusative-definite-nominative-singular":"bumbacul","accusative-indefinite-nominative-plural":"bumbacuri","accusative-definite-nominative-plural":"bumbacurile","dative-genitive-indefinite-singular":"bumbac","dative-definite-genitive-singular":"bumbacului","dative-genitive-indefinite-plural":"bumbacuri","dative-definite-genitive-plural":"bumbacurilor","singular-vocative":"bumbacule","plural-vocative":"bumbacurilor"}},{"word":"bumbăcar","pos":"noun","definitions":["cotton worker"],"forms":{"plural":"bumbăcari","feminine":"equivalent bumbăcăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbăcar","accusative-definite-nominative-singular":"bumbăcarul","accusative-indefinite-nominative-plural":"bumbăcari","accusative-definite-nominative-plural":"bumbăcarii","dative-genitive-indefinite-singular":"bumbăcar","dative-definite-genitive-singular":"bumbăcarului","dative-genitive-indefinite-plural":"bumbăcari","dative-definite-genitive-plural":"bumbăcarilor","singular-vocative":"bumbăcarule","plural-vocative":"bumbăcarilor"}},{"word":"bumbăcăreasă","pos":"noun","definitions":["female equivalent of bumbăcar"],"forms":{"plural":"bumbăcărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumbăcăreasă","accusative-definite-nominative-singular":"bumbăcăreasa","accusative-indefinite-nominative-plural":"bumbăcărese","accusative-definite-nominative-plural":"bumbăcăresele","dative-genitive-indefinite-singular":"bumbăcărese","dative-definite-genitive-singular":"bumbăcăresei","dative-genitive-indefinite-plural":"bumbăcărese","dative-definite-genitive-plural":"bumbăcăreselor","singular-vocative":"bumbăcăreasă","plural-vocative":"bumbăcăreselor"}},{"word":"Bumbăcari","pos":"name","definitions":["a village in Dudești, Brăila County, Romania"],"gender":"m"},{"word":"bumbăcari","pos":"noun","definitions":["plural of bumbăcar"]},{"word":"bumbăcărie","pos":"noun","definitions":["cotton textile manufacturer","cotton plantation"],"forms":{"plural":"bumbăcării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"bumbăcărie","accusative-definite-nominative-singular":"bumbăcăria","accusative-indefinite-nominative-plural":"bumbăcării","accusative-definite-nominative-plural":"bumbăcăriile","dative-genitive-indefinite-singular":"bumbăcării","dative-definite-genitive-singular":"bumbăcăriei","dative-genitive-indefinite-plural":"bumbăcării","dative-definite-genitive-plural":"bumbăcăriilor","singular-vocative":"bumbăcărie","plural-vocative":"bumbăcăriilor"}},{"word":"bumbăcariță","pos":"noun","definitions":["cottongrass (Eriophorum)"],"forms":{"plural":"bumbăcărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumbăcariță","accusative-definite-nominative-singular":"bumbăcarița","accusative-indefinite-nominative-plural":"bumbăcărițe","accusative-definite-nominative-plural":"bumbăcărițele","dative-genitive-indefinite-singular":"bumbăcărițe","dative-definite-genitive-singular":"bumbăcăriței","dative-genitive-indefinite-plural":"bumbăcărițe","dative-definite-genitive-plural":"bumbăcărițelor","singular-vocative":"bumbăcariță","plural-vocative":"bumbăcărițelor"}},{"word":"bumbăcăriță","pos":"noun","definitions":["alternative form of bumbăcariță"],"forms":{"plural":"bumbăcărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumbăcăriță","accusative-definite-nominative-singular":"bumbăcărița","accusative-indefinite-nominative-plural":"bumbăcărițe","accusative-definite-nominative-plural":"bumbăcărițele","dative-genitive-indefinite-singular":"bumbăcărițe","dative-definite-genitive-singular":"bumbăcăriței","dative-genitive-indefinite-plural":"bumbăcărițe","dative-definite-genitive-plural":"bumbăcărițelor","singular-vocative":"bumbăcăriță","plural-vocative":"bumbăcărițelor"}},{"word":"Bumbăcaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Bumbăcaru"}},{"word":"bumbăceală","pos":"noun","definitions":["a beating"],"forms":{"plural":"bumbăceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumbăceală","accusative-definite-nominative-singular":"bumbăceala","accusative-indefinite-nominative-plural":"bumbăcele","accusative-definite-nominative-plural":"bumbăcelele","dative-genitive-indefinite-singular":"bumbăcele","dative-definite-genitive-singular":"bumbăcelei","dative-genitive-indefinite-plural":"bumbăcele","dative-definite-genitive-plural":"bumbăcelelor","singular-vocative":"bumbăceală","plural-vocative":"bumbăcelelor"}},{"word":"bumbăcel","pos":"noun","definitions":["diminutive of bumbac"],"forms":{"plural":"bumbăceluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bumbăcel","accusative-definite-nominative-singular":"bumbăcelul","accusative-indefinite-nominative-plural":"bumbăceluri","accusative-definite-nominative-plural":"bumbăcelurile","dative-genitive-indefinite-singular":"bumbăcel","dative-definite-genitive-singular":"bumbăcelului","dative-genitive-indefinite-plural":"bumbăceluri","dative-definite-genitive-plural":"bumbăcelurilor","singular-vocative":"bumbăcelule","plural-vocative":"bumbăcelurilor"}},{"word":"bumbăci","pos":"verb","definitions":["to beat up"],"forms":{"canonical":"a bumbăci 4th conjugation","present-singular-third-person":"bumbăcește","participle-past":"bumbăcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a bumbăci","gerund":"bumbăcind","first-person-indicative-present-singular":"bumbăcesc","indicative-present-second-person-singular":"bumbăcești","indicative-present-singular-third-person":"bumbăcește","first-person-indicative-plural-present":"bumbăcim","indicative-plural-present-second-person":"bumbăciți","indicative-plural-present-third-person":"bumbăcesc","first-person-imperfect-indicative-singular":"bumbăceam","imperfect-indicative-second-person-singular":"bumbăceai","imperfect-indicative-singular-third-person":"bumbăcea","first-person-imperfect-indicative-plural":"bumbăceam","imperfect-indicative-plural-second-person":"bumbăceați","imperfect-indicative-plural-third-person":"bumbăceau","first-person-indicative-perfect-singular":"bumbăcii","indicative-perfect-second-person-singular":"bumbăciși","indicative-perfect-singular-third-person":"bumbăci","first-person-indicative-perfect-plural":"bumbăcirăm","indicative-perfect-plural-second-person":"bumbăcirăți","indicative-perfect-plural-third-person":"bumbăciră","first-person-indicative-pluperfect-singular":"bumbăcisem","indicative-pluperfect-second-person-singular":"bumbăciseși","indicative-pluperfect-singular-third-person":"bumbăcise","first-person-indicative-pluperfect-plural":"bumbăciserăm","indicative-pluperfect-plural-second-person":"bumbăciserăți","indicative-pluperfect-plural-third-person":"bumbăciseră","first-person-present-singular-subjunctive":"să bumbăcesc","present-second-person-singular-subjunctive":"să bumbăcești","present-singular-subjunctive-third-person":"să bumbăcească","first-person-plural-present-subjunctive":"să bumbăcim","plural-present-second-person-subjunctive":"să bumbăciți","plural-present-subjunctive-third-person":"să bumbăcească","imperative-second-person-singular":"bumbăcește","imperative-plural-second-person":"bumbăciți","imperative-negative-second-person-singular":"nu bumbăci","imperative-negative-plural-second-person":"nu bumbăciți"}},{"word":"Bumbăcilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bumbăcilă"}},{"word":"bumbăcit","pos":"noun","definitions":["a beating"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bumbăcit","accusative-definite-nominative":"bumbăcitul","dative-genitive-indefinite":"bumbăcit","dative-definite-genitive":"bumbăcitului","vocative":"bumbăcitule"}},{"word":"bumbăcit","pos":"verb","definitions":["past participle of bumbăci"],"forms":{"participle-past":"of bumbăci"}},{"word":"bumbăcos","pos":"adj","definitions":["soft like cotton"],"forms":{"feminine-singular":"bumbăcoasă","masculine-plural":"bumbăcoși","feminine-neuter-plural":"bumbăcoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bumbăcos","error-unrecognized-form-feminine-indefinite-singular":"bumbăcoasă","error-unrecognized-form-indefinite-masculine-plural":"bumbăcoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"bumbăcoase","definite-error-unrecognized-form-masculine-neuter-singular":"bumbăcosul","definite-error-unrecognized-form-feminine-singular":"bumbăcoasa","definite-error-unrecognized-form-masculine-plural":"bumbăcoșii","definite-error-unrecognized-form-feminine-neuter-plural":"bumbăcoasele"}},{"word":"bumbara","pos":"noun","definitions":["alternative form of cumbara"],"forms":{"plural":"bumbarale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"bumbara","accusative-definite-nominative-singular":"bumbaraua","accusative-indefinite-nominative-plural":"bumbarale","accusative-definite-nominative-plural":"bumbaralele","dative-genitive-indefinite-singular":"bumbarale","dative-definite-genitive-singular":"bumbaralei","dative-genitive-indefinite-plural":"bumbarale","dative-definite-genitive-plural":"bumbaralelor","singular-vocative":"bumbara","plural-vocative":"bumbaralelor"}},{"word":"bumbărel","pos":"noun","definitions":["a wild bee"],"forms":{"plural":"bumbărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbărel","accusative-definite-nominative-singular":"bumbărelul","accusative-indefinite-nominative-plural":"bumbărei","accusative-definite-nominative-plural":"bumbăreii","dative-genitive-indefinite-singular":"bumbărel","dative-definite-genitive-singular":"bumbărelului","dative-genitive-indefinite-plural":"bumbărei","dative-definite-genitive-plural":"bumbăreilor","singular-vocative":"bumbărelule","plural-vocative":"bumbăreilor"}},{"word":"bumbașir","pos":"noun","definitions":["alternative form of mumbașir"],"forms":{"plural":"bumbașiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbașir","accusative-definite-nominative-singular":"bumbașirul","accusative-indefinite-nominative-plural":"bumbașiri","accusative-definite-nominative-plural":"bumbașirii","dative-genitive-indefinite-singular":"bumbașir","dative-definite-genitive-singular":"bumbașirului","dative-genitive-indefinite-plural":"bumbașiri","dative-definite-genitive-plural":"bumbașirilor","singular-vocative":"bumbașirule","plural-vocative":"bumbașirilor"}},{"word":"Bumbăta","pos":"name","definitions":["a village in Bumbăta, Ungheni Raion, Moldova","a commune of Ungheni Raion, Moldova","a village in Vetrișoaia, Vaslui County, Romania"],"gender":"f"},{"word":"Bumbescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bumbescu"}},{"word":"Bumbești-Jiu","pos":"name","definitions":["a town in Gorj County, Romania"],"gender":"m"},{"word":"Bumbești-Pițic","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Bumbești-Pițic, Gorj County, Romania"],"gender":"m"},{"word":"bumbic","pos":"noun","definitions":["eddy, vortex"],"forms":{"plural":"bumbicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bumbic","accusative-definite-nominative-singular":"bumbicul","accusative-indefinite-nominative-plural":"bumbicuri","accusative-definite-nominative-plural":"bumbicurile","dative-genitive-indefinite-singular":"bumbic","dative-definite-genitive-singular":"bumbicului","dative-genitive-indefinite-plural":"bumbicuri","dative-definite-genitive-plural":"bumbicurilor","singular-vocative":"bumbicule","plural-vocative":"bumbicurilor"}},{"word":"bumbișor","pos":"noun","definitions":["diminutive of bumb"],"forms":{"plural":"bumbișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbișor","accusative-definite-nominative-singular":"bumbișorul","accusative-indefinite-nominative-plural":"bumbișori","accusative-definite-nominative-plural":"bumbișorii","dative-genitive-indefinite-singular":"bumbișor","dative-definite-genitive-singular":"bumbișorului","dative-genitive-indefinite-plural":"bumbișori","dative-definite-genitive-plural":"bumbișorilor","singular-vocative":"bumbișorule","plural-vocative":"bumbișorilor"}},{"word":"Bumboiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bumboiu"}},{"word":"Bumbu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bumbu"}},{"word":"Bumbueni","pos":"name","definitions":["a village in Lunca Corbului, Argeș County, Romania"],"gender":"m"},{"word":"Bumbuești","pos":"name","definitions":["a village in Boișoara, Vâlcea County, Romania"],"gender":"m"},{"word":"Bumbuia","pos":"name","definitions":["a village in Gura Foii, Dâmbovița County, Romania"],"gender":"f"},{"word":"bumbuleț","pos":"noun","definitions":["diminutive of bumb"],"forms":{"plural":"bumbuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbuleț","accusative-definite-nominative-singular":"bumbulețul","accusative-indefinite-nominative-plural":"bumbuleți","accusative-definite-nominative-plural":"bumbuleții","dative-genitive-indefinite-singular":"bumbuleț","dative-definite-genitive-singular":"bumbulețului","dative-genitive-indefinite-plural":"bumbuleți","dative-definite-genitive-plural":"bumbuleților","singular-vocative":"bumbulețule","plural-vocative":"bumbuleților"}},{"word":"Bumbuluț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bumbuluț"}},{"word":"bumburea","pos":"noun","definitions":["small swelling, abscess"],"forms":{"plural":"bumburele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"bumburea","accusative-definite-nominative-singular":"bumbureaua","accusative-indefinite-nominative-plural":"bumburele","accusative-definite-nominative-plural":"bumburelele","dative-genitive-indefinite-singular":"bumburele","dative-definite-genitive-singular":"bumburelei","dative-genitive-indefinite-plural":"bumburele","dative-definite-genitive-plural":"bumburelelor","singular-vocative":"bumburea","plural-vocative":"bumburelelor"}},{"word":"bumbușcă","pos":"noun","definitions":["pin"],"forms":{"plural":"bumbuște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bumbușcă","accusative-definite-nominative-singular":"bumbușca","accusative-indefinite-nominative-plural":"bumbuște","accusative-definite-nominative-plural":"bumbuștele","dative-genitive-indefinite-singular":"bumbuște","dative-definite-genitive-singular":"bumbuștei","dative-genitive-indefinite-plural":"bumbuște","dative-definite-genitive-plural":"bumbuștelor","singular-vocative":"bumbușcă","plural-vocative":"bumbuștelor"}},{"word":"bumbușor","pos":"noun","definitions":["diminutive of bumb"],"forms":{"plural":"bumbușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbușor","accusative-definite-nominative-singular":"bumbușorul","accusative-indefinite-nominative-plural":"bumbușori","accusative-definite-nominative-plural":"bumbușorii","dative-genitive-indefinite-singular":"bumbușor","dative-definite-genitive-singular":"bumbușorului","dative-genitive-indefinite-plural":"bumbușori","dative-definite-genitive-plural":"bumbușorilor","singular-vocative":"bumbușorule","plural-vocative":"bumbușorilor"}},{"word":"bumbuț","pos":"noun","definitions":["diminutive of bumb"],"forms":{"plural":"bumbuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bumbuț","accusative-definite-nominative-singular":"bumbuțul","accusative-indefinite-nominative-plural":"bumbuți","accusative-definite-nominative-plural":"bumbuții","dative-genitive-indefinite-singular":"bumbuț","dative-definite-genitive-singular":"bumbuțului","dative-genitive-indefinite-plural":"bumbuți","dative-definite-genitive-plural":"bumbuților","singular-vocative":"bumbuțule","plural-vocative":"bumbuților"}},{"word":"bumerang","pos":"noun","definitions":["boomerang"],"forms":{"plural":"bumeranguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bumerang","accusative-definite-nominative-singular":"bumerangul","accusative-indefinite-nominative-plural":"bumeranguri","accusative-definite-nominative-plural":"bumerangurile","dative-genitive-indefinite-singular":"bumerang","dative-definite-genitive-singular":"bumerangului","dative-genitive-indefinite-plural":"bumeranguri","dative-definite-genitive-plural":"bumerangurilor","singular-vocative":"bumerangule","plural-vocative":"bumerangurilor"}},{"word":"bun","pos":"adj","definitions":["good"],"pronunciation":"/bun/","examples":[{"ro":"E un om bun, crede-mă.","en":"He is a good man, trust me."},{"ro":"Sunt bun la fotbal.","en":"I am good at football."}],"forms":{"feminine-singular":"bună","masculine-plural":"buni","feminine-neuter-plural":"bune","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bun","error-unrecognized-form-feminine-indefinite-singular":"bună","error-unrecognized-form-indefinite-masculine-plural":"buni","error-unrecognized-form-feminine-indefinite-neuter-plural":"bune","definite-error-unrecognized-form-masculine-neuter-singular":"bunul","definite-error-unrecognized-form-feminine-singular":"buna","definite-error-unrecognized-form-masculine-plural":"bunii","definite-error-unrecognized-form-feminine-neuter-plural":"bunele"}},{"word":"bun","pos":"noun","definitions":["good, asset, possession"],"pronunciation":"/bun/","forms":{"plural":"bunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bun","accusative-definite-nominative-singular":"bunul","accusative-indefinite-nominative-plural":"bunuri","accusative-definite-nominative-plural":"bunurile","dative-genitive-indefinite-singular":"bun","dative-definite-genitive-singular":"bunului","dative-genitive-indefinite-plural":"bunuri","dative-definite-genitive-plural":"bunurilor","singular-vocative":"bunule","plural-vocative":"bunurilor"}},{"word":"bun","pos":"noun","definitions":["grandfather"],"pronunciation":"/bun/","forms":{"plural":"buni","feminine":"equivalent bună","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bun","accusative-definite-nominative-singular":"bunul","accusative-indefinite-nominative-plural":"buni","accusative-definite-nominative-plural":"bunii","dative-genitive-indefinite-singular":"bun","dative-definite-genitive-singular":"bunului","dative-genitive-indefinite-plural":"buni","dative-definite-genitive-plural":"bunilor","singular-vocative":"bunule","plural-vocative":"bunilor"}},{"word":"bun ca pâinea caldă","pos":"adj","definitions":["sweet as pie"]},{"word":"bun simț","pos":"noun","definitions":["common sense"]},{"word":"bun-simț","pos":"noun","definitions":["common sense","decency"]},{"word":"buna","pos":"adj","definitions":["definite nominative/accusative feminine singular of bun"],"pronunciation":"[ˈbu.na]"},{"word":"bună","pos":"adj","definitions":["nominative/accusative feminine singular of bun"],"pronunciation":"[ˈbunə]"},{"word":"bună","pos":"intj","definitions":["hey! hi!"],"pronunciation":"[ˈbunə]"},{"word":"bună credință","pos":"noun","definitions":["good faith"]},{"word":"bună dimineața","pos":"intj","definitions":["good morning"],"pronunciation":"/ˌbu.nə ˌdi.miˈne̯a.t͡sa/"},{"word":"bună seara","pos":"intj","definitions":["good evening"],"pronunciation":"/ˌbu.nə ˈse̯a.ra/"},{"word":"Buna Vestire","pos":"name","definitions":["Annunciation"],"pronunciation":"/ˈbu.na vesˈti.re/","gender":"f","forms":{"dative-genitive":"Bunei Vestiri"}},{"word":"bună ziua","pos":"intj","definitions":["hello!","good day!"],"pronunciation":"[ˌbu.nə ˈzi.wa]"},{"word":"bunăciune","pos":"noun","definitions":["attractive woman"],"forms":{"plural":"bunăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bunăciune","accusative-definite-nominative-singular":"bunăciunea","accusative-indefinite-nominative-plural":"bunăciuni","accusative-definite-nominative-plural":"bunăciunile","dative-genitive-indefinite-singular":"bunăciuni","dative-definite-genitive-singular":"bunăciunii","dative-genitive-indefinite-plural":"bunăciuni","dative-definite-genitive-plural":"bunăciunilor","singular-vocative":"bunăciune","plural-vocative":"bunăciunilor"}},{"word":"bunăoară","pos":"adv","definitions":["such as"]},{"word":"bunar","pos":"noun","definitions":["well"],"forms":{"plural":"bunari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunar","accusative-definite-nominative-singular":"bunarul","accusative-indefinite-nominative-plural":"bunari","accusative-definite-nominative-plural":"bunarii","dative-genitive-indefinite-singular":"bunar","dative-definite-genitive-singular":"bunarului","dative-genitive-indefinite-plural":"bunari","dative-definite-genitive-plural":"bunarilor","singular-vocative":"bunarule","plural-vocative":"bunarilor"}},{"word":"bunăstare","pos":"noun","definitions":["wellbeing, prosperity"],"forms":{"plural":"bunăstări"}},{"word":"bunătate","pos":"noun","definitions":["kindness, goodness, benevolence, kindliness, benignity","bounty (generosity)","delicacy, dainty (food)"],"forms":{"plural":"bunătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bunătate","accusative-definite-nominative-singular":"bunătatea","accusative-indefinite-nominative-plural":"bunătăți","accusative-definite-nominative-plural":"bunătățile","dative-genitive-indefinite-singular":"bunătăți","dative-definite-genitive-singular":"bunătății","dative-genitive-indefinite-plural":"bunătăți","dative-definite-genitive-plural":"bunătăților","singular-vocative":"bunătate","plural-vocative":"bunătăților"}},{"word":"bunăvoie","pos":"noun","definitions":["only used in de bunăvoie (“willingly”)"],"pronunciation":"/bu.nəˈvo.je/"},{"word":"bunăvoință","pos":"noun","definitions":["benevolence"],"pronunciation":"/ˌbu.nə.voˈin.t͡sə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"bunăvoință","accusative-definite-nominative":"bunăvoința","dative-genitive-indefinite":"bunăvoințe","dative-definite-genitive":"bunăvoinței","vocative":"bunăvoință"}},{"word":"buncăr","pos":"noun","definitions":["bunker"],"forms":{"plural":"buncăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buncăr","accusative-definite-nominative-singular":"buncărul","accusative-indefinite-nominative-plural":"buncăre","accusative-definite-nominative-plural":"buncărele","dative-genitive-indefinite-singular":"buncăr","dative-definite-genitive-singular":"buncărului","dative-genitive-indefinite-plural":"buncăre","dative-definite-genitive-plural":"buncărelor","singular-vocative":"buncărule","plural-vocative":"buncărelor"}},{"word":"bund","pos":"noun","definitions":["bund"],"forms":{"plural":"bunduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bund","accusative-definite-nominative-singular":"bundul","accusative-indefinite-nominative-plural":"bunduri","accusative-definite-nominative-plural":"bundurile","dative-genitive-indefinite-singular":"bund","dative-definite-genitive-singular":"bundului","dative-genitive-indefinite-plural":"bunduri","dative-definite-genitive-plural":"bundurilor","singular-vocative":"bundule","plural-vocative":"bundurilor"}},{"word":"Bunda","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bunda"}},{"word":"Bundă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bundă"}},{"word":"bundă","pos":"noun","definitions":["fur coat"],"forms":{"plural":"bunde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bundă","accusative-definite-nominative-singular":"bunda","accusative-indefinite-nominative-plural":"bunde","accusative-definite-nominative-plural":"bundele","dative-genitive-indefinite-singular":"bunde","dative-definite-genitive-singular":"bundei","dative-genitive-indefinite-plural":"bunde","dative-definite-genitive-plural":"bundelor","singular-vocative":"bundă","plural-vocative":"bundelor"}},{"word":"bundesrat","pos":"noun","definitions":["Bundesrat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bundesrat","accusative-definite-nominative":"bundesratul","dative-genitive-indefinite":"bundesrat","dative-definite-genitive":"bundesratului","vocative":"bundesratule"}},{"word":"bundestag","pos":"noun","definitions":["Bundestag"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bundestag","accusative-definite-nominative":"bundestagul","dative-genitive-indefinite":"bundestag","dative-definite-genitive":"bundestagului","vocative":"bundestagule"}},{"word":"bundiță","pos":"noun","definitions":["diminutive of bundă"],"forms":{"plural":"bundițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bundiță","accusative-definite-nominative-singular":"bundița","accusative-indefinite-nominative-plural":"bundițe","accusative-definite-nominative-plural":"bundițele","dative-genitive-indefinite-singular":"bundițe","dative-definite-genitive-singular":"bundiței","dative-genitive-indefinite-plural":"bundițe","dative-definite-genitive-plural":"bundițelor","singular-vocative":"bundiță","plural-vocative":"bundițelor"}},{"word":"bunduță","pos":"noun","definitions":["diminutive of bundă"],"forms":{"plural":"bunduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bunduță","accusative-definite-nominative-singular":"bunduța","accusative-indefinite-nominative-plural":"bunduțe","accusative-definite-nominative-plural":"bunduțele","dative-genitive-indefinite-singular":"bunduțe","dative-definite-genitive-singular":"bunduței","dative-genitive-indefinite-plural":"bunduțe","dative-definite-genitive-plural":"bunduțelor","singular-vocative":"bunduță","plural-vocative":"bunduțelor"}},{"word":"bune","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of bun"],"pronunciation":"[ˈbu.ne]"},{"word":"bune oficii","pos":"noun","definitions":["good offices"]},{"word":"Bunea","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Pădurani"],"gender":"f"},{"word":"Bunea Mare","pos":"name","definitions":["a village in Făget, Timiș County, Romania"],"gender":"f"},{"word":"Bunea Mică","pos":"name","definitions":["a village in Făget, Timiș County, Romania"],"gender":"f"},{"word":"bunel","pos":"noun","definitions":["grandfather"],"forms":{"plural":"bunei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunel","accusative-definite-nominative-singular":"bunelul","accusative-indefinite-nominative-plural":"bunei","accusative-definite-nominative-plural":"buneii","dative-genitive-indefinite-singular":"bunel","dative-definite-genitive-singular":"bunelului","dative-genitive-indefinite-plural":"bunei","dative-definite-genitive-plural":"buneilor","singular-vocative":"bunelule","plural-vocative":"buneilor"}},{"word":"bunele moravuri","pos":"noun","definitions":["good manners"]},{"word":"Bunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bunescu"}},{"word":"Bunești","pos":"name","definitions":["a village in Cotmeana, Argeș County, Romania","a village in Mălureni, Argeș County, Romania","a commune of Brașov County, Romania","a village in Bunești, Brașov County, Romania","a village in Mintiu Gherlii, Cluj County, Romania"],"gender":"m"},{"word":"Bunești-Averești","pos":"name","definitions":["a commune of Vaslui County, Romania"],"gender":"m"},{"word":"bunețe","pos":"noun","definitions":["goodness"],"forms":{"plural":"buneți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bunețe","accusative-definite-nominative-singular":"bunețea","accusative-indefinite-nominative-plural":"buneți","accusative-definite-nominative-plural":"bunețile","dative-genitive-indefinite-singular":"buneți","dative-definite-genitive-singular":"buneții","dative-genitive-indefinite-plural":"buneți","dative-definite-genitive-plural":"buneților","singular-vocative":"bunețe","plural-vocative":"buneților"}},{"word":"bungalou","pos":"noun","definitions":["bungalow"],"forms":{"plural":"bungalouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bungalou","accusative-definite-nominative-singular":"bungaloul","accusative-indefinite-nominative-plural":"bungalouri","accusative-definite-nominative-plural":"bungalourile","dative-genitive-indefinite-singular":"bungalou","dative-definite-genitive-singular":"bungaloului","dative-genitive-indefinite-plural":"bungalouri","dative-definite-genitive-plural":"bungalourilor","singular-vocative":"bungaloule","plural-vocative":"bungalourilor"}},{"word":"bungalow","pos":"noun","definitions":["bungalow"],"forms":{"plural":"bungalow-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bungalow","accusative-definite-nominative-singular":"bungalowul","accusative-indefinite-nominative-plural":"bungalow-uri","accusative-definite-nominative-plural":"bungalow-urile","dative-genitive-indefinite-singular":"bungalow","dative-definite-genitive-singular":"bungalowului","dative-genitive-indefinite-plural":"bungalow-uri","dative-definite-genitive-plural":"bungalow-urilor","singular-vocative":"bungalowule","plural-vocative":"bungalow-urilor"}},{"word":"Bungard","pos":"name","definitions":["a village in Lechința, Bistrița-Năsăud County, Romania","a village in Șelimbăr, Sibiu County, Romania"],"gender":"m"},{"word":"Bunget","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bunget"}},{"word":"bunget","pos":"noun","definitions":["thicket, grove"],"pronunciation":"/bunˈd͡ʒet/","forms":{"plural":"bungeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bunget","accusative-definite-nominative-singular":"bungetul","accusative-indefinite-nominative-plural":"bungeturi","accusative-definite-nominative-plural":"bungeturile","dative-genitive-indefinite-singular":"bunget","dative-definite-genitive-singular":"bungetului","dative-genitive-indefinite-plural":"bungeturi","dative-definite-genitive-plural":"bungeturilor","singular-vocative":"bungetule","plural-vocative":"bungeturilor"}},{"word":"Bungețani","pos":"name","definitions":["a village in Făurești, Vâlcea County, Romania"],"gender":"m"},{"word":"Bungetu","pos":"name","definitions":["a village in Văcărești, Dâmbovița County, Romania"],"gender":"m"},{"word":"bungetul","pos":"noun","definitions":["definite nominative/accusative singular of bunget"]},{"word":"bungoiat","pos":"noun","definitions":["buzz"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bungoiat","accusative-definite-nominative":"bungoiatul","dative-genitive-indefinite":"bungoiat","dative-definite-genitive":"bungoiatului","vocative":"bungoiatule"}},{"word":"buni","pos":"adj","definitions":["nominative/accusative masculine plural of bun"],"pronunciation":"/bunʲ/"},{"word":"bunic","pos":"noun","definitions":["grandfather","grandparents"],"pronunciation":"/buˈnik/","forms":{"plural":"bunici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunic","accusative-definite-nominative-singular":"bunicul","accusative-indefinite-nominative-plural":"bunici","accusative-definite-nominative-plural":"bunicii","dative-genitive-indefinite-singular":"bunic","dative-definite-genitive-singular":"bunicului","dative-genitive-indefinite-plural":"bunici","dative-definite-genitive-plural":"bunicilor","singular-vocative":"bunicule","plural-vocative":"bunicilor"}},{"word":"Bunica","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bunica"}},{"word":"bunica","pos":"noun","definitions":["definite nominative/accusative singular of bunică"],"gender":"f"},{"word":"Bunică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bunică"}},{"word":"bunică","pos":"noun","definitions":["grandmother"],"pronunciation":"/buˈnikə/","forms":{"plural":"bunici","masculine":"equivalent bunic","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bunică","accusative-definite-nominative-singular":"bunica","accusative-indefinite-nominative-plural":"bunici","accusative-definite-nominative-plural":"bunicile","dative-genitive-indefinite-singular":"bunici","dative-definite-genitive-singular":"bunicii","dative-genitive-indefinite-plural":"bunici","dative-definite-genitive-plural":"bunicilor","singular-vocative":"bunică","plural-vocative":"bunicilor"}},{"word":"bunicel","pos":"adj","definitions":["diminutive of bun; pretty good"],"pronunciation":"/bu.niˈt͡ʃel/","forms":{"feminine-singular":"bunicică","masculine-plural":"bunicei","feminine-neuter-plural":"bunicele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bunicel","error-unrecognized-form-feminine-indefinite-singular":"bunicică","error-unrecognized-form-indefinite-masculine-plural":"bunicei","error-unrecognized-form-feminine-indefinite-neuter-plural":"bunicele","definite-error-unrecognized-form-masculine-neuter-singular":"bunicelul","definite-error-unrecognized-form-feminine-singular":"bunicica","definite-error-unrecognized-form-masculine-plural":"buniceii","definite-error-unrecognized-form-feminine-neuter-plural":"bunicelele"}},{"word":"Bunicelu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bunicelu"}},{"word":"bunici","pos":"noun","definitions":["indefinite plural of bunic (“grandfather”)"],"pronunciation":"/buˈnit͡ʃʲ/"},{"word":"bunici","pos":"noun","definitions":["inflection of bunică (“grandmother”):","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"/buˈnit͡ʃʲ/"},{"word":"bunicuț","pos":"noun","definitions":["diminutive of bunic","grandpa"],"pronunciation":"/buniˈkut͡s/","forms":{"plural":"bunicuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunicuț","accusative-definite-nominative-singular":"bunicuțul","accusative-indefinite-nominative-plural":"bunicuți","accusative-definite-nominative-plural":"bunicuții","dative-genitive-indefinite-singular":"bunicuț","dative-definite-genitive-singular":"bunicuțului","dative-genitive-indefinite-plural":"bunicuți","dative-definite-genitive-plural":"bunicuților","singular-vocative":"bunicuțule","plural-vocative":"bunicuților"}},{"word":"bunicuță","pos":"noun","definitions":["diminutive of bunică; (informal) grandma"],"pronunciation":"/buniˈkut͡sə/","forms":{"plural":"bunicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bunicuță","accusative-definite-nominative-singular":"bunicuța","accusative-indefinite-nominative-plural":"bunicuțe","accusative-definite-nominative-plural":"bunicuțele","dative-genitive-indefinite-singular":"bunicuțe","dative-definite-genitive-singular":"bunicuței","dative-genitive-indefinite-plural":"bunicuțe","dative-definite-genitive-plural":"bunicuțelor","singular-vocative":"bunicuță","plural-vocative":"bunicuțelor"}},{"word":"Bunila","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Cerna","a commune of Hunedoara County, Romania","a village in Bunila, Hunedoara County, Romania"],"gender":"f"},{"word":"bunioară","pos":"adv","definitions":["alternative form of bunăoară"]},{"word":"bunișor","pos":"adj","definitions":["diminutive of bun"],"pronunciation":"/bu.niˈʃor/","forms":{"feminine-singular":"bunișoară","masculine-plural":"bunișori","feminine-neuter-plural":"bunișoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bunișor","error-unrecognized-form-feminine-indefinite-singular":"bunișoară","error-unrecognized-form-indefinite-masculine-plural":"bunișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"bunișoare","definite-error-unrecognized-form-masculine-neuter-singular":"bunișorul","definite-error-unrecognized-form-feminine-singular":"bunișoara","definite-error-unrecognized-form-masculine-plural":"bunișorii","definite-error-unrecognized-form-feminine-neuter-plural":"bunișoarele"}},{"word":"buniță","pos":"noun","definitions":["grandmother"],"forms":{"plural":"bunițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buniță","accusative-definite-nominative-singular":"bunița","accusative-indefinite-nominative-plural":"bunițe","accusative-definite-nominative-plural":"bunițele","dative-genitive-indefinite-singular":"bunițe","dative-definite-genitive-singular":"buniței","dative-genitive-indefinite-plural":"bunițe","dative-definite-genitive-plural":"bunițelor","singular-vocative":"buniță","plural-vocative":"bunițelor"}},{"word":"Bunoaica","pos":"name","definitions":["a village in Cireșu, Mehedinți County, Romania"],"gender":"f"},{"word":"bunțăr","pos":"noun","definitions":["tramp"],"forms":{"plural":"bunțări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bunțăr","accusative-definite-nominative-singular":"bunțărul","accusative-indefinite-nominative-plural":"bunțări","accusative-definite-nominative-plural":"bunțării","dative-genitive-indefinite-singular":"bunțăr","dative-definite-genitive-singular":"bunțărului","dative-genitive-indefinite-plural":"bunțări","dative-definite-genitive-plural":"bunțărilor","singular-vocative":"bunțărule","plural-vocative":"bunțărilor"}},{"word":"Buntești","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Buntești, Bihor County, Romania"],"gender":"m"},{"word":"buntușnic","pos":"noun","definitions":["conspirator"],"forms":{"plural":"buntușnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buntușnic","accusative-definite-nominative-singular":"buntușnicul","accusative-indefinite-nominative-plural":"buntușnici","accusative-definite-nominative-plural":"buntușnicii","dative-genitive-indefinite-singular":"buntușnic","dative-definite-genitive-singular":"buntușnicului","dative-genitive-indefinite-plural":"buntușnici","dative-definite-genitive-plural":"buntușnicilor","singular-vocative":"buntușnicule","plural-vocative":"buntușnicilor"}},{"word":"Bunulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bunulescu"}},{"word":"bunuri","pos":"noun","definitions":["plural of bun"],"pronunciation":"/ˈbu.nurʲ/"},{"word":"bunuri mobile","pos":"noun","definitions":["movable property"]},{"word":"bunuț","pos":"adj","definitions":["diminutive of bun"],"pronunciation":"/buˈnut͡s/","forms":{"feminine-singular":"bunuță","masculine-plural":"bunuți","feminine-neuter-plural":"bunuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"bunuț","error-unrecognized-form-feminine-indefinite-singular":"bunuță","error-unrecognized-form-indefinite-masculine-plural":"bunuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"bunuțe","definite-error-unrecognized-form-masculine-neuter-singular":"bunuțul","definite-error-unrecognized-form-feminine-singular":"bunuța","definite-error-unrecognized-form-masculine-plural":"bunuții","definite-error-unrecognized-form-feminine-neuter-plural":"bunuțele"}},{"word":"bura","pos":"verb","definitions":["to drizzle"],"pronunciation":"/buˈra/","forms":{"canonical":"a bura 1st conjugation","present-singular-third-person":"burează","participle-past":"burat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a bura","gerund":"burând","first-person-indicative-present-singular":"burez","indicative-present-second-person-singular":"burezi","indicative-present-singular-third-person":"burează","first-person-indicative-plural-present":"burăm","indicative-plural-present-second-person":"burați","indicative-plural-present-third-person":"burează","first-person-imperfect-indicative-singular":"buram","imperfect-indicative-second-person-singular":"burai","imperfect-indicative-singular-third-person":"bura","first-person-imperfect-indicative-plural":"buram","imperfect-indicative-plural-second-person":"burați","imperfect-indicative-plural-third-person":"burau","first-person-indicative-perfect-singular":"burai","indicative-perfect-second-person-singular":"burași","indicative-perfect-singular-third-person":"bură","first-person-indicative-perfect-plural":"burarăm","indicative-perfect-plural-second-person":"burarăți","indicative-perfect-plural-third-person":"burară","first-person-indicative-pluperfect-singular":"burasem","indicative-pluperfect-second-person-singular":"buraseși","indicative-pluperfect-singular-third-person":"burase","first-person-indicative-pluperfect-plural":"buraserăm","indicative-pluperfect-plural-second-person":"buraserăți","indicative-pluperfect-plural-third-person":"buraseră","first-person-present-singular-subjunctive":"să burez","present-second-person-singular-subjunctive":"să burezi","present-singular-subjunctive-third-person":"să bureze","first-person-plural-present-subjunctive":"să burăm","plural-present-second-person-subjunctive":"să burați","plural-present-subjunctive-third-person":"să bureze","imperative-second-person-singular":"burează","imperative-plural-second-person":"burați","imperative-negative-second-person-singular":"nu bura","imperative-negative-plural-second-person":"nu burați","alternative":"бура"}},{"word":"bură","pos":"noun","definitions":["storm","shower, drizzle","fog","rime"],"pronunciation":"/ˈbu.rə/","forms":{"plural":"bure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bură","accusative-definite-nominative-singular":"bura","accusative-indefinite-nominative-plural":"bure","accusative-definite-nominative-plural":"burele","dative-genitive-indefinite-singular":"bure","dative-definite-genitive-singular":"burei","dative-genitive-indefinite-plural":"bure","dative-definite-genitive-plural":"burelor","singular-vocative":"bură","plural-vocative":"burelor"}},{"word":"buraga","pos":"noun","definitions":["definite nominative/accusative singular of buragă"],"gender":"f"},{"word":"buragă","pos":"noun","definitions":["fog"]},{"word":"burai","pos":"verb","definitions":["inflection of bura:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[buˈraj]"},{"word":"burăitoare","pos":"noun","definitions":["waterfall"],"forms":{"plural":"burăitori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"burăitoare","accusative-definite-nominative-singular":"burăitoarea","accusative-indefinite-nominative-plural":"burăitori","accusative-definite-nominative-plural":"burăitorile","dative-genitive-indefinite-singular":"burăitori","dative-definite-genitive-singular":"burăitorii","dative-genitive-indefinite-plural":"burăitori","dative-definite-genitive-plural":"burăitorilor","singular-vocative":"burăitoare","plural-vocative":"burăitorilor"}},{"word":"buram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of bura"],"pronunciation":"[buˈram]"},{"word":"burangic","pos":"noun","definitions":["alternative form of borangic"],"forms":{"plural":"burangicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burangic","accusative-definite-nominative-singular":"burangicul","accusative-indefinite-nominative-plural":"burangicuri","accusative-definite-nominative-plural":"burangicurile","dative-genitive-indefinite-singular":"burangic","dative-definite-genitive-singular":"burangicului","dative-genitive-indefinite-plural":"burangicuri","dative-definite-genitive-plural":"burangicurilor","singular-vocative":"burangicule","plural-vocative":"burangicurilor"}},{"word":"burare","pos":"noun","definitions":["drizzle"],"forms":{"plural":"burări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"burare","accusative-definite-nominative-singular":"burarea","accusative-indefinite-nominative-plural":"burări","accusative-definite-nominative-plural":"burările","dative-genitive-indefinite-singular":"burări","dative-definite-genitive-singular":"burării","dative-genitive-indefinite-plural":"burări","dative-definite-genitive-plural":"burărilor","singular-vocative":"burare","plural-vocative":"burărilor"}},{"word":"burat","pos":"verb","definitions":["past participle of bura"],"pronunciation":"[buˈrat]"},{"word":"buratec","pos":"noun","definitions":["alternative form of buratic"],"forms":{"plural":"burateci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buratec","accusative-definite-nominative-singular":"buratecul","accusative-indefinite-nominative-plural":"burateci","accusative-definite-nominative-plural":"buratecii","dative-genitive-indefinite-singular":"buratec","dative-definite-genitive-singular":"buratecului","dative-genitive-indefinite-plural":"burateci","dative-definite-genitive-plural":"buratecilor","singular-vocative":"buratecule","plural-vocative":"buratecilor"}},{"word":"buratic","pos":"noun","definitions":["obsolete form of brotac"],"forms":{"plural":"buratici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buratic","accusative-definite-nominative-singular":"buraticul","accusative-indefinite-nominative-plural":"buratici","accusative-definite-nominative-plural":"buraticii","dative-genitive-indefinite-singular":"buratic","dative-definite-genitive-singular":"buraticului","dative-genitive-indefinite-plural":"buratici","dative-definite-genitive-plural":"buraticilor","singular-vocative":"buraticule","plural-vocative":"buraticilor"}},{"word":"burău","pos":"noun","definitions":["waterfall"],"forms":{"plural":"buraie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burău","accusative-definite-nominative-singular":"burăuul","accusative-indefinite-nominative-plural":"buraie","accusative-definite-nominative-plural":"buraiele","dative-genitive-indefinite-singular":"burău","dative-definite-genitive-singular":"burăuului","dative-genitive-indefinite-plural":"buraie","dative-definite-genitive-plural":"buraielor","singular-vocative":"burăuule","plural-vocative":"buraielor"}},{"word":"burbon","pos":"noun","definitions":["bourbon whiskey"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"burbon","accusative-definite-nominative":"burbonul","dative-genitive-indefinite":"burbon","dative-definite-genitive":"burbonului","vocative":"burbonule"}},{"word":"Burca","pos":"name","definitions":["a village in Vidra, Vrancea County, Romania"],"gender":"f"},{"word":"Burcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Burcescu"}},{"word":"Burcioaia","pos":"name","definitions":["a locality in Adjud, Vrancea County, Romania"],"gender":"f"},{"word":"Burciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Burciulescu"}},{"word":"burcuș","pos":"noun","definitions":["Prussian"],"forms":{"plural":"burcuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burcuș","accusative-definite-nominative-singular":"burcușul","accusative-indefinite-nominative-plural":"burcuși","accusative-definite-nominative-plural":"burcușii","dative-genitive-indefinite-singular":"burcuș","dative-definite-genitive-singular":"burcușului","dative-genitive-indefinite-plural":"burcuși","dative-definite-genitive-plural":"burcușilor","singular-vocative":"burcușule","plural-vocative":"burcușilor"}},{"word":"burcușesc","pos":"adj","definitions":["Prussian"],"forms":{"feminine-singular":"burcușească","plural":"burcușești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burcușesc","error-unrecognized-form-feminine-indefinite-singular":"burcușească","error-unrecognized-form-indefinite-masculine-plural":"burcușești","error-unrecognized-form-feminine-indefinite-neuter-plural":"burcușești","definite-error-unrecognized-form-masculine-neuter-singular":"burcușescul","definite-error-unrecognized-form-feminine-singular":"burcușeasca","definite-error-unrecognized-form-masculine-plural":"burcușeștii","definite-error-unrecognized-form-feminine-neuter-plural":"burcușeștile"}},{"word":"burcușoară","pos":"noun","definitions":["diminutive of burcă"],"forms":{"plural":"burcușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burcușoară","accusative-definite-nominative-singular":"burcușoara","accusative-indefinite-nominative-plural":"burcușoare","accusative-definite-nominative-plural":"burcușoarele","dative-genitive-indefinite-singular":"burcușoare","dative-definite-genitive-singular":"burcușoarei","dative-genitive-indefinite-plural":"burcușoare","dative-definite-genitive-plural":"burcușoarelor","singular-vocative":"burcușoară","plural-vocative":"burcușoarelor"}},{"word":"Burdălești","pos":"name","definitions":["a village in Gușoeni, Vâlcea County, Romania"],"gender":"m"},{"word":"Burdeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Burdeanu"}},{"word":"Burdeni","pos":"name","definitions":["a village in Balaci, Teleorman County, Romania"],"gender":"m"},{"word":"Burdescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Burdescu"}},{"word":"Burdești","pos":"name","definitions":["a village in Suseni, Argeș County, Romania"],"gender":"m"},{"word":"burdihan","pos":"noun","definitions":["alternative form of burduhan"],"forms":{"plural":"burdihane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burdihan","accusative-definite-nominative-singular":"burdihanul","accusative-indefinite-nominative-plural":"burdihane","accusative-definite-nominative-plural":"burdihanele","dative-genitive-indefinite-singular":"burdihan","dative-definite-genitive-singular":"burdihanului","dative-genitive-indefinite-plural":"burdihane","dative-definite-genitive-plural":"burdihanelor","singular-vocative":"burdihanule","plural-vocative":"burdihanelor"}},{"word":"burdios","pos":"adj","definitions":["obsolete form of burduhos"],"forms":{"feminine-singular":"burdioasă","masculine-plural":"burdioși","feminine-neuter-plural":"burdioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burdios","error-unrecognized-form-feminine-indefinite-singular":"burdioasă","error-unrecognized-form-indefinite-masculine-plural":"burdioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burdioase","definite-error-unrecognized-form-masculine-neuter-singular":"burdiosul","definite-error-unrecognized-form-feminine-singular":"burdioasa","definite-error-unrecognized-form-masculine-plural":"burdioșii","definite-error-unrecognized-form-feminine-neuter-plural":"burdioasele"}},{"word":"Burduf","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burduf"}},{"word":"burduf","pos":"noun","definitions":["leather hide bag","bladder bag, waterskin, wineskin; bag or sack made from an animal stomach, used to store liquid, flour, cheese, etc.;","cask-skin","bellows"],"forms":{"plural":"burdufuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burduf","accusative-definite-nominative-singular":"burduful","accusative-indefinite-nominative-plural":"burdufuri","accusative-definite-nominative-plural":"burdufurile","dative-genitive-indefinite-singular":"burduf","dative-definite-genitive-singular":"burdufului","dative-genitive-indefinite-plural":"burdufuri","dative-definite-genitive-plural":"burdufurilor","singular-vocative":"burdufule","plural-vocative":"burdufurilor","alternative":"burduv"}},{"word":"burduh","pos":"noun","definitions":["alternative form of burduf"],"forms":{"plural":"burduhuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burduh","accusative-definite-nominative-singular":"burduhul","accusative-indefinite-nominative-plural":"burduhuri","accusative-definite-nominative-plural":"burduhurile","dative-genitive-indefinite-singular":"burduh","dative-definite-genitive-singular":"burduhului","dative-genitive-indefinite-plural":"burduhuri","dative-definite-genitive-plural":"burduhurilor","singular-vocative":"burduhule","plural-vocative":"burduhurilor"}},{"word":"burduhan","pos":"noun","definitions":["paunch, big belly"],"forms":{"plural":"burduhane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burduhan","accusative-definite-nominative-singular":"burduhanul","accusative-indefinite-nominative-plural":"burduhane","accusative-definite-nominative-plural":"burduhanele","dative-genitive-indefinite-singular":"burduhan","dative-definite-genitive-singular":"burduhanului","dative-genitive-indefinite-plural":"burduhane","dative-definite-genitive-plural":"burduhanelor","singular-vocative":"burduhanule","plural-vocative":"burduhanelor"}},{"word":"burduhănos","pos":"adj","definitions":["pot-bellied"],"forms":{"feminine-singular":"burduhănoasă","masculine-plural":"burduhănoși","feminine-neuter-plural":"burduhănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burduhănos","error-unrecognized-form-feminine-indefinite-singular":"burduhănoasă","error-unrecognized-form-indefinite-masculine-plural":"burduhănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burduhănoase","definite-error-unrecognized-form-masculine-neuter-singular":"burduhănosul","definite-error-unrecognized-form-feminine-singular":"burduhănoasa","definite-error-unrecognized-form-masculine-plural":"burduhănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burduhănoasele"}},{"word":"burduhaș","pos":"noun","definitions":["diminutive of burduh"],"forms":{"plural":"burduhași","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burduhaș","accusative-definite-nominative-singular":"burduhașul","accusative-indefinite-nominative-plural":"burduhași","accusative-definite-nominative-plural":"burduhașile","dative-genitive-indefinite-singular":"burduhaș","dative-definite-genitive-singular":"burduhașului","dative-genitive-indefinite-plural":"burduhași","dative-definite-genitive-plural":"burduhașilor","singular-vocative":"burduhașule","plural-vocative":"burduhașilor"}},{"word":"Burduhos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burduhos"}},{"word":"burduhos","pos":"adj","definitions":["potbellied"],"forms":{"feminine-singular":"burduhoasă","masculine-plural":"burduhoși","feminine-neuter-plural":"burduhoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burduhos","error-unrecognized-form-feminine-indefinite-singular":"burduhoasă","error-unrecognized-form-indefinite-masculine-plural":"burduhoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burduhoase","definite-error-unrecognized-form-masculine-neuter-singular":"burduhosul","definite-error-unrecognized-form-feminine-singular":"burduhoasa","definite-error-unrecognized-form-masculine-plural":"burduhoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burduhoasele"}},{"word":"burduhoșel","pos":"adj","definitions":["diminutive of burduhos"],"forms":{"feminine-singular":"burduhoșelă","masculine-plural":"burduhoșeli","feminine-neuter-plural":"burduhoșele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burduhoșel","error-unrecognized-form-feminine-indefinite-singular":"burduhoșelă","error-unrecognized-form-indefinite-masculine-plural":"burduhoșeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"burduhoșele","definite-error-unrecognized-form-masculine-neuter-singular":"burduhoșelul","definite-error-unrecognized-form-feminine-singular":"burduhoșela","definite-error-unrecognized-form-masculine-plural":"burduhoșelii","definite-error-unrecognized-form-feminine-neuter-plural":"burduhoșelele"}},{"word":"Burduhosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burduhosu"}},{"word":"Burdulești","pos":"name","definitions":["a village in Corbu, Olt County, Romania"],"gender":"m"},{"word":"burduloi","pos":"noun","definitions":["treestump"],"forms":{"plural":"burduloaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burduloi","accusative-definite-nominative-singular":"burduloiul","accusative-indefinite-nominative-plural":"burduloaie","accusative-definite-nominative-plural":"burduloaiele","dative-genitive-indefinite-singular":"burduloi","dative-definite-genitive-singular":"burduloiului","dative-genitive-indefinite-plural":"burduloaie","dative-definite-genitive-plural":"burduloaielor","singular-vocative":"burduloiule","plural-vocative":"burduloaielor"}},{"word":"Burduluș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burduluș"}},{"word":"burduș","pos":"noun","definitions":["alternative form of burduf"],"forms":{"plural":"burdușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burduș","accusative-definite-nominative-singular":"burdușul","accusative-indefinite-nominative-plural":"burdușuri","accusative-definite-nominative-plural":"burdușurile","dative-genitive-indefinite-singular":"burduș","dative-definite-genitive-singular":"burdușului","dative-genitive-indefinite-plural":"burdușuri","dative-definite-genitive-plural":"burdușurilor","singular-vocative":"burdușule","plural-vocative":"burdușurilor"}},{"word":"Burdusaci","pos":"name","definitions":["a village in Răchitoasa, Bacău County, Romania"],"gender":"m"},{"word":"burdușeală","pos":"noun","definitions":["stuffing"],"forms":{"plural":"burdușeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burdușeală","accusative-definite-nominative-singular":"burdușeala","accusative-indefinite-nominative-plural":"burdușele","accusative-definite-nominative-plural":"burdușelele","dative-genitive-indefinite-singular":"burdușele","dative-definite-genitive-singular":"burdușelei","dative-genitive-indefinite-plural":"burdușele","dative-definite-genitive-plural":"burdușelelor","singular-vocative":"burdușeală","plural-vocative":"burdușelelor"}},{"word":"burdușel","pos":"noun","definitions":["diminutive of burduș"],"forms":{"plural":"burdușele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burdușel","accusative-definite-nominative-singular":"burdușelul","accusative-indefinite-nominative-plural":"burdușele","accusative-definite-nominative-plural":"burdușelele","dative-genitive-indefinite-singular":"burdușel","dative-definite-genitive-singular":"burdușelului","dative-genitive-indefinite-plural":"burdușele","dative-definite-genitive-plural":"burdușelelor","singular-vocative":"burdușelule","plural-vocative":"burdușelelor"}},{"word":"burduși","pos":"verb","definitions":["to cram"],"forms":{"canonical":"a burduși 4th conjugation","present-singular-third-person":"burdușește","participle-past":"burdușit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a burduși","gerund":"burdușind","first-person-indicative-present-singular":"burdușesc","indicative-present-second-person-singular":"burdușești","indicative-present-singular-third-person":"burdușește","first-person-indicative-plural-present":"burdușim","indicative-plural-present-second-person":"burdușiți","indicative-plural-present-third-person":"burdușesc","first-person-imperfect-indicative-singular":"burdușeam","imperfect-indicative-second-person-singular":"burdușeai","imperfect-indicative-singular-third-person":"burdușea","first-person-imperfect-indicative-plural":"burdușeam","imperfect-indicative-plural-second-person":"burdușeați","imperfect-indicative-plural-third-person":"burdușeau","first-person-indicative-perfect-singular":"burdușii","indicative-perfect-second-person-singular":"burdușiși","indicative-perfect-singular-third-person":"burduși","first-person-indicative-perfect-plural":"burdușirăm","indicative-perfect-plural-second-person":"burdușirăți","indicative-perfect-plural-third-person":"burdușiră","first-person-indicative-pluperfect-singular":"burdușisem","indicative-pluperfect-second-person-singular":"burdușiseși","indicative-pluperfect-singular-third-person":"burdușise","first-person-indicative-pluperfect-plural":"burdușiserăm","indicative-pluperfect-plural-second-person":"burdușiserăți","indicative-pluperfect-plural-third-person":"burdușiseră","first-person-present-singular-subjunctive":"să burdușesc","present-second-person-singular-subjunctive":"să burdușești","present-singular-subjunctive-third-person":"să burdușească","first-person-plural-present-subjunctive":"să burdușim","plural-present-second-person-subjunctive":"să burdușiți","plural-present-subjunctive-third-person":"să burdușească","imperative-second-person-singular":"burdușește","imperative-plural-second-person":"burdușiți","imperative-negative-second-person-singular":"nu burduși","imperative-negative-plural-second-person":"nu burdușiți"}},{"word":"burdușire","pos":"noun","definitions":["stuffing"],"forms":{"plural":"burdușiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"burdușire","accusative-definite-nominative-singular":"burdușirea","accusative-indefinite-nominative-plural":"burdușiri","accusative-definite-nominative-plural":"burdușirile","dative-genitive-indefinite-singular":"burdușiri","dative-definite-genitive-singular":"burdușirii","dative-genitive-indefinite-plural":"burdușiri","dative-definite-genitive-plural":"burdușirilor","singular-vocative":"burdușire","plural-vocative":"burdușirilor"}},{"word":"burdușit","pos":"adj","definitions":["stuffed"],"forms":{"feminine-singular":"burdușită","masculine-plural":"burdușiți","feminine-neuter-plural":"burdușite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burdușit","error-unrecognized-form-feminine-indefinite-singular":"burdușită","error-unrecognized-form-indefinite-masculine-plural":"burdușiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"burdușite","definite-error-unrecognized-form-masculine-neuter-singular":"burdușitul","definite-error-unrecognized-form-feminine-singular":"burdușita","definite-error-unrecognized-form-masculine-plural":"burdușiții","definite-error-unrecognized-form-feminine-neuter-plural":"burdușitele"}},{"word":"burdușit","pos":"verb","definitions":["past participle of burduși"],"forms":{"participle-past":"of burduși"}},{"word":"burduv","pos":"noun","definitions":["alternative form of burduf"],"forms":{"plural":"burduvuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burduv","accusative-definite-nominative-singular":"burduvul","accusative-indefinite-nominative-plural":"burduvuri","accusative-definite-nominative-plural":"burduvurile","dative-genitive-indefinite-singular":"burduv","dative-definite-genitive-singular":"burduvului","dative-genitive-indefinite-plural":"burduvuri","dative-definite-genitive-plural":"burduvurilor","singular-vocative":"burduvule","plural-vocative":"burduvurilor"}},{"word":"burecior","pos":"noun","definitions":["diminutive of burete"],"forms":{"plural":"bureciori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burecior","accusative-definite-nominative-singular":"bureciorul","accusative-indefinite-nominative-plural":"bureciori","accusative-definite-nominative-plural":"bureciorii","dative-genitive-indefinite-singular":"burecior","dative-definite-genitive-singular":"bureciorului","dative-genitive-indefinite-plural":"bureciori","dative-definite-genitive-plural":"bureciorilor","singular-vocative":"bureciorule","plural-vocative":"bureciorilor"}},{"word":"burelet","pos":"noun","definitions":["alternative form of burlet"],"forms":{"plural":"bureleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burelet","accusative-definite-nominative-singular":"bureletul","accusative-indefinite-nominative-plural":"bureleți","accusative-definite-nominative-plural":"bureleții","dative-genitive-indefinite-singular":"burelet","dative-definite-genitive-singular":"bureletului","dative-genitive-indefinite-plural":"bureleți","dative-definite-genitive-plural":"bureleților","singular-vocative":"bureletule","plural-vocative":"bureleților"}},{"word":"Burete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burete"}},{"word":"burete","pos":"noun","definitions":["sponge (cleaning item)","sponge (sea creature)","a species of mushroom"],"pronunciation":"[buˈrete]","forms":{"plural":"bureți","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"burete","accusative-definite-nominative-singular":"buretele","accusative-indefinite-nominative-plural":"bureți","accusative-definite-nominative-plural":"bureții","dative-genitive-indefinite-singular":"burete","dative-definite-genitive-singular":"buretelui","dative-genitive-indefinite-plural":"bureți","dative-definite-genitive-plural":"bureților","singular-vocative":"burete","plural-vocative":"bureților"}},{"word":"burete de mare","pos":"noun","definitions":["sponge (marine animal)"],"forms":{"plural":"bureți de mare"}},{"word":"burețel","pos":"noun","definitions":["diminutive of burete"],"forms":{"plural":"bureței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burețel","accusative-definite-nominative-singular":"burețelul","accusative-indefinite-nominative-plural":"bureței","accusative-definite-nominative-plural":"burețeii","dative-genitive-indefinite-singular":"burețel","dative-definite-genitive-singular":"burețelului","dative-genitive-indefinite-plural":"bureței","dative-definite-genitive-plural":"burețeilor","singular-vocative":"burețelule","plural-vocative":"burețeilor"}},{"word":"buretele cerbilor","pos":"noun","definitions":["common earthball (Scleroderma citrinum)"]},{"word":"Burețești","pos":"name","definitions":["a village in Vedea, Argeș County, Romania"],"gender":"m"},{"word":"buretieră","pos":"noun","definitions":["sponge case"],"forms":{"plural":"buretiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buretieră","accusative-definite-nominative-singular":"buretiera","accusative-indefinite-nominative-plural":"buretiere","accusative-definite-nominative-plural":"buretierele","dative-genitive-indefinite-singular":"buretiere","dative-definite-genitive-singular":"buretierei","dative-genitive-indefinite-plural":"buretiere","dative-definite-genitive-plural":"buretierelor","singular-vocative":"buretieră","plural-vocative":"buretierelor"}},{"word":"buretos","pos":"adj","definitions":["spongy"],"forms":{"feminine-singular":"buretoasă","masculine-plural":"buretoși","feminine-neuter-plural":"buretoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buretos","error-unrecognized-form-feminine-indefinite-singular":"buretoasă","error-unrecognized-form-indefinite-masculine-plural":"buretoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buretoase","definite-error-unrecognized-form-masculine-neuter-singular":"buretosul","definite-error-unrecognized-form-feminine-singular":"buretoasa","definite-error-unrecognized-form-masculine-plural":"buretoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buretoasele"}},{"word":"burg","pos":"noun","definitions":["burg, market town"],"forms":{"plural":"burguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burg","accusative-definite-nominative-singular":"burgul","accusative-indefinite-nominative-plural":"burguri","accusative-definite-nominative-plural":"burgurile","dative-genitive-indefinite-singular":"burg","dative-definite-genitive-singular":"burgului","dative-genitive-indefinite-plural":"burguri","dative-definite-genitive-plural":"burgurilor","singular-vocative":"burgule","plural-vocative":"burgurilor"}},{"word":"burgadă","pos":"noun","definitions":["a small town"],"forms":{"plural":"burgade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burgadă","accusative-definite-nominative-singular":"burgada","accusative-indefinite-nominative-plural":"burgade","accusative-definite-nominative-plural":"burgadele","dative-genitive-indefinite-singular":"burgade","dative-definite-genitive-singular":"burgadei","dative-genitive-indefinite-plural":"burgade","dative-definite-genitive-plural":"burgadelor","singular-vocative":"burgadă","plural-vocative":"burgadelor"}},{"word":"Burghelea","pos":"name","definitions":["a village in Ișcălău, Fălești Raion, Moldova"],"gender":"f"},{"word":"burghez","pos":"adj","definitions":["bourgeois"],"forms":{"feminine-singular":"burgheză","masculine-plural":"burghezi","feminine-neuter-plural":"burgheze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burghez","error-unrecognized-form-feminine-indefinite-singular":"burgheză","error-unrecognized-form-indefinite-masculine-plural":"burghezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"burgheze","definite-error-unrecognized-form-masculine-neuter-singular":"burghezul","definite-error-unrecognized-form-feminine-singular":"burgheza","definite-error-unrecognized-form-masculine-plural":"burghezii","definite-error-unrecognized-form-feminine-neuter-plural":"burghezele"}},{"word":"burghez","pos":"noun","definitions":["bourgeois","burgher"],"forms":{"plural":"burghezi","feminine":"equivalent burgheză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burghez","accusative-definite-nominative-singular":"burghezul","accusative-indefinite-nominative-plural":"burghezi","accusative-definite-nominative-plural":"burghezii","dative-genitive-indefinite-singular":"burghez","dative-definite-genitive-singular":"burghezului","dative-genitive-indefinite-plural":"burghezi","dative-definite-genitive-plural":"burghezilor","singular-vocative":"burghezule","plural-vocative":"burghezilor"}},{"word":"burgheză","pos":"noun","definitions":["female equivalent of burghez"],"forms":{"plural":"burgheze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burgheză","accusative-definite-nominative-singular":"burgheza","accusative-indefinite-nominative-plural":"burgheze","accusative-definite-nominative-plural":"burghezele","dative-genitive-indefinite-singular":"burgheze","dative-definite-genitive-singular":"burghezei","dative-genitive-indefinite-plural":"burgheze","dative-definite-genitive-plural":"burghezelor","singular-vocative":"burgheză","plural-vocative":"burghezelor"}},{"word":"burghezi","pos":"verb","definitions":["to bourgeoisify"],"forms":{"canonical":"a burghezi 4th conjugation","present-singular-third-person":"burghezește","participle-past":"burghezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a burghezi","gerund":"burghezind","first-person-indicative-present-singular":"burghezesc","indicative-present-second-person-singular":"burghezești","indicative-present-singular-third-person":"burghezește","first-person-indicative-plural-present":"burghezim","indicative-plural-present-second-person":"burgheziți","indicative-plural-present-third-person":"burghezesc","first-person-imperfect-indicative-singular":"burghezeam","imperfect-indicative-second-person-singular":"burghezeai","imperfect-indicative-singular-third-person":"burghezea","first-person-imperfect-indicative-plural":"burghezeam","imperfect-indicative-plural-second-person":"burghezeați","imperfect-indicative-plural-third-person":"burghezeau","first-person-indicative-perfect-singular":"burghezii","indicative-perfect-second-person-singular":"burgheziși","indicative-perfect-singular-third-person":"burghezi","first-person-indicative-perfect-plural":"burghezirăm","indicative-perfect-plural-second-person":"burghezirăți","indicative-perfect-plural-third-person":"burgheziră","first-person-indicative-pluperfect-singular":"burghezisem","indicative-pluperfect-second-person-singular":"burgheziseși","indicative-pluperfect-singular-third-person":"burghezise","first-person-indicative-pluperfect-plural":"burgheziserăm","indicative-pluperfect-plural-second-person":"burgheziserăți","indicative-pluperfect-plural-third-person":"burgheziseră","first-person-present-singular-subjunctive":"să burghezesc","present-second-person-singular-subjunctive":"să burghezești","present-singular-subjunctive-third-person":"să burghezească","first-person-plural-present-subjunctive":"să burghezim","plural-present-second-person-subjunctive":"să burgheziți","plural-present-subjunctive-third-person":"să burghezească","imperative-second-person-singular":"burghezește","imperative-plural-second-person":"burgheziți","imperative-negative-second-person-singular":"nu burghezi","imperative-negative-plural-second-person":"nu burgheziți"}},{"word":"burghezie","pos":"noun","definitions":["bourgeoisie"],"forms":{"plural":"burghezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"burghezie","accusative-definite-nominative-singular":"burghezia","accusative-indefinite-nominative-plural":"burghezii","accusative-definite-nominative-plural":"burgheziile","dative-genitive-indefinite-singular":"burghezii","dative-definite-genitive-singular":"burgheziei","dative-genitive-indefinite-plural":"burghezii","dative-definite-genitive-plural":"burgheziilor","singular-vocative":"burghezie","plural-vocative":"burgheziilor"}},{"word":"burghezie națională","pos":"noun","definitions":["national bourgeoisie"]},{"word":"burghezime","pos":"noun","definitions":["bourgeoisie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"burghezime","accusative-definite-nominative-singular":"burghezimii","accusative-indefinite-nominative-plural":"burghezimi","accusative-definite-nominative-plural":"burghezimile","dative-genitive-indefinite-singular":"burghezimi","dative-definite-genitive-singular":"burghezimii","dative-genitive-indefinite-plural":"burghezimi","dative-definite-genitive-plural":"burghezimilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"burghiaș","pos":"noun","definitions":["diminutive of burghiu"],"forms":{"plural":"burghiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burghiaș","accusative-definite-nominative-singular":"burghiașul","accusative-indefinite-nominative-plural":"burghiași","accusative-definite-nominative-plural":"burghiașii","dative-genitive-indefinite-singular":"burghiaș","dative-definite-genitive-singular":"burghiașului","dative-genitive-indefinite-plural":"burghiași","dative-definite-genitive-plural":"burghiașilor","singular-vocative":"burghiașule","plural-vocative":"burghiașilor"}},{"word":"burghiere","pos":"noun","definitions":["drilling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"burghiere","accusative-definite-nominative":"burghierea","dative-genitive-indefinite":"burghiere","dative-definite-genitive":"burghierei","vocative":"burghiere"}},{"word":"burghieș","pos":"noun","definitions":["alternative form of burghiaș"],"forms":{"plural":"burghieși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burghieș","accusative-definite-nominative-singular":"burghieșul","accusative-indefinite-nominative-plural":"burghieși","accusative-definite-nominative-plural":"burghieșii","dative-genitive-indefinite-singular":"burghieș","dative-definite-genitive-singular":"burghieșului","dative-genitive-indefinite-plural":"burghieși","dative-definite-genitive-plural":"burghieșilor","singular-vocative":"burghieșule","plural-vocative":"burghieșilor"}},{"word":"Burghiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burghiu"}},{"word":"burghiu","pos":"noun","definitions":["drill","borer","penis"],"pronunciation":"/burˈɡiw/","forms":{"plural":"burghie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burghiu","accusative-definite-nominative-singular":"burghiul","accusative-indefinite-nominative-plural":"burghie","accusative-definite-nominative-plural":"burghiele","dative-genitive-indefinite-singular":"burghiu","dative-definite-genitive-singular":"burghiului","dative-genitive-indefinite-plural":"burghie","dative-definite-genitive-plural":"burghielor","singular-vocative":"burghiule","plural-vocative":"burghielor"}},{"word":"burghiu de foraj","pos":"noun","definitions":["drill bit"],"forms":{"plural":"burghie de foraj"}},{"word":"burghiuț","pos":"noun","definitions":["diminutive of burghiu"],"forms":{"plural":"burghiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burghiuț","accusative-definite-nominative-singular":"burghiuțul","accusative-indefinite-nominative-plural":"burghiuțe","accusative-definite-nominative-plural":"burghiuțele","dative-genitive-indefinite-singular":"burghiuț","dative-definite-genitive-singular":"burghiuțului","dative-genitive-indefinite-plural":"burghiuțe","dative-definite-genitive-plural":"burghiuțelor","singular-vocative":"burghiuțule","plural-vocative":"burghiuțelor"}},{"word":"burgmaistru","pos":"noun","definitions":["burgomaster"],"forms":{"plural":"burgmaiștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"burgmaistru","accusative-definite-nominative-singular":"burgmaistrul","accusative-indefinite-nominative-plural":"burgmaiștri","accusative-definite-nominative-plural":"burgmaiștrii","dative-genitive-indefinite-singular":"burgmaistru","dative-definite-genitive-singular":"burgmaistrului","dative-genitive-indefinite-plural":"burgmaiștri","dative-definite-genitive-plural":"burgmaiștrilor","singular-vocative":"burgmaistrule","plural-vocative":"burgmaiștrilor"}},{"word":"burgrav","pos":"noun","definitions":["burgrave"],"forms":{"plural":"burgravi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burgrav","accusative-definite-nominative-singular":"burgravul","accusative-indefinite-nominative-plural":"burgravi","accusative-definite-nominative-plural":"burgravii","dative-genitive-indefinite-singular":"burgrav","dative-definite-genitive-singular":"burgravului","dative-genitive-indefinite-plural":"burgravi","dative-definite-genitive-plural":"burgravilor","singular-vocative":"burgravule","plural-vocative":"burgravilor"}},{"word":"burgraviat","pos":"noun","definitions":["burgraviate"],"forms":{"plural":"burgraviate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burgraviat","accusative-definite-nominative-singular":"burgraviatul","accusative-indefinite-nominative-plural":"burgraviate","accusative-definite-nominative-plural":"burgraviatele","dative-genitive-indefinite-singular":"burgraviat","dative-definite-genitive-singular":"burgraviatului","dative-genitive-indefinite-plural":"burgraviate","dative-definite-genitive-plural":"burgraviatelor","singular-vocative":"burgraviatule","plural-vocative":"burgraviatelor"}},{"word":"burgund","pos":"adj","definitions":["Burgundian"],"forms":{"feminine-singular":"burgundă","masculine-plural":"burgunzi","feminine-neuter-plural":"burgunde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burgund","error-unrecognized-form-feminine-indefinite-singular":"burgundă","error-unrecognized-form-indefinite-masculine-plural":"burgunzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"burgunde","definite-error-unrecognized-form-masculine-neuter-singular":"burgundul","definite-error-unrecognized-form-feminine-singular":"burgunda","definite-error-unrecognized-form-masculine-plural":"burgunzii","definite-error-unrecognized-form-feminine-neuter-plural":"burgundele"}},{"word":"burgundă","pos":"noun","definitions":["female equivalent of burgund"],"forms":{"plural":"burgunde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burgundă","accusative-definite-nominative-singular":"burgunda","accusative-indefinite-nominative-plural":"burgunde","accusative-definite-nominative-plural":"burgundele","dative-genitive-indefinite-singular":"burgunde","dative-definite-genitive-singular":"burgundei","dative-genitive-indefinite-plural":"burgunde","dative-definite-genitive-plural":"burgundelor","singular-vocative":"burgundă","plural-vocative":"burgundelor"}},{"word":"burguri","pos":"noun","definitions":["plural of burg"]},{"word":"Buriaș","pos":"name","definitions":["a village in Periș, Ilfov County, Romania"],"gender":"m"},{"word":"Buric","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buric"}},{"word":"buric","pos":"noun","definitions":["navel, bellybutton"],"forms":{"plural":"burice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buric","accusative-definite-nominative-singular":"buricul","accusative-indefinite-nominative-plural":"burice","accusative-definite-nominative-plural":"buricele","dative-genitive-indefinite-singular":"buric","dative-definite-genitive-singular":"buricului","dative-genitive-indefinite-plural":"burice","dative-definite-genitive-plural":"buricelor","singular-vocative":"buricule","plural-vocative":"buricelor"}},{"word":"buricaș","pos":"noun","definitions":["diminutive of buric"],"forms":{"plural":"buricașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buricaș","accusative-definite-nominative-singular":"buricașul","accusative-indefinite-nominative-plural":"buricașe","accusative-definite-nominative-plural":"buricașele","dative-genitive-indefinite-singular":"buricaș","dative-definite-genitive-singular":"buricașului","dative-genitive-indefinite-plural":"buricașe","dative-definite-genitive-plural":"buricașelor","singular-vocative":"buricașule","plural-vocative":"buricașelor"}},{"word":"buricel","pos":"noun","definitions":["diminutive of buric"],"forms":{"plural":"buricele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buricel","accusative-definite-nominative-singular":"buricelul","accusative-indefinite-nominative-plural":"buricele","accusative-definite-nominative-plural":"buricelele","dative-genitive-indefinite-singular":"buricel","dative-definite-genitive-singular":"buricelului","dative-genitive-indefinite-plural":"buricele","dative-definite-genitive-plural":"buricelelor","singular-vocative":"buricelule","plural-vocative":"buricelelor"}},{"word":"buricică","pos":"noun","definitions":["diminutive of bură"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"buricică","accusative-definite-nominative":"buricica","dative-genitive-indefinite":"buricice","dative-definite-genitive":"buricicei","vocative":"buricică"}},{"word":"Burila Mare","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Burila Mare, Mehedinți County, Romania"],"gender":"f"},{"word":"Burila Mică","pos":"name","definitions":["a village in Gogoșu, Mehedinți County, Romania"],"gender":"f"},{"word":"Burileanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Burileanu"}},{"word":"buriu","pos":"noun","definitions":["a large barrel"],"forms":{"plural":"burie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buriu","accusative-definite-nominative-singular":"buriuul","accusative-indefinite-nominative-plural":"burie","accusative-definite-nominative-plural":"buriele","dative-genitive-indefinite-singular":"buriu","dative-definite-genitive-singular":"buriuului","dative-genitive-indefinite-plural":"burie","dative-definite-genitive-plural":"burielor","singular-vocative":"buriuule","plural-vocative":"burielor"}},{"word":"Burjuc","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Burjuc, Hunedoara County, Romania"],"gender":"m"},{"word":"burjui","pos":"noun","definitions":["bourgeois"],"forms":{"plural":"burjui","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burjui","accusative-definite-nominative-singular":"burjuiul","accusative-indefinite-nominative-plural":"burjui","accusative-definite-nominative-plural":"burjuii","dative-genitive-indefinite-singular":"burjui","dative-definite-genitive-singular":"burjuiului","dative-genitive-indefinite-plural":"burjui","dative-definite-genitive-plural":"burjuilor","singular-vocative":"burjuiule","plural-vocative":"burjuilor"}},{"word":"Burkina Faso","pos":"name","definitions":["Burkina Faso (a country in West Africa, formerly Upper Volta)"]},{"word":"Burla","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Sitna","a village in Unțeni, Botoșani County, Romania","a commune of Suceava County, Romania","a village in Burla, Suceava County, Romania"],"gender":"f"},{"word":"burlac","pos":"noun","definitions":["bachelor"],"pronunciation":"/burˈlak/","forms":{"plural":"burlaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burlac","accusative-definite-nominative-singular":"burlacul","accusative-indefinite-nominative-plural":"burlaci","accusative-definite-nominative-plural":"burlacii","dative-genitive-indefinite-singular":"burlac","dative-definite-genitive-singular":"burlacului","dative-genitive-indefinite-plural":"burlaci","dative-definite-genitive-plural":"burlacilor","singular-vocative":"burlacule","plural-vocative":"burlacilor"}},{"word":"burlac","pos":"adj","definitions":["unmarried, single (having no husband or wife)"],"pronunciation":"/burˈlak/","forms":{"plural":"burlaci","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burlac","error-unrecognized-form-feminine-indefinite-singular":"-","error-unrecognized-form-indefinite-masculine-plural":"burlaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"-","definite-error-unrecognized-form-masculine-neuter-singular":"burlacul","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"burlacii","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"burlăcărit","pos":"noun","definitions":["bachelordom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"burlăcărit","accusative-definite-nominative":"burlăcăritul","dative-genitive-indefinite":"burlăcărit","dative-definite-genitive":"burlăcăritului","vocative":"burlăcăritule"}},{"word":"Burlăcel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burlăcel"}},{"word":"Burlăceni","pos":"name","definitions":["a village in Burlăceni, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"burlăcesc","pos":"adj","definitions":["bachelorlike"],"forms":{"feminine-singular":"burlăcească","plural":"burlăcești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burlăcesc","error-unrecognized-form-feminine-indefinite-singular":"burlăcească","error-unrecognized-form-indefinite-masculine-plural":"burlăcești","error-unrecognized-form-feminine-indefinite-neuter-plural":"burlăcești","definite-error-unrecognized-form-masculine-neuter-singular":"burlăcescul","definite-error-unrecognized-form-feminine-singular":"burlăceasca","definite-error-unrecognized-form-masculine-plural":"burlăceștii","definite-error-unrecognized-form-feminine-neuter-plural":"burlăceștile"}},{"word":"burlaci","pos":"noun","definitions":["plural of burlac"],"gender":"m-p"},{"word":"burlăci","pos":"verb","definitions":["to live a life of a bachelor"],"forms":{"canonical":"a burlăci 4th conjugation","present-singular-third-person":"burlăcește","participle-past":"burlăcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a burlăci","gerund":"burlăcind","first-person-indicative-present-singular":"burlăcesc","indicative-present-second-person-singular":"burlăcești","indicative-present-singular-third-person":"burlăcește","first-person-indicative-plural-present":"burlăcim","indicative-plural-present-second-person":"burlăciți","indicative-plural-present-third-person":"burlăcesc","first-person-imperfect-indicative-singular":"burlăceam","imperfect-indicative-second-person-singular":"burlăceai","imperfect-indicative-singular-third-person":"burlăcea","first-person-imperfect-indicative-plural":"burlăceam","imperfect-indicative-plural-second-person":"burlăceați","imperfect-indicative-plural-third-person":"burlăceau","first-person-indicative-perfect-singular":"burlăcii","indicative-perfect-second-person-singular":"burlăciși","indicative-perfect-singular-third-person":"burlăci","first-person-indicative-perfect-plural":"burlăcirăm","indicative-perfect-plural-second-person":"burlăcirăți","indicative-perfect-plural-third-person":"burlăciră","first-person-indicative-pluperfect-singular":"burlăcisem","indicative-pluperfect-second-person-singular":"burlăciseși","indicative-pluperfect-singular-third-person":"burlăcise","first-person-indicative-pluperfect-plural":"burlăciserăm","indicative-pluperfect-plural-second-person":"burlăciserăți","indicative-pluperfect-plural-third-person":"burlăciseră","first-person-present-singular-subjunctive":"să burlăcesc","present-second-person-singular-subjunctive":"să burlăcești","present-singular-subjunctive-third-person":"să burlăcească","first-person-plural-present-subjunctive":"să burlăcim","plural-present-second-person-subjunctive":"să burlăciți","plural-present-subjunctive-third-person":"să burlăcească","imperative-second-person-singular":"burlăcește","imperative-plural-second-person":"burlăciți","imperative-negative-second-person-singular":"nu burlăci","imperative-negative-plural-second-person":"nu burlăciți"}},{"word":"burlăcie","pos":"noun","definitions":["bachelordom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"burlăcie","accusative-definite-nominative":"burlăcia","dative-genitive-indefinite":"burlăcii","dative-definite-genitive":"burlăciei","vocative":"burlăcie"}},{"word":"Burlacu","pos":"name","definitions":["a village in Burlacu, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"burlacul","pos":"noun","definitions":["definite nominative/accusative singular of burlac"]},{"word":"Burlan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burlan"}},{"word":"burlan","pos":"noun","definitions":["drainpipe"],"pronunciation":"/burˈlan/","forms":{"plural":"burlane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burlan","accusative-definite-nominative-singular":"burlanul","accusative-indefinite-nominative-plural":"burlane","accusative-definite-nominative-plural":"burlanele","dative-genitive-indefinite-singular":"burlan","dative-definite-genitive-singular":"burlanului","dative-genitive-indefinite-plural":"burlane","dative-definite-genitive-plural":"burlanelor","singular-vocative":"burlanule","plural-vocative":"burlanelor","alternative":"бурлан"}},{"word":"Burlănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Burlănescu"}},{"word":"Burlănești","pos":"name","definitions":["a village in Burlănești, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Burlani","pos":"name","definitions":["a village in Prigoria, Gorj County, Romania"],"gender":"m"},{"word":"Burleac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burleac"}},{"word":"burlesc","pos":"noun","definitions":["farcical"],"forms":{"plural":"burlești","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"burlesc","accusative-definite-nominative-singular":"burles","accusative-indefinite-nominative-plural":"burlești","accusative-definite-nominative-plural":"burleștile","dative-genitive-indefinite-singular":"burlești","dative-definite-genitive-singular":"burleștii","dative-genitive-indefinite-plural":"burlești","dative-definite-genitive-plural":"burleștilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Burlești","pos":"name","definitions":["a village in Unțeni, Botoșani County, Romania"],"gender":"m"},{"word":"burlincaș","pos":"noun","definitions":["diminutive of burlinc"],"forms":{"plural":"burlincași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burlincaș","accusative-definite-nominative-singular":"burlincașul","accusative-indefinite-nominative-plural":"burlincași","accusative-definite-nominative-plural":"burlincașii","dative-genitive-indefinite-singular":"burlincaș","dative-definite-genitive-singular":"burlincașului","dative-genitive-indefinite-plural":"burlincași","dative-definite-genitive-plural":"burlincașilor","singular-vocative":"burlincașule","plural-vocative":"burlincașilor"}},{"word":"burlincuț","pos":"noun","definitions":["diminutive of burlinc"],"forms":{"plural":"burlincuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burlincuț","accusative-definite-nominative-singular":"burlincuțul","accusative-indefinite-nominative-plural":"burlincuți","accusative-definite-nominative-plural":"burlincuții","dative-genitive-indefinite-singular":"burlincuț","dative-definite-genitive-singular":"burlincuțului","dative-genitive-indefinite-plural":"burlincuți","dative-definite-genitive-plural":"burlincuților","singular-vocative":"burlincuțule","plural-vocative":"burlincuților"}},{"word":"Burluși","pos":"name","definitions":["a village in Ciofringeni, Argeș County, Romania"],"gender":"m"},{"word":"burmă","pos":"noun","definitions":["wedding ring"],"forms":{"plural":"burme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burmă","accusative-definite-nominative-singular":"burma","accusative-indefinite-nominative-plural":"burme","accusative-definite-nominative-plural":"burmele","dative-genitive-indefinite-singular":"burme","dative-definite-genitive-singular":"burmei","dative-genitive-indefinite-plural":"burme","dative-definite-genitive-plural":"burmelor","singular-vocative":"burmă","plural-vocative":"burmelor"}},{"word":"Burnești","pos":"name","definitions":["a village in Schitu Golești, Argeș County, Romania"],"gender":"m"},{"word":"burnița","pos":"verb","definitions":["to drizzle"],"forms":{"canonical":"a burnița 1st conjugation","present-singular-third-person":"burnițează","participle-past":"burnițat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a burnița","gerund":"burnițând","first-person-indicative-present-singular":"burniț","indicative-present-second-person-singular":"burniți","indicative-present-singular-third-person":"burniță","first-person-indicative-plural-present":"burnițăm","indicative-plural-present-second-person":"burnițați","indicative-plural-present-third-person":"burniță","first-person-imperfect-indicative-singular":"burnițam","imperfect-indicative-second-person-singular":"burnițai","imperfect-indicative-singular-third-person":"burnița","first-person-imperfect-indicative-plural":"burnițam","imperfect-indicative-plural-second-person":"burnițați","imperfect-indicative-plural-third-person":"burnițau","first-person-indicative-perfect-singular":"burnițai","indicative-perfect-second-person-singular":"burnițași","indicative-perfect-singular-third-person":"burniță","first-person-indicative-perfect-plural":"burnițarăm","indicative-perfect-plural-second-person":"burnițarăți","indicative-perfect-plural-third-person":"burnițară","first-person-indicative-pluperfect-singular":"burnițasem","indicative-pluperfect-second-person-singular":"burnițaseși","indicative-pluperfect-singular-third-person":"burnițase","first-person-indicative-pluperfect-plural":"burnițaserăm","indicative-pluperfect-plural-second-person":"burnițaserăți","indicative-pluperfect-plural-third-person":"burnițaseră","first-person-present-singular-subjunctive":"să burniț","present-second-person-singular-subjunctive":"să burniți","present-singular-subjunctive-third-person":"să burnițe","first-person-plural-present-subjunctive":"să burnițăm","plural-present-second-person-subjunctive":"să burnițați","plural-present-subjunctive-third-person":"să burnițe","imperative-second-person-singular":"burniță","imperative-plural-second-person":"burnițați","imperative-negative-second-person-singular":"nu burnița","imperative-negative-plural-second-person":"nu burnițați"}},{"word":"burniță","pos":"noun","definitions":["drizzle"],"forms":{"plural":"burnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burniță","accusative-definite-nominative-singular":"burnița","accusative-indefinite-nominative-plural":"burnițe","accusative-definite-nominative-plural":"burnițele","dative-genitive-indefinite-singular":"burnițe","dative-definite-genitive-singular":"burniței","dative-genitive-indefinite-plural":"burnițe","dative-definite-genitive-plural":"burnițelor","singular-vocative":"burniță","plural-vocative":"burnițelor"}},{"word":"burnițeală","pos":"noun","definitions":["drizzle"],"forms":{"plural":"burnițeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"burnițeală","accusative-definite-nominative-singular":"burnițeala","accusative-indefinite-nominative-plural":"burnițeli","accusative-definite-nominative-plural":"burnițelile","dative-genitive-indefinite-singular":"burnițeli","dative-definite-genitive-singular":"burnițelii","dative-genitive-indefinite-plural":"burnițeli","dative-definite-genitive-plural":"burnițelilor","singular-vocative":"burnițeală","plural-vocative":"burnițelilor"}},{"word":"burnițos","pos":"adj","definitions":["drizzling"],"forms":{"feminine-singular":"burnițoasă","masculine-plural":"burnițoși","feminine-neuter-plural":"burnițoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burnițos","error-unrecognized-form-feminine-indefinite-singular":"burnițoasă","error-unrecognized-form-indefinite-masculine-plural":"burnițoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burnițoase","definite-error-unrecognized-form-masculine-neuter-singular":"burnițosul","definite-error-unrecognized-form-feminine-singular":"burnițoasa","definite-error-unrecognized-form-masculine-plural":"burnițoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burnițoasele"}},{"word":"burnujel","pos":"noun","definitions":["diminutive of burnuz"],"forms":{"plural":"burnujele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burnujel","accusative-definite-nominative-singular":"burnujelul","accusative-indefinite-nominative-plural":"burnujele","accusative-definite-nominative-plural":"burnujelele","dative-genitive-indefinite-singular":"burnujel","dative-definite-genitive-singular":"burnujelului","dative-genitive-indefinite-plural":"burnujele","dative-definite-genitive-plural":"burnujelelor","singular-vocative":"burnujelule","plural-vocative":"burnujelelor"}},{"word":"burnuz","pos":"noun","definitions":["haik"],"forms":{"plural":"burnuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"burnuz","accusative-definite-nominative-singular":"burnuzul","accusative-indefinite-nominative-plural":"burnuze","accusative-definite-nominative-plural":"burnuzele","dative-genitive-indefinite-singular":"burnuz","dative-definite-genitive-singular":"burnuzului","dative-genitive-indefinite-plural":"burnuze","dative-definite-genitive-plural":"burnuzelor","singular-vocative":"burnuzule","plural-vocative":"burnuzelor"}},{"word":"buroaică","pos":"noun","definitions":["drizzle"],"forms":{"plural":"buroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buroaică","accusative-definite-nominative-singular":"buroaica","accusative-indefinite-nominative-plural":"buroaice","accusative-definite-nominative-plural":"buroaicele","dative-genitive-indefinite-singular":"buroaice","dative-definite-genitive-singular":"buroaicei","dative-genitive-indefinite-plural":"buroaice","dative-definite-genitive-plural":"buroaicelor","singular-vocative":"buroaică","plural-vocative":"buroaicelor"}},{"word":"bursă","pos":"noun","definitions":["stock exchange","scholarship"],"forms":{"plural":"burse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bursă","accusative-definite-nominative-singular":"bursa","accusative-indefinite-nominative-plural":"burse","accusative-definite-nominative-plural":"bursele","dative-genitive-indefinite-singular":"burse","dative-definite-genitive-singular":"bursei","dative-genitive-indefinite-plural":"burse","dative-definite-genitive-plural":"burselor","singular-vocative":"bursă","plural-vocative":"burselor"}},{"word":"bursă de valori","pos":"noun","definitions":["stock exchange"],"forms":{"plural":"burse de valori"}},{"word":"bursa muncii","pos":"noun","definitions":["labour exchange"]},{"word":"bursier","pos":"noun","definitions":["person awarded a scholarship"],"forms":{"plural":"bursieri","feminine":"equivalent bursieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bursier","accusative-definite-nominative-singular":"bursierul","accusative-indefinite-nominative-plural":"bursieri","accusative-definite-nominative-plural":"bursierii","dative-genitive-indefinite-singular":"bursier","dative-definite-genitive-singular":"bursierului","dative-genitive-indefinite-plural":"bursieri","dative-definite-genitive-plural":"bursierilor","singular-vocative":"bursierule","plural-vocative":"bursierilor"}},{"word":"bursieră","pos":"noun","definitions":["female equivalent of bursier"],"forms":{"plural":"bursiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bursieră","accusative-definite-nominative-singular":"bursiera","accusative-indefinite-nominative-plural":"bursiere","accusative-definite-nominative-plural":"bursierele","dative-genitive-indefinite-singular":"bursiere","dative-definite-genitive-singular":"bursierei","dative-genitive-indefinite-plural":"bursiere","dative-definite-genitive-plural":"bursierelor","singular-vocative":"bursieră","plural-vocative":"bursierelor"}},{"word":"Bursuc","pos":"name","definitions":["a village in Bursuc, Nisporeni Raion, Moldova","a village in Japca, Florești Raion, Moldova","a commune of Nisporeni Raion, Moldova"],"gender":"m"},{"word":"bursuc","pos":"noun","definitions":["badger (animal) (Meles meles)"],"forms":{"plural":"bursuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bursuc","accusative-definite-nominative-singular":"bursucul","accusative-indefinite-nominative-plural":"bursuci","accusative-definite-nominative-plural":"bursucii","dative-genitive-indefinite-singular":"bursuc","dative-definite-genitive-singular":"bursucului","dative-genitive-indefinite-plural":"bursuci","dative-definite-genitive-plural":"bursucilor","singular-vocative":"bursucule","plural-vocative":"bursucilor"}},{"word":"Bursuc-Deal","pos":"name","definitions":["a village in Lespezi, Iași County, Romania"],"gender":"m"},{"word":"Bursuc-Vale","pos":"name","definitions":["a village in Lespezi, Iași County, Romania"],"gender":"m"},{"word":"bursuca","pos":"verb","definitions":["to get angry (at someone)"],"forms":{"canonical":"a bursuca 1st conjugation","present-singular-third-person":"bursucă","participle-past":"bursucat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a bursuca","gerund":"bursucând","first-person-indicative-present-singular":"bursuc","indicative-present-second-person-singular":"bursuci","indicative-present-singular-third-person":"bursucă","first-person-indicative-plural-present":"bursucăm","indicative-plural-present-second-person":"bursucați","indicative-plural-present-third-person":"bursucă","first-person-imperfect-indicative-singular":"bursucam","imperfect-indicative-second-person-singular":"bursucai","imperfect-indicative-singular-third-person":"bursuca","first-person-imperfect-indicative-plural":"bursucam","imperfect-indicative-plural-second-person":"bursucați","imperfect-indicative-plural-third-person":"bursucau","first-person-indicative-perfect-singular":"bursucai","indicative-perfect-second-person-singular":"bursucași","indicative-perfect-singular-third-person":"bursucă","first-person-indicative-perfect-plural":"bursucarăm","indicative-perfect-plural-second-person":"bursucarăți","indicative-perfect-plural-third-person":"bursucară","first-person-indicative-pluperfect-singular":"bursucasem","indicative-pluperfect-second-person-singular":"bursucaseși","indicative-pluperfect-singular-third-person":"bursucase","first-person-indicative-pluperfect-plural":"bursucaserăm","indicative-pluperfect-plural-second-person":"bursucaserăți","indicative-pluperfect-plural-third-person":"bursucaseră","first-person-present-singular-subjunctive":"să bursuc","present-second-person-singular-subjunctive":"să bursuci","present-singular-subjunctive-third-person":"să bursuce","first-person-plural-present-subjunctive":"să bursucăm","plural-present-second-person-subjunctive":"să bursucați","plural-present-subjunctive-third-person":"să bursuce","imperative-second-person-singular":"bursucă","imperative-plural-second-person":"bursucați","imperative-negative-second-person-singular":"nu bursuca","imperative-negative-plural-second-person":"nu bursucați"}},{"word":"bursucă","pos":"noun","definitions":["alpine bartsia (Bartsia alpina)"],"forms":{"plural":"bursuce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bursucă","accusative-definite-nominative-singular":"bursuca","accusative-indefinite-nominative-plural":"bursuce","accusative-definite-nominative-plural":"bursucele","dative-genitive-indefinite-singular":"bursuce","dative-definite-genitive-singular":"bursucei","dative-genitive-indefinite-plural":"bursuce","dative-definite-genitive-plural":"bursucelor","singular-vocative":"bursucă","plural-vocative":"bursucelor"}},{"word":"Bursucani","pos":"name","definitions":["a village in Bălăbănești, Galați County, Romania"],"gender":"m"},{"word":"bursucel","pos":"noun","definitions":["diminutive of bursuc; small badger"],"forms":{"plural":"bursucei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bursucel","accusative-definite-nominative-singular":"bursucelul","accusative-indefinite-nominative-plural":"bursucei","accusative-definite-nominative-plural":"bursuceii","dative-genitive-indefinite-singular":"bursucel","dative-definite-genitive-singular":"bursucelului","dative-genitive-indefinite-plural":"bursucei","dative-definite-genitive-plural":"bursuceilor","singular-vocative":"bursucelule","plural-vocative":"bursuceilor"}},{"word":"Bursuceni","pos":"name","definitions":["a village in Verești, Suceava County, Romania"],"gender":"m"},{"word":"Bursuci","pos":"name","definitions":["a village in Epureni, Vaslui County, Romania"],"gender":"m"},{"word":"bursuflură","pos":"noun","definitions":["blister on ceramics"],"forms":{"plural":"bursuflure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bursuflură","accusative-definite-nominative-singular":"bursuflura","accusative-indefinite-nominative-plural":"bursuflure","accusative-definite-nominative-plural":"bursuflurele","dative-genitive-indefinite-singular":"bursuflure","dative-definite-genitive-singular":"bursuflurei","dative-genitive-indefinite-plural":"bursuflure","dative-definite-genitive-plural":"bursuflurelor","singular-vocative":"bursuflură","plural-vocative":"bursuflurelor"}},{"word":"burta","pos":"noun","definitions":["definite nominative/accusative singular of burtă"],"pronunciation":"[ˈburta]","gender":"f"},{"word":"Burtă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burtă"}},{"word":"burtă","pos":"noun","definitions":["belly"],"pronunciation":"[ˈbur.tə]","forms":{"plural":"burți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"burtă","accusative-definite-nominative-singular":"burta","accusative-indefinite-nominative-plural":"burți","accusative-definite-nominative-plural":"burțile","dative-genitive-indefinite-singular":"burți","dative-definite-genitive-singular":"burții","dative-genitive-indefinite-plural":"burți","dative-definite-genitive-plural":"burților","singular-vocative":"burtă","plural-vocative":"burților"}},{"word":"burtă-verde","pos":"noun","definitions":["bourgeois philistine"],"forms":{"plural":"burtă-verde","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burtă-verde","accusative-definite-nominative-singular":"burtă-verdeul","accusative-indefinite-nominative-plural":"burtă-verde","accusative-definite-nominative-plural":"burtă-verdei","dative-genitive-indefinite-singular":"burtă-verde","dative-definite-genitive-singular":"burtă-verdeului","dative-genitive-indefinite-plural":"burtă-verde","dative-definite-genitive-plural":"burtă-verdelor","singular-vocative":"burtă-verdeule","plural-vocative":"burtă-verdelor"}},{"word":"Burtăverde","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burtăverde"}},{"word":"burtăverzime","pos":"noun","definitions":["philistine bourgeoisie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"burtăverzime","accusative-definite-nominative":"burtăverzimea","dative-genitive-indefinite":"burtăverzimi","dative-definite-genitive":"burtăverzimii","vocative":"burtăverzime"}},{"word":"burtea","pos":"noun","definitions":["nickname for a fat person"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"burtea","accusative-definite-nominative":"burteaul","dative-genitive-indefinite":"burtea","dative-definite-genitive":"burteaului","vocative":"burteaule"}},{"word":"Burtescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Burtescu"}},{"word":"Burtică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burtică"}},{"word":"burtică","pos":"noun","definitions":["diminutive of burtă; small belly"],"forms":{"plural":"burtici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burtică","accusative-definite-nominative-singular":"burtica","accusative-indefinite-nominative-plural":"burtice","accusative-definite-nominative-plural":"burticele","dative-genitive-indefinite-singular":"burtice","dative-definite-genitive-singular":"burticei","dative-genitive-indefinite-plural":"burtice","dative-definite-genitive-plural":"burticelor","singular-vocative":"burtică","plural-vocative":"burticelor"}},{"word":"Burticică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burticică"}},{"word":"burticică","pos":"noun","definitions":["diminutive of burtă; small belly"],"forms":{"plural":"burticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burticică","accusative-definite-nominative-singular":"burticica","accusative-indefinite-nominative-plural":"burticice","accusative-definite-nominative-plural":"burticicele","dative-genitive-indefinite-singular":"burticice","dative-definite-genitive-singular":"burticicei","dative-genitive-indefinite-plural":"burticice","dative-definite-genitive-plural":"burticicelor","singular-vocative":"burticică","plural-vocative":"burticicelor"}},{"word":"burticos","pos":"adj","definitions":["potbellied"],"forms":{"feminine-singular":"burticoasă","masculine-plural":"burticoși","feminine-neuter-plural":"burticoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burticos","error-unrecognized-form-feminine-indefinite-singular":"burticoasă","error-unrecognized-form-indefinite-masculine-plural":"burticoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burticoase","definite-error-unrecognized-form-masculine-neuter-singular":"burticosul","definite-error-unrecognized-form-feminine-singular":"burticoasa","definite-error-unrecognized-form-masculine-plural":"burticoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burticoasele"}},{"word":"burtieră","pos":"noun","definitions":["girdle","news ticker"],"forms":{"plural":"burtiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burtieră","accusative-definite-nominative-singular":"burtiera","accusative-indefinite-nominative-plural":"burtiere","accusative-definite-nominative-plural":"burtierele","dative-genitive-indefinite-singular":"burtiere","dative-definite-genitive-singular":"burtierei","dative-genitive-indefinite-plural":"burtiere","dative-definite-genitive-plural":"burtierelor","singular-vocative":"burtieră","plural-vocative":"burtierelor"}},{"word":"Burțilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burțilă"}},{"word":"Burtoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Burtoi"}},{"word":"burtos","pos":"adj","definitions":["having a big belly"],"pronunciation":"/burˈtos/","forms":{"feminine-singular":"burtoasă","masculine-plural":"burtoși","feminine-neuter-plural":"burtoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burtos","error-unrecognized-form-feminine-indefinite-singular":"burtoasă","error-unrecognized-form-indefinite-masculine-plural":"burtoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burtoase","definite-error-unrecognized-form-masculine-neuter-singular":"burtosul","definite-error-unrecognized-form-feminine-singular":"burtoasa","definite-error-unrecognized-form-masculine-plural":"burtoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burtoasele"}},{"word":"burtucă","pos":"noun","definitions":["hole in the ice (for winter fishing)"],"forms":{"plural":"burtuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"burtucă","accusative-definite-nominative-singular":"burtuca","accusative-indefinite-nominative-plural":"burtuci","accusative-definite-nominative-plural":"burtucile","dative-genitive-indefinite-singular":"burtuci","dative-definite-genitive-singular":"burtucii","dative-genitive-indefinite-plural":"burtuci","dative-definite-genitive-plural":"burtucilor","singular-vocative":"burtucă","plural-vocative":"burtucilor"}},{"word":"burtucănos","pos":"adj","definitions":["pot-bellied"],"forms":{"feminine-singular":"burtucănoasă","masculine-plural":"burtucănoși","feminine-neuter-plural":"burtucănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burtucănos","error-unrecognized-form-feminine-indefinite-singular":"burtucănoasă","error-unrecognized-form-indefinite-masculine-plural":"burtucănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"burtucănoase","definite-error-unrecognized-form-masculine-neuter-singular":"burtucănosul","definite-error-unrecognized-form-feminine-singular":"burtucănoasa","definite-error-unrecognized-form-masculine-plural":"burtucănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"burtucănoasele"}},{"word":"burugă","pos":"noun","definitions":["waterfall"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"burugă","accusative-definite-nominative":"buruga","dative-genitive-indefinite":"buruge","dative-definite-genitive":"burugei","vocative":"burugă"}},{"word":"buruian","pos":"noun","definitions":["alternative form of buruiană"],"forms":{"plural":"buruieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buruian","accusative-definite-nominative-singular":"buruianul","accusative-indefinite-nominative-plural":"buruieni","accusative-definite-nominative-plural":"buruienile","dative-genitive-indefinite-singular":"buruian","dative-definite-genitive-singular":"buruianului","dative-genitive-indefinite-plural":"buruieni","dative-definite-genitive-plural":"buruienilor","singular-vocative":"buruianule","plural-vocative":"buruienilor"}},{"word":"buruiana","pos":"noun","definitions":["definite nominative/accusative singular of buruiană"]},{"word":"Buruiană","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buruiană"}},{"word":"buruiană","pos":"noun","definitions":["weed"],"pronunciation":"/bu.ruˈja.nə/","forms":{"plural":"buruieni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"buruiană","accusative-definite-nominative-singular":"buruiana","accusative-indefinite-nominative-plural":"buruieni","accusative-definite-nominative-plural":"buruienile","dative-genitive-indefinite-singular":"buruieni","dative-definite-genitive-singular":"buruienii","dative-genitive-indefinite-plural":"buruieni","dative-definite-genitive-plural":"buruienilor","singular-vocative":"buruiană","plural-vocative":"buruienilor"}},{"word":"Buruienești","pos":"name","definitions":["a village in Bivolari, Iași County, Romania","a village in Doljești, Neamț County, Romania"],"gender":"m"},{"word":"Buruieniș","pos":"name","definitions":["a village in Brusturoasa, Bacău County, Romania"],"gender":"m"},{"word":"buruieniș","pos":"noun","definitions":["a place with many weeds"],"forms":{"plural":"buruienișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"buruieniș","accusative-definite-nominative-singular":"buruienișul","accusative-indefinite-nominative-plural":"buruienișuri","accusative-definite-nominative-plural":"buruienișurile","dative-genitive-indefinite-singular":"buruieniș","dative-definite-genitive-singular":"buruienișului","dative-genitive-indefinite-plural":"buruienișuri","dative-definite-genitive-plural":"buruienișurilor","singular-vocative":"buruienișule","plural-vocative":"buruienișurilor"}},{"word":"Buruienișu de Sus","pos":"name","definitions":["a village in Brusturoasa, Bacău County, Romania"],"gender":"m"},{"word":"buruieniță","pos":"noun","definitions":["diminutive of buruiană; small weed"],"forms":{"plural":"buruienițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buruieniță","accusative-definite-nominative-singular":"buruienița","accusative-indefinite-nominative-plural":"buruienițe","accusative-definite-nominative-plural":"buruienițele","dative-genitive-indefinite-singular":"buruienițe","dative-definite-genitive-singular":"buruieniței","dative-genitive-indefinite-plural":"buruienițe","dative-definite-genitive-plural":"buruienițelor","singular-vocative":"buruieniță","plural-vocative":"buruienițelor"}},{"word":"buruienos","pos":"adj","definitions":["weedy"],"forms":{"feminine-singular":"buruienoasă","masculine-plural":"buruienoși","feminine-neuter-plural":"buruienoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buruienos","error-unrecognized-form-feminine-indefinite-singular":"buruienoasă","error-unrecognized-form-indefinite-masculine-plural":"buruienoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buruienoase","definite-error-unrecognized-form-masculine-neuter-singular":"buruienosul","definite-error-unrecognized-form-feminine-singular":"buruienoasa","definite-error-unrecognized-form-masculine-plural":"buruienoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buruienoasele"}},{"word":"buruienuță","pos":"noun","definitions":["diminutive of buruiană; small weed"],"forms":{"plural":"buruienuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buruienuță","accusative-definite-nominative-singular":"buruienuța","accusative-indefinite-nominative-plural":"buruienuțe","accusative-definite-nominative-plural":"buruienuțele","dative-genitive-indefinite-singular":"buruienuțe","dative-definite-genitive-singular":"buruienuței","dative-genitive-indefinite-plural":"buruienuțe","dative-definite-genitive-plural":"buruienuțelor","singular-vocative":"buruienuță","plural-vocative":"buruienuțelor"}},{"word":"burundez","pos":"adj","definitions":["Burundian"],"forms":{"feminine-singular":"burundeză","masculine-plural":"burundezi","feminine-neuter-plural":"burundeze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burundez","error-unrecognized-form-feminine-indefinite-singular":"burundeză","error-unrecognized-form-indefinite-masculine-plural":"burundezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"burundeze","definite-error-unrecognized-form-masculine-neuter-singular":"burundezul","definite-error-unrecognized-form-feminine-singular":"burundeza","definite-error-unrecognized-form-masculine-plural":"burundezii","definite-error-unrecognized-form-feminine-neuter-plural":"burundezele"}},{"word":"burundez","pos":"noun","definitions":["Burundian"],"forms":{"plural":"burundezi","feminine":"equivalent burundeză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"burundez","accusative-definite-nominative-singular":"burundezul","accusative-indefinite-nominative-plural":"burundezi","accusative-definite-nominative-plural":"burundezii","dative-genitive-indefinite-singular":"burundez","dative-definite-genitive-singular":"burundezului","dative-genitive-indefinite-plural":"burundezi","dative-definite-genitive-plural":"burundezilor","singular-vocative":"burundezule","plural-vocative":"burundezilor"}},{"word":"burundeză","pos":"noun","definitions":["female equivalent of burundez"],"forms":{"plural":"burundeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"burundeză","accusative-definite-nominative-singular":"burundeza","accusative-indefinite-nominative-plural":"burundeze","accusative-definite-nominative-plural":"burundezele","dative-genitive-indefinite-singular":"burundeze","dative-definite-genitive-singular":"burundezei","dative-genitive-indefinite-plural":"burundeze","dative-definite-genitive-plural":"burundezelor","singular-vocative":"burundeză","plural-vocative":"burundezelor"}},{"word":"Burundi","pos":"name","definitions":["Burundi (a country in East Africa)"]},{"word":"burungiuc","pos":"noun","definitions":["obsolete form of borangic"],"forms":{"plural":"burungiucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"burungiuc","accusative-definite-nominative-singular":"burungiucul","accusative-indefinite-nominative-plural":"burungiucuri","accusative-definite-nominative-plural":"burungiucurile","dative-genitive-indefinite-singular":"burungiuc","dative-definite-genitive-singular":"burungiucului","dative-genitive-indefinite-plural":"burungiucuri","dative-definite-genitive-plural":"burungiucurilor","singular-vocative":"burungiucule","plural-vocative":"burungiucurilor"}},{"word":"Burzești","pos":"name","definitions":["a village in Vadu Moților, Alba County, Romania"],"gender":"m"},{"word":"burziluitor","pos":"adj","definitions":["irritating"],"forms":{"feminine-singular":"burziluitoare","masculine-plural":"burziluitori","feminine-neuter-plural":"burziluitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burziluitor","error-unrecognized-form-feminine-indefinite-singular":"burziluitoare","error-unrecognized-form-indefinite-masculine-plural":"burziluitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"burziluitoare","definite-error-unrecognized-form-masculine-neuter-singular":"burziluitorul","definite-error-unrecognized-form-feminine-singular":"burziluitoarea","definite-error-unrecognized-form-masculine-plural":"burziluitorii","definite-error-unrecognized-form-feminine-neuter-plural":"burziluitoarele"}},{"word":"burzului","pos":"verb","definitions":["to get angry (with someone)"],"forms":{"canonical":"a burzului 4th conjugation","present-singular-third-person":"burzuluiește","participle-past":"burzuluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a burzului","gerund":"burzuluind","first-person-indicative-present-singular":"burzuluiesc","indicative-present-second-person-singular":"burzuluiești","indicative-present-singular-third-person":"burzuluiește","first-person-indicative-plural-present":"burzuluim","indicative-plural-present-second-person":"burzuluiți","indicative-plural-present-third-person":"burzuluiesc","first-person-imperfect-indicative-singular":"burzuluiam","imperfect-indicative-second-person-singular":"burzuluiai","imperfect-indicative-singular-third-person":"burzuluia","first-person-imperfect-indicative-plural":"burzuluiam","imperfect-indicative-plural-second-person":"burzuluiați","imperfect-indicative-plural-third-person":"burzuluiau","first-person-indicative-perfect-singular":"burzuluii","indicative-perfect-second-person-singular":"burzuluiși","indicative-perfect-singular-third-person":"burzului","first-person-indicative-perfect-plural":"burzuluirăm","indicative-perfect-plural-second-person":"burzuluirăți","indicative-perfect-plural-third-person":"burzuluiră","first-person-indicative-pluperfect-singular":"burzuluisem","indicative-pluperfect-second-person-singular":"burzuluiseși","indicative-pluperfect-singular-third-person":"burzuluise","first-person-indicative-pluperfect-plural":"burzuluiserăm","indicative-pluperfect-plural-second-person":"burzuluiserăți","indicative-pluperfect-plural-third-person":"burzuluiseră","first-person-present-singular-subjunctive":"să burzuluiesc","present-second-person-singular-subjunctive":"să burzuluiești","present-singular-subjunctive-third-person":"să burzuluiască","first-person-plural-present-subjunctive":"să burzuluim","plural-present-second-person-subjunctive":"să burzuluiți","plural-present-subjunctive-third-person":"să burzuluiască","imperative-second-person-singular":"burzuluiește","imperative-plural-second-person":"burzuluiți","imperative-negative-second-person-singular":"nu burzului","imperative-negative-plural-second-person":"nu burzuluiți"}},{"word":"burzuluială","pos":"noun","definitions":["anger"],"forms":{"plural":"burzuluieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"burzuluială","accusative-definite-nominative-singular":"burzuluiala","accusative-indefinite-nominative-plural":"burzuluieli","accusative-definite-nominative-plural":"burzuluielile","dative-genitive-indefinite-singular":"burzuluieli","dative-definite-genitive-singular":"burzuluielii","dative-genitive-indefinite-plural":"burzuluieli","dative-definite-genitive-plural":"burzuluielilor","singular-vocative":"burzuluială","plural-vocative":"burzuluielilor"}},{"word":"burzuluire","pos":"noun","definitions":["irritation"],"forms":{"plural":"burzuluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"burzuluire","accusative-definite-nominative-singular":"burzuluirea","accusative-indefinite-nominative-plural":"burzuluiri","accusative-definite-nominative-plural":"burzuluirile","dative-genitive-indefinite-singular":"burzuluiri","dative-definite-genitive-singular":"burzuluirii","dative-genitive-indefinite-plural":"burzuluiri","dative-definite-genitive-plural":"burzuluirilor","singular-vocative":"burzuluire","plural-vocative":"burzuluirilor"}},{"word":"burzuluit","pos":"adj","definitions":["annoyed, angry","disheveled"],"forms":{"feminine-singular":"burzuluită","masculine-plural":"burzuluiți","feminine-neuter-plural":"burzuluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"burzuluit","error-unrecognized-form-feminine-indefinite-singular":"burzuluită","error-unrecognized-form-indefinite-masculine-plural":"burzuluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"burzuluite","definite-error-unrecognized-form-masculine-neuter-singular":"burzuluitul","definite-error-unrecognized-form-feminine-singular":"burzuluita","definite-error-unrecognized-form-masculine-plural":"burzuluiții","definite-error-unrecognized-form-feminine-neuter-plural":"burzuluitele"}},{"word":"burzuluit","pos":"verb","definitions":["past participle of burzului"],"forms":{"participle-past":"of burzului"}},{"word":"bușcă","pos":"noun","definitions":["a kind of flatcake"],"forms":{"plural":"buște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bușcă","accusative-definite-nominative-singular":"bușca","accusative-indefinite-nominative-plural":"buște","accusative-definite-nominative-plural":"buștele","dative-genitive-indefinite-singular":"buște","dative-definite-genitive-singular":"buștei","dative-genitive-indefinite-plural":"buște","dative-definite-genitive-plural":"buștelor","singular-vocative":"bușcă","plural-vocative":"buștelor"}},{"word":"buscula","pos":"verb","definitions":["to shove, to bump into, to jostle"],"forms":{"canonical":"a buscula 1st conjugation","present-singular-third-person":"busculează","participle-past":"busculat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a buscula","gerund":"busculând","first-person-indicative-present-singular":"busculez","indicative-present-second-person-singular":"busculezi","indicative-present-singular-third-person":"busculează","first-person-indicative-plural-present":"busculăm","indicative-plural-present-second-person":"busculați","indicative-plural-present-third-person":"busculează","first-person-imperfect-indicative-singular":"busculam","imperfect-indicative-second-person-singular":"busculai","imperfect-indicative-singular-third-person":"buscula","first-person-imperfect-indicative-plural":"busculam","imperfect-indicative-plural-second-person":"busculați","imperfect-indicative-plural-third-person":"busculau","first-person-indicative-perfect-singular":"busculai","indicative-perfect-second-person-singular":"busculași","indicative-perfect-singular-third-person":"busculă","first-person-indicative-perfect-plural":"buscularăm","indicative-perfect-plural-second-person":"buscularăți","indicative-perfect-plural-third-person":"busculară","first-person-indicative-pluperfect-singular":"busculasem","indicative-pluperfect-second-person-singular":"busculaseși","indicative-pluperfect-singular-third-person":"busculase","first-person-indicative-pluperfect-plural":"busculaserăm","indicative-pluperfect-plural-second-person":"busculaserăți","indicative-pluperfect-plural-third-person":"busculaseră","first-person-present-singular-subjunctive":"să busculez","present-second-person-singular-subjunctive":"să busculezi","present-singular-subjunctive-third-person":"să busculeze","first-person-plural-present-subjunctive":"să busculăm","plural-present-second-person-subjunctive":"să busculați","plural-present-subjunctive-third-person":"să busculeze","imperative-second-person-singular":"busculează","imperative-plural-second-person":"busculați","imperative-negative-second-person-singular":"nu buscula","imperative-negative-plural-second-person":"nu busculați"}},{"word":"busculadă","pos":"noun","definitions":["melee","stampede"],"forms":{"plural":"busculade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"busculadă","accusative-definite-nominative-singular":"busculada","accusative-indefinite-nominative-plural":"busculade","accusative-definite-nominative-plural":"busculadele","dative-genitive-indefinite-singular":"busculade","dative-definite-genitive-singular":"busculadei","dative-genitive-indefinite-plural":"busculade","dative-definite-genitive-plural":"busculadelor","singular-vocative":"busculadă","plural-vocative":"busculadelor"}},{"word":"bușeală","pos":"noun","definitions":["thumping"],"forms":{"plural":"bușeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"bușeală","accusative-definite-nominative-singular":"bușeala","accusative-indefinite-nominative-plural":"bușele","accusative-definite-nominative-plural":"bușelele","dative-genitive-indefinite-singular":"bușele","dative-definite-genitive-singular":"bușelei","dative-genitive-indefinite-plural":"bușele","dative-definite-genitive-plural":"bușelelor","singular-vocative":"bușeală","plural-vocative":"bușelelor"}},{"word":"bușel","pos":"noun","definitions":["bushel"],"forms":{"plural":"bușei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bușel","accusative-definite-nominative-singular":"bușelul","accusative-indefinite-nominative-plural":"bușei","accusative-definite-nominative-plural":"bușeii","dative-genitive-indefinite-singular":"bușel","dative-definite-genitive-singular":"bușelului","dative-genitive-indefinite-plural":"bușei","dative-definite-genitive-plural":"bușeilor","singular-vocative":"bușelule","plural-vocative":"bușeilor"}},{"word":"Busești","pos":"name","definitions":["a village in Isverna, Mehedinți County, Romania"],"gender":"m"},{"word":"bușeu","pos":"noun","definitions":["bouchée"],"forms":{"plural":"bușeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bușeu","accusative-definite-nominative-singular":"bușeuul","accusative-indefinite-nominative-plural":"bușeuri","accusative-definite-nominative-plural":"bușeurile","dative-genitive-indefinite-singular":"bușeu","dative-definite-genitive-singular":"bușeuului","dative-genitive-indefinite-plural":"bușeuri","dative-definite-genitive-plural":"bușeurilor","singular-vocative":"bușeuule","plural-vocative":"bușeurilor"}},{"word":"bushel","pos":"noun","definitions":["bushel"],"forms":{"plural":"busheli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bushel","accusative-definite-nominative-singular":"bushelul","accusative-indefinite-nominative-plural":"busheli","accusative-definite-nominative-plural":"bushelii","dative-genitive-indefinite-singular":"bushel","dative-definite-genitive-singular":"bushelului","dative-genitive-indefinite-plural":"busheli","dative-definite-genitive-plural":"bushelilor","singular-vocative":"bushelule","plural-vocative":"bushelilor"}},{"word":"buși","pos":"verb","definitions":["to thump, to slam, to strike","to crash (a car)"],"forms":{"canonical":"a buși 4th conjugation","present-singular-third-person":"bușește","participle-past":"bușit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buși","gerund":"bușind","first-person-indicative-present-singular":"bușesc","indicative-present-second-person-singular":"bușești","indicative-present-singular-third-person":"bușește","first-person-indicative-plural-present":"bușim","indicative-plural-present-second-person":"bușiți","indicative-plural-present-third-person":"bușesc","first-person-imperfect-indicative-singular":"bușeam","imperfect-indicative-second-person-singular":"bușeai","imperfect-indicative-singular-third-person":"bușea","first-person-imperfect-indicative-plural":"bușeam","imperfect-indicative-plural-second-person":"bușeați","imperfect-indicative-plural-third-person":"bușeau","first-person-indicative-perfect-singular":"bușii","indicative-perfect-second-person-singular":"bușiși","indicative-perfect-singular-third-person":"buși","first-person-indicative-perfect-plural":"bușirăm","indicative-perfect-plural-second-person":"bușirăți","indicative-perfect-plural-third-person":"bușiră","first-person-indicative-pluperfect-singular":"bușisem","indicative-pluperfect-second-person-singular":"bușiseși","indicative-pluperfect-singular-third-person":"bușise","first-person-indicative-pluperfect-plural":"bușiserăm","indicative-pluperfect-plural-second-person":"bușiserăți","indicative-pluperfect-plural-third-person":"bușiseră","first-person-present-singular-subjunctive":"să bușesc","present-second-person-singular-subjunctive":"să bușești","present-singular-subjunctive-third-person":"să bușească","first-person-plural-present-subjunctive":"să bușim","plural-present-second-person-subjunctive":"să bușiți","plural-present-subjunctive-third-person":"să bușească","imperative-second-person-singular":"bușește","imperative-plural-second-person":"bușiți","imperative-negative-second-person-singular":"nu buși","imperative-negative-plural-second-person":"nu bușiți"}},{"word":"bușie","pos":"noun","definitions":["weed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"bușie","accusative-definite-nominative":"bușia","dative-genitive-indefinite":"bușii","dative-definite-genitive":"bușiei","vocative":"bușie"}},{"word":"Bușila","pos":"name","definitions":["a village in Bușila, Ungheni Raion, Moldova","a commune of Ungheni Raion, Moldova"],"gender":"f"},{"word":"Bușilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bușilă"}},{"word":"business","pos":"noun","definitions":["business"],"forms":{"plural":"businessuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"business","accusative-definite-nominative-singular":"businessul","accusative-indefinite-nominative-plural":"businessuri","accusative-definite-nominative-plural":"businessurile","dative-genitive-indefinite-singular":"business","dative-definite-genitive-singular":"businessului","dative-genitive-indefinite-plural":"businessuri","dative-definite-genitive-plural":"businessurilor","singular-vocative":"businessule","plural-vocative":"businessurilor"}},{"word":"businessman","pos":"noun","definitions":["businessman"],"forms":{"plural":"businessmeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"businessman","accusative-definite-nominative-singular":"businessmanul","accusative-indefinite-nominative-plural":"businessmeni","accusative-definite-nominative-plural":"businessmenii","dative-genitive-indefinite-singular":"businessman","dative-definite-genitive-singular":"businessmanului","dative-genitive-indefinite-plural":"businessmeni","dative-definite-genitive-plural":"businessmenilor","singular-vocative":"businessmanule","plural-vocative":"businessmenilor"}},{"word":"bușitură","pos":"noun","definitions":["blow, hit"],"forms":{"plural":"bușituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"bușitură","accusative-definite-nominative-singular":"bușitura","accusative-indefinite-nominative-plural":"bușituri","accusative-definite-nominative-plural":"bușiturile","dative-genitive-indefinite-singular":"bușituri","dative-definite-genitive-singular":"bușiturii","dative-genitive-indefinite-plural":"bușituri","dative-definite-genitive-plural":"bușiturilor","singular-vocative":"bușitură","plural-vocative":"bușiturilor"}},{"word":"bușmachiu","pos":"noun","definitions":["houseshoe"],"forms":{"plural":"bușmachii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bușmachiu","accusative-definite-nominative-singular":"bușmachiul","accusative-indefinite-nominative-plural":"bușmachii","accusative-definite-nominative-plural":"bușmachiii","dative-genitive-indefinite-singular":"bușmachiu","dative-definite-genitive-singular":"bușmachiului","dative-genitive-indefinite-plural":"bușmachii","dative-definite-genitive-plural":"bușmachiilor","singular-vocative":"bușmachiule","plural-vocative":"bușmachiilor"}},{"word":"busola","pos":"noun","definitions":["definite nominative/accusative singular of busolă"],"pronunciation":"[buˈsola]","gender":"f"},{"word":"busolă","pos":"noun","definitions":["compass (navigational tool)"],"pronunciation":"[buˈso.lə]","forms":{"plural":"busole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"busolă","accusative-definite-nominative-singular":"busola","accusative-indefinite-nominative-plural":"busole","accusative-definite-nominative-plural":"busolele","dative-genitive-indefinite-singular":"busole","dative-definite-genitive-singular":"busolei","dative-genitive-indefinite-plural":"busole","dative-definite-genitive-plural":"busolelor","singular-vocative":"busolă","plural-vocative":"busolelor"}},{"word":"busolă magnetică","pos":"noun","definitions":["magnetic compass"],"forms":{"plural":"busole magnetice"}},{"word":"busolo","pos":"noun","definitions":["vocative singular of busolă"],"pronunciation":"[buˈsolo]","gender":"f"},{"word":"bușon","pos":"noun","definitions":["plug"],"forms":{"plural":"bușoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"bușon","accusative-definite-nominative-singular":"bușonul","accusative-indefinite-nominative-plural":"bușoane","accusative-definite-nominative-plural":"bușoanele","dative-genitive-indefinite-singular":"bușon","dative-definite-genitive-singular":"bușonului","dative-genitive-indefinite-plural":"bușoane","dative-definite-genitive-plural":"bușoanelor","singular-vocative":"bușonule","plural-vocative":"bușoanelor"}},{"word":"bust","pos":"noun","definitions":["bust (sculpture)"],"forms":{"plural":"busturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bust","accusative-definite-nominative-singular":"bustul","accusative-indefinite-nominative-plural":"busturi","accusative-definite-nominative-plural":"busturile","dative-genitive-indefinite-singular":"bust","dative-definite-genitive-singular":"bustului","dative-genitive-indefinite-plural":"busturi","dative-definite-genitive-plural":"busturilor","singular-vocative":"bustule","plural-vocative":"busturilor"}},{"word":"busta","pos":"adv","definitions":["alternative form of buzna"]},{"word":"Buștea","pos":"name","definitions":["a village in Mânzălești, Buzău County, Romania"],"gender":"f"},{"word":"Buștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buștean"}},{"word":"buștean","pos":"noun","definitions":["log (trunk of a tree cleared of branches)","stock (tree)","stump","burnt wood"],"forms":{"plural":"bușteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buștean","accusative-definite-nominative-singular":"bușteanul","accusative-indefinite-nominative-plural":"bușteni","accusative-definite-nominative-plural":"buștenii","dative-genitive-indefinite-singular":"buștean","dative-definite-genitive-singular":"bușteanului","dative-genitive-indefinite-plural":"bușteni","dative-definite-genitive-plural":"buștenilor","singular-vocative":"bușteanule","plural-vocative":"buștenilor","alternative":"buștihan"}},{"word":"Bușteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Bușteanu"}},{"word":"Buștenari","pos":"name","definitions":["a village in Telega, Prahova County, Romania"],"gender":"m"},{"word":"Bușteni","pos":"name","definitions":["a village in Murgași, Dolj County, Romania","a city in Prahova County, Romania"],"gender":"m"},{"word":"bușteni","pos":"noun","definitions":["plural of buștean"]},{"word":"buștenit","pos":"adj","definitions":["stiffened"],"forms":{"feminine-singular":"buștenită","masculine-plural":"bușteniți","feminine-neuter-plural":"buștenite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buștenit","error-unrecognized-form-feminine-indefinite-singular":"buștenită","error-unrecognized-form-indefinite-masculine-plural":"bușteniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"buștenite","definite-error-unrecognized-form-masculine-neuter-singular":"buștenitul","definite-error-unrecognized-form-feminine-singular":"buștenita","definite-error-unrecognized-form-masculine-plural":"bușteniții","definite-error-unrecognized-form-feminine-neuter-plural":"buștenitele"}},{"word":"bustier","pos":"noun","definitions":["bustier"],"forms":{"plural":"bustieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"bustier","accusative-definite-nominative-singular":"bustierul","accusative-indefinite-nominative-plural":"bustieri","accusative-definite-nominative-plural":"bustierii","dative-genitive-indefinite-singular":"bustier","dative-definite-genitive-singular":"bustierului","dative-genitive-indefinite-plural":"bustieri","dative-definite-genitive-plural":"bustierilor","singular-vocative":"bustierule","plural-vocative":"bustierilor"}},{"word":"bustieri","pos":"noun","definitions":["plural of bustier"]},{"word":"buștihan","pos":"noun","definitions":["log"],"forms":{"plural":"buștihani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buștihan","accusative-definite-nominative-singular":"buștihanul","accusative-indefinite-nominative-plural":"buștihani","accusative-definite-nominative-plural":"buștihanii","dative-genitive-indefinite-singular":"buștihan","dative-definite-genitive-singular":"buștihanului","dative-genitive-indefinite-plural":"buștihani","dative-definite-genitive-plural":"buștihanilor","singular-vocative":"buștihanule","plural-vocative":"buștihanilor"}},{"word":"buștină","pos":"noun","definitions":["fog"],"forms":{"plural":"buștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buștină","accusative-definite-nominative-singular":"buștina","accusative-indefinite-nominative-plural":"buștine","accusative-definite-nominative-plural":"buștinele","dative-genitive-indefinite-singular":"buștine","dative-definite-genitive-singular":"buștinei","dative-genitive-indefinite-plural":"buștine","dative-definite-genitive-plural":"buștinelor","singular-vocative":"buștină","plural-vocative":"buștinelor"}},{"word":"bustrofedon","pos":"noun","definitions":["boustrophedon (text written such that its direction alternates on each line, resulting in a continuous stream of characters spanning multiple lines; frequently also involving the corresponding alternation of letter directionality using mirrored letters, indicating the direction of the text at any given point)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bustrofedon","accusative-definite-nominative":"bustrofedonul","dative-genitive-indefinite":"bustrofedon","dative-definite-genitive":"bustrofedonului","vocative":"bustrofedonule"}},{"word":"busturi","pos":"noun","definitions":["plural of bust"]},{"word":"bustușag","pos":"noun","definitions":["desolation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"bustușag","accusative-definite-nominative":"bustușagul","dative-genitive-indefinite":"bustușag","dative-definite-genitive":"bustușagului","vocative":"bustușagule"}},{"word":"Bușui","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Bușui"}},{"word":"busuioacă","pos":"noun","definitions":["grape variety"],"forms":{"plural":"busuioace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"busuioacă","accusative-definite-nominative-singular":"busuioaca","accusative-indefinite-nominative-plural":"busuioace","accusative-definite-nominative-plural":"busuioacele","dative-genitive-indefinite-singular":"busuioace","dative-definite-genitive-singular":"busuioacei","dative-genitive-indefinite-plural":"busuioace","dative-definite-genitive-plural":"busuioacelor","singular-vocative":"busuioacă","plural-vocative":"busuioacelor"}},{"word":"Busuioc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Busuioc"}},{"word":"busuioc","pos":"noun","definitions":["basil (plant)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"busuioc","accusative-definite-nominative":"busuiocul","dative-genitive-indefinite":"busuioc","dative-definite-genitive":"busuiocului","vocative":"busuiocule"}},{"word":"busuioc-de-câmp","pos":"noun","definitions":["selfheal (Prunella vulgaris)"]},{"word":"Busuioceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Busuioceanu"}},{"word":"busuiocesc","pos":"adj","definitions":["basil-like"],"forms":{"feminine-singular":"busuiocească","plural":"busuiocești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"busuiocesc","error-unrecognized-form-feminine-indefinite-singular":"busuiocească","error-unrecognized-form-indefinite-masculine-plural":"busuiocești","error-unrecognized-form-feminine-indefinite-neuter-plural":"busuiocești","definite-error-unrecognized-form-masculine-neuter-singular":"busuiocescul","definite-error-unrecognized-form-feminine-singular":"busuioceasca","definite-error-unrecognized-form-masculine-plural":"busuioceștii","definite-error-unrecognized-form-feminine-neuter-plural":"busuioceștile"}},{"word":"Busuiocescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Busuiocescu"}},{"word":"Busuioci","pos":"name","definitions":["a village in Hurezani, Gorj County, Romania"],"gender":"m"},{"word":"busuiocul cerbilor","pos":"noun","definitions":["pennyroyal (Mentha pulegium)"]},{"word":"busuiocul dracului","pos":"noun","definitions":["Galinsoga parviflora"]},{"word":"Bușulete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Bușulete"}},{"word":"Busulețu","pos":"name","definitions":["a village in Grecești, Dolj County, Romania"],"gender":"m"},{"word":"busumfla","pos":"verb","definitions":["obsolete form of bosumfla"],"forms":{"canonical":"a busumfla 1st conjugation","present-singular-third-person":"busumflă","participle-past":"busumflat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a busumfla","gerund":"busumflând","first-person-indicative-present-singular":"busumflu","indicative-present-second-person-singular":"busumfli","indicative-present-singular-third-person":"busumflă","first-person-indicative-plural-present":"busumflăm","indicative-plural-present-second-person":"busumflați","indicative-plural-present-third-person":"busumflă","first-person-imperfect-indicative-singular":"busumflam","imperfect-indicative-second-person-singular":"busumflai","imperfect-indicative-singular-third-person":"busumfla","first-person-imperfect-indicative-plural":"busumflam","imperfect-indicative-plural-second-person":"busumflați","imperfect-indicative-plural-third-person":"busumflau","first-person-indicative-perfect-singular":"busumflai","indicative-perfect-second-person-singular":"busumflași","indicative-perfect-singular-third-person":"busumflă","first-person-indicative-perfect-plural":"busumflarăm","indicative-perfect-plural-second-person":"busumflarăți","indicative-perfect-plural-third-person":"busumflară","first-person-indicative-pluperfect-singular":"busumflasem","indicative-pluperfect-second-person-singular":"busumflaseși","indicative-pluperfect-singular-third-person":"busumflase","first-person-indicative-pluperfect-plural":"busumflaserăm","indicative-pluperfect-plural-second-person":"busumflaserăți","indicative-pluperfect-plural-third-person":"busumflaseră","first-person-present-singular-subjunctive":"să busumflu","present-second-person-singular-subjunctive":"să busumfli","present-singular-subjunctive-third-person":"să busumfle","first-person-plural-present-subjunctive":"să busumflăm","plural-present-second-person-subjunctive":"să busumflați","plural-present-subjunctive-third-person":"să busumfle","imperative-second-person-singular":"busumflă","imperative-plural-second-person":"busumflați","imperative-negative-second-person-singular":"nu busumfla","imperative-negative-plural-second-person":"nu busumflați"}},{"word":"busurman","pos":"noun","definitions":["Muslim"],"forms":{"plural":"busurmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"busurman","accusative-definite-nominative-singular":"busurmanul","accusative-indefinite-nominative-plural":"busurmani","accusative-definite-nominative-plural":"busurmanii","dative-genitive-indefinite-singular":"busurman","dative-definite-genitive-singular":"busurmanului","dative-genitive-indefinite-plural":"busurmani","dative-definite-genitive-plural":"busurmanilor","singular-vocative":"busurmanule","plural-vocative":"busurmanilor"}},{"word":"but","pos":"noun","definitions":["thigh of an animal"],"forms":{"plural":"buturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"but","accusative-definite-nominative-singular":"butul","accusative-indefinite-nominative-plural":"buturi","accusative-definite-nominative-plural":"buturile","dative-genitive-indefinite-singular":"but","dative-definite-genitive-singular":"butului","dative-genitive-indefinite-plural":"buturi","dative-definite-genitive-plural":"buturilor","singular-vocative":"butule","plural-vocative":"buturilor"}},{"word":"butadă","pos":"noun","definitions":["witticism"],"forms":{"plural":"butade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butadă","accusative-definite-nominative-singular":"butada","accusative-indefinite-nominative-plural":"butade","accusative-definite-nominative-plural":"butadele","dative-genitive-indefinite-singular":"butade","dative-definite-genitive-singular":"butadei","dative-genitive-indefinite-plural":"butade","dative-definite-genitive-plural":"butadelor","singular-vocative":"butadă","plural-vocative":"butadelor"}},{"word":"butadienă","pos":"noun","definitions":["butadiene"],"forms":{"plural":"butadiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butadienă","accusative-definite-nominative-singular":"butadiena","accusative-indefinite-nominative-plural":"butadiene","accusative-definite-nominative-plural":"butadienele","dative-genitive-indefinite-singular":"butadiene","dative-definite-genitive-singular":"butadienei","dative-genitive-indefinite-plural":"butadiene","dative-definite-genitive-plural":"butadienelor","singular-vocative":"butadienă","plural-vocative":"butadienelor"}},{"word":"butaforic","pos":"adj","definitions":["mockup"],"forms":{"feminine-singular":"butaforică","masculine-plural":"butaforici","feminine-neuter-plural":"butaforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butaforic","error-unrecognized-form-feminine-indefinite-singular":"butaforică","error-unrecognized-form-indefinite-masculine-plural":"butaforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"butaforice","definite-error-unrecognized-form-masculine-neuter-singular":"butaforicul","definite-error-unrecognized-form-feminine-singular":"butaforica","definite-error-unrecognized-form-masculine-plural":"butaforicii","definite-error-unrecognized-form-feminine-neuter-plural":"butaforicele"}},{"word":"butaforie","pos":"noun","definitions":["mockup","window dressing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"butaforie","accusative-definite-nominative":"butaforia","dative-genitive-indefinite":"butaforii","dative-definite-genitive":"butaforiei","vocative":"butaforie"}},{"word":"butan","pos":"noun","definitions":["butane"],"forms":{"plural":"butani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butan","accusative-definite-nominative-singular":"butanul","accusative-indefinite-nominative-plural":"butani","accusative-definite-nominative-plural":"butanii","dative-genitive-indefinite-singular":"butan","dative-definite-genitive-singular":"butanului","dative-genitive-indefinite-plural":"butani","dative-definite-genitive-plural":"butanilor","singular-vocative":"butanule","plural-vocative":"butanilor"}},{"word":"Butănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butănescu"}},{"word":"butanol","pos":"noun","definitions":["butanol (any of four isomeric aliphatic alcohols, C₄H₉-OH)"],"forms":{"plural":"butanoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butanol","accusative-definite-nominative-singular":"butanolul","accusative-indefinite-nominative-plural":"butanoli","accusative-definite-nominative-plural":"butanolii","dative-genitive-indefinite-singular":"butanol","dative-definite-genitive-singular":"butanolului","dative-genitive-indefinite-plural":"butanoli","dative-definite-genitive-plural":"butanolilor","singular-vocative":"butanolule","plural-vocative":"butanolilor"}},{"word":"butanonă","pos":"noun","definitions":["butanone"],"forms":{"plural":"butanone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butanonă","accusative-definite-nominative-singular":"butanona","accusative-indefinite-nominative-plural":"butanone","accusative-definite-nominative-plural":"butanonele","dative-genitive-indefinite-singular":"butanone","dative-definite-genitive-singular":"butanonei","dative-genitive-indefinite-plural":"butanone","dative-definite-genitive-plural":"butanonelor","singular-vocative":"butanonă","plural-vocative":"butanonelor"}},{"word":"butar","pos":"noun","definitions":["barrelmaker, cooper"],"forms":{"plural":"butari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butar","accusative-definite-nominative-singular":"butarul","accusative-indefinite-nominative-plural":"butari","accusative-definite-nominative-plural":"butarii","dative-genitive-indefinite-singular":"butar","dative-definite-genitive-singular":"butarului","dative-genitive-indefinite-plural":"butari","dative-definite-genitive-plural":"butarilor","singular-vocative":"butarule","plural-vocative":"butarilor"}},{"word":"butargă","pos":"noun","definitions":["bottarga"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"butargă","accusative-definite-nominative":"butarga","dative-genitive-indefinite":"butarge","dative-definite-genitive":"butargei","vocative":"butargă"}},{"word":"Butaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Butaru"}},{"word":"butaș","pos":"noun","definitions":["cutting"],"forms":{"plural":"butași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butaș","accusative-definite-nominative-singular":"butașul","accusative-indefinite-nominative-plural":"butași","accusative-definite-nominative-plural":"butașii","dative-genitive-indefinite-singular":"butaș","dative-definite-genitive-singular":"butașului","dative-genitive-indefinite-plural":"butași","dative-definite-genitive-plural":"butașilor","singular-vocative":"butașule","plural-vocative":"butașilor"}},{"word":"butășeală","pos":"noun","definitions":["cutting (multiplying plants)"],"forms":{"plural":"butășeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butășeală","accusative-definite-nominative-singular":"butășeala","accusative-indefinite-nominative-plural":"butășele","accusative-definite-nominative-plural":"butășelele","dative-genitive-indefinite-singular":"butășele","dative-definite-genitive-singular":"butășelei","dative-genitive-indefinite-plural":"butășele","dative-definite-genitive-plural":"butășelelor","singular-vocative":"butășeală","plural-vocative":"butășelelor"}},{"word":"butășire","pos":"noun","definitions":["cutting (multiplying plants)"],"forms":{"plural":"butășiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"butășire","accusative-definite-nominative-singular":"butășirea","accusative-indefinite-nominative-plural":"butășiri","accusative-definite-nominative-plural":"butășirile","dative-genitive-indefinite-singular":"butășiri","dative-definite-genitive-singular":"butășirii","dative-genitive-indefinite-plural":"butășiri","dative-definite-genitive-plural":"butășirilor","singular-vocative":"butășire","plural-vocative":"butășirilor"}},{"word":"butășit","pos":"adj","definitions":["cut (multiplying plants)"],"forms":{"feminine-singular":"butășită","masculine-plural":"butășiți","feminine-neuter-plural":"butășite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butășit","error-unrecognized-form-feminine-indefinite-singular":"butășită","error-unrecognized-form-indefinite-masculine-plural":"butășiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"butășite","definite-error-unrecognized-form-masculine-neuter-singular":"butășitul","definite-error-unrecognized-form-feminine-singular":"butășita","definite-error-unrecognized-form-masculine-plural":"butășiții","definite-error-unrecognized-form-feminine-neuter-plural":"butășitele"}},{"word":"butășit","pos":"verb","definitions":["past participle of butăși"],"forms":{"participle-past":"of butăși"}},{"word":"Butca","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butca"}},{"word":"Butcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butcă"}},{"word":"butcă","pos":"noun","definitions":["carriage"],"forms":{"plural":"butci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"butcă","accusative-definite-nominative-singular":"butca","accusative-indefinite-nominative-plural":"butci","accusative-definite-nominative-plural":"butcile","dative-genitive-indefinite-singular":"butci","dative-definite-genitive-singular":"butcii","dative-genitive-indefinite-plural":"butci","dative-definite-genitive-plural":"butcilor","singular-vocative":"butcă","plural-vocative":"butcilor"}},{"word":"butcărie","pos":"noun","definitions":["carriage shed"],"forms":{"plural":"butcării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"butcărie","accusative-definite-nominative-singular":"butcăria","accusative-indefinite-nominative-plural":"butcării","accusative-definite-nominative-plural":"butcăriile","dative-genitive-indefinite-singular":"butcării","dative-definite-genitive-singular":"butcăriei","dative-genitive-indefinite-plural":"butcării","dative-definite-genitive-plural":"butcăriilor","singular-vocative":"butcărie","plural-vocative":"butcăriilor"}},{"word":"butcariță","pos":"noun","definitions":["bucket, pail"],"forms":{"plural":"butcarițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butcariță","accusative-definite-nominative-singular":"butcarița","accusative-indefinite-nominative-plural":"butcarițe","accusative-definite-nominative-plural":"butcarițele","dative-genitive-indefinite-singular":"butcarițe","dative-definite-genitive-singular":"butcariței","dative-genitive-indefinite-plural":"butcarițe","dative-definite-genitive-plural":"butcarițelor","singular-vocative":"butcariță","plural-vocative":"butcarițelor"}},{"word":"butcos","pos":"noun","definitions":["jug, pitcher"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"butcos","accusative-definite-nominative":"butcosul","dative-genitive-indefinite":"butcos","dative-definite-genitive":"butcosului","vocative":"butcosule"}},{"word":"Butculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butculescu"}},{"word":"Butculești","pos":"name","definitions":["a village in Săceni, Teleorman County, Romania"],"gender":"m"},{"word":"butculiță","pos":"noun","definitions":["sneezewort (Achillea ptarmica)"],"forms":{"plural":"butculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butculiță","accusative-definite-nominative-singular":"butculița","accusative-indefinite-nominative-plural":"butculițe","accusative-definite-nominative-plural":"butculițele","dative-genitive-indefinite-singular":"butculițe","dative-definite-genitive-singular":"butculiței","dative-genitive-indefinite-plural":"butculițe","dative-definite-genitive-plural":"butculițelor","singular-vocative":"butculiță","plural-vocative":"butculițelor"}},{"word":"bute","pos":"noun","definitions":["barrel, cask; contents of a barrel","pillar that supports the structure of a tunnel, such as in a mine"],"forms":{"plural":"buți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"bute","accusative-definite-nominative-singular":"butea","accusative-indefinite-nominative-plural":"buți","accusative-definite-nominative-plural":"buțile","dative-genitive-indefinite-singular":"buți","dative-definite-genitive-singular":"buții","dative-genitive-indefinite-plural":"buți","dative-definite-genitive-plural":"buților","singular-vocative":"bute","plural-vocative":"buților"}},{"word":"Buteasa","pos":"name","definitions":["a village in Șomcuta Mare, Maramureș County, Romania"],"gender":"f"},{"word":"Buteică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buteică"}},{"word":"Butelcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butelcă"}},{"word":"butelcă","pos":"noun","definitions":["demijohn","bottle"],"forms":{"plural":"butelci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"butelcă","accusative-definite-nominative-singular":"butelca","accusative-indefinite-nominative-plural":"butelci","accusative-definite-nominative-plural":"butelcile","dative-genitive-indefinite-singular":"butelci","dative-definite-genitive-singular":"butelcii","dative-genitive-indefinite-plural":"butelci","dative-definite-genitive-plural":"butelcilor","singular-vocative":"butelcă","plural-vocative":"butelcilor"}},{"word":"butelcuță","pos":"noun","definitions":["diminutive of butelcă; small bottle"],"forms":{"plural":"butelcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butelcuță","accusative-definite-nominative-singular":"butelcuța","accusative-indefinite-nominative-plural":"butelcuțe","accusative-definite-nominative-plural":"butelcuțele","dative-genitive-indefinite-singular":"butelcuțe","dative-definite-genitive-singular":"butelcuței","dative-genitive-indefinite-plural":"butelcuțe","dative-definite-genitive-plural":"butelcuțelor","singular-vocative":"butelcuță","plural-vocative":"butelcuțelor"}},{"word":"butelie","pos":"noun","definitions":["gas tank"],"forms":{"plural":"butelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"butelie","accusative-definite-nominative-singular":"butelia","accusative-indefinite-nominative-plural":"butelii","accusative-definite-nominative-plural":"buteliile","dative-genitive-indefinite-singular":"butelii","dative-definite-genitive-singular":"buteliei","dative-genitive-indefinite-plural":"butelii","dative-definite-genitive-plural":"buteliilor","singular-vocative":"butelie","plural-vocative":"buteliilor"}},{"word":"butelie de Leyda","pos":"noun","definitions":["Leyden jar"],"forms":{"plural":"butelii de Leyda"}},{"word":"butenă","pos":"noun","definitions":["butene"],"forms":{"plural":"butene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butenă","accusative-definite-nominative-singular":"butena","accusative-indefinite-nominative-plural":"butene","accusative-definite-nominative-plural":"butenele","dative-genitive-indefinite-singular":"butene","dative-definite-genitive-singular":"butenei","dative-genitive-indefinite-plural":"butene","dative-definite-genitive-plural":"butenelor","singular-vocative":"butenă","plural-vocative":"butenelor"}},{"word":"Buteni","pos":"name","definitions":["a commune of Arad County, Romania","a village in Buteni, Arad County, Romania","a village in Mărgău, Cluj County, Romania"],"gender":"m"},{"word":"Buțeni","pos":"name","definitions":["a village in Buțeni, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"m"},{"word":"Buteșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buteșteanu"}},{"word":"Butești","pos":"name","definitions":["a village in Horea, Alba County, Romania","a village in Mogoș, Alba County, Romania","a village in Siliștea, Teleorman County, Romania"],"gender":"m"},{"word":"butic","pos":"noun","definitions":["boutique"],"forms":{"plural":"buticuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"butic","accusative-definite-nominative-singular":"buticul","accusative-indefinite-nominative-plural":"buticuri","accusative-definite-nominative-plural":"buticurile","dative-genitive-indefinite-singular":"butic","dative-definite-genitive-singular":"buticului","dative-genitive-indefinite-plural":"buticuri","dative-definite-genitive-plural":"buticurilor","singular-vocative":"buticule","plural-vocative":"buticurilor"}},{"word":"butică","pos":"noun","definitions":["alternative form of butic"],"forms":{"plural":"butici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"butică","accusative-definite-nominative-singular":"butica","accusative-indefinite-nominative-plural":"butici","accusative-definite-nominative-plural":"buticile","dative-genitive-indefinite-singular":"butici","dative-definite-genitive-singular":"buticii","dative-genitive-indefinite-plural":"butici","dative-definite-genitive-plural":"buticilor","singular-vocative":"butică","plural-vocative":"buticilor"}},{"word":"buticică","pos":"noun","definitions":["diminutive of bute"],"forms":{"plural":"buticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buticică","accusative-definite-nominative-singular":"buticica","accusative-indefinite-nominative-plural":"buticele","accusative-definite-nominative-plural":"buticelele","dative-genitive-indefinite-singular":"buticele","dative-definite-genitive-singular":"buticelei","dative-genitive-indefinite-plural":"buticele","dative-definite-genitive-plural":"buticelelor","singular-vocative":"buticică","plural-vocative":"buticelelor"}},{"word":"butie","pos":"noun","definitions":["alternative form of bute"],"forms":{"plural":"butii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"butie","accusative-definite-nominative-singular":"butia","accusative-indefinite-nominative-plural":"butii","accusative-definite-nominative-plural":"butiile","dative-genitive-indefinite-singular":"butii","dative-definite-genitive-singular":"butiei","dative-genitive-indefinite-plural":"butii","dative-definite-genitive-plural":"butiilor","singular-vocative":"butie","plural-vocative":"butiilor"}},{"word":"buții","pos":"noun","definitions":["definite genitive/dative singular of bute"]},{"word":"butilenă","pos":"noun","definitions":["butylene"],"forms":{"plural":"butilene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butilenă","accusative-definite-nominative-singular":"butilena","accusative-indefinite-nominative-plural":"butilene","accusative-definite-nominative-plural":"butilenele","dative-genitive-indefinite-singular":"butilene","dative-definite-genitive-singular":"butilenei","dative-genitive-indefinite-plural":"butilene","dative-definite-genitive-plural":"butilenelor","singular-vocative":"butilenă","plural-vocative":"butilenelor"}},{"word":"butilic","pos":"adj","definitions":["butylic"],"forms":{"feminine-singular":"butilică","masculine-plural":"butilici","feminine-neuter-plural":"butilice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butilic","error-unrecognized-form-feminine-indefinite-singular":"butilică","error-unrecognized-form-indefinite-masculine-plural":"butilici","error-unrecognized-form-feminine-indefinite-neuter-plural":"butilice","definite-error-unrecognized-form-masculine-neuter-singular":"butilicul","definite-error-unrecognized-form-feminine-singular":"butilica","definite-error-unrecognized-form-masculine-plural":"butilicii","definite-error-unrecognized-form-feminine-neuter-plural":"butilicele"}},{"word":"Butin","pos":"name","definitions":["a village in Gătaia, Timiș County, Romania"],"gender":"m"},{"word":"butirat","pos":"noun","definitions":["butyrate"],"forms":{"plural":"butirați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butirat","accusative-definite-nominative-singular":"butiratul","accusative-indefinite-nominative-plural":"butirați","accusative-definite-nominative-plural":"butirații","dative-genitive-indefinite-singular":"butirat","dative-definite-genitive-singular":"butiratului","dative-genitive-indefinite-plural":"butirați","dative-definite-genitive-plural":"butiraților","singular-vocative":"butiratule","plural-vocative":"butiraților"}},{"word":"butiric","pos":"adj","definitions":["butyric"],"forms":{"feminine-singular":"butirică","masculine-plural":"butirici","feminine-neuter-plural":"butirice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butiric","error-unrecognized-form-feminine-indefinite-singular":"butirică","error-unrecognized-form-indefinite-masculine-plural":"butirici","error-unrecognized-form-feminine-indefinite-neuter-plural":"butirice","definite-error-unrecognized-form-masculine-neuter-singular":"butiricul","definite-error-unrecognized-form-feminine-singular":"butirica","definite-error-unrecognized-form-masculine-plural":"butiricii","definite-error-unrecognized-form-feminine-neuter-plural":"butiricele"}},{"word":"butirină","pos":"noun","definitions":["butyrin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butirină","accusative-definite-nominative-singular":"butirina","accusative-indefinite-nominative-plural":"butirine","accusative-definite-nominative-plural":"butirinele","dative-genitive-indefinite-singular":"butirine","dative-definite-genitive-singular":"butirinei","dative-genitive-indefinite-plural":"butirine","dative-definite-genitive-plural":"butirinelor","singular-vocative":"butirină","plural-vocative":"butirinelor"}},{"word":"butirometru","pos":"noun","definitions":["butyrometer"],"forms":{"plural":"butirometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"butirometru","accusative-definite-nominative-singular":"butirometrul","accusative-indefinite-nominative-plural":"butirometre","accusative-definite-nominative-plural":"butirometrele","dative-genitive-indefinite-singular":"butirometru","dative-definite-genitive-singular":"butirometrului","dative-genitive-indefinite-plural":"butirometre","dative-definite-genitive-plural":"butirometrelor","singular-vocative":"butirometrule","plural-vocative":"butirometrelor"}},{"word":"butlan","pos":"noun","definitions":["a small barrel"],"forms":{"plural":"butlane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"butlan","accusative-definite-nominative-singular":"butlanul","accusative-indefinite-nominative-plural":"butlane","accusative-definite-nominative-plural":"butlanele","dative-genitive-indefinite-singular":"butlan","dative-definite-genitive-singular":"butlanului","dative-genitive-indefinite-plural":"butlane","dative-definite-genitive-plural":"butlanelor","singular-vocative":"butlanule","plural-vocative":"butlanelor"}},{"word":"butlănaș","pos":"noun","definitions":["diminutive of butlan"],"forms":{"plural":"butlănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"butlănaș","accusative-definite-nominative-singular":"butlănașul","accusative-indefinite-nominative-plural":"butlănașe","accusative-definite-nominative-plural":"butlănașele","dative-genitive-indefinite-singular":"butlănaș","dative-definite-genitive-singular":"butlănașului","dative-genitive-indefinite-plural":"butlănașe","dative-definite-genitive-plural":"butlănașelor","singular-vocative":"butlănașule","plural-vocative":"butlănașelor"}},{"word":"Butnar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Butnar"}},{"word":"butnar","pos":"noun","definitions":["cooper"],"forms":{"plural":"butnari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butnar","accusative-definite-nominative-singular":"butnarul","accusative-indefinite-nominative-plural":"butnari","accusative-definite-nominative-plural":"butnarii","dative-genitive-indefinite-singular":"butnar","dative-definite-genitive-singular":"butnarului","dative-genitive-indefinite-plural":"butnari","dative-definite-genitive-plural":"butnarilor","singular-vocative":"butnarule","plural-vocative":"butnarilor"}},{"word":"Butnăreanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butnăreanu"}},{"word":"butnăresc","pos":"adj","definitions":["cooper's"],"forms":{"feminine-singular":"butnărească","plural":"butnărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butnăresc","error-unrecognized-form-feminine-indefinite-singular":"butnărească","error-unrecognized-form-indefinite-masculine-plural":"butnărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"butnărești","definite-error-unrecognized-form-masculine-neuter-singular":"butnărescul","definite-error-unrecognized-form-feminine-singular":"butnăreasca","definite-error-unrecognized-form-masculine-plural":"butnăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"butnăreștile"}},{"word":"Butnărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butnărescu"}},{"word":"Butnărești","pos":"name","definitions":["a village in Secuieni, Neamț County, Romania"],"gender":"m"}];
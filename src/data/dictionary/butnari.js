@@ -0,0 +1 @@
+export default [{"word":"butnări","pos":"verb","definitions":["to work as a cooper"],"forms":{"canonical":"a butnări 4th conjugation","present-singular-third-person":"butnărie","participle-past":"butnărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a butnări","gerund":"butnărind","first-person-indicative-present-singular":"butnăr","indicative-present-second-person-singular":"butnări","indicative-present-singular-third-person":"butnăre","first-person-indicative-plural-present":"butnărim","indicative-plural-present-second-person":"butnăriți","indicative-plural-present-third-person":"butnăr","first-person-imperfect-indicative-singular":"butnăream","imperfect-indicative-second-person-singular":"butnăreai","imperfect-indicative-singular-third-person":"butnărea","first-person-imperfect-indicative-plural":"butnăream","imperfect-indicative-plural-second-person":"butnăreați","imperfect-indicative-plural-third-person":"butnăreau","first-person-indicative-perfect-singular":"butnării","indicative-perfect-second-person-singular":"butnăriși","indicative-perfect-singular-third-person":"butnări","first-person-indicative-perfect-plural":"butnărirăm","indicative-perfect-plural-second-person":"butnărirăți","indicative-perfect-plural-third-person":"butnăriră","first-person-indicative-pluperfect-singular":"butnărisem","indicative-pluperfect-second-person-singular":"butnăriseși","indicative-pluperfect-singular-third-person":"butnărise","first-person-indicative-pluperfect-plural":"butnăriserăm","indicative-pluperfect-plural-second-person":"butnăriserăți","indicative-pluperfect-plural-third-person":"butnăriseră","first-person-present-singular-subjunctive":"să butnăr","present-second-person-singular-subjunctive":"să butnări","present-singular-subjunctive-third-person":"să butnără","first-person-plural-present-subjunctive":"să butnărim","plural-present-second-person-subjunctive":"să butnăriți","plural-present-subjunctive-third-person":"să butnără","imperative-second-person-singular":"butnăre","imperative-plural-second-person":"butnăriți","imperative-negative-second-person-singular":"nu butnări","imperative-negative-plural-second-person":"nu butnăriți"}},{"word":"butnărie","pos":"noun","definitions":["cooperage, a cooper's workshop"],"forms":{"plural":"butnării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"butnărie","accusative-definite-nominative-singular":"butnăria","accusative-indefinite-nominative-plural":"butnării","accusative-definite-nominative-plural":"butnăriile","dative-genitive-indefinite-singular":"butnării","dative-definite-genitive-singular":"butnăriei","dative-genitive-indefinite-plural":"butnării","dative-definite-genitive-plural":"butnăriilor","singular-vocative":"butnărie","plural-vocative":"butnăriilor"}},{"word":"butnărire","pos":"noun","definitions":["coopering"],"forms":{"plural":"butnăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"butnărire","accusative-definite-nominative-singular":"butnărirea","accusative-indefinite-nominative-plural":"butnăriri","accusative-definite-nominative-plural":"butnăririle","dative-genitive-indefinite-singular":"butnăriri","dative-definite-genitive-singular":"butnăririi","dative-genitive-indefinite-plural":"butnăriri","dative-definite-genitive-plural":"butnăririlor","singular-vocative":"butnărire","plural-vocative":"butnăririlor"}},{"word":"butnărit","pos":"adj","definitions":["coopering"],"forms":{"feminine-singular":"butnărită","masculine-plural":"butnăriți","feminine-neuter-plural":"butnărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butnărit","error-unrecognized-form-feminine-indefinite-singular":"butnărită","error-unrecognized-form-indefinite-masculine-plural":"butnăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"butnărite","definite-error-unrecognized-form-masculine-neuter-singular":"butnăritul","definite-error-unrecognized-form-feminine-singular":"butnărita","definite-error-unrecognized-form-masculine-plural":"butnăriții","definite-error-unrecognized-form-feminine-neuter-plural":"butnăritele"}},{"word":"butnărit","pos":"verb","definitions":["past participle of butnări"],"forms":{"participle-past":"of butnări"}},{"word":"Butnariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Butnariu"}},{"word":"Butnaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Butnaru"}},{"word":"Butnăruș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butnăruș"}},{"word":"Butoaia","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Calul"],"gender":"f"},{"word":"butoaică","pos":"noun","definitions":["diminutive of butoi"],"forms":{"plural":"butoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butoaică","accusative-definite-nominative-singular":"butoaica","accusative-indefinite-nominative-plural":"butoaice","accusative-definite-nominative-plural":"butoaicele","dative-genitive-indefinite-singular":"butoaice","dative-definite-genitive-singular":"butoaicei","dative-genitive-indefinite-plural":"butoaice","dative-definite-genitive-plural":"butoaicelor","singular-vocative":"butoaică","plural-vocative":"butoaicelor"}},{"word":"butoaie","pos":"noun","definitions":["diminutive of bute"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"butoaie","accusative-definite-nominative":"butoaia","dative-genitive-indefinite":"butoaii","dative-definite-genitive":"butoaiei","vocative":"butoaie"}},{"word":"butoană","pos":"noun","definitions":["barrel"],"forms":{"plural":"butoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butoană","accusative-definite-nominative-singular":"butoana","accusative-indefinite-nominative-plural":"butoane","accusative-definite-nominative-plural":"butoanele","dative-genitive-indefinite-singular":"butoane","dative-definite-genitive-singular":"butoanei","dative-genitive-indefinite-plural":"butoane","dative-definite-genitive-plural":"butoanelor","singular-vocative":"butoană","plural-vocative":"butoanelor"}},{"word":"Butoescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butoescu"}},{"word":"Butoi","pos":"name","definitions":["a village in Pârșcoveni, Olt County, Romania"],"gender":"m"},{"word":"butoi","pos":"noun","definitions":["barrel (a wood, plastic or metallic container)","cask"],"forms":{"plural":"butoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"butoi","accusative-definite-nominative-singular":"butoiul","accusative-indefinite-nominative-plural":"butoaie","accusative-definite-nominative-plural":"butoaiele","dative-genitive-indefinite-singular":"butoi","dative-definite-genitive-singular":"butoiului","dative-genitive-indefinite-plural":"butoaie","dative-definite-genitive-plural":"butoaielor","singular-vocative":"butoiule","plural-vocative":"butoaielor"}},{"word":"Butoianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Butoianu"}},{"word":"butoiaș","pos":"noun","definitions":["diminutive of butoi; small barrel"],"forms":{"plural":"butoiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"butoiaș","accusative-definite-nominative-singular":"butoiașul","accusative-indefinite-nominative-plural":"butoiașe","accusative-definite-nominative-plural":"butoiașele","dative-genitive-indefinite-singular":"butoiaș","dative-definite-genitive-singular":"butoiașului","dative-genitive-indefinite-plural":"butoiașe","dative-definite-genitive-plural":"butoiașelor","singular-vocative":"butoiașule","plural-vocative":"butoiașelor"}},{"word":"Butoiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butoiescu"}},{"word":"Butoiești","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Butoiești, Mehedinți County, Romania"],"gender":"m"},{"word":"Butoiu","pos":"name","definitions":["a village in Sfântu Gheorghe, Ialomița County, Romania"],"gender":"m"},{"word":"Butoiu de Jos","pos":"name","definitions":["a village in Hulubești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Butoiu de Sus","pos":"name","definitions":["a village in Hulubești, Dâmbovița County, Romania"],"gender":"m"},{"word":"butoiul","pos":"noun","definitions":["definite nominative/accusative singular of butoi"]},{"word":"Buton","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buton"}},{"word":"buton","pos":"noun","definitions":["button (knob or small disc serving as fastener)","button (mechanical device designed to be pressed)","button (on-screen control that can be selected)"],"forms":{"plural":"butoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buton","accusative-definite-nominative-singular":"butonul","accusative-indefinite-nominative-plural":"butoane","accusative-definite-nominative-plural":"butoanele","dative-genitive-indefinite-singular":"buton","dative-definite-genitive-singular":"butonului","dative-genitive-indefinite-plural":"butoane","dative-definite-genitive-plural":"butoanelor","singular-vocative":"butonule","plural-vocative":"butoanelor"}},{"word":"butona","pos":"verb","definitions":["to press buttons fast","to zap"],"forms":{"canonical":"a butona 1st conjugation","present-singular-third-person":"butonează","participle-past":"butonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a butona","gerund":"butonând","first-person-indicative-present-singular":"butonez","indicative-present-second-person-singular":"butonezi","indicative-present-singular-third-person":"butonează","first-person-indicative-plural-present":"butonăm","indicative-plural-present-second-person":"butonați","indicative-plural-present-third-person":"butonează","first-person-imperfect-indicative-singular":"butonam","imperfect-indicative-second-person-singular":"butonai","imperfect-indicative-singular-third-person":"butona","first-person-imperfect-indicative-plural":"butonam","imperfect-indicative-plural-second-person":"butonați","imperfect-indicative-plural-third-person":"butonau","first-person-indicative-perfect-singular":"butonai","indicative-perfect-second-person-singular":"butonași","indicative-perfect-singular-third-person":"butonă","first-person-indicative-perfect-plural":"butonarăm","indicative-perfect-plural-second-person":"butonarăți","indicative-perfect-plural-third-person":"butonară","first-person-indicative-pluperfect-singular":"butonasem","indicative-pluperfect-second-person-singular":"butonaseși","indicative-pluperfect-singular-third-person":"butonase","first-person-indicative-pluperfect-plural":"butonaserăm","indicative-pluperfect-plural-second-person":"butonaserăți","indicative-pluperfect-plural-third-person":"butonaseră","first-person-present-singular-subjunctive":"să butonez","present-second-person-singular-subjunctive":"să butonezi","present-singular-subjunctive-third-person":"să butoneze","first-person-plural-present-subjunctive":"să butonăm","plural-present-second-person-subjunctive":"să butonați","plural-present-subjunctive-third-person":"să butoneze","imperative-second-person-singular":"butonează","imperative-plural-second-person":"butonați","imperative-negative-second-person-singular":"nu butona","imperative-negative-plural-second-person":"nu butonați"}},{"word":"butonare","pos":"noun","definitions":["zapping"],"forms":{"plural":"butonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"butonare","accusative-definite-nominative-singular":"butonarea","accusative-indefinite-nominative-plural":"butonări","accusative-definite-nominative-plural":"butonările","dative-genitive-indefinite-singular":"butonări","dative-definite-genitive-singular":"butonării","dative-genitive-indefinite-plural":"butonări","dative-definite-genitive-plural":"butonărilor","singular-vocative":"butonare","plural-vocative":"butonărilor"}},{"word":"butonieră","pos":"noun","definitions":["buttonhole"],"forms":{"plural":"butoniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"butonieră","accusative-definite-nominative-singular":"butoniera","accusative-indefinite-nominative-plural":"butoniere","accusative-definite-nominative-plural":"butonierele","dative-genitive-indefinite-singular":"butoniere","dative-definite-genitive-singular":"butonierei","dative-genitive-indefinite-plural":"butoniere","dative-definite-genitive-plural":"butonierelor","singular-vocative":"butonieră","plural-vocative":"butonierelor"}},{"word":"Butor","pos":"name","definitions":["a village in Butor, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"m"},{"word":"Butuc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butuc"}},{"word":"butuc","pos":"noun","definitions":["trunk (of a tree), stump","log","block","hub (of a wheel)"],"forms":{"plural":"butuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butuc","accusative-definite-nominative-singular":"butucul","accusative-indefinite-nominative-plural":"butuci","accusative-definite-nominative-plural":"butucii","dative-genitive-indefinite-singular":"butuc","dative-definite-genitive-singular":"butucului","dative-genitive-indefinite-plural":"butuci","dative-definite-genitive-plural":"butucilor","singular-vocative":"butucule","plural-vocative":"butucilor"}},{"word":"butucănos","pos":"adj","definitions":["stumpy"],"forms":{"feminine-singular":"butucănoasă","masculine-plural":"butucănoși","feminine-neuter-plural":"butucănoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butucănos","error-unrecognized-form-feminine-indefinite-singular":"butucănoasă","error-unrecognized-form-indefinite-masculine-plural":"butucănoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"butucănoase","definite-error-unrecognized-form-masculine-neuter-singular":"butucănosul","definite-error-unrecognized-form-feminine-singular":"butucănoasa","definite-error-unrecognized-form-masculine-plural":"butucănoșii","definite-error-unrecognized-form-feminine-neuter-plural":"butucănoasele"}},{"word":"butucar","pos":"noun","definitions":["sylviculturist, forester"],"forms":{"plural":"butucari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butucar","accusative-definite-nominative-singular":"butucarul","accusative-indefinite-nominative-plural":"butucari","accusative-definite-nominative-plural":"butucarii","dative-genitive-indefinite-singular":"butucar","dative-definite-genitive-singular":"butucarului","dative-genitive-indefinite-plural":"butucari","dative-definite-genitive-plural":"butucarilor","singular-vocative":"butucarule","plural-vocative":"butucarilor"}},{"word":"Butucari","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Moreni"],"gender":"m"},{"word":"Butucăria","pos":"name","definitions":["a village in Zăpodeni, Vaslui County, Romania"],"gender":"f"},{"word":"butucaș","pos":"noun","definitions":["diminutive of butuc; small stump"],"forms":{"plural":"butucași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butucaș","accusative-definite-nominative-singular":"butucașul","accusative-indefinite-nominative-plural":"butucași","accusative-definite-nominative-plural":"butucașii","dative-genitive-indefinite-singular":"butucaș","dative-definite-genitive-singular":"butucașului","dative-genitive-indefinite-plural":"butucași","dative-definite-genitive-plural":"butucașilor","singular-vocative":"butucașule","plural-vocative":"butucașilor"}},{"word":"Butuceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Butuceanu"}},{"word":"Butucel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butucel"}},{"word":"butucel","pos":"noun","definitions":["diminutive of butuc; small stump"],"forms":{"plural":"butucei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butucel","accusative-definite-nominative-singular":"butucelul","accusative-indefinite-nominative-plural":"butuceli","accusative-definite-nominative-plural":"butucelii","dative-genitive-indefinite-singular":"butucel","dative-definite-genitive-singular":"butucelului","dative-genitive-indefinite-plural":"butuceli","dative-definite-genitive-plural":"butucelilor","singular-vocative":"butucelule","plural-vocative":"butucelilor"}},{"word":"Butuceni","pos":"name","definitions":["a village in Trebujeni, Orhei Raion, Moldova","a village in Butuceni, Transnistria, Moldova","a commune of Transnistria, Moldova"],"gender":"m"},{"word":"Butucescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Butucescu"}},{"word":"Butuci","pos":"name","definitions":["a village in Sângeru, Prahova County, Romania"],"gender":"m"},{"word":"butuci","pos":"noun","definitions":["plural of butuc"],"gender":"m-p"},{"word":"butucii","pos":"noun","definitions":["definite nominative/accusative plural of butuc"]},{"word":"butucilor","pos":"noun","definitions":["definite genitive/dative plural of butuc"]},{"word":"butucos","pos":"adj","definitions":["rough, coarse"],"forms":{"feminine-singular":"butucoasă","masculine-plural":"butucoși","feminine-neuter-plural":"butucoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"butucos","error-unrecognized-form-feminine-indefinite-singular":"butucoasă","error-unrecognized-form-indefinite-masculine-plural":"butucoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"butucoase","definite-error-unrecognized-form-masculine-neuter-singular":"butucosul","definite-error-unrecognized-form-feminine-singular":"butucoasa","definite-error-unrecognized-form-masculine-plural":"butucoșii","definite-error-unrecognized-form-feminine-neuter-plural":"butucoasele"}},{"word":"butucul","pos":"noun","definitions":["definite nominative/accusative singular of butuc"]},{"word":"butucului","pos":"noun","definitions":["definite genitive/dative singular of butuc"]},{"word":"buțuiaș","pos":"noun","definitions":["diminutive of buțui"],"forms":{"plural":"buțuiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buțuiaș","accusative-definite-nominative-singular":"buțuiașul","accusative-indefinite-nominative-plural":"buțuiași","accusative-definite-nominative-plural":"buțuiașii","dative-genitive-indefinite-singular":"buțuiaș","dative-definite-genitive-singular":"buțuiașului","dative-genitive-indefinite-plural":"buțuiași","dative-definite-genitive-plural":"buțuiașilor","singular-vocative":"buțuiașule","plural-vocative":"buțuiașilor"}},{"word":"butur","pos":"noun","definitions":["alternative form of butură"],"forms":{"plural":"buturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butur","accusative-definite-nominative-singular":"buturul","accusative-indefinite-nominative-plural":"buturi","accusative-definite-nominative-plural":"buturii","dative-genitive-indefinite-singular":"butur","dative-definite-genitive-singular":"buturului","dative-genitive-indefinite-plural":"buturi","dative-definite-genitive-plural":"buturilor","singular-vocative":"buturule","plural-vocative":"buturilor"}},{"word":"butură","pos":"noun","definitions":["log"],"forms":{"plural":"buturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"butură","accusative-definite-nominative-singular":"buturăul","accusative-indefinite-nominative-plural":"buturi","accusative-definite-nominative-plural":"buturii","dative-genitive-indefinite-singular":"butură","dative-definite-genitive-singular":"buturăului","dative-genitive-indefinite-plural":"buturi","dative-definite-genitive-plural":"buturilor","singular-vocative":"buturăule","plural-vocative":"buturilor"}},{"word":"buture","pos":"noun","definitions":["alternative form of butură"],"forms":{"plural":"buturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buture","accusative-definite-nominative-singular":"butureul","accusative-indefinite-nominative-plural":"buturi","accusative-definite-nominative-plural":"buturii","dative-genitive-indefinite-singular":"buture","dative-definite-genitive-singular":"butureului","dative-genitive-indefinite-plural":"buturi","dative-definite-genitive-plural":"buturilor","singular-vocative":"butureule","plural-vocative":"buturilor"}},{"word":"Buțureanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buțureanu"}},{"word":"buturel","pos":"noun","definitions":["diminutive of butură"],"forms":{"plural":"buturele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buturel","accusative-definite-nominative-singular":"buturelul","accusative-indefinite-nominative-plural":"buturele","accusative-definite-nominative-plural":"buturelele","dative-genitive-indefinite-singular":"buturel","dative-definite-genitive-singular":"buturelului","dative-genitive-indefinite-plural":"buturele","dative-definite-genitive-plural":"buturelelor","singular-vocative":"buturelule","plural-vocative":"buturelelor"}},{"word":"buturilor","pos":"noun","definitions":["definite genitive/dative plural of but"]},{"word":"buturos","pos":"adj","definitions":["hollow (about trees)"],"forms":{"feminine-singular":"buturoasă","masculine-plural":"buturoși","feminine-neuter-plural":"buturoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buturos","error-unrecognized-form-feminine-indefinite-singular":"buturoasă","error-unrecognized-form-indefinite-masculine-plural":"buturoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buturoase","definite-error-unrecognized-form-masculine-neuter-singular":"buturosul","definite-error-unrecognized-form-feminine-singular":"buturoasa","definite-error-unrecognized-form-masculine-plural":"buturoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buturoasele"}},{"word":"Buturugă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buturugă"}},{"word":"buturugă","pos":"noun","definitions":["stump","stub"],"forms":{"plural":"buturugi"}},{"word":"buturuga mică răstoarnă carul mare","pos":"proverb","definitions":["little strokes fell great oaks"]},{"word":"Buturugeni","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Buturugeni, Giurgiu County, Romania"],"gender":"m"},{"word":"buturuguță","pos":"noun","definitions":["diminutive of buturugă; small tree stump"],"forms":{"plural":"buturuguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buturuguță","accusative-definite-nominative-singular":"buturuguța","accusative-indefinite-nominative-plural":"buturuguțe","accusative-definite-nominative-plural":"buturuguțele","dative-genitive-indefinite-singular":"buturuguțe","dative-definite-genitive-singular":"buturuguței","dative-genitive-indefinite-plural":"buturuguțe","dative-definite-genitive-plural":"buturuguțelor","singular-vocative":"buturuguță","plural-vocative":"buturuguțelor"}},{"word":"Butușan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butușan"}},{"word":"Butușină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Butușină"}},{"word":"buvabil","pos":"adj","definitions":["drinkable"],"forms":{"feminine-singular":"buvabilă","masculine-plural":"buvabili","feminine-neuter-plural":"buvabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buvabil","error-unrecognized-form-feminine-indefinite-singular":"buvabilă","error-unrecognized-form-indefinite-masculine-plural":"buvabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"buvabile","definite-error-unrecognized-form-masculine-neuter-singular":"buvabilul","definite-error-unrecognized-form-feminine-singular":"buvabila","definite-error-unrecognized-form-masculine-plural":"buvabilii","definite-error-unrecognized-form-feminine-neuter-plural":"buvabilele"}},{"word":"buvetă","pos":"noun","definitions":["buvette"],"forms":{"plural":"buvete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buvetă","accusative-definite-nominative-singular":"buveta","accusative-indefinite-nominative-plural":"buvete","accusative-definite-nominative-plural":"buvetele","dative-genitive-indefinite-singular":"buvete","dative-definite-genitive-singular":"buvetei","dative-genitive-indefinite-plural":"buvete","dative-definite-genitive-plural":"buvetelor","singular-vocative":"buvetă","plural-vocative":"buvetelor"}},{"word":"Buza","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Buza, Cluj County, Romania"],"gender":"f"},{"word":"buza","pos":"noun","definitions":["definite nominative/accusative singular of buză"],"pronunciation":"[ˈbuza]","gender":"f"},{"word":"Buză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buză"}},{"word":"buză","pos":"noun","definitions":["lip","edge of scar","labia","edge","cut"],"pronunciation":"/ˈbu.zə/","forms":{"plural":"buze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buză","accusative-definite-nominative-singular":"buza","accusative-indefinite-nominative-plural":"buze","accusative-definite-nominative-plural":"buzele","dative-genitive-indefinite-singular":"buze","dative-definite-genitive-singular":"buzei","dative-genitive-indefinite-plural":"buze","dative-definite-genitive-plural":"buzelor","singular-vocative":"buză","plural-vocative":"buzelor"}},{"word":"Buzad","pos":"name","definitions":["a village in Bogda, Timiș County, Romania"],"gender":"f"},{"word":"Buzăianu","pos":"name","definitions":["a river in Prahova County, Romania, tributary to the Șipotele"],"gender":"m"},{"word":"Buzăiel","pos":"name","definitions":["a village in Vama Buzăului, Brașov County, Romania"],"gender":"m"},{"word":"buzaină","pos":"noun","definitions":["shed"],"forms":{"plural":"buzaine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzaină","accusative-definite-nominative-singular":"buzaina","accusative-indefinite-nominative-plural":"buzaine","accusative-definite-nominative-plural":"buzainele","dative-genitive-indefinite-singular":"buzaine","dative-definite-genitive-singular":"buzainei","dative-genitive-indefinite-plural":"buzaine","dative-definite-genitive-plural":"buzainelor","singular-vocative":"buzaină","plural-vocative":"buzainelor"}},{"word":"buzăreț","pos":"noun","definitions":["pellagra"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"buzăreț","accusative-definite-nominative":"buzărețul","dative-genitive-indefinite":"buzăreț","dative-definite-genitive":"buzărețului","vocative":"buzărețule"}},{"word":"Buzărnescu","pos":"name","definitions":["a surname"],"pronunciation":"[buzərˈnesku]","gender":"m","forms":{"dative-genitive":"lui Buzărnescu"}},{"word":"Buzaș","pos":"name","definitions":["a village in Rus, Sălaj County, Romania"],"gender":"m"},{"word":"Buzat","pos":"name","definitions":["a river in Dolj, Romania, tributary to the Desnățui"],"gender":"m"},{"word":"buzat","pos":"adj","definitions":["big-lipped"],"forms":{"feminine-singular":"buzată","masculine-plural":"buzați","feminine-neuter-plural":"buzate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzat","error-unrecognized-form-feminine-indefinite-singular":"buzată","error-unrecognized-form-indefinite-masculine-plural":"buzați","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzate","definite-error-unrecognized-form-masculine-neuter-singular":"buzatul","definite-error-unrecognized-form-feminine-singular":"buzata","definite-error-unrecognized-form-masculine-plural":"buzații","definite-error-unrecognized-form-feminine-neuter-plural":"buzatele"}},{"word":"buzățel","pos":"adj","definitions":["diminutive of buzat"],"forms":{"feminine-singular":"buzățelă","masculine-plural":"buzățeli","feminine-neuter-plural":"buzățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzățel","error-unrecognized-form-feminine-indefinite-singular":"buzățelă","error-unrecognized-form-indefinite-masculine-plural":"buzățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzățele","definite-error-unrecognized-form-masculine-neuter-singular":"buzățelul","definite-error-unrecognized-form-feminine-singular":"buzățela","definite-error-unrecognized-form-masculine-plural":"buzățelii","definite-error-unrecognized-form-feminine-neuter-plural":"buzățelele"}},{"word":"Buzați","pos":"name","definitions":["a village in Neamț County, Romania. Renamed to Lunca Moldovei in 1964."],"gender":"m"},{"word":"buzățică","pos":"adj","definitions":["diminutive of buzat"],"forms":{"plural":"buzățice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"buzățică","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzățice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"buzățica","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"buzățicele"}},{"word":"Buzățoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Buzățoaia"}},{"word":"Buzățoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Buzățoiu"}},{"word":"Buzatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Buzatu"}},{"word":"Buzău","pos":"name","definitions":["Buzău (a city in Buzău County, Romania)","Buzău (a county of Romania)","Buzău (a river in Romania)"],"pronunciation":"/buˈzəw/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative":"Buzău","accusative-definite-nominative":"Buzăul","dative-genitive-indefinite":"Buzău","dative-definite-genitive":"Buzăului","vocative":"Buzăule"}},{"word":"Buzăului","pos":"name","definitions":["definite dative/genitive singular of Buzău"]},{"word":"Buzd","pos":"name","definitions":["a village in Brateiu, Sibiu County, Romania"],"gender":"m"},{"word":"Buzduceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buzduceanu"}},{"word":"Buzdug","pos":"name","definitions":["a village in Dagâța, Iași County, Romania"],"gender":"m"},{"word":"Buzdugan","pos":"name","definitions":["a village in Păușești, Vâlcea County, Romania"],"gender":"m"},{"word":"buzdugan","pos":"noun","definitions":["mace, morning star"],"forms":{"plural":"buzdugane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzdugan","accusative-definite-nominative-singular":"buzduganul","accusative-indefinite-nominative-plural":"buzdugane","accusative-definite-nominative-plural":"buzduganele","dative-genitive-indefinite-singular":"buzdugan","dative-definite-genitive-singular":"buzduganului","dative-genitive-indefinite-plural":"buzdugane","dative-definite-genitive-plural":"buzduganelor","singular-vocative":"buzduganule","plural-vocative":"buzduganelor"}},{"word":"buzdugănaș","pos":"noun","definitions":["diminutive of buzdugan"],"forms":{"plural":"buzdugănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzdugănaș","accusative-definite-nominative-singular":"buzdugănașul","accusative-indefinite-nominative-plural":"buzdugănașe","accusative-definite-nominative-plural":"buzdugănașele","dative-genitive-indefinite-singular":"buzdugănaș","dative-definite-genitive-singular":"buzdugănașului","dative-genitive-indefinite-plural":"buzdugănașe","dative-definite-genitive-plural":"buzdugănașelor","singular-vocative":"buzdugănașule","plural-vocative":"buzdugănașelor"}},{"word":"buzdugăni","pos":"verb","definitions":["to bludgeon"],"forms":{"canonical":"a buzdugăni 4th conjugation","present-singular-third-person":"buzdugănește","participle-past":"buzdugănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buzdugăni","gerund":"buzdugănind","first-person-indicative-present-singular":"buzdugănesc","indicative-present-second-person-singular":"buzdugănești","indicative-present-singular-third-person":"buzdugănește","first-person-indicative-plural-present":"buzdugănim","indicative-plural-present-second-person":"buzdugăniți","indicative-plural-present-third-person":"buzdugănesc","first-person-imperfect-indicative-singular":"buzdugăneam","imperfect-indicative-second-person-singular":"buzdugăneai","imperfect-indicative-singular-third-person":"buzdugănea","first-person-imperfect-indicative-plural":"buzdugăneam","imperfect-indicative-plural-second-person":"buzdugăneați","imperfect-indicative-plural-third-person":"buzdugăneau","first-person-indicative-perfect-singular":"buzdugănii","indicative-perfect-second-person-singular":"buzdugăniși","indicative-perfect-singular-third-person":"buzdugăni","first-person-indicative-perfect-plural":"buzdugănirăm","indicative-perfect-plural-second-person":"buzdugănirăți","indicative-perfect-plural-third-person":"buzdugăniră","first-person-indicative-pluperfect-singular":"buzdugănisem","indicative-pluperfect-second-person-singular":"buzdugăniseși","indicative-pluperfect-singular-third-person":"buzdugănise","first-person-indicative-pluperfect-plural":"buzdugăniserăm","indicative-pluperfect-plural-second-person":"buzdugăniserăți","indicative-pluperfect-plural-third-person":"buzdugăniseră","first-person-present-singular-subjunctive":"să buzdugănesc","present-second-person-singular-subjunctive":"să buzdugănești","present-singular-subjunctive-third-person":"să buzdugănească","first-person-plural-present-subjunctive":"să buzdugănim","plural-present-second-person-subjunctive":"să buzdugăniți","plural-present-subjunctive-third-person":"să buzdugănească","imperative-second-person-singular":"buzdugănește","imperative-plural-second-person":"buzdugăniți","imperative-negative-second-person-singular":"nu buzdugăni","imperative-negative-plural-second-person":"nu buzdugăniți"}},{"word":"Buzduganii de Jos","pos":"name","definitions":["a village in Valea Mare, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Buzduganii de Sus","pos":"name","definitions":["a village in Valea Mare, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Buzduganu","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Sebeș"],"gender":"m"},{"word":"buzdugeană","pos":"noun","definitions":["a large being"],"forms":{"plural":"buzdugene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzdugeană","accusative-definite-nominative-singular":"buzdugeana","accusative-indefinite-nominative-plural":"buzdugene","accusative-definite-nominative-plural":"buzdugenele","dative-genitive-indefinite-singular":"buzdugene","dative-definite-genitive-singular":"buzdugenei","dative-genitive-indefinite-plural":"buzdugene","dative-definite-genitive-plural":"buzdugenelor","singular-vocative":"buzdugeană","plural-vocative":"buzdugenelor"}},{"word":"Buzdugeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buzdugeanu"}},{"word":"Buzdugeni","pos":"name","definitions":["a village in Burlănești, Edineț Raion, Moldova"],"gender":"m"},{"word":"buze","pos":"noun","definitions":["inflection of buză:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈbuze]","gender":"f"},{"word":"Buzeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Buzeanu"}},{"word":"Buzeni","pos":"name","definitions":["a village in Bălușeni, Botoșani County, Romania"],"gender":"m"},{"word":"Buzescu","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Buzescu, Teleorman County, Romania"],"gender":"m"},{"word":"Buzești","pos":"name","definitions":["a village in Crasna, Gorj County, Romania","a village in Fărcașa, Maramureș County, Romania","a village in Corbu, Olt County, Romania"],"gender":"m"},{"word":"Buziaș","pos":"name","definitions":["a town in Timiș County, Romania"],"gender":"m"},{"word":"buzișoară","pos":"noun","definitions":["diminutive of buză; small lip"],"forms":{"plural":"buzișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzișoară","accusative-definite-nominative-singular":"buzișoara","accusative-indefinite-nominative-plural":"buzișoare","accusative-definite-nominative-plural":"buzișoarele","dative-genitive-indefinite-singular":"buzișoare","dative-definite-genitive-singular":"buzișoarei","dative-genitive-indefinite-plural":"buzișoare","dative-definite-genitive-plural":"buzișoarelor","singular-vocative":"buzișoară","plural-vocative":"buzișoarelor"}},{"word":"buzișor","pos":"noun","definitions":["yellow coralroot, Corallorhiza trifida"],"forms":{"plural":"buzișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buzișor","accusative-definite-nominative-singular":"buzișorul","accusative-indefinite-nominative-plural":"buzișori","accusative-definite-nominative-plural":"buzișorii","dative-genitive-indefinite-singular":"buzișor","dative-definite-genitive-singular":"buzișorului","dative-genitive-indefinite-plural":"buzișori","dative-definite-genitive-plural":"buzișorilor","singular-vocative":"buzișorule","plural-vocative":"buzișorilor"}},{"word":"buzna","pos":"adv","definitions":["unexpectedly"]},{"word":"Buznea","pos":"name","definitions":["a village in Ion Neculce, Iași County, Romania"],"gender":"f"},{"word":"buzo","pos":"noun","definitions":["definite vocative singular of buză"],"gender":"f"},{"word":"buzoaie","pos":"noun","definitions":["augmentative of buză"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"buzoaie","accusative-definite-nominative":"buzoaieul","dative-genitive-indefinite":"buzoaie","dative-definite-genitive":"buzoaieului","vocative":"buzoaieule"}},{"word":"Buzoeni","pos":"name","definitions":["a village in Lehliu-Gară, Călărași County, Romania"],"gender":"m"},{"word":"Buzoești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Buzoești, Argeș County, Romania"],"gender":"m"},{"word":"buzoi","pos":"noun","definitions":["augmentative of buză"],"forms":{"plural":"buzoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzoi","accusative-definite-nominative-singular":"buzoiul","accusative-indefinite-nominative-plural":"buzoaie","accusative-definite-nominative-plural":"buzoaiele","dative-genitive-indefinite-singular":"buzoi","dative-definite-genitive-singular":"buzoiului","dative-genitive-indefinite-plural":"buzoaie","dative-definite-genitive-plural":"buzoaielor","singular-vocative":"buzoiule","plural-vocative":"buzoaielor"}},{"word":"buzoia","pos":"verb","definitions":["to get upset"],"forms":{"canonical":"a buzoia 1st conjugation","present-singular-third-person":"buzoiesc","participle-past":"buzoiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a buzoia","gerund":"buzoind","first-person-indicative-present-singular":"buzoi","indicative-present-second-person-singular":"buzoi","indicative-present-singular-third-person":"buzoie","first-person-indicative-plural-present":"buzoiem","indicative-plural-present-second-person":"buzoiați","indicative-plural-present-third-person":"buzoie","first-person-imperfect-indicative-singular":"buzoiam","imperfect-indicative-second-person-singular":"buzoiai","imperfect-indicative-singular-third-person":"buzoia","first-person-imperfect-indicative-plural":"buzoiam","imperfect-indicative-plural-second-person":"buzoiați","imperfect-indicative-plural-third-person":"buzoiau","first-person-indicative-perfect-singular":"buzoiai","indicative-perfect-second-person-singular":"buzoiași","indicative-perfect-singular-third-person":"buzoie","first-person-indicative-perfect-plural":"buzoiarăm","indicative-perfect-plural-second-person":"buzoiarăți","indicative-perfect-plural-third-person":"buzoiară","first-person-indicative-pluperfect-singular":"buzoiasem","indicative-pluperfect-second-person-singular":"buzoiaseși","indicative-pluperfect-singular-third-person":"buzoiase","first-person-indicative-pluperfect-plural":"buzoiaserăm","indicative-pluperfect-plural-second-person":"buzoiaserăți","indicative-pluperfect-plural-third-person":"buzoiaseră","first-person-present-singular-subjunctive":"să buzoi","present-second-person-singular-subjunctive":"să buzoi","present-singular-subjunctive-third-person":"să buzoie","first-person-plural-present-subjunctive":"să buzoiem","plural-present-second-person-subjunctive":"să buzoiați","plural-present-subjunctive-third-person":"să buzoie","imperative-second-person-singular":"buzoie","imperative-plural-second-person":"buzoiați","imperative-negative-second-person-singular":"nu buzoia","imperative-negative-plural-second-person":"nu buzoiați"}},{"word":"buzoian","pos":"noun","definitions":["native or inhabitant of the city of Buzău or surrounding Buzău County, Romania (usually male)"],"forms":{"plural":"buzoieni","feminine":"equivalent buzoiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"buzoian","accusative-definite-nominative-singular":"buzoianul","accusative-indefinite-nominative-plural":"buzoieni","accusative-definite-nominative-plural":"buzoienii","dative-genitive-indefinite-singular":"buzoian","dative-definite-genitive-singular":"buzoianului","dative-genitive-indefinite-plural":"buzoieni","dative-definite-genitive-plural":"buzoienilor","singular-vocative":"buzoianule","plural-vocative":"buzoienilor"}},{"word":"buzoiană","pos":"noun","definitions":["female equivalent of buzoian"],"forms":{"plural":"buzoiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzoiană","accusative-definite-nominative-singular":"buzoiana","accusative-indefinite-nominative-plural":"buzoiene","accusative-definite-nominative-plural":"buzoienele","dative-genitive-indefinite-singular":"buzoiene","dative-definite-genitive-singular":"buzoienei","dative-genitive-indefinite-plural":"buzoiene","dative-definite-genitive-plural":"buzoienelor","singular-vocative":"buzoiană","plural-vocative":"buzoienelor"}},{"word":"buzoiancă","pos":"noun","definitions":["female equivalent of buzoian"],"forms":{"plural":"buzoience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzoiancă","accusative-definite-nominative-singular":"buzoianca","accusative-indefinite-nominative-plural":"buzoience","accusative-definite-nominative-plural":"buzoiencele","dative-genitive-indefinite-singular":"buzoience","dative-definite-genitive-singular":"buzoiencei","dative-genitive-indefinite-plural":"buzoience","dative-definite-genitive-plural":"buzoiencelor","singular-vocative":"buzoiancă","plural-vocative":"buzoiencelor"}},{"word":"Buzoianu","pos":"name","definitions":["a surname"],"pronunciation":"/bu.zoˈja.nu/","gender":"m","forms":{"dative-genitive":"lui Buzoianu"}},{"word":"buzoiat","pos":"adj","definitions":["upset"],"forms":{"feminine-singular":"buzoiată","masculine-plural":"buzoiați","feminine-neuter-plural":"buzoiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzoiat","error-unrecognized-form-feminine-indefinite-singular":"buzoiată","error-unrecognized-form-indefinite-masculine-plural":"buzoiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzoiate","definite-error-unrecognized-form-masculine-neuter-singular":"buzoiatul","definite-error-unrecognized-form-feminine-singular":"buzoiata","definite-error-unrecognized-form-masculine-plural":"buzoiații","definite-error-unrecognized-form-feminine-neuter-plural":"buzoiatele"}},{"word":"buzoiat","pos":"verb","definitions":["past participle of buzoia"],"forms":{"participle-past":"of buzoia"}},{"word":"buzoienesc","pos":"adj","definitions":["related to the city Buzău"],"forms":{"feminine-singular":"buzoienească","plural":"buzoienești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzoienesc","error-unrecognized-form-feminine-indefinite-singular":"buzoienească","error-unrecognized-form-indefinite-masculine-plural":"buzoienești","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzoienești","definite-error-unrecognized-form-masculine-neuter-singular":"buzoienescul","definite-error-unrecognized-form-feminine-singular":"buzoieneasca","definite-error-unrecognized-form-masculine-plural":"buzoieneștii","definite-error-unrecognized-form-feminine-neuter-plural":"buzoieneștile"}},{"word":"buzos","pos":"adj","definitions":["having big lips"],"forms":{"feminine-singular":"buzoasă","masculine-plural":"buzoși","feminine-neuter-plural":"buzoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzos","error-unrecognized-form-feminine-indefinite-singular":"buzoasă","error-unrecognized-form-indefinite-masculine-plural":"buzoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzoase","definite-error-unrecognized-form-masculine-neuter-singular":"buzosul","definite-error-unrecognized-form-feminine-singular":"buzoasa","definite-error-unrecognized-form-masculine-plural":"buzoșii","definite-error-unrecognized-form-feminine-neuter-plural":"buzoasele"}},{"word":"Buzota","pos":"name","definitions":["a village in Apostolache, Prahova County, Romania"],"gender":"f"},{"word":"buzuliță","pos":"noun","definitions":["diminutive of buză; liplet"],"forms":{"plural":"buzulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzuliță","accusative-definite-nominative-singular":"buzulița","accusative-indefinite-nominative-plural":"buzulițe","accusative-definite-nominative-plural":"buzulițele","dative-genitive-indefinite-singular":"buzulițe","dative-definite-genitive-singular":"buzuliței","dative-genitive-indefinite-plural":"buzulițe","dative-definite-genitive-plural":"buzulițelor","singular-vocative":"buzuliță","plural-vocative":"buzulițelor"}},{"word":"buzunar","pos":"noun","definitions":["pocket (in clothes)"],"pronunciation":"[buzuˈnar]","forms":{"plural":"buzunare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzunar","accusative-definite-nominative-singular":"buzunarul","accusative-indefinite-nominative-plural":"buzunare","accusative-definite-nominative-plural":"buzunarele","dative-genitive-indefinite-singular":"buzunar","dative-definite-genitive-singular":"buzunarului","dative-genitive-indefinite-plural":"buzunare","dative-definite-genitive-plural":"buzunarelor","singular-vocative":"buzunarule","plural-vocative":"buzunarelor"}},{"word":"buzunăraș","pos":"noun","definitions":["diminutive of buzunar; small pocket"],"forms":{"plural":"buzunărașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzunăraș","accusative-definite-nominative-singular":"buzunărașul","accusative-indefinite-nominative-plural":"buzunărașe","accusative-definite-nominative-plural":"buzunărașele","dative-genitive-indefinite-singular":"buzunăraș","dative-definite-genitive-singular":"buzunărașului","dative-genitive-indefinite-plural":"buzunărașe","dative-definite-genitive-plural":"buzunărașelor","singular-vocative":"buzunărașule","plural-vocative":"buzunărașelor"}},{"word":"buzunăreală","pos":"noun","definitions":["pickpocketing"],"forms":{"plural":"buzunăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"buzunăreală","accusative-definite-nominative-singular":"buzunăreala","accusative-indefinite-nominative-plural":"buzunărele","accusative-definite-nominative-plural":"buzunărelele","dative-genitive-indefinite-singular":"buzunărele","dative-definite-genitive-singular":"buzunărelei","dative-genitive-indefinite-plural":"buzunărele","dative-definite-genitive-plural":"buzunărelelor","singular-vocative":"buzunăreală","plural-vocative":"buzunărelelor"}},{"word":"buzunărel","pos":"noun","definitions":["diminutive of buzunar; small pocket"],"forms":{"plural":"buzunărele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"buzunărel","accusative-definite-nominative-singular":"buzunărelul","accusative-indefinite-nominative-plural":"buzunărele","accusative-definite-nominative-plural":"buzunărelele","dative-genitive-indefinite-singular":"buzunărel","dative-definite-genitive-singular":"buzunărelului","dative-genitive-indefinite-plural":"buzunărele","dative-definite-genitive-plural":"buzunărelelor","singular-vocative":"buzunărelule","plural-vocative":"buzunărelelor"}},{"word":"buzunări","pos":"verb","definitions":["to pickpocket"],"forms":{"canonical":"a buzunări 4th conjugation","present-singular-third-person":"buzunărește","participle-past":"buzunărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a buzunări","gerund":"buzunărind","first-person-indicative-present-singular":"buzunăresc","indicative-present-second-person-singular":"buzunărești","indicative-present-singular-third-person":"buzunărește","first-person-indicative-plural-present":"buzunărim","indicative-plural-present-second-person":"buzunăriți","indicative-plural-present-third-person":"buzunăresc","first-person-imperfect-indicative-singular":"buzunăream","imperfect-indicative-second-person-singular":"buzunăreai","imperfect-indicative-singular-third-person":"buzunărea","first-person-imperfect-indicative-plural":"buzunăream","imperfect-indicative-plural-second-person":"buzunăreați","imperfect-indicative-plural-third-person":"buzunăreau","first-person-indicative-perfect-singular":"buzunării","indicative-perfect-second-person-singular":"buzunăriși","indicative-perfect-singular-third-person":"buzunări","first-person-indicative-perfect-plural":"buzunărirăm","indicative-perfect-plural-second-person":"buzunărirăți","indicative-perfect-plural-third-person":"buzunăriră","first-person-indicative-pluperfect-singular":"buzunărisem","indicative-pluperfect-second-person-singular":"buzunăriseși","indicative-pluperfect-singular-third-person":"buzunărise","first-person-indicative-pluperfect-plural":"buzunăriserăm","indicative-pluperfect-plural-second-person":"buzunăriserăți","indicative-pluperfect-plural-third-person":"buzunăriseră","first-person-present-singular-subjunctive":"să buzunăresc","present-second-person-singular-subjunctive":"să buzunărești","present-singular-subjunctive-third-person":"să buzunărească","first-person-plural-present-subjunctive":"să buzunărim","plural-present-second-person-subjunctive":"să buzunăriți","plural-present-subjunctive-third-person":"să buzunărească","imperative-second-person-singular":"buzunărește","imperative-plural-second-person":"buzunăriți","imperative-negative-second-person-singular":"nu buzunări","imperative-negative-plural-second-person":"nu buzunăriți"}},{"word":"buzunărire","pos":"noun","definitions":["pickpocketing"],"forms":{"plural":"buzunăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"buzunărire","accusative-definite-nominative-singular":"buzunărirea","accusative-indefinite-nominative-plural":"buzunăriri","accusative-definite-nominative-plural":"buzunăririle","dative-genitive-indefinite-singular":"buzunăriri","dative-definite-genitive-singular":"buzunăririi","dative-genitive-indefinite-plural":"buzunăriri","dative-definite-genitive-plural":"buzunăririlor","singular-vocative":"buzunărire","plural-vocative":"buzunăririlor"}},{"word":"buzunărit","pos":"adj","definitions":["pickpocketed"],"forms":{"feminine-singular":"buzunărită","masculine-plural":"buzunăriți","feminine-neuter-plural":"buzunărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"buzunărit","error-unrecognized-form-feminine-indefinite-singular":"buzunărită","error-unrecognized-form-indefinite-masculine-plural":"buzunăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"buzunărite","definite-error-unrecognized-form-masculine-neuter-singular":"buzunăritul","definite-error-unrecognized-form-feminine-singular":"buzunărita","definite-error-unrecognized-form-masculine-plural":"buzunăriții","definite-error-unrecognized-form-feminine-neuter-plural":"buzunăritele"}},{"word":"buzunărit","pos":"verb","definitions":["past participle of buzunări"],"forms":{"participle-past":"of buzunări"}},{"word":"BV","pos":"name","definitions":["abbreviation of Brașov: a county of Romania"]},{"word":"bypass","pos":"noun","definitions":["bypass"],"forms":{"plural":"bypassuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"bypass","accusative-definite-nominative-singular":"bypassul","accusative-indefinite-nominative-plural":"bypassuri","accusative-definite-nominative-plural":"bypassurile","dative-genitive-indefinite-singular":"bypass","dative-definite-genitive-singular":"bypassului","dative-genitive-indefinite-plural":"bypassuri","dative-definite-genitive-plural":"bypassurilor","singular-vocative":"bypassule","plural-vocative":"bypassurilor"}},{"word":"byronian","pos":"adj","definitions":["Byronian"],"forms":{"feminine-singular":"byroniană","masculine-plural":"byronieni","feminine-neuter-plural":"byroniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"byronian","error-unrecognized-form-feminine-indefinite-singular":"byroniană","error-unrecognized-form-indefinite-masculine-plural":"byronieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"byroniene","definite-error-unrecognized-form-masculine-neuter-singular":"byronianul","definite-error-unrecognized-form-feminine-singular":"byroniana","definite-error-unrecognized-form-masculine-plural":"byronienii","definite-error-unrecognized-form-feminine-neuter-plural":"byronienele"}},{"word":"byte","pos":"noun","definitions":["byte"],"pronunciation":"/ˈbajt/","forms":{"plural":"byți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"byte","accusative-definite-nominative-singular":"byteul","accusative-indefinite-nominative-plural":"byți","accusative-definite-nominative-plural":"byții","dative-genitive-indefinite-singular":"byte","dative-definite-genitive-singular":"byteului","dative-genitive-indefinite-plural":"byți","dative-definite-genitive-plural":"byților","singular-vocative":"byteule","plural-vocative":"byților"}},{"word":"byți","pos":"noun","definitions":["plural of byte"],"pronunciation":"/ˈbajtsʲ/"},{"word":"BZ","pos":"name","definitions":["abbreviation of Buzău: a county of Romania"]}];
@@ -0,0 +1 @@
+export default [{"word":"efemina","pos":"verb","definitions":["to feminize, to womanize"],"forms":{"canonical":"a efemina 1st conjugation","present-singular-third-person":"efeminează","participle-past":"efeminat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a efemina","gerund":"efeminând","first-person-indicative-present-singular":"efeminez","indicative-present-second-person-singular":"efeminezi","indicative-present-singular-third-person":"efeminează","first-person-indicative-plural-present":"efeminăm","indicative-plural-present-second-person":"efeminați","indicative-plural-present-third-person":"efeminează","first-person-imperfect-indicative-singular":"efeminam","imperfect-indicative-second-person-singular":"efeminai","imperfect-indicative-singular-third-person":"efemina","first-person-imperfect-indicative-plural":"efeminam","imperfect-indicative-plural-second-person":"efeminați","imperfect-indicative-plural-third-person":"efeminau","first-person-indicative-perfect-singular":"efeminai","indicative-perfect-second-person-singular":"efeminași","indicative-perfect-singular-third-person":"efemină","first-person-indicative-perfect-plural":"efeminarăm","indicative-perfect-plural-second-person":"efeminarăți","indicative-perfect-plural-third-person":"efeminară","first-person-indicative-pluperfect-singular":"efeminasem","indicative-pluperfect-second-person-singular":"efeminaseși","indicative-pluperfect-singular-third-person":"efeminase","first-person-indicative-pluperfect-plural":"efeminaserăm","indicative-pluperfect-plural-second-person":"efeminaserăți","indicative-pluperfect-plural-third-person":"efeminaseră","first-person-present-singular-subjunctive":"să efeminez","present-second-person-singular-subjunctive":"să efeminezi","present-singular-subjunctive-third-person":"să efemineze","first-person-plural-present-subjunctive":"să efeminăm","plural-present-second-person-subjunctive":"să efeminați","plural-present-subjunctive-third-person":"să efemineze","imperative-second-person-singular":"efeminează","imperative-plural-second-person":"efeminați","imperative-negative-second-person-singular":"nu efemina","imperative-negative-plural-second-person":"nu efeminați"}},{"word":"efeminare","pos":"noun","definitions":["feminization, effemination"],"forms":{"plural":"efeminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"efeminare","accusative-definite-nominative-singular":"efeminarea","accusative-indefinite-nominative-plural":"efeminări","accusative-definite-nominative-plural":"efeminările","dative-genitive-indefinite-singular":"efeminări","dative-definite-genitive-singular":"efeminării","dative-genitive-indefinite-plural":"efeminări","dative-definite-genitive-plural":"efeminărilor","singular-vocative":"efeminare","plural-vocative":"efeminărilor"}},{"word":"efeminat","pos":"adj","definitions":["effeminate"],"forms":{"feminine-singular":"efeminată","masculine-plural":"efeminați","feminine-neuter-plural":"efeminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efeminat","error-unrecognized-form-feminine-indefinite-singular":"efeminată","error-unrecognized-form-indefinite-masculine-plural":"efeminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"efeminate","definite-error-unrecognized-form-masculine-neuter-singular":"efeminatul","definite-error-unrecognized-form-feminine-singular":"efeminata","definite-error-unrecognized-form-masculine-plural":"efeminații","definite-error-unrecognized-form-feminine-neuter-plural":"efeminatele"}},{"word":"efeminație","pos":"noun","definitions":["effeminacy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"efeminație","accusative-definite-nominative":"efeminația","dative-genitive-indefinite":"efeminații","dative-definite-genitive":"efeminației","vocative":"efeminație"}},{"word":"efeminațiune","pos":"noun","definitions":["obsolete form of efeminație"],"forms":{"plural":"efeminațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"efeminațiune","accusative-definite-nominative-singular":"efeminațiunea","accusative-indefinite-nominative-plural":"efeminațiuni","accusative-definite-nominative-plural":"efeminațiunile","dative-genitive-indefinite-singular":"efeminațiuni","dative-definite-genitive-singular":"efeminațiunii","dative-genitive-indefinite-plural":"efeminațiuni","dative-definite-genitive-plural":"efeminațiunilor","singular-vocative":"efeminațiune","plural-vocative":"efeminațiunilor"}},{"word":"efendi","pos":"noun","definitions":["sir"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"efendi","accusative-definite-nominative":"efendiul","dative-genitive-indefinite":"efendi","dative-definite-genitive":"efendiului","vocative":"efendiule"}},{"word":"eferent","pos":"adj","definitions":["efferent"],"forms":{"feminine-singular":"eferentă","masculine-plural":"eferenți","feminine-neuter-plural":"eferente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eferent","error-unrecognized-form-feminine-indefinite-singular":"eferentă","error-unrecognized-form-indefinite-masculine-plural":"eferenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eferente","definite-error-unrecognized-form-masculine-neuter-singular":"eferentul","definite-error-unrecognized-form-feminine-singular":"eferenta","definite-error-unrecognized-form-masculine-plural":"eferenții","definite-error-unrecognized-form-feminine-neuter-plural":"eferentele"}},{"word":"efervescent","pos":"adj","definitions":["effervescent"],"forms":{"feminine-singular":"efervescentă","masculine-plural":"efervescenți","feminine-neuter-plural":"efervescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efervescent","error-unrecognized-form-feminine-indefinite-singular":"efervescentă","error-unrecognized-form-indefinite-masculine-plural":"efervescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"efervescente","definite-error-unrecognized-form-masculine-neuter-singular":"efervescentul","definite-error-unrecognized-form-feminine-singular":"efervescenta","definite-error-unrecognized-form-masculine-plural":"efervescenții","definite-error-unrecognized-form-feminine-neuter-plural":"efervescentele"}},{"word":"efervescență","pos":"noun","definitions":["effervescence"],"forms":{"plural":"efervescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"efervescență","accusative-definite-nominative-singular":"efervescența","accusative-indefinite-nominative-plural":"efervescențe","accusative-definite-nominative-plural":"efervescențele","dative-genitive-indefinite-singular":"efervescențe","dative-definite-genitive-singular":"efervescenței","dative-genitive-indefinite-plural":"efervescențe","dative-definite-genitive-plural":"efervescențelor","singular-vocative":"efervescență","plural-vocative":"efervescențelor"}},{"word":"Efes","pos":"name","definitions":["Ephesus (an ancient Greek city in Anatolia, near Selçuk in modern İzmir Province, Turkey)"],"gender":"m"},{"word":"efesean","pos":"adj","definitions":["Ephesian"],"forms":{"feminine-singular":"efeseană","masculine-plural":"efeseni","feminine-neuter-plural":"efesene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efesean","error-unrecognized-form-feminine-indefinite-singular":"efeseană","error-unrecognized-form-indefinite-masculine-plural":"efeseni","error-unrecognized-form-feminine-indefinite-neuter-plural":"efesene","definite-error-unrecognized-form-masculine-neuter-singular":"efeseanul","definite-error-unrecognized-form-feminine-singular":"efeseana","definite-error-unrecognized-form-masculine-plural":"efesenii","definite-error-unrecognized-form-feminine-neuter-plural":"efesenele"}},{"word":"efeseiesc","pos":"adj","definitions":["Ephesian"],"forms":{"feminine-singular":"efeseiască","plural":"efeseiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efeseiesc","error-unrecognized-form-feminine-indefinite-singular":"efeseiască","error-unrecognized-form-indefinite-masculine-plural":"efeseiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"efeseiești","definite-error-unrecognized-form-masculine-neuter-singular":"efeseiescul","definite-error-unrecognized-form-feminine-singular":"efeseiasca","definite-error-unrecognized-form-masculine-plural":"efeseieștii","definite-error-unrecognized-form-feminine-neuter-plural":"efeseieștile"}},{"word":"efetonină","pos":"noun","definitions":["ephetonin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"efetonină","accusative-definite-nominative-singular":"efetonina","accusative-indefinite-nominative-plural":"efetonine","accusative-definite-nominative-plural":"efetoninele","dative-genitive-indefinite-singular":"efetonine","dative-definite-genitive-singular":"efetoninei","dative-genitive-indefinite-plural":"efetonine","dative-definite-genitive-plural":"efetoninelor","singular-vocative":"efetonină","plural-vocative":"efetoninelor"}},{"word":"efevrimă","pos":"noun","definitions":["invention"],"forms":{"plural":"efevrime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"efevrimă","accusative-definite-nominative-singular":"efevrima","accusative-indefinite-nominative-plural":"efevrime","accusative-definite-nominative-plural":"efevrimele","dative-genitive-indefinite-singular":"efevrime","dative-definite-genitive-singular":"efevrimei","dative-genitive-indefinite-plural":"efevrime","dative-definite-genitive-plural":"efevrimelor","singular-vocative":"efevrimă","plural-vocative":"efevrimelor"}},{"word":"eficace","pos":"adj","definitions":["effective (producing a decided or decisive effect)"],"pronunciation":"/e.fiˈka.t͡ʃe/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eficace","error-unrecognized-form-feminine-indefinite-singular":"eficace","error-unrecognized-form-indefinite-masculine-plural":"eficace","error-unrecognized-form-feminine-indefinite-neuter-plural":"eficace","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"eficacitate","pos":"noun","definitions":["effectiveness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eficacitate","accusative-definite-nominative-singular":"eficacitatea","accusative-indefinite-nominative-plural":"eficacități","accusative-definite-nominative-plural":"eficacitățile","dative-genitive-indefinite-singular":"eficacități","dative-definite-genitive-singular":"eficacității","dative-genitive-indefinite-plural":"eficacități","dative-definite-genitive-plural":"eficacităților","singular-vocative":"eficacitate","plural-vocative":"eficacităților"}},{"word":"eficient","pos":"adj","definitions":["efficient, operative"],"forms":{"feminine-singular":"eficientă","masculine-plural":"eficienți","feminine-neuter-plural":"eficiente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eficient","error-unrecognized-form-feminine-indefinite-singular":"eficientă","error-unrecognized-form-indefinite-masculine-plural":"eficienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eficiente","definite-error-unrecognized-form-masculine-neuter-singular":"eficientul","definite-error-unrecognized-form-feminine-singular":"eficienta","definite-error-unrecognized-form-masculine-plural":"eficienții","definite-error-unrecognized-form-feminine-neuter-plural":"eficientele"}},{"word":"eficiență","pos":"noun","definitions":["efficiency"],"forms":{"plural":"eficiențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eficiență","accusative-definite-nominative-singular":"eficiența","accusative-indefinite-nominative-plural":"eficiențe","accusative-definite-nominative-plural":"eficiențele","dative-genitive-indefinite-singular":"eficiențe","dative-definite-genitive-singular":"eficienței","dative-genitive-indefinite-plural":"eficiențe","dative-definite-genitive-plural":"eficiențelor","singular-vocative":"eficiență","plural-vocative":"eficiențelor"}},{"word":"eficientiza","pos":"verb","definitions":["to streamline"],"forms":{"canonical":"a eficientiza 1st conjugation","present-singular-third-person":"eficientizează","participle-past":"eficientizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eficientiza","gerund":"eficientizând","first-person-indicative-present-singular":"eficientizez","indicative-present-second-person-singular":"eficientizezi","indicative-present-singular-third-person":"eficientizează","first-person-indicative-plural-present":"eficientizăm","indicative-plural-present-second-person":"eficientizați","indicative-plural-present-third-person":"eficientizează","first-person-imperfect-indicative-singular":"eficientizam","imperfect-indicative-second-person-singular":"eficientizai","imperfect-indicative-singular-third-person":"eficientiza","first-person-imperfect-indicative-plural":"eficientizam","imperfect-indicative-plural-second-person":"eficientizați","imperfect-indicative-plural-third-person":"eficientizau","first-person-indicative-perfect-singular":"eficientizai","indicative-perfect-second-person-singular":"eficientizași","indicative-perfect-singular-third-person":"eficientiză","first-person-indicative-perfect-plural":"eficientizarăm","indicative-perfect-plural-second-person":"eficientizarăți","indicative-perfect-plural-third-person":"eficientizară","first-person-indicative-pluperfect-singular":"eficientizasem","indicative-pluperfect-second-person-singular":"eficientizaseși","indicative-pluperfect-singular-third-person":"eficientizase","first-person-indicative-pluperfect-plural":"eficientizaserăm","indicative-pluperfect-plural-second-person":"eficientizaserăți","indicative-pluperfect-plural-third-person":"eficientizaseră","first-person-present-singular-subjunctive":"să eficientizez","present-second-person-singular-subjunctive":"să eficientizezi","present-singular-subjunctive-third-person":"să eficientizeze","first-person-plural-present-subjunctive":"să eficientizăm","plural-present-second-person-subjunctive":"să eficientizați","plural-present-subjunctive-third-person":"să eficientizeze","imperative-second-person-singular":"eficientizează","imperative-plural-second-person":"eficientizați","imperative-negative-second-person-singular":"nu eficientiza","imperative-negative-plural-second-person":"nu eficientizați"}},{"word":"eficientizare","pos":"noun","definitions":["an improvement in efficiency"],"forms":{"plural":"eficientizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eficientizare","accusative-definite-nominative-singular":"eficientizarea","accusative-indefinite-nominative-plural":"eficientizări","accusative-definite-nominative-plural":"eficientizările","dative-genitive-indefinite-singular":"eficientizări","dative-definite-genitive-singular":"eficientizării","dative-genitive-indefinite-plural":"eficientizări","dative-definite-genitive-plural":"eficientizărilor","singular-vocative":"eficientizare","plural-vocative":"eficientizărilor"}},{"word":"efigial","pos":"adj","definitions":["effigial"],"forms":{"feminine-singular":"efigială","masculine-plural":"efigiali","feminine-neuter-plural":"efigiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efigial","error-unrecognized-form-feminine-indefinite-singular":"efigială","error-unrecognized-form-indefinite-masculine-plural":"efigiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"efigiale","definite-error-unrecognized-form-masculine-neuter-singular":"efigialul","definite-error-unrecognized-form-feminine-singular":"efigiala","definite-error-unrecognized-form-masculine-plural":"efigialii","definite-error-unrecognized-form-feminine-neuter-plural":"efigialele"}},{"word":"efigie","pos":"noun","definitions":["effigy"],"forms":{"plural":"efigii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"efigie","accusative-definite-nominative-singular":"efigia","accusative-indefinite-nominative-plural":"efigii","accusative-definite-nominative-plural":"efigiile","dative-genitive-indefinite-singular":"efigii","dative-definite-genitive-singular":"efigiei","dative-genitive-indefinite-plural":"efigii","dative-definite-genitive-plural":"efigiilor","singular-vocative":"efigie","plural-vocative":"efigiilor"}},{"word":"efila","pos":"verb","definitions":["to taper"],"forms":{"canonical":"a efila 1st conjugation","present-singular-third-person":"efilează","participle-past":"efilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a efila","gerund":"efilând","first-person-indicative-present-singular":"efilez","indicative-present-second-person-singular":"efilezi","indicative-present-singular-third-person":"efilează","first-person-indicative-plural-present":"efilăm","indicative-plural-present-second-person":"efilați","indicative-plural-present-third-person":"efilează","first-person-imperfect-indicative-singular":"efilam","imperfect-indicative-second-person-singular":"efilai","imperfect-indicative-singular-third-person":"efila","first-person-imperfect-indicative-plural":"efilam","imperfect-indicative-plural-second-person":"efilați","imperfect-indicative-plural-third-person":"efilau","first-person-indicative-perfect-singular":"efilai","indicative-perfect-second-person-singular":"efilași","indicative-perfect-singular-third-person":"efilă","first-person-indicative-perfect-plural":"efilarăm","indicative-perfect-plural-second-person":"efilarăți","indicative-perfect-plural-third-person":"efilară","first-person-indicative-pluperfect-singular":"efilasem","indicative-pluperfect-second-person-singular":"efilaseși","indicative-pluperfect-singular-third-person":"efilase","first-person-indicative-pluperfect-plural":"efilaserăm","indicative-pluperfect-plural-second-person":"efilaserăți","indicative-pluperfect-plural-third-person":"efilaseră","first-person-present-singular-subjunctive":"să efilez","present-second-person-singular-subjunctive":"să efilezi","present-singular-subjunctive-third-person":"să efileze","first-person-plural-present-subjunctive":"să efilăm","plural-present-second-person-subjunctive":"să efilați","plural-present-subjunctive-third-person":"să efileze","imperative-second-person-singular":"efilează","imperative-plural-second-person":"efilați","imperative-negative-second-person-singular":"nu efila","imperative-negative-plural-second-person":"nu efilați"}},{"word":"efimerie","pos":"noun","definitions":["the order of the priests for the daily service in a temple"],"forms":{"plural":"efimerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"efimerie","accusative-definite-nominative-singular":"efimeria","accusative-indefinite-nominative-plural":"efimerii","accusative-definite-nominative-plural":"efimeriile","dative-genitive-indefinite-singular":"efimerii","dative-definite-genitive-singular":"efimeriei","dative-genitive-indefinite-plural":"efimerii","dative-definite-genitive-plural":"efimeriilor","singular-vocative":"efimerie","plural-vocative":"efimeriilor"}},{"word":"efir","pos":"noun","definitions":["ether"],"forms":{"plural":"efiruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"efir","accusative-definite-nominative-singular":"efirul","accusative-indefinite-nominative-plural":"efiruri","accusative-definite-nominative-plural":"efirurile","dative-genitive-indefinite-singular":"efir","dative-definite-genitive-singular":"efirului","dative-genitive-indefinite-plural":"efiruri","dative-definite-genitive-plural":"efirurilor","singular-vocative":"efirule","plural-vocative":"efirurilor"}},{"word":"efleuraj","pos":"noun","definitions":["effleurage"],"forms":{"plural":"efleuraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"efleuraj","accusative-definite-nominative-singular":"efleurajul","accusative-indefinite-nominative-plural":"efleuraje","accusative-definite-nominative-plural":"efleurajele","dative-genitive-indefinite-singular":"efleuraj","dative-definite-genitive-singular":"efleurajului","dative-genitive-indefinite-plural":"efleuraje","dative-definite-genitive-plural":"efleurajelor","singular-vocative":"efleurajule","plural-vocative":"efleurajelor"}},{"word":"eflorescent","pos":"adj","definitions":["efflorescent"],"forms":{"feminine-singular":"eflorescentă","masculine-plural":"eflorescenți","feminine-neuter-plural":"eflorescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eflorescent","error-unrecognized-form-feminine-indefinite-singular":"eflorescentă","error-unrecognized-form-indefinite-masculine-plural":"eflorescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eflorescente","definite-error-unrecognized-form-masculine-neuter-singular":"eflorescentul","definite-error-unrecognized-form-feminine-singular":"eflorescenta","definite-error-unrecognized-form-masculine-plural":"eflorescenții","definite-error-unrecognized-form-feminine-neuter-plural":"eflorescentele"}},{"word":"eflorescență","pos":"noun","definitions":["efflorescence"],"forms":{"plural":"eflorescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eflorescență","accusative-definite-nominative-singular":"eflorescența","accusative-indefinite-nominative-plural":"eflorescențe","accusative-definite-nominative-plural":"eflorescențele","dative-genitive-indefinite-singular":"eflorescențe","dative-definite-genitive-singular":"eflorescenței","dative-genitive-indefinite-plural":"eflorescențe","dative-definite-genitive-plural":"eflorescențelor","singular-vocative":"eflorescență","plural-vocative":"eflorescențelor"}},{"word":"eflorisment","pos":"noun","definitions":["efflorescence"],"forms":{"plural":"eflorismente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eflorisment","accusative-definite-nominative-singular":"eflorismentul","accusative-indefinite-nominative-plural":"eflorismente","accusative-definite-nominative-plural":"eflorismentele","dative-genitive-indefinite-singular":"eflorisment","dative-definite-genitive-singular":"eflorismentului","dative-genitive-indefinite-plural":"eflorismente","dative-definite-genitive-plural":"eflorismentelor","singular-vocative":"eflorismentule","plural-vocative":"eflorismentelor"}},{"word":"efluent","pos":"adj","definitions":["effluent"],"forms":{"feminine-singular":"efluentă","masculine-plural":"efluenți","feminine-neuter-plural":"efluente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efluent","error-unrecognized-form-feminine-indefinite-singular":"efluentă","error-unrecognized-form-indefinite-masculine-plural":"efluenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"efluente","definite-error-unrecognized-form-masculine-neuter-singular":"efluentul","definite-error-unrecognized-form-feminine-singular":"efluenta","definite-error-unrecognized-form-masculine-plural":"efluenții","definite-error-unrecognized-form-feminine-neuter-plural":"efluentele"}},{"word":"efluență","pos":"noun","definitions":["effluence"],"forms":{"plural":"efluențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"efluență","accusative-definite-nominative-singular":"efluența","accusative-indefinite-nominative-plural":"efluențe","accusative-definite-nominative-plural":"efluențele","dative-genitive-indefinite-singular":"efluențe","dative-definite-genitive-singular":"efluenței","dative-genitive-indefinite-plural":"efluențe","dative-definite-genitive-plural":"efluențelor","singular-vocative":"efluență","plural-vocative":"efluențelor"}},{"word":"efluviu","pos":"noun","definitions":["effluvium"],"forms":{"plural":"efluvii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"efluviu","accusative-definite-nominative-singular":"efluviul","accusative-indefinite-nominative-plural":"efluvii","accusative-definite-nominative-plural":"efluviile","dative-genitive-indefinite-singular":"efluviu","dative-definite-genitive-singular":"efluviului","dative-genitive-indefinite-plural":"efluvii","dative-definite-genitive-plural":"efluviilor","singular-vocative":"efluviule","plural-vocative":"efluviilor"}},{"word":"eflux","pos":"noun","definitions":["efflux"],"forms":{"plural":"efluxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eflux","accusative-definite-nominative-singular":"efluxul","accusative-indefinite-nominative-plural":"efluxuri","accusative-definite-nominative-plural":"efluxurile","dative-genitive-indefinite-singular":"eflux","dative-definite-genitive-singular":"efluxului","dative-genitive-indefinite-plural":"efluxuri","dative-definite-genitive-plural":"efluxurilor","singular-vocative":"efluxule","plural-vocative":"efluxurilor"}},{"word":"efod","pos":"noun","definitions":["ephod"],"forms":{"plural":"efoade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"efod","accusative-definite-nominative-singular":"efodul","accusative-indefinite-nominative-plural":"efoade","accusative-definite-nominative-plural":"efoadele","dative-genitive-indefinite-singular":"efod","dative-definite-genitive-singular":"efodului","dative-genitive-indefinite-plural":"efoade","dative-definite-genitive-plural":"efoadelor","singular-vocative":"efodule","plural-vocative":"efoadelor"}},{"word":"efor","pos":"noun","definitions":["ephor"],"forms":{"plural":"efori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"efor","accusative-definite-nominative-singular":"eforul","accusative-indefinite-nominative-plural":"efori","accusative-definite-nominative-plural":"eforii","dative-genitive-indefinite-singular":"efor","dative-definite-genitive-singular":"eforului","dative-genitive-indefinite-plural":"efori","dative-definite-genitive-plural":"eforilor","singular-vocative":"eforule","plural-vocative":"eforilor"}},{"word":"eforat","pos":"noun","definitions":["ephorate"],"forms":{"plural":"eforate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eforat","accusative-definite-nominative-singular":"eforatul","accusative-indefinite-nominative-plural":"eforate","accusative-definite-nominative-plural":"eforatele","dative-genitive-indefinite-singular":"eforat","dative-definite-genitive-singular":"eforatului","dative-genitive-indefinite-plural":"eforate","dative-definite-genitive-plural":"eforatelor","singular-vocative":"eforatule","plural-vocative":"eforatelor"}},{"word":"eforesc","pos":"adj","definitions":["ephoral"],"forms":{"feminine-singular":"eforească","plural":"eforești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eforesc","error-unrecognized-form-feminine-indefinite-singular":"eforească","error-unrecognized-form-indefinite-masculine-plural":"eforești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eforești","definite-error-unrecognized-form-masculine-neuter-singular":"eforescul","definite-error-unrecognized-form-feminine-singular":"eforeasca","definite-error-unrecognized-form-masculine-plural":"eforeștii","definite-error-unrecognized-form-feminine-neuter-plural":"eforeștile"}},{"word":"eforicesc","pos":"adj","definitions":["ephoral"],"forms":{"feminine-singular":"eforicească","plural":"eforicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eforicesc","error-unrecognized-form-feminine-indefinite-singular":"eforicească","error-unrecognized-form-indefinite-masculine-plural":"eforicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eforicești","definite-error-unrecognized-form-masculine-neuter-singular":"eforicescul","definite-error-unrecognized-form-feminine-singular":"eforiceasca","definite-error-unrecognized-form-masculine-plural":"eforiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"eforiceștile"}},{"word":"Eforie","pos":"name","definitions":["a town in Constanța County, Romania"],"gender":"m"},{"word":"eforie","pos":"noun","definitions":["public utility institution"],"forms":{"plural":"eforii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eforie","accusative-definite-nominative-singular":"eforia","accusative-indefinite-nominative-plural":"eforii","accusative-definite-nominative-plural":"eforiile","dative-genitive-indefinite-singular":"eforii","dative-definite-genitive-singular":"eforiei","dative-genitive-indefinite-plural":"eforii","dative-definite-genitive-plural":"eforiilor","singular-vocative":"eforie","plural-vocative":"eforiilor"}},{"word":"Eforie Nord","pos":"name","definitions":["a locality in Eforie, Constanța County, Romania"],"gender":"m"},{"word":"Eforie Sud","pos":"name","definitions":["a city in Constanța County, Romania"],"gender":"m"},{"word":"efort","pos":"noun","definitions":["effort"],"forms":{"plural":"eforturi"}},{"word":"efracție","pos":"noun","definitions":["intrusion"],"forms":{"plural":"efracții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"efracție","accusative-definite-nominative-singular":"efracția","accusative-indefinite-nominative-plural":"efracții","accusative-definite-nominative-plural":"efracțiile","dative-genitive-indefinite-singular":"efracții","dative-definite-genitive-singular":"efracției","dative-genitive-indefinite-plural":"efracții","dative-definite-genitive-plural":"efracțiilor","singular-vocative":"efracție","plural-vocative":"efracțiilor"}},{"word":"efracțiune","pos":"noun","definitions":["alternative form of efracție"],"forms":{"plural":"efracțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"efracțiune","accusative-definite-nominative-singular":"efracțiunea","accusative-indefinite-nominative-plural":"efracțiuni","accusative-definite-nominative-plural":"efracțiunile","dative-genitive-indefinite-singular":"efracțiuni","dative-definite-genitive-singular":"efracțiunii","dative-genitive-indefinite-plural":"efracțiuni","dative-definite-genitive-plural":"efracțiunilor","singular-vocative":"efracțiune","plural-vocative":"efracțiunilor"}},{"word":"efractoare","pos":"noun","definitions":["female equivalent of efractor"],"forms":{"plural":"efractoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"efractoare","accusative-definite-nominative-singular":"efractoarea","accusative-indefinite-nominative-plural":"efractoare","accusative-definite-nominative-plural":"efractoarele","dative-genitive-indefinite-singular":"efractoare","dative-definite-genitive-singular":"efractoarei","dative-genitive-indefinite-plural":"efractoare","dative-definite-genitive-plural":"efractoarelor","singular-vocative":"efractoare","plural-vocative":"efractoarelor"}},{"word":"efractor","pos":"noun","definitions":["intruder, burglar"],"forms":{"plural":"efractori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"efractor","accusative-definite-nominative-singular":"efractorul","accusative-indefinite-nominative-plural":"efractori","accusative-definite-nominative-plural":"efractorii","dative-genitive-indefinite-singular":"efractor","dative-definite-genitive-singular":"efractorului","dative-genitive-indefinite-plural":"efractori","dative-definite-genitive-plural":"efractorilor","singular-vocative":"efractorule","plural-vocative":"efractorilor"}},{"word":"efrenat","pos":"adj","definitions":["unrestrained, unruly"],"forms":{"feminine-singular":"efrenată","masculine-plural":"efrenați","feminine-neuter-plural":"efrenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efrenat","error-unrecognized-form-feminine-indefinite-singular":"efrenată","error-unrecognized-form-indefinite-masculine-plural":"efrenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"efrenate","definite-error-unrecognized-form-masculine-neuter-singular":"efrenatul","definite-error-unrecognized-form-feminine-singular":"efrenata","definite-error-unrecognized-form-masculine-plural":"efrenații","definite-error-unrecognized-form-feminine-neuter-plural":"efrenatele"}},{"word":"efroaiabil","pos":"adj","definitions":["horrific, horrifying, terrifying"],"forms":{"feminine-singular":"efroaiabilă","masculine-plural":"efroaiabili","feminine-neuter-plural":"efroaiabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efroaiabil","error-unrecognized-form-feminine-indefinite-singular":"efroaiabilă","error-unrecognized-form-indefinite-masculine-plural":"efroaiabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"efroaiabile","definite-error-unrecognized-form-masculine-neuter-singular":"efroaiabilul","definite-error-unrecognized-form-feminine-singular":"efroaiabila","definite-error-unrecognized-form-masculine-plural":"efroaiabilii","definite-error-unrecognized-form-feminine-neuter-plural":"efroaiabilele"}},{"word":"eftaxie","pos":"noun","definitions":["order"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eftaxie","accusative-definite-nominative":"eftaxia","dative-genitive-indefinite":"eftaxii","dative-definite-genitive":"eftaxiei","vocative":"eftaxie"}},{"word":"eftenșug","pos":"noun","definitions":["pity, compassion, mercy"],"forms":{"plural":"eftenșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eftenșug","accusative-definite-nominative-singular":"eftenșugul","accusative-indefinite-nominative-plural":"eftenșuguri","accusative-definite-nominative-plural":"eftenșugurile","dative-genitive-indefinite-singular":"eftenșug","dative-definite-genitive-singular":"eftenșugului","dative-genitive-indefinite-plural":"eftenșuguri","dative-definite-genitive-plural":"eftenșugurilor","singular-vocative":"eftenșugule","plural-vocative":"eftenșugurilor"}},{"word":"Eftimescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Eftimescu"}},{"word":"Eftimie Murgu","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Eftimie Murgu, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Eftimiu","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Eftimiu"}},{"word":"Eftimoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Eftimoiu"}},{"word":"eftinătate","pos":"noun","definitions":["obsolete form of ieftinătate"],"forms":{"plural":"eftinătăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eftinătate","accusative-definite-nominative-singular":"eftinătatea","accusative-indefinite-nominative-plural":"eftinătăți","accusative-definite-nominative-plural":"eftinătățile","dative-genitive-indefinite-singular":"eftinătăți","dative-definite-genitive-singular":"eftinătății","dative-genitive-indefinite-plural":"eftinătăți","dative-definite-genitive-plural":"eftinătăților","singular-vocative":"eftinătate","plural-vocative":"eftinătăților"}},{"word":"eftinie","pos":"noun","definitions":["pity, compassion, mercy"],"forms":{"plural":"eftinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eftinie","accusative-definite-nominative-singular":"eftinia","accusative-indefinite-nominative-plural":"eftinii","accusative-definite-nominative-plural":"eftiniile","dative-genitive-indefinite-singular":"eftinii","dative-definite-genitive-singular":"eftiniei","dative-genitive-indefinite-plural":"eftinii","dative-definite-genitive-plural":"eftiniilor","singular-vocative":"eftinie","plural-vocative":"eftiniilor"}},{"word":"efuzie","pos":"noun","definitions":["obsolete form of efuziune"],"forms":{"plural":"efuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"efuzie","accusative-definite-nominative-singular":"efuzia","accusative-indefinite-nominative-plural":"efuzii","accusative-definite-nominative-plural":"efuziile","dative-genitive-indefinite-singular":"efuzii","dative-definite-genitive-singular":"efuziei","dative-genitive-indefinite-plural":"efuzii","dative-definite-genitive-plural":"efuziilor","singular-vocative":"efuzie","plural-vocative":"efuziilor"}},{"word":"efuziometru","pos":"noun","definitions":["effusion meter"],"forms":{"plural":"efuziometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"efuziometru","accusative-definite-nominative-singular":"efuziometrul","accusative-indefinite-nominative-plural":"efuziometre","accusative-definite-nominative-plural":"efuziometrele","dative-genitive-indefinite-singular":"efuziometru","dative-definite-genitive-singular":"efuziometrului","dative-genitive-indefinite-plural":"efuziometre","dative-definite-genitive-plural":"efuziometrelor","singular-vocative":"efuziometrule","plural-vocative":"efuziometrelor"}},{"word":"efuziune","pos":"noun","definitions":["effusion"],"forms":{"plural":"efuziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"efuziune","accusative-definite-nominative-singular":"efuziunea","accusative-indefinite-nominative-plural":"efuziune","accusative-definite-nominative-plural":"efuziunele","dative-genitive-indefinite-singular":"efuziune","dative-definite-genitive-singular":"efuziunei","dative-genitive-indefinite-plural":"efuziune","dative-definite-genitive-plural":"efuziunelor","singular-vocative":"efuziune","plural-vocative":"efuziunelor"}},{"word":"efuziv","pos":"adj","definitions":["effusive"],"forms":{"feminine-singular":"efuzivă","masculine-plural":"efuzivi","feminine-neuter-plural":"efuzive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"efuziv","error-unrecognized-form-feminine-indefinite-singular":"efuzivă","error-unrecognized-form-indefinite-masculine-plural":"efuzivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"efuzive","definite-error-unrecognized-form-masculine-neuter-singular":"efuzivul","definite-error-unrecognized-form-feminine-singular":"efuziva","definite-error-unrecognized-form-masculine-plural":"efuzivii","definite-error-unrecognized-form-feminine-neuter-plural":"efuzivele"}},{"word":"egal","pos":"adj","definitions":["equal, even"],"pronunciation":"/eˈɡal/","forms":{"feminine-singular":"egală","masculine-plural":"egali","feminine-neuter-plural":"egale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"egal","error-unrecognized-form-feminine-indefinite-singular":"egală","error-unrecognized-form-indefinite-masculine-plural":"egali","error-unrecognized-form-feminine-indefinite-neuter-plural":"egale","definite-error-unrecognized-form-masculine-neuter-singular":"egalul","definite-error-unrecognized-form-feminine-singular":"egala","definite-error-unrecognized-form-masculine-plural":"egalii","definite-error-unrecognized-form-feminine-neuter-plural":"egalele"}},{"word":"egal","pos":"adv","definitions":["equally, evenly"],"pronunciation":"/eˈɡal/"},{"word":"egal","pos":"noun","definitions":["an equal, a match"],"pronunciation":"/eˈɡal/","forms":{"plural":"egali","feminine":"equivalent egală","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"egal","accusative-definite-nominative-singular":"egalul","accusative-indefinite-nominative-plural":"egali","accusative-definite-nominative-plural":"egalii","dative-genitive-indefinite-singular":"egal","dative-definite-genitive-singular":"egalului","dative-genitive-indefinite-plural":"egali","dative-definite-genitive-plural":"egalilor","singular-vocative":"egalule","plural-vocative":"egalilor"}},{"word":"egala","pos":"verb","definitions":["to equal"],"forms":{"canonical":"a egala 1st conjugation","present-singular-third-person":"egalează","participle-past":"egalat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a egala","gerund":"egalând","first-person-indicative-present-singular":"egalez","indicative-present-second-person-singular":"egalezi","indicative-present-singular-third-person":"egalează","first-person-indicative-plural-present":"egalăm","indicative-plural-present-second-person":"egalați","indicative-plural-present-third-person":"egalează","first-person-imperfect-indicative-singular":"egalam","imperfect-indicative-second-person-singular":"egalai","imperfect-indicative-singular-third-person":"egala","first-person-imperfect-indicative-plural":"egalam","imperfect-indicative-plural-second-person":"egalați","imperfect-indicative-plural-third-person":"egalau","first-person-indicative-perfect-singular":"egalai","indicative-perfect-second-person-singular":"egalași","indicative-perfect-singular-third-person":"egală","first-person-indicative-perfect-plural":"egalarăm","indicative-perfect-plural-second-person":"egalarăți","indicative-perfect-plural-third-person":"egalară","first-person-indicative-pluperfect-singular":"egalasem","indicative-pluperfect-second-person-singular":"egalaseși","indicative-pluperfect-singular-third-person":"egalase","first-person-indicative-pluperfect-plural":"egalaserăm","indicative-pluperfect-plural-second-person":"egalaserăți","indicative-pluperfect-plural-third-person":"egalaseră","first-person-present-singular-subjunctive":"să egalez","present-second-person-singular-subjunctive":"să egalezi","present-singular-subjunctive-third-person":"să egaleze","first-person-plural-present-subjunctive":"să egalăm","plural-present-second-person-subjunctive":"să egalați","plural-present-subjunctive-third-person":"să egaleze","imperative-second-person-singular":"egalează","imperative-plural-second-person":"egalați","imperative-negative-second-person-singular":"nu egala","imperative-negative-plural-second-person":"nu egalați"}},{"word":"egalabil","pos":"adj","definitions":["equatable"],"forms":{"feminine-singular":"egalabilă","masculine-plural":"egalabili","feminine-neuter-plural":"egalabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egalabil","error-unrecognized-form-feminine-indefinite-singular":"egalabilă","error-unrecognized-form-indefinite-masculine-plural":"egalabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"egalabile","definite-error-unrecognized-form-masculine-neuter-singular":"egalabilul","definite-error-unrecognized-form-feminine-singular":"egalabila","definite-error-unrecognized-form-masculine-plural":"egalabilii","definite-error-unrecognized-form-feminine-neuter-plural":"egalabilele"}},{"word":"egalare","pos":"noun","definitions":["equation"],"forms":{"plural":"egalări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egalare","accusative-definite-nominative-singular":"egalarea","accusative-indefinite-nominative-plural":"egalări","accusative-definite-nominative-plural":"egalările","dative-genitive-indefinite-singular":"egalări","dative-definite-genitive-singular":"egalării","dative-genitive-indefinite-plural":"egalări","dative-definite-genitive-plural":"egalărilor","singular-vocative":"egalare","plural-vocative":"egalărilor"}},{"word":"egalat","pos":"adj","definitions":["equaled"],"forms":{"feminine-singular":"egalată","masculine-plural":"egalați","feminine-neuter-plural":"egalate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egalat","error-unrecognized-form-feminine-indefinite-singular":"egalată","error-unrecognized-form-indefinite-masculine-plural":"egalați","error-unrecognized-form-feminine-indefinite-neuter-plural":"egalate","definite-error-unrecognized-form-masculine-neuter-singular":"egalatul","definite-error-unrecognized-form-feminine-singular":"egalata","definite-error-unrecognized-form-masculine-plural":"egalații","definite-error-unrecognized-form-feminine-neuter-plural":"egalatele"}},{"word":"egali","pos":"noun","definitions":["indefinite plural of egal"],"pronunciation":"[eˈɡalʲ]","gender":"m"},{"word":"egalitar","pos":"adj","definitions":["egalitarian"],"forms":{"feminine-singular":"egalitară","masculine-plural":"egalitari","feminine-neuter-plural":"egalitare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egalitar","error-unrecognized-form-feminine-indefinite-singular":"egalitară","error-unrecognized-form-indefinite-masculine-plural":"egalitari","error-unrecognized-form-feminine-indefinite-neuter-plural":"egalitare","definite-error-unrecognized-form-masculine-neuter-singular":"egalitarul","definite-error-unrecognized-form-feminine-singular":"egalitara","definite-error-unrecognized-form-masculine-plural":"egalitarii","definite-error-unrecognized-form-feminine-neuter-plural":"egalitarele"}},{"word":"egalitarism","pos":"noun","definitions":["egalitarianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"egalitarism","accusative-definite-nominative-singular":"egalitarismul","accusative-indefinite-nominative-plural":"egalitarisme","accusative-definite-nominative-plural":"egalitarismele","dative-genitive-indefinite-singular":"egalitarism","dative-definite-genitive-singular":"egalitarismului","dative-genitive-indefinite-plural":"egalitarisme","dative-definite-genitive-plural":"egalitarismelor","singular-vocative":"egalitarismule","plural-vocative":"egalitarismelor"}},{"word":"egalitarist","pos":"noun","definitions":["egalitarian"],"forms":{"plural":"egalitariști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"egalitarist","accusative-definite-nominative-singular":"egalitaristul","accusative-indefinite-nominative-plural":"egalitariști","accusative-definite-nominative-plural":"egalitariștii","dative-genitive-indefinite-singular":"egalitarist","dative-definite-genitive-singular":"egalitaristului","dative-genitive-indefinite-plural":"egalitariști","dative-definite-genitive-plural":"egalitariștilor","singular-vocative":"egalitaristule","plural-vocative":"egalitariștilor"}},{"word":"egalitaristă","pos":"noun","definitions":["female equivalent of egalitarist"],"forms":{"plural":"egalitariste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egalitaristă","accusative-definite-nominative-singular":"egalitarista","accusative-indefinite-nominative-plural":"egalitariste","accusative-definite-nominative-plural":"egalitaristele","dative-genitive-indefinite-singular":"egalitariste","dative-definite-genitive-singular":"egalitaristei","dative-genitive-indefinite-plural":"egalitariste","dative-definite-genitive-plural":"egalitaristelor","singular-vocative":"egalitaristă","plural-vocative":"egalitaristelor"}},{"word":"egalitate","pos":"noun","definitions":["equality"],"forms":{"plural":"egalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egalitate","accusative-definite-nominative-singular":"egalitatea","accusative-indefinite-nominative-plural":"egalități","accusative-definite-nominative-plural":"egalitățile","dative-genitive-indefinite-singular":"egalități","dative-definite-genitive-singular":"egalității","dative-genitive-indefinite-plural":"egalități","dative-definite-genitive-plural":"egalităților","singular-vocative":"egalitate","plural-vocative":"egalităților","alternative":"егалитате"}},{"word":"egaliza","pos":"verb","definitions":["to equalize"],"forms":{"canonical":"a egaliza 1st conjugation","present-singular-third-person":"egalizează","participle-past":"egalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a egaliza","gerund":"egalizând","first-person-indicative-present-singular":"egalizez","indicative-present-second-person-singular":"egalizezi","indicative-present-singular-third-person":"egalizează","first-person-indicative-plural-present":"egalizăm","indicative-plural-present-second-person":"egalizați","indicative-plural-present-third-person":"egalizează","first-person-imperfect-indicative-singular":"egalizam","imperfect-indicative-second-person-singular":"egalizai","imperfect-indicative-singular-third-person":"egaliza","first-person-imperfect-indicative-plural":"egalizam","imperfect-indicative-plural-second-person":"egalizați","imperfect-indicative-plural-third-person":"egalizau","first-person-indicative-perfect-singular":"egalizai","indicative-perfect-second-person-singular":"egalizași","indicative-perfect-singular-third-person":"egaliză","first-person-indicative-perfect-plural":"egalizarăm","indicative-perfect-plural-second-person":"egalizarăți","indicative-perfect-plural-third-person":"egalizară","first-person-indicative-pluperfect-singular":"egalizasem","indicative-pluperfect-second-person-singular":"egalizaseși","indicative-pluperfect-singular-third-person":"egalizase","first-person-indicative-pluperfect-plural":"egalizaserăm","indicative-pluperfect-plural-second-person":"egalizaserăți","indicative-pluperfect-plural-third-person":"egalizaseră","first-person-present-singular-subjunctive":"să egalizez","present-second-person-singular-subjunctive":"să egalizezi","present-singular-subjunctive-third-person":"să egalizeze","first-person-plural-present-subjunctive":"să egalizăm","plural-present-second-person-subjunctive":"să egalizați","plural-present-subjunctive-third-person":"să egalizeze","imperative-second-person-singular":"egalizează","imperative-plural-second-person":"egalizați","imperative-negative-second-person-singular":"nu egaliza","imperative-negative-plural-second-person":"nu egalizați"}},{"word":"egalizare","pos":"noun","definitions":["equalization"],"forms":{"plural":"egalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egalizare","accusative-definite-nominative-singular":"egalizarea","accusative-indefinite-nominative-plural":"egalizări","accusative-definite-nominative-plural":"egalizările","dative-genitive-indefinite-singular":"egalizări","dative-definite-genitive-singular":"egalizării","dative-genitive-indefinite-plural":"egalizări","dative-definite-genitive-plural":"egalizărilor","singular-vocative":"egalizare","plural-vocative":"egalizărilor"}},{"word":"egalizat","pos":"adj","definitions":["equaled"],"forms":{"feminine-singular":"egalizată","masculine-plural":"egalizați","feminine-neuter-plural":"egalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egalizat","error-unrecognized-form-feminine-indefinite-singular":"egalizată","error-unrecognized-form-indefinite-masculine-plural":"egalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"egalizate","definite-error-unrecognized-form-masculine-neuter-singular":"egalizatul","definite-error-unrecognized-form-feminine-singular":"egalizata","definite-error-unrecognized-form-masculine-plural":"egalizații","definite-error-unrecognized-form-feminine-neuter-plural":"egalizatele"}},{"word":"egalizat","pos":"verb","definitions":["past participle of egaliza"],"forms":{"participle-past":"of egaliza"}},{"word":"egalizator","pos":"noun","definitions":["leveling"],"forms":{"plural":"egalizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"egalizator","accusative-definite-nominative-singular":"egalizatorul","accusative-indefinite-nominative-plural":"egalizatori","accusative-definite-nominative-plural":"egalizatorile","dative-genitive-indefinite-singular":"egalizator","dative-definite-genitive-singular":"egalizatorului","dative-genitive-indefinite-plural":"egalizatori","dative-definite-genitive-plural":"egalizatorilor","singular-vocative":"egalizatorule","plural-vocative":"egalizatorilor"}},{"word":"egalizor","pos":"noun","definitions":["equalizer"],"forms":{"plural":"egalizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"egalizor","accusative-definite-nominative-singular":"egalizorul","accusative-indefinite-nominative-plural":"egalizoare","accusative-definite-nominative-plural":"egalizoarele","dative-genitive-indefinite-singular":"egalizor","dative-definite-genitive-singular":"egalizorului","dative-genitive-indefinite-plural":"egalizoare","dative-definite-genitive-plural":"egalizoarelor","singular-vocative":"egalizorule","plural-vocative":"egalizoarelor"}},{"word":"egeean","pos":"adj","definitions":["Aegean"],"forms":{"feminine-singular":"egeeană","masculine-plural":"egeeni","feminine-neuter-plural":"egeene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egeean","error-unrecognized-form-feminine-indefinite-singular":"egeeană","error-unrecognized-form-indefinite-masculine-plural":"egeeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"egeene","definite-error-unrecognized-form-masculine-neuter-singular":"egeeanul","definite-error-unrecognized-form-feminine-singular":"egeeana","definite-error-unrecognized-form-masculine-plural":"egeenii","definite-error-unrecognized-form-feminine-neuter-plural":"egeenele"}},{"word":"egerie","pos":"noun","definitions":["muse"],"forms":{"plural":"egerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"egerie","accusative-definite-nominative-singular":"egeria","accusative-indefinite-nominative-plural":"egerii","accusative-definite-nominative-plural":"egeriile","dative-genitive-indefinite-singular":"egerii","dative-definite-genitive-singular":"egeriei","dative-genitive-indefinite-plural":"egerii","dative-definite-genitive-plural":"egeriilor","singular-vocative":"egerie","plural-vocative":"egeriilor"}},{"word":"eghemon","pos":"noun","definitions":["obsolete form of hegemon"],"forms":{"plural":"eghemoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eghemon","accusative-definite-nominative-singular":"eghemonul","accusative-indefinite-nominative-plural":"eghemoni","accusative-definite-nominative-plural":"eghemonii","dative-genitive-indefinite-singular":"eghemon","dative-definite-genitive-singular":"eghemonului","dative-genitive-indefinite-plural":"eghemoni","dative-definite-genitive-plural":"eghemonilor","singular-vocative":"eghemonule","plural-vocative":"eghemonilor"}},{"word":"Eghersec","pos":"name","definitions":["a village in Ciucsângeorgiu, Harghita County, Romania"],"gender":"m"},{"word":"eghilet","pos":"noun","definitions":["aiglet"],"forms":{"plural":"eghileți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eghilet","accusative-definite-nominative-singular":"eghiletul","accusative-indefinite-nominative-plural":"eghileți","accusative-definite-nominative-plural":"eghileții","dative-genitive-indefinite-singular":"eghilet","dative-definite-genitive-singular":"eghiletului","dative-genitive-indefinite-plural":"eghileți","dative-definite-genitive-plural":"eghileților","singular-vocative":"eghiletule","plural-vocative":"eghileților"}},{"word":"eghiptean","pos":"adj","definitions":["obsolete form of egiptean"],"forms":{"feminine-singular":"eghipteană","masculine-plural":"eghipteni","feminine-neuter-plural":"eghiptene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eghiptean","error-unrecognized-form-feminine-indefinite-singular":"eghipteană","error-unrecognized-form-indefinite-masculine-plural":"eghipteni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eghiptene","definite-error-unrecognized-form-masculine-neuter-singular":"eghipteanul","definite-error-unrecognized-form-feminine-singular":"eghipteana","definite-error-unrecognized-form-masculine-plural":"eghiptenii","definite-error-unrecognized-form-feminine-neuter-plural":"eghiptenele"}},{"word":"eghiptic","pos":"adj","definitions":["Egyptian"],"forms":{"feminine-singular":"eghiptică","masculine-plural":"eghiptici","feminine-neuter-plural":"eghiptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eghiptic","error-unrecognized-form-feminine-indefinite-singular":"eghiptică","error-unrecognized-form-indefinite-masculine-plural":"eghiptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eghiptice","definite-error-unrecognized-form-masculine-neuter-singular":"eghipticul","definite-error-unrecognized-form-feminine-singular":"eghiptica","definite-error-unrecognized-form-masculine-plural":"eghipticii","definite-error-unrecognized-form-feminine-neuter-plural":"eghipticele"}},{"word":"egidă","pos":"noun","definitions":["aegis"],"forms":{"plural":"egide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egidă","accusative-definite-nominative-singular":"egida","accusative-indefinite-nominative-plural":"egide","accusative-definite-nominative-plural":"egidele","dative-genitive-indefinite-singular":"egide","dative-definite-genitive-singular":"egidei","dative-genitive-indefinite-plural":"egide","dative-definite-genitive-plural":"egidelor","singular-vocative":"egidă","plural-vocative":"egidelor"}},{"word":"Egipet","pos":"name","definitions":["Egypt"],"gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Egipet","accusative-definite-nominative":"Egipetul","dative-genitive-indefinite":"Egipet","dative-definite-genitive":"Egipetului","vocative":"Egipetule"}},{"word":"Egipt","pos":"name","definitions":["Egypt (a country in North Africa and West Asia)"],"pronunciation":"/eˈd͡ʒipt/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Egipt","accusative-definite-nominative":"Egiptul","dative-genitive-indefinite":"Egipt","dative-definite-genitive":"Egiptului","vocative":"Egiptule"}},{"word":"egiptean","pos":"adj","definitions":["Egyptian"],"forms":{"feminine-singular":"egipteană","masculine-plural":"egipteni","feminine-neuter-plural":"egiptene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egiptean","error-unrecognized-form-feminine-indefinite-singular":"egipteană","error-unrecognized-form-indefinite-masculine-plural":"egipteni","error-unrecognized-form-feminine-indefinite-neuter-plural":"egiptene","definite-error-unrecognized-form-masculine-neuter-singular":"egipteanul","definite-error-unrecognized-form-feminine-singular":"egipteana","definite-error-unrecognized-form-masculine-plural":"egiptenii","definite-error-unrecognized-form-feminine-neuter-plural":"egiptenele"}},{"word":"egiptean","pos":"noun","definitions":["Egyptian"],"forms":{"plural":"egipteni","feminine":"equivalent egipteană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"egiptean","accusative-definite-nominative-singular":"egipteanul","accusative-indefinite-nominative-plural":"egipteni","accusative-definite-nominative-plural":"egiptenii","dative-genitive-indefinite-singular":"egiptean","dative-definite-genitive-singular":"egipteanului","dative-genitive-indefinite-plural":"egipteni","dative-definite-genitive-plural":"egiptenilor","singular-vocative":"egipteanule","plural-vocative":"egiptenilor"}},{"word":"egipteană","pos":"noun","definitions":["female equivalent of egiptean"],"forms":{"plural":"egiptene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egipteană","accusative-definite-nominative-singular":"egipteana","accusative-indefinite-nominative-plural":"egiptene","accusative-definite-nominative-plural":"egiptenele","dative-genitive-indefinite-singular":"egiptene","dative-definite-genitive-singular":"egiptenei","dative-genitive-indefinite-plural":"egiptene","dative-definite-genitive-plural":"egiptenelor","singular-vocative":"egipteană","plural-vocative":"egiptenelor"}},{"word":"egipteancă","pos":"noun","definitions":["female equivalent of egiptean"],"forms":{"plural":"egiptence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egipteancă","accusative-definite-nominative-singular":"egipteanca","accusative-indefinite-nominative-plural":"egipteance","accusative-definite-nominative-plural":"egipteancele","dative-genitive-indefinite-singular":"egipteance","dative-definite-genitive-singular":"egipteancei","dative-genitive-indefinite-plural":"egipteance","dative-definite-genitive-plural":"egipteancelor","singular-vocative":"egipteancă","plural-vocative":"egipteancelor"}},{"word":"egiptenesc","pos":"adj","definitions":["Egyptian"],"forms":{"feminine-singular":"egiptenească","plural":"egiptenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egiptenesc","error-unrecognized-form-feminine-indefinite-singular":"egiptenească","error-unrecognized-form-indefinite-masculine-plural":"egiptenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"egiptenești","definite-error-unrecognized-form-masculine-neuter-singular":"egiptenescul","definite-error-unrecognized-form-feminine-singular":"egipteneasca","definite-error-unrecognized-form-masculine-plural":"egipteneștii","definite-error-unrecognized-form-feminine-neuter-plural":"egipteneștile"}},{"word":"egipțiac","pos":"adj","definitions":["Egyptian"],"forms":{"feminine-singular":"egipțiacă","masculine-plural":"egipțiaci","feminine-neuter-plural":"egipțiace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egipțiac","error-unrecognized-form-feminine-indefinite-singular":"egipțiacă","error-unrecognized-form-indefinite-masculine-plural":"egipțiaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"egipțiace","definite-error-unrecognized-form-masculine-neuter-singular":"egipțiacul","definite-error-unrecognized-form-feminine-singular":"egipțiaca","definite-error-unrecognized-form-masculine-plural":"egipțiacii","definite-error-unrecognized-form-feminine-neuter-plural":"egipțiacele"}},{"word":"egipțian","pos":"adj","definitions":["obsolete form of egiptean"],"forms":{"feminine-singular":"egipțiană","masculine-plural":"egipțieni","feminine-neuter-plural":"egipțiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egipțian","error-unrecognized-form-feminine-indefinite-singular":"egipțiană","error-unrecognized-form-indefinite-masculine-plural":"egipțieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"egipțiene","definite-error-unrecognized-form-masculine-neuter-singular":"egipțianul","definite-error-unrecognized-form-feminine-singular":"egipțiana","definite-error-unrecognized-form-masculine-plural":"egipțienii","definite-error-unrecognized-form-feminine-neuter-plural":"egipțienele"}},{"word":"egiptic","pos":"adj","definitions":["Egyptian"],"forms":{"feminine-singular":"egiptică","masculine-plural":"egiptici","feminine-neuter-plural":"egiptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egiptic","error-unrecognized-form-feminine-indefinite-singular":"egiptică","error-unrecognized-form-indefinite-masculine-plural":"egiptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"egiptice","definite-error-unrecognized-form-masculine-neuter-singular":"egipticul","definite-error-unrecognized-form-feminine-singular":"egiptica","definite-error-unrecognized-form-masculine-plural":"egipticii","definite-error-unrecognized-form-feminine-neuter-plural":"egipticele"}},{"word":"egiptolog","pos":"noun","definitions":["Egyptologist"],"forms":{"plural":"egiptologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"egiptolog","accusative-definite-nominative-singular":"egiptologul","accusative-indefinite-nominative-plural":"egiptologi","accusative-definite-nominative-plural":"egiptologii","dative-genitive-indefinite-singular":"egiptolog","dative-definite-genitive-singular":"egiptologului","dative-genitive-indefinite-plural":"egiptologi","dative-definite-genitive-plural":"egiptologilor","singular-vocative":"egiptologule","plural-vocative":"egiptologilor"}},{"word":"egiptologic","pos":"adj","definitions":["Egyptological"],"forms":{"feminine-singular":"egiptologică","masculine-plural":"egiptologici","feminine-neuter-plural":"egiptologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egiptologic","error-unrecognized-form-feminine-indefinite-singular":"egiptologică","error-unrecognized-form-indefinite-masculine-plural":"egiptologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"egiptologice","definite-error-unrecognized-form-masculine-neuter-singular":"egiptologicul","definite-error-unrecognized-form-feminine-singular":"egiptologica","definite-error-unrecognized-form-masculine-plural":"egiptologicii","definite-error-unrecognized-form-feminine-neuter-plural":"egiptologicele"}},{"word":"egiptologie","pos":"noun","definitions":["Egyptology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"egiptologie","accusative-definite-nominative-singular":"egiptologia","accusative-indefinite-nominative-plural":"egiptologii","accusative-definite-nominative-plural":"egiptologiile","dative-genitive-indefinite-singular":"egiptologii","dative-definite-genitive-singular":"egiptologiei","dative-genitive-indefinite-plural":"egiptologii","dative-definite-genitive-plural":"egiptologiilor","singular-vocative":"egiptologie","plural-vocative":"egiptologiilor"}},{"word":"eglantină","pos":"noun","definitions":["eglantine, dog rose"],"forms":{"plural":"eglantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eglantină","accusative-definite-nominative-singular":"eglantina","accusative-indefinite-nominative-plural":"eglantine","accusative-definite-nominative-plural":"eglantinele","dative-genitive-indefinite-singular":"eglantine","dative-definite-genitive-singular":"eglantinei","dative-genitive-indefinite-plural":"eglantine","dative-definite-genitive-plural":"eglantinelor","singular-vocative":"eglantină","plural-vocative":"eglantinelor"}},{"word":"eglendisitor","pos":"adj","definitions":["fun"],"forms":{"feminine-singular":"eglendisitoare","masculine-plural":"eglendisitori","feminine-neuter-plural":"eglendisitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eglendisitor","error-unrecognized-form-feminine-indefinite-singular":"eglendisitoare","error-unrecognized-form-indefinite-masculine-plural":"eglendisitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"eglendisitoare","definite-error-unrecognized-form-masculine-neuter-singular":"eglendisitorul","definite-error-unrecognized-form-feminine-singular":"eglendisitoarea","definite-error-unrecognized-form-masculine-plural":"eglendisitorii","definite-error-unrecognized-form-feminine-neuter-plural":"eglendisitoarele"}},{"word":"eglengea","pos":"noun","definitions":["party, amusement"],"forms":{"plural":"eglengele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"eglengea","accusative-definite-nominative-singular":"eglengeaua","accusative-indefinite-nominative-plural":"eglengele","accusative-definite-nominative-plural":"eglengelele","dative-genitive-indefinite-singular":"eglengele","dative-definite-genitive-singular":"eglengelei","dative-genitive-indefinite-plural":"eglengele","dative-definite-genitive-plural":"eglengelelor","singular-vocative":"eglengea","plural-vocative":"eglengelelor"}},{"word":"eglogă","pos":"noun","definitions":["eclogue"],"forms":{"plural":"egloge","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eglogă","accusative-definite-nominative-singular":"egloga","accusative-indefinite-nominative-plural":"egloge","accusative-definite-nominative-plural":"eglogele","dative-genitive-indefinite-singular":"egloge","dative-definite-genitive-singular":"eglogei","dative-genitive-indefinite-plural":"egloge","dative-definite-genitive-plural":"eglogelor","singular-vocative":"eglogă","plural-vocative":"eglogelor"}},{"word":"egocentric","pos":"adj","definitions":["self-centered"],"forms":{"feminine-singular":"egocentrică","masculine-plural":"egocentrici","feminine-neuter-plural":"egocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egocentric","error-unrecognized-form-feminine-indefinite-singular":"egocentrică","error-unrecognized-form-indefinite-masculine-plural":"egocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"egocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"egocentricul","definite-error-unrecognized-form-feminine-singular":"egocentrica","definite-error-unrecognized-form-masculine-plural":"egocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"egocentricele"}},{"word":"egocentricitate","pos":"noun","definitions":["egocentricity"],"forms":{"plural":"egocentricitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egocentricitate","accusative-definite-nominative-singular":"egocentricitatea","accusative-indefinite-nominative-plural":"egocentricitatăți","accusative-definite-nominative-plural":"egocentricitatățile","dative-genitive-indefinite-singular":"egocentricitatăți","dative-definite-genitive-singular":"egocentricitatății","dative-genitive-indefinite-plural":"egocentricitatăți","dative-definite-genitive-plural":"egocentricitatăților","singular-vocative":"egocentricitate","plural-vocative":"egocentricitatăților"}},{"word":"egocentrism","pos":"noun","definitions":["egocentrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"egocentrism","accusative-definite-nominative":"egocentrismul","dative-genitive-indefinite":"egocentrism","dative-definite-genitive":"egocentrismului","vocative":"egocentrismule"}},{"word":"egoism","pos":"noun","definitions":["egoism, selfishness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"egoism","accusative-definite-nominative":"egoismul","dative-genitive-indefinite":"egoism","dative-definite-genitive":"egoismului","vocative":"egoismule"}},{"word":"egoist","pos":"adj","definitions":["selfish"],"forms":{"feminine-singular":"egoistă","masculine-plural":"egoiști","feminine-neuter-plural":"egoiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egoist","error-unrecognized-form-feminine-indefinite-singular":"egoistă","error-unrecognized-form-indefinite-masculine-plural":"egoiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"egoiste","definite-error-unrecognized-form-masculine-neuter-singular":"egoistul","definite-error-unrecognized-form-feminine-singular":"egoista","definite-error-unrecognized-form-masculine-plural":"egoiștii","definite-error-unrecognized-form-feminine-neuter-plural":"egoistele"}},{"word":"egoistic","pos":"adj","definitions":["egoistical"],"forms":{"feminine-singular":"egoistică","masculine-plural":"egoistici","feminine-neuter-plural":"egoistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egoistic","error-unrecognized-form-feminine-indefinite-singular":"egoistică","error-unrecognized-form-indefinite-masculine-plural":"egoistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"egoistice","definite-error-unrecognized-form-masculine-neuter-singular":"egoisticul","definite-error-unrecognized-form-feminine-singular":"egoistica","definite-error-unrecognized-form-masculine-plural":"egoisticii","definite-error-unrecognized-form-feminine-neuter-plural":"egoisticele"}},{"word":"egolatrie","pos":"noun","definitions":["autolatry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"egolatrie","accusative-definite-nominative":"egolatria","dative-genitive-indefinite":"egolatrii","dative-definite-genitive":"egolatriei","vocative":"egolatrie"}},{"word":"egolatru","pos":"adj","definitions":["egolatrous"],"forms":{"feminine-singular":"egolatră","masculine-plural":"egolatri","feminine-neuter-plural":"egolatre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egolatru","error-unrecognized-form-feminine-indefinite-singular":"egolatră","error-unrecognized-form-indefinite-masculine-plural":"egolatri","error-unrecognized-form-feminine-indefinite-neuter-plural":"egolatre","definite-error-unrecognized-form-masculine-neuter-singular":"egolatrul","definite-error-unrecognized-form-feminine-singular":"egolatra","definite-error-unrecognized-form-masculine-plural":"egolatrii","definite-error-unrecognized-form-feminine-neuter-plural":"egolatrele"}},{"word":"egomism","pos":"noun","definitions":["selfishness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"egomism","accusative-definite-nominative":"egomismul","dative-genitive-indefinite":"egomism","dative-definite-genitive":"egomismului","vocative":"egomismule"}},{"word":"Egoreni","pos":"name","definitions":["a village in Egoreni, Soroca Raion, Moldova","a commune of Soroca Raion, Moldova"],"gender":"m"},{"word":"Egorovca","pos":"name","definitions":["a village in Egorovca, Fălești Raion, Moldova","a commune of Fălești Raion, Moldova"],"gender":"f"},{"word":"egotism","pos":"noun","definitions":["egotism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"egotism","accusative-definite-nominative":"egotismul","dative-genitive-indefinite":"egotism","dative-definite-genitive":"egotismului","vocative":"egotismule"}},{"word":"egotist","pos":"adj","definitions":["egotistical"],"forms":{"feminine-singular":"egotistă","masculine-plural":"egotiști","feminine-neuter-plural":"egotiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egotist","error-unrecognized-form-feminine-indefinite-singular":"egotistă","error-unrecognized-form-indefinite-masculine-plural":"egotiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"egotiste","definite-error-unrecognized-form-masculine-neuter-singular":"egotistul","definite-error-unrecognized-form-feminine-singular":"egotista","definite-error-unrecognized-form-masculine-plural":"egotiștii","definite-error-unrecognized-form-feminine-neuter-plural":"egotistele"}},{"word":"egregie","pos":"adj","definitions":["nominative/accusative feminine singular of egregiu"]},{"word":"egregii","pos":"adj","definitions":["nominative/accusative masculine plural of egregiu"]},{"word":"egregiu","pos":"adj","definitions":["distinct"],"forms":{"feminine-singular":"egregie","plural":"egregii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egregiu","error-unrecognized-form-feminine-indefinite-singular":"egregie","error-unrecognized-form-indefinite-masculine-plural":"egregii","error-unrecognized-form-feminine-indefinite-neuter-plural":"egregii","definite-error-unrecognized-form-masculine-neuter-singular":"egregiul","definite-error-unrecognized-form-feminine-singular":"egregia","definite-error-unrecognized-form-masculine-plural":"egregiii","definite-error-unrecognized-form-feminine-neuter-plural":"egregiile"}},{"word":"egrena","pos":"verb","definitions":["to gin (cotton)"],"forms":{"canonical":"a egrena 1st conjugation","present-singular-third-person":"egrenează","participle-past":"egrenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a egrena","gerund":"egrenând","first-person-indicative-present-singular":"egrenez","indicative-present-second-person-singular":"egrenezi","indicative-present-singular-third-person":"egrenează","first-person-indicative-plural-present":"egrenăm","indicative-plural-present-second-person":"egrenați","indicative-plural-present-third-person":"egrenează","first-person-imperfect-indicative-singular":"egrenam","imperfect-indicative-second-person-singular":"egrenai","imperfect-indicative-singular-third-person":"egrena","first-person-imperfect-indicative-plural":"egrenam","imperfect-indicative-plural-second-person":"egrenați","imperfect-indicative-plural-third-person":"egrenau","first-person-indicative-perfect-singular":"egrenai","indicative-perfect-second-person-singular":"egrenași","indicative-perfect-singular-third-person":"egrenă","first-person-indicative-perfect-plural":"egrenarăm","indicative-perfect-plural-second-person":"egrenarăți","indicative-perfect-plural-third-person":"egrenară","first-person-indicative-pluperfect-singular":"egrenasem","indicative-pluperfect-second-person-singular":"egrenaseși","indicative-pluperfect-singular-third-person":"egrenase","first-person-indicative-pluperfect-plural":"egrenaserăm","indicative-pluperfect-plural-second-person":"egrenaserăți","indicative-pluperfect-plural-third-person":"egrenaseră","first-person-present-singular-subjunctive":"să egrenez","present-second-person-singular-subjunctive":"să egrenezi","present-singular-subjunctive-third-person":"să egreneze","first-person-plural-present-subjunctive":"să egrenăm","plural-present-second-person-subjunctive":"să egrenați","plural-present-subjunctive-third-person":"să egreneze","imperative-second-person-singular":"egrenează","imperative-plural-second-person":"egrenați","imperative-negative-second-person-singular":"nu egrena","imperative-negative-plural-second-person":"nu egrenați"}},{"word":"egresiune","pos":"noun","definitions":["egression"],"forms":{"plural":"egresiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egresiune","accusative-definite-nominative-singular":"egresiunea","accusative-indefinite-nominative-plural":"egresiuni","accusative-definite-nominative-plural":"egresiunile","dative-genitive-indefinite-singular":"egresiuni","dative-definite-genitive-singular":"egresiunii","dative-genitive-indefinite-plural":"egresiuni","dative-definite-genitive-plural":"egresiunilor","singular-vocative":"egresiune","plural-vocative":"egresiunilor"}},{"word":"Egreșu","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Homorodul Mare"],"gender":"m"},{"word":"egretă","pos":"noun","definitions":["egret"],"forms":{"plural":"egrete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egretă","accusative-definite-nominative-singular":"egreta","accusative-indefinite-nominative-plural":"egrete","accusative-definite-nominative-plural":"egretele","dative-genitive-indefinite-singular":"egrete","dative-definite-genitive-singular":"egretei","dative-genitive-indefinite-plural":"egrete","dative-definite-genitive-plural":"egretelor","singular-vocative":"egretă","plural-vocative":"egretelor"}},{"word":"egretă mare","pos":"noun","definitions":["great egret (Ardea alba)"],"forms":{"plural":"egrete mari"}},{"word":"egretă mică","pos":"noun","definitions":["little egret (Egretta garzetta)"],"forms":{"plural":"egrete mici"}},{"word":"egritudine","pos":"noun","definitions":["grief"],"forms":{"plural":"egritudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"egritudine","accusative-definite-nominative-singular":"egritudinea","accusative-indefinite-nominative-plural":"egritudini","accusative-definite-nominative-plural":"egritudinile","dative-genitive-indefinite-singular":"egritudini","dative-definite-genitive-singular":"egritudinii","dative-genitive-indefinite-plural":"egritudini","dative-definite-genitive-plural":"egritudinilor","singular-vocative":"egritudine","plural-vocative":"egritudinilor"}},{"word":"egu","pos":"noun","definitions":["underground sewer"],"forms":{"plural":"eguuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"egu","accusative-definite-nominative-singular":"eguul","accusative-indefinite-nominative-plural":"eguuri","accusative-definite-nominative-plural":"eguurile","dative-genitive-indefinite-singular":"egu","dative-definite-genitive-singular":"eguului","dative-genitive-indefinite-plural":"eguuri","dative-definite-genitive-plural":"eguurilor","singular-vocative":"eguule","plural-vocative":"eguurilor"}},{"word":"egumen","pos":"noun","definitions":["abbot"],"forms":{"plural":"egumeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"egumen","accusative-definite-nominative-singular":"egumenul","accusative-indefinite-nominative-plural":"egumeni","accusative-definite-nominative-plural":"egumenii","dative-genitive-indefinite-singular":"egumen","dative-definite-genitive-singular":"egumenului","dative-genitive-indefinite-plural":"egumeni","dative-definite-genitive-plural":"egumenilor","singular-vocative":"egumenule","plural-vocative":"egumenilor"}},{"word":"egumenă","pos":"noun","definitions":["female equivalent of egumen"],"forms":{"plural":"egumene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egumenă","accusative-definite-nominative-singular":"egumena","accusative-indefinite-nominative-plural":"egumene","accusative-definite-nominative-plural":"egumenele","dative-genitive-indefinite-singular":"egumene","dative-definite-genitive-singular":"egumenei","dative-genitive-indefinite-plural":"egumene","dative-definite-genitive-plural":"egumenelor","singular-vocative":"egumenă","plural-vocative":"egumenelor"}},{"word":"egumeneasă","pos":"noun","definitions":["abbess"],"forms":{"plural":"egumenese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egumeneasă","accusative-definite-nominative-singular":"egumeneasa","accusative-indefinite-nominative-plural":"egumenese","accusative-definite-nominative-plural":"egumenesele","dative-genitive-indefinite-singular":"egumenese","dative-definite-genitive-singular":"egumenesei","dative-genitive-indefinite-plural":"egumenese","dative-definite-genitive-plural":"egumeneselor","singular-vocative":"egumeneasă","plural-vocative":"egumeneselor"}},{"word":"egumenesc","pos":"adj","definitions":["abbot's"],"forms":{"feminine-singular":"egumenească","plural":"egumenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"egumenesc","error-unrecognized-form-feminine-indefinite-singular":"egumenească","error-unrecognized-form-indefinite-masculine-plural":"egumenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"egumenești","definite-error-unrecognized-form-masculine-neuter-singular":"egumenescul","definite-error-unrecognized-form-feminine-singular":"egumeneasca","definite-error-unrecognized-form-masculine-plural":"egumeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"egumeneștile"}},{"word":"egumenie","pos":"noun","definitions":["abbotship"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"egumenie","accusative-definite-nominative":"egumenia","dative-genitive-indefinite":"egumenii","dative-definite-genitive":"egumeniei","vocative":"egumenie"}},{"word":"egumeniță","pos":"noun","definitions":["female equivalent of egumen"],"forms":{"plural":"egumenițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"egumeniță","accusative-definite-nominative-singular":"egumenița","accusative-indefinite-nominative-plural":"egumenițe","accusative-definite-nominative-plural":"egumenițele","dative-genitive-indefinite-singular":"egumenițe","dative-definite-genitive-singular":"egumeniței","dative-genitive-indefinite-plural":"egumenițe","dative-definite-genitive-plural":"egumenițelor","singular-vocative":"egumeniță","plural-vocative":"egumenițelor"}},{"word":"egutaj","pos":"noun","definitions":["draining"],"forms":{"plural":"egutaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"egutaj","accusative-definite-nominative-singular":"egutajul","accusative-indefinite-nominative-plural":"egutaje","accusative-definite-nominative-plural":"egutajele","dative-genitive-indefinite-singular":"egutaj","dative-definite-genitive-singular":"egutajului","dative-genitive-indefinite-plural":"egutaje","dative-definite-genitive-plural":"egutajelor","singular-vocative":"egutajule","plural-vocative":"egutajelor"}},{"word":"eh","pos":"intj","definitions":["expresses dissatisfaction or sadness"]},{"word":"ehe","pos":"intj","definitions":["alternative form of ehei"]},{"word":"ehehei","pos":"intj","definitions":["alternative form of ehei"]},{"word":"ehli-islam","pos":"noun","definitions":["Muslim"],"forms":{"plural":"ehlí-islámi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ehli-islam","accusative-definite-nominative-singular":"ehli-islamul","accusative-indefinite-nominative-plural":"ehlí-islámi","accusative-definite-nominative-plural":"ehlí-islámii","dative-genitive-indefinite-singular":"ehli-islam","dative-definite-genitive-singular":"ehli-islamului","dative-genitive-indefinite-plural":"ehlí-islámi","dative-definite-genitive-plural":"ehlí-islámilor","singular-vocative":"ehli-islamule","plural-vocative":"ehlí-islámilor"}},{"word":"ehlierz","pos":"adj","definitions":["honest"],"forms":{"feminine-singular":"ehlierză","masculine-plural":"ehlierzi","feminine-neuter-plural":"ehlierze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ehlierz","error-unrecognized-form-feminine-indefinite-singular":"ehlierză","error-unrecognized-form-indefinite-masculine-plural":"ehlierzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ehlierze","definite-error-unrecognized-form-masculine-neuter-singular":"ehlierzul","definite-error-unrecognized-form-feminine-singular":"ehlierza","definite-error-unrecognized-form-masculine-plural":"ehlierzii","definite-error-unrecognized-form-feminine-neuter-plural":"ehlierzele"}},{"word":"eho","pos":"noun","definitions":["obsolete form of ecou"],"forms":{"plural":"ehouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eho","accusative-definite-nominative-singular":"ehoul","accusative-indefinite-nominative-plural":"ehouri","accusative-definite-nominative-plural":"ehourile","dative-genitive-indefinite-singular":"eho","dative-definite-genitive-singular":"ehoului","dative-genitive-indefinite-plural":"ehouri","dative-definite-genitive-plural":"ehourilor","singular-vocative":"ehoule","plural-vocative":"ehourilor"}},{"word":"Ehrește","pos":"name","definitions":["a village in Brodina, Suceava County, Romania"],"gender":"m"},{"word":"ei","pos":"pron","definitions":["they (used for an all-male or mixed-sex group)"],"pronunciation":"/ˈjej/","gender":"m-p","forms":{"feminine":"equivalent ele","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"ei","accusative-stressed":"ei","accusative-error-unrecognized-form":"îi","dative-stressed":"lor","dative-error-unrecognized-form":"le","genitive":"lor","masculine-possessive-singular":"lor","masculine-plural-possessive":"lor","neuter-possessive-singular":"lor","neuter-plural-possessive":"lor","feminine-possessive-singular":"lor","feminine-plural-possessive":"lor","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sieși","dative-error-unrecognized-form-possessive":"își"}},{"word":"ei","pos":"pron","definitions":["them (all-male or mixed-sex group)"],"pronunciation":"/ˈjej/","gender":"m"},{"word":"ei","pos":"pron","definitions":["her"],"pronunciation":"/ˈjej/","gender":"f","examples":[{"ro":"Ai cartea ei?","en":"Do you have her book?"}],"forms":{"masculine":"equivalent lui","plural":"lor"}},{"word":"ei","pos":"pron","definitions":["to her"],"pronunciation":"/ˈjej/","gender":"f","forms":{"masculine":"equivalent lui","plural":"lor"}},{"word":"eialet","pos":"noun","definitions":["eyalet"],"forms":{"plural":"eialete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eialet","accusative-definite-nominative":"eialetul","dative-genitive-indefinite":"eialet","dative-definite-genitive":"eialetului","vocative":"eialetule"}},{"word":"Eibenthal","pos":"name","definitions":["a village in Dubova, Mehedinți County, Romania"],"gender":"m"},{"word":"eider","pos":"noun","definitions":["eider"],"forms":{"plural":"eideri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eider","accusative-definite-nominative-singular":"eiderul","accusative-indefinite-nominative-plural":"eideri","accusative-definite-nominative-plural":"eiderii","dative-genitive-indefinite-singular":"eider","dative-definite-genitive-singular":"eiderului","dative-genitive-indefinite-plural":"eideri","dative-definite-genitive-plural":"eiderilor","singular-vocative":"eiderule","plural-vocative":"eiderilor"}},{"word":"eideri","pos":"noun","definitions":["plural of eider"],"gender":"m"},{"word":"eidetic","pos":"adj","definitions":["eidetic"],"forms":{"feminine-singular":"eidetică","masculine-plural":"eidetici","feminine-neuter-plural":"eidetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eidetic","error-unrecognized-form-feminine-indefinite-singular":"eidetică","error-unrecognized-form-indefinite-masculine-plural":"eidetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eidetice","definite-error-unrecognized-form-masculine-neuter-singular":"eideticul","definite-error-unrecognized-form-feminine-singular":"eidetica","definite-error-unrecognized-form-masculine-plural":"eideticii","definite-error-unrecognized-form-feminine-neuter-plural":"eideticele"}},{"word":"eidetism","pos":"noun","definitions":["eidetism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eidetism","accusative-definite-nominative-singular":"eidetismul","accusative-indefinite-nominative-plural":"eidetisme","accusative-definite-nominative-plural":"eidetismele","dative-genitive-indefinite-singular":"eidetism","dative-definite-genitive-singular":"eidetismului","dative-genitive-indefinite-plural":"eidetisme","dative-definite-genitive-plural":"eidetismelor","singular-vocative":"eidetismule","plural-vocative":"eidetismelor"}},{"word":"eifelian","pos":"adj","definitions":["Eifelian"],"forms":{"feminine-singular":"eifeliană","masculine-plural":"eifelieni","feminine-neuter-plural":"eifeliene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eifelian","error-unrecognized-form-feminine-indefinite-singular":"eifeliană","error-unrecognized-form-indefinite-masculine-plural":"eifelieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eifeliene","definite-error-unrecognized-form-masculine-neuter-singular":"eifelianul","definite-error-unrecognized-form-feminine-singular":"eifeliana","definite-error-unrecognized-form-masculine-plural":"eifelienii","definite-error-unrecognized-form-feminine-neuter-plural":"eifelienele"}},{"word":"eifelian","pos":"noun","definitions":["Eifelian"],"forms":{"plural":"eifeliani","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eifelian","accusative-definite-nominative-singular":"eifelianul","accusative-indefinite-nominative-plural":"eifeliani","accusative-definite-nominative-plural":"eifelianile","dative-genitive-indefinite-singular":"eifelian","dative-definite-genitive-singular":"eifelianului","dative-genitive-indefinite-plural":"eifeliani","dative-definite-genitive-plural":"eifelianilor","singular-vocative":"eifelianule","plural-vocative":"eifelianilor"}},{"word":"einsteiniu","pos":"noun","definitions":["einsteinium (element with atomic number 99)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"einsteiniu","accusative-definite-nominative":"einsteiniul","dative-genitive-indefinite":"einsteiniu","dative-definite-genitive":"einsteiniului","vocative":"einsteiniule"}},{"word":"ejacula","pos":"verb","definitions":["to ejaculate"],"pronunciation":"[e.ʒa.kuˈla]","forms":{"canonical":"a ejacula 1st conjugation","present-singular-third-person":"ejaculează","participle-past":"ejaculat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ejacula","gerund":"ejaculând","first-person-indicative-present-singular":"ejaculez","indicative-present-second-person-singular":"ejaculezi","indicative-present-singular-third-person":"ejaculează","first-person-indicative-plural-present":"ejaculăm","indicative-plural-present-second-person":"ejaculați","indicative-plural-present-third-person":"ejaculează","first-person-imperfect-indicative-singular":"ejaculam","imperfect-indicative-second-person-singular":"ejaculai","imperfect-indicative-singular-third-person":"ejacula","first-person-imperfect-indicative-plural":"ejaculam","imperfect-indicative-plural-second-person":"ejaculați","imperfect-indicative-plural-third-person":"ejaculau","first-person-indicative-perfect-singular":"ejaculai","indicative-perfect-second-person-singular":"ejaculași","indicative-perfect-singular-third-person":"ejaculă","first-person-indicative-perfect-plural":"ejacularăm","indicative-perfect-plural-second-person":"ejacularăți","indicative-perfect-plural-third-person":"ejaculară","first-person-indicative-pluperfect-singular":"ejaculasem","indicative-pluperfect-second-person-singular":"ejaculaseși","indicative-pluperfect-singular-third-person":"ejaculase","first-person-indicative-pluperfect-plural":"ejaculaserăm","indicative-pluperfect-plural-second-person":"ejaculaserăți","indicative-pluperfect-plural-third-person":"ejaculaseră","first-person-present-singular-subjunctive":"să ejaculez","present-second-person-singular-subjunctive":"să ejaculezi","present-singular-subjunctive-third-person":"să ejaculeze","first-person-plural-present-subjunctive":"să ejaculăm","plural-present-second-person-subjunctive":"să ejaculați","plural-present-subjunctive-third-person":"să ejaculeze","imperative-second-person-singular":"ejaculează","imperative-plural-second-person":"ejaculați","imperative-negative-second-person-singular":"nu ejacula","imperative-negative-plural-second-person":"nu ejaculați"}},{"word":"ejaculă","pos":"verb","definitions":["third-person singular simple perfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlə]"},{"word":"ejaculai","pos":"verb","definitions":["inflection of ejacula:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[e.ʒa.kuˈlaj]"},{"word":"ejaculam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlam]"},{"word":"ejaculăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of ejacula"],"pronunciation":"[e.ʒa.kuˈləm]"},{"word":"ejaculând","pos":"verb","definitions":["gerund of ejacula (“to ejaculate”)"],"pronunciation":"/e.ʒa.kuˈlɨnd/","forms":{"alternative":"ejaculînd"}},{"word":"ejaculară","pos":"verb","definitions":["third-person plural simple perfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlarə]"},{"word":"ejacularăm","pos":"verb","definitions":["first-person plural simple perfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlarəm]"},{"word":"ejacularăți","pos":"verb","definitions":["second-person plural simple perfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlarətsʲ]"},{"word":"ejaculare","pos":"noun","definitions":["ejaculation"],"pronunciation":"[e.ʒa.kuˈla.re]","forms":{"plural":"ejaculări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ejaculare","accusative-definite-nominative-singular":"ejacularea","accusative-indefinite-nominative-plural":"ejaculări","accusative-definite-nominative-plural":"ejaculările","dative-genitive-indefinite-singular":"ejaculări","dative-definite-genitive-singular":"ejaculării","dative-genitive-indefinite-plural":"ejaculări","dative-definite-genitive-plural":"ejaculărilor","singular-vocative":"ejaculare","plural-vocative":"ejaculărilor"}},{"word":"ejaculase","pos":"verb","definitions":["third-person singular pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlase]"},{"word":"ejaculasem","pos":"verb","definitions":["first-person singular pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlasem]"},{"word":"ejaculaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaserə]"},{"word":"ejaculaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaserəm]"},{"word":"ejaculaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaserətsʲ]"},{"word":"ejaculaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaseʃʲ]"},{"word":"ejaculași","pos":"verb","definitions":["second-person singular simple perfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaʃʲ]"},{"word":"ejaculat","pos":"noun","definitions":["ejaculation"],"pronunciation":"[e.ʒa.kuˈlat]","forms":{"plural":"ejaculaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ejaculat","accusative-definite-nominative-singular":"ejaculatul","accusative-indefinite-nominative-plural":"ejaculaturi","accusative-definite-nominative-plural":"ejaculaturile","dative-genitive-indefinite-singular":"ejaculat","dative-definite-genitive-singular":"ejaculatului","dative-genitive-indefinite-plural":"ejaculaturi","dative-definite-genitive-plural":"ejaculaturilor","singular-vocative":"ejaculatule","plural-vocative":"ejaculaturilor"}},{"word":"ejaculați","pos":"adj","definitions":["masculine plural of ejaculat"],"pronunciation":"[e.ʒa.kuˈlat͡sʲ]","gender":"m-p"},{"word":"ejaculați","pos":"verb","definitions":["inflection of ejacula:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[e.ʒa.kuˈlat͡sʲ]"},{"word":"ejaculație","pos":"noun","definitions":["ejaculate (semen ejected during ejaculation)","ejaculation"],"pronunciation":"[e.ʒa.kuˈla.t͡si.e]","forms":{"plural":"ejaculații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ejaculație","accusative-definite-nominative-singular":"ejaculația","accusative-indefinite-nominative-plural":"ejaculații","accusative-definite-nominative-plural":"ejaculațiile","dative-genitive-indefinite-singular":"ejaculații","dative-definite-genitive-singular":"ejaculației","dative-genitive-indefinite-plural":"ejaculații","dative-definite-genitive-plural":"ejaculațiilor","singular-vocative":"ejaculație","plural-vocative":"ejaculațiilor"}},{"word":"ejaculațiune","pos":"noun","definitions":["obsolete form of ejaculație"],"forms":{"plural":"ejaculațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ejaculațiune","accusative-definite-nominative-singular":"ejaculațiunea","accusative-indefinite-nominative-plural":"ejaculațiuni","accusative-definite-nominative-plural":"ejaculațiunile","dative-genitive-indefinite-singular":"ejaculațiuni","dative-definite-genitive-singular":"ejaculațiunii","dative-genitive-indefinite-plural":"ejaculațiuni","dative-definite-genitive-plural":"ejaculațiunilor","singular-vocative":"ejaculațiune","plural-vocative":"ejaculațiunilor"}},{"word":"ejaculator","pos":"adj","definitions":["ejaculatory"],"pronunciation":"[eˌʒa.ku.laˈtor]","forms":{"feminine-singular":"ejaculatoare","masculine-plural":"ejaculatori","feminine-neuter-plural":"ejaculatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ejaculator","error-unrecognized-form-feminine-indefinite-singular":"ejaculatoare","error-unrecognized-form-indefinite-masculine-plural":"ejaculatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"ejaculatoare","definite-error-unrecognized-form-masculine-neuter-singular":"ejaculatorul","definite-error-unrecognized-form-feminine-singular":"ejaculatoarea","definite-error-unrecognized-form-masculine-plural":"ejaculatorii","definite-error-unrecognized-form-feminine-neuter-plural":"ejaculatoarele"}},{"word":"ejaculau","pos":"verb","definitions":["third-person plural imperfect indicative of ejacula"],"pronunciation":"[e.ʒa.kuˈlaw]"},{"word":"ejaculează","pos":"verb","definitions":["inflection of ejacula:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[e.ʒa.kuˈle̯azə]"},{"word":"ejaculez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of ejacula"],"pronunciation":"[e.ʒa.kuˈlez]"},{"word":"ejaculeze","pos":"verb","definitions":["third-person singular/plural present subjunctive of ejacula"],"pronunciation":"[e.ʒa.kuˈleze]"},{"word":"ejaculezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of ejacula"],"pronunciation":"[e.ʒa.kuˈlezʲ]"},{"word":"ejecta","pos":"verb","definitions":["to eject"],"forms":{"canonical":"a ejecta 1st conjugation","present-singular-third-person":"ejectează","participle-past":"ejectat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ejecta","gerund":"ejectând","first-person-indicative-present-singular":"ejectez","indicative-present-second-person-singular":"ejectezi","indicative-present-singular-third-person":"ejectează","first-person-indicative-plural-present":"ejectăm","indicative-plural-present-second-person":"ejectați","indicative-plural-present-third-person":"ejectează","first-person-imperfect-indicative-singular":"ejectam","imperfect-indicative-second-person-singular":"ejectai","imperfect-indicative-singular-third-person":"ejecta","first-person-imperfect-indicative-plural":"ejectam","imperfect-indicative-plural-second-person":"ejectați","imperfect-indicative-plural-third-person":"ejectau","first-person-indicative-perfect-singular":"ejectai","indicative-perfect-second-person-singular":"ejectași","indicative-perfect-singular-third-person":"ejectă","first-person-indicative-perfect-plural":"ejectarăm","indicative-perfect-plural-second-person":"ejectarăți","indicative-perfect-plural-third-person":"ejectară","first-person-indicative-pluperfect-singular":"ejectasem","indicative-pluperfect-second-person-singular":"ejectaseși","indicative-pluperfect-singular-third-person":"ejectase","first-person-indicative-pluperfect-plural":"ejectaserăm","indicative-pluperfect-plural-second-person":"ejectaserăți","indicative-pluperfect-plural-third-person":"ejectaseră","first-person-present-singular-subjunctive":"să ejectez","present-second-person-singular-subjunctive":"să ejectezi","present-singular-subjunctive-third-person":"să ejecteze","first-person-plural-present-subjunctive":"să ejectăm","plural-present-second-person-subjunctive":"să ejectați","plural-present-subjunctive-third-person":"să ejecteze","imperative-second-person-singular":"ejectează","imperative-plural-second-person":"ejectați","imperative-negative-second-person-singular":"nu ejecta","imperative-negative-plural-second-person":"nu ejectați"}},{"word":"ejectabil","pos":"adj","definitions":["ejectable"],"forms":{"feminine-singular":"ejectabilă","masculine-plural":"ejectabili","feminine-neuter-plural":"ejectabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ejectabil","error-unrecognized-form-feminine-indefinite-singular":"ejectabilă","error-unrecognized-form-indefinite-masculine-plural":"ejectabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"ejectabile","definite-error-unrecognized-form-masculine-neuter-singular":"ejectabilul","definite-error-unrecognized-form-feminine-singular":"ejectabila","definite-error-unrecognized-form-masculine-plural":"ejectabilii","definite-error-unrecognized-form-feminine-neuter-plural":"ejectabilele"}},{"word":"ejectare","pos":"noun","definitions":["ejection"],"forms":{"plural":"ejectări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ejectare","accusative-definite-nominative-singular":"ejectarea","accusative-indefinite-nominative-plural":"ejectări","accusative-definite-nominative-plural":"ejectările","dative-genitive-indefinite-singular":"ejectări","dative-definite-genitive-singular":"ejectării","dative-genitive-indefinite-plural":"ejectări","dative-definite-genitive-plural":"ejectărilor","singular-vocative":"ejectare","plural-vocative":"ejectărilor"}},{"word":"ejectat","pos":"adj","definitions":["ejected"],"forms":{"feminine-singular":"ejectată","masculine-plural":"ejectați","feminine-neuter-plural":"ejectate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ejectat","error-unrecognized-form-feminine-indefinite-singular":"ejectată","error-unrecognized-form-indefinite-masculine-plural":"ejectați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ejectate","definite-error-unrecognized-form-masculine-neuter-singular":"ejectatul","definite-error-unrecognized-form-feminine-singular":"ejectata","definite-error-unrecognized-form-masculine-plural":"ejectații","definite-error-unrecognized-form-feminine-neuter-plural":"ejectatele"}},{"word":"ejectat","pos":"verb","definitions":["past participle of ejecta"],"forms":{"participle-past":"of ejecta"}},{"word":"ejecție","pos":"noun","definitions":["ejection"],"forms":{"plural":"ejecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ejecție","accusative-definite-nominative-singular":"ejecția","accusative-indefinite-nominative-plural":"ejecții","accusative-definite-nominative-plural":"ejecțiile","dative-genitive-indefinite-singular":"ejecții","dative-definite-genitive-singular":"ejecției","dative-genitive-indefinite-plural":"ejecții","dative-definite-genitive-plural":"ejecțiilor","singular-vocative":"ejecție","plural-vocative":"ejecțiilor"}},{"word":"ejecțiune","pos":"noun","definitions":["obsolete form of ejecție"],"forms":{"plural":"ejecțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ejecțiune","accusative-definite-nominative-singular":"ejecțiunea","accusative-indefinite-nominative-plural":"ejecțiuni","accusative-definite-nominative-plural":"ejecțiunile","dative-genitive-indefinite-singular":"ejecțiuni","dative-definite-genitive-singular":"ejecțiunii","dative-genitive-indefinite-plural":"ejecțiuni","dative-definite-genitive-plural":"ejecțiunilor","singular-vocative":"ejecțiune","plural-vocative":"ejecțiunilor"}},{"word":"ejectoare","pos":"noun","definitions":["plural of ejector"]},{"word":"ejector","pos":"noun","definitions":["ejector"],"forms":{"plural":"ejectoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ejector","accusative-definite-nominative-singular":"ejectorul","accusative-indefinite-nominative-plural":"ejectoare","accusative-definite-nominative-plural":"ejectoarele","dative-genitive-indefinite-singular":"ejector","dative-definite-genitive-singular":"ejectorului","dative-genitive-indefinite-plural":"ejectoare","dative-definite-genitive-plural":"ejectoarelor","singular-vocative":"ejectorule","plural-vocative":"ejectoarelor"}},{"word":"el","pos":"pron","definitions":["he"],"pronunciation":"/jel/","gender":"m","forms":{"plural":"ei","feminine":"equivalent ea","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"el","accusative-stressed":"el","accusative-error-unrecognized-form":"îl","dative-stressed":"lui","dative-error-unrecognized-form":"îi","genitive":"lui","masculine-possessive-singular":"său","masculine-plural-possessive":"săi","neuter-possessive-singular":"său","neuter-plural-possessive":"sale","feminine-possessive-singular":"sa","feminine-plural-possessive":"sale","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sie","dative-error-unrecognized-form-possessive":"își","alternative":"ел"}},{"word":"el","pos":"pron","definitions":["him"],"pronunciation":"/jel/","gender":"m","forms":{"alternative":"ел"}},{"word":"El Salvador","pos":"name","definitions":["El Salvador (a country in Central America)"],"gender":"n"},{"word":"elabora","pos":"verb","definitions":["to elaborate"],"pronunciation":"/e.la.boˈra/","forms":{"canonical":"a elabora 1st conjugation","present-singular-third-person":"elaborează","participle-past":"elaborat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elabora","gerund":"elaborând","first-person-indicative-present-singular":"elaborez","indicative-present-second-person-singular":"elaborezi","indicative-present-singular-third-person":"elaborează","first-person-indicative-plural-present":"elaborăm","indicative-plural-present-second-person":"elaborați","indicative-plural-present-third-person":"elaborează","first-person-imperfect-indicative-singular":"elaboram","imperfect-indicative-second-person-singular":"elaborai","imperfect-indicative-singular-third-person":"elabora","first-person-imperfect-indicative-plural":"elaboram","imperfect-indicative-plural-second-person":"elaborați","imperfect-indicative-plural-third-person":"elaborau","first-person-indicative-perfect-singular":"elaborai","indicative-perfect-second-person-singular":"elaborași","indicative-perfect-singular-third-person":"elaboră","first-person-indicative-perfect-plural":"elaborarăm","indicative-perfect-plural-second-person":"elaborarăți","indicative-perfect-plural-third-person":"elaborară","first-person-indicative-pluperfect-singular":"elaborasem","indicative-pluperfect-second-person-singular":"elaboraseși","indicative-pluperfect-singular-third-person":"elaborase","first-person-indicative-pluperfect-plural":"elaboraserăm","indicative-pluperfect-plural-second-person":"elaboraserăți","indicative-pluperfect-plural-third-person":"elaboraseră","first-person-present-singular-subjunctive":"să elaborez","present-second-person-singular-subjunctive":"să elaborezi","present-singular-subjunctive-third-person":"să elaboreze","first-person-plural-present-subjunctive":"să elaborăm","plural-present-second-person-subjunctive":"să elaborați","plural-present-subjunctive-third-person":"să elaboreze","imperative-second-person-singular":"elaborează","imperative-plural-second-person":"elaborați","imperative-negative-second-person-singular":"nu elabora","imperative-negative-plural-second-person":"nu elaborați"}},{"word":"elaborare","pos":"noun","definitions":["elaboration"],"forms":{"plural":"elaborări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elaborare","accusative-definite-nominative-singular":"elaborarea","accusative-indefinite-nominative-plural":"elaborări","accusative-definite-nominative-plural":"elaborările","dative-genitive-indefinite-singular":"elaborări","dative-definite-genitive-singular":"elaborării","dative-genitive-indefinite-plural":"elaborări","dative-definite-genitive-plural":"elaborărilor","singular-vocative":"elaborare","plural-vocative":"elaborărilor"}},{"word":"elaborație","pos":"noun","definitions":["elaboration"],"forms":{"plural":"elaborații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elaborație","accusative-definite-nominative-singular":"elaborația","accusative-indefinite-nominative-plural":"elaborații","accusative-definite-nominative-plural":"elaborațiile","dative-genitive-indefinite-singular":"elaborații","dative-definite-genitive-singular":"elaborației","dative-genitive-indefinite-plural":"elaborații","dative-definite-genitive-plural":"elaborațiilor","singular-vocative":"elaborație","plural-vocative":"elaborațiilor"}},{"word":"elagaj","pos":"noun","definitions":["pruning"],"forms":{"plural":"elagaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elagaj","accusative-definite-nominative-singular":"elagajul","accusative-indefinite-nominative-plural":"elagaje","accusative-definite-nominative-plural":"elagajele","dative-genitive-indefinite-singular":"elagaj","dative-definite-genitive-singular":"elagajului","dative-genitive-indefinite-plural":"elagaje","dative-definite-genitive-plural":"elagajelor","singular-vocative":"elagajule","plural-vocative":"elagajelor"}},{"word":"elamit","pos":"noun","definitions":["Elamite"],"forms":{"plural":"elamiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elamit","accusative-definite-nominative-singular":"elamitul","accusative-indefinite-nominative-plural":"elamiți","accusative-definite-nominative-plural":"elamiții","dative-genitive-indefinite-singular":"elamit","dative-definite-genitive-singular":"elamitului","dative-genitive-indefinite-plural":"elamiți","dative-definite-genitive-plural":"elamiților","singular-vocative":"elamitule","plural-vocative":"elamiților"}},{"word":"elamită","pos":"noun","definitions":["female equivalent of elamit"],"forms":{"plural":"elamite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elamită","accusative-definite-nominative-singular":"elamita","accusative-indefinite-nominative-plural":"elamite","accusative-definite-nominative-plural":"elamitele","dative-genitive-indefinite-singular":"elamite","dative-definite-genitive-singular":"elamitei","dative-genitive-indefinite-plural":"elamite","dative-definite-genitive-plural":"elamitelor","singular-vocative":"elamită","plural-vocative":"elamitelor"}},{"word":"elan","pos":"noun","definitions":["elk, moose (Alces alces)"],"forms":{"plural":"elani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elan","accusative-definite-nominative-singular":"elanul","accusative-indefinite-nominative-plural":"elani","accusative-definite-nominative-plural":"elanii","dative-genitive-indefinite-singular":"elan","dative-definite-genitive-singular":"elanului","dative-genitive-indefinite-plural":"elani","dative-definite-genitive-plural":"elanilor","singular-vocative":"elanule","plural-vocative":"elanilor"}},{"word":"elan","pos":"noun","definitions":["élan"],"forms":{"plural":"elanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"elan","accusative-definite-nominative-singular":"elanul","accusative-indefinite-nominative-plural":"elanuri","accusative-definite-nominative-plural":"elanurile","dative-genitive-indefinite-singular":"elan","dative-definite-genitive-singular":"elanului","dative-genitive-indefinite-plural":"elanuri","dative-definite-genitive-plural":"elanurilor","singular-vocative":"elanule","plural-vocative":"elanurilor"}},{"word":"elansa","pos":"verb","definitions":["to dash forward, to throw oneself at"],"forms":{"canonical":"a elansa 1st conjugation","present-singular-third-person":"elansează","participle-past":"elansat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elansa","gerund":"elansând","first-person-indicative-present-singular":"elansez","indicative-present-second-person-singular":"elansezi","indicative-present-singular-third-person":"elansează","first-person-indicative-plural-present":"elansăm","indicative-plural-present-second-person":"elansați","indicative-plural-present-third-person":"elansează","first-person-imperfect-indicative-singular":"elansam","imperfect-indicative-second-person-singular":"elansai","imperfect-indicative-singular-third-person":"elansa","first-person-imperfect-indicative-plural":"elansam","imperfect-indicative-plural-second-person":"elansați","imperfect-indicative-plural-third-person":"elansau","first-person-indicative-perfect-singular":"elansai","indicative-perfect-second-person-singular":"elansași","indicative-perfect-singular-third-person":"elansă","first-person-indicative-perfect-plural":"elansarăm","indicative-perfect-plural-second-person":"elansarăți","indicative-perfect-plural-third-person":"elansară","first-person-indicative-pluperfect-singular":"elansasem","indicative-pluperfect-second-person-singular":"elansaseși","indicative-pluperfect-singular-third-person":"elansase","first-person-indicative-pluperfect-plural":"elansaserăm","indicative-pluperfect-plural-second-person":"elansaserăți","indicative-pluperfect-plural-third-person":"elansaseră","first-person-present-singular-subjunctive":"să elansez","present-second-person-singular-subjunctive":"să elansezi","present-singular-subjunctive-third-person":"să elanseze","first-person-plural-present-subjunctive":"să elansăm","plural-present-second-person-subjunctive":"să elansați","plural-present-subjunctive-third-person":"să elanseze","imperative-second-person-singular":"elansează","imperative-plural-second-person":"elansați","imperative-negative-second-person-singular":"nu elansa","imperative-negative-plural-second-person":"nu elansați"}},{"word":"elansat","pos":"adj","definitions":["slender, slim"],"forms":{"feminine-singular":"elansată","masculine-plural":"elansați","feminine-neuter-plural":"elansate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elansat","error-unrecognized-form-feminine-indefinite-singular":"elansată","error-unrecognized-form-indefinite-masculine-plural":"elansați","error-unrecognized-form-feminine-indefinite-neuter-plural":"elansate","definite-error-unrecognized-form-masculine-neuter-singular":"elansatul","definite-error-unrecognized-form-feminine-singular":"elansata","definite-error-unrecognized-form-masculine-plural":"elansații","definite-error-unrecognized-form-feminine-neuter-plural":"elansatele"}},{"word":"elansat","pos":"verb","definitions":["past participle of elansa"],"forms":{"participle-past":"of elansa"}},{"word":"elastic","pos":"adj","definitions":["elastic"],"forms":{"feminine-singular":"elastică","masculine-plural":"elastici","feminine-neuter-plural":"elastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elastic","error-unrecognized-form-feminine-indefinite-singular":"elastică","error-unrecognized-form-indefinite-masculine-plural":"elastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elastice","definite-error-unrecognized-form-masculine-neuter-singular":"elasticul","definite-error-unrecognized-form-feminine-singular":"elastica","definite-error-unrecognized-form-masculine-plural":"elasticii","definite-error-unrecognized-form-feminine-neuter-plural":"elasticele"}},{"word":"elasticesc","pos":"adj","definitions":["elastic"],"forms":{"feminine-singular":"elasticească","plural":"elasticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elasticesc","error-unrecognized-form-feminine-indefinite-singular":"elasticească","error-unrecognized-form-indefinite-masculine-plural":"elasticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"elasticești","definite-error-unrecognized-form-masculine-neuter-singular":"elasticescul","definite-error-unrecognized-form-feminine-singular":"elasticeasca","definite-error-unrecognized-form-masculine-plural":"elasticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"elasticeștile"}},{"word":"elasticitate","pos":"noun","definitions":["elasticity"],"pronunciation":"[e.las.ti.t͡ʃiˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"elasticitate","accusative-definite-nominative":"elasticitatea","dative-genitive-indefinite":"elasticități","dative-definite-genitive":"elasticității","vocative":"elasticitate"}},{"word":"elastină","pos":"noun","definitions":["elastin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elastină","accusative-definite-nominative-singular":"elastina","accusative-indefinite-nominative-plural":"elastine","accusative-definite-nominative-plural":"elastinele","dative-genitive-indefinite-singular":"elastine","dative-definite-genitive-singular":"elastinei","dative-genitive-indefinite-plural":"elastine","dative-definite-genitive-plural":"elastinelor","singular-vocative":"elastină","plural-vocative":"elastinelor"}},{"word":"elastomecanică","pos":"noun","definitions":["elastomechanical"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"elastomecanică","accusative-definite-nominative":"elastomecanica","dative-genitive-indefinite":"elastomecanice","dative-definite-genitive":"elastomecanicei","vocative":"elastomecanică"}},{"word":"elastomer","pos":"noun","definitions":["elastomer"],"forms":{"plural":"elastomeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elastomer","accusative-definite-nominative-singular":"elastomerul","accusative-indefinite-nominative-plural":"elastomeri","accusative-definite-nominative-plural":"elastomerii","dative-genitive-indefinite-singular":"elastomer","dative-definite-genitive-singular":"elastomerului","dative-genitive-indefinite-plural":"elastomeri","dative-definite-genitive-plural":"elastomerilor","singular-vocative":"elastomerule","plural-vocative":"elastomerilor"}},{"word":"elaterid","pos":"noun","definitions":["click beetle"],"forms":{"plural":"elateride","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elaterid","accusative-definite-nominative-singular":"elateridul","accusative-indefinite-nominative-plural":"elateride","accusative-definite-nominative-plural":"elateridele","dative-genitive-indefinite-singular":"elaterid","dative-definite-genitive-singular":"elateridului","dative-genitive-indefinite-plural":"elateride","dative-definite-genitive-plural":"elateridelor","singular-vocative":"elateridule","plural-vocative":"elateridelor"}},{"word":"elaterimă","pos":"noun","definitions":["elaterin"],"forms":{"plural":"elaterime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elaterimă","accusative-definite-nominative-singular":"elaterima","accusative-indefinite-nominative-plural":"elaterime","accusative-definite-nominative-plural":"elaterimele","dative-genitive-indefinite-singular":"elaterime","dative-definite-genitive-singular":"elaterimei","dative-genitive-indefinite-plural":"elaterime","dative-definite-genitive-plural":"elaterimelor","singular-vocative":"elaterimă","plural-vocative":"elaterimelor"}},{"word":"elateriu","pos":"noun","definitions":["squirting cucumber (Ecballium elaterium)"],"forms":{"plural":"elaterii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elateriu","accusative-definite-nominative-singular":"elateriuul","accusative-indefinite-nominative-plural":"elaterii","accusative-definite-nominative-plural":"elateriile","dative-genitive-indefinite-singular":"elateriu","dative-definite-genitive-singular":"elateriuului","dative-genitive-indefinite-plural":"elaterii","dative-definite-genitive-plural":"elateriilor","singular-vocative":"elateriuule","plural-vocative":"elateriilor"}},{"word":"Elba","pos":"name","definitions":["Elbe (a major river in central Europe that passes through the Czech Republic and Germany before flowing into the North Sea)","Elba (an Italian island in the Tuscan Archipelago off the west coast of Italy, administratively part of Tuscany; between the Italian coast and Corsica)"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Elbă","accusative-definite-nominative":"Elba","dative-genitive-indefinite":"Elbe","dative-definite-genitive":"Elbei","vocative":"Elbă"}},{"word":"elchegiu","pos":"noun","definitions":["sail handler (on a ship)"],"forms":{"plural":"elchegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elchegiu","accusative-definite-nominative-singular":"elchegiuul","accusative-indefinite-nominative-plural":"elchegii","accusative-definite-nominative-plural":"elchegiii","dative-genitive-indefinite-singular":"elchegiu","dative-definite-genitive-singular":"elchegiuului","dative-genitive-indefinite-plural":"elchegii","dative-definite-genitive-plural":"elchegiilor","singular-vocative":"elchegiuule","plural-vocative":"elchegiilor"}},{"word":"Elciu","pos":"name","definitions":["a village in Recea-Cristur, Cluj County, Romania"],"gender":"m"},{"word":"elciu","pos":"noun","definitions":["diplomatic envoy to the Ottoman Empire."],"forms":{"plural":"elcii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elciu","accusative-definite-nominative-singular":"elciuul","accusative-indefinite-nominative-plural":"elcii","accusative-definite-nominative-plural":"elciii","dative-genitive-indefinite-singular":"elciu","dative-definite-genitive-singular":"elciuului","dative-genitive-indefinite-plural":"elcii","dative-definite-genitive-plural":"elciilor","singular-vocative":"elciuule","plural-vocative":"elciilor"}},{"word":"ele","pos":"pron","definitions":["they (for a group composed completely of females)"],"pronunciation":"/ˈje.le/","gender":"f-p","forms":{"masculine":"equivalent ei","table-tags":"no-table-tags","inflection-template":"l-self","nominative":"ele","accusative-stressed":"ele","accusative-error-unrecognized-form":"le","dative-stressed":"lor","dative-error-unrecognized-form":"le","genitive":"lor","masculine-possessive-singular":"lor","masculine-plural-possessive":"lor","neuter-possessive-singular":"lor","neuter-plural-possessive":"lor","feminine-possessive-singular":"lor","feminine-plural-possessive":"lor","accusative-possessive-stressed":"sine","accusative-error-unrecognized-form-possessive":"se","dative-possessive-stressed":"sieși","dative-error-unrecognized-form-possessive":"își"}},{"word":"ele","pos":"pron","definitions":["them (all-female group)"],"pronunciation":"/ˈje.le/","gender":"f"},{"word":"eleat","pos":"noun","definitions":["eleate"],"forms":{"plural":"eleați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eleat","accusative-definite-nominative-singular":"eleatul","accusative-indefinite-nominative-plural":"eleați","accusative-definite-nominative-plural":"eleații","dative-genitive-indefinite-singular":"eleat","dative-definite-genitive-singular":"eleatului","dative-genitive-indefinite-plural":"eleați","dative-definite-genitive-plural":"eleaților","singular-vocative":"eleatule","plural-vocative":"eleaților"}},{"word":"eleatic","pos":"adj","definitions":["Eleatic"],"forms":{"feminine-singular":"eleatică","masculine-plural":"eleatici","feminine-neuter-plural":"eleatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eleatic","error-unrecognized-form-feminine-indefinite-singular":"eleatică","error-unrecognized-form-indefinite-masculine-plural":"eleatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eleatice","definite-error-unrecognized-form-masculine-neuter-singular":"eleaticul","definite-error-unrecognized-form-feminine-singular":"eleatica","definite-error-unrecognized-form-masculine-plural":"eleaticii","definite-error-unrecognized-form-feminine-neuter-plural":"eleaticele"}},{"word":"eleatism","pos":"noun","definitions":["Eleaticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eleatism","accusative-definite-nominative":"eleatismul","dative-genitive-indefinite":"eleatism","dative-definite-genitive":"eleatismului","vocative":"eleatismule"}},{"word":"elebor","pos":"noun","definitions":["hellebore (plant)"],"forms":{"plural":"elebori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elebor","accusative-definite-nominative-singular":"eleborul","accusative-indefinite-nominative-plural":"elebori","accusative-definite-nominative-plural":"eleborii","dative-genitive-indefinite-singular":"elebor","dative-definite-genitive-singular":"eleborului","dative-genitive-indefinite-plural":"elebori","dative-definite-genitive-plural":"eleborilor","singular-vocative":"eleborule","plural-vocative":"eleborilor"}},{"word":"elecție","pos":"noun","definitions":["alternative form of elecțiune"],"forms":{"plural":"elecții"}},{"word":"elecțiune","pos":"noun","definitions":["election"],"forms":{"plural":"elecțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"elecțiune","accusative-definite-nominative-singular":"elecțiunea","accusative-indefinite-nominative-plural":"elecțiuni","accusative-definite-nominative-plural":"elecțiunile","dative-genitive-indefinite-singular":"elecțiuni","dative-definite-genitive-singular":"elecțiunii","dative-genitive-indefinite-plural":"elecțiuni","dative-definite-genitive-plural":"elecțiunilor","singular-vocative":"-","plural-vocative":"-","alternative":"elecție"}},{"word":"electiv","pos":"adj","definitions":["elective"],"forms":{"feminine-singular":"electivă","masculine-plural":"electivi","feminine-neuter-plural":"elective","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electiv","error-unrecognized-form-feminine-indefinite-singular":"electivă","error-unrecognized-form-indefinite-masculine-plural":"electivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"elective","definite-error-unrecognized-form-masculine-neuter-singular":"electivul","definite-error-unrecognized-form-feminine-singular":"electiva","definite-error-unrecognized-form-masculine-plural":"electivii","definite-error-unrecognized-form-feminine-neuter-plural":"electivele"}},{"word":"electivitate","pos":"noun","definitions":["electivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electivitate","accusative-definite-nominative-singular":"electivitatea","accusative-indefinite-nominative-plural":"electivități","accusative-definite-nominative-plural":"electivitățile","dative-genitive-indefinite-singular":"electivități","dative-definite-genitive-singular":"electivității","dative-genitive-indefinite-plural":"electivități","dative-definite-genitive-plural":"electivităților","singular-vocative":"electivitate","plural-vocative":"electivităților"}},{"word":"electoare","pos":"noun","definitions":["female equivalent of elector"],"forms":{"plural":"electoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"electoare","accusative-definite-nominative-singular":"electoarea","accusative-indefinite-nominative-plural":"electoare","accusative-definite-nominative-plural":"electoarele","dative-genitive-indefinite-singular":"electoare","dative-definite-genitive-singular":"electoarei","dative-genitive-indefinite-plural":"electoare","dative-definite-genitive-plural":"electoarelor","singular-vocative":"electoare","plural-vocative":"electoarelor"}},{"word":"elector","pos":"noun","definitions":["elector"],"forms":{"plural":"electori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elector","accusative-definite-nominative-singular":"electorul","accusative-indefinite-nominative-plural":"electori","accusative-definite-nominative-plural":"electorii","dative-genitive-indefinite-singular":"elector","dative-definite-genitive-singular":"electorului","dative-genitive-indefinite-plural":"electori","dative-definite-genitive-plural":"electorilor","singular-vocative":"electorule","plural-vocative":"electorilor"}},{"word":"electoral","pos":"adj","definitions":["electoral"],"forms":{"feminine-singular":"electorală","masculine-plural":"electorali","feminine-neuter-plural":"electorale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electoral","error-unrecognized-form-feminine-indefinite-singular":"electorală","error-unrecognized-form-indefinite-masculine-plural":"electorali","error-unrecognized-form-feminine-indefinite-neuter-plural":"electorale","definite-error-unrecognized-form-masculine-neuter-singular":"electoralul","definite-error-unrecognized-form-feminine-singular":"electorala","definite-error-unrecognized-form-masculine-plural":"electoralii","definite-error-unrecognized-form-feminine-neuter-plural":"electoralele"}},{"word":"electorat","pos":"noun","definitions":["electorate"],"pronunciation":"/e.lek.toˈrat/","forms":{"plural":"electorate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electorat","accusative-definite-nominative-singular":"electoratul","accusative-indefinite-nominative-plural":"electorate","accusative-definite-nominative-plural":"electoratele","dative-genitive-indefinite-singular":"electorat","dative-definite-genitive-singular":"electoratului","dative-genitive-indefinite-plural":"electorate","dative-definite-genitive-plural":"electoratelor","singular-vocative":"electoratule","plural-vocative":"electoratelor"}},{"word":"electorime","pos":"noun","definitions":["electorate"],"forms":{"plural":"electorimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electorime","accusative-definite-nominative-singular":"electorimea","accusative-indefinite-nominative-plural":"electorimi","accusative-definite-nominative-plural":"electorimile","dative-genitive-indefinite-singular":"electorimi","dative-definite-genitive-singular":"electorimii","dative-genitive-indefinite-plural":"electorimi","dative-definite-genitive-plural":"electorimilor","singular-vocative":"electorime","plural-vocative":"electorimilor"}},{"word":"electret","pos":"noun","definitions":["electret"],"forms":{"plural":"electreți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electret","accusative-definite-nominative-singular":"electretul","accusative-indefinite-nominative-plural":"electreți","accusative-definite-nominative-plural":"electreții","dative-genitive-indefinite-singular":"electret","dative-definite-genitive-singular":"electretului","dative-genitive-indefinite-plural":"electreți","dative-definite-genitive-plural":"electreților","singular-vocative":"electretule","plural-vocative":"electreților"}},{"word":"electric","pos":"adj","definitions":["electric"],"pronunciation":"/eˈlek.trik/","forms":{"feminine-singular":"electrică","masculine-plural":"electrici","feminine-neuter-plural":"electrice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"electric","error-unrecognized-form-feminine-indefinite-singular":"electrică","error-unrecognized-form-indefinite-masculine-plural":"electrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrice","definite-error-unrecognized-form-masculine-neuter-singular":"electricul","definite-error-unrecognized-form-feminine-singular":"electrica","definite-error-unrecognized-form-masculine-plural":"electricii","definite-error-unrecognized-form-feminine-neuter-plural":"electricele"}},{"word":"electrică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of electric"]},{"word":"electricesc","pos":"adj","definitions":["electrical"],"forms":{"feminine-singular":"electricească","plural":"electricești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electricesc","error-unrecognized-form-feminine-indefinite-singular":"electricească","error-unrecognized-form-indefinite-masculine-plural":"electricești","error-unrecognized-form-feminine-indefinite-neuter-plural":"electricești","definite-error-unrecognized-form-masculine-neuter-singular":"electricescul","definite-error-unrecognized-form-feminine-singular":"electriceasca","definite-error-unrecognized-form-masculine-plural":"electriceștii","definite-error-unrecognized-form-feminine-neuter-plural":"electriceștile"}},{"word":"electrician","pos":"noun","definitions":["electrician"],"pronunciation":"/e.lek.tri.t͡ʃiˈan/","forms":{"plural":"electricieni","feminine":"equivalent electriciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electrician","accusative-definite-nominative-singular":"electricianul","accusative-indefinite-nominative-plural":"electricieni","accusative-definite-nominative-plural":"electricienii","dative-genitive-indefinite-singular":"electrician","dative-definite-genitive-singular":"electricianului","dative-genitive-indefinite-plural":"electricieni","dative-definite-genitive-plural":"electricienilor","singular-vocative":"electricianule","plural-vocative":"electricienilor"}},{"word":"electriciană","pos":"noun","definitions":["female equivalent of electrician"],"pronunciation":"/e.lek.tri.t͡ʃiˈa.nə/","forms":{"plural":"electriciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"electriciană","accusative-definite-nominative-singular":"electriciana","accusative-indefinite-nominative-plural":"electriciene","accusative-definite-nominative-plural":"electricienele","dative-genitive-indefinite-singular":"electriciene","dative-definite-genitive-singular":"electricienei","dative-genitive-indefinite-plural":"electriciene","dative-definite-genitive-plural":"electricienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"electriciene","pos":"noun","definitions":["plural of electriciană"],"gender":"f"},{"word":"electricieni","pos":"noun","definitions":["plural of electrician"],"gender":"m"},{"word":"electricitate","pos":"noun","definitions":["electricity (form of energy)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"electricitate","accusative-definite-nominative":"electricitatea","dative-genitive-indefinite":"electricități","dative-definite-genitive":"electricității","vocative":"electricitate"}},{"word":"electricitate statică","pos":"noun","definitions":["static electricity"]},{"word":"electrifica","pos":"verb","definitions":["to electrify"],"forms":{"canonical":"a electrifica 1st conjugation","present-singular-third-person":"electrifică","participle-past":"electrificat","subjunctive-third-person":"electrifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a electrifica","gerund":"electrificând","first-person-indicative-present-singular":"electrific","indicative-present-second-person-singular":"electrifici","indicative-present-singular-third-person":"electrifică","first-person-indicative-plural-present":"electrificăm","indicative-plural-present-second-person":"electrificați","indicative-plural-present-third-person":"electrifică","first-person-imperfect-indicative-singular":"electrificam","imperfect-indicative-second-person-singular":"electrificai","imperfect-indicative-singular-third-person":"electrifica","first-person-imperfect-indicative-plural":"electrificam","imperfect-indicative-plural-second-person":"electrificați","imperfect-indicative-plural-third-person":"electrificau","first-person-indicative-perfect-singular":"electrificai","indicative-perfect-second-person-singular":"electrificași","indicative-perfect-singular-third-person":"electrifică","first-person-indicative-perfect-plural":"electrificarăm","indicative-perfect-plural-second-person":"electrificarăți","indicative-perfect-plural-third-person":"electrificară","first-person-indicative-pluperfect-singular":"electrificasem","indicative-pluperfect-second-person-singular":"electrificaseși","indicative-pluperfect-singular-third-person":"electrificase","first-person-indicative-pluperfect-plural":"electrificaserăm","indicative-pluperfect-plural-second-person":"electrificaserăți","indicative-pluperfect-plural-third-person":"electrificaseră","first-person-present-singular-subjunctive":"să electrific","present-second-person-singular-subjunctive":"să electrifici","present-singular-subjunctive-third-person":"să electrifice","first-person-plural-present-subjunctive":"să electrificăm","plural-present-second-person-subjunctive":"să electrificați","plural-present-subjunctive-third-person":"să electrifice","imperative-second-person-singular":"electrifică","imperative-plural-second-person":"electrificați","imperative-negative-second-person-singular":"nu electrifica","imperative-negative-plural-second-person":"nu electrificați"}},{"word":"electrificare","pos":"noun","definitions":["electrification"],"forms":{"plural":"electrificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrificare","accusative-definite-nominative-singular":"electrificarea","accusative-indefinite-nominative-plural":"electrificări","accusative-definite-nominative-plural":"electrificările","dative-genitive-indefinite-singular":"electrificări","dative-definite-genitive-singular":"electrificării","dative-genitive-indefinite-plural":"electrificări","dative-definite-genitive-plural":"electrificărilor","singular-vocative":"electrificare","plural-vocative":"electrificărilor"}},{"word":"electrificat","pos":"adj","definitions":["electrified"],"forms":{"feminine-singular":"electrificată","masculine-plural":"electrificați","feminine-neuter-plural":"electrificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrificat","error-unrecognized-form-feminine-indefinite-singular":"electrificată","error-unrecognized-form-indefinite-masculine-plural":"electrificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrificate","definite-error-unrecognized-form-masculine-neuter-singular":"electrificatul","definite-error-unrecognized-form-feminine-singular":"electrificata","definite-error-unrecognized-form-masculine-plural":"electrificații","definite-error-unrecognized-form-feminine-neuter-plural":"electrificatele"}},{"word":"electriș","pos":"noun","definitions":["tram, streetcar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electriș","accusative-definite-nominative":"electrișul","dative-genitive-indefinite":"electriș","dative-definite-genitive":"electrișului","vocative":"electrișule"}},{"word":"electrism","pos":"noun","definitions":["electricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrism","accusative-definite-nominative":"electrismul","dative-genitive-indefinite":"electrism","dative-definite-genitive":"electrismului","vocative":"electrismule"}},{"word":"electriza","pos":"verb","definitions":["to electrify"],"forms":{"canonical":"a electriza 1st conjugation","present-singular-third-person":"electrizează","participle-past":"electrizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electriza","gerund":"electrizând","first-person-indicative-present-singular":"electrizez","indicative-present-second-person-singular":"electrizezi","indicative-present-singular-third-person":"electrizează","first-person-indicative-plural-present":"electrizăm","indicative-plural-present-second-person":"electrizați","indicative-plural-present-third-person":"electrizează","first-person-imperfect-indicative-singular":"electrizam","imperfect-indicative-second-person-singular":"electrizai","imperfect-indicative-singular-third-person":"electriza","first-person-imperfect-indicative-plural":"electrizam","imperfect-indicative-plural-second-person":"electrizați","imperfect-indicative-plural-third-person":"electrizau","first-person-indicative-perfect-singular":"electrizai","indicative-perfect-second-person-singular":"electrizași","indicative-perfect-singular-third-person":"electriză","first-person-indicative-perfect-plural":"electrizarăm","indicative-perfect-plural-second-person":"electrizarăți","indicative-perfect-plural-third-person":"electrizară","first-person-indicative-pluperfect-singular":"electrizasem","indicative-pluperfect-second-person-singular":"electrizaseși","indicative-pluperfect-singular-third-person":"electrizase","first-person-indicative-pluperfect-plural":"electrizaserăm","indicative-pluperfect-plural-second-person":"electrizaserăți","indicative-pluperfect-plural-third-person":"electrizaseră","first-person-present-singular-subjunctive":"să electrizez","present-second-person-singular-subjunctive":"să electrizezi","present-singular-subjunctive-third-person":"să electrizeze","first-person-plural-present-subjunctive":"să electrizăm","plural-present-second-person-subjunctive":"să electrizați","plural-present-subjunctive-third-person":"să electrizeze","imperative-second-person-singular":"electrizează","imperative-plural-second-person":"electrizați","imperative-negative-second-person-singular":"nu electriza","imperative-negative-plural-second-person":"nu electrizați"}},{"word":"electrizabil","pos":"adj","definitions":["electrifying"],"forms":{"feminine-singular":"electrizabilă","masculine-plural":"electrizabili","feminine-neuter-plural":"electrizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrizabil","error-unrecognized-form-feminine-indefinite-singular":"electrizabilă","error-unrecognized-form-indefinite-masculine-plural":"electrizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrizabile","definite-error-unrecognized-form-masculine-neuter-singular":"electrizabilul","definite-error-unrecognized-form-feminine-singular":"electrizabila","definite-error-unrecognized-form-masculine-plural":"electrizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"electrizabilele"}},{"word":"electrizant","pos":"adj","definitions":["electrifying"],"forms":{"feminine-singular":"electrizantă","masculine-plural":"electrizanți","feminine-neuter-plural":"electrizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrizant","error-unrecognized-form-feminine-indefinite-singular":"electrizantă","error-unrecognized-form-indefinite-masculine-plural":"electrizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrizante","definite-error-unrecognized-form-masculine-neuter-singular":"electrizantul","definite-error-unrecognized-form-feminine-singular":"electrizanta","definite-error-unrecognized-form-masculine-plural":"electrizanții","definite-error-unrecognized-form-feminine-neuter-plural":"electrizantele"}},{"word":"electrizare","pos":"noun","definitions":["electrification"],"forms":{"plural":"electrizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrizare","accusative-definite-nominative-singular":"electrizarea","accusative-indefinite-nominative-plural":"electrizări","accusative-definite-nominative-plural":"electrizările","dative-genitive-indefinite-singular":"electrizări","dative-definite-genitive-singular":"electrizării","dative-genitive-indefinite-plural":"electrizări","dative-definite-genitive-plural":"electrizărilor","singular-vocative":"electrizare","plural-vocative":"electrizărilor"}},{"word":"electrizat","pos":"adj","definitions":["electrified"],"forms":{"feminine-singular":"electrizată","masculine-plural":"electrizați","feminine-neuter-plural":"electrizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrizat","error-unrecognized-form-feminine-indefinite-singular":"electrizată","error-unrecognized-form-indefinite-masculine-plural":"electrizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrizate","definite-error-unrecognized-form-masculine-neuter-singular":"electrizatul","definite-error-unrecognized-form-feminine-singular":"electrizata","definite-error-unrecognized-form-masculine-plural":"electrizații","definite-error-unrecognized-form-feminine-neuter-plural":"electrizatele"}},{"word":"electrizație","pos":"noun","definitions":["electrification"],"forms":{"plural":"electrizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrizație","accusative-definite-nominative-singular":"electrizația","accusative-indefinite-nominative-plural":"electrizații","accusative-definite-nominative-plural":"electrizațiile","dative-genitive-indefinite-singular":"electrizații","dative-definite-genitive-singular":"electrizației","dative-genitive-indefinite-plural":"electrizații","dative-definite-genitive-plural":"electrizațiilor","singular-vocative":"electrizație","plural-vocative":"electrizațiilor"}},{"word":"electrizator","pos":"adj","definitions":["electrifier"],"forms":{"feminine-singular":"electrizatoare","masculine-plural":"electrizatori","feminine-neuter-plural":"electrizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrizator","error-unrecognized-form-feminine-indefinite-singular":"electrizatoare","error-unrecognized-form-indefinite-masculine-plural":"electrizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"electrizatorul","definite-error-unrecognized-form-feminine-singular":"electrizatoarea","definite-error-unrecognized-form-masculine-plural":"electrizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"electrizatoarele"}},{"word":"electroacupunctură","pos":"noun","definitions":["electroacupuncture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electroacupunctură","accusative-definite-nominative":"electroacupunctura","dative-genitive-indefinite":"electroacupuncture","dative-definite-genitive":"electroacupuncturei","vocative":"electroacupunctură"}},{"word":"electroacustic","pos":"adj","definitions":["electroacoustic"],"forms":{"feminine-singular":"electroacustică","masculine-plural":"electroacustici","feminine-neuter-plural":"electroacustice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroacustic","error-unrecognized-form-feminine-indefinite-singular":"electroacustică","error-unrecognized-form-indefinite-masculine-plural":"electroacustici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroacustice","definite-error-unrecognized-form-masculine-neuter-singular":"electroacusticul","definite-error-unrecognized-form-feminine-singular":"electroacustica","definite-error-unrecognized-form-masculine-plural":"electroacusticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroacusticele"}},{"word":"electroacustică","pos":"noun","definitions":["electroacoustics"],"forms":{"plural":"electroacustici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electroacustică","accusative-definite-nominative-singular":"electroacustica","accusative-indefinite-nominative-plural":"electroacustici","accusative-definite-nominative-plural":"electroacusticile","dative-genitive-indefinite-singular":"electroacustici","dative-definite-genitive-singular":"electroacusticii","dative-genitive-indefinite-plural":"electroacustici","dative-definite-genitive-plural":"electroacusticilor","singular-vocative":"electroacustică","plural-vocative":"electroacusticilor"}},{"word":"electroanaliză","pos":"noun","definitions":["electroanalysis"],"forms":{"plural":"electroanalize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroanaliză","accusative-definite-nominative-singular":"electroanaliza","accusative-indefinite-nominative-plural":"electroanalize","accusative-definite-nominative-plural":"electroanalizele","dative-genitive-indefinite-singular":"electroanalize","dative-definite-genitive-singular":"electroanalizei","dative-genitive-indefinite-plural":"electroanalize","dative-definite-genitive-plural":"electroanalizelor","singular-vocative":"electroanaliză","plural-vocative":"electroanalizelor"}},{"word":"electroanestezie","pos":"noun","definitions":["electroanesthesia"],"forms":{"plural":"electroanestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electroanestezie","accusative-definite-nominative-singular":"electroanestezia","accusative-indefinite-nominative-plural":"electroanestezii","accusative-definite-nominative-plural":"electroanesteziile","dative-genitive-indefinite-singular":"electroanestezii","dative-definite-genitive-singular":"electroanesteziei","dative-genitive-indefinite-plural":"electroanestezii","dative-definite-genitive-plural":"electroanesteziilor","singular-vocative":"electroanestezie","plural-vocative":"electroanesteziilor"}},{"word":"electrobiologic","pos":"adj","definitions":["electrobiological"],"forms":{"feminine-singular":"electrobiologică","masculine-plural":"electrobiologici","feminine-neuter-plural":"electrobiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrobiologic","error-unrecognized-form-feminine-indefinite-singular":"electrobiologică","error-unrecognized-form-indefinite-masculine-plural":"electrobiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrobiologice","definite-error-unrecognized-form-masculine-neuter-singular":"electrobiologicul","definite-error-unrecognized-form-feminine-singular":"electrobiologica","definite-error-unrecognized-form-masculine-plural":"electrobiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrobiologicele"}},{"word":"electrobiologie","pos":"noun","definitions":["electrobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrobiologie","accusative-definite-nominative-singular":"electrobiologia","accusative-indefinite-nominative-plural":"electrobiologii","accusative-definite-nominative-plural":"electrobiologiile","dative-genitive-indefinite-singular":"electrobiologii","dative-definite-genitive-singular":"electrobiologiei","dative-genitive-indefinite-plural":"electrobiologii","dative-definite-genitive-plural":"electrobiologiilor","singular-vocative":"electrobiologie","plural-vocative":"electrobiologiilor"}},{"word":"electrobuz","pos":"noun","definitions":["electrical bus"],"forms":{"plural":"electrobuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrobuz","accusative-definite-nominative-singular":"electrobuzul","accusative-indefinite-nominative-plural":"electrobuze","accusative-definite-nominative-plural":"electrobuzele","dative-genitive-indefinite-singular":"electrobuz","dative-definite-genitive-singular":"electrobuzului","dative-genitive-indefinite-plural":"electrobuze","dative-definite-genitive-plural":"electrobuzelor","singular-vocative":"electrobuzule","plural-vocative":"electrobuzelor"}},{"word":"electrocăldură","pos":"noun","definitions":["electric heat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electrocăldură","accusative-definite-nominative":"electrocăldura","dative-genitive-indefinite":"electrocăldure","dative-definite-genitive":"electrocăldurei","vocative":"electrocăldură"}},{"word":"electrocalorimetru","pos":"noun","definitions":["electrical calorimeter"],"forms":{"plural":"electrocalorimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrocalorimetru","accusative-definite-nominative-singular":"electrocalorimetruul","accusative-indefinite-nominative-plural":"electrocalorimetre","accusative-definite-nominative-plural":"electrocalorimetrele","dative-genitive-indefinite-singular":"electrocalorimetru","dative-definite-genitive-singular":"electrocalorimetruului","dative-genitive-indefinite-plural":"electrocalorimetre","dative-definite-genitive-plural":"electrocalorimetrelor","singular-vocative":"electrocalorimetruule","plural-vocative":"electrocalorimetrelor"}},{"word":"electrocapilar","pos":"adj","definitions":["electrocapillary"],"forms":{"feminine-singular":"electrocapilară","masculine-plural":"electrocapilari","feminine-neuter-plural":"electrocapilare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocapilar","error-unrecognized-form-feminine-indefinite-singular":"electrocapilară","error-unrecognized-form-indefinite-masculine-plural":"electrocapilari","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocapilare","definite-error-unrecognized-form-masculine-neuter-singular":"electrocapilarul","definite-error-unrecognized-form-feminine-singular":"electrocapilara","definite-error-unrecognized-form-masculine-plural":"electrocapilarii","definite-error-unrecognized-form-feminine-neuter-plural":"electrocapilarele"}},{"word":"electrocapilaritate","pos":"noun","definitions":["electrocapillarity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrocapilaritate","accusative-definite-nominative-singular":"electrocapilaritatea","accusative-indefinite-nominative-plural":"electrocapilarități","accusative-definite-nominative-plural":"electrocapilaritățile","dative-genitive-indefinite-singular":"electrocapilarități","dative-definite-genitive-singular":"electrocapilarității","dative-genitive-indefinite-plural":"electrocapilarități","dative-definite-genitive-plural":"electrocapilarităților","singular-vocative":"electrocapilaritate","plural-vocative":"electrocapilarităților"}},{"word":"electrocardiograf","pos":"noun","definitions":["electrocardiograph"],"forms":{"plural":"electrocardiografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrocardiograf","accusative-definite-nominative-singular":"electrocardiograful","accusative-indefinite-nominative-plural":"electrocardiografe","accusative-definite-nominative-plural":"electrocardiografele","dative-genitive-indefinite-singular":"electrocardiograf","dative-definite-genitive-singular":"electrocardiografului","dative-genitive-indefinite-plural":"electrocardiografe","dative-definite-genitive-plural":"electrocardiografelor","singular-vocative":"electrocardiografule","plural-vocative":"electrocardiografelor"}},{"word":"electrocardiografic","pos":"adj","definitions":["electrocardiographic"],"forms":{"feminine-singular":"electrocardiografică","masculine-plural":"electrocardiografici","feminine-neuter-plural":"electrocardiografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocardiografic","error-unrecognized-form-feminine-indefinite-singular":"electrocardiografică","error-unrecognized-form-indefinite-masculine-plural":"electrocardiografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocardiografice","definite-error-unrecognized-form-masculine-neuter-singular":"electrocardiograficul","definite-error-unrecognized-form-feminine-singular":"electrocardiografica","definite-error-unrecognized-form-masculine-plural":"electrocardiograficii","definite-error-unrecognized-form-feminine-neuter-plural":"electrocardiograficele"}},{"word":"electrocardiografie","pos":"noun","definitions":["electrocardiography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrocardiografie","accusative-definite-nominative":"electrocardiografia","dative-genitive-indefinite":"electrocardiografii","dative-definite-genitive":"electrocardiografiei","vocative":"electrocardiografie"}},{"word":"electrocardiogramă","pos":"noun","definitions":["electrocardiogram"],"forms":{"plural":"electrocardiograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrocardiogramă","accusative-definite-nominative-singular":"electrocardiograma","accusative-indefinite-nominative-plural":"electrocardiograme","accusative-definite-nominative-plural":"electrocardiogramele","dative-genitive-indefinite-singular":"electrocardiograme","dative-definite-genitive-singular":"electrocardiogramei","dative-genitive-indefinite-plural":"electrocardiograme","dative-definite-genitive-plural":"electrocardiogramelor","singular-vocative":"electrocardiogramă","plural-vocative":"electrocardiogramelor"}},{"word":"electrocardioscop","pos":"noun","definitions":["electrocardioscope"],"forms":{"plural":"electrocardioscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrocardioscop","accusative-definite-nominative-singular":"electrocardioscopul","accusative-indefinite-nominative-plural":"electrocardioscoape","accusative-definite-nominative-plural":"electrocardioscoapele","dative-genitive-indefinite-singular":"electrocardioscop","dative-definite-genitive-singular":"electrocardioscopului","dative-genitive-indefinite-plural":"electrocardioscoape","dative-definite-genitive-plural":"electrocardioscoapelor","singular-vocative":"electrocardioscopule","plural-vocative":"electrocardioscoapelor"}},{"word":"electrocardioscopie","pos":"noun","definitions":["electrocardioscopy"],"forms":{"plural":"electrocardioscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrocardioscopie","accusative-definite-nominative-singular":"electrocardioscopia","accusative-indefinite-nominative-plural":"electrocardioscopii","accusative-definite-nominative-plural":"electrocardioscopiile","dative-genitive-indefinite-singular":"electrocardioscopii","dative-definite-genitive-singular":"electrocardioscopiei","dative-genitive-indefinite-plural":"electrocardioscopii","dative-definite-genitive-plural":"electrocardioscopiilor","singular-vocative":"electrocardioscopie","plural-vocative":"electrocardioscopiilor"}},{"word":"electrocasnic","pos":"adj","definitions":["related to a household appliance"],"forms":{"feminine-singular":"electrocasnică","masculine-plural":"electrocasnici","feminine-neuter-plural":"electrocasnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocasnic","error-unrecognized-form-feminine-indefinite-singular":"electrocasnică","error-unrecognized-form-indefinite-masculine-plural":"electrocasnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocasnice","definite-error-unrecognized-form-masculine-neuter-singular":"electrocasnicul","definite-error-unrecognized-form-feminine-singular":"electrocasnica","definite-error-unrecognized-form-masculine-plural":"electrocasnicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrocasnicele"}},{"word":"electrocauter","pos":"noun","definitions":["electrocautery"],"forms":{"plural":"electrocautere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrocauter","accusative-definite-nominative-singular":"electrocauterul","accusative-indefinite-nominative-plural":"electrocautere","accusative-definite-nominative-plural":"electrocauterele","dative-genitive-indefinite-singular":"electrocauter","dative-definite-genitive-singular":"electrocauterului","dative-genitive-indefinite-plural":"electrocautere","dative-definite-genitive-plural":"electrocauterelor","singular-vocative":"electrocauterule","plural-vocative":"electrocauterelor"}},{"word":"electrocauteriza","pos":"verb","definitions":["to electrocauterize"],"forms":{"canonical":"a electrocauteriza 1st conjugation","present-singular-third-person":"electrocauterizează","participle-past":"electrocauterizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electrocauteriza","gerund":"electrocauterizând","first-person-indicative-present-singular":"electrocauterizez","indicative-present-second-person-singular":"electrocauterizezi","indicative-present-singular-third-person":"electrocauterizează","first-person-indicative-plural-present":"electrocauterizăm","indicative-plural-present-second-person":"electrocauterizați","indicative-plural-present-third-person":"electrocauterizează","first-person-imperfect-indicative-singular":"electrocauterizam","imperfect-indicative-second-person-singular":"electrocauterizai","imperfect-indicative-singular-third-person":"electrocauteriza","first-person-imperfect-indicative-plural":"electrocauterizam","imperfect-indicative-plural-second-person":"electrocauterizați","imperfect-indicative-plural-third-person":"electrocauterizau","first-person-indicative-perfect-singular":"electrocauterizai","indicative-perfect-second-person-singular":"electrocauterizași","indicative-perfect-singular-third-person":"electrocauteriză","first-person-indicative-perfect-plural":"electrocauterizarăm","indicative-perfect-plural-second-person":"electrocauterizarăți","indicative-perfect-plural-third-person":"electrocauterizară","first-person-indicative-pluperfect-singular":"electrocauterizasem","indicative-pluperfect-second-person-singular":"electrocauterizaseși","indicative-pluperfect-singular-third-person":"electrocauterizase","first-person-indicative-pluperfect-plural":"electrocauterizaserăm","indicative-pluperfect-plural-second-person":"electrocauterizaserăți","indicative-pluperfect-plural-third-person":"electrocauterizaseră","first-person-present-singular-subjunctive":"să electrocauterizez","present-second-person-singular-subjunctive":"să electrocauterizezi","present-singular-subjunctive-third-person":"să electrocauterizeze","first-person-plural-present-subjunctive":"să electrocauterizăm","plural-present-second-person-subjunctive":"să electrocauterizați","plural-present-subjunctive-third-person":"să electrocauterizeze","imperative-second-person-singular":"electrocauterizează","imperative-plural-second-person":"electrocauterizați","imperative-negative-second-person-singular":"nu electrocauteriza","imperative-negative-plural-second-person":"nu electrocauterizați"}},{"word":"electrocauterizare","pos":"noun","definitions":["electrocautery"],"forms":{"plural":"electrocauterizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrocauterizare","accusative-definite-nominative-singular":"electrocauterizarea","accusative-indefinite-nominative-plural":"electrocauterizări","accusative-definite-nominative-plural":"electrocauterizările","dative-genitive-indefinite-singular":"electrocauterizări","dative-definite-genitive-singular":"electrocauterizării","dative-genitive-indefinite-plural":"electrocauterizări","dative-definite-genitive-plural":"electrocauterizărilor","singular-vocative":"electrocauterizare","plural-vocative":"electrocauterizărilor"}},{"word":"electrocauterizat","pos":"adj","definitions":["electrocauterized"],"forms":{"feminine-singular":"electrocauterizată","masculine-plural":"electrocauterizați","feminine-neuter-plural":"electrocauterizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocauterizat","error-unrecognized-form-feminine-indefinite-singular":"electrocauterizată","error-unrecognized-form-indefinite-masculine-plural":"electrocauterizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocauterizate","definite-error-unrecognized-form-masculine-neuter-singular":"electrocauterizatul","definite-error-unrecognized-form-feminine-singular":"electrocauterizata","definite-error-unrecognized-form-masculine-plural":"electrocauterizații","definite-error-unrecognized-form-feminine-neuter-plural":"electrocauterizatele"}},{"word":"electrocauterizat","pos":"verb","definitions":["past participle of electrocauteriza"],"forms":{"participle-past":"of electrocauteriza"}},{"word":"electroceramică","pos":"noun","definitions":["electroceramic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electroceramică","accusative-definite-nominative":"electroceramica","dative-genitive-indefinite":"electroceramice","dative-definite-genitive":"electroceramicei","vocative":"electroceramică"}},{"word":"electrochimic","pos":"adj","definitions":["electrochemical"],"forms":{"feminine-singular":"electrochimică","masculine-plural":"electrochimici","feminine-neuter-plural":"electrochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrochimic","error-unrecognized-form-feminine-indefinite-singular":"electrochimică","error-unrecognized-form-indefinite-masculine-plural":"electrochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrochimice","definite-error-unrecognized-form-masculine-neuter-singular":"electrochimicul","definite-error-unrecognized-form-feminine-singular":"electrochimica","definite-error-unrecognized-form-masculine-plural":"electrochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrochimicele"}},{"word":"electrochimie","pos":"noun","definitions":["electrochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrochimie","accusative-definite-nominative":"electrochimia","dative-genitive-indefinite":"electrochimii","dative-definite-genitive":"electrochimiei","vocative":"electrochimie"}},{"word":"electrochimograf","pos":"noun","definitions":["electrokymograph"],"forms":{"plural":"electrochimografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrochimograf","accusative-definite-nominative-singular":"electrochimograful","accusative-indefinite-nominative-plural":"electrochimografe","accusative-definite-nominative-plural":"electrochimografele","dative-genitive-indefinite-singular":"electrochimograf","dative-definite-genitive-singular":"electrochimografului","dative-genitive-indefinite-plural":"electrochimografe","dative-definite-genitive-plural":"electrochimografelor","singular-vocative":"electrochimografule","plural-vocative":"electrochimografelor"}},{"word":"electrochimogramă","pos":"noun","definitions":["electrokymogram"],"forms":{"plural":"electrochimograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrochimogramă","accusative-definite-nominative-singular":"electrochimograma","accusative-indefinite-nominative-plural":"electrochimograme","accusative-definite-nominative-plural":"electrochimogramele","dative-genitive-indefinite-singular":"electrochimograme","dative-definite-genitive-singular":"electrochimogramei","dative-genitive-indefinite-plural":"electrochimograme","dative-definite-genitive-plural":"electrochimogramelor","singular-vocative":"electrochimogramă","plural-vocative":"electrochimogramelor"}},{"word":"electrochirurgie","pos":"noun","definitions":["electrosurgery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrochirurgie","accusative-definite-nominative":"electrochirurgia","dative-genitive-indefinite":"electrochirurgii","dative-definite-genitive":"electrochirurgiei","vocative":"electrochirurgie"}},{"word":"electrocinetic","pos":"adj","definitions":["electrokinetic"],"forms":{"feminine-singular":"electrocinetică","masculine-plural":"electrocinetici","feminine-neuter-plural":"electrocinetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocinetic","error-unrecognized-form-feminine-indefinite-singular":"electrocinetică","error-unrecognized-form-indefinite-masculine-plural":"electrocinetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocinetice","definite-error-unrecognized-form-masculine-neuter-singular":"electrocineticul","definite-error-unrecognized-form-feminine-singular":"electrocinetica","definite-error-unrecognized-form-masculine-plural":"electrocineticii","definite-error-unrecognized-form-feminine-neuter-plural":"electrocineticele"}},{"word":"electrocinetică","pos":"noun","definitions":["electrokinetics"],"forms":{"plural":"electrocinetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electrocinetică","accusative-definite-nominative-singular":"electrocinetica","accusative-indefinite-nominative-plural":"electrocinetici","accusative-definite-nominative-plural":"electrocineticile","dative-genitive-indefinite-singular":"electrocinetici","dative-definite-genitive-singular":"electrocineticii","dative-genitive-indefinite-plural":"electrocinetici","dative-definite-genitive-plural":"electrocineticilor","singular-vocative":"electrocinetică","plural-vocative":"electrocineticilor"}},{"word":"electrocoagula","pos":"verb","definitions":["to electrocoagulate"],"forms":{"canonical":"a electrocoagula 1st conjugation","present-singular-third-person":"electrocoagulează","participle-past":"electrocoagulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electrocoagula","gerund":"electrocoagulând","first-person-indicative-present-singular":"electrocoagulez","indicative-present-second-person-singular":"electrocoagulezi","indicative-present-singular-third-person":"electrocoagulează","first-person-indicative-plural-present":"electrocoagulăm","indicative-plural-present-second-person":"electrocoagulați","indicative-plural-present-third-person":"electrocoagulează","first-person-imperfect-indicative-singular":"electrocoagulam","imperfect-indicative-second-person-singular":"electrocoagulai","imperfect-indicative-singular-third-person":"electrocoagula","first-person-imperfect-indicative-plural":"electrocoagulam","imperfect-indicative-plural-second-person":"electrocoagulați","imperfect-indicative-plural-third-person":"electrocoagulau","first-person-indicative-perfect-singular":"electrocoagulai","indicative-perfect-second-person-singular":"electrocoagulași","indicative-perfect-singular-third-person":"electrocoagulă","first-person-indicative-perfect-plural":"electrocoagularăm","indicative-perfect-plural-second-person":"electrocoagularăți","indicative-perfect-plural-third-person":"electrocoagulară","first-person-indicative-pluperfect-singular":"electrocoagulasem","indicative-pluperfect-second-person-singular":"electrocoagulaseși","indicative-pluperfect-singular-third-person":"electrocoagulase","first-person-indicative-pluperfect-plural":"electrocoagulaserăm","indicative-pluperfect-plural-second-person":"electrocoagulaserăți","indicative-pluperfect-plural-third-person":"electrocoagulaseră","first-person-present-singular-subjunctive":"să electrocoagulez","present-second-person-singular-subjunctive":"să electrocoagulezi","present-singular-subjunctive-third-person":"să electrocoaguleze","first-person-plural-present-subjunctive":"să electrocoagulăm","plural-present-second-person-subjunctive":"să electrocoagulați","plural-present-subjunctive-third-person":"să electrocoaguleze","imperative-second-person-singular":"electrocoagulează","imperative-plural-second-person":"electrocoagulați","imperative-negative-second-person-singular":"nu electrocoagula","imperative-negative-plural-second-person":"nu electrocoagulați"}},{"word":"electrocoagulare","pos":"noun","definitions":["electrocoagulation"],"forms":{"plural":"electrocoagulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrocoagulare","accusative-definite-nominative-singular":"electrocoagularea","accusative-indefinite-nominative-plural":"electrocoagulări","accusative-definite-nominative-plural":"electrocoagulările","dative-genitive-indefinite-singular":"electrocoagulări","dative-definite-genitive-singular":"electrocoagulării","dative-genitive-indefinite-plural":"electrocoagulări","dative-definite-genitive-plural":"electrocoagulărilor","singular-vocative":"electrocoagulare","plural-vocative":"electrocoagulărilor"}},{"word":"electrocoagulat","pos":"adj","definitions":["electrocoagulated"],"forms":{"feminine-singular":"electrocoagulată","masculine-plural":"electrocoagulați","feminine-neuter-plural":"electrocoagulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocoagulat","error-unrecognized-form-feminine-indefinite-singular":"electrocoagulată","error-unrecognized-form-indefinite-masculine-plural":"electrocoagulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocoagulate","definite-error-unrecognized-form-masculine-neuter-singular":"electrocoagulatul","definite-error-unrecognized-form-feminine-singular":"electrocoagulata","definite-error-unrecognized-form-masculine-plural":"electrocoagulații","definite-error-unrecognized-form-feminine-neuter-plural":"electrocoagulatele"}},{"word":"electrocoagulat","pos":"verb","definitions":["past participle of electrocoagula"],"forms":{"participle-past":"of electrocoagula"}},{"word":"electrocomunicație","pos":"noun","definitions":["electrocommunication"],"forms":{"plural":"electrocomunicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrocomunicație","accusative-definite-nominative-singular":"electrocomunicația","accusative-indefinite-nominative-plural":"electrocomunicații","accusative-definite-nominative-plural":"electrocomunicațiile","dative-genitive-indefinite-singular":"electrocomunicații","dative-definite-genitive-singular":"electrocomunicației","dative-genitive-indefinite-plural":"electrocomunicații","dative-definite-genitive-plural":"electrocomunicațiilor","singular-vocative":"electrocomunicație","plural-vocative":"electrocomunicațiilor"}},{"word":"electroconductibilitate","pos":"noun","definitions":["electroconductibility"],"pronunciation":"[elektrokonduktibiliˈtate]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"electroconductibilitate","accusative-definite-nominative":"electroconductibilitatea","dative-genitive-indefinite":"electroconductibilități","dative-definite-genitive":"electroconductibilității","vocative":"electroconductibilitate"}},{"word":"electrocorticografie","pos":"noun","definitions":["electrocorticography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrocorticografie","accusative-definite-nominative":"electrocorticografia","dative-genitive-indefinite":"electrocorticografii","dative-definite-genitive":"electrocorticografiei","vocative":"electrocorticografie"}},{"word":"electrocorticogramă","pos":"noun","definitions":["electrocorticogram"],"forms":{"plural":"electrocorticograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrocorticogramă","accusative-definite-nominative-singular":"electrocorticograma","accusative-indefinite-nominative-plural":"electrocorticograme","accusative-definite-nominative-plural":"electrocorticogramele","dative-genitive-indefinite-singular":"electrocorticograme","dative-definite-genitive-singular":"electrocorticogramei","dative-genitive-indefinite-plural":"electrocorticograme","dative-definite-genitive-plural":"electrocorticogramelor","singular-vocative":"electrocorticogramă","plural-vocative":"electrocorticogramelor"}},{"word":"electrocultură","pos":"noun","definitions":["electroculture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electrocultură","accusative-definite-nominative":"electrocultura","dative-genitive-indefinite":"electroculture","dative-definite-genitive":"electroculturei","vocative":"electrocultură"}},{"word":"electrocuta","pos":"verb","definitions":["to electrocute"],"forms":{"canonical":"a electrocuta 1st conjugation","present-singular-third-person":"electrocutează","participle-past":"electrocutat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electrocuta","gerund":"electrocutând","first-person-indicative-present-singular":"electrocutez","indicative-present-second-person-singular":"electrocutezi","indicative-present-singular-third-person":"electrocutează","first-person-indicative-plural-present":"electrocutăm","indicative-plural-present-second-person":"electrocutați","indicative-plural-present-third-person":"electrocutează","first-person-imperfect-indicative-singular":"electrocutam","imperfect-indicative-second-person-singular":"electrocutai","imperfect-indicative-singular-third-person":"electrocuta","first-person-imperfect-indicative-plural":"electrocutam","imperfect-indicative-plural-second-person":"electrocutați","imperfect-indicative-plural-third-person":"electrocutau","first-person-indicative-perfect-singular":"electrocutai","indicative-perfect-second-person-singular":"electrocutași","indicative-perfect-singular-third-person":"electrocută","first-person-indicative-perfect-plural":"electrocutarăm","indicative-perfect-plural-second-person":"electrocutarăți","indicative-perfect-plural-third-person":"electrocutară","first-person-indicative-pluperfect-singular":"electrocutasem","indicative-pluperfect-second-person-singular":"electrocutaseși","indicative-pluperfect-singular-third-person":"electrocutase","first-person-indicative-pluperfect-plural":"electrocutaserăm","indicative-pluperfect-plural-second-person":"electrocutaserăți","indicative-pluperfect-plural-third-person":"electrocutaseră","first-person-present-singular-subjunctive":"să electrocutez","present-second-person-singular-subjunctive":"să electrocutezi","present-singular-subjunctive-third-person":"să electrocuteze","first-person-plural-present-subjunctive":"să electrocutăm","plural-present-second-person-subjunctive":"să electrocutați","plural-present-subjunctive-third-person":"să electrocuteze","imperative-second-person-singular":"electrocutează","imperative-plural-second-person":"electrocutați","imperative-negative-second-person-singular":"nu electrocuta","imperative-negative-plural-second-person":"nu electrocutați"}},{"word":"electrocutare","pos":"noun","definitions":["electrocution"],"forms":{"plural":"electrocutări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrocutare","accusative-definite-nominative-singular":"electrocutarea","accusative-indefinite-nominative-plural":"electrocutări","accusative-definite-nominative-plural":"electrocutările","dative-genitive-indefinite-singular":"electrocutări","dative-definite-genitive-singular":"electrocutării","dative-genitive-indefinite-plural":"electrocutări","dative-definite-genitive-plural":"electrocutărilor","singular-vocative":"electrocutare","plural-vocative":"electrocutărilor"}},{"word":"electrocutat","pos":"adj","definitions":["electrocuted"],"forms":{"feminine-singular":"electrocutată","masculine-plural":"electrocutați","feminine-neuter-plural":"electrocutate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrocutat","error-unrecognized-form-feminine-indefinite-singular":"electrocutată","error-unrecognized-form-indefinite-masculine-plural":"electrocutați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrocutate","definite-error-unrecognized-form-masculine-neuter-singular":"electrocutatul","definite-error-unrecognized-form-feminine-singular":"electrocutata","definite-error-unrecognized-form-masculine-plural":"electrocutații","definite-error-unrecognized-form-feminine-neuter-plural":"electrocutatele"}},{"word":"electrocutat","pos":"verb","definitions":["past participle of electrocuta"],"forms":{"participle-past":"of electrocuta"}},{"word":"electrocuțiune","pos":"noun","definitions":["electrocution (death or suicide by electric shock)"],"forms":{"plural":"electrocuțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrocuțiune","accusative-definite-nominative-singular":"electrocuțiunea","accusative-indefinite-nominative-plural":"electrocuțiuni","accusative-definite-nominative-plural":"electrocuțiunile","dative-genitive-indefinite-singular":"electrocuțiuni","dative-definite-genitive-singular":"electrocuțiunii","dative-genitive-indefinite-plural":"electrocuțiuni","dative-definite-genitive-plural":"electrocuțiunilor","singular-vocative":"electrocuțiune","plural-vocative":"electrocuțiunilor"}},{"word":"electrod","pos":"noun","definitions":["electrode"],"forms":{"plural":"electrozi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electrod","accusative-definite-nominative-singular":"electrodul","accusative-indefinite-nominative-plural":"electrozi","accusative-definite-nominative-plural":"electrozii","dative-genitive-indefinite-singular":"electrod","dative-definite-genitive-singular":"electrodului","dative-genitive-indefinite-plural":"electrozi","dative-definite-genitive-plural":"electrozilor","singular-vocative":"electrodule","plural-vocative":"electrozilor"}},{"word":"electrod de sticlă","pos":"noun","definitions":["glass electrode"],"forms":{"plural":"electrozi de sticlă"}},{"word":"electrodezintegrare","pos":"noun","definitions":["electrodisintegration"]},{"word":"electrodiagnostic","pos":"noun","definitions":["electrodiagnosis"],"forms":{"plural":"electrodiagnostice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrodiagnostic","accusative-definite-nominative-singular":"electrodiagnosticul","accusative-indefinite-nominative-plural":"electrodiagnostice","accusative-definite-nominative-plural":"electrodiagnosticele","dative-genitive-indefinite-singular":"electrodiagnostic","dative-definite-genitive-singular":"electrodiagnosticului","dative-genitive-indefinite-plural":"electrodiagnostice","dative-definite-genitive-plural":"electrodiagnosticelor","singular-vocative":"electrodiagnosticule","plural-vocative":"electrodiagnosticelor"}},{"word":"electrodiagnoză","pos":"noun","definitions":["electrodiagnosis"],"forms":{"plural":"electrodiagnoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrodiagnoză","accusative-definite-nominative-singular":"electrodiagnoza","accusative-indefinite-nominative-plural":"electrodiagnoze","accusative-definite-nominative-plural":"electrodiagnozele","dative-genitive-indefinite-singular":"electrodiagnoze","dative-definite-genitive-singular":"electrodiagnozei","dative-genitive-indefinite-plural":"electrodiagnoze","dative-definite-genitive-plural":"electrodiagnozelor","singular-vocative":"electrodiagnoză","plural-vocative":"electrodiagnozelor"}},{"word":"electrodializă","pos":"noun","definitions":["electrodialysis"],"forms":{"plural":"electrodialize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrodializă","accusative-definite-nominative-singular":"electrodializa","accusative-indefinite-nominative-plural":"electrodialize","accusative-definite-nominative-plural":"electrodializele","dative-genitive-indefinite-singular":"electrodialize","dative-definite-genitive-singular":"electrodializei","dative-genitive-indefinite-plural":"electrodialize","dative-definite-genitive-plural":"electrodializelor","singular-vocative":"electrodializă","plural-vocative":"electrodializelor"}},{"word":"electrodinamic","pos":"adj","definitions":["electrodynamic"],"forms":{"feminine-singular":"electrodinamică","masculine-plural":"electrodinamici","feminine-neuter-plural":"electrodinamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrodinamic","error-unrecognized-form-feminine-indefinite-singular":"electrodinamică","error-unrecognized-form-indefinite-masculine-plural":"electrodinamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrodinamice","definite-error-unrecognized-form-masculine-neuter-singular":"electrodinamicul","definite-error-unrecognized-form-feminine-singular":"electrodinamica","definite-error-unrecognized-form-masculine-plural":"electrodinamicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrodinamicele"}},{"word":"electrodinamică","pos":"noun","definitions":["electrodynamics"],"forms":{"plural":"electrodinamici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electrodinamică","accusative-definite-nominative-singular":"electrodinamica","accusative-indefinite-nominative-plural":"electrodinamici","accusative-definite-nominative-plural":"electrodinamicile","dative-genitive-indefinite-singular":"electrodinamici","dative-definite-genitive-singular":"electrodinamicii","dative-genitive-indefinite-plural":"electrodinamici","dative-definite-genitive-plural":"electrodinamicilor","singular-vocative":"electrodinamică","plural-vocative":"electrodinamicilor"}},{"word":"electrodinamică cuantică","pos":"noun","definitions":["quantum electrodynamics"]},{"word":"electrodinamism","pos":"noun","definitions":["electrodynamics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrodinamism","accusative-definite-nominative":"electrodinamismul","dative-genitive-indefinite":"electrodinamism","dative-definite-genitive":"electrodinamismului","vocative":"electrodinamismule"}},{"word":"electrodinamometru","pos":"noun","definitions":["electrodynamometer"],"forms":{"plural":"electrodinamometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrodinamometru","accusative-definite-nominative-singular":"electrodinamometruul","accusative-indefinite-nominative-plural":"electrodinamometre","accusative-definite-nominative-plural":"electrodinamometrele","dative-genitive-indefinite-singular":"electrodinamometru","dative-definite-genitive-singular":"electrodinamometruului","dative-genitive-indefinite-plural":"electrodinamometre","dative-definite-genitive-plural":"electrodinamometrelor","singular-vocative":"electrodinamometruule","plural-vocative":"electrodinamometrelor"}},{"word":"electroencefalograf","pos":"noun","definitions":["electroencephalograph"],"forms":{"plural":"electroencefalografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electroencefalograf","accusative-definite-nominative-singular":"electroencefalograful","accusative-indefinite-nominative-plural":"electroencefalografe","accusative-definite-nominative-plural":"electroencefalografele","dative-genitive-indefinite-singular":"electroencefalograf","dative-definite-genitive-singular":"electroencefalografului","dative-genitive-indefinite-plural":"electroencefalografe","dative-definite-genitive-plural":"electroencefalografelor","singular-vocative":"electroencefalografule","plural-vocative":"electroencefalografelor"}},{"word":"electroencefalografie","pos":"noun","definitions":["electroencephalography"],"forms":{"plural":"electroencefalografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electroencefalografie","accusative-definite-nominative-singular":"electroencefalografia","accusative-indefinite-nominative-plural":"electroencefalografii","accusative-definite-nominative-plural":"electroencefalografiile","dative-genitive-indefinite-singular":"electroencefalografii","dative-definite-genitive-singular":"electroencefalografiei","dative-genitive-indefinite-plural":"electroencefalografii","dative-definite-genitive-plural":"electroencefalografiilor","singular-vocative":"electroencefalografie","plural-vocative":"electroencefalografiilor"}},{"word":"electroencefalogramă","pos":"noun","definitions":["electroencephalogram"],"forms":{"plural":"electroencefalograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroencefalogramă","accusative-definite-nominative-singular":"electroencefalograma","accusative-indefinite-nominative-plural":"electroencefalograme","accusative-definite-nominative-plural":"electroencefalogramele","dative-genitive-indefinite-singular":"electroencefalograme","dative-definite-genitive-singular":"electroencefalogramei","dative-genitive-indefinite-plural":"electroencefalograme","dative-definite-genitive-plural":"electroencefalogramelor","singular-vocative":"electroencefalogramă","plural-vocative":"electroencefalogramelor"}},{"word":"electroenergetic","pos":"adj","definitions":["electric power"],"forms":{"feminine-singular":"electroenergetică","masculine-plural":"electroenergetici","feminine-neuter-plural":"electroenergetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroenergetic","error-unrecognized-form-feminine-indefinite-singular":"electroenergetică","error-unrecognized-form-indefinite-masculine-plural":"electroenergetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroenergetice","definite-error-unrecognized-form-masculine-neuter-singular":"electroenergeticul","definite-error-unrecognized-form-feminine-singular":"electroenergetica","definite-error-unrecognized-form-masculine-plural":"electroenergeticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroenergeticele"}},{"word":"electroeroziune","pos":"noun","definitions":["wire erosion"],"forms":{"plural":"electroeroziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electroeroziune","accusative-definite-nominative-singular":"electroeroziunea","accusative-indefinite-nominative-plural":"electroeroziuni","accusative-definite-nominative-plural":"electroeroziunile","dative-genitive-indefinite-singular":"electroeroziuni","dative-definite-genitive-singular":"electroeroziunii","dative-genitive-indefinite-plural":"electroeroziuni","dative-definite-genitive-plural":"electroeroziunilor","singular-vocative":"electroeroziune","plural-vocative":"electroeroziunilor"}},{"word":"electrofiltru","pos":"noun","definitions":["electrofilter"],"forms":{"plural":"electrofiltre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrofiltru","accusative-definite-nominative-singular":"electrofiltrul","accusative-indefinite-nominative-plural":"electrofiltre","accusative-definite-nominative-plural":"electrofiltrele","dative-genitive-indefinite-singular":"electrofiltru","dative-definite-genitive-singular":"electrofiltrului","dative-genitive-indefinite-plural":"electrofiltre","dative-definite-genitive-plural":"electrofiltrelor","singular-vocative":"electrofiltrule","plural-vocative":"electrofiltrelor"}},{"word":"electrofiziologie","pos":"noun","definitions":["electrophysiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrofiziologie","accusative-definite-nominative-singular":"electrofiziologia","accusative-indefinite-nominative-plural":"electrofiziologii","accusative-definite-nominative-plural":"electrofiziologiile","dative-genitive-indefinite-singular":"electrofiziologii","dative-definite-genitive-singular":"electrofiziologiei","dative-genitive-indefinite-plural":"electrofiziologii","dative-definite-genitive-plural":"electrofiziologiilor","singular-vocative":"electrofiziologie","plural-vocative":"electrofiziologiilor"}},{"word":"electrofon","pos":"noun","definitions":["electrophone"],"forms":{"plural":"electrofoni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrofon","accusative-definite-nominative-singular":"electrofonul","accusative-indefinite-nominative-plural":"electrofoni","accusative-definite-nominative-plural":"electrofonile","dative-genitive-indefinite-singular":"electrofon","dative-definite-genitive-singular":"electrofonului","dative-genitive-indefinite-plural":"electrofoni","dative-definite-genitive-plural":"electrofonilor","singular-vocative":"electrofonule","plural-vocative":"electrofonilor"}},{"word":"electrofor","pos":"noun","definitions":["electrophore"],"forms":{"plural":"electrofoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrofor","accusative-definite-nominative-singular":"electroforul","accusative-indefinite-nominative-plural":"electrofoare","accusative-definite-nominative-plural":"electrofoarele","dative-genitive-indefinite-singular":"electrofor","dative-definite-genitive-singular":"electroforului","dative-genitive-indefinite-plural":"electrofoare","dative-definite-genitive-plural":"electrofoarelor","singular-vocative":"electroforule","plural-vocative":"electrofoarelor"}},{"word":"electroforegramă","pos":"noun","definitions":["electropherogram"],"forms":{"plural":"electroforegrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroforegramă","accusative-definite-nominative-singular":"electroforegrama","accusative-indefinite-nominative-plural":"electroforegrame","accusative-definite-nominative-plural":"electroforegramele","dative-genitive-indefinite-singular":"electroforegrame","dative-definite-genitive-singular":"electroforegramei","dative-genitive-indefinite-plural":"electroforegrame","dative-definite-genitive-plural":"electroforegramelor","singular-vocative":"electroforegramă","plural-vocative":"electroforegramelor"}},{"word":"electroforetic","pos":"adj","definitions":["electrophoretic"],"forms":{"feminine-singular":"electroforetică","masculine-plural":"electroforetici","feminine-neuter-plural":"electroforetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroforetic","error-unrecognized-form-feminine-indefinite-singular":"electroforetică","error-unrecognized-form-indefinite-masculine-plural":"electroforetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroforetice","definite-error-unrecognized-form-masculine-neuter-singular":"electroforeticul","definite-error-unrecognized-form-feminine-singular":"electroforetica","definite-error-unrecognized-form-masculine-plural":"electroforeticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroforeticele"}},{"word":"electroforeză","pos":"noun","definitions":["electrophoresis"],"forms":{"plural":"electroforeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroforeză","accusative-definite-nominative-singular":"electroforeza","accusative-indefinite-nominative-plural":"electroforeze","accusative-definite-nominative-plural":"electroforezele","dative-genitive-indefinite-singular":"electroforeze","dative-definite-genitive-singular":"electroforezei","dative-genitive-indefinite-plural":"electroforeze","dative-definite-genitive-plural":"electroforezelor","singular-vocative":"electroforeză","plural-vocative":"electroforezelor"}},{"word":"electrofotografie","pos":"noun","definitions":["electrophotography"],"forms":{"plural":"electrofotografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrofotografie","accusative-definite-nominative-singular":"electrofotografia","accusative-indefinite-nominative-plural":"electrofotografii","accusative-definite-nominative-plural":"electrofotografiile","dative-genitive-indefinite-singular":"electrofotografii","dative-definite-genitive-singular":"electrofotografiei","dative-genitive-indefinite-plural":"electrofotografii","dative-definite-genitive-plural":"electrofotografiilor","singular-vocative":"electrofotografie","plural-vocative":"electrofotografiilor"}},{"word":"electrogalvanic","pos":"adj","definitions":["electrogalvanic"],"forms":{"feminine-singular":"electrogalvanică","masculine-plural":"electrogalvanici","feminine-neuter-plural":"electrogalvanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrogalvanic","error-unrecognized-form-feminine-indefinite-singular":"electrogalvanică","error-unrecognized-form-indefinite-masculine-plural":"electrogalvanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrogalvanice","definite-error-unrecognized-form-masculine-neuter-singular":"electrogalvanicul","definite-error-unrecognized-form-feminine-singular":"electrogalvanica","definite-error-unrecognized-form-masculine-plural":"electrogalvanicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrogalvanicele"}},{"word":"electrogalvanicesc","pos":"adj","definitions":["electrogalvanic"],"forms":{"feminine-singular":"electrogalvanicească","plural":"electrogalvanicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrogalvanicesc","error-unrecognized-form-feminine-indefinite-singular":"electrogalvanicească","error-unrecognized-form-indefinite-masculine-plural":"electrogalvanicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrogalvanicești","definite-error-unrecognized-form-masculine-neuter-singular":"electrogalvanicescul","definite-error-unrecognized-form-feminine-singular":"electrogalvaniceasca","definite-error-unrecognized-form-masculine-plural":"electrogalvaniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"electrogalvaniceștile"}},{"word":"electrogalvanism","pos":"noun","definitions":["electrogalvanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrogalvanism","accusative-definite-nominative":"electrogalvanismul","dative-genitive-indefinite":"electrogalvanism","dative-definite-genitive":"electrogalvanismului","vocative":"electrogalvanismule"}},{"word":"electrogen","pos":"adj","definitions":["electrogenic"],"forms":{"feminine-singular":"electrogenă","masculine-plural":"electrogeni","feminine-neuter-plural":"electrogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrogen","error-unrecognized-form-feminine-indefinite-singular":"electrogenă","error-unrecognized-form-indefinite-masculine-plural":"electrogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrogene","definite-error-unrecognized-form-masculine-neuter-singular":"electrogenul","definite-error-unrecognized-form-feminine-singular":"electrogena","definite-error-unrecognized-form-masculine-plural":"electrogenii","definite-error-unrecognized-form-feminine-neuter-plural":"electrogenele"}},{"word":"electroglotograf","pos":"noun","definitions":["electroglottograph"],"forms":{"plural":"electroglotografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electroglotograf","accusative-definite-nominative-singular":"electroglotograful","accusative-indefinite-nominative-plural":"electroglotografe","accusative-definite-nominative-plural":"electroglotografele","dative-genitive-indefinite-singular":"electroglotograf","dative-definite-genitive-singular":"electroglotografului","dative-genitive-indefinite-plural":"electroglotografe","dative-definite-genitive-plural":"electroglotografelor","singular-vocative":"electroglotografule","plural-vocative":"electroglotografelor"}},{"word":"electroglotogramă","pos":"noun","definitions":["electroglottogram"],"forms":{"plural":"electroglotograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroglotogramă","accusative-definite-nominative-singular":"electroglotograma","accusative-indefinite-nominative-plural":"electroglotograme","accusative-definite-nominative-plural":"electroglotogramele","dative-genitive-indefinite-singular":"electroglotograme","dative-definite-genitive-singular":"electroglotogramei","dative-genitive-indefinite-plural":"electroglotograme","dative-definite-genitive-plural":"electroglotogramelor","singular-vocative":"electroglotogramă","plural-vocative":"electroglotogramelor"}},{"word":"electroglotospectrografie","pos":"noun","definitions":["Method for determining the harmonic composition of speech signals by analyzing impulses obtained with an electroglotograph."],"forms":{"plural":"electroglotospectrografii"}},{"word":"electrograf","pos":"noun","definitions":["electrograph"],"forms":{"plural":"electrografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrograf","accusative-definite-nominative-singular":"electrograful","accusative-indefinite-nominative-plural":"electrografe","accusative-definite-nominative-plural":"electrografele","dative-genitive-indefinite-singular":"electrograf","dative-definite-genitive-singular":"electrografului","dative-genitive-indefinite-plural":"electrografe","dative-definite-genitive-plural":"electrografelor","singular-vocative":"electrografule","plural-vocative":"electrografelor"}},{"word":"electrografie","pos":"noun","definitions":["electrography"],"forms":{"plural":"electrografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrografie","accusative-definite-nominative-singular":"electrografia","accusative-indefinite-nominative-plural":"electrografii","accusative-definite-nominative-plural":"electrografiile","dative-genitive-indefinite-singular":"electrografii","dative-definite-genitive-singular":"electrografiei","dative-genitive-indefinite-plural":"electrografii","dative-definite-genitive-plural":"electrografiilor","singular-vocative":"electrografie","plural-vocative":"electrografiilor"}},{"word":"electrogravimetrie","pos":"noun","definitions":["electrogravimetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrogravimetrie","accusative-definite-nominative":"electrogravimetria","dative-genitive-indefinite":"electrogravimetrii","dative-definite-genitive":"electrogravimetriei","vocative":"electrogravimetrie"}},{"word":"electrogravură","pos":"noun","definitions":["electroengraving"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrogravură","accusative-definite-nominative-singular":"electrogravura","accusative-indefinite-nominative-plural":"electrogravure","accusative-definite-nominative-plural":"electrogravurele","dative-genitive-indefinite-singular":"electrogravure","dative-definite-genitive-singular":"electrogravurei","dative-genitive-indefinite-plural":"electrogravure","dative-definite-genitive-plural":"electrogravurelor","singular-vocative":"electrogravură","plural-vocative":"electrogravurelor"}},{"word":"electroizolant","pos":"adj","definitions":["electrical insulating"],"forms":{"feminine-singular":"electroizolantă","masculine-plural":"electroizolanți","feminine-neuter-plural":"electroizolante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroizolant","error-unrecognized-form-feminine-indefinite-singular":"electroizolantă","error-unrecognized-form-indefinite-masculine-plural":"electroizolanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroizolante","definite-error-unrecognized-form-masculine-neuter-singular":"electroizolantul","definite-error-unrecognized-form-feminine-singular":"electroizolanta","definite-error-unrecognized-form-masculine-plural":"electroizolanții","definite-error-unrecognized-form-feminine-neuter-plural":"electroizolantele"}},{"word":"electrolit","pos":"noun","definitions":["electrolyte"],"forms":{"plural":"electroliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electrolit","accusative-definite-nominative-singular":"electrolitul","accusative-indefinite-nominative-plural":"electroliți","accusative-definite-nominative-plural":"electroliții","dative-genitive-indefinite-singular":"electrolit","dative-definite-genitive-singular":"electrolitului","dative-genitive-indefinite-plural":"electroliți","dative-definite-genitive-plural":"electroliților","singular-vocative":"electrolitule","plural-vocative":"electroliților"}},{"word":"electrolitic","pos":"adj","definitions":["electrolytic"],"forms":{"feminine-singular":"electrolitică","masculine-plural":"electrolitici","feminine-neuter-plural":"electrolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrolitic","error-unrecognized-form-feminine-indefinite-singular":"electrolitică","error-unrecognized-form-indefinite-masculine-plural":"electrolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrolitice","definite-error-unrecognized-form-masculine-neuter-singular":"electroliticul","definite-error-unrecognized-form-feminine-singular":"electrolitica","definite-error-unrecognized-form-masculine-plural":"electroliticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroliticele"}},{"word":"electroliza","pos":"verb","definitions":["to electrolyze"],"forms":{"canonical":"a electroliza 1st conjugation","present-singular-third-person":"electrolizează","participle-past":"electrolizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electroliza","gerund":"electrolizând","first-person-indicative-present-singular":"electrolizez","indicative-present-second-person-singular":"electrolizezi","indicative-present-singular-third-person":"electrolizează","first-person-indicative-plural-present":"electrolizăm","indicative-plural-present-second-person":"electrolizați","indicative-plural-present-third-person":"electrolizează","first-person-imperfect-indicative-singular":"electrolizam","imperfect-indicative-second-person-singular":"electrolizai","imperfect-indicative-singular-third-person":"electroliza","first-person-imperfect-indicative-plural":"electrolizam","imperfect-indicative-plural-second-person":"electrolizați","imperfect-indicative-plural-third-person":"electrolizau","first-person-indicative-perfect-singular":"electrolizai","indicative-perfect-second-person-singular":"electrolizași","indicative-perfect-singular-third-person":"electroliză","first-person-indicative-perfect-plural":"electrolizarăm","indicative-perfect-plural-second-person":"electrolizarăți","indicative-perfect-plural-third-person":"electrolizară","first-person-indicative-pluperfect-singular":"electrolizasem","indicative-pluperfect-second-person-singular":"electrolizaseși","indicative-pluperfect-singular-third-person":"electrolizase","first-person-indicative-pluperfect-plural":"electrolizaserăm","indicative-pluperfect-plural-second-person":"electrolizaserăți","indicative-pluperfect-plural-third-person":"electrolizaseră","first-person-present-singular-subjunctive":"să electrolizez","present-second-person-singular-subjunctive":"să electrolizezi","present-singular-subjunctive-third-person":"să electrolizeze","first-person-plural-present-subjunctive":"să electrolizăm","plural-present-second-person-subjunctive":"să electrolizați","plural-present-subjunctive-third-person":"să electrolizeze","imperative-second-person-singular":"electrolizează","imperative-plural-second-person":"electrolizați","imperative-negative-second-person-singular":"nu electroliza","imperative-negative-plural-second-person":"nu electrolizați"}},{"word":"electroliză","pos":"noun","definitions":["electrolysis"],"forms":{"plural":"electrolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroliză","accusative-definite-nominative-singular":"electroliza","accusative-indefinite-nominative-plural":"electrolize","accusative-definite-nominative-plural":"electrolizele","dative-genitive-indefinite-singular":"electrolize","dative-definite-genitive-singular":"electrolizei","dative-genitive-indefinite-plural":"electrolize","dative-definite-genitive-plural":"electrolizelor","singular-vocative":"electroliză","plural-vocative":"electrolizelor"}},{"word":"electrolizabil","pos":"adj","definitions":["electrolyzable"],"forms":{"feminine-singular":"electrolizabilă","masculine-plural":"electrolizabili","feminine-neuter-plural":"electrolizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrolizabil","error-unrecognized-form-feminine-indefinite-singular":"electrolizabilă","error-unrecognized-form-indefinite-masculine-plural":"electrolizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrolizabile","definite-error-unrecognized-form-masculine-neuter-singular":"electrolizabilul","definite-error-unrecognized-form-feminine-singular":"electrolizabila","definite-error-unrecognized-form-masculine-plural":"electrolizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"electrolizabilele"}},{"word":"electrolizor","pos":"noun","definitions":["electrolyzer"],"forms":{"plural":"electrolizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrolizor","accusative-definite-nominative-singular":"electrolizorul","accusative-indefinite-nominative-plural":"electrolizoare","accusative-definite-nominative-plural":"electrolizoarele","dative-genitive-indefinite-singular":"electrolizor","dative-definite-genitive-singular":"electrolizorului","dative-genitive-indefinite-plural":"electrolizoare","dative-definite-genitive-plural":"electrolizoarelor","singular-vocative":"electrolizorule","plural-vocative":"electrolizoarelor"}},{"word":"electroluminescent","pos":"adj","definitions":["electroluminescent"],"forms":{"feminine-singular":"electroluminescentă","masculine-plural":"electroluminescenți","feminine-neuter-plural":"electroluminescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroluminescent","error-unrecognized-form-feminine-indefinite-singular":"electroluminescentă","error-unrecognized-form-indefinite-masculine-plural":"electroluminescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroluminescente","definite-error-unrecognized-form-masculine-neuter-singular":"electroluminescentul","definite-error-unrecognized-form-feminine-singular":"electroluminescenta","definite-error-unrecognized-form-masculine-plural":"electroluminescenții","definite-error-unrecognized-form-feminine-neuter-plural":"electroluminescentele"}},{"word":"electroluminescență","pos":"noun","definitions":["electroluminescence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroluminescență","accusative-definite-nominative-singular":"electroluminescența","accusative-indefinite-nominative-plural":"electroluminescențe","accusative-definite-nominative-plural":"electroluminescențele","dative-genitive-indefinite-singular":"electroluminescențe","dative-definite-genitive-singular":"electroluminescenței","dative-genitive-indefinite-plural":"electroluminescențe","dative-definite-genitive-plural":"electroluminescențelor","singular-vocative":"electroluminescență","plural-vocative":"electroluminescențelor"}},{"word":"electroluminiscență","pos":"noun","definitions":["alternative form of electroluminescență"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electroluminiscență","accusative-definite-nominative":"electroluminiscența","dative-genitive-indefinite":"electroluminiscențe","dative-definite-genitive":"electroluminiscenței","vocative":"electroluminiscență"}},{"word":"electromagnet","pos":"noun","definitions":["electromagnet"],"forms":{"plural":"electromagneți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electromagnet","accusative-definite-nominative-singular":"electromagnetul","accusative-indefinite-nominative-plural":"electromagneți","accusative-definite-nominative-plural":"electromagneții","dative-genitive-indefinite-singular":"electromagnet","dative-definite-genitive-singular":"electromagnetului","dative-genitive-indefinite-plural":"electromagneți","dative-definite-genitive-plural":"electromagneților","singular-vocative":"electromagnetule","plural-vocative":"electromagneților"}},{"word":"electromagnetic","pos":"adj","definitions":["Electromagnetic."],"pronunciation":"/eˌlek.tro.maɡˈne.tik/","forms":{"canonical-masculine-neuter":"electromagnétic","feminine-singular":"electromagnetică","masculine-plural":"electromagnetici","feminine-neuter-plural":"electromagnetice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"electromagnetic","error-unrecognized-form-feminine-indefinite-singular":"electromagnetică","error-unrecognized-form-indefinite-masculine-plural":"electromagnetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electromagnetice","definite-error-unrecognized-form-masculine-neuter-singular":"electromagneticul","definite-error-unrecognized-form-feminine-singular":"electromagnetica","definite-error-unrecognized-form-masculine-plural":"electromagneticii","definite-error-unrecognized-form-feminine-neuter-plural":"electromagneticele"}},{"word":"electromagnetică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of electromagnetic"]},{"word":"electromagnetism","pos":"noun","definitions":["electromagnetism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electromagnetism","accusative-definite-nominative":"electromagnetismul","dative-genitive-indefinite":"electromagnetism","dative-definite-genitive":"electromagnetismului","vocative":"electromagnetismule"}},{"word":"electromasaj","pos":"noun","definitions":["electromassage"],"forms":{"plural":"electromasaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electromasaj","accusative-definite-nominative-singular":"electromasajul","accusative-indefinite-nominative-plural":"electromasaje","accusative-definite-nominative-plural":"electromasajele","dative-genitive-indefinite-singular":"electromasaj","dative-definite-genitive-singular":"electromasajului","dative-genitive-indefinite-plural":"electromasaje","dative-definite-genitive-plural":"electromasajelor","singular-vocative":"electromasajule","plural-vocative":"electromasajelor"}},{"word":"electromecanic","pos":"adj","definitions":["electromechanical"],"forms":{"feminine-singular":"electromecanică","masculine-plural":"electromecanici","feminine-neuter-plural":"electromecanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electromecanic","error-unrecognized-form-feminine-indefinite-singular":"electromecanică","error-unrecognized-form-indefinite-masculine-plural":"electromecanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electromecanice","definite-error-unrecognized-form-masculine-neuter-singular":"electromecanicul","definite-error-unrecognized-form-feminine-singular":"electromecanica","definite-error-unrecognized-form-masculine-plural":"electromecanicii","definite-error-unrecognized-form-feminine-neuter-plural":"electromecanicele"}},{"word":"electromecanică","pos":"noun","definitions":["electromechanics"],"forms":{"plural":"electromecanici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electromecanică","accusative-definite-nominative-singular":"electromecanica","accusative-indefinite-nominative-plural":"electromecanici","accusative-definite-nominative-plural":"electromecanicile","dative-genitive-indefinite-singular":"electromecanici","dative-definite-genitive-singular":"electromecanicii","dative-genitive-indefinite-plural":"electromecanici","dative-definite-genitive-plural":"electromecanicilor","singular-vocative":"electromecanică","plural-vocative":"electromecanicilor"}},{"word":"electromenajer","pos":"adj","definitions":["home appliance"],"forms":{"feminine-singular":"electromenajeră","masculine-plural":"electromenajeri","feminine-neuter-plural":"electromenajere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electromenajer","error-unrecognized-form-feminine-indefinite-singular":"electromenajeră","error-unrecognized-form-indefinite-masculine-plural":"electromenajeri","error-unrecognized-form-feminine-indefinite-neuter-plural":"electromenajere","definite-error-unrecognized-form-masculine-neuter-singular":"electromenajerul","definite-error-unrecognized-form-feminine-singular":"electromenajera","definite-error-unrecognized-form-masculine-plural":"electromenajerii","definite-error-unrecognized-form-feminine-neuter-plural":"electromenajerele"}},{"word":"electrometalurgic","pos":"adj","definitions":["electrometallurgical"],"forms":{"feminine-singular":"electrometalurgică","masculine-plural":"electrometalurgici","feminine-neuter-plural":"electrometalurgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrometalurgic","error-unrecognized-form-feminine-indefinite-singular":"electrometalurgică","error-unrecognized-form-indefinite-masculine-plural":"electrometalurgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrometalurgice","definite-error-unrecognized-form-masculine-neuter-singular":"electrometalurgicul","definite-error-unrecognized-form-feminine-singular":"electrometalurgica","definite-error-unrecognized-form-masculine-plural":"electrometalurgicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrometalurgicele"}},{"word":"electrometalurgie","pos":"noun","definitions":["electrometallurgy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrometalurgie","accusative-definite-nominative":"electrometalurgia","dative-genitive-indefinite":"electrometalurgii","dative-definite-genitive":"electrometalurgiei","vocative":"electrometalurgie"}},{"word":"electrometalurgist","pos":"noun","definitions":["electrometallurgist"],"forms":{"plural":"electrometalurgiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electrometalurgist","accusative-definite-nominative-singular":"electrometalurgistul","accusative-indefinite-nominative-plural":"electrometalurgiști","accusative-definite-nominative-plural":"electrometalurgiștii","dative-genitive-indefinite-singular":"electrometalurgist","dative-definite-genitive-singular":"electrometalurgistului","dative-genitive-indefinite-plural":"electrometalurgiști","dative-definite-genitive-plural":"electrometalurgiștilor","singular-vocative":"electrometalurgistule","plural-vocative":"electrometalurgiștilor"}},{"word":"electrometric","pos":"adj","definitions":["electrometric"],"forms":{"feminine-singular":"electrometrică","masculine-plural":"electrometrici","feminine-neuter-plural":"electrometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrometric","error-unrecognized-form-feminine-indefinite-singular":"electrometrică","error-unrecognized-form-indefinite-masculine-plural":"electrometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrometrice","definite-error-unrecognized-form-masculine-neuter-singular":"electrometricul","definite-error-unrecognized-form-feminine-singular":"electrometrica","definite-error-unrecognized-form-masculine-plural":"electrometricii","definite-error-unrecognized-form-feminine-neuter-plural":"electrometricele"}},{"word":"electrometrie","pos":"noun","definitions":["electrometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrometrie","accusative-definite-nominative":"electrometria","dative-genitive-indefinite":"electrometrii","dative-definite-genitive":"electrometriei","vocative":"electrometrie"}},{"word":"electrometru","pos":"noun","definitions":["electrometer"],"forms":{"plural":"electrometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrometru","accusative-definite-nominative-singular":"electrometrul","accusative-indefinite-nominative-plural":"electrometre","accusative-definite-nominative-plural":"electrometrele","dative-genitive-indefinite-singular":"electrometru","dative-definite-genitive-singular":"electrometrului","dative-genitive-indefinite-plural":"electrometre","dative-definite-genitive-plural":"electrometrelor","singular-vocative":"electrometrule","plural-vocative":"electrometrelor"}},{"word":"electromicroscopie","pos":"noun","definitions":["electron microscopy"],"forms":{"plural":"electromicroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electromicroscopie","accusative-definite-nominative-singular":"electromicroscopia","accusative-indefinite-nominative-plural":"electromicroscopii","accusative-definite-nominative-plural":"electromicroscopiile","dative-genitive-indefinite-singular":"electromicroscopii","dative-definite-genitive-singular":"electromicroscopiei","dative-genitive-indefinite-plural":"electromicroscopii","dative-definite-genitive-plural":"electromicroscopiilor","singular-vocative":"electromicroscopie","plural-vocative":"electromicroscopiilor"}},{"word":"electromiograf","pos":"noun","definitions":["electromyograph"],"forms":{"plural":"electromiografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electromiograf","accusative-definite-nominative-singular":"electromiograful","accusative-indefinite-nominative-plural":"electromiografe","accusative-definite-nominative-plural":"electromiografele","dative-genitive-indefinite-singular":"electromiograf","dative-definite-genitive-singular":"electromiografului","dative-genitive-indefinite-plural":"electromiografe","dative-definite-genitive-plural":"electromiografelor","singular-vocative":"electromiografule","plural-vocative":"electromiografelor"}},{"word":"electromiografie","pos":"noun","definitions":["electromyography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electromiografie","accusative-definite-nominative":"electromiografia","dative-genitive-indefinite":"electromiografii","dative-definite-genitive":"electromiografiei","vocative":"electromiografie"}},{"word":"electromiogramă","pos":"noun","definitions":["electromyogram"],"forms":{"plural":"electromiograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electromiogramă","accusative-definite-nominative-singular":"electromiograma","accusative-indefinite-nominative-plural":"electromiograme","accusative-definite-nominative-plural":"electromiogramele","dative-genitive-indefinite-singular":"electromiograme","dative-definite-genitive-singular":"electromiogramei","dative-genitive-indefinite-plural":"electromiograme","dative-definite-genitive-plural":"electromiogramelor","singular-vocative":"electromiogramă","plural-vocative":"electromiogramelor"}},{"word":"electromobil","pos":"noun","definitions":["electric car"],"forms":{"plural":"electromobile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electromobil","accusative-definite-nominative-singular":"electromobilul","accusative-indefinite-nominative-plural":"electromobile","accusative-definite-nominative-plural":"electromobilele","dative-genitive-indefinite-singular":"electromobil","dative-definite-genitive-singular":"electromobilului","dative-genitive-indefinite-plural":"electromobile","dative-definite-genitive-plural":"electromobilelor","singular-vocative":"electromobilule","plural-vocative":"electromobilelor"}},{"word":"electromotor","pos":"noun","definitions":["electromotor"],"forms":{"plural":"electromotori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electromotor","accusative-definite-nominative-singular":"electromotorul","accusative-indefinite-nominative-plural":"electromotori","accusative-definite-nominative-plural":"electromotorile","dative-genitive-indefinite-singular":"electromotor","dative-definite-genitive-singular":"electromotorului","dative-genitive-indefinite-plural":"electromotori","dative-definite-genitive-plural":"electromotorilor","singular-vocative":"electromotorule","plural-vocative":"electromotorilor"}},{"word":"electromuscular","pos":"adj","definitions":["electromuscular"],"forms":{"feminine-singular":"electromusculară","masculine-plural":"electromusculari","feminine-neuter-plural":"electromusculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electromuscular","error-unrecognized-form-feminine-indefinite-singular":"electromusculară","error-unrecognized-form-indefinite-masculine-plural":"electromusculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"electromusculare","definite-error-unrecognized-form-masculine-neuter-singular":"electromuscularul","definite-error-unrecognized-form-feminine-singular":"electromusculara","definite-error-unrecognized-form-masculine-plural":"electromuscularii","definite-error-unrecognized-form-feminine-neuter-plural":"electromuscularele"}},{"word":"electron","pos":"noun","definitions":["electron"],"forms":{"plural":"electroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electron","accusative-definite-nominative-singular":"electronul","accusative-indefinite-nominative-plural":"electroni","accusative-definite-nominative-plural":"electronii","dative-genitive-indefinite-singular":"electron","dative-definite-genitive-singular":"electronului","dative-genitive-indefinite-plural":"electroni","dative-definite-genitive-plural":"electronilor","singular-vocative":"electronule","plural-vocative":"electronilor"}},{"word":"electron-volt","pos":"noun","definitions":["electron volt"],"forms":{"plural":"electron-volți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electron-volt","accusative-definite-nominative-singular":"electron-voltul","accusative-indefinite-nominative-plural":"electron-volți","accusative-definite-nominative-plural":"electron-volții","dative-genitive-indefinite-singular":"electron-volt","dative-definite-genitive-singular":"electron-voltului","dative-genitive-indefinite-plural":"electron-volți","dative-definite-genitive-plural":"electron-volților","singular-vocative":"electron-voltule","plural-vocative":"electron-volților"}},{"word":"electronarcoză","pos":"noun","definitions":["electronarcosis"],"forms":{"plural":"electronarcoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electronarcoză","accusative-definite-nominative-singular":"electronarcoza","accusative-indefinite-nominative-plural":"electronarcoze","accusative-definite-nominative-plural":"electronarcozele","dative-genitive-indefinite-singular":"electronarcoze","dative-definite-genitive-singular":"electronarcozei","dative-genitive-indefinite-plural":"electronarcoze","dative-definite-genitive-plural":"electronarcozelor","singular-vocative":"electronarcoză","plural-vocative":"electronarcozelor"}},{"word":"electronegativ","pos":"adj","definitions":["electronegative"],"forms":{"feminine-singular":"electronegativă","masculine-plural":"electronegativi","feminine-neuter-plural":"electronegative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electronegativ","error-unrecognized-form-feminine-indefinite-singular":"electronegativă","error-unrecognized-form-indefinite-masculine-plural":"electronegativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"electronegative","definite-error-unrecognized-form-masculine-neuter-singular":"electronegativul","definite-error-unrecognized-form-feminine-singular":"electronegativa","definite-error-unrecognized-form-masculine-plural":"electronegativii","definite-error-unrecognized-form-feminine-neuter-plural":"electronegativele"}},{"word":"electronegativitate","pos":"noun","definitions":["electronegativity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electronegativitate","accusative-definite-nominative-singular":"electronegativitatea","accusative-indefinite-nominative-plural":"electronegativități","accusative-definite-nominative-plural":"electronegativitățile","dative-genitive-indefinite-singular":"electronegativități","dative-definite-genitive-singular":"electronegativității","dative-genitive-indefinite-plural":"electronegativități","dative-definite-genitive-plural":"electronegativităților","singular-vocative":"electronegativitate","plural-vocative":"electronegativităților"}},{"word":"electroneutralitate","pos":"noun","definitions":["electroneutrality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"electroneutralitate","accusative-definite-nominative":"electroneutralitatea","dative-genitive-indefinite":"electroneutralități","dative-definite-genitive":"electroneutralității","vocative":"electroneutralitate"}},{"word":"electronic","pos":"adj","definitions":["electronic"],"forms":{"feminine-singular":"electronică","masculine-plural":"electronici","feminine-neuter-plural":"electronice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electronic","error-unrecognized-form-feminine-indefinite-singular":"electronică","error-unrecognized-form-indefinite-masculine-plural":"electronici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electronice","definite-error-unrecognized-form-masculine-neuter-singular":"electronicul","definite-error-unrecognized-form-feminine-singular":"electronica","definite-error-unrecognized-form-masculine-plural":"electronicii","definite-error-unrecognized-form-feminine-neuter-plural":"electronicele"}},{"word":"electronică","pos":"noun","definitions":["electronics"],"forms":{"plural":"electronici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electronică","accusative-definite-nominative-singular":"electronica","accusative-indefinite-nominative-plural":"electronici","accusative-definite-nominative-plural":"electronicile","dative-genitive-indefinite-singular":"electronici","dative-definite-genitive-singular":"electronicii","dative-genitive-indefinite-plural":"electronici","dative-definite-genitive-plural":"electronicilor","singular-vocative":"electronică","plural-vocative":"electronicilor"}},{"word":"electronician","pos":"noun","definitions":["electronicist"],"forms":{"plural":"electronicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electronician","accusative-definite-nominative-singular":"electronicianul","accusative-indefinite-nominative-plural":"electronicieni","accusative-definite-nominative-plural":"electronicienii","dative-genitive-indefinite-singular":"electronician","dative-definite-genitive-singular":"electronicianului","dative-genitive-indefinite-plural":"electronicieni","dative-definite-genitive-plural":"electronicienilor","singular-vocative":"electronicianule","plural-vocative":"electronicienilor"}},{"word":"electronist","pos":"noun","definitions":["electronicist"],"forms":{"plural":"electroniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electronist","accusative-definite-nominative-singular":"electronistul","accusative-indefinite-nominative-plural":"electroniști","accusative-definite-nominative-plural":"electroniștii","dative-genitive-indefinite-singular":"electronist","dative-definite-genitive-singular":"electronistului","dative-genitive-indefinite-plural":"electroniști","dative-definite-genitive-plural":"electroniștilor","singular-vocative":"electronistule","plural-vocative":"electroniștilor"}},{"word":"electronistă","pos":"noun","definitions":["female equivalent of electronist"],"forms":{"plural":"electroniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electronistă","accusative-definite-nominative-singular":"electronista","accusative-indefinite-nominative-plural":"electroniste","accusative-definite-nominative-plural":"electronistele","dative-genitive-indefinite-singular":"electroniste","dative-definite-genitive-singular":"electronistei","dative-genitive-indefinite-plural":"electroniste","dative-definite-genitive-plural":"electronistelor","singular-vocative":"electronistă","plural-vocative":"electronistelor"}},{"word":"electroniza","pos":"verb","definitions":["to electronize"],"forms":{"canonical":"a electroniza 1st conjugation","present-singular-third-person":"electronizează","participle-past":"electronizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a electroniza","gerund":"electronizând","first-person-indicative-present-singular":"electronizez","indicative-present-second-person-singular":"electronizezi","indicative-present-singular-third-person":"electronizează","first-person-indicative-plural-present":"electronizăm","indicative-plural-present-second-person":"electronizați","indicative-plural-present-third-person":"electronizează","first-person-imperfect-indicative-singular":"electronizam","imperfect-indicative-second-person-singular":"electronizai","imperfect-indicative-singular-third-person":"electroniza","first-person-imperfect-indicative-plural":"electronizam","imperfect-indicative-plural-second-person":"electronizați","imperfect-indicative-plural-third-person":"electronizau","first-person-indicative-perfect-singular":"electronizai","indicative-perfect-second-person-singular":"electronizași","indicative-perfect-singular-third-person":"electroniză","first-person-indicative-perfect-plural":"electronizarăm","indicative-perfect-plural-second-person":"electronizarăți","indicative-perfect-plural-third-person":"electronizară","first-person-indicative-pluperfect-singular":"electronizasem","indicative-pluperfect-second-person-singular":"electronizaseși","indicative-pluperfect-singular-third-person":"electronizase","first-person-indicative-pluperfect-plural":"electronizaserăm","indicative-pluperfect-plural-second-person":"electronizaserăți","indicative-pluperfect-plural-third-person":"electronizaseră","first-person-present-singular-subjunctive":"să electronizez","present-second-person-singular-subjunctive":"să electronizezi","present-singular-subjunctive-third-person":"să electronizeze","first-person-plural-present-subjunctive":"să electronizăm","plural-present-second-person-subjunctive":"să electronizați","plural-present-subjunctive-third-person":"să electronizeze","imperative-second-person-singular":"electronizează","imperative-plural-second-person":"electronizați","imperative-negative-second-person-singular":"nu electroniza","imperative-negative-plural-second-person":"nu electronizați"}},{"word":"electronizare","pos":"noun","definitions":["electronization"],"forms":{"plural":"electronizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electronizare","accusative-definite-nominative-singular":"electronizarea","accusative-indefinite-nominative-plural":"electronizări","accusative-definite-nominative-plural":"electronizările","dative-genitive-indefinite-singular":"electronizări","dative-definite-genitive-singular":"electronizării","dative-genitive-indefinite-plural":"electronizări","dative-definite-genitive-plural":"electronizărilor","singular-vocative":"electronizare","plural-vocative":"electronizărilor"}},{"word":"electronizat","pos":"adj","definitions":["electronic"],"forms":{"feminine-singular":"electronizată","masculine-plural":"electronizați","feminine-neuter-plural":"electronizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electronizat","error-unrecognized-form-feminine-indefinite-singular":"electronizată","error-unrecognized-form-indefinite-masculine-plural":"electronizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"electronizate","definite-error-unrecognized-form-masculine-neuter-singular":"electronizatul","definite-error-unrecognized-form-feminine-singular":"electronizata","definite-error-unrecognized-form-masculine-plural":"electronizații","definite-error-unrecognized-form-feminine-neuter-plural":"electronizatele"}},{"word":"electronizat","pos":"verb","definitions":["past participle of electroniza"],"forms":{"participle-past":"of electroniza"}},{"word":"electronograf","pos":"noun","definitions":["electronograph"],"forms":{"plural":"electronografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electronograf","accusative-definite-nominative-singular":"electronograful","accusative-indefinite-nominative-plural":"electronografe","accusative-definite-nominative-plural":"electronografele","dative-genitive-indefinite-singular":"electronograf","dative-definite-genitive-singular":"electronografului","dative-genitive-indefinite-plural":"electronografe","dative-definite-genitive-plural":"electronografelor","singular-vocative":"electronografule","plural-vocative":"electronografelor"}},{"word":"electronografic","pos":"adj","definitions":["electronographic"],"forms":{"feminine-singular":"electronografică","masculine-plural":"electronografici","feminine-neuter-plural":"electronografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electronografic","error-unrecognized-form-feminine-indefinite-singular":"electronografică","error-unrecognized-form-indefinite-masculine-plural":"electronografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electronografice","definite-error-unrecognized-form-masculine-neuter-singular":"electronograficul","definite-error-unrecognized-form-feminine-singular":"electronografica","definite-error-unrecognized-form-masculine-plural":"electronograficii","definite-error-unrecognized-form-feminine-neuter-plural":"electronograficele"}},{"word":"electronografie","pos":"noun","definitions":["electrography"],"forms":{"plural":"electronografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electronografie","accusative-definite-nominative-singular":"electronografia","accusative-indefinite-nominative-plural":"electronografii","accusative-definite-nominative-plural":"electronografiile","dative-genitive-indefinite-singular":"electronografii","dative-definite-genitive-singular":"electronografiei","dative-genitive-indefinite-plural":"electronografii","dative-definite-genitive-plural":"electronografiilor","singular-vocative":"electronografie","plural-vocative":"electronografiilor"}},{"word":"electronopunctură","pos":"noun","definitions":["electropuncture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electronopunctură","accusative-definite-nominative":"electronopunctura","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"electronopunctură"}},{"word":"electronvolt","pos":"noun","definitions":["electron volt"],"forms":{"plural":"electronvolți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electronvolt","accusative-definite-nominative-singular":"electronvoltul","accusative-indefinite-nominative-plural":"electronvolți","accusative-definite-nominative-plural":"electronvolții","dative-genitive-indefinite-singular":"electronvolt","dative-definite-genitive-singular":"electronvoltului","dative-genitive-indefinite-plural":"electronvolți","dative-definite-genitive-plural":"electronvolților","singular-vocative":"electronvoltule","plural-vocative":"electronvolților"}},{"word":"electrooptică","pos":"noun","definitions":["electrooptics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrooptică","accusative-definite-nominative-singular":"electrooptica","accusative-indefinite-nominative-plural":"electrooptice","accusative-definite-nominative-plural":"electroopticele","dative-genitive-indefinite-singular":"electrooptice","dative-definite-genitive-singular":"electroopticei","dative-genitive-indefinite-plural":"electrooptice","dative-definite-genitive-plural":"electroopticelor","singular-vocative":"electrooptică","plural-vocative":"electroopticelor"}},{"word":"electroosmotic","pos":"adj","definitions":["electroosmotic"],"forms":{"feminine-singular":"electroosmotică","masculine-plural":"electroosmotici","feminine-neuter-plural":"electroosmotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroosmotic","error-unrecognized-form-feminine-indefinite-singular":"electroosmotică","error-unrecognized-form-indefinite-masculine-plural":"electroosmotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroosmotice","definite-error-unrecognized-form-masculine-neuter-singular":"electroosmoticul","definite-error-unrecognized-form-feminine-singular":"electroosmotica","definite-error-unrecognized-form-masculine-plural":"electroosmoticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroosmoticele"}},{"word":"electroosmoză","pos":"noun","definitions":["electroosmosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electroosmoză","accusative-definite-nominative-singular":"electroosmoza","accusative-indefinite-nominative-plural":"electroosmoze","accusative-definite-nominative-plural":"electroosmozele","dative-genitive-indefinite-singular":"electroosmoze","dative-definite-genitive-singular":"electroosmozei","dative-genitive-indefinite-plural":"electroosmoze","dative-definite-genitive-plural":"electroosmozelor","singular-vocative":"electroosmoză","plural-vocative":"electroosmozelor"}},{"word":"electropatologie","pos":"noun","definitions":["electropathology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electropatologie","accusative-definite-nominative-singular":"electropatologia","accusative-indefinite-nominative-plural":"electropatologii","accusative-definite-nominative-plural":"electropatologiile","dative-genitive-indefinite-singular":"electropatologii","dative-definite-genitive-singular":"electropatologiei","dative-genitive-indefinite-plural":"electropatologii","dative-definite-genitive-plural":"electropatologiilor","singular-vocative":"electropatologie","plural-vocative":"electropatologiilor"}},{"word":"electroporțelan","pos":"noun","definitions":["electric porcelain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electroporțelan","accusative-definite-nominative":"electroporțelanul","dative-genitive-indefinite":"electroporțelan","dative-definite-genitive":"electroporțelanului","vocative":"electroporțelanule"}},{"word":"electropozitiv","pos":"adj","definitions":["electropositive"],"forms":{"feminine-singular":"electropozitivă","masculine-plural":"electropozitivi","feminine-neuter-plural":"electropozitive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electropozitiv","error-unrecognized-form-feminine-indefinite-singular":"electropozitivă","error-unrecognized-form-indefinite-masculine-plural":"electropozitivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"electropozitive","definite-error-unrecognized-form-masculine-neuter-singular":"electropozitivul","definite-error-unrecognized-form-feminine-singular":"electropozitiva","definite-error-unrecognized-form-masculine-plural":"electropozitivii","definite-error-unrecognized-form-feminine-neuter-plural":"electropozitivele"}},{"word":"electropozitivitate","pos":"noun","definitions":["electropositivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electropozitivitate","accusative-definite-nominative-singular":"electropozitivitatea","accusative-indefinite-nominative-plural":"electropozitivități","accusative-definite-nominative-plural":"electropozitivitățile","dative-genitive-indefinite-singular":"electropozitivități","dative-definite-genitive-singular":"electropozitivității","dative-genitive-indefinite-plural":"electropozitivități","dative-definite-genitive-plural":"electropozitivităților","singular-vocative":"electropozitivitate","plural-vocative":"electropozitivităților"}},{"word":"electroprelucrare","pos":"noun","definitions":["electric processing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"electroprelucrare","accusative-definite-nominative":"electroprelucrarea","dative-genitive-indefinite":"electroprelucrari","dative-definite-genitive":"electroprelucrarii","vocative":"electroprelucrare"}},{"word":"electropunctură","pos":"noun","definitions":["electropuncture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"electropunctură","accusative-definite-nominative":"electropunctura","dative-genitive-indefinite":"electropuncture","dative-definite-genitive":"electropuncturei","vocative":"electropunctură"}},{"word":"electroradiolog","pos":"noun","definitions":["electroradiologist"],"forms":{"plural":"electroradiologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electroradiolog","accusative-definite-nominative-singular":"electroradiologul","accusative-indefinite-nominative-plural":"electroradiologi","accusative-definite-nominative-plural":"electroradiologii","dative-genitive-indefinite-singular":"electroradiolog","dative-definite-genitive-singular":"electroradiologului","dative-genitive-indefinite-plural":"electroradiologi","dative-definite-genitive-plural":"electroradiologilor","singular-vocative":"electroradiologule","plural-vocative":"electroradiologilor"}},{"word":"electroradiologie","pos":"noun","definitions":["electroradiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electroradiologie","accusative-definite-nominative":"electroradiologia","dative-genitive-indefinite":"electroradiologii","dative-definite-genitive":"electroradiologiei","vocative":"electroradiologie"}},{"word":"electroscop","pos":"noun","definitions":["electroscope"],"forms":{"plural":"electroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electroscop","accusative-definite-nominative-singular":"electroscopul","accusative-indefinite-nominative-plural":"electroscoape","accusative-definite-nominative-plural":"electroscoapele","dative-genitive-indefinite-singular":"electroscop","dative-definite-genitive-singular":"electroscopului","dative-genitive-indefinite-plural":"electroscoape","dative-definite-genitive-plural":"electroscoapelor","singular-vocative":"electroscopule","plural-vocative":"electroscoapelor"}},{"word":"electroscopic","pos":"adj","definitions":["electroscopic"],"forms":{"feminine-singular":"electroscopică","masculine-plural":"electroscopici","feminine-neuter-plural":"electroscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroscopic","error-unrecognized-form-feminine-indefinite-singular":"electroscopică","error-unrecognized-form-indefinite-masculine-plural":"electroscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroscopice","definite-error-unrecognized-form-masculine-neuter-singular":"electroscopicul","definite-error-unrecognized-form-feminine-singular":"electroscopica","definite-error-unrecognized-form-masculine-plural":"electroscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"electroscopicele"}},{"word":"electroscopie","pos":"noun","definitions":["electroscopy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electroscopie","accusative-definite-nominative":"electroscopia","dative-genitive-indefinite":"electroscopii","dative-definite-genitive":"electroscopiei","vocative":"electroscopie"}},{"word":"electrosecuritate","pos":"noun","definitions":["electrical safety"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"electrosecuritate","accusative-definite-nominative":"electrosecuritatea","dative-genitive-indefinite":"electrosecurități","dative-definite-genitive":"electrosecurității","vocative":"electrosecuritate"}}];
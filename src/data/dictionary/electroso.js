@@ -0,0 +1 @@
+export default [{"word":"electroșoc","pos":"noun","definitions":["electroshock"],"forms":{"plural":"electroșocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"electroșoc","accusative-definite-nominative-singular":"electroșocul","accusative-indefinite-nominative-plural":"electroșocuri","accusative-definite-nominative-plural":"electroșocurile","dative-genitive-indefinite-singular":"electroșoc","dative-definite-genitive-singular":"electroșocului","dative-genitive-indefinite-plural":"electroșocuri","dative-definite-genitive-plural":"electroșocurilor","singular-vocative":"electroșocule","plural-vocative":"electroșocurilor"}},{"word":"electrosomn","pos":"noun","definitions":["electrosleep"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrosomn","accusative-definite-nominative":"electrosomnul","dative-genitive-indefinite":"electrosomn","dative-definite-genitive":"electrosomnului","vocative":"electrosomnule"}},{"word":"electrostatic","pos":"adj","definitions":["electrostatic"],"forms":{"feminine-singular":"electrostatică","masculine-plural":"electrostatici","feminine-neuter-plural":"electrostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrostatic","error-unrecognized-form-feminine-indefinite-singular":"electrostatică","error-unrecognized-form-indefinite-masculine-plural":"electrostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrostatice","definite-error-unrecognized-form-masculine-neuter-singular":"electrostaticul","definite-error-unrecognized-form-feminine-singular":"electrostatica","definite-error-unrecognized-form-masculine-plural":"electrostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"electrostaticele"}},{"word":"electrostatică","pos":"noun","definitions":["electrostatics"],"forms":{"plural":"electrostatici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"electrostatică","accusative-definite-nominative-singular":"electrostatica","accusative-indefinite-nominative-plural":"electrostatici","accusative-definite-nominative-plural":"electrostaticile","dative-genitive-indefinite-singular":"electrostatici","dative-definite-genitive-singular":"electrostaticii","dative-genitive-indefinite-plural":"electrostatici","dative-definite-genitive-plural":"electrostaticilor","singular-vocative":"electrostatică","plural-vocative":"electrostaticilor"}},{"word":"electrostimulare","pos":"noun","definitions":["electrostimulation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"electrostimulare","accusative-definite-nominative":"electrostimularea","dative-genitive-indefinite":"electrostimulari","dative-definite-genitive":"electrostimularii","vocative":"electrostimulare"}},{"word":"electrostricțiune","pos":"noun","definitions":["electrostriction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"electrostricțiune","accusative-definite-nominative-singular":"electrostricțiunea","accusative-indefinite-nominative-plural":"electrostricțiuni","accusative-definite-nominative-plural":"electrostricțiunile","dative-genitive-indefinite-singular":"electrostricțiuni","dative-definite-genitive-singular":"electrostricțiunii","dative-genitive-indefinite-plural":"electrostricțiuni","dative-definite-genitive-plural":"electrostricțiunilor","singular-vocative":"electrostricțiune","plural-vocative":"electrostricțiunilor"}},{"word":"electrotehnic","pos":"noun","definitions":["electrical engineering"],"forms":{"plural":"electrotehnici","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"electrotehnic","accusative-definite-nominative-singular":"electrotehni","accusative-indefinite-nominative-plural":"electrotehnici","accusative-definite-nominative-plural":"electrotehnicile","dative-genitive-indefinite-singular":"electrotehnici","dative-definite-genitive-singular":"electrotehnicii","dative-genitive-indefinite-plural":"electrotehnici","dative-definite-genitive-plural":"electrotehnicilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"electrotehnică","pos":"noun","definitions":["electrical engineering"],"forms":{"plural":"electrotehnici"}},{"word":"electrotehnician","pos":"adj","definitions":["electrotechnician"],"forms":{"feminine-singular":"electrotehniciană","masculine-plural":"electrotehnicieni","feminine-neuter-plural":"electrotehniciene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrotehnician","error-unrecognized-form-feminine-indefinite-singular":"electrotehniciană","error-unrecognized-form-indefinite-masculine-plural":"electrotehnicieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrotehniciene","definite-error-unrecognized-form-masculine-neuter-singular":"electrotehnicianul","definite-error-unrecognized-form-feminine-singular":"electrotehniciana","definite-error-unrecognized-form-masculine-plural":"electrotehnicienii","definite-error-unrecognized-form-feminine-neuter-plural":"electrotehnicienele"}},{"word":"electrotehnician","pos":"noun","definitions":["electrotechnician"],"forms":{"plural":"electrotehnicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"electrotehnician","accusative-definite-nominative-singular":"electrotehnicianul","accusative-indefinite-nominative-plural":"electrotehnicieni","accusative-definite-nominative-plural":"electrotehnicienii","dative-genitive-indefinite-singular":"electrotehnician","dative-definite-genitive-singular":"electrotehnicianului","dative-genitive-indefinite-plural":"electrotehnicieni","dative-definite-genitive-plural":"electrotehnicienilor","singular-vocative":"electrotehnicianule","plural-vocative":"electrotehnicienilor"}},{"word":"electroterapeut","pos":"adj","definitions":["electrotherapist"],"forms":{"feminine-singular":"electroterapeută","masculine-plural":"electroterapeuți","feminine-neuter-plural":"electroterapeute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroterapeut","error-unrecognized-form-feminine-indefinite-singular":"electroterapeută","error-unrecognized-form-indefinite-masculine-plural":"electroterapeuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroterapeute","definite-error-unrecognized-form-masculine-neuter-singular":"electroterapeutul","definite-error-unrecognized-form-feminine-singular":"electroterapeuta","definite-error-unrecognized-form-masculine-plural":"electroterapeuții","definite-error-unrecognized-form-feminine-neuter-plural":"electroterapeutele"}},{"word":"electroterapeutic","pos":"adj","definitions":["electrotherapeutic"],"forms":{"feminine-singular":"electroterapeutică","masculine-plural":"electroterapeutici","feminine-neuter-plural":"electroterapeutice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroterapeutic","error-unrecognized-form-feminine-indefinite-singular":"electroterapeutică","error-unrecognized-form-indefinite-masculine-plural":"electroterapeutici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroterapeutice","definite-error-unrecognized-form-masculine-neuter-singular":"electroterapeuticul","definite-error-unrecognized-form-feminine-singular":"electroterapeutica","definite-error-unrecognized-form-masculine-plural":"electroterapeuticii","definite-error-unrecognized-form-feminine-neuter-plural":"electroterapeuticele"}},{"word":"electroterapic","pos":"adj","definitions":["electrotherapeutic"],"forms":{"feminine-singular":"electroterapică","masculine-plural":"electroterapici","feminine-neuter-plural":"electroterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electroterapic","error-unrecognized-form-feminine-indefinite-singular":"electroterapică","error-unrecognized-form-indefinite-masculine-plural":"electroterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electroterapice","definite-error-unrecognized-form-masculine-neuter-singular":"electroterapicul","definite-error-unrecognized-form-feminine-singular":"electroterapica","definite-error-unrecognized-form-masculine-plural":"electroterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"electroterapicele"}},{"word":"electroterapie","pos":"noun","definitions":["electrotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electroterapie","accusative-definite-nominative":"electroterapia","dative-genitive-indefinite":"electroterapii","dative-definite-genitive":"electroterapiei","vocative":"electroterapie"}},{"word":"electrotermic","pos":"adj","definitions":["electrothermal"],"forms":{"feminine-singular":"electrotermică","masculine-plural":"electrotermici","feminine-neuter-plural":"electrotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrotermic","error-unrecognized-form-feminine-indefinite-singular":"electrotermică","error-unrecognized-form-indefinite-masculine-plural":"electrotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrotermice","definite-error-unrecognized-form-masculine-neuter-singular":"electrotermicul","definite-error-unrecognized-form-feminine-singular":"electrotermica","definite-error-unrecognized-form-masculine-plural":"electrotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrotermicele"}},{"word":"electrotermie","pos":"noun","definitions":["electrothermy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrotermie","accusative-definite-nominative":"electrotermia","dative-genitive-indefinite":"electrotermii","dative-definite-genitive":"electrotermiei","vocative":"electrotermie"}},{"word":"electrotipic","pos":"adj","definitions":["electrotypic"],"forms":{"feminine-singular":"electrotipică","masculine-plural":"electrotipici","feminine-neuter-plural":"electrotipice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrotipic","error-unrecognized-form-feminine-indefinite-singular":"electrotipică","error-unrecognized-form-indefinite-masculine-plural":"electrotipici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrotipice","definite-error-unrecognized-form-masculine-neuter-singular":"electrotipicul","definite-error-unrecognized-form-feminine-singular":"electrotipica","definite-error-unrecognized-form-masculine-plural":"electrotipicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrotipicele"}},{"word":"electrotipie","pos":"noun","definitions":["electrotype"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"electrotipie","accusative-definite-nominative":"electrotipia","dative-genitive-indefinite":"electrotipii","dative-definite-genitive":"electrotipiei","vocative":"electrotipie"}},{"word":"electrotomie","pos":"noun","definitions":["electrotomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"electrotomie","accusative-definite-nominative-singular":"electrotomia","accusative-indefinite-nominative-plural":"electrotomii","accusative-definite-nominative-plural":"electrotomiile","dative-genitive-indefinite-singular":"electrotomii","dative-definite-genitive-singular":"electrotomiei","dative-genitive-indefinite-plural":"electrotomii","dative-definite-genitive-plural":"electrotomiilor","singular-vocative":"electrotomie","plural-vocative":"electrotomiilor"}},{"word":"electrotonic","pos":"adj","definitions":["electrotonic"],"forms":{"feminine-singular":"electrotonică","masculine-plural":"electrotonici","feminine-neuter-plural":"electrotonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"electrotonic","error-unrecognized-form-feminine-indefinite-singular":"electrotonică","error-unrecognized-form-indefinite-masculine-plural":"electrotonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"electrotonice","definite-error-unrecognized-form-masculine-neuter-singular":"electrotonicul","definite-error-unrecognized-form-feminine-singular":"electrotonica","definite-error-unrecognized-form-masculine-plural":"electrotonicii","definite-error-unrecognized-form-feminine-neuter-plural":"electrotonicele"}},{"word":"electrotonus","pos":"noun","definitions":["electrotonus"],"forms":{"plural":"electrotonusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"electrotonus","accusative-definite-nominative-singular":"electrotonusul","accusative-indefinite-nominative-plural":"electrotonusuri","accusative-definite-nominative-plural":"electrotonusurile","dative-genitive-indefinite-singular":"electrotonus","dative-definite-genitive-singular":"electrotonusului","dative-genitive-indefinite-plural":"electrotonusuri","dative-definite-genitive-plural":"electrotonusurilor","singular-vocative":"electrotonusule","plural-vocative":"electrotonusurilor"}},{"word":"electrotraumatism","pos":"noun","definitions":["trauma caused by electrocution"],"forms":{"plural":"electrotraumatisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electrotraumatism","accusative-definite-nominative-singular":"electrotraumatismul","accusative-indefinite-nominative-plural":"electrotraumatisme","accusative-definite-nominative-plural":"electrotraumatismele","dative-genitive-indefinite-singular":"electrotraumatism","dative-definite-genitive-singular":"electrotraumatismului","dative-genitive-indefinite-plural":"electrotraumatisme","dative-definite-genitive-plural":"electrotraumatismelor","singular-vocative":"electrotraumatismule","plural-vocative":"electrotraumatismelor"}},{"word":"electrotropism","pos":"noun","definitions":["electrotropism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrotropism","accusative-definite-nominative":"electrotropismul","dative-genitive-indefinite":"electrotropism","dative-definite-genitive":"electrotropismului","vocative":"electrotropismule"}},{"word":"electrovalență","pos":"noun","definitions":["electrovalence"],"forms":{"plural":"electrovalențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrovalență","accusative-definite-nominative-singular":"electrovalența","accusative-indefinite-nominative-plural":"electrovalențe","accusative-definite-nominative-plural":"electrovalențele","dative-genitive-indefinite-singular":"electrovalențe","dative-definite-genitive-singular":"electrovalenței","dative-genitive-indefinite-plural":"electrovalențe","dative-definite-genitive-plural":"electrovalențelor","singular-vocative":"electrovalență","plural-vocative":"electrovalențelor"}},{"word":"electrovalvă","pos":"noun","definitions":["electrovalve"],"forms":{"plural":"electrovalve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"electrovalvă","accusative-definite-nominative-singular":"electrovalva","accusative-indefinite-nominative-plural":"electrovalve","accusative-definite-nominative-plural":"electrovalvele","dative-genitive-indefinite-singular":"electrovalve","dative-definite-genitive-singular":"electrovalvei","dative-genitive-indefinite-plural":"electrovalve","dative-definite-genitive-plural":"electrovalvelor","singular-vocative":"electrovalvă","plural-vocative":"electrovalvelor"}},{"word":"electrum","pos":"noun","definitions":["electrum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"electrum","accusative-definite-nominative":"electrumul","dative-genitive-indefinite":"electrum","dative-definite-genitive":"electrumului","vocative":"electrumule"}},{"word":"electuar","pos":"noun","definitions":["electuary"],"forms":{"plural":"electuare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"electuar","accusative-definite-nominative-singular":"electuarul","accusative-indefinite-nominative-plural":"electuare","accusative-definite-nominative-plural":"electuarele","dative-genitive-indefinite-singular":"electuar","dative-definite-genitive-singular":"electuarului","dative-genitive-indefinite-plural":"electuare","dative-definite-genitive-plural":"electuarelor","singular-vocative":"electuarule","plural-vocative":"electuarelor"}},{"word":"elefant","pos":"noun","definitions":["elephant (mammal)"],"pronunciation":"/e.leˈfant/","forms":{"plural":"elefanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elefant","accusative-definite-nominative-singular":"elefantul","accusative-indefinite-nominative-plural":"elefanți","accusative-definite-nominative-plural":"elefanții","dative-genitive-indefinite-singular":"elefant","dative-definite-genitive-singular":"elefantului","dative-genitive-indefinite-plural":"elefanți","dative-definite-genitive-plural":"elefanților","singular-vocative":"elefantule","plural-vocative":"elefanților","alternative":"елефант"}},{"word":"elefant african","pos":"noun","definitions":["African elephant"],"forms":{"plural":"elefanți africani"}},{"word":"elefant asiatic","pos":"noun","definitions":["Indian elephant"],"forms":{"plural":"elefanți asiatici"}},{"word":"elefant indian","pos":"noun","definitions":["Indian elephant"],"forms":{"plural":"elefanți indiani"}},{"word":"elefantiazis","pos":"noun","definitions":["elephantiasis"],"forms":{"plural":"elefantiazise","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elefantiazis","accusative-definite-nominative-singular":"elefantiazisul","accusative-indefinite-nominative-plural":"elefantiazise","accusative-definite-nominative-plural":"elefantiazisele","dative-genitive-indefinite-singular":"elefantiazis","dative-definite-genitive-singular":"elefantiazisului","dative-genitive-indefinite-plural":"elefantiazise","dative-definite-genitive-plural":"elefantiaziselor","singular-vocative":"elefantiazisule","plural-vocative":"elefantiaziselor"}},{"word":"elefantic","pos":"adj","definitions":["elephantic"],"forms":{"feminine-singular":"elefantică","masculine-plural":"elefantici","feminine-neuter-plural":"elefantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elefantic","error-unrecognized-form-feminine-indefinite-singular":"elefantică","error-unrecognized-form-indefinite-masculine-plural":"elefantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elefantice","definite-error-unrecognized-form-masculine-neuter-singular":"elefanticul","definite-error-unrecognized-form-feminine-singular":"elefantica","definite-error-unrecognized-form-masculine-plural":"elefanticii","definite-error-unrecognized-form-feminine-neuter-plural":"elefanticele"}},{"word":"elefantin","pos":"adj","definitions":["elephantine"],"forms":{"feminine-singular":"elefantină","masculine-plural":"elefantini","feminine-neuter-plural":"elefantine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elefantin","error-unrecognized-form-feminine-indefinite-singular":"elefantină","error-unrecognized-form-indefinite-masculine-plural":"elefantini","error-unrecognized-form-feminine-indefinite-neuter-plural":"elefantine","definite-error-unrecognized-form-masculine-neuter-singular":"elefantinul","definite-error-unrecognized-form-feminine-singular":"elefantina","definite-error-unrecognized-form-masculine-plural":"elefantinii","definite-error-unrecognized-form-feminine-neuter-plural":"elefantinele"}},{"word":"elefăntoaică","pos":"noun","definitions":["female elephant"],"forms":{"plural":"elefăntoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elefăntoaică","accusative-definite-nominative-singular":"elefăntoaica","accusative-indefinite-nominative-plural":"elefăntoaice","accusative-definite-nominative-plural":"elefăntoaicele","dative-genitive-indefinite-singular":"elefăntoaice","dative-definite-genitive-singular":"elefăntoaicei","dative-genitive-indefinite-plural":"elefăntoaice","dative-definite-genitive-plural":"elefăntoaicelor","singular-vocative":"elefăntoaică","plural-vocative":"elefăntoaicelor"}},{"word":"Elefterescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Elefterescu"}},{"word":"Elefterie","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Elefterie"}},{"word":"elefterosi","pos":"verb","definitions":["to free"],"forms":{"canonical":"a elefterosi 4th conjugation","present-singular-third-person":"elefterosie","participle-past":"elefterosit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a elefterosi","gerund":"elefterosind","first-person-indicative-present-singular":"elefteros","indicative-present-second-person-singular":"elefteroși","indicative-present-singular-third-person":"elefterose","first-person-indicative-plural-present":"elefterosim","indicative-plural-present-second-person":"elefterosiți","indicative-plural-present-third-person":"elefteros","first-person-imperfect-indicative-singular":"elefteroseam","imperfect-indicative-second-person-singular":"elefteroseai","imperfect-indicative-singular-third-person":"elefterosea","first-person-imperfect-indicative-plural":"elefteroseam","imperfect-indicative-plural-second-person":"elefteroseați","imperfect-indicative-plural-third-person":"elefteroseau","first-person-indicative-perfect-singular":"elefterosii","indicative-perfect-second-person-singular":"elefterosiși","indicative-perfect-singular-third-person":"elefterosi","first-person-indicative-perfect-plural":"elefterosirăm","indicative-perfect-plural-second-person":"elefterosirăți","indicative-perfect-plural-third-person":"elefterosiră","first-person-indicative-pluperfect-singular":"elefterosisem","indicative-pluperfect-second-person-singular":"elefterosiseși","indicative-pluperfect-singular-third-person":"elefterosise","first-person-indicative-pluperfect-plural":"elefterosiserăm","indicative-pluperfect-plural-second-person":"elefterosiserăți","indicative-pluperfect-plural-third-person":"elefterosiseră","first-person-present-singular-subjunctive":"să elefteros","present-second-person-singular-subjunctive":"să elefteroși","present-singular-subjunctive-third-person":"să elefterosă","first-person-plural-present-subjunctive":"să elefterosim","plural-present-second-person-subjunctive":"să elefterosiți","plural-present-subjunctive-third-person":"să elefterosă","imperative-second-person-singular":"elefterose","imperative-plural-second-person":"elefterosiți","imperative-negative-second-person-singular":"nu elefterosi","imperative-negative-plural-second-person":"nu elefterosiți"}},{"word":"elegant","pos":"adj","definitions":["tasteful"],"forms":{"feminine-singular":"elegantă","masculine-plural":"eleganți","feminine-neuter-plural":"elegante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elegant","error-unrecognized-form-feminine-indefinite-singular":"elegantă","error-unrecognized-form-indefinite-masculine-plural":"eleganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"elegante","definite-error-unrecognized-form-masculine-neuter-singular":"elegantul","definite-error-unrecognized-form-feminine-singular":"eleganta","definite-error-unrecognized-form-masculine-plural":"eleganții","definite-error-unrecognized-form-feminine-neuter-plural":"elegantele"}},{"word":"eleganță","pos":"noun","definitions":["elegance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eleganță","accusative-definite-nominative-singular":"eleganța","accusative-indefinite-nominative-plural":"eleganțe","accusative-definite-nominative-plural":"eleganțele","dative-genitive-indefinite-singular":"eleganțe","dative-definite-genitive-singular":"eleganței","dative-genitive-indefinite-plural":"eleganțe","dative-definite-genitive-plural":"eleganțelor","singular-vocative":"eleganță","plural-vocative":"eleganțelor"}},{"word":"eleghiacesc","pos":"adj","definitions":["elegiac"],"forms":{"feminine-singular":"eleghiacească","plural":"eleghiacești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eleghiacesc","error-unrecognized-form-feminine-indefinite-singular":"eleghiacească","error-unrecognized-form-indefinite-masculine-plural":"eleghiacești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eleghiacești","definite-error-unrecognized-form-masculine-neuter-singular":"eleghiacescul","definite-error-unrecognized-form-feminine-singular":"eleghiaceasca","definite-error-unrecognized-form-masculine-plural":"eleghiaceștii","definite-error-unrecognized-form-feminine-neuter-plural":"eleghiaceștile"}},{"word":"elegiac","pos":"adj","definitions":["elegiac"],"forms":{"feminine-singular":"elegiacă","masculine-plural":"elegiaci","feminine-neuter-plural":"elegiace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elegiac","error-unrecognized-form-feminine-indefinite-singular":"elegiacă","error-unrecognized-form-indefinite-masculine-plural":"elegiaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"elegiace","definite-error-unrecognized-form-masculine-neuter-singular":"elegiacul","definite-error-unrecognized-form-feminine-singular":"elegiaca","definite-error-unrecognized-form-masculine-plural":"elegiacii","definite-error-unrecognized-form-feminine-neuter-plural":"elegiacele"}},{"word":"elegic","pos":"noun","definitions":["elegiac"],"forms":{"plural":"elegici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elegic","accusative-definite-nominative-singular":"elegicul","accusative-indefinite-nominative-plural":"elegici","accusative-definite-nominative-plural":"elegicii","dative-genitive-indefinite-singular":"elegic","dative-definite-genitive-singular":"elegicului","dative-genitive-indefinite-plural":"elegici","dative-definite-genitive-plural":"elegicilor","singular-vocative":"elegicule","plural-vocative":"elegicilor"}},{"word":"elegie","pos":"noun","definitions":["elegy"],"forms":{"plural":"elegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elegie","accusative-definite-nominative-singular":"elegia","accusative-indefinite-nominative-plural":"elegii","accusative-definite-nominative-plural":"elegiile","dative-genitive-indefinite-singular":"elegii","dative-definite-genitive-singular":"elegiei","dative-genitive-indefinite-plural":"elegii","dative-definite-genitive-plural":"elegiilor","singular-vocative":"elegie","plural-vocative":"elegiilor"}},{"word":"elegist","pos":"noun","definitions":["elegist"],"forms":{"plural":"elegiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elegist","accusative-definite-nominative-singular":"elegistul","accusative-indefinite-nominative-plural":"elegiști","accusative-definite-nominative-plural":"elegiștii","dative-genitive-indefinite-singular":"elegist","dative-definite-genitive-singular":"elegistului","dative-genitive-indefinite-plural":"elegiști","dative-definite-genitive-plural":"elegiștilor","singular-vocative":"elegistule","plural-vocative":"elegiștilor"}},{"word":"element","pos":"noun","definitions":["element"],"forms":{"plural":"elemente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"element","accusative-definite-nominative-singular":"elementul","accusative-indefinite-nominative-plural":"elemente","accusative-definite-nominative-plural":"elementele","dative-genitive-indefinite-singular":"element","dative-definite-genitive-singular":"elementului","dative-genitive-indefinite-plural":"elemente","dative-definite-genitive-plural":"elementelor","singular-vocative":"elementule","plural-vocative":"elementelor"}},{"word":"element de tranziție","pos":"noun","definitions":["transition element"],"forms":{"plural":"elemente de tranziție"}},{"word":"element parazitic","pos":"noun","definitions":["parasitic element"],"forms":{"plural":"elemente parazitice"}},{"word":"elementar","pos":"adj","definitions":["elementary"],"pronunciation":"/e.le.menˈtar/","forms":{"feminine-singular":"elementară","masculine-plural":"elementari","feminine-neuter-plural":"elementare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"elementar","error-unrecognized-form-feminine-indefinite-singular":"elementară","error-unrecognized-form-indefinite-masculine-plural":"elementari","error-unrecognized-form-feminine-indefinite-neuter-plural":"elementare","definite-error-unrecognized-form-masculine-neuter-singular":"elementarul","definite-error-unrecognized-form-feminine-singular":"elementara","definite-error-unrecognized-form-masculine-plural":"elementarii","definite-error-unrecognized-form-feminine-neuter-plural":"elementarele"}},{"word":"elementară","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of elementar"]},{"word":"elementaricesc","pos":"adj","definitions":["elementary"],"forms":{"feminine-singular":"elementaricească","plural":"elementaricești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elementaricesc","error-unrecognized-form-feminine-indefinite-singular":"elementaricească","error-unrecognized-form-indefinite-masculine-plural":"elementaricești","error-unrecognized-form-feminine-indefinite-neuter-plural":"elementaricești","definite-error-unrecognized-form-masculine-neuter-singular":"elementaricescul","definite-error-unrecognized-form-feminine-singular":"elementariceasca","definite-error-unrecognized-form-masculine-plural":"elementariceștii","definite-error-unrecognized-form-feminine-neuter-plural":"elementariceștile"}},{"word":"elementaritate","pos":"noun","definitions":["elementality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"elementaritate","accusative-definite-nominative":"elementaritatea","dative-genitive-indefinite":"elementarități","dative-definite-genitive":"elementarității","vocative":"elementaritate"}},{"word":"elementariza","pos":"verb","definitions":["to simplify"],"forms":{"canonical":"a elementariza 1st conjugation","present-singular-third-person":"elementarizează","participle-past":"elementarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elementariza","gerund":"elementarizând","first-person-indicative-present-singular":"elementarizez","indicative-present-second-person-singular":"elementarizezi","indicative-present-singular-third-person":"elementarizează","first-person-indicative-plural-present":"elementarizăm","indicative-plural-present-second-person":"elementarizați","indicative-plural-present-third-person":"elementarizează","first-person-imperfect-indicative-singular":"elementarizam","imperfect-indicative-second-person-singular":"elementarizai","imperfect-indicative-singular-third-person":"elementariza","first-person-imperfect-indicative-plural":"elementarizam","imperfect-indicative-plural-second-person":"elementarizați","imperfect-indicative-plural-third-person":"elementarizau","first-person-indicative-perfect-singular":"elementarizai","indicative-perfect-second-person-singular":"elementarizași","indicative-perfect-singular-third-person":"elementariză","first-person-indicative-perfect-plural":"elementarizarăm","indicative-perfect-plural-second-person":"elementarizarăți","indicative-perfect-plural-third-person":"elementarizară","first-person-indicative-pluperfect-singular":"elementarizasem","indicative-pluperfect-second-person-singular":"elementarizaseși","indicative-pluperfect-singular-third-person":"elementarizase","first-person-indicative-pluperfect-plural":"elementarizaserăm","indicative-pluperfect-plural-second-person":"elementarizaserăți","indicative-pluperfect-plural-third-person":"elementarizaseră","first-person-present-singular-subjunctive":"să elementarizez","present-second-person-singular-subjunctive":"să elementarizezi","present-singular-subjunctive-third-person":"să elementarizeze","first-person-plural-present-subjunctive":"să elementarizăm","plural-present-second-person-subjunctive":"să elementarizați","plural-present-subjunctive-third-person":"să elementarizeze","imperative-second-person-singular":"elementarizează","imperative-plural-second-person":"elementarizați","imperative-negative-second-person-singular":"nu elementariza","imperative-negative-plural-second-person":"nu elementarizați"}},{"word":"elemozină","pos":"noun","definitions":["alms","mercy"],"pronunciation":"[e.le.mo.zi.nə]","forms":{"plural":"elemozine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elemozină","accusative-definite-nominative-singular":"elemozina","accusative-indefinite-nominative-plural":"elemozine","accusative-definite-nominative-plural":"elemozinele","dative-genitive-indefinite-singular":"elemozine","dative-definite-genitive-singular":"elemozinei","dative-genitive-indefinite-plural":"elemozine","dative-definite-genitive-plural":"elemozinelor","singular-vocative":"elemozină","plural-vocative":"elemozinelor","alternative":"eleemozină"}},{"word":"elen","pos":"noun","definitions":["Hellene, Greek"],"forms":{"plural":"eleni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elen","accusative-definite-nominative-singular":"elenul","accusative-indefinite-nominative-plural":"eleni","accusative-definite-nominative-plural":"elenii","dative-genitive-indefinite-singular":"elen","dative-definite-genitive-singular":"elenului","dative-genitive-indefinite-plural":"eleni","dative-definite-genitive-plural":"elenilor","singular-vocative":"elenule","plural-vocative":"elenilor"}},{"word":"Elena","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"elenă","pos":"noun","definitions":["female equivalent of elen","Greek (language)"],"forms":{"plural":"elene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elenă","accusative-definite-nominative-singular":"elena","accusative-indefinite-nominative-plural":"elene","accusative-definite-nominative-plural":"elenele","dative-genitive-indefinite-singular":"elene","dative-definite-genitive-singular":"elenei","dative-genitive-indefinite-plural":"elene","dative-definite-genitive-plural":"elenelor","singular-vocative":"elenă","plural-vocative":"elenelor"}},{"word":"elencos","pos":"noun","definitions":["elenchus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"elencos","accusative-definite-nominative":"elencosul","dative-genitive-indefinite":"elencos","dative-definite-genitive":"elencosului","vocative":"elencosule"}},{"word":"Elenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Elenescu"}},{"word":"elenic","pos":"adj","definitions":["Hellenic"],"forms":{"feminine-singular":"elenică","masculine-plural":"elenici","feminine-neuter-plural":"elenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elenic","error-unrecognized-form-feminine-indefinite-singular":"elenică","error-unrecognized-form-indefinite-masculine-plural":"elenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elenice","definite-error-unrecognized-form-masculine-neuter-singular":"elenicul","definite-error-unrecognized-form-feminine-singular":"elenica","definite-error-unrecognized-form-masculine-plural":"elenicii","definite-error-unrecognized-form-feminine-neuter-plural":"elenicele"}},{"word":"elenism","pos":"noun","definitions":["Hellenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elenism","accusative-definite-nominative-singular":"elenismul","accusative-indefinite-nominative-plural":"elenisme","accusative-definite-nominative-plural":"elenismele","dative-genitive-indefinite-singular":"elenism","dative-definite-genitive-singular":"elenismului","dative-genitive-indefinite-plural":"elenisme","dative-definite-genitive-plural":"elenismelor","singular-vocative":"elenismule","plural-vocative":"elenismelor"}},{"word":"elenist","pos":"noun","definitions":["Hellenist"],"forms":{"plural":"eleniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elenist","accusative-definite-nominative-singular":"elenistul","accusative-indefinite-nominative-plural":"eleniști","accusative-definite-nominative-plural":"eleniștii","dative-genitive-indefinite-singular":"elenist","dative-definite-genitive-singular":"elenistului","dative-genitive-indefinite-plural":"eleniști","dative-definite-genitive-plural":"eleniștilor","singular-vocative":"elenistule","plural-vocative":"eleniștilor"}},{"word":"elenistă","pos":"noun","definitions":["female equivalent of elenist"],"forms":{"plural":"eleniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elenistă","accusative-definite-nominative-singular":"elenista","accusative-indefinite-nominative-plural":"eleniste","accusative-definite-nominative-plural":"elenistele","dative-genitive-indefinite-singular":"eleniste","dative-definite-genitive-singular":"elenistei","dative-genitive-indefinite-plural":"eleniste","dative-definite-genitive-plural":"elenistelor","singular-vocative":"elenistă","plural-vocative":"elenistelor"}},{"word":"elenistic","pos":"adj","definitions":["Hellenistic"],"forms":{"feminine-singular":"elenistică","masculine-plural":"elenistici","feminine-neuter-plural":"elenistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elenistic","error-unrecognized-form-feminine-indefinite-singular":"elenistică","error-unrecognized-form-indefinite-masculine-plural":"elenistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elenistice","definite-error-unrecognized-form-masculine-neuter-singular":"elenisticul","definite-error-unrecognized-form-feminine-singular":"elenistica","definite-error-unrecognized-form-masculine-plural":"elenisticii","definite-error-unrecognized-form-feminine-neuter-plural":"elenisticele"}},{"word":"eleniza","pos":"verb","definitions":["to Hellenize"],"forms":{"canonical":"a eleniza 1st conjugation","present-singular-third-person":"elenizează","participle-past":"elenizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eleniza","gerund":"elenizând","first-person-indicative-present-singular":"elenizez","indicative-present-second-person-singular":"elenizezi","indicative-present-singular-third-person":"elenizează","first-person-indicative-plural-present":"elenizăm","indicative-plural-present-second-person":"elenizați","indicative-plural-present-third-person":"elenizează","first-person-imperfect-indicative-singular":"elenizam","imperfect-indicative-second-person-singular":"elenizai","imperfect-indicative-singular-third-person":"eleniza","first-person-imperfect-indicative-plural":"elenizam","imperfect-indicative-plural-second-person":"elenizați","imperfect-indicative-plural-third-person":"elenizau","first-person-indicative-perfect-singular":"elenizai","indicative-perfect-second-person-singular":"elenizași","indicative-perfect-singular-third-person":"eleniză","first-person-indicative-perfect-plural":"elenizarăm","indicative-perfect-plural-second-person":"elenizarăți","indicative-perfect-plural-third-person":"elenizară","first-person-indicative-pluperfect-singular":"elenizasem","indicative-pluperfect-second-person-singular":"elenizaseși","indicative-pluperfect-singular-third-person":"elenizase","first-person-indicative-pluperfect-plural":"elenizaserăm","indicative-pluperfect-plural-second-person":"elenizaserăți","indicative-pluperfect-plural-third-person":"elenizaseră","first-person-present-singular-subjunctive":"să elenizez","present-second-person-singular-subjunctive":"să elenizezi","present-singular-subjunctive-third-person":"să elenizeze","first-person-plural-present-subjunctive":"să elenizăm","plural-present-second-person-subjunctive":"să elenizați","plural-present-subjunctive-third-person":"să elenizeze","imperative-second-person-singular":"elenizează","imperative-plural-second-person":"elenizați","imperative-negative-second-person-singular":"nu eleniza","imperative-negative-plural-second-person":"nu elenizați"}},{"word":"elenizare","pos":"noun","definitions":["Hellenisation"],"forms":{"plural":"elenizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elenizare","accusative-definite-nominative-singular":"elenizarea","accusative-indefinite-nominative-plural":"elenizări","accusative-definite-nominative-plural":"elenizările","dative-genitive-indefinite-singular":"elenizări","dative-definite-genitive-singular":"elenizării","dative-genitive-indefinite-plural":"elenizări","dative-definite-genitive-plural":"elenizărilor","singular-vocative":"elenizare","plural-vocative":"elenizărilor"}},{"word":"Elenovca","pos":"name","definitions":["a village in Tîrnova, Dondușeni Raion, Moldova"],"gender":"f"},{"word":"elenșug","pos":"noun","definitions":["robbery"],"forms":{"plural":"elenșuguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"elenșug","accusative-definite-nominative-singular":"elenșugul","accusative-indefinite-nominative-plural":"elenșuguri","accusative-definite-nominative-plural":"elenșugurile","dative-genitive-indefinite-singular":"elenșug","dative-definite-genitive-singular":"elenșugului","dative-genitive-indefinite-plural":"elenșuguri","dative-definite-genitive-plural":"elenșugurilor","singular-vocative":"elenșugule","plural-vocative":"elenșugurilor"}},{"word":"eleolit","pos":"noun","definitions":["elaeolite"],"forms":{"plural":"eleoliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eleolit","accusative-definite-nominative-singular":"eleolitul","accusative-indefinite-nominative-plural":"eleoliți","accusative-definite-nominative-plural":"eleoliții","dative-genitive-indefinite-singular":"eleolit","dative-definite-genitive-singular":"eleolitului","dative-genitive-indefinite-plural":"eleoliți","dative-definite-genitive-plural":"eleoliților","singular-vocative":"eleolitule","plural-vocative":"eleoliților"}},{"word":"eleron","pos":"noun","definitions":["aileron"],"forms":{"plural":"eleroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eleron","accusative-definite-nominative-singular":"eleronul","accusative-indefinite-nominative-plural":"eleroane","accusative-definite-nominative-plural":"eleroanele","dative-genitive-indefinite-singular":"eleron","dative-definite-genitive-singular":"eleronului","dative-genitive-indefinite-plural":"eleroane","dative-definite-genitive-plural":"eleroanelor","singular-vocative":"eleronule","plural-vocative":"eleroanelor"}},{"word":"eleșteu","pos":"noun","definitions":["alternative form of heleșteu"],"forms":{"plural":"eleșteie"}},{"word":"eletronmicroscopie","pos":"noun","definitions":["electron microscopy"],"forms":{"plural":"eletronmicroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eletronmicroscopie","accusative-definite-nominative-singular":"eletronmicroscopia","accusative-indefinite-nominative-plural":"eletronmicroscopii","accusative-definite-nominative-plural":"eletronmicroscopiile","dative-genitive-indefinite-singular":"eletronmicroscopii","dative-definite-genitive-singular":"eletronmicroscopiei","dative-genitive-indefinite-plural":"eletronmicroscopii","dative-definite-genitive-plural":"eletronmicroscopiilor","singular-vocative":"eletronmicroscopie","plural-vocative":"eletronmicroscopiilor"}},{"word":"elev","pos":"noun","definitions":["student, schoolboy"],"forms":{"plural":"elevi","feminine":"equivalent elevă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elev","accusative-definite-nominative-singular":"elevul","accusative-indefinite-nominative-plural":"elevi","accusative-definite-nominative-plural":"elevii","dative-genitive-indefinite-singular":"elev","dative-definite-genitive-singular":"elevului","dative-genitive-indefinite-plural":"elevi","dative-definite-genitive-plural":"elevilor","singular-vocative":"elevule","plural-vocative":"elevilor"}},{"word":"eleva","pos":"verb","definitions":["to elevate, to lift"]},{"word":"eleva","pos":"noun","definitions":["definite nominative/accusative singular of elevă"],"gender":"f"},{"word":"elevă","pos":"noun","definitions":["female equivalent of elev: schoolgirl, female student"],"forms":{"plural":"eleve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elevă","accusative-definite-nominative-singular":"eleva","accusative-indefinite-nominative-plural":"eleve","accusative-definite-nominative-plural":"elevele","dative-genitive-indefinite-singular":"eleve","dative-definite-genitive-singular":"elevei","dative-genitive-indefinite-plural":"eleve","dative-definite-genitive-plural":"elevelor","singular-vocative":"elevă","plural-vocative":"elevelor"}},{"word":"elevare","pos":"noun","definitions":["elevation"],"forms":{"plural":"elevări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elevare","accusative-definite-nominative-singular":"elevarea","accusative-indefinite-nominative-plural":"elevări","accusative-definite-nominative-plural":"elevările","dative-genitive-indefinite-singular":"elevări","dative-definite-genitive-singular":"elevării","dative-genitive-indefinite-plural":"elevări","dative-definite-genitive-plural":"elevărilor","singular-vocative":"elevare","plural-vocative":"elevărilor"}},{"word":"elevat","pos":"adj","definitions":["raised"],"forms":{"feminine-singular":"elevată","masculine-plural":"elevați","feminine-neuter-plural":"elevate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elevat","error-unrecognized-form-feminine-indefinite-singular":"elevată","error-unrecognized-form-indefinite-masculine-plural":"elevați","error-unrecognized-form-feminine-indefinite-neuter-plural":"elevate","definite-error-unrecognized-form-masculine-neuter-singular":"elevatul","definite-error-unrecognized-form-feminine-singular":"elevata","definite-error-unrecognized-form-masculine-plural":"elevații","definite-error-unrecognized-form-feminine-neuter-plural":"elevatele","alternative":"елеват"}},{"word":"elevat","pos":"verb","definitions":["past participle of eleva"],"forms":{"participle-past":"of eleva","alternative":"елеват"}},{"word":"elevație","pos":"noun","definitions":["elevation"],"forms":{"plural":"elevații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elevație","accusative-definite-nominative-singular":"elevația","accusative-indefinite-nominative-plural":"elevații","accusative-definite-nominative-plural":"elevațiile","dative-genitive-indefinite-singular":"elevații","dative-definite-genitive-singular":"elevației","dative-genitive-indefinite-plural":"elevații","dative-definite-genitive-plural":"elevațiilor","singular-vocative":"elevație","plural-vocative":"elevațiilor"}},{"word":"elevațiune","pos":"noun","definitions":["obsolete form of elevație"],"forms":{"plural":"elevațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elevațiune","accusative-definite-nominative-singular":"elevațiunea","accusative-indefinite-nominative-plural":"elevațiuni","accusative-definite-nominative-plural":"elevațiunile","dative-genitive-indefinite-singular":"elevațiuni","dative-definite-genitive-singular":"elevațiunii","dative-genitive-indefinite-plural":"elevațiuni","dative-definite-genitive-plural":"elevațiunilor","singular-vocative":"elevațiune","plural-vocative":"elevațiunilor"}},{"word":"elevator","pos":"noun","definitions":["elevator"],"forms":{"plural":"elevatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elevator","accusative-definite-nominative-singular":"elevatorul","accusative-indefinite-nominative-plural":"elevatoare","accusative-definite-nominative-plural":"elevatoarele","dative-genitive-indefinite-singular":"elevator","dative-definite-genitive-singular":"elevatorului","dative-genitive-indefinite-plural":"elevatoare","dative-definite-genitive-plural":"elevatoarelor","singular-vocative":"elevatorule","plural-vocative":"elevatoarelor"}},{"word":"eleve","pos":"noun","definitions":["plural of elevă (“schoolgirls, female students”)"],"gender":"f-p"},{"word":"elevei","pos":"noun","definitions":["definite genitive/dative singular of elevă"],"pronunciation":"[eˈlevej]","gender":"f"},{"word":"elevi","pos":"noun","definitions":["indefinite plural of elev"],"pronunciation":"[eˈlevʲ]","gender":"m"},{"word":"elevo","pos":"noun","definitions":["vocative singular of elevă"],"pronunciation":"[eˈlevo]","gender":"f"},{"word":"elf","pos":"noun","definitions":["elf"],"forms":{"plural":"elfi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elf","accusative-definite-nominative-singular":"elful","accusative-indefinite-nominative-plural":"elfi","accusative-definite-nominative-plural":"elfii","dative-genitive-indefinite-singular":"elf","dative-definite-genitive-singular":"elfului","dative-genitive-indefinite-plural":"elfi","dative-definite-genitive-plural":"elfilor","singular-vocative":"elfule","plural-vocative":"elfilor"}},{"word":"elfă","pos":"noun","definitions":["a female elf"],"forms":{"plural":"elfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"elfă","accusative-definite-nominative-singular":"elfa","accusative-indefinite-nominative-plural":"elfe","accusative-definite-nominative-plural":"elfele","dative-genitive-indefinite-singular":"elfe","dative-definite-genitive-singular":"elfei","dative-genitive-indefinite-plural":"elfe","dative-definite-genitive-plural":"elfelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"eliac","pos":"adj","definitions":["heliacal"],"forms":{"feminine-singular":"eliacă","masculine-plural":"eliaci","feminine-neuter-plural":"eliace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliac","error-unrecognized-form-feminine-indefinite-singular":"eliacă","error-unrecognized-form-indefinite-masculine-plural":"eliaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliace","definite-error-unrecognized-form-masculine-neuter-singular":"eliacul","definite-error-unrecognized-form-feminine-singular":"eliaca","definite-error-unrecognized-form-masculine-plural":"eliacii","definite-error-unrecognized-form-feminine-neuter-plural":"eliacele"}},{"word":"Eliade","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Eliade"}},{"word":"elibera","pos":"verb","definitions":["to free, set free, release","to liberate","to honourably discharge","to vacate premises","to clear out, declutter"],"pronunciation":"/e.li.beˈra/","forms":{"canonical":"a elibera 1st conjugation","present-singular-third-person":"eliberează","participle-past":"eliberat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elibera","gerund":"eliberând","first-person-indicative-present-singular":"eliberez","indicative-present-second-person-singular":"eliberezi","indicative-present-singular-third-person":"eliberează","first-person-indicative-plural-present":"eliberăm","indicative-plural-present-second-person":"eliberați","indicative-plural-present-third-person":"eliberează","first-person-imperfect-indicative-singular":"eliberam","imperfect-indicative-second-person-singular":"eliberai","imperfect-indicative-singular-third-person":"elibera","first-person-imperfect-indicative-plural":"eliberam","imperfect-indicative-plural-second-person":"eliberați","imperfect-indicative-plural-third-person":"eliberau","first-person-indicative-perfect-singular":"eliberai","indicative-perfect-second-person-singular":"eliberași","indicative-perfect-singular-third-person":"eliberă","first-person-indicative-perfect-plural":"eliberarăm","indicative-perfect-plural-second-person":"eliberarăți","indicative-perfect-plural-third-person":"eliberară","first-person-indicative-pluperfect-singular":"eliberasem","indicative-pluperfect-second-person-singular":"eliberaseși","indicative-pluperfect-singular-third-person":"eliberase","first-person-indicative-pluperfect-plural":"eliberaserăm","indicative-pluperfect-plural-second-person":"eliberaserăți","indicative-pluperfect-plural-third-person":"eliberaseră","first-person-present-singular-subjunctive":"să eliberez","present-second-person-singular-subjunctive":"să eliberezi","present-singular-subjunctive-third-person":"să elibereze","first-person-plural-present-subjunctive":"să eliberăm","plural-present-second-person-subjunctive":"să eliberați","plural-present-subjunctive-third-person":"să elibereze","imperative-second-person-singular":"eliberează","imperative-plural-second-person":"eliberați","imperative-negative-second-person-singular":"nu elibera","imperative-negative-plural-second-person":"nu eliberați"}},{"word":"eliberă","pos":"verb","definitions":["third-person singular simple perfect indicative of elibera"]},{"word":"elibera din funcție","pos":"verb","definitions":["to lay off, to dismiss, to fire, to terminate"],"forms":{"canonical":"a elibera din funcție 1st conjugation","present-singular-third-person":"eliberează din funcție","participle-past":"eliberat din funcție"}},{"word":"eliberare","pos":"noun","definitions":["release"],"forms":{"plural":"eliberări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eliberare","accusative-definite-nominative-singular":"eliberarea","accusative-indefinite-nominative-plural":"eliberări","accusative-definite-nominative-plural":"eliberările","dative-genitive-indefinite-singular":"eliberări","dative-definite-genitive-singular":"eliberării","dative-genitive-indefinite-plural":"eliberări","dative-definite-genitive-plural":"eliberărilor","singular-vocative":"eliberare","plural-vocative":"eliberărilor"}},{"word":"eliberat","pos":"adj","definitions":["freed, emancipated"],"forms":{"feminine-singular":"eliberată","masculine-plural":"eliberați","feminine-neuter-plural":"eliberate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliberat","error-unrecognized-form-feminine-indefinite-singular":"eliberată","error-unrecognized-form-indefinite-masculine-plural":"eliberați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliberate","definite-error-unrecognized-form-masculine-neuter-singular":"eliberatul","definite-error-unrecognized-form-feminine-singular":"eliberata","definite-error-unrecognized-form-masculine-plural":"eliberații","definite-error-unrecognized-form-feminine-neuter-plural":"eliberatele"}},{"word":"eliberat","pos":"verb","definitions":["past participle of elibera"],"forms":{"participle-past":"of elibera"}},{"word":"eliberație","pos":"noun","definitions":["liberation, release"],"forms":{"plural":"eliberații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eliberație","accusative-definite-nominative-singular":"eliberația","accusative-indefinite-nominative-plural":"eliberații","accusative-definite-nominative-plural":"eliberațiile","dative-genitive-indefinite-singular":"eliberații","dative-definite-genitive-singular":"eliberației","dative-genitive-indefinite-plural":"eliberații","dative-definite-genitive-plural":"eliberațiilor","singular-vocative":"eliberație","plural-vocative":"eliberațiilor"}},{"word":"eliberator","pos":"adj","definitions":["liberating"],"forms":{"feminine-singular":"eliberatoare","masculine-plural":"eliberatori","feminine-neuter-plural":"eliberatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliberator","error-unrecognized-form-feminine-indefinite-singular":"eliberatoare","error-unrecognized-form-indefinite-masculine-plural":"eliberatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliberatoare","definite-error-unrecognized-form-masculine-neuter-singular":"eliberatorul","definite-error-unrecognized-form-feminine-singular":"eliberatoarea","definite-error-unrecognized-form-masculine-plural":"eliberatorii","definite-error-unrecognized-form-feminine-neuter-plural":"eliberatoarele"}},{"word":"elice","pos":"noun","definitions":["propeller (mechanical device used to propel)"],"forms":{"plural":"elice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"elice","accusative-definite-nominative-singular":"elicea","accusative-indefinite-nominative-plural":"elice","accusative-definite-nominative-plural":"elicele","dative-genitive-indefinite-singular":"elice","dative-definite-genitive-singular":"elicei","dative-genitive-indefinite-plural":"elice","dative-definite-genitive-plural":"elicelor","singular-vocative":"elice","plural-vocative":"elicelor"}},{"word":"elicoid","pos":"noun","definitions":["helicoid"],"forms":{"plural":"elicoide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elicoid","accusative-definite-nominative-singular":"elicoidul","accusative-indefinite-nominative-plural":"elicoide","accusative-definite-nominative-plural":"elicoidele","dative-genitive-indefinite-singular":"elicoid","dative-definite-genitive-singular":"elicoidului","dative-genitive-indefinite-plural":"elicoide","dative-definite-genitive-plural":"elicoidelor","singular-vocative":"elicoidule","plural-vocative":"elicoidelor"}},{"word":"elicoidal","pos":"adj","definitions":["spiral"],"forms":{"feminine-singular":"elicoidală","masculine-plural":"elicoidali","feminine-neuter-plural":"elicoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elicoidal","error-unrecognized-form-feminine-indefinite-singular":"elicoidală","error-unrecognized-form-indefinite-masculine-plural":"elicoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"elicoidale","definite-error-unrecognized-form-masculine-neuter-singular":"elicoidalul","definite-error-unrecognized-form-feminine-singular":"elicoidala","definite-error-unrecognized-form-masculine-plural":"elicoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"elicoidalele"}},{"word":"elicopter","pos":"noun","definitions":["helicopter"],"forms":{"plural":"elicoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elicopter","accusative-definite-nominative-singular":"elicopterul","accusative-indefinite-nominative-plural":"elicoptere","accusative-definite-nominative-plural":"elicopterele","dative-genitive-indefinite-singular":"elicopter","dative-definite-genitive-singular":"elicopterului","dative-genitive-indefinite-plural":"elicoptere","dative-definite-genitive-plural":"elicopterelor","singular-vocative":"elicopterule","plural-vocative":"elicopterelor","alternative":"helicopter"}},{"word":"elicopter de atac","pos":"noun","definitions":["attack helicopter"],"forms":{"plural":"elicoptere de atac"}},{"word":"elicopter de luptă","pos":"noun","definitions":["attack helicopter"],"forms":{"plural":"elicoptere de luptă"}},{"word":"elicopterist","pos":"noun","definitions":["helicopter pilot"],"forms":{"plural":"elicopteriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elicopterist","accusative-definite-nominative-singular":"elicopteristul","accusative-indefinite-nominative-plural":"elicopteristi","accusative-definite-nominative-plural":"elicopteristii","dative-genitive-indefinite-singular":"elicopterist","dative-definite-genitive-singular":"elicopteristului","dative-genitive-indefinite-plural":"elicopteristi","dative-definite-genitive-plural":"elicopteristilor","singular-vocative":"elicopteristule","plural-vocative":"elicopteristilor"}},{"word":"elida","pos":"verb","definitions":["to elide"],"forms":{"canonical":"a elida 1st conjugation","present-singular-third-person":"elidează","participle-past":"elidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elida","gerund":"elidând","first-person-indicative-present-singular":"elidez","indicative-present-second-person-singular":"elidezi","indicative-present-singular-third-person":"elidează","first-person-indicative-plural-present":"elidăm","indicative-plural-present-second-person":"elidați","indicative-plural-present-third-person":"elidează","first-person-imperfect-indicative-singular":"elidam","imperfect-indicative-second-person-singular":"elidai","imperfect-indicative-singular-third-person":"elida","first-person-imperfect-indicative-plural":"elidam","imperfect-indicative-plural-second-person":"elidați","imperfect-indicative-plural-third-person":"elidau","first-person-indicative-perfect-singular":"elidai","indicative-perfect-second-person-singular":"elidași","indicative-perfect-singular-third-person":"elidă","first-person-indicative-perfect-plural":"elidarăm","indicative-perfect-plural-second-person":"elidarăți","indicative-perfect-plural-third-person":"elidară","first-person-indicative-pluperfect-singular":"elidasem","indicative-pluperfect-second-person-singular":"elidaseși","indicative-pluperfect-singular-third-person":"elidase","first-person-indicative-pluperfect-plural":"elidaserăm","indicative-pluperfect-plural-second-person":"elidaserăți","indicative-pluperfect-plural-third-person":"elidaseră","first-person-present-singular-subjunctive":"să elidez","present-second-person-singular-subjunctive":"să elidezi","present-singular-subjunctive-third-person":"să elideze","first-person-plural-present-subjunctive":"să elidăm","plural-present-second-person-subjunctive":"să elidați","plural-present-subjunctive-third-person":"să elideze","imperative-second-person-singular":"elidează","imperative-plural-second-person":"elidați","imperative-negative-second-person-singular":"nu elida","imperative-negative-plural-second-person":"nu elidați"}},{"word":"elidare","pos":"noun","definitions":["elision"],"forms":{"plural":"elidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elidare","accusative-definite-nominative-singular":"elidarea","accusative-indefinite-nominative-plural":"elidări","accusative-definite-nominative-plural":"elidările","dative-genitive-indefinite-singular":"elidări","dative-definite-genitive-singular":"elidării","dative-genitive-indefinite-plural":"elidări","dative-definite-genitive-plural":"elidărilor","singular-vocative":"elidare","plural-vocative":"elidărilor"}},{"word":"Eliescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Eliescu"}},{"word":"eligară","pos":"noun","definitions":["heliport, helideck"],"forms":{"plural":"eligări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eligară","accusative-definite-nominative-singular":"eligara","accusative-indefinite-nominative-plural":"eligăre","accusative-definite-nominative-plural":"eligărele","dative-genitive-indefinite-singular":"eligăre","dative-definite-genitive-singular":"eligărei","dative-genitive-indefinite-plural":"eligăre","dative-definite-genitive-plural":"eligărelor","singular-vocative":"eligară","plural-vocative":"eligărelor"}},{"word":"eligibil","pos":"adj","definitions":["eligible"],"forms":{"feminine-singular":"eligibilă","masculine-plural":"eligibili","feminine-neuter-plural":"eligibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eligibil","error-unrecognized-form-feminine-indefinite-singular":"eligibilă","error-unrecognized-form-indefinite-masculine-plural":"eligibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"eligibile","definite-error-unrecognized-form-masculine-neuter-singular":"eligibilul","definite-error-unrecognized-form-feminine-singular":"eligibila","definite-error-unrecognized-form-masculine-plural":"eligibilii","definite-error-unrecognized-form-feminine-neuter-plural":"eligibilele"}},{"word":"eligibilitate","pos":"noun","definitions":["eligibility"],"pronunciation":"[e.li.d͡ʒi.bi.liˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"eligibilitate","accusative-definite-nominative":"eligibilitatea","dative-genitive-indefinite":"eligibilități","dative-definite-genitive":"eligibilității","vocative":"eligibilitate"}},{"word":"elimina","pos":"verb","definitions":["to eliminate"],"pronunciation":"[e.li.miˈna]","forms":{"canonical":"a elimina 1st conjugation","present-singular-third-person":"elimină","participle-past":"eliminat","subjunctive-third-person":"elimine","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a elimina","gerund":"eliminând","first-person-indicative-present-singular":"elimin","indicative-present-second-person-singular":"elimini","indicative-present-singular-third-person":"elimină","first-person-indicative-plural-present":"eliminăm","indicative-plural-present-second-person":"eliminați","indicative-plural-present-third-person":"elimină","first-person-imperfect-indicative-singular":"eliminam","imperfect-indicative-second-person-singular":"eliminai","imperfect-indicative-singular-third-person":"elimina","first-person-imperfect-indicative-plural":"eliminam","imperfect-indicative-plural-second-person":"eliminați","imperfect-indicative-plural-third-person":"eliminau","first-person-indicative-perfect-singular":"eliminai","indicative-perfect-second-person-singular":"eliminași","indicative-perfect-singular-third-person":"elimină","first-person-indicative-perfect-plural":"eliminarăm","indicative-perfect-plural-second-person":"eliminarăți","indicative-perfect-plural-third-person":"eliminară","first-person-indicative-pluperfect-singular":"eliminasem","indicative-pluperfect-second-person-singular":"eliminaseși","indicative-pluperfect-singular-third-person":"eliminase","first-person-indicative-pluperfect-plural":"eliminaserăm","indicative-pluperfect-plural-second-person":"eliminaserăți","indicative-pluperfect-plural-third-person":"eliminaseră","first-person-present-singular-subjunctive":"să elimin","present-second-person-singular-subjunctive":"să elimini","present-singular-subjunctive-third-person":"să elimine","first-person-plural-present-subjunctive":"să eliminăm","plural-present-second-person-subjunctive":"să eliminați","plural-present-subjunctive-third-person":"să elimine","imperative-second-person-singular":"elimină","imperative-plural-second-person":"eliminați","imperative-negative-second-person-singular":"nu elimina","imperative-negative-plural-second-person":"nu eliminați"}},{"word":"eliminai","pos":"verb","definitions":["inflection of elimina:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[elimiˈnaj]"},{"word":"eliminam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of elimina"],"pronunciation":"[elimiˈnam]"},{"word":"eliminare","pos":"noun","definitions":["elimination"],"forms":{"plural":"eliminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eliminare","accusative-definite-nominative-singular":"eliminarea","accusative-indefinite-nominative-plural":"eliminări","accusative-definite-nominative-plural":"eliminările","dative-genitive-indefinite-singular":"eliminări","dative-definite-genitive-singular":"eliminării","dative-genitive-indefinite-plural":"eliminări","dative-definite-genitive-plural":"eliminărilor","singular-vocative":"eliminare","plural-vocative":"eliminărilor"}},{"word":"eliminase","pos":"verb","definitions":["third-person singular pluperfect indicative of elimina"],"pronunciation":"[elimiˈnase]"},{"word":"eliminat","pos":"adj","definitions":["eliminated"],"pronunciation":"[e.li.miˈnat]","forms":{"feminine-singular":"eliminată","masculine-plural":"eliminați","feminine-neuter-plural":"eliminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliminat","error-unrecognized-form-feminine-indefinite-singular":"eliminată","error-unrecognized-form-indefinite-masculine-plural":"eliminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliminate","definite-error-unrecognized-form-masculine-neuter-singular":"eliminatul","definite-error-unrecognized-form-feminine-singular":"eliminata","definite-error-unrecognized-form-masculine-plural":"eliminații","definite-error-unrecognized-form-feminine-neuter-plural":"eliminatele"}},{"word":"eliminat","pos":"verb","definitions":["past participle of elimina"],"pronunciation":"[e.li.miˈnat]","forms":{"participle-past":"of elimina"}},{"word":"eliminație","pos":"noun","definitions":["elimination"],"forms":{"plural":"eliminații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eliminație","accusative-definite-nominative-singular":"eliminația","accusative-indefinite-nominative-plural":"eliminații","accusative-definite-nominative-plural":"eliminațiile","dative-genitive-indefinite-singular":"eliminații","dative-definite-genitive-singular":"eliminației","dative-genitive-indefinite-plural":"eliminații","dative-definite-genitive-plural":"eliminațiilor","singular-vocative":"eliminație","plural-vocative":"eliminațiilor"}},{"word":"eliminațiune","pos":"noun","definitions":["obsolete form of eliminație"],"forms":{"plural":"eliminațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eliminațiune","accusative-definite-nominative-singular":"eliminațiunea","accusative-indefinite-nominative-plural":"eliminațiuni","accusative-definite-nominative-plural":"eliminațiunile","dative-genitive-indefinite-singular":"eliminațiuni","dative-definite-genitive-singular":"eliminațiunii","dative-genitive-indefinite-plural":"eliminațiuni","dative-definite-genitive-plural":"eliminațiunilor","singular-vocative":"eliminațiune","plural-vocative":"eliminațiunilor"}},{"word":"eliminator","pos":"adj","definitions":["eliminatory"],"forms":{"feminine-singular":"eliminatoare","masculine-plural":"eliminatori","feminine-neuter-plural":"eliminatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliminator","error-unrecognized-form-feminine-indefinite-singular":"eliminatoare","error-unrecognized-form-indefinite-masculine-plural":"eliminatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliminatoare","definite-error-unrecognized-form-masculine-neuter-singular":"eliminatorul","definite-error-unrecognized-form-feminine-singular":"eliminatoarea","definite-error-unrecognized-form-masculine-plural":"eliminatorii","definite-error-unrecognized-form-feminine-neuter-plural":"eliminatoarele"}},{"word":"eliminator","pos":"noun","definitions":["eliminator"],"forms":{"plural":"eliminatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eliminator","accusative-definite-nominative-singular":"eliminatorul","accusative-indefinite-nominative-plural":"eliminatori","accusative-definite-nominative-plural":"eliminatorile","dative-genitive-indefinite-singular":"eliminator","dative-definite-genitive-singular":"eliminatorului","dative-genitive-indefinite-plural":"eliminatori","dative-definite-genitive-plural":"eliminatorilor","singular-vocative":"eliminatorule","plural-vocative":"eliminatorilor"}},{"word":"eliminatoriu","pos":"adj","definitions":["eliminatory"],"forms":{"feminine-singular":"eliminatorie","plural":"eliminatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliminatoriu","error-unrecognized-form-feminine-indefinite-singular":"eliminatorie","error-unrecognized-form-indefinite-masculine-plural":"eliminatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliminatorii","definite-error-unrecognized-form-masculine-neuter-singular":"eliminatoriul","definite-error-unrecognized-form-feminine-singular":"eliminatoria","definite-error-unrecognized-form-masculine-plural":"eliminatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"eliminatoriile"}},{"word":"elimine","pos":"verb","definitions":["third-person singular/plural present subjunctive of elimina"],"pronunciation":"[eˈlimine]"},{"word":"elimini","pos":"verb","definitions":["second-person singular present indicative/subjunctive of elimina"],"pronunciation":"[eˈli.mi.nʲi]"},{"word":"elin","pos":"adj","definitions":["alternative form of elen"],"forms":{"feminine-singular":"elină","masculine-plural":"elini","feminine-neuter-plural":"eline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elin","error-unrecognized-form-feminine-indefinite-singular":"elină","error-unrecognized-form-indefinite-masculine-plural":"elini","error-unrecognized-form-feminine-indefinite-neuter-plural":"eline","definite-error-unrecognized-form-masculine-neuter-singular":"elinul","definite-error-unrecognized-form-feminine-singular":"elina","definite-error-unrecognized-form-masculine-plural":"elinii","definite-error-unrecognized-form-feminine-neuter-plural":"elinele"}},{"word":"elinesc","pos":"adj","definitions":["Hellenic"],"forms":{"feminine-singular":"elinească","plural":"elinești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elinesc","error-unrecognized-form-feminine-indefinite-singular":"elinească","error-unrecognized-form-indefinite-masculine-plural":"elinești","error-unrecognized-form-feminine-indefinite-neuter-plural":"elinești","definite-error-unrecognized-form-masculine-neuter-singular":"elinescul","definite-error-unrecognized-form-feminine-singular":"elineasca","definite-error-unrecognized-form-masculine-plural":"elineștii","definite-error-unrecognized-form-feminine-neuter-plural":"elineștile"}},{"word":"elinește","pos":"adv","definitions":["in Greek language"]},{"word":"elinică","pos":"noun","definitions":["Ancient Greek"],"pronunciation":"/eˈli.ni.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"elinică","accusative-definite-nominative":"elinica","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"elinică"}},{"word":"eliofob","pos":"adj","definitions":["alternative form of heliofob"],"forms":{"feminine-singular":"eliofobă","masculine-plural":"eliofobi","feminine-neuter-plural":"eliofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliofob","error-unrecognized-form-feminine-indefinite-singular":"eliofobă","error-unrecognized-form-indefinite-masculine-plural":"eliofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliofobe","definite-error-unrecognized-form-masculine-neuter-singular":"eliofobul","definite-error-unrecognized-form-feminine-singular":"eliofoba","definite-error-unrecognized-form-masculine-plural":"eliofobii","definite-error-unrecognized-form-feminine-neuter-plural":"eliofobele"}},{"word":"eliofobă","pos":"noun","definitions":["female equivalent of eliofob"],"forms":{"plural":"eliofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eliofobă","accusative-definite-nominative-singular":"eliofoba","accusative-indefinite-nominative-plural":"eliofobe","accusative-definite-nominative-plural":"eliofobele","dative-genitive-indefinite-singular":"eliofobe","dative-definite-genitive-singular":"eliofobei","dative-genitive-indefinite-plural":"eliofobe","dative-definite-genitive-plural":"eliofobelor","singular-vocative":"eliofobă","plural-vocative":"eliofobelor"}},{"word":"eliport","pos":"noun","definitions":["heliport"],"forms":{"plural":"eliporturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eliport","accusative-definite-nominative-singular":"eliportul","accusative-indefinite-nominative-plural":"eliporturi","accusative-definite-nominative-plural":"eliporturile","dative-genitive-indefinite-singular":"eliport","dative-definite-genitive-singular":"eliportului","dative-genitive-indefinite-plural":"eliporturi","dative-definite-genitive-plural":"eliporturilor","singular-vocative":"eliportule","plural-vocative":"eliporturilor"}},{"word":"elipsa","pos":"noun","definitions":["definite nominative/accusative singular of elipsă"],"pronunciation":"[eˈlipsa]","gender":"f"},{"word":"elipsă","pos":"noun","definitions":["ellipse (curve)"],"pronunciation":"/eˈlip.sə/","forms":{"plural":"elipse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elipsă","accusative-definite-nominative-singular":"elipsa","accusative-indefinite-nominative-plural":"elipse","accusative-definite-nominative-plural":"elipsele","dative-genitive-indefinite-singular":"elipse","dative-definite-genitive-singular":"elipsei","dative-genitive-indefinite-plural":"elipse","dative-definite-genitive-plural":"elipselor","singular-vocative":"elipsă","plural-vocative":"elipselor","alternative":"елипсэ"}},{"word":"elipse","pos":"noun","definitions":["inflection of elipsă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[eˈlipse]","gender":"f"},{"word":"elipso","pos":"noun","definitions":["vocative singular of elipsă"],"pronunciation":"[eˈlipso]","gender":"f"},{"word":"elipsograf","pos":"noun","definitions":["ellipsograph"],"forms":{"plural":"elipsografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elipsograf","accusative-definite-nominative-singular":"elipsograful","accusative-indefinite-nominative-plural":"elipsografe","accusative-definite-nominative-plural":"elipsografele","dative-genitive-indefinite-singular":"elipsograf","dative-definite-genitive-singular":"elipsografului","dative-genitive-indefinite-plural":"elipsografe","dative-definite-genitive-plural":"elipsografelor","singular-vocative":"elipsografule","plural-vocative":"elipsografelor"}},{"word":"elipsoid","pos":"noun","definitions":["ellipsoid"],"forms":{"plural":"elipsoide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elipsoid","accusative-definite-nominative-singular":"elipsoidul","accusative-indefinite-nominative-plural":"elipsoide","accusative-definite-nominative-plural":"elipsoidele","dative-genitive-indefinite-singular":"elipsoid","dative-definite-genitive-singular":"elipsoidului","dative-genitive-indefinite-plural":"elipsoide","dative-definite-genitive-plural":"elipsoidelor","singular-vocative":"elipsoidule","plural-vocative":"elipsoidelor"}},{"word":"elipsoidal","pos":"adj","definitions":["ellipsoidal"],"forms":{"feminine-singular":"elipsoidală","masculine-plural":"elipsoidali","feminine-neuter-plural":"elipsoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elipsoidal","error-unrecognized-form-feminine-indefinite-singular":"elipsoidală","error-unrecognized-form-indefinite-masculine-plural":"elipsoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"elipsoidale","definite-error-unrecognized-form-masculine-neuter-singular":"elipsoidalul","definite-error-unrecognized-form-feminine-singular":"elipsoidala","definite-error-unrecognized-form-masculine-plural":"elipsoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"elipsoidalele"}},{"word":"eliptic","pos":"adj","definitions":["elliptical"],"forms":{"feminine-singular":"eliptică","masculine-plural":"eliptici","feminine-neuter-plural":"eliptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliptic","error-unrecognized-form-feminine-indefinite-singular":"eliptică","error-unrecognized-form-indefinite-masculine-plural":"eliptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliptice","definite-error-unrecognized-form-masculine-neuter-singular":"elipticul","definite-error-unrecognized-form-feminine-singular":"eliptica","definite-error-unrecognized-form-masculine-plural":"elipticii","definite-error-unrecognized-form-feminine-neuter-plural":"elipticele"}},{"word":"elipticitate","pos":"noun","definitions":["ellipticity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elipticitate","accusative-definite-nominative-singular":"elipticitatea","accusative-indefinite-nominative-plural":"elipticități","accusative-definite-nominative-plural":"elipticitățile","dative-genitive-indefinite-singular":"elipticități","dative-definite-genitive-singular":"elipticității","dative-genitive-indefinite-plural":"elipticități","dative-definite-genitive-plural":"elipticităților","singular-vocative":"elipticitate","plural-vocative":"elipticităților"}},{"word":"Elisabeta","pos":"name","definitions":["a female given name from Hebrew, equivalent to English Elizabeth"],"gender":"f","forms":{"dative-genitive":"Elisabetei"}},{"word":"elisabetan","pos":"adj","definitions":["Elizabethan"],"forms":{"feminine-singular":"elisabetană","masculine-plural":"elisabetani","feminine-neuter-plural":"elisabetane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elisabetan","error-unrecognized-form-feminine-indefinite-singular":"elisabetană","error-unrecognized-form-indefinite-masculine-plural":"elisabetani","error-unrecognized-form-feminine-indefinite-neuter-plural":"elisabetane","definite-error-unrecognized-form-masculine-neuter-singular":"elisabetanul","definite-error-unrecognized-form-feminine-singular":"elisabetana","definite-error-unrecognized-form-masculine-plural":"elisabetanii","definite-error-unrecognized-form-feminine-neuter-plural":"elisabetanele"}},{"word":"Elisabetin","pos":"name","definitions":["a neighbourhood to the south of the historical core of Timișoara, Timiș County, Romania"],"pronunciation":"/e.li.sa.beˈtin/","gender":"n"},{"word":"eliseesc","pos":"adj","definitions":["Elysian"],"forms":{"feminine-singular":"eliseească","plural":"eliseești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eliseesc","error-unrecognized-form-feminine-indefinite-singular":"eliseească","error-unrecognized-form-indefinite-masculine-plural":"eliseești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eliseești","definite-error-unrecognized-form-masculine-neuter-singular":"eliseescul","definite-error-unrecognized-form-feminine-singular":"eliseeasca","definite-error-unrecognized-form-masculine-plural":"eliseeștii","definite-error-unrecognized-form-feminine-neuter-plural":"eliseeștile"}},{"word":"Eliseni","pos":"name","definitions":["a river in Romania, tributary to the Târnava Mare","a village in Secuieni, Harghita County, Romania"],"gender":"m"},{"word":"elită","pos":"noun","definitions":["elite"],"forms":{"plural":"elite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elită","accusative-definite-nominative-singular":"elita","accusative-indefinite-nominative-plural":"elite","accusative-definite-nominative-plural":"elitele","dative-genitive-indefinite-singular":"elite","dative-definite-genitive-singular":"elitei","dative-genitive-indefinite-plural":"elite","dative-definite-genitive-plural":"elitelor","singular-vocative":"elită","plural-vocative":"elitelor"}},{"word":"elitar","pos":"adj","definitions":["elite (attributive use)"],"forms":{"feminine-singular":"elitară","masculine-plural":"elitari","feminine-neuter-plural":"elitare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elitar","error-unrecognized-form-feminine-indefinite-singular":"elitară","error-unrecognized-form-indefinite-masculine-plural":"elitari","error-unrecognized-form-feminine-indefinite-neuter-plural":"elitare","definite-error-unrecognized-form-masculine-neuter-singular":"elitarul","definite-error-unrecognized-form-feminine-singular":"elitara","definite-error-unrecognized-form-masculine-plural":"elitarii","definite-error-unrecognized-form-feminine-neuter-plural":"elitarele"}},{"word":"elitism","pos":"noun","definitions":["elitism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"elitism","accusative-definite-nominative":"elitismul","dative-genitive-indefinite":"elitism","dative-definite-genitive":"elitismului","vocative":"elitismule"}},{"word":"elitist","pos":"adj","definitions":["elitist"],"forms":{"feminine-singular":"elitistă","masculine-plural":"elitiști","feminine-neuter-plural":"elitiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elitist","error-unrecognized-form-feminine-indefinite-singular":"elitistă","error-unrecognized-form-indefinite-masculine-plural":"elitiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"elitiste","definite-error-unrecognized-form-masculine-neuter-singular":"elitistul","definite-error-unrecognized-form-feminine-singular":"elitista","definite-error-unrecognized-form-masculine-plural":"elitiștii","definite-error-unrecognized-form-feminine-neuter-plural":"elitistele"}},{"word":"elitră","pos":"noun","definitions":["elytron"],"forms":{"plural":"elitre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elitră","accusative-definite-nominative-singular":"elitra","accusative-indefinite-nominative-plural":"elitre","accusative-definite-nominative-plural":"elitrele","dative-genitive-indefinite-singular":"elitre","dative-definite-genitive-singular":"elitrei","dative-genitive-indefinite-plural":"elitre","dative-definite-genitive-plural":"elitrelor","singular-vocative":"elitră","plural-vocative":"elitrelor"}},{"word":"elitrotomie","pos":"noun","definitions":["elytrotomy"],"forms":{"plural":"elitrotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elitrotomie","accusative-definite-nominative-singular":"elitrotomia","accusative-indefinite-nominative-plural":"elitrotomii","accusative-definite-nominative-plural":"elitrotomiile","dative-genitive-indefinite-singular":"elitrotomii","dative-definite-genitive-singular":"elitrotomiei","dative-genitive-indefinite-plural":"elitrotomii","dative-definite-genitive-plural":"elitrotomiilor","singular-vocative":"elitrotomie","plural-vocative":"elitrotomiilor"}},{"word":"elixir","pos":"noun","definitions":["elixir"],"forms":{"plural":"elixire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elixir","accusative-definite-nominative-singular":"elixirul","accusative-indefinite-nominative-plural":"elixire","accusative-definite-nominative-plural":"elixirele","dative-genitive-indefinite-singular":"elixir","dative-definite-genitive-singular":"elixirului","dative-genitive-indefinite-plural":"elixire","dative-definite-genitive-plural":"elixirelor","singular-vocative":"elixirule","plural-vocative":"elixirelor"}},{"word":"Elizavetovca","pos":"name","definitions":["a village in Elizavetovca, Dondușeni Raion, Moldova","a village in Zagarancea, Ungheni Raion, Moldova","a commune of Dondușeni Raion, Moldova"],"gender":"f"},{"word":"elizee","pos":"noun","definitions":["plural of elizeu"],"pronunciation":"[eliˈzeː]","gender":"n-p"},{"word":"elizeele","pos":"noun","definitions":["definite nominative/accusative plural of elizeu"],"pronunciation":"[eliˈzeːle]","gender":"n-p"},{"word":"elizeelor","pos":"noun","definitions":["definite genitive/dative plural of elizeu"],"pronunciation":"[eliˈzeːlor]","gender":"n-p"},{"word":"elizeic","pos":"adj","definitions":["Elysian"],"forms":{"feminine-singular":"elizeică","masculine-plural":"elizeici","feminine-neuter-plural":"elizeice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elizeic","error-unrecognized-form-feminine-indefinite-singular":"elizeică","error-unrecognized-form-indefinite-masculine-plural":"elizeici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elizeice","definite-error-unrecognized-form-masculine-neuter-singular":"elizeicul","definite-error-unrecognized-form-feminine-singular":"elizeica","definite-error-unrecognized-form-masculine-plural":"elizeicii","definite-error-unrecognized-form-feminine-neuter-plural":"elizeicele"}},{"word":"elizeu","pos":"noun","definitions":["Elysium"],"pronunciation":"[eliˈzew]","forms":{"plural":"elizee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elizeu","accusative-definite-nominative-singular":"elizeul","accusative-indefinite-nominative-plural":"elizee","accusative-definite-nominative-plural":"elizeele","dative-genitive-indefinite-singular":"elizeu","dative-definite-genitive-singular":"elizeului","dative-genitive-indefinite-plural":"elizee","dative-definite-genitive-plural":"elizeelor","singular-vocative":"elizeule","plural-vocative":"elizeelor"}},{"word":"elizeul","pos":"noun","definitions":["definite nominative/accusative singular of elizeu"],"pronunciation":"/eliˈzewl/","gender":"n"},{"word":"elizeului","pos":"noun","definitions":["definite genitive/dative singular of elizeu"],"pronunciation":"[eliˈzewluj]","gender":"n"},{"word":"eliziune","pos":"noun","definitions":["elision"],"forms":{"plural":"eliziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eliziune","accusative-definite-nominative-singular":"eliziunea","accusative-indefinite-nominative-plural":"eliziuni","accusative-definite-nominative-plural":"eliziunile","dative-genitive-indefinite-singular":"eliziuni","dative-definite-genitive-singular":"eliziunii","dative-genitive-indefinite-plural":"eliziuni","dative-definite-genitive-plural":"eliziunilor","singular-vocative":"eliziune","plural-vocative":"eliziunilor"}},{"word":"elmint","pos":"noun","definitions":["helminth"],"forms":{"plural":"elminți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elmint","accusative-definite-nominative-singular":"elmintul","accusative-indefinite-nominative-plural":"elminți","accusative-definite-nominative-plural":"elminții","dative-genitive-indefinite-singular":"elmint","dative-definite-genitive-singular":"elmintului","dative-genitive-indefinite-plural":"elminți","dative-definite-genitive-plural":"elminților","singular-vocative":"elmintule","plural-vocative":"elminților"}},{"word":"elocință","pos":"noun","definitions":["alternative form of elocvență"],"forms":{"plural":"elocințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elocință","accusative-definite-nominative-singular":"elocința","accusative-indefinite-nominative-plural":"elocințe","accusative-definite-nominative-plural":"elocințele","dative-genitive-indefinite-singular":"elocințe","dative-definite-genitive-singular":"elocinței","dative-genitive-indefinite-plural":"elocințe","dative-definite-genitive-plural":"elocințelor","singular-vocative":"elocință","plural-vocative":"elocințelor"}},{"word":"elocinte","pos":"adj","definitions":["obsolete form of elocvent"],"forms":{"masculine-plural":"elocinți","feminine-neuter-plural":"elocinte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elocinte","error-unrecognized-form-feminine-indefinite-singular":"elocinte","error-unrecognized-form-indefinite-masculine-plural":"elocinți","error-unrecognized-form-feminine-indefinite-neuter-plural":"elocinte","definite-error-unrecognized-form-masculine-neuter-singular":"elocintele","definite-error-unrecognized-form-feminine-singular":"elocintea","definite-error-unrecognized-form-masculine-plural":"elocinții","definite-error-unrecognized-form-feminine-neuter-plural":"elocintele"}},{"word":"elocuțiune","pos":"noun","definitions":["elocution"],"forms":{"plural":"elocuțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elocuțiune","accusative-definite-nominative-singular":"elocuțiunea","accusative-indefinite-nominative-plural":"elocuțiuni","accusative-definite-nominative-plural":"elocuțiunile","dative-genitive-indefinite-singular":"elocuțiuni","dative-definite-genitive-singular":"elocuțiunii","dative-genitive-indefinite-plural":"elocuțiuni","dative-definite-genitive-plural":"elocuțiunilor","singular-vocative":"elocuțiune","plural-vocative":"elocuțiunilor"}},{"word":"elocvent","pos":"adj","definitions":["eloquent, articulate"],"pronunciation":"/elokˈvent/","forms":{"feminine-singular":"elocventă","masculine-plural":"elocvenți","feminine-neuter-plural":"elocvente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elocvent","error-unrecognized-form-feminine-indefinite-singular":"elocventă","error-unrecognized-form-indefinite-masculine-plural":"elocvenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"elocvente","definite-error-unrecognized-form-masculine-neuter-singular":"elocventul","definite-error-unrecognized-form-feminine-singular":"elocventa","definite-error-unrecognized-form-masculine-plural":"elocvenții","definite-error-unrecognized-form-feminine-neuter-plural":"elocventele"}},{"word":"elocvență","pos":"noun","definitions":["eloquence"],"pronunciation":"/elokˈvent͡sə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elocvență","accusative-definite-nominative-singular":"elocvența","accusative-indefinite-nominative-plural":"elocvențe","accusative-definite-nominative-plural":"elocvențele","dative-genitive-indefinite-singular":"elocvențe","dative-definite-genitive-singular":"elocvenței","dative-genitive-indefinite-plural":"elocvențe","dative-definite-genitive-plural":"elocvențelor","singular-vocative":"elocvență","plural-vocative":"elocvențelor"}},{"word":"elogia","pos":"verb","definitions":["to praise"],"forms":{"canonical":"a elogia 1st conjugation","present-singular-third-person":"elogiează","participle-past":"elogiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elogia","gerund":"elogiind","first-person-indicative-present-singular":"elogiez","indicative-present-second-person-singular":"elogiezi","indicative-present-singular-third-person":"elogiază","first-person-indicative-plural-present":"elogiem","indicative-plural-present-second-person":"elogiați","indicative-plural-present-third-person":"elogiază","first-person-imperfect-indicative-singular":"elogiam","imperfect-indicative-second-person-singular":"elogiai","imperfect-indicative-singular-third-person":"elogia","first-person-imperfect-indicative-plural":"elogiam","imperfect-indicative-plural-second-person":"elogiați","imperfect-indicative-plural-third-person":"elogiau","first-person-indicative-perfect-singular":"elogiai","indicative-perfect-second-person-singular":"elogiași","indicative-perfect-singular-third-person":"elogie","first-person-indicative-perfect-plural":"elogiarăm","indicative-perfect-plural-second-person":"elogiarăți","indicative-perfect-plural-third-person":"elogiară","first-person-indicative-pluperfect-singular":"elogiasem","indicative-pluperfect-second-person-singular":"elogiaseși","indicative-pluperfect-singular-third-person":"elogiase","first-person-indicative-pluperfect-plural":"elogiaserăm","indicative-pluperfect-plural-second-person":"elogiaserăți","indicative-pluperfect-plural-third-person":"elogiaseră","first-person-present-singular-subjunctive":"să elogiez","present-second-person-singular-subjunctive":"să elogiezi","present-singular-subjunctive-third-person":"să elogieze","first-person-plural-present-subjunctive":"să elogiem","plural-present-second-person-subjunctive":"să elogiați","plural-present-subjunctive-third-person":"să elogieze","imperative-second-person-singular":"elogiază","imperative-plural-second-person":"elogiați","imperative-negative-second-person-singular":"nu elogia","imperative-negative-plural-second-person":"nu elogiați"}},{"word":"elogiat","pos":"adj","definitions":["praised"],"forms":{"feminine-singular":"elogiată","masculine-plural":"elogiați","feminine-neuter-plural":"elogiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elogiat","error-unrecognized-form-feminine-indefinite-singular":"elogiată","error-unrecognized-form-indefinite-masculine-plural":"elogiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"elogiate","definite-error-unrecognized-form-masculine-neuter-singular":"elogiatul","definite-error-unrecognized-form-feminine-singular":"elogiata","definite-error-unrecognized-form-masculine-plural":"elogiații","definite-error-unrecognized-form-feminine-neuter-plural":"elogiatele"}},{"word":"elogiat","pos":"verb","definitions":["past participle of elogia"],"forms":{"participle-past":"of elogia"}},{"word":"elogiere","pos":"noun","definitions":["the act of eulogizing"],"forms":{"plural":"elogieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elogiere","accusative-definite-nominative-singular":"elogierea","accusative-indefinite-nominative-plural":"elogieri","accusative-definite-nominative-plural":"elogierile","dative-genitive-indefinite-singular":"elogieri","dative-definite-genitive-singular":"elogierii","dative-genitive-indefinite-plural":"elogieri","dative-definite-genitive-plural":"elogierilor","singular-vocative":"elogiere","plural-vocative":"elogierilor"}},{"word":"elogios","pos":"adj","definitions":["eulogistic, laudatory"],"forms":{"feminine-singular":"elogioasă","masculine-plural":"elogioși","feminine-neuter-plural":"elogioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elogios","error-unrecognized-form-feminine-indefinite-singular":"elogioasă","error-unrecognized-form-indefinite-masculine-plural":"elogioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"elogioase","definite-error-unrecognized-form-masculine-neuter-singular":"elogiosul","definite-error-unrecognized-form-feminine-singular":"elogioasa","definite-error-unrecognized-form-masculine-plural":"elogioșii","definite-error-unrecognized-form-feminine-neuter-plural":"elogioasele"}},{"word":"elogist","pos":"noun","definitions":["elogist"],"forms":{"plural":"elogiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elogist","accusative-definite-nominative-singular":"elogistul","accusative-indefinite-nominative-plural":"elogiști","accusative-definite-nominative-plural":"elogiștii","dative-genitive-indefinite-singular":"elogist","dative-definite-genitive-singular":"elogistului","dative-genitive-indefinite-plural":"elogiști","dative-definite-genitive-plural":"elogiștilor","singular-vocative":"elogistule","plural-vocative":"elogiștilor"}},{"word":"elogiu","pos":"noun","definitions":["eulogy"],"pronunciation":"[eˈlo.d͡ʒiw]","forms":{"plural":"elogii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elogiu","accusative-definite-nominative-singular":"elogiul","accusative-indefinite-nominative-plural":"elogii","accusative-definite-nominative-plural":"elogiile","dative-genitive-indefinite-singular":"elogiu","dative-definite-genitive-singular":"elogiului","dative-genitive-indefinite-plural":"elogii","dative-definite-genitive-plural":"elogiilor","singular-vocative":"elogiule","plural-vocative":"elogiilor"}},{"word":"elongat","pos":"adj","definitions":["elongate"],"forms":{"feminine-singular":"elongată","masculine-plural":"elongați","feminine-neuter-plural":"elongate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elongat","error-unrecognized-form-feminine-indefinite-singular":"elongată","error-unrecognized-form-indefinite-masculine-plural":"elongați","error-unrecognized-form-feminine-indefinite-neuter-plural":"elongate","definite-error-unrecognized-form-masculine-neuter-singular":"elongatul","definite-error-unrecognized-form-feminine-singular":"elongata","definite-error-unrecognized-form-masculine-plural":"elongații","definite-error-unrecognized-form-feminine-neuter-plural":"elongatele"}},{"word":"elongație","pos":"noun","definitions":["elongation"],"forms":{"plural":"elongații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elongație","accusative-definite-nominative-singular":"elongația","accusative-indefinite-nominative-plural":"elongații","accusative-definite-nominative-plural":"elongațiile","dative-genitive-indefinite-singular":"elongații","dative-definite-genitive-singular":"elongației","dative-genitive-indefinite-plural":"elongații","dative-definite-genitive-plural":"elongațiilor","singular-vocative":"elongație","plural-vocative":"elongațiilor"}},{"word":"elongațiune","pos":"noun","definitions":["obsolete form of elongație"],"forms":{"plural":"elongațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elongațiune","accusative-definite-nominative-singular":"elongațiunea","accusative-indefinite-nominative-plural":"elongațiuni","accusative-definite-nominative-plural":"elongațiunile","dative-genitive-indefinite-singular":"elongațiuni","dative-definite-genitive-singular":"elongațiunii","dative-genitive-indefinite-plural":"elongațiuni","dative-definite-genitive-plural":"elongațiunilor","singular-vocative":"elongațiune","plural-vocative":"elongațiunilor"}},{"word":"eloxat","pos":"adj","definitions":["anodized"],"forms":{"feminine-singular":"eloxată","masculine-plural":"eloxați","feminine-neuter-plural":"eloxate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eloxat","error-unrecognized-form-feminine-indefinite-singular":"eloxată","error-unrecognized-form-indefinite-masculine-plural":"eloxați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eloxate","definite-error-unrecognized-form-masculine-neuter-singular":"eloxatul","definite-error-unrecognized-form-feminine-singular":"eloxata","definite-error-unrecognized-form-masculine-plural":"eloxații","definite-error-unrecognized-form-feminine-neuter-plural":"eloxatele"}},{"word":"eluant","pos":"noun","definitions":["eluent"],"forms":{"plural":"eluanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eluant","accusative-definite-nominative-singular":"eluantul","accusative-indefinite-nominative-plural":"eluanți","accusative-definite-nominative-plural":"eluanții","dative-genitive-indefinite-singular":"eluant","dative-definite-genitive-singular":"eluantului","dative-genitive-indefinite-plural":"eluanți","dative-definite-genitive-plural":"eluanților","singular-vocative":"eluantule","plural-vocative":"eluanților"}},{"word":"elucida","pos":"verb","definitions":["to elucidate"],"forms":{"canonical":"a elucida 1st conjugation","present-singular-third-person":"elucidează","participle-past":"elucidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elucida","gerund":"elucidând","first-person-indicative-present-singular":"elucidez","indicative-present-second-person-singular":"elucidezi","indicative-present-singular-third-person":"elucidează","first-person-indicative-plural-present":"elucidăm","indicative-plural-present-second-person":"elucidați","indicative-plural-present-third-person":"elucidează","first-person-imperfect-indicative-singular":"elucidam","imperfect-indicative-second-person-singular":"elucidai","imperfect-indicative-singular-third-person":"elucida","first-person-imperfect-indicative-plural":"elucidam","imperfect-indicative-plural-second-person":"elucidați","imperfect-indicative-plural-third-person":"elucidau","first-person-indicative-perfect-singular":"elucidai","indicative-perfect-second-person-singular":"elucidași","indicative-perfect-singular-third-person":"elucidă","first-person-indicative-perfect-plural":"elucidarăm","indicative-perfect-plural-second-person":"elucidarăți","indicative-perfect-plural-third-person":"elucidară","first-person-indicative-pluperfect-singular":"elucidasem","indicative-pluperfect-second-person-singular":"elucidaseși","indicative-pluperfect-singular-third-person":"elucidase","first-person-indicative-pluperfect-plural":"elucidaserăm","indicative-pluperfect-plural-second-person":"elucidaserăți","indicative-pluperfect-plural-third-person":"elucidaseră","first-person-present-singular-subjunctive":"să elucidez","present-second-person-singular-subjunctive":"să elucidezi","present-singular-subjunctive-third-person":"să elucideze","first-person-plural-present-subjunctive":"să elucidăm","plural-present-second-person-subjunctive":"să elucidați","plural-present-subjunctive-third-person":"să elucideze","imperative-second-person-singular":"elucidează","imperative-plural-second-person":"elucidați","imperative-negative-second-person-singular":"nu elucida","imperative-negative-plural-second-person":"nu elucidați"}},{"word":"elucidare","pos":"noun","definitions":["elucidation"],"forms":{"plural":"elucidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elucidare","accusative-definite-nominative-singular":"elucidarea","accusative-indefinite-nominative-plural":"elucidări","accusative-definite-nominative-plural":"elucidările","dative-genitive-indefinite-singular":"elucidări","dative-definite-genitive-singular":"elucidării","dative-genitive-indefinite-plural":"elucidări","dative-definite-genitive-plural":"elucidărilor","singular-vocative":"elucidare","plural-vocative":"elucidărilor"}},{"word":"elucidat","pos":"adj","definitions":["elucidated"],"forms":{"feminine-singular":"elucidată","masculine-plural":"elucidați","feminine-neuter-plural":"elucidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elucidat","error-unrecognized-form-feminine-indefinite-singular":"elucidată","error-unrecognized-form-indefinite-masculine-plural":"elucidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"elucidate","definite-error-unrecognized-form-masculine-neuter-singular":"elucidatul","definite-error-unrecognized-form-feminine-singular":"elucidata","definite-error-unrecognized-form-masculine-plural":"elucidații","definite-error-unrecognized-form-feminine-neuter-plural":"elucidatele"}},{"word":"elucidat","pos":"verb","definitions":["past participle of elucida"],"forms":{"participle-past":"of elucida"}},{"word":"elucidație","pos":"noun","definitions":["elucidation"],"forms":{"plural":"elucidații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elucidație","accusative-definite-nominative-singular":"elucidația","accusative-indefinite-nominative-plural":"elucidații","accusative-definite-nominative-plural":"elucidațiile","dative-genitive-indefinite-singular":"elucidații","dative-definite-genitive-singular":"elucidației","dative-genitive-indefinite-plural":"elucidații","dative-definite-genitive-plural":"elucidațiilor","singular-vocative":"elucidație","plural-vocative":"elucidațiilor"}},{"word":"elucubra","pos":"verb","definitions":["to elucubrate"],"forms":{"canonical":"a elucubra 1st conjugation","present-singular-third-person":"elucubrează","participle-past":"elucubrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a elucubra","gerund":"elucubrând","first-person-indicative-present-singular":"elucubrez","indicative-present-second-person-singular":"elucubrezi","indicative-present-singular-third-person":"elucubrează","first-person-indicative-plural-present":"elucubrăm","indicative-plural-present-second-person":"elucubrați","indicative-plural-present-third-person":"elucubrează","first-person-imperfect-indicative-singular":"elucubram","imperfect-indicative-second-person-singular":"elucubrai","imperfect-indicative-singular-third-person":"elucubra","first-person-imperfect-indicative-plural":"elucubram","imperfect-indicative-plural-second-person":"elucubrați","imperfect-indicative-plural-third-person":"elucubrau","first-person-indicative-perfect-singular":"elucubrai","indicative-perfect-second-person-singular":"elucubrași","indicative-perfect-singular-third-person":"elucubră","first-person-indicative-perfect-plural":"elucubrarăm","indicative-perfect-plural-second-person":"elucubrarăți","indicative-perfect-plural-third-person":"elucubrară","first-person-indicative-pluperfect-singular":"elucubrasem","indicative-pluperfect-second-person-singular":"elucubraseși","indicative-pluperfect-singular-third-person":"elucubrase","first-person-indicative-pluperfect-plural":"elucubraserăm","indicative-pluperfect-plural-second-person":"elucubraserăți","indicative-pluperfect-plural-third-person":"elucubraseră","first-person-present-singular-subjunctive":"să elucubrez","present-second-person-singular-subjunctive":"să elucubrezi","present-singular-subjunctive-third-person":"să elucubreze","first-person-plural-present-subjunctive":"să elucubrăm","plural-present-second-person-subjunctive":"să elucubrați","plural-present-subjunctive-third-person":"să elucubreze","imperative-second-person-singular":"elucubrează","imperative-plural-second-person":"elucubrați","imperative-negative-second-person-singular":"nu elucubra","imperative-negative-plural-second-person":"nu elucubrați"}},{"word":"elucubrant","pos":"adj","definitions":["absurd"],"forms":{"feminine-singular":"elucubrantă","masculine-plural":"elucubranți","feminine-neuter-plural":"elucubrante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elucubrant","error-unrecognized-form-feminine-indefinite-singular":"elucubrantă","error-unrecognized-form-indefinite-masculine-plural":"elucubranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"elucubrante","definite-error-unrecognized-form-masculine-neuter-singular":"elucubrantul","definite-error-unrecognized-form-feminine-singular":"elucubranta","definite-error-unrecognized-form-masculine-plural":"elucubranții","definite-error-unrecognized-form-feminine-neuter-plural":"elucubrantele"}},{"word":"elucubrație","pos":"noun","definitions":["speculation"],"forms":{"plural":"elucubrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"elucubrație","accusative-definite-nominative-singular":"elucubrația","accusative-indefinite-nominative-plural":"elucubrații","accusative-definite-nominative-plural":"elucubrațiile","dative-genitive-indefinite-singular":"elucubrații","dative-definite-genitive-singular":"elucubrației","dative-genitive-indefinite-plural":"elucubrații","dative-definite-genitive-plural":"elucubrațiilor","singular-vocative":"elucubrație","plural-vocative":"elucubrațiilor"}},{"word":"elucubrațiune","pos":"noun","definitions":["alternative form of elucubrație"],"forms":{"plural":"elucubrațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"elucubrațiune","accusative-definite-nominative-singular":"elucubrațiunea","accusative-indefinite-nominative-plural":"elucubrațiuni","accusative-definite-nominative-plural":"elucubrațiunile","dative-genitive-indefinite-singular":"elucubrațiuni","dative-definite-genitive-singular":"elucubrațiunii","dative-genitive-indefinite-plural":"elucubrațiuni","dative-definite-genitive-plural":"elucubrațiunilor","singular-vocative":"elucubrațiune","plural-vocative":"elucubrațiunilor"}},{"word":"elucubrativ","pos":"adj","definitions":["elucubrating"],"forms":{"feminine-singular":"elucubrativă","masculine-plural":"elucubrativi","feminine-neuter-plural":"elucubrative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elucubrativ","error-unrecognized-form-feminine-indefinite-singular":"elucubrativă","error-unrecognized-form-indefinite-masculine-plural":"elucubrativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"elucubrative","definite-error-unrecognized-form-masculine-neuter-singular":"elucubrativul","definite-error-unrecognized-form-feminine-singular":"elucubrativa","definite-error-unrecognized-form-masculine-plural":"elucubrativii","definite-error-unrecognized-form-feminine-neuter-plural":"elucubrativele"}},{"word":"eluda","pos":"verb","definitions":["to elude"],"forms":{"canonical":"a eluda 1st conjugation","present-singular-third-person":"eludează","participle-past":"eludat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eluda","gerund":"eludând","first-person-indicative-present-singular":"eludez","indicative-present-second-person-singular":"eludezi","indicative-present-singular-third-person":"eludează","first-person-indicative-plural-present":"eludăm","indicative-plural-present-second-person":"eludați","indicative-plural-present-third-person":"eludează","first-person-imperfect-indicative-singular":"eludam","imperfect-indicative-second-person-singular":"eludai","imperfect-indicative-singular-third-person":"eluda","first-person-imperfect-indicative-plural":"eludam","imperfect-indicative-plural-second-person":"eludați","imperfect-indicative-plural-third-person":"eludau","first-person-indicative-perfect-singular":"eludai","indicative-perfect-second-person-singular":"eludași","indicative-perfect-singular-third-person":"eludă","first-person-indicative-perfect-plural":"eludarăm","indicative-perfect-plural-second-person":"eludarăți","indicative-perfect-plural-third-person":"eludară","first-person-indicative-pluperfect-singular":"eludasem","indicative-pluperfect-second-person-singular":"eludaseși","indicative-pluperfect-singular-third-person":"eludase","first-person-indicative-pluperfect-plural":"eludaserăm","indicative-pluperfect-plural-second-person":"eludaserăți","indicative-pluperfect-plural-third-person":"eludaseră","first-person-present-singular-subjunctive":"să eludez","present-second-person-singular-subjunctive":"să eludezi","present-singular-subjunctive-third-person":"să eludeze","first-person-plural-present-subjunctive":"să eludăm","plural-present-second-person-subjunctive":"să eludați","plural-present-subjunctive-third-person":"să eludeze","imperative-second-person-singular":"eludează","imperative-plural-second-person":"eludați","imperative-negative-second-person-singular":"nu eluda","imperative-negative-plural-second-person":"nu eludați"}},{"word":"eludabil","pos":"adj","definitions":["evasive"],"forms":{"feminine-singular":"eludabilă","masculine-plural":"eludabili","feminine-neuter-plural":"eludabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eludabil","error-unrecognized-form-feminine-indefinite-singular":"eludabilă","error-unrecognized-form-indefinite-masculine-plural":"eludabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"eludabile","definite-error-unrecognized-form-masculine-neuter-singular":"eludabilul","definite-error-unrecognized-form-feminine-singular":"eludabila","definite-error-unrecognized-form-masculine-plural":"eludabilii","definite-error-unrecognized-form-feminine-neuter-plural":"eludabilele"}},{"word":"eludare","pos":"noun","definitions":["elusion"],"forms":{"plural":"eludări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eludare","accusative-definite-nominative-singular":"eludarea","accusative-indefinite-nominative-plural":"eludări","accusative-definite-nominative-plural":"eludările","dative-genitive-indefinite-singular":"eludări","dative-definite-genitive-singular":"eludării","dative-genitive-indefinite-plural":"eludări","dative-definite-genitive-plural":"eludărilor","singular-vocative":"eludare","plural-vocative":"eludărilor"}},{"word":"eludat","pos":"adj","definitions":["eluded"],"forms":{"feminine-singular":"eludată","masculine-plural":"eludați","feminine-neuter-plural":"eludate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eludat","error-unrecognized-form-feminine-indefinite-singular":"eludată","error-unrecognized-form-indefinite-masculine-plural":"eludați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eludate","definite-error-unrecognized-form-masculine-neuter-singular":"eludatul","definite-error-unrecognized-form-feminine-singular":"eludata","definite-error-unrecognized-form-masculine-plural":"eludații","definite-error-unrecognized-form-feminine-neuter-plural":"eludatele"}},{"word":"eludat","pos":"verb","definitions":["past participle of eluda"],"forms":{"participle-past":"of eluda"}},{"word":"eluție","pos":"noun","definitions":["elution"],"forms":{"plural":"eluții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eluție","accusative-definite-nominative-singular":"eluția","accusative-indefinite-nominative-plural":"eluții","accusative-definite-nominative-plural":"eluțiile","dative-genitive-indefinite-singular":"eluții","dative-definite-genitive-singular":"eluției","dative-genitive-indefinite-plural":"eluții","dative-definite-genitive-plural":"eluțiilor","singular-vocative":"eluție","plural-vocative":"eluțiilor"}},{"word":"eluțiune","pos":"noun","definitions":["elution"],"forms":{"plural":"eluțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eluțiune","accusative-definite-nominative-singular":"eluțiunea","accusative-indefinite-nominative-plural":"eluțiuni","accusative-definite-nominative-plural":"eluțiunile","dative-genitive-indefinite-singular":"eluțiuni","dative-definite-genitive-singular":"eluțiunii","dative-genitive-indefinite-plural":"eluțiuni","dative-definite-genitive-plural":"eluțiunilor","singular-vocative":"eluțiune","plural-vocative":"eluțiunilor"}},{"word":"elutriere","pos":"noun","definitions":["elutriation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"elutriere","accusative-definite-nominative":"elutrierea","dative-genitive-indefinite":"elutrieri","dative-definite-genitive":"elutrierii","vocative":"elutriere"}},{"word":"eluvial","pos":"adj","definitions":["eluvial"],"forms":{"feminine-singular":"eluvială","masculine-plural":"eluviali","feminine-neuter-plural":"eluviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eluvial","error-unrecognized-form-feminine-indefinite-singular":"eluvială","error-unrecognized-form-indefinite-masculine-plural":"eluviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"eluviale","definite-error-unrecognized-form-masculine-neuter-singular":"eluvialul","definite-error-unrecognized-form-feminine-singular":"eluviala","definite-error-unrecognized-form-masculine-plural":"eluvialii","definite-error-unrecognized-form-feminine-neuter-plural":"eluvialele"}},{"word":"eluviu","pos":"noun","definitions":["eluvium"],"forms":{"plural":"eluvii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eluviu","accusative-definite-nominative-singular":"eluviul","accusative-indefinite-nominative-plural":"eluvii","accusative-definite-nominative-plural":"eluviile","dative-genitive-indefinite-singular":"eluviu","dative-definite-genitive-singular":"eluviului","dative-genitive-indefinite-plural":"eluvii","dative-definite-genitive-plural":"eluviilor","singular-vocative":"eluviule","plural-vocative":"eluviilor"}},{"word":"eluviune","pos":"noun","definitions":["eluvium"],"forms":{"plural":"eluviuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eluviune","accusative-definite-nominative-singular":"eluviunea","accusative-indefinite-nominative-plural":"eluviuni","accusative-definite-nominative-plural":"eluviunile","dative-genitive-indefinite-singular":"eluviuni","dative-definite-genitive-singular":"eluviunii","dative-genitive-indefinite-plural":"eluviuni","dative-definite-genitive-plural":"eluviunilor","singular-vocative":"eluviune","plural-vocative":"eluviunilor"}},{"word":"elvet","pos":"noun","definitions":["Swiss"],"forms":{"plural":"elveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elvet","accusative-definite-nominative-singular":"elvetul","accusative-indefinite-nominative-plural":"elveți","accusative-definite-nominative-plural":"elveții","dative-genitive-indefinite-singular":"elvet","dative-definite-genitive-singular":"elvetului","dative-genitive-indefinite-plural":"elveți","dative-definite-genitive-plural":"elveților","singular-vocative":"elvetule","plural-vocative":"elveților"}},{"word":"Elveția","pos":"name","definitions":["Switzerland (a country in Western Europe and Central Europe)"],"pronunciation":"/elˈve.t͡si.(j)a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Elveție","accusative-definite-nominative":"Elveția","dative-genitive-indefinite":"Elveții","dative-definite-genitive":"Elveției","vocative":"Elveție"}},{"word":"elvețian","pos":"noun","definitions":["Swiss"],"forms":{"plural":"elvețieni","feminine":"equivalent elvețiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"elvețian","accusative-definite-nominative-singular":"elvețianul","accusative-indefinite-nominative-plural":"elvețieni","accusative-definite-nominative-plural":"elvețienii","dative-genitive-indefinite-singular":"elvețian","dative-definite-genitive-singular":"elvețianului","dative-genitive-indefinite-plural":"elvețieni","dative-definite-genitive-plural":"elvețienilor","singular-vocative":"elvețianule","plural-vocative":"elvețienilor"}},{"word":"elvețiană","pos":"noun","definitions":["female equivalent of elvețian"],"forms":{"plural":"elvețiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elvețiană","accusative-definite-nominative-singular":"elvețiana","accusative-indefinite-nominative-plural":"elvețiene","accusative-definite-nominative-plural":"elvețienele","dative-genitive-indefinite-singular":"elvețiene","dative-definite-genitive-singular":"elvețienei","dative-genitive-indefinite-plural":"elvețiene","dative-definite-genitive-plural":"elvețienelor","singular-vocative":"elvețiană","plural-vocative":"elvețienelor"}},{"word":"elvețiancă","pos":"noun","definitions":["female equivalent of elvețian"],"forms":{"plural":"elvețience","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"elvețiancă","accusative-definite-nominative-singular":"elvețianca","accusative-indefinite-nominative-plural":"elvețiance","accusative-definite-nominative-plural":"elvețiancele","dative-genitive-indefinite-singular":"elvețiance","dative-definite-genitive-singular":"elvețiancei","dative-genitive-indefinite-plural":"elvețiance","dative-definite-genitive-plural":"elvețiancelor","singular-vocative":"elvețiancă","plural-vocative":"elvețiancelor"}},{"word":"elvetic","pos":"adj","definitions":["Swiss"],"forms":{"feminine-singular":"elvetică","masculine-plural":"elvetici","feminine-neuter-plural":"elvetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elvetic","error-unrecognized-form-feminine-indefinite-singular":"elvetică","error-unrecognized-form-indefinite-masculine-plural":"elvetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"elvetice","definite-error-unrecognized-form-masculine-neuter-singular":"elveticul","definite-error-unrecognized-form-feminine-singular":"elvetica","definite-error-unrecognized-form-masculine-plural":"elveticii","definite-error-unrecognized-form-feminine-neuter-plural":"elveticele"}},{"word":"elveticesc","pos":"adj","definitions":["Swiss"],"forms":{"feminine-singular":"elveticească","plural":"elveticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"elveticesc","error-unrecognized-form-feminine-indefinite-singular":"elveticească","error-unrecognized-form-indefinite-masculine-plural":"elveticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"elveticești","definite-error-unrecognized-form-masculine-neuter-singular":"elveticescul","definite-error-unrecognized-form-feminine-singular":"elveticeasca","definite-error-unrecognized-form-masculine-plural":"elveticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"elveticeștile"}},{"word":"elvețienește","pos":"adv","definitions":["Swissly"]},{"word":"elzevir","pos":"noun","definitions":["Elzevir (typeface)"],"forms":{"plural":"elzevire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"elzevir","accusative-definite-nominative-singular":"elzevirul","accusative-indefinite-nominative-plural":"elzevire","accusative-definite-nominative-plural":"elzevirele","dative-genitive-indefinite-singular":"elzevir","dative-definite-genitive-singular":"elzevirului","dative-genitive-indefinite-plural":"elzevire","dative-definite-genitive-plural":"elzevirelor","singular-vocative":"elzevirule","plural-vocative":"elzevirelor"}},{"word":"emacia","pos":"verb","definitions":["to emaciate"],"forms":{"canonical":"a emacia 1st conjugation","present-singular-third-person":"emaciază","participle-past":"emaciat","subjunctive-third-person":"emacieze","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emacia","gerund":"emaciind","first-person-indicative-present-singular":"emaciez","indicative-present-second-person-singular":"emaciezi","indicative-present-singular-third-person":"emaciază","first-person-indicative-plural-present":"emaciem","indicative-plural-present-second-person":"emaciați","indicative-plural-present-third-person":"emaciază","first-person-imperfect-indicative-singular":"emaciam","imperfect-indicative-second-person-singular":"emaciai","imperfect-indicative-singular-third-person":"emacia","first-person-imperfect-indicative-plural":"emaciam","imperfect-indicative-plural-second-person":"emaciați","imperfect-indicative-plural-third-person":"emaciau","first-person-indicative-perfect-singular":"emaciai","indicative-perfect-second-person-singular":"emaciași","indicative-perfect-singular-third-person":"emacie","first-person-indicative-perfect-plural":"emaciarăm","indicative-perfect-plural-second-person":"emaciarăți","indicative-perfect-plural-third-person":"emaciară","first-person-indicative-pluperfect-singular":"emaciasem","indicative-pluperfect-second-person-singular":"emaciaseși","indicative-pluperfect-singular-third-person":"emaciase","first-person-indicative-pluperfect-plural":"emaciaserăm","indicative-pluperfect-plural-second-person":"emaciaserăți","indicative-pluperfect-plural-third-person":"emaciaseră","first-person-present-singular-subjunctive":"să emaciez","present-second-person-singular-subjunctive":"să emaciezi","present-singular-subjunctive-third-person":"să emacieze","first-person-plural-present-subjunctive":"să emaciem","plural-present-second-person-subjunctive":"să emaciați","plural-present-subjunctive-third-person":"să emacieze","imperative-second-person-singular":"emaciază","imperative-plural-second-person":"emaciați","imperative-negative-second-person-singular":"nu emacia","imperative-negative-plural-second-person":"nu emaciați"}},{"word":"emaciat","pos":"adj","definitions":["emaciated (thin or haggard)"],"forms":{"feminine-singular":"emaciată","masculine-plural":"emaciați","feminine-neuter-plural":"emaciate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emaciat","error-unrecognized-form-feminine-indefinite-singular":"emaciată","error-unrecognized-form-indefinite-masculine-plural":"emaciați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emaciate","definite-error-unrecognized-form-masculine-neuter-singular":"emaciatul","definite-error-unrecognized-form-feminine-singular":"emaciata","definite-error-unrecognized-form-masculine-plural":"emaciații","definite-error-unrecognized-form-feminine-neuter-plural":"emaciatele"}},{"word":"emaciație","pos":"noun","definitions":["emaciation"],"forms":{"plural":"emaciații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emaciație","accusative-definite-nominative-singular":"emaciația","accusative-indefinite-nominative-plural":"emaciații","accusative-definite-nominative-plural":"emaciațiile","dative-genitive-indefinite-singular":"emaciații","dative-definite-genitive-singular":"emaciației","dative-genitive-indefinite-plural":"emaciații","dative-definite-genitive-plural":"emaciațiilor","singular-vocative":"emaciație","plural-vocative":"emaciațiilor"}},{"word":"emaciere","pos":"noun","definitions":["emaciation"],"forms":{"plural":"emacieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emaciere","accusative-definite-nominative-singular":"emacierea","accusative-indefinite-nominative-plural":"emacieri","accusative-definite-nominative-plural":"emacierile","dative-genitive-indefinite-singular":"emacieri","dative-definite-genitive-singular":"emacierii","dative-genitive-indefinite-plural":"emacieri","dative-definite-genitive-plural":"emacierilor","singular-vocative":"emaciere","plural-vocative":"emacierilor"}},{"word":"emagramă","pos":"noun","definitions":["emagram"],"forms":{"plural":"emagrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emagramă","accusative-definite-nominative-singular":"emagrama","accusative-indefinite-nominative-plural":"emagrame","accusative-definite-nominative-plural":"emagramele","dative-genitive-indefinite-singular":"emagrame","dative-definite-genitive-singular":"emagramei","dative-genitive-indefinite-plural":"emagrame","dative-definite-genitive-plural":"emagramelor","singular-vocative":"emagramă","plural-vocative":"emagramelor"}},{"word":"email","pos":"noun","definitions":["enamel"],"pronunciation":"/eˈma.il/","forms":{"plural":"emailuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"email","accusative-definite-nominative-singular":"emailul","accusative-indefinite-nominative-plural":"emailuri","accusative-definite-nominative-plural":"emailurile","dative-genitive-indefinite-singular":"email","dative-definite-genitive-singular":"emailului","dative-genitive-indefinite-plural":"emailuri","dative-definite-genitive-plural":"emailurilor","singular-vocative":"emailule","plural-vocative":"emailurilor"}},{"word":"email","pos":"noun","definitions":["email"],"pronunciation":"/iˈmejl/","forms":{"plural":"emailuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"email","accusative-definite-nominative-singular":"emailul","accusative-indefinite-nominative-plural":"emailuri","accusative-definite-nominative-plural":"emailurile","dative-genitive-indefinite-singular":"email","dative-definite-genitive-singular":"emailului","dative-genitive-indefinite-plural":"emailuri","dative-definite-genitive-plural":"emailurilor","singular-vocative":"emailule","plural-vocative":"emailurilor"}},{"word":"emaila","pos":"verb","definitions":["to enamel"],"forms":{"canonical":"a emaila 1st conjugation","present-singular-third-person":"emailează","participle-past":"emailat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emaila","gerund":"emailând","first-person-indicative-present-singular":"emailez","indicative-present-second-person-singular":"emailezi","indicative-present-singular-third-person":"emailează","first-person-indicative-plural-present":"emailăm","indicative-plural-present-second-person":"emailați","indicative-plural-present-third-person":"emailează","first-person-imperfect-indicative-singular":"emailam","imperfect-indicative-second-person-singular":"emailai","imperfect-indicative-singular-third-person":"emaila","first-person-imperfect-indicative-plural":"emailam","imperfect-indicative-plural-second-person":"emailați","imperfect-indicative-plural-third-person":"emailau","first-person-indicative-perfect-singular":"emailai","indicative-perfect-second-person-singular":"emailași","indicative-perfect-singular-third-person":"emailă","first-person-indicative-perfect-plural":"emailarăm","indicative-perfect-plural-second-person":"emailarăți","indicative-perfect-plural-third-person":"emailară","first-person-indicative-pluperfect-singular":"emailasem","indicative-pluperfect-second-person-singular":"emailaseși","indicative-pluperfect-singular-third-person":"emailase","first-person-indicative-pluperfect-plural":"emailaserăm","indicative-pluperfect-plural-second-person":"emailaserăți","indicative-pluperfect-plural-third-person":"emailaseră","first-person-present-singular-subjunctive":"să emailez","present-second-person-singular-subjunctive":"să emailezi","present-singular-subjunctive-third-person":"să emaileze","first-person-plural-present-subjunctive":"să emailăm","plural-present-second-person-subjunctive":"să emailați","plural-present-subjunctive-third-person":"să emaileze","imperative-second-person-singular":"emailează","imperative-plural-second-person":"emailați","imperative-negative-second-person-singular":"nu emaila","imperative-negative-plural-second-person":"nu emailați"}},{"word":"emailaj","pos":"noun","definitions":["enamelling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emailaj","accusative-definite-nominative":"emailajul","dative-genitive-indefinite":"emailaj","dative-definite-genitive":"emailajului","vocative":"emailajule"}},{"word":"emailare","pos":"noun","definitions":["enameling"],"forms":{"plural":"emailări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emailare","accusative-definite-nominative-singular":"emailarea","accusative-indefinite-nominative-plural":"emailări","accusative-definite-nominative-plural":"emailările","dative-genitive-indefinite-singular":"emailări","dative-definite-genitive-singular":"emailării","dative-genitive-indefinite-plural":"emailări","dative-definite-genitive-plural":"emailărilor","singular-vocative":"emailare","plural-vocative":"emailărilor"}},{"word":"emailat","pos":"adj","definitions":["enameled"],"forms":{"feminine-singular":"emailată","masculine-plural":"emailați","feminine-neuter-plural":"emailate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emailat","error-unrecognized-form-feminine-indefinite-singular":"emailată","error-unrecognized-form-indefinite-masculine-plural":"emailați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emailate","definite-error-unrecognized-form-masculine-neuter-singular":"emailatul","definite-error-unrecognized-form-feminine-singular":"emailata","definite-error-unrecognized-form-masculine-plural":"emailații","definite-error-unrecognized-form-feminine-neuter-plural":"emailatele"}},{"word":"emailator","pos":"noun","definitions":["enameler"],"forms":{"plural":"emailatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emailator","accusative-definite-nominative-singular":"emailatorul","accusative-indefinite-nominative-plural":"emailatori","accusative-definite-nominative-plural":"emailatorii","dative-genitive-indefinite-singular":"emailator","dative-definite-genitive-singular":"emailatorului","dative-genitive-indefinite-plural":"emailatori","dative-definite-genitive-plural":"emailatorilor","singular-vocative":"emailatorule","plural-vocative":"emailatorilor"}},{"word":"emailoare","pos":"noun","definitions":["female equivalent of emailor"],"forms":{"plural":"emailoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"emailoare","accusative-definite-nominative-singular":"emailoarea","accusative-indefinite-nominative-plural":"emailoare","accusative-definite-nominative-plural":"emailoarele","dative-genitive-indefinite-singular":"emailoare","dative-definite-genitive-singular":"emailoarei","dative-genitive-indefinite-plural":"emailoare","dative-definite-genitive-plural":"emailoarelor","singular-vocative":"emailoare","plural-vocative":"emailoarelor"}},{"word":"emailor","pos":"noun","definitions":["enameller"],"forms":{"plural":"emailori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emailor","accusative-definite-nominative-singular":"emailorul","accusative-indefinite-nominative-plural":"emailori","accusative-definite-nominative-plural":"emailorii","dative-genitive-indefinite-singular":"emailor","dative-definite-genitive-singular":"emailorului","dative-genitive-indefinite-plural":"emailori","dative-definite-genitive-plural":"emailorilor","singular-vocative":"emailorule","plural-vocative":"emailorilor"}},{"word":"emana","pos":"verb","definitions":["to emanate"],"forms":{"canonical":"a emana 1st conjugation","present-singular-third-person":"emană","participle-past":"emanat","subjunctive-third-person":"emane","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a emana","gerund":"emanând","first-person-indicative-present-singular":"eman","indicative-present-second-person-singular":"emani","indicative-present-singular-third-person":"emană","first-person-indicative-plural-present":"emanăm","indicative-plural-present-second-person":"emanați","indicative-plural-present-third-person":"emană","first-person-imperfect-indicative-singular":"emanam","imperfect-indicative-second-person-singular":"emanai","imperfect-indicative-singular-third-person":"emana","first-person-imperfect-indicative-plural":"emanam","imperfect-indicative-plural-second-person":"emanați","imperfect-indicative-plural-third-person":"emanau","first-person-indicative-perfect-singular":"emanai","indicative-perfect-second-person-singular":"emanași","indicative-perfect-singular-third-person":"emană","first-person-indicative-perfect-plural":"emanarăm","indicative-perfect-plural-second-person":"emanarăți","indicative-perfect-plural-third-person":"emanară","first-person-indicative-pluperfect-singular":"emanasem","indicative-pluperfect-second-person-singular":"emanaseși","indicative-pluperfect-singular-third-person":"emanase","first-person-indicative-pluperfect-plural":"emanaserăm","indicative-pluperfect-plural-second-person":"emanaserăți","indicative-pluperfect-plural-third-person":"emanaseră","first-person-present-singular-subjunctive":"să eman","present-second-person-singular-subjunctive":"să emani","present-singular-subjunctive-third-person":"să emane","first-person-plural-present-subjunctive":"să emanăm","plural-present-second-person-subjunctive":"să emanați","plural-present-subjunctive-third-person":"să emane","imperative-second-person-singular":"emană","imperative-plural-second-person":"emanați","imperative-negative-second-person-singular":"nu emana","imperative-negative-plural-second-person":"nu emanați"}},{"word":"emanare","pos":"noun","definitions":["emanation"],"forms":{"plural":"emanări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emanare","accusative-definite-nominative-singular":"emanarea","accusative-indefinite-nominative-plural":"emanări","accusative-definite-nominative-plural":"emanările","dative-genitive-indefinite-singular":"emanări","dative-definite-genitive-singular":"emanării","dative-genitive-indefinite-plural":"emanări","dative-definite-genitive-plural":"emanărilor","singular-vocative":"emanare","plural-vocative":"emanărilor"}},{"word":"emanație","pos":"noun","definitions":["emanation"],"forms":{"plural":"emanații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emanație","accusative-definite-nominative-singular":"emanația","accusative-indefinite-nominative-plural":"emanații","accusative-definite-nominative-plural":"emanațiile","dative-genitive-indefinite-singular":"emanații","dative-definite-genitive-singular":"emanației","dative-genitive-indefinite-plural":"emanații","dative-definite-genitive-plural":"emanațiilor","singular-vocative":"emanație","plural-vocative":"emanațiilor"}},{"word":"emanaționism","pos":"noun","definitions":["emanationism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emanaționism","accusative-definite-nominative":"emanaționismul","dative-genitive-indefinite":"emanaționism","dative-definite-genitive":"emanaționismului","vocative":"emanaționismule"}},{"word":"emanatism","pos":"noun","definitions":["emanatism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emanatism","accusative-definite-nominative":"emanatismul","dative-genitive-indefinite":"emanatism","dative-definite-genitive":"emanatismului","vocative":"emanatismule"}},{"word":"emanațiune","pos":"noun","definitions":["alternative form of emanație"],"forms":{"plural":"emanațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emanațiune","accusative-definite-nominative-singular":"emanațiunea","accusative-indefinite-nominative-plural":"emanațiuni","accusative-definite-nominative-plural":"emanațiunile","dative-genitive-indefinite-singular":"emanațiuni","dative-definite-genitive-singular":"emanațiunii","dative-genitive-indefinite-plural":"emanațiuni","dative-definite-genitive-plural":"emanațiunilor","singular-vocative":"emanațiune","plural-vocative":"emanațiunilor"}},{"word":"emancipa","pos":"verb","definitions":["to emancipate"],"forms":{"canonical":"a emancipa 1st conjugation","present-singular-third-person":"emancipează","participle-past":"emancipat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emancipa","gerund":"emancipând","first-person-indicative-present-singular":"emancipez","indicative-present-second-person-singular":"emancipezi","indicative-present-singular-third-person":"emancipează","first-person-indicative-plural-present":"emancipăm","indicative-plural-present-second-person":"emancipați","indicative-plural-present-third-person":"emancipează","first-person-imperfect-indicative-singular":"emancipam","imperfect-indicative-second-person-singular":"emancipai","imperfect-indicative-singular-third-person":"emancipa","first-person-imperfect-indicative-plural":"emancipam","imperfect-indicative-plural-second-person":"emancipați","imperfect-indicative-plural-third-person":"emancipau","first-person-indicative-perfect-singular":"emancipai","indicative-perfect-second-person-singular":"emancipași","indicative-perfect-singular-third-person":"emancipă","first-person-indicative-perfect-plural":"emanciparăm","indicative-perfect-plural-second-person":"emanciparăți","indicative-perfect-plural-third-person":"emancipară","first-person-indicative-pluperfect-singular":"emancipasem","indicative-pluperfect-second-person-singular":"emancipaseși","indicative-pluperfect-singular-third-person":"emancipase","first-person-indicative-pluperfect-plural":"emancipaserăm","indicative-pluperfect-plural-second-person":"emancipaserăți","indicative-pluperfect-plural-third-person":"emancipaseră","first-person-present-singular-subjunctive":"să emancipez","present-second-person-singular-subjunctive":"să emancipezi","present-singular-subjunctive-third-person":"să emancipeze","first-person-plural-present-subjunctive":"să emancipăm","plural-present-second-person-subjunctive":"să emancipați","plural-present-subjunctive-third-person":"să emancipeze","imperative-second-person-singular":"emancipează","imperative-plural-second-person":"emancipați","imperative-negative-second-person-singular":"nu emancipa","imperative-negative-plural-second-person":"nu emancipați"}},{"word":"emancipare","pos":"noun","definitions":["emancipation"],"forms":{"plural":"emancipări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emancipare","accusative-definite-nominative-singular":"emanciparea","accusative-indefinite-nominative-plural":"emancipări","accusative-definite-nominative-plural":"emancipările","dative-genitive-indefinite-singular":"emancipări","dative-definite-genitive-singular":"emancipării","dative-genitive-indefinite-plural":"emancipări","dative-definite-genitive-plural":"emancipărilor","singular-vocative":"emancipare","plural-vocative":"emancipărilor"}},{"word":"emancipat","pos":"adj","definitions":["emancipated"],"forms":{"feminine-singular":"emancipată","masculine-plural":"emancipați","feminine-neuter-plural":"emancipate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emancipat","error-unrecognized-form-feminine-indefinite-singular":"emancipată","error-unrecognized-form-indefinite-masculine-plural":"emancipați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emancipate","definite-error-unrecognized-form-masculine-neuter-singular":"emancipatul","definite-error-unrecognized-form-feminine-singular":"emancipata","definite-error-unrecognized-form-masculine-plural":"emancipații","definite-error-unrecognized-form-feminine-neuter-plural":"emancipatele"}},{"word":"emancipat","pos":"verb","definitions":["past participle of emancipa"],"forms":{"participle-past":"of emancipa"}},{"word":"emancipație","pos":"noun","definitions":["emancipation"],"forms":{"plural":"emancipații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emancipație","accusative-definite-nominative-singular":"emancipația","accusative-indefinite-nominative-plural":"emancipații","accusative-definite-nominative-plural":"emancipațiile","dative-genitive-indefinite-singular":"emancipații","dative-definite-genitive-singular":"emancipației","dative-genitive-indefinite-plural":"emancipații","dative-definite-genitive-plural":"emancipațiilor","singular-vocative":"emancipație","plural-vocative":"emancipațiilor"}},{"word":"emancipațiune","pos":"noun","definitions":["obsolete form of emancipație"],"forms":{"plural":"emancipațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emancipațiune","accusative-definite-nominative-singular":"emancipațiunea","accusative-indefinite-nominative-plural":"emancipațiuni","accusative-definite-nominative-plural":"emancipațiunile","dative-genitive-indefinite-singular":"emancipațiuni","dative-definite-genitive-singular":"emancipațiunii","dative-genitive-indefinite-plural":"emancipațiuni","dative-definite-genitive-plural":"emancipațiunilor","singular-vocative":"emancipațiune","plural-vocative":"emancipațiunilor"}},{"word":"emancipățiune","pos":"noun","definitions":["obsolete form of emancipație"],"forms":{"plural":"emancipățiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emancipățiune","accusative-definite-nominative-singular":"emancipățiunea","accusative-indefinite-nominative-plural":"emancipățiuni","accusative-definite-nominative-plural":"emancipățiunile","dative-genitive-indefinite-singular":"emancipățiuni","dative-definite-genitive-singular":"emancipățiunii","dative-genitive-indefinite-plural":"emancipățiuni","dative-definite-genitive-plural":"emancipățiunilor","singular-vocative":"emancipățiune","plural-vocative":"emancipățiunilor"}},{"word":"emancipator","pos":"adj","definitions":["emancipatory"],"forms":{"feminine-singular":"emancipatoare","masculine-plural":"emancipatori","feminine-neuter-plural":"emancipatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emancipator","error-unrecognized-form-feminine-indefinite-singular":"emancipatoare","error-unrecognized-form-indefinite-masculine-plural":"emancipatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"emancipatoare","definite-error-unrecognized-form-masculine-neuter-singular":"emancipatorul","definite-error-unrecognized-form-feminine-singular":"emancipatoarea","definite-error-unrecognized-form-masculine-plural":"emancipatorii","definite-error-unrecognized-form-feminine-neuter-plural":"emancipatoarele"}},{"word":"Emancipatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Emancipatu"}},{"word":"emarginatură","pos":"noun","definitions":["notch"],"forms":{"plural":"emarginaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"emarginatură","accusative-definite-nominative-singular":"emarginatura","accusative-indefinite-nominative-plural":"emarginaturi","accusative-definite-nominative-plural":"emarginaturile","dative-genitive-indefinite-singular":"emarginaturi","dative-definite-genitive-singular":"emarginaturii","dative-genitive-indefinite-plural":"emarginaturi","dative-definite-genitive-plural":"emarginaturilor","singular-vocative":"emarginatură","plural-vocative":"emarginaturilor"}},{"word":"emascula","pos":"verb","definitions":["to emasculate"],"forms":{"canonical":"a emascula 1st conjugation","present-singular-third-person":"emasculează","participle-past":"emasculat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emascula","gerund":"emasculând","first-person-indicative-present-singular":"emasculez","indicative-present-second-person-singular":"emasculezi","indicative-present-singular-third-person":"emasculează","first-person-indicative-plural-present":"emasculăm","indicative-plural-present-second-person":"emasculați","indicative-plural-present-third-person":"emasculează","first-person-imperfect-indicative-singular":"emasculam","imperfect-indicative-second-person-singular":"emasculai","imperfect-indicative-singular-third-person":"emascula","first-person-imperfect-indicative-plural":"emasculam","imperfect-indicative-plural-second-person":"emasculați","imperfect-indicative-plural-third-person":"emasculau","first-person-indicative-perfect-singular":"emasculai","indicative-perfect-second-person-singular":"emasculași","indicative-perfect-singular-third-person":"emasculă","first-person-indicative-perfect-plural":"emascularăm","indicative-perfect-plural-second-person":"emascularăți","indicative-perfect-plural-third-person":"emasculară","first-person-indicative-pluperfect-singular":"emasculasem","indicative-pluperfect-second-person-singular":"emasculaseși","indicative-pluperfect-singular-third-person":"emasculase","first-person-indicative-pluperfect-plural":"emasculaserăm","indicative-pluperfect-plural-second-person":"emasculaserăți","indicative-pluperfect-plural-third-person":"emasculaseră","first-person-present-singular-subjunctive":"să emasculez","present-second-person-singular-subjunctive":"să emasculezi","present-singular-subjunctive-third-person":"să emasculeze","first-person-plural-present-subjunctive":"să emasculăm","plural-present-second-person-subjunctive":"să emasculați","plural-present-subjunctive-third-person":"să emasculeze","imperative-second-person-singular":"emasculează","imperative-plural-second-person":"emasculați","imperative-negative-second-person-singular":"nu emascula","imperative-negative-plural-second-person":"nu emasculați"}},{"word":"emasculare","pos":"noun","definitions":["emasculation"],"forms":{"plural":"emasculări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emasculare","accusative-definite-nominative-singular":"emascularea","accusative-indefinite-nominative-plural":"emasculări","accusative-definite-nominative-plural":"emasculările","dative-genitive-indefinite-singular":"emasculări","dative-definite-genitive-singular":"emasculării","dative-genitive-indefinite-plural":"emasculări","dative-definite-genitive-plural":"emasculărilor","singular-vocative":"emasculare","plural-vocative":"emasculărilor"}},{"word":"emasculat","pos":"noun","definitions":["emasculation"],"forms":{"plural":"emasculaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emasculat","accusative-definite-nominative-singular":"emasculatul","accusative-indefinite-nominative-plural":"emasculaturi","accusative-definite-nominative-plural":"emasculaturile","dative-genitive-indefinite-singular":"emasculat","dative-definite-genitive-singular":"emasculatului","dative-genitive-indefinite-plural":"emasculaturi","dative-definite-genitive-plural":"emasculaturilor","singular-vocative":"emasculatule","plural-vocative":"emasculaturilor"}},{"word":"emasculat","pos":"verb","definitions":["past participle of emascula"],"forms":{"participle-past":"of emascula"}},{"word":"emasculație","pos":"noun","definitions":["emasculation"],"forms":{"plural":"emasculații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emasculație","accusative-definite-nominative-singular":"emasculația","accusative-indefinite-nominative-plural":"emasculații","accusative-definite-nominative-plural":"emasculațiile","dative-genitive-indefinite-singular":"emasculații","dative-definite-genitive-singular":"emasculației","dative-genitive-indefinite-plural":"emasculații","dative-definite-genitive-plural":"emasculațiilor","singular-vocative":"emasculație","plural-vocative":"emasculațiilor"}},{"word":"embargo","pos":"noun","definitions":["embargo"],"forms":{"plural":"embargouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"embargo","accusative-definite-nominative-singular":"embargoul","accusative-indefinite-nominative-plural":"embargouri","accusative-definite-nominative-plural":"embargourile","dative-genitive-indefinite-singular":"embargo","dative-definite-genitive-singular":"embargoului","dative-genitive-indefinite-plural":"embargouri","dative-definite-genitive-plural":"embargourilor","singular-vocative":"embargoule","plural-vocative":"embargourilor"}},{"word":"embaticară","pos":"noun","definitions":["female equivalent of embaticar"],"forms":{"plural":"embaticare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"embaticară","accusative-definite-nominative-singular":"embaticara","accusative-indefinite-nominative-plural":"embaticare","accusative-definite-nominative-plural":"embaticarele","dative-genitive-indefinite-singular":"embaticare","dative-definite-genitive-singular":"embaticarei","dative-genitive-indefinite-plural":"embaticare","dative-definite-genitive-plural":"embaticarelor","singular-vocative":"embaticară","plural-vocative":"embaticarelor"}},{"word":"embereclisi","pos":"verb","definitions":["to annex"],"forms":{"canonical":"a embereclisi 4th conjugation","present-singular-third-person":"embereclisie","participle-past":"embereclisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a embereclisi","gerund":"embereclisind","first-person-indicative-present-singular":"embereclis","indicative-present-second-person-singular":"emberecliși","indicative-present-singular-third-person":"embereclise","first-person-indicative-plural-present":"embereclisim","indicative-plural-present-second-person":"embereclisiți","indicative-plural-present-third-person":"embereclis","first-person-imperfect-indicative-singular":"emberecliseam","imperfect-indicative-second-person-singular":"emberecliseai","imperfect-indicative-singular-third-person":"embereclisea","first-person-imperfect-indicative-plural":"emberecliseam","imperfect-indicative-plural-second-person":"emberecliseați","imperfect-indicative-plural-third-person":"emberecliseau","first-person-indicative-perfect-singular":"embereclisii","indicative-perfect-second-person-singular":"embereclisiși","indicative-perfect-singular-third-person":"embereclisi","first-person-indicative-perfect-plural":"embereclisirăm","indicative-perfect-plural-second-person":"embereclisirăți","indicative-perfect-plural-third-person":"embereclisiră","first-person-indicative-pluperfect-singular":"embereclisisem","indicative-pluperfect-second-person-singular":"embereclisiseși","indicative-pluperfect-singular-third-person":"embereclisise","first-person-indicative-pluperfect-plural":"embereclisiserăm","indicative-pluperfect-plural-second-person":"embereclisiserăți","indicative-pluperfect-plural-third-person":"embereclisiseră","first-person-present-singular-subjunctive":"să embereclis","present-second-person-singular-subjunctive":"să emberecliși","present-singular-subjunctive-third-person":"să embereclisă","first-person-plural-present-subjunctive":"să embereclisim","plural-present-second-person-subjunctive":"să embereclisiți","plural-present-subjunctive-third-person":"să embereclisă","imperative-second-person-singular":"embereclise","imperative-plural-second-person":"embereclisiți","imperative-negative-second-person-singular":"nu embereclisi","imperative-negative-plural-second-person":"nu embereclisiți"}},{"word":"embereclisire","pos":"noun","definitions":["annexation"],"forms":{"plural":"embereclisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"embereclisire","accusative-definite-nominative-singular":"embereclisirea","accusative-indefinite-nominative-plural":"embereclisiri","accusative-definite-nominative-plural":"embereclisirile","dative-genitive-indefinite-singular":"embereclisiri","dative-definite-genitive-singular":"embereclisirii","dative-genitive-indefinite-plural":"embereclisiri","dative-definite-genitive-plural":"embereclisirilor","singular-vocative":"embereclisire","plural-vocative":"embereclisirilor"}},{"word":"embereclisit","pos":"adj","definitions":["annexed"],"forms":{"feminine-singular":"embereclisită","masculine-plural":"embereclisiți","feminine-neuter-plural":"embereclisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embereclisit","error-unrecognized-form-feminine-indefinite-singular":"embereclisită","error-unrecognized-form-indefinite-masculine-plural":"embereclisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"embereclisite","definite-error-unrecognized-form-masculine-neuter-singular":"embereclisitul","definite-error-unrecognized-form-feminine-singular":"embereclisita","definite-error-unrecognized-form-masculine-plural":"embereclisiții","definite-error-unrecognized-form-feminine-neuter-plural":"embereclisitele"}},{"word":"embereclisit","pos":"verb","definitions":["past participle of embereclisi"],"forms":{"participle-past":"of embereclisi"}},{"word":"emblem","pos":"noun","definitions":["obsolete form of emblemă"],"forms":{"plural":"embleme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emblem","accusative-definite-nominative-singular":"emblemul","accusative-indefinite-nominative-plural":"embleme","accusative-definite-nominative-plural":"emblemele","dative-genitive-indefinite-singular":"emblem","dative-definite-genitive-singular":"emblemului","dative-genitive-indefinite-plural":"embleme","dative-definite-genitive-plural":"emblemelor","singular-vocative":"emblemule","plural-vocative":"emblemelor"}},{"word":"emblemă","pos":"noun","definitions":["emblem"],"forms":{"plural":"embleme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emblemă","accusative-definite-nominative-singular":"emblema","accusative-indefinite-nominative-plural":"embleme","accusative-definite-nominative-plural":"emblemele","dative-genitive-indefinite-singular":"embleme","dative-definite-genitive-singular":"emblemei","dative-genitive-indefinite-plural":"embleme","dative-definite-genitive-plural":"emblemelor","singular-vocative":"emblemă","plural-vocative":"emblemelor"}},{"word":"emblematic","pos":"adj","definitions":["emblematic"],"forms":{"feminine-singular":"emblematică","masculine-plural":"emblematici","feminine-neuter-plural":"emblematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emblematic","error-unrecognized-form-feminine-indefinite-singular":"emblematică","error-unrecognized-form-indefinite-masculine-plural":"emblematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emblematice","definite-error-unrecognized-form-masculine-neuter-singular":"emblematicul","definite-error-unrecognized-form-feminine-singular":"emblematica","definite-error-unrecognized-form-masculine-plural":"emblematicii","definite-error-unrecognized-form-feminine-neuter-plural":"emblematicele"}},{"word":"embol","pos":"noun","definitions":["alternative form of embolus"],"forms":{"plural":"emboluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"embol","accusative-definite-nominative-singular":"embolul","accusative-indefinite-nominative-plural":"emboluri","accusative-definite-nominative-plural":"embolurile","dative-genitive-indefinite-singular":"embol","dative-definite-genitive-singular":"embolului","dative-genitive-indefinite-plural":"emboluri","dative-definite-genitive-plural":"embolurilor","singular-vocative":"embolule","plural-vocative":"embolurilor"}},{"word":"embolic","pos":"adj","definitions":["embolic"],"forms":{"feminine-singular":"embolică","masculine-plural":"embolici","feminine-neuter-plural":"embolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embolic","error-unrecognized-form-feminine-indefinite-singular":"embolică","error-unrecognized-form-indefinite-masculine-plural":"embolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"embolice","definite-error-unrecognized-form-masculine-neuter-singular":"embolicul","definite-error-unrecognized-form-feminine-singular":"embolica","definite-error-unrecognized-form-masculine-plural":"embolicii","definite-error-unrecognized-form-feminine-neuter-plural":"embolicele"}},{"word":"embolie","pos":"noun","definitions":["embolism"],"forms":{"plural":"embolii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embolie","accusative-definite-nominative-singular":"embolia","accusative-indefinite-nominative-plural":"embolii","accusative-definite-nominative-plural":"emboliile","dative-genitive-indefinite-singular":"embolii","dative-definite-genitive-singular":"emboliei","dative-genitive-indefinite-plural":"embolii","dative-definite-genitive-plural":"emboliilor","singular-vocative":"embolie","plural-vocative":"emboliilor"}},{"word":"emboligen","pos":"adj","definitions":["emboligenic"],"forms":{"feminine-singular":"emboligenă","masculine-plural":"emboligeni","feminine-neuter-plural":"emboligene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emboligen","error-unrecognized-form-feminine-indefinite-singular":"emboligenă","error-unrecognized-form-indefinite-masculine-plural":"emboligeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"emboligene","definite-error-unrecognized-form-masculine-neuter-singular":"emboligenul","definite-error-unrecognized-form-feminine-singular":"emboligena","definite-error-unrecognized-form-masculine-plural":"emboligenii","definite-error-unrecognized-form-feminine-neuter-plural":"emboligenele"}},{"word":"embolism","pos":"noun","definitions":["embolism"],"forms":{"plural":"embolismuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"embolism","accusative-definite-nominative-singular":"embolismul","accusative-indefinite-nominative-plural":"embolismuri","accusative-definite-nominative-plural":"embolismurile","dative-genitive-indefinite-singular":"embolism","dative-definite-genitive-singular":"embolismului","dative-genitive-indefinite-plural":"embolismuri","dative-definite-genitive-plural":"embolismurilor","singular-vocative":"embolismule","plural-vocative":"embolismurilor"}},{"word":"embolismic","pos":"adj","definitions":["embolismic"],"forms":{"feminine-singular":"embolismică","masculine-plural":"embolismici","feminine-neuter-plural":"embolismice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embolismic","error-unrecognized-form-feminine-indefinite-singular":"embolismică","error-unrecognized-form-indefinite-masculine-plural":"embolismici","error-unrecognized-form-feminine-indefinite-neuter-plural":"embolismice","definite-error-unrecognized-form-masculine-neuter-singular":"embolismicul","definite-error-unrecognized-form-feminine-singular":"embolismica","definite-error-unrecognized-form-masculine-plural":"embolismicii","definite-error-unrecognized-form-feminine-neuter-plural":"embolismicele"}},{"word":"embolit","pos":"noun","definitions":["embolite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"embolit","accusative-definite-nominative":"embolitul","dative-genitive-indefinite":"embolit","dative-definite-genitive":"embolitului","vocative":"embolitule"}},{"word":"embor","pos":"noun","definitions":["wholesaler"],"forms":{"plural":"embori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"embor","accusative-definite-nominative-singular":"emborul","accusative-indefinite-nominative-plural":"embori","accusative-definite-nominative-plural":"emborii","dative-genitive-indefinite-singular":"embor","dative-definite-genitive-singular":"emborului","dative-genitive-indefinite-plural":"embori","dative-definite-genitive-plural":"emborilor","singular-vocative":"emborule","plural-vocative":"emborilor"}},{"word":"emboricesc","pos":"adj","definitions":["commercial"],"forms":{"feminine-singular":"emboricească","plural":"emboricești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emboricesc","error-unrecognized-form-feminine-indefinite-singular":"emboricească","error-unrecognized-form-indefinite-masculine-plural":"emboricești","error-unrecognized-form-feminine-indefinite-neuter-plural":"emboricești","definite-error-unrecognized-form-masculine-neuter-singular":"emboricescul","definite-error-unrecognized-form-feminine-singular":"emboriceasca","definite-error-unrecognized-form-masculine-plural":"emboriceștii","definite-error-unrecognized-form-feminine-neuter-plural":"emboriceștile"}},{"word":"embriocardie","pos":"noun","definitions":["embryocardia"],"forms":{"plural":"embriocardii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embriocardie","accusative-definite-nominative-singular":"embriocardia","accusative-indefinite-nominative-plural":"embriocardii","accusative-definite-nominative-plural":"embriocardiile","dative-genitive-indefinite-singular":"embriocardii","dative-definite-genitive-singular":"embriocardiei","dative-genitive-indefinite-plural":"embriocardii","dative-definite-genitive-plural":"embriocardiilor","singular-vocative":"embriocardie","plural-vocative":"embriocardiilor"}},{"word":"embriogeneză","pos":"noun","definitions":["embryogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"embriogeneză","accusative-definite-nominative-singular":"embriogeneza","accusative-indefinite-nominative-plural":"embriogeneze","accusative-definite-nominative-plural":"embriogenezele","dative-genitive-indefinite-singular":"embriogeneze","dative-definite-genitive-singular":"embriogenezei","dative-genitive-indefinite-plural":"embriogeneze","dative-definite-genitive-plural":"embriogenezelor","singular-vocative":"embriogeneză","plural-vocative":"embriogenezelor"}},{"word":"embriogenie","pos":"noun","definitions":["embryogenesis"],"forms":{"plural":"embriogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embriogenie","accusative-definite-nominative-singular":"embriogenia","accusative-indefinite-nominative-plural":"embriogenii","accusative-definite-nominative-plural":"embriogeniile","dative-genitive-indefinite-singular":"embriogenii","dative-definite-genitive-singular":"embriogeniei","dative-genitive-indefinite-plural":"embriogenii","dative-definite-genitive-plural":"embriogeniilor","singular-vocative":"embriogenie","plural-vocative":"embriogeniilor"}},{"word":"embriografie","pos":"noun","definitions":["embryography"],"forms":{"plural":"embriografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embriografie","accusative-definite-nominative-singular":"embriografia","accusative-indefinite-nominative-plural":"embriografii","accusative-definite-nominative-plural":"embriografiile","dative-genitive-indefinite-singular":"embriografii","dative-definite-genitive-singular":"embriografiei","dative-genitive-indefinite-plural":"embriografii","dative-definite-genitive-plural":"embriografiilor","singular-vocative":"embriografie","plural-vocative":"embriografiilor"}},{"word":"embriolog","pos":"noun","definitions":["embryologist"],"forms":{"plural":"embriologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"embriolog","accusative-definite-nominative-singular":"embriologul","accusative-indefinite-nominative-plural":"embriologi","accusative-definite-nominative-plural":"embriologii","dative-genitive-indefinite-singular":"embriolog","dative-definite-genitive-singular":"embriologului","dative-genitive-indefinite-plural":"embriologi","dative-definite-genitive-plural":"embriologilor","singular-vocative":"embriologule","plural-vocative":"embriologilor"}},{"word":"embriologă","pos":"noun","definitions":["female equivalent of embriolog"],"forms":{"plural":"embriologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"embriologă","accusative-definite-nominative-singular":"embriologa","accusative-indefinite-nominative-plural":"embriologe","accusative-definite-nominative-plural":"embriologele","dative-genitive-indefinite-singular":"embriologe","dative-definite-genitive-singular":"embriologei","dative-genitive-indefinite-plural":"embriologe","dative-definite-genitive-plural":"embriologelor","singular-vocative":"embriologă","plural-vocative":"embriologelor"}},{"word":"embriologic","pos":"adj","definitions":["embryological"],"forms":{"feminine-singular":"embriologică","masculine-plural":"embriologici","feminine-neuter-plural":"embriologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embriologic","error-unrecognized-form-feminine-indefinite-singular":"embriologică","error-unrecognized-form-indefinite-masculine-plural":"embriologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"embriologice","definite-error-unrecognized-form-masculine-neuter-singular":"embriologicul","definite-error-unrecognized-form-feminine-singular":"embriologica","definite-error-unrecognized-form-masculine-plural":"embriologicii","definite-error-unrecognized-form-feminine-neuter-plural":"embriologicele"}},{"word":"embriologie","pos":"noun","definitions":["embryology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"embriologie","accusative-definite-nominative":"embriologia","dative-genitive-indefinite":"embriologii","dative-definite-genitive":"embriologiei","vocative":"embriologie"}},{"word":"embrion","pos":"noun","definitions":["embryo (an unborn baby that is less developed than a fetus)"],"forms":{"plural":"embrioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"embrion","accusative-definite-nominative-singular":"embrionul","accusative-indefinite-nominative-plural":"embrioni","accusative-definite-nominative-plural":"embrionii","dative-genitive-indefinite-singular":"embrion","dative-definite-genitive-singular":"embrionului","dative-genitive-indefinite-plural":"embrioni","dative-definite-genitive-plural":"embrionilor","singular-vocative":"embrionule","plural-vocative":"embrionilor"}},{"word":"embrionar","pos":"adj","definitions":["embryonic"],"forms":{"feminine-singular":"embrionară","masculine-plural":"embrionari","feminine-neuter-plural":"embrionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embrionar","error-unrecognized-form-feminine-indefinite-singular":"embrionară","error-unrecognized-form-indefinite-masculine-plural":"embrionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"embrionare","definite-error-unrecognized-form-masculine-neuter-singular":"embrionarul","definite-error-unrecognized-form-feminine-singular":"embrionara","definite-error-unrecognized-form-masculine-plural":"embrionarii","definite-error-unrecognized-form-feminine-neuter-plural":"embrionarele"}},{"word":"embrionat","pos":"adj","definitions":["embryo"],"forms":{"feminine-singular":"embrionată","masculine-plural":"embrionați","feminine-neuter-plural":"embrionate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embrionat","error-unrecognized-form-feminine-indefinite-singular":"embrionată","error-unrecognized-form-indefinite-masculine-plural":"embrionați","error-unrecognized-form-feminine-indefinite-neuter-plural":"embrionate","definite-error-unrecognized-form-masculine-neuter-singular":"embrionatul","definite-error-unrecognized-form-feminine-singular":"embrionata","definite-error-unrecognized-form-masculine-plural":"embrionații","definite-error-unrecognized-form-feminine-neuter-plural":"embrionatele"}},{"word":"embriopatie","pos":"noun","definitions":["embryopathy"],"forms":{"plural":"embriopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embriopatie","accusative-definite-nominative-singular":"embriopatia","accusative-indefinite-nominative-plural":"embriopatii","accusative-definite-nominative-plural":"embriopatiile","dative-genitive-indefinite-singular":"embriopatii","dative-definite-genitive-singular":"embriopatiei","dative-genitive-indefinite-plural":"embriopatii","dative-definite-genitive-plural":"embriopatiilor","singular-vocative":"embriopatie","plural-vocative":"embriopatiilor"}},{"word":"embriotom","pos":"noun","definitions":["embryotome"],"forms":{"plural":"embriotomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"embriotom","accusative-definite-nominative-singular":"embriotomul","accusative-indefinite-nominative-plural":"embriotomuri","accusative-definite-nominative-plural":"embriotomurile","dative-genitive-indefinite-singular":"embriotom","dative-definite-genitive-singular":"embriotomului","dative-genitive-indefinite-plural":"embriotomuri","dative-definite-genitive-plural":"embriotomurilor","singular-vocative":"embriotomule","plural-vocative":"embriotomurilor"}},{"word":"embriotomic","pos":"adj","definitions":["embryotomic"],"forms":{"feminine-singular":"embriotomică","masculine-plural":"embriotomici","feminine-neuter-plural":"embriotomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"embriotomic","error-unrecognized-form-feminine-indefinite-singular":"embriotomică","error-unrecognized-form-indefinite-masculine-plural":"embriotomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"embriotomice","definite-error-unrecognized-form-masculine-neuter-singular":"embriotomicul","definite-error-unrecognized-form-feminine-singular":"embriotomica","definite-error-unrecognized-form-masculine-plural":"embriotomicii","definite-error-unrecognized-form-feminine-neuter-plural":"embriotomicele"}},{"word":"embriotomie","pos":"noun","definitions":["embryotomy"],"forms":{"plural":"embriotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"embriotomie","accusative-definite-nominative-singular":"embriotomia","accusative-indefinite-nominative-plural":"embriotomii","accusative-definite-nominative-plural":"embriotomiile","dative-genitive-indefinite-singular":"embriotomii","dative-definite-genitive-singular":"embriotomiei","dative-genitive-indefinite-plural":"embriotomii","dative-definite-genitive-plural":"embriotomiilor","singular-vocative":"embriotomie","plural-vocative":"embriotomiilor"}},{"word":"emectar","pos":"noun","definitions":["veteran"],"forms":{"plural":"emectari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emectar","accusative-definite-nominative-singular":"emectarul","accusative-indefinite-nominative-plural":"emectari","accusative-definite-nominative-plural":"emectarii","dative-genitive-indefinite-singular":"emectar","dative-definite-genitive-singular":"emectarului","dative-genitive-indefinite-plural":"emectari","dative-definite-genitive-plural":"emectarilor","singular-vocative":"emectarule","plural-vocative":"emectarilor"}},{"word":"emeletiu","pos":"noun","definitions":["a floor above ground level"],"forms":{"plural":"emeletiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emeletiu","accusative-definite-nominative-singular":"emeletiuul","accusative-indefinite-nominative-plural":"emeletiuuri","accusative-definite-nominative-plural":"emeletiuurile","dative-genitive-indefinite-singular":"emeletiu","dative-definite-genitive-singular":"emeletiuului","dative-genitive-indefinite-plural":"emeletiuuri","dative-definite-genitive-plural":"emeletiuurilor","singular-vocative":"emeletiuule","plural-vocative":"emeletiuurilor"}},{"word":"emenagog","pos":"noun","definitions":["emmenagogue"],"forms":{"plural":"emenagoge","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emenagog","accusative-definite-nominative-singular":"emenagogul","accusative-indefinite-nominative-plural":"emenagoge","accusative-definite-nominative-plural":"emenagogele","dative-genitive-indefinite-singular":"emenagog","dative-definite-genitive-singular":"emenagogului","dative-genitive-indefinite-plural":"emenagoge","dative-definite-genitive-plural":"emenagogelor","singular-vocative":"emenagogule","plural-vocative":"emenagogelor"}},{"word":"emenda","pos":"verb","definitions":["to emend"],"forms":{"canonical":"a emenda 1st conjugation","present-singular-third-person":"emendează","participle-past":"emendat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emenda","gerund":"emendând","first-person-indicative-present-singular":"emendez","indicative-present-second-person-singular":"emendezi","indicative-present-singular-third-person":"emendează","first-person-indicative-plural-present":"emendăm","indicative-plural-present-second-person":"emendați","indicative-plural-present-third-person":"emendează","first-person-imperfect-indicative-singular":"emendam","imperfect-indicative-second-person-singular":"emendai","imperfect-indicative-singular-third-person":"emenda","first-person-imperfect-indicative-plural":"emendam","imperfect-indicative-plural-second-person":"emendați","imperfect-indicative-plural-third-person":"emendau","first-person-indicative-perfect-singular":"emendai","indicative-perfect-second-person-singular":"emendași","indicative-perfect-singular-third-person":"emendă","first-person-indicative-perfect-plural":"emendarăm","indicative-perfect-plural-second-person":"emendarăți","indicative-perfect-plural-third-person":"emendară","first-person-indicative-pluperfect-singular":"emendasem","indicative-pluperfect-second-person-singular":"emendaseși","indicative-pluperfect-singular-third-person":"emendase","first-person-indicative-pluperfect-plural":"emendaserăm","indicative-pluperfect-plural-second-person":"emendaserăți","indicative-pluperfect-plural-third-person":"emendaseră","first-person-present-singular-subjunctive":"să emendez","present-second-person-singular-subjunctive":"să emendezi","present-singular-subjunctive-third-person":"să emendeze","first-person-plural-present-subjunctive":"să emendăm","plural-present-second-person-subjunctive":"să emendați","plural-present-subjunctive-third-person":"să emendeze","imperative-second-person-singular":"emendează","imperative-plural-second-person":"emendați","imperative-negative-second-person-singular":"nu emenda","imperative-negative-plural-second-person":"nu emendați"}},{"word":"emendabil","pos":"adj","definitions":["amendable"],"forms":{"feminine-singular":"emendabilă","masculine-plural":"emendabili","feminine-neuter-plural":"emendabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emendabil","error-unrecognized-form-feminine-indefinite-singular":"emendabilă","error-unrecognized-form-indefinite-masculine-plural":"emendabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"emendabile","definite-error-unrecognized-form-masculine-neuter-singular":"emendabilul","definite-error-unrecognized-form-feminine-singular":"emendabila","definite-error-unrecognized-form-masculine-plural":"emendabilii","definite-error-unrecognized-form-feminine-neuter-plural":"emendabilele"}},{"word":"emendare","pos":"noun","definitions":["correction"],"forms":{"plural":"emendări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emendare","accusative-definite-nominative-singular":"emendarea","accusative-indefinite-nominative-plural":"emendări","accusative-definite-nominative-plural":"emendările","dative-genitive-indefinite-singular":"emendări","dative-definite-genitive-singular":"emendării","dative-genitive-indefinite-plural":"emendări","dative-definite-genitive-plural":"emendărilor","singular-vocative":"emendare","plural-vocative":"emendărilor"}},{"word":"emendație","pos":"noun","definitions":["amendment"],"forms":{"plural":"emendații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emendație","accusative-definite-nominative-singular":"emendația","accusative-indefinite-nominative-plural":"emendații","accusative-definite-nominative-plural":"emendațiile","dative-genitive-indefinite-singular":"emendații","dative-definite-genitive-singular":"emendației","dative-genitive-indefinite-plural":"emendații","dative-definite-genitive-plural":"emendațiilor","singular-vocative":"emendație","plural-vocative":"emendațiilor"}},{"word":"emendațiune","pos":"noun","definitions":["obsolete form of emendație"],"forms":{"plural":"emendațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emendațiune","accusative-definite-nominative-singular":"emendațiunea","accusative-indefinite-nominative-plural":"emendațiuni","accusative-definite-nominative-plural":"emendațiunile","dative-genitive-indefinite-singular":"emendațiuni","dative-definite-genitive-singular":"emendațiunii","dative-genitive-indefinite-plural":"emendațiuni","dative-definite-genitive-plural":"emendațiunilor","singular-vocative":"emendațiune","plural-vocative":"emendațiunilor"}},{"word":"emerge","pos":"verb","definitions":["to emerge"],"forms":{"canonical":"a emerge 3rd conjugation","present-singular-third-person":"emerge","participle-past":"emers","subjunctive-third-person":"emeargă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a emerge","gerund":"emergând","first-person-indicative-present-singular":"emerg","indicative-present-second-person-singular":"emergi","indicative-present-singular-third-person":"emerge","first-person-indicative-plural-present":"emergem","indicative-plural-present-second-person":"emergeți","indicative-plural-present-third-person":"emerg","first-person-imperfect-indicative-singular":"emergeam","imperfect-indicative-second-person-singular":"emergeai","imperfect-indicative-singular-third-person":"emergea","first-person-imperfect-indicative-plural":"emergeam","imperfect-indicative-plural-second-person":"emergeați","imperfect-indicative-plural-third-person":"emergeau","first-person-indicative-perfect-singular":"emersei","indicative-perfect-second-person-singular":"emerseși","indicative-perfect-singular-third-person":"emerse","first-person-indicative-perfect-plural":"emerserăm","indicative-perfect-plural-second-person":"emerserăți","indicative-perfect-plural-third-person":"emerseră","first-person-indicative-pluperfect-singular":"emersesem","indicative-pluperfect-second-person-singular":"emerseseși","indicative-pluperfect-singular-third-person":"emersese","first-person-indicative-pluperfect-plural":"emerseserăm","indicative-pluperfect-plural-second-person":"emerseserăți","indicative-pluperfect-plural-third-person":"emerseseră","first-person-present-singular-subjunctive":"să emerg","present-second-person-singular-subjunctive":"să emergi","present-singular-subjunctive-third-person":"să emergă","first-person-plural-present-subjunctive":"să emergem","plural-present-second-person-subjunctive":"să emergeți","plural-present-subjunctive-third-person":"să emergă","imperative-second-person-singular":"emerge","imperative-plural-second-person":"emergeți","imperative-negative-second-person-singular":"nu emerge","imperative-negative-plural-second-person":"nu emergeți"}},{"word":"emergent","pos":"adj","definitions":["emergent"],"forms":{"feminine-singular":"emergentă","masculine-plural":"emergenți","feminine-neuter-plural":"emergente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emergent","error-unrecognized-form-feminine-indefinite-singular":"emergentă","error-unrecognized-form-indefinite-masculine-plural":"emergenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"emergente","definite-error-unrecognized-form-masculine-neuter-singular":"emergentul","definite-error-unrecognized-form-feminine-singular":"emergenta","definite-error-unrecognized-form-masculine-plural":"emergenții","definite-error-unrecognized-form-feminine-neuter-plural":"emergentele"}},{"word":"emergență","pos":"noun","definitions":["emergence"],"forms":{"plural":"emergențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emergență","accusative-definite-nominative-singular":"emergența","accusative-indefinite-nominative-plural":"emergențe","accusative-definite-nominative-plural":"emergențele","dative-genitive-indefinite-singular":"emergențe","dative-definite-genitive-singular":"emergenței","dative-genitive-indefinite-plural":"emergențe","dative-definite-genitive-plural":"emergențelor","singular-vocative":"emergență","plural-vocative":"emergențelor"}},{"word":"emeri","pos":"noun","definitions":["emery"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emeri","accusative-definite-nominative":"emeriul","dative-genitive-indefinite":"emeri","dative-definite-genitive":"emeriului","vocative":"emeriule"}},{"word":"emerit","pos":"adj","definitions":["emeritus","skilled, experienced"],"pronunciation":"/e.meˈrit/","forms":{"feminine-singular":"emerită","masculine-plural":"emeriți","feminine-neuter-plural":"emerite","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"emerit","error-unrecognized-form-feminine-indefinite-singular":"emerită","error-unrecognized-form-indefinite-masculine-plural":"emeriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"emerite","definite-error-unrecognized-form-masculine-neuter-singular":"emeritul","definite-error-unrecognized-form-feminine-singular":"emerita","definite-error-unrecognized-form-masculine-plural":"emeriții","definite-error-unrecognized-form-feminine-neuter-plural":"emeritele"}},{"word":"emeritat","pos":"adj","definitions":["emeritus"],"forms":{"feminine-singular":"emeritată","masculine-plural":"emeritați","feminine-neuter-plural":"emeritate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emeritat","error-unrecognized-form-feminine-indefinite-singular":"emeritată","error-unrecognized-form-indefinite-masculine-plural":"emeritați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emeritate","definite-error-unrecognized-form-masculine-neuter-singular":"emeritatul","definite-error-unrecognized-form-feminine-singular":"emeritata","definite-error-unrecognized-form-masculine-plural":"emeritații","definite-error-unrecognized-form-feminine-neuter-plural":"emeritatele"}},{"word":"emersiune","pos":"noun","definitions":["emersion"],"forms":{"plural":"emersiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emersiune","accusative-definite-nominative-singular":"emersiunea","accusative-indefinite-nominative-plural":"emersiuni","accusative-definite-nominative-plural":"emersiunile","dative-genitive-indefinite-singular":"emersiuni","dative-definite-genitive-singular":"emersiunii","dative-genitive-indefinite-plural":"emersiuni","dative-definite-genitive-plural":"emersiunilor","singular-vocative":"emersiune","plural-vocative":"emersiunilor"}},{"word":"emetic","pos":"noun","definitions":["emetic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emetic","accusative-definite-nominative":"emeticul","dative-genitive-indefinite":"emetic","dative-definite-genitive":"emeticului","vocative":"emeticule"}},{"word":"emetină","pos":"noun","definitions":["emetine"],"forms":{"plural":"emetine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emetină","accusative-definite-nominative-singular":"emetina","accusative-indefinite-nominative-plural":"emetine","accusative-definite-nominative-plural":"emetinele","dative-genitive-indefinite-singular":"emetine","dative-definite-genitive-singular":"emetinei","dative-genitive-indefinite-plural":"emetine","dative-definite-genitive-plural":"emetinelor","singular-vocative":"emetină","plural-vocative":"emetinelor"}},{"word":"emetiza","pos":"verb","definitions":["to emetize"],"forms":{"canonical":"a emetiza 1st conjugation","present-singular-third-person":"emetizează","participle-past":"emetizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emetiza","gerund":"emetizând","first-person-indicative-present-singular":"emetizez","indicative-present-second-person-singular":"emetizezi","indicative-present-singular-third-person":"emetizează","first-person-indicative-plural-present":"emetizăm","indicative-plural-present-second-person":"emetizați","indicative-plural-present-third-person":"emetizează","first-person-imperfect-indicative-singular":"emetizam","imperfect-indicative-second-person-singular":"emetizai","imperfect-indicative-singular-third-person":"emetiza","first-person-imperfect-indicative-plural":"emetizam","imperfect-indicative-plural-second-person":"emetizați","imperfect-indicative-plural-third-person":"emetizau","first-person-indicative-perfect-singular":"emetizai","indicative-perfect-second-person-singular":"emetizași","indicative-perfect-singular-third-person":"emetiză","first-person-indicative-perfect-plural":"emetizarăm","indicative-perfect-plural-second-person":"emetizarăți","indicative-perfect-plural-third-person":"emetizară","first-person-indicative-pluperfect-singular":"emetizasem","indicative-pluperfect-second-person-singular":"emetizaseși","indicative-pluperfect-singular-third-person":"emetizase","first-person-indicative-pluperfect-plural":"emetizaserăm","indicative-pluperfect-plural-second-person":"emetizaserăți","indicative-pluperfect-plural-third-person":"emetizaseră","first-person-present-singular-subjunctive":"să emetizez","present-second-person-singular-subjunctive":"să emetizezi","present-singular-subjunctive-third-person":"să emetizeze","first-person-plural-present-subjunctive":"să emetizăm","plural-present-second-person-subjunctive":"să emetizați","plural-present-subjunctive-third-person":"să emetizeze","imperative-second-person-singular":"emetizează","imperative-plural-second-person":"emetizați","imperative-negative-second-person-singular":"nu emetiza","imperative-negative-plural-second-person":"nu emetizați"}},{"word":"emetocatarctic","pos":"noun","definitions":["emetocathartic"],"forms":{"plural":"emetocatarctici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emetocatarctic","accusative-definite-nominative-singular":"emetocatarcticul","accusative-indefinite-nominative-plural":"emetocatarctici","accusative-definite-nominative-plural":"emetocatarcticile","dative-genitive-indefinite-singular":"emetocatarctic","dative-definite-genitive-singular":"emetocatarcticului","dative-genitive-indefinite-plural":"emetocatarctici","dative-definite-genitive-plural":"emetocatarcticilor","singular-vocative":"emetocatarcticule","plural-vocative":"emetocatarcticilor"}},{"word":"emetrop","pos":"adj","definitions":["emmetropic"],"forms":{"feminine-singular":"emetropă","masculine-plural":"emetropi","feminine-neuter-plural":"emetrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emetrop","error-unrecognized-form-feminine-indefinite-singular":"emetropă","error-unrecognized-form-indefinite-masculine-plural":"emetropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"emetrope","definite-error-unrecognized-form-masculine-neuter-singular":"emetropul","definite-error-unrecognized-form-feminine-singular":"emetropa","definite-error-unrecognized-form-masculine-plural":"emetropii","definite-error-unrecognized-form-feminine-neuter-plural":"emetropele"}},{"word":"emetropă","pos":"noun","definitions":["female equivalent of emetrop"],"forms":{"plural":"emetrope","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emetropă","accusative-definite-nominative-singular":"emetropa","accusative-indefinite-nominative-plural":"emetrope","accusative-definite-nominative-plural":"emetropele","dative-genitive-indefinite-singular":"emetrope","dative-definite-genitive-singular":"emetropei","dative-genitive-indefinite-plural":"emetrope","dative-definite-genitive-plural":"emetropelor","singular-vocative":"emetropă","plural-vocative":"emetropelor"}},{"word":"emetropie","pos":"noun","definitions":["emmetropia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"emetropie","accusative-definite-nominative":"emetropia","dative-genitive-indefinite":"emetropii","dative-definite-genitive":"emetropiei","vocative":"emetropie"}},{"word":"emfas","pos":"noun","definitions":["obsolete form of emfază"],"forms":{"plural":"emfasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emfas","accusative-definite-nominative-singular":"emfasul","accusative-indefinite-nominative-plural":"emfasuri","accusative-definite-nominative-plural":"emfasurile","dative-genitive-indefinite-singular":"emfas","dative-definite-genitive-singular":"emfasului","dative-genitive-indefinite-plural":"emfasuri","dative-definite-genitive-plural":"emfasurilor","singular-vocative":"emfasule","plural-vocative":"emfasurilor"}},{"word":"emfatic","pos":"adj","definitions":["emphatic"],"forms":{"feminine-singular":"emfatică","masculine-plural":"emfatici","feminine-neuter-plural":"emfatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emfatic","error-unrecognized-form-feminine-indefinite-singular":"emfatică","error-unrecognized-form-indefinite-masculine-plural":"emfatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emfatice","definite-error-unrecognized-form-masculine-neuter-singular":"emfaticul","definite-error-unrecognized-form-feminine-singular":"emfatica","definite-error-unrecognized-form-masculine-plural":"emfaticii","definite-error-unrecognized-form-feminine-neuter-plural":"emfaticele"}},{"word":"emfaticesc","pos":"adj","definitions":["emphatic"],"forms":{"feminine-singular":"emfaticească","plural":"emfaticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emfaticesc","error-unrecognized-form-feminine-indefinite-singular":"emfaticească","error-unrecognized-form-indefinite-masculine-plural":"emfaticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"emfaticești","definite-error-unrecognized-form-masculine-neuter-singular":"emfaticescul","definite-error-unrecognized-form-feminine-singular":"emfaticeasca","definite-error-unrecognized-form-masculine-plural":"emfaticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"emfaticeștile"}},{"word":"emfaticește","pos":"adv","definitions":["emphatically"]},{"word":"emfază","pos":"noun","definitions":["emphasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"emfază","accusative-definite-nominative":"emfaza","dative-genitive-indefinite":"emfaze","dative-definite-genitive":"emfazei","vocative":"emfază"}},{"word":"emfiteotic","pos":"adj","definitions":["emphyteutic"],"forms":{"feminine-singular":"emfiteotică","masculine-plural":"emfiteotici","feminine-neuter-plural":"emfiteotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emfiteotic","error-unrecognized-form-feminine-indefinite-singular":"emfiteotică","error-unrecognized-form-indefinite-masculine-plural":"emfiteotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emfiteotice","definite-error-unrecognized-form-masculine-neuter-singular":"emfiteoticul","definite-error-unrecognized-form-feminine-singular":"emfiteotica","definite-error-unrecognized-form-masculine-plural":"emfiteoticii","definite-error-unrecognized-form-feminine-neuter-plural":"emfiteoticele"}},{"word":"emfiteoză","pos":"noun","definitions":["emphyteusis"],"forms":{"plural":"emfiteoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emfiteoză","accusative-definite-nominative-singular":"emfiteoza","accusative-indefinite-nominative-plural":"emfiteoze","accusative-definite-nominative-plural":"emfiteozele","dative-genitive-indefinite-singular":"emfiteoze","dative-definite-genitive-singular":"emfiteozei","dative-genitive-indefinite-plural":"emfiteoze","dative-definite-genitive-plural":"emfiteozelor","singular-vocative":"emfiteoză","plural-vocative":"emfiteozelor"}},{"word":"emfizem","pos":"noun","definitions":["emphysema"],"forms":{"plural":"emfizeme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emfizem","accusative-definite-nominative-singular":"emfizemul","accusative-indefinite-nominative-plural":"emfizeme","accusative-definite-nominative-plural":"emfizemele","dative-genitive-indefinite-singular":"emfizem","dative-definite-genitive-singular":"emfizemului","dative-genitive-indefinite-plural":"emfizeme","dative-definite-genitive-plural":"emfizemelor","singular-vocative":"emfizemule","plural-vocative":"emfizemelor"}},{"word":"emfizem pulmonar","pos":"noun","definitions":["pulmonary emphysema"],"forms":{"plural":"emfizemuri pulmonare"}},{"word":"emfizematos","pos":"adj","definitions":["emphysematic"],"forms":{"feminine-singular":"emfizematoasă","masculine-plural":"emfizematoși","feminine-neuter-plural":"emfizematoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emfizematos","error-unrecognized-form-feminine-indefinite-singular":"emfizematoasă","error-unrecognized-form-indefinite-masculine-plural":"emfizematoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"emfizematoase","definite-error-unrecognized-form-masculine-neuter-singular":"emfizematosul","definite-error-unrecognized-form-feminine-singular":"emfizematoasa","definite-error-unrecognized-form-masculine-plural":"emfizematoșii","definite-error-unrecognized-form-feminine-neuter-plural":"emfizematoasele"}},{"word":"emfractic","pos":"adj","definitions":["emphractic"],"forms":{"feminine-singular":"emfractică","masculine-plural":"emfractici","feminine-neuter-plural":"emfractice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emfractic","error-unrecognized-form-feminine-indefinite-singular":"emfractică","error-unrecognized-form-indefinite-masculine-plural":"emfractici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emfractice","definite-error-unrecognized-form-masculine-neuter-singular":"emfracticul","definite-error-unrecognized-form-feminine-singular":"emfractica","definite-error-unrecognized-form-masculine-plural":"emfracticii","definite-error-unrecognized-form-feminine-neuter-plural":"emfracticele"}},{"word":"emfraxie","pos":"noun","definitions":["emphraxis"],"forms":{"plural":"emfraxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emfraxie","accusative-definite-nominative-singular":"emfraxia","accusative-indefinite-nominative-plural":"emfraxii","accusative-definite-nominative-plural":"emfraxiile","dative-genitive-indefinite-singular":"emfraxii","dative-definite-genitive-singular":"emfraxiei","dative-genitive-indefinite-plural":"emfraxii","dative-definite-genitive-plural":"emfraxiilor","singular-vocative":"emfraxie","plural-vocative":"emfraxiilor"}},{"word":"emiciclu","pos":"noun","definitions":["alternative form of hemiciclu"],"forms":{"plural":"emicicluri"}},{"word":"emiclic","pos":"noun","definitions":["ration"],"forms":{"plural":"emiclicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emiclic","accusative-definite-nominative-singular":"emiclicul","accusative-indefinite-nominative-plural":"emiclicuri","accusative-definite-nominative-plural":"emiclicurile","dative-genitive-indefinite-singular":"emiclic","dative-definite-genitive-singular":"emiclicului","dative-genitive-indefinite-plural":"emiclicuri","dative-definite-genitive-plural":"emiclicurilor","singular-vocative":"emiclicule","plural-vocative":"emiclicurilor"}},{"word":"emigra","pos":"verb","definitions":["to emigrate"],"pronunciation":"/e.miˈɡra/","forms":{"canonical":"a emigra 1st conjugation","present-singular-third-person":"emigrează","participle-past":"emigrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emigra","gerund":"emigrând","first-person-indicative-present-singular":"emigrez","indicative-present-second-person-singular":"emigrezi","indicative-present-singular-third-person":"emigrează","first-person-indicative-plural-present":"emigrăm","indicative-plural-present-second-person":"emigrați","indicative-plural-present-third-person":"emigrează","first-person-imperfect-indicative-singular":"emigram","imperfect-indicative-second-person-singular":"emigrai","imperfect-indicative-singular-third-person":"emigra","first-person-imperfect-indicative-plural":"emigram","imperfect-indicative-plural-second-person":"emigrați","imperfect-indicative-plural-third-person":"emigrau","first-person-indicative-perfect-singular":"emigrai","indicative-perfect-second-person-singular":"emigrași","indicative-perfect-singular-third-person":"emigră","first-person-indicative-perfect-plural":"emigrarăm","indicative-perfect-plural-second-person":"emigrarăți","indicative-perfect-plural-third-person":"emigrară","first-person-indicative-pluperfect-singular":"emigrasem","indicative-pluperfect-second-person-singular":"emigraseși","indicative-pluperfect-singular-third-person":"emigrase","first-person-indicative-pluperfect-plural":"emigraserăm","indicative-pluperfect-plural-second-person":"emigraserăți","indicative-pluperfect-plural-third-person":"emigraseră","first-person-present-singular-subjunctive":"să emigrez","present-second-person-singular-subjunctive":"să emigrezi","present-singular-subjunctive-third-person":"să emigreze","first-person-plural-present-subjunctive":"să emigrăm","plural-present-second-person-subjunctive":"să emigrați","plural-present-subjunctive-third-person":"să emigreze","imperative-second-person-singular":"emigrează","imperative-plural-second-person":"emigrați","imperative-negative-second-person-singular":"nu emigra","imperative-negative-plural-second-person":"nu emigrați"}},{"word":"emigrant","pos":"noun","definitions":["emigrant"],"forms":{"plural":"emigranți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emigrant","accusative-definite-nominative-singular":"emigrantul","accusative-indefinite-nominative-plural":"emigranți","accusative-definite-nominative-plural":"emigranții","dative-genitive-indefinite-singular":"emigrant","dative-definite-genitive-singular":"emigrantului","dative-genitive-indefinite-plural":"emigranți","dative-definite-genitive-plural":"emigranților","singular-vocative":"emigrantule","plural-vocative":"emigranților"}},{"word":"emigrantă","pos":"noun","definitions":["female equivalent of emigrant"],"forms":{"plural":"emigrante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emigrantă","accusative-definite-nominative-singular":"emigranta","accusative-indefinite-nominative-plural":"emigrante","accusative-definite-nominative-plural":"emigrantele","dative-genitive-indefinite-singular":"emigrante","dative-definite-genitive-singular":"emigrantei","dative-genitive-indefinite-plural":"emigrante","dative-definite-genitive-plural":"emigrantelor","singular-vocative":"emigrantă","plural-vocative":"emigrantelor"}},{"word":"emigrare","pos":"noun","definitions":["emigration"],"forms":{"plural":"emigrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emigrare","accusative-definite-nominative-singular":"emigrarea","accusative-indefinite-nominative-plural":"emigrări","accusative-definite-nominative-plural":"emigrările","dative-genitive-indefinite-singular":"emigrări","dative-definite-genitive-singular":"emigrării","dative-genitive-indefinite-plural":"emigrări","dative-definite-genitive-plural":"emigrărilor","singular-vocative":"emigrare","plural-vocative":"emigrărilor"}},{"word":"emigrat","pos":"adj","definitions":["emigrant"],"forms":{"feminine-singular":"emigrată","masculine-plural":"emigrați","feminine-neuter-plural":"emigrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emigrat","error-unrecognized-form-feminine-indefinite-singular":"emigrată","error-unrecognized-form-indefinite-masculine-plural":"emigrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emigrate","definite-error-unrecognized-form-masculine-neuter-singular":"emigratul","definite-error-unrecognized-form-feminine-singular":"emigrata","definite-error-unrecognized-form-masculine-plural":"emigrații","definite-error-unrecognized-form-feminine-neuter-plural":"emigratele"}},{"word":"emigrată","pos":"noun","definitions":["female equivalent of emigrat"],"forms":{"plural":"emigrate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emigrată","accusative-definite-nominative-singular":"emigrata","accusative-indefinite-nominative-plural":"emigrate","accusative-definite-nominative-plural":"emigratele","dative-genitive-indefinite-singular":"emigrate","dative-definite-genitive-singular":"emigratei","dative-genitive-indefinite-plural":"emigrate","dative-definite-genitive-plural":"emigratelor","singular-vocative":"emigrată","plural-vocative":"emigratelor"}},{"word":"emigrație","pos":"noun","definitions":["emigration"],"forms":{"plural":"emigrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emigrație","accusative-definite-nominative-singular":"emigrația","accusative-indefinite-nominative-plural":"emigrații","accusative-definite-nominative-plural":"emigrațiile","dative-genitive-indefinite-singular":"emigrații","dative-definite-genitive-singular":"emigrației","dative-genitive-indefinite-plural":"emigrații","dative-definite-genitive-plural":"emigrațiilor","singular-vocative":"emigrație","plural-vocative":"emigrațiilor"}},{"word":"emigrațiune","pos":"noun","definitions":["alternative form of emigrație"],"forms":{"plural":"emigrațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emigrațiune","accusative-definite-nominative-singular":"emigrațiunea","accusative-indefinite-nominative-plural":"emigrațiuni","accusative-definite-nominative-plural":"emigrațiunile","dative-genitive-indefinite-singular":"emigrațiuni","dative-definite-genitive-singular":"emigrațiunii","dative-genitive-indefinite-plural":"emigrațiuni","dative-definite-genitive-plural":"emigrațiunilor","singular-vocative":"emigrațiune","plural-vocative":"emigrațiunilor"}},{"word":"Emil","pos":"name","definitions":["a male given name from Latin, equivalent to English Emil — famously held by","a male given name from Latin, equivalent to English Emil — famously held by:","Emil Racoviță (1868–1947), the Romanian biologist, zoologist, speleologist, and explorer of Antarctica who gave his name to the village of Emil Racoviță"],"pronunciation":"[eˈmil]","gender":"m","forms":{"dative-genitive":"lui Emil","feminine":"Emilia"}},{"word":"Emil Racoviță","pos":"name","definitions":["a village in the commune of Dănești, in the county of Vaslui County, Romania"],"pronunciation":"[eˈmil ˈrakovit͡sə]"},{"word":"Emilia","pos":"name","definitions":["a female given name"],"gender":"f","forms":{"dative-genitive":"Emiliei","masculine":"Emil"}},{"word":"eminamente","pos":"adv","definitions":["eminently"]},{"word":"eminent","pos":"adj","definitions":["notable"],"forms":{"feminine-singular":"eminentă","masculine-plural":"eminenți","feminine-neuter-plural":"eminente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eminent","error-unrecognized-form-feminine-indefinite-singular":"eminentă","error-unrecognized-form-indefinite-masculine-plural":"eminenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eminente","definite-error-unrecognized-form-masculine-neuter-singular":"eminentul","definite-error-unrecognized-form-feminine-singular":"eminenta","definite-error-unrecognized-form-masculine-plural":"eminenții","definite-error-unrecognized-form-feminine-neuter-plural":"eminentele"}},{"word":"eminență","pos":"noun","definitions":["eminence"],"forms":{"plural":"eminențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eminență","accusative-definite-nominative-singular":"eminența","accusative-indefinite-nominative-plural":"eminențe","accusative-definite-nominative-plural":"eminențele","dative-genitive-indefinite-singular":"eminențe","dative-definite-genitive-singular":"eminenței","dative-genitive-indefinite-plural":"eminențe","dative-definite-genitive-plural":"eminențelor","singular-vocative":"eminență","plural-vocative":"eminențelor"}},{"word":"eminență cenușie","pos":"noun","definitions":["gray eminence"],"forms":{"plural":"eminențe cenușii"}},{"word":"eminentisim","pos":"adj","definitions":["most eminent"],"forms":{"feminine-singular":"eminentisimă","masculine-plural":"eminentisimi","feminine-neuter-plural":"eminentisime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eminentisim","error-unrecognized-form-feminine-indefinite-singular":"eminentisimă","error-unrecognized-form-indefinite-masculine-plural":"eminentisimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eminentisime","definite-error-unrecognized-form-masculine-neuter-singular":"eminentisimul","definite-error-unrecognized-form-feminine-singular":"eminentisima","definite-error-unrecognized-form-masculine-plural":"eminentisimii","definite-error-unrecognized-form-feminine-neuter-plural":"eminentisimele"}},{"word":"eminentisim","pos":"noun","definitions":["most eminent"],"forms":{"plural":"eminentisimi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eminentisim","accusative-definite-nominative-singular":"eminentisimul","accusative-indefinite-nominative-plural":"eminentisimi","accusative-definite-nominative-plural":"eminentisimii","dative-genitive-indefinite-singular":"eminentisim","dative-definite-genitive-singular":"eminentisimului","dative-genitive-indefinite-plural":"eminentisimi","dative-definite-genitive-plural":"eminentisimilor","singular-vocative":"eminentisimule","plural-vocative":"eminentisimilor"}},{"word":"eminescian","pos":"adj","definitions":["Of or pertaining to the Romanian poet Mihai Eminescu or in the style of Eminescu"],"forms":{"feminine-singular":"eminesciană","masculine-plural":"eminescieni","feminine-neuter-plural":"eminesciene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eminescian","error-unrecognized-form-feminine-indefinite-singular":"eminesciană","error-unrecognized-form-indefinite-masculine-plural":"eminescieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eminesciene","definite-error-unrecognized-form-masculine-neuter-singular":"eminescianul","definite-error-unrecognized-form-feminine-singular":"eminesciana","definite-error-unrecognized-form-masculine-plural":"eminescienii","definite-error-unrecognized-form-feminine-neuter-plural":"eminescienele"}},{"word":"eminescianism","pos":"noun","definitions":["the ideology and thought of Eminescu"],"forms":{"plural":"eminescianisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eminescianism","accusative-definite-nominative-singular":"eminescianismul","accusative-indefinite-nominative-plural":"eminescianisme","accusative-definite-nominative-plural":"eminescianismele","dative-genitive-indefinite-singular":"eminescianism","dative-definite-genitive-singular":"eminescianismului","dative-genitive-indefinite-plural":"eminescianisme","dative-definite-genitive-plural":"eminescianismelor","singular-vocative":"eminescianismule","plural-vocative":"eminescianismelor"}},{"word":"eminescianiza","pos":"verb","definitions":["to turn into the style of Mihai Eminescu"],"forms":{"canonical":"a eminescianiza 1st conjugation","present-singular-third-person":"eminescianizează","participle-past":"eminescianizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eminescianiza","gerund":"eminescianizând","first-person-indicative-present-singular":"eminescianizez","indicative-present-second-person-singular":"eminescianizezi","indicative-present-singular-third-person":"eminescianizează","first-person-indicative-plural-present":"eminescianizăm","indicative-plural-present-second-person":"eminescianizați","indicative-plural-present-third-person":"eminescianizează","first-person-imperfect-indicative-singular":"eminescianizam","imperfect-indicative-second-person-singular":"eminescianizai","imperfect-indicative-singular-third-person":"eminescianiza","first-person-imperfect-indicative-plural":"eminescianizam","imperfect-indicative-plural-second-person":"eminescianizați","imperfect-indicative-plural-third-person":"eminescianizau","first-person-indicative-perfect-singular":"eminescianizai","indicative-perfect-second-person-singular":"eminescianizași","indicative-perfect-singular-third-person":"eminescianiză","first-person-indicative-perfect-plural":"eminescianizarăm","indicative-perfect-plural-second-person":"eminescianizarăți","indicative-perfect-plural-third-person":"eminescianizară","first-person-indicative-pluperfect-singular":"eminescianizasem","indicative-pluperfect-second-person-singular":"eminescianizaseși","indicative-pluperfect-singular-third-person":"eminescianizase","first-person-indicative-pluperfect-plural":"eminescianizaserăm","indicative-pluperfect-plural-second-person":"eminescianizaserăți","indicative-pluperfect-plural-third-person":"eminescianizaseră","first-person-present-singular-subjunctive":"să eminescianizez","present-second-person-singular-subjunctive":"să eminescianizezi","present-singular-subjunctive-third-person":"să eminescianizeze","first-person-plural-present-subjunctive":"să eminescianizăm","plural-present-second-person-subjunctive":"să eminescianizați","plural-present-subjunctive-third-person":"să eminescianizeze","imperative-second-person-singular":"eminescianizează","imperative-plural-second-person":"eminescianizați","imperative-negative-second-person-singular":"nu eminescianiza","imperative-negative-plural-second-person":"nu eminescianizați"}},{"word":"eminescologă","pos":"noun","definitions":["female equivalent of eminescolog"],"forms":{"plural":"eminescologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eminescologă","accusative-definite-nominative-singular":"eminescologa","accusative-indefinite-nominative-plural":"eminescologe","accusative-definite-nominative-plural":"eminescologele","dative-genitive-indefinite-singular":"eminescologe","dative-definite-genitive-singular":"eminescologei","dative-genitive-indefinite-plural":"eminescologe","dative-definite-genitive-plural":"eminescologelor","singular-vocative":"eminescologă","plural-vocative":"eminescologelor"}},{"word":"Eminescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Eminescu"}},{"word":"emir","pos":"noun","definitions":["emir"],"pronunciation":"/eˈmir/","forms":{"plural":"emiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emir","accusative-definite-nominative-singular":"emirul","accusative-indefinite-nominative-plural":"emiri","accusative-definite-nominative-plural":"emirii","dative-genitive-indefinite-singular":"emir","dative-definite-genitive-singular":"emirului","dative-genitive-indefinite-plural":"emiri","dative-definite-genitive-plural":"emirilor","singular-vocative":"emirule","plural-vocative":"emirilor","alternative":"емир"}},{"word":"emirat","pos":"noun","definitions":["emirate"],"forms":{"plural":"emirate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emirat","accusative-definite-nominative-singular":"emiratul","accusative-indefinite-nominative-plural":"emirate","accusative-definite-nominative-plural":"emiratele","dative-genitive-indefinite-singular":"emirat","dative-definite-genitive-singular":"emiratului","dative-genitive-indefinite-plural":"emirate","dative-definite-genitive-plural":"emiratelor","singular-vocative":"emiratule","plural-vocative":"emiratelor"}},{"word":"Emiratele Arabe Unite","pos":"name","definitions":["the United Arab Emirates (a country in West Asia in the Middle East)"],"gender":"n-p"},{"word":"emirian","pos":"adj","definitions":["Emirian"],"forms":{"feminine-singular":"emiriană","masculine-plural":"emirieni","feminine-neuter-plural":"emiriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emirian","error-unrecognized-form-feminine-indefinite-singular":"emiriană","error-unrecognized-form-indefinite-masculine-plural":"emirieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"emiriene","definite-error-unrecognized-form-masculine-neuter-singular":"emirianul","definite-error-unrecognized-form-feminine-singular":"emiriana","definite-error-unrecognized-form-masculine-plural":"emirienii","definite-error-unrecognized-form-feminine-neuter-plural":"emirienele"}},{"word":"emirian","pos":"noun","definitions":["Emirian"],"forms":{"plural":"emirieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emirian","accusative-definite-nominative-singular":"emirianul","accusative-indefinite-nominative-plural":"emirieni","accusative-definite-nominative-plural":"emirienii","dative-genitive-indefinite-singular":"emirian","dative-definite-genitive-singular":"emirianului","dative-genitive-indefinite-plural":"emirieni","dative-definite-genitive-plural":"emirienilor","singular-vocative":"emirianule","plural-vocative":"emirienilor"}},{"word":"emiriană","pos":"noun","definitions":["female equivalent of emirian"],"forms":{"plural":"emiriene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emiriană","accusative-definite-nominative-singular":"emiriana","accusative-indefinite-nominative-plural":"emiriene","accusative-definite-nominative-plural":"emirienele","dative-genitive-indefinite-singular":"emiriene","dative-definite-genitive-singular":"emirienei","dative-genitive-indefinite-plural":"emiriene","dative-definite-genitive-plural":"emirienelor","singular-vocative":"emiriană","plural-vocative":"emirienelor"}},{"word":"emis","pos":"adj","definitions":["emitted"],"forms":{"feminine-singular":"emisă","masculine-plural":"emiși","feminine-neuter-plural":"emise","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emis","error-unrecognized-form-feminine-indefinite-singular":"emisă","error-unrecognized-form-indefinite-masculine-plural":"emiși","error-unrecognized-form-feminine-indefinite-neuter-plural":"emise","definite-error-unrecognized-form-masculine-neuter-singular":"emisul","definite-error-unrecognized-form-feminine-singular":"emisa","definite-error-unrecognized-form-masculine-plural":"emișii","definite-error-unrecognized-form-feminine-neuter-plural":"emisele"}},{"word":"emis","pos":"noun","definitions":["emission"],"forms":{"plural":"emiși","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emis","accusative-definite-nominative-singular":"emisul","accusative-indefinite-nominative-plural":"emiși","accusative-definite-nominative-plural":"emișile","dative-genitive-indefinite-singular":"emis","dative-definite-genitive-singular":"emisului","dative-genitive-indefinite-plural":"emiși","dative-definite-genitive-plural":"emișilor","singular-vocative":"emisule","plural-vocative":"emișilor"}},{"word":"emisar","pos":"noun","definitions":["emissary"],"forms":{"plural":"emisari","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emisar","accusative-definite-nominative-singular":"emisarul","accusative-indefinite-nominative-plural":"emisari","accusative-definite-nominative-plural":"emisarile","dative-genitive-indefinite-singular":"emisar","dative-definite-genitive-singular":"emisarului","dative-genitive-indefinite-plural":"emisari","dative-definite-genitive-plural":"emisarilor","singular-vocative":"emisarule","plural-vocative":"emisarilor"}},{"word":"emisfer","pos":"noun","definitions":["obsolete form of emisferă"],"forms":{"plural":"emisfere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emisfer","accusative-definite-nominative-singular":"emisferul","accusative-indefinite-nominative-plural":"emisfere","accusative-definite-nominative-plural":"emisferele","dative-genitive-indefinite-singular":"emisfer","dative-definite-genitive-singular":"emisferului","dative-genitive-indefinite-plural":"emisfere","dative-definite-genitive-plural":"emisferelor","singular-vocative":"emisferule","plural-vocative":"emisferelor"}},{"word":"emisferă","pos":"noun","definitions":["hemisphere"],"forms":{"plural":"emisfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emisferă","accusative-definite-nominative-singular":"emisfera","accusative-indefinite-nominative-plural":"emisfere","accusative-definite-nominative-plural":"emisferele","dative-genitive-indefinite-singular":"emisfere","dative-definite-genitive-singular":"emisferei","dative-genitive-indefinite-plural":"emisfere","dative-definite-genitive-plural":"emisferelor","singular-vocative":"emisferă","plural-vocative":"emisferelor"}},{"word":"emisferic","pos":"adj","definitions":["hemispherical"],"forms":{"feminine-singular":"emisferică","masculine-plural":"emisferici","feminine-neuter-plural":"emisferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emisferic","error-unrecognized-form-feminine-indefinite-singular":"emisferică","error-unrecognized-form-indefinite-masculine-plural":"emisferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emisferice","definite-error-unrecognized-form-masculine-neuter-singular":"emisfericul","definite-error-unrecognized-form-feminine-singular":"emisferica","definite-error-unrecognized-form-masculine-plural":"emisfericii","definite-error-unrecognized-form-feminine-neuter-plural":"emisfericele"}},{"word":"emisferiu","pos":"noun","definitions":["obsolete form of emisferă"],"forms":{"plural":"emisferii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emisferiu","accusative-definite-nominative-singular":"emisferiuul","accusative-indefinite-nominative-plural":"emisferii","accusative-definite-nominative-plural":"emisferiile","dative-genitive-indefinite-singular":"emisferiu","dative-definite-genitive-singular":"emisferiuului","dative-genitive-indefinite-plural":"emisferii","dative-definite-genitive-plural":"emisferiilor","singular-vocative":"emisferiuule","plural-vocative":"emisferiilor"}},{"word":"emisie","pos":"noun","definitions":["alternative form of emisiune"],"forms":{"plural":"emisii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emisie","accusative-definite-nominative-singular":"emisia","accusative-indefinite-nominative-plural":"emisii","accusative-definite-nominative-plural":"emisiile","dative-genitive-indefinite-singular":"emisii","dative-definite-genitive-singular":"emisiei","dative-genitive-indefinite-plural":"emisii","dative-definite-genitive-plural":"emisiilor","singular-vocative":"emisie","plural-vocative":"emisiilor"}},{"word":"emisiune","pos":"noun","definitions":["broadcast, show","issue","emission"],"forms":{"plural":"emisiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emisiune","accusative-definite-nominative-singular":"emisiunea","accusative-indefinite-nominative-plural":"emisiuni","accusative-definite-nominative-plural":"emisiunile","dative-genitive-indefinite-singular":"emisiuni","dative-definite-genitive-singular":"emisiunii","dative-genitive-indefinite-plural":"emisiuni","dative-definite-genitive-plural":"emisiunilor","singular-vocative":"emisiune","plural-vocative":"emisiunilor"}},{"word":"emisiv","pos":"adj","definitions":["emissive"],"forms":{"feminine-singular":"emisivă","masculine-plural":"emisivi","feminine-neuter-plural":"emisive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emisiv","error-unrecognized-form-feminine-indefinite-singular":"emisivă","error-unrecognized-form-indefinite-masculine-plural":"emisivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"emisive","definite-error-unrecognized-form-masculine-neuter-singular":"emisivul","definite-error-unrecognized-form-feminine-singular":"emisiva","definite-error-unrecognized-form-masculine-plural":"emisivii","definite-error-unrecognized-form-feminine-neuter-plural":"emisivele"}},{"word":"emistih","pos":"noun","definitions":["hemistich"],"forms":{"plural":"emistihuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emistih","accusative-definite-nominative-singular":"emistihul","accusative-indefinite-nominative-plural":"emistihuri","accusative-definite-nominative-plural":"emistihurile","dative-genitive-indefinite-singular":"emistih","dative-definite-genitive-singular":"emistihului","dative-genitive-indefinite-plural":"emistihuri","dative-definite-genitive-plural":"emistihurilor","singular-vocative":"emistihule","plural-vocative":"emistihurilor"}},{"word":"emitanță","pos":"noun","definitions":["emittance"],"forms":{"plural":"emitanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emitanță","accusative-definite-nominative-singular":"emitanța","accusative-indefinite-nominative-plural":"emitanțe","accusative-definite-nominative-plural":"emitanțele","dative-genitive-indefinite-singular":"emitanțe","dative-definite-genitive-singular":"emitanței","dative-genitive-indefinite-plural":"emitanțe","dative-definite-genitive-plural":"emitanțelor","singular-vocative":"emitanță","plural-vocative":"emitanțelor"}},{"word":"emițător","pos":"noun","definitions":["emitter"],"forms":{"plural":"emițători","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emițător","accusative-definite-nominative-singular":"emițătorul","accusative-indefinite-nominative-plural":"emițători","accusative-definite-nominative-plural":"emițătorile","dative-genitive-indefinite-singular":"emițător","dative-definite-genitive-singular":"emițătorului","dative-genitive-indefinite-plural":"emițători","dative-definite-genitive-plural":"emițătorilor","singular-vocative":"emițătorule","plural-vocative":"emițătorilor"}},{"word":"emițător de radio","pos":"noun","definitions":["radio station"],"forms":{"plural":"emițătoare de radio"}},{"word":"emite","pos":"verb","definitions":["to emit (gasses, radiation)","to release (a law, money)","to express (an opinion, a theory)","to announce"],"forms":{"canonical":"a emite 3rd conjugation","present-singular-third-person":"emite","participle-past":"emis","subjunctive-third-person":"emită","obsolete-subjunctive-third-person":"emiță","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a emite","gerund":"emițând","first-person-indicative-present-singular":"emit","indicative-present-second-person-singular":"emiți","indicative-present-singular-third-person":"emite","first-person-indicative-plural-present":"emitem","indicative-plural-present-second-person":"emiteți","indicative-plural-present-third-person":"emit","first-person-imperfect-indicative-singular":"emiteam","imperfect-indicative-second-person-singular":"emiteai","imperfect-indicative-singular-third-person":"emitea","first-person-imperfect-indicative-plural":"emiteam","imperfect-indicative-plural-second-person":"emiteați","imperfect-indicative-plural-third-person":"emiteau","first-person-indicative-perfect-singular":"emisei","indicative-perfect-second-person-singular":"emiseși","indicative-perfect-singular-third-person":"emise","first-person-indicative-perfect-plural":"emiserăm","indicative-perfect-plural-second-person":"emiserăți","indicative-perfect-plural-third-person":"emiseră","first-person-indicative-pluperfect-singular":"emisesem","indicative-pluperfect-second-person-singular":"emiseseși","indicative-pluperfect-singular-third-person":"emisese","first-person-indicative-pluperfect-plural":"emiseserăm","indicative-pluperfect-plural-second-person":"emiseserăți","indicative-pluperfect-plural-third-person":"emiseseră","first-person-present-singular-subjunctive":"să emit","present-second-person-singular-subjunctive":"să emiți","present-singular-subjunctive-third-person":"să emită","first-person-plural-present-subjunctive":"să emitem","plural-present-second-person-subjunctive":"să emiteți","plural-present-subjunctive-third-person":"să emită","imperative-second-person-singular":"emite","imperative-plural-second-person":"emiteți","imperative-negative-second-person-singular":"nu emite","imperative-negative-plural-second-person":"nu emiteți"}},{"word":"emitent","pos":"adj","definitions":["emitter","minter (of money)"],"forms":{"feminine-singular":"emitentă","masculine-plural":"emitenți","feminine-neuter-plural":"emitente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emitent","error-unrecognized-form-feminine-indefinite-singular":"emitentă","error-unrecognized-form-indefinite-masculine-plural":"emitenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"emitente","definite-error-unrecognized-form-masculine-neuter-singular":"emitentul","definite-error-unrecognized-form-feminine-singular":"emitenta","definite-error-unrecognized-form-masculine-plural":"emitenții","definite-error-unrecognized-form-feminine-neuter-plural":"emitentele"}},{"word":"emitent","pos":"noun","definitions":["transmitting"],"forms":{"plural":"emitenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emitent","accusative-definite-nominative-singular":"emitentul","accusative-indefinite-nominative-plural":"emitenți","accusative-definite-nominative-plural":"emitenții","dative-genitive-indefinite-singular":"emitent","dative-definite-genitive-singular":"emitentului","dative-genitive-indefinite-plural":"emitenți","dative-definite-genitive-plural":"emitenților","singular-vocative":"emitentule","plural-vocative":"emitenților"}},{"word":"emitere","pos":"noun","definitions":["emission"],"forms":{"plural":"emiteri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emitere","accusative-definite-nominative-singular":"emiterea","accusative-indefinite-nominative-plural":"emiteri","accusative-definite-nominative-plural":"emiterile","dative-genitive-indefinite-singular":"emiteri","dative-definite-genitive-singular":"emiterii","dative-genitive-indefinite-plural":"emiteri","dative-definite-genitive-plural":"emiterilor","singular-vocative":"emitere","plural-vocative":"emiterilor"}},{"word":"emitor","pos":"noun","definitions":["emitter"],"forms":{"plural":"emitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emitor","accusative-definite-nominative-singular":"emitorul","accusative-indefinite-nominative-plural":"emitori","accusative-definite-nominative-plural":"emitorii","dative-genitive-indefinite-singular":"emitor","dative-definite-genitive-singular":"emitorului","dative-genitive-indefinite-plural":"emitori","dative-definite-genitive-plural":"emitorilor","singular-vocative":"emitorule","plural-vocative":"emitorilor"}},{"word":"emniet","pos":"noun","definitions":["security, safety"],"forms":{"plural":"emnieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emniet","accusative-definite-nominative-singular":"emnietul","accusative-indefinite-nominative-plural":"emnieturi","accusative-definite-nominative-plural":"emnieturile","dative-genitive-indefinite-singular":"emniet","dative-definite-genitive-singular":"emnietului","dative-genitive-indefinite-plural":"emnieturi","dative-definite-genitive-plural":"emnieturilor","singular-vocative":"emnietule","plural-vocative":"emnieturilor"}},{"word":"emociune","pos":"noun","definitions":["obsolete form of emoție"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"emociune","accusative-definite-nominative":"emociunea","dative-genitive-indefinite":"emociuni","dative-definite-genitive":"emociunii","vocative":"emociune"}},{"word":"emoji","pos":"noun","definitions":["emoji (“digital graphic icon used to represent a concept or object”)"],"pronunciation":"/e.ˈmo.d͡ʒi/","forms":{"plural":"emojiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"emoji","accusative-definite-nominative-singular":"emojiul","accusative-indefinite-nominative-plural":"emojiuri","accusative-definite-nominative-plural":"emojiurile","dative-genitive-indefinite-singular":"emoji","dative-definite-genitive-singular":"emojiului","dative-genitive-indefinite-plural":"emojiuri","dative-definite-genitive-plural":"emojiurilor","singular-vocative":"emojiule","plural-vocative":"emojiurilor"}},{"word":"emolient","pos":"noun","definitions":["emollient"],"forms":{"plural":"emolienți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emolient","accusative-definite-nominative-singular":"emolientul","accusative-indefinite-nominative-plural":"emolienți","accusative-definite-nominative-plural":"emoliențile","dative-genitive-indefinite-singular":"emolient","dative-definite-genitive-singular":"emolientului","dative-genitive-indefinite-plural":"emolienți","dative-definite-genitive-plural":"emolienților","singular-vocative":"emolientule","plural-vocative":"emolienților"}},{"word":"emolument","pos":"noun","definitions":["profit"],"forms":{"plural":"emolumente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emolument","accusative-definite-nominative-singular":"emolumentul","accusative-indefinite-nominative-plural":"emolumente","accusative-definite-nominative-plural":"emolumentele","dative-genitive-indefinite-singular":"emolument","dative-definite-genitive-singular":"emolumentului","dative-genitive-indefinite-plural":"emolumente","dative-definite-genitive-plural":"emolumentelor","singular-vocative":"emolumentule","plural-vocative":"emolumentelor"}},{"word":"emolumentar","pos":"adj","definitions":["emolumentary"],"forms":{"feminine-singular":"emolumentară","masculine-plural":"emolumentari","feminine-neuter-plural":"emolumentare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emolumentar","error-unrecognized-form-feminine-indefinite-singular":"emolumentară","error-unrecognized-form-indefinite-masculine-plural":"emolumentari","error-unrecognized-form-feminine-indefinite-neuter-plural":"emolumentare","definite-error-unrecognized-form-masculine-neuter-singular":"emolumentarul","definite-error-unrecognized-form-feminine-singular":"emolumentara","definite-error-unrecognized-form-masculine-plural":"emolumentarii","definite-error-unrecognized-form-feminine-neuter-plural":"emolumentarele"}},{"word":"emoncțiune","pos":"noun","definitions":["emunction"],"forms":{"plural":"emoncțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emoncțiune","accusative-definite-nominative-singular":"emoncțiunea","accusative-indefinite-nominative-plural":"emoncțiuni","accusative-definite-nominative-plural":"emoncțiunile","dative-genitive-indefinite-singular":"emoncțiuni","dative-definite-genitive-singular":"emoncțiunii","dative-genitive-indefinite-plural":"emoncțiuni","dative-definite-genitive-plural":"emoncțiunilor","singular-vocative":"emoncțiune","plural-vocative":"emoncțiunilor"}},{"word":"emonctoriu","pos":"noun","definitions":["emunctory"],"forms":{"plural":"emonctorii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emonctoriu","accusative-definite-nominative-singular":"emonctoriul","accusative-indefinite-nominative-plural":"emonctorii","accusative-definite-nominative-plural":"emonctoriile","dative-genitive-indefinite-singular":"emonctoriu","dative-definite-genitive-singular":"emonctoriului","dative-genitive-indefinite-plural":"emonctorii","dative-definite-genitive-plural":"emonctoriilor","singular-vocative":"emonctoriule","plural-vocative":"emonctoriilor"}},{"word":"emoticon","pos":"noun","definitions":["emoticon"],"pronunciation":"/e.mo.ti.ˈkon/","forms":{"plural":"emoticoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emoticon","accusative-definite-nominative-singular":"emoticonul","accusative-indefinite-nominative-plural":"emoticoane","accusative-definite-nominative-plural":"emoticoanele","dative-genitive-indefinite-singular":"emoticon","dative-definite-genitive-singular":"emoticonului","dative-genitive-indefinite-plural":"emoticoane","dative-definite-genitive-plural":"emoticoanelor","singular-vocative":"emoticonule","plural-vocative":"emoticoanelor"}},{"word":"emoție","pos":"noun","definitions":["emotion"],"forms":{"plural":"emoții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emoție","accusative-definite-nominative-singular":"emoția","accusative-indefinite-nominative-plural":"emoții","accusative-definite-nominative-plural":"emoțiile","dative-genitive-indefinite-singular":"emoții","dative-definite-genitive-singular":"emoției","dative-genitive-indefinite-plural":"emoții","dative-definite-genitive-plural":"emoțiilor","singular-vocative":"emoție","plural-vocative":"emoțiilor"}},{"word":"emoționa","pos":"verb","definitions":["to move emotionally","to be overwhelmed by emotion"],"forms":{"canonical":"a emoționa 1st conjugation","present-singular-third-person":"emoționează","participle-past":"emoționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emoționa","gerund":"emoționând","first-person-indicative-present-singular":"emoționez","indicative-present-second-person-singular":"emoționezi","indicative-present-singular-third-person":"emoționează","first-person-indicative-plural-present":"emoționăm","indicative-plural-present-second-person":"emoționați","indicative-plural-present-third-person":"emoționează","first-person-imperfect-indicative-singular":"emoționam","imperfect-indicative-second-person-singular":"emoționai","imperfect-indicative-singular-third-person":"emoționa","first-person-imperfect-indicative-plural":"emoționam","imperfect-indicative-plural-second-person":"emoționați","imperfect-indicative-plural-third-person":"emoționau","first-person-indicative-perfect-singular":"emoționai","indicative-perfect-second-person-singular":"emoționași","indicative-perfect-singular-third-person":"emoționă","first-person-indicative-perfect-plural":"emoționarăm","indicative-perfect-plural-second-person":"emoționarăți","indicative-perfect-plural-third-person":"emoționară","first-person-indicative-pluperfect-singular":"emoționasem","indicative-pluperfect-second-person-singular":"emoționaseși","indicative-pluperfect-singular-third-person":"emoționase","first-person-indicative-pluperfect-plural":"emoționaserăm","indicative-pluperfect-plural-second-person":"emoționaserăți","indicative-pluperfect-plural-third-person":"emoționaseră","first-person-present-singular-subjunctive":"să emoționez","present-second-person-singular-subjunctive":"să emoționezi","present-singular-subjunctive-third-person":"să emoționeze","first-person-plural-present-subjunctive":"să emoționăm","plural-present-second-person-subjunctive":"să emoționați","plural-present-subjunctive-third-person":"să emoționeze","imperative-second-person-singular":"emoționează","imperative-plural-second-person":"emoționați","imperative-negative-second-person-singular":"nu emoționa","imperative-negative-plural-second-person":"nu emoționați"}},{"word":"emoționabil","pos":"adj","definitions":["emotionable"],"forms":{"feminine-singular":"emoționabilă","masculine-plural":"emoționabili","feminine-neuter-plural":"emoționabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emoționabil","error-unrecognized-form-feminine-indefinite-singular":"emoționabilă","error-unrecognized-form-indefinite-masculine-plural":"emoționabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"emoționabile","definite-error-unrecognized-form-masculine-neuter-singular":"emoționabilul","definite-error-unrecognized-form-feminine-singular":"emoționabila","definite-error-unrecognized-form-masculine-plural":"emoționabilii","definite-error-unrecognized-form-feminine-neuter-plural":"emoționabilele"}},{"word":"emoționabilitate","pos":"noun","definitions":["emotionality"],"forms":{"plural":"emoționabilitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emoționabilitate","accusative-definite-nominative-singular":"emoționabilitatea","accusative-indefinite-nominative-plural":"emoționabilitatăți","accusative-definite-nominative-plural":"emoționabilitatățile","dative-genitive-indefinite-singular":"emoționabilitatăți","dative-definite-genitive-singular":"emoționabilitatății","dative-genitive-indefinite-plural":"emoționabilitatăți","dative-definite-genitive-plural":"emoționabilitatăților","singular-vocative":"emoționabilitate","plural-vocative":"emoționabilitatăților"}},{"word":"emoțional","pos":"adj","definitions":["emotional (relating to emotion)"],"pronunciation":"/e.mo.t͡si.oˈnal/","forms":{"feminine-singular":"emoțională","masculine-plural":"emoționali","feminine-neuter-plural":"emoționale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"emoțional","error-unrecognized-form-feminine-indefinite-singular":"emoțională","error-unrecognized-form-indefinite-masculine-plural":"emoționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"emoționale","definite-error-unrecognized-form-masculine-neuter-singular":"emoționalul","definite-error-unrecognized-form-feminine-singular":"emoționala","definite-error-unrecognized-form-masculine-plural":"emoționalii","definite-error-unrecognized-form-feminine-neuter-plural":"emoționalele"}},{"word":"emoționalitate","pos":"noun","definitions":["emotionality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"emoționalitate","accusative-definite-nominative":"emoționalitatea","dative-genitive-indefinite":"emoționalități","dative-definite-genitive":"emoționalității","vocative":"emoționalitate"}},{"word":"emoționant","pos":"adj","definitions":["emotional (touching, moving)"],"pronunciation":"/e.mo.t͡si.oˈnant/","forms":{"feminine-singular":"emoționantă","masculine-plural":"emoționanți","feminine-neuter-plural":"emoționante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emoționant","error-unrecognized-form-feminine-indefinite-singular":"emoționantă","error-unrecognized-form-indefinite-masculine-plural":"emoționanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"emoționante","definite-error-unrecognized-form-masculine-neuter-singular":"emoționantul","definite-error-unrecognized-form-feminine-singular":"emoționanta","definite-error-unrecognized-form-masculine-plural":"emoționanții","definite-error-unrecognized-form-feminine-neuter-plural":"emoționantele"}},{"word":"emoționare","pos":"noun","definitions":["emotion"],"forms":{"plural":"emoționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emoționare","accusative-definite-nominative-singular":"emoționarea","accusative-indefinite-nominative-plural":"emoționări","accusative-definite-nominative-plural":"emoționările","dative-genitive-indefinite-singular":"emoționări","dative-definite-genitive-singular":"emoționării","dative-genitive-indefinite-plural":"emoționări","dative-definite-genitive-plural":"emoționărilor","singular-vocative":"emoționare","plural-vocative":"emoționărilor"}},{"word":"emoționat","pos":"adj","definitions":["emotional (moved, overcome with emotion)","nervous, afflicted with anxiety about one’s performance"],"pronunciation":"/e.mo.t͡si.oˈnat/","forms":{"feminine-singular":"emoționată","masculine-plural":"emoționați","feminine-neuter-plural":"emoționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emoționat","error-unrecognized-form-feminine-indefinite-singular":"emoționată","error-unrecognized-form-indefinite-masculine-plural":"emoționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"emoționate","definite-error-unrecognized-form-masculine-neuter-singular":"emoționatul","definite-error-unrecognized-form-feminine-singular":"emoționata","definite-error-unrecognized-form-masculine-plural":"emoționații","definite-error-unrecognized-form-feminine-neuter-plural":"emoționatele"}},{"word":"emoțiune","pos":"noun","definitions":["alternative form of emoție"],"forms":{"plural":"emoțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emoțiune","accusative-definite-nominative-singular":"emoțiunea","accusative-indefinite-nominative-plural":"emoțiuni","accusative-definite-nominative-plural":"emoțiunile","dative-genitive-indefinite-singular":"emoțiuni","dative-definite-genitive-singular":"emoțiunii","dative-genitive-indefinite-plural":"emoțiuni","dative-definite-genitive-plural":"emoțiunilor","singular-vocative":"emoțiune","plural-vocative":"emoțiunilor"}},{"word":"emotiv","pos":"adj","definitions":["emotional (easily affected by emotion)","synonym of emoțional (“emotional, relating to emotion”)"],"pronunciation":"/e.moˈtiv/","forms":{"feminine-singular":"emotivă","masculine-plural":"emotivi","feminine-neuter-plural":"emotive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emotiv","error-unrecognized-form-feminine-indefinite-singular":"emotivă","error-unrecognized-form-indefinite-masculine-plural":"emotivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"emotive","definite-error-unrecognized-form-masculine-neuter-singular":"emotivul","definite-error-unrecognized-form-feminine-singular":"emotiva","definite-error-unrecognized-form-masculine-plural":"emotivii","definite-error-unrecognized-form-feminine-neuter-plural":"emotivele"}},{"word":"emotivism","pos":"noun","definitions":["emotivism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"emotivism","accusative-definite-nominative":"emotivismul","dative-genitive-indefinite":"emotivism","dative-definite-genitive":"emotivismului","vocative":"emotivismule"}},{"word":"emotivitate","pos":"noun","definitions":["emotivity, excitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emotivitate","accusative-definite-nominative-singular":"emotivitatea","accusative-indefinite-nominative-plural":"emotivități","accusative-definite-nominative-plural":"emotivitățile","dative-genitive-indefinite-singular":"emotivități","dative-definite-genitive-singular":"emotivității","dative-genitive-indefinite-plural":"emotivități","dative-definite-genitive-plural":"emotivităților","singular-vocative":"emotivitate","plural-vocative":"emotivităților"}},{"word":"empatetic","pos":"adj","definitions":["empathetic"],"forms":{"feminine-singular":"empatetică","masculine-plural":"empatetici","feminine-neuter-plural":"empatetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empatetic","error-unrecognized-form-feminine-indefinite-singular":"empatetică","error-unrecognized-form-indefinite-masculine-plural":"empatetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"empatetice","definite-error-unrecognized-form-masculine-neuter-singular":"empateticul","definite-error-unrecognized-form-feminine-singular":"empatetica","definite-error-unrecognized-form-masculine-plural":"empateticii","definite-error-unrecognized-form-feminine-neuter-plural":"empateticele"}},{"word":"empatie","pos":"noun","definitions":["empathy (intellectual identification with another person)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"empatie","accusative-definite-nominative":"empatia","dative-genitive-indefinite":"empatii","dative-definite-genitive":"empatiei","vocative":"empatie"}},{"word":"empire","pos":"adj","definitions":["Empire"],"forms":{"masculine-plural":"empiri","feminine-neuter-plural":"empire","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empire","error-unrecognized-form-feminine-indefinite-singular":"empire","error-unrecognized-form-indefinite-masculine-plural":"empiri","error-unrecognized-form-feminine-indefinite-neuter-plural":"empire","definite-error-unrecognized-form-masculine-neuter-singular":"empirele","definite-error-unrecognized-form-feminine-singular":"empirea","definite-error-unrecognized-form-masculine-plural":"empirii","definite-error-unrecognized-form-feminine-neuter-plural":"empirele"}},{"word":"empireu","pos":"adj","definitions":["empyrean"],"forms":{"feminine-singular":"empiree","masculine-plural":"empirei","feminine-neuter-plural":"empiree","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empireu","error-unrecognized-form-feminine-indefinite-singular":"empiree","error-unrecognized-form-indefinite-masculine-plural":"empirei","error-unrecognized-form-feminine-indefinite-neuter-plural":"empiree","definite-error-unrecognized-form-masculine-neuter-singular":"empireul","definite-error-unrecognized-form-feminine-singular":"empireea","definite-error-unrecognized-form-masculine-plural":"empireii","definite-error-unrecognized-form-feminine-neuter-plural":"empireele"}}];
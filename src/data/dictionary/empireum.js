@@ -0,0 +1 @@
+export default [{"word":"empireumatic","pos":"adj","definitions":["empyreumatic"],"forms":{"feminine-singular":"empireumatică","masculine-plural":"empireumatici","feminine-neuter-plural":"empireumatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empireumatic","error-unrecognized-form-feminine-indefinite-singular":"empireumatică","error-unrecognized-form-indefinite-masculine-plural":"empireumatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"empireumatice","definite-error-unrecognized-form-masculine-neuter-singular":"empireumaticul","definite-error-unrecognized-form-feminine-singular":"empireumatica","definite-error-unrecognized-form-masculine-plural":"empireumaticii","definite-error-unrecognized-form-feminine-neuter-plural":"empireumaticele"}},{"word":"empiric","pos":"adj","definitions":["empirical"],"pronunciation":"/emˈpi.rik/","forms":{"feminine-singular":"empirică","masculine-plural":"empirici","feminine-neuter-plural":"empirice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"empiric","error-unrecognized-form-feminine-indefinite-singular":"empirică","error-unrecognized-form-indefinite-masculine-plural":"empirici","error-unrecognized-form-feminine-indefinite-neuter-plural":"empirice","definite-error-unrecognized-form-masculine-neuter-singular":"empiricul","definite-error-unrecognized-form-feminine-singular":"empirica","definite-error-unrecognized-form-masculine-plural":"empiricii","definite-error-unrecognized-form-feminine-neuter-plural":"empiricele"}},{"word":"empiricesc","pos":"adj","definitions":["empirical"],"forms":{"feminine-singular":"empiricească","plural":"empiricești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empiricesc","error-unrecognized-form-feminine-indefinite-singular":"empiricească","error-unrecognized-form-indefinite-masculine-plural":"empiricești","error-unrecognized-form-feminine-indefinite-neuter-plural":"empiricești","definite-error-unrecognized-form-masculine-neuter-singular":"empiricescul","definite-error-unrecognized-form-feminine-singular":"empiriceasca","definite-error-unrecognized-form-masculine-plural":"empiriceștii","definite-error-unrecognized-form-feminine-neuter-plural":"empiriceștile"}},{"word":"empirie","pos":"noun","definitions":["existence"],"forms":{"plural":"empirii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"empirie","accusative-definite-nominative-singular":"empiria","accusative-indefinite-nominative-plural":"empirii","accusative-definite-nominative-plural":"empiriile","dative-genitive-indefinite-singular":"empirii","dative-definite-genitive-singular":"empiriei","dative-genitive-indefinite-plural":"empirii","dative-definite-genitive-plural":"empiriilor","singular-vocative":"empirie","plural-vocative":"empiriilor"}},{"word":"empiriocritic","pos":"adj","definitions":["empiriocritical"],"forms":{"feminine-singular":"empiriocritică","masculine-plural":"empiriocritici","feminine-neuter-plural":"empiriocritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"empiriocritic","error-unrecognized-form-feminine-indefinite-singular":"empiriocritică","error-unrecognized-form-indefinite-masculine-plural":"empiriocritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"empiriocritice","definite-error-unrecognized-form-masculine-neuter-singular":"empiriocriticul","definite-error-unrecognized-form-feminine-singular":"empiriocritica","definite-error-unrecognized-form-masculine-plural":"empiriocriticii","definite-error-unrecognized-form-feminine-neuter-plural":"empiriocriticele"}},{"word":"empiriocritic","pos":"noun","definitions":["empiriocritic"],"forms":{"plural":"empiriocritici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"empiriocritic","accusative-definite-nominative-singular":"empiriocriticul","accusative-indefinite-nominative-plural":"empiriocritici","accusative-definite-nominative-plural":"empiriocriticii","dative-genitive-indefinite-singular":"empiriocritic","dative-definite-genitive-singular":"empiriocriticului","dative-genitive-indefinite-plural":"empiriocritici","dative-definite-genitive-plural":"empiriocriticilor","singular-vocative":"empiriocriticule","plural-vocative":"empiriocriticilor"}},{"word":"empiriocriticism","pos":"noun","definitions":["empiriocriticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"empiriocriticism","accusative-definite-nominative":"empiriocriticismul","dative-genitive-indefinite":"empiriocriticism","dative-definite-genitive":"empiriocriticismului","vocative":"empiriocriticismule"}},{"word":"empiriomonist","pos":"noun","definitions":["empiriomonist"],"forms":{"plural":"empiriomoniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"empiriomonist","accusative-definite-nominative-singular":"empiriomonistul","accusative-indefinite-nominative-plural":"empiriomoniști","accusative-definite-nominative-plural":"empiriomoniștii","dative-genitive-indefinite-singular":"empiriomonist","dative-definite-genitive-singular":"empiriomonistului","dative-genitive-indefinite-plural":"empiriomoniști","dative-definite-genitive-plural":"empiriomoniștilor","singular-vocative":"empiriomonistule","plural-vocative":"empiriomoniștilor"}},{"word":"empiriosimbolism","pos":"noun","definitions":["empiriosymbolism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"empiriosimbolism","accusative-definite-nominative-singular":"empiriosimbolismul","accusative-indefinite-nominative-plural":"empiriosimbolisme","accusative-definite-nominative-plural":"empiriosimbolismele","dative-genitive-indefinite-singular":"empiriosimbolism","dative-definite-genitive-singular":"empiriosimbolismului","dative-genitive-indefinite-plural":"empiriosimbolisme","dative-definite-genitive-plural":"empiriosimbolismelor","singular-vocative":"empiriosimbolismule","plural-vocative":"empiriosimbolismelor"}},{"word":"empirism","pos":"noun","definitions":["empiricism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"empirism","accusative-definite-nominative-singular":"empirismul","accusative-indefinite-nominative-plural":"empirisme","accusative-definite-nominative-plural":"empirismele","dative-genitive-indefinite-singular":"empirism","dative-definite-genitive-singular":"empirismului","dative-genitive-indefinite-plural":"empirisme","dative-definite-genitive-plural":"empirismelor","singular-vocative":"empirismule","plural-vocative":"empirismelor"}},{"word":"empirist","pos":"noun","definitions":["empiricist"],"forms":{"plural":"empiriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"empirist","accusative-definite-nominative-singular":"empiristul","accusative-indefinite-nominative-plural":"empiriști","accusative-definite-nominative-plural":"empiriștii","dative-genitive-indefinite-singular":"empirist","dative-definite-genitive-singular":"empiristului","dative-genitive-indefinite-plural":"empiriști","dative-definite-genitive-plural":"empiriștilor","singular-vocative":"empiristule","plural-vocative":"empiriștilor"}},{"word":"empiristă","pos":"noun","definitions":["female equivalent of empirist"],"forms":{"plural":"empiriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"empiristă","accusative-definite-nominative-singular":"empirista","accusative-indefinite-nominative-plural":"empiriste","accusative-definite-nominative-plural":"empiristele","dative-genitive-indefinite-singular":"empiriste","dative-definite-genitive-singular":"empiristei","dative-genitive-indefinite-plural":"empiriste","dative-definite-genitive-plural":"empiristelor","singular-vocative":"empiristă","plural-vocative":"empiristelor"}},{"word":"emplastic","pos":"adj","definitions":["emplastic"],"forms":{"feminine-singular":"emplastică","masculine-plural":"emplastici","feminine-neuter-plural":"emplastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emplastic","error-unrecognized-form-feminine-indefinite-singular":"emplastică","error-unrecognized-form-indefinite-masculine-plural":"emplastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"emplastice","definite-error-unrecognized-form-masculine-neuter-singular":"emplasticul","definite-error-unrecognized-form-feminine-singular":"emplastica","definite-error-unrecognized-form-masculine-plural":"emplasticii","definite-error-unrecognized-form-feminine-neuter-plural":"emplasticele"}},{"word":"emporiu","pos":"noun","definitions":["emporium"],"forms":{"plural":"emporii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emporiu","accusative-definite-nominative-singular":"emporiul","accusative-indefinite-nominative-plural":"emporii","accusative-definite-nominative-plural":"emporiile","dative-genitive-indefinite-singular":"emporiu","dative-definite-genitive-singular":"emporiului","dative-genitive-indefinite-plural":"emporii","dative-definite-genitive-plural":"emporiilor","singular-vocative":"emporiule","plural-vocative":"emporiilor"}},{"word":"emu","pos":"noun","definitions":["emu"],"forms":{"plural":"emu","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emu","accusative-definite-nominative-singular":"emuul","accusative-indefinite-nominative-plural":"emu","accusative-definite-nominative-plural":"emui","dative-genitive-indefinite-singular":"emu","dative-definite-genitive-singular":"emuului","dative-genitive-indefinite-plural":"emu","dative-definite-genitive-plural":"emulor","singular-vocative":"emuule","plural-vocative":"emulor"}},{"word":"emul","pos":"noun","definitions":["emulator"],"forms":{"plural":"emuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emul","accusative-definite-nominative-singular":"emulul","accusative-indefinite-nominative-plural":"emuli","accusative-definite-nominative-plural":"emulii","dative-genitive-indefinite-singular":"emul","dative-definite-genitive-singular":"emulului","dative-genitive-indefinite-plural":"emuli","dative-definite-genitive-plural":"emulilor","singular-vocative":"emulule","plural-vocative":"emulilor"}},{"word":"emula","pos":"verb","definitions":["to emulate"],"pronunciation":"/e.muˈla/","forms":{"canonical":"a emula 1st conjugation","present-singular-third-person":"emulează","participle-past":"emulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emula","gerund":"emulând","first-person-indicative-present-singular":"emulez","indicative-present-second-person-singular":"emulezi","indicative-present-singular-third-person":"emulează","first-person-indicative-plural-present":"emulăm","indicative-plural-present-second-person":"emulați","indicative-plural-present-third-person":"emulează","first-person-imperfect-indicative-singular":"emulam","imperfect-indicative-second-person-singular":"emulai","imperfect-indicative-singular-third-person":"emula","first-person-imperfect-indicative-plural":"emulam","imperfect-indicative-plural-second-person":"emulați","imperfect-indicative-plural-third-person":"emulau","first-person-indicative-perfect-singular":"emulai","indicative-perfect-second-person-singular":"emulași","indicative-perfect-singular-third-person":"emulă","first-person-indicative-perfect-plural":"emularăm","indicative-perfect-plural-second-person":"emularăți","indicative-perfect-plural-third-person":"emulară","first-person-indicative-pluperfect-singular":"emulasem","indicative-pluperfect-second-person-singular":"emulaseși","indicative-pluperfect-singular-third-person":"emulase","first-person-indicative-pluperfect-plural":"emulaserăm","indicative-pluperfect-plural-second-person":"emulaserăți","indicative-pluperfect-plural-third-person":"emulaseră","first-person-present-singular-subjunctive":"să emulez","present-second-person-singular-subjunctive":"să emulezi","present-singular-subjunctive-third-person":"să emuleze","first-person-plural-present-subjunctive":"să emulăm","plural-present-second-person-subjunctive":"să emulați","plural-present-subjunctive-third-person":"să emuleze","imperative-second-person-singular":"emulează","imperative-plural-second-person":"emulați","imperative-negative-second-person-singular":"nu emula","imperative-negative-plural-second-person":"nu emulați"}},{"word":"emulare","pos":"noun","definitions":["emulation"],"pronunciation":"[emuˈlare]","forms":{"plural":"emulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emulare","accusative-definite-nominative-singular":"emularea","accusative-indefinite-nominative-plural":"emulări","accusative-definite-nominative-plural":"emulările","dative-genitive-indefinite-singular":"emulări","dative-definite-genitive-singular":"emulării","dative-genitive-indefinite-plural":"emulări","dative-definite-genitive-plural":"emulărilor","singular-vocative":"emulare","plural-vocative":"emulărilor"}},{"word":"emulație","pos":"noun","definitions":["emulation"],"forms":{"plural":"emulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emulație","accusative-definite-nominative-singular":"emulația","accusative-indefinite-nominative-plural":"emulații","accusative-definite-nominative-plural":"emulațiile","dative-genitive-indefinite-singular":"emulații","dative-definite-genitive-singular":"emulației","dative-genitive-indefinite-plural":"emulații","dative-definite-genitive-plural":"emulațiilor","singular-vocative":"emulație","plural-vocative":"emulațiilor"}},{"word":"emulațiune","pos":"noun","definitions":["alternative form of emulație"],"forms":{"plural":"emulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emulațiune","accusative-definite-nominative-singular":"emulațiunea","accusative-indefinite-nominative-plural":"emulațiuni","accusative-definite-nominative-plural":"emulațiunile","dative-genitive-indefinite-singular":"emulațiuni","dative-definite-genitive-singular":"emulațiunii","dative-genitive-indefinite-plural":"emulațiuni","dative-definite-genitive-plural":"emulațiunilor","singular-vocative":"emulațiune","plural-vocative":"emulațiunilor"}},{"word":"emulățiune","pos":"noun","definitions":["obsolete form of emulație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"emulățiune","accusative-definite-nominative":"emulățiunea","dative-genitive-indefinite":"emulățiuni","dative-definite-genitive":"emulățiunii","vocative":"emulățiune"}},{"word":"emulativ","pos":"adj","definitions":["emulative"],"forms":{"feminine-singular":"emulativă","masculine-plural":"emulativi","feminine-neuter-plural":"emulative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emulativ","error-unrecognized-form-feminine-indefinite-singular":"emulativă","error-unrecognized-form-indefinite-masculine-plural":"emulativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"emulative","definite-error-unrecognized-form-masculine-neuter-singular":"emulativul","definite-error-unrecognized-form-feminine-singular":"emulativa","definite-error-unrecognized-form-masculine-plural":"emulativii","definite-error-unrecognized-form-feminine-neuter-plural":"emulativele"}},{"word":"emulator","pos":"adj","definitions":["emulator"],"pronunciation":"/e.mu.laˈtor/","forms":{"feminine-singular":"emulatoare","masculine-plural":"emulatori","feminine-neuter-plural":"emulatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emulator","error-unrecognized-form-feminine-indefinite-singular":"emulatoare","error-unrecognized-form-indefinite-masculine-plural":"emulatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"emulatoare","definite-error-unrecognized-form-masculine-neuter-singular":"emulatorul","definite-error-unrecognized-form-feminine-singular":"emulatoarea","definite-error-unrecognized-form-masculine-plural":"emulatorii","definite-error-unrecognized-form-feminine-neuter-plural":"emulatoarele"}},{"word":"emulgator","pos":"noun","definitions":["emulsifier"],"forms":{"plural":"emulgatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"emulgator","accusative-definite-nominative-singular":"emulgatorul","accusative-indefinite-nominative-plural":"emulgatori","accusative-definite-nominative-plural":"emulgatorii","dative-genitive-indefinite-singular":"emulgator","dative-definite-genitive-singular":"emulgatorului","dative-genitive-indefinite-plural":"emulgatori","dative-definite-genitive-plural":"emulgatorilor","singular-vocative":"emulgatorule","plural-vocative":"emulgatorilor"}},{"word":"emulsie","pos":"noun","definitions":["emulsion"],"forms":{"plural":"emulsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"emulsie","accusative-definite-nominative-singular":"emulsia","accusative-indefinite-nominative-plural":"emulsii","accusative-definite-nominative-plural":"emulsiile","dative-genitive-indefinite-singular":"emulsii","dative-definite-genitive-singular":"emulsiei","dative-genitive-indefinite-plural":"emulsii","dative-definite-genitive-plural":"emulsiilor","singular-vocative":"emulsie","plural-vocative":"emulsiilor"}},{"word":"emulsină","pos":"noun","definitions":["emulsin"],"forms":{"plural":"emulsine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"emulsină","accusative-definite-nominative-singular":"emulsina","accusative-indefinite-nominative-plural":"emulsine","accusative-definite-nominative-plural":"emulsinele","dative-genitive-indefinite-singular":"emulsine","dative-definite-genitive-singular":"emulsinei","dative-genitive-indefinite-plural":"emulsine","dative-definite-genitive-plural":"emulsinelor","singular-vocative":"emulsină","plural-vocative":"emulsinelor"}},{"word":"emulsiona","pos":"verb","definitions":["to emulsify"],"forms":{"canonical":"a emulsiona 1st conjugation","present-singular-third-person":"emulsionează","participle-past":"emulsionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a emulsiona","gerund":"emulsionând","first-person-indicative-present-singular":"emulsionez","indicative-present-second-person-singular":"emulsionezi","indicative-present-singular-third-person":"emulsionează","first-person-indicative-plural-present":"emulsionăm","indicative-plural-present-second-person":"emulsionați","indicative-plural-present-third-person":"emulsionează","first-person-imperfect-indicative-singular":"emulsionam","imperfect-indicative-second-person-singular":"emulsionai","imperfect-indicative-singular-third-person":"emulsiona","first-person-imperfect-indicative-plural":"emulsionam","imperfect-indicative-plural-second-person":"emulsionați","imperfect-indicative-plural-third-person":"emulsionau","first-person-indicative-perfect-singular":"emulsionai","indicative-perfect-second-person-singular":"emulsionași","indicative-perfect-singular-third-person":"emulsionă","first-person-indicative-perfect-plural":"emulsionarăm","indicative-perfect-plural-second-person":"emulsionarăți","indicative-perfect-plural-third-person":"emulsionară","first-person-indicative-pluperfect-singular":"emulsionasem","indicative-pluperfect-second-person-singular":"emulsionaseși","indicative-pluperfect-singular-third-person":"emulsionase","first-person-indicative-pluperfect-plural":"emulsionaserăm","indicative-pluperfect-plural-second-person":"emulsionaserăți","indicative-pluperfect-plural-third-person":"emulsionaseră","first-person-present-singular-subjunctive":"să emulsionez","present-second-person-singular-subjunctive":"să emulsionezi","present-singular-subjunctive-third-person":"să emulsioneze","first-person-plural-present-subjunctive":"să emulsionăm","plural-present-second-person-subjunctive":"să emulsionați","plural-present-subjunctive-third-person":"să emulsioneze","imperative-second-person-singular":"emulsionează","imperative-plural-second-person":"emulsionați","imperative-negative-second-person-singular":"nu emulsiona","imperative-negative-plural-second-person":"nu emulsionați"}},{"word":"emulsionabil","pos":"adj","definitions":["emulsifiable"],"forms":{"feminine-singular":"emulsionabilă","masculine-plural":"emulsionabili","feminine-neuter-plural":"emulsionabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"emulsionabil","error-unrecognized-form-feminine-indefinite-singular":"emulsionabilă","error-unrecognized-form-indefinite-masculine-plural":"emulsionabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"emulsionabile","definite-error-unrecognized-form-masculine-neuter-singular":"emulsionabilul","definite-error-unrecognized-form-feminine-singular":"emulsionabila","definite-error-unrecognized-form-masculine-plural":"emulsionabilii","definite-error-unrecognized-form-feminine-neuter-plural":"emulsionabilele"}},{"word":"emulsionant","pos":"noun","definitions":["emulsifier"],"forms":{"plural":"emulsionante","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emulsionant","accusative-definite-nominative-singular":"emulsionantul","accusative-indefinite-nominative-plural":"emulsionante","accusative-definite-nominative-plural":"emulsionantele","dative-genitive-indefinite-singular":"emulsionant","dative-definite-genitive-singular":"emulsionantului","dative-genitive-indefinite-plural":"emulsionante","dative-definite-genitive-plural":"emulsionantelor","singular-vocative":"emulsionantule","plural-vocative":"emulsionantelor"}},{"word":"emulsionare","pos":"noun","definitions":["emulsifying"],"forms":{"plural":"emulsionări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emulsionare","accusative-definite-nominative-singular":"emulsionarea","accusative-indefinite-nominative-plural":"emulsionări","accusative-definite-nominative-plural":"emulsionările","dative-genitive-indefinite-singular":"emulsionări","dative-definite-genitive-singular":"emulsionării","dative-genitive-indefinite-plural":"emulsionări","dative-definite-genitive-plural":"emulsionărilor","singular-vocative":"emulsionare","plural-vocative":"emulsionărilor"}},{"word":"emulsiune","pos":"noun","definitions":["obsolete form of emulsie"],"forms":{"plural":"emulsiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"emulsiune","accusative-definite-nominative-singular":"emulsiunea","accusative-indefinite-nominative-plural":"emulsiuni","accusative-definite-nominative-plural":"emulsiunile","dative-genitive-indefinite-singular":"emulsiuni","dative-definite-genitive-singular":"emulsiunii","dative-genitive-indefinite-plural":"emulsiuni","dative-definite-genitive-plural":"emulsiunilor","singular-vocative":"emulsiune","plural-vocative":"emulsiunilor"}},{"word":"emulsiv","pos":"noun","definitions":["emulsifier"],"forms":{"plural":"emulsivi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emulsiv","accusative-definite-nominative-singular":"emulsivul","accusative-indefinite-nominative-plural":"emulsivi","accusative-definite-nominative-plural":"emulsivile","dative-genitive-indefinite-singular":"emulsiv","dative-definite-genitive-singular":"emulsivului","dative-genitive-indefinite-plural":"emulsivi","dative-definite-genitive-plural":"emulsivilor","singular-vocative":"emulsivule","plural-vocative":"emulsivilor"}},{"word":"emulsor","pos":"noun","definitions":["emulsifier"],"forms":{"plural":"emulsoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"emulsor","accusative-definite-nominative-singular":"emulsorul","accusative-indefinite-nominative-plural":"emulsoare","accusative-definite-nominative-plural":"emulsoarele","dative-genitive-indefinite-singular":"emulsor","dative-definite-genitive-singular":"emulsorului","dative-genitive-indefinite-plural":"emulsoare","dative-definite-genitive-plural":"emulsoarelor","singular-vocative":"emulsorule","plural-vocative":"emulsoarelor"}},{"word":"Enăceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enăceanu"}},{"word":"Enăcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enăcescu"}},{"word":"Enache","pos":"name","definitions":["a surname from Greek"]},{"word":"Enăchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enăchescu"}},{"word":"Enăchești","pos":"name","definitions":["a village in Berești-Tazlău, Bacău County, Romania"],"gender":"m"},{"word":"Enachi","pos":"name","definitions":["a surname from Greek"]},{"word":"Enăchioae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Enăchioae"}},{"word":"Enăchioaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Enăchioaia"}},{"word":"Enăchioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enăchioiu"}},{"word":"Enăchiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enăchiță"}},{"word":"enantem","pos":"noun","definitions":["enanthema"],"forms":{"plural":"enanteme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enantem","accusative-definite-nominative-singular":"enantemul","accusative-indefinite-nominative-plural":"enanteme","accusative-definite-nominative-plural":"enantemele","dative-genitive-indefinite-singular":"enantem","dative-definite-genitive-singular":"enantemului","dative-genitive-indefinite-plural":"enanteme","dative-definite-genitive-plural":"enantemelor","singular-vocative":"enantemule","plural-vocative":"enantemelor"}},{"word":"enantic","pos":"adj","definitions":["enanthic"],"forms":{"feminine-singular":"enantică","masculine-plural":"enantici","feminine-neuter-plural":"enantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enantic","error-unrecognized-form-feminine-indefinite-singular":"enantică","error-unrecognized-form-indefinite-masculine-plural":"enantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enantice","definite-error-unrecognized-form-masculine-neuter-singular":"enanticul","definite-error-unrecognized-form-feminine-singular":"enantica","definite-error-unrecognized-form-masculine-plural":"enanticii","definite-error-unrecognized-form-feminine-neuter-plural":"enanticele"}},{"word":"enantiomer","pos":"noun","definitions":["enantiomer"],"forms":{"plural":"enantiomeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enantiomer","accusative-definite-nominative-singular":"enantiomerul","accusative-indefinite-nominative-plural":"enantiomeri","accusative-definite-nominative-plural":"enantiomerii","dative-genitive-indefinite-singular":"enantiomer","dative-definite-genitive-singular":"enantiomerului","dative-genitive-indefinite-plural":"enantiomeri","dative-definite-genitive-plural":"enantiomerilor","singular-vocative":"enantiomerule","plural-vocative":"enantiomerilor"}},{"word":"enantiomorf","pos":"adj","definitions":["enantiomorphic"],"forms":{"feminine-singular":"enantiomorfă","masculine-plural":"enantiomorfi","feminine-neuter-plural":"enantiomorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enantiomorf","error-unrecognized-form-feminine-indefinite-singular":"enantiomorfă","error-unrecognized-form-indefinite-masculine-plural":"enantiomorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"enantiomorfe","definite-error-unrecognized-form-masculine-neuter-singular":"enantiomorful","definite-error-unrecognized-form-feminine-singular":"enantiomorfa","definite-error-unrecognized-form-masculine-plural":"enantiomorfii","definite-error-unrecognized-form-feminine-neuter-plural":"enantiomorfele"}},{"word":"enantiomorfie","pos":"noun","definitions":["enantiomorphy"],"forms":{"plural":"enantiomorfii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enantiomorfie","accusative-definite-nominative-singular":"enantiomorfia","accusative-indefinite-nominative-plural":"enantiomorfii","accusative-definite-nominative-plural":"enantiomorfiile","dative-genitive-indefinite-singular":"enantiomorfii","dative-definite-genitive-singular":"enantiomorfiei","dative-genitive-indefinite-plural":"enantiomorfii","dative-definite-genitive-plural":"enantiomorfiilor","singular-vocative":"enantiomorfie","plural-vocative":"enantiomorfiilor"}},{"word":"enantiomorfism","pos":"noun","definitions":["enantiomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enantiomorfism","accusative-definite-nominative-singular":"enantiomorfismul","accusative-indefinite-nominative-plural":"enantiomorfisme","accusative-definite-nominative-plural":"enantiomorfismele","dative-genitive-indefinite-singular":"enantiomorfism","dative-definite-genitive-singular":"enantiomorfismului","dative-genitive-indefinite-plural":"enantiomorfisme","dative-definite-genitive-plural":"enantiomorfismelor","singular-vocative":"enantiomorfismule","plural-vocative":"enantiomorfismelor"}},{"word":"enantiotrop","pos":"adj","definitions":["enantiotropic"],"forms":{"feminine-singular":"enantiotropă","masculine-plural":"enantiotropi","feminine-neuter-plural":"enantiotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enantiotrop","error-unrecognized-form-feminine-indefinite-singular":"enantiotropă","error-unrecognized-form-indefinite-masculine-plural":"enantiotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"enantiotrope","definite-error-unrecognized-form-masculine-neuter-singular":"enantiotropul","definite-error-unrecognized-form-feminine-singular":"enantiotropa","definite-error-unrecognized-form-masculine-plural":"enantiotropii","definite-error-unrecognized-form-feminine-neuter-plural":"enantiotropele"}},{"word":"enantiotropie","pos":"noun","definitions":["enantiotropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"enantiotropie","accusative-definite-nominative":"enantiotropia","dative-genitive-indefinite":"enantiotropii","dative-definite-genitive":"enantiotropiei","vocative":"enantiotropie"}},{"word":"enantioză","pos":"noun","definitions":["enantiosis"],"forms":{"plural":"enantioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enantioză","accusative-definite-nominative-singular":"enantioza","accusative-indefinite-nominative-plural":"enantioze","accusative-definite-nominative-plural":"enantiozele","dative-genitive-indefinite-singular":"enantioze","dative-definite-genitive-singular":"enantiozei","dative-genitive-indefinite-plural":"enantioze","dative-definite-genitive-plural":"enantiozelor","singular-vocative":"enantioză","plural-vocative":"enantiozelor"}},{"word":"enara","pos":"verb","definitions":["to expound"],"forms":{"canonical":"a enara 1st conjugation","present-singular-third-person":"enarează","participle-past":"enarat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a enara","gerund":"enarând","first-person-indicative-present-singular":"enarez","indicative-present-second-person-singular":"enarezi","indicative-present-singular-third-person":"enarează","first-person-indicative-plural-present":"enarăm","indicative-plural-present-second-person":"enarați","indicative-plural-present-third-person":"enarează","first-person-imperfect-indicative-singular":"enaram","imperfect-indicative-second-person-singular":"enarai","imperfect-indicative-singular-third-person":"enara","first-person-imperfect-indicative-plural":"enaram","imperfect-indicative-plural-second-person":"enarați","imperfect-indicative-plural-third-person":"enarau","first-person-indicative-perfect-singular":"enarai","indicative-perfect-second-person-singular":"enarași","indicative-perfect-singular-third-person":"enară","first-person-indicative-perfect-plural":"enararăm","indicative-perfect-plural-second-person":"enararăți","indicative-perfect-plural-third-person":"enarară","first-person-indicative-pluperfect-singular":"enarasem","indicative-pluperfect-second-person-singular":"enaraseși","indicative-pluperfect-singular-third-person":"enarase","first-person-indicative-pluperfect-plural":"enaraserăm","indicative-pluperfect-plural-second-person":"enaraserăți","indicative-pluperfect-plural-third-person":"enaraseră","first-person-present-singular-subjunctive":"să enarez","present-second-person-singular-subjunctive":"să enarezi","present-singular-subjunctive-third-person":"să enareze","first-person-plural-present-subjunctive":"să enarăm","plural-present-second-person-subjunctive":"să enarați","plural-present-subjunctive-third-person":"să enareze","imperative-second-person-singular":"enarează","imperative-plural-second-person":"enarați","imperative-negative-second-person-singular":"nu enara","imperative-negative-plural-second-person":"nu enarați"}},{"word":"enarare","pos":"noun","definitions":["enarration"],"forms":{"plural":"enarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enarare","accusative-definite-nominative-singular":"enararea","accusative-indefinite-nominative-plural":"enarări","accusative-definite-nominative-plural":"enarările","dative-genitive-indefinite-singular":"enarări","dative-definite-genitive-singular":"enarării","dative-genitive-indefinite-plural":"enarări","dative-definite-genitive-plural":"enarărilor","singular-vocative":"enarare","plural-vocative":"enarărilor"}},{"word":"enargit","pos":"noun","definitions":["enargite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"enargit","accusative-definite-nominative":"enargitul","dative-genitive-indefinite":"enargit","dative-definite-genitive":"enargitului","vocative":"enargitule"}},{"word":"enarmonic","pos":"adj","definitions":["enharmonic"],"forms":{"feminine-singular":"enarmonică","masculine-plural":"enarmonici","feminine-neuter-plural":"enarmonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enarmonic","error-unrecognized-form-feminine-indefinite-singular":"enarmonică","error-unrecognized-form-indefinite-masculine-plural":"enarmonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enarmonice","definite-error-unrecognized-form-masculine-neuter-singular":"enarmonicul","definite-error-unrecognized-form-feminine-singular":"enarmonica","definite-error-unrecognized-form-masculine-plural":"enarmonicii","definite-error-unrecognized-form-feminine-neuter-plural":"enarmonicele"}},{"word":"enarmonie","pos":"noun","definitions":["enharmony"],"forms":{"plural":"enarmonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enarmonie","accusative-definite-nominative-singular":"enarmonia","accusative-indefinite-nominative-plural":"enarmonii","accusative-definite-nominative-plural":"enarmoniile","dative-genitive-indefinite-singular":"enarmonii","dative-definite-genitive-singular":"enarmoniei","dative-genitive-indefinite-plural":"enarmonii","dative-definite-genitive-plural":"enarmoniilor","singular-vocative":"enarmonie","plural-vocative":"enarmoniilor"}},{"word":"enarmonism","pos":"noun","definitions":["enharmony"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"enarmonism","accusative-definite-nominative":"enarmonismul","dative-genitive-indefinite":"enarmonism","dative-definite-genitive":"enarmonismului","vocative":"enarmonismule"}},{"word":"enartroză","pos":"noun","definitions":["enarthrosis, ball and socket joint"],"forms":{"plural":"enartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enartroză","accusative-definite-nominative-singular":"enartroza","accusative-indefinite-nominative-plural":"enartroze","accusative-definite-nominative-plural":"enartrozele","dative-genitive-indefinite-singular":"enartroze","dative-definite-genitive-singular":"enartrozei","dative-genitive-indefinite-plural":"enartroze","dative-definite-genitive-plural":"enartrozelor","singular-vocative":"enartroză","plural-vocative":"enartrozelor"}},{"word":"Enășoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enășoiu"}},{"word":"encarpă","pos":"noun","definitions":["encarpus"],"forms":{"plural":"encarpe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encarpă","accusative-definite-nominative-singular":"encarpăul","accusative-indefinite-nominative-plural":"encarpe","accusative-definite-nominative-plural":"encarpele","dative-genitive-indefinite-singular":"encarpă","dative-definite-genitive-singular":"encarpăului","dative-genitive-indefinite-plural":"encarpe","dative-definite-genitive-plural":"encarpelor","singular-vocative":"encarpăule","plural-vocative":"encarpelor"}},{"word":"encaustic","pos":"noun","definitions":["encaustic"],"forms":{"plural":"encaustici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"encaustic","accusative-definite-nominative-singular":"encausticul","accusative-indefinite-nominative-plural":"encaustici","accusative-definite-nominative-plural":"encausticii","dative-genitive-indefinite-singular":"encaustic","dative-definite-genitive-singular":"encausticului","dative-genitive-indefinite-plural":"encaustici","dative-definite-genitive-plural":"encausticilor","singular-vocative":"encausticule","plural-vocative":"encausticilor"}},{"word":"encefal","pos":"noun","definitions":["encephalon"],"forms":{"plural":"encefale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encefal","accusative-definite-nominative-singular":"encefalul","accusative-indefinite-nominative-plural":"encefale","accusative-definite-nominative-plural":"encefalele","dative-genitive-indefinite-singular":"encefal","dative-definite-genitive-singular":"encefalului","dative-genitive-indefinite-plural":"encefale","dative-definite-genitive-plural":"encefalelor","singular-vocative":"encefalule","plural-vocative":"encefalelor"}},{"word":"encefalic","pos":"adj","definitions":["encephalic"],"forms":{"feminine-singular":"encefalică","masculine-plural":"encefalici","feminine-neuter-plural":"encefalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"encefalic","error-unrecognized-form-feminine-indefinite-singular":"encefalică","error-unrecognized-form-indefinite-masculine-plural":"encefalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"encefalice","definite-error-unrecognized-form-masculine-neuter-singular":"encefalicul","definite-error-unrecognized-form-feminine-singular":"encefalica","definite-error-unrecognized-form-masculine-plural":"encefalicii","definite-error-unrecognized-form-feminine-neuter-plural":"encefalicele"}},{"word":"encefalină","pos":"noun","definitions":["encephalin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encefalină","accusative-definite-nominative-singular":"encefalina","accusative-indefinite-nominative-plural":"encefaline","accusative-definite-nominative-plural":"encefalinele","dative-genitive-indefinite-singular":"encefaline","dative-definite-genitive-singular":"encefalinei","dative-genitive-indefinite-plural":"encefaline","dative-definite-genitive-plural":"encefalinelor","singular-vocative":"encefalină","plural-vocative":"encefalinelor"}},{"word":"encefalită","pos":"noun","definitions":["encephalitis"],"forms":{"plural":"encefalite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encefalită","accusative-definite-nominative-singular":"encefalita","accusative-indefinite-nominative-plural":"encefalite","accusative-definite-nominative-plural":"encefalitele","dative-genitive-indefinite-singular":"encefalite","dative-definite-genitive-singular":"encefalitei","dative-genitive-indefinite-plural":"encefalite","dative-definite-genitive-plural":"encefalitelor","singular-vocative":"encefalită","plural-vocative":"encefalitelor"}},{"word":"encefalitic","pos":"adj","definitions":["encephalitic"],"forms":{"feminine-singular":"encefalitică","masculine-plural":"encefalitici","feminine-neuter-plural":"encefalitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"encefalitic","error-unrecognized-form-feminine-indefinite-singular":"encefalitică","error-unrecognized-form-indefinite-masculine-plural":"encefalitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"encefalitice","definite-error-unrecognized-form-masculine-neuter-singular":"encefaliticul","definite-error-unrecognized-form-feminine-singular":"encefalitica","definite-error-unrecognized-form-masculine-plural":"encefaliticii","definite-error-unrecognized-form-feminine-neuter-plural":"encefaliticele"}},{"word":"encefalocel","pos":"noun","definitions":["encephalocele"],"forms":{"plural":"encefalocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encefalocel","accusative-definite-nominative-singular":"encefalocelul","accusative-indefinite-nominative-plural":"encefalocele","accusative-definite-nominative-plural":"encefalocelele","dative-genitive-indefinite-singular":"encefalocel","dative-definite-genitive-singular":"encefalocelului","dative-genitive-indefinite-plural":"encefalocele","dative-definite-genitive-plural":"encefalocelelor","singular-vocative":"encefalocelule","plural-vocative":"encefalocelelor"}},{"word":"encefalografie","pos":"noun","definitions":["encephalography"],"forms":{"plural":"encefalografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"encefalografie","accusative-definite-nominative-singular":"encefalografia","accusative-indefinite-nominative-plural":"encefalografii","accusative-definite-nominative-plural":"encefalografiile","dative-genitive-indefinite-singular":"encefalografii","dative-definite-genitive-singular":"encefalografiei","dative-genitive-indefinite-plural":"encefalografii","dative-definite-genitive-plural":"encefalografiilor","singular-vocative":"encefalografie","plural-vocative":"encefalografiilor"}},{"word":"encefalogramă","pos":"noun","definitions":["encephalogram"],"forms":{"plural":"encefalograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encefalogramă","accusative-definite-nominative-singular":"encefalograma","accusative-indefinite-nominative-plural":"encefalograme","accusative-definite-nominative-plural":"encefalogramele","dative-genitive-indefinite-singular":"encefalograme","dative-definite-genitive-singular":"encefalogramei","dative-genitive-indefinite-plural":"encefalograme","dative-definite-genitive-plural":"encefalogramelor","singular-vocative":"encefalogramă","plural-vocative":"encefalogramelor"}},{"word":"encefaloid","pos":"adj","definitions":["encephaloid"],"forms":{"feminine-singular":"encefaloidă","masculine-plural":"encefaloizi","feminine-neuter-plural":"encefaloide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"encefaloid","error-unrecognized-form-feminine-indefinite-singular":"encefaloidă","error-unrecognized-form-indefinite-masculine-plural":"encefaloizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"encefaloide","definite-error-unrecognized-form-masculine-neuter-singular":"encefaloidul","definite-error-unrecognized-form-feminine-singular":"encefaloida","definite-error-unrecognized-form-masculine-plural":"encefaloizii","definite-error-unrecognized-form-feminine-neuter-plural":"encefaloidele"}},{"word":"encefalomalacie","pos":"noun","definitions":["encephalomalacia"],"forms":{"plural":"encefalomalacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"encefalomalacie","accusative-definite-nominative-singular":"encefalomalacia","accusative-indefinite-nominative-plural":"encefalomalacii","accusative-definite-nominative-plural":"encefalomalaciile","dative-genitive-indefinite-singular":"encefalomalacii","dative-definite-genitive-singular":"encefalomalaciei","dative-genitive-indefinite-plural":"encefalomalacii","dative-definite-genitive-plural":"encefalomalaciilor","singular-vocative":"encefalomalacie","plural-vocative":"encefalomalaciilor"}},{"word":"encefalomielită","pos":"noun","definitions":["encephalomyelitis"],"forms":{"plural":"encefalomielite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encefalomielită","accusative-definite-nominative-singular":"encefalomielita","accusative-indefinite-nominative-plural":"encefalomielite","accusative-definite-nominative-plural":"encefalomielitele","dative-genitive-indefinite-singular":"encefalomielite","dative-definite-genitive-singular":"encefalomielitei","dative-genitive-indefinite-plural":"encefalomielite","dative-definite-genitive-plural":"encefalomielitelor","singular-vocative":"encefalomielită","plural-vocative":"encefalomielitelor"}},{"word":"encefalopatie","pos":"noun","definitions":["encephalopathy"],"forms":{"plural":"encefalopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"encefalopatie","accusative-definite-nominative-singular":"encefalopatia","accusative-indefinite-nominative-plural":"encefalopatii","accusative-definite-nominative-plural":"encefalopatiile","dative-genitive-indefinite-singular":"encefalopatii","dative-definite-genitive-singular":"encefalopatiei","dative-genitive-indefinite-plural":"encefalopatii","dative-definite-genitive-plural":"encefalopatiilor","singular-vocative":"encefalopatie","plural-vocative":"encefalopatiilor"}},{"word":"encefaloscop","pos":"noun","definitions":["encephaloscope"],"forms":{"plural":"encefaloscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encefaloscop","accusative-definite-nominative-singular":"encefaloscopul","accusative-indefinite-nominative-plural":"encefaloscoape","accusative-definite-nominative-plural":"encefaloscoapele","dative-genitive-indefinite-singular":"encefaloscop","dative-definite-genitive-singular":"encefaloscopului","dative-genitive-indefinite-plural":"encefaloscoape","dative-definite-genitive-plural":"encefaloscoapelor","singular-vocative":"encefaloscopule","plural-vocative":"encefaloscoapelor"}},{"word":"encefaloză","pos":"noun","definitions":["encephalosis"],"forms":{"plural":"encefaloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encefaloză","accusative-definite-nominative-singular":"encefaloza","accusative-indefinite-nominative-plural":"encefaloze","accusative-definite-nominative-plural":"encefalozele","dative-genitive-indefinite-singular":"encefaloze","dative-definite-genitive-singular":"encefalozei","dative-genitive-indefinite-plural":"encefaloze","dative-definite-genitive-plural":"encefalozelor","singular-vocative":"encefaloză","plural-vocative":"encefalozelor"}},{"word":"Encescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Encescu"}},{"word":"enchiclopedicesc","pos":"adj","definitions":["encyclopedic"],"forms":{"feminine-singular":"enchiclopedicească","plural":"enchiclopedicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enchiclopedicesc","error-unrecognized-form-feminine-indefinite-singular":"enchiclopedicească","error-unrecognized-form-indefinite-masculine-plural":"enchiclopedicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"enchiclopedicești","definite-error-unrecognized-form-masculine-neuter-singular":"enchiclopedicescul","definite-error-unrecognized-form-feminine-singular":"enchiclopediceasca","definite-error-unrecognized-form-masculine-plural":"enchiclopediceștii","definite-error-unrecognized-form-feminine-neuter-plural":"enchiclopediceștile"}},{"word":"enchimoză","pos":"noun","definitions":["enchymosis"],"forms":{"plural":"enchimoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enchimoză","accusative-definite-nominative-singular":"enchimoza","accusative-indefinite-nominative-plural":"enchimoze","accusative-definite-nominative-plural":"enchimozele","dative-genitive-indefinite-singular":"enchimoze","dative-definite-genitive-singular":"enchimozei","dative-genitive-indefinite-plural":"enchimoze","dative-definite-genitive-plural":"enchimozelor","singular-vocative":"enchimoză","plural-vocative":"enchimozelor"}},{"word":"Encică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Encică"}},{"word":"enciclemă","pos":"noun","definitions":["eccyclema"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"enciclemă","accusative-definite-nominative":"enciclema","dative-genitive-indefinite":"encicleme","dative-definite-genitive":"enciclemei","vocative":"enciclemă"}},{"word":"enciclic","pos":"adj","definitions":["encyclical"],"forms":{"feminine-singular":"enciclică","masculine-plural":"enciclici","feminine-neuter-plural":"enciclice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enciclic","error-unrecognized-form-feminine-indefinite-singular":"enciclică","error-unrecognized-form-indefinite-masculine-plural":"enciclici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enciclice","definite-error-unrecognized-form-masculine-neuter-singular":"enciclicul","definite-error-unrecognized-form-feminine-singular":"enciclica","definite-error-unrecognized-form-masculine-plural":"enciclicii","definite-error-unrecognized-form-feminine-neuter-plural":"enciclicele"}},{"word":"enciclic","pos":"noun","definitions":["encyclical"],"forms":{"plural":"enciclici"}},{"word":"enciclică","pos":"noun","definitions":["encyclical"],"forms":{"plural":"enciclice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enciclică","accusative-definite-nominative-singular":"enciclica","accusative-indefinite-nominative-plural":"enciclice","accusative-definite-nominative-plural":"enciclicele","dative-genitive-indefinite-singular":"enciclice","dative-definite-genitive-singular":"enciclicei","dative-genitive-indefinite-plural":"enciclice","dative-definite-genitive-plural":"enciclicelor","singular-vocative":"enciclică","plural-vocative":"enciclicelor"}},{"word":"encicloped","pos":"noun","definitions":["encyclopedist"],"forms":{"plural":"enciclopezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"encicloped","accusative-definite-nominative-singular":"enciclopedul","accusative-indefinite-nominative-plural":"enciclopezi","accusative-definite-nominative-plural":"enciclopezii","dative-genitive-indefinite-singular":"encicloped","dative-definite-genitive-singular":"enciclopedului","dative-genitive-indefinite-plural":"enciclopezi","dative-definite-genitive-plural":"enciclopezilor","singular-vocative":"enciclopedule","plural-vocative":"enciclopezilor"}},{"word":"enciclopedia","pos":"noun","definitions":["definite nominative/accusative feminine singular of enciclopedie"],"pronunciation":"/en.t͡ʃi.klo.peˈdi.ja/","gender":"f","forms":{"alternative":"енчиклопедия"}},{"word":"enciclopedic","pos":"adj","definitions":["encyclopedic"],"forms":{"feminine-singular":"enciclopedică","masculine-plural":"enciclopedici","feminine-neuter-plural":"enciclopedice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enciclopedic","error-unrecognized-form-feminine-indefinite-singular":"enciclopedică","error-unrecognized-form-indefinite-masculine-plural":"enciclopedici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enciclopedice","definite-error-unrecognized-form-masculine-neuter-singular":"enciclopedicul","definite-error-unrecognized-form-feminine-singular":"enciclopedica","definite-error-unrecognized-form-masculine-plural":"enciclopedicii","definite-error-unrecognized-form-feminine-neuter-plural":"enciclopedicele"}},{"word":"enciclopedie","pos":"noun","definitions":["encyclopedia"],"pronunciation":"/en.t͡ʃi.klo.peˈdi.je/","forms":{"plural":"enciclopedii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enciclopedie","accusative-definite-nominative-singular":"enciclopedia","accusative-indefinite-nominative-plural":"enciclopedii","accusative-definite-nominative-plural":"enciclopediile","dative-genitive-indefinite-singular":"enciclopedii","dative-definite-genitive-singular":"enciclopediei","dative-genitive-indefinite-plural":"enciclopedii","dative-definite-genitive-plural":"enciclopediilor","singular-vocative":"enciclopedie","plural-vocative":"enciclopediilor","alternative":"енчиклопедие"}},{"word":"enciclopedie ambulantă","pos":"noun","definitions":["walking encyclopaedia"]},{"word":"enciclopedism","pos":"noun","definitions":["encyclopedism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enciclopedism","accusative-definite-nominative-singular":"enciclopedismul","accusative-indefinite-nominative-plural":"enciclopedisme","accusative-definite-nominative-plural":"enciclopedismele","dative-genitive-indefinite-singular":"enciclopedism","dative-definite-genitive-singular":"enciclopedismului","dative-genitive-indefinite-plural":"enciclopedisme","dative-definite-genitive-plural":"enciclopedismelor","singular-vocative":"enciclopedismule","plural-vocative":"enciclopedismelor"}},{"word":"enciclopedist","pos":"noun","definitions":["encyclopedist"],"forms":{"plural":"enciclopediști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enciclopedist","accusative-definite-nominative-singular":"enciclopedistul","accusative-indefinite-nominative-plural":"enciclopediști","accusative-definite-nominative-plural":"enciclopediștii","dative-genitive-indefinite-singular":"enciclopedist","dative-definite-genitive-singular":"enciclopedistului","dative-genitive-indefinite-plural":"enciclopediști","dative-definite-genitive-plural":"enciclopediștilor","singular-vocative":"enciclopedistule","plural-vocative":"enciclopediștilor"}},{"word":"enciclopedistă","pos":"noun","definitions":["female equivalent of enciclopedist"],"forms":{"plural":"enciclopediste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enciclopedistă","accusative-definite-nominative-singular":"enciclopedista","accusative-indefinite-nominative-plural":"enciclopediste","accusative-definite-nominative-plural":"enciclopedistele","dative-genitive-indefinite-singular":"enciclopediste","dative-definite-genitive-singular":"enciclopedistei","dative-genitive-indefinite-plural":"enciclopediste","dative-definite-genitive-plural":"enciclopedistelor","singular-vocative":"enciclopedistă","plural-vocative":"enciclopedistelor"}},{"word":"Encioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Encioiu"}},{"word":"Enciu","pos":"name","definitions":["a surname","a village in Matei, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Enciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enciulescu"}},{"word":"enclavă","pos":"noun","definitions":["enclave"],"forms":{"plural":"enclave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enclavă","accusative-definite-nominative-singular":"enclava","accusative-indefinite-nominative-plural":"enclave","accusative-definite-nominative-plural":"enclavele","dative-genitive-indefinite-singular":"enclave","dative-definite-genitive-singular":"enclavei","dative-genitive-indefinite-plural":"enclave","dative-definite-genitive-plural":"enclavelor","singular-vocative":"enclavă","plural-vocative":"enclavelor"}},{"word":"enclitic","pos":"adj","definitions":["enclitic"],"forms":{"feminine-singular":"enclitică","masculine-plural":"enclitici","feminine-neuter-plural":"enclitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enclitic","error-unrecognized-form-feminine-indefinite-singular":"enclitică","error-unrecognized-form-indefinite-masculine-plural":"enclitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enclitice","definite-error-unrecognized-form-masculine-neuter-singular":"encliticul","definite-error-unrecognized-form-feminine-singular":"enclitica","definite-error-unrecognized-form-masculine-plural":"encliticii","definite-error-unrecognized-form-feminine-neuter-plural":"encliticele"}},{"word":"encliză","pos":"noun","definitions":["enclise"],"forms":{"plural":"enclize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"encliză","accusative-definite-nominative-singular":"encliza","accusative-indefinite-nominative-plural":"enclize","accusative-definite-nominative-plural":"enclizele","dative-genitive-indefinite-singular":"enclize","dative-definite-genitive-singular":"enclizei","dative-genitive-indefinite-plural":"enclize","dative-definite-genitive-plural":"enclizelor","singular-vocative":"encliză","plural-vocative":"enclizelor"}},{"word":"encomiastic","pos":"adj","definitions":["eulogistic, laudatory"],"forms":{"feminine-singular":"encomiastică","masculine-plural":"encomiastici","feminine-neuter-plural":"encomiastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"encomiastic","error-unrecognized-form-feminine-indefinite-singular":"encomiastică","error-unrecognized-form-indefinite-masculine-plural":"encomiastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"encomiastice","definite-error-unrecognized-form-masculine-neuter-singular":"encomiasticul","definite-error-unrecognized-form-feminine-singular":"encomiastica","definite-error-unrecognized-form-masculine-plural":"encomiasticii","definite-error-unrecognized-form-feminine-neuter-plural":"encomiasticele"}},{"word":"encomiasticesc","pos":"adj","definitions":["eulogistic, laudatory"],"forms":{"feminine-singular":"encomiasticească","plural":"encomiasticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"encomiasticesc","error-unrecognized-form-feminine-indefinite-singular":"encomiasticească","error-unrecognized-form-indefinite-masculine-plural":"encomiasticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"encomiasticești","definite-error-unrecognized-form-masculine-neuter-singular":"encomiasticescul","definite-error-unrecognized-form-feminine-singular":"encomiasticeasca","definite-error-unrecognized-form-masculine-plural":"encomiasticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"encomiasticeștile"}},{"word":"encomion","pos":"noun","definitions":["eulogy"],"forms":{"plural":"encomioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encomion","accusative-definite-nominative-singular":"encomionul","accusative-indefinite-nominative-plural":"encomioane","accusative-definite-nominative-plural":"encomioanele","dative-genitive-indefinite-singular":"encomion","dative-definite-genitive-singular":"encomionului","dative-genitive-indefinite-plural":"encomioane","dative-definite-genitive-plural":"encomioanelor","singular-vocative":"encomionule","plural-vocative":"encomioanelor"}},{"word":"encomiu","pos":"noun","definitions":["alternative form of encomion (“eulogy”)"],"forms":{"plural":"encomii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"encomiu","accusative-definite-nominative-singular":"encomiul","accusative-indefinite-nominative-plural":"encomii","accusative-definite-nominative-plural":"encomiii","dative-genitive-indefinite-singular":"encomiu","dative-definite-genitive-singular":"encomiului","dative-genitive-indefinite-plural":"encomii","dative-definite-genitive-plural":"encomiilor","singular-vocative":"encomiule","plural-vocative":"encomiilor"}},{"word":"encondrom","pos":"noun","definitions":["enchondroma"],"forms":{"plural":"encondroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"encondrom","accusative-definite-nominative-singular":"encondromul","accusative-indefinite-nominative-plural":"encondroame","accusative-definite-nominative-plural":"encondroamele","dative-genitive-indefinite-singular":"encondrom","dative-definite-genitive-singular":"encondromului","dative-genitive-indefinite-plural":"encondroame","dative-definite-genitive-plural":"encondroamelor","singular-vocative":"encondromule","plural-vocative":"encondroamelor"}},{"word":"Enculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enculescu"}},{"word":"Enculești","pos":"name","definitions":["a village in Ștefănești, Argeș County, Romania"],"gender":"m"},{"word":"Encuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Encuțescu"}},{"word":"Encuțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Encuțoiu"}},{"word":"endarterectomie","pos":"noun","definitions":["endarterectomy"],"forms":{"plural":"endarterectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"endarterectomie","accusative-definite-nominative-singular":"endarterectomia","accusative-indefinite-nominative-plural":"endarterectomii","accusative-definite-nominative-plural":"endarterectomiile","dative-genitive-indefinite-singular":"endarterectomii","dative-definite-genitive-singular":"endarterectomiei","dative-genitive-indefinite-plural":"endarterectomii","dative-definite-genitive-plural":"endarterectomiilor","singular-vocative":"endarterectomie","plural-vocative":"endarterectomiilor"}},{"word":"endarterită","pos":"noun","definitions":["endarteritis"],"forms":{"plural":"endarterite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endarterită","accusative-definite-nominative-singular":"endarterita","accusative-indefinite-nominative-plural":"endarterite","accusative-definite-nominative-plural":"endarteritele","dative-genitive-indefinite-singular":"endarterite","dative-definite-genitive-singular":"endarteritei","dative-genitive-indefinite-plural":"endarterite","dative-definite-genitive-plural":"endarteritelor","singular-vocative":"endarterită","plural-vocative":"endarteritelor"}},{"word":"endasea","pos":"noun","definitions":["a unit of measure"],"forms":{"plural":"endasele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"endasea","accusative-definite-nominative-singular":"endaseaua","accusative-indefinite-nominative-plural":"endasele","accusative-definite-nominative-plural":"endaselele","dative-genitive-indefinite-singular":"endasele","dative-definite-genitive-singular":"endaselei","dative-genitive-indefinite-plural":"endasele","dative-definite-genitive-plural":"endaselelor","singular-vocative":"endasea","plural-vocative":"endaselelor"}},{"word":"endecagon","pos":"noun","definitions":["hendecagon"],"forms":{"plural":"endecagoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endecagon","accusative-definite-nominative-singular":"endecagonul","accusative-indefinite-nominative-plural":"endecagoane","accusative-definite-nominative-plural":"endecagoanele","dative-genitive-indefinite-singular":"endecagon","dative-definite-genitive-singular":"endecagonului","dative-genitive-indefinite-plural":"endecagoane","dative-definite-genitive-plural":"endecagoanelor","singular-vocative":"endecagonule","plural-vocative":"endecagoanelor"}},{"word":"Endecarachioi","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Valea Dacilor."],"gender":"m"},{"word":"endecasilab","pos":"noun","definitions":["hendecasyllabic"],"forms":{"plural":"endecasilabi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"endecasilab","accusative-definite-nominative-singular":"endecasilabul","accusative-indefinite-nominative-plural":"endecasilabi","accusative-definite-nominative-plural":"endecasilabii","dative-genitive-indefinite-singular":"endecasilab","dative-definite-genitive-singular":"endecasilabului","dative-genitive-indefinite-plural":"endecasilabi","dative-definite-genitive-plural":"endecasilabilor","singular-vocative":"endecasilabule","plural-vocative":"endecasilabilor"}},{"word":"endecasilabic","pos":"adj","definitions":["hendecasyllabic"],"forms":{"feminine-singular":"endecasilabică","masculine-plural":"endecasilabici","feminine-neuter-plural":"endecasilabice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endecasilabic","error-unrecognized-form-feminine-indefinite-singular":"endecasilabică","error-unrecognized-form-indefinite-masculine-plural":"endecasilabici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endecasilabice","definite-error-unrecognized-form-masculine-neuter-singular":"endecasilabicul","definite-error-unrecognized-form-feminine-singular":"endecasilabica","definite-error-unrecognized-form-masculine-plural":"endecasilabicii","definite-error-unrecognized-form-feminine-neuter-plural":"endecasilabicele"}},{"word":"endemic","pos":"adj","definitions":["endemic"],"forms":{"feminine-singular":"endemică","masculine-plural":"endemici","feminine-neuter-plural":"endemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endemic","error-unrecognized-form-feminine-indefinite-singular":"endemică","error-unrecognized-form-indefinite-masculine-plural":"endemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endemice","definite-error-unrecognized-form-masculine-neuter-singular":"endemicul","definite-error-unrecognized-form-feminine-singular":"endemica","definite-error-unrecognized-form-masculine-plural":"endemicii","definite-error-unrecognized-form-feminine-neuter-plural":"endemicele"}},{"word":"endemicitate","pos":"noun","definitions":["endemicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"endemicitate","accusative-definite-nominative-singular":"endemicitatea","accusative-indefinite-nominative-plural":"endemicități","accusative-definite-nominative-plural":"endemicitățile","dative-genitive-indefinite-singular":"endemicități","dative-definite-genitive-singular":"endemicității","dative-genitive-indefinite-plural":"endemicități","dative-definite-genitive-plural":"endemicităților","singular-vocative":"endemicitate","plural-vocative":"endemicităților"}},{"word":"endemie","pos":"noun","definitions":["endemic"],"forms":{"plural":"endemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"endemie","accusative-definite-nominative-singular":"endemia","accusative-indefinite-nominative-plural":"endemii","accusative-definite-nominative-plural":"endemiile","dative-genitive-indefinite-singular":"endemii","dative-definite-genitive-singular":"endemiei","dative-genitive-indefinite-plural":"endemii","dative-definite-genitive-plural":"endemiilor","singular-vocative":"endemie","plural-vocative":"endemiilor"}},{"word":"endemism","pos":"noun","definitions":["endemism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"endemism","accusative-definite-nominative":"endemismul","dative-genitive-indefinite":"endemism","dative-definite-genitive":"endemismului","vocative":"endemismule"}},{"word":"endemoepidemic","pos":"adj","definitions":["endemoepidemic"],"forms":{"feminine-singular":"endemoepidemică","masculine-plural":"endemoepidemici","feminine-neuter-plural":"endemoepidemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endemoepidemic","error-unrecognized-form-feminine-indefinite-singular":"endemoepidemică","error-unrecognized-form-indefinite-masculine-plural":"endemoepidemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endemoepidemice","definite-error-unrecognized-form-masculine-neuter-singular":"endemoepidemicul","definite-error-unrecognized-form-feminine-singular":"endemoepidemica","definite-error-unrecognized-form-masculine-plural":"endemoepidemicii","definite-error-unrecognized-form-feminine-neuter-plural":"endemoepidemicele"}},{"word":"endoblast","pos":"noun","definitions":["entoblast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"endoblast","accusative-definite-nominative":"endoblastul","dative-genitive-indefinite":"endoblast","dative-definite-genitive":"endoblastului","vocative":"endoblastule"}},{"word":"endoblastic","pos":"adj","definitions":["endoblastic"],"forms":{"feminine-singular":"endoblastică","masculine-plural":"endoblastici","feminine-neuter-plural":"endoblastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoblastic","error-unrecognized-form-feminine-indefinite-singular":"endoblastică","error-unrecognized-form-indefinite-masculine-plural":"endoblastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoblastice","definite-error-unrecognized-form-masculine-neuter-singular":"endoblasticul","definite-error-unrecognized-form-feminine-singular":"endoblastica","definite-error-unrecognized-form-masculine-plural":"endoblasticii","definite-error-unrecognized-form-feminine-neuter-plural":"endoblasticele"}},{"word":"endocard","pos":"noun","definitions":["endocardium"],"forms":{"plural":"endocarduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"endocard","accusative-definite-nominative-singular":"endocardul","accusative-indefinite-nominative-plural":"endocarduri","accusative-definite-nominative-plural":"endocardurile","dative-genitive-indefinite-singular":"endocard","dative-definite-genitive-singular":"endocardului","dative-genitive-indefinite-plural":"endocarduri","dative-definite-genitive-plural":"endocardurilor","singular-vocative":"endocardule","plural-vocative":"endocardurilor"}},{"word":"endocardic","pos":"adj","definitions":["endocarditic"],"forms":{"feminine-singular":"endocardică","masculine-plural":"endocardici","feminine-neuter-plural":"endocardice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocardic","error-unrecognized-form-feminine-indefinite-singular":"endocardică","error-unrecognized-form-indefinite-masculine-plural":"endocardici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocardice","definite-error-unrecognized-form-masculine-neuter-singular":"endocardicul","definite-error-unrecognized-form-feminine-singular":"endocardica","definite-error-unrecognized-form-masculine-plural":"endocardicii","definite-error-unrecognized-form-feminine-neuter-plural":"endocardicele"}},{"word":"endocardită","pos":"noun","definitions":["endocarditis"],"forms":{"plural":"endocardite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endocardită","accusative-definite-nominative-singular":"endocardita","accusative-indefinite-nominative-plural":"endocardite","accusative-definite-nominative-plural":"endocarditele","dative-genitive-indefinite-singular":"endocardite","dative-definite-genitive-singular":"endocarditei","dative-genitive-indefinite-plural":"endocardite","dative-definite-genitive-plural":"endocarditelor","singular-vocative":"endocardită","plural-vocative":"endocarditelor"}},{"word":"endocarp","pos":"noun","definitions":["endocarp"],"forms":{"plural":"endocarpuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"endocarp","accusative-definite-nominative-singular":"endocarpul","accusative-indefinite-nominative-plural":"endocarpuri","accusative-definite-nominative-plural":"endocarpurile","dative-genitive-indefinite-singular":"endocarp","dative-definite-genitive-singular":"endocarpului","dative-genitive-indefinite-plural":"endocarpuri","dative-definite-genitive-plural":"endocarpurilor","singular-vocative":"endocarpule","plural-vocative":"endocarpurilor"}},{"word":"endocervicită","pos":"noun","definitions":["endocervicitis"],"forms":{"plural":"endocervicite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endocervicită","accusative-definite-nominative-singular":"endocervicita","accusative-indefinite-nominative-plural":"endocervicite","accusative-definite-nominative-plural":"endocervicitele","dative-genitive-indefinite-singular":"endocervicite","dative-definite-genitive-singular":"endocervicitei","dative-genitive-indefinite-plural":"endocervicite","dative-definite-genitive-plural":"endocervicitelor","singular-vocative":"endocervicită","plural-vocative":"endocervicitelor"}},{"word":"endocraniu","pos":"noun","definitions":["endocranium"],"forms":{"plural":"endocranii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endocraniu","accusative-definite-nominative-singular":"endocraniul","accusative-indefinite-nominative-plural":"endocranii","accusative-definite-nominative-plural":"endocraniile","dative-genitive-indefinite-singular":"endocraniu","dative-definite-genitive-singular":"endocraniului","dative-genitive-indefinite-plural":"endocranii","dative-definite-genitive-plural":"endocraniilor","singular-vocative":"endocraniule","plural-vocative":"endocraniilor"}},{"word":"endocrin","pos":"adj","definitions":["endocrine"],"forms":{"feminine-singular":"endocrină","masculine-plural":"endocrini","feminine-neuter-plural":"endocrine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocrin","error-unrecognized-form-feminine-indefinite-singular":"endocrină","error-unrecognized-form-indefinite-masculine-plural":"endocrini","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocrine","definite-error-unrecognized-form-masculine-neuter-singular":"endocrinul","definite-error-unrecognized-form-feminine-singular":"endocrina","definite-error-unrecognized-form-masculine-plural":"endocrinii","definite-error-unrecognized-form-feminine-neuter-plural":"endocrinele"}},{"word":"endocrinian","pos":"adj","definitions":["endocrine"],"forms":{"feminine-singular":"endocriniană","masculine-plural":"endocrinieni","feminine-neuter-plural":"endocriniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocrinian","error-unrecognized-form-feminine-indefinite-singular":"endocriniană","error-unrecognized-form-indefinite-masculine-plural":"endocrinieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocriniene","definite-error-unrecognized-form-masculine-neuter-singular":"endocrinianul","definite-error-unrecognized-form-feminine-singular":"endocriniana","definite-error-unrecognized-form-masculine-plural":"endocrinienii","definite-error-unrecognized-form-feminine-neuter-plural":"endocrinienele"}},{"word":"endocrinic","pos":"adj","definitions":["endocrine"],"forms":{"feminine-singular":"endocrinică","masculine-plural":"endocrinici","feminine-neuter-plural":"endocrinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocrinic","error-unrecognized-form-feminine-indefinite-singular":"endocrinică","error-unrecognized-form-indefinite-masculine-plural":"endocrinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocrinice","definite-error-unrecognized-form-masculine-neuter-singular":"endocrinicul","definite-error-unrecognized-form-feminine-singular":"endocrinica","definite-error-unrecognized-form-masculine-plural":"endocrinicii","definite-error-unrecognized-form-feminine-neuter-plural":"endocrinicele"}},{"word":"endocrinolog","pos":"adj","definitions":["endocrinologist"],"forms":{"feminine-singular":"endocrinologă","masculine-plural":"endocrinologi","feminine-neuter-plural":"endocrinologe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocrinolog","error-unrecognized-form-feminine-indefinite-singular":"endocrinologă","error-unrecognized-form-indefinite-masculine-plural":"endocrinologi","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocrinologe","definite-error-unrecognized-form-masculine-neuter-singular":"endocrinologul","definite-error-unrecognized-form-feminine-singular":"endocrinologa","definite-error-unrecognized-form-masculine-plural":"endocrinologii","definite-error-unrecognized-form-feminine-neuter-plural":"endocrinologele"}},{"word":"endocrinologă","pos":"noun","definitions":["female equivalent of endocrinolog"],"forms":{"plural":"endocrinologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endocrinologă","accusative-definite-nominative-singular":"endocrinologa","accusative-indefinite-nominative-plural":"endocrinologe","accusative-definite-nominative-plural":"endocrinologele","dative-genitive-indefinite-singular":"endocrinologe","dative-definite-genitive-singular":"endocrinologei","dative-genitive-indefinite-plural":"endocrinologe","dative-definite-genitive-plural":"endocrinologelor","singular-vocative":"endocrinologă","plural-vocative":"endocrinologelor"}},{"word":"endocrinologic","pos":"adj","definitions":["endocrinological"],"forms":{"feminine-singular":"endocrinologică","masculine-plural":"endocrinologici","feminine-neuter-plural":"endocrinologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endocrinologic","error-unrecognized-form-feminine-indefinite-singular":"endocrinologică","error-unrecognized-form-indefinite-masculine-plural":"endocrinologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endocrinologice","definite-error-unrecognized-form-masculine-neuter-singular":"endocrinologicul","definite-error-unrecognized-form-feminine-singular":"endocrinologica","definite-error-unrecognized-form-masculine-plural":"endocrinologicii","definite-error-unrecognized-form-feminine-neuter-plural":"endocrinologicele"}},{"word":"endocrinologie","pos":"noun","definitions":["endocrinology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"endocrinologie","accusative-definite-nominative":"endocrinologia","dative-genitive-indefinite":"endocrinologii","dative-definite-genitive":"endocrinologiei","vocative":"endocrinologie"}},{"word":"endocrinopatie","pos":"noun","definitions":["endocrinopathy"],"forms":{"plural":"endocrinopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"endocrinopatie","accusative-definite-nominative-singular":"endocrinopatia","accusative-indefinite-nominative-plural":"endocrinopatii","accusative-definite-nominative-plural":"endocrinopatiile","dative-genitive-indefinite-singular":"endocrinopatii","dative-definite-genitive-singular":"endocrinopatiei","dative-genitive-indefinite-plural":"endocrinopatii","dative-definite-genitive-plural":"endocrinopatiilor","singular-vocative":"endocrinopatie","plural-vocative":"endocrinopatiilor"}},{"word":"endocrinoterapie","pos":"noun","definitions":["endocrinotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"endocrinoterapie","accusative-definite-nominative":"endocrinoterapia","dative-genitive-indefinite":"endocrinoterapii","dative-definite-genitive":"endocrinoterapiei","vocative":"endocrinoterapie"}},{"word":"endoderm","pos":"noun","definitions":["endoderm"],"forms":{"plural":"endoderme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endoderm","accusative-definite-nominative-singular":"endodermul","accusative-indefinite-nominative-plural":"endoderme","accusative-definite-nominative-plural":"endodermele","dative-genitive-indefinite-singular":"endoderm","dative-definite-genitive-singular":"endodermului","dative-genitive-indefinite-plural":"endoderme","dative-definite-genitive-plural":"endodermelor","singular-vocative":"endodermule","plural-vocative":"endodermelor"}},{"word":"endodermic","pos":"adj","definitions":["endodermal"],"forms":{"feminine-singular":"endodermică","masculine-plural":"endodermici","feminine-neuter-plural":"endodermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endodermic","error-unrecognized-form-feminine-indefinite-singular":"endodermică","error-unrecognized-form-indefinite-masculine-plural":"endodermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endodermice","definite-error-unrecognized-form-masculine-neuter-singular":"endodermicul","definite-error-unrecognized-form-feminine-singular":"endodermica","definite-error-unrecognized-form-masculine-plural":"endodermicii","definite-error-unrecognized-form-feminine-neuter-plural":"endodermicele"}},{"word":"endoenzimă","pos":"noun","definitions":["endoenzyme"],"forms":{"plural":"endoenzime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endoenzimă","accusative-definite-nominative-singular":"endoenzima","accusative-indefinite-nominative-plural":"endoenzime","accusative-definite-nominative-plural":"endoenzimele","dative-genitive-indefinite-singular":"endoenzime","dative-definite-genitive-singular":"endoenzimei","dative-genitive-indefinite-plural":"endoenzime","dative-definite-genitive-plural":"endoenzimelor","singular-vocative":"endoenzimă","plural-vocative":"endoenzimelor"}},{"word":"endofazie","pos":"noun","definitions":["endophasia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"endofazie","accusative-definite-nominative-singular":"endofazia","accusative-indefinite-nominative-plural":"endofazii","accusative-definite-nominative-plural":"endofaziile","dative-genitive-indefinite-singular":"endofazii","dative-definite-genitive-singular":"endofaziei","dative-genitive-indefinite-plural":"endofazii","dative-definite-genitive-plural":"endofaziilor","singular-vocative":"endofazie","plural-vocative":"endofaziilor"}},{"word":"endofit","pos":"adj","definitions":["endophyte"],"forms":{"feminine-singular":"endofită","masculine-plural":"endofiți","feminine-neuter-plural":"endofite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endofit","error-unrecognized-form-feminine-indefinite-singular":"endofită","error-unrecognized-form-indefinite-masculine-plural":"endofiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"endofite","definite-error-unrecognized-form-masculine-neuter-singular":"endofitul","definite-error-unrecognized-form-feminine-singular":"endofita","definite-error-unrecognized-form-masculine-plural":"endofiții","definite-error-unrecognized-form-feminine-neuter-plural":"endofitele"}},{"word":"endoflebită","pos":"noun","definitions":["endophlebitis"],"forms":{"plural":"endoflebite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endoflebită","accusative-definite-nominative-singular":"endoflebita","accusative-indefinite-nominative-plural":"endoflebite","accusative-definite-nominative-plural":"endoflebitele","dative-genitive-indefinite-singular":"endoflebite","dative-definite-genitive-singular":"endoflebitei","dative-genitive-indefinite-plural":"endoflebite","dative-definite-genitive-plural":"endoflebitelor","singular-vocative":"endoflebită","plural-vocative":"endoflebitelor"}},{"word":"endogam","pos":"adj","definitions":["endogamous (of a marriage, within a social group)"],"forms":{"feminine-singular":"endogamă","masculine-plural":"endogami","feminine-neuter-plural":"endogame","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endogam","error-unrecognized-form-feminine-indefinite-singular":"endogamă","error-unrecognized-form-indefinite-masculine-plural":"endogami","error-unrecognized-form-feminine-indefinite-neuter-plural":"endogame","definite-error-unrecognized-form-masculine-neuter-singular":"endogamul","definite-error-unrecognized-form-feminine-singular":"endogama","definite-error-unrecognized-form-masculine-plural":"endogamii","definite-error-unrecognized-form-feminine-neuter-plural":"endogamele"}},{"word":"endogamie","pos":"noun","definitions":["endogamy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"endogamie","accusative-definite-nominative":"endogamia","dative-genitive-indefinite":"endogamii","dative-definite-genitive":"endogamiei","vocative":"endogamie"}},{"word":"endogen","pos":"adj","definitions":["endogenous"],"forms":{"feminine-singular":"endogenă","masculine-plural":"endogeni","feminine-neuter-plural":"endogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endogen","error-unrecognized-form-feminine-indefinite-singular":"endogenă","error-unrecognized-form-indefinite-masculine-plural":"endogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"endogene","definite-error-unrecognized-form-masculine-neuter-singular":"endogenul","definite-error-unrecognized-form-feminine-singular":"endogena","definite-error-unrecognized-form-masculine-plural":"endogenii","definite-error-unrecognized-form-feminine-neuter-plural":"endogenele"}},{"word":"endogeneză","pos":"noun","definitions":["endogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endogeneză","accusative-definite-nominative-singular":"endogeneza","accusative-indefinite-nominative-plural":"endogeneze","accusative-definite-nominative-plural":"endogenezele","dative-genitive-indefinite-singular":"endogeneze","dative-definite-genitive-singular":"endogenezei","dative-genitive-indefinite-plural":"endogeneze","dative-definite-genitive-plural":"endogenezelor","singular-vocative":"endogeneză","plural-vocative":"endogenezelor"}},{"word":"endolimfă","pos":"noun","definitions":["endolymph"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"endolimfă","accusative-definite-nominative":"endolimfa","dative-genitive-indefinite":"endolimfe","dative-definite-genitive":"endolimfei","vocative":"endolimfă"}},{"word":"endometrial","pos":"adj","definitions":["endometrial"],"forms":{"feminine-singular":"endometrială","masculine-plural":"endometriali","feminine-neuter-plural":"endometriale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endometrial","error-unrecognized-form-feminine-indefinite-singular":"endometrială","error-unrecognized-form-indefinite-masculine-plural":"endometriali","error-unrecognized-form-feminine-indefinite-neuter-plural":"endometriale","definite-error-unrecognized-form-masculine-neuter-singular":"endometrialul","definite-error-unrecognized-form-feminine-singular":"endometriala","definite-error-unrecognized-form-masculine-plural":"endometrialii","definite-error-unrecognized-form-feminine-neuter-plural":"endometrialele"}},{"word":"endometriom","pos":"noun","definitions":["endometrioma"],"forms":{"plural":"endometrioame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endometriom","accusative-definite-nominative-singular":"endometriomul","accusative-indefinite-nominative-plural":"endometrioame","accusative-definite-nominative-plural":"endometrioamele","dative-genitive-indefinite-singular":"endometriom","dative-definite-genitive-singular":"endometriomului","dative-genitive-indefinite-plural":"endometrioame","dative-definite-genitive-plural":"endometrioamelor","singular-vocative":"endometriomule","plural-vocative":"endometrioamelor"}},{"word":"endometrioză","pos":"noun","definitions":["endometriosis"],"forms":{"plural":"endometrioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endometrioză","accusative-definite-nominative-singular":"endometrioza","accusative-indefinite-nominative-plural":"endometrioze","accusative-definite-nominative-plural":"endometriozele","dative-genitive-indefinite-singular":"endometrioze","dative-definite-genitive-singular":"endometriozei","dative-genitive-indefinite-plural":"endometrioze","dative-definite-genitive-plural":"endometriozelor","singular-vocative":"endometrioză","plural-vocative":"endometriozelor"}},{"word":"endometrită","pos":"noun","definitions":["endometritis"],"forms":{"plural":"endometrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endometrită","accusative-definite-nominative-singular":"endometrita","accusative-indefinite-nominative-plural":"endometrite","accusative-definite-nominative-plural":"endometritele","dative-genitive-indefinite-singular":"endometrite","dative-definite-genitive-singular":"endometritei","dative-genitive-indefinite-plural":"endometrite","dative-definite-genitive-plural":"endometritelor","singular-vocative":"endometrită","plural-vocative":"endometritelor"}},{"word":"endometru","pos":"noun","definitions":["endometrium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"endometru","accusative-definite-nominative":"endometrul","dative-genitive-indefinite":"endometru","dative-definite-genitive":"endometrului","vocative":"endometrule"}},{"word":"endomitoză","pos":"noun","definitions":["endomitosis"],"forms":{"plural":"endomitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endomitoză","accusative-definite-nominative-singular":"endomitoza","accusative-indefinite-nominative-plural":"endomitoze","accusative-definite-nominative-plural":"endomitozele","dative-genitive-indefinite-singular":"endomitoze","dative-definite-genitive-singular":"endomitozei","dative-genitive-indefinite-plural":"endomitoze","dative-definite-genitive-plural":"endomitozelor","singular-vocative":"endomitoză","plural-vocative":"endomitozelor"}},{"word":"endomorfism","pos":"noun","definitions":["endomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endomorfism","accusative-definite-nominative-singular":"endomorfismul","accusative-indefinite-nominative-plural":"endomorfisme","accusative-definite-nominative-plural":"endomorfismele","dative-genitive-indefinite-singular":"endomorfism","dative-definite-genitive-singular":"endomorfismului","dative-genitive-indefinite-plural":"endomorfisme","dative-definite-genitive-plural":"endomorfismelor","singular-vocative":"endomorfismule","plural-vocative":"endomorfismelor"}},{"word":"endonazal","pos":"adj","definitions":["endonasal"],"forms":{"feminine-singular":"endonazală","masculine-plural":"endonazali","feminine-neuter-plural":"endonazale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endonazal","error-unrecognized-form-feminine-indefinite-singular":"endonazală","error-unrecognized-form-indefinite-masculine-plural":"endonazali","error-unrecognized-form-feminine-indefinite-neuter-plural":"endonazale","definite-error-unrecognized-form-masculine-neuter-singular":"endonazalul","definite-error-unrecognized-form-feminine-singular":"endonazala","definite-error-unrecognized-form-masculine-plural":"endonazalii","definite-error-unrecognized-form-feminine-neuter-plural":"endonazalele"}},{"word":"endoparazit","pos":"adj","definitions":["endoparasitic"],"forms":{"feminine-singular":"endoparazită","masculine-plural":"endoparaziți","feminine-neuter-plural":"endoparazite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoparazit","error-unrecognized-form-feminine-indefinite-singular":"endoparazită","error-unrecognized-form-indefinite-masculine-plural":"endoparaziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoparazite","definite-error-unrecognized-form-masculine-neuter-singular":"endoparazitul","definite-error-unrecognized-form-feminine-singular":"endoparazita","definite-error-unrecognized-form-masculine-plural":"endoparaziții","definite-error-unrecognized-form-feminine-neuter-plural":"endoparazitele"}},{"word":"endopericardită","pos":"noun","definitions":["endopericarditis"],"forms":{"plural":"endopericardite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endopericardită","accusative-definite-nominative-singular":"endopericardita","accusative-indefinite-nominative-plural":"endopericardite","accusative-definite-nominative-plural":"endopericarditele","dative-genitive-indefinite-singular":"endopericardite","dative-definite-genitive-singular":"endopericarditei","dative-genitive-indefinite-plural":"endopericardite","dative-definite-genitive-plural":"endopericarditelor","singular-vocative":"endopericardită","plural-vocative":"endopericarditelor"}},{"word":"endoplasmă","pos":"noun","definitions":["endoplasm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endoplasmă","accusative-definite-nominative-singular":"endoplasma","accusative-indefinite-nominative-plural":"endoplasme","accusative-definite-nominative-plural":"endoplasmele","dative-genitive-indefinite-singular":"endoplasme","dative-definite-genitive-singular":"endoplasmei","dative-genitive-indefinite-plural":"endoplasme","dative-definite-genitive-plural":"endoplasmelor","singular-vocative":"endoplasmă","plural-vocative":"endoplasmelor"}},{"word":"endoplasmatic","pos":"adj","definitions":["endoplasmic"],"forms":{"feminine-singular":"endoplasmatică","masculine-plural":"endoplasmatici","feminine-neuter-plural":"endoplasmatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoplasmatic","error-unrecognized-form-feminine-indefinite-singular":"endoplasmatică","error-unrecognized-form-indefinite-masculine-plural":"endoplasmatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoplasmatice","definite-error-unrecognized-form-masculine-neuter-singular":"endoplasmaticul","definite-error-unrecognized-form-feminine-singular":"endoplasmatica","definite-error-unrecognized-form-masculine-plural":"endoplasmaticii","definite-error-unrecognized-form-feminine-neuter-plural":"endoplasmaticele"}},{"word":"endoplastă","pos":"noun","definitions":["endoplast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"endoplastă","accusative-definite-nominative":"endoplasta","dative-genitive-indefinite":"endoplaste","dative-definite-genitive":"endoplastei","vocative":"endoplastă"}},{"word":"endoreic","pos":"adj","definitions":["endorheic"],"forms":{"feminine-singular":"endoreică","masculine-plural":"endoreici","feminine-neuter-plural":"endoreice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoreic","error-unrecognized-form-feminine-indefinite-singular":"endoreică","error-unrecognized-form-indefinite-masculine-plural":"endoreici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoreice","definite-error-unrecognized-form-masculine-neuter-singular":"endoreicul","definite-error-unrecognized-form-feminine-singular":"endoreica","definite-error-unrecognized-form-masculine-plural":"endoreicii","definite-error-unrecognized-form-feminine-neuter-plural":"endoreicele"}},{"word":"endosarc","pos":"noun","definitions":["endosarc"],"forms":{"plural":"endosarce","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endosarc","accusative-definite-nominative-singular":"endosarcul","accusative-indefinite-nominative-plural":"endosarce","accusative-definite-nominative-plural":"endosarcele","dative-genitive-indefinite-singular":"endosarc","dative-definite-genitive-singular":"endosarcului","dative-genitive-indefinite-plural":"endosarce","dative-definite-genitive-plural":"endosarcelor","singular-vocative":"endosarcule","plural-vocative":"endosarcelor"}},{"word":"endoschelet","pos":"noun","definitions":["endoskeleton"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"endoschelet","accusative-definite-nominative":"endoscheletul","dative-genitive-indefinite":"endoschelet","dative-definite-genitive":"endoscheletului","vocative":"endoscheletule"}},{"word":"endoscop","pos":"noun","definitions":["endoscope"],"forms":{"plural":"endoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endoscop","accusative-definite-nominative-singular":"endoscopul","accusative-indefinite-nominative-plural":"endoscoape","accusative-definite-nominative-plural":"endoscoapele","dative-genitive-indefinite-singular":"endoscop","dative-definite-genitive-singular":"endoscopului","dative-genitive-indefinite-plural":"endoscoape","dative-definite-genitive-plural":"endoscoapelor","singular-vocative":"endoscopule","plural-vocative":"endoscoapelor"}},{"word":"endoscopic","pos":"adj","definitions":["endoscopic"],"forms":{"feminine-singular":"endoscopică","masculine-plural":"endoscopici","feminine-neuter-plural":"endoscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoscopic","error-unrecognized-form-feminine-indefinite-singular":"endoscopică","error-unrecognized-form-indefinite-masculine-plural":"endoscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoscopice","definite-error-unrecognized-form-masculine-neuter-singular":"endoscopicul","definite-error-unrecognized-form-feminine-singular":"endoscopica","definite-error-unrecognized-form-masculine-plural":"endoscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"endoscopicele"}},{"word":"endoscopie","pos":"noun","definitions":["endoscopy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"endoscopie","accusative-definite-nominative":"endoscopia","dative-genitive-indefinite":"endoscopii","dative-definite-genitive":"endoscopiei","vocative":"endoscopie"}},{"word":"endosmometru","pos":"noun","definitions":["endosmometer"],"forms":{"plural":"endosmometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endosmometru","accusative-definite-nominative-singular":"endosmometruul","accusative-indefinite-nominative-plural":"endosmometre","accusative-definite-nominative-plural":"endosmometrele","dative-genitive-indefinite-singular":"endosmometru","dative-definite-genitive-singular":"endosmometruului","dative-genitive-indefinite-plural":"endosmometre","dative-definite-genitive-plural":"endosmometrelor","singular-vocative":"endosmometruule","plural-vocative":"endosmometrelor"}},{"word":"endosmotic","pos":"adj","definitions":["endosmotic"],"forms":{"feminine-singular":"endosmotică","masculine-plural":"endosmotici","feminine-neuter-plural":"endosmotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endosmotic","error-unrecognized-form-feminine-indefinite-singular":"endosmotică","error-unrecognized-form-indefinite-masculine-plural":"endosmotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endosmotice","definite-error-unrecognized-form-masculine-neuter-singular":"endosmoticul","definite-error-unrecognized-form-feminine-singular":"endosmotica","definite-error-unrecognized-form-masculine-plural":"endosmoticii","definite-error-unrecognized-form-feminine-neuter-plural":"endosmoticele"}},{"word":"endosmoză","pos":"noun","definitions":["endosmosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endosmoză","accusative-definite-nominative-singular":"endosmoza","accusative-indefinite-nominative-plural":"endosmoze","accusative-definite-nominative-plural":"endosmozele","dative-genitive-indefinite-singular":"endosmoze","dative-definite-genitive-singular":"endosmozei","dative-genitive-indefinite-plural":"endosmoze","dative-definite-genitive-plural":"endosmozelor","singular-vocative":"endosmoză","plural-vocative":"endosmozelor"}},{"word":"endosperm","pos":"noun","definitions":["endosperm"],"forms":{"plural":"endosperme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endosperm","accusative-definite-nominative-singular":"endospermul","accusative-indefinite-nominative-plural":"endosperme","accusative-definite-nominative-plural":"endospermele","dative-genitive-indefinite-singular":"endosperm","dative-definite-genitive-singular":"endospermului","dative-genitive-indefinite-plural":"endosperme","dative-definite-genitive-plural":"endospermelor","singular-vocative":"endospermule","plural-vocative":"endospermelor"}},{"word":"endotelial","pos":"adj","definitions":["endothelial"],"forms":{"feminine-singular":"endotelială","masculine-plural":"endoteliali","feminine-neuter-plural":"endoteliale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endotelial","error-unrecognized-form-feminine-indefinite-singular":"endotelială","error-unrecognized-form-indefinite-masculine-plural":"endoteliali","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoteliale","definite-error-unrecognized-form-masculine-neuter-singular":"endotelialul","definite-error-unrecognized-form-feminine-singular":"endoteliala","definite-error-unrecognized-form-masculine-plural":"endotelialii","definite-error-unrecognized-form-feminine-neuter-plural":"endotelialele"}},{"word":"endoteliom","pos":"noun","definitions":["endothelioma"],"forms":{"plural":"endotelioame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endoteliom","accusative-definite-nominative-singular":"endoteliomul","accusative-indefinite-nominative-plural":"endotelioame","accusative-definite-nominative-plural":"endotelioamele","dative-genitive-indefinite-singular":"endoteliom","dative-definite-genitive-singular":"endoteliomului","dative-genitive-indefinite-plural":"endotelioame","dative-definite-genitive-plural":"endotelioamelor","singular-vocative":"endoteliomule","plural-vocative":"endotelioamelor"}},{"word":"endotelită","pos":"noun","definitions":["endothelitis"],"forms":{"plural":"endotelite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endotelită","accusative-definite-nominative-singular":"endotelita","accusative-indefinite-nominative-plural":"endotelite","accusative-definite-nominative-plural":"endotelitele","dative-genitive-indefinite-singular":"endotelite","dative-definite-genitive-singular":"endotelitei","dative-genitive-indefinite-plural":"endotelite","dative-definite-genitive-plural":"endotelitelor","singular-vocative":"endotelită","plural-vocative":"endotelitelor"}},{"word":"endoteliu","pos":"noun","definitions":["endothelium"],"forms":{"plural":"endotelii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"endoteliu","accusative-definite-nominative-singular":"endoteliul","accusative-indefinite-nominative-plural":"endotelii","accusative-definite-nominative-plural":"endoteliile","dative-genitive-indefinite-singular":"endoteliu","dative-definite-genitive-singular":"endoteliului","dative-genitive-indefinite-plural":"endotelii","dative-definite-genitive-plural":"endoteliilor","singular-vocative":"endoteliule","plural-vocative":"endoteliilor"}},{"word":"endoterm","pos":"adj","definitions":["endothermic"],"forms":{"feminine-singular":"endotermă","masculine-plural":"endotermi","feminine-neuter-plural":"endoterme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endoterm","error-unrecognized-form-feminine-indefinite-singular":"endotermă","error-unrecognized-form-indefinite-masculine-plural":"endotermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"endoterme","definite-error-unrecognized-form-masculine-neuter-singular":"endotermul","definite-error-unrecognized-form-feminine-singular":"endoterma","definite-error-unrecognized-form-masculine-plural":"endotermii","definite-error-unrecognized-form-feminine-neuter-plural":"endotermele"}},{"word":"endotermic","pos":"adj","definitions":["endothermic"],"forms":{"feminine-singular":"endotermică","masculine-plural":"endotermici","feminine-neuter-plural":"endotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"endotermic","error-unrecognized-form-feminine-indefinite-singular":"endotermică","error-unrecognized-form-indefinite-masculine-plural":"endotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"endotermice","definite-error-unrecognized-form-masculine-neuter-singular":"endotermicul","definite-error-unrecognized-form-feminine-singular":"endotermica","definite-error-unrecognized-form-masculine-plural":"endotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"endotermicele"}},{"word":"endotermie","pos":"noun","definitions":["endothermia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"endotermie","accusative-definite-nominative":"endotermia","dative-genitive-indefinite":"endotermii","dative-definite-genitive":"endotermiei","vocative":"endotermie"}},{"word":"endotoxină","pos":"noun","definitions":["endotoxin"],"forms":{"plural":"endotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"endotoxină","accusative-definite-nominative-singular":"endotoxina","accusative-indefinite-nominative-plural":"endotoxine","accusative-definite-nominative-plural":"endotoxinele","dative-genitive-indefinite-singular":"endotoxine","dative-definite-genitive-singular":"endotoxinei","dative-genitive-indefinite-plural":"endotoxine","dative-definite-genitive-plural":"endotoxinelor","singular-vocative":"endotoxină","plural-vocative":"endotoxinelor"}},{"word":"Ene","pos":"name","definitions":["a surname"]},{"word":"eneadă","pos":"noun","definitions":["ennead"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"eneadă","accusative-definite-nominative":"eneada","dative-genitive-indefinite":"eneade","dative-definite-genitive":"eneadei","vocative":"eneadă"}},{"word":"eneagon","pos":"noun","definitions":["enneagon"],"forms":{"plural":"eneagoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eneagon","accusative-definite-nominative-singular":"eneagonul","accusative-indefinite-nominative-plural":"eneagoane","accusative-definite-nominative-plural":"eneagoanele","dative-genitive-indefinite-singular":"eneagon","dative-definite-genitive-singular":"eneagonului","dative-genitive-indefinite-plural":"eneagoane","dative-definite-genitive-plural":"eneagoanelor","singular-vocative":"eneagonule","plural-vocative":"eneagoanelor"}},{"word":"eneagonal","pos":"adj","definitions":["enneagonal"],"forms":{"feminine-singular":"eneagonală","masculine-plural":"eneagonali","feminine-neuter-plural":"eneagonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eneagonal","error-unrecognized-form-feminine-indefinite-singular":"eneagonală","error-unrecognized-form-indefinite-masculine-plural":"eneagonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"eneagonale","definite-error-unrecognized-form-masculine-neuter-singular":"eneagonalul","definite-error-unrecognized-form-feminine-singular":"eneagonala","definite-error-unrecognized-form-masculine-plural":"eneagonalii","definite-error-unrecognized-form-feminine-neuter-plural":"eneagonalele"}},{"word":"Enechescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enechescu"}},{"word":"eneolitic","pos":"noun","definitions":["Eneolithic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eneolitic","accusative-definite-nominative":"eneoliticul","dative-genitive-indefinite":"eneolitic","dative-definite-genitive":"eneoliticului","vocative":"eneoliticule"}},{"word":"energetic","pos":"adj","definitions":["energetic (relating to energy)"],"pronunciation":"/e.nerˈd͡ʒe.tik/","forms":{"feminine-singular":"energetică","masculine-plural":"energetici","feminine-neuter-plural":"energetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energetic","error-unrecognized-form-feminine-indefinite-singular":"energetică","error-unrecognized-form-indefinite-masculine-plural":"energetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"energetice","definite-error-unrecognized-form-masculine-neuter-singular":"energeticul","definite-error-unrecognized-form-feminine-singular":"energetica","definite-error-unrecognized-form-masculine-plural":"energeticii","definite-error-unrecognized-form-feminine-neuter-plural":"energeticele","alternative":"енерӂетик"}},{"word":"energetică","pos":"noun","definitions":["energetics"],"forms":{"plural":"energetici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"energetică","accusative-definite-nominative-singular":"energetica","accusative-indefinite-nominative-plural":"energetici","accusative-definite-nominative-plural":"energeticile","dative-genitive-indefinite-singular":"energetici","dative-definite-genitive-singular":"energeticii","dative-genitive-indefinite-plural":"energetici","dative-definite-genitive-plural":"energeticilor","singular-vocative":"energetică","plural-vocative":"energeticilor"}},{"word":"energetician","pos":"noun","definitions":["energy sector worker"],"forms":{"plural":"energeticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"energetician","accusative-definite-nominative-singular":"energeticianul","accusative-indefinite-nominative-plural":"energeticieni","accusative-definite-nominative-plural":"energeticienii","dative-genitive-indefinite-singular":"energetician","dative-definite-genitive-singular":"energeticianului","dative-genitive-indefinite-plural":"energeticieni","dative-definite-genitive-plural":"energeticienilor","singular-vocative":"energeticianule","plural-vocative":"energeticienilor"}},{"word":"energetist","pos":"noun","definitions":["energeticist"],"forms":{"plural":"energetiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"energetist","accusative-definite-nominative-singular":"energetistul","accusative-indefinite-nominative-plural":"energetiști","accusative-definite-nominative-plural":"energetiștii","dative-genitive-indefinite-singular":"energetist","dative-definite-genitive-singular":"energetistului","dative-genitive-indefinite-plural":"energetiști","dative-definite-genitive-plural":"energetiștilor","singular-vocative":"energetistule","plural-vocative":"energetiștilor"}},{"word":"energetistă","pos":"noun","definitions":["female equivalent of energetist"],"forms":{"plural":"energetiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"energetistă","accusative-definite-nominative-singular":"energetista","accusative-indefinite-nominative-plural":"energetiste","accusative-definite-nominative-plural":"energetistele","dative-genitive-indefinite-singular":"energetiste","dative-definite-genitive-singular":"energetistei","dative-genitive-indefinite-plural":"energetiste","dative-definite-genitive-plural":"energetistelor","singular-vocative":"energetistă","plural-vocative":"energetistelor"}},{"word":"energhicos","pos":"adj","definitions":["energetic"],"forms":{"feminine-singular":"energhicoasă","masculine-plural":"energhicoși","feminine-neuter-plural":"energhicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energhicos","error-unrecognized-form-feminine-indefinite-singular":"energhicoasă","error-unrecognized-form-indefinite-masculine-plural":"energhicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"energhicoase","definite-error-unrecognized-form-masculine-neuter-singular":"energhicosul","definite-error-unrecognized-form-feminine-singular":"energhicoasa","definite-error-unrecognized-form-masculine-plural":"energhicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"energhicoasele"}},{"word":"energhisi","pos":"verb","definitions":["to act"],"forms":{"canonical":"a energhisi 4th conjugation","present-singular-third-person":"energhisie","participle-past":"energhisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a energhisi","gerund":"energhisind","first-person-indicative-present-singular":"energhis","indicative-present-second-person-singular":"energhiși","indicative-present-singular-third-person":"energhise","first-person-indicative-plural-present":"energhisim","indicative-plural-present-second-person":"energhisiți","indicative-plural-present-third-person":"energhis","first-person-imperfect-indicative-singular":"energhiseam","imperfect-indicative-second-person-singular":"energhiseai","imperfect-indicative-singular-third-person":"energhisea","first-person-imperfect-indicative-plural":"energhiseam","imperfect-indicative-plural-second-person":"energhiseați","imperfect-indicative-plural-third-person":"energhiseau","first-person-indicative-perfect-singular":"energhisii","indicative-perfect-second-person-singular":"energhisiși","indicative-perfect-singular-third-person":"energhisi","first-person-indicative-perfect-plural":"energhisirăm","indicative-perfect-plural-second-person":"energhisirăți","indicative-perfect-plural-third-person":"energhisiră","first-person-indicative-pluperfect-singular":"energhisisem","indicative-pluperfect-second-person-singular":"energhisiseși","indicative-pluperfect-singular-third-person":"energhisise","first-person-indicative-pluperfect-plural":"energhisiserăm","indicative-pluperfect-plural-second-person":"energhisiserăți","indicative-pluperfect-plural-third-person":"energhisiseră","first-person-present-singular-subjunctive":"să energhis","present-second-person-singular-subjunctive":"să energhiși","present-singular-subjunctive-third-person":"să energhisă","first-person-plural-present-subjunctive":"să energhisim","plural-present-second-person-subjunctive":"să energhisiți","plural-present-subjunctive-third-person":"să energhisă","imperative-second-person-singular":"energhise","imperative-plural-second-person":"energhisiți","imperative-negative-second-person-singular":"nu energhisi","imperative-negative-plural-second-person":"nu energhisiți"}},{"word":"energic","pos":"adj","definitions":["energetic, energic (full of energy)"],"pronunciation":"/eˈner.d͡ʒik/","forms":{"feminine-singular":"energică","masculine-plural":"energici","feminine-neuter-plural":"energice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energic","error-unrecognized-form-feminine-indefinite-singular":"energică","error-unrecognized-form-indefinite-masculine-plural":"energici","error-unrecognized-form-feminine-indefinite-neuter-plural":"energice","definite-error-unrecognized-form-masculine-neuter-singular":"energicul","definite-error-unrecognized-form-feminine-singular":"energica","definite-error-unrecognized-form-masculine-plural":"energicii","definite-error-unrecognized-form-feminine-neuter-plural":"energicele"}},{"word":"energicește","pos":"adv","definitions":["energetically"]},{"word":"energie","pos":"noun","definitions":["energy (impetus behind activity)"],"forms":{"plural":"energii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"energie","accusative-definite-nominative-singular":"energia","accusative-indefinite-nominative-plural":"energii","accusative-definite-nominative-plural":"energiile","dative-genitive-indefinite-singular":"energii","dative-definite-genitive-singular":"energiei","dative-genitive-indefinite-plural":"energii","dative-definite-genitive-plural":"energiilor","singular-vocative":"energie","plural-vocative":"energiilor","alternative":"energhie"}},{"word":"energie atomică","pos":"noun","definitions":["atomic energy"]},{"word":"energie cinetică","pos":"noun","definitions":["kinetic energy"],"forms":{"plural":"energii cinetice"}},{"word":"energie de abur","pos":"noun","definitions":["steam power"]},{"word":"energie de legătură","pos":"noun","definitions":["binding energy"]},{"word":"energie electrică","pos":"noun","definitions":["electricity"]},{"word":"energie nucleară","pos":"noun","definitions":["nuclear energy"],"forms":{"plural":"energii nucleare"}},{"word":"energie potențială","pos":"noun","definitions":["potential energy"]},{"word":"energie regenerabilă","pos":"noun","definitions":["renewable energy"],"forms":{"plural":"energii regenerabile"}},{"word":"energios","pos":"adj","definitions":["energetic"],"forms":{"feminine-singular":"energioasă","masculine-plural":"energioși","feminine-neuter-plural":"energioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energios","error-unrecognized-form-feminine-indefinite-singular":"energioasă","error-unrecognized-form-indefinite-masculine-plural":"energioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"energioase","definite-error-unrecognized-form-masculine-neuter-singular":"energiosul","definite-error-unrecognized-form-feminine-singular":"energioasa","definite-error-unrecognized-form-masculine-plural":"energioșii","definite-error-unrecognized-form-feminine-neuter-plural":"energioasele"}},{"word":"energizant","pos":"adj","definitions":["energizing"],"forms":{"feminine-singular":"energizantă","masculine-plural":"energizanți","feminine-neuter-plural":"energizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energizant","error-unrecognized-form-feminine-indefinite-singular":"energizantă","error-unrecognized-form-indefinite-masculine-plural":"energizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"energizante","definite-error-unrecognized-form-masculine-neuter-singular":"energizantul","definite-error-unrecognized-form-feminine-singular":"energizanta","definite-error-unrecognized-form-masculine-plural":"energizanții","definite-error-unrecognized-form-feminine-neuter-plural":"energizantele"}},{"word":"energofag","pos":"adj","definitions":["large energy consumer (about a factory)"],"forms":{"feminine-singular":"energofagă","masculine-plural":"energofagi","feminine-neuter-plural":"energofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"energofag","error-unrecognized-form-feminine-indefinite-singular":"energofagă","error-unrecognized-form-indefinite-masculine-plural":"energofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"energofage","definite-error-unrecognized-form-masculine-neuter-singular":"energofagul","definite-error-unrecognized-form-feminine-singular":"energofaga","definite-error-unrecognized-form-masculine-plural":"energofagii","definite-error-unrecognized-form-feminine-neuter-plural":"energofagele"}},{"word":"energometru","pos":"noun","definitions":["energy meter"],"forms":{"plural":"energometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"energometru","accusative-definite-nominative-singular":"energometrul","accusative-indefinite-nominative-plural":"energometre","accusative-definite-nominative-plural":"energometrele","dative-genitive-indefinite-singular":"energometru","dative-definite-genitive-singular":"energometrului","dative-genitive-indefinite-plural":"energometre","dative-definite-genitive-plural":"energometrelor","singular-vocative":"energometrule","plural-vocative":"energometrelor"}},{"word":"energumen","pos":"noun","definitions":["energumen"],"forms":{"plural":"energumeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"energumen","accusative-definite-nominative-singular":"energumenul","accusative-indefinite-nominative-plural":"energumeni","accusative-definite-nominative-plural":"energumenii","dative-genitive-indefinite-singular":"energumen","dative-definite-genitive-singular":"energumenului","dative-genitive-indefinite-plural":"energumeni","dative-definite-genitive-plural":"energumenilor","singular-vocative":"energumenule","plural-vocative":"energumenilor"}},{"word":"enerva","pos":"verb","definitions":["to vex, to annoy, to irritate","to become angry,"],"examples":[{"ro":"Tipul ăsta mă enervează.","en":"This guy annoys me."}],"forms":{"canonical":"a enerva 1st conjugation","present-singular-third-person":"enervează","participle-past":"enervat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a enerva","gerund":"enervând","first-person-indicative-present-singular":"enervez","indicative-present-second-person-singular":"enervezi","indicative-present-singular-third-person":"enervează","first-person-indicative-plural-present":"enervăm","indicative-plural-present-second-person":"enervați","indicative-plural-present-third-person":"enervează","first-person-imperfect-indicative-singular":"enervam","imperfect-indicative-second-person-singular":"enervai","imperfect-indicative-singular-third-person":"enerva","first-person-imperfect-indicative-plural":"enervam","imperfect-indicative-plural-second-person":"enervați","imperfect-indicative-plural-third-person":"enervau","first-person-indicative-perfect-singular":"enervai","indicative-perfect-second-person-singular":"enervași","indicative-perfect-singular-third-person":"enervă","first-person-indicative-perfect-plural":"enervarăm","indicative-perfect-plural-second-person":"enervarăți","indicative-perfect-plural-third-person":"enervară","first-person-indicative-pluperfect-singular":"enervasem","indicative-pluperfect-second-person-singular":"enervaseși","indicative-pluperfect-singular-third-person":"enervase","first-person-indicative-pluperfect-plural":"enervaserăm","indicative-pluperfect-plural-second-person":"enervaserăți","indicative-pluperfect-plural-third-person":"enervaseră","first-person-present-singular-subjunctive":"să enervez","present-second-person-singular-subjunctive":"să enervezi","present-singular-subjunctive-third-person":"să enerveze","first-person-plural-present-subjunctive":"să enervăm","plural-present-second-person-subjunctive":"să enervați","plural-present-subjunctive-third-person":"să enerveze","imperative-second-person-singular":"enervează","imperative-plural-second-person":"enervați","imperative-negative-second-person-singular":"nu enerva","imperative-negative-plural-second-person":"nu enervați"}},{"word":"enervai","pos":"verb","definitions":["inflection of enerva:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[enerˈvaj]"},{"word":"enervam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of enerva"],"pronunciation":"[enerˈvam]"},{"word":"enervant","pos":"adj","definitions":["annoying"],"forms":{"feminine-singular":"enervantă","masculine-plural":"enervanți","feminine-neuter-plural":"enervante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enervant","error-unrecognized-form-feminine-indefinite-singular":"enervantă","error-unrecognized-form-indefinite-masculine-plural":"enervanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"enervante","definite-error-unrecognized-form-masculine-neuter-singular":"enervantul","definite-error-unrecognized-form-feminine-singular":"enervanta","definite-error-unrecognized-form-masculine-plural":"enervanții","definite-error-unrecognized-form-feminine-neuter-plural":"enervantele"}},{"word":"enervare","pos":"noun","definitions":["annoyance (the psychological state of being annoyed or irritated)"],"forms":{"plural":"enervări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enervare","accusative-definite-nominative-singular":"enervarea","accusative-indefinite-nominative-plural":"enervări","accusative-definite-nominative-plural":"enervările","dative-genitive-indefinite-singular":"enervări","dative-definite-genitive-singular":"enervării","dative-genitive-indefinite-plural":"enervări","dative-definite-genitive-plural":"enervărilor","singular-vocative":"enervare","plural-vocative":"enervărilor"}},{"word":"enervase","pos":"verb","definitions":["third-person singular pluperfect indicative of enerva"],"pronunciation":"[enerˈvase]"},{"word":"enervat","pos":"adj","definitions":["annoyed, angry"],"pronunciation":"[enerˈvat]","forms":{"feminine-singular":"enervată","masculine-plural":"enervați","feminine-neuter-plural":"enervate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enervat","error-unrecognized-form-feminine-indefinite-singular":"enervată","error-unrecognized-form-indefinite-masculine-plural":"enervați","error-unrecognized-form-feminine-indefinite-neuter-plural":"enervate","definite-error-unrecognized-form-masculine-neuter-singular":"enervatul","definite-error-unrecognized-form-feminine-singular":"enervata","definite-error-unrecognized-form-masculine-plural":"enervații","definite-error-unrecognized-form-feminine-neuter-plural":"enervatele"}},{"word":"enervat","pos":"verb","definitions":["past participle of enerva"],"pronunciation":"[enerˈvat]","forms":{"participle-past":"of enerva"}},{"word":"enervez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of enerva"],"pronunciation":"[enerˈvez]"},{"word":"Enescu","pos":"name","definitions":["a surname"]},{"word":"enfaz","pos":"noun","definitions":["obsolete form of emfază"],"forms":{"plural":"enfaze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enfaz","accusative-definite-nominative-singular":"enfazul","accusative-indefinite-nominative-plural":"enfaze","accusative-definite-nominative-plural":"enfazele","dative-genitive-indefinite-singular":"enfaz","dative-definite-genitive-singular":"enfazului","dative-genitive-indefinite-plural":"enfaze","dative-definite-genitive-plural":"enfazelor","singular-vocative":"enfazule","plural-vocative":"enfazelor"}},{"word":"enfeu","pos":"noun","definitions":["funereal recess"],"forms":{"plural":"enfeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enfeu","accusative-definite-nominative-singular":"enfeuul","accusative-indefinite-nominative-plural":"enfeuri","accusative-definite-nominative-plural":"enfeurile","dative-genitive-indefinite-singular":"enfeu","dative-definite-genitive-singular":"enfeuului","dative-genitive-indefinite-plural":"enfeuri","dative-definite-genitive-plural":"enfeurilor","singular-vocative":"enfeuule","plural-vocative":"enfeurilor"}},{"word":"engastrimit","pos":"noun","definitions":["ventriloquist"],"forms":{"plural":"engastrimiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"engastrimit","accusative-definite-nominative-singular":"engastrimitul","accusative-indefinite-nominative-plural":"engastrimiți","accusative-definite-nominative-plural":"engastrimiții","dative-genitive-indefinite-singular":"engastrimit","dative-definite-genitive-singular":"engastrimitului","dative-genitive-indefinite-plural":"engastrimiți","dative-definite-genitive-plural":"engastrimiților","singular-vocative":"engastrimitule","plural-vocative":"engastrimiților"}},{"word":"Enghe-Mahale","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Mereni."],"gender":"m"},{"word":"Enghez","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as General Scărișoreanu."],"gender":"m"},{"word":"enghiureșal","pos":"noun","definitions":["angora shawl"],"forms":{"plural":"enghiureșali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enghiureșal","accusative-definite-nominative-singular":"enghiureșalul","accusative-indefinite-nominative-plural":"enghiureșali","accusative-definite-nominative-plural":"enghiureșalii","dative-genitive-indefinite-singular":"enghiureșal","dative-definite-genitive-singular":"enghiureșalului","dative-genitive-indefinite-plural":"enghiureșali","dative-definite-genitive-plural":"enghiureșalilor","singular-vocative":"enghiureșalule","plural-vocative":"enghiureșalilor"}},{"word":"engineering","pos":"noun","definitions":["engineering"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"engineering","accusative-definite-nominative":"engineeringul","dative-genitive-indefinite":"engineering","dative-definite-genitive":"engineeringului","vocative":"engineeringule"}},{"word":"engl.","pos":"noun","definitions":["abbreviation of engleză (“English”)"]},{"word":"englez","pos":"adj","definitions":["English"],"pronunciation":"/eŋˈɡlez/","forms":{"feminine-singular":"engleză","masculine-plural":"englezi","feminine-neuter-plural":"engleze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"englez","error-unrecognized-form-feminine-indefinite-singular":"engleză","error-unrecognized-form-indefinite-masculine-plural":"englezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"engleze","definite-error-unrecognized-form-masculine-neuter-singular":"englezul","definite-error-unrecognized-form-feminine-singular":"engleza","definite-error-unrecognized-form-masculine-plural":"englezii","definite-error-unrecognized-form-feminine-neuter-plural":"englezele"}},{"word":"englez","pos":"noun","definitions":["an English man; Englishman"],"pronunciation":"/eŋˈɡlez/","forms":{"plural":"englezi","feminine":"equivalent engleză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"englez","accusative-definite-nominative-singular":"englezul","accusative-indefinite-nominative-plural":"englezi","accusative-definite-nominative-plural":"englezii","dative-genitive-indefinite-singular":"englez","dative-definite-genitive-singular":"englezului","dative-genitive-indefinite-plural":"englezi","dative-definite-genitive-plural":"englezilor","singular-vocative":"englezule","plural-vocative":"englezilor"}},{"word":"engleză","pos":"noun","definitions":["English (language)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"engleză","accusative-definite-nominative":"engleza","dative-genitive-indefinite":"engleze","dative-definite-genitive":"englezei","vocative":"engleză"}},{"word":"engleză americană","pos":"noun","definitions":["American English"]},{"word":"engleză australiană","pos":"noun","definitions":["Australian English"]},{"word":"engleză veche","pos":"noun","definitions":["Old English"]},{"word":"engleze","pos":"adj","definitions":["feminine/neuter plural of englez"],"pronunciation":"/eŋˈɡleze/","gender":"f-p"},{"word":"englezesc","pos":"adj","definitions":["English","Englishly"],"forms":{"feminine-singular":"englezească","plural":"englezești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"englezesc","error-unrecognized-form-feminine-indefinite-singular":"englezească","error-unrecognized-form-indefinite-masculine-plural":"englezești","error-unrecognized-form-feminine-indefinite-neuter-plural":"englezești","definite-error-unrecognized-form-masculine-neuter-singular":"englezescul","definite-error-unrecognized-form-feminine-singular":"englezeasca","definite-error-unrecognized-form-masculine-plural":"englezeștii","definite-error-unrecognized-form-feminine-neuter-plural":"englezeștile"}},{"word":"englezește","pos":"adv","definitions":["English","like an Englishman"],"examples":[{"ro":"înțelegeți englezește?","en":"Do you understand English?"},{"ro":"vorbesc puțin englezește.","en":"I speak a little English."}]},{"word":"englezești","pos":"adj","definitions":["masculine plural of englezesc"],"pronunciation":"/ˌeŋɡleˈzeʃtʲ/","gender":"m-p"},{"word":"englezi","pos":"verb","definitions":["to Englishify"],"forms":{"canonical":"a englezi 4th conjugation","present-singular-third-person":"englezește","participle-past":"englezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a englezi","gerund":"englezind","first-person-indicative-present-singular":"englezesc","indicative-present-second-person-singular":"englezești","indicative-present-singular-third-person":"englezește","first-person-indicative-plural-present":"englezim","indicative-plural-present-second-person":"engleziți","indicative-plural-present-third-person":"englezesc","first-person-imperfect-indicative-singular":"englezeam","imperfect-indicative-second-person-singular":"englezeai","imperfect-indicative-singular-third-person":"englezea","first-person-imperfect-indicative-plural":"englezeam","imperfect-indicative-plural-second-person":"englezeați","imperfect-indicative-plural-third-person":"englezeau","first-person-indicative-perfect-singular":"englezii","indicative-perfect-second-person-singular":"engleziși","indicative-perfect-singular-third-person":"englezi","first-person-indicative-perfect-plural":"englezirăm","indicative-perfect-plural-second-person":"englezirăți","indicative-perfect-plural-third-person":"engleziră","first-person-indicative-pluperfect-singular":"englezisem","indicative-pluperfect-second-person-singular":"engleziseși","indicative-pluperfect-singular-third-person":"englezise","first-person-indicative-pluperfect-plural":"engleziserăm","indicative-pluperfect-plural-second-person":"engleziserăți","indicative-pluperfect-plural-third-person":"engleziseră","first-person-present-singular-subjunctive":"să englezesc","present-second-person-singular-subjunctive":"să englezești","present-singular-subjunctive-third-person":"să englezească","first-person-plural-present-subjunctive":"să englezim","plural-present-second-person-subjunctive":"să engleziți","plural-present-subjunctive-third-person":"să englezească","imperative-second-person-singular":"englezește","imperative-plural-second-person":"engleziți","imperative-negative-second-person-singular":"nu englezi","imperative-negative-plural-second-person":"nu engleziți"}},{"word":"englezism","pos":"noun","definitions":["Englishism"],"forms":{"plural":"englezisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"englezism","accusative-definite-nominative-singular":"englezismul","accusative-indefinite-nominative-plural":"englezisme","accusative-definite-nominative-plural":"englezismele","dative-genitive-indefinite-singular":"englezism","dative-definite-genitive-singular":"englezismului","dative-genitive-indefinite-plural":"englezisme","dative-definite-genitive-plural":"englezismelor","singular-vocative":"englezismule","plural-vocative":"englezismelor"}},{"word":"englezit","pos":"adj","definitions":["Englishified"],"forms":{"feminine-singular":"englezită","masculine-plural":"engleziți","feminine-neuter-plural":"englezite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"englezit","error-unrecognized-form-feminine-indefinite-singular":"englezită","error-unrecognized-form-indefinite-masculine-plural":"engleziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"englezite","definite-error-unrecognized-form-masculine-neuter-singular":"englezitul","definite-error-unrecognized-form-feminine-singular":"englezita","definite-error-unrecognized-form-masculine-plural":"engleziții","definite-error-unrecognized-form-feminine-neuter-plural":"englezitele"}},{"word":"englezit","pos":"verb","definitions":["past participle of englezi"],"forms":{"participle-past":"of englezi"}},{"word":"englezoaică","pos":"noun","definitions":["female equivalent of englez"],"forms":{"plural":"englezoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"englezoaică","accusative-definite-nominative-singular":"englezoaica","accusative-indefinite-nominative-plural":"englezoaice","accusative-definite-nominative-plural":"englezoaicele","dative-genitive-indefinite-singular":"englezoaice","dative-definite-genitive-singular":"englezoaicei","dative-genitive-indefinite-plural":"englezoaice","dative-definite-genitive-plural":"englezoaicelor","singular-vocative":"englezoaică","plural-vocative":"englezoaicelor"}},{"word":"Englezu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Englezu"}},{"word":"Englitera","pos":"name","definitions":["England"]},{"word":"englizește","pos":"adv","definitions":["obsolete form of englezește"]},{"word":"engobă","pos":"noun","definitions":["engobe"],"forms":{"plural":"engobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"engobă","accusative-definite-nominative-singular":"engoba","accusative-indefinite-nominative-plural":"engobe","accusative-definite-nominative-plural":"engobele","dative-genitive-indefinite-singular":"engobe","dative-definite-genitive-singular":"engobei","dative-genitive-indefinite-plural":"engobe","dative-definite-genitive-plural":"engobelor","singular-vocative":"engobă","plural-vocative":"engobelor"}},{"word":"engolpion","pos":"noun","definitions":["encolpium"],"forms":{"plural":"engolpioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"engolpion","accusative-definite-nominative-singular":"engolpionul","accusative-indefinite-nominative-plural":"engolpioane","accusative-definite-nominative-plural":"engolpioanele","dative-genitive-indefinite-singular":"engolpion","dative-definite-genitive-singular":"engolpionului","dative-genitive-indefinite-plural":"engolpioane","dative-definite-genitive-plural":"engolpioanelor","singular-vocative":"engolpionule","plural-vocative":"engolpioanelor"}},{"word":"engramă","pos":"noun","definitions":["engram"],"forms":{"plural":"engrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"engramă","accusative-definite-nominative-singular":"engrama","accusative-indefinite-nominative-plural":"engrame","accusative-definite-nominative-plural":"engramele","dative-genitive-indefinite-singular":"engrame","dative-definite-genitive-singular":"engramei","dative-genitive-indefinite-plural":"engrame","dative-definite-genitive-plural":"engramelor","singular-vocative":"engramă","plural-vocative":"engramelor"}},{"word":"enhiridiu","pos":"noun","definitions":["handbook"],"forms":{"plural":"enhiridie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enhiridiu","accusative-definite-nominative-singular":"enhiridiuul","accusative-indefinite-nominative-plural":"enhiridie","accusative-definite-nominative-plural":"enhiridiele","dative-genitive-indefinite-singular":"enhiridiu","dative-definite-genitive-singular":"enhiridiuului","dative-genitive-indefinite-plural":"enhiridie","dative-definite-genitive-plural":"enhiridielor","singular-vocative":"enhiridiuule","plural-vocative":"enhiridielor"}},{"word":"Enică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enică"}},{"word":"Enichioi","pos":"name","definitions":["a village in Enichioi, Cantemir Raion, Moldova","a commune of Cantemir Raion, Moldova"],"gender":"m"},{"word":"Enigea","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Deleni."],"gender":"m"},{"word":"enigma","pos":"noun","definitions":["definite nominative/accusative singular of enigmă"],"pronunciation":"[eˈniɡma]","gender":"f"},{"word":"enigmă","pos":"noun","definitions":["enigma"],"forms":{"plural":"enigme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enigmă","accusative-definite-nominative-singular":"enigma","accusative-indefinite-nominative-plural":"enigme","accusative-definite-nominative-plural":"enigmele","dative-genitive-indefinite-singular":"enigme","dative-definite-genitive-singular":"enigmei","dative-genitive-indefinite-plural":"enigme","dative-definite-genitive-plural":"enigmelor","singular-vocative":"enigmă","plural-vocative":"enigmelor"}},{"word":"enigmatic","pos":"adj","definitions":["enigmatic"],"pronunciation":"[eniɡˈmatik]","forms":{"feminine-singular":"enigmatică","masculine-plural":"enigmatici","feminine-neuter-plural":"enigmatice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"enigmatic","error-unrecognized-form-feminine-indefinite-singular":"enigmatică","error-unrecognized-form-indefinite-masculine-plural":"enigmatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enigmatice","definite-error-unrecognized-form-masculine-neuter-singular":"enigmaticul","definite-error-unrecognized-form-feminine-singular":"enigmatica","definite-error-unrecognized-form-masculine-plural":"enigmaticii","definite-error-unrecognized-form-feminine-neuter-plural":"enigmaticele"}},{"word":"enigmatica","pos":"adj","definitions":["definite nominative/accusative feminine singular of enigmatic"],"pronunciation":"[eniɡˈmatika]"},{"word":"enigmatică","pos":"adj","definitions":["feminine singular of enigmatic"],"pronunciation":"[eniɡˈmatikə]"},{"word":"enigmatice","pos":"adj","definitions":["feminine/neuter plural of enigmatic"],"pronunciation":"[eniɡˈmatit͡ʃe]"},{"word":"enigmaticesc","pos":"adj","definitions":["enigmatic"],"forms":{"feminine-singular":"enigmaticească","plural":"enigmaticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enigmaticesc","error-unrecognized-form-feminine-indefinite-singular":"enigmaticească","error-unrecognized-form-indefinite-masculine-plural":"enigmaticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"enigmaticești","definite-error-unrecognized-form-masculine-neuter-singular":"enigmaticescul","definite-error-unrecognized-form-feminine-singular":"enigmaticeasca","definite-error-unrecognized-form-masculine-plural":"enigmaticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"enigmaticeștile"}},{"word":"enigmaticește","pos":"adv","definitions":["enigmatically"]},{"word":"enigmatici","pos":"adj","definitions":["masculine plural of enigmatic"],"pronunciation":"[eniɡˈmatit͡ʃʲ]"},{"word":"enigmatiza","pos":"verb","definitions":["to enigmatize"],"forms":{"canonical":"a enigmatiza 1st conjugation","present-singular-third-person":"enigmatizează","participle-past":"enigmatizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a enigmatiza","gerund":"enigmatizând","first-person-indicative-present-singular":"enigmatizez","indicative-present-second-person-singular":"enigmatizezi","indicative-present-singular-third-person":"enigmatizează","first-person-indicative-plural-present":"enigmatizăm","indicative-plural-present-second-person":"enigmatizați","indicative-plural-present-third-person":"enigmatizează","first-person-imperfect-indicative-singular":"enigmatizam","imperfect-indicative-second-person-singular":"enigmatizai","imperfect-indicative-singular-third-person":"enigmatiza","first-person-imperfect-indicative-plural":"enigmatizam","imperfect-indicative-plural-second-person":"enigmatizați","imperfect-indicative-plural-third-person":"enigmatizau","first-person-indicative-perfect-singular":"enigmatizai","indicative-perfect-second-person-singular":"enigmatizași","indicative-perfect-singular-third-person":"enigmatiză","first-person-indicative-perfect-plural":"enigmatizarăm","indicative-perfect-plural-second-person":"enigmatizarăți","indicative-perfect-plural-third-person":"enigmatizară","first-person-indicative-pluperfect-singular":"enigmatizasem","indicative-pluperfect-second-person-singular":"enigmatizaseși","indicative-pluperfect-singular-third-person":"enigmatizase","first-person-indicative-pluperfect-plural":"enigmatizaserăm","indicative-pluperfect-plural-second-person":"enigmatizaserăți","indicative-pluperfect-plural-third-person":"enigmatizaseră","first-person-present-singular-subjunctive":"să enigmatizez","present-second-person-singular-subjunctive":"să enigmatizezi","present-singular-subjunctive-third-person":"să enigmatizeze","first-person-plural-present-subjunctive":"să enigmatizăm","plural-present-second-person-subjunctive":"să enigmatizați","plural-present-subjunctive-third-person":"să enigmatizeze","imperative-second-person-singular":"enigmatizează","imperative-plural-second-person":"enigmatizați","imperative-negative-second-person-singular":"nu enigmatiza","imperative-negative-plural-second-person":"nu enigmatizați"}},{"word":"Enisala","pos":"name","definitions":["a village in Tulcea County, Dobruja, in eastern Romania"],"gender":"f"},{"word":"Enișenlia","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Văleni."],"gender":"f"},{"word":"Eniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Eniță"}},{"word":"enjambament","pos":"noun","definitions":["enjambment"],"forms":{"plural":"enjambamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enjambament","accusative-definite-nominative-singular":"enjambamentul","accusative-indefinite-nominative-plural":"enjambamente","accusative-definite-nominative-plural":"enjambamentele","dative-genitive-indefinite-singular":"enjambament","dative-definite-genitive-singular":"enjambamentului","dative-genitive-indefinite-plural":"enjambamente","dative-definite-genitive-plural":"enjambamentelor","singular-vocative":"enjambamentule","plural-vocative":"enjambamentelor"}},{"word":"Enoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Enoae"}},{"word":"Enoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Enoaia"}},{"word":"enocianină","pos":"noun","definitions":["enocyanin"],"forms":{"plural":"enocianine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enocianină","accusative-definite-nominative-singular":"enocianina","accusative-indefinite-nominative-plural":"enocianine","accusative-definite-nominative-plural":"enocianinele","dative-genitive-indefinite-singular":"enocianine","dative-definite-genitive-singular":"enocianinei","dative-genitive-indefinite-plural":"enocianine","dative-definite-genitive-plural":"enocianinelor","singular-vocative":"enocianină","plural-vocative":"enocianinelor"}},{"word":"Enoescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enoescu"}},{"word":"enofil","pos":"noun","definitions":["oenophile"],"forms":{"plural":"enofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enofil","accusative-definite-nominative-singular":"enofilul","accusative-indefinite-nominative-plural":"enofili","accusative-definite-nominative-plural":"enofilii","dative-genitive-indefinite-singular":"enofil","dative-definite-genitive-singular":"enofilului","dative-genitive-indefinite-plural":"enofili","dative-definite-genitive-plural":"enofililor","singular-vocative":"enofilule","plural-vocative":"enofililor"}},{"word":"enoftalmie","pos":"noun","definitions":["enophthalmos"],"forms":{"plural":"enoftalmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enoftalmie","accusative-definite-nominative-singular":"enoftalmia","accusative-indefinite-nominative-plural":"enoftalmii","accusative-definite-nominative-plural":"enoftalmiile","dative-genitive-indefinite-singular":"enoftalmii","dative-definite-genitive-singular":"enoftalmiei","dative-genitive-indefinite-plural":"enoftalmii","dative-definite-genitive-plural":"enoftalmiilor","singular-vocative":"enoftalmie","plural-vocative":"enoftalmiilor"}},{"word":"Enoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enoiu"}},{"word":"enolază","pos":"noun","definitions":["enolase"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enolază","accusative-definite-nominative-singular":"enolaza","accusative-indefinite-nominative-plural":"enolaze","accusative-definite-nominative-plural":"enolazele","dative-genitive-indefinite-singular":"enolaze","dative-definite-genitive-singular":"enolazei","dative-genitive-indefinite-plural":"enolaze","dative-definite-genitive-plural":"enolazelor","singular-vocative":"enolază","plural-vocative":"enolazelor"}},{"word":"enolic","pos":"adj","definitions":["enolic"],"forms":{"feminine-singular":"enolică","masculine-plural":"enolici","feminine-neuter-plural":"enolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enolic","error-unrecognized-form-feminine-indefinite-singular":"enolică","error-unrecognized-form-indefinite-masculine-plural":"enolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enolice","definite-error-unrecognized-form-masculine-neuter-singular":"enolicul","definite-error-unrecognized-form-feminine-singular":"enolica","definite-error-unrecognized-form-masculine-plural":"enolicii","definite-error-unrecognized-form-feminine-neuter-plural":"enolicele"}},{"word":"enolizare","pos":"noun","definitions":["enolization"],"forms":{"plural":"enolizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enolizare","accusative-definite-nominative-singular":"enolizarea","accusative-indefinite-nominative-plural":"enolizări","accusative-definite-nominative-plural":"enolizările","dative-genitive-indefinite-singular":"enolizări","dative-definite-genitive-singular":"enolizării","dative-genitive-indefinite-plural":"enolizări","dative-definite-genitive-plural":"enolizărilor","singular-vocative":"enolizare","plural-vocative":"enolizărilor"}},{"word":"enolog","pos":"noun","definitions":["enologist"],"forms":{"plural":"enologi","feminine":"equivalent enologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enolog","accusative-definite-nominative-singular":"enologul","accusative-indefinite-nominative-plural":"enologi","accusative-definite-nominative-plural":"enologii","dative-genitive-indefinite-singular":"enolog","dative-definite-genitive-singular":"enologului","dative-genitive-indefinite-plural":"enologi","dative-definite-genitive-plural":"enologilor","singular-vocative":"enologule","plural-vocative":"enologilor","alternative":"oenolog","alternative-rare":"oinolog"}},{"word":"enologă","pos":"noun","definitions":["female equivalent of enolog"],"forms":{"plural":"enologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enologă","accusative-definite-nominative-singular":"enologa","accusative-indefinite-nominative-plural":"enologe","accusative-definite-nominative-plural":"enologele","dative-genitive-indefinite-singular":"enologe","dative-definite-genitive-singular":"enologei","dative-genitive-indefinite-plural":"enologe","dative-definite-genitive-plural":"enologelor","singular-vocative":"enologă","plural-vocative":"enologelor"}},{"word":"enologic","pos":"adj","definitions":["oenological"],"forms":{"feminine-singular":"enologică","masculine-plural":"enologici","feminine-neuter-plural":"enologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enologic","error-unrecognized-form-feminine-indefinite-singular":"enologică","error-unrecognized-form-indefinite-masculine-plural":"enologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enologice","definite-error-unrecognized-form-masculine-neuter-singular":"enologicul","definite-error-unrecognized-form-feminine-singular":"enologica","definite-error-unrecognized-form-masculine-plural":"enologicii","definite-error-unrecognized-form-feminine-neuter-plural":"enologicele"}},{"word":"enologie","pos":"noun","definitions":["oenology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"enologie","accusative-definite-nominative":"enologia","dative-genitive-indefinite":"enologii","dative-definite-genitive":"enologiei","vocative":"enologie"}},{"word":"enoptromanție","pos":"noun","definitions":["enoptromancy"],"forms":{"plural":"enoptromanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enoptromanție","accusative-definite-nominative-singular":"enoptromanția","accusative-indefinite-nominative-plural":"enoptromanții","accusative-definite-nominative-plural":"enoptromanțiile","dative-genitive-indefinite-singular":"enoptromanții","dative-definite-genitive-singular":"enoptromanției","dative-genitive-indefinite-plural":"enoptromanții","dative-definite-genitive-plural":"enoptromanțiilor","singular-vocative":"enoptromanție","plural-vocative":"enoptromanțiilor"}},{"word":"enorial","pos":"adj","definitions":["parochial; of a parish"],"forms":{"feminine-singular":"enorială","masculine-plural":"enoriali","feminine-neuter-plural":"enoriale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enorial","error-unrecognized-form-feminine-indefinite-singular":"enorială","error-unrecognized-form-indefinite-masculine-plural":"enoriali","error-unrecognized-form-feminine-indefinite-neuter-plural":"enoriale","definite-error-unrecognized-form-masculine-neuter-singular":"enorialul","definite-error-unrecognized-form-feminine-singular":"enoriala","definite-error-unrecognized-form-masculine-plural":"enorialii","definite-error-unrecognized-form-feminine-neuter-plural":"enorialele"}},{"word":"enoriaș","pos":"noun","definitions":["parishioner"],"forms":{"plural":"enoriași"}},{"word":"enoriașă","pos":"noun","definitions":["female equivalent of enoriaș"],"forms":{"plural":"enoriașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enoriașă","accusative-definite-nominative-singular":"enoriașa","accusative-indefinite-nominative-plural":"enoriașe","accusative-definite-nominative-plural":"enoriașele","dative-genitive-indefinite-singular":"enoriașe","dative-definite-genitive-singular":"enoriașei","dative-genitive-indefinite-plural":"enoriașe","dative-definite-genitive-plural":"enoriașelor","singular-vocative":"enoriașă","plural-vocative":"enoriașelor"}},{"word":"enorie","pos":"noun","definitions":["parish"],"forms":{"plural":"enorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enorie","accusative-definite-nominative-singular":"enoria","accusative-indefinite-nominative-plural":"enorii","accusative-definite-nominative-plural":"enoriile","dative-genitive-indefinite-singular":"enorii","dative-definite-genitive-singular":"enoriei","dative-genitive-indefinite-plural":"enorii","dative-definite-genitive-plural":"enoriilor","singular-vocative":"enorie","plural-vocative":"enoriilor"}},{"word":"enorm","pos":"adj","definitions":["enormous"],"pronunciation":"/eˈnorm/","forms":{"canonical-masculine-neuter":"enórm","feminine-singular":"enormă","masculine-plural":"enormi","feminine-neuter-plural":"enorme","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"enorm","error-unrecognized-form-feminine-indefinite-singular":"enormă","error-unrecognized-form-indefinite-masculine-plural":"enormi","error-unrecognized-form-feminine-indefinite-neuter-plural":"enorme","definite-error-unrecognized-form-masculine-neuter-singular":"enormul","definite-error-unrecognized-form-feminine-singular":"enorma","definite-error-unrecognized-form-masculine-plural":"enormii","definite-error-unrecognized-form-feminine-neuter-plural":"enormele"}},{"word":"enorm","pos":"adv","definitions":["enormously"],"pronunciation":"/eˈnorm/","forms":{"canonical":"enórm"}},{"word":"enormitate","pos":"noun","definitions":["enormity"],"forms":{"plural":"enormități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enormitate","accusative-definite-nominative-singular":"enormitatea","accusative-indefinite-nominative-plural":"enormități","accusative-definite-nominative-plural":"enormitățile","dative-genitive-indefinite-singular":"enormități","dative-definite-genitive-singular":"enormității","dative-genitive-indefinite-plural":"enormități","dative-definite-genitive-plural":"enormităților","singular-vocative":"enormitate","plural-vocative":"enormităților"}},{"word":"Enoșești","pos":"name","definitions":["a village in Piatra-Olt, Olt County, Romania"],"gender":"m"},{"word":"enostoză","pos":"noun","definitions":["enostosis"],"forms":{"plural":"enostoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enostoză","accusative-definite-nominative-singular":"enostoza","accusative-indefinite-nominative-plural":"enostoze","accusative-definite-nominative-plural":"enostozele","dative-genitive-indefinite-singular":"enostoze","dative-definite-genitive-singular":"enostozei","dative-genitive-indefinite-plural":"enostoze","dative-definite-genitive-plural":"enostozelor","singular-vocative":"enostoză","plural-vocative":"enostozelor"}},{"word":"enot","pos":"noun","definitions":["raccoon dog"],"forms":{"plural":"enoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enot","accusative-definite-nominative-singular":"enotul","accusative-indefinite-nominative-plural":"enoți","accusative-definite-nominative-plural":"enoții","dative-genitive-indefinite-singular":"enot","dative-definite-genitive-singular":"enotului","dative-genitive-indefinite-plural":"enoți","dative-definite-genitive-plural":"enoților","singular-vocative":"enotule","plural-vocative":"enoților"}},{"word":"enotehnică","pos":"noun","definitions":["wine technology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"enotehnică","accusative-definite-nominative":"enotehnica","dative-genitive-indefinite":"enotehnice","dative-definite-genitive":"enotehnicei","vocative":"enotehnică"}},{"word":"ensiform","pos":"adj","definitions":["ensiform"],"forms":{"feminine-singular":"ensiformă","masculine-plural":"ensiformi","feminine-neuter-plural":"ensiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ensiform","error-unrecognized-form-feminine-indefinite-singular":"ensiformă","error-unrecognized-form-indefinite-masculine-plural":"ensiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ensiforme","definite-error-unrecognized-form-masculine-neuter-singular":"ensiformul","definite-error-unrecognized-form-feminine-singular":"ensiforma","definite-error-unrecognized-form-masculine-plural":"ensiformii","definite-error-unrecognized-form-feminine-neuter-plural":"ensiformele"}},{"word":"enstatit","pos":"noun","definitions":["enstatite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"enstatit","accusative-definite-nominative":"enstatitul","dative-genitive-indefinite":"enstatit","dative-definite-genitive":"enstatitului","vocative":"enstatitule"}},{"word":"entalpie","pos":"noun","definitions":["enthalpy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"entalpie","accusative-definite-nominative":"entalpia","dative-genitive-indefinite":"entalpii","dative-definite-genitive":"entalpiei","vocative":"entalpie"}},{"word":"entelehie","pos":"noun","definitions":["entelechy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"entelehie","accusative-definite-nominative":"entelehia","dative-genitive-indefinite":"entelehii","dative-definite-genitive":"entelehiei","vocative":"entelehie"}},{"word":"enteralgie","pos":"noun","definitions":["enteralgia"],"forms":{"plural":"enteralgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enteralgie","accusative-definite-nominative-singular":"enteralgia","accusative-indefinite-nominative-plural":"enteralgii","accusative-definite-nominative-plural":"enteralgiile","dative-genitive-indefinite-singular":"enteralgii","dative-definite-genitive-singular":"enteralgiei","dative-genitive-indefinite-plural":"enteralgii","dative-definite-genitive-plural":"enteralgiilor","singular-vocative":"enteralgie","plural-vocative":"enteralgiilor"}},{"word":"enterectomie","pos":"noun","definitions":["enterectomy"],"forms":{"plural":"enterectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enterectomie","accusative-definite-nominative-singular":"enterectomia","accusative-indefinite-nominative-plural":"enterectomii","accusative-definite-nominative-plural":"enterectomiile","dative-genitive-indefinite-singular":"enterectomii","dative-definite-genitive-singular":"enterectomiei","dative-genitive-indefinite-plural":"enterectomii","dative-definite-genitive-plural":"enterectomiilor","singular-vocative":"enterectomie","plural-vocative":"enterectomiilor"}},{"word":"enteric","pos":"adj","definitions":["enteric"],"forms":{"feminine-singular":"enterică","masculine-plural":"enterici","feminine-neuter-plural":"enterice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enteric","error-unrecognized-form-feminine-indefinite-singular":"enterică","error-unrecognized-form-indefinite-masculine-plural":"enterici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enterice","definite-error-unrecognized-form-masculine-neuter-singular":"entericul","definite-error-unrecognized-form-feminine-singular":"enterica","definite-error-unrecognized-form-masculine-plural":"entericii","definite-error-unrecognized-form-feminine-neuter-plural":"entericele"}},{"word":"enterită","pos":"noun","definitions":["enteritis"],"forms":{"plural":"enterite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterită","accusative-definite-nominative-singular":"enterita","accusative-indefinite-nominative-plural":"enterite","accusative-definite-nominative-plural":"enteritele","dative-genitive-indefinite-singular":"enterite","dative-definite-genitive-singular":"enteritei","dative-genitive-indefinite-plural":"enterite","dative-definite-genitive-plural":"enteritelor","singular-vocative":"enterită","plural-vocative":"enteritelor"}},{"word":"enteroanastomoză","pos":"noun","definitions":["enteroanastomosis"],"forms":{"plural":"enteroanastomoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enteroanastomoză","accusative-definite-nominative-singular":"enteroanastomoza","accusative-indefinite-nominative-plural":"enteroanastomoze","accusative-definite-nominative-plural":"enteroanastomozele","dative-genitive-indefinite-singular":"enteroanastomoze","dative-definite-genitive-singular":"enteroanastomozei","dative-genitive-indefinite-plural":"enteroanastomoze","dative-definite-genitive-plural":"enteroanastomozelor","singular-vocative":"enteroanastomoză","plural-vocative":"enteroanastomozelor"}},{"word":"enterobacterie","pos":"noun","definitions":["enterobacteria"],"forms":{"plural":"enterobacterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enterobacterie","accusative-definite-nominative-singular":"enterobacteria","accusative-indefinite-nominative-plural":"enterobacterii","accusative-definite-nominative-plural":"enterobacteriile","dative-genitive-indefinite-singular":"enterobacterii","dative-definite-genitive-singular":"enterobacteriei","dative-genitive-indefinite-plural":"enterobacterii","dative-definite-genitive-plural":"enterobacteriilor","singular-vocative":"enterobacterie","plural-vocative":"enterobacteriilor"}},{"word":"enterocel","pos":"noun","definitions":["enterocele"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"enterocel","accusative-definite-nominative":"enterocelul","dative-genitive-indefinite":"enterocel","dative-definite-genitive":"enterocelului","vocative":"enterocelule"}},{"word":"enterocenteză","pos":"noun","definitions":["enterocentesis"],"forms":{"plural":"enterocenteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterocenteză","accusative-definite-nominative-singular":"enterocenteza","accusative-indefinite-nominative-plural":"enterocenteze","accusative-definite-nominative-plural":"enterocentezele","dative-genitive-indefinite-singular":"enterocenteze","dative-definite-genitive-singular":"enterocentezei","dative-genitive-indefinite-plural":"enterocenteze","dative-definite-genitive-plural":"enterocentezelor","singular-vocative":"enterocenteză","plural-vocative":"enterocentezelor"}},{"word":"enterochinază","pos":"noun","definitions":["enterokinase"],"forms":{"plural":"enterochinaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterochinază","accusative-definite-nominative-singular":"enterochinaza","accusative-indefinite-nominative-plural":"enterochinaze","accusative-definite-nominative-plural":"enterochinazele","dative-genitive-indefinite-singular":"enterochinaze","dative-definite-genitive-singular":"enterochinazei","dative-genitive-indefinite-plural":"enterochinaze","dative-definite-genitive-plural":"enterochinazelor","singular-vocative":"enterochinază","plural-vocative":"enterochinazelor"}},{"word":"enterocliză","pos":"noun","definitions":["enteroclysis"],"forms":{"plural":"enteroclize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterocliză","accusative-definite-nominative-singular":"enterocliza","accusative-indefinite-nominative-plural":"enteroclize","accusative-definite-nominative-plural":"enteroclizele","dative-genitive-indefinite-singular":"enteroclize","dative-definite-genitive-singular":"enteroclizei","dative-genitive-indefinite-plural":"enteroclize","dative-definite-genitive-plural":"enteroclizelor","singular-vocative":"enterocliză","plural-vocative":"enteroclizelor"}},{"word":"enterococ","pos":"noun","definitions":["enterococcus"],"forms":{"plural":"enterococi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"enterococ","accusative-definite-nominative-singular":"enterococul","accusative-indefinite-nominative-plural":"enterococi","accusative-definite-nominative-plural":"enterococii","dative-genitive-indefinite-singular":"enterococ","dative-definite-genitive-singular":"enterococului","dative-genitive-indefinite-plural":"enterococi","dative-definite-genitive-plural":"enterococilor","singular-vocative":"enterococule","plural-vocative":"enterococilor"}},{"word":"enterocolită","pos":"noun","definitions":["enterocolitis"],"forms":{"plural":"enterocolite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterocolită","accusative-definite-nominative-singular":"enterocolita","accusative-indefinite-nominative-plural":"enterocolite","accusative-definite-nominative-plural":"enterocolitele","dative-genitive-indefinite-singular":"enterocolite","dative-definite-genitive-singular":"enterocolitei","dative-genitive-indefinite-plural":"enterocolite","dative-definite-genitive-plural":"enterocolitelor","singular-vocative":"enterocolită","plural-vocative":"enterocolitelor"}},{"word":"enterogastrită","pos":"noun","definitions":["enterogastritis"],"forms":{"plural":"enterogastrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterogastrită","accusative-definite-nominative-singular":"enterogastrita","accusative-indefinite-nominative-plural":"enterogastrite","accusative-definite-nominative-plural":"enterogastritele","dative-genitive-indefinite-singular":"enterogastrite","dative-definite-genitive-singular":"enterogastritei","dative-genitive-indefinite-plural":"enterogastrite","dative-definite-genitive-plural":"enterogastritelor","singular-vocative":"enterogastrită","plural-vocative":"enterogastritelor"}},{"word":"enterogastron","pos":"noun","definitions":["alternative form of enterogastronă"],"forms":{"plural":"enterogastrone","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enterogastron","accusative-definite-nominative-singular":"enterogastronul","accusative-indefinite-nominative-plural":"enterogastrone","accusative-definite-nominative-plural":"enterogastronele","dative-genitive-indefinite-singular":"enterogastron","dative-definite-genitive-singular":"enterogastronului","dative-genitive-indefinite-plural":"enterogastrone","dative-definite-genitive-plural":"enterogastronelor","singular-vocative":"enterogastronule","plural-vocative":"enterogastronelor"}},{"word":"enterogastronă","pos":"noun","definitions":["enterogastrone"],"forms":{"plural":"enterogastrone","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enterogastronă","accusative-definite-nominative-singular":"enterogastronăul","accusative-indefinite-nominative-plural":"enterogastrone","accusative-definite-nominative-plural":"enterogastronele","dative-genitive-indefinite-singular":"enterogastronă","dative-definite-genitive-singular":"enterogastronăului","dative-genitive-indefinite-plural":"enterogastrone","dative-definite-genitive-plural":"enterogastronelor","singular-vocative":"enterogastronăule","plural-vocative":"enterogastronelor"}},{"word":"enterohemoragie","pos":"noun","definitions":["enterohemorrhagic"],"forms":{"plural":"enterohemoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enterohemoragie","accusative-definite-nominative-singular":"enterohemoragia","accusative-indefinite-nominative-plural":"enterohemoragii","accusative-definite-nominative-plural":"enterohemoragiile","dative-genitive-indefinite-singular":"enterohemoragii","dative-definite-genitive-singular":"enterohemoragiei","dative-genitive-indefinite-plural":"enterohemoragii","dative-definite-genitive-plural":"enterohemoragiilor","singular-vocative":"enterohemoragie","plural-vocative":"enterohemoragiilor"}},{"word":"enterohepatită","pos":"noun","definitions":["enterohepatitis"],"forms":{"plural":"enterohepatite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterohepatită","accusative-definite-nominative-singular":"enterohepatita","accusative-indefinite-nominative-plural":"enterohepatite","accusative-definite-nominative-plural":"enterohepatitele","dative-genitive-indefinite-singular":"enterohepatite","dative-definite-genitive-singular":"enterohepatitei","dative-genitive-indefinite-plural":"enterohepatite","dative-definite-genitive-plural":"enterohepatitelor","singular-vocative":"enterohepatită","plural-vocative":"enterohepatitelor"}},{"word":"enterologie","pos":"noun","definitions":["enterology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"enterologie","accusative-definite-nominative":"enterologia","dative-genitive-indefinite":"enterologii","dative-definite-genitive":"enterologiei","vocative":"enterologie"}},{"word":"enteropatie","pos":"noun","definitions":["enteropathy"],"forms":{"plural":"enteropatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enteropatie","accusative-definite-nominative-singular":"enteropatia","accusative-indefinite-nominative-plural":"enteropatii","accusative-definite-nominative-plural":"enteropatiile","dative-genitive-indefinite-singular":"enteropatii","dative-definite-genitive-singular":"enteropatiei","dative-genitive-indefinite-plural":"enteropatii","dative-definite-genitive-plural":"enteropatiilor","singular-vocative":"enteropatie","plural-vocative":"enteropatiilor"}},{"word":"enteropexie","pos":"noun","definitions":["enteropexy"],"forms":{"plural":"enteropexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enteropexie","accusative-definite-nominative-singular":"enteropexia","accusative-indefinite-nominative-plural":"enteropexii","accusative-definite-nominative-plural":"enteropexiile","dative-genitive-indefinite-singular":"enteropexii","dative-definite-genitive-singular":"enteropexiei","dative-genitive-indefinite-plural":"enteropexii","dative-definite-genitive-plural":"enteropexiilor","singular-vocative":"enteropexie","plural-vocative":"enteropexiilor"}},{"word":"enteroptoză","pos":"noun","definitions":["enteroptosis"],"forms":{"plural":"enteroptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enteroptoză","accusative-definite-nominative-singular":"enteroptoza","accusative-indefinite-nominative-plural":"enteroptoze","accusative-definite-nominative-plural":"enteroptozele","dative-genitive-indefinite-singular":"enteroptoze","dative-definite-genitive-singular":"enteroptozei","dative-genitive-indefinite-plural":"enteroptoze","dative-definite-genitive-plural":"enteroptozelor","singular-vocative":"enteroptoză","plural-vocative":"enteroptozelor"}},{"word":"enteroragie","pos":"noun","definitions":["enterorrhagia"],"forms":{"plural":"enteroragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enteroragie","accusative-definite-nominative-singular":"enteroragia","accusative-indefinite-nominative-plural":"enteroragii","accusative-definite-nominative-plural":"enteroragiile","dative-genitive-indefinite-singular":"enteroragii","dative-definite-genitive-singular":"enteroragiei","dative-genitive-indefinite-plural":"enteroragii","dative-definite-genitive-plural":"enteroragiilor","singular-vocative":"enteroragie","plural-vocative":"enteroragiilor"}},{"word":"enterorenal","pos":"adj","definitions":["enterorenal"],"forms":{"feminine-singular":"enterorenală","masculine-plural":"enterorenali","feminine-neuter-plural":"enterorenale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enterorenal","error-unrecognized-form-feminine-indefinite-singular":"enterorenală","error-unrecognized-form-indefinite-masculine-plural":"enterorenali","error-unrecognized-form-feminine-indefinite-neuter-plural":"enterorenale","definite-error-unrecognized-form-masculine-neuter-singular":"enterorenalul","definite-error-unrecognized-form-feminine-singular":"enterorenala","definite-error-unrecognized-form-masculine-plural":"enterorenalii","definite-error-unrecognized-form-feminine-neuter-plural":"enterorenalele"}},{"word":"enterospasm","pos":"noun","definitions":["enterospasm"],"forms":{"plural":"enterospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enterospasm","accusative-definite-nominative-singular":"enterospasmul","accusative-indefinite-nominative-plural":"enterospasme","accusative-definite-nominative-plural":"enterospasmele","dative-genitive-indefinite-singular":"enterospasm","dative-definite-genitive-singular":"enterospasmului","dative-genitive-indefinite-plural":"enterospasme","dative-definite-genitive-plural":"enterospasmelor","singular-vocative":"enterospasmule","plural-vocative":"enterospasmelor"}},{"word":"enterostenoză","pos":"noun","definitions":["enterostenosis"],"forms":{"plural":"enterostenoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enterostenoză","accusative-definite-nominative-singular":"enterostenoza","accusative-indefinite-nominative-plural":"enterostenoze","accusative-definite-nominative-plural":"enterostenozele","dative-genitive-indefinite-singular":"enterostenoze","dative-definite-genitive-singular":"enterostenozei","dative-genitive-indefinite-plural":"enterostenoze","dative-definite-genitive-plural":"enterostenozelor","singular-vocative":"enterostenoză","plural-vocative":"enterostenozelor"}},{"word":"enterostomie","pos":"noun","definitions":["enterostomy"],"forms":{"plural":"enterostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enterostomie","accusative-definite-nominative-singular":"enterostomia","accusative-indefinite-nominative-plural":"enterostomii","accusative-definite-nominative-plural":"enterostomiile","dative-genitive-indefinite-singular":"enterostomii","dative-definite-genitive-singular":"enterostomiei","dative-genitive-indefinite-plural":"enterostomii","dative-definite-genitive-plural":"enterostomiilor","singular-vocative":"enterostomie","plural-vocative":"enterostomiilor"}},{"word":"enterotom","pos":"noun","definitions":["enterotome"],"forms":{"plural":"enterotoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"enterotom","accusative-definite-nominative-singular":"enterotomul","accusative-indefinite-nominative-plural":"enterotoame","accusative-definite-nominative-plural":"enterotoamele","dative-genitive-indefinite-singular":"enterotom","dative-definite-genitive-singular":"enterotomului","dative-genitive-indefinite-plural":"enterotoame","dative-definite-genitive-plural":"enterotoamelor","singular-vocative":"enterotomule","plural-vocative":"enterotoamelor"}},{"word":"enterotomie","pos":"noun","definitions":["enterotomy"],"forms":{"plural":"enterotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enterotomie","accusative-definite-nominative-singular":"enterotomia","accusative-indefinite-nominative-plural":"enterotomii","accusative-definite-nominative-plural":"enterotomiile","dative-genitive-indefinite-singular":"enterotomii","dative-definite-genitive-singular":"enterotomiei","dative-genitive-indefinite-plural":"enterotomii","dative-definite-genitive-plural":"enterotomiilor","singular-vocative":"enterotomie","plural-vocative":"enterotomiilor"}},{"word":"entimemă","pos":"noun","definitions":["enthymeme"],"forms":{"plural":"entimeme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entimemă","accusative-definite-nominative-singular":"entimema","accusative-indefinite-nominative-plural":"entimeme","accusative-definite-nominative-plural":"entimemele","dative-genitive-indefinite-singular":"entimeme","dative-definite-genitive-singular":"entimemei","dative-genitive-indefinite-plural":"entimeme","dative-definite-genitive-plural":"entimemelor","singular-vocative":"entimemă","plural-vocative":"entimemelor"}},{"word":"entitate","pos":"noun","definitions":["entity"],"forms":{"plural":"entități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"entitate","accusative-definite-nominative-singular":"entitatea","accusative-indefinite-nominative-plural":"entități","accusative-definite-nominative-plural":"entitățile","dative-genitive-indefinite-singular":"entități","dative-definite-genitive-singular":"entității","dative-genitive-indefinite-plural":"entități","dative-definite-genitive-plural":"entităților","singular-vocative":"entitate","plural-vocative":"entităților"}},{"word":"entomofag","pos":"noun","definitions":["an entomophagous animal"],"forms":{"plural":"entomofagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"entomofag","accusative-definite-nominative-singular":"entomofagul","accusative-indefinite-nominative-plural":"entomofagi","accusative-definite-nominative-plural":"entomofagii","dative-genitive-indefinite-singular":"entomofag","dative-definite-genitive-singular":"entomofagului","dative-genitive-indefinite-plural":"entomofagi","dative-definite-genitive-plural":"entomofagilor","singular-vocative":"entomofagule","plural-vocative":"entomofagilor"}},{"word":"entomofagă","pos":"noun","definitions":["female equivalent of entomofag"],"forms":{"plural":"entomofage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entomofagă","accusative-definite-nominative-singular":"entomofaga","accusative-indefinite-nominative-plural":"entomofage","accusative-definite-nominative-plural":"entomofagele","dative-genitive-indefinite-singular":"entomofage","dative-definite-genitive-singular":"entomofagei","dative-genitive-indefinite-plural":"entomofage","dative-definite-genitive-plural":"entomofagelor","singular-vocative":"entomofagă","plural-vocative":"entomofagelor"}},{"word":"entomofil","pos":"adj","definitions":["entomophilic"],"forms":{"feminine-singular":"entomofilă","masculine-plural":"entomofili","feminine-neuter-plural":"entomofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entomofil","error-unrecognized-form-feminine-indefinite-singular":"entomofilă","error-unrecognized-form-indefinite-masculine-plural":"entomofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"entomofile","definite-error-unrecognized-form-masculine-neuter-singular":"entomofilul","definite-error-unrecognized-form-feminine-singular":"entomofila","definite-error-unrecognized-form-masculine-plural":"entomofilii","definite-error-unrecognized-form-feminine-neuter-plural":"entomofilele"}},{"word":"entomofilie","pos":"noun","definitions":["entomophily"],"forms":{"plural":"entomofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"entomofilie","accusative-definite-nominative-singular":"entomofilia","accusative-indefinite-nominative-plural":"entomofilii","accusative-definite-nominative-plural":"entomofiliile","dative-genitive-indefinite-singular":"entomofilii","dative-definite-genitive-singular":"entomofiliei","dative-genitive-indefinite-plural":"entomofilii","dative-definite-genitive-plural":"entomofiliilor","singular-vocative":"entomofilie","plural-vocative":"entomofiliilor"}},{"word":"entomofit","pos":"adj","definitions":["entomophyte"],"forms":{"feminine-singular":"entomofită","masculine-plural":"entomofiți","feminine-neuter-plural":"entomofite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entomofit","error-unrecognized-form-feminine-indefinite-singular":"entomofită","error-unrecognized-form-indefinite-masculine-plural":"entomofiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"entomofite","definite-error-unrecognized-form-masculine-neuter-singular":"entomofitul","definite-error-unrecognized-form-feminine-singular":"entomofita","definite-error-unrecognized-form-masculine-plural":"entomofiții","definite-error-unrecognized-form-feminine-neuter-plural":"entomofitele"}},{"word":"entomografie","pos":"noun","definitions":["entomography"],"forms":{"plural":"entomografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"entomografie","accusative-definite-nominative-singular":"entomografia","accusative-indefinite-nominative-plural":"entomografii","accusative-definite-nominative-plural":"entomografiile","dative-genitive-indefinite-singular":"entomografii","dative-definite-genitive-singular":"entomografiei","dative-genitive-indefinite-plural":"entomografii","dative-definite-genitive-plural":"entomografiilor","singular-vocative":"entomografie","plural-vocative":"entomografiilor"}},{"word":"entomolog","pos":"noun","definitions":["entomologist"],"pronunciation":"/en.to.moˈloɡ/","forms":{"plural":"entomologi","feminine":"equivalent entomologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"entomolog","accusative-definite-nominative-singular":"entomologul","accusative-indefinite-nominative-plural":"entomologi","accusative-definite-nominative-plural":"entomologii","dative-genitive-indefinite-singular":"entomolog","dative-definite-genitive-singular":"entomologului","dative-genitive-indefinite-plural":"entomologi","dative-definite-genitive-plural":"entomologilor","singular-vocative":"entomologule","plural-vocative":"entomologilor"}},{"word":"entomologa","pos":"noun","definitions":["definite nominative/accusative singular of entomologă"]},{"word":"entomologă","pos":"noun","definitions":["female equivalent of entomolog"],"pronunciation":"/en.to.moˈlo.ɡə/","forms":{"plural":"entomologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"entomologă","accusative-definite-nominative-singular":"entomologa","accusative-indefinite-nominative-plural":"entomologe","accusative-definite-nominative-plural":"entomologele","dative-genitive-indefinite-singular":"entomologe","dative-definite-genitive-singular":"entomologei","dative-genitive-indefinite-plural":"entomologe","dative-definite-genitive-plural":"entomologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"entomologe","pos":"noun","definitions":["plural of entomologă"],"gender":"f"},{"word":"entomologi","pos":"noun","definitions":["plural of entomolog"],"gender":"m"},{"word":"entomologic","pos":"adj","definitions":["entomological"],"forms":{"feminine-singular":"entomologică","masculine-plural":"entomologici","feminine-neuter-plural":"entomologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entomologic","error-unrecognized-form-feminine-indefinite-singular":"entomologică","error-unrecognized-form-indefinite-masculine-plural":"entomologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"entomologice","definite-error-unrecognized-form-masculine-neuter-singular":"entomologicul","definite-error-unrecognized-form-feminine-singular":"entomologica","definite-error-unrecognized-form-masculine-plural":"entomologicii","definite-error-unrecognized-form-feminine-neuter-plural":"entomologicele"}},{"word":"entomologie","pos":"noun","definitions":["entomology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"entomologie","accusative-definite-nominative":"entomologia","dative-genitive-indefinite":"entomologii","dative-definite-genitive":"entomologiei","vocative":"entomologie"}},{"word":"entomologist","pos":"noun","definitions":["entomologist"],"forms":{"plural":"entomologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"entomologist","accusative-definite-nominative-singular":"entomologistul","accusative-indefinite-nominative-plural":"entomologiști","accusative-definite-nominative-plural":"entomologiștii","dative-genitive-indefinite-singular":"entomologist","dative-definite-genitive-singular":"entomologistului","dative-genitive-indefinite-plural":"entomologiști","dative-definite-genitive-plural":"entomologiștilor","singular-vocative":"entomologistule","plural-vocative":"entomologiștilor"}},{"word":"entomologistă","pos":"noun","definitions":["female equivalent of entomologist"],"forms":{"plural":"entomologiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entomologistă","accusative-definite-nominative-singular":"entomologista","accusative-indefinite-nominative-plural":"entomologiste","accusative-definite-nominative-plural":"entomologistele","dative-genitive-indefinite-singular":"entomologiste","dative-definite-genitive-singular":"entomologistei","dative-genitive-indefinite-plural":"entomologiste","dative-definite-genitive-plural":"entomologistelor","singular-vocative":"entomologistă","plural-vocative":"entomologistelor"}},{"word":"entomostraceu","pos":"noun","definitions":["entomostracean"],"forms":{"plural":"entomostracee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"entomostraceu","accusative-definite-nominative-singular":"entomostraceul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"le","dative-genitive-indefinite-singular":"entomostraceu","dative-definite-genitive-singular":"entomostraceului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"lor","singular-vocative":"entomostraceule","plural-vocative":"lor"}},{"word":"entoplasmă","pos":"noun","definitions":["endoplasm"],"forms":{"plural":"entoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entoplasmă","accusative-definite-nominative-singular":"entoplasma","accusative-indefinite-nominative-plural":"entoplasme","accusative-definite-nominative-plural":"entoplasmele","dative-genitive-indefinite-singular":"entoplasme","dative-definite-genitive-singular":"entoplasmei","dative-genitive-indefinite-plural":"entoplasme","dative-definite-genitive-plural":"entoplasmelor","singular-vocative":"entoplasmă","plural-vocative":"entoplasmelor"}},{"word":"entorsă","pos":"noun","definitions":["sprain"],"forms":{"plural":"entorse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entorsă","accusative-definite-nominative-singular":"entorsa","accusative-indefinite-nominative-plural":"entorse","accusative-definite-nominative-plural":"entorsele","dative-genitive-indefinite-singular":"entorse","dative-definite-genitive-singular":"entorsei","dative-genitive-indefinite-plural":"entorse","dative-definite-genitive-plural":"entorselor","singular-vocative":"entorsă","plural-vocative":"entorselor"}},{"word":"entozoar","pos":"noun","definitions":["entozoan"],"forms":{"plural":"entozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"entozoar","accusative-definite-nominative-singular":"entozoarul","accusative-indefinite-nominative-plural":"entozoare","accusative-definite-nominative-plural":"entozoarele","dative-genitive-indefinite-singular":"entozoar","dative-definite-genitive-singular":"entozoarului","dative-genitive-indefinite-plural":"entozoare","dative-definite-genitive-plural":"entozoarelor","singular-vocative":"entozoarule","plural-vocative":"entozoarelor"}},{"word":"entrată","pos":"noun","definitions":["introduction"],"pronunciation":"/enˈtra.tə/","forms":{"plural":"entrate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"entrată","accusative-definite-nominative-singular":"entrata","accusative-indefinite-nominative-plural":"entrate","accusative-definite-nominative-plural":"entratele","dative-genitive-indefinite-singular":"entrate","dative-definite-genitive-singular":"entratei","dative-genitive-indefinite-plural":"entrate","dative-definite-genitive-plural":"entratelor","singular-vocative":"entrată","plural-vocative":"entratelor"}},{"word":"entrefilet","pos":"noun","definitions":["snippet (short newspaper article)"],"forms":{"plural":"entrefileturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"entrefilet","accusative-definite-nominative-singular":"entrefiletul","accusative-indefinite-nominative-plural":"entrefileturi","accusative-definite-nominative-plural":"entrefileturile","dative-genitive-indefinite-singular":"entrefilet","dative-definite-genitive-singular":"entrefiletului","dative-genitive-indefinite-plural":"entrefileturi","dative-definite-genitive-plural":"entrefileturilor","singular-vocative":"entrefiletule","plural-vocative":"entrefileturilor"}},{"word":"entrelacs","pos":"noun","definitions":["interlacing pattern"],"forms":{"plural":"entrelacsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"entrelacs","accusative-definite-nominative-singular":"entrelacsul","accusative-indefinite-nominative-plural":"entrelacsuri","accusative-definite-nominative-plural":"entrelacsurile","dative-genitive-indefinite-singular":"entrelacs","dative-definite-genitive-singular":"entrelacsului","dative-genitive-indefinite-plural":"entrelacsuri","dative-definite-genitive-plural":"entrelacsurilor","singular-vocative":"entrelacsule","plural-vocative":"entrelacsurilor"}},{"word":"entropic","pos":"adj","definitions":["entropic"],"forms":{"feminine-singular":"entropică","masculine-plural":"entropici","feminine-neuter-plural":"entropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entropic","error-unrecognized-form-feminine-indefinite-singular":"entropică","error-unrecognized-form-indefinite-masculine-plural":"entropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"entropice","definite-error-unrecognized-form-masculine-neuter-singular":"entropicul","definite-error-unrecognized-form-feminine-singular":"entropica","definite-error-unrecognized-form-masculine-plural":"entropicii","definite-error-unrecognized-form-feminine-neuter-plural":"entropicele"}},{"word":"entropie","pos":"noun","definitions":["entropy"],"forms":{"plural":"entropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"entropie","accusative-definite-nominative-singular":"entropia","accusative-indefinite-nominative-plural":"entropii","accusative-definite-nominative-plural":"entropiile","dative-genitive-indefinite-singular":"entropii","dative-definite-genitive-singular":"entropiei","dative-genitive-indefinite-plural":"entropii","dative-definite-genitive-plural":"entropiilor","singular-vocative":"entropie","plural-vocative":"entropiilor"}},{"word":"entropion","pos":"noun","definitions":["entropion"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"entropion","accusative-definite-nominative":"entropionul","dative-genitive-indefinite":"entropion","dative-definite-genitive":"entropionului","vocative":"entropionule"}},{"word":"entusiasmat","pos":"adj","definitions":["obsolete form of entuziasmat"],"forms":{"feminine-singular":"entusiasmată","masculine-plural":"entusiasmați","feminine-neuter-plural":"entusiasmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entusiasmat","error-unrecognized-form-feminine-indefinite-singular":"entusiasmată","error-unrecognized-form-indefinite-masculine-plural":"entusiasmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"entusiasmate","definite-error-unrecognized-form-masculine-neuter-singular":"entusiasmatul","definite-error-unrecognized-form-feminine-singular":"entusiasmata","definite-error-unrecognized-form-masculine-plural":"entusiasmații","definite-error-unrecognized-form-feminine-neuter-plural":"entusiasmatele"}},{"word":"entusiat","pos":"adj","definitions":["enthusiastic"],"forms":{"feminine-singular":"entusiată","masculine-plural":"entusiați","feminine-neuter-plural":"entusiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entusiat","error-unrecognized-form-feminine-indefinite-singular":"entusiată","error-unrecognized-form-indefinite-masculine-plural":"entusiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"entusiate","definite-error-unrecognized-form-masculine-neuter-singular":"entusiatul","definite-error-unrecognized-form-feminine-singular":"entusiata","definite-error-unrecognized-form-masculine-plural":"entusiații","definite-error-unrecognized-form-feminine-neuter-plural":"entusiatele"}},{"word":"entusiat","pos":"verb","definitions":["past participle of entusia"],"forms":{"participle-past":"of entusia"}},{"word":"entuziasm","pos":"noun","definitions":["enthusiasm"],"forms":{"plural":"entuziasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"entuziasm","accusative-definite-nominative-singular":"entuziasmul","accusative-indefinite-nominative-plural":"entuziasme","accusative-definite-nominative-plural":"entuziasmele","dative-genitive-indefinite-singular":"entuziasm","dative-definite-genitive-singular":"entuziasmului","dative-genitive-indefinite-plural":"entuziasme","dative-definite-genitive-plural":"entuziasmelor","singular-vocative":"entuziasmule","plural-vocative":"entuziasmelor"}},{"word":"entuziasma","pos":"verb","definitions":["to enthuse, to enthrall"],"pronunciation":"/en.tu.zi.aˈsma/","forms":{"canonical":"a entuziasma 1st conjugation","present-singular-third-person":"entuziasmează","participle-past":"entuziasmat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a entuziasma","gerund":"entuziasmând","first-person-indicative-present-singular":"entuziasmez","indicative-present-second-person-singular":"entuziasmezi","indicative-present-singular-third-person":"entuziasmează","first-person-indicative-plural-present":"entuziasmăm","indicative-plural-present-second-person":"entuziasmați","indicative-plural-present-third-person":"entuziasmează","first-person-imperfect-indicative-singular":"entuziasmam","imperfect-indicative-second-person-singular":"entuziasmai","imperfect-indicative-singular-third-person":"entuziasma","first-person-imperfect-indicative-plural":"entuziasmam","imperfect-indicative-plural-second-person":"entuziasmați","imperfect-indicative-plural-third-person":"entuziasmau","first-person-indicative-perfect-singular":"entuziasmai","indicative-perfect-second-person-singular":"entuziasmași","indicative-perfect-singular-third-person":"entuziasmă","first-person-indicative-perfect-plural":"entuziasmarăm","indicative-perfect-plural-second-person":"entuziasmarăți","indicative-perfect-plural-third-person":"entuziasmară","first-person-indicative-pluperfect-singular":"entuziasmasem","indicative-pluperfect-second-person-singular":"entuziasmaseși","indicative-pluperfect-singular-third-person":"entuziasmase","first-person-indicative-pluperfect-plural":"entuziasmaserăm","indicative-pluperfect-plural-second-person":"entuziasmaserăți","indicative-pluperfect-plural-third-person":"entuziasmaseră","first-person-present-singular-subjunctive":"să entuziasmez","present-second-person-singular-subjunctive":"să entuziasmezi","present-singular-subjunctive-third-person":"să entuziasmeze","first-person-plural-present-subjunctive":"să entuziasmăm","plural-present-second-person-subjunctive":"să entuziasmați","plural-present-subjunctive-third-person":"să entuziasmeze","imperative-second-person-singular":"entuziasmează","imperative-plural-second-person":"entuziasmați","imperative-negative-second-person-singular":"nu entuziasma","imperative-negative-plural-second-person":"nu entuziasmați"}},{"word":"entuziasmare","pos":"noun","definitions":["excitement"],"forms":{"plural":"entuziasmări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"entuziasmare","accusative-definite-nominative-singular":"entuziasmarea","accusative-indefinite-nominative-plural":"entuziasmări","accusative-definite-nominative-plural":"entuziasmările","dative-genitive-indefinite-singular":"entuziasmări","dative-definite-genitive-singular":"entuziasmării","dative-genitive-indefinite-plural":"entuziasmări","dative-definite-genitive-plural":"entuziasmărilor","singular-vocative":"entuziasmare","plural-vocative":"entuziasmărilor"}},{"word":"entuziasmat","pos":"adj","definitions":["enthusiastic"],"forms":{"feminine-singular":"entuziasmată","masculine-plural":"entuziasmați","feminine-neuter-plural":"entuziasmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entuziasmat","error-unrecognized-form-feminine-indefinite-singular":"entuziasmată","error-unrecognized-form-indefinite-masculine-plural":"entuziasmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"entuziasmate","definite-error-unrecognized-form-masculine-neuter-singular":"entuziasmatul","definite-error-unrecognized-form-feminine-singular":"entuziasmata","definite-error-unrecognized-form-masculine-plural":"entuziasmații","definite-error-unrecognized-form-feminine-neuter-plural":"entuziasmatele"}},{"word":"entuziast","pos":"adj","definitions":["enthusiastic"],"forms":{"feminine-singular":"entuziastă","masculine-plural":"entuziaști","feminine-neuter-plural":"entuziaste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entuziast","error-unrecognized-form-feminine-indefinite-singular":"entuziastă","error-unrecognized-form-indefinite-masculine-plural":"entuziaști","error-unrecognized-form-feminine-indefinite-neuter-plural":"entuziaste","definite-error-unrecognized-form-masculine-neuter-singular":"entuziastul","definite-error-unrecognized-form-feminine-singular":"entuziasta","definite-error-unrecognized-form-masculine-plural":"entuziaștii","definite-error-unrecognized-form-feminine-neuter-plural":"entuziastele"}},{"word":"entuziastic","pos":"adj","definitions":["enthusiastic"],"forms":{"feminine-singular":"entuziastică","masculine-plural":"entuziastici","feminine-neuter-plural":"entuziastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"entuziastic","error-unrecognized-form-feminine-indefinite-singular":"entuziastică","error-unrecognized-form-indefinite-masculine-plural":"entuziastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"entuziastice","definite-error-unrecognized-form-masculine-neuter-singular":"entuziasticul","definite-error-unrecognized-form-feminine-singular":"entuziastica","definite-error-unrecognized-form-masculine-plural":"entuziasticii","definite-error-unrecognized-form-feminine-neuter-plural":"entuziasticele"}},{"word":"Enucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enucă"}},{"word":"enucleare","pos":"noun","definitions":["to enucleate"],"forms":{"plural":"enucleări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enucleare","accusative-definite-nominative-singular":"enuclearea","accusative-indefinite-nominative-plural":"enucleări","accusative-definite-nominative-plural":"enucleările","dative-genitive-indefinite-singular":"enucleări","dative-definite-genitive-singular":"enucleării","dative-genitive-indefinite-plural":"enucleări","dative-definite-genitive-plural":"enucleărilor","singular-vocative":"enucleare","plural-vocative":"enucleărilor"}},{"word":"enucleație","pos":"noun","definitions":["enucleation"],"forms":{"plural":"enucleații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enucleație","accusative-definite-nominative-singular":"enucleația","accusative-indefinite-nominative-plural":"enucleații","accusative-definite-nominative-plural":"enucleațiile","dative-genitive-indefinite-singular":"enucleații","dative-definite-genitive-singular":"enucleației","dative-genitive-indefinite-plural":"enucleații","dative-definite-genitive-plural":"enucleațiilor","singular-vocative":"enucleație","plural-vocative":"enucleațiilor"}},{"word":"enucleațiune","pos":"noun","definitions":["obsolete form of enucleație"],"forms":{"plural":"enucleațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enucleațiune","accusative-definite-nominative-singular":"enucleațiunea","accusative-indefinite-nominative-plural":"enucleațiuni","accusative-definite-nominative-plural":"enucleațiunile","dative-genitive-indefinite-singular":"enucleațiuni","dative-definite-genitive-singular":"enucleațiunii","dative-genitive-indefinite-plural":"enucleațiuni","dative-definite-genitive-plural":"enucleațiunilor","singular-vocative":"enucleațiune","plural-vocative":"enucleațiunilor"}},{"word":"Enulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Enulescu"}},{"word":"enumera","pos":"verb","definitions":["to enumerate"],"forms":{"canonical":"a enumera 1st conjugation","present-singular-third-person":"enumeră","participle-past":"enumerat","subjunctive-third-person":"enumere","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a enumera","gerund":"enumerând","first-person-indicative-present-singular":"enumer","indicative-present-second-person-singular":"enumeri","indicative-present-singular-third-person":"enumeră","first-person-indicative-plural-present":"enumerăm","indicative-plural-present-second-person":"enumerați","indicative-plural-present-third-person":"enumeră","first-person-imperfect-indicative-singular":"enumeram","imperfect-indicative-second-person-singular":"enumerai","imperfect-indicative-singular-third-person":"enumera","first-person-imperfect-indicative-plural":"enumeram","imperfect-indicative-plural-second-person":"enumerați","imperfect-indicative-plural-third-person":"enumerau","first-person-indicative-perfect-singular":"enumerai","indicative-perfect-second-person-singular":"enumerași","indicative-perfect-singular-third-person":"enumeră","first-person-indicative-perfect-plural":"enumerarăm","indicative-perfect-plural-second-person":"enumerarăți","indicative-perfect-plural-third-person":"enumerară","first-person-indicative-pluperfect-singular":"enumerasem","indicative-pluperfect-second-person-singular":"enumeraseși","indicative-pluperfect-singular-third-person":"enumerase","first-person-indicative-pluperfect-plural":"enumeraserăm","indicative-pluperfect-plural-second-person":"enumeraserăți","indicative-pluperfect-plural-third-person":"enumeraseră","first-person-present-singular-subjunctive":"să enumer","present-second-person-singular-subjunctive":"să enumeri","present-singular-subjunctive-third-person":"să enumere","first-person-plural-present-subjunctive":"să enumerăm","plural-present-second-person-subjunctive":"să enumerați","plural-present-subjunctive-third-person":"să enumere","imperative-second-person-singular":"enumeră","imperative-plural-second-person":"enumerați","imperative-negative-second-person-singular":"nu enumera","imperative-negative-plural-second-person":"nu enumerați"}},{"word":"enumerabil","pos":"adj","definitions":["enumerable"],"forms":{"feminine-singular":"enumerabilă","masculine-plural":"enumerabili","feminine-neuter-plural":"enumerabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enumerabil","error-unrecognized-form-feminine-indefinite-singular":"enumerabilă","error-unrecognized-form-indefinite-masculine-plural":"enumerabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"enumerabile","definite-error-unrecognized-form-masculine-neuter-singular":"enumerabilul","definite-error-unrecognized-form-feminine-singular":"enumerabila","definite-error-unrecognized-form-masculine-plural":"enumerabilii","definite-error-unrecognized-form-feminine-neuter-plural":"enumerabilele"}},{"word":"enumerare","pos":"noun","definitions":["enumeration"],"forms":{"plural":"enumerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enumerare","accusative-definite-nominative-singular":"enumerarea","accusative-indefinite-nominative-plural":"enumerări","accusative-definite-nominative-plural":"enumerările","dative-genitive-indefinite-singular":"enumerări","dative-definite-genitive-singular":"enumerării","dative-genitive-indefinite-plural":"enumerări","dative-definite-genitive-plural":"enumerărilor","singular-vocative":"enumerare","plural-vocative":"enumerărilor"}},{"word":"enumerat","pos":"adj","definitions":["enumerated"],"forms":{"feminine-singular":"enumerată","masculine-plural":"enumerați","feminine-neuter-plural":"enumerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enumerat","error-unrecognized-form-feminine-indefinite-singular":"enumerată","error-unrecognized-form-indefinite-masculine-plural":"enumerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"enumerate","definite-error-unrecognized-form-masculine-neuter-singular":"enumeratul","definite-error-unrecognized-form-feminine-singular":"enumerata","definite-error-unrecognized-form-masculine-plural":"enumerații","definite-error-unrecognized-form-feminine-neuter-plural":"enumeratele"}},{"word":"enumerat","pos":"verb","definitions":["past participle of enumera"],"forms":{"participle-past":"of enumera"}},{"word":"enumerație","pos":"noun","definitions":["enumeration"],"forms":{"plural":"enumerații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enumerație","accusative-definite-nominative-singular":"enumerația","accusative-indefinite-nominative-plural":"enumerații","accusative-definite-nominative-plural":"enumerațiile","dative-genitive-indefinite-singular":"enumerații","dative-definite-genitive-singular":"enumerației","dative-genitive-indefinite-plural":"enumerații","dative-definite-genitive-plural":"enumerațiilor","singular-vocative":"enumerație","plural-vocative":"enumerațiilor"}},{"word":"enumerațiune","pos":"noun","definitions":["obsolete form of enumerație"],"forms":{"plural":"enumerațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enumerațiune","accusative-definite-nominative-singular":"enumerațiunea","accusative-indefinite-nominative-plural":"enumerațiuni","accusative-definite-nominative-plural":"enumerațiunile","dative-genitive-indefinite-singular":"enumerațiuni","dative-definite-genitive-singular":"enumerațiunii","dative-genitive-indefinite-plural":"enumerațiuni","dative-definite-genitive-plural":"enumerațiunilor","singular-vocative":"enumerațiune","plural-vocative":"enumerațiunilor"}},{"word":"enumerativ","pos":"adj","definitions":["enumerative"],"forms":{"feminine-singular":"enumerativă","masculine-plural":"enumerativi","feminine-neuter-plural":"enumerative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enumerativ","error-unrecognized-form-feminine-indefinite-singular":"enumerativă","error-unrecognized-form-indefinite-masculine-plural":"enumerativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"enumerative","definite-error-unrecognized-form-masculine-neuter-singular":"enumerativul","definite-error-unrecognized-form-feminine-singular":"enumerativa","definite-error-unrecognized-form-masculine-plural":"enumerativii","definite-error-unrecognized-form-feminine-neuter-plural":"enumerativele"}},{"word":"enunț","pos":"noun","definitions":["enunciation, statement"],"forms":{"plural":"enunțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"enunț","accusative-definite-nominative-singular":"enunțul","accusative-indefinite-nominative-plural":"enunțuri","accusative-definite-nominative-plural":"enunțurile","dative-genitive-indefinite-singular":"enunț","dative-definite-genitive-singular":"enunțului","dative-genitive-indefinite-plural":"enunțuri","dative-definite-genitive-plural":"enunțurilor","singular-vocative":"enunțule","plural-vocative":"enunțurilor"}},{"word":"enunța","pos":"verb","definitions":["to enunciate"],"forms":{"canonical":"a enunța 1st conjugation","present-singular-third-person":"enunță","participle-past":"enunțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a enunța","gerund":"enunțând","first-person-indicative-present-singular":"enunț","indicative-present-second-person-singular":"enunți","indicative-present-singular-third-person":"enunță","first-person-indicative-plural-present":"enunțăm","indicative-plural-present-second-person":"enunțați","indicative-plural-present-third-person":"enunță","first-person-imperfect-indicative-singular":"enunțam","imperfect-indicative-second-person-singular":"enunțai","imperfect-indicative-singular-third-person":"enunța","first-person-imperfect-indicative-plural":"enunțam","imperfect-indicative-plural-second-person":"enunțați","imperfect-indicative-plural-third-person":"enunțau","first-person-indicative-perfect-singular":"enunțai","indicative-perfect-second-person-singular":"enunțași","indicative-perfect-singular-third-person":"enunță","first-person-indicative-perfect-plural":"enunțarăm","indicative-perfect-plural-second-person":"enunțarăți","indicative-perfect-plural-third-person":"enunțară","first-person-indicative-pluperfect-singular":"enunțasem","indicative-pluperfect-second-person-singular":"enunțaseși","indicative-pluperfect-singular-third-person":"enunțase","first-person-indicative-pluperfect-plural":"enunțaserăm","indicative-pluperfect-plural-second-person":"enunțaserăți","indicative-pluperfect-plural-third-person":"enunțaseră","first-person-present-singular-subjunctive":"să enunț","present-second-person-singular-subjunctive":"să enunți","present-singular-subjunctive-third-person":"să enunțe","first-person-plural-present-subjunctive":"să enunțăm","plural-present-second-person-subjunctive":"să enunțați","plural-present-subjunctive-third-person":"să enunțe","imperative-second-person-singular":"enunță","imperative-plural-second-person":"enunțați","imperative-negative-second-person-singular":"nu enunța","imperative-negative-plural-second-person":"nu enunțați"}},{"word":"enunțare","pos":"noun","definitions":["enunciation"],"forms":{"plural":"enunțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"enunțare","accusative-definite-nominative-singular":"enunțarea","accusative-indefinite-nominative-plural":"enunțări","accusative-definite-nominative-plural":"enunțările","dative-genitive-indefinite-singular":"enunțări","dative-definite-genitive-singular":"enunțării","dative-genitive-indefinite-plural":"enunțări","dative-definite-genitive-plural":"enunțărilor","singular-vocative":"enunțare","plural-vocative":"enunțărilor"}},{"word":"enunțător","pos":"adj","definitions":["enunciative"],"forms":{"feminine-singular":"enunțătoare","masculine-plural":"enunțători","feminine-neuter-plural":"enunțătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enunțător","error-unrecognized-form-feminine-indefinite-singular":"enunțătoare","error-unrecognized-form-indefinite-masculine-plural":"enunțători","error-unrecognized-form-feminine-indefinite-neuter-plural":"enunțătoare","definite-error-unrecognized-form-masculine-neuter-singular":"enunțătorul","definite-error-unrecognized-form-feminine-singular":"enunțătoarea","definite-error-unrecognized-form-masculine-plural":"enunțătorii","definite-error-unrecognized-form-feminine-neuter-plural":"enunțătoarele"}},{"word":"enunțiativ","pos":"adj","definitions":["enunciative"],"forms":{"feminine-singular":"enunțiativă","masculine-plural":"enunțiativi","feminine-neuter-plural":"enunțiative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enunțiativ","error-unrecognized-form-feminine-indefinite-singular":"enunțiativă","error-unrecognized-form-indefinite-masculine-plural":"enunțiativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"enunțiative","definite-error-unrecognized-form-masculine-neuter-singular":"enunțiativul","definite-error-unrecognized-form-feminine-singular":"enunțiativa","definite-error-unrecognized-form-masculine-plural":"enunțiativii","definite-error-unrecognized-form-feminine-neuter-plural":"enunțiativele"}},{"word":"enuretic","pos":"adj","definitions":["enuretic"],"forms":{"feminine-singular":"enuretică","masculine-plural":"enuretici","feminine-neuter-plural":"enuretice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enuretic","error-unrecognized-form-feminine-indefinite-singular":"enuretică","error-unrecognized-form-indefinite-masculine-plural":"enuretici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enuretice","definite-error-unrecognized-form-masculine-neuter-singular":"enureticul","definite-error-unrecognized-form-feminine-singular":"enuretica","definite-error-unrecognized-form-masculine-plural":"enureticii","definite-error-unrecognized-form-feminine-neuter-plural":"enureticele"}},{"word":"enurezis","pos":"noun","definitions":["enuresis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"enurezis","accusative-definite-nominative":"enurezisul","dative-genitive-indefinite":"enurezis","dative-definite-genitive":"enurezisului","vocative":"enurezisule"}},{"word":"Enuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enuș"}},{"word":"Enuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Enuță"}},{"word":"enzimă","pos":"noun","definitions":["enzyme"],"forms":{"plural":"enzime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"enzimă","accusative-definite-nominative-singular":"enzima","accusative-indefinite-nominative-plural":"enzime","accusative-definite-nominative-plural":"enzimele","dative-genitive-indefinite-singular":"enzime","dative-definite-genitive-singular":"enzimei","dative-genitive-indefinite-plural":"enzime","dative-definite-genitive-plural":"enzimelor","singular-vocative":"enzimă","plural-vocative":"enzimelor"}},{"word":"enzimatic","pos":"adj","definitions":["enzymatic"],"forms":{"feminine-singular":"enzimatică","masculine-plural":"enzimatici","feminine-neuter-plural":"enzimatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enzimatic","error-unrecognized-form-feminine-indefinite-singular":"enzimatică","error-unrecognized-form-indefinite-masculine-plural":"enzimatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enzimatice","definite-error-unrecognized-form-masculine-neuter-singular":"enzimaticul","definite-error-unrecognized-form-feminine-singular":"enzimatica","definite-error-unrecognized-form-masculine-plural":"enzimaticii","definite-error-unrecognized-form-feminine-neuter-plural":"enzimaticele"}},{"word":"enzimologie","pos":"noun","definitions":["enzymology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"enzimologie","accusative-definite-nominative":"enzimologia","dative-genitive-indefinite":"enzimologii","dative-definite-genitive":"enzimologiei","vocative":"enzimologie"}},{"word":"enzimopatie","pos":"noun","definitions":["enzymopathy"],"forms":{"plural":"enzimopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"enzimopatie","accusative-definite-nominative-singular":"enzimopatia","accusative-indefinite-nominative-plural":"enzimopatii","accusative-definite-nominative-plural":"enzimopatiile","dative-genitive-indefinite-singular":"enzimopatii","dative-definite-genitive-singular":"enzimopatiei","dative-genitive-indefinite-plural":"enzimopatii","dative-definite-genitive-plural":"enzimopatiilor","singular-vocative":"enzimopatie","plural-vocative":"enzimopatiilor"}},{"word":"enzootic","pos":"adj","definitions":["enzootic"],"forms":{"feminine-singular":"enzootică","masculine-plural":"enzootici","feminine-neuter-plural":"enzootice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"enzootic","error-unrecognized-form-feminine-indefinite-singular":"enzootică","error-unrecognized-form-indefinite-masculine-plural":"enzootici","error-unrecognized-form-feminine-indefinite-neuter-plural":"enzootice","definite-error-unrecognized-form-masculine-neuter-singular":"enzooticul","definite-error-unrecognized-form-feminine-singular":"enzootica","definite-error-unrecognized-form-masculine-plural":"enzooticii","definite-error-unrecognized-form-feminine-neuter-plural":"enzooticele"}},{"word":"enzootie","pos":"noun","definitions":["enzooty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"enzootie","accusative-definite-nominative":"enzootia","dative-genitive-indefinite":"enzootii","dative-definite-genitive":"enzootiei","vocative":"enzootie"}},{"word":"eoantrop","pos":"noun","definitions":["Eoanthropus"],"forms":{"plural":"eoantropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eoantrop","accusative-definite-nominative-singular":"eoantropul","accusative-indefinite-nominative-plural":"eoantropi","accusative-definite-nominative-plural":"eoantropii","dative-genitive-indefinite-singular":"eoantrop","dative-definite-genitive-singular":"eoantropului","dative-genitive-indefinite-plural":"eoantropi","dative-definite-genitive-plural":"eoantropilor","singular-vocative":"eoantropule","plural-vocative":"eoantropilor"}},{"word":"eocen","pos":"noun","definitions":["Eocene"],"forms":{"plural":"eoceni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eocen","accusative-definite-nominative-singular":"eocenul","accusative-indefinite-nominative-plural":"eoceni","accusative-definite-nominative-plural":"eocenile","dative-genitive-indefinite-singular":"eocen","dative-definite-genitive-singular":"eocenului","dative-genitive-indefinite-plural":"eoceni","dative-definite-genitive-plural":"eocenilor","singular-vocative":"eocenule","plural-vocative":"eocenilor"}},{"word":"eocenic","pos":"adj","definitions":["Eocene"],"forms":{"feminine-singular":"eocenică","masculine-plural":"eocenici","feminine-neuter-plural":"eocenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eocenic","error-unrecognized-form-feminine-indefinite-singular":"eocenică","error-unrecognized-form-indefinite-masculine-plural":"eocenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eocenice","definite-error-unrecognized-form-masculine-neuter-singular":"eocenicul","definite-error-unrecognized-form-feminine-singular":"eocenica","definite-error-unrecognized-form-masculine-plural":"eocenicii","definite-error-unrecognized-form-feminine-neuter-plural":"eocenicele"}},{"word":"eolian","pos":"adj","definitions":["aeolian"],"forms":{"feminine-singular":"eoliană","masculine-plural":"eolieni","feminine-neuter-plural":"eoliene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eolian","error-unrecognized-form-feminine-indefinite-singular":"eoliană","error-unrecognized-form-indefinite-masculine-plural":"eolieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eoliene","definite-error-unrecognized-form-masculine-neuter-singular":"eolianul","definite-error-unrecognized-form-feminine-singular":"eoliana","definite-error-unrecognized-form-masculine-plural":"eolienii","definite-error-unrecognized-form-feminine-neuter-plural":"eolienele"}},{"word":"eolină","pos":"noun","definitions":["harmonica"],"forms":{"plural":"eoline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eolină","accusative-definite-nominative-singular":"eolina","accusative-indefinite-nominative-plural":"eoline","accusative-definite-nominative-plural":"eolinele","dative-genitive-indefinite-singular":"eoline","dative-definite-genitive-singular":"eolinei","dative-genitive-indefinite-plural":"eoline","dative-definite-genitive-plural":"eolinelor","singular-vocative":"eolină","plural-vocative":"eolinelor"}},{"word":"eolit","pos":"noun","definitions":["eolith"],"forms":{"plural":"eolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eolit","accusative-definite-nominative-singular":"eolitul","accusative-indefinite-nominative-plural":"eolite","accusative-definite-nominative-plural":"eolitele","dative-genitive-indefinite-singular":"eolit","dative-definite-genitive-singular":"eolitului","dative-genitive-indefinite-plural":"eolite","dative-definite-genitive-plural":"eolitelor","singular-vocative":"eolitule","plural-vocative":"eolitelor"}},{"word":"eolitic","pos":"adj","definitions":["eolithic"],"forms":{"feminine-singular":"eolitică","masculine-plural":"eolitici","feminine-neuter-plural":"eolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eolitic","error-unrecognized-form-feminine-indefinite-singular":"eolitică","error-unrecognized-form-indefinite-masculine-plural":"eolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eolitice","definite-error-unrecognized-form-masculine-neuter-singular":"eoliticul","definite-error-unrecognized-form-feminine-singular":"eolitica","definite-error-unrecognized-form-masculine-plural":"eoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"eoliticele"}},{"word":"eolotrop","pos":"adj","definitions":["aeolotropic"],"forms":{"feminine-singular":"eolotropă","masculine-plural":"eolotropi","feminine-neuter-plural":"eolotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eolotrop","error-unrecognized-form-feminine-indefinite-singular":"eolotropă","error-unrecognized-form-indefinite-masculine-plural":"eolotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eolotrope","definite-error-unrecognized-form-masculine-neuter-singular":"eolotropul","definite-error-unrecognized-form-feminine-singular":"eolotropa","definite-error-unrecognized-form-masculine-plural":"eolotropii","definite-error-unrecognized-form-feminine-neuter-plural":"eolotropele"}},{"word":"eolotropie","pos":"noun","definitions":["eolotropy"],"forms":{"plural":"eolotropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eolotropie","accusative-definite-nominative-singular":"eolotropia","accusative-indefinite-nominative-plural":"eolotropii","accusative-definite-nominative-plural":"eolotropiile","dative-genitive-indefinite-singular":"eolotropii","dative-definite-genitive-singular":"eolotropiei","dative-genitive-indefinite-plural":"eolotropii","dative-definite-genitive-plural":"eolotropiilor","singular-vocative":"eolotropie","plural-vocative":"eolotropiilor"}},{"word":"eon","pos":"noun","definitions":["eon"],"forms":{"plural":"eoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eon","accusative-definite-nominative-singular":"eonul","accusative-indefinite-nominative-plural":"eoni","accusative-definite-nominative-plural":"eonii","dative-genitive-indefinite-singular":"eon","dative-definite-genitive-singular":"eonului","dative-genitive-indefinite-plural":"eoni","dative-definite-genitive-plural":"eonilor","singular-vocative":"eonule","plural-vocative":"eonilor"}},{"word":"eozină","pos":"noun","definitions":["eosin"],"forms":{"plural":"eozine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eozină","accusative-definite-nominative-singular":"eozina","accusative-indefinite-nominative-plural":"eozine","accusative-definite-nominative-plural":"eozinele","dative-genitive-indefinite-singular":"eozine","dative-definite-genitive-singular":"eozinei","dative-genitive-indefinite-plural":"eozine","dative-definite-genitive-plural":"eozinelor","singular-vocative":"eozină","plural-vocative":"eozinelor"}},{"word":"eozinocit","pos":"noun","definitions":["eosinocyte"],"forms":{"plural":"eozinocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eozinocit","accusative-definite-nominative-singular":"eozinocitul","accusative-indefinite-nominative-plural":"eozinocite","accusative-definite-nominative-plural":"eozinocitele","dative-genitive-indefinite-singular":"eozinocit","dative-definite-genitive-singular":"eozinocitului","dative-genitive-indefinite-plural":"eozinocite","dative-definite-genitive-plural":"eozinocitelor","singular-vocative":"eozinocitule","plural-vocative":"eozinocitelor"}},{"word":"eozinofil","pos":"adj","definitions":["eosinophilic"],"forms":{"feminine-singular":"eozinofilă","masculine-plural":"eozinofili","feminine-neuter-plural":"eozinofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eozinofil","error-unrecognized-form-feminine-indefinite-singular":"eozinofilă","error-unrecognized-form-indefinite-masculine-plural":"eozinofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"eozinofile","definite-error-unrecognized-form-masculine-neuter-singular":"eozinofilul","definite-error-unrecognized-form-feminine-singular":"eozinofila","definite-error-unrecognized-form-masculine-plural":"eozinofilii","definite-error-unrecognized-form-feminine-neuter-plural":"eozinofilele"}},{"word":"eozinofilie","pos":"noun","definitions":["eosinophilia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eozinofilie","accusative-definite-nominative":"eozinofilia","dative-genitive-indefinite":"eozinofilii","dative-definite-genitive":"eozinofiliei","vocative":"eozinofilie"}},{"word":"eozinopenie","pos":"noun","definitions":["eosinopenia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eozinopenie","accusative-definite-nominative":"eozinopenia","dative-genitive-indefinite":"eozinopenii","dative-definite-genitive":"eozinopeniei","vocative":"eozinopenie"}},{"word":"eozoic","pos":"adj","definitions":["Eozoic"],"forms":{"feminine-singular":"eozoică","masculine-plural":"eozoici","feminine-neuter-plural":"eozoice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eozoic","error-unrecognized-form-feminine-indefinite-singular":"eozoică","error-unrecognized-form-indefinite-masculine-plural":"eozoici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eozoice","definite-error-unrecognized-form-masculine-neuter-singular":"eozoicul","definite-error-unrecognized-form-feminine-singular":"eozoica","definite-error-unrecognized-form-masculine-plural":"eozoicii","definite-error-unrecognized-form-feminine-neuter-plural":"eozoicele"}},{"word":"eozoic","pos":"noun","definitions":["Eozoic era"],"forms":{"plural":"eozoici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eozoic","accusative-definite-nominative-singular":"eozoicul","accusative-indefinite-nominative-plural":"eozoici","accusative-definite-nominative-plural":"eozoicile","dative-genitive-indefinite-singular":"eozoic","dative-definite-genitive-singular":"eozoicului","dative-genitive-indefinite-plural":"eozoici","dative-definite-genitive-plural":"eozoicilor","singular-vocative":"eozoicule","plural-vocative":"eozoicilor"}},{"word":"epactă","pos":"noun","definitions":["epact"],"forms":{"plural":"epacte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epactă","accusative-definite-nominative-singular":"epacta","accusative-indefinite-nominative-plural":"epacte","accusative-definite-nominative-plural":"epactele","dative-genitive-indefinite-singular":"epacte","dative-definite-genitive-singular":"epactei","dative-genitive-indefinite-plural":"epacte","dative-definite-genitive-plural":"epactelor","singular-vocative":"epactă","plural-vocative":"epactelor"}},{"word":"epactal","pos":"adj","definitions":["epactal"],"forms":{"feminine-singular":"epactală","masculine-plural":"epactali","feminine-neuter-plural":"epactale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epactal","error-unrecognized-form-feminine-indefinite-singular":"epactală","error-unrecognized-form-indefinite-masculine-plural":"epactali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epactale","definite-error-unrecognized-form-masculine-neuter-singular":"epactalul","definite-error-unrecognized-form-feminine-singular":"epactala","definite-error-unrecognized-form-masculine-plural":"epactalii","definite-error-unrecognized-form-feminine-neuter-plural":"epactalele"}},{"word":"epagogă","pos":"noun","definitions":["induction"],"forms":{"plural":"epagoge","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epagogă","accusative-definite-nominative-singular":"epagoga","accusative-indefinite-nominative-plural":"epagoge","accusative-definite-nominative-plural":"epagogele","dative-genitive-indefinite-singular":"epagoge","dative-definite-genitive-singular":"epagogei","dative-genitive-indefinite-plural":"epagoge","dative-definite-genitive-plural":"epagogelor","singular-vocative":"epagogă","plural-vocative":"epagogelor"}},{"word":"epagogic","pos":"adj","definitions":["epagogic"],"forms":{"feminine-singular":"epagogică","masculine-plural":"epagogici","feminine-neuter-plural":"epagogice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epagogic","error-unrecognized-form-feminine-indefinite-singular":"epagogică","error-unrecognized-form-indefinite-masculine-plural":"epagogici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epagogice","definite-error-unrecognized-form-masculine-neuter-singular":"epagogicul","definite-error-unrecognized-form-feminine-singular":"epagogica","definite-error-unrecognized-form-masculine-plural":"epagogicii","definite-error-unrecognized-form-feminine-neuter-plural":"epagogicele"}},{"word":"epanaforă","pos":"noun","definitions":["anaphora"],"forms":{"plural":"epanafore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epanaforă","accusative-definite-nominative-singular":"epanafora","accusative-indefinite-nominative-plural":"epanafore","accusative-definite-nominative-plural":"epanaforele","dative-genitive-indefinite-singular":"epanafore","dative-definite-genitive-singular":"epanaforei","dative-genitive-indefinite-plural":"epanafore","dative-definite-genitive-plural":"epanaforelor","singular-vocative":"epanaforă","plural-vocative":"epanaforelor"}},{"word":"epanalepsă","pos":"noun","definitions":["epanalepsis"],"forms":{"plural":"epanalepse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epanalepsă","accusative-definite-nominative-singular":"epanalepsa","accusative-indefinite-nominative-plural":"epanalepse","accusative-definite-nominative-plural":"epanalepsele","dative-genitive-indefinite-singular":"epanalepse","dative-definite-genitive-singular":"epanalepsei","dative-genitive-indefinite-plural":"epanalepse","dative-definite-genitive-plural":"epanalepselor","singular-vocative":"epanalepsă","plural-vocative":"epanalepselor"}},{"word":"epandaj","pos":"noun","definitions":["muck spreading"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epandaj","accusative-definite-nominative":"epandajul","dative-genitive-indefinite":"epandaj","dative-definite-genitive":"epandajului","vocative":"epandajule"}},{"word":"epaniol","pos":"noun","definitions":["spaniel"],"forms":{"plural":"epanioli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epaniol","accusative-definite-nominative-singular":"epaniolul","accusative-indefinite-nominative-plural":"epanioli","accusative-definite-nominative-plural":"epaniolii","dative-genitive-indefinite-singular":"epaniol","dative-definite-genitive-singular":"epaniolului","dative-genitive-indefinite-plural":"epanioli","dative-definite-genitive-plural":"epaniolilor","singular-vocative":"epaniolule","plural-vocative":"epaniolilor"}},{"word":"epanodă","pos":"noun","definitions":["epanodos"],"forms":{"plural":"epanode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epanodă","accusative-definite-nominative-singular":"epanoda","accusative-indefinite-nominative-plural":"epanode","accusative-definite-nominative-plural":"epanodele","dative-genitive-indefinite-singular":"epanode","dative-definite-genitive-singular":"epanodei","dative-genitive-indefinite-plural":"epanode","dative-definite-genitive-plural":"epanodelor","singular-vocative":"epanodă","plural-vocative":"epanodelor"}},{"word":"epanșament","pos":"noun","definitions":["effusion"],"forms":{"plural":"epanșamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epanșament","accusative-definite-nominative-singular":"epanșamentul","accusative-indefinite-nominative-plural":"epanșamente","accusative-definite-nominative-plural":"epanșamentele","dative-genitive-indefinite-singular":"epanșament","dative-definite-genitive-singular":"epanșamentului","dative-genitive-indefinite-plural":"epanșamente","dative-definite-genitive-plural":"epanșamentelor","singular-vocative":"epanșamentule","plural-vocative":"epanșamentelor"}},{"word":"eparh","pos":"noun","definitions":["eparch"],"forms":{"plural":"eparhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eparh","accusative-definite-nominative-singular":"eparhul","accusative-indefinite-nominative-plural":"eparhi","accusative-definite-nominative-plural":"eparhii","dative-genitive-indefinite-singular":"eparh","dative-definite-genitive-singular":"eparhului","dative-genitive-indefinite-plural":"eparhi","dative-definite-genitive-plural":"eparhilor","singular-vocative":"eparhule","plural-vocative":"eparhilor"}},{"word":"eparhial","pos":"adj","definitions":["diocesan"],"forms":{"feminine-singular":"eparhială","masculine-plural":"eparhiali","feminine-neuter-plural":"eparhiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eparhial","error-unrecognized-form-feminine-indefinite-singular":"eparhială","error-unrecognized-form-indefinite-masculine-plural":"eparhiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"eparhiale","definite-error-unrecognized-form-masculine-neuter-singular":"eparhialul","definite-error-unrecognized-form-feminine-singular":"eparhiala","definite-error-unrecognized-form-masculine-plural":"eparhialii","definite-error-unrecognized-form-feminine-neuter-plural":"eparhialele"}},{"word":"eparhialnic","pos":"adj","definitions":["diocesan"],"forms":{"feminine-singular":"eparhialnică","masculine-plural":"eparhialnici","feminine-neuter-plural":"eparhialnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eparhialnic","error-unrecognized-form-feminine-indefinite-singular":"eparhialnică","error-unrecognized-form-indefinite-masculine-plural":"eparhialnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eparhialnice","definite-error-unrecognized-form-masculine-neuter-singular":"eparhialnicul","definite-error-unrecognized-form-feminine-singular":"eparhialnica","definite-error-unrecognized-form-masculine-plural":"eparhialnicii","definite-error-unrecognized-form-feminine-neuter-plural":"eparhialnicele"}},{"word":"eparhian","pos":"noun","definitions":["eparchial"],"forms":{"plural":"eparhiani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eparhian","accusative-definite-nominative-singular":"eparhianul","accusative-indefinite-nominative-plural":"eparhiani","accusative-definite-nominative-plural":"eparhianii","dative-genitive-indefinite-singular":"eparhian","dative-definite-genitive-singular":"eparhianului","dative-genitive-indefinite-plural":"eparhiani","dative-definite-genitive-plural":"eparhianilor","singular-vocative":"eparhianule","plural-vocative":"eparhianilor"}},{"word":"eparhic","pos":"adj","definitions":["diocesan"],"forms":{"feminine-singular":"eparhică","masculine-plural":"eparhici","feminine-neuter-plural":"eparhice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eparhic","error-unrecognized-form-feminine-indefinite-singular":"eparhică","error-unrecognized-form-indefinite-masculine-plural":"eparhici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eparhice","definite-error-unrecognized-form-masculine-neuter-singular":"eparhicul","definite-error-unrecognized-form-feminine-singular":"eparhica","definite-error-unrecognized-form-masculine-plural":"eparhicii","definite-error-unrecognized-form-feminine-neuter-plural":"eparhicele"}},{"word":"eparhie","pos":"noun","definitions":["diocese or bishopric in the Orthodox Church; eparchy"],"forms":{"plural":"eparhii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eparhie","accusative-definite-nominative-singular":"eparhia","accusative-indefinite-nominative-plural":"eparhii","accusative-definite-nominative-plural":"eparhiile","dative-genitive-indefinite-singular":"eparhii","dative-definite-genitive-singular":"eparhiei","dative-genitive-indefinite-plural":"eparhii","dative-definite-genitive-plural":"eparhiilor","singular-vocative":"eparhie","plural-vocative":"eparhiilor"}},{"word":"eparhiot","pos":"adj","definitions":["eparchial"],"forms":{"feminine-singular":"eparhiotă","masculine-plural":"eparhioți","feminine-neuter-plural":"eparhiote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eparhiot","error-unrecognized-form-feminine-indefinite-singular":"eparhiotă","error-unrecognized-form-indefinite-masculine-plural":"eparhioți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eparhiote","definite-error-unrecognized-form-masculine-neuter-singular":"eparhiotul","definite-error-unrecognized-form-feminine-singular":"eparhiota","definite-error-unrecognized-form-masculine-plural":"eparhioții","definite-error-unrecognized-form-feminine-neuter-plural":"eparhiotele"}},{"word":"eparhiot","pos":"noun","definitions":["person belonging to an eparchy"],"forms":{"plural":"eparhioți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eparhiot","accusative-definite-nominative-singular":"eparhiotul","accusative-indefinite-nominative-plural":"eparhioți","accusative-definite-nominative-plural":"eparhioții","dative-genitive-indefinite-singular":"eparhiot","dative-definite-genitive-singular":"eparhiotului","dative-genitive-indefinite-plural":"eparhioți","dative-definite-genitive-plural":"eparhioților","singular-vocative":"eparhiotule","plural-vocative":"eparhioților"}},{"word":"eparșicesc","pos":"adj","definitions":["diocesan"],"forms":{"feminine-singular":"eparșicească","plural":"eparșicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eparșicesc","error-unrecognized-form-feminine-indefinite-singular":"eparșicească","error-unrecognized-form-indefinite-masculine-plural":"eparșicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eparșicești","definite-error-unrecognized-form-masculine-neuter-singular":"eparșicescul","definite-error-unrecognized-form-feminine-singular":"eparșiceasca","definite-error-unrecognized-form-masculine-plural":"eparșiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"eparșiceștile"}},{"word":"Eparu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Eparu"}},{"word":"eparven","pos":"noun","definitions":["spavin"],"forms":{"plural":"eparvene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eparven","accusative-definite-nominative-singular":"eparvenul","accusative-indefinite-nominative-plural":"eparvene","accusative-definite-nominative-plural":"eparvenele","dative-genitive-indefinite-singular":"eparven","dative-definite-genitive-singular":"eparvenului","dative-genitive-indefinite-plural":"eparvene","dative-definite-genitive-plural":"eparvenelor","singular-vocative":"eparvenule","plural-vocative":"eparvenelor"}},{"word":"epata","pos":"verb","definitions":["to amaze"],"forms":{"canonical":"a epata 1st conjugation","present-singular-third-person":"epatează","participle-past":"epatat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a epata","gerund":"epatând","first-person-indicative-present-singular":"epatez","indicative-present-second-person-singular":"epatezi","indicative-present-singular-third-person":"epatează","first-person-indicative-plural-present":"epatăm","indicative-plural-present-second-person":"epatați","indicative-plural-present-third-person":"epatează","first-person-imperfect-indicative-singular":"epatam","imperfect-indicative-second-person-singular":"epatai","imperfect-indicative-singular-third-person":"epata","first-person-imperfect-indicative-plural":"epatam","imperfect-indicative-plural-second-person":"epatați","imperfect-indicative-plural-third-person":"epatau","first-person-indicative-perfect-singular":"epatai","indicative-perfect-second-person-singular":"epatași","indicative-perfect-singular-third-person":"epată","first-person-indicative-perfect-plural":"epatarăm","indicative-perfect-plural-second-person":"epatarăți","indicative-perfect-plural-third-person":"epatară","first-person-indicative-pluperfect-singular":"epatasem","indicative-pluperfect-second-person-singular":"epataseși","indicative-pluperfect-singular-third-person":"epatase","first-person-indicative-pluperfect-plural":"epataserăm","indicative-pluperfect-plural-second-person":"epataserăți","indicative-pluperfect-plural-third-person":"epataseră","first-person-present-singular-subjunctive":"să epatez","present-second-person-singular-subjunctive":"să epatezi","present-singular-subjunctive-third-person":"să epateze","first-person-plural-present-subjunctive":"să epatăm","plural-present-second-person-subjunctive":"să epatați","plural-present-subjunctive-third-person":"să epateze","imperative-second-person-singular":"epatează","imperative-plural-second-person":"epatați","imperative-negative-second-person-singular":"nu epata","imperative-negative-plural-second-person":"nu epatați"}},{"word":"epatant","pos":"adj","definitions":["amazing"],"forms":{"feminine-singular":"epatantă","masculine-plural":"epatanți","feminine-neuter-plural":"epatante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epatant","error-unrecognized-form-feminine-indefinite-singular":"epatantă","error-unrecognized-form-indefinite-masculine-plural":"epatanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epatante","definite-error-unrecognized-form-masculine-neuter-singular":"epatantul","definite-error-unrecognized-form-feminine-singular":"epatanta","definite-error-unrecognized-form-masculine-plural":"epatanții","definite-error-unrecognized-form-feminine-neuter-plural":"epatantele"}},{"word":"epavă","pos":"noun","definitions":["wreck"],"forms":{"plural":"epave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epavă","accusative-definite-nominative-singular":"epava","accusative-indefinite-nominative-plural":"epave","accusative-definite-nominative-plural":"epavele","dative-genitive-indefinite-singular":"epave","dative-definite-genitive-singular":"epavei","dative-genitive-indefinite-plural":"epave","dative-definite-genitive-plural":"epavelor","singular-vocative":"epavă","plural-vocative":"epavelor"}},{"word":"ependim","pos":"noun","definitions":["ependyma"],"forms":{"plural":"ependime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ependim","accusative-definite-nominative-singular":"ependimul","accusative-indefinite-nominative-plural":"ependime","accusative-definite-nominative-plural":"ependimele","dative-genitive-indefinite-singular":"ependim","dative-definite-genitive-singular":"ependimului","dative-genitive-indefinite-plural":"ependime","dative-definite-genitive-plural":"ependimelor","singular-vocative":"ependimule","plural-vocative":"ependimelor"}},{"word":"ependimar","pos":"adj","definitions":["ependymal"],"forms":{"feminine-singular":"ependimară","masculine-plural":"ependimari","feminine-neuter-plural":"ependimare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ependimar","error-unrecognized-form-feminine-indefinite-singular":"ependimară","error-unrecognized-form-indefinite-masculine-plural":"ependimari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ependimare","definite-error-unrecognized-form-masculine-neuter-singular":"ependimarul","definite-error-unrecognized-form-feminine-singular":"ependimara","definite-error-unrecognized-form-masculine-plural":"ependimarii","definite-error-unrecognized-form-feminine-neuter-plural":"ependimarele"}},{"word":"ependimită","pos":"noun","definitions":["ependymitis"],"forms":{"plural":"ependimite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ependimită","accusative-definite-nominative-singular":"ependimita","accusative-indefinite-nominative-plural":"ependimite","accusative-definite-nominative-plural":"ependimitele","dative-genitive-indefinite-singular":"ependimite","dative-definite-genitive-singular":"ependimitei","dative-genitive-indefinite-plural":"ependimite","dative-definite-genitive-plural":"ependimitelor","singular-vocative":"ependimită","plural-vocative":"ependimitelor"}},{"word":"epentetic","pos":"adj","definitions":["epenthetic"],"forms":{"feminine-singular":"epentetică","masculine-plural":"epentetici","feminine-neuter-plural":"epentetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epentetic","error-unrecognized-form-feminine-indefinite-singular":"epentetică","error-unrecognized-form-indefinite-masculine-plural":"epentetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epentetice","definite-error-unrecognized-form-masculine-neuter-singular":"epenteticul","definite-error-unrecognized-form-feminine-singular":"epentetica","definite-error-unrecognized-form-masculine-plural":"epenteticii","definite-error-unrecognized-form-feminine-neuter-plural":"epenteticele"}},{"word":"epenteză","pos":"noun","definitions":["epenthesis"],"forms":{"plural":"epenteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epenteză","accusative-definite-nominative-singular":"epenteza","accusative-indefinite-nominative-plural":"epenteze","accusative-definite-nominative-plural":"epentezele","dative-genitive-indefinite-singular":"epenteze","dative-definite-genitive-singular":"epentezei","dative-genitive-indefinite-plural":"epenteze","dative-definite-genitive-plural":"epentezelor","singular-vocative":"epenteză","plural-vocative":"epentezelor"}},{"word":"epeu","pos":"noun","definitions":["sword"],"forms":{"plural":"epee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epeu","accusative-definite-nominative-singular":"epeuul","accusative-indefinite-nominative-plural":"epee","accusative-definite-nominative-plural":"epeele","dative-genitive-indefinite-singular":"epeu","dative-definite-genitive-singular":"epeuului","dative-genitive-indefinite-plural":"epee","dative-definite-genitive-plural":"epeelor","singular-vocative":"epeuule","plural-vocative":"epeelor"}},{"word":"epexegetic","pos":"adj","definitions":["epexegetic"],"forms":{"feminine-singular":"epexegetică","masculine-plural":"epexegetici","feminine-neuter-plural":"epexegetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epexegetic","error-unrecognized-form-feminine-indefinite-singular":"epexegetică","error-unrecognized-form-indefinite-masculine-plural":"epexegetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epexegetice","definite-error-unrecognized-form-masculine-neuter-singular":"epexegeticul","definite-error-unrecognized-form-feminine-singular":"epexegetica","definite-error-unrecognized-form-masculine-plural":"epexegeticii","definite-error-unrecognized-form-feminine-neuter-plural":"epexegeticele"}}];
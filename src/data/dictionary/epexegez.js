@@ -0,0 +1 @@
+export default [{"word":"epexegeză","pos":"noun","definitions":["epexegesis"],"forms":{"plural":"epexegeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epexegeză","accusative-definite-nominative-singular":"epexegeza","accusative-indefinite-nominative-plural":"epexegeze","accusative-definite-nominative-plural":"epexegezele","dative-genitive-indefinite-singular":"epexegeze","dative-definite-genitive-singular":"epexegezei","dative-genitive-indefinite-plural":"epexegeze","dative-definite-genitive-plural":"epexegezelor","singular-vocative":"epexegeză","plural-vocative":"epexegezelor"}},{"word":"epibat","pos":"noun","definitions":["epibate (soldier of ancient Greek navies)"],"forms":{"plural":"epibați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epibat","accusative-definite-nominative-singular":"epibatul","accusative-indefinite-nominative-plural":"epibați","accusative-definite-nominative-plural":"epibații","dative-genitive-indefinite-singular":"epibat","dative-definite-genitive-singular":"epibatului","dative-genitive-indefinite-plural":"epibați","dative-definite-genitive-plural":"epibaților","singular-vocative":"epibatule","plural-vocative":"epibaților"}},{"word":"epic","pos":"adj","definitions":["epic"],"forms":{"feminine-singular":"epică","masculine-plural":"epici","feminine-neuter-plural":"epice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epic","error-unrecognized-form-feminine-indefinite-singular":"epică","error-unrecognized-form-indefinite-masculine-plural":"epici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epice","definite-error-unrecognized-form-masculine-neuter-singular":"epicul","definite-error-unrecognized-form-feminine-singular":"epica","definite-error-unrecognized-form-masculine-plural":"epicii","definite-error-unrecognized-form-feminine-neuter-plural":"epicele"}},{"word":"epică","pos":"noun","definitions":["epic poetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epică","accusative-definite-nominative-singular":"epica","accusative-indefinite-nominative-plural":"epice","accusative-definite-nominative-plural":"epicele","dative-genitive-indefinite-singular":"epice","dative-definite-genitive-singular":"epicei","dative-genitive-indefinite-plural":"epice","dative-definite-genitive-plural":"epicelor","singular-vocative":"epică","plural-vocative":"epicelor"}},{"word":"epicard","pos":"noun","definitions":["epicardium"],"forms":{"plural":"epicarduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epicard","accusative-definite-nominative-singular":"epicardul","accusative-indefinite-nominative-plural":"epicarduri","accusative-definite-nominative-plural":"epicardurile","dative-genitive-indefinite-singular":"epicard","dative-definite-genitive-singular":"epicardului","dative-genitive-indefinite-plural":"epicarduri","dative-definite-genitive-plural":"epicardurilor","singular-vocative":"epicardule","plural-vocative":"epicardurilor"}},{"word":"epicardită","pos":"noun","definitions":["epicarditis"],"forms":{"plural":"epicardite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicardită","accusative-definite-nominative-singular":"epicardita","accusative-indefinite-nominative-plural":"epicardite","accusative-definite-nominative-plural":"epicarditele","dative-genitive-indefinite-singular":"epicardite","dative-definite-genitive-singular":"epicarditei","dative-genitive-indefinite-plural":"epicardite","dative-definite-genitive-plural":"epicarditelor","singular-vocative":"epicardită","plural-vocative":"epicarditelor"}},{"word":"epicarp","pos":"noun","definitions":["epicarp, exocarp"],"forms":{"plural":"epicarpuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epicarp","accusative-definite-nominative-singular":"epicarpul","accusative-indefinite-nominative-plural":"epicarpuri","accusative-definite-nominative-plural":"epicarpurile","dative-genitive-indefinite-singular":"epicarp","dative-definite-genitive-singular":"epicarpului","dative-genitive-indefinite-plural":"epicarpuri","dative-definite-genitive-plural":"epicarpurilor","singular-vocative":"epicarpule","plural-vocative":"epicarpurilor"}},{"word":"epicen","pos":"adj","definitions":["epicene"],"forms":{"feminine-singular":"epicenă","masculine-plural":"epiceni","feminine-neuter-plural":"epicene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicen","error-unrecognized-form-feminine-indefinite-singular":"epicenă","error-unrecognized-form-indefinite-masculine-plural":"epiceni","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicene","definite-error-unrecognized-form-masculine-neuter-singular":"epicenul","definite-error-unrecognized-form-feminine-singular":"epicena","definite-error-unrecognized-form-masculine-plural":"epicenii","definite-error-unrecognized-form-feminine-neuter-plural":"epicenele"}},{"word":"epicentral","pos":"adj","definitions":["epicentral"],"forms":{"feminine-singular":"epicentrală","masculine-plural":"epicentrali","feminine-neuter-plural":"epicentrale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicentral","error-unrecognized-form-feminine-indefinite-singular":"epicentrală","error-unrecognized-form-indefinite-masculine-plural":"epicentrali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicentrale","definite-error-unrecognized-form-masculine-neuter-singular":"epicentralul","definite-error-unrecognized-form-feminine-singular":"epicentrala","definite-error-unrecognized-form-masculine-plural":"epicentralii","definite-error-unrecognized-form-feminine-neuter-plural":"epicentralele"}},{"word":"epicentric","pos":"adj","definitions":["epicentric"],"forms":{"feminine-singular":"epicentrică","masculine-plural":"epicentrici","feminine-neuter-plural":"epicentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicentric","error-unrecognized-form-feminine-indefinite-singular":"epicentrică","error-unrecognized-form-indefinite-masculine-plural":"epicentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicentrice","definite-error-unrecognized-form-masculine-neuter-singular":"epicentricul","definite-error-unrecognized-form-feminine-singular":"epicentrica","definite-error-unrecognized-form-masculine-plural":"epicentricii","definite-error-unrecognized-form-feminine-neuter-plural":"epicentricele"}},{"word":"epicentru","pos":"noun","definitions":["epicenter"],"forms":{"plural":"epicentre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epicentru","accusative-definite-nominative-singular":"epicentrul","accusative-indefinite-nominative-plural":"epicentre","accusative-definite-nominative-plural":"epicentrele","dative-genitive-indefinite-singular":"epicentru","dative-definite-genitive-singular":"epicentrului","dative-genitive-indefinite-plural":"epicentre","dative-definite-genitive-plural":"epicentrelor","singular-vocative":"epicentrule","plural-vocative":"epicentrelor"}},{"word":"epicerc","pos":"noun","definitions":["epicycle"],"forms":{"plural":"epicercuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epicerc","accusative-definite-nominative-singular":"epicercul","accusative-indefinite-nominative-plural":"epicercuri","accusative-definite-nominative-plural":"epicercurile","dative-genitive-indefinite-singular":"epicerc","dative-definite-genitive-singular":"epicercului","dative-genitive-indefinite-plural":"epicercuri","dative-definite-genitive-plural":"epicercurilor","singular-vocative":"epicercule","plural-vocative":"epicercurilor"}},{"word":"epicheremă","pos":"noun","definitions":["epichirema"],"forms":{"plural":"epichereme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicheremă","accusative-definite-nominative-singular":"epicherema","accusative-indefinite-nominative-plural":"epichereme","accusative-definite-nominative-plural":"epicheremele","dative-genitive-indefinite-singular":"epichereme","dative-definite-genitive-singular":"epicheremei","dative-genitive-indefinite-plural":"epichereme","dative-definite-genitive-plural":"epicheremelor","singular-vocative":"epicheremă","plural-vocative":"epicheremelor"}},{"word":"epicicloidă","pos":"noun","definitions":["epicycloid"],"forms":{"plural":"epicicloide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicicloidă","accusative-definite-nominative-singular":"epicicloida","accusative-indefinite-nominative-plural":"epicicloide","accusative-definite-nominative-plural":"epicicloidele","dative-genitive-indefinite-singular":"epicicloide","dative-definite-genitive-singular":"epicicloidei","dative-genitive-indefinite-plural":"epicicloide","dative-definite-genitive-plural":"epicicloidelor","singular-vocative":"epicicloidă","plural-vocative":"epicicloidelor"}},{"word":"epicicloidal","pos":"adj","definitions":["epicycloidal"],"forms":{"feminine-singular":"epicicloidală","masculine-plural":"epicicloidali","feminine-neuter-plural":"epicicloidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicicloidal","error-unrecognized-form-feminine-indefinite-singular":"epicicloidală","error-unrecognized-form-indefinite-masculine-plural":"epicicloidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicicloidale","definite-error-unrecognized-form-masculine-neuter-singular":"epicicloidalul","definite-error-unrecognized-form-feminine-singular":"epicicloidala","definite-error-unrecognized-form-masculine-plural":"epicicloidalii","definite-error-unrecognized-form-feminine-neuter-plural":"epicicloidalele"}},{"word":"epiciclu","pos":"noun","definitions":["epicycle"],"forms":{"plural":"epicicluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epiciclu","accusative-definite-nominative-singular":"epiciclul","accusative-indefinite-nominative-plural":"epicicluri","accusative-definite-nominative-plural":"epiciclurile","dative-genitive-indefinite-singular":"epiciclu","dative-definite-genitive-singular":"epiciclului","dative-genitive-indefinite-plural":"epicicluri","dative-definite-genitive-plural":"epiciclurilor","singular-vocative":"epiciclule","plural-vocative":"epiciclurilor"}},{"word":"epicitate","pos":"noun","definitions":["epicness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epicitate","accusative-definite-nominative-singular":"epicitatea","accusative-indefinite-nominative-plural":"epicități","accusative-definite-nominative-plural":"epicitățile","dative-genitive-indefinite-singular":"epicități","dative-definite-genitive-singular":"epicității","dative-genitive-indefinite-plural":"epicități","dative-definite-genitive-plural":"epicităților","singular-vocative":"epicitate","plural-vocative":"epicităților"}},{"word":"epicondil","pos":"noun","definitions":["epicondyle"],"forms":{"plural":"epicondile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epicondil","accusative-definite-nominative-singular":"epicondilul","accusative-indefinite-nominative-plural":"epicondile","accusative-definite-nominative-plural":"epicondilele","dative-genitive-indefinite-singular":"epicondil","dative-definite-genitive-singular":"epicondilului","dative-genitive-indefinite-plural":"epicondile","dative-definite-genitive-plural":"epicondilelor","singular-vocative":"epicondilule","plural-vocative":"epicondilelor"}},{"word":"epicondilită","pos":"noun","definitions":["epicondylitis"],"forms":{"plural":"epicondilite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicondilită","accusative-definite-nominative-singular":"epicondilita","accusative-indefinite-nominative-plural":"epicondilite","accusative-definite-nominative-plural":"epicondilitele","dative-genitive-indefinite-singular":"epicondilite","dative-definite-genitive-singular":"epicondilitei","dative-genitive-indefinite-plural":"epicondilite","dative-definite-genitive-plural":"epicondilitelor","singular-vocative":"epicondilită","plural-vocative":"epicondilitelor"}},{"word":"epicontinental","pos":"adj","definitions":["epicontinental"],"forms":{"feminine-singular":"epicontinentală","masculine-plural":"epicontinentali","feminine-neuter-plural":"epicontinentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicontinental","error-unrecognized-form-feminine-indefinite-singular":"epicontinentală","error-unrecognized-form-indefinite-masculine-plural":"epicontinentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicontinentale","definite-error-unrecognized-form-masculine-neuter-singular":"epicontinentalul","definite-error-unrecognized-form-feminine-singular":"epicontinentala","definite-error-unrecognized-form-masculine-plural":"epicontinentalii","definite-error-unrecognized-form-feminine-neuter-plural":"epicontinentalele"}},{"word":"epicotil","pos":"noun","definitions":["epicotyl"],"forms":{"plural":"epicotile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epicotil","accusative-definite-nominative-singular":"epicotilul","accusative-indefinite-nominative-plural":"epicotile","accusative-definite-nominative-plural":"epicotilele","dative-genitive-indefinite-singular":"epicotil","dative-definite-genitive-singular":"epicotilului","dative-genitive-indefinite-plural":"epicotile","dative-definite-genitive-plural":"epicotilelor","singular-vocative":"epicotilule","plural-vocative":"epicotilelor"}},{"word":"epicranian","pos":"adj","definitions":["epicranial"],"forms":{"feminine-singular":"epicraniană","masculine-plural":"epicranieni","feminine-neuter-plural":"epicraniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicranian","error-unrecognized-form-feminine-indefinite-singular":"epicraniană","error-unrecognized-form-indefinite-masculine-plural":"epicranieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicraniene","definite-error-unrecognized-form-masculine-neuter-singular":"epicranianul","definite-error-unrecognized-form-feminine-singular":"epicraniana","definite-error-unrecognized-form-masculine-plural":"epicranienii","definite-error-unrecognized-form-feminine-neuter-plural":"epicranienele"}},{"word":"epicraniu","pos":"noun","definitions":["epicranium"],"forms":{"plural":"epicranii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epicraniu","accusative-definite-nominative-singular":"epicraniuul","accusative-indefinite-nominative-plural":"epicranii","accusative-definite-nominative-plural":"epicraniile","dative-genitive-indefinite-singular":"epicraniu","dative-definite-genitive-singular":"epicraniuului","dative-genitive-indefinite-plural":"epicranii","dative-definite-genitive-plural":"epicraniilor","singular-vocative":"epicraniuule","plural-vocative":"epicraniilor"}},{"word":"epicrație","pos":"noun","definitions":["domination"],"forms":{"plural":"epicrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epicrație","accusative-definite-nominative-singular":"epicrația","accusative-indefinite-nominative-plural":"epicrații","accusative-definite-nominative-plural":"epicrațiile","dative-genitive-indefinite-singular":"epicrații","dative-definite-genitive-singular":"epicrației","dative-genitive-indefinite-plural":"epicrații","dative-definite-genitive-plural":"epicrațiilor","singular-vocative":"epicrație","plural-vocative":"epicrațiilor"}},{"word":"epicriză","pos":"noun","definitions":["epicrisis"],"forms":{"plural":"epicrize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicriză","accusative-definite-nominative-singular":"epicriza","accusative-indefinite-nominative-plural":"epicrize","accusative-definite-nominative-plural":"epicrizele","dative-genitive-indefinite-singular":"epicrize","dative-definite-genitive-singular":"epicrizei","dative-genitive-indefinite-plural":"epicrize","dative-definite-genitive-plural":"epicrizelor","singular-vocative":"epicriză","plural-vocative":"epicrizelor"}},{"word":"epicurean","pos":"adj","definitions":["obsolete form of epicurian"],"forms":{"feminine-singular":"epicureană","masculine-plural":"epicureni","feminine-neuter-plural":"epicurene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicurean","error-unrecognized-form-feminine-indefinite-singular":"epicureană","error-unrecognized-form-indefinite-masculine-plural":"epicureni","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicurene","definite-error-unrecognized-form-masculine-neuter-singular":"epicureanul","definite-error-unrecognized-form-feminine-singular":"epicureana","definite-error-unrecognized-form-masculine-plural":"epicurenii","definite-error-unrecognized-form-feminine-neuter-plural":"epicurenele"}},{"word":"epicureic","pos":"adj","definitions":["epicurean"],"forms":{"feminine-singular":"epicureică","masculine-plural":"epicureici","feminine-neuter-plural":"epicureice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicureic","error-unrecognized-form-feminine-indefinite-singular":"epicureică","error-unrecognized-form-indefinite-masculine-plural":"epicureici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicureice","definite-error-unrecognized-form-masculine-neuter-singular":"epicureicul","definite-error-unrecognized-form-feminine-singular":"epicureica","definite-error-unrecognized-form-masculine-plural":"epicureicii","definite-error-unrecognized-form-feminine-neuter-plural":"epicureicele"}},{"word":"epicureism","pos":"noun","definitions":["alternative form of epicurism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epicureism","accusative-definite-nominative":"epicureismul","dative-genitive-indefinite":"epicureism","dative-definite-genitive":"epicureismului","vocative":"epicureismule"}},{"word":"epicureu","pos":"adj","definitions":["epicurean"],"forms":{"feminine-singular":"epicuree","masculine-plural":"epicurei","feminine-neuter-plural":"epicuree","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicureu","error-unrecognized-form-feminine-indefinite-singular":"epicuree","error-unrecognized-form-indefinite-masculine-plural":"epicurei","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicuree","definite-error-unrecognized-form-masculine-neuter-singular":"epicureul","definite-error-unrecognized-form-feminine-singular":"epicureea","definite-error-unrecognized-form-masculine-plural":"epicureii","definite-error-unrecognized-form-feminine-neuter-plural":"epicureele"}},{"word":"epicurian","pos":"noun","definitions":["epicurean"],"forms":{"plural":"epicurieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epicurian","accusative-definite-nominative-singular":"epicurianul","accusative-indefinite-nominative-plural":"epicurieni","accusative-definite-nominative-plural":"epicurienii","dative-genitive-indefinite-singular":"epicurian","dative-definite-genitive-singular":"epicurianului","dative-genitive-indefinite-plural":"epicurieni","dative-definite-genitive-plural":"epicurienilor","singular-vocative":"epicurianule","plural-vocative":"epicurienilor"}},{"word":"epicuriană","pos":"noun","definitions":["female equivalent of epicurian"],"forms":{"plural":"epicuriene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epicuriană","accusative-definite-nominative-singular":"epicuriana","accusative-indefinite-nominative-plural":"epicuriene","accusative-definite-nominative-plural":"epicurienele","dative-genitive-indefinite-singular":"epicuriene","dative-definite-genitive-singular":"epicurienei","dative-genitive-indefinite-plural":"epicuriene","dative-definite-genitive-plural":"epicurienelor","singular-vocative":"epicuriană","plural-vocative":"epicurienelor"}},{"word":"epicuriesc","pos":"adj","definitions":["Epicurean"],"forms":{"feminine-singular":"epicuriască","plural":"epicuriești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicuriesc","error-unrecognized-form-feminine-indefinite-singular":"epicuriască","error-unrecognized-form-indefinite-masculine-plural":"epicuriești","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicuriești","definite-error-unrecognized-form-masculine-neuter-singular":"epicuriescul","definite-error-unrecognized-form-feminine-singular":"epicuriasca","definite-error-unrecognized-form-masculine-plural":"epicurieștii","definite-error-unrecognized-form-feminine-neuter-plural":"epicurieștile"}},{"word":"epicurism","pos":"noun","definitions":["Epicureanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epicurism","accusative-definite-nominative":"epicurismul","dative-genitive-indefinite":"epicurism","dative-definite-genitive":"epicurismului","vocative":"epicurismule"}},{"word":"epicurist","pos":"adj","definitions":["epicurean"],"forms":{"feminine-singular":"epicuristă","masculine-plural":"epicuriști","feminine-neuter-plural":"epicuriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epicurist","error-unrecognized-form-feminine-indefinite-singular":"epicuristă","error-unrecognized-form-indefinite-masculine-plural":"epicuriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"epicuriste","definite-error-unrecognized-form-masculine-neuter-singular":"epicuristul","definite-error-unrecognized-form-feminine-singular":"epicurista","definite-error-unrecognized-form-masculine-plural":"epicuriștii","definite-error-unrecognized-form-feminine-neuter-plural":"epicuristele"}},{"word":"epidemic","pos":"adj","definitions":["epidemic"],"forms":{"feminine-singular":"epidemică","masculine-plural":"epidemici","feminine-neuter-plural":"epidemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidemic","error-unrecognized-form-feminine-indefinite-singular":"epidemică","error-unrecognized-form-indefinite-masculine-plural":"epidemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidemice","definite-error-unrecognized-form-masculine-neuter-singular":"epidemicul","definite-error-unrecognized-form-feminine-singular":"epidemica","definite-error-unrecognized-form-masculine-plural":"epidemicii","definite-error-unrecognized-form-feminine-neuter-plural":"epidemicele"}},{"word":"epidemicește","pos":"adv","definitions":["epidemically"]},{"word":"epidemie","pos":"noun","definitions":["epidemic"],"forms":{"plural":"epidemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epidemie","accusative-definite-nominative-singular":"epidemia","accusative-indefinite-nominative-plural":"epidemii","accusative-definite-nominative-plural":"epidemiile","dative-genitive-indefinite-singular":"epidemii","dative-definite-genitive-singular":"epidemiei","dative-genitive-indefinite-plural":"epidemii","dative-definite-genitive-plural":"epidemiilor","singular-vocative":"epidemie","plural-vocative":"epidemiilor"}},{"word":"epidemiesc","pos":"adj","definitions":["epidemic"],"forms":{"feminine-singular":"epidemiască","plural":"epidemiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidemiesc","error-unrecognized-form-feminine-indefinite-singular":"epidemiască","error-unrecognized-form-indefinite-masculine-plural":"epidemiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidemiești","definite-error-unrecognized-form-masculine-neuter-singular":"epidemiescul","definite-error-unrecognized-form-feminine-singular":"epidemiasca","definite-error-unrecognized-form-masculine-plural":"epidemieștii","definite-error-unrecognized-form-feminine-neuter-plural":"epidemieștile"}},{"word":"epidemiolog","pos":"noun","definitions":["epidemiologist"],"forms":{"plural":"epidemiologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epidemiolog","accusative-definite-nominative-singular":"epidemiologul","accusative-indefinite-nominative-plural":"epidemiologi","accusative-definite-nominative-plural":"epidemiologii","dative-genitive-indefinite-singular":"epidemiolog","dative-definite-genitive-singular":"epidemiologului","dative-genitive-indefinite-plural":"epidemiologi","dative-definite-genitive-plural":"epidemiologilor","singular-vocative":"epidemiologule","plural-vocative":"epidemiologilor"}},{"word":"epidemiologă","pos":"noun","definitions":["female equivalent of epidemiolog"],"forms":{"plural":"epidemiologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epidemiologă","accusative-definite-nominative-singular":"epidemiologa","accusative-indefinite-nominative-plural":"epidemiologe","accusative-definite-nominative-plural":"epidemiologele","dative-genitive-indefinite-singular":"epidemiologe","dative-definite-genitive-singular":"epidemiologei","dative-genitive-indefinite-plural":"epidemiologe","dative-definite-genitive-plural":"epidemiologelor","singular-vocative":"epidemiologă","plural-vocative":"epidemiologelor"}},{"word":"epidemiologic","pos":"adj","definitions":["epidemiological"],"forms":{"feminine-singular":"epidemiologică","masculine-plural":"epidemiologici","feminine-neuter-plural":"epidemiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidemiologic","error-unrecognized-form-feminine-indefinite-singular":"epidemiologică","error-unrecognized-form-indefinite-masculine-plural":"epidemiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidemiologice","definite-error-unrecognized-form-masculine-neuter-singular":"epidemiologicul","definite-error-unrecognized-form-feminine-singular":"epidemiologica","definite-error-unrecognized-form-masculine-plural":"epidemiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"epidemiologicele"}},{"word":"epidemiologie","pos":"noun","definitions":["epidemiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"epidemiologie","accusative-definite-nominative":"epidemiologia","dative-genitive-indefinite":"epidemiologii","dative-definite-genitive":"epidemiologiei","vocative":"epidemiologie"}},{"word":"epidermă","pos":"noun","definitions":["epidermis"],"forms":{"plural":"epiderme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epidermă","accusative-definite-nominative-singular":"epiderma","accusative-indefinite-nominative-plural":"epiderme","accusative-definite-nominative-plural":"epidermele","dative-genitive-indefinite-singular":"epiderme","dative-definite-genitive-singular":"epidermei","dative-genitive-indefinite-plural":"epiderme","dative-definite-genitive-plural":"epidermelor","singular-vocative":"epidermă","plural-vocative":"epidermelor"}},{"word":"epidermic","pos":"adj","definitions":["epidermal"],"forms":{"feminine-singular":"epidermică","masculine-plural":"epidermici","feminine-neuter-plural":"epidermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidermic","error-unrecognized-form-feminine-indefinite-singular":"epidermică","error-unrecognized-form-indefinite-masculine-plural":"epidermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidermice","definite-error-unrecognized-form-masculine-neuter-singular":"epidermicul","definite-error-unrecognized-form-feminine-singular":"epidermica","definite-error-unrecognized-form-masculine-plural":"epidermicii","definite-error-unrecognized-form-feminine-neuter-plural":"epidermicele"}},{"word":"epidermicesc","pos":"adj","definitions":["epidemic"],"forms":{"feminine-singular":"epidermicească","plural":"epidermicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidermicesc","error-unrecognized-form-feminine-indefinite-singular":"epidermicească","error-unrecognized-form-indefinite-masculine-plural":"epidermicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidermicești","definite-error-unrecognized-form-masculine-neuter-singular":"epidermicescul","definite-error-unrecognized-form-feminine-singular":"epidermiceasca","definite-error-unrecognized-form-masculine-plural":"epidermiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"epidermiceștile"}},{"word":"epidermită","pos":"noun","definitions":["epidermitis"],"forms":{"plural":"epidermite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epidermită","accusative-definite-nominative-singular":"epidermita","accusative-indefinite-nominative-plural":"epidermite","accusative-definite-nominative-plural":"epidermitele","dative-genitive-indefinite-singular":"epidermite","dative-definite-genitive-singular":"epidermitei","dative-genitive-indefinite-plural":"epidermite","dative-definite-genitive-plural":"epidermitelor","singular-vocative":"epidermită","plural-vocative":"epidermitelor"}},{"word":"epidermizare","pos":"noun","definitions":["epidermization"],"forms":{"plural":"epidermizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epidermizare","accusative-definite-nominative-singular":"epidermizarea","accusative-indefinite-nominative-plural":"epidermizări","accusative-definite-nominative-plural":"epidermizările","dative-genitive-indefinite-singular":"epidermizări","dative-definite-genitive-singular":"epidermizării","dative-genitive-indefinite-plural":"epidermizări","dative-definite-genitive-plural":"epidermizărilor","singular-vocative":"epidermizare","plural-vocative":"epidermizărilor"}},{"word":"epidermofiție","pos":"noun","definitions":["epidermophyte"],"forms":{"plural":"epidermofiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epidermofiție","accusative-definite-nominative-singular":"epidermofiția","accusative-indefinite-nominative-plural":"epidermofiții","accusative-definite-nominative-plural":"epidermofițiile","dative-genitive-indefinite-singular":"epidermofiții","dative-definite-genitive-singular":"epidermofiției","dative-genitive-indefinite-plural":"epidermofiții","dative-definite-genitive-plural":"epidermofițiilor","singular-vocative":"epidermofiție","plural-vocative":"epidermofițiilor"}},{"word":"epidermoid","pos":"adj","definitions":["epidermoid"],"forms":{"feminine-singular":"epidermoidă","masculine-plural":"epidermoizi","feminine-neuter-plural":"epidermoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidermoid","error-unrecognized-form-feminine-indefinite-singular":"epidermoidă","error-unrecognized-form-indefinite-masculine-plural":"epidermoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidermoide","definite-error-unrecognized-form-masculine-neuter-singular":"epidermoidul","definite-error-unrecognized-form-feminine-singular":"epidermoida","definite-error-unrecognized-form-masculine-plural":"epidermoizii","definite-error-unrecognized-form-feminine-neuter-plural":"epidermoidele"}},{"word":"epidermoidal","pos":"adj","definitions":["epidermoid"],"forms":{"feminine-singular":"epidermoidală","masculine-plural":"epidermoidali","feminine-neuter-plural":"epidermoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidermoidal","error-unrecognized-form-feminine-indefinite-singular":"epidermoidală","error-unrecognized-form-indefinite-masculine-plural":"epidermoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidermoidale","definite-error-unrecognized-form-masculine-neuter-singular":"epidermoidalul","definite-error-unrecognized-form-feminine-singular":"epidermoidala","definite-error-unrecognized-form-masculine-plural":"epidermoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"epidermoidalele"}},{"word":"epidermoliză","pos":"noun","definitions":["epidermolysis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epidermoliză","accusative-definite-nominative-singular":"epidermoliza","accusative-indefinite-nominative-plural":"epidermolize","accusative-definite-nominative-plural":"epidermolizele","dative-genitive-indefinite-singular":"epidermolize","dative-definite-genitive-singular":"epidermolizei","dative-genitive-indefinite-plural":"epidermolize","dative-definite-genitive-plural":"epidermolizelor","singular-vocative":"epidermoliză","plural-vocative":"epidermolizelor"}},{"word":"epidermomicoză","pos":"noun","definitions":["epidermoycosis"],"forms":{"plural":"epidermomicoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epidermomicoză","accusative-definite-nominative-singular":"epidermomicoza","accusative-indefinite-nominative-plural":"epidermomicoze","accusative-definite-nominative-plural":"epidermomicozele","dative-genitive-indefinite-singular":"epidermomicoze","dative-definite-genitive-singular":"epidermomicozei","dative-genitive-indefinite-plural":"epidermomicoze","dative-definite-genitive-plural":"epidermomicozelor","singular-vocative":"epidermomicoză","plural-vocative":"epidermomicozelor"}},{"word":"epidiascop","pos":"noun","definitions":["epidiascope"],"forms":{"plural":"epidiascoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epidiascop","accusative-definite-nominative-singular":"epidiascopul","accusative-indefinite-nominative-plural":"epidiascoape","accusative-definite-nominative-plural":"epidiascoapele","dative-genitive-indefinite-singular":"epidiascop","dative-definite-genitive-singular":"epidiascopului","dative-genitive-indefinite-plural":"epidiascoape","dative-definite-genitive-plural":"epidiascoapelor","singular-vocative":"epidiascopule","plural-vocative":"epidiascoapelor"}},{"word":"epidictic","pos":"adj","definitions":["epidictic"],"forms":{"feminine-singular":"epidictică","masculine-plural":"epidictici","feminine-neuter-plural":"epidictice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epidictic","error-unrecognized-form-feminine-indefinite-singular":"epidictică","error-unrecognized-form-indefinite-masculine-plural":"epidictici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epidictice","definite-error-unrecognized-form-masculine-neuter-singular":"epidicticul","definite-error-unrecognized-form-feminine-singular":"epidictica","definite-error-unrecognized-form-masculine-plural":"epidicticii","definite-error-unrecognized-form-feminine-neuter-plural":"epidicticele"}},{"word":"epididim","pos":"noun","definitions":["epididymis"],"forms":{"plural":"epididime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epididim","accusative-definite-nominative-singular":"epididimul","accusative-indefinite-nominative-plural":"epididime","accusative-definite-nominative-plural":"epididimele","dative-genitive-indefinite-singular":"epididim","dative-definite-genitive-singular":"epididimului","dative-genitive-indefinite-plural":"epididime","dative-definite-genitive-plural":"epididimelor","singular-vocative":"epididimule","plural-vocative":"epididimelor"}},{"word":"epididimectomie","pos":"noun","definitions":["epididymectomy"],"forms":{"plural":"epididimectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epididimectomie","accusative-definite-nominative-singular":"epididimectomia","accusative-indefinite-nominative-plural":"epididimectomii","accusative-definite-nominative-plural":"epididimectomiile","dative-genitive-indefinite-singular":"epididimectomii","dative-definite-genitive-singular":"epididimectomiei","dative-genitive-indefinite-plural":"epididimectomii","dative-definite-genitive-plural":"epididimectomiilor","singular-vocative":"epididimectomie","plural-vocative":"epididimectomiilor"}},{"word":"epididimită","pos":"noun","definitions":["epididymitis"],"forms":{"plural":"epididimite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epididimită","accusative-definite-nominative-singular":"epididimita","accusative-indefinite-nominative-plural":"epididimite","accusative-definite-nominative-plural":"epididimitele","dative-genitive-indefinite-singular":"epididimite","dative-definite-genitive-singular":"epididimitei","dative-genitive-indefinite-plural":"epididimite","dative-definite-genitive-plural":"epididimitelor","singular-vocative":"epididimită","plural-vocative":"epididimitelor"}},{"word":"epididimotomie","pos":"noun","definitions":["epididymotomy"],"forms":{"plural":"epididimotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epididimotomie","accusative-definite-nominative-singular":"epididimotomia","accusative-indefinite-nominative-plural":"epididimotomii","accusative-definite-nominative-plural":"epididimotomiile","dative-genitive-indefinite-singular":"epididimotomii","dative-definite-genitive-singular":"epididimotomiei","dative-genitive-indefinite-plural":"epididimotomii","dative-definite-genitive-plural":"epididimotomiilor","singular-vocative":"epididimotomie","plural-vocative":"epididimotomiilor"}},{"word":"epidot","pos":"noun","definitions":["epidote"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epidot","accusative-definite-nominative":"epidotul","dative-genitive-indefinite":"epidot","dative-definite-genitive":"epidotului","vocative":"epidotule"}},{"word":"epifanie","pos":"noun","definitions":["epiphany"],"pronunciation":"/e.pi.faˈni.je/","forms":{"plural":"epifanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epifanie","accusative-definite-nominative-singular":"epifania","accusative-indefinite-nominative-plural":"epifanii","accusative-definite-nominative-plural":"epifaniile","dative-genitive-indefinite-singular":"epifanii","dative-definite-genitive-singular":"epifaniei","dative-genitive-indefinite-plural":"epifanii","dative-definite-genitive-plural":"epifaniilor","singular-vocative":"epifanie","plural-vocative":"epifaniilor"}},{"word":"epifenomen","pos":"noun","definitions":["epiphenomenon"],"forms":{"plural":"epifenomene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epifenomen","accusative-definite-nominative-singular":"epifenomenul","accusative-indefinite-nominative-plural":"epifenomene","accusative-definite-nominative-plural":"epifenomenele","dative-genitive-indefinite-singular":"epifenomen","dative-definite-genitive-singular":"epifenomenului","dative-genitive-indefinite-plural":"epifenomene","dative-definite-genitive-plural":"epifenomenelor","singular-vocative":"epifenomenule","plural-vocative":"epifenomenelor"}},{"word":"epifenomenalism","pos":"noun","definitions":["epiphenomenalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epifenomenalism","accusative-definite-nominative-singular":"epifenomenalismul","accusative-indefinite-nominative-plural":"epifenomenalisme","accusative-definite-nominative-plural":"epifenomenalismele","dative-genitive-indefinite-singular":"epifenomenalism","dative-definite-genitive-singular":"epifenomenalismului","dative-genitive-indefinite-plural":"epifenomenalisme","dative-definite-genitive-plural":"epifenomenalismelor","singular-vocative":"epifenomenalismule","plural-vocative":"epifenomenalismelor"}},{"word":"epifenomenist","pos":"adj","definitions":["epiphenomenalist"],"forms":{"feminine-singular":"epifenomenistă","masculine-plural":"epifenomeniști","feminine-neuter-plural":"epifenomeniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epifenomenist","error-unrecognized-form-feminine-indefinite-singular":"epifenomenistă","error-unrecognized-form-indefinite-masculine-plural":"epifenomeniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"epifenomeniste","definite-error-unrecognized-form-masculine-neuter-singular":"epifenomenistul","definite-error-unrecognized-form-feminine-singular":"epifenomenista","definite-error-unrecognized-form-masculine-plural":"epifenomeniștii","definite-error-unrecognized-form-feminine-neuter-plural":"epifenomenistele"}},{"word":"epifil","pos":"adj","definitions":["epiphyllous"],"forms":{"feminine-singular":"epifilă","masculine-plural":"epifili","feminine-neuter-plural":"epifile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epifil","error-unrecognized-form-feminine-indefinite-singular":"epifilă","error-unrecognized-form-indefinite-masculine-plural":"epifili","error-unrecognized-form-feminine-indefinite-neuter-plural":"epifile","definite-error-unrecognized-form-masculine-neuter-singular":"epifilul","definite-error-unrecognized-form-feminine-singular":"epifila","definite-error-unrecognized-form-masculine-plural":"epifilii","definite-error-unrecognized-form-feminine-neuter-plural":"epifilele"}},{"word":"epifit","pos":"adj","definitions":["epiphytic"],"forms":{"feminine-singular":"epifită","masculine-plural":"epifiți","feminine-neuter-plural":"epifite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epifit","error-unrecognized-form-feminine-indefinite-singular":"epifită","error-unrecognized-form-indefinite-masculine-plural":"epifiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epifite","definite-error-unrecognized-form-masculine-neuter-singular":"epifitul","definite-error-unrecognized-form-feminine-singular":"epifita","definite-error-unrecognized-form-masculine-plural":"epifiții","definite-error-unrecognized-form-feminine-neuter-plural":"epifitele"}},{"word":"epifitie","pos":"noun","definitions":["epiphytia"],"forms":{"plural":"epifitii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epifitie","accusative-definite-nominative-singular":"epifitia","accusative-indefinite-nominative-plural":"epifitii","accusative-definite-nominative-plural":"epifitiile","dative-genitive-indefinite-singular":"epifitii","dative-definite-genitive-singular":"epifitiei","dative-genitive-indefinite-plural":"epifitii","dative-definite-genitive-plural":"epifitiilor","singular-vocative":"epifitie","plural-vocative":"epifitiilor"}},{"word":"epifiză","pos":"noun","definitions":["epiphysis"],"forms":{"plural":"epifize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epifiză","accusative-definite-nominative-singular":"epifiza","accusative-indefinite-nominative-plural":"epifize","accusative-definite-nominative-plural":"epifizele","dative-genitive-indefinite-singular":"epifize","dative-definite-genitive-singular":"epifizei","dative-genitive-indefinite-plural":"epifize","dative-definite-genitive-plural":"epifizelor","singular-vocative":"epifiză","plural-vocative":"epifizelor"}},{"word":"epifizan","pos":"adj","definitions":["epiphyseal"],"forms":{"feminine-singular":"epifizană","masculine-plural":"epifizani","feminine-neuter-plural":"epifizane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epifizan","error-unrecognized-form-feminine-indefinite-singular":"epifizană","error-unrecognized-form-indefinite-masculine-plural":"epifizani","error-unrecognized-form-feminine-indefinite-neuter-plural":"epifizane","definite-error-unrecognized-form-masculine-neuter-singular":"epifizanul","definite-error-unrecognized-form-feminine-singular":"epifizana","definite-error-unrecognized-form-masculine-plural":"epifizanii","definite-error-unrecognized-form-feminine-neuter-plural":"epifizanele"}},{"word":"epifizar","pos":"adj","definitions":["epiphyseal"],"forms":{"feminine-singular":"epifizară","masculine-plural":"epifizari","feminine-neuter-plural":"epifizare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epifizar","error-unrecognized-form-feminine-indefinite-singular":"epifizară","error-unrecognized-form-indefinite-masculine-plural":"epifizari","error-unrecognized-form-feminine-indefinite-neuter-plural":"epifizare","definite-error-unrecognized-form-masculine-neuter-singular":"epifizarul","definite-error-unrecognized-form-feminine-singular":"epifizara","definite-error-unrecognized-form-masculine-plural":"epifizarii","definite-error-unrecognized-form-feminine-neuter-plural":"epifizarele"}},{"word":"epifizită","pos":"noun","definitions":["epiphysitis"],"forms":{"plural":"epifizite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epifizită","accusative-definite-nominative-singular":"epifizita","accusative-indefinite-nominative-plural":"epifizite","accusative-definite-nominative-plural":"epifizitele","dative-genitive-indefinite-singular":"epifizite","dative-definite-genitive-singular":"epifizitei","dative-genitive-indefinite-plural":"epifizite","dative-definite-genitive-plural":"epifizitelor","singular-vocative":"epifizită","plural-vocative":"epifizitelor"}},{"word":"epifonem","pos":"noun","definitions":["epiphonema"],"forms":{"plural":"epifoneme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epifonem","accusative-definite-nominative-singular":"epifonemul","accusative-indefinite-nominative-plural":"epifoneme","accusative-definite-nominative-plural":"epifonemele","dative-genitive-indefinite-singular":"epifonem","dative-definite-genitive-singular":"epifonemului","dative-genitive-indefinite-plural":"epifoneme","dative-definite-genitive-plural":"epifonemelor","singular-vocative":"epifonemule","plural-vocative":"epifonemelor"}},{"word":"epiforă","pos":"noun","definitions":["epiphora"],"forms":{"plural":"epifore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epiforă","accusative-definite-nominative-singular":"epifora","accusative-indefinite-nominative-plural":"epifore","accusative-definite-nominative-plural":"epiforele","dative-genitive-indefinite-singular":"epifore","dative-definite-genitive-singular":"epiforei","dative-genitive-indefinite-plural":"epifore","dative-definite-genitive-plural":"epiforelor","singular-vocative":"epiforă","plural-vocative":"epiforelor"}},{"word":"epifrază","pos":"noun","definitions":["epiphrasis"],"forms":{"plural":"epifraze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epifrază","accusative-definite-nominative-singular":"epifraza","accusative-indefinite-nominative-plural":"epifraze","accusative-definite-nominative-plural":"epifrazele","dative-genitive-indefinite-singular":"epifraze","dative-definite-genitive-singular":"epifrazei","dative-genitive-indefinite-plural":"epifraze","dative-definite-genitive-plural":"epifrazelor","singular-vocative":"epifrază","plural-vocative":"epifrazelor"}},{"word":"epigastralgie","pos":"noun","definitions":["epigastralgia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"epigastralgie","accusative-definite-nominative":"epigastralgia","dative-genitive-indefinite":"epigastralgii","dative-definite-genitive":"epigastralgiei","vocative":"epigastralgie"}},{"word":"epigastric","pos":"adj","definitions":["epigastric"],"forms":{"feminine-singular":"epigastrică","masculine-plural":"epigastrici","feminine-neuter-plural":"epigastrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigastric","error-unrecognized-form-feminine-indefinite-singular":"epigastrică","error-unrecognized-form-indefinite-masculine-plural":"epigastrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigastrice","definite-error-unrecognized-form-masculine-neuter-singular":"epigastricul","definite-error-unrecognized-form-feminine-singular":"epigastrica","definite-error-unrecognized-form-masculine-plural":"epigastricii","definite-error-unrecognized-form-feminine-neuter-plural":"epigastricele"}},{"word":"epigastru","pos":"noun","definitions":["epigastrium"],"forms":{"plural":"epigastre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epigastru","accusative-definite-nominative-singular":"epigastrul","accusative-indefinite-nominative-plural":"epigastre","accusative-definite-nominative-plural":"epigastrele","dative-genitive-indefinite-singular":"epigastru","dative-definite-genitive-singular":"epigastrului","dative-genitive-indefinite-plural":"epigastre","dative-definite-genitive-plural":"epigastrelor","singular-vocative":"epigastrule","plural-vocative":"epigastrelor"}},{"word":"epigenetic","pos":"adj","definitions":["epigenetic"],"forms":{"feminine-singular":"epigenetică","masculine-plural":"epigenetici","feminine-neuter-plural":"epigenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigenetic","error-unrecognized-form-feminine-indefinite-singular":"epigenetică","error-unrecognized-form-indefinite-masculine-plural":"epigenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigenetice","definite-error-unrecognized-form-masculine-neuter-singular":"epigeneticul","definite-error-unrecognized-form-feminine-singular":"epigenetica","definite-error-unrecognized-form-masculine-plural":"epigeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"epigeneticele"}},{"word":"epigeneză","pos":"noun","definitions":["epigenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epigeneză","accusative-definite-nominative-singular":"epigeneza","accusative-indefinite-nominative-plural":"epigeneze","accusative-definite-nominative-plural":"epigenezele","dative-genitive-indefinite-singular":"epigeneze","dative-definite-genitive-singular":"epigenezei","dative-genitive-indefinite-plural":"epigeneze","dative-definite-genitive-plural":"epigenezelor","singular-vocative":"epigeneză","plural-vocative":"epigenezelor"}},{"word":"epigenie","pos":"noun","definitions":["epigenesis"],"forms":{"plural":"epigenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epigenie","accusative-definite-nominative-singular":"epigenia","accusative-indefinite-nominative-plural":"epigenii","accusative-definite-nominative-plural":"epigeniile","dative-genitive-indefinite-singular":"epigenii","dative-definite-genitive-singular":"epigeniei","dative-genitive-indefinite-plural":"epigenii","dative-definite-genitive-plural":"epigeniilor","singular-vocative":"epigenie","plural-vocative":"epigeniilor"}},{"word":"epigeu","pos":"adj","definitions":["epigeous"],"forms":{"feminine-singular":"epigee","masculine-plural":"epigei","feminine-neuter-plural":"epigee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigeu","error-unrecognized-form-feminine-indefinite-singular":"epigee","error-unrecognized-form-indefinite-masculine-plural":"epigei","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigee","definite-error-unrecognized-form-masculine-neuter-singular":"epigeul","definite-error-unrecognized-form-feminine-singular":"epigeea","definite-error-unrecognized-form-masculine-plural":"epigeii","definite-error-unrecognized-form-feminine-neuter-plural":"epigeele"}},{"word":"epigin","pos":"adj","definitions":["epigynous"],"forms":{"feminine-singular":"epigină","masculine-plural":"epigini","feminine-neuter-plural":"epigine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigin","error-unrecognized-form-feminine-indefinite-singular":"epigină","error-unrecognized-form-indefinite-masculine-plural":"epigini","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigine","definite-error-unrecognized-form-masculine-neuter-singular":"epiginul","definite-error-unrecognized-form-feminine-singular":"epigina","definite-error-unrecognized-form-masculine-plural":"epiginii","definite-error-unrecognized-form-feminine-neuter-plural":"epiginele"}},{"word":"epiginie","pos":"noun","definitions":["epigyny"],"forms":{"plural":"epiginii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epiginie","accusative-definite-nominative-singular":"epiginia","accusative-indefinite-nominative-plural":"epiginii","accusative-definite-nominative-plural":"epiginiile","dative-genitive-indefinite-singular":"epiginii","dative-definite-genitive-singular":"epiginiei","dative-genitive-indefinite-plural":"epiginii","dative-definite-genitive-plural":"epiginiilor","singular-vocative":"epiginie","plural-vocative":"epiginiilor"}},{"word":"epiglotă","pos":"noun","definitions":["epiglottis"],"forms":{"plural":"epiglote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epiglotă","accusative-definite-nominative-singular":"epiglota","accusative-indefinite-nominative-plural":"epiglote","accusative-definite-nominative-plural":"epiglotele","dative-genitive-indefinite-singular":"epiglote","dative-definite-genitive-singular":"epiglotei","dative-genitive-indefinite-plural":"epiglote","dative-definite-genitive-plural":"epiglotelor","singular-vocative":"epiglotă","plural-vocative":"epiglotelor"}},{"word":"epiglotită","pos":"noun","definitions":["epiglottitis"],"forms":{"plural":"epiglotităe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epiglotită","accusative-definite-nominative-singular":"epiglotita","accusative-indefinite-nominative-plural":"epiglotităe","accusative-definite-nominative-plural":"epiglotităele","dative-genitive-indefinite-singular":"epiglotităe","dative-definite-genitive-singular":"epiglotităei","dative-genitive-indefinite-plural":"epiglotităe","dative-definite-genitive-plural":"epiglotităelor","singular-vocative":"epiglotită","plural-vocative":"epiglotităelor"}},{"word":"epigon","pos":"noun","definitions":["epigone"],"forms":{"plural":"epigoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epigon","accusative-definite-nominative-singular":"epigonul","accusative-indefinite-nominative-plural":"epigoni","accusative-definite-nominative-plural":"epigonii","dative-genitive-indefinite-singular":"epigon","dative-definite-genitive-singular":"epigonului","dative-genitive-indefinite-plural":"epigoni","dative-definite-genitive-plural":"epigonilor","singular-vocative":"epigonule","plural-vocative":"epigonilor"}},{"word":"epigonic","pos":"adj","definitions":["epigonic"],"forms":{"feminine-singular":"epigonică","masculine-plural":"epigonici","feminine-neuter-plural":"epigonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigonic","error-unrecognized-form-feminine-indefinite-singular":"epigonică","error-unrecognized-form-indefinite-masculine-plural":"epigonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigonice","definite-error-unrecognized-form-masculine-neuter-singular":"epigonicul","definite-error-unrecognized-form-feminine-singular":"epigonica","definite-error-unrecognized-form-masculine-plural":"epigonicii","definite-error-unrecognized-form-feminine-neuter-plural":"epigonicele"}},{"word":"epigonism","pos":"noun","definitions":["epigonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epigonism","accusative-definite-nominative":"epigonismul","dative-genitive-indefinite":"epigonism","dative-definite-genitive":"epigonismului","vocative":"epigonismule"}},{"word":"epigraf","pos":"noun","definitions":["epigraph"],"forms":{"plural":"epigrafe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epigraf","accusative-definite-nominative-singular":"epigraful","accusative-indefinite-nominative-plural":"epigrafe","accusative-definite-nominative-plural":"epigrafele","dative-genitive-indefinite-singular":"epigraf","dative-definite-genitive-singular":"epigrafului","dative-genitive-indefinite-plural":"epigrafe","dative-definite-genitive-plural":"epigrafelor","singular-vocative":"epigrafule","plural-vocative":"epigrafelor"}},{"word":"epigrafic","pos":"adj","definitions":["epigraphic"],"forms":{"feminine-singular":"epigrafică","masculine-plural":"epigrafici","feminine-neuter-plural":"epigrafice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigrafic","error-unrecognized-form-feminine-indefinite-singular":"epigrafică","error-unrecognized-form-indefinite-masculine-plural":"epigrafici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigrafice","definite-error-unrecognized-form-masculine-neuter-singular":"epigraficul","definite-error-unrecognized-form-feminine-singular":"epigrafica","definite-error-unrecognized-form-masculine-plural":"epigraficii","definite-error-unrecognized-form-feminine-neuter-plural":"epigraficele"}},{"word":"epigrafie","pos":"noun","definitions":["epigraphy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"epigrafie","accusative-definite-nominative":"epigrafia","dative-genitive-indefinite":"epigrafii","dative-definite-genitive":"epigrafiei","vocative":"epigrafie"}},{"word":"epigrafist","pos":"noun","definitions":["epigraphist"],"forms":{"plural":"epigrafiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epigrafist","accusative-definite-nominative-singular":"epigrafistul","accusative-indefinite-nominative-plural":"epigrafiști","accusative-definite-nominative-plural":"epigrafiștii","dative-genitive-indefinite-singular":"epigrafist","dative-definite-genitive-singular":"epigrafistului","dative-genitive-indefinite-plural":"epigrafiști","dative-definite-genitive-plural":"epigrafiștilor","singular-vocative":"epigrafistule","plural-vocative":"epigrafiștilor"}},{"word":"epigrafistă","pos":"noun","definitions":["female equivalent of epigrafist"],"forms":{"plural":"epigrafiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epigrafistă","accusative-definite-nominative-singular":"epigrafista","accusative-indefinite-nominative-plural":"epigrafiste","accusative-definite-nominative-plural":"epigrafistele","dative-genitive-indefinite-singular":"epigrafiste","dative-definite-genitive-singular":"epigrafistei","dative-genitive-indefinite-plural":"epigrafiste","dative-definite-genitive-plural":"epigrafistelor","singular-vocative":"epigrafistă","plural-vocative":"epigrafistelor"}},{"word":"epigramă","pos":"noun","definitions":["epigram"],"forms":{"plural":"epigrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epigramă","accusative-definite-nominative-singular":"epigrama","accusative-indefinite-nominative-plural":"epigrame","accusative-definite-nominative-plural":"epigramele","dative-genitive-indefinite-singular":"epigrame","dative-definite-genitive-singular":"epigramei","dative-genitive-indefinite-plural":"epigrame","dative-definite-genitive-plural":"epigramelor","singular-vocative":"epigramă","plural-vocative":"epigramelor"}},{"word":"epigramatic","pos":"adj","definitions":["epigrammatic"],"forms":{"feminine-singular":"epigramatică","masculine-plural":"epigramatici","feminine-neuter-plural":"epigramatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epigramatic","error-unrecognized-form-feminine-indefinite-singular":"epigramatică","error-unrecognized-form-indefinite-masculine-plural":"epigramatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epigramatice","definite-error-unrecognized-form-masculine-neuter-singular":"epigramaticul","definite-error-unrecognized-form-feminine-singular":"epigramatica","definite-error-unrecognized-form-masculine-plural":"epigramaticii","definite-error-unrecognized-form-feminine-neuter-plural":"epigramaticele"}},{"word":"epigramatist","pos":"noun","definitions":["epigrammatist"],"forms":{"plural":"epigramatiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epigramatist","accusative-definite-nominative-singular":"epigramatistul","accusative-indefinite-nominative-plural":"epigramatiști","accusative-definite-nominative-plural":"epigramatiștii","dative-genitive-indefinite-singular":"epigramatist","dative-definite-genitive-singular":"epigramatistului","dative-genitive-indefinite-plural":"epigramatiști","dative-definite-genitive-plural":"epigramatiștilor","singular-vocative":"epigramatistule","plural-vocative":"epigramatiștilor"}},{"word":"epigramist","pos":"noun","definitions":["epigram writer"],"forms":{"plural":"epigramiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epigramist","accusative-definite-nominative-singular":"epigramistul","accusative-indefinite-nominative-plural":"epigramisti","accusative-definite-nominative-plural":"epigramistii","dative-genitive-indefinite-singular":"epigramist","dative-definite-genitive-singular":"epigramistului","dative-genitive-indefinite-plural":"epigramisti","dative-definite-genitive-plural":"epigramistilor","singular-vocative":"epigramistule","plural-vocative":"epigramistilor"}},{"word":"epigramistă","pos":"noun","definitions":["female equivalent of epigramist"],"forms":{"plural":"epigramiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epigramistă","accusative-definite-nominative-singular":"epigramista","accusative-indefinite-nominative-plural":"epigramiste","accusative-definite-nominative-plural":"epigramistele","dative-genitive-indefinite-singular":"epigramiste","dative-definite-genitive-singular":"epigramistei","dative-genitive-indefinite-plural":"epigramiste","dative-definite-genitive-plural":"epigramistelor","singular-vocative":"epigramistă","plural-vocative":"epigramistelor"}},{"word":"epihirosire","pos":"noun","definitions":["confirmation"],"forms":{"plural":"epihirosiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epihirosire","accusative-definite-nominative-singular":"epihirosirea","accusative-indefinite-nominative-plural":"epihirosiri","accusative-definite-nominative-plural":"epihirosirile","dative-genitive-indefinite-singular":"epihirosiri","dative-definite-genitive-singular":"epihirosirii","dative-genitive-indefinite-plural":"epihirosiri","dative-definite-genitive-plural":"epihirosirilor","singular-vocative":"epihirosire","plural-vocative":"epihirosirilor"}},{"word":"epihirosiri","pos":"noun","definitions":["plural of epihirosire"]},{"word":"epila","pos":"verb","definitions":["to epilate"],"forms":{"canonical":"a epila 1st conjugation","present-singular-third-person":"epilează","participle-past":"epilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a epila","gerund":"epilând","first-person-indicative-present-singular":"epilez","indicative-present-second-person-singular":"epilezi","indicative-present-singular-third-person":"epilează","first-person-indicative-plural-present":"epilăm","indicative-plural-present-second-person":"epilați","indicative-plural-present-third-person":"epilează","first-person-imperfect-indicative-singular":"epilam","imperfect-indicative-second-person-singular":"epilai","imperfect-indicative-singular-third-person":"epila","first-person-imperfect-indicative-plural":"epilam","imperfect-indicative-plural-second-person":"epilați","imperfect-indicative-plural-third-person":"epilau","first-person-indicative-perfect-singular":"epilai","indicative-perfect-second-person-singular":"epilași","indicative-perfect-singular-third-person":"epilă","first-person-indicative-perfect-plural":"epilarăm","indicative-perfect-plural-second-person":"epilarăți","indicative-perfect-plural-third-person":"epilară","first-person-indicative-pluperfect-singular":"epilasem","indicative-pluperfect-second-person-singular":"epilaseși","indicative-pluperfect-singular-third-person":"epilase","first-person-indicative-pluperfect-plural":"epilaserăm","indicative-pluperfect-plural-second-person":"epilaserăți","indicative-pluperfect-plural-third-person":"epilaseră","first-person-present-singular-subjunctive":"să epilez","present-second-person-singular-subjunctive":"să epilezi","present-singular-subjunctive-third-person":"să epileze","first-person-plural-present-subjunctive":"să epilăm","plural-present-second-person-subjunctive":"să epilați","plural-present-subjunctive-third-person":"să epileze","imperative-second-person-singular":"epilează","imperative-plural-second-person":"epilați","imperative-negative-second-person-singular":"nu epila","imperative-negative-plural-second-person":"nu epilați"}},{"word":"epilare","pos":"noun","definitions":["epilation"],"forms":{"plural":"epilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epilare","accusative-definite-nominative-singular":"epilarea","accusative-indefinite-nominative-plural":"epilări","accusative-definite-nominative-plural":"epilările","dative-genitive-indefinite-singular":"epilări","dative-definite-genitive-singular":"epilării","dative-genitive-indefinite-plural":"epilări","dative-definite-genitive-plural":"epilărilor","singular-vocative":"epilare","plural-vocative":"epilărilor"}},{"word":"epilație","pos":"noun","definitions":["depilation, hair removal"],"forms":{"plural":"epilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epilație","accusative-definite-nominative-singular":"epilația","accusative-indefinite-nominative-plural":"epilații","accusative-definite-nominative-plural":"epilațiile","dative-genitive-indefinite-singular":"epilații","dative-definite-genitive-singular":"epilației","dative-genitive-indefinite-plural":"epilații","dative-definite-genitive-plural":"epilațiilor","singular-vocative":"epilație","plural-vocative":"epilațiilor"}},{"word":"epilațiune","pos":"noun","definitions":["obsolete form of epilație"],"forms":{"plural":"epilațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epilațiune","accusative-definite-nominative-singular":"epilațiunea","accusative-indefinite-nominative-plural":"epilațiuni","accusative-definite-nominative-plural":"epilațiunile","dative-genitive-indefinite-singular":"epilațiuni","dative-definite-genitive-singular":"epilațiunii","dative-genitive-indefinite-plural":"epilațiuni","dative-definite-genitive-plural":"epilațiunilor","singular-vocative":"epilațiune","plural-vocative":"epilațiunilor"}},{"word":"epilator","pos":"noun","definitions":["epilator"],"forms":{"plural":"epilatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epilator","accusative-definite-nominative-singular":"epilatorul","accusative-indefinite-nominative-plural":"epilatori","accusative-definite-nominative-plural":"epilatorile","dative-genitive-indefinite-singular":"epilator","dative-definite-genitive-singular":"epilatorului","dative-genitive-indefinite-plural":"epilatori","dative-definite-genitive-plural":"epilatorilor","singular-vocative":"epilatorule","plural-vocative":"epilatorilor"}},{"word":"epilepsie","pos":"noun","definitions":["epilepsy"],"forms":{"plural":"epilepsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epilepsie","accusative-definite-nominative-singular":"epilepsia","accusative-indefinite-nominative-plural":"epilepsii","accusative-definite-nominative-plural":"epilepsiile","dative-genitive-indefinite-singular":"epilepsii","dative-definite-genitive-singular":"epilepsiei","dative-genitive-indefinite-plural":"epilepsii","dative-definite-genitive-plural":"epilepsiilor","singular-vocative":"epilepsie","plural-vocative":"epilepsiilor"}},{"word":"epileptic","pos":"adj","definitions":["epileptic"],"forms":{"feminine-singular":"epileptică","masculine-plural":"epileptici","feminine-neuter-plural":"epileptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epileptic","error-unrecognized-form-feminine-indefinite-singular":"epileptică","error-unrecognized-form-indefinite-masculine-plural":"epileptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epileptice","definite-error-unrecognized-form-masculine-neuter-singular":"epilepticul","definite-error-unrecognized-form-feminine-singular":"epileptica","definite-error-unrecognized-form-masculine-plural":"epilepticii","definite-error-unrecognized-form-feminine-neuter-plural":"epilepticele"}},{"word":"epileptică","pos":"noun","definitions":["female equivalent of epileptic"],"forms":{"plural":"epileptice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epileptică","accusative-definite-nominative-singular":"epileptica","accusative-indefinite-nominative-plural":"epileptice","accusative-definite-nominative-plural":"epilepticele","dative-genitive-indefinite-singular":"epileptice","dative-definite-genitive-singular":"epilepticei","dative-genitive-indefinite-plural":"epileptice","dative-definite-genitive-plural":"epilepticelor","singular-vocative":"epileptică","plural-vocative":"epilepticelor"}},{"word":"epilepticos","pos":"adj","definitions":["epileptic"],"forms":{"feminine-singular":"epilepticoasă","masculine-plural":"epilepticoși","feminine-neuter-plural":"epilepticoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epilepticos","error-unrecognized-form-feminine-indefinite-singular":"epilepticoasă","error-unrecognized-form-indefinite-masculine-plural":"epilepticoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"epilepticoase","definite-error-unrecognized-form-masculine-neuter-singular":"epilepticosul","definite-error-unrecognized-form-feminine-singular":"epilepticoasa","definite-error-unrecognized-form-masculine-plural":"epilepticoșii","definite-error-unrecognized-form-feminine-neuter-plural":"epilepticoasele"}},{"word":"epileptiform","pos":"adj","definitions":["epileptiform"],"forms":{"feminine-singular":"epileptiformă","masculine-plural":"epileptiformi","feminine-neuter-plural":"epileptiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epileptiform","error-unrecognized-form-feminine-indefinite-singular":"epileptiformă","error-unrecognized-form-indefinite-masculine-plural":"epileptiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"epileptiforme","definite-error-unrecognized-form-masculine-neuter-singular":"epileptiformul","definite-error-unrecognized-form-feminine-singular":"epileptiforma","definite-error-unrecognized-form-masculine-plural":"epileptiformii","definite-error-unrecognized-form-feminine-neuter-plural":"epileptiformele"}},{"word":"epileptogen","pos":"adj","definitions":["epileptogenic"],"forms":{"feminine-singular":"epileptogenă","masculine-plural":"epileptogeni","feminine-neuter-plural":"epileptogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epileptogen","error-unrecognized-form-feminine-indefinite-singular":"epileptogenă","error-unrecognized-form-indefinite-masculine-plural":"epileptogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"epileptogene","definite-error-unrecognized-form-masculine-neuter-singular":"epileptogenul","definite-error-unrecognized-form-feminine-singular":"epileptogena","definite-error-unrecognized-form-masculine-plural":"epileptogenii","definite-error-unrecognized-form-feminine-neuter-plural":"epileptogenele"}},{"word":"epileptoid","pos":"adj","definitions":["epileptoid"],"forms":{"feminine-singular":"epileptoidă","masculine-plural":"epileptoizi","feminine-neuter-plural":"epileptoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epileptoid","error-unrecognized-form-feminine-indefinite-singular":"epileptoidă","error-unrecognized-form-indefinite-masculine-plural":"epileptoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"epileptoide","definite-error-unrecognized-form-masculine-neuter-singular":"epileptoidul","definite-error-unrecognized-form-feminine-singular":"epileptoida","definite-error-unrecognized-form-masculine-plural":"epileptoizii","definite-error-unrecognized-form-feminine-neuter-plural":"epileptoidele"}},{"word":"epilog","pos":"noun","definitions":["epilogue"],"forms":{"plural":"epiloguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epilog","accusative-definite-nominative-singular":"epilogul","accusative-indefinite-nominative-plural":"epiloge","accusative-definite-nominative-plural":"epilogele","dative-genitive-indefinite-singular":"epilog","dative-definite-genitive-singular":"epilogului","dative-genitive-indefinite-plural":"epiloge","dative-definite-genitive-plural":"epilogelor","singular-vocative":"epilogule","plural-vocative":"epilogelor"}},{"word":"epiloga","pos":"verb","definitions":["to epilogue"],"forms":{"canonical":"a epiloga 1st conjugation","present-singular-third-person":"epiloghează","participle-past":"epilogat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a epiloga","gerund":"epilogând","first-person-indicative-present-singular":"epiloghez","indicative-present-second-person-singular":"epiloghezi","indicative-present-singular-third-person":"epiloghează","first-person-indicative-plural-present":"epilogăm","indicative-plural-present-second-person":"epilogați","indicative-plural-present-third-person":"epiloghează","first-person-imperfect-indicative-singular":"epilogam","imperfect-indicative-second-person-singular":"epilogai","imperfect-indicative-singular-third-person":"epiloga","first-person-imperfect-indicative-plural":"epilogam","imperfect-indicative-plural-second-person":"epilogați","imperfect-indicative-plural-third-person":"epilogau","first-person-indicative-perfect-singular":"epilogai","indicative-perfect-second-person-singular":"epilogași","indicative-perfect-singular-third-person":"epilogă","first-person-indicative-perfect-plural":"epilogarăm","indicative-perfect-plural-second-person":"epilogarăți","indicative-perfect-plural-third-person":"epilogară","first-person-indicative-pluperfect-singular":"epilogasem","indicative-pluperfect-second-person-singular":"epilogaseși","indicative-pluperfect-singular-third-person":"epilogase","first-person-indicative-pluperfect-plural":"epilogaserăm","indicative-pluperfect-plural-second-person":"epilogaserăți","indicative-pluperfect-plural-third-person":"epilogaseră","first-person-present-singular-subjunctive":"să epiloghez","present-second-person-singular-subjunctive":"să epiloghezi","present-singular-subjunctive-third-person":"să epilogheze","first-person-plural-present-subjunctive":"să epilogăm","plural-present-second-person-subjunctive":"să epilogați","plural-present-subjunctive-third-person":"să epilogheze","imperative-second-person-singular":"epiloghează","imperative-plural-second-person":"epilogați","imperative-negative-second-person-singular":"nu epiloga","imperative-negative-plural-second-person":"nu epilogați"}},{"word":"epilogal","pos":"adj","definitions":["epilogical"],"forms":{"feminine-singular":"epilogală","masculine-plural":"epilogali","feminine-neuter-plural":"epilogale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epilogal","error-unrecognized-form-feminine-indefinite-singular":"epilogală","error-unrecognized-form-indefinite-masculine-plural":"epilogali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epilogale","definite-error-unrecognized-form-masculine-neuter-singular":"epilogalul","definite-error-unrecognized-form-feminine-singular":"epilogala","definite-error-unrecognized-form-masculine-plural":"epilogalii","definite-error-unrecognized-form-feminine-neuter-plural":"epilogalele"}},{"word":"epilogare","pos":"noun","definitions":["an end, epilogue"],"forms":{"plural":"epilogări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epilogare","accusative-definite-nominative-singular":"epilogarea","accusative-indefinite-nominative-plural":"epilogări","accusative-definite-nominative-plural":"epilogările","dative-genitive-indefinite-singular":"epilogări","dative-definite-genitive-singular":"epilogării","dative-genitive-indefinite-plural":"epilogări","dative-definite-genitive-plural":"epilogărilor","singular-vocative":"epilogare","plural-vocative":"epilogărilor"}},{"word":"epilogat","pos":"adj","definitions":["ending"],"forms":{"feminine-singular":"epilogată","masculine-plural":"epilogați","feminine-neuter-plural":"epilogate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epilogat","error-unrecognized-form-feminine-indefinite-singular":"epilogată","error-unrecognized-form-indefinite-masculine-plural":"epilogați","error-unrecognized-form-feminine-indefinite-neuter-plural":"epilogate","definite-error-unrecognized-form-masculine-neuter-singular":"epilogatul","definite-error-unrecognized-form-feminine-singular":"epilogata","definite-error-unrecognized-form-masculine-plural":"epilogații","definite-error-unrecognized-form-feminine-neuter-plural":"epilogatele"}},{"word":"epilogat","pos":"verb","definitions":["past participle of epiloga"],"forms":{"participle-past":"of epiloga"}},{"word":"epilogism","pos":"noun","definitions":["epilogism"],"forms":{"plural":"epilogisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epilogism","accusative-definite-nominative-singular":"epilogismul","accusative-indefinite-nominative-plural":"epilogisme","accusative-definite-nominative-plural":"epilogismele","dative-genitive-indefinite-singular":"epilogism","dative-definite-genitive-singular":"epilogismului","dative-genitive-indefinite-plural":"epilogisme","dative-definite-genitive-plural":"epilogismelor","singular-vocative":"epilogismule","plural-vocative":"epilogismelor"}},{"word":"epimelie","pos":"noun","definitions":["care"],"forms":{"plural":"epimelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epimelie","accusative-definite-nominative-singular":"epimelia","accusative-indefinite-nominative-plural":"epimelii","accusative-definite-nominative-plural":"epimeliile","dative-genitive-indefinite-singular":"epimelii","dative-definite-genitive-singular":"epimeliei","dative-genitive-indefinite-plural":"epimelii","dative-definite-genitive-plural":"epimeliilor","singular-vocative":"epimelie","plural-vocative":"epimeliilor"}},{"word":"epimelisi","pos":"verb","definitions":["to take care"],"forms":{"canonical":"a epimelisi 4th conjugation","present-singular-third-person":"epimelisie","participle-past":"epimelisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a epimelisi","gerund":"epimelisind","first-person-indicative-present-singular":"epimelis","indicative-present-second-person-singular":"epimeliși","indicative-present-singular-third-person":"epimelise","first-person-indicative-plural-present":"epimelisim","indicative-plural-present-second-person":"epimelisiți","indicative-plural-present-third-person":"epimelis","first-person-imperfect-indicative-singular":"epimeliseam","imperfect-indicative-second-person-singular":"epimeliseai","imperfect-indicative-singular-third-person":"epimelisea","first-person-imperfect-indicative-plural":"epimeliseam","imperfect-indicative-plural-second-person":"epimeliseați","imperfect-indicative-plural-third-person":"epimeliseau","first-person-indicative-perfect-singular":"epimelisii","indicative-perfect-second-person-singular":"epimelisiși","indicative-perfect-singular-third-person":"epimelisi","first-person-indicative-perfect-plural":"epimelisirăm","indicative-perfect-plural-second-person":"epimelisirăți","indicative-perfect-plural-third-person":"epimelisiră","first-person-indicative-pluperfect-singular":"epimelisisem","indicative-pluperfect-second-person-singular":"epimelisiseși","indicative-pluperfect-singular-third-person":"epimelisise","first-person-indicative-pluperfect-plural":"epimelisiserăm","indicative-pluperfect-plural-second-person":"epimelisiserăți","indicative-pluperfect-plural-third-person":"epimelisiseră","first-person-present-singular-subjunctive":"să epimelis","present-second-person-singular-subjunctive":"să epimeliși","present-singular-subjunctive-third-person":"să epimelisă","first-person-plural-present-subjunctive":"să epimelisim","plural-present-second-person-subjunctive":"să epimelisiți","plural-present-subjunctive-third-person":"să epimelisă","imperative-second-person-singular":"epimelise","imperative-plural-second-person":"epimelisiți","imperative-negative-second-person-singular":"nu epimelisi","imperative-negative-plural-second-person":"nu epimelisiți"}},{"word":"epimelisire","pos":"noun","definitions":["care"],"forms":{"plural":"epimelisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epimelisire","accusative-definite-nominative-singular":"epimelisirea","accusative-indefinite-nominative-plural":"epimelisiri","accusative-definite-nominative-plural":"epimelisirile","dative-genitive-indefinite-singular":"epimelisiri","dative-definite-genitive-singular":"epimelisirii","dative-genitive-indefinite-plural":"epimelisiri","dative-definite-genitive-plural":"epimelisirilor","singular-vocative":"epimelisire","plural-vocative":"epimelisirilor"}},{"word":"epimelisit","pos":"adj","definitions":["cared"],"forms":{"feminine-singular":"epimelisită","masculine-plural":"epimelisiți","feminine-neuter-plural":"epimelisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epimelisit","error-unrecognized-form-feminine-indefinite-singular":"epimelisită","error-unrecognized-form-indefinite-masculine-plural":"epimelisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epimelisite","definite-error-unrecognized-form-masculine-neuter-singular":"epimelisitul","definite-error-unrecognized-form-feminine-singular":"epimelisita","definite-error-unrecognized-form-masculine-plural":"epimelisiții","definite-error-unrecognized-form-feminine-neuter-plural":"epimelisitele"}},{"word":"epimelisit","pos":"verb","definitions":["past participle of epimelisi"],"forms":{"participle-past":"of epimelisi"}},{"word":"epimonă","pos":"noun","definitions":["epimone"],"forms":{"plural":"epimone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epimonă","accusative-definite-nominative-singular":"epimona","accusative-indefinite-nominative-plural":"epimone","accusative-definite-nominative-plural":"epimonele","dative-genitive-indefinite-singular":"epimone","dative-definite-genitive-singular":"epimonei","dative-genitive-indefinite-plural":"epimone","dative-definite-genitive-plural":"epimonelor","singular-vocative":"epimonă","plural-vocative":"epimonelor"}},{"word":"epinefrină","pos":"noun","definitions":["epinephrine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epinefrină","accusative-definite-nominative-singular":"epinefrina","accusative-indefinite-nominative-plural":"epinefrine","accusative-definite-nominative-plural":"epinefrinele","dative-genitive-indefinite-singular":"epinefrine","dative-definite-genitive-singular":"epinefrinei","dative-genitive-indefinite-plural":"epinefrine","dative-definite-genitive-plural":"epinefrinelor","singular-vocative":"epinefrină","plural-vocative":"epinefrinelor"}},{"word":"epinetă","pos":"noun","definitions":["spinet"],"forms":{"plural":"epinete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epinetă","accusative-definite-nominative-singular":"epineta","accusative-indefinite-nominative-plural":"epinete","accusative-definite-nominative-plural":"epinetele","dative-genitive-indefinite-singular":"epinete","dative-definite-genitive-singular":"epinetei","dative-genitive-indefinite-plural":"epinete","dative-definite-genitive-plural":"epinetelor","singular-vocative":"epinetă","plural-vocative":"epinetelor"}},{"word":"epingea","pos":"noun","definitions":["alternative form of ipingea"],"forms":{"plural":"epingele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"epingea","accusative-definite-nominative-singular":"epingeaua","accusative-indefinite-nominative-plural":"epingele","accusative-definite-nominative-plural":"epingelele","dative-genitive-indefinite-singular":"epingele","dative-definite-genitive-singular":"epingelei","dative-genitive-indefinite-plural":"epingele","dative-definite-genitive-plural":"epingelelor","singular-vocative":"epingea","plural-vocative":"epingelelor"}},{"word":"epiorchie","pos":"noun","definitions":["perjury"],"forms":{"plural":"epiorchii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epiorchie","accusative-definite-nominative-singular":"epiorchia","accusative-indefinite-nominative-plural":"epiorchii","accusative-definite-nominative-plural":"epiorchiile","dative-genitive-indefinite-singular":"epiorchii","dative-definite-genitive-singular":"epiorchiei","dative-genitive-indefinite-plural":"epiorchii","dative-definite-genitive-plural":"epiorchiilor","singular-vocative":"epiorchie","plural-vocative":"epiorchiilor"}},{"word":"epipitidă","pos":"noun","definitions":["anthrax"],"forms":{"plural":"epipitide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epipitidă","accusative-definite-nominative-singular":"epipitida","accusative-indefinite-nominative-plural":"epipitide","accusative-definite-nominative-plural":"epipitidele","dative-genitive-indefinite-singular":"epipitide","dative-definite-genitive-singular":"epipitidei","dative-genitive-indefinite-plural":"epipitide","dative-definite-genitive-plural":"epipitidelor","singular-vocative":"epipitidă","plural-vocative":"epipitidelor"}},{"word":"epiplocă","pos":"noun","definitions":["concatenation"],"forms":{"plural":"epiploce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epiplocă","accusative-definite-nominative-singular":"epiploca","accusative-indefinite-nominative-plural":"epiploce","accusative-definite-nominative-plural":"epiplocele","dative-genitive-indefinite-singular":"epiploce","dative-definite-genitive-singular":"epiplocei","dative-genitive-indefinite-plural":"epiploce","dative-definite-genitive-plural":"epiplocelor","singular-vocative":"epiplocă","plural-vocative":"epiplocelor"}},{"word":"epiplon","pos":"noun","definitions":["epiploon"],"forms":{"plural":"epiploane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epiplon","accusative-definite-nominative-singular":"epiplonul","accusative-indefinite-nominative-plural":"epiploane","accusative-definite-nominative-plural":"epiploanele","dative-genitive-indefinite-singular":"epiplon","dative-definite-genitive-singular":"epiplonului","dative-genitive-indefinite-plural":"epiploane","dative-definite-genitive-plural":"epiploanelor","singular-vocative":"epiplonule","plural-vocative":"epiploanelor"}},{"word":"epirogenetic","pos":"adj","definitions":["epeirogenic"],"forms":{"feminine-singular":"epirogenetică","masculine-plural":"epirogenetici","feminine-neuter-plural":"epirogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epirogenetic","error-unrecognized-form-feminine-indefinite-singular":"epirogenetică","error-unrecognized-form-indefinite-masculine-plural":"epirogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epirogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"epirogeneticul","definite-error-unrecognized-form-feminine-singular":"epirogenetica","definite-error-unrecognized-form-masculine-plural":"epirogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"epirogeneticele"}},{"word":"epirogeneză","pos":"noun","definitions":["epeirogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epirogeneză","accusative-definite-nominative-singular":"epirogeneza","accusative-indefinite-nominative-plural":"epirogeneze","accusative-definite-nominative-plural":"epirogenezele","dative-genitive-indefinite-singular":"epirogeneze","dative-definite-genitive-singular":"epirogenezei","dative-genitive-indefinite-plural":"epirogeneze","dative-definite-genitive-plural":"epirogenezelor","singular-vocative":"epirogeneză","plural-vocative":"epirogenezelor"}},{"word":"epirogenic","pos":"adj","definitions":["epeirogenic"],"forms":{"feminine-singular":"epirogenică","masculine-plural":"epirogenici","feminine-neuter-plural":"epirogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epirogenic","error-unrecognized-form-feminine-indefinite-singular":"epirogenică","error-unrecognized-form-indefinite-masculine-plural":"epirogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epirogenice","definite-error-unrecognized-form-masculine-neuter-singular":"epirogenicul","definite-error-unrecognized-form-feminine-singular":"epirogenica","definite-error-unrecognized-form-masculine-plural":"epirogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"epirogenicele"}},{"word":"epirot","pos":"adj","definitions":["Epirotic"],"forms":{"feminine-singular":"epirotă","masculine-plural":"epiroți","feminine-neuter-plural":"epirote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epirot","error-unrecognized-form-feminine-indefinite-singular":"epirotă","error-unrecognized-form-indefinite-masculine-plural":"epiroți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epirote","definite-error-unrecognized-form-masculine-neuter-singular":"epirotul","definite-error-unrecognized-form-feminine-singular":"epirota","definite-error-unrecognized-form-masculine-plural":"epiroții","definite-error-unrecognized-form-feminine-neuter-plural":"epirotele"}},{"word":"epirot","pos":"noun","definitions":["Epirot"],"forms":{"plural":"epiroți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epirot","accusative-definite-nominative-singular":"epirotul","accusative-indefinite-nominative-plural":"epiroți","accusative-definite-nominative-plural":"epiroții","dative-genitive-indefinite-singular":"epirot","dative-definite-genitive-singular":"epirotului","dative-genitive-indefinite-plural":"epiroți","dative-definite-genitive-plural":"epiroților","singular-vocative":"epirotule","plural-vocative":"epiroților"}},{"word":"epirotic","pos":"adj","definitions":["Epirotic"],"forms":{"feminine-singular":"epirotică","masculine-plural":"epirotici","feminine-neuter-plural":"epirotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epirotic","error-unrecognized-form-feminine-indefinite-singular":"epirotică","error-unrecognized-form-indefinite-masculine-plural":"epirotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epirotice","definite-error-unrecognized-form-masculine-neuter-singular":"epiroticul","definite-error-unrecognized-form-feminine-singular":"epirotica","definite-error-unrecognized-form-masculine-plural":"epiroticii","definite-error-unrecognized-form-feminine-neuter-plural":"epiroticele"}},{"word":"episcop","pos":"noun","definitions":["bishop"],"forms":{"plural":"episcopi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"episcop","accusative-definite-nominative-singular":"episcopul","accusative-indefinite-nominative-plural":"episcopi","accusative-definite-nominative-plural":"episcopii","dative-genitive-indefinite-singular":"episcop","dative-definite-genitive-singular":"episcopului","dative-genitive-indefinite-plural":"episcopi","dative-definite-genitive-plural":"episcopilor","singular-vocative":"episcopule","plural-vocative":"episcopilor","alternative":"епископ"}},{"word":"episcop","pos":"noun","definitions":["episcope"],"forms":{"plural":"episcoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"episcop","accusative-definite-nominative-singular":"episcopul","accusative-indefinite-nominative-plural":"episcoape","accusative-definite-nominative-plural":"episcoapele","dative-genitive-indefinite-singular":"episcop","dative-definite-genitive-singular":"episcopului","dative-genitive-indefinite-plural":"episcoape","dative-definite-genitive-plural":"episcoapelor","singular-vocative":"episcopule","plural-vocative":"episcoapelor","alternative":"епископ"}},{"word":"episcopal","pos":"adj","definitions":["episcopal"],"pronunciation":"/ˌe.pis.koˈpal/","forms":{"feminine-singular":"episcopală","masculine-plural":"episcopali","feminine-neuter-plural":"episcopale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"episcopal","error-unrecognized-form-feminine-indefinite-singular":"episcopală","error-unrecognized-form-indefinite-masculine-plural":"episcopali","error-unrecognized-form-feminine-indefinite-neuter-plural":"episcopale","definite-error-unrecognized-form-masculine-neuter-singular":"episcopalul","definite-error-unrecognized-form-feminine-singular":"episcopala","definite-error-unrecognized-form-masculine-plural":"episcopalii","definite-error-unrecognized-form-feminine-neuter-plural":"episcopalele"}},{"word":"episcopat","pos":"noun","definitions":["episcopate"],"forms":{"plural":"episcopate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"episcopat","accusative-definite-nominative-singular":"episcopatul","accusative-indefinite-nominative-plural":"episcopate","accusative-definite-nominative-plural":"episcopatele","dative-genitive-indefinite-singular":"episcopat","dative-definite-genitive-singular":"episcopatului","dative-genitive-indefinite-plural":"episcopate","dative-definite-genitive-plural":"episcopatelor","singular-vocative":"episcopatule","plural-vocative":"episcopatelor"}},{"word":"episcopeasă","pos":"noun","definitions":["bishop's wife"],"forms":{"plural":"episcopese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"episcopeasă","accusative-definite-nominative-singular":"episcopeasa","accusative-indefinite-nominative-plural":"episcopese","accusative-definite-nominative-plural":"episcopesele","dative-genitive-indefinite-singular":"episcopese","dative-definite-genitive-singular":"episcopesei","dative-genitive-indefinite-plural":"episcopese","dative-definite-genitive-plural":"episcopeselor","singular-vocative":"episcopeasă","plural-vocative":"episcopeselor"}},{"word":"episcopesc","pos":"adj","definitions":["episcopal"],"forms":{"feminine-singular":"episcopească","plural":"episcopești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"episcopesc","error-unrecognized-form-feminine-indefinite-singular":"episcopească","error-unrecognized-form-indefinite-masculine-plural":"episcopești","error-unrecognized-form-feminine-indefinite-neuter-plural":"episcopești","definite-error-unrecognized-form-masculine-neuter-singular":"episcopescul","definite-error-unrecognized-form-feminine-singular":"episcopeasca","definite-error-unrecognized-form-masculine-plural":"episcopeștii","definite-error-unrecognized-form-feminine-neuter-plural":"episcopeștile"}},{"word":"Episcopescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Episcopescu"}},{"word":"episcopește","pos":"adv","definitions":["episcopally"]},{"word":"episcopic","pos":"adj","definitions":["episcopic"],"forms":{"feminine-singular":"episcopică","masculine-plural":"episcopici","feminine-neuter-plural":"episcopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"episcopic","error-unrecognized-form-feminine-indefinite-singular":"episcopică","error-unrecognized-form-indefinite-masculine-plural":"episcopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"episcopice","definite-error-unrecognized-form-masculine-neuter-singular":"episcopicul","definite-error-unrecognized-form-feminine-singular":"episcopica","definite-error-unrecognized-form-masculine-plural":"episcopicii","definite-error-unrecognized-form-feminine-neuter-plural":"episcopicele"}},{"word":"episcopicesc","pos":"adj","definitions":["episcopal"],"forms":{"feminine-singular":"episcopicească","plural":"episcopicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"episcopicesc","error-unrecognized-form-feminine-indefinite-singular":"episcopicească","error-unrecognized-form-indefinite-masculine-plural":"episcopicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"episcopicești","definite-error-unrecognized-form-masculine-neuter-singular":"episcopicescul","definite-error-unrecognized-form-feminine-singular":"episcopiceasca","definite-error-unrecognized-form-masculine-plural":"episcopiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"episcopiceștile"}},{"word":"episcopie","pos":"noun","definitions":["bishopric"],"forms":{"plural":"episcopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"episcopie","accusative-definite-nominative-singular":"episcopia","accusative-indefinite-nominative-plural":"episcopii","accusative-definite-nominative-plural":"episcopiile","dative-genitive-indefinite-singular":"episcopii","dative-definite-genitive-singular":"episcopiei","dative-genitive-indefinite-plural":"episcopii","dative-definite-genitive-plural":"episcopiilor","singular-vocative":"episcopie","plural-vocative":"episcopiilor"}},{"word":"episerie","pos":"noun","definitions":["grocery store"],"forms":{"plural":"episerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"episerie","accusative-definite-nominative-singular":"episeria","accusative-indefinite-nominative-plural":"episerii","accusative-definite-nominative-plural":"episeriile","dative-genitive-indefinite-singular":"episerii","dative-definite-genitive-singular":"episeriei","dative-genitive-indefinite-plural":"episerii","dative-definite-genitive-plural":"episeriilor","singular-vocative":"episerie","plural-vocative":"episeriilor"}},{"word":"episilogism","pos":"noun","definitions":["episyllogism"],"forms":{"plural":"episilogisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"episilogism","accusative-definite-nominative-singular":"episilogismul","accusative-indefinite-nominative-plural":"episilogisme","accusative-definite-nominative-plural":"episilogismele","dative-genitive-indefinite-singular":"episilogism","dative-definite-genitive-singular":"episilogismului","dative-genitive-indefinite-plural":"episilogisme","dative-definite-genitive-plural":"episilogismelor","singular-vocative":"episilogismule","plural-vocative":"episilogismelor"}},{"word":"episod","pos":"noun","definitions":["episode","installment"],"forms":{"plural":"episoade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"episod","accusative-definite-nominative-singular":"episodul","accusative-indefinite-nominative-plural":"episoade","accusative-definite-nominative-plural":"episoadele","dative-genitive-indefinite-singular":"episod","dative-definite-genitive-singular":"episodului","dative-genitive-indefinite-plural":"episoade","dative-definite-genitive-plural":"episoadelor","singular-vocative":"episodule","plural-vocative":"episoadelor"}},{"word":"episodic","pos":"adj","definitions":["episodic"],"forms":{"feminine-singular":"episodică","masculine-plural":"episodici","feminine-neuter-plural":"episodice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"episodic","error-unrecognized-form-feminine-indefinite-singular":"episodică","error-unrecognized-form-indefinite-masculine-plural":"episodici","error-unrecognized-form-feminine-indefinite-neuter-plural":"episodice","definite-error-unrecognized-form-masculine-neuter-singular":"episodicul","definite-error-unrecognized-form-feminine-singular":"episodica","definite-error-unrecognized-form-masculine-plural":"episodicii","definite-error-unrecognized-form-feminine-neuter-plural":"episodicele"}},{"word":"epispadias","pos":"noun","definitions":["epispadias"],"forms":{"plural":"epispadiasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epispadias","accusative-definite-nominative-singular":"epispadiasul","accusative-indefinite-nominative-plural":"epispadiasuri","accusative-definite-nominative-plural":"epispadiasurile","dative-genitive-indefinite-singular":"epispadias","dative-definite-genitive-singular":"epispadiasului","dative-genitive-indefinite-plural":"epispadiasuri","dative-definite-genitive-plural":"epispadiasurilor","singular-vocative":"epispadiasule","plural-vocative":"epispadiasurilor"}},{"word":"episperm","pos":"noun","definitions":["seed coat"],"forms":{"plural":"episperme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"episperm","accusative-definite-nominative-singular":"epispermul","accusative-indefinite-nominative-plural":"episperme","accusative-definite-nominative-plural":"epispermele","dative-genitive-indefinite-singular":"episperm","dative-definite-genitive-singular":"epispermului","dative-genitive-indefinite-plural":"episperme","dative-definite-genitive-plural":"epispermelor","singular-vocative":"epispermule","plural-vocative":"epispermelor"}},{"word":"epistat","pos":"noun","definitions":["police officer"],"forms":{"plural":"epistați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epistat","accusative-definite-nominative-singular":"epistatul","accusative-indefinite-nominative-plural":"epistați","accusative-definite-nominative-plural":"epistații","dative-genitive-indefinite-singular":"epistat","dative-definite-genitive-singular":"epistatului","dative-genitive-indefinite-plural":"epistați","dative-definite-genitive-plural":"epistaților","singular-vocative":"epistatule","plural-vocative":"epistaților"}},{"word":"epistaxis","pos":"noun","definitions":["epistaxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epistaxis","accusative-definite-nominative":"epistaxisul","dative-genitive-indefinite":"epistaxis","dative-definite-genitive":"epistaxisului","vocative":"epistaxisule"}},{"word":"epistemolog","pos":"noun","definitions":["epistemologist"],"forms":{"plural":"epistemologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epistemolog","accusative-definite-nominative-singular":"epistemologul","accusative-indefinite-nominative-plural":"epistemologi","accusative-definite-nominative-plural":"epistemologii","dative-genitive-indefinite-singular":"epistemolog","dative-definite-genitive-singular":"epistemologului","dative-genitive-indefinite-plural":"epistemologi","dative-definite-genitive-plural":"epistemologilor","singular-vocative":"epistemologule","plural-vocative":"epistemologilor"}},{"word":"epistemologic","pos":"adj","definitions":["epistemological"],"forms":{"feminine-singular":"epistemologică","masculine-plural":"epistemologici","feminine-neuter-plural":"epistemologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epistemologic","error-unrecognized-form-feminine-indefinite-singular":"epistemologică","error-unrecognized-form-indefinite-masculine-plural":"epistemologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epistemologice","definite-error-unrecognized-form-masculine-neuter-singular":"epistemologicul","definite-error-unrecognized-form-feminine-singular":"epistemologica","definite-error-unrecognized-form-masculine-plural":"epistemologicii","definite-error-unrecognized-form-feminine-neuter-plural":"epistemologicele"}},{"word":"epistemologie","pos":"noun","definitions":["epistemology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"epistemologie","accusative-definite-nominative":"epistemologia","dative-genitive-indefinite":"epistemologii","dative-definite-genitive":"epistemologiei","vocative":"epistemologie"}},{"word":"epistil","pos":"noun","definitions":["epistyle"],"forms":{"plural":"epistiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epistil","accusative-definite-nominative-singular":"epistilul","accusative-indefinite-nominative-plural":"epistiluri","accusative-definite-nominative-plural":"epistilurile","dative-genitive-indefinite-singular":"epistil","dative-definite-genitive-singular":"epistilului","dative-genitive-indefinite-plural":"epistiluri","dative-definite-genitive-plural":"epistilurilor","singular-vocative":"epistilule","plural-vocative":"epistilurilor"}},{"word":"epistilbit","pos":"noun","definitions":["epistilbite"],"forms":{"plural":"epistilbituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epistilbit","accusative-definite-nominative-singular":"epistilbitul","accusative-indefinite-nominative-plural":"epistilbituri","accusative-definite-nominative-plural":"epistilbiturile","dative-genitive-indefinite-singular":"epistilbit","dative-definite-genitive-singular":"epistilbitului","dative-genitive-indefinite-plural":"epistilbituri","dative-definite-genitive-plural":"epistilbiturilor","singular-vocative":"epistilbitule","plural-vocative":"epistilbiturilor"}},{"word":"epistimie","pos":"noun","definitions":["knowledge"],"forms":{"plural":"epistimii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epistimie","accusative-definite-nominative-singular":"epistimieul","accusative-indefinite-nominative-plural":"epistimii","accusative-definite-nominative-plural":"epistimiile","dative-genitive-indefinite-singular":"epistimie","dative-definite-genitive-singular":"epistimieului","dative-genitive-indefinite-plural":"epistimii","dative-definite-genitive-plural":"epistimiilor","singular-vocative":"epistimieule","plural-vocative":"epistimiilor"}},{"word":"epistola","pos":"noun","definitions":["definite nominative/accusative singular of epistolă"],"pronunciation":"[eˈpistola]","gender":"f"},{"word":"epistolă","pos":"noun","definitions":["epistle","letter"],"pronunciation":"[eˈpistolə]","forms":{"plural":"epistole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epistolă","accusative-definite-nominative-singular":"epistola","accusative-indefinite-nominative-plural":"epistole","accusative-definite-nominative-plural":"epistolele","dative-genitive-indefinite-singular":"epistole","dative-definite-genitive-singular":"epistolei","dative-genitive-indefinite-plural":"epistole","dative-definite-genitive-plural":"epistolelor","singular-vocative":"epistolă","plural-vocative":"epistolelor"}},{"word":"epistolar","pos":"adj","definitions":["epistolary"],"forms":{"feminine-singular":"epistolară","masculine-plural":"epistolari","feminine-neuter-plural":"epistolare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epistolar","error-unrecognized-form-feminine-indefinite-singular":"epistolară","error-unrecognized-form-indefinite-masculine-plural":"epistolari","error-unrecognized-form-feminine-indefinite-neuter-plural":"epistolare","definite-error-unrecognized-form-masculine-neuter-singular":"epistolarul","definite-error-unrecognized-form-feminine-singular":"epistolara","definite-error-unrecognized-form-masculine-plural":"epistolarii","definite-error-unrecognized-form-feminine-neuter-plural":"epistolarele"}},{"word":"epistole","pos":"noun","definitions":["inflection of epistolă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[eˈpistole]","gender":"f"},{"word":"epistoler","pos":"adj","definitions":["epistolary"],"forms":{"feminine-singular":"epistoleră","masculine-plural":"epistoleri","feminine-neuter-plural":"epistolere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epistoler","error-unrecognized-form-feminine-indefinite-singular":"epistoleră","error-unrecognized-form-indefinite-masculine-plural":"epistoleri","error-unrecognized-form-feminine-indefinite-neuter-plural":"epistolere","definite-error-unrecognized-form-masculine-neuter-singular":"epistolerul","definite-error-unrecognized-form-feminine-singular":"epistolera","definite-error-unrecognized-form-masculine-plural":"epistolerii","definite-error-unrecognized-form-feminine-neuter-plural":"epistolerele"}},{"word":"epistolie","pos":"noun","definitions":["letter, epistle"],"forms":{"plural":"epistolii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epistolie","accusative-definite-nominative-singular":"epistolia","accusative-indefinite-nominative-plural":"epistolii","accusative-definite-nominative-plural":"epistoliile","dative-genitive-indefinite-singular":"epistolii","dative-definite-genitive-singular":"epistoliei","dative-genitive-indefinite-plural":"epistolii","dative-definite-genitive-plural":"epistoliilor","singular-vocative":"epistolie","plural-vocative":"epistoliilor"}},{"word":"epistolier","pos":"noun","definitions":["epistolary"],"forms":{"plural":"epistolieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epistolier","accusative-definite-nominative-singular":"epistolierul","accusative-indefinite-nominative-plural":"epistolieri","accusative-definite-nominative-plural":"epistolierii","dative-genitive-indefinite-singular":"epistolier","dative-definite-genitive-singular":"epistolierului","dative-genitive-indefinite-plural":"epistolieri","dative-definite-genitive-plural":"epistolierilor","singular-vocative":"epistolierule","plural-vocative":"epistolierilor"}},{"word":"epistolograf","pos":"noun","definitions":["epistolographer"],"forms":{"plural":"epistolografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epistolograf","accusative-definite-nominative-singular":"epistolograful","accusative-indefinite-nominative-plural":"epistolografi","accusative-definite-nominative-plural":"epistolografii","dative-genitive-indefinite-singular":"epistolograf","dative-definite-genitive-singular":"epistolografului","dative-genitive-indefinite-plural":"epistolografi","dative-definite-genitive-plural":"epistolografilor","singular-vocative":"epistolografule","plural-vocative":"epistolografilor"}},{"word":"epistolografie","pos":"noun","definitions":["epistolography"],"forms":{"plural":"epistolografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epistolografie","accusative-definite-nominative-singular":"epistolografia","accusative-indefinite-nominative-plural":"epistolografii","accusative-definite-nominative-plural":"epistolografiile","dative-genitive-indefinite-singular":"epistolografii","dative-definite-genitive-singular":"epistolografiei","dative-genitive-indefinite-plural":"epistolografii","dative-definite-genitive-plural":"epistolografiilor","singular-vocative":"epistolografie","plural-vocative":"epistolografiilor"}},{"word":"epistrofă","pos":"noun","definitions":["epistrophe"],"forms":{"plural":"epistrofe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epistrofă","accusative-definite-nominative-singular":"epistrofa","accusative-indefinite-nominative-plural":"epistrofe","accusative-definite-nominative-plural":"epistrofele","dative-genitive-indefinite-singular":"epistrofe","dative-definite-genitive-singular":"epistrofei","dative-genitive-indefinite-plural":"epistrofe","dative-definite-genitive-plural":"epistrofelor","singular-vocative":"epistrofă","plural-vocative":"epistrofelor"}},{"word":"epitaf","pos":"noun","definitions":["epitaph"],"forms":{"plural":"epitafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epitaf","accusative-definite-nominative-singular":"epitaful","accusative-indefinite-nominative-plural":"epitafuri","accusative-definite-nominative-plural":"epitafurile","dative-genitive-indefinite-singular":"epitaf","dative-definite-genitive-singular":"epitafului","dative-genitive-indefinite-plural":"epitafuri","dative-definite-genitive-plural":"epitafurilor","singular-vocative":"epitafule","plural-vocative":"epitafurilor"}},{"word":"epitalam","pos":"noun","definitions":["epithalamium"],"pronunciation":"/e.pi.taˈlam/","forms":{"plural":"epitalamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epitalam","accusative-definite-nominative-singular":"epitalamul","accusative-indefinite-nominative-plural":"epitalamuri","accusative-definite-nominative-plural":"epitalamurile","dative-genitive-indefinite-singular":"epitalam","dative-definite-genitive-singular":"epitalamului","dative-genitive-indefinite-plural":"epitalamuri","dative-definite-genitive-plural":"epitalamurilor","singular-vocative":"epitalamule","plural-vocative":"epitalamurilor"}},{"word":"epitază","pos":"noun","definitions":["epitasis"],"forms":{"plural":"epitaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epitază","accusative-definite-nominative-singular":"epitaza","accusative-indefinite-nominative-plural":"epitaze","accusative-definite-nominative-plural":"epitazele","dative-genitive-indefinite-singular":"epitaze","dative-definite-genitive-singular":"epitazei","dative-genitive-indefinite-plural":"epitaze","dative-definite-genitive-plural":"epitazelor","singular-vocative":"epitază","plural-vocative":"epitazelor"}},{"word":"epitelial","pos":"adj","definitions":["epithelial"],"forms":{"feminine-singular":"epitelială","masculine-plural":"epiteliali","feminine-neuter-plural":"epiteliale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epitelial","error-unrecognized-form-feminine-indefinite-singular":"epitelială","error-unrecognized-form-indefinite-masculine-plural":"epiteliali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epiteliale","definite-error-unrecognized-form-masculine-neuter-singular":"epitelialul","definite-error-unrecognized-form-feminine-singular":"epiteliala","definite-error-unrecognized-form-masculine-plural":"epitelialii","definite-error-unrecognized-form-feminine-neuter-plural":"epitelialele"}},{"word":"epiteliom","pos":"noun","definitions":["epithelioma"],"forms":{"plural":"epiteliomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epiteliom","accusative-definite-nominative-singular":"epiteliomul","accusative-indefinite-nominative-plural":"epiteliomuri","accusative-definite-nominative-plural":"epiteliomurile","dative-genitive-indefinite-singular":"epiteliom","dative-definite-genitive-singular":"epiteliomului","dative-genitive-indefinite-plural":"epiteliomuri","dative-definite-genitive-plural":"epiteliomurilor","singular-vocative":"epiteliomule","plural-vocative":"epiteliomurilor"}},{"word":"epiteliu","pos":"noun","definitions":["epithelium"],"forms":{"plural":"epitelii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epiteliu","accusative-definite-nominative-singular":"epiteliul","accusative-indefinite-nominative-plural":"epitelii","accusative-definite-nominative-plural":"epiteliile","dative-genitive-indefinite-singular":"epiteliu","dative-definite-genitive-singular":"epiteliului","dative-genitive-indefinite-plural":"epitelii","dative-definite-genitive-plural":"epiteliilor","singular-vocative":"epiteliule","plural-vocative":"epiteliilor"}},{"word":"epitelizare","pos":"noun","definitions":["epithelialization"],"forms":{"plural":"epitelizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epitelizare","accusative-definite-nominative-singular":"epitelizarea","accusative-indefinite-nominative-plural":"epitelizări","accusative-definite-nominative-plural":"epitelizările","dative-genitive-indefinite-singular":"epitelizări","dative-definite-genitive-singular":"epitelizării","dative-genitive-indefinite-plural":"epitelizări","dative-definite-genitive-plural":"epitelizărilor","singular-vocative":"epitelizare","plural-vocative":"epitelizărilor"}},{"word":"epiteorisi","pos":"verb","definitions":["to examinate"],"forms":{"canonical":"a epiteorisi 4th conjugation","present-singular-third-person":"epiteorisie","participle-past":"epiteorisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a epiteorisi","gerund":"epiteorisind","first-person-indicative-present-singular":"epiteoris","indicative-present-second-person-singular":"epiteoriși","indicative-present-singular-third-person":"epiteorise","first-person-indicative-plural-present":"epiteorisim","indicative-plural-present-second-person":"epiteorisiți","indicative-plural-present-third-person":"epiteoris","first-person-imperfect-indicative-singular":"epiteoriseam","imperfect-indicative-second-person-singular":"epiteoriseai","imperfect-indicative-singular-third-person":"epiteorisea","first-person-imperfect-indicative-plural":"epiteoriseam","imperfect-indicative-plural-second-person":"epiteoriseați","imperfect-indicative-plural-third-person":"epiteoriseau","first-person-indicative-perfect-singular":"epiteorisii","indicative-perfect-second-person-singular":"epiteorisiși","indicative-perfect-singular-third-person":"epiteorisi","first-person-indicative-perfect-plural":"epiteorisirăm","indicative-perfect-plural-second-person":"epiteorisirăți","indicative-perfect-plural-third-person":"epiteorisiră","first-person-indicative-pluperfect-singular":"epiteorisisem","indicative-pluperfect-second-person-singular":"epiteorisiseși","indicative-pluperfect-singular-third-person":"epiteorisise","first-person-indicative-pluperfect-plural":"epiteorisiserăm","indicative-pluperfect-plural-second-person":"epiteorisiserăți","indicative-pluperfect-plural-third-person":"epiteorisiseră","first-person-present-singular-subjunctive":"să epiteoris","present-second-person-singular-subjunctive":"să epiteoriși","present-singular-subjunctive-third-person":"să epiteorisă","first-person-plural-present-subjunctive":"să epiteorisim","plural-present-second-person-subjunctive":"să epiteorisiți","plural-present-subjunctive-third-person":"să epiteorisă","imperative-second-person-singular":"epiteorise","imperative-plural-second-person":"epiteorisiți","imperative-negative-second-person-singular":"nu epiteorisi","imperative-negative-plural-second-person":"nu epiteorisiți"}},{"word":"epitermal","pos":"adj","definitions":["epithermal"],"forms":{"feminine-singular":"epitermală","masculine-plural":"epitermali","feminine-neuter-plural":"epitermale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epitermal","error-unrecognized-form-feminine-indefinite-singular":"epitermală","error-unrecognized-form-indefinite-masculine-plural":"epitermali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epitermale","definite-error-unrecognized-form-masculine-neuter-singular":"epitermalul","definite-error-unrecognized-form-feminine-singular":"epitermala","definite-error-unrecognized-form-masculine-plural":"epitermalii","definite-error-unrecognized-form-feminine-neuter-plural":"epitermalele"}},{"word":"epitet","pos":"noun","definitions":["epithet"],"forms":{"plural":"epitete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epitet","accusative-definite-nominative-singular":"epitetul","accusative-indefinite-nominative-plural":"epitete","accusative-definite-nominative-plural":"epitetele","dative-genitive-indefinite-singular":"epitet","dative-definite-genitive-singular":"epitetului","dative-genitive-indefinite-plural":"epitete","dative-definite-genitive-plural":"epitetelor","singular-vocative":"epitetule","plural-vocative":"epitetelor"}},{"word":"epitetic","pos":"adj","definitions":["epithetic"],"forms":{"feminine-singular":"epitetică","masculine-plural":"epitetici","feminine-neuter-plural":"epitetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epitetic","error-unrecognized-form-feminine-indefinite-singular":"epitetică","error-unrecognized-form-indefinite-masculine-plural":"epitetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epitetice","definite-error-unrecognized-form-masculine-neuter-singular":"epiteticul","definite-error-unrecognized-form-feminine-singular":"epitetica","definite-error-unrecognized-form-masculine-plural":"epiteticii","definite-error-unrecognized-form-feminine-neuter-plural":"epiteticele"}},{"word":"epiteză","pos":"noun","definitions":["epithesis"],"forms":{"plural":"epiteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epiteză","accusative-definite-nominative-singular":"epiteza","accusative-indefinite-nominative-plural":"epiteze","accusative-definite-nominative-plural":"epitezele","dative-genitive-indefinite-singular":"epiteze","dative-definite-genitive-singular":"epitezei","dative-genitive-indefinite-plural":"epiteze","dative-definite-genitive-plural":"epitezelor","singular-vocative":"epiteză","plural-vocative":"epitezelor"}},{"word":"epitimie","pos":"noun","definitions":["penance"],"forms":{"plural":"epitimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epitimie","accusative-definite-nominative-singular":"epitimia","accusative-indefinite-nominative-plural":"epitimii","accusative-definite-nominative-plural":"epitimiile","dative-genitive-indefinite-singular":"epitimii","dative-definite-genitive-singular":"epitimiei","dative-genitive-indefinite-plural":"epitimii","dative-definite-genitive-plural":"epitimiilor","singular-vocative":"epitimie","plural-vocative":"epitimiilor"}},{"word":"epitomator","pos":"noun","definitions":["epitomizer"],"forms":{"plural":"epitomatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epitomator","accusative-definite-nominative-singular":"epitomatorul","accusative-indefinite-nominative-plural":"epitomatori","accusative-definite-nominative-plural":"epitomatorii","dative-genitive-indefinite-singular":"epitomator","dative-definite-genitive-singular":"epitomatorului","dative-genitive-indefinite-plural":"epitomatori","dative-definite-genitive-plural":"epitomatorilor","singular-vocative":"epitomatorule","plural-vocative":"epitomatorilor"}},{"word":"epitră","pos":"noun","definitions":["epistle (a letter)"],"forms":{"plural":"epitre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epitră","accusative-definite-nominative-singular":"epitra","accusative-indefinite-nominative-plural":"epitre","accusative-definite-nominative-plural":"epitrele","dative-genitive-indefinite-singular":"epitre","dative-definite-genitive-singular":"epitrei","dative-genitive-indefinite-plural":"epitre","dative-definite-genitive-plural":"epitrelor","singular-vocative":"epitră","plural-vocative":"epitrelor"}},{"word":"epitrahil","pos":"noun","definitions":["alternative form of patrafir"],"forms":{"plural":"epitrahile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epitrahil","accusative-definite-nominative-singular":"epitrahilul","accusative-indefinite-nominative-plural":"epitrahile","accusative-definite-nominative-plural":"epitrahilele","dative-genitive-indefinite-singular":"epitrahil","dative-definite-genitive-singular":"epitrahilului","dative-genitive-indefinite-plural":"epitrahile","dative-definite-genitive-plural":"epitrahilelor","singular-vocative":"epitrahilule","plural-vocative":"epitrahilelor"}},{"word":"epitrop","pos":"noun","definitions":["guardian (person legally responsible for a minor)","trustee"],"forms":{"plural":"epitropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epitrop","accusative-definite-nominative-singular":"epitropul","accusative-indefinite-nominative-plural":"epitropi","accusative-definite-nominative-plural":"epitropii","dative-genitive-indefinite-singular":"epitrop","dative-definite-genitive-singular":"epitropului","dative-genitive-indefinite-plural":"epitropi","dative-definite-genitive-plural":"epitropilor","singular-vocative":"epitropule","plural-vocative":"epitropilor"}},{"word":"epitropie","pos":"noun","definitions":["guardianship"],"forms":{"plural":"epitropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epitropie","accusative-definite-nominative-singular":"epitropia","accusative-indefinite-nominative-plural":"epitropii","accusative-definite-nominative-plural":"epitropiile","dative-genitive-indefinite-singular":"epitropii","dative-definite-genitive-singular":"epitropiei","dative-genitive-indefinite-plural":"epitropii","dative-definite-genitive-plural":"epitropiilor","singular-vocative":"epitropie","plural-vocative":"epitropiilor"}},{"word":"epitropire","pos":"noun","definitions":["guardianship"],"forms":{"plural":"epitropiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epitropire","accusative-definite-nominative-singular":"epitropirea","accusative-indefinite-nominative-plural":"epitropiri","accusative-definite-nominative-plural":"epitropirile","dative-genitive-indefinite-singular":"epitropiri","dative-definite-genitive-singular":"epitropirii","dative-genitive-indefinite-plural":"epitropiri","dative-definite-genitive-plural":"epitropirilor","singular-vocative":"epitropire","plural-vocative":"epitropirilor"}},{"word":"epitropisire","pos":"noun","definitions":["guardianship"],"forms":{"plural":"epitropisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epitropisire","accusative-definite-nominative-singular":"epitropisirea","accusative-indefinite-nominative-plural":"epitropisiri","accusative-definite-nominative-plural":"epitropisirile","dative-genitive-indefinite-singular":"epitropisiri","dative-definite-genitive-singular":"epitropisirii","dative-genitive-indefinite-plural":"epitropisiri","dative-definite-genitive-plural":"epitropisirilor","singular-vocative":"epitropisire","plural-vocative":"epitropisirilor"}},{"word":"epitropit","pos":"adj","definitions":["guardianship"],"forms":{"feminine-singular":"epitropită","masculine-plural":"epitropiți","feminine-neuter-plural":"epitropite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epitropit","error-unrecognized-form-feminine-indefinite-singular":"epitropită","error-unrecognized-form-indefinite-masculine-plural":"epitropiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epitropite","definite-error-unrecognized-form-masculine-neuter-singular":"epitropitul","definite-error-unrecognized-form-feminine-singular":"epitropita","definite-error-unrecognized-form-masculine-plural":"epitropiții","definite-error-unrecognized-form-feminine-neuter-plural":"epitropitele"}},{"word":"epitropit","pos":"verb","definitions":["past participle of epitropi"],"forms":{"participle-past":"of epitropi"}},{"word":"epizeuxis","pos":"noun","definitions":["epizeuxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epizeuxis","accusative-definite-nominative":"epizeuxisul","dative-genitive-indefinite":"epizeuxis","dative-definite-genitive":"epizeuxisului","vocative":"epizeuxisule"}},{"word":"epizoar","pos":"noun","definitions":["epizoan"],"forms":{"plural":"epizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epizoar","accusative-definite-nominative-singular":"epizoarul","accusative-indefinite-nominative-plural":"epizoare","accusative-definite-nominative-plural":"epizoarele","dative-genitive-indefinite-singular":"epizoar","dative-definite-genitive-singular":"epizoarului","dative-genitive-indefinite-plural":"epizoare","dative-definite-genitive-plural":"epizoarelor","singular-vocative":"epizoarule","plural-vocative":"epizoarelor"}},{"word":"epizod","pos":"noun","definitions":["alternative form of episod"],"forms":{"plural":"epizoade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epizod","accusative-definite-nominative-singular":"epizodul","accusative-indefinite-nominative-plural":"epizoade","accusative-definite-nominative-plural":"epizoadele","dative-genitive-indefinite-singular":"epizod","dative-definite-genitive-singular":"epizodului","dative-genitive-indefinite-plural":"epizoade","dative-definite-genitive-plural":"epizoadelor","singular-vocative":"epizodule","plural-vocative":"epizoadelor"}},{"word":"epizootic","pos":"adj","definitions":["epizootic"],"forms":{"feminine-singular":"epizootică","masculine-plural":"epizootici","feminine-neuter-plural":"epizootice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epizootic","error-unrecognized-form-feminine-indefinite-singular":"epizootică","error-unrecognized-form-indefinite-masculine-plural":"epizootici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epizootice","definite-error-unrecognized-form-masculine-neuter-singular":"epizooticul","definite-error-unrecognized-form-feminine-singular":"epizootica","definite-error-unrecognized-form-masculine-plural":"epizooticii","definite-error-unrecognized-form-feminine-neuter-plural":"epizooticele"}},{"word":"epizootie","pos":"noun","definitions":["epizootic"],"forms":{"plural":"epizootii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epizootie","accusative-definite-nominative-singular":"epizootia","accusative-indefinite-nominative-plural":"epizootii","accusative-definite-nominative-plural":"epizootiile","dative-genitive-indefinite-singular":"epizootii","dative-definite-genitive-singular":"epizootiei","dative-genitive-indefinite-plural":"epizootii","dative-definite-genitive-plural":"epizootiilor","singular-vocative":"epizootie","plural-vocative":"epizootiilor"}},{"word":"epoca","pos":"noun","definitions":["definite nominative/accusative singular of epocă"],"pronunciation":"[ˈepoka]","gender":"f"},{"word":"epocă","pos":"noun","definitions":["epoch, age"],"pronunciation":"[ˈe.po.kə]","forms":{"plural":"epoci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"epocă","accusative-definite-nominative-singular":"epoca","accusative-indefinite-nominative-plural":"epoci","accusative-definite-nominative-plural":"epocile","dative-genitive-indefinite-singular":"epoci","dative-definite-genitive-singular":"epocii","dative-genitive-indefinite-plural":"epoci","dative-definite-genitive-plural":"epocilor","singular-vocative":"epocă","plural-vocative":"epocilor"}},{"word":"epoca bronzului","pos":"noun","definitions":["Bronze Age"]},{"word":"epocă de aur","pos":"noun","definitions":["golden age"],"forms":{"plural":"epoci de aur"}},{"word":"epoca de bronz","pos":"noun","definitions":["Bronze Age"]},{"word":"epoca de fier","pos":"noun","definitions":["iron age"]},{"word":"epoca de piatră","pos":"noun","definitions":["stone age"]},{"word":"epoca fierului","pos":"noun","definitions":["iron age"]},{"word":"epocă glaciară","pos":"noun","definitions":["ice age"],"forms":{"plural":"epoci glaciare"}},{"word":"epocal","pos":"adj","definitions":["epochal"],"forms":{"feminine-singular":"epocală","masculine-plural":"epocali","feminine-neuter-plural":"epocale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epocal","error-unrecognized-form-feminine-indefinite-singular":"epocală","error-unrecognized-form-indefinite-masculine-plural":"epocali","error-unrecognized-form-feminine-indefinite-neuter-plural":"epocale","definite-error-unrecognized-form-masculine-neuter-singular":"epocalul","definite-error-unrecognized-form-feminine-singular":"epocala","definite-error-unrecognized-form-masculine-plural":"epocalii","definite-error-unrecognized-form-feminine-neuter-plural":"epocalele"}},{"word":"epodă","pos":"noun","definitions":["epode"],"forms":{"plural":"epode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epodă","accusative-definite-nominative-singular":"epoda","accusative-indefinite-nominative-plural":"epode","accusative-definite-nominative-plural":"epodele","dative-genitive-indefinite-singular":"epode","dative-definite-genitive-singular":"epodei","dative-genitive-indefinite-plural":"epode","dative-definite-genitive-plural":"epodelor","singular-vocative":"epodă","plural-vocative":"epodelor"}},{"word":"epohă","pos":"noun","definitions":["alternative form of epocă"],"forms":{"plural":"epohe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epohă","accusative-definite-nominative-singular":"epoha","accusative-indefinite-nominative-plural":"epohe","accusative-definite-nominative-plural":"epohele","dative-genitive-indefinite-singular":"epohe","dative-definite-genitive-singular":"epohei","dative-genitive-indefinite-plural":"epohe","dative-definite-genitive-plural":"epohelor","singular-vocative":"epohă","plural-vocative":"epohelor"}},{"word":"epolet","pos":"noun","definitions":["epaulet"],"forms":{"plural":"epoleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"epolet","accusative-definite-nominative-singular":"epoletul","accusative-indefinite-nominative-plural":"epoleți","accusative-definite-nominative-plural":"epoleții","dative-genitive-indefinite-singular":"epolet","dative-definite-genitive-singular":"epoletului","dative-genitive-indefinite-plural":"epoleți","dative-definite-genitive-plural":"epoleților","singular-vocative":"epoletule","plural-vocative":"epoleților"}},{"word":"epoletă","pos":"noun","definitions":["obsolete form of epolet"],"forms":{"plural":"epolete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epoletă","accusative-definite-nominative-singular":"epoleta","accusative-indefinite-nominative-plural":"epolete","accusative-definite-nominative-plural":"epoletele","dative-genitive-indefinite-singular":"epolete","dative-definite-genitive-singular":"epoletei","dative-genitive-indefinite-plural":"epolete","dative-definite-genitive-plural":"epoletelor","singular-vocative":"epoletă","plural-vocative":"epoletelor"}},{"word":"eponim","pos":"noun","definitions":["eponym"],"forms":{"plural":"eponimi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eponim","accusative-definite-nominative-singular":"eponimul","accusative-indefinite-nominative-plural":"eponimi","accusative-definite-nominative-plural":"eponimii","dative-genitive-indefinite-singular":"eponim","dative-definite-genitive-singular":"eponimului","dative-genitive-indefinite-plural":"eponimi","dative-definite-genitive-plural":"eponimilor","singular-vocative":"eponimule","plural-vocative":"eponimilor"}},{"word":"eponimie","pos":"noun","definitions":["eponymy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eponimie","accusative-definite-nominative":"eponimia","dative-genitive-indefinite":"eponimii","dative-definite-genitive":"eponimiei","vocative":"eponimie"}},{"word":"eponj","pos":"noun","definitions":["sponge"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eponj","accusative-definite-nominative":"eponjul","dative-genitive-indefinite":"eponj","dative-definite-genitive":"eponjului","vocative":"eponjule"}},{"word":"epopee","pos":"noun","definitions":["epic"],"forms":{"plural":"epopei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epopee","accusative-definite-nominative-singular":"epopeea","accusative-indefinite-nominative-plural":"epopei","accusative-definite-nominative-plural":"epopeile","dative-genitive-indefinite-singular":"epopei","dative-definite-genitive-singular":"epopeii","dative-genitive-indefinite-plural":"epopei","dative-definite-genitive-plural":"epopeilor","singular-vocative":"epopee","plural-vocative":"epopeilor"}},{"word":"epopeic","pos":"adj","definitions":["epic"],"forms":{"feminine-singular":"epopeică","masculine-plural":"epopeici","feminine-neuter-plural":"epopeice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epopeic","error-unrecognized-form-feminine-indefinite-singular":"epopeică","error-unrecognized-form-indefinite-masculine-plural":"epopeici","error-unrecognized-form-feminine-indefinite-neuter-plural":"epopeice","definite-error-unrecognized-form-masculine-neuter-singular":"epopeicul","definite-error-unrecognized-form-feminine-singular":"epopeica","definite-error-unrecognized-form-masculine-plural":"epopeicii","definite-error-unrecognized-form-feminine-neuter-plural":"epopeicele"}},{"word":"epos","pos":"noun","definitions":["epic"],"pronunciation":"/eˈpos/","forms":{"plural":"eposuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"epos","accusative-definite-nominative-singular":"eposul","accusative-indefinite-nominative-plural":"eposuri","accusative-definite-nominative-plural":"eposurile","dative-genitive-indefinite-singular":"epos","dative-definite-genitive-singular":"eposului","dative-genitive-indefinite-plural":"eposuri","dative-definite-genitive-plural":"eposurilor","singular-vocative":"eposule","plural-vocative":"eposurilor"}},{"word":"epoxid","pos":"noun","definitions":["epoxide"],"forms":{"plural":"epoxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epoxid","accusative-definite-nominative-singular":"epoxidul","accusative-indefinite-nominative-plural":"epoxizi","accusative-definite-nominative-plural":"epoxizile","dative-genitive-indefinite-singular":"epoxid","dative-definite-genitive-singular":"epoxidului","dative-genitive-indefinite-plural":"epoxizi","dative-definite-genitive-plural":"epoxizilor","singular-vocative":"epoxidule","plural-vocative":"epoxizilor"}},{"word":"eprubetă","pos":"noun","definitions":["test tube"],"forms":{"plural":"eprubete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eprubetă","accusative-definite-nominative-singular":"eprubeta","accusative-indefinite-nominative-plural":"eprubete","accusative-definite-nominative-plural":"eprubetele","dative-genitive-indefinite-singular":"eprubete","dative-definite-genitive-singular":"eprubetei","dative-genitive-indefinite-plural":"eprubete","dative-definite-genitive-plural":"eprubetelor","singular-vocative":"eprubetă","plural-vocative":"eprubetelor"}},{"word":"epruvetă","pos":"noun","definitions":["test tube"],"forms":{"plural":"epruvete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epruvetă","accusative-definite-nominative-singular":"epruveta","accusative-indefinite-nominative-plural":"epruvete","accusative-definite-nominative-plural":"epruvetele","dative-genitive-indefinite-singular":"epruvete","dative-definite-genitive-singular":"epruvetei","dative-genitive-indefinite-plural":"epruvete","dative-definite-genitive-plural":"epruvetelor","singular-vocative":"epruvetă","plural-vocative":"epruvetelor"}},{"word":"epsomit","pos":"noun","definitions":["epsomite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"epsomit","accusative-definite-nominative":"epsomitul","dative-genitive-indefinite":"epsomit","dative-definite-genitive":"epsomitului","vocative":"epsomitule"}},{"word":"epuiza","pos":"verb","definitions":["to tire, drain, exhaust, wear out, tire out, spend, overfatigue"],"forms":{"canonical":"a epuiza 1st conjugation","present-singular-third-person":"epuizează","participle-past":"epuizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a epuiza","gerund":"epuizând","first-person-indicative-present-singular":"epuizez","indicative-present-second-person-singular":"epuizezi","indicative-present-singular-third-person":"epuizează","first-person-indicative-plural-present":"epuizăm","indicative-plural-present-second-person":"epuizați","indicative-plural-present-third-person":"epuizează","first-person-imperfect-indicative-singular":"epuizam","imperfect-indicative-second-person-singular":"epuizai","imperfect-indicative-singular-third-person":"epuiza","first-person-imperfect-indicative-plural":"epuizam","imperfect-indicative-plural-second-person":"epuizați","imperfect-indicative-plural-third-person":"epuizau","first-person-indicative-perfect-singular":"epuizai","indicative-perfect-second-person-singular":"epuizași","indicative-perfect-singular-third-person":"epuiză","first-person-indicative-perfect-plural":"epuizarăm","indicative-perfect-plural-second-person":"epuizarăți","indicative-perfect-plural-third-person":"epuizară","first-person-indicative-pluperfect-singular":"epuizasem","indicative-pluperfect-second-person-singular":"epuizaseși","indicative-pluperfect-singular-third-person":"epuizase","first-person-indicative-pluperfect-plural":"epuizaserăm","indicative-pluperfect-plural-second-person":"epuizaserăți","indicative-pluperfect-plural-third-person":"epuizaseră","first-person-present-singular-subjunctive":"să epuizez","present-second-person-singular-subjunctive":"să epuizezi","present-singular-subjunctive-third-person":"să epuizeze","first-person-plural-present-subjunctive":"să epuizăm","plural-present-second-person-subjunctive":"să epuizați","plural-present-subjunctive-third-person":"să epuizeze","imperative-second-person-singular":"epuizează","imperative-plural-second-person":"epuizați","imperative-negative-second-person-singular":"nu epuiza","imperative-negative-plural-second-person":"nu epuizați"}},{"word":"epuizabil","pos":"adj","definitions":["exhaustible"],"forms":{"feminine-singular":"epuizabilă","masculine-plural":"epuizabili","feminine-neuter-plural":"epuizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epuizabil","error-unrecognized-form-feminine-indefinite-singular":"epuizabilă","error-unrecognized-form-indefinite-masculine-plural":"epuizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"epuizabile","definite-error-unrecognized-form-masculine-neuter-singular":"epuizabilul","definite-error-unrecognized-form-feminine-singular":"epuizabila","definite-error-unrecognized-form-masculine-plural":"epuizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"epuizabilele"}},{"word":"epuizant","pos":"adj","definitions":["gruelling"],"forms":{"feminine-singular":"epuizantă","masculine-plural":"epuizanți","feminine-neuter-plural":"epuizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epuizant","error-unrecognized-form-feminine-indefinite-singular":"epuizantă","error-unrecognized-form-indefinite-masculine-plural":"epuizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"epuizante","definite-error-unrecognized-form-masculine-neuter-singular":"epuizantul","definite-error-unrecognized-form-feminine-singular":"epuizanta","definite-error-unrecognized-form-masculine-plural":"epuizanții","definite-error-unrecognized-form-feminine-neuter-plural":"epuizantele"}},{"word":"epuizare","pos":"noun","definitions":["exhaustion"],"forms":{"plural":"epuizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epuizare","accusative-definite-nominative-singular":"epuizarea","accusative-indefinite-nominative-plural":"epuizări","accusative-definite-nominative-plural":"epuizările","dative-genitive-indefinite-singular":"epuizări","dative-definite-genitive-singular":"epuizării","dative-genitive-indefinite-plural":"epuizări","dative-definite-genitive-plural":"epuizărilor","singular-vocative":"epuizare","plural-vocative":"epuizărilor"}},{"word":"epuizat","pos":"adj","definitions":["exhausted"],"forms":{"feminine-singular":"epuizată","masculine-plural":"epuizați","feminine-neuter-plural":"epuizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epuizat","error-unrecognized-form-feminine-indefinite-singular":"epuizată","error-unrecognized-form-indefinite-masculine-plural":"epuizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"epuizate","definite-error-unrecognized-form-masculine-neuter-singular":"epuizatul","definite-error-unrecognized-form-feminine-singular":"epuizata","definite-error-unrecognized-form-masculine-plural":"epuizații","definite-error-unrecognized-form-feminine-neuter-plural":"epuizatele"}},{"word":"epura","pos":"verb","definitions":["to epurate, to purify"],"pronunciation":"/e.puˈra/","forms":{"canonical":"a epura 1st conjugation","present-singular-third-person":"epurează","participle-past":"epurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a epura","gerund":"epurând","first-person-indicative-present-singular":"epurez","indicative-present-second-person-singular":"epurezi","indicative-present-singular-third-person":"epurează","first-person-indicative-plural-present":"epurăm","indicative-plural-present-second-person":"epurați","indicative-plural-present-third-person":"epurează","first-person-imperfect-indicative-singular":"epuram","imperfect-indicative-second-person-singular":"epurai","imperfect-indicative-singular-third-person":"epura","first-person-imperfect-indicative-plural":"epuram","imperfect-indicative-plural-second-person":"epurați","imperfect-indicative-plural-third-person":"epurau","first-person-indicative-perfect-singular":"epurai","indicative-perfect-second-person-singular":"epurași","indicative-perfect-singular-third-person":"epură","first-person-indicative-perfect-plural":"epurarăm","indicative-perfect-plural-second-person":"epurarăți","indicative-perfect-plural-third-person":"epurară","first-person-indicative-pluperfect-singular":"epurasem","indicative-pluperfect-second-person-singular":"epuraseși","indicative-pluperfect-singular-third-person":"epurase","first-person-indicative-pluperfect-plural":"epuraserăm","indicative-pluperfect-plural-second-person":"epuraserăți","indicative-pluperfect-plural-third-person":"epuraseră","first-person-present-singular-subjunctive":"să epurez","present-second-person-singular-subjunctive":"să epurezi","present-singular-subjunctive-third-person":"să epureze","first-person-plural-present-subjunctive":"să epurăm","plural-present-second-person-subjunctive":"să epurați","plural-present-subjunctive-third-person":"să epureze","imperative-second-person-singular":"epurează","imperative-plural-second-person":"epurați","imperative-negative-second-person-singular":"nu epura","imperative-negative-plural-second-person":"nu epurați"}},{"word":"epură","pos":"noun","definitions":["blueprint"],"forms":{"plural":"epure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"epură","accusative-definite-nominative-singular":"epura","accusative-indefinite-nominative-plural":"epure","accusative-definite-nominative-plural":"epurele","dative-genitive-indefinite-singular":"epure","dative-definite-genitive-singular":"epurei","dative-genitive-indefinite-plural":"epure","dative-definite-genitive-plural":"epurelor","singular-vocative":"epură","plural-vocative":"epurelor"}},{"word":"epurare","pos":"noun","definitions":["purge"],"forms":{"plural":"epurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epurare","accusative-definite-nominative-singular":"epurarea","accusative-indefinite-nominative-plural":"epurări","accusative-definite-nominative-plural":"epurările","dative-genitive-indefinite-singular":"epurări","dative-definite-genitive-singular":"epurării","dative-genitive-indefinite-plural":"epurări","dative-definite-genitive-plural":"epurărilor","singular-vocative":"epurare","plural-vocative":"epurărilor"}},{"word":"epurare etnică","pos":"noun","definitions":["ethnic cleansing"],"pronunciation":"[epuˈrareːtnikə]","forms":{"plural":"epurări etnice","table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"epurare etnică","accusative-definite-nominative-singular":"epurarea etnică","accusative-indefinite-nominative-plural":"epurări etnice","accusative-definite-nominative-plural":"epurările etnice","dative-genitive-indefinite-singular":"epurări etnice","dative-definite-genitive-singular":"epurării etnice","dative-genitive-indefinite-plural":"epurări etnice","dative-definite-genitive-plural":"epurărilor etnice","singular-vocative":"-","plural-vocative":"-"}},{"word":"Epuraru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Epuraru"}},{"word":"Epuraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Epuraș"}},{"word":"epurat","pos":"adj","definitions":["epurated, purified"],"forms":{"feminine-singular":"epurată","masculine-plural":"epurați","feminine-neuter-plural":"epurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epurat","error-unrecognized-form-feminine-indefinite-singular":"epurată","error-unrecognized-form-indefinite-masculine-plural":"epurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"epurate","definite-error-unrecognized-form-masculine-neuter-singular":"epuratul","definite-error-unrecognized-form-feminine-singular":"epurata","definite-error-unrecognized-form-masculine-plural":"epurații","definite-error-unrecognized-form-feminine-neuter-plural":"epuratele"}},{"word":"epurat","pos":"verb","definitions":["past participle of epura"],"forms":{"participle-past":"of epura"}},{"word":"epurație","pos":"noun","definitions":["purification"],"forms":{"plural":"epurații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"epurație","accusative-definite-nominative-singular":"epurația","accusative-indefinite-nominative-plural":"epurații","accusative-definite-nominative-plural":"epurațiile","dative-genitive-indefinite-singular":"epurații","dative-definite-genitive-singular":"epurației","dative-genitive-indefinite-plural":"epurații","dative-definite-genitive-plural":"epurațiilor","singular-vocative":"epurație","plural-vocative":"epurațiilor"}},{"word":"epurațiune","pos":"noun","definitions":["obsolete form of epurație"],"forms":{"plural":"epurațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"epurațiune","accusative-definite-nominative-singular":"epurațiunea","accusative-indefinite-nominative-plural":"epurațiuni","accusative-definite-nominative-plural":"epurațiunile","dative-genitive-indefinite-singular":"epurațiuni","dative-definite-genitive-singular":"epurațiunii","dative-genitive-indefinite-plural":"epurațiuni","dative-definite-genitive-plural":"epurațiunilor","singular-vocative":"epurațiune","plural-vocative":"epurațiunilor"}},{"word":"epurativ","pos":"adj","definitions":["purifying"],"forms":{"feminine-singular":"epurativă","masculine-plural":"epurativi","feminine-neuter-plural":"epurative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epurativ","error-unrecognized-form-feminine-indefinite-singular":"epurativă","error-unrecognized-form-indefinite-masculine-plural":"epurativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"epurative","definite-error-unrecognized-form-masculine-neuter-singular":"epurativul","definite-error-unrecognized-form-feminine-singular":"epurativa","definite-error-unrecognized-form-masculine-plural":"epurativii","definite-error-unrecognized-form-feminine-neuter-plural":"epurativele"}},{"word":"epurator","pos":"noun","definitions":["purifier"],"forms":{"plural":"epuratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"epurator","accusative-definite-nominative-singular":"epuratorul","accusative-indefinite-nominative-plural":"epuratoare","accusative-definite-nominative-plural":"epuratoarele","dative-genitive-indefinite-singular":"epurator","dative-definite-genitive-singular":"epuratorului","dative-genitive-indefinite-plural":"epuratoare","dative-definite-genitive-plural":"epuratoarelor","singular-vocative":"epuratorule","plural-vocative":"epuratoarelor"}},{"word":"Epure","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Epure"}},{"word":"Epureni","pos":"name","definitions":["a village in Duda-Epureni, Vaslui County, Romania","a commune of Vaslui County, Romania","a village in Epureni, Vaslui County, Romania"],"gender":"m"},{"word":"Epurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Epurescu"}},{"word":"epuvantabil","pos":"adj","definitions":["atrocious, awful, appalling"],"forms":{"feminine-singular":"epuvantabilă","masculine-plural":"epuvantabili","feminine-neuter-plural":"epuvantabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"epuvantabil","error-unrecognized-form-feminine-indefinite-singular":"epuvantabilă","error-unrecognized-form-indefinite-masculine-plural":"epuvantabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"epuvantabile","definite-error-unrecognized-form-masculine-neuter-singular":"epuvantabilul","definite-error-unrecognized-form-feminine-singular":"epuvantabila","definite-error-unrecognized-form-masculine-plural":"epuvantabilii","definite-error-unrecognized-form-feminine-neuter-plural":"epuvantabilele"}},{"word":"era","pos":"verb","definitions":["third-person singular imperfect indicative of fi: he/she was (being)"],"pronunciation":"[jeˈra]","examples":[{"ro":"el era pierdut","en":"he was lost"},{"ro":"el era sarcastic","en":"he was being sarcastic"}]},{"word":"era","pos":"noun","definitions":["definite nominative/accusative singular of eră"],"pronunciation":"[ˈera]","gender":"f"},{"word":"eră","pos":"noun","definitions":["age, era"],"forms":{"plural":"ere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eră","accusative-definite-nominative-singular":"era","accusative-indefinite-nominative-plural":"ere","accusative-definite-nominative-plural":"erele","dative-genitive-indefinite-singular":"ere","dative-definite-genitive-singular":"erei","dative-genitive-indefinite-plural":"ere","dative-definite-genitive-plural":"erelor","singular-vocative":"eră","plural-vocative":"erelor"}},{"word":"eră glaciară","pos":"noun","definitions":["ice age"],"forms":{"plural":"ere glaciare"}},{"word":"eradica","pos":"verb","definitions":["to uproot, to eradicate"],"forms":{"canonical":"a eradica 1st conjugation","present-singular-third-person":"eradichează","participle-past":"eradicat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eradica","gerund":"eradicând","first-person-indicative-present-singular":"eradichez","indicative-present-second-person-singular":"eradichezi","indicative-present-singular-third-person":"eradichează","first-person-indicative-plural-present":"eradicăm","indicative-plural-present-second-person":"eradicați","indicative-plural-present-third-person":"eradichează","first-person-imperfect-indicative-singular":"eradicam","imperfect-indicative-second-person-singular":"eradicai","imperfect-indicative-singular-third-person":"eradica","first-person-imperfect-indicative-plural":"eradicam","imperfect-indicative-plural-second-person":"eradicați","imperfect-indicative-plural-third-person":"eradicau","first-person-indicative-perfect-singular":"eradicai","indicative-perfect-second-person-singular":"eradicași","indicative-perfect-singular-third-person":"eradică","first-person-indicative-perfect-plural":"eradicarăm","indicative-perfect-plural-second-person":"eradicarăți","indicative-perfect-plural-third-person":"eradicară","first-person-indicative-pluperfect-singular":"eradicasem","indicative-pluperfect-second-person-singular":"eradicaseși","indicative-pluperfect-singular-third-person":"eradicase","first-person-indicative-pluperfect-plural":"eradicaserăm","indicative-pluperfect-plural-second-person":"eradicaserăți","indicative-pluperfect-plural-third-person":"eradicaseră","first-person-present-singular-subjunctive":"să eradichez","present-second-person-singular-subjunctive":"să eradichezi","present-singular-subjunctive-third-person":"să eradicheze","first-person-plural-present-subjunctive":"să eradicăm","plural-present-second-person-subjunctive":"să eradicați","plural-present-subjunctive-third-person":"să eradicheze","imperative-second-person-singular":"eradichează","imperative-plural-second-person":"eradicați","imperative-negative-second-person-singular":"nu eradica","imperative-negative-plural-second-person":"nu eradicați"}},{"word":"eradicabil","pos":"adj","definitions":["eradicable"],"forms":{"feminine-singular":"eradicabilă","masculine-plural":"eradicabili","feminine-neuter-plural":"eradicabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eradicabil","error-unrecognized-form-feminine-indefinite-singular":"eradicabilă","error-unrecognized-form-indefinite-masculine-plural":"eradicabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"eradicabile","definite-error-unrecognized-form-masculine-neuter-singular":"eradicabilul","definite-error-unrecognized-form-feminine-singular":"eradicabila","definite-error-unrecognized-form-masculine-plural":"eradicabilii","definite-error-unrecognized-form-feminine-neuter-plural":"eradicabilele"}},{"word":"eradicare","pos":"noun","definitions":["eradication"],"forms":{"plural":"eradicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eradicare","accusative-definite-nominative-singular":"eradicarea","accusative-indefinite-nominative-plural":"eradicări","accusative-definite-nominative-plural":"eradicările","dative-genitive-indefinite-singular":"eradicări","dative-definite-genitive-singular":"eradicării","dative-genitive-indefinite-plural":"eradicări","dative-definite-genitive-plural":"eradicărilor","singular-vocative":"eradicare","plural-vocative":"eradicărilor"}},{"word":"eradicat","pos":"adj","definitions":["eradicated"],"forms":{"feminine-singular":"eradicată","masculine-plural":"eradicați","feminine-neuter-plural":"eradicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eradicat","error-unrecognized-form-feminine-indefinite-singular":"eradicată","error-unrecognized-form-indefinite-masculine-plural":"eradicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eradicate","definite-error-unrecognized-form-masculine-neuter-singular":"eradicatul","definite-error-unrecognized-form-feminine-singular":"eradicata","definite-error-unrecognized-form-masculine-plural":"eradicații","definite-error-unrecognized-form-feminine-neuter-plural":"eradicatele"}},{"word":"eradicat","pos":"verb","definitions":["past participle of eradica"],"forms":{"participle-past":"of eradica"}},{"word":"eradicație","pos":"noun","definitions":["rooting out, eradication"],"forms":{"plural":"eradicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eradicație","accusative-definite-nominative-singular":"eradicația","accusative-indefinite-nominative-plural":"eradicații","accusative-definite-nominative-plural":"eradicațiile","dative-genitive-indefinite-singular":"eradicații","dative-definite-genitive-singular":"eradicației","dative-genitive-indefinite-plural":"eradicații","dative-definite-genitive-plural":"eradicațiilor","singular-vocative":"eradicație","plural-vocative":"eradicațiilor"}},{"word":"erai","pos":"verb","definitions":["second-person singular imperfect indicative of fi: you were"],"pronunciation":"/jeˈraj/"},{"word":"eram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fi (“be”): I was; we were"],"pronunciation":"/jeˈram/"},{"word":"erasmian","pos":"adj","definitions":["Erasmian"],"forms":{"feminine-singular":"erasmiană","masculine-plural":"erasmieni","feminine-neuter-plural":"erasmiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erasmian","error-unrecognized-form-feminine-indefinite-singular":"erasmiană","error-unrecognized-form-indefinite-masculine-plural":"erasmieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"erasmiene","definite-error-unrecognized-form-masculine-neuter-singular":"erasmianul","definite-error-unrecognized-form-feminine-singular":"erasmiana","definite-error-unrecognized-form-masculine-plural":"erasmienii","definite-error-unrecognized-form-feminine-neuter-plural":"erasmienele"}},{"word":"erasmic","pos":"adj","definitions":["Erasmian"],"forms":{"feminine-singular":"erasmică","masculine-plural":"erasmici","feminine-neuter-plural":"erasmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erasmic","error-unrecognized-form-feminine-indefinite-singular":"erasmică","error-unrecognized-form-indefinite-masculine-plural":"erasmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"erasmice","definite-error-unrecognized-form-masculine-neuter-singular":"erasmicul","definite-error-unrecognized-form-feminine-singular":"erasmica","definite-error-unrecognized-form-masculine-plural":"erasmicii","definite-error-unrecognized-form-feminine-neuter-plural":"erasmicele"}},{"word":"erată","pos":"noun","definitions":["errata"],"forms":{"plural":"erate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erată","accusative-definite-nominative-singular":"eratăul","accusative-indefinite-nominative-plural":"erate","accusative-definite-nominative-plural":"eratele","dative-genitive-indefinite-singular":"erată","dative-definite-genitive-singular":"eratăului","dative-genitive-indefinite-plural":"erate","dative-definite-genitive-plural":"eratelor","singular-vocative":"eratăule","plural-vocative":"eratelor"}},{"word":"erați","pos":"verb","definitions":["second-person plural imperfect indicative of fi: you were"],"pronunciation":"[(j)eˈrat͡sʲ]"},{"word":"eratic","pos":"adj","definitions":["erratic"],"forms":{"feminine-singular":"eratică","masculine-plural":"eratici","feminine-neuter-plural":"eratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eratic","error-unrecognized-form-feminine-indefinite-singular":"eratică","error-unrecognized-form-indefinite-masculine-plural":"eratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eratice","definite-error-unrecognized-form-masculine-neuter-singular":"eraticul","definite-error-unrecognized-form-feminine-singular":"eratica","definite-error-unrecognized-form-masculine-plural":"eraticii","definite-error-unrecognized-form-feminine-neuter-plural":"eraticele"}},{"word":"erau","pos":"verb","definitions":["third-person plural imperfect indicative of fi: they were"],"pronunciation":"[(j)eˈraw]"},{"word":"erbacee","pos":"adj","definitions":["nominative/accusative feminine singular of erbaceu"]},{"word":"erbacee","pos":"noun","definitions":["herbaceous plant"],"forms":{"plural":"erbacee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"erbacee","accusative-definite-nominative-singular":"erbaceea","accusative-indefinite-nominative-plural":"erbacee","accusative-definite-nominative-plural":"erbaceele","dative-genitive-indefinite-singular":"erbacee","dative-definite-genitive-singular":"erbaceei","dative-genitive-indefinite-plural":"erbacee","dative-definite-genitive-plural":"erbaceelor","singular-vocative":"erbacee","plural-vocative":"erbaceelor"}},{"word":"erbaceu","pos":"adj","definitions":["herbaceous"],"forms":{"feminine-singular":"erbacee","masculine-plural":"erbacei","feminine-neuter-plural":"erbacee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erbaceu","error-unrecognized-form-feminine-indefinite-singular":"erbacee","error-unrecognized-form-indefinite-masculine-plural":"erbacei","error-unrecognized-form-feminine-indefinite-neuter-plural":"erbacee","definite-error-unrecognized-form-masculine-neuter-singular":"erbaceul","definite-error-unrecognized-form-feminine-singular":"erbaceea","definite-error-unrecognized-form-masculine-plural":"erbaceii","definite-error-unrecognized-form-feminine-neuter-plural":"erbaceele"}},{"word":"erbaceu","pos":"noun","definitions":["herbaceous"],"forms":{"plural":"erbacei"}},{"word":"Erbărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Erbărescu"}},{"word":"Erbiceni","pos":"name","definitions":["a commune of Iași County, Romania","a village in Erbiceni, Iași County, Romania"],"gender":"m"},{"word":"erbicid","pos":"noun","definitions":["herbicide"],"forms":{"plural":"erbicide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erbicid","accusative-definite-nominative-singular":"erbicidul","accusative-indefinite-nominative-plural":"erbicide","accusative-definite-nominative-plural":"erbicidele","dative-genitive-indefinite-singular":"erbicid","dative-definite-genitive-singular":"erbicidului","dative-genitive-indefinite-plural":"erbicide","dative-definite-genitive-plural":"erbicidelor","singular-vocative":"erbicidule","plural-vocative":"erbicidelor"}},{"word":"erbicida","pos":"verb","definitions":["to apply herbicide"],"forms":{"canonical":"a erbicida 1st conjugation","present-singular-third-person":"erbicidează","participle-past":"erbicidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a erbicida","gerund":"erbicidând","first-person-indicative-present-singular":"erbicidez","indicative-present-second-person-singular":"erbicidezi","indicative-present-singular-third-person":"erbicidează","first-person-indicative-plural-present":"erbicidăm","indicative-plural-present-second-person":"erbicidați","indicative-plural-present-third-person":"erbicidează","first-person-imperfect-indicative-singular":"erbicidam","imperfect-indicative-second-person-singular":"erbicidai","imperfect-indicative-singular-third-person":"erbicida","first-person-imperfect-indicative-plural":"erbicidam","imperfect-indicative-plural-second-person":"erbicidați","imperfect-indicative-plural-third-person":"erbicidau","first-person-indicative-perfect-singular":"erbicidai","indicative-perfect-second-person-singular":"erbicidași","indicative-perfect-singular-third-person":"erbicidă","first-person-indicative-perfect-plural":"erbicidarăm","indicative-perfect-plural-second-person":"erbicidarăți","indicative-perfect-plural-third-person":"erbicidară","first-person-indicative-pluperfect-singular":"erbicidasem","indicative-pluperfect-second-person-singular":"erbicidaseși","indicative-pluperfect-singular-third-person":"erbicidase","first-person-indicative-pluperfect-plural":"erbicidaserăm","indicative-pluperfect-plural-second-person":"erbicidaserăți","indicative-pluperfect-plural-third-person":"erbicidaseră","first-person-present-singular-subjunctive":"să erbicidez","present-second-person-singular-subjunctive":"să erbicidezi","present-singular-subjunctive-third-person":"să erbicideze","first-person-plural-present-subjunctive":"să erbicidăm","plural-present-second-person-subjunctive":"să erbicidați","plural-present-subjunctive-third-person":"să erbicideze","imperative-second-person-singular":"erbicidează","imperative-plural-second-person":"erbicidați","imperative-negative-second-person-singular":"nu erbicida","imperative-negative-plural-second-person":"nu erbicidați"}},{"word":"erbicidare","pos":"noun","definitions":["the act of applying herbicide"],"forms":{"plural":"erbicidări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erbicidare","accusative-definite-nominative-singular":"erbicidarea","accusative-indefinite-nominative-plural":"erbicidări","accusative-definite-nominative-plural":"erbicidările","dative-genitive-indefinite-singular":"erbicidări","dative-definite-genitive-singular":"erbicidării","dative-genitive-indefinite-plural":"erbicidări","dative-definite-genitive-plural":"erbicidărilor","singular-vocative":"erbicidare","plural-vocative":"erbicidărilor"}},{"word":"erbicidat","pos":"adj","definitions":["sprayed with herbicides"],"forms":{"feminine-singular":"erbicidată","masculine-plural":"erbicidați","feminine-neuter-plural":"erbicidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erbicidat","error-unrecognized-form-feminine-indefinite-singular":"erbicidată","error-unrecognized-form-indefinite-masculine-plural":"erbicidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"erbicidate","definite-error-unrecognized-form-masculine-neuter-singular":"erbicidatul","definite-error-unrecognized-form-feminine-singular":"erbicidata","definite-error-unrecognized-form-masculine-plural":"erbicidații","definite-error-unrecognized-form-feminine-neuter-plural":"erbicidatele"}},{"word":"erbicide","pos":"noun","definitions":["plural of erbicid"]},{"word":"erbiu","pos":"noun","definitions":["erbium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"erbiu","accusative-definite-nominative":"erbiul","dative-genitive-indefinite":"erbiu","dative-definite-genitive":"erbiului","vocative":"erbiule"}},{"word":"erbivor","pos":"noun","definitions":["herbivore"],"forms":{"plural":"erbivori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erbivor","accusative-definite-nominative-singular":"erbivorul","accusative-indefinite-nominative-plural":"erbivori","accusative-definite-nominative-plural":"erbivorile","dative-genitive-indefinite-singular":"erbivor","dative-definite-genitive-singular":"erbivorului","dative-genitive-indefinite-plural":"erbivori","dative-definite-genitive-plural":"erbivorilor","singular-vocative":"erbivorule","plural-vocative":"erbivorilor"}},{"word":"erborist","pos":"noun","definitions":["herbalist"],"forms":{"plural":"erboriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erborist","accusative-definite-nominative-singular":"erboristul","accusative-indefinite-nominative-plural":"erboriști","accusative-definite-nominative-plural":"erboriștii","dative-genitive-indefinite-singular":"erborist","dative-definite-genitive-singular":"erboristului","dative-genitive-indefinite-plural":"erboriști","dative-definite-genitive-plural":"erboriștilor","singular-vocative":"erboristule","plural-vocative":"erboriștilor"}},{"word":"erboriza","pos":"verb","definitions":["to herborize"],"forms":{"canonical":"a erboriza 1st conjugation","present-singular-third-person":"erborizează","participle-past":"erborizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a erboriza","gerund":"erborizând","first-person-indicative-present-singular":"erborizez","indicative-present-second-person-singular":"erborizezi","indicative-present-singular-third-person":"erborizează","first-person-indicative-plural-present":"erborizăm","indicative-plural-present-second-person":"erborizați","indicative-plural-present-third-person":"erborizează","first-person-imperfect-indicative-singular":"erborizam","imperfect-indicative-second-person-singular":"erborizai","imperfect-indicative-singular-third-person":"erboriza","first-person-imperfect-indicative-plural":"erborizam","imperfect-indicative-plural-second-person":"erborizați","imperfect-indicative-plural-third-person":"erborizau","first-person-indicative-perfect-singular":"erborizai","indicative-perfect-second-person-singular":"erborizași","indicative-perfect-singular-third-person":"erboriză","first-person-indicative-perfect-plural":"erborizarăm","indicative-perfect-plural-second-person":"erborizarăți","indicative-perfect-plural-third-person":"erborizară","first-person-indicative-pluperfect-singular":"erborizasem","indicative-pluperfect-second-person-singular":"erborizaseși","indicative-pluperfect-singular-third-person":"erborizase","first-person-indicative-pluperfect-plural":"erborizaserăm","indicative-pluperfect-plural-second-person":"erborizaserăți","indicative-pluperfect-plural-third-person":"erborizaseră","first-person-present-singular-subjunctive":"să erborizez","present-second-person-singular-subjunctive":"să erborizezi","present-singular-subjunctive-third-person":"să erborizeze","first-person-plural-present-subjunctive":"să erborizăm","plural-present-second-person-subjunctive":"să erborizați","plural-present-subjunctive-third-person":"să erborizeze","imperative-second-person-singular":"erborizează","imperative-plural-second-person":"erborizați","imperative-negative-second-person-singular":"nu erboriza","imperative-negative-plural-second-person":"nu erborizați"}},{"word":"erborizație","pos":"noun","definitions":["herborization"],"forms":{"plural":"erborizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erborizație","accusative-definite-nominative-singular":"erborizația","accusative-indefinite-nominative-plural":"erborizații","accusative-definite-nominative-plural":"erborizațiile","dative-genitive-indefinite-singular":"erborizații","dative-definite-genitive-singular":"erborizației","dative-genitive-indefinite-plural":"erborizații","dative-definite-genitive-plural":"erborizațiilor","singular-vocative":"erborizație","plural-vocative":"erborizațiilor"}},{"word":"ercăziș","pos":"noun","definitions":["rest time"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ercăziș","accusative-definite-nominative":"ercăzișul","dative-genitive-indefinite":"ercăziș","dative-definite-genitive":"ercăzișului","vocative":"ercăzișule"}},{"word":"Ercheșec","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Stupina."],"gender":"m"},{"word":"erculean","pos":"adj","definitions":["alternative form of herculean"],"forms":{"feminine-singular":"erculeană","masculine-plural":"erculeni","feminine-neuter-plural":"erculene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erculean","error-unrecognized-form-feminine-indefinite-singular":"erculeană","error-unrecognized-form-indefinite-masculine-plural":"erculeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"erculene","definite-error-unrecognized-form-masculine-neuter-singular":"erculeanul","definite-error-unrecognized-form-feminine-singular":"erculeana","definite-error-unrecognized-form-masculine-plural":"erculenii","definite-error-unrecognized-form-feminine-neuter-plural":"erculenele"}},{"word":"Erculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Erculescu"}},{"word":"ere","pos":"noun","definitions":["inflection of eră:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈere]","gender":"f"},{"word":"Erebiler","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Orzari, merged with Comana in 1968."],"gender":"m"},{"word":"erect","pos":"adj","definitions":["erect"],"forms":{"feminine-singular":"erectă","masculine-plural":"erecți","feminine-neuter-plural":"erecte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erect","error-unrecognized-form-feminine-indefinite-singular":"erectă","error-unrecognized-form-indefinite-masculine-plural":"erecți","error-unrecognized-form-feminine-indefinite-neuter-plural":"erecte","definite-error-unrecognized-form-masculine-neuter-singular":"erectul","definite-error-unrecognized-form-feminine-singular":"erecta","definite-error-unrecognized-form-masculine-plural":"erecții","definite-error-unrecognized-form-feminine-neuter-plural":"erectele"}},{"word":"erecție","pos":"noun","definitions":["erection (stiffening of the penis)"],"pronunciation":"/eˈrekt͡sie/","examples":[{"ro":"În fiecare dimineață mă trezesc cu erecție.","en":"Every morning I wake up with an erection."}],"forms":{"plural":"erecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erecție","accusative-definite-nominative-singular":"erecția","accusative-indefinite-nominative-plural":"erecții","accusative-definite-nominative-plural":"erecțiile","dative-genitive-indefinite-singular":"erecții","dative-definite-genitive-singular":"erecției","dative-genitive-indefinite-plural":"erecții","dative-definite-genitive-plural":"erecțiilor","singular-vocative":"erecție","plural-vocative":"erecțiilor","alternative-obsolete":"erecțiune"}},{"word":"erecții","pos":"noun","definitions":["plural of erecție"],"gender":"f"},{"word":"erectil","pos":"adj","definitions":["erectile"],"pronunciation":"/erekˈtil/","forms":{"feminine-singular":"erectilă","masculine-plural":"erectili","feminine-neuter-plural":"erectile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erectil","error-unrecognized-form-feminine-indefinite-singular":"erectilă","error-unrecognized-form-indefinite-masculine-plural":"erectili","error-unrecognized-form-feminine-indefinite-neuter-plural":"erectile","definite-error-unrecognized-form-masculine-neuter-singular":"erectilul","definite-error-unrecognized-form-feminine-singular":"erectila","definite-error-unrecognized-form-masculine-plural":"erectilii","definite-error-unrecognized-form-feminine-neuter-plural":"erectilele"}},{"word":"erectilitate","pos":"noun","definitions":["erectility"],"forms":{"plural":"erectilitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erectilitate","accusative-definite-nominative-singular":"erectilitatea","accusative-indefinite-nominative-plural":"erectilitatăți","accusative-definite-nominative-plural":"erectilitatățile","dative-genitive-indefinite-singular":"erectilitatăți","dative-definite-genitive-singular":"erectilitatății","dative-genitive-indefinite-plural":"erectilitatăți","dative-definite-genitive-plural":"erectilitatăților","singular-vocative":"erectilitate","plural-vocative":"erectilitatăților"}},{"word":"erecțiune","pos":"noun","definitions":["obsolete form of erecție"],"forms":{"plural":"erecțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erecțiune","accusative-definite-nominative-singular":"erecțiunea","accusative-indefinite-nominative-plural":"erecțiuni","accusative-definite-nominative-plural":"erecțiunile","dative-genitive-indefinite-singular":"erecțiuni","dative-definite-genitive-singular":"erecțiunii","dative-genitive-indefinite-plural":"erecțiuni","dative-definite-genitive-plural":"erecțiunilor","singular-vocative":"erecțiune","plural-vocative":"erecțiunilor"}},{"word":"erector","pos":"noun","definitions":["erector"],"forms":{"plural":"erectori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erector","accusative-definite-nominative-singular":"erectorul","accusative-indefinite-nominative-plural":"erectori","accusative-definite-nominative-plural":"erectorile","dative-genitive-indefinite-singular":"erector","dative-definite-genitive-singular":"erectorului","dative-genitive-indefinite-plural":"erectori","dative-definite-genitive-plural":"erectorilor","singular-vocative":"erectorule","plural-vocative":"erectorilor"}},{"word":"ereda","pos":"verb","definitions":["to inherit"],"forms":{"canonical":"a ereda 1st conjugation","present-singular-third-person":"eredează","participle-past":"eredat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ereda","gerund":"eredând","first-person-indicative-present-singular":"eredez","indicative-present-second-person-singular":"eredezi","indicative-present-singular-third-person":"eredează","first-person-indicative-plural-present":"eredăm","indicative-plural-present-second-person":"eredați","indicative-plural-present-third-person":"eredează","first-person-imperfect-indicative-singular":"eredam","imperfect-indicative-second-person-singular":"eredai","imperfect-indicative-singular-third-person":"ereda","first-person-imperfect-indicative-plural":"eredam","imperfect-indicative-plural-second-person":"eredați","imperfect-indicative-plural-third-person":"eredau","first-person-indicative-perfect-singular":"eredai","indicative-perfect-second-person-singular":"eredași","indicative-perfect-singular-third-person":"eredă","first-person-indicative-perfect-plural":"eredarăm","indicative-perfect-plural-second-person":"eredarăți","indicative-perfect-plural-third-person":"eredară","first-person-indicative-pluperfect-singular":"eredasem","indicative-pluperfect-second-person-singular":"eredaseși","indicative-pluperfect-singular-third-person":"eredase","first-person-indicative-pluperfect-plural":"eredaserăm","indicative-pluperfect-plural-second-person":"eredaserăți","indicative-pluperfect-plural-third-person":"eredaseră","first-person-present-singular-subjunctive":"să eredez","present-second-person-singular-subjunctive":"să eredezi","present-singular-subjunctive-third-person":"să eredeze","first-person-plural-present-subjunctive":"să eredăm","plural-present-second-person-subjunctive":"să eredați","plural-present-subjunctive-third-person":"să eredeze","imperative-second-person-singular":"eredează","imperative-plural-second-person":"eredați","imperative-negative-second-person-singular":"nu ereda","imperative-negative-plural-second-person":"nu eredați"}},{"word":"erede","pos":"noun","definitions":["heir, inheritor"],"pronunciation":"/eˈre.de/","forms":{"plural":"erezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erede","accusative-definite-nominative-singular":"eredeul","accusative-indefinite-nominative-plural":"erezi","accusative-definite-nominative-plural":"erezii","dative-genitive-indefinite-singular":"erede","dative-definite-genitive-singular":"eredeului","dative-genitive-indefinite-plural":"erezi","dative-definite-genitive-plural":"erezilor","singular-vocative":"eredeule","plural-vocative":"erezilor"}},{"word":"ereditar","pos":"adj","definitions":["hereditary"],"forms":{"feminine-singular":"ereditară","masculine-plural":"ereditari","feminine-neuter-plural":"ereditare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ereditar","error-unrecognized-form-feminine-indefinite-singular":"ereditară","error-unrecognized-form-indefinite-masculine-plural":"ereditari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ereditare","definite-error-unrecognized-form-masculine-neuter-singular":"ereditarul","definite-error-unrecognized-form-feminine-singular":"ereditara","definite-error-unrecognized-form-masculine-plural":"ereditarii","definite-error-unrecognized-form-feminine-neuter-plural":"ereditarele"}},{"word":"ereditat","pos":"adj","definitions":["inherited"],"forms":{"feminine-singular":"ereditată","masculine-plural":"ereditați","feminine-neuter-plural":"ereditate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ereditat","error-unrecognized-form-feminine-indefinite-singular":"ereditată","error-unrecognized-form-indefinite-masculine-plural":"ereditați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ereditate","definite-error-unrecognized-form-masculine-neuter-singular":"ereditatul","definite-error-unrecognized-form-feminine-singular":"ereditata","definite-error-unrecognized-form-masculine-plural":"ereditații","definite-error-unrecognized-form-feminine-neuter-plural":"ereditatele"}},{"word":"ereditat","pos":"verb","definitions":["past participle of eredita"],"forms":{"participle-past":"of eredita"}},{"word":"ereditate","pos":"noun","definitions":["heredity"],"forms":{"plural":"eredități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ereditate","accusative-definite-nominative-singular":"ereditatea","accusative-indefinite-nominative-plural":"eredități","accusative-definite-nominative-plural":"ereditățile","dative-genitive-indefinite-singular":"eredități","dative-definite-genitive-singular":"eredității","dative-genitive-indefinite-plural":"eredități","dative-definite-genitive-plural":"eredităților","singular-vocative":"ereditate","plural-vocative":"eredităților"}},{"word":"ereditator","pos":"noun","definitions":["inheritor"],"forms":{"plural":"ereditatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ereditator","accusative-definite-nominative-singular":"ereditatorul","accusative-indefinite-nominative-plural":"ereditatori","accusative-definite-nominative-plural":"ereditatorii","dative-genitive-indefinite-singular":"ereditator","dative-definite-genitive-singular":"ereditatorului","dative-genitive-indefinite-plural":"ereditatori","dative-definite-genitive-plural":"ereditatorilor","singular-vocative":"ereditatorule","plural-vocative":"ereditatorilor"}},{"word":"eredobiologie","pos":"noun","definitions":["heredobiology, genetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eredobiologie","accusative-definite-nominative-singular":"eredobiologia","accusative-indefinite-nominative-plural":"eredobiologii","accusative-definite-nominative-plural":"eredobiologiile","dative-genitive-indefinite-singular":"eredobiologii","dative-definite-genitive-singular":"eredobiologiei","dative-genitive-indefinite-plural":"eredobiologii","dative-definite-genitive-plural":"eredobiologiilor","singular-vocative":"eredobiologie","plural-vocative":"eredobiologiilor"}},{"word":"eredopatie","pos":"noun","definitions":["heredopathy"],"forms":{"plural":"eredopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eredopatie","accusative-definite-nominative-singular":"eredopatia","accusative-indefinite-nominative-plural":"eredopatii","accusative-definite-nominative-plural":"eredopatiile","dative-genitive-indefinite-singular":"eredopatii","dative-definite-genitive-singular":"eredopatiei","dative-genitive-indefinite-plural":"eredopatii","dative-definite-genitive-plural":"eredopatiilor","singular-vocative":"eredopatie","plural-vocative":"eredopatiilor"}},{"word":"eredosifilis","pos":"noun","definitions":["heredosyphilis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eredosifilis","accusative-definite-nominative":"eredosifilisul","dative-genitive-indefinite":"eredosifilis","dative-definite-genitive":"eredosifilisului","vocative":"eredosifilisule"}},{"word":"eredosifilitic","pos":"adj","definitions":["heredosyphilitic"],"forms":{"feminine-singular":"eredosifilitică","masculine-plural":"eredosifilitici","feminine-neuter-plural":"eredosifilitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eredosifilitic","error-unrecognized-form-feminine-indefinite-singular":"eredosifilitică","error-unrecognized-form-indefinite-masculine-plural":"eredosifilitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eredosifilitice","definite-error-unrecognized-form-masculine-neuter-singular":"eredosifiliticul","definite-error-unrecognized-form-feminine-singular":"eredosifilitica","definite-error-unrecognized-form-masculine-plural":"eredosifiliticii","definite-error-unrecognized-form-feminine-neuter-plural":"eredosifiliticele"}},{"word":"erem","pos":"adj","definitions":["deserted, bare, desolate"],"forms":{"feminine-singular":"eremă","masculine-plural":"eremi","feminine-neuter-plural":"ereme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erem","error-unrecognized-form-feminine-indefinite-singular":"eremă","error-unrecognized-form-indefinite-masculine-plural":"eremi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ereme","definite-error-unrecognized-form-masculine-neuter-singular":"eremul","definite-error-unrecognized-form-feminine-singular":"erema","definite-error-unrecognized-form-masculine-plural":"eremii","definite-error-unrecognized-form-feminine-neuter-plural":"eremele"}},{"word":"erem","pos":"noun","definitions":["a deserted place"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"erem","accusative-definite-nominative":"eremul","dative-genitive-indefinite":"erem","dative-definite-genitive":"eremului","vocative":"eremule"}},{"word":"Eremencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Eremencu"}},{"word":"Eremia","pos":"name","definitions":["a surname"]},{"word":"Eremiaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Eremiaș"}},{"word":"Eremieni","pos":"name","definitions":["a village in Bereni, Mureș County, Romania"],"gender":"m"},{"word":"eremit","pos":"adj","definitions":["hermit"],"forms":{"feminine-singular":"eremită","masculine-plural":"eremiți","feminine-neuter-plural":"eremite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eremit","error-unrecognized-form-feminine-indefinite-singular":"eremită","error-unrecognized-form-indefinite-masculine-plural":"eremiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eremite","definite-error-unrecognized-form-masculine-neuter-singular":"eremitul","definite-error-unrecognized-form-feminine-singular":"eremita","definite-error-unrecognized-form-masculine-plural":"eremiții","definite-error-unrecognized-form-feminine-neuter-plural":"eremitele"}},{"word":"eremitagiu","pos":"noun","definitions":["obsolete form of ermitaj"],"forms":{"plural":"eremitagii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eremitagiu","accusative-definite-nominative-singular":"eremitagiuul","accusative-indefinite-nominative-plural":"eremitagii","accusative-definite-nominative-plural":"eremitagiile","dative-genitive-indefinite-singular":"eremitagiu","dative-definite-genitive-singular":"eremitagiuului","dative-genitive-indefinite-plural":"eremitagii","dative-definite-genitive-plural":"eremitagiilor","singular-vocative":"eremitagiuule","plural-vocative":"eremitagiilor"}},{"word":"eremitate","pos":"noun","definitions":["devastation"],"forms":{"plural":"eremitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eremitate","accusative-definite-nominative-singular":"eremitatea","accusative-indefinite-nominative-plural":"eremitatăți","accusative-definite-nominative-plural":"eremitatățile","dative-genitive-indefinite-singular":"eremitatăți","dative-definite-genitive-singular":"eremitatății","dative-genitive-indefinite-plural":"eremitatăți","dative-definite-genitive-plural":"eremitatăților","singular-vocative":"eremitate","plural-vocative":"eremitatăților"}},{"word":"eremitic","pos":"adj","definitions":["eremitic"],"forms":{"feminine-singular":"eremitică","masculine-plural":"eremitici","feminine-neuter-plural":"eremitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eremitic","error-unrecognized-form-feminine-indefinite-singular":"eremitică","error-unrecognized-form-indefinite-masculine-plural":"eremitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eremitice","definite-error-unrecognized-form-masculine-neuter-singular":"eremiticul","definite-error-unrecognized-form-feminine-singular":"eremitica","definite-error-unrecognized-form-masculine-plural":"eremiticii","definite-error-unrecognized-form-feminine-neuter-plural":"eremiticele"}},{"word":"Eremitu","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Eremitu, Mureș County, Romania"],"gender":"m"},{"word":"erepsină","pos":"noun","definitions":["erepsin"],"forms":{"plural":"erepsine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"erepsină","accusative-definite-nominative-singular":"erepsina","accusative-indefinite-nominative-plural":"erepsine","accusative-definite-nominative-plural":"erepsinele","dative-genitive-indefinite-singular":"erepsine","dative-definite-genitive-singular":"erepsinei","dative-genitive-indefinite-plural":"erepsine","dative-definite-genitive-plural":"erepsinelor","singular-vocative":"erepsină","plural-vocative":"erepsinelor"}},{"word":"eres","pos":"noun","definitions":["heresy","belief in supernatural forces, superstition"],"forms":{"plural":"eresuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eres","accusative-definite-nominative-singular":"eresul","accusative-indefinite-nominative-plural":"eresuri","accusative-definite-nominative-plural":"eresurile","dative-genitive-indefinite-singular":"eres","dative-definite-genitive-singular":"eresului","dative-genitive-indefinite-plural":"eresuri","dative-definite-genitive-plural":"eresurilor","singular-vocative":"eresule","plural-vocative":"eresurilor"}},{"word":"eresipelă","pos":"noun","definitions":["erysipelas"],"forms":{"plural":"eresipele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eresipelă","accusative-definite-nominative-singular":"eresipela","accusative-indefinite-nominative-plural":"eresipele","accusative-definite-nominative-plural":"eresipelele","dative-genitive-indefinite-singular":"eresipele","dative-definite-genitive-singular":"eresipelei","dative-genitive-indefinite-plural":"eresipele","dative-definite-genitive-plural":"eresipelelor","singular-vocative":"eresipelă","plural-vocative":"eresipelelor"}},{"word":"eresul","pos":"noun","definitions":["definite nominative/accusative singular of eres"]},{"word":"eresului","pos":"noun","definitions":["definite genitive/dative singular of eres"]},{"word":"eresuri","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of eres"]},{"word":"eresurile","pos":"noun","definitions":["definite nominative/accusative plural of eres"]},{"word":"eresurilor","pos":"noun","definitions":["definite genitive/dative plural of eres"]},{"word":"erete","pos":"noun","definitions":["kite (bird)"],"forms":{"plural":"ereți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erete","accusative-definite-nominative-singular":"ereteul","accusative-indefinite-nominative-plural":"ereți","accusative-definite-nominative-plural":"ereții","dative-genitive-indefinite-singular":"erete","dative-definite-genitive-singular":"ereteului","dative-genitive-indefinite-plural":"ereți","dative-definite-genitive-plural":"ereților","singular-vocative":"ereteule","plural-vocative":"ereților"}},{"word":"erete alb","pos":"noun","definitions":["pallid harrier (Circus macrourus)"],"forms":{"plural":"ereți albi"}},{"word":"erete de stuf","pos":"noun","definitions":["western marsh harrier (Circus aeruginosus)"],"forms":{"plural":"ereți de stuf"}},{"word":"erete sur","pos":"noun","definitions":["Montagu's harrier (Circus pygargus)"],"forms":{"plural":"ereți suri"}},{"word":"erete vânăt","pos":"noun","definitions":["hen harrier (Circus cyaneus)"],"forms":{"plural":"ereți vineți"}},{"word":"eretic","pos":"adj","definitions":["heretical"],"forms":{"feminine-singular":"eretică","masculine-plural":"eretici","feminine-neuter-plural":"eretice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eretic","error-unrecognized-form-feminine-indefinite-singular":"eretică","error-unrecognized-form-indefinite-masculine-plural":"eretici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eretice","definite-error-unrecognized-form-masculine-neuter-singular":"ereticul","definite-error-unrecognized-form-feminine-singular":"eretica","definite-error-unrecognized-form-masculine-plural":"ereticii","definite-error-unrecognized-form-feminine-neuter-plural":"ereticele"}},{"word":"eretic","pos":"noun","definitions":["heretic"],"forms":{"plural":"eretici","feminine":"equivalent eretică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eretic","accusative-definite-nominative-singular":"ereticul","accusative-indefinite-nominative-plural":"eretici","accusative-definite-nominative-plural":"ereticii","dative-genitive-indefinite-singular":"eretic","dative-definite-genitive-singular":"ereticului","dative-genitive-indefinite-plural":"eretici","dative-definite-genitive-plural":"ereticilor","singular-vocative":"ereticule","plural-vocative":"ereticilor"}},{"word":"eretică","pos":"noun","definitions":["female equivalent of eretic"],"forms":{"plural":"eretici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"eretică","accusative-definite-nominative-singular":"eretica","accusative-indefinite-nominative-plural":"eretici","accusative-definite-nominative-plural":"ereticile","dative-genitive-indefinite-singular":"eretici","dative-definite-genitive-singular":"ereticii","dative-genitive-indefinite-plural":"eretici","dative-definite-genitive-plural":"ereticilor","singular-vocative":"eretică","plural-vocative":"ereticilor"}},{"word":"eretical","pos":"adj","definitions":["heretical"],"forms":{"feminine-singular":"ereticală","masculine-plural":"ereticali","feminine-neuter-plural":"ereticale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eretical","error-unrecognized-form-feminine-indefinite-singular":"ereticală","error-unrecognized-form-indefinite-masculine-plural":"ereticali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ereticale","definite-error-unrecognized-form-masculine-neuter-singular":"ereticalul","definite-error-unrecognized-form-feminine-singular":"ereticala","definite-error-unrecognized-form-masculine-plural":"ereticalii","definite-error-unrecognized-form-feminine-neuter-plural":"ereticalele"}},{"word":"ereticesc","pos":"adj","definitions":["heretical"],"forms":{"feminine-singular":"ereticească","plural":"ereticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ereticesc","error-unrecognized-form-feminine-indefinite-singular":"ereticească","error-unrecognized-form-indefinite-masculine-plural":"ereticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ereticești","definite-error-unrecognized-form-masculine-neuter-singular":"ereticescul","definite-error-unrecognized-form-feminine-singular":"ereticeasca","definite-error-unrecognized-form-masculine-plural":"ereticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"ereticeștile"}},{"word":"ereticește","pos":"adv","definitions":["heretically"]},{"word":"ereticie","pos":"noun","definitions":["heresy"],"forms":{"plural":"ereticii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ereticie","accusative-definite-nominative-singular":"ereticia","accusative-indefinite-nominative-plural":"ereticii","accusative-definite-nominative-plural":"ereticiile","dative-genitive-indefinite-singular":"ereticii","dative-definite-genitive-singular":"ereticiei","dative-genitive-indefinite-plural":"ereticii","dative-definite-genitive-plural":"ereticiilor","singular-vocative":"ereticie","plural-vocative":"ereticiilor"}},{"word":"ereticitate","pos":"noun","definitions":["the condition of being heretical"],"forms":{"plural":"ereticitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ereticitate","accusative-definite-nominative-singular":"ereticitatea","accusative-indefinite-nominative-plural":"ereticitatăți","accusative-definite-nominative-plural":"ereticitatățile","dative-genitive-indefinite-singular":"ereticitatăți","dative-definite-genitive-singular":"ereticitatății","dative-genitive-indefinite-plural":"ereticitatăți","dative-definite-genitive-plural":"ereticitatăților","singular-vocative":"ereticitate","plural-vocative":"ereticitatăților"}},{"word":"ereticitură","pos":"noun","definitions":["heresy"],"forms":{"plural":"ereticituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ereticitură","accusative-definite-nominative-singular":"ereticitura","accusative-indefinite-nominative-plural":"ereticituri","accusative-definite-nominative-plural":"ereticiturile","dative-genitive-indefinite-singular":"ereticituri","dative-definite-genitive-singular":"ereticiturii","dative-genitive-indefinite-plural":"ereticituri","dative-definite-genitive-plural":"ereticiturilor","singular-vocative":"ereticitură","plural-vocative":"ereticiturilor"}},{"word":"ereticituri","pos":"noun","definitions":["plural of ereticitură"]},{"word":"eretism","pos":"noun","definitions":["erethism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eretism","accusative-definite-nominative-singular":"eretismul","accusative-indefinite-nominative-plural":"eretisme","accusative-definite-nominative-plural":"eretismele","dative-genitive-indefinite-singular":"eretism","dative-definite-genitive-singular":"eretismului","dative-genitive-indefinite-plural":"eretisme","dative-definite-genitive-plural":"eretismelor","singular-vocative":"eretismule","plural-vocative":"eretismelor"}},{"word":"eretocrisie","pos":"noun","definitions":["arbitration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eretocrisie","accusative-definite-nominative":"eretocrisia","dative-genitive-indefinite":"eretocrisii","dative-definite-genitive":"eretocrisiei","vocative":"eretocrisie"}},{"word":"ereutofobie","pos":"noun","definitions":["erythrophobia"],"forms":{"plural":"ereutofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ereutofobie","accusative-definite-nominative-singular":"ereutofobia","accusative-indefinite-nominative-plural":"ereutofobii","accusative-definite-nominative-plural":"ereutofobiile","dative-genitive-indefinite-singular":"ereutofobii","dative-definite-genitive-singular":"ereutofobiei","dative-genitive-indefinite-plural":"ereutofobii","dative-definite-genitive-plural":"ereutofobiilor","singular-vocative":"ereutofobie","plural-vocative":"ereutofobiilor"}},{"word":"Erevan","pos":"name","definitions":["Yerevan (the capital of Armenia)"]},{"word":"erezia","pos":"noun","definitions":["definite nominative/accusative singular of erezie"]},{"word":"erezie","pos":"noun","definitions":["heresy"],"forms":{"plural":"erezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erezie","accusative-definite-nominative-singular":"erezia","accusative-indefinite-nominative-plural":"erezii","accusative-definite-nominative-plural":"ereziile","dative-genitive-indefinite-singular":"erezii","dative-definite-genitive-singular":"ereziei","dative-genitive-indefinite-plural":"erezii","dative-definite-genitive-plural":"ereziilor","singular-vocative":"erezie","plural-vocative":"ereziilor"}},{"word":"ereziei","pos":"noun","definitions":["definite genitive/dative singular of erezie"]},{"word":"erezii","pos":"noun","definitions":["inflection of erezie:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"ereziile","pos":"noun","definitions":["definite nominative/accusative plural of erezie"]},{"word":"ereziilor","pos":"noun","definitions":["definite genitive/dative plural of erezie"]},{"word":"erezitar","pos":"noun","definitions":["inheritor"],"forms":{"plural":"erezitari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erezitar","accusative-definite-nominative-singular":"erezitarul","accusative-indefinite-nominative-plural":"erezitari","accusative-definite-nominative-plural":"erezitarii","dative-genitive-indefinite-singular":"erezitar","dative-definite-genitive-singular":"erezitarului","dative-genitive-indefinite-plural":"erezitari","dative-definite-genitive-plural":"erezitarilor","singular-vocative":"erezitarule","plural-vocative":"erezitarilor"}},{"word":"erg","pos":"noun","definitions":["erg"],"forms":{"plural":"ergi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erg","accusative-definite-nominative-singular":"ergul","accusative-indefinite-nominative-plural":"ergi","accusative-definite-nominative-plural":"ergii","dative-genitive-indefinite-singular":"erg","dative-definite-genitive-singular":"ergului","dative-genitive-indefinite-plural":"ergi","dative-definite-genitive-plural":"ergilor","singular-vocative":"ergule","plural-vocative":"ergilor"}},{"word":"ergastoplasmă","pos":"noun","definitions":["ergastoplasm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergastoplasmă","accusative-definite-nominative-singular":"ergastoplasma","accusative-indefinite-nominative-plural":"ergastoplasme","accusative-definite-nominative-plural":"ergastoplasmele","dative-genitive-indefinite-singular":"ergastoplasme","dative-definite-genitive-singular":"ergastoplasmei","dative-genitive-indefinite-plural":"ergastoplasme","dative-definite-genitive-plural":"ergastoplasmelor","singular-vocative":"ergastoplasmă","plural-vocative":"ergastoplasmelor"}},{"word":"ergativ","pos":"noun","definitions":["ergative case"],"forms":{"plural":"ergative","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ergativ","accusative-definite-nominative-singular":"ergativul","accusative-indefinite-nominative-plural":"ergative","accusative-definite-nominative-plural":"ergativele","dative-genitive-indefinite-singular":"ergativ","dative-definite-genitive-singular":"ergativului","dative-genitive-indefinite-plural":"ergative","dative-definite-genitive-plural":"ergativelor","singular-vocative":"ergativule","plural-vocative":"ergativelor"}},{"word":"Erghevița","pos":"name","definitions":["a village in Șimian, Mehedinți County, Romania"],"gender":"f"},{"word":"ergocalciferol","pos":"noun","definitions":["ergocalciferol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ergocalciferol","accusative-definite-nominative":"ergocalciferolul","dative-genitive-indefinite":"ergocalciferol","dative-definite-genitive":"ergocalciferolului","vocative":"ergocalciferolule"}},{"word":"ergociclu","pos":"noun","definitions":["ergocycle"],"forms":{"plural":"ergocicluuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ergociclu","accusative-definite-nominative-singular":"ergocicluul","accusative-indefinite-nominative-plural":"ergocicluuri","accusative-definite-nominative-plural":"ergocicluurile","dative-genitive-indefinite-singular":"ergociclu","dative-definite-genitive-singular":"ergocicluului","dative-genitive-indefinite-plural":"ergocicluuri","dative-definite-genitive-plural":"ergocicluurilor","singular-vocative":"ergocicluule","plural-vocative":"ergocicluurilor"}},{"word":"ergograf","pos":"noun","definitions":["ergograph"],"forms":{"plural":"ergografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ergograf","accusative-definite-nominative-singular":"ergograful","accusative-indefinite-nominative-plural":"ergografe","accusative-definite-nominative-plural":"ergografele","dative-genitive-indefinite-singular":"ergograf","dative-definite-genitive-singular":"ergografului","dative-genitive-indefinite-plural":"ergografe","dative-definite-genitive-plural":"ergografelor","singular-vocative":"ergografule","plural-vocative":"ergografelor"}},{"word":"ergol","pos":"noun","definitions":["propellant (for rockets etc)"],"forms":{"plural":"ergoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ergol","accusative-definite-nominative-singular":"ergolul","accusative-indefinite-nominative-plural":"ergoli","accusative-definite-nominative-plural":"ergolii","dative-genitive-indefinite-singular":"ergol","dative-definite-genitive-singular":"ergolului","dative-genitive-indefinite-plural":"ergoli","dative-definite-genitive-plural":"ergolilor","singular-vocative":"ergolule","plural-vocative":"ergolilor"}},{"word":"ergometre","pos":"noun","definitions":["plural of ergometru"],"gender":"n"},{"word":"ergometric","pos":"adj","definitions":["ergometric"],"forms":{"feminine-singular":"ergometrică","masculine-plural":"ergometrici","feminine-neuter-plural":"ergometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ergometric","error-unrecognized-form-feminine-indefinite-singular":"ergometrică","error-unrecognized-form-indefinite-masculine-plural":"ergometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ergometrice","definite-error-unrecognized-form-masculine-neuter-singular":"ergometricul","definite-error-unrecognized-form-feminine-singular":"ergometrica","definite-error-unrecognized-form-masculine-plural":"ergometricii","definite-error-unrecognized-form-feminine-neuter-plural":"ergometricele"}},{"word":"ergometrie","pos":"noun","definitions":["ergometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ergometrie","accusative-definite-nominative":"ergometria","dative-genitive-indefinite":"ergometrii","dative-definite-genitive":"ergometriei","vocative":"ergometrie"}},{"word":"ergometrină","pos":"noun","definitions":["ergometrine"],"forms":{"plural":"ergometrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergometrină","accusative-definite-nominative-singular":"ergometrina","accusative-indefinite-nominative-plural":"ergometrine","accusative-definite-nominative-plural":"ergometrinele","dative-genitive-indefinite-singular":"ergometrine","dative-definite-genitive-singular":"ergometrinei","dative-genitive-indefinite-plural":"ergometrine","dative-definite-genitive-plural":"ergometrinelor","singular-vocative":"ergometrină","plural-vocative":"ergometrinelor"}},{"word":"ergometru","pos":"noun","definitions":["ergometer"],"forms":{"plural":"ergometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ergometru","accusative-definite-nominative-singular":"ergometrul","accusative-indefinite-nominative-plural":"ergometre","accusative-definite-nominative-plural":"ergometrele","dative-genitive-indefinite-singular":"ergometru","dative-definite-genitive-singular":"ergometrului","dative-genitive-indefinite-plural":"ergometre","dative-definite-genitive-plural":"ergometrelor","singular-vocative":"ergometrule","plural-vocative":"ergometrelor"}},{"word":"ergonomic","pos":"adj","definitions":["ergonomic"],"forms":{"feminine-singular":"ergonomică","masculine-plural":"ergonomici","feminine-neuter-plural":"ergonomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ergonomic","error-unrecognized-form-feminine-indefinite-singular":"ergonomică","error-unrecognized-form-indefinite-masculine-plural":"ergonomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ergonomice","definite-error-unrecognized-form-masculine-neuter-singular":"ergonomicul","definite-error-unrecognized-form-feminine-singular":"ergonomica","definite-error-unrecognized-form-masculine-plural":"ergonomicii","definite-error-unrecognized-form-feminine-neuter-plural":"ergonomicele"}},{"word":"ergonomie","pos":"noun","definitions":["ergonomics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ergonomie","accusative-definite-nominative":"ergonomia","dative-genitive-indefinite":"ergonomii","dative-definite-genitive":"ergonomiei","vocative":"ergonomie"}},{"word":"ergonomist","pos":"noun","definitions":["ergonomist"],"forms":{"plural":"ergonomiști","feminine":"equivalent ergonomistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ergonomist","accusative-definite-nominative-singular":"ergonomistul","accusative-indefinite-nominative-plural":"ergonomiști","accusative-definite-nominative-plural":"ergonomiștii","dative-genitive-indefinite-singular":"ergonomist","dative-definite-genitive-singular":"ergonomistului","dative-genitive-indefinite-plural":"ergonomiști","dative-definite-genitive-plural":"ergonomiștilor","singular-vocative":"ergonomistule","plural-vocative":"ergonomiștilor"}},{"word":"ergonomistă","pos":"noun","definitions":["female equivalent of ergonomist"],"forms":{"plural":"ergonomiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergonomistă","accusative-definite-nominative-singular":"ergonomista","accusative-indefinite-nominative-plural":"ergonomiste","accusative-definite-nominative-plural":"ergonomistele","dative-genitive-indefinite-singular":"ergonomiste","dative-definite-genitive-singular":"ergonomistei","dative-genitive-indefinite-plural":"ergonomiste","dative-definite-genitive-plural":"ergonomistelor","singular-vocative":"ergonomistă","plural-vocative":"ergonomistelor"}},{"word":"ergospirometru","pos":"noun","definitions":["ergospirometer"],"forms":{"plural":"ergospirometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ergospirometru","accusative-definite-nominative-singular":"ergospirometruul","accusative-indefinite-nominative-plural":"ergospirometre","accusative-definite-nominative-plural":"ergospirometrele","dative-genitive-indefinite-singular":"ergospirometru","dative-definite-genitive-singular":"ergospirometruului","dative-genitive-indefinite-plural":"ergospirometre","dative-definite-genitive-plural":"ergospirometrelor","singular-vocative":"ergospirometruule","plural-vocative":"ergospirometrelor"}},{"word":"ergosterină","pos":"noun","definitions":["ergosterine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergosterină","accusative-definite-nominative-singular":"ergosterina","accusative-indefinite-nominative-plural":"ergosterine","accusative-definite-nominative-plural":"ergosterinele","dative-genitive-indefinite-singular":"ergosterine","dative-definite-genitive-singular":"ergosterinei","dative-genitive-indefinite-plural":"ergosterine","dative-definite-genitive-plural":"ergosterinelor","singular-vocative":"ergosterină","plural-vocative":"ergosterinelor"}},{"word":"ergosterol","pos":"noun","definitions":["ergosterol"],"forms":{"plural":"ergosteroli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ergosterol","accusative-definite-nominative-singular":"ergosterolul","accusative-indefinite-nominative-plural":"ergosteroli","accusative-definite-nominative-plural":"ergosterolii","dative-genitive-indefinite-singular":"ergosterol","dative-definite-genitive-singular":"ergosterolului","dative-genitive-indefinite-plural":"ergosteroli","dative-definite-genitive-plural":"ergosterolilor","singular-vocative":"ergosterolule","plural-vocative":"ergosterolilor"}},{"word":"ergot","pos":"noun","definitions":["ergot"],"forms":{"plural":"ergoturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ergot","accusative-definite-nominative-singular":"ergotul","accusative-indefinite-nominative-plural":"ergoturi","accusative-definite-nominative-plural":"ergoturile","dative-genitive-indefinite-singular":"ergot","dative-definite-genitive-singular":"ergotului","dative-genitive-indefinite-plural":"ergoturi","dative-definite-genitive-plural":"ergoturilor","singular-vocative":"ergotule","plural-vocative":"ergoturilor"}},{"word":"ergotamină","pos":"noun","definitions":["ergotamine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ergotamină","accusative-definite-nominative":"ergotamina","dative-genitive-indefinite":"ergotamine","dative-definite-genitive":"ergotaminei","vocative":"ergotamină"}},{"word":"ergoterapeut","pos":"noun","definitions":["occupational therapist"],"forms":{"plural":"ergoterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ergoterapeut","accusative-definite-nominative-singular":"ergoterapeutul","accusative-indefinite-nominative-plural":"ergoterapeuți","accusative-definite-nominative-plural":"ergoterapeuții","dative-genitive-indefinite-singular":"ergoterapeut","dative-definite-genitive-singular":"ergoterapeutului","dative-genitive-indefinite-plural":"ergoterapeuți","dative-definite-genitive-plural":"ergoterapeuților","singular-vocative":"ergoterapeutule","plural-vocative":"ergoterapeuților"}},{"word":"ergoterapie","pos":"noun","definitions":["occupational therapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ergoterapie","accusative-definite-nominative":"ergoterapia","dative-genitive-indefinite":"ergoterapii","dative-definite-genitive":"ergoterapiei","vocative":"ergoterapie"}},{"word":"ergotină","pos":"noun","definitions":["ergotine"],"forms":{"plural":"ergotine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergotină","accusative-definite-nominative-singular":"ergotina","accusative-indefinite-nominative-plural":"ergotine","accusative-definite-nominative-plural":"ergotinele","dative-genitive-indefinite-singular":"ergotine","dative-definite-genitive-singular":"ergotinei","dative-genitive-indefinite-plural":"ergotine","dative-definite-genitive-plural":"ergotinelor","singular-vocative":"ergotină","plural-vocative":"ergotinelor"}},{"word":"ergotism","pos":"noun","definitions":["ergotism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ergotism","accusative-definite-nominative":"ergotismul","dative-genitive-indefinite":"ergotism","dative-definite-genitive":"ergotismului","vocative":"ergotismule"}},{"word":"ergotoxină","pos":"noun","definitions":["ergotoxine"],"forms":{"plural":"ergotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ergotoxină","accusative-definite-nominative-singular":"ergotoxina","accusative-indefinite-nominative-plural":"ergotoxine","accusative-definite-nominative-plural":"ergotoxinele","dative-genitive-indefinite-singular":"ergotoxine","dative-definite-genitive-singular":"ergotoxinei","dative-genitive-indefinite-plural":"ergotoxine","dative-definite-genitive-plural":"ergotoxinelor","singular-vocative":"ergotoxină","plural-vocative":"ergotoxinelor"}},{"word":"erhă","pos":"noun","definitions":["calfskin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"erhă","accusative-definite-nominative":"erha","dative-genitive-indefinite":"erhe","dative-definite-genitive":"erhei","vocative":"erhă"}},{"word":"Erimescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Erimescu"}},{"word":"erisipelas","pos":"noun","definitions":["erysipelas"],"forms":{"plural":"erisipelase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erisipelas","accusative-definite-nominative-singular":"erisipelasul","accusative-indefinite-nominative-plural":"erisipelase","accusative-definite-nominative-plural":"erisipelasele","dative-genitive-indefinite-singular":"erisipelas","dative-definite-genitive-singular":"erisipelasului","dative-genitive-indefinite-plural":"erisipelase","dative-definite-genitive-plural":"erisipelaselor","singular-vocative":"erisipelasule","plural-vocative":"erisipelaselor"}},{"word":"eristic","pos":"adj","definitions":["eristic"],"forms":{"feminine-singular":"eristică","masculine-plural":"eristici","feminine-neuter-plural":"eristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eristic","error-unrecognized-form-feminine-indefinite-singular":"eristică","error-unrecognized-form-indefinite-masculine-plural":"eristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eristice","definite-error-unrecognized-form-masculine-neuter-singular":"eristicul","definite-error-unrecognized-form-feminine-singular":"eristica","definite-error-unrecognized-form-masculine-plural":"eristicii","definite-error-unrecognized-form-feminine-neuter-plural":"eristicele"}},{"word":"eritaj","pos":"noun","definitions":["right to inheritance"],"forms":{"plural":"eritaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eritaj","accusative-definite-nominative-singular":"eritajul","accusative-indefinite-nominative-plural":"eritaje","accusative-definite-nominative-plural":"eritajele","dative-genitive-indefinite-singular":"eritaj","dative-definite-genitive-singular":"eritajului","dative-genitive-indefinite-plural":"eritaje","dative-definite-genitive-plural":"eritajelor","singular-vocative":"eritajule","plural-vocative":"eritajelor"}},{"word":"eritem","pos":"noun","definitions":["erythema"],"forms":{"plural":"eriteme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eritem","accusative-definite-nominative-singular":"eritemul","accusative-indefinite-nominative-plural":"eriteme","accusative-definite-nominative-plural":"eritemele","dative-genitive-indefinite-singular":"eritem","dative-definite-genitive-singular":"eritemului","dative-genitive-indefinite-plural":"eriteme","dative-definite-genitive-plural":"eritemelor","singular-vocative":"eritemule","plural-vocative":"eritemelor"}},{"word":"eritem nodos","pos":"noun","definitions":["erythema nodosum"]},{"word":"eritematoasă","pos":"noun","definitions":["female equivalent of eritematos"],"forms":{"plural":"eritematoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritematoasă","accusative-definite-nominative-singular":"eritematoasa","accusative-indefinite-nominative-plural":"eritematoase","accusative-definite-nominative-plural":"eritematoasele","dative-genitive-indefinite-singular":"eritematoase","dative-definite-genitive-singular":"eritematoasei","dative-genitive-indefinite-plural":"eritematoase","dative-definite-genitive-plural":"eritematoaselor","singular-vocative":"eritematoasă","plural-vocative":"eritematoaselor"}},{"word":"eritematos","pos":"adj","definitions":["erythematous"],"forms":{"feminine-singular":"eritematoasă","masculine-plural":"eritematoși","feminine-neuter-plural":"eritematoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eritematos","error-unrecognized-form-feminine-indefinite-singular":"eritematoasă","error-unrecognized-form-indefinite-masculine-plural":"eritematoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"eritematoase","definite-error-unrecognized-form-masculine-neuter-singular":"eritematosul","definite-error-unrecognized-form-feminine-singular":"eritematoasa","definite-error-unrecognized-form-masculine-plural":"eritematoșii","definite-error-unrecognized-form-feminine-neuter-plural":"eritematoasele"}},{"word":"eriticos","pos":"adj","definitions":["heretical"],"forms":{"feminine-singular":"eriticoasă","masculine-plural":"eriticoși","feminine-neuter-plural":"eriticoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eriticos","error-unrecognized-form-feminine-indefinite-singular":"eriticoasă","error-unrecognized-form-indefinite-masculine-plural":"eriticoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"eriticoase","definite-error-unrecognized-form-masculine-neuter-singular":"eriticosul","definite-error-unrecognized-form-feminine-singular":"eriticoasa","definite-error-unrecognized-form-masculine-plural":"eriticoșii","definite-error-unrecognized-form-feminine-neuter-plural":"eriticoasele"}},{"word":"eritreeană","pos":"noun","definitions":["female equivalent of eritreean"],"forms":{"plural":"eritreeane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritreeană","accusative-definite-nominative-singular":"eritreeana","accusative-indefinite-nominative-plural":"eritreeane","accusative-definite-nominative-plural":"eritreeanele","dative-genitive-indefinite-singular":"eritreeane","dative-definite-genitive-singular":"eritreeanei","dative-genitive-indefinite-plural":"eritreeane","dative-definite-genitive-plural":"eritreeanelor","singular-vocative":"eritreeană","plural-vocative":"eritreeanelor"}},{"word":"eritremie","pos":"noun","definitions":["erythremia"],"forms":{"plural":"eritremii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritremie","accusative-definite-nominative-singular":"eritremia","accusative-indefinite-nominative-plural":"eritremii","accusative-definite-nominative-plural":"eritremiile","dative-genitive-indefinite-singular":"eritremii","dative-definite-genitive-singular":"eritremiei","dative-genitive-indefinite-plural":"eritremii","dative-definite-genitive-plural":"eritremiilor","singular-vocative":"eritremie","plural-vocative":"eritremiilor"}},{"word":"eritrină","pos":"noun","definitions":["erythrin"],"forms":{"plural":"eritrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritrină","accusative-definite-nominative-singular":"eritrina","accusative-indefinite-nominative-plural":"eritrine","accusative-definite-nominative-plural":"eritrinele","dative-genitive-indefinite-singular":"eritrine","dative-definite-genitive-singular":"eritrinei","dative-genitive-indefinite-plural":"eritrine","dative-definite-genitive-plural":"eritrinelor","singular-vocative":"eritrină","plural-vocative":"eritrinelor"}},{"word":"eritrită","pos":"noun","definitions":["erythrite"],"forms":{"plural":"eritrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritrită","accusative-definite-nominative-singular":"eritrita","accusative-indefinite-nominative-plural":"eritrite","accusative-definite-nominative-plural":"eritritele","dative-genitive-indefinite-singular":"eritrite","dative-definite-genitive-singular":"eritritei","dative-genitive-indefinite-plural":"eritrite","dative-definite-genitive-plural":"eritritelor","singular-vocative":"eritrită","plural-vocative":"eritritelor"}},{"word":"eritroblast","pos":"noun","definitions":["erythroblast"],"forms":{"plural":"eritroblaști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eritroblast","accusative-definite-nominative-singular":"eritroblastul","accusative-indefinite-nominative-plural":"eritroblaști","accusative-definite-nominative-plural":"eritroblaștii","dative-genitive-indefinite-singular":"eritroblast","dative-definite-genitive-singular":"eritroblastului","dative-genitive-indefinite-plural":"eritroblaști","dative-definite-genitive-plural":"eritroblaștilor","singular-vocative":"eritroblastule","plural-vocative":"eritroblaștilor"}},{"word":"eritroblastemie","pos":"noun","definitions":["erythroblastemia"],"forms":{"plural":"eritroblastemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritroblastemie","accusative-definite-nominative-singular":"eritroblastemia","accusative-indefinite-nominative-plural":"eritroblastemii","accusative-definite-nominative-plural":"eritroblastemiile","dative-genitive-indefinite-singular":"eritroblastemii","dative-definite-genitive-singular":"eritroblastemiei","dative-genitive-indefinite-plural":"eritroblastemii","dative-definite-genitive-plural":"eritroblastemiilor","singular-vocative":"eritroblastemie","plural-vocative":"eritroblastemiilor"}},{"word":"eritroblastopenie","pos":"noun","definitions":["erythroblastopenia"],"forms":{"plural":"eritroblastopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritroblastopenie","accusative-definite-nominative-singular":"eritroblastopenia","accusative-indefinite-nominative-plural":"eritroblastopenii","accusative-definite-nominative-plural":"eritroblastopeniile","dative-genitive-indefinite-singular":"eritroblastopenii","dative-definite-genitive-singular":"eritroblastopeniei","dative-genitive-indefinite-plural":"eritroblastopenii","dative-definite-genitive-plural":"eritroblastopeniilor","singular-vocative":"eritroblastopenie","plural-vocative":"eritroblastopeniilor"}},{"word":"eritroblastoză","pos":"noun","definitions":["erythroblastosis"],"forms":{"plural":"eritroblastoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritroblastoză","accusative-definite-nominative-singular":"eritroblastoza","accusative-indefinite-nominative-plural":"eritroblastoze","accusative-definite-nominative-plural":"eritroblastozele","dative-genitive-indefinite-singular":"eritroblastoze","dative-definite-genitive-singular":"eritroblastozei","dative-genitive-indefinite-plural":"eritroblastoze","dative-definite-genitive-plural":"eritroblastozelor","singular-vocative":"eritroblastoză","plural-vocative":"eritroblastozelor"}},{"word":"eritrocit","pos":"noun","definitions":["erythrocyte"],"forms":{"plural":"eritrocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eritrocit","accusative-definite-nominative-singular":"eritrocitul","accusative-indefinite-nominative-plural":"eritrocite","accusative-definite-nominative-plural":"eritrocitele","dative-genitive-indefinite-singular":"eritrocit","dative-definite-genitive-singular":"eritrocitului","dative-genitive-indefinite-plural":"eritrocite","dative-definite-genitive-plural":"eritrocitelor","singular-vocative":"eritrocitule","plural-vocative":"eritrocitelor"}},{"word":"eritrocitoză","pos":"noun","definitions":["erythrocytosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritrocitoză","accusative-definite-nominative-singular":"eritrocitoza","accusative-indefinite-nominative-plural":"eritrocitoze","accusative-definite-nominative-plural":"eritrocitozele","dative-genitive-indefinite-singular":"eritrocitoze","dative-definite-genitive-singular":"eritrocitozei","dative-genitive-indefinite-plural":"eritrocitoze","dative-definite-genitive-plural":"eritrocitozelor","singular-vocative":"eritrocitoză","plural-vocative":"eritrocitozelor"}},{"word":"eritrodermie","pos":"noun","definitions":["erythrodermia"],"forms":{"plural":"eritrodermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritrodermie","accusative-definite-nominative-singular":"eritrodermia","accusative-indefinite-nominative-plural":"eritrodermii","accusative-definite-nominative-plural":"eritrodermiile","dative-genitive-indefinite-singular":"eritrodermii","dative-definite-genitive-singular":"eritrodermiei","dative-genitive-indefinite-plural":"eritrodermii","dative-definite-genitive-plural":"eritrodermiilor","singular-vocative":"eritrodermie","plural-vocative":"eritrodermiilor"}},{"word":"eritrofobie","pos":"noun","definitions":["erythrophobia"],"forms":{"plural":"eritrofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritrofobie","accusative-definite-nominative-singular":"eritrofobia","accusative-indefinite-nominative-plural":"eritrofobii","accusative-definite-nominative-plural":"eritrofobiile","dative-genitive-indefinite-singular":"eritrofobii","dative-definite-genitive-singular":"eritrofobiei","dative-genitive-indefinite-plural":"eritrofobii","dative-definite-genitive-plural":"eritrofobiilor","singular-vocative":"eritrofobie","plural-vocative":"eritrofobiilor"}},{"word":"eritroleucemie","pos":"noun","definitions":["erythroleukemia"],"forms":{"plural":"eritroleucemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritroleucemie","accusative-definite-nominative-singular":"eritroleucemia","accusative-indefinite-nominative-plural":"eritroleucemii","accusative-definite-nominative-plural":"eritroleucemiile","dative-genitive-indefinite-singular":"eritroleucemii","dative-definite-genitive-singular":"eritroleucemiei","dative-genitive-indefinite-plural":"eritroleucemii","dative-definite-genitive-plural":"eritroleucemiilor","singular-vocative":"eritroleucemie","plural-vocative":"eritroleucemiilor"}},{"word":"eritroleucoză","pos":"noun","definitions":["erythroleukosis"],"forms":{"plural":"eritroleucoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritroleucoză","accusative-definite-nominative-singular":"eritroleucoza","accusative-indefinite-nominative-plural":"eritroleucoze","accusative-definite-nominative-plural":"eritroleucozele","dative-genitive-indefinite-singular":"eritroleucoze","dative-definite-genitive-singular":"eritroleucozei","dative-genitive-indefinite-plural":"eritroleucoze","dative-definite-genitive-plural":"eritroleucozelor","singular-vocative":"eritroleucoză","plural-vocative":"eritroleucozelor"}},{"word":"eritromicină","pos":"noun","definitions":["erythromycin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritromicină","accusative-definite-nominative-singular":"eritromicina","accusative-indefinite-nominative-plural":"eritromicine","accusative-definite-nominative-plural":"eritromicinele","dative-genitive-indefinite-singular":"eritromicine","dative-definite-genitive-singular":"eritromicinei","dative-genitive-indefinite-plural":"eritromicine","dative-definite-genitive-plural":"eritromicinelor","singular-vocative":"eritromicină","plural-vocative":"eritromicinelor"}},{"word":"eritropatie","pos":"noun","definitions":["erythropathy"],"forms":{"plural":"eritropatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritropatie","accusative-definite-nominative-singular":"eritropatia","accusative-indefinite-nominative-plural":"eritropatii","accusative-definite-nominative-plural":"eritropatiile","dative-genitive-indefinite-singular":"eritropatii","dative-definite-genitive-singular":"eritropatiei","dative-genitive-indefinite-plural":"eritropatii","dative-definite-genitive-plural":"eritropatiilor","singular-vocative":"eritropatie","plural-vocative":"eritropatiilor"}},{"word":"eritropenie","pos":"noun","definitions":["erythropenia"],"forms":{"plural":"eritropenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritropenie","accusative-definite-nominative-singular":"eritropenia","accusative-indefinite-nominative-plural":"eritropenii","accusative-definite-nominative-plural":"eritropeniile","dative-genitive-indefinite-singular":"eritropenii","dative-definite-genitive-singular":"eritropeniei","dative-genitive-indefinite-plural":"eritropenii","dative-definite-genitive-plural":"eritropeniilor","singular-vocative":"eritropenie","plural-vocative":"eritropeniilor"}},{"word":"eritropoieză","pos":"noun","definitions":["erythropoiesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritropoieză","accusative-definite-nominative-singular":"eritropoieza","accusative-indefinite-nominative-plural":"eritropoieze","accusative-definite-nominative-plural":"eritropoiezele","dative-genitive-indefinite-singular":"eritropoieze","dative-definite-genitive-singular":"eritropoiezei","dative-genitive-indefinite-plural":"eritropoieze","dative-definite-genitive-plural":"eritropoiezelor","singular-vocative":"eritropoieză","plural-vocative":"eritropoiezelor"}},{"word":"eritropsie","pos":"noun","definitions":["erythropsia"],"forms":{"plural":"eritropsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eritropsie","accusative-definite-nominative-singular":"eritropsia","accusative-indefinite-nominative-plural":"eritropsii","accusative-definite-nominative-plural":"eritropsiile","dative-genitive-indefinite-singular":"eritropsii","dative-definite-genitive-singular":"eritropsiei","dative-genitive-indefinite-plural":"eritropsii","dative-definite-genitive-plural":"eritropsiilor","singular-vocative":"eritropsie","plural-vocative":"eritropsiilor"}},{"word":"eritropsină","pos":"noun","definitions":["erythrosine"],"forms":{"plural":"eritropsine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritropsină","accusative-definite-nominative-singular":"eritropsina","accusative-indefinite-nominative-plural":"eritropsine","accusative-definite-nominative-plural":"eritropsinele","dative-genitive-indefinite-singular":"eritropsine","dative-definite-genitive-singular":"eritropsinei","dative-genitive-indefinite-plural":"eritropsine","dative-definite-genitive-plural":"eritropsinelor","singular-vocative":"eritropsină","plural-vocative":"eritropsinelor"}},{"word":"eritroză","pos":"noun","definitions":["erythrose"],"forms":{"plural":"eritroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritroză","accusative-definite-nominative-singular":"eritroza","accusative-indefinite-nominative-plural":"eritroze","accusative-definite-nominative-plural":"eritrozele","dative-genitive-indefinite-singular":"eritroze","dative-definite-genitive-singular":"eritrozei","dative-genitive-indefinite-plural":"eritroze","dative-definite-genitive-plural":"eritrozelor","singular-vocative":"eritroză","plural-vocative":"eritrozelor"}},{"word":"eritrozină","pos":"noun","definitions":["erythrosine"],"forms":{"plural":"eritrozine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eritrozină","accusative-definite-nominative-singular":"eritrozina","accusative-indefinite-nominative-plural":"eritrozine","accusative-definite-nominative-plural":"eritrozinele","dative-genitive-indefinite-singular":"eritrozine","dative-definite-genitive-singular":"eritrozinei","dative-genitive-indefinite-plural":"eritrozine","dative-definite-genitive-plural":"eritrozinelor","singular-vocative":"eritrozină","plural-vocative":"eritrozinelor"}},{"word":"Eriu Sâncrai","pos":"name","definitions":["a village in Craidorolț, Satu Mare County, Romania"],"gender":"m"},{"word":"erizipel","pos":"noun","definitions":["erysipelas"],"forms":{"plural":"erizipele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"erizipel","accusative-definite-nominative-singular":"erizipelul","accusative-indefinite-nominative-plural":"erizipele","accusative-definite-nominative-plural":"erizipelele","dative-genitive-indefinite-singular":"erizipel","dative-definite-genitive-singular":"erizipelului","dative-genitive-indefinite-plural":"erizipele","dative-definite-genitive-plural":"erizipelelor","singular-vocative":"erizipelule","plural-vocative":"erizipelelor"}},{"word":"erizipelă","pos":"noun","definitions":["erysipelas"],"forms":{"plural":"erizipele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"erizipelă","accusative-definite-nominative-singular":"erizipela","accusative-indefinite-nominative-plural":"erizipele","accusative-definite-nominative-plural":"erizipelele","dative-genitive-indefinite-singular":"erizipele","dative-definite-genitive-singular":"erizipelei","dative-genitive-indefinite-plural":"erizipele","dative-definite-genitive-plural":"erizipelelor","singular-vocative":"erizipelă","plural-vocative":"erizipelelor"}},{"word":"erizipelatos","pos":"adj","definitions":["erysipelatous"],"forms":{"feminine-singular":"erizipelatoasă","masculine-plural":"erizipelatoși","feminine-neuter-plural":"erizipelatoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erizipelatos","error-unrecognized-form-feminine-indefinite-singular":"erizipelatoasă","error-unrecognized-form-indefinite-masculine-plural":"erizipelatoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"erizipelatoase","definite-error-unrecognized-form-masculine-neuter-singular":"erizipelatosul","definite-error-unrecognized-form-feminine-singular":"erizipelatoasa","definite-error-unrecognized-form-masculine-plural":"erizipelatoșii","definite-error-unrecognized-form-feminine-neuter-plural":"erizipelatoasele"}},{"word":"ermeneutic","pos":"adj","definitions":["alternative form of hermeneutic"],"forms":{"feminine-singular":"ermeneutică","masculine-plural":"ermeneutici","feminine-neuter-plural":"ermeneutice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ermeneutic","error-unrecognized-form-feminine-indefinite-singular":"ermeneutică","error-unrecognized-form-indefinite-masculine-plural":"ermeneutici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ermeneutice","definite-error-unrecognized-form-masculine-neuter-singular":"ermeneuticul","definite-error-unrecognized-form-feminine-singular":"ermeneutica","definite-error-unrecognized-form-masculine-plural":"ermeneuticii","definite-error-unrecognized-form-feminine-neuter-plural":"ermeneuticele"}},{"word":"ermeneutică","pos":"noun","definitions":["alternative form of hermeneutică"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ermeneutică","accusative-definite-nominative":"ermeneutica","dative-genitive-indefinite":"ermeneutice","dative-definite-genitive":"ermeneuticei","vocative":"ermeneutică"}},{"word":"ermetic","pos":"adj","definitions":["hermetic"],"forms":{"feminine-singular":"ermetică","masculine-plural":"ermetici","feminine-neuter-plural":"ermetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ermetic","error-unrecognized-form-feminine-indefinite-singular":"ermetică","error-unrecognized-form-indefinite-masculine-plural":"ermetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ermetice","definite-error-unrecognized-form-masculine-neuter-singular":"ermeticul","definite-error-unrecognized-form-feminine-singular":"ermetica","definite-error-unrecognized-form-masculine-plural":"ermeticii","definite-error-unrecognized-form-feminine-neuter-plural":"ermeticele"}},{"word":"ermeticamente","pos":"adv","definitions":["hermetically"]},{"word":"ermetism","pos":"noun","definitions":["hermeticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ermetism","accusative-definite-nominative-singular":"ermetismul","accusative-indefinite-nominative-plural":"ermetisme","accusative-definite-nominative-plural":"ermetismele","dative-genitive-indefinite-singular":"ermetism","dative-definite-genitive-singular":"ermetismului","dative-genitive-indefinite-plural":"ermetisme","dative-definite-genitive-plural":"ermetismelor","singular-vocative":"ermetismule","plural-vocative":"ermetismelor"}},{"word":"ermetiza","pos":"verb","definitions":["to seal"],"forms":{"canonical":"a ermetiza 1st conjugation","present-singular-third-person":"ermetizează","participle-past":"ermetizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ermetiza","gerund":"ermetizând","first-person-indicative-present-singular":"ermetizez","indicative-present-second-person-singular":"ermetizezi","indicative-present-singular-third-person":"ermetizează","first-person-indicative-plural-present":"ermetizăm","indicative-plural-present-second-person":"ermetizați","indicative-plural-present-third-person":"ermetizează","first-person-imperfect-indicative-singular":"ermetizam","imperfect-indicative-second-person-singular":"ermetizai","imperfect-indicative-singular-third-person":"ermetiza","first-person-imperfect-indicative-plural":"ermetizam","imperfect-indicative-plural-second-person":"ermetizați","imperfect-indicative-plural-third-person":"ermetizau","first-person-indicative-perfect-singular":"ermetizai","indicative-perfect-second-person-singular":"ermetizași","indicative-perfect-singular-third-person":"ermetiză","first-person-indicative-perfect-plural":"ermetizarăm","indicative-perfect-plural-second-person":"ermetizarăți","indicative-perfect-plural-third-person":"ermetizară","first-person-indicative-pluperfect-singular":"ermetizasem","indicative-pluperfect-second-person-singular":"ermetizaseși","indicative-pluperfect-singular-third-person":"ermetizase","first-person-indicative-pluperfect-plural":"ermetizaserăm","indicative-pluperfect-plural-second-person":"ermetizaserăți","indicative-pluperfect-plural-third-person":"ermetizaseră","first-person-present-singular-subjunctive":"să ermetizez","present-second-person-singular-subjunctive":"să ermetizezi","present-singular-subjunctive-third-person":"să ermetizeze","first-person-plural-present-subjunctive":"să ermetizăm","plural-present-second-person-subjunctive":"să ermetizați","plural-present-subjunctive-third-person":"să ermetizeze","imperative-second-person-singular":"ermetizează","imperative-plural-second-person":"ermetizați","imperative-negative-second-person-singular":"nu ermetiza","imperative-negative-plural-second-person":"nu ermetizați"}},{"word":"ermetizare","pos":"noun","definitions":["sealing"],"forms":{"plural":"ermetizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ermetizare","accusative-definite-nominative-singular":"ermetizarea","accusative-indefinite-nominative-plural":"ermetizări","accusative-definite-nominative-plural":"ermetizările","dative-genitive-indefinite-singular":"ermetizări","dative-definite-genitive-singular":"ermetizării","dative-genitive-indefinite-plural":"ermetizări","dative-definite-genitive-plural":"ermetizărilor","singular-vocative":"ermetizare","plural-vocative":"ermetizărilor"}},{"word":"ermit","pos":"noun","definitions":["alternative form of eremit"],"forms":{"plural":"ermiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ermit","accusative-definite-nominative-singular":"ermitul","accusative-indefinite-nominative-plural":"ermiți","accusative-definite-nominative-plural":"ermiții","dative-genitive-indefinite-singular":"ermit","dative-definite-genitive-singular":"ermitului","dative-genitive-indefinite-plural":"ermiți","dative-definite-genitive-plural":"ermiților","singular-vocative":"ermitule","plural-vocative":"ermiților"}},{"word":"ermitagiu","pos":"noun","definitions":["obsolete form of ermitaj"],"forms":{"plural":"ermitagii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ermitagiu","accusative-definite-nominative-singular":"ermitagiuul","accusative-indefinite-nominative-plural":"ermitagii","accusative-definite-nominative-plural":"ermitagiile","dative-genitive-indefinite-singular":"ermitagiu","dative-definite-genitive-singular":"ermitagiuului","dative-genitive-indefinite-plural":"ermitagii","dative-definite-genitive-plural":"ermitagiilor","singular-vocative":"ermitagiuule","plural-vocative":"ermitagiilor"}},{"word":"ermitaj","pos":"noun","definitions":["hermitage"],"pronunciation":"/er.miˈtaʒ/","forms":{"plural":"ermitaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ermitaj","accusative-definite-nominative-singular":"ermitajul","accusative-indefinite-nominative-plural":"ermitaje","accusative-definite-nominative-plural":"ermitajele","dative-genitive-indefinite-singular":"ermitaj","dative-definite-genitive-singular":"ermitajului","dative-genitive-indefinite-plural":"ermitaje","dative-definite-genitive-plural":"ermitajelor","singular-vocative":"ermitajule","plural-vocative":"ermitajelor"}},{"word":"Ermoclia","pos":"name","definitions":["a village in Ermoclia, Ștefan Vodă Raion, Moldova","a commune of Ștefan Vodă Raion, Moldova"],"gender":"f"},{"word":"Ernea","pos":"name","definitions":["a locality in Dumbrăveni, Sibiu County, Romania"],"gender":"f"},{"word":"ero","pos":"noun","definitions":["vocative singular of eră"],"pronunciation":"[ˈero]","gender":"f"},{"word":"eroare","pos":"noun","definitions":["error"],"forms":{"plural":"erori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eroare","accusative-definite-nominative-singular":"eroarea","accusative-indefinite-nominative-plural":"erori","accusative-definite-nominative-plural":"erorile","dative-genitive-indefinite-singular":"erori","dative-definite-genitive-singular":"erorii","dative-genitive-indefinite-plural":"erori","dative-definite-genitive-plural":"erorilor","singular-vocative":"eroare","plural-vocative":"erorilor"}},{"word":"eroda","pos":"verb","definitions":["to erode"],"forms":{"canonical":"a eroda 1st conjugation","present-singular-third-person":"erodează","participle-past":"erodat","subjunctive-third-person":"erodeze","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eroda","gerund":"erodând","first-person-indicative-present-singular":"erodez","indicative-present-second-person-singular":"erodezi","indicative-present-singular-third-person":"erodează","first-person-indicative-plural-present":"erodăm","indicative-plural-present-second-person":"erodați","indicative-plural-present-third-person":"erodează","first-person-imperfect-indicative-singular":"erodam","imperfect-indicative-second-person-singular":"erodai","imperfect-indicative-singular-third-person":"eroda","first-person-imperfect-indicative-plural":"erodam","imperfect-indicative-plural-second-person":"erodați","imperfect-indicative-plural-third-person":"erodau","first-person-indicative-perfect-singular":"erodai","indicative-perfect-second-person-singular":"erodași","indicative-perfect-singular-third-person":"erodă","first-person-indicative-perfect-plural":"erodarăm","indicative-perfect-plural-second-person":"erodarăți","indicative-perfect-plural-third-person":"erodară","first-person-indicative-pluperfect-singular":"erodasem","indicative-pluperfect-second-person-singular":"erodaseși","indicative-pluperfect-singular-third-person":"erodase","first-person-indicative-pluperfect-plural":"erodaserăm","indicative-pluperfect-plural-second-person":"erodaserăți","indicative-pluperfect-plural-third-person":"erodaseră","first-person-present-singular-subjunctive":"să erodez","present-second-person-singular-subjunctive":"să erodezi","present-singular-subjunctive-third-person":"să erodeze","first-person-plural-present-subjunctive":"să erodăm","plural-present-second-person-subjunctive":"să erodați","plural-present-subjunctive-third-person":"să erodeze","imperative-second-person-singular":"erodează","imperative-plural-second-person":"erodați","imperative-negative-second-person-singular":"nu eroda","imperative-negative-plural-second-person":"nu erodați"}}];
@@ -0,0 +1 @@
+export default [{"word":"erodare","pos":"noun","definitions":["erosion"],"forms":{"plural":"erodări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erodare","accusative-definite-nominative-singular":"erodarea","accusative-indefinite-nominative-plural":"erodări","accusative-definite-nominative-plural":"erodările","dative-genitive-indefinite-singular":"erodări","dative-definite-genitive-singular":"erodării","dative-genitive-indefinite-plural":"erodări","dative-definite-genitive-plural":"erodărilor","singular-vocative":"erodare","plural-vocative":"erodărilor"}},{"word":"erodat","pos":"adj","definitions":["eroded"],"forms":{"feminine-singular":"erodată","masculine-plural":"erodați","feminine-neuter-plural":"erodate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erodat","error-unrecognized-form-feminine-indefinite-singular":"erodată","error-unrecognized-form-indefinite-masculine-plural":"erodați","error-unrecognized-form-feminine-indefinite-neuter-plural":"erodate","definite-error-unrecognized-form-masculine-neuter-singular":"erodatul","definite-error-unrecognized-form-feminine-singular":"erodata","definite-error-unrecognized-form-masculine-plural":"erodații","definite-error-unrecognized-form-feminine-neuter-plural":"erodatele"}},{"word":"erodiu","pos":"noun","definitions":["egret"],"forms":{"plural":"erodii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erodiu","accusative-definite-nominative-singular":"erodiuul","accusative-indefinite-nominative-plural":"erodii","accusative-definite-nominative-plural":"erodiii","dative-genitive-indefinite-singular":"erodiu","dative-definite-genitive-singular":"erodiuului","dative-genitive-indefinite-plural":"erodii","dative-definite-genitive-plural":"erodiilor","singular-vocative":"erodiuule","plural-vocative":"erodiilor"}},{"word":"erogație","pos":"noun","definitions":["expenditure"],"forms":{"plural":"erogații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erogație","accusative-definite-nominative-singular":"erogația","accusative-indefinite-nominative-plural":"erogații","accusative-definite-nominative-plural":"erogațiile","dative-genitive-indefinite-singular":"erogații","dative-definite-genitive-singular":"erogației","dative-genitive-indefinite-plural":"erogații","dative-definite-genitive-plural":"erogațiilor","singular-vocative":"erogație","plural-vocative":"erogațiilor"}},{"word":"erogen","pos":"adj","definitions":["erogenous"],"pronunciation":"[e.roˈd͡ʒen]","forms":{"feminine-singular":"erogenă","masculine-plural":"erogeni","feminine-neuter-plural":"erogene","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"erogen","error-unrecognized-form-feminine-indefinite-singular":"erogenă","error-unrecognized-form-indefinite-masculine-plural":"erogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"erogene","definite-error-unrecognized-form-masculine-neuter-singular":"erogenul","definite-error-unrecognized-form-feminine-singular":"erogena","definite-error-unrecognized-form-masculine-plural":"erogenii","definite-error-unrecognized-form-feminine-neuter-plural":"erogenele"}},{"word":"erogenă","pos":"adj","definitions":["nominative feminine singular of erogen","accusative feminine singular of erogen"],"pronunciation":"[e.roˈd͡ʒe.nə]","examples":[{"ro":"zonă erogenă","en":"erogenous zone"}]},{"word":"erogene","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of erogen"],"pronunciation":"[e.roˈd͡ʒe.ne]"},{"word":"erogeni","pos":"adj","definitions":["nominative/accusative masculine plural of erogen"],"pronunciation":"[eroˈdʒenʲ]"},{"word":"eroi","pos":"noun","definitions":["plural of erou (“heroes”)"],"pronunciation":"[eˈroj]","gender":"m-p"},{"word":"eroic","pos":"adj","definitions":["heroic"],"forms":{"feminine-singular":"eroică","masculine-plural":"eroici","feminine-neuter-plural":"eroice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroic","error-unrecognized-form-feminine-indefinite-singular":"eroică","error-unrecognized-form-indefinite-masculine-plural":"eroici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eroice","definite-error-unrecognized-form-masculine-neuter-singular":"eroicul","definite-error-unrecognized-form-feminine-singular":"eroica","definite-error-unrecognized-form-masculine-plural":"eroicii","definite-error-unrecognized-form-feminine-neuter-plural":"eroicele"}},{"word":"eroicesc","pos":"adj","definitions":["heroic"],"forms":{"feminine-singular":"eroicească","plural":"eroicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroicesc","error-unrecognized-form-feminine-indefinite-singular":"eroicească","error-unrecognized-form-indefinite-masculine-plural":"eroicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eroicești","definite-error-unrecognized-form-masculine-neuter-singular":"eroicescul","definite-error-unrecognized-form-feminine-singular":"eroiceasca","definite-error-unrecognized-form-masculine-plural":"eroiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"eroiceștile"}},{"word":"eroicește","pos":"adv","definitions":["heroicly"]},{"word":"eroicitate","pos":"noun","definitions":["heroicness, heroism"],"forms":{"plural":"eroicitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eroicitate","accusative-definite-nominative-singular":"eroicitatea","accusative-indefinite-nominative-plural":"eroicitatăți","accusative-definite-nominative-plural":"eroicitatățile","dative-genitive-indefinite-singular":"eroicitatăți","dative-definite-genitive-singular":"eroicitatății","dative-genitive-indefinite-plural":"eroicitatăți","dative-definite-genitive-plural":"eroicitatăților","singular-vocative":"eroicitate","plural-vocative":"eroicitatăților"}},{"word":"eroicomic","pos":"adj","definitions":["heroicomical"],"forms":{"feminine-singular":"eroicomică","masculine-plural":"eroicomici","feminine-neuter-plural":"eroicomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroicomic","error-unrecognized-form-feminine-indefinite-singular":"eroicomică","error-unrecognized-form-indefinite-masculine-plural":"eroicomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eroicomice","definite-error-unrecognized-form-masculine-neuter-singular":"eroicomicul","definite-error-unrecognized-form-feminine-singular":"eroicomica","definite-error-unrecognized-form-masculine-plural":"eroicomicii","definite-error-unrecognized-form-feminine-neuter-plural":"eroicomicele"}},{"word":"eroifica","pos":"verb","definitions":["to heroify"],"forms":{"canonical":"a eroifica 1st conjugation","present-singular-third-person":"eroifică","participle-past":"eroificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a eroifica","gerund":"eroificând","first-person-indicative-present-singular":"eroific","indicative-present-second-person-singular":"eroifici","indicative-present-singular-third-person":"eroifică","first-person-indicative-plural-present":"eroificăm","indicative-plural-present-second-person":"eroificați","indicative-plural-present-third-person":"eroifică","first-person-imperfect-indicative-singular":"eroificam","imperfect-indicative-second-person-singular":"eroificai","imperfect-indicative-singular-third-person":"eroifica","first-person-imperfect-indicative-plural":"eroificam","imperfect-indicative-plural-second-person":"eroificați","imperfect-indicative-plural-third-person":"eroificau","first-person-indicative-perfect-singular":"eroificai","indicative-perfect-second-person-singular":"eroificași","indicative-perfect-singular-third-person":"eroifică","first-person-indicative-perfect-plural":"eroificarăm","indicative-perfect-plural-second-person":"eroificarăți","indicative-perfect-plural-third-person":"eroificară","first-person-indicative-pluperfect-singular":"eroificasem","indicative-pluperfect-second-person-singular":"eroificaseși","indicative-pluperfect-singular-third-person":"eroificase","first-person-indicative-pluperfect-plural":"eroificaserăm","indicative-pluperfect-plural-second-person":"eroificaserăți","indicative-pluperfect-plural-third-person":"eroificaseră","first-person-present-singular-subjunctive":"să eroific","present-second-person-singular-subjunctive":"să eroifici","present-singular-subjunctive-third-person":"să eroifice","first-person-plural-present-subjunctive":"să eroificăm","plural-present-second-person-subjunctive":"să eroificați","plural-present-subjunctive-third-person":"să eroifice","imperative-second-person-singular":"eroifică","imperative-plural-second-person":"eroificați","imperative-negative-second-person-singular":"nu eroifica","imperative-negative-plural-second-person":"nu eroificați"}},{"word":"eroii","pos":"noun","definitions":["definite nominative/accusative plural of erou"]},{"word":"eroilor","pos":"noun","definitions":["inflection of erou:","definite genitive/dative plural","vocative plural"]},{"word":"eroină","pos":"noun","definitions":["heroine"],"forms":{"plural":"eroine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eroină","accusative-definite-nominative-singular":"eroina","accusative-indefinite-nominative-plural":"eroine","accusative-definite-nominative-plural":"eroinele","dative-genitive-indefinite-singular":"eroine","dative-definite-genitive-singular":"eroinei","dative-genitive-indefinite-plural":"eroine","dative-definite-genitive-plural":"eroinelor","singular-vocative":"eroină","plural-vocative":"eroinelor"}},{"word":"eroism","pos":"noun","definitions":["heroism","courage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eroism","accusative-definite-nominative":"eroismul","dative-genitive-indefinite":"eroism","dative-definite-genitive":"eroismului","vocative":"eroismule"}},{"word":"eroitate","pos":"noun","definitions":["heroicity"],"forms":{"plural":"eroitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eroitate","accusative-definite-nominative-singular":"eroitatea","accusative-indefinite-nominative-plural":"eroitatăți","accusative-definite-nominative-plural":"eroitatățile","dative-genitive-indefinite-singular":"eroitatăți","dative-definite-genitive-singular":"eroitatății","dative-genitive-indefinite-plural":"eroitatăți","dative-definite-genitive-plural":"eroitatăților","singular-vocative":"eroitate","plural-vocative":"eroitatăților"}},{"word":"eroiza","pos":"verb","definitions":["to heroify"],"forms":{"canonical":"a eroiza 1st conjugation","present-singular-third-person":"eroizează","participle-past":"eroizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eroiza","gerund":"eroizând","first-person-indicative-present-singular":"eroizez","indicative-present-second-person-singular":"eroizezi","indicative-present-singular-third-person":"eroizează","first-person-indicative-plural-present":"eroizăm","indicative-plural-present-second-person":"eroizați","indicative-plural-present-third-person":"eroizează","first-person-imperfect-indicative-singular":"eroizam","imperfect-indicative-second-person-singular":"eroizai","imperfect-indicative-singular-third-person":"eroiza","first-person-imperfect-indicative-plural":"eroizam","imperfect-indicative-plural-second-person":"eroizați","imperfect-indicative-plural-third-person":"eroizau","first-person-indicative-perfect-singular":"eroizai","indicative-perfect-second-person-singular":"eroizași","indicative-perfect-singular-third-person":"eroiză","first-person-indicative-perfect-plural":"eroizarăm","indicative-perfect-plural-second-person":"eroizarăți","indicative-perfect-plural-third-person":"eroizară","first-person-indicative-pluperfect-singular":"eroizasem","indicative-pluperfect-second-person-singular":"eroizaseși","indicative-pluperfect-singular-third-person":"eroizase","first-person-indicative-pluperfect-plural":"eroizaserăm","indicative-pluperfect-plural-second-person":"eroizaserăți","indicative-pluperfect-plural-third-person":"eroizaseră","first-person-present-singular-subjunctive":"să eroizez","present-second-person-singular-subjunctive":"să eroizezi","present-singular-subjunctive-third-person":"să eroizeze","first-person-plural-present-subjunctive":"să eroizăm","plural-present-second-person-subjunctive":"să eroizați","plural-present-subjunctive-third-person":"să eroizeze","imperative-second-person-singular":"eroizează","imperative-plural-second-person":"eroizați","imperative-negative-second-person-singular":"nu eroiza","imperative-negative-plural-second-person":"nu eroizați"}},{"word":"eroizat","pos":"adj","definitions":["heroified"],"forms":{"feminine-singular":"eroizată","masculine-plural":"eroizați","feminine-neuter-plural":"eroizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroizat","error-unrecognized-form-feminine-indefinite-singular":"eroizată","error-unrecognized-form-indefinite-masculine-plural":"eroizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eroizate","definite-error-unrecognized-form-masculine-neuter-singular":"eroizatul","definite-error-unrecognized-form-feminine-singular":"eroizata","definite-error-unrecognized-form-masculine-plural":"eroizații","definite-error-unrecognized-form-feminine-neuter-plural":"eroizatele"}},{"word":"eroizat","pos":"verb","definitions":["past participle of eroiza"],"forms":{"participle-past":"of eroiza"}},{"word":"eroman","pos":"adj","definitions":["erotomaniacal"],"forms":{"feminine-singular":"eromană","masculine-plural":"eromani","feminine-neuter-plural":"eromane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroman","error-unrecognized-form-feminine-indefinite-singular":"eromană","error-unrecognized-form-indefinite-masculine-plural":"eromani","error-unrecognized-form-feminine-indefinite-neuter-plural":"eromane","definite-error-unrecognized-form-masculine-neuter-singular":"eromanul","definite-error-unrecognized-form-feminine-singular":"eromana","definite-error-unrecognized-form-masculine-plural":"eromanii","definite-error-unrecognized-form-feminine-neuter-plural":"eromanele"}},{"word":"eroman","pos":"noun","definitions":["erotomaniac"],"forms":{"plural":"eromani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eroman","accusative-definite-nominative-singular":"eromanul","accusative-indefinite-nominative-plural":"eromani","accusative-definite-nominative-plural":"eromanii","dative-genitive-indefinite-singular":"eroman","dative-definite-genitive-singular":"eromanului","dative-genitive-indefinite-plural":"eromani","dative-definite-genitive-plural":"eromanilor","singular-vocative":"eromanule","plural-vocative":"eromanilor"}},{"word":"eronat","pos":"adj","definitions":["erroneous"],"pronunciation":"/e.roˈnat/","forms":{"feminine-singular":"eronată","masculine-plural":"eronați","feminine-neuter-plural":"eronate","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"eronat","error-unrecognized-form-feminine-indefinite-singular":"eronată","error-unrecognized-form-indefinite-masculine-plural":"eronați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eronate","definite-error-unrecognized-form-masculine-neuter-singular":"eronatul","definite-error-unrecognized-form-feminine-singular":"eronata","definite-error-unrecognized-form-masculine-plural":"eronații","definite-error-unrecognized-form-feminine-neuter-plural":"eronatele"}},{"word":"eroneu","pos":"adj","definitions":["erroneous"],"forms":{"feminine-singular":"eronee","masculine-plural":"eronei","feminine-neuter-plural":"eronee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroneu","error-unrecognized-form-feminine-indefinite-singular":"eronee","error-unrecognized-form-indefinite-masculine-plural":"eronei","error-unrecognized-form-feminine-indefinite-neuter-plural":"eronee","definite-error-unrecognized-form-masculine-neuter-singular":"eroneul","definite-error-unrecognized-form-feminine-singular":"eroneea","definite-error-unrecognized-form-masculine-plural":"eroneii","definite-error-unrecognized-form-feminine-neuter-plural":"eroneele"}},{"word":"eros","pos":"noun","definitions":["eros (physical love)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eros","accusative-definite-nominative":"erosul","dative-genitive-indefinite":"eros","dative-definite-genitive":"erosului","vocative":"erosule"}},{"word":"erotematic","pos":"adj","definitions":["erotematic"],"forms":{"feminine-singular":"erotematică","masculine-plural":"erotematici","feminine-neuter-plural":"erotematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erotematic","error-unrecognized-form-feminine-indefinite-singular":"erotematică","error-unrecognized-form-indefinite-masculine-plural":"erotematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"erotematice","definite-error-unrecognized-form-masculine-neuter-singular":"erotematicul","definite-error-unrecognized-form-feminine-singular":"erotematica","definite-error-unrecognized-form-masculine-plural":"erotematicii","definite-error-unrecognized-form-feminine-neuter-plural":"erotematicele"}},{"word":"erotic","pos":"adj","definitions":["erotic"],"pronunciation":"[eˈrotik]","forms":{"feminine-singular":"erotică","masculine-plural":"erotici","feminine-neuter-plural":"erotice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"erotic","error-unrecognized-form-feminine-indefinite-singular":"erotică","error-unrecognized-form-indefinite-masculine-plural":"erotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"erotice","definite-error-unrecognized-form-masculine-neuter-singular":"eroticul","definite-error-unrecognized-form-feminine-singular":"erotica","definite-error-unrecognized-form-masculine-plural":"eroticii","definite-error-unrecognized-form-feminine-neuter-plural":"eroticele"}},{"word":"erotica","pos":"adj","definitions":["definite feminine singular nominative/accusative of erotic (“erotic”)"],"pronunciation":"[eˈrotika]"},{"word":"erotica","pos":"noun","definitions":["definite singular nominative/accusative of erotică (“erotica”)"],"pronunciation":"[eˈrotika]","gender":"f"},{"word":"erotică","pos":"noun","definitions":["erotica"],"pronunciation":"[eˈrotikə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"erotică","accusative-definite-nominative":"erotica","dative-genitive-indefinite":"erotici","dative-definite-genitive":"eroticii","vocative":"erotică"}},{"word":"erotică","pos":"adj","definitions":["nominative/accusative feminine singular of erotic"],"pronunciation":"[eˈrotikə]"},{"word":"erotice","pos":"adj","definitions":["feminine/neuter plural of erotic"],"pronunciation":"[eˈrotit͡ʃe]"},{"word":"eroticei","pos":"adj","definitions":["definite genitive/dative feminine singular of erotic"],"pronunciation":"[eˈrotit͡ʃej]"},{"word":"eroticele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of erotic"],"pronunciation":"[eˈrotit͡ʃele]"},{"word":"eroticelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of erotic"],"pronunciation":"[eˈrotit͡ʃelor]"},{"word":"eroticește","pos":"adv","definitions":["erotically"]},{"word":"erotici","pos":"adj","definitions":["masculine plural of erotic"],"pronunciation":"[eˈrotit͡ʃʲ]","gender":"m-p"},{"word":"eroticii","pos":"adj","definitions":["definite genitive/dative masculine plural of erotic"],"pronunciation":"[eˈrotit͡ʃiː]"},{"word":"eroticii","pos":"noun","definitions":["definite genitive/dative singular of erotică"],"pronunciation":"[eˈrotit͡ʃiː]","gender":"f"},{"word":"eroticilor","pos":"adj","definitions":["definite genitive/dative masculine plural of erotic"],"pronunciation":"[eˈrotit͡ʃilor]"},{"word":"erotico","pos":"noun","definitions":["vocative singular of erotică"],"pronunciation":"[eˈrotiko]","gender":"f"},{"word":"eroticul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of erotic"],"pronunciation":"[eˈrotikul]"},{"word":"eroticului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of erotic"],"pronunciation":"[eˈrotikuluj]"},{"word":"erotimie","pos":"noun","definitions":["generosity"],"forms":{"plural":"erotimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erotimie","accusative-definite-nominative-singular":"erotimia","accusative-indefinite-nominative-plural":"erotimii","accusative-definite-nominative-plural":"erotimiile","dative-genitive-indefinite-singular":"erotimii","dative-definite-genitive-singular":"erotimiei","dative-genitive-indefinite-plural":"erotimii","dative-definite-genitive-plural":"erotimiilor","singular-vocative":"erotimie","plural-vocative":"erotimiilor"}},{"word":"erotism","pos":"noun","definitions":["eroticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"erotism","accusative-definite-nominative":"erotismul","dative-genitive-indefinite":"erotism","dative-definite-genitive":"erotismului","vocative":"erotismule"}},{"word":"erotiza","pos":"verb","definitions":["to eroticize"],"forms":{"canonical":"a erotiza 1st conjugation","present-singular-third-person":"erotizează","participle-past":"erotizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a erotiza","gerund":"erotizând","first-person-indicative-present-singular":"erotizez","indicative-present-second-person-singular":"erotizezi","indicative-present-singular-third-person":"erotizează","first-person-indicative-plural-present":"erotizăm","indicative-plural-present-second-person":"erotizați","indicative-plural-present-third-person":"erotizează","first-person-imperfect-indicative-singular":"erotizam","imperfect-indicative-second-person-singular":"erotizai","imperfect-indicative-singular-third-person":"erotiza","first-person-imperfect-indicative-plural":"erotizam","imperfect-indicative-plural-second-person":"erotizați","imperfect-indicative-plural-third-person":"erotizau","first-person-indicative-perfect-singular":"erotizai","indicative-perfect-second-person-singular":"erotizași","indicative-perfect-singular-third-person":"erotiză","first-person-indicative-perfect-plural":"erotizarăm","indicative-perfect-plural-second-person":"erotizarăți","indicative-perfect-plural-third-person":"erotizară","first-person-indicative-pluperfect-singular":"erotizasem","indicative-pluperfect-second-person-singular":"erotizaseși","indicative-pluperfect-singular-third-person":"erotizase","first-person-indicative-pluperfect-plural":"erotizaserăm","indicative-pluperfect-plural-second-person":"erotizaserăți","indicative-pluperfect-plural-third-person":"erotizaseră","first-person-present-singular-subjunctive":"să erotizez","present-second-person-singular-subjunctive":"să erotizezi","present-singular-subjunctive-third-person":"să erotizeze","first-person-plural-present-subjunctive":"să erotizăm","plural-present-second-person-subjunctive":"să erotizați","plural-present-subjunctive-third-person":"să erotizeze","imperative-second-person-singular":"erotizează","imperative-plural-second-person":"erotizați","imperative-negative-second-person-singular":"nu erotiza","imperative-negative-plural-second-person":"nu erotizați"}},{"word":"erotizare","pos":"noun","definitions":["erotization"],"forms":{"plural":"erotizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erotizare","accusative-definite-nominative-singular":"erotizarea","accusative-indefinite-nominative-plural":"erotizări","accusative-definite-nominative-plural":"erotizările","dative-genitive-indefinite-singular":"erotizări","dative-definite-genitive-singular":"erotizării","dative-genitive-indefinite-plural":"erotizări","dative-definite-genitive-plural":"erotizărilor","singular-vocative":"erotizare","plural-vocative":"erotizărilor"}},{"word":"erotolog","pos":"noun","definitions":["erotologist"],"forms":{"plural":"erotologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erotolog","accusative-definite-nominative-singular":"erotologul","accusative-indefinite-nominative-plural":"erotologi","accusative-definite-nominative-plural":"erotologii","dative-genitive-indefinite-singular":"erotolog","dative-definite-genitive-singular":"erotologului","dative-genitive-indefinite-plural":"erotologi","dative-definite-genitive-plural":"erotologilor","singular-vocative":"erotologule","plural-vocative":"erotologilor"}},{"word":"erotologie","pos":"noun","definitions":["erotology"],"forms":{"plural":"erotologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erotologie","accusative-definite-nominative-singular":"erotologia","accusative-indefinite-nominative-plural":"erotologii","accusative-definite-nominative-plural":"erotologiile","dative-genitive-indefinite-singular":"erotologii","dative-definite-genitive-singular":"erotologiei","dative-genitive-indefinite-plural":"erotologii","dative-definite-genitive-plural":"erotologiilor","singular-vocative":"erotologie","plural-vocative":"erotologiilor"}},{"word":"erotoman","pos":"noun","definitions":["erotomaniac"],"forms":{"plural":"erotomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erotoman","accusative-definite-nominative-singular":"erotomanul","accusative-indefinite-nominative-plural":"erotomani","accusative-definite-nominative-plural":"erotomanii","dative-genitive-indefinite-singular":"erotoman","dative-definite-genitive-singular":"erotomanului","dative-genitive-indefinite-plural":"erotomani","dative-definite-genitive-plural":"erotomanilor","singular-vocative":"erotomanule","plural-vocative":"erotomanilor"}},{"word":"erotomană","pos":"noun","definitions":["female equivalent of erotoman"],"forms":{"plural":"erotomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"erotomană","accusative-definite-nominative-singular":"erotomana","accusative-indefinite-nominative-plural":"erotomane","accusative-definite-nominative-plural":"erotomanele","dative-genitive-indefinite-singular":"erotomane","dative-definite-genitive-singular":"erotomanei","dative-genitive-indefinite-plural":"erotomane","dative-definite-genitive-plural":"erotomanelor","singular-vocative":"erotomană","plural-vocative":"erotomanelor"}},{"word":"erotomaniac","pos":"adj","definitions":["erotomanic"],"forms":{"feminine-singular":"erotomaniacă","masculine-plural":"erotomaniaci","feminine-neuter-plural":"erotomaniace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erotomaniac","error-unrecognized-form-feminine-indefinite-singular":"erotomaniacă","error-unrecognized-form-indefinite-masculine-plural":"erotomaniaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"erotomaniace","definite-error-unrecognized-form-masculine-neuter-singular":"erotomaniacul","definite-error-unrecognized-form-feminine-singular":"erotomaniaca","definite-error-unrecognized-form-masculine-plural":"erotomaniacii","definite-error-unrecognized-form-feminine-neuter-plural":"erotomaniacele"}},{"word":"erotomanie","pos":"noun","definitions":["erotomania"],"forms":{"plural":"erotomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erotomanie","accusative-definite-nominative-singular":"erotomania","accusative-indefinite-nominative-plural":"erotomanii","accusative-definite-nominative-plural":"erotomaniile","dative-genitive-indefinite-singular":"erotomanii","dative-definite-genitive-singular":"erotomaniei","dative-genitive-indefinite-plural":"erotomanii","dative-definite-genitive-plural":"erotomaniilor","singular-vocative":"erotomanie","plural-vocative":"erotomaniilor"}},{"word":"erou","pos":"noun","definitions":["hero"],"pronunciation":"[eˈɾow]","forms":{"plural":"eroi","feminine":"equivalent eroină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erou","accusative-definite-nominative-singular":"eroul","accusative-indefinite-nominative-plural":"eroi","accusative-definite-nominative-plural":"eroii","dative-genitive-indefinite-singular":"erou","dative-definite-genitive-singular":"eroului","dative-genitive-indefinite-plural":"eroi","dative-definite-genitive-plural":"eroilor","singular-vocative":"eroule","plural-vocative":"eroilor"}},{"word":"eroul","pos":"noun","definitions":["definite nominative/accusative singular of erou"]},{"word":"eroule","pos":"noun","definitions":["vocative singular of erou"]},{"word":"eroului","pos":"noun","definitions":["definite genitive/dative singular of erou"]},{"word":"eroziune","pos":"noun","definitions":["erosion"],"forms":{"plural":"eroziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"eroziune","accusative-definite-nominative-singular":"eroziunea","accusative-indefinite-nominative-plural":"eroziune","accusative-definite-nominative-plural":"eroziunele","dative-genitive-indefinite-singular":"eroziune","dative-definite-genitive-singular":"eroziunei","dative-genitive-indefinite-plural":"eroziune","dative-definite-genitive-plural":"eroziunelor","singular-vocative":"eroziune","plural-vocative":"eroziunelor"}},{"word":"eroziv","pos":"adj","definitions":["erosive"],"forms":{"feminine-singular":"erozivă","masculine-plural":"erozivi","feminine-neuter-plural":"erozive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eroziv","error-unrecognized-form-feminine-indefinite-singular":"erozivă","error-unrecognized-form-indefinite-masculine-plural":"erozivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"erozive","definite-error-unrecognized-form-masculine-neuter-singular":"erozivul","definite-error-unrecognized-form-feminine-singular":"eroziva","definite-error-unrecognized-form-masculine-plural":"erozivii","definite-error-unrecognized-form-feminine-neuter-plural":"erozivele"}},{"word":"erpetografic","pos":"adj","definitions":["herpetological"],"forms":{"feminine-singular":"erpetografică","masculine-plural":"erpetografici","feminine-neuter-plural":"erpetografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erpetografic","error-unrecognized-form-feminine-indefinite-singular":"erpetografică","error-unrecognized-form-indefinite-masculine-plural":"erpetografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"erpetografice","definite-error-unrecognized-form-masculine-neuter-singular":"erpetograficul","definite-error-unrecognized-form-feminine-singular":"erpetografica","definite-error-unrecognized-form-masculine-plural":"erpetograficii","definite-error-unrecognized-form-feminine-neuter-plural":"erpetograficele"}},{"word":"erpetografie","pos":"noun","definitions":["herpetology"],"forms":{"plural":"erpetografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erpetografie","accusative-definite-nominative-singular":"erpetografia","accusative-indefinite-nominative-plural":"erpetografii","accusative-definite-nominative-plural":"erpetografiile","dative-genitive-indefinite-singular":"erpetografii","dative-definite-genitive-singular":"erpetografiei","dative-genitive-indefinite-plural":"erpetografii","dative-definite-genitive-plural":"erpetografiilor","singular-vocative":"erpetografie","plural-vocative":"erpetografiilor"}},{"word":"erpetolog","pos":"noun","definitions":["herpetologist"],"pronunciation":"/er.pe.toˈloɡ/","forms":{"plural":"erpetologi","feminine":"equivalent erpetologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erpetolog","accusative-definite-nominative-singular":"erpetologul","accusative-indefinite-nominative-plural":"erpetologi","accusative-definite-nominative-plural":"erpetologii","dative-genitive-indefinite-singular":"erpetolog","dative-definite-genitive-singular":"erpetologului","dative-genitive-indefinite-plural":"erpetologi","dative-definite-genitive-plural":"erpetologilor","singular-vocative":"erpetologule","plural-vocative":"erpetologilor"}},{"word":"erpetologă","pos":"noun","definitions":["female equivalent of erpetolog"],"pronunciation":"/er.pe.toˈlo.ɡə/","forms":{"plural":"erpetologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"erpetologă","accusative-definite-nominative-singular":"erpetologul","accusative-indefinite-nominative-plural":"erpetologe","accusative-definite-nominative-plural":"erpetologele","dative-genitive-indefinite-singular":"erpetologe","dative-definite-genitive-singular":"erpetologei","dative-genitive-indefinite-plural":"erpetologe","dative-definite-genitive-plural":"erpetologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"erpetologe","pos":"noun","definitions":["plural of erpetologă"],"gender":"f"},{"word":"erpetologi","pos":"noun","definitions":["plural of erpetolog"],"gender":"m"},{"word":"erpetologic","pos":"adj","definitions":["herpetological"],"forms":{"feminine-singular":"erpetologică","masculine-plural":"erpetologici","feminine-neuter-plural":"erpetologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erpetologic","error-unrecognized-form-feminine-indefinite-singular":"erpetologică","error-unrecognized-form-indefinite-masculine-plural":"erpetologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"erpetologice","definite-error-unrecognized-form-masculine-neuter-singular":"erpetologicul","definite-error-unrecognized-form-feminine-singular":"erpetologica","definite-error-unrecognized-form-masculine-plural":"erpetologicii","definite-error-unrecognized-form-feminine-neuter-plural":"erpetologicele"}},{"word":"erpetologie","pos":"noun","definitions":["herpetology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"erpetologie","accusative-definite-nominative":"erpetologia","dative-genitive-indefinite":"erpetologii","dative-definite-genitive":"erpetologiei","vocative":"erpetologie"}},{"word":"erpetologist","pos":"noun","definitions":["herpetologist"],"forms":{"plural":"erpetologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"erpetologist","accusative-definite-nominative-singular":"erpetologistul","accusative-indefinite-nominative-plural":"erpetologiști","accusative-definite-nominative-plural":"erpetologiștii","dative-genitive-indefinite-singular":"erpetologist","dative-definite-genitive-singular":"erpetologistului","dative-genitive-indefinite-plural":"erpetologiști","dative-definite-genitive-plural":"erpetologiștilor","singular-vocative":"erpetologistule","plural-vocative":"erpetologiștilor"}},{"word":"Ersig","pos":"name","definitions":["a village in Vermeș, Caraș-Severin County, Romania"],"gender":"m"},{"word":"eruciform","pos":"adj","definitions":["eruciform"],"forms":{"feminine-singular":"eruciformă","masculine-plural":"eruciformi","feminine-neuter-plural":"eruciforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eruciform","error-unrecognized-form-feminine-indefinite-singular":"eruciformă","error-unrecognized-form-indefinite-masculine-plural":"eruciformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eruciforme","definite-error-unrecognized-form-masculine-neuter-singular":"eruciformul","definite-error-unrecognized-form-feminine-singular":"eruciforma","definite-error-unrecognized-form-masculine-plural":"eruciformii","definite-error-unrecognized-form-feminine-neuter-plural":"eruciformele"}},{"word":"eructa","pos":"verb","definitions":["to eructate"],"forms":{"canonical":"a eructa 1st conjugation","present-singular-third-person":"eructează","participle-past":"eructat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eructa","gerund":"eructând","first-person-indicative-present-singular":"eructez","indicative-present-second-person-singular":"eructezi","indicative-present-singular-third-person":"eructează","first-person-indicative-plural-present":"eructăm","indicative-plural-present-second-person":"eructați","indicative-plural-present-third-person":"eructează","first-person-imperfect-indicative-singular":"eructam","imperfect-indicative-second-person-singular":"eructai","imperfect-indicative-singular-third-person":"eructa","first-person-imperfect-indicative-plural":"eructam","imperfect-indicative-plural-second-person":"eructați","imperfect-indicative-plural-third-person":"eructau","first-person-indicative-perfect-singular":"eructai","indicative-perfect-second-person-singular":"eructași","indicative-perfect-singular-third-person":"eructă","first-person-indicative-perfect-plural":"eructarăm","indicative-perfect-plural-second-person":"eructarăți","indicative-perfect-plural-third-person":"eructară","first-person-indicative-pluperfect-singular":"eructasem","indicative-pluperfect-second-person-singular":"eructaseși","indicative-pluperfect-singular-third-person":"eructase","first-person-indicative-pluperfect-plural":"eructaserăm","indicative-pluperfect-plural-second-person":"eructaserăți","indicative-pluperfect-plural-third-person":"eructaseră","first-person-present-singular-subjunctive":"să eructez","present-second-person-singular-subjunctive":"să eructezi","present-singular-subjunctive-third-person":"să eructeze","first-person-plural-present-subjunctive":"să eructăm","plural-present-second-person-subjunctive":"să eructați","plural-present-subjunctive-third-person":"să eructeze","imperative-second-person-singular":"eructează","imperative-plural-second-person":"eructați","imperative-negative-second-person-singular":"nu eructa","imperative-negative-plural-second-person":"nu eructați"}},{"word":"eructație","pos":"noun","definitions":["eructation"],"forms":{"plural":"eructații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eructație","accusative-definite-nominative-singular":"eructația","accusative-indefinite-nominative-plural":"eructații","accusative-definite-nominative-plural":"eructațiile","dative-genitive-indefinite-singular":"eructații","dative-definite-genitive-singular":"eructației","dative-genitive-indefinite-plural":"eructații","dative-definite-genitive-plural":"eructațiilor","singular-vocative":"eructație","plural-vocative":"eructațiilor"}},{"word":"eructațiune","pos":"noun","definitions":["obsolete form of eructație"],"forms":{"plural":"eructațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eructațiune","accusative-definite-nominative-singular":"eructațiunea","accusative-indefinite-nominative-plural":"eructațiuni","accusative-definite-nominative-plural":"eructațiunile","dative-genitive-indefinite-singular":"eructațiuni","dative-definite-genitive-singular":"eructațiunii","dative-genitive-indefinite-plural":"eructațiuni","dative-definite-genitive-plural":"eructațiunilor","singular-vocative":"eructațiune","plural-vocative":"eructațiunilor"}},{"word":"erudit","pos":"adj","definitions":["erudite"],"pronunciation":"/e.ruˈdit/","forms":{"feminine-singular":"erudită","masculine-plural":"erudiți","feminine-neuter-plural":"erudite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"erudit","error-unrecognized-form-feminine-indefinite-singular":"erudită","error-unrecognized-form-indefinite-masculine-plural":"erudiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"erudite","definite-error-unrecognized-form-masculine-neuter-singular":"eruditul","definite-error-unrecognized-form-feminine-singular":"erudita","definite-error-unrecognized-form-masculine-plural":"erudiții","definite-error-unrecognized-form-feminine-neuter-plural":"eruditele"}},{"word":"erudiție","pos":"noun","definitions":["erudition"],"forms":{"plural":"erudiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erudiție","accusative-definite-nominative-singular":"erudiția","accusative-indefinite-nominative-plural":"erudiții","accusative-definite-nominative-plural":"erudițiile","dative-genitive-indefinite-singular":"erudiții","dative-definite-genitive-singular":"erudiției","dative-genitive-indefinite-plural":"erudiții","dative-definite-genitive-plural":"erudițiilor","singular-vocative":"erudiție","plural-vocative":"erudițiilor"}},{"word":"eruditisim","pos":"adj","definitions":["very erudite"],"pronunciation":"/e.ru.diˈti.sim/","forms":{"feminine-singular":"eruditisimă","masculine-plural":"eruditisimi","feminine-neuter-plural":"eruditisime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eruditisim","error-unrecognized-form-feminine-indefinite-singular":"eruditisimă","error-unrecognized-form-indefinite-masculine-plural":"eruditisimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eruditisime","definite-error-unrecognized-form-masculine-neuter-singular":"eruditisimul","definite-error-unrecognized-form-feminine-singular":"eruditisima","definite-error-unrecognized-form-masculine-plural":"eruditisimii","definite-error-unrecognized-form-feminine-neuter-plural":"eruditisimele"}},{"word":"erudițiune","pos":"noun","definitions":["alternative form of erudiție"],"forms":{"plural":"erudițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erudițiune","accusative-definite-nominative-singular":"erudițiunea","accusative-indefinite-nominative-plural":"erudițiuni","accusative-definite-nominative-plural":"erudițiunile","dative-genitive-indefinite-singular":"erudițiuni","dative-definite-genitive-singular":"erudițiunii","dative-genitive-indefinite-plural":"erudițiuni","dative-definite-genitive-plural":"erudițiunilor","singular-vocative":"erudițiune","plural-vocative":"erudițiunilor"}},{"word":"erupe","pos":"verb","definitions":["to erupt"],"pronunciation":"/eˈru.pe/","forms":{"canonical":"a erupe 3rd conjugation","present-singular-third-person":"erupe","participle-past":"erupt","subjunctive-third-person":"erupă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-pt","infinitive":"a erupe","gerund":"erupând","first-person-indicative-present-singular":"erup","indicative-present-second-person-singular":"erupi","indicative-present-singular-third-person":"erupe","first-person-indicative-plural-present":"erupem","indicative-plural-present-second-person":"erupeți","indicative-plural-present-third-person":"erup","first-person-imperfect-indicative-singular":"erupeam","imperfect-indicative-second-person-singular":"erupeai","imperfect-indicative-singular-third-person":"erupea","first-person-imperfect-indicative-plural":"erupeam","imperfect-indicative-plural-second-person":"erupeați","imperfect-indicative-plural-third-person":"erupeau","first-person-indicative-perfect-singular":"erupsei","indicative-perfect-second-person-singular":"erupseși","indicative-perfect-singular-third-person":"erupse","first-person-indicative-perfect-plural":"erupserăm","indicative-perfect-plural-second-person":"erupserăți","indicative-perfect-plural-third-person":"erupseră","first-person-indicative-pluperfect-singular":"erupsesem","indicative-pluperfect-second-person-singular":"erupseseși","indicative-pluperfect-singular-third-person":"erupsese","first-person-indicative-pluperfect-plural":"erupseserăm","indicative-pluperfect-plural-second-person":"erupseserăți","indicative-pluperfect-plural-third-person":"erupseseră","first-person-present-singular-subjunctive":"să erup","present-second-person-singular-subjunctive":"să erupi","present-singular-subjunctive-third-person":"să erupă","first-person-plural-present-subjunctive":"să erupem","plural-present-second-person-subjunctive":"să erupeți","plural-present-subjunctive-third-person":"să erupă","imperative-second-person-singular":"erupe","imperative-plural-second-person":"erupeți","imperative-negative-second-person-singular":"nu erupe","imperative-negative-plural-second-person":"nu erupeți","alternative-obsolete":"erumpe"}},{"word":"erupere","pos":"noun","definitions":["eruption"],"forms":{"plural":"eruperi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erupere","accusative-definite-nominative-singular":"eruperea","accusative-indefinite-nominative-plural":"eruperi","accusative-definite-nominative-plural":"eruperile","dative-genitive-indefinite-singular":"eruperi","dative-definite-genitive-singular":"eruperii","dative-genitive-indefinite-plural":"eruperi","dative-definite-genitive-plural":"eruperilor","singular-vocative":"erupere","plural-vocative":"eruperilor"}},{"word":"erupție","pos":"noun","definitions":["eruption"],"forms":{"plural":"erupții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"erupție","accusative-definite-nominative-singular":"erupția","accusative-indefinite-nominative-plural":"erupții","accusative-definite-nominative-plural":"erupțiile","dative-genitive-indefinite-singular":"erupții","dative-definite-genitive-singular":"erupției","dative-genitive-indefinite-plural":"erupții","dative-definite-genitive-plural":"erupțiilor","singular-vocative":"erupție","plural-vocative":"erupțiilor"}},{"word":"erupțiune","pos":"noun","definitions":["alternative form of erupție"],"forms":{"plural":"erupțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"erupțiune","accusative-definite-nominative-singular":"erupțiunea","accusative-indefinite-nominative-plural":"erupțiuni","accusative-definite-nominative-plural":"erupțiunile","dative-genitive-indefinite-singular":"erupțiuni","dative-definite-genitive-singular":"erupțiunii","dative-genitive-indefinite-plural":"erupțiuni","dative-definite-genitive-plural":"erupțiunilor","singular-vocative":"erupțiune","plural-vocative":"erupțiunilor"}},{"word":"eruptiv","pos":"adj","definitions":["eruptive"],"forms":{"feminine-singular":"eruptivă","masculine-plural":"eruptivi","feminine-neuter-plural":"eruptive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eruptiv","error-unrecognized-form-feminine-indefinite-singular":"eruptivă","error-unrecognized-form-indefinite-masculine-plural":"eruptivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eruptive","definite-error-unrecognized-form-masculine-neuter-singular":"eruptivul","definite-error-unrecognized-form-feminine-singular":"eruptiva","definite-error-unrecognized-form-masculine-plural":"eruptivii","definite-error-unrecognized-form-feminine-neuter-plural":"eruptivele"}},{"word":"eruptivism","pos":"noun","definitions":["eruptivism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eruptivism","accusative-definite-nominative-singular":"eruptivismul","accusative-indefinite-nominative-plural":"eruptivisme","accusative-definite-nominative-plural":"eruptivismele","dative-genitive-indefinite-singular":"eruptivism","dative-definite-genitive-singular":"eruptivismului","dative-genitive-indefinite-plural":"eruptivisme","dative-definite-genitive-plural":"eruptivismelor","singular-vocative":"eruptivismule","plural-vocative":"eruptivismelor"}},{"word":"erzaț","pos":"noun","definitions":["ersatz, replacement, substitute"],"pronunciation":"/erˈzat͡s/","forms":{"plural":"erzațuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"erzaț","accusative-definite-nominative-singular":"erzațul","accusative-indefinite-nominative-plural":"erzațuri","accusative-definite-nominative-plural":"erzațurile","dative-genitive-indefinite-singular":"erzaț","dative-definite-genitive-singular":"erzațului","dative-genitive-indefinite-plural":"erzațuri","dative-definite-genitive-plural":"erzațurilor","singular-vocative":"erzațule","plural-vocative":"erzațurilor"}},{"word":"eșafod","pos":"noun","definitions":["scaffold (execution platform)"],"pronunciation":"/e.ʃaˈfod/","forms":{"literary-plural":"eșafoduri","plural-variant":"eșafoade","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eșafod","accusative-definite-nominative-singular":"eșafodul","accusative-indefinite-nominative-plural":"eșafoduri","accusative-definite-nominative-plural":"eșafodurile","dative-genitive-indefinite-singular":"eșafod","dative-definite-genitive-singular":"eșafodului","dative-genitive-indefinite-plural":"eșafoduri","dative-definite-genitive-plural":"eșafodurilor","singular-vocative":"eșafodule","plural-vocative":"eșafodurilor"}},{"word":"eșafodaj","pos":"noun","definitions":["scaffolding"],"forms":{"plural":"eșafodaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșafodaj","accusative-definite-nominative-singular":"eșafodajul","accusative-indefinite-nominative-plural":"eșafodaje","accusative-definite-nominative-plural":"eșafodajele","dative-genitive-indefinite-singular":"eșafodaj","dative-definite-genitive-singular":"eșafodajului","dative-genitive-indefinite-plural":"eșafodaje","dative-definite-genitive-plural":"eșafodajelor","singular-vocative":"eșafodajule","plural-vocative":"eșafodajelor"}},{"word":"eșafoduri","pos":"noun","definitions":["plural of eșafod"]},{"word":"esagerațiune","pos":"noun","definitions":["obsolete form of exagerație"],"forms":{"plural":"esagerațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esagerațiune","accusative-definite-nominative-singular":"esagerațiunea","accusative-indefinite-nominative-plural":"esagerațiuni","accusative-definite-nominative-plural":"esagerațiunile","dative-genitive-indefinite-singular":"esagerațiuni","dative-definite-genitive-singular":"esagerațiunii","dative-genitive-indefinite-plural":"esagerațiuni","dative-definite-genitive-plural":"esagerațiunilor","singular-vocative":"esagerațiune","plural-vocative":"esagerațiunilor"}},{"word":"eșalon","pos":"noun","definitions":["echelon"],"forms":{"plural":"eșaloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșalon","accusative-definite-nominative-singular":"eșalonul","accusative-indefinite-nominative-plural":"eșaloane","accusative-definite-nominative-plural":"eșaloanele","dative-genitive-indefinite-singular":"eșalon","dative-definite-genitive-singular":"eșalonului","dative-genitive-indefinite-plural":"eșaloane","dative-definite-genitive-plural":"eșaloanelor","singular-vocative":"eșalonule","plural-vocative":"eșaloanelor"}},{"word":"eșalona","pos":"verb","definitions":["to echelon"],"forms":{"canonical":"a eșalona 1st conjugation","present-singular-third-person":"eșalonează","participle-past":"eșalonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eșalona","gerund":"eșalonând","first-person-indicative-present-singular":"eșalonez","indicative-present-second-person-singular":"eșalonezi","indicative-present-singular-third-person":"eșalonează","first-person-indicative-plural-present":"eșalonăm","indicative-plural-present-second-person":"eșalonați","indicative-plural-present-third-person":"eșalonează","first-person-imperfect-indicative-singular":"eșalonam","imperfect-indicative-second-person-singular":"eșalonai","imperfect-indicative-singular-third-person":"eșalona","first-person-imperfect-indicative-plural":"eșalonam","imperfect-indicative-plural-second-person":"eșalonați","imperfect-indicative-plural-third-person":"eșalonau","first-person-indicative-perfect-singular":"eșalonai","indicative-perfect-second-person-singular":"eșalonași","indicative-perfect-singular-third-person":"eșalonă","first-person-indicative-perfect-plural":"eșalonarăm","indicative-perfect-plural-second-person":"eșalonarăți","indicative-perfect-plural-third-person":"eșalonară","first-person-indicative-pluperfect-singular":"eșalonasem","indicative-pluperfect-second-person-singular":"eșalonaseși","indicative-pluperfect-singular-third-person":"eșalonase","first-person-indicative-pluperfect-plural":"eșalonaserăm","indicative-pluperfect-plural-second-person":"eșalonaserăți","indicative-pluperfect-plural-third-person":"eșalonaseră","first-person-present-singular-subjunctive":"să eșalonez","present-second-person-singular-subjunctive":"să eșalonezi","present-singular-subjunctive-third-person":"să eșaloneze","first-person-plural-present-subjunctive":"să eșalonăm","plural-present-second-person-subjunctive":"să eșalonați","plural-present-subjunctive-third-person":"să eșaloneze","imperative-second-person-singular":"eșalonează","imperative-plural-second-person":"eșalonați","imperative-negative-second-person-singular":"nu eșalona","imperative-negative-plural-second-person":"nu eșalonați"}},{"word":"eșalonare","pos":"noun","definitions":["scheduling"],"forms":{"plural":"eșalonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eșalonare","accusative-definite-nominative-singular":"eșalonarea","accusative-indefinite-nominative-plural":"eșalonări","accusative-definite-nominative-plural":"eșalonările","dative-genitive-indefinite-singular":"eșalonări","dative-definite-genitive-singular":"eșalonării","dative-genitive-indefinite-plural":"eșalonări","dative-definite-genitive-plural":"eșalonărilor","singular-vocative":"eșalonare","plural-vocative":"eșalonărilor"}},{"word":"eșalonat","pos":"adj","definitions":["scheduled"],"forms":{"feminine-singular":"eșalonată","masculine-plural":"eșalonați","feminine-neuter-plural":"eșalonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eșalonat","error-unrecognized-form-feminine-indefinite-singular":"eșalonată","error-unrecognized-form-indefinite-masculine-plural":"eșalonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eșalonate","definite-error-unrecognized-form-masculine-neuter-singular":"eșalonatul","definite-error-unrecognized-form-feminine-singular":"eșalonata","definite-error-unrecognized-form-masculine-plural":"eșalonații","definite-error-unrecognized-form-feminine-neuter-plural":"eșalonatele"}},{"word":"eșalonat","pos":"verb","definitions":["past participle of eșalona"],"forms":{"participle-past":"of eșalona"}},{"word":"esăltăciune","pos":"noun","definitions":["obsolete form of exaltație"],"forms":{"plural":"esăltăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esăltăciune","accusative-definite-nominative-singular":"esăltăciunea","accusative-indefinite-nominative-plural":"esăltăciuni","accusative-definite-nominative-plural":"esăltăciunile","dative-genitive-indefinite-singular":"esăltăciuni","dative-definite-genitive-singular":"esăltăciunii","dative-genitive-indefinite-plural":"esăltăciuni","dative-definite-genitive-plural":"esăltăciunilor","singular-vocative":"esăltăciune","plural-vocative":"esăltăciunilor"}},{"word":"esaltațiune","pos":"noun","definitions":["obsolete form of exaltație"],"forms":{"plural":"esaltațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esaltațiune","accusative-definite-nominative-singular":"esaltațiunea","accusative-indefinite-nominative-plural":"esaltațiuni","accusative-definite-nominative-plural":"esaltațiunile","dative-genitive-indefinite-singular":"esaltațiuni","dative-definite-genitive-singular":"esaltațiunii","dative-genitive-indefinite-plural":"esaltațiuni","dative-definite-genitive-plural":"esaltațiunilor","singular-vocative":"esaltațiune","plural-vocative":"esaltațiunilor"}},{"word":"esamen","pos":"noun","definitions":["obsolete form of examen"],"forms":{"plural":"esamene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esamen","accusative-definite-nominative-singular":"esamenul","accusative-indefinite-nominative-plural":"esamene","accusative-definite-nominative-plural":"esamenele","dative-genitive-indefinite-singular":"esamen","dative-definite-genitive-singular":"esamenului","dative-genitive-indefinite-plural":"esamene","dative-definite-genitive-plural":"esamenelor","singular-vocative":"esamenule","plural-vocative":"esamenelor"}},{"word":"esaminator","pos":"adj","definitions":["obsolete form of examinator"],"forms":{"feminine-singular":"esaminatoare","masculine-plural":"esaminatori","feminine-neuter-plural":"esaminatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esaminator","error-unrecognized-form-feminine-indefinite-singular":"esaminatoare","error-unrecognized-form-indefinite-masculine-plural":"esaminatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"esaminatoare","definite-error-unrecognized-form-masculine-neuter-singular":"esaminatorul","definite-error-unrecognized-form-feminine-singular":"esaminatoarea","definite-error-unrecognized-form-masculine-plural":"esaminatorii","definite-error-unrecognized-form-feminine-neuter-plural":"esaminatoarele"}},{"word":"Eșanca","pos":"name","definitions":["a village in Darabani, Botoșani County, Romania"],"gender":"f"},{"word":"eșantion","pos":"noun","definitions":["sample"],"forms":{"plural":"eșantioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșantion","accusative-definite-nominative-singular":"eșantionul","accusative-indefinite-nominative-plural":"eșantione","accusative-definite-nominative-plural":"eșantionele","dative-genitive-indefinite-singular":"eșantion","dative-definite-genitive-singular":"eșantionului","dative-genitive-indefinite-plural":"eșantione","dative-definite-genitive-plural":"eșantionelor","singular-vocative":"eșantionule","plural-vocative":"eșantionelor"}},{"word":"eșantiona","pos":"verb","definitions":["to sample"],"forms":{"canonical":"a eșantiona 1st conjugation","present-singular-third-person":"eșantionează","participle-past":"eșantionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eșantiona","gerund":"eșantionând","first-person-indicative-present-singular":"eșantionez","indicative-present-second-person-singular":"eșantionezi","indicative-present-singular-third-person":"eșantionează","first-person-indicative-plural-present":"eșantionăm","indicative-plural-present-second-person":"eșantionați","indicative-plural-present-third-person":"eșantionează","first-person-imperfect-indicative-singular":"eșantionam","imperfect-indicative-second-person-singular":"eșantionai","imperfect-indicative-singular-third-person":"eșantiona","first-person-imperfect-indicative-plural":"eșantionam","imperfect-indicative-plural-second-person":"eșantionați","imperfect-indicative-plural-third-person":"eșantionau","first-person-indicative-perfect-singular":"eșantionai","indicative-perfect-second-person-singular":"eșantionași","indicative-perfect-singular-third-person":"eșantionă","first-person-indicative-perfect-plural":"eșantionarăm","indicative-perfect-plural-second-person":"eșantionarăți","indicative-perfect-plural-third-person":"eșantionară","first-person-indicative-pluperfect-singular":"eșantionasem","indicative-pluperfect-second-person-singular":"eșantionaseși","indicative-pluperfect-singular-third-person":"eșantionase","first-person-indicative-pluperfect-plural":"eșantionaserăm","indicative-pluperfect-plural-second-person":"eșantionaserăți","indicative-pluperfect-plural-third-person":"eșantionaseră","first-person-present-singular-subjunctive":"să eșantionez","present-second-person-singular-subjunctive":"să eșantionezi","present-singular-subjunctive-third-person":"să eșantioneze","first-person-plural-present-subjunctive":"să eșantionăm","plural-present-second-person-subjunctive":"să eșantionați","plural-present-subjunctive-third-person":"să eșantioneze","imperative-second-person-singular":"eșantionează","imperative-plural-second-person":"eșantionați","imperative-negative-second-person-singular":"nu eșantiona","imperative-negative-plural-second-person":"nu eșantionați"}},{"word":"eșantionaj","pos":"noun","definitions":["sampling"],"forms":{"plural":"eșantionaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșantionaj","accusative-definite-nominative-singular":"eșantionajul","accusative-indefinite-nominative-plural":"eșantionaje","accusative-definite-nominative-plural":"eșantionajele","dative-genitive-indefinite-singular":"eșantionaj","dative-definite-genitive-singular":"eșantionajului","dative-genitive-indefinite-plural":"eșantionaje","dative-definite-genitive-plural":"eșantionajelor","singular-vocative":"eșantionajule","plural-vocative":"eșantionajelor"}},{"word":"eșantionare","pos":"noun","definitions":["sampling"],"forms":{"plural":"eșantionări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eșantionare","accusative-definite-nominative-singular":"eșantionarea","accusative-indefinite-nominative-plural":"eșantionări","accusative-definite-nominative-plural":"eșantionările","dative-genitive-indefinite-singular":"eșantionări","dative-definite-genitive-singular":"eșantionării","dative-genitive-indefinite-plural":"eșantionări","dative-definite-genitive-plural":"eșantionărilor","singular-vocative":"eșantionare","plural-vocative":"eșantionărilor"}},{"word":"eșantionat","pos":"adj","definitions":["sampled"],"forms":{"feminine-singular":"eșantionată","masculine-plural":"eșantionați","feminine-neuter-plural":"eșantionate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eșantionat","error-unrecognized-form-feminine-indefinite-singular":"eșantionată","error-unrecognized-form-indefinite-masculine-plural":"eșantionați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eșantionate","definite-error-unrecognized-form-masculine-neuter-singular":"eșantionatul","definite-error-unrecognized-form-feminine-singular":"eșantionata","definite-error-unrecognized-form-masculine-plural":"eșantionații","definite-error-unrecognized-form-feminine-neuter-plural":"eșantionatele"}},{"word":"Eșanu","pos":"name","definitions":["a surname"]},{"word":"eșapament","pos":"noun","definitions":["exhaust"],"forms":{"plural":"eșapamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșapament","accusative-definite-nominative-singular":"eșapamentul","accusative-indefinite-nominative-plural":"eșapamente","accusative-definite-nominative-plural":"eșapamentele","dative-genitive-indefinite-singular":"eșapament","dative-definite-genitive-singular":"eșapamentului","dative-genitive-indefinite-plural":"eșapamente","dative-definite-genitive-plural":"eșapamentelor","singular-vocative":"eșapamentule","plural-vocative":"eșapamentelor"}},{"word":"eșarfă","pos":"noun","definitions":["scarf"],"pronunciation":"/eˈʃar.fə/","forms":{"plural":"eșarfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eșarfă","accusative-definite-nominative-singular":"eșarfa","accusative-indefinite-nominative-plural":"eșarfe","accusative-definite-nominative-plural":"eșarfele","dative-genitive-indefinite-singular":"eșarfe","dative-definite-genitive-singular":"eșarfei","dative-genitive-indefinite-plural":"eșarfe","dative-definite-genitive-plural":"eșarfelor","singular-vocative":"eșarfă","plural-vocative":"eșarfelor","alternative":"eșarpă"}},{"word":"eșarpă","pos":"noun","definitions":["alternative form of eșarfă"],"forms":{"plural":"eșarpe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eșarpă","accusative-definite-nominative-singular":"eșarpa","accusative-indefinite-nominative-plural":"eșarpe","accusative-definite-nominative-plural":"eșarpele","dative-genitive-indefinite-singular":"eșarpe","dative-definite-genitive-singular":"eșarpei","dative-genitive-indefinite-plural":"eșarpe","dative-definite-genitive-plural":"eșarpelor","singular-vocative":"eșarpă","plural-vocative":"eșarpelor"}},{"word":"escadră","pos":"noun","definitions":["squadron, wing"],"forms":{"plural":"escadre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escadră","accusative-definite-nominative-singular":"escadra","accusative-indefinite-nominative-plural":"escadre","accusative-definite-nominative-plural":"escadrele","dative-genitive-indefinite-singular":"escadre","dative-definite-genitive-singular":"escadrei","dative-genitive-indefinite-plural":"escadre","dative-definite-genitive-plural":"escadrelor","singular-vocative":"escadră","plural-vocative":"escadrelor"}},{"word":"escadrilă","pos":"noun","definitions":["squadron"],"forms":{"plural":"escadrile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escadrilă","accusative-definite-nominative-singular":"escadrila","accusative-indefinite-nominative-plural":"escadrile","accusative-definite-nominative-plural":"escadrilele","dative-genitive-indefinite-singular":"escadrile","dative-definite-genitive-singular":"escadrilei","dative-genitive-indefinite-plural":"escadrile","dative-definite-genitive-plural":"escadrilelor","singular-vocative":"escadrilă","plural-vocative":"escadrilelor"}},{"word":"escadron","pos":"noun","definitions":["squadron"],"forms":{"plural":"escadroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escadron","accusative-definite-nominative-singular":"escadronul","accusative-indefinite-nominative-plural":"escadroane","accusative-definite-nominative-plural":"escadroanele","dative-genitive-indefinite-singular":"escadron","dative-definite-genitive-singular":"escadronului","dative-genitive-indefinite-plural":"escadroane","dative-definite-genitive-plural":"escadroanelor","singular-vocative":"escadronule","plural-vocative":"escadroanelor"}},{"word":"escală","pos":"noun","definitions":["stopover, port of call"],"forms":{"plural":"escale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escală","accusative-definite-nominative-singular":"escala","accusative-indefinite-nominative-plural":"escale","accusative-definite-nominative-plural":"escalele","dative-genitive-indefinite-singular":"escale","dative-definite-genitive-singular":"escalei","dative-genitive-indefinite-plural":"escale","dative-definite-genitive-plural":"escalelor","singular-vocative":"escală","plural-vocative":"escalelor"}},{"word":"escalada","pos":"verb","definitions":["to climb"],"forms":{"canonical":"a escalada 1st conjugation","present-singular-third-person":"escaladează","participle-past":"escaladat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a escalada","gerund":"escaladând","first-person-indicative-present-singular":"escaladez","indicative-present-second-person-singular":"escaladezi","indicative-present-singular-third-person":"escaladează","first-person-indicative-plural-present":"escaladăm","indicative-plural-present-second-person":"escaladați","indicative-plural-present-third-person":"escaladează","first-person-imperfect-indicative-singular":"escaladam","imperfect-indicative-second-person-singular":"escaladai","imperfect-indicative-singular-third-person":"escalada","first-person-imperfect-indicative-plural":"escaladam","imperfect-indicative-plural-second-person":"escaladați","imperfect-indicative-plural-third-person":"escaladau","first-person-indicative-perfect-singular":"escaladai","indicative-perfect-second-person-singular":"escaladași","indicative-perfect-singular-third-person":"escaladă","first-person-indicative-perfect-plural":"escaladarăm","indicative-perfect-plural-second-person":"escaladarăți","indicative-perfect-plural-third-person":"escaladară","first-person-indicative-pluperfect-singular":"escaladasem","indicative-pluperfect-second-person-singular":"escaladaseși","indicative-pluperfect-singular-third-person":"escaladase","first-person-indicative-pluperfect-plural":"escaladaserăm","indicative-pluperfect-plural-second-person":"escaladaserăți","indicative-pluperfect-plural-third-person":"escaladaseră","first-person-present-singular-subjunctive":"să escaladez","present-second-person-singular-subjunctive":"să escaladezi","present-singular-subjunctive-third-person":"să escaladeze","first-person-plural-present-subjunctive":"să escaladăm","plural-present-second-person-subjunctive":"să escaladați","plural-present-subjunctive-third-person":"să escaladeze","imperative-second-person-singular":"escaladează","imperative-plural-second-person":"escaladați","imperative-negative-second-person-singular":"nu escalada","imperative-negative-plural-second-person":"nu escaladați"}},{"word":"escaladă","pos":"noun","definitions":["climbing"],"forms":{"plural":"escalade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escaladă","accusative-definite-nominative-singular":"escalada","accusative-indefinite-nominative-plural":"escalade","accusative-definite-nominative-plural":"escaladele","dative-genitive-indefinite-singular":"escalade","dative-definite-genitive-singular":"escaladei","dative-genitive-indefinite-plural":"escalade","dative-definite-genitive-plural":"escaladelor","singular-vocative":"escaladă","plural-vocative":"escaladelor"}},{"word":"escaladare","pos":"noun","definitions":["climbing"],"forms":{"plural":"escaladări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escaladare","accusative-definite-nominative-singular":"escaladarea","accusative-indefinite-nominative-plural":"escaladări","accusative-definite-nominative-plural":"escaladările","dative-genitive-indefinite-singular":"escaladări","dative-definite-genitive-singular":"escaladării","dative-genitive-indefinite-plural":"escaladări","dative-definite-genitive-plural":"escaladărilor","singular-vocative":"escaladare","plural-vocative":"escaladărilor"}},{"word":"escalator","pos":"noun","definitions":["escalator"],"forms":{"plural":"escalatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escalator","accusative-definite-nominative-singular":"escalatorul","accusative-indefinite-nominative-plural":"escalatoare","accusative-definite-nominative-plural":"escalatoarele","dative-genitive-indefinite-singular":"escalator","dative-definite-genitive-singular":"escalatorului","dative-genitive-indefinite-plural":"escalatoare","dative-definite-genitive-plural":"escalatoarelor","singular-vocative":"escalatorule","plural-vocative":"escalatoarelor"}},{"word":"escalop","pos":"noun","definitions":["escalope"],"forms":{"plural":"escalopuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"escalop","accusative-definite-nominative-singular":"escalopul","accusative-indefinite-nominative-plural":"escalopuri","accusative-definite-nominative-plural":"escalopurile","dative-genitive-indefinite-singular":"escalop","dative-definite-genitive-singular":"escalopului","dative-genitive-indefinite-plural":"escalopuri","dative-definite-genitive-plural":"escalopurilor","singular-vocative":"escalopule","plural-vocative":"escalopurilor"}},{"word":"escamota","pos":"verb","definitions":["to conjure away, to make disappear"],"forms":{"canonical":"a escamota 1st conjugation","present-singular-third-person":"escamotează","participle-past":"escamotat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a escamota","gerund":"escamotând","first-person-indicative-present-singular":"escamotez","indicative-present-second-person-singular":"escamotezi","indicative-present-singular-third-person":"escamotează","first-person-indicative-plural-present":"escamotăm","indicative-plural-present-second-person":"escamotați","indicative-plural-present-third-person":"escamotează","first-person-imperfect-indicative-singular":"escamotam","imperfect-indicative-second-person-singular":"escamotai","imperfect-indicative-singular-third-person":"escamota","first-person-imperfect-indicative-plural":"escamotam","imperfect-indicative-plural-second-person":"escamotați","imperfect-indicative-plural-third-person":"escamotau","first-person-indicative-perfect-singular":"escamotai","indicative-perfect-second-person-singular":"escamotași","indicative-perfect-singular-third-person":"escamotă","first-person-indicative-perfect-plural":"escamotarăm","indicative-perfect-plural-second-person":"escamotarăți","indicative-perfect-plural-third-person":"escamotară","first-person-indicative-pluperfect-singular":"escamotasem","indicative-pluperfect-second-person-singular":"escamotaseși","indicative-pluperfect-singular-third-person":"escamotase","first-person-indicative-pluperfect-plural":"escamotaserăm","indicative-pluperfect-plural-second-person":"escamotaserăți","indicative-pluperfect-plural-third-person":"escamotaseră","first-person-present-singular-subjunctive":"să escamotez","present-second-person-singular-subjunctive":"să escamotezi","present-singular-subjunctive-third-person":"să escamoteze","first-person-plural-present-subjunctive":"să escamotăm","plural-present-second-person-subjunctive":"să escamotați","plural-present-subjunctive-third-person":"să escamoteze","imperative-second-person-singular":"escamotează","imperative-plural-second-person":"escamotați","imperative-negative-second-person-singular":"nu escamota","imperative-negative-plural-second-person":"nu escamotați"}},{"word":"escamotabil","pos":"adj","definitions":["retractable"],"forms":{"feminine-singular":"escamotabilă","masculine-plural":"escamotabili","feminine-neuter-plural":"escamotabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escamotabil","error-unrecognized-form-feminine-indefinite-singular":"escamotabilă","error-unrecognized-form-indefinite-masculine-plural":"escamotabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"escamotabile","definite-error-unrecognized-form-masculine-neuter-singular":"escamotabilul","definite-error-unrecognized-form-feminine-singular":"escamotabila","definite-error-unrecognized-form-masculine-plural":"escamotabilii","definite-error-unrecognized-form-feminine-neuter-plural":"escamotabilele"}},{"word":"escamotare","pos":"noun","definitions":["making an object disappear as a magic trick"],"forms":{"plural":"escamotări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escamotare","accusative-definite-nominative-singular":"escamotarea","accusative-indefinite-nominative-plural":"escamotări","accusative-definite-nominative-plural":"escamotările","dative-genitive-indefinite-singular":"escamotări","dative-definite-genitive-singular":"escamotării","dative-genitive-indefinite-plural":"escamotări","dative-definite-genitive-plural":"escamotărilor","singular-vocative":"escamotare","plural-vocative":"escamotărilor"}},{"word":"escapadă","pos":"noun","definitions":["escapade"],"forms":{"plural":"escapade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escapadă","accusative-definite-nominative-singular":"escapada","accusative-indefinite-nominative-plural":"escapade","accusative-definite-nominative-plural":"escapadele","dative-genitive-indefinite-singular":"escapade","dative-definite-genitive-singular":"escapadei","dative-genitive-indefinite-plural":"escapade","dative-definite-genitive-plural":"escapadelor","singular-vocative":"escapadă","plural-vocative":"escapadelor"}},{"word":"escapism","pos":"noun","definitions":["escapism"],"forms":{"plural":"escapisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escapism","accusative-definite-nominative-singular":"escapismul","accusative-indefinite-nominative-plural":"escapisme","accusative-definite-nominative-plural":"escapismele","dative-genitive-indefinite-singular":"escapism","dative-definite-genitive-singular":"escapismului","dative-genitive-indefinite-plural":"escapisme","dative-definite-genitive-plural":"escapismelor","singular-vocative":"escapismule","plural-vocative":"escapismelor"}},{"word":"escapist","pos":"adj","definitions":["escapist"],"forms":{"feminine-singular":"escapistă","masculine-plural":"escapiști","feminine-neuter-plural":"escapiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escapist","error-unrecognized-form-feminine-indefinite-singular":"escapistă","error-unrecognized-form-indefinite-masculine-plural":"escapiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"escapiste","definite-error-unrecognized-form-masculine-neuter-singular":"escapistul","definite-error-unrecognized-form-feminine-singular":"escapista","definite-error-unrecognized-form-masculine-plural":"escapiștii","definite-error-unrecognized-form-feminine-neuter-plural":"escapistele"}},{"word":"escară","pos":"noun","definitions":["eschar"],"forms":{"plural":"escare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escară","accusative-definite-nominative-singular":"escara","accusative-indefinite-nominative-plural":"escare","accusative-definite-nominative-plural":"escarele","dative-genitive-indefinite-singular":"escare","dative-definite-genitive-singular":"escarei","dative-genitive-indefinite-plural":"escare","dative-definite-genitive-plural":"escarelor","singular-vocative":"escară","plural-vocative":"escarelor"}},{"word":"escarmușă","pos":"noun","definitions":["skirmish; dispute"],"forms":{"plural":"escarmușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escarmușă","accusative-definite-nominative-singular":"escarmușăul","accusative-indefinite-nominative-plural":"escarmușe","accusative-definite-nominative-plural":"escarmușele","dative-genitive-indefinite-singular":"escarmușă","dative-definite-genitive-singular":"escarmușăului","dative-genitive-indefinite-plural":"escarmușe","dative-definite-genitive-plural":"escarmușelor","singular-vocative":"escarmușăule","plural-vocative":"escarmușelor"}},{"word":"escarotic","pos":"adj","definitions":["escharotic"],"forms":{"feminine-singular":"escarotică","masculine-plural":"escarotici","feminine-neuter-plural":"escarotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escarotic","error-unrecognized-form-feminine-indefinite-singular":"escarotică","error-unrecognized-form-indefinite-masculine-plural":"escarotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"escarotice","definite-error-unrecognized-form-masculine-neuter-singular":"escaroticul","definite-error-unrecognized-form-feminine-singular":"escarotica","definite-error-unrecognized-form-masculine-plural":"escaroticii","definite-error-unrecognized-form-feminine-neuter-plural":"escaroticele"}},{"word":"escarpă","pos":"noun","definitions":["escarp"],"forms":{"plural":"escarpe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escarpă","accusative-definite-nominative-singular":"escarpa","accusative-indefinite-nominative-plural":"escarpe","accusative-definite-nominative-plural":"escarpele","dative-genitive-indefinite-singular":"escarpe","dative-definite-genitive-singular":"escarpei","dative-genitive-indefinite-plural":"escarpe","dative-definite-genitive-plural":"escarpelor","singular-vocative":"escarpă","plural-vocative":"escarpelor"}},{"word":"escarpen","pos":"noun","definitions":["high-heeled woman's shoe"],"forms":{"plural":"escarpeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"escarpen","accusative-definite-nominative-singular":"escarpenul","accusative-indefinite-nominative-plural":"escarpeni","accusative-definite-nominative-plural":"escarpenii","dative-genitive-indefinite-singular":"escarpen","dative-definite-genitive-singular":"escarpenului","dative-genitive-indefinite-plural":"escarpeni","dative-definite-genitive-plural":"escarpenilor","singular-vocative":"escarpenule","plural-vocative":"escarpenilor"}},{"word":"escatologic","pos":"adj","definitions":["eschatological"],"forms":{"feminine-singular":"escatologică","masculine-plural":"escatologici","feminine-neuter-plural":"escatologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escatologic","error-unrecognized-form-feminine-indefinite-singular":"escatologică","error-unrecognized-form-indefinite-masculine-plural":"escatologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"escatologice","definite-error-unrecognized-form-masculine-neuter-singular":"escatologicul","definite-error-unrecognized-form-feminine-singular":"escatologica","definite-error-unrecognized-form-masculine-plural":"escatologicii","definite-error-unrecognized-form-feminine-neuter-plural":"escatologicele"}},{"word":"escatologie","pos":"noun","definitions":["eschatology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"escatologie","accusative-definite-nominative":"escatologia","dative-genitive-indefinite":"escatologii","dative-definite-genitive":"escatologiei","vocative":"escatologie"}},{"word":"escavator","pos":"noun","definitions":["alternative form of excavator"],"forms":{"plural":"escavatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escavator","accusative-definite-nominative-singular":"escavatorul","accusative-indefinite-nominative-plural":"escavatoare","accusative-definite-nominative-plural":"escavatoarele","dative-genitive-indefinite-singular":"escavator","dative-definite-genitive-singular":"escavatorului","dative-genitive-indefinite-plural":"escavatoare","dative-definite-genitive-plural":"escavatoarelor","singular-vocative":"escavatorule","plural-vocative":"escavatoarelor"}},{"word":"escelență","pos":"noun","definitions":["obsolete form of excelență"],"forms":{"plural":"escelențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escelență","accusative-definite-nominative-singular":"escelența","accusative-indefinite-nominative-plural":"escelențe","accusative-definite-nominative-plural":"escelențele","dative-genitive-indefinite-singular":"escelențe","dative-definite-genitive-singular":"escelenței","dative-genitive-indefinite-plural":"escelențe","dative-definite-genitive-plural":"escelențelor","singular-vocative":"escelență","plural-vocative":"escelențelor"}},{"word":"escelință","pos":"noun","definitions":["obsolete form of excelență"],"forms":{"plural":"escelințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escelință","accusative-definite-nominative-singular":"escelința","accusative-indefinite-nominative-plural":"escelințe","accusative-definite-nominative-plural":"escelințele","dative-genitive-indefinite-singular":"escelințe","dative-definite-genitive-singular":"escelinței","dative-genitive-indefinite-plural":"escelințe","dative-definite-genitive-plural":"escelințelor","singular-vocative":"escelință","plural-vocative":"escelințelor"}},{"word":"escepsiune","pos":"noun","definitions":["obsolete form of excepție"],"forms":{"plural":"escepsiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escepsiune","accusative-definite-nominative-singular":"escepsiunea","accusative-indefinite-nominative-plural":"escepsiuni","accusative-definite-nominative-plural":"escepsiunile","dative-genitive-indefinite-singular":"escepsiuni","dative-definite-genitive-singular":"escepsiunii","dative-genitive-indefinite-plural":"escepsiuni","dative-definite-genitive-plural":"escepsiunilor","singular-vocative":"escepsiune","plural-vocative":"escepsiunilor"}},{"word":"escepție","pos":"noun","definitions":["obsolete form of excepție"],"forms":{"plural":"escepții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"escepție","accusative-definite-nominative-singular":"escepția","accusative-indefinite-nominative-plural":"escepții","accusative-definite-nominative-plural":"escepțiile","dative-genitive-indefinite-singular":"escepții","dative-definite-genitive-singular":"escepției","dative-genitive-indefinite-plural":"escepții","dative-definite-genitive-plural":"escepțiilor","singular-vocative":"escepție","plural-vocative":"escepțiilor"}},{"word":"escepțiune","pos":"noun","definitions":["obsolete form of excepție"],"forms":{"plural":"escepțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escepțiune","accusative-definite-nominative-singular":"escepțiunea","accusative-indefinite-nominative-plural":"escepțiuni","accusative-definite-nominative-plural":"escepțiunile","dative-genitive-indefinite-singular":"escepțiuni","dative-definite-genitive-singular":"escepțiunii","dative-genitive-indefinite-plural":"escepțiuni","dative-definite-genitive-plural":"escepțiunilor","singular-vocative":"escepțiune","plural-vocative":"escepțiunilor"}},{"word":"esces","pos":"noun","definitions":["obsolete form of exces"],"forms":{"plural":"escesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"esces","accusative-definite-nominative-singular":"escesul","accusative-indefinite-nominative-plural":"escesuri","accusative-definite-nominative-plural":"escesurile","dative-genitive-indefinite-singular":"esces","dative-definite-genitive-singular":"escesului","dative-genitive-indefinite-plural":"escesuri","dative-definite-genitive-plural":"escesurilor","singular-vocative":"escesule","plural-vocative":"escesurilor"}},{"word":"Eschibaba","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Stejaru."],"gender":"m"},{"word":"eschilă","pos":"noun","definitions":["bone splinter"],"forms":{"plural":"eschile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eschilă","accusative-definite-nominative-singular":"eschila","accusative-indefinite-nominative-plural":"eschile","accusative-definite-nominative-plural":"eschilele","dative-genitive-indefinite-singular":"eschile","dative-definite-genitive-singular":"eschilei","dative-genitive-indefinite-plural":"eschile","dative-definite-genitive-plural":"eschilelor","singular-vocative":"eschilă","plural-vocative":"eschilelor"}},{"word":"eschimoasă","pos":"noun","definitions":["female equivalent of eschimos"],"forms":{"plural":"eschimoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eschimoasă","accusative-definite-nominative-singular":"eschimoasa","accusative-indefinite-nominative-plural":"eschimoase","accusative-definite-nominative-plural":"eschimoasele","dative-genitive-indefinite-singular":"eschimoase","dative-definite-genitive-singular":"eschimoasei","dative-genitive-indefinite-plural":"eschimoase","dative-definite-genitive-plural":"eschimoaselor","singular-vocative":"eschimoasă","plural-vocative":"eschimoaselor"}},{"word":"eschimos","pos":"noun","definitions":["Eskimo"],"forms":{"plural":"eschimoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eschimos","accusative-definite-nominative-singular":"eschimosul","accusative-indefinite-nominative-plural":"eschimoși","accusative-definite-nominative-plural":"eschimoșii","dative-genitive-indefinite-singular":"eschimos","dative-definite-genitive-singular":"eschimosului","dative-genitive-indefinite-plural":"eschimoși","dative-definite-genitive-plural":"eschimoșilor","singular-vocative":"eschimosule","plural-vocative":"eschimoșilor"}},{"word":"eschimosă","pos":"noun","definitions":["female equivalent of eschimos"],"forms":{"plural":"eschimose","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eschimosă","accusative-definite-nominative-singular":"eschimosa","accusative-indefinite-nominative-plural":"eschimose","accusative-definite-nominative-plural":"eschimosele","dative-genitive-indefinite-singular":"eschimose","dative-definite-genitive-singular":"eschimosei","dative-genitive-indefinite-plural":"eschimose","dative-definite-genitive-plural":"eschimoselor","singular-vocative":"eschimosă","plural-vocative":"eschimoselor"}},{"word":"eschisă","pos":"noun","definitions":["rough sketch of a literary work"],"forms":{"plural":"eschise","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eschisă","accusative-definite-nominative-singular":"eschisa","accusative-indefinite-nominative-plural":"eschise","accusative-definite-nominative-plural":"eschisele","dative-genitive-indefinite-singular":"eschise","dative-definite-genitive-singular":"eschisei","dative-genitive-indefinite-plural":"eschise","dative-definite-genitive-plural":"eschiselor","singular-vocative":"eschisă","plural-vocative":"eschiselor"}},{"word":"eschiva","pos":"verb","definitions":["to shirk"],"forms":{"canonical":"a eschiva 1st conjugation","present-singular-third-person":"eschivează","participle-past":"eschivat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eschiva","gerund":"eschivând","first-person-indicative-present-singular":"eschivez","indicative-present-second-person-singular":"eschivezi","indicative-present-singular-third-person":"eschivează","first-person-indicative-plural-present":"eschivăm","indicative-plural-present-second-person":"eschivați","indicative-plural-present-third-person":"eschivează","first-person-imperfect-indicative-singular":"eschivam","imperfect-indicative-second-person-singular":"eschivai","imperfect-indicative-singular-third-person":"eschiva","first-person-imperfect-indicative-plural":"eschivam","imperfect-indicative-plural-second-person":"eschivați","imperfect-indicative-plural-third-person":"eschivau","first-person-indicative-perfect-singular":"eschivai","indicative-perfect-second-person-singular":"eschivași","indicative-perfect-singular-third-person":"eschivă","first-person-indicative-perfect-plural":"eschivarăm","indicative-perfect-plural-second-person":"eschivarăți","indicative-perfect-plural-third-person":"eschivară","first-person-indicative-pluperfect-singular":"eschivasem","indicative-pluperfect-second-person-singular":"eschivaseși","indicative-pluperfect-singular-third-person":"eschivase","first-person-indicative-pluperfect-plural":"eschivaserăm","indicative-pluperfect-plural-second-person":"eschivaserăți","indicative-pluperfect-plural-third-person":"eschivaseră","first-person-present-singular-subjunctive":"să eschivez","present-second-person-singular-subjunctive":"să eschivezi","present-singular-subjunctive-third-person":"să eschiveze","first-person-plural-present-subjunctive":"să eschivăm","plural-present-second-person-subjunctive":"să eschivați","plural-present-subjunctive-third-person":"să eschiveze","imperative-second-person-singular":"eschivează","imperative-plural-second-person":"eschivați","imperative-negative-second-person-singular":"nu eschiva","imperative-negative-plural-second-person":"nu eschivați"}},{"word":"eschivă","pos":"noun","definitions":["dodge"],"forms":{"plural":"eschive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eschivă","accusative-definite-nominative-singular":"eschiva","accusative-indefinite-nominative-plural":"eschive","accusative-definite-nominative-plural":"eschivele","dative-genitive-indefinite-singular":"eschive","dative-definite-genitive-singular":"eschivei","dative-genitive-indefinite-plural":"eschive","dative-definite-genitive-plural":"eschivelor","singular-vocative":"eschivă","plural-vocative":"eschivelor"}},{"word":"eschivare","pos":"noun","definitions":["evasion"],"forms":{"plural":"eschivări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eschivare","accusative-definite-nominative-singular":"eschivarea","accusative-indefinite-nominative-plural":"eschivări","accusative-definite-nominative-plural":"eschivările","dative-genitive-indefinite-singular":"eschivări","dative-definite-genitive-singular":"eschivării","dative-genitive-indefinite-plural":"eschivări","dative-definite-genitive-plural":"eschivărilor","singular-vocative":"eschivare","plural-vocative":"eschivărilor"}},{"word":"eschivat","pos":"adj","definitions":["evaded"],"forms":{"feminine-singular":"eschivată","masculine-plural":"eschivați","feminine-neuter-plural":"eschivate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eschivat","error-unrecognized-form-feminine-indefinite-singular":"eschivată","error-unrecognized-form-indefinite-masculine-plural":"eschivați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eschivate","definite-error-unrecognized-form-masculine-neuter-singular":"eschivatul","definite-error-unrecognized-form-feminine-singular":"eschivata","definite-error-unrecognized-form-masculine-plural":"eschivații","definite-error-unrecognized-form-feminine-neuter-plural":"eschivatele"}},{"word":"eschivat","pos":"verb","definitions":["past participle of eschiva"],"forms":{"participle-past":"of eschiva"}},{"word":"escitat","pos":"adj","definitions":["obsolete form of excitat"],"forms":{"feminine-singular":"escitată","masculine-plural":"escitați","feminine-neuter-plural":"escitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escitat","error-unrecognized-form-feminine-indefinite-singular":"escitată","error-unrecognized-form-indefinite-masculine-plural":"escitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"escitate","definite-error-unrecognized-form-masculine-neuter-singular":"escitatul","definite-error-unrecognized-form-feminine-singular":"escitata","definite-error-unrecognized-form-masculine-plural":"escitații","definite-error-unrecognized-form-feminine-neuter-plural":"escitatele"}},{"word":"esclamațiune","pos":"noun","definitions":["obsolete form of exclamație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"esclamațiune","accusative-definite-nominative":"esclamațiunea","dative-genitive-indefinite":"esclamațiuni","dative-definite-genitive":"esclamațiunii","vocative":"esclamațiune"}},{"word":"escludere","pos":"noun","definitions":["obsolete form of excludere"],"forms":{"plural":"escluderi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escludere","accusative-definite-nominative-singular":"escluderea","accusative-indefinite-nominative-plural":"escluderi","accusative-definite-nominative-plural":"escluderile","dative-genitive-indefinite-singular":"escluderi","dative-definite-genitive-singular":"escluderii","dative-genitive-indefinite-plural":"escluderi","dative-definite-genitive-plural":"escluderilor","singular-vocative":"escludere","plural-vocative":"escluderilor"}},{"word":"esclusivist","pos":"adj","definitions":["obsolete form of exclusivist"],"forms":{"feminine-singular":"esclusivistă","masculine-plural":"esclusiviști","feminine-neuter-plural":"esclusiviste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esclusivist","error-unrecognized-form-feminine-indefinite-singular":"esclusivistă","error-unrecognized-form-indefinite-masculine-plural":"esclusiviști","error-unrecognized-form-feminine-indefinite-neuter-plural":"esclusiviste","definite-error-unrecognized-form-masculine-neuter-singular":"esclusivistul","definite-error-unrecognized-form-feminine-singular":"esclusivista","definite-error-unrecognized-form-masculine-plural":"esclusiviștii","definite-error-unrecognized-form-feminine-neuter-plural":"esclusivistele"}},{"word":"escontor","pos":"noun","definitions":["discounter"],"forms":{"plural":"escontori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"escontor","accusative-definite-nominative-singular":"escontorul","accusative-indefinite-nominative-plural":"escontori","accusative-definite-nominative-plural":"escontorii","dative-genitive-indefinite-singular":"escontor","dative-definite-genitive-singular":"escontorului","dative-genitive-indefinite-plural":"escontori","dative-definite-genitive-plural":"escontorilor","singular-vocative":"escontorule","plural-vocative":"escontorilor"}},{"word":"escopetă","pos":"noun","definitions":["carbine, escopet"],"forms":{"plural":"escopete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escopetă","accusative-definite-nominative-singular":"escopeta","accusative-indefinite-nominative-plural":"escopete","accusative-definite-nominative-plural":"escopetele","dative-genitive-indefinite-singular":"escopete","dative-definite-genitive-singular":"escopetei","dative-genitive-indefinite-plural":"escopete","dative-definite-genitive-plural":"escopetelor","singular-vocative":"escopetă","plural-vocative":"escopetelor"}},{"word":"escorta","pos":"verb","definitions":["to escort"],"forms":{"canonical":"a escorta 1st conjugation","present-singular-third-person":"escortează","participle-past":"escortat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a escorta","gerund":"escortând","first-person-indicative-present-singular":"escortez","indicative-present-second-person-singular":"escortezi","indicative-present-singular-third-person":"escortează","first-person-indicative-plural-present":"escortăm","indicative-plural-present-second-person":"escortați","indicative-plural-present-third-person":"escortează","first-person-imperfect-indicative-singular":"escortam","imperfect-indicative-second-person-singular":"escortai","imperfect-indicative-singular-third-person":"escorta","first-person-imperfect-indicative-plural":"escortam","imperfect-indicative-plural-second-person":"escortați","imperfect-indicative-plural-third-person":"escortau","first-person-indicative-perfect-singular":"escortai","indicative-perfect-second-person-singular":"escortași","indicative-perfect-singular-third-person":"escortă","first-person-indicative-perfect-plural":"escortarăm","indicative-perfect-plural-second-person":"escortarăți","indicative-perfect-plural-third-person":"escortară","first-person-indicative-pluperfect-singular":"escortasem","indicative-pluperfect-second-person-singular":"escortaseși","indicative-pluperfect-singular-third-person":"escortase","first-person-indicative-pluperfect-plural":"escortaserăm","indicative-pluperfect-plural-second-person":"escortaserăți","indicative-pluperfect-plural-third-person":"escortaseră","first-person-present-singular-subjunctive":"să escortez","present-second-person-singular-subjunctive":"să escortezi","present-singular-subjunctive-third-person":"să escorteze","first-person-plural-present-subjunctive":"să escortăm","plural-present-second-person-subjunctive":"să escortați","plural-present-subjunctive-third-person":"să escorteze","imperative-second-person-singular":"escortează","imperative-plural-second-person":"escortați","imperative-negative-second-person-singular":"nu escorta","imperative-negative-plural-second-person":"nu escortați"}},{"word":"escortă","pos":"noun","definitions":["escort"],"forms":{"plural":"escorte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escortă","accusative-definite-nominative-singular":"escorta","accusative-indefinite-nominative-plural":"escorte","accusative-definite-nominative-plural":"escortele","dative-genitive-indefinite-singular":"escorte","dative-definite-genitive-singular":"escortei","dative-genitive-indefinite-plural":"escorte","dative-definite-genitive-plural":"escortelor","singular-vocative":"escortă","plural-vocative":"escortelor"}},{"word":"escortare","pos":"noun","definitions":["escort"],"forms":{"plural":"escortări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escortare","accusative-definite-nominative-singular":"escortarea","accusative-indefinite-nominative-plural":"escortări","accusative-definite-nominative-plural":"escortările","dative-genitive-indefinite-singular":"escortări","dative-definite-genitive-singular":"escortării","dative-genitive-indefinite-plural":"escortări","dative-definite-genitive-plural":"escortărilor","singular-vocative":"escortare","plural-vocative":"escortărilor"}},{"word":"escortat","pos":"adj","definitions":["escorted"],"forms":{"feminine-singular":"escortată","masculine-plural":"escortați","feminine-neuter-plural":"escortate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escortat","error-unrecognized-form-feminine-indefinite-singular":"escortată","error-unrecognized-form-indefinite-masculine-plural":"escortați","error-unrecognized-form-feminine-indefinite-neuter-plural":"escortate","definite-error-unrecognized-form-masculine-neuter-singular":"escortatul","definite-error-unrecognized-form-feminine-singular":"escortata","definite-error-unrecognized-form-masculine-plural":"escortații","definite-error-unrecognized-form-feminine-neuter-plural":"escortatele"}},{"word":"escortat","pos":"verb","definitions":["past participle of escorta"],"forms":{"participle-past":"of escorta"}},{"word":"escortor","pos":"noun","definitions":["escort"],"forms":{"plural":"escortoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"escortor","accusative-definite-nominative-singular":"escortorul","accusative-indefinite-nominative-plural":"escortoare","accusative-definite-nominative-plural":"escortoarele","dative-genitive-indefinite-singular":"escortor","dative-definite-genitive-singular":"escortorului","dative-genitive-indefinite-plural":"escortoare","dative-definite-genitive-plural":"escortoarelor","singular-vocative":"escortorule","plural-vocative":"escortoarelor"}},{"word":"escroacă","pos":"noun","definitions":["female equivalent of escroc"],"forms":{"plural":"escroace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escroacă","accusative-definite-nominative-singular":"escroaca","accusative-indefinite-nominative-plural":"escroace","accusative-definite-nominative-plural":"escroacele","dative-genitive-indefinite-singular":"escroace","dative-definite-genitive-singular":"escroacei","dative-genitive-indefinite-plural":"escroace","dative-definite-genitive-plural":"escroacelor","singular-vocative":"escroacă","plural-vocative":"escroacelor"}},{"word":"escroc","pos":"noun","definitions":["crook, swindler"],"forms":{"plural":"escroci","feminine":"equivalent escroacă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"escroc","accusative-definite-nominative-singular":"escrocul","accusative-indefinite-nominative-plural":"escroci","accusative-definite-nominative-plural":"escrocii","dative-genitive-indefinite-singular":"escroc","dative-definite-genitive-singular":"escrocului","dative-genitive-indefinite-plural":"escroci","dative-definite-genitive-plural":"escrocilor","singular-vocative":"escrocule","plural-vocative":"escrocilor"}},{"word":"escroca","pos":"verb","definitions":["to cheat"],"forms":{"canonical":"a escroca 1st conjugation","present-singular-third-person":"escrochează","participle-past":"escrocat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a escroca","gerund":"escrocând","first-person-indicative-present-singular":"escrochez","indicative-present-second-person-singular":"escrochezi","indicative-present-singular-third-person":"escrochează","first-person-indicative-plural-present":"escrocăm","indicative-plural-present-second-person":"escrocați","indicative-plural-present-third-person":"escrochează","first-person-imperfect-indicative-singular":"escrocam","imperfect-indicative-second-person-singular":"escrocai","imperfect-indicative-singular-third-person":"escroca","first-person-imperfect-indicative-plural":"escrocam","imperfect-indicative-plural-second-person":"escrocați","imperfect-indicative-plural-third-person":"escrocau","first-person-indicative-perfect-singular":"escrocai","indicative-perfect-second-person-singular":"escrocași","indicative-perfect-singular-third-person":"escrocă","first-person-indicative-perfect-plural":"escrocarăm","indicative-perfect-plural-second-person":"escrocarăți","indicative-perfect-plural-third-person":"escrocară","first-person-indicative-pluperfect-singular":"escrocasem","indicative-pluperfect-second-person-singular":"escrocaseși","indicative-pluperfect-singular-third-person":"escrocase","first-person-indicative-pluperfect-plural":"escrocaserăm","indicative-pluperfect-plural-second-person":"escrocaserăți","indicative-pluperfect-plural-third-person":"escrocaseră","first-person-present-singular-subjunctive":"să escrochez","present-second-person-singular-subjunctive":"să escrochezi","present-singular-subjunctive-third-person":"să escrocheze","first-person-plural-present-subjunctive":"să escrocăm","plural-present-second-person-subjunctive":"să escrocați","plural-present-subjunctive-third-person":"să escrocheze","imperative-second-person-singular":"escrochează","imperative-plural-second-person":"escrocați","imperative-negative-second-person-singular":"nu escroca","imperative-negative-plural-second-person":"nu escrocați"}},{"word":"escrocă","pos":"noun","definitions":["female equivalent of escroc"],"forms":{"plural":"escroce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escrocă","accusative-definite-nominative-singular":"escroca","accusative-indefinite-nominative-plural":"escroce","accusative-definite-nominative-plural":"escrocele","dative-genitive-indefinite-singular":"escroce","dative-definite-genitive-singular":"escrocei","dative-genitive-indefinite-plural":"escroce","dative-definite-genitive-plural":"escrocelor","singular-vocative":"escrocă","plural-vocative":"escrocelor"}},{"word":"escrocare","pos":"noun","definitions":["racketeering"],"forms":{"plural":"escrocări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"escrocare","accusative-definite-nominative-singular":"escrocarea","accusative-indefinite-nominative-plural":"escrocări","accusative-definite-nominative-plural":"escrocările","dative-genitive-indefinite-singular":"escrocări","dative-definite-genitive-singular":"escrocării","dative-genitive-indefinite-plural":"escrocări","dative-definite-genitive-plural":"escrocărilor","singular-vocative":"escrocare","plural-vocative":"escrocărilor"}},{"word":"escrocat","pos":"adj","definitions":["racketeered"],"forms":{"feminine-singular":"escrocată","masculine-plural":"escrocați","feminine-neuter-plural":"escrocate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"escrocat","error-unrecognized-form-feminine-indefinite-singular":"escrocată","error-unrecognized-form-indefinite-masculine-plural":"escrocați","error-unrecognized-form-feminine-indefinite-neuter-plural":"escrocate","definite-error-unrecognized-form-masculine-neuter-singular":"escrocatul","definite-error-unrecognized-form-feminine-singular":"escrocata","definite-error-unrecognized-form-masculine-plural":"escrocații","definite-error-unrecognized-form-feminine-neuter-plural":"escrocatele"}},{"word":"escrocat","pos":"verb","definitions":["past participle of escroca"],"forms":{"participle-past":"of escroca"}},{"word":"escrocherie","pos":"noun","definitions":["fraud"],"forms":{"plural":"escrocherii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"escrocherie","accusative-definite-nominative-singular":"escrocheria","accusative-indefinite-nominative-plural":"escrocherii","accusative-definite-nominative-plural":"escrocheriile","dative-genitive-indefinite-singular":"escrocherii","dative-definite-genitive-singular":"escrocheriei","dative-genitive-indefinite-plural":"escrocherii","dative-definite-genitive-plural":"escrocheriilor","singular-vocative":"escrocherie","plural-vocative":"escrocheriilor"}},{"word":"escroci","pos":"noun","definitions":["plural of escroc"]},{"word":"Escu","pos":"name","definitions":["a village in Recea-Cristur, Cluj County, Romania"],"gender":"m"},{"word":"escuadă","pos":"noun","definitions":["squad, squadron"],"forms":{"plural":"escuade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"escuadă","accusative-definite-nominative-singular":"escuada","accusative-indefinite-nominative-plural":"escuade","accusative-definite-nominative-plural":"escuadele","dative-genitive-indefinite-singular":"escuade","dative-definite-genitive-singular":"escuadei","dative-genitive-indefinite-plural":"escuade","dative-definite-genitive-plural":"escuadelor","singular-vocative":"escuadă","plural-vocative":"escuadelor"}},{"word":"escudo","pos":"noun","definitions":["escudo"],"forms":{"plural":"escudo","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"escudo","accusative-definite-nominative-singular":"escudoul","accusative-indefinite-nominative-plural":"escudo","accusative-definite-nominative-plural":"escudoi","dative-genitive-indefinite-singular":"escudo","dative-definite-genitive-singular":"escudoului","dative-genitive-indefinite-plural":"escudo","dative-definite-genitive-plural":"escudolor","singular-vocative":"escudoule","plural-vocative":"escudolor"}},{"word":"esculap","pos":"noun","definitions":["Aesculapius"],"forms":{"plural":"esculapi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"esculap","accusative-definite-nominative-singular":"esculapul","accusative-indefinite-nominative-plural":"esculapi","accusative-definite-nominative-plural":"esculapii","dative-genitive-indefinite-singular":"esculap","dative-definite-genitive-singular":"esculapului","dative-genitive-indefinite-plural":"esculapi","dative-definite-genitive-plural":"esculapilor","singular-vocative":"esculapule","plural-vocative":"esculapilor"}},{"word":"esculină","pos":"noun","definitions":["esculin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esculină","accusative-definite-nominative-singular":"esculina","accusative-indefinite-nominative-plural":"esculine","accusative-definite-nominative-plural":"esculinele","dative-genitive-indefinite-singular":"esculine","dative-definite-genitive-singular":"esculinei","dative-genitive-indefinite-plural":"esculine","dative-definite-genitive-plural":"esculinelor","singular-vocative":"esculină","plural-vocative":"esculinelor"}},{"word":"escursiune","pos":"noun","definitions":["obsolete form of excursie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"escursiune","accusative-definite-nominative":"escursiunea","dative-genitive-indefinite":"escursiuni","dative-definite-genitive":"escursiunii","vocative":"escursiune"}},{"word":"eșec","pos":"noun","definitions":["failure"],"forms":{"plural":"eșecuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eșec","accusative-definite-nominative-singular":"eșecul","accusative-indefinite-nominative-plural":"eșecuri","accusative-definite-nominative-plural":"eșecurile","dative-genitive-indefinite-singular":"eșec","dative-definite-genitive-singular":"eșecului","dative-genitive-indefinite-plural":"eșecuri","dative-definite-genitive-plural":"eșecurilor","singular-vocative":"eșecule","plural-vocative":"eșecurilor"}},{"word":"Esechioi","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania"],"gender":"f"},{"word":"eseiaj","pos":"noun","definitions":["fitting, trying on"],"forms":{"plural":"eseiaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eseiaj","accusative-definite-nominative-singular":"eseiajul","accusative-indefinite-nominative-plural":"eseiaje","accusative-definite-nominative-plural":"eseiajele","dative-genitive-indefinite-singular":"eseiaj","dative-definite-genitive-singular":"eseiajului","dative-genitive-indefinite-plural":"eseiaje","dative-definite-genitive-plural":"eseiajelor","singular-vocative":"eseiajule","plural-vocative":"eseiajelor"}},{"word":"eseior","pos":"noun","definitions":["test pilot"],"forms":{"plural":"eseiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eseior","accusative-definite-nominative-singular":"eseiorul","accusative-indefinite-nominative-plural":"eseiori","accusative-definite-nominative-plural":"eseiorii","dative-genitive-indefinite-singular":"eseior","dative-definite-genitive-singular":"eseiorului","dative-genitive-indefinite-plural":"eseiori","dative-definite-genitive-plural":"eseiorilor","singular-vocative":"eseiorule","plural-vocative":"eseiorilor"}},{"word":"eseist","pos":"noun","definitions":["essayist"],"forms":{"plural":"eseiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eseist","accusative-definite-nominative-singular":"eseistul","accusative-indefinite-nominative-plural":"eseiști","accusative-definite-nominative-plural":"eseiștii","dative-genitive-indefinite-singular":"eseist","dative-definite-genitive-singular":"eseistului","dative-genitive-indefinite-plural":"eseiști","dative-definite-genitive-plural":"eseiștilor","singular-vocative":"eseistule","plural-vocative":"eseiștilor"}},{"word":"eseistă","pos":"noun","definitions":["female equivalent of eseist"],"forms":{"plural":"eseiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eseistă","accusative-definite-nominative-singular":"eseista","accusative-indefinite-nominative-plural":"eseiste","accusative-definite-nominative-plural":"eseistele","dative-genitive-indefinite-singular":"eseiste","dative-definite-genitive-singular":"eseistei","dative-genitive-indefinite-plural":"eseiste","dative-definite-genitive-plural":"eseistelor","singular-vocative":"eseistă","plural-vocative":"eseistelor"}},{"word":"eseistic","pos":"adj","definitions":["essayistic"],"forms":{"feminine-singular":"eseistică","masculine-plural":"eseistici","feminine-neuter-plural":"eseistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eseistic","error-unrecognized-form-feminine-indefinite-singular":"eseistică","error-unrecognized-form-indefinite-masculine-plural":"eseistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eseistice","definite-error-unrecognized-form-masculine-neuter-singular":"eseisticul","definite-error-unrecognized-form-feminine-singular":"eseistica","definite-error-unrecognized-form-masculine-plural":"eseisticii","definite-error-unrecognized-form-feminine-neuter-plural":"eseisticele"}},{"word":"eseistică","pos":"noun","definitions":["the art of writing essays"],"forms":{"plural":"eseistici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"eseistică","accusative-definite-nominative-singular":"eseistica","accusative-indefinite-nominative-plural":"eseistici","accusative-definite-nominative-plural":"eseisticile","dative-genitive-indefinite-singular":"eseistici","dative-definite-genitive-singular":"eseisticii","dative-genitive-indefinite-plural":"eseistici","dative-definite-genitive-plural":"eseisticilor","singular-vocative":"eseistică","plural-vocative":"eseisticilor"}},{"word":"eșelă","pos":"noun","definitions":["scale"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"eșelă","accusative-definite-nominative":"eșela","dative-genitive-indefinite":"eșele","dative-definite-genitive":"eșelei","vocative":"eșelă"}},{"word":"esență","pos":"noun","definitions":["essence"],"pronunciation":"[eˈsent͡sə]","forms":{"plural":"esențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esență","accusative-definite-nominative-singular":"esența","accusative-indefinite-nominative-plural":"esențe","accusative-definite-nominative-plural":"esențele","dative-genitive-indefinite-singular":"esențe","dative-definite-genitive-singular":"esenței","dative-genitive-indefinite-plural":"esențe","dative-definite-genitive-plural":"esențelor","singular-vocative":"esență","plural-vocative":"esențelor"}},{"word":"esențial","pos":"adj","definitions":["essential"],"pronunciation":"/e.sen.t͡siˈal/","forms":{"feminine-singular":"esențială","masculine-plural":"esențiali","feminine-neuter-plural":"esențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esențial","error-unrecognized-form-feminine-indefinite-singular":"esențială","error-unrecognized-form-indefinite-masculine-plural":"esențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"esențiale","definite-error-unrecognized-form-masculine-neuter-singular":"esențialul","definite-error-unrecognized-form-feminine-singular":"esențiala","definite-error-unrecognized-form-masculine-plural":"esențialii","definite-error-unrecognized-form-feminine-neuter-plural":"esențialele"}},{"word":"esențialism","pos":"noun","definitions":["essentialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"esențialism","accusative-definite-nominative":"esențialismul","dative-genitive-indefinite":"esențialism","dative-definite-genitive":"esențialismului","vocative":"esențialismule"}},{"word":"esențialitate","pos":"noun","definitions":["essentiality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esențialitate","accusative-definite-nominative-singular":"esențialitatea","accusative-indefinite-nominative-plural":"esențialități","accusative-definite-nominative-plural":"esențialitățile","dative-genitive-indefinite-singular":"esențialități","dative-definite-genitive-singular":"esențialității","dative-genitive-indefinite-plural":"esențialități","dative-definite-genitive-plural":"esențialităților","singular-vocative":"esențialitate","plural-vocative":"esențialităților"}},{"word":"esențializa","pos":"verb","definitions":["to essentialize"],"forms":{"canonical":"a esențializa 1st conjugation","present-singular-third-person":"esențializează","participle-past":"esențializat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a esențializa","gerund":"esențializând","first-person-indicative-present-singular":"esențializez","indicative-present-second-person-singular":"esențializezi","indicative-present-singular-third-person":"esențializează","first-person-indicative-plural-present":"esențializăm","indicative-plural-present-second-person":"esențializați","indicative-plural-present-third-person":"esențializează","first-person-imperfect-indicative-singular":"esențializam","imperfect-indicative-second-person-singular":"esențializai","imperfect-indicative-singular-third-person":"esențializa","first-person-imperfect-indicative-plural":"esențializam","imperfect-indicative-plural-second-person":"esențializați","imperfect-indicative-plural-third-person":"esențializau","first-person-indicative-perfect-singular":"esențializai","indicative-perfect-second-person-singular":"esențializași","indicative-perfect-singular-third-person":"esențializă","first-person-indicative-perfect-plural":"esențializarăm","indicative-perfect-plural-second-person":"esențializarăți","indicative-perfect-plural-third-person":"esențializară","first-person-indicative-pluperfect-singular":"esențializasem","indicative-pluperfect-second-person-singular":"esențializaseși","indicative-pluperfect-singular-third-person":"esențializase","first-person-indicative-pluperfect-plural":"esențializaserăm","indicative-pluperfect-plural-second-person":"esențializaserăți","indicative-pluperfect-plural-third-person":"esențializaseră","first-person-present-singular-subjunctive":"să esențializez","present-second-person-singular-subjunctive":"să esențializezi","present-singular-subjunctive-third-person":"să esențializeze","first-person-plural-present-subjunctive":"să esențializăm","plural-present-second-person-subjunctive":"să esențializați","plural-present-subjunctive-third-person":"să esențializeze","imperative-second-person-singular":"esențializează","imperative-plural-second-person":"esențializați","imperative-negative-second-person-singular":"nu esențializa","imperative-negative-plural-second-person":"nu esențializați"}},{"word":"esențializare","pos":"noun","definitions":["essentialization"],"forms":{"plural":"esențializări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esențializare","accusative-definite-nominative-singular":"esențializarea","accusative-indefinite-nominative-plural":"esențializări","accusative-definite-nominative-plural":"esențializările","dative-genitive-indefinite-singular":"esențializări","dative-definite-genitive-singular":"esențializării","dative-genitive-indefinite-plural":"esențializări","dative-definite-genitive-plural":"esențializărilor","singular-vocative":"esențializare","plural-vocative":"esențializărilor"}},{"word":"esențializat","pos":"adj","definitions":["essentialized"],"forms":{"feminine-singular":"esențializată","masculine-plural":"esențializați","feminine-neuter-plural":"esențializate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esențializat","error-unrecognized-form-feminine-indefinite-singular":"esențializată","error-unrecognized-form-indefinite-masculine-plural":"esențializați","error-unrecognized-form-feminine-indefinite-neuter-plural":"esențializate","definite-error-unrecognized-form-masculine-neuter-singular":"esențializatul","definite-error-unrecognized-form-feminine-singular":"esențializata","definite-error-unrecognized-form-masculine-plural":"esențializații","definite-error-unrecognized-form-feminine-neuter-plural":"esențializatele"}},{"word":"esențializat","pos":"verb","definitions":["past participle of esențializa"],"forms":{"participle-past":"of esențializa"}},{"word":"esențialmente","pos":"adv","definitions":["essentially"]},{"word":"eșerneu","pos":"noun","definitions":["umbrella"],"forms":{"plural":"eșeri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșerneu","accusative-definite-nominative-singular":"eșerneuul","accusative-indefinite-nominative-plural":"eșeri","accusative-definite-nominative-plural":"eșerile","dative-genitive-indefinite-singular":"eșerneu","dative-definite-genitive-singular":"eșerneuului","dative-genitive-indefinite-plural":"eșeri","dative-definite-genitive-plural":"eșerilor","singular-vocative":"eșerneuule","plural-vocative":"eșerilor"}},{"word":"eseu","pos":"noun","definitions":["essay"],"forms":{"plural":"eseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eseu","accusative-definite-nominative-singular":"eseul","accusative-indefinite-nominative-plural":"eseuri","accusative-definite-nominative-plural":"eseurile","dative-genitive-indefinite-singular":"eseu","dative-definite-genitive-singular":"eseului","dative-genitive-indefinite-plural":"eseuri","dative-definite-genitive-plural":"eseurilor","singular-vocative":"eseule","plural-vocative":"eseurilor"}},{"word":"eșichier","pos":"noun","definitions":["chessboard"],"forms":{"plural":"eșichiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eșichier","accusative-definite-nominative-singular":"eșichierul","accusative-indefinite-nominative-plural":"eșichiere","accusative-definite-nominative-plural":"eșichierele","dative-genitive-indefinite-singular":"eșichier","dative-definite-genitive-singular":"eșichierului","dative-genitive-indefinite-plural":"eșichiere","dative-definite-genitive-plural":"eșichierelor","singular-vocative":"eșichierule","plural-vocative":"eșichierelor"}},{"word":"Esna","pos":"name","definitions":["a village in Movila Miresii, Brăila County, Romania"],"gender":"f"},{"word":"esofag","pos":"noun","definitions":["oesophagus"],"forms":{"plural":"esofage","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esofag","accusative-definite-nominative-singular":"esofagul","accusative-indefinite-nominative-plural":"esofage","accusative-definite-nominative-plural":"esofagele","dative-genitive-indefinite-singular":"esofag","dative-definite-genitive-singular":"esofagului","dative-genitive-indefinite-plural":"esofage","dative-definite-genitive-plural":"esofagelor","singular-vocative":"esofagule","plural-vocative":"esofagelor"}},{"word":"esofagectomie","pos":"noun","definitions":["esophagectomy"],"forms":{"plural":"esofagectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esofagectomie","accusative-definite-nominative-singular":"esofagectomia","accusative-indefinite-nominative-plural":"esofagectomii","accusative-definite-nominative-plural":"esofagectomiile","dative-genitive-indefinite-singular":"esofagectomii","dative-definite-genitive-singular":"esofagectomiei","dative-genitive-indefinite-plural":"esofagectomii","dative-definite-genitive-plural":"esofagectomiilor","singular-vocative":"esofagectomie","plural-vocative":"esofagectomiilor"}},{"word":"esofagian","pos":"adj","definitions":["esophageal"],"forms":{"feminine-singular":"esofagiană","masculine-plural":"esofagieni","feminine-neuter-plural":"esofagiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esofagian","error-unrecognized-form-feminine-indefinite-singular":"esofagiană","error-unrecognized-form-indefinite-masculine-plural":"esofagieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"esofagiene","definite-error-unrecognized-form-masculine-neuter-singular":"esofagianul","definite-error-unrecognized-form-feminine-singular":"esofagiana","definite-error-unrecognized-form-masculine-plural":"esofagienii","definite-error-unrecognized-form-feminine-neuter-plural":"esofagienele"}},{"word":"esofagism","pos":"noun","definitions":["esophagism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esofagism","accusative-definite-nominative-singular":"esofagismul","accusative-indefinite-nominative-plural":"esofagisme","accusative-definite-nominative-plural":"esofagismele","dative-genitive-indefinite-singular":"esofagism","dative-definite-genitive-singular":"esofagismului","dative-genitive-indefinite-plural":"esofagisme","dative-definite-genitive-plural":"esofagismelor","singular-vocative":"esofagismule","plural-vocative":"esofagismelor"}},{"word":"esofagită","pos":"noun","definitions":["oesophagitis"],"pronunciation":"/e.so.faˈd͡ʒi.tə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"esofagită","accusative-definite-nominative":"esofagita","dative-genitive-indefinite":"esofagite","dative-definite-genitive":"esofagitei","vocative":"esofagită"}},{"word":"esofagoplastie","pos":"noun","definitions":["esophagoplasty"],"forms":{"plural":"esofagoplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esofagoplastie","accusative-definite-nominative-singular":"esofagoplastia","accusative-indefinite-nominative-plural":"esofagoplastii","accusative-definite-nominative-plural":"esofagoplastiile","dative-genitive-indefinite-singular":"esofagoplastii","dative-definite-genitive-singular":"esofagoplastiei","dative-genitive-indefinite-plural":"esofagoplastii","dative-definite-genitive-plural":"esofagoplastiilor","singular-vocative":"esofagoplastie","plural-vocative":"esofagoplastiilor"}},{"word":"esofagoscop","pos":"noun","definitions":["esophagoscope"],"forms":{"plural":"esofagoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esofagoscop","accusative-definite-nominative-singular":"esofagoscopul","accusative-indefinite-nominative-plural":"esofagoscoape","accusative-definite-nominative-plural":"esofagoscoapele","dative-genitive-indefinite-singular":"esofagoscop","dative-definite-genitive-singular":"esofagoscopului","dative-genitive-indefinite-plural":"esofagoscoape","dative-definite-genitive-plural":"esofagoscoapelor","singular-vocative":"esofagoscopule","plural-vocative":"esofagoscoapelor"}},{"word":"esofagoscopie","pos":"noun","definitions":["esophagoscopy"],"forms":{"plural":"esofagoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esofagoscopie","accusative-definite-nominative-singular":"esofagoscopia","accusative-indefinite-nominative-plural":"esofagoscopii","accusative-definite-nominative-plural":"esofagoscopiile","dative-genitive-indefinite-singular":"esofagoscopii","dative-definite-genitive-singular":"esofagoscopiei","dative-genitive-indefinite-plural":"esofagoscopii","dative-definite-genitive-plural":"esofagoscopiilor","singular-vocative":"esofagoscopie","plural-vocative":"esofagoscopiilor"}},{"word":"esofagostomie","pos":"noun","definitions":["esophagostomy"],"forms":{"plural":"esofagostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esofagostomie","accusative-definite-nominative-singular":"esofagostomia","accusative-indefinite-nominative-plural":"esofagostomii","accusative-definite-nominative-plural":"esofagostomiile","dative-genitive-indefinite-singular":"esofagostomii","dative-definite-genitive-singular":"esofagostomiei","dative-genitive-indefinite-plural":"esofagostomii","dative-definite-genitive-plural":"esofagostomiilor","singular-vocative":"esofagostomie","plural-vocative":"esofagostomiilor"}},{"word":"esofagotom","pos":"noun","definitions":["surgery tool for esophagotomy"],"forms":{"plural":"esofagotomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"esofagotom","accusative-definite-nominative-singular":"esofagotomul","accusative-indefinite-nominative-plural":"esofagotomuri","accusative-definite-nominative-plural":"esofagotomurile","dative-genitive-indefinite-singular":"esofagotom","dative-definite-genitive-singular":"esofagotomului","dative-genitive-indefinite-plural":"esofagotomuri","dative-definite-genitive-plural":"esofagotomurilor","singular-vocative":"esofagotomule","plural-vocative":"esofagotomurilor"}},{"word":"esofagotomie","pos":"noun","definitions":["esophagotomy"],"forms":{"plural":"esofagotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esofagotomie","accusative-definite-nominative-singular":"esofagotomia","accusative-indefinite-nominative-plural":"esofagotomii","accusative-definite-nominative-plural":"esofagotomiile","dative-genitive-indefinite-singular":"esofagotomii","dative-definite-genitive-singular":"esofagotomiei","dative-genitive-indefinite-plural":"esofagotomii","dative-definite-genitive-plural":"esofagotomiilor","singular-vocative":"esofagotomie","plural-vocative":"esofagotomiilor"}},{"word":"esopic","pos":"adj","definitions":["Aesopic, Aesopian"],"forms":{"feminine-singular":"esopică","masculine-plural":"esopici","feminine-neuter-plural":"esopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esopic","error-unrecognized-form-feminine-indefinite-singular":"esopică","error-unrecognized-form-indefinite-masculine-plural":"esopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"esopice","definite-error-unrecognized-form-masculine-neuter-singular":"esopicul","definite-error-unrecognized-form-feminine-singular":"esopica","definite-error-unrecognized-form-masculine-plural":"esopicii","definite-error-unrecognized-form-feminine-neuter-plural":"esopicele"}},{"word":"esopicesc","pos":"adj","definitions":["Aesopic, Aesopian"],"forms":{"feminine-singular":"esopicească","plural":"esopicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esopicesc","error-unrecognized-form-feminine-indefinite-singular":"esopicească","error-unrecognized-form-indefinite-masculine-plural":"esopicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"esopicești","definite-error-unrecognized-form-masculine-neuter-singular":"esopicescul","definite-error-unrecognized-form-feminine-singular":"esopiceasca","definite-error-unrecognized-form-masculine-plural":"esopiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"esopiceștile"}},{"word":"espadă","pos":"noun","definitions":["a kind of sword"],"forms":{"plural":"espade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"espadă","accusative-definite-nominative-singular":"espada","accusative-indefinite-nominative-plural":"espade","accusative-definite-nominative-plural":"espadele","dative-genitive-indefinite-singular":"espade","dative-definite-genitive-singular":"espadei","dative-genitive-indefinite-plural":"espade","dative-definite-genitive-plural":"espadelor","singular-vocative":"espadă","plural-vocative":"espadelor"}},{"word":"espadon","pos":"noun","definitions":["espadon"],"forms":{"plural":"espadoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"espadon","accusative-definite-nominative-singular":"espadonul","accusative-indefinite-nominative-plural":"espadoane","accusative-definite-nominative-plural":"espadoanele","dative-genitive-indefinite-singular":"espadon","dative-definite-genitive-singular":"espadonului","dative-genitive-indefinite-plural":"espadoane","dative-definite-genitive-plural":"espadoanelor","singular-vocative":"espadonule","plural-vocative":"espadoanelor"}},{"word":"espadrilă","pos":"noun","definitions":["espadrille"],"pronunciation":"/es.paˈdri.lə/","forms":{"plural":"espadrile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"espadrilă","accusative-definite-nominative-singular":"espadrila","accusative-indefinite-nominative-plural":"espadrile","accusative-definite-nominative-plural":"espadrilele","dative-genitive-indefinite-singular":"espadrile","dative-definite-genitive-singular":"espadrilei","dative-genitive-indefinite-plural":"espadrile","dative-definite-genitive-plural":"espadrilelor","singular-vocative":"espadrilă","plural-vocative":"espadrilelor"}},{"word":"espargută","pos":"noun","definitions":["corn spurry (Spergula arvensis)"],"forms":{"plural":"espargute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"espargută","accusative-definite-nominative-singular":"esparguta","accusative-indefinite-nominative-plural":"espargute","accusative-definite-nominative-plural":"espargutele","dative-genitive-indefinite-singular":"espargute","dative-definite-genitive-singular":"espargutei","dative-genitive-indefinite-plural":"espargute","dative-definite-genitive-plural":"espargutelor","singular-vocative":"espargută","plural-vocative":"espargutelor"}},{"word":"espediție","pos":"noun","definitions":["obsolete form of expediție"],"forms":{"plural":"espediții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"espediție","accusative-definite-nominative-singular":"espediția","accusative-indefinite-nominative-plural":"espediții","accusative-definite-nominative-plural":"espedițiile","dative-genitive-indefinite-singular":"espediții","dative-definite-genitive-singular":"espediției","dative-genitive-indefinite-plural":"espediții","dative-definite-genitive-plural":"espedițiilor","singular-vocative":"espediție","plural-vocative":"espedițiilor"}},{"word":"espedițiune","pos":"noun","definitions":["obsolete form of expediție"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"espedițiune","accusative-definite-nominative":"espedițiunea","dative-genitive-indefinite":"espedițiuni","dative-definite-genitive":"espedițiunii","vocative":"espedițiune"}},{"word":"esperantism","pos":"noun","definitions":["Esperantism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esperantism","accusative-definite-nominative-singular":"esperantismul","accusative-indefinite-nominative-plural":"esperantisme","accusative-definite-nominative-plural":"esperantismele","dative-genitive-indefinite-singular":"esperantism","dative-definite-genitive-singular":"esperantismului","dative-genitive-indefinite-plural":"esperantisme","dative-definite-genitive-plural":"esperantismelor","singular-vocative":"esperantismule","plural-vocative":"esperantismelor"}},{"word":"esperantist","pos":"noun","definitions":["Esperantist"],"forms":{"plural":"esperantiști","feminine":"equivalent esperantistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"esperantist","accusative-definite-nominative-singular":"esperantistul","accusative-indefinite-nominative-plural":"esperantiști","accusative-definite-nominative-plural":"esperantiștii","dative-genitive-indefinite-singular":"esperantist","dative-definite-genitive-singular":"esperantistului","dative-genitive-indefinite-plural":"esperantiști","dative-definite-genitive-plural":"esperantiștilor","singular-vocative":"esperantistule","plural-vocative":"esperantiștilor"}},{"word":"esperantistă","pos":"noun","definitions":["female equivalent of esperantist"],"forms":{"plural":"esperantiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esperantistă","accusative-definite-nominative-singular":"esperantista","accusative-indefinite-nominative-plural":"esperantiste","accusative-definite-nominative-plural":"esperantistele","dative-genitive-indefinite-singular":"esperantiste","dative-definite-genitive-singular":"esperantistei","dative-genitive-indefinite-plural":"esperantiste","dative-definite-genitive-plural":"esperantistelor","singular-vocative":"esperantistă","plural-vocative":"esperantistelor"}},{"word":"Esperanto","pos":"noun","definitions":["alternative letter-case form of esperanto"]},{"word":"esperanto","pos":"noun","definitions":["Esperanto (an auxiliary language)"],"forms":{"alternative":"Esperanto"}},{"word":"esperiență","pos":"noun","definitions":["obsolete form of experiență"],"forms":{"plural":"esperiențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esperiență","accusative-definite-nominative-singular":"esperiența","accusative-indefinite-nominative-plural":"esperiențe","accusative-definite-nominative-plural":"esperiențele","dative-genitive-indefinite-singular":"esperiențe","dative-definite-genitive-singular":"esperienței","dative-genitive-indefinite-plural":"esperiențe","dative-definite-genitive-plural":"esperiențelor","singular-vocative":"esperiență","plural-vocative":"esperiențelor"}},{"word":"esperiință","pos":"noun","definitions":["obsolete form of experiență"],"forms":{"plural":"esperiințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esperiință","accusative-definite-nominative-singular":"esperiința","accusative-indefinite-nominative-plural":"esperiințe","accusative-definite-nominative-plural":"esperiințele","dative-genitive-indefinite-singular":"esperiințe","dative-definite-genitive-singular":"esperiinței","dative-genitive-indefinite-plural":"esperiințe","dative-definite-genitive-plural":"esperiințelor","singular-vocative":"esperiință","plural-vocative":"esperiințelor"}},{"word":"esperiment","pos":"noun","definitions":["obsolete form of experiment"],"forms":{"plural":"esperimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esperiment","accusative-definite-nominative-singular":"esperimentul","accusative-indefinite-nominative-plural":"esperimente","accusative-definite-nominative-plural":"esperimentele","dative-genitive-indefinite-singular":"esperiment","dative-definite-genitive-singular":"esperimentului","dative-genitive-indefinite-plural":"esperimente","dative-definite-genitive-plural":"esperimentelor","singular-vocative":"esperimentule","plural-vocative":"esperimentelor"}},{"word":"espert","pos":"adj","definitions":["obsolete form of expert"],"forms":{"feminine-singular":"espertă","masculine-plural":"esperți","feminine-neuter-plural":"esperte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"espert","error-unrecognized-form-feminine-indefinite-singular":"espertă","error-unrecognized-form-indefinite-masculine-plural":"esperți","error-unrecognized-form-feminine-indefinite-neuter-plural":"esperte","definite-error-unrecognized-form-masculine-neuter-singular":"espertul","definite-error-unrecognized-form-feminine-singular":"esperta","definite-error-unrecognized-form-masculine-plural":"esperții","definite-error-unrecognized-form-feminine-neuter-plural":"espertele"}},{"word":"espiare","pos":"noun","definitions":["obsolete form of expiere"],"forms":{"plural":"espieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"espiare","accusative-definite-nominative-singular":"espiarea","accusative-indefinite-nominative-plural":"espieri","accusative-definite-nominative-plural":"espierile","dative-genitive-indefinite-singular":"espieri","dative-definite-genitive-singular":"espierii","dative-genitive-indefinite-plural":"espieri","dative-definite-genitive-plural":"espierilor","singular-vocative":"espiare","plural-vocative":"espierilor"}},{"word":"espingolă","pos":"noun","definitions":["blunderbuss"],"forms":{"plural":"espingole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"espingolă","accusative-definite-nominative-singular":"espingola","accusative-indefinite-nominative-plural":"espingole","accusative-definite-nominative-plural":"espingolele","dative-genitive-indefinite-singular":"espingole","dative-definite-genitive-singular":"espingolei","dative-genitive-indefinite-plural":"espingole","dative-definite-genitive-plural":"espingolelor","singular-vocative":"espingolă","plural-vocative":"espingolelor"}},{"word":"esplanadă","pos":"noun","definitions":["esplanade"],"forms":{"plural":"esplanade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esplanadă","accusative-definite-nominative-singular":"esplanada","accusative-indefinite-nominative-plural":"esplanade","accusative-definite-nominative-plural":"esplanadele","dative-genitive-indefinite-singular":"esplanade","dative-definite-genitive-singular":"esplanadei","dative-genitive-indefinite-plural":"esplanade","dative-definite-genitive-plural":"esplanadelor","singular-vocative":"esplanadă","plural-vocative":"esplanadelor"}},{"word":"esplica","pos":"verb","definitions":["obsolete form of explica (“explain”)"],"forms":{"canonical":"a esplica 1st conjugation","present-singular-third-person":"esplică","participle-past":"esplicat","subjunctive-third-person":"esplice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a esplica","gerund":"esplicând","first-person-indicative-present-singular":"esplic","indicative-present-second-person-singular":"esplici","indicative-present-singular-third-person":"esplică","first-person-indicative-plural-present":"esplicăm","indicative-plural-present-second-person":"esplicați","indicative-plural-present-third-person":"esplică","first-person-imperfect-indicative-singular":"esplicam","imperfect-indicative-second-person-singular":"esplicai","imperfect-indicative-singular-third-person":"esplica","first-person-imperfect-indicative-plural":"esplicam","imperfect-indicative-plural-second-person":"esplicați","imperfect-indicative-plural-third-person":"esplicau","first-person-indicative-perfect-singular":"esplicai","indicative-perfect-second-person-singular":"esplicași","indicative-perfect-singular-third-person":"esplică","first-person-indicative-perfect-plural":"esplicarăm","indicative-perfect-plural-second-person":"esplicarăți","indicative-perfect-plural-third-person":"esplicară","first-person-indicative-pluperfect-singular":"esplicasem","indicative-pluperfect-second-person-singular":"esplicaseși","indicative-pluperfect-singular-third-person":"esplicase","first-person-indicative-pluperfect-plural":"esplicaserăm","indicative-pluperfect-plural-second-person":"esplicaserăți","indicative-pluperfect-plural-third-person":"esplicaseră","first-person-present-singular-subjunctive":"să esplic","present-second-person-singular-subjunctive":"să esplici","present-singular-subjunctive-third-person":"să esplice","first-person-plural-present-subjunctive":"să esplicăm","plural-present-second-person-subjunctive":"să esplicați","plural-present-subjunctive-third-person":"să esplice","imperative-second-person-singular":"esplică","imperative-plural-second-person":"esplicați","imperative-negative-second-person-singular":"nu esplica","imperative-negative-plural-second-person":"nu esplicați"}},{"word":"esplicare","pos":"noun","definitions":["obsolete form of explicare"],"forms":{"plural":"esplicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esplicare","accusative-definite-nominative-singular":"esplicarea","accusative-indefinite-nominative-plural":"esplicări","accusative-definite-nominative-plural":"esplicările","dative-genitive-indefinite-singular":"esplicări","dative-definite-genitive-singular":"esplicării","dative-genitive-indefinite-plural":"esplicări","dative-definite-genitive-plural":"esplicărilor","singular-vocative":"esplicare","plural-vocative":"esplicărilor"}},{"word":"esplicație","pos":"noun","definitions":["obsolete form of explicație"],"forms":{"plural":"esplicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esplicație","accusative-definite-nominative-singular":"esplicația","accusative-indefinite-nominative-plural":"esplicații","accusative-definite-nominative-plural":"esplicațiile","dative-genitive-indefinite-singular":"esplicații","dative-definite-genitive-singular":"esplicației","dative-genitive-indefinite-plural":"esplicații","dative-definite-genitive-plural":"esplicațiilor","singular-vocative":"esplicație","plural-vocative":"esplicațiilor"}},{"word":"esplicațiune","pos":"noun","definitions":["obsolete form of explicație"],"forms":{"plural":"esplicațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esplicațiune","accusative-definite-nominative-singular":"esplicațiunea","accusative-indefinite-nominative-plural":"esplicațiuni","accusative-definite-nominative-plural":"esplicațiunile","dative-genitive-indefinite-singular":"esplicațiuni","dative-definite-genitive-singular":"esplicațiunii","dative-genitive-indefinite-plural":"esplicațiuni","dative-definite-genitive-plural":"esplicațiunilor","singular-vocative":"esplicațiune","plural-vocative":"esplicațiunilor"}},{"word":"esplicativ","pos":"adj","definitions":["obsolete form of explicativ"],"forms":{"feminine-singular":"esplicativă","masculine-plural":"esplicativi","feminine-neuter-plural":"esplicative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esplicativ","error-unrecognized-form-feminine-indefinite-singular":"esplicativă","error-unrecognized-form-indefinite-masculine-plural":"esplicativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"esplicative","definite-error-unrecognized-form-masculine-neuter-singular":"esplicativul","definite-error-unrecognized-form-feminine-singular":"esplicativa","definite-error-unrecognized-form-masculine-plural":"esplicativii","definite-error-unrecognized-form-feminine-neuter-plural":"esplicativele"}},{"word":"esplosiune","pos":"noun","definitions":["obsolete form of explozie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"esplosiune","accusative-definite-nominative":"esplosiunea","dative-genitive-indefinite":"esplosiuni","dative-definite-genitive":"esplosiunii","vocative":"esplosiune"}},{"word":"esplosiv","pos":"noun","definitions":["obsolete form of exploziv"],"forms":{"plural":"esplosive","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esplosiv","accusative-definite-nominative-singular":"esplosivul","accusative-indefinite-nominative-plural":"esplosive","accusative-definite-nominative-plural":"esplosivele","dative-genitive-indefinite-singular":"esplosiv","dative-definite-genitive-singular":"esplosivului","dative-genitive-indefinite-plural":"esplosive","dative-definite-genitive-plural":"esplosivelor","singular-vocative":"esplosivule","plural-vocative":"esplosivelor"}},{"word":"esploziune","pos":"noun","definitions":["obsolete form of explozie"],"forms":{"plural":"esploziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esploziune","accusative-definite-nominative-singular":"esploziunea","accusative-indefinite-nominative-plural":"esploziuni","accusative-definite-nominative-plural":"esploziunile","dative-genitive-indefinite-singular":"esploziuni","dative-definite-genitive-singular":"esploziunii","dative-genitive-indefinite-plural":"esploziuni","dative-definite-genitive-plural":"esploziunilor","singular-vocative":"esploziune","plural-vocative":"esploziunilor"}},{"word":"esportațiune","pos":"noun","definitions":["obsolete form of exportație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"esportațiune","accusative-definite-nominative":"esportațiunea","dative-genitive-indefinite":"esportațiuni","dative-definite-genitive":"esportațiunii","vocative":"esportațiune"}},{"word":"espozițiune","pos":"noun","definitions":["obsolete form of expoziție"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"espozițiune","accusative-definite-nominative":"espozițiunea","dative-genitive-indefinite":"espozițiuni","dative-definite-genitive":"espozițiunii","vocative":"espozițiune"}},{"word":"espresso","pos":"noun","definitions":["espresso"],"forms":{"plural":"espresso","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"espresso","accusative-definite-nominative-singular":"espressoul","accusative-indefinite-nominative-plural":"espresso","accusative-definite-nominative-plural":"espressole","dative-genitive-indefinite-singular":"espresso","dative-definite-genitive-singular":"espressoului","dative-genitive-indefinite-plural":"espresso","dative-definite-genitive-plural":"espressolor","singular-vocative":"espressoule","plural-vocative":"espressolor"}},{"word":"espropriat","pos":"adj","definitions":["obsolete form of expropriat"],"forms":{"feminine-singular":"espropriată","masculine-plural":"espropriați","feminine-neuter-plural":"espropriate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"espropriat","error-unrecognized-form-feminine-indefinite-singular":"espropriată","error-unrecognized-form-indefinite-masculine-plural":"espropriați","error-unrecognized-form-feminine-indefinite-neuter-plural":"espropriate","definite-error-unrecognized-form-masculine-neuter-singular":"espropriatul","definite-error-unrecognized-form-feminine-singular":"espropriata","definite-error-unrecognized-form-masculine-plural":"espropriații","definite-error-unrecognized-form-feminine-neuter-plural":"espropriatele"}},{"word":"espunere","pos":"noun","definitions":["obsolete form of expunere"],"forms":{"plural":"espuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"espunere","accusative-definite-nominative-singular":"espunerea","accusative-indefinite-nominative-plural":"espuneri","accusative-definite-nominative-plural":"espunerile","dative-genitive-indefinite-singular":"espuneri","dative-definite-genitive-singular":"espunerii","dative-genitive-indefinite-plural":"espuneri","dative-definite-genitive-plural":"espunerilor","singular-vocative":"espunere","plural-vocative":"espunerilor"}},{"word":"est","pos":"noun","definitions":["east"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"est","accusative-definite-nominative":"estul","dative-genitive-indefinite":"est","dative-definite-genitive":"estului","vocative":"estule"}},{"word":"est-european","pos":"adj","definitions":["Eastern European"],"forms":{"feminine-singular":"est-europeană","masculine-plural":"est-europeni","feminine-neuter-plural":"est-europene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"est-european","error-unrecognized-form-feminine-indefinite-singular":"est-europeană","error-unrecognized-form-indefinite-masculine-plural":"est-europeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"est-europene","definite-error-unrecognized-form-masculine-neuter-singular":"est-europeanul","definite-error-unrecognized-form-feminine-singular":"est-europeana","definite-error-unrecognized-form-masculine-plural":"est-europenii","definite-error-unrecognized-form-feminine-neuter-plural":"est-europenele"}},{"word":"est-european","pos":"noun","definitions":["Eastern European"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"est-europeni","accusative-definite-nominative":"est-europenii","dative-genitive-indefinite":"est-europeni","dative-definite-genitive":"est-europenilor","vocative":"est-europenilor"}},{"word":"est-europeană","pos":"noun","definitions":["female equivalent of est-european"],"forms":{"plural":"est-europeane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"est-europeană","accusative-definite-nominative-singular":"est-europeana","accusative-indefinite-nominative-plural":"est-europeane","accusative-definite-nominative-plural":"est-europeanele","dative-genitive-indefinite-singular":"est-europeane","dative-definite-genitive-singular":"est-europeanei","dative-genitive-indefinite-plural":"est-europeane","dative-definite-genitive-plural":"est-europeanelor","singular-vocative":"est-europeană","plural-vocative":"est-europeanelor"}},{"word":"est-german","pos":"adj","definitions":["East German"],"forms":{"feminine-singular":"est-germană","masculine-plural":"est-germani","feminine-neuter-plural":"est-germane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"est-german","error-unrecognized-form-feminine-indefinite-singular":"est-germană","error-unrecognized-form-indefinite-masculine-plural":"est-germani","error-unrecognized-form-feminine-indefinite-neuter-plural":"est-germane","definite-error-unrecognized-form-masculine-neuter-singular":"est-germanul","definite-error-unrecognized-form-feminine-singular":"est-germana","definite-error-unrecognized-form-masculine-plural":"est-germanii","definite-error-unrecognized-form-feminine-neuter-plural":"est-germanele"}},{"word":"est-german","pos":"noun","definitions":["East German"],"forms":{"plural":"est-germani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"est-german","accusative-definite-nominative-singular":"est-germanul","accusative-indefinite-nominative-plural":"est-germani","accusative-definite-nominative-plural":"est-germanii","dative-genitive-indefinite-singular":"est-german","dative-definite-genitive-singular":"est-germanului","dative-genitive-indefinite-plural":"est-germani","dative-definite-genitive-plural":"est-germanilor","singular-vocative":"est-germanule","plural-vocative":"est-germanilor"}},{"word":"estacadă","pos":"noun","definitions":["estacade"],"forms":{"plural":"estacade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estacadă","accusative-definite-nominative-singular":"estacada","accusative-indefinite-nominative-plural":"estacade","accusative-definite-nominative-plural":"estacadele","dative-genitive-indefinite-singular":"estacade","dative-definite-genitive-singular":"estacadei","dative-genitive-indefinite-plural":"estacade","dative-definite-genitive-plural":"estacadelor","singular-vocative":"estacadă","plural-vocative":"estacadelor"}},{"word":"estafiladă","pos":"noun","definitions":["gash, slash (with a bladed weapon, usually on the face)"],"forms":{"plural":"estafilade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estafiladă","accusative-definite-nominative-singular":"estafilada","accusative-indefinite-nominative-plural":"estafilade","accusative-definite-nominative-plural":"estafiladele","dative-genitive-indefinite-singular":"estafilade","dative-definite-genitive-singular":"estafiladei","dative-genitive-indefinite-plural":"estafilade","dative-definite-genitive-plural":"estafiladelor","singular-vocative":"estafiladă","plural-vocative":"estafiladelor"}},{"word":"estancia","pos":"noun","definitions":["estancia"]},{"word":"estaz","pos":"noun","definitions":["obsolete form of extaz"],"forms":{"plural":"estaze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estaz","accusative-definite-nominative-singular":"estazul","accusative-indefinite-nominative-plural":"estaze","accusative-definite-nominative-plural":"estazele","dative-genitive-indefinite-singular":"estaz","dative-definite-genitive-singular":"estazului","dative-genitive-indefinite-plural":"estaze","dative-definite-genitive-plural":"estazelor","singular-vocative":"estazule","plural-vocative":"estazelor"}},{"word":"este","pos":"verb","definitions":["third-person singular present indicative of fi: he/she is"],"pronunciation":"/ˈjes.te/","examples":[{"ro":"Ea este o femeie foarte frumoasă.","en":"She is a very beautiful woman."}],"forms":{"alternative":"есте"}},{"word":"Estelnic","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Estelnic, Covasna County, Romania"],"gender":"m"},{"word":"Ester","pos":"name","definitions":["a village in Constanța County, Dobruja, in eastern Romania. Merged with Pazarlia, which was then renamed to Târgușor."],"gender":"m"},{"word":"ester","pos":"noun","definitions":["ester"],"forms":{"plural":"esteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ester","accusative-definite-nominative-singular":"esterul","accusative-indefinite-nominative-plural":"esteri","accusative-definite-nominative-plural":"esterii","dative-genitive-indefinite-singular":"ester","dative-definite-genitive-singular":"esterului","dative-genitive-indefinite-plural":"esteri","dative-definite-genitive-plural":"esterilor","singular-vocative":"esterule","plural-vocative":"esterilor"}},{"word":"esterază","pos":"noun","definitions":["esterase (any enzyme that catalyzes the hydrolysis of an ester)"],"forms":{"plural":"esteraze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"esterază","accusative-definite-nominative-singular":"esteraza","accusative-indefinite-nominative-plural":"esteraze","accusative-definite-nominative-plural":"esterazele","dative-genitive-indefinite-singular":"esteraze","dative-definite-genitive-singular":"esterazei","dative-genitive-indefinite-plural":"esteraze","dative-definite-genitive-plural":"esterazelor","singular-vocative":"esterază","plural-vocative":"esterazelor"}},{"word":"estergă","pos":"noun","definitions":["lathe"],"forms":{"plural":"estergi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"estergă","accusative-definite-nominative-singular":"esterga","accusative-indefinite-nominative-plural":"estergi","accusative-definite-nominative-plural":"estergile","dative-genitive-indefinite-singular":"estergi","dative-definite-genitive-singular":"estergii","dative-genitive-indefinite-plural":"estergi","dative-definite-genitive-plural":"estergilor","singular-vocative":"estergă","plural-vocative":"estergilor"}},{"word":"estergai","pos":"noun","definitions":["lathe"],"forms":{"plural":"estergaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"estergai","accusative-definite-nominative-singular":"estergaiul","accusative-indefinite-nominative-plural":"estergaiuri","accusative-definite-nominative-plural":"estergaiurile","dative-genitive-indefinite-singular":"estergai","dative-definite-genitive-singular":"estergaiului","dative-genitive-indefinite-plural":"estergaiuri","dative-definite-genitive-plural":"estergaiurilor","singular-vocative":"estergaiule","plural-vocative":"estergaiurilor"}},{"word":"esterifica","pos":"verb","definitions":["to esterify"],"forms":{"canonical":"a esterifica 1st conjugation","present-singular-third-person":"esterifică","participle-past":"esterificat","subjunctive-third-person":"esterifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a esterifica","gerund":"esterificând","first-person-indicative-present-singular":"esterific","indicative-present-second-person-singular":"esterifici","indicative-present-singular-third-person":"esterifică","first-person-indicative-plural-present":"esterificăm","indicative-plural-present-second-person":"esterificați","indicative-plural-present-third-person":"esterifică","first-person-imperfect-indicative-singular":"esterificam","imperfect-indicative-second-person-singular":"esterificai","imperfect-indicative-singular-third-person":"esterifica","first-person-imperfect-indicative-plural":"esterificam","imperfect-indicative-plural-second-person":"esterificați","imperfect-indicative-plural-third-person":"esterificau","first-person-indicative-perfect-singular":"esterificai","indicative-perfect-second-person-singular":"esterificași","indicative-perfect-singular-third-person":"esterifică","first-person-indicative-perfect-plural":"esterificarăm","indicative-perfect-plural-second-person":"esterificarăți","indicative-perfect-plural-third-person":"esterificară","first-person-indicative-pluperfect-singular":"esterificasem","indicative-pluperfect-second-person-singular":"esterificaseși","indicative-pluperfect-singular-third-person":"esterificase","first-person-indicative-pluperfect-plural":"esterificaserăm","indicative-pluperfect-plural-second-person":"esterificaserăți","indicative-pluperfect-plural-third-person":"esterificaseră","first-person-present-singular-subjunctive":"să esterific","present-second-person-singular-subjunctive":"să esterifici","present-singular-subjunctive-third-person":"să esterifice","first-person-plural-present-subjunctive":"să esterificăm","plural-present-second-person-subjunctive":"să esterificați","plural-present-subjunctive-third-person":"să esterifice","imperative-second-person-singular":"esterifică","imperative-plural-second-person":"esterificați","imperative-negative-second-person-singular":"nu esterifica","imperative-negative-plural-second-person":"nu esterificați"}},{"word":"esterificare","pos":"noun","definitions":["esterification"],"forms":{"plural":"esterificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esterificare","accusative-definite-nominative-singular":"esterificarea","accusative-indefinite-nominative-plural":"esterificări","accusative-definite-nominative-plural":"esterificările","dative-genitive-indefinite-singular":"esterificări","dative-definite-genitive-singular":"esterificării","dative-genitive-indefinite-plural":"esterificări","dative-definite-genitive-plural":"esterificărilor","singular-vocative":"esterificare","plural-vocative":"esterificărilor"}},{"word":"estern","pos":"adj","definitions":["obsolete form of extern"],"forms":{"feminine-singular":"esternă","masculine-plural":"esterni","feminine-neuter-plural":"esterne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estern","error-unrecognized-form-feminine-indefinite-singular":"esternă","error-unrecognized-form-indefinite-masculine-plural":"esterni","error-unrecognized-form-feminine-indefinite-neuter-plural":"esterne","definite-error-unrecognized-form-masculine-neuter-singular":"esternul","definite-error-unrecognized-form-feminine-singular":"esterna","definite-error-unrecognized-form-masculine-plural":"esternii","definite-error-unrecognized-form-feminine-neuter-plural":"esternele"}},{"word":"estet","pos":"noun","definitions":["esthete"],"forms":{"plural":"esteți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estet","accusative-definite-nominative-singular":"estetul","accusative-indefinite-nominative-plural":"esteți","accusative-definite-nominative-plural":"esteții","dative-genitive-indefinite-singular":"estet","dative-definite-genitive-singular":"estetului","dative-genitive-indefinite-plural":"esteți","dative-definite-genitive-plural":"esteților","singular-vocative":"estetule","plural-vocative":"esteților"}},{"word":"estetă","pos":"noun","definitions":["female equivalent of estet"],"forms":{"plural":"estete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estetă","accusative-definite-nominative-singular":"esteta","accusative-indefinite-nominative-plural":"estete","accusative-definite-nominative-plural":"estetele","dative-genitive-indefinite-singular":"estete","dative-definite-genitive-singular":"estetei","dative-genitive-indefinite-plural":"estete","dative-definite-genitive-plural":"estetelor","singular-vocative":"estetă","plural-vocative":"estetelor"}},{"word":"estetic","pos":"adj","definitions":["aesthetic"],"forms":{"feminine-singular":"estetică","masculine-plural":"estetici","feminine-neuter-plural":"estetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estetic","error-unrecognized-form-feminine-indefinite-singular":"estetică","error-unrecognized-form-indefinite-masculine-plural":"estetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"estetice","definite-error-unrecognized-form-masculine-neuter-singular":"esteticul","definite-error-unrecognized-form-feminine-singular":"estetica","definite-error-unrecognized-form-masculine-plural":"esteticii","definite-error-unrecognized-form-feminine-neuter-plural":"esteticele"}},{"word":"estetică","pos":"noun","definitions":["aesthetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estetică","accusative-definite-nominative-singular":"estetica","accusative-indefinite-nominative-plural":"estetice","accusative-definite-nominative-plural":"esteticele","dative-genitive-indefinite-singular":"estetice","dative-definite-genitive-singular":"esteticei","dative-genitive-indefinite-plural":"estetice","dative-definite-genitive-plural":"esteticelor","singular-vocative":"estetică","plural-vocative":"esteticelor"}},{"word":"esteticamente","pos":"adv","definitions":["aesthetically"]},{"word":"esteticesc","pos":"adj","definitions":["aesthetic"],"forms":{"feminine-singular":"esteticească","plural":"esteticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esteticesc","error-unrecognized-form-feminine-indefinite-singular":"esteticească","error-unrecognized-form-indefinite-masculine-plural":"esteticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"esteticești","definite-error-unrecognized-form-masculine-neuter-singular":"esteticescul","definite-error-unrecognized-form-feminine-singular":"esteticeasca","definite-error-unrecognized-form-masculine-plural":"esteticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"esteticeștile"}},{"word":"esteticește","pos":"adv","definitions":["aesthetically"]},{"word":"estetician","pos":"noun","definitions":["beautician"],"pronunciation":"/es.te.ti.t͡ʃiˈan/","forms":{"plural":"esteticieni","feminine":"equivalent esteticiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estetician","accusative-definite-nominative-singular":"esteticianul","accusative-indefinite-nominative-plural":"esteticieni","accusative-definite-nominative-plural":"esteticienii","dative-genitive-indefinite-singular":"estetician","dative-definite-genitive-singular":"esteticianului","dative-genitive-indefinite-plural":"esteticieni","dative-definite-genitive-plural":"esteticienilor","singular-vocative":"esteticianule","plural-vocative":"esteticienilor"}},{"word":"esteticiană","pos":"noun","definitions":["female equivalent of estetician"],"pronunciation":"/es.te.ti.t͡ʃiˈa.nə/","forms":{"plural":"esteticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"esteticiană","accusative-definite-nominative-singular":"esteticiana","accusative-indefinite-nominative-plural":"esteticiene","accusative-definite-nominative-plural":"esteticienele","dative-genitive-indefinite-singular":"esteticiene","dative-definite-genitive-singular":"esteticienei","dative-genitive-indefinite-plural":"esteticiene","dative-definite-genitive-plural":"esteticienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"esteticiene","pos":"noun","definitions":["plural of esteticiană"],"gender":"f"},{"word":"esteticieni","pos":"noun","definitions":["plural of estetician"],"gender":"m"},{"word":"estetism","pos":"noun","definitions":["aestheticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estetism","accusative-definite-nominative-singular":"estetismul","accusative-indefinite-nominative-plural":"estetisme","accusative-definite-nominative-plural":"estetismele","dative-genitive-indefinite-singular":"estetism","dative-definite-genitive-singular":"estetismului","dative-genitive-indefinite-plural":"estetisme","dative-definite-genitive-plural":"estetismelor","singular-vocative":"estetismule","plural-vocative":"estetismelor"}},{"word":"estetist","pos":"adj","definitions":["estetician"],"forms":{"feminine-singular":"estetistă","masculine-plural":"estetiști","feminine-neuter-plural":"estetiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estetist","error-unrecognized-form-feminine-indefinite-singular":"estetistă","error-unrecognized-form-indefinite-masculine-plural":"estetiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"estetiste","definite-error-unrecognized-form-masculine-neuter-singular":"estetistul","definite-error-unrecognized-form-feminine-singular":"estetista","definite-error-unrecognized-form-masculine-plural":"estetiștii","definite-error-unrecognized-form-feminine-neuter-plural":"estetistele"}},{"word":"estetiza","pos":"verb","definitions":["to aestheticise"],"forms":{"canonical":"a estetiza 1st conjugation","present-singular-third-person":"estetizează","participle-past":"estetizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a estetiza","gerund":"estetizând","first-person-indicative-present-singular":"estetizez","indicative-present-second-person-singular":"estetizezi","indicative-present-singular-third-person":"estetizează","first-person-indicative-plural-present":"estetizăm","indicative-plural-present-second-person":"estetizați","indicative-plural-present-third-person":"estetizează","first-person-imperfect-indicative-singular":"estetizam","imperfect-indicative-second-person-singular":"estetizai","imperfect-indicative-singular-third-person":"estetiza","first-person-imperfect-indicative-plural":"estetizam","imperfect-indicative-plural-second-person":"estetizați","imperfect-indicative-plural-third-person":"estetizau","first-person-indicative-perfect-singular":"estetizai","indicative-perfect-second-person-singular":"estetizași","indicative-perfect-singular-third-person":"estetiză","first-person-indicative-perfect-plural":"estetizarăm","indicative-perfect-plural-second-person":"estetizarăți","indicative-perfect-plural-third-person":"estetizară","first-person-indicative-pluperfect-singular":"estetizasem","indicative-pluperfect-second-person-singular":"estetizaseși","indicative-pluperfect-singular-third-person":"estetizase","first-person-indicative-pluperfect-plural":"estetizaserăm","indicative-pluperfect-plural-second-person":"estetizaserăți","indicative-pluperfect-plural-third-person":"estetizaseră","first-person-present-singular-subjunctive":"să estetizez","present-second-person-singular-subjunctive":"să estetizezi","present-singular-subjunctive-third-person":"să estetizeze","first-person-plural-present-subjunctive":"să estetizăm","plural-present-second-person-subjunctive":"să estetizați","plural-present-subjunctive-third-person":"să estetizeze","imperative-second-person-singular":"estetizează","imperative-plural-second-person":"estetizați","imperative-negative-second-person-singular":"nu estetiza","imperative-negative-plural-second-person":"nu estetizați"}},{"word":"estetizant","pos":"adj","definitions":["estheticizing"],"forms":{"feminine-singular":"estetizantă","masculine-plural":"estetizanți","feminine-neuter-plural":"estetizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estetizant","error-unrecognized-form-feminine-indefinite-singular":"estetizantă","error-unrecognized-form-indefinite-masculine-plural":"estetizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"estetizante","definite-error-unrecognized-form-masculine-neuter-singular":"estetizantul","definite-error-unrecognized-form-feminine-singular":"estetizanta","definite-error-unrecognized-form-masculine-plural":"estetizanții","definite-error-unrecognized-form-feminine-neuter-plural":"estetizantele"}},{"word":"estetizantă","pos":"noun","definitions":["female equivalent of estetizant"],"forms":{"plural":"estetizante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estetizantă","accusative-definite-nominative-singular":"estetizanta","accusative-indefinite-nominative-plural":"estetizante","accusative-definite-nominative-plural":"estetizantele","dative-genitive-indefinite-singular":"estetizante","dative-definite-genitive-singular":"estetizantei","dative-genitive-indefinite-plural":"estetizante","dative-definite-genitive-plural":"estetizantelor","singular-vocative":"estetizantă","plural-vocative":"estetizantelor"}},{"word":"estetizare","pos":"noun","definitions":["aestheticisation"],"forms":{"plural":"estetizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estetizare","accusative-definite-nominative-singular":"estetizarea","accusative-indefinite-nominative-plural":"estetizări","accusative-definite-nominative-plural":"estetizările","dative-genitive-indefinite-singular":"estetizări","dative-definite-genitive-singular":"estetizării","dative-genitive-indefinite-plural":"estetizări","dative-definite-genitive-plural":"estetizărilor","singular-vocative":"estetizare","plural-vocative":"estetizărilor"}},{"word":"estezie","pos":"noun","definitions":["aesthesia"],"forms":{"plural":"estezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"estezie","accusative-definite-nominative-singular":"estezia","accusative-indefinite-nominative-plural":"estezii","accusative-definite-nominative-plural":"esteziile","dative-genitive-indefinite-singular":"estezii","dative-definite-genitive-singular":"esteziei","dative-genitive-indefinite-plural":"estezii","dative-definite-genitive-plural":"esteziilor","singular-vocative":"estezie","plural-vocative":"esteziilor"}},{"word":"esteziologie","pos":"noun","definitions":["esthesiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esteziologie","accusative-definite-nominative-singular":"esteziologia","accusative-indefinite-nominative-plural":"esteziologii","accusative-definite-nominative-plural":"esteziologiile","dative-genitive-indefinite-singular":"esteziologii","dative-definite-genitive-singular":"esteziologiei","dative-genitive-indefinite-plural":"esteziologii","dative-definite-genitive-plural":"esteziologiilor","singular-vocative":"esteziologie","plural-vocative":"esteziologiilor"}},{"word":"esteziometrie","pos":"noun","definitions":["aesthesiometry"],"forms":{"plural":"esteziometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"esteziometrie","accusative-definite-nominative-singular":"esteziometria","accusative-indefinite-nominative-plural":"esteziometrii","accusative-definite-nominative-plural":"esteziometriile","dative-genitive-indefinite-singular":"esteziometrii","dative-definite-genitive-singular":"esteziometriei","dative-genitive-indefinite-plural":"esteziometrii","dative-definite-genitive-plural":"esteziometriilor","singular-vocative":"esteziometrie","plural-vocative":"esteziometriilor"}},{"word":"esteziometru","pos":"noun","definitions":["esthesiometer"],"forms":{"plural":"esteziometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"esteziometru","accusative-definite-nominative-singular":"esteziometrul","accusative-indefinite-nominative-plural":"esteziometre","accusative-definite-nominative-plural":"esteziometrele","dative-genitive-indefinite-singular":"esteziometru","dative-definite-genitive-singular":"esteziometrului","dative-genitive-indefinite-plural":"esteziometre","dative-definite-genitive-plural":"esteziometrelor","singular-vocative":"esteziometrule","plural-vocative":"esteziometrelor"}},{"word":"ești","pos":"verb","definitions":["second-person singular present indicative of fi: You are."],"pronunciation":"[jeʃtʲ]","examples":[{"ro":"Ești un amic de al lui?","en":"Are you a friend of his?"}],"forms":{"alternative":"ешть"}},{"word":"estic","pos":"adj","definitions":["eastern"],"forms":{"feminine-singular":"estică","masculine-plural":"estici","feminine-neuter-plural":"estice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estic","error-unrecognized-form-feminine-indefinite-singular":"estică","error-unrecognized-form-indefinite-masculine-plural":"estici","error-unrecognized-form-feminine-indefinite-neuter-plural":"estice","definite-error-unrecognized-form-masculine-neuter-singular":"esticul","definite-error-unrecognized-form-feminine-singular":"estica","definite-error-unrecognized-form-masculine-plural":"esticii","definite-error-unrecognized-form-feminine-neuter-plural":"esticele"}},{"word":"estima","pos":"verb","definitions":["to estimate"],"pronunciation":"/es.tiˈma/","forms":{"canonical":"a estima 1st conjugation","present-singular-third-person":"estimează","participle-past":"estimat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a estima","gerund":"estimând","first-person-indicative-present-singular":"estimez","indicative-present-second-person-singular":"estimezi","indicative-present-singular-third-person":"estimează","first-person-indicative-plural-present":"estimăm","indicative-plural-present-second-person":"estimați","indicative-plural-present-third-person":"estimează","first-person-imperfect-indicative-singular":"estimam","imperfect-indicative-second-person-singular":"estimai","imperfect-indicative-singular-third-person":"estima","first-person-imperfect-indicative-plural":"estimam","imperfect-indicative-plural-second-person":"estimați","imperfect-indicative-plural-third-person":"estimau","first-person-indicative-perfect-singular":"estimai","indicative-perfect-second-person-singular":"estimași","indicative-perfect-singular-third-person":"estimă","first-person-indicative-perfect-plural":"estimarăm","indicative-perfect-plural-second-person":"estimarăți","indicative-perfect-plural-third-person":"estimară","first-person-indicative-pluperfect-singular":"estimasem","indicative-pluperfect-second-person-singular":"estimaseși","indicative-pluperfect-singular-third-person":"estimase","first-person-indicative-pluperfect-plural":"estimaserăm","indicative-pluperfect-plural-second-person":"estimaserăți","indicative-pluperfect-plural-third-person":"estimaseră","first-person-present-singular-subjunctive":"să estimez","present-second-person-singular-subjunctive":"să estimezi","present-singular-subjunctive-third-person":"să estimeze","first-person-plural-present-subjunctive":"să estimăm","plural-present-second-person-subjunctive":"să estimați","plural-present-subjunctive-third-person":"să estimeze","imperative-second-person-singular":"estimează","imperative-plural-second-person":"estimați","imperative-negative-second-person-singular":"nu estima","imperative-negative-plural-second-person":"nu estimați"}},{"word":"estimabil","pos":"adj","definitions":["estimable"],"pronunciation":"/es.tiˈma.bil/","forms":{"feminine-singular":"estimabilă","masculine-plural":"estimabili","feminine-neuter-plural":"estimabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estimabil","error-unrecognized-form-feminine-indefinite-singular":"estimabilă","error-unrecognized-form-indefinite-masculine-plural":"estimabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"estimabile","definite-error-unrecognized-form-masculine-neuter-singular":"estimabilul","definite-error-unrecognized-form-feminine-singular":"estimabila","definite-error-unrecognized-form-masculine-plural":"estimabilii","definite-error-unrecognized-form-feminine-neuter-plural":"estimabilele"}},{"word":"estimai","pos":"verb","definitions":["inflection of estima:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[estiˈmaj]"},{"word":"estimam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of estima"],"pronunciation":"[estiˈmam]"},{"word":"estimare","pos":"noun","definitions":["estimation"],"forms":{"plural":"estimări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estimare","accusative-definite-nominative-singular":"estimarea","accusative-indefinite-nominative-plural":"estimări","accusative-definite-nominative-plural":"estimările","dative-genitive-indefinite-singular":"estimări","dative-definite-genitive-singular":"estimării","dative-genitive-indefinite-plural":"estimări","dative-definite-genitive-plural":"estimărilor","singular-vocative":"estimare","plural-vocative":"estimărilor"}},{"word":"estimase","pos":"verb","definitions":["third-person singular pluperfect indicative of estima"],"pronunciation":"[estiˈmase]"},{"word":"estimat","pos":"noun","definitions":["estimate"],"pronunciation":"[estiˈmat]","forms":{"plural":"estimate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estimat","accusative-definite-nominative-singular":"estimatul","accusative-indefinite-nominative-plural":"estimate","accusative-definite-nominative-plural":"estimatele","dative-genitive-indefinite-singular":"estimat","dative-definite-genitive-singular":"estimatului","dative-genitive-indefinite-plural":"estimate","dative-definite-genitive-plural":"estimatelor","singular-vocative":"estimatule","plural-vocative":"estimatelor"}},{"word":"estimat","pos":"verb","definitions":["past participle of estima"],"pronunciation":"[estiˈmat]","forms":{"participle-past":"of estima"}},{"word":"estimație","pos":"noun","definitions":["estimate"],"forms":{"plural":"estimații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"estimație","accusative-definite-nominative-singular":"estimația","accusative-indefinite-nominative-plural":"estimații","accusative-definite-nominative-plural":"estimațiile","dative-genitive-indefinite-singular":"estimații","dative-definite-genitive-singular":"estimației","dative-genitive-indefinite-plural":"estimații","dative-definite-genitive-plural":"estimațiilor","singular-vocative":"estimație","plural-vocative":"estimațiilor"}},{"word":"estimațiune","pos":"noun","definitions":["alternative form of estimație"],"forms":{"plural":"estimațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estimațiune","accusative-definite-nominative-singular":"estimațiunea","accusative-indefinite-nominative-plural":"estimațiuni","accusative-definite-nominative-plural":"estimațiunile","dative-genitive-indefinite-singular":"estimațiuni","dative-definite-genitive-singular":"estimațiunii","dative-genitive-indefinite-plural":"estimațiuni","dative-definite-genitive-plural":"estimațiunilor","singular-vocative":"estimațiune","plural-vocative":"estimațiunilor"}},{"word":"estimativ","pos":"adj","definitions":["estimated"],"forms":{"feminine-singular":"estimativă","masculine-plural":"estimativi","feminine-neuter-plural":"estimative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estimativ","error-unrecognized-form-feminine-indefinite-singular":"estimativă","error-unrecognized-form-indefinite-masculine-plural":"estimativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"estimative","definite-error-unrecognized-form-masculine-neuter-singular":"estimativul","definite-error-unrecognized-form-feminine-singular":"estimativa","definite-error-unrecognized-form-masculine-plural":"estimativii","definite-error-unrecognized-form-feminine-neuter-plural":"estimativele"}},{"word":"estimator","pos":"noun","definitions":["assessor"],"forms":{"plural":"estimatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estimator","accusative-definite-nominative-singular":"estimatorul","accusative-indefinite-nominative-plural":"estimatori","accusative-definite-nominative-plural":"estimatorii","dative-genitive-indefinite-singular":"estimator","dative-definite-genitive-singular":"estimatorului","dative-genitive-indefinite-plural":"estimatori","dative-definite-genitive-plural":"estimatorilor","singular-vocative":"estimatorule","plural-vocative":"estimatorilor"}},{"word":"estimatoriu","pos":"adj","definitions":["estimative"],"forms":{"feminine-singular":"estimatorie","plural":"estimatorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estimatoriu","error-unrecognized-form-feminine-indefinite-singular":"estimatorie","error-unrecognized-form-indefinite-masculine-plural":"estimatorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"estimatorii","definite-error-unrecognized-form-masculine-neuter-singular":"estimatoriul","definite-error-unrecognized-form-feminine-singular":"estimatoria","definite-error-unrecognized-form-masculine-plural":"estimatoriii","definite-error-unrecognized-form-feminine-neuter-plural":"estimatoriile"}},{"word":"estimez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of estima"],"pronunciation":"[estiˈmez]"},{"word":"estimp","pos":"adv","definitions":["in this year"]},{"word":"estirpațiune","pos":"noun","definitions":["obsolete form of extirpație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"estirpațiune","accusative-definite-nominative":"estirpațiunea","dative-genitive-indefinite":"estirpațiuni","dative-definite-genitive":"estirpațiunii","vocative":"estirpațiune"}},{"word":"estiv","pos":"adj","definitions":["estival"],"pronunciation":"/esˈtiv/","forms":{"feminine-singular":"estivă","masculine-plural":"estivi","feminine-neuter-plural":"estive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estiv","error-unrecognized-form-feminine-indefinite-singular":"estivă","error-unrecognized-form-indefinite-masculine-plural":"estivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"estive","definite-error-unrecognized-form-masculine-neuter-singular":"estivul","definite-error-unrecognized-form-feminine-singular":"estiva","definite-error-unrecognized-form-masculine-plural":"estivii","definite-error-unrecognized-form-feminine-neuter-plural":"estivele"}},{"word":"estival","pos":"adj","definitions":["estival"],"pronunciation":"/es.tiˈval/","forms":{"feminine-singular":"estivală","masculine-plural":"estivali","feminine-neuter-plural":"estivale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estival","error-unrecognized-form-feminine-indefinite-singular":"estivală","error-unrecognized-form-indefinite-masculine-plural":"estivali","error-unrecognized-form-feminine-indefinite-neuter-plural":"estivale","definite-error-unrecognized-form-masculine-neuter-singular":"estivalul","definite-error-unrecognized-form-feminine-singular":"estivala","definite-error-unrecognized-form-masculine-plural":"estivalii","definite-error-unrecognized-form-feminine-neuter-plural":"estivalele"}},{"word":"estivație","pos":"noun","definitions":["estivation"],"forms":{"plural":"estivații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"estivație","accusative-definite-nominative-singular":"estivația","accusative-indefinite-nominative-plural":"estivații","accusative-definite-nominative-plural":"estivațiile","dative-genitive-indefinite-singular":"estivații","dative-definite-genitive-singular":"estivației","dative-genitive-indefinite-plural":"estivații","dative-definite-genitive-plural":"estivațiilor","singular-vocative":"estivație","plural-vocative":"estivațiilor"}},{"word":"estoc","pos":"noun","definitions":["sword, rapier"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"estoc","accusative-definite-nominative":"estocul","dative-genitive-indefinite":"estoc","dative-definite-genitive":"estocului","vocative":"estocule"}},{"word":"estompa","pos":"verb","definitions":["to blur, to dim"],"forms":{"canonical":"a estompa 1st conjugation","present-singular-third-person":"estompează","participle-past":"estompat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a estompa","gerund":"estompând","first-person-indicative-present-singular":"estompez","indicative-present-second-person-singular":"estompezi","indicative-present-singular-third-person":"estompează","first-person-indicative-plural-present":"estompăm","indicative-plural-present-second-person":"estompați","indicative-plural-present-third-person":"estompează","first-person-imperfect-indicative-singular":"estompam","imperfect-indicative-second-person-singular":"estompai","imperfect-indicative-singular-third-person":"estompa","first-person-imperfect-indicative-plural":"estompam","imperfect-indicative-plural-second-person":"estompați","imperfect-indicative-plural-third-person":"estompau","first-person-indicative-perfect-singular":"estompai","indicative-perfect-second-person-singular":"estompași","indicative-perfect-singular-third-person":"estompă","first-person-indicative-perfect-plural":"estomparăm","indicative-perfect-plural-second-person":"estomparăți","indicative-perfect-plural-third-person":"estompară","first-person-indicative-pluperfect-singular":"estompasem","indicative-pluperfect-second-person-singular":"estompaseși","indicative-pluperfect-singular-third-person":"estompase","first-person-indicative-pluperfect-plural":"estompaserăm","indicative-pluperfect-plural-second-person":"estompaserăți","indicative-pluperfect-plural-third-person":"estompaseră","first-person-present-singular-subjunctive":"să estompez","present-second-person-singular-subjunctive":"să estompezi","present-singular-subjunctive-third-person":"să estompeze","first-person-plural-present-subjunctive":"să estompăm","plural-present-second-person-subjunctive":"să estompați","plural-present-subjunctive-third-person":"să estompeze","imperative-second-person-singular":"estompează","imperative-plural-second-person":"estompați","imperative-negative-second-person-singular":"nu estompa","imperative-negative-plural-second-person":"nu estompați"}},{"word":"estompare","pos":"noun","definitions":["blur, dim"],"forms":{"plural":"estompări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estompare","accusative-definite-nominative-singular":"estomparea","accusative-indefinite-nominative-plural":"estompări","accusative-definite-nominative-plural":"estompările","dative-genitive-indefinite-singular":"estompări","dative-definite-genitive-singular":"estompării","dative-genitive-indefinite-plural":"estompări","dative-definite-genitive-plural":"estompărilor","singular-vocative":"estompare","plural-vocative":"estompărilor"}},{"word":"estompat","pos":"adj","definitions":["blurred"],"forms":{"feminine-singular":"estompată","masculine-plural":"estompați","feminine-neuter-plural":"estompate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estompat","error-unrecognized-form-feminine-indefinite-singular":"estompată","error-unrecognized-form-indefinite-masculine-plural":"estompați","error-unrecognized-form-feminine-indefinite-neuter-plural":"estompate","definite-error-unrecognized-form-masculine-neuter-singular":"estompatul","definite-error-unrecognized-form-feminine-singular":"estompata","definite-error-unrecognized-form-masculine-plural":"estompații","definite-error-unrecognized-form-feminine-neuter-plural":"estompatele"}},{"word":"eston","pos":"noun","definitions":["Estonian"],"pronunciation":"/esˈton/","forms":{"plural":"estoni","feminine":"equivalent estonă"}},{"word":"eston","pos":"adj","definitions":["Estonian"],"pronunciation":"/esˈton/","forms":{"feminine-singular":"estonă","masculine-plural":"estoni","feminine-neuter-plural":"estone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eston","error-unrecognized-form-feminine-indefinite-singular":"estonă","error-unrecognized-form-indefinite-masculine-plural":"estoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"estone","definite-error-unrecognized-form-masculine-neuter-singular":"estonul","definite-error-unrecognized-form-feminine-singular":"estona","definite-error-unrecognized-form-masculine-plural":"estonii","definite-error-unrecognized-form-feminine-neuter-plural":"estonele"}},{"word":"estonă","pos":"noun","definitions":["female equivalent of eston","Estonian language"],"forms":{"plural":"estone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estonă","accusative-definite-nominative-singular":"estona","accusative-indefinite-nominative-plural":"estone","accusative-definite-nominative-plural":"estonele","dative-genitive-indefinite-singular":"estone","dative-definite-genitive-singular":"estonei","dative-genitive-indefinite-plural":"estone","dative-definite-genitive-plural":"estonelor","singular-vocative":"estonă","plural-vocative":"estonelor"}},{"word":"Estonia","pos":"name","definitions":["Estonia (a country in northeastern Europe, on the southeastern coast of the Baltic Sea)"],"pronunciation":"/esˈto.ni.(j)a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Estonie","accusative-definite-nominative":"Estonia","dative-genitive-indefinite":"Estonii","dative-definite-genitive":"Estoniei","vocative":"Estonie"}},{"word":"estonian","pos":"adj","definitions":["Estonian"],"pronunciation":"/es.to.niˈan/","forms":{"feminine-singular":"estoniană","masculine-plural":"estonieni","feminine-neuter-plural":"estoniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estonian","error-unrecognized-form-feminine-indefinite-singular":"estoniană","error-unrecognized-form-indefinite-masculine-plural":"estonieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"estoniene","definite-error-unrecognized-form-masculine-neuter-singular":"estonianul","definite-error-unrecognized-form-feminine-singular":"estoniana","definite-error-unrecognized-form-masculine-plural":"estonienii","definite-error-unrecognized-form-feminine-neuter-plural":"estonienele"}},{"word":"estonian","pos":"noun","definitions":["an Estonian man"],"pronunciation":"/es.to.niˈan/","forms":{"plural":"estonieni","feminine":"equivalent estoniană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estonian","accusative-definite-nominative-singular":"estonianul","accusative-indefinite-nominative-plural":"estonieni","accusative-definite-nominative-plural":"estonienii","dative-genitive-indefinite-singular":"estonian","dative-definite-genitive-singular":"estonianului","dative-genitive-indefinite-plural":"estonieni","dative-definite-genitive-plural":"estonienilor","singular-vocative":"estonianule","plural-vocative":"estonienilor"}},{"word":"estoniana","pos":"noun","definitions":["definite nominative/accusative singular of estoniană"],"pronunciation":"[estoniˈana]","gender":"f"},{"word":"estoniană","pos":"adj","definitions":["nominative/accusative feminine singular of estonian"],"pronunciation":"[es.to.niˈa.nə]"},{"word":"estoniană","pos":"noun","definitions":["an Estonian woman"],"pronunciation":"[es.to.niˈa.nə]","forms":{"plural":"estoniene","masculine":"equivalent estonian","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estoniană","accusative-definite-nominative-singular":"estoniana","accusative-indefinite-nominative-plural":"estoniene","accusative-definite-nominative-plural":"estonienele","dative-genitive-indefinite-singular":"estoniene","dative-definite-genitive-singular":"estonienei","dative-genitive-indefinite-plural":"estoniene","dative-definite-genitive-plural":"estonienelor","singular-vocative":"estoniană","plural-vocative":"estonienelor"}},{"word":"estoniană","pos":"noun","definitions":["Estonian (language)"],"pronunciation":"[es.to.niˈa.nə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"estoniană","accusative-definite-nominative":"estoniana","dative-genitive-indefinite":"estoniene","dative-definite-genitive":"estonienei","vocative":"estoniană"}},{"word":"estoniano","pos":"noun","definitions":["vocative singular of estoniană"],"pronunciation":"[estoniˈano]","gender":"f"},{"word":"estoniene","pos":"adj","definitions":["feminine/neuter plural of estonian"],"pronunciation":"/es.to.niˈe.ne/","gender":"f-p"},{"word":"estonieni","pos":"noun","definitions":["plural of estonian"],"gender":"m"},{"word":"estorca","pos":"verb","definitions":["alternative form of extorca"],"forms":{"canonical":"a estorca 1st conjugation","present-singular-third-person":"estorchează","participle-past":"estorcat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a estorca","gerund":"estorcând","first-person-indicative-present-singular":"estorchez","indicative-present-second-person-singular":"estorchezi","indicative-present-singular-third-person":"estorchează","first-person-indicative-plural-present":"estorcăm","indicative-plural-present-second-person":"estorcați","indicative-plural-present-third-person":"estorchează","first-person-imperfect-indicative-singular":"estorcam","imperfect-indicative-second-person-singular":"estorcai","imperfect-indicative-singular-third-person":"estorca","first-person-imperfect-indicative-plural":"estorcam","imperfect-indicative-plural-second-person":"estorcați","imperfect-indicative-plural-third-person":"estorcau","first-person-indicative-perfect-singular":"estorcai","indicative-perfect-second-person-singular":"estorcași","indicative-perfect-singular-third-person":"estorcă","first-person-indicative-perfect-plural":"estorcarăm","indicative-perfect-plural-second-person":"estorcarăți","indicative-perfect-plural-third-person":"estorcară","first-person-indicative-pluperfect-singular":"estorcasem","indicative-pluperfect-second-person-singular":"estorcaseși","indicative-pluperfect-singular-third-person":"estorcase","first-person-indicative-pluperfect-plural":"estorcaserăm","indicative-pluperfect-plural-second-person":"estorcaserăți","indicative-pluperfect-plural-third-person":"estorcaseră","first-person-present-singular-subjunctive":"să estorchez","present-second-person-singular-subjunctive":"să estorchezi","present-singular-subjunctive-third-person":"să estorcheze","first-person-plural-present-subjunctive":"să estorcăm","plural-present-second-person-subjunctive":"să estorcați","plural-present-subjunctive-third-person":"să estorcheze","imperative-second-person-singular":"estorchează","imperative-plural-second-person":"estorcați","imperative-negative-second-person-singular":"nu estorca","imperative-negative-plural-second-person":"nu estorcați"}},{"word":"estorcare","pos":"noun","definitions":["alternative form of extorcare"],"forms":{"plural":"estorcări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estorcare","accusative-definite-nominative-singular":"estorcarea","accusative-indefinite-nominative-plural":"estorcări","accusative-definite-nominative-plural":"estorcările","dative-genitive-indefinite-singular":"estorcări","dative-definite-genitive-singular":"estorcării","dative-genitive-indefinite-plural":"estorcări","dative-definite-genitive-plural":"estorcărilor","singular-vocative":"estorcare","plural-vocative":"estorcărilor"}},{"word":"estracțiune","pos":"noun","definitions":["obsolete form of extracție"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"estracțiune","accusative-definite-nominative":"estracțiunea","dative-genitive-indefinite":"estracțiuni","dative-definite-genitive":"estracțiunii","vocative":"estracțiune"}},{"word":"estradă","pos":"noun","definitions":["platform"],"forms":{"plural":"estrade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estradă","accusative-definite-nominative-singular":"estrada","accusative-indefinite-nominative-plural":"estrade","accusative-definite-nominative-plural":"estradele","dative-genitive-indefinite-singular":"estrade","dative-definite-genitive-singular":"estradei","dative-genitive-indefinite-plural":"estrade","dative-definite-genitive-plural":"estradelor","singular-vocative":"estradă","plural-vocative":"estradelor"}},{"word":"estradiol","pos":"noun","definitions":["estradiol"],"forms":{"plural":"estradioli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estradiol","accusative-definite-nominative-singular":"estradiolul","accusative-indefinite-nominative-plural":"estradioli","accusative-definite-nominative-plural":"estradiolii","dative-genitive-indefinite-singular":"estradiol","dative-definite-genitive-singular":"estradiolului","dative-genitive-indefinite-plural":"estradioli","dative-definite-genitive-plural":"estradiolilor","singular-vocative":"estradiolule","plural-vocative":"estradiolilor"}},{"word":"estral","pos":"adj","definitions":["oestral"],"forms":{"feminine-singular":"estrală","masculine-plural":"estrali","feminine-neuter-plural":"estrale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estral","error-unrecognized-form-feminine-indefinite-singular":"estrală","error-unrecognized-form-indefinite-masculine-plural":"estrali","error-unrecognized-form-feminine-indefinite-neuter-plural":"estrale","definite-error-unrecognized-form-masculine-neuter-singular":"estralul","definite-error-unrecognized-form-feminine-singular":"estrala","definite-error-unrecognized-form-masculine-plural":"estralii","definite-error-unrecognized-form-feminine-neuter-plural":"estralele"}},{"word":"estriol","pos":"noun","definitions":["estriol"],"forms":{"plural":"estrioli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"estriol","accusative-definite-nominative-singular":"estriolul","accusative-indefinite-nominative-plural":"estrioli","accusative-definite-nominative-plural":"estriolii","dative-genitive-indefinite-singular":"estriol","dative-definite-genitive-singular":"estriolului","dative-genitive-indefinite-plural":"estrioli","dative-definite-genitive-plural":"estriolilor","singular-vocative":"estriolule","plural-vocative":"estriolilor"}},{"word":"estrogen","pos":"noun","definitions":["estrogen"],"forms":{"plural":"estrogene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estrogen","accusative-definite-nominative-singular":"estrogenul","accusative-indefinite-nominative-plural":"estrogene","accusative-definite-nominative-plural":"estrogenele","dative-genitive-indefinite-singular":"estrogen","dative-definite-genitive-singular":"estrogenului","dative-genitive-indefinite-plural":"estrogene","dative-definite-genitive-plural":"estrogenelor","singular-vocative":"estrogenule","plural-vocative":"estrogenelor"}},{"word":"estronă","pos":"noun","definitions":["estrone"],"forms":{"plural":"estrone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"estronă","accusative-definite-nominative-singular":"estrona","accusative-indefinite-nominative-plural":"estrone","accusative-definite-nominative-plural":"estronele","dative-genitive-indefinite-singular":"estrone","dative-definite-genitive-singular":"estronei","dative-genitive-indefinite-plural":"estrone","dative-definite-genitive-plural":"estronelor","singular-vocative":"estronă","plural-vocative":"estronelor"}},{"word":"estropia","pos":"verb","definitions":["to cripple"],"forms":{"canonical":"a estropia 1st conjugation","present-singular-third-person":"estropiează","participle-past":"estropiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a estropia","gerund":"estropiind","first-person-indicative-present-singular":"estropiez","indicative-present-second-person-singular":"estropiezi","indicative-present-singular-third-person":"estropiază","first-person-indicative-plural-present":"estropiem","indicative-plural-present-second-person":"estropiați","indicative-plural-present-third-person":"estropiază","first-person-imperfect-indicative-singular":"estropiam","imperfect-indicative-second-person-singular":"estropiai","imperfect-indicative-singular-third-person":"estropia","first-person-imperfect-indicative-plural":"estropiam","imperfect-indicative-plural-second-person":"estropiați","imperfect-indicative-plural-third-person":"estropiau","first-person-indicative-perfect-singular":"estropiai","indicative-perfect-second-person-singular":"estropiași","indicative-perfect-singular-third-person":"estropie","first-person-indicative-perfect-plural":"estropiarăm","indicative-perfect-plural-second-person":"estropiarăți","indicative-perfect-plural-third-person":"estropiară","first-person-indicative-pluperfect-singular":"estropiasem","indicative-pluperfect-second-person-singular":"estropiaseși","indicative-pluperfect-singular-third-person":"estropiase","first-person-indicative-pluperfect-plural":"estropiaserăm","indicative-pluperfect-plural-second-person":"estropiaserăți","indicative-pluperfect-plural-third-person":"estropiaseră","first-person-present-singular-subjunctive":"să estropiez","present-second-person-singular-subjunctive":"să estropiezi","present-singular-subjunctive-third-person":"să estropieze","first-person-plural-present-subjunctive":"să estropiem","plural-present-second-person-subjunctive":"să estropiați","plural-present-subjunctive-third-person":"să estropieze","imperative-second-person-singular":"estropiază","imperative-plural-second-person":"estropiați","imperative-negative-second-person-singular":"nu estropia","imperative-negative-plural-second-person":"nu estropiați"}},{"word":"estropiat","pos":"adj","definitions":["maimed"],"forms":{"feminine-singular":"estropiată","masculine-plural":"estropiați","feminine-neuter-plural":"estropiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"estropiat","error-unrecognized-form-feminine-indefinite-singular":"estropiată","error-unrecognized-form-indefinite-masculine-plural":"estropiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"estropiate","definite-error-unrecognized-form-masculine-neuter-singular":"estropiatul","definite-error-unrecognized-form-feminine-singular":"estropiata","definite-error-unrecognized-form-masculine-plural":"estropiații","definite-error-unrecognized-form-feminine-neuter-plural":"estropiatele"}},{"word":"estropiație","pos":"noun","definitions":["mutilation"],"forms":{"plural":"estropiații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"estropiație","accusative-definite-nominative-singular":"estropiația","accusative-indefinite-nominative-plural":"estropiații","accusative-definite-nominative-plural":"estropiațiile","dative-genitive-indefinite-singular":"estropiații","dative-definite-genitive-singular":"estropiației","dative-genitive-indefinite-plural":"estropiații","dative-definite-genitive-plural":"estropiațiilor","singular-vocative":"estropiație","plural-vocative":"estropiațiilor"}},{"word":"estropiere","pos":"noun","definitions":["disablement"],"forms":{"plural":"estropieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"estropiere","accusative-definite-nominative-singular":"estropierea","accusative-indefinite-nominative-plural":"estropieri","accusative-definite-nominative-plural":"estropierile","dative-genitive-indefinite-singular":"estropieri","dative-definite-genitive-singular":"estropierii","dative-genitive-indefinite-plural":"estropieri","dative-definite-genitive-plural":"estropierilor","singular-vocative":"estropiere","plural-vocative":"estropierilor"}},{"word":"estru","pos":"noun","definitions":["estrus"],"forms":{"plural":"estre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estru","accusative-definite-nominative-singular":"estrul","accusative-indefinite-nominative-plural":"estre","accusative-definite-nominative-plural":"estrele","dative-genitive-indefinite-singular":"estru","dative-definite-genitive-singular":"estrului","dative-genitive-indefinite-plural":"estre","dative-definite-genitive-plural":"estrelor","singular-vocative":"estrule","plural-vocative":"estrelor"}},{"word":"estuar","pos":"noun","definitions":["estuary"],"forms":{"plural":"estuare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"estuar","accusative-definite-nominative-singular":"estuarul","accusative-indefinite-nominative-plural":"estuare","accusative-definite-nominative-plural":"estuarele","dative-genitive-indefinite-singular":"estuar","dative-definite-genitive-singular":"estuarului","dative-genitive-indefinite-plural":"estuare","dative-definite-genitive-plural":"estuarelor","singular-vocative":"estuarule","plural-vocative":"estuarelor"}},{"word":"eșua","pos":"verb","definitions":["to fail","to ground, run aground, to beach"],"pronunciation":"/e.ʃuˈa/","examples":[{"ro":"Planul a eșuat.","en":"The plan failed."},{"ro":"Am eșuat în a duce la sfârșit planul.","en":"I failed in following the plan trough."}],"forms":{"canonical":"a eșua 1st conjugation","present-singular-third-person":"eșuează","participle-past":"eșuat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eșua","gerund":"eșuând","first-person-indicative-present-singular":"eșuez","indicative-present-second-person-singular":"eșuezi","indicative-present-singular-third-person":"eșuează","first-person-indicative-plural-present":"eșuăm","indicative-plural-present-second-person":"eșuați","indicative-plural-present-third-person":"eșuează","first-person-imperfect-indicative-singular":"eșuam","imperfect-indicative-second-person-singular":"eșuai","imperfect-indicative-singular-third-person":"eșua","first-person-imperfect-indicative-plural":"eșuam","imperfect-indicative-plural-second-person":"eșuați","imperfect-indicative-plural-third-person":"eșuau","first-person-indicative-perfect-singular":"eșuai","indicative-perfect-second-person-singular":"eșuași","indicative-perfect-singular-third-person":"eșuă","first-person-indicative-perfect-plural":"eșuarăm","indicative-perfect-plural-second-person":"eșuarăți","indicative-perfect-plural-third-person":"eșuară","first-person-indicative-pluperfect-singular":"eșuasem","indicative-pluperfect-second-person-singular":"eșuaseși","indicative-pluperfect-singular-third-person":"eșuase","first-person-indicative-pluperfect-plural":"eșuaserăm","indicative-pluperfect-plural-second-person":"eșuaserăți","indicative-pluperfect-plural-third-person":"eșuaseră","first-person-present-singular-subjunctive":"să eșuez","present-second-person-singular-subjunctive":"să eșuezi","present-singular-subjunctive-third-person":"să eșueze","first-person-plural-present-subjunctive":"să eșuăm","plural-present-second-person-subjunctive":"să eșuați","plural-present-subjunctive-third-person":"să eșueze","imperative-second-person-singular":"eșuează","imperative-plural-second-person":"eșuați","imperative-negative-second-person-singular":"nu eșua","imperative-negative-plural-second-person":"nu eșuați"}},{"word":"eșuare","pos":"noun","definitions":["failure"],"forms":{"plural":"eșuări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eșuare","accusative-definite-nominative-singular":"eșuarea","accusative-indefinite-nominative-plural":"eșuări","accusative-definite-nominative-plural":"eșuările","dative-genitive-indefinite-singular":"eșuări","dative-definite-genitive-singular":"eșuării","dative-genitive-indefinite-plural":"eșuări","dative-definite-genitive-plural":"eșuărilor","singular-vocative":"eșuare","plural-vocative":"eșuărilor"}},{"word":"eșuat","pos":"adj","definitions":["failed"],"forms":{"feminine-singular":"eșuată","masculine-plural":"eșuați","feminine-neuter-plural":"eșuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eșuat","error-unrecognized-form-feminine-indefinite-singular":"eșuată","error-unrecognized-form-indefinite-masculine-plural":"eșuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eșuate","definite-error-unrecognized-form-masculine-neuter-singular":"eșuatul","definite-error-unrecognized-form-feminine-singular":"eșuata","definite-error-unrecognized-form-masculine-plural":"eșuații","definite-error-unrecognized-form-feminine-neuter-plural":"eșuatele"}},{"word":"eșuat","pos":"verb","definitions":["past participle of eșua"],"forms":{"participle-past":"of eșua"}},{"word":"esundat","pos":"adj","definitions":["flooded"],"forms":{"feminine-singular":"esundată","masculine-plural":"esundați","feminine-neuter-plural":"esundate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"esundat","error-unrecognized-form-feminine-indefinite-singular":"esundată","error-unrecognized-form-indefinite-masculine-plural":"esundați","error-unrecognized-form-feminine-indefinite-neuter-plural":"esundate","definite-error-unrecognized-form-masculine-neuter-singular":"esundatul","definite-error-unrecognized-form-feminine-singular":"esundata","definite-error-unrecognized-form-masculine-plural":"esundații","definite-error-unrecognized-form-feminine-neuter-plural":"esundatele"}},{"word":"esundat","pos":"verb","definitions":["past participle of esunda"],"forms":{"participle-past":"of esunda"}},{"word":"esundațiune","pos":"noun","definitions":["flooding"],"forms":{"plural":"esundațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"esundațiune","accusative-definite-nominative-singular":"esundațiunea","accusative-indefinite-nominative-plural":"esundațiuni","accusative-definite-nominative-plural":"esundațiunile","dative-genitive-indefinite-singular":"esundațiuni","dative-definite-genitive-singular":"esundațiunii","dative-genitive-indefinite-plural":"esundațiuni","dative-definite-genitive-plural":"esundațiunilor","singular-vocative":"esundațiune","plural-vocative":"esundațiunilor"}},{"word":"et cetera","pos":"adv","definitions":["alternative spelling of etcetera"]},{"word":"et.","pos":"noun","definitions":["abbreviation of etaj (“floor, storey”)"]},{"word":"eta","pos":"noun","definitions":["age"]},{"word":"etagiu","pos":"noun","definitions":["obsolete form of etaj"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"etagiu","accusative-definite-nominative":"etagiuul","dative-genitive-indefinite":"etagiu","dative-definite-genitive":"etagiuului","vocative":"etagiuule"}},{"word":"etaj","pos":"noun","definitions":["floor (a storey/story of a building)"],"pronunciation":"/eˈtaʒ/","forms":{"plural":"etaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etaj","accusative-definite-nominative-singular":"etajul","accusative-indefinite-nominative-plural":"etaje","accusative-definite-nominative-plural":"etajele","dative-genitive-indefinite-singular":"etaj","dative-definite-genitive-singular":"etajului","dative-genitive-indefinite-plural":"etaje","dative-definite-genitive-plural":"etajelor","singular-vocative":"etajule","plural-vocative":"etajelor","alternative":"етаж"}},{"word":"etaj întâi","pos":"noun","definitions":["ground floor"],"forms":{"plural":"etaje întâi"}},{"word":"etaja","pos":"verb","definitions":["to layer, to set one above the other"],"forms":{"canonical":"a etaja 1st conjugation","present-singular-third-person":"etajează","participle-past":"etajat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etaja","gerund":"etajând","first-person-indicative-present-singular":"etajez","indicative-present-second-person-singular":"etajezi","indicative-present-singular-third-person":"etajează","first-person-indicative-plural-present":"etajăm","indicative-plural-present-second-person":"etajați","indicative-plural-present-third-person":"etajează","first-person-imperfect-indicative-singular":"etajam","imperfect-indicative-second-person-singular":"etajai","imperfect-indicative-singular-third-person":"etaja","first-person-imperfect-indicative-plural":"etajam","imperfect-indicative-plural-second-person":"etajați","imperfect-indicative-plural-third-person":"etajau","first-person-indicative-perfect-singular":"etajai","indicative-perfect-second-person-singular":"etajași","indicative-perfect-singular-third-person":"etajă","first-person-indicative-perfect-plural":"etajarăm","indicative-perfect-plural-second-person":"etajarăți","indicative-perfect-plural-third-person":"etajară","first-person-indicative-pluperfect-singular":"etajasem","indicative-pluperfect-second-person-singular":"etajaseși","indicative-pluperfect-singular-third-person":"etajase","first-person-indicative-pluperfect-plural":"etajaserăm","indicative-pluperfect-plural-second-person":"etajaserăți","indicative-pluperfect-plural-third-person":"etajaseră","first-person-present-singular-subjunctive":"să etajez","present-second-person-singular-subjunctive":"să etajezi","present-singular-subjunctive-third-person":"să etajeze","first-person-plural-present-subjunctive":"să etajăm","plural-present-second-person-subjunctive":"să etajați","plural-present-subjunctive-third-person":"să etajeze","imperative-second-person-singular":"etajează","imperative-plural-second-person":"etajați","imperative-negative-second-person-singular":"nu etaja","imperative-negative-plural-second-person":"nu etajați"}},{"word":"etajare","pos":"noun","definitions":["flooring"],"forms":{"plural":"etajări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etajare","accusative-definite-nominative-singular":"etajarea","accusative-indefinite-nominative-plural":"etajări","accusative-definite-nominative-plural":"etajările","dative-genitive-indefinite-singular":"etajări","dative-definite-genitive-singular":"etajării","dative-genitive-indefinite-plural":"etajări","dative-definite-genitive-plural":"etajărilor","singular-vocative":"etajare","plural-vocative":"etajărilor"}},{"word":"etajat","pos":"adj","definitions":["storied"],"forms":{"feminine-singular":"etajată","masculine-plural":"etajați","feminine-neuter-plural":"etajate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etajat","error-unrecognized-form-feminine-indefinite-singular":"etajată","error-unrecognized-form-indefinite-masculine-plural":"etajați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etajate","definite-error-unrecognized-form-masculine-neuter-singular":"etajatul","definite-error-unrecognized-form-feminine-singular":"etajata","definite-error-unrecognized-form-masculine-plural":"etajații","definite-error-unrecognized-form-feminine-neuter-plural":"etajatele"}},{"word":"etajeră","pos":"noun","definitions":["shelf"],"forms":{"plural":"etajere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etajeră","accusative-definite-nominative-singular":"etajera","accusative-indefinite-nominative-plural":"etajere","accusative-definite-nominative-plural":"etajerele","dative-genitive-indefinite-singular":"etajere","dative-definite-genitive-singular":"etajerei","dative-genitive-indefinite-plural":"etajere","dative-definite-genitive-plural":"etajerelor","singular-vocative":"etajeră","plural-vocative":"etajerelor"}},{"word":"etala","pos":"verb","definitions":["to display"],"forms":{"canonical":"a etala 1st conjugation","present-singular-third-person":"etalează","participle-past":"etalat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etala","gerund":"etalând","first-person-indicative-present-singular":"etalez","indicative-present-second-person-singular":"etalezi","indicative-present-singular-third-person":"etalează","first-person-indicative-plural-present":"etalăm","indicative-plural-present-second-person":"etalați","indicative-plural-present-third-person":"etalează","first-person-imperfect-indicative-singular":"etalam","imperfect-indicative-second-person-singular":"etalai","imperfect-indicative-singular-third-person":"etala","first-person-imperfect-indicative-plural":"etalam","imperfect-indicative-plural-second-person":"etalați","imperfect-indicative-plural-third-person":"etalau","first-person-indicative-perfect-singular":"etalai","indicative-perfect-second-person-singular":"etalași","indicative-perfect-singular-third-person":"etală","first-person-indicative-perfect-plural":"etalarăm","indicative-perfect-plural-second-person":"etalarăți","indicative-perfect-plural-third-person":"etalară","first-person-indicative-pluperfect-singular":"etalasem","indicative-pluperfect-second-person-singular":"etalaseși","indicative-pluperfect-singular-third-person":"etalase","first-person-indicative-pluperfect-plural":"etalaserăm","indicative-pluperfect-plural-second-person":"etalaserăți","indicative-pluperfect-plural-third-person":"etalaseră","first-person-present-singular-subjunctive":"să etalez","present-second-person-singular-subjunctive":"să etalezi","present-singular-subjunctive-third-person":"să etaleze","first-person-plural-present-subjunctive":"să etalăm","plural-present-second-person-subjunctive":"să etalați","plural-present-subjunctive-third-person":"să etaleze","imperative-second-person-singular":"etalează","imperative-plural-second-person":"etalați","imperative-negative-second-person-singular":"nu etala","imperative-negative-plural-second-person":"nu etalați"}},{"word":"etalaj","pos":"noun","definitions":["display"],"forms":{"plural":"etalaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etalaj","accusative-definite-nominative-singular":"etalajul","accusative-indefinite-nominative-plural":"etalaje","accusative-definite-nominative-plural":"etalajele","dative-genitive-indefinite-singular":"etalaj","dative-definite-genitive-singular":"etalajului","dative-genitive-indefinite-plural":"etalaje","dative-definite-genitive-plural":"etalajelor","singular-vocative":"etalajule","plural-vocative":"etalajelor"}},{"word":"etalare","pos":"noun","definitions":["display"],"forms":{"plural":"etalări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etalare","accusative-definite-nominative-singular":"etalarea","accusative-indefinite-nominative-plural":"etalări","accusative-definite-nominative-plural":"etalările","dative-genitive-indefinite-singular":"etalări","dative-definite-genitive-singular":"etalării","dative-genitive-indefinite-plural":"etalări","dative-definite-genitive-plural":"etalărilor","singular-vocative":"etalare","plural-vocative":"etalărilor"}},{"word":"etalat","pos":"adj","definitions":["displayed"],"forms":{"feminine-singular":"etalată","masculine-plural":"etalați","feminine-neuter-plural":"etalate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etalat","error-unrecognized-form-feminine-indefinite-singular":"etalată","error-unrecognized-form-indefinite-masculine-plural":"etalați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etalate","definite-error-unrecognized-form-masculine-neuter-singular":"etalatul","definite-error-unrecognized-form-feminine-singular":"etalata","definite-error-unrecognized-form-masculine-plural":"etalații","definite-error-unrecognized-form-feminine-neuter-plural":"etalatele"}},{"word":"etalat","pos":"verb","definitions":["past participle of etala"],"forms":{"participle-past":"of etala"}},{"word":"etalon","pos":"noun","definitions":["standard"],"forms":{"plural":"etaloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etalon","accusative-definite-nominative-singular":"etalonul","accusative-indefinite-nominative-plural":"etaloane","accusative-definite-nominative-plural":"etaloanele","dative-genitive-indefinite-singular":"etalon","dative-definite-genitive-singular":"etalonului","dative-genitive-indefinite-plural":"etaloane","dative-definite-genitive-plural":"etaloanelor","singular-vocative":"etalonule","plural-vocative":"etaloanelor"}},{"word":"etalon de aur","pos":"noun","definitions":["gold standard"]},{"word":"etalona","pos":"verb","definitions":["to standardize"],"forms":{"canonical":"a etalona 1st conjugation","present-singular-third-person":"etalonează","participle-past":"etalonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etalona","gerund":"etalonând","first-person-indicative-present-singular":"etalonez","indicative-present-second-person-singular":"etalonezi","indicative-present-singular-third-person":"etalonează","first-person-indicative-plural-present":"etalonăm","indicative-plural-present-second-person":"etalonați","indicative-plural-present-third-person":"etalonează","first-person-imperfect-indicative-singular":"etalonam","imperfect-indicative-second-person-singular":"etalonai","imperfect-indicative-singular-third-person":"etalona","first-person-imperfect-indicative-plural":"etalonam","imperfect-indicative-plural-second-person":"etalonați","imperfect-indicative-plural-third-person":"etalonau","first-person-indicative-perfect-singular":"etalonai","indicative-perfect-second-person-singular":"etalonași","indicative-perfect-singular-third-person":"etalonă","first-person-indicative-perfect-plural":"etalonarăm","indicative-perfect-plural-second-person":"etalonarăți","indicative-perfect-plural-third-person":"etalonară","first-person-indicative-pluperfect-singular":"etalonasem","indicative-pluperfect-second-person-singular":"etalonaseși","indicative-pluperfect-singular-third-person":"etalonase","first-person-indicative-pluperfect-plural":"etalonaserăm","indicative-pluperfect-plural-second-person":"etalonaserăți","indicative-pluperfect-plural-third-person":"etalonaseră","first-person-present-singular-subjunctive":"să etalonez","present-second-person-singular-subjunctive":"să etalonezi","present-singular-subjunctive-third-person":"să etaloneze","first-person-plural-present-subjunctive":"să etalonăm","plural-present-second-person-subjunctive":"să etalonați","plural-present-subjunctive-third-person":"să etaloneze","imperative-second-person-singular":"etalonează","imperative-plural-second-person":"etalonați","imperative-negative-second-person-singular":"nu etalona","imperative-negative-plural-second-person":"nu etalonați"}},{"word":"etalonare","pos":"noun","definitions":["calibration"],"forms":{"plural":"etalonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etalonare","accusative-definite-nominative-singular":"etalonarea","accusative-indefinite-nominative-plural":"etalonări","accusative-definite-nominative-plural":"etalonările","dative-genitive-indefinite-singular":"etalonări","dative-definite-genitive-singular":"etalonării","dative-genitive-indefinite-plural":"etalonări","dative-definite-genitive-plural":"etalonărilor","singular-vocative":"etalonare","plural-vocative":"etalonărilor"}},{"word":"etalonat","pos":"adj","definitions":["calibrated"],"forms":{"feminine-singular":"etalonată","masculine-plural":"etalonați","feminine-neuter-plural":"etalonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etalonat","error-unrecognized-form-feminine-indefinite-singular":"etalonată","error-unrecognized-form-indefinite-masculine-plural":"etalonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etalonate","definite-error-unrecognized-form-masculine-neuter-singular":"etalonatul","definite-error-unrecognized-form-feminine-singular":"etalonata","definite-error-unrecognized-form-masculine-plural":"etalonații","definite-error-unrecognized-form-feminine-neuter-plural":"etalonatele"}},{"word":"etalonist","pos":"noun","definitions":["calibrator"],"forms":{"plural":"etaloniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etalonist","accusative-definite-nominative-singular":"etalonistul","accusative-indefinite-nominative-plural":"etaloniști","accusative-definite-nominative-plural":"etaloniștii","dative-genitive-indefinite-singular":"etalonist","dative-definite-genitive-singular":"etalonistului","dative-genitive-indefinite-plural":"etaloniști","dative-definite-genitive-plural":"etaloniștilor","singular-vocative":"etalonistule","plural-vocative":"etaloniștilor"}},{"word":"etalonor","pos":"noun","definitions":["calibrator"],"forms":{"plural":"etalonori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etalonor","accusative-definite-nominative-singular":"etalonorul","accusative-indefinite-nominative-plural":"etalonori","accusative-definite-nominative-plural":"etalonorii","dative-genitive-indefinite-singular":"etalonor","dative-definite-genitive-singular":"etalonorului","dative-genitive-indefinite-plural":"etalonori","dative-definite-genitive-plural":"etalonorilor","singular-vocative":"etalonorule","plural-vocative":"etalonorilor"}},{"word":"etamină","pos":"noun","definitions":["stamen"],"forms":{"plural":"etamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etamină","accusative-definite-nominative-singular":"etamina","accusative-indefinite-nominative-plural":"etamine","accusative-definite-nominative-plural":"etaminele","dative-genitive-indefinite-singular":"etamine","dative-definite-genitive-singular":"etaminei","dative-genitive-indefinite-plural":"etamine","dative-definite-genitive-plural":"etaminelor","singular-vocative":"etamină","plural-vocative":"etaminelor"}},{"word":"etan","pos":"noun","definitions":["ethane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"etan","accusative-definite-nominative":"etanul","dative-genitive-indefinite":"etan","dative-definite-genitive":"etanului","vocative":"etanule"}},{"word":"etanoic","pos":"adj","definitions":["ethanoic"],"forms":{"feminine-singular":"etanoică","masculine-plural":"etanoici","feminine-neuter-plural":"etanoice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etanoic","error-unrecognized-form-feminine-indefinite-singular":"etanoică","error-unrecognized-form-indefinite-masculine-plural":"etanoici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etanoice","definite-error-unrecognized-form-masculine-neuter-singular":"etanoicul","definite-error-unrecognized-form-feminine-singular":"etanoica","definite-error-unrecognized-form-masculine-plural":"etanoicii","definite-error-unrecognized-form-feminine-neuter-plural":"etanoicele"}},{"word":"etanol","pos":"noun","definitions":["ethanol"],"forms":{"plural":"etanoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etanol","accusative-definite-nominative-singular":"etanolul","accusative-indefinite-nominative-plural":"etanoli","accusative-definite-nominative-plural":"etanolii","dative-genitive-indefinite-singular":"etanol","dative-definite-genitive-singular":"etanolului","dative-genitive-indefinite-plural":"etanoli","dative-definite-genitive-plural":"etanolilor","singular-vocative":"etanolule","plural-vocative":"etanolilor"}},{"word":"etanolamină","pos":"noun","definitions":["ethanolamine"],"forms":{"plural":"etanolamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etanolamină","accusative-definite-nominative-singular":"etanolamina","accusative-indefinite-nominative-plural":"etanolamine","accusative-definite-nominative-plural":"etanolaminele","dative-genitive-indefinite-singular":"etanolamine","dative-definite-genitive-singular":"etanolaminei","dative-genitive-indefinite-plural":"etanolamine","dative-definite-genitive-plural":"etanolaminelor","singular-vocative":"etanolamină","plural-vocative":"etanolaminelor"}},{"word":"etanș","pos":"adj","definitions":["tight"],"forms":{"feminine-singular":"etanșă","masculine-plural":"etanși","feminine-neuter-plural":"etanșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etanș","error-unrecognized-form-feminine-indefinite-singular":"etanșă","error-unrecognized-form-indefinite-masculine-plural":"etanși","error-unrecognized-form-feminine-indefinite-neuter-plural":"etanșe","definite-error-unrecognized-form-masculine-neuter-singular":"etanșul","definite-error-unrecognized-form-feminine-singular":"etanșa","definite-error-unrecognized-form-masculine-plural":"etanșii","definite-error-unrecognized-form-feminine-neuter-plural":"etanșele"}},{"word":"etanșa","pos":"verb","definitions":["to make waterproof"],"forms":{"canonical":"a etanșa 1st conjugation","present-singular-third-person":"etanșează","participle-past":"etanșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etanșa","gerund":"etanșând","first-person-indicative-present-singular":"etanșez","indicative-present-second-person-singular":"etanșezi","indicative-present-singular-third-person":"etanșează","first-person-indicative-plural-present":"etanșăm","indicative-plural-present-second-person":"etanșați","indicative-plural-present-third-person":"etanșează","first-person-imperfect-indicative-singular":"etanșam","imperfect-indicative-second-person-singular":"etanșai","imperfect-indicative-singular-third-person":"etanșa","first-person-imperfect-indicative-plural":"etanșam","imperfect-indicative-plural-second-person":"etanșați","imperfect-indicative-plural-third-person":"etanșau","first-person-indicative-perfect-singular":"etanșai","indicative-perfect-second-person-singular":"etanșași","indicative-perfect-singular-third-person":"etanșă","first-person-indicative-perfect-plural":"etanșarăm","indicative-perfect-plural-second-person":"etanșarăți","indicative-perfect-plural-third-person":"etanșară","first-person-indicative-pluperfect-singular":"etanșasem","indicative-pluperfect-second-person-singular":"etanșaseși","indicative-pluperfect-singular-third-person":"etanșase","first-person-indicative-pluperfect-plural":"etanșaserăm","indicative-pluperfect-plural-second-person":"etanșaserăți","indicative-pluperfect-plural-third-person":"etanșaseră","first-person-present-singular-subjunctive":"să etanșez","present-second-person-singular-subjunctive":"să etanșezi","present-singular-subjunctive-third-person":"să etanșeze","first-person-plural-present-subjunctive":"să etanșăm","plural-present-second-person-subjunctive":"să etanșați","plural-present-subjunctive-third-person":"să etanșeze","imperative-second-person-singular":"etanșează","imperative-plural-second-person":"etanșați","imperative-negative-second-person-singular":"nu etanșa","imperative-negative-plural-second-person":"nu etanșați"}},{"word":"etanșare","pos":"noun","definitions":["sealing"],"forms":{"plural":"etanșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etanșare","accusative-definite-nominative-singular":"etanșarea","accusative-indefinite-nominative-plural":"etanșări","accusative-definite-nominative-plural":"etanșările","dative-genitive-indefinite-singular":"etanșări","dative-definite-genitive-singular":"etanșării","dative-genitive-indefinite-plural":"etanșări","dative-definite-genitive-plural":"etanșărilor","singular-vocative":"etanșare","plural-vocative":"etanșărilor"}},{"word":"etanșat","pos":"adj","definitions":["sealed"],"forms":{"feminine-singular":"etanșată","masculine-plural":"etanșați","feminine-neuter-plural":"etanșate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etanșat","error-unrecognized-form-feminine-indefinite-singular":"etanșată","error-unrecognized-form-indefinite-masculine-plural":"etanșați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etanșate","definite-error-unrecognized-form-masculine-neuter-singular":"etanșatul","definite-error-unrecognized-form-feminine-singular":"etanșata","definite-error-unrecognized-form-masculine-plural":"etanșații","definite-error-unrecognized-form-feminine-neuter-plural":"etanșatele"}},{"word":"etanșat","pos":"verb","definitions":["past participle of etanșa"],"forms":{"participle-past":"of etanșa"}},{"word":"etanșeitate","pos":"noun","definitions":["tightness"],"forms":{"plural":"etanșeități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etanșeitate","accusative-definite-nominative-singular":"etanșeitatea","accusative-indefinite-nominative-plural":"etanșeități","accusative-definite-nominative-plural":"etanșeitățile","dative-genitive-indefinite-singular":"etanșeități","dative-definite-genitive-singular":"etanșeității","dative-genitive-indefinite-plural":"etanșeități","dative-definite-genitive-plural":"etanșeităților","singular-vocative":"etanșeitate","plural-vocative":"etanșeităților"}},{"word":"etanșeiza","pos":"verb","definitions":["to make watertight"],"forms":{"canonical":"a etanșeiza 1st conjugation","present-singular-third-person":"etanșeizează","participle-past":"etanșeizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etanșeiza","gerund":"etanșeizând","first-person-indicative-present-singular":"etanșeizez","indicative-present-second-person-singular":"etanșeizezi","indicative-present-singular-third-person":"etanșeizează","first-person-indicative-plural-present":"etanșeizăm","indicative-plural-present-second-person":"etanșeizați","indicative-plural-present-third-person":"etanșeizează","first-person-imperfect-indicative-singular":"etanșeizam","imperfect-indicative-second-person-singular":"etanșeizai","imperfect-indicative-singular-third-person":"etanșeiza","first-person-imperfect-indicative-plural":"etanșeizam","imperfect-indicative-plural-second-person":"etanșeizați","imperfect-indicative-plural-third-person":"etanșeizau","first-person-indicative-perfect-singular":"etanșeizai","indicative-perfect-second-person-singular":"etanșeizași","indicative-perfect-singular-third-person":"etanșeiză","first-person-indicative-perfect-plural":"etanșeizarăm","indicative-perfect-plural-second-person":"etanșeizarăți","indicative-perfect-plural-third-person":"etanșeizară","first-person-indicative-pluperfect-singular":"etanșeizasem","indicative-pluperfect-second-person-singular":"etanșeizaseși","indicative-pluperfect-singular-third-person":"etanșeizase","first-person-indicative-pluperfect-plural":"etanșeizaserăm","indicative-pluperfect-plural-second-person":"etanșeizaserăți","indicative-pluperfect-plural-third-person":"etanșeizaseră","first-person-present-singular-subjunctive":"să etanșeizez","present-second-person-singular-subjunctive":"să etanșeizezi","present-singular-subjunctive-third-person":"să etanșeizeze","first-person-plural-present-subjunctive":"să etanșeizăm","plural-present-second-person-subjunctive":"să etanșeizați","plural-present-subjunctive-third-person":"să etanșeizeze","imperative-second-person-singular":"etanșeizează","imperative-plural-second-person":"etanșeizați","imperative-negative-second-person-singular":"nu etanșeiza","imperative-negative-plural-second-person":"nu etanșeizați"}},{"word":"etanșeizare","pos":"noun","definitions":["sealing"],"forms":{"plural":"etanșeizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etanșeizare","accusative-definite-nominative-singular":"etanșeizarea","accusative-indefinite-nominative-plural":"etanșeizări","accusative-definite-nominative-plural":"etanșeizările","dative-genitive-indefinite-singular":"etanșeizări","dative-definite-genitive-singular":"etanșeizării","dative-genitive-indefinite-plural":"etanșeizări","dative-definite-genitive-plural":"etanșeizărilor","singular-vocative":"etanșeizare","plural-vocative":"etanșeizărilor"}},{"word":"etanșor","pos":"noun","definitions":["sealer"],"forms":{"plural":"etanșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etanșor","accusative-definite-nominative-singular":"etanșorul","accusative-indefinite-nominative-plural":"etanșoare","accusative-definite-nominative-plural":"etanșoarele","dative-genitive-indefinite-singular":"etanșor","dative-definite-genitive-singular":"etanșorului","dative-genitive-indefinite-plural":"etanșoare","dative-definite-genitive-plural":"etanșoarelor","singular-vocative":"etanșorule","plural-vocative":"etanșoarelor"}},{"word":"etapă","pos":"noun","definitions":["stage"],"forms":{"plural":"etape","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etapă","accusative-definite-nominative-singular":"etapa","accusative-indefinite-nominative-plural":"etape","accusative-definite-nominative-plural":"etapele","dative-genitive-indefinite-singular":"etape","dative-definite-genitive-singular":"etapei","dative-genitive-indefinite-plural":"etape","dative-definite-genitive-plural":"etapelor","singular-vocative":"etapă","plural-vocative":"etapelor"}},{"word":"etapiza","pos":"verb","definitions":["to divide into stages"],"forms":{"canonical":"a etapiza 1st conjugation","present-singular-third-person":"etapizează","participle-past":"etapizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etapiza","gerund":"etapizând","first-person-indicative-present-singular":"etapizez","indicative-present-second-person-singular":"etapizezi","indicative-present-singular-third-person":"etapizează","first-person-indicative-plural-present":"etapizăm","indicative-plural-present-second-person":"etapizați","indicative-plural-present-third-person":"etapizează","first-person-imperfect-indicative-singular":"etapizam","imperfect-indicative-second-person-singular":"etapizai","imperfect-indicative-singular-third-person":"etapiza","first-person-imperfect-indicative-plural":"etapizam","imperfect-indicative-plural-second-person":"etapizați","imperfect-indicative-plural-third-person":"etapizau","first-person-indicative-perfect-singular":"etapizai","indicative-perfect-second-person-singular":"etapizași","indicative-perfect-singular-third-person":"etapiză","first-person-indicative-perfect-plural":"etapizarăm","indicative-perfect-plural-second-person":"etapizarăți","indicative-perfect-plural-third-person":"etapizară","first-person-indicative-pluperfect-singular":"etapizasem","indicative-pluperfect-second-person-singular":"etapizaseși","indicative-pluperfect-singular-third-person":"etapizase","first-person-indicative-pluperfect-plural":"etapizaserăm","indicative-pluperfect-plural-second-person":"etapizaserăți","indicative-pluperfect-plural-third-person":"etapizaseră","first-person-present-singular-subjunctive":"să etapizez","present-second-person-singular-subjunctive":"să etapizezi","present-singular-subjunctive-third-person":"să etapizeze","first-person-plural-present-subjunctive":"să etapizăm","plural-present-second-person-subjunctive":"să etapizați","plural-present-subjunctive-third-person":"să etapizeze","imperative-second-person-singular":"etapizează","imperative-plural-second-person":"etapizați","imperative-negative-second-person-singular":"nu etapiza","imperative-negative-plural-second-person":"nu etapizați"}},{"word":"etapizare","pos":"noun","definitions":["staging"],"forms":{"plural":"etapizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etapizare","accusative-definite-nominative-singular":"etapizarea","accusative-indefinite-nominative-plural":"etapizări","accusative-definite-nominative-plural":"etapizările","dative-genitive-indefinite-singular":"etapizări","dative-definite-genitive-singular":"etapizării","dative-genitive-indefinite-plural":"etapizări","dative-definite-genitive-plural":"etapizărilor","singular-vocative":"etapizare","plural-vocative":"etapizărilor"}},{"word":"etapizat","pos":"adj","definitions":["staged"],"forms":{"feminine-singular":"etapizată","masculine-plural":"etapizați","feminine-neuter-plural":"etapizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etapizat","error-unrecognized-form-feminine-indefinite-singular":"etapizată","error-unrecognized-form-indefinite-masculine-plural":"etapizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etapizate","definite-error-unrecognized-form-masculine-neuter-singular":"etapizatul","definite-error-unrecognized-form-feminine-singular":"etapizata","definite-error-unrecognized-form-masculine-plural":"etapizații","definite-error-unrecognized-form-feminine-neuter-plural":"etapizatele"}},{"word":"etate","pos":"noun","definitions":["age"],"forms":{"plural":"etăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"etate","accusative-definite-nominative-singular":"etatea","accusative-indefinite-nominative-plural":"etăți","accusative-definite-nominative-plural":"etățile","dative-genitive-indefinite-singular":"etăți","dative-definite-genitive-singular":"etății","dative-genitive-indefinite-plural":"etăți","dative-definite-genitive-plural":"etăților","singular-vocative":"etate","plural-vocative":"etăților"}},{"word":"etatism","pos":"noun","definitions":["statism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"etatism","accusative-definite-nominative":"etatismul","dative-genitive-indefinite":"etatism","dative-definite-genitive":"etatismului","vocative":"etatismule"}},{"word":"etatist","pos":"adj","definitions":["statist"],"forms":{"feminine-singular":"etatistă","masculine-plural":"etatiști","feminine-neuter-plural":"etatiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etatist","error-unrecognized-form-feminine-indefinite-singular":"etatistă","error-unrecognized-form-indefinite-masculine-plural":"etatiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"etatiste","definite-error-unrecognized-form-masculine-neuter-singular":"etatistul","definite-error-unrecognized-form-feminine-singular":"etatista","definite-error-unrecognized-form-masculine-plural":"etatiștii","definite-error-unrecognized-form-feminine-neuter-plural":"etatistele"}},{"word":"etatist","pos":"noun","definitions":["statist"],"forms":{"plural":"etatiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etatist","accusative-definite-nominative-singular":"etatistul","accusative-indefinite-nominative-plural":"etatiști","accusative-definite-nominative-plural":"etatiștii","dative-genitive-indefinite-singular":"etatist","dative-definite-genitive-singular":"etatistului","dative-genitive-indefinite-plural":"etatiști","dative-definite-genitive-plural":"etatiștilor","singular-vocative":"etatistule","plural-vocative":"etatiștilor"}},{"word":"etatiza","pos":"verb","definitions":["to nationalize"],"forms":{"canonical":"a etatiza 1st conjugation","present-singular-third-person":"etatizează","participle-past":"etatizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etatiza","gerund":"etatizând","first-person-indicative-present-singular":"etatizez","indicative-present-second-person-singular":"etatizezi","indicative-present-singular-third-person":"etatizează","first-person-indicative-plural-present":"etatizăm","indicative-plural-present-second-person":"etatizați","indicative-plural-present-third-person":"etatizează","first-person-imperfect-indicative-singular":"etatizam","imperfect-indicative-second-person-singular":"etatizai","imperfect-indicative-singular-third-person":"etatiza","first-person-imperfect-indicative-plural":"etatizam","imperfect-indicative-plural-second-person":"etatizați","imperfect-indicative-plural-third-person":"etatizau","first-person-indicative-perfect-singular":"etatizai","indicative-perfect-second-person-singular":"etatizași","indicative-perfect-singular-third-person":"etatiză","first-person-indicative-perfect-plural":"etatizarăm","indicative-perfect-plural-second-person":"etatizarăți","indicative-perfect-plural-third-person":"etatizară","first-person-indicative-pluperfect-singular":"etatizasem","indicative-pluperfect-second-person-singular":"etatizaseși","indicative-pluperfect-singular-third-person":"etatizase","first-person-indicative-pluperfect-plural":"etatizaserăm","indicative-pluperfect-plural-second-person":"etatizaserăți","indicative-pluperfect-plural-third-person":"etatizaseră","first-person-present-singular-subjunctive":"să etatizez","present-second-person-singular-subjunctive":"să etatizezi","present-singular-subjunctive-third-person":"să etatizeze","first-person-plural-present-subjunctive":"să etatizăm","plural-present-second-person-subjunctive":"să etatizați","plural-present-subjunctive-third-person":"să etatizeze","imperative-second-person-singular":"etatizează","imperative-plural-second-person":"etatizați","imperative-negative-second-person-singular":"nu etatiza","imperative-negative-plural-second-person":"nu etatizați"}},{"word":"etatizare","pos":"noun","definitions":["nationalization"],"forms":{"plural":"etatizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etatizare","accusative-definite-nominative-singular":"etatizarea","accusative-indefinite-nominative-plural":"etatizări","accusative-definite-nominative-plural":"etatizările","dative-genitive-indefinite-singular":"etatizări","dative-definite-genitive-singular":"etatizării","dative-genitive-indefinite-plural":"etatizări","dative-definite-genitive-plural":"etatizărilor","singular-vocative":"etatizare","plural-vocative":"etatizărilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"etatizat","pos":"adj","definitions":["nationalized"],"forms":{"feminine-singular":"etatizată","masculine-plural":"etatizați","feminine-neuter-plural":"etatizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etatizat","error-unrecognized-form-feminine-indefinite-singular":"etatizată","error-unrecognized-form-indefinite-masculine-plural":"etatizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etatizate","definite-error-unrecognized-form-masculine-neuter-singular":"etatizatul","definite-error-unrecognized-form-feminine-singular":"etatizata","definite-error-unrecognized-form-masculine-plural":"etatizații","definite-error-unrecognized-form-feminine-neuter-plural":"etatizatele"}},{"word":"etcetera","pos":"adv","definitions":["et cetera"],"pronunciation":"/etˈtʃe.te.ra/","forms":{"alternative":"et cetera"}},{"word":"ete","pos":"intj","definitions":["obsolete form of iată"]},{"word":"Etegan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Etegan"}},{"word":"etenă","pos":"noun","definitions":["ethene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etenă","accusative-definite-nominative-singular":"etena","accusative-indefinite-nominative-plural":"etene","accusative-definite-nominative-plural":"etenele","dative-genitive-indefinite-singular":"etene","dative-definite-genitive-singular":"etenei","dative-genitive-indefinite-plural":"etene","dative-definite-genitive-plural":"etenelor","singular-vocative":"etenă","plural-vocative":"etenelor"}},{"word":"eter","pos":"noun","definitions":["ether (compound containing an oxygen atom bonded to two hydrocarbon groups)","ether (substance once thought to fill all space)"],"forms":{"plural":"eteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eter","accusative-definite-nominative-singular":"eterul","accusative-indefinite-nominative-plural":"eteri","accusative-definite-nominative-plural":"eterii","dative-genitive-indefinite-singular":"eter","dative-definite-genitive-singular":"eterului","dative-genitive-indefinite-plural":"eteri","dative-definite-genitive-plural":"eterilor","singular-vocative":"eterule","plural-vocative":"eterilor"}},{"word":"eter","pos":"noun","definitions":["air, sky, atmosphere","ether (classical physical element)"],"forms":{"plural":"eteruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eter","accusative-definite-nominative-singular":"eterul","accusative-indefinite-nominative-plural":"eteruri","accusative-definite-nominative-plural":"eterurile","dative-genitive-indefinite-singular":"eter","dative-definite-genitive-singular":"eterului","dative-genitive-indefinite-plural":"eteruri","dative-definite-genitive-plural":"eterurilor","singular-vocative":"eterule","plural-vocative":"eterurilor"}},{"word":"eter etilic","pos":"noun","definitions":["ethyl ether"]},{"word":"eterat","pos":"noun","definitions":["ethereal"],"forms":{"plural":"eterați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eterat","accusative-definite-nominative-singular":"eteratul","accusative-indefinite-nominative-plural":"eterați","accusative-definite-nominative-plural":"eterații","dative-genitive-indefinite-singular":"eterat","dative-definite-genitive-singular":"eteratului","dative-genitive-indefinite-plural":"eterați","dative-definite-genitive-plural":"eteraților","singular-vocative":"eteratule","plural-vocative":"eteraților"}},{"word":"etereu","pos":"adj","definitions":["ethereal"],"forms":{"feminine-singular":"eteree","masculine-plural":"eterei","feminine-neuter-plural":"eteree","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etereu","error-unrecognized-form-feminine-indefinite-singular":"eteree","error-unrecognized-form-indefinite-masculine-plural":"eterei","error-unrecognized-form-feminine-indefinite-neuter-plural":"eteree","definite-error-unrecognized-form-masculine-neuter-singular":"etereul","definite-error-unrecognized-form-feminine-singular":"etereea","definite-error-unrecognized-form-masculine-plural":"etereii","definite-error-unrecognized-form-feminine-neuter-plural":"etereele"}},{"word":"eteric","pos":"adj","definitions":["ethereal"],"forms":{"feminine-singular":"eterică","masculine-plural":"eterici","feminine-neuter-plural":"eterice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eteric","error-unrecognized-form-feminine-indefinite-singular":"eterică","error-unrecognized-form-indefinite-masculine-plural":"eterici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterice","definite-error-unrecognized-form-masculine-neuter-singular":"etericul","definite-error-unrecognized-form-feminine-singular":"eterica","definite-error-unrecognized-form-masculine-plural":"etericii","definite-error-unrecognized-form-feminine-neuter-plural":"etericele"}},{"word":"eterifica","pos":"verb","definitions":["to etherify"],"forms":{"canonical":"a eterifica 1st conjugation","present-singular-third-person":"eterifică","participle-past":"eterificat","subjunctive-third-person":"eterifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a eterifica","gerund":"eterificând","first-person-indicative-present-singular":"eterific","indicative-present-second-person-singular":"eterifici","indicative-present-singular-third-person":"eterifică","first-person-indicative-plural-present":"eterificăm","indicative-plural-present-second-person":"eterificați","indicative-plural-present-third-person":"eterifică","first-person-imperfect-indicative-singular":"eterificam","imperfect-indicative-second-person-singular":"eterificai","imperfect-indicative-singular-third-person":"eterifica","first-person-imperfect-indicative-plural":"eterificam","imperfect-indicative-plural-second-person":"eterificați","imperfect-indicative-plural-third-person":"eterificau","first-person-indicative-perfect-singular":"eterificai","indicative-perfect-second-person-singular":"eterificași","indicative-perfect-singular-third-person":"eterifică","first-person-indicative-perfect-plural":"eterificarăm","indicative-perfect-plural-second-person":"eterificarăți","indicative-perfect-plural-third-person":"eterificară","first-person-indicative-pluperfect-singular":"eterificasem","indicative-pluperfect-second-person-singular":"eterificaseși","indicative-pluperfect-singular-third-person":"eterificase","first-person-indicative-pluperfect-plural":"eterificaserăm","indicative-pluperfect-plural-second-person":"eterificaserăți","indicative-pluperfect-plural-third-person":"eterificaseră","first-person-present-singular-subjunctive":"să eterific","present-second-person-singular-subjunctive":"să eterifici","present-singular-subjunctive-third-person":"să eterifice","first-person-plural-present-subjunctive":"să eterificăm","plural-present-second-person-subjunctive":"să eterificați","plural-present-subjunctive-third-person":"să eterifice","imperative-second-person-singular":"eterifică","imperative-plural-second-person":"eterificați","imperative-negative-second-person-singular":"nu eterifica","imperative-negative-plural-second-person":"nu eterificați"}},{"word":"eterificare","pos":"noun","definitions":["etherification"],"forms":{"plural":"eterificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eterificare","accusative-definite-nominative-singular":"eterificarea","accusative-indefinite-nominative-plural":"eterificări","accusative-definite-nominative-plural":"eterificările","dative-genitive-indefinite-singular":"eterificări","dative-definite-genitive-singular":"eterificării","dative-genitive-indefinite-plural":"eterificări","dative-definite-genitive-plural":"eterificărilor","singular-vocative":"eterificare","plural-vocative":"eterificărilor"}},{"word":"eterism","pos":"noun","definitions":["etherism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eterism","accusative-definite-nominative":"eterismul","dative-genitive-indefinite":"eterism","dative-definite-genitive":"eterismului","vocative":"eterismule"}},{"word":"eterist","pos":"noun","definitions":["etherist"],"forms":{"plural":"eteriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eterist","accusative-definite-nominative-singular":"eteristul","accusative-indefinite-nominative-plural":"eteristi","accusative-definite-nominative-plural":"eteristii","dative-genitive-indefinite-singular":"eterist","dative-definite-genitive-singular":"eteristului","dative-genitive-indefinite-plural":"eteristi","dative-definite-genitive-plural":"eteristilor","singular-vocative":"eteristule","plural-vocative":"eteristilor"}},{"word":"eteriza","pos":"verb","definitions":["to etherize"],"forms":{"canonical":"a eteriza 1st conjugation","present-singular-third-person":"eterizează","participle-past":"eterizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eteriza","gerund":"eterizând","first-person-indicative-present-singular":"eterizez","indicative-present-second-person-singular":"eterizezi","indicative-present-singular-third-person":"eterizează","first-person-indicative-plural-present":"eterizăm","indicative-plural-present-second-person":"eterizați","indicative-plural-present-third-person":"eterizează","first-person-imperfect-indicative-singular":"eterizam","imperfect-indicative-second-person-singular":"eterizai","imperfect-indicative-singular-third-person":"eteriza","first-person-imperfect-indicative-plural":"eterizam","imperfect-indicative-plural-second-person":"eterizați","imperfect-indicative-plural-third-person":"eterizau","first-person-indicative-perfect-singular":"eterizai","indicative-perfect-second-person-singular":"eterizași","indicative-perfect-singular-third-person":"eteriză","first-person-indicative-perfect-plural":"eterizarăm","indicative-perfect-plural-second-person":"eterizarăți","indicative-perfect-plural-third-person":"eterizară","first-person-indicative-pluperfect-singular":"eterizasem","indicative-pluperfect-second-person-singular":"eterizaseși","indicative-pluperfect-singular-third-person":"eterizase","first-person-indicative-pluperfect-plural":"eterizaserăm","indicative-pluperfect-plural-second-person":"eterizaserăți","indicative-pluperfect-plural-third-person":"eterizaseră","first-person-present-singular-subjunctive":"să eterizez","present-second-person-singular-subjunctive":"să eterizezi","present-singular-subjunctive-third-person":"să eterizeze","first-person-plural-present-subjunctive":"să eterizăm","plural-present-second-person-subjunctive":"să eterizați","plural-present-subjunctive-third-person":"să eterizeze","imperative-second-person-singular":"eterizează","imperative-plural-second-person":"eterizați","imperative-negative-second-person-singular":"nu eteriza","imperative-negative-plural-second-person":"nu eterizați"}},{"word":"eterizare","pos":"noun","definitions":["etherization"],"forms":{"plural":"eterizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eterizare","accusative-definite-nominative-singular":"eterizarea","accusative-indefinite-nominative-plural":"eterizări","accusative-definite-nominative-plural":"eterizările","dative-genitive-indefinite-singular":"eterizări","dative-definite-genitive-singular":"eterizării","dative-genitive-indefinite-plural":"eterizări","dative-definite-genitive-plural":"eterizărilor","singular-vocative":"eterizare","plural-vocative":"eterizărilor"}},{"word":"etern","pos":"adj","definitions":["eternal, perpetual"],"forms":{"feminine-singular":"eternă","masculine-plural":"eterni","feminine-neuter-plural":"eterne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etern","error-unrecognized-form-feminine-indefinite-singular":"eternă","error-unrecognized-form-indefinite-masculine-plural":"eterni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterne","definite-error-unrecognized-form-masculine-neuter-singular":"eternul","definite-error-unrecognized-form-feminine-singular":"eterna","definite-error-unrecognized-form-masculine-plural":"eternii","definite-error-unrecognized-form-feminine-neuter-plural":"eternele"}},{"word":"eternamente","pos":"adv","definitions":["eternally"]},{"word":"eternit","pos":"noun","definitions":["asbestos cement"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eternit","accusative-definite-nominative":"eternitul","dative-genitive-indefinite":"eternit","dative-definite-genitive":"eternitului","vocative":"eternitule"}},{"word":"eternitate","pos":"noun","definitions":["eternity"],"forms":{"plural":"eternități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"eternitate","accusative-definite-nominative-singular":"eternitatea","accusative-indefinite-nominative-plural":"eternități","accusative-definite-nominative-plural":"eternitățile","dative-genitive-indefinite-singular":"eternități","dative-definite-genitive-singular":"eternității","dative-genitive-indefinite-plural":"eternități","dative-definite-genitive-plural":"eternităților","singular-vocative":"eternitate","plural-vocative":"eternităților"}},{"word":"eterniza","pos":"verb","definitions":["to eternize"],"forms":{"canonical":"a eterniza 1st conjugation","present-singular-third-person":"eternizează","participle-past":"eternizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eterniza","gerund":"eternizând","first-person-indicative-present-singular":"eternizez","indicative-present-second-person-singular":"eternizezi","indicative-present-singular-third-person":"eternizează","first-person-indicative-plural-present":"eternizăm","indicative-plural-present-second-person":"eternizați","indicative-plural-present-third-person":"eternizează","first-person-imperfect-indicative-singular":"eternizam","imperfect-indicative-second-person-singular":"eternizai","imperfect-indicative-singular-third-person":"eterniza","first-person-imperfect-indicative-plural":"eternizam","imperfect-indicative-plural-second-person":"eternizați","imperfect-indicative-plural-third-person":"eternizau","first-person-indicative-perfect-singular":"eternizai","indicative-perfect-second-person-singular":"eternizași","indicative-perfect-singular-third-person":"eterniză","first-person-indicative-perfect-plural":"eternizarăm","indicative-perfect-plural-second-person":"eternizarăți","indicative-perfect-plural-third-person":"eternizară","first-person-indicative-pluperfect-singular":"eternizasem","indicative-pluperfect-second-person-singular":"eternizaseși","indicative-pluperfect-singular-third-person":"eternizase","first-person-indicative-pluperfect-plural":"eternizaserăm","indicative-pluperfect-plural-second-person":"eternizaserăți","indicative-pluperfect-plural-third-person":"eternizaseră","first-person-present-singular-subjunctive":"să eternizez","present-second-person-singular-subjunctive":"să eternizezi","present-singular-subjunctive-third-person":"să eternizeze","first-person-plural-present-subjunctive":"să eternizăm","plural-present-second-person-subjunctive":"să eternizați","plural-present-subjunctive-third-person":"să eternizeze","imperative-second-person-singular":"eternizează","imperative-plural-second-person":"eternizați","imperative-negative-second-person-singular":"nu eterniza","imperative-negative-plural-second-person":"nu eternizați"}},{"word":"eternizare","pos":"noun","definitions":["perpetuation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"eternizare","accusative-definite-nominative":"eternizarea","dative-genitive-indefinite":"eternizare","dative-definite-genitive":"eternizarei","vocative":"eternizare"}},{"word":"eternizat","pos":"adj","definitions":["made eternal"],"forms":{"feminine-singular":"eternizată","masculine-plural":"eternizați","feminine-neuter-plural":"eternizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eternizat","error-unrecognized-form-feminine-indefinite-singular":"eternizată","error-unrecognized-form-indefinite-masculine-plural":"eternizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eternizate","definite-error-unrecognized-form-masculine-neuter-singular":"eternizatul","definite-error-unrecognized-form-feminine-singular":"eternizata","definite-error-unrecognized-form-masculine-plural":"eternizații","definite-error-unrecognized-form-feminine-neuter-plural":"eternizatele"}},{"word":"eteroclit","pos":"adj","definitions":["alternative form of heteroclit"],"forms":{"feminine-singular":"eteroclită","masculine-plural":"eterocliți","feminine-neuter-plural":"eteroclite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eteroclit","error-unrecognized-form-feminine-indefinite-singular":"eteroclită","error-unrecognized-form-indefinite-masculine-plural":"eterocliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"eteroclite","definite-error-unrecognized-form-masculine-neuter-singular":"eteroclitul","definite-error-unrecognized-form-feminine-singular":"eteroclita","definite-error-unrecognized-form-masculine-plural":"eterocliții","definite-error-unrecognized-form-feminine-neuter-plural":"eteroclitele"}},{"word":"eterodină","pos":"noun","definitions":["alternative form of heterodină"],"forms":{"plural":"eterodine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eterodină","accusative-definite-nominative-singular":"eterodina","accusative-indefinite-nominative-plural":"eterodine","accusative-definite-nominative-plural":"eterodinele","dative-genitive-indefinite-singular":"eterodine","dative-definite-genitive-singular":"eterodinei","dative-genitive-indefinite-plural":"eterodine","dative-definite-genitive-plural":"eterodinelor","singular-vocative":"eterodină","plural-vocative":"eterodinelor"}},{"word":"eterodox","pos":"adj","definitions":["heterodox"],"forms":{"feminine-singular":"eterodoxă","masculine-plural":"eterodocși","feminine-neuter-plural":"eterodoxe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eterodox","error-unrecognized-form-feminine-indefinite-singular":"eterodoxă","error-unrecognized-form-indefinite-masculine-plural":"eterodocși","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterodoxe","definite-error-unrecognized-form-masculine-neuter-singular":"eterodoxul","definite-error-unrecognized-form-feminine-singular":"eterodoxa","definite-error-unrecognized-form-masculine-plural":"eterodocșii","definite-error-unrecognized-form-feminine-neuter-plural":"eterodoxele"}},{"word":"eterodoxie","pos":"noun","definitions":["heterodoxy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eterodoxie","accusative-definite-nominative":"eterodoxia","dative-genitive-indefinite":"eterodoxii","dative-definite-genitive":"eterodoxiei","vocative":"eterodoxie"}},{"word":"eterofon","pos":"adj","definitions":["alternative form of heterofon"],"forms":{"feminine-singular":"eterofonă","masculine-plural":"eterofoni","feminine-neuter-plural":"eterofone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eterofon","error-unrecognized-form-feminine-indefinite-singular":"eterofonă","error-unrecognized-form-indefinite-masculine-plural":"eterofoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterofone","definite-error-unrecognized-form-masculine-neuter-singular":"eterofonul","definite-error-unrecognized-form-feminine-singular":"eterofona","definite-error-unrecognized-form-masculine-plural":"eterofonii","definite-error-unrecognized-form-feminine-neuter-plural":"eterofonele"}},{"word":"eterofonie","pos":"noun","definitions":["alternative form of heterofonie"],"forms":{"plural":"eterofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eterofonie","accusative-definite-nominative-singular":"eterofonia","accusative-indefinite-nominative-plural":"eterofonii","accusative-definite-nominative-plural":"eterofoniile","dative-genitive-indefinite-singular":"eterofonii","dative-definite-genitive-singular":"eterofoniei","dative-genitive-indefinite-plural":"eterofonii","dative-definite-genitive-plural":"eterofoniilor","singular-vocative":"eterofonie","plural-vocative":"eterofoniilor"}},{"word":"eterogen","pos":"adj","definitions":["heterogeneous"],"pronunciation":"/ˌe.te.roˈd͡ʒen/","forms":{"feminine-singular":"eterogenă","masculine-plural":"eterogeni","feminine-neuter-plural":"eterogene","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"eterogen","error-unrecognized-form-feminine-indefinite-singular":"eterogenă","error-unrecognized-form-indefinite-masculine-plural":"eterogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterogene","definite-error-unrecognized-form-masculine-neuter-singular":"eterogenul","definite-error-unrecognized-form-feminine-singular":"eterogena","definite-error-unrecognized-form-masculine-plural":"eterogenii","definite-error-unrecognized-form-feminine-neuter-plural":"eterogenele"}},{"word":"eterogenie","pos":"noun","definitions":["heterogeny"],"forms":{"plural":"eterogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eterogenie","accusative-definite-nominative-singular":"eterogenia","accusative-indefinite-nominative-plural":"eterogenii","accusative-definite-nominative-plural":"eterogeniile","dative-genitive-indefinite-singular":"eterogenii","dative-definite-genitive-singular":"eterogeniei","dative-genitive-indefinite-plural":"eterogenii","dative-definite-genitive-plural":"eterogeniilor","singular-vocative":"eterogenie","plural-vocative":"eterogeniilor"}},{"word":"eterogenitate","pos":"noun","definitions":["heterogeneousness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"eterogenitate","accusative-definite-nominative":"eterogenitatea","dative-genitive-indefinite":"eterogenități","dative-definite-genitive":"eterogenității","vocative":"eterogenitate"}},{"word":"eterogrefă","pos":"noun","definitions":["alternative form of heterogrefă"],"forms":{"plural":"eterogrefe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eterogrefă","accusative-definite-nominative-singular":"eterogrefa","accusative-indefinite-nominative-plural":"eterogrefe","accusative-definite-nominative-plural":"eterogrefele","dative-genitive-indefinite-singular":"eterogrefe","dative-definite-genitive-singular":"eterogrefei","dative-genitive-indefinite-plural":"eterogrefe","dative-definite-genitive-plural":"eterogrefelor","singular-vocative":"eterogrefă","plural-vocative":"eterogrefelor"}},{"word":"eteroman","pos":"noun","definitions":["etheromaniac"],"forms":{"plural":"eteromani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eteroman","accusative-definite-nominative-singular":"eteromanul","accusative-indefinite-nominative-plural":"eteromani","accusative-definite-nominative-plural":"eteromanii","dative-genitive-indefinite-singular":"eteroman","dative-definite-genitive-singular":"eteromanului","dative-genitive-indefinite-plural":"eteromani","dative-definite-genitive-plural":"eteromanilor","singular-vocative":"eteromanule","plural-vocative":"eteromanilor"}},{"word":"eteromană","pos":"noun","definitions":["female equivalent of eteroman"],"forms":{"plural":"eteromane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eteromană","accusative-definite-nominative-singular":"eteromana","accusative-indefinite-nominative-plural":"eteromane","accusative-definite-nominative-plural":"eteromanele","dative-genitive-indefinite-singular":"eteromane","dative-definite-genitive-singular":"eteromanei","dative-genitive-indefinite-plural":"eteromane","dative-definite-genitive-plural":"eteromanelor","singular-vocative":"eteromană","plural-vocative":"eteromanelor"}},{"word":"eteromanie","pos":"noun","definitions":["etheromania"],"forms":{"plural":"eteromanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eteromanie","accusative-definite-nominative-singular":"eteromania","accusative-indefinite-nominative-plural":"eteromanii","accusative-definite-nominative-plural":"eteromaniile","dative-genitive-indefinite-singular":"eteromanii","dative-definite-genitive-singular":"eteromaniei","dative-genitive-indefinite-plural":"eteromanii","dative-definite-genitive-plural":"eteromaniilor","singular-vocative":"eteromanie","plural-vocative":"eteromaniilor"}},{"word":"eterometric","pos":"adj","definitions":["heterometric"],"forms":{"feminine-singular":"eterometrică","masculine-plural":"eterometrici","feminine-neuter-plural":"eterometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eterometric","error-unrecognized-form-feminine-indefinite-singular":"eterometrică","error-unrecognized-form-indefinite-masculine-plural":"eterometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eterometrice","definite-error-unrecognized-form-masculine-neuter-singular":"eterometricul","definite-error-unrecognized-form-feminine-singular":"eterometrica","definite-error-unrecognized-form-masculine-plural":"eterometricii","definite-error-unrecognized-form-feminine-neuter-plural":"eterometricele"}},{"word":"eteromorf","pos":"adj","definitions":["alternative form of heteromorf"],"forms":{"feminine-singular":"eteromorfă","masculine-plural":"eteromorfi","feminine-neuter-plural":"eteromorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eteromorf","error-unrecognized-form-feminine-indefinite-singular":"eteromorfă","error-unrecognized-form-indefinite-masculine-plural":"eteromorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eteromorfe","definite-error-unrecognized-form-masculine-neuter-singular":"eteromorful","definite-error-unrecognized-form-feminine-singular":"eteromorfa","definite-error-unrecognized-form-masculine-plural":"eteromorfii","definite-error-unrecognized-form-feminine-neuter-plural":"eteromorfele"}},{"word":"eteronim","pos":"adj","definitions":["alternative form of heteronim"],"forms":{"feminine-singular":"eteronimă","masculine-plural":"eteronimi","feminine-neuter-plural":"eteronime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eteronim","error-unrecognized-form-feminine-indefinite-singular":"eteronimă","error-unrecognized-form-indefinite-masculine-plural":"eteronimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eteronime","definite-error-unrecognized-form-masculine-neuter-singular":"eteronimul","definite-error-unrecognized-form-feminine-singular":"eteronima","definite-error-unrecognized-form-masculine-plural":"eteronimii","definite-error-unrecognized-form-feminine-neuter-plural":"eteronimele"}},{"word":"eteronom","pos":"adj","definitions":["alternative form of heteronom"],"forms":{"feminine-singular":"eteronomă","masculine-plural":"eteronomi","feminine-neuter-plural":"eteronome","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eteronom","error-unrecognized-form-feminine-indefinite-singular":"eteronomă","error-unrecognized-form-indefinite-masculine-plural":"eteronomi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eteronome","definite-error-unrecognized-form-masculine-neuter-singular":"eteronomul","definite-error-unrecognized-form-feminine-singular":"eteronoma","definite-error-unrecognized-form-masculine-plural":"eteronomii","definite-error-unrecognized-form-feminine-neuter-plural":"eteronomele"}},{"word":"eteronomie","pos":"noun","definitions":["alternative form of heteronomie"],"forms":{"plural":"eteronomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eteronomie","accusative-definite-nominative-singular":"eteronomia","accusative-indefinite-nominative-plural":"eteronomii","accusative-definite-nominative-plural":"eteronomiile","dative-genitive-indefinite-singular":"eteronomii","dative-definite-genitive-singular":"eteronomiei","dative-genitive-indefinite-plural":"eteronomii","dative-definite-genitive-plural":"eteronomiilor","singular-vocative":"eteronomie","plural-vocative":"eteronomiilor"}},{"word":"eteroproteidă","pos":"noun","definitions":["alternative form of heteroproteidă"],"forms":{"plural":"eteroproteide"}},{"word":"eterosferă","pos":"noun","definitions":["alternative form of heterosferă"],"forms":{"plural":"eterosfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eterosferă","accusative-definite-nominative-singular":"eterosfera","accusative-indefinite-nominative-plural":"eterosfere","accusative-definite-nominative-plural":"eterosferele","dative-genitive-indefinite-singular":"eterosfere","dative-definite-genitive-singular":"eterosferei","dative-genitive-indefinite-plural":"eterosfere","dative-definite-genitive-plural":"eterosferelor","singular-vocative":"eterosferă","plural-vocative":"eterosferelor"}},{"word":"eterosugestie","pos":"noun","definitions":["alternative form of heterosugestie"],"forms":{"plural":"eterosugestii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eterosugestie","accusative-definite-nominative-singular":"eterosugestia","accusative-indefinite-nominative-plural":"eterosugestii","accusative-definite-nominative-plural":"eterosugestiile","dative-genitive-indefinite-singular":"eterosugestii","dative-definite-genitive-singular":"eterosugestiei","dative-genitive-indefinite-plural":"eterosugestii","dative-definite-genitive-plural":"eterosugestiilor","singular-vocative":"eterosugestie","plural-vocative":"eterosugestiilor"}},{"word":"ețetera","pos":"adv","definitions":["alternative form of etcetera"],"pronunciation":"/eˈt͡se.te.ra/"},{"word":"etiaj","pos":"noun","definitions":["lowest water level (of a river course)"],"forms":{"plural":"etiaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etiaj","accusative-definite-nominative-singular":"etiajul","accusative-indefinite-nominative-plural":"etiaje","accusative-definite-nominative-plural":"etiajele","dative-genitive-indefinite-singular":"etiaj","dative-definite-genitive-singular":"etiajului","dative-genitive-indefinite-plural":"etiaje","dative-definite-genitive-plural":"etiajelor","singular-vocative":"etiajule","plural-vocative":"etiajelor"}},{"word":"etic","pos":"adj","definitions":["ethic"],"forms":{"feminine-singular":"etică","masculine-plural":"etici","feminine-neuter-plural":"etice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etic","error-unrecognized-form-feminine-indefinite-singular":"etică","error-unrecognized-form-indefinite-masculine-plural":"etici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etice","definite-error-unrecognized-form-masculine-neuter-singular":"eticul","definite-error-unrecognized-form-feminine-singular":"etica","definite-error-unrecognized-form-masculine-plural":"eticii","definite-error-unrecognized-form-feminine-neuter-plural":"eticele"}},{"word":"etică","pos":"noun","definitions":["ethics","morality"],"forms":{"plural":"etici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"etică","accusative-definite-nominative":"etica","dative-genitive-indefinite":"etici","dative-definite-genitive":"eticii","vocative":"etică"}},{"word":"eticesc","pos":"adj","definitions":["ethic"],"forms":{"feminine-singular":"eticească","plural":"eticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eticesc","error-unrecognized-form-feminine-indefinite-singular":"eticească","error-unrecognized-form-indefinite-masculine-plural":"eticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"eticești","definite-error-unrecognized-form-masculine-neuter-singular":"eticescul","definite-error-unrecognized-form-feminine-singular":"eticeasca","definite-error-unrecognized-form-masculine-plural":"eticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"eticeștile"}},{"word":"eticește","pos":"adv","definitions":["ethically"]},{"word":"eticheta","pos":"verb","definitions":["to label"],"forms":{"canonical":"a eticheta 1st conjugation","present-singular-third-person":"etichetează","participle-past":"etichetat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eticheta","gerund":"etichetând","first-person-indicative-present-singular":"etichetez","indicative-present-second-person-singular":"etichetezi","indicative-present-singular-third-person":"etichetează","first-person-indicative-plural-present":"etichetăm","indicative-plural-present-second-person":"etichetați","indicative-plural-present-third-person":"etichetează","first-person-imperfect-indicative-singular":"etichetam","imperfect-indicative-second-person-singular":"etichetai","imperfect-indicative-singular-third-person":"eticheta","first-person-imperfect-indicative-plural":"etichetam","imperfect-indicative-plural-second-person":"etichetați","imperfect-indicative-plural-third-person":"etichetau","first-person-indicative-perfect-singular":"etichetai","indicative-perfect-second-person-singular":"etichetași","indicative-perfect-singular-third-person":"etichetă","first-person-indicative-perfect-plural":"etichetarăm","indicative-perfect-plural-second-person":"etichetarăți","indicative-perfect-plural-third-person":"etichetară","first-person-indicative-pluperfect-singular":"etichetasem","indicative-pluperfect-second-person-singular":"etichetaseși","indicative-pluperfect-singular-third-person":"etichetase","first-person-indicative-pluperfect-plural":"etichetaserăm","indicative-pluperfect-plural-second-person":"etichetaserăți","indicative-pluperfect-plural-third-person":"etichetaseră","first-person-present-singular-subjunctive":"să etichetez","present-second-person-singular-subjunctive":"să etichetezi","present-singular-subjunctive-third-person":"să eticheteze","first-person-plural-present-subjunctive":"să etichetăm","plural-present-second-person-subjunctive":"să etichetați","plural-present-subjunctive-third-person":"să eticheteze","imperative-second-person-singular":"etichetează","imperative-plural-second-person":"etichetați","imperative-negative-second-person-singular":"nu eticheta","imperative-negative-plural-second-person":"nu etichetați"}},{"word":"etichetă","pos":"noun","definitions":["label, tag (identifier on a product)","label (term used to categorise someone)","etiquette"],"pronunciation":"/e.tiˈke.tə/","forms":{"plural":"etichete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etichetă","accusative-definite-nominative-singular":"eticheta","accusative-indefinite-nominative-plural":"etichete","accusative-definite-nominative-plural":"etichetele","dative-genitive-indefinite-singular":"etichete","dative-definite-genitive-singular":"etichetei","dative-genitive-indefinite-plural":"etichete","dative-definite-genitive-plural":"etichetelor","singular-vocative":"etichetă","plural-vocative":"etichetelor","alternative-obsolete":"etichet"}},{"word":"etichetă","pos":"verb","definitions":["third-person singular simple perfect indicative of eticheta (“to label”)"],"pronunciation":"/e.ti.keˈtə/"},{"word":"etichetare","pos":"noun","definitions":["labeling"],"forms":{"plural":"etichetări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etichetare","accusative-definite-nominative-singular":"etichetarea","accusative-indefinite-nominative-plural":"etichetări","accusative-definite-nominative-plural":"etichetările","dative-genitive-indefinite-singular":"etichetări","dative-definite-genitive-singular":"etichetării","dative-genitive-indefinite-plural":"etichetări","dative-definite-genitive-plural":"etichetărilor","singular-vocative":"etichetare","plural-vocative":"etichetărilor"}},{"word":"etichetat","pos":"adj","definitions":["labeled"],"forms":{"feminine-singular":"etichetată","masculine-plural":"etichetați","feminine-neuter-plural":"etichetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etichetat","error-unrecognized-form-feminine-indefinite-singular":"etichetată","error-unrecognized-form-indefinite-masculine-plural":"etichetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etichetate","definite-error-unrecognized-form-masculine-neuter-singular":"etichetatul","definite-error-unrecognized-form-feminine-singular":"etichetata","definite-error-unrecognized-form-masculine-plural":"etichetații","definite-error-unrecognized-form-feminine-neuter-plural":"etichetatele"}},{"word":"etici","pos":"adj","definitions":["nominative/accusative masculine plural of etic"],"gender":"m-p"},{"word":"etician","pos":"noun","definitions":["ethicist"],"forms":{"plural":"eticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etician","accusative-definite-nominative-singular":"eticianul","accusative-indefinite-nominative-plural":"eticieni","accusative-definite-nominative-plural":"eticienii","dative-genitive-indefinite-singular":"etician","dative-definite-genitive-singular":"eticianului","dative-genitive-indefinite-plural":"eticieni","dative-definite-genitive-plural":"eticienilor","singular-vocative":"eticianule","plural-vocative":"eticienilor"}},{"word":"eticiană","pos":"noun","definitions":["female equivalent of etician"],"forms":{"plural":"eticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eticiană","accusative-definite-nominative-singular":"eticiana","accusative-indefinite-nominative-plural":"eticiene","accusative-definite-nominative-plural":"eticienele","dative-genitive-indefinite-singular":"eticiene","dative-definite-genitive-singular":"eticienei","dative-genitive-indefinite-plural":"eticiene","dative-definite-genitive-plural":"eticienelor","singular-vocative":"eticiană","plural-vocative":"eticienelor"}},{"word":"eticism","pos":"noun","definitions":["ethicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eticism","accusative-definite-nominative":"eticismul","dative-genitive-indefinite":"eticism","dative-definite-genitive":"eticismului","vocative":"eticismule"}},{"word":"eticiza","pos":"verb","definitions":["to ethicize"],"forms":{"canonical":"a eticiza 1st conjugation","present-singular-third-person":"eticizează","participle-past":"eticizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eticiza","gerund":"eticizând","first-person-indicative-present-singular":"eticizez","indicative-present-second-person-singular":"eticizezi","indicative-present-singular-third-person":"eticizează","first-person-indicative-plural-present":"eticizăm","indicative-plural-present-second-person":"eticizați","indicative-plural-present-third-person":"eticizează","first-person-imperfect-indicative-singular":"eticizam","imperfect-indicative-second-person-singular":"eticizai","imperfect-indicative-singular-third-person":"eticiza","first-person-imperfect-indicative-plural":"eticizam","imperfect-indicative-plural-second-person":"eticizați","imperfect-indicative-plural-third-person":"eticizau","first-person-indicative-perfect-singular":"eticizai","indicative-perfect-second-person-singular":"eticizași","indicative-perfect-singular-third-person":"eticiză","first-person-indicative-perfect-plural":"eticizarăm","indicative-perfect-plural-second-person":"eticizarăți","indicative-perfect-plural-third-person":"eticizară","first-person-indicative-pluperfect-singular":"eticizasem","indicative-pluperfect-second-person-singular":"eticizaseși","indicative-pluperfect-singular-third-person":"eticizase","first-person-indicative-pluperfect-plural":"eticizaserăm","indicative-pluperfect-plural-second-person":"eticizaserăți","indicative-pluperfect-plural-third-person":"eticizaseră","first-person-present-singular-subjunctive":"să eticizez","present-second-person-singular-subjunctive":"să eticizezi","present-singular-subjunctive-third-person":"să eticizeze","first-person-plural-present-subjunctive":"să eticizăm","plural-present-second-person-subjunctive":"să eticizați","plural-present-subjunctive-third-person":"să eticizeze","imperative-second-person-singular":"eticizează","imperative-plural-second-person":"eticizați","imperative-negative-second-person-singular":"nu eticiza","imperative-negative-plural-second-person":"nu eticizați"}},{"word":"etil","pos":"noun","definitions":["ethyl"],"pronunciation":"/eˈtil/","forms":{"plural":"etili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etil","accusative-definite-nominative-singular":"etilul","accusative-indefinite-nominative-plural":"etili","accusative-definite-nominative-plural":"etilii","dative-genitive-indefinite-singular":"etil","dative-definite-genitive-singular":"etilului","dative-genitive-indefinite-plural":"etili","dative-definite-genitive-plural":"etililor","singular-vocative":"etilule","plural-vocative":"etililor"}},{"word":"etila","pos":"verb","definitions":["to ethylate"],"forms":{"canonical":"a etila 1st conjugation","present-singular-third-person":"etilează","participle-past":"etilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etila","gerund":"etilând","first-person-indicative-present-singular":"etilez","indicative-present-second-person-singular":"etilezi","indicative-present-singular-third-person":"etilează","first-person-indicative-plural-present":"etilăm","indicative-plural-present-second-person":"etilați","indicative-plural-present-third-person":"etilează","first-person-imperfect-indicative-singular":"etilam","imperfect-indicative-second-person-singular":"etilai","imperfect-indicative-singular-third-person":"etila","first-person-imperfect-indicative-plural":"etilam","imperfect-indicative-plural-second-person":"etilați","imperfect-indicative-plural-third-person":"etilau","first-person-indicative-perfect-singular":"etilai","indicative-perfect-second-person-singular":"etilași","indicative-perfect-singular-third-person":"etilă","first-person-indicative-perfect-plural":"etilarăm","indicative-perfect-plural-second-person":"etilarăți","indicative-perfect-plural-third-person":"etilară","first-person-indicative-pluperfect-singular":"etilasem","indicative-pluperfect-second-person-singular":"etilaseși","indicative-pluperfect-singular-third-person":"etilase","first-person-indicative-pluperfect-plural":"etilaserăm","indicative-pluperfect-plural-second-person":"etilaserăți","indicative-pluperfect-plural-third-person":"etilaseră","first-person-present-singular-subjunctive":"să etilez","present-second-person-singular-subjunctive":"să etilezi","present-singular-subjunctive-third-person":"să etileze","first-person-plural-present-subjunctive":"să etilăm","plural-present-second-person-subjunctive":"să etilați","plural-present-subjunctive-third-person":"să etileze","imperative-second-person-singular":"etilează","imperative-plural-second-person":"etilați","imperative-negative-second-person-singular":"nu etila","imperative-negative-plural-second-person":"nu etilați"}},{"word":"etilamină","pos":"noun","definitions":["ethylamine"],"forms":{"plural":"etilamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etilamină","accusative-definite-nominative-singular":"etilamina","accusative-indefinite-nominative-plural":"etilamine","accusative-definite-nominative-plural":"etilaminele","dative-genitive-indefinite-singular":"etilamine","dative-definite-genitive-singular":"etilaminei","dative-genitive-indefinite-plural":"etilamine","dative-definite-genitive-plural":"etilaminelor","singular-vocative":"etilamină","plural-vocative":"etilaminelor"}},{"word":"etilare","pos":"noun","definitions":["ethylation"],"forms":{"plural":"etilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etilare","accusative-definite-nominative-singular":"etilarea","accusative-indefinite-nominative-plural":"etilări","accusative-definite-nominative-plural":"etilările","dative-genitive-indefinite-singular":"etilări","dative-definite-genitive-singular":"etilării","dative-genitive-indefinite-plural":"etilări","dative-definite-genitive-plural":"etilărilor","singular-vocative":"etilare","plural-vocative":"etilărilor"}},{"word":"etilbenzen","pos":"noun","definitions":["ethylbenzene"],"forms":{"plural":"etilbenzeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etilbenzen","accusative-definite-nominative-singular":"etilbenzenul","accusative-indefinite-nominative-plural":"etilbenzeni","accusative-definite-nominative-plural":"etilbenzenii","dative-genitive-indefinite-singular":"etilbenzen","dative-definite-genitive-singular":"etilbenzenului","dative-genitive-indefinite-plural":"etilbenzeni","dative-definite-genitive-plural":"etilbenzenilor","singular-vocative":"etilbenzenule","plural-vocative":"etilbenzenilor"}},{"word":"etilenă","pos":"noun","definitions":["ethylene"],"forms":{"plural":"etilene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etilenă","accusative-definite-nominative-singular":"etilena","accusative-indefinite-nominative-plural":"etilene","accusative-definite-nominative-plural":"etilenele","dative-genitive-indefinite-singular":"etilene","dative-definite-genitive-singular":"etilenei","dative-genitive-indefinite-plural":"etilene","dative-definite-genitive-plural":"etilenelor","singular-vocative":"etilenă","plural-vocative":"etilenelor"}},{"word":"etilendiamină","pos":"noun","definitions":["ethylenediamine"],"forms":{"plural":"etilendiamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etilendiamină","accusative-definite-nominative-singular":"etilendiamina","accusative-indefinite-nominative-plural":"etilendiamine","accusative-definite-nominative-plural":"etilendiaminele","dative-genitive-indefinite-singular":"etilendiamine","dative-definite-genitive-singular":"etilendiaminei","dative-genitive-indefinite-plural":"etilendiamine","dative-definite-genitive-plural":"etilendiaminelor","singular-vocative":"etilendiamină","plural-vocative":"etilendiaminelor"}},{"word":"etilenglicol","pos":"noun","definitions":["ethylene glycol"],"forms":{"plural":"etilenglicoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etilenglicol","accusative-definite-nominative-singular":"etilenglicolul","accusative-indefinite-nominative-plural":"etilenglicoli","accusative-definite-nominative-plural":"etilenglicolii","dative-genitive-indefinite-singular":"etilenglicol","dative-definite-genitive-singular":"etilenglicolului","dative-genitive-indefinite-plural":"etilenglicoli","dative-definite-genitive-plural":"etilenglicolilor","singular-vocative":"etilenglicolule","plural-vocative":"etilenglicolilor"}},{"word":"etilenic","pos":"adj","definitions":["ethylenic"],"forms":{"feminine-singular":"etilenică","masculine-plural":"etilenici","feminine-neuter-plural":"etilenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etilenic","error-unrecognized-form-feminine-indefinite-singular":"etilenică","error-unrecognized-form-indefinite-masculine-plural":"etilenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etilenice","definite-error-unrecognized-form-masculine-neuter-singular":"etilenicul","definite-error-unrecognized-form-feminine-singular":"etilenica","definite-error-unrecognized-form-masculine-plural":"etilenicii","definite-error-unrecognized-form-feminine-neuter-plural":"etilenicele"}},{"word":"etilenoxid","pos":"noun","definitions":["ethylene oxide"],"forms":{"plural":"etilenoxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etilenoxid","accusative-definite-nominative-singular":"etilenoxidul","accusative-indefinite-nominative-plural":"etilenoxizi","accusative-definite-nominative-plural":"etilenoxizii","dative-genitive-indefinite-singular":"etilenoxid","dative-definite-genitive-singular":"etilenoxidului","dative-genitive-indefinite-plural":"etilenoxizi","dative-definite-genitive-plural":"etilenoxizilor","singular-vocative":"etilenoxidule","plural-vocative":"etilenoxizilor"}},{"word":"etilic","pos":"adj","definitions":["ethyl"],"pronunciation":"/eˈti.lik/","forms":{"feminine-singular":"etilică","masculine-plural":"etilici","feminine-neuter-plural":"etilice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etilic","error-unrecognized-form-feminine-indefinite-singular":"etilică","error-unrecognized-form-indefinite-masculine-plural":"etilici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etilice","definite-error-unrecognized-form-masculine-neuter-singular":"etilicul","definite-error-unrecognized-form-feminine-singular":"etilica","definite-error-unrecognized-form-masculine-plural":"etilicii","definite-error-unrecognized-form-feminine-neuter-plural":"etilicele"}},{"word":"etilism","pos":"noun","definitions":["alcoholism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etilism","accusative-definite-nominative-singular":"etilismul","accusative-indefinite-nominative-plural":"etilisme","accusative-definite-nominative-plural":"etilismele","dative-genitive-indefinite-singular":"etilism","dative-definite-genitive-singular":"etilismului","dative-genitive-indefinite-plural":"etilisme","dative-definite-genitive-plural":"etilismelor","singular-vocative":"etilismule","plural-vocative":"etilismelor"}},{"word":"etimoane","pos":"noun","definitions":["plural of etimon"],"pronunciation":"/etiˈmwane/","gender":"n-p"},{"word":"etimolog","pos":"noun","definitions":["etymologist"],"forms":{"plural":"etimologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etimolog","accusative-definite-nominative-singular":"etimologul","accusative-indefinite-nominative-plural":"etimologi","accusative-definite-nominative-plural":"etimologii","dative-genitive-indefinite-singular":"etimolog","dative-definite-genitive-singular":"etimologului","dative-genitive-indefinite-plural":"etimologi","dative-definite-genitive-plural":"etimologilor","singular-vocative":"etimologule","plural-vocative":"etimologilor"}},{"word":"etimologă","pos":"noun","definitions":["female equivalent of etimolog"],"forms":{"plural":"etimologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etimologă","accusative-definite-nominative-singular":"etimologa","accusative-indefinite-nominative-plural":"etimologe","accusative-definite-nominative-plural":"etimologele","dative-genitive-indefinite-singular":"etimologe","dative-definite-genitive-singular":"etimologei","dative-genitive-indefinite-plural":"etimologe","dative-definite-genitive-plural":"etimologelor","singular-vocative":"etimologă","plural-vocative":"etimologelor"}},{"word":"etimologia","pos":"noun","definitions":["definite nominative/accusative singular of etimologie"],"gender":"f"},{"word":"etimologic","pos":"adj","definitions":["etymological"],"pronunciation":"/etimoˈlod͡ʒik/","forms":{"feminine-singular":"etimologică","masculine-plural":"etimologici","feminine-neuter-plural":"etimologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etimologic","error-unrecognized-form-feminine-indefinite-singular":"etimologică","error-unrecognized-form-indefinite-masculine-plural":"etimologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etimologice","definite-error-unrecognized-form-masculine-neuter-singular":"etimologicul","definite-error-unrecognized-form-feminine-singular":"etimologica","definite-error-unrecognized-form-masculine-plural":"etimologicii","definite-error-unrecognized-form-feminine-neuter-plural":"etimologicele"}},{"word":"etimologicesc","pos":"adj","definitions":["etymological"],"forms":{"feminine-singular":"etimologicească","plural":"etimologicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etimologicesc","error-unrecognized-form-feminine-indefinite-singular":"etimologicească","error-unrecognized-form-indefinite-masculine-plural":"etimologicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etimologicești","definite-error-unrecognized-form-masculine-neuter-singular":"etimologicescul","definite-error-unrecognized-form-feminine-singular":"etimologiceasca","definite-error-unrecognized-form-masculine-plural":"etimologiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"etimologiceștile"}},{"word":"etimologicește","pos":"adv","definitions":["etymologically"]},{"word":"etimologici","pos":"adj","definitions":["nominative/accusative masculine plural of etimologic"],"gender":"m-p"},{"word":"etimologie","pos":"noun","definitions":["etymology"],"pronunciation":"/e.ti.mo.lo.ˈd͡ʒi.e/","forms":{"plural":"etimologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etimologie","accusative-definite-nominative-singular":"etimologia","accusative-indefinite-nominative-plural":"etimologii","accusative-definite-nominative-plural":"etimologiile","dative-genitive-indefinite-singular":"etimologii","dative-definite-genitive-singular":"etimologiei","dative-genitive-indefinite-plural":"etimologii","dative-definite-genitive-plural":"etimologiilor","singular-vocative":"etimologie","plural-vocative":"etimologiilor"}},{"word":"etimologie populară","pos":"noun","definitions":["folk etymology"],"forms":{"plural":"etimologii populare"}},{"word":"etimologism","pos":"noun","definitions":["etymologism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etimologism","accusative-definite-nominative-singular":"etimologismul","accusative-indefinite-nominative-plural":"etimologisme","accusative-definite-nominative-plural":"etimologismele","dative-genitive-indefinite-singular":"etimologism","dative-definite-genitive-singular":"etimologismului","dative-genitive-indefinite-plural":"etimologisme","dative-definite-genitive-plural":"etimologismelor","singular-vocative":"etimologismule","plural-vocative":"etimologismelor"}},{"word":"etimologist","pos":"noun","definitions":["etymologist"],"forms":{"plural":"etimologiști","feminine":"equivalent etimologistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etimologist","accusative-definite-nominative-singular":"etimologistul","accusative-indefinite-nominative-plural":"etimologiști","accusative-definite-nominative-plural":"etimologiștii","dative-genitive-indefinite-singular":"etimologist","dative-definite-genitive-singular":"etimologistului","dative-genitive-indefinite-plural":"etimologiști","dative-definite-genitive-plural":"etimologiștilor","singular-vocative":"etimologistule","plural-vocative":"etimologiștilor"}},{"word":"etimologistă","pos":"noun","definitions":["female equivalent of etimologist"],"forms":{"plural":"etimologiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etimologistă","accusative-definite-nominative-singular":"etimologista","accusative-indefinite-nominative-plural":"etimologiste","accusative-definite-nominative-plural":"etimologistele","dative-genitive-indefinite-singular":"etimologiste","dative-definite-genitive-singular":"etimologistei","dative-genitive-indefinite-plural":"etimologiste","dative-definite-genitive-plural":"etimologistelor","singular-vocative":"etimologistă","plural-vocative":"etimologistelor"}},{"word":"etimologiza","pos":"verb","definitions":["to etymologize"],"forms":{"canonical":"a etimologiza 1st conjugation","present-singular-third-person":"etimologizează","participle-past":"etimologizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etimologiza","gerund":"etimologizând","first-person-indicative-present-singular":"etimologizez","indicative-present-second-person-singular":"etimologizezi","indicative-present-singular-third-person":"etimologizează","first-person-indicative-plural-present":"etimologizăm","indicative-plural-present-second-person":"etimologizați","indicative-plural-present-third-person":"etimologizează","first-person-imperfect-indicative-singular":"etimologizam","imperfect-indicative-second-person-singular":"etimologizai","imperfect-indicative-singular-third-person":"etimologiza","first-person-imperfect-indicative-plural":"etimologizam","imperfect-indicative-plural-second-person":"etimologizați","imperfect-indicative-plural-third-person":"etimologizau","first-person-indicative-perfect-singular":"etimologizai","indicative-perfect-second-person-singular":"etimologizași","indicative-perfect-singular-third-person":"etimologiză","first-person-indicative-perfect-plural":"etimologizarăm","indicative-perfect-plural-second-person":"etimologizarăți","indicative-perfect-plural-third-person":"etimologizară","first-person-indicative-pluperfect-singular":"etimologizasem","indicative-pluperfect-second-person-singular":"etimologizaseși","indicative-pluperfect-singular-third-person":"etimologizase","first-person-indicative-pluperfect-plural":"etimologizaserăm","indicative-pluperfect-plural-second-person":"etimologizaserăți","indicative-pluperfect-plural-third-person":"etimologizaseră","first-person-present-singular-subjunctive":"să etimologizez","present-second-person-singular-subjunctive":"să etimologizezi","present-singular-subjunctive-third-person":"să etimologizeze","first-person-plural-present-subjunctive":"să etimologizăm","plural-present-second-person-subjunctive":"să etimologizați","plural-present-subjunctive-third-person":"să etimologizeze","imperative-second-person-singular":"etimologizează","imperative-plural-second-person":"etimologizați","imperative-negative-second-person-singular":"nu etimologiza","imperative-negative-plural-second-person":"nu etimologizați"}},{"word":"etimologizant","pos":"adj","definitions":["using the etymologizing spelling"],"forms":{"feminine-singular":"etimologizantă","masculine-plural":"etimologizanți","feminine-neuter-plural":"etimologizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etimologizant","error-unrecognized-form-feminine-indefinite-singular":"etimologizantă","error-unrecognized-form-indefinite-masculine-plural":"etimologizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"etimologizante","definite-error-unrecognized-form-masculine-neuter-singular":"etimologizantul","definite-error-unrecognized-form-feminine-singular":"etimologizanta","definite-error-unrecognized-form-masculine-plural":"etimologizanții","definite-error-unrecognized-form-feminine-neuter-plural":"etimologizantele"}},{"word":"etimologizare","pos":"noun","definitions":["etymology"],"forms":{"plural":"etimologizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etimologizare","accusative-definite-nominative-singular":"etimologizarea","accusative-indefinite-nominative-plural":"etimologizări","accusative-definite-nominative-plural":"etimologizările","dative-genitive-indefinite-singular":"etimologizări","dative-definite-genitive-singular":"etimologizării","dative-genitive-indefinite-plural":"etimologizări","dative-definite-genitive-plural":"etimologizărilor","singular-vocative":"etimologizare","plural-vocative":"etimologizărilor"}},{"word":"etimon","pos":"noun","definitions":["etymon"],"pronunciation":"/etiˈmon/","forms":{"plural":"etimoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etimon","accusative-definite-nominative-singular":"etimonul","accusative-indefinite-nominative-plural":"etimoane","accusative-definite-nominative-plural":"etimoanele","dative-genitive-indefinite-singular":"etimon","dative-definite-genitive-singular":"etimonului","dative-genitive-indefinite-plural":"etimoane","dative-definite-genitive-plural":"etimoanelor","singular-vocative":"etimonule","plural-vocative":"etimoanelor"}},{"word":"etină","pos":"noun","definitions":["ethyne"],"forms":{"plural":"etine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etină","accusative-definite-nominative-singular":"etina","accusative-indefinite-nominative-plural":"etine","accusative-definite-nominative-plural":"etinele","dative-genitive-indefinite-singular":"etine","dative-definite-genitive-singular":"etinei","dative-genitive-indefinite-plural":"etine","dative-definite-genitive-plural":"etinelor","singular-vocative":"etină","plural-vocative":"etinelor"}},{"word":"etiola","pos":"verb","definitions":["to etiolate"],"forms":{"canonical":"a etiola 1st conjugation","present-singular-third-person":"etiolează","participle-past":"etiolat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etiola","gerund":"etiolând","first-person-indicative-present-singular":"etiolez","indicative-present-second-person-singular":"etiolezi","indicative-present-singular-third-person":"etiolează","first-person-indicative-plural-present":"etiolăm","indicative-plural-present-second-person":"etiolați","indicative-plural-present-third-person":"etiolează","first-person-imperfect-indicative-singular":"etiolam","imperfect-indicative-second-person-singular":"etiolai","imperfect-indicative-singular-third-person":"etiola","first-person-imperfect-indicative-plural":"etiolam","imperfect-indicative-plural-second-person":"etiolați","imperfect-indicative-plural-third-person":"etiolau","first-person-indicative-perfect-singular":"etiolai","indicative-perfect-second-person-singular":"etiolași","indicative-perfect-singular-third-person":"etiolă","first-person-indicative-perfect-plural":"etiolarăm","indicative-perfect-plural-second-person":"etiolarăți","indicative-perfect-plural-third-person":"etiolară","first-person-indicative-pluperfect-singular":"etiolasem","indicative-pluperfect-second-person-singular":"etiolaseși","indicative-pluperfect-singular-third-person":"etiolase","first-person-indicative-pluperfect-plural":"etiolaserăm","indicative-pluperfect-plural-second-person":"etiolaserăți","indicative-pluperfect-plural-third-person":"etiolaseră","first-person-present-singular-subjunctive":"să etiolez","present-second-person-singular-subjunctive":"să etiolezi","present-singular-subjunctive-third-person":"să etioleze","first-person-plural-present-subjunctive":"să etiolăm","plural-present-second-person-subjunctive":"să etiolați","plural-present-subjunctive-third-person":"să etioleze","imperative-second-person-singular":"etiolează","imperative-plural-second-person":"etiolați","imperative-negative-second-person-singular":"nu etiola","imperative-negative-plural-second-person":"nu etiolați"}},{"word":"etiolare","pos":"noun","definitions":["etiolation"],"forms":{"plural":"etiolări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etiolare","accusative-definite-nominative-singular":"etiolarea","accusative-indefinite-nominative-plural":"etiolări","accusative-definite-nominative-plural":"etiolările","dative-genitive-indefinite-singular":"etiolări","dative-definite-genitive-singular":"etiolării","dative-genitive-indefinite-plural":"etiolări","dative-definite-genitive-plural":"etiolărilor","singular-vocative":"etiolare","plural-vocative":"etiolărilor"}},{"word":"etiologic","pos":"adj","definitions":["etiological"],"forms":{"feminine-singular":"etiologică","masculine-plural":"etiologici","feminine-neuter-plural":"etiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etiologic","error-unrecognized-form-feminine-indefinite-singular":"etiologică","error-unrecognized-form-indefinite-masculine-plural":"etiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etiologice","definite-error-unrecognized-form-masculine-neuter-singular":"etiologicul","definite-error-unrecognized-form-feminine-singular":"etiologica","definite-error-unrecognized-form-masculine-plural":"etiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"etiologicele"}},{"word":"etiologie","pos":"noun","definitions":["aetiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etiologie","accusative-definite-nominative":"etiologia","dative-genitive-indefinite":"etiologii","dative-definite-genitive":"etiologiei","vocative":"etiologie"}},{"word":"etiop","pos":"noun","definitions":["Ethiopian"],"forms":{"plural":"etiopi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etiop","accusative-definite-nominative-singular":"etiopul","accusative-indefinite-nominative-plural":"etiopi","accusative-definite-nominative-plural":"etiopii","dative-genitive-indefinite-singular":"etiop","dative-definite-genitive-singular":"etiopului","dative-genitive-indefinite-plural":"etiopi","dative-definite-genitive-plural":"etiopilor","singular-vocative":"etiopule","plural-vocative":"etiopilor"}},{"word":"etiopenesc","pos":"adj","definitions":["Ethiopian"],"forms":{"feminine-singular":"etiopenească","plural":"etiopenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etiopenesc","error-unrecognized-form-feminine-indefinite-singular":"etiopenească","error-unrecognized-form-indefinite-masculine-plural":"etiopenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etiopenești","definite-error-unrecognized-form-masculine-neuter-singular":"etiopenescul","definite-error-unrecognized-form-feminine-singular":"etiopeneasca","definite-error-unrecognized-form-masculine-plural":"etiopeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"etiopeneștile"}},{"word":"etiopesc","pos":"adj","definitions":["Ethiopian"],"forms":{"feminine-singular":"etiopească","plural":"etiopești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etiopesc","error-unrecognized-form-feminine-indefinite-singular":"etiopească","error-unrecognized-form-indefinite-masculine-plural":"etiopești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etiopești","definite-error-unrecognized-form-masculine-neuter-singular":"etiopescul","definite-error-unrecognized-form-feminine-singular":"etiopeasca","definite-error-unrecognized-form-masculine-plural":"etiopeștii","definite-error-unrecognized-form-feminine-neuter-plural":"etiopeștile"}},{"word":"Etiopia","pos":"name","definitions":["Ethiopia (a country in East Africa)"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Etiopia","dative-definite-genitive":"Etiopiei"}},{"word":"etiopian","pos":"adj","definitions":["Ethiopian"],"forms":{"feminine-singular":"etiopiană","masculine-plural":"etiopieni","feminine-neuter-plural":"etiopiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etiopian","error-unrecognized-form-feminine-indefinite-singular":"etiopiană","error-unrecognized-form-indefinite-masculine-plural":"etiopieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"etiopiene","definite-error-unrecognized-form-masculine-neuter-singular":"etiopianul","definite-error-unrecognized-form-feminine-singular":"etiopiana","definite-error-unrecognized-form-masculine-plural":"etiopienii","definite-error-unrecognized-form-feminine-neuter-plural":"etiopienele"}},{"word":"etiopian","pos":"noun","definitions":["Ethiopian"],"forms":{"plural":"etiopieni","feminine":"equivalent etiopiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etiopian","accusative-definite-nominative-singular":"etiopianul","accusative-indefinite-nominative-plural":"etiopieni","accusative-definite-nominative-plural":"etiopienii","dative-genitive-indefinite-singular":"etiopian","dative-definite-genitive-singular":"etiopianului","dative-genitive-indefinite-plural":"etiopieni","dative-definite-genitive-plural":"etiopienilor","singular-vocative":"etiopianule","plural-vocative":"etiopienilor"}},{"word":"etiopiană","pos":"noun","definitions":["female equivalent of etiopian"],"forms":{"plural":"etiopiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etiopiană","accusative-definite-nominative-singular":"etiopiana","accusative-indefinite-nominative-plural":"etiopiene","accusative-definite-nominative-plural":"etiopienele","dative-genitive-indefinite-singular":"etiopiene","dative-definite-genitive-singular":"etiopienei","dative-genitive-indefinite-plural":"etiopiene","dative-definite-genitive-plural":"etiopienelor","singular-vocative":"etiopiană","plural-vocative":"etiopienelor"}},{"word":"etiopicesc","pos":"adj","definitions":["Ethiopian"],"forms":{"feminine-singular":"etiopicească","plural":"etiopicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etiopicesc","error-unrecognized-form-feminine-indefinite-singular":"etiopicească","error-unrecognized-form-indefinite-masculine-plural":"etiopicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etiopicești","definite-error-unrecognized-form-masculine-neuter-singular":"etiopicescul","definite-error-unrecognized-form-feminine-singular":"etiopiceasca","definite-error-unrecognized-form-masculine-plural":"etiopiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"etiopiceștile"}},{"word":"etira","pos":"verb","definitions":["to stretch"],"forms":{"canonical":"a etira 1st conjugation","present-singular-third-person":"etirează","participle-past":"etirat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etira","gerund":"etirând","first-person-indicative-present-singular":"etirez","indicative-present-second-person-singular":"etirezi","indicative-present-singular-third-person":"etirează","first-person-indicative-plural-present":"etirăm","indicative-plural-present-second-person":"etirați","indicative-plural-present-third-person":"etirează","first-person-imperfect-indicative-singular":"etiram","imperfect-indicative-second-person-singular":"etirai","imperfect-indicative-singular-third-person":"etira","first-person-imperfect-indicative-plural":"etiram","imperfect-indicative-plural-second-person":"etirați","imperfect-indicative-plural-third-person":"etirau","first-person-indicative-perfect-singular":"etirai","indicative-perfect-second-person-singular":"etirași","indicative-perfect-singular-third-person":"etiră","first-person-indicative-perfect-plural":"etirarăm","indicative-perfect-plural-second-person":"etirarăți","indicative-perfect-plural-third-person":"etirară","first-person-indicative-pluperfect-singular":"etirasem","indicative-pluperfect-second-person-singular":"etiraseși","indicative-pluperfect-singular-third-person":"etirase","first-person-indicative-pluperfect-plural":"etiraserăm","indicative-pluperfect-plural-second-person":"etiraserăți","indicative-pluperfect-plural-third-person":"etiraseră","first-person-present-singular-subjunctive":"să etirez","present-second-person-singular-subjunctive":"să etirezi","present-singular-subjunctive-third-person":"să etireze","first-person-plural-present-subjunctive":"să etirăm","plural-present-second-person-subjunctive":"să etirați","plural-present-subjunctive-third-person":"să etireze","imperative-second-person-singular":"etirează","imperative-plural-second-person":"etirați","imperative-negative-second-person-singular":"nu etira","imperative-negative-plural-second-person":"nu etirați"}},{"word":"etirat","pos":"adj","definitions":["stretched"],"forms":{"feminine-singular":"etirată","masculine-plural":"etirați","feminine-neuter-plural":"etirate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etirat","error-unrecognized-form-feminine-indefinite-singular":"etirată","error-unrecognized-form-indefinite-masculine-plural":"etirați","error-unrecognized-form-feminine-indefinite-neuter-plural":"etirate","definite-error-unrecognized-form-masculine-neuter-singular":"etiratul","definite-error-unrecognized-form-feminine-singular":"etirata","definite-error-unrecognized-form-masculine-plural":"etirații","definite-error-unrecognized-form-feminine-neuter-plural":"etiratele"}},{"word":"etirat","pos":"verb","definitions":["past participle of etira"],"forms":{"participle-past":"of etira"}},{"word":"etmoid","pos":"noun","definitions":["ethmoid"],"forms":{"plural":"etmoide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etmoid","accusative-definite-nominative-singular":"etmoidul","accusative-indefinite-nominative-plural":"etmoide","accusative-definite-nominative-plural":"etmoidele","dative-genitive-indefinite-singular":"etmoid","dative-definite-genitive-singular":"etmoidului","dative-genitive-indefinite-plural":"etmoide","dative-definite-genitive-plural":"etmoidelor","singular-vocative":"etmoidule","plural-vocative":"etmoidelor"}},{"word":"etmoidal","pos":"adj","definitions":["ethmoidal, ethmoid"],"forms":{"feminine-singular":"etmoidală","masculine-plural":"etmoidali","feminine-neuter-plural":"etmoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etmoidal","error-unrecognized-form-feminine-indefinite-singular":"etmoidală","error-unrecognized-form-indefinite-masculine-plural":"etmoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"etmoidale","definite-error-unrecognized-form-masculine-neuter-singular":"etmoidalul","definite-error-unrecognized-form-feminine-singular":"etmoidala","definite-error-unrecognized-form-masculine-plural":"etmoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"etmoidalele"}},{"word":"etmoidectomie","pos":"noun","definitions":["ethmoidectomy"],"forms":{"plural":"etmoidectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etmoidectomie","accusative-definite-nominative-singular":"etmoidectomia","accusative-indefinite-nominative-plural":"etmoidectomii","accusative-definite-nominative-plural":"etmoidectomiile","dative-genitive-indefinite-singular":"etmoidectomii","dative-definite-genitive-singular":"etmoidectomiei","dative-genitive-indefinite-plural":"etmoidectomii","dative-definite-genitive-plural":"etmoidectomiilor","singular-vocative":"etmoidectomie","plural-vocative":"etmoidectomiilor"}},{"word":"etmoidită","pos":"noun","definitions":["ethmoiditis"],"forms":{"plural":"etmoidite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etmoidită","accusative-definite-nominative-singular":"etmoidita","accusative-indefinite-nominative-plural":"etmoidite","accusative-definite-nominative-plural":"etmoiditele","dative-genitive-indefinite-singular":"etmoidite","dative-definite-genitive-singular":"etmoiditei","dative-genitive-indefinite-plural":"etmoidite","dative-definite-genitive-plural":"etmoiditelor","singular-vocative":"etmoidită","plural-vocative":"etmoiditelor"}},{"word":"etnarh","pos":"noun","definitions":["ethnarch"],"forms":{"plural":"etnarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etnarh","accusative-definite-nominative-singular":"etnarhul","accusative-indefinite-nominative-plural":"etnarhi","accusative-definite-nominative-plural":"etnarhii","dative-genitive-indefinite-singular":"etnarh","dative-definite-genitive-singular":"etnarhului","dative-genitive-indefinite-plural":"etnarhi","dative-definite-genitive-plural":"etnarhilor","singular-vocative":"etnarhule","plural-vocative":"etnarhilor"}},{"word":"etnarhie","pos":"noun","definitions":["ethnarchy"],"forms":{"plural":"etnarhii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnarhie","accusative-definite-nominative-singular":"etnarhia","accusative-indefinite-nominative-plural":"etnarhii","accusative-definite-nominative-plural":"etnarhiile","dative-genitive-indefinite-singular":"etnarhii","dative-definite-genitive-singular":"etnarhiei","dative-genitive-indefinite-plural":"etnarhii","dative-definite-genitive-plural":"etnarhiilor","singular-vocative":"etnarhie","plural-vocative":"etnarhiilor"}},{"word":"etnic","pos":"adj","definitions":["ethnic"],"forms":{"feminine-singular":"etnică","masculine-plural":"etnici","feminine-neuter-plural":"etnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnic","error-unrecognized-form-feminine-indefinite-singular":"etnică","error-unrecognized-form-indefinite-masculine-plural":"etnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnice","definite-error-unrecognized-form-masculine-neuter-singular":"etnicul","definite-error-unrecognized-form-feminine-singular":"etnica","definite-error-unrecognized-form-masculine-plural":"etnicii","definite-error-unrecognized-form-feminine-neuter-plural":"etnicele"}},{"word":"etnicesc","pos":"adj","definitions":["ethnic"],"forms":{"feminine-singular":"etnicească","plural":"etnicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnicesc","error-unrecognized-form-feminine-indefinite-singular":"etnicească","error-unrecognized-form-indefinite-masculine-plural":"etnicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnicești","definite-error-unrecognized-form-masculine-neuter-singular":"etnicescul","definite-error-unrecognized-form-feminine-singular":"etniceasca","definite-error-unrecognized-form-masculine-plural":"etniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"etniceștile"}},{"word":"etnicește","pos":"adv","definitions":["ethnically"]},{"word":"etnicism","pos":"noun","definitions":["ethnicism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etnicism","accusative-definite-nominative-singular":"etnicismul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-le","dative-genitive-indefinite-singular":"etnicism","dative-definite-genitive-singular":"etnicismului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"etnicismule","plural-vocative":"-lor"}},{"word":"etnicitate","pos":"noun","definitions":["ethnicity"],"forms":{"plural":"etnicități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"etnicitate","accusative-definite-nominative-singular":"etnicitatea","accusative-indefinite-nominative-plural":"etnicități","accusative-definite-nominative-plural":"etnicitățile","dative-genitive-indefinite-singular":"etnicități","dative-definite-genitive-singular":"etnicității","dative-genitive-indefinite-plural":"etnicități","dative-definite-genitive-plural":"etnicităților","singular-vocative":"etnicitate","plural-vocative":"etnicităților"}},{"word":"etniciza","pos":"verb","definitions":["to ethnicize"],"forms":{"canonical":"a etniciza 1st conjugation","present-singular-third-person":"etnicizează","participle-past":"etnicizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a etniciza","gerund":"etnicizând","first-person-indicative-present-singular":"etnicizez","indicative-present-second-person-singular":"etnicizezi","indicative-present-singular-third-person":"etnicizează","first-person-indicative-plural-present":"etnicizăm","indicative-plural-present-second-person":"etnicizați","indicative-plural-present-third-person":"etnicizează","first-person-imperfect-indicative-singular":"etnicizam","imperfect-indicative-second-person-singular":"etnicizai","imperfect-indicative-singular-third-person":"etniciza","first-person-imperfect-indicative-plural":"etnicizam","imperfect-indicative-plural-second-person":"etnicizați","imperfect-indicative-plural-third-person":"etnicizau","first-person-indicative-perfect-singular":"etnicizai","indicative-perfect-second-person-singular":"etnicizași","indicative-perfect-singular-third-person":"etniciză","first-person-indicative-perfect-plural":"etnicizarăm","indicative-perfect-plural-second-person":"etnicizarăți","indicative-perfect-plural-third-person":"etnicizară","first-person-indicative-pluperfect-singular":"etnicizasem","indicative-pluperfect-second-person-singular":"etnicizaseși","indicative-pluperfect-singular-third-person":"etnicizase","first-person-indicative-pluperfect-plural":"etnicizaserăm","indicative-pluperfect-plural-second-person":"etnicizaserăți","indicative-pluperfect-plural-third-person":"etnicizaseră","first-person-present-singular-subjunctive":"să etnicizez","present-second-person-singular-subjunctive":"să etnicizezi","present-singular-subjunctive-third-person":"să etnicizeze","first-person-plural-present-subjunctive":"să etnicizăm","plural-present-second-person-subjunctive":"să etnicizați","plural-present-subjunctive-third-person":"să etnicizeze","imperative-second-person-singular":"etnicizează","imperative-plural-second-person":"etnicizați","imperative-negative-second-person-singular":"nu etniciza","imperative-negative-plural-second-person":"nu etnicizați"}},{"word":"etnie","pos":"noun","definitions":["ethnic group"],"forms":{"plural":"etnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnie","accusative-definite-nominative-singular":"etnia","accusative-indefinite-nominative-plural":"etnii","accusative-definite-nominative-plural":"etniile","dative-genitive-indefinite-singular":"etnii","dative-definite-genitive-singular":"etniei","dative-genitive-indefinite-plural":"etnii","dative-definite-genitive-plural":"etniilor","singular-vocative":"etnie","plural-vocative":"etniilor"}},{"word":"etnobotanic","pos":"adj","definitions":["ethnobotanical"],"forms":{"feminine-singular":"etnobotanică","masculine-plural":"etnobotanici","feminine-neuter-plural":"etnobotanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnobotanic","error-unrecognized-form-feminine-indefinite-singular":"etnobotanică","error-unrecognized-form-indefinite-masculine-plural":"etnobotanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnobotanice","definite-error-unrecognized-form-masculine-neuter-singular":"etnobotanicul","definite-error-unrecognized-form-feminine-singular":"etnobotanica","definite-error-unrecognized-form-masculine-plural":"etnobotanicii","definite-error-unrecognized-form-feminine-neuter-plural":"etnobotanicele"}},{"word":"etnobotanică","pos":"noun","definitions":["ethnobotany"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"etnobotanică","accusative-definite-nominative":"etnobotanica","dative-genitive-indefinite":"etnobotanice","dative-definite-genitive":"etnobotanicei","vocative":"etnobotanică"}},{"word":"etnocentrism","pos":"noun","definitions":["ethnocentrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etnocentrism","accusative-definite-nominative-singular":"etnocentrismul","accusative-indefinite-nominative-plural":"etnocentrisme","accusative-definite-nominative-plural":"etnocentrismele","dative-genitive-indefinite-singular":"etnocentrism","dative-definite-genitive-singular":"etnocentrismului","dative-genitive-indefinite-plural":"etnocentrisme","dative-definite-genitive-plural":"etnocentrismelor","singular-vocative":"etnocentrismule","plural-vocative":"etnocentrismelor"}},{"word":"etnocratic","pos":"adj","definitions":["ethnocratic"],"forms":{"feminine-singular":"etnocratică","masculine-plural":"etnocratici","feminine-neuter-plural":"etnocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnocratic","error-unrecognized-form-feminine-indefinite-singular":"etnocratică","error-unrecognized-form-indefinite-masculine-plural":"etnocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnocratice","definite-error-unrecognized-form-masculine-neuter-singular":"etnocraticul","definite-error-unrecognized-form-feminine-singular":"etnocratica","definite-error-unrecognized-form-masculine-plural":"etnocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"etnocraticele"}},{"word":"etnocrație","pos":"noun","definitions":["ethnocracy"],"forms":{"plural":"etnocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnocrație","accusative-definite-nominative-singular":"etnocrația","accusative-indefinite-nominative-plural":"etnocrații","accusative-definite-nominative-plural":"etnocrațiile","dative-genitive-indefinite-singular":"etnocrații","dative-definite-genitive-singular":"etnocrației","dative-genitive-indefinite-plural":"etnocrații","dative-definite-genitive-plural":"etnocrațiilor","singular-vocative":"etnocrație","plural-vocative":"etnocrațiilor"}},{"word":"etnocultură","pos":"noun","definitions":["ethnoculture"],"forms":{"plural":"etnoculturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"etnocultură","accusative-definite-nominative-singular":"etnocultura","accusative-indefinite-nominative-plural":"etnoculturi","accusative-definite-nominative-plural":"etnoculturile","dative-genitive-indefinite-singular":"etnoculturi","dative-definite-genitive-singular":"etnoculturii","dative-genitive-indefinite-plural":"etnoculturi","dative-definite-genitive-plural":"etnoculturilor","singular-vocative":"etnocultură","plural-vocative":"etnoculturilor"}},{"word":"etnocultural","pos":"adj","definitions":["ethnocultural"],"forms":{"feminine-singular":"etnoculturală","masculine-plural":"etnoculturali","feminine-neuter-plural":"etnoculturale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnocultural","error-unrecognized-form-feminine-indefinite-singular":"etnoculturală","error-unrecognized-form-indefinite-masculine-plural":"etnoculturali","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnoculturale","definite-error-unrecognized-form-masculine-neuter-singular":"etnoculturalul","definite-error-unrecognized-form-feminine-singular":"etnoculturala","definite-error-unrecognized-form-masculine-plural":"etnoculturalii","definite-error-unrecognized-form-feminine-neuter-plural":"etnoculturalele"}},{"word":"etnofolcloric","pos":"adj","definitions":["folkloristic"],"forms":{"feminine-singular":"etnofolclorică","masculine-plural":"etnofolclorici","feminine-neuter-plural":"etnofolclorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnofolcloric","error-unrecognized-form-feminine-indefinite-singular":"etnofolclorică","error-unrecognized-form-indefinite-masculine-plural":"etnofolclorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnofolclorice","definite-error-unrecognized-form-masculine-neuter-singular":"etnofolcloricul","definite-error-unrecognized-form-feminine-singular":"etnofolclorica","definite-error-unrecognized-form-masculine-plural":"etnofolcloricii","definite-error-unrecognized-form-feminine-neuter-plural":"etnofolcloricele"}},{"word":"etnogenetic","pos":"adj","definitions":["ethnogenetic"],"forms":{"feminine-singular":"etnogenetică","masculine-plural":"etnogenetici","feminine-neuter-plural":"etnogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnogenetic","error-unrecognized-form-feminine-indefinite-singular":"etnogenetică","error-unrecognized-form-indefinite-masculine-plural":"etnogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"etnogeneticul","definite-error-unrecognized-form-feminine-singular":"etnogenetica","definite-error-unrecognized-form-masculine-plural":"etnogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"etnogeneticele"}},{"word":"etnogeneza","pos":"noun","definitions":["nominative/accusative definite singular of etnogeneză"],"gender":"f"},{"word":"etnogeneză","pos":"noun","definitions":["ethnogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etnogeneză","accusative-definite-nominative-singular":"etnogeneza","accusative-indefinite-nominative-plural":"etnogeneze","accusative-definite-nominative-plural":"etnogenezele","dative-genitive-indefinite-singular":"etnogeneze","dative-definite-genitive-singular":"etnogenezei","dative-genitive-indefinite-plural":"etnogeneze","dative-definite-genitive-plural":"etnogenezelor","singular-vocative":"etnogeneză","plural-vocative":"etnogenezelor"}},{"word":"etnogenezo","pos":"noun","definitions":["vocative singular of etnogeneză"],"gender":"f"},{"word":"etnogenie","pos":"noun","definitions":["ethnogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnogenie","accusative-definite-nominative-singular":"etnogenia","accusative-indefinite-nominative-plural":"etnogenii","accusative-definite-nominative-plural":"etnogeniile","dative-genitive-indefinite-singular":"etnogenii","dative-definite-genitive-singular":"etnogeniei","dative-genitive-indefinite-plural":"etnogenii","dative-definite-genitive-plural":"etnogeniilor","singular-vocative":"etnogenie","plural-vocative":"etnogeniilor"}},{"word":"etnogeografic","pos":"adj","definitions":["ethnogeographic"],"forms":{"feminine-singular":"etnogeografică","masculine-plural":"etnogeografici","feminine-neuter-plural":"etnogeografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnogeografic","error-unrecognized-form-feminine-indefinite-singular":"etnogeografică","error-unrecognized-form-indefinite-masculine-plural":"etnogeografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnogeografice","definite-error-unrecognized-form-masculine-neuter-singular":"etnogeograficul","definite-error-unrecognized-form-feminine-singular":"etnogeografica","definite-error-unrecognized-form-masculine-plural":"etnogeograficii","definite-error-unrecognized-form-feminine-neuter-plural":"etnogeograficele"}},{"word":"etnogeograficesc","pos":"adj","definitions":["ethnogeographic"],"forms":{"feminine-singular":"etnogeograficească","plural":"etnogeograficești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnogeograficesc","error-unrecognized-form-feminine-indefinite-singular":"etnogeograficească","error-unrecognized-form-indefinite-masculine-plural":"etnogeograficești","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnogeograficești","definite-error-unrecognized-form-masculine-neuter-singular":"etnogeograficescul","definite-error-unrecognized-form-feminine-singular":"etnogeograficeasca","definite-error-unrecognized-form-masculine-plural":"etnogeograficeștii","definite-error-unrecognized-form-feminine-neuter-plural":"etnogeograficeștile"}},{"word":"etnogeografie","pos":"noun","definitions":["ethnogeography"],"forms":{"plural":"etnogeografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnogeografie","accusative-definite-nominative-singular":"etnogeografia","accusative-indefinite-nominative-plural":"etnogeografii","accusative-definite-nominative-plural":"etnogeografiile","dative-genitive-indefinite-singular":"etnogeografii","dative-definite-genitive-singular":"etnogeografiei","dative-genitive-indefinite-plural":"etnogeografii","dative-definite-genitive-plural":"etnogeografiilor","singular-vocative":"etnogeografie","plural-vocative":"etnogeografiilor"}},{"word":"etnograf","pos":"noun","definitions":["ethnographer"],"forms":{"plural":"etnografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etnograf","accusative-definite-nominative-singular":"etnograful","accusative-indefinite-nominative-plural":"etnografi","accusative-definite-nominative-plural":"etnografii","dative-genitive-indefinite-singular":"etnograf","dative-definite-genitive-singular":"etnografului","dative-genitive-indefinite-plural":"etnografi","dative-definite-genitive-plural":"etnografilor","singular-vocative":"etnografule","plural-vocative":"etnografilor"}},{"word":"etnografă","pos":"noun","definitions":["female equivalent of etnograf"],"forms":{"plural":"etnografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etnografă","accusative-definite-nominative-singular":"etnografa","accusative-indefinite-nominative-plural":"etnografe","accusative-definite-nominative-plural":"etnografele","dative-genitive-indefinite-singular":"etnografe","dative-definite-genitive-singular":"etnografei","dative-genitive-indefinite-plural":"etnografe","dative-definite-genitive-plural":"etnografelor","singular-vocative":"etnografă","plural-vocative":"etnografelor"}},{"word":"etnografic","pos":"adj","definitions":["ethnographic"],"forms":{"feminine-singular":"etnografică","masculine-plural":"etnografici","feminine-neuter-plural":"etnografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnografic","error-unrecognized-form-feminine-indefinite-singular":"etnografică","error-unrecognized-form-indefinite-masculine-plural":"etnografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnografice","definite-error-unrecognized-form-masculine-neuter-singular":"etnograficul","definite-error-unrecognized-form-feminine-singular":"etnografica","definite-error-unrecognized-form-masculine-plural":"etnograficii","definite-error-unrecognized-form-feminine-neuter-plural":"etnograficele"}},{"word":"etnografica","pos":"adj","definitions":["definite nominative/accusative feminine singular of etnografic"],"pronunciation":"/et.noˈɡra.fi.ka/","gender":"f-s","forms":{"alternative":"етнографика"}},{"word":"etnografică","pos":"adj","definitions":["nominative/accusative feminine singular of etnografic"],"pronunciation":"/et.noˈɡra.fi.kə/","gender":"f-s","forms":{"alternative":"етнографикэ"}},{"word":"etnografici","pos":"adj","definitions":["nominative/accusative masculine plural of etnografic"],"gender":"m-p"},{"word":"etnografie","pos":"noun","definitions":["ethnography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etnografie","accusative-definite-nominative":"etnografia","dative-genitive-indefinite":"etnografii","dative-definite-genitive":"etnografiei","vocative":"etnografie"}},{"word":"etnolingvistic","pos":"adj","definitions":["ethnolinguistic"],"forms":{"feminine-singular":"etnolingvistică","masculine-plural":"etnolingvistici","feminine-neuter-plural":"etnolingvistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnolingvistic","error-unrecognized-form-feminine-indefinite-singular":"etnolingvistică","error-unrecognized-form-indefinite-masculine-plural":"etnolingvistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnolingvistice","definite-error-unrecognized-form-masculine-neuter-singular":"etnolingvisticul","definite-error-unrecognized-form-feminine-singular":"etnolingvistica","definite-error-unrecognized-form-masculine-plural":"etnolingvisticii","definite-error-unrecognized-form-feminine-neuter-plural":"etnolingvisticele"}},{"word":"etnolingvistică","pos":"noun","definitions":["ethnolinguistics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etnolingvistică","accusative-definite-nominative-singular":"etnolingvistica","accusative-indefinite-nominative-plural":"etnolingvistice","accusative-definite-nominative-plural":"etnolingvisticele","dative-genitive-indefinite-singular":"etnolingvistice","dative-definite-genitive-singular":"etnolingvisticei","dative-genitive-indefinite-plural":"etnolingvistice","dative-definite-genitive-plural":"etnolingvisticelor","singular-vocative":"etnolingvistică","plural-vocative":"etnolingvisticelor"}},{"word":"etnolog","pos":"noun","definitions":["ethnologist"],"pronunciation":"/et.noˈloɡ/","forms":{"plural":"etnologi","feminine":"equivalent etnologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etnolog","accusative-definite-nominative-singular":"etnologul","accusative-indefinite-nominative-plural":"etnologi","accusative-definite-nominative-plural":"etnologii","dative-genitive-indefinite-singular":"etnolog","dative-definite-genitive-singular":"etnologului","dative-genitive-indefinite-plural":"etnologi","dative-definite-genitive-plural":"etnologilor","singular-vocative":"etnologule","plural-vocative":"etnologilor"}},{"word":"etnologa","pos":"noun","definitions":["definite nominative/accusative singular of etnologă"]},{"word":"etnologă","pos":"noun","definitions":["female equivalent of etnolog"],"pronunciation":"/et.noˈlo.ɡə/","forms":{"plural":"etnologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"etnologă","accusative-definite-nominative-singular":"etnologa","accusative-indefinite-nominative-plural":"etnologe","accusative-definite-nominative-plural":"etnologele","dative-genitive-indefinite-singular":"etnologe","dative-definite-genitive-singular":"etnologei","dative-genitive-indefinite-plural":"etnologe","dative-definite-genitive-plural":"etnologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"etnologe","pos":"noun","definitions":["plural of etnologă"],"gender":"f"},{"word":"etnologi","pos":"noun","definitions":["plural of etnolog"],"gender":"m"},{"word":"etnologic","pos":"adj","definitions":["ethnological"],"forms":{"feminine-singular":"etnologică","masculine-plural":"etnologici","feminine-neuter-plural":"etnologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etnologic","error-unrecognized-form-feminine-indefinite-singular":"etnologică","error-unrecognized-form-indefinite-masculine-plural":"etnologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etnologice","definite-error-unrecognized-form-masculine-neuter-singular":"etnologicul","definite-error-unrecognized-form-feminine-singular":"etnologica","definite-error-unrecognized-form-masculine-plural":"etnologicii","definite-error-unrecognized-form-feminine-neuter-plural":"etnologicele"}},{"word":"etnologie","pos":"noun","definitions":["ethnology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etnologie","accusative-definite-nominative":"etnologia","dative-genitive-indefinite":"etnologii","dative-definite-genitive":"etnologiei","vocative":"etnologie"}},{"word":"etnologii","pos":"noun","definitions":["definite nominative/accusative plural of etnolog"],"gender":"m"},{"word":"etnologist","pos":"noun","definitions":["ethnologist"],"forms":{"plural":"etnologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etnologist","accusative-definite-nominative-singular":"etnologistul","accusative-indefinite-nominative-plural":"etnologiști","accusative-definite-nominative-plural":"etnologiștii","dative-genitive-indefinite-singular":"etnologist","dative-definite-genitive-singular":"etnologistului","dative-genitive-indefinite-plural":"etnologiști","dative-definite-genitive-plural":"etnologiștilor","singular-vocative":"etnologistule","plural-vocative":"etnologiștilor"}},{"word":"etnomuzicolog","pos":"noun","definitions":["ethnomusicologist"],"forms":{"plural":"etnomuzicologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etnomuzicolog","accusative-definite-nominative-singular":"etnomuzicologul","accusative-indefinite-nominative-plural":"etnomuzicologi","accusative-definite-nominative-plural":"etnomuzicologii","dative-genitive-indefinite-singular":"etnomuzicolog","dative-definite-genitive-singular":"etnomuzicologului","dative-genitive-indefinite-plural":"etnomuzicologi","dative-definite-genitive-plural":"etnomuzicologilor","singular-vocative":"etnomuzicologule","plural-vocative":"etnomuzicologilor"}},{"word":"etnomuzicologă","pos":"noun","definitions":["female equivalent of etnomuzicolog"],"forms":{"plural":"etnomuzicologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etnomuzicologă","accusative-definite-nominative-singular":"etnomuzicologa","accusative-indefinite-nominative-plural":"etnomuzicologe","accusative-definite-nominative-plural":"etnomuzicologele","dative-genitive-indefinite-singular":"etnomuzicologe","dative-definite-genitive-singular":"etnomuzicologei","dative-genitive-indefinite-plural":"etnomuzicologe","dative-definite-genitive-plural":"etnomuzicologelor","singular-vocative":"etnomuzicologă","plural-vocative":"etnomuzicologelor"}},{"word":"etnomuzicologie","pos":"noun","definitions":["ethnomusicology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etnomuzicologie","accusative-definite-nominative":"etnomuzicologia","dative-genitive-indefinite":"etnomuzicologii","dative-definite-genitive":"etnomuzicologiei","vocative":"etnomuzicologie"}},{"word":"etnonim","pos":"noun","definitions":["ethnonym"],"forms":{"plural":"etnonime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etnonim","accusative-definite-nominative-singular":"etnonimul","accusative-indefinite-nominative-plural":"etnonime","accusative-definite-nominative-plural":"etnonimele","dative-genitive-indefinite-singular":"etnonim","dative-definite-genitive-singular":"etnonimului","dative-genitive-indefinite-plural":"etnonime","dative-definite-genitive-plural":"etnonimelor","singular-vocative":"etnonimule","plural-vocative":"etnonimelor"}},{"word":"etnopsihologie","pos":"noun","definitions":["ethnopsychology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnopsihologie","accusative-definite-nominative-singular":"etnopsihologia","accusative-indefinite-nominative-plural":"etnopsihologii","accusative-definite-nominative-plural":"etnopsihologiile","dative-genitive-indefinite-singular":"etnopsihologii","dative-definite-genitive-singular":"etnopsihologiei","dative-genitive-indefinite-plural":"etnopsihologii","dative-definite-genitive-plural":"etnopsihologiilor","singular-vocative":"etnopsihologie","plural-vocative":"etnopsihologiilor"}},{"word":"etnosociologie","pos":"noun","definitions":["ethnosociology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etnosociologie","accusative-definite-nominative-singular":"etnosociologia","accusative-indefinite-nominative-plural":"etnosociologii","accusative-definite-nominative-plural":"etnosociologiile","dative-genitive-indefinite-singular":"etnosociologii","dative-definite-genitive-singular":"etnosociologiei","dative-genitive-indefinite-plural":"etnosociologii","dative-definite-genitive-plural":"etnosociologiilor","singular-vocative":"etnosociologie","plural-vocative":"etnosociologiilor"}},{"word":"etografie","pos":"noun","definitions":["ethography"],"forms":{"plural":"etografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"etografie","accusative-definite-nominative-singular":"etografia","accusative-indefinite-nominative-plural":"etografii","accusative-definite-nominative-plural":"etografiile","dative-genitive-indefinite-singular":"etografii","dative-definite-genitive-singular":"etografiei","dative-genitive-indefinite-plural":"etografii","dative-definite-genitive-plural":"etografiilor","singular-vocative":"etografie","plural-vocative":"etografiilor"}},{"word":"etolă","pos":"noun","definitions":["stole"],"forms":{"plural":"etole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etolă","accusative-definite-nominative-singular":"etola","accusative-indefinite-nominative-plural":"etole","accusative-definite-nominative-plural":"etolele","dative-genitive-indefinite-singular":"etole","dative-definite-genitive-singular":"etolei","dative-genitive-indefinite-plural":"etole","dative-definite-genitive-plural":"etolelor","singular-vocative":"etolă","plural-vocative":"etolelor"}},{"word":"etolog","pos":"noun","definitions":["ethologist"],"pronunciation":"/e.toˈloɡ/","forms":{"plural":"etologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etolog","accusative-definite-nominative-singular":"etologul","accusative-indefinite-nominative-plural":"etologi","accusative-definite-nominative-plural":"etologii","dative-genitive-indefinite-singular":"etolog","dative-definite-genitive-singular":"etologului","dative-genitive-indefinite-plural":"etologi","dative-definite-genitive-plural":"etologilor","singular-vocative":"etologule","plural-vocative":"etologilor"}},{"word":"etologic","pos":"adj","definitions":["ethologic"],"forms":{"feminine-singular":"etologică","masculine-plural":"etologici","feminine-neuter-plural":"etologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etologic","error-unrecognized-form-feminine-indefinite-singular":"etologică","error-unrecognized-form-indefinite-masculine-plural":"etologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"etologice","definite-error-unrecognized-form-masculine-neuter-singular":"etologicul","definite-error-unrecognized-form-feminine-singular":"etologica","definite-error-unrecognized-form-masculine-plural":"etologicii","definite-error-unrecognized-form-feminine-neuter-plural":"etologicele"}},{"word":"etologie","pos":"noun","definitions":["ethology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etologie","accusative-definite-nominative":"etologia","dative-genitive-indefinite":"etologii","dative-definite-genitive":"etologiei","vocative":"etologie"}},{"word":"etonament","pos":"noun","definitions":["astonishment (amazement, great surprise)"],"forms":{"plural":"etonamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etonament","accusative-definite-nominative-singular":"etonamentul","accusative-indefinite-nominative-plural":"etonamente","accusative-definite-nominative-plural":"etonamentele","dative-genitive-indefinite-singular":"etonament","dative-definite-genitive-singular":"etonamentului","dative-genitive-indefinite-plural":"etonamente","dative-definite-genitive-plural":"etonamentelor","singular-vocative":"etonamentule","plural-vocative":"etonamentelor"}},{"word":"etos","pos":"noun","definitions":["ethos"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"etos","accusative-definite-nominative":"etosul","dative-genitive-indefinite":"etos","dative-definite-genitive":"etosului","vocative":"etosule"}},{"word":"etravă","pos":"noun","definitions":["stem"],"forms":{"plural":"etrave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etravă","accusative-definite-nominative-singular":"etrava","accusative-indefinite-nominative-plural":"etrave","accusative-definite-nominative-plural":"etravele","dative-genitive-indefinite-singular":"etrave","dative-definite-genitive-singular":"etravei","dative-genitive-indefinite-plural":"etrave","dative-definite-genitive-plural":"etravelor","singular-vocative":"etravă","plural-vocative":"etravelor"}},{"word":"etrier","pos":"noun","definitions":["caliper"],"forms":{"plural":"etriere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"etrier","accusative-definite-nominative-singular":"etrierul","accusative-indefinite-nominative-plural":"etriere","accusative-definite-nominative-plural":"etrierele","dative-genitive-indefinite-singular":"etrier","dative-definite-genitive-singular":"etrierului","dative-genitive-indefinite-plural":"etriere","dative-definite-genitive-plural":"etrierelor","singular-vocative":"etrierule","plural-vocative":"etrierelor"}},{"word":"etrusc","pos":"noun","definitions":["Etruscan"],"pronunciation":"/eˈtrusk/","forms":{"plural":"etrusci","feminine":"equivalent etruscă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etrusc","accusative-definite-nominative-singular":"etruscul","accusative-indefinite-nominative-plural":"etrusci","accusative-definite-nominative-plural":"etruscii","dative-genitive-indefinite-singular":"etrusc","dative-definite-genitive-singular":"etruscului","dative-genitive-indefinite-plural":"etrusci","dative-definite-genitive-plural":"etruscilor","singular-vocative":"etruscule","plural-vocative":"etruscilor"}},{"word":"etruscă","pos":"noun","definitions":["female equivalent of etrusc","Etruscan language"],"forms":{"plural":"etrusce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etruscă","accusative-definite-nominative-singular":"etrusca","accusative-indefinite-nominative-plural":"etrusce","accusative-definite-nominative-plural":"etruscele","dative-genitive-indefinite-singular":"etrusce","dative-definite-genitive-singular":"etruscei","dative-genitive-indefinite-plural":"etrusce","dative-definite-genitive-plural":"etruscelor","singular-vocative":"etruscă","plural-vocative":"etruscelor"}},{"word":"etruscolog","pos":"noun","definitions":["Etruscologist"],"forms":{"plural":"etruscologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"etruscolog","accusative-definite-nominative-singular":"etruscologul","accusative-indefinite-nominative-plural":"etruscologi","accusative-definite-nominative-plural":"etruscologii","dative-genitive-indefinite-singular":"etruscolog","dative-definite-genitive-singular":"etruscologului","dative-genitive-indefinite-plural":"etruscologi","dative-definite-genitive-plural":"etruscologilor","singular-vocative":"etruscologule","plural-vocative":"etruscologilor"}},{"word":"etruscologie","pos":"noun","definitions":["Etruscology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"etruscologie","accusative-definite-nominative":"etruscologia","dative-genitive-indefinite":"etruscologii","dative-definite-genitive":"etruscologiei","vocative":"etruscologie"}},{"word":"etufant","pos":"adj","definitions":["suffocating"],"forms":{"feminine-singular":"etufantă","masculine-plural":"etufanți","feminine-neuter-plural":"etufante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"etufant","error-unrecognized-form-feminine-indefinite-singular":"etufantă","error-unrecognized-form-indefinite-masculine-plural":"etufanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"etufante","definite-error-unrecognized-form-masculine-neuter-singular":"etufantul","definite-error-unrecognized-form-feminine-singular":"etufanta","definite-error-unrecognized-form-masculine-plural":"etufanții","definite-error-unrecognized-form-feminine-neuter-plural":"etufantele"}},{"word":"etui","pos":"noun","definitions":["case, holster"],"forms":{"plural":"etuiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"etui","accusative-definite-nominative-singular":"etuiul","accusative-indefinite-nominative-plural":"etuiuri","accusative-definite-nominative-plural":"etuiurile","dative-genitive-indefinite-singular":"etui","dative-definite-genitive-singular":"etuiului","dative-genitive-indefinite-plural":"etuiuri","dative-definite-genitive-plural":"etuiurilor","singular-vocative":"etuiule","plural-vocative":"etuiurilor"}},{"word":"Etulia Nouă","pos":"name","definitions":["a village in Etulia, Gagauzia, Moldova"],"gender":"f"},{"word":"etuvă","pos":"noun","definitions":["oven"],"forms":{"plural":"etuve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"etuvă","accusative-definite-nominative-singular":"etuva","accusative-indefinite-nominative-plural":"etuve","accusative-definite-nominative-plural":"etuvele","dative-genitive-indefinite-singular":"etuve","dative-definite-genitive-singular":"etuvei","dative-genitive-indefinite-plural":"etuve","dative-definite-genitive-plural":"etuvelor","singular-vocative":"etuvă","plural-vocative":"etuvelor"}},{"word":"eu","pos":"pron","definitions":["I"],"pronunciation":"/jew/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","nominative":"eu","accusative-stressed":"mine","accusative-error-unrecognized-form":"mă","dative-stressed":"mie","dative-error-unrecognized-form":"îmi","masculine-possessive-singular":"meu","masculine-plural-possessive":"mei","neuter-possessive-singular":"meu","neuter-plural-possessive":"mele","feminine-possessive-singular":"mea","feminine-plural-possessive":"mele","alternative-archaic":"eŭ","alternative-colloquial":"io"}},{"word":"eu","pos":"noun","definitions":["ego"],"pronunciation":"/jew/","forms":{"plural":"euri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eu","accusative-definite-nominative-singular":"eul","accusative-indefinite-nominative-plural":"euri","accusative-definite-nominative-plural":"eurile","dative-genitive-indefinite-singular":"eu","dative-definite-genitive-singular":"eului","dative-genitive-indefinite-plural":"euri","dative-definite-genitive-plural":"eurilor","singular-vocative":"eule","plural-vocative":"eurilor","alternative-archaic":"eŭ","alternative-colloquial":"io"}},{"word":"eucalipt","pos":"noun","definitions":["eucalyptus (any of many trees of genus Eucalyptus)"],"forms":{"plural":"eucalipți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eucalipt","accusative-definite-nominative-singular":"eucaliptul","accusative-indefinite-nominative-plural":"eucalipți","accusative-definite-nominative-plural":"eucalipții","dative-genitive-indefinite-singular":"eucalipt","dative-definite-genitive-singular":"eucaliptului","dative-genitive-indefinite-plural":"eucalipți","dative-definite-genitive-plural":"eucalipților","singular-vocative":"eucaliptule","plural-vocative":"eucalipților"}},{"word":"eucaliptol","pos":"noun","definitions":["eucalyptol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"eucaliptol","accusative-definite-nominative":"eucaliptolul","dative-genitive-indefinite":"eucaliptol","dative-definite-genitive":"eucaliptolului","vocative":"eucaliptolule"}},{"word":"eucariotă","pos":"noun","definitions":["eukaryote"],"forms":{"plural":"eucariote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eucariotă","accusative-definite-nominative-singular":"eucariota","accusative-indefinite-nominative-plural":"eucariote","accusative-definite-nominative-plural":"eucariotele","dative-genitive-indefinite-singular":"eucariote","dative-definite-genitive-singular":"eucariotei","dative-genitive-indefinite-plural":"eucariote","dative-definite-genitive-plural":"eucariotelor","singular-vocative":"eucariotă","plural-vocative":"eucariotelor"}},{"word":"euclaz","pos":"noun","definitions":["euclase"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"euclaz","accusative-definite-nominative":"euclazul","dative-genitive-indefinite":"euclaz","dative-definite-genitive":"euclazului","vocative":"euclazule"}},{"word":"euclidian","pos":"adj","definitions":["Euclidean"],"forms":{"feminine-singular":"euclidiană","masculine-plural":"euclidieni","feminine-neuter-plural":"euclidiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euclidian","error-unrecognized-form-feminine-indefinite-singular":"euclidiană","error-unrecognized-form-indefinite-masculine-plural":"euclidieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"euclidiene","definite-error-unrecognized-form-masculine-neuter-singular":"euclidianul","definite-error-unrecognized-form-feminine-singular":"euclidiana","definite-error-unrecognized-form-masculine-plural":"euclidienii","definite-error-unrecognized-form-feminine-neuter-plural":"euclidienele"}},{"word":"euclidic","pos":"adj","definitions":["Euclidean"],"forms":{"feminine-singular":"euclidică","masculine-plural":"euclidici","feminine-neuter-plural":"euclidice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euclidic","error-unrecognized-form-feminine-indefinite-singular":"euclidică","error-unrecognized-form-indefinite-masculine-plural":"euclidici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euclidice","definite-error-unrecognized-form-masculine-neuter-singular":"euclidicul","definite-error-unrecognized-form-feminine-singular":"euclidica","definite-error-unrecognized-form-masculine-plural":"euclidicii","definite-error-unrecognized-form-feminine-neuter-plural":"euclidicele"}},{"word":"eucoloid","pos":"noun","definitions":["eucolloid"],"forms":{"plural":"eucoloizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eucoloid","accusative-definite-nominative-singular":"eucoloidul","accusative-indefinite-nominative-plural":"eucoloizi","accusative-definite-nominative-plural":"eucoloizii","dative-genitive-indefinite-singular":"eucoloid","dative-definite-genitive-singular":"eucoloidului","dative-genitive-indefinite-plural":"eucoloizi","dative-definite-genitive-plural":"eucoloizilor","singular-vocative":"eucoloidule","plural-vocative":"eucoloizilor"}},{"word":"eucrazie","pos":"noun","definitions":["eucrasia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eucrazie","accusative-definite-nominative":"eucrazia","dative-genitive-indefinite":"eucrazii","dative-definite-genitive":"eucraziei","vocative":"eucrazie"}},{"word":"eucromozom","pos":"noun","definitions":["euchromosome"],"forms":{"plural":"eucromozomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eucromozom","accusative-definite-nominative-singular":"eucromozomul","accusative-indefinite-nominative-plural":"eucromozomi","accusative-definite-nominative-plural":"eucromozomii","dative-genitive-indefinite-singular":"eucromozom","dative-definite-genitive-singular":"eucromozomului","dative-genitive-indefinite-plural":"eucromozomi","dative-definite-genitive-plural":"eucromozomilor","singular-vocative":"eucromozomule","plural-vocative":"eucromozomilor"}},{"word":"eudemonic","pos":"adj","definitions":["eudaemonic"],"forms":{"feminine-singular":"eudemonică","masculine-plural":"eudemonici","feminine-neuter-plural":"eudemonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eudemonic","error-unrecognized-form-feminine-indefinite-singular":"eudemonică","error-unrecognized-form-indefinite-masculine-plural":"eudemonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eudemonice","definite-error-unrecognized-form-masculine-neuter-singular":"eudemonicul","definite-error-unrecognized-form-feminine-singular":"eudemonica","definite-error-unrecognized-form-masculine-plural":"eudemonicii","definite-error-unrecognized-form-feminine-neuter-plural":"eudemonicele"}},{"word":"eudemonie","pos":"noun","definitions":["happiness"],"forms":{"plural":"eudemonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eudemonie","accusative-definite-nominative-singular":"eudemonia","accusative-indefinite-nominative-plural":"eudemonii","accusative-definite-nominative-plural":"eudemoniile","dative-genitive-indefinite-singular":"eudemonii","dative-definite-genitive-singular":"eudemoniei","dative-genitive-indefinite-plural":"eudemonii","dative-definite-genitive-plural":"eudemoniilor","singular-vocative":"eudemonie","plural-vocative":"eudemoniilor"}},{"word":"eudemonism","pos":"noun","definitions":["eudaemonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eudemonism","accusative-definite-nominative":"eudemonismul","dative-genitive-indefinite":"eudemonism","dative-definite-genitive":"eudemonismului","vocative":"eudemonismule"}},{"word":"eudemonist","pos":"noun","definitions":["eudaemonist"],"forms":{"plural":"eudemoniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eudemonist","accusative-definite-nominative-singular":"eudemonistul","accusative-indefinite-nominative-plural":"eudemoniști","accusative-definite-nominative-plural":"eudemoniștii","dative-genitive-indefinite-singular":"eudemonist","dative-definite-genitive-singular":"eudemonistului","dative-genitive-indefinite-plural":"eudemoniști","dative-definite-genitive-plural":"eudemoniștilor","singular-vocative":"eudemonistule","plural-vocative":"eudemoniștilor"}},{"word":"eudemonistă","pos":"noun","definitions":["female equivalent of eudemonist"],"forms":{"plural":"eudemoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eudemonistă","accusative-definite-nominative-singular":"eudemonista","accusative-indefinite-nominative-plural":"eudemoniste","accusative-definite-nominative-plural":"eudemonistele","dative-genitive-indefinite-singular":"eudemoniste","dative-definite-genitive-singular":"eudemonistei","dative-genitive-indefinite-plural":"eudemoniste","dative-definite-genitive-plural":"eudemonistelor","singular-vocative":"eudemonistă","plural-vocative":"eudemonistelor"}},{"word":"eudiometric","pos":"adj","definitions":["eudiometric"],"forms":{"feminine-singular":"eudiometrică","masculine-plural":"eudiometrici","feminine-neuter-plural":"eudiometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eudiometric","error-unrecognized-form-feminine-indefinite-singular":"eudiometrică","error-unrecognized-form-indefinite-masculine-plural":"eudiometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eudiometrice","definite-error-unrecognized-form-masculine-neuter-singular":"eudiometricul","definite-error-unrecognized-form-feminine-singular":"eudiometrica","definite-error-unrecognized-form-masculine-plural":"eudiometricii","definite-error-unrecognized-form-feminine-neuter-plural":"eudiometricele"}},{"word":"eudiometrie","pos":"noun","definitions":["eudiometry"],"forms":{"plural":"eudiometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eudiometrie","accusative-definite-nominative-singular":"eudiometria","accusative-indefinite-nominative-plural":"eudiometrii","accusative-definite-nominative-plural":"eudiometriile","dative-genitive-indefinite-singular":"eudiometrii","dative-definite-genitive-singular":"eudiometriei","dative-genitive-indefinite-plural":"eudiometrii","dative-definite-genitive-plural":"eudiometriilor","singular-vocative":"eudiometrie","plural-vocative":"eudiometriilor"}},{"word":"eudiometru","pos":"noun","definitions":["eudiometer"],"forms":{"plural":"eudiometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eudiometru","accusative-definite-nominative-singular":"eudiometrul","accusative-indefinite-nominative-plural":"eudiometre","accusative-definite-nominative-plural":"eudiometrele","dative-genitive-indefinite-singular":"eudiometru","dative-definite-genitive-singular":"eudiometrului","dative-genitive-indefinite-plural":"eudiometre","dative-definite-genitive-plural":"eudiometrelor","singular-vocative":"eudiometrule","plural-vocative":"eudiometrelor"}},{"word":"eudist","pos":"noun","definitions":["eudist"],"forms":{"plural":"eudiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eudist","accusative-definite-nominative-singular":"eudistul","accusative-indefinite-nominative-plural":"eudiști","accusative-definite-nominative-plural":"eudiștii","dative-genitive-indefinite-singular":"eudist","dative-definite-genitive-singular":"eudistului","dative-genitive-indefinite-plural":"eudiști","dative-definite-genitive-plural":"eudiștilor","singular-vocative":"eudistule","plural-vocative":"eudiștilor"}},{"word":"eudistă","pos":"noun","definitions":["female equivalent of eudist"],"forms":{"plural":"eudiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eudistă","accusative-definite-nominative-singular":"eudista","accusative-indefinite-nominative-plural":"eudiste","accusative-definite-nominative-plural":"eudistele","dative-genitive-indefinite-singular":"eudiste","dative-definite-genitive-singular":"eudistei","dative-genitive-indefinite-plural":"eudiste","dative-definite-genitive-plural":"eudistelor","singular-vocative":"eudistă","plural-vocative":"eudistelor"}},{"word":"eufemic","pos":"adj","definitions":["euphemistic"],"forms":{"feminine-singular":"eufemică","masculine-plural":"eufemici","feminine-neuter-plural":"eufemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eufemic","error-unrecognized-form-feminine-indefinite-singular":"eufemică","error-unrecognized-form-indefinite-masculine-plural":"eufemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eufemice","definite-error-unrecognized-form-masculine-neuter-singular":"eufemicul","definite-error-unrecognized-form-feminine-singular":"eufemica","definite-error-unrecognized-form-masculine-plural":"eufemicii","definite-error-unrecognized-form-feminine-neuter-plural":"eufemicele"}},{"word":"eufemism","pos":"noun","definitions":["euphemism"],"forms":{"plural":"eufemisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eufemism","accusative-definite-nominative-singular":"eufemismul","accusative-indefinite-nominative-plural":"eufemisme","accusative-definite-nominative-plural":"eufemismele","dative-genitive-indefinite-singular":"eufemism","dative-definite-genitive-singular":"eufemismului","dative-genitive-indefinite-plural":"eufemisme","dative-definite-genitive-plural":"eufemismelor","singular-vocative":"eufemismule","plural-vocative":"eufemismelor"}},{"word":"eufemist","pos":"adj","definitions":["euphemistic"],"forms":{"feminine-singular":"eufemistă","masculine-plural":"eufemiști","feminine-neuter-plural":"eufemiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eufemist","error-unrecognized-form-feminine-indefinite-singular":"eufemistă","error-unrecognized-form-indefinite-masculine-plural":"eufemiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"eufemiste","definite-error-unrecognized-form-masculine-neuter-singular":"eufemistul","definite-error-unrecognized-form-feminine-singular":"eufemista","definite-error-unrecognized-form-masculine-plural":"eufemiștii","definite-error-unrecognized-form-feminine-neuter-plural":"eufemistele"}},{"word":"eufemistic","pos":"adj","definitions":["euphemistic"],"forms":{"feminine-singular":"eufemistică","masculine-plural":"eufemistici","feminine-neuter-plural":"eufemistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eufemistic","error-unrecognized-form-feminine-indefinite-singular":"eufemistică","error-unrecognized-form-indefinite-masculine-plural":"eufemistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eufemistice","definite-error-unrecognized-form-masculine-neuter-singular":"eufemisticul","definite-error-unrecognized-form-feminine-singular":"eufemistica","definite-error-unrecognized-form-masculine-plural":"eufemisticii","definite-error-unrecognized-form-feminine-neuter-plural":"eufemisticele"}},{"word":"eufonic","pos":"adj","definitions":["euphonic"],"forms":{"feminine-singular":"eufonică","masculine-plural":"eufonici","feminine-neuter-plural":"eufonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eufonic","error-unrecognized-form-feminine-indefinite-singular":"eufonică","error-unrecognized-form-indefinite-masculine-plural":"eufonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eufonice","definite-error-unrecognized-form-masculine-neuter-singular":"eufonicul","definite-error-unrecognized-form-feminine-singular":"eufonica","definite-error-unrecognized-form-masculine-plural":"eufonicii","definite-error-unrecognized-form-feminine-neuter-plural":"eufonicele"}},{"word":"eufonie","pos":"noun","definitions":["euphony"],"forms":{"plural":"eufonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eufonie","accusative-definite-nominative-singular":"eufonia","accusative-indefinite-nominative-plural":"eufonii","accusative-definite-nominative-plural":"eufoniile","dative-genitive-indefinite-singular":"eufonii","dative-definite-genitive-singular":"eufoniei","dative-genitive-indefinite-plural":"eufonii","dative-definite-genitive-plural":"eufoniilor","singular-vocative":"eufonie","plural-vocative":"eufoniilor"}},{"word":"eufonism","pos":"noun","definitions":["euphonism"],"forms":{"plural":"eufonisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eufonism","accusative-definite-nominative-singular":"eufonismul","accusative-indefinite-nominative-plural":"eufonisme","accusative-definite-nominative-plural":"eufonismele","dative-genitive-indefinite-singular":"eufonism","dative-definite-genitive-singular":"eufonismului","dative-genitive-indefinite-plural":"eufonisme","dative-definite-genitive-plural":"eufonismelor","singular-vocative":"eufonismule","plural-vocative":"eufonismelor"}},{"word":"eufoniu","pos":"noun","definitions":["euphonium"],"forms":{"plural":"eufonii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eufoniu","accusative-definite-nominative-singular":"eufoniuul","accusative-indefinite-nominative-plural":"eufonii","accusative-definite-nominative-plural":"eufoniile","dative-genitive-indefinite-singular":"eufoniu","dative-definite-genitive-singular":"eufoniuului","dative-genitive-indefinite-plural":"eufonii","dative-definite-genitive-plural":"eufoniilor","singular-vocative":"eufoniuule","plural-vocative":"eufoniilor"}},{"word":"euforbie","pos":"noun","definitions":["euphorbia"],"forms":{"plural":"euforbii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"euforbie","accusative-definite-nominative-singular":"euforbieul","accusative-indefinite-nominative-plural":"euforbii","accusative-definite-nominative-plural":"euforbiile","dative-genitive-indefinite-singular":"euforbie","dative-definite-genitive-singular":"euforbieului","dative-genitive-indefinite-plural":"euforbii","dative-definite-genitive-plural":"euforbiilor","singular-vocative":"euforbieule","plural-vocative":"euforbiilor"}},{"word":"euforic","pos":"adj","definitions":["euphoric"],"forms":{"feminine-singular":"euforică","masculine-plural":"euforici","feminine-neuter-plural":"euforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euforic","error-unrecognized-form-feminine-indefinite-singular":"euforică","error-unrecognized-form-indefinite-masculine-plural":"euforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euforice","definite-error-unrecognized-form-masculine-neuter-singular":"euforicul","definite-error-unrecognized-form-feminine-singular":"euforica","definite-error-unrecognized-form-masculine-plural":"euforicii","definite-error-unrecognized-form-feminine-neuter-plural":"euforicele"}},{"word":"euforie","pos":"noun","definitions":["euphoria (an excited state of joy)"],"forms":{"plural":"euforii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"euforie","accusative-definite-nominative-singular":"euforia","accusative-indefinite-nominative-plural":"euforii","accusative-definite-nominative-plural":"euforiile","dative-genitive-indefinite-singular":"euforii","dative-definite-genitive-singular":"euforiei","dative-genitive-indefinite-plural":"euforii","dative-definite-genitive-plural":"euforiilor","singular-vocative":"euforie","plural-vocative":"euforiilor"}},{"word":"euforii","pos":"noun","definitions":["plural of euforie"]},{"word":"euforizant","pos":"adj","definitions":["euphoriant"],"forms":{"feminine-singular":"euforizantă","masculine-plural":"euforizanți","feminine-neuter-plural":"euforizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euforizant","error-unrecognized-form-feminine-indefinite-singular":"euforizantă","error-unrecognized-form-indefinite-masculine-plural":"euforizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"euforizante","definite-error-unrecognized-form-masculine-neuter-singular":"euforizantul","definite-error-unrecognized-form-feminine-singular":"euforizanta","definite-error-unrecognized-form-masculine-plural":"euforizanții","definite-error-unrecognized-form-feminine-neuter-plural":"euforizantele"}},{"word":"Eufrosin","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Eufrosin"}},{"word":"Eufrosina","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"eufuism","pos":"noun","definitions":["euphuism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eufuism","accusative-definite-nominative":"eufuismul","dative-genitive-indefinite":"eufuism","dative-definite-genitive":"eufuismului","vocative":"eufuismule"}},{"word":"eufuistic","pos":"adj","definitions":["euphuistic"],"forms":{"feminine-singular":"eufuistică","masculine-plural":"eufuistici","feminine-neuter-plural":"eufuistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eufuistic","error-unrecognized-form-feminine-indefinite-singular":"eufuistică","error-unrecognized-form-indefinite-masculine-plural":"eufuistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eufuistice","definite-error-unrecognized-form-masculine-neuter-singular":"eufuisticul","definite-error-unrecognized-form-feminine-singular":"eufuistica","definite-error-unrecognized-form-masculine-plural":"eufuisticii","definite-error-unrecognized-form-feminine-neuter-plural":"eufuisticele"}},{"word":"Eugen","pos":"name","definitions":["a male given name from Latin, feminine equivalent Eugenia, equivalent to English Eugene"],"gender":"m"},{"word":"eugenetică","pos":"noun","definitions":["eugenics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"eugenetică","accusative-definite-nominative":"eugenetica","dative-genitive-indefinite":"eugenetici","dative-definite-genitive":"eugeneticii","vocative":"eugenetică"}},{"word":"eugenezic","pos":"adj","definitions":["eugenic"],"forms":{"feminine-singular":"eugenezică","masculine-plural":"eugenezici","feminine-neuter-plural":"eugenezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eugenezic","error-unrecognized-form-feminine-indefinite-singular":"eugenezică","error-unrecognized-form-indefinite-masculine-plural":"eugenezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eugenezice","definite-error-unrecognized-form-masculine-neuter-singular":"eugenezicul","definite-error-unrecognized-form-feminine-singular":"eugenezica","definite-error-unrecognized-form-masculine-plural":"eugenezicii","definite-error-unrecognized-form-feminine-neuter-plural":"eugenezicele"}},{"word":"eugenic","pos":"adj","definitions":["eugenic"],"forms":{"feminine-singular":"eugenică","masculine-plural":"eugenici","feminine-neuter-plural":"eugenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eugenic","error-unrecognized-form-feminine-indefinite-singular":"eugenică","error-unrecognized-form-indefinite-masculine-plural":"eugenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eugenice","definite-error-unrecognized-form-masculine-neuter-singular":"eugenicul","definite-error-unrecognized-form-feminine-singular":"eugenica","definite-error-unrecognized-form-masculine-plural":"eugenicii","definite-error-unrecognized-form-feminine-neuter-plural":"eugenicele"}},{"word":"eugenie","pos":"noun","definitions":["eugenics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eugenie","accusative-definite-nominative":"eugenia","dative-genitive-indefinite":"eugenii","dative-definite-genitive":"eugeniei","vocative":"eugenie"}},{"word":"eugenism","pos":"noun","definitions":["eugenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eugenism","accusative-definite-nominative":"eugenismul","dative-genitive-indefinite":"eugenism","dative-definite-genitive":"eugenismului","vocative":"eugenismule"}},{"word":"eugenist","pos":"adj","definitions":["eugenicist"],"forms":{"feminine-singular":"eugenistă","masculine-plural":"eugeniști","feminine-neuter-plural":"eugeniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eugenist","error-unrecognized-form-feminine-indefinite-singular":"eugenistă","error-unrecognized-form-indefinite-masculine-plural":"eugeniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"eugeniste","definite-error-unrecognized-form-masculine-neuter-singular":"eugenistul","definite-error-unrecognized-form-feminine-singular":"eugenista","definite-error-unrecognized-form-masculine-plural":"eugeniștii","definite-error-unrecognized-form-feminine-neuter-plural":"eugenistele"}},{"word":"eugenol","pos":"noun","definitions":["eugenol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eugenol","accusative-definite-nominative":"eugenolul","dative-genitive-indefinite":"eugenol","dative-definite-genitive":"eugenolului","vocative":"eugenolule"}},{"word":"euglenă","pos":"noun","definitions":["euglene"],"forms":{"plural":"euglene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"euglenă","accusative-definite-nominative-singular":"euglena","accusative-indefinite-nominative-plural":"euglene","accusative-definite-nominative-plural":"euglenele","dative-genitive-indefinite-singular":"euglene","dative-definite-genitive-singular":"euglenei","dative-genitive-indefinite-plural":"euglene","dative-definite-genitive-plural":"euglenelor","singular-vocative":"euglenă","plural-vocative":"euglenelor"}},{"word":"euharistic","pos":"adj","definitions":["Eucharistic"],"forms":{"feminine-singular":"euharistică","masculine-plural":"euharistici","feminine-neuter-plural":"euharistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euharistic","error-unrecognized-form-feminine-indefinite-singular":"euharistică","error-unrecognized-form-indefinite-masculine-plural":"euharistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euharistice","definite-error-unrecognized-form-masculine-neuter-singular":"euharisticul","definite-error-unrecognized-form-feminine-singular":"euharistica","definite-error-unrecognized-form-masculine-plural":"euharisticii","definite-error-unrecognized-form-feminine-neuter-plural":"euharisticele"}},{"word":"euharistie","pos":"noun","definitions":["Eucharist"],"forms":{"plural":"euharistii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"euharistie","accusative-definite-nominative-singular":"euharistia","accusative-indefinite-nominative-plural":"euharistii","accusative-definite-nominative-plural":"euharistiile","dative-genitive-indefinite-singular":"euharistii","dative-definite-genitive-singular":"euharistiei","dative-genitive-indefinite-plural":"euharistii","dative-definite-genitive-plural":"euharistiilor","singular-vocative":"euharistie","plural-vocative":"euharistiilor"}},{"word":"euhemerism","pos":"noun","definitions":["euhemerism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"euhemerism","accusative-definite-nominative":"euhemerismul","dative-genitive-indefinite":"euhemerism","dative-definite-genitive":"euhemerismului","vocative":"euhemerismule"}},{"word":"euism","pos":"noun","definitions":["selfism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"euism","accusative-definite-nominative":"euismul","dative-genitive-indefinite":"euism","dative-definite-genitive":"euismului","vocative":"euismule"}},{"word":"eul","pos":"noun","definitions":["definite nominative/accusative singular of eu"]},{"word":"eulogie","pos":"noun","definitions":["eulogy"],"forms":{"plural":"eulogii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eulogie","accusative-definite-nominative-singular":"eulogia","accusative-indefinite-nominative-plural":"eulogii","accusative-definite-nominative-plural":"eulogiile","dative-genitive-indefinite-singular":"eulogii","dative-definite-genitive-singular":"eulogiei","dative-genitive-indefinite-plural":"eulogii","dative-definite-genitive-plural":"eulogiilor","singular-vocative":"eulogie","plural-vocative":"eulogiilor"}},{"word":"eunuc","pos":"noun","definitions":["eunuch"],"forms":{"plural":"eunuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eunuc","accusative-definite-nominative-singular":"eunucul","accusative-indefinite-nominative-plural":"eunuci","accusative-definite-nominative-plural":"eunucii","dative-genitive-indefinite-singular":"eunuc","dative-definite-genitive-singular":"eunucului","dative-genitive-indefinite-plural":"eunuci","dative-definite-genitive-plural":"eunucilor","singular-vocative":"eunucule","plural-vocative":"eunucilor"}},{"word":"eunuchism","pos":"noun","definitions":["eunuchism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eunuchism","accusative-definite-nominative":"eunuchismul","dative-genitive-indefinite":"eunuchism","dative-definite-genitive":"eunuchismului","vocative":"eunuchismule"}},{"word":"eunucoid","pos":"adj","definitions":["eunuchoid"],"forms":{"feminine-singular":"eunucoidă","masculine-plural":"eunucoizi","feminine-neuter-plural":"eunucoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eunucoid","error-unrecognized-form-feminine-indefinite-singular":"eunucoidă","error-unrecognized-form-indefinite-masculine-plural":"eunucoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eunucoide","definite-error-unrecognized-form-masculine-neuter-singular":"eunucoidul","definite-error-unrecognized-form-feminine-singular":"eunucoida","definite-error-unrecognized-form-masculine-plural":"eunucoizii","definite-error-unrecognized-form-feminine-neuter-plural":"eunucoidele"}},{"word":"eunucoidism","pos":"noun","definitions":["eunuchoidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eunucoidism","accusative-definite-nominative":"eunucoidismul","dative-genitive-indefinite":"eunucoidism","dative-definite-genitive":"eunucoidismului","vocative":"eunucoidismule"}},{"word":"eupatie","pos":"noun","definitions":["eupathy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"eupatie","accusative-definite-nominative":"eupatia","dative-genitive-indefinite":"eupatii","dative-definite-genitive":"eupatiei","vocative":"eupatie"}},{"word":"eupatrid","pos":"noun","definitions":["Eupatrid"],"forms":{"plural":"eupatrizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eupatrid","accusative-definite-nominative-singular":"eupatridul","accusative-indefinite-nominative-plural":"eupatrizi","accusative-definite-nominative-plural":"eupatrizii","dative-genitive-indefinite-singular":"eupatrid","dative-definite-genitive-singular":"eupatridului","dative-genitive-indefinite-plural":"eupatrizi","dative-definite-genitive-plural":"eupatrizilor","singular-vocative":"eupatridule","plural-vocative":"eupatrizilor"}},{"word":"eupepsie","pos":"noun","definitions":["eupepsia"],"forms":{"plural":"eupepsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eupepsie","accusative-definite-nominative-singular":"eupepsia","accusative-indefinite-nominative-plural":"eupepsii","accusative-definite-nominative-plural":"eupepsiile","dative-genitive-indefinite-singular":"eupepsii","dative-definite-genitive-singular":"eupepsiei","dative-genitive-indefinite-plural":"eupepsii","dative-definite-genitive-plural":"eupepsiilor","singular-vocative":"eupepsie","plural-vocative":"eupepsiilor"}},{"word":"eupeptic","pos":"adj","definitions":["eupeptic"],"forms":{"feminine-singular":"eupeptică","masculine-plural":"eupeptici","feminine-neuter-plural":"eupeptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eupeptic","error-unrecognized-form-feminine-indefinite-singular":"eupeptică","error-unrecognized-form-indefinite-masculine-plural":"eupeptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eupeptice","definite-error-unrecognized-form-masculine-neuter-singular":"eupepticul","definite-error-unrecognized-form-feminine-singular":"eupeptica","definite-error-unrecognized-form-masculine-plural":"eupepticii","definite-error-unrecognized-form-feminine-neuter-plural":"eupepticele"}},{"word":"euploid","pos":"noun","definitions":["euploid"],"forms":{"plural":"euploide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"euploid","accusative-definite-nominative-singular":"euploidul","accusative-indefinite-nominative-plural":"euploide","accusative-definite-nominative-plural":"euploidele","dative-genitive-indefinite-singular":"euploid","dative-definite-genitive-singular":"euploidului","dative-genitive-indefinite-plural":"euploide","dative-definite-genitive-plural":"euploidelor","singular-vocative":"euploidule","plural-vocative":"euploidelor"}},{"word":"eupnee","pos":"noun","definitions":["eupnea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"eupnee","accusative-definite-nominative":"eupneea","dative-genitive-indefinite":"eupnee","dative-definite-genitive":"eupneei","vocative":"eupnee"}},{"word":"eurafrican","pos":"adj","definitions":["Eurafrican"],"forms":{"feminine-singular":"eurafricană","masculine-plural":"eurafricani","feminine-neuter-plural":"eurafricane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eurafrican","error-unrecognized-form-feminine-indefinite-singular":"eurafricană","error-unrecognized-form-indefinite-masculine-plural":"eurafricani","error-unrecognized-form-feminine-indefinite-neuter-plural":"eurafricane","definite-error-unrecognized-form-masculine-neuter-singular":"eurafricanul","definite-error-unrecognized-form-feminine-singular":"eurafricana","definite-error-unrecognized-form-masculine-plural":"eurafricanii","definite-error-unrecognized-form-feminine-neuter-plural":"eurafricanele"}},{"word":"eurasian","pos":"adj","definitions":["Eurasian"],"forms":{"feminine-singular":"eurasiană","masculine-plural":"eurasieni","feminine-neuter-plural":"eurasiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eurasian","error-unrecognized-form-feminine-indefinite-singular":"eurasiană","error-unrecognized-form-indefinite-masculine-plural":"eurasieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"eurasiene","definite-error-unrecognized-form-masculine-neuter-singular":"eurasianul","definite-error-unrecognized-form-feminine-singular":"eurasiana","definite-error-unrecognized-form-masculine-plural":"eurasienii","definite-error-unrecognized-form-feminine-neuter-plural":"eurasienele"}},{"word":"eurasiatic","pos":"adj","definitions":["Eurasian"],"forms":{"feminine-singular":"eurasiatică","masculine-plural":"eurasiatici","feminine-neuter-plural":"eurasiatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eurasiatic","error-unrecognized-form-feminine-indefinite-singular":"eurasiatică","error-unrecognized-form-indefinite-masculine-plural":"eurasiatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eurasiatice","definite-error-unrecognized-form-masculine-neuter-singular":"eurasiaticul","definite-error-unrecognized-form-feminine-singular":"eurasiatica","definite-error-unrecognized-form-masculine-plural":"eurasiaticii","definite-error-unrecognized-form-feminine-neuter-plural":"eurasiaticele"}},{"word":"euri","pos":"noun","definitions":["plural of eu"],"gender":"n"},{"word":"euricefal","pos":"adj","definitions":["eurycephalic"],"forms":{"feminine-singular":"euricefală","masculine-plural":"euricefali","feminine-neuter-plural":"euricefale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euricefal","error-unrecognized-form-feminine-indefinite-singular":"euricefală","error-unrecognized-form-indefinite-masculine-plural":"euricefali","error-unrecognized-form-feminine-indefinite-neuter-plural":"euricefale","definite-error-unrecognized-form-masculine-neuter-singular":"euricefalul","definite-error-unrecognized-form-feminine-singular":"euricefala","definite-error-unrecognized-form-masculine-plural":"euricefalii","definite-error-unrecognized-form-feminine-neuter-plural":"euricefalele"}},{"word":"eurignatism","pos":"noun","definitions":["eurygnathism"],"forms":{"plural":"eurignatisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eurignatism","accusative-definite-nominative-singular":"eurignatismul","accusative-indefinite-nominative-plural":"eurignatisme","accusative-definite-nominative-plural":"eurignatismele","dative-genitive-indefinite-singular":"eurignatism","dative-definite-genitive-singular":"eurignatismului","dative-genitive-indefinite-plural":"eurignatisme","dative-definite-genitive-plural":"eurignatismelor","singular-vocative":"eurignatismule","plural-vocative":"eurignatismelor"}},{"word":"eurihalin","pos":"adj","definitions":["euryhaline"],"forms":{"feminine-singular":"eurihalină","masculine-plural":"eurihalini","feminine-neuter-plural":"eurihaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eurihalin","error-unrecognized-form-feminine-indefinite-singular":"eurihalină","error-unrecognized-form-indefinite-masculine-plural":"eurihalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"eurihaline","definite-error-unrecognized-form-masculine-neuter-singular":"eurihalinul","definite-error-unrecognized-form-feminine-singular":"eurihalina","definite-error-unrecognized-form-masculine-plural":"eurihalinii","definite-error-unrecognized-form-feminine-neuter-plural":"eurihalinele"}},{"word":"euristic","pos":"adj","definitions":["heuristic"],"forms":{"feminine-singular":"euristică","masculine-plural":"euristici","feminine-neuter-plural":"euristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euristic","error-unrecognized-form-feminine-indefinite-singular":"euristică","error-unrecognized-form-indefinite-masculine-plural":"euristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euristice","definite-error-unrecognized-form-masculine-neuter-singular":"euristicul","definite-error-unrecognized-form-feminine-singular":"euristica","definite-error-unrecognized-form-masculine-plural":"euristicii","definite-error-unrecognized-form-feminine-neuter-plural":"euristicele"}},{"word":"euristică","pos":"noun","definitions":["heuristics"],"forms":{"plural":"euristici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"euristică","accusative-definite-nominative-singular":"euristica","accusative-indefinite-nominative-plural":"euristici","accusative-definite-nominative-plural":"euristicile","dative-genitive-indefinite-singular":"euristici","dative-definite-genitive-singular":"euristicii","dative-genitive-indefinite-plural":"euristici","dative-definite-genitive-plural":"euristicilor","singular-vocative":"euristică","plural-vocative":"euristicilor"}},{"word":"euriterm","pos":"adj","definitions":["eurythermal"],"forms":{"feminine-singular":"euritermă","masculine-plural":"euritermi","feminine-neuter-plural":"euriterme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euriterm","error-unrecognized-form-feminine-indefinite-singular":"euritermă","error-unrecognized-form-indefinite-masculine-plural":"euritermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"euriterme","definite-error-unrecognized-form-masculine-neuter-singular":"euritermul","definite-error-unrecognized-form-feminine-singular":"euriterma","definite-error-unrecognized-form-masculine-plural":"euritermii","definite-error-unrecognized-form-feminine-neuter-plural":"euritermele"}},{"word":"euritmic","pos":"adj","definitions":["eurhythmic"],"forms":{"feminine-singular":"euritmică","masculine-plural":"euritmici","feminine-neuter-plural":"euritmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euritmic","error-unrecognized-form-feminine-indefinite-singular":"euritmică","error-unrecognized-form-indefinite-masculine-plural":"euritmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euritmice","definite-error-unrecognized-form-masculine-neuter-singular":"euritmicul","definite-error-unrecognized-form-feminine-singular":"euritmica","definite-error-unrecognized-form-masculine-plural":"euritmicii","definite-error-unrecognized-form-feminine-neuter-plural":"euritmicele"}},{"word":"euritmie","pos":"noun","definitions":["eurythmics"],"forms":{"plural":"euritmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"euritmie","accusative-definite-nominative-singular":"euritmia","accusative-indefinite-nominative-plural":"euritmii","accusative-definite-nominative-plural":"euritmiile","dative-genitive-indefinite-singular":"euritmii","dative-definite-genitive-singular":"euritmiei","dative-genitive-indefinite-plural":"euritmii","dative-definite-genitive-plural":"euritmiilor","singular-vocative":"euritmie","plural-vocative":"euritmiilor"}},{"word":"euro","pos":"noun","definitions":["euro (currency)"],"pronunciation":"/ˈeu̯.ro/","forms":{"plural":"euro","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"euro","accusative-definite-nominative-singular":"euroul","accusative-indefinite-nominative-plural":"euro","accusative-definite-nominative-plural":"euroi","dative-genitive-indefinite-singular":"euro","dative-definite-genitive-singular":"euroului","dative-genitive-indefinite-plural":"euro","dative-definite-genitive-plural":"eurolor","singular-vocative":"euroule","plural-vocative":"eurolor"}},{"word":"euroasiatică","pos":"noun","definitions":["female equivalent of euroasiatic"],"forms":{"plural":"euroasiatice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"euroasiatică","accusative-definite-nominative-singular":"euroasiatica","accusative-indefinite-nominative-plural":"euroasiatice","accusative-definite-nominative-plural":"euroasiaticele","dative-genitive-indefinite-singular":"euroasiatice","dative-definite-genitive-singular":"euroasiaticei","dative-genitive-indefinite-plural":"euroasiatice","dative-definite-genitive-plural":"euroasiaticelor","singular-vocative":"euroasiatică","plural-vocative":"euroasiaticelor"}},{"word":"euroatlantic","pos":"adj","definitions":["Euro-Atlantic"],"forms":{"feminine-singular":"euroatlantică","masculine-plural":"euroatlantici","feminine-neuter-plural":"euroatlantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"euroatlantic","error-unrecognized-form-feminine-indefinite-singular":"euroatlantică","error-unrecognized-form-indefinite-masculine-plural":"euroatlantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"euroatlantice","definite-error-unrecognized-form-masculine-neuter-singular":"euroatlanticul","definite-error-unrecognized-form-feminine-singular":"euroatlantica","definite-error-unrecognized-form-masculine-plural":"euroatlanticii","definite-error-unrecognized-form-feminine-neuter-plural":"euroatlanticele"}},{"word":"eurobancă","pos":"noun","definitions":["Eurobank"],"forms":{"plural":"eurobănci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"eurobancă","accusative-definite-nominative-singular":"eurobanca","accusative-indefinite-nominative-plural":"eurobănce","accusative-definite-nominative-plural":"eurobăncele","dative-genitive-indefinite-singular":"eurobănce","dative-definite-genitive-singular":"eurobăncei","dative-genitive-indefinite-plural":"eurobănce","dative-definite-genitive-plural":"eurobăncelor","singular-vocative":"eurobancă","plural-vocative":"eurobăncelor"}},{"word":"eurocent","pos":"noun","definitions":["Eurocent"],"forms":{"plural":"eurocenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eurocent","accusative-definite-nominative-singular":"eurocentul","accusative-indefinite-nominative-plural":"eurocenți","accusative-definite-nominative-plural":"eurocenții","dative-genitive-indefinite-singular":"eurocent","dative-definite-genitive-singular":"eurocentului","dative-genitive-indefinite-plural":"eurocenți","dative-definite-genitive-plural":"eurocenților","singular-vocative":"eurocentule","plural-vocative":"eurocenților"}},{"word":"eurocomunism","pos":"noun","definitions":["Eurocommunism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"eurocomunism","accusative-definite-nominative":"eurocomunismul","dative-genitive-indefinite":"eurocomunism","dative-definite-genitive":"eurocomunismului","vocative":"eurocomunismule"}},{"word":"eurocomunist","pos":"adj","definitions":["Eurocommunist"],"forms":{"feminine-singular":"eurocomunistă","masculine-plural":"eurocomuniști","feminine-neuter-plural":"eurocomuniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eurocomunist","error-unrecognized-form-feminine-indefinite-singular":"eurocomunistă","error-unrecognized-form-indefinite-masculine-plural":"eurocomuniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"eurocomuniste","definite-error-unrecognized-form-masculine-neuter-singular":"eurocomunistul","definite-error-unrecognized-form-feminine-singular":"eurocomunista","definite-error-unrecognized-form-masculine-plural":"eurocomuniștii","definite-error-unrecognized-form-feminine-neuter-plural":"eurocomunistele"}},{"word":"eurocomunist","pos":"noun","definitions":["Eurocommunist"],"forms":{"plural":"eurocomuniști","feminine":"equivalent eurocomunistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eurocomunist","accusative-definite-nominative-singular":"eurocomunistul","accusative-indefinite-nominative-plural":"eurocomuniști","accusative-definite-nominative-plural":"eurocomuniștii","dative-genitive-indefinite-singular":"eurocomunist","dative-definite-genitive-singular":"eurocomunistului","dative-genitive-indefinite-plural":"eurocomuniști","dative-definite-genitive-plural":"eurocomuniștilor","singular-vocative":"eurocomunistule","plural-vocative":"eurocomuniștilor"}},{"word":"eurocomuniști","pos":"noun","definitions":["plural of eurocomunist"]},{"word":"eurodolar","pos":"noun","definitions":["Eurodollar"],"forms":{"plural":"eurodolari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eurodolar","accusative-definite-nominative-singular":"eurodolarul","accusative-indefinite-nominative-plural":"eurodolari","accusative-definite-nominative-plural":"eurodolarii","dative-genitive-indefinite-singular":"eurodolar","dative-definite-genitive-singular":"eurodolarului","dative-genitive-indefinite-plural":"eurodolari","dative-definite-genitive-plural":"eurodolarilor","singular-vocative":"eurodolarule","plural-vocative":"eurodolarilor"}},{"word":"euroobligațiune","pos":"noun","definitions":["Eurobond"],"forms":{"plural":"euroobligațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"euroobligațiune","accusative-definite-nominative-singular":"euroobligațiunea","accusative-indefinite-nominative-plural":"euroobligațiuni","accusative-definite-nominative-plural":"euroobligațiunile","dative-genitive-indefinite-singular":"euroobligațiuni","dative-definite-genitive-singular":"euroobligațiunii","dative-genitive-indefinite-plural":"euroobligațiuni","dative-definite-genitive-plural":"euroobligațiunilor","singular-vocative":"euroobligațiune","plural-vocative":"euroobligațiunilor"}},{"word":"Europa","pos":"name","definitions":["Europe (a continent located west of Asia and north of Africa)","Europa (several characters, most notably a Phoenician princess abducted to Crete by Zeus)","Europa (a moon in Jupiter)","Europa (52 Europa, a main belt asteroid; not to be confused with the Jovian moon)"],"pronunciation":"/e.uˈro.pa/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Europă","accusative-definite-nominative":"Europa","dative-genitive-indefinite":"Europe","dative-definite-genitive":"Europei","vocative":"Europă","alternative":"Еуропа"}},{"word":"Europa Centrală","pos":"name","definitions":["Central Europe (a geographic region in the center of Europe, usually including Austria, Switzerland, the Czech Republic, Hungary, Poland, Slovakia, Slovenia, Croatia and Germany)"],"pronunciation":"[e.uˈɾo.pa.t͡ʃenˌtɾa.lə]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Europa Centrală","dative-definite-genitive":"Europei Centrale"}},{"word":"Europa de Est","pos":"name","definitions":["Eastern Europe (a socio-political geographical area of eastern Europe usually including the European countries to the east of Germany, Austria and Italy, and to the west of the Urals)"],"pronunciation":"[e.uˈɾo.pa.deˌjest]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Europa de Est","dative-definite-genitive":"Europei de Est"}},{"word":"Europa de Nord","pos":"name","definitions":["Northern Europe (a sociopolitical region of Europe including such countries as Denmark, Finland, Iceland, Norway, Sweden, Estonia, Latvia and Lithuania)"],"pronunciation":"[e.uˈɾo.pa.deˌnoɾd]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Europa de Nord","dative-definite-genitive":"Europei de Nord"}},{"word":"Europa de Sud","pos":"name","definitions":["Southern Europe (a sociopolitical region of Europe including such countries as Spain, Portugal, Italy, and Greece)"],"pronunciation":"[e.uˈɾo.pa.deˌsud]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Europa de Sud","dative-definite-genitive":"Europei de Sud"}},{"word":"Europa de Vest","pos":"name","definitions":["Western Europe (a sociopolitical region in the west of Europe)"],"pronunciation":"[e.uˈɾo.pa.deˌvest]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"l","accusative-definite-nominative":"Europa de Vest","dative-definite-genitive":"Europei de Vest"}},{"word":"europarlamentar","pos":"noun","definitions":["MEP"],"forms":{"plural":"europarlamentari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"europarlamentar","accusative-definite-nominative-singular":"europarlamentarul","accusative-indefinite-nominative-plural":"europarlamentari","accusative-definite-nominative-plural":"europarlamentarii","dative-genitive-indefinite-singular":"europarlamentar","dative-definite-genitive-singular":"europarlamentarului","dative-genitive-indefinite-plural":"europarlamentari","dative-definite-genitive-plural":"europarlamentarilor","singular-vocative":"europarlamentarule","plural-vocative":"europarlamentarilor"}},{"word":"european","pos":"adj","definitions":["European"],"pronunciation":"/ˌe.u.roˈpe̯an/","forms":{"feminine-singular":"europeană","masculine-plural":"europeni","feminine-neuter-plural":"europene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"european","error-unrecognized-form-feminine-indefinite-singular":"europeană","error-unrecognized-form-indefinite-masculine-plural":"europeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"europene","definite-error-unrecognized-form-masculine-neuter-singular":"europeanul","definite-error-unrecognized-form-feminine-singular":"europeana","definite-error-unrecognized-form-masculine-plural":"europenii","definite-error-unrecognized-form-feminine-neuter-plural":"europenele"}},{"word":"european","pos":"noun","definitions":["European"],"pronunciation":"/ˌe.u.roˈpe̯an/","forms":{"plural":"europeni","feminine":"equivalent europeană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"european","accusative-definite-nominative-singular":"europeanul","accusative-indefinite-nominative-plural":"europeni","accusative-definite-nominative-plural":"europenii","dative-genitive-indefinite-singular":"european","dative-definite-genitive-singular":"europeanului","dative-genitive-indefinite-plural":"europeni","dative-definite-genitive-plural":"europenilor","singular-vocative":"europeanule","plural-vocative":"europenilor"}},{"word":"europeană","pos":"noun","definitions":["female equivalent of european"],"forms":{"plural":"europene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"europeană","accusative-definite-nominative-singular":"europeana","accusative-indefinite-nominative-plural":"europene","accusative-definite-nominative-plural":"europenele","dative-genitive-indefinite-singular":"europene","dative-definite-genitive-singular":"europenei","dative-genitive-indefinite-plural":"europene","dative-definite-genitive-plural":"europenelor","singular-vocative":"europeană","plural-vocative":"europenelor"}},{"word":"europeancă","pos":"noun","definitions":["female equivalent of european"],"forms":{"plural":"europence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"europeancă","accusative-definite-nominative-singular":"europeanca","accusative-indefinite-nominative-plural":"europence","accusative-definite-nominative-plural":"europencele","dative-genitive-indefinite-singular":"europence","dative-definite-genitive-singular":"europencei","dative-genitive-indefinite-plural":"europence","dative-definite-genitive-plural":"europencelor","singular-vocative":"europeancă","plural-vocative":"europencelor"}},{"word":"europeism","pos":"noun","definitions":["Europeanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"europeism","accusative-definite-nominative":"europeismul","dative-genitive-indefinite":"europeism","dative-definite-genitive":"europeismului","vocative":"europeismule"}},{"word":"europenesc","pos":"adj","definitions":["European"],"forms":{"feminine-singular":"europenească","plural":"europenești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"europenesc","error-unrecognized-form-feminine-indefinite-singular":"europenească","error-unrecognized-form-indefinite-masculine-plural":"europenești","error-unrecognized-form-feminine-indefinite-neuter-plural":"europenești","definite-error-unrecognized-form-masculine-neuter-singular":"europenescul","definite-error-unrecognized-form-feminine-singular":"europeneasca","definite-error-unrecognized-form-masculine-plural":"europeneștii","definite-error-unrecognized-form-feminine-neuter-plural":"europeneștile"}},{"word":"europenește","pos":"adv","definitions":["like a European"]},{"word":"europeni","pos":"noun","definitions":["plural of european"]},{"word":"europeniza","pos":"verb","definitions":["to Europeanize"],"forms":{"canonical":"a europeniza 1st conjugation","present-singular-third-person":"europenizează","participle-past":"europenizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a europeniza","gerund":"europenizând","first-person-indicative-present-singular":"europenizez","indicative-present-second-person-singular":"europenizezi","indicative-present-singular-third-person":"europenizează","first-person-indicative-plural-present":"europenizăm","indicative-plural-present-second-person":"europenizați","indicative-plural-present-third-person":"europenizează","first-person-imperfect-indicative-singular":"europenizam","imperfect-indicative-second-person-singular":"europenizai","imperfect-indicative-singular-third-person":"europeniza","first-person-imperfect-indicative-plural":"europenizam","imperfect-indicative-plural-second-person":"europenizați","imperfect-indicative-plural-third-person":"europenizau","first-person-indicative-perfect-singular":"europenizai","indicative-perfect-second-person-singular":"europenizași","indicative-perfect-singular-third-person":"europeniză","first-person-indicative-perfect-plural":"europenizarăm","indicative-perfect-plural-second-person":"europenizarăți","indicative-perfect-plural-third-person":"europenizară","first-person-indicative-pluperfect-singular":"europenizasem","indicative-pluperfect-second-person-singular":"europenizaseși","indicative-pluperfect-singular-third-person":"europenizase","first-person-indicative-pluperfect-plural":"europenizaserăm","indicative-pluperfect-plural-second-person":"europenizaserăți","indicative-pluperfect-plural-third-person":"europenizaseră","first-person-present-singular-subjunctive":"să europenizez","present-second-person-singular-subjunctive":"să europenizezi","present-singular-subjunctive-third-person":"să europenizeze","first-person-plural-present-subjunctive":"să europenizăm","plural-present-second-person-subjunctive":"să europenizați","plural-present-subjunctive-third-person":"să europenizeze","imperative-second-person-singular":"europenizează","imperative-plural-second-person":"europenizați","imperative-negative-second-person-singular":"nu europeniza","imperative-negative-plural-second-person":"nu europenizați"}},{"word":"europenizare","pos":"noun","definitions":["Europeanization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"europenizare","accusative-definite-nominative":"europenizarea","dative-genitive-indefinite":"europenizări","dative-definite-genitive":"europenizării","vocative":"europenizare"}},{"word":"europenizat","pos":"adj","definitions":["Europeanized"],"forms":{"feminine-singular":"europenizată","masculine-plural":"europenizați","feminine-neuter-plural":"europenizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"europenizat","error-unrecognized-form-feminine-indefinite-singular":"europenizată","error-unrecognized-form-indefinite-masculine-plural":"europenizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"europenizate","definite-error-unrecognized-form-masculine-neuter-singular":"europenizatul","definite-error-unrecognized-form-feminine-singular":"europenizata","definite-error-unrecognized-form-masculine-plural":"europenizații","definite-error-unrecognized-form-feminine-neuter-plural":"europenizatele"}},{"word":"europenizat","pos":"verb","definitions":["past participle of europeniza"],"forms":{"participle-past":"of europeniza"}},{"word":"europesc","pos":"adj","definitions":["European"],"forms":{"feminine-singular":"europească","plural":"europești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"europesc","error-unrecognized-form-feminine-indefinite-singular":"europească","error-unrecognized-form-indefinite-masculine-plural":"europești","error-unrecognized-form-feminine-indefinite-neuter-plural":"europești","definite-error-unrecognized-form-masculine-neuter-singular":"europescul","definite-error-unrecognized-form-feminine-singular":"europeasca","definite-error-unrecognized-form-masculine-plural":"europeștii","definite-error-unrecognized-form-feminine-neuter-plural":"europeștile"}},{"word":"europeu","pos":"adj","definitions":["European"],"forms":{"feminine-singular":"europee","masculine-plural":"europei","feminine-neuter-plural":"europee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"europeu","error-unrecognized-form-feminine-indefinite-singular":"europee","error-unrecognized-form-indefinite-masculine-plural":"europei","error-unrecognized-form-feminine-indefinite-neuter-plural":"europee","definite-error-unrecognized-form-masculine-neuter-singular":"europeul","definite-error-unrecognized-form-feminine-singular":"europeea","definite-error-unrecognized-form-masculine-plural":"europeii","definite-error-unrecognized-form-feminine-neuter-plural":"europeele"}},{"word":"europiu","pos":"noun","definitions":["europium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"europiu","accusative-definite-nominative":"europiul","dative-genitive-indefinite":"europiu","dative-definite-genitive":"europiului","vocative":"europiule"}},{"word":"eurosceptic","pos":"noun","definitions":["Eurosceptic"],"forms":{"plural":"eurosceptici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"eurosceptic","accusative-definite-nominative-singular":"euroscepticul","accusative-indefinite-nominative-plural":"eurosceptici","accusative-definite-nominative-plural":"euroscepticii","dative-genitive-indefinite-singular":"eurosceptic","dative-definite-genitive-singular":"euroscepticului","dative-genitive-indefinite-plural":"eurosceptici","dative-definite-genitive-plural":"euroscepticilor","singular-vocative":"euroscepticule","plural-vocative":"euroscepticilor"}},{"word":"Eurovision","pos":"name","definitions":["Eurovision"],"pronunciation":"/ˌe.u.ro.vi.zi.ˈon/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"Eurovision","accusative-definite-nominative":"Eurovisionul","dative-genitive-indefinite":"Eurovision","dative-definite-genitive":"Eurovisionului","vocative":"Eurovisionule"}},{"word":"eustatic","pos":"adj","definitions":["eustatic"],"forms":{"feminine-singular":"eustatică","masculine-plural":"eustatici","feminine-neuter-plural":"eustatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eustatic","error-unrecognized-form-feminine-indefinite-singular":"eustatică","error-unrecognized-form-indefinite-masculine-plural":"eustatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eustatice","definite-error-unrecognized-form-masculine-neuter-singular":"eustaticul","definite-error-unrecognized-form-feminine-singular":"eustatica","definite-error-unrecognized-form-masculine-plural":"eustaticii","definite-error-unrecognized-form-feminine-neuter-plural":"eustaticele"}},{"word":"eustatism","pos":"noun","definitions":["eustatism"],"forms":{"plural":"eustatisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eustatism","accusative-definite-nominative-singular":"eustatismul","accusative-indefinite-nominative-plural":"eustatisme","accusative-definite-nominative-plural":"eustatismele","dative-genitive-indefinite-singular":"eustatism","dative-definite-genitive-singular":"eustatismului","dative-genitive-indefinite-plural":"eustatisme","dative-definite-genitive-plural":"eustatismelor","singular-vocative":"eustatismule","plural-vocative":"eustatismelor"}},{"word":"eustil","pos":"noun","definitions":["eustyle"],"forms":{"plural":"eustiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eustil","accusative-definite-nominative-singular":"eustilul","accusative-indefinite-nominative-plural":"eustiluri","accusative-definite-nominative-plural":"eustilurile","dative-genitive-indefinite-singular":"eustil","dative-definite-genitive-singular":"eustilului","dative-genitive-indefinite-plural":"eustiluri","dative-definite-genitive-plural":"eustilurilor","singular-vocative":"eustilule","plural-vocative":"eustilurilor"}},{"word":"eutanasia","pos":"verb","definitions":["to euthanise"],"forms":{"canonical":"a eutanasia 1st conjugation","present-singular-third-person":"eutanasiază","participle-past":"eutanasiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eutanasia","gerund":"eutanasiind","first-person-indicative-present-singular":"eutanasiez","indicative-present-second-person-singular":"eutanasiezi","indicative-present-singular-third-person":"eutanasiază","first-person-indicative-plural-present":"eutanasiem","indicative-plural-present-second-person":"eutanasiați","indicative-plural-present-third-person":"eutanasiază","first-person-imperfect-indicative-singular":"eutanasiam","imperfect-indicative-second-person-singular":"eutanasiai","imperfect-indicative-singular-third-person":"eutanasia","first-person-imperfect-indicative-plural":"eutanasiam","imperfect-indicative-plural-second-person":"eutanasiați","imperfect-indicative-plural-third-person":"eutanasiau","first-person-indicative-perfect-singular":"eutanasiai","indicative-perfect-second-person-singular":"eutanasiași","indicative-perfect-singular-third-person":"eutanasie","first-person-indicative-perfect-plural":"eutanasiarăm","indicative-perfect-plural-second-person":"eutanasiarăți","indicative-perfect-plural-third-person":"eutanasiară","first-person-indicative-pluperfect-singular":"eutanasiasem","indicative-pluperfect-second-person-singular":"eutanasiaseși","indicative-pluperfect-singular-third-person":"eutanasiase","first-person-indicative-pluperfect-plural":"eutanasiaserăm","indicative-pluperfect-plural-second-person":"eutanasiaserăți","indicative-pluperfect-plural-third-person":"eutanasiaseră","first-person-present-singular-subjunctive":"să eutanasiez","present-second-person-singular-subjunctive":"să eutanasiezi","present-singular-subjunctive-third-person":"să eutanasieze","first-person-plural-present-subjunctive":"să eutanasiem","plural-present-second-person-subjunctive":"să eutanasiați","plural-present-subjunctive-third-person":"să eutanasieze","imperative-second-person-singular":"eutanasiază","imperative-plural-second-person":"eutanasiați","imperative-negative-second-person-singular":"nu eutanasia","imperative-negative-plural-second-person":"nu eutanasiați"}},{"word":"eutanasie","pos":"noun","definitions":["euthanasia"],"forms":{"plural":"euthanasie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eutanasie","accusative-definite-nominative-singular":"eutanasia","accusative-indefinite-nominative-plural":"eutanasii","accusative-definite-nominative-plural":"eutanasiile","dative-genitive-indefinite-singular":"eutanasii","dative-definite-genitive-singular":"eutanasiei","dative-genitive-indefinite-plural":"eutanasii","dative-definite-genitive-plural":"eutanasiilor","singular-vocative":"eutanasie","plural-vocative":"eutanasiilor"}},{"word":"eutanasiere","pos":"noun","definitions":["euthanasia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"eutanasiere","accusative-definite-nominative":"eutanasierea","dative-genitive-indefinite":"eutanasieri","dative-definite-genitive":"eutanasierii","vocative":"eutanasiere"}},{"word":"eutectic","pos":"adj","definitions":["eutectic"],"forms":{"feminine-singular":"eutectică","masculine-plural":"eutectici","feminine-neuter-plural":"eutectice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eutectic","error-unrecognized-form-feminine-indefinite-singular":"eutectică","error-unrecognized-form-indefinite-masculine-plural":"eutectici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eutectice","definite-error-unrecognized-form-masculine-neuter-singular":"eutecticul","definite-error-unrecognized-form-feminine-singular":"eutectica","definite-error-unrecognized-form-masculine-plural":"eutecticii","definite-error-unrecognized-form-feminine-neuter-plural":"eutecticele"}},{"word":"eutectoid","pos":"noun","definitions":["eutectoid"],"forms":{"plural":"eutectoide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eutectoid","accusative-definite-nominative-singular":"eutectoidul","accusative-indefinite-nominative-plural":"eutectoide","accusative-definite-nominative-plural":"eutectoidele","dative-genitive-indefinite-singular":"eutectoid","dative-definite-genitive-singular":"eutectoidului","dative-genitive-indefinite-plural":"eutectoide","dative-definite-genitive-plural":"eutectoidelor","singular-vocative":"eutectoidule","plural-vocative":"eutectoidelor"}},{"word":"eutexie","pos":"noun","definitions":["eutexia"],"forms":{"plural":"eutexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eutexie","accusative-definite-nominative-singular":"eutexia","accusative-indefinite-nominative-plural":"eutexii","accusative-definite-nominative-plural":"eutexiile","dative-genitive-indefinite-singular":"eutexii","dative-definite-genitive-singular":"eutexiei","dative-genitive-indefinite-plural":"eutexii","dative-definite-genitive-plural":"eutexiilor","singular-vocative":"eutexie","plural-vocative":"eutexiilor"}},{"word":"eutimie","pos":"noun","definitions":["euthymia"],"forms":{"plural":"eutimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eutimie","accusative-definite-nominative-singular":"eutimia","accusative-indefinite-nominative-plural":"eutimii","accusative-definite-nominative-plural":"eutimiile","dative-genitive-indefinite-singular":"eutimii","dative-definite-genitive-singular":"eutimiei","dative-genitive-indefinite-plural":"eutimii","dative-definite-genitive-plural":"eutimiilor","singular-vocative":"eutimie","plural-vocative":"eutimiilor"}},{"word":"eutocic","pos":"adj","definitions":["eutocic"],"forms":{"feminine-singular":"eutocică","masculine-plural":"eutocici","feminine-neuter-plural":"eutocice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eutocic","error-unrecognized-form-feminine-indefinite-singular":"eutocică","error-unrecognized-form-indefinite-masculine-plural":"eutocici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eutocice","definite-error-unrecognized-form-masculine-neuter-singular":"eutocicul","definite-error-unrecognized-form-feminine-singular":"eutocica","definite-error-unrecognized-form-masculine-plural":"eutocicii","definite-error-unrecognized-form-feminine-neuter-plural":"eutocicele"}},{"word":"eutocie","pos":"noun","definitions":["eutocia"],"forms":{"plural":"eutocii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eutocie","accusative-definite-nominative-singular":"eutocia","accusative-indefinite-nominative-plural":"eutocii","accusative-definite-nominative-plural":"eutociile","dative-genitive-indefinite-singular":"eutocii","dative-definite-genitive-singular":"eutociei","dative-genitive-indefinite-plural":"eutocii","dative-definite-genitive-plural":"eutociilor","singular-vocative":"eutocie","plural-vocative":"eutociilor"}},{"word":"eutrof","pos":"adj","definitions":["eutrophic"],"forms":{"feminine-singular":"eutrofă","masculine-plural":"eutrofi","feminine-neuter-plural":"eutrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eutrof","error-unrecognized-form-feminine-indefinite-singular":"eutrofă","error-unrecognized-form-indefinite-masculine-plural":"eutrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eutrofe","definite-error-unrecognized-form-masculine-neuter-singular":"eutroful","definite-error-unrecognized-form-feminine-singular":"eutrofa","definite-error-unrecognized-form-masculine-plural":"eutrofii","definite-error-unrecognized-form-feminine-neuter-plural":"eutrofele"}},{"word":"eutrofic","pos":"adj","definitions":["eutrophic, providing nutrients"],"forms":{"feminine-singular":"eutrofică","masculine-plural":"eutrofici","feminine-neuter-plural":"eutrofice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eutrofic","error-unrecognized-form-feminine-indefinite-singular":"eutrofică","error-unrecognized-form-indefinite-masculine-plural":"eutrofici","error-unrecognized-form-feminine-indefinite-neuter-plural":"eutrofice","definite-error-unrecognized-form-masculine-neuter-singular":"eutroficul","definite-error-unrecognized-form-feminine-singular":"eutrofica","definite-error-unrecognized-form-masculine-plural":"eutroficii","definite-error-unrecognized-form-feminine-neuter-plural":"eutroficele"}},{"word":"eutrofie","pos":"noun","definitions":["eutrophy"],"forms":{"plural":"eutrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eutrofie","accusative-definite-nominative-singular":"eutrofia","accusative-indefinite-nominative-plural":"eutrofii","accusative-definite-nominative-plural":"eutrofiile","dative-genitive-indefinite-singular":"eutrofii","dative-definite-genitive-singular":"eutrofiei","dative-genitive-indefinite-plural":"eutrofii","dative-definite-genitive-plural":"eutrofiilor","singular-vocative":"eutrofie","plural-vocative":"eutrofiilor"}},{"word":"euxenit","pos":"noun","definitions":["euxenite"],"forms":{"plural":"euxenite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"euxenit","accusative-definite-nominative-singular":"euxenitul","accusative-indefinite-nominative-plural":"euxenite","accusative-definite-nominative-plural":"euxenitele","dative-genitive-indefinite-singular":"euxenit","dative-definite-genitive-singular":"euxenitului","dative-genitive-indefinite-plural":"euxenite","dative-definite-genitive-plural":"euxenitelor","singular-vocative":"euxenitule","plural-vocative":"euxenitelor"}},{"word":"ev","pos":"noun","definitions":["age, era, period","century"],"pronunciation":"/ev/","forms":{"canonical-neuter":"ev","canonical-masculine":"ev","plural":"evuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ev","accusative-definite-nominative-singular":"evul","accusative-indefinite-nominative-plural":"evuri","accusative-definite-nominative-plural":"evurile","dative-genitive-indefinite-singular":"ev","dative-definite-genitive-singular":"evului","dative-genitive-indefinite-plural":"evuri","dative-definite-genitive-plural":"evurilor","singular-vocative":"evule","plural-vocative":"evurilor"}},{"word":"evacua","pos":"verb","definitions":["to evacuate"],"forms":{"canonical":"a evacua 1st conjugation","present-singular-third-person":"evacuează","participle-past":"evacuat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evacua","gerund":"evacuând","first-person-indicative-present-singular":"evacuez","indicative-present-second-person-singular":"evacuezi","indicative-present-singular-third-person":"evacuează","first-person-indicative-plural-present":"evacuăm","indicative-plural-present-second-person":"evacuați","indicative-plural-present-third-person":"evacuează","first-person-imperfect-indicative-singular":"evacuam","imperfect-indicative-second-person-singular":"evacuai","imperfect-indicative-singular-third-person":"evacua","first-person-imperfect-indicative-plural":"evacuam","imperfect-indicative-plural-second-person":"evacuați","imperfect-indicative-plural-third-person":"evacuau","first-person-indicative-perfect-singular":"evacuai","indicative-perfect-second-person-singular":"evacuași","indicative-perfect-singular-third-person":"evacuă","first-person-indicative-perfect-plural":"evacuarăm","indicative-perfect-plural-second-person":"evacuarăți","indicative-perfect-plural-third-person":"evacuară","first-person-indicative-pluperfect-singular":"evacuasem","indicative-pluperfect-second-person-singular":"evacuaseși","indicative-pluperfect-singular-third-person":"evacuase","first-person-indicative-pluperfect-plural":"evacuaserăm","indicative-pluperfect-plural-second-person":"evacuaserăți","indicative-pluperfect-plural-third-person":"evacuaseră","first-person-present-singular-subjunctive":"să evacuez","present-second-person-singular-subjunctive":"să evacuezi","present-singular-subjunctive-third-person":"să evacueze","first-person-plural-present-subjunctive":"să evacuăm","plural-present-second-person-subjunctive":"să evacuați","plural-present-subjunctive-third-person":"să evacueze","imperative-second-person-singular":"evacuează","imperative-plural-second-person":"evacuați","imperative-negative-second-person-singular":"nu evacua","imperative-negative-plural-second-person":"nu evacuați"}},{"word":"evacuabil","pos":"adj","definitions":["evacuable"],"forms":{"feminine-singular":"evacuabilă","masculine-plural":"evacuabili","feminine-neuter-plural":"evacuabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evacuabil","error-unrecognized-form-feminine-indefinite-singular":"evacuabilă","error-unrecognized-form-indefinite-masculine-plural":"evacuabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evacuabile","definite-error-unrecognized-form-masculine-neuter-singular":"evacuabilul","definite-error-unrecognized-form-feminine-singular":"evacuabila","definite-error-unrecognized-form-masculine-plural":"evacuabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evacuabilele"}},{"word":"evacuare","pos":"noun","definitions":["evacuation"],"forms":{"plural":"evacuări"}},{"word":"evacuări","pos":"noun","definitions":["plural of evacuare"]},{"word":"evacuat","pos":"adj","definitions":["evacuated"],"forms":{"feminine-singular":"evacuată","masculine-plural":"evacuați","feminine-neuter-plural":"evacuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evacuat","error-unrecognized-form-feminine-indefinite-singular":"evacuată","error-unrecognized-form-indefinite-masculine-plural":"evacuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evacuate","definite-error-unrecognized-form-masculine-neuter-singular":"evacuatul","definite-error-unrecognized-form-feminine-singular":"evacuata","definite-error-unrecognized-form-masculine-plural":"evacuații","definite-error-unrecognized-form-feminine-neuter-plural":"evacuatele"}},{"word":"evacuat","pos":"verb","definitions":["past participle of evacua"],"forms":{"participle-past":"of evacua"}},{"word":"evacuație","pos":"noun","definitions":["evacuation"],"forms":{"plural":"evacuații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evacuație","accusative-definite-nominative-singular":"evacuația","accusative-indefinite-nominative-plural":"evacuații","accusative-definite-nominative-plural":"evacuațiile","dative-genitive-indefinite-singular":"evacuații","dative-definite-genitive-singular":"evacuației","dative-genitive-indefinite-plural":"evacuații","dative-definite-genitive-plural":"evacuațiilor","singular-vocative":"evacuație","plural-vocative":"evacuațiilor"}},{"word":"evacuațiune","pos":"noun","definitions":["obsolete form of evacuație"],"forms":{"plural":"evacuațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evacuațiune","accusative-definite-nominative-singular":"evacuațiunea","accusative-indefinite-nominative-plural":"evacuațiuni","accusative-definite-nominative-plural":"evacuațiunile","dative-genitive-indefinite-singular":"evacuațiuni","dative-definite-genitive-singular":"evacuațiunii","dative-genitive-indefinite-plural":"evacuațiuni","dative-definite-genitive-plural":"evacuațiunilor","singular-vocative":"evacuațiune","plural-vocative":"evacuațiunilor"}},{"word":"evacuator","pos":"adj","definitions":["evacuatory"],"forms":{"feminine-singular":"evacuatoare","masculine-plural":"evacuatori","feminine-neuter-plural":"evacuatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evacuator","error-unrecognized-form-feminine-indefinite-singular":"evacuatoare","error-unrecognized-form-indefinite-masculine-plural":"evacuatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"evacuatoare","definite-error-unrecognized-form-masculine-neuter-singular":"evacuatorul","definite-error-unrecognized-form-feminine-singular":"evacuatoarea","definite-error-unrecognized-form-masculine-plural":"evacuatorii","definite-error-unrecognized-form-feminine-neuter-plural":"evacuatoarele"}},{"word":"evacuator","pos":"noun","definitions":["evacuator"],"forms":{"plural":"evacuatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"evacuator","accusative-definite-nominative-singular":"evacuatorul","accusative-indefinite-nominative-plural":"evacuatori","accusative-definite-nominative-plural":"evacuatorile","dative-genitive-indefinite-singular":"evacuator","dative-definite-genitive-singular":"evacuatorului","dative-genitive-indefinite-plural":"evacuatori","dative-definite-genitive-plural":"evacuatorilor","singular-vocative":"evacuatorule","plural-vocative":"evacuatorilor"}},{"word":"evada","pos":"verb","definitions":["to escape (from prison)"],"forms":{"canonical":"a evada 1st conjugation","present-singular-third-person":"evadează","participle-past":"evadat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evada","gerund":"evadând","first-person-indicative-present-singular":"evadez","indicative-present-second-person-singular":"evadezi","indicative-present-singular-third-person":"evadează","first-person-indicative-plural-present":"evadăm","indicative-plural-present-second-person":"evadați","indicative-plural-present-third-person":"evadează","first-person-imperfect-indicative-singular":"evadam","imperfect-indicative-second-person-singular":"evadai","imperfect-indicative-singular-third-person":"evada","first-person-imperfect-indicative-plural":"evadam","imperfect-indicative-plural-second-person":"evadați","imperfect-indicative-plural-third-person":"evadau","first-person-indicative-perfect-singular":"evadai","indicative-perfect-second-person-singular":"evadași","indicative-perfect-singular-third-person":"evadă","first-person-indicative-perfect-plural":"evadarăm","indicative-perfect-plural-second-person":"evadarăți","indicative-perfect-plural-third-person":"evadară","first-person-indicative-pluperfect-singular":"evadasem","indicative-pluperfect-second-person-singular":"evadaseși","indicative-pluperfect-singular-third-person":"evadase","first-person-indicative-pluperfect-plural":"evadaserăm","indicative-pluperfect-plural-second-person":"evadaserăți","indicative-pluperfect-plural-third-person":"evadaseră","first-person-present-singular-subjunctive":"să evadez","present-second-person-singular-subjunctive":"să evadezi","present-singular-subjunctive-third-person":"să evadeze","first-person-plural-present-subjunctive":"să evadăm","plural-present-second-person-subjunctive":"să evadați","plural-present-subjunctive-third-person":"să evadeze","imperative-second-person-singular":"evadează","imperative-plural-second-person":"evadați","imperative-negative-second-person-singular":"nu evada","imperative-negative-plural-second-person":"nu evadați"}},{"word":"evadare","pos":"noun","definitions":["escape"],"forms":{"plural":"evadări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evadare","accusative-definite-nominative-singular":"evadarea","accusative-indefinite-nominative-plural":"evadări","accusative-definite-nominative-plural":"evadările","dative-genitive-indefinite-singular":"evadări","dative-definite-genitive-singular":"evadării","dative-genitive-indefinite-plural":"evadări","dative-definite-genitive-plural":"evadărilor","singular-vocative":"evadare","plural-vocative":"evadărilor"}},{"word":"evadat","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"evadată","masculine-plural":"evadați","feminine-neuter-plural":"evadate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evadat","error-unrecognized-form-feminine-indefinite-singular":"evadată","error-unrecognized-form-indefinite-masculine-plural":"evadați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evadate","definite-error-unrecognized-form-masculine-neuter-singular":"evadatul","definite-error-unrecognized-form-feminine-singular":"evadata","definite-error-unrecognized-form-masculine-plural":"evadații","definite-error-unrecognized-form-feminine-neuter-plural":"evadatele"}},{"word":"evalua","pos":"verb","definitions":["to assess"],"pronunciation":"/e.va.luˈa/","forms":{"canonical":"a evalua 1st conjugation","present-singular-third-person":"evaluează","participle-past":"evaluat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evalua","gerund":"evaluând","first-person-indicative-present-singular":"evaluez","indicative-present-second-person-singular":"evaluezi","indicative-present-singular-third-person":"evaluează","first-person-indicative-plural-present":"evaluăm","indicative-plural-present-second-person":"evaluați","indicative-plural-present-third-person":"evaluează","first-person-imperfect-indicative-singular":"evaluam","imperfect-indicative-second-person-singular":"evaluai","imperfect-indicative-singular-third-person":"evalua","first-person-imperfect-indicative-plural":"evaluam","imperfect-indicative-plural-second-person":"evaluați","imperfect-indicative-plural-third-person":"evaluau","first-person-indicative-perfect-singular":"evaluai","indicative-perfect-second-person-singular":"evaluași","indicative-perfect-singular-third-person":"evaluă","first-person-indicative-perfect-plural":"evaluarăm","indicative-perfect-plural-second-person":"evaluarăți","indicative-perfect-plural-third-person":"evaluară","first-person-indicative-pluperfect-singular":"evaluasem","indicative-pluperfect-second-person-singular":"evaluaseși","indicative-pluperfect-singular-third-person":"evaluase","first-person-indicative-pluperfect-plural":"evaluaserăm","indicative-pluperfect-plural-second-person":"evaluaserăți","indicative-pluperfect-plural-third-person":"evaluaseră","first-person-present-singular-subjunctive":"să evaluez","present-second-person-singular-subjunctive":"să evaluezi","present-singular-subjunctive-third-person":"să evalueze","first-person-plural-present-subjunctive":"să evaluăm","plural-present-second-person-subjunctive":"să evaluați","plural-present-subjunctive-third-person":"să evalueze","imperative-second-person-singular":"evaluează","imperative-plural-second-person":"evaluați","imperative-negative-second-person-singular":"nu evalua","imperative-negative-plural-second-person":"nu evaluați"}},{"word":"evaluabil","pos":"adj","definitions":["ratable"],"forms":{"feminine-singular":"evaluabilă","masculine-plural":"evaluabili","feminine-neuter-plural":"evaluabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaluabil","error-unrecognized-form-feminine-indefinite-singular":"evaluabilă","error-unrecognized-form-indefinite-masculine-plural":"evaluabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evaluabile","definite-error-unrecognized-form-masculine-neuter-singular":"evaluabilul","definite-error-unrecognized-form-feminine-singular":"evaluabila","definite-error-unrecognized-form-masculine-plural":"evaluabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evaluabilele"}},{"word":"evaluare","pos":"noun","definitions":["evaluation, assessment"],"forms":{"plural":"evaluări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evaluare","accusative-definite-nominative-singular":"evaluarea","accusative-indefinite-nominative-plural":"evaluări","accusative-definite-nominative-plural":"evaluările","dative-genitive-indefinite-singular":"evaluări","dative-definite-genitive-singular":"evaluării","dative-genitive-indefinite-plural":"evaluări","dative-definite-genitive-plural":"evaluărilor","singular-vocative":"evaluare","plural-vocative":"evaluărilor"}},{"word":"evaluat","pos":"adj","definitions":["appraised"],"forms":{"feminine-singular":"evaluată","masculine-plural":"evaluați","feminine-neuter-plural":"evaluate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaluat","error-unrecognized-form-feminine-indefinite-singular":"evaluată","error-unrecognized-form-indefinite-masculine-plural":"evaluați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evaluate","definite-error-unrecognized-form-masculine-neuter-singular":"evaluatul","definite-error-unrecognized-form-feminine-singular":"evaluata","definite-error-unrecognized-form-masculine-plural":"evaluații","definite-error-unrecognized-form-feminine-neuter-plural":"evaluatele"}},{"word":"evaluație","pos":"noun","definitions":["assessment"],"forms":{"plural":"evaluații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evaluație","accusative-definite-nominative-singular":"evaluația","accusative-indefinite-nominative-plural":"evaluații","accusative-definite-nominative-plural":"evaluațiile","dative-genitive-indefinite-singular":"evaluații","dative-definite-genitive-singular":"evaluației","dative-genitive-indefinite-plural":"evaluații","dative-definite-genitive-plural":"evaluațiilor","singular-vocative":"evaluație","plural-vocative":"evaluațiilor"}},{"word":"evaluativ","pos":"adj","definitions":["evaluative"],"forms":{"feminine-singular":"evaluativă","masculine-plural":"evaluativi","feminine-neuter-plural":"evaluative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaluativ","error-unrecognized-form-feminine-indefinite-singular":"evaluativă","error-unrecognized-form-indefinite-masculine-plural":"evaluativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"evaluative","definite-error-unrecognized-form-masculine-neuter-singular":"evaluativul","definite-error-unrecognized-form-feminine-singular":"evaluativa","definite-error-unrecognized-form-masculine-plural":"evaluativii","definite-error-unrecognized-form-feminine-neuter-plural":"evaluativele"}},{"word":"evanescent","pos":"adj","definitions":["evanescent"],"forms":{"feminine-singular":"evanescentă","masculine-plural":"evanescenți","feminine-neuter-plural":"evanescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evanescent","error-unrecognized-form-feminine-indefinite-singular":"evanescentă","error-unrecognized-form-indefinite-masculine-plural":"evanescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"evanescente","definite-error-unrecognized-form-masculine-neuter-singular":"evanescentul","definite-error-unrecognized-form-feminine-singular":"evanescenta","definite-error-unrecognized-form-masculine-plural":"evanescenții","definite-error-unrecognized-form-feminine-neuter-plural":"evanescentele"}},{"word":"evanescență","pos":"noun","definitions":["evanescence"],"forms":{"plural":"evanescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evanescență","accusative-definite-nominative-singular":"evanescența","accusative-indefinite-nominative-plural":"evanescențe","accusative-definite-nominative-plural":"evanescențele","dative-genitive-indefinite-singular":"evanescențe","dative-definite-genitive-singular":"evanescenței","dative-genitive-indefinite-plural":"evanescențe","dative-definite-genitive-plural":"evanescențelor","singular-vocative":"evanescență","plural-vocative":"evanescențelor"}},{"word":"evangelic","pos":"adj","definitions":["obsolete form of evanghelic"],"forms":{"feminine-singular":"evangelică","masculine-plural":"evangelici","feminine-neuter-plural":"evangelice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evangelic","error-unrecognized-form-feminine-indefinite-singular":"evangelică","error-unrecognized-form-indefinite-masculine-plural":"evangelici","error-unrecognized-form-feminine-indefinite-neuter-plural":"evangelice","definite-error-unrecognized-form-masculine-neuter-singular":"evangelicul","definite-error-unrecognized-form-feminine-singular":"evangelica","definite-error-unrecognized-form-masculine-plural":"evangelicii","definite-error-unrecognized-form-feminine-neuter-plural":"evangelicele"}},{"word":"Evanghelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Evanghelescu"}},{"word":"evangheliar","pos":"noun","definitions":["evangelistary"],"forms":{"plural":"evangheliare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"evangheliar","accusative-definite-nominative-singular":"evangheliarul","accusative-indefinite-nominative-plural":"evangheliare","accusative-definite-nominative-plural":"evangheliarele","dative-genitive-indefinite-singular":"evangheliar","dative-definite-genitive-singular":"evangheliarului","dative-genitive-indefinite-plural":"evangheliare","dative-definite-genitive-plural":"evangheliarelor","singular-vocative":"evangheliarule","plural-vocative":"evangheliarelor"}},{"word":"evanghelic","pos":"adj","definitions":["evangelical"],"forms":{"feminine-singular":"evanghelică","masculine-plural":"evanghelici","feminine-neuter-plural":"evanghelice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evanghelic","error-unrecognized-form-feminine-indefinite-singular":"evanghelică","error-unrecognized-form-indefinite-masculine-plural":"evanghelici","error-unrecognized-form-feminine-indefinite-neuter-plural":"evanghelice","definite-error-unrecognized-form-masculine-neuter-singular":"evanghelicul","definite-error-unrecognized-form-feminine-singular":"evanghelica","definite-error-unrecognized-form-masculine-plural":"evanghelicii","definite-error-unrecognized-form-feminine-neuter-plural":"evanghelicele"}},{"word":"evanghelicesc","pos":"adj","definitions":["evangelical"],"forms":{"feminine-singular":"evanghelicească","plural":"evanghelicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evanghelicesc","error-unrecognized-form-feminine-indefinite-singular":"evanghelicească","error-unrecognized-form-indefinite-masculine-plural":"evanghelicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"evanghelicești","definite-error-unrecognized-form-masculine-neuter-singular":"evanghelicescul","definite-error-unrecognized-form-feminine-singular":"evangheliceasca","definite-error-unrecognized-form-masculine-plural":"evangheliceștii","definite-error-unrecognized-form-feminine-neuter-plural":"evangheliceștile"}},{"word":"evanghelicește","pos":"adv","definitions":["evangelically"]},{"word":"evanghelie","pos":"noun","definitions":["gospel"],"pronunciation":"[evanˈɡelie]","examples":[{"ro":"Evanghelia după Matei","en":"The Gospel according to Matthew"}],"forms":{"plural":"evanghelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evanghelie","accusative-definite-nominative-singular":"evanghelia","accusative-indefinite-nominative-plural":"evanghelii","accusative-definite-nominative-plural":"evangheliile","dative-genitive-indefinite-singular":"evanghelii","dative-definite-genitive-singular":"evangheliei","dative-genitive-indefinite-plural":"evanghelii","dative-definite-genitive-plural":"evangheliilor","singular-vocative":"evanghelie","plural-vocative":"evangheliilor"}},{"word":"evanghelisire","pos":"noun","definitions":["evangelization"],"forms":{"plural":"evanghelisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evanghelisire","accusative-definite-nominative-singular":"evanghelisirea","accusative-indefinite-nominative-plural":"evanghelisiri","accusative-definite-nominative-plural":"evanghelisirile","dative-genitive-indefinite-singular":"evanghelisiri","dative-definite-genitive-singular":"evanghelisirii","dative-genitive-indefinite-plural":"evanghelisiri","dative-definite-genitive-plural":"evanghelisirilor","singular-vocative":"evanghelisire","plural-vocative":"evanghelisirilor"}},{"word":"evanghelism","pos":"noun","definitions":["evangelism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"evanghelism","accusative-definite-nominative":"evanghelismul","dative-genitive-indefinite":"evanghelism","dative-definite-genitive":"evanghelismului","vocative":"evanghelismule"}},{"word":"evanghelist","pos":"noun","definitions":["evangelist"],"forms":{"plural":"evangheliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evanghelist","accusative-definite-nominative-singular":"evanghelistul","accusative-indefinite-nominative-plural":"evangheliști","accusative-definite-nominative-plural":"evangheliștii","dative-genitive-indefinite-singular":"evanghelist","dative-definite-genitive-singular":"evanghelistului","dative-genitive-indefinite-plural":"evangheliști","dative-definite-genitive-plural":"evangheliștilor","singular-vocative":"evanghelistule","plural-vocative":"evangheliștilor"}},{"word":"evangheliza","pos":"verb","definitions":["to evangelize"],"forms":{"canonical":"a evangheliza 1st conjugation","present-singular-third-person":"evanghelizează","participle-past":"evanghelizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evangheliza","gerund":"evanghelizând","first-person-indicative-present-singular":"evanghelizez","indicative-present-second-person-singular":"evanghelizezi","indicative-present-singular-third-person":"evanghelizează","first-person-indicative-plural-present":"evanghelizăm","indicative-plural-present-second-person":"evanghelizați","indicative-plural-present-third-person":"evanghelizează","first-person-imperfect-indicative-singular":"evanghelizam","imperfect-indicative-second-person-singular":"evanghelizai","imperfect-indicative-singular-third-person":"evangheliza","first-person-imperfect-indicative-plural":"evanghelizam","imperfect-indicative-plural-second-person":"evanghelizați","imperfect-indicative-plural-third-person":"evanghelizau","first-person-indicative-perfect-singular":"evanghelizai","indicative-perfect-second-person-singular":"evanghelizași","indicative-perfect-singular-third-person":"evangheliză","first-person-indicative-perfect-plural":"evanghelizarăm","indicative-perfect-plural-second-person":"evanghelizarăți","indicative-perfect-plural-third-person":"evanghelizară","first-person-indicative-pluperfect-singular":"evanghelizasem","indicative-pluperfect-second-person-singular":"evanghelizaseși","indicative-pluperfect-singular-third-person":"evanghelizase","first-person-indicative-pluperfect-plural":"evanghelizaserăm","indicative-pluperfect-plural-second-person":"evanghelizaserăți","indicative-pluperfect-plural-third-person":"evanghelizaseră","first-person-present-singular-subjunctive":"să evanghelizez","present-second-person-singular-subjunctive":"să evanghelizezi","present-singular-subjunctive-third-person":"să evanghelizeze","first-person-plural-present-subjunctive":"să evanghelizăm","plural-present-second-person-subjunctive":"să evanghelizați","plural-present-subjunctive-third-person":"să evanghelizeze","imperative-second-person-singular":"evanghelizează","imperative-plural-second-person":"evanghelizați","imperative-negative-second-person-singular":"nu evangheliza","imperative-negative-plural-second-person":"nu evanghelizați"}},{"word":"evanghelizare","pos":"noun","definitions":["evangelization"],"forms":{"plural":"evanghelizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evanghelizare","accusative-definite-nominative-singular":"evanghelizarea","accusative-indefinite-nominative-plural":"evanghelizări","accusative-definite-nominative-plural":"evanghelizările","dative-genitive-indefinite-singular":"evanghelizări","dative-definite-genitive-singular":"evanghelizării","dative-genitive-indefinite-plural":"evanghelizări","dative-definite-genitive-plural":"evanghelizărilor","singular-vocative":"evanghelizare","plural-vocative":"evanghelizărilor"}},{"word":"evanghelizator","pos":"adj","definitions":["evangelizing"],"forms":{"feminine-singular":"evanghelizatoare","masculine-plural":"evanghelizatori","feminine-neuter-plural":"evanghelizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evanghelizator","error-unrecognized-form-feminine-indefinite-singular":"evanghelizatoare","error-unrecognized-form-indefinite-masculine-plural":"evanghelizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"evanghelizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"evanghelizatorul","definite-error-unrecognized-form-feminine-singular":"evanghelizatoarea","definite-error-unrecognized-form-masculine-plural":"evanghelizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"evanghelizatoarele"}},{"word":"evanghelizator","pos":"noun","definitions":["evangelizer"],"forms":{"plural":"evanghelizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evanghelizator","accusative-definite-nominative-singular":"evanghelizatorul","accusative-indefinite-nominative-plural":"evanghelizatori","accusative-definite-nominative-plural":"evanghelizatorii","dative-genitive-indefinite-singular":"evanghelizator","dative-definite-genitive-singular":"evanghelizatorului","dative-genitive-indefinite-plural":"evanghelizatori","dative-definite-genitive-plural":"evanghelizatorilor","singular-vocative":"evanghelizatorule","plural-vocative":"evanghelizatorilor"}},{"word":"evantai","pos":"noun","definitions":["fan (handheld)"],"forms":{"plural":"evantaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"evantai","accusative-definite-nominative-singular":"evantaiul","accusative-indefinite-nominative-plural":"evantaie","accusative-definite-nominative-plural":"evantaiele","dative-genitive-indefinite-singular":"evantai","dative-definite-genitive-singular":"evantaiului","dative-genitive-indefinite-plural":"evantaie","dative-definite-genitive-plural":"evantaielor","singular-vocative":"evantaiule","plural-vocative":"evantaielor"}},{"word":"evantaliu","pos":"noun","definitions":["alternative form of evantai"],"forms":{"plural":"evantalii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"evantaliu","accusative-definite-nominative-singular":"evantaliuul","accusative-indefinite-nominative-plural":"evantalii","accusative-definite-nominative-plural":"evantaliile","dative-genitive-indefinite-singular":"evantaliu","dative-definite-genitive-singular":"evantaliuului","dative-genitive-indefinite-plural":"evantalii","dative-definite-genitive-plural":"evantaliilor","singular-vocative":"evantaliuule","plural-vocative":"evantaliilor"}},{"word":"evapora","pos":"verb","definitions":["to evaporate","to suddenly disappear"],"pronunciation":"/e.va.poˈra/","forms":{"canonical":"a evapora 1st conjugation","present-singular-third-person":"evaporă","participle-past":"evaporat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a evapora","gerund":"evaporând","first-person-indicative-present-singular":"evapor","indicative-present-second-person-singular":"evapori","indicative-present-singular-third-person":"evaporă","first-person-indicative-plural-present":"evaporăm","indicative-plural-present-second-person":"evaporați","indicative-plural-present-third-person":"evaporă","first-person-imperfect-indicative-singular":"evaporam","imperfect-indicative-second-person-singular":"evaporai","imperfect-indicative-singular-third-person":"evapora","first-person-imperfect-indicative-plural":"evaporam","imperfect-indicative-plural-second-person":"evaporați","imperfect-indicative-plural-third-person":"evaporau","first-person-indicative-perfect-singular":"evaporai","indicative-perfect-second-person-singular":"evaporași","indicative-perfect-singular-third-person":"evaporă","first-person-indicative-perfect-plural":"evaporarăm","indicative-perfect-plural-second-person":"evaporarăți","indicative-perfect-plural-third-person":"evaporară","first-person-indicative-pluperfect-singular":"evaporasem","indicative-pluperfect-second-person-singular":"evaporaseși","indicative-pluperfect-singular-third-person":"evaporase","first-person-indicative-pluperfect-plural":"evaporaserăm","indicative-pluperfect-plural-second-person":"evaporaserăți","indicative-pluperfect-plural-third-person":"evaporaseră","first-person-present-singular-subjunctive":"să evapor","present-second-person-singular-subjunctive":"să evapori","present-singular-subjunctive-third-person":"să evapore","first-person-plural-present-subjunctive":"să evaporăm","plural-present-second-person-subjunctive":"să evaporați","plural-present-subjunctive-third-person":"să evapore","imperative-second-person-singular":"evaporă","imperative-plural-second-person":"evaporați","imperative-negative-second-person-singular":"nu evapora","imperative-negative-plural-second-person":"nu evaporați"}},{"word":"evaporabil","pos":"adj","definitions":["evaporable"],"forms":{"feminine-singular":"evaporabilă","masculine-plural":"evaporabili","feminine-neuter-plural":"evaporabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaporabil","error-unrecognized-form-feminine-indefinite-singular":"evaporabilă","error-unrecognized-form-indefinite-masculine-plural":"evaporabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evaporabile","definite-error-unrecognized-form-masculine-neuter-singular":"evaporabilul","definite-error-unrecognized-form-feminine-singular":"evaporabila","definite-error-unrecognized-form-masculine-plural":"evaporabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evaporabilele"}},{"word":"evaporare","pos":"noun","definitions":["evaporation"],"forms":{"plural":"evaporări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evaporare","accusative-definite-nominative-singular":"evaporarea","accusative-indefinite-nominative-plural":"evaporări","accusative-definite-nominative-plural":"evaporările","dative-genitive-indefinite-singular":"evaporări","dative-definite-genitive-singular":"evaporării","dative-genitive-indefinite-plural":"evaporări","dative-definite-genitive-plural":"evaporărilor","singular-vocative":"evaporare","plural-vocative":"evaporărilor"}},{"word":"evaporat","pos":"adj","definitions":["evaporated"],"forms":{"feminine-singular":"evaporată","masculine-plural":"evaporați","feminine-neuter-plural":"evaporate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaporat","error-unrecognized-form-feminine-indefinite-singular":"evaporată","error-unrecognized-form-indefinite-masculine-plural":"evaporați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evaporate","definite-error-unrecognized-form-masculine-neuter-singular":"evaporatul","definite-error-unrecognized-form-feminine-singular":"evaporata","definite-error-unrecognized-form-masculine-plural":"evaporații","definite-error-unrecognized-form-feminine-neuter-plural":"evaporatele"}},{"word":"evaporat","pos":"verb","definitions":["past participle of evapora"],"forms":{"participle-past":"of evapora"}},{"word":"evaporație","pos":"noun","definitions":["evaporation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evaporație","accusative-definite-nominative-singular":"evaporația","accusative-indefinite-nominative-plural":"evaporații","accusative-definite-nominative-plural":"evaporațiile","dative-genitive-indefinite-singular":"evaporații","dative-definite-genitive-singular":"evaporației","dative-genitive-indefinite-plural":"evaporații","dative-definite-genitive-plural":"evaporațiilor","singular-vocative":"evaporație","plural-vocative":"evaporațiilor"}},{"word":"evaporațiune","pos":"noun","definitions":["obsolete form of evaporație"],"forms":{"plural":"evaporațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evaporațiune","accusative-definite-nominative-singular":"evaporațiunea","accusative-indefinite-nominative-plural":"evaporațiuni","accusative-definite-nominative-plural":"evaporațiunile","dative-genitive-indefinite-singular":"evaporațiuni","dative-definite-genitive-singular":"evaporațiunii","dative-genitive-indefinite-plural":"evaporațiuni","dative-definite-genitive-plural":"evaporațiunilor","singular-vocative":"evaporațiune","plural-vocative":"evaporațiunilor"}},{"word":"evaporimetru","pos":"noun","definitions":["evaporimeter"],"forms":{"plural":"evaporimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"evaporimetru","accusative-definite-nominative-singular":"evaporimetrul","accusative-indefinite-nominative-plural":"evaporimetre","accusative-definite-nominative-plural":"evaporimetrele","dative-genitive-indefinite-singular":"evaporimetru","dative-definite-genitive-singular":"evaporimetrului","dative-genitive-indefinite-plural":"evaporimetre","dative-definite-genitive-plural":"evaporimetrelor","singular-vocative":"evaporimetrule","plural-vocative":"evaporimetrelor"}},{"word":"evaza","pos":"verb","definitions":["to widen"],"forms":{"canonical":"a evaza 1st conjugation","present-singular-third-person":"evazează","participle-past":"evazat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evaza","gerund":"evazând","first-person-indicative-present-singular":"evazez","indicative-present-second-person-singular":"evazezi","indicative-present-singular-third-person":"evazează","first-person-indicative-plural-present":"evazăm","indicative-plural-present-second-person":"evazați","indicative-plural-present-third-person":"evazează","first-person-imperfect-indicative-singular":"evazam","imperfect-indicative-second-person-singular":"evazai","imperfect-indicative-singular-third-person":"evaza","first-person-imperfect-indicative-plural":"evazam","imperfect-indicative-plural-second-person":"evazați","imperfect-indicative-plural-third-person":"evazau","first-person-indicative-perfect-singular":"evazai","indicative-perfect-second-person-singular":"evazași","indicative-perfect-singular-third-person":"evază","first-person-indicative-perfect-plural":"evazarăm","indicative-perfect-plural-second-person":"evazarăți","indicative-perfect-plural-third-person":"evazară","first-person-indicative-pluperfect-singular":"evazasem","indicative-pluperfect-second-person-singular":"evazaseși","indicative-pluperfect-singular-third-person":"evazase","first-person-indicative-pluperfect-plural":"evazaserăm","indicative-pluperfect-plural-second-person":"evazaserăți","indicative-pluperfect-plural-third-person":"evazaseră","first-person-present-singular-subjunctive":"să evazez","present-second-person-singular-subjunctive":"să evazezi","present-singular-subjunctive-third-person":"să evazeze","first-person-plural-present-subjunctive":"să evazăm","plural-present-second-person-subjunctive":"să evazați","plural-present-subjunctive-third-person":"să evazeze","imperative-second-person-singular":"evazează","imperative-plural-second-person":"evazați","imperative-negative-second-person-singular":"nu evaza","imperative-negative-plural-second-person":"nu evazați"}},{"word":"evazionism","pos":"noun","definitions":["escapism"],"forms":{"plural":"evazionisme","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evazionism","accusative-definite-nominative-singular":"evazionismul","accusative-indefinite-nominative-plural":"evazionisme","accusative-definite-nominative-plural":"evazionismei","dative-genitive-indefinite-singular":"evazionism","dative-definite-genitive-singular":"evazionismului","dative-genitive-indefinite-plural":"evazionisme","dative-definite-genitive-plural":"evazionismelor","singular-vocative":"evazionismule","plural-vocative":"evazionismelor"}},{"word":"evazionist","pos":"noun","definitions":["tax evader"],"forms":{"plural":"evazioniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evazionist","accusative-definite-nominative-singular":"evazionistul","accusative-indefinite-nominative-plural":"evazionisti","accusative-definite-nominative-plural":"evazionistii","dative-genitive-indefinite-singular":"evazionist","dative-definite-genitive-singular":"evazionistului","dative-genitive-indefinite-plural":"evazionisti","dative-definite-genitive-plural":"evazionistilor","singular-vocative":"evazionistule","plural-vocative":"evazionistilor"}},{"word":"evazionistă","pos":"noun","definitions":["female equivalent of evazionist"],"forms":{"plural":"evazioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evazionistă","accusative-definite-nominative-singular":"evazionista","accusative-indefinite-nominative-plural":"evazioniste","accusative-definite-nominative-plural":"evazionistele","dative-genitive-indefinite-singular":"evazioniste","dative-definite-genitive-singular":"evazionistei","dative-genitive-indefinite-plural":"evazioniste","dative-definite-genitive-plural":"evazionistelor","singular-vocative":"evazionistă","plural-vocative":"evazionistelor"}},{"word":"evaziune","pos":"noun","definitions":["evasion"],"forms":{"plural":"evaziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evaziune","accusative-definite-nominative-singular":"evaziunea","accusative-indefinite-nominative-plural":"evaziuni","accusative-definite-nominative-plural":"evaziunile","dative-genitive-indefinite-singular":"evaziuni","dative-definite-genitive-singular":"evaziunii","dative-genitive-indefinite-plural":"evaziuni","dative-definite-genitive-plural":"evaziunilor","singular-vocative":"evaziune","plural-vocative":"evaziunilor"}},{"word":"evaziune fiscală","pos":"noun","definitions":["tax evasion"]},{"word":"evaziv","pos":"adj","definitions":["evasive"],"pronunciation":"/e.vaˈziv/","forms":{"feminine-singular":"evazivă","masculine-plural":"evazivi","feminine-neuter-plural":"evazive","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"evaziv","error-unrecognized-form-feminine-indefinite-singular":"evazivă","error-unrecognized-form-indefinite-masculine-plural":"evazivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"evazive","definite-error-unrecognized-form-masculine-neuter-singular":"evazivul","definite-error-unrecognized-form-feminine-singular":"evaziva","definite-error-unrecognized-form-masculine-plural":"evazivii","definite-error-unrecognized-form-feminine-neuter-plural":"evazivele"}},{"word":"evazivitate","pos":"noun","definitions":["evasiveness"],"forms":{"plural":"evazivitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evazivitate","accusative-definite-nominative-singular":"evazivitatea","accusative-indefinite-nominative-plural":"evazivitatăți","accusative-definite-nominative-plural":"evazivitatățile","dative-genitive-indefinite-singular":"evazivitatăți","dative-definite-genitive-singular":"evazivitatății","dative-genitive-indefinite-plural":"evazivitatăți","dative-definite-genitive-plural":"evazivitatăților","singular-vocative":"evazivitate","plural-vocative":"evazivitatăților"}},{"word":"evdemon","pos":"noun","definitions":["angel"],"forms":{"plural":"evdemoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evdemon","accusative-definite-nominative-singular":"evdemonul","accusative-indefinite-nominative-plural":"evdemoni","accusative-definite-nominative-plural":"evdemonii","dative-genitive-indefinite-singular":"evdemon","dative-definite-genitive-singular":"evdemonului","dative-genitive-indefinite-plural":"evdemoni","dative-definite-genitive-plural":"evdemonilor","singular-vocative":"evdemonule","plural-vocative":"evdemonilor"}},{"word":"evecțiune","pos":"noun","definitions":["evection"],"forms":{"plural":"evecțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evecțiune","accusative-definite-nominative-singular":"evecțiunea","accusative-indefinite-nominative-plural":"evecțiuni","accusative-definite-nominative-plural":"evecțiunile","dative-genitive-indefinite-singular":"evecțiuni","dative-definite-genitive-singular":"evecțiunii","dative-genitive-indefinite-plural":"evecțiuni","dative-definite-genitive-plural":"evecțiunilor","singular-vocative":"evecțiune","plural-vocative":"evecțiunilor"}},{"word":"eveni","pos":"verb","definitions":["to happen"],"forms":{"canonical":"a eveni 4th conjugation","present-singular-third-person":"evenește","participle-past":"evenit","subjunctive-third-person":"evenească","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a eveni","gerund":"evenind","first-person-indicative-present-singular":"evenesc","indicative-present-second-person-singular":"evenești","indicative-present-singular-third-person":"evenește","first-person-indicative-plural-present":"evenim","indicative-plural-present-second-person":"eveniți","indicative-plural-present-third-person":"evenesc","first-person-imperfect-indicative-singular":"eveneam","imperfect-indicative-second-person-singular":"eveneai","imperfect-indicative-singular-third-person":"evenea","first-person-imperfect-indicative-plural":"eveneam","imperfect-indicative-plural-second-person":"eveneați","imperfect-indicative-plural-third-person":"eveneau","first-person-indicative-perfect-singular":"evenii","indicative-perfect-second-person-singular":"eveniși","indicative-perfect-singular-third-person":"eveni","first-person-indicative-perfect-plural":"evenirăm","indicative-perfect-plural-second-person":"evenirăți","indicative-perfect-plural-third-person":"eveniră","first-person-indicative-pluperfect-singular":"evenisem","indicative-pluperfect-second-person-singular":"eveniseși","indicative-pluperfect-singular-third-person":"evenise","first-person-indicative-pluperfect-plural":"eveniserăm","indicative-pluperfect-plural-second-person":"eveniserăți","indicative-pluperfect-plural-third-person":"eveniseră","first-person-present-singular-subjunctive":"să evenesc","present-second-person-singular-subjunctive":"să evenești","present-singular-subjunctive-third-person":"să evenească","first-person-plural-present-subjunctive":"să evenim","plural-present-second-person-subjunctive":"să eveniți","plural-present-subjunctive-third-person":"să evenească","imperative-second-person-singular":"evenește","imperative-plural-second-person":"eveniți","imperative-negative-second-person-singular":"nu eveni","imperative-negative-plural-second-person":"nu eveniți"}},{"word":"eveniment","pos":"noun","definitions":["event"],"forms":{"plural":"evenimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"eveniment","accusative-definite-nominative-singular":"evenimentul","accusative-indefinite-nominative-plural":"evenimente","accusative-definite-nominative-plural":"evenimentele","dative-genitive-indefinite-singular":"eveniment","dative-definite-genitive-singular":"evenimentului","dative-genitive-indefinite-plural":"evenimente","dative-definite-genitive-plural":"evenimentelor","singular-vocative":"evenimentule","plural-vocative":"evenimentelor"}},{"word":"evenimențial","pos":"adj","definitions":["event"],"forms":{"feminine-singular":"evenimențială","masculine-plural":"evenimențiali","feminine-neuter-plural":"evenimențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evenimențial","error-unrecognized-form-feminine-indefinite-singular":"evenimențială","error-unrecognized-form-indefinite-masculine-plural":"evenimențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"evenimențiale","definite-error-unrecognized-form-masculine-neuter-singular":"evenimențialul","definite-error-unrecognized-form-feminine-singular":"evenimențiala","definite-error-unrecognized-form-masculine-plural":"evenimențialii","definite-error-unrecognized-form-feminine-neuter-plural":"evenimențialele"}},{"word":"evenire","pos":"noun","definitions":["happening, occurrence"],"forms":{"plural":"eveniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evenire","accusative-definite-nominative-singular":"evenirea","accusative-indefinite-nominative-plural":"eveniri","accusative-definite-nominative-plural":"evenirile","dative-genitive-indefinite-singular":"eveniri","dative-definite-genitive-singular":"evenirii","dative-genitive-indefinite-plural":"eveniri","dative-definite-genitive-plural":"evenirilor","singular-vocative":"evenire","plural-vocative":"evenirilor"}},{"word":"eventiv","pos":"adj","definitions":["prospective"],"forms":{"feminine-singular":"eventivă","masculine-plural":"eventivi","feminine-neuter-plural":"eventive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eventiv","error-unrecognized-form-feminine-indefinite-singular":"eventivă","error-unrecognized-form-indefinite-masculine-plural":"eventivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"eventive","definite-error-unrecognized-form-masculine-neuter-singular":"eventivul","definite-error-unrecognized-form-feminine-singular":"eventiva","definite-error-unrecognized-form-masculine-plural":"eventivii","definite-error-unrecognized-form-feminine-neuter-plural":"eventivele"}},{"word":"eventrație","pos":"noun","definitions":["eventration"],"forms":{"plural":"eventrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"eventrație","accusative-definite-nominative-singular":"eventrația","accusative-indefinite-nominative-plural":"eventrații","accusative-definite-nominative-plural":"eventrațiile","dative-genitive-indefinite-singular":"eventrații","dative-definite-genitive-singular":"eventrației","dative-genitive-indefinite-plural":"eventrații","dative-definite-genitive-plural":"eventrațiilor","singular-vocative":"eventrație","plural-vocative":"eventrațiilor"}},{"word":"eventual","pos":"adj","definitions":["prospective"],"forms":{"feminine-singular":"eventuală","masculine-plural":"eventuali","feminine-neuter-plural":"eventuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eventual","error-unrecognized-form-feminine-indefinite-singular":"eventuală","error-unrecognized-form-indefinite-masculine-plural":"eventuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"eventuale","definite-error-unrecognized-form-masculine-neuter-singular":"eventualul","definite-error-unrecognized-form-feminine-singular":"eventuala","definite-error-unrecognized-form-masculine-plural":"eventualii","definite-error-unrecognized-form-feminine-neuter-plural":"eventualele"}},{"word":"eventualitate","pos":"noun","definitions":["eventuality"],"pronunciation":"[eventualiˈtate]","forms":{"plural":"eventualități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"eventualitate","accusative-definite-nominative-singular":"eventualitatea","accusative-indefinite-nominative-plural":"eventualități","accusative-definite-nominative-plural":"eventualitățile","dative-genitive-indefinite-singular":"eventualități","dative-definite-genitive-singular":"eventualității","dative-genitive-indefinite-plural":"eventualități","dative-definite-genitive-plural":"eventualităților","singular-vocative":"eventualitate","plural-vocative":"eventualităților"}},{"word":"everghesie","pos":"noun","definitions":["a good deed, public service"],"forms":{"plural":"everghesii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"everghesie","accusative-definite-nominative-singular":"everghesia","accusative-indefinite-nominative-plural":"everghesii","accusative-definite-nominative-plural":"everghesiile","dative-genitive-indefinite-singular":"everghesii","dative-definite-genitive-singular":"everghesiei","dative-genitive-indefinite-plural":"everghesii","dative-definite-genitive-plural":"everghesiilor","singular-vocative":"everghesie","plural-vocative":"everghesiilor"}},{"word":"everghet","pos":"noun","definitions":["benefactor"],"forms":{"plural":"evergheți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"everghet","accusative-definite-nominative-singular":"everghetul","accusative-indefinite-nominative-plural":"evergheți","accusative-definite-nominative-plural":"evergheții","dative-genitive-indefinite-singular":"everghet","dative-definite-genitive-singular":"everghetului","dative-genitive-indefinite-plural":"evergheți","dative-definite-genitive-plural":"evergheților","singular-vocative":"everghetule","plural-vocative":"evergheților"}},{"word":"eversiune","pos":"noun","definitions":["eversion"],"forms":{"plural":"eversiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eversiune","accusative-definite-nominative-singular":"eversiunea","accusative-indefinite-nominative-plural":"eversiuni","accusative-definite-nominative-plural":"eversiunile","dative-genitive-indefinite-singular":"eversiuni","dative-definite-genitive-singular":"eversiunii","dative-genitive-indefinite-plural":"eversiuni","dative-definite-genitive-plural":"eversiunilor","singular-vocative":"eversiune","plural-vocative":"eversiunilor"}},{"word":"evghenicesc","pos":"adj","definitions":["nobiliary"],"forms":{"feminine-singular":"evghenicească","plural":"evghenicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evghenicesc","error-unrecognized-form-feminine-indefinite-singular":"evghenicească","error-unrecognized-form-indefinite-masculine-plural":"evghenicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"evghenicești","definite-error-unrecognized-form-masculine-neuter-singular":"evghenicescul","definite-error-unrecognized-form-feminine-singular":"evgheniceasca","definite-error-unrecognized-form-masculine-plural":"evgheniceștii","definite-error-unrecognized-form-feminine-neuter-plural":"evgheniceștile"}},{"word":"evghenichi","pos":"adj","definitions":["noble"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evghenichi","error-unrecognized-form-feminine-indefinite-singular":"evghenichi","error-unrecognized-form-indefinite-masculine-plural":"evghenichi","error-unrecognized-form-feminine-indefinite-neuter-plural":"evghenichi","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"evghenicos","pos":"adj","definitions":["noble"],"forms":{"feminine-singular":"evghenicoasă","masculine-plural":"evghenicoși","feminine-neuter-plural":"evghenicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evghenicos","error-unrecognized-form-feminine-indefinite-singular":"evghenicoasă","error-unrecognized-form-indefinite-masculine-plural":"evghenicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"evghenicoase","definite-error-unrecognized-form-masculine-neuter-singular":"evghenicosul","definite-error-unrecognized-form-feminine-singular":"evghenicoasa","definite-error-unrecognized-form-masculine-plural":"evghenicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"evghenicoasele"}},{"word":"Evghenie","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Evghenie"}},{"word":"evghenie","pos":"noun","definitions":["nobility"],"forms":{"plural":"evghenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evghenie","accusative-definite-nominative-singular":"evghenia","accusative-indefinite-nominative-plural":"evghenii","accusative-definite-nominative-plural":"evgheniile","dative-genitive-indefinite-singular":"evghenii","dative-definite-genitive-singular":"evgheniei","dative-genitive-indefinite-plural":"evghenii","dative-definite-genitive-plural":"evgheniilor","singular-vocative":"evghenie","plural-vocative":"evgheniilor"}},{"word":"Evghenievca","pos":"name","definitions":["a village in Copăceni, Sîngerei Raion, Moldova"],"gender":"f"},{"word":"evghenis","pos":"noun","definitions":["noble"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"evghenis","accusative-definite-nominative":"evghenisul","dative-genitive-indefinite":"evghenis","dative-definite-genitive":"evghenisului","vocative":"evghenisule"}},{"word":"evghenisi","pos":"verb","definitions":["to ennoble"],"forms":{"canonical":"a evghenisi 4th conjugation","present-singular-third-person":"evghenisește","participle-past":"evghenisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a evghenisi","gerund":"evghenisind","first-person-indicative-present-singular":"evghenisesc","indicative-present-second-person-singular":"evghenisești","indicative-present-singular-third-person":"evghenisește","first-person-indicative-plural-present":"evghenisim","indicative-plural-present-second-person":"evghenisiți","indicative-plural-present-third-person":"evghenisesc","first-person-imperfect-indicative-singular":"evgheniseam","imperfect-indicative-second-person-singular":"evgheniseai","imperfect-indicative-singular-third-person":"evghenisea","first-person-imperfect-indicative-plural":"evgheniseam","imperfect-indicative-plural-second-person":"evgheniseați","imperfect-indicative-plural-third-person":"evgheniseau","first-person-indicative-perfect-singular":"evghenisii","indicative-perfect-second-person-singular":"evghenisiși","indicative-perfect-singular-third-person":"evghenisi","first-person-indicative-perfect-plural":"evghenisirăm","indicative-perfect-plural-second-person":"evghenisirăți","indicative-perfect-plural-third-person":"evghenisiră","first-person-indicative-pluperfect-singular":"evghenisisem","indicative-pluperfect-second-person-singular":"evghenisiseși","indicative-pluperfect-singular-third-person":"evghenisise","first-person-indicative-pluperfect-plural":"evghenisiserăm","indicative-pluperfect-plural-second-person":"evghenisiserăți","indicative-pluperfect-plural-third-person":"evghenisiseră","first-person-present-singular-subjunctive":"să evghenisesc","present-second-person-singular-subjunctive":"să evghenisești","present-singular-subjunctive-third-person":"să evghenisească","first-person-plural-present-subjunctive":"să evghenisim","plural-present-second-person-subjunctive":"să evghenisiți","plural-present-subjunctive-third-person":"să evghenisească","imperative-second-person-singular":"evghenisește","imperative-plural-second-person":"evghenisiți","imperative-negative-second-person-singular":"nu evghenisi","imperative-negative-plural-second-person":"nu evghenisiți"}},{"word":"evghenisire","pos":"noun","definitions":["nobility"],"forms":{"plural":"evghenisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evghenisire","accusative-definite-nominative-singular":"evghenisirea","accusative-indefinite-nominative-plural":"evghenisiri","accusative-definite-nominative-plural":"evghenisirile","dative-genitive-indefinite-singular":"evghenisiri","dative-definite-genitive-singular":"evghenisirii","dative-genitive-indefinite-plural":"evghenisiri","dative-definite-genitive-plural":"evghenisirilor","singular-vocative":"evghenisire","plural-vocative":"evghenisirilor"}},{"word":"evghenisit","pos":"adj","definitions":["noble"],"forms":{"feminine-singular":"evghenisită","masculine-plural":"evghenisiți","feminine-neuter-plural":"evghenisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evghenisit","error-unrecognized-form-feminine-indefinite-singular":"evghenisită","error-unrecognized-form-indefinite-masculine-plural":"evghenisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"evghenisite","definite-error-unrecognized-form-masculine-neuter-singular":"evghenisitul","definite-error-unrecognized-form-feminine-singular":"evghenisita","definite-error-unrecognized-form-masculine-plural":"evghenisiții","definite-error-unrecognized-form-feminine-neuter-plural":"evghenisitele"}},{"word":"evghenisit","pos":"verb","definitions":["past participle of evghenisi"],"forms":{"participle-past":"of evghenisi"}},{"word":"evghenist","pos":"adj","definitions":["noble"],"forms":{"feminine-singular":"evghenistă","masculine-plural":"evgheniști","feminine-neuter-plural":"evgheniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evghenist","error-unrecognized-form-feminine-indefinite-singular":"evghenistă","error-unrecognized-form-indefinite-masculine-plural":"evgheniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"evgheniste","definite-error-unrecognized-form-masculine-neuter-singular":"evghenistul","definite-error-unrecognized-form-feminine-singular":"evghenista","definite-error-unrecognized-form-masculine-plural":"evgheniștii","definite-error-unrecognized-form-feminine-neuter-plural":"evghenistele"}},{"word":"evghenit","pos":"noun","definitions":["noble"],"forms":{"plural":"evgheniți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evghenit","accusative-definite-nominative-singular":"evghenitul","accusative-indefinite-nominative-plural":"evgheniți","accusative-definite-nominative-plural":"evgheniții","dative-genitive-indefinite-singular":"evghenit","dative-definite-genitive-singular":"evghenitului","dative-genitive-indefinite-plural":"evgheniți","dative-definite-genitive-plural":"evgheniților","singular-vocative":"evghenitule","plural-vocative":"evgheniților"}},{"word":"evghenitate","pos":"noun","definitions":["nobility"],"forms":{"plural":"evghenități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evghenitate","accusative-definite-nominative-singular":"evghenitatea","accusative-indefinite-nominative-plural":"evghenități","accusative-definite-nominative-plural":"evghenitățile","dative-genitive-indefinite-singular":"evghenități","dative-definite-genitive-singular":"evghenității","dative-genitive-indefinite-plural":"evghenități","dative-definite-genitive-plural":"evghenităților","singular-vocative":"evghenitate","plural-vocative":"evghenităților"}},{"word":"evglotie","pos":"noun","definitions":["eloquence"],"forms":{"plural":"evglotii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evglotie","accusative-definite-nominative-singular":"evglotia","accusative-indefinite-nominative-plural":"evglotii","accusative-definite-nominative-plural":"evglotiile","dative-genitive-indefinite-singular":"evglotii","dative-definite-genitive-singular":"evglotiei","dative-genitive-indefinite-plural":"evglotii","dative-definite-genitive-plural":"evglotiilor","singular-vocative":"evglotie","plural-vocative":"evglotiilor"}},{"word":"evgnomosine","pos":"noun","definitions":["gratitude, gratefulness, thankfulness"],"forms":{"plural":"evgnomosini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evgnomosine","accusative-definite-nominative-singular":"evgnomosinea","accusative-indefinite-nominative-plural":"evgnomosini","accusative-definite-nominative-plural":"evgnomosinile","dative-genitive-indefinite-singular":"evgnomosini","dative-definite-genitive-singular":"evgnomosinii","dative-genitive-indefinite-plural":"evgnomosini","dative-definite-genitive-plural":"evgnomosinilor","singular-vocative":"evgnomosine","plural-vocative":"evgnomosinilor"}},{"word":"evhemerism","pos":"noun","definitions":["alternative form of euhemerism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"evhemerism","accusative-definite-nominative":"evhemerismul","dative-genitive-indefinite":"evhemerism","dative-definite-genitive":"evhemerismului","vocative":"evhemerismule"}},{"word":"evi","pos":"noun","definitions":["indefinite plural of ev"],"pronunciation":"[evʲ]","gender":"m"},{"word":"evicțiune","pos":"noun","definitions":["eviction"],"forms":{"plural":"evicțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evicțiune","accusative-definite-nominative-singular":"evicțiunea","accusative-indefinite-nominative-plural":"evicțiuni","accusative-definite-nominative-plural":"evicțiunile","dative-genitive-indefinite-singular":"evicțiuni","dative-definite-genitive-singular":"evicțiunii","dative-genitive-indefinite-plural":"evicțiuni","dative-definite-genitive-plural":"evicțiunilor","singular-vocative":"evicțiune","plural-vocative":"evicțiunilor"}},{"word":"evident","pos":"adj","definitions":["obvious"],"forms":{"feminine-singular":"evidentă","masculine-plural":"evidenți","feminine-neuter-plural":"evidente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evident","error-unrecognized-form-feminine-indefinite-singular":"evidentă","error-unrecognized-form-indefinite-masculine-plural":"evidenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"evidente","definite-error-unrecognized-form-masculine-neuter-singular":"evidentul","definite-error-unrecognized-form-feminine-singular":"evidenta","definite-error-unrecognized-form-masculine-plural":"evidenții","definite-error-unrecognized-form-feminine-neuter-plural":"evidentele"}},{"word":"evidență","pos":"noun","definitions":["evidence"],"forms":{"plural":"evidențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evidență","accusative-definite-nominative-singular":"evidența","accusative-indefinite-nominative-plural":"evidențe","accusative-definite-nominative-plural":"evidențele","dative-genitive-indefinite-singular":"evidențe","dative-definite-genitive-singular":"evidenței","dative-genitive-indefinite-plural":"evidențe","dative-definite-genitive-plural":"evidențelor","singular-vocative":"evidență","plural-vocative":"evidențelor"}}];
@@ -0,0 +1 @@
+export default [{"word":"evidenția","pos":"verb","definitions":["to emphasize"],"forms":{"canonical":"a evidenția 1st conjugation","present-singular-third-person":"evidențiează","participle-past":"evidențiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evidenția","gerund":"evidențiind","first-person-indicative-present-singular":"evidențiez","indicative-present-second-person-singular":"evidențiezi","indicative-present-singular-third-person":"evidențiază","first-person-indicative-plural-present":"evidențiem","indicative-plural-present-second-person":"evidențiați","indicative-plural-present-third-person":"evidențiază","first-person-imperfect-indicative-singular":"evidențiam","imperfect-indicative-second-person-singular":"evidențiai","imperfect-indicative-singular-third-person":"evidenția","first-person-imperfect-indicative-plural":"evidențiam","imperfect-indicative-plural-second-person":"evidențiați","imperfect-indicative-plural-third-person":"evidențiau","first-person-indicative-perfect-singular":"evidențiai","indicative-perfect-second-person-singular":"evidențiași","indicative-perfect-singular-third-person":"evidenție","first-person-indicative-perfect-plural":"evidențiarăm","indicative-perfect-plural-second-person":"evidențiarăți","indicative-perfect-plural-third-person":"evidențiară","first-person-indicative-pluperfect-singular":"evidențiasem","indicative-pluperfect-second-person-singular":"evidențiaseși","indicative-pluperfect-singular-third-person":"evidențiase","first-person-indicative-pluperfect-plural":"evidențiaserăm","indicative-pluperfect-plural-second-person":"evidențiaserăți","indicative-pluperfect-plural-third-person":"evidențiaseră","first-person-present-singular-subjunctive":"să evidențiez","present-second-person-singular-subjunctive":"să evidențiezi","present-singular-subjunctive-third-person":"să evidențieze","first-person-plural-present-subjunctive":"să evidențiem","plural-present-second-person-subjunctive":"să evidențiați","plural-present-subjunctive-third-person":"să evidențieze","imperative-second-person-singular":"evidențiază","imperative-plural-second-person":"evidențiați","imperative-negative-second-person-singular":"nu evidenția","imperative-negative-plural-second-person":"nu evidențiați"}},{"word":"evidențiat","pos":"adj","definitions":["highlighted"],"forms":{"feminine-singular":"evidențiată","masculine-plural":"evidențiați","feminine-neuter-plural":"evidențiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evidențiat","error-unrecognized-form-feminine-indefinite-singular":"evidențiată","error-unrecognized-form-indefinite-masculine-plural":"evidențiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evidențiate","definite-error-unrecognized-form-masculine-neuter-singular":"evidențiatul","definite-error-unrecognized-form-feminine-singular":"evidențiata","definite-error-unrecognized-form-masculine-plural":"evidențiații","definite-error-unrecognized-form-feminine-neuter-plural":"evidențiatele"}},{"word":"evidențiat","pos":"verb","definitions":["past participle of evidenția"],"forms":{"participle-past":"of evidenția"}},{"word":"evidențiere","pos":"noun","definitions":["highlighting"],"forms":{"plural":"evidențieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evidențiere","accusative-definite-nominative-singular":"evidențierea","accusative-indefinite-nominative-plural":"evidențieri","accusative-definite-nominative-plural":"evidențierile","dative-genitive-indefinite-singular":"evidențieri","dative-definite-genitive-singular":"evidențierii","dative-genitive-indefinite-plural":"evidențieri","dative-definite-genitive-plural":"evidențierilor","singular-vocative":"evidențiere","plural-vocative":"evidențierilor"}},{"word":"evinge","pos":"verb","definitions":["to evict"],"forms":{"canonical":"a evinge 3rd conjugation","present-singular-third-person":"evinge","participle-past":"evins","subjunctive-third-person":"evingă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a evinge","gerund":"evingând","first-person-indicative-present-singular":"eving","indicative-present-second-person-singular":"evingi","indicative-present-singular-third-person":"evinge","first-person-indicative-plural-present":"evingem","indicative-plural-present-second-person":"evingeți","indicative-plural-present-third-person":"eving","first-person-imperfect-indicative-singular":"evingeam","imperfect-indicative-second-person-singular":"evingeai","imperfect-indicative-singular-third-person":"evingea","first-person-imperfect-indicative-plural":"evingeam","imperfect-indicative-plural-second-person":"evingeați","imperfect-indicative-plural-third-person":"evingeau","first-person-indicative-perfect-singular":"evinsei","indicative-perfect-second-person-singular":"evinseși","indicative-perfect-singular-third-person":"evinse","first-person-indicative-perfect-plural":"evinserăm","indicative-perfect-plural-second-person":"evinserăți","indicative-perfect-plural-third-person":"evinseră","first-person-indicative-pluperfect-singular":"evinsesem","indicative-pluperfect-second-person-singular":"evinseseși","indicative-pluperfect-singular-third-person":"evinsese","first-person-indicative-pluperfect-plural":"evinseserăm","indicative-pluperfect-plural-second-person":"evinseserăți","indicative-pluperfect-plural-third-person":"evinseseră","first-person-present-singular-subjunctive":"să eving","present-second-person-singular-subjunctive":"să evingi","present-singular-subjunctive-third-person":"să evingă","first-person-plural-present-subjunctive":"să evingem","plural-present-second-person-subjunctive":"să evingeți","plural-present-subjunctive-third-person":"să evingă","imperative-second-person-singular":"evinge","imperative-plural-second-person":"evingeți","imperative-negative-second-person-singular":"nu evinge","imperative-negative-plural-second-person":"nu evingeți"}},{"word":"evirație","pos":"noun","definitions":["evacuation"],"forms":{"plural":"evirații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evirație","accusative-definite-nominative-singular":"evirația","accusative-indefinite-nominative-plural":"evirații","accusative-definite-nominative-plural":"evirațiile","dative-genitive-indefinite-singular":"evirații","dative-definite-genitive-singular":"evirației","dative-genitive-indefinite-plural":"evirații","dative-definite-genitive-plural":"evirațiilor","singular-vocative":"evirație","plural-vocative":"evirațiilor"}},{"word":"eviscera","pos":"verb","definitions":["to eviscerate"],"forms":{"canonical":"a eviscera 1st conjugation","present-singular-third-person":"eviscerează","participle-past":"eviscerat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a eviscera","gerund":"eviscerând","first-person-indicative-present-singular":"eviscerez","indicative-present-second-person-singular":"eviscerezi","indicative-present-singular-third-person":"eviscerează","first-person-indicative-plural-present":"eviscerăm","indicative-plural-present-second-person":"eviscerați","indicative-plural-present-third-person":"eviscerează","first-person-imperfect-indicative-singular":"evisceram","imperfect-indicative-second-person-singular":"eviscerai","imperfect-indicative-singular-third-person":"eviscera","first-person-imperfect-indicative-plural":"evisceram","imperfect-indicative-plural-second-person":"eviscerați","imperfect-indicative-plural-third-person":"eviscerau","first-person-indicative-perfect-singular":"eviscerai","indicative-perfect-second-person-singular":"eviscerași","indicative-perfect-singular-third-person":"evisceră","first-person-indicative-perfect-plural":"eviscerarăm","indicative-perfect-plural-second-person":"eviscerarăți","indicative-perfect-plural-third-person":"eviscerară","first-person-indicative-pluperfect-singular":"eviscerasem","indicative-pluperfect-second-person-singular":"evisceraseși","indicative-pluperfect-singular-third-person":"eviscerase","first-person-indicative-pluperfect-plural":"evisceraserăm","indicative-pluperfect-plural-second-person":"evisceraserăți","indicative-pluperfect-plural-third-person":"evisceraseră","first-person-present-singular-subjunctive":"să eviscerez","present-second-person-singular-subjunctive":"să eviscerezi","present-singular-subjunctive-third-person":"să eviscereze","first-person-plural-present-subjunctive":"să eviscerăm","plural-present-second-person-subjunctive":"să eviscerați","plural-present-subjunctive-third-person":"să eviscereze","imperative-second-person-singular":"eviscerează","imperative-plural-second-person":"eviscerați","imperative-negative-second-person-singular":"nu eviscera","imperative-negative-plural-second-person":"nu eviscerați"}},{"word":"eviscerare","pos":"noun","definitions":["evisceration"],"forms":{"plural":"eviscerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"eviscerare","accusative-definite-nominative-singular":"eviscerarea","accusative-indefinite-nominative-plural":"eviscerări","accusative-definite-nominative-plural":"eviscerările","dative-genitive-indefinite-singular":"eviscerări","dative-definite-genitive-singular":"eviscerării","dative-genitive-indefinite-plural":"eviscerări","dative-definite-genitive-plural":"eviscerărilor","singular-vocative":"eviscerare","plural-vocative":"eviscerărilor"}},{"word":"eviscerat","pos":"adj","definitions":["eviscerated"],"forms":{"feminine-singular":"eviscerată","masculine-plural":"eviscerați","feminine-neuter-plural":"eviscerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"eviscerat","error-unrecognized-form-feminine-indefinite-singular":"eviscerată","error-unrecognized-form-indefinite-masculine-plural":"eviscerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"eviscerate","definite-error-unrecognized-form-masculine-neuter-singular":"evisceratul","definite-error-unrecognized-form-feminine-singular":"eviscerata","definite-error-unrecognized-form-masculine-plural":"eviscerații","definite-error-unrecognized-form-feminine-neuter-plural":"evisceratele"}},{"word":"eviscerat","pos":"verb","definitions":["past participle of eviscera"],"forms":{"participle-past":"of eviscera"}},{"word":"evita","pos":"verb","definitions":["to avoid"],"forms":{"canonical":"a evita 1st conjugation","present-singular-third-person":"evită","participle-past":"evitat","subjunctive-third-person":"evite","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a evita","gerund":"evitând","first-person-indicative-present-singular":"evit","indicative-present-second-person-singular":"eviți","indicative-present-singular-third-person":"evită","first-person-indicative-plural-present":"evităm","indicative-plural-present-second-person":"evitați","indicative-plural-present-third-person":"evită","first-person-imperfect-indicative-singular":"evitam","imperfect-indicative-second-person-singular":"evitai","imperfect-indicative-singular-third-person":"evita","first-person-imperfect-indicative-plural":"evitam","imperfect-indicative-plural-second-person":"evitați","imperfect-indicative-plural-third-person":"evitau","first-person-indicative-perfect-singular":"evitai","indicative-perfect-second-person-singular":"evitași","indicative-perfect-singular-third-person":"evită","first-person-indicative-perfect-plural":"evitarăm","indicative-perfect-plural-second-person":"evitarăți","indicative-perfect-plural-third-person":"evitară","first-person-indicative-pluperfect-singular":"evitasem","indicative-pluperfect-second-person-singular":"evitaseși","indicative-pluperfect-singular-third-person":"evitase","first-person-indicative-pluperfect-plural":"evitaserăm","indicative-pluperfect-plural-second-person":"evitaserăți","indicative-pluperfect-plural-third-person":"evitaseră","first-person-present-singular-subjunctive":"să evit","present-second-person-singular-subjunctive":"să eviți","present-singular-subjunctive-third-person":"să evite","first-person-plural-present-subjunctive":"să evităm","plural-present-second-person-subjunctive":"să evitați","plural-present-subjunctive-third-person":"să evite","imperative-second-person-singular":"evită","imperative-plural-second-person":"evitați","imperative-negative-second-person-singular":"nu evita","imperative-negative-plural-second-person":"nu evitați"}},{"word":"evitabil","pos":"adj","definitions":["avoidable"],"forms":{"feminine-singular":"evitabilă","masculine-plural":"evitabili","feminine-neuter-plural":"evitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evitabil","error-unrecognized-form-feminine-indefinite-singular":"evitabilă","error-unrecognized-form-indefinite-masculine-plural":"evitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evitabile","definite-error-unrecognized-form-masculine-neuter-singular":"evitabilul","definite-error-unrecognized-form-feminine-singular":"evitabila","definite-error-unrecognized-form-masculine-plural":"evitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evitabilele"}},{"word":"evitabilitate","pos":"noun","definitions":["avoidability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evitabilitate","accusative-definite-nominative-singular":"evitabilitatea","accusative-indefinite-nominative-plural":"evitabilități","accusative-definite-nominative-plural":"evitabilitățile","dative-genitive-indefinite-singular":"evitabilități","dative-definite-genitive-singular":"evitabilității","dative-genitive-indefinite-plural":"evitabilități","dative-definite-genitive-plural":"evitabilităților","singular-vocative":"evitabilitate","plural-vocative":"evitabilităților"}},{"word":"evitare","pos":"noun","definitions":["avoidance"],"forms":{"plural":"evitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evitare","accusative-definite-nominative-singular":"evitarea","accusative-indefinite-nominative-plural":"evitări","accusative-definite-nominative-plural":"evitările","dative-genitive-indefinite-singular":"evitări","dative-definite-genitive-singular":"evitării","dative-genitive-indefinite-plural":"evitări","dative-definite-genitive-plural":"evitărilor","singular-vocative":"evitare","plural-vocative":"evitărilor"}},{"word":"evitație","pos":"noun","definitions":["avoidance"],"forms":{"plural":"evitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evitație","accusative-definite-nominative-singular":"evitația","accusative-indefinite-nominative-plural":"evitații","accusative-definite-nominative-plural":"evitațiile","dative-genitive-indefinite-singular":"evitații","dative-definite-genitive-singular":"evitației","dative-genitive-indefinite-plural":"evitații","dative-definite-genitive-plural":"evitațiilor","singular-vocative":"evitație","plural-vocative":"evitațiilor"}},{"word":"evlavia","pos":"noun","definitions":["definite nominative/accusative singular of evlavie"],"pronunciation":"[evˈlavia]","gender":"f"},{"word":"evlavie","pos":"noun","definitions":["piety, godliness, devotion"],"pronunciation":"/e.ˈvla.vi.e/","forms":{"plural":"evlavii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evlavie","accusative-definite-nominative-singular":"evlavia","accusative-indefinite-nominative-plural":"evlavii","accusative-definite-nominative-plural":"evlaviile","dative-genitive-indefinite-singular":"evlavii","dative-definite-genitive-singular":"evlaviei","dative-genitive-indefinite-plural":"evlavii","dative-definite-genitive-plural":"evlaviilor","singular-vocative":"evlavie","plural-vocative":"evlaviilor"}},{"word":"evlaviei","pos":"noun","definitions":["definite genitive/dative singular of evlavie"],"pronunciation":"[evˈlaviej]","gender":"f"},{"word":"evlavii","pos":"noun","definitions":["plural of evlavie"],"pronunciation":"[evˈlaviː]","gender":"f-p"},{"word":"evlaviile","pos":"noun","definitions":["definite nominative/accusative plural of evlavie"],"pronunciation":"[evˈlaviːle]","gender":"f-p"},{"word":"evlaviilor","pos":"noun","definitions":["definite genitive/dative plural of evlavie"],"pronunciation":"[evˈlaviːlor]","gender":"f-p"},{"word":"evlavioasa","pos":"adj","definitions":["definite nominative/accusative feminine singular of evlavios"],"pronunciation":"[evlaviˈo̯asa]"},{"word":"evlavioasă","pos":"adj","definitions":["feminine singular of evlavios"],"pronunciation":"[e.vla.viˈo̯a.sə]"},{"word":"evlavioase","pos":"adj","definitions":["feminine/neuter plural of evlavios"],"pronunciation":"[evlaviˈo̯ase]","gender":"f-p"},{"word":"evlavioasei","pos":"adj","definitions":["definite genitive/dative feminine singular of evlavios"],"pronunciation":"[evlaviˈo̯asej]"},{"word":"evlavioasele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of evlavios"],"pronunciation":"[evlaviˈo̯asele]","gender":"f-p"},{"word":"evlavioaselor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of evlavios"],"pronunciation":"[evlaviˈo̯aselor]","gender":"f-p"},{"word":"evlavios","pos":"adj","definitions":["pious"],"pronunciation":"/e.vla.viˈos/","forms":{"feminine-singular":"evlavioasă","masculine-plural":"evlavioși","feminine-neuter-plural":"evlavioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evlavios","error-unrecognized-form-feminine-indefinite-singular":"evlavioasă","error-unrecognized-form-indefinite-masculine-plural":"evlavioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"evlavioase","definite-error-unrecognized-form-masculine-neuter-singular":"evlaviosul","definite-error-unrecognized-form-feminine-singular":"evlavioasa","definite-error-unrecognized-form-masculine-plural":"evlavioșii","definite-error-unrecognized-form-feminine-neuter-plural":"evlavioasele"}},{"word":"evlavioși","pos":"adj","definitions":["masculine plural of evlavios"],"pronunciation":"[evlaviˈoʃʲ]","gender":"m-p"},{"word":"evlavioșii","pos":"adj","definitions":["definite nominative/accusative masculine plural of evlavios"],"pronunciation":"[evlaviˈoʃiː]","gender":"m-p"},{"word":"evlavioșilor","pos":"adj","definitions":["definite genitive/dative masculine plural of evlavios"],"pronunciation":"[evlaviˈoʃilor]","gender":"m-p"},{"word":"evlaviosul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of evlavios"],"pronunciation":"/evlaviˈosul/","gender":"m"},{"word":"evlaviosului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of evlavios"],"pronunciation":"[evlaviˈosuluj]","gender":"m"},{"word":"evlavnic","pos":"adj","definitions":["pious"],"forms":{"feminine-singular":"evlavnică","masculine-plural":"evlavnici","feminine-neuter-plural":"evlavnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evlavnic","error-unrecognized-form-feminine-indefinite-singular":"evlavnică","error-unrecognized-form-indefinite-masculine-plural":"evlavnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"evlavnice","definite-error-unrecognized-form-masculine-neuter-singular":"evlavnicul","definite-error-unrecognized-form-feminine-singular":"evlavnica","definite-error-unrecognized-form-masculine-plural":"evlavnicii","definite-error-unrecognized-form-feminine-neuter-plural":"evlavnicele"}},{"word":"evmenie","pos":"noun","definitions":["benevolence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"evmenie","accusative-definite-nominative":"evmenia","dative-genitive-indefinite":"evmenii","dative-definite-genitive":"evmeniei","vocative":"evmenie"}},{"word":"evoca","pos":"verb","definitions":["to evoke"],"forms":{"canonical":"a evoca 1st conjugation","present-singular-third-person":"evocă","participle-past":"evocat","subjunctive-third-person":"evoce","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a evoca","gerund":"evocând","first-person-indicative-present-singular":"evoc","indicative-present-second-person-singular":"evoci","indicative-present-singular-third-person":"evocă","first-person-indicative-plural-present":"evocăm","indicative-plural-present-second-person":"evocați","indicative-plural-present-third-person":"evocă","first-person-imperfect-indicative-singular":"evocam","imperfect-indicative-second-person-singular":"evocai","imperfect-indicative-singular-third-person":"evoca","first-person-imperfect-indicative-plural":"evocam","imperfect-indicative-plural-second-person":"evocați","imperfect-indicative-plural-third-person":"evocau","first-person-indicative-perfect-singular":"evocai","indicative-perfect-second-person-singular":"evocași","indicative-perfect-singular-third-person":"evocă","first-person-indicative-perfect-plural":"evocarăm","indicative-perfect-plural-second-person":"evocarăți","indicative-perfect-plural-third-person":"evocară","first-person-indicative-pluperfect-singular":"evocasem","indicative-pluperfect-second-person-singular":"evocaseși","indicative-pluperfect-singular-third-person":"evocase","first-person-indicative-pluperfect-plural":"evocaserăm","indicative-pluperfect-plural-second-person":"evocaserăți","indicative-pluperfect-plural-third-person":"evocaseră","first-person-present-singular-subjunctive":"să evoc","present-second-person-singular-subjunctive":"să evoci","present-singular-subjunctive-third-person":"să evoce","first-person-plural-present-subjunctive":"să evocăm","plural-present-second-person-subjunctive":"să evocați","plural-present-subjunctive-third-person":"să evoce","imperative-second-person-singular":"evocă","imperative-plural-second-person":"evocați","imperative-negative-second-person-singular":"nu evoca","imperative-negative-plural-second-person":"nu evocați"}},{"word":"evocabil","pos":"adj","definitions":["evocable"],"forms":{"feminine-singular":"evocabilă","masculine-plural":"evocabili","feminine-neuter-plural":"evocabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evocabil","error-unrecognized-form-feminine-indefinite-singular":"evocabilă","error-unrecognized-form-indefinite-masculine-plural":"evocabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evocabile","definite-error-unrecognized-form-masculine-neuter-singular":"evocabilul","definite-error-unrecognized-form-feminine-singular":"evocabila","definite-error-unrecognized-form-masculine-plural":"evocabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evocabilele"}},{"word":"evocant","pos":"adj","definitions":["evocative"],"forms":{"feminine-singular":"evocantă","masculine-plural":"evocanți","feminine-neuter-plural":"evocante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evocant","error-unrecognized-form-feminine-indefinite-singular":"evocantă","error-unrecognized-form-indefinite-masculine-plural":"evocanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"evocante","definite-error-unrecognized-form-masculine-neuter-singular":"evocantul","definite-error-unrecognized-form-feminine-singular":"evocanta","definite-error-unrecognized-form-masculine-plural":"evocanții","definite-error-unrecognized-form-feminine-neuter-plural":"evocantele"}},{"word":"evocare","pos":"noun","definitions":["evocation"],"forms":{"plural":"evocări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evocare","accusative-definite-nominative-singular":"evocarea","accusative-indefinite-nominative-plural":"evocări","accusative-definite-nominative-plural":"evocările","dative-genitive-indefinite-singular":"evocări","dative-definite-genitive-singular":"evocării","dative-genitive-indefinite-plural":"evocări","dative-definite-genitive-plural":"evocărilor","singular-vocative":"evocare","plural-vocative":"evocărilor"}},{"word":"evocat","pos":"adj","definitions":["recalled"],"forms":{"feminine-singular":"evocată","masculine-plural":"evocați","feminine-neuter-plural":"evocate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evocat","error-unrecognized-form-feminine-indefinite-singular":"evocată","error-unrecognized-form-indefinite-masculine-plural":"evocați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evocate","definite-error-unrecognized-form-masculine-neuter-singular":"evocatul","definite-error-unrecognized-form-feminine-singular":"evocata","definite-error-unrecognized-form-masculine-plural":"evocații","definite-error-unrecognized-form-feminine-neuter-plural":"evocatele"}},{"word":"evocat","pos":"verb","definitions":["past participle of evoca"],"forms":{"participle-past":"of evoca"}},{"word":"evocație","pos":"noun","definitions":["evocation"],"forms":{"plural":"evocații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evocație","accusative-definite-nominative-singular":"evocația","accusative-indefinite-nominative-plural":"evocații","accusative-definite-nominative-plural":"evocațiile","dative-genitive-indefinite-singular":"evocații","dative-definite-genitive-singular":"evocației","dative-genitive-indefinite-plural":"evocații","dative-definite-genitive-plural":"evocațiilor","singular-vocative":"evocație","plural-vocative":"evocațiilor"}},{"word":"evocațiune","pos":"noun","definitions":["obsolete form of evocație"],"forms":{"plural":"evocațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evocațiune","accusative-definite-nominative-singular":"evocațiunea","accusative-indefinite-nominative-plural":"evocațiuni","accusative-definite-nominative-plural":"evocațiunile","dative-genitive-indefinite-singular":"evocațiuni","dative-definite-genitive-singular":"evocațiunii","dative-genitive-indefinite-plural":"evocațiuni","dative-definite-genitive-plural":"evocațiunilor","singular-vocative":"evocațiune","plural-vocative":"evocațiunilor"}},{"word":"evocativ","pos":"adj","definitions":["evocative"],"forms":{"feminine-singular":"evocativă","masculine-plural":"evocativi","feminine-neuter-plural":"evocative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evocativ","error-unrecognized-form-feminine-indefinite-singular":"evocativă","error-unrecognized-form-indefinite-masculine-plural":"evocativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"evocative","definite-error-unrecognized-form-masculine-neuter-singular":"evocativul","definite-error-unrecognized-form-feminine-singular":"evocativa","definite-error-unrecognized-form-masculine-plural":"evocativii","definite-error-unrecognized-form-feminine-neuter-plural":"evocativele"}},{"word":"evocator","pos":"adj","definitions":["evocative"],"forms":{"feminine-singular":"evocatoare","masculine-plural":"evocatori","feminine-neuter-plural":"evocatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evocator","error-unrecognized-form-feminine-indefinite-singular":"evocatoare","error-unrecognized-form-indefinite-masculine-plural":"evocatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"evocatoare","definite-error-unrecognized-form-masculine-neuter-singular":"evocatorul","definite-error-unrecognized-form-feminine-singular":"evocatoarea","definite-error-unrecognized-form-masculine-plural":"evocatorii","definite-error-unrecognized-form-feminine-neuter-plural":"evocatoarele"}},{"word":"evolua","pos":"verb","definitions":["to evolve"],"forms":{"canonical":"a evolua 1st conjugation","present-singular-third-person":"evoluează","participle-past":"evoluat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a evolua","gerund":"evoluând","first-person-indicative-present-singular":"evoluez","indicative-present-second-person-singular":"evoluezi","indicative-present-singular-third-person":"evoluează","first-person-indicative-plural-present":"evoluăm","indicative-plural-present-second-person":"evoluați","indicative-plural-present-third-person":"evoluează","first-person-imperfect-indicative-singular":"evoluam","imperfect-indicative-second-person-singular":"evoluai","imperfect-indicative-singular-third-person":"evolua","first-person-imperfect-indicative-plural":"evoluam","imperfect-indicative-plural-second-person":"evoluați","imperfect-indicative-plural-third-person":"evoluau","first-person-indicative-perfect-singular":"evoluai","indicative-perfect-second-person-singular":"evoluași","indicative-perfect-singular-third-person":"evoluă","first-person-indicative-perfect-plural":"evoluarăm","indicative-perfect-plural-second-person":"evoluarăți","indicative-perfect-plural-third-person":"evoluară","first-person-indicative-pluperfect-singular":"evoluasem","indicative-pluperfect-second-person-singular":"evoluaseși","indicative-pluperfect-singular-third-person":"evoluase","first-person-indicative-pluperfect-plural":"evoluaserăm","indicative-pluperfect-plural-second-person":"evoluaserăți","indicative-pluperfect-plural-third-person":"evoluaseră","first-person-present-singular-subjunctive":"să evoluez","present-second-person-singular-subjunctive":"să evoluezi","present-singular-subjunctive-third-person":"să evolueze","first-person-plural-present-subjunctive":"să evoluăm","plural-present-second-person-subjunctive":"să evoluați","plural-present-subjunctive-third-person":"să evolueze","imperative-second-person-singular":"evoluează","imperative-plural-second-person":"evoluați","imperative-negative-second-person-singular":"nu evolua","imperative-negative-plural-second-person":"nu evoluați"}},{"word":"evoluabil","pos":"adj","definitions":["evolvable"],"forms":{"feminine-singular":"evoluabilă","masculine-plural":"evoluabili","feminine-neuter-plural":"evoluabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evoluabil","error-unrecognized-form-feminine-indefinite-singular":"evoluabilă","error-unrecognized-form-indefinite-masculine-plural":"evoluabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"evoluabile","definite-error-unrecognized-form-masculine-neuter-singular":"evoluabilul","definite-error-unrecognized-form-feminine-singular":"evoluabila","definite-error-unrecognized-form-masculine-plural":"evoluabilii","definite-error-unrecognized-form-feminine-neuter-plural":"evoluabilele"}},{"word":"evoluam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of evolua"],"pronunciation":"[evoluˈam]"},{"word":"evoluare","pos":"noun","definitions":["evolving"],"forms":{"plural":"evoluări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evoluare","accusative-definite-nominative-singular":"evoluarea","accusative-indefinite-nominative-plural":"evoluări","accusative-definite-nominative-plural":"evoluările","dative-genitive-indefinite-singular":"evoluări","dative-definite-genitive-singular":"evoluării","dative-genitive-indefinite-plural":"evoluări","dative-definite-genitive-plural":"evoluărilor","singular-vocative":"evoluare","plural-vocative":"evoluărilor"}},{"word":"evoluat","pos":"adj","definitions":["advanced"],"forms":{"feminine-singular":"evoluată","masculine-plural":"evoluați","feminine-neuter-plural":"evoluate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evoluat","error-unrecognized-form-feminine-indefinite-singular":"evoluată","error-unrecognized-form-indefinite-masculine-plural":"evoluați","error-unrecognized-form-feminine-indefinite-neuter-plural":"evoluate","definite-error-unrecognized-form-masculine-neuter-singular":"evoluatul","definite-error-unrecognized-form-feminine-singular":"evoluata","definite-error-unrecognized-form-masculine-plural":"evoluații","definite-error-unrecognized-form-feminine-neuter-plural":"evoluatele"}},{"word":"evoluție","pos":"noun","definitions":["evolution"],"pronunciation":"[evoˈlut͡sie]","forms":{"canonical-feminine":"evolúție","plural":"evoluții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evoluție","accusative-definite-nominative-singular":"evoluția","accusative-indefinite-nominative-plural":"evoluții","accusative-definite-nominative-plural":"evoluțiile","dative-genitive-indefinite-singular":"evoluții","dative-definite-genitive-singular":"evoluției","dative-genitive-indefinite-plural":"evoluții","dative-definite-genitive-plural":"evoluțiilor","singular-vocative":"evoluție","plural-vocative":"evoluțiilor"}},{"word":"evoluționar","pos":"adj","definitions":["evolutionary"],"forms":{"feminine-singular":"evoluționară","masculine-plural":"evoluționari","feminine-neuter-plural":"evoluționare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evoluționar","error-unrecognized-form-feminine-indefinite-singular":"evoluționară","error-unrecognized-form-indefinite-masculine-plural":"evoluționari","error-unrecognized-form-feminine-indefinite-neuter-plural":"evoluționare","definite-error-unrecognized-form-masculine-neuter-singular":"evoluționarul","definite-error-unrecognized-form-feminine-singular":"evoluționara","definite-error-unrecognized-form-masculine-plural":"evoluționarii","definite-error-unrecognized-form-feminine-neuter-plural":"evoluționarele"}},{"word":"evoluționism","pos":"noun","definitions":["evolutionism"]},{"word":"evoluționist","pos":"noun","definitions":["evolutionist"],"forms":{"plural":"evoluționiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"evoluționist","accusative-definite-nominative-singular":"evoluționistul","accusative-indefinite-nominative-plural":"evoluționiști","accusative-definite-nominative-plural":"evoluționiștii","dative-genitive-indefinite-singular":"evoluționist","dative-definite-genitive-singular":"evoluționistului","dative-genitive-indefinite-plural":"evoluționiști","dative-definite-genitive-plural":"evoluționiștilor","singular-vocative":"evoluționistule","plural-vocative":"evoluționiștilor"}},{"word":"evoluționistă","pos":"noun","definitions":["female equivalent of evoluționist"],"forms":{"plural":"evoluționiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evoluționistă","accusative-definite-nominative-singular":"evoluționista","accusative-indefinite-nominative-plural":"evoluționiste","accusative-definite-nominative-plural":"evoluționistele","dative-genitive-indefinite-singular":"evoluționiste","dative-definite-genitive-singular":"evoluționistei","dative-genitive-indefinite-plural":"evoluționiste","dative-definite-genitive-plural":"evoluționistelor","singular-vocative":"evoluționistă","plural-vocative":"evoluționistelor"}},{"word":"evoluțiune","pos":"noun","definitions":["obsolete form of evoluție"],"forms":{"plural":"evoluțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evoluțiune","accusative-definite-nominative-singular":"evoluțiunea","accusative-indefinite-nominative-plural":"evoluțiuni","accusative-definite-nominative-plural":"evoluțiunile","dative-genitive-indefinite-singular":"evoluțiuni","dative-definite-genitive-singular":"evoluțiunii","dative-genitive-indefinite-plural":"evoluțiuni","dative-definite-genitive-plural":"evoluțiunilor","singular-vocative":"evoluțiune","plural-vocative":"evoluțiunilor"}},{"word":"evolutiv","pos":"adj","definitions":["progressive"],"forms":{"feminine-singular":"evolutivă","masculine-plural":"evolutivi","feminine-neuter-plural":"evolutive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evolutiv","error-unrecognized-form-feminine-indefinite-singular":"evolutivă","error-unrecognized-form-indefinite-masculine-plural":"evolutivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"evolutive","definite-error-unrecognized-form-masculine-neuter-singular":"evolutivul","definite-error-unrecognized-form-feminine-singular":"evolutiva","definite-error-unrecognized-form-masculine-plural":"evolutivii","definite-error-unrecognized-form-feminine-neuter-plural":"evolutivele"}},{"word":"evreiască","pos":"adj","definitions":["feminine singular of evreiesc"],"pronunciation":"/ˌevreˈjas.kə/"},{"word":"evreică","pos":"noun","definitions":["Jewish woman"],"pronunciation":"/eˈvrejkə/","forms":{"plural":"evreice","masculine":"equivalent evreu","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evreică","accusative-definite-nominative-singular":"evreica","accusative-indefinite-nominative-plural":"evreice","accusative-definite-nominative-plural":"evreicele","dative-genitive-indefinite-singular":"evreice","dative-definite-genitive-singular":"evreicei","dative-genitive-indefinite-plural":"evreice","dative-definite-genitive-plural":"evreicelor","singular-vocative":"evreică","plural-vocative":"evreicelor"}},{"word":"evreicuță","pos":"noun","definitions":["diminutive of evreică"],"forms":{"plural":"evreicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"evreicuță","accusative-definite-nominative-singular":"evreicuța","accusative-indefinite-nominative-plural":"evreicuțe","accusative-definite-nominative-plural":"evreicuțele","dative-genitive-indefinite-singular":"evreicuțe","dative-definite-genitive-singular":"evreicuței","dative-genitive-indefinite-plural":"evreicuțe","dative-definite-genitive-plural":"evreicuțelor","singular-vocative":"evreicuță","plural-vocative":"evreicuțelor"}},{"word":"evreiesc","pos":"adj","definitions":["Jewish, Hebrew"],"pronunciation":"/ˌevreˈjesk/","forms":{"feminine-singular":"evreiască","plural":"evreiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evreiesc","error-unrecognized-form-feminine-indefinite-singular":"evreiască","error-unrecognized-form-indefinite-masculine-plural":"evreiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"evreiești","definite-error-unrecognized-form-masculine-neuter-singular":"evreiescul","definite-error-unrecognized-form-feminine-singular":"evreiasca","definite-error-unrecognized-form-masculine-plural":"evreieștii","definite-error-unrecognized-form-feminine-neuter-plural":"evreieștile"}},{"word":"evreiește","pos":"adv","definitions":["Jewishly","in a language of the Jews, like Hebrew or Yiddish"]},{"word":"evreiești","pos":"adj","definitions":["plural of evreiesc"],"pronunciation":"/ˌevreˈjeʃtʲ/"},{"word":"evreime","pos":"noun","definitions":["Jewdom, Jewry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"evreime","accusative-definite-nominative":"evreimea","dative-genitive-indefinite":"evreimi","dative-definite-genitive":"evreimii","vocative":"evreime"}},{"word":"evreism","pos":"noun","definitions":["Judaism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"evreism","accusative-definite-nominative":"evreismul","dative-genitive-indefinite":"evreism","dative-definite-genitive":"evreismului","vocative":"evreismule"}},{"word":"evreu","pos":"noun","definitions":["a Jew, Hebrew"],"pronunciation":"/eˈvre̯u/","forms":{"plural":"evrei","feminine":"equivalent evreică","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"evreu","accusative-definite-nominative-singular":"evreul","accusative-indefinite-nominative-plural":"evrei","accusative-definite-nominative-plural":"evreii","dative-genitive-indefinite-singular":"evreu","dative-definite-genitive-singular":"evreului","dative-genitive-indefinite-plural":"evrei","dative-definite-genitive-plural":"evreilor","singular-vocative":"evreule","plural-vocative":"evreilor","alternative":"ebreu"}},{"word":"evrica","pos":"intj","definitions":["eureka"]},{"word":"evropaicesc","pos":"adj","definitions":["European"],"forms":{"feminine-singular":"evropaicească","plural":"evropaicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"evropaicesc","error-unrecognized-form-feminine-indefinite-singular":"evropaicească","error-unrecognized-form-indefinite-masculine-plural":"evropaicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"evropaicești","definite-error-unrecognized-form-masculine-neuter-singular":"evropaicescul","definite-error-unrecognized-form-feminine-singular":"evropaiceasca","definite-error-unrecognized-form-masculine-plural":"evropaiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"evropaiceștile"}},{"word":"evsevie","pos":"noun","definitions":["piety"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"evsevie","accusative-definite-nominative":"evsevia","dative-genitive-indefinite":"evsevii","dative-definite-genitive":"evseviei","vocative":"evsevie"}},{"word":"Evul Mediu","pos":"name","definitions":["Middle Ages"]},{"word":"evulsie","pos":"noun","definitions":["alternative form of evulsiune"],"forms":{"plural":"evulsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"evulsie","accusative-definite-nominative-singular":"evulsia","accusative-indefinite-nominative-plural":"evulsii","accusative-definite-nominative-plural":"evulsiile","dative-genitive-indefinite-singular":"evulsii","dative-definite-genitive-singular":"evulsiei","dative-genitive-indefinite-plural":"evulsii","dative-definite-genitive-plural":"evulsiilor","singular-vocative":"evulsie","plural-vocative":"evulsiilor"}},{"word":"evulsiune","pos":"noun","definitions":["eviction"],"forms":{"plural":"evulsiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"evulsiune","accusative-definite-nominative-singular":"evulsiunea","accusative-indefinite-nominative-plural":"evulsiuni","accusative-definite-nominative-plural":"evulsiunile","dative-genitive-indefinite-singular":"evulsiuni","dative-definite-genitive-singular":"evulsiunii","dative-genitive-indefinite-plural":"evulsiuni","dative-definite-genitive-plural":"evulsiunilor","singular-vocative":"evulsiune","plural-vocative":"evulsiunilor"}},{"word":"ex-campioană","pos":"noun","definitions":["female equivalent of ex-campion"],"forms":{"plural":"ex-campioane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ex-campioană","accusative-definite-nominative-singular":"ex-campioana","accusative-indefinite-nominative-plural":"ex-campioane","accusative-definite-nominative-plural":"ex-campioanele","dative-genitive-indefinite-singular":"ex-campioane","dative-definite-genitive-singular":"ex-campioanei","dative-genitive-indefinite-plural":"ex-campioane","dative-definite-genitive-plural":"ex-campioanelor","singular-vocative":"ex-campioană","plural-vocative":"ex-campioanelor"}},{"word":"ex-campion","pos":"noun","definitions":["former champion"],"forms":{"plural":"ex-campioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ex-campion","accusative-definite-nominative-singular":"ex-campionul","accusative-indefinite-nominative-plural":"ex-campioni","accusative-definite-nominative-plural":"ex-campionii","dative-genitive-indefinite-singular":"ex-campion","dative-definite-genitive-singular":"ex-campionului","dative-genitive-indefinite-plural":"ex-campioni","dative-definite-genitive-plural":"ex-campionilor","singular-vocative":"ex-campionule","plural-vocative":"ex-campionilor"}},{"word":"ex-comunist","pos":"adj","definitions":["former communist"],"forms":{"feminine-singular":"ex-comunistă","masculine-plural":"ex-comuniști","feminine-neuter-plural":"ex-comuniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ex-comunist","error-unrecognized-form-feminine-indefinite-singular":"ex-comunistă","error-unrecognized-form-indefinite-masculine-plural":"ex-comuniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"ex-comuniste","definite-error-unrecognized-form-masculine-neuter-singular":"ex-comunistul","definite-error-unrecognized-form-feminine-singular":"ex-comunista","definite-error-unrecognized-form-masculine-plural":"ex-comuniștii","definite-error-unrecognized-form-feminine-neuter-plural":"ex-comunistele"}},{"word":"ex-libris","pos":"noun","definitions":["ex libris"],"forms":{"plural":"ex-librisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ex-libris","accusative-definite-nominative-singular":"ex-librisul","accusative-indefinite-nominative-plural":"ex-librisuri","accusative-definite-nominative-plural":"ex-librisurile","dative-genitive-indefinite-singular":"ex-libris","dative-definite-genitive-singular":"ex-librisului","dative-genitive-indefinite-plural":"ex-librisuri","dative-definite-genitive-plural":"ex-librisurilor","singular-vocative":"ex-librisule","plural-vocative":"ex-librisurilor"}},{"word":"ex-ministru","pos":"noun","definitions":["former minister"],"forms":{"plural":"ex-miniștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ex-ministru","accusative-definite-nominative-singular":"ex-ministrul","accusative-indefinite-nominative-plural":"ex-miniștri","accusative-definite-nominative-plural":"ex-miniștrii","dative-genitive-indefinite-singular":"ex-ministru","dative-definite-genitive-singular":"ex-ministrului","dative-genitive-indefinite-plural":"ex-miniștri","dative-definite-genitive-plural":"ex-miniștrilor","singular-vocative":"ex-ministrule","plural-vocative":"ex-miniștrilor"}},{"word":"ex-președinte","pos":"noun","definitions":["ex-president"],"forms":{"plural":"ex-președinți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ex-președinte","accusative-definite-nominative-singular":"ex-președinteul","accusative-indefinite-nominative-plural":"ex-președinți","accusative-definite-nominative-plural":"ex-președinții","dative-genitive-indefinite-singular":"ex-președinte","dative-definite-genitive-singular":"ex-președinteului","dative-genitive-indefinite-plural":"ex-președinți","dative-definite-genitive-plural":"ex-președinților","singular-vocative":"ex-președinteule","plural-vocative":"ex-președinților"}},{"word":"exacerba","pos":"verb","definitions":["to exacerbate"],"pronunciation":"/eɡ.za.t͡ʃerˈba/","forms":{"canonical":"a exacerba 1st conjugation","present-singular-third-person":"exacerbează","participle-past":"exacerbat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exacerba","gerund":"exacerbând","first-person-indicative-present-singular":"exacerbez","indicative-present-second-person-singular":"exacerbezi","indicative-present-singular-third-person":"exacerbează","first-person-indicative-plural-present":"exacerbăm","indicative-plural-present-second-person":"exacerbați","indicative-plural-present-third-person":"exacerbează","first-person-imperfect-indicative-singular":"exacerbam","imperfect-indicative-second-person-singular":"exacerbai","imperfect-indicative-singular-third-person":"exacerba","first-person-imperfect-indicative-plural":"exacerbam","imperfect-indicative-plural-second-person":"exacerbați","imperfect-indicative-plural-third-person":"exacerbau","first-person-indicative-perfect-singular":"exacerbai","indicative-perfect-second-person-singular":"exacerbași","indicative-perfect-singular-third-person":"exacerbă","first-person-indicative-perfect-plural":"exacerbarăm","indicative-perfect-plural-second-person":"exacerbarăți","indicative-perfect-plural-third-person":"exacerbară","first-person-indicative-pluperfect-singular":"exacerbasem","indicative-pluperfect-second-person-singular":"exacerbaseși","indicative-pluperfect-singular-third-person":"exacerbase","first-person-indicative-pluperfect-plural":"exacerbaserăm","indicative-pluperfect-plural-second-person":"exacerbaserăți","indicative-pluperfect-plural-third-person":"exacerbaseră","first-person-present-singular-subjunctive":"să exacerbez","present-second-person-singular-subjunctive":"să exacerbezi","present-singular-subjunctive-third-person":"să exacerbeze","first-person-plural-present-subjunctive":"să exacerbăm","plural-present-second-person-subjunctive":"să exacerbați","plural-present-subjunctive-third-person":"să exacerbeze","imperative-second-person-singular":"exacerbează","imperative-plural-second-person":"exacerbați","imperative-negative-second-person-singular":"nu exacerba","imperative-negative-plural-second-person":"nu exacerbați"}},{"word":"exacerbare","pos":"noun","definitions":["exacerbation"],"forms":{"plural":"exacerbări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exacerbare","accusative-definite-nominative-singular":"exacerbarea","accusative-indefinite-nominative-plural":"exacerbări","accusative-definite-nominative-plural":"exacerbările","dative-genitive-indefinite-singular":"exacerbări","dative-definite-genitive-singular":"exacerbării","dative-genitive-indefinite-plural":"exacerbări","dative-definite-genitive-plural":"exacerbărilor","singular-vocative":"exacerbare","plural-vocative":"exacerbărilor"}},{"word":"exacerbat","pos":"adj","definitions":["exacerbated"],"forms":{"feminine-singular":"exacerbată","masculine-plural":"exacerbați","feminine-neuter-plural":"exacerbate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exacerbat","error-unrecognized-form-feminine-indefinite-singular":"exacerbată","error-unrecognized-form-indefinite-masculine-plural":"exacerbați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exacerbate","definite-error-unrecognized-form-masculine-neuter-singular":"exacerbatul","definite-error-unrecognized-form-feminine-singular":"exacerbata","definite-error-unrecognized-form-masculine-plural":"exacerbații","definite-error-unrecognized-form-feminine-neuter-plural":"exacerbatele"}},{"word":"exacerbat","pos":"verb","definitions":["past participle of exacerba"],"forms":{"participle-past":"of exacerba"}},{"word":"exacerbație","pos":"noun","definitions":["exacerbation"],"forms":{"plural":"exacerbații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exacerbație","accusative-definite-nominative-singular":"exacerbația","accusative-indefinite-nominative-plural":"exacerbații","accusative-definite-nominative-plural":"exacerbațiile","dative-genitive-indefinite-singular":"exacerbații","dative-definite-genitive-singular":"exacerbației","dative-genitive-indefinite-plural":"exacerbații","dative-definite-genitive-plural":"exacerbațiilor","singular-vocative":"exacerbație","plural-vocative":"exacerbațiilor"}},{"word":"exacerbațiune","pos":"noun","definitions":["obsolete form of exacerbație"],"forms":{"plural":"exacerbațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exacerbațiune","accusative-definite-nominative-singular":"exacerbațiunea","accusative-indefinite-nominative-plural":"exacerbațiuni","accusative-definite-nominative-plural":"exacerbațiunile","dative-genitive-indefinite-singular":"exacerbațiuni","dative-definite-genitive-singular":"exacerbațiunii","dative-genitive-indefinite-plural":"exacerbațiuni","dative-definite-genitive-plural":"exacerbațiunilor","singular-vocative":"exacerbațiune","plural-vocative":"exacerbațiunilor"}},{"word":"exact","pos":"adj","definitions":["exact, precise"],"pronunciation":"/eɡˈzakt/","forms":{"feminine-singular":"exactă","masculine-plural":"exacți","feminine-neuter-plural":"exacte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exact","error-unrecognized-form-feminine-indefinite-singular":"exactă","error-unrecognized-form-indefinite-masculine-plural":"exacți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exacte","definite-error-unrecognized-form-masculine-neuter-singular":"exactul","definite-error-unrecognized-form-feminine-singular":"exacta","definite-error-unrecognized-form-masculine-plural":"exacții","definite-error-unrecognized-form-feminine-neuter-plural":"exactele"}},{"word":"exact","pos":"adv","definitions":["exactly, precisely"],"pronunciation":"/eɡˈzakt/"},{"word":"exactemente","pos":"adv","definitions":["exactly"]},{"word":"exactitate","pos":"noun","definitions":["accuracy"],"forms":{"plural":"exactități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exactitate","accusative-definite-nominative-singular":"exactitatea","accusative-indefinite-nominative-plural":"exactități","accusative-definite-nominative-plural":"exactitățile","dative-genitive-indefinite-singular":"exactități","dative-definite-genitive-singular":"exactității","dative-genitive-indefinite-plural":"exactități","dative-definite-genitive-plural":"exactităților","singular-vocative":"exactitate","plural-vocative":"exactităților"}},{"word":"exactitudine","pos":"noun","definitions":["exactitude, accuracy"],"forms":{"plural":"exactitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exactitudine","accusative-definite-nominative-singular":"exactitudinea","accusative-indefinite-nominative-plural":"exactitudini","accusative-definite-nominative-plural":"exactitudinile","dative-genitive-indefinite-singular":"exactitudini","dative-definite-genitive-singular":"exactitudinii","dative-genitive-indefinite-plural":"exactitudini","dative-definite-genitive-plural":"exactitudinilor","singular-vocative":"exactitudine","plural-vocative":"exactitudinilor"}},{"word":"exaedru","pos":"noun","definitions":["alternative form of hexaedru"],"forms":{"plural":"exaedre"}},{"word":"exagera","pos":"verb","definitions":["to exaggerate"],"forms":{"canonical":"a exagera 1st conjugation","present-singular-third-person":"exagerează","participle-past":"exagerat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exagera","gerund":"exagerând","first-person-indicative-present-singular":"exagerez","indicative-present-second-person-singular":"exagerezi","indicative-present-singular-third-person":"exagerează","first-person-indicative-plural-present":"exagerăm","indicative-plural-present-second-person":"exagerați","indicative-plural-present-third-person":"exagerează","first-person-imperfect-indicative-singular":"exageram","imperfect-indicative-second-person-singular":"exagerai","imperfect-indicative-singular-third-person":"exagera","first-person-imperfect-indicative-plural":"exageram","imperfect-indicative-plural-second-person":"exagerați","imperfect-indicative-plural-third-person":"exagerau","first-person-indicative-perfect-singular":"exagerai","indicative-perfect-second-person-singular":"exagerași","indicative-perfect-singular-third-person":"exageră","first-person-indicative-perfect-plural":"exagerarăm","indicative-perfect-plural-second-person":"exagerarăți","indicative-perfect-plural-third-person":"exagerară","first-person-indicative-pluperfect-singular":"exagerasem","indicative-pluperfect-second-person-singular":"exageraseși","indicative-pluperfect-singular-third-person":"exagerase","first-person-indicative-pluperfect-plural":"exageraserăm","indicative-pluperfect-plural-second-person":"exageraserăți","indicative-pluperfect-plural-third-person":"exageraseră","first-person-present-singular-subjunctive":"să exagerez","present-second-person-singular-subjunctive":"să exagerezi","present-singular-subjunctive-third-person":"să exagereze","first-person-plural-present-subjunctive":"să exagerăm","plural-present-second-person-subjunctive":"să exagerați","plural-present-subjunctive-third-person":"să exagereze","imperative-second-person-singular":"exagerează","imperative-plural-second-person":"exagerați","imperative-negative-second-person-singular":"nu exagera","imperative-negative-plural-second-person":"nu exagerați"}},{"word":"exagerai","pos":"verb","definitions":["inflection of exagera:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eksad͡ʒeˈraj]"},{"word":"exageram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exagera"],"pronunciation":"[eksad͡ʒeˈram]"},{"word":"exagerare","pos":"noun","definitions":["exaggeration"],"forms":{"plural":"exagerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exagerare","accusative-definite-nominative-singular":"exagerarea","accusative-indefinite-nominative-plural":"exagerări","accusative-definite-nominative-plural":"exagerările","dative-genitive-indefinite-singular":"exagerări","dative-definite-genitive-singular":"exagerării","dative-genitive-indefinite-plural":"exagerări","dative-definite-genitive-plural":"exagerărilor","singular-vocative":"exagerare","plural-vocative":"exagerărilor"}},{"word":"exagerase","pos":"verb","definitions":["third-person singular pluperfect indicative of exagera"],"pronunciation":"[eksad͡ʒeˈrase]"},{"word":"exagerat","pos":"adj","definitions":["exaggerated","excessive, abusive","too, extremely, very"],"pronunciation":"/ˌek.sa.d͡ʒeˈrat/","forms":{"feminine-singular":"exagerată","masculine-plural":"exagerați","feminine-neuter-plural":"exagerate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"exagerat","error-unrecognized-form-feminine-indefinite-singular":"exagerată","error-unrecognized-form-indefinite-masculine-plural":"exagerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exagerate","definite-error-unrecognized-form-masculine-neuter-singular":"exageratul","definite-error-unrecognized-form-feminine-singular":"exagerata","definite-error-unrecognized-form-masculine-plural":"exagerații","definite-error-unrecognized-form-feminine-neuter-plural":"exageratele"}},{"word":"exagerat","pos":"verb","definitions":["past participle of exagera"],"pronunciation":"/ˌek.sa.d͡ʒeˈrat/"},{"word":"exagerație","pos":"noun","definitions":["exaggeration"],"pronunciation":"/eksad͡ʒeˈrat͡si.e/","forms":{"plural":"exagerații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exagerație","accusative-definite-nominative-singular":"exagerația","accusative-indefinite-nominative-plural":"exagerații","accusative-definite-nominative-plural":"exagerațiile","dative-genitive-indefinite-singular":"exagerații","dative-definite-genitive-singular":"exagerației","dative-genitive-indefinite-plural":"exagerații","dative-definite-genitive-plural":"exagerațiilor","singular-vocative":"exagerație","plural-vocative":"exagerațiilor"}},{"word":"exagerațiune","pos":"noun","definitions":["obsolete form of exagerație"],"forms":{"plural":"exagerațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exagerațiune","accusative-definite-nominative-singular":"exagerațiunea","accusative-indefinite-nominative-plural":"exagerațiuni","accusative-definite-nominative-plural":"exagerațiunile","dative-genitive-indefinite-singular":"exagerațiuni","dative-definite-genitive-singular":"exagerațiunii","dative-genitive-indefinite-plural":"exagerațiuni","dative-definite-genitive-plural":"exagerațiunilor","singular-vocative":"exagerațiune","plural-vocative":"exagerațiunilor"}},{"word":"exagoane","pos":"noun","definitions":["plural of exagon"]},{"word":"exagon","pos":"noun","definitions":["alternative form of hexagon"],"forms":{"plural":"exagoane"}},{"word":"exala","pos":"verb","definitions":["to exhale"],"forms":{"canonical":"a exala 1st conjugation","present-singular-third-person":"exală","participle-past":"exalat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exala","gerund":"exalând","first-person-indicative-present-singular":"exal","indicative-present-second-person-singular":"exali","indicative-present-singular-third-person":"exală","first-person-indicative-plural-present":"exalăm","indicative-plural-present-second-person":"exalați","indicative-plural-present-third-person":"exală","first-person-imperfect-indicative-singular":"exalam","imperfect-indicative-second-person-singular":"exalai","imperfect-indicative-singular-third-person":"exala","first-person-imperfect-indicative-plural":"exalam","imperfect-indicative-plural-second-person":"exalați","imperfect-indicative-plural-third-person":"exalau","first-person-indicative-perfect-singular":"exalai","indicative-perfect-second-person-singular":"exalași","indicative-perfect-singular-third-person":"exală","first-person-indicative-perfect-plural":"exalarăm","indicative-perfect-plural-second-person":"exalarăți","indicative-perfect-plural-third-person":"exalară","first-person-indicative-pluperfect-singular":"exalasem","indicative-pluperfect-second-person-singular":"exalaseși","indicative-pluperfect-singular-third-person":"exalase","first-person-indicative-pluperfect-plural":"exalaserăm","indicative-pluperfect-plural-second-person":"exalaserăți","indicative-pluperfect-plural-third-person":"exalaseră","first-person-present-singular-subjunctive":"să exal","present-second-person-singular-subjunctive":"să exali","present-singular-subjunctive-third-person":"să exale","first-person-plural-present-subjunctive":"să exalăm","plural-present-second-person-subjunctive":"să exalați","plural-present-subjunctive-third-person":"să exale","imperative-second-person-singular":"exală","imperative-plural-second-person":"exalați","imperative-negative-second-person-singular":"nu exala","imperative-negative-plural-second-person":"nu exalați"}},{"word":"exalare","pos":"noun","definitions":["exhalation"],"forms":{"plural":"exalări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exalare","accusative-definite-nominative-singular":"exalarea","accusative-indefinite-nominative-plural":"exalări","accusative-definite-nominative-plural":"exalările","dative-genitive-indefinite-singular":"exalări","dative-definite-genitive-singular":"exalării","dative-genitive-indefinite-plural":"exalări","dative-definite-genitive-plural":"exalărilor","singular-vocative":"exalare","plural-vocative":"exalărilor"}},{"word":"exalație","pos":"noun","definitions":["exhalation"],"forms":{"plural":"exalații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exalație","accusative-definite-nominative-singular":"exalația","accusative-indefinite-nominative-plural":"exalații","accusative-definite-nominative-plural":"exalațiile","dative-genitive-indefinite-singular":"exalații","dative-definite-genitive-singular":"exalației","dative-genitive-indefinite-plural":"exalații","dative-definite-genitive-plural":"exalațiilor","singular-vocative":"exalație","plural-vocative":"exalațiilor"}},{"word":"exalațiune","pos":"noun","definitions":["obsolete form of exalație"],"forms":{"plural":"exalațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exalațiune","accusative-definite-nominative-singular":"exalațiunea","accusative-indefinite-nominative-plural":"exalațiuni","accusative-definite-nominative-plural":"exalațiunile","dative-genitive-indefinite-singular":"exalațiuni","dative-definite-genitive-singular":"exalațiunii","dative-genitive-indefinite-plural":"exalațiuni","dative-definite-genitive-plural":"exalațiunilor","singular-vocative":"exalațiune","plural-vocative":"exalațiunilor"}},{"word":"exalgină","pos":"noun","definitions":["exalgin"],"forms":{"plural":"exalgine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exalgină","accusative-definite-nominative-singular":"exalginăul","accusative-indefinite-nominative-plural":"exalgine","accusative-definite-nominative-plural":"exalginele","dative-genitive-indefinite-singular":"exalgină","dative-definite-genitive-singular":"exalginăului","dative-genitive-indefinite-plural":"exalgine","dative-definite-genitive-plural":"exalginelor","singular-vocative":"exalginăule","plural-vocative":"exalginelor"}},{"word":"exalta","pos":"verb","definitions":["to exalt"],"forms":{"canonical":"a exalta 1st conjugation","present-singular-third-person":"exaltă","participle-past":"exaltat","subjunctive-third-person":"exalte","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exalta","gerund":"exaltând","first-person-indicative-present-singular":"exalt","indicative-present-second-person-singular":"exalți","indicative-present-singular-third-person":"exaltă","first-person-indicative-plural-present":"exaltăm","indicative-plural-present-second-person":"exaltați","indicative-plural-present-third-person":"exaltă","first-person-imperfect-indicative-singular":"exaltam","imperfect-indicative-second-person-singular":"exaltai","imperfect-indicative-singular-third-person":"exalta","first-person-imperfect-indicative-plural":"exaltam","imperfect-indicative-plural-second-person":"exaltați","imperfect-indicative-plural-third-person":"exaltau","first-person-indicative-perfect-singular":"exaltai","indicative-perfect-second-person-singular":"exaltași","indicative-perfect-singular-third-person":"exaltă","first-person-indicative-perfect-plural":"exaltarăm","indicative-perfect-plural-second-person":"exaltarăți","indicative-perfect-plural-third-person":"exaltară","first-person-indicative-pluperfect-singular":"exaltasem","indicative-pluperfect-second-person-singular":"exaltaseși","indicative-pluperfect-singular-third-person":"exaltase","first-person-indicative-pluperfect-plural":"exaltaserăm","indicative-pluperfect-plural-second-person":"exaltaserăți","indicative-pluperfect-plural-third-person":"exaltaseră","first-person-present-singular-subjunctive":"să exalt","present-second-person-singular-subjunctive":"să exalți","present-singular-subjunctive-third-person":"să exalte","first-person-plural-present-subjunctive":"să exaltăm","plural-present-second-person-subjunctive":"să exaltați","plural-present-subjunctive-third-person":"să exalte","imperative-second-person-singular":"exaltă","imperative-plural-second-person":"exaltați","imperative-negative-second-person-singular":"nu exalta","imperative-negative-plural-second-person":"nu exaltați"}},{"word":"exaltare","pos":"noun","definitions":["exaltation"],"forms":{"plural":"exaltări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exaltare","accusative-definite-nominative-singular":"exaltarea","accusative-indefinite-nominative-plural":"exaltări","accusative-definite-nominative-plural":"exaltările","dative-genitive-indefinite-singular":"exaltări","dative-definite-genitive-singular":"exaltării","dative-genitive-indefinite-plural":"exaltări","dative-definite-genitive-plural":"exaltărilor","singular-vocative":"exaltare","plural-vocative":"exaltărilor"}},{"word":"exaltat","pos":"adj","definitions":["exalted"],"forms":{"feminine-singular":"exaltată","masculine-plural":"exaltați","feminine-neuter-plural":"exaltate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exaltat","error-unrecognized-form-feminine-indefinite-singular":"exaltată","error-unrecognized-form-indefinite-masculine-plural":"exaltați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exaltate","definite-error-unrecognized-form-masculine-neuter-singular":"exaltatul","definite-error-unrecognized-form-feminine-singular":"exaltata","definite-error-unrecognized-form-masculine-plural":"exaltații","definite-error-unrecognized-form-feminine-neuter-plural":"exaltatele"}},{"word":"exaltat","pos":"verb","definitions":["past participle of exalta"],"forms":{"participle-past":"of exalta"}},{"word":"exaltație","pos":"noun","definitions":["exaltation"],"forms":{"plural":"exaltații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exaltație","accusative-definite-nominative-singular":"exaltația","accusative-indefinite-nominative-plural":"exaltații","accusative-definite-nominative-plural":"exaltațiile","dative-genitive-indefinite-singular":"exaltații","dative-definite-genitive-singular":"exaltației","dative-genitive-indefinite-plural":"exaltații","dative-definite-genitive-plural":"exaltațiilor","singular-vocative":"exaltație","plural-vocative":"exaltațiilor"}},{"word":"exaltațiune","pos":"noun","definitions":["obsolete form of exaltație"],"forms":{"plural":"exaltațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exaltațiune","accusative-definite-nominative-singular":"exaltațiunea","accusative-indefinite-nominative-plural":"exaltațiuni","accusative-definite-nominative-plural":"exaltațiunile","dative-genitive-indefinite-singular":"exaltațiuni","dative-definite-genitive-singular":"exaltațiunii","dative-genitive-indefinite-plural":"exaltațiuni","dative-definite-genitive-plural":"exaltațiunilor","singular-vocative":"exaltațiune","plural-vocative":"exaltațiunilor"}},{"word":"exaltățiune","pos":"noun","definitions":["obsolete form of exaltație"],"forms":{"plural":"exaltățiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exaltățiune","accusative-definite-nominative-singular":"exaltățiunea","accusative-indefinite-nominative-plural":"exaltățiuni","accusative-definite-nominative-plural":"exaltățiunile","dative-genitive-indefinite-singular":"exaltățiuni","dative-definite-genitive-singular":"exaltățiunii","dative-genitive-indefinite-plural":"exaltățiuni","dative-definite-genitive-plural":"exaltățiunilor","singular-vocative":"exaltățiune","plural-vocative":"exaltățiunilor"}},{"word":"examen","pos":"noun","definitions":["exam, examination, test"],"pronunciation":"[eɡˈza.men]","forms":{"plural":"examene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"examen","accusative-definite-nominative-singular":"examenul","accusative-indefinite-nominative-plural":"examene","accusative-definite-nominative-plural":"examenele","dative-genitive-indefinite-singular":"examen","dative-definite-genitive-singular":"examenului","dative-genitive-indefinite-plural":"examene","dative-definite-genitive-plural":"examenelor","singular-vocative":"examenule","plural-vocative":"examenelor"}},{"word":"examen clinic","pos":"noun","definitions":["physical examination"],"forms":{"plural":"examene clinice"}},{"word":"examen de admitere","pos":"noun","definitions":["entrance examination"],"forms":{"plural":"examene de admitere"}},{"word":"examen fizic","pos":"noun","definitions":["physical examination"],"forms":{"plural":"examene fizice"}},{"word":"examene","pos":"noun","definitions":["plural of examen"]},{"word":"examenuire","pos":"noun","definitions":["examination"],"forms":{"plural":"examenuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"examenuire","accusative-definite-nominative-singular":"examenuirea","accusative-indefinite-nominative-plural":"examenuiri","accusative-definite-nominative-plural":"examenuirile","dative-genitive-indefinite-singular":"examenuiri","dative-definite-genitive-singular":"examenuirii","dative-genitive-indefinite-plural":"examenuiri","dative-definite-genitive-plural":"examenuirilor","singular-vocative":"examenuire","plural-vocative":"examenuirilor"}},{"word":"examenuit","pos":"adj","definitions":["examined"],"forms":{"feminine-singular":"examenuită","masculine-plural":"examenuiți","feminine-neuter-plural":"examenuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"examenuit","error-unrecognized-form-feminine-indefinite-singular":"examenuită","error-unrecognized-form-indefinite-masculine-plural":"examenuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"examenuite","definite-error-unrecognized-form-masculine-neuter-singular":"examenuitul","definite-error-unrecognized-form-feminine-singular":"examenuita","definite-error-unrecognized-form-masculine-plural":"examenuiții","definite-error-unrecognized-form-feminine-neuter-plural":"examenuitele"}},{"word":"examenuit","pos":"verb","definitions":["past participle of examenui"],"forms":{"participle-past":"of examenui"}},{"word":"exametru","pos":"noun","definitions":["alternative form of hexametru"],"forms":{"plural":"exametri"}},{"word":"examina","pos":"verb","definitions":["to examine"],"forms":{"canonical":"a examina 1st conjugation","present-singular-third-person":"examinez","participle-past":"examinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a examina","gerund":"examinând","first-person-indicative-present-singular":"examinez","indicative-present-second-person-singular":"examinezi","indicative-present-singular-third-person":"examinează","first-person-indicative-plural-present":"examinăm","indicative-plural-present-second-person":"examinați","indicative-plural-present-third-person":"examinează","first-person-imperfect-indicative-singular":"examinam","imperfect-indicative-second-person-singular":"examinai","imperfect-indicative-singular-third-person":"examina","first-person-imperfect-indicative-plural":"examinam","imperfect-indicative-plural-second-person":"examinați","imperfect-indicative-plural-third-person":"examinau","first-person-indicative-perfect-singular":"examinai","indicative-perfect-second-person-singular":"examinași","indicative-perfect-singular-third-person":"examină","first-person-indicative-perfect-plural":"examinarăm","indicative-perfect-plural-second-person":"examinarăți","indicative-perfect-plural-third-person":"examinară","first-person-indicative-pluperfect-singular":"examinasem","indicative-pluperfect-second-person-singular":"examinaseși","indicative-pluperfect-singular-third-person":"examinase","first-person-indicative-pluperfect-plural":"examinaserăm","indicative-pluperfect-plural-second-person":"examinaserăți","indicative-pluperfect-plural-third-person":"examinaseră","first-person-present-singular-subjunctive":"să examinez","present-second-person-singular-subjunctive":"să examinezi","present-singular-subjunctive-third-person":"să examineze","first-person-plural-present-subjunctive":"să examinăm","plural-present-second-person-subjunctive":"să examinați","plural-present-subjunctive-third-person":"să examineze","imperative-second-person-singular":"examinează","imperative-plural-second-person":"examinați","imperative-negative-second-person-singular":"nu examina","imperative-negative-plural-second-person":"nu examinați"}},{"word":"examinăluire","pos":"noun","definitions":["examination"],"forms":{"plural":"examinăluiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"examinăluire","accusative-definite-nominative-singular":"examinăluirea","accusative-indefinite-nominative-plural":"examinăluiri","accusative-definite-nominative-plural":"examinăluirile","dative-genitive-indefinite-singular":"examinăluiri","dative-definite-genitive-singular":"examinăluirii","dative-genitive-indefinite-plural":"examinăluiri","dative-definite-genitive-plural":"examinăluirilor","singular-vocative":"examinăluire","plural-vocative":"examinăluirilor"}},{"word":"examinăluit","pos":"adj","definitions":["examined"],"forms":{"feminine-singular":"examinăluită","masculine-plural":"examinăluiți","feminine-neuter-plural":"examinăluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"examinăluit","error-unrecognized-form-feminine-indefinite-singular":"examinăluită","error-unrecognized-form-indefinite-masculine-plural":"examinăluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"examinăluite","definite-error-unrecognized-form-masculine-neuter-singular":"examinăluitul","definite-error-unrecognized-form-feminine-singular":"examinăluita","definite-error-unrecognized-form-masculine-plural":"examinăluiții","definite-error-unrecognized-form-feminine-neuter-plural":"examinăluitele"}},{"word":"examinăluit","pos":"verb","definitions":["past participle of examinălui"],"forms":{"participle-past":"of examinălui"}},{"word":"examinare","pos":"noun","definitions":["examination"],"forms":{"plural":"examinări"}},{"word":"examinat","pos":"adj","definitions":["examined"],"forms":{"feminine-singular":"examinată","masculine-plural":"examinați","feminine-neuter-plural":"examinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"examinat","error-unrecognized-form-feminine-indefinite-singular":"examinată","error-unrecognized-form-indefinite-masculine-plural":"examinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"examinate","definite-error-unrecognized-form-masculine-neuter-singular":"examinatul","definite-error-unrecognized-form-feminine-singular":"examinata","definite-error-unrecognized-form-masculine-plural":"examinații","definite-error-unrecognized-form-feminine-neuter-plural":"examinatele"}},{"word":"examinat","pos":"verb","definitions":["past participle of examina"],"forms":{"participle-past":"of examina"}},{"word":"examinație","pos":"noun","definitions":["examination"],"forms":{"plural":"examinații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"examinație","accusative-definite-nominative-singular":"examinația","accusative-indefinite-nominative-plural":"examinații","accusative-definite-nominative-plural":"examinațiile","dative-genitive-indefinite-singular":"examinații","dative-definite-genitive-singular":"examinației","dative-genitive-indefinite-plural":"examinații","dative-definite-genitive-plural":"examinațiilor","singular-vocative":"examinație","plural-vocative":"examinațiilor"}},{"word":"examinatoare","pos":"noun","definitions":["female equivalent of examinator"],"forms":{"plural":"examinatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"examinatoare","accusative-definite-nominative-singular":"examinatoarea","accusative-indefinite-nominative-plural":"examinatoare","accusative-definite-nominative-plural":"examinatoarele","dative-genitive-indefinite-singular":"examinatoare","dative-definite-genitive-singular":"examinatoarei","dative-genitive-indefinite-plural":"examinatoare","dative-definite-genitive-plural":"examinatoarelor","singular-vocative":"examinatoare","plural-vocative":"examinatoarelor"}},{"word":"examinator","pos":"noun","definitions":["examiner"],"forms":{"plural":"examinatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"examinator","accusative-definite-nominative-singular":"examinatorul","accusative-indefinite-nominative-plural":"examinatori","accusative-definite-nominative-plural":"examinatorii","dative-genitive-indefinite-singular":"examinator","dative-definite-genitive-singular":"examinatorului","dative-genitive-indefinite-plural":"examinatori","dative-definite-genitive-plural":"examinatorilor","singular-vocative":"examinatorule","plural-vocative":"examinatorilor"}},{"word":"exanol","pos":"noun","definitions":["hexanol"],"forms":{"plural":"exanoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exanol","accusative-definite-nominative-singular":"exanolul","accusative-indefinite-nominative-plural":"exanoli","accusative-definite-nominative-plural":"exanolii","dative-genitive-indefinite-singular":"exanol","dative-definite-genitive-singular":"exanolului","dative-genitive-indefinite-plural":"exanoli","dative-definite-genitive-plural":"exanolilor","singular-vocative":"exanolule","plural-vocative":"exanolilor"}},{"word":"exantem","pos":"noun","definitions":["exanthema"],"forms":{"plural":"exanteme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exantem","accusative-definite-nominative-singular":"exantemul","accusative-indefinite-nominative-plural":"exanteme","accusative-definite-nominative-plural":"exantemele","dative-genitive-indefinite-singular":"exantem","dative-definite-genitive-singular":"exantemului","dative-genitive-indefinite-plural":"exanteme","dative-definite-genitive-plural":"exantemelor","singular-vocative":"exantemule","plural-vocative":"exantemelor"}},{"word":"exantematic","pos":"adj","definitions":["exanthematic"],"forms":{"feminine-singular":"exantematică","masculine-plural":"exantematici","feminine-neuter-plural":"exantematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exantematic","error-unrecognized-form-feminine-indefinite-singular":"exantematică","error-unrecognized-form-indefinite-masculine-plural":"exantematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exantematice","definite-error-unrecognized-form-masculine-neuter-singular":"exantematicul","definite-error-unrecognized-form-feminine-singular":"exantematica","definite-error-unrecognized-form-masculine-plural":"exantematicii","definite-error-unrecognized-form-feminine-neuter-plural":"exantematicele"}},{"word":"exantematos","pos":"adj","definitions":["exanthematous"],"forms":{"feminine-singular":"exantematoasă","masculine-plural":"exantematoși","feminine-neuter-plural":"exantematoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exantematos","error-unrecognized-form-feminine-indefinite-singular":"exantematoasă","error-unrecognized-form-indefinite-masculine-plural":"exantematoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"exantematoase","definite-error-unrecognized-form-masculine-neuter-singular":"exantematosul","definite-error-unrecognized-form-feminine-singular":"exantematoasa","definite-error-unrecognized-form-masculine-plural":"exantematoșii","definite-error-unrecognized-form-feminine-neuter-plural":"exantematoasele"}},{"word":"exarh","pos":"noun","definitions":["exarch"],"forms":{"plural":"exarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exarh","accusative-definite-nominative-singular":"exarhul","accusative-indefinite-nominative-plural":"exarhi","accusative-definite-nominative-plural":"exarhii","dative-genitive-indefinite-singular":"exarh","dative-definite-genitive-singular":"exarhului","dative-genitive-indefinite-plural":"exarhi","dative-definite-genitive-plural":"exarhilor","singular-vocative":"exarhule","plural-vocative":"exarhilor"}},{"word":"exarhat","pos":"noun","definitions":["exarchate"],"forms":{"plural":"exarhate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exarhat","accusative-definite-nominative-singular":"exarhatul","accusative-indefinite-nominative-plural":"exarhate","accusative-definite-nominative-plural":"exarhatele","dative-genitive-indefinite-singular":"exarhat","dative-definite-genitive-singular":"exarhatului","dative-genitive-indefinite-plural":"exarhate","dative-definite-genitive-plural":"exarhatelor","singular-vocative":"exarhatule","plural-vocative":"exarhatelor"}},{"word":"exarhie","pos":"noun","definitions":["exarchy"],"forms":{"plural":"exarhii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exarhie","accusative-definite-nominative-singular":"exarhia","accusative-indefinite-nominative-plural":"exarhii","accusative-definite-nominative-plural":"exarhiile","dative-genitive-indefinite-singular":"exarhii","dative-definite-genitive-singular":"exarhiei","dative-genitive-indefinite-plural":"exarhii","dative-definite-genitive-plural":"exarhiilor","singular-vocative":"exarhie","plural-vocative":"exarhiilor"}},{"word":"exarhierie","pos":"noun","definitions":["exarchate"],"forms":{"plural":"exarhierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exarhierie","accusative-definite-nominative-singular":"exarhieria","accusative-indefinite-nominative-plural":"exarhierii","accusative-definite-nominative-plural":"exarhieriile","dative-genitive-indefinite-singular":"exarhierii","dative-definite-genitive-singular":"exarhieriei","dative-genitive-indefinite-plural":"exarhierii","dative-definite-genitive-plural":"exarhieriilor","singular-vocative":"exarhierie","plural-vocative":"exarhieriilor"}},{"word":"exarticulațiune","pos":"noun","definitions":["disarticulation"],"forms":{"plural":"exarticulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exarticulațiune","accusative-definite-nominative-singular":"exarticulațiunea","accusative-indefinite-nominative-plural":"exarticulațiuni","accusative-definite-nominative-plural":"exarticulațiunile","dative-genitive-indefinite-singular":"exarticulațiuni","dative-definite-genitive-singular":"exarticulațiunii","dative-genitive-indefinite-plural":"exarticulațiuni","dative-definite-genitive-plural":"exarticulațiunilor","singular-vocative":"exarticulațiune","plural-vocative":"exarticulațiunilor"}},{"word":"exaspera","pos":"verb","definitions":["to exasperate"],"pronunciation":"/eɡ.zas.peˈra/","forms":{"canonical":"a exaspera 1st conjugation","present-singular-third-person":"exasperează","participle-past":"exasperat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exaspera","gerund":"exasperând","first-person-indicative-present-singular":"exasperez","indicative-present-second-person-singular":"exasperezi","indicative-present-singular-third-person":"exasperează","first-person-indicative-plural-present":"exasperăm","indicative-plural-present-second-person":"exasperați","indicative-plural-present-third-person":"exasperează","first-person-imperfect-indicative-singular":"exasperam","imperfect-indicative-second-person-singular":"exasperai","imperfect-indicative-singular-third-person":"exaspera","first-person-imperfect-indicative-plural":"exasperam","imperfect-indicative-plural-second-person":"exasperați","imperfect-indicative-plural-third-person":"exasperau","first-person-indicative-perfect-singular":"exasperai","indicative-perfect-second-person-singular":"exasperași","indicative-perfect-singular-third-person":"exasperă","first-person-indicative-perfect-plural":"exasperarăm","indicative-perfect-plural-second-person":"exasperarăți","indicative-perfect-plural-third-person":"exasperară","first-person-indicative-pluperfect-singular":"exasperasem","indicative-pluperfect-second-person-singular":"exasperaseși","indicative-pluperfect-singular-third-person":"exasperase","first-person-indicative-pluperfect-plural":"exasperaserăm","indicative-pluperfect-plural-second-person":"exasperaserăți","indicative-pluperfect-plural-third-person":"exasperaseră","first-person-present-singular-subjunctive":"să exasperez","present-second-person-singular-subjunctive":"să exasperezi","present-singular-subjunctive-third-person":"să exaspereze","first-person-plural-present-subjunctive":"să exasperăm","plural-present-second-person-subjunctive":"să exasperați","plural-present-subjunctive-third-person":"să exaspereze","imperative-second-person-singular":"exasperează","imperative-plural-second-person":"exasperați","imperative-negative-second-person-singular":"nu exaspera","imperative-negative-plural-second-person":"nu exasperați"}},{"word":"exasperant","pos":"adj","definitions":["exasperating"],"forms":{"feminine-singular":"exasperantă","masculine-plural":"exasperanți","feminine-neuter-plural":"exasperante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exasperant","error-unrecognized-form-feminine-indefinite-singular":"exasperantă","error-unrecognized-form-indefinite-masculine-plural":"exasperanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exasperante","definite-error-unrecognized-form-masculine-neuter-singular":"exasperantul","definite-error-unrecognized-form-feminine-singular":"exasperanta","definite-error-unrecognized-form-masculine-plural":"exasperanții","definite-error-unrecognized-form-feminine-neuter-plural":"exasperantele"}},{"word":"exasperare","pos":"noun","definitions":["exasperation"],"forms":{"plural":"exasperări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exasperare","accusative-definite-nominative-singular":"exasperarea","accusative-indefinite-nominative-plural":"exasperări","accusative-definite-nominative-plural":"exasperările","dative-genitive-indefinite-singular":"exasperări","dative-definite-genitive-singular":"exasperării","dative-genitive-indefinite-plural":"exasperări","dative-definite-genitive-plural":"exasperărilor","singular-vocative":"exasperare","plural-vocative":"exasperărilor"}},{"word":"exasperat","pos":"adj","definitions":["exasperated"],"pronunciation":"/ˌeɡ.zas.peˈrat/","forms":{"feminine-singular":"exasperată","masculine-plural":"exasperați","feminine-neuter-plural":"exasperate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exasperat","error-unrecognized-form-feminine-indefinite-singular":"exasperată","error-unrecognized-form-indefinite-masculine-plural":"exasperați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exasperate","definite-error-unrecognized-form-masculine-neuter-singular":"exasperatul","definite-error-unrecognized-form-feminine-singular":"exasperata","definite-error-unrecognized-form-masculine-plural":"exasperații","definite-error-unrecognized-form-feminine-neuter-plural":"exasperatele"}},{"word":"exasperație","pos":"noun","definitions":["exasperation"],"forms":{"plural":"exasperații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exasperație","accusative-definite-nominative-singular":"exasperația","accusative-indefinite-nominative-plural":"exasperații","accusative-definite-nominative-plural":"exasperațiile","dative-genitive-indefinite-singular":"exasperații","dative-definite-genitive-singular":"exasperației","dative-genitive-indefinite-plural":"exasperații","dative-definite-genitive-plural":"exasperațiilor","singular-vocative":"exasperație","plural-vocative":"exasperațiilor"}},{"word":"exaurient","pos":"adj","definitions":["exhaustive"],"forms":{"feminine-singular":"exaurientă","masculine-plural":"exaurienți","feminine-neuter-plural":"exauriente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exaurient","error-unrecognized-form-feminine-indefinite-singular":"exaurientă","error-unrecognized-form-indefinite-masculine-plural":"exaurienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exauriente","definite-error-unrecognized-form-masculine-neuter-singular":"exaurientul","definite-error-unrecognized-form-feminine-singular":"exaurienta","definite-error-unrecognized-form-masculine-plural":"exaurienții","definite-error-unrecognized-form-feminine-neuter-plural":"exaurientele"}},{"word":"excava","pos":"verb","definitions":["to excavate"],"pronunciation":"[ek.skaˈva]","forms":{"canonical":"a excava 1st conjugation","present-singular-third-person":"excavează","participle-past":"excavat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excava","gerund":"excavând","first-person-indicative-present-singular":"excavez","indicative-present-second-person-singular":"excavezi","indicative-present-singular-third-person":"excavează","first-person-indicative-plural-present":"excavăm","indicative-plural-present-second-person":"excavați","indicative-plural-present-third-person":"excavează","first-person-imperfect-indicative-singular":"excavam","imperfect-indicative-second-person-singular":"excavai","imperfect-indicative-singular-third-person":"excava","first-person-imperfect-indicative-plural":"excavam","imperfect-indicative-plural-second-person":"excavați","imperfect-indicative-plural-third-person":"excavau","first-person-indicative-perfect-singular":"excavai","indicative-perfect-second-person-singular":"excavași","indicative-perfect-singular-third-person":"excavă","first-person-indicative-perfect-plural":"excavarăm","indicative-perfect-plural-second-person":"excavarăți","indicative-perfect-plural-third-person":"excavară","first-person-indicative-pluperfect-singular":"excavasem","indicative-pluperfect-second-person-singular":"excavaseși","indicative-pluperfect-singular-third-person":"excavase","first-person-indicative-pluperfect-plural":"excavaserăm","indicative-pluperfect-plural-second-person":"excavaserăți","indicative-pluperfect-plural-third-person":"excavaseră","first-person-present-singular-subjunctive":"să excavez","present-second-person-singular-subjunctive":"să excavezi","present-singular-subjunctive-third-person":"să excaveze","first-person-plural-present-subjunctive":"să excavăm","plural-present-second-person-subjunctive":"să excavați","plural-present-subjunctive-third-person":"să excaveze","imperative-second-person-singular":"excavează","imperative-plural-second-person":"excavați","imperative-negative-second-person-singular":"nu excava","imperative-negative-plural-second-person":"nu excavați"}},{"word":"excavă","pos":"verb","definitions":["third-person singular simple perfect indicative of excava"],"pronunciation":"[ek.skaˈvə]"},{"word":"excavai","pos":"verb","definitions":["inflection of excava:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ek.skaˈvaj]"},{"word":"excavam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of excava"],"pronunciation":"[ek.skaˈvam]"},{"word":"excavăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of excava"],"pronunciation":"[ek.skaˈvəm]"},{"word":"excavând","pos":"verb","definitions":["gerund of excava (“to excavate”)"],"pronunciation":"/eks.kaˈvɨnd/","forms":{"alternative":"excavînd"}},{"word":"excavară","pos":"verb","definitions":["third-person plural simple perfect indicative of excava"],"pronunciation":"[ek.skaˈvarə]"},{"word":"excavarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of excava"],"pronunciation":"[ek.skaˈvarəm]"},{"word":"excavarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of excava"],"pronunciation":"[ek.skaˈvarət͡sʲ]"},{"word":"excavare","pos":"noun","definitions":["excavation"],"forms":{"plural":"excavări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excavare","accusative-definite-nominative-singular":"excavarea","accusative-indefinite-nominative-plural":"excavări","accusative-definite-nominative-plural":"excavările","dative-genitive-indefinite-singular":"excavări","dative-definite-genitive-singular":"excavării","dative-genitive-indefinite-plural":"excavări","dative-definite-genitive-plural":"excavărilor","singular-vocative":"excavare","plural-vocative":"excavărilor"}},{"word":"excavase","pos":"verb","definitions":["third-person singular pluperfect indicative of excava"],"pronunciation":"[ek.skaˈva.se]"},{"word":"excavasem","pos":"verb","definitions":["first-person singular pluperfect indicative of excava"],"pronunciation":"[ek.skaˈvasem]"},{"word":"excavaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of excava"],"pronunciation":"[ek.skaˈvaserə]"},{"word":"excavaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of excava"],"pronunciation":"[ek.skaˈvaserəm]"},{"word":"excavaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of excava"],"pronunciation":"[ek.skaˈvaserətsʲ]"},{"word":"excavaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of excava"],"pronunciation":"[ek.skaˈvaseʃʲ]"},{"word":"excavași","pos":"verb","definitions":["second-person singular simple perfect indicative of excava"],"pronunciation":"[ek.skaˈvaʃʲ]"},{"word":"excavat","pos":"verb","definitions":["past participle of excava"],"pronunciation":"[ek.skaˈvat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"excavat","error-unrecognized-form-feminine-indefinite-singular":"excavată","error-unrecognized-form-indefinite-masculine-plural":"excavați","error-unrecognized-form-feminine-indefinite-neuter-plural":"excavate","definite-error-unrecognized-form-masculine-neuter-singular":"excavatul","definite-error-unrecognized-form-feminine-singular":"excavata","definite-error-unrecognized-form-masculine-plural":"excavații","definite-error-unrecognized-form-feminine-neuter-plural":"excavatele"}},{"word":"excavați","pos":"adj","definitions":["masculine plural of excavat"],"pronunciation":"[eks.kaˈvat͡sʲ]"},{"word":"excavați","pos":"verb","definitions":["inflection of excava:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[eks.kaˈvat͡sʲ]"},{"word":"excavație","pos":"noun","definitions":["excavation"],"forms":{"plural":"excavații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excavație","accusative-definite-nominative-singular":"excavația","accusative-indefinite-nominative-plural":"excavații","accusative-definite-nominative-plural":"excavațiile","dative-genitive-indefinite-singular":"excavații","dative-definite-genitive-singular":"excavației","dative-genitive-indefinite-plural":"excavații","dative-definite-genitive-plural":"excavațiilor","singular-vocative":"excavație","plural-vocative":"excavațiilor"}},{"word":"excavațiune","pos":"noun","definitions":["alternative form of excavație"],"forms":{"plural":"excavațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excavațiune","accusative-definite-nominative-singular":"excavațiunea","accusative-indefinite-nominative-plural":"excavațiuni","accusative-definite-nominative-plural":"excavațiunile","dative-genitive-indefinite-singular":"excavațiuni","dative-definite-genitive-singular":"excavațiunii","dative-genitive-indefinite-plural":"excavațiuni","dative-definite-genitive-plural":"excavațiunilor","singular-vocative":"excavațiune","plural-vocative":"excavațiunilor"}},{"word":"excavatoare","pos":"noun","definitions":["plural of excavator"]},{"word":"excavator","pos":"noun","definitions":["excavator, digger"],"forms":{"plural":"excavatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excavator","accusative-definite-nominative-singular":"excavatorul","accusative-indefinite-nominative-plural":"excavatoare","accusative-definite-nominative-plural":"excavatoarele","dative-genitive-indefinite-singular":"excavator","dative-definite-genitive-singular":"excavatorului","dative-genitive-indefinite-plural":"excavatoare","dative-definite-genitive-plural":"excavatoarelor","singular-vocative":"excavatorule","plural-vocative":"excavatoarelor"}},{"word":"excavatorist","pos":"noun","definitions":["excavator operator"],"forms":{"plural":"excavatoriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"excavatorist","accusative-definite-nominative-singular":"excavatoristul","accusative-indefinite-nominative-plural":"excavatoristi","accusative-definite-nominative-plural":"excavatoristii","dative-genitive-indefinite-singular":"excavatorist","dative-definite-genitive-singular":"excavatoristului","dative-genitive-indefinite-plural":"excavatoristi","dative-definite-genitive-plural":"excavatoristilor","singular-vocative":"excavatoristule","plural-vocative":"excavatoristilor"}},{"word":"excavatoristă","pos":"noun","definitions":["female equivalent of excavatorist"],"forms":{"plural":"excavatoriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"excavatoristă","accusative-definite-nominative-singular":"excavatorista","accusative-indefinite-nominative-plural":"excavatoriste","accusative-definite-nominative-plural":"excavatoristele","dative-genitive-indefinite-singular":"excavatoriste","dative-definite-genitive-singular":"excavatoristei","dative-genitive-indefinite-plural":"excavatoriste","dative-definite-genitive-plural":"excavatoristelor","singular-vocative":"excavatoristă","plural-vocative":"excavatoristelor"}},{"word":"excavau","pos":"verb","definitions":["third-person plural imperfect indicative of excava"],"pronunciation":"[ek.skaˈvaw]"},{"word":"excavează","pos":"verb","definitions":["inflection of excava:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[ek.skaˈve̯azə]"},{"word":"excavez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of excava"],"pronunciation":"[ek.skaˈvez]"},{"word":"excaveze","pos":"verb","definitions":["third-person singular/plural present subjunctive of excava"],"pronunciation":"[ek.skaˈveze]"},{"word":"excavezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of excava"],"pronunciation":"[ek.skaˈvezʲ]"},{"word":"exceda","pos":"verb","definitions":["to exceed"],"forms":{"canonical":"a exceda 1st conjugation","present-singular-third-person":"excedează","participle-past":"excedat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exceda","gerund":"excedând","first-person-indicative-present-singular":"excedez","indicative-present-second-person-singular":"excedezi","indicative-present-singular-third-person":"excedează","first-person-indicative-plural-present":"excedăm","indicative-plural-present-second-person":"excedați","indicative-plural-present-third-person":"excedează","first-person-imperfect-indicative-singular":"excedam","imperfect-indicative-second-person-singular":"excedai","imperfect-indicative-singular-third-person":"exceda","first-person-imperfect-indicative-plural":"excedam","imperfect-indicative-plural-second-person":"excedați","imperfect-indicative-plural-third-person":"excedau","first-person-indicative-perfect-singular":"excedai","indicative-perfect-second-person-singular":"excedași","indicative-perfect-singular-third-person":"excedă","first-person-indicative-perfect-plural":"excedarăm","indicative-perfect-plural-second-person":"excedarăți","indicative-perfect-plural-third-person":"excedară","first-person-indicative-pluperfect-singular":"excedasem","indicative-pluperfect-second-person-singular":"excedaseși","indicative-pluperfect-singular-third-person":"excedase","first-person-indicative-pluperfect-plural":"excedaserăm","indicative-pluperfect-plural-second-person":"excedaserăți","indicative-pluperfect-plural-third-person":"excedaseră","first-person-present-singular-subjunctive":"să excedez","present-second-person-singular-subjunctive":"să excedezi","present-singular-subjunctive-third-person":"să excedeze","first-person-plural-present-subjunctive":"să excedăm","plural-present-second-person-subjunctive":"să excedați","plural-present-subjunctive-third-person":"să excedeze","imperative-second-person-singular":"excedează","imperative-plural-second-person":"excedați","imperative-negative-second-person-singular":"nu exceda","imperative-negative-plural-second-person":"nu excedați"}},{"word":"excedat","pos":"adj","definitions":["exceeded"],"forms":{"feminine-singular":"excedată","masculine-plural":"excedați","feminine-neuter-plural":"excedate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excedat","error-unrecognized-form-feminine-indefinite-singular":"excedată","error-unrecognized-form-indefinite-masculine-plural":"excedați","error-unrecognized-form-feminine-indefinite-neuter-plural":"excedate","definite-error-unrecognized-form-masculine-neuter-singular":"excedatul","definite-error-unrecognized-form-feminine-singular":"excedata","definite-error-unrecognized-form-masculine-plural":"excedații","definite-error-unrecognized-form-feminine-neuter-plural":"excedatele"}},{"word":"excedat","pos":"verb","definitions":["past participle of exceda"],"forms":{"participle-past":"of exceda"}},{"word":"excedent","pos":"noun","definitions":["surplus"],"forms":{"plural":"excedente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excedent","accusative-definite-nominative-singular":"excedentul","accusative-indefinite-nominative-plural":"excedente","accusative-definite-nominative-plural":"excedentele","dative-genitive-indefinite-singular":"excedent","dative-definite-genitive-singular":"excedentului","dative-genitive-indefinite-plural":"excedente","dative-definite-genitive-plural":"excedentelor","singular-vocative":"excedentule","plural-vocative":"excedentelor"}},{"word":"excedentar","pos":"adj","definitions":["surplus"],"forms":{"feminine-singular":"excedentară","masculine-plural":"excedentari","feminine-neuter-plural":"excedentare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excedentar","error-unrecognized-form-feminine-indefinite-singular":"excedentară","error-unrecognized-form-indefinite-masculine-plural":"excedentari","error-unrecognized-form-feminine-indefinite-neuter-plural":"excedentare","definite-error-unrecognized-form-masculine-neuter-singular":"excedentarul","definite-error-unrecognized-form-feminine-singular":"excedentara","definite-error-unrecognized-form-masculine-plural":"excedentarii","definite-error-unrecognized-form-feminine-neuter-plural":"excedentarele"}},{"word":"excela","pos":"verb","definitions":["to excel, to master"],"forms":{"canonical":"a excela 1st conjugation","present-singular-third-person":"excelează","participle-past":"excelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excela","gerund":"excelând","first-person-indicative-present-singular":"excelez","indicative-present-second-person-singular":"excelezi","indicative-present-singular-third-person":"excelează","first-person-indicative-plural-present":"excelăm","indicative-plural-present-second-person":"excelați","indicative-plural-present-third-person":"excelează","first-person-imperfect-indicative-singular":"excelam","imperfect-indicative-second-person-singular":"excelai","imperfect-indicative-singular-third-person":"excela","first-person-imperfect-indicative-plural":"excelam","imperfect-indicative-plural-second-person":"excelați","imperfect-indicative-plural-third-person":"excelau","first-person-indicative-perfect-singular":"excelai","indicative-perfect-second-person-singular":"excelași","indicative-perfect-singular-third-person":"excelă","first-person-indicative-perfect-plural":"excelarăm","indicative-perfect-plural-second-person":"excelarăți","indicative-perfect-plural-third-person":"excelară","first-person-indicative-pluperfect-singular":"excelasem","indicative-pluperfect-second-person-singular":"excelaseși","indicative-pluperfect-singular-third-person":"excelase","first-person-indicative-pluperfect-plural":"excelaserăm","indicative-pluperfect-plural-second-person":"excelaserăți","indicative-pluperfect-plural-third-person":"excelaseră","first-person-present-singular-subjunctive":"să excelez","present-second-person-singular-subjunctive":"să excelezi","present-singular-subjunctive-third-person":"să exceleze","first-person-plural-present-subjunctive":"să excelăm","plural-present-second-person-subjunctive":"să excelați","plural-present-subjunctive-third-person":"să exceleze","imperative-second-person-singular":"excelează","imperative-plural-second-person":"excelați","imperative-negative-second-person-singular":"nu excela","imperative-negative-plural-second-person":"nu excelați"}},{"word":"excelam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of excela"],"pronunciation":"[ekst͡ʃeˈlam]"},{"word":"excelent","pos":"adj","definitions":["excellent"],"pronunciation":"/eks.t͡ʃeˈlent/","forms":{"feminine-singular":"excelentă","masculine-plural":"excelenți","feminine-neuter-plural":"excelente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excelent","error-unrecognized-form-feminine-indefinite-singular":"excelentă","error-unrecognized-form-indefinite-masculine-plural":"excelenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"excelente","definite-error-unrecognized-form-masculine-neuter-singular":"excelentul","definite-error-unrecognized-form-feminine-singular":"excelenta","definite-error-unrecognized-form-masculine-plural":"excelenții","definite-error-unrecognized-form-feminine-neuter-plural":"excelentele"}},{"word":"excelență","pos":"noun","definitions":["excellency"],"forms":{"plural":"excelențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"excelență","accusative-definite-nominative-singular":"excelența","accusative-indefinite-nominative-plural":"excelențe","accusative-definite-nominative-plural":"excelențele","dative-genitive-indefinite-singular":"excelențe","dative-definite-genitive-singular":"excelenței","dative-genitive-indefinite-plural":"excelențe","dative-definite-genitive-plural":"excelențelor","singular-vocative":"excelență","plural-vocative":"excelențelor"}},{"word":"excelenție","pos":"noun","definitions":["obsolete form of excelență"],"forms":{"plural":"excelenții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excelenție","accusative-definite-nominative-singular":"excelenția","accusative-indefinite-nominative-plural":"excelenții","accusative-definite-nominative-plural":"excelențiile","dative-genitive-indefinite-singular":"excelenții","dative-definite-genitive-singular":"excelenției","dative-genitive-indefinite-plural":"excelenții","dative-definite-genitive-plural":"excelențiilor","singular-vocative":"excelenție","plural-vocative":"excelențiilor"}},{"word":"excelentissim","pos":"adj","definitions":["most or very excellent"],"forms":{"feminine-singular":"excelentissimă","masculine-plural":"excelentissimi","feminine-neuter-plural":"excelentissime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excelentissim","error-unrecognized-form-feminine-indefinite-singular":"excelentissimă","error-unrecognized-form-indefinite-masculine-plural":"excelentissimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"excelentissime","definite-error-unrecognized-form-masculine-neuter-singular":"excelentissimul","definite-error-unrecognized-form-feminine-singular":"excelentissima","definite-error-unrecognized-form-masculine-plural":"excelentissimii","definite-error-unrecognized-form-feminine-neuter-plural":"excelentissimele"}},{"word":"excentric","pos":"adj","definitions":["eccentric, oddball"],"forms":{"feminine-singular":"excentrică","masculine-plural":"excentrici","feminine-neuter-plural":"excentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excentric","error-unrecognized-form-feminine-indefinite-singular":"excentrică","error-unrecognized-form-indefinite-masculine-plural":"excentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"excentrice","definite-error-unrecognized-form-masculine-neuter-singular":"excentricul","definite-error-unrecognized-form-feminine-singular":"excentrica","definite-error-unrecognized-form-masculine-plural":"excentricii","definite-error-unrecognized-form-feminine-neuter-plural":"excentricele"}},{"word":"excentricitate","pos":"noun","definitions":["eccentricity"],"forms":{"plural":"excentricități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excentricitate","accusative-definite-nominative-singular":"excentricitatea","accusative-indefinite-nominative-plural":"excentricități","accusative-definite-nominative-plural":"excentricitățile","dative-genitive-indefinite-singular":"excentricități","dative-definite-genitive-singular":"excentricității","dative-genitive-indefinite-plural":"excentricități","dative-definite-genitive-plural":"excentricităților","singular-vocative":"excentricitate","plural-vocative":"excentricităților"}},{"word":"excepciune","pos":"noun","definitions":["obsolete form of excepție"],"forms":{"plural":"excepciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excepciune","accusative-definite-nominative-singular":"excepciunea","accusative-indefinite-nominative-plural":"excepciuni","accusative-definite-nominative-plural":"excepciunile","dative-genitive-indefinite-singular":"excepciuni","dative-definite-genitive-singular":"excepciunii","dative-genitive-indefinite-plural":"excepciuni","dative-definite-genitive-plural":"excepciunilor","singular-vocative":"excepciune","plural-vocative":"excepciunilor"}},{"word":"except","pos":"adj","definitions":["excepted"],"forms":{"feminine-singular":"exceptă","masculine-plural":"excepți","feminine-neuter-plural":"excepte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"except","error-unrecognized-form-feminine-indefinite-singular":"exceptă","error-unrecognized-form-indefinite-masculine-plural":"excepți","error-unrecognized-form-feminine-indefinite-neuter-plural":"excepte","definite-error-unrecognized-form-masculine-neuter-singular":"exceptul","definite-error-unrecognized-form-feminine-singular":"excepta","definite-error-unrecognized-form-masculine-plural":"excepții","definite-error-unrecognized-form-feminine-neuter-plural":"exceptele"}},{"word":"excepta","pos":"verb","definitions":["to except"],"pronunciation":"/eks.t͡ʃepˈta/","forms":{"canonical":"a excepta 1st conjugation","present-singular-third-person":"exceptează","participle-past":"exceptat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excepta","gerund":"exceptând","first-person-indicative-present-singular":"exceptez","indicative-present-second-person-singular":"exceptezi","indicative-present-singular-third-person":"exceptează","first-person-indicative-plural-present":"exceptăm","indicative-plural-present-second-person":"exceptați","indicative-plural-present-third-person":"exceptează","first-person-imperfect-indicative-singular":"exceptam","imperfect-indicative-second-person-singular":"exceptai","imperfect-indicative-singular-third-person":"excepta","first-person-imperfect-indicative-plural":"exceptam","imperfect-indicative-plural-second-person":"exceptați","imperfect-indicative-plural-third-person":"exceptau","first-person-indicative-perfect-singular":"exceptai","indicative-perfect-second-person-singular":"exceptași","indicative-perfect-singular-third-person":"exceptă","first-person-indicative-perfect-plural":"exceptarăm","indicative-perfect-plural-second-person":"exceptarăți","indicative-perfect-plural-third-person":"exceptară","first-person-indicative-pluperfect-singular":"exceptasem","indicative-pluperfect-second-person-singular":"exceptaseși","indicative-pluperfect-singular-third-person":"exceptase","first-person-indicative-pluperfect-plural":"exceptaserăm","indicative-pluperfect-plural-second-person":"exceptaserăți","indicative-pluperfect-plural-third-person":"exceptaseră","first-person-present-singular-subjunctive":"să exceptez","present-second-person-singular-subjunctive":"să exceptezi","present-singular-subjunctive-third-person":"să excepteze","first-person-plural-present-subjunctive":"să exceptăm","plural-present-second-person-subjunctive":"să exceptați","plural-present-subjunctive-third-person":"să excepteze","imperative-second-person-singular":"exceptează","imperative-plural-second-person":"exceptați","imperative-negative-second-person-singular":"nu excepta","imperative-negative-plural-second-person":"nu exceptați"}},{"word":"exceptabil","pos":"adj","definitions":["which can be excepted"],"forms":{"feminine-singular":"exceptabilă","masculine-plural":"exceptabili","feminine-neuter-plural":"exceptabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exceptabil","error-unrecognized-form-feminine-indefinite-singular":"exceptabilă","error-unrecognized-form-indefinite-masculine-plural":"exceptabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exceptabile","definite-error-unrecognized-form-masculine-neuter-singular":"exceptabilul","definite-error-unrecognized-form-feminine-singular":"exceptabila","definite-error-unrecognized-form-masculine-plural":"exceptabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exceptabilele"}},{"word":"exceptare","pos":"noun","definitions":["exception"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"exceptare","accusative-definite-nominative":"exceptarea","dative-genitive-indefinite":"exceptare","dative-definite-genitive":"exceptarei","vocative":"exceptare"}},{"word":"exceptat","pos":"adj","definitions":["excepted"],"forms":{"feminine-singular":"exceptată","masculine-plural":"exceptați","feminine-neuter-plural":"exceptate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exceptat","error-unrecognized-form-feminine-indefinite-singular":"exceptată","error-unrecognized-form-indefinite-masculine-plural":"exceptați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exceptate","definite-error-unrecognized-form-masculine-neuter-singular":"exceptatul","definite-error-unrecognized-form-feminine-singular":"exceptata","definite-error-unrecognized-form-masculine-plural":"exceptații","definite-error-unrecognized-form-feminine-neuter-plural":"exceptatele"}},{"word":"exceptat","pos":"verb","definitions":["past participle of excepta"],"forms":{"participle-past":"of excepta"}},{"word":"excepție","pos":"noun","definitions":["exception"],"forms":{"plural":"excepții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excepție","accusative-definite-nominative-singular":"excepția","accusative-indefinite-nominative-plural":"excepții","accusative-definite-nominative-plural":"excepțiile","dative-genitive-indefinite-singular":"excepții","dative-definite-genitive-singular":"excepției","dative-genitive-indefinite-plural":"excepții","dative-definite-genitive-plural":"excepțiilor","singular-vocative":"excepție","plural-vocative":"excepțiilor"}},{"word":"excepțional","pos":"adj","definitions":["exceptional"],"pronunciation":"/ˌeks.t͡ʃep.t͡si.oˈnal/","forms":{"feminine-singular":"excepțională","masculine-plural":"excepționali","feminine-neuter-plural":"excepționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excepțional","error-unrecognized-form-feminine-indefinite-singular":"excepțională","error-unrecognized-form-indefinite-masculine-plural":"excepționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"excepționale","definite-error-unrecognized-form-masculine-neuter-singular":"excepționalul","definite-error-unrecognized-form-feminine-singular":"excepționala","definite-error-unrecognized-form-masculine-plural":"excepționalii","definite-error-unrecognized-form-feminine-neuter-plural":"excepționalele"}},{"word":"excepționalitate","pos":"noun","definitions":["exceptionality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"excepționalitate","accusative-definite-nominative":"excepționalitatea","dative-genitive-indefinite":"excepționalități","dative-definite-genitive":"excepționalității","vocative":"-"}},{"word":"excepționare","pos":"noun","definitions":["exception"],"forms":{"plural":"excepționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excepționare","accusative-definite-nominative-singular":"excepționarea","accusative-indefinite-nominative-plural":"excepționări","accusative-definite-nominative-plural":"excepționările","dative-genitive-indefinite-singular":"excepționări","dative-definite-genitive-singular":"excepționării","dative-genitive-indefinite-plural":"excepționări","dative-definite-genitive-plural":"excepționărilor","singular-vocative":"excepționare","plural-vocative":"excepționărilor"}},{"word":"excepțiune","pos":"noun","definitions":["obsolete form of excepție"],"forms":{"plural":"excepțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excepțiune","accusative-definite-nominative-singular":"excepțiunea","accusative-indefinite-nominative-plural":"excepțiuni","accusative-definite-nominative-plural":"excepțiunile","dative-genitive-indefinite-singular":"excepțiuni","dative-definite-genitive-singular":"excepțiunii","dative-genitive-indefinite-plural":"excepțiuni","dative-definite-genitive-plural":"excepțiunilor","singular-vocative":"excepțiune","plural-vocative":"excepțiunilor"}},{"word":"excerpta","pos":"verb","definitions":["to excerpt"],"forms":{"canonical":"a excerpta 1st conjugation","present-singular-third-person":"excerptează","participle-past":"excerptat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excerpta","gerund":"excerptând","first-person-indicative-present-singular":"excerptez","indicative-present-second-person-singular":"excerptezi","indicative-present-singular-third-person":"excerptează","first-person-indicative-plural-present":"excerptăm","indicative-plural-present-second-person":"excerptați","indicative-plural-present-third-person":"excerptează","first-person-imperfect-indicative-singular":"excerptam","imperfect-indicative-second-person-singular":"excerptai","imperfect-indicative-singular-third-person":"excerpta","first-person-imperfect-indicative-plural":"excerptam","imperfect-indicative-plural-second-person":"excerptați","imperfect-indicative-plural-third-person":"excerptau","first-person-indicative-perfect-singular":"excerptai","indicative-perfect-second-person-singular":"excerptași","indicative-perfect-singular-third-person":"excerptă","first-person-indicative-perfect-plural":"excerptarăm","indicative-perfect-plural-second-person":"excerptarăți","indicative-perfect-plural-third-person":"excerptară","first-person-indicative-pluperfect-singular":"excerptasem","indicative-pluperfect-second-person-singular":"excerptaseși","indicative-pluperfect-singular-third-person":"excerptase","first-person-indicative-pluperfect-plural":"excerptaserăm","indicative-pluperfect-plural-second-person":"excerptaserăți","indicative-pluperfect-plural-third-person":"excerptaseră","first-person-present-singular-subjunctive":"să excerptez","present-second-person-singular-subjunctive":"să excerptezi","present-singular-subjunctive-third-person":"să excerpteze","first-person-plural-present-subjunctive":"să excerptăm","plural-present-second-person-subjunctive":"să excerptați","plural-present-subjunctive-third-person":"să excerpteze","imperative-second-person-singular":"excerptează","imperative-plural-second-person":"excerptați","imperative-negative-second-person-singular":"nu excerpta","imperative-negative-plural-second-person":"nu excerptați"}},{"word":"exces","pos":"noun","definitions":["excess"],"forms":{"plural":"excese","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exces","accusative-definite-nominative-singular":"excesul","accusative-indefinite-nominative-plural":"excese","accusative-definite-nominative-plural":"excesele","dative-genitive-indefinite-singular":"exces","dative-definite-genitive-singular":"excesului","dative-genitive-indefinite-plural":"excese","dative-definite-genitive-plural":"exceselor","singular-vocative":"excesule","plural-vocative":"exceselor"}},{"word":"excesiv","pos":"adj","definitions":["excessive"],"forms":{"feminine-singular":"excesivă","masculine-plural":"excesivi","feminine-neuter-plural":"excesive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excesiv","error-unrecognized-form-feminine-indefinite-singular":"excesivă","error-unrecognized-form-indefinite-masculine-plural":"excesivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"excesive","definite-error-unrecognized-form-masculine-neuter-singular":"excesivul","definite-error-unrecognized-form-feminine-singular":"excesiva","definite-error-unrecognized-form-masculine-plural":"excesivii","definite-error-unrecognized-form-feminine-neuter-plural":"excesivele"}},{"word":"excesivitate","pos":"noun","definitions":["excessiveness"],"forms":{"plural":"excesivități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excesivitate","accusative-definite-nominative-singular":"excesivitatea","accusative-indefinite-nominative-plural":"excesivități","accusative-definite-nominative-plural":"excesivitățile","dative-genitive-indefinite-singular":"excesivități","dative-definite-genitive-singular":"excesivității","dative-genitive-indefinite-plural":"excesivități","dative-definite-genitive-plural":"excesivităților","singular-vocative":"excesivitate","plural-vocative":"excesivităților"}},{"word":"exchiz","pos":"adj","definitions":["exquisite"],"forms":{"feminine-singular":"exchiză","masculine-plural":"exchizi","feminine-neuter-plural":"exchize","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exchiz","error-unrecognized-form-feminine-indefinite-singular":"exchiză","error-unrecognized-form-indefinite-masculine-plural":"exchizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exchize","definite-error-unrecognized-form-masculine-neuter-singular":"exchizul","definite-error-unrecognized-form-feminine-singular":"exchiza","definite-error-unrecognized-form-masculine-plural":"exchizii","definite-error-unrecognized-form-feminine-neuter-plural":"exchizele"}},{"word":"excipient","pos":"noun","definitions":["excipient"],"forms":{"plural":"excipienți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excipient","accusative-definite-nominative-singular":"excipientul","accusative-indefinite-nominative-plural":"excipienți","accusative-definite-nominative-plural":"excipiențile","dative-genitive-indefinite-singular":"excipient","dative-definite-genitive-singular":"excipientului","dative-genitive-indefinite-plural":"excipienți","dative-definite-genitive-plural":"excipienților","singular-vocative":"excipientule","plural-vocative":"excipienților"}},{"word":"excit","pos":"verb","definitions":["first-person singular present indicative/subjunctive of excita"],"pronunciation":"[eksˈt͡ʃit]"},{"word":"excita","pos":"verb","definitions":["to excite; to arouse"],"pronunciation":"/eks.t͡ʃiˈta/","forms":{"canonical":"a excita 1st conjugation","present-singular-third-person":"excită","participle-past":"excitat","subjunctive-third-person":"excite","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a excita","gerund":"excitând","first-person-indicative-present-singular":"excit","indicative-present-second-person-singular":"exciți","indicative-present-singular-third-person":"excită","first-person-indicative-plural-present":"excităm","indicative-plural-present-second-person":"excitați","indicative-plural-present-third-person":"excită","first-person-imperfect-indicative-singular":"excitam","imperfect-indicative-second-person-singular":"excitai","imperfect-indicative-singular-third-person":"excita","first-person-imperfect-indicative-plural":"excitam","imperfect-indicative-plural-second-person":"excitați","imperfect-indicative-plural-third-person":"excitau","first-person-indicative-perfect-singular":"excitai","indicative-perfect-second-person-singular":"excitași","indicative-perfect-singular-third-person":"excită","first-person-indicative-perfect-plural":"excitarăm","indicative-perfect-plural-second-person":"excitarăți","indicative-perfect-plural-third-person":"excitară","first-person-indicative-pluperfect-singular":"excitasem","indicative-pluperfect-second-person-singular":"excitaseși","indicative-pluperfect-singular-third-person":"excitase","first-person-indicative-pluperfect-plural":"excitaserăm","indicative-pluperfect-plural-second-person":"excitaserăți","indicative-pluperfect-plural-third-person":"excitaseră","first-person-present-singular-subjunctive":"să excit","present-second-person-singular-subjunctive":"să exciți","present-singular-subjunctive-third-person":"să excite","first-person-plural-present-subjunctive":"să excităm","plural-present-second-person-subjunctive":"să excitați","plural-present-subjunctive-third-person":"să excite","imperative-second-person-singular":"excită","imperative-plural-second-person":"excitați","imperative-negative-second-person-singular":"nu excita","imperative-negative-plural-second-person":"nu excitați"}},{"word":"excitabil","pos":"adj","definitions":["excitable"],"forms":{"feminine-singular":"excitabilă","masculine-plural":"excitabili","feminine-neuter-plural":"excitabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excitabil","error-unrecognized-form-feminine-indefinite-singular":"excitabilă","error-unrecognized-form-indefinite-masculine-plural":"excitabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"excitabile","definite-error-unrecognized-form-masculine-neuter-singular":"excitabilul","definite-error-unrecognized-form-feminine-singular":"excitabila","definite-error-unrecognized-form-masculine-plural":"excitabilii","definite-error-unrecognized-form-feminine-neuter-plural":"excitabilele"}},{"word":"excitabilitate","pos":"noun","definitions":["excitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excitabilitate","accusative-definite-nominative-singular":"excitabilitatea","accusative-indefinite-nominative-plural":"excitabilități","accusative-definite-nominative-plural":"excitabilitățile","dative-genitive-indefinite-singular":"excitabilități","dative-definite-genitive-singular":"excitabilității","dative-genitive-indefinite-plural":"excitabilități","dative-definite-genitive-plural":"excitabilităților","singular-vocative":"excitabilitate","plural-vocative":"excitabilităților"}},{"word":"excitai","pos":"verb","definitions":["inflection of excita:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ekst͡ʃiˈtaj]"},{"word":"excitam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of excita"],"pronunciation":"[ekst͡ʃiˈtam]"},{"word":"excitant","pos":"adj","definitions":["exciting"],"forms":{"feminine-singular":"excitantă","masculine-plural":"excitanți","feminine-neuter-plural":"excitante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excitant","error-unrecognized-form-feminine-indefinite-singular":"excitantă","error-unrecognized-form-indefinite-masculine-plural":"excitanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"excitante","definite-error-unrecognized-form-masculine-neuter-singular":"excitantul","definite-error-unrecognized-form-feminine-singular":"excitanta","definite-error-unrecognized-form-masculine-plural":"excitanții","definite-error-unrecognized-form-feminine-neuter-plural":"excitantele"}},{"word":"excitare","pos":"noun","definitions":["excitation, excitement"],"forms":{"plural":"excitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excitare","accusative-definite-nominative-singular":"excitarea","accusative-indefinite-nominative-plural":"excitări","accusative-definite-nominative-plural":"excitările","dative-genitive-indefinite-singular":"excitări","dative-definite-genitive-singular":"excitării","dative-genitive-indefinite-plural":"excitări","dative-definite-genitive-plural":"excitărilor","singular-vocative":"excitare","plural-vocative":"excitărilor"}},{"word":"excitase","pos":"verb","definitions":["third-person singular pluperfect indicative of excita"],"pronunciation":"[ekst͡ʃiˈtase]"},{"word":"excitat","pos":"adj","definitions":["excited","horny"],"pronunciation":"[eks.tʃiˈtat]","forms":{"feminine-singular":"excitată","masculine-plural":"excitați","feminine-neuter-plural":"excitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excitat","error-unrecognized-form-feminine-indefinite-singular":"excitată","error-unrecognized-form-indefinite-masculine-plural":"excitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"excitate","definite-error-unrecognized-form-masculine-neuter-singular":"excitatul","definite-error-unrecognized-form-feminine-singular":"excitata","definite-error-unrecognized-form-masculine-plural":"excitații","definite-error-unrecognized-form-feminine-neuter-plural":"excitatele"}},{"word":"excitat","pos":"verb","definitions":["past participle of excita"],"pronunciation":"[eks.tʃiˈtat]","forms":{"participle-past":"of excita"}},{"word":"excitație","pos":"noun","definitions":["excitation"],"forms":{"plural":"excitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excitație","accusative-definite-nominative-singular":"excitația","accusative-indefinite-nominative-plural":"excitații","accusative-definite-nominative-plural":"excitațiile","dative-genitive-indefinite-singular":"excitații","dative-definite-genitive-singular":"excitației","dative-genitive-indefinite-plural":"excitații","dative-definite-genitive-plural":"excitațiilor","singular-vocative":"excitație","plural-vocative":"excitațiilor"}},{"word":"excitațiune","pos":"noun","definitions":["obsolete form of excitație"],"forms":{"plural":"excitațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excitațiune","accusative-definite-nominative-singular":"excitațiunea","accusative-indefinite-nominative-plural":"excitațiuni","accusative-definite-nominative-plural":"excitațiunile","dative-genitive-indefinite-singular":"excitațiuni","dative-definite-genitive-singular":"excitațiunii","dative-genitive-indefinite-plural":"excitațiuni","dative-definite-genitive-plural":"excitațiunilor","singular-vocative":"excitațiune","plural-vocative":"excitațiunilor"}},{"word":"excitativ","pos":"adj","definitions":["exciting"],"forms":{"feminine-singular":"excitativă","masculine-plural":"excitativi","feminine-neuter-plural":"excitative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excitativ","error-unrecognized-form-feminine-indefinite-singular":"excitativă","error-unrecognized-form-indefinite-masculine-plural":"excitativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"excitative","definite-error-unrecognized-form-masculine-neuter-singular":"excitativul","definite-error-unrecognized-form-feminine-singular":"excitativa","definite-error-unrecognized-form-masculine-plural":"excitativii","definite-error-unrecognized-form-feminine-neuter-plural":"excitativele"}},{"word":"excitator","pos":"noun","definitions":["excitator"],"pronunciation":"/eks.t͡ʃi.taˈtor/","forms":{"plural":"excitatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excitator","accusative-definite-nominative-singular":"excitatorul","accusative-indefinite-nominative-plural":"excitatoare","accusative-definite-nominative-plural":"excitatoarele","dative-genitive-indefinite-singular":"excitator","dative-definite-genitive-singular":"excitatorului","dative-genitive-indefinite-plural":"excitatoare","dative-definite-genitive-plural":"excitatoarelor","singular-vocative":"excitatorule","plural-vocative":"excitatoarelor"}},{"word":"excite","pos":"verb","definitions":["third-person singular/plural present subjunctive of excita"],"pronunciation":"[eksˈt͡ʃite]"},{"word":"excitomotor","pos":"adj","definitions":["excitomotory"],"forms":{"feminine-singular":"excitomotoare","masculine-plural":"excitomotori","feminine-neuter-plural":"excitomotoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excitomotor","error-unrecognized-form-feminine-indefinite-singular":"excitomotoare","error-unrecognized-form-indefinite-masculine-plural":"excitomotori","error-unrecognized-form-feminine-indefinite-neuter-plural":"excitomotoare","definite-error-unrecognized-form-masculine-neuter-singular":"excitomotorul","definite-error-unrecognized-form-feminine-singular":"excitomotoarea","definite-error-unrecognized-form-masculine-plural":"excitomotorii","definite-error-unrecognized-form-feminine-neuter-plural":"excitomotoarele"}},{"word":"excitron","pos":"noun","definitions":["excitron"],"forms":{"plural":"excitroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excitron","accusative-definite-nominative-singular":"excitronul","accusative-indefinite-nominative-plural":"excitroane","accusative-definite-nominative-plural":"excitroanele","dative-genitive-indefinite-singular":"excitron","dative-definite-genitive-singular":"excitronului","dative-genitive-indefinite-plural":"excitroane","dative-definite-genitive-plural":"excitroanelor","singular-vocative":"excitronule","plural-vocative":"excitroanelor"}},{"word":"exciza","pos":"verb","definitions":["to excise"],"forms":{"canonical":"a exciza 1st conjugation","present-singular-third-person":"excizează","participle-past":"excizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exciza","gerund":"excizând","first-person-indicative-present-singular":"excizez","indicative-present-second-person-singular":"excizezi","indicative-present-singular-third-person":"excizează","first-person-indicative-plural-present":"excizăm","indicative-plural-present-second-person":"excizați","indicative-plural-present-third-person":"excizează","first-person-imperfect-indicative-singular":"excizam","imperfect-indicative-second-person-singular":"excizai","imperfect-indicative-singular-third-person":"exciza","first-person-imperfect-indicative-plural":"excizam","imperfect-indicative-plural-second-person":"excizați","imperfect-indicative-plural-third-person":"excizau","first-person-indicative-perfect-singular":"excizai","indicative-perfect-second-person-singular":"excizași","indicative-perfect-singular-third-person":"exciză","first-person-indicative-perfect-plural":"excizarăm","indicative-perfect-plural-second-person":"excizarăți","indicative-perfect-plural-third-person":"excizară","first-person-indicative-pluperfect-singular":"excizasem","indicative-pluperfect-second-person-singular":"excizaseși","indicative-pluperfect-singular-third-person":"excizase","first-person-indicative-pluperfect-plural":"excizaserăm","indicative-pluperfect-plural-second-person":"excizaserăți","indicative-pluperfect-plural-third-person":"excizaseră","first-person-present-singular-subjunctive":"să excizez","present-second-person-singular-subjunctive":"să excizezi","present-singular-subjunctive-third-person":"să excizeze","first-person-plural-present-subjunctive":"să excizăm","plural-present-second-person-subjunctive":"să excizați","plural-present-subjunctive-third-person":"să excizeze","imperative-second-person-singular":"excizează","imperative-plural-second-person":"excizați","imperative-negative-second-person-singular":"nu exciza","imperative-negative-plural-second-person":"nu excizați"}},{"word":"exciză","pos":"noun","definitions":["excise"],"forms":{"plural":"excize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exciză","accusative-definite-nominative-singular":"exciza","accusative-indefinite-nominative-plural":"excize","accusative-definite-nominative-plural":"excizele","dative-genitive-indefinite-singular":"excize","dative-definite-genitive-singular":"excizei","dative-genitive-indefinite-plural":"excize","dative-definite-genitive-plural":"excizelor","singular-vocative":"exciză","plural-vocative":"excizelor"}},{"word":"excizare","pos":"noun","definitions":["excision"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"excizare","accusative-definite-nominative":"excizarea","dative-genitive-indefinite":"excizări","dative-definite-genitive":"excizării","vocative":"excizare"}},{"word":"excizat","pos":"adj","definitions":["excised"],"forms":{"feminine-singular":"excizată","masculine-plural":"excizați","feminine-neuter-plural":"excizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excizat","error-unrecognized-form-feminine-indefinite-singular":"excizată","error-unrecognized-form-indefinite-masculine-plural":"excizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"excizate","definite-error-unrecognized-form-masculine-neuter-singular":"excizatul","definite-error-unrecognized-form-feminine-singular":"excizata","definite-error-unrecognized-form-masculine-plural":"excizații","definite-error-unrecognized-form-feminine-neuter-plural":"excizatele"}},{"word":"excizat","pos":"verb","definitions":["past participle of exciza"],"forms":{"participle-past":"of exciza"}},{"word":"excizie","pos":"noun","definitions":["abscission"],"forms":{"plural":"excizii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excizie","accusative-definite-nominative-singular":"excizia","accusative-indefinite-nominative-plural":"excizii","accusative-definite-nominative-plural":"exciziile","dative-genitive-indefinite-singular":"excizii","dative-definite-genitive-singular":"exciziei","dative-genitive-indefinite-plural":"excizii","dative-definite-genitive-plural":"exciziilor","singular-vocative":"excizie","plural-vocative":"exciziilor"}},{"word":"exclam","pos":"verb","definitions":["first-person singular present indicative/subjunctive of exclama"],"pronunciation":"[eksˈklam]"},{"word":"exclama","pos":"verb","definitions":["to exclaim"],"forms":{"canonical":"a exclama 1st conjugation","present-singular-third-person":"exclamă","participle-past":"exclamat","subjunctive-third-person":"exclame","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exclama","gerund":"exclamând","first-person-indicative-present-singular":"exclam","indicative-present-second-person-singular":"exclami","indicative-present-singular-third-person":"exclamă","first-person-indicative-plural-present":"exclamăm","indicative-plural-present-second-person":"exclamați","indicative-plural-present-third-person":"exclamă","first-person-imperfect-indicative-singular":"exclamam","imperfect-indicative-second-person-singular":"exclamai","imperfect-indicative-singular-third-person":"exclama","first-person-imperfect-indicative-plural":"exclamam","imperfect-indicative-plural-second-person":"exclamați","imperfect-indicative-plural-third-person":"exclamau","first-person-indicative-perfect-singular":"exclamai","indicative-perfect-second-person-singular":"exclamași","indicative-perfect-singular-third-person":"exclamă","first-person-indicative-perfect-plural":"exclamarăm","indicative-perfect-plural-second-person":"exclamarăți","indicative-perfect-plural-third-person":"exclamară","first-person-indicative-pluperfect-singular":"exclamasem","indicative-pluperfect-second-person-singular":"exclamaseși","indicative-pluperfect-singular-third-person":"exclamase","first-person-indicative-pluperfect-plural":"exclamaserăm","indicative-pluperfect-plural-second-person":"exclamaserăți","indicative-pluperfect-plural-third-person":"exclamaseră","first-person-present-singular-subjunctive":"să exclam","present-second-person-singular-subjunctive":"să exclami","present-singular-subjunctive-third-person":"să exclame","first-person-plural-present-subjunctive":"să exclamăm","plural-present-second-person-subjunctive":"să exclamați","plural-present-subjunctive-third-person":"să exclame","imperative-second-person-singular":"exclamă","imperative-plural-second-person":"exclamați","imperative-negative-second-person-singular":"nu exclama","imperative-negative-plural-second-person":"nu exclamați"}},{"word":"exclamai","pos":"verb","definitions":["inflection of exclama:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eksklaˈmaj]"},{"word":"exclamam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exclama"],"pronunciation":"[eksklaˈmam]"},{"word":"exclamare","pos":"noun","definitions":["exclamation"],"forms":{"plural":"exclamări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exclamare","accusative-definite-nominative-singular":"exclamarea","accusative-indefinite-nominative-plural":"exclamări","accusative-definite-nominative-plural":"exclamările","dative-genitive-indefinite-singular":"exclamări","dative-definite-genitive-singular":"exclamării","dative-genitive-indefinite-plural":"exclamări","dative-definite-genitive-plural":"exclamărilor","singular-vocative":"exclamare","plural-vocative":"exclamărilor"}},{"word":"exclamase","pos":"verb","definitions":["third-person singular pluperfect indicative of exclama"],"pronunciation":"[eksklaˈmase]"},{"word":"exclamat","pos":"verb","definitions":["past participle of exclama"],"pronunciation":"[eksklaˈmat]"},{"word":"exclamație","pos":"noun","definitions":["exclamation"],"forms":{"plural":"exclamații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exclamație","accusative-definite-nominative-singular":"exclamația","accusative-indefinite-nominative-plural":"exclamații","accusative-definite-nominative-plural":"exclamațiile","dative-genitive-indefinite-singular":"exclamații","dative-definite-genitive-singular":"exclamației","dative-genitive-indefinite-plural":"exclamații","dative-definite-genitive-plural":"exclamațiilor","singular-vocative":"exclamație","plural-vocative":"exclamațiilor"}},{"word":"exclamațiune","pos":"noun","definitions":["obsolete form of exclamație"],"forms":{"plural":"exclamațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exclamațiune","accusative-definite-nominative-singular":"exclamațiunea","accusative-indefinite-nominative-plural":"exclamațiuni","accusative-definite-nominative-plural":"exclamațiunile","dative-genitive-indefinite-singular":"exclamațiuni","dative-definite-genitive-singular":"exclamațiunii","dative-genitive-indefinite-plural":"exclamațiuni","dative-definite-genitive-plural":"exclamațiunilor","singular-vocative":"exclamațiune","plural-vocative":"exclamațiunilor"}},{"word":"exclamativ","pos":"adj","definitions":["exclamatory"],"forms":{"feminine-singular":"exclamativă","masculine-plural":"exclamativi","feminine-neuter-plural":"exclamative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exclamativ","error-unrecognized-form-feminine-indefinite-singular":"exclamativă","error-unrecognized-form-indefinite-masculine-plural":"exclamativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exclamative","definite-error-unrecognized-form-masculine-neuter-singular":"exclamativul","definite-error-unrecognized-form-feminine-singular":"exclamativa","definite-error-unrecognized-form-masculine-plural":"exclamativii","definite-error-unrecognized-form-feminine-neuter-plural":"exclamativele"}},{"word":"exclamativă","pos":"noun","definitions":["exclamatory sentence"],"forms":{"plural":"exclamative","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exclamativă","accusative-definite-nominative-singular":"exclamativa","accusative-indefinite-nominative-plural":"exclamative","accusative-definite-nominative-plural":"exclamativele","dative-genitive-indefinite-singular":"exclamative","dative-definite-genitive-singular":"exclamativei","dative-genitive-indefinite-plural":"exclamative","dative-definite-genitive-plural":"exclamativelor","singular-vocative":"exclamativă","plural-vocative":"exclamativelor"}},{"word":"exclame","pos":"verb","definitions":["third-person singular/plural present subjunctive of exclama"],"pronunciation":"[eksˈklame]"},{"word":"exclami","pos":"verb","definitions":["second-person singular present indicative/subjunctive of exclama"],"pronunciation":"[eksˈklamʲ]"},{"word":"exclude","pos":"verb","definitions":["to exclude"],"pronunciation":"/eksˈklude/","forms":{"canonical":"a exclude 3rd conjugation","present-singular-third-person":"exclude","participle-past":"exclus","subjunctive-third-person":"excludă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-s","infinitive":"a exclude","gerund":"excluzând","first-person-indicative-present-singular":"exclud","indicative-present-second-person-singular":"excluzi","indicative-present-singular-third-person":"exclude","first-person-indicative-plural-present":"excludem","indicative-plural-present-second-person":"excludeți","indicative-plural-present-third-person":"exclud","first-person-imperfect-indicative-singular":"excludeam","imperfect-indicative-second-person-singular":"excludeai","imperfect-indicative-singular-third-person":"excludea","first-person-imperfect-indicative-plural":"excludeam","imperfect-indicative-plural-second-person":"excludeați","imperfect-indicative-plural-third-person":"excludeau","first-person-indicative-perfect-singular":"exclusei","indicative-perfect-second-person-singular":"excluseși","indicative-perfect-singular-third-person":"excluse","first-person-indicative-perfect-plural":"excluserăm","indicative-perfect-plural-second-person":"excluserăți","indicative-perfect-plural-third-person":"excluseră","first-person-indicative-pluperfect-singular":"exclusesem","indicative-pluperfect-second-person-singular":"excluseseși","indicative-pluperfect-singular-third-person":"exclusese","first-person-indicative-pluperfect-plural":"excluseserăm","indicative-pluperfect-plural-second-person":"excluseserăți","indicative-pluperfect-plural-third-person":"excluseseră","first-person-present-singular-subjunctive":"să exclud","present-second-person-singular-subjunctive":"să excluzi","present-singular-subjunctive-third-person":"să excludă","first-person-plural-present-subjunctive":"să excludem","plural-present-second-person-subjunctive":"să excludeți","plural-present-subjunctive-third-person":"să excludă","imperative-second-person-singular":"exclude","imperative-plural-second-person":"excludeți","imperative-negative-second-person-singular":"nu exclude","imperative-negative-plural-second-person":"nu excludeți"}},{"word":"excludere","pos":"noun","definitions":["exclusion"],"forms":{"plural":"excluderi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excludere","accusative-definite-nominative-singular":"excluderea","accusative-indefinite-nominative-plural":"excluderi","accusative-definite-nominative-plural":"excluderile","dative-genitive-indefinite-singular":"excluderi","dative-definite-genitive-singular":"excluderii","dative-genitive-indefinite-plural":"excluderi","dative-definite-genitive-plural":"excluderilor","singular-vocative":"excludere","plural-vocative":"excluderilor"}},{"word":"exclus","pos":"adj","definitions":["excluded"],"forms":{"feminine-singular":"exclusă","masculine-plural":"excluși","feminine-neuter-plural":"excluse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exclus","error-unrecognized-form-feminine-indefinite-singular":"exclusă","error-unrecognized-form-indefinite-masculine-plural":"excluși","error-unrecognized-form-feminine-indefinite-neuter-plural":"excluse","definite-error-unrecognized-form-masculine-neuter-singular":"exclusul","definite-error-unrecognized-form-feminine-singular":"exclusa","definite-error-unrecognized-form-masculine-plural":"exclușii","definite-error-unrecognized-form-feminine-neuter-plural":"exclusele"}},{"word":"exclusiv","pos":"adj","definitions":["exclusive"],"forms":{"feminine-singular":"exclusivă","masculine-plural":"exclusivi","feminine-neuter-plural":"exclusive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exclusiv","error-unrecognized-form-feminine-indefinite-singular":"exclusivă","error-unrecognized-form-indefinite-masculine-plural":"exclusivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exclusive","definite-error-unrecognized-form-masculine-neuter-singular":"exclusivul","definite-error-unrecognized-form-feminine-singular":"exclusiva","definite-error-unrecognized-form-masculine-plural":"exclusivii","definite-error-unrecognized-form-feminine-neuter-plural":"exclusivele"}},{"word":"exclusivamente","pos":"adv","definitions":["exclusive"]},{"word":"exclusivism","pos":"noun","definitions":["exclusivism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exclusivism","accusative-definite-nominative":"exclusivismul","dative-genitive-indefinite":"exclusivism","dative-definite-genitive":"exclusivismului","vocative":"exclusivismule"}},{"word":"exclusivist","pos":"adj","definitions":["exclusive"],"forms":{"feminine-singular":"exclusivistă","masculine-plural":"exclusiviști","feminine-neuter-plural":"exclusiviste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exclusivist","error-unrecognized-form-feminine-indefinite-singular":"exclusivistă","error-unrecognized-form-indefinite-masculine-plural":"exclusiviști","error-unrecognized-form-feminine-indefinite-neuter-plural":"exclusiviste","definite-error-unrecognized-form-masculine-neuter-singular":"exclusivistul","definite-error-unrecognized-form-feminine-singular":"exclusivista","definite-error-unrecognized-form-masculine-plural":"exclusiviștii","definite-error-unrecognized-form-feminine-neuter-plural":"exclusivistele"}},{"word":"exclusivitate","pos":"noun","definitions":["exclusivity"],"pronunciation":"[ek.sklu.si.viˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"exclusivitate","accusative-definite-nominative":"exclusivitatea","dative-genitive-indefinite":"exclusivități","dative-definite-genitive":"exclusivității","vocative":"exclusivitate"}},{"word":"excluzie","pos":"noun","definitions":["exclusion"],"forms":{"plural":"excluzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excluzie","accusative-definite-nominative-singular":"excluzia","accusative-indefinite-nominative-plural":"excluzii","accusative-definite-nominative-plural":"excluziile","dative-genitive-indefinite-singular":"excluzii","dative-definite-genitive-singular":"excluziei","dative-genitive-indefinite-plural":"excluzii","dative-definite-genitive-plural":"excluziilor","singular-vocative":"excluzie","plural-vocative":"excluziilor"}},{"word":"excluziune","pos":"noun","definitions":["exclusion"],"forms":{"plural":"excluziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excluziune","accusative-definite-nominative-singular":"excluziunea","accusative-indefinite-nominative-plural":"excluziuni","accusative-definite-nominative-plural":"excluziunile","dative-genitive-indefinite-singular":"excluziuni","dative-definite-genitive-singular":"excluziunii","dative-genitive-indefinite-plural":"excluziuni","dative-definite-genitive-plural":"excluziunilor","singular-vocative":"excluziune","plural-vocative":"excluziunilor"}},{"word":"excluzivitate","pos":"noun","definitions":["obsolete form of exclusivitate"],"forms":{"plural":"excluzivități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excluzivitate","accusative-definite-nominative-singular":"excluzivitatea","accusative-indefinite-nominative-plural":"excluzivități","accusative-definite-nominative-plural":"excluzivitățile","dative-genitive-indefinite-singular":"excluzivități","dative-definite-genitive-singular":"excluzivității","dative-genitive-indefinite-plural":"excluzivități","dative-definite-genitive-plural":"excluzivităților","singular-vocative":"excluzivitate","plural-vocative":"excluzivităților"}},{"word":"excogita","pos":"verb","definitions":["to excogitate (think up)"],"pronunciation":"/eks.ko.d͡ʒiˈta/","forms":{"canonical":"a excogita 1st conjugation","present-singular-third-person":"excogitează","participle-past":"excogitat","subjunctive-third-person":"excogiteze","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excogita","gerund":"excogitând","first-person-indicative-present-singular":"excogitez","indicative-present-second-person-singular":"excogitezi","indicative-present-singular-third-person":"excogitează","first-person-indicative-plural-present":"excogităm","indicative-plural-present-second-person":"excogitați","indicative-plural-present-third-person":"excogitează","first-person-imperfect-indicative-singular":"excogitam","imperfect-indicative-second-person-singular":"excogitai","imperfect-indicative-singular-third-person":"excogita","first-person-imperfect-indicative-plural":"excogitam","imperfect-indicative-plural-second-person":"excogitați","imperfect-indicative-plural-third-person":"excogitau","first-person-indicative-perfect-singular":"excogitai","indicative-perfect-second-person-singular":"excogitași","indicative-perfect-singular-third-person":"excogită","first-person-indicative-perfect-plural":"excogitarăm","indicative-perfect-plural-second-person":"excogitarăți","indicative-perfect-plural-third-person":"excogitară","first-person-indicative-pluperfect-singular":"excogitasem","indicative-pluperfect-second-person-singular":"excogitaseși","indicative-pluperfect-singular-third-person":"excogitase","first-person-indicative-pluperfect-plural":"excogitaserăm","indicative-pluperfect-plural-second-person":"excogitaserăți","indicative-pluperfect-plural-third-person":"excogitaseră","first-person-present-singular-subjunctive":"să excogitez","present-second-person-singular-subjunctive":"să excogitezi","present-singular-subjunctive-third-person":"să excogiteze","first-person-plural-present-subjunctive":"să excogităm","plural-present-second-person-subjunctive":"să excogitați","plural-present-subjunctive-third-person":"să excogiteze","imperative-second-person-singular":"excogitează","imperative-plural-second-person":"excogitați","imperative-negative-second-person-singular":"nu excogita","imperative-negative-plural-second-person":"nu excogitați","alternative":"екскоӂита"}},{"word":"excogitare","pos":"noun","definitions":["excogitation"],"forms":{"plural":"excogitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excogitare","accusative-definite-nominative-singular":"excogitarea","accusative-indefinite-nominative-plural":"excogitări","accusative-definite-nominative-plural":"excogitările","dative-genitive-indefinite-singular":"excogitări","dative-definite-genitive-singular":"excogitării","dative-genitive-indefinite-plural":"excogitări","dative-definite-genitive-plural":"excogitărilor","singular-vocative":"excogitare","plural-vocative":"excogitărilor"}},{"word":"excogitație","pos":"noun","definitions":["excogitation"],"forms":{"plural":"excogitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excogitație","accusative-definite-nominative-singular":"excogitația","accusative-indefinite-nominative-plural":"excogitații","accusative-definite-nominative-plural":"excogitațiile","dative-genitive-indefinite-singular":"excogitații","dative-definite-genitive-singular":"excogitației","dative-genitive-indefinite-plural":"excogitații","dative-definite-genitive-plural":"excogitațiilor","singular-vocative":"excogitație","plural-vocative":"excogitațiilor"}},{"word":"excomunica","pos":"verb","definitions":["to excommunicate"],"forms":{"canonical":"a excomunica 1st conjugation","present-singular-third-person":"excomunică","participle-past":"excomunicat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a excomunica","gerund":"excomunicând","first-person-indicative-present-singular":"excomunic","indicative-present-second-person-singular":"excomunici","indicative-present-singular-third-person":"excomunică","first-person-indicative-plural-present":"excomunicăm","indicative-plural-present-second-person":"excomunicați","indicative-plural-present-third-person":"excomunică","first-person-imperfect-indicative-singular":"excomunicam","imperfect-indicative-second-person-singular":"excomunicai","imperfect-indicative-singular-third-person":"excomunica","first-person-imperfect-indicative-plural":"excomunicam","imperfect-indicative-plural-second-person":"excomunicați","imperfect-indicative-plural-third-person":"excomunicau","first-person-indicative-perfect-singular":"excomunicai","indicative-perfect-second-person-singular":"excomunicași","indicative-perfect-singular-third-person":"excomunică","first-person-indicative-perfect-plural":"excomunicarăm","indicative-perfect-plural-second-person":"excomunicarăți","indicative-perfect-plural-third-person":"excomunicară","first-person-indicative-pluperfect-singular":"excomunicasem","indicative-pluperfect-second-person-singular":"excomunicaseși","indicative-pluperfect-singular-third-person":"excomunicase","first-person-indicative-pluperfect-plural":"excomunicaserăm","indicative-pluperfect-plural-second-person":"excomunicaserăți","indicative-pluperfect-plural-third-person":"excomunicaseră","first-person-present-singular-subjunctive":"să excomunic","present-second-person-singular-subjunctive":"să excomunici","present-singular-subjunctive-third-person":"să excomunice","first-person-plural-present-subjunctive":"să excomunicăm","plural-present-second-person-subjunctive":"să excomunicați","plural-present-subjunctive-third-person":"să excomunice","imperative-second-person-singular":"excomunică","imperative-plural-second-person":"excomunicați","imperative-negative-second-person-singular":"nu excomunica","imperative-negative-plural-second-person":"nu excomunicați"}},{"word":"excomunicare","pos":"noun","definitions":["excommunication"],"forms":{"plural":"excomunicări"}},{"word":"excomunicat","pos":"adj","definitions":["excommunicated"],"forms":{"feminine-singular":"excomunicată","masculine-plural":"excomunicați","feminine-neuter-plural":"excomunicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excomunicat","error-unrecognized-form-feminine-indefinite-singular":"excomunicată","error-unrecognized-form-indefinite-masculine-plural":"excomunicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"excomunicate","definite-error-unrecognized-form-masculine-neuter-singular":"excomunicatul","definite-error-unrecognized-form-feminine-singular":"excomunicata","definite-error-unrecognized-form-masculine-plural":"excomunicații","definite-error-unrecognized-form-feminine-neuter-plural":"excomunicatele"}},{"word":"excomunicat","pos":"verb","definitions":["past participle of excomunica"],"forms":{"participle-past":"of excomunica"}},{"word":"excomunicație","pos":"noun","definitions":["excommunication"],"forms":{"plural":"excomunicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excomunicație","accusative-definite-nominative-singular":"excomunicația","accusative-indefinite-nominative-plural":"excomunicații","accusative-definite-nominative-plural":"excomunicațiile","dative-genitive-indefinite-singular":"excomunicații","dative-definite-genitive-singular":"excomunicației","dative-genitive-indefinite-plural":"excomunicații","dative-definite-genitive-plural":"excomunicațiilor","singular-vocative":"excomunicație","plural-vocative":"excomunicațiilor"}},{"word":"excoria","pos":"verb","definitions":["to excoriate"],"forms":{"canonical":"a excoria 1st conjugation","present-singular-third-person":"excoriază","participle-past":"excoriat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a excoria","gerund":"excoriind","first-person-indicative-present-singular":"excorii","indicative-present-second-person-singular":"excorii","indicative-present-singular-third-person":"excorie","first-person-indicative-plural-present":"excoriem","indicative-plural-present-second-person":"excoriați","indicative-plural-present-third-person":"excorie","first-person-imperfect-indicative-singular":"excoriam","imperfect-indicative-second-person-singular":"excoriai","imperfect-indicative-singular-third-person":"excoria","first-person-imperfect-indicative-plural":"excoriam","imperfect-indicative-plural-second-person":"excoriați","imperfect-indicative-plural-third-person":"excoriau","first-person-indicative-perfect-singular":"excoriai","indicative-perfect-second-person-singular":"excoriași","indicative-perfect-singular-third-person":"excorie","first-person-indicative-perfect-plural":"excoriarăm","indicative-perfect-plural-second-person":"excoriarăți","indicative-perfect-plural-third-person":"excoriară","first-person-indicative-pluperfect-singular":"excoriasem","indicative-pluperfect-second-person-singular":"excoriaseși","indicative-pluperfect-singular-third-person":"excoriase","first-person-indicative-pluperfect-plural":"excoriaserăm","indicative-pluperfect-plural-second-person":"excoriaserăți","indicative-pluperfect-plural-third-person":"excoriaseră","first-person-present-singular-subjunctive":"să excorii","present-second-person-singular-subjunctive":"să excorii","present-singular-subjunctive-third-person":"să excorie","first-person-plural-present-subjunctive":"să excoriem","plural-present-second-person-subjunctive":"să excoriați","plural-present-subjunctive-third-person":"să excorie","imperative-second-person-singular":"excorie","imperative-plural-second-person":"excoriați","imperative-negative-second-person-singular":"nu excoria","imperative-negative-plural-second-person":"nu excoriați"}},{"word":"excoriație","pos":"noun","definitions":["excoriation"],"forms":{"plural":"excoriații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excoriație","accusative-definite-nominative-singular":"excoriația","accusative-indefinite-nominative-plural":"excoriații","accusative-definite-nominative-plural":"excoriațiile","dative-genitive-indefinite-singular":"excoriații","dative-definite-genitive-singular":"excoriației","dative-genitive-indefinite-plural":"excoriații","dative-definite-genitive-plural":"excoriațiilor","singular-vocative":"excoriație","plural-vocative":"excoriațiilor"}},{"word":"excoriere","pos":"noun","definitions":["excoriation"],"forms":{"plural":"excorieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excoriere","accusative-definite-nominative-singular":"excorierea","accusative-indefinite-nominative-plural":"excorieri","accusative-definite-nominative-plural":"excorierile","dative-genitive-indefinite-singular":"excorieri","dative-definite-genitive-singular":"excorierii","dative-genitive-indefinite-plural":"excorieri","dative-definite-genitive-plural":"excorierilor","singular-vocative":"excoriere","plural-vocative":"excorierilor"}},{"word":"excorporație","pos":"noun","definitions":["excorporation"],"forms":{"plural":"excorporații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excorporație","accusative-definite-nominative-singular":"excorporația","accusative-indefinite-nominative-plural":"excorporații","accusative-definite-nominative-plural":"excorporațiile","dative-genitive-indefinite-singular":"excorporații","dative-definite-genitive-singular":"excorporației","dative-genitive-indefinite-plural":"excorporații","dative-definite-genitive-plural":"excorporațiilor","singular-vocative":"excorporație","plural-vocative":"excorporațiilor"}},{"word":"excrement","pos":"noun","definitions":["excrement, feces"],"forms":{"plural":"excremente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"excrement","accusative-definite-nominative-singular":"excrementul","accusative-indefinite-nominative-plural":"excremente","accusative-definite-nominative-plural":"excrementele","dative-genitive-indefinite-singular":"excrement","dative-definite-genitive-singular":"excrementului","dative-genitive-indefinite-plural":"excremente","dative-definite-genitive-plural":"excrementelor","singular-vocative":"excrementule","plural-vocative":"excrementelor"}},{"word":"excremență","pos":"noun","definitions":["excrement"],"forms":{"plural":"excremențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"excremență","accusative-definite-nominative-singular":"excremența","accusative-indefinite-nominative-plural":"excremențe","accusative-definite-nominative-plural":"excremențele","dative-genitive-indefinite-singular":"excremențe","dative-definite-genitive-singular":"excremenței","dative-genitive-indefinite-plural":"excremențe","dative-definite-genitive-plural":"excremențelor","singular-vocative":"excremență","plural-vocative":"excremențelor"}},{"word":"excremental","pos":"adj","definitions":["excremental"],"forms":{"feminine-singular":"excrementală","masculine-plural":"excrementali","feminine-neuter-plural":"excrementale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excremental","error-unrecognized-form-feminine-indefinite-singular":"excrementală","error-unrecognized-form-indefinite-masculine-plural":"excrementali","error-unrecognized-form-feminine-indefinite-neuter-plural":"excrementale","definite-error-unrecognized-form-masculine-neuter-singular":"excrementalul","definite-error-unrecognized-form-feminine-singular":"excrementala","definite-error-unrecognized-form-masculine-plural":"excrementalii","definite-error-unrecognized-form-feminine-neuter-plural":"excrementalele"}},{"word":"excremente","pos":"noun","definitions":["plural of excrement"]},{"word":"excremențial","pos":"adj","definitions":["excremental"],"forms":{"feminine-singular":"excremențială","masculine-plural":"excremențiali","feminine-neuter-plural":"excremențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excremențial","error-unrecognized-form-feminine-indefinite-singular":"excremențială","error-unrecognized-form-indefinite-masculine-plural":"excremențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"excremențiale","definite-error-unrecognized-form-masculine-neuter-singular":"excremențialul","definite-error-unrecognized-form-feminine-singular":"excremențiala","definite-error-unrecognized-form-masculine-plural":"excremențialii","definite-error-unrecognized-form-feminine-neuter-plural":"excremențialele"}},{"word":"excrescență","pos":"noun","definitions":["excrescence"],"forms":{"plural":"excrescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"excrescență","accusative-definite-nominative-singular":"excrescența","accusative-indefinite-nominative-plural":"excrescențe","accusative-definite-nominative-plural":"excrescențele","dative-genitive-indefinite-singular":"excrescențe","dative-definite-genitive-singular":"excrescenței","dative-genitive-indefinite-plural":"excrescențe","dative-definite-genitive-plural":"excrescențelor","singular-vocative":"excrescență","plural-vocative":"excrescențelor"}},{"word":"excreta","pos":"verb","definitions":["to excrete"],"forms":{"canonical":"a excreta 1st conjugation","present-singular-third-person":"excretez","participle-past":"excretat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a excreta","gerund":"excretând","first-person-indicative-present-singular":"excretez","indicative-present-second-person-singular":"excretezi","indicative-present-singular-third-person":"excretează","first-person-indicative-plural-present":"excretăm","indicative-plural-present-second-person":"excretați","indicative-plural-present-third-person":"excretează","first-person-imperfect-indicative-singular":"excretam","imperfect-indicative-second-person-singular":"excretai","imperfect-indicative-singular-third-person":"excreta","first-person-imperfect-indicative-plural":"excretam","imperfect-indicative-plural-second-person":"excretați","imperfect-indicative-plural-third-person":"excretau","first-person-indicative-perfect-singular":"excretai","indicative-perfect-second-person-singular":"excretași","indicative-perfect-singular-third-person":"excretă","first-person-indicative-perfect-plural":"excretarăm","indicative-perfect-plural-second-person":"excretarăți","indicative-perfect-plural-third-person":"excretară","first-person-indicative-pluperfect-singular":"excretasem","indicative-pluperfect-second-person-singular":"excretaseși","indicative-pluperfect-singular-third-person":"excretase","first-person-indicative-pluperfect-plural":"excretaserăm","indicative-pluperfect-plural-second-person":"excretaserăți","indicative-pluperfect-plural-third-person":"excretaseră","first-person-present-singular-subjunctive":"să excretez","present-second-person-singular-subjunctive":"să excretezi","present-singular-subjunctive-third-person":"să excreteze","first-person-plural-present-subjunctive":"să excretăm","plural-present-second-person-subjunctive":"să excretați","plural-present-subjunctive-third-person":"să excreteze","imperative-second-person-singular":"excretează","imperative-plural-second-person":"excretați","imperative-negative-second-person-singular":"nu excreta","imperative-negative-plural-second-person":"nu excretați"}},{"word":"excreție","pos":"noun","definitions":["excretion"],"pronunciation":"/eksˈkret͡si.e/","forms":{"plural":"excreții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excreție","accusative-definite-nominative-singular":"excreția","accusative-indefinite-nominative-plural":"excreții","accusative-definite-nominative-plural":"excrețiile","dative-genitive-indefinite-singular":"excreții","dative-definite-genitive-singular":"excreției","dative-genitive-indefinite-plural":"excreții","dative-definite-genitive-plural":"excrețiilor","singular-vocative":"excreție","plural-vocative":"excrețiilor"}},{"word":"excrețiune","pos":"noun","definitions":["obsolete form of excreție"],"forms":{"plural":"excrețiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excrețiune","accusative-definite-nominative-singular":"excrețiunea","accusative-indefinite-nominative-plural":"excrețiuni","accusative-definite-nominative-plural":"excrețiunile","dative-genitive-indefinite-singular":"excrețiuni","dative-definite-genitive-singular":"excrețiunii","dative-genitive-indefinite-plural":"excrețiuni","dative-definite-genitive-plural":"excrețiunilor","singular-vocative":"excrețiune","plural-vocative":"excrețiunilor"}},{"word":"excretiv","pos":"adj","definitions":["excretory"],"forms":{"feminine-singular":"excretivă","masculine-plural":"excretivi","feminine-neuter-plural":"excretive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excretiv","error-unrecognized-form-feminine-indefinite-singular":"excretivă","error-unrecognized-form-indefinite-masculine-plural":"excretivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"excretive","definite-error-unrecognized-form-masculine-neuter-singular":"excretivul","definite-error-unrecognized-form-feminine-singular":"excretiva","definite-error-unrecognized-form-masculine-plural":"excretivii","definite-error-unrecognized-form-feminine-neuter-plural":"excretivele"}},{"word":"excretor","pos":"adj","definitions":["excretory"],"forms":{"feminine-singular":"excretoare","masculine-plural":"excretori","feminine-neuter-plural":"excretoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excretor","error-unrecognized-form-feminine-indefinite-singular":"excretoare","error-unrecognized-form-indefinite-masculine-plural":"excretori","error-unrecognized-form-feminine-indefinite-neuter-plural":"excretoare","definite-error-unrecognized-form-masculine-neuter-singular":"excretorul","definite-error-unrecognized-form-feminine-singular":"excretoarea","definite-error-unrecognized-form-masculine-plural":"excretorii","definite-error-unrecognized-form-feminine-neuter-plural":"excretoarele"}},{"word":"excretoriu","pos":"adj","definitions":["excretory"],"forms":{"feminine-singular":"excretorie","plural":"excretorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excretoriu","error-unrecognized-form-feminine-indefinite-singular":"excretorie","error-unrecognized-form-indefinite-masculine-plural":"excretorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"excretorii","definite-error-unrecognized-form-masculine-neuter-singular":"excretoriul","definite-error-unrecognized-form-feminine-singular":"excretoria","definite-error-unrecognized-form-masculine-plural":"excretoriii","definite-error-unrecognized-form-feminine-neuter-plural":"excretoriile"}},{"word":"excrocherie","pos":"noun","definitions":["obsolete form of escrocherie"],"forms":{"plural":"excrocherii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excrocherie","accusative-definite-nominative-singular":"excrocheria","accusative-indefinite-nominative-plural":"excrocherii","accusative-definite-nominative-plural":"excrocheriile","dative-genitive-indefinite-singular":"excrocherii","dative-definite-genitive-singular":"excrocheriei","dative-genitive-indefinite-plural":"excrocherii","dative-definite-genitive-plural":"excrocheriilor","singular-vocative":"excrocherie","plural-vocative":"excrocheriilor"}},{"word":"excurs","pos":"noun","definitions":["excursus"],"forms":{"plural":"excursuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"excurs","accusative-definite-nominative-singular":"excursul","accusative-indefinite-nominative-plural":"excursuri","accusative-definite-nominative-plural":"excursurile","dative-genitive-indefinite-singular":"excurs","dative-definite-genitive-singular":"excursului","dative-genitive-indefinite-plural":"excursuri","dative-definite-genitive-plural":"excursurilor","singular-vocative":"excursule","plural-vocative":"excursurilor"}},{"word":"excursie","pos":"noun","definitions":["trip"],"forms":{"plural":"excursii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excursie","accusative-definite-nominative-singular":"excursia","accusative-indefinite-nominative-plural":"excursii","accusative-definite-nominative-plural":"excursiile","dative-genitive-indefinite-singular":"excursii","dative-definite-genitive-singular":"excursiei","dative-genitive-indefinite-plural":"excursii","dative-definite-genitive-plural":"excursiilor","singular-vocative":"excursie","plural-vocative":"excursiilor"}},{"word":"excursionism","pos":"noun","definitions":["excursionism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"excursionism","accusative-definite-nominative":"excursionismul","dative-genitive-indefinite":"excursionism","dative-definite-genitive":"excursionismului","vocative":"excursionismule"}},{"word":"excursionist","pos":"noun","definitions":["excursionist"],"forms":{"plural":"excursioniști","feminine":"equivalent excursionistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"excursionist","accusative-definite-nominative-singular":"excursionistul","accusative-indefinite-nominative-plural":"excursioniști","accusative-definite-nominative-plural":"excursioniștii","dative-genitive-indefinite-singular":"excursionist","dative-definite-genitive-singular":"excursionistului","dative-genitive-indefinite-plural":"excursioniști","dative-definite-genitive-plural":"excursioniștilor","singular-vocative":"excursionistule","plural-vocative":"excursioniștilor"}},{"word":"excursionistă","pos":"noun","definitions":["female equivalent of excursionist"],"forms":{"plural":"excursioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"excursionistă","accusative-definite-nominative-singular":"excursionista","accusative-indefinite-nominative-plural":"excursioniste","accusative-definite-nominative-plural":"excursionistele","dative-genitive-indefinite-singular":"excursioniste","dative-definite-genitive-singular":"excursionistei","dative-genitive-indefinite-plural":"excursioniste","dative-definite-genitive-plural":"excursionistelor","singular-vocative":"excursionistă","plural-vocative":"excursionistelor"}},{"word":"excursiune","pos":"noun","definitions":["alternative form of excursie"],"forms":{"plural":"excursiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"excursiune","accusative-definite-nominative-singular":"excursiunea","accusative-indefinite-nominative-plural":"excursiuni","accusative-definite-nominative-plural":"excursiunile","dative-genitive-indefinite-singular":"excursiuni","dative-definite-genitive-singular":"excursiunii","dative-genitive-indefinite-plural":"excursiuni","dative-definite-genitive-plural":"excursiunilor","singular-vocative":"excursiune","plural-vocative":"excursiunilor"}},{"word":"excursiv","pos":"adj","definitions":["excursive"],"forms":{"feminine-singular":"excursivă","masculine-plural":"excursivi","feminine-neuter-plural":"excursive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"excursiv","error-unrecognized-form-feminine-indefinite-singular":"excursivă","error-unrecognized-form-indefinite-masculine-plural":"excursivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"excursive","definite-error-unrecognized-form-masculine-neuter-singular":"excursivul","definite-error-unrecognized-form-feminine-singular":"excursiva","definite-error-unrecognized-form-masculine-plural":"excursivii","definite-error-unrecognized-form-feminine-neuter-plural":"excursivele"}},{"word":"excuzație","pos":"noun","definitions":["excuse"],"forms":{"plural":"excuzații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"excuzație","accusative-definite-nominative-singular":"excuzația","accusative-indefinite-nominative-plural":"excuzații","accusative-definite-nominative-plural":"excuzațiile","dative-genitive-indefinite-singular":"excuzații","dative-definite-genitive-singular":"excuzației","dative-genitive-indefinite-plural":"excuzații","dative-definite-genitive-plural":"excuzațiilor","singular-vocative":"excuzație","plural-vocative":"excuzațiilor"}},{"word":"execra","pos":"verb","definitions":["to loathe"],"forms":{"canonical":"a execra 1st conjugation","present-singular-third-person":"execrează","participle-past":"execrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a execra","gerund":"execrând","first-person-indicative-present-singular":"execrez","indicative-present-second-person-singular":"execrezi","indicative-present-singular-third-person":"execrează","first-person-indicative-plural-present":"execrăm","indicative-plural-present-second-person":"execrați","indicative-plural-present-third-person":"execrează","first-person-imperfect-indicative-singular":"execram","imperfect-indicative-second-person-singular":"execrai","imperfect-indicative-singular-third-person":"execra","first-person-imperfect-indicative-plural":"execram","imperfect-indicative-plural-second-person":"execrați","imperfect-indicative-plural-third-person":"execrau","first-person-indicative-perfect-singular":"execrai","indicative-perfect-second-person-singular":"execrași","indicative-perfect-singular-third-person":"execră","first-person-indicative-perfect-plural":"execrarăm","indicative-perfect-plural-second-person":"execrarăți","indicative-perfect-plural-third-person":"execrară","first-person-indicative-pluperfect-singular":"execrasem","indicative-pluperfect-second-person-singular":"execraseși","indicative-pluperfect-singular-third-person":"execrase","first-person-indicative-pluperfect-plural":"execraserăm","indicative-pluperfect-plural-second-person":"execraserăți","indicative-pluperfect-plural-third-person":"execraseră","first-person-present-singular-subjunctive":"să execrez","present-second-person-singular-subjunctive":"să execrezi","present-singular-subjunctive-third-person":"să execreze","first-person-plural-present-subjunctive":"să execrăm","plural-present-second-person-subjunctive":"să execrați","plural-present-subjunctive-third-person":"să execreze","imperative-second-person-singular":"execrează","imperative-plural-second-person":"execrați","imperative-negative-second-person-singular":"nu execra","imperative-negative-plural-second-person":"nu execrați"}},{"word":"execrabil","pos":"adj","definitions":["execrable"],"forms":{"feminine-singular":"execrabilă","masculine-plural":"execrabili","feminine-neuter-plural":"execrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"execrabil","error-unrecognized-form-feminine-indefinite-singular":"execrabilă","error-unrecognized-form-indefinite-masculine-plural":"execrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"execrabile","definite-error-unrecognized-form-masculine-neuter-singular":"execrabilul","definite-error-unrecognized-form-feminine-singular":"execrabila","definite-error-unrecognized-form-masculine-plural":"execrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"execrabilele"}},{"word":"execrăciune","pos":"noun","definitions":["obsolete form of execrație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"execrăciune","accusative-definite-nominative":"execrăciunea","dative-genitive-indefinite":"execrăciuni","dative-definite-genitive":"execrăciunii","vocative":"execrăciune"}},{"word":"execrare","pos":"noun","definitions":["execration"],"forms":{"plural":"execrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"execrare","accusative-definite-nominative-singular":"execrarea","accusative-indefinite-nominative-plural":"execrări","accusative-definite-nominative-plural":"execrările","dative-genitive-indefinite-singular":"execrări","dative-definite-genitive-singular":"execrării","dative-genitive-indefinite-plural":"execrări","dative-definite-genitive-plural":"execrărilor","singular-vocative":"execrare","plural-vocative":"execrărilor"}},{"word":"execrație","pos":"noun","definitions":["execration"],"forms":{"plural":"execrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"execrație","accusative-definite-nominative-singular":"execrația","accusative-indefinite-nominative-plural":"execrații","accusative-definite-nominative-plural":"execrațiile","dative-genitive-indefinite-singular":"execrații","dative-definite-genitive-singular":"execrației","dative-genitive-indefinite-plural":"execrații","dative-definite-genitive-plural":"execrațiilor","singular-vocative":"execrație","plural-vocative":"execrațiilor"}},{"word":"execrațiune","pos":"noun","definitions":["obsolete form of execrație"],"forms":{"plural":"execrațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"execrațiune","accusative-definite-nominative-singular":"execrațiunea","accusative-indefinite-nominative-plural":"execrațiuni","accusative-definite-nominative-plural":"execrațiunile","dative-genitive-indefinite-singular":"execrațiuni","dative-definite-genitive-singular":"execrațiunii","dative-genitive-indefinite-plural":"execrațiuni","dative-definite-genitive-plural":"execrațiunilor","singular-vocative":"execrațiune","plural-vocative":"execrațiunilor"}},{"word":"executa","pos":"verb","definitions":["to execute"],"forms":{"canonical":"a executa 1st conjugation","present-singular-third-person":"execută","participle-past":"executat","subjunctive-third-person":"execute","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a executa","gerund":"executând","first-person-indicative-present-singular":"execut","indicative-present-second-person-singular":"execuți","indicative-present-singular-third-person":"execută","first-person-indicative-plural-present":"executăm","indicative-plural-present-second-person":"executați","indicative-plural-present-third-person":"execută","first-person-imperfect-indicative-singular":"executam","imperfect-indicative-second-person-singular":"executai","imperfect-indicative-singular-third-person":"executa","first-person-imperfect-indicative-plural":"executam","imperfect-indicative-plural-second-person":"executați","imperfect-indicative-plural-third-person":"executau","first-person-indicative-perfect-singular":"executai","indicative-perfect-second-person-singular":"executași","indicative-perfect-singular-third-person":"execută","first-person-indicative-perfect-plural":"executarăm","indicative-perfect-plural-second-person":"executarăți","indicative-perfect-plural-third-person":"executară","first-person-indicative-pluperfect-singular":"executasem","indicative-pluperfect-second-person-singular":"executaseși","indicative-pluperfect-singular-third-person":"executase","first-person-indicative-pluperfect-plural":"executaserăm","indicative-pluperfect-plural-second-person":"executaserăți","indicative-pluperfect-plural-third-person":"executaseră","first-person-present-singular-subjunctive":"să execut","present-second-person-singular-subjunctive":"să execuți","present-singular-subjunctive-third-person":"să execute","first-person-plural-present-subjunctive":"să executăm","plural-present-second-person-subjunctive":"să executați","plural-present-subjunctive-third-person":"să execute","imperative-second-person-singular":"execută","imperative-plural-second-person":"executați","imperative-negative-second-person-singular":"nu executa","imperative-negative-plural-second-person":"nu executați"}},{"word":"executabil","pos":"adj","definitions":["executable"],"forms":{"feminine-singular":"executabilă","masculine-plural":"executabili","feminine-neuter-plural":"executabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executabil","error-unrecognized-form-feminine-indefinite-singular":"executabilă","error-unrecognized-form-indefinite-masculine-plural":"executabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"executabile","definite-error-unrecognized-form-masculine-neuter-singular":"executabilul","definite-error-unrecognized-form-feminine-singular":"executabila","definite-error-unrecognized-form-masculine-plural":"executabilii","definite-error-unrecognized-form-feminine-neuter-plural":"executabilele"}},{"word":"executant","pos":"adj","definitions":["performing"],"forms":{"feminine-singular":"executantă","masculine-plural":"executanți","feminine-neuter-plural":"executante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executant","error-unrecognized-form-feminine-indefinite-singular":"executantă","error-unrecognized-form-indefinite-masculine-plural":"executanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"executante","definite-error-unrecognized-form-masculine-neuter-singular":"executantul","definite-error-unrecognized-form-feminine-singular":"executanta","definite-error-unrecognized-form-masculine-plural":"executanții","definite-error-unrecognized-form-feminine-neuter-plural":"executantele"}},{"word":"executare","pos":"noun","definitions":["execution"],"forms":{"plural":"executări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"executare","accusative-definite-nominative-singular":"executarea","accusative-indefinite-nominative-plural":"executări","accusative-definite-nominative-plural":"executările","dative-genitive-indefinite-singular":"executări","dative-definite-genitive-singular":"executării","dative-genitive-indefinite-plural":"executări","dative-definite-genitive-plural":"executărilor","singular-vocative":"executare","plural-vocative":"executărilor"}},{"word":"executarisi","pos":"verb","definitions":["to execute"],"forms":{"canonical":"a executarisi 4th conjugation","present-singular-third-person":"executarisie","participle-past":"executarisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a executarisi","gerund":"executarisind","first-person-indicative-present-singular":"executaris","indicative-present-second-person-singular":"executariși","indicative-present-singular-third-person":"executarise","first-person-indicative-plural-present":"executarisim","indicative-plural-present-second-person":"executarisiți","indicative-plural-present-third-person":"executaris","first-person-imperfect-indicative-singular":"executariseam","imperfect-indicative-second-person-singular":"executariseai","imperfect-indicative-singular-third-person":"executarisea","first-person-imperfect-indicative-plural":"executariseam","imperfect-indicative-plural-second-person":"executariseați","imperfect-indicative-plural-third-person":"executariseau","first-person-indicative-perfect-singular":"executarisii","indicative-perfect-second-person-singular":"executarisiși","indicative-perfect-singular-third-person":"executarisi","first-person-indicative-perfect-plural":"executarisirăm","indicative-perfect-plural-second-person":"executarisirăți","indicative-perfect-plural-third-person":"executarisiră","first-person-indicative-pluperfect-singular":"executarisisem","indicative-pluperfect-second-person-singular":"executarisiseși","indicative-pluperfect-singular-third-person":"executarisise","first-person-indicative-pluperfect-plural":"executarisiserăm","indicative-pluperfect-plural-second-person":"executarisiserăți","indicative-pluperfect-plural-third-person":"executarisiseră","first-person-present-singular-subjunctive":"să executaris","present-second-person-singular-subjunctive":"să executariși","present-singular-subjunctive-third-person":"să executarisă","first-person-plural-present-subjunctive":"să executarisim","plural-present-second-person-subjunctive":"să executarisiți","plural-present-subjunctive-third-person":"să executarisă","imperative-second-person-singular":"executarise","imperative-plural-second-person":"executarisiți","imperative-negative-second-person-singular":"nu executarisi","imperative-negative-plural-second-person":"nu executarisiți"}},{"word":"executarisire","pos":"noun","definitions":["execution"],"forms":{"plural":"executarisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"executarisire","accusative-definite-nominative-singular":"executarisirea","accusative-indefinite-nominative-plural":"executarisiri","accusative-definite-nominative-plural":"executarisirile","dative-genitive-indefinite-singular":"executarisiri","dative-definite-genitive-singular":"executarisirii","dative-genitive-indefinite-plural":"executarisiri","dative-definite-genitive-plural":"executarisirilor","singular-vocative":"executarisire","plural-vocative":"executarisirilor"}},{"word":"executat","pos":"adj","definitions":["executed"],"forms":{"feminine-singular":"executată","masculine-plural":"executați","feminine-neuter-plural":"executate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executat","error-unrecognized-form-feminine-indefinite-singular":"executată","error-unrecognized-form-indefinite-masculine-plural":"executați","error-unrecognized-form-feminine-indefinite-neuter-plural":"executate","definite-error-unrecognized-form-masculine-neuter-singular":"executatul","definite-error-unrecognized-form-feminine-singular":"executata","definite-error-unrecognized-form-masculine-plural":"executații","definite-error-unrecognized-form-feminine-neuter-plural":"executatele"}},{"word":"executat","pos":"verb","definitions":["past participle of executa"],"forms":{"participle-past":"of executa"}},{"word":"execuție","pos":"noun","definitions":["execution"],"pronunciation":"/eɡzeˈkut͡sie/","forms":{"plural":"execuții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"execuție","accusative-definite-nominative-singular":"execuția","accusative-indefinite-nominative-plural":"execuții","accusative-definite-nominative-plural":"execuțiile","dative-genitive-indefinite-singular":"execuții","dative-definite-genitive-singular":"execuției","dative-genitive-indefinite-plural":"execuții","dative-definite-genitive-plural":"execuțiilor","singular-vocative":"execuție","plural-vocative":"execuțiilor"}},{"word":"execuțiu","pos":"adj","definitions":["executive"],"forms":{"feminine-singular":"execuție","plural":"execuții","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"execuțiu","error-unrecognized-form-feminine-indefinite-singular":"execuție","error-unrecognized-form-indefinite-masculine-plural":"execuții","error-unrecognized-form-feminine-indefinite-neuter-plural":"execuții","definite-error-unrecognized-form-masculine-neuter-singular":"execuțiul","definite-error-unrecognized-form-feminine-singular":"execuția","definite-error-unrecognized-form-masculine-plural":"execuțiii","definite-error-unrecognized-form-feminine-neuter-plural":"execuțiile"}},{"word":"execuțiune","pos":"noun","definitions":["obsolete form of execuție"],"forms":{"plural":"execuțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"execuțiune","accusative-definite-nominative-singular":"execuțiunea","accusative-indefinite-nominative-plural":"execuțiuni","accusative-definite-nominative-plural":"execuțiunile","dative-genitive-indefinite-singular":"execuțiuni","dative-definite-genitive-singular":"execuțiunii","dative-genitive-indefinite-plural":"execuțiuni","dative-definite-genitive-plural":"execuțiunilor","singular-vocative":"execuțiune","plural-vocative":"execuțiunilor"}},{"word":"executiv","pos":"adj","definitions":["executive"],"forms":{"feminine-singular":"executivă","masculine-plural":"executivi","feminine-neuter-plural":"executive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executiv","error-unrecognized-form-feminine-indefinite-singular":"executivă","error-unrecognized-form-indefinite-masculine-plural":"executivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"executive","definite-error-unrecognized-form-masculine-neuter-singular":"executivul","definite-error-unrecognized-form-feminine-singular":"executiva","definite-error-unrecognized-form-masculine-plural":"executivii","definite-error-unrecognized-form-feminine-neuter-plural":"executivele"}},{"word":"executor","pos":"adj","definitions":["executory"],"forms":{"feminine-singular":"executoare","masculine-plural":"executori","feminine-neuter-plural":"executoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executor","error-unrecognized-form-feminine-indefinite-singular":"executoare","error-unrecognized-form-indefinite-masculine-plural":"executori","error-unrecognized-form-feminine-indefinite-neuter-plural":"executoare","definite-error-unrecognized-form-masculine-neuter-singular":"executorul","definite-error-unrecognized-form-feminine-singular":"executoarea","definite-error-unrecognized-form-masculine-plural":"executorii","definite-error-unrecognized-form-feminine-neuter-plural":"executoarele"}},{"word":"executor judecătoresc","pos":"noun","definitions":["bailiff"],"forms":{"plural":"executori judecătorești"}},{"word":"executor testamentar","pos":"noun","definitions":["executor"],"forms":{"plural":"executori testamentari"}},{"word":"executoriu","pos":"adj","definitions":["executory"],"forms":{"feminine-singular":"executorie","plural":"executorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"executoriu","error-unrecognized-form-feminine-indefinite-singular":"executorie","error-unrecognized-form-indefinite-masculine-plural":"executorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"executorii","definite-error-unrecognized-form-masculine-neuter-singular":"executoriul","definite-error-unrecognized-form-feminine-singular":"executoria","definite-error-unrecognized-form-masculine-plural":"executoriii","definite-error-unrecognized-form-feminine-neuter-plural":"executoriile"}},{"word":"exedră","pos":"noun","definitions":["exedra"],"forms":{"plural":"exedre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exedră","accusative-definite-nominative-singular":"exedra","accusative-indefinite-nominative-plural":"exedre","accusative-definite-nominative-plural":"exedrele","dative-genitive-indefinite-singular":"exedre","dative-definite-genitive-singular":"exedrei","dative-genitive-indefinite-plural":"exedre","dative-definite-genitive-plural":"exedrelor","singular-vocative":"exedră","plural-vocative":"exedrelor"}},{"word":"exeget","pos":"noun","definitions":["exegete; exegetist; interpreter"],"forms":{"plural":"exegeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exeget","accusative-definite-nominative-singular":"exegetul","accusative-indefinite-nominative-plural":"exegeți","accusative-definite-nominative-plural":"exegeții","dative-genitive-indefinite-singular":"exeget","dative-definite-genitive-singular":"exegetului","dative-genitive-indefinite-plural":"exegeți","dative-definite-genitive-plural":"exegeților","singular-vocative":"exegetule","plural-vocative":"exegeților"}},{"word":"exegete","pos":"noun","definitions":["feminine plural of exeget"]},{"word":"exegetic","pos":"adj","definitions":["exegetic, exegetical"],"forms":{"feminine-singular":"exegetică","masculine-plural":"exegetici","feminine-neuter-plural":"exegetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exegetic","error-unrecognized-form-feminine-indefinite-singular":"exegetică","error-unrecognized-form-indefinite-masculine-plural":"exegetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exegetice","definite-error-unrecognized-form-masculine-neuter-singular":"exegeticul","definite-error-unrecognized-form-feminine-singular":"exegetica","definite-error-unrecognized-form-masculine-plural":"exegeticii","definite-error-unrecognized-form-feminine-neuter-plural":"exegeticele"}},{"word":"exegetică","pos":"adj","definitions":["feminine singular nominative/accusative of exegetic"],"gender":"f-s"},{"word":"exegeză","pos":"noun","definitions":["exegesis"],"forms":{"plural":"exegeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exegeză","accusative-definite-nominative-singular":"exegeza","accusative-indefinite-nominative-plural":"exegeze","accusative-definite-nominative-plural":"exegezele","dative-genitive-indefinite-singular":"exegeze","dative-definite-genitive-singular":"exegezei","dative-genitive-indefinite-plural":"exegeze","dative-definite-genitive-plural":"exegezelor","singular-vocative":"exegeză","plural-vocative":"exegezelor"}},{"word":"exelbant","pos":"noun","definitions":["aiglet"],"forms":{"plural":"exelbanturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exelbant","accusative-definite-nominative-singular":"exelbantul","accusative-indefinite-nominative-plural":"exelbanturi","accusative-definite-nominative-plural":"exelbanturile","dative-genitive-indefinite-singular":"exelbant","dative-definite-genitive-singular":"exelbantului","dative-genitive-indefinite-plural":"exelbanturi","dative-definite-genitive-plural":"exelbanturilor","singular-vocative":"exelbantule","plural-vocative":"exelbanturilor"}},{"word":"exelență","pos":"noun","definitions":["obsolete form of excelență"],"forms":{"plural":"exelențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exelență","accusative-definite-nominative-singular":"exelența","accusative-indefinite-nominative-plural":"exelențe","accusative-definite-nominative-plural":"exelențele","dative-genitive-indefinite-singular":"exelențe","dative-definite-genitive-singular":"exelenței","dative-genitive-indefinite-plural":"exelențe","dative-definite-genitive-plural":"exelențelor","singular-vocative":"exelență","plural-vocative":"exelențelor"}},{"word":"exemplar","pos":"noun","definitions":["copy"],"pronunciation":"/ek.semˈplar/","forms":{"plural":"exemplare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exemplar","accusative-definite-nominative-singular":"exemplarul","accusative-indefinite-nominative-plural":"exemplare","accusative-definite-nominative-plural":"exemplarele","dative-genitive-indefinite-singular":"exemplar","dative-definite-genitive-singular":"exemplarului","dative-genitive-indefinite-plural":"exemplare","dative-definite-genitive-plural":"exemplarelor","singular-vocative":"exemplarule","plural-vocative":"exemplarelor"}},{"word":"exemplaritate","pos":"noun","definitions":["exemplarity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"exemplaritate","accusative-definite-nominative":"exemplaritatea","dative-genitive-indefinite":"exemplarități","dative-definite-genitive":"exemplarității","vocative":"exemplaritate"}},{"word":"exemplarnic","pos":"adj","definitions":["exemplary"],"forms":{"feminine-singular":"exemplarnică","masculine-plural":"exemplarnici","feminine-neuter-plural":"exemplarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exemplarnic","error-unrecognized-form-feminine-indefinite-singular":"exemplarnică","error-unrecognized-form-indefinite-masculine-plural":"exemplarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exemplarnice","definite-error-unrecognized-form-masculine-neuter-singular":"exemplarnicul","definite-error-unrecognized-form-feminine-singular":"exemplarnica","definite-error-unrecognized-form-masculine-plural":"exemplarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"exemplarnicele"}},{"word":"exemple","pos":"noun","definitions":["plural of exemplu"],"pronunciation":"[eɡˈzem.ple]","gender":"n-p"},{"word":"exemplele","pos":"noun","definitions":["definite nominative/accusative plural of exemplu"],"pronunciation":"[eɡˈzem.ple.le]","gender":"n"},{"word":"exemplelor","pos":"noun","definitions":["definite genitive/dative plural of exemplu"],"pronunciation":"[eɡˈzem.ple.lor]","gender":"n"},{"word":"exemplifica","pos":"verb","definitions":["to exemplify"],"pronunciation":"/eɡ.zem.pli.fiˈka/","forms":{"canonical":"a exemplifica 1st conjugation","present-singular-third-person":"exemplifică","participle-past":"exemplificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exemplifica","gerund":"exemplificând","first-person-indicative-present-singular":"exemplific","indicative-present-second-person-singular":"exemplifici","indicative-present-singular-third-person":"exemplifică","first-person-indicative-plural-present":"exemplificăm","indicative-plural-present-second-person":"exemplificați","indicative-plural-present-third-person":"exemplifică","first-person-imperfect-indicative-singular":"exemplificam","imperfect-indicative-second-person-singular":"exemplificai","imperfect-indicative-singular-third-person":"exemplifica","first-person-imperfect-indicative-plural":"exemplificam","imperfect-indicative-plural-second-person":"exemplificați","imperfect-indicative-plural-third-person":"exemplificau","first-person-indicative-perfect-singular":"exemplificai","indicative-perfect-second-person-singular":"exemplificași","indicative-perfect-singular-third-person":"exemplifică","first-person-indicative-perfect-plural":"exemplificarăm","indicative-perfect-plural-second-person":"exemplificarăți","indicative-perfect-plural-third-person":"exemplificară","first-person-indicative-pluperfect-singular":"exemplificasem","indicative-pluperfect-second-person-singular":"exemplificaseși","indicative-pluperfect-singular-third-person":"exemplificase","first-person-indicative-pluperfect-plural":"exemplificaserăm","indicative-pluperfect-plural-second-person":"exemplificaserăți","indicative-pluperfect-plural-third-person":"exemplificaseră","first-person-present-singular-subjunctive":"să exemplific","present-second-person-singular-subjunctive":"să exemplifici","present-singular-subjunctive-third-person":"să exemplifice","first-person-plural-present-subjunctive":"să exemplificăm","plural-present-second-person-subjunctive":"să exemplificați","plural-present-subjunctive-third-person":"să exemplifice","imperative-second-person-singular":"exemplifică","imperative-plural-second-person":"exemplificați","imperative-negative-second-person-singular":"nu exemplifica","imperative-negative-plural-second-person":"nu exemplificați"}},{"word":"exemplificare","pos":"noun","definitions":["exemplification"],"forms":{"plural":"exemplificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exemplificare","accusative-definite-nominative-singular":"exemplificarea","accusative-indefinite-nominative-plural":"exemplificări","accusative-definite-nominative-plural":"exemplificările","dative-genitive-indefinite-singular":"exemplificări","dative-definite-genitive-singular":"exemplificării","dative-genitive-indefinite-plural":"exemplificări","dative-definite-genitive-plural":"exemplificărilor","singular-vocative":"exemplificare","plural-vocative":"exemplificărilor"}},{"word":"exemplificări","pos":"noun","definitions":["plural of exemplificare"]},{"word":"exemplificat","pos":"adj","definitions":["exemplified"],"forms":{"feminine-singular":"exemplificată","masculine-plural":"exemplificați","feminine-neuter-plural":"exemplificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exemplificat","error-unrecognized-form-feminine-indefinite-singular":"exemplificată","error-unrecognized-form-indefinite-masculine-plural":"exemplificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exemplificate","definite-error-unrecognized-form-masculine-neuter-singular":"exemplificatul","definite-error-unrecognized-form-feminine-singular":"exemplificata","definite-error-unrecognized-form-masculine-plural":"exemplificații","definite-error-unrecognized-form-feminine-neuter-plural":"exemplificatele"}},{"word":"exemplificat","pos":"verb","definitions":["past participle of exemplifica"],"forms":{"participle-past":"of exemplifica"}},{"word":"exemplificație","pos":"noun","definitions":["exemplification"],"forms":{"plural":"exemplificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exemplificație","accusative-definite-nominative-singular":"exemplificația","accusative-indefinite-nominative-plural":"exemplificații","accusative-definite-nominative-plural":"exemplificațiile","dative-genitive-indefinite-singular":"exemplificații","dative-definite-genitive-singular":"exemplificației","dative-genitive-indefinite-plural":"exemplificații","dative-definite-genitive-plural":"exemplificațiilor","singular-vocative":"exemplificație","plural-vocative":"exemplificațiilor"}},{"word":"exemplificații","pos":"noun","definitions":["plural of exemplificație"]},{"word":"exemplificativ","pos":"adj","definitions":["exemplative, illustrative"],"forms":{"feminine-singular":"exemplificativă","masculine-plural":"exemplificativi","feminine-neuter-plural":"exemplificative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exemplificativ","error-unrecognized-form-feminine-indefinite-singular":"exemplificativă","error-unrecognized-form-indefinite-masculine-plural":"exemplificativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exemplificative","definite-error-unrecognized-form-masculine-neuter-singular":"exemplificativul","definite-error-unrecognized-form-feminine-singular":"exemplificativa","definite-error-unrecognized-form-masculine-plural":"exemplificativii","definite-error-unrecognized-form-feminine-neuter-plural":"exemplificativele"}},{"word":"exemplu","pos":"noun","definitions":["example"],"pronunciation":"[eɡˈzemplu]","examples":[{"ro":"de exemplu","en":"for example"}],"forms":{"plural":"exemple","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exemplu","accusative-definite-nominative-singular":"exemplul","accusative-indefinite-nominative-plural":"exemple","accusative-definite-nominative-plural":"exemplele","dative-genitive-indefinite-singular":"exemplu","dative-definite-genitive-singular":"exemplului","dative-genitive-indefinite-plural":"exemple","dative-definite-genitive-plural":"exemplelor","singular-vocative":"exemplule","plural-vocative":"exemplelor"}},{"word":"exemplul","pos":"noun","definitions":["definite nominative/accusative singular of exemplu"],"pronunciation":"[eɡˈzem.plul]","gender":"n"},{"word":"exemplului","pos":"noun","definitions":["definite genitive/dative singular of exemplu"],"pronunciation":"[eɡˈzem.plu.lui]","gender":"n"},{"word":"exempt","pos":"adj","definitions":["exempt"],"forms":{"feminine-singular":"exemptă","masculine-plural":"exempți","feminine-neuter-plural":"exempte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exempt","error-unrecognized-form-feminine-indefinite-singular":"exemptă","error-unrecognized-form-indefinite-masculine-plural":"exempți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exempte","definite-error-unrecognized-form-masculine-neuter-singular":"exemptul","definite-error-unrecognized-form-feminine-singular":"exempta","definite-error-unrecognized-form-masculine-plural":"exempții","definite-error-unrecognized-form-feminine-neuter-plural":"exemptele"}},{"word":"exempțiune","pos":"noun","definitions":["exemption"],"forms":{"plural":"exempțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exempțiune","accusative-definite-nominative-singular":"exempțiunea","accusative-indefinite-nominative-plural":"exempțiuni","accusative-definite-nominative-plural":"exempțiunile","dative-genitive-indefinite-singular":"exempțiuni","dative-definite-genitive-singular":"exempțiunii","dative-genitive-indefinite-plural":"exempțiuni","dative-definite-genitive-plural":"exempțiunilor","singular-vocative":"exempțiune","plural-vocative":"exempțiunilor"}},{"word":"exencefal","pos":"noun","definitions":["exencephalus"],"forms":{"plural":"exencefali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exencefal","accusative-definite-nominative-singular":"exencefalul","accusative-indefinite-nominative-plural":"exencefali","accusative-definite-nominative-plural":"exencefalii","dative-genitive-indefinite-singular":"exencefal","dative-definite-genitive-singular":"exencefalului","dative-genitive-indefinite-plural":"exencefali","dative-definite-genitive-plural":"exencefalilor","singular-vocative":"exencefalule","plural-vocative":"exencefalilor"}},{"word":"exencefalie","pos":"noun","definitions":["exencephaly"],"forms":{"plural":"exencefalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exencefalie","accusative-definite-nominative-singular":"exencefalia","accusative-indefinite-nominative-plural":"exencefalii","accusative-definite-nominative-plural":"exencefaliile","dative-genitive-indefinite-singular":"exencefalii","dative-definite-genitive-singular":"exencefaliei","dative-genitive-indefinite-plural":"exencefalii","dative-definite-genitive-plural":"exencefaliilor","singular-vocative":"exencefalie","plural-vocative":"exencefaliilor"}},{"word":"exenterație","pos":"noun","definitions":["exenteration"],"forms":{"plural":"exenterații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exenterație","accusative-definite-nominative-singular":"exenterația","accusative-indefinite-nominative-plural":"exenterații","accusative-definite-nominative-plural":"exenterațiile","dative-genitive-indefinite-singular":"exenterații","dative-definite-genitive-singular":"exenterației","dative-genitive-indefinite-plural":"exenterații","dative-definite-genitive-plural":"exenterațiilor","singular-vocative":"exenterație","plural-vocative":"exenterațiilor"}},{"word":"exercit","pos":"verb","definitions":["first-person singular present indicative/subjunctive of exercita"],"pronunciation":"[eˈɡzert͡ʃit]"},{"word":"exercita","pos":"verb","definitions":["to exercise, to use (e.g. one's rights)","to exert, to apply"],"pronunciation":"/eɡ.zer.t͡ʃiˈta/","forms":{"canonical":"a exercita 1st conjugation","present-singular-third-person":"exercită","participle-past":"exercitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exercita","gerund":"exercitând","first-person-indicative-present-singular":"exercit","indicative-present-second-person-singular":"exerciți","indicative-present-singular-third-person":"exercită","first-person-indicative-plural-present":"exercităm","indicative-plural-present-second-person":"exercitați","indicative-plural-present-third-person":"exercită","first-person-imperfect-indicative-singular":"exercitam","imperfect-indicative-second-person-singular":"exercitai","imperfect-indicative-singular-third-person":"exercita","first-person-imperfect-indicative-plural":"exercitam","imperfect-indicative-plural-second-person":"exercitați","imperfect-indicative-plural-third-person":"exercitau","first-person-indicative-perfect-singular":"exercitai","indicative-perfect-second-person-singular":"exercitași","indicative-perfect-singular-third-person":"exercită","first-person-indicative-perfect-plural":"exercitarăm","indicative-perfect-plural-second-person":"exercitarăți","indicative-perfect-plural-third-person":"exercitară","first-person-indicative-pluperfect-singular":"exercitasem","indicative-pluperfect-second-person-singular":"exercitaseși","indicative-pluperfect-singular-third-person":"exercitase","first-person-indicative-pluperfect-plural":"exercitaserăm","indicative-pluperfect-plural-second-person":"exercitaserăți","indicative-pluperfect-plural-third-person":"exercitaseră","first-person-present-singular-subjunctive":"să exercit","present-second-person-singular-subjunctive":"să exerciți","present-singular-subjunctive-third-person":"să exercite","first-person-plural-present-subjunctive":"să exercităm","plural-present-second-person-subjunctive":"să exercitați","plural-present-subjunctive-third-person":"să exercite","imperative-second-person-singular":"exercită","imperative-plural-second-person":"exercitați","imperative-negative-second-person-singular":"nu exercita","imperative-negative-plural-second-person":"nu exercitați"}},{"word":"exercitai","pos":"verb","definitions":["inflection of exercita:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eɡzert͡ʃiˈtaj]"},{"word":"exercitam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exercita"],"pronunciation":"[eɡzert͡ʃiˈtam]"},{"word":"exercitare","pos":"noun","definitions":["exercise"],"forms":{"plural":"exercitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exercitare","accusative-definite-nominative-singular":"exercitarea","accusative-indefinite-nominative-plural":"exercitări","accusative-definite-nominative-plural":"exercitările","dative-genitive-indefinite-singular":"exercitări","dative-definite-genitive-singular":"exercitării","dative-genitive-indefinite-plural":"exercitări","dative-definite-genitive-plural":"exercitărilor","singular-vocative":"exercitare","plural-vocative":"exercitărilor"}},{"word":"exercitase","pos":"verb","definitions":["third-person singular pluperfect indicative of exercita"],"pronunciation":"[eɡzert͡ʃiˈtase]"},{"word":"exercitat","pos":"adj","definitions":["exercised"],"pronunciation":"[eɡzert͡ʃiˈtat]","forms":{"feminine-singular":"exercitată","masculine-plural":"exercitați","feminine-neuter-plural":"exercitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exercitat","error-unrecognized-form-feminine-indefinite-singular":"exercitată","error-unrecognized-form-indefinite-masculine-plural":"exercitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exercitate","definite-error-unrecognized-form-masculine-neuter-singular":"exercitatul","definite-error-unrecognized-form-feminine-singular":"exercitata","definite-error-unrecognized-form-masculine-plural":"exercitații","definite-error-unrecognized-form-feminine-neuter-plural":"exercitatele"}},{"word":"exercitat","pos":"verb","definitions":["past participle of exercita"],"pronunciation":"[eɡzert͡ʃiˈtat]","forms":{"participle-past":"of exercita"}},{"word":"exercitație","pos":"noun","definitions":["exercise"],"forms":{"plural":"exercitații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exercitație","accusative-definite-nominative-singular":"exercitația","accusative-indefinite-nominative-plural":"exercitații","accusative-definite-nominative-plural":"exercitațiile","dative-genitive-indefinite-singular":"exercitații","dative-definite-genitive-singular":"exercitației","dative-genitive-indefinite-plural":"exercitații","dative-definite-genitive-plural":"exercitațiilor","singular-vocative":"exercitație","plural-vocative":"exercitațiilor"}},{"word":"exercite","pos":"verb","definitions":["third-person singular/plural present subjunctive of exercita"],"pronunciation":"[eˈɡzert͡ʃite]"},{"word":"exercițiu","pos":"noun","definitions":["exercise"],"forms":{"plural":"exerciții","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exercițiu","accusative-definite-nominative-singular":"exercițiul","accusative-indefinite-nominative-plural":"exerciții","accusative-definite-nominative-plural":"exercițiile","dative-genitive-indefinite-singular":"exercițiu","dative-definite-genitive-singular":"exercițiului","dative-genitive-indefinite-plural":"exerciții","dative-definite-genitive-plural":"exercițiilor","singular-vocative":"exercițiule","plural-vocative":"exercițiilor"}},{"word":"exercițiu la sol","pos":"noun","definitions":["floor exercise"],"forms":{"plural":"exerciții la sol"}},{"word":"exeredita","pos":"verb","definitions":["to disown"],"forms":{"canonical":"a exeredita 1st conjugation","participle-past":"exereditat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exeredita","gerund":"exereditând","first-person-indicative-present-singular":"exeredit","indicative-present-second-person-singular":"exerediți","indicative-present-singular-third-person":"exeredită","first-person-indicative-plural-present":"exeredităm","indicative-plural-present-second-person":"exereditați","indicative-plural-present-third-person":"exeredită","first-person-imperfect-indicative-singular":"exereditam","imperfect-indicative-second-person-singular":"exereditai","imperfect-indicative-singular-third-person":"exeredita","first-person-imperfect-indicative-plural":"exereditam","imperfect-indicative-plural-second-person":"exereditați","imperfect-indicative-plural-third-person":"exereditau","first-person-indicative-perfect-singular":"exereditai","indicative-perfect-second-person-singular":"exereditași","indicative-perfect-singular-third-person":"exeredită","first-person-indicative-perfect-plural":"exereditarăm","indicative-perfect-plural-second-person":"exereditarăți","indicative-perfect-plural-third-person":"exereditară","first-person-indicative-pluperfect-singular":"exereditasem","indicative-pluperfect-second-person-singular":"exereditaseși","indicative-pluperfect-singular-third-person":"exereditase","first-person-indicative-pluperfect-plural":"exereditaserăm","indicative-pluperfect-plural-second-person":"exereditaserăți","indicative-pluperfect-plural-third-person":"exereditaseră","first-person-present-singular-subjunctive":"să exeredit","present-second-person-singular-subjunctive":"să exerediți","present-singular-subjunctive-third-person":"să exeredite","first-person-plural-present-subjunctive":"să exeredităm","plural-present-second-person-subjunctive":"să exereditați","plural-present-subjunctive-third-person":"să exeredite","imperative-second-person-singular":"exeredită","imperative-plural-second-person":"exereditați","imperative-negative-second-person-singular":"nu exeredita","imperative-negative-plural-second-person":"nu exereditați"}},{"word":"exereditare","pos":"noun","definitions":["disinheritance"],"forms":{"plural":"exereditări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exereditare","accusative-definite-nominative-singular":"exereditarea","accusative-indefinite-nominative-plural":"exereditări","accusative-definite-nominative-plural":"exereditările","dative-genitive-indefinite-singular":"exereditări","dative-definite-genitive-singular":"exereditării","dative-genitive-indefinite-plural":"exereditări","dative-definite-genitive-plural":"exereditărilor","singular-vocative":"exereditare","plural-vocative":"exereditărilor"}},{"word":"exereză","pos":"noun","definitions":["ablation"],"forms":{"plural":"exereze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exereză","accusative-definite-nominative-singular":"exereza","accusative-indefinite-nominative-plural":"exereze","accusative-definite-nominative-plural":"exerezele","dative-genitive-indefinite-singular":"exereze","dative-definite-genitive-singular":"exerezei","dative-genitive-indefinite-plural":"exereze","dative-definite-genitive-plural":"exerezelor","singular-vocative":"exereză","plural-vocative":"exerezelor"}},{"word":"exergă","pos":"noun","definitions":["exergue"],"forms":{"plural":"exerge","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exergă","accusative-definite-nominative-singular":"exerga","accusative-indefinite-nominative-plural":"exerge","accusative-definite-nominative-plural":"exergele","dative-genitive-indefinite-singular":"exerge","dative-definite-genitive-singular":"exergei","dative-genitive-indefinite-plural":"exerge","dative-definite-genitive-plural":"exergelor","singular-vocative":"exergă","plural-vocative":"exergelor"}},{"word":"exergie","pos":"noun","definitions":["exergy"],"forms":{"plural":"exergii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exergie","accusative-definite-nominative-singular":"exergia","accusative-indefinite-nominative-plural":"exergii","accusative-definite-nominative-plural":"exergiile","dative-genitive-indefinite-singular":"exergii","dative-definite-genitive-singular":"exergiei","dative-genitive-indefinite-plural":"exergii","dative-definite-genitive-plural":"exergiilor","singular-vocative":"exergie","plural-vocative":"exergiilor"}},{"word":"exersa","pos":"verb","definitions":["to exercise"],"forms":{"canonical":"a exersa 1st conjugation","present-singular-third-person":"exersează","participle-past":"exersat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exersa","gerund":"exersând","first-person-indicative-present-singular":"exersez","indicative-present-second-person-singular":"exersezi","indicative-present-singular-third-person":"exersează","first-person-indicative-plural-present":"exersăm","indicative-plural-present-second-person":"exersați","indicative-plural-present-third-person":"exersează","first-person-imperfect-indicative-singular":"exersam","imperfect-indicative-second-person-singular":"exersai","imperfect-indicative-singular-third-person":"exersa","first-person-imperfect-indicative-plural":"exersam","imperfect-indicative-plural-second-person":"exersați","imperfect-indicative-plural-third-person":"exersau","first-person-indicative-perfect-singular":"exersai","indicative-perfect-second-person-singular":"exersași","indicative-perfect-singular-third-person":"exersă","first-person-indicative-perfect-plural":"exersarăm","indicative-perfect-plural-second-person":"exersarăți","indicative-perfect-plural-third-person":"exersară","first-person-indicative-pluperfect-singular":"exersasem","indicative-pluperfect-second-person-singular":"exersaseși","indicative-pluperfect-singular-third-person":"exersase","first-person-indicative-pluperfect-plural":"exersaserăm","indicative-pluperfect-plural-second-person":"exersaserăți","indicative-pluperfect-plural-third-person":"exersaseră","first-person-present-singular-subjunctive":"să exersez","present-second-person-singular-subjunctive":"să exersezi","present-singular-subjunctive-third-person":"să exerseze","first-person-plural-present-subjunctive":"să exersăm","plural-present-second-person-subjunctive":"să exersați","plural-present-subjunctive-third-person":"să exerseze","imperative-second-person-singular":"exersează","imperative-plural-second-person":"exersați","imperative-negative-second-person-singular":"nu exersa","imperative-negative-plural-second-person":"nu exersați"}},{"word":"exersare","pos":"noun","definitions":["practice"],"forms":{"plural":"exersări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exersare","accusative-definite-nominative-singular":"exersarea","accusative-indefinite-nominative-plural":"exersări","accusative-definite-nominative-plural":"exersările","dative-genitive-indefinite-singular":"exersări","dative-definite-genitive-singular":"exersării","dative-genitive-indefinite-plural":"exersări","dative-definite-genitive-plural":"exersărilor","singular-vocative":"exersare","plural-vocative":"exersărilor"}},{"word":"exfiltrație","pos":"noun","definitions":["exfiltration"],"forms":{"plural":"exfiltrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exfiltrație","accusative-definite-nominative-singular":"exfiltrația","accusative-indefinite-nominative-plural":"exfiltrații","accusative-definite-nominative-plural":"exfiltrațiile","dative-genitive-indefinite-singular":"exfiltrații","dative-definite-genitive-singular":"exfiltrației","dative-genitive-indefinite-plural":"exfiltrații","dative-definite-genitive-plural":"exfiltrațiilor","singular-vocative":"exfiltrație","plural-vocative":"exfiltrațiilor"}},{"word":"exfolia","pos":"verb","definitions":["to exfoliate"],"forms":{"canonical":"a exfolia 1st conjugation","present-singular-third-person":"exfoliază","participle-past":"exfoliat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exfolia","gerund":"exfoliind","first-person-indicative-present-singular":"exfoliez","indicative-present-second-person-singular":"exfoliezi","indicative-present-singular-third-person":"exfoliază","first-person-indicative-plural-present":"exfoliem","indicative-plural-present-second-person":"exfoliați","indicative-plural-present-third-person":"exfoliază","first-person-imperfect-indicative-singular":"exfoliam","imperfect-indicative-second-person-singular":"exfoliai","imperfect-indicative-singular-third-person":"exfolia","first-person-imperfect-indicative-plural":"exfoliam","imperfect-indicative-plural-second-person":"exfoliați","imperfect-indicative-plural-third-person":"exfoliau","first-person-indicative-perfect-singular":"exfoliai","indicative-perfect-second-person-singular":"exfoliași","indicative-perfect-singular-third-person":"exfolie","first-person-indicative-perfect-plural":"exfoliarăm","indicative-perfect-plural-second-person":"exfoliarăți","indicative-perfect-plural-third-person":"exfoliară","first-person-indicative-pluperfect-singular":"exfoliasem","indicative-pluperfect-second-person-singular":"exfoliaseși","indicative-pluperfect-singular-third-person":"exfoliase","first-person-indicative-pluperfect-plural":"exfoliaserăm","indicative-pluperfect-plural-second-person":"exfoliaserăți","indicative-pluperfect-plural-third-person":"exfoliaseră","first-person-present-singular-subjunctive":"să exfoliez","present-second-person-singular-subjunctive":"să exfoliezi","present-singular-subjunctive-third-person":"să exfolieze","first-person-plural-present-subjunctive":"să exfoliem","plural-present-second-person-subjunctive":"să exfoliați","plural-present-subjunctive-third-person":"să exfolieze","imperative-second-person-singular":"exfoliază","imperative-plural-second-person":"exfoliați","imperative-negative-second-person-singular":"nu exfolia","imperative-negative-plural-second-person":"nu exfoliați"}},{"word":"exfoliație","pos":"noun","definitions":["exfoliation"],"forms":{"plural":"exfoliații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exfoliație","accusative-definite-nominative-singular":"exfoliația","accusative-indefinite-nominative-plural":"exfoliații","accusative-definite-nominative-plural":"exfoliațiile","dative-genitive-indefinite-singular":"exfoliații","dative-definite-genitive-singular":"exfoliației","dative-genitive-indefinite-plural":"exfoliații","dative-definite-genitive-plural":"exfoliațiilor","singular-vocative":"exfoliație","plural-vocative":"exfoliațiilor"}},{"word":"exfoliațiune","pos":"noun","definitions":["obsolete form of exfoliație"],"forms":{"plural":"exfoliațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exfoliațiune","accusative-definite-nominative-singular":"exfoliațiunea","accusative-indefinite-nominative-plural":"exfoliațiuni","accusative-definite-nominative-plural":"exfoliațiunile","dative-genitive-indefinite-singular":"exfoliațiuni","dative-definite-genitive-singular":"exfoliațiunii","dative-genitive-indefinite-plural":"exfoliațiuni","dative-definite-genitive-plural":"exfoliațiunilor","singular-vocative":"exfoliațiune","plural-vocative":"exfoliațiunilor"}},{"word":"exfoliativ","pos":"adj","definitions":["exfoliative"],"forms":{"feminine-singular":"exfoliativă","masculine-plural":"exfoliativi","feminine-neuter-plural":"exfoliative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exfoliativ","error-unrecognized-form-feminine-indefinite-singular":"exfoliativă","error-unrecognized-form-indefinite-masculine-plural":"exfoliativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exfoliative","definite-error-unrecognized-form-masculine-neuter-singular":"exfoliativul","definite-error-unrecognized-form-feminine-singular":"exfoliativa","definite-error-unrecognized-form-masculine-plural":"exfoliativii","definite-error-unrecognized-form-feminine-neuter-plural":"exfoliativele"}},{"word":"exfoliator","pos":"adj","definitions":["exfoliant"],"forms":{"feminine-singular":"exfoliatoare","masculine-plural":"exfoliatori","feminine-neuter-plural":"exfoliatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exfoliator","error-unrecognized-form-feminine-indefinite-singular":"exfoliatoare","error-unrecognized-form-indefinite-masculine-plural":"exfoliatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"exfoliatoare","definite-error-unrecognized-form-masculine-neuter-singular":"exfoliatorul","definite-error-unrecognized-form-feminine-singular":"exfoliatoarea","definite-error-unrecognized-form-masculine-plural":"exfoliatorii","definite-error-unrecognized-form-feminine-neuter-plural":"exfoliatoarele"}},{"word":"exfoliere","pos":"noun","definitions":["exfoliation"],"forms":{"plural":"exfolieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exfoliere","accusative-definite-nominative-singular":"exfolierea","accusative-indefinite-nominative-plural":"exfolieri","accusative-definite-nominative-plural":"exfolierile","dative-genitive-indefinite-singular":"exfolieri","dative-definite-genitive-singular":"exfolierii","dative-genitive-indefinite-plural":"exfolieri","dative-definite-genitive-plural":"exfolierilor","singular-vocative":"exfoliere","plural-vocative":"exfolierilor"}},{"word":"exhaustiv","pos":"adj","definitions":["exhaustive"],"forms":{"feminine-singular":"exhaustivă","masculine-plural":"exhaustivi","feminine-neuter-plural":"exhaustive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exhaustiv","error-unrecognized-form-feminine-indefinite-singular":"exhaustivă","error-unrecognized-form-indefinite-masculine-plural":"exhaustivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exhaustive","definite-error-unrecognized-form-masculine-neuter-singular":"exhaustivul","definite-error-unrecognized-form-feminine-singular":"exhaustiva","definite-error-unrecognized-form-masculine-plural":"exhaustivii","definite-error-unrecognized-form-feminine-neuter-plural":"exhaustivele"}},{"word":"exhaustivitate","pos":"noun","definitions":["completeness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exhaustivitate","accusative-definite-nominative-singular":"exhaustivitatea","accusative-indefinite-nominative-plural":"exhaustivități","accusative-definite-nominative-plural":"exhaustivitățile","dative-genitive-indefinite-singular":"exhaustivități","dative-definite-genitive-singular":"exhaustivității","dative-genitive-indefinite-plural":"exhaustivități","dative-definite-genitive-plural":"exhaustivităților","singular-vocative":"exhaustivitate","plural-vocative":"exhaustivităților"}},{"word":"exhaustor","pos":"noun","definitions":["enhancer (for the carburator)"],"forms":{"plural":"exhaustoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exhaustor","accusative-definite-nominative-singular":"exhaustorul","accusative-indefinite-nominative-plural":"exhaustoare","accusative-definite-nominative-plural":"exhaustoarele","dative-genitive-indefinite-singular":"exhaustor","dative-definite-genitive-singular":"exhaustorului","dative-genitive-indefinite-plural":"exhaustoare","dative-definite-genitive-plural":"exhaustoarelor","singular-vocative":"exhaustorule","plural-vocative":"exhaustoarelor"}},{"word":"exhiba","pos":"verb","definitions":["to exhibit"],"forms":{"canonical":"a exhiba 1st conjugation","present-singular-third-person":"exhibează","participle-past":"exhibat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exhiba","gerund":"exhibând","first-person-indicative-present-singular":"exhibez","indicative-present-second-person-singular":"exhibezi","indicative-present-singular-third-person":"exhibează","first-person-indicative-plural-present":"exhibăm","indicative-plural-present-second-person":"exhibați","indicative-plural-present-third-person":"exhibează","first-person-imperfect-indicative-singular":"exhibam","imperfect-indicative-second-person-singular":"exhibai","imperfect-indicative-singular-third-person":"exhiba","first-person-imperfect-indicative-plural":"exhibam","imperfect-indicative-plural-second-person":"exhibați","imperfect-indicative-plural-third-person":"exhibau","first-person-indicative-perfect-singular":"exhibai","indicative-perfect-second-person-singular":"exhibași","indicative-perfect-singular-third-person":"exhibă","first-person-indicative-perfect-plural":"exhibarăm","indicative-perfect-plural-second-person":"exhibarăți","indicative-perfect-plural-third-person":"exhibară","first-person-indicative-pluperfect-singular":"exhibasem","indicative-pluperfect-second-person-singular":"exhibaseși","indicative-pluperfect-singular-third-person":"exhibase","first-person-indicative-pluperfect-plural":"exhibaserăm","indicative-pluperfect-plural-second-person":"exhibaserăți","indicative-pluperfect-plural-third-person":"exhibaseră","first-person-present-singular-subjunctive":"să exhibez","present-second-person-singular-subjunctive":"să exhibezi","present-singular-subjunctive-third-person":"să exhibeze","first-person-plural-present-subjunctive":"să exhibăm","plural-present-second-person-subjunctive":"să exhibați","plural-present-subjunctive-third-person":"să exhibeze","imperative-second-person-singular":"exhibează","imperative-plural-second-person":"exhibați","imperative-negative-second-person-singular":"nu exhiba","imperative-negative-plural-second-person":"nu exhibați"}},{"word":"exhibare","pos":"noun","definitions":["exhibition"],"forms":{"plural":"exhibări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exhibare","accusative-definite-nominative-singular":"exhibarea","accusative-indefinite-nominative-plural":"exhibări","accusative-definite-nominative-plural":"exhibările","dative-genitive-indefinite-singular":"exhibări","dative-definite-genitive-singular":"exhibării","dative-genitive-indefinite-plural":"exhibări","dative-definite-genitive-plural":"exhibărilor","singular-vocative":"exhibare","plural-vocative":"exhibărilor"}},{"word":"exhibat","pos":"adj","definitions":["exhibited"],"forms":{"feminine-singular":"exhibată","masculine-plural":"exhibați","feminine-neuter-plural":"exhibate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exhibat","error-unrecognized-form-feminine-indefinite-singular":"exhibată","error-unrecognized-form-indefinite-masculine-plural":"exhibați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exhibate","definite-error-unrecognized-form-masculine-neuter-singular":"exhibatul","definite-error-unrecognized-form-feminine-singular":"exhibata","definite-error-unrecognized-form-masculine-plural":"exhibații","definite-error-unrecognized-form-feminine-neuter-plural":"exhibatele"}},{"word":"exhibat","pos":"verb","definitions":["past participle of exhiba"],"forms":{"participle-past":"of exhiba"}},{"word":"exhibiție","pos":"noun","definitions":["exhibition"],"forms":{"plural":"exhibiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exhibiție","accusative-definite-nominative-singular":"exhibiția","accusative-indefinite-nominative-plural":"exhibiții","accusative-definite-nominative-plural":"exhibițiile","dative-genitive-indefinite-singular":"exhibiții","dative-definite-genitive-singular":"exhibiției","dative-genitive-indefinite-plural":"exhibiții","dative-definite-genitive-plural":"exhibițiilor","singular-vocative":"exhibiție","plural-vocative":"exhibițiilor"}},{"word":"exhibiționism","pos":"noun","definitions":["exhibitionism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exhibiționism","accusative-definite-nominative-singular":"exhibiționismul","accusative-indefinite-nominative-plural":"exhibiționisme","accusative-definite-nominative-plural":"exhibiționismele","dative-genitive-indefinite-singular":"exhibiționism","dative-definite-genitive-singular":"exhibiționismului","dative-genitive-indefinite-plural":"exhibiționisme","dative-definite-genitive-plural":"exhibiționismelor","singular-vocative":"exhibiționismule","plural-vocative":"exhibiționismelor"}},{"word":"exhibiționist","pos":"noun","definitions":["exhibitionist, flasher"],"forms":{"plural":"exhibiționiști","feminine":"equivalent exhibiționistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exhibiționist","accusative-definite-nominative-singular":"exhibiționistul","accusative-indefinite-nominative-plural":"exhibiționiști","accusative-definite-nominative-plural":"exhibiționiștii","dative-genitive-indefinite-singular":"exhibiționist","dative-definite-genitive-singular":"exhibiționistului","dative-genitive-indefinite-plural":"exhibiționiști","dative-definite-genitive-plural":"exhibiționiștilor","singular-vocative":"exhibiționistule","plural-vocative":"exhibiționiștilor"}},{"word":"exhibiționistă","pos":"noun","definitions":["female equivalent of exhibiționist"],"forms":{"plural":"exhibiționiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exhibiționistă","accusative-definite-nominative-singular":"exhibiționista","accusative-indefinite-nominative-plural":"exhibiționiste","accusative-definite-nominative-plural":"exhibiționistele","dative-genitive-indefinite-singular":"exhibiționiste","dative-definite-genitive-singular":"exhibiționistei","dative-genitive-indefinite-plural":"exhibiționiste","dative-definite-genitive-plural":"exhibiționistelor","singular-vocative":"exhibiționistă","plural-vocative":"exhibiționistelor"}},{"word":"exhibițiune","pos":"noun","definitions":["alternative form of exhibiție"],"forms":{"plural":"exhibițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exhibițiune","accusative-definite-nominative-singular":"exhibițiunea","accusative-indefinite-nominative-plural":"exhibițiuni","accusative-definite-nominative-plural":"exhibițiunile","dative-genitive-indefinite-singular":"exhibițiuni","dative-definite-genitive-singular":"exhibițiunii","dative-genitive-indefinite-plural":"exhibițiuni","dative-definite-genitive-plural":"exhibițiunilor","singular-vocative":"exhibițiune","plural-vocative":"exhibițiunilor"}},{"word":"exhibitoriu","pos":"adj","definitions":["exhibitory"],"pronunciation":"/eks.hi.biˈto.rju/","forms":{"feminine-singular":"exhibitorie","plural":"exhibitorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exhibitoriu","error-unrecognized-form-feminine-indefinite-singular":"exhibitorie","error-unrecognized-form-indefinite-masculine-plural":"exhibitorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"exhibitorii","definite-error-unrecognized-form-masculine-neuter-singular":"exhibitoriul","definite-error-unrecognized-form-feminine-singular":"exhibitoria","definite-error-unrecognized-form-masculine-plural":"exhibitoriii","definite-error-unrecognized-form-feminine-neuter-plural":"exhibitoriile","alternative":"esibitoriu"}},{"word":"exhortațiune","pos":"noun","definitions":["obsolete form of exortație"],"forms":{"plural":"exhortațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exhortațiune","accusative-definite-nominative-singular":"exhortațiunea","accusative-indefinite-nominative-plural":"exhortațiuni","accusative-definite-nominative-plural":"exhortațiunile","dative-genitive-indefinite-singular":"exhortațiuni","dative-definite-genitive-singular":"exhortațiunii","dative-genitive-indefinite-plural":"exhortațiuni","dative-definite-genitive-plural":"exhortațiunilor","singular-vocative":"exhortațiune","plural-vocative":"exhortațiunilor"}},{"word":"exhuma","pos":"verb","definitions":["to exhume"],"pronunciation":"/eks.huˈma/","forms":{"canonical":"a exhuma 1st conjugation","present-singular-third-person":"exhumez","participle-past":"exhumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exhuma","gerund":"exhumând","first-person-indicative-present-singular":"exhumez","indicative-present-second-person-singular":"exhumezi","indicative-present-singular-third-person":"exhumează","first-person-indicative-plural-present":"exhumăm","indicative-plural-present-second-person":"exhumați","indicative-plural-present-third-person":"exhumează","first-person-imperfect-indicative-singular":"exhumam","imperfect-indicative-second-person-singular":"exhumai","imperfect-indicative-singular-third-person":"exhuma","first-person-imperfect-indicative-plural":"exhumam","imperfect-indicative-plural-second-person":"exhumați","imperfect-indicative-plural-third-person":"exhumau","first-person-indicative-perfect-singular":"exhumai","indicative-perfect-second-person-singular":"exhumași","indicative-perfect-singular-third-person":"exhumă","first-person-indicative-perfect-plural":"exhumarăm","indicative-perfect-plural-second-person":"exhumarăți","indicative-perfect-plural-third-person":"exhumară","first-person-indicative-pluperfect-singular":"exhumasem","indicative-pluperfect-second-person-singular":"exhumaseși","indicative-pluperfect-singular-third-person":"exhumase","first-person-indicative-pluperfect-plural":"exhumaserăm","indicative-pluperfect-plural-second-person":"exhumaserăți","indicative-pluperfect-plural-third-person":"exhumaseră","first-person-present-singular-subjunctive":"să exhumez","present-second-person-singular-subjunctive":"să exhumezi","present-singular-subjunctive-third-person":"să exhumeze","first-person-plural-present-subjunctive":"să exhumăm","plural-present-second-person-subjunctive":"să exhumați","plural-present-subjunctive-third-person":"să exhumeze","imperative-second-person-singular":"exhumează","imperative-plural-second-person":"exhumați","imperative-negative-second-person-singular":"nu exhuma","imperative-negative-plural-second-person":"nu exhumați"}},{"word":"exhumare","pos":"noun","definitions":["exhumation"],"forms":{"plural":"exhumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exhumare","accusative-definite-nominative-singular":"exhumarea","accusative-indefinite-nominative-plural":"exhumări","accusative-definite-nominative-plural":"exhumările","dative-genitive-indefinite-singular":"exhumări","dative-definite-genitive-singular":"exhumării","dative-genitive-indefinite-plural":"exhumări","dative-definite-genitive-plural":"exhumărilor","singular-vocative":"exhumare","plural-vocative":"exhumărilor"}},{"word":"exhumație","pos":"noun","definitions":["exhumation"],"forms":{"plural":"exhumații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exhumație","accusative-definite-nominative-singular":"exhumația","accusative-indefinite-nominative-plural":"exhumații","accusative-definite-nominative-plural":"exhumațiile","dative-genitive-indefinite-singular":"exhumații","dative-definite-genitive-singular":"exhumației","dative-genitive-indefinite-plural":"exhumații","dative-definite-genitive-plural":"exhumațiilor","singular-vocative":"exhumație","plural-vocative":"exhumațiilor"}},{"word":"exibițiune","pos":"noun","definitions":["obsolete form of exhibiție"],"forms":{"plural":"exibițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exibițiune","accusative-definite-nominative-singular":"exibițiunea","accusative-indefinite-nominative-plural":"exibițiuni","accusative-definite-nominative-plural":"exibițiunile","dative-genitive-indefinite-singular":"exibițiuni","dative-definite-genitive-singular":"exibițiunii","dative-genitive-indefinite-plural":"exibițiuni","dative-definite-genitive-plural":"exibițiunilor","singular-vocative":"exibițiune","plural-vocative":"exibițiunilor"}},{"word":"exige","pos":"verb","definitions":["to demand, require"],"forms":{"canonical":"a exige 3rd conjugation","present-singular-third-person":"exige","participle-past":"not used","subjunctive-third-person":"exigă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a exige","gerund":"exigând","first-person-indicative-present-singular":"exig","indicative-present-second-person-singular":"exigi","indicative-present-singular-third-person":"exige","first-person-indicative-plural-present":"exigem","indicative-plural-present-second-person":"exigeți","indicative-plural-present-third-person":"exig","first-person-imperfect-indicative-singular":"exigeam","imperfect-indicative-second-person-singular":"exigeai","imperfect-indicative-singular-third-person":"exigea","first-person-imperfect-indicative-plural":"exigeam","imperfect-indicative-plural-second-person":"exigeați","imperfect-indicative-plural-third-person":"exigeau","first-person-indicative-perfect-singular":"exisei","indicative-perfect-second-person-singular":"exiseși","indicative-perfect-singular-third-person":"exise","first-person-indicative-perfect-plural":"exiserăm","indicative-perfect-plural-second-person":"exiserăți","indicative-perfect-plural-third-person":"exiseră","first-person-indicative-pluperfect-singular":"exisesem","indicative-pluperfect-second-person-singular":"exiseseși","indicative-pluperfect-singular-third-person":"exisese","first-person-indicative-pluperfect-plural":"exiseserăm","indicative-pluperfect-plural-second-person":"exiseserăți","indicative-pluperfect-plural-third-person":"exiseseră","first-person-present-singular-subjunctive":"să exig","present-second-person-singular-subjunctive":"să exigi","present-singular-subjunctive-third-person":"să exigă","first-person-plural-present-subjunctive":"să exigem","plural-present-second-person-subjunctive":"să exigeți","plural-present-subjunctive-third-person":"să exigă","imperative-second-person-singular":"exige","imperative-plural-second-person":"exigeți","imperative-negative-second-person-singular":"nu exige","imperative-negative-plural-second-person":"nu exigeți"}}];
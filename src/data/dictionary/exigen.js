@@ -0,0 +1 @@
+export default [{"word":"exigent","pos":"adj","definitions":["demanding"],"forms":{"feminine-singular":"exigentă","masculine-plural":"exigenți","feminine-neuter-plural":"exigente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exigent","error-unrecognized-form-feminine-indefinite-singular":"exigentă","error-unrecognized-form-indefinite-masculine-plural":"exigenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exigente","definite-error-unrecognized-form-masculine-neuter-singular":"exigentul","definite-error-unrecognized-form-feminine-singular":"exigenta","definite-error-unrecognized-form-masculine-plural":"exigenții","definite-error-unrecognized-form-feminine-neuter-plural":"exigentele"}},{"word":"exigență","pos":"noun","definitions":["exigency","exigence"],"forms":{"plural":"exigențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exigență","accusative-definite-nominative-singular":"exigența","accusative-indefinite-nominative-plural":"exigențe","accusative-definite-nominative-plural":"exigențele","dative-genitive-indefinite-singular":"exigențe","dative-definite-genitive-singular":"exigenței","dative-genitive-indefinite-plural":"exigențe","dative-definite-genitive-plural":"exigențelor","singular-vocative":"exigență","plural-vocative":"exigențelor"}},{"word":"exigibil","pos":"adj","definitions":["demandable"],"forms":{"feminine-singular":"exigibilă","masculine-plural":"exigibili","feminine-neuter-plural":"exigibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exigibil","error-unrecognized-form-feminine-indefinite-singular":"exigibilă","error-unrecognized-form-indefinite-masculine-plural":"exigibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exigibile","definite-error-unrecognized-form-masculine-neuter-singular":"exigibilul","definite-error-unrecognized-form-feminine-singular":"exigibila","definite-error-unrecognized-form-masculine-plural":"exigibilii","definite-error-unrecognized-form-feminine-neuter-plural":"exigibilele"}},{"word":"exigibilitate","pos":"noun","definitions":["chargeability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exigibilitate","accusative-definite-nominative-singular":"exigibilitatea","accusative-indefinite-nominative-plural":"exigibilități","accusative-definite-nominative-plural":"exigibilitățile","dative-genitive-indefinite-singular":"exigibilități","dative-definite-genitive-singular":"exigibilității","dative-genitive-indefinite-plural":"exigibilități","dative-definite-genitive-plural":"exigibilităților","singular-vocative":"exigibilitate","plural-vocative":"exigibilităților"}},{"word":"exiguitate","pos":"noun","definitions":["smallness"],"forms":{"plural":"exiguități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exiguitate","accusative-definite-nominative-singular":"exiguitatea","accusative-indefinite-nominative-plural":"exiguități","accusative-definite-nominative-plural":"exiguitățile","dative-genitive-indefinite-singular":"exiguități","dative-definite-genitive-singular":"exiguității","dative-genitive-indefinite-plural":"exiguități","dative-definite-genitive-plural":"exiguităților","singular-vocative":"exiguitate","plural-vocative":"exiguităților"}},{"word":"exiguu","pos":"adj","definitions":["exiguous"],"forms":{"feminine-singular":"exiguă","masculine-plural":"exigui","feminine-neuter-plural":"exigue","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exiguu","error-unrecognized-form-feminine-indefinite-singular":"exiguă","error-unrecognized-form-indefinite-masculine-plural":"exigui","error-unrecognized-form-feminine-indefinite-neuter-plural":"exigue","definite-error-unrecognized-form-masculine-neuter-singular":"exiguul","definite-error-unrecognized-form-feminine-singular":"exigua","definite-error-unrecognized-form-masculine-plural":"exiguii","definite-error-unrecognized-form-feminine-neuter-plural":"exiguele"}},{"word":"exil","pos":"noun","definitions":["exile"],"forms":{"plural":"exiluri"}},{"word":"exila","pos":"verb","definitions":["to exile, banish"],"forms":{"canonical":"a exila 1st conjugation","present-singular-third-person":"exilează","participle-past":"exilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exila","gerund":"exilând","first-person-indicative-present-singular":"exilez","indicative-present-second-person-singular":"exilezi","indicative-present-singular-third-person":"exilează","first-person-indicative-plural-present":"exilăm","indicative-plural-present-second-person":"exilați","indicative-plural-present-third-person":"exilează","first-person-imperfect-indicative-singular":"exilam","imperfect-indicative-second-person-singular":"exilai","imperfect-indicative-singular-third-person":"exila","first-person-imperfect-indicative-plural":"exilam","imperfect-indicative-plural-second-person":"exilați","imperfect-indicative-plural-third-person":"exilau","first-person-indicative-perfect-singular":"exilai","indicative-perfect-second-person-singular":"exilași","indicative-perfect-singular-third-person":"exilă","first-person-indicative-perfect-plural":"exilarăm","indicative-perfect-plural-second-person":"exilarăți","indicative-perfect-plural-third-person":"exilară","first-person-indicative-pluperfect-singular":"exilasem","indicative-pluperfect-second-person-singular":"exilaseși","indicative-pluperfect-singular-third-person":"exilase","first-person-indicative-pluperfect-plural":"exilaserăm","indicative-pluperfect-plural-second-person":"exilaserăți","indicative-pluperfect-plural-third-person":"exilaseră","first-person-present-singular-subjunctive":"să exilez","present-second-person-singular-subjunctive":"să exilezi","present-singular-subjunctive-third-person":"să exileze","first-person-plural-present-subjunctive":"să exilăm","plural-present-second-person-subjunctive":"să exilați","plural-present-subjunctive-third-person":"să exileze","imperative-second-person-singular":"exilează","imperative-plural-second-person":"exilați","imperative-negative-second-person-singular":"nu exila","imperative-negative-plural-second-person":"nu exilați"}},{"word":"exilai","pos":"verb","definitions":["inflection of exila:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eɡziˈlaj]"},{"word":"exilam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exila"],"pronunciation":"[eɡziˈlam]"},{"word":"exilare","pos":"noun","definitions":["banishment"],"forms":{"plural":"exilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exilare","accusative-definite-nominative-singular":"exilarea","accusative-indefinite-nominative-plural":"exilări","accusative-definite-nominative-plural":"exilările","dative-genitive-indefinite-singular":"exilări","dative-definite-genitive-singular":"exilării","dative-genitive-indefinite-plural":"exilări","dative-definite-genitive-plural":"exilărilor","singular-vocative":"exilare","plural-vocative":"exilărilor"}},{"word":"exilarh","pos":"noun","definitions":["exilarch"],"forms":{"plural":"exilarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exilarh","accusative-definite-nominative-singular":"exilarhul","accusative-indefinite-nominative-plural":"exilarhi","accusative-definite-nominative-plural":"exilarhii","dative-genitive-indefinite-singular":"exilarh","dative-definite-genitive-singular":"exilarhului","dative-genitive-indefinite-plural":"exilarhi","dative-definite-genitive-plural":"exilarhilor","singular-vocative":"exilarhule","plural-vocative":"exilarhilor"}},{"word":"exilase","pos":"verb","definitions":["third-person singular pluperfect indicative of exila"],"pronunciation":"[eɡziˈlase]"},{"word":"exilat","pos":"adj","definitions":["exiled"],"forms":{"feminine-singular":"exilată","masculine-plural":"exilați","feminine-neuter-plural":"exilate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exilat","error-unrecognized-form-feminine-indefinite-singular":"exilată","error-unrecognized-form-indefinite-masculine-plural":"exilați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exilate","definite-error-unrecognized-form-masculine-neuter-singular":"exilatul","definite-error-unrecognized-form-feminine-singular":"exilata","definite-error-unrecognized-form-masculine-plural":"exilații","definite-error-unrecognized-form-feminine-neuter-plural":"exilatele"}},{"word":"exilație","pos":"noun","definitions":["banishment, exile"],"forms":{"plural":"exilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exilație","accusative-definite-nominative-singular":"exilația","accusative-indefinite-nominative-plural":"exilații","accusative-definite-nominative-plural":"exilațiile","dative-genitive-indefinite-singular":"exilații","dative-definite-genitive-singular":"exilației","dative-genitive-indefinite-plural":"exilații","dative-definite-genitive-plural":"exilațiilor","singular-vocative":"exilație","plural-vocative":"exilațiilor"}},{"word":"exilez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of exila"],"pronunciation":"[eɡziˈlez]"},{"word":"exină","pos":"noun","definitions":["exine"],"forms":{"plural":"exine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exină","accusative-definite-nominative-singular":"exina","accusative-indefinite-nominative-plural":"exine","accusative-definite-nominative-plural":"exinele","dative-genitive-indefinite-singular":"exine","dative-definite-genitive-singular":"exinei","dative-genitive-indefinite-plural":"exine","dative-definite-genitive-plural":"exinelor","singular-vocative":"exină","plural-vocative":"exinelor"}},{"word":"exist","pos":"verb","definitions":["first-person singular present indicative of exista: I exist","first-person singular present subjunctive of exista"],"pronunciation":"[eɡˈzist]"},{"word":"exista","pos":"verb","definitions":["to exist"],"pronunciation":"[eɡ.zisˈta]","forms":{"canonical":"a exista 1st conjugation","present-singular-third-person":"există","participle-past":"existat","subjunctive-third-person":"existe","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exista","gerund":"existând","first-person-indicative-present-singular":"exist","indicative-present-second-person-singular":"exiști","indicative-present-singular-third-person":"există","first-person-indicative-plural-present":"existăm","indicative-plural-present-second-person":"existați","indicative-plural-present-third-person":"există","first-person-imperfect-indicative-singular":"existam","imperfect-indicative-second-person-singular":"existai","imperfect-indicative-singular-third-person":"exista","first-person-imperfect-indicative-plural":"existam","imperfect-indicative-plural-second-person":"existați","imperfect-indicative-plural-third-person":"existau","first-person-indicative-perfect-singular":"existai","indicative-perfect-second-person-singular":"existași","indicative-perfect-singular-third-person":"există","first-person-indicative-perfect-plural":"existarăm","indicative-perfect-plural-second-person":"existarăți","indicative-perfect-plural-third-person":"existară","first-person-indicative-pluperfect-singular":"existasem","indicative-pluperfect-second-person-singular":"existaseși","indicative-pluperfect-singular-third-person":"existase","first-person-indicative-pluperfect-plural":"existaserăm","indicative-pluperfect-plural-second-person":"existaserăți","indicative-pluperfect-plural-third-person":"existaseră","first-person-present-singular-subjunctive":"să exist","present-second-person-singular-subjunctive":"să exiști","present-singular-subjunctive-third-person":"să existe","first-person-plural-present-subjunctive":"să existăm","plural-present-second-person-subjunctive":"să existați","plural-present-subjunctive-third-person":"să existe","imperative-second-person-singular":"există","imperative-plural-second-person":"existați","imperative-negative-second-person-singular":"nu exista","imperative-negative-plural-second-person":"nu existați"}},{"word":"existai","pos":"verb","definitions":["inflection of exista:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eɡziˈstaj]"},{"word":"existam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exista"],"pronunciation":"[eɡziˈstam]"},{"word":"existare","pos":"noun","definitions":["existence"],"forms":{"plural":"existări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"existare","accusative-definite-nominative-singular":"existarea","accusative-indefinite-nominative-plural":"existări","accusative-definite-nominative-plural":"existările","dative-genitive-indefinite-singular":"existări","dative-definite-genitive-singular":"existării","dative-genitive-indefinite-plural":"existări","dative-definite-genitive-plural":"existărilor","singular-vocative":"existare","plural-vocative":"existărilor"}},{"word":"existat","pos":"verb","definitions":["past participle of exista"],"pronunciation":"[eɡziˈstat]"},{"word":"existe","pos":"verb","definitions":["third-person singular/plural present subjunctive of exista"],"pronunciation":"[eˈɡziste]"},{"word":"existent","pos":"adj","definitions":["existent"],"forms":{"feminine-singular":"existentă","masculine-plural":"existenți","feminine-neuter-plural":"existente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"existent","error-unrecognized-form-feminine-indefinite-singular":"existentă","error-unrecognized-form-indefinite-masculine-plural":"existenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"existente","definite-error-unrecognized-form-masculine-neuter-singular":"existentul","definite-error-unrecognized-form-feminine-singular":"existenta","definite-error-unrecognized-form-masculine-plural":"existenții","definite-error-unrecognized-form-feminine-neuter-plural":"existentele"}},{"word":"existență","pos":"noun","definitions":["existence"],"forms":{"plural":"existențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"existență","accusative-definite-nominative-singular":"existența","accusative-indefinite-nominative-plural":"existențe","accusative-definite-nominative-plural":"existențele","dative-genitive-indefinite-singular":"existențe","dative-definite-genitive-singular":"existenței","dative-genitive-indefinite-plural":"existențe","dative-definite-genitive-plural":"existențelor","singular-vocative":"existență","plural-vocative":"existențelor"}},{"word":"existențial","pos":"adj","definitions":["existential"],"forms":{"feminine-singular":"existențială","masculine-plural":"existențiali","feminine-neuter-plural":"existențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"existențial","error-unrecognized-form-feminine-indefinite-singular":"existențială","error-unrecognized-form-indefinite-masculine-plural":"existențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"existențiale","definite-error-unrecognized-form-masculine-neuter-singular":"existențialul","definite-error-unrecognized-form-feminine-singular":"existențiala","definite-error-unrecognized-form-masculine-plural":"existențialii","definite-error-unrecognized-form-feminine-neuter-plural":"existențialele"}},{"word":"existențialism","pos":"noun","definitions":["existentialism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"existențialism","accusative-definite-nominative-singular":"existențialismul","accusative-indefinite-nominative-plural":"existențialisme","accusative-definite-nominative-plural":"existențialismele","dative-genitive-indefinite-singular":"existențialism","dative-definite-genitive-singular":"existențialismului","dative-genitive-indefinite-plural":"existențialisme","dative-definite-genitive-plural":"existențialismelor","singular-vocative":"existențialismule","plural-vocative":"existențialismelor"}},{"word":"existențialist","pos":"noun","definitions":["existentialist"],"forms":{"plural":"existențialiști","feminine":"equivalent existențialistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"existențialist","accusative-definite-nominative-singular":"existențialistul","accusative-indefinite-nominative-plural":"existențialiști","accusative-definite-nominative-plural":"existențialiștii","dative-genitive-indefinite-singular":"existențialist","dative-definite-genitive-singular":"existențialistului","dative-genitive-indefinite-plural":"existențialiști","dative-definite-genitive-plural":"existențialiștilor","singular-vocative":"existențialistule","plural-vocative":"existențialiștilor"}},{"word":"existențialistă","pos":"noun","definitions":["female equivalent of existențialist"],"forms":{"plural":"existențialiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"existențialistă","accusative-definite-nominative-singular":"existențialista","accusative-indefinite-nominative-plural":"existențialiste","accusative-definite-nominative-plural":"existențialistele","dative-genitive-indefinite-singular":"existențialiste","dative-definite-genitive-singular":"existențialistei","dative-genitive-indefinite-plural":"existențialiste","dative-definite-genitive-plural":"existențialistelor","singular-vocative":"existențialistă","plural-vocative":"existențialistelor"}},{"word":"exit-poll","pos":"noun","definitions":["exit poll"],"forms":{"plural":"exit-polluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exit-poll","accusative-definite-nominative-singular":"exit-pollul","accusative-indefinite-nominative-plural":"exit-polluri","accusative-definite-nominative-plural":"exit-pollurile","dative-genitive-indefinite-singular":"exit-poll","dative-definite-genitive-singular":"exit-pollului","dative-genitive-indefinite-plural":"exit-polluri","dative-definite-genitive-plural":"exit-pollurilor","singular-vocative":"exit-pollule","plural-vocative":"exit-pollurilor"}},{"word":"exitus","pos":"noun","definitions":["death"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exitus","accusative-definite-nominative":"exitusul","dative-genitive-indefinite":"exitus","dative-definite-genitive":"exitusului","vocative":"exitusule"}},{"word":"exmatricula","pos":"verb","definitions":["to expel (from a school)"],"forms":{"canonical":"a exmatricula 1st conjugation","present-singular-third-person":"exmatriculează","participle-past":"exmatriculat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exmatricula","gerund":"exmatriculând","first-person-indicative-present-singular":"exmatriculez","indicative-present-second-person-singular":"exmatriculezi","indicative-present-singular-third-person":"exmatriculează","first-person-indicative-plural-present":"exmatriculăm","indicative-plural-present-second-person":"exmatriculați","indicative-plural-present-third-person":"exmatriculează","first-person-imperfect-indicative-singular":"exmatriculam","imperfect-indicative-second-person-singular":"exmatriculai","imperfect-indicative-singular-third-person":"exmatricula","first-person-imperfect-indicative-plural":"exmatriculam","imperfect-indicative-plural-second-person":"exmatriculați","imperfect-indicative-plural-third-person":"exmatriculau","first-person-indicative-perfect-singular":"exmatriculai","indicative-perfect-second-person-singular":"exmatriculași","indicative-perfect-singular-third-person":"exmatriculă","first-person-indicative-perfect-plural":"exmatricularăm","indicative-perfect-plural-second-person":"exmatricularăți","indicative-perfect-plural-third-person":"exmatriculară","first-person-indicative-pluperfect-singular":"exmatriculasem","indicative-pluperfect-second-person-singular":"exmatriculaseși","indicative-pluperfect-singular-third-person":"exmatriculase","first-person-indicative-pluperfect-plural":"exmatriculaserăm","indicative-pluperfect-plural-second-person":"exmatriculaserăți","indicative-pluperfect-plural-third-person":"exmatriculaseră","first-person-present-singular-subjunctive":"să exmatriculez","present-second-person-singular-subjunctive":"să exmatriculezi","present-singular-subjunctive-third-person":"să exmatriculeze","first-person-plural-present-subjunctive":"să exmatriculăm","plural-present-second-person-subjunctive":"să exmatriculați","plural-present-subjunctive-third-person":"să exmatriculeze","imperative-second-person-singular":"exmatriculează","imperative-plural-second-person":"exmatriculați","imperative-negative-second-person-singular":"nu exmatricula","imperative-negative-plural-second-person":"nu exmatriculați"}},{"word":"exmatriculare","pos":"noun","definitions":["expulsion (from a school)"],"forms":{"plural":"exmatriculări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exmatriculare","accusative-definite-nominative-singular":"exmatricularea","accusative-indefinite-nominative-plural":"exmatriculări","accusative-definite-nominative-plural":"exmatriculările","dative-genitive-indefinite-singular":"exmatriculări","dative-definite-genitive-singular":"exmatriculării","dative-genitive-indefinite-plural":"exmatriculări","dative-definite-genitive-plural":"exmatriculărilor","singular-vocative":"exmatriculare","plural-vocative":"exmatriculărilor"}},{"word":"exmatriculat","pos":"adj","definitions":["expelled (from a school)"],"forms":{"feminine-singular":"exmatriculată","masculine-plural":"exmatriculați","feminine-neuter-plural":"exmatriculate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exmatriculat","error-unrecognized-form-feminine-indefinite-singular":"exmatriculată","error-unrecognized-form-indefinite-masculine-plural":"exmatriculați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exmatriculate","definite-error-unrecognized-form-masculine-neuter-singular":"exmatriculatul","definite-error-unrecognized-form-feminine-singular":"exmatriculata","definite-error-unrecognized-form-masculine-plural":"exmatriculații","definite-error-unrecognized-form-feminine-neuter-plural":"exmatriculatele"}},{"word":"exmatriculat","pos":"verb","definitions":["past participle of exmatricula"],"forms":{"participle-past":"of exmatricula"}},{"word":"exobiologie","pos":"noun","definitions":["exobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"exobiologie","accusative-definite-nominative":"exobiologia","dative-genitive-indefinite":"exobiologii","dative-definite-genitive":"exobiologiei","vocative":"exobiologie"}},{"word":"exocarp","pos":"noun","definitions":["exocarpe"],"forms":{"plural":"exocarpuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exocarp","accusative-definite-nominative-singular":"exocarpul","accusative-indefinite-nominative-plural":"exocarpuri","accusative-definite-nominative-plural":"exocarpurile","dative-genitive-indefinite-singular":"exocarp","dative-definite-genitive-singular":"exocarpului","dative-genitive-indefinite-plural":"exocarpuri","dative-definite-genitive-plural":"exocarpurilor","singular-vocative":"exocarpule","plural-vocative":"exocarpurilor"}},{"word":"exocastron","pos":"noun","definitions":["suburb"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exocastron","accusative-definite-nominative":"exocastronul","dative-genitive-indefinite":"exocastron","dative-definite-genitive":"exocastronului","vocative":"exocastronule"}},{"word":"exocitoză","pos":"noun","definitions":["exocytosis"],"forms":{"plural":"exocitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exocitoză","accusative-definite-nominative-singular":"exocitoza","accusative-indefinite-nominative-plural":"exocitoze","accusative-definite-nominative-plural":"exocitozele","dative-genitive-indefinite-singular":"exocitoze","dative-definite-genitive-singular":"exocitozei","dative-genitive-indefinite-plural":"exocitoze","dative-definite-genitive-plural":"exocitozelor","singular-vocative":"exocitoză","plural-vocative":"exocitozelor"}},{"word":"exocortex","pos":"noun","definitions":["exocortex"],"forms":{"plural":"exocortexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exocortex","accusative-definite-nominative-singular":"exocortexul","accusative-indefinite-nominative-plural":"exocortexuri","accusative-definite-nominative-plural":"exocortexurile","dative-genitive-indefinite-singular":"exocortex","dative-definite-genitive-singular":"exocortexului","dative-genitive-indefinite-plural":"exocortexuri","dative-definite-genitive-plural":"exocortexurilor","singular-vocative":"exocortexule","plural-vocative":"exocortexurilor"}},{"word":"exocrin","pos":"adj","definitions":["exocrine"],"forms":{"feminine-singular":"exocrină","masculine-plural":"exocrini","feminine-neuter-plural":"exocrine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exocrin","error-unrecognized-form-feminine-indefinite-singular":"exocrină","error-unrecognized-form-indefinite-masculine-plural":"exocrini","error-unrecognized-form-feminine-indefinite-neuter-plural":"exocrine","definite-error-unrecognized-form-masculine-neuter-singular":"exocrinul","definite-error-unrecognized-form-feminine-singular":"exocrina","definite-error-unrecognized-form-masculine-plural":"exocrinii","definite-error-unrecognized-form-feminine-neuter-plural":"exocrinele"}},{"word":"exocrinopatie","pos":"noun","definitions":["exocrinopathy"],"forms":{"plural":"exocrinopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exocrinopatie","accusative-definite-nominative-singular":"exocrinopatia","accusative-indefinite-nominative-plural":"exocrinopatii","accusative-definite-nominative-plural":"exocrinopatiile","dative-genitive-indefinite-singular":"exocrinopatii","dative-definite-genitive-singular":"exocrinopatiei","dative-genitive-indefinite-plural":"exocrinopatii","dative-definite-genitive-plural":"exocrinopatiilor","singular-vocative":"exocrinopatie","plural-vocative":"exocrinopatiilor"}},{"word":"exod","pos":"noun","definitions":["exodus"],"forms":{"plural":"exoduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exod","accusative-definite-nominative-singular":"exodul","accusative-indefinite-nominative-plural":"exoduri","accusative-definite-nominative-plural":"exodurile","dative-genitive-indefinite-singular":"exod","dative-definite-genitive-singular":"exodului","dative-genitive-indefinite-plural":"exoduri","dative-definite-genitive-plural":"exodurilor","singular-vocative":"exodule","plural-vocative":"exodurilor"}},{"word":"exoderm","pos":"noun","definitions":["exoderm"],"forms":{"plural":"exoderme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exoderm","accusative-definite-nominative-singular":"exodermul","accusative-indefinite-nominative-plural":"exoderme","accusative-definite-nominative-plural":"exodermele","dative-genitive-indefinite-singular":"exoderm","dative-definite-genitive-singular":"exodermului","dative-genitive-indefinite-plural":"exoderme","dative-definite-genitive-plural":"exodermelor","singular-vocative":"exodermule","plural-vocative":"exodermelor"}},{"word":"exoelectron","pos":"noun","definitions":["exoelectron"],"forms":{"plural":"exoelectroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exoelectron","accusative-definite-nominative-singular":"exoelectronul","accusative-indefinite-nominative-plural":"exoelectroni","accusative-definite-nominative-plural":"exoelectronii","dative-genitive-indefinite-singular":"exoelectron","dative-definite-genitive-singular":"exoelectronului","dative-genitive-indefinite-plural":"exoelectroni","dative-definite-genitive-plural":"exoelectronilor","singular-vocative":"exoelectronule","plural-vocative":"exoelectronilor"}},{"word":"exoenzimă","pos":"noun","definitions":["exoenzyme"],"forms":{"plural":"exoenzime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exoenzimă","accusative-definite-nominative-singular":"exoenzima","accusative-indefinite-nominative-plural":"exoenzime","accusative-definite-nominative-plural":"exoenzimele","dative-genitive-indefinite-singular":"exoenzime","dative-definite-genitive-singular":"exoenzimei","dative-genitive-indefinite-plural":"exoenzime","dative-definite-genitive-plural":"exoenzimelor","singular-vocative":"exoenzimă","plural-vocative":"exoenzimelor"}},{"word":"exofag","pos":"adj","definitions":["exophagic"],"forms":{"feminine-singular":"exofagă","masculine-plural":"exofagi","feminine-neuter-plural":"exofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exofag","error-unrecognized-form-feminine-indefinite-singular":"exofagă","error-unrecognized-form-indefinite-masculine-plural":"exofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exofage","definite-error-unrecognized-form-masculine-neuter-singular":"exofagul","definite-error-unrecognized-form-feminine-singular":"exofaga","definite-error-unrecognized-form-masculine-plural":"exofagii","definite-error-unrecognized-form-feminine-neuter-plural":"exofagele"}},{"word":"exoflisi","pos":"verb","definitions":["to pay a debt"],"forms":{"canonical":"a exoflisi 4th conjugation","present-singular-third-person":"exoflisește","participle-past":"exoflisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a exoflisi","gerund":"exoflisind","first-person-indicative-present-singular":"exoflisesc","indicative-present-second-person-singular":"exoflisești","indicative-present-singular-third-person":"exoflisește","first-person-indicative-plural-present":"exoflisim","indicative-plural-present-second-person":"exoflisiți","indicative-plural-present-third-person":"exoflisesc","first-person-imperfect-indicative-singular":"exofliseam","imperfect-indicative-second-person-singular":"exofliseai","imperfect-indicative-singular-third-person":"exoflisea","first-person-imperfect-indicative-plural":"exofliseam","imperfect-indicative-plural-second-person":"exofliseați","imperfect-indicative-plural-third-person":"exofliseau","first-person-indicative-perfect-singular":"exoflisii","indicative-perfect-second-person-singular":"exoflisiși","indicative-perfect-singular-third-person":"exoflisi","first-person-indicative-perfect-plural":"exoflisirăm","indicative-perfect-plural-second-person":"exoflisirăți","indicative-perfect-plural-third-person":"exoflisiră","first-person-indicative-pluperfect-singular":"exoflisisem","indicative-pluperfect-second-person-singular":"exoflisiseși","indicative-pluperfect-singular-third-person":"exoflisise","first-person-indicative-pluperfect-plural":"exoflisiserăm","indicative-pluperfect-plural-second-person":"exoflisiserăți","indicative-pluperfect-plural-third-person":"exoflisiseră","first-person-present-singular-subjunctive":"să exoflisesc","present-second-person-singular-subjunctive":"să exoflisești","present-singular-subjunctive-third-person":"să exoflisească","first-person-plural-present-subjunctive":"să exoflisim","plural-present-second-person-subjunctive":"să exoflisiți","plural-present-subjunctive-third-person":"să exoflisească","imperative-second-person-singular":"exoflisește","imperative-plural-second-person":"exoflisiți","imperative-negative-second-person-singular":"nu exoflisi","imperative-negative-plural-second-person":"nu exoflisiți"}},{"word":"exofliticon","pos":"noun","definitions":["receipt"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exofliticon","accusative-definite-nominative":"exofliticonul","dative-genitive-indefinite":"exofliticon","dative-definite-genitive":"exofliticonului","vocative":"exofliticonule"}},{"word":"exoftalmic","pos":"adj","definitions":["exophthalmic"],"forms":{"feminine-singular":"exoftalmică","masculine-plural":"exoftalmici","feminine-neuter-plural":"exoftalmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exoftalmic","error-unrecognized-form-feminine-indefinite-singular":"exoftalmică","error-unrecognized-form-indefinite-masculine-plural":"exoftalmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exoftalmice","definite-error-unrecognized-form-masculine-neuter-singular":"exoftalmicul","definite-error-unrecognized-form-feminine-singular":"exoftalmica","definite-error-unrecognized-form-masculine-plural":"exoftalmicii","definite-error-unrecognized-form-feminine-neuter-plural":"exoftalmicele"}},{"word":"exoftalmie","pos":"noun","definitions":["exophthalmos"],"forms":{"plural":"exoftalmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exoftalmie","accusative-definite-nominative-singular":"exoftalmia","accusative-indefinite-nominative-plural":"exoftalmii","accusative-definite-nominative-plural":"exoftalmiile","dative-genitive-indefinite-singular":"exoftalmii","dative-definite-genitive-singular":"exoftalmiei","dative-genitive-indefinite-plural":"exoftalmii","dative-definite-genitive-plural":"exoftalmiilor","singular-vocative":"exoftalmie","plural-vocative":"exoftalmiilor"}},{"word":"exoftalmometrie","pos":"noun","definitions":["exophthalmometry"],"forms":{"plural":"exoftalmometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exoftalmometrie","accusative-definite-nominative-singular":"exoftalmometria","accusative-indefinite-nominative-plural":"exoftalmometrii","accusative-definite-nominative-plural":"exoftalmometriile","dative-genitive-indefinite-singular":"exoftalmometrii","dative-definite-genitive-singular":"exoftalmometriei","dative-genitive-indefinite-plural":"exoftalmometrii","dative-definite-genitive-plural":"exoftalmometriilor","singular-vocative":"exoftalmometrie","plural-vocative":"exoftalmometriilor"}},{"word":"exoftalmometru","pos":"noun","definitions":["exophthalmometer"],"forms":{"plural":"exoftalmometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exoftalmometru","accusative-definite-nominative-singular":"exoftalmometruul","accusative-indefinite-nominative-plural":"exoftalmometre","accusative-definite-nominative-plural":"exoftalmometrele","dative-genitive-indefinite-singular":"exoftalmometru","dative-definite-genitive-singular":"exoftalmometruului","dative-genitive-indefinite-plural":"exoftalmometre","dative-definite-genitive-plural":"exoftalmometrelor","singular-vocative":"exoftalmometruule","plural-vocative":"exoftalmometrelor"}},{"word":"exogam","pos":"adj","definitions":["exogamous"],"forms":{"feminine-singular":"exogamă","masculine-plural":"exogami","feminine-neuter-plural":"exogame","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exogam","error-unrecognized-form-feminine-indefinite-singular":"exogamă","error-unrecognized-form-indefinite-masculine-plural":"exogami","error-unrecognized-form-feminine-indefinite-neuter-plural":"exogame","definite-error-unrecognized-form-masculine-neuter-singular":"exogamul","definite-error-unrecognized-form-feminine-singular":"exogama","definite-error-unrecognized-form-masculine-plural":"exogamii","definite-error-unrecognized-form-feminine-neuter-plural":"exogamele"}},{"word":"exogamie","pos":"noun","definitions":["exogamy"],"forms":{"plural":"exogamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exogamie","accusative-definite-nominative-singular":"exogamia","accusative-indefinite-nominative-plural":"exogamii","accusative-definite-nominative-plural":"exogamiile","dative-genitive-indefinite-singular":"exogamii","dative-definite-genitive-singular":"exogamiei","dative-genitive-indefinite-plural":"exogamii","dative-definite-genitive-plural":"exogamiilor","singular-vocative":"exogamie","plural-vocative":"exogamiilor"}},{"word":"exogen","pos":"adj","definitions":["exogenous"],"forms":{"feminine-singular":"exogenă","masculine-plural":"exogeni","feminine-neuter-plural":"exogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exogen","error-unrecognized-form-feminine-indefinite-singular":"exogenă","error-unrecognized-form-indefinite-masculine-plural":"exogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"exogene","definite-error-unrecognized-form-masculine-neuter-singular":"exogenul","definite-error-unrecognized-form-feminine-singular":"exogena","definite-error-unrecognized-form-masculine-plural":"exogenii","definite-error-unrecognized-form-feminine-neuter-plural":"exogenele"}},{"word":"exomorf","pos":"adj","definitions":["exomorphic"],"forms":{"feminine-singular":"exomorfă","masculine-plural":"exomorfi","feminine-neuter-plural":"exomorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exomorf","error-unrecognized-form-feminine-indefinite-singular":"exomorfă","error-unrecognized-form-indefinite-masculine-plural":"exomorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exomorfe","definite-error-unrecognized-form-masculine-neuter-singular":"exomorful","definite-error-unrecognized-form-feminine-singular":"exomorfa","definite-error-unrecognized-form-masculine-plural":"exomorfii","definite-error-unrecognized-form-feminine-neuter-plural":"exomorfele"}},{"word":"exomorfism","pos":"noun","definitions":["exomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exomorfism","accusative-definite-nominative-singular":"exomorfismul","accusative-indefinite-nominative-plural":"exomorfisme","accusative-definite-nominative-plural":"exomorfismele","dative-genitive-indefinite-singular":"exomorfism","dative-definite-genitive-singular":"exomorfismului","dative-genitive-indefinite-plural":"exomorfisme","dative-definite-genitive-plural":"exomorfismelor","singular-vocative":"exomorfismule","plural-vocative":"exomorfismelor"}},{"word":"exonartex","pos":"noun","definitions":["exonarthex"],"forms":{"plural":"exonartexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"exonartex","accusative-definite-nominative-singular":"exonartexul","accusative-indefinite-nominative-plural":"exonartexuri","accusative-definite-nominative-plural":"exonartexurile","dative-genitive-indefinite-singular":"exonartex","dative-definite-genitive-singular":"exonartexului","dative-genitive-indefinite-plural":"exonartexuri","dative-definite-genitive-plural":"exonartexurilor","singular-vocative":"exonartexule","plural-vocative":"exonartexurilor"}},{"word":"exonera","pos":"verb","definitions":["to exonerate"],"forms":{"canonical":"a exonera 1st conjugation","present-singular-third-person":"exonerează","participle-past":"exonerat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exonera","gerund":"exonerând","first-person-indicative-present-singular":"exonerez","indicative-present-second-person-singular":"exonerezi","indicative-present-singular-third-person":"exonerează","first-person-indicative-plural-present":"exonerăm","indicative-plural-present-second-person":"exonerați","indicative-plural-present-third-person":"exonerează","first-person-imperfect-indicative-singular":"exoneram","imperfect-indicative-second-person-singular":"exonerai","imperfect-indicative-singular-third-person":"exonera","first-person-imperfect-indicative-plural":"exoneram","imperfect-indicative-plural-second-person":"exonerați","imperfect-indicative-plural-third-person":"exonerau","first-person-indicative-perfect-singular":"exonerai","indicative-perfect-second-person-singular":"exonerași","indicative-perfect-singular-third-person":"exoneră","first-person-indicative-perfect-plural":"exonerarăm","indicative-perfect-plural-second-person":"exonerarăți","indicative-perfect-plural-third-person":"exonerară","first-person-indicative-pluperfect-singular":"exonerasem","indicative-pluperfect-second-person-singular":"exoneraseși","indicative-pluperfect-singular-third-person":"exonerase","first-person-indicative-pluperfect-plural":"exoneraserăm","indicative-pluperfect-plural-second-person":"exoneraserăți","indicative-pluperfect-plural-third-person":"exoneraseră","first-person-present-singular-subjunctive":"să exonerez","present-second-person-singular-subjunctive":"să exonerezi","present-singular-subjunctive-third-person":"să exonereze","first-person-plural-present-subjunctive":"să exonerăm","plural-present-second-person-subjunctive":"să exonerați","plural-present-subjunctive-third-person":"să exonereze","imperative-second-person-singular":"exonerează","imperative-plural-second-person":"exonerați","imperative-negative-second-person-singular":"nu exonera","imperative-negative-plural-second-person":"nu exonerați"}},{"word":"exonerare","pos":"noun","definitions":["exoneration"],"forms":{"plural":"exonerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exonerare","accusative-definite-nominative-singular":"exonerarea","accusative-indefinite-nominative-plural":"exonerări","accusative-definite-nominative-plural":"exonerările","dative-genitive-indefinite-singular":"exonerări","dative-definite-genitive-singular":"exonerării","dative-genitive-indefinite-plural":"exonerări","dative-definite-genitive-plural":"exonerărilor","singular-vocative":"exonerare","plural-vocative":"exonerărilor"}},{"word":"exonerație","pos":"noun","definitions":["exoneration"],"forms":{"plural":"exonerații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exonerație","accusative-definite-nominative-singular":"exonerația","accusative-indefinite-nominative-plural":"exonerații","accusative-definite-nominative-plural":"exonerațiile","dative-genitive-indefinite-singular":"exonerații","dative-definite-genitive-singular":"exonerației","dative-genitive-indefinite-plural":"exonerații","dative-definite-genitive-plural":"exonerațiilor","singular-vocative":"exonerație","plural-vocative":"exonerațiilor"}},{"word":"exopeptidază","pos":"noun","definitions":["exopeptidase"],"forms":{"plural":"exopeptidaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exopeptidază","accusative-definite-nominative-singular":"exopeptidaza","accusative-indefinite-nominative-plural":"exopeptidaze","accusative-definite-nominative-plural":"exopeptidazele","dative-genitive-indefinite-singular":"exopeptidaze","dative-definite-genitive-singular":"exopeptidazei","dative-genitive-indefinite-plural":"exopeptidaze","dative-definite-genitive-plural":"exopeptidazelor","singular-vocative":"exopeptidază","plural-vocative":"exopeptidazelor"}},{"word":"exoplasmă","pos":"noun","definitions":["ectoplasm"],"forms":{"plural":"exoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exoplasmă","accusative-definite-nominative-singular":"exoplasma","accusative-indefinite-nominative-plural":"exoplasme","accusative-definite-nominative-plural":"exoplasmele","dative-genitive-indefinite-singular":"exoplasme","dative-definite-genitive-singular":"exoplasmei","dative-genitive-indefinite-plural":"exoplasme","dative-definite-genitive-plural":"exoplasmelor","singular-vocative":"exoplasmă","plural-vocative":"exoplasmelor"}},{"word":"exoplasmic","pos":"adj","definitions":["exoplasmic"],"forms":{"feminine-singular":"exoplasmică","masculine-plural":"exoplasmici","feminine-neuter-plural":"exoplasmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exoplasmic","error-unrecognized-form-feminine-indefinite-singular":"exoplasmică","error-unrecognized-form-indefinite-masculine-plural":"exoplasmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exoplasmice","definite-error-unrecognized-form-masculine-neuter-singular":"exoplasmicul","definite-error-unrecognized-form-feminine-singular":"exoplasmica","definite-error-unrecognized-form-masculine-plural":"exoplasmicii","definite-error-unrecognized-form-feminine-neuter-plural":"exoplasmicele"}},{"word":"exorabil","pos":"adj","definitions":["exorable"],"forms":{"feminine-singular":"exorabilă","masculine-plural":"exorabili","feminine-neuter-plural":"exorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exorabil","error-unrecognized-form-feminine-indefinite-singular":"exorabilă","error-unrecognized-form-indefinite-masculine-plural":"exorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exorabile","definite-error-unrecognized-form-masculine-neuter-singular":"exorabilul","definite-error-unrecognized-form-feminine-singular":"exorabila","definite-error-unrecognized-form-masculine-plural":"exorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exorabilele"}},{"word":"exorație","pos":"noun","definitions":["exhortation"],"forms":{"plural":"exorații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exorație","accusative-definite-nominative-singular":"exorația","accusative-indefinite-nominative-plural":"exorații","accusative-definite-nominative-plural":"exorațiile","dative-genitive-indefinite-singular":"exorații","dative-definite-genitive-singular":"exorației","dative-genitive-indefinite-plural":"exorații","dative-definite-genitive-plural":"exorațiilor","singular-vocative":"exorație","plural-vocative":"exorațiilor"}},{"word":"exorbitant","pos":"adj","definitions":["extortionate"],"forms":{"feminine-singular":"exorbitantă","masculine-plural":"exorbitanți","feminine-neuter-plural":"exorbitante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exorbitant","error-unrecognized-form-feminine-indefinite-singular":"exorbitantă","error-unrecognized-form-indefinite-masculine-plural":"exorbitanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exorbitante","definite-error-unrecognized-form-masculine-neuter-singular":"exorbitantul","definite-error-unrecognized-form-feminine-singular":"exorbitanta","definite-error-unrecognized-form-masculine-plural":"exorbitanții","definite-error-unrecognized-form-feminine-neuter-plural":"exorbitantele"}},{"word":"exorbitanță","pos":"noun","definitions":["exorbitance"],"forms":{"plural":"exorbitanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exorbitanță","accusative-definite-nominative-singular":"exorbitanța","accusative-indefinite-nominative-plural":"exorbitanțe","accusative-definite-nominative-plural":"exorbitanțele","dative-genitive-indefinite-singular":"exorbitanțe","dative-definite-genitive-singular":"exorbitanței","dative-genitive-indefinite-plural":"exorbitanțe","dative-definite-genitive-plural":"exorbitanțelor","singular-vocative":"exorbitanță","plural-vocative":"exorbitanțelor"}},{"word":"exorbitat","pos":"adj","definitions":["bulging (eyes)"],"forms":{"feminine-singular":"exorbitată","masculine-plural":"exorbitați","feminine-neuter-plural":"exorbitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exorbitat","error-unrecognized-form-feminine-indefinite-singular":"exorbitată","error-unrecognized-form-indefinite-masculine-plural":"exorbitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exorbitate","definite-error-unrecognized-form-masculine-neuter-singular":"exorbitatul","definite-error-unrecognized-form-feminine-singular":"exorbitata","definite-error-unrecognized-form-masculine-plural":"exorbitații","definite-error-unrecognized-form-feminine-neuter-plural":"exorbitatele"}},{"word":"exorchisire","pos":"noun","definitions":["exorcism"],"forms":{"plural":"exorchisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exorchisire","accusative-definite-nominative-singular":"exorchisirea","accusative-indefinite-nominative-plural":"exorchisiri","accusative-definite-nominative-plural":"exorchisirile","dative-genitive-indefinite-singular":"exorchisiri","dative-definite-genitive-singular":"exorchisirii","dative-genitive-indefinite-plural":"exorchisiri","dative-definite-genitive-plural":"exorchisirilor","singular-vocative":"exorchisire","plural-vocative":"exorchisirilor"}},{"word":"exorcism","pos":"noun","definitions":["exorcism"],"pronunciation":"/ek.sorˈt͡ʃism/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exorcism","accusative-definite-nominative":"exorcismul","dative-genitive-indefinite":"exorcism","dative-definite-genitive":"exorcismului","vocative":"exorcismule"}},{"word":"exorcist","pos":"noun","definitions":["exorcist"],"forms":{"plural":"exorciști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exorcist","accusative-definite-nominative-singular":"exorcistul","accusative-indefinite-nominative-plural":"exorciști","accusative-definite-nominative-plural":"exorciștii","dative-genitive-indefinite-singular":"exorcist","dative-definite-genitive-singular":"exorcistului","dative-genitive-indefinite-plural":"exorciști","dative-definite-genitive-plural":"exorciștilor","singular-vocative":"exorcistule","plural-vocative":"exorciștilor"}},{"word":"exorcistă","pos":"noun","definitions":["female equivalent of exorcist"],"forms":{"plural":"exorciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exorcistă","accusative-definite-nominative-singular":"exorcista","accusative-indefinite-nominative-plural":"exorciste","accusative-definite-nominative-plural":"exorcistele","dative-genitive-indefinite-singular":"exorciste","dative-definite-genitive-singular":"exorcistei","dative-genitive-indefinite-plural":"exorciste","dative-definite-genitive-plural":"exorcistelor","singular-vocative":"exorcistă","plural-vocative":"exorcistelor"}},{"word":"exorciza","pos":"verb","definitions":["to exorcise"],"pronunciation":"/ek.sor.t͡ʃiˈza/","forms":{"canonical":"a exorciza 1st conjugation","present-singular-third-person":"exorcizează","participle-past":"exorcizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exorciza","gerund":"exorcizând","first-person-indicative-present-singular":"exorcizez","indicative-present-second-person-singular":"exorcizezi","indicative-present-singular-third-person":"exorcizează","first-person-indicative-plural-present":"exorcizăm","indicative-plural-present-second-person":"exorcizați","indicative-plural-present-third-person":"exorcizează","first-person-imperfect-indicative-singular":"exorcizam","imperfect-indicative-second-person-singular":"exorcizai","imperfect-indicative-singular-third-person":"exorciza","first-person-imperfect-indicative-plural":"exorcizam","imperfect-indicative-plural-second-person":"exorcizați","imperfect-indicative-plural-third-person":"exorcizau","first-person-indicative-perfect-singular":"exorcizai","indicative-perfect-second-person-singular":"exorcizași","indicative-perfect-singular-third-person":"exorciză","first-person-indicative-perfect-plural":"exorcizarăm","indicative-perfect-plural-second-person":"exorcizarăți","indicative-perfect-plural-third-person":"exorcizară","first-person-indicative-pluperfect-singular":"exorcizasem","indicative-pluperfect-second-person-singular":"exorcizaseși","indicative-pluperfect-singular-third-person":"exorcizase","first-person-indicative-pluperfect-plural":"exorcizaserăm","indicative-pluperfect-plural-second-person":"exorcizaserăți","indicative-pluperfect-plural-third-person":"exorcizaseră","first-person-present-singular-subjunctive":"să exorcizez","present-second-person-singular-subjunctive":"să exorcizezi","present-singular-subjunctive-third-person":"să exorcizeze","first-person-plural-present-subjunctive":"să exorcizăm","plural-present-second-person-subjunctive":"să exorcizați","plural-present-subjunctive-third-person":"să exorcizeze","imperative-second-person-singular":"exorcizează","imperative-plural-second-person":"exorcizați","imperative-negative-second-person-singular":"nu exorciza","imperative-negative-plural-second-person":"nu exorcizați"}},{"word":"exorcizare","pos":"noun","definitions":["exorcism"],"forms":{"plural":"exorcizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exorcizare","accusative-definite-nominative-singular":"exorcizarea","accusative-indefinite-nominative-plural":"exorcizări","accusative-definite-nominative-plural":"exorcizările","dative-genitive-indefinite-singular":"exorcizări","dative-definite-genitive-singular":"exorcizării","dative-genitive-indefinite-plural":"exorcizări","dative-definite-genitive-plural":"exorcizărilor","singular-vocative":"exorcizare","plural-vocative":"exorcizărilor"}},{"word":"exordiu","pos":"noun","definitions":["exordium, beginning, commencement of a discourse"],"forms":{"plural":"exordii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exordiu","accusative-definite-nominative-singular":"exordiuul","accusative-indefinite-nominative-plural":"exordii","accusative-definite-nominative-plural":"exordiile","dative-genitive-indefinite-singular":"exordiu","dative-definite-genitive-singular":"exordiuului","dative-genitive-indefinite-plural":"exordii","dative-definite-genitive-plural":"exordiilor","singular-vocative":"exordiuule","plural-vocative":"exordiilor"}},{"word":"exoreic","pos":"adj","definitions":["exoreic"],"forms":{"feminine-singular":"exoreică","masculine-plural":"exoreici","feminine-neuter-plural":"exoreice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exoreic","error-unrecognized-form-feminine-indefinite-singular":"exoreică","error-unrecognized-form-indefinite-masculine-plural":"exoreici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exoreice","definite-error-unrecognized-form-masculine-neuter-singular":"exoreicul","definite-error-unrecognized-form-feminine-singular":"exoreica","definite-error-unrecognized-form-masculine-plural":"exoreicii","definite-error-unrecognized-form-feminine-neuter-plural":"exoreicele"}},{"word":"exorie","pos":"noun","definitions":["exile"],"forms":{"plural":"exorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exorie","accusative-definite-nominative-singular":"exoria","accusative-indefinite-nominative-plural":"exorii","accusative-definite-nominative-plural":"exoriile","dative-genitive-indefinite-singular":"exorii","dative-definite-genitive-singular":"exoriei","dative-genitive-indefinite-plural":"exorii","dative-definite-genitive-plural":"exoriilor","singular-vocative":"exorie","plural-vocative":"exoriilor"}},{"word":"exorisire","pos":"noun","definitions":["banishment"],"forms":{"plural":"exorisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exorisire","accusative-definite-nominative-singular":"exorisirea","accusative-indefinite-nominative-plural":"exorisiri","accusative-definite-nominative-plural":"exorisirile","dative-genitive-indefinite-singular":"exorisiri","dative-definite-genitive-singular":"exorisirii","dative-genitive-indefinite-plural":"exorisiri","dative-definite-genitive-plural":"exorisirilor","singular-vocative":"exorisire","plural-vocative":"exorisirilor"}},{"word":"exorisit","pos":"adj","definitions":["exiled"],"forms":{"feminine-singular":"exorisită","masculine-plural":"exorisiți","feminine-neuter-plural":"exorisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exorisit","error-unrecognized-form-feminine-indefinite-singular":"exorisită","error-unrecognized-form-indefinite-masculine-plural":"exorisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exorisite","definite-error-unrecognized-form-masculine-neuter-singular":"exorisitul","definite-error-unrecognized-form-feminine-singular":"exorisita","definite-error-unrecognized-form-masculine-plural":"exorisiții","definite-error-unrecognized-form-feminine-neuter-plural":"exorisitele"}},{"word":"exorisit","pos":"verb","definitions":["past participle of exorisi"],"forms":{"participle-past":"of exorisi"}},{"word":"exorta","pos":"verb","definitions":["to urge"],"pronunciation":"/ek.sorˈta/","forms":{"canonical":"a exorta 1st conjugation","present-singular-third-person":"exortează","participle-past":"exortat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exorta","gerund":"exortând","first-person-indicative-present-singular":"exortez","indicative-present-second-person-singular":"exortezi","indicative-present-singular-third-person":"exortează","first-person-indicative-plural-present":"exortăm","indicative-plural-present-second-person":"exortați","indicative-plural-present-third-person":"exortează","first-person-imperfect-indicative-singular":"exortam","imperfect-indicative-second-person-singular":"exortai","imperfect-indicative-singular-third-person":"exorta","first-person-imperfect-indicative-plural":"exortam","imperfect-indicative-plural-second-person":"exortați","imperfect-indicative-plural-third-person":"exortau","first-person-indicative-perfect-singular":"exortai","indicative-perfect-second-person-singular":"exortași","indicative-perfect-singular-third-person":"exortă","first-person-indicative-perfect-plural":"exortarăm","indicative-perfect-plural-second-person":"exortarăți","indicative-perfect-plural-third-person":"exortară","first-person-indicative-pluperfect-singular":"exortasem","indicative-pluperfect-second-person-singular":"exortaseși","indicative-pluperfect-singular-third-person":"exortase","first-person-indicative-pluperfect-plural":"exortaserăm","indicative-pluperfect-plural-second-person":"exortaserăți","indicative-pluperfect-plural-third-person":"exortaseră","first-person-present-singular-subjunctive":"să exortez","present-second-person-singular-subjunctive":"să exortezi","present-singular-subjunctive-third-person":"să exorteze","first-person-plural-present-subjunctive":"să exortăm","plural-present-second-person-subjunctive":"să exortați","plural-present-subjunctive-third-person":"să exorteze","imperative-second-person-singular":"exortează","imperative-plural-second-person":"exortați","imperative-negative-second-person-singular":"nu exorta","imperative-negative-plural-second-person":"nu exortați"}},{"word":"exortare","pos":"noun","definitions":["exhortation"],"forms":{"plural":"exortări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exortare","accusative-definite-nominative-singular":"exortarea","accusative-indefinite-nominative-plural":"exortări","accusative-definite-nominative-plural":"exortările","dative-genitive-indefinite-singular":"exortări","dative-definite-genitive-singular":"exortării","dative-genitive-indefinite-plural":"exortări","dative-definite-genitive-plural":"exortărilor","singular-vocative":"exortare","plural-vocative":"exortărilor"}},{"word":"exortație","pos":"noun","definitions":["exhortation"],"forms":{"plural":"exortații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exortație","accusative-definite-nominative-singular":"exortația","accusative-indefinite-nominative-plural":"exortații","accusative-definite-nominative-plural":"exortațiile","dative-genitive-indefinite-singular":"exortații","dative-definite-genitive-singular":"exortației","dative-genitive-indefinite-plural":"exortații","dative-definite-genitive-plural":"exortațiilor","singular-vocative":"exortație","plural-vocative":"exortațiilor"}},{"word":"exortațiune","pos":"noun","definitions":["obsolete form of exortație"],"forms":{"plural":"exortațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exortațiune","accusative-definite-nominative-singular":"exortațiunea","accusative-indefinite-nominative-plural":"exortațiuni","accusative-definite-nominative-plural":"exortațiunile","dative-genitive-indefinite-singular":"exortațiuni","dative-definite-genitive-singular":"exortațiunii","dative-genitive-indefinite-plural":"exortațiuni","dative-definite-genitive-plural":"exortațiunilor","singular-vocative":"exortațiune","plural-vocative":"exortațiunilor"}},{"word":"exortativ","pos":"adj","definitions":["exhortative"],"forms":{"feminine-singular":"exortativă","masculine-plural":"exortativi","feminine-neuter-plural":"exortative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exortativ","error-unrecognized-form-feminine-indefinite-singular":"exortativă","error-unrecognized-form-indefinite-masculine-plural":"exortativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exortative","definite-error-unrecognized-form-masculine-neuter-singular":"exortativul","definite-error-unrecognized-form-feminine-singular":"exortativa","definite-error-unrecognized-form-masculine-plural":"exortativii","definite-error-unrecognized-form-feminine-neuter-plural":"exortativele"}},{"word":"exoschelet","pos":"noun","definitions":["exoskeleton"],"forms":{"plural":"exoschelete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exoschelet","accusative-definite-nominative-singular":"exoscheletul","accusative-indefinite-nominative-plural":"exoschelete","accusative-definite-nominative-plural":"exoscheletele","dative-genitive-indefinite-singular":"exoschelet","dative-definite-genitive-singular":"exoscheletului","dative-genitive-indefinite-plural":"exoschelete","dative-definite-genitive-plural":"exoscheletelor","singular-vocative":"exoscheletule","plural-vocative":"exoscheletelor"}},{"word":"exoseroză","pos":"noun","definitions":["exoserosis"],"forms":{"plural":"exoseroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exoseroză","accusative-definite-nominative-singular":"exoseroza","accusative-indefinite-nominative-plural":"exoseroze","accusative-definite-nominative-plural":"exoserozele","dative-genitive-indefinite-singular":"exoseroze","dative-definite-genitive-singular":"exoserozei","dative-genitive-indefinite-plural":"exoseroze","dative-definite-genitive-plural":"exoserozelor","singular-vocative":"exoseroză","plural-vocative":"exoserozelor"}},{"word":"exosferă","pos":"noun","definitions":["exosphere"],"forms":{"plural":"exosfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exosferă","accusative-definite-nominative-singular":"exosfera","accusative-indefinite-nominative-plural":"exosfere","accusative-definite-nominative-plural":"exosferele","dative-genitive-indefinite-singular":"exosfere","dative-definite-genitive-singular":"exosferei","dative-genitive-indefinite-plural":"exosfere","dative-definite-genitive-plural":"exosferelor","singular-vocative":"exosferă","plural-vocative":"exosferelor"}},{"word":"exosferic","pos":"adj","definitions":["exospheric"],"forms":{"feminine-singular":"exosferică","masculine-plural":"exosferici","feminine-neuter-plural":"exosferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exosferic","error-unrecognized-form-feminine-indefinite-singular":"exosferică","error-unrecognized-form-indefinite-masculine-plural":"exosferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exosferice","definite-error-unrecognized-form-masculine-neuter-singular":"exosfericul","definite-error-unrecognized-form-feminine-singular":"exosferica","definite-error-unrecognized-form-masculine-plural":"exosfericii","definite-error-unrecognized-form-feminine-neuter-plural":"exosfericele"}},{"word":"exosmotic","pos":"adj","definitions":["exosmotic"],"forms":{"feminine-singular":"exosmotică","masculine-plural":"exosmotici","feminine-neuter-plural":"exosmotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exosmotic","error-unrecognized-form-feminine-indefinite-singular":"exosmotică","error-unrecognized-form-indefinite-masculine-plural":"exosmotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exosmotice","definite-error-unrecognized-form-masculine-neuter-singular":"exosmoticul","definite-error-unrecognized-form-feminine-singular":"exosmotica","definite-error-unrecognized-form-masculine-plural":"exosmoticii","definite-error-unrecognized-form-feminine-neuter-plural":"exosmoticele"}},{"word":"exosmoză","pos":"noun","definitions":["exosmosis"],"forms":{"plural":"exosmoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exosmoză","accusative-definite-nominative-singular":"exosmoza","accusative-indefinite-nominative-plural":"exosmoze","accusative-definite-nominative-plural":"exosmozele","dative-genitive-indefinite-singular":"exosmoze","dative-definite-genitive-singular":"exosmozei","dative-genitive-indefinite-plural":"exosmoze","dative-definite-genitive-plural":"exosmozelor","singular-vocative":"exosmoză","plural-vocative":"exosmozelor"}},{"word":"exostoză","pos":"noun","definitions":["exostosis"],"forms":{"plural":"exostoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exostoză","accusative-definite-nominative-singular":"exostoza","accusative-indefinite-nominative-plural":"exostoze","accusative-definite-nominative-plural":"exostozele","dative-genitive-indefinite-singular":"exostoze","dative-definite-genitive-singular":"exostozei","dative-genitive-indefinite-plural":"exostoze","dative-definite-genitive-plural":"exostozelor","singular-vocative":"exostoză","plural-vocative":"exostozelor"}},{"word":"exostozic","pos":"adj","definitions":["related to exostosis"],"forms":{"feminine-singular":"exostozică","masculine-plural":"exostozici","feminine-neuter-plural":"exostozice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exostozic","error-unrecognized-form-feminine-indefinite-singular":"exostozică","error-unrecognized-form-indefinite-masculine-plural":"exostozici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exostozice","definite-error-unrecognized-form-masculine-neuter-singular":"exostozicul","definite-error-unrecognized-form-feminine-singular":"exostozica","definite-error-unrecognized-form-masculine-plural":"exostozicii","definite-error-unrecognized-form-feminine-neuter-plural":"exostozicele"}},{"word":"exoteric","pos":"adj","definitions":["exoteric"],"forms":{"feminine-singular":"exoterică","masculine-plural":"exoterici","feminine-neuter-plural":"exoterice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exoteric","error-unrecognized-form-feminine-indefinite-singular":"exoterică","error-unrecognized-form-indefinite-masculine-plural":"exoterici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exoterice","definite-error-unrecognized-form-masculine-neuter-singular":"exotericul","definite-error-unrecognized-form-feminine-singular":"exoterica","definite-error-unrecognized-form-masculine-plural":"exotericii","definite-error-unrecognized-form-feminine-neuter-plural":"exotericele"}},{"word":"exoterism","pos":"noun","definitions":["exoterism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exoterism","accusative-definite-nominative":"exoterismul","dative-genitive-indefinite":"exoterism","dative-definite-genitive":"exoterismului","vocative":"exoterismule"}},{"word":"exoterm","pos":"adj","definitions":["exothermic"],"forms":{"feminine-singular":"exotermă","masculine-plural":"exotermi","feminine-neuter-plural":"exoterme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exoterm","error-unrecognized-form-feminine-indefinite-singular":"exotermă","error-unrecognized-form-indefinite-masculine-plural":"exotermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exoterme","definite-error-unrecognized-form-masculine-neuter-singular":"exotermul","definite-error-unrecognized-form-feminine-singular":"exoterma","definite-error-unrecognized-form-masculine-plural":"exotermii","definite-error-unrecognized-form-feminine-neuter-plural":"exotermele"}},{"word":"exotermic","pos":"adj","definitions":["exothermic"],"forms":{"feminine-singular":"exotermică","masculine-plural":"exotermici","feminine-neuter-plural":"exotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exotermic","error-unrecognized-form-feminine-indefinite-singular":"exotermică","error-unrecognized-form-indefinite-masculine-plural":"exotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exotermice","definite-error-unrecognized-form-masculine-neuter-singular":"exotermicul","definite-error-unrecognized-form-feminine-singular":"exotermica","definite-error-unrecognized-form-masculine-plural":"exotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"exotermicele"}},{"word":"exotic","pos":"adj","definitions":["exotic"],"pronunciation":"/eɡˈzo.tik/","forms":{"feminine-singular":"exotică","masculine-plural":"exotici","feminine-neuter-plural":"exotice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"exotic","error-unrecognized-form-feminine-indefinite-singular":"exotică","error-unrecognized-form-indefinite-masculine-plural":"exotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"exotice","definite-error-unrecognized-form-masculine-neuter-singular":"exoticul","definite-error-unrecognized-form-feminine-singular":"exotica","definite-error-unrecognized-form-masculine-plural":"exoticii","definite-error-unrecognized-form-feminine-neuter-plural":"exoticele"}},{"word":"exotism","pos":"noun","definitions":["exoticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"exotism","accusative-definite-nominative":"exotismul","dative-genitive-indefinite":"exotism","dative-definite-genitive":"exotismului","vocative":"exotismule"}},{"word":"exotiza","pos":"verb","definitions":["to exoticize"],"forms":{"canonical":"a exotiza 1st conjugation","present-singular-third-person":"exotizează","participle-past":"exotizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exotiza","gerund":"exotizând","first-person-indicative-present-singular":"exotizez","indicative-present-second-person-singular":"exotizezi","indicative-present-singular-third-person":"exotizează","first-person-indicative-plural-present":"exotizăm","indicative-plural-present-second-person":"exotizați","indicative-plural-present-third-person":"exotizează","first-person-imperfect-indicative-singular":"exotizam","imperfect-indicative-second-person-singular":"exotizai","imperfect-indicative-singular-third-person":"exotiza","first-person-imperfect-indicative-plural":"exotizam","imperfect-indicative-plural-second-person":"exotizați","imperfect-indicative-plural-third-person":"exotizau","first-person-indicative-perfect-singular":"exotizai","indicative-perfect-second-person-singular":"exotizași","indicative-perfect-singular-third-person":"exotiză","first-person-indicative-perfect-plural":"exotizarăm","indicative-perfect-plural-second-person":"exotizarăți","indicative-perfect-plural-third-person":"exotizară","first-person-indicative-pluperfect-singular":"exotizasem","indicative-pluperfect-second-person-singular":"exotizaseși","indicative-pluperfect-singular-third-person":"exotizase","first-person-indicative-pluperfect-plural":"exotizaserăm","indicative-pluperfect-plural-second-person":"exotizaserăți","indicative-pluperfect-plural-third-person":"exotizaseră","first-person-present-singular-subjunctive":"să exotizez","present-second-person-singular-subjunctive":"să exotizezi","present-singular-subjunctive-third-person":"să exotizeze","first-person-plural-present-subjunctive":"să exotizăm","plural-present-second-person-subjunctive":"să exotizați","plural-present-subjunctive-third-person":"să exotizeze","imperative-second-person-singular":"exotizează","imperative-plural-second-person":"exotizați","imperative-negative-second-person-singular":"nu exotiza","imperative-negative-plural-second-person":"nu exotizați"}},{"word":"exotizare","pos":"noun","definitions":["exoticization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"exotizare","accusative-definite-nominative":"exotizarea","dative-genitive-indefinite":"exotizări","dative-definite-genitive":"exotizării","vocative":"exotizare"}},{"word":"exotoxină","pos":"noun","definitions":["exotoxin"],"pronunciation":"/ek.so.tokˈsi.nə/","forms":{"plural":"exotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exotoxină","accusative-definite-nominative-singular":"exotoxina","accusative-indefinite-nominative-plural":"exotoxine","accusative-definite-nominative-plural":"exotoxinele","dative-genitive-indefinite-singular":"exotoxine","dative-definite-genitive-singular":"exotoxinei","dative-genitive-indefinite-plural":"exotoxine","dative-definite-genitive-plural":"exotoxinelor","singular-vocative":"exotoxină","plural-vocative":"exotoxinelor"}},{"word":"exotrof","pos":"adj","definitions":["exotrophic"],"forms":{"feminine-singular":"exotrofă","masculine-plural":"exotrofi","feminine-neuter-plural":"exotrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exotrof","error-unrecognized-form-feminine-indefinite-singular":"exotrofă","error-unrecognized-form-indefinite-masculine-plural":"exotrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exotrofe","definite-error-unrecognized-form-masculine-neuter-singular":"exotroful","definite-error-unrecognized-form-feminine-singular":"exotrofa","definite-error-unrecognized-form-masculine-plural":"exotrofii","definite-error-unrecognized-form-feminine-neuter-plural":"exotrofele"}},{"word":"exotropie","pos":"noun","definitions":["exotropia"],"forms":{"plural":"exotropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exotropie","accusative-definite-nominative-singular":"exotropia","accusative-indefinite-nominative-plural":"exotropii","accusative-definite-nominative-plural":"exotropiile","dative-genitive-indefinite-singular":"exotropii","dative-definite-genitive-singular":"exotropiei","dative-genitive-indefinite-plural":"exotropii","dative-definite-genitive-plural":"exotropiilor","singular-vocative":"exotropie","plural-vocative":"exotropiilor"}},{"word":"expanda","pos":"verb","definitions":["to expand"],"pronunciation":"/eks.panˈda/","forms":{"canonical":"a expanda 1st conjugation","present-singular-third-person":"expandează","participle-past":"expandat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expanda","gerund":"expandând","first-person-indicative-present-singular":"expandez","indicative-present-second-person-singular":"expandezi","indicative-present-singular-third-person":"expandează","first-person-indicative-plural-present":"expandăm","indicative-plural-present-second-person":"expandați","indicative-plural-present-third-person":"expandează","first-person-imperfect-indicative-singular":"expandam","imperfect-indicative-second-person-singular":"expandai","imperfect-indicative-singular-third-person":"expanda","first-person-imperfect-indicative-plural":"expandam","imperfect-indicative-plural-second-person":"expandați","imperfect-indicative-plural-third-person":"expandau","first-person-indicative-perfect-singular":"expandai","indicative-perfect-second-person-singular":"expandași","indicative-perfect-singular-third-person":"expandă","first-person-indicative-perfect-plural":"expandarăm","indicative-perfect-plural-second-person":"expandarăți","indicative-perfect-plural-third-person":"expandară","first-person-indicative-pluperfect-singular":"expandasem","indicative-pluperfect-second-person-singular":"expandaseși","indicative-pluperfect-singular-third-person":"expandase","first-person-indicative-pluperfect-plural":"expandaserăm","indicative-pluperfect-plural-second-person":"expandaserăți","indicative-pluperfect-plural-third-person":"expandaseră","first-person-present-singular-subjunctive":"să expandez","present-second-person-singular-subjunctive":"să expandezi","present-singular-subjunctive-third-person":"să expandeze","first-person-plural-present-subjunctive":"să expandăm","plural-present-second-person-subjunctive":"să expandați","plural-present-subjunctive-third-person":"să expandeze","imperative-second-person-singular":"expandează","imperative-plural-second-person":"expandați","imperative-negative-second-person-singular":"nu expanda","imperative-negative-plural-second-person":"nu expandați"}},{"word":"expandabil","pos":"adj","definitions":["expandable"],"forms":{"feminine-singular":"expandabilă","masculine-plural":"expandabili","feminine-neuter-plural":"expandabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expandabil","error-unrecognized-form-feminine-indefinite-singular":"expandabilă","error-unrecognized-form-indefinite-masculine-plural":"expandabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"expandabile","definite-error-unrecognized-form-masculine-neuter-singular":"expandabilul","definite-error-unrecognized-form-feminine-singular":"expandabila","definite-error-unrecognized-form-masculine-plural":"expandabilii","definite-error-unrecognized-form-feminine-neuter-plural":"expandabilele"}},{"word":"expansibil","pos":"adj","definitions":["expandable"],"forms":{"feminine-singular":"expansibilă","masculine-plural":"expansibili","feminine-neuter-plural":"expansibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expansibil","error-unrecognized-form-feminine-indefinite-singular":"expansibilă","error-unrecognized-form-indefinite-masculine-plural":"expansibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"expansibile","definite-error-unrecognized-form-masculine-neuter-singular":"expansibilul","definite-error-unrecognized-form-feminine-singular":"expansibila","definite-error-unrecognized-form-masculine-plural":"expansibilii","definite-error-unrecognized-form-feminine-neuter-plural":"expansibilele"}},{"word":"expansibilitate","pos":"noun","definitions":["expandability"],"forms":{"plural":"expansibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expansibilitate","accusative-definite-nominative-singular":"expansibilitatea","accusative-indefinite-nominative-plural":"expansibilități","accusative-definite-nominative-plural":"expansibilitățile","dative-genitive-indefinite-singular":"expansibilități","dative-definite-genitive-singular":"expansibilității","dative-genitive-indefinite-plural":"expansibilități","dative-definite-genitive-plural":"expansibilităților","singular-vocative":"expansibilitate","plural-vocative":"expansibilităților"}},{"word":"expansie","pos":"noun","definitions":["expansion (spreading out)"],"forms":{"plural":"expansii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expansie","accusative-definite-nominative-singular":"expansia","accusative-indefinite-nominative-plural":"expansii","accusative-definite-nominative-plural":"expansiile","dative-genitive-indefinite-singular":"expansii","dative-definite-genitive-singular":"expansiei","dative-genitive-indefinite-plural":"expansii","dative-definite-genitive-plural":"expansiilor","singular-vocative":"expansie","plural-vocative":"expansiilor"}},{"word":"expansionism","pos":"noun","definitions":["expansionism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"expansionism","accusative-definite-nominative":"expansionismul","dative-genitive-indefinite":"expansionism","dative-definite-genitive":"expansionismului","vocative":"expansionismule"}},{"word":"expansionist","pos":"adj","definitions":["expansionist"],"forms":{"feminine-singular":"expansionistă","masculine-plural":"expansioniști","feminine-neuter-plural":"expansioniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expansionist","error-unrecognized-form-feminine-indefinite-singular":"expansionistă","error-unrecognized-form-indefinite-masculine-plural":"expansioniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"expansioniste","definite-error-unrecognized-form-masculine-neuter-singular":"expansionistul","definite-error-unrecognized-form-feminine-singular":"expansionista","definite-error-unrecognized-form-masculine-plural":"expansioniștii","definite-error-unrecognized-form-feminine-neuter-plural":"expansionistele"}},{"word":"expansiune","pos":"noun","definitions":["expansion"],"forms":{"plural":"expansiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expansiune","accusative-definite-nominative-singular":"expansiunea","accusative-indefinite-nominative-plural":"expansiuni","accusative-definite-nominative-plural":"expansiunile","dative-genitive-indefinite-singular":"expansiuni","dative-definite-genitive-singular":"expansiunii","dative-genitive-indefinite-plural":"expansiuni","dative-definite-genitive-plural":"expansiunilor","singular-vocative":"expansiune","plural-vocative":"expansiunilor"}},{"word":"expansiv","pos":"adj","definitions":["expansive"],"forms":{"feminine-singular":"expansivă","masculine-plural":"expansivi","feminine-neuter-plural":"expansive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expansiv","error-unrecognized-form-feminine-indefinite-singular":"expansivă","error-unrecognized-form-indefinite-masculine-plural":"expansivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expansive","definite-error-unrecognized-form-masculine-neuter-singular":"expansivul","definite-error-unrecognized-form-feminine-singular":"expansiva","definite-error-unrecognized-form-masculine-plural":"expansivii","definite-error-unrecognized-form-feminine-neuter-plural":"expansivele"}},{"word":"expansivitate","pos":"noun","definitions":["expansiveness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expansivitate","accusative-definite-nominative-singular":"expansivitatea","accusative-indefinite-nominative-plural":"expansivități","accusative-definite-nominative-plural":"expansivitățile","dative-genitive-indefinite-singular":"expansivități","dative-definite-genitive-singular":"expansivității","dative-genitive-indefinite-plural":"expansivități","dative-definite-genitive-plural":"expansivităților","singular-vocative":"expansivitate","plural-vocative":"expansivităților"}},{"word":"expatria","pos":"verb","definitions":["to expatriate"],"pronunciation":"/eks.pa.triˈa/","forms":{"canonical":"a expatria 1st conjugation","present-singular-third-person":"expatriează","participle-past":"expatriat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expatria","gerund":"expatriind","first-person-indicative-present-singular":"expatriez","indicative-present-second-person-singular":"expatriezi","indicative-present-singular-third-person":"expatriază","first-person-indicative-plural-present":"expatriem","indicative-plural-present-second-person":"expatriați","indicative-plural-present-third-person":"expatriază","first-person-imperfect-indicative-singular":"expatriam","imperfect-indicative-second-person-singular":"expatriai","imperfect-indicative-singular-third-person":"expatria","first-person-imperfect-indicative-plural":"expatriam","imperfect-indicative-plural-second-person":"expatriați","imperfect-indicative-plural-third-person":"expatriau","first-person-indicative-perfect-singular":"expatriai","indicative-perfect-second-person-singular":"expatriași","indicative-perfect-singular-third-person":"expatrie","first-person-indicative-perfect-plural":"expatriarăm","indicative-perfect-plural-second-person":"expatriarăți","indicative-perfect-plural-third-person":"expatriară","first-person-indicative-pluperfect-singular":"expatriasem","indicative-pluperfect-second-person-singular":"expatriaseși","indicative-pluperfect-singular-third-person":"expatriase","first-person-indicative-pluperfect-plural":"expatriaserăm","indicative-pluperfect-plural-second-person":"expatriaserăți","indicative-pluperfect-plural-third-person":"expatriaseră","first-person-present-singular-subjunctive":"să expatriez","present-second-person-singular-subjunctive":"să expatriezi","present-singular-subjunctive-third-person":"să expatrieze","first-person-plural-present-subjunctive":"să expatriem","plural-present-second-person-subjunctive":"să expatriați","plural-present-subjunctive-third-person":"să expatrieze","imperative-second-person-singular":"expatriază","imperative-plural-second-person":"expatriați","imperative-negative-second-person-singular":"nu expatria","imperative-negative-plural-second-person":"nu expatriați"}},{"word":"expatriat","pos":"adj","definitions":["expatriated"],"forms":{"feminine-singular":"expatriată","masculine-plural":"expatriați","feminine-neuter-plural":"expatriate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expatriat","error-unrecognized-form-feminine-indefinite-singular":"expatriată","error-unrecognized-form-indefinite-masculine-plural":"expatriați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expatriate","definite-error-unrecognized-form-masculine-neuter-singular":"expatriatul","definite-error-unrecognized-form-feminine-singular":"expatriata","definite-error-unrecognized-form-masculine-plural":"expatriații","definite-error-unrecognized-form-feminine-neuter-plural":"expatriatele"}},{"word":"expatriată","pos":"noun","definitions":["female equivalent of expatriat"],"forms":{"plural":"expatriate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expatriată","accusative-definite-nominative-singular":"expatriata","accusative-indefinite-nominative-plural":"expatriate","accusative-definite-nominative-plural":"expatriatele","dative-genitive-indefinite-singular":"expatriate","dative-definite-genitive-singular":"expatriatei","dative-genitive-indefinite-plural":"expatriate","dative-definite-genitive-plural":"expatriatelor","singular-vocative":"expatriată","plural-vocative":"expatriatelor"}},{"word":"expatriație","pos":"noun","definitions":["expatriation"],"forms":{"plural":"expatriații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expatriație","accusative-definite-nominative-singular":"expatriația","accusative-indefinite-nominative-plural":"expatriații","accusative-definite-nominative-plural":"expatriațiile","dative-genitive-indefinite-singular":"expatriații","dative-definite-genitive-singular":"expatriației","dative-genitive-indefinite-plural":"expatriații","dative-definite-genitive-plural":"expatriațiilor","singular-vocative":"expatriație","plural-vocative":"expatriațiilor"}},{"word":"expatriere","pos":"noun","definitions":["expatriation"],"forms":{"plural":"expatrieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expatriere","accusative-definite-nominative-singular":"expatrierea","accusative-indefinite-nominative-plural":"expatrieri","accusative-definite-nominative-plural":"expatrierile","dative-genitive-indefinite-singular":"expatrieri","dative-definite-genitive-singular":"expatrierii","dative-genitive-indefinite-plural":"expatrieri","dative-definite-genitive-plural":"expatrierilor","singular-vocative":"expatriere","plural-vocative":"expatrierilor"}},{"word":"expectanță","pos":"noun","definitions":["expectancy"],"forms":{"plural":"expectanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expectanță","accusative-definite-nominative-singular":"expectanța","accusative-indefinite-nominative-plural":"expectanțe","accusative-definite-nominative-plural":"expectanțele","dative-genitive-indefinite-singular":"expectanțe","dative-definite-genitive-singular":"expectanței","dative-genitive-indefinite-plural":"expectanțe","dative-definite-genitive-plural":"expectanțelor","singular-vocative":"expectanță","plural-vocative":"expectanțelor"}},{"word":"expectație","pos":"noun","definitions":["expectation"],"forms":{"plural":"expectații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expectație","accusative-definite-nominative-singular":"expectația","accusative-indefinite-nominative-plural":"expectații","accusative-definite-nominative-plural":"expectațiile","dative-genitive-indefinite-singular":"expectații","dative-definite-genitive-singular":"expectației","dative-genitive-indefinite-plural":"expectații","dative-definite-genitive-plural":"expectațiilor","singular-vocative":"expectație","plural-vocative":"expectațiilor"}},{"word":"expectațiune","pos":"noun","definitions":["obsolete form of expectație"],"forms":{"plural":"expectațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expectațiune","accusative-definite-nominative-singular":"expectațiunea","accusative-indefinite-nominative-plural":"expectațiuni","accusative-definite-nominative-plural":"expectațiunile","dative-genitive-indefinite-singular":"expectațiuni","dative-definite-genitive-singular":"expectațiunii","dative-genitive-indefinite-plural":"expectațiuni","dative-definite-genitive-plural":"expectațiunilor","singular-vocative":"expectațiune","plural-vocative":"expectațiunilor"}},{"word":"expectativ","pos":"adj","definitions":["expectant"],"forms":{"feminine-singular":"expectativă","masculine-plural":"expectativi","feminine-neuter-plural":"expectative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expectativ","error-unrecognized-form-feminine-indefinite-singular":"expectativă","error-unrecognized-form-indefinite-masculine-plural":"expectativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expectative","definite-error-unrecognized-form-masculine-neuter-singular":"expectativul","definite-error-unrecognized-form-feminine-singular":"expectativa","definite-error-unrecognized-form-masculine-plural":"expectativii","definite-error-unrecognized-form-feminine-neuter-plural":"expectativele"}},{"word":"expectativ","pos":"adv","definitions":["expectant"]},{"word":"expectativă","pos":"noun","definitions":["expectation"],"forms":{"plural":"expectative","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expectativă","accusative-definite-nominative-singular":"expectativa","accusative-indefinite-nominative-plural":"expectative","accusative-definite-nominative-plural":"expectativele","dative-genitive-indefinite-singular":"expectative","dative-definite-genitive-singular":"expectativei","dative-genitive-indefinite-plural":"expectative","dative-definite-genitive-plural":"expectativelor","singular-vocative":"expectativă","plural-vocative":"expectativelor"}},{"word":"expectora","pos":"verb","definitions":["to expectorate"],"forms":{"canonical":"a expectora 1st conjugation","present-singular-third-person":"expectorează","participle-past":"expectorat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expectora","gerund":"expectorând","first-person-indicative-present-singular":"expectorez","indicative-present-second-person-singular":"expectorezi","indicative-present-singular-third-person":"expectorează","first-person-indicative-plural-present":"expectorăm","indicative-plural-present-second-person":"expectorați","indicative-plural-present-third-person":"expectorează","first-person-imperfect-indicative-singular":"expectoram","imperfect-indicative-second-person-singular":"expectorai","imperfect-indicative-singular-third-person":"expectora","first-person-imperfect-indicative-plural":"expectoram","imperfect-indicative-plural-second-person":"expectorați","imperfect-indicative-plural-third-person":"expectorau","first-person-indicative-perfect-singular":"expectorai","indicative-perfect-second-person-singular":"expectorași","indicative-perfect-singular-third-person":"expectoră","first-person-indicative-perfect-plural":"expectorarăm","indicative-perfect-plural-second-person":"expectorarăți","indicative-perfect-plural-third-person":"expectorară","first-person-indicative-pluperfect-singular":"expectorasem","indicative-pluperfect-second-person-singular":"expectoraseși","indicative-pluperfect-singular-third-person":"expectorase","first-person-indicative-pluperfect-plural":"expectoraserăm","indicative-pluperfect-plural-second-person":"expectoraserăți","indicative-pluperfect-plural-third-person":"expectoraseră","first-person-present-singular-subjunctive":"să expectorez","present-second-person-singular-subjunctive":"să expectorezi","present-singular-subjunctive-third-person":"să expectoreze","first-person-plural-present-subjunctive":"să expectorăm","plural-present-second-person-subjunctive":"să expectorați","plural-present-subjunctive-third-person":"să expectoreze","imperative-second-person-singular":"expectorează","imperative-plural-second-person":"expectorați","imperative-negative-second-person-singular":"nu expectora","imperative-negative-plural-second-person":"nu expectorați"}},{"word":"expectorant","pos":"adj","definitions":["expectorant"],"forms":{"feminine-singular":"expectorantă","masculine-plural":"expectoranți","feminine-neuter-plural":"expectorante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expectorant","error-unrecognized-form-feminine-indefinite-singular":"expectorantă","error-unrecognized-form-indefinite-masculine-plural":"expectoranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"expectorante","definite-error-unrecognized-form-masculine-neuter-singular":"expectorantul","definite-error-unrecognized-form-feminine-singular":"expectoranta","definite-error-unrecognized-form-masculine-plural":"expectoranții","definite-error-unrecognized-form-feminine-neuter-plural":"expectorantele"}},{"word":"expectorare","pos":"noun","definitions":["expectoration"],"forms":{"plural":"expectorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expectorare","accusative-definite-nominative-singular":"expectorarea","accusative-indefinite-nominative-plural":"expectorări","accusative-definite-nominative-plural":"expectorările","dative-genitive-indefinite-singular":"expectorări","dative-definite-genitive-singular":"expectorării","dative-genitive-indefinite-plural":"expectorări","dative-definite-genitive-plural":"expectorărilor","singular-vocative":"expectorare","plural-vocative":"expectorărilor"}},{"word":"expectorație","pos":"noun","definitions":["expectoration"],"forms":{"plural":"expectorații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expectorație","accusative-definite-nominative-singular":"expectorația","accusative-indefinite-nominative-plural":"expectorații","accusative-definite-nominative-plural":"expectorațiile","dative-genitive-indefinite-singular":"expectorații","dative-definite-genitive-singular":"expectorației","dative-genitive-indefinite-plural":"expectorații","dative-definite-genitive-plural":"expectorațiilor","singular-vocative":"expectorație","plural-vocative":"expectorațiilor"}},{"word":"expectorațiune","pos":"noun","definitions":["obsolete form of expectorație"],"forms":{"plural":"expectorațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expectorațiune","accusative-definite-nominative-singular":"expectorațiunea","accusative-indefinite-nominative-plural":"expectorațiuni","accusative-definite-nominative-plural":"expectorațiunile","dative-genitive-indefinite-singular":"expectorațiuni","dative-definite-genitive-singular":"expectorațiunii","dative-genitive-indefinite-plural":"expectorațiuni","dative-definite-genitive-plural":"expectorațiunilor","singular-vocative":"expectorațiune","plural-vocative":"expectorațiunilor"}},{"word":"expedia","pos":"verb","definitions":["to mail, send by mail"],"forms":{"canonical":"a expedia 1st conjugation","present-singular-third-person":"expediază","participle-past":"expediat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expedia","gerund":"expediind","first-person-indicative-present-singular":"expediez","indicative-present-second-person-singular":"expediezi","indicative-present-singular-third-person":"expediază","first-person-indicative-plural-present":"expediem","indicative-plural-present-second-person":"expediați","indicative-plural-present-third-person":"expediază","first-person-imperfect-indicative-singular":"expediam","imperfect-indicative-second-person-singular":"expediai","imperfect-indicative-singular-third-person":"expedia","first-person-imperfect-indicative-plural":"expediam","imperfect-indicative-plural-second-person":"expediați","imperfect-indicative-plural-third-person":"expediau","first-person-indicative-perfect-singular":"expediai","indicative-perfect-second-person-singular":"expediași","indicative-perfect-singular-third-person":"expedie","first-person-indicative-perfect-plural":"expediarăm","indicative-perfect-plural-second-person":"expediarăți","indicative-perfect-plural-third-person":"expediară","first-person-indicative-pluperfect-singular":"expediasem","indicative-pluperfect-second-person-singular":"expediaseși","indicative-pluperfect-singular-third-person":"expediase","first-person-indicative-pluperfect-plural":"expediaserăm","indicative-pluperfect-plural-second-person":"expediaserăți","indicative-pluperfect-plural-third-person":"expediaseră","first-person-present-singular-subjunctive":"să expediez","present-second-person-singular-subjunctive":"să expediezi","present-singular-subjunctive-third-person":"să expedieze","first-person-plural-present-subjunctive":"să expediem","plural-present-second-person-subjunctive":"să expediați","plural-present-subjunctive-third-person":"să expedieze","imperative-second-person-singular":"expediază","imperative-plural-second-person":"expediați","imperative-negative-second-person-singular":"nu expedia","imperative-negative-plural-second-person":"nu expediați"}},{"word":"expediam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of expedia"],"pronunciation":"[ekspediˈam]"},{"word":"expediare","pos":"noun","definitions":["obsolete form of expediere"],"forms":{"plural":"expedieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expediare","accusative-definite-nominative-singular":"expediarea","accusative-indefinite-nominative-plural":"expedieri","accusative-definite-nominative-plural":"expedierile","dative-genitive-indefinite-singular":"expedieri","dative-definite-genitive-singular":"expedierii","dative-genitive-indefinite-plural":"expedieri","dative-definite-genitive-plural":"expedierilor","singular-vocative":"expediare","plural-vocative":"expedierilor"}},{"word":"expediat","pos":"adj","definitions":["dispatched, sent"],"pronunciation":"[ekspediˈat]","forms":{"feminine-singular":"expediată","masculine-plural":"expediați","feminine-neuter-plural":"expediate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expediat","error-unrecognized-form-feminine-indefinite-singular":"expediată","error-unrecognized-form-indefinite-masculine-plural":"expediați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expediate","definite-error-unrecognized-form-masculine-neuter-singular":"expediatul","definite-error-unrecognized-form-feminine-singular":"expediata","definite-error-unrecognized-form-masculine-plural":"expediații","definite-error-unrecognized-form-feminine-neuter-plural":"expediatele"}},{"word":"expediat","pos":"verb","definitions":["past participle of expedia"],"pronunciation":"[ekspediˈat]","forms":{"participle-past":"of expedia"}},{"word":"expedient","pos":"noun","definitions":["expedient"],"forms":{"plural":"expediente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"expedient","accusative-definite-nominative-singular":"expedientul","accusative-indefinite-nominative-plural":"expediente","accusative-definite-nominative-plural":"expedientele","dative-genitive-indefinite-singular":"expedient","dative-definite-genitive-singular":"expedientului","dative-genitive-indefinite-plural":"expediente","dative-definite-genitive-plural":"expedientelor","singular-vocative":"expedientule","plural-vocative":"expedientelor"}},{"word":"expediere","pos":"noun","definitions":["dispatch"],"forms":{"plural":"expedieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expediere","accusative-definite-nominative-singular":"expedierea","accusative-indefinite-nominative-plural":"expedieri","accusative-definite-nominative-plural":"expedierile","dative-genitive-indefinite-singular":"expedieri","dative-definite-genitive-singular":"expedierii","dative-genitive-indefinite-plural":"expedieri","dative-definite-genitive-plural":"expedierilor","singular-vocative":"expediere","plural-vocative":"expedierilor"}},{"word":"expediție","pos":"noun","definitions":["expedition"],"forms":{"plural":"expediții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expediție","accusative-definite-nominative-singular":"expediția","accusative-indefinite-nominative-plural":"expediții","accusative-definite-nominative-plural":"expedițiile","dative-genitive-indefinite-singular":"expediții","dative-definite-genitive-singular":"expediției","dative-genitive-indefinite-plural":"expediții","dative-definite-genitive-plural":"expedițiilor","singular-vocative":"expediție","plural-vocative":"expedițiilor"}},{"word":"expediționar","pos":"adj","definitions":["expeditionary"],"forms":{"feminine-singular":"expediționară","masculine-plural":"expediționari","feminine-neuter-plural":"expediționare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expediționar","error-unrecognized-form-feminine-indefinite-singular":"expediționară","error-unrecognized-form-indefinite-masculine-plural":"expediționari","error-unrecognized-form-feminine-indefinite-neuter-plural":"expediționare","definite-error-unrecognized-form-masculine-neuter-singular":"expediționarul","definite-error-unrecognized-form-feminine-singular":"expediționara","definite-error-unrecognized-form-masculine-plural":"expediționarii","definite-error-unrecognized-form-feminine-neuter-plural":"expediționarele"}},{"word":"expedițiune","pos":"noun","definitions":["obsolete form of expediție"],"forms":{"plural":"expedițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expedițiune","accusative-definite-nominative-singular":"expedițiunea","accusative-indefinite-nominative-plural":"expedițiuni","accusative-definite-nominative-plural":"expedițiunile","dative-genitive-indefinite-singular":"expedițiuni","dative-definite-genitive-singular":"expedițiunii","dative-genitive-indefinite-plural":"expedițiuni","dative-definite-genitive-plural":"expedițiunilor","singular-vocative":"expedițiune","plural-vocative":"expedițiunilor"}},{"word":"expeditiv","pos":"adj","definitions":["expeditious"],"forms":{"feminine-singular":"expeditivă","masculine-plural":"expeditivi","feminine-neuter-plural":"expeditive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expeditiv","error-unrecognized-form-feminine-indefinite-singular":"expeditivă","error-unrecognized-form-indefinite-masculine-plural":"expeditivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expeditive","definite-error-unrecognized-form-masculine-neuter-singular":"expeditivul","definite-error-unrecognized-form-feminine-singular":"expeditiva","definite-error-unrecognized-form-masculine-plural":"expeditivii","definite-error-unrecognized-form-feminine-neuter-plural":"expeditivele"}},{"word":"expeditoare","pos":"noun","definitions":["female equivalent of expeditor"],"forms":{"plural":"expeditoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"expeditoare","accusative-definite-nominative-singular":"expeditoarea","accusative-indefinite-nominative-plural":"expeditoare","accusative-definite-nominative-plural":"expeditoarele","dative-genitive-indefinite-singular":"expeditoare","dative-definite-genitive-singular":"expeditoarei","dative-genitive-indefinite-plural":"expeditoare","dative-definite-genitive-plural":"expeditoarelor","singular-vocative":"expeditoare","plural-vocative":"expeditoarelor"}},{"word":"expeditor","pos":"noun","definitions":["sender"],"forms":{"plural":"expeditori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"expeditor","accusative-definite-nominative-singular":"expeditorul","accusative-indefinite-nominative-plural":"expeditori","accusative-definite-nominative-plural":"expeditorii","dative-genitive-indefinite-singular":"expeditor","dative-definite-genitive-singular":"expeditorului","dative-genitive-indefinite-plural":"expeditori","dative-definite-genitive-plural":"expeditorilor","singular-vocative":"expeditorule","plural-vocative":"expeditorilor"}},{"word":"expedui","pos":"verb","definitions":["to expedite"],"forms":{"canonical":"a expedui 4th conjugation","present-singular-third-person":"expeduiește","participle-past":"expeduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a expedui","gerund":"expeduind","first-person-indicative-present-singular":"expeduiesc","indicative-present-second-person-singular":"expeduiești","indicative-present-singular-third-person":"expeduiește","first-person-indicative-plural-present":"expeduim","indicative-plural-present-second-person":"expeduiți","indicative-plural-present-third-person":"expeduiesc","first-person-imperfect-indicative-singular":"expeduiam","imperfect-indicative-second-person-singular":"expeduiai","imperfect-indicative-singular-third-person":"expeduia","first-person-imperfect-indicative-plural":"expeduiam","imperfect-indicative-plural-second-person":"expeduiați","imperfect-indicative-plural-third-person":"expeduiau","first-person-indicative-perfect-singular":"expeduii","indicative-perfect-second-person-singular":"expeduiși","indicative-perfect-singular-third-person":"expedui","first-person-indicative-perfect-plural":"expeduirăm","indicative-perfect-plural-second-person":"expeduirăți","indicative-perfect-plural-third-person":"expeduiră","first-person-indicative-pluperfect-singular":"expeduisem","indicative-pluperfect-second-person-singular":"expeduiseși","indicative-pluperfect-singular-third-person":"expeduise","first-person-indicative-pluperfect-plural":"expeduiserăm","indicative-pluperfect-plural-second-person":"expeduiserăți","indicative-pluperfect-plural-third-person":"expeduiseră","first-person-present-singular-subjunctive":"să expeduiesc","present-second-person-singular-subjunctive":"să expeduiești","present-singular-subjunctive-third-person":"să expeduiască","first-person-plural-present-subjunctive":"să expeduim","plural-present-second-person-subjunctive":"să expeduiți","plural-present-subjunctive-third-person":"să expeduiască","imperative-second-person-singular":"expeduiește","imperative-plural-second-person":"expeduiți","imperative-negative-second-person-singular":"nu expedui","imperative-negative-plural-second-person":"nu expeduiți"}},{"word":"expeduire","pos":"noun","definitions":["dispatch"],"forms":{"plural":"expeduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expeduire","accusative-definite-nominative-singular":"expeduirea","accusative-indefinite-nominative-plural":"expeduiri","accusative-definite-nominative-plural":"expeduirile","dative-genitive-indefinite-singular":"expeduiri","dative-definite-genitive-singular":"expeduirii","dative-genitive-indefinite-plural":"expeduiri","dative-definite-genitive-plural":"expeduirilor","singular-vocative":"expeduire","plural-vocative":"expeduirilor"}},{"word":"expeduit","pos":"adj","definitions":["dispatched"],"forms":{"feminine-singular":"expeduită","masculine-plural":"expeduiți","feminine-neuter-plural":"expeduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expeduit","error-unrecognized-form-feminine-indefinite-singular":"expeduită","error-unrecognized-form-indefinite-masculine-plural":"expeduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"expeduite","definite-error-unrecognized-form-masculine-neuter-singular":"expeduitul","definite-error-unrecognized-form-feminine-singular":"expeduita","definite-error-unrecognized-form-masculine-plural":"expeduiții","definite-error-unrecognized-form-feminine-neuter-plural":"expeduitele"}},{"word":"expeduit","pos":"verb","definitions":["past participle of expedui"],"forms":{"participle-past":"of expedui"}},{"word":"experient","pos":"adj","definitions":["experienced"],"forms":{"feminine-singular":"experientă","masculine-plural":"experienți","feminine-neuter-plural":"experiente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"experient","error-unrecognized-form-feminine-indefinite-singular":"experientă","error-unrecognized-form-indefinite-masculine-plural":"experienți","error-unrecognized-form-feminine-indefinite-neuter-plural":"experiente","definite-error-unrecognized-form-masculine-neuter-singular":"experientul","definite-error-unrecognized-form-feminine-singular":"experienta","definite-error-unrecognized-form-masculine-plural":"experienții","definite-error-unrecognized-form-feminine-neuter-plural":"experientele"}},{"word":"experiență","pos":"noun","definitions":["experience"],"pronunciation":"/eks.pe.riˈen.t͡sə/","forms":{"plural":"experiențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"experiență","accusative-definite-nominative-singular":"experiența","accusative-indefinite-nominative-plural":"experiențe","accusative-definite-nominative-plural":"experiențele","dative-genitive-indefinite-singular":"experiențe","dative-definite-genitive-singular":"experienței","dative-genitive-indefinite-plural":"experiențe","dative-definite-genitive-plural":"experiențelor","singular-vocative":"experiență","plural-vocative":"experiențelor","alternative":"експериенцэ"}},{"word":"experiențial","pos":"adj","definitions":["experiential"],"forms":{"feminine-singular":"experiențială","masculine-plural":"experiențiali","feminine-neuter-plural":"experiențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"experiențial","error-unrecognized-form-feminine-indefinite-singular":"experiențială","error-unrecognized-form-indefinite-masculine-plural":"experiențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"experiențiale","definite-error-unrecognized-form-masculine-neuter-singular":"experiențialul","definite-error-unrecognized-form-feminine-singular":"experiențiala","definite-error-unrecognized-form-masculine-plural":"experiențialii","definite-error-unrecognized-form-feminine-neuter-plural":"experiențialele"}},{"word":"experiment","pos":"noun","definitions":["experiment"],"forms":{"plural":"experimente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"experiment","accusative-definite-nominative-singular":"experimentul","accusative-indefinite-nominative-plural":"experimente","accusative-definite-nominative-plural":"experimentele","dative-genitive-indefinite-singular":"experiment","dative-definite-genitive-singular":"experimentului","dative-genitive-indefinite-plural":"experimente","dative-definite-genitive-plural":"experimentelor","singular-vocative":"experimentule","plural-vocative":"experimentelor"}},{"word":"experimenta","pos":"verb","definitions":["to experiment"],"pronunciation":"/eks.pe.ri.menˈta/","forms":{"canonical":"a experimenta 1st conjugation","present-singular-third-person":"experimentează","participle-past":"experimentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a experimenta","gerund":"experimentând","first-person-indicative-present-singular":"experimentez","indicative-present-second-person-singular":"experimentezi","indicative-present-singular-third-person":"experimentează","first-person-indicative-plural-present":"experimentăm","indicative-plural-present-second-person":"experimentați","indicative-plural-present-third-person":"experimentează","first-person-imperfect-indicative-singular":"experimentam","imperfect-indicative-second-person-singular":"experimentai","imperfect-indicative-singular-third-person":"experimenta","first-person-imperfect-indicative-plural":"experimentam","imperfect-indicative-plural-second-person":"experimentați","imperfect-indicative-plural-third-person":"experimentau","first-person-indicative-perfect-singular":"experimentai","indicative-perfect-second-person-singular":"experimentași","indicative-perfect-singular-third-person":"experimentă","first-person-indicative-perfect-plural":"experimentarăm","indicative-perfect-plural-second-person":"experimentarăți","indicative-perfect-plural-third-person":"experimentară","first-person-indicative-pluperfect-singular":"experimentasem","indicative-pluperfect-second-person-singular":"experimentaseși","indicative-pluperfect-singular-third-person":"experimentase","first-person-indicative-pluperfect-plural":"experimentaserăm","indicative-pluperfect-plural-second-person":"experimentaserăți","indicative-pluperfect-plural-third-person":"experimentaseră","first-person-present-singular-subjunctive":"să experimentez","present-second-person-singular-subjunctive":"să experimentezi","present-singular-subjunctive-third-person":"să experimenteze","first-person-plural-present-subjunctive":"să experimentăm","plural-present-second-person-subjunctive":"să experimentați","plural-present-subjunctive-third-person":"să experimenteze","imperative-second-person-singular":"experimentează","imperative-plural-second-person":"experimentați","imperative-negative-second-person-singular":"nu experimenta","imperative-negative-plural-second-person":"nu experimentați"}},{"word":"experimentabil","pos":"adj","definitions":["experimentable"],"forms":{"feminine-singular":"experimentabilă","masculine-plural":"experimentabili","feminine-neuter-plural":"experimentabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"experimentabil","error-unrecognized-form-feminine-indefinite-singular":"experimentabilă","error-unrecognized-form-indefinite-masculine-plural":"experimentabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"experimentabile","definite-error-unrecognized-form-masculine-neuter-singular":"experimentabilul","definite-error-unrecognized-form-feminine-singular":"experimentabila","definite-error-unrecognized-form-masculine-plural":"experimentabilii","definite-error-unrecognized-form-feminine-neuter-plural":"experimentabilele"}},{"word":"experimental","pos":"adj","definitions":["experiential"],"forms":{"feminine-singular":"experimentală","masculine-plural":"experimentali","feminine-neuter-plural":"experimentale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"experimental","error-unrecognized-form-feminine-indefinite-singular":"experimentală","error-unrecognized-form-indefinite-masculine-plural":"experimentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"experimentale","definite-error-unrecognized-form-masculine-neuter-singular":"experimentalul","definite-error-unrecognized-form-feminine-singular":"experimentala","definite-error-unrecognized-form-masculine-plural":"experimentalii","definite-error-unrecognized-form-feminine-neuter-plural":"experimentalele"}},{"word":"experimentalism","pos":"noun","definitions":["experimentalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"experimentalism","accusative-definite-nominative":"experimentalismul","dative-genitive-indefinite":"experimentalism","dative-definite-genitive":"experimentalismului","vocative":"experimentalismule"}},{"word":"experimentalist","pos":"adj","definitions":["experimentalist"],"forms":{"feminine-singular":"experimentalistă","masculine-plural":"experimentaliști","feminine-neuter-plural":"experimentaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"experimentalist","error-unrecognized-form-feminine-indefinite-singular":"experimentalistă","error-unrecognized-form-indefinite-masculine-plural":"experimentaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"experimentaliste","definite-error-unrecognized-form-masculine-neuter-singular":"experimentalistul","definite-error-unrecognized-form-feminine-singular":"experimentalista","definite-error-unrecognized-form-masculine-plural":"experimentaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"experimentalistele"}},{"word":"experimentare","pos":"noun","definitions":["experimentation"],"forms":{"plural":"experimentări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"experimentare","accusative-definite-nominative-singular":"experimentarea","accusative-indefinite-nominative-plural":"experimentări","accusative-definite-nominative-plural":"experimentările","dative-genitive-indefinite-singular":"experimentări","dative-definite-genitive-singular":"experimentării","dative-genitive-indefinite-plural":"experimentări","dative-definite-genitive-plural":"experimentărilor","singular-vocative":"experimentare","plural-vocative":"experimentărilor"}},{"word":"experimentat","pos":"adj","definitions":["experienced"],"pronunciation":"/eks.pe.ri.menˈtat/","forms":{"feminine-singular":"experimentată","masculine-plural":"experimentați","feminine-neuter-plural":"experimentate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"experimentat","error-unrecognized-form-feminine-indefinite-singular":"experimentată","error-unrecognized-form-indefinite-masculine-plural":"experimentați","error-unrecognized-form-feminine-indefinite-neuter-plural":"experimentate","definite-error-unrecognized-form-masculine-neuter-singular":"experimentatul","definite-error-unrecognized-form-feminine-singular":"experimentata","definite-error-unrecognized-form-masculine-plural":"experimentații","definite-error-unrecognized-form-feminine-neuter-plural":"experimentatele"}},{"word":"experimentat","pos":"verb","definitions":["past participle of experimenta"],"pronunciation":"/eks.pe.ri.menˈtat/"},{"word":"experimentatoare","pos":"noun","definitions":["female equivalent of experimentator"],"forms":{"plural":"experimentatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"experimentatoare","accusative-definite-nominative-singular":"experimentatoarea","accusative-indefinite-nominative-plural":"experimentatoare","accusative-definite-nominative-plural":"experimentatoarele","dative-genitive-indefinite-singular":"experimentatoare","dative-definite-genitive-singular":"experimentatoarei","dative-genitive-indefinite-plural":"experimentatoare","dative-definite-genitive-plural":"experimentatoarelor","singular-vocative":"experimentatoare","plural-vocative":"experimentatoarelor"}},{"word":"experimentator","pos":"noun","definitions":["experimenter"],"forms":{"plural":"experimentatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"experimentator","accusative-definite-nominative-singular":"experimentatorul","accusative-indefinite-nominative-plural":"experimentatori","accusative-definite-nominative-plural":"experimentatorii","dative-genitive-indefinite-singular":"experimentator","dative-definite-genitive-singular":"experimentatorului","dative-genitive-indefinite-plural":"experimentatori","dative-definite-genitive-plural":"experimentatorilor","singular-vocative":"experimentatorule","plural-vocative":"experimentatorilor"}},{"word":"expert","pos":"noun","definitions":["expert (person with extensive knowledge or ability in a given field)","wizard (program or script used to simplify complex operations)"],"forms":{"plural":"experți","feminine":"equivalent expertă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"expert","accusative-definite-nominative-singular":"expertul","accusative-indefinite-nominative-plural":"experți","accusative-definite-nominative-plural":"experții","dative-genitive-indefinite-singular":"expert","dative-definite-genitive-singular":"expertului","dative-genitive-indefinite-plural":"experți","dative-definite-genitive-plural":"experților","singular-vocative":"expertule","plural-vocative":"experților"}},{"word":"expertă","pos":"noun","definitions":["female equivalent of expert"],"forms":{"plural":"experte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expertă","accusative-definite-nominative-singular":"experta","accusative-indefinite-nominative-plural":"experte","accusative-definite-nominative-plural":"expertele","dative-genitive-indefinite-singular":"experte","dative-definite-genitive-singular":"expertei","dative-genitive-indefinite-plural":"experte","dative-definite-genitive-plural":"expertelor","singular-vocative":"expertă","plural-vocative":"expertelor"}},{"word":"expertiza","pos":"verb","definitions":["to appraise, to value"],"forms":{"canonical":"a expertiza 1st conjugation","present-singular-third-person":"expertizează","participle-past":"expertizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expertiza","gerund":"expertizând","first-person-indicative-present-singular":"expertizez","indicative-present-second-person-singular":"expertizezi","indicative-present-singular-third-person":"expertizează","first-person-indicative-plural-present":"expertizăm","indicative-plural-present-second-person":"expertizați","indicative-plural-present-third-person":"expertizează","first-person-imperfect-indicative-singular":"expertizam","imperfect-indicative-second-person-singular":"expertizai","imperfect-indicative-singular-third-person":"expertiza","first-person-imperfect-indicative-plural":"expertizam","imperfect-indicative-plural-second-person":"expertizați","imperfect-indicative-plural-third-person":"expertizau","first-person-indicative-perfect-singular":"expertizai","indicative-perfect-second-person-singular":"expertizași","indicative-perfect-singular-third-person":"expertiză","first-person-indicative-perfect-plural":"expertizarăm","indicative-perfect-plural-second-person":"expertizarăți","indicative-perfect-plural-third-person":"expertizară","first-person-indicative-pluperfect-singular":"expertizasem","indicative-pluperfect-second-person-singular":"expertizaseși","indicative-pluperfect-singular-third-person":"expertizase","first-person-indicative-pluperfect-plural":"expertizaserăm","indicative-pluperfect-plural-second-person":"expertizaserăți","indicative-pluperfect-plural-third-person":"expertizaseră","first-person-present-singular-subjunctive":"să expertizez","present-second-person-singular-subjunctive":"să expertizezi","present-singular-subjunctive-third-person":"să expertizeze","first-person-plural-present-subjunctive":"să expertizăm","plural-present-second-person-subjunctive":"să expertizați","plural-present-subjunctive-third-person":"să expertizeze","imperative-second-person-singular":"expertizează","imperative-plural-second-person":"expertizați","imperative-negative-second-person-singular":"nu expertiza","imperative-negative-plural-second-person":"nu expertizați"}},{"word":"expertiză","pos":"noun","definitions":["expertise"],"forms":{"plural":"expertize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expertiză","accusative-definite-nominative-singular":"expertiza","accusative-indefinite-nominative-plural":"expertize","accusative-definite-nominative-plural":"expertizele","dative-genitive-indefinite-singular":"expertize","dative-definite-genitive-singular":"expertizei","dative-genitive-indefinite-plural":"expertize","dative-definite-genitive-plural":"expertizelor","singular-vocative":"expertiză","plural-vocative":"expertizelor"}},{"word":"expertizare","pos":"noun","definitions":["expertise"],"forms":{"plural":"expertizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expertizare","accusative-definite-nominative-singular":"expertizarea","accusative-indefinite-nominative-plural":"expertizări","accusative-definite-nominative-plural":"expertizările","dative-genitive-indefinite-singular":"expertizări","dative-definite-genitive-singular":"expertizării","dative-genitive-indefinite-plural":"expertizări","dative-definite-genitive-plural":"expertizărilor","singular-vocative":"expertizare","plural-vocative":"expertizărilor"}},{"word":"expertizat","pos":"adj","definitions":["expertized"],"forms":{"feminine-singular":"expertizată","masculine-plural":"expertizați","feminine-neuter-plural":"expertizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expertizat","error-unrecognized-form-feminine-indefinite-singular":"expertizată","error-unrecognized-form-indefinite-masculine-plural":"expertizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expertizate","definite-error-unrecognized-form-masculine-neuter-singular":"expertizatul","definite-error-unrecognized-form-feminine-singular":"expertizata","definite-error-unrecognized-form-masculine-plural":"expertizații","definite-error-unrecognized-form-feminine-neuter-plural":"expertizatele"}},{"word":"expia","pos":"verb","definitions":["to expiate"],"forms":{"canonical":"a expia 1st conjugation","present-singular-third-person":"expiează","participle-past":"expiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expia","gerund":"expiind","first-person-indicative-present-singular":"expiez","indicative-present-second-person-singular":"expiezi","indicative-present-singular-third-person":"expiază","first-person-indicative-plural-present":"expiem","indicative-plural-present-second-person":"expiați","indicative-plural-present-third-person":"expiază","first-person-imperfect-indicative-singular":"expiam","imperfect-indicative-second-person-singular":"expiai","imperfect-indicative-singular-third-person":"expia","first-person-imperfect-indicative-plural":"expiam","imperfect-indicative-plural-second-person":"expiați","imperfect-indicative-plural-third-person":"expiau","first-person-indicative-perfect-singular":"expiai","indicative-perfect-second-person-singular":"expiași","indicative-perfect-singular-third-person":"expie","first-person-indicative-perfect-plural":"expiarăm","indicative-perfect-plural-second-person":"expiarăți","indicative-perfect-plural-third-person":"expiară","first-person-indicative-pluperfect-singular":"expiasem","indicative-pluperfect-second-person-singular":"expiaseși","indicative-pluperfect-singular-third-person":"expiase","first-person-indicative-pluperfect-plural":"expiaserăm","indicative-pluperfect-plural-second-person":"expiaserăți","indicative-pluperfect-plural-third-person":"expiaseră","first-person-present-singular-subjunctive":"să expiez","present-second-person-singular-subjunctive":"să expiezi","present-singular-subjunctive-third-person":"să expieze","first-person-plural-present-subjunctive":"să expiem","plural-present-second-person-subjunctive":"să expiați","plural-present-subjunctive-third-person":"să expieze","imperative-second-person-singular":"expiază","imperative-plural-second-person":"expiați","imperative-negative-second-person-singular":"nu expia","imperative-negative-plural-second-person":"nu expiați"}},{"word":"expiabil","pos":"adj","definitions":["expiable"],"forms":{"feminine-singular":"expiabilă","masculine-plural":"expiabili","feminine-neuter-plural":"expiabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expiabil","error-unrecognized-form-feminine-indefinite-singular":"expiabilă","error-unrecognized-form-indefinite-masculine-plural":"expiabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"expiabile","definite-error-unrecognized-form-masculine-neuter-singular":"expiabilul","definite-error-unrecognized-form-feminine-singular":"expiabila","definite-error-unrecognized-form-masculine-plural":"expiabilii","definite-error-unrecognized-form-feminine-neuter-plural":"expiabilele"}},{"word":"expiație","pos":"noun","definitions":["expiation"],"forms":{"plural":"expiații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expiație","accusative-definite-nominative-singular":"expiația","accusative-indefinite-nominative-plural":"expiații","accusative-definite-nominative-plural":"expiațiile","dative-genitive-indefinite-singular":"expiații","dative-definite-genitive-singular":"expiației","dative-genitive-indefinite-plural":"expiații","dative-definite-genitive-plural":"expiațiilor","singular-vocative":"expiație","plural-vocative":"expiațiilor"}},{"word":"expiațiune","pos":"noun","definitions":["alternative form of expiație"],"forms":{"plural":"expiațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expiațiune","accusative-definite-nominative-singular":"expiațiunea","accusative-indefinite-nominative-plural":"expiațiuni","accusative-definite-nominative-plural":"expiațiunile","dative-genitive-indefinite-singular":"expiațiuni","dative-definite-genitive-singular":"expiațiunii","dative-genitive-indefinite-plural":"expiațiuni","dative-definite-genitive-plural":"expiațiunilor","singular-vocative":"expiațiune","plural-vocative":"expiațiunilor"}},{"word":"expiator","pos":"adj","definitions":["expiatory"],"forms":{"feminine-singular":"expiatoare","masculine-plural":"expiatori","feminine-neuter-plural":"expiatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expiator","error-unrecognized-form-feminine-indefinite-singular":"expiatoare","error-unrecognized-form-indefinite-masculine-plural":"expiatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"expiatoare","definite-error-unrecognized-form-masculine-neuter-singular":"expiatorul","definite-error-unrecognized-form-feminine-singular":"expiatoarea","definite-error-unrecognized-form-masculine-plural":"expiatorii","definite-error-unrecognized-form-feminine-neuter-plural":"expiatoarele"}},{"word":"expiere","pos":"noun","definitions":["expiation"],"forms":{"plural":"expieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expiere","accusative-definite-nominative-singular":"expierea","accusative-indefinite-nominative-plural":"expieri","accusative-definite-nominative-plural":"expierile","dative-genitive-indefinite-singular":"expieri","dative-definite-genitive-singular":"expierii","dative-genitive-indefinite-plural":"expieri","dative-definite-genitive-plural":"expierilor","singular-vocative":"expiere","plural-vocative":"expierilor"}},{"word":"expira","pos":"verb","definitions":["to exhale","to expire"],"forms":{"canonical":"a expira 1st conjugation","present-singular-third-person":"expiră","participle-past":"expirat","subjunctive-third-person":"expire","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a expira","gerund":"expirând","first-person-indicative-present-singular":"expir","indicative-present-second-person-singular":"expiri","indicative-present-singular-third-person":"expiră","first-person-indicative-plural-present":"expirăm","indicative-plural-present-second-person":"expirați","indicative-plural-present-third-person":"expiră","first-person-imperfect-indicative-singular":"expiram","imperfect-indicative-second-person-singular":"expirai","imperfect-indicative-singular-third-person":"expira","first-person-imperfect-indicative-plural":"expiram","imperfect-indicative-plural-second-person":"expirați","imperfect-indicative-plural-third-person":"expirau","first-person-indicative-perfect-singular":"expirai","indicative-perfect-second-person-singular":"expirași","indicative-perfect-singular-third-person":"expiră","first-person-indicative-perfect-plural":"expirarăm","indicative-perfect-plural-second-person":"expirarăți","indicative-perfect-plural-third-person":"expirară","first-person-indicative-pluperfect-singular":"expirasem","indicative-pluperfect-second-person-singular":"expiraseși","indicative-pluperfect-singular-third-person":"expirase","first-person-indicative-pluperfect-plural":"expiraserăm","indicative-pluperfect-plural-second-person":"expiraserăți","indicative-pluperfect-plural-third-person":"expiraseră","first-person-present-singular-subjunctive":"să expir","present-second-person-singular-subjunctive":"să expiri","present-singular-subjunctive-third-person":"să expire","first-person-plural-present-subjunctive":"să expirăm","plural-present-second-person-subjunctive":"să expirați","plural-present-subjunctive-third-person":"să expire","imperative-second-person-singular":"expiră","imperative-plural-second-person":"expirați","imperative-negative-second-person-singular":"nu expira","imperative-negative-plural-second-person":"nu expirați"}},{"word":"expirai","pos":"verb","definitions":["inflection of expira:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ekspiˈraj]"},{"word":"expiram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of expira"],"pronunciation":"[ekspiˈram]"},{"word":"expirare","pos":"noun","definitions":["expiration"],"forms":{"plural":"expirări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expirare","accusative-definite-nominative-singular":"expirarea","accusative-indefinite-nominative-plural":"expirări","accusative-definite-nominative-plural":"expirările","dative-genitive-indefinite-singular":"expirări","dative-definite-genitive-singular":"expirării","dative-genitive-indefinite-plural":"expirări","dative-definite-genitive-plural":"expirărilor","singular-vocative":"expirare","plural-vocative":"expirărilor"}},{"word":"expirase","pos":"verb","definitions":["third-person singular pluperfect indicative of expira"],"pronunciation":"[ekspiˈrase]"},{"word":"expirat","pos":"adj","definitions":["lapsed, expired"],"pronunciation":"[ekspiˈrat]","forms":{"feminine-singular":"expirată","masculine-plural":"expirați","feminine-neuter-plural":"expirate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expirat","error-unrecognized-form-feminine-indefinite-singular":"expirată","error-unrecognized-form-indefinite-masculine-plural":"expirați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expirate","definite-error-unrecognized-form-masculine-neuter-singular":"expiratul","definite-error-unrecognized-form-feminine-singular":"expirata","definite-error-unrecognized-form-masculine-plural":"expirații","definite-error-unrecognized-form-feminine-neuter-plural":"expiratele"}},{"word":"expirat","pos":"verb","definitions":["past participle of expira"],"pronunciation":"[ekspiˈrat]","forms":{"participle-past":"of expira"}},{"word":"expirație","pos":"noun","definitions":["expiration"],"pronunciation":"/ekspiˈrat͡si.e/","forms":{"plural":"expirații"}},{"word":"expirațiune","pos":"noun","definitions":["obsolete form of expirație"],"forms":{"plural":"expirațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expirațiune","accusative-definite-nominative-singular":"expirațiunea","accusative-indefinite-nominative-plural":"expirațiuni","accusative-definite-nominative-plural":"expirațiunile","dative-genitive-indefinite-singular":"expirațiuni","dative-definite-genitive-singular":"expirațiunii","dative-genitive-indefinite-plural":"expirațiuni","dative-definite-genitive-plural":"expirațiunilor","singular-vocative":"expirațiune","plural-vocative":"expirațiunilor"}},{"word":"expirator","pos":"adj","definitions":["expiratory"],"forms":{"feminine-singular":"expiratoare","masculine-plural":"expiratori","feminine-neuter-plural":"expiratoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expirator","error-unrecognized-form-feminine-indefinite-singular":"expiratoare","error-unrecognized-form-indefinite-masculine-plural":"expiratori","error-unrecognized-form-feminine-indefinite-neuter-plural":"expiratoare","definite-error-unrecognized-form-masculine-neuter-singular":"expiratorul","definite-error-unrecognized-form-feminine-singular":"expiratoarea","definite-error-unrecognized-form-masculine-plural":"expiratorii","definite-error-unrecognized-form-feminine-neuter-plural":"expiratoarele"}},{"word":"expire","pos":"verb","definitions":["third-person singular/plural present subjunctive of expira"],"pronunciation":"[ekˈspire]"},{"word":"expletiv","pos":"adj","definitions":["expletive"],"forms":{"feminine-singular":"expletivă","masculine-plural":"expletivi","feminine-neuter-plural":"expletive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expletiv","error-unrecognized-form-feminine-indefinite-singular":"expletivă","error-unrecognized-form-indefinite-masculine-plural":"expletivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expletive","definite-error-unrecognized-form-masculine-neuter-singular":"expletivul","definite-error-unrecognized-form-feminine-singular":"expletiva","definite-error-unrecognized-form-masculine-plural":"expletivii","definite-error-unrecognized-form-feminine-neuter-plural":"expletivele"}},{"word":"explica","pos":"verb","definitions":["to explain"],"pronunciation":"[ekspliˈka]","forms":{"canonical":"a explica 1st conjugation","present-singular-third-person":"explică","participle-past":"explicat","subjunctive-third-person":"explice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a explica","gerund":"explicând","first-person-indicative-present-singular":"explic","indicative-present-second-person-singular":"explici","indicative-present-singular-third-person":"explică","first-person-indicative-plural-present":"explicăm","indicative-plural-present-second-person":"explicați","indicative-plural-present-third-person":"explică","first-person-imperfect-indicative-singular":"explicam","imperfect-indicative-second-person-singular":"explicai","imperfect-indicative-singular-third-person":"explica","first-person-imperfect-indicative-plural":"explicam","imperfect-indicative-plural-second-person":"explicați","imperfect-indicative-plural-third-person":"explicau","first-person-indicative-perfect-singular":"explicai","indicative-perfect-second-person-singular":"explicași","indicative-perfect-singular-third-person":"explică","first-person-indicative-perfect-plural":"explicarăm","indicative-perfect-plural-second-person":"explicarăți","indicative-perfect-plural-third-person":"explicară","first-person-indicative-pluperfect-singular":"explicasem","indicative-pluperfect-second-person-singular":"explicaseși","indicative-pluperfect-singular-third-person":"explicase","first-person-indicative-pluperfect-plural":"explicaserăm","indicative-pluperfect-plural-second-person":"explicaserăți","indicative-pluperfect-plural-third-person":"explicaseră","first-person-present-singular-subjunctive":"să explic","present-second-person-singular-subjunctive":"să explici","present-singular-subjunctive-third-person":"să explice","first-person-plural-present-subjunctive":"să explicăm","plural-present-second-person-subjunctive":"să explicați","plural-present-subjunctive-third-person":"să explice","imperative-second-person-singular":"explică","imperative-plural-second-person":"explicați","imperative-negative-second-person-singular":"nu explica","imperative-negative-plural-second-person":"nu explicați"}},{"word":"explicabil","pos":"adj","definitions":["explicable"],"forms":{"feminine-singular":"explicabilă","masculine-plural":"explicabili","feminine-neuter-plural":"explicabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explicabil","error-unrecognized-form-feminine-indefinite-singular":"explicabilă","error-unrecognized-form-indefinite-masculine-plural":"explicabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"explicabile","definite-error-unrecognized-form-masculine-neuter-singular":"explicabilul","definite-error-unrecognized-form-feminine-singular":"explicabila","definite-error-unrecognized-form-masculine-plural":"explicabilii","definite-error-unrecognized-form-feminine-neuter-plural":"explicabilele"}},{"word":"explicai","pos":"verb","definitions":["inflection of explica:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ekspliˈkaj]"},{"word":"explicam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of explica"],"pronunciation":"[ekspliˈkam]"},{"word":"explicare","pos":"noun","definitions":["explaining"],"pronunciation":"[ekspliˈkare]","forms":{"plural":"explicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explicare","accusative-definite-nominative-singular":"explicarea","accusative-indefinite-nominative-plural":"explicări","accusative-definite-nominative-plural":"explicările","dative-genitive-indefinite-singular":"explicări","dative-definite-genitive-singular":"explicării","dative-genitive-indefinite-plural":"explicări","dative-definite-genitive-plural":"explicărilor","singular-vocative":"explicare","plural-vocative":"explicărilor"}},{"word":"explicase","pos":"verb","definitions":["third-person singular pluperfect indicative of explica"],"pronunciation":"[ekspliˈkase]"},{"word":"explicat","pos":"adj","definitions":["explained"],"pronunciation":"[ekspliˈkat]","forms":{"feminine-singular":"explicată","masculine-plural":"explicați","feminine-neuter-plural":"explicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explicat","error-unrecognized-form-feminine-indefinite-singular":"explicată","error-unrecognized-form-indefinite-masculine-plural":"explicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"explicate","definite-error-unrecognized-form-masculine-neuter-singular":"explicatul","definite-error-unrecognized-form-feminine-singular":"explicata","definite-error-unrecognized-form-masculine-plural":"explicații","definite-error-unrecognized-form-feminine-neuter-plural":"explicatele"}},{"word":"explicat","pos":"verb","definitions":["past participle of explica"],"pronunciation":"[ekspliˈkat]","forms":{"participle-past":"of explica"}},{"word":"explicație","pos":"noun","definitions":["explanation"],"pronunciation":"[eks.pliˈka.t͡si.e]","forms":{"plural":"explicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"explicație","accusative-definite-nominative-singular":"explicația","accusative-indefinite-nominative-plural":"explicații","accusative-definite-nominative-plural":"explicațiile","dative-genitive-indefinite-singular":"explicații","dative-definite-genitive-singular":"explicației","dative-genitive-indefinite-plural":"explicații","dative-definite-genitive-plural":"explicațiilor","singular-vocative":"explicație","plural-vocative":"explicațiilor"}},{"word":"explicațiune","pos":"noun","definitions":["obsolete form of explicație"],"forms":{"plural":"explicațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explicațiune","accusative-definite-nominative-singular":"explicațiunea","accusative-indefinite-nominative-plural":"explicațiuni","accusative-definite-nominative-plural":"explicațiunile","dative-genitive-indefinite-singular":"explicațiuni","dative-definite-genitive-singular":"explicațiunii","dative-genitive-indefinite-plural":"explicațiuni","dative-definite-genitive-plural":"explicațiunilor","singular-vocative":"explicațiune","plural-vocative":"explicațiunilor"}},{"word":"explicativ","pos":"adj","definitions":["explanatory"],"pronunciation":"/ˌeks.pli.kaˈtiv/","examples":[{"ro":"dicționarul explicativ","en":"explanatory dictionary"}],"forms":{"feminine-singular":"explicativă","masculine-plural":"explicativi","feminine-neuter-plural":"explicative","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"explicativ","error-unrecognized-form-feminine-indefinite-singular":"explicativă","error-unrecognized-form-indefinite-masculine-plural":"explicativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"explicative","definite-error-unrecognized-form-masculine-neuter-singular":"explicativul","definite-error-unrecognized-form-feminine-singular":"explicativa","definite-error-unrecognized-form-masculine-plural":"explicativii","definite-error-unrecognized-form-feminine-neuter-plural":"explicativele"}},{"word":"explicator","pos":"adj","definitions":["explanatory"],"forms":{"feminine-singular":"explicatoare","masculine-plural":"explicatori","feminine-neuter-plural":"explicatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explicator","error-unrecognized-form-feminine-indefinite-singular":"explicatoare","error-unrecognized-form-indefinite-masculine-plural":"explicatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"explicatoare","definite-error-unrecognized-form-masculine-neuter-singular":"explicatorul","definite-error-unrecognized-form-feminine-singular":"explicatoarea","definite-error-unrecognized-form-masculine-plural":"explicatorii","definite-error-unrecognized-form-feminine-neuter-plural":"explicatoarele"}},{"word":"explicit","pos":"adj","definitions":["explicit"],"forms":{"feminine-singular":"explicită","masculine-plural":"expliciți","feminine-neuter-plural":"explicite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explicit","error-unrecognized-form-feminine-indefinite-singular":"explicită","error-unrecognized-form-indefinite-masculine-plural":"expliciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"explicite","definite-error-unrecognized-form-masculine-neuter-singular":"explicitul","definite-error-unrecognized-form-feminine-singular":"explicita","definite-error-unrecognized-form-masculine-plural":"expliciții","definite-error-unrecognized-form-feminine-neuter-plural":"explicitele"}},{"word":"explicita","pos":"verb","definitions":["to clarify"],"forms":{"canonical":"a explicita 1st conjugation","present-singular-third-person":"explicitează","participle-past":"explicitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a explicita","gerund":"explicitând","first-person-indicative-present-singular":"explicitez","indicative-present-second-person-singular":"explicitezi","indicative-present-singular-third-person":"explicitează","first-person-indicative-plural-present":"explicităm","indicative-plural-present-second-person":"explicitați","indicative-plural-present-third-person":"explicitează","first-person-imperfect-indicative-singular":"explicitam","imperfect-indicative-second-person-singular":"explicitai","imperfect-indicative-singular-third-person":"explicita","first-person-imperfect-indicative-plural":"explicitam","imperfect-indicative-plural-second-person":"explicitați","imperfect-indicative-plural-third-person":"explicitau","first-person-indicative-perfect-singular":"explicitai","indicative-perfect-second-person-singular":"explicitași","indicative-perfect-singular-third-person":"explicită","first-person-indicative-perfect-plural":"explicitarăm","indicative-perfect-plural-second-person":"explicitarăți","indicative-perfect-plural-third-person":"explicitară","first-person-indicative-pluperfect-singular":"explicitasem","indicative-pluperfect-second-person-singular":"explicitaseși","indicative-pluperfect-singular-third-person":"explicitase","first-person-indicative-pluperfect-plural":"explicitaserăm","indicative-pluperfect-plural-second-person":"explicitaserăți","indicative-pluperfect-plural-third-person":"explicitaseră","first-person-present-singular-subjunctive":"să explicitez","present-second-person-singular-subjunctive":"să explicitezi","present-singular-subjunctive-third-person":"să expliciteze","first-person-plural-present-subjunctive":"să explicităm","plural-present-second-person-subjunctive":"să explicitați","plural-present-subjunctive-third-person":"să expliciteze","imperative-second-person-singular":"explicitează","imperative-plural-second-person":"explicitați","imperative-negative-second-person-singular":"nu explicita","imperative-negative-plural-second-person":"nu explicitați"}},{"word":"explicitare","pos":"noun","definitions":["clarification"],"forms":{"plural":"explicitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explicitare","accusative-definite-nominative-singular":"explicitarea","accusative-indefinite-nominative-plural":"explicitări","accusative-definite-nominative-plural":"explicitările","dative-genitive-indefinite-singular":"explicitări","dative-definite-genitive-singular":"explicitării","dative-genitive-indefinite-plural":"explicitări","dative-definite-genitive-plural":"explicitărilor","singular-vocative":"explicitare","plural-vocative":"explicitărilor"}},{"word":"explicitat","pos":"noun","definitions":["clarification"],"forms":{"plural":"explicitaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"explicitat","accusative-definite-nominative-singular":"explicitatul","accusative-indefinite-nominative-plural":"explicitaturi","accusative-definite-nominative-plural":"explicitaturile","dative-genitive-indefinite-singular":"explicitat","dative-definite-genitive-singular":"explicitatului","dative-genitive-indefinite-plural":"explicitaturi","dative-definite-genitive-plural":"explicitaturilor","singular-vocative":"explicitatule","plural-vocative":"explicitaturilor"}},{"word":"explicitat","pos":"verb","definitions":["past participle of explicita"],"forms":{"participle-past":"of explicita"}},{"word":"explicitate","pos":"noun","definitions":["explicitness"],"pronunciation":"/ek.spli.t͡ʃiˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"explicitate","accusative-definite-nominative":"explicitatea","dative-genitive-indefinite":"explicități","dative-definite-genitive":"explicității","vocative":"-"}},{"word":"explicite","pos":"adv","definitions":["obsolete form of explicit"]},{"word":"exploata","pos":"verb","definitions":["to exploit"],"forms":{"canonical":"a exploata 1st conjugation","present-singular-third-person":"exploatez","participle-past":"exploatat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exploata","gerund":"exploatând","first-person-indicative-present-singular":"exploatez","indicative-present-second-person-singular":"exploatezi","indicative-present-singular-third-person":"exploatează","first-person-indicative-plural-present":"exploatăm","indicative-plural-present-second-person":"exploatați","indicative-plural-present-third-person":"exploatează","first-person-imperfect-indicative-singular":"exploatam","imperfect-indicative-second-person-singular":"exploatai","imperfect-indicative-singular-third-person":"exploata","first-person-imperfect-indicative-plural":"exploatam","imperfect-indicative-plural-second-person":"exploatați","imperfect-indicative-plural-third-person":"exploatau","first-person-indicative-perfect-singular":"exploatai","indicative-perfect-second-person-singular":"exploatași","indicative-perfect-singular-third-person":"exploată","first-person-indicative-perfect-plural":"exploatarăm","indicative-perfect-plural-second-person":"exploatarăți","indicative-perfect-plural-third-person":"exploatară","first-person-indicative-pluperfect-singular":"exploatasem","indicative-pluperfect-second-person-singular":"exploataseși","indicative-pluperfect-singular-third-person":"exploatase","first-person-indicative-pluperfect-plural":"exploataserăm","indicative-pluperfect-plural-second-person":"exploataserăți","indicative-pluperfect-plural-third-person":"exploataseră","first-person-present-singular-subjunctive":"să exploatez","present-second-person-singular-subjunctive":"să exploatezi","present-singular-subjunctive-third-person":"să exploateze","first-person-plural-present-subjunctive":"să exploatăm","plural-present-second-person-subjunctive":"să exploatați","plural-present-subjunctive-third-person":"să exploateze","imperative-second-person-singular":"exploatează","imperative-plural-second-person":"exploatați","imperative-negative-second-person-singular":"nu exploata","imperative-negative-plural-second-person":"nu exploatați"}},{"word":"exploatabil","pos":"adj","definitions":["exploitable"],"forms":{"feminine-singular":"exploatabilă","masculine-plural":"exploatabili","feminine-neuter-plural":"exploatabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exploatabil","error-unrecognized-form-feminine-indefinite-singular":"exploatabilă","error-unrecognized-form-indefinite-masculine-plural":"exploatabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exploatabile","definite-error-unrecognized-form-masculine-neuter-singular":"exploatabilul","definite-error-unrecognized-form-feminine-singular":"exploatabila","definite-error-unrecognized-form-masculine-plural":"exploatabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exploatabilele"}},{"word":"exploatabilitate","pos":"noun","definitions":["exploitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exploatabilitate","accusative-definite-nominative-singular":"exploatabilitatea","accusative-indefinite-nominative-plural":"exploatabilități","accusative-definite-nominative-plural":"exploatabilitățile","dative-genitive-indefinite-singular":"exploatabilități","dative-definite-genitive-singular":"exploatabilității","dative-genitive-indefinite-plural":"exploatabilități","dative-definite-genitive-plural":"exploatabilităților","singular-vocative":"exploatabilitate","plural-vocative":"exploatabilităților"}},{"word":"exploatant","pos":"adj","definitions":["exploiting"],"forms":{"feminine-singular":"exploatantă","masculine-plural":"exploatanți","feminine-neuter-plural":"exploatante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exploatant","error-unrecognized-form-feminine-indefinite-singular":"exploatantă","error-unrecognized-form-indefinite-masculine-plural":"exploatanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exploatante","definite-error-unrecognized-form-masculine-neuter-singular":"exploatantul","definite-error-unrecognized-form-feminine-singular":"exploatanta","definite-error-unrecognized-form-masculine-plural":"exploatanții","definite-error-unrecognized-form-feminine-neuter-plural":"exploatantele"}},{"word":"exploatant","pos":"noun","definitions":["exploiting"],"forms":{"plural":"exploatanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exploatant","accusative-definite-nominative-singular":"exploatantul","accusative-indefinite-nominative-plural":"exploatanți","accusative-definite-nominative-plural":"exploatanții","dative-genitive-indefinite-singular":"exploatant","dative-definite-genitive-singular":"exploatantului","dative-genitive-indefinite-plural":"exploatanți","dative-definite-genitive-plural":"exploatanților","singular-vocative":"exploatantule","plural-vocative":"exploatanților"}},{"word":"exploatare","pos":"noun","definitions":["exploitation"],"pronunciation":"/eks.plo.aˈta.re/","forms":{"plural":"exploatări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exploatare","accusative-definite-nominative-singular":"exploatarea","accusative-indefinite-nominative-plural":"exploatări","accusative-definite-nominative-plural":"exploatările","dative-genitive-indefinite-singular":"exploatări","dative-definite-genitive-singular":"exploatării","dative-genitive-indefinite-plural":"exploatări","dative-definite-genitive-plural":"exploatărilor","singular-vocative":"exploatare","plural-vocative":"exploatărilor"}},{"word":"exploatat","pos":"adj","definitions":["exploited"],"forms":{"feminine-singular":"exploatată","masculine-plural":"exploatați","feminine-neuter-plural":"exploatate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exploatat","error-unrecognized-form-feminine-indefinite-singular":"exploatată","error-unrecognized-form-indefinite-masculine-plural":"exploatați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exploatate","definite-error-unrecognized-form-masculine-neuter-singular":"exploatatul","definite-error-unrecognized-form-feminine-singular":"exploatata","definite-error-unrecognized-form-masculine-plural":"exploatații","definite-error-unrecognized-form-feminine-neuter-plural":"exploatatele"}},{"word":"exploatată","pos":"noun","definitions":["female equivalent of exploatat"],"forms":{"plural":"exploatate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exploatată","accusative-definite-nominative-singular":"exploatata","accusative-indefinite-nominative-plural":"exploatate","accusative-definite-nominative-plural":"exploatatele","dative-genitive-indefinite-singular":"exploatate","dative-definite-genitive-singular":"exploatatei","dative-genitive-indefinite-plural":"exploatate","dative-definite-genitive-plural":"exploatatelor","singular-vocative":"exploatată","plural-vocative":"exploatatelor"}},{"word":"exploatație","pos":"noun","definitions":["exploitation"],"forms":{"plural":"exploatații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exploatație","accusative-definite-nominative-singular":"exploatația","accusative-indefinite-nominative-plural":"exploatații","accusative-definite-nominative-plural":"exploatațiile","dative-genitive-indefinite-singular":"exploatații","dative-definite-genitive-singular":"exploatației","dative-genitive-indefinite-plural":"exploatații","dative-definite-genitive-plural":"exploatațiilor","singular-vocative":"exploatație","plural-vocative":"exploatațiilor"}},{"word":"exploatațiune","pos":"noun","definitions":["obsolete form of exploatație"],"forms":{"plural":"exploatațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exploatațiune","accusative-definite-nominative-singular":"exploatațiunea","accusative-indefinite-nominative-plural":"exploatațiuni","accusative-definite-nominative-plural":"exploatațiunile","dative-genitive-indefinite-singular":"exploatațiuni","dative-definite-genitive-singular":"exploatațiunii","dative-genitive-indefinite-plural":"exploatațiuni","dative-definite-genitive-plural":"exploatațiunilor","singular-vocative":"exploatațiune","plural-vocative":"exploatațiunilor"}},{"word":"exploatatoare","pos":"noun","definitions":["female equivalent of exploatator"],"forms":{"plural":"exploatatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"exploatatoare","accusative-definite-nominative-singular":"exploatatoarea","accusative-indefinite-nominative-plural":"exploatatoare","accusative-definite-nominative-plural":"exploatatoarele","dative-genitive-indefinite-singular":"exploatatoare","dative-definite-genitive-singular":"exploatatoarei","dative-genitive-indefinite-plural":"exploatatoare","dative-definite-genitive-plural":"exploatatoarelor","singular-vocative":"exploatatoare","plural-vocative":"exploatatoarelor"}},{"word":"exploatator","pos":"adj","definitions":["exploiting"],"forms":{"feminine-singular":"exploatatoare","masculine-plural":"exploatatori","feminine-neuter-plural":"exploatatoare"}},{"word":"exploatator","pos":"noun","definitions":["exploiter"],"forms":{"plural":"exploatatori","feminine":"equivalent exploatatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exploatator","accusative-definite-nominative-singular":"exploatatorul","accusative-indefinite-nominative-plural":"exploatatori","accusative-definite-nominative-plural":"exploatatorii","dative-genitive-indefinite-singular":"exploatator","dative-definite-genitive-singular":"exploatatorului","dative-genitive-indefinite-plural":"exploatatori","dative-definite-genitive-plural":"exploatatorilor","singular-vocative":"exploatatorule","plural-vocative":"exploatatorilor"}},{"word":"exploda","pos":"verb","definitions":["to explode"],"forms":{"canonical":"a exploda 1st conjugation","present-singular-third-person":"explodează","participle-past":"explodat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exploda","gerund":"explodând","first-person-indicative-present-singular":"explodez","indicative-present-second-person-singular":"explodezi","indicative-present-singular-third-person":"explodează","first-person-indicative-plural-present":"explodăm","indicative-plural-present-second-person":"explodați","indicative-plural-present-third-person":"explodează","first-person-imperfect-indicative-singular":"explodam","imperfect-indicative-second-person-singular":"explodai","imperfect-indicative-singular-third-person":"exploda","first-person-imperfect-indicative-plural":"explodam","imperfect-indicative-plural-second-person":"explodați","imperfect-indicative-plural-third-person":"explodau","first-person-indicative-perfect-singular":"explodai","indicative-perfect-second-person-singular":"explodași","indicative-perfect-singular-third-person":"explodă","first-person-indicative-perfect-plural":"explodarăm","indicative-perfect-plural-second-person":"explodarăți","indicative-perfect-plural-third-person":"explodară","first-person-indicative-pluperfect-singular":"explodasem","indicative-pluperfect-second-person-singular":"explodaseși","indicative-pluperfect-singular-third-person":"explodase","first-person-indicative-pluperfect-plural":"explodaserăm","indicative-pluperfect-plural-second-person":"explodaserăți","indicative-pluperfect-plural-third-person":"explodaseră","first-person-present-singular-subjunctive":"să explodez","present-second-person-singular-subjunctive":"să explodezi","present-singular-subjunctive-third-person":"să explodeze","first-person-plural-present-subjunctive":"să explodăm","plural-present-second-person-subjunctive":"să explodați","plural-present-subjunctive-third-person":"să explodeze","imperative-second-person-singular":"explodează","imperative-plural-second-person":"explodați","imperative-negative-second-person-singular":"nu exploda","imperative-negative-plural-second-person":"nu explodați"}},{"word":"explodare","pos":"noun","definitions":["blast"],"forms":{"plural":"explodări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explodare","accusative-definite-nominative-singular":"explodarea","accusative-indefinite-nominative-plural":"explodări","accusative-definite-nominative-plural":"explodările","dative-genitive-indefinite-singular":"explodări","dative-definite-genitive-singular":"explodării","dative-genitive-indefinite-plural":"explodări","dative-definite-genitive-plural":"explodărilor","singular-vocative":"explodare","plural-vocative":"explodărilor"}},{"word":"explodat","pos":"adj","definitions":["exploded"],"forms":{"feminine-singular":"explodată","masculine-plural":"explodați","feminine-neuter-plural":"explodate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explodat","error-unrecognized-form-feminine-indefinite-singular":"explodată","error-unrecognized-form-indefinite-masculine-plural":"explodați","error-unrecognized-form-feminine-indefinite-neuter-plural":"explodate","definite-error-unrecognized-form-masculine-neuter-singular":"explodatul","definite-error-unrecognized-form-feminine-singular":"explodata","definite-error-unrecognized-form-masculine-plural":"explodații","definite-error-unrecognized-form-feminine-neuter-plural":"explodatele"}},{"word":"explodat","pos":"verb","definitions":["past participle of exploda"],"forms":{"participle-past":"of exploda"}},{"word":"explodor","pos":"noun","definitions":["exploder"],"forms":{"plural":"explodoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"explodor","accusative-definite-nominative-singular":"explodorul","accusative-indefinite-nominative-plural":"explodoare","accusative-definite-nominative-plural":"explodoarele","dative-genitive-indefinite-singular":"explodor","dative-definite-genitive-singular":"explodorului","dative-genitive-indefinite-plural":"explodoare","dative-definite-genitive-plural":"explodoarelor","singular-vocative":"explodorule","plural-vocative":"explodoarelor"}},{"word":"explora","pos":"verb","definitions":["to explore"],"forms":{"canonical":"a explora 1st conjugation","present-singular-third-person":"explorează","participle-past":"explorat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a explora","gerund":"explorând","first-person-indicative-present-singular":"explorez","indicative-present-second-person-singular":"explorezi","indicative-present-singular-third-person":"explorează","first-person-indicative-plural-present":"explorăm","indicative-plural-present-second-person":"explorați","indicative-plural-present-third-person":"explorează","first-person-imperfect-indicative-singular":"exploram","imperfect-indicative-second-person-singular":"explorai","imperfect-indicative-singular-third-person":"explora","first-person-imperfect-indicative-plural":"exploram","imperfect-indicative-plural-second-person":"explorați","imperfect-indicative-plural-third-person":"explorau","first-person-indicative-perfect-singular":"explorai","indicative-perfect-second-person-singular":"explorași","indicative-perfect-singular-third-person":"exploră","first-person-indicative-perfect-plural":"explorarăm","indicative-perfect-plural-second-person":"explorarăți","indicative-perfect-plural-third-person":"explorară","first-person-indicative-pluperfect-singular":"explorasem","indicative-pluperfect-second-person-singular":"exploraseși","indicative-pluperfect-singular-third-person":"explorase","first-person-indicative-pluperfect-plural":"exploraserăm","indicative-pluperfect-plural-second-person":"exploraserăți","indicative-pluperfect-plural-third-person":"exploraseră","first-person-present-singular-subjunctive":"să explorez","present-second-person-singular-subjunctive":"să explorezi","present-singular-subjunctive-third-person":"să exploreze","first-person-plural-present-subjunctive":"să explorăm","plural-present-second-person-subjunctive":"să explorați","plural-present-subjunctive-third-person":"să exploreze","imperative-second-person-singular":"explorează","imperative-plural-second-person":"explorați","imperative-negative-second-person-singular":"nu explora","imperative-negative-plural-second-person":"nu explorați"}},{"word":"explorabil","pos":"adj","definitions":["explorable"],"forms":{"feminine-singular":"explorabilă","masculine-plural":"explorabili","feminine-neuter-plural":"explorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explorabil","error-unrecognized-form-feminine-indefinite-singular":"explorabilă","error-unrecognized-form-indefinite-masculine-plural":"explorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"explorabile","definite-error-unrecognized-form-masculine-neuter-singular":"explorabilul","definite-error-unrecognized-form-feminine-singular":"explorabila","definite-error-unrecognized-form-masculine-plural":"explorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"explorabilele"}},{"word":"explorare","pos":"noun","definitions":["exploration"],"forms":{"plural":"explorări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explorare","accusative-definite-nominative-singular":"explorarea","accusative-indefinite-nominative-plural":"explorări","accusative-definite-nominative-plural":"explorările","dative-genitive-indefinite-singular":"explorări","dative-definite-genitive-singular":"explorării","dative-genitive-indefinite-plural":"explorări","dative-definite-genitive-plural":"explorărilor","singular-vocative":"explorare","plural-vocative":"explorărilor"}},{"word":"explorat","pos":"adj","definitions":["explored"],"forms":{"feminine-singular":"explorată","masculine-plural":"explorați","feminine-neuter-plural":"explorate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explorat","error-unrecognized-form-feminine-indefinite-singular":"explorată","error-unrecognized-form-indefinite-masculine-plural":"explorați","error-unrecognized-form-feminine-indefinite-neuter-plural":"explorate","definite-error-unrecognized-form-masculine-neuter-singular":"exploratul","definite-error-unrecognized-form-feminine-singular":"explorata","definite-error-unrecognized-form-masculine-plural":"explorații","definite-error-unrecognized-form-feminine-neuter-plural":"exploratele"}},{"word":"explorație","pos":"noun","definitions":["exploration"],"forms":{"plural":"explorații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"explorație","accusative-definite-nominative-singular":"explorația","accusative-indefinite-nominative-plural":"explorații","accusative-definite-nominative-plural":"explorațiile","dative-genitive-indefinite-singular":"explorații","dative-definite-genitive-singular":"explorației","dative-genitive-indefinite-plural":"explorații","dative-definite-genitive-plural":"explorațiilor","singular-vocative":"explorație","plural-vocative":"explorațiilor"}},{"word":"explorațiune","pos":"noun","definitions":["obsolete form of explorație"],"forms":{"plural":"explorațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explorațiune","accusative-definite-nominative-singular":"explorațiunea","accusative-indefinite-nominative-plural":"explorațiuni","accusative-definite-nominative-plural":"explorațiunile","dative-genitive-indefinite-singular":"explorațiuni","dative-definite-genitive-singular":"explorațiunii","dative-genitive-indefinite-plural":"explorațiuni","dative-definite-genitive-plural":"explorațiunilor","singular-vocative":"explorațiune","plural-vocative":"explorațiunilor"}},{"word":"explorativ","pos":"adj","definitions":["explorative, exploratory"],"forms":{"feminine-singular":"explorativă","masculine-plural":"explorativi","feminine-neuter-plural":"explorative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"explorativ","error-unrecognized-form-feminine-indefinite-singular":"explorativă","error-unrecognized-form-indefinite-masculine-plural":"explorativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"explorative","definite-error-unrecognized-form-masculine-neuter-singular":"explorativul","definite-error-unrecognized-form-feminine-singular":"explorativa","definite-error-unrecognized-form-masculine-plural":"explorativii","definite-error-unrecognized-form-feminine-neuter-plural":"explorativele"}},{"word":"exploratoare","pos":"noun","definitions":["female equivalent of explorator"],"forms":{"plural":"exploratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"exploratoare","accusative-definite-nominative-singular":"exploratoarea","accusative-indefinite-nominative-plural":"exploratoare","accusative-definite-nominative-plural":"exploratoarele","dative-genitive-indefinite-singular":"exploratoare","dative-definite-genitive-singular":"exploratoarei","dative-genitive-indefinite-plural":"exploratoare","dative-definite-genitive-plural":"exploratoarelor","singular-vocative":"exploratoare","plural-vocative":"exploratoarelor"}},{"word":"explorator","pos":"noun","definitions":["explorer"],"forms":{"plural":"exploratori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"explorator","accusative-definite-nominative-singular":"exploratorul","accusative-indefinite-nominative-plural":"exploratori","accusative-definite-nominative-plural":"exploratorii","dative-genitive-indefinite-singular":"explorator","dative-definite-genitive-singular":"exploratorului","dative-genitive-indefinite-plural":"exploratori","dative-definite-genitive-plural":"exploratorilor","singular-vocative":"exploratorule","plural-vocative":"exploratorilor"}},{"word":"explosiune","pos":"noun","definitions":["obsolete form of explozie"],"forms":{"plural":"explosiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explosiune","accusative-definite-nominative-singular":"explosiunea","accusative-indefinite-nominative-plural":"explosiuni","accusative-definite-nominative-plural":"explosiunile","dative-genitive-indefinite-singular":"explosiuni","dative-definite-genitive-singular":"explosiunii","dative-genitive-indefinite-plural":"explosiuni","dative-definite-genitive-plural":"explosiunilor","singular-vocative":"explosiune","plural-vocative":"explosiunilor"}},{"word":"explozibil","pos":"adj","definitions":["explosible"],"pronunciation":"/ˌeks.ploˈzi.bil/","forms":{"feminine-singular":"explozibilă","masculine-plural":"explozibili","feminine-neuter-plural":"explozibile"}},{"word":"explozibil","pos":"noun","definitions":["explosive"],"pronunciation":"/ˌeks.ploˈzi.bil/","forms":{"plural":"explozibili","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"explozibil","accusative-definite-nominative-singular":"explozibilul","accusative-indefinite-nominative-plural":"explozibili","accusative-definite-nominative-plural":"explozibilile","dative-genitive-indefinite-singular":"explozibil","dative-definite-genitive-singular":"explozibilului","dative-genitive-indefinite-plural":"explozibili","dative-definite-genitive-plural":"explozibililor","singular-vocative":"explozibilule","plural-vocative":"explozibililor"}},{"word":"explozie","pos":"noun","definitions":["explosion"],"forms":{"plural":"explozii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"explozie","accusative-definite-nominative-singular":"explozia","accusative-indefinite-nominative-plural":"explozii","accusative-definite-nominative-plural":"exploziile","dative-genitive-indefinite-singular":"explozii","dative-definite-genitive-singular":"exploziei","dative-genitive-indefinite-plural":"explozii","dative-definite-genitive-plural":"exploziilor","singular-vocative":"explozie","plural-vocative":"exploziilor"}},{"word":"explozimetru","pos":"noun","definitions":["explosimeter"],"forms":{"plural":"explozimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"explozimetru","accusative-definite-nominative-singular":"explozimetruul","accusative-indefinite-nominative-plural":"explozimetre","accusative-definite-nominative-plural":"explozimetrele","dative-genitive-indefinite-singular":"explozimetru","dative-definite-genitive-singular":"explozimetruului","dative-genitive-indefinite-plural":"explozimetre","dative-definite-genitive-plural":"explozimetrelor","singular-vocative":"explozimetruule","plural-vocative":"explozimetrelor"}},{"word":"explozitivitate","pos":"noun","definitions":["explosiveness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explozitivitate","accusative-definite-nominative-singular":"explozitivitatea","accusative-indefinite-nominative-plural":"explozitivități","accusative-definite-nominative-plural":"explozitivitățile","dative-genitive-indefinite-singular":"explozitivități","dative-definite-genitive-singular":"explozitivității","dative-genitive-indefinite-plural":"explozitivități","dative-definite-genitive-plural":"explozitivităților","singular-vocative":"explozitivitate","plural-vocative":"explozitivităților"}},{"word":"exploziune","pos":"noun","definitions":["obsolete form of explozie"],"forms":{"plural":"exploziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exploziune","accusative-definite-nominative-singular":"exploziunea","accusative-indefinite-nominative-plural":"exploziuni","accusative-definite-nominative-plural":"exploziunile","dative-genitive-indefinite-singular":"exploziuni","dative-definite-genitive-singular":"exploziunii","dative-genitive-indefinite-plural":"exploziuni","dative-definite-genitive-plural":"exploziunilor","singular-vocative":"exploziune","plural-vocative":"exploziunilor"}},{"word":"exploziv","pos":"noun","definitions":["explosive"],"forms":{"plural":"explozivi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exploziv","accusative-definite-nominative-singular":"explozivul","accusative-indefinite-nominative-plural":"explozivi","accusative-definite-nominative-plural":"explozivile","dative-genitive-indefinite-singular":"exploziv","dative-definite-genitive-singular":"explozivului","dative-genitive-indefinite-plural":"explozivi","dative-definite-genitive-plural":"explozivilor","singular-vocative":"explozivule","plural-vocative":"explozivilor"}},{"word":"explozivă","pos":"noun","definitions":["plosive"],"forms":{"plural":"explozive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"explozivă","accusative-definite-nominative-singular":"exploziva","accusative-indefinite-nominative-plural":"explozive","accusative-definite-nominative-plural":"explozivele","dative-genitive-indefinite-singular":"explozive","dative-definite-genitive-singular":"explozivei","dative-genitive-indefinite-plural":"explozive","dative-definite-genitive-plural":"explozivelor","singular-vocative":"explozivă","plural-vocative":"explozivelor"}},{"word":"explozivitate","pos":"noun","definitions":["explosiveness"],"forms":{"plural":"explozivități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"explozivitate","accusative-definite-nominative-singular":"explozivitatea","accusative-indefinite-nominative-plural":"explozivități","accusative-definite-nominative-plural":"explozivitățile","dative-genitive-indefinite-singular":"explozivități","dative-definite-genitive-singular":"explozivității","dative-genitive-indefinite-plural":"explozivități","dative-definite-genitive-plural":"explozivităților","singular-vocative":"explozivitate","plural-vocative":"explozivităților"}},{"word":"explozor","pos":"noun","definitions":["exploder"],"forms":{"plural":"explozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"explozor","accusative-definite-nominative-singular":"explozorul","accusative-indefinite-nominative-plural":"explozoare","accusative-definite-nominative-plural":"explozoarele","dative-genitive-indefinite-singular":"explozor","dative-definite-genitive-singular":"explozorului","dative-genitive-indefinite-plural":"explozoare","dative-definite-genitive-plural":"explozoarelor","singular-vocative":"explozorule","plural-vocative":"explozoarelor"}},{"word":"expo","pos":"noun","definitions":["exposition"]},{"word":"exponat","pos":"noun","definitions":["exhibit"],"forms":{"plural":"exponate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exponat","accusative-definite-nominative-singular":"exponatul","accusative-indefinite-nominative-plural":"exponate","accusative-definite-nominative-plural":"exponatele","dative-genitive-indefinite-singular":"exponat","dative-definite-genitive-singular":"exponatului","dative-genitive-indefinite-plural":"exponate","dative-definite-genitive-plural":"exponatelor","singular-vocative":"exponatule","plural-vocative":"exponatelor"}},{"word":"exponent","pos":"noun","definitions":["exponent (number)","exponent (person)"],"forms":{"plural":"exponenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exponent","accusative-definite-nominative-singular":"exponentul","accusative-indefinite-nominative-plural":"exponenți","accusative-definite-nominative-plural":"exponenții","dative-genitive-indefinite-singular":"exponent","dative-definite-genitive-singular":"exponentului","dative-genitive-indefinite-plural":"exponenți","dative-definite-genitive-plural":"exponenților","singular-vocative":"exponentule","plural-vocative":"exponenților"}},{"word":"exponentă","pos":"noun","definitions":["female equivalent of exponent"],"forms":{"plural":"exponente","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exponentă","accusative-definite-nominative-singular":"exponenta","accusative-indefinite-nominative-plural":"exponente","accusative-definite-nominative-plural":"exponentele","dative-genitive-indefinite-singular":"exponente","dative-definite-genitive-singular":"exponentei","dative-genitive-indefinite-plural":"exponente","dative-definite-genitive-plural":"exponentelor","singular-vocative":"exponentă","plural-vocative":"exponentelor"}},{"word":"exponențial","pos":"adj","definitions":["exponential"],"forms":{"feminine-singular":"exponențială","masculine-plural":"exponențiali","feminine-neuter-plural":"exponențiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exponențial","error-unrecognized-form-feminine-indefinite-singular":"exponențială","error-unrecognized-form-indefinite-masculine-plural":"exponențiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"exponențiale","definite-error-unrecognized-form-masculine-neuter-singular":"exponențialul","definite-error-unrecognized-form-feminine-singular":"exponențiala","definite-error-unrecognized-form-masculine-plural":"exponențialii","definite-error-unrecognized-form-feminine-neuter-plural":"exponențialele"}},{"word":"exponometru","pos":"noun","definitions":["exposure meter"],"forms":{"plural":"exponometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exponometru","accusative-definite-nominative-singular":"exponometrul","accusative-indefinite-nominative-plural":"exponometre","accusative-definite-nominative-plural":"exponometrele","dative-genitive-indefinite-singular":"exponometru","dative-definite-genitive-singular":"exponometrului","dative-genitive-indefinite-plural":"exponometre","dative-definite-genitive-plural":"exponometrelor","singular-vocative":"exponometrule","plural-vocative":"exponometrelor"}},{"word":"export","pos":"noun","definitions":["export"],"forms":{"plural":"exporturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"export","accusative-definite-nominative-singular":"exportul","accusative-indefinite-nominative-plural":"exporturi","accusative-definite-nominative-plural":"exporturile","dative-genitive-indefinite-singular":"export","dative-definite-genitive-singular":"exportului","dative-genitive-indefinite-plural":"exporturi","dative-definite-genitive-plural":"exporturilor","singular-vocative":"exportule","plural-vocative":"exporturilor"}},{"word":"export invizibil","pos":"noun","definitions":["invisible export"],"forms":{"plural":"exporturi invizibile"}},{"word":"exporta","pos":"verb","definitions":["to export"],"pronunciation":"/eks.porˈta/","forms":{"canonical":"a exporta 1st conjugation","present-singular-third-person":"exportă","participle-past":"exportat","subjunctive-third-person":"exporte","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exporta","gerund":"exportând","first-person-indicative-present-singular":"export","indicative-present-second-person-singular":"exporți","indicative-present-singular-third-person":"exportă","first-person-indicative-plural-present":"exportăm","indicative-plural-present-second-person":"exportați","indicative-plural-present-third-person":"exportă","first-person-imperfect-indicative-singular":"exportam","imperfect-indicative-second-person-singular":"exportai","imperfect-indicative-singular-third-person":"exporta","first-person-imperfect-indicative-plural":"exportam","imperfect-indicative-plural-second-person":"exportați","imperfect-indicative-plural-third-person":"exportau","first-person-indicative-perfect-singular":"exportai","indicative-perfect-second-person-singular":"exportași","indicative-perfect-singular-third-person":"exportă","first-person-indicative-perfect-plural":"exportarăm","indicative-perfect-plural-second-person":"exportarăți","indicative-perfect-plural-third-person":"exportară","first-person-indicative-pluperfect-singular":"exportasem","indicative-pluperfect-second-person-singular":"exportaseși","indicative-pluperfect-singular-third-person":"exportase","first-person-indicative-pluperfect-plural":"exportaserăm","indicative-pluperfect-plural-second-person":"exportaserăți","indicative-pluperfect-plural-third-person":"exportaseră","first-person-present-singular-subjunctive":"să export","present-second-person-singular-subjunctive":"să exporți","present-singular-subjunctive-third-person":"să exporte","first-person-plural-present-subjunctive":"să exportăm","plural-present-second-person-subjunctive":"să exportați","plural-present-subjunctive-third-person":"să exporte","imperative-second-person-singular":"exportă","imperative-plural-second-person":"exportați","imperative-negative-second-person-singular":"nu exporta","imperative-negative-plural-second-person":"nu exportați"}},{"word":"exportabil","pos":"adj","definitions":["exportable"],"forms":{"feminine-singular":"exportabilă","masculine-plural":"exportabili","feminine-neuter-plural":"exportabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exportabil","error-unrecognized-form-feminine-indefinite-singular":"exportabilă","error-unrecognized-form-indefinite-masculine-plural":"exportabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exportabile","definite-error-unrecognized-form-masculine-neuter-singular":"exportabilul","definite-error-unrecognized-form-feminine-singular":"exportabila","definite-error-unrecognized-form-masculine-plural":"exportabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exportabilele"}},{"word":"exportare","pos":"noun","definitions":["exportation"],"forms":{"plural":"exportări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exportare","accusative-definite-nominative-singular":"exportarea","accusative-indefinite-nominative-plural":"exportări","accusative-definite-nominative-plural":"exportările","dative-genitive-indefinite-singular":"exportări","dative-definite-genitive-singular":"exportării","dative-genitive-indefinite-plural":"exportări","dative-definite-genitive-plural":"exportărilor","singular-vocative":"exportare","plural-vocative":"exportărilor"}},{"word":"exportat","pos":"adj","definitions":["exported"],"forms":{"feminine-singular":"exportată","masculine-plural":"exportați","feminine-neuter-plural":"exportate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exportat","error-unrecognized-form-feminine-indefinite-singular":"exportată","error-unrecognized-form-indefinite-masculine-plural":"exportați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exportate","definite-error-unrecognized-form-masculine-neuter-singular":"exportatul","definite-error-unrecognized-form-feminine-singular":"exportata","definite-error-unrecognized-form-masculine-plural":"exportații","definite-error-unrecognized-form-feminine-neuter-plural":"exportatele"}},{"word":"exportat","pos":"verb","definitions":["past participle of exporta"],"forms":{"participle-past":"of exporta"}},{"word":"exportație","pos":"noun","definitions":["export"],"forms":{"plural":"exportații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exportație","accusative-definite-nominative-singular":"exportația","accusative-indefinite-nominative-plural":"exportații","accusative-definite-nominative-plural":"exportațiile","dative-genitive-indefinite-singular":"exportații","dative-definite-genitive-singular":"exportației","dative-genitive-indefinite-plural":"exportații","dative-definite-genitive-plural":"exportațiilor","singular-vocative":"exportație","plural-vocative":"exportațiilor"}},{"word":"exportațiune","pos":"noun","definitions":["obsolete form of exportație"],"forms":{"plural":"exportațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exportațiune","accusative-definite-nominative-singular":"exportațiunea","accusative-indefinite-nominative-plural":"exportațiuni","accusative-definite-nominative-plural":"exportațiunile","dative-genitive-indefinite-singular":"exportațiuni","dative-definite-genitive-singular":"exportațiunii","dative-genitive-indefinite-plural":"exportațiuni","dative-definite-genitive-plural":"exportațiunilor","singular-vocative":"exportațiune","plural-vocative":"exportațiunilor"}},{"word":"exportatoare","pos":"noun","definitions":["female equivalent of exportator"],"forms":{"plural":"exportatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"exportatoare","accusative-definite-nominative-singular":"exportatoarea","accusative-indefinite-nominative-plural":"exportatoare","accusative-definite-nominative-plural":"exportatoarele","dative-genitive-indefinite-singular":"exportatoare","dative-definite-genitive-singular":"exportatoarei","dative-genitive-indefinite-plural":"exportatoare","dative-definite-genitive-plural":"exportatoarelor","singular-vocative":"exportatoare","plural-vocative":"exportatoarelor"}},{"word":"exportator","pos":"noun","definitions":["exporter"],"forms":{"plural":"exportatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exportator","accusative-definite-nominative-singular":"exportatorul","accusative-indefinite-nominative-plural":"exportatori","accusative-definite-nominative-plural":"exportatorii","dative-genitive-indefinite-singular":"exportator","dative-definite-genitive-singular":"exportatorului","dative-genitive-indefinite-plural":"exportatori","dative-definite-genitive-plural":"exportatorilor","singular-vocative":"exportatorule","plural-vocative":"exportatorilor"}},{"word":"exportui","pos":"verb","definitions":["to export"],"forms":{"canonical":"a exportui 4th conjugation","present-singular-third-person":"exportuie","participle-past":"exportuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a exportui","gerund":"exportuind","first-person-indicative-present-singular":"exportui","indicative-present-second-person-singular":"exportui","indicative-present-singular-third-person":"exportuie","first-person-indicative-plural-present":"exportuim","indicative-plural-present-second-person":"exportuiți","indicative-plural-present-third-person":"exportuie","first-person-imperfect-indicative-singular":"exportuiam","imperfect-indicative-second-person-singular":"exportuiai","imperfect-indicative-singular-third-person":"exportuia","first-person-imperfect-indicative-plural":"exportuiam","imperfect-indicative-plural-second-person":"exportuiați","imperfect-indicative-plural-third-person":"exportuiau","first-person-indicative-perfect-singular":"exportuii","indicative-perfect-second-person-singular":"exportuiși","indicative-perfect-singular-third-person":"exportui","first-person-indicative-perfect-plural":"exportuirăm","indicative-perfect-plural-second-person":"exportuirăți","indicative-perfect-plural-third-person":"exportuiră","first-person-indicative-pluperfect-singular":"exportuisem","indicative-pluperfect-second-person-singular":"exportuiseși","indicative-pluperfect-singular-third-person":"exportuise","first-person-indicative-pluperfect-plural":"exportuiserăm","indicative-pluperfect-plural-second-person":"exportuiserăți","indicative-pluperfect-plural-third-person":"exportuiseră","first-person-present-singular-subjunctive":"să exportui","present-second-person-singular-subjunctive":"să exportui","present-singular-subjunctive-third-person":"să exportuie","first-person-plural-present-subjunctive":"să exportuim","plural-present-second-person-subjunctive":"să exportuiți","plural-present-subjunctive-third-person":"să exportuie","imperative-second-person-singular":"exportuie","imperative-plural-second-person":"exportuiți","imperative-negative-second-person-singular":"nu exportui","imperative-negative-plural-second-person":"nu exportuiți"}},{"word":"expozabil","pos":"adj","definitions":["exposable"],"forms":{"feminine-singular":"expozabilă","masculine-plural":"expozabili","feminine-neuter-plural":"expozabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expozabil","error-unrecognized-form-feminine-indefinite-singular":"expozabilă","error-unrecognized-form-indefinite-masculine-plural":"expozabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"expozabile","definite-error-unrecognized-form-masculine-neuter-singular":"expozabilul","definite-error-unrecognized-form-feminine-singular":"expozabila","definite-error-unrecognized-form-masculine-plural":"expozabilii","definite-error-unrecognized-form-feminine-neuter-plural":"expozabilele"}},{"word":"expozant","pos":"noun","definitions":["exhibitor"],"forms":{"plural":"expozanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"expozant","accusative-definite-nominative-singular":"expozantul","accusative-indefinite-nominative-plural":"expozanți","accusative-definite-nominative-plural":"expozanții","dative-genitive-indefinite-singular":"expozant","dative-definite-genitive-singular":"expozantului","dative-genitive-indefinite-plural":"expozanți","dative-definite-genitive-plural":"expozanților","singular-vocative":"expozantule","plural-vocative":"expozanților"}},{"word":"expozantă","pos":"noun","definitions":["female equivalent of expozant"],"forms":{"plural":"expozante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expozantă","accusative-definite-nominative-singular":"expozanta","accusative-indefinite-nominative-plural":"expozante","accusative-definite-nominative-plural":"expozantele","dative-genitive-indefinite-singular":"expozante","dative-definite-genitive-singular":"expozantei","dative-genitive-indefinite-plural":"expozante","dative-definite-genitive-plural":"expozantelor","singular-vocative":"expozantă","plural-vocative":"expozantelor"}},{"word":"expozeu","pos":"noun","definitions":["expose"],"forms":{"plural":"expozeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"expozeu","accusative-definite-nominative-singular":"expozeul","accusative-indefinite-nominative-plural":"expozeuri","accusative-definite-nominative-plural":"expozeurile","dative-genitive-indefinite-singular":"expozeu","dative-definite-genitive-singular":"expozeului","dative-genitive-indefinite-plural":"expozeuri","dative-definite-genitive-plural":"expozeurilor","singular-vocative":"expozeule","plural-vocative":"expozeurilor"}},{"word":"expoziție","pos":"noun","definitions":["exhibition; exposition, display"],"pronunciation":"[eks.poˈzi.t͡si.e]","forms":{"plural":"expoziții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expoziție","accusative-definite-nominative-singular":"expoziția","accusative-indefinite-nominative-plural":"expoziții","accusative-definite-nominative-plural":"expozițiile","dative-genitive-indefinite-singular":"expoziții","dative-definite-genitive-singular":"expoziției","dative-genitive-indefinite-plural":"expoziții","dative-definite-genitive-plural":"expozițiilor","singular-vocative":"expoziție","plural-vocative":"expozițiilor"}},{"word":"expozițional","pos":"adj","definitions":["expositional"],"forms":{"feminine-singular":"expozițională","masculine-plural":"expoziționali","feminine-neuter-plural":"expoziționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expozițional","error-unrecognized-form-feminine-indefinite-singular":"expozițională","error-unrecognized-form-indefinite-masculine-plural":"expoziționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"expoziționale","definite-error-unrecognized-form-masculine-neuter-singular":"expoziționalul","definite-error-unrecognized-form-feminine-singular":"expoziționala","definite-error-unrecognized-form-masculine-plural":"expoziționalii","definite-error-unrecognized-form-feminine-neuter-plural":"expoziționalele"}},{"word":"expozițiune","pos":"noun","definitions":["alternative form of expoziție"],"forms":{"plural":"expozițiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expozițiune","accusative-definite-nominative-singular":"expozițiunea","accusative-indefinite-nominative-plural":"expozițiuni","accusative-definite-nominative-plural":"expozițiunile","dative-genitive-indefinite-singular":"expozițiuni","dative-definite-genitive-singular":"expozițiunii","dative-genitive-indefinite-plural":"expozițiuni","dative-definite-genitive-plural":"expozițiunilor","singular-vocative":"expozițiune","plural-vocative":"expozițiunilor"}},{"word":"expozitiv","pos":"adj","definitions":["expositive"],"forms":{"feminine-singular":"expozitivă","masculine-plural":"expozitivi","feminine-neuter-plural":"expozitive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expozitiv","error-unrecognized-form-feminine-indefinite-singular":"expozitivă","error-unrecognized-form-indefinite-masculine-plural":"expozitivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expozitive","definite-error-unrecognized-form-masculine-neuter-singular":"expozitivul","definite-error-unrecognized-form-feminine-singular":"expozitiva","definite-error-unrecognized-form-masculine-plural":"expozitivii","definite-error-unrecognized-form-feminine-neuter-plural":"expozitivele"}},{"word":"expre","pos":"adj","definitions":["alternative form of expres"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expre","error-unrecognized-form-feminine-indefinite-singular":"expre","error-unrecognized-form-indefinite-masculine-plural":"expre","error-unrecognized-form-feminine-indefinite-neuter-plural":"expre","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"expres","pos":"adj","definitions":["express"],"forms":{"feminine-singular":"expresă","masculine-plural":"expreși","feminine-neuter-plural":"exprese","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expres","error-unrecognized-form-feminine-indefinite-singular":"expresă","error-unrecognized-form-indefinite-masculine-plural":"expreși","error-unrecognized-form-feminine-indefinite-neuter-plural":"exprese","definite-error-unrecognized-form-masculine-neuter-singular":"expresul","definite-error-unrecognized-form-feminine-singular":"expresa","definite-error-unrecognized-form-masculine-plural":"expreșii","definite-error-unrecognized-form-feminine-neuter-plural":"expresele"}},{"word":"expresie","pos":"noun","definitions":["expression"],"pronunciation":"/eksˈpre.si.e/","forms":{"plural":"expresii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expresie","accusative-definite-nominative-singular":"expresia","accusative-indefinite-nominative-plural":"expresii","accusative-definite-nominative-plural":"expresiile","dative-genitive-indefinite-singular":"expresii","dative-definite-genitive-singular":"expresiei","dative-genitive-indefinite-plural":"expresii","dative-definite-genitive-plural":"expresiilor","singular-vocative":"expresie","plural-vocative":"expresiilor"}},{"word":"expresie lambda","pos":"noun","definitions":["lambda expression"],"forms":{"plural":"expresii lambda"}},{"word":"expresionism","pos":"noun","definitions":["expressionism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"expresionism","accusative-definite-nominative-singular":"expresionismul","accusative-indefinite-nominative-plural":"expresionisme","accusative-definite-nominative-plural":"expresionismele","dative-genitive-indefinite-singular":"expresionism","dative-definite-genitive-singular":"expresionismului","dative-genitive-indefinite-plural":"expresionisme","dative-definite-genitive-plural":"expresionismelor","singular-vocative":"expresionismule","plural-vocative":"expresionismelor"}},{"word":"expresionist","pos":"adj","definitions":["expressionist"],"forms":{"feminine-singular":"expresionistă","masculine-plural":"expresioniști","feminine-neuter-plural":"expresioniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expresionist","error-unrecognized-form-feminine-indefinite-singular":"expresionistă","error-unrecognized-form-indefinite-masculine-plural":"expresioniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"expresioniste","definite-error-unrecognized-form-masculine-neuter-singular":"expresionistul","definite-error-unrecognized-form-feminine-singular":"expresionista","definite-error-unrecognized-form-masculine-plural":"expresioniștii","definite-error-unrecognized-form-feminine-neuter-plural":"expresionistele"}},{"word":"expresionist","pos":"noun","definitions":["expressionist"],"forms":{"plural":"expresioniști","feminine":"equivalent expresionistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"expresionist","accusative-definite-nominative-singular":"expresionistul","accusative-indefinite-nominative-plural":"expresioniști","accusative-definite-nominative-plural":"expresioniștii","dative-genitive-indefinite-singular":"expresionist","dative-definite-genitive-singular":"expresionistului","dative-genitive-indefinite-plural":"expresioniști","dative-definite-genitive-plural":"expresioniștilor","singular-vocative":"expresionistule","plural-vocative":"expresioniștilor"}},{"word":"expresionistă","pos":"noun","definitions":["female equivalent of expresionist"],"forms":{"plural":"expresioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expresionistă","accusative-definite-nominative-singular":"expresionista","accusative-indefinite-nominative-plural":"expresioniste","accusative-definite-nominative-plural":"expresionistele","dative-genitive-indefinite-singular":"expresioniste","dative-definite-genitive-singular":"expresionistei","dative-genitive-indefinite-plural":"expresioniste","dative-definite-genitive-plural":"expresionistelor","singular-vocative":"expresionistă","plural-vocative":"expresionistelor"}},{"word":"expresiune","pos":"noun","definitions":["alternative form of expresie"],"forms":{"plural":"expresiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expresiune","accusative-definite-nominative-singular":"expresiunea","accusative-indefinite-nominative-plural":"expresiuni","accusative-definite-nominative-plural":"expresiunile","dative-genitive-indefinite-singular":"expresiuni","dative-definite-genitive-singular":"expresiunii","dative-genitive-indefinite-plural":"expresiuni","dative-definite-genitive-plural":"expresiunilor","singular-vocative":"expresiune","plural-vocative":"expresiunilor"}},{"word":"expresiv","pos":"adj","definitions":["expressive"],"forms":{"feminine-singular":"expresivă","masculine-plural":"expresivi","feminine-neuter-plural":"expresive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expresiv","error-unrecognized-form-feminine-indefinite-singular":"expresivă","error-unrecognized-form-indefinite-masculine-plural":"expresivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"expresive","definite-error-unrecognized-form-masculine-neuter-singular":"expresivul","definite-error-unrecognized-form-feminine-singular":"expresiva","definite-error-unrecognized-form-masculine-plural":"expresivii","definite-error-unrecognized-form-feminine-neuter-plural":"expresivele"}},{"word":"expresivitate","pos":"noun","definitions":["expressiveness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expresivitate","accusative-definite-nominative-singular":"expresivitatea","accusative-indefinite-nominative-plural":"expresivități","accusative-definite-nominative-plural":"expresivitățile","dative-genitive-indefinite-singular":"expresivități","dative-definite-genitive-singular":"expresivității","dative-genitive-indefinite-plural":"expresivități","dative-definite-genitive-plural":"expresivităților","singular-vocative":"expresivitate","plural-vocative":"expresivităților"}},{"word":"exprima","pos":"verb","definitions":["to express","to voice, state","to show, manifest, represent, set forth in words"],"forms":{"canonical":"a exprima 1st conjugation","present-singular-third-person":"exprimă","participle-past":"exprimat","subjunctive-third-person":"exprime","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exprima","gerund":"exprimând","first-person-indicative-present-singular":"exprim","indicative-present-second-person-singular":"exprimi","indicative-present-singular-third-person":"exprimă","first-person-indicative-plural-present":"exprimăm","indicative-plural-present-second-person":"exprimați","indicative-plural-present-third-person":"exprimă","first-person-imperfect-indicative-singular":"exprimam","imperfect-indicative-second-person-singular":"exprimai","imperfect-indicative-singular-third-person":"exprima","first-person-imperfect-indicative-plural":"exprimam","imperfect-indicative-plural-second-person":"exprimați","imperfect-indicative-plural-third-person":"exprimau","first-person-indicative-perfect-singular":"exprimai","indicative-perfect-second-person-singular":"exprimași","indicative-perfect-singular-third-person":"exprimă","first-person-indicative-perfect-plural":"exprimarăm","indicative-perfect-plural-second-person":"exprimarăți","indicative-perfect-plural-third-person":"exprimară","first-person-indicative-pluperfect-singular":"exprimasem","indicative-pluperfect-second-person-singular":"exprimaseși","indicative-pluperfect-singular-third-person":"exprimase","first-person-indicative-pluperfect-plural":"exprimaserăm","indicative-pluperfect-plural-second-person":"exprimaserăți","indicative-pluperfect-plural-third-person":"exprimaseră","first-person-present-singular-subjunctive":"să exprim","present-second-person-singular-subjunctive":"să exprimi","present-singular-subjunctive-third-person":"să exprime","first-person-plural-present-subjunctive":"să exprimăm","plural-present-second-person-subjunctive":"să exprimați","plural-present-subjunctive-third-person":"să exprime","imperative-second-person-singular":"exprimă","imperative-plural-second-person":"exprimați","imperative-negative-second-person-singular":"nu exprima","imperative-negative-plural-second-person":"nu exprimați"}},{"word":"exprimabil","pos":"adj","definitions":["expressible"],"forms":{"feminine-singular":"exprimabilă","masculine-plural":"exprimabili","feminine-neuter-plural":"exprimabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exprimabil","error-unrecognized-form-feminine-indefinite-singular":"exprimabilă","error-unrecognized-form-indefinite-masculine-plural":"exprimabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exprimabile","definite-error-unrecognized-form-masculine-neuter-singular":"exprimabilul","definite-error-unrecognized-form-feminine-singular":"exprimabila","definite-error-unrecognized-form-masculine-plural":"exprimabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exprimabilele"}},{"word":"exprimai","pos":"verb","definitions":["inflection of exprima:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ekspriˈmaj]"},{"word":"exprimam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of exprima"],"pronunciation":"[ekspriˈmam]"},{"word":"exprimare","pos":"noun","definitions":["expression"],"forms":{"plural":"exprimări"}},{"word":"exprimat","pos":"adj","definitions":["expressed"],"pronunciation":"[ekspriˈmat]","forms":{"feminine-singular":"exprimată","masculine-plural":"exprimați","feminine-neuter-plural":"exprimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exprimat","error-unrecognized-form-feminine-indefinite-singular":"exprimată","error-unrecognized-form-indefinite-masculine-plural":"exprimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exprimate","definite-error-unrecognized-form-masculine-neuter-singular":"exprimatul","definite-error-unrecognized-form-feminine-singular":"exprimata","definite-error-unrecognized-form-masculine-plural":"exprimații","definite-error-unrecognized-form-feminine-neuter-plural":"exprimatele"}},{"word":"exprimat","pos":"verb","definitions":["past participle of exprima"],"pronunciation":"[ekspriˈmat]","forms":{"participle-past":"of exprima"}},{"word":"exprime","pos":"verb","definitions":["third-person singular/plural present subjunctive of exprima"],"pronunciation":"[ekˈsprime]"},{"word":"exprimi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of exprima"],"pronunciation":"[ekˈsprimʲ]"},{"word":"expropria","pos":"verb","definitions":["to expropriate"],"forms":{"canonical":"a expropria 1st conjugation","present-singular-third-person":"expropriez","participle-past":"expropriat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expropria","gerund":"expropriind","first-person-indicative-present-singular":"expropriez","indicative-present-second-person-singular":"expropriezi","indicative-present-singular-third-person":"expropriază","first-person-indicative-plural-present":"expropriem","indicative-plural-present-second-person":"expropriați","indicative-plural-present-third-person":"expropriază","first-person-imperfect-indicative-singular":"expropriam","imperfect-indicative-second-person-singular":"expropriai","imperfect-indicative-singular-third-person":"expropria","first-person-imperfect-indicative-plural":"expropriam","imperfect-indicative-plural-second-person":"expropriați","imperfect-indicative-plural-third-person":"expropriau","first-person-indicative-perfect-singular":"expropriai","indicative-perfect-second-person-singular":"expropriași","indicative-perfect-singular-third-person":"exproprie","first-person-indicative-perfect-plural":"expropriarăm","indicative-perfect-plural-second-person":"expropriarăți","indicative-perfect-plural-third-person":"expropriară","first-person-indicative-pluperfect-singular":"expropriasem","indicative-pluperfect-second-person-singular":"expropriaseși","indicative-pluperfect-singular-third-person":"expropriase","first-person-indicative-pluperfect-plural":"expropriaserăm","indicative-pluperfect-plural-second-person":"expropriaserăți","indicative-pluperfect-plural-third-person":"expropriaseră","first-person-present-singular-subjunctive":"să expropriez","present-second-person-singular-subjunctive":"să expropriezi","present-singular-subjunctive-third-person":"să exproprieze","first-person-plural-present-subjunctive":"să expropriem","plural-present-second-person-subjunctive":"să expropriați","plural-present-subjunctive-third-person":"să exproprieze","imperative-second-person-singular":"expropriază","imperative-plural-second-person":"expropriați","imperative-negative-second-person-singular":"nu expropria","imperative-negative-plural-second-person":"nu expropriați"}},{"word":"expropriat","pos":"adj","definitions":["expropriated"],"forms":{"feminine-singular":"expropriată","masculine-plural":"expropriați","feminine-neuter-plural":"expropriate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expropriat","error-unrecognized-form-feminine-indefinite-singular":"expropriată","error-unrecognized-form-indefinite-masculine-plural":"expropriați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expropriate","definite-error-unrecognized-form-masculine-neuter-singular":"expropriatul","definite-error-unrecognized-form-feminine-singular":"expropriata","definite-error-unrecognized-form-masculine-plural":"expropriații","definite-error-unrecognized-form-feminine-neuter-plural":"expropriatele"}},{"word":"expropriată","pos":"noun","definitions":["female equivalent of expropriat"],"forms":{"plural":"expropriate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"expropriată","accusative-definite-nominative-singular":"expropriata","accusative-indefinite-nominative-plural":"expropriate","accusative-definite-nominative-plural":"expropriatele","dative-genitive-indefinite-singular":"expropriate","dative-definite-genitive-singular":"expropriatei","dative-genitive-indefinite-plural":"expropriate","dative-definite-genitive-plural":"expropriatelor","singular-vocative":"expropriată","plural-vocative":"expropriatelor"}},{"word":"expropriație","pos":"noun","definitions":["expropriation"],"forms":{"plural":"expropriații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expropriație","accusative-definite-nominative-singular":"expropriația","accusative-indefinite-nominative-plural":"expropriații","accusative-definite-nominative-plural":"expropriațiile","dative-genitive-indefinite-singular":"expropriații","dative-definite-genitive-singular":"expropriației","dative-genitive-indefinite-plural":"expropriații","dative-definite-genitive-plural":"expropriațiilor","singular-vocative":"expropriație","plural-vocative":"expropriațiilor"}},{"word":"expropriatoare","pos":"noun","definitions":["female equivalent of expropriator"],"forms":{"plural":"expropriatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"expropriatoare","accusative-definite-nominative-singular":"expropriatoarea","accusative-indefinite-nominative-plural":"expropriatoare","accusative-definite-nominative-plural":"expropriatoarele","dative-genitive-indefinite-singular":"expropriatoare","dative-definite-genitive-singular":"expropriatoarei","dative-genitive-indefinite-plural":"expropriatoare","dative-definite-genitive-plural":"expropriatoarelor","singular-vocative":"expropriatoare","plural-vocative":"expropriatoarelor"}},{"word":"expropriator","pos":"noun","definitions":["expropriator"],"forms":{"plural":"expropriatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"expropriator","accusative-definite-nominative-singular":"expropriatorul","accusative-indefinite-nominative-plural":"expropriatori","accusative-definite-nominative-plural":"expropriatorii","dative-genitive-indefinite-singular":"expropriator","dative-definite-genitive-singular":"expropriatorului","dative-genitive-indefinite-plural":"expropriatori","dative-definite-genitive-plural":"expropriatorilor","singular-vocative":"expropriatorule","plural-vocative":"expropriatorilor"}},{"word":"expropriere","pos":"noun","definitions":["expropriation"],"forms":{"plural":"exproprieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expropriere","accusative-definite-nominative-singular":"exproprierea","accusative-indefinite-nominative-plural":"exproprieri","accusative-definite-nominative-plural":"exproprierile","dative-genitive-indefinite-singular":"exproprieri","dative-definite-genitive-singular":"exproprierii","dative-genitive-indefinite-plural":"exproprieri","dative-definite-genitive-plural":"exproprierilor","singular-vocative":"expropriere","plural-vocative":"exproprierilor"}},{"word":"expui","pos":"verb","definitions":["second-person singular present indicative/subjunctive of expune"],"pronunciation":"[eksˈpuj]"},{"word":"expulsa","pos":"verb","definitions":["obsolete form of expulza"],"forms":{"canonical":"a expulsa 1st conjugation","present-singular-third-person":"expulsează","participle-past":"expulsat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expulsa","gerund":"expulsând","first-person-indicative-present-singular":"expulsez","indicative-present-second-person-singular":"expulsezi","indicative-present-singular-third-person":"expulsează","first-person-indicative-plural-present":"expulsăm","indicative-plural-present-second-person":"expulsați","indicative-plural-present-third-person":"expulsează","first-person-imperfect-indicative-singular":"expulsam","imperfect-indicative-second-person-singular":"expulsai","imperfect-indicative-singular-third-person":"expulsa","first-person-imperfect-indicative-plural":"expulsam","imperfect-indicative-plural-second-person":"expulsați","imperfect-indicative-plural-third-person":"expulsau","first-person-indicative-perfect-singular":"expulsai","indicative-perfect-second-person-singular":"expulsași","indicative-perfect-singular-third-person":"expulsă","first-person-indicative-perfect-plural":"expulsarăm","indicative-perfect-plural-second-person":"expulsarăți","indicative-perfect-plural-third-person":"expulsară","first-person-indicative-pluperfect-singular":"expulsasem","indicative-pluperfect-second-person-singular":"expulsaseși","indicative-pluperfect-singular-third-person":"expulsase","first-person-indicative-pluperfect-plural":"expulsaserăm","indicative-pluperfect-plural-second-person":"expulsaserăți","indicative-pluperfect-plural-third-person":"expulsaseră","first-person-present-singular-subjunctive":"să expulsez","present-second-person-singular-subjunctive":"să expulsezi","present-singular-subjunctive-third-person":"să expulseze","first-person-plural-present-subjunctive":"să expulsăm","plural-present-second-person-subjunctive":"să expulsați","plural-present-subjunctive-third-person":"să expulseze","imperative-second-person-singular":"expulsează","imperative-plural-second-person":"expulsați","imperative-negative-second-person-singular":"nu expulsa","imperative-negative-plural-second-person":"nu expulsați"}},{"word":"expulsie","pos":"noun","definitions":["expulsion"],"forms":{"plural":"expulsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expulsie","accusative-definite-nominative-singular":"expulsia","accusative-indefinite-nominative-plural":"expulsii","accusative-definite-nominative-plural":"expulsiile","dative-genitive-indefinite-singular":"expulsii","dative-definite-genitive-singular":"expulsiei","dative-genitive-indefinite-plural":"expulsii","dative-definite-genitive-plural":"expulsiilor","singular-vocative":"expulsie","plural-vocative":"expulsiilor"}},{"word":"expulsiune","pos":"noun","definitions":["obsolete form of expulsie"],"forms":{"plural":"expulsiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expulsiune","accusative-definite-nominative-singular":"expulsiunea","accusative-indefinite-nominative-plural":"expulsiuni","accusative-definite-nominative-plural":"expulsiunile","dative-genitive-indefinite-singular":"expulsiuni","dative-definite-genitive-singular":"expulsiunii","dative-genitive-indefinite-plural":"expulsiuni","dative-definite-genitive-plural":"expulsiunilor","singular-vocative":"expulsiune","plural-vocative":"expulsiunilor"}},{"word":"expulza","pos":"verb","definitions":["to expel"],"forms":{"canonical":"a expulza 1st conjugation","present-singular-third-person":"expulzează","participle-past":"expulzat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a expulza","gerund":"expulzând","first-person-indicative-present-singular":"expulzez","indicative-present-second-person-singular":"expulzezi","indicative-present-singular-third-person":"expulzează","first-person-indicative-plural-present":"expulzăm","indicative-plural-present-second-person":"expulzați","indicative-plural-present-third-person":"expulzează","first-person-imperfect-indicative-singular":"expulzam","imperfect-indicative-second-person-singular":"expulzai","imperfect-indicative-singular-third-person":"expulza","first-person-imperfect-indicative-plural":"expulzam","imperfect-indicative-plural-second-person":"expulzați","imperfect-indicative-plural-third-person":"expulzau","first-person-indicative-perfect-singular":"expulzai","indicative-perfect-second-person-singular":"expulzași","indicative-perfect-singular-third-person":"expulză","first-person-indicative-perfect-plural":"expulzarăm","indicative-perfect-plural-second-person":"expulzarăți","indicative-perfect-plural-third-person":"expulzară","first-person-indicative-pluperfect-singular":"expulzasem","indicative-pluperfect-second-person-singular":"expulzaseși","indicative-pluperfect-singular-third-person":"expulzase","first-person-indicative-pluperfect-plural":"expulzaserăm","indicative-pluperfect-plural-second-person":"expulzaserăți","indicative-pluperfect-plural-third-person":"expulzaseră","first-person-present-singular-subjunctive":"să expulzez","present-second-person-singular-subjunctive":"să expulzezi","present-singular-subjunctive-third-person":"să expulzeze","first-person-plural-present-subjunctive":"să expulzăm","plural-present-second-person-subjunctive":"să expulzați","plural-present-subjunctive-third-person":"să expulzeze","imperative-second-person-singular":"expulzează","imperative-plural-second-person":"expulzați","imperative-negative-second-person-singular":"nu expulza","imperative-negative-plural-second-person":"nu expulzați"}},{"word":"expulzare","pos":"noun","definitions":["expulsion"],"forms":{"plural":"expulzări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expulzare","accusative-definite-nominative-singular":"expulzarea","accusative-indefinite-nominative-plural":"expulzări","accusative-definite-nominative-plural":"expulzările","dative-genitive-indefinite-singular":"expulzări","dative-definite-genitive-singular":"expulzării","dative-genitive-indefinite-plural":"expulzări","dative-definite-genitive-plural":"expulzărilor","singular-vocative":"expulzare","plural-vocative":"expulzărilor"}},{"word":"expulzat","pos":"adj","definitions":["expelled"],"forms":{"feminine-singular":"expulzată","masculine-plural":"expulzați","feminine-neuter-plural":"expulzate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expulzat","error-unrecognized-form-feminine-indefinite-singular":"expulzată","error-unrecognized-form-indefinite-masculine-plural":"expulzați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expulzate","definite-error-unrecognized-form-masculine-neuter-singular":"expulzatul","definite-error-unrecognized-form-feminine-singular":"expulzata","definite-error-unrecognized-form-masculine-plural":"expulzații","definite-error-unrecognized-form-feminine-neuter-plural":"expulzatele"}},{"word":"expulzat","pos":"verb","definitions":["past participle of expulza"],"forms":{"participle-past":"of expulza"}},{"word":"expulziune","pos":"noun","definitions":["obsolete form of expulsie"],"forms":{"plural":"expulziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expulziune","accusative-definite-nominative-singular":"expulziunea","accusative-indefinite-nominative-plural":"expulziuni","accusative-definite-nominative-plural":"expulziunile","dative-genitive-indefinite-singular":"expulziuni","dative-definite-genitive-singular":"expulziunii","dative-genitive-indefinite-plural":"expulziuni","dative-definite-genitive-plural":"expulziunilor","singular-vocative":"expulziune","plural-vocative":"expulziunilor"}},{"word":"expuncțiune","pos":"noun","definitions":["expunction"],"forms":{"plural":"expuncțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expuncțiune","accusative-definite-nominative-singular":"expuncțiunea","accusative-indefinite-nominative-plural":"expuncțiuni","accusative-definite-nominative-plural":"expuncțiunile","dative-genitive-indefinite-singular":"expuncțiuni","dative-definite-genitive-singular":"expuncțiunii","dative-genitive-indefinite-plural":"expuncțiuni","dative-definite-genitive-plural":"expuncțiunilor","singular-vocative":"expuncțiune","plural-vocative":"expuncțiunilor"}},{"word":"expune","pos":"verb","definitions":["to exhibit, to lay out, to expose, to make known","to expose to a risk, to incur a risk","to expose (film)"],"pronunciation":"[eksˈpune]","forms":{"canonical":"a expune 3rd conjugation","present-singular-third-person":"expune","participle-past":"expus","subjunctive-third-person":"expună","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a expune","gerund":"expunând","first-person-indicative-present-singular":"expun","indicative-present-second-person-singular":"expui","indicative-present-singular-third-person":"expune","first-person-indicative-plural-present":"expunem","indicative-plural-present-second-person":"expuneți","indicative-plural-present-third-person":"expun","first-person-imperfect-indicative-singular":"expuneam","imperfect-indicative-second-person-singular":"expuneai","imperfect-indicative-singular-third-person":"expunea","first-person-imperfect-indicative-plural":"expuneam","imperfect-indicative-plural-second-person":"expuneați","imperfect-indicative-plural-third-person":"expuneau","first-person-indicative-perfect-singular":"expusei","indicative-perfect-second-person-singular":"expuseși","indicative-perfect-singular-third-person":"expuse","first-person-indicative-perfect-plural":"expuserăm","indicative-perfect-plural-second-person":"expuserăți","indicative-perfect-plural-third-person":"expuseră","first-person-indicative-pluperfect-singular":"expusesem","indicative-pluperfect-second-person-singular":"expuseseși","indicative-pluperfect-singular-third-person":"expusese","first-person-indicative-pluperfect-plural":"expuseserăm","indicative-pluperfect-plural-second-person":"expuseserăți","indicative-pluperfect-plural-third-person":"expuseseră","first-person-present-singular-subjunctive":"să expun","present-second-person-singular-subjunctive":"să expui","present-singular-subjunctive-third-person":"să expună","first-person-plural-present-subjunctive":"să expunem","plural-present-second-person-subjunctive":"să expuneți","plural-present-subjunctive-third-person":"să expună","imperative-second-person-singular":"expune","imperative-plural-second-person":"expuneți","imperative-negative-second-person-singular":"nu expune","imperative-negative-plural-second-person":"nu expuneți"}},{"word":"expune","pos":"verb","definitions":["inflection of expune:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[eksˈpune]"},{"word":"expunere","pos":"noun","definitions":["exposure"],"forms":{"plural":"expuneri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expunere","accusative-definite-nominative-singular":"expunerea","accusative-indefinite-nominative-plural":"expuneri","accusative-definite-nominative-plural":"expunerile","dative-genitive-indefinite-singular":"expuneri","dative-definite-genitive-singular":"expunerii","dative-genitive-indefinite-plural":"expuneri","dative-definite-genitive-plural":"expunerilor","singular-vocative":"expunere","plural-vocative":"expunerilor"}},{"word":"expurga","pos":"verb","definitions":["to expurge"],"forms":{"canonical":"a expurga 1st conjugation","present-singular-third-person":"expurgă","participle-past":"expurgat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a expurga","gerund":"expurgând","first-person-indicative-present-singular":"expurg","indicative-present-second-person-singular":"expurgi","indicative-present-singular-third-person":"expurgă","first-person-indicative-plural-present":"expurgăm","indicative-plural-present-second-person":"expurgați","indicative-plural-present-third-person":"expurgă","first-person-imperfect-indicative-singular":"expurgam","imperfect-indicative-second-person-singular":"expurgai","imperfect-indicative-singular-third-person":"expurga","first-person-imperfect-indicative-plural":"expurgam","imperfect-indicative-plural-second-person":"expurgați","imperfect-indicative-plural-third-person":"expurgau","first-person-indicative-perfect-singular":"expurgai","indicative-perfect-second-person-singular":"expurgași","indicative-perfect-singular-third-person":"expurgă","first-person-indicative-perfect-plural":"expurgarăm","indicative-perfect-plural-second-person":"expurgarăți","indicative-perfect-plural-third-person":"expurgară","first-person-indicative-pluperfect-singular":"expurgasem","indicative-pluperfect-second-person-singular":"expurgaseși","indicative-pluperfect-singular-third-person":"expurgase","first-person-indicative-pluperfect-plural":"expurgaserăm","indicative-pluperfect-plural-second-person":"expurgaserăți","indicative-pluperfect-plural-third-person":"expurgaseră","first-person-present-singular-subjunctive":"să expurg","present-second-person-singular-subjunctive":"să expurgi","present-singular-subjunctive-third-person":"să expurge","first-person-plural-present-subjunctive":"să expurgăm","plural-present-second-person-subjunctive":"să expurgați","plural-present-subjunctive-third-person":"să expurge","imperative-second-person-singular":"expurgă","imperative-plural-second-person":"expurgați","imperative-negative-second-person-singular":"nu expurga","imperative-negative-plural-second-person":"nu expurgați"}},{"word":"expurgare","pos":"noun","definitions":["expurgation"],"forms":{"plural":"expurgări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"expurgare","accusative-definite-nominative-singular":"expurgarea","accusative-indefinite-nominative-plural":"expurgări","accusative-definite-nominative-plural":"expurgările","dative-genitive-indefinite-singular":"expurgări","dative-definite-genitive-singular":"expurgării","dative-genitive-indefinite-plural":"expurgări","dative-definite-genitive-plural":"expurgărilor","singular-vocative":"expurgare","plural-vocative":"expurgărilor"}},{"word":"expurgat","pos":"adj","definitions":["expurgated"],"forms":{"feminine-singular":"expurgată","masculine-plural":"expurgați","feminine-neuter-plural":"expurgate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expurgat","error-unrecognized-form-feminine-indefinite-singular":"expurgată","error-unrecognized-form-indefinite-masculine-plural":"expurgați","error-unrecognized-form-feminine-indefinite-neuter-plural":"expurgate","definite-error-unrecognized-form-masculine-neuter-singular":"expurgatul","definite-error-unrecognized-form-feminine-singular":"expurgata","definite-error-unrecognized-form-masculine-plural":"expurgații","definite-error-unrecognized-form-feminine-neuter-plural":"expurgatele"}},{"word":"expurgat","pos":"verb","definitions":["past participle of expurga"],"forms":{"participle-past":"of expurga"}},{"word":"expurgație","pos":"noun","definitions":["expurgation"],"forms":{"plural":"expurgații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"expurgație","accusative-definite-nominative-singular":"expurgația","accusative-indefinite-nominative-plural":"expurgații","accusative-definite-nominative-plural":"expurgațiile","dative-genitive-indefinite-singular":"expurgații","dative-definite-genitive-singular":"expurgației","dative-genitive-indefinite-plural":"expurgații","dative-definite-genitive-plural":"expurgațiilor","singular-vocative":"expurgație","plural-vocative":"expurgațiilor"}},{"word":"expus","pos":"adj","definitions":["exposed"],"forms":{"feminine-singular":"expusă","masculine-plural":"expuși","feminine-neuter-plural":"expuse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"expus","error-unrecognized-form-feminine-indefinite-singular":"expusă","error-unrecognized-form-indefinite-masculine-plural":"expuși","error-unrecognized-form-feminine-indefinite-neuter-plural":"expuse","definite-error-unrecognized-form-masculine-neuter-singular":"expusul","definite-error-unrecognized-form-feminine-singular":"expusa","definite-error-unrecognized-form-masculine-plural":"expușii","definite-error-unrecognized-form-feminine-neuter-plural":"expusele"}},{"word":"exsanguinotransfuzie","pos":"noun","definitions":["alternative form of exsangvinotransfuzie"],"forms":{"plural":"exsanguinotransfuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exsanguinotransfuzie","accusative-definite-nominative-singular":"exsanguinotransfuzia","accusative-indefinite-nominative-plural":"exsanguinotransfuzii","accusative-definite-nominative-plural":"exsanguinotransfuziile","dative-genitive-indefinite-singular":"exsanguinotransfuzii","dative-definite-genitive-singular":"exsanguinotransfuziei","dative-genitive-indefinite-plural":"exsanguinotransfuzii","dative-definite-genitive-plural":"exsanguinotransfuziilor","singular-vocative":"exsanguinotransfuzie","plural-vocative":"exsanguinotransfuziilor"}},{"word":"exsanguu","pos":"adj","definitions":["exsanguine"],"forms":{"feminine-singular":"exsanguă","masculine-plural":"exsangui","feminine-neuter-plural":"exsangue","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exsanguu","error-unrecognized-form-feminine-indefinite-singular":"exsanguă","error-unrecognized-form-indefinite-masculine-plural":"exsangui","error-unrecognized-form-feminine-indefinite-neuter-plural":"exsangue","definite-error-unrecognized-form-masculine-neuter-singular":"exsanguul","definite-error-unrecognized-form-feminine-singular":"exsangua","definite-error-unrecognized-form-masculine-plural":"exsanguii","definite-error-unrecognized-form-feminine-neuter-plural":"exsanguele"}},{"word":"exsangvinotransfuzie","pos":"noun","definitions":["exchange transfusion"],"forms":{"plural":"exsangvinotransfuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exsangvinotransfuzie","accusative-definite-nominative-singular":"exsangvinotransfuzia","accusative-indefinite-nominative-plural":"exsangvinotransfuzii","accusative-definite-nominative-plural":"exsangvinotransfuziile","dative-genitive-indefinite-singular":"exsangvinotransfuzii","dative-definite-genitive-singular":"exsangvinotransfuziei","dative-genitive-indefinite-plural":"exsangvinotransfuzii","dative-definite-genitive-plural":"exsangvinotransfuziilor","singular-vocative":"exsangvinotransfuzie","plural-vocative":"exsangvinotransfuziilor","alternative":"exsanguinotransfuzie"}},{"word":"exsicator","pos":"noun","definitions":["desiccator"],"forms":{"plural":"exsicatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exsicator","accusative-definite-nominative-singular":"exsicatorul","accusative-indefinite-nominative-plural":"exsicatoare","accusative-definite-nominative-plural":"exsicatoarele","dative-genitive-indefinite-singular":"exsicator","dative-definite-genitive-singular":"exsicatorului","dative-genitive-indefinite-plural":"exsicatoare","dative-definite-genitive-plural":"exsicatoarelor","singular-vocative":"exsicatorule","plural-vocative":"exsicatoarelor"}},{"word":"exsudant","pos":"adj","definitions":["exuding"],"forms":{"feminine-singular":"exsudantă","masculine-plural":"exsudanți","feminine-neuter-plural":"exsudante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exsudant","error-unrecognized-form-feminine-indefinite-singular":"exsudantă","error-unrecognized-form-indefinite-masculine-plural":"exsudanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exsudante","definite-error-unrecognized-form-masculine-neuter-singular":"exsudantul","definite-error-unrecognized-form-feminine-singular":"exsudanta","definite-error-unrecognized-form-masculine-plural":"exsudanții","definite-error-unrecognized-form-feminine-neuter-plural":"exsudantele"}},{"word":"exsudat","pos":"noun","definitions":["exudate"],"forms":{"plural":"exsudate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exsudat","accusative-definite-nominative-singular":"exsudatul","accusative-indefinite-nominative-plural":"exsudate","accusative-definite-nominative-plural":"exsudatele","dative-genitive-indefinite-singular":"exsudat","dative-definite-genitive-singular":"exsudatului","dative-genitive-indefinite-plural":"exsudate","dative-definite-genitive-plural":"exsudatelor","singular-vocative":"exsudatule","plural-vocative":"exsudatelor"}},{"word":"exsudație","pos":"noun","definitions":["exudation"],"forms":{"plural":"exsudații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exsudație","accusative-definite-nominative-singular":"exsudația","accusative-indefinite-nominative-plural":"exsudații","accusative-definite-nominative-plural":"exsudațiile","dative-genitive-indefinite-singular":"exsudații","dative-definite-genitive-singular":"exsudației","dative-genitive-indefinite-plural":"exsudații","dative-definite-genitive-plural":"exsudațiilor","singular-vocative":"exsudație","plural-vocative":"exsudațiilor"}},{"word":"extatic","pos":"adj","definitions":["ecstatic"],"forms":{"feminine-singular":"extatică","masculine-plural":"extatici","feminine-neuter-plural":"extatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extatic","error-unrecognized-form-feminine-indefinite-singular":"extatică","error-unrecognized-form-indefinite-masculine-plural":"extatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"extatice","definite-error-unrecognized-form-masculine-neuter-singular":"extaticul","definite-error-unrecognized-form-feminine-singular":"extatica","definite-error-unrecognized-form-masculine-plural":"extaticii","definite-error-unrecognized-form-feminine-neuter-plural":"extaticele"}},{"word":"extaz","pos":"noun","definitions":["ecstasy (intense pleasure)"],"forms":{"plural":"extaze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extaz","accusative-definite-nominative-singular":"extazul","accusative-indefinite-nominative-plural":"extaze","accusative-definite-nominative-plural":"extazele","dative-genitive-indefinite-singular":"extaz","dative-definite-genitive-singular":"extazului","dative-genitive-indefinite-plural":"extaze","dative-definite-genitive-plural":"extazelor","singular-vocative":"extazule","plural-vocative":"extazelor"}},{"word":"extazia","pos":"verb","definitions":["to be in ecstasy"],"forms":{"canonical":"a extazia 1st conjugation","present-singular-third-person":"extaziează","participle-past":"extaziat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a extazia","gerund":"extaziind","first-person-indicative-present-singular":"extaziez","indicative-present-second-person-singular":"extaziezi","indicative-present-singular-third-person":"extaziază","first-person-indicative-plural-present":"extaziem","indicative-plural-present-second-person":"extaziați","indicative-plural-present-third-person":"extaziază","first-person-imperfect-indicative-singular":"extaziam","imperfect-indicative-second-person-singular":"extaziai","imperfect-indicative-singular-third-person":"extazia","first-person-imperfect-indicative-plural":"extaziam","imperfect-indicative-plural-second-person":"extaziați","imperfect-indicative-plural-third-person":"extaziau","first-person-indicative-perfect-singular":"extaziai","indicative-perfect-second-person-singular":"extaziași","indicative-perfect-singular-third-person":"extazie","first-person-indicative-perfect-plural":"extaziarăm","indicative-perfect-plural-second-person":"extaziarăți","indicative-perfect-plural-third-person":"extaziară","first-person-indicative-pluperfect-singular":"extaziasem","indicative-pluperfect-second-person-singular":"extaziaseși","indicative-pluperfect-singular-third-person":"extaziase","first-person-indicative-pluperfect-plural":"extaziaserăm","indicative-pluperfect-plural-second-person":"extaziaserăți","indicative-pluperfect-plural-third-person":"extaziaseră","first-person-present-singular-subjunctive":"să extaziez","present-second-person-singular-subjunctive":"să extaziezi","present-singular-subjunctive-third-person":"să extazieze","first-person-plural-present-subjunctive":"să extaziem","plural-present-second-person-subjunctive":"să extaziați","plural-present-subjunctive-third-person":"să extazieze","imperative-second-person-singular":"extaziază","imperative-plural-second-person":"extaziați","imperative-negative-second-person-singular":"nu extazia","imperative-negative-plural-second-person":"nu extaziați"}},{"word":"extaziat","pos":"adj","definitions":["ecstatic"],"forms":{"feminine-singular":"extaziată","masculine-plural":"extaziați","feminine-neuter-plural":"extaziate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extaziat","error-unrecognized-form-feminine-indefinite-singular":"extaziată","error-unrecognized-form-indefinite-masculine-plural":"extaziați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extaziate","definite-error-unrecognized-form-masculine-neuter-singular":"extaziatul","definite-error-unrecognized-form-feminine-singular":"extaziata","definite-error-unrecognized-form-masculine-plural":"extaziații","definite-error-unrecognized-form-feminine-neuter-plural":"extaziatele"}},{"word":"extaziere","pos":"noun","definitions":["ecstasying"],"forms":{"plural":"extazieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extaziere","accusative-definite-nominative-singular":"extazierea","accusative-indefinite-nominative-plural":"extazieri","accusative-definite-nominative-plural":"extazierile","dative-genitive-indefinite-singular":"extazieri","dative-definite-genitive-singular":"extazierii","dative-genitive-indefinite-plural":"extazieri","dative-definite-genitive-plural":"extazierilor","singular-vocative":"extaziere","plural-vocative":"extazierilor"}},{"word":"extemporal","pos":"noun","definitions":["unannounced test"],"forms":{"plural":"extemporale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extemporal","accusative-definite-nominative-singular":"extemporalul","accusative-indefinite-nominative-plural":"extemporale","accusative-definite-nominative-plural":"extemporalele","dative-genitive-indefinite-singular":"extemporal","dative-definite-genitive-singular":"extemporalului","dative-genitive-indefinite-plural":"extemporale","dative-definite-genitive-plural":"extemporalelor","singular-vocative":"extemporalule","plural-vocative":"extemporalelor"}},{"word":"extemporaneu","pos":"adj","definitions":["extemporaneous"],"forms":{"feminine-singular":"extemporanee","masculine-plural":"extemporanei","feminine-neuter-plural":"extemporanee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extemporaneu","error-unrecognized-form-feminine-indefinite-singular":"extemporanee","error-unrecognized-form-indefinite-masculine-plural":"extemporanei","error-unrecognized-form-feminine-indefinite-neuter-plural":"extemporanee","definite-error-unrecognized-form-masculine-neuter-singular":"extemporaneul","definite-error-unrecognized-form-feminine-singular":"extemporaneea","definite-error-unrecognized-form-masculine-plural":"extemporaneii","definite-error-unrecognized-form-feminine-neuter-plural":"extemporaneele"}},{"word":"extensibil","pos":"adj","definitions":["extensible"],"forms":{"feminine-singular":"extensibilă","masculine-plural":"extensibili","feminine-neuter-plural":"extensibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extensibil","error-unrecognized-form-feminine-indefinite-singular":"extensibilă","error-unrecognized-form-indefinite-masculine-plural":"extensibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"extensibile","definite-error-unrecognized-form-masculine-neuter-singular":"extensibilul","definite-error-unrecognized-form-feminine-singular":"extensibila","definite-error-unrecognized-form-masculine-plural":"extensibilii","definite-error-unrecognized-form-feminine-neuter-plural":"extensibilele"}},{"word":"extensibilitate","pos":"noun","definitions":["extensibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extensibilitate","accusative-definite-nominative-singular":"extensibilitatea","accusative-indefinite-nominative-plural":"extensibilități","accusative-definite-nominative-plural":"extensibilitățile","dative-genitive-indefinite-singular":"extensibilități","dative-definite-genitive-singular":"extensibilității","dative-genitive-indefinite-plural":"extensibilități","dative-definite-genitive-plural":"extensibilităților","singular-vocative":"extensibilitate","plural-vocative":"extensibilităților"}},{"word":"extensie","pos":"noun","definitions":["alternative form of extensiune","extension number"],"forms":{"plural":"extensii"}},{"word":"extensiune","pos":"noun","definitions":["extension"],"forms":{"plural":"extensiuni","alternative":"extensie"}},{"word":"extensiv","pos":"adj","definitions":["extensive"],"forms":{"feminine-singular":"extensivă","masculine-plural":"extensivi","feminine-neuter-plural":"extensive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extensiv","error-unrecognized-form-feminine-indefinite-singular":"extensivă","error-unrecognized-form-indefinite-masculine-plural":"extensivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"extensive","definite-error-unrecognized-form-masculine-neuter-singular":"extensivul","definite-error-unrecognized-form-feminine-singular":"extensiva","definite-error-unrecognized-form-masculine-plural":"extensivii","definite-error-unrecognized-form-feminine-neuter-plural":"extensivele"}},{"word":"extensograf","pos":"noun","definitions":["extensograph"],"forms":{"plural":"extensografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extensograf","accusative-definite-nominative-singular":"extensograful","accusative-indefinite-nominative-plural":"extensografe","accusative-definite-nominative-plural":"extensografele","dative-genitive-indefinite-singular":"extensograf","dative-definite-genitive-singular":"extensografului","dative-genitive-indefinite-plural":"extensografe","dative-definite-genitive-plural":"extensografelor","singular-vocative":"extensografule","plural-vocative":"extensografelor"}},{"word":"extensor","pos":"noun","definitions":["extensor"],"forms":{"plural":"extensori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extensor","accusative-definite-nominative-singular":"extensorul","accusative-indefinite-nominative-plural":"extensori","accusative-definite-nominative-plural":"extensorile","dative-genitive-indefinite-singular":"extensor","dative-definite-genitive-singular":"extensorului","dative-genitive-indefinite-plural":"extensori","dative-definite-genitive-plural":"extensorilor","singular-vocative":"extensorule","plural-vocative":"extensorilor"}},{"word":"extenua","pos":"verb","definitions":["to exhaust or tire (oneself) wear out","to extenuate; to waste"],"forms":{"canonical":"a extenua 1st conjugation","present-singular-third-person":"extenuează","participle-past":"extenuat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a extenua","gerund":"extenuând","first-person-indicative-present-singular":"extenuez","indicative-present-second-person-singular":"extenuezi","indicative-present-singular-third-person":"extenuează","first-person-indicative-plural-present":"extenuăm","indicative-plural-present-second-person":"extenuați","indicative-plural-present-third-person":"extenuează","first-person-imperfect-indicative-singular":"extenuam","imperfect-indicative-second-person-singular":"extenuai","imperfect-indicative-singular-third-person":"extenua","first-person-imperfect-indicative-plural":"extenuam","imperfect-indicative-plural-second-person":"extenuați","imperfect-indicative-plural-third-person":"extenuau","first-person-indicative-perfect-singular":"extenuai","indicative-perfect-second-person-singular":"extenuași","indicative-perfect-singular-third-person":"extenuă","first-person-indicative-perfect-plural":"extenuarăm","indicative-perfect-plural-second-person":"extenuarăți","indicative-perfect-plural-third-person":"extenuară","first-person-indicative-pluperfect-singular":"extenuasem","indicative-pluperfect-second-person-singular":"extenuaseși","indicative-pluperfect-singular-third-person":"extenuase","first-person-indicative-pluperfect-plural":"extenuaserăm","indicative-pluperfect-plural-second-person":"extenuaserăți","indicative-pluperfect-plural-third-person":"extenuaseră","first-person-present-singular-subjunctive":"să extenuez","present-second-person-singular-subjunctive":"să extenuezi","present-singular-subjunctive-third-person":"să extenueze","first-person-plural-present-subjunctive":"să extenuăm","plural-present-second-person-subjunctive":"să extenuați","plural-present-subjunctive-third-person":"să extenueze","imperative-second-person-singular":"extenuează","imperative-plural-second-person":"extenuați","imperative-negative-second-person-singular":"nu extenua","imperative-negative-plural-second-person":"nu extenuați"}},{"word":"extenuant","pos":"adj","definitions":["exhausting"],"forms":{"feminine-singular":"extenuantă","masculine-plural":"extenuanți","feminine-neuter-plural":"extenuante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extenuant","error-unrecognized-form-feminine-indefinite-singular":"extenuantă","error-unrecognized-form-indefinite-masculine-plural":"extenuanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"extenuante","definite-error-unrecognized-form-masculine-neuter-singular":"extenuantul","definite-error-unrecognized-form-feminine-singular":"extenuanta","definite-error-unrecognized-form-masculine-plural":"extenuanții","definite-error-unrecognized-form-feminine-neuter-plural":"extenuantele"}}];
@@ -0,0 +1 @@
+export default [{"word":"extenuare","pos":"noun","definitions":["extenuation"],"forms":{"plural":"extenuări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extenuare","accusative-definite-nominative-singular":"extenuarea","accusative-indefinite-nominative-plural":"extenuări","accusative-definite-nominative-plural":"extenuările","dative-genitive-indefinite-singular":"extenuări","dative-definite-genitive-singular":"extenuării","dative-genitive-indefinite-plural":"extenuări","dative-definite-genitive-plural":"extenuărilor","singular-vocative":"extenuare","plural-vocative":"extenuărilor"}},{"word":"extenuase","pos":"verb","definitions":["third-person singular pluperfect indicative of extenua"],"pronunciation":"[ekstenuˈase]"},{"word":"extenuat","pos":"adj","definitions":["exhausted"],"pronunciation":"[ekstenuˈat]","forms":{"feminine-singular":"extenuată","masculine-plural":"extenuați","feminine-neuter-plural":"extenuate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extenuat","error-unrecognized-form-feminine-indefinite-singular":"extenuată","error-unrecognized-form-indefinite-masculine-plural":"extenuați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extenuate","definite-error-unrecognized-form-masculine-neuter-singular":"extenuatul","definite-error-unrecognized-form-feminine-singular":"extenuata","definite-error-unrecognized-form-masculine-plural":"extenuații","definite-error-unrecognized-form-feminine-neuter-plural":"extenuatele"}},{"word":"extenuat","pos":"verb","definitions":["past participle of extenua"],"pronunciation":"[ekstenuˈat]","forms":{"participle-past":"of extenua"}},{"word":"exterior","pos":"noun","definitions":["exterior"],"pronunciation":"/ˌeks.te.riˈor/","forms":{"plural":"exterioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"exterior","accusative-definite-nominative-singular":"exteriorul","accusative-indefinite-nominative-plural":"exterioare","accusative-definite-nominative-plural":"exterioarele","dative-genitive-indefinite-singular":"exterior","dative-definite-genitive-singular":"exteriorului","dative-genitive-indefinite-plural":"exterioare","dative-definite-genitive-plural":"exterioarelor","singular-vocative":"exteriorule","plural-vocative":"exterioarelor"}},{"word":"exterior","pos":"adj","definitions":["external, outer"],"pronunciation":"/ˌeks.te.riˈor/","forms":{"feminine-singular":"exterioară","masculine-plural":"exteriori","feminine-neuter-plural":"exterioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exterior","error-unrecognized-form-feminine-indefinite-singular":"exterioară","error-unrecognized-form-indefinite-masculine-plural":"exteriori","error-unrecognized-form-feminine-indefinite-neuter-plural":"exterioare","definite-error-unrecognized-form-masculine-neuter-singular":"exteriorul","definite-error-unrecognized-form-feminine-singular":"exterioara","definite-error-unrecognized-form-masculine-plural":"exteriorii","definite-error-unrecognized-form-feminine-neuter-plural":"exterioarele"}},{"word":"exterioritate","pos":"noun","definitions":["exteriority"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exterioritate","accusative-definite-nominative-singular":"exterioritatea","accusative-indefinite-nominative-plural":"exteriorități","accusative-definite-nominative-plural":"exterioritățile","dative-genitive-indefinite-singular":"exteriorități","dative-definite-genitive-singular":"exteriorității","dative-genitive-indefinite-plural":"exteriorități","dative-definite-genitive-plural":"exteriorităților","singular-vocative":"exterioritate","plural-vocative":"exteriorităților"}},{"word":"exterioriza","pos":"verb","definitions":["to exteriorize"],"forms":{"canonical":"a exterioriza 1st conjugation","present-singular-third-person":"exteriorizează","participle-past":"exteriorizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a exterioriza","gerund":"exteriorizând","first-person-indicative-present-singular":"exteriorizez","indicative-present-second-person-singular":"exteriorizezi","indicative-present-singular-third-person":"exteriorizează","first-person-indicative-plural-present":"exteriorizăm","indicative-plural-present-second-person":"exteriorizați","indicative-plural-present-third-person":"exteriorizează","first-person-imperfect-indicative-singular":"exteriorizam","imperfect-indicative-second-person-singular":"exteriorizai","imperfect-indicative-singular-third-person":"exterioriza","first-person-imperfect-indicative-plural":"exteriorizam","imperfect-indicative-plural-second-person":"exteriorizați","imperfect-indicative-plural-third-person":"exteriorizau","first-person-indicative-perfect-singular":"exteriorizai","indicative-perfect-second-person-singular":"exteriorizași","indicative-perfect-singular-third-person":"exterioriză","first-person-indicative-perfect-plural":"exteriorizarăm","indicative-perfect-plural-second-person":"exteriorizarăți","indicative-perfect-plural-third-person":"exteriorizară","first-person-indicative-pluperfect-singular":"exteriorizasem","indicative-pluperfect-second-person-singular":"exteriorizaseși","indicative-pluperfect-singular-third-person":"exteriorizase","first-person-indicative-pluperfect-plural":"exteriorizaserăm","indicative-pluperfect-plural-second-person":"exteriorizaserăți","indicative-pluperfect-plural-third-person":"exteriorizaseră","first-person-present-singular-subjunctive":"să exteriorizez","present-second-person-singular-subjunctive":"să exteriorizezi","present-singular-subjunctive-third-person":"să exteriorizeze","first-person-plural-present-subjunctive":"să exteriorizăm","plural-present-second-person-subjunctive":"să exteriorizați","plural-present-subjunctive-third-person":"să exteriorizeze","imperative-second-person-singular":"exteriorizează","imperative-plural-second-person":"exteriorizați","imperative-negative-second-person-singular":"nu exterioriza","imperative-negative-plural-second-person":"nu exteriorizați"}},{"word":"exteriorizare","pos":"noun","definitions":["exteriorization"],"forms":{"plural":"exteriorizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exteriorizare","accusative-definite-nominative-singular":"exteriorizarea","accusative-indefinite-nominative-plural":"exteriorizări","accusative-definite-nominative-plural":"exteriorizările","dative-genitive-indefinite-singular":"exteriorizări","dative-definite-genitive-singular":"exteriorizării","dative-genitive-indefinite-plural":"exteriorizări","dative-definite-genitive-plural":"exteriorizărilor","singular-vocative":"exteriorizare","plural-vocative":"exteriorizărilor"}},{"word":"exteriorizat","pos":"adj","definitions":["exteriorized"],"forms":{"feminine-singular":"exteriorizată","masculine-plural":"exteriorizați","feminine-neuter-plural":"exteriorizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exteriorizat","error-unrecognized-form-feminine-indefinite-singular":"exteriorizată","error-unrecognized-form-indefinite-masculine-plural":"exteriorizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exteriorizate","definite-error-unrecognized-form-masculine-neuter-singular":"exteriorizatul","definite-error-unrecognized-form-feminine-singular":"exteriorizata","definite-error-unrecognized-form-masculine-plural":"exteriorizații","definite-error-unrecognized-form-feminine-neuter-plural":"exteriorizatele"}},{"word":"exteriorizat","pos":"verb","definitions":["past participle of exterioriza"],"forms":{"participle-past":"of exterioriza"}},{"word":"exteritorial","pos":"adj","definitions":["exterritorial"],"forms":{"feminine-singular":"exteritorială","masculine-plural":"exteritoriali","feminine-neuter-plural":"exteritoriale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exteritorial","error-unrecognized-form-feminine-indefinite-singular":"exteritorială","error-unrecognized-form-indefinite-masculine-plural":"exteritoriali","error-unrecognized-form-feminine-indefinite-neuter-plural":"exteritoriale","definite-error-unrecognized-form-masculine-neuter-singular":"exteritorialul","definite-error-unrecognized-form-feminine-singular":"exteritoriala","definite-error-unrecognized-form-masculine-plural":"exteritorialii","definite-error-unrecognized-form-feminine-neuter-plural":"exteritorialele"}},{"word":"exteritorialitate","pos":"noun","definitions":["exterritoriality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exteritorialitate","accusative-definite-nominative-singular":"exteritorialitatea","accusative-indefinite-nominative-plural":"exteritorialități","accusative-definite-nominative-plural":"exteritorialitățile","dative-genitive-indefinite-singular":"exteritorialități","dative-definite-genitive-singular":"exteritorialității","dative-genitive-indefinite-plural":"exteritorialități","dative-definite-genitive-plural":"exteritorialităților","singular-vocative":"exteritorialitate","plural-vocative":"exteritorialităților"}},{"word":"extermina","pos":"verb","definitions":["to exterminate"],"forms":{"canonical":"a extermina 1st conjugation","present-singular-third-person":"extermină","participle-past":"exterminat","subjunctive-third-person":"extermine","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a extermina","gerund":"exterminând","first-person-indicative-present-singular":"extermin","indicative-present-second-person-singular":"extermini","indicative-present-singular-third-person":"extermină","first-person-indicative-plural-present":"exterminăm","indicative-plural-present-second-person":"exterminați","indicative-plural-present-third-person":"extermină","first-person-imperfect-indicative-singular":"exterminam","imperfect-indicative-second-person-singular":"exterminai","imperfect-indicative-singular-third-person":"extermina","first-person-imperfect-indicative-plural":"exterminam","imperfect-indicative-plural-second-person":"exterminați","imperfect-indicative-plural-third-person":"exterminau","first-person-indicative-perfect-singular":"exterminai","indicative-perfect-second-person-singular":"exterminași","indicative-perfect-singular-third-person":"extermină","first-person-indicative-perfect-plural":"exterminarăm","indicative-perfect-plural-second-person":"exterminarăți","indicative-perfect-plural-third-person":"exterminară","first-person-indicative-pluperfect-singular":"exterminasem","indicative-pluperfect-second-person-singular":"exterminaseși","indicative-pluperfect-singular-third-person":"exterminase","first-person-indicative-pluperfect-plural":"exterminaserăm","indicative-pluperfect-plural-second-person":"exterminaserăți","indicative-pluperfect-plural-third-person":"exterminaseră","first-person-present-singular-subjunctive":"să extermin","present-second-person-singular-subjunctive":"să extermini","present-singular-subjunctive-third-person":"să extermine","first-person-plural-present-subjunctive":"să exterminăm","plural-present-second-person-subjunctive":"să exterminați","plural-present-subjunctive-third-person":"să extermine","imperative-second-person-singular":"extermină","imperative-plural-second-person":"exterminați","imperative-negative-second-person-singular":"nu extermina","imperative-negative-plural-second-person":"nu exterminați"}},{"word":"exterminant","pos":"adj","definitions":["exterminating"],"forms":{"feminine-singular":"exterminantă","masculine-plural":"exterminanți","feminine-neuter-plural":"exterminante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exterminant","error-unrecognized-form-feminine-indefinite-singular":"exterminantă","error-unrecognized-form-indefinite-masculine-plural":"exterminanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exterminante","definite-error-unrecognized-form-masculine-neuter-singular":"exterminantul","definite-error-unrecognized-form-feminine-singular":"exterminanta","definite-error-unrecognized-form-masculine-plural":"exterminanții","definite-error-unrecognized-form-feminine-neuter-plural":"exterminantele"}},{"word":"exterminare","pos":"noun","definitions":["extermination"],"forms":{"plural":"exterminări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exterminare","accusative-definite-nominative-singular":"exterminarea","accusative-indefinite-nominative-plural":"exterminări","accusative-definite-nominative-plural":"exterminările","dative-genitive-indefinite-singular":"exterminări","dative-definite-genitive-singular":"exterminării","dative-genitive-indefinite-plural":"exterminări","dative-definite-genitive-plural":"exterminărilor","singular-vocative":"exterminare","plural-vocative":"exterminărilor"}},{"word":"exterminat","pos":"adj","definitions":["exterminated, destroyed"],"forms":{"feminine-singular":"exterminată","masculine-plural":"exterminați","feminine-neuter-plural":"exterminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exterminat","error-unrecognized-form-feminine-indefinite-singular":"exterminată","error-unrecognized-form-indefinite-masculine-plural":"exterminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"exterminate","definite-error-unrecognized-form-masculine-neuter-singular":"exterminatul","definite-error-unrecognized-form-feminine-singular":"exterminata","definite-error-unrecognized-form-masculine-plural":"exterminații","definite-error-unrecognized-form-feminine-neuter-plural":"exterminatele"}},{"word":"exterminațiune","pos":"noun","definitions":["extermination"],"forms":{"plural":"exterminațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exterminațiune","accusative-definite-nominative-singular":"exterminațiunea","accusative-indefinite-nominative-plural":"exterminațiuni","accusative-definite-nominative-plural":"exterminațiunile","dative-genitive-indefinite-singular":"exterminațiuni","dative-definite-genitive-singular":"exterminațiunii","dative-genitive-indefinite-plural":"exterminațiuni","dative-definite-genitive-plural":"exterminațiunilor","singular-vocative":"exterminațiune","plural-vocative":"exterminațiunilor"}},{"word":"exterminatoare","pos":"noun","definitions":["female equivalent of exterminator"],"forms":{"plural":"exterminatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"exterminatoare","accusative-definite-nominative-singular":"exterminatoarea","accusative-indefinite-nominative-plural":"exterminatoare","accusative-definite-nominative-plural":"exterminatoarele","dative-genitive-indefinite-singular":"exterminatoare","dative-definite-genitive-singular":"exterminatoarei","dative-genitive-indefinite-plural":"exterminatoare","dative-definite-genitive-plural":"exterminatoarelor","singular-vocative":"exterminatoare","plural-vocative":"exterminatoarelor"}},{"word":"exterminator","pos":"noun","definitions":["exterminator"],"forms":{"plural":"exterminatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exterminator","accusative-definite-nominative-singular":"exterminatorul","accusative-indefinite-nominative-plural":"exterminatori","accusative-definite-nominative-plural":"exterminatorii","dative-genitive-indefinite-singular":"exterminator","dative-definite-genitive-singular":"exterminatorului","dative-genitive-indefinite-plural":"exterminatori","dative-definite-genitive-plural":"exterminatorilor","singular-vocative":"exterminatorule","plural-vocative":"exterminatorilor"}},{"word":"extern","pos":"adj","definitions":["external"],"pronunciation":"[eksˈtern]","forms":{"feminine-singular":"externă","masculine-plural":"externi","feminine-neuter-plural":"externe","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"extern","error-unrecognized-form-feminine-indefinite-singular":"externă","error-unrecognized-form-indefinite-masculine-plural":"externi","error-unrecognized-form-feminine-indefinite-neuter-plural":"externe","definite-error-unrecognized-form-masculine-neuter-singular":"externul","definite-error-unrecognized-form-feminine-singular":"externa","definite-error-unrecognized-form-masculine-plural":"externii","definite-error-unrecognized-form-feminine-neuter-plural":"externele"}},{"word":"externa","pos":"adj","definitions":["nominative/accusative feminine singular of extern"],"pronunciation":"/eksˈter.na/"},{"word":"externa","pos":"verb","definitions":["to discharge (from a hospital)"],"pronunciation":"/eksˈter.na/","forms":{"canonical":"a externa 1st conjugation","present-singular-third-person":"externează","participle-past":"externat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a externa","gerund":"externând","first-person-indicative-present-singular":"externez","indicative-present-second-person-singular":"externezi","indicative-present-singular-third-person":"externează","first-person-indicative-plural-present":"externăm","indicative-plural-present-second-person":"externați","indicative-plural-present-third-person":"externează","first-person-imperfect-indicative-singular":"externam","imperfect-indicative-second-person-singular":"externai","imperfect-indicative-singular-third-person":"externa","first-person-imperfect-indicative-plural":"externam","imperfect-indicative-plural-second-person":"externați","imperfect-indicative-plural-third-person":"externau","first-person-indicative-perfect-singular":"externai","indicative-perfect-second-person-singular":"externași","indicative-perfect-singular-third-person":"externă","first-person-indicative-perfect-plural":"externarăm","indicative-perfect-plural-second-person":"externarăți","indicative-perfect-plural-third-person":"externară","first-person-indicative-pluperfect-singular":"externasem","indicative-pluperfect-second-person-singular":"externaseși","indicative-pluperfect-singular-third-person":"externase","first-person-indicative-pluperfect-plural":"externaserăm","indicative-pluperfect-plural-second-person":"externaserăți","indicative-pluperfect-plural-third-person":"externaseră","first-person-present-singular-subjunctive":"să externez","present-second-person-singular-subjunctive":"să externezi","present-singular-subjunctive-third-person":"să externeze","first-person-plural-present-subjunctive":"să externăm","plural-present-second-person-subjunctive":"să externați","plural-present-subjunctive-third-person":"să externeze","imperative-second-person-singular":"externează","imperative-plural-second-person":"externați","imperative-negative-second-person-singular":"nu externa","imperative-negative-plural-second-person":"nu externați"}},{"word":"externă","pos":"noun","definitions":["female equivalent of extern"],"forms":{"plural":"externe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"externă","accusative-definite-nominative-singular":"externa","accusative-indefinite-nominative-plural":"externe","accusative-definite-nominative-plural":"externele","dative-genitive-indefinite-singular":"externe","dative-definite-genitive-singular":"externei","dative-genitive-indefinite-plural":"externe","dative-definite-genitive-plural":"externelor","singular-vocative":"externă","plural-vocative":"externelor"}},{"word":"externaliza","pos":"verb","definitions":["to outsource"],"pronunciation":"/eks.ter.na.liˈza/","forms":{"canonical":"a externaliza 1st conjugation","present-singular-third-person":"externalizează","participle-past":"externalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a externaliza","gerund":"externalizând","first-person-indicative-present-singular":"externalizez","indicative-present-second-person-singular":"externalizezi","indicative-present-singular-third-person":"externalizează","first-person-indicative-plural-present":"externalizăm","indicative-plural-present-second-person":"externalizați","indicative-plural-present-third-person":"externalizează","first-person-imperfect-indicative-singular":"externalizam","imperfect-indicative-second-person-singular":"externalizai","imperfect-indicative-singular-third-person":"externaliza","first-person-imperfect-indicative-plural":"externalizam","imperfect-indicative-plural-second-person":"externalizați","imperfect-indicative-plural-third-person":"externalizau","first-person-indicative-perfect-singular":"externalizai","indicative-perfect-second-person-singular":"externalizași","indicative-perfect-singular-third-person":"externaliză","first-person-indicative-perfect-plural":"externalizarăm","indicative-perfect-plural-second-person":"externalizarăți","indicative-perfect-plural-third-person":"externalizară","first-person-indicative-pluperfect-singular":"externalizasem","indicative-pluperfect-second-person-singular":"externalizaseși","indicative-pluperfect-singular-third-person":"externalizase","first-person-indicative-pluperfect-plural":"externalizaserăm","indicative-pluperfect-plural-second-person":"externalizaserăți","indicative-pluperfect-plural-third-person":"externalizaseră","first-person-present-singular-subjunctive":"să externalizez","present-second-person-singular-subjunctive":"să externalizezi","present-singular-subjunctive-third-person":"să externalizeze","first-person-plural-present-subjunctive":"să externalizăm","plural-present-second-person-subjunctive":"să externalizați","plural-present-subjunctive-third-person":"să externalizeze","imperative-second-person-singular":"externalizează","imperative-plural-second-person":"externalizați","imperative-negative-second-person-singular":"nu externaliza","imperative-negative-plural-second-person":"nu externalizați"}},{"word":"externare","pos":"noun","definitions":["release, discharge (from a hospital)"],"forms":{"plural":"externări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"externare","accusative-definite-nominative-singular":"externarea","accusative-indefinite-nominative-plural":"externări","accusative-definite-nominative-plural":"externările","dative-genitive-indefinite-singular":"externări","dative-definite-genitive-singular":"externării","dative-genitive-indefinite-plural":"externări","dative-definite-genitive-plural":"externărilor","singular-vocative":"externare","plural-vocative":"externărilor"}},{"word":"externat","pos":"adj","definitions":["discharged"],"forms":{"feminine-singular":"externată","masculine-plural":"externați","feminine-neuter-plural":"externate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"externat","error-unrecognized-form-feminine-indefinite-singular":"externată","error-unrecognized-form-indefinite-masculine-plural":"externați","error-unrecognized-form-feminine-indefinite-neuter-plural":"externate","definite-error-unrecognized-form-masculine-neuter-singular":"externatul","definite-error-unrecognized-form-feminine-singular":"externata","definite-error-unrecognized-form-masculine-plural":"externații","definite-error-unrecognized-form-feminine-neuter-plural":"externatele"}},{"word":"externe","pos":"adj","definitions":["extern feminine nominative/accusative/genitive/dative plural of sonor"]},{"word":"exteroceptiv","pos":"adj","definitions":["exteroceptive"],"forms":{"feminine-singular":"exteroceptivă","masculine-plural":"exteroceptivi","feminine-neuter-plural":"exteroceptive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exteroceptiv","error-unrecognized-form-feminine-indefinite-singular":"exteroceptivă","error-unrecognized-form-indefinite-masculine-plural":"exteroceptivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"exteroceptive","definite-error-unrecognized-form-masculine-neuter-singular":"exteroceptivul","definite-error-unrecognized-form-feminine-singular":"exteroceptiva","definite-error-unrecognized-form-masculine-plural":"exteroceptivii","definite-error-unrecognized-form-feminine-neuter-plural":"exteroceptivele"}},{"word":"exteroceptor","pos":"noun","definitions":["exteroceptor"],"forms":{"plural":"exteroceptori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"exteroceptor","accusative-definite-nominative-singular":"exteroceptorul","accusative-indefinite-nominative-plural":"exteroceptori","accusative-definite-nominative-plural":"exteroceptorii","dative-genitive-indefinite-singular":"exteroceptor","dative-definite-genitive-singular":"exteroceptorului","dative-genitive-indefinite-plural":"exteroceptori","dative-definite-genitive-plural":"exteroceptorilor","singular-vocative":"exteroceptorule","plural-vocative":"exteroceptorilor"}},{"word":"extincție","pos":"noun","definitions":["extinction"],"forms":{"plural":"extincții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extincție","accusative-definite-nominative-singular":"extincția","accusative-indefinite-nominative-plural":"extincții","accusative-definite-nominative-plural":"extincțiile","dative-genitive-indefinite-singular":"extincții","dative-definite-genitive-singular":"extincției","dative-genitive-indefinite-plural":"extincții","dative-definite-genitive-plural":"extincțiilor","singular-vocative":"extincție","plural-vocative":"extincțiilor"}},{"word":"extincțiune","pos":"noun","definitions":["alternative form of extincție"],"forms":{"plural":"extincțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extincțiune","accusative-definite-nominative-singular":"extincțiunea","accusative-indefinite-nominative-plural":"extincțiuni","accusative-definite-nominative-plural":"extincțiunile","dative-genitive-indefinite-singular":"extincțiuni","dative-definite-genitive-singular":"extincțiunii","dative-genitive-indefinite-plural":"extincțiuni","dative-definite-genitive-plural":"extincțiunilor","singular-vocative":"extincțiune","plural-vocative":"extincțiunilor"}},{"word":"extinctiv","pos":"adj","definitions":["extinctive"],"forms":{"feminine-singular":"extinctivă","masculine-plural":"extinctivi","feminine-neuter-plural":"extinctive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extinctiv","error-unrecognized-form-feminine-indefinite-singular":"extinctivă","error-unrecognized-form-indefinite-masculine-plural":"extinctivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"extinctive","definite-error-unrecognized-form-masculine-neuter-singular":"extinctivul","definite-error-unrecognized-form-feminine-singular":"extinctiva","definite-error-unrecognized-form-masculine-plural":"extinctivii","definite-error-unrecognized-form-feminine-neuter-plural":"extinctivele"}},{"word":"extinctor","pos":"noun","definitions":["fire extinguisher"],"forms":{"plural":"extinctoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extinctor","accusative-definite-nominative-singular":"extinctorul","accusative-indefinite-nominative-plural":"extinctoare","accusative-definite-nominative-plural":"extinctoarele","dative-genitive-indefinite-singular":"extinctor","dative-definite-genitive-singular":"extinctorului","dative-genitive-indefinite-plural":"extinctoare","dative-definite-genitive-plural":"extinctoarelor","singular-vocative":"extinctorule","plural-vocative":"extinctoarelor"}},{"word":"extinde","pos":"verb","definitions":["to extend"],"forms":{"canonical":"a extinde 3rd conjugation","present-singular-third-person":"extinde","participle-past":"extins","subjunctive-third-person":"extindă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a extinde","gerund":"extinzând","first-person-indicative-present-singular":"extind","indicative-present-second-person-singular":"extinzi","indicative-present-singular-third-person":"extinde","first-person-indicative-plural-present":"extindem","indicative-plural-present-second-person":"extindeți","indicative-plural-present-third-person":"extind","first-person-imperfect-indicative-singular":"extindeam","imperfect-indicative-second-person-singular":"extindeai","imperfect-indicative-singular-third-person":"extindea","first-person-imperfect-indicative-plural":"extindeam","imperfect-indicative-plural-second-person":"extindeați","imperfect-indicative-plural-third-person":"extindeau","first-person-indicative-perfect-singular":"extinsei","indicative-perfect-second-person-singular":"extinseși","indicative-perfect-singular-third-person":"extinse","first-person-indicative-perfect-plural":"extinserăm","indicative-perfect-plural-second-person":"extinserăți","indicative-perfect-plural-third-person":"extinseră","first-person-indicative-pluperfect-singular":"extinsesem","indicative-pluperfect-second-person-singular":"extinseseși","indicative-pluperfect-singular-third-person":"extinsese","first-person-indicative-pluperfect-plural":"extinseserăm","indicative-pluperfect-plural-second-person":"extinseserăți","indicative-pluperfect-plural-third-person":"extinseseră","first-person-present-singular-subjunctive":"să extind","present-second-person-singular-subjunctive":"să extinzi","present-singular-subjunctive-third-person":"să extindă","first-person-plural-present-subjunctive":"să extindem","plural-present-second-person-subjunctive":"să extindeți","plural-present-subjunctive-third-person":"să extindă","imperative-second-person-singular":"extinde","imperative-plural-second-person":"extindeți","imperative-negative-second-person-singular":"nu extinde","imperative-negative-plural-second-person":"nu extindeți"}},{"word":"extindere","pos":"noun","definitions":["extension (act of extending)"],"forms":{"plural":"extinderi"}},{"word":"extingibil","pos":"adj","definitions":["extinguishable"],"forms":{"feminine-singular":"extingibilă","masculine-plural":"extingibili","feminine-neuter-plural":"extingibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extingibil","error-unrecognized-form-feminine-indefinite-singular":"extingibilă","error-unrecognized-form-indefinite-masculine-plural":"extingibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"extingibile","definite-error-unrecognized-form-masculine-neuter-singular":"extingibilul","definite-error-unrecognized-form-feminine-singular":"extingibila","definite-error-unrecognized-form-masculine-plural":"extingibilii","definite-error-unrecognized-form-feminine-neuter-plural":"extingibilele"}},{"word":"extins","pos":"adj","definitions":["extended"],"forms":{"feminine-singular":"extinsă","masculine-plural":"extinși","feminine-neuter-plural":"extinse","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extins","error-unrecognized-form-feminine-indefinite-singular":"extinsă","error-unrecognized-form-indefinite-masculine-plural":"extinși","error-unrecognized-form-feminine-indefinite-neuter-plural":"extinse","definite-error-unrecognized-form-masculine-neuter-singular":"extinsul","definite-error-unrecognized-form-feminine-singular":"extinsa","definite-error-unrecognized-form-masculine-plural":"extinșii","definite-error-unrecognized-form-feminine-neuter-plural":"extinsele"}},{"word":"extinsă","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of extins"]},{"word":"extirpa","pos":"verb","definitions":["to extirpate"],"forms":{"canonical":"a extirpa 1st conjugation","present-singular-third-person":"extirpă","participle-past":"extirpat","subjunctive-third-person":"extirpe","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a extirpa","gerund":"extirpând","first-person-indicative-present-singular":"extirp","indicative-present-second-person-singular":"extirpi","indicative-present-singular-third-person":"extirpă","first-person-indicative-plural-present":"extirpăm","indicative-plural-present-second-person":"extirpați","indicative-plural-present-third-person":"extirpă","first-person-imperfect-indicative-singular":"extirpam","imperfect-indicative-second-person-singular":"extirpai","imperfect-indicative-singular-third-person":"extirpa","first-person-imperfect-indicative-plural":"extirpam","imperfect-indicative-plural-second-person":"extirpați","imperfect-indicative-plural-third-person":"extirpau","first-person-indicative-perfect-singular":"extirpai","indicative-perfect-second-person-singular":"extirpași","indicative-perfect-singular-third-person":"extirpă","first-person-indicative-perfect-plural":"extirparăm","indicative-perfect-plural-second-person":"extirparăți","indicative-perfect-plural-third-person":"extirpară","first-person-indicative-pluperfect-singular":"extirpasem","indicative-pluperfect-second-person-singular":"extirpaseși","indicative-pluperfect-singular-third-person":"extirpase","first-person-indicative-pluperfect-plural":"extirpaserăm","indicative-pluperfect-plural-second-person":"extirpaserăți","indicative-pluperfect-plural-third-person":"extirpaseră","first-person-present-singular-subjunctive":"să extirp","present-second-person-singular-subjunctive":"să extirpi","present-singular-subjunctive-third-person":"să extirpe","first-person-plural-present-subjunctive":"să extirpăm","plural-present-second-person-subjunctive":"să extirpați","plural-present-subjunctive-third-person":"să extirpe","imperative-second-person-singular":"extirpă","imperative-plural-second-person":"extirpați","imperative-negative-second-person-singular":"nu extirpa","imperative-negative-plural-second-person":"nu extirpați"}},{"word":"extirpabil","pos":"adj","definitions":["removable"],"forms":{"feminine-singular":"extirpabilă","masculine-plural":"extirpabili","feminine-neuter-plural":"extirpabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extirpabil","error-unrecognized-form-feminine-indefinite-singular":"extirpabilă","error-unrecognized-form-indefinite-masculine-plural":"extirpabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"extirpabile","definite-error-unrecognized-form-masculine-neuter-singular":"extirpabilul","definite-error-unrecognized-form-feminine-singular":"extirpabila","definite-error-unrecognized-form-masculine-plural":"extirpabilii","definite-error-unrecognized-form-feminine-neuter-plural":"extirpabilele"}},{"word":"extirpare","pos":"noun","definitions":["extirpation"],"forms":{"plural":"extirpări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extirpare","accusative-definite-nominative-singular":"extirparea","accusative-indefinite-nominative-plural":"extirpări","accusative-definite-nominative-plural":"extirpările","dative-genitive-indefinite-singular":"extirpări","dative-definite-genitive-singular":"extirpării","dative-genitive-indefinite-plural":"extirpări","dative-definite-genitive-plural":"extirpărilor","singular-vocative":"extirpare","plural-vocative":"extirpărilor"}},{"word":"extirpat","pos":"adj","definitions":["extirpated"],"forms":{"feminine-singular":"extirpată","masculine-plural":"extirpați","feminine-neuter-plural":"extirpate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extirpat","error-unrecognized-form-feminine-indefinite-singular":"extirpată","error-unrecognized-form-indefinite-masculine-plural":"extirpați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extirpate","definite-error-unrecognized-form-masculine-neuter-singular":"extirpatul","definite-error-unrecognized-form-feminine-singular":"extirpata","definite-error-unrecognized-form-masculine-plural":"extirpații","definite-error-unrecognized-form-feminine-neuter-plural":"extirpatele"}},{"word":"extirpat","pos":"verb","definitions":["past participle of extirpa"],"forms":{"participle-past":"of extirpa"}},{"word":"extirpație","pos":"noun","definitions":["extirpation"],"forms":{"plural":"extirpații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extirpație","accusative-definite-nominative-singular":"extirpația","accusative-indefinite-nominative-plural":"extirpații","accusative-definite-nominative-plural":"extirpațiile","dative-genitive-indefinite-singular":"extirpații","dative-definite-genitive-singular":"extirpației","dative-genitive-indefinite-plural":"extirpații","dative-definite-genitive-plural":"extirpațiilor","singular-vocative":"extirpație","plural-vocative":"extirpațiilor"}},{"word":"extirpațiune","pos":"noun","definitions":["obsolete form of extirpație"],"forms":{"plural":"extirpațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extirpațiune","accusative-definite-nominative-singular":"extirpațiunea","accusative-indefinite-nominative-plural":"extirpațiuni","accusative-definite-nominative-plural":"extirpațiunile","dative-genitive-indefinite-singular":"extirpațiuni","dative-definite-genitive-singular":"extirpațiunii","dative-genitive-indefinite-plural":"extirpațiuni","dative-definite-genitive-plural":"extirpațiunilor","singular-vocative":"extirpațiune","plural-vocative":"extirpațiunilor"}},{"word":"extirpator","pos":"noun","definitions":["extirpator"],"forms":{"plural":"extirpatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extirpator","accusative-definite-nominative-singular":"extirpatorul","accusative-indefinite-nominative-plural":"extirpatori","accusative-definite-nominative-plural":"extirpatorile","dative-genitive-indefinite-singular":"extirpator","dative-definite-genitive-singular":"extirpatorului","dative-genitive-indefinite-plural":"extirpatori","dative-definite-genitive-plural":"extirpatorilor","singular-vocative":"extirpatorule","plural-vocative":"extirpatorilor"}},{"word":"extispiciu","pos":"noun","definitions":["extispicy"],"forms":{"plural":"extispicii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extispiciu","accusative-definite-nominative-singular":"extispiciul","accusative-indefinite-nominative-plural":"extispicii","accusative-definite-nominative-plural":"extispiciile","dative-genitive-indefinite-singular":"extispiciu","dative-definite-genitive-singular":"extispiciului","dative-genitive-indefinite-plural":"extispicii","dative-definite-genitive-plural":"extispiciilor","singular-vocative":"extispiciule","plural-vocative":"extispiciilor"}},{"word":"extorca","pos":"verb","definitions":["to extort"],"forms":{"canonical":"a extorca 1st conjugation","present-singular-third-person":"extorchează","participle-past":"extorcat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a extorca","gerund":"extorcând","first-person-indicative-present-singular":"extorchez","indicative-present-second-person-singular":"extorchezi","indicative-present-singular-third-person":"extorchează","first-person-indicative-plural-present":"extorcăm","indicative-plural-present-second-person":"extorcați","indicative-plural-present-third-person":"extorchează","first-person-imperfect-indicative-singular":"extorcam","imperfect-indicative-second-person-singular":"extorcai","imperfect-indicative-singular-third-person":"extorca","first-person-imperfect-indicative-plural":"extorcam","imperfect-indicative-plural-second-person":"extorcați","imperfect-indicative-plural-third-person":"extorcau","first-person-indicative-perfect-singular":"extorcai","indicative-perfect-second-person-singular":"extorcași","indicative-perfect-singular-third-person":"extorcă","first-person-indicative-perfect-plural":"extorcarăm","indicative-perfect-plural-second-person":"extorcarăți","indicative-perfect-plural-third-person":"extorcară","first-person-indicative-pluperfect-singular":"extorcasem","indicative-pluperfect-second-person-singular":"extorcaseși","indicative-pluperfect-singular-third-person":"extorcase","first-person-indicative-pluperfect-plural":"extorcaserăm","indicative-pluperfect-plural-second-person":"extorcaserăți","indicative-pluperfect-plural-third-person":"extorcaseră","first-person-present-singular-subjunctive":"să extorchez","present-second-person-singular-subjunctive":"să extorchezi","present-singular-subjunctive-third-person":"să extorcheze","first-person-plural-present-subjunctive":"să extorcăm","plural-present-second-person-subjunctive":"să extorcați","plural-present-subjunctive-third-person":"să extorcheze","imperative-second-person-singular":"extorchează","imperative-plural-second-person":"extorcați","imperative-negative-second-person-singular":"nu extorca","imperative-negative-plural-second-person":"nu extorcați"}},{"word":"extorcare","pos":"noun","definitions":["extortion"],"forms":{"plural":"extorcări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extorcare","accusative-definite-nominative-singular":"extorcarea","accusative-indefinite-nominative-plural":"extorcări","accusative-definite-nominative-plural":"extorcările","dative-genitive-indefinite-singular":"extorcări","dative-definite-genitive-singular":"extorcării","dative-genitive-indefinite-plural":"extorcări","dative-definite-genitive-plural":"extorcărilor","singular-vocative":"extorcare","plural-vocative":"extorcărilor"}},{"word":"extorcat","pos":"adj","definitions":["extorted"],"forms":{"feminine-singular":"extorcată","masculine-plural":"extorcați","feminine-neuter-plural":"extorcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extorcat","error-unrecognized-form-feminine-indefinite-singular":"extorcată","error-unrecognized-form-indefinite-masculine-plural":"extorcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extorcate","definite-error-unrecognized-form-masculine-neuter-singular":"extorcatul","definite-error-unrecognized-form-feminine-singular":"extorcata","definite-error-unrecognized-form-masculine-plural":"extorcații","definite-error-unrecognized-form-feminine-neuter-plural":"extorcatele"}},{"word":"extorcat","pos":"verb","definitions":["past participle of extorca"],"forms":{"participle-past":"of extorca"}},{"word":"extorsiune","pos":"noun","definitions":["extortion"],"forms":{"plural":"extorsiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extorsiune","accusative-definite-nominative-singular":"extorsiunea","accusative-indefinite-nominative-plural":"extorsiuni","accusative-definite-nominative-plural":"extorsiunile","dative-genitive-indefinite-singular":"extorsiuni","dative-definite-genitive-singular":"extorsiunii","dative-genitive-indefinite-plural":"extorsiuni","dative-definite-genitive-plural":"extorsiunilor","singular-vocative":"extorsiune","plural-vocative":"extorsiunilor"}},{"word":"extraatmosferic","pos":"adj","definitions":["extra-atmospheric"],"forms":{"feminine-singular":"extraatmosferică","masculine-plural":"extraatmosferici","feminine-neuter-plural":"extraatmosferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraatmosferic","error-unrecognized-form-feminine-indefinite-singular":"extraatmosferică","error-unrecognized-form-indefinite-masculine-plural":"extraatmosferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraatmosferice","definite-error-unrecognized-form-masculine-neuter-singular":"extraatmosfericul","definite-error-unrecognized-form-feminine-singular":"extraatmosferica","definite-error-unrecognized-form-masculine-plural":"extraatmosfericii","definite-error-unrecognized-form-feminine-neuter-plural":"extraatmosfericele"}},{"word":"extrabugetar","pos":"adj","definitions":["extrabudgetary"],"forms":{"feminine-singular":"extrabugetară","masculine-plural":"extrabugetari","feminine-neuter-plural":"extrabugetare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrabugetar","error-unrecognized-form-feminine-indefinite-singular":"extrabugetară","error-unrecognized-form-indefinite-masculine-plural":"extrabugetari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrabugetare","definite-error-unrecognized-form-masculine-neuter-singular":"extrabugetarul","definite-error-unrecognized-form-feminine-singular":"extrabugetara","definite-error-unrecognized-form-masculine-plural":"extrabugetarii","definite-error-unrecognized-form-feminine-neuter-plural":"extrabugetarele"}},{"word":"extracelular","pos":"adj","definitions":["extracellular"],"forms":{"feminine-singular":"extracelulară","masculine-plural":"extracelulari","feminine-neuter-plural":"extracelulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extracelular","error-unrecognized-form-feminine-indefinite-singular":"extracelulară","error-unrecognized-form-indefinite-masculine-plural":"extracelulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extracelulare","definite-error-unrecognized-form-masculine-neuter-singular":"extracelularul","definite-error-unrecognized-form-feminine-singular":"extracelulara","definite-error-unrecognized-form-masculine-plural":"extracelularii","definite-error-unrecognized-form-feminine-neuter-plural":"extracelularele"}},{"word":"extraconjugal","pos":"adj","definitions":["extramarital"],"forms":{"feminine-singular":"extraconjugală","masculine-plural":"extraconjugali","feminine-neuter-plural":"extraconjugale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraconjugal","error-unrecognized-form-feminine-indefinite-singular":"extraconjugală","error-unrecognized-form-indefinite-masculine-plural":"extraconjugali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraconjugale","definite-error-unrecognized-form-masculine-neuter-singular":"extraconjugalul","definite-error-unrecognized-form-feminine-singular":"extraconjugala","definite-error-unrecognized-form-masculine-plural":"extraconjugalii","definite-error-unrecognized-form-feminine-neuter-plural":"extraconjugalele"}},{"word":"extraconstituțional","pos":"adj","definitions":["extraconstitutional"],"forms":{"feminine-singular":"extraconstituțională","masculine-plural":"extraconstituționali","feminine-neuter-plural":"extraconstituționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraconstituțional","error-unrecognized-form-feminine-indefinite-singular":"extraconstituțională","error-unrecognized-form-indefinite-masculine-plural":"extraconstituționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraconstituționale","definite-error-unrecognized-form-masculine-neuter-singular":"extraconstituționalul","definite-error-unrecognized-form-feminine-singular":"extraconstituționala","definite-error-unrecognized-form-masculine-plural":"extraconstituționalii","definite-error-unrecognized-form-feminine-neuter-plural":"extraconstituționalele"}},{"word":"extracorporal","pos":"adj","definitions":["extracorporeal"],"forms":{"feminine-singular":"extracorporală","masculine-plural":"extracorporali","feminine-neuter-plural":"extracorporale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extracorporal","error-unrecognized-form-feminine-indefinite-singular":"extracorporală","error-unrecognized-form-indefinite-masculine-plural":"extracorporali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extracorporale","definite-error-unrecognized-form-masculine-neuter-singular":"extracorporalul","definite-error-unrecognized-form-feminine-singular":"extracorporala","definite-error-unrecognized-form-masculine-plural":"extracorporalii","definite-error-unrecognized-form-feminine-neuter-plural":"extracorporalele"}},{"word":"extract","pos":"noun","definitions":["extract"],"forms":{"plural":"extracte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extract","accusative-definite-nominative-singular":"extractul","accusative-indefinite-nominative-plural":"extracte","accusative-definite-nominative-plural":"extractele","dative-genitive-indefinite-singular":"extract","dative-definite-genitive-singular":"extractului","dative-genitive-indefinite-plural":"extracte","dative-definite-genitive-plural":"extractelor","singular-vocative":"extractule","plural-vocative":"extractelor"}},{"word":"extracție","pos":"noun","definitions":["extraction"],"forms":{"plural":"extracții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extracție","accusative-definite-nominative-singular":"extracția","accusative-indefinite-nominative-plural":"extracții","accusative-definite-nominative-plural":"extracțiile","dative-genitive-indefinite-singular":"extracții","dative-definite-genitive-singular":"extracției","dative-genitive-indefinite-plural":"extracții","dative-definite-genitive-plural":"extracțiilor","singular-vocative":"extracție","plural-vocative":"extracțiilor"}},{"word":"extracțiune","pos":"noun","definitions":["obsolete form of extracție"],"forms":{"plural":"extracțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extracțiune","accusative-definite-nominative-singular":"extracțiunea","accusative-indefinite-nominative-plural":"extracțiuni","accusative-definite-nominative-plural":"extracțiunile","dative-genitive-indefinite-singular":"extracțiuni","dative-definite-genitive-singular":"extracțiunii","dative-genitive-indefinite-plural":"extracțiuni","dative-definite-genitive-plural":"extracțiunilor","singular-vocative":"extracțiune","plural-vocative":"extracțiunilor"}},{"word":"extractiv","pos":"adj","definitions":["extractive"],"forms":{"feminine-singular":"extractivă","masculine-plural":"extractivi","feminine-neuter-plural":"extractive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extractiv","error-unrecognized-form-feminine-indefinite-singular":"extractivă","error-unrecognized-form-indefinite-masculine-plural":"extractivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"extractive","definite-error-unrecognized-form-masculine-neuter-singular":"extractivul","definite-error-unrecognized-form-feminine-singular":"extractiva","definite-error-unrecognized-form-masculine-plural":"extractivii","definite-error-unrecognized-form-feminine-neuter-plural":"extractivele"}},{"word":"extractor","pos":"noun","definitions":["extractor"],"forms":{"plural":"extractori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extractor","accusative-definite-nominative-singular":"extractorul","accusative-indefinite-nominative-plural":"extractori","accusative-definite-nominative-plural":"extractorile","dative-genitive-indefinite-singular":"extractor","dative-definite-genitive-singular":"extractorului","dative-genitive-indefinite-plural":"extractori","dative-definite-genitive-plural":"extractorilor","singular-vocative":"extractorule","plural-vocative":"extractorilor"}},{"word":"extractori","pos":"noun","definitions":["plural of extractor"]},{"word":"extrăda","pos":"verb","definitions":["to extradite"],"forms":{"canonical":"a extrăda 1st conjugation","present-singular-third-person":"extrădează","participle-past":"extrădat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a extrăda","gerund":"extrădând","first-person-indicative-present-singular":"extrădez","indicative-present-second-person-singular":"extrădezi","indicative-present-singular-third-person":"extrădează","first-person-indicative-plural-present":"extrădăm","indicative-plural-present-second-person":"extrădați","indicative-plural-present-third-person":"extrădează","first-person-imperfect-indicative-singular":"extrădam","imperfect-indicative-second-person-singular":"extrădai","imperfect-indicative-singular-third-person":"extrăda","first-person-imperfect-indicative-plural":"extrădam","imperfect-indicative-plural-second-person":"extrădați","imperfect-indicative-plural-third-person":"extrădau","first-person-indicative-perfect-singular":"extrădai","indicative-perfect-second-person-singular":"extrădași","indicative-perfect-singular-third-person":"extrădă","first-person-indicative-perfect-plural":"extrădarăm","indicative-perfect-plural-second-person":"extrădarăți","indicative-perfect-plural-third-person":"extrădară","first-person-indicative-pluperfect-singular":"extrădasem","indicative-pluperfect-second-person-singular":"extrădaseși","indicative-pluperfect-singular-third-person":"extrădase","first-person-indicative-pluperfect-plural":"extrădaserăm","indicative-pluperfect-plural-second-person":"extrădaserăți","indicative-pluperfect-plural-third-person":"extrădaseră","first-person-present-singular-subjunctive":"să extrădez","present-second-person-singular-subjunctive":"să extrădezi","present-singular-subjunctive-third-person":"să extrădeze","first-person-plural-present-subjunctive":"să extrădăm","plural-present-second-person-subjunctive":"să extrădați","plural-present-subjunctive-third-person":"să extrădeze","imperative-second-person-singular":"extrădează","imperative-plural-second-person":"extrădați","imperative-negative-second-person-singular":"nu extrăda","imperative-negative-plural-second-person":"nu extrădați"}},{"word":"extrădare","pos":"noun","definitions":["extradition"],"forms":{"plural":"extrădări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extrădare","accusative-definite-nominative-singular":"extrădarea","accusative-indefinite-nominative-plural":"extrădări","accusative-definite-nominative-plural":"extrădările","dative-genitive-indefinite-singular":"extrădări","dative-definite-genitive-singular":"extrădării","dative-genitive-indefinite-plural":"extrădări","dative-definite-genitive-plural":"extrădărilor","singular-vocative":"extrădare","plural-vocative":"extrădărilor"}},{"word":"extrădat","pos":"adj","definitions":["extradited"],"forms":{"feminine-singular":"extrădată","masculine-plural":"extrădați","feminine-neuter-plural":"extrădate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrădat","error-unrecognized-form-feminine-indefinite-singular":"extrădată","error-unrecognized-form-indefinite-masculine-plural":"extrădați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrădate","definite-error-unrecognized-form-masculine-neuter-singular":"extrădatul","definite-error-unrecognized-form-feminine-singular":"extrădata","definite-error-unrecognized-form-masculine-plural":"extrădații","definite-error-unrecognized-form-feminine-neuter-plural":"extrădatele"}},{"word":"extrădat","pos":"verb","definitions":["past participle of extrăda"],"forms":{"participle-past":"of extrăda"}},{"word":"extradiție","pos":"noun","definitions":["extradition"],"forms":{"plural":"extradiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extradiție","accusative-definite-nominative-singular":"extradiția","accusative-indefinite-nominative-plural":"extradiții","accusative-definite-nominative-plural":"extradițiile","dative-genitive-indefinite-singular":"extradiții","dative-definite-genitive-singular":"extradiției","dative-genitive-indefinite-plural":"extradiții","dative-definite-genitive-plural":"extradițiilor","singular-vocative":"extradiție","plural-vocative":"extradițiilor"}},{"word":"extrados","pos":"noun","definitions":["extrados"],"forms":{"plural":"extradosuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"extrados","accusative-definite-nominative-singular":"extradosul","accusative-indefinite-nominative-plural":"extradosuri","accusative-definite-nominative-plural":"extradosurile","dative-genitive-indefinite-singular":"extrados","dative-definite-genitive-singular":"extradosului","dative-genitive-indefinite-plural":"extradosuri","dative-definite-genitive-plural":"extradosurilor","singular-vocative":"extradosule","plural-vocative":"extradosurilor"}},{"word":"extradotal","pos":"adj","definitions":["extradotal"],"forms":{"feminine-singular":"extradotală","masculine-plural":"extradotali","feminine-neuter-plural":"extradotale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extradotal","error-unrecognized-form-feminine-indefinite-singular":"extradotală","error-unrecognized-form-indefinite-masculine-plural":"extradotali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extradotale","definite-error-unrecognized-form-masculine-neuter-singular":"extradotalul","definite-error-unrecognized-form-feminine-singular":"extradotala","definite-error-unrecognized-form-masculine-plural":"extradotalii","definite-error-unrecognized-form-feminine-neuter-plural":"extradotalele"}},{"word":"extradur","pos":"adj","definitions":["superhard"],"forms":{"feminine-singular":"extradură","masculine-plural":"extraduri","feminine-neuter-plural":"extradure","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extradur","error-unrecognized-form-feminine-indefinite-singular":"extradură","error-unrecognized-form-indefinite-masculine-plural":"extraduri","error-unrecognized-form-feminine-indefinite-neuter-plural":"extradure","definite-error-unrecognized-form-masculine-neuter-singular":"extradurul","definite-error-unrecognized-form-feminine-singular":"extradura","definite-error-unrecognized-form-masculine-plural":"extradurii","definite-error-unrecognized-form-feminine-neuter-plural":"extradurele"}},{"word":"extrafin","pos":"adj","definitions":["superfine"],"forms":{"feminine-singular":"extrafină","masculine-plural":"extrafini","feminine-neuter-plural":"extrafine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrafin","error-unrecognized-form-feminine-indefinite-singular":"extrafină","error-unrecognized-form-indefinite-masculine-plural":"extrafini","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrafine","definite-error-unrecognized-form-masculine-neuter-singular":"extrafinul","definite-error-unrecognized-form-feminine-singular":"extrafina","definite-error-unrecognized-form-masculine-plural":"extrafinii","definite-error-unrecognized-form-feminine-neuter-plural":"extrafinele"}},{"word":"extragalactic","pos":"adj","definitions":["extragalactic"],"forms":{"feminine-singular":"extragalactică","masculine-plural":"extragalactici","feminine-neuter-plural":"extragalactice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extragalactic","error-unrecognized-form-feminine-indefinite-singular":"extragalactică","error-unrecognized-form-indefinite-masculine-plural":"extragalactici","error-unrecognized-form-feminine-indefinite-neuter-plural":"extragalactice","definite-error-unrecognized-form-masculine-neuter-singular":"extragalacticul","definite-error-unrecognized-form-feminine-singular":"extragalactica","definite-error-unrecognized-form-masculine-plural":"extragalacticii","definite-error-unrecognized-form-feminine-neuter-plural":"extragalacticele"}},{"word":"extrage","pos":"verb","definitions":["to extract"],"forms":{"canonical":"a extrage 3rd conjugation","present-singular-third-person":"extrage","participle-past":"extras","subjunctive-third-person":"extragă","table-tags":"conjugation-3","inflection-template":"ro-conj-e","infinitive":"a extrage","gerund":"extragând","first-person-indicative-present-singular":"extrag","indicative-present-second-person-singular":"extragi","indicative-present-singular-third-person":"extrage","first-person-indicative-plural-present":"extragem","indicative-plural-present-second-person":"extrageți","indicative-plural-present-third-person":"extrag","first-person-imperfect-indicative-singular":"extrageam","imperfect-indicative-second-person-singular":"extrageai","imperfect-indicative-singular-third-person":"extragea","first-person-imperfect-indicative-plural":"extrageam","imperfect-indicative-plural-second-person":"extrageați","imperfect-indicative-plural-third-person":"extrageau","first-person-indicative-perfect-singular":"extrasei","indicative-perfect-second-person-singular":"extraseși","indicative-perfect-singular-third-person":"extrase","first-person-indicative-perfect-plural":"extraserăm","indicative-perfect-plural-second-person":"extraserăți","indicative-perfect-plural-third-person":"extraseră","first-person-indicative-pluperfect-singular":"extrasesem","indicative-pluperfect-second-person-singular":"extraseseși","indicative-pluperfect-singular-third-person":"extrasese","first-person-indicative-pluperfect-plural":"extraseserăm","indicative-pluperfect-plural-second-person":"extraseserăți","indicative-pluperfect-plural-third-person":"extraseseră","first-person-present-singular-subjunctive":"să extrag","present-second-person-singular-subjunctive":"să extragi","present-singular-subjunctive-third-person":"să extragă","first-person-plural-present-subjunctive":"să extragem","plural-present-second-person-subjunctive":"să extrageți","plural-present-subjunctive-third-person":"să extragă","imperative-second-person-singular":"extrage","imperative-plural-second-person":"extrageți","imperative-negative-second-person-singular":"nu extrage","imperative-negative-plural-second-person":"nu extrageți"}},{"word":"extragere","pos":"noun","definitions":["extraction"],"forms":{"plural":"extrageri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extragere","accusative-definite-nominative-singular":"extragerea","accusative-indefinite-nominative-plural":"extrageri","accusative-definite-nominative-plural":"extragerile","dative-genitive-indefinite-singular":"extrageri","dative-definite-genitive-singular":"extragerii","dative-genitive-indefinite-plural":"extrageri","dative-definite-genitive-plural":"extragerilor","singular-vocative":"extragere","plural-vocative":"extragerilor"}},{"word":"extrajudiciar","pos":"adj","definitions":["extrajudicial"],"forms":{"feminine-singular":"extrajudiciară","masculine-plural":"extrajudiciari","feminine-neuter-plural":"extrajudiciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrajudiciar","error-unrecognized-form-feminine-indefinite-singular":"extrajudiciară","error-unrecognized-form-indefinite-masculine-plural":"extrajudiciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrajudiciare","definite-error-unrecognized-form-masculine-neuter-singular":"extrajudiciarul","definite-error-unrecognized-form-feminine-singular":"extrajudiciara","definite-error-unrecognized-form-masculine-plural":"extrajudiciarii","definite-error-unrecognized-form-feminine-neuter-plural":"extrajudiciarele"}},{"word":"extralegal","pos":"adj","definitions":["extralegal"],"forms":{"feminine-singular":"extralegală","masculine-plural":"extralegali","feminine-neuter-plural":"extralegale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extralegal","error-unrecognized-form-feminine-indefinite-singular":"extralegală","error-unrecognized-form-indefinite-masculine-plural":"extralegali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extralegale","definite-error-unrecognized-form-masculine-neuter-singular":"extralegalul","definite-error-unrecognized-form-feminine-singular":"extralegala","definite-error-unrecognized-form-masculine-plural":"extralegalii","definite-error-unrecognized-form-feminine-neuter-plural":"extralegalele"}},{"word":"extralingvistic","pos":"adj","definitions":["extralinguistic"],"forms":{"feminine-singular":"extralingvistică","masculine-plural":"extralingvistici","feminine-neuter-plural":"extralingvistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extralingvistic","error-unrecognized-form-feminine-indefinite-singular":"extralingvistică","error-unrecognized-form-indefinite-masculine-plural":"extralingvistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"extralingvistice","definite-error-unrecognized-form-masculine-neuter-singular":"extralingvisticul","definite-error-unrecognized-form-feminine-singular":"extralingvistica","definite-error-unrecognized-form-masculine-plural":"extralingvisticii","definite-error-unrecognized-form-feminine-neuter-plural":"extralingvisticele"}},{"word":"extramarital","pos":"adj","definitions":["extramarital"],"forms":{"feminine-singular":"extramaritală","masculine-plural":"extramaritali","feminine-neuter-plural":"extramaritale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extramarital","error-unrecognized-form-feminine-indefinite-singular":"extramaritală","error-unrecognized-form-indefinite-masculine-plural":"extramaritali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extramaritale","definite-error-unrecognized-form-masculine-neuter-singular":"extramaritalul","definite-error-unrecognized-form-feminine-singular":"extramaritala","definite-error-unrecognized-form-masculine-plural":"extramaritalii","definite-error-unrecognized-form-feminine-neuter-plural":"extramaritalele"}},{"word":"extraneitate","pos":"noun","definitions":["extraneity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extraneitate","accusative-definite-nominative-singular":"extraneitatea","accusative-indefinite-nominative-plural":"extraneități","accusative-definite-nominative-plural":"extraneitățile","dative-genitive-indefinite-singular":"extraneități","dative-definite-genitive-singular":"extraneității","dative-genitive-indefinite-plural":"extraneități","dative-definite-genitive-plural":"extraneităților","singular-vocative":"extraneitate","plural-vocative":"extraneităților"}},{"word":"extraneu","pos":"adj","definitions":["foreign"],"forms":{"feminine-singular":"extranee","masculine-plural":"extranei","feminine-neuter-plural":"extranee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraneu","error-unrecognized-form-feminine-indefinite-singular":"extranee","error-unrecognized-form-indefinite-masculine-plural":"extranei","error-unrecognized-form-feminine-indefinite-neuter-plural":"extranee","definite-error-unrecognized-form-masculine-neuter-singular":"extraneul","definite-error-unrecognized-form-feminine-singular":"extraneea","definite-error-unrecognized-form-masculine-plural":"extraneii","definite-error-unrecognized-form-feminine-neuter-plural":"extraneele"}},{"word":"extranuclear","pos":"adj","definitions":["extranuclear"],"forms":{"feminine-singular":"extranucleară","masculine-plural":"extranucleari","feminine-neuter-plural":"extranucleare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extranuclear","error-unrecognized-form-feminine-indefinite-singular":"extranucleară","error-unrecognized-form-indefinite-masculine-plural":"extranucleari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extranucleare","definite-error-unrecognized-form-masculine-neuter-singular":"extranuclearul","definite-error-unrecognized-form-feminine-singular":"extranucleara","definite-error-unrecognized-form-masculine-plural":"extranuclearii","definite-error-unrecognized-form-feminine-neuter-plural":"extranuclearele"}},{"word":"extraordinar","pos":"adj","definitions":["extraordinary"],"pronunciation":"/ˌeks.tra.or.diˈnar/","forms":{"feminine-singular":"extraordinară","masculine-plural":"extraordinari","feminine-neuter-plural":"extraordinare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraordinar","error-unrecognized-form-feminine-indefinite-singular":"extraordinară","error-unrecognized-form-indefinite-masculine-plural":"extraordinari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraordinare","definite-error-unrecognized-form-masculine-neuter-singular":"extraordinarul","definite-error-unrecognized-form-feminine-singular":"extraordinara","definite-error-unrecognized-form-masculine-plural":"extraordinarii","definite-error-unrecognized-form-feminine-neuter-plural":"extraordinarele"}},{"word":"extraparlamentar","pos":"adj","definitions":["extraparliamentary"],"forms":{"feminine-singular":"extraparlamentară","masculine-plural":"extraparlamentari","feminine-neuter-plural":"extraparlamentare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraparlamentar","error-unrecognized-form-feminine-indefinite-singular":"extraparlamentară","error-unrecognized-form-indefinite-masculine-plural":"extraparlamentari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraparlamentare","definite-error-unrecognized-form-masculine-neuter-singular":"extraparlamentarul","definite-error-unrecognized-form-feminine-singular":"extraparlamentara","definite-error-unrecognized-form-masculine-plural":"extraparlamentarii","definite-error-unrecognized-form-feminine-neuter-plural":"extraparlamentarele"}},{"word":"extraperitoneal","pos":"adj","definitions":["extraperitoneal"],"forms":{"feminine-singular":"extraperitoneală","masculine-plural":"extraperitoneali","feminine-neuter-plural":"extraperitoneale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraperitoneal","error-unrecognized-form-feminine-indefinite-singular":"extraperitoneală","error-unrecognized-form-indefinite-masculine-plural":"extraperitoneali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraperitoneale","definite-error-unrecognized-form-masculine-neuter-singular":"extraperitonealul","definite-error-unrecognized-form-feminine-singular":"extraperitoneala","definite-error-unrecognized-form-masculine-plural":"extraperitonealii","definite-error-unrecognized-form-feminine-neuter-plural":"extraperitonealele"}},{"word":"extraplat","pos":"adj","definitions":["extra flat"],"forms":{"feminine-singular":"extraplată","masculine-plural":"extraplați","feminine-neuter-plural":"extraplate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraplat","error-unrecognized-form-feminine-indefinite-singular":"extraplată","error-unrecognized-form-indefinite-masculine-plural":"extraplați","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraplate","definite-error-unrecognized-form-masculine-neuter-singular":"extraplatul","definite-error-unrecognized-form-feminine-singular":"extraplata","definite-error-unrecognized-form-masculine-plural":"extraplații","definite-error-unrecognized-form-feminine-neuter-plural":"extraplatele"}},{"word":"extrapleural","pos":"adj","definitions":["extrapleural"],"forms":{"feminine-singular":"extrapleurală","masculine-plural":"extrapleurali","feminine-neuter-plural":"extrapleurale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrapleural","error-unrecognized-form-feminine-indefinite-singular":"extrapleurală","error-unrecognized-form-indefinite-masculine-plural":"extrapleurali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrapleurale","definite-error-unrecognized-form-masculine-neuter-singular":"extrapleuralul","definite-error-unrecognized-form-feminine-singular":"extrapleurala","definite-error-unrecognized-form-masculine-plural":"extrapleuralii","definite-error-unrecognized-form-feminine-neuter-plural":"extrapleuralele"}},{"word":"extrapola","pos":"verb","definitions":["to extrapolate"],"forms":{"canonical":"a extrapola 1st conjugation","present-singular-third-person":"extrapolez","participle-past":"extrapolat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a extrapola","gerund":"extrapolând","first-person-indicative-present-singular":"extrapolez","indicative-present-second-person-singular":"extrapolezi","indicative-present-singular-third-person":"extrapolează","first-person-indicative-plural-present":"extrapolăm","indicative-plural-present-second-person":"extrapolați","indicative-plural-present-third-person":"extrapolează","first-person-imperfect-indicative-singular":"extrapolam","imperfect-indicative-second-person-singular":"extrapolai","imperfect-indicative-singular-third-person":"extrapola","first-person-imperfect-indicative-plural":"extrapolam","imperfect-indicative-plural-second-person":"extrapolați","imperfect-indicative-plural-third-person":"extrapolau","first-person-indicative-perfect-singular":"extrapolai","indicative-perfect-second-person-singular":"extrapolași","indicative-perfect-singular-third-person":"extrapolă","first-person-indicative-perfect-plural":"extrapolarăm","indicative-perfect-plural-second-person":"extrapolarăți","indicative-perfect-plural-third-person":"extrapolară","first-person-indicative-pluperfect-singular":"extrapolasem","indicative-pluperfect-second-person-singular":"extrapolaseși","indicative-pluperfect-singular-third-person":"extrapolase","first-person-indicative-pluperfect-plural":"extrapolaserăm","indicative-pluperfect-plural-second-person":"extrapolaserăți","indicative-pluperfect-plural-third-person":"extrapolaseră","first-person-present-singular-subjunctive":"să extrapolez","present-second-person-singular-subjunctive":"să extrapolezi","present-singular-subjunctive-third-person":"să extrapoleze","first-person-plural-present-subjunctive":"să extrapolăm","plural-present-second-person-subjunctive":"să extrapolați","plural-present-subjunctive-third-person":"să extrapoleze","imperative-second-person-singular":"extrapolează","imperative-plural-second-person":"extrapolați","imperative-negative-second-person-singular":"nu extrapola","imperative-negative-plural-second-person":"nu extrapolați"}},{"word":"extrapolare","pos":"noun","definitions":["extrapolation"],"forms":{"plural":"extrapolări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extrapolare","accusative-definite-nominative-singular":"extrapolarea","accusative-indefinite-nominative-plural":"extrapolări","accusative-definite-nominative-plural":"extrapolările","dative-genitive-indefinite-singular":"extrapolări","dative-definite-genitive-singular":"extrapolării","dative-genitive-indefinite-plural":"extrapolări","dative-definite-genitive-plural":"extrapolărilor","singular-vocative":"extrapolare","plural-vocative":"extrapolărilor"}},{"word":"extrapolație","pos":"noun","definitions":["extrapolation"],"forms":{"plural":"extrapolații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extrapolație","accusative-definite-nominative-singular":"extrapolația","accusative-indefinite-nominative-plural":"extrapolații","accusative-definite-nominative-plural":"extrapolațiile","dative-genitive-indefinite-singular":"extrapolații","dative-definite-genitive-singular":"extrapolației","dative-genitive-indefinite-plural":"extrapolații","dative-definite-genitive-plural":"extrapolațiilor","singular-vocative":"extrapolație","plural-vocative":"extrapolațiilor"}},{"word":"extraprofesional","pos":"adj","definitions":["extraprofessional"],"forms":{"feminine-singular":"extraprofesională","masculine-plural":"extraprofesionali","feminine-neuter-plural":"extraprofesionale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraprofesional","error-unrecognized-form-feminine-indefinite-singular":"extraprofesională","error-unrecognized-form-indefinite-masculine-plural":"extraprofesionali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraprofesionale","definite-error-unrecognized-form-masculine-neuter-singular":"extraprofesionalul","definite-error-unrecognized-form-feminine-singular":"extraprofesionala","definite-error-unrecognized-form-masculine-plural":"extraprofesionalii","definite-error-unrecognized-form-feminine-neuter-plural":"extraprofesionalele"}},{"word":"extraretinian","pos":"adj","definitions":["extraretinal"],"forms":{"feminine-singular":"extraretiniană","masculine-plural":"extraretinieni","feminine-neuter-plural":"extraretiniene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraretinian","error-unrecognized-form-feminine-indefinite-singular":"extraretiniană","error-unrecognized-form-indefinite-masculine-plural":"extraretinieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraretiniene","definite-error-unrecognized-form-masculine-neuter-singular":"extraretinianul","definite-error-unrecognized-form-feminine-singular":"extraretiniana","definite-error-unrecognized-form-masculine-plural":"extraretinienii","definite-error-unrecognized-form-feminine-neuter-plural":"extraretinienele"}},{"word":"extras","pos":"noun","definitions":["fragment of a work"],"forms":{"plural":"extrase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"extras","accusative-definite-nominative-singular":"extrasul","accusative-indefinite-nominative-plural":"extrase","accusative-definite-nominative-plural":"extrasele","dative-genitive-indefinite-singular":"extras","dative-definite-genitive-singular":"extrasului","dative-genitive-indefinite-plural":"extrase","dative-definite-genitive-plural":"extraselor","singular-vocative":"extrasule","plural-vocative":"extraselor"}},{"word":"extras de cont","pos":"noun","definitions":["bank statement"],"forms":{"plural":"extrase de cont"}},{"word":"extrăsătură","pos":"noun","definitions":["extraction"],"forms":{"plural":"extrăsături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"extrăsătură","accusative-definite-nominative-singular":"extrăsătura","accusative-indefinite-nominative-plural":"extrăsături","accusative-definite-nominative-plural":"extrăsăturile","dative-genitive-indefinite-singular":"extrăsături","dative-definite-genitive-singular":"extrăsăturii","dative-genitive-indefinite-plural":"extrăsături","dative-definite-genitive-plural":"extrăsăturilor","singular-vocative":"extrăsătură","plural-vocative":"extrăsăturilor"}},{"word":"extrașcolar","pos":"adj","definitions":["extrascholastic"],"forms":{"feminine-singular":"extrașcolară","masculine-plural":"extrașcolari","feminine-neuter-plural":"extrașcolare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrașcolar","error-unrecognized-form-feminine-indefinite-singular":"extrașcolară","error-unrecognized-form-indefinite-masculine-plural":"extrașcolari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrașcolare","definite-error-unrecognized-form-masculine-neuter-singular":"extrașcolarul","definite-error-unrecognized-form-feminine-singular":"extrașcolara","definite-error-unrecognized-form-masculine-plural":"extrașcolarii","definite-error-unrecognized-form-feminine-neuter-plural":"extrașcolarele"}},{"word":"extrasensibil","pos":"adj","definitions":["supersensitive, extremely sensitive"],"forms":{"feminine-singular":"extrasensibilă","masculine-plural":"extrasensibili","feminine-neuter-plural":"extrasensibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrasensibil","error-unrecognized-form-feminine-indefinite-singular":"extrasensibilă","error-unrecognized-form-indefinite-masculine-plural":"extrasensibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrasensibile","definite-error-unrecognized-form-masculine-neuter-singular":"extrasensibilul","definite-error-unrecognized-form-feminine-singular":"extrasensibila","definite-error-unrecognized-form-masculine-plural":"extrasensibilii","definite-error-unrecognized-form-feminine-neuter-plural":"extrasensibilele"}},{"word":"extrasenzorial","pos":"adj","definitions":["extrasensory"],"forms":{"feminine-singular":"extrasenzorială","masculine-plural":"extrasenzoriali","feminine-neuter-plural":"extrasenzoriale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrasenzorial","error-unrecognized-form-feminine-indefinite-singular":"extrasenzorială","error-unrecognized-form-indefinite-masculine-plural":"extrasenzoriali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrasenzoriale","definite-error-unrecognized-form-masculine-neuter-singular":"extrasenzorialul","definite-error-unrecognized-form-feminine-singular":"extrasenzoriala","definite-error-unrecognized-form-masculine-plural":"extrasenzorialii","definite-error-unrecognized-form-feminine-neuter-plural":"extrasenzorialele"}},{"word":"extrasezon","pos":"noun","definitions":["outside of the peak season"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"extrasezon","accusative-definite-nominative":"extrasezonul","dative-genitive-indefinite":"extrasezon","dative-definite-genitive":"extrasezonului","vocative":"extrasezonule"}},{"word":"extrasistolă","pos":"noun","definitions":["extrasystole"],"forms":{"plural":"extrasistole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"extrasistolă","accusative-definite-nominative-singular":"extrasistola","accusative-indefinite-nominative-plural":"extrasistole","accusative-definite-nominative-plural":"extrasistolele","dative-genitive-indefinite-singular":"extrasistole","dative-definite-genitive-singular":"extrasistolei","dative-genitive-indefinite-plural":"extrasistole","dative-definite-genitive-plural":"extrasistolelor","singular-vocative":"extrasistolă","plural-vocative":"extrasistolelor"}},{"word":"extrastatutar","pos":"adj","definitions":["extra-statutory"],"forms":{"feminine-singular":"extrastatutară","masculine-plural":"extrastatutari","feminine-neuter-plural":"extrastatutare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrastatutar","error-unrecognized-form-feminine-indefinite-singular":"extrastatutară","error-unrecognized-form-indefinite-masculine-plural":"extrastatutari","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrastatutare","definite-error-unrecognized-form-masculine-neuter-singular":"extrastatutarul","definite-error-unrecognized-form-feminine-singular":"extrastatutara","definite-error-unrecognized-form-masculine-plural":"extrastatutarii","definite-error-unrecognized-form-feminine-neuter-plural":"extrastatutarele"}},{"word":"extraterestră","pos":"noun","definitions":["female equivalent of extraterestru"],"forms":{"plural":"extraterestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"extraterestră","accusative-definite-nominative-singular":"extraterestra","accusative-indefinite-nominative-plural":"extraterestre","accusative-definite-nominative-plural":"extraterestrele","dative-genitive-indefinite-singular":"extraterestre","dative-definite-genitive-singular":"extraterestrei","dative-genitive-indefinite-plural":"extraterestre","dative-definite-genitive-plural":"extraterestrelor","singular-vocative":"extraterestră","plural-vocative":"extraterestrelor"}},{"word":"extraterestru","pos":"noun","definitions":["alien, extraterrestrial"],"forms":{"plural":"extratereștri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"extraterestru","accusative-definite-nominative-singular":"extraterestrul","accusative-indefinite-nominative-plural":"extratereștri","accusative-definite-nominative-plural":"extratereștrii","dative-genitive-indefinite-singular":"extraterestru","dative-definite-genitive-singular":"extraterestrului","dative-genitive-indefinite-plural":"extratereștri","dative-definite-genitive-plural":"extratereștrilor","singular-vocative":"extraterestrule","plural-vocative":"extratereștrilor"}},{"word":"extrateritorial","pos":"adj","definitions":["extraterritorial"],"forms":{"feminine-singular":"extrateritorială","masculine-plural":"extrateritoriali","feminine-neuter-plural":"extrateritoriale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrateritorial","error-unrecognized-form-feminine-indefinite-singular":"extrateritorială","error-unrecognized-form-indefinite-masculine-plural":"extrateritoriali","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrateritoriale","definite-error-unrecognized-form-masculine-neuter-singular":"extrateritorialul","definite-error-unrecognized-form-feminine-singular":"extrateritoriala","definite-error-unrecognized-form-masculine-plural":"extrateritorialii","definite-error-unrecognized-form-feminine-neuter-plural":"extrateritorialele"}},{"word":"extrateritorialitate","pos":"noun","definitions":["extraterritoriality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extrateritorialitate","accusative-definite-nominative-singular":"extrateritorialitatea","accusative-indefinite-nominative-plural":"extrateritorialități","accusative-definite-nominative-plural":"extrateritorialitățile","dative-genitive-indefinite-singular":"extrateritorialități","dative-definite-genitive-singular":"extrateritorialității","dative-genitive-indefinite-plural":"extrateritorialități","dative-definite-genitive-plural":"extrateritorialităților","singular-vocative":"extrateritorialitate","plural-vocative":"extrateritorialităților"}},{"word":"extraurban","pos":"adj","definitions":["suburban"],"forms":{"feminine-singular":"extraurbană","masculine-plural":"extraurbani","feminine-neuter-plural":"extraurbane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extraurban","error-unrecognized-form-feminine-indefinite-singular":"extraurbană","error-unrecognized-form-indefinite-masculine-plural":"extraurbani","error-unrecognized-form-feminine-indefinite-neuter-plural":"extraurbane","definite-error-unrecognized-form-masculine-neuter-singular":"extraurbanul","definite-error-unrecognized-form-feminine-singular":"extraurbana","definite-error-unrecognized-form-masculine-plural":"extraurbanii","definite-error-unrecognized-form-feminine-neuter-plural":"extraurbanele"}},{"word":"extrauterin","pos":"adj","definitions":["ectopic"],"forms":{"feminine-singular":"extrauterină","masculine-plural":"extrauterini","feminine-neuter-plural":"extrauterine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrauterin","error-unrecognized-form-feminine-indefinite-singular":"extrauterină","error-unrecognized-form-indefinite-masculine-plural":"extrauterini","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrauterine","definite-error-unrecognized-form-masculine-neuter-singular":"extrauterinul","definite-error-unrecognized-form-feminine-singular":"extrauterina","definite-error-unrecognized-form-masculine-plural":"extrauterinii","definite-error-unrecognized-form-feminine-neuter-plural":"extrauterinele"}},{"word":"extravagant","pos":"adj","definitions":["extravagant"],"forms":{"feminine-singular":"extravagantă","masculine-plural":"extravaganți","feminine-neuter-plural":"extravagante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extravagant","error-unrecognized-form-feminine-indefinite-singular":"extravagantă","error-unrecognized-form-indefinite-masculine-plural":"extravaganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"extravagante","definite-error-unrecognized-form-masculine-neuter-singular":"extravagantul","definite-error-unrecognized-form-feminine-singular":"extravaganta","definite-error-unrecognized-form-masculine-plural":"extravaganții","definite-error-unrecognized-form-feminine-neuter-plural":"extravagantele"}},{"word":"extravaganță","pos":"noun","definitions":["extravagance"],"forms":{"plural":"extravaganțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"extravaganță","accusative-definite-nominative-singular":"extravaganța","accusative-indefinite-nominative-plural":"extravaganțe","accusative-definite-nominative-plural":"extravaganțele","dative-genitive-indefinite-singular":"extravaganțe","dative-definite-genitive-singular":"extravaganței","dative-genitive-indefinite-plural":"extravaganțe","dative-definite-genitive-plural":"extravaganțelor","singular-vocative":"extravaganță","plural-vocative":"extravaganțelor"}},{"word":"extravazare","pos":"noun","definitions":["extravasation"],"forms":{"plural":"extravazări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extravazare","accusative-definite-nominative-singular":"extravazarea","accusative-indefinite-nominative-plural":"extravazări","accusative-definite-nominative-plural":"extravazările","dative-genitive-indefinite-singular":"extravazări","dative-definite-genitive-singular":"extravazării","dative-genitive-indefinite-plural":"extravazări","dative-definite-genitive-plural":"extravazărilor","singular-vocative":"extravazare","plural-vocative":"extravazărilor"}},{"word":"extraversiune","pos":"noun","definitions":["extroversion"],"forms":{"plural":"extraversiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extraversiune","accusative-definite-nominative-singular":"extraversiunea","accusative-indefinite-nominative-plural":"extraversiuni","accusative-definite-nominative-plural":"extraversiunile","dative-genitive-indefinite-singular":"extraversiuni","dative-definite-genitive-singular":"extraversiunii","dative-genitive-indefinite-plural":"extraversiuni","dative-definite-genitive-plural":"extraversiunilor","singular-vocative":"extraversiune","plural-vocative":"extraversiunilor"}},{"word":"extravertit","pos":"adj","definitions":["extroverted"],"forms":{"feminine-singular":"extravertită","masculine-plural":"extravertiți","feminine-neuter-plural":"extravertite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extravertit","error-unrecognized-form-feminine-indefinite-singular":"extravertită","error-unrecognized-form-indefinite-masculine-plural":"extravertiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"extravertite","definite-error-unrecognized-form-masculine-neuter-singular":"extravertitul","definite-error-unrecognized-form-feminine-singular":"extravertita","definite-error-unrecognized-form-masculine-plural":"extravertiții","definite-error-unrecognized-form-feminine-neuter-plural":"extravertitele"}},{"word":"extravilan","pos":"adj","definitions":["outside the residential zone in a settlement"],"forms":{"feminine-singular":"extravilană","masculine-plural":"extravilani","feminine-neuter-plural":"extravilane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extravilan","error-unrecognized-form-feminine-indefinite-singular":"extravilană","error-unrecognized-form-indefinite-masculine-plural":"extravilani","error-unrecognized-form-feminine-indefinite-neuter-plural":"extravilane","definite-error-unrecognized-form-masculine-neuter-singular":"extravilanul","definite-error-unrecognized-form-feminine-singular":"extravilana","definite-error-unrecognized-form-masculine-plural":"extravilanii","definite-error-unrecognized-form-feminine-neuter-plural":"extravilanele"}},{"word":"extravilan","pos":"noun","definitions":["the area outside the residential zone in a settlement"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"extravilan","accusative-definite-nominative":"extravilanul","dative-genitive-indefinite":"extravilan","dative-definite-genitive":"extravilanului","vocative":"extravilanule"}},{"word":"extrem","pos":"adj","definitions":["extreme"],"forms":{"feminine-singular":"extremă","masculine-plural":"extremi","feminine-neuter-plural":"extreme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrem","error-unrecognized-form-feminine-indefinite-singular":"extremă","error-unrecognized-form-indefinite-masculine-plural":"extremi","error-unrecognized-form-feminine-indefinite-neuter-plural":"extreme","definite-error-unrecognized-form-masculine-neuter-singular":"extremul","definite-error-unrecognized-form-feminine-singular":"extrema","definite-error-unrecognized-form-masculine-plural":"extremii","definite-error-unrecognized-form-feminine-neuter-plural":"extremele"}},{"word":"extremă dreaptă","pos":"noun","definitions":["far right"]},{"word":"extremă stângă","pos":"noun","definitions":["far left"]},{"word":"extremală","pos":"noun","definitions":["extremal"],"forms":{"plural":"extremale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"extremală","accusative-definite-nominative-singular":"extremala","accusative-indefinite-nominative-plural":"extremale","accusative-definite-nominative-plural":"extremalele","dative-genitive-indefinite-singular":"extremale","dative-definite-genitive-singular":"extremalei","dative-genitive-indefinite-plural":"extremale","dative-definite-genitive-plural":"extremalelor","singular-vocative":"extremală","plural-vocative":"extremalelor"}},{"word":"extremism","pos":"noun","definitions":["extremism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"extremism","accusative-definite-nominative":"extremismul","dative-genitive-indefinite":"extremism","dative-definite-genitive":"extremismului","vocative":"extremismule"}},{"word":"extremist","pos":"noun","definitions":["extremist"],"forms":{"plural":"extremiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"extremist","accusative-definite-nominative-singular":"extremistul","accusative-indefinite-nominative-plural":"extremiști","accusative-definite-nominative-plural":"extremiștii","dative-genitive-indefinite-singular":"extremist","dative-definite-genitive-singular":"extremistului","dative-genitive-indefinite-plural":"extremiști","dative-definite-genitive-plural":"extremiștilor","singular-vocative":"extremistule","plural-vocative":"extremiștilor"}},{"word":"extremistă","pos":"noun","definitions":["female equivalent of extremist"],"forms":{"plural":"extremiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"extremistă","accusative-definite-nominative-singular":"extremista","accusative-indefinite-nominative-plural":"extremiste","accusative-definite-nominative-plural":"extremistele","dative-genitive-indefinite-singular":"extremiste","dative-definite-genitive-singular":"extremistei","dative-genitive-indefinite-plural":"extremiste","dative-definite-genitive-plural":"extremistelor","singular-vocative":"extremistă","plural-vocative":"extremistelor"}},{"word":"extremitate","pos":"noun","definitions":["extremity"],"pronunciation":"/eks.tre.miˈta.te/","forms":{"plural":"extremități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extremitate","accusative-definite-nominative-singular":"extremitatea","accusative-indefinite-nominative-plural":"extremități","accusative-definite-nominative-plural":"extremitățile","dative-genitive-indefinite-singular":"extremități","dative-definite-genitive-singular":"extremității","dative-genitive-indefinite-plural":"extremități","dative-definite-genitive-plural":"extremităților","singular-vocative":"extremitate","plural-vocative":"extremităților"}},{"word":"extremități","pos":"noun","definitions":["plural of extremitate"],"pronunciation":"/eks.tre.miˈtət͡sʲ/","gender":"f"},{"word":"Extremul Orient","pos":"name","definitions":["Far East (a geographical region of Asia, consisting of East Asia (Korea, Japan, China, the Russian Far East, etc.) and Southeast Asia, taken as a whole)"],"gender":"n"},{"word":"extrinsec","pos":"adj","definitions":["extrinsical"],"forms":{"feminine-singular":"extrinsecă","masculine-plural":"extrinseci","feminine-neuter-plural":"extrinsece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrinsec","error-unrecognized-form-feminine-indefinite-singular":"extrinsecă","error-unrecognized-form-indefinite-masculine-plural":"extrinseci","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrinsece","definite-error-unrecognized-form-masculine-neuter-singular":"extrinsecul","definite-error-unrecognized-form-feminine-singular":"extrinseca","definite-error-unrecognized-form-masculine-plural":"extrinsecii","definite-error-unrecognized-form-feminine-neuter-plural":"extrinsecele"}},{"word":"extrofie","pos":"noun","definitions":["exstrophy"],"forms":{"plural":"extrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extrofie","accusative-definite-nominative-singular":"extrofia","accusative-indefinite-nominative-plural":"extrofii","accusative-definite-nominative-plural":"extrofiile","dative-genitive-indefinite-singular":"extrofii","dative-definite-genitive-singular":"extrofiei","dative-genitive-indefinite-plural":"extrofii","dative-definite-genitive-plural":"extrofiilor","singular-vocative":"extrofie","plural-vocative":"extrofiilor"}},{"word":"extrospecție","pos":"noun","definitions":["extrospection"],"forms":{"plural":"extrospecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"extrospecție","accusative-definite-nominative-singular":"extrospecția","accusative-indefinite-nominative-plural":"extrospecții","accusative-definite-nominative-plural":"extrospecțiile","dative-genitive-indefinite-singular":"extrospecții","dative-definite-genitive-singular":"extrospecției","dative-genitive-indefinite-plural":"extrospecții","dative-definite-genitive-plural":"extrospecțiilor","singular-vocative":"extrospecție","plural-vocative":"extrospecțiilor"}},{"word":"extrospectiv","pos":"adj","definitions":["extrospective"],"forms":{"feminine-singular":"extrospectivă","masculine-plural":"extrospectivi","feminine-neuter-plural":"extrospective","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrospectiv","error-unrecognized-form-feminine-indefinite-singular":"extrospectivă","error-unrecognized-form-indefinite-masculine-plural":"extrospectivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrospective","definite-error-unrecognized-form-masculine-neuter-singular":"extrospectivul","definite-error-unrecognized-form-feminine-singular":"extrospectiva","definite-error-unrecognized-form-masculine-plural":"extrospectivii","definite-error-unrecognized-form-feminine-neuter-plural":"extrospectivele"}},{"word":"extroversiune","pos":"noun","definitions":["alternative form of extraversiune"],"forms":{"plural":"extroversiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extroversiune","accusative-definite-nominative-singular":"extroversiunea","accusative-indefinite-nominative-plural":"extroversiuni","accusative-definite-nominative-plural":"extroversiunile","dative-genitive-indefinite-singular":"extroversiuni","dative-definite-genitive-singular":"extroversiunii","dative-genitive-indefinite-plural":"extroversiuni","dative-definite-genitive-plural":"extroversiunilor","singular-vocative":"extroversiune","plural-vocative":"extroversiunilor"}},{"word":"extrovertit","pos":"adj","definitions":["alternative form of extravertit"],"forms":{"feminine-singular":"extrovertită","masculine-plural":"extrovertiți","feminine-neuter-plural":"extrovertite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"extrovertit","error-unrecognized-form-feminine-indefinite-singular":"extrovertită","error-unrecognized-form-indefinite-masculine-plural":"extrovertiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"extrovertite","definite-error-unrecognized-form-masculine-neuter-singular":"extrovertitul","definite-error-unrecognized-form-feminine-singular":"extrovertita","definite-error-unrecognized-form-masculine-plural":"extrovertiții","definite-error-unrecognized-form-feminine-neuter-plural":"extrovertitele"}},{"word":"extrudare","pos":"noun","definitions":["extrusion"],"forms":{"plural":"extrudări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extrudare","accusative-definite-nominative-singular":"extrudarea","accusative-indefinite-nominative-plural":"extrudări","accusative-definite-nominative-plural":"extrudările","dative-genitive-indefinite-singular":"extrudări","dative-definite-genitive-singular":"extrudării","dative-genitive-indefinite-plural":"extrudări","dative-definite-genitive-plural":"extrudărilor","singular-vocative":"extrudare","plural-vocative":"extrudărilor"}},{"word":"extrudere","pos":"noun","definitions":["extrusion"],"forms":{"plural":"extruderi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extrudere","accusative-definite-nominative-singular":"extruderea","accusative-indefinite-nominative-plural":"extruderi","accusative-definite-nominative-plural":"extruderile","dative-genitive-indefinite-singular":"extruderi","dative-definite-genitive-singular":"extruderii","dative-genitive-indefinite-plural":"extruderi","dative-definite-genitive-plural":"extruderilor","singular-vocative":"extrudere","plural-vocative":"extruderilor"}},{"word":"extruziune","pos":"noun","definitions":["extrusion"],"forms":{"plural":"extruziuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"extruziune","accusative-definite-nominative-singular":"extruziunea","accusative-indefinite-nominative-plural":"extruziuni","accusative-definite-nominative-plural":"extruziunile","dative-genitive-indefinite-singular":"extruziuni","dative-definite-genitive-singular":"extruziunii","dative-genitive-indefinite-plural":"extruziuni","dative-definite-genitive-plural":"extruziunilor","singular-vocative":"extruziune","plural-vocative":"extruziunilor"}},{"word":"exuberant","pos":"adj","definitions":["exuberant"],"forms":{"feminine-singular":"exuberantă","masculine-plural":"exuberanți","feminine-neuter-plural":"exuberante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exuberant","error-unrecognized-form-feminine-indefinite-singular":"exuberantă","error-unrecognized-form-indefinite-masculine-plural":"exuberanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exuberante","definite-error-unrecognized-form-masculine-neuter-singular":"exuberantul","definite-error-unrecognized-form-feminine-singular":"exuberanta","definite-error-unrecognized-form-masculine-plural":"exuberanții","definite-error-unrecognized-form-feminine-neuter-plural":"exuberantele"}},{"word":"exuberanță","pos":"noun","definitions":["exuberance"],"forms":{"plural":"exuberanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"exuberanță","accusative-definite-nominative-singular":"exuberanța","accusative-indefinite-nominative-plural":"exuberanțe","accusative-definite-nominative-plural":"exuberanțele","dative-genitive-indefinite-singular":"exuberanțe","dative-definite-genitive-singular":"exuberanței","dative-genitive-indefinite-plural":"exuberanțe","dative-definite-genitive-plural":"exuberanțelor","singular-vocative":"exuberanță","plural-vocative":"exuberanțelor"}},{"word":"exulcerație","pos":"noun","definitions":["exulceration"],"forms":{"plural":"exulcerații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exulcerație","accusative-definite-nominative-singular":"exulcerația","accusative-indefinite-nominative-plural":"exulcerații","accusative-definite-nominative-plural":"exulcerațiile","dative-genitive-indefinite-singular":"exulcerații","dative-definite-genitive-singular":"exulcerației","dative-genitive-indefinite-plural":"exulcerații","dative-definite-genitive-plural":"exulcerațiilor","singular-vocative":"exulcerație","plural-vocative":"exulcerațiilor"}},{"word":"exulta","pos":"verb","definitions":["to exult"],"forms":{"canonical":"a exulta 1st conjugation","present-singular-third-person":"exultă","participle-past":"exultat","subjunctive-third-person":"exulte","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a exulta","gerund":"exultând","first-person-indicative-present-singular":"exult","indicative-present-second-person-singular":"exulți","indicative-present-singular-third-person":"exultă","first-person-indicative-plural-present":"exultăm","indicative-plural-present-second-person":"exultați","indicative-plural-present-third-person":"exultă","first-person-imperfect-indicative-singular":"exultam","imperfect-indicative-second-person-singular":"exultai","imperfect-indicative-singular-third-person":"exulta","first-person-imperfect-indicative-plural":"exultam","imperfect-indicative-plural-second-person":"exultați","imperfect-indicative-plural-third-person":"exultau","first-person-indicative-perfect-singular":"exultai","indicative-perfect-second-person-singular":"exultași","indicative-perfect-singular-third-person":"exultă","first-person-indicative-perfect-plural":"exultarăm","indicative-perfect-plural-second-person":"exultarăți","indicative-perfect-plural-third-person":"exultară","first-person-indicative-pluperfect-singular":"exultasem","indicative-pluperfect-second-person-singular":"exultaseși","indicative-pluperfect-singular-third-person":"exultase","first-person-indicative-pluperfect-plural":"exultaserăm","indicative-pluperfect-plural-second-person":"exultaserăți","indicative-pluperfect-plural-third-person":"exultaseră","first-person-present-singular-subjunctive":"să exult","present-second-person-singular-subjunctive":"să exulți","present-singular-subjunctive-third-person":"să exulte","first-person-plural-present-subjunctive":"să exultăm","plural-present-second-person-subjunctive":"să exultați","plural-present-subjunctive-third-person":"să exulte","imperative-second-person-singular":"exultă","imperative-plural-second-person":"exultați","imperative-negative-second-person-singular":"nu exulta","imperative-negative-plural-second-person":"nu exultați"}},{"word":"exultant","pos":"adj","definitions":["exultant"],"forms":{"feminine-singular":"exultantă","masculine-plural":"exultanți","feminine-neuter-plural":"exultante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exultant","error-unrecognized-form-feminine-indefinite-singular":"exultantă","error-unrecognized-form-indefinite-masculine-plural":"exultanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"exultante","definite-error-unrecognized-form-masculine-neuter-singular":"exultantul","definite-error-unrecognized-form-feminine-singular":"exultanta","definite-error-unrecognized-form-masculine-plural":"exultanții","definite-error-unrecognized-form-feminine-neuter-plural":"exultantele"}},{"word":"exultare","pos":"noun","definitions":["exultation"],"forms":{"plural":"exultări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exultare","accusative-definite-nominative-singular":"exultarea","accusative-indefinite-nominative-plural":"exultări","accusative-definite-nominative-plural":"exultările","dative-genitive-indefinite-singular":"exultări","dative-definite-genitive-singular":"exultării","dative-genitive-indefinite-plural":"exultări","dative-definite-genitive-plural":"exultărilor","singular-vocative":"exultare","plural-vocative":"exultărilor"}},{"word":"exultație","pos":"noun","definitions":["exultation"],"forms":{"plural":"exultații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exultație","accusative-definite-nominative-singular":"exultația","accusative-indefinite-nominative-plural":"exultații","accusative-definite-nominative-plural":"exultațiile","dative-genitive-indefinite-singular":"exultații","dative-definite-genitive-singular":"exultației","dative-genitive-indefinite-plural":"exultații","dative-definite-genitive-plural":"exultațiilor","singular-vocative":"exultație","plural-vocative":"exultațiilor"}},{"word":"exultațiune","pos":"noun","definitions":["obsolete form of exultație"],"forms":{"plural":"exultațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"exultațiune","accusative-definite-nominative-singular":"exultațiunea","accusative-indefinite-nominative-plural":"exultațiuni","accusative-definite-nominative-plural":"exultațiunile","dative-genitive-indefinite-singular":"exultațiuni","dative-definite-genitive-singular":"exultațiunii","dative-genitive-indefinite-plural":"exultațiuni","dative-definite-genitive-plural":"exultațiunilor","singular-vocative":"exultațiune","plural-vocative":"exultațiunilor"}},{"word":"exuviabil","pos":"adj","definitions":["exuviable"],"forms":{"feminine-singular":"exuviabilă","masculine-plural":"exuviabili","feminine-neuter-plural":"exuviabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exuviabil","error-unrecognized-form-feminine-indefinite-singular":"exuviabilă","error-unrecognized-form-indefinite-masculine-plural":"exuviabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"exuviabile","definite-error-unrecognized-form-masculine-neuter-singular":"exuviabilul","definite-error-unrecognized-form-feminine-singular":"exuviabila","definite-error-unrecognized-form-masculine-plural":"exuviabilii","definite-error-unrecognized-form-feminine-neuter-plural":"exuviabilele"}},{"word":"exuvial","pos":"adj","definitions":["exuvial"],"forms":{"feminine-singular":"exuvială","masculine-plural":"exuviali","feminine-neuter-plural":"exuviale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"exuvial","error-unrecognized-form-feminine-indefinite-singular":"exuvială","error-unrecognized-form-indefinite-masculine-plural":"exuviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"exuviale","definite-error-unrecognized-form-masculine-neuter-singular":"exuvialul","definite-error-unrecognized-form-feminine-singular":"exuviala","definite-error-unrecognized-form-masculine-plural":"exuvialii","definite-error-unrecognized-form-feminine-neuter-plural":"exuvialele"}},{"word":"exuvie","pos":"noun","definitions":["exuvia"],"pronunciation":"/eɡˈzu.vi.(j)e/","forms":{"plural":"exuvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"exuvie","accusative-definite-nominative-singular":"exuvia","accusative-indefinite-nominative-plural":"exuvii","accusative-definite-nominative-plural":"exuviile","dative-genitive-indefinite-singular":"exuvii","dative-definite-genitive-singular":"exuviei","dative-genitive-indefinite-plural":"exuvii","dative-definite-genitive-plural":"exuviilor","singular-vocative":"exuvie","plural-vocative":"exuviilor"}},{"word":"Ezereanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ezereanu"}},{"word":"ezerină","pos":"noun","definitions":["eserine"],"forms":{"plural":"ezerine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ezerină","accusative-definite-nominative-singular":"ezerina","accusative-indefinite-nominative-plural":"ezerine","accusative-definite-nominative-plural":"ezerinele","dative-genitive-indefinite-singular":"ezerine","dative-definite-genitive-singular":"ezerinei","dative-genitive-indefinite-plural":"ezerine","dative-definite-genitive-plural":"ezerinelor","singular-vocative":"ezerină","plural-vocative":"ezerinelor"}},{"word":"Ezeriș","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Ezeriș, Caraș-Severin County, Romania"],"gender":"m"},{"word":"eziet","pos":"noun","definitions":["waste, loss, damage"],"forms":{"plural":"ezieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"eziet","accusative-definite-nominative-singular":"ezietul","accusative-indefinite-nominative-plural":"ezieturi","accusative-definite-nominative-plural":"ezieturile","dative-genitive-indefinite-singular":"eziet","dative-definite-genitive-singular":"ezietului","dative-genitive-indefinite-plural":"ezieturi","dative-definite-genitive-plural":"ezieturilor","singular-vocative":"ezietule","plural-vocative":"ezieturilor"}},{"word":"ezita","pos":"verb","definitions":["to hesitate, waver","to vacillate, oscillate"],"forms":{"canonical":"a ezita 1st conjugation","present-singular-third-person":"ezită","participle-past":"ezitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ezita","gerund":"ezitând","first-person-indicative-present-singular":"ezit","indicative-present-second-person-singular":"eziți","indicative-present-singular-third-person":"ezită","first-person-indicative-plural-present":"ezităm","indicative-plural-present-second-person":"ezitați","indicative-plural-present-third-person":"ezită","first-person-imperfect-indicative-singular":"ezitam","imperfect-indicative-second-person-singular":"ezitai","imperfect-indicative-singular-third-person":"ezita","first-person-imperfect-indicative-plural":"ezitam","imperfect-indicative-plural-second-person":"ezitați","imperfect-indicative-plural-third-person":"ezitau","first-person-indicative-perfect-singular":"ezitai","indicative-perfect-second-person-singular":"ezitași","indicative-perfect-singular-third-person":"ezită","first-person-indicative-perfect-plural":"ezitarăm","indicative-perfect-plural-second-person":"ezitarăți","indicative-perfect-plural-third-person":"ezitară","first-person-indicative-pluperfect-singular":"ezitasem","indicative-pluperfect-second-person-singular":"ezitaseși","indicative-pluperfect-singular-third-person":"ezitase","first-person-indicative-pluperfect-plural":"ezitaserăm","indicative-pluperfect-plural-second-person":"ezitaserăți","indicative-pluperfect-plural-third-person":"ezitaseră","first-person-present-singular-subjunctive":"să ezit","present-second-person-singular-subjunctive":"să eziți","present-singular-subjunctive-third-person":"să ezite","first-person-plural-present-subjunctive":"să ezităm","plural-present-second-person-subjunctive":"să ezitați","plural-present-subjunctive-third-person":"să ezite","imperative-second-person-singular":"ezită","imperative-plural-second-person":"ezitați","imperative-negative-second-person-singular":"nu ezita","imperative-negative-plural-second-person":"nu ezitați"}},{"word":"ezitai","pos":"verb","definitions":["inflection of ezita:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[eziˈtaj]"},{"word":"ezitant","pos":"adj","definitions":["reluctant"],"forms":{"feminine-singular":"ezitantă","masculine-plural":"ezitanți","feminine-neuter-plural":"ezitante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ezitant","error-unrecognized-form-feminine-indefinite-singular":"ezitantă","error-unrecognized-form-indefinite-masculine-plural":"ezitanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ezitante","definite-error-unrecognized-form-masculine-neuter-singular":"ezitantul","definite-error-unrecognized-form-feminine-singular":"ezitanta","definite-error-unrecognized-form-masculine-plural":"ezitanții","definite-error-unrecognized-form-feminine-neuter-plural":"ezitantele"}},{"word":"ezitare","pos":"noun","definitions":["hesitation"],"forms":{"plural":"ezitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ezitare","accusative-definite-nominative-singular":"ezitarea","accusative-indefinite-nominative-plural":"ezitări","accusative-definite-nominative-plural":"ezitările","dative-genitive-indefinite-singular":"ezitări","dative-definite-genitive-singular":"ezitării","dative-genitive-indefinite-plural":"ezitări","dative-definite-genitive-plural":"ezitărilor","singular-vocative":"ezitare","plural-vocative":"ezitărilor"}},{"word":"ezitațiune","pos":"noun","definitions":["hesitation"],"forms":{"plural":"ezitațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ezitațiune","accusative-definite-nominative-singular":"ezitațiunea","accusative-indefinite-nominative-plural":"ezitațiuni","accusative-definite-nominative-plural":"ezitațiunile","dative-genitive-indefinite-singular":"ezitațiuni","dative-definite-genitive-singular":"ezitațiunii","dative-genitive-indefinite-plural":"ezitațiuni","dative-definite-genitive-plural":"ezitațiunilor","singular-vocative":"ezitațiune","plural-vocative":"ezitațiunilor"}},{"word":"ezoteric","pos":"adj","definitions":["esoteric"],"forms":{"feminine-singular":"ezoterică","masculine-plural":"ezoterici","feminine-neuter-plural":"ezoterice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ezoteric","error-unrecognized-form-feminine-indefinite-singular":"ezoterică","error-unrecognized-form-indefinite-masculine-plural":"ezoterici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ezoterice","definite-error-unrecognized-form-masculine-neuter-singular":"ezotericul","definite-error-unrecognized-form-feminine-singular":"ezoterica","definite-error-unrecognized-form-masculine-plural":"ezotericii","definite-error-unrecognized-form-feminine-neuter-plural":"ezotericele"}},{"word":"ezoterism","pos":"noun","definitions":["esotericism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ezoterism","accusative-definite-nominative-singular":"ezoterismul","accusative-indefinite-nominative-plural":"ezoterisme","accusative-definite-nominative-plural":"ezoterismele","dative-genitive-indefinite-singular":"ezoterism","dative-definite-genitive-singular":"ezoterismului","dative-genitive-indefinite-plural":"ezoterisme","dative-definite-genitive-plural":"ezoterismelor","singular-vocative":"ezoterismule","plural-vocative":"ezoterismelor"}},{"word":"ezred","pos":"noun","definitions":["regiment"],"forms":{"plural":"ezreduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ezred","accusative-definite-nominative-singular":"ezredul","accusative-indefinite-nominative-plural":"ezreduri","accusative-definite-nominative-plural":"ezredurile","dative-genitive-indefinite-singular":"ezred","dative-definite-genitive-singular":"ezredului","dative-genitive-indefinite-plural":"ezreduri","dative-definite-genitive-plural":"ezredurilor","singular-vocative":"ezredule","plural-vocative":"ezredurilor"}},{"word":"ezredeș","pos":"noun","definitions":["general"],"forms":{"plural":"ezredeși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ezredeș","accusative-definite-nominative-singular":"ezredeșul","accusative-indefinite-nominative-plural":"ezredeși","accusative-definite-nominative-plural":"ezredeșii","dative-genitive-indefinite-singular":"ezredeș","dative-definite-genitive-singular":"ezredeșului","dative-genitive-indefinite-plural":"ezredeși","dative-definite-genitive-plural":"ezredeșilor","singular-vocative":"ezredeșule","plural-vocative":"ezredeșilor"}}];
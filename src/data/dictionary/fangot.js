@@ -0,0 +1 @@
+export default [{"word":"fangoterapie","pos":"noun","definitions":["mud bath treatment"],"forms":{"plural":"fangoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fangoterapie","accusative-definite-nominative-singular":"fangoterapia","accusative-indefinite-nominative-plural":"fangoterapii","accusative-definite-nominative-plural":"fangoterapiile","dative-genitive-indefinite-singular":"fangoterapii","dative-definite-genitive-singular":"fangoterapiei","dative-genitive-indefinite-plural":"fangoterapii","dative-definite-genitive-plural":"fangoterapiilor","singular-vocative":"fangoterapie","plural-vocative":"fangoterapiilor"}},{"word":"Fănică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fănică"}},{"word":"fanion","pos":"noun","definitions":["pennant"],"forms":{"plural":"fanioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fanion","accusative-definite-nominative-singular":"fanionul","accusative-indefinite-nominative-plural":"fanioane","accusative-definite-nominative-plural":"fanioanele","dative-genitive-indefinite-singular":"fanion","dative-definite-genitive-singular":"fanionului","dative-genitive-indefinite-plural":"fanioane","dative-definite-genitive-plural":"fanioanelor","singular-vocative":"fanionule","plural-vocative":"fanioanelor"}},{"word":"fânișor","pos":"noun","definitions":["diminutive of fân; small hay"],"forms":{"plural":"fânișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fânișor","accusative-definite-nominative-singular":"fânișorul","accusative-indefinite-nominative-plural":"fânișore","accusative-definite-nominative-plural":"fânișorele","dative-genitive-indefinite-singular":"fânișor","dative-definite-genitive-singular":"fânișorului","dative-genitive-indefinite-plural":"fânișore","dative-definite-genitive-plural":"fânișorelor","singular-vocative":"fânișorule","plural-vocative":"fânișorelor"}},{"word":"Făniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Făniță"}},{"word":"Fănoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fănoiu"}},{"word":"fanon","pos":"noun","definitions":["dewlap"],"forms":{"plural":"fanoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fanon","accusative-definite-nominative-singular":"fanonul","accusative-indefinite-nominative-plural":"fanoane","accusative-definite-nominative-plural":"fanoanele","dative-genitive-indefinite-singular":"fanon","dative-definite-genitive-singular":"fanonului","dative-genitive-indefinite-plural":"fanoane","dative-definite-genitive-plural":"fanoanelor","singular-vocative":"fanonule","plural-vocative":"fanoanelor"}},{"word":"fanotron","pos":"noun","definitions":["phanotron"],"forms":{"plural":"fanotroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fanotron","accusative-definite-nominative-singular":"fanotronul","accusative-indefinite-nominative-plural":"fanotroane","accusative-definite-nominative-plural":"fanotroanele","dative-genitive-indefinite-singular":"fanotron","dative-definite-genitive-singular":"fanotronului","dative-genitive-indefinite-plural":"fanotroane","dative-definite-genitive-plural":"fanotroanelor","singular-vocative":"fanotronule","plural-vocative":"fanotroanelor"}},{"word":"fantă","pos":"noun","definitions":["slot"],"forms":{"plural":"fante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fantă","accusative-definite-nominative-singular":"fanta","accusative-indefinite-nominative-plural":"fante","accusative-definite-nominative-plural":"fantele","dative-genitive-indefinite-singular":"fante","dative-definite-genitive-singular":"fantei","dative-genitive-indefinite-plural":"fante","dative-definite-genitive-plural":"fantelor","singular-vocative":"fantă","plural-vocative":"fantelor"}},{"word":"fântâioară","pos":"noun","definitions":["alternative form of fântânioară"],"forms":{"plural":"fântâioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fântâioară","accusative-definite-nominative-singular":"fântâioara","accusative-indefinite-nominative-plural":"fântâioare","accusative-definite-nominative-plural":"fântâioarele","dative-genitive-indefinite-singular":"fântâioare","dative-definite-genitive-singular":"fântâioarei","dative-genitive-indefinite-plural":"fântâioare","dative-definite-genitive-plural":"fântâioarelor","singular-vocative":"fântâioară","plural-vocative":"fântâioarelor"}},{"word":"Fântâna","pos":"name","definitions":["a village in Hoghiz, Brașov County, Romania","a village in Lunca Cernii de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"fântâna","pos":"noun","definitions":["definite nominative/accusative singular of fântână"]},{"word":"Fântână","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fântână"}},{"word":"fântână","pos":"noun","definitions":["well (for water)","spring, source"],"pronunciation":"/fɨnˈtɨ.nə/","forms":{"plural":"fântâni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fântână","accusative-definite-nominative-singular":"fântâna","accusative-indefinite-nominative-plural":"fântâni","accusative-definite-nominative-plural":"fântânile","dative-genitive-indefinite-singular":"fântâni","dative-definite-genitive-singular":"fântânii","dative-genitive-indefinite-plural":"fântâni","dative-definite-genitive-plural":"fântânilor","singular-vocative":"fântână","plural-vocative":"fântânilor","alternative-obsolete":"fôntână"}},{"word":"Fântâna Albă","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Măieruș"],"gender":"f","forms":{"canonical-feminine":"Fântână Albă"}},{"word":"fântână arteziană","pos":"noun","definitions":["artesian well"],"forms":{"plural":"fântâni arteziene"}},{"word":"Fântâna Babii","pos":"name","definitions":["a village in Pogăceaua, Mureș County, Romania"],"gender":"f"},{"word":"Fântâna Blănarului","pos":"name","definitions":["a village in Bogdana, Vaslui County, Romania"],"gender":"f"},{"word":"Fântâna Brazilor","pos":"name","definitions":["a village in Corund, Harghita County, Romania"],"gender":"f"},{"word":"Fântâna Cerbului","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Brăneasa"],"gender":"f"},{"word":"Fântâna Doamnei","pos":"name","definitions":["a village in Nicolae Bălcescu, Călărași County, Romania"],"gender":"f"},{"word":"Fântâna Domnească","pos":"name","definitions":["a village in Prunișor, Mehedinți County, Romania"],"gender":"f"},{"word":"Fântâna lui Gal","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Olt"],"gender":"f"},{"word":"Fântâna Mare","pos":"name","definitions":["a village in Independența, Constanța County, Romania","a commune of Suceava County, Romania","a village in Fântâna Mare, Suceava County, Romania","a village in Ciucurova, Tulcea County, Romania"],"gender":"f"},{"word":"Fântâna Oilor","pos":"name","definitions":["a village in Dorobanțu, Tulcea County, Romania"],"gender":"f"},{"word":"Fântâna Pustnicului","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Trebiș"],"gender":"f"},{"word":"Fântâna Seacă","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Nera"],"gender":"f"},{"word":"Fântâna Tulbure","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Muereasca"],"gender":"f"},{"word":"fântânar","pos":"noun","definitions":["welldigger"],"forms":{"plural":"fântânari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fântânar","accusative-definite-nominative-singular":"fântânarul","accusative-indefinite-nominative-plural":"fântânari","accusative-definite-nominative-plural":"fântânarii","dative-genitive-indefinite-singular":"fântânar","dative-definite-genitive-singular":"fântânarului","dative-genitive-indefinite-plural":"fântânari","dative-definite-genitive-plural":"fântânarilor","singular-vocative":"fântânarule","plural-vocative":"fântânarilor"}},{"word":"Fântânariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fântânariu"}},{"word":"Fântânea","pos":"name","definitions":["a village in Valea Mare Pravăț, Argeș County, Romania"],"gender":"f"},{"word":"fântânea","pos":"noun","definitions":["diminutive of fântână; small well"],"forms":{"plural":"fântânele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"fântânea","accusative-definite-nominative-singular":"fântâneaua","accusative-indefinite-nominative-plural":"fântânele","accusative-definite-nominative-plural":"fântânelele","dative-genitive-indefinite-singular":"fântânele","dative-definite-genitive-singular":"fântânelei","dative-genitive-indefinite-plural":"fântânele","dative-definite-genitive-plural":"fântânelelor","singular-vocative":"fântânea","plural-vocative":"fântânelelor"}},{"word":"Fântâneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fântâneanu"}},{"word":"Fântâneaua Rece","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"f"},{"word":"fântânel","pos":"noun","definitions":["brook trout (Salvelinus fontinalis)"],"forms":{"plural":"fântânei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fântânel","accusative-definite-nominative-singular":"fântânelul","accusative-indefinite-nominative-plural":"fântânei","accusative-definite-nominative-plural":"fântâneii","dative-genitive-indefinite-singular":"fântânel","dative-definite-genitive-singular":"fântânelului","dative-genitive-indefinite-plural":"fântânei","dative-definite-genitive-plural":"fântâneilor","singular-vocative":"fântânelule","plural-vocative":"fântâneilor"}},{"word":"Fântânele","pos":"name","definitions":["a village in Ceru-Băcăinți, Alba County, Romania","a commune of Arad County, Romania","a village in Fântânele, Arad County, Romania","a village in Hemeiuș, Bacău County, Romania","a village in Motoșeni, Bacău County, Romania"],"gender":"m"},{"word":"fântânele","pos":"noun","definitions":["inflection of fântânea:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"Fântânele-Rus","pos":"name","definitions":["a village in Rus, Sălaj County, Romania"],"gender":"m"},{"word":"Fântâneru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fântâneru"}},{"word":"Fântânescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fântânescu"}},{"word":"Fântâni","pos":"name","definitions":["a village in Goiești, Dolj County, Romania","a village in Nicorești, Galați County, Romania"],"gender":"m"},{"word":"fântâni","pos":"noun","definitions":["plural of fântână"]},{"word":"fântânică","pos":"noun","definitions":["diminutive of fântână"],"forms":{"plural":"fântânici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fântânică","accusative-definite-nominative-singular":"fântânica","accusative-indefinite-nominative-plural":"fântânici","accusative-definite-nominative-plural":"fântânicile","dative-genitive-indefinite-singular":"fântânici","dative-definite-genitive-singular":"fântânicii","dative-genitive-indefinite-plural":"fântânici","dative-definite-genitive-plural":"fântânicilor","singular-vocative":"fântânică","plural-vocative":"fântânicilor"}},{"word":"fântânier","pos":"noun","definitions":["welldigger"],"forms":{"plural":"fântânieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fântânier","accusative-definite-nominative-singular":"fântânierul","accusative-indefinite-nominative-plural":"fântânieri","accusative-definite-nominative-plural":"fântânierii","dative-genitive-indefinite-singular":"fântânier","dative-definite-genitive-singular":"fântânierului","dative-genitive-indefinite-plural":"fântânieri","dative-definite-genitive-plural":"fântânierilor","singular-vocative":"fântânierule","plural-vocative":"fântânierilor"}},{"word":"fântânii","pos":"noun","definitions":["definite genitive/dative singular of fântână"]},{"word":"Fântânile Negre","pos":"name","definitions":["a village in Poroina Mare, Mehedinți County, Romania"],"gender":"m"},{"word":"fântânilor","pos":"noun","definitions":["definite genitive/dative plural of fântână"]},{"word":"fântânioară","pos":"noun","definitions":["diminutive of fântână; small well"],"forms":{"plural":"fântânioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fântânioară","accusative-definite-nominative-singular":"fântânioara","accusative-indefinite-nominative-plural":"fântânioare","accusative-definite-nominative-plural":"fântânioarele","dative-genitive-indefinite-singular":"fântânioare","dative-definite-genitive-singular":"fântânioarei","dative-genitive-indefinite-plural":"fântânioare","dative-definite-genitive-plural":"fântânioarelor","singular-vocative":"fântânioară","plural-vocative":"fântânioarelor"}},{"word":"Fântânița","pos":"name","definitions":["a village in Miceștii de Câmpie, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"fântânița","pos":"noun","definitions":["definite nominative/accusative singular of fântâniță"]},{"word":"fântâniță","pos":"noun","definitions":["diminutive of fântână; small well"],"forms":{"plural":"fântânițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fântâniță","accusative-definite-nominative-singular":"fântânița","accusative-indefinite-nominative-plural":"fântânițe","accusative-definite-nominative-plural":"fântânițele","dative-genitive-indefinite-singular":"fântânițe","dative-definite-genitive-singular":"fântâniței","dative-genitive-indefinite-plural":"fântânițe","dative-definite-genitive-plural":"fântânițelor","singular-vocative":"fântâniță","plural-vocative":"fântânițelor"}},{"word":"fântânuță","pos":"noun","definitions":["diminutive of fântână"],"forms":{"plural":"fântânuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fântânuță","accusative-definite-nominative-singular":"fântânuța","accusative-indefinite-nominative-plural":"fântânuțe","accusative-definite-nominative-plural":"fântânuțele","dative-genitive-indefinite-singular":"fântânuțe","dative-definite-genitive-singular":"fântânuței","dative-genitive-indefinite-plural":"fântânuțe","dative-definite-genitive-plural":"fântânuțelor","singular-vocative":"fântânuță","plural-vocative":"fântânuțelor"}},{"word":"fantasc","pos":"adj","definitions":["whimsical"],"forms":{"feminine-singular":"fantască","masculine-plural":"fantaști","feminine-neuter-plural":"fantaște","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantasc","error-unrecognized-form-feminine-indefinite-singular":"fantască","error-unrecognized-form-indefinite-masculine-plural":"fantaști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fantaște","definite-error-unrecognized-form-masculine-neuter-singular":"fantascul","definite-error-unrecognized-form-feminine-singular":"fantasca","definite-error-unrecognized-form-masculine-plural":"fantaștii","definite-error-unrecognized-form-feminine-neuter-plural":"fantaștele"}},{"word":"fantasie","pos":"noun","definitions":["alternative form of fantezie"],"forms":{"plural":"fantasii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fantasie","accusative-definite-nominative-singular":"fantasia","accusative-indefinite-nominative-plural":"fantasii","accusative-definite-nominative-plural":"fantasiile","dative-genitive-indefinite-singular":"fantasii","dative-definite-genitive-singular":"fantasiei","dative-genitive-indefinite-plural":"fantasii","dative-definite-genitive-plural":"fantasiilor","singular-vocative":"fantasie","plural-vocative":"fantasiilor"}},{"word":"fantasin","pos":"noun","definitions":["foot soldier, infantryman"],"forms":{"plural":"fantasini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fantasin","accusative-definite-nominative-singular":"fantasinul","accusative-indefinite-nominative-plural":"fantasini","accusative-definite-nominative-plural":"fantasinii","dative-genitive-indefinite-singular":"fantasin","dative-definite-genitive-singular":"fantasinului","dative-genitive-indefinite-plural":"fantasini","dative-definite-genitive-plural":"fantasinilor","singular-vocative":"fantasinule","plural-vocative":"fantasinilor"}},{"word":"fantasma","pos":"noun","definitions":["definite nominative/accusative singular of fantasmă"],"pronunciation":"[fanˈtasma]","gender":"f"},{"word":"fantasmă","pos":"noun","definitions":["phantasm"],"forms":{"plural":"fantasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fantasmă","accusative-definite-nominative-singular":"fantasma","accusative-indefinite-nominative-plural":"fantasme","accusative-definite-nominative-plural":"fantasmele","dative-genitive-indefinite-singular":"fantasme","dative-definite-genitive-singular":"fantasmei","dative-genitive-indefinite-plural":"fantasme","dative-definite-genitive-plural":"fantasmelor","singular-vocative":"fantasmă","plural-vocative":"fantasmelor"}},{"word":"fantasmagoric","pos":"adj","definitions":["phantasmagoric"],"forms":{"feminine-singular":"fantasmagorică","masculine-plural":"fantasmagorici","feminine-neuter-plural":"fantasmagorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantasmagoric","error-unrecognized-form-feminine-indefinite-singular":"fantasmagorică","error-unrecognized-form-indefinite-masculine-plural":"fantasmagorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fantasmagorice","definite-error-unrecognized-form-masculine-neuter-singular":"fantasmagoricul","definite-error-unrecognized-form-feminine-singular":"fantasmagorica","definite-error-unrecognized-form-masculine-plural":"fantasmagoricii","definite-error-unrecognized-form-feminine-neuter-plural":"fantasmagoricele"}},{"word":"fantasmagorie","pos":"noun","definitions":["phantasmagoria","bizarre idea"],"forms":{"plural":"fantasmagorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fantasmagorie","accusative-definite-nominative-singular":"fantasmagoria","accusative-indefinite-nominative-plural":"fantasmagorii","accusative-definite-nominative-plural":"fantasmagoriile","dative-genitive-indefinite-singular":"fantasmagorii","dative-definite-genitive-singular":"fantasmagoriei","dative-genitive-indefinite-plural":"fantasmagorii","dative-definite-genitive-plural":"fantasmagoriilor","singular-vocative":"fantasmagorie","plural-vocative":"fantasmagoriilor"}},{"word":"fantasmatic","pos":"adj","definitions":["phantasmal"],"forms":{"feminine-singular":"fantasmatică","masculine-plural":"fantasmatici","feminine-neuter-plural":"fantasmatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantasmatic","error-unrecognized-form-feminine-indefinite-singular":"fantasmatică","error-unrecognized-form-indefinite-masculine-plural":"fantasmatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fantasmatice","definite-error-unrecognized-form-masculine-neuter-singular":"fantasmaticul","definite-error-unrecognized-form-feminine-singular":"fantasmatica","definite-error-unrecognized-form-masculine-plural":"fantasmaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fantasmaticele"}},{"word":"fantasme","pos":"noun","definitions":["inflection of fantasmă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[fanˈtasme]","gender":"f"},{"word":"fantast","pos":"noun","definitions":["fantast"],"forms":{"plural":"fantaști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fantast","accusative-definite-nominative-singular":"fantastul","accusative-indefinite-nominative-plural":"fantaști","accusative-definite-nominative-plural":"fantaștii","dative-genitive-indefinite-singular":"fantast","dative-definite-genitive-singular":"fantastului","dative-genitive-indefinite-plural":"fantaști","dative-definite-genitive-plural":"fantaștilor","singular-vocative":"fantastule","plural-vocative":"fantaștilor"}},{"word":"fantastă","pos":"noun","definitions":["female equivalent of fantast"],"forms":{"plural":"fantaste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fantastă","accusative-definite-nominative-singular":"fantasta","accusative-indefinite-nominative-plural":"fantaste","accusative-definite-nominative-plural":"fantastele","dative-genitive-indefinite-singular":"fantaste","dative-definite-genitive-singular":"fantastei","dative-genitive-indefinite-plural":"fantaste","dative-definite-genitive-plural":"fantastelor","singular-vocative":"fantastă","plural-vocative":"fantastelor"}},{"word":"fantastic","pos":"adj","definitions":["fantastic"],"forms":{"feminine-singular":"fantastică","masculine-plural":"fantastici","feminine-neuter-plural":"fantastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantastic","error-unrecognized-form-feminine-indefinite-singular":"fantastică","error-unrecognized-form-indefinite-masculine-plural":"fantastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fantastice","definite-error-unrecognized-form-masculine-neuter-singular":"fantasticul","definite-error-unrecognized-form-feminine-singular":"fantastica","definite-error-unrecognized-form-masculine-plural":"fantasticii","definite-error-unrecognized-form-feminine-neuter-plural":"fantasticele"}},{"word":"fantasticitate","pos":"noun","definitions":["fantasticalness"],"forms":{"plural":"fantasticitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fantasticitate","accusative-definite-nominative-singular":"fantasticitatea","accusative-indefinite-nominative-plural":"fantasticitatăți","accusative-definite-nominative-plural":"fantasticitatățile","dative-genitive-indefinite-singular":"fantasticitatăți","dative-definite-genitive-singular":"fantasticitatății","dative-genitive-indefinite-plural":"fantasticitatăți","dative-definite-genitive-plural":"fantasticitatăților","singular-vocative":"fantasticitate","plural-vocative":"fantasticitatăților"}},{"word":"fantazare","pos":"noun","definitions":["fantasization"],"forms":{"plural":"fantazări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fantazare","accusative-definite-nominative-singular":"fantazarea","accusative-indefinite-nominative-plural":"fantazări","accusative-definite-nominative-plural":"fantazările","dative-genitive-indefinite-singular":"fantazări","dative-definite-genitive-singular":"fantazării","dative-genitive-indefinite-plural":"fantazări","dative-definite-genitive-plural":"fantazărilor","singular-vocative":"fantazare","plural-vocative":"fantazărilor"}},{"word":"fantazie","pos":"noun","definitions":["alternative form of fantezie"],"forms":{"plural":"fantazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fantazie","accusative-definite-nominative-singular":"fantazia","accusative-indefinite-nominative-plural":"fantazii","accusative-definite-nominative-plural":"fantaziile","dative-genitive-indefinite-singular":"fantazii","dative-definite-genitive-singular":"fantaziei","dative-genitive-indefinite-plural":"fantazii","dative-definite-genitive-plural":"fantaziilor","singular-vocative":"fantazie","plural-vocative":"fantaziilor"}},{"word":"fante","pos":"noun","definitions":["womanizer","jack"],"forms":{"plural":"fanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fante","accusative-definite-nominative-singular":"fanteul","accusative-indefinite-nominative-plural":"fanți","accusative-definite-nominative-plural":"fanții","dative-genitive-indefinite-singular":"fante","dative-definite-genitive-singular":"fanteului","dative-genitive-indefinite-plural":"fanți","dative-definite-genitive-plural":"fanților","singular-vocative":"fanteule","plural-vocative":"fanților"}},{"word":"fantezia","pos":"noun","definitions":["definite nominative/accusative singular of fantezie"],"pronunciation":"[fanˈtezia]"},{"word":"fantezie","pos":"noun","definitions":["fantasy"],"pronunciation":"[fan.teˈzi.e]","forms":{"plural":"fantezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fantezie","accusative-definite-nominative-singular":"fantezia","accusative-indefinite-nominative-plural":"fantezii","accusative-definite-nominative-plural":"fanteziile","dative-genitive-indefinite-singular":"fantezii","dative-definite-genitive-singular":"fanteziei","dative-genitive-indefinite-plural":"fantezii","dative-definite-genitive-plural":"fanteziilor","singular-vocative":"fantezie","plural-vocative":"fanteziilor"}},{"word":"fanteziei","pos":"noun","definitions":["definite genitive/dative singular of fantezie"],"pronunciation":"[fanˈteziej]"},{"word":"fantezii","pos":"noun","definitions":["plural of fantezie"],"pronunciation":"[fanˈteziː]","gender":"f-p"},{"word":"fanteziile","pos":"noun","definitions":["definite nominative/accusative plural of fantezie"],"pronunciation":"[fanˈteziːle]"},{"word":"fanteziilor","pos":"noun","definitions":["definite genitive/dative plural of fantezie"],"pronunciation":"[fanˈteziːlor]"},{"word":"fantezist","pos":"adj","definitions":["imaginary","fanciful"],"forms":{"feminine-singular":"fantezistă","masculine-plural":"fanteziști","feminine-neuter-plural":"fanteziste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantezist","error-unrecognized-form-feminine-indefinite-singular":"fantezistă","error-unrecognized-form-indefinite-masculine-plural":"fanteziști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fanteziste","definite-error-unrecognized-form-masculine-neuter-singular":"fantezistul","definite-error-unrecognized-form-feminine-singular":"fantezista","definite-error-unrecognized-form-masculine-plural":"fanteziștii","definite-error-unrecognized-form-feminine-neuter-plural":"fantezistele"}},{"word":"fantom","pos":"noun","definitions":["obsolete form of fantomă"],"forms":{"plural":"fantomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fantom","accusative-definite-nominative-singular":"fantomul","accusative-indefinite-nominative-plural":"fantomuri","accusative-definite-nominative-plural":"fantomurile","dative-genitive-indefinite-singular":"fantom","dative-definite-genitive-singular":"fantomului","dative-genitive-indefinite-plural":"fantomuri","dative-definite-genitive-plural":"fantomurilor","singular-vocative":"fantomule","plural-vocative":"fantomurilor"}},{"word":"fantoma","pos":"noun","definitions":["definite nominative/accusative singular of fantomă"],"pronunciation":"[fanˈtoma]","gender":"f"},{"word":"fantomă","pos":"noun","definitions":["phantom"],"forms":{"plural":"fantome"}},{"word":"fantomatic","pos":"adj","definitions":["ghostly"],"forms":{"feminine-singular":"fantomatică","masculine-plural":"fantomatici","feminine-neuter-plural":"fantomatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fantomatic","error-unrecognized-form-feminine-indefinite-singular":"fantomatică","error-unrecognized-form-indefinite-masculine-plural":"fantomatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fantomatice","definite-error-unrecognized-form-masculine-neuter-singular":"fantomaticul","definite-error-unrecognized-form-feminine-singular":"fantomatica","definite-error-unrecognized-form-masculine-plural":"fantomaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fantomaticele"}},{"word":"fantome","pos":"noun","definitions":["inflection of fantomă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[fanˈtome]","gender":"f"},{"word":"fantoșă","pos":"noun","definitions":["puppet, marionette"],"forms":{"plural":"fantoșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fantoșă","accusative-definite-nominative-singular":"fantoșa","accusative-indefinite-nominative-plural":"fantoșe","accusative-definite-nominative-plural":"fantoșele","dative-genitive-indefinite-singular":"fantoșe","dative-definite-genitive-singular":"fantoșei","dative-genitive-indefinite-plural":"fantoșe","dative-definite-genitive-plural":"fantoșelor","singular-vocative":"fantoșă","plural-vocative":"fantoșelor"}},{"word":"fanum","pos":"noun","definitions":["fanum"],"forms":{"plural":"fanumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fanum","accusative-definite-nominative-singular":"fanumul","accusative-indefinite-nominative-plural":"fanumuri","accusative-definite-nominative-plural":"fanumurile","dative-genitive-indefinite-singular":"fanum","dative-definite-genitive-singular":"fanumului","dative-genitive-indefinite-plural":"fanumuri","dative-definite-genitive-plural":"fanumurilor","singular-vocative":"fanumule","plural-vocative":"fanumurilor"}},{"word":"Fănuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fănuț"}},{"word":"Fănuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fănuță"}},{"word":"fapt","pos":"noun","definitions":["fact","deed, event"],"pronunciation":"[fapt]","examples":[{"ro":"de fapt","en":"in fact, actually"},{"ro":"un fapt istoric","en":"a historic event"}],"forms":{"plural":"fapte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fapt","accusative-definite-nominative-singular":"faptul","accusative-indefinite-nominative-plural":"fapte","accusative-definite-nominative-plural":"faptele","dative-genitive-indefinite-singular":"fapt","dative-definite-genitive-singular":"faptului","dative-genitive-indefinite-plural":"fapte","dative-definite-genitive-plural":"faptelor","singular-vocative":"faptule","plural-vocative":"faptelor"}},{"word":"fapt penal","pos":"noun","definitions":["criminal offence"],"forms":{"plural":"fapte penale"}},{"word":"faptă","pos":"noun","definitions":["deed, action, doing","feat"],"pronunciation":"/ˈfap.tə/","forms":{"plural":"fapte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faptă","accusative-definite-nominative-singular":"fapta","accusative-indefinite-nominative-plural":"fapte","accusative-definite-nominative-plural":"faptele","dative-genitive-indefinite-singular":"fapte","dative-definite-genitive-singular":"faptei","dative-genitive-indefinite-plural":"fapte","dative-definite-genitive-plural":"faptelor","singular-vocative":"faptă","plural-vocative":"faptelor"}},{"word":"făptaș","pos":"noun","definitions":["perpetrator"],"pronunciation":"/fəpˈtaʃ/","forms":{"plural":"făptași","feminine":"equivalent făptașă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făptaș","accusative-definite-nominative-singular":"făptașul","accusative-indefinite-nominative-plural":"făptași","accusative-definite-nominative-plural":"făptașii","dative-genitive-indefinite-singular":"făptaș","dative-definite-genitive-singular":"făptașului","dative-genitive-indefinite-plural":"făptași","dative-definite-genitive-plural":"făptașilor","singular-vocative":"făptașule","plural-vocative":"făptașilor"}},{"word":"făptașă","pos":"noun","definitions":["female perpetrator"],"pronunciation":"/fəpˈta.ʃə/","forms":{"plural":"făptașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făptașă","accusative-definite-nominative-singular":"făptașa","accusative-indefinite-nominative-plural":"făptașe","accusative-definite-nominative-plural":"făptașele","dative-genitive-indefinite-singular":"făptașe","dative-definite-genitive-singular":"făptașei","dative-genitive-indefinite-plural":"făptașe","dative-definite-genitive-plural":"făptașelor","singular-vocative":"făptașă","plural-vocative":"făptașelor"}},{"word":"fapte","pos":"noun","definitions":["plural of fapt"],"pronunciation":"[ˈfap.te]"},{"word":"faptele","pos":"noun","definitions":["definite nominative/accusative plural of fapt"],"pronunciation":"[ˈfap.te.le]"},{"word":"Faptele Apostolilor","pos":"name","definitions":["Acts of the Apostles"],"gender":"f"},{"word":"faptelor","pos":"noun","definitions":["inflection of fapt:","definite genitive/dative plural","vocative plural"],"pronunciation":"[ˈfap.te.lor]"},{"word":"faptic","pos":"adj","definitions":["factual"],"forms":{"feminine-singular":"faptică","masculine-plural":"faptici","feminine-neuter-plural":"faptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faptic","error-unrecognized-form-feminine-indefinite-singular":"faptică","error-unrecognized-form-indefinite-masculine-plural":"faptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"faptice","definite-error-unrecognized-form-masculine-neuter-singular":"fapticul","definite-error-unrecognized-form-feminine-singular":"faptica","definite-error-unrecognized-form-masculine-plural":"fapticii","definite-error-unrecognized-form-feminine-neuter-plural":"fapticele"}},{"word":"făptui","pos":"verb","definitions":["to make, do","to commit, perpetrate"],"forms":{"canonical":"a făptui 4th conjugation","present-singular-third-person":"făptuiește","participle-past":"făptuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a făptui","gerund":"făptuind","first-person-indicative-present-singular":"făptuiesc","indicative-present-second-person-singular":"făptuiești","indicative-present-singular-third-person":"făptuiește","first-person-indicative-plural-present":"făptuim","indicative-plural-present-second-person":"făptuiți","indicative-plural-present-third-person":"făptuiesc","first-person-imperfect-indicative-singular":"făptuiam","imperfect-indicative-second-person-singular":"făptuiai","imperfect-indicative-singular-third-person":"făptuia","first-person-imperfect-indicative-plural":"făptuiam","imperfect-indicative-plural-second-person":"făptuiați","imperfect-indicative-plural-third-person":"făptuiau","first-person-indicative-perfect-singular":"făptuii","indicative-perfect-second-person-singular":"făptuiși","indicative-perfect-singular-third-person":"făptui","first-person-indicative-perfect-plural":"făptuirăm","indicative-perfect-plural-second-person":"făptuirăți","indicative-perfect-plural-third-person":"făptuiră","first-person-indicative-pluperfect-singular":"făptuisem","indicative-pluperfect-second-person-singular":"făptuiseși","indicative-pluperfect-singular-third-person":"făptuise","first-person-indicative-pluperfect-plural":"făptuiserăm","indicative-pluperfect-plural-second-person":"făptuiserăți","indicative-pluperfect-plural-third-person":"făptuiseră","first-person-present-singular-subjunctive":"să făptuiesc","present-second-person-singular-subjunctive":"să făptuiești","present-singular-subjunctive-third-person":"să făptuiască","first-person-plural-present-subjunctive":"să făptuim","plural-present-second-person-subjunctive":"să făptuiți","plural-present-subjunctive-third-person":"să făptuiască","imperative-second-person-singular":"făptuiește","imperative-plural-second-person":"făptuiți","imperative-negative-second-person-singular":"nu făptui","imperative-negative-plural-second-person":"nu făptuiți"}},{"word":"făptuire","pos":"noun","definitions":["creation"],"forms":{"plural":"făptuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"făptuire","accusative-definite-nominative-singular":"făptuirea","accusative-indefinite-nominative-plural":"făptuiri","accusative-definite-nominative-plural":"făptuirile","dative-genitive-indefinite-singular":"făptuiri","dative-definite-genitive-singular":"făptuirii","dative-genitive-indefinite-plural":"făptuiri","dative-definite-genitive-plural":"făptuirilor","singular-vocative":"făptuire","plural-vocative":"făptuirilor"}},{"word":"făptuitoare","pos":"noun","definitions":["female equivalent of făptuitor"],"forms":{"plural":"făptuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"făptuitoare","accusative-definite-nominative-singular":"făptuitoarea","accusative-indefinite-nominative-plural":"făptuitoare","accusative-definite-nominative-plural":"făptuitoarele","dative-genitive-indefinite-singular":"făptuitoare","dative-definite-genitive-singular":"făptuitoarei","dative-genitive-indefinite-plural":"făptuitoare","dative-definite-genitive-plural":"făptuitoarelor","singular-vocative":"făptuitoare","plural-vocative":"făptuitoarelor"}},{"word":"făptuitor","pos":"noun","definitions":["offender"],"forms":{"plural":"făptuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făptuitor","accusative-definite-nominative-singular":"făptuitorul","accusative-indefinite-nominative-plural":"făptuitori","accusative-definite-nominative-plural":"făptuitorii","dative-genitive-indefinite-singular":"făptuitor","dative-definite-genitive-singular":"făptuitorului","dative-genitive-indefinite-plural":"făptuitori","dative-definite-genitive-plural":"făptuitorilor","singular-vocative":"făptuitorule","plural-vocative":"făptuitorilor"}},{"word":"faptul","pos":"noun","definitions":["definite nominative/accusative singular of fapt"],"pronunciation":"/ˈfap.tul/"},{"word":"faptule","pos":"noun","definitions":["vocative singular of fapt"]},{"word":"faptului","pos":"noun","definitions":["definite dative/genitive singular of fapt"],"pronunciation":"[ˈfap.tu.luj]"},{"word":"făptură","pos":"noun","definitions":["creature, being","figure, form, shape","stature, build","nature"],"pronunciation":"/fəpˈtu.rə/","forms":{"plural":"făpturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"făptură","accusative-definite-nominative-singular":"făptura","accusative-indefinite-nominative-plural":"făpturi","accusative-definite-nominative-plural":"făpturile","dative-genitive-indefinite-singular":"făpturi","dative-definite-genitive-singular":"făpturii","dative-genitive-indefinite-plural":"făpturi","dative-definite-genitive-plural":"făpturilor","singular-vocative":"făptură","plural-vocative":"făpturilor"}},{"word":"făpturi","pos":"noun","definitions":["plural of făptură"],"pronunciation":"/fəpˈturʲ/"},{"word":"far","pos":"noun","definitions":["lighthouse","beacon","car headlight"],"pronunciation":"/far/","forms":{"plural":"faruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"far","accusative-definite-nominative-singular":"farul","accusative-indefinite-nominative-plural":"faruri","accusative-definite-nominative-plural":"farurile","dative-genitive-indefinite-singular":"far","dative-definite-genitive-singular":"farului","dative-genitive-indefinite-plural":"faruri","dative-definite-genitive-plural":"farurilor","singular-vocative":"farule","plural-vocative":"farurilor"}},{"word":"fără","pos":"prep","definitions":["without","free"],"pronunciation":"[ˈfə.rə]","examples":[{"ro":"Pleacă fără mine.","en":"Go without me."},{"ro":"lapte fără grăsime.","en":"Fat-free milk."}]},{"word":"fără cusur","pos":"adj","definitions":["flawless, perfect"],"forms":{"feminine-singular":"fără cusură","masculine-plural":"fără cusuri","feminine-neuter-plural":"fără cusure"}},{"word":"fără doar și poate","pos":"adv","definitions":["without a doubt"]},{"word":"fără perdea","pos":"adv","definitions":["indecently, inappropriately","directly"]},{"word":"farad","pos":"noun","definitions":["farad"],"forms":{"plural":"farazi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farad","accusative-definite-nominative-singular":"faradul","accusative-indefinite-nominative-plural":"farazi","accusative-definite-nominative-plural":"farazii","dative-genitive-indefinite-singular":"farad","dative-definite-genitive-singular":"faradului","dative-genitive-indefinite-plural":"farazi","dative-definite-genitive-plural":"farazilor","singular-vocative":"faradule","plural-vocative":"farazilor"}},{"word":"fărădelege","pos":"noun","definitions":["crime, misdeed, ill deed, offence, wrongdoing","contravention, trespass, infringement","blasphemy, sacrilege","outrage"],"forms":{"plural":"fărădelegi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărădelege","accusative-definite-nominative-singular":"fărădelegea","accusative-indefinite-nominative-plural":"fărădelegi","accusative-definite-nominative-plural":"fărădelegile","dative-genitive-indefinite-singular":"fărădelegi","dative-definite-genitive-singular":"fărădelegii","dative-genitive-indefinite-plural":"fărădelegi","dative-definite-genitive-plural":"fărădelegilor","singular-vocative":"fărădelege","plural-vocative":"fărădelegilor"}},{"word":"fărădelege","pos":"adj","definitions":["criminal, doing wrong; wicked, base, abject"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărădelege","error-unrecognized-form-feminine-indefinite-singular":"fărădelege","error-unrecognized-form-indefinite-masculine-plural":"fărădelege","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărădelege","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"faradic","pos":"adj","definitions":["faradic"],"forms":{"feminine-singular":"faradică","masculine-plural":"faradici","feminine-neuter-plural":"faradice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faradic","error-unrecognized-form-feminine-indefinite-singular":"faradică","error-unrecognized-form-indefinite-masculine-plural":"faradici","error-unrecognized-form-feminine-indefinite-neuter-plural":"faradice","definite-error-unrecognized-form-masculine-neuter-singular":"faradicul","definite-error-unrecognized-form-feminine-singular":"faradica","definite-error-unrecognized-form-masculine-plural":"faradicii","definite-error-unrecognized-form-feminine-neuter-plural":"faradicele"}},{"word":"faradizare","pos":"noun","definitions":["faradization"],"forms":{"plural":"faradizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"faradizare","accusative-definite-nominative-singular":"faradizarea","accusative-indefinite-nominative-plural":"faradizări","accusative-definite-nominative-plural":"faradizările","dative-genitive-indefinite-singular":"faradizări","dative-definite-genitive-singular":"faradizării","dative-genitive-indefinite-plural":"faradizări","dative-definite-genitive-plural":"faradizărilor","singular-vocative":"faradizare","plural-vocative":"faradizărilor"}},{"word":"faradmetru","pos":"noun","definitions":["faradmeter"],"forms":{"plural":"faradmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"faradmetru","accusative-definite-nominative-singular":"faradmetruul","accusative-indefinite-nominative-plural":"faradmetre","accusative-definite-nominative-plural":"faradmetrele","dative-genitive-indefinite-singular":"faradmetru","dative-definite-genitive-singular":"faradmetruului","dative-genitive-indefinite-plural":"faradmetre","dative-definite-genitive-plural":"faradmetrelor","singular-vocative":"faradmetruule","plural-vocative":"faradmetrelor"}},{"word":"faradoterapie","pos":"noun","definitions":["faradotherapy"],"forms":{"plural":"faradoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"faradoterapie","accusative-definite-nominative-singular":"faradoterapia","accusative-indefinite-nominative-plural":"faradoterapii","accusative-definite-nominative-plural":"faradoterapiile","dative-genitive-indefinite-singular":"faradoterapii","dative-definite-genitive-singular":"faradoterapiei","dative-genitive-indefinite-plural":"faradoterapii","dative-definite-genitive-plural":"faradoterapiilor","singular-vocative":"faradoterapie","plural-vocative":"faradoterapiilor"}},{"word":"Fărăgău","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Fărăgău, Mureș County, Romania"],"gender":"m"},{"word":"Fărăianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fărăianu"}},{"word":"fărălegi","pos":"verb","definitions":["to commit a crime"],"forms":{"canonical":"a fărălegi 4th conjugation","present-singular-third-person":"fărălegește","participle-past":"fărălegit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fărălegi","gerund":"fărălegind","first-person-indicative-present-singular":"fărălegesc","indicative-present-second-person-singular":"fărălegești","indicative-present-singular-third-person":"fărălegește","first-person-indicative-plural-present":"fărălegim","indicative-plural-present-second-person":"fărălegiți","indicative-plural-present-third-person":"fărălegesc","first-person-imperfect-indicative-singular":"fărălegeam","imperfect-indicative-second-person-singular":"fărălegeai","imperfect-indicative-singular-third-person":"fărălegea","first-person-imperfect-indicative-plural":"fărălegeam","imperfect-indicative-plural-second-person":"fărălegeați","imperfect-indicative-plural-third-person":"fărălegeau","first-person-indicative-perfect-singular":"fărălegii","indicative-perfect-second-person-singular":"fărălegiși","indicative-perfect-singular-third-person":"fărălegi","first-person-indicative-perfect-plural":"fărălegirăm","indicative-perfect-plural-second-person":"fărălegirăți","indicative-perfect-plural-third-person":"fărălegiră","first-person-indicative-pluperfect-singular":"fărălegisem","indicative-pluperfect-second-person-singular":"fărălegiseși","indicative-pluperfect-singular-third-person":"fărălegise","first-person-indicative-pluperfect-plural":"fărălegiserăm","indicative-pluperfect-plural-second-person":"fărălegiserăți","indicative-pluperfect-plural-third-person":"fărălegiseră","first-person-present-singular-subjunctive":"să fărălegesc","present-second-person-singular-subjunctive":"să fărălegești","present-singular-subjunctive-third-person":"să fărălegească","first-person-plural-present-subjunctive":"să fărălegim","plural-present-second-person-subjunctive":"să fărălegiți","plural-present-subjunctive-third-person":"să fărălegească","imperative-second-person-singular":"fărălegește","imperative-plural-second-person":"fărălegiți","imperative-negative-second-person-singular":"nu fărălegi","imperative-negative-plural-second-person":"nu fărălegiți"}},{"word":"fărâma","pos":"verb","definitions":["to knock, break, smash, or dash to pieces/smithereens; to crumble"],"forms":{"canonical":"a fărâma 1st conjugation","present-singular-third-person":"fărâmă","participle-past":"fărâmat","subjunctive-third-person":"fărâme","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fărâma","gerund":"fărâmând","first-person-indicative-present-singular":"fărâm","indicative-present-second-person-singular":"fărâmi","indicative-present-singular-third-person":"fărâmă","first-person-indicative-plural-present":"fărâmăm","indicative-plural-present-second-person":"fărâmați","indicative-plural-present-third-person":"fărâmă","first-person-imperfect-indicative-singular":"fărâmam","imperfect-indicative-second-person-singular":"fărâmai","imperfect-indicative-singular-third-person":"fărâma","first-person-imperfect-indicative-plural":"fărâmam","imperfect-indicative-plural-second-person":"fărâmați","imperfect-indicative-plural-third-person":"fărâmau","first-person-indicative-perfect-singular":"fărâmai","indicative-perfect-second-person-singular":"fărâmași","indicative-perfect-singular-third-person":"fărâmă","first-person-indicative-perfect-plural":"fărâmarăm","indicative-perfect-plural-second-person":"fărâmarăți","indicative-perfect-plural-third-person":"fărâmară","first-person-indicative-pluperfect-singular":"fărâmasem","indicative-pluperfect-second-person-singular":"fărâmaseși","indicative-pluperfect-singular-third-person":"fărâmase","first-person-indicative-pluperfect-plural":"fărâmaserăm","indicative-pluperfect-plural-second-person":"fărâmaserăți","indicative-pluperfect-plural-third-person":"fărâmaseră","first-person-present-singular-subjunctive":"să fărâm","present-second-person-singular-subjunctive":"să fărâmi","present-singular-subjunctive-third-person":"să fărâme","first-person-plural-present-subjunctive":"să fărâmăm","plural-present-second-person-subjunctive":"să fărâmați","plural-present-subjunctive-third-person":"să fărâme","imperative-second-person-singular":"fărâmă","imperative-plural-second-person":"fărâmați","imperative-negative-second-person-singular":"nu fărâma","imperative-negative-plural-second-person":"nu fărâmați","alternative":"fărma"}},{"word":"Fărâmă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fărâmă"}},{"word":"fărâmă","pos":"noun","definitions":["small piece","crumb"],"forms":{"plural":"fărâme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmă","accusative-definite-nominative-singular":"fărâma","accusative-indefinite-nominative-plural":"fărâme","accusative-definite-nominative-plural":"fărâmele","dative-genitive-indefinite-singular":"fărâme","dative-definite-genitive-singular":"fărâmei","dative-genitive-indefinite-plural":"fărâme","dative-definite-genitive-plural":"fărâmelor","singular-vocative":"fărâmă","plural-vocative":"fărâmelor"}},{"word":"fărâmare","pos":"noun","definitions":["crushing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"fărâmare","accusative-definite-nominative":"fărâmarea","dative-genitive-indefinite":"fărâmare","dative-definite-genitive":"fărâmarei","vocative":"fărâmare"}},{"word":"fărâmat","pos":"adj","definitions":["crushed"],"forms":{"feminine-singular":"fărâmată","masculine-plural":"fărâmați","feminine-neuter-plural":"fărâmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărâmat","error-unrecognized-form-feminine-indefinite-singular":"fărâmată","error-unrecognized-form-indefinite-masculine-plural":"fărâmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărâmate","definite-error-unrecognized-form-masculine-neuter-singular":"fărâmatul","definite-error-unrecognized-form-feminine-singular":"fărâmata","definite-error-unrecognized-form-masculine-plural":"fărâmații","definite-error-unrecognized-form-feminine-neuter-plural":"fărâmatele"}},{"word":"fărămat","pos":"adj","definitions":["obsolete form of fărâmat"],"forms":{"feminine-singular":"fărămată","masculine-plural":"fărămați","feminine-neuter-plural":"fărămate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărămat","error-unrecognized-form-feminine-indefinite-singular":"fărămată","error-unrecognized-form-indefinite-masculine-plural":"fărămați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărămate","definite-error-unrecognized-form-masculine-neuter-singular":"fărămatul","definite-error-unrecognized-form-feminine-singular":"fărămata","definite-error-unrecognized-form-masculine-plural":"fărămații","definite-error-unrecognized-form-feminine-neuter-plural":"fărămatele"}},{"word":"fărâmător","pos":"noun","definitions":["crumbler"],"forms":{"plural":"fărâmătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fărâmător","accusative-definite-nominative-singular":"fărâmătorul","accusative-indefinite-nominative-plural":"fărâmătoare","accusative-definite-nominative-plural":"fărâmătoarele","dative-genitive-indefinite-singular":"fărâmător","dative-definite-genitive-singular":"fărâmătorului","dative-genitive-indefinite-plural":"fărâmătoare","dative-definite-genitive-plural":"fărâmătoarelor","singular-vocative":"fărâmătorule","plural-vocative":"fărâmătoarelor"}},{"word":"fărâmătură","pos":"noun","definitions":["crumb"],"forms":{"plural":"fărâmături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmătură","accusative-definite-nominative-singular":"fărâmătura","accusative-indefinite-nominative-plural":"fărâmăture","accusative-definite-nominative-plural":"fărâmăturele","dative-genitive-indefinite-singular":"fărâmăture","dative-definite-genitive-singular":"fărâmăturei","dative-genitive-indefinite-plural":"fărâmăture","dative-definite-genitive-plural":"fărâmăturelor","singular-vocative":"fărâmătură","plural-vocative":"fărâmăturelor"}},{"word":"fărămătură","pos":"noun","definitions":["obsolete form of fărâmătură"],"forms":{"plural":"fărămături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fărămătură","accusative-definite-nominative-singular":"fărămătura","accusative-indefinite-nominative-plural":"fărămături","accusative-definite-nominative-plural":"fărămăturile","dative-genitive-indefinite-singular":"fărămături","dative-definite-genitive-singular":"fărămăturii","dative-genitive-indefinite-plural":"fărămături","dative-definite-genitive-plural":"fărămăturilor","singular-vocative":"fărămătură","plural-vocative":"fărămăturilor"}},{"word":"fărâmături","pos":"verb","definitions":["to crumble"],"forms":{"canonical":"a fărâmături 4th conjugation","present-singular-third-person":"fărâmăturie","participle-past":"fărâmăturit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fărâmături","gerund":"fărâmăturind","first-person-indicative-present-singular":"fărâmătur","indicative-present-second-person-singular":"fărâmături","indicative-present-singular-third-person":"fărâmăture","first-person-indicative-plural-present":"fărâmăturim","indicative-plural-present-second-person":"fărâmăturiți","indicative-plural-present-third-person":"fărâmătur","first-person-imperfect-indicative-singular":"fărâmătuream","imperfect-indicative-second-person-singular":"fărâmătureai","imperfect-indicative-singular-third-person":"fărâmăturea","first-person-imperfect-indicative-plural":"fărâmătuream","imperfect-indicative-plural-second-person":"fărâmătureați","imperfect-indicative-plural-third-person":"fărâmătureau","first-person-indicative-perfect-singular":"fărâmăturii","indicative-perfect-second-person-singular":"fărâmăturiși","indicative-perfect-singular-third-person":"fărâmături","first-person-indicative-perfect-plural":"fărâmăturirăm","indicative-perfect-plural-second-person":"fărâmăturirăți","indicative-perfect-plural-third-person":"fărâmăturiră","first-person-indicative-pluperfect-singular":"fărâmăturisem","indicative-pluperfect-second-person-singular":"fărâmăturiseși","indicative-pluperfect-singular-third-person":"fărâmăturise","first-person-indicative-pluperfect-plural":"fărâmăturiserăm","indicative-pluperfect-plural-second-person":"fărâmăturiserăți","indicative-pluperfect-plural-third-person":"fărâmăturiseră","first-person-present-singular-subjunctive":"să fărâmătur","present-second-person-singular-subjunctive":"să fărâmături","present-singular-subjunctive-third-person":"să fărâmătură","first-person-plural-present-subjunctive":"să fărâmăturim","plural-present-second-person-subjunctive":"să fărâmăturiți","plural-present-subjunctive-third-person":"să fărâmătură","imperative-second-person-singular":"fărâmăture","imperative-plural-second-person":"fărâmăturiți","imperative-negative-second-person-singular":"nu fărâmături","imperative-negative-plural-second-person":"nu fărâmăturiți"}},{"word":"fărâmăturică","pos":"noun","definitions":["diminutive of fărâmătură"],"forms":{"plural":"fărâmăturele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmăturică","accusative-definite-nominative-singular":"fărâmăturica","accusative-indefinite-nominative-plural":"fărâmăturele","accusative-definite-nominative-plural":"fărâmăturelele","dative-genitive-indefinite-singular":"fărâmăturele","dative-definite-genitive-singular":"fărâmăturelei","dative-genitive-indefinite-plural":"fărâmăturele","dative-definite-genitive-plural":"fărâmăturelelor","singular-vocative":"fărâmăturică","plural-vocative":"fărâmăturelelor"}},{"word":"fărâmi","pos":"verb","definitions":["to crumble"],"forms":{"canonical":"a fărâmi 4th conjugation","present-singular-third-person":"fărâmie","participle-past":"fărâmit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fărâmi","gerund":"fărâmind","first-person-indicative-present-singular":"fărâm","indicative-present-second-person-singular":"fărâmi","indicative-present-singular-third-person":"fărâme","first-person-indicative-plural-present":"fărâmim","indicative-plural-present-second-person":"fărâmiți","indicative-plural-present-third-person":"fărâm","first-person-imperfect-indicative-singular":"fărâmeam","imperfect-indicative-second-person-singular":"fărâmeai","imperfect-indicative-singular-third-person":"fărâmea","first-person-imperfect-indicative-plural":"fărâmeam","imperfect-indicative-plural-second-person":"fărâmeați","imperfect-indicative-plural-third-person":"fărâmeau","first-person-indicative-perfect-singular":"fărâmii","indicative-perfect-second-person-singular":"fărâmiși","indicative-perfect-singular-third-person":"fărâmi","first-person-indicative-perfect-plural":"fărâmirăm","indicative-perfect-plural-second-person":"fărâmirăți","indicative-perfect-plural-third-person":"fărâmiră","first-person-indicative-pluperfect-singular":"fărâmisem","indicative-pluperfect-second-person-singular":"fărâmiseși","indicative-pluperfect-singular-third-person":"fărâmise","first-person-indicative-pluperfect-plural":"fărâmiserăm","indicative-pluperfect-plural-second-person":"fărâmiserăți","indicative-pluperfect-plural-third-person":"fărâmiseră","first-person-present-singular-subjunctive":"să fărâm","present-second-person-singular-subjunctive":"să fărâmi","present-singular-subjunctive-third-person":"să fărâmă","first-person-plural-present-subjunctive":"să fărâmim","plural-present-second-person-subjunctive":"să fărâmiți","plural-present-subjunctive-third-person":"să fărâmă","imperative-second-person-singular":"fărâme","imperative-plural-second-person":"fărâmiți","imperative-negative-second-person-singular":"nu fărâmi","imperative-negative-plural-second-person":"nu fărâmiți"}},{"word":"fărâmică","pos":"noun","definitions":["diminutive of fărâmă; small bit"],"forms":{"plural":"fărâmici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmică","accusative-definite-nominative-singular":"fărâmica","accusative-indefinite-nominative-plural":"fărâmice","accusative-definite-nominative-plural":"fărâmicele","dative-genitive-indefinite-singular":"fărâmice","dative-definite-genitive-singular":"fărâmicei","dative-genitive-indefinite-plural":"fărâmice","dative-definite-genitive-plural":"fărâmicelor","singular-vocative":"fărâmică","plural-vocative":"fărâmicelor"}},{"word":"fărâmicat","pos":"adj","definitions":["crumbled"],"forms":{"feminine-singular":"fărâmicată","masculine-plural":"fărâmicați","feminine-neuter-plural":"fărâmicate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărâmicat","error-unrecognized-form-feminine-indefinite-singular":"fărâmicată","error-unrecognized-form-indefinite-masculine-plural":"fărâmicați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărâmicate","definite-error-unrecognized-form-masculine-neuter-singular":"fărâmicatul","definite-error-unrecognized-form-feminine-singular":"fărâmicata","definite-error-unrecognized-form-masculine-plural":"fărâmicații","definite-error-unrecognized-form-feminine-neuter-plural":"fărâmicatele"}},{"word":"fărâmicat","pos":"verb","definitions":["past participle of fărâmica"],"forms":{"participle-past":"of fărâmica"}},{"word":"fărâmice","pos":"noun","definitions":["diminutive of fărâmă"],"forms":{"plural":"fărâmici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărâmice","accusative-definite-nominative-singular":"fărâmicea","accusative-indefinite-nominative-plural":"fărâmici","accusative-definite-nominative-plural":"fărâmicile","dative-genitive-indefinite-singular":"fărâmici","dative-definite-genitive-singular":"fărâmicii","dative-genitive-indefinite-plural":"fărâmici","dative-definite-genitive-plural":"fărâmicilor","singular-vocative":"fărâmice","plural-vocative":"fărâmicilor"}},{"word":"fărâmicios","pos":"adj","definitions":["crumbly"],"forms":{"feminine-singular":"fărâmicioasă","masculine-plural":"fărâmicioși","feminine-neuter-plural":"fărâmicioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărâmicios","error-unrecognized-form-feminine-indefinite-singular":"fărâmicioasă","error-unrecognized-form-indefinite-masculine-plural":"fărâmicioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărâmicioase","definite-error-unrecognized-form-masculine-neuter-singular":"fărâmiciosul","definite-error-unrecognized-form-feminine-singular":"fărâmicioasa","definite-error-unrecognized-form-masculine-plural":"fărâmicioșii","definite-error-unrecognized-form-feminine-neuter-plural":"fărâmicioasele"}},{"word":"fărâmit","pos":"adj","definitions":["crumbled"],"forms":{"feminine-singular":"fărâmită","masculine-plural":"fărâmiți","feminine-neuter-plural":"fărâmite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărâmit","error-unrecognized-form-feminine-indefinite-singular":"fărâmită","error-unrecognized-form-indefinite-masculine-plural":"fărâmiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărâmite","definite-error-unrecognized-form-masculine-neuter-singular":"fărâmitul","definite-error-unrecognized-form-feminine-singular":"fărâmita","definite-error-unrecognized-form-masculine-plural":"fărâmiții","definite-error-unrecognized-form-feminine-neuter-plural":"fărâmitele"}},{"word":"fărâmit","pos":"verb","definitions":["past participle of fărâmi"],"forms":{"participle-past":"of fărâmi"}},{"word":"fărâmița","pos":"verb","definitions":["to crumble"],"forms":{"canonical":"a fărâmița 1st conjugation","present-singular-third-person":"fărâmițează","participle-past":"fărâmițat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fărâmița","gerund":"fărâmițând","first-person-indicative-present-singular":"fărâmițez","indicative-present-second-person-singular":"fărâmițezi","indicative-present-singular-third-person":"fărâmițează","first-person-indicative-plural-present":"fărâmițăm","indicative-plural-present-second-person":"fărâmițați","indicative-plural-present-third-person":"fărâmițează","first-person-imperfect-indicative-singular":"fărâmițam","imperfect-indicative-second-person-singular":"fărâmițai","imperfect-indicative-singular-third-person":"fărâmița","first-person-imperfect-indicative-plural":"fărâmițam","imperfect-indicative-plural-second-person":"fărâmițați","imperfect-indicative-plural-third-person":"fărâmițau","first-person-indicative-perfect-singular":"fărâmițai","indicative-perfect-second-person-singular":"fărâmițași","indicative-perfect-singular-third-person":"fărâmiță","first-person-indicative-perfect-plural":"fărâmițarăm","indicative-perfect-plural-second-person":"fărâmițarăți","indicative-perfect-plural-third-person":"fărâmițară","first-person-indicative-pluperfect-singular":"fărâmițasem","indicative-pluperfect-second-person-singular":"fărâmițaseși","indicative-pluperfect-singular-third-person":"fărâmițase","first-person-indicative-pluperfect-plural":"fărâmițaserăm","indicative-pluperfect-plural-second-person":"fărâmițaserăți","indicative-pluperfect-plural-third-person":"fărâmițaseră","first-person-present-singular-subjunctive":"să fărâmițez","present-second-person-singular-subjunctive":"să fărâmițezi","present-singular-subjunctive-third-person":"să fărâmițeze","first-person-plural-present-subjunctive":"să fărâmițăm","plural-present-second-person-subjunctive":"să fărâmițați","plural-present-subjunctive-third-person":"să fărâmițeze","imperative-second-person-singular":"fărâmițează","imperative-plural-second-person":"fărâmițați","imperative-negative-second-person-singular":"nu fărâmița","imperative-negative-plural-second-person":"nu fărâmițați"}},{"word":"Fărâmiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fărâmiță"}},{"word":"fărâmiță","pos":"noun","definitions":["diminutive of fărâmă; small piece"],"forms":{"plural":"fărâmițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmiță","accusative-definite-nominative-singular":"fărâmița","accusative-indefinite-nominative-plural":"fărâmițe","accusative-definite-nominative-plural":"fărâmițele","dative-genitive-indefinite-singular":"fărâmițe","dative-definite-genitive-singular":"fărâmiței","dative-genitive-indefinite-plural":"fărâmițe","dative-definite-genitive-plural":"fărâmițelor","singular-vocative":"fărâmiță","plural-vocative":"fărâmițelor"}},{"word":"fărâmițare","pos":"noun","definitions":["grinding"],"forms":{"plural":"fărâmițări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărâmițare","accusative-definite-nominative-singular":"fărâmițarea","accusative-indefinite-nominative-plural":"fărâmițări","accusative-definite-nominative-plural":"fărâmițările","dative-genitive-indefinite-singular":"fărâmițări","dative-definite-genitive-singular":"fărâmițării","dative-genitive-indefinite-plural":"fărâmițări","dative-definite-genitive-plural":"fărâmițărilor","singular-vocative":"fărâmițare","plural-vocative":"fărâmițărilor"}},{"word":"fărâmițat","pos":"adj","definitions":["crumbled, disintegrated"],"forms":{"feminine-singular":"fărâmițată","masculine-plural":"fărâmițați","feminine-neuter-plural":"fărâmițate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărâmițat","error-unrecognized-form-feminine-indefinite-singular":"fărâmițată","error-unrecognized-form-indefinite-masculine-plural":"fărâmițați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărâmițate","definite-error-unrecognized-form-masculine-neuter-singular":"fărâmițatul","definite-error-unrecognized-form-feminine-singular":"fărâmițata","definite-error-unrecognized-form-masculine-plural":"fărâmițații","definite-error-unrecognized-form-feminine-neuter-plural":"fărâmițatele"}},{"word":"fărâmitură","pos":"noun","definitions":["alternative form of fărâmătură"],"forms":{"plural":"fărâmituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fărâmitură","accusative-definite-nominative-singular":"fărâmitura","accusative-indefinite-nominative-plural":"fărâmituri","accusative-definite-nominative-plural":"fărâmiturile","dative-genitive-indefinite-singular":"fărâmituri","dative-definite-genitive-singular":"fărâmiturii","dative-genitive-indefinite-plural":"fărâmituri","dative-definite-genitive-plural":"fărâmiturilor","singular-vocative":"fărâmitură","plural-vocative":"fărâmiturilor"}},{"word":"fărâmușă","pos":"noun","definitions":["diminutive of fărâmă"],"forms":{"plural":"fărâmușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărâmușă","accusative-definite-nominative-singular":"fărâmușa","accusative-indefinite-nominative-plural":"fărâmușe","accusative-definite-nominative-plural":"fărâmușele","dative-genitive-indefinite-singular":"fărâmușe","dative-definite-genitive-singular":"fărâmușei","dative-genitive-indefinite-plural":"fărâmușe","dative-definite-genitive-plural":"fărâmușelor","singular-vocative":"fărâmușă","plural-vocative":"fărâmușelor"}},{"word":"Făran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Făran"}},{"word":"farandolă","pos":"noun","definitions":["farandola"],"forms":{"plural":"farandole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farandolă","accusative-definite-nominative-singular":"farandola","accusative-indefinite-nominative-plural":"farandole","accusative-definite-nominative-plural":"farandolele","dative-genitive-indefinite-singular":"farandole","dative-definite-genitive-singular":"farandolei","dative-genitive-indefinite-plural":"farandole","dative-definite-genitive-plural":"farandolelor","singular-vocative":"farandolă","plural-vocative":"farandolelor"}},{"word":"faraoancă","pos":"noun","definitions":["gypsy woman"],"forms":{"plural":"faraoance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faraoancă","accusative-definite-nominative-singular":"faraoanca","accusative-indefinite-nominative-plural":"faraoance","accusative-definite-nominative-plural":"faraoancele","dative-genitive-indefinite-singular":"faraoance","dative-definite-genitive-singular":"faraoancei","dative-genitive-indefinite-plural":"faraoance","dative-definite-genitive-plural":"faraoancelor","singular-vocative":"faraoancă","plural-vocative":"faraoancelor"}},{"word":"Faraoanele","pos":"name","definitions":["a village in Vârteșcoiu, Vrancea County, Romania"],"gender":"m"},{"word":"Faraoani","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Faraoani, Bacău County, Romania"],"gender":"m"},{"word":"Faraon","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Faraon"}},{"word":"faraon","pos":"noun","definitions":["pharaoh","Gypsy, Roma","devil","synonym of faro (“faro”)"],"pronunciation":"/fa.raˈon/","forms":{"plural":"faraoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"faraon","accusative-definite-nominative-singular":"faraonul","accusative-indefinite-nominative-plural":"faraoni","accusative-definite-nominative-plural":"faraonii","dative-genitive-indefinite-singular":"faraon","dative-definite-genitive-singular":"faraonului","dative-genitive-indefinite-plural":"faraoni","dative-definite-genitive-plural":"faraonilor","singular-vocative":"faraonule","plural-vocative":"faraonilor"}},{"word":"Faraoneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Faraoneanu"}},{"word":"faraonic","pos":"adj","definitions":["pharaonic"],"forms":{"feminine-singular":"faraonică","masculine-plural":"faraonici","feminine-neuter-plural":"faraonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faraonic","error-unrecognized-form-feminine-indefinite-singular":"faraonică","error-unrecognized-form-indefinite-masculine-plural":"faraonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"faraonice","definite-error-unrecognized-form-masculine-neuter-singular":"faraonicul","definite-error-unrecognized-form-feminine-singular":"faraonica","definite-error-unrecognized-form-masculine-plural":"faraonicii","definite-error-unrecognized-form-feminine-neuter-plural":"faraonicele"}},{"word":"Făraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Făraru"}},{"word":"făraș","pos":"noun","definitions":["dustpan"],"pronunciation":"/fəˈraʃ/","forms":{"plural":"fărașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"făraș","accusative-definite-nominative-singular":"fărașul","accusative-indefinite-nominative-plural":"fărașe","accusative-definite-nominative-plural":"fărașele","dative-genitive-indefinite-singular":"făraș","dative-definite-genitive-singular":"fărașului","dative-genitive-indefinite-plural":"fărașe","dative-definite-genitive-plural":"fărașelor","singular-vocative":"fărașule","plural-vocative":"fărașelor","alternative":"foraș"}},{"word":"Fărășești","pos":"name","definitions":["a village in Pietroasa, Timiș County, Romania"],"gender":"m"},{"word":"Fărău","pos":"name","definitions":["a commune of Alba County, Romania","a village in Fărău, Alba County, Romania"],"gender":"m"},{"word":"farbă","pos":"noun","definitions":["paint, color"],"forms":{"plural":"fărburi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"farbă","accusative-definite-nominative-singular":"farba","accusative-indefinite-nominative-plural":"fărburi","accusative-definite-nominative-plural":"fărburile","dative-genitive-indefinite-singular":"fărburi","dative-definite-genitive-singular":"fărburii","dative-genitive-indefinite-plural":"fărburi","dative-definite-genitive-plural":"fărburilor","singular-vocative":"farbă","plural-vocative":"fărburilor"}},{"word":"fărbui","pos":"verb","definitions":["to paint"],"forms":{"canonical":"a fărbui 4th conjugation","present-singular-third-person":"fărbuiește","participle-past":"fărbuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fărbui","gerund":"fărbuind","first-person-indicative-present-singular":"fărbuiesc","indicative-present-second-person-singular":"fărbuiești","indicative-present-singular-third-person":"fărbuiește","first-person-indicative-plural-present":"fărbuim","indicative-plural-present-second-person":"fărbuiți","indicative-plural-present-third-person":"fărbuiesc","first-person-imperfect-indicative-singular":"fărbuiam","imperfect-indicative-second-person-singular":"fărbuiai","imperfect-indicative-singular-third-person":"fărbuia","first-person-imperfect-indicative-plural":"fărbuiam","imperfect-indicative-plural-second-person":"fărbuiați","imperfect-indicative-plural-third-person":"fărbuiau","first-person-indicative-perfect-singular":"fărbuii","indicative-perfect-second-person-singular":"fărbuiși","indicative-perfect-singular-third-person":"fărbui","first-person-indicative-perfect-plural":"fărbuirăm","indicative-perfect-plural-second-person":"fărbuirăți","indicative-perfect-plural-third-person":"fărbuiră","first-person-indicative-pluperfect-singular":"fărbuisem","indicative-pluperfect-second-person-singular":"fărbuiseși","indicative-pluperfect-singular-third-person":"fărbuise","first-person-indicative-pluperfect-plural":"fărbuiserăm","indicative-pluperfect-plural-second-person":"fărbuiserăți","indicative-pluperfect-plural-third-person":"fărbuiseră","first-person-present-singular-subjunctive":"să fărbuiesc","present-second-person-singular-subjunctive":"să fărbuiești","present-singular-subjunctive-third-person":"să fărbuiască","first-person-plural-present-subjunctive":"să fărbuim","plural-present-second-person-subjunctive":"să fărbuiți","plural-present-subjunctive-third-person":"să fărbuiască","imperative-second-person-singular":"fărbuiește","imperative-plural-second-person":"fărbuiți","imperative-negative-second-person-singular":"nu fărbui","imperative-negative-plural-second-person":"nu fărbuiți"}},{"word":"Farcaș","pos":"name","definitions":["a village in Reghiu, Vrancea County, Romania"],"gender":"f"},{"word":"Fărcaș","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Fărcaș, Dolj County, Romania","a surname from Hungarian"],"gender":"m"},{"word":"Farcașa","pos":"name","definitions":["a village in Răchitoasa, Bacău County, Romania","a commune of Neamț County, Romania","a village in Farcașa, Neamț County, Romania"],"gender":"f"},{"word":"Fărcașa","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Fărcașa, Maramureș County, Romania"],"gender":"f"},{"word":"Farcașanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Farcașanu"}},{"word":"Fărcașele","pos":"name","definitions":["a commune of Olt County, Romania","a village in Fărcașele, Olt County, Romania"],"gender":"m"},{"word":"Fărcășeni","pos":"name","definitions":["a village in Strunga, Iași County, Romania"],"gender":"m"},{"word":"Fărcășescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fărcășescu"}},{"word":"Fărcășești","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Fărcășești, Gorj County, Romania"],"gender":"m"},{"word":"Fărcășești Moșneni","pos":"name","definitions":["a village in Fărcășești, Gorj County, Romania"],"gender":"m"},{"word":"Fărcășu","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Tazlăul Sărat"],"gender":"m"},{"word":"Fărcașu de Jos","pos":"name","definitions":["a village in Fărcașele, Olt County, Romania"],"gender":"m"},{"word":"fard","pos":"noun","definitions":["make-up"],"forms":{"plural":"farduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fard","accusative-definite-nominative-singular":"fardul","accusative-indefinite-nominative-plural":"farduri","accusative-definite-nominative-plural":"fardurile","dative-genitive-indefinite-singular":"fard","dative-definite-genitive-singular":"fardului","dative-genitive-indefinite-plural":"farduri","dative-definite-genitive-plural":"fardurilor","singular-vocative":"fardule","plural-vocative":"fardurilor"}},{"word":"farda","pos":"verb","definitions":["to put make-up on"],"forms":{"canonical":"a farda 1st conjugation","present-singular-third-person":"fardează","participle-past":"fardat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a farda","gerund":"fardând","first-person-indicative-present-singular":"fardez","indicative-present-second-person-singular":"fardezi","indicative-present-singular-third-person":"fardează","first-person-indicative-plural-present":"fardăm","indicative-plural-present-second-person":"fardați","indicative-plural-present-third-person":"fardează","first-person-imperfect-indicative-singular":"fardam","imperfect-indicative-second-person-singular":"fardai","imperfect-indicative-singular-third-person":"farda","first-person-imperfect-indicative-plural":"fardam","imperfect-indicative-plural-second-person":"fardați","imperfect-indicative-plural-third-person":"fardau","first-person-indicative-perfect-singular":"fardai","indicative-perfect-second-person-singular":"fardași","indicative-perfect-singular-third-person":"fardă","first-person-indicative-perfect-plural":"fardarăm","indicative-perfect-plural-second-person":"fardarăți","indicative-perfect-plural-third-person":"fardară","first-person-indicative-pluperfect-singular":"fardasem","indicative-pluperfect-second-person-singular":"fardaseși","indicative-pluperfect-singular-third-person":"fardase","first-person-indicative-pluperfect-plural":"fardaserăm","indicative-pluperfect-plural-second-person":"fardaserăți","indicative-pluperfect-plural-third-person":"fardaseră","first-person-present-singular-subjunctive":"să fardez","present-second-person-singular-subjunctive":"să fardezi","present-singular-subjunctive-third-person":"să fardeze","first-person-plural-present-subjunctive":"să fardăm","plural-present-second-person-subjunctive":"să fardați","plural-present-subjunctive-third-person":"să fardeze","imperative-second-person-singular":"fardează","imperative-plural-second-person":"fardați","imperative-negative-second-person-singular":"nu farda","imperative-negative-plural-second-person":"nu fardați"}},{"word":"fardare","pos":"noun","definitions":["putting on make-up"],"forms":{"plural":"fardări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fardare","accusative-definite-nominative-singular":"fardarea","accusative-indefinite-nominative-plural":"fardări","accusative-definite-nominative-plural":"fardările","dative-genitive-indefinite-singular":"fardări","dative-definite-genitive-singular":"fardării","dative-genitive-indefinite-plural":"fardări","dative-definite-genitive-plural":"fardărilor","singular-vocative":"fardare","plural-vocative":"fardărilor"}},{"word":"Fârdea","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Fârdea, Timiș County, Romania"],"gender":"f"},{"word":"fărdelege","pos":"noun","definitions":["alternative form of fărădelege"],"forms":{"plural":"fărdelegi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărdelege","accusative-definite-nominative-singular":"fărdelegea","accusative-indefinite-nominative-plural":"fărdelegi","accusative-definite-nominative-plural":"fărdelegile","dative-genitive-indefinite-singular":"fărdelegi","dative-definite-genitive-singular":"fărdelegii","dative-genitive-indefinite-plural":"fărdelegi","dative-definite-genitive-plural":"fărdelegilor","singular-vocative":"fărdelege","plural-vocative":"fărdelegilor"}},{"word":"farduri","pos":"noun","definitions":["plural of fard"]},{"word":"faretră","pos":"noun","definitions":["a quiver"],"forms":{"plural":"faretre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faretră","accusative-definite-nominative-singular":"faretra","accusative-indefinite-nominative-plural":"faretre","accusative-definite-nominative-plural":"faretrele","dative-genitive-indefinite-singular":"faretre","dative-definite-genitive-singular":"faretrei","dative-genitive-indefinite-plural":"faretre","dative-definite-genitive-plural":"faretrelor","singular-vocative":"faretră","plural-vocative":"faretrelor"}},{"word":"farfara","pos":"noun","definitions":["windbag"],"forms":{"plural":"farfarale","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"farfara","accusative-definite-nominative-singular":"farfaraua","accusative-indefinite-nominative-plural":"farfarale","accusative-definite-nominative-plural":"farfaralele","dative-genitive-indefinite-singular":"farfarale","dative-definite-genitive-singular":"farfaralei","dative-genitive-indefinite-plural":"farfarale","dative-definite-genitive-plural":"farfaralelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"farfasit","pos":"adj","definitions":["picky"],"forms":{"feminine-singular":"farfasită","masculine-plural":"farfasiți","feminine-neuter-plural":"farfasite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farfasit","error-unrecognized-form-feminine-indefinite-singular":"farfasită","error-unrecognized-form-indefinite-masculine-plural":"farfasiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"farfasite","definite-error-unrecognized-form-masculine-neuter-singular":"farfasitul","definite-error-unrecognized-form-feminine-singular":"farfasita","definite-error-unrecognized-form-masculine-plural":"farfasiții","definite-error-unrecognized-form-feminine-neuter-plural":"farfasitele"}},{"word":"farfasit","pos":"noun","definitions":["picky person"],"forms":{"plural":"farfasiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farfasit","accusative-definite-nominative-singular":"farfasitul","accusative-indefinite-nominative-plural":"farfasiți","accusative-definite-nominative-plural":"farfasiții","dative-genitive-indefinite-singular":"farfasit","dative-definite-genitive-singular":"farfasitului","dative-genitive-indefinite-plural":"farfasiți","dative-definite-genitive-plural":"farfasiților","singular-vocative":"farfasitule","plural-vocative":"farfasiților"}},{"word":"farfasită","pos":"noun","definitions":["female equivalent of farfasit"],"forms":{"plural":"farfasite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farfasită","accusative-definite-nominative-singular":"farfasita","accusative-indefinite-nominative-plural":"farfasite","accusative-definite-nominative-plural":"farfasitele","dative-genitive-indefinite-singular":"farfasite","dative-definite-genitive-singular":"farfasitei","dative-genitive-indefinite-plural":"farfasite","dative-definite-genitive-plural":"farfasitelor","singular-vocative":"farfasită","plural-vocative":"farfasitelor"}},{"word":"farfurărie","pos":"noun","definitions":["a china set"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"farfurărie","accusative-definite-nominative":"farfurăria","dative-genitive-indefinite":"farfurării","dative-definite-genitive":"farfurăriei","vocative":"farfurărie"}},{"word":"farfurie","pos":"noun","definitions":["plate","porcelain"],"pronunciation":"[far.fuˈri.e]","forms":{"plural":"farfurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farfurie","accusative-definite-nominative-singular":"farfuria","accusative-indefinite-nominative-plural":"farfurii","accusative-definite-nominative-plural":"farfuriile","dative-genitive-indefinite-singular":"farfurii","dative-definite-genitive-singular":"farfuriei","dative-genitive-indefinite-plural":"farfurii","dative-definite-genitive-plural":"farfuriilor","singular-vocative":"farfurie","plural-vocative":"farfuriilor"}},{"word":"farfurie zburătoare","pos":"noun","definitions":["flying saucer"],"forms":{"plural":"farfurii zburătoare"}},{"word":"farfurigiu","pos":"noun","definitions":["porcelain merchant"],"forms":{"plural":"farfurigii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farfurigiu","accusative-definite-nominative-singular":"farfurigiuul","accusative-indefinite-nominative-plural":"farfurigii","accusative-definite-nominative-plural":"farfurigiii","dative-genitive-indefinite-singular":"farfurigiu","dative-definite-genitive-singular":"farfurigiuului","dative-genitive-indefinite-plural":"farfurigii","dative-definite-genitive-plural":"farfurigiilor","singular-vocative":"farfurigiuule","plural-vocative":"farfurigiilor"}},{"word":"farfurii","pos":"noun","definitions":["plural of farfurie"]},{"word":"farfurioară","pos":"noun","definitions":["diminutive of farfurie (“plate”)","saucer"],"forms":{"plural":"farfurioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farfurioară","accusative-definite-nominative-singular":"farfurioara","accusative-indefinite-nominative-plural":"farfurioare","accusative-definite-nominative-plural":"farfurioarele","dative-genitive-indefinite-singular":"farfurioare","dative-definite-genitive-singular":"farfurioarei","dative-genitive-indefinite-plural":"farfurioare","dative-definite-genitive-plural":"farfurioarelor","singular-vocative":"farfurioară","plural-vocative":"farfurioarelor"}},{"word":"farfuriuță","pos":"noun","definitions":["diminutive of farfurie; small plate"],"forms":{"plural":"farfuriuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farfuriuță","accusative-definite-nominative-singular":"farfuriuța","accusative-indefinite-nominative-plural":"farfuriuțe","accusative-definite-nominative-plural":"farfuriuțele","dative-genitive-indefinite-singular":"farfuriuțe","dative-definite-genitive-singular":"farfuriuței","dative-genitive-indefinite-plural":"farfuriuțe","dative-definite-genitive-plural":"farfuriuțelor","singular-vocative":"farfuriuță","plural-vocative":"farfuriuțelor"}},{"word":"fărgătău","pos":"noun","definitions":["latch"],"forms":{"plural":"fărgătaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fărgătău","accusative-definite-nominative-singular":"fărgătăuul","accusative-indefinite-nominative-plural":"fărgătaie","accusative-definite-nominative-plural":"fărgătaiele","dative-genitive-indefinite-singular":"fărgătău","dative-definite-genitive-singular":"fărgătăuului","dative-genitive-indefinite-plural":"fărgătaie","dative-definite-genitive-plural":"fărgătaielor","singular-vocative":"fărgătăuule","plural-vocative":"fărgătaielor"}},{"word":"fărgău","pos":"noun","definitions":["door handle"],"forms":{"plural":"fărgăe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fărgău","accusative-definite-nominative-singular":"fărgăuul","accusative-indefinite-nominative-plural":"fărgăe","accusative-definite-nominative-plural":"fărgăele","dative-genitive-indefinite-singular":"fărgău","dative-definite-genitive-singular":"fărgăuului","dative-genitive-indefinite-plural":"fărgăe","dative-definite-genitive-plural":"fărgăelor","singular-vocative":"fărgăuule","plural-vocative":"fărgăelor"}},{"word":"Fărîmă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fărîmă"}},{"word":"fărimitură","pos":"noun","definitions":["obsolete form of fărâmitură"],"forms":{"plural":"fărimituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fărimitură","accusative-definite-nominative-singular":"fărimitura","accusative-indefinite-nominative-plural":"fărimituri","accusative-definite-nominative-plural":"fărimiturile","dative-genitive-indefinite-singular":"fărimituri","dative-definite-genitive-singular":"fărimiturii","dative-genitive-indefinite-plural":"fărimituri","dative-definite-genitive-plural":"fărimiturilor","singular-vocative":"fărimitură","plural-vocative":"fărimiturilor"}},{"word":"farin","pos":"adj","definitions":["floury"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farin","error-unrecognized-form-feminine-indefinite-singular":"farin","error-unrecognized-form-indefinite-masculine-plural":"farin","error-unrecognized-form-feminine-indefinite-neuter-plural":"farin","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"fărină","pos":"noun","definitions":["alternative form of făină"],"forms":{"plural-rare":"fărinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"fărină","accusative-definite-nominative-singular":"fărina","accusative-indefinite-nominative-plural":"fărinuri","accusative-definite-nominative-plural":"fărinurile","dative-genitive-indefinite-singular":"fărini","dative-definite-genitive-singular":"fărinii","dative-genitive-indefinite-plural":"fărinuri","dative-definite-genitive-plural":"fărinurilor","singular-vocative":"fărină","plural-vocative":"fărinurilor"}},{"word":"farinaceu","pos":"adj","definitions":["farinaceous"],"forms":{"feminine-singular":"farinacee","masculine-plural":"farinacei","feminine-neuter-plural":"farinacee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farinaceu","error-unrecognized-form-feminine-indefinite-singular":"farinacee","error-unrecognized-form-indefinite-masculine-plural":"farinacei","error-unrecognized-form-feminine-indefinite-neuter-plural":"farinacee","definite-error-unrecognized-form-masculine-neuter-singular":"farinaceul","definite-error-unrecognized-form-feminine-singular":"farinaceea","definite-error-unrecognized-form-masculine-plural":"farinaceii","definite-error-unrecognized-form-feminine-neuter-plural":"farinaceele"}},{"word":"faringal","pos":"adj","definitions":["pharyngeal"],"forms":{"feminine-singular":"faringală","masculine-plural":"faringali","feminine-neuter-plural":"faringale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faringal","error-unrecognized-form-feminine-indefinite-singular":"faringală","error-unrecognized-form-indefinite-masculine-plural":"faringali","error-unrecognized-form-feminine-indefinite-neuter-plural":"faringale","definite-error-unrecognized-form-masculine-neuter-singular":"faringalul","definite-error-unrecognized-form-feminine-singular":"faringala","definite-error-unrecognized-form-masculine-plural":"faringalii","definite-error-unrecognized-form-feminine-neuter-plural":"faringalele"}},{"word":"faringe","pos":"noun","definitions":["pharynx"],"forms":{"plural":"faringe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"faringe","accusative-definite-nominative-singular":"faringeul","accusative-indefinite-nominative-plural":"faringe","accusative-definite-nominative-plural":"faringele","dative-genitive-indefinite-singular":"faringe","dative-definite-genitive-singular":"faringeului","dative-genitive-indefinite-plural":"faringe","dative-definite-genitive-plural":"faringelor","singular-vocative":"faringeule","plural-vocative":"faringelor"}},{"word":"faringian","pos":"adj","definitions":["pharyngeal"],"forms":{"feminine-singular":"faringiană","masculine-plural":"faringieni","feminine-neuter-plural":"faringiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faringian","error-unrecognized-form-feminine-indefinite-singular":"faringiană","error-unrecognized-form-indefinite-masculine-plural":"faringieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"faringiene","definite-error-unrecognized-form-masculine-neuter-singular":"faringianul","definite-error-unrecognized-form-feminine-singular":"faringiana","definite-error-unrecognized-form-masculine-plural":"faringienii","definite-error-unrecognized-form-feminine-neuter-plural":"faringienele"}},{"word":"faringism","pos":"noun","definitions":["pharyngism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"faringism","accusative-definite-nominative-singular":"faringismul","accusative-indefinite-nominative-plural":"faringisme","accusative-definite-nominative-plural":"faringismele","dative-genitive-indefinite-singular":"faringism","dative-definite-genitive-singular":"faringismului","dative-genitive-indefinite-plural":"faringisme","dative-definite-genitive-plural":"faringismelor","singular-vocative":"faringismule","plural-vocative":"faringismelor"}},{"word":"faringită","pos":"noun","definitions":["pharyngitis"],"forms":{"plural":"faringite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faringită","accusative-definite-nominative-singular":"faringita","accusative-indefinite-nominative-plural":"faringite","accusative-definite-nominative-plural":"faringitele","dative-genitive-indefinite-singular":"faringite","dative-definite-genitive-singular":"faringitei","dative-genitive-indefinite-plural":"faringite","dative-definite-genitive-plural":"faringitelor","singular-vocative":"faringită","plural-vocative":"faringitelor"}},{"word":"faringolaringită","pos":"noun","definitions":["pharyngolaryngitis"],"forms":{"plural":"faringolaringite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faringolaringită","accusative-definite-nominative-singular":"faringolaringita","accusative-indefinite-nominative-plural":"faringolaringite","accusative-definite-nominative-plural":"faringolaringitele","dative-genitive-indefinite-singular":"faringolaringite","dative-definite-genitive-singular":"faringolaringitei","dative-genitive-indefinite-plural":"faringolaringite","dative-definite-genitive-plural":"faringolaringitelor","singular-vocative":"faringolaringită","plural-vocative":"faringolaringitelor"}},{"word":"faringologie","pos":"noun","definitions":["pharyngology"],"forms":{"plural":"faringologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"faringologie","accusative-definite-nominative-singular":"faringologia","accusative-indefinite-nominative-plural":"faringologii","accusative-definite-nominative-plural":"faringologiile","dative-genitive-indefinite-singular":"faringologii","dative-definite-genitive-singular":"faringologiei","dative-genitive-indefinite-plural":"faringologii","dative-definite-genitive-plural":"faringologiilor","singular-vocative":"faringologie","plural-vocative":"faringologiilor"}},{"word":"faringoscop","pos":"noun","definitions":["pharyngoscope"],"forms":{"plural":"faringoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"faringoscop","accusative-definite-nominative-singular":"faringoscopul","accusative-indefinite-nominative-plural":"faringoscoape","accusative-definite-nominative-plural":"faringoscoapele","dative-genitive-indefinite-singular":"faringoscop","dative-definite-genitive-singular":"faringoscopului","dative-genitive-indefinite-plural":"faringoscoape","dative-definite-genitive-plural":"faringoscoapelor","singular-vocative":"faringoscopule","plural-vocative":"faringoscoapelor"}},{"word":"faringoscopie","pos":"noun","definitions":["pharyngoscopy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"faringoscopie","accusative-definite-nominative":"faringoscopia","dative-genitive-indefinite":"faringoscopii","dative-definite-genitive":"faringoscopiei","vocative":"faringoscopie"}},{"word":"faringospasm","pos":"noun","definitions":["pharyngospasm"],"forms":{"plural":"faringospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"faringospasm","accusative-definite-nominative-singular":"faringospasmul","accusative-indefinite-nominative-plural":"faringospasme","accusative-definite-nominative-plural":"faringospasmele","dative-genitive-indefinite-singular":"faringospasm","dative-definite-genitive-singular":"faringospasmului","dative-genitive-indefinite-plural":"faringospasme","dative-definite-genitive-plural":"faringospasmelor","singular-vocative":"faringospasmule","plural-vocative":"faringospasmelor"}},{"word":"faringostomie","pos":"noun","definitions":["pharyngostomy"],"forms":{"plural":"faringostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"faringostomie","accusative-definite-nominative-singular":"faringostomia","accusative-indefinite-nominative-plural":"faringostomii","accusative-definite-nominative-plural":"faringostomiile","dative-genitive-indefinite-singular":"faringostomii","dative-definite-genitive-singular":"faringostomiei","dative-genitive-indefinite-plural":"faringostomii","dative-definite-genitive-plural":"faringostomiilor","singular-vocative":"faringostomie","plural-vocative":"faringostomiilor"}},{"word":"faringotomie","pos":"noun","definitions":["pharyngotomy"],"forms":{"plural":"faringotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"faringotomie","accusative-definite-nominative-singular":"faringotomia","accusative-indefinite-nominative-plural":"faringotomii","accusative-definite-nominative-plural":"faringotomiile","dative-genitive-indefinite-singular":"faringotomii","dative-definite-genitive-singular":"faringotomiei","dative-genitive-indefinite-plural":"faringotomii","dative-definite-genitive-plural":"faringotomiilor","singular-vocative":"faringotomie","plural-vocative":"faringotomiilor"}},{"word":"farinograf","pos":"noun","definitions":["farinograph"],"forms":{"plural":"farinografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"farinograf","accusative-definite-nominative-singular":"farinograful","accusative-indefinite-nominative-plural":"farinografe","accusative-definite-nominative-plural":"farinografele","dative-genitive-indefinite-singular":"farinograf","dative-definite-genitive-singular":"farinografului","dative-genitive-indefinite-plural":"farinografe","dative-definite-genitive-plural":"farinografelor","singular-vocative":"farinografule","plural-vocative":"farinografelor"}},{"word":"farinos","pos":"adj","definitions":["floury"],"forms":{"feminine-singular":"farinoasă","masculine-plural":"farinoși","feminine-neuter-plural":"farinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farinos","error-unrecognized-form-feminine-indefinite-singular":"farinoasă","error-unrecognized-form-indefinite-masculine-plural":"farinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"farinoase","definite-error-unrecognized-form-masculine-neuter-singular":"farinosul","definite-error-unrecognized-form-feminine-singular":"farinoasa","definite-error-unrecognized-form-masculine-plural":"farinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"farinoasele"}},{"word":"farinx","pos":"noun","definitions":["pharynx"],"forms":{"plural":"farinxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"farinx","accusative-definite-nominative-singular":"farinxul","accusative-indefinite-nominative-plural":"farinxuri","accusative-definite-nominative-plural":"farinxurile","dative-genitive-indefinite-singular":"farinx","dative-definite-genitive-singular":"farinxului","dative-genitive-indefinite-plural":"farinxuri","dative-definite-genitive-plural":"farinxurilor","singular-vocative":"farinxule","plural-vocative":"farinxurilor"}},{"word":"fariseean","pos":"adj","definitions":["Pharisean"],"forms":{"feminine-singular":"fariseeană","masculine-plural":"fariseeni","feminine-neuter-plural":"fariseene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fariseean","error-unrecognized-form-feminine-indefinite-singular":"fariseeană","error-unrecognized-form-indefinite-masculine-plural":"fariseeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fariseene","definite-error-unrecognized-form-masculine-neuter-singular":"fariseeanul","definite-error-unrecognized-form-feminine-singular":"fariseeana","definite-error-unrecognized-form-masculine-plural":"fariseenii","definite-error-unrecognized-form-feminine-neuter-plural":"fariseenele"}},{"word":"fariseean","pos":"noun","definitions":["Pharisee"],"forms":{"plural":"fariseeani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fariseean","accusative-definite-nominative-singular":"fariseeanul","accusative-indefinite-nominative-plural":"fariseeani","accusative-definite-nominative-plural":"fariseeanii","dative-genitive-indefinite-singular":"fariseean","dative-definite-genitive-singular":"fariseeanului","dative-genitive-indefinite-plural":"fariseeani","dative-definite-genitive-plural":"fariseeanilor","singular-vocative":"fariseeanule","plural-vocative":"fariseeanilor"}},{"word":"fariseesc","pos":"adj","definitions":["Pharisean"],"forms":{"feminine-singular":"fariseească","plural":"fariseești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fariseesc","error-unrecognized-form-feminine-indefinite-singular":"fariseească","error-unrecognized-form-indefinite-masculine-plural":"fariseești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fariseești","definite-error-unrecognized-form-masculine-neuter-singular":"fariseescul","definite-error-unrecognized-form-feminine-singular":"fariseeasca","definite-error-unrecognized-form-masculine-plural":"fariseeștii","definite-error-unrecognized-form-feminine-neuter-plural":"fariseeștile"}},{"word":"fariseic","pos":"adj","definitions":["pharisaical"],"forms":{"feminine-singular":"fariseică","masculine-plural":"fariseici","feminine-neuter-plural":"fariseice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fariseic","error-unrecognized-form-feminine-indefinite-singular":"fariseică","error-unrecognized-form-indefinite-masculine-plural":"fariseici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fariseice","definite-error-unrecognized-form-masculine-neuter-singular":"fariseicul","definite-error-unrecognized-form-feminine-singular":"fariseica","definite-error-unrecognized-form-masculine-plural":"fariseicii","definite-error-unrecognized-form-feminine-neuter-plural":"fariseicele"}},{"word":"fariseism","pos":"noun","definitions":["pharisaism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fariseism","accusative-definite-nominative-singular":"fariseismul","accusative-indefinite-nominative-plural":"fariseisme","accusative-definite-nominative-plural":"fariseismele","dative-genitive-indefinite-singular":"fariseism","dative-definite-genitive-singular":"fariseismului","dative-genitive-indefinite-plural":"fariseisme","dative-definite-genitive-plural":"fariseismelor","singular-vocative":"fariseismule","plural-vocative":"fariseismelor"}},{"word":"Fariseu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fariseu"}},{"word":"fariseu","pos":"noun","definitions":["Pharisee","hypocrite"],"forms":{"plural":"farisei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fariseu","accusative-definite-nominative-singular":"fariseul","accusative-indefinite-nominative-plural":"farisei","accusative-definite-nominative-plural":"fariseii","dative-genitive-indefinite-singular":"fariseu","dative-definite-genitive-singular":"fariseului","dative-genitive-indefinite-plural":"farisei","dative-definite-genitive-plural":"fariseilor","singular-vocative":"fariseule","plural-vocative":"fariseilor"}},{"word":"fărma","pos":"verb","definitions":["alternative form of fărâma"],"forms":{"canonical":"a fărma 1st conjugation","present-singular-third-person":"farmă","participle-past":"fărmat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fărma","gerund":"fărmând","first-person-indicative-present-singular":"fărm","indicative-present-second-person-singular":"fărmi","indicative-present-singular-third-person":"farmă","first-person-indicative-plural-present":"fărmăm","indicative-plural-present-second-person":"fărmați","indicative-plural-present-third-person":"farmă","first-person-imperfect-indicative-singular":"fărmam","imperfect-indicative-second-person-singular":"fărmai","imperfect-indicative-singular-third-person":"fărma","first-person-imperfect-indicative-plural":"fărmam","imperfect-indicative-plural-second-person":"fărmați","imperfect-indicative-plural-third-person":"fărmau","first-person-indicative-perfect-singular":"fărmai","indicative-perfect-second-person-singular":"fărmași","indicative-perfect-singular-third-person":"fărmă","first-person-indicative-perfect-plural":"fărmarăm","indicative-perfect-plural-second-person":"fărmarăți","indicative-perfect-plural-third-person":"fărmară","first-person-indicative-pluperfect-singular":"fărmasem","indicative-pluperfect-second-person-singular":"fărmaseși","indicative-pluperfect-singular-third-person":"fărmase","first-person-indicative-pluperfect-plural":"fărmaserăm","indicative-pluperfect-plural-second-person":"fărmaserăți","indicative-pluperfect-plural-third-person":"fărmaseră","first-person-present-singular-subjunctive":"să fărm","present-second-person-singular-subjunctive":"să fărmi","present-singular-subjunctive-third-person":"să farme","first-person-plural-present-subjunctive":"să fărmăm","plural-present-second-person-subjunctive":"să fărmați","plural-present-subjunctive-third-person":"să farme","imperative-second-person-singular":"farmă","imperative-plural-second-person":"fărmați","imperative-negative-second-person-singular":"nu fărma","imperative-negative-plural-second-person":"nu fărmați"}},{"word":"fărmăca","pos":"verb","definitions":["alternative form of fermeca"],"forms":{"canonical":"a fărmăca 1st conjugation","present-singular-third-person":"farmăcă","participle-past":"fărmăcat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fărmăca","gerund":"fărmăcând","first-person-indicative-present-singular":"fărmăc","indicative-present-second-person-singular":"fărmăci","indicative-present-singular-third-person":"fărmăcă","first-person-indicative-plural-present":"fărmăcăm","indicative-plural-present-second-person":"fărmăcați","indicative-plural-present-third-person":"fărmăcă","first-person-imperfect-indicative-singular":"fărmăcam","imperfect-indicative-second-person-singular":"fărmăcai","imperfect-indicative-singular-third-person":"fărmăca","first-person-imperfect-indicative-plural":"fărmăcam","imperfect-indicative-plural-second-person":"fărmăcați","imperfect-indicative-plural-third-person":"fărmăcau","first-person-indicative-perfect-singular":"fărmăcai","indicative-perfect-second-person-singular":"fărmăcași","indicative-perfect-singular-third-person":"fărmăcă","first-person-indicative-perfect-plural":"fărmăcarăm","indicative-perfect-plural-second-person":"fărmăcarăți","indicative-perfect-plural-third-person":"fărmăcară","first-person-indicative-pluperfect-singular":"fărmăcasem","indicative-pluperfect-second-person-singular":"fărmăcaseși","indicative-pluperfect-singular-third-person":"fărmăcase","first-person-indicative-pluperfect-plural":"fărmăcaserăm","indicative-pluperfect-plural-second-person":"fărmăcaserăți","indicative-pluperfect-plural-third-person":"fărmăcaseră","first-person-present-singular-subjunctive":"să fărmăc","present-second-person-singular-subjunctive":"să fărmăci","present-singular-subjunctive-third-person":"să fărmăce","first-person-plural-present-subjunctive":"să fărmăcăm","plural-present-second-person-subjunctive":"să fărmăcați","plural-present-subjunctive-third-person":"să fărmăce","imperative-second-person-singular":"fărmăcă","imperative-plural-second-person":"fărmăcați","imperative-negative-second-person-singular":"nu fărmăca","imperative-negative-plural-second-person":"nu fărmăcați"}},{"word":"fărmăcăciune","pos":"noun","definitions":["a magic spell, charm."],"forms":{"plural":"fărmăcăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărmăcăciune","accusative-definite-nominative-singular":"fărmăcăciunea","accusative-indefinite-nominative-plural":"fărmăcăciuni","accusative-definite-nominative-plural":"fărmăcăciunile","dative-genitive-indefinite-singular":"fărmăcăciuni","dative-definite-genitive-singular":"fărmăcăciunii","dative-genitive-indefinite-plural":"fărmăcăciuni","dative-definite-genitive-plural":"fărmăcăciunilor","singular-vocative":"fărmăcăciune","plural-vocative":"fărmăcăciunilor"}},{"word":"fărmăcăresc","pos":"adj","definitions":["witchy, wizardly"],"forms":{"feminine-singular":"fărmăcărească","plural":"fărmăcărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărmăcăresc","error-unrecognized-form-feminine-indefinite-singular":"fărmăcărească","error-unrecognized-form-indefinite-masculine-plural":"fărmăcărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărmăcărești","definite-error-unrecognized-form-masculine-neuter-singular":"fărmăcărescul","definite-error-unrecognized-form-feminine-singular":"fărmăcăreasca","definite-error-unrecognized-form-masculine-plural":"fărmăcăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"fărmăcăreștile"}},{"word":"fărmăcat","pos":"adj","definitions":["alternative form of fermecat"],"forms":{"feminine-singular":"fărmăcată","masculine-plural":"fărmăcați","feminine-neuter-plural":"fărmăcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărmăcat","error-unrecognized-form-feminine-indefinite-singular":"fărmăcată","error-unrecognized-form-indefinite-masculine-plural":"fărmăcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărmăcate","definite-error-unrecognized-form-masculine-neuter-singular":"fărmăcatul","definite-error-unrecognized-form-feminine-singular":"fărmăcata","definite-error-unrecognized-form-masculine-plural":"fărmăcații","definite-error-unrecognized-form-feminine-neuter-plural":"fărmăcatele"}},{"word":"fărmăcător","pos":"adj","definitions":["alternative form of fermecător"],"forms":{"feminine-singular":"fărmăcătoare","masculine-plural":"fărmăcători","feminine-neuter-plural":"fărmăcătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărmăcător","error-unrecognized-form-feminine-indefinite-singular":"fărmăcătoare","error-unrecognized-form-indefinite-masculine-plural":"fărmăcători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărmăcătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fărmăcătorul","definite-error-unrecognized-form-feminine-singular":"fărmăcătoarea","definite-error-unrecognized-form-masculine-plural":"fărmăcătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fărmăcătoarele"}},{"word":"fărmăcesc","pos":"adj","definitions":["charming"],"forms":{"feminine-singular":"fărmăcească","plural":"fărmăcești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărmăcesc","error-unrecognized-form-feminine-indefinite-singular":"fărmăcească","error-unrecognized-form-indefinite-masculine-plural":"fărmăcești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărmăcești","definite-error-unrecognized-form-masculine-neuter-singular":"fărmăcescul","definite-error-unrecognized-form-feminine-singular":"fărmăceasca","definite-error-unrecognized-form-masculine-plural":"fărmăceștii","definite-error-unrecognized-form-feminine-neuter-plural":"fărmăceștile"}},{"word":"farmaceutic","pos":"adj","definitions":["pharmaceutical"],"forms":{"feminine-singular":"farmaceutică","masculine-plural":"farmaceutici","feminine-neuter-plural":"farmaceutice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farmaceutic","error-unrecognized-form-feminine-indefinite-singular":"farmaceutică","error-unrecognized-form-indefinite-masculine-plural":"farmaceutici","error-unrecognized-form-feminine-indefinite-neuter-plural":"farmaceutice","definite-error-unrecognized-form-masculine-neuter-singular":"farmaceuticul","definite-error-unrecognized-form-feminine-singular":"farmaceutica","definite-error-unrecognized-form-masculine-plural":"farmaceuticii","definite-error-unrecognized-form-feminine-neuter-plural":"farmaceuticele"}},{"word":"farmaceutică","pos":"noun","definitions":["pharmaceutics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farmaceutică","accusative-definite-nominative-singular":"farmaceutica","accusative-indefinite-nominative-plural":"farmaceutice","accusative-definite-nominative-plural":"farmaceuticele","dative-genitive-indefinite-singular":"farmaceutice","dative-definite-genitive-singular":"farmaceuticei","dative-genitive-indefinite-plural":"farmaceutice","dative-definite-genitive-plural":"farmaceuticelor","singular-vocative":"farmaceutică","plural-vocative":"farmaceuticelor"}},{"word":"farmacie","pos":"noun","definitions":["pharmacy"],"forms":{"plural":"farmacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmacie","accusative-definite-nominative-singular":"farmacia","accusative-indefinite-nominative-plural":"farmacii","accusative-definite-nominative-plural":"farmaciile","dative-genitive-indefinite-singular":"farmacii","dative-definite-genitive-singular":"farmaciei","dative-genitive-indefinite-plural":"farmacii","dative-definite-genitive-plural":"farmaciilor","singular-vocative":"farmacie","plural-vocative":"farmaciilor"}},{"word":"farmacist","pos":"noun","definitions":["pharmacist"],"pronunciation":"/far.maˈt͡ʃist/","forms":{"plural":"farmaciști","feminine":"equivalent farmacistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farmacist","accusative-definite-nominative-singular":"farmacistul","accusative-indefinite-nominative-plural":"farmaciști","accusative-definite-nominative-plural":"farmaciștii","dative-genitive-indefinite-singular":"farmacist","dative-definite-genitive-singular":"farmacistului","dative-genitive-indefinite-plural":"farmaciști","dative-definite-genitive-plural":"farmaciștilor","singular-vocative":"farmacistule","plural-vocative":"farmaciștilor"}},{"word":"farmacista","pos":"noun","definitions":["definite nominative/accusative singular of farmacistă"],"pronunciation":"[farmaˈt͡ʃista]","gender":"f"},{"word":"farmacistă","pos":"noun","definitions":["female equivalent of farmacist"],"pronunciation":"/far.maˈt͡ʃis.tə/","forms":{"plural":"farmaciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"farmacistă","accusative-definite-nominative-singular":"farmacista","accusative-indefinite-nominative-plural":"farmaciste","accusative-definite-nominative-plural":"farmacistele","dative-genitive-indefinite-singular":"farmaciste","dative-definite-genitive-singular":"farmacistei","dative-genitive-indefinite-plural":"farmaciste","dative-definite-genitive-plural":"farmacistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"farmaciste","pos":"noun","definitions":["plural of farmacistă"],"gender":"f"},{"word":"farmaciști","pos":"noun","definitions":["plural of farmacist"],"gender":"m"},{"word":"farmacodinamică","pos":"noun","definitions":["pharmacodynamics"],"forms":{"plural":"farmacodinamici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"farmacodinamică","accusative-definite-nominative-singular":"farmacodinamica","accusative-indefinite-nominative-plural":"farmacodinamici","accusative-definite-nominative-plural":"farmacodinamicile","dative-genitive-indefinite-singular":"farmacodinamici","dative-definite-genitive-singular":"farmacodinamicii","dative-genitive-indefinite-plural":"farmacodinamici","dative-definite-genitive-plural":"farmacodinamicilor","singular-vocative":"farmacodinamică","plural-vocative":"farmacodinamicilor"}},{"word":"farmacodinamie","pos":"noun","definitions":["pharmacodynamics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"farmacodinamie","accusative-definite-nominative":"farmacodinamia","dative-genitive-indefinite":"farmacodinamii","dative-definite-genitive":"farmacodinamiei","vocative":"farmacodinamie"}},{"word":"farmacofilie","pos":"noun","definitions":["pharmacophilia"],"forms":{"plural":"farmacofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmacofilie","accusative-definite-nominative-singular":"farmacofilia","accusative-indefinite-nominative-plural":"farmacofilii","accusative-definite-nominative-plural":"farmacofiliile","dative-genitive-indefinite-singular":"farmacofilii","dative-definite-genitive-singular":"farmacofiliei","dative-genitive-indefinite-plural":"farmacofilii","dative-definite-genitive-plural":"farmacofiliilor","singular-vocative":"farmacofilie","plural-vocative":"farmacofiliilor"}},{"word":"farmacofobie","pos":"noun","definitions":["pharmacophobia"],"forms":{"plural":"farmacofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmacofobie","accusative-definite-nominative-singular":"farmacofobia","accusative-indefinite-nominative-plural":"farmacofobii","accusative-definite-nominative-plural":"farmacofobiile","dative-genitive-indefinite-singular":"farmacofobii","dative-definite-genitive-singular":"farmacofobiei","dative-genitive-indefinite-plural":"farmacofobii","dative-definite-genitive-plural":"farmacofobiilor","singular-vocative":"farmacofobie","plural-vocative":"farmacofobiilor"}},{"word":"farmacografie","pos":"noun","definitions":["pharmacography"],"forms":{"plural":"farmacografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmacografie","accusative-definite-nominative-singular":"farmacografia","accusative-indefinite-nominative-plural":"farmacografii","accusative-definite-nominative-plural":"farmacografiile","dative-genitive-indefinite-singular":"farmacografii","dative-definite-genitive-singular":"farmacografiei","dative-genitive-indefinite-plural":"farmacografii","dative-definite-genitive-plural":"farmacografiilor","singular-vocative":"farmacografie","plural-vocative":"farmacografiilor"}},{"word":"farmacolog","pos":"noun","definitions":["pharmacologist"],"pronunciation":"/far.ma.koˈloɡ/","forms":{"plural":"farmacologi","feminine":"equivalent farmacologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farmacolog","accusative-definite-nominative-singular":"farmacologul","accusative-indefinite-nominative-plural":"farmacologi","accusative-definite-nominative-plural":"farmacologii","dative-genitive-indefinite-singular":"farmacolog","dative-definite-genitive-singular":"farmacologului","dative-genitive-indefinite-plural":"farmacologi","dative-definite-genitive-plural":"farmacologilor","singular-vocative":"farmacologule","plural-vocative":"farmacologilor"}},{"word":"farmacologa","pos":"noun","definitions":["definite nominative/accusative singular of farmacologă"]},{"word":"farmacologă","pos":"noun","definitions":["female equivalent of farmacolog"],"pronunciation":"/far.ma.koˈlo.ɡə/","forms":{"plural":"farmacologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"farmacologă","accusative-definite-nominative-singular":"farmacologa","accusative-indefinite-nominative-plural":"farmacologe","accusative-definite-nominative-plural":"farmacologele","dative-genitive-indefinite-singular":"farmacologe","dative-definite-genitive-singular":"farmacologei","dative-genitive-indefinite-plural":"farmacologe","dative-definite-genitive-plural":"farmacologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"farmacologe","pos":"noun","definitions":["plural of farmacologă"],"gender":"f"},{"word":"farmacologi","pos":"noun","definitions":["plural of farmacolog"],"gender":"m"},{"word":"farmacologic","pos":"adj","definitions":["pharmacological"],"forms":{"feminine-singular":"farmacologică","masculine-plural":"farmacologici","feminine-neuter-plural":"farmacologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"farmacologic","error-unrecognized-form-feminine-indefinite-singular":"farmacologică","error-unrecognized-form-indefinite-masculine-plural":"farmacologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"farmacologice","definite-error-unrecognized-form-masculine-neuter-singular":"farmacologicul","definite-error-unrecognized-form-feminine-singular":"farmacologica","definite-error-unrecognized-form-masculine-plural":"farmacologicii","definite-error-unrecognized-form-feminine-neuter-plural":"farmacologicele"}},{"word":"farmacologie","pos":"noun","definitions":["pharmacology"]},{"word":"farmacomanie","pos":"noun","definitions":["pharmacomania"],"forms":{"plural":"farmacomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmacomanie","accusative-definite-nominative-singular":"farmacomania","accusative-indefinite-nominative-plural":"farmacomanii","accusative-definite-nominative-plural":"farmacomaniile","dative-genitive-indefinite-singular":"farmacomanii","dative-definite-genitive-singular":"farmacomaniei","dative-genitive-indefinite-plural":"farmacomanii","dative-definite-genitive-plural":"farmacomaniilor","singular-vocative":"farmacomanie","plural-vocative":"farmacomaniilor"}},{"word":"farmacopee","pos":"noun","definitions":["pharmacopoeia"],"forms":{"plural":"farmacopei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"farmacopee","accusative-definite-nominative-singular":"farmacopeea","accusative-indefinite-nominative-plural":"farmacopee","accusative-definite-nominative-plural":"farmacopeele","dative-genitive-indefinite-singular":"farmacopee","dative-definite-genitive-singular":"farmacopeei","dative-genitive-indefinite-plural":"farmacopee","dative-definite-genitive-plural":"farmacopeelor","singular-vocative":"farmacopee","plural-vocative":"farmacopeelor"}},{"word":"farmacoterapie","pos":"noun","definitions":["pharmacotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"farmacoterapie","accusative-definite-nominative":"farmacoterapia","dative-genitive-indefinite":"farmacoterapii","dative-definite-genitive":"farmacoterapiei","vocative":"farmacoterapie"}},{"word":"farmacovigilență","pos":"noun","definitions":["pharmacovigilance"],"forms":{"plural":"farmacovigilențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farmacovigilență","accusative-definite-nominative-singular":"farmacovigilența","accusative-indefinite-nominative-plural":"farmacovigilențe","accusative-definite-nominative-plural":"farmacovigilențele","dative-genitive-indefinite-singular":"farmacovigilențe","dative-definite-genitive-singular":"farmacovigilenței","dative-genitive-indefinite-plural":"farmacovigilențe","dative-definite-genitive-plural":"farmacovigilențelor","singular-vocative":"farmacovigilență","plural-vocative":"farmacovigilențelor"}},{"word":"fărmare","pos":"noun","definitions":["alternative form of fărâmare"],"forms":{"plural":"fărmări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fărmare","accusative-definite-nominative-singular":"fărmarea","accusative-indefinite-nominative-plural":"fărmări","accusative-definite-nominative-plural":"fărmările","dative-genitive-indefinite-singular":"fărmări","dative-definite-genitive-singular":"fărmării","dative-genitive-indefinite-plural":"fărmări","dative-definite-genitive-plural":"fărmărilor","singular-vocative":"fărmare","plural-vocative":"fărmărilor"}},{"word":"fărmat","pos":"adj","definitions":["alternative form of fărâmat"],"forms":{"feminine-singular":"fărmată","masculine-plural":"fărmați","feminine-neuter-plural":"fărmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărmat","error-unrecognized-form-feminine-indefinite-singular":"fărmată","error-unrecognized-form-indefinite-masculine-plural":"fărmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărmate","definite-error-unrecognized-form-masculine-neuter-singular":"fărmatul","definite-error-unrecognized-form-feminine-singular":"fărmata","definite-error-unrecognized-form-masculine-plural":"fărmații","definite-error-unrecognized-form-feminine-neuter-plural":"fărmatele"}},{"word":"fărmătură","pos":"noun","definitions":["alternative form of fărâmătură"],"forms":{"plural":"fărmături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fărmătură","accusative-definite-nominative-singular":"fărmătura","accusative-indefinite-nominative-plural":"fărmături","accusative-definite-nominative-plural":"fărmăturile","dative-genitive-indefinite-singular":"fărmături","dative-definite-genitive-singular":"fărmăturii","dative-genitive-indefinite-plural":"fărmături","dative-definite-genitive-plural":"fărmăturilor","singular-vocative":"fărmătură","plural-vocative":"fărmăturilor"}},{"word":"farmazoană","pos":"noun","definitions":["female equivalent of farmazon"],"forms":{"plural":"farmazoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farmazoană","accusative-definite-nominative-singular":"farmazoana","accusative-indefinite-nominative-plural":"farmazoane","accusative-definite-nominative-plural":"farmazoanele","dative-genitive-indefinite-singular":"farmazoane","dative-definite-genitive-singular":"farmazoanei","dative-genitive-indefinite-plural":"farmazoane","dative-definite-genitive-plural":"farmazoanelor","singular-vocative":"farmazoană","plural-vocative":"farmazoanelor"}},{"word":"Farmazon","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Farmazon"}},{"word":"farmazon","pos":"noun","definitions":["wizard","cunning man"],"forms":{"plural":"farmazoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farmazon","accusative-definite-nominative-singular":"farmazonul","accusative-indefinite-nominative-plural":"farmazoni","accusative-definite-nominative-plural":"farmazonii","dative-genitive-indefinite-singular":"farmazon","dative-definite-genitive-singular":"farmazonului","dative-genitive-indefinite-plural":"farmazoni","dative-definite-genitive-plural":"farmazonilor","singular-vocative":"farmazonule","plural-vocative":"farmazonilor"}},{"word":"farmazoni","pos":"noun","definitions":["plural of farmazon"]},{"word":"farmazonie","pos":"noun","definitions":["magic, spell"],"forms":{"plural":"farmazonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"farmazonie","accusative-definite-nominative-singular":"farmazonia","accusative-indefinite-nominative-plural":"farmazonii","accusative-definite-nominative-plural":"farmazoniile","dative-genitive-indefinite-singular":"farmazonii","dative-definite-genitive-singular":"farmazoniei","dative-genitive-indefinite-plural":"farmazonii","dative-definite-genitive-plural":"farmazoniilor","singular-vocative":"farmazonie","plural-vocative":"farmazoniilor"}},{"word":"farmec","pos":"noun","definitions":["magic spell, charm","charm, allurement (the qualities that draw people's attention)"],"pronunciation":"/ˈfar.mek/","forms":{"plural":"farmece","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"farmec","accusative-definite-nominative-singular":"farmecul","accusative-indefinite-nominative-plural":"farmece","accusative-definite-nominative-plural":"farmecele","dative-genitive-indefinite-singular":"farmec","dative-definite-genitive-singular":"farmecului","dative-genitive-indefinite-plural":"farmece","dative-definite-genitive-plural":"farmecelor","singular-vocative":"farmecule","plural-vocative":"farmecelor"}},{"word":"farniente","pos":"noun","definitions":["dolce far niente"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"farniente","accusative-definite-nominative":"farnienteul","dative-genitive-indefinite":"farniente","dative-definite-genitive":"farnienteului","vocative":"farnienteule"}},{"word":"fărobrăzie","pos":"noun","definitions":["impertinence, insolence"],"forms":{"plural":"fărobrăzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fărobrăzie","accusative-definite-nominative-singular":"fărobrăzia","accusative-indefinite-nominative-plural":"fărobrăzii","accusative-definite-nominative-plural":"fărobrăziile","dative-genitive-indefinite-singular":"fărobrăzii","dative-definite-genitive-singular":"fărobrăziei","dative-genitive-indefinite-plural":"fărobrăzii","dative-definite-genitive-plural":"fărobrăziilor","singular-vocative":"fărobrăzie","plural-vocative":"fărobrăziilor"}},{"word":"faroeză","pos":"noun","definitions":["female equivalent of faroez"],"forms":{"plural":"faroeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faroeză","accusative-definite-nominative-singular":"faroeza","accusative-indefinite-nominative-plural":"faroeze","accusative-definite-nominative-plural":"faroezele","dative-genitive-indefinite-singular":"faroeze","dative-definite-genitive-singular":"faroezei","dative-genitive-indefinite-plural":"faroeze","dative-definite-genitive-plural":"faroezelor","singular-vocative":"faroeză","plural-vocative":"faroezelor"}},{"word":"farsă","pos":"noun","definitions":["practical joke, farce"],"forms":{"plural":"farse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"farsă","accusative-definite-nominative-singular":"farsa","accusative-indefinite-nominative-plural":"farse","accusative-definite-nominative-plural":"farsele","dative-genitive-indefinite-singular":"farse","dative-definite-genitive-singular":"farsei","dative-genitive-indefinite-plural":"farse","dative-definite-genitive-plural":"farselor","singular-vocative":"farsă","plural-vocative":"farselor"}},{"word":"fărșang","pos":"noun","definitions":["carnival"],"forms":{"plural":"fărșanguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fărșang","accusative-definite-nominative-singular":"fărșangul","accusative-indefinite-nominative-plural":"fărșanguri","accusative-definite-nominative-plural":"fărșangurile","dative-genitive-indefinite-singular":"fărșang","dative-definite-genitive-singular":"fărșangului","dative-genitive-indefinite-plural":"fărșanguri","dative-definite-genitive-plural":"fărșangurilor","singular-vocative":"fărșangule","plural-vocative":"fărșangurilor"}},{"word":"fărșărot","pos":"noun","definitions":["Aromanian from Albania"],"pronunciation":"/fər.ʃəˈrot/","forms":{"plural":"fărșăroți","feminine":"equivalent fărșărotă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fărșărot","accusative-definite-nominative-singular":"fărșărotul","accusative-indefinite-nominative-plural":"fărșăroți","accusative-definite-nominative-plural":"fărșăroții","dative-genitive-indefinite-singular":"fărșărot","dative-definite-genitive-singular":"fărșărotului","dative-genitive-indefinite-plural":"fărșăroți","dative-definite-genitive-plural":"fărșăroților","singular-vocative":"fărșărotule","plural-vocative":"fărșăroților","alternative":"fărșerot"}},{"word":"fărșărotă","pos":"noun","definitions":["female equivalent of fărșărot"],"forms":{"plural":"fărșărote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărșărotă","accusative-definite-nominative-singular":"fărșărota","accusative-indefinite-nominative-plural":"fărșărote","accusative-definite-nominative-plural":"fărșărotele","dative-genitive-indefinite-singular":"fărșărote","dative-definite-genitive-singular":"fărșărotei","dative-genitive-indefinite-plural":"fărșărote","dative-definite-genitive-plural":"fărșărotelor","singular-vocative":"fărșărotă","plural-vocative":"fărșărotelor","alternative":"fărșerotă"}},{"word":"fărșărotesc","pos":"adj","definitions":["alternative form of fărșerotesc"],"pronunciation":"/fər.ʃə.rotˈesk/","forms":{"feminine-singular":"fărșărotească","plural":"fărșărotești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărșărotesc","error-unrecognized-form-feminine-indefinite-singular":"fărșărotească","error-unrecognized-form-indefinite-masculine-plural":"fărșărotești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărșărotești","definite-error-unrecognized-form-masculine-neuter-singular":"fărșărotescul","definite-error-unrecognized-form-feminine-singular":"fărșăroteasca","definite-error-unrecognized-form-masculine-plural":"fărșăroteștii","definite-error-unrecognized-form-feminine-neuter-plural":"fărșăroteștile","alternative":"fărșerotesc"}},{"word":"fârșerot","pos":"noun","definitions":["alternative form of fărșerot"],"pronunciation":"/fɨr.ʃeˈrot/","forms":{"plural":"fârşeroți","feminine":"equivalent fârșerotă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fârșerot","accusative-definite-nominative-singular":"fârșerotul","accusative-indefinite-nominative-plural":"fârşeroți","accusative-definite-nominative-plural":"fârşeroții","dative-genitive-indefinite-singular":"fârșerot","dative-definite-genitive-singular":"fârșerotului","dative-genitive-indefinite-plural":"fârşeroți","dative-definite-genitive-plural":"fârşeroților","singular-vocative":"fârșerotule","plural-vocative":"fârşeroților","alternative":"fărșerot"}},{"word":"fărșerot","pos":"noun","definitions":["Aromanian from Albania"],"pronunciation":"/fər.ʃeˈrot/","forms":{"plural":"fărșeroți","feminine":"equivalent fărșerotă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fărșerot","accusative-definite-nominative-singular":"fărșerotul","accusative-indefinite-nominative-plural":"fărșeroți","accusative-definite-nominative-plural":"fărșeroții","dative-genitive-indefinite-singular":"fărșerot","dative-definite-genitive-singular":"fărșerotului","dative-genitive-indefinite-plural":"fărșeroți","dative-definite-genitive-plural":"fărșeroților","singular-vocative":"fărșerotule","plural-vocative":"fărșeroților","alternative":"fărșărot"}},{"word":"fârșerotă","pos":"noun","definitions":["female equivalent of fărșerot"],"forms":{"plural":"fârșerote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fârșerotă","accusative-definite-nominative-singular":"fârșerota","accusative-indefinite-nominative-plural":"fârșerote","accusative-definite-nominative-plural":"fârșerotele","dative-genitive-indefinite-singular":"fârșerote","dative-definite-genitive-singular":"fârșerotei","dative-genitive-indefinite-plural":"fârșerote","dative-definite-genitive-plural":"fârșerotelor","singular-vocative":"fârșerotă","plural-vocative":"fârșerotelor","alternative":"fărșerotă"}},{"word":"fărșerotă","pos":"noun","definitions":["female equivalent of fărșerot"],"forms":{"plural":"fărșerote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fărșerotă","accusative-definite-nominative-singular":"fărșerota","accusative-indefinite-nominative-plural":"fărșerote","accusative-definite-nominative-plural":"fărșerotele","dative-genitive-indefinite-singular":"fărșerote","dative-definite-genitive-singular":"fărșerotei","dative-genitive-indefinite-plural":"fărșerote","dative-definite-genitive-plural":"fărșerotelor","singular-vocative":"fărșerotă","plural-vocative":"fărșerotelor","alternative":"fărșărotă"}},{"word":"fărșerotesc","pos":"adj","definitions":["Aromanian (of, from, or pertaining to the fărșerot people, the fărșerot dialect or the fărșerot culture)"],"pronunciation":"/fər.ʃe.rotˈesk/","forms":{"feminine-singular":"fărșerotească","plural":"fărșerotești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fărșerotesc","error-unrecognized-form-feminine-indefinite-singular":"fărșerotească","error-unrecognized-form-indefinite-masculine-plural":"fărșerotești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fărșerotești","definite-error-unrecognized-form-masculine-neuter-singular":"fărșerotescul","definite-error-unrecognized-form-feminine-singular":"fărșeroteasca","definite-error-unrecognized-form-masculine-plural":"fărșeroteștii","definite-error-unrecognized-form-feminine-neuter-plural":"fărșeroteștile","alternative":"fărșărotesc"}},{"word":"fârși","pos":"verb","definitions":["obsolete form of sfârși"],"forms":{"canonical":"a fârși 4th conjugation","present-singular-third-person":"fârșește","participle-past":"fârșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fârși","gerund":"fârșind","first-person-indicative-present-singular":"fârșesc","indicative-present-second-person-singular":"fârșești","indicative-present-singular-third-person":"fârșește","first-person-indicative-plural-present":"fârșim","indicative-plural-present-second-person":"fârșiți","indicative-plural-present-third-person":"fârșesc","first-person-imperfect-indicative-singular":"fârșeam","imperfect-indicative-second-person-singular":"fârșeai","imperfect-indicative-singular-third-person":"fârșea","first-person-imperfect-indicative-plural":"fârșeam","imperfect-indicative-plural-second-person":"fârșeați","imperfect-indicative-plural-third-person":"fârșeau","first-person-indicative-perfect-singular":"fârșii","indicative-perfect-second-person-singular":"fârșiși","indicative-perfect-singular-third-person":"fârși","first-person-indicative-perfect-plural":"fârșirăm","indicative-perfect-plural-second-person":"fârșirăți","indicative-perfect-plural-third-person":"fârșiră","first-person-indicative-pluperfect-singular":"fârșisem","indicative-pluperfect-second-person-singular":"fârșiseși","indicative-pluperfect-singular-third-person":"fârșise","first-person-indicative-pluperfect-plural":"fârșiserăm","indicative-pluperfect-plural-second-person":"fârșiserăți","indicative-pluperfect-plural-third-person":"fârșiseră","first-person-present-singular-subjunctive":"să fârșesc","present-second-person-singular-subjunctive":"să fârșești","present-singular-subjunctive-third-person":"să fârșească","first-person-plural-present-subjunctive":"să fârșim","plural-present-second-person-subjunctive":"să fârșiți","plural-present-subjunctive-third-person":"să fârșească","imperative-second-person-singular":"fârșește","imperative-plural-second-person":"fârșiți","imperative-negative-second-person-singular":"nu fârși","imperative-negative-plural-second-person":"nu fârșiți"}},{"word":"fârșit","pos":"noun","definitions":["alternative form of sfârșit"],"forms":{"plural":"fârșituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fârșit","accusative-definite-nominative-singular":"fârșitul","accusative-indefinite-nominative-plural":"fârșite","accusative-definite-nominative-plural":"fârșitele","dative-genitive-indefinite-singular":"fârșit","dative-definite-genitive-singular":"fârșitului","dative-genitive-indefinite-plural":"fârșite","dative-definite-genitive-plural":"fârșitelor","singular-vocative":"fârșitule","plural-vocative":"fârșitelor"}},{"word":"farsoare","pos":"noun","definitions":["female equivalent of farsor"],"forms":{"plural":"farsoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"farsoare","accusative-definite-nominative-singular":"farsoarea","accusative-indefinite-nominative-plural":"farsoare","accusative-definite-nominative-plural":"farsoarele","dative-genitive-indefinite-singular":"farsoare","dative-definite-genitive-singular":"farsoarei","dative-genitive-indefinite-plural":"farsoare","dative-definite-genitive-plural":"farsoarelor","singular-vocative":"farsoare","plural-vocative":"farsoarelor"}},{"word":"farsor","pos":"noun","definitions":["joker"],"forms":{"plural":"farsori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"farsor","accusative-definite-nominative-singular":"farsorul","accusative-indefinite-nominative-plural":"farsori","accusative-definite-nominative-plural":"farsorii","dative-genitive-indefinite-singular":"farsor","dative-definite-genitive-singular":"farsorului","dative-genitive-indefinite-plural":"farsori","dative-definite-genitive-plural":"farsorilor","singular-vocative":"farsorule","plural-vocative":"farsorilor"}},{"word":"fârtai","pos":"noun","definitions":["quarter"],"forms":{"plural":"fârtaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fârtai","accusative-definite-nominative-singular":"fârtaiul","accusative-indefinite-nominative-plural":"fârtaie","accusative-definite-nominative-plural":"fârtaiele","dative-genitive-indefinite-singular":"fârtai","dative-definite-genitive-singular":"fârtaiului","dative-genitive-indefinite-plural":"fârtaie","dative-definite-genitive-plural":"fârtaielor","singular-vocative":"fârtaiule","plural-vocative":"fârtaielor"}},{"word":"Fârțănești","pos":"name","definitions":["a commune of Galați County, Romania","a village in Fârțănești, Galați County, Romania"],"gender":"m"},{"word":"Fârtat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fârtat"}},{"word":"fârtat","pos":"noun","definitions":["bosom friend, bosom buddy, very close friend or comrade","blood brother (someone bound to another person in commitment and friendship by a ceremonial mingling of blood)"],"forms":{"plural":"fârtați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fârtat","accusative-definite-nominative-singular":"fârtatul","accusative-indefinite-nominative-plural":"fârtati","accusative-definite-nominative-plural":"fârtatii","dative-genitive-indefinite-singular":"fârtat","dative-definite-genitive-singular":"fârtatului","dative-genitive-indefinite-plural":"fârtati","dative-definite-genitive-plural":"fârtatilor","singular-vocative":"fârtatule","plural-vocative":"fârtatilor"}},{"word":"fărtat","pos":"noun","definitions":["alternative form of fârtat"],"forms":{"plural":"fărtați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fărtat","accusative-definite-nominative-singular":"fărtatul","accusative-indefinite-nominative-plural":"fărtați","accusative-definite-nominative-plural":"fărtații","dative-genitive-indefinite-singular":"fărtat","dative-definite-genitive-singular":"fărtatului","dative-genitive-indefinite-plural":"fărtați","dative-definite-genitive-plural":"fărtaților","singular-vocative":"fărtatule","plural-vocative":"fărtaților"}},{"word":"fărtățel","pos":"noun","definitions":["diminutive of fărtat"],"forms":{"plural":"fărtăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fărtățel","accusative-definite-nominative-singular":"fărtățelul","accusative-indefinite-nominative-plural":"fărtăței","accusative-definite-nominative-plural":"fărtățeii","dative-genitive-indefinite-singular":"fărtățel","dative-definite-genitive-singular":"fărtățelului","dative-genitive-indefinite-plural":"fărtăței","dative-definite-genitive-plural":"fărtățeilor","singular-vocative":"fărtățelule","plural-vocative":"fărtățeilor"}},{"word":"Fârtățești","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Fârtățești, Vâlcea County, Romania"],"gender":"m"},{"word":"fârticușă","pos":"noun","definitions":["damson"],"forms":{"plural":"fârticușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fârticușă","accusative-definite-nominative-singular":"fârticușa","accusative-indefinite-nominative-plural":"fârticușe","accusative-definite-nominative-plural":"fârticușele","dative-genitive-indefinite-singular":"fârticușe","dative-definite-genitive-singular":"fârticușei","dative-genitive-indefinite-plural":"fârticușe","dative-definite-genitive-plural":"fârticușelor","singular-vocative":"fârticușă","plural-vocative":"fârticușelor"}},{"word":"fârțos","pos":"adj","definitions":["gossiping"],"forms":{"feminine-singular":"fârțoasă","masculine-plural":"fârțoși","feminine-neuter-plural":"fârțoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fârțos","error-unrecognized-form-feminine-indefinite-singular":"fârțoasă","error-unrecognized-form-indefinite-masculine-plural":"fârțoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fârțoase","definite-error-unrecognized-form-masculine-neuter-singular":"fârțosul","definite-error-unrecognized-form-feminine-singular":"fârțoasa","definite-error-unrecognized-form-masculine-plural":"fârțoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fârțoasele"}},{"word":"faruri","pos":"noun","definitions":["plural of far lighthouses"],"gender":"n-p"},{"word":"fașă","pos":"noun","definitions":["bandage, dressing","swaddling clothes","fess"],"forms":{"plural":"feșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fașă","accusative-definite-nominative-singular":"fașa","accusative-indefinite-nominative-plural":"feșe","accusative-definite-nominative-plural":"feșele","dative-genitive-indefinite-singular":"feșe","dative-definite-genitive-singular":"feșei","dative-genitive-indefinite-plural":"feșe","dative-definite-genitive-plural":"feșelor","singular-vocative":"fașă","plural-vocative":"feșelor"}},{"word":"fâsă","pos":"noun","definitions":["pipit (bird)"],"pronunciation":"/ˈfɨ.sə/","forms":{"plural":"fâse","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fâsă","accusative-definite-nominative-singular":"fâsa","accusative-indefinite-nominative-plural":"fâse","accusative-definite-nominative-plural":"fâsele","dative-genitive-indefinite-singular":"fâse","dative-definite-genitive-singular":"fâsei","dative-genitive-indefinite-plural":"fâse","dative-definite-genitive-plural":"fâselor","singular-vocative":"-","plural-vocative":"-","alternative":"fîsă"}},{"word":"fâsă de câmp","pos":"noun","definitions":["tawny pipit (Anthus campestris)"],"forms":{"plural":"fâse de câmp"}},{"word":"fâsă de luncă","pos":"noun","definitions":["meadow pipit (Anthus pratensis)"],"forms":{"plural":"fâse de luncă"}},{"word":"fâsă de munte","pos":"noun","definitions":["water pipit (Anthus spinoletta)"],"forms":{"plural":"fâse de munte"}},{"word":"fâsă de pădure","pos":"noun","definitions":["tree pipit (Anthus trivialis)"],"forms":{"plural":"fâse de pădure"}},{"word":"fâsă de stâncă","pos":"noun","definitions":["rock pipit (Anthus petrosus)"],"forms":{"plural":"fâse de stâncă"}},{"word":"fâsa lui Richard","pos":"noun","definitions":["Richard's pipit (Anthus richardi)"]},{"word":"fâsă roșiatică","pos":"noun","definitions":["red-throated pipit (Anthus cervinus)"],"forms":{"plural":"fâse roșiatice"}},{"word":"fâsâi","pos":"verb","definitions":["to fizzle"],"forms":{"canonical":"a fâsâi 4th conjugation","present-singular-third-person":"fâsâie","participle-past":"fâsâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâsâi","gerund":"fâsâind","first-person-indicative-present-singular":"fâsâi","indicative-present-second-person-singular":"fâsâi","indicative-present-singular-third-person":"fâsâie","first-person-indicative-plural-present":"fâsâim","indicative-plural-present-second-person":"fâsâiți","indicative-plural-present-third-person":"fâsâie","first-person-imperfect-indicative-singular":"fâsâiam","imperfect-indicative-second-person-singular":"fâsâiai","imperfect-indicative-singular-third-person":"fâsâia","first-person-imperfect-indicative-plural":"fâsâiam","imperfect-indicative-plural-second-person":"fâsâiați","imperfect-indicative-plural-third-person":"fâsâiau","first-person-indicative-perfect-singular":"fâsâii","indicative-perfect-second-person-singular":"fâsâiși","indicative-perfect-singular-third-person":"fâsâi","first-person-indicative-perfect-plural":"fâsâirăm","indicative-perfect-plural-second-person":"fâsâirăți","indicative-perfect-plural-third-person":"fâsâiră","first-person-indicative-pluperfect-singular":"fâsâisem","indicative-pluperfect-second-person-singular":"fâsâiseși","indicative-pluperfect-singular-third-person":"fâsâise","first-person-indicative-pluperfect-plural":"fâsâiserăm","indicative-pluperfect-plural-second-person":"fâsâiserăți","indicative-pluperfect-plural-third-person":"fâsâiseră","first-person-present-singular-subjunctive":"să fâsâi","present-second-person-singular-subjunctive":"să fâsâi","present-singular-subjunctive-third-person":"să fâsâie","first-person-plural-present-subjunctive":"să fâsâim","plural-present-second-person-subjunctive":"să fâsâiți","plural-present-subjunctive-third-person":"să fâsâie","imperative-second-person-singular":"fâsâie","imperative-plural-second-person":"fâsâiți","imperative-negative-second-person-singular":"nu fâsâi","imperative-negative-plural-second-person":"nu fâsâiți"}},{"word":"fâsăi","pos":"verb","definitions":["alternative form of fâsâi"],"forms":{"canonical":"a fâsăi 4th conjugation","present-singular-third-person":"fâsăie","participle-past":"fâsăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâsăi","gerund":"fâsăind","first-person-indicative-present-singular":"fâsăi","indicative-present-second-person-singular":"fâsăi","indicative-present-singular-third-person":"fâsăie","first-person-indicative-plural-present":"fâsăim","indicative-plural-present-second-person":"fâsăiți","indicative-plural-present-third-person":"fâsăie","first-person-imperfect-indicative-singular":"fâsăiam","imperfect-indicative-second-person-singular":"fâsăiai","imperfect-indicative-singular-third-person":"fâsăia","first-person-imperfect-indicative-plural":"fâsăiam","imperfect-indicative-plural-second-person":"fâsăiați","imperfect-indicative-plural-third-person":"fâsăiau","first-person-indicative-perfect-singular":"fâsăii","indicative-perfect-second-person-singular":"fâsăiși","indicative-perfect-singular-third-person":"fâsăi","first-person-indicative-perfect-plural":"fâsăirăm","indicative-perfect-plural-second-person":"fâsăirăți","indicative-perfect-plural-third-person":"fâsăiră","first-person-indicative-pluperfect-singular":"fâsăisem","indicative-pluperfect-second-person-singular":"fâsăiseși","indicative-pluperfect-singular-third-person":"fâsăise","first-person-indicative-pluperfect-plural":"fâsăiserăm","indicative-pluperfect-plural-second-person":"fâsăiserăți","indicative-pluperfect-plural-third-person":"fâsăiseră","first-person-present-singular-subjunctive":"să fâsăi","present-second-person-singular-subjunctive":"să fâsăi","present-singular-subjunctive-third-person":"să fâsăie","first-person-plural-present-subjunctive":"să fâsăim","plural-present-second-person-subjunctive":"să fâsăiți","plural-present-subjunctive-third-person":"să fâsăie","imperative-second-person-singular":"fâsăie","imperative-plural-second-person":"fâsăiți","imperative-negative-second-person-singular":"nu fâsăi","imperative-negative-plural-second-person":"nu fâsăiți"}},{"word":"fâșâi","pos":"verb","definitions":["to rustle (sound of dry leaves)"],"forms":{"canonical":"a fâșâi 4th conjugation","present-singular-third-person":"fâșâie","participle-past":"fâșâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâșâi","gerund":"fâșâind","first-person-indicative-present-singular":"fâșâi","indicative-present-second-person-singular":"fâșâi","indicative-present-singular-third-person":"fâșâie","first-person-indicative-plural-present":"fâșâim","indicative-plural-present-second-person":"fâșâiți","indicative-plural-present-third-person":"fâșâie","first-person-imperfect-indicative-singular":"fâșâiam","imperfect-indicative-second-person-singular":"fâșâiai","imperfect-indicative-singular-third-person":"fâșâia","first-person-imperfect-indicative-plural":"fâșâiam","imperfect-indicative-plural-second-person":"fâșâiați","imperfect-indicative-plural-third-person":"fâșâiau","first-person-indicative-perfect-singular":"fâșâii","indicative-perfect-second-person-singular":"fâșâiși","indicative-perfect-singular-third-person":"fâșâi","first-person-indicative-perfect-plural":"fâșâirăm","indicative-perfect-plural-second-person":"fâșâirăți","indicative-perfect-plural-third-person":"fâșâiră","first-person-indicative-pluperfect-singular":"fâșâisem","indicative-pluperfect-second-person-singular":"fâșâiseși","indicative-pluperfect-singular-third-person":"fâșâise","first-person-indicative-pluperfect-plural":"fâșâiserăm","indicative-pluperfect-plural-second-person":"fâșâiserăți","indicative-pluperfect-plural-third-person":"fâșâiseră","first-person-present-singular-subjunctive":"să fâșâi","present-second-person-singular-subjunctive":"să fâșâi","present-singular-subjunctive-third-person":"să fâșâie","first-person-plural-present-subjunctive":"să fâșâim","plural-present-second-person-subjunctive":"să fâșâiți","plural-present-subjunctive-third-person":"să fâșâie","imperative-second-person-singular":"fâșâie","imperative-plural-second-person":"fâșâiți","imperative-negative-second-person-singular":"nu fâșâi","imperative-negative-plural-second-person":"nu fâșâiți"}},{"word":"fâșăi","pos":"verb","definitions":["alternative form of fâșâi"],"forms":{"canonical":"a fâșăi 4th conjugation","present-singular-third-person":"fâșăie","participle-past":"fâșăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâșăi","gerund":"fâșăind","first-person-indicative-present-singular":"fâșăi","indicative-present-second-person-singular":"fâșăi","indicative-present-singular-third-person":"fâșăie","first-person-indicative-plural-present":"fâșăim","indicative-plural-present-second-person":"fâșăiți","indicative-plural-present-third-person":"fâșăie","first-person-imperfect-indicative-singular":"fâșăiam","imperfect-indicative-second-person-singular":"fâșăiai","imperfect-indicative-singular-third-person":"fâșăia","first-person-imperfect-indicative-plural":"fâșăiam","imperfect-indicative-plural-second-person":"fâșăiați","imperfect-indicative-plural-third-person":"fâșăiau","first-person-indicative-perfect-singular":"fâșăii","indicative-perfect-second-person-singular":"fâșăiși","indicative-perfect-singular-third-person":"fâșăi","first-person-indicative-perfect-plural":"fâșăirăm","indicative-perfect-plural-second-person":"fâșăirăți","indicative-perfect-plural-third-person":"fâșăiră","first-person-indicative-pluperfect-singular":"fâșăisem","indicative-pluperfect-second-person-singular":"fâșăiseși","indicative-pluperfect-singular-third-person":"fâșăise","first-person-indicative-pluperfect-plural":"fâșăiserăm","indicative-pluperfect-plural-second-person":"fâșăiserăți","indicative-pluperfect-plural-third-person":"fâșăiseră","first-person-present-singular-subjunctive":"să fâșăi","present-second-person-singular-subjunctive":"să fâșăi","present-singular-subjunctive-third-person":"să fâșăie","first-person-plural-present-subjunctive":"să fâșăim","plural-present-second-person-subjunctive":"să fâșăiți","plural-present-subjunctive-third-person":"să fâșăie","imperative-second-person-singular":"fâșăie","imperative-plural-second-person":"fâșăiți","imperative-negative-second-person-singular":"nu fâșăi","imperative-negative-plural-second-person":"nu fâșăiți"}},{"word":"fâsâială","pos":"noun","definitions":["fizzle"],"forms":{"plural":"fâsâieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâsâială","accusative-definite-nominative-singular":"fâsâiala","accusative-indefinite-nominative-plural":"fâsâieli","accusative-definite-nominative-plural":"fâsâielile","dative-genitive-indefinite-singular":"fâsâieli","dative-definite-genitive-singular":"fâsâielii","dative-genitive-indefinite-plural":"fâsâieli","dative-definite-genitive-plural":"fâsâielilor","singular-vocative":"fâsâială","plural-vocative":"fâsâielilor"}},{"word":"fâsăială","pos":"noun","definitions":["alternative form of fâsâială"],"forms":{"plural":"fâsăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâsăială","accusative-definite-nominative-singular":"fâsăiala","accusative-indefinite-nominative-plural":"fâsăiele","accusative-definite-nominative-plural":"fâsăielele","dative-genitive-indefinite-singular":"fâsăiele","dative-definite-genitive-singular":"fâsăielei","dative-genitive-indefinite-plural":"fâsăiele","dative-definite-genitive-plural":"fâsăielelor","singular-vocative":"fâsăială","plural-vocative":"fâsăielelor"}},{"word":"fâșâială","pos":"noun","definitions":["a rustle (sound of dry leaves)"],"forms":{"plural":"fâșâieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâșâială","accusative-definite-nominative-singular":"fâșâiala","accusative-indefinite-nominative-plural":"fâșâiele","accusative-definite-nominative-plural":"fâșâielele","dative-genitive-indefinite-singular":"fâșâiele","dative-definite-genitive-singular":"fâșâielei","dative-genitive-indefinite-plural":"fâșâiele","dative-definite-genitive-plural":"fâșâielelor","singular-vocative":"fâșâială","plural-vocative":"fâșâielelor"}},{"word":"fâșăială","pos":"noun","definitions":["alternative form of fâșâială"],"forms":{"plural":"fâșăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâșăială","accusative-definite-nominative-singular":"fâșăiala","accusative-indefinite-nominative-plural":"fâșăiele","accusative-definite-nominative-plural":"fâșăielele","dative-genitive-indefinite-singular":"fâșăiele","dative-definite-genitive-singular":"fâșăielei","dative-genitive-indefinite-plural":"fâșăiele","dative-definite-genitive-plural":"fâșăielelor","singular-vocative":"fâșăială","plural-vocative":"fâșăielelor"}},{"word":"fâsâire","pos":"noun","definitions":["fizzle"],"forms":{"plural":"fâsâiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fâsâire","accusative-definite-nominative-singular":"fâsâirea","accusative-indefinite-nominative-plural":"fâsâiri","accusative-definite-nominative-plural":"fâsâirile","dative-genitive-indefinite-singular":"fâsâiri","dative-definite-genitive-singular":"fâsâirii","dative-genitive-indefinite-plural":"fâsâiri","dative-definite-genitive-plural":"fâsâirilor","singular-vocative":"fâsâire","plural-vocative":"fâsâirilor"}},{"word":"fâsăire","pos":"noun","definitions":["alternative form of fâsâire"],"forms":{"plural":"fâsăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fâsăire","accusative-definite-nominative-singular":"fâsăirea","accusative-indefinite-nominative-plural":"fâsăiri","accusative-definite-nominative-plural":"fâsăirile","dative-genitive-indefinite-singular":"fâsăiri","dative-definite-genitive-singular":"fâsăirii","dative-genitive-indefinite-plural":"fâsăiri","dative-definite-genitive-plural":"fâsăirilor","singular-vocative":"fâsăire","plural-vocative":"fâsăirilor"}},{"word":"fâșâire","pos":"noun","definitions":["rustle"],"forms":{"plural":"fâșâiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fâșâire","accusative-definite-nominative-singular":"fâșâirea","accusative-indefinite-nominative-plural":"fâșâiri","accusative-definite-nominative-plural":"fâșâirile","dative-genitive-indefinite-singular":"fâșâiri","dative-definite-genitive-singular":"fâșâirii","dative-genitive-indefinite-plural":"fâșâiri","dative-definite-genitive-plural":"fâșâirilor","singular-vocative":"fâșâire","plural-vocative":"fâșâirilor"}},{"word":"fâsâit","pos":"noun","definitions":["fizzle"],"forms":{"plural":"fâsâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fâsâit","accusative-definite-nominative-singular":"fâsâitul","accusative-indefinite-nominative-plural":"fâsâituri","accusative-definite-nominative-plural":"fâsâiturile","dative-genitive-indefinite-singular":"fâsâit","dative-definite-genitive-singular":"fâsâitului","dative-genitive-indefinite-plural":"fâsâituri","dative-definite-genitive-plural":"fâsâiturilor","singular-vocative":"fâsâitule","plural-vocative":"fâsâiturilor"}},{"word":"fâsâit","pos":"verb","definitions":["past participle of fâsâi"],"forms":{"participle-past":"of fâsâi"}},{"word":"fâsăit","pos":"noun","definitions":["alternative form of fâsâit"],"forms":{"plural":"fâsăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fâsăit","accusative-definite-nominative-singular":"fâsăitul","accusative-indefinite-nominative-plural":"fâsăituri","accusative-definite-nominative-plural":"fâsăiturile","dative-genitive-indefinite-singular":"fâsăit","dative-definite-genitive-singular":"fâsăitului","dative-genitive-indefinite-plural":"fâsăituri","dative-definite-genitive-plural":"fâsăiturilor","singular-vocative":"fâsăitule","plural-vocative":"fâsăiturilor"}},{"word":"fâșâit","pos":"noun","definitions":["a rustle (sound of dry leaves)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fâșâit","accusative-definite-nominative":"fâșâitul","dative-genitive-indefinite":"fâșâit","dative-definite-genitive":"fâșâitului","vocative":"fâșâitule"}},{"word":"fâșâit","pos":"verb","definitions":["past participle of fâșâi"],"forms":{"participle-past":"of fâșâi"}},{"word":"fâșâitor","pos":"adj","definitions":["whistling"],"forms":{"feminine-singular":"fâșâitoare","masculine-plural":"fâșâitori","feminine-neuter-plural":"fâșâitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fâșâitor","error-unrecognized-form-feminine-indefinite-singular":"fâșâitoare","error-unrecognized-form-indefinite-masculine-plural":"fâșâitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fâșâitoare","definite-error-unrecognized-form-masculine-neuter-singular":"fâșâitorul","definite-error-unrecognized-form-feminine-singular":"fâșâitoarea","definite-error-unrecognized-form-masculine-plural":"fâșâitorii","definite-error-unrecognized-form-feminine-neuter-plural":"fâșâitoarele"}},{"word":"fâsâitură","pos":"noun","definitions":["whistling"],"forms":{"plural":"fâsâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâsâitură","accusative-definite-nominative-singular":"fâsâitura","accusative-indefinite-nominative-plural":"fâsâituri","accusative-definite-nominative-plural":"fâsâiturile","dative-genitive-indefinite-singular":"fâsâituri","dative-definite-genitive-singular":"fâsâiturii","dative-genitive-indefinite-plural":"fâsâituri","dative-definite-genitive-plural":"fâsâiturilor","singular-vocative":"fâsâitură","plural-vocative":"fâsâiturilor"}},{"word":"fâsăitură","pos":"noun","definitions":["alternative form of fâsâitură"],"forms":{"plural":"fâsăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâsăitură","accusative-definite-nominative-singular":"fâsăitura","accusative-indefinite-nominative-plural":"fâsăituri","accusative-definite-nominative-plural":"fâsăiturile","dative-genitive-indefinite-singular":"fâsăituri","dative-definite-genitive-singular":"fâsăiturii","dative-genitive-indefinite-plural":"fâsăituri","dative-definite-genitive-plural":"fâsăiturilor","singular-vocative":"fâsăitură","plural-vocative":"fâsăiturilor"}},{"word":"fâșâitură","pos":"noun","definitions":["a rustle (sound of dry leaves)"],"forms":{"plural":"fâșâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâșâitură","accusative-definite-nominative-singular":"fâșâitura","accusative-indefinite-nominative-plural":"fâșâituri","accusative-definite-nominative-plural":"fâșâiturile","dative-genitive-indefinite-singular":"fâșâituri","dative-definite-genitive-singular":"fâșâiturii","dative-genitive-indefinite-plural":"fâșâituri","dative-definite-genitive-plural":"fâșâiturilor","singular-vocative":"fâșâitură","plural-vocative":"fâșâiturilor"}},{"word":"fasamen","pos":"noun","definitions":["lorgnette"],"forms":{"plural":"fasamene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fasamen","accusative-definite-nominative-singular":"fasamenul","accusative-indefinite-nominative-plural":"fasamene","accusative-definite-nominative-plural":"fasamenele","dative-genitive-indefinite-singular":"fasamen","dative-definite-genitive-singular":"fasamenului","dative-genitive-indefinite-plural":"fasamene","dative-definite-genitive-plural":"fasamenelor","singular-vocative":"fasamenule","plural-vocative":"fasamenelor"}},{"word":"fășașea","pos":"noun","definitions":["diminutive of fașă"],"forms":{"plural":"fășașele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"fășașea","accusative-definite-nominative-singular":"fășașeaua","accusative-indefinite-nominative-plural":"fășașele","accusative-definite-nominative-plural":"fășașelele","dative-genitive-indefinite-singular":"fășașele","dative-definite-genitive-singular":"fășașelei","dative-genitive-indefinite-plural":"fășașele","dative-definite-genitive-plural":"fășașelelor","singular-vocative":"fășașea","plural-vocative":"fășașelelor"}},{"word":"fășat","pos":"adj","definitions":["swaddled"],"forms":{"feminine-singular":"fășată","masculine-plural":"fășați","feminine-neuter-plural":"fășate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fășat","error-unrecognized-form-feminine-indefinite-singular":"fășată","error-unrecognized-form-indefinite-masculine-plural":"fășați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fășate","definite-error-unrecognized-form-masculine-neuter-singular":"fășatul","definite-error-unrecognized-form-feminine-singular":"fășata","definite-error-unrecognized-form-masculine-plural":"fășații","definite-error-unrecognized-form-feminine-neuter-plural":"fășatele"}},{"word":"fășat","pos":"verb","definitions":["past participle of fășa"],"forms":{"participle-past":"of fășa"}},{"word":"fășățel","pos":"adj","definitions":["diminutive of fășat"],"forms":{"feminine-singular":"fășățelă","masculine-plural":"fășățeli","feminine-neuter-plural":"fășățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fășățel","error-unrecognized-form-feminine-indefinite-singular":"fășățelă","error-unrecognized-form-indefinite-masculine-plural":"fășățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"fășățele","definite-error-unrecognized-form-masculine-neuter-singular":"fășățelul","definite-error-unrecognized-form-feminine-singular":"fășățela","definite-error-unrecognized-form-masculine-plural":"fășățelii","definite-error-unrecognized-form-feminine-neuter-plural":"fășățelele"}},{"word":"fasciație","pos":"noun","definitions":["fasciation"],"forms":{"plural":"fasciații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fasciație","accusative-definite-nominative-singular":"fasciația","accusative-indefinite-nominative-plural":"fasciații","accusative-definite-nominative-plural":"fasciațiile","dative-genitive-indefinite-singular":"fasciații","dative-definite-genitive-singular":"fasciației","dative-genitive-indefinite-plural":"fasciații","dative-definite-genitive-plural":"fasciațiilor","singular-vocative":"fasciație","plural-vocative":"fasciațiilor"}},{"word":"fascicol","pos":"noun","definitions":["alternative form of fascicul"],"forms":{"plural":"fascicole","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fascicol","accusative-definite-nominative-singular":"fascicolul","accusative-indefinite-nominative-plural":"fascicole","accusative-definite-nominative-plural":"fascicolele","dative-genitive-indefinite-singular":"fascicol","dative-definite-genitive-singular":"fascicolului","dative-genitive-indefinite-plural":"fascicole","dative-definite-genitive-plural":"fascicolelor","singular-vocative":"fascicolule","plural-vocative":"fascicolelor"}},{"word":"fascicolă","pos":"noun","definitions":["alternative form of fasciculă"],"forms":{"plural":"fascicole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fascicolă","accusative-definite-nominative-singular":"fascicola","accusative-indefinite-nominative-plural":"fascicole","accusative-definite-nominative-plural":"fascicolele","dative-genitive-indefinite-singular":"fascicole","dative-definite-genitive-singular":"fascicolei","dative-genitive-indefinite-plural":"fascicole","dative-definite-genitive-plural":"fascicolelor","singular-vocative":"fascicolă","plural-vocative":"fascicolelor"}},{"word":"fascicul","pos":"noun","definitions":["sheaf, bundle"],"forms":{"plural":"fascicule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fascicul","accusative-definite-nominative-singular":"fasciculul","accusative-indefinite-nominative-plural":"fascicule","accusative-definite-nominative-plural":"fasciculele","dative-genitive-indefinite-singular":"fascicul","dative-definite-genitive-singular":"fasciculului","dative-genitive-indefinite-plural":"fascicule","dative-definite-genitive-plural":"fasciculelor","singular-vocative":"fasciculule","plural-vocative":"fasciculelor"}},{"word":"fasciculă","pos":"noun","definitions":["fascicle"],"forms":{"plural":"fascicule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fasciculă","accusative-definite-nominative-singular":"fascicula","accusative-indefinite-nominative-plural":"fascicule","accusative-definite-nominative-plural":"fasciculele","dative-genitive-indefinite-singular":"fascicule","dative-definite-genitive-singular":"fasciculei","dative-genitive-indefinite-plural":"fascicule","dative-definite-genitive-plural":"fasciculelor","singular-vocative":"fasciculă","plural-vocative":"fasciculelor"}},{"word":"fasciculat","pos":"adj","definitions":["fasciculate"],"forms":{"feminine-singular":"fasciculată","masculine-plural":"fasciculați","feminine-neuter-plural":"fasciculate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fasciculat","error-unrecognized-form-feminine-indefinite-singular":"fasciculată","error-unrecognized-form-indefinite-masculine-plural":"fasciculați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fasciculate","definite-error-unrecognized-form-masculine-neuter-singular":"fasciculatul","definite-error-unrecognized-form-feminine-singular":"fasciculata","definite-error-unrecognized-form-masculine-plural":"fasciculații","definite-error-unrecognized-form-feminine-neuter-plural":"fasciculatele"}},{"word":"fascie","pos":"noun","definitions":["fascia"],"forms":{"plural":"fascii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fascie","accusative-definite-nominative-singular":"fascia","accusative-indefinite-nominative-plural":"fascii","accusative-definite-nominative-plural":"fasciile","dative-genitive-indefinite-singular":"fascii","dative-definite-genitive-singular":"fasciei","dative-genitive-indefinite-plural":"fascii","dative-definite-genitive-plural":"fasciilor","singular-vocative":"fascie","plural-vocative":"fasciilor"}},{"word":"fascina","pos":"verb","definitions":["to fascinate"],"pronunciation":"/fas.t͡ʃiˈna/","forms":{"canonical":"a fascina 1st conjugation","present-singular-third-person":"fascinează","participle-past":"fascinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fascina","gerund":"fascinând","first-person-indicative-present-singular":"fascinez","indicative-present-second-person-singular":"fascinezi","indicative-present-singular-third-person":"fascinează","first-person-indicative-plural-present":"fascinăm","indicative-plural-present-second-person":"fascinați","indicative-plural-present-third-person":"fascinează","first-person-imperfect-indicative-singular":"fascinam","imperfect-indicative-second-person-singular":"fascinai","imperfect-indicative-singular-third-person":"fascina","first-person-imperfect-indicative-plural":"fascinam","imperfect-indicative-plural-second-person":"fascinați","imperfect-indicative-plural-third-person":"fascinau","first-person-indicative-perfect-singular":"fascinai","indicative-perfect-second-person-singular":"fascinași","indicative-perfect-singular-third-person":"fascină","first-person-indicative-perfect-plural":"fascinarăm","indicative-perfect-plural-second-person":"fascinarăți","indicative-perfect-plural-third-person":"fascinară","first-person-indicative-pluperfect-singular":"fascinasem","indicative-pluperfect-second-person-singular":"fascinaseși","indicative-pluperfect-singular-third-person":"fascinase","first-person-indicative-pluperfect-plural":"fascinaserăm","indicative-pluperfect-plural-second-person":"fascinaserăți","indicative-pluperfect-plural-third-person":"fascinaseră","first-person-present-singular-subjunctive":"să fascinez","present-second-person-singular-subjunctive":"să fascinezi","present-singular-subjunctive-third-person":"să fascineze","first-person-plural-present-subjunctive":"să fascinăm","plural-present-second-person-subjunctive":"să fascinați","plural-present-subjunctive-third-person":"să fascineze","imperative-second-person-singular":"fascinează","imperative-plural-second-person":"fascinați","imperative-negative-second-person-singular":"nu fascina","imperative-negative-plural-second-person":"nu fascinați"}},{"word":"fascinant","pos":"adj","definitions":["fascinating"],"forms":{"feminine-singular":"fascinantă","masculine-plural":"fascinanți","feminine-neuter-plural":"fascinante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fascinant","error-unrecognized-form-feminine-indefinite-singular":"fascinantă","error-unrecognized-form-indefinite-masculine-plural":"fascinanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fascinante","definite-error-unrecognized-form-masculine-neuter-singular":"fascinantul","definite-error-unrecognized-form-feminine-singular":"fascinanta","definite-error-unrecognized-form-masculine-plural":"fascinanții","definite-error-unrecognized-form-feminine-neuter-plural":"fascinantele"}},{"word":"fascinare","pos":"noun","definitions":["fascination"],"forms":{"plural":"fascinări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fascinare","accusative-definite-nominative-singular":"fascinarea","accusative-indefinite-nominative-plural":"fascinări","accusative-definite-nominative-plural":"fascinările","dative-genitive-indefinite-singular":"fascinări","dative-definite-genitive-singular":"fascinării","dative-genitive-indefinite-plural":"fascinări","dative-definite-genitive-plural":"fascinărilor","singular-vocative":"fascinare","plural-vocative":"fascinărilor"}},{"word":"fascinat","pos":"adj","definitions":["fascinated"],"forms":{"feminine-singular":"fascinată","masculine-plural":"fascinați","feminine-neuter-plural":"fascinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fascinat","error-unrecognized-form-feminine-indefinite-singular":"fascinată","error-unrecognized-form-indefinite-masculine-plural":"fascinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fascinate","definite-error-unrecognized-form-masculine-neuter-singular":"fascinatul","definite-error-unrecognized-form-feminine-singular":"fascinata","definite-error-unrecognized-form-masculine-plural":"fascinații","definite-error-unrecognized-form-feminine-neuter-plural":"fascinatele"}},{"word":"fascinat","pos":"verb","definitions":["past participle of fascina"],"forms":{"participle-past":"of fascina"}},{"word":"fascinație","pos":"noun","definitions":["fascination"],"forms":{"plural":"fascinații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fascinație","accusative-definite-nominative-singular":"fascinația","accusative-indefinite-nominative-plural":"fascinații","accusative-definite-nominative-plural":"fascinațiile","dative-genitive-indefinite-singular":"fascinații","dative-definite-genitive-singular":"fascinației","dative-genitive-indefinite-plural":"fascinații","dative-definite-genitive-plural":"fascinațiilor","singular-vocative":"fascinație","plural-vocative":"fascinațiilor"}},{"word":"fascinațiune","pos":"noun","definitions":["alternative form of fascinație"],"forms":{"plural":"fascinațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fascinațiune","accusative-definite-nominative-singular":"fascinațiunea","accusative-indefinite-nominative-plural":"fascinațiuni","accusative-definite-nominative-plural":"fascinațiunile","dative-genitive-indefinite-singular":"fascinațiuni","dative-definite-genitive-singular":"fascinațiunii","dative-genitive-indefinite-plural":"fascinațiuni","dative-definite-genitive-plural":"fascinațiunilor","singular-vocative":"fascinațiune","plural-vocative":"fascinațiunilor"}},{"word":"fascinator","pos":"adj","definitions":["fascinator"],"forms":{"feminine-singular":"fascinatoare","masculine-plural":"fascinatori","feminine-neuter-plural":"fascinatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fascinator","error-unrecognized-form-feminine-indefinite-singular":"fascinatoare","error-unrecognized-form-indefinite-masculine-plural":"fascinatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fascinatoare","definite-error-unrecognized-form-masculine-neuter-singular":"fascinatorul","definite-error-unrecognized-form-feminine-singular":"fascinatoarea","definite-error-unrecognized-form-masculine-plural":"fascinatorii","definite-error-unrecognized-form-feminine-neuter-plural":"fascinatoarele"}},{"word":"făscioară","pos":"noun","definitions":["fascicle"],"forms":{"plural":"făscioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făscioară","accusative-definite-nominative-singular":"făscioara","accusative-indefinite-nominative-plural":"făscioare","accusative-definite-nominative-plural":"făscioarele","dative-genitive-indefinite-singular":"făscioare","dative-definite-genitive-singular":"făscioarei","dative-genitive-indefinite-plural":"făscioare","dative-definite-genitive-plural":"făscioarelor","singular-vocative":"făscioară","plural-vocative":"făscioarelor"}},{"word":"fascioloză","pos":"noun","definitions":["fascioliasis"],"forms":{"plural":"fascioloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fascioloză","accusative-definite-nominative-singular":"fascioloza","accusative-indefinite-nominative-plural":"fascioloze","accusative-definite-nominative-plural":"fasciolozele","dative-genitive-indefinite-singular":"fascioloze","dative-definite-genitive-singular":"fasciolozei","dative-genitive-indefinite-plural":"fascioloze","dative-definite-genitive-plural":"fasciolozelor","singular-vocative":"fascioloză","plural-vocative":"fasciolozelor"}},{"word":"fascism","pos":"noun","definitions":["fascism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fascism","accusative-definite-nominative":"fascismul","dative-genitive-indefinite":"fascism","dative-definite-genitive":"fascismului","vocative":"fascismule"}},{"word":"fascist","pos":"adj","definitions":["fascist (supporting the principles of fascism)"],"forms":{"feminine-singular":"fascistă","masculine-plural":"fasciști","feminine-neuter-plural":"fasciste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fascist","error-unrecognized-form-feminine-indefinite-singular":"fascistă","error-unrecognized-form-indefinite-masculine-plural":"fasciști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fasciste","definite-error-unrecognized-form-masculine-neuter-singular":"fascistul","definite-error-unrecognized-form-feminine-singular":"fascista","definite-error-unrecognized-form-masculine-plural":"fasciștii","definite-error-unrecognized-form-feminine-neuter-plural":"fascistele"}},{"word":"fascist","pos":"noun","definitions":["fascist (“proponent of fascism”)"],"forms":{"plural":"fasciști","feminine":"equivalent fascistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fascist","accusative-definite-nominative-singular":"fascistul","accusative-indefinite-nominative-plural":"fasciști","accusative-definite-nominative-plural":"fasciștii","dative-genitive-indefinite-singular":"fascist","dative-definite-genitive-singular":"fascistului","dative-genitive-indefinite-plural":"fasciști","dative-definite-genitive-plural":"fasciștilor","singular-vocative":"fascistule","plural-vocative":"fasciștilor"}},{"word":"fascistă","pos":"noun","definitions":["female equivalent of fascist"],"forms":{"plural":"fasciste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fascistă","accusative-definite-nominative-singular":"fascista","accusative-indefinite-nominative-plural":"fasciste","accusative-definite-nominative-plural":"fascistele","dative-genitive-indefinite-singular":"fasciste","dative-definite-genitive-singular":"fascistei","dative-genitive-indefinite-plural":"fasciste","dative-definite-genitive-plural":"fascistelor","singular-vocative":"fascistă","plural-vocative":"fascistelor"}},{"word":"fasciza","pos":"verb","definitions":["to make something Fascist"],"forms":{"canonical":"a fasciza 1st conjugation","present-singular-third-person":"fascizează","participle-past":"fascizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fasciza","gerund":"fascizând","first-person-indicative-present-singular":"fascizez","indicative-present-second-person-singular":"fascizezi","indicative-present-singular-third-person":"fascizează","first-person-indicative-plural-present":"fascizăm","indicative-plural-present-second-person":"fascizați","indicative-plural-present-third-person":"fascizează","first-person-imperfect-indicative-singular":"fascizam","imperfect-indicative-second-person-singular":"fascizai","imperfect-indicative-singular-third-person":"fasciza","first-person-imperfect-indicative-plural":"fascizam","imperfect-indicative-plural-second-person":"fascizați","imperfect-indicative-plural-third-person":"fascizau","first-person-indicative-perfect-singular":"fascizai","indicative-perfect-second-person-singular":"fascizași","indicative-perfect-singular-third-person":"fasciză","first-person-indicative-perfect-plural":"fascizarăm","indicative-perfect-plural-second-person":"fascizarăți","indicative-perfect-plural-third-person":"fascizară","first-person-indicative-pluperfect-singular":"fascizasem","indicative-pluperfect-second-person-singular":"fascizaseși","indicative-pluperfect-singular-third-person":"fascizase","first-person-indicative-pluperfect-plural":"fascizaserăm","indicative-pluperfect-plural-second-person":"fascizaserăți","indicative-pluperfect-plural-third-person":"fascizaseră","first-person-present-singular-subjunctive":"să fascizez","present-second-person-singular-subjunctive":"să fascizezi","present-singular-subjunctive-third-person":"să fascizeze","first-person-plural-present-subjunctive":"să fascizăm","plural-present-second-person-subjunctive":"să fascizați","plural-present-subjunctive-third-person":"să fascizeze","imperative-second-person-singular":"fascizează","imperative-plural-second-person":"fascizați","imperative-negative-second-person-singular":"nu fasciza","imperative-negative-plural-second-person":"nu fascizați"}},{"word":"fascizare","pos":"noun","definitions":["fascistization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"fascizare","accusative-definite-nominative":"fascizarea","dative-genitive-indefinite":"fascizare","dative-definite-genitive":"fascizarei","vocative":"fascizare"}},{"word":"fășcuță","pos":"noun","definitions":["cheese barrel"],"forms":{"plural":"fășcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fășcuță","accusative-definite-nominative-singular":"fășcuța","accusative-indefinite-nominative-plural":"fășcuțe","accusative-definite-nominative-plural":"fășcuțele","dative-genitive-indefinite-singular":"fășcuțe","dative-definite-genitive-singular":"fășcuței","dative-genitive-indefinite-plural":"fășcuțe","dative-definite-genitive-plural":"fășcuțelor","singular-vocative":"fășcuță","plural-vocative":"fășcuțelor"}},{"word":"fâse","pos":"noun","definitions":["plural of fâsă"],"gender":"f"},{"word":"faseolină","pos":"noun","definitions":["phaseolin"],"forms":{"plural":"faseoline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faseolină","accusative-definite-nominative-singular":"faseolina","accusative-indefinite-nominative-plural":"faseoline","accusative-definite-nominative-plural":"faseolinele","dative-genitive-indefinite-singular":"faseoline","dative-definite-genitive-singular":"faseolinei","dative-genitive-indefinite-plural":"faseoline","dative-definite-genitive-plural":"faseolinelor","singular-vocative":"faseolină","plural-vocative":"faseolinelor"}},{"word":"Fâșia Gaza","pos":"name","definitions":["Gaza Strip (a region in Palestine between Egypt and Israel)"],"gender":"f"},{"word":"fâșic","pos":"noun","definitions":["obsolete form of fișic"],"forms":{"plural":"fâșicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fâșic","accusative-definite-nominative-singular":"fâșicul","accusative-indefinite-nominative-plural":"fâșicuri","accusative-definite-nominative-plural":"fâșicurile","dative-genitive-indefinite-singular":"fâșic","dative-definite-genitive-singular":"fâșicului","dative-genitive-indefinite-plural":"fâșicuri","dative-definite-genitive-plural":"fâșicurilor","singular-vocative":"fâșicule","plural-vocative":"fâșicurilor"}},{"word":"Fâșie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fâșie"}},{"word":"fâșie","pos":"noun","definitions":["band, bandage, bind, strip","rag","fascine, fagot"],"forms":{"plural":"fâșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fâșie","accusative-definite-nominative-singular":"fâșia","accusative-indefinite-nominative-plural":"fâșii","accusative-definite-nominative-plural":"fâșiile","dative-genitive-indefinite-singular":"fâșii","dative-definite-genitive-singular":"fâșiei","dative-genitive-indefinite-plural":"fâșii","dative-definite-genitive-plural":"fâșiilor","singular-vocative":"fâșie","plural-vocative":"fâșiilor"}},{"word":"Fășie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fășie"}},{"word":"fășie","pos":"noun","definitions":["alternative form of fâșie"],"forms":{"plural":"fășii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fășie","accusative-definite-nominative-singular":"fășia","accusative-indefinite-nominative-plural":"fășii","accusative-definite-nominative-plural":"fășiile","dative-genitive-indefinite-singular":"fășii","dative-definite-genitive-singular":"fășiei","dative-genitive-indefinite-plural":"fășii","dative-definite-genitive-plural":"fășiilor","singular-vocative":"fășie","plural-vocative":"fășiilor"}},{"word":"fâșii","pos":"verb","definitions":["alternative form of fâșâi"],"forms":{"canonical":"a fâșii 4th conjugation","present-singular-third-person":"fâșie","participle-past":"fâșiit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâșii","gerund":"fâșiind","first-person-indicative-present-singular":"fâșii","indicative-present-second-person-singular":"fâșii","indicative-present-singular-third-person":"fâșiie","first-person-indicative-plural-present":"fâșiim","indicative-plural-present-second-person":"fâșiiți","indicative-plural-present-third-person":"fâșiie","first-person-imperfect-indicative-singular":"fâșiiam","imperfect-indicative-second-person-singular":"fâșiiai","imperfect-indicative-singular-third-person":"fâșiia","first-person-imperfect-indicative-plural":"fâșiiam","imperfect-indicative-plural-second-person":"fâșiiați","imperfect-indicative-plural-third-person":"fâșiiau","first-person-indicative-perfect-singular":"fâșiii","indicative-perfect-second-person-singular":"fâșiiși","indicative-perfect-singular-third-person":"fâșii","first-person-indicative-perfect-plural":"fâșiirăm","indicative-perfect-plural-second-person":"fâșiirăți","indicative-perfect-plural-third-person":"fâșiiră","first-person-indicative-pluperfect-singular":"fâșiisem","indicative-pluperfect-second-person-singular":"fâșiiseși","indicative-pluperfect-singular-third-person":"fâșiise","first-person-indicative-pluperfect-plural":"fâșiiserăm","indicative-pluperfect-plural-second-person":"fâșiiserăți","indicative-pluperfect-plural-third-person":"fâșiiseră","first-person-present-singular-subjunctive":"să fâșii","present-second-person-singular-subjunctive":"să fâșii","present-singular-subjunctive-third-person":"să fâșiie","first-person-plural-present-subjunctive":"să fâșiim","plural-present-second-person-subjunctive":"să fâșiiți","plural-present-subjunctive-third-person":"să fâșiie","imperative-second-person-singular":"fâșiie","imperative-plural-second-person":"fâșiiți","imperative-negative-second-person-singular":"nu fâșii","imperative-negative-plural-second-person":"nu fâșiiți"}},{"word":"fâșiit","pos":"noun","definitions":["alternative form of fâșâit"],"forms":{"plural":"fâșiituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fâșiit","accusative-definite-nominative-singular":"fâșiitul","accusative-indefinite-nominative-plural":"fâșiituri","accusative-definite-nominative-plural":"fâșiiturile","dative-genitive-indefinite-singular":"fâșiit","dative-definite-genitive-singular":"fâșiitului","dative-genitive-indefinite-plural":"fâșiituri","dative-definite-genitive-plural":"fâșiiturilor","singular-vocative":"fâșiitule","plural-vocative":"fâșiiturilor"}},{"word":"fâșiitor","pos":"adj","definitions":["obsolete form of fâșâitor"],"forms":{"feminine-singular":"fâșiitoare","masculine-plural":"fâșiitori","feminine-neuter-plural":"fâșiitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fâșiitor","error-unrecognized-form-feminine-indefinite-singular":"fâșiitoare","error-unrecognized-form-indefinite-masculine-plural":"fâșiitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fâșiitoare","definite-error-unrecognized-form-masculine-neuter-singular":"fâșiitorul","definite-error-unrecognized-form-feminine-singular":"fâșiitoarea","definite-error-unrecognized-form-masculine-plural":"fâșiitorii","definite-error-unrecognized-form-feminine-neuter-plural":"fâșiitoarele"}},{"word":"fâșiitură","pos":"noun","definitions":["alternative form of fâșâitură"],"forms":{"plural":"fâșiituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâșiitură","accusative-definite-nominative-singular":"fâșiitura","accusative-indefinite-nominative-plural":"fâșiituri","accusative-definite-nominative-plural":"fâșiiturile","dative-genitive-indefinite-singular":"fâșiituri","dative-definite-genitive-singular":"fâșiiturii","dative-genitive-indefinite-plural":"fâșiituri","dative-definite-genitive-plural":"fâșiiturilor","singular-vocative":"fâșiitură","plural-vocative":"fâșiiturilor"}},{"word":"fașină","pos":"noun","definitions":["alternative form of fascină"],"forms":{"plural":"fașine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fașină","accusative-definite-nominative-singular":"fașina","accusative-indefinite-nominative-plural":"fașine","accusative-definite-nominative-plural":"fașinele","dative-genitive-indefinite-singular":"fașine","dative-definite-genitive-singular":"fașinei","dative-genitive-indefinite-plural":"fașine","dative-definite-genitive-plural":"fașinelor","singular-vocative":"fașină","plural-vocative":"fașinelor"}},{"word":"fâșioară","pos":"noun","definitions":["diminutive of fâșie; strip"],"pronunciation":"/fɨʃiˈwarə/","forms":{"plural":"fâșioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâșioară","accusative-definite-nominative-singular":"fâșioara","accusative-indefinite-nominative-plural":"fâșioare","accusative-definite-nominative-plural":"fâșioarele","dative-genitive-indefinite-singular":"fâșioare","dative-definite-genitive-singular":"fâșioarei","dative-genitive-indefinite-plural":"fâșioare","dative-definite-genitive-plural":"fâșioarelor","singular-vocative":"fâșioară","plural-vocative":"fâșioarelor","alternative":"făscioară","alternative-obsolete":"fîșioară"}},{"word":"fașionabil","pos":"adj","definitions":["fashionable"],"forms":{"feminine-singular":"fașionabilă","masculine-plural":"fașionabili","feminine-neuter-plural":"fașionabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fașionabil","error-unrecognized-form-feminine-indefinite-singular":"fașionabilă","error-unrecognized-form-indefinite-masculine-plural":"fașionabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fașionabile","definite-error-unrecognized-form-masculine-neuter-singular":"fașionabilul","definite-error-unrecognized-form-feminine-singular":"fașionabila","definite-error-unrecognized-form-masculine-plural":"fașionabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fașionabilele"}},{"word":"fâșiuță","pos":"noun","definitions":["diminutive of fâșie"],"forms":{"plural":"fâșiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâșiuță","accusative-definite-nominative-singular":"fâșiuța","accusative-indefinite-nominative-plural":"fâșiuțe","accusative-definite-nominative-plural":"fâșiuțele","dative-genitive-indefinite-singular":"fâșiuțe","dative-definite-genitive-singular":"fâșiuței","dative-genitive-indefinite-plural":"fâșiuțe","dative-definite-genitive-plural":"fâșiuțelor","singular-vocative":"fâșiuță","plural-vocative":"fâșiuțelor"}},{"word":"fășoară","pos":"noun","definitions":["diminutive of fașă"],"forms":{"plural":"fășoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fășoară","accusative-definite-nominative-singular":"fășoara","accusative-indefinite-nominative-plural":"fășoare","accusative-definite-nominative-plural":"fășoarele","dative-genitive-indefinite-singular":"fășoare","dative-definite-genitive-singular":"fășoarei","dative-genitive-indefinite-plural":"fășoare","dative-definite-genitive-plural":"fășoarelor","singular-vocative":"fășoară","plural-vocative":"fășoarelor"}},{"word":"fasolă","pos":"noun","definitions":["obsolete form of fasole"],"forms":{"plural":"fasole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fasolă","accusative-definite-nominative-singular":"fasola","accusative-indefinite-nominative-plural":"fasole","accusative-definite-nominative-plural":"fasolele","dative-genitive-indefinite-singular":"fasole","dative-definite-genitive-singular":"fasolei","dative-genitive-indefinite-plural":"fasole","dative-definite-genitive-plural":"fasolelor","singular-vocative":"fasolă","plural-vocative":"fasolelor"}},{"word":"Fasole","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fasole"}},{"word":"fasole","pos":"noun","definitions":["bean (seed)","beans"],"pronunciation":"/faˈso.le/","forms":{"plural-rare":"fasole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fasole","accusative-definite-nominative-singular":"fasolea","accusative-indefinite-nominative-plural":"fasole","accusative-definite-nominative-plural":"fasolele","dative-genitive-indefinite-singular":"fasole","dative-definite-genitive-singular":"fasolei","dative-genitive-indefinite-plural":"fasole","dative-definite-genitive-plural":"fasolelor","singular-vocative":"fasole","plural-vocative":"fasolelor","alternative-rare":"fasolă"}},{"word":"fasoleală","pos":"noun","definitions":["whimsiness"],"forms":{"plural":"fasoleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fasoleală","accusative-definite-nominative-singular":"fasoleala","accusative-indefinite-nominative-plural":"fasolele","accusative-definite-nominative-plural":"fasolelele","dative-genitive-indefinite-singular":"fasolele","dative-definite-genitive-singular":"fasolelei","dative-genitive-indefinite-plural":"fasolele","dative-definite-genitive-plural":"fasolelelor","singular-vocative":"fasoleală","plural-vocative":"fasolelelor"}},{"word":"fasolică","pos":"noun","definitions":["diminutive of fasole; small beans"],"forms":{"plural":"fasolici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fasolică","accusative-definite-nominative-singular":"fasolica","accusative-indefinite-nominative-plural":"fasolice","accusative-definite-nominative-plural":"fasolicele","dative-genitive-indefinite-singular":"fasolice","dative-definite-genitive-singular":"fasolicei","dative-genitive-indefinite-plural":"fasolice","dative-definite-genitive-plural":"fasolicelor","singular-vocative":"fasolică","plural-vocative":"fasolicelor"}},{"word":"fasoliște","pos":"noun","definitions":["bean field"],"forms":{"plural":"fasoliști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fasoliște","accusative-definite-nominative-singular":"fasoliștea","accusative-indefinite-nominative-plural":"fasoliști","accusative-definite-nominative-plural":"fasoliștile","dative-genitive-indefinite-singular":"fasoliști","dative-definite-genitive-singular":"fasoliștii","dative-genitive-indefinite-plural":"fasoliști","dative-definite-genitive-plural":"fasoliștilor","singular-vocative":"fasoliște","plural-vocative":"fasoliștilor"}},{"word":"fasolit","pos":"adj","definitions":["poseur"],"forms":{"feminine-singular":"fasolită","masculine-plural":"fasoliți","feminine-neuter-plural":"fasolite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fasolit","error-unrecognized-form-feminine-indefinite-singular":"fasolită","error-unrecognized-form-indefinite-masculine-plural":"fasoliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fasolite","definite-error-unrecognized-form-masculine-neuter-singular":"fasolitul","definite-error-unrecognized-form-feminine-singular":"fasolita","definite-error-unrecognized-form-masculine-plural":"fasoliții","definite-error-unrecognized-form-feminine-neuter-plural":"fasolitele"}},{"word":"fasolit","pos":"verb","definitions":["past participle of fasoli"],"forms":{"participle-past":"of fasoli"}},{"word":"fason","pos":"noun","definitions":["way; manner; fashion"],"forms":{"plural":"fasoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fason","accusative-definite-nominative-singular":"fasonul","accusative-indefinite-nominative-plural":"fasoane","accusative-definite-nominative-plural":"fasoanele","dative-genitive-indefinite-singular":"fason","dative-definite-genitive-singular":"fasonului","dative-genitive-indefinite-plural":"fasoane","dative-definite-genitive-plural":"fasoanelor","singular-vocative":"fasonule","plural-vocative":"fasoanelor"}},{"word":"fasona","pos":"verb","definitions":["to shape"],"forms":{"canonical":"a fasona 1st conjugation","present-singular-third-person":"fasonează","participle-past":"fasonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fasona","gerund":"fasonând","first-person-indicative-present-singular":"fasonez","indicative-present-second-person-singular":"fasonezi","indicative-present-singular-third-person":"fasonează","first-person-indicative-plural-present":"fasonăm","indicative-plural-present-second-person":"fasonați","indicative-plural-present-third-person":"fasonează","first-person-imperfect-indicative-singular":"fasonam","imperfect-indicative-second-person-singular":"fasonai","imperfect-indicative-singular-third-person":"fasona","first-person-imperfect-indicative-plural":"fasonam","imperfect-indicative-plural-second-person":"fasonați","imperfect-indicative-plural-third-person":"fasonau","first-person-indicative-perfect-singular":"fasonai","indicative-perfect-second-person-singular":"fasonași","indicative-perfect-singular-third-person":"fasonă","first-person-indicative-perfect-plural":"fasonarăm","indicative-perfect-plural-second-person":"fasonarăți","indicative-perfect-plural-third-person":"fasonară","first-person-indicative-pluperfect-singular":"fasonasem","indicative-pluperfect-second-person-singular":"fasonaseși","indicative-pluperfect-singular-third-person":"fasonase","first-person-indicative-pluperfect-plural":"fasonaserăm","indicative-pluperfect-plural-second-person":"fasonaserăți","indicative-pluperfect-plural-third-person":"fasonaseră","first-person-present-singular-subjunctive":"să fasonez","present-second-person-singular-subjunctive":"să fasonezi","present-singular-subjunctive-third-person":"să fasoneze","first-person-plural-present-subjunctive":"să fasonăm","plural-present-second-person-subjunctive":"să fasonați","plural-present-subjunctive-third-person":"să fasoneze","imperative-second-person-singular":"fasonează","imperative-plural-second-person":"fasonați","imperative-negative-second-person-singular":"nu fasona","imperative-negative-plural-second-person":"nu fasonați"}},{"word":"fasonaj","pos":"noun","definitions":["shaping"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fasonaj","accusative-definite-nominative":"fasonajul","dative-genitive-indefinite":"fasonaj","dative-definite-genitive":"fasonajului","vocative":"fasonajule"}},{"word":"fasonatoare","pos":"noun","definitions":["female equivalent of fasonator"],"forms":{"plural":"fasonatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fasonatoare","accusative-definite-nominative-singular":"fasonatoarea","accusative-indefinite-nominative-plural":"fasonatoare","accusative-definite-nominative-plural":"fasonatoarele","dative-genitive-indefinite-singular":"fasonatoare","dative-definite-genitive-singular":"fasonatoarei","dative-genitive-indefinite-plural":"fasonatoare","dative-definite-genitive-plural":"fasonatoarelor","singular-vocative":"fasonatoare","plural-vocative":"fasonatoarelor"}},{"word":"fast","pos":"noun","definitions":["splendour, pomp"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fast","accusative-definite-nominative":"fastul","dative-genitive-indefinite":"fast","dative-definite-genitive":"fastului","vocative":"fastule"}},{"word":"fast-food","pos":"noun","definitions":["fast-food"],"forms":{"plural":"fast-fooduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fast-food","accusative-definite-nominative-singular":"fast-foodul","accusative-indefinite-nominative-plural":"fast-fooduri","accusative-definite-nominative-plural":"fast-foodurile","dative-genitive-indefinite-singular":"fast-food","dative-definite-genitive-singular":"fast-foodului","dative-genitive-indefinite-plural":"fast-fooduri","dative-definite-genitive-plural":"fast-foodurilor","singular-vocative":"fast-foodule","plural-vocative":"fast-foodurilor"}},{"word":"fâstâc","pos":"noun","definitions":["alternative form of fistic"],"forms":{"plural":"fâstâci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fâstâc","accusative-definite-nominative-singular":"fâstâcul","accusative-indefinite-nominative-plural":"fâstâci","accusative-definite-nominative-plural":"fâstâcii","dative-genitive-indefinite-singular":"fâstâc","dative-definite-genitive-singular":"fâstâcului","dative-genitive-indefinite-plural":"fâstâci","dative-definite-genitive-plural":"fâstâcilor","singular-vocative":"fâstâcule","plural-vocative":"fâstâcilor"}},{"word":"fâstâceală","pos":"noun","definitions":["confusion, especially if caused by shyness"],"forms":{"plural":"fâstâceli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâstâceală","accusative-definite-nominative-singular":"fâstâceala","accusative-indefinite-nominative-plural":"fâstâcele","accusative-definite-nominative-plural":"fâstâcelele","dative-genitive-indefinite-singular":"fâstâcele","dative-definite-genitive-singular":"fâstâcelei","dative-genitive-indefinite-plural":"fâstâcele","dative-definite-genitive-plural":"fâstâcelelor","singular-vocative":"fâstâceală","plural-vocative":"fâstâcelelor"}},{"word":"fâstâci","pos":"verb","definitions":["to be intimidated"],"forms":{"canonical":"a fâstâci 4th conjugation","present-singular-third-person":"fâstâcește","participle-past":"fâstâcit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fâstâci","gerund":"fâstâcind","first-person-indicative-present-singular":"fâstâcesc","indicative-present-second-person-singular":"fâstâcești","indicative-present-singular-third-person":"fâstâcește","first-person-indicative-plural-present":"fâstâcim","indicative-plural-present-second-person":"fâstâciți","indicative-plural-present-third-person":"fâstâcesc","first-person-imperfect-indicative-singular":"fâstâceam","imperfect-indicative-second-person-singular":"fâstâceai","imperfect-indicative-singular-third-person":"fâstâcea","first-person-imperfect-indicative-plural":"fâstâceam","imperfect-indicative-plural-second-person":"fâstâceați","imperfect-indicative-plural-third-person":"fâstâceau","first-person-indicative-perfect-singular":"fâstâcii","indicative-perfect-second-person-singular":"fâstâciși","indicative-perfect-singular-third-person":"fâstâci","first-person-indicative-perfect-plural":"fâstâcirăm","indicative-perfect-plural-second-person":"fâstâcirăți","indicative-perfect-plural-third-person":"fâstâciră","first-person-indicative-pluperfect-singular":"fâstâcisem","indicative-pluperfect-second-person-singular":"fâstâciseși","indicative-pluperfect-singular-third-person":"fâstâcise","first-person-indicative-pluperfect-plural":"fâstâciserăm","indicative-pluperfect-plural-second-person":"fâstâciserăți","indicative-pluperfect-plural-third-person":"fâstâciseră","first-person-present-singular-subjunctive":"să fâstâcesc","present-second-person-singular-subjunctive":"să fâstâcești","present-singular-subjunctive-third-person":"să fâstâcească","first-person-plural-present-subjunctive":"să fâstâcim","plural-present-second-person-subjunctive":"să fâstâciți","plural-present-subjunctive-third-person":"să fâstâcească","imperative-second-person-singular":"fâstâcește","imperative-plural-second-person":"fâstâciți","imperative-negative-second-person-singular":"nu fâstâci","imperative-negative-plural-second-person":"nu fâstâciți"}},{"word":"fâstâcire","pos":"noun","definitions":["becoming intimidated"],"forms":{"plural":"fâstâciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fâstâcire","accusative-definite-nominative-singular":"fâstâcirea","accusative-indefinite-nominative-plural":"fâstâciri","accusative-definite-nominative-plural":"fâstâcirile","dative-genitive-indefinite-singular":"fâstâciri","dative-definite-genitive-singular":"fâstâcirii","dative-genitive-indefinite-plural":"fâstâciri","dative-definite-genitive-plural":"fâstâcirilor","singular-vocative":"fâstâcire","plural-vocative":"fâstâcirilor"}},{"word":"fâstâcit","pos":"adj","definitions":["flustered"],"forms":{"feminine-singular":"fâstâcită","masculine-plural":"fâstâciți","feminine-neuter-plural":"fâstâcite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fâstâcit","error-unrecognized-form-feminine-indefinite-singular":"fâstâcită","error-unrecognized-form-indefinite-masculine-plural":"fâstâciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fâstâcite","definite-error-unrecognized-form-masculine-neuter-singular":"fâstâcitul","definite-error-unrecognized-form-feminine-singular":"fâstâcita","definite-error-unrecognized-form-masculine-plural":"fâstâciții","definite-error-unrecognized-form-feminine-neuter-plural":"fâstâcitele"}},{"word":"fâstâcit","pos":"verb","definitions":["past participle of fâstâci"],"forms":{"participle-past":"of fâstâci"}},{"word":"fastidios","pos":"adj","definitions":["tedious"],"forms":{"feminine-singular":"fastidioasă","masculine-plural":"fastidioși","feminine-neuter-plural":"fastidioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fastidios","error-unrecognized-form-feminine-indefinite-singular":"fastidioasă","error-unrecognized-form-indefinite-masculine-plural":"fastidioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fastidioase","definite-error-unrecognized-form-masculine-neuter-singular":"fastidiosul","definite-error-unrecognized-form-feminine-singular":"fastidioasa","definite-error-unrecognized-form-masculine-plural":"fastidioșii","definite-error-unrecognized-form-feminine-neuter-plural":"fastidioasele"}},{"word":"fastuos","pos":"adj","definitions":["sumptuous"],"forms":{"feminine-singular":"fastuoasă","masculine-plural":"fastuoși","feminine-neuter-plural":"fastuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fastuos","error-unrecognized-form-feminine-indefinite-singular":"fastuoasă","error-unrecognized-form-indefinite-masculine-plural":"fastuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fastuoase","definite-error-unrecognized-form-masculine-neuter-singular":"fastuosul","definite-error-unrecognized-form-feminine-singular":"fastuoasa","definite-error-unrecognized-form-masculine-plural":"fastuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fastuoasele"}},{"word":"fasulă","pos":"noun","definitions":["obsolete form of fasole"],"forms":{"plural":"fasule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fasulă","accusative-definite-nominative-singular":"fasula","accusative-indefinite-nominative-plural":"fasule","accusative-definite-nominative-plural":"fasulele","dative-genitive-indefinite-singular":"fasule","dative-definite-genitive-singular":"fasulei","dative-genitive-indefinite-plural":"fasule","dative-definite-genitive-plural":"fasulelor","singular-vocative":"fasulă","plural-vocative":"fasulelor"}},{"word":"fasule","pos":"noun","definitions":["alternative form of fasole"],"forms":{"plural":"fasule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fasule","accusative-definite-nominative-singular":"fasulea","accusative-indefinite-nominative-plural":"fasule","accusative-definite-nominative-plural":"fasulele","dative-genitive-indefinite-singular":"fasule","dative-definite-genitive-singular":"fasulei","dative-genitive-indefinite-plural":"fasule","dative-definite-genitive-plural":"fasulelor","singular-vocative":"fasule","plural-vocative":"fasulelor"}},{"word":"făsule","pos":"noun","definitions":["alternative form of fasole"],"forms":{"plural":"făsule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"făsule","accusative-definite-nominative-singular":"făsulea","accusative-indefinite-nominative-plural":"făsule","accusative-definite-nominative-plural":"făsulele","dative-genitive-indefinite-singular":"făsule","dative-definite-genitive-singular":"făsulei","dative-genitive-indefinite-plural":"făsule","dative-definite-genitive-plural":"făsulelor","singular-vocative":"făsule","plural-vocative":"făsulelor"}},{"word":"fasung","pos":"noun","definitions":["light bulb base"],"forms":{"plural":"fasunguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fasung","accusative-definite-nominative-singular":"fasungul","accusative-indefinite-nominative-plural":"fasunguri","accusative-definite-nominative-plural":"fasungurile","dative-genitive-indefinite-singular":"fasung","dative-definite-genitive-singular":"fasungului","dative-genitive-indefinite-plural":"fasunguri","dative-definite-genitive-plural":"fasungurilor","singular-vocative":"fasungule","plural-vocative":"fasungurilor"}},{"word":"fășura","pos":"verb","definitions":["to wrap"],"forms":{"canonical":"a fășura 1st conjugation","present-singular-third-person":"înfășoară","participle-past":"fășurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fășura","gerund":"fășurând","first-person-indicative-present-singular":"fășur","indicative-present-second-person-singular":"fășuri","indicative-present-singular-third-person":"fășură","first-person-indicative-plural-present":"fășurăm","indicative-plural-present-second-person":"fășurați","indicative-plural-present-third-person":"fășură","first-person-imperfect-indicative-singular":"fășuram","imperfect-indicative-second-person-singular":"fășurai","imperfect-indicative-singular-third-person":"fășura","first-person-imperfect-indicative-plural":"fășuram","imperfect-indicative-plural-second-person":"fășurați","imperfect-indicative-plural-third-person":"fășurau","first-person-indicative-perfect-singular":"fășurai","indicative-perfect-second-person-singular":"fășurași","indicative-perfect-singular-third-person":"fășură","first-person-indicative-perfect-plural":"fășurarăm","indicative-perfect-plural-second-person":"fășurarăți","indicative-perfect-plural-third-person":"fășurară","first-person-indicative-pluperfect-singular":"fășurasem","indicative-pluperfect-second-person-singular":"fășuraseși","indicative-pluperfect-singular-third-person":"fășurase","first-person-indicative-pluperfect-plural":"fășuraserăm","indicative-pluperfect-plural-second-person":"fășuraserăți","indicative-pluperfect-plural-third-person":"fășuraseră","first-person-present-singular-subjunctive":"să fășur","present-second-person-singular-subjunctive":"să fășuri","present-singular-subjunctive-third-person":"să fășure","first-person-plural-present-subjunctive":"să fășurăm","plural-present-second-person-subjunctive":"să fășurați","plural-present-subjunctive-third-person":"să fășure","imperative-second-person-singular":"fășură","imperative-plural-second-person":"fășurați","imperative-negative-second-person-singular":"nu fășura","imperative-negative-plural-second-person":"nu fășurați"}},{"word":"fășuță","pos":"noun","definitions":["diminutive of fașă"],"forms":{"plural":"fășuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fășuță","accusative-definite-nominative-singular":"fășuța","accusative-indefinite-nominative-plural":"fășuțe","accusative-definite-nominative-plural":"fășuțele","dative-genitive-indefinite-singular":"fășuțe","dative-definite-genitive-singular":"fășuței","dative-genitive-indefinite-plural":"fășuțe","dative-definite-genitive-plural":"fășuțelor","singular-vocative":"fășuță","plural-vocative":"fășuțelor"}},{"word":"făt","pos":"noun","definitions":["fetus","young child, boy, youth","young of an animal, such as a cub"],"forms":{"plural":"feți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făt","accusative-definite-nominative-singular":"fătul","accusative-indefinite-nominative-plural":"feți","accusative-definite-nominative-plural":"feții","dative-genitive-indefinite-singular":"făt","dative-definite-genitive-singular":"fătului","dative-genitive-indefinite-plural":"feți","dative-definite-genitive-plural":"feților","singular-vocative":"fătule","plural-vocative":"feților"}},{"word":"Făt-Frumos","pos":"noun","definitions":["a handsome, brave, and noble youth of good character from traditional Romanian fairy-tales, similar to the idea of Prince Charming or the like","an exceptionally handsome young man"],"pronunciation":"/fət.fruˈmos/","forms":{"plural":"Feți-Frumoși"}},{"word":"Fata","pos":"name","definitions":["a village in Vedea, Argeș County, Romania"],"gender":"f"},{"word":"fata","pos":"noun","definitions":["definite nominative/accusative singular of fată"],"pronunciation":"[ˈfata]"},{"word":"fată","pos":"noun","definitions":["girl","daughter"],"pronunciation":"[ˈfa.tə]","examples":[{"ro":"Ce face fata asta?","en":"What is that girl doing?"},{"ro":"Acele fete vorbesc germană.","en":"Those girls speak German."},{"ro":"E fata mea.","en":"She's my daughter."}],"forms":{"plural":"fete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fată","accusative-definite-nominative-singular":"fata","accusative-indefinite-nominative-plural":"fete","accusative-definite-nominative-plural":"fetele","dative-genitive-indefinite-singular":"fete","dative-definite-genitive-singular":"fetei","dative-genitive-indefinite-plural":"fete","dative-definite-genitive-plural":"fetelor","singular-vocative":"fată","plural-vocative":"fetelor"}},{"word":"Fața","pos":"name","definitions":["a village in Albac, Alba County, Romania"],"gender":"f"},{"word":"fața","pos":"noun","definitions":["definite nominative/accusative singular of față"],"pronunciation":"[ˈfatsa]","gender":"f"},{"word":"față","pos":"noun","definitions":["face","visage","aspect","surface, front"],"pronunciation":"/ˈfa.t͡sə/","examples":[{"ro":"față în față","en":"face to face"},{"ro":"Sunt niște copii în fața școlii.","en":"There are some children in front of the school."}],"forms":{"plural":"fețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"față","accusative-definite-nominative-singular":"fața","accusative-indefinite-nominative-plural":"fețe","accusative-definite-nominative-plural":"fețele","dative-genitive-indefinite-singular":"fețe","dative-definite-genitive-singular":"feței","dative-genitive-indefinite-plural":"fețe","dative-definite-genitive-plural":"fețelor","singular-vocative":"față","plural-vocative":"fețelor","alternative":"фацэ"}},{"word":"fâța","pos":"intj","definitions":["alternative form of fâț"]},{"word":"fâță","pos":"noun","definitions":["a small fish"],"pronunciation":"/ˈfɨ.t͡sə/","forms":{"plural":"fâțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâță","accusative-definite-nominative-singular":"fâța","accusative-indefinite-nominative-plural":"fâțe","accusative-definite-nominative-plural":"fâțele","dative-genitive-indefinite-singular":"fâțe","dative-definite-genitive-singular":"fâței","dative-genitive-indefinite-plural":"fâțe","dative-definite-genitive-plural":"fâțelor","singular-vocative":"fâță","plural-vocative":"fâțelor","alternative":"фыцэ"}},{"word":"făta","pos":"verb","definitions":["to give birth to, foal, litter, yean, calve, whelp, farrow, pup"],"examples":[{"ro":"Pisica noastră a fătat ieri.","en":"Our cat gave birth yesterday."}],"forms":{"canonical":"a făta 1st conjugation","present-singular-third-person":"fată","participle-past":"fătat","subjunctive-third-person":"fete","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a făta","gerund":"fătând","first-person-indicative-present-singular":"făt","indicative-present-second-person-singular":"feți","indicative-present-singular-third-person":"fată","first-person-indicative-plural-present":"fătăm","indicative-plural-present-second-person":"fătați","indicative-plural-present-third-person":"fată","first-person-imperfect-indicative-singular":"fătam","imperfect-indicative-second-person-singular":"fătai","imperfect-indicative-singular-third-person":"făta","first-person-imperfect-indicative-plural":"fătam","imperfect-indicative-plural-second-person":"fătați","imperfect-indicative-plural-third-person":"fătau","first-person-indicative-perfect-singular":"fătai","indicative-perfect-second-person-singular":"fătași","indicative-perfect-singular-third-person":"fătă","first-person-indicative-perfect-plural":"fătarăm","indicative-perfect-plural-second-person":"fătarăți","indicative-perfect-plural-third-person":"fătară","first-person-indicative-pluperfect-singular":"fătasem","indicative-pluperfect-second-person-singular":"fătaseși","indicative-pluperfect-singular-third-person":"fătase","first-person-indicative-pluperfect-plural":"fătaserăm","indicative-pluperfect-plural-second-person":"fătaserăți","indicative-pluperfect-plural-third-person":"fătaseră","first-person-present-singular-subjunctive":"să făt","present-second-person-singular-subjunctive":"să feți","present-singular-subjunctive-third-person":"să fete","first-person-plural-present-subjunctive":"să fătăm","plural-present-second-person-subjunctive":"să fătați","plural-present-subjunctive-third-person":"să fete","imperative-second-person-singular":"fată","imperative-plural-second-person":"fătați","imperative-negative-second-person-singular":"nu făta","imperative-negative-plural-second-person":"nu fătați"}},{"word":"Fața Abrudului","pos":"name","definitions":["a locality in Câmpeni, Alba County, Romania"],"gender":"f","forms":{"canonical-feminine":"Față Abrudului"}},{"word":"fată bătrână","pos":"noun","definitions":["spinster, old maid"],"forms":{"plural":"fete bătrâne"}},{"word":"față bisericească","pos":"noun","definitions":["clergyperson"],"forms":{"plural":"fețe bisericești"}},{"word":"Fața Cremenii","pos":"name","definitions":["a village in Tâmna, Mehedinți County, Romania"],"gender":"f"},{"word":"Fața Cristesei","pos":"name","definitions":["a village in Arieșeni, Alba County, Romania"],"gender":"f"},{"word":"față de masă","pos":"noun","definitions":["tablecloth"],"forms":{"plural":"fețe de masă"}},{"word":"față de pernă","pos":"noun","definitions":["pillowcase"],"forms":{"plural":"fețe de pernă"}},{"word":"Fața Iarului","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Jiul de Vest"],"gender":"f"},{"word":"fată în casă","pos":"noun","definitions":["maid"],"forms":{"plural":"fete în casă"}},{"word":"Fața Lăpușului","pos":"name","definitions":["a village in Arieșeni, Alba County, Romania"],"gender":"f","forms":{"canonical-feminine":"Față Lăpușului"}},{"word":"Fața lui Nan","pos":"name","definitions":["a village in Cozieni, Buzău County, Romania"],"gender":"f"},{"word":"fată mare","pos":"noun","definitions":["virgin"],"forms":{"plural":"fete mari"}},{"word":"Fața Motrului","pos":"name","definitions":["a village in Stângăceaua, Mehedinți County, Romania"],"gender":"f"},{"word":"Fața Pietrii","pos":"name","definitions":["a village in Stremț, Alba County, Romania"],"gender":"f"},{"word":"Fața Roșie","pos":"name","definitions":["a village in Bătrâna, Hunedoara County, Romania"],"gender":"f"},{"word":"Fața-Lăzești","pos":"name","definitions":["a village in Scărișoara, Alba County, Romania"],"gender":"f"},{"word":"Fătăciunea","pos":"name","definitions":["a river in Iași, Romania, tributary to the Gârboveta"],"gender":"f"},{"word":"Fătăciunii","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"fațadă","pos":"noun","definitions":["façade, face, front","façade, front, false appearance"],"forms":{"plural":"fațade"}},{"word":"fâțâi","pos":"verb","definitions":["to fuss"],"forms":{"canonical":"a fâțâi 4th conjugation","present-singular-third-person":"fâțâie","participle-past":"fâțâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fâțâi","gerund":"fâțâind","first-person-indicative-present-singular":"fâțâi","indicative-present-second-person-singular":"fâțâi","indicative-present-singular-third-person":"fâțâie","first-person-indicative-plural-present":"fâțâim","indicative-plural-present-second-person":"fâțâiți","indicative-plural-present-third-person":"fâțâie","first-person-imperfect-indicative-singular":"fâțâiam","imperfect-indicative-second-person-singular":"fâțâiai","imperfect-indicative-singular-third-person":"fâțâia","first-person-imperfect-indicative-plural":"fâțâiam","imperfect-indicative-plural-second-person":"fâțâiați","imperfect-indicative-plural-third-person":"fâțâiau","first-person-indicative-perfect-singular":"fâțâii","indicative-perfect-second-person-singular":"fâțâiși","indicative-perfect-singular-third-person":"fâțâi","first-person-indicative-perfect-plural":"fâțâirăm","indicative-perfect-plural-second-person":"fâțâirăți","indicative-perfect-plural-third-person":"fâțâiră","first-person-indicative-pluperfect-singular":"fâțâisem","indicative-pluperfect-second-person-singular":"fâțâiseși","indicative-pluperfect-singular-third-person":"fâțâise","first-person-indicative-pluperfect-plural":"fâțâiserăm","indicative-pluperfect-plural-second-person":"fâțâiserăți","indicative-pluperfect-plural-third-person":"fâțâiseră","first-person-present-singular-subjunctive":"să fâțâi","present-second-person-singular-subjunctive":"să fâțâi","present-singular-subjunctive-third-person":"să fâțâie","first-person-plural-present-subjunctive":"să fâțâim","plural-present-second-person-subjunctive":"să fâțâiți","plural-present-subjunctive-third-person":"să fâțâie","imperative-second-person-singular":"fâțâie","imperative-plural-second-person":"fâțâiți","imperative-negative-second-person-singular":"nu fâțâi","imperative-negative-plural-second-person":"nu fâțâiți"}},{"word":"fâțâială","pos":"noun","definitions":["fussing"],"forms":{"plural":"fâțâieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâțâială","accusative-definite-nominative-singular":"fâțâiala","accusative-indefinite-nominative-plural":"fâțâiali","accusative-definite-nominative-plural":"fâțâialile","dative-genitive-indefinite-singular":"fâțâiali","dative-definite-genitive-singular":"fâțâialii","dative-genitive-indefinite-plural":"fâțâiali","dative-definite-genitive-plural":"fâțâialilor","singular-vocative":"fâțâială","plural-vocative":"fâțâialilor"}},{"word":"fâțâire","pos":"noun","definitions":["fussing"],"forms":{"plural":"fâțâiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fâțâire","accusative-definite-nominative-singular":"fâțâirea","accusative-indefinite-nominative-plural":"fâțâiri","accusative-definite-nominative-plural":"fâțâirile","dative-genitive-indefinite-singular":"fâțâiri","dative-definite-genitive-singular":"fâțâirii","dative-genitive-indefinite-plural":"fâțâiri","dative-definite-genitive-plural":"fâțâirilor","singular-vocative":"fâțâire","plural-vocative":"fâțâirilor"}},{"word":"fâțâit","pos":"noun","definitions":["fussing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fâțâit","accusative-definite-nominative":"fâțâitul","dative-genitive-indefinite":"fâțâit","dative-definite-genitive":"fâțâitului","vocative":"fâțâitule"}},{"word":"fâțâit","pos":"verb","definitions":["past participle of fâțâi"],"forms":{"participle-past":"of fâțâi"}},{"word":"fâțâitură","pos":"noun","definitions":["fussing"],"forms":{"plural":"fâțâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fâțâitură","accusative-definite-nominative-singular":"fâțâitura","accusative-indefinite-nominative-plural":"fâțâituri","accusative-definite-nominative-plural":"fâțâiturile","dative-genitive-indefinite-singular":"fâțâituri","dative-definite-genitive-singular":"fâțâiturii","dative-genitive-indefinite-plural":"fâțâituri","dative-definite-genitive-plural":"fâțâiturilor","singular-vocative":"fâțâitură","plural-vocative":"fâțâiturilor"}},{"word":"fatal","pos":"adj","definitions":["fatal (causing or characterised by death or misfortune)","fatal (inevitable, dictated by fate)"],"pronunciation":"/faˈtal/","examples":[{"ro":"Generată de nevoia de a lupta împotriva inamicului comun – Germania nazistă –, era fatal ca alianța să se surpe, întrucât între SUA și URSS, diferențele[…] erau ireconciliabile.","en":"Occasioned by the need to fight against the common enemy—Nazi Germany—it was inevitable that the alliance would collapse, as the differences between the USA and the USSR […] were irreconcilable."}],"forms":{"feminine-singular":"fatală","masculine-plural":"fatali","feminine-neuter-plural":"fatale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fatal","error-unrecognized-form-feminine-indefinite-singular":"fatală","error-unrecognized-form-indefinite-masculine-plural":"fatali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fatale","definite-error-unrecognized-form-masculine-neuter-singular":"fatalul","definite-error-unrecognized-form-feminine-singular":"fatala","definite-error-unrecognized-form-masculine-plural":"fatalii","definite-error-unrecognized-form-feminine-neuter-plural":"fatalele","alternative":"фатал"}},{"word":"fatală","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of fatal"]},{"word":"fătălău","pos":"noun","definitions":["pansy (a timid, weak man or boy; a wuss.)"],"forms":{"plural":"fătălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fătălău","accusative-definite-nominative-singular":"fătălăul","accusative-indefinite-nominative-plural":"fătălăi","accusative-definite-nominative-plural":"fătălăii","dative-genitive-indefinite-singular":"fătălău","dative-definite-genitive-singular":"fătălăului","dative-genitive-indefinite-plural":"fătălăi","dative-definite-genitive-plural":"fătălăilor","singular-vocative":"fătălăule","plural-vocative":"fătălăilor"}},{"word":"fatale","pos":"adj","definitions":["indefinite nominative/accusative/genitive/dative feminine/neuter plural of fatal","indefinite genitive/dative feminine singular of fatal"]},{"word":"fatali","pos":"adj","definitions":["indefinite nominative/accusative/genitive/dative masculine plural of fatal"]},{"word":"fatalism","pos":"noun","definitions":["fatalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fatalism","accusative-definite-nominative":"fatalismul","dative-genitive-indefinite":"fatalism","dative-definite-genitive":"fatalismului","vocative":"fatalismule"}},{"word":"fatalist","pos":"adj","definitions":["fatalistic"],"forms":{"feminine-singular":"fatalistă","masculine-plural":"fataliști","feminine-neuter-plural":"fataliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fatalist","error-unrecognized-form-feminine-indefinite-singular":"fatalistă","error-unrecognized-form-indefinite-masculine-plural":"fataliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fataliste","definite-error-unrecognized-form-masculine-neuter-singular":"fatalistul","definite-error-unrecognized-form-feminine-singular":"fatalista","definite-error-unrecognized-form-masculine-plural":"fataliștii","definite-error-unrecognized-form-feminine-neuter-plural":"fatalistele"}},{"word":"fatalistă","pos":"noun","definitions":["female equivalent of fatalist"],"forms":{"plural":"fataliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fatalistă","accusative-definite-nominative-singular":"fatalista","accusative-indefinite-nominative-plural":"fataliste","accusative-definite-nominative-plural":"fatalistele","dative-genitive-indefinite-singular":"fataliste","dative-definite-genitive-singular":"fatalistei","dative-genitive-indefinite-plural":"fataliste","dative-definite-genitive-plural":"fatalistelor","singular-vocative":"fatalistă","plural-vocative":"fatalistelor"}},{"word":"fatalitate","pos":"noun","definitions":["fatality"],"forms":{"plural":"fatalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fatalitate","accusative-definite-nominative-singular":"fatalitatea","accusative-indefinite-nominative-plural":"fatalități","accusative-definite-nominative-plural":"fatalitățile","dative-genitive-indefinite-singular":"fatalități","dative-definite-genitive-singular":"fatalității","dative-genitive-indefinite-plural":"fatalități","dative-definite-genitive-plural":"fatalităților","singular-vocative":"fatalitate","plural-vocative":"fatalităților"}},{"word":"fatalmente","pos":"adv","definitions":["fatally"]},{"word":"fătare","pos":"noun","definitions":["calving"],"forms":{"plural":"fătări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fătare","accusative-definite-nominative-singular":"fătarea","accusative-indefinite-nominative-plural":"fătări","accusative-definite-nominative-plural":"fătările","dative-genitive-indefinite-singular":"fătări","dative-definite-genitive-singular":"fătării","dative-genitive-indefinite-plural":"fătări","dative-definite-genitive-plural":"fătărilor","singular-vocative":"fătare","plural-vocative":"fătărilor"}},{"word":"fățări","pos":"verb","definitions":["to pretend"],"forms":{"canonical":"a fățări 4th conjugation","present-singular-third-person":"fățărește","participle-past":"fățărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fățări","gerund":"fățărind","first-person-indicative-present-singular":"fățăresc","indicative-present-second-person-singular":"fățărești","indicative-present-singular-third-person":"fățărește","first-person-indicative-plural-present":"fățărim","indicative-plural-present-second-person":"fățăriți","indicative-plural-present-third-person":"fățăresc","first-person-imperfect-indicative-singular":"fățăream","imperfect-indicative-second-person-singular":"fățăreai","imperfect-indicative-singular-third-person":"fățărea","first-person-imperfect-indicative-plural":"fățăream","imperfect-indicative-plural-second-person":"fățăreați","imperfect-indicative-plural-third-person":"fățăreau","first-person-indicative-perfect-singular":"fățării","indicative-perfect-second-person-singular":"fățăriși","indicative-perfect-singular-third-person":"fățări","first-person-indicative-perfect-plural":"fățărirăm","indicative-perfect-plural-second-person":"fățărirăți","indicative-perfect-plural-third-person":"fățăriră","first-person-indicative-pluperfect-singular":"fățărisem","indicative-pluperfect-second-person-singular":"fățăriseși","indicative-pluperfect-singular-third-person":"fățărise","first-person-indicative-pluperfect-plural":"fățăriserăm","indicative-pluperfect-plural-second-person":"fățăriserăți","indicative-pluperfect-plural-third-person":"fățăriseră","first-person-present-singular-subjunctive":"să fățăresc","present-second-person-singular-subjunctive":"să fățărești","present-singular-subjunctive-third-person":"să fățărească","first-person-plural-present-subjunctive":"să fățărim","plural-present-second-person-subjunctive":"să fățăriți","plural-present-subjunctive-third-person":"să fățărească","imperative-second-person-singular":"fățărește","imperative-plural-second-person":"fățăriți","imperative-negative-second-person-singular":"nu fățări","imperative-negative-plural-second-person":"nu fățăriți"}},{"word":"fățărie","pos":"noun","definitions":["hypocrisy"],"forms":{"plural":"fățării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fățărie","accusative-definite-nominative-singular":"fățăria","accusative-indefinite-nominative-plural":"fățării","accusative-definite-nominative-plural":"fățăriile","dative-genitive-indefinite-singular":"fățării","dative-definite-genitive-singular":"fățăriei","dative-genitive-indefinite-plural":"fățării","dative-definite-genitive-plural":"fățăriilor","singular-vocative":"fățărie","plural-vocative":"fățăriilor"}},{"word":"fățarnic","pos":"adj","definitions":["hypocritical"],"forms":{"feminine-singular":"fățarnică","masculine-plural":"fățarnici","feminine-neuter-plural":"fățarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fățarnic","error-unrecognized-form-feminine-indefinite-singular":"fățarnică","error-unrecognized-form-indefinite-masculine-plural":"fățarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fățarnice","definite-error-unrecognized-form-masculine-neuter-singular":"fățarnicul","definite-error-unrecognized-form-feminine-singular":"fățarnica","definite-error-unrecognized-form-masculine-plural":"fățarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"fățarnicele"}},{"word":"fățărnicește","pos":"adv","definitions":["hypocritically"]},{"word":"fățărnici","pos":"verb","definitions":["to pretend"],"forms":{"canonical":"a fățărnici 4th conjugation","present-singular-third-person":"fățărnicește","participle-past":"fățărnicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fățărnici","gerund":"fățărnicind","first-person-indicative-present-singular":"fățărnicesc","indicative-present-second-person-singular":"fățărnicești","indicative-present-singular-third-person":"fățărnicește","first-person-indicative-plural-present":"fățărnicim","indicative-plural-present-second-person":"fățărniciți","indicative-plural-present-third-person":"fățărnicesc","first-person-imperfect-indicative-singular":"fățărniceam","imperfect-indicative-second-person-singular":"fățărniceai","imperfect-indicative-singular-third-person":"fățărnicea","first-person-imperfect-indicative-plural":"fățărniceam","imperfect-indicative-plural-second-person":"fățărniceați","imperfect-indicative-plural-third-person":"fățărniceau","first-person-indicative-perfect-singular":"fățărnicii","indicative-perfect-second-person-singular":"fățărniciși","indicative-perfect-singular-third-person":"fățărnici","first-person-indicative-perfect-plural":"fățărnicirăm","indicative-perfect-plural-second-person":"fățărnicirăți","indicative-perfect-plural-third-person":"fățărniciră","first-person-indicative-pluperfect-singular":"fățărnicisem","indicative-pluperfect-second-person-singular":"fățărniciseși","indicative-pluperfect-singular-third-person":"fățărnicise","first-person-indicative-pluperfect-plural":"fățărniciserăm","indicative-pluperfect-plural-second-person":"fățărniciserăți","indicative-pluperfect-plural-third-person":"fățărniciseră","first-person-present-singular-subjunctive":"să fățărnicesc","present-second-person-singular-subjunctive":"să fățărnicești","present-singular-subjunctive-third-person":"să fățărnicească","first-person-plural-present-subjunctive":"să fățărnicim","plural-present-second-person-subjunctive":"să fățărniciți","plural-present-subjunctive-third-person":"să fățărnicească","imperative-second-person-singular":"fățărnicește","imperative-plural-second-person":"fățărniciți","imperative-negative-second-person-singular":"nu fățărnici","imperative-negative-plural-second-person":"nu fățărniciți"}},{"word":"fățărnicie","pos":"noun","definitions":["hypocrisy"],"forms":{"plural":"fățărnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fățărnicie","accusative-definite-nominative-singular":"fățărnicia","accusative-indefinite-nominative-plural":"fățărnicii","accusative-definite-nominative-plural":"fățărniciile","dative-genitive-indefinite-singular":"fățărnicii","dative-definite-genitive-singular":"fățărniciei","dative-genitive-indefinite-plural":"fățărnicii","dative-definite-genitive-plural":"fățărniciilor","singular-vocative":"fățărnicie","plural-vocative":"fățărniciilor"}},{"word":"fătat","pos":"noun","definitions":["calving"],"forms":{"plural":"fătaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fătat","accusative-definite-nominative-singular":"fătatul","accusative-indefinite-nominative-plural":"fătaturi","accusative-definite-nominative-plural":"fătaturile","dative-genitive-indefinite-singular":"fătat","dative-definite-genitive-singular":"fătatului","dative-genitive-indefinite-plural":"fătaturi","dative-definite-genitive-plural":"fătaturilor","singular-vocative":"fătatule","plural-vocative":"fătaturilor"}},{"word":"fătat","pos":"verb","definitions":["past participle of făta"],"forms":{"participle-past":"of făta"}},{"word":"fătătoare","pos":"adj","definitions":["calving"],"forms":{"masculine-plural":"fătătoari","feminine-neuter-plural":"fătătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fătătoare","error-unrecognized-form-feminine-indefinite-singular":"fătătoare","error-unrecognized-form-indefinite-masculine-plural":"fătătoari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fătătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fătătoarele","definite-error-unrecognized-form-feminine-singular":"fătătoarea","definite-error-unrecognized-form-masculine-plural":"fătătoarii","definite-error-unrecognized-form-feminine-neuter-plural":"fătătoarele"}},{"word":"fătătură","pos":"noun","definitions":["fabrication, fable"],"forms":{"plural":"fătături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fătătură","accusative-definite-nominative-singular":"fătătura","accusative-indefinite-nominative-plural":"fătături","accusative-definite-nominative-plural":"fătăturile","dative-genitive-indefinite-singular":"fătături","dative-definite-genitive-singular":"fătăturii","dative-genitive-indefinite-plural":"fătături","dative-definite-genitive-plural":"fătăturilor","singular-vocative":"fătătură","plural-vocative":"fătăturilor"}},{"word":"fațeta","pos":"verb","definitions":["to facet"],"forms":{"canonical":"a fațeta 1st conjugation","present-singular-third-person":"fațetează","participle-past":"fațetat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fațeta","gerund":"fațetând","first-person-indicative-present-singular":"fațetez","indicative-present-second-person-singular":"fațetezi","indicative-present-singular-third-person":"fațetează","first-person-indicative-plural-present":"fațetăm","indicative-plural-present-second-person":"fațetați","indicative-plural-present-third-person":"fațetează","first-person-imperfect-indicative-singular":"fațetam","imperfect-indicative-second-person-singular":"fațetai","imperfect-indicative-singular-third-person":"fațeta","first-person-imperfect-indicative-plural":"fațetam","imperfect-indicative-plural-second-person":"fațetați","imperfect-indicative-plural-third-person":"fațetau","first-person-indicative-perfect-singular":"fațetai","indicative-perfect-second-person-singular":"fațetași","indicative-perfect-singular-third-person":"fațetă","first-person-indicative-perfect-plural":"fațetarăm","indicative-perfect-plural-second-person":"fațetarăți","indicative-perfect-plural-third-person":"fațetară","first-person-indicative-pluperfect-singular":"fațetasem","indicative-pluperfect-second-person-singular":"fațetaseși","indicative-pluperfect-singular-third-person":"fațetase","first-person-indicative-pluperfect-plural":"fațetaserăm","indicative-pluperfect-plural-second-person":"fațetaserăți","indicative-pluperfect-plural-third-person":"fațetaseră","first-person-present-singular-subjunctive":"să fațetez","present-second-person-singular-subjunctive":"să fațetezi","present-singular-subjunctive-third-person":"să fațeteze","first-person-plural-present-subjunctive":"să fațetăm","plural-present-second-person-subjunctive":"să fațetați","plural-present-subjunctive-third-person":"să fațeteze","imperative-second-person-singular":"fațetează","imperative-plural-second-person":"fațetați","imperative-negative-second-person-singular":"nu fațeta","imperative-negative-plural-second-person":"nu fațetați"}},{"word":"fațetă","pos":"noun","definitions":["facet"],"forms":{"plural":"fațete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fațetă","accusative-definite-nominative-singular":"fațeta","accusative-indefinite-nominative-plural":"fațete","accusative-definite-nominative-plural":"fațetele","dative-genitive-indefinite-singular":"fațete","dative-definite-genitive-singular":"fațetei","dative-genitive-indefinite-plural":"fațete","dative-definite-genitive-plural":"fațetelor","singular-vocative":"fațetă","plural-vocative":"fațetelor"}},{"word":"fațetat","pos":"adj","definitions":["faceted"],"forms":{"feminine-singular":"fațetată","masculine-plural":"fațetați","feminine-neuter-plural":"fațetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fațetat","error-unrecognized-form-feminine-indefinite-singular":"fațetată","error-unrecognized-form-indefinite-masculine-plural":"fațetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fațetate","definite-error-unrecognized-form-masculine-neuter-singular":"fațetatul","definite-error-unrecognized-form-feminine-singular":"fațetata","definite-error-unrecognized-form-masculine-plural":"fațetații","definite-error-unrecognized-form-feminine-neuter-plural":"fațetatele"}},{"word":"fatidic","pos":"adj","definitions":["fateful"],"forms":{"feminine-singular":"fatidică","masculine-plural":"fatidici","feminine-neuter-plural":"fatidice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fatidic","error-unrecognized-form-feminine-indefinite-singular":"fatidică","error-unrecognized-form-indefinite-masculine-plural":"fatidici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fatidice","definite-error-unrecognized-form-masculine-neuter-singular":"fatidicul","definite-error-unrecognized-form-feminine-singular":"fatidica","definite-error-unrecognized-form-masculine-plural":"fatidicii","definite-error-unrecognized-form-feminine-neuter-plural":"fatidicele"}}];
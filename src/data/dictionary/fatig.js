@@ -0,0 +1 @@
+export default [{"word":"fatigabilitate","pos":"noun","definitions":["fatigability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fatigabilitate","accusative-definite-nominative-singular":"fatigabilitatea","accusative-indefinite-nominative-plural":"fatigabilități","accusative-definite-nominative-plural":"fatigabilitățile","dative-genitive-indefinite-singular":"fatigabilități","dative-definite-genitive-singular":"fatigabilității","dative-genitive-indefinite-plural":"fatigabilități","dative-definite-genitive-plural":"fatigabilităților","singular-vocative":"fatigabilitate","plural-vocative":"fatigabilităților"}},{"word":"fățiș","pos":"adj","definitions":["outspoken, open, downright, straight, plain, frank"],"pronunciation":"/fəˈt͡siʃ/","forms":{"feminine-singular":"fățișă","masculine-plural":"fățiși","feminine-neuter-plural":"fățișe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fățiș","error-unrecognized-form-feminine-indefinite-singular":"fățișă","error-unrecognized-form-indefinite-masculine-plural":"fățiși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fățișe","definite-error-unrecognized-form-masculine-neuter-singular":"fățișul","definite-error-unrecognized-form-feminine-singular":"fățișa","definite-error-unrecognized-form-masculine-plural":"fățișii","definite-error-unrecognized-form-feminine-neuter-plural":"fățișele"}},{"word":"fățișare","pos":"noun","definitions":["aspect, look, appearance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fățișare","accusative-definite-nominative":"fățișarea","dative-genitive-indefinite":"fățișări","dative-definite-genitive":"fățișării","vocative":"fățișare"}},{"word":"fâțișoară","pos":"noun","definitions":["diminutive of fâță"],"forms":{"plural":"fâțișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fâțișoară","accusative-definite-nominative-singular":"fâțișoara","accusative-indefinite-nominative-plural":"fâțișoare","accusative-definite-nominative-plural":"fâțișoarele","dative-genitive-indefinite-singular":"fâțișoare","dative-definite-genitive-singular":"fâțișoarei","dative-genitive-indefinite-plural":"fâțișoare","dative-definite-genitive-plural":"fâțișoarelor","singular-vocative":"fâțișoară","plural-vocative":"fâțișoarelor"}},{"word":"fato","pos":"noun","definitions":["vocative singular of fată"],"pronunciation":"[ˈfa.to]","gender":"f"},{"word":"fătoi","pos":"noun","definitions":["augmentative of fată"],"forms":{"plural":"fătoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fătoi","accusative-definite-nominative-singular":"fătoiul","accusative-indefinite-nominative-plural":"fătoaie","accusative-definite-nominative-plural":"fătoaiele","dative-genitive-indefinite-singular":"fătoi","dative-definite-genitive-singular":"fătoiului","dative-genitive-indefinite-plural":"fătoaie","dative-definite-genitive-plural":"fătoaielor","singular-vocative":"fătoiule","plural-vocative":"fătoaielor"}},{"word":"fătucă","pos":"noun","definitions":["diminutive of fată"],"forms":{"plural":"fătuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fătucă","accusative-definite-nominative-singular":"fătuca","accusative-indefinite-nominative-plural":"fătuci","accusative-definite-nominative-plural":"fătucile","dative-genitive-indefinite-singular":"fătuci","dative-definite-genitive-singular":"fătucii","dative-genitive-indefinite-plural":"fătuci","dative-definite-genitive-plural":"fătucilor","singular-vocative":"fătucă","plural-vocative":"fătucilor"}},{"word":"fățui","pos":"verb","definitions":["to plane, smooth, level, finish, polish"],"forms":{"canonical":"a fățui 4th conjugation","present-singular-third-person":"fățuiește","participle-past":"fățuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fățui","gerund":"fățuind","first-person-indicative-present-singular":"fățuiesc","indicative-present-second-person-singular":"fățuiești","indicative-present-singular-third-person":"fățuiește","first-person-indicative-plural-present":"fățuim","indicative-plural-present-second-person":"fățuiți","indicative-plural-present-third-person":"fățuiesc","first-person-imperfect-indicative-singular":"fățuiam","imperfect-indicative-second-person-singular":"fățuiai","imperfect-indicative-singular-third-person":"fățuia","first-person-imperfect-indicative-plural":"fățuiam","imperfect-indicative-plural-second-person":"fățuiați","imperfect-indicative-plural-third-person":"fățuiau","first-person-indicative-perfect-singular":"fățuii","indicative-perfect-second-person-singular":"fățuiși","indicative-perfect-singular-third-person":"fățui","first-person-indicative-perfect-plural":"fățuirăm","indicative-perfect-plural-second-person":"fățuirăți","indicative-perfect-plural-third-person":"fățuiră","first-person-indicative-pluperfect-singular":"fățuisem","indicative-pluperfect-second-person-singular":"fățuiseși","indicative-pluperfect-singular-third-person":"fățuise","first-person-indicative-pluperfect-plural":"fățuiserăm","indicative-pluperfect-plural-second-person":"fățuiserăți","indicative-pluperfect-plural-third-person":"fățuiseră","first-person-present-singular-subjunctive":"să fățuiesc","present-second-person-singular-subjunctive":"să fățuiești","present-singular-subjunctive-third-person":"să fățuiască","first-person-plural-present-subjunctive":"să fățuim","plural-present-second-person-subjunctive":"să fățuiți","plural-present-subjunctive-third-person":"să fățuiască","imperative-second-person-singular":"fățuiește","imperative-plural-second-person":"fățuiți","imperative-negative-second-person-singular":"nu fățui","imperative-negative-plural-second-person":"nu fățuiți"}},{"word":"fățuială","pos":"noun","definitions":["revetment, finishing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fățuială","accusative-definite-nominative":"fățuiala","dative-genitive-indefinite":"fățuiale","dative-definite-genitive":"fățuialei","vocative":"fățuială"}},{"word":"fătuică","pos":"noun","definitions":["diminutive of fată"],"forms":{"plural":"fătuici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fătuică","accusative-definite-nominative-singular":"fătuica","accusative-indefinite-nominative-plural":"fătuici","accusative-definite-nominative-plural":"fătuicile","dative-genitive-indefinite-singular":"fătuici","dative-definite-genitive-singular":"fătuicii","dative-genitive-indefinite-plural":"fătuici","dative-definite-genitive-plural":"fătuicilor","singular-vocative":"fătuică","plural-vocative":"fătuicilor"}},{"word":"fățuit","pos":"noun","definitions":["smoothed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fățuit","accusative-definite-nominative":"fățuitul","dative-genitive-indefinite":"fățuit","dative-definite-genitive":"fățuitului","vocative":"fățuitule"}},{"word":"fățuit","pos":"verb","definitions":["past participle of fățui"],"forms":{"participle-past":"of fățui"}},{"word":"fatuitate","pos":"noun","definitions":["fatuity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fatuitate","accusative-definite-nominative":"fatuitatea","dative-genitive-indefinite":"fatuități","dative-definite-genitive":"fatuității","vocative":"fatuitate"}},{"word":"fățuitoare","pos":"noun","definitions":["female equivalent of fățuitor"],"forms":{"plural":"fățuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fățuitoare","accusative-definite-nominative-singular":"fățuitoarea","accusative-indefinite-nominative-plural":"fățuitoare","accusative-definite-nominative-plural":"fățuitoarele","dative-genitive-indefinite-singular":"fățuitoare","dative-definite-genitive-singular":"fățuitoarei","dative-genitive-indefinite-plural":"fățuitoare","dative-definite-genitive-plural":"fățuitoarelor","singular-vocative":"fățuitoare","plural-vocative":"fățuitoarelor"}},{"word":"fățuitor","pos":"noun","definitions":["plane, smoothing plane","one who smoothes, planes, or levels with such a tool"],"forms":{"plural":"fățuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fățuitor","accusative-definite-nominative-singular":"fățuitorul","accusative-indefinite-nominative-plural":"fățuitori","accusative-definite-nominative-plural":"fățuitorii","dative-genitive-indefinite-singular":"fățuitor","dative-definite-genitive-singular":"fățuitorului","dative-genitive-indefinite-plural":"fățuitori","dative-definite-genitive-plural":"fățuitorilor","singular-vocative":"fățuitorule","plural-vocative":"fățuitorilor"}},{"word":"Fătulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fătulescu"}},{"word":"fatum","pos":"noun","definitions":["fate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fatum","accusative-definite-nominative":"fatumul","dative-genitive-indefinite":"fatum","dative-definite-genitive":"fatumului","vocative":"fatumule"}},{"word":"fătuță","pos":"noun","definitions":["diminutive of fată; small girl"],"forms":{"plural":"fătuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fătuță","accusative-definite-nominative-singular":"fătuța","accusative-indefinite-nominative-plural":"fătuțe","accusative-definite-nominative-plural":"fătuțele","dative-genitive-indefinite-singular":"fătuțe","dative-definite-genitive-singular":"fătuței","dative-genitive-indefinite-plural":"fătuțe","dative-definite-genitive-plural":"fătuțelor","singular-vocative":"fătuță","plural-vocative":"fătuțelor"}},{"word":"faulă","pos":"noun","definitions":["appearance, look"],"pronunciation":"/faˈu.lə/","forms":{"plural":"faule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faulă","accusative-definite-nominative-singular":"faula","accusative-indefinite-nominative-plural":"faule","accusative-definite-nominative-plural":"faulele","dative-genitive-indefinite-singular":"faule","dative-definite-genitive-singular":"faulei","dative-genitive-indefinite-plural":"faule","dative-definite-genitive-plural":"faulelor","singular-vocative":"faulă","plural-vocative":"faulelor","alternative":"făulă"}},{"word":"fault","pos":"noun","definitions":["foul"],"pronunciation":"/ˈfa.ult/","forms":{"plural":"faulturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fault","accusative-definite-nominative-singular":"faultul","accusative-indefinite-nominative-plural":"faulturi","accusative-definite-nominative-plural":"faulturile","dative-genitive-indefinite-singular":"fault","dative-definite-genitive-singular":"faultului","dative-genitive-indefinite-plural":"faulturi","dative-definite-genitive-plural":"faulturilor","singular-vocative":"faultule","plural-vocative":"faulturilor"}},{"word":"faulta","pos":"verb","definitions":["to commit a foul play"],"forms":{"canonical":"a faulta 1st conjugation","present-singular-third-person":"faultează","participle-past":"faultat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a faulta","gerund":"faultând","first-person-indicative-present-singular":"faultez","indicative-present-second-person-singular":"faultezi","indicative-present-singular-third-person":"faultează","first-person-indicative-plural-present":"faultăm","indicative-plural-present-second-person":"faultați","indicative-plural-present-third-person":"faultează","first-person-imperfect-indicative-singular":"faultam","imperfect-indicative-second-person-singular":"faultai","imperfect-indicative-singular-third-person":"faulta","first-person-imperfect-indicative-plural":"faultam","imperfect-indicative-plural-second-person":"faultați","imperfect-indicative-plural-third-person":"faultau","first-person-indicative-perfect-singular":"faultai","indicative-perfect-second-person-singular":"faultași","indicative-perfect-singular-third-person":"faultă","first-person-indicative-perfect-plural":"faultarăm","indicative-perfect-plural-second-person":"faultarăți","indicative-perfect-plural-third-person":"faultară","first-person-indicative-pluperfect-singular":"faultasem","indicative-pluperfect-second-person-singular":"faultaseși","indicative-pluperfect-singular-third-person":"faultase","first-person-indicative-pluperfect-plural":"faultaserăm","indicative-pluperfect-plural-second-person":"faultaserăți","indicative-pluperfect-plural-third-person":"faultaseră","first-person-present-singular-subjunctive":"să faultez","present-second-person-singular-subjunctive":"să faultezi","present-singular-subjunctive-third-person":"să faulteze","first-person-plural-present-subjunctive":"să faultăm","plural-present-second-person-subjunctive":"să faultați","plural-present-subjunctive-third-person":"să faulteze","imperative-second-person-singular":"faultează","imperative-plural-second-person":"faultați","imperative-negative-second-person-singular":"nu faulta","imperative-negative-plural-second-person":"nu faultați"}},{"word":"faultare","pos":"noun","definitions":["committing a fault"],"forms":{"plural":"faultări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"faultare","accusative-definite-nominative-singular":"faultarea","accusative-indefinite-nominative-plural":"faultări","accusative-definite-nominative-plural":"faultările","dative-genitive-indefinite-singular":"faultări","dative-definite-genitive-singular":"faultării","dative-genitive-indefinite-plural":"faultări","dative-definite-genitive-plural":"faultărilor","singular-vocative":"faultare","plural-vocative":"faultărilor"}},{"word":"faun","pos":"noun","definitions":["faun"],"forms":{"plural":"fauni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"faun","accusative-definite-nominative-singular":"faunul","accusative-indefinite-nominative-plural":"fauni","accusative-definite-nominative-plural":"faunii","dative-genitive-indefinite-singular":"faun","dative-definite-genitive-singular":"faunului","dative-genitive-indefinite-plural":"fauni","dative-definite-genitive-plural":"faunilor","singular-vocative":"faunule","plural-vocative":"faunilor"}},{"word":"faună","pos":"noun","definitions":["fauna"],"forms":{"plural":"faune","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"faună","accusative-definite-nominative-singular":"fauna","accusative-indefinite-nominative-plural":"faune","accusative-definite-nominative-plural":"faunele","dative-genitive-indefinite-singular":"faune","dative-definite-genitive-singular":"faunei","dative-genitive-indefinite-plural":"faune","dative-definite-genitive-plural":"faunelor","singular-vocative":"faună","plural-vocative":"faunelor"}},{"word":"faunesc","pos":"adj","definitions":["faunlike"],"forms":{"feminine-singular":"faunească","plural":"faunești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faunesc","error-unrecognized-form-feminine-indefinite-singular":"faunească","error-unrecognized-form-indefinite-masculine-plural":"faunești","error-unrecognized-form-feminine-indefinite-neuter-plural":"faunești","definite-error-unrecognized-form-masculine-neuter-singular":"faunescul","definite-error-unrecognized-form-feminine-singular":"fauneasca","definite-error-unrecognized-form-masculine-plural":"fauneștii","definite-error-unrecognized-form-feminine-neuter-plural":"fauneștile"}},{"word":"faunistic","pos":"adj","definitions":["faunistic"],"forms":{"feminine-singular":"faunistică","masculine-plural":"faunistici","feminine-neuter-plural":"faunistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"faunistic","error-unrecognized-form-feminine-indefinite-singular":"faunistică","error-unrecognized-form-indefinite-masculine-plural":"faunistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"faunistice","definite-error-unrecognized-form-masculine-neuter-singular":"faunisticul","definite-error-unrecognized-form-feminine-singular":"faunistica","definite-error-unrecognized-form-masculine-plural":"faunisticii","definite-error-unrecognized-form-feminine-neuter-plural":"faunisticele"}},{"word":"Faur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Faur"}},{"word":"faur","pos":"noun","definitions":["ironsmith, blacksmith"],"forms":{"plural":"fauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"faur","accusative-definite-nominative-singular":"faurul","accusative-indefinite-nominative-plural":"fauri","accusative-definite-nominative-plural":"faurii","dative-genitive-indefinite-singular":"faur","dative-definite-genitive-singular":"faurului","dative-genitive-indefinite-plural":"fauri","dative-definite-genitive-plural":"faurilor","singular-vocative":"faurule","plural-vocative":"faurilor"}},{"word":"făurar","pos":"noun","definitions":["smith"],"pronunciation":"/fəwˈrar/","forms":{"plural":"făurari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făurar","accusative-definite-nominative-singular":"făurarul","accusative-indefinite-nominative-plural":"făurari","accusative-definite-nominative-plural":"făurarii","dative-genitive-indefinite-singular":"făurar","dative-definite-genitive-singular":"făurarului","dative-genitive-indefinite-plural":"făurari","dative-definite-genitive-plural":"făurarilor","singular-vocative":"făurarule","plural-vocative":"făurarilor"}},{"word":"făurar","pos":"noun","definitions":["February (second month of the Gregorian calendar)"],"pronunciation":"/fəwˈrar/"},{"word":"făurăreasă","pos":"noun","definitions":["female equivalent of făurar"],"forms":{"plural":"făurărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făurăreasă","accusative-definite-nominative-singular":"făurăreasa","accusative-indefinite-nominative-plural":"făurărese","accusative-definite-nominative-plural":"făurăresele","dative-genitive-indefinite-singular":"făurărese","dative-definite-genitive-singular":"făurăresei","dative-genitive-indefinite-plural":"făurărese","dative-definite-genitive-plural":"făurăreselor","singular-vocative":"făurăreasă","plural-vocative":"făurăreselor"}},{"word":"făurărie","pos":"noun","definitions":["forge, smithy"],"forms":{"plural":"făurării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"făurărie","accusative-definite-nominative-singular":"făurăria","accusative-indefinite-nominative-plural":"făurării","accusative-definite-nominative-plural":"făurăriile","dative-genitive-indefinite-singular":"făurării","dative-definite-genitive-singular":"făurăriei","dative-genitive-indefinite-plural":"făurării","dative-definite-genitive-plural":"făurăriilor","singular-vocative":"făurărie","plural-vocative":"făurăriilor"}},{"word":"făureală","pos":"noun","definitions":["creation"],"forms":{"plural":"făureli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făureală","accusative-definite-nominative-singular":"făureala","accusative-indefinite-nominative-plural":"făurele","accusative-definite-nominative-plural":"făurelele","dative-genitive-indefinite-singular":"făurele","dative-definite-genitive-singular":"făurelei","dative-genitive-indefinite-plural":"făurele","dative-definite-genitive-plural":"făurelelor","singular-vocative":"făureală","plural-vocative":"făurelelor"}},{"word":"Făurei","pos":"name","definitions":["a city in Brăila County, Romania","a village in Ulmu, Călărași County, Romania","a village in Băneasa, Constanța County, Romania","a commune of Neamț County, Romania","a village in Făurei, Neamț County, Romania"],"gender":"m"},{"word":"Făurei Sat","pos":"name","definitions":["a village in Surdila-Greci, Brăila County, Romania"],"gender":"m"},{"word":"făurel","pos":"noun","definitions":["diminutive of faur; young ironsmith"],"forms":{"plural":"făurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făurel","accusative-definite-nominative-singular":"făurelul","accusative-indefinite-nominative-plural":"făurei","accusative-definite-nominative-plural":"făureii","dative-genitive-indefinite-singular":"făurel","dative-definite-genitive-singular":"făurelului","dative-genitive-indefinite-plural":"făurei","dative-definite-genitive-plural":"făureilor","singular-vocative":"făurelule","plural-vocative":"făureilor"}},{"word":"Făureni","pos":"name","definitions":["a village in Vultureni, Cluj County, Romania"],"gender":"m"},{"word":"Făurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Făurescu"}},{"word":"Făurești","pos":"name","definitions":["a village in Copalnic-Mănăștur, Maramureș County, Romania","a commune of Vâlcea County, Romania","a village in Făurești, Vâlcea County, Romania","a village in Zătreni, Vâlcea County, Romania"],"gender":"m"},{"word":"făuri","pos":"verb","definitions":["to forge (make at a forge)","to create, make, craft","to scheme, plan, devise, concoct"],"pronunciation":"/fə.uˈri/","forms":{"canonical":"a făuri 4th conjugation","present-singular-third-person":"făurește","participle-past":"făurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a făuri","gerund":"făurind","first-person-indicative-present-singular":"făuresc","indicative-present-second-person-singular":"făurești","indicative-present-singular-third-person":"făurește","first-person-indicative-plural-present":"făurim","indicative-plural-present-second-person":"făuriți","indicative-plural-present-third-person":"făuresc","first-person-imperfect-indicative-singular":"făuream","imperfect-indicative-second-person-singular":"făureai","imperfect-indicative-singular-third-person":"făurea","first-person-imperfect-indicative-plural":"făuream","imperfect-indicative-plural-second-person":"făureați","imperfect-indicative-plural-third-person":"făureau","first-person-indicative-perfect-singular":"făurii","indicative-perfect-second-person-singular":"făuriși","indicative-perfect-singular-third-person":"făuri","first-person-indicative-perfect-plural":"făurirăm","indicative-perfect-plural-second-person":"făurirăți","indicative-perfect-plural-third-person":"făuriră","first-person-indicative-pluperfect-singular":"făurisem","indicative-pluperfect-second-person-singular":"făuriseși","indicative-pluperfect-singular-third-person":"făurise","first-person-indicative-pluperfect-plural":"făuriserăm","indicative-pluperfect-plural-second-person":"făuriserăți","indicative-pluperfect-plural-third-person":"făuriseră","first-person-present-singular-subjunctive":"să făuresc","present-second-person-singular-subjunctive":"să făurești","present-singular-subjunctive-third-person":"să făurească","first-person-plural-present-subjunctive":"să făurim","plural-present-second-person-subjunctive":"să făuriți","plural-present-subjunctive-third-person":"să făurească","imperative-second-person-singular":"făurește","imperative-plural-second-person":"făuriți","imperative-negative-second-person-singular":"nu făuri","imperative-negative-plural-second-person":"nu făuriți"}},{"word":"făurie","pos":"noun","definitions":["forge"],"forms":{"plural":"făurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"făurie","accusative-definite-nominative-singular":"făuria","accusative-indefinite-nominative-plural":"făurii","accusative-definite-nominative-plural":"făuriile","dative-genitive-indefinite-singular":"făurii","dative-definite-genitive-singular":"făuriei","dative-genitive-indefinite-plural":"făurii","dative-definite-genitive-plural":"făuriilor","singular-vocative":"făurie","plural-vocative":"făuriilor"}},{"word":"făurire","pos":"noun","definitions":["building"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"făurire","accusative-definite-nominative":"făurirea","dative-genitive-indefinite":"făurire","dative-definite-genitive":"făurirei","vocative":"făurire"}},{"word":"făuriște","pos":"noun","definitions":["ironsmith's shop"],"forms":{"plural":"făuriști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"făuriște","accusative-definite-nominative-singular":"făuriștea","accusative-indefinite-nominative-plural":"făuriști","accusative-definite-nominative-plural":"făuriștile","dative-genitive-indefinite-singular":"făuriști","dative-definite-genitive-singular":"făuriștii","dative-genitive-indefinite-plural":"făuriști","dative-definite-genitive-plural":"făuriștilor","singular-vocative":"făuriște","plural-vocative":"făuriștilor"}},{"word":"făurit","pos":"adj","definitions":["forged (fabricated by forging)"],"forms":{"feminine-singular":"făurită","masculine-plural":"făuriți","feminine-neuter-plural":"făurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"făurit","error-unrecognized-form-feminine-indefinite-singular":"făurită","error-unrecognized-form-indefinite-masculine-plural":"făuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"făurite","definite-error-unrecognized-form-masculine-neuter-singular":"făuritul","definite-error-unrecognized-form-feminine-singular":"făurita","definite-error-unrecognized-form-masculine-plural":"făuriții","definite-error-unrecognized-form-feminine-neuter-plural":"făuritele"}},{"word":"făurit","pos":"verb","definitions":["past participle of făuri"],"forms":{"participle-past":"of făuri"}},{"word":"făuriță","pos":"noun","definitions":["blacksmith's wife"],"forms":{"plural":"făurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făuriță","accusative-definite-nominative-singular":"făurița","accusative-indefinite-nominative-plural":"făurițe","accusative-definite-nominative-plural":"făurițele","dative-genitive-indefinite-singular":"făurițe","dative-definite-genitive-singular":"făuriței","dative-genitive-indefinite-plural":"făurițe","dative-definite-genitive-plural":"făurițelor","singular-vocative":"făuriță","plural-vocative":"făurițelor"}},{"word":"făuritoare","pos":"noun","definitions":["female equivalent of făuritor"],"forms":{"plural":"făuritoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"făuritoare","accusative-definite-nominative-singular":"făuritoarea","accusative-indefinite-nominative-plural":"făuritoare","accusative-definite-nominative-plural":"făuritoarele","dative-genitive-indefinite-singular":"făuritoare","dative-definite-genitive-singular":"făuritoarei","dative-genitive-indefinite-plural":"făuritoare","dative-definite-genitive-plural":"făuritoarelor","singular-vocative":"făuritoare","plural-vocative":"făuritoarelor"}},{"word":"făuritor","pos":"noun","definitions":["founder"],"forms":{"plural":"făuritori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"făuritor","accusative-definite-nominative-singular":"făuritorul","accusative-indefinite-nominative-plural":"făuritori","accusative-definite-nominative-plural":"făuritorii","dative-genitive-indefinite-singular":"făuritor","dative-definite-genitive-singular":"făuritorului","dative-genitive-indefinite-plural":"făuritori","dative-definite-genitive-plural":"făuritorilor","singular-vocative":"făuritorule","plural-vocative":"făuritorilor"}},{"word":"Făuroaia","pos":"name","definitions":["a village in Breznița-Motru, Mehedinți County, Romania"],"gender":"f"},{"word":"faurului","pos":"noun","definitions":["definite genitive/dative singular of faur"]},{"word":"făușel","pos":"noun","definitions":["egg (of a young hen)"],"forms":{"plural":"făușele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"făușel","accusative-definite-nominative-singular":"făușelul","accusative-indefinite-nominative-plural":"făușele","accusative-definite-nominative-plural":"făușelele","dative-genitive-indefinite-singular":"făușel","dative-definite-genitive-singular":"făușelului","dative-genitive-indefinite-plural":"făușele","dative-definite-genitive-plural":"făușelelor","singular-vocative":"făușelule","plural-vocative":"făușelelor"}},{"word":"favă","pos":"noun","definitions":["fava bean (Vicia faba)"],"forms":{"plural":"fave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"favă","accusative-definite-nominative-singular":"fava","accusative-indefinite-nominative-plural":"fave","accusative-definite-nominative-plural":"favele","dative-genitive-indefinite-singular":"fave","dative-definite-genitive-singular":"favei","dative-genitive-indefinite-plural":"fave","dative-definite-genitive-plural":"favelor","singular-vocative":"favă","plural-vocative":"favelor"}},{"word":"favelă","pos":"noun","definitions":["favela"],"forms":{"plural":"favele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"favelă","accusative-definite-nominative-singular":"favela","accusative-indefinite-nominative-plural":"favele","accusative-definite-nominative-plural":"favelele","dative-genitive-indefinite-singular":"favele","dative-definite-genitive-singular":"favelei","dative-genitive-indefinite-plural":"favele","dative-definite-genitive-plural":"favelelor","singular-vocative":"favelă","plural-vocative":"favelelor"}},{"word":"favism","pos":"noun","definitions":["favism"],"forms":{"plural":"favisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"favism","accusative-definite-nominative-singular":"favismul","accusative-indefinite-nominative-plural":"favisme","accusative-definite-nominative-plural":"favismele","dative-genitive-indefinite-singular":"favism","dative-definite-genitive-singular":"favismului","dative-genitive-indefinite-plural":"favisme","dative-definite-genitive-plural":"favismelor","singular-vocative":"favismule","plural-vocative":"favismelor"}},{"word":"favoare","pos":"noun","definitions":["favor"],"forms":{"plural":"favoruri"}},{"word":"favor","pos":"noun","definitions":["alternative form of favoare"],"forms":{"plural":"favoruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"favor","accusative-definite-nominative-singular":"favorul","accusative-indefinite-nominative-plural":"favoruri","accusative-definite-nominative-plural":"favorurile","dative-genitive-indefinite-singular":"favor","dative-definite-genitive-singular":"favorului","dative-genitive-indefinite-plural":"favoruri","dative-definite-genitive-plural":"favorurilor","singular-vocative":"favorule","plural-vocative":"favorurilor"}},{"word":"favorabil","pos":"adj","definitions":["favorable"],"forms":{"feminine-singular":"favorabilă","masculine-plural":"favorabili","feminine-neuter-plural":"favorabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"favorabil","error-unrecognized-form-feminine-indefinite-singular":"favorabilă","error-unrecognized-form-indefinite-masculine-plural":"favorabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"favorabile","definite-error-unrecognized-form-masculine-neuter-singular":"favorabilul","definite-error-unrecognized-form-feminine-singular":"favorabila","definite-error-unrecognized-form-masculine-plural":"favorabilii","definite-error-unrecognized-form-feminine-neuter-plural":"favorabilele"}},{"word":"favorit","pos":"adj","definitions":["favourite"],"forms":{"feminine-singular":"favorită","masculine-plural":"favoriți","feminine-neuter-plural":"favorite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"favorit","error-unrecognized-form-feminine-indefinite-singular":"favorită","error-unrecognized-form-indefinite-masculine-plural":"favoriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"favorite","definite-error-unrecognized-form-masculine-neuter-singular":"favoritul","definite-error-unrecognized-form-feminine-singular":"favorita","definite-error-unrecognized-form-masculine-plural":"favoriții","definite-error-unrecognized-form-feminine-neuter-plural":"favoritele"}},{"word":"favorită","pos":"noun","definitions":["female equivalent of favorit"],"forms":{"plural":"favorite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"favorită","accusative-definite-nominative-singular":"favorita","accusative-indefinite-nominative-plural":"favorite","accusative-definite-nominative-plural":"favoritele","dative-genitive-indefinite-singular":"favorite","dative-definite-genitive-singular":"favoritei","dative-genitive-indefinite-plural":"favorite","dative-definite-genitive-plural":"favoritelor","singular-vocative":"favorită","plural-vocative":"favoritelor"}},{"word":"favoritism","pos":"noun","definitions":["favoritism"],"forms":{"plural":"favoritisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"favoritism","accusative-definite-nominative-singular":"favoritismul","accusative-indefinite-nominative-plural":"favoritisme","accusative-definite-nominative-plural":"favoritismele","dative-genitive-indefinite-singular":"favoritism","dative-definite-genitive-singular":"favoritismului","dative-genitive-indefinite-plural":"favoritisme","dative-definite-genitive-plural":"favoritismelor","singular-vocative":"favoritismule","plural-vocative":"favoritismelor"}},{"word":"favoriza","pos":"verb","definitions":["to favor"],"forms":{"canonical":"a favoriza 1st conjugation","present-singular-third-person":"favorizează","participle-past":"favorizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a favoriza","gerund":"favorizând","first-person-indicative-present-singular":"favorizez","indicative-present-second-person-singular":"favorizezi","indicative-present-singular-third-person":"favorizează","first-person-indicative-plural-present":"favorizăm","indicative-plural-present-second-person":"favorizați","indicative-plural-present-third-person":"favorizează","first-person-imperfect-indicative-singular":"favorizam","imperfect-indicative-second-person-singular":"favorizai","imperfect-indicative-singular-third-person":"favoriza","first-person-imperfect-indicative-plural":"favorizam","imperfect-indicative-plural-second-person":"favorizați","imperfect-indicative-plural-third-person":"favorizau","first-person-indicative-perfect-singular":"favorizai","indicative-perfect-second-person-singular":"favorizași","indicative-perfect-singular-third-person":"favoriză","first-person-indicative-perfect-plural":"favorizarăm","indicative-perfect-plural-second-person":"favorizarăți","indicative-perfect-plural-third-person":"favorizară","first-person-indicative-pluperfect-singular":"favorizasem","indicative-pluperfect-second-person-singular":"favorizaseși","indicative-pluperfect-singular-third-person":"favorizase","first-person-indicative-pluperfect-plural":"favorizaserăm","indicative-pluperfect-plural-second-person":"favorizaserăți","indicative-pluperfect-plural-third-person":"favorizaseră","first-person-present-singular-subjunctive":"să favorizez","present-second-person-singular-subjunctive":"să favorizezi","present-singular-subjunctive-third-person":"să favorizeze","first-person-plural-present-subjunctive":"să favorizăm","plural-present-second-person-subjunctive":"să favorizați","plural-present-subjunctive-third-person":"să favorizeze","imperative-second-person-singular":"favorizează","imperative-plural-second-person":"favorizați","imperative-negative-second-person-singular":"nu favoriza","imperative-negative-plural-second-person":"nu favorizați"}},{"word":"favorizant","pos":"adj","definitions":["favoring"],"forms":{"feminine-singular":"favorizantă","masculine-plural":"favorizanți","feminine-neuter-plural":"favorizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"favorizant","error-unrecognized-form-feminine-indefinite-singular":"favorizantă","error-unrecognized-form-indefinite-masculine-plural":"favorizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"favorizante","definite-error-unrecognized-form-masculine-neuter-singular":"favorizantul","definite-error-unrecognized-form-feminine-singular":"favorizanta","definite-error-unrecognized-form-masculine-plural":"favorizanții","definite-error-unrecognized-form-feminine-neuter-plural":"favorizantele"}},{"word":"favorizare","pos":"noun","definitions":["favoring"],"forms":{"plural":"favorizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"favorizare","accusative-definite-nominative-singular":"favorizarea","accusative-indefinite-nominative-plural":"favorizări","accusative-definite-nominative-plural":"favorizările","dative-genitive-indefinite-singular":"favorizări","dative-definite-genitive-singular":"favorizării","dative-genitive-indefinite-plural":"favorizări","dative-definite-genitive-plural":"favorizărilor","singular-vocative":"favorizare","plural-vocative":"favorizărilor"}},{"word":"favorizat","pos":"adj","definitions":["favoured"],"forms":{"feminine-singular":"favorizată","masculine-plural":"favorizați","feminine-neuter-plural":"favorizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"favorizat","error-unrecognized-form-feminine-indefinite-singular":"favorizată","error-unrecognized-form-indefinite-masculine-plural":"favorizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"favorizate","definite-error-unrecognized-form-masculine-neuter-singular":"favorizatul","definite-error-unrecognized-form-feminine-singular":"favorizata","definite-error-unrecognized-form-masculine-plural":"favorizații","definite-error-unrecognized-form-feminine-neuter-plural":"favorizatele"}},{"word":"favorizat","pos":"verb","definitions":["past participle of favoriza"],"forms":{"participle-past":"of favoriza"}},{"word":"favoruri","pos":"noun","definitions":["plural of favoare"]},{"word":"favus","pos":"noun","definitions":["favus"],"forms":{"plural":"favusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"favus","accusative-definite-nominative-singular":"favusul","accusative-indefinite-nominative-plural":"favusuri","accusative-definite-nominative-plural":"favusurile","dative-genitive-indefinite-singular":"favus","dative-definite-genitive-singular":"favusului","dative-genitive-indefinite-plural":"favusuri","dative-definite-genitive-plural":"favusurilor","singular-vocative":"favusule","plural-vocative":"favusurilor"}},{"word":"fax","pos":"noun","definitions":["fax"],"forms":{"plural":"faxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fax","accusative-definite-nominative-singular":"faxul","accusative-indefinite-nominative-plural":"faxuri","accusative-definite-nominative-plural":"faxurile","dative-genitive-indefinite-singular":"fax","dative-definite-genitive-singular":"faxului","dative-genitive-indefinite-plural":"faxuri","dative-definite-genitive-plural":"faxurilor","singular-vocative":"faxule","plural-vocative":"faxurilor"}},{"word":"faxuri","pos":"noun","definitions":["plural of fax"]},{"word":"faza","pos":"noun","definitions":["definite nominative/accusative singular of fază"],"pronunciation":"/ˈfa.za/","gender":"f","forms":{"alternative":"фаза"}},{"word":"fază","pos":"noun","definitions":["phase"],"pronunciation":"/ˈfa.zə/","forms":{"plural":"faze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fază","accusative-definite-nominative-singular":"faza","accusative-indefinite-nominative-plural":"faze","accusative-definite-nominative-plural":"fazele","dative-genitive-indefinite-singular":"faze","dative-definite-genitive-singular":"fazei","dative-genitive-indefinite-plural":"faze","dative-definite-genitive-plural":"fazelor","singular-vocative":"fază","plural-vocative":"fazelor","alternative":"фазэ"}},{"word":"faza e că","pos":"phrase","definitions":["the thing is"],"pronunciation":"/ˈfa.za je ˈkə/"},{"word":"fază lichidă","pos":"noun","definitions":["liquid phase"],"forms":{"plural":"faze lichide"}},{"word":"fază lunară","pos":"noun","definitions":["lunar phase"],"forms":{"plural":"faze lunare"}},{"word":"fază solidă","pos":"noun","definitions":["solid phase"],"forms":{"plural":"faze solide"}},{"word":"fazan","pos":"noun","definitions":["pheasant (a bird of family Phasianidae, often hunted for food)","an idiot, sucker"],"pronunciation":"/faˈzan/","forms":{"plural":"fazani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fazan","accusative-definite-nominative-singular":"fazanul","accusative-indefinite-nominative-plural":"fazani","accusative-definite-nominative-plural":"fazanii","dative-genitive-indefinite-singular":"fazan","dative-definite-genitive-singular":"fazanului","dative-genitive-indefinite-plural":"fazani","dative-definite-genitive-plural":"fazanilor","singular-vocative":"fazanule","plural-vocative":"fazanilor"}},{"word":"fazanerie","pos":"noun","definitions":["pheasantry"],"forms":{"plural":"fazanerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fazanerie","accusative-definite-nominative-singular":"fazaneria","accusative-indefinite-nominative-plural":"fazanerii","accusative-definite-nominative-plural":"fazaneriile","dative-genitive-indefinite-singular":"fazanerii","dative-definite-genitive-singular":"fazaneriei","dative-genitive-indefinite-plural":"fazanerii","dative-definite-genitive-plural":"fazaneriilor","singular-vocative":"fazanerie","plural-vocative":"fazaneriilor"}},{"word":"fazani","pos":"noun","definitions":["plural of fazan"],"gender":"m"},{"word":"fazanier","pos":"noun","definitions":["pheasant farmer"],"forms":{"plural":"fazanieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fazanier","accusative-definite-nominative-singular":"fazanierul","accusative-indefinite-nominative-plural":"fazanieri","accusative-definite-nominative-plural":"fazanierii","dative-genitive-indefinite-singular":"fazanier","dative-definite-genitive-singular":"fazanierului","dative-genitive-indefinite-plural":"fazanieri","dative-definite-genitive-plural":"fazanierilor","singular-vocative":"fazanierule","plural-vocative":"fazanierilor"}},{"word":"făzăniță","pos":"noun","definitions":["pheasant hen"],"forms":{"plural":"făzănițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"făzăniță","accusative-definite-nominative-singular":"făzănița","accusative-indefinite-nominative-plural":"făzănițe","accusative-definite-nominative-plural":"făzănițele","dative-genitive-indefinite-singular":"făzănițe","dative-definite-genitive-singular":"făzăniței","dative-genitive-indefinite-plural":"făzănițe","dative-definite-genitive-plural":"făzănițelor","singular-vocative":"făzăniță","plural-vocative":"făzănițelor"}},{"word":"faze","pos":"noun","definitions":["inflection of fază:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfaze]","gender":"f"},{"word":"fazei","pos":"noun","definitions":["definite genitive/dative singular of fază"],"pronunciation":"[ˈfazej]","gender":"f"},{"word":"fazitron","pos":"noun","definitions":["phasitron"],"forms":{"plural":"fazitroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fazitron","accusative-definite-nominative-singular":"fazitronul","accusative-indefinite-nominative-plural":"fazitroane","accusative-definite-nominative-plural":"fazitroanele","dative-genitive-indefinite-singular":"fazitron","dative-definite-genitive-singular":"fazitronului","dative-genitive-indefinite-plural":"fazitroane","dative-definite-genitive-plural":"fazitroanelor","singular-vocative":"fazitronule","plural-vocative":"fazitroanelor"}},{"word":"fazmetru","pos":"noun","definitions":["phase meter"],"forms":{"plural":"fazmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fazmetru","accusative-definite-nominative-singular":"fazmetrul","accusative-indefinite-nominative-plural":"fazmetre","accusative-definite-nominative-plural":"fazmetrele","dative-genitive-indefinite-singular":"fazmetru","dative-definite-genitive-singular":"fazmetrului","dative-genitive-indefinite-plural":"fazmetre","dative-definite-genitive-plural":"fazmetrelor","singular-vocative":"fazmetrule","plural-vocative":"fazmetrelor"}},{"word":"fc","pos":"verb","definitions":["alternative form of fct (“done”)"],"forms":{"participle-past":"of făcut"}},{"word":"FCSB","pos":"name","definitions":["initialism of Fotbal Club Steaua București"],"gender":"?"},{"word":"fct","pos":"verb","definitions":["abbreviation of făcut (“done”)"],"forms":{"participle-past":"of făcut","alternative":"fc"}},{"word":"fe","pos":"intj","definitions":["obsolete form of fă"]},{"word":"feblețe","pos":"noun","definitions":["weakness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"feblețe","accusative-definite-nominative":"feblețea","dative-genitive-indefinite":"febleți","dative-definite-genitive":"febleții","vocative":"feblețe"}},{"word":"febra","pos":"noun","definitions":["definite nominative/accusative singular of febră"],"pronunciation":"[ˈfebra]","gender":"f"},{"word":"febră","pos":"noun","definitions":["fever"],"pronunciation":"/ˈfe.brə/","forms":{"plural":"febre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"febră","accusative-definite-nominative-singular":"febra","accusative-indefinite-nominative-plural":"febre","accusative-definite-nominative-plural":"febrele","dative-genitive-indefinite-singular":"febre","dative-definite-genitive-singular":"febrei","dative-genitive-indefinite-plural":"febre","dative-definite-genitive-plural":"febrelor","singular-vocative":"febră","plural-vocative":"febrelor","alternative":"фебрэ"}},{"word":"febră aftoasă","pos":"noun","definitions":["foot-and-mouth disease"]},{"word":"febră musculară","pos":"noun","definitions":["muscle soreness"],"forms":{"plural":"febre musculare"}},{"word":"febră puerperală","pos":"noun","definitions":["puerperal fever"]},{"word":"febră recurentă","pos":"noun","definitions":["relapsing fever"],"forms":{"plural":"febre recurente"}},{"word":"febră tifoidă","pos":"noun","definitions":["typhoid fever"]},{"word":"febre","pos":"noun","definitions":["inflection of febră:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfebre]","gender":"f"},{"word":"febricitate","pos":"noun","definitions":["feverishness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"febricitate","accusative-definite-nominative":"febricitatea","dative-genitive-indefinite":"febricități","dative-definite-genitive":"febricității","vocative":"febricitate"}},{"word":"febrifug","pos":"noun","definitions":["febrifuge"],"forms":{"plural":"febrifugi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"febrifug","accusative-definite-nominative-singular":"febrifugul","accusative-indefinite-nominative-plural":"febrifugi","accusative-definite-nominative-plural":"febrifugile","dative-genitive-indefinite-singular":"febrifug","dative-definite-genitive-singular":"febrifugului","dative-genitive-indefinite-plural":"febrifugi","dative-definite-genitive-plural":"febrifugilor","singular-vocative":"febrifugule","plural-vocative":"febrifugilor"}},{"word":"febril","pos":"adj","definitions":["febrile"],"forms":{"feminine-singular":"febrilă","masculine-plural":"febrili","feminine-neuter-plural":"febrile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"febril","error-unrecognized-form-feminine-indefinite-singular":"febrilă","error-unrecognized-form-indefinite-masculine-plural":"febrili","error-unrecognized-form-feminine-indefinite-neuter-plural":"febrile","definite-error-unrecognized-form-masculine-neuter-singular":"febrilul","definite-error-unrecognized-form-feminine-singular":"febrila","definite-error-unrecognized-form-masculine-plural":"febrilii","definite-error-unrecognized-form-feminine-neuter-plural":"febrilele"}},{"word":"febrilitate","pos":"noun","definitions":["feverishness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"febrilitate","accusative-definite-nominative-singular":"febrilitatea","accusative-indefinite-nominative-plural":"febrilități","accusative-definite-nominative-plural":"febrilitățile","dative-genitive-indefinite-singular":"febrilități","dative-definite-genitive-singular":"febrilității","dative-genitive-indefinite-plural":"febrilități","dative-definite-genitive-plural":"febrilităților","singular-vocative":"febrilitate","plural-vocative":"febrilităților"}},{"word":"februar","pos":"noun","definitions":["alternative form of februarie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"februar","accusative-definite-nominative":"februarul","dative-genitive-indefinite":"februar","dative-definite-genitive":"februarului","vocative":"februarule"}},{"word":"februarie","pos":"noun","definitions":["February"],"pronunciation":"/feˈbrwa.rje/","forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"februarie","accusative-definite-nominative":"februariele","dative-genitive-indefinite":"februarie","dative-definite-genitive":"februarie","vocative":"-","alternative-archaic":"fevruarie","alternative-dated-poetic":"februar"}},{"word":"fecal","pos":"adj","definitions":["fecal"],"forms":{"feminine-singular":"fecală","masculine-plural":"fecali","feminine-neuter-plural":"fecale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecal","error-unrecognized-form-feminine-indefinite-singular":"fecală","error-unrecognized-form-indefinite-masculine-plural":"fecali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecale","definite-error-unrecognized-form-masculine-neuter-singular":"fecalul","definite-error-unrecognized-form-feminine-singular":"fecala","definite-error-unrecognized-form-masculine-plural":"fecalii","definite-error-unrecognized-form-feminine-neuter-plural":"fecalele"}},{"word":"fecală","pos":"noun","definitions":["feces"],"forms":{"plural":"fecale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fecală","accusative-definite-nominative-singular":"fecala","accusative-indefinite-nominative-plural":"fecale","accusative-definite-nominative-plural":"fecalele","dative-genitive-indefinite-singular":"fecale","dative-definite-genitive-singular":"fecalei","dative-genitive-indefinite-plural":"fecale","dative-definite-genitive-plural":"fecalelor","singular-vocative":"fecală","plural-vocative":"fecalelor"}},{"word":"fecaloid","pos":"adj","definitions":["fecaloid"],"forms":{"feminine-singular":"fecaloidă","masculine-plural":"fecaloizi","feminine-neuter-plural":"fecaloide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecaloid","error-unrecognized-form-feminine-indefinite-singular":"fecaloidă","error-unrecognized-form-indefinite-masculine-plural":"fecaloizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecaloide","definite-error-unrecognized-form-masculine-neuter-singular":"fecaloidul","definite-error-unrecognized-form-feminine-singular":"fecaloida","definite-error-unrecognized-form-masculine-plural":"fecaloizii","definite-error-unrecognized-form-feminine-neuter-plural":"fecaloidele"}},{"word":"fecaloid","pos":"noun","definitions":["fecaloid"],"forms":{"plural":"fecaloizi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fecaloid","accusative-definite-nominative-singular":"fecaloidul","accusative-indefinite-nominative-plural":"fecaloizi","accusative-definite-nominative-plural":"fecaloizile","dative-genitive-indefinite-singular":"fecaloid","dative-definite-genitive-singular":"fecaloidului","dative-genitive-indefinite-plural":"fecaloizi","dative-definite-genitive-plural":"fecaloizilor","singular-vocative":"fecaloidule","plural-vocative":"fecaloizilor"}},{"word":"fecalom","pos":"noun","definitions":["fecaloma"],"forms":{"plural":"fecaloame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fecalom","accusative-definite-nominative-singular":"fecalomul","accusative-indefinite-nominative-plural":"fecaloame","accusative-definite-nominative-plural":"fecaloamele","dative-genitive-indefinite-singular":"fecalom","dative-definite-genitive-singular":"fecalomului","dative-genitive-indefinite-plural":"fecaloame","dative-definite-genitive-plural":"fecaloamelor","singular-vocative":"fecalomule","plural-vocative":"fecaloamelor"}},{"word":"Fechetău","pos":"name","definitions":["a village in Cluj County, Romania. Renamed to Negreni."],"gender":"m"},{"word":"Fechete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fechete"}},{"word":"Fecioară","pos":"name","definitions":["the constellation Virgo"]},{"word":"fecioară","pos":"noun","definitions":["virgin, maiden"],"pronunciation":"/feˈt͡ʃjo̯a.rə/","forms":{"plural":"fecioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fecioară","accusative-definite-nominative-singular":"fecioara","accusative-indefinite-nominative-plural":"fecioare","accusative-definite-nominative-plural":"fecioarele","dative-genitive-indefinite-singular":"fecioare","dative-definite-genitive-singular":"fecioarei","dative-genitive-indefinite-plural":"fecioare","dative-definite-genitive-plural":"fecioarelor","singular-vocative":"fecioară","plural-vocative":"fecioarelor","alternative-obsolete":"fecióră"}},{"word":"fecioară","pos":"adj","definitions":["virgin"],"pronunciation":"/feˈt͡ʃjo̯a.rə/","forms":{"plural":"fecioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"fecioară","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecioare","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"fecioara","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"fecioarele","alternative-obsolete":"fecióră"}},{"word":"Fecioara Maria","pos":"name","definitions":["the Virgin Mary"],"gender":"f"},{"word":"fecioarică","pos":"noun","definitions":["diminutive of fecioară; small daughter"],"forms":{"plural":"feciorele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feciorică","accusative-definite-nominative-singular":"feciorica","accusative-indefinite-nominative-plural":"feciorice","accusative-definite-nominative-plural":"fecioricele","dative-genitive-indefinite-singular":"feciorice","dative-definite-genitive-singular":"fecioricei","dative-genitive-indefinite-plural":"feciorice","dative-definite-genitive-plural":"fecioricelor","singular-vocative":"feciorică","plural-vocative":"fecioricelor"}},{"word":"fecior","pos":"noun","definitions":["youth, boy, child, unmarried young man"],"forms":{"plural":"feciori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fecior","accusative-definite-nominative-singular":"feciorul","accusative-indefinite-nominative-plural":"feciori","accusative-definite-nominative-plural":"feciorii","dative-genitive-indefinite-singular":"fecior","dative-definite-genitive-singular":"feciorului","dative-genitive-indefinite-plural":"feciori","dative-definite-genitive-plural":"feciorilor","singular-vocative":"feciorule","plural-vocative":"feciorilor","alternative":"ficior"}},{"word":"fecior tomnatic","pos":"noun","definitions":["old bachelor"],"forms":{"plural":"feciori tomnatici"}},{"word":"feciorandru","pos":"noun","definitions":["youth, boy"],"forms":{"plural":"feciorandri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feciorandru","accusative-definite-nominative-singular":"feciorandruul","accusative-indefinite-nominative-plural":"feciorandri","accusative-definite-nominative-plural":"feciorandrii","dative-genitive-indefinite-singular":"feciorandru","dative-definite-genitive-singular":"feciorandruului","dative-genitive-indefinite-plural":"feciorandri","dative-definite-genitive-plural":"feciorandrilor","singular-vocative":"feciorandruule","plural-vocative":"feciorandrilor"}},{"word":"fecioraș","pos":"noun","definitions":["diminutive of fecior; small son"],"forms":{"plural":"feciorași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fecioraș","accusative-definite-nominative-singular":"feciorașul","accusative-indefinite-nominative-plural":"feciorași","accusative-definite-nominative-plural":"feciorașii","dative-genitive-indefinite-singular":"fecioraș","dative-definite-genitive-singular":"feciorașului","dative-genitive-indefinite-plural":"feciorași","dative-definite-genitive-plural":"feciorașilor","singular-vocative":"feciorașule","plural-vocative":"feciorașilor"}},{"word":"feciorea","pos":"noun","definitions":["diminutive of fecior"],"forms":{"plural":"feciorele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"feciorea","accusative-definite-nominative-singular":"fecioreaua","accusative-indefinite-nominative-plural":"feciorele","accusative-definite-nominative-plural":"feciorelele","dative-genitive-indefinite-singular":"feciorele","dative-definite-genitive-singular":"feciorelei","dative-genitive-indefinite-plural":"feciorele","dative-definite-genitive-plural":"feciorelelor","singular-vocative":"feciorea","plural-vocative":"feciorelelor"}},{"word":"feciorel","pos":"noun","definitions":["diminutive of fecior"],"forms":{"plural":"feciorei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feciorel","accusative-definite-nominative-singular":"feciorelul","accusative-indefinite-nominative-plural":"feciorei","accusative-definite-nominative-plural":"fecioreii","dative-genitive-indefinite-singular":"feciorel","dative-definite-genitive-singular":"feciorelului","dative-genitive-indefinite-plural":"feciorei","dative-definite-genitive-plural":"fecioreilor","singular-vocative":"feciorelule","plural-vocative":"fecioreilor"}},{"word":"feciorelnic","pos":"adj","definitions":["virginal"],"forms":{"feminine-singular":"feciorelnică","masculine-plural":"feciorelnici","feminine-neuter-plural":"feciorelnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feciorelnic","error-unrecognized-form-feminine-indefinite-singular":"feciorelnică","error-unrecognized-form-indefinite-masculine-plural":"feciorelnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feciorelnice","definite-error-unrecognized-form-masculine-neuter-singular":"feciorelnicul","definite-error-unrecognized-form-feminine-singular":"feciorelnica","definite-error-unrecognized-form-masculine-plural":"feciorelnicii","definite-error-unrecognized-form-feminine-neuter-plural":"feciorelnicele"}},{"word":"feciorenie","pos":"noun","definitions":["virginity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"feciorenie","accusative-definite-nominative":"feciorenia","dative-genitive-indefinite":"feciorenii","dative-definite-genitive":"fecioreniei","vocative":"feciorenie"}},{"word":"fecioresc","pos":"adj","definitions":["boyish"],"forms":{"feminine-singular":"feciorească","plural":"feciorești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecioresc","error-unrecognized-form-feminine-indefinite-singular":"feciorească","error-unrecognized-form-indefinite-masculine-plural":"feciorești","error-unrecognized-form-feminine-indefinite-neuter-plural":"feciorești","definite-error-unrecognized-form-masculine-neuter-singular":"feciorescul","definite-error-unrecognized-form-feminine-singular":"fecioreasca","definite-error-unrecognized-form-masculine-plural":"fecioreștii","definite-error-unrecognized-form-feminine-neuter-plural":"fecioreștile"}},{"word":"feciorește","pos":"adv","definitions":["maidenlike"]},{"word":"feciori","pos":"verb","definitions":["to grow up"],"forms":{"canonical":"a feciori 4th conjugation","present-singular-third-person":"feciorește","participle-past":"feciorit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a feciori","gerund":"feciorind","first-person-indicative-present-singular":"fecioresc","indicative-present-second-person-singular":"feciorești","indicative-present-singular-third-person":"feciorește","first-person-indicative-plural-present":"feciorim","indicative-plural-present-second-person":"fecioriți","indicative-plural-present-third-person":"fecioresc","first-person-imperfect-indicative-singular":"fecioream","imperfect-indicative-second-person-singular":"fecioreai","imperfect-indicative-singular-third-person":"feciorea","first-person-imperfect-indicative-plural":"fecioream","imperfect-indicative-plural-second-person":"fecioreați","imperfect-indicative-plural-third-person":"fecioreau","first-person-indicative-perfect-singular":"feciorii","indicative-perfect-second-person-singular":"fecioriși","indicative-perfect-singular-third-person":"feciori","first-person-indicative-perfect-plural":"feciorirăm","indicative-perfect-plural-second-person":"feciorirăți","indicative-perfect-plural-third-person":"fecioriră","first-person-indicative-pluperfect-singular":"feciorisem","indicative-pluperfect-second-person-singular":"fecioriseși","indicative-pluperfect-singular-third-person":"feciorise","first-person-indicative-pluperfect-plural":"fecioriserăm","indicative-pluperfect-plural-second-person":"fecioriserăți","indicative-pluperfect-plural-third-person":"fecioriseră","first-person-present-singular-subjunctive":"să fecioresc","present-second-person-singular-subjunctive":"să feciorești","present-singular-subjunctive-third-person":"să feciorească","first-person-plural-present-subjunctive":"să feciorim","plural-present-second-person-subjunctive":"să fecioriți","plural-present-subjunctive-third-person":"să feciorească","imperative-second-person-singular":"feciorește","imperative-plural-second-person":"fecioriți","imperative-negative-second-person-singular":"nu feciori","imperative-negative-plural-second-person":"nu fecioriți"}},{"word":"feciorică","pos":"noun","definitions":["smooth rupturewort (Herniaria glabra)"],"forms":{"plural":"feciorele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feciorică","accusative-definite-nominative-singular":"feciorica","accusative-indefinite-nominative-plural":"feciorele","accusative-definite-nominative-plural":"feciorelele","dative-genitive-indefinite-singular":"feciorele","dative-definite-genitive-singular":"feciorelei","dative-genitive-indefinite-plural":"feciorele","dative-definite-genitive-plural":"feciorelelor","singular-vocative":"feciorică","plural-vocative":"feciorelelor"}},{"word":"feciorie","pos":"noun","definitions":["virginity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"feciorie","accusative-definite-nominative":"fecioria","dative-genitive-indefinite":"feciorii","dative-definite-genitive":"fecioriei","vocative":"feciorie"}},{"word":"fecioriță","pos":"noun","definitions":["diminutive of fecioară"],"forms":{"plural":"feciorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fecioriță","accusative-definite-nominative-singular":"feciorița","accusative-indefinite-nominative-plural":"feciorițe","accusative-definite-nominative-plural":"feciorițele","dative-genitive-indefinite-singular":"feciorițe","dative-definite-genitive-singular":"fecioriței","dative-genitive-indefinite-plural":"feciorițe","dative-definite-genitive-plural":"feciorițelor","singular-vocative":"fecioriță","plural-vocative":"feciorițelor"}},{"word":"Fecioru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fecioru"}},{"word":"feculă","pos":"noun","definitions":["fecula"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"feculă","accusative-definite-nominative":"fecula","dative-genitive-indefinite":"fecule","dative-definite-genitive":"feculei","vocative":"feculă"}},{"word":"feculent","pos":"adj","definitions":["starchy"],"forms":{"feminine-singular":"feculentă","masculine-plural":"feculenți","feminine-neuter-plural":"feculente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feculent","error-unrecognized-form-feminine-indefinite-singular":"feculentă","error-unrecognized-form-indefinite-masculine-plural":"feculenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"feculente","definite-error-unrecognized-form-masculine-neuter-singular":"feculentul","definite-error-unrecognized-form-feminine-singular":"feculenta","definite-error-unrecognized-form-masculine-plural":"feculenții","definite-error-unrecognized-form-feminine-neuter-plural":"feculentele"}},{"word":"feculență","pos":"noun","definitions":["feculence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"feculență","accusative-definite-nominative":"feculența","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"feculență"}},{"word":"feculerie","pos":"noun","definitions":["starch factory"],"forms":{"plural":"feculerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"feculerie","accusative-definite-nominative-singular":"feculeria","accusative-indefinite-nominative-plural":"feculerii","accusative-definite-nominative-plural":"feculeriile","dative-genitive-indefinite-singular":"feculerii","dative-definite-genitive-singular":"feculeriei","dative-genitive-indefinite-plural":"feculerii","dative-definite-genitive-plural":"feculeriilor","singular-vocative":"feculerie","plural-vocative":"feculeriilor"}},{"word":"fecund","pos":"adj","definitions":["fruitful"],"forms":{"feminine-singular":"fecundă","masculine-plural":"fecunzi","feminine-neuter-plural":"fecunde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecund","error-unrecognized-form-feminine-indefinite-singular":"fecundă","error-unrecognized-form-indefinite-masculine-plural":"fecunzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecunde","definite-error-unrecognized-form-masculine-neuter-singular":"fecundul","definite-error-unrecognized-form-feminine-singular":"fecunda","definite-error-unrecognized-form-masculine-plural":"fecunzii","definite-error-unrecognized-form-feminine-neuter-plural":"fecundele"}},{"word":"fecunda","pos":"verb","definitions":["to fecundate, to fertilize"],"pronunciation":"/fe.kunˈda/","forms":{"canonical":"a fecunda 1st conjugation","present-singular-third-person":"fecundează","participle-past":"fecundat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fecunda","gerund":"fecundând","first-person-indicative-present-singular":"fecundez","indicative-present-second-person-singular":"fecundezi","indicative-present-singular-third-person":"fecundează","first-person-indicative-plural-present":"fecundăm","indicative-plural-present-second-person":"fecundați","indicative-plural-present-third-person":"fecundează","first-person-imperfect-indicative-singular":"fecundam","imperfect-indicative-second-person-singular":"fecundai","imperfect-indicative-singular-third-person":"fecunda","first-person-imperfect-indicative-plural":"fecundam","imperfect-indicative-plural-second-person":"fecundați","imperfect-indicative-plural-third-person":"fecundau","first-person-indicative-perfect-singular":"fecundai","indicative-perfect-second-person-singular":"fecundași","indicative-perfect-singular-third-person":"fecundă","first-person-indicative-perfect-plural":"fecundarăm","indicative-perfect-plural-second-person":"fecundarăți","indicative-perfect-plural-third-person":"fecundară","first-person-indicative-pluperfect-singular":"fecundasem","indicative-pluperfect-second-person-singular":"fecundaseși","indicative-pluperfect-singular-third-person":"fecundase","first-person-indicative-pluperfect-plural":"fecundaserăm","indicative-pluperfect-plural-second-person":"fecundaserăți","indicative-pluperfect-plural-third-person":"fecundaseră","first-person-present-singular-subjunctive":"să fecundez","present-second-person-singular-subjunctive":"să fecundezi","present-singular-subjunctive-third-person":"să fecundeze","first-person-plural-present-subjunctive":"să fecundăm","plural-present-second-person-subjunctive":"să fecundați","plural-present-subjunctive-third-person":"să fecundeze","imperative-second-person-singular":"fecundează","imperative-plural-second-person":"fecundați","imperative-negative-second-person-singular":"nu fecunda","imperative-negative-plural-second-person":"nu fecundați"}},{"word":"fecundabil","pos":"adj","definitions":["fecundable, fertilizable"],"forms":{"feminine-singular":"fecundabilă","masculine-plural":"fecundabili","feminine-neuter-plural":"fecundabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecundabil","error-unrecognized-form-feminine-indefinite-singular":"fecundabilă","error-unrecognized-form-indefinite-masculine-plural":"fecundabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecundabile","definite-error-unrecognized-form-masculine-neuter-singular":"fecundabilul","definite-error-unrecognized-form-feminine-singular":"fecundabila","definite-error-unrecognized-form-masculine-plural":"fecundabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fecundabilele"}},{"word":"fecundare","pos":"noun","definitions":["fertilization, fecundation"],"forms":{"plural":"fecundări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fecundare","accusative-definite-nominative-singular":"fecundarea","accusative-indefinite-nominative-plural":"fecundări","accusative-definite-nominative-plural":"fecundările","dative-genitive-indefinite-singular":"fecundări","dative-definite-genitive-singular":"fecundării","dative-genitive-indefinite-plural":"fecundări","dative-definite-genitive-plural":"fecundărilor","singular-vocative":"fecundare","plural-vocative":"fecundărilor"}},{"word":"fecundat","pos":"adj","definitions":["fertilized"],"forms":{"feminine-singular":"fecundată","masculine-plural":"fecundați","feminine-neuter-plural":"fecundate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fecundat","error-unrecognized-form-feminine-indefinite-singular":"fecundată","error-unrecognized-form-indefinite-masculine-plural":"fecundați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fecundate","definite-error-unrecognized-form-masculine-neuter-singular":"fecundatul","definite-error-unrecognized-form-feminine-singular":"fecundata","definite-error-unrecognized-form-masculine-plural":"fecundații","definite-error-unrecognized-form-feminine-neuter-plural":"fecundatele"}},{"word":"fecundație","pos":"noun","definitions":["fecundation"],"forms":{"plural":"fecundații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fecundație","accusative-definite-nominative-singular":"fecundația","accusative-indefinite-nominative-plural":"fecundații","accusative-definite-nominative-plural":"fecundațiile","dative-genitive-indefinite-singular":"fecundații","dative-definite-genitive-singular":"fecundației","dative-genitive-indefinite-plural":"fecundații","dative-definite-genitive-plural":"fecundațiilor","singular-vocative":"fecundație","plural-vocative":"fecundațiilor"}},{"word":"fecundațiune","pos":"noun","definitions":["obsolete form of fecundație"],"forms":{"plural":"fecundațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fecundațiune","accusative-definite-nominative-singular":"fecundațiunea","accusative-indefinite-nominative-plural":"fecundațiuni","accusative-definite-nominative-plural":"fecundațiunile","dative-genitive-indefinite-singular":"fecundațiuni","dative-definite-genitive-singular":"fecundațiunii","dative-genitive-indefinite-plural":"fecundațiuni","dative-definite-genitive-plural":"fecundațiunilor","singular-vocative":"fecundațiune","plural-vocative":"fecundațiunilor"}},{"word":"fecunditate","pos":"noun","definitions":["fecundity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fecunditate","accusative-definite-nominative":"fecunditatea","dative-genitive-indefinite":"fecundități","dative-definite-genitive":"fecundității","vocative":"fecunditate"}},{"word":"Fedeleș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fedeleș"}},{"word":"fedeleș","pos":"noun","definitions":["small lidded water cask that was used by peasants to carry water when working on the field."],"forms":{"plural":"fedeleșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fedeleș","accusative-definite-nominative-singular":"fedeleșul","accusative-indefinite-nominative-plural":"fedeleșuri","accusative-definite-nominative-plural":"fedeleșurile","dative-genitive-indefinite-singular":"fedeleș","dative-definite-genitive-singular":"fedeleșului","dative-genitive-indefinite-plural":"fedeleșuri","dative-definite-genitive-plural":"fedeleșurilor","singular-vocative":"fedeleșule","plural-vocative":"fedeleșurilor"}},{"word":"Fedeleșeni","pos":"name","definitions":["a village in Strunga, Iași County, Romania"],"gender":"m"},{"word":"Fedeleșoiu","pos":"name","definitions":["a village in Ciomăgești, Argeș County, Romania","a village in Dăești, Vâlcea County, Romania"],"gender":"m"},{"word":"Fedeleșul","pos":"name","definitions":["a river in Iași, Romania, tributary to the Șorogari"],"gender":"m"},{"word":"federa","pos":"verb","definitions":["to federate"],"pronunciation":"/fe.deˈra/","forms":{"canonical":"a federa 1st conjugation","present-singular-third-person":"federează","participle-past":"federat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a federa","gerund":"federând","first-person-indicative-present-singular":"federez","indicative-present-second-person-singular":"federezi","indicative-present-singular-third-person":"federează","first-person-indicative-plural-present":"federăm","indicative-plural-present-second-person":"federați","indicative-plural-present-third-person":"federează","first-person-imperfect-indicative-singular":"federam","imperfect-indicative-second-person-singular":"federai","imperfect-indicative-singular-third-person":"federa","first-person-imperfect-indicative-plural":"federam","imperfect-indicative-plural-second-person":"federați","imperfect-indicative-plural-third-person":"federau","first-person-indicative-perfect-singular":"federai","indicative-perfect-second-person-singular":"federași","indicative-perfect-singular-third-person":"federă","first-person-indicative-perfect-plural":"federarăm","indicative-perfect-plural-second-person":"federarăți","indicative-perfect-plural-third-person":"federară","first-person-indicative-pluperfect-singular":"federasem","indicative-pluperfect-second-person-singular":"federaseși","indicative-pluperfect-singular-third-person":"federase","first-person-indicative-pluperfect-plural":"federaserăm","indicative-pluperfect-plural-second-person":"federaserăți","indicative-pluperfect-plural-third-person":"federaseră","first-person-present-singular-subjunctive":"să federez","present-second-person-singular-subjunctive":"să federezi","present-singular-subjunctive-third-person":"să federeze","first-person-plural-present-subjunctive":"să federăm","plural-present-second-person-subjunctive":"să federați","plural-present-subjunctive-third-person":"să federeze","imperative-second-person-singular":"federează","imperative-plural-second-person":"federați","imperative-negative-second-person-singular":"nu federa","imperative-negative-plural-second-person":"nu federați"}},{"word":"federal","pos":"adj","definitions":["federal"],"pronunciation":"/fe.deˈral/","forms":{"feminine-singular":"federală","masculine-plural":"federali","feminine-neuter-plural":"federale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"federal","error-unrecognized-form-feminine-indefinite-singular":"federală","error-unrecognized-form-indefinite-masculine-plural":"federali","error-unrecognized-form-feminine-indefinite-neuter-plural":"federale","definite-error-unrecognized-form-masculine-neuter-singular":"federalul","definite-error-unrecognized-form-feminine-singular":"federala","definite-error-unrecognized-form-masculine-plural":"federalii","definite-error-unrecognized-form-feminine-neuter-plural":"federalele"}},{"word":"federală","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of federal"]},{"word":"federalism","pos":"noun","definitions":["federalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"federalism","accusative-definite-nominative":"federalismul","dative-genitive-indefinite":"federalism","dative-definite-genitive":"federalismului","vocative":"federalismule"}},{"word":"federalist","pos":"noun","definitions":["federalist"],"forms":{"plural":"federaliști","feminine":"equivalent federalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"federalist","accusative-definite-nominative-singular":"federalistul","accusative-indefinite-nominative-plural":"federaliști","accusative-definite-nominative-plural":"federaliștii","dative-genitive-indefinite-singular":"federalist","dative-definite-genitive-singular":"federalistului","dative-genitive-indefinite-plural":"federaliști","dative-definite-genitive-plural":"federaliștilor","singular-vocative":"federalistule","plural-vocative":"federaliștilor"}},{"word":"federalistă","pos":"noun","definitions":["female equivalent of federalist"],"forms":{"plural":"federaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"federalistă","accusative-definite-nominative-singular":"federalista","accusative-indefinite-nominative-plural":"federaliste","accusative-definite-nominative-plural":"federalistele","dative-genitive-indefinite-singular":"federaliste","dative-definite-genitive-singular":"federalistei","dative-genitive-indefinite-plural":"federaliste","dative-definite-genitive-plural":"federalistelor","singular-vocative":"federalistă","plural-vocative":"federalistelor"}},{"word":"federaliza","pos":"verb","definitions":["to federalize"],"forms":{"canonical":"a federaliza 1st conjugation","present-singular-third-person":"federalizează","participle-past":"federalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a federaliza","gerund":"federalizând","first-person-indicative-present-singular":"federaliz","indicative-present-second-person-singular":"federalizi","indicative-present-singular-third-person":"federaliză","first-person-indicative-plural-present":"federalizăm","indicative-plural-present-second-person":"federalizați","indicative-plural-present-third-person":"federaliză","first-person-imperfect-indicative-singular":"federalizam","imperfect-indicative-second-person-singular":"federalizai","imperfect-indicative-singular-third-person":"federaliza","first-person-imperfect-indicative-plural":"federalizam","imperfect-indicative-plural-second-person":"federalizați","imperfect-indicative-plural-third-person":"federalizau","first-person-indicative-perfect-singular":"federalizai","indicative-perfect-second-person-singular":"federalizași","indicative-perfect-singular-third-person":"federaliză","first-person-indicative-perfect-plural":"federalizarăm","indicative-perfect-plural-second-person":"federalizarăți","indicative-perfect-plural-third-person":"federalizară","first-person-indicative-pluperfect-singular":"federalizasem","indicative-pluperfect-second-person-singular":"federalizaseși","indicative-pluperfect-singular-third-person":"federalizase","first-person-indicative-pluperfect-plural":"federalizaserăm","indicative-pluperfect-plural-second-person":"federalizaserăți","indicative-pluperfect-plural-third-person":"federalizaseră","first-person-present-singular-subjunctive":"să federaliz","present-second-person-singular-subjunctive":"să federalizi","present-singular-subjunctive-third-person":"să federalize","first-person-plural-present-subjunctive":"să federalizăm","plural-present-second-person-subjunctive":"să federalizați","plural-present-subjunctive-third-person":"să federalize","imperative-second-person-singular":"federaliză","imperative-plural-second-person":"federalizați","imperative-negative-second-person-singular":"nu federaliza","imperative-negative-plural-second-person":"nu federalizați"}},{"word":"federalizare","pos":"noun","definitions":["federalization"],"forms":{"plural":"federalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"federalizare","accusative-definite-nominative-singular":"federalizarea","accusative-indefinite-nominative-plural":"federalizări","accusative-definite-nominative-plural":"federalizările","dative-genitive-indefinite-singular":"federalizări","dative-definite-genitive-singular":"federalizării","dative-genitive-indefinite-plural":"federalizări","dative-definite-genitive-plural":"federalizărilor","singular-vocative":"federalizare","plural-vocative":"federalizărilor"}},{"word":"federat","pos":"noun","definitions":["foederatus"],"forms":{"plural":"federați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"federat","accusative-definite-nominative-singular":"federatul","accusative-indefinite-nominative-plural":"federați","accusative-definite-nominative-plural":"federații","dative-genitive-indefinite-singular":"federat","dative-definite-genitive-singular":"federatului","dative-genitive-indefinite-plural":"federați","dative-definite-genitive-plural":"federaților","singular-vocative":"federatule","plural-vocative":"federaților"}},{"word":"federația","pos":"noun","definitions":["definite nominative/accusative singular of federație"],"gender":"f","forms":{"alternative":"федерация"}},{"word":"Federația Rusă","pos":"name","definitions":["Russian Federation (official name of Russia: a transcontinental country in Eastern Europe and North Asia)"],"gender":"f","forms":{"alternative":"Федерация Русэ"}},{"word":"federație","pos":"noun","definitions":["federation"],"pronunciation":"/fedeˈrat͡si.e/","forms":{"plural":"federații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"federație","accusative-definite-nominative-singular":"federația","accusative-indefinite-nominative-plural":"federații","accusative-definite-nominative-plural":"federațiile","dative-genitive-indefinite-singular":"federații","dative-definite-genitive-singular":"federației","dative-genitive-indefinite-plural":"federații","dative-definite-genitive-plural":"federațiilor","singular-vocative":"federație","plural-vocative":"federațiilor","alternative":"federațiune"}},{"word":"federații","pos":"noun","definitions":["plural of federație"]},{"word":"federațiune","pos":"noun","definitions":["obsolete form of federație"],"forms":{"plural":"federațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"federațiune","accusative-definite-nominative-singular":"federațiunea","accusative-indefinite-nominative-plural":"federațiuni","accusative-definite-nominative-plural":"federațiunile","dative-genitive-indefinite-singular":"federațiuni","dative-definite-genitive-singular":"federațiunii","dative-genitive-indefinite-plural":"federațiuni","dative-definite-genitive-plural":"federațiunilor","singular-vocative":"federațiune","plural-vocative":"federațiunilor"}},{"word":"federativ","pos":"adj","definitions":["federative"],"pronunciation":"/fe.de.raˈtiv/","forms":{"feminine-singular":"federativă","masculine-plural":"federativi","feminine-neuter-plural":"federative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"federativ","error-unrecognized-form-feminine-indefinite-singular":"federativă","error-unrecognized-form-indefinite-masculine-plural":"federativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"federative","definite-error-unrecognized-form-masculine-neuter-singular":"federativul","definite-error-unrecognized-form-feminine-singular":"federativa","definite-error-unrecognized-form-masculine-plural":"federativii","definite-error-unrecognized-form-feminine-neuter-plural":"federativele","alternative":"федератив"}},{"word":"federativă","pos":"adj","definitions":["feminine singular of federativ"],"gender":"f-s"},{"word":"Federi","pos":"name","definitions":["a village in Pui, Hunedoara County, Romania"],"gender":"m"},{"word":"federvais","pos":"noun","definitions":["French chalk"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"federvais","accusative-definite-nominative":"federvaisul","dative-genitive-indefinite":"federvais","dative-definite-genitive":"federvaisului","vocative":"federvaisule"}},{"word":"Fedești","pos":"name","definitions":["a village in Șuletea, Vaslui County, Romania"],"gender":"m"},{"word":"Fediuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Fediuc"}},{"word":"Fedorciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Fedorciuc"}},{"word":"Fedoreac","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Fedoreac"}},{"word":"Fedoreuca","pos":"name","definitions":["a village in Ciocîlteni, Orhei Raion, Moldova"],"gender":"f"},{"word":"Fedoseevca","pos":"name","definitions":["a village in Carmanova, Transnistria, Moldova"],"gender":"f"},{"word":"fee","pos":"noun","definitions":["fairy"],"forms":{"plural":"fee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fee","accusative-definite-nominative-singular":"feea","accusative-indefinite-nominative-plural":"fee","accusative-definite-nominative-plural":"feele","dative-genitive-indefinite-singular":"fee","dative-definite-genitive-singular":"feei","dative-genitive-indefinite-plural":"fee","dative-definite-genitive-plural":"feelor","singular-vocative":"fee","plural-vocative":"feelor"}},{"word":"feedback","pos":"noun","definitions":["feedback"],"forms":{"plural":"feedbackuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feedback","accusative-definite-nominative-singular":"feedbackul","accusative-indefinite-nominative-plural":"feedbackuri","accusative-definite-nominative-plural":"feedbackurile","dative-genitive-indefinite-singular":"feedback","dative-definite-genitive-singular":"feedbackului","dative-genitive-indefinite-plural":"feedbackuri","dative-definite-genitive-plural":"feedbackurilor","singular-vocative":"feedbackule","plural-vocative":"feedbackurilor"}},{"word":"feeling","pos":"noun","definitions":["feeling"],"forms":{"plural":"feelinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feeling","accusative-definite-nominative-singular":"feelingul","accusative-indefinite-nominative-plural":"feelinguri","accusative-definite-nominative-plural":"feelingurile","dative-genitive-indefinite-singular":"feeling","dative-definite-genitive-singular":"feelingului","dative-genitive-indefinite-plural":"feelinguri","dative-definite-genitive-plural":"feelingurilor","singular-vocative":"feelingule","plural-vocative":"feelingurilor"}},{"word":"feeric","pos":"adj","definitions":["enchanting"],"forms":{"feminine-singular":"feerică","masculine-plural":"feerici","feminine-neuter-plural":"feerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feeric","error-unrecognized-form-feminine-indefinite-singular":"feerică","error-unrecognized-form-indefinite-masculine-plural":"feerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feerice","definite-error-unrecognized-form-masculine-neuter-singular":"feericul","definite-error-unrecognized-form-feminine-singular":"feerica","definite-error-unrecognized-form-masculine-plural":"feericii","definite-error-unrecognized-form-feminine-neuter-plural":"feericele"}},{"word":"feerie","pos":"noun","definitions":["fairyland","féerie"],"forms":{"plural":"feerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"feerie","accusative-definite-nominative-singular":"feeria","accusative-indefinite-nominative-plural":"feerii","accusative-definite-nominative-plural":"feeriile","dative-genitive-indefinite-singular":"feerii","dative-definite-genitive-singular":"feeriei","dative-genitive-indefinite-plural":"feerii","dative-definite-genitive-plural":"feeriilor","singular-vocative":"feerie","plural-vocative":"feeriilor"}},{"word":"Feernic","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Târnava Mare"],"gender":"m"},{"word":"Fefelei","pos":"name","definitions":["a locality in Mizil, Prahova County, Romania"],"gender":"m"},{"word":"Fegernic","pos":"name","definitions":["a village in Sârbi, Bihor County, Romania"],"gender":"m"},{"word":"Fegernicu Nou","pos":"name","definitions":["a village in Sârbi, Bihor County, Romania"],"gender":"m"},{"word":"Feieragu","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Orăștie"],"gender":"m"},{"word":"Feiurd","pos":"name","definitions":["a village in Cluj County, Romania. Renamed to Feiurdeni in 1925."],"gender":"f"},{"word":"Feiurdeni","pos":"name","definitions":["a village in Chinteni, Cluj County, Romania"],"gender":"m"},{"word":"fel","pos":"noun","definitions":["sort, type, kind","manner, style, way","course of a meal"],"pronunciation":"/ˈfel/","examples":[{"ro":"În ce fel?","en":"In what way?"},{"ro":"În felul acesta.","en":"In this way."},{"ro":"Nu e în felul lui să fie neprietenos.","en":"It’s unlike him to be unkind."}],"forms":{"plural":"feluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fel","accusative-definite-nominative-singular":"felul","accusative-indefinite-nominative-plural":"feluri","accusative-definite-nominative-plural":"felurile","dative-genitive-indefinite-singular":"fel","dative-definite-genitive-singular":"felului","dative-genitive-indefinite-plural":"feluri","dative-definite-genitive-plural":"felurilor","singular-vocative":"felule","plural-vocative":"felurilor"}},{"word":"felah","pos":"noun","definitions":["fellah (peasant or farmer)"],"forms":{"plural":"felahi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"felah","accusative-definite-nominative-singular":"felahul","accusative-indefinite-nominative-plural":"felahi","accusative-definite-nominative-plural":"felahii","dative-genitive-indefinite-singular":"felah","dative-definite-genitive-singular":"felahului","dative-genitive-indefinite-plural":"felahi","dative-definite-genitive-plural":"felahilor","singular-vocative":"felahule","plural-vocative":"felahilor"}},{"word":"Felaiud","pos":"name","definitions":["a village in Alba County, Romania. Renamed to Aiudul de Sus in 1925."],"gender":"m"},{"word":"felația","pos":"noun","definitions":["definite nominative/accusative singular of felație"],"pronunciation":"[feˈlatsia]","gender":"f"},{"word":"felație","pos":"noun","definitions":["fellatio"],"pronunciation":"[feˈlatsi.e]","forms":{"plural":"felații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"felație","accusative-definite-nominative-singular":"felația","accusative-indefinite-nominative-plural":"felații","accusative-definite-nominative-plural":"felațiile","dative-genitive-indefinite-singular":"felații","dative-definite-genitive-singular":"felației","dative-genitive-indefinite-plural":"felații","dative-definite-genitive-plural":"felațiilor","singular-vocative":"felație","plural-vocative":"felațiilor"}},{"word":"felației","pos":"noun","definitions":["definite genitive/dative singular of felație"],"pronunciation":"/fe.ˈla.t͡si.ej/","gender":"f"},{"word":"felații","pos":"noun","definitions":["plural of felație"],"pronunciation":"[feˈlatsiː]","gender":"f-p"},{"word":"felațiile","pos":"noun","definitions":["definite nominative/accusative plural of felație"],"pronunciation":"[feˈlatsiːle]","gender":"f-p"},{"word":"felațiilor","pos":"noun","definitions":["definite genitive/dative plural of felație"],"pronunciation":"[feˈlatsiːlor]","gender":"f-p"},{"word":"felcer","pos":"noun","definitions":["barber surgeon, doctor's helper","quack doctor"],"forms":{"plural":"felceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"felcer","accusative-definite-nominative-singular":"felcerul","accusative-indefinite-nominative-plural":"felceri","accusative-definite-nominative-plural":"felcerii","dative-genitive-indefinite-singular":"felcer","dative-definite-genitive-singular":"felcerului","dative-genitive-indefinite-plural":"felceri","dative-definite-genitive-plural":"felcerilor","singular-vocative":"felcerule","plural-vocative":"felcerilor"}},{"word":"felceră","pos":"noun","definitions":["female equivalent of felcer"],"forms":{"plural":"felcere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felceră","accusative-definite-nominative-singular":"felcera","accusative-indefinite-nominative-plural":"felcere","accusative-definite-nominative-plural":"felcerele","dative-genitive-indefinite-singular":"felcere","dative-definite-genitive-singular":"felcerei","dative-genitive-indefinite-plural":"felcere","dative-definite-genitive-plural":"felcerelor","singular-vocative":"felceră","plural-vocative":"felcerelor"}},{"word":"felceriță","pos":"noun","definitions":["female equivalent of felcer"],"forms":{"plural":"felcerițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felceriță","accusative-definite-nominative-singular":"felcerița","accusative-indefinite-nominative-plural":"felcerițe","accusative-definite-nominative-plural":"felcerițele","dative-genitive-indefinite-singular":"felcerițe","dative-definite-genitive-singular":"felceriței","dative-genitive-indefinite-plural":"felcerițe","dative-definite-genitive-plural":"felcerițelor","singular-vocative":"felceriță","plural-vocative":"felcerițelor"}},{"word":"Felcheriu","pos":"name","definitions":["a village in Oșorhei, Bihor County, Romania"],"gender":"m"},{"word":"felcuță","pos":"noun","definitions":["diminutive of fele"],"forms":{"plural":"felcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felcuță","accusative-definite-nominative-singular":"felcuța","accusative-indefinite-nominative-plural":"felcuțe","accusative-definite-nominative-plural":"felcuțele","dative-genitive-indefinite-singular":"felcuțe","dative-definite-genitive-singular":"felcuței","dative-genitive-indefinite-plural":"felcuțe","dative-definite-genitive-plural":"felcuțelor","singular-vocative":"felcuță","plural-vocative":"felcuțelor"}},{"word":"Feldeorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feldeorean"}},{"word":"felderă","pos":"noun","definitions":["alternative form of ferdelă"],"forms":{"plural":"feldere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felderă","accusative-definite-nominative-singular":"feldera","accusative-indefinite-nominative-plural":"feldere","accusative-definite-nominative-plural":"felderele","dative-genitive-indefinite-singular":"feldere","dative-definite-genitive-singular":"felderei","dative-genitive-indefinite-plural":"feldere","dative-definite-genitive-plural":"felderelor","singular-vocative":"felderă","plural-vocative":"felderelor"}},{"word":"Feldioara","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Feldioara, Brașov County, Romania","a village in Ucea, Brașov County, Romania","a village in Cătina, Cluj County, Romania","a village in Tănăsoaia, Vrancea County, Romania"],"gender":"f"},{"word":"Feldiorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feldiorean"}},{"word":"Feldioreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feldioreanu"}},{"word":"feldmareșal","pos":"noun","definitions":["field marshal"],"forms":{"plural":"feldmareșali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feldmareșal","accusative-definite-nominative-singular":"feldmareșalul","accusative-indefinite-nominative-plural":"feldmareșali","accusative-definite-nominative-plural":"feldmareșalii","dative-genitive-indefinite-singular":"feldmareșal","dative-definite-genitive-singular":"feldmareșalului","dative-genitive-indefinite-plural":"feldmareșali","dative-definite-genitive-plural":"feldmareșalilor","singular-vocative":"feldmareșalule","plural-vocative":"feldmareșalilor"}},{"word":"Feldrișel","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"Feldru","pos":"name","definitions":["a commune of Bistrița-Năsăud County, Romania","a village in Feldru, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"feldspat","pos":"noun","definitions":["feldspar"],"forms":{"plural":"feldspați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feldspat","accusative-definite-nominative-singular":"feldspatul","accusative-indefinite-nominative-plural":"feldspați","accusative-definite-nominative-plural":"feldspații","dative-genitive-indefinite-singular":"feldspat","dative-definite-genitive-singular":"feldspatului","dative-genitive-indefinite-plural":"feldspați","dative-definite-genitive-plural":"feldspaților","singular-vocative":"feldspatule","plural-vocative":"feldspaților"}},{"word":"feldspatic","pos":"adj","definitions":["feldspathic"],"forms":{"feminine-singular":"feldspatică","masculine-plural":"feldspatici","feminine-neuter-plural":"feldspatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feldspatic","error-unrecognized-form-feminine-indefinite-singular":"feldspatică","error-unrecognized-form-indefinite-masculine-plural":"feldspatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feldspatice","definite-error-unrecognized-form-masculine-neuter-singular":"feldspaticul","definite-error-unrecognized-form-feminine-singular":"feldspatica","definite-error-unrecognized-form-masculine-plural":"feldspaticii","definite-error-unrecognized-form-feminine-neuter-plural":"feldspaticele"}},{"word":"feldspatoid","pos":"noun","definitions":["feldspathoid"],"forms":{"plural":"feldspatoizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feldspatoid","accusative-definite-nominative-singular":"feldspatoidul","accusative-indefinite-nominative-plural":"feldspatoizi","accusative-definite-nominative-plural":"feldspatoizii","dative-genitive-indefinite-singular":"feldspatoid","dative-definite-genitive-singular":"feldspatoidului","dative-genitive-indefinite-plural":"feldspatoizi","dative-definite-genitive-plural":"feldspatoizilor","singular-vocative":"feldspatoidule","plural-vocative":"feldspatoizilor"}},{"word":"feldvebăl","pos":"noun","definitions":["sergeant (noncommissioned officer)"],"forms":{"plural":"feldvebăli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feldvebăl","accusative-definite-nominative-singular":"feldvebălul","accusative-indefinite-nominative-plural":"feldvebăli","accusative-definite-nominative-plural":"feldvebălii","dative-genitive-indefinite-singular":"feldvebăl","dative-definite-genitive-singular":"feldvebălului","dative-genitive-indefinite-plural":"feldvebăli","dative-definite-genitive-plural":"feldvebălilor","singular-vocative":"feldvebălule","plural-vocative":"feldvebălilor"}},{"word":"feldwebel","pos":"noun","definitions":["feldwebel"],"forms":{"plural":"feldwebeli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feldwebel","accusative-definite-nominative-singular":"feldwebelul","accusative-indefinite-nominative-plural":"feldwebeli","accusative-definite-nominative-plural":"feldwebelii","dative-genitive-indefinite-singular":"feldwebel","dative-definite-genitive-singular":"feldwebelului","dative-genitive-indefinite-plural":"feldwebeli","dative-definite-genitive-plural":"feldwebelilor","singular-vocative":"feldwebelule","plural-vocative":"feldwebelilor"}},{"word":"Feleac","pos":"name","definitions":["a village in Nușeni, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Feleacu","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Feleacu, Cluj County, Romania"],"gender":"m"},{"word":"Feleag","pos":"name","definitions":["a village in Vânători, Mureș County, Romania"],"gender":"m"},{"word":"Felecan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Felecan"}},{"word":"Felegan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Felegan"}},{"word":"felegean","pos":"noun","definitions":["finjan"],"forms":{"plural":"felegene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"felegean","accusative-definite-nominative-singular":"felegeanul","accusative-indefinite-nominative-plural":"felegene","accusative-definite-nominative-plural":"felegenele","dative-genitive-indefinite-singular":"felegean","dative-definite-genitive-singular":"felegeanului","dative-genitive-indefinite-plural":"felegene","dative-definite-genitive-plural":"felegenelor","singular-vocative":"felegeanule","plural-vocative":"felegenelor","alternative":"filigean"}},{"word":"feleguță","pos":"noun","definitions":["diminutive of felegă"],"forms":{"plural":"feleguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feleguță","accusative-definite-nominative-singular":"feleguța","accusative-indefinite-nominative-plural":"feleguțe","accusative-definite-nominative-plural":"feleguțele","dative-genitive-indefinite-singular":"feleguțe","dative-definite-genitive-singular":"feleguței","dative-genitive-indefinite-plural":"feleguțe","dative-definite-genitive-plural":"feleguțelor","singular-vocative":"feleguță","plural-vocative":"feleguțelor"}},{"word":"feleșag","pos":"noun","definitions":["character (of a person)"],"forms":{"plural":"feleșaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feleșag","accusative-definite-nominative-singular":"feleșagul","accusative-indefinite-nominative-plural":"feleșaguri","accusative-definite-nominative-plural":"feleșagurile","dative-genitive-indefinite-singular":"feleșag","dative-definite-genitive-singular":"feleșagului","dative-genitive-indefinite-plural":"feleșaguri","dative-definite-genitive-plural":"feleșagurilor","singular-vocative":"feleșagule","plural-vocative":"feleșagurilor"}},{"word":"Feleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feleșteanu"}},{"word":"feleșui","pos":"verb","definitions":["to contradict"],"forms":{"canonical":"a feleșui 4th conjugation","present-singular-third-person":"feleșuie","participle-past":"feleșuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a feleșui","gerund":"feleșuind","first-person-indicative-present-singular":"feleșui","indicative-present-second-person-singular":"feleșui","indicative-present-singular-third-person":"feleșuie","first-person-indicative-plural-present":"feleșuim","indicative-plural-present-second-person":"feleșuiți","indicative-plural-present-third-person":"feleșuie","first-person-imperfect-indicative-singular":"feleșuiam","imperfect-indicative-second-person-singular":"feleșuiai","imperfect-indicative-singular-third-person":"feleșuia","first-person-imperfect-indicative-plural":"feleșuiam","imperfect-indicative-plural-second-person":"feleșuiați","imperfect-indicative-plural-third-person":"feleșuiau","first-person-indicative-perfect-singular":"feleșuii","indicative-perfect-second-person-singular":"feleșuiși","indicative-perfect-singular-third-person":"feleșui","first-person-indicative-perfect-plural":"feleșuirăm","indicative-perfect-plural-second-person":"feleșuirăți","indicative-perfect-plural-third-person":"feleșuiră","first-person-indicative-pluperfect-singular":"feleșuisem","indicative-pluperfect-second-person-singular":"feleșuiseși","indicative-pluperfect-singular-third-person":"feleșuise","first-person-indicative-pluperfect-plural":"feleșuiserăm","indicative-pluperfect-plural-second-person":"feleșuiserăți","indicative-pluperfect-plural-third-person":"feleșuiseră","first-person-present-singular-subjunctive":"să feleșui","present-second-person-singular-subjunctive":"să feleșui","present-singular-subjunctive-third-person":"să feleșuie","first-person-plural-present-subjunctive":"să feleșuim","plural-present-second-person-subjunctive":"să feleșuiți","plural-present-subjunctive-third-person":"să feleșuie","imperative-second-person-singular":"feleșuie","imperative-plural-second-person":"feleșuiți","imperative-negative-second-person-singular":"nu feleșui","imperative-negative-plural-second-person":"nu feleșuiți"}},{"word":"felia","pos":"verb","definitions":["to slice (cut into slices; usually food)"],"pronunciation":"/fe.liˈa/","forms":{"canonical":"a felia 1st conjugation","present-singular-third-person":"feliază","participle-past":"feliat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a felia","gerund":"feliind","first-person-indicative-present-singular":"feliez","indicative-present-second-person-singular":"feliezi","indicative-present-singular-third-person":"feliază","first-person-indicative-plural-present":"feliem","indicative-plural-present-second-person":"feliați","indicative-plural-present-third-person":"feliază","first-person-imperfect-indicative-singular":"feliam","imperfect-indicative-second-person-singular":"feliai","imperfect-indicative-singular-third-person":"felia","first-person-imperfect-indicative-plural":"feliam","imperfect-indicative-plural-second-person":"feliați","imperfect-indicative-plural-third-person":"feliau","first-person-indicative-perfect-singular":"feliai","indicative-perfect-second-person-singular":"feliași","indicative-perfect-singular-third-person":"felie","first-person-indicative-perfect-plural":"feliarăm","indicative-perfect-plural-second-person":"feliarăți","indicative-perfect-plural-third-person":"feliară","first-person-indicative-pluperfect-singular":"feliasem","indicative-pluperfect-second-person-singular":"feliaseși","indicative-pluperfect-singular-third-person":"feliase","first-person-indicative-pluperfect-plural":"feliaserăm","indicative-pluperfect-plural-second-person":"feliaserăți","indicative-pluperfect-plural-third-person":"feliaseră","first-person-present-singular-subjunctive":"să feliez","present-second-person-singular-subjunctive":"să feliezi","present-singular-subjunctive-third-person":"să felieze","first-person-plural-present-subjunctive":"să feliem","plural-present-second-person-subjunctive":"să feliați","plural-present-subjunctive-third-person":"să felieze","imperative-second-person-singular":"feliază","imperative-plural-second-person":"feliați","imperative-negative-second-person-singular":"nu felia","imperative-negative-plural-second-person":"nu feliați"}},{"word":"felibru","pos":"noun","definitions":["félibre"],"forms":{"plural":"felibri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"felibru","accusative-definite-nominative-singular":"felibrul","accusative-indefinite-nominative-plural":"felibri","accusative-definite-nominative-plural":"felibrii","dative-genitive-indefinite-singular":"felibru","dative-definite-genitive-singular":"felibrului","dative-genitive-indefinite-plural":"felibri","dative-definite-genitive-plural":"felibrilor","singular-vocative":"felibrule","plural-vocative":"felibrilor"}},{"word":"felicea","pos":"noun","definitions":["diminutive of fele"],"forms":{"plural":"felicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"felicea","accusative-definite-nominative-singular":"feliceaua","accusative-indefinite-nominative-plural":"felicele","accusative-definite-nominative-plural":"felicelele","dative-genitive-indefinite-singular":"felicele","dative-definite-genitive-singular":"felicelei","dative-genitive-indefinite-plural":"felicele","dative-definite-genitive-plural":"felicelelor","singular-vocative":"felicea","plural-vocative":"felicelelor"}},{"word":"Feliceni","pos":"name","definitions":["a commune of Harghita County, Romania","a village in Feliceni, Harghita County, Romania"],"gender":"m"},{"word":"felicita","pos":"verb","definitions":["to congratulate"],"pronunciation":"/fe.li.t͡ʃiˈta/","forms":{"canonical":"a felicita 1st conjugation","present-singular-third-person":"felicită","participle-past":"felicitat","subjunctive-third-person":"felicite","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a felicita","gerund":"felicitând","first-person-indicative-present-singular":"felicit","indicative-present-second-person-singular":"feliciți","indicative-present-singular-third-person":"felicită","first-person-indicative-plural-present":"felicităm","indicative-plural-present-second-person":"felicitați","indicative-plural-present-third-person":"felicită","first-person-imperfect-indicative-singular":"felicitam","imperfect-indicative-second-person-singular":"felicitai","imperfect-indicative-singular-third-person":"felicita","first-person-imperfect-indicative-plural":"felicitam","imperfect-indicative-plural-second-person":"felicitați","imperfect-indicative-plural-third-person":"felicitau","first-person-indicative-perfect-singular":"felicitai","indicative-perfect-second-person-singular":"felicitași","indicative-perfect-singular-third-person":"felicită","first-person-indicative-perfect-plural":"felicitarăm","indicative-perfect-plural-second-person":"felicitarăți","indicative-perfect-plural-third-person":"felicitară","first-person-indicative-pluperfect-singular":"felicitasem","indicative-pluperfect-second-person-singular":"felicitaseși","indicative-pluperfect-singular-third-person":"felicitase","first-person-indicative-pluperfect-plural":"felicitaserăm","indicative-pluperfect-plural-second-person":"felicitaserăți","indicative-pluperfect-plural-third-person":"felicitaseră","first-person-present-singular-subjunctive":"să felicit","present-second-person-singular-subjunctive":"să feliciți","present-singular-subjunctive-third-person":"să felicite","first-person-plural-present-subjunctive":"să felicităm","plural-present-second-person-subjunctive":"să felicitați","plural-present-subjunctive-third-person":"să felicite","imperative-second-person-singular":"felicită","imperative-plural-second-person":"felicitați","imperative-negative-second-person-singular":"nu felicita","imperative-negative-plural-second-person":"nu felicitați"}},{"word":"felicită","pos":"verb","definitions":["third-person singular present of felicita"]},{"word":"felicitare","pos":"noun","definitions":["greeting card"],"forms":{"plural":"felicitări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"felicitare","accusative-definite-nominative-singular":"felicitarea","accusative-indefinite-nominative-plural":"felicitări","accusative-definite-nominative-plural":"felicitările","dative-genitive-indefinite-singular":"felicitări","dative-definite-genitive-singular":"felicitării","dative-genitive-indefinite-plural":"felicitări","dative-definite-genitive-plural":"felicitărilor","singular-vocative":"felicitare","plural-vocative":"felicitărilor"}},{"word":"felicitat","pos":"adj","definitions":["congratulated"],"forms":{"feminine-singular":"felicitată","masculine-plural":"felicitați","feminine-neuter-plural":"felicitate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"felicitat","error-unrecognized-form-feminine-indefinite-singular":"felicitată","error-unrecognized-form-indefinite-masculine-plural":"felicitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"felicitate","definite-error-unrecognized-form-masculine-neuter-singular":"felicitatul","definite-error-unrecognized-form-feminine-singular":"felicitata","definite-error-unrecognized-form-masculine-plural":"felicitații","definite-error-unrecognized-form-feminine-neuter-plural":"felicitatele"}},{"word":"felicitat","pos":"verb","definitions":["past participle of felicita"],"forms":{"participle-past":"of felicita"}},{"word":"felidă","pos":"noun","definitions":["felid"],"forms":{"plural":"felide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felidă","accusative-definite-nominative-singular":"felida","accusative-indefinite-nominative-plural":"felide","accusative-definite-nominative-plural":"felidele","dative-genitive-indefinite-singular":"felide","dative-definite-genitive-singular":"felidei","dative-genitive-indefinite-plural":"felide","dative-definite-genitive-plural":"felidelor","singular-vocative":"felidă","plural-vocative":"felidelor"}},{"word":"Felie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Felie"}},{"word":"felie","pos":"noun","definitions":["wedge, slice, piece cut off from the rest (usually said of food)"],"examples":[{"ro":"Dă-mi o felie de tort.","en":"Give me a slice of cake."}],"forms":{"plural":"felii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"felie","accusative-definite-nominative-singular":"felia","accusative-indefinite-nominative-plural":"felii","accusative-definite-nominative-plural":"feliile","dative-genitive-indefinite-singular":"felii","dative-definite-genitive-singular":"feliei","dative-genitive-indefinite-plural":"felii","dative-definite-genitive-plural":"feliilor","singular-vocative":"felie","plural-vocative":"feliilor"}},{"word":"feliere","pos":"noun","definitions":["slicing"],"forms":{"plural":"felieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"feliere","accusative-definite-nominative-singular":"felierea","accusative-indefinite-nominative-plural":"felieri","accusative-definite-nominative-plural":"felierile","dative-genitive-indefinite-singular":"felieri","dative-definite-genitive-singular":"felierii","dative-genitive-indefinite-plural":"felieri","dative-definite-genitive-plural":"felierilor","singular-vocative":"feliere","plural-vocative":"felierilor"}},{"word":"feligean","pos":"noun","definitions":["obsolete form of felegean"],"forms":{"plural":"feligene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feligean","accusative-definite-nominative-singular":"feligeanul","accusative-indefinite-nominative-plural":"feligene","accusative-definite-nominative-plural":"feligenele","dative-genitive-indefinite-singular":"feligean","dative-definite-genitive-singular":"feligeanului","dative-genitive-indefinite-plural":"feligene","dative-definite-genitive-plural":"feligenelor","singular-vocative":"feligeanule","plural-vocative":"feligenelor"}},{"word":"felin","pos":"adj","definitions":["feline"],"forms":{"feminine-singular":"felină","masculine-plural":"felini","feminine-neuter-plural":"feline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"felin","error-unrecognized-form-feminine-indefinite-singular":"felină","error-unrecognized-form-indefinite-masculine-plural":"felini","error-unrecognized-form-feminine-indefinite-neuter-plural":"feline","definite-error-unrecognized-form-masculine-neuter-singular":"felinul","definite-error-unrecognized-form-feminine-singular":"felina","definite-error-unrecognized-form-masculine-plural":"felinii","definite-error-unrecognized-form-feminine-neuter-plural":"felinele"}},{"word":"felina","pos":"noun","definitions":["definite nominative/accusative singular of felină"],"pronunciation":"[feˈlina]","gender":"f"},{"word":"felină","pos":"adj","definitions":["feminine singular of felin"],"pronunciation":"/feˈlinə/"},{"word":"felină","pos":"noun","definitions":["feline"],"pronunciation":"/feˈlinə/","forms":{"plural":"feline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felină","accusative-definite-nominative-singular":"felina","accusative-indefinite-nominative-plural":"feline","accusative-definite-nominative-plural":"felinele","dative-genitive-indefinite-singular":"feline","dative-definite-genitive-singular":"felinei","dative-genitive-indefinite-plural":"feline","dative-definite-genitive-plural":"felinelor","singular-vocative":"felină","plural-vocative":"felinelor"}},{"word":"felinar","pos":"noun","definitions":["a streetlamp"],"forms":{"plural":"felinare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"felinar","accusative-definite-nominative-singular":"felinarul","accusative-indefinite-nominative-plural":"felinare","accusative-definite-nominative-plural":"felinarele","dative-genitive-indefinite-singular":"felinar","dative-definite-genitive-singular":"felinarului","dative-genitive-indefinite-plural":"felinare","dative-definite-genitive-plural":"felinarelor","singular-vocative":"felinarule","plural-vocative":"felinarelor"}},{"word":"feline","pos":"noun","definitions":["inflection of felină:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[feˈline]","gender":"f"},{"word":"felinei","pos":"noun","definitions":["definite genitive/dative singular of felină"],"pronunciation":"[feˈlinej]","gender":"f"},{"word":"felinitate","pos":"noun","definitions":["felinity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"felinitate","accusative-definite-nominative-singular":"felinitatea","accusative-indefinite-nominative-plural":"felinități","accusative-definite-nominative-plural":"felinitățile","dative-genitive-indefinite-singular":"felinități","dative-definite-genitive-singular":"felinității","dative-genitive-indefinite-plural":"felinități","dative-definite-genitive-plural":"felinităților","singular-vocative":"felinitate","plural-vocative":"felinităților"}},{"word":"felino","pos":"noun","definitions":["vocative singular of felină"],"pronunciation":"[feˈlino]","gender":"f"},{"word":"felioară","pos":"noun","definitions":["diminutive of felie; small slice"],"forms":{"plural":"felioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"felioară","accusative-definite-nominative-singular":"felioara","accusative-indefinite-nominative-plural":"felioare","accusative-definite-nominative-plural":"felioarele","dative-genitive-indefinite-singular":"felioare","dative-definite-genitive-singular":"felioarei","dative-genitive-indefinite-plural":"felioare","dative-definite-genitive-plural":"felioarelor","singular-vocative":"felioară","plural-vocative":"felioarelor"}},{"word":"felișcă","pos":"noun","definitions":["pot marigold (Calendula officinalis)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"felișcă","accusative-definite-nominative":"felișca","dative-genitive-indefinite":"felișce","dative-definite-genitive":"felișcei","vocative":"felișcă"}},{"word":"feliță","pos":"noun","definitions":["diminutive of fele"],"forms":{"plural":"felițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feliță","accusative-definite-nominative-singular":"felița","accusative-indefinite-nominative-plural":"felițe","accusative-definite-nominative-plural":"felițele","dative-genitive-indefinite-singular":"felițe","dative-definite-genitive-singular":"feliței","dative-genitive-indefinite-plural":"felițe","dative-definite-genitive-plural":"felițelor","singular-vocative":"feliță","plural-vocative":"felițelor"}},{"word":"feliuri","pos":"verb","definitions":["obsolete form of feluri"],"forms":{"canonical":"a feliuri 4th conjugation","present-singular-third-person":"feliurie","participle-past":"feliurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a feliuri","gerund":"feliurind","first-person-indicative-present-singular":"feliur","indicative-present-second-person-singular":"feliuri","indicative-present-singular-third-person":"feliure","first-person-indicative-plural-present":"feliurim","indicative-plural-present-second-person":"feliuriți","indicative-plural-present-third-person":"feliur","first-person-imperfect-indicative-singular":"feliuream","imperfect-indicative-second-person-singular":"feliureai","imperfect-indicative-singular-third-person":"feliurea","first-person-imperfect-indicative-plural":"feliuream","imperfect-indicative-plural-second-person":"feliureați","imperfect-indicative-plural-third-person":"feliureau","first-person-indicative-perfect-singular":"feliurii","indicative-perfect-second-person-singular":"feliuriși","indicative-perfect-singular-third-person":"feliuri","first-person-indicative-perfect-plural":"feliurirăm","indicative-perfect-plural-second-person":"feliurirăți","indicative-perfect-plural-third-person":"feliuriră","first-person-indicative-pluperfect-singular":"feliurisem","indicative-pluperfect-second-person-singular":"feliuriseși","indicative-pluperfect-singular-third-person":"feliurise","first-person-indicative-pluperfect-plural":"feliuriserăm","indicative-pluperfect-plural-second-person":"feliuriserăți","indicative-pluperfect-plural-third-person":"feliuriseră","first-person-present-singular-subjunctive":"să feliur","present-second-person-singular-subjunctive":"să feliuri","present-singular-subjunctive-third-person":"să feliură","first-person-plural-present-subjunctive":"să feliurim","plural-present-second-person-subjunctive":"să feliuriți","plural-present-subjunctive-third-person":"să feliură","imperative-second-person-singular":"feliure","imperative-plural-second-person":"feliuriți","imperative-negative-second-person-singular":"nu feliuri","imperative-negative-plural-second-person":"nu feliuriți"}},{"word":"feliurime","pos":"noun","definitions":["alternative form of felurime"],"forms":{"plural":"feliurimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"feliurime","accusative-definite-nominative-singular":"feliurimea","accusative-indefinite-nominative-plural":"feliurimi","accusative-definite-nominative-plural":"feliurimile","dative-genitive-indefinite-singular":"feliurimi","dative-definite-genitive-singular":"feliurimii","dative-genitive-indefinite-plural":"feliurimi","dative-definite-genitive-plural":"feliurimilor","singular-vocative":"feliurime","plural-vocative":"feliurimilor"}},{"word":"feliurit","pos":"adj","definitions":["alternative form of felurit"],"forms":{"feminine-singular":"feliurită","masculine-plural":"feliuriți","feminine-neuter-plural":"feliurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feliurit","error-unrecognized-form-feminine-indefinite-singular":"feliurită","error-unrecognized-form-indefinite-masculine-plural":"feliuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"feliurite","definite-error-unrecognized-form-masculine-neuter-singular":"feliuritul","definite-error-unrecognized-form-feminine-singular":"feliurita","definite-error-unrecognized-form-masculine-plural":"feliuriții","definite-error-unrecognized-form-feminine-neuter-plural":"feliuritele"}},{"word":"feliușag","pos":"noun","definitions":["alternative form of feleșag"],"forms":{"plural":"feliușaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feliușag","accusative-definite-nominative-singular":"feliușagul","accusative-indefinite-nominative-plural":"feliușaguri","accusative-definite-nominative-plural":"feliușagurile","dative-genitive-indefinite-singular":"feliușag","dative-definite-genitive-singular":"feliușagului","dative-genitive-indefinite-plural":"feliușaguri","dative-definite-genitive-plural":"feliușagurilor","singular-vocative":"feliușagule","plural-vocative":"feliușagurilor"}},{"word":"feliuță","pos":"noun","definitions":["diminutive of felie; small slice"],"forms":{"plural":"feliuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feliuță","accusative-definite-nominative-singular":"feliuța","accusative-indefinite-nominative-plural":"feliuțe","accusative-definite-nominative-plural":"feliuțele","dative-genitive-indefinite-singular":"feliuțe","dative-definite-genitive-singular":"feliuței","dative-genitive-indefinite-plural":"feliuțe","dative-definite-genitive-plural":"feliuțelor","singular-vocative":"feliuță","plural-vocative":"feliuțelor"}},{"word":"Felmer","pos":"name","definitions":["a village in Șoarș, Brașov County, Romania"],"gender":"m"},{"word":"Felnac","pos":"name","definitions":["a commune of Arad County, Romania","a village in Felnac, Arad County, Romania"],"gender":"f"},{"word":"feloderm","pos":"noun","definitions":["phelloderm"],"forms":{"plural":"feloderme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feloderm","accusative-definite-nominative-singular":"felodermul","accusative-indefinite-nominative-plural":"feloderme","accusative-definite-nominative-plural":"felodermele","dative-genitive-indefinite-singular":"feloderm","dative-definite-genitive-singular":"felodermului","dative-genitive-indefinite-plural":"feloderme","dative-definite-genitive-plural":"felodermelor","singular-vocative":"felodermule","plural-vocative":"felodermelor"}},{"word":"felogen","pos":"noun","definitions":["phellogen"],"forms":{"plural":"felogene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"felogen","accusative-definite-nominative-singular":"felogenul","accusative-indefinite-nominative-plural":"felogene","accusative-definite-nominative-plural":"felogenele","dative-genitive-indefinite-singular":"felogen","dative-definite-genitive-singular":"felogenului","dative-genitive-indefinite-plural":"felogene","dative-definite-genitive-plural":"felogenelor","singular-vocative":"felogenule","plural-vocative":"felogenelor"}},{"word":"Feloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Feloiu"}},{"word":"felon","pos":"noun","definitions":["cape worn by the priest over the liturgical garments"],"forms":{"plural":"feloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"felon","accusative-definite-nominative-singular":"felonul","accusative-indefinite-nominative-plural":"feloane","accusative-definite-nominative-plural":"feloanele","dative-genitive-indefinite-singular":"felon","dative-definite-genitive-singular":"felonului","dative-genitive-indefinite-plural":"feloane","dative-definite-genitive-plural":"feloanelor","singular-vocative":"felonule","plural-vocative":"feloanelor"}},{"word":"felonie","pos":"noun","definitions":["treachery, treason"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"felonie","accusative-definite-nominative":"felonia","dative-genitive-indefinite":"felonii","dative-definite-genitive":"feloniei","vocative":"felonie"}},{"word":"felpinz","pos":"noun","definitions":["advance payment"],"forms":{"plural":"felpinzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"felpinz","accusative-definite-nominative-singular":"felpinzul","accusative-indefinite-nominative-plural":"felpinzuri","accusative-definite-nominative-plural":"felpinzurile","dative-genitive-indefinite-singular":"felpinz","dative-definite-genitive-singular":"felpinzului","dative-genitive-indefinite-plural":"felpinzuri","dative-definite-genitive-plural":"felpinzurilor","singular-vocative":"felpinzule","plural-vocative":"felpinzurilor"}},{"word":"felucă","pos":"noun","definitions":["felucca"],"forms":{"plural":"feluci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"felucă","accusative-definite-nominative-singular":"feluca","accusative-indefinite-nominative-plural":"feluci","accusative-definite-nominative-plural":"felucile","dative-genitive-indefinite-singular":"feluci","dative-definite-genitive-singular":"felucii","dative-genitive-indefinite-plural":"feluci","dative-definite-genitive-plural":"felucilor","singular-vocative":"felucă","plural-vocative":"felucilor"}},{"word":"felul","pos":"noun","definitions":["definite nominative/accusative singular of fel"],"pronunciation":"/ˈfe.lul/"},{"word":"felului","pos":"noun","definitions":["definite dative/genitive singular of fel"]},{"word":"feluri","pos":"verb","definitions":["to differentiate (oneself)"],"pronunciation":"/fe.luˈri/","forms":{"canonical":"a feluri 4th conjugation","present-singular-third-person":"felurește","participle-past":"felurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a feluri","gerund":"felurind","first-person-indicative-present-singular":"feluresc","indicative-present-second-person-singular":"felurești","indicative-present-singular-third-person":"felurește","first-person-indicative-plural-present":"felurim","indicative-plural-present-second-person":"feluriți","indicative-plural-present-third-person":"feluresc","first-person-imperfect-indicative-singular":"feluream","imperfect-indicative-second-person-singular":"felureai","imperfect-indicative-singular-third-person":"felurea","first-person-imperfect-indicative-plural":"feluream","imperfect-indicative-plural-second-person":"felureați","imperfect-indicative-plural-third-person":"felureau","first-person-indicative-perfect-singular":"felurii","indicative-perfect-second-person-singular":"feluriși","indicative-perfect-singular-third-person":"feluri","first-person-indicative-perfect-plural":"felurirăm","indicative-perfect-plural-second-person":"felurirăți","indicative-perfect-plural-third-person":"feluriră","first-person-indicative-pluperfect-singular":"felurisem","indicative-pluperfect-second-person-singular":"feluriseși","indicative-pluperfect-singular-third-person":"felurise","first-person-indicative-pluperfect-plural":"feluriserăm","indicative-pluperfect-plural-second-person":"feluriserăți","indicative-pluperfect-plural-third-person":"feluriseră","first-person-present-singular-subjunctive":"să feluresc","present-second-person-singular-subjunctive":"să felurești","present-singular-subjunctive-third-person":"să felurească","first-person-plural-present-subjunctive":"să felurim","plural-present-second-person-subjunctive":"să feluriți","plural-present-subjunctive-third-person":"să felurească","imperative-second-person-singular":"felurește","imperative-plural-second-person":"feluriți","imperative-negative-second-person-singular":"nu feluri","imperative-negative-plural-second-person":"nu feluriți"}},{"word":"feluri","pos":"noun","definitions":["plural of fel"],"pronunciation":"/ˈfe.lurʲ/"},{"word":"felurile","pos":"noun","definitions":["definite nominative/accusative plural of fel"]},{"word":"felurilor","pos":"noun","definitions":["inflection of fel:","definite genitive/dative plural","vocative plural"]},{"word":"felurime","pos":"noun","definitions":["variety, diversity"],"forms":{"plural":"felurimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"felurime","accusative-definite-nominative-singular":"felurimea","accusative-indefinite-nominative-plural":"felurimi","accusative-definite-nominative-plural":"felurimile","dative-genitive-indefinite-singular":"felurimi","dative-definite-genitive-singular":"felurimii","dative-genitive-indefinite-plural":"felurimi","dative-definite-genitive-plural":"felurimilor","singular-vocative":"felurime","plural-vocative":"felurimilor"}},{"word":"felurit","pos":"adj","definitions":["various, different"],"pronunciation":"/fe.luˈrit/","forms":{"feminine-singular":"felurită","masculine-plural":"feluriți","feminine-neuter-plural":"felurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"felurit","error-unrecognized-form-feminine-indefinite-singular":"felurită","error-unrecognized-form-indefinite-masculine-plural":"feluriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"felurite","definite-error-unrecognized-form-masculine-neuter-singular":"feluritul","definite-error-unrecognized-form-feminine-singular":"felurita","definite-error-unrecognized-form-masculine-plural":"feluriții","definite-error-unrecognized-form-feminine-neuter-plural":"feluritele"}},{"word":"fem.","pos":"adj","definitions":["abbreviation of feminin"]},{"word":"femei","pos":"noun","definitions":["inflection of femeie:","plural","genitive/dative singular"],"pronunciation":"/fe.ˈmej/"},{"word":"femeia","pos":"noun","definitions":["definite nominative/accusative singular of femeie"],"pronunciation":"/feˈme.ja/"},{"word":"femeiască","pos":"adj","definitions":["feminine singular of femeiesc"],"pronunciation":"/fe.meˈjas.kə/","gender":"f"},{"word":"femeie","pos":"noun","definitions":["woman","married woman, wife","family"],"pronunciation":"[fe.ˈme.je]","examples":[{"ro":"Lot, ieși cu muiarea ta și cu fămeaia ta afară din cetate.","en":"Lot, exit with your wife and your family outside the city."}],"forms":{"plural":"femei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"femeie","accusative-definite-nominative-singular":"femeia","accusative-indefinite-nominative-plural":"femei","accusative-definite-nominative-plural":"femeile","dative-genitive-indefinite-singular":"femei","dative-definite-genitive-singular":"femeii","dative-genitive-indefinite-plural":"femei","dative-definite-genitive-plural":"femeilor","singular-vocative":"femeie","plural-vocative":"femeilor","alternative-archaic":"fămeaiă","alternative":"fomeie"}},{"word":"femeie de serviciu","pos":"noun","definitions":["janitress"],"forms":{"plural":"femei de serviciu"}},{"word":"femeie publică","pos":"noun","definitions":["public woman"],"forms":{"plural":"femei publice"}},{"word":"femeie transsexuală","pos":"noun","definitions":["trans woman"],"forms":{"plural":"femei transsexuale"}},{"word":"femeiesc","pos":"adj","definitions":["feminine, womanly"],"pronunciation":"/fe.meˈjesk/","forms":{"feminine-singular":"femeiască","plural":"femeiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"femeiesc","error-unrecognized-form-feminine-indefinite-singular":"femeiască","error-unrecognized-form-indefinite-masculine-plural":"femeiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"femeiești","definite-error-unrecognized-form-masculine-neuter-singular":"femeiescul","definite-error-unrecognized-form-feminine-singular":"femeiasca","definite-error-unrecognized-form-masculine-plural":"femeieștii","definite-error-unrecognized-form-feminine-neuter-plural":"femeieștile"}},{"word":"femeiește","pos":"adv","definitions":["in a womanly way; like a woman"],"pronunciation":"[fe.meˈjeʃ.te]"},{"word":"femeiești","pos":"adj","definitions":["plural of femeiesc"],"pronunciation":"/fe.meˈjeʃtʲ/"},{"word":"femeiet","pos":"noun","definitions":["womankind"],"forms":{"plural":"femeieturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"femeiet","accusative-definite-nominative-singular":"femeietul","accusative-indefinite-nominative-plural":"femeieturi","accusative-definite-nominative-plural":"femeieturile","dative-genitive-indefinite-singular":"femeiet","dative-definite-genitive-singular":"femeietului","dative-genitive-indefinite-plural":"femeieturi","dative-definite-genitive-plural":"femeieturilor","singular-vocative":"femeietule","plural-vocative":"femeieturilor"}},{"word":"femeii","pos":"noun","definitions":["definite genitive/dative singular of femeie"],"pronunciation":"/feˈme.ij/"},{"word":"femeile","pos":"noun","definitions":["definite nominative/accusative plural of femeie"],"pronunciation":"[ feˈmej.le ]","examples":[{"ro":"Femeile cu care a vorbit sunt prietenoase.","en":"The women with whom he spoke are friendly."}]},{"word":"femeilor","pos":"noun","definitions":["definite genitive/dative plural of femeie","definite vocative plural of femeie"],"pronunciation":"[ feˈme.i.lor ]","examples":[{"ro":"Fiecare bărbat știe că femeilor le plac florile.","en":"Every man knows that women like flowers."}]},{"word":"femeiușcă","pos":"noun","definitions":["diminutive of femeie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"femeiușcă","accusative-definite-nominative-singular":"femeiușca","accusative-indefinite-nominative-plural":"femeiuște","accusative-definite-nominative-plural":"femeiuștele","dative-genitive-indefinite-singular":"femeiuște","dative-definite-genitive-singular":"femeiuștei","dative-genitive-indefinite-plural":"femeiuște","dative-definite-genitive-plural":"femeiuștelor","singular-vocative":"femeiușcă","plural-vocative":"femeiuștelor"}},{"word":"femeiuță","pos":"noun","definitions":["diminutive of femeie"],"forms":{"plural":"femeiute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"femeiuță","accusative-definite-nominative-singular":"femeiuța","accusative-indefinite-nominative-plural":"femeiute","accusative-definite-nominative-plural":"femeiutele","dative-genitive-indefinite-singular":"femeiute","dative-definite-genitive-singular":"femeiutei","dative-genitive-indefinite-plural":"femeiute","dative-definite-genitive-plural":"femeiutelor","singular-vocative":"femeiuță","plural-vocative":"femeiutelor"}},{"word":"femelă","pos":"noun","definitions":["female"],"pronunciation":"/feˈme.lə/","forms":{"plural":"femele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"femelă","accusative-definite-nominative-singular":"femela","accusative-indefinite-nominative-plural":"femele","accusative-definite-nominative-plural":"femelele","dative-genitive-indefinite-singular":"femele","dative-definite-genitive-singular":"femelei","dative-genitive-indefinite-plural":"femele","dative-definite-genitive-plural":"femelelor","singular-vocative":"femelă","plural-vocative":"femelelor"}},{"word":"femele","pos":"noun","definitions":["plural of femelă"],"pronunciation":"/feˈme.le/"},{"word":"femenin","pos":"adj","definitions":["obsolete form of feminin"],"forms":{"feminine-singular":"femenină","masculine-plural":"femenini","feminine-neuter-plural":"femenine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"femenin","error-unrecognized-form-feminine-indefinite-singular":"femenină","error-unrecognized-form-indefinite-masculine-plural":"femenini","error-unrecognized-form-feminine-indefinite-neuter-plural":"femenine","definite-error-unrecognized-form-masculine-neuter-singular":"femeninul","definite-error-unrecognized-form-feminine-singular":"femenina","definite-error-unrecognized-form-masculine-plural":"femeninii","definite-error-unrecognized-form-feminine-neuter-plural":"femeninele"}},{"word":"feminin","pos":"adj","definitions":["feminine, womanly","feminine"],"pronunciation":"[fe.miˈnin]","forms":{"feminine-singular":"feminină","masculine-plural":"feminini","feminine-neuter-plural":"feminine","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"feminin","error-unrecognized-form-feminine-indefinite-singular":"feminină","error-unrecognized-form-indefinite-masculine-plural":"feminini","error-unrecognized-form-feminine-indefinite-neuter-plural":"feminine","definite-error-unrecognized-form-masculine-neuter-singular":"femininul","definite-error-unrecognized-form-feminine-singular":"feminina","definite-error-unrecognized-form-masculine-plural":"femininii","definite-error-unrecognized-form-feminine-neuter-plural":"femininele"}},{"word":"feminine","pos":"adj","definitions":["feminine/neuter plural nominative/accusative of feminin"],"pronunciation":"/femiˈnine/"},{"word":"feminism","pos":"noun","definitions":["feminism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feminism","accusative-definite-nominative":"feminismul","dative-genitive-indefinite":"feminism","dative-definite-genitive":"feminismului","vocative":"feminismule"}},{"word":"feminist","pos":"noun","definitions":["feminist"],"forms":{"plural":"feminiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feminist","accusative-definite-nominative-singular":"feministul","accusative-indefinite-nominative-plural":"feminiști","accusative-definite-nominative-plural":"feminiștii","dative-genitive-indefinite-singular":"feminist","dative-definite-genitive-singular":"feministului","dative-genitive-indefinite-plural":"feminiști","dative-definite-genitive-plural":"feminiștilor","singular-vocative":"feministule","plural-vocative":"feminiștilor"}},{"word":"feministă","pos":"noun","definitions":["female equivalent of feminist"],"forms":{"plural":"feministe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feministă","accusative-definite-nominative-singular":"feminista","accusative-indefinite-nominative-plural":"feministe","accusative-definite-nominative-plural":"feministele","dative-genitive-indefinite-singular":"feministe","dative-definite-genitive-singular":"feministei","dative-genitive-indefinite-plural":"feministe","dative-definite-genitive-plural":"feministelor","singular-vocative":"feministă","plural-vocative":"feministelor"}},{"word":"feminitate","pos":"noun","definitions":["femininity","womanliness"],"pronunciation":"[fe.mi.niˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"feminitate","accusative-definite-nominative":"feminitatea","dative-genitive-indefinite":"feminități","dative-definite-genitive":"feminității","vocative":"feminitate"}},{"word":"feminiza","pos":"verb","definitions":["to feminize"],"forms":{"canonical":"a feminiza 1st conjugation","present-singular-third-person":"feminizează","participle-past":"feminizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a feminiza","gerund":"feminizând","first-person-indicative-present-singular":"feminizez","indicative-present-second-person-singular":"feminizezi","indicative-present-singular-third-person":"feminizează","first-person-indicative-plural-present":"feminizăm","indicative-plural-present-second-person":"feminizați","indicative-plural-present-third-person":"feminizează","first-person-imperfect-indicative-singular":"feminizam","imperfect-indicative-second-person-singular":"feminizai","imperfect-indicative-singular-third-person":"feminiza","first-person-imperfect-indicative-plural":"feminizam","imperfect-indicative-plural-second-person":"feminizați","imperfect-indicative-plural-third-person":"feminizau","first-person-indicative-perfect-singular":"feminizai","indicative-perfect-second-person-singular":"feminizași","indicative-perfect-singular-third-person":"feminiză","first-person-indicative-perfect-plural":"feminizarăm","indicative-perfect-plural-second-person":"feminizarăți","indicative-perfect-plural-third-person":"feminizară","first-person-indicative-pluperfect-singular":"feminizasem","indicative-pluperfect-second-person-singular":"feminizaseși","indicative-pluperfect-singular-third-person":"feminizase","first-person-indicative-pluperfect-plural":"feminizaserăm","indicative-pluperfect-plural-second-person":"feminizaserăți","indicative-pluperfect-plural-third-person":"feminizaseră","first-person-present-singular-subjunctive":"să feminizez","present-second-person-singular-subjunctive":"să feminizezi","present-singular-subjunctive-third-person":"să feminizeze","first-person-plural-present-subjunctive":"să feminizăm","plural-present-second-person-subjunctive":"să feminizați","plural-present-subjunctive-third-person":"să feminizeze","imperative-second-person-singular":"feminizează","imperative-plural-second-person":"feminizați","imperative-negative-second-person-singular":"nu feminiza","imperative-negative-plural-second-person":"nu feminizați"}},{"word":"feminizare","pos":"noun","definitions":["feminisation"],"forms":{"plural":"feminizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"feminizare","accusative-definite-nominative-singular":"feminizarea","accusative-indefinite-nominative-plural":"feminizări","accusative-definite-nominative-plural":"feminizările","dative-genitive-indefinite-singular":"feminizări","dative-definite-genitive-singular":"feminizării","dative-genitive-indefinite-plural":"feminizări","dative-definite-genitive-plural":"feminizărilor","singular-vocative":"feminizare","plural-vocative":"feminizărilor"}},{"word":"femur","pos":"noun","definitions":["femur"],"forms":{"plural":"femururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"femur","accusative-definite-nominative-singular":"femurul","accusative-indefinite-nominative-plural":"femururi","accusative-definite-nominative-plural":"femururile","dative-genitive-indefinite-singular":"femur","dative-definite-genitive-singular":"femurului","dative-genitive-indefinite-plural":"femururi","dative-definite-genitive-plural":"femururilor","singular-vocative":"femurule","plural-vocative":"femururilor"}},{"word":"femural","pos":"adj","definitions":["femoral"],"forms":{"feminine-singular":"femurală","masculine-plural":"femurali","feminine-neuter-plural":"femurale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"femural","error-unrecognized-form-feminine-indefinite-singular":"femurală","error-unrecognized-form-indefinite-masculine-plural":"femurali","error-unrecognized-form-feminine-indefinite-neuter-plural":"femurale","definite-error-unrecognized-form-masculine-neuter-singular":"femuralul","definite-error-unrecognized-form-feminine-singular":"femurala","definite-error-unrecognized-form-masculine-plural":"femuralii","definite-error-unrecognized-form-feminine-neuter-plural":"femuralele"}},{"word":"fenantren","pos":"noun","definitions":["phenanthrene"],"forms":{"plural":"fenantrene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fenantren","accusative-definite-nominative-singular":"fenantrenul","accusative-indefinite-nominative-plural":"fenantrene","accusative-definite-nominative-plural":"fenantrenele","dative-genitive-indefinite-singular":"fenantren","dative-definite-genitive-singular":"fenantrenului","dative-genitive-indefinite-plural":"fenantrene","dative-definite-genitive-plural":"fenantrenelor","singular-vocative":"fenantrenule","plural-vocative":"fenantrenelor"}},{"word":"fenat","pos":"noun","definitions":["phenate"],"forms":{"plural":"fenați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenat","accusative-definite-nominative-singular":"fenatul","accusative-indefinite-nominative-plural":"fenați","accusative-definite-nominative-plural":"fenații","dative-genitive-indefinite-singular":"fenat","dative-definite-genitive-singular":"fenatului","dative-genitive-indefinite-plural":"fenați","dative-definite-genitive-plural":"fenaților","singular-vocative":"fenatule","plural-vocative":"fenaților"}},{"word":"fenazonă","pos":"noun","definitions":["phenazone"],"forms":{"plural":"fenazone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenazonă","accusative-definite-nominative-singular":"fenazona","accusative-indefinite-nominative-plural":"fenazone","accusative-definite-nominative-plural":"fenazonele","dative-genitive-indefinite-singular":"fenazone","dative-definite-genitive-singular":"fenazonei","dative-genitive-indefinite-plural":"fenazone","dative-definite-genitive-plural":"fenazonelor","singular-vocative":"fenazonă","plural-vocative":"fenazonelor"}},{"word":"feneantism","pos":"noun","definitions":["laziness, idleness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feneantism","accusative-definite-nominative":"feneantismul","dative-genitive-indefinite":"feneantism","dative-definite-genitive":"feneantismului","vocative":"feneantismule"}},{"word":"fenec","pos":"noun","definitions":["fennec"],"forms":{"plural":"feneci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenec","accusative-definite-nominative-singular":"fenecul","accusative-indefinite-nominative-plural":"feneci","accusative-definite-nominative-plural":"fenecii","dative-genitive-indefinite-singular":"fenec","dative-definite-genitive-singular":"fenecului","dative-genitive-indefinite-plural":"feneci","dative-definite-genitive-plural":"fenecilor","singular-vocative":"fenecule","plural-vocative":"fenecilor"}},{"word":"Feneriș","pos":"name","definitions":["a village in Pocola, Bihor County, Romania"],"gender":"m"},{"word":"Feneș","pos":"name","definitions":["a village in Zlatna, Alba County, Romania","a village in Armeniș, Caraș-Severin County, Romania"],"gender":"m"},{"word":"fenestra","pos":"noun","definitions":["fenestra"],"forms":{"plural":"fenestre"}},{"word":"fenestrație","pos":"noun","definitions":["fenestration"],"forms":{"plural":"fenestrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fenestrație","accusative-definite-nominative-singular":"fenestrația","accusative-indefinite-nominative-plural":"fenestrații","accusative-definite-nominative-plural":"fenestrațiile","dative-genitive-indefinite-singular":"fenestrații","dative-definite-genitive-singular":"fenestrației","dative-genitive-indefinite-plural":"fenestrații","dative-definite-genitive-plural":"fenestrațiilor","singular-vocative":"fenestrație","plural-vocative":"fenestrațiilor"}},{"word":"fenhiel","pos":"noun","definitions":["fennel (Foeniculum vulgare)"],"forms":{"plural":"fenhiele","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenhiel","accusative-definite-nominative-singular":"fenhielul","accusative-indefinite-nominative-plural":"fenhiele","accusative-definite-nominative-plural":"fenhielei","dative-genitive-indefinite-singular":"fenhiel","dative-definite-genitive-singular":"fenhielului","dative-genitive-indefinite-plural":"fenhiele","dative-definite-genitive-plural":"fenhielelor","singular-vocative":"fenhielule","plural-vocative":"fenhielelor"}},{"word":"fenian","pos":"noun","definitions":["Fenian"],"forms":{"plural":"fenieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fenian","accusative-definite-nominative-singular":"fenianul","accusative-indefinite-nominative-plural":"fenieni","accusative-definite-nominative-plural":"fenienile","dative-genitive-indefinite-singular":"fenian","dative-definite-genitive-singular":"fenianului","dative-genitive-indefinite-plural":"fenieni","dative-definite-genitive-plural":"fenienilor","singular-vocative":"fenianule","plural-vocative":"fenienilor"}},{"word":"fenianism","pos":"noun","definitions":["Fenianism"],"forms":{"plural":"fenianisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fenianism","accusative-definite-nominative-singular":"fenianismul","accusative-indefinite-nominative-plural":"fenianisme","accusative-definite-nominative-plural":"fenianismele","dative-genitive-indefinite-singular":"fenianism","dative-definite-genitive-singular":"fenianismului","dative-genitive-indefinite-plural":"fenianisme","dative-definite-genitive-plural":"fenianismelor","singular-vocative":"fenianismule","plural-vocative":"fenianismelor"}},{"word":"feniar","pos":"noun","definitions":["common juniper (Juniperus communis)"],"forms":{"plural":"feniari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feniar","accusative-definite-nominative-singular":"feniarul","accusative-indefinite-nominative-plural":"feniari","accusative-definite-nominative-plural":"feniarii","dative-genitive-indefinite-singular":"feniar","dative-definite-genitive-singular":"feniarului","dative-genitive-indefinite-plural":"feniari","dative-definite-genitive-plural":"feniarilor","singular-vocative":"feniarule","plural-vocative":"feniarilor"}},{"word":"fenic","pos":"adj","definitions":["phenolic"],"forms":{"feminine-singular":"fenică","masculine-plural":"fenici","feminine-neuter-plural":"fenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenic","error-unrecognized-form-feminine-indefinite-singular":"fenică","error-unrecognized-form-indefinite-masculine-plural":"fenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenice","definite-error-unrecognized-form-masculine-neuter-singular":"fenicul","definite-error-unrecognized-form-feminine-singular":"fenica","definite-error-unrecognized-form-masculine-plural":"fenicii","definite-error-unrecognized-form-feminine-neuter-plural":"fenicele"}},{"word":"fenice","pos":"noun","definitions":["alternative form of Phoenix"],"forms":{"plural":"fenici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenice","accusative-definite-nominative-singular":"feniceul","accusative-indefinite-nominative-plural":"fenici","accusative-definite-nominative-plural":"fenicii","dative-genitive-indefinite-singular":"fenice","dative-definite-genitive-singular":"feniceului","dative-genitive-indefinite-plural":"fenici","dative-definite-genitive-plural":"fenicilor","singular-vocative":"feniceule","plural-vocative":"fenicilor"}},{"word":"fenicel","pos":"noun","definitions":["diminutive of fenicul"],"forms":{"plural":"feniceli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenicel","accusative-definite-nominative-singular":"fenicelul","accusative-indefinite-nominative-plural":"feniceli","accusative-definite-nominative-plural":"fenicelii","dative-genitive-indefinite-singular":"fenicel","dative-definite-genitive-singular":"fenicelului","dative-genitive-indefinite-plural":"feniceli","dative-definite-genitive-plural":"fenicelilor","singular-vocative":"fenicelule","plural-vocative":"fenicelilor"}},{"word":"Fenicia","pos":"name","definitions":["Phoenicia"],"gender":"f"},{"word":"fenician","pos":"noun","definitions":["Phoenician"],"forms":{"plural":"fenicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenician","accusative-definite-nominative-singular":"fenicianul","accusative-indefinite-nominative-plural":"fenicieni","accusative-definite-nominative-plural":"fenicienii","dative-genitive-indefinite-singular":"fenician","dative-definite-genitive-singular":"fenicianului","dative-genitive-indefinite-plural":"fenicieni","dative-definite-genitive-plural":"fenicienilor","singular-vocative":"fenicianule","plural-vocative":"fenicienilor"}},{"word":"feniciană","pos":"noun","definitions":["female equivalent of fenician"],"forms":{"plural":"feniciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feniciană","accusative-definite-nominative-singular":"feniciana","accusative-indefinite-nominative-plural":"feniciene","accusative-definite-nominative-plural":"fenicienele","dative-genitive-indefinite-singular":"feniciene","dative-definite-genitive-singular":"fenicienei","dative-genitive-indefinite-plural":"feniciene","dative-definite-genitive-plural":"fenicienelor","singular-vocative":"feniciană","plural-vocative":"fenicienelor"}},{"word":"fenicși","pos":"noun","definitions":["plural of fenix"],"gender":"m-p"},{"word":"fenicul","pos":"noun","definitions":["fennel"],"forms":{"plural":"feniculi"}},{"word":"fenil","pos":"noun","definitions":["phenyl"],"forms":{"plural":"fenili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenil","accusative-definite-nominative-singular":"fenilul","accusative-indefinite-nominative-plural":"fenili","accusative-definite-nominative-plural":"fenilii","dative-genitive-indefinite-singular":"fenil","dative-definite-genitive-singular":"fenilului","dative-genitive-indefinite-plural":"fenili","dative-definite-genitive-plural":"fenililor","singular-vocative":"fenilule","plural-vocative":"fenililor"}},{"word":"fenilalanină","pos":"noun","definitions":["phenylalanine"],"forms":{"plural":"fenilalanine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenilalanină","accusative-definite-nominative-singular":"fenilalanina","accusative-indefinite-nominative-plural":"fenilalanine","accusative-definite-nominative-plural":"fenilalaninele","dative-genitive-indefinite-singular":"fenilalanine","dative-definite-genitive-singular":"fenilalaninei","dative-genitive-indefinite-plural":"fenilalanine","dative-definite-genitive-plural":"fenilalaninelor","singular-vocative":"fenilalanină","plural-vocative":"fenilalaninelor"}},{"word":"fenilamină","pos":"noun","definitions":["phenylamine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenilamină","accusative-definite-nominative-singular":"fenilamina","accusative-indefinite-nominative-plural":"fenilamine","accusative-definite-nominative-plural":"fenilaminele","dative-genitive-indefinite-singular":"fenilamine","dative-definite-genitive-singular":"fenilaminei","dative-genitive-indefinite-plural":"fenilamine","dative-definite-genitive-plural":"fenilaminelor","singular-vocative":"fenilamină","plural-vocative":"fenilaminelor"}},{"word":"fenilbutazonă","pos":"noun","definitions":["phenylbutazone"],"forms":{"plural":"fenilbutazone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenilbutazonă","accusative-definite-nominative-singular":"fenilbutazona","accusative-indefinite-nominative-plural":"fenilbutazone","accusative-definite-nominative-plural":"fenilbutazonele","dative-genitive-indefinite-singular":"fenilbutazone","dative-definite-genitive-singular":"fenilbutazonei","dative-genitive-indefinite-plural":"fenilbutazone","dative-definite-genitive-plural":"fenilbutazonelor","singular-vocative":"fenilbutazonă","plural-vocative":"fenilbutazonelor"}},{"word":"fenilen","pos":"noun","definitions":["phenylene"],"forms":{"plural":"fenilene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fenilen","accusative-definite-nominative-singular":"fenilenul","accusative-indefinite-nominative-plural":"fenilene","accusative-definite-nominative-plural":"fenilenele","dative-genitive-indefinite-singular":"fenilen","dative-definite-genitive-singular":"fenilenului","dative-genitive-indefinite-plural":"fenilene","dative-definite-genitive-plural":"fenilenelor","singular-vocative":"fenilenule","plural-vocative":"fenilenelor"}},{"word":"Feniș","pos":"name","definitions":["a village in Gurahonț, Arad County, Romania"],"gender":"m"},{"word":"fenix","pos":"noun","definitions":["phoenix (mythical bird)"],"forms":{"plural":"fenicși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenix","accusative-definite-nominative-singular":"fenixul","accusative-indefinite-nominative-plural":"fenicși","accusative-definite-nominative-plural":"fenicșii","dative-genitive-indefinite-singular":"fenix","dative-definite-genitive-singular":"fenixului","dative-genitive-indefinite-plural":"fenicși","dative-definite-genitive-plural":"fenicșilor","singular-vocative":"fenixule","plural-vocative":"fenicșilor"}},{"word":"fenobarbital","pos":"noun","definitions":["phenobarbital"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fenobarbital","accusative-definite-nominative":"fenobarbitalul","dative-genitive-indefinite":"fenobarbital","dative-definite-genitive":"fenobarbitalului","vocative":"fenobarbitalule"}},{"word":"fenofază","pos":"noun","definitions":["phenophase"],"forms":{"plural":"fenofaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenofază","accusative-definite-nominative-singular":"fenofaza","accusative-indefinite-nominative-plural":"fenofaze","accusative-definite-nominative-plural":"fenofazele","dative-genitive-indefinite-singular":"fenofaze","dative-definite-genitive-singular":"fenofazei","dative-genitive-indefinite-plural":"fenofaze","dative-definite-genitive-plural":"fenofazelor","singular-vocative":"fenofază","plural-vocative":"fenofazelor"}},{"word":"fenol","pos":"noun","definitions":["phenol"],"forms":{"plural":"fenoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenol","accusative-definite-nominative-singular":"fenolul","accusative-indefinite-nominative-plural":"fenoli","accusative-definite-nominative-plural":"fenolii","dative-genitive-indefinite-singular":"fenol","dative-definite-genitive-singular":"fenolului","dative-genitive-indefinite-plural":"fenoli","dative-definite-genitive-plural":"fenolilor","singular-vocative":"fenolule","plural-vocative":"fenolilor"}},{"word":"fenolat","pos":"noun","definitions":["phenolate"],"forms":{"plural":"fenolați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenolat","accusative-definite-nominative-singular":"fenolatul","accusative-indefinite-nominative-plural":"fenolați","accusative-definite-nominative-plural":"fenolații","dative-genitive-indefinite-singular":"fenolat","dative-definite-genitive-singular":"fenolatului","dative-genitive-indefinite-plural":"fenolați","dative-definite-genitive-plural":"fenolaților","singular-vocative":"fenolatule","plural-vocative":"fenolaților"}},{"word":"fenolftaleină","pos":"noun","definitions":["phenolphthalein"],"forms":{"plural":"fenolftaleine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenolftaleină","accusative-definite-nominative-singular":"fenolftaleina","accusative-indefinite-nominative-plural":"fenolftaleine","accusative-definite-nominative-plural":"fenolftaleinele","dative-genitive-indefinite-singular":"fenolftaleine","dative-definite-genitive-singular":"fenolftaleinei","dative-genitive-indefinite-plural":"fenolftaleine","dative-definite-genitive-plural":"fenolftaleinelor","singular-vocative":"fenolftaleină","plural-vocative":"fenolftaleinelor"}},{"word":"fenolic","pos":"adj","definitions":["phenolic"],"forms":{"feminine-singular":"fenolică","masculine-plural":"fenolici","feminine-neuter-plural":"fenolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenolic","error-unrecognized-form-feminine-indefinite-singular":"fenolică","error-unrecognized-form-indefinite-masculine-plural":"fenolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenolice","definite-error-unrecognized-form-masculine-neuter-singular":"fenolicul","definite-error-unrecognized-form-feminine-singular":"fenolica","definite-error-unrecognized-form-masculine-plural":"fenolicii","definite-error-unrecognized-form-feminine-neuter-plural":"fenolicele"}},{"word":"fenologic","pos":"adj","definitions":["phenological"],"forms":{"feminine-singular":"fenologică","masculine-plural":"fenologici","feminine-neuter-plural":"fenologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenologic","error-unrecognized-form-feminine-indefinite-singular":"fenologică","error-unrecognized-form-indefinite-masculine-plural":"fenologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenologice","definite-error-unrecognized-form-masculine-neuter-singular":"fenologicul","definite-error-unrecognized-form-feminine-singular":"fenologica","definite-error-unrecognized-form-masculine-plural":"fenologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fenologicele"}},{"word":"fenologie","pos":"noun","definitions":["phenology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fenologie","accusative-definite-nominative":"fenologia","dative-genitive-indefinite":"fenologii","dative-definite-genitive":"fenologiei","vocative":"fenologie"}},{"word":"fenomen","pos":"noun","definitions":["phenomenon"],"forms":{"plural":"fenomene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fenomen","accusative-definite-nominative-singular":"fenomenul","accusative-indefinite-nominative-plural":"fenomene","accusative-definite-nominative-plural":"fenomenele","dative-genitive-indefinite-singular":"fenomen","dative-definite-genitive-singular":"fenomenului","dative-genitive-indefinite-plural":"fenomene","dative-definite-genitive-plural":"fenomenelor","singular-vocative":"fenomenule","plural-vocative":"fenomenelor"}},{"word":"fenomenal","pos":"adj","definitions":["phenomenal"],"forms":{"feminine-singular":"fenomenală","masculine-plural":"fenomenali","feminine-neuter-plural":"fenomenale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenomenal","error-unrecognized-form-feminine-indefinite-singular":"fenomenală","error-unrecognized-form-indefinite-masculine-plural":"fenomenali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenomenale","definite-error-unrecognized-form-masculine-neuter-singular":"fenomenalul","definite-error-unrecognized-form-feminine-singular":"fenomenala","definite-error-unrecognized-form-masculine-plural":"fenomenalii","definite-error-unrecognized-form-feminine-neuter-plural":"fenomenalele"}},{"word":"fenomenalism","pos":"noun","definitions":["phenomenalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fenomenalism","accusative-definite-nominative":"fenomenalismul","dative-genitive-indefinite":"fenomenalism","dative-definite-genitive":"fenomenalismului","vocative":"fenomenalismule"}},{"word":"fenomenalist","pos":"adj","definitions":["phenomenalist"],"forms":{"feminine-singular":"fenomenalistă","masculine-plural":"fenomenaliști","feminine-neuter-plural":"fenomenaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenomenalist","error-unrecognized-form-feminine-indefinite-singular":"fenomenalistă","error-unrecognized-form-indefinite-masculine-plural":"fenomenaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenomenaliste","definite-error-unrecognized-form-masculine-neuter-singular":"fenomenalistul","definite-error-unrecognized-form-feminine-singular":"fenomenalista","definite-error-unrecognized-form-masculine-plural":"fenomenaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"fenomenalistele"}},{"word":"fenomenalist","pos":"noun","definitions":["phenomenalist"],"forms":{"plural":"fenomenaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenomenalist","accusative-definite-nominative-singular":"fenomenalistul","accusative-indefinite-nominative-plural":"fenomenaliști","accusative-definite-nominative-plural":"fenomenaliștii","dative-genitive-indefinite-singular":"fenomenalist","dative-definite-genitive-singular":"fenomenalistului","dative-genitive-indefinite-plural":"fenomenaliști","dative-definite-genitive-plural":"fenomenaliștilor","singular-vocative":"fenomenalistule","plural-vocative":"fenomenaliștilor"}},{"word":"fenomenalistă","pos":"noun","definitions":["female equivalent of fenomenalist"],"forms":{"plural":"fenomenaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenomenalistă","accusative-definite-nominative-singular":"fenomenalista","accusative-indefinite-nominative-plural":"fenomenaliste","accusative-definite-nominative-plural":"fenomenalistele","dative-genitive-indefinite-singular":"fenomenaliste","dative-definite-genitive-singular":"fenomenalistei","dative-genitive-indefinite-plural":"fenomenaliste","dative-definite-genitive-plural":"fenomenalistelor","singular-vocative":"fenomenalistă","plural-vocative":"fenomenalistelor"}},{"word":"fenomenalitate","pos":"noun","definitions":["phenomenality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fenomenalitate","accusative-definite-nominative-singular":"fenomenalitatea","accusative-indefinite-nominative-plural":"fenomenalități","accusative-definite-nominative-plural":"fenomenalitățile","dative-genitive-indefinite-singular":"fenomenalități","dative-definite-genitive-singular":"fenomenalității","dative-genitive-indefinite-plural":"fenomenalități","dative-definite-genitive-plural":"fenomenalităților","singular-vocative":"fenomenalitate","plural-vocative":"fenomenalităților"}},{"word":"fenomenism","pos":"noun","definitions":["phenomenalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fenomenism","accusative-definite-nominative":"fenomenismul","dative-genitive-indefinite":"fenomenism","dative-definite-genitive":"fenomenismului","vocative":"fenomenismule"}},{"word":"fenomenolog","pos":"noun","definitions":["phenomenologist"],"forms":{"plural":"fenomenologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fenomenolog","accusative-definite-nominative-singular":"fenomenologul","accusative-indefinite-nominative-plural":"fenomenologi","accusative-definite-nominative-plural":"fenomenologii","dative-genitive-indefinite-singular":"fenomenolog","dative-definite-genitive-singular":"fenomenologului","dative-genitive-indefinite-plural":"fenomenologi","dative-definite-genitive-plural":"fenomenologilor","singular-vocative":"fenomenologule","plural-vocative":"fenomenologilor"}},{"word":"fenomenologic","pos":"adj","definitions":["phenomenological"],"forms":{"feminine-singular":"fenomenologică","masculine-plural":"fenomenologici","feminine-neuter-plural":"fenomenologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenomenologic","error-unrecognized-form-feminine-indefinite-singular":"fenomenologică","error-unrecognized-form-indefinite-masculine-plural":"fenomenologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenomenologice","definite-error-unrecognized-form-masculine-neuter-singular":"fenomenologicul","definite-error-unrecognized-form-feminine-singular":"fenomenologica","definite-error-unrecognized-form-masculine-plural":"fenomenologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fenomenologicele"}},{"word":"fenomenologie","pos":"noun","definitions":["phenomenology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fenomenologie","accusative-definite-nominative":"fenomenologia","dative-genitive-indefinite":"fenomenologii","dative-definite-genitive":"fenomenologiei","vocative":"fenomenologie"}},{"word":"fenoplastă","pos":"noun","definitions":["phenoplast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fenoplastă","accusative-definite-nominative":"fenoplasta","dative-genitive-indefinite":"fenoplaste","dative-definite-genitive":"fenoplastei","vocative":"fenoplastă"}},{"word":"fenotiazină","pos":"noun","definitions":["phenothiazine"],"forms":{"plural":"fenotiazine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fenotiazină","accusative-definite-nominative-singular":"fenotiazina","accusative-indefinite-nominative-plural":"fenotiazine","accusative-definite-nominative-plural":"fenotiazinele","dative-genitive-indefinite-singular":"fenotiazine","dative-definite-genitive-singular":"fenotiazinei","dative-genitive-indefinite-plural":"fenotiazine","dative-definite-genitive-plural":"fenotiazinelor","singular-vocative":"fenotiazină","plural-vocative":"fenotiazinelor"}},{"word":"fenotip","pos":"noun","definitions":["phenotype"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fenotip","accusative-definite-nominative":"fenotipul","dative-genitive-indefinite":"fenotip","dative-definite-genitive":"fenotipului","vocative":"fenotipule"}},{"word":"fenotipic","pos":"adj","definitions":["phenotypical"],"forms":{"feminine-singular":"fenotipică","masculine-plural":"fenotipici","feminine-neuter-plural":"fenotipice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fenotipic","error-unrecognized-form-feminine-indefinite-singular":"fenotipică","error-unrecognized-form-indefinite-masculine-plural":"fenotipici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fenotipice","definite-error-unrecognized-form-masculine-neuter-singular":"fenotipicul","definite-error-unrecognized-form-feminine-singular":"fenotipica","definite-error-unrecognized-form-masculine-plural":"fenotipicii","definite-error-unrecognized-form-feminine-neuter-plural":"fenotipicele"}},{"word":"fenta","pos":"verb","definitions":["to feint"],"forms":{"canonical":"a fenta 1st conjugation","present-singular-third-person":"fentează","participle-past":"fentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fenta","gerund":"fentând","first-person-indicative-present-singular":"fentez","indicative-present-second-person-singular":"fentezi","indicative-present-singular-third-person":"fentează","first-person-indicative-plural-present":"fentăm","indicative-plural-present-second-person":"fentați","indicative-plural-present-third-person":"fentează","first-person-imperfect-indicative-singular":"fentam","imperfect-indicative-second-person-singular":"fentai","imperfect-indicative-singular-third-person":"fenta","first-person-imperfect-indicative-plural":"fentam","imperfect-indicative-plural-second-person":"fentați","imperfect-indicative-plural-third-person":"fentau","first-person-indicative-perfect-singular":"fentai","indicative-perfect-second-person-singular":"fentași","indicative-perfect-singular-third-person":"fentă","first-person-indicative-perfect-plural":"fentarăm","indicative-perfect-plural-second-person":"fentarăți","indicative-perfect-plural-third-person":"fentară","first-person-indicative-pluperfect-singular":"fentasem","indicative-pluperfect-second-person-singular":"fentaseși","indicative-pluperfect-singular-third-person":"fentase","first-person-indicative-pluperfect-plural":"fentaserăm","indicative-pluperfect-plural-second-person":"fentaserăți","indicative-pluperfect-plural-third-person":"fentaseră","first-person-present-singular-subjunctive":"să fentez","present-second-person-singular-subjunctive":"să fentezi","present-singular-subjunctive-third-person":"să fenteze","first-person-plural-present-subjunctive":"să fentăm","plural-present-second-person-subjunctive":"să fentați","plural-present-subjunctive-third-person":"să fenteze","imperative-second-person-singular":"fentează","imperative-plural-second-person":"fentați","imperative-negative-second-person-singular":"nu fenta","imperative-negative-plural-second-person":"nu fentați"}},{"word":"fentă","pos":"noun","definitions":["feint","fraud, swindle"],"forms":{"plural":"fente","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fentă","accusative-definite-nominative-singular":"fenta","accusative-indefinite-nominative-plural":"fente","accusative-definite-nominative-plural":"fentele","dative-genitive-indefinite-singular":"fente","dative-definite-genitive-singular":"fentei","dative-genitive-indefinite-plural":"fente","dative-definite-genitive-plural":"fentelor","singular-vocative":"fentă","plural-vocative":"fentelor"}},{"word":"feodal","pos":"adj","definitions":["obsolete form of feudal"],"forms":{"feminine-singular":"feodală","masculine-plural":"feodali","feminine-neuter-plural":"feodale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feodal","error-unrecognized-form-feminine-indefinite-singular":"feodală","error-unrecognized-form-indefinite-masculine-plural":"feodali","error-unrecognized-form-feminine-indefinite-neuter-plural":"feodale","definite-error-unrecognized-form-masculine-neuter-singular":"feodalul","definite-error-unrecognized-form-feminine-singular":"feodala","definite-error-unrecognized-form-masculine-plural":"feodalii","definite-error-unrecognized-form-feminine-neuter-plural":"feodalele"}},{"word":"fer","pos":"noun","definitions":["alternative form of fier"],"forms":{"plural":"feare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fer","accusative-definite-nominative-singular":"ferul","accusative-indefinite-nominative-plural":"feare","accusative-definite-nominative-plural":"fearele","dative-genitive-indefinite-singular":"fer","dative-definite-genitive-singular":"ferului","dative-genitive-indefinite-plural":"feare","dative-definite-genitive-plural":"fearelor","singular-vocative":"ferule","plural-vocative":"fearelor"}},{"word":"feraluminiu","pos":"noun","definitions":["alternative form of feroaluminiu"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feraluminiu","accusative-definite-nominative":"feraluminiuul","dative-genitive-indefinite":"feraluminiu","dative-definite-genitive":"feraluminiuului","vocative":"feraluminiuule"}},{"word":"Ferapontievca","pos":"name","definitions":["a village in Ferapontievca, Gagauzia, Moldova","a commune of Gagauzia, Moldova"],"gender":"f"},{"word":"Ferariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ferariu"}},{"word":"Feraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Feraru"}},{"word":"ferăstrăiaș","pos":"noun","definitions":["diminutive of ferăstrău"],"forms":{"plural":"ferăstrăiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ferăstrăiaș","accusative-definite-nominative-singular":"ferăstrăiașul","accusative-indefinite-nominative-plural":"ferăstrăiași","accusative-definite-nominative-plural":"ferăstrăiașii","dative-genitive-indefinite-singular":"ferăstrăiaș","dative-definite-genitive-singular":"ferăstrăiașului","dative-genitive-indefinite-plural":"ferăstrăiași","dative-definite-genitive-plural":"ferăstrăiașilor","singular-vocative":"ferăstrăiașule","plural-vocative":"ferăstrăiașilor"}},{"word":"Ferăstrău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ferăstrău"}},{"word":"ferăstrău","pos":"noun","definitions":["saw"],"forms":{"plural":"ferăstraie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ferăstrău","accusative-definite-nominative-singular":"ferăstrăul","accusative-indefinite-nominative-plural":"ferăstraie","accusative-definite-nominative-plural":"ferăstraiele","dative-genitive-indefinite-singular":"ferăstrău","dative-definite-genitive-singular":"ferăstrăului","dative-genitive-indefinite-plural":"ferăstraie","dative-definite-genitive-plural":"ferăstraielor","singular-vocative":"ferăstrăule","plural-vocative":"ferăstraielor","alternative":"fierăstrău"}},{"word":"ferăstrău circular","pos":"noun","definitions":["circular saw"],"forms":{"plural":"ferăstraie circulare"}},{"word":"ferăstrui","pos":"verb","definitions":["alternative form of fierăstrui"],"forms":{"canonical":"a ferăstrui 4th conjugation","present-singular-third-person":"ferăstruiește","participle-past":"ferăstruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ferăstrui","gerund":"ferăstruind","first-person-indicative-present-singular":"ferăstruiesc","indicative-present-second-person-singular":"ferăstruiești","indicative-present-singular-third-person":"ferăstruiește","first-person-indicative-plural-present":"ferăstruim","indicative-plural-present-second-person":"ferăstruiți","indicative-plural-present-third-person":"ferăstruiesc","first-person-imperfect-indicative-singular":"ferăstruiam","imperfect-indicative-second-person-singular":"ferăstruiai","imperfect-indicative-singular-third-person":"ferăstruia","first-person-imperfect-indicative-plural":"ferăstruiam","imperfect-indicative-plural-second-person":"ferăstruiați","imperfect-indicative-plural-third-person":"ferăstruiau","first-person-indicative-perfect-singular":"ferăstruii","indicative-perfect-second-person-singular":"ferăstruiși","indicative-perfect-singular-third-person":"ferăstrui","first-person-indicative-perfect-plural":"ferăstruirăm","indicative-perfect-plural-second-person":"ferăstruirăți","indicative-perfect-plural-third-person":"ferăstruiră","first-person-indicative-pluperfect-singular":"ferăstruisem","indicative-pluperfect-second-person-singular":"ferăstruiseși","indicative-pluperfect-singular-third-person":"ferăstruise","first-person-indicative-pluperfect-plural":"ferăstruiserăm","indicative-pluperfect-plural-second-person":"ferăstruiserăți","indicative-pluperfect-plural-third-person":"ferăstruiseră","first-person-present-singular-subjunctive":"să ferăstruiesc","present-second-person-singular-subjunctive":"să ferăstruiești","present-singular-subjunctive-third-person":"să ferăstruiască","first-person-plural-present-subjunctive":"să ferăstruim","plural-present-second-person-subjunctive":"să ferăstruiți","plural-present-subjunctive-third-person":"să ferăstruiască","imperative-second-person-singular":"ferăstruiește","imperative-plural-second-person":"ferăstruiți","imperative-negative-second-person-singular":"nu ferăstrui","imperative-negative-plural-second-person":"nu ferăstruiți"}},{"word":"ferăstruie","pos":"noun","definitions":["alternative form of ferestruie"],"forms":{"plural":"ferăstrui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"ferăstruie","accusative-definite-nominative-singular":"ferăstruia","accusative-indefinite-nominative-plural":"ferăstrui","accusative-definite-nominative-plural":"ferăstruile","dative-genitive-indefinite-singular":"ferăstrui","dative-definite-genitive-singular":"ferăstruii","dative-genitive-indefinite-plural":"ferăstrui","dative-definite-genitive-plural":"ferăstruilor","singular-vocative":"ferăstruie","plural-vocative":"ferăstruilor"}},{"word":"ferăstruire","pos":"noun","definitions":["alternative form of fierăstruire"],"forms":{"plural":"ferăstruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ferăstruire","accusative-definite-nominative-singular":"ferăstruirea","accusative-indefinite-nominative-plural":"ferăstruiri","accusative-definite-nominative-plural":"ferăstruirile","dative-genitive-indefinite-singular":"ferăstruiri","dative-definite-genitive-singular":"ferăstruirii","dative-genitive-indefinite-plural":"ferăstruiri","dative-definite-genitive-plural":"ferăstruirilor","singular-vocative":"ferăstruire","plural-vocative":"ferăstruirilor"}},{"word":"ferăstruit","pos":"adj","definitions":["alternative form of ferestruit"],"forms":{"feminine-singular":"ferăstruită","masculine-plural":"ferăstruiți","feminine-neuter-plural":"ferăstruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferăstruit","error-unrecognized-form-feminine-indefinite-singular":"ferăstruită","error-unrecognized-form-indefinite-masculine-plural":"ferăstruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferăstruite","definite-error-unrecognized-form-masculine-neuter-singular":"ferăstruitul","definite-error-unrecognized-form-feminine-singular":"ferăstruita","definite-error-unrecognized-form-masculine-plural":"ferăstruiții","definite-error-unrecognized-form-feminine-neuter-plural":"ferăstruitele"}},{"word":"ferat","pos":"noun","definitions":["ferrate"],"forms":{"plural":"ferați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ferat","accusative-definite-nominative-singular":"feratul","accusative-indefinite-nominative-plural":"ferați","accusative-definite-nominative-plural":"ferații","dative-genitive-indefinite-singular":"ferat","dative-definite-genitive-singular":"feratului","dative-genitive-indefinite-plural":"ferați","dative-definite-genitive-plural":"feraților","singular-vocative":"feratule","plural-vocative":"feraților"}},{"word":"ferber","pos":"noun","definitions":["a card game"],"forms":{"plural":"ferbere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ferber","accusative-definite-nominative-singular":"ferberul","accusative-indefinite-nominative-plural":"ferbere","accusative-definite-nominative-plural":"ferberele","dative-genitive-indefinite-singular":"ferber","dative-definite-genitive-singular":"ferberului","dative-genitive-indefinite-plural":"ferbere","dative-definite-genitive-plural":"ferberelor","singular-vocative":"ferberule","plural-vocative":"ferberelor"}},{"word":"ferbințeală","pos":"noun","definitions":["obsolete form of fierbințeală"],"forms":{"plural":"ferbințeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferbințeală","accusative-definite-nominative-singular":"ferbințeala","accusative-indefinite-nominative-plural":"ferbințele","accusative-definite-nominative-plural":"ferbințelele","dative-genitive-indefinite-singular":"ferbințele","dative-definite-genitive-singular":"ferbințelei","dative-genitive-indefinite-plural":"ferbințele","dative-definite-genitive-plural":"ferbințelelor","singular-vocative":"ferbințeală","plural-vocative":"ferbințelelor"}},{"word":"fercheș","pos":"adj","definitions":["dapper"],"forms":{"feminine-singular":"fercheșă","masculine-plural":"fercheși","feminine-neuter-plural":"fercheșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fercheș","error-unrecognized-form-feminine-indefinite-singular":"fercheșă","error-unrecognized-form-indefinite-masculine-plural":"fercheși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fercheșe","definite-error-unrecognized-form-masculine-neuter-singular":"fercheșul","definite-error-unrecognized-form-feminine-singular":"fercheșa","definite-error-unrecognized-form-masculine-plural":"fercheșii","definite-error-unrecognized-form-feminine-neuter-plural":"fercheșele"}},{"word":"ferchezui","pos":"verb","definitions":["to dress up"],"forms":{"canonical":"a ferchezui 4th conjugation","present-singular-third-person":"ferchezuiește","participle-past":"ferchezuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ferchezui","gerund":"ferchezuind","first-person-indicative-present-singular":"ferchezuiesc","indicative-present-second-person-singular":"ferchezuiești","indicative-present-singular-third-person":"ferchezuiește","first-person-indicative-plural-present":"ferchezuim","indicative-plural-present-second-person":"ferchezuiți","indicative-plural-present-third-person":"ferchezuiesc","first-person-imperfect-indicative-singular":"ferchezuiam","imperfect-indicative-second-person-singular":"ferchezuiai","imperfect-indicative-singular-third-person":"ferchezuia","first-person-imperfect-indicative-plural":"ferchezuiam","imperfect-indicative-plural-second-person":"ferchezuiați","imperfect-indicative-plural-third-person":"ferchezuiau","first-person-indicative-perfect-singular":"ferchezuii","indicative-perfect-second-person-singular":"ferchezuiși","indicative-perfect-singular-third-person":"ferchezui","first-person-indicative-perfect-plural":"ferchezuirăm","indicative-perfect-plural-second-person":"ferchezuirăți","indicative-perfect-plural-third-person":"ferchezuiră","first-person-indicative-pluperfect-singular":"ferchezuisem","indicative-pluperfect-second-person-singular":"ferchezuiseși","indicative-pluperfect-singular-third-person":"ferchezuise","first-person-indicative-pluperfect-plural":"ferchezuiserăm","indicative-pluperfect-plural-second-person":"ferchezuiserăți","indicative-pluperfect-plural-third-person":"ferchezuiseră","first-person-present-singular-subjunctive":"să ferchezuiesc","present-second-person-singular-subjunctive":"să ferchezuiești","present-singular-subjunctive-third-person":"să ferchezuiască","first-person-plural-present-subjunctive":"să ferchezuim","plural-present-second-person-subjunctive":"să ferchezuiți","plural-present-subjunctive-third-person":"să ferchezuiască","imperative-second-person-singular":"ferchezuiește","imperative-plural-second-person":"ferchezuiți","imperative-negative-second-person-singular":"nu ferchezui","imperative-negative-plural-second-person":"nu ferchezuiți"}},{"word":"ferchezuială","pos":"noun","definitions":["dressing up"],"forms":{"plural":"ferchezuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferchezuială","accusative-definite-nominative-singular":"ferchezuiala","accusative-indefinite-nominative-plural":"ferchezuiele","accusative-definite-nominative-plural":"ferchezuielele","dative-genitive-indefinite-singular":"ferchezuiele","dative-definite-genitive-singular":"ferchezuielei","dative-genitive-indefinite-plural":"ferchezuiele","dative-definite-genitive-plural":"ferchezuielelor","singular-vocative":"ferchezuială","plural-vocative":"ferchezuielelor"}},{"word":"ferchezuit","pos":"adj","definitions":["elegant"],"forms":{"feminine-singular":"ferchezuită","masculine-plural":"ferchezuiți","feminine-neuter-plural":"ferchezuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferchezuit","error-unrecognized-form-feminine-indefinite-singular":"ferchezuită","error-unrecognized-form-indefinite-masculine-plural":"ferchezuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferchezuite","definite-error-unrecognized-form-masculine-neuter-singular":"ferchezuitul","definite-error-unrecognized-form-feminine-singular":"ferchezuita","definite-error-unrecognized-form-masculine-plural":"ferchezuiții","definite-error-unrecognized-form-feminine-neuter-plural":"ferchezuitele"}},{"word":"ferchezuit","pos":"verb","definitions":["past participle of ferchezui"],"forms":{"participle-past":"of ferchezui"}},{"word":"Fercu","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Fercu"}},{"word":"fereală","pos":"noun","definitions":["caution"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fereală","accusative-definite-nominative":"fereala","dative-genitive-indefinite":"fereale","dative-definite-genitive":"ferealei","vocative":"fereală"}},{"word":"fereastă","pos":"noun","definitions":["obsolete form of fereastră"],"forms":{"plural":"ferești","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fereastă","accusative-definite-nominative-singular":"fereasta","accusative-indefinite-nominative-plural":"ferește","accusative-definite-nominative-plural":"fereștele","dative-genitive-indefinite-singular":"ferește","dative-definite-genitive-singular":"fereștei","dative-genitive-indefinite-plural":"ferește","dative-definite-genitive-plural":"fereștelor","singular-vocative":"fereastă","plural-vocative":"fereștelor"}},{"word":"fereastră","pos":"noun","definitions":["window"],"pronunciation":"/feˈɾe̯as.t̪ɾə/","forms":{"plural":"ferestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fereastră","accusative-definite-nominative-singular":"fereastra","accusative-indefinite-nominative-plural":"ferestre","accusative-definite-nominative-plural":"ferestrele","dative-genitive-indefinite-singular":"ferestre","dative-definite-genitive-singular":"ferestrei","dative-genitive-indefinite-plural":"ferestre","dative-definite-genitive-plural":"ferestrelor","singular-vocative":"fereastră","plural-vocative":"ferestrelor","alternative":"fereastă"}},{"word":"ferec","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fereca"]},{"word":"fereca","pos":"verb","definitions":["to hoop","to chain, fetter","to strengthen by adding metal (such as a wheel)"],"forms":{"canonical":"a fereca 1st conjugation","present-singular-third-person":"ferecă","participle-past":"ferecat","subjunctive-third-person":"ferece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fereca","gerund":"ferecând","first-person-indicative-present-singular":"ferec","indicative-present-second-person-singular":"fereci","indicative-present-singular-third-person":"ferecă","first-person-indicative-plural-present":"ferecăm","indicative-plural-present-second-person":"ferecați","indicative-plural-present-third-person":"ferecă","first-person-imperfect-indicative-singular":"ferecam","imperfect-indicative-second-person-singular":"ferecai","imperfect-indicative-singular-third-person":"fereca","first-person-imperfect-indicative-plural":"ferecam","imperfect-indicative-plural-second-person":"ferecați","imperfect-indicative-plural-third-person":"ferecau","first-person-indicative-perfect-singular":"ferecai","indicative-perfect-second-person-singular":"ferecași","indicative-perfect-singular-third-person":"ferecă","first-person-indicative-perfect-plural":"ferecarăm","indicative-perfect-plural-second-person":"ferecarăți","indicative-perfect-plural-third-person":"ferecară","first-person-indicative-pluperfect-singular":"ferecasem","indicative-pluperfect-second-person-singular":"ferecaseși","indicative-pluperfect-singular-third-person":"ferecase","first-person-indicative-pluperfect-plural":"ferecaserăm","indicative-pluperfect-plural-second-person":"ferecaserăți","indicative-pluperfect-plural-third-person":"ferecaseră","first-person-present-singular-subjunctive":"să ferec","present-second-person-singular-subjunctive":"să fereci","present-singular-subjunctive-third-person":"să ferece","first-person-plural-present-subjunctive":"să ferecăm","plural-present-second-person-subjunctive":"să ferecați","plural-present-subjunctive-third-person":"să ferece","imperative-second-person-singular":"ferecă","imperative-plural-second-person":"ferecați","imperative-negative-second-person-singular":"nu fereca","imperative-negative-plural-second-person":"nu ferecați","alternative":"înferica"}},{"word":"ferecă","pos":"noun","definitions":["obsolete form of ferigă"],"forms":{"plural":"fereci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferecă","accusative-definite-nominative-singular":"fereca","accusative-indefinite-nominative-plural":"fereci","accusative-definite-nominative-plural":"ferecile","dative-genitive-indefinite-singular":"fereci","dative-definite-genitive-singular":"ferecii","dative-genitive-indefinite-plural":"fereci","dative-definite-genitive-plural":"ferecilor","singular-vocative":"ferecă","plural-vocative":"ferecilor"}},{"word":"ferecare","pos":"noun","definitions":["locking"],"forms":{"plural":"ferecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ferecare","accusative-definite-nominative-singular":"ferecarea","accusative-indefinite-nominative-plural":"ferecări","accusative-definite-nominative-plural":"ferecările","dative-genitive-indefinite-singular":"ferecări","dative-definite-genitive-singular":"ferecării","dative-genitive-indefinite-plural":"ferecări","dative-definite-genitive-plural":"ferecărilor","singular-vocative":"ferecare","plural-vocative":"ferecărilor"}},{"word":"ferecat","pos":"noun","definitions":["locked"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferecat","accusative-definite-nominative":"ferecatul","dative-genitive-indefinite":"ferecat","dative-definite-genitive":"ferecatului","vocative":"ferecatule"}},{"word":"ferecat","pos":"verb","definitions":["past participle of fereca"],"forms":{"participle-past":"of fereca"}},{"word":"Ferecatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ferecatu"}},{"word":"ferecătură","pos":"noun","definitions":["the covering of an object with metal"],"forms":{"plural":"ferecături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferecătură","accusative-definite-nominative-singular":"ferecătura","accusative-indefinite-nominative-plural":"ferecături","accusative-definite-nominative-plural":"ferecăturile","dative-genitive-indefinite-singular":"ferecături","dative-definite-genitive-singular":"ferecăturii","dative-genitive-indefinite-plural":"ferecături","dative-definite-genitive-plural":"ferecăturilor","singular-vocative":"ferecătură","plural-vocative":"ferecăturilor"}},{"word":"Feredău","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Turdaș"],"gender":"m"},{"word":"Feredeni","pos":"name","definitions":["a village in Deleni, Iași County, Romania"],"gender":"m"},{"word":"feredeu","pos":"noun","definitions":["bath, bathing"],"forms":{"plural":"feredeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feredeu","accusative-definite-nominative-singular":"feredeuul","accusative-indefinite-nominative-plural":"feredeie","accusative-definite-nominative-plural":"feredeiele","dative-genitive-indefinite-singular":"feredeu","dative-definite-genitive-singular":"feredeuului","dative-genitive-indefinite-plural":"feredeie","dative-definite-genitive-plural":"feredeielor","singular-vocative":"feredeuule","plural-vocative":"feredeielor"}},{"word":"feregă","pos":"noun","definitions":["alternative form of ferigă"],"forms":{"plural":"feregi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"feregă","accusative-definite-nominative-singular":"ferega","accusative-indefinite-nominative-plural":"feregi","accusative-definite-nominative-plural":"feregile","dative-genitive-indefinite-singular":"feregi","dative-definite-genitive-singular":"feregii","dative-genitive-indefinite-plural":"feregi","dative-definite-genitive-plural":"feregilor","singular-vocative":"feregă","plural-vocative":"feregilor"}},{"word":"Feregan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feregan"}},{"word":"feregea","pos":"noun","definitions":["ferace"],"forms":{"plural":"feregele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"feregea","accusative-definite-nominative-singular":"feregeaua","accusative-indefinite-nominative-plural":"feregele","accusative-definite-nominative-plural":"feregelele","dative-genitive-indefinite-singular":"feregele","dative-definite-genitive-singular":"feregelei","dative-genitive-indefinite-plural":"feregele","dative-definite-genitive-plural":"feregelelor","singular-vocative":"feregea","plural-vocative":"feregelelor"}},{"word":"Feregi","pos":"name","definitions":["a village in Cerbăl, Hunedoara County, Romania"],"gender":"m"},{"word":"Ferencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Ferencu"}},{"word":"Ferendia","pos":"name","definitions":["a village in Jamu Mare, Timiș County, Romania"],"gender":"f"},{"word":"Ferenț","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Ferenț"}},{"word":"ferentar","pos":"noun","definitions":["light infantry"],"forms":{"plural":"ferentari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ferentar","accusative-definite-nominative-singular":"ferentarul","accusative-indefinite-nominative-plural":"ferentari","accusative-definite-nominative-plural":"ferentarii","dative-genitive-indefinite-singular":"ferentar","dative-definite-genitive-singular":"ferentarului","dative-genitive-indefinite-plural":"ferentari","dative-definite-genitive-plural":"ferentarilor","singular-vocative":"ferentarule","plural-vocative":"ferentarilor"}},{"word":"Ferentari","pos":"name","definitions":["a neighbourhood of Bucharest, Romania"],"gender":"m"},{"word":"ferentari","pos":"noun","definitions":["plural of ferentar"]},{"word":"Ferenți","pos":"name","definitions":["a river in Brașov County, Romania, tributary to the Tigăile"],"gender":"m"},{"word":"feresc","pos":"verb","definitions":["inflection of feri:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"ferește","pos":"verb","definitions":["third-person singular present indicative of feri"]},{"word":"Fereștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fereștean"}},{"word":"Fereșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fereșteanu"}},{"word":"Ferești","pos":"name","definitions":["a village in Bucium, Alba County, Romania","a village in Giulești, Maramureș County, Romania","a commune of Vaslui County, Romania","a village in Ferești, Vaslui County, Romania"],"gender":"m"},{"word":"ferestică","pos":"noun","definitions":["alternative form of ferestrică"],"forms":{"plural":"ferestici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferestică","accusative-definite-nominative-singular":"ferestica","accusative-indefinite-nominative-plural":"ferestici","accusative-definite-nominative-plural":"feresticile","dative-genitive-indefinite-singular":"ferestici","dative-definite-genitive-singular":"feresticii","dative-genitive-indefinite-plural":"ferestici","dative-definite-genitive-plural":"feresticilor","singular-vocative":"ferestică","plural-vocative":"feresticilor"}},{"word":"ferestraș mare","pos":"noun","definitions":["common merganser (Mergus merganser)"],"forms":{"plural":"ferestrași mari"}},{"word":"ferestraș mic","pos":"noun","definitions":["smew (Mergellus albellus)"],"forms":{"plural":"ferestrași mici"}},{"word":"ferestraș moțat","pos":"noun","definitions":["red-breasted merganser (Mergus serrator)"],"forms":{"plural":"ferestrași moțați"}},{"word":"ferestrău","pos":"noun","definitions":["alternative form of ferăstrău"],"forms":{"plural":"ferestraie"}},{"word":"Ferestrău-Oituz","pos":"name","definitions":["a village in Oituz, Bacău County, Romania"],"gender":"m"},{"word":"Ferestre","pos":"name","definitions":["a village in Runcu, Dâmbovița County, Romania"],"gender":"f"},{"word":"ferestrică","pos":"noun","definitions":["diminutive of fereastră; small window"],"forms":{"plural":"ferestrici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferestrică","accusative-definite-nominative-singular":"ferestrica","accusative-indefinite-nominative-plural":"ferestrice","accusative-definite-nominative-plural":"ferestricele","dative-genitive-indefinite-singular":"ferestrice","dative-definite-genitive-singular":"ferestricei","dative-genitive-indefinite-plural":"ferestrice","dative-definite-genitive-plural":"ferestricelor","singular-vocative":"ferestrică","plural-vocative":"ferestricelor"}},{"word":"ferestrui","pos":"verb","definitions":["to saw"],"pronunciation":"/fe.res.truˈi/","forms":{"canonical":"a ferestrui 4th conjugation","present-singular-third-person":"ferestruiește","participle-past":"ferestruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ferestrui","gerund":"ferestruind","first-person-indicative-present-singular":"ferestruiesc","indicative-present-second-person-singular":"ferestruiești","indicative-present-singular-third-person":"ferestruiește","first-person-indicative-plural-present":"ferestruim","indicative-plural-present-second-person":"ferestruiți","indicative-plural-present-third-person":"ferestruiesc","first-person-imperfect-indicative-singular":"ferestruiam","imperfect-indicative-second-person-singular":"ferestruiai","imperfect-indicative-singular-third-person":"ferestruia","first-person-imperfect-indicative-plural":"ferestruiam","imperfect-indicative-plural-second-person":"ferestruiați","imperfect-indicative-plural-third-person":"ferestruiau","first-person-indicative-perfect-singular":"ferestruii","indicative-perfect-second-person-singular":"ferestruiși","indicative-perfect-singular-third-person":"ferestrui","first-person-indicative-perfect-plural":"ferestruirăm","indicative-perfect-plural-second-person":"ferestruirăți","indicative-perfect-plural-third-person":"ferestruiră","first-person-indicative-pluperfect-singular":"ferestruisem","indicative-pluperfect-second-person-singular":"ferestruiseși","indicative-pluperfect-singular-third-person":"ferestruise","first-person-indicative-pluperfect-plural":"ferestruiserăm","indicative-pluperfect-plural-second-person":"ferestruiserăți","indicative-pluperfect-plural-third-person":"ferestruiseră","first-person-present-singular-subjunctive":"să ferestruiesc","present-second-person-singular-subjunctive":"să ferestruiești","present-singular-subjunctive-third-person":"să ferestruiască","first-person-plural-present-subjunctive":"să ferestruim","plural-present-second-person-subjunctive":"să ferestruiți","plural-present-subjunctive-third-person":"să ferestruiască","imperative-second-person-singular":"ferestruiește","imperative-plural-second-person":"ferestruiți","imperative-negative-second-person-singular":"nu ferestrui","imperative-negative-plural-second-person":"nu ferestruiți","alternative":"fierăstrui"}},{"word":"ferestruică","pos":"noun","definitions":["diminutive of fereastră; small window"],"forms":{"plural":"ferestruici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferestruică","accusative-definite-nominative-singular":"ferestruica","accusative-indefinite-nominative-plural":"ferestruici","accusative-definite-nominative-plural":"ferestruicile","dative-genitive-indefinite-singular":"ferestruici","dative-definite-genitive-singular":"ferestruicii","dative-genitive-indefinite-plural":"ferestruici","dative-definite-genitive-plural":"ferestruicilor","singular-vocative":"ferestruică","plural-vocative":"ferestruicilor"}},{"word":"ferestruie","pos":"noun","definitions":["diminutive of fereastră"],"forms":{"plural":"ferestrui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ferestruie","accusative-definite-nominative-singular":"ferestruia","accusative-indefinite-nominative-plural":"ferestruii","accusative-definite-nominative-plural":"ferestruiile","dative-genitive-indefinite-singular":"ferestruii","dative-definite-genitive-singular":"ferestruiei","dative-genitive-indefinite-plural":"ferestruii","dative-definite-genitive-plural":"ferestruiilor","singular-vocative":"ferestruie","plural-vocative":"ferestruiilor"}},{"word":"ferestruire","pos":"noun","definitions":["windowing"],"forms":{"plural":"ferestruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ferestruire","accusative-definite-nominative-singular":"ferestruirea","accusative-indefinite-nominative-plural":"ferestruiri","accusative-definite-nominative-plural":"ferestruirile","dative-genitive-indefinite-singular":"ferestruiri","dative-definite-genitive-singular":"ferestruirii","dative-genitive-indefinite-plural":"ferestruiri","dative-definite-genitive-plural":"ferestruirilor","singular-vocative":"ferestruire","plural-vocative":"ferestruirilor"}},{"word":"ferestruit","pos":"adj","definitions":["saw-toothed"],"pronunciation":"/fe.re.struˈit/","forms":{"feminine-singular":"ferestruită","masculine-plural":"ferestruiți","feminine-neuter-plural":"ferestruite"}},{"word":"ferestruit","pos":"verb","definitions":["past participle of ferestrui"],"pronunciation":"/fe.re.struˈit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferestruit","error-unrecognized-form-feminine-indefinite-singular":"ferestruită","error-unrecognized-form-indefinite-masculine-plural":"ferestruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferestruite","definite-error-unrecognized-form-masculine-neuter-singular":"ferestruitul","definite-error-unrecognized-form-feminine-singular":"ferestruita","definite-error-unrecognized-form-masculine-plural":"ferestruiții","definite-error-unrecognized-form-feminine-neuter-plural":"ferestruitele"}},{"word":"ferestruță","pos":"noun","definitions":["diminutive of fereastră"],"forms":{"plural":"ferestruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferestruță","accusative-definite-nominative-singular":"ferestruța","accusative-indefinite-nominative-plural":"ferestruțe","accusative-definite-nominative-plural":"ferestruțele","dative-genitive-indefinite-singular":"ferestruțe","dative-definite-genitive-singular":"ferestruței","dative-genitive-indefinite-plural":"ferestruțe","dative-definite-genitive-plural":"ferestruțelor","singular-vocative":"ferestruță","plural-vocative":"ferestruțelor"}},{"word":"ferestui","pos":"verb","definitions":["alternative form of ferestrui"],"forms":{"canonical":"a ferestui 4th conjugation","present-singular-third-person":"ferestuiește","participle-past":"ferestuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ferestui","gerund":"ferestuind","first-person-indicative-present-singular":"ferestuiesc","indicative-present-second-person-singular":"ferestuiești","indicative-present-singular-third-person":"ferestuiește","first-person-indicative-plural-present":"ferestuim","indicative-plural-present-second-person":"ferestuiți","indicative-plural-present-third-person":"ferestuiesc","first-person-imperfect-indicative-singular":"ferestuiam","imperfect-indicative-second-person-singular":"ferestuiai","imperfect-indicative-singular-third-person":"ferestuia","first-person-imperfect-indicative-plural":"ferestuiam","imperfect-indicative-plural-second-person":"ferestuiați","imperfect-indicative-plural-third-person":"ferestuiau","first-person-indicative-perfect-singular":"ferestuii","indicative-perfect-second-person-singular":"ferestuiși","indicative-perfect-singular-third-person":"ferestui","first-person-indicative-perfect-plural":"ferestuirăm","indicative-perfect-plural-second-person":"ferestuirăți","indicative-perfect-plural-third-person":"ferestuiră","first-person-indicative-pluperfect-singular":"ferestuisem","indicative-pluperfect-second-person-singular":"ferestuiseși","indicative-pluperfect-singular-third-person":"ferestuise","first-person-indicative-pluperfect-plural":"ferestuiserăm","indicative-pluperfect-plural-second-person":"ferestuiserăți","indicative-pluperfect-plural-third-person":"ferestuiseră","first-person-present-singular-subjunctive":"să ferestuiesc","present-second-person-singular-subjunctive":"să ferestuiești","present-singular-subjunctive-third-person":"să ferestuiască","first-person-plural-present-subjunctive":"să ferestuim","plural-present-second-person-subjunctive":"să ferestuiți","plural-present-subjunctive-third-person":"să ferestuiască","imperative-second-person-singular":"ferestuiește","imperative-plural-second-person":"ferestuiți","imperative-negative-second-person-singular":"nu ferestui","imperative-negative-plural-second-person":"nu ferestuiți"}},{"word":"ferestuică","pos":"noun","definitions":["alternative form of ferestruică"],"forms":{"plural":"ferestuici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferestuică","accusative-definite-nominative-singular":"ferestuica","accusative-indefinite-nominative-plural":"ferestuici","accusative-definite-nominative-plural":"ferestuicile","dative-genitive-indefinite-singular":"ferestuici","dative-definite-genitive-singular":"ferestuicii","dative-genitive-indefinite-plural":"ferestuici","dative-definite-genitive-plural":"ferestuicilor","singular-vocative":"ferestuică","plural-vocative":"ferestuicilor"}},{"word":"ferestuie","pos":"noun","definitions":["alternative form of ferestruie"],"forms":{"plural":"ferestui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"ferestuie","accusative-definite-nominative-singular":"ferestuia","accusative-indefinite-nominative-plural":"ferestui","accusative-definite-nominative-plural":"ferestuile","dative-genitive-indefinite-singular":"ferestui","dative-definite-genitive-singular":"ferestuii","dative-genitive-indefinite-plural":"ferestui","dative-definite-genitive-plural":"ferestuilor","singular-vocative":"ferestuie","plural-vocative":"ferestuilor"}},{"word":"ferestuire","pos":"noun","definitions":["alternative form of fierăstruire"],"forms":{"plural":"ferestuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ferestuire","accusative-definite-nominative-singular":"ferestuirea","accusative-indefinite-nominative-plural":"ferestuiri","accusative-definite-nominative-plural":"ferestuirile","dative-genitive-indefinite-singular":"ferestuiri","dative-definite-genitive-singular":"ferestuirii","dative-genitive-indefinite-plural":"ferestuiri","dative-definite-genitive-plural":"ferestuirilor","singular-vocative":"ferestuire","plural-vocative":"ferestuirilor"}},{"word":"ferestuit","pos":"adj","definitions":["alternative form of ferestruit"],"forms":{"feminine-singular":"ferestuită","masculine-plural":"ferestuiți","feminine-neuter-plural":"ferestuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferestuit","error-unrecognized-form-feminine-indefinite-singular":"ferestuită","error-unrecognized-form-indefinite-masculine-plural":"ferestuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferestuite","definite-error-unrecognized-form-masculine-neuter-singular":"ferestuitul","definite-error-unrecognized-form-feminine-singular":"ferestuita","definite-error-unrecognized-form-masculine-plural":"ferestuiții","definite-error-unrecognized-form-feminine-neuter-plural":"ferestuitele"}},{"word":"Ferezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ferezan"}},{"word":"ferfeliță","pos":"noun","definitions":["alternative form of ferfeniță"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ferfeliță","accusative-definite-nominative":"ferfelița","dative-genitive-indefinite":"ferfelițe","dative-definite-genitive":"ferfeliței","vocative":"ferfeliță"}},{"word":"ferfenița","pos":"verb","definitions":["alternative form of ferfeniți"],"forms":{"canonical":"a ferfenița 1st conjugation","present-singular-third-person":"ferfenițează","participle-past":"ferfenițat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ferfenița","gerund":"ferfenițând","first-person-indicative-present-singular":"ferfenițez","indicative-present-second-person-singular":"ferfenițezi","indicative-present-singular-third-person":"ferfenițează","first-person-indicative-plural-present":"ferfenițăm","indicative-plural-present-second-person":"ferfenițați","indicative-plural-present-third-person":"ferfenițează","first-person-imperfect-indicative-singular":"ferfenițam","imperfect-indicative-second-person-singular":"ferfenițai","imperfect-indicative-singular-third-person":"ferfenița","first-person-imperfect-indicative-plural":"ferfenițam","imperfect-indicative-plural-second-person":"ferfenițați","imperfect-indicative-plural-third-person":"ferfenițau","first-person-indicative-perfect-singular":"ferfenițai","indicative-perfect-second-person-singular":"ferfenițași","indicative-perfect-singular-third-person":"ferfeniță","first-person-indicative-perfect-plural":"ferfenițarăm","indicative-perfect-plural-second-person":"ferfenițarăți","indicative-perfect-plural-third-person":"ferfenițară","first-person-indicative-pluperfect-singular":"ferfenițasem","indicative-pluperfect-second-person-singular":"ferfenițaseși","indicative-pluperfect-singular-third-person":"ferfenițase","first-person-indicative-pluperfect-plural":"ferfenițaserăm","indicative-pluperfect-plural-second-person":"ferfenițaserăți","indicative-pluperfect-plural-third-person":"ferfenițaseră","first-person-present-singular-subjunctive":"să ferfenițez","present-second-person-singular-subjunctive":"să ferfenițezi","present-singular-subjunctive-third-person":"să ferfenițeze","first-person-plural-present-subjunctive":"să ferfenițăm","plural-present-second-person-subjunctive":"să ferfenițați","plural-present-subjunctive-third-person":"să ferfenițeze","imperative-second-person-singular":"ferfenițează","imperative-plural-second-person":"ferfenițați","imperative-negative-second-person-singular":"nu ferfenița","imperative-negative-plural-second-person":"nu ferfenițați"}},{"word":"ferfeniță","pos":"noun","definitions":["rag, tatter"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"ferfeniță","accusative-definite-nominative":"ferfenița","dative-genitive-indefinite":"ferfenițe","dative-definite-genitive":"ferfeniței","vocative":"ferfeniță"}},{"word":"ferfenițit","pos":"noun","definitions":["tearing, ripping"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferfenițit","accusative-definite-nominative":"ferfenițitul","dative-genitive-indefinite":"ferfenițit","dative-definite-genitive":"ferfenițitului","vocative":"ferfenițitule"}},{"word":"ferfenițit","pos":"verb","definitions":["past participle of ferfeniți"],"forms":{"participle-past":"of ferfeniți"}},{"word":"ferfenițos","pos":"adj","definitions":["tattered"],"forms":{"feminine-singular":"ferfenițoasă","masculine-plural":"ferfenițoși","feminine-neuter-plural":"ferfenițoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferfenițos","error-unrecognized-form-feminine-indefinite-singular":"ferfenițoasă","error-unrecognized-form-indefinite-masculine-plural":"ferfenițoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferfenițoase","definite-error-unrecognized-form-masculine-neuter-singular":"ferfenițosul","definite-error-unrecognized-form-feminine-singular":"ferfenițoasa","definite-error-unrecognized-form-masculine-plural":"ferfenițoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ferfenițoasele"}},{"word":"fergheteag","pos":"noun","definitions":["storm"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fergheteag","accusative-definite-nominative":"fergheteagul","dative-genitive-indefinite":"fergheteag","dative-definite-genitive":"fergheteagului","vocative":"fergheteagule"}},{"word":"feri","pos":"verb","definitions":["to guard from, fend","to duck, dodge, avoid","to recoil, shirk","to be on one's guard, be wary","to observe, keep"],"examples":[{"ro":"Aceștia trebuie să fie cu fața în sus, cu urechi păroase pe frunte, cu gura mare, astfel ca măselele căscate să verse foc mișcându-se, cu pântecele strânse îngust la vintre, cu coada scurtă, cu șale lungi, cu coama măruntă pe grumaz, nu prea stufoasă, dar îndestulă, ca să-i ferească de frig, iar sub umerii lor sănătoși să se-nalțe un piept care să ducă la alergătură multă și să nu se obosească de cele mai mari goane.","en":"These must have an upturned face, shaggy ears on the forehead, a big mouth so that the open teeth can blow fire while moving, an abdomen drawn narrow by the belly, a short tail, with long hips, a fine mane on the nape, not too thick, but sufficient, to guard then from the cold, and under their healthy shoulders must be a breast tolerant of much running and not growing tired of the longest strides."},{"ro":"Dar șireata vulpe știe cum să se ferească de mânia ursului.","en":"But the sly fox knows how to guard from the wrath of the bear."},{"ro":"O voce se aude strigând somnoroasă: ferește linia, ferește linia.","en":"A sleepy voice is heard shouting: avoid the line, avoid the line."}],"forms":{"canonical":"a feri 4th conjugation","present-singular-third-person":"ferește","participle-past":"ferit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a feri","gerund":"ferind","first-person-indicative-present-singular":"feresc","indicative-present-second-person-singular":"ferești","indicative-present-singular-third-person":"ferește","first-person-indicative-plural-present":"ferim","indicative-plural-present-second-person":"feriți","indicative-plural-present-third-person":"feresc","first-person-imperfect-indicative-singular":"feream","imperfect-indicative-second-person-singular":"fereai","imperfect-indicative-singular-third-person":"ferea","first-person-imperfect-indicative-plural":"feream","imperfect-indicative-plural-second-person":"fereați","imperfect-indicative-plural-third-person":"fereau","first-person-indicative-perfect-singular":"ferii","indicative-perfect-second-person-singular":"feriși","indicative-perfect-singular-third-person":"feri","first-person-indicative-perfect-plural":"ferirăm","indicative-perfect-plural-second-person":"ferirăți","indicative-perfect-plural-third-person":"feriră","first-person-indicative-pluperfect-singular":"ferisem","indicative-pluperfect-second-person-singular":"feriseși","indicative-pluperfect-singular-third-person":"ferise","first-person-indicative-pluperfect-plural":"feriserăm","indicative-pluperfect-plural-second-person":"feriserăți","indicative-pluperfect-plural-third-person":"feriseră","first-person-present-singular-subjunctive":"să feresc","present-second-person-singular-subjunctive":"să ferești","present-singular-subjunctive-third-person":"să ferească","first-person-plural-present-subjunctive":"să ferim","plural-present-second-person-subjunctive":"să feriți","plural-present-subjunctive-third-person":"să ferească","imperative-second-person-singular":"ferește","imperative-plural-second-person":"feriți","imperative-negative-second-person-singular":"nu feri","imperative-negative-plural-second-person":"nu feriți"}},{"word":"feribot","pos":"noun","definitions":["ferryboat"],"forms":{"plural":"feriboturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feribot","accusative-definite-nominative-singular":"feribotul","accusative-indefinite-nominative-plural":"feriboturi","accusative-definite-nominative-plural":"feriboturile","dative-genitive-indefinite-singular":"feribot","dative-definite-genitive-singular":"feribotului","dative-genitive-indefinite-plural":"feriboturi","dative-definite-genitive-plural":"feriboturilor","singular-vocative":"feribotule","plural-vocative":"feriboturilor"}},{"word":"feric","pos":"adj","definitions":["ferric"],"forms":{"feminine-singular":"ferică","masculine-plural":"ferici","feminine-neuter-plural":"ferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feric","error-unrecognized-form-feminine-indefinite-singular":"ferică","error-unrecognized-form-indefinite-masculine-plural":"ferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferice","definite-error-unrecognized-form-masculine-neuter-singular":"fericul","definite-error-unrecognized-form-feminine-singular":"ferica","definite-error-unrecognized-form-masculine-plural":"fericii","definite-error-unrecognized-form-feminine-neuter-plural":"fericele"}},{"word":"ferica","pos":"verb","definitions":["to make happy"],"forms":{"canonical":"a ferica 1st conjugation","present-singular-third-person":"ferică","participle-past":"fericat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a ferica","gerund":"fericând","first-person-indicative-present-singular":"feric","indicative-present-second-person-singular":"ferici","indicative-present-singular-third-person":"ferică","first-person-indicative-plural-present":"fericăm","indicative-plural-present-second-person":"fericați","indicative-plural-present-third-person":"ferică","first-person-imperfect-indicative-singular":"fericam","imperfect-indicative-second-person-singular":"fericai","imperfect-indicative-singular-third-person":"ferica","first-person-imperfect-indicative-plural":"fericam","imperfect-indicative-plural-second-person":"fericați","imperfect-indicative-plural-third-person":"fericau","first-person-indicative-perfect-singular":"fericai","indicative-perfect-second-person-singular":"fericași","indicative-perfect-singular-third-person":"ferică","first-person-indicative-perfect-plural":"fericarăm","indicative-perfect-plural-second-person":"fericarăți","indicative-perfect-plural-third-person":"fericară","first-person-indicative-pluperfect-singular":"fericasem","indicative-pluperfect-second-person-singular":"fericaseși","indicative-pluperfect-singular-third-person":"fericase","first-person-indicative-pluperfect-plural":"fericaserăm","indicative-pluperfect-plural-second-person":"fericaserăți","indicative-pluperfect-plural-third-person":"fericaseră","first-person-present-singular-subjunctive":"să feric","present-second-person-singular-subjunctive":"să ferici","present-singular-subjunctive-third-person":"să ferice","first-person-plural-present-subjunctive":"să fericăm","plural-present-second-person-subjunctive":"să fericați","plural-present-subjunctive-third-person":"să ferice","imperative-second-person-singular":"ferică","imperative-plural-second-person":"fericați","imperative-negative-second-person-singular":"nu ferica","imperative-negative-plural-second-person":"nu fericați"}},{"word":"fericăciune","pos":"noun","definitions":["happiness"],"forms":{"plural":"fericăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fericăciune","accusative-definite-nominative-singular":"fericăciunea","accusative-indefinite-nominative-plural":"fericăciuni","accusative-definite-nominative-plural":"fericăciunile","dative-genitive-indefinite-singular":"fericăciuni","dative-definite-genitive-singular":"fericăciunii","dative-genitive-indefinite-plural":"fericăciuni","dative-definite-genitive-plural":"fericăciunilor","singular-vocative":"fericăciune","plural-vocative":"fericăciunilor"}},{"word":"Ferice","pos":"name","definitions":["a village in Buntești, Bihor County, Romania"],"gender":"m"},{"word":"ferice","pos":"adj","definitions":["happy"],"pronunciation":"/feˈri.t͡ʃe/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferice","error-unrecognized-form-feminine-indefinite-singular":"ferice","error-unrecognized-form-indefinite-masculine-plural":"ferice","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Fericea","pos":"name","definitions":["a village in Valea Chioarului, Maramureș County, Romania"],"gender":"f"},{"word":"Fericet","pos":"name","definitions":["a village in Horea, Alba County, Romania"],"gender":"m"},{"word":"ferici","pos":"verb","definitions":["to make happy","to congratulate"],"forms":{"canonical":"a ferici 4th conjugation","present-singular-third-person":"fericește","participle-past":"fericit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ferici","gerund":"fericind","first-person-indicative-present-singular":"fericesc","indicative-present-second-person-singular":"fericești","indicative-present-singular-third-person":"fericește","first-person-indicative-plural-present":"fericim","indicative-plural-present-second-person":"fericiți","indicative-plural-present-third-person":"fericesc","first-person-imperfect-indicative-singular":"fericeam","imperfect-indicative-second-person-singular":"fericeai","imperfect-indicative-singular-third-person":"fericea","first-person-imperfect-indicative-plural":"fericeam","imperfect-indicative-plural-second-person":"fericeați","imperfect-indicative-plural-third-person":"fericeau","first-person-indicative-perfect-singular":"fericii","indicative-perfect-second-person-singular":"fericiși","indicative-perfect-singular-third-person":"ferici","first-person-indicative-perfect-plural":"fericirăm","indicative-perfect-plural-second-person":"fericirăți","indicative-perfect-plural-third-person":"fericiră","first-person-indicative-pluperfect-singular":"fericisem","indicative-pluperfect-second-person-singular":"fericiseși","indicative-pluperfect-singular-third-person":"fericise","first-person-indicative-pluperfect-plural":"fericiserăm","indicative-pluperfect-plural-second-person":"fericiserăți","indicative-pluperfect-plural-third-person":"fericiseră","first-person-present-singular-subjunctive":"să fericesc","present-second-person-singular-subjunctive":"să fericești","present-singular-subjunctive-third-person":"să fericească","first-person-plural-present-subjunctive":"să fericim","plural-present-second-person-subjunctive":"să fericiți","plural-present-subjunctive-third-person":"să fericească","imperative-second-person-singular":"fericește","imperative-plural-second-person":"fericiți","imperative-negative-second-person-singular":"nu ferici","imperative-negative-plural-second-person":"nu fericiți"}},{"word":"fericianură","pos":"noun","definitions":["ferricyanide"],"forms":{"plural":"fericianuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fericianură","accusative-definite-nominative-singular":"fericianura","accusative-indefinite-nominative-plural":"fericianuri","accusative-definite-nominative-plural":"fericianurile","dative-genitive-indefinite-singular":"fericianuri","dative-definite-genitive-singular":"fericianurii","dative-genitive-indefinite-plural":"fericianuri","dative-definite-genitive-plural":"fericianurilor","singular-vocative":"fericianură","plural-vocative":"fericianurilor"}},{"word":"fericință","pos":"noun","definitions":["happiness"],"forms":{"plural":"fericințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fericință","accusative-definite-nominative-singular":"fericința","accusative-indefinite-nominative-plural":"fericințe","accusative-definite-nominative-plural":"fericințele","dative-genitive-indefinite-singular":"fericințe","dative-definite-genitive-singular":"fericinței","dative-genitive-indefinite-plural":"fericințe","dative-definite-genitive-plural":"fericințelor","singular-vocative":"fericință","plural-vocative":"fericințelor"}},{"word":"fericire","pos":"noun","definitions":["happiness, joy, felicity","good luck"],"pronunciation":"/fe.riˈt͡ʃi.re/","forms":{"plural":"fericiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fericire","accusative-definite-nominative-singular":"fericirea","accusative-indefinite-nominative-plural":"fericiri","accusative-definite-nominative-plural":"fericirile","dative-genitive-indefinite-singular":"fericiri","dative-definite-genitive-singular":"fericirii","dative-genitive-indefinite-plural":"fericiri","dative-definite-genitive-plural":"fericirilor","singular-vocative":"fericire","plural-vocative":"fericirilor"}},{"word":"fericirea","pos":"noun","definitions":["definite nominative/accusative singular of fericire"],"pronunciation":"/fe.riˈt͡ʃi.re̯a/","gender":"f"},{"word":"fericit","pos":"adj","definitions":["happy (enjoying peace, comfort, etc; contented, joyous)"],"pronunciation":"/fe.riˈt͡ʃit/","forms":{"feminine-singular":"fericită","masculine-plural":"fericiți","feminine-neuter-plural":"fericite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fericit","error-unrecognized-form-feminine-indefinite-singular":"fericită","error-unrecognized-form-indefinite-masculine-plural":"fericiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fericite","definite-error-unrecognized-form-masculine-neuter-singular":"fericitul","definite-error-unrecognized-form-feminine-singular":"fericita","definite-error-unrecognized-form-masculine-plural":"fericiții","definite-error-unrecognized-form-feminine-neuter-plural":"fericitele"}},{"word":"fericita","pos":"verb","definitions":["alternative form of felicita"],"forms":{"canonical":"a fericita 1st conjugation","present-singular-third-person":"fericită","participle-past":"fericitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fericita","gerund":"fericitând","first-person-indicative-present-singular":"fericit","indicative-present-second-person-singular":"fericiți","indicative-present-singular-third-person":"fericită","first-person-indicative-plural-present":"fericităm","indicative-plural-present-second-person":"fericitați","indicative-plural-present-third-person":"fericită","first-person-imperfect-indicative-singular":"fericitam","imperfect-indicative-second-person-singular":"fericitai","imperfect-indicative-singular-third-person":"fericita","first-person-imperfect-indicative-plural":"fericitam","imperfect-indicative-plural-second-person":"fericitați","imperfect-indicative-plural-third-person":"fericitau","first-person-indicative-perfect-singular":"fericitai","indicative-perfect-second-person-singular":"fericitași","indicative-perfect-singular-third-person":"fericită","first-person-indicative-perfect-plural":"fericitarăm","indicative-perfect-plural-second-person":"fericitarăți","indicative-perfect-plural-third-person":"fericitară","first-person-indicative-pluperfect-singular":"fericitasem","indicative-pluperfect-second-person-singular":"fericitaseși","indicative-pluperfect-singular-third-person":"fericitase","first-person-indicative-pluperfect-plural":"fericitaserăm","indicative-pluperfect-plural-second-person":"fericitaserăți","indicative-pluperfect-plural-third-person":"fericitaseră","first-person-present-singular-subjunctive":"să fericit","present-second-person-singular-subjunctive":"să fericiți","present-singular-subjunctive-third-person":"să fericite","first-person-plural-present-subjunctive":"să fericităm","plural-present-second-person-subjunctive":"să fericitați","plural-present-subjunctive-third-person":"să fericite","imperative-second-person-singular":"fericită","imperative-plural-second-person":"fericitați","imperative-negative-second-person-singular":"nu fericita","imperative-negative-plural-second-person":"nu fericitați"}},{"word":"fericită","pos":"noun","definitions":["female equivalent of fericit"],"forms":{"plural":"fericite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fericită","accusative-definite-nominative-singular":"fericita","accusative-indefinite-nominative-plural":"fericite","accusative-definite-nominative-plural":"fericitele","dative-genitive-indefinite-singular":"fericite","dative-definite-genitive-singular":"fericitei","dative-genitive-indefinite-plural":"fericite","dative-definite-genitive-plural":"fericitelor","singular-vocative":"fericită","plural-vocative":"fericitelor"}},{"word":"fericitor","pos":"adj","definitions":["bringing happiness"],"forms":{"feminine-singular":"fericitoare","masculine-plural":"fericitori","feminine-neuter-plural":"fericitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fericitor","error-unrecognized-form-feminine-indefinite-singular":"fericitoare","error-unrecognized-form-indefinite-masculine-plural":"fericitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fericitoare","definite-error-unrecognized-form-masculine-neuter-singular":"fericitorul","definite-error-unrecognized-form-feminine-singular":"fericitoarea","definite-error-unrecognized-form-masculine-plural":"fericitorii","definite-error-unrecognized-form-feminine-neuter-plural":"fericitoarele"}},{"word":"ferigă","pos":"noun","definitions":["fern"],"forms":{"plural":"ferigi","alternative-regional":"feregă","alternative":"ferece","alternative-archaic":"ferice"}},{"word":"Ferigele","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Valea Satului"],"gender":"m"},{"word":"Ferihaza","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Albeștii Bistriței."],"gender":"f"},{"word":"ferii","pos":"verb","definitions":["first-person plural simple perfect indicative of feri"],"pronunciation":"[feˈriː]"},{"word":"ferim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of feri"],"pronunciation":"[feˈrim]"},{"word":"ferimagnetic","pos":"adj","definitions":["ferrimagnetic"],"forms":{"feminine-singular":"ferimagnetică","masculine-plural":"ferimagnetici","feminine-neuter-plural":"ferimagnetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferimagnetic","error-unrecognized-form-feminine-indefinite-singular":"ferimagnetică","error-unrecognized-form-indefinite-masculine-plural":"ferimagnetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferimagnetice","definite-error-unrecognized-form-masculine-neuter-singular":"ferimagneticul","definite-error-unrecognized-form-feminine-singular":"ferimagnetica","definite-error-unrecognized-form-masculine-plural":"ferimagneticii","definite-error-unrecognized-form-feminine-neuter-plural":"ferimagneticele"}},{"word":"ferimagnetism","pos":"noun","definitions":["ferrimagnetism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferimagnetism","accusative-definite-nominative":"ferimagnetismul","dative-genitive-indefinite":"ferimagnetism","dative-definite-genitive":"ferimagnetismului","vocative":"ferimagnetismule"}},{"word":"ferind","pos":"verb","definitions":["gerund of feri"]},{"word":"ferință","pos":"noun","definitions":["dodge"],"forms":{"plural":"ferințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferință","accusative-definite-nominative-singular":"ferința","accusative-indefinite-nominative-plural":"ferințe","accusative-definite-nominative-plural":"ferințele","dative-genitive-indefinite-singular":"ferințe","dative-definite-genitive-singular":"ferinței","dative-genitive-indefinite-plural":"ferințe","dative-definite-genitive-plural":"ferințelor","singular-vocative":"ferință","plural-vocative":"ferințelor"}},{"word":"feriptiv","pos":"adj","definitions":["ferriprive"],"forms":{"feminine-singular":"feriptivă","masculine-plural":"feriptivi","feminine-neuter-plural":"feriptive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feriptiv","error-unrecognized-form-feminine-indefinite-singular":"feriptivă","error-unrecognized-form-indefinite-masculine-plural":"feriptivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"feriptive","definite-error-unrecognized-form-masculine-neuter-singular":"feriptivul","definite-error-unrecognized-form-feminine-singular":"feriptiva","definite-error-unrecognized-form-masculine-plural":"feriptivii","definite-error-unrecognized-form-feminine-neuter-plural":"feriptivele"}},{"word":"ferire","pos":"noun","definitions":["dodge"],"forms":{"plural":"feriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ferire","accusative-definite-nominative-singular":"ferirea","accusative-indefinite-nominative-plural":"feriri","accusative-definite-nominative-plural":"feririle","dative-genitive-indefinite-singular":"feriri","dative-definite-genitive-singular":"feririi","dative-genitive-indefinite-plural":"feriri","dative-definite-genitive-plural":"feririlor","singular-vocative":"ferire","plural-vocative":"feririlor"}},{"word":"ferit","pos":"adj","definitions":["hidden, isolated, little known","safe"],"forms":{"feminine-singular":"ferită","masculine-plural":"feriți","feminine-neuter-plural":"ferite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferit","error-unrecognized-form-feminine-indefinite-singular":"ferită","error-unrecognized-form-indefinite-masculine-plural":"feriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferite","definite-error-unrecognized-form-masculine-neuter-singular":"feritul","definite-error-unrecognized-form-feminine-singular":"ferita","definite-error-unrecognized-form-masculine-plural":"feriții","definite-error-unrecognized-form-feminine-neuter-plural":"feritele"}},{"word":"ferit","pos":"verb","definitions":["past participle of feri"],"forms":{"participle-past":"of feri"}},{"word":"ferită","pos":"noun","definitions":["ferrite"],"forms":{"plural":"ferite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ferită","accusative-definite-nominative-singular":"ferita","accusative-indefinite-nominative-plural":"ferite","accusative-definite-nominative-plural":"feritele","dative-genitive-indefinite-singular":"ferite","dative-definite-genitive-singular":"feritei","dative-genitive-indefinite-plural":"ferite","dative-definite-genitive-plural":"feritelor","singular-vocative":"ferită","plural-vocative":"feritelor"}},{"word":"feritic","pos":"adj","definitions":["ferritic"],"forms":{"feminine-singular":"feritică","masculine-plural":"feritici","feminine-neuter-plural":"feritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feritic","error-unrecognized-form-feminine-indefinite-singular":"feritică","error-unrecognized-form-indefinite-masculine-plural":"feritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feritice","definite-error-unrecognized-form-masculine-neuter-singular":"feriticul","definite-error-unrecognized-form-feminine-singular":"feritica","definite-error-unrecognized-form-masculine-plural":"feriticii","definite-error-unrecognized-form-feminine-neuter-plural":"feriticele"}},{"word":"ferm","pos":"adj","definitions":["firm"],"forms":{"feminine-singular":"fermă","masculine-plural":"fermi","feminine-neuter-plural":"ferme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ferm","error-unrecognized-form-feminine-indefinite-singular":"fermă","error-unrecognized-form-indefinite-masculine-plural":"fermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ferme","definite-error-unrecognized-form-masculine-neuter-singular":"fermul","definite-error-unrecognized-form-feminine-singular":"ferma","definite-error-unrecognized-form-masculine-plural":"fermii","definite-error-unrecognized-form-feminine-neuter-plural":"fermele"}},{"word":"ferma","pos":"noun","definitions":["definite nominative/accusative singular of fermă"],"pronunciation":"[ˈferma]","gender":"f"},{"word":"fermă","pos":"noun","definitions":["farm"],"forms":{"plural":"ferme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fermă","accusative-definite-nominative-singular":"ferma","accusative-indefinite-nominative-plural":"ferme","accusative-definite-nominative-plural":"fermele","dative-genitive-indefinite-singular":"ferme","dative-definite-genitive-singular":"fermei","dative-genitive-indefinite-plural":"ferme","dative-definite-genitive-plural":"fermelor","singular-vocative":"fermă","plural-vocative":"fermelor"}},{"word":"fermata","pos":"noun","definitions":["fermata"]},{"word":"fermată","pos":"noun","definitions":["fermata (the holding of a note)"],"forms":{"plural":"fermate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fermată","accusative-definite-nominative-singular":"fermata","accusative-indefinite-nominative-plural":"fermate","accusative-definite-nominative-plural":"fermatele","dative-genitive-indefinite-singular":"fermate","dative-definite-genitive-singular":"fermatei","dative-genitive-indefinite-plural":"fermate","dative-definite-genitive-plural":"fermatelor","singular-vocative":"fermată","plural-vocative":"fermatelor"}},{"word":"ferme","pos":"noun","definitions":["inflection of fermă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈferme]","gender":"f"},{"word":"fermeca","pos":"verb","definitions":["to enchant, bewitch, enthrall"],"pronunciation":"/fer.meˈka/","forms":{"canonical":"a fermeca 1st conjugation","present-singular-third-person":"farmecă","participle-past":"fermecat","subjunctive-third-person":"farmece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fermeca","gerund":"fermecând","first-person-indicative-present-singular":"farmec","indicative-present-second-person-singular":"farmeci","indicative-present-singular-third-person":"farmecă","first-person-indicative-plural-present":"fermecăm","indicative-plural-present-second-person":"fermecați","indicative-plural-present-third-person":"farmecă","first-person-imperfect-indicative-singular":"fermecam","imperfect-indicative-second-person-singular":"fermecai","imperfect-indicative-singular-third-person":"fermeca","first-person-imperfect-indicative-plural":"fermecam","imperfect-indicative-plural-second-person":"fermecați","imperfect-indicative-plural-third-person":"fermecau","first-person-indicative-perfect-singular":"fermecai","indicative-perfect-second-person-singular":"fermecași","indicative-perfect-singular-third-person":"fermecă","first-person-indicative-perfect-plural":"fermecarăm","indicative-perfect-plural-second-person":"fermecarăți","indicative-perfect-plural-third-person":"fermecară","first-person-indicative-pluperfect-singular":"fermecasem","indicative-pluperfect-second-person-singular":"fermecaseși","indicative-pluperfect-singular-third-person":"fermecase","first-person-indicative-pluperfect-plural":"fermecaserăm","indicative-pluperfect-plural-second-person":"fermecaserăți","indicative-pluperfect-plural-third-person":"fermecaseră","first-person-present-singular-subjunctive":"să farmec","present-second-person-singular-subjunctive":"să farmeci","present-singular-subjunctive-third-person":"să farmece","first-person-plural-present-subjunctive":"să fermecăm","plural-present-second-person-subjunctive":"să fermecați","plural-present-subjunctive-third-person":"să farmece","imperative-second-person-singular":"farmecă","imperative-plural-second-person":"fermecați","imperative-negative-second-person-singular":"nu fermeca","imperative-negative-plural-second-person":"nu fermecați","alternative-common":"fărmeca"}},{"word":"fermecare","pos":"noun","definitions":["spellbinding","captivation"],"forms":{"plural":"fermecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fermecare","accusative-definite-nominative-singular":"fermecarea","accusative-indefinite-nominative-plural":"fermecări","accusative-definite-nominative-plural":"fermecările","dative-genitive-indefinite-singular":"fermecări","dative-definite-genitive-singular":"fermecării","dative-genitive-indefinite-plural":"fermecări","dative-definite-genitive-plural":"fermecărilor","singular-vocative":"fermecare","plural-vocative":"fermecărilor"}},{"word":"fermecat","pos":"adj","definitions":["charmed"],"forms":{"feminine-singular":"fermecată","masculine-plural":"fermecați","feminine-neuter-plural":"fermecate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermecat","error-unrecognized-form-feminine-indefinite-singular":"fermecată","error-unrecognized-form-indefinite-masculine-plural":"fermecați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermecate","definite-error-unrecognized-form-masculine-neuter-singular":"fermecatul","definite-error-unrecognized-form-feminine-singular":"fermecata","definite-error-unrecognized-form-masculine-plural":"fermecații","definite-error-unrecognized-form-feminine-neuter-plural":"fermecatele"}},{"word":"fermecător","pos":"adj","definitions":["charming"],"pronunciation":"/ˌfer.me.kəˈtor/","forms":{"feminine-singular":"fermecătoare","masculine-plural":"fermecători","feminine-neuter-plural":"fermecătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermecător","error-unrecognized-form-feminine-indefinite-singular":"fermecătoare","error-unrecognized-form-indefinite-masculine-plural":"fermecători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermecătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fermecătorul","definite-error-unrecognized-form-feminine-singular":"fermecătoarea","definite-error-unrecognized-form-masculine-plural":"fermecătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fermecătoarele"}},{"word":"fermecătoreasă","pos":"noun","definitions":["female equivalent of fermecător"],"forms":{"plural":"fermecătorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fermecătoreasă","accusative-definite-nominative-singular":"fermecătoreasa","accusative-indefinite-nominative-plural":"fermecătorese","accusative-definite-nominative-plural":"fermecătoresele","dative-genitive-indefinite-singular":"fermecătorese","dative-definite-genitive-singular":"fermecătoresei","dative-genitive-indefinite-plural":"fermecătorese","dative-definite-genitive-plural":"fermecătoreselor","singular-vocative":"fermecătoreasă","plural-vocative":"fermecătoreselor"}},{"word":"fermecătoresc","pos":"adj","definitions":["magic"],"forms":{"feminine-singular":"fermecătorească","plural":"fermecătorești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermecătoresc","error-unrecognized-form-feminine-indefinite-singular":"fermecătorească","error-unrecognized-form-indefinite-masculine-plural":"fermecătorești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermecătorești","definite-error-unrecognized-form-masculine-neuter-singular":"fermecătorescul","definite-error-unrecognized-form-feminine-singular":"fermecătoreasca","definite-error-unrecognized-form-masculine-plural":"fermecătoreștii","definite-error-unrecognized-form-feminine-neuter-plural":"fermecătoreștile"}},{"word":"fermecătorie","pos":"noun","definitions":["sorcery, wizardry"],"forms":{"plural":"fermecătorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fermecătorie","accusative-definite-nominative-singular":"fermecătoria","accusative-indefinite-nominative-plural":"fermecătorii","accusative-definite-nominative-plural":"fermecătoriile","dative-genitive-indefinite-singular":"fermecătorii","dative-definite-genitive-singular":"fermecătoriei","dative-genitive-indefinite-plural":"fermecătorii","dative-definite-genitive-plural":"fermecătoriilor","singular-vocative":"fermecătorie","plural-vocative":"fermecătoriilor"}}];
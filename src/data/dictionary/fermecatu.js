@@ -0,0 +1 @@
+export default [{"word":"fermecătură","pos":"noun","definitions":["enchantment, magic, spell"],"forms":{"plural":"fermecături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fermecătură","accusative-definite-nominative-singular":"fermecătura","accusative-indefinite-nominative-plural":"fermecături","accusative-definite-nominative-plural":"fermecăturile","dative-genitive-indefinite-singular":"fermecături","dative-definite-genitive-singular":"fermecăturii","dative-genitive-indefinite-plural":"fermecături","dative-definite-genitive-plural":"fermecăturilor","singular-vocative":"fermecătură","plural-vocative":"fermecăturilor"}},{"word":"fermelor","pos":"noun","definitions":["definite genitive/dative plural of fermă"]},{"word":"fermenaș","pos":"noun","definitions":["diminutive of fermenea"],"forms":{"plural":"fermenașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fermenaș","accusative-definite-nominative-singular":"fermenașul","accusative-indefinite-nominative-plural":"fermenașe","accusative-definite-nominative-plural":"fermenașele","dative-genitive-indefinite-singular":"fermenaș","dative-definite-genitive-singular":"fermenașului","dative-genitive-indefinite-plural":"fermenașe","dative-definite-genitive-plural":"fermenașelor","singular-vocative":"fermenașule","plural-vocative":"fermenașelor"}},{"word":"ferment","pos":"noun","definitions":["ferment"],"forms":{"plural":"fermenți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ferment","accusative-definite-nominative-singular":"fermentul","accusative-indefinite-nominative-plural":"fermenți","accusative-definite-nominative-plural":"fermenții","dative-genitive-indefinite-singular":"ferment","dative-definite-genitive-singular":"fermentului","dative-genitive-indefinite-plural":"fermenți","dative-definite-genitive-plural":"fermenților","singular-vocative":"fermentule","plural-vocative":"fermenților"}},{"word":"fermenta","pos":"verb","definitions":["to ferment"],"pronunciation":"/fer.menˈta/","forms":{"canonical":"a fermenta 1st conjugation","present-singular-third-person":"fermentează","participle-past":"fermentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fermenta","gerund":"fermentând","first-person-indicative-present-singular":"fermentez","indicative-present-second-person-singular":"fermentezi","indicative-present-singular-third-person":"fermentează","first-person-indicative-plural-present":"fermentăm","indicative-plural-present-second-person":"fermentați","indicative-plural-present-third-person":"fermentează","first-person-imperfect-indicative-singular":"fermentam","imperfect-indicative-second-person-singular":"fermentai","imperfect-indicative-singular-third-person":"fermenta","first-person-imperfect-indicative-plural":"fermentam","imperfect-indicative-plural-second-person":"fermentați","imperfect-indicative-plural-third-person":"fermentau","first-person-indicative-perfect-singular":"fermentai","indicative-perfect-second-person-singular":"fermentași","indicative-perfect-singular-third-person":"fermentă","first-person-indicative-perfect-plural":"fermentarăm","indicative-perfect-plural-second-person":"fermentarăți","indicative-perfect-plural-third-person":"fermentară","first-person-indicative-pluperfect-singular":"fermentasem","indicative-pluperfect-second-person-singular":"fermentaseși","indicative-pluperfect-singular-third-person":"fermentase","first-person-indicative-pluperfect-plural":"fermentaserăm","indicative-pluperfect-plural-second-person":"fermentaserăți","indicative-pluperfect-plural-third-person":"fermentaseră","first-person-present-singular-subjunctive":"să fermentez","present-second-person-singular-subjunctive":"să fermentezi","present-singular-subjunctive-third-person":"să fermenteze","first-person-plural-present-subjunctive":"să fermentăm","plural-present-second-person-subjunctive":"să fermentați","plural-present-subjunctive-third-person":"să fermenteze","imperative-second-person-singular":"fermentează","imperative-plural-second-person":"fermentați","imperative-negative-second-person-singular":"nu fermenta","imperative-negative-plural-second-person":"nu fermentați"}},{"word":"fermentabil","pos":"adj","definitions":["fermentable"],"forms":{"feminine-singular":"fermentabilă","masculine-plural":"fermentabili","feminine-neuter-plural":"fermentabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermentabil","error-unrecognized-form-feminine-indefinite-singular":"fermentabilă","error-unrecognized-form-indefinite-masculine-plural":"fermentabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermentabile","definite-error-unrecognized-form-masculine-neuter-singular":"fermentabilul","definite-error-unrecognized-form-feminine-singular":"fermentabila","definite-error-unrecognized-form-masculine-plural":"fermentabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fermentabilele"}},{"word":"fermentare","pos":"noun","definitions":["ferment"],"forms":{"plural":"fermentări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fermentare","accusative-definite-nominative-singular":"fermentarea","accusative-indefinite-nominative-plural":"fermentări","accusative-definite-nominative-plural":"fermentările","dative-genitive-indefinite-singular":"fermentări","dative-definite-genitive-singular":"fermentării","dative-genitive-indefinite-plural":"fermentări","dative-definite-genitive-plural":"fermentărilor","singular-vocative":"fermentare","plural-vocative":"fermentărilor"}},{"word":"fermentat","pos":"noun","definitions":["fermentation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fermentat","accusative-definite-nominative":"fermentatul","dative-genitive-indefinite":"fermentat","dative-definite-genitive":"fermentatului","vocative":"fermentatule"}},{"word":"fermentație","pos":"noun","definitions":["fermentation"],"pronunciation":"/fermenˈtat͡si.e/","forms":{"plural":"fermentații"}},{"word":"fermentațiune","pos":"noun","definitions":["obsolete form of fermentație"],"forms":{"plural":"fermentațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fermentațiune","accusative-definite-nominative-singular":"fermentațiunea","accusative-indefinite-nominative-plural":"fermentațiuni","accusative-definite-nominative-plural":"fermentațiunile","dative-genitive-indefinite-singular":"fermentațiuni","dative-definite-genitive-singular":"fermentațiunii","dative-genitive-indefinite-plural":"fermentațiuni","dative-definite-genitive-plural":"fermentațiunilor","singular-vocative":"fermentațiune","plural-vocative":"fermentațiunilor"}},{"word":"fermentativ","pos":"adj","definitions":["fermentative"],"forms":{"feminine-singular":"fermentativă","masculine-plural":"fermentativi","feminine-neuter-plural":"fermentative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermentativ","error-unrecognized-form-feminine-indefinite-singular":"fermentativă","error-unrecognized-form-indefinite-masculine-plural":"fermentativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermentative","definite-error-unrecognized-form-masculine-neuter-singular":"fermentativul","definite-error-unrecognized-form-feminine-singular":"fermentativa","definite-error-unrecognized-form-masculine-plural":"fermentativii","definite-error-unrecognized-form-feminine-neuter-plural":"fermentativele"}},{"word":"fermentescibil","pos":"adj","definitions":["fermentable"],"forms":{"feminine-singular":"fermentescibilă","masculine-plural":"fermentescibili","feminine-neuter-plural":"fermentescibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fermentescibil","error-unrecognized-form-feminine-indefinite-singular":"fermentescibilă","error-unrecognized-form-indefinite-masculine-plural":"fermentescibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fermentescibile","definite-error-unrecognized-form-masculine-neuter-singular":"fermentescibilul","definite-error-unrecognized-form-feminine-singular":"fermentescibila","definite-error-unrecognized-form-masculine-plural":"fermentescibilii","definite-error-unrecognized-form-feminine-neuter-plural":"fermentescibilele"}},{"word":"fermentescibilitate","pos":"noun","definitions":["fermentability"],"forms":{"plural":"fermentescibilitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fermentescibilitate","accusative-definite-nominative-singular":"fermentescibilitatea","accusative-indefinite-nominative-plural":"fermentescibilitatăți","accusative-definite-nominative-plural":"fermentescibilitatățile","dative-genitive-indefinite-singular":"fermentescibilitatăți","dative-definite-genitive-singular":"fermentescibilitatății","dative-genitive-indefinite-plural":"fermentescibilitatăți","dative-definite-genitive-plural":"fermentescibilitatăților","singular-vocative":"fermentescibilitate","plural-vocative":"fermentescibilitatăților"}},{"word":"fermier","pos":"noun","definitions":["farmer"],"forms":{"plural":"fermieri","feminine":"equivalent fermieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fermier","accusative-definite-nominative-singular":"fermierul","accusative-indefinite-nominative-plural":"fermieri","accusative-definite-nominative-plural":"fermierii","dative-genitive-indefinite-singular":"fermier","dative-definite-genitive-singular":"fermierului","dative-genitive-indefinite-plural":"fermieri","dative-definite-genitive-plural":"fermierilor","singular-vocative":"fermierule","plural-vocative":"fermierilor"}},{"word":"fermieră","pos":"noun","definitions":["female equivalent of fermier"],"forms":{"plural":"fermiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fermieră","accusative-definite-nominative-singular":"fermiera","accusative-indefinite-nominative-plural":"fermiere","accusative-definite-nominative-plural":"fermierele","dative-genitive-indefinite-singular":"fermiere","dative-definite-genitive-singular":"fermierei","dative-genitive-indefinite-plural":"fermiere","dative-definite-genitive-plural":"fermierelor","singular-vocative":"fermieră","plural-vocative":"fermierelor"}},{"word":"fermieri","pos":"noun","definitions":["plural of fermier"]},{"word":"fermion","pos":"noun","definitions":["fermion"],"forms":{"plural":"fermioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fermion","accusative-definite-nominative-singular":"fermionul","accusative-indefinite-nominative-plural":"fermioni","accusative-definite-nominative-plural":"fermionii","dative-genitive-indefinite-singular":"fermion","dative-definite-genitive-singular":"fermionului","dative-genitive-indefinite-plural":"fermioni","dative-definite-genitive-plural":"fermionilor","singular-vocative":"fermionule","plural-vocative":"fermionilor"}},{"word":"fermitate","pos":"noun","definitions":["resoluteness","rigour","determination"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fermitate","accusative-definite-nominative":"fermitatea","dative-genitive-indefinite":"fermități","dative-definite-genitive":"fermității","vocative":"fermitate"}},{"word":"fermiu","pos":"noun","definitions":["fermium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fermiu","accusative-definite-nominative":"fermiul","dative-genitive-indefinite":"fermiu","dative-definite-genitive":"fermiului","vocative":"fermiule"}},{"word":"fermo","pos":"noun","definitions":["vocative singular of fermă"],"pronunciation":"[ˈfermo]","gender":"f"},{"word":"fermoar","pos":"noun","definitions":["zipper"],"forms":{"plural":"fermoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fermoar","accusative-definite-nominative-singular":"fermoarul","accusative-indefinite-nominative-plural":"fermoare","accusative-definite-nominative-plural":"fermoarele","dative-genitive-indefinite-singular":"fermoar","dative-definite-genitive-singular":"fermoarului","dative-genitive-indefinite-plural":"fermoare","dative-definite-genitive-plural":"fermoarelor","singular-vocative":"fermoarule","plural-vocative":"fermoarelor"}},{"word":"fernambuc","pos":"noun","definitions":["brazilwood"],"forms":{"plural":"fernambucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fernambuc","accusative-definite-nominative-singular":"fernambucul","accusative-indefinite-nominative-plural":"fernambucuri","accusative-definite-nominative-plural":"fernambucurile","dative-genitive-indefinite-singular":"fernambuc","dative-definite-genitive-singular":"fernambucului","dative-genitive-indefinite-plural":"fernambucuri","dative-definite-genitive-plural":"fernambucurilor","singular-vocative":"fernambucule","plural-vocative":"fernambucurilor"}},{"word":"feroaliaj","pos":"noun","definitions":["ferroalloy"],"forms":{"plural":"feroaliaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feroaliaj","accusative-definite-nominative-singular":"feroaliajul","accusative-indefinite-nominative-plural":"feroaliaje","accusative-definite-nominative-plural":"feroaliajele","dative-genitive-indefinite-singular":"feroaliaj","dative-definite-genitive-singular":"feroaliajului","dative-genitive-indefinite-plural":"feroaliaje","dative-definite-genitive-plural":"feroaliajelor","singular-vocative":"feroaliajule","plural-vocative":"feroaliajelor"}},{"word":"feroaluminiu","pos":"noun","definitions":["ferroaluminum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feroaluminiu","accusative-definite-nominative":"feroaluminiul","dative-genitive-indefinite":"feroaluminiu","dative-definite-genitive":"feroaluminiului","vocative":"feroaluminiule"}},{"word":"ferobacter","pos":"noun","definitions":["ferrobacterium"],"forms":{"plural":"ferobacteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ferobacter","accusative-definite-nominative-singular":"ferobacterul","accusative-indefinite-nominative-plural":"ferobacteri","accusative-definite-nominative-plural":"ferobacterii","dative-genitive-indefinite-singular":"ferobacter","dative-definite-genitive-singular":"ferobacterului","dative-genitive-indefinite-plural":"ferobacteri","dative-definite-genitive-plural":"ferobacterilor","singular-vocative":"ferobacterule","plural-vocative":"ferobacterilor"}},{"word":"feroce","pos":"adj","definitions":["ferocious, fierce"],"forms":{"masculine-plural":"feroci","feminine-neuter-plural":"feroce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feroce","error-unrecognized-form-feminine-indefinite-singular":"feroce","error-unrecognized-form-indefinite-masculine-plural":"feroci","error-unrecognized-form-feminine-indefinite-neuter-plural":"feroce","definite-error-unrecognized-form-masculine-neuter-singular":"ferocele","definite-error-unrecognized-form-feminine-singular":"ferocea","definite-error-unrecognized-form-masculine-plural":"ferocii","definite-error-unrecognized-form-feminine-neuter-plural":"ferocele"}},{"word":"ferocianură","pos":"noun","definitions":["ferrocyanide"],"forms":{"plural":"ferocianuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ferocianură","accusative-definite-nominative-singular":"ferocianura","accusative-indefinite-nominative-plural":"ferocianuri","accusative-definite-nominative-plural":"ferocianurile","dative-genitive-indefinite-singular":"ferocianuri","dative-definite-genitive-singular":"ferocianurii","dative-genitive-indefinite-plural":"ferocianuri","dative-definite-genitive-plural":"ferocianurilor","singular-vocative":"ferocianură","plural-vocative":"ferocianurilor"}},{"word":"ferocitate","pos":"noun","definitions":["ferocity"],"pronunciation":"[fe.ro.t͡ʃiˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"ferocitate","accusative-definite-nominative":"ferocitatea","dative-genitive-indefinite":"ferocități","dative-definite-genitive":"ferocității","vocative":"ferocitate"}},{"word":"ferocrom","pos":"noun","definitions":["ferrochrome"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferocrom","accusative-definite-nominative":"ferocromul","dative-genitive-indefinite":"ferocrom","dative-definite-genitive":"ferocromului","vocative":"ferocromule"}},{"word":"ferodo","pos":"noun","definitions":["alternative form of ferodou"],"forms":{"plural":"ferodouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ferodo","accusative-definite-nominative-singular":"ferodoul","accusative-indefinite-nominative-plural":"ferodouri","accusative-definite-nominative-plural":"ferodourile","dative-genitive-indefinite-singular":"ferodo","dative-definite-genitive-singular":"ferodoului","dative-genitive-indefinite-plural":"ferodouri","dative-definite-genitive-plural":"ferodourilor","singular-vocative":"ferodoule","plural-vocative":"ferodourilor"}},{"word":"feroelectric","pos":"adj","definitions":["ferroelectric"],"forms":{"feminine-singular":"feroelectrică","masculine-plural":"feroelectrici","feminine-neuter-plural":"feroelectrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feroelectric","error-unrecognized-form-feminine-indefinite-singular":"feroelectrică","error-unrecognized-form-indefinite-masculine-plural":"feroelectrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feroelectrice","definite-error-unrecognized-form-masculine-neuter-singular":"feroelectricul","definite-error-unrecognized-form-feminine-singular":"feroelectrica","definite-error-unrecognized-form-masculine-plural":"feroelectricii","definite-error-unrecognized-form-feminine-neuter-plural":"feroelectricele"}},{"word":"feroelectricitate","pos":"noun","definitions":["ferroelectricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"feroelectricitate","accusative-definite-nominative":"feroelectricitatea","dative-genitive-indefinite":"feroelectricități","dative-definite-genitive":"feroelectricității","vocative":"-"}},{"word":"feroeză","pos":"noun","definitions":["female equivalent of feroez"],"forms":{"plural":"feroeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feroeză","accusative-definite-nominative-singular":"feroeza","accusative-indefinite-nominative-plural":"feroeze","accusative-definite-nominative-plural":"feroezele","dative-genitive-indefinite-singular":"feroeze","dative-definite-genitive-singular":"feroezei","dative-genitive-indefinite-plural":"feroeze","dative-definite-genitive-plural":"feroezelor","singular-vocative":"feroeză","plural-vocative":"feroezelor"}},{"word":"Feroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Feroiu"}},{"word":"feromagnetic","pos":"adj","definitions":["ferromagnetic"],"forms":{"feminine-singular":"feromagnetică","masculine-plural":"feromagnetici","feminine-neuter-plural":"feromagnetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feromagnetic","error-unrecognized-form-feminine-indefinite-singular":"feromagnetică","error-unrecognized-form-indefinite-masculine-plural":"feromagnetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"feromagnetice","definite-error-unrecognized-form-masculine-neuter-singular":"feromagneticul","definite-error-unrecognized-form-feminine-singular":"feromagnetica","definite-error-unrecognized-form-masculine-plural":"feromagneticii","definite-error-unrecognized-form-feminine-neuter-plural":"feromagneticele"}},{"word":"feromagnetism","pos":"noun","definitions":["ferromagnetism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feromagnetism","accusative-definite-nominative":"feromagnetismul","dative-genitive-indefinite":"feromagnetism","dative-definite-genitive":"feromagnetismului","vocative":"feromagnetismule"}},{"word":"feromolibden","pos":"noun","definitions":["ferromolybdenum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feromolibden","accusative-definite-nominative":"feromolibdenul","dative-genitive-indefinite":"feromolibden","dative-definite-genitive":"feromolibdenului","vocative":"feromolibdenule"}},{"word":"feromon","pos":"noun","definitions":["pheromone"],"forms":{"plural":"feromoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feromon","accusative-definite-nominative-singular":"feromonul","accusative-indefinite-nominative-plural":"feromoni","accusative-definite-nominative-plural":"feromonii","dative-genitive-indefinite-singular":"feromon","dative-definite-genitive-singular":"feromonului","dative-genitive-indefinite-plural":"feromoni","dative-definite-genitive-plural":"feromonilor","singular-vocative":"feromonule","plural-vocative":"feromonilor"}},{"word":"feronerie","pos":"noun","definitions":["ironwork"],"forms":{"plural":"feronerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"feronerie","accusative-definite-nominative-singular":"feroneria","accusative-indefinite-nominative-plural":"feronerii","accusative-definite-nominative-plural":"feroneriile","dative-genitive-indefinite-singular":"feronerii","dative-definite-genitive-singular":"feroneriei","dative-genitive-indefinite-plural":"feronerii","dative-definite-genitive-plural":"feroneriilor","singular-vocative":"feronerie","plural-vocative":"feroneriilor"}},{"word":"feronichel","pos":"noun","definitions":["ferronickel"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"feronichel","accusative-definite-nominative":"feronichelul","dative-genitive-indefinite":"feronichel","dative-definite-genitive":"feronichelului","vocative":"feronichelule"}},{"word":"feros","pos":"adj","definitions":["ferriferous"],"forms":{"feminine-singular":"feroasă","masculine-plural":"feroși","feminine-neuter-plural":"feroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feros","error-unrecognized-form-feminine-indefinite-singular":"feroasă","error-unrecognized-form-indefinite-masculine-plural":"feroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"feroase","definite-error-unrecognized-form-masculine-neuter-singular":"ferosul","definite-error-unrecognized-form-feminine-singular":"feroasa","definite-error-unrecognized-form-masculine-plural":"feroșii","definite-error-unrecognized-form-feminine-neuter-plural":"feroasele"}},{"word":"ferosiliciu","pos":"noun","definitions":["ferrosilicon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferosiliciu","accusative-definite-nominative":"ferosiliciuul","dative-genitive-indefinite":"ferosiliciu","dative-definite-genitive":"ferosiliciuului","vocative":"ferosiliciuule"}},{"word":"ferotipie","pos":"noun","definitions":["ferrotype"],"forms":{"plural":"ferotipii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ferotipie","accusative-definite-nominative-singular":"ferotipia","accusative-indefinite-nominative-plural":"ferotipii","accusative-definite-nominative-plural":"ferotipiile","dative-genitive-indefinite-singular":"ferotipii","dative-definite-genitive-singular":"ferotipiei","dative-genitive-indefinite-plural":"ferotipii","dative-definite-genitive-plural":"ferotipiilor","singular-vocative":"ferotipie","plural-vocative":"ferotipiilor"}},{"word":"ferotitan","pos":"noun","definitions":["ferrotitanium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferotitan","accusative-definite-nominative":"ferotitanul","dative-genitive-indefinite":"ferotitan","dative-definite-genitive":"ferotitanului","vocative":"ferotitanule"}},{"word":"ferovanadiu","pos":"noun","definitions":["ferrovanadium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ferovanadiu","accusative-definite-nominative":"ferovanadiuul","dative-genitive-indefinite":"ferovanadiu","dative-definite-genitive":"ferovanadiuului","vocative":"ferovanadiuule"}},{"word":"feroviar","pos":"adj","definitions":["rail, railway, railroad transportation"],"examples":[{"ro":"transport feroviar","en":null}],"forms":{"feminine-singular":"feroviară","masculine-plural":"feroviari","feminine-neuter-plural":"feroviare"}},{"word":"feroviar","pos":"noun","definitions":["railwayman, railway worker"],"forms":{"plural":"feroviari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feroviar","accusative-definite-nominative-singular":"feroviarul","accusative-indefinite-nominative-plural":"feroviari","accusative-definite-nominative-plural":"feroviarii","dative-genitive-indefinite-singular":"feroviar","dative-definite-genitive-singular":"feroviarului","dative-genitive-indefinite-plural":"feroviari","dative-definite-genitive-plural":"feroviarilor","singular-vocative":"feroviarule","plural-vocative":"feroviarilor"}},{"word":"feroviară","pos":"noun","definitions":["female equivalent of feroviar"],"forms":{"plural":"feroviare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feroviară","accusative-definite-nominative-singular":"feroviara","accusative-indefinite-nominative-plural":"feroviare","accusative-definite-nominative-plural":"feroviarele","dative-genitive-indefinite-singular":"feroviare","dative-definite-genitive-singular":"feroviarei","dative-genitive-indefinite-plural":"feroviare","dative-definite-genitive-plural":"feroviarelor","singular-vocative":"feroviară","plural-vocative":"feroviarelor"}},{"word":"ferpar","pos":"noun","definitions":["announcement"],"forms":{"plural":"ferpare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ferpar","accusative-definite-nominative-singular":"ferparul","accusative-indefinite-nominative-plural":"ferpare","accusative-definite-nominative-plural":"ferparele","dative-genitive-indefinite-singular":"ferpar","dative-definite-genitive-singular":"ferparului","dative-genitive-indefinite-plural":"ferpare","dative-definite-genitive-plural":"ferparelor","singular-vocative":"ferparule","plural-vocative":"ferparelor"}},{"word":"Fersig","pos":"name","definitions":["a village in Satulung, Maramureș County, Romania"],"gender":"m"},{"word":"fertil","pos":"adj","definitions":["fertile"],"pronunciation":"/ferˈtil/","forms":{"feminine-singular":"fertilă","masculine-plural":"fertili","feminine-neuter-plural":"fertile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fertil","error-unrecognized-form-feminine-indefinite-singular":"fertilă","error-unrecognized-form-indefinite-masculine-plural":"fertili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fertile","definite-error-unrecognized-form-masculine-neuter-singular":"fertilul","definite-error-unrecognized-form-feminine-singular":"fertila","definite-error-unrecognized-form-masculine-plural":"fertilii","definite-error-unrecognized-form-feminine-neuter-plural":"fertilele"}},{"word":"fertilitate","pos":"noun","definitions":["fertility"],"pronunciation":"[fer.ti.liˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"fertilitate","accusative-definite-nominative":"fertilitatea","dative-genitive-indefinite":"fertilități","dative-definite-genitive":"fertilității","vocative":"fertilitate"}},{"word":"fertiliza","pos":"verb","definitions":["to fertilize"],"pronunciation":"/fer.ti.liˈza/","forms":{"canonical":"a fertiliza 1st conjugation","present-singular-third-person":"fertilizează","participle-past":"fertilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fertiliza","gerund":"fertilizând","first-person-indicative-present-singular":"fertilizez","indicative-present-second-person-singular":"fertilizezi","indicative-present-singular-third-person":"fertilizează","first-person-indicative-plural-present":"fertilizăm","indicative-plural-present-second-person":"fertilizați","indicative-plural-present-third-person":"fertilizează","first-person-imperfect-indicative-singular":"fertilizam","imperfect-indicative-second-person-singular":"fertilizai","imperfect-indicative-singular-third-person":"fertiliza","first-person-imperfect-indicative-plural":"fertilizam","imperfect-indicative-plural-second-person":"fertilizați","imperfect-indicative-plural-third-person":"fertilizau","first-person-indicative-perfect-singular":"fertilizai","indicative-perfect-second-person-singular":"fertilizași","indicative-perfect-singular-third-person":"fertiliză","first-person-indicative-perfect-plural":"fertilizarăm","indicative-perfect-plural-second-person":"fertilizarăți","indicative-perfect-plural-third-person":"fertilizară","first-person-indicative-pluperfect-singular":"fertilizasem","indicative-pluperfect-second-person-singular":"fertilizaseși","indicative-pluperfect-singular-third-person":"fertilizase","first-person-indicative-pluperfect-plural":"fertilizaserăm","indicative-pluperfect-plural-second-person":"fertilizaserăți","indicative-pluperfect-plural-third-person":"fertilizaseră","first-person-present-singular-subjunctive":"să fertilizez","present-second-person-singular-subjunctive":"să fertilizezi","present-singular-subjunctive-third-person":"să fertilizeze","first-person-plural-present-subjunctive":"să fertilizăm","plural-present-second-person-subjunctive":"să fertilizați","plural-present-subjunctive-third-person":"să fertilizeze","imperative-second-person-singular":"fertilizează","imperative-plural-second-person":"fertilizați","imperative-negative-second-person-singular":"nu fertiliza","imperative-negative-plural-second-person":"nu fertilizați"}},{"word":"fertilizabil","pos":"adj","definitions":["fertilizable"],"forms":{"feminine-singular":"fertilizabilă","masculine-plural":"fertilizabili","feminine-neuter-plural":"fertilizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fertilizabil","error-unrecognized-form-feminine-indefinite-singular":"fertilizabilă","error-unrecognized-form-indefinite-masculine-plural":"fertilizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fertilizabile","definite-error-unrecognized-form-masculine-neuter-singular":"fertilizabilul","definite-error-unrecognized-form-feminine-singular":"fertilizabila","definite-error-unrecognized-form-masculine-plural":"fertilizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fertilizabilele"}},{"word":"fertilizant","pos":"adj","definitions":["fertilizing"],"forms":{"feminine-singular":"fertilizantă","masculine-plural":"fertilizanți","feminine-neuter-plural":"fertilizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fertilizant","error-unrecognized-form-feminine-indefinite-singular":"fertilizantă","error-unrecognized-form-indefinite-masculine-plural":"fertilizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fertilizante","definite-error-unrecognized-form-masculine-neuter-singular":"fertilizantul","definite-error-unrecognized-form-feminine-singular":"fertilizanta","definite-error-unrecognized-form-masculine-plural":"fertilizanții","definite-error-unrecognized-form-feminine-neuter-plural":"fertilizantele"}},{"word":"fertilizare","pos":"noun","definitions":["fertilization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"fertilizare","accusative-definite-nominative":"fertilizarea","dative-genitive-indefinite":"fertilizare","dative-definite-genitive":"fertilizarei","vocative":"fertilizare"}},{"word":"fertilizat","pos":"adj","definitions":["fertilized"],"forms":{"feminine-singular":"fertilizată","masculine-plural":"fertilizați","feminine-neuter-plural":"fertilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fertilizat","error-unrecognized-form-feminine-indefinite-singular":"fertilizată","error-unrecognized-form-indefinite-masculine-plural":"fertilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fertilizate","definite-error-unrecognized-form-masculine-neuter-singular":"fertilizatul","definite-error-unrecognized-form-feminine-singular":"fertilizata","definite-error-unrecognized-form-masculine-plural":"fertilizații","definite-error-unrecognized-form-feminine-neuter-plural":"fertilizatele"}},{"word":"feruginos","pos":"adj","definitions":["ferruginous"],"forms":{"feminine-singular":"feruginoasă","masculine-plural":"feruginoși","feminine-neuter-plural":"feruginoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feruginos","error-unrecognized-form-feminine-indefinite-singular":"feruginoasă","error-unrecognized-form-indefinite-masculine-plural":"feruginoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"feruginoase","definite-error-unrecognized-form-masculine-neuter-singular":"feruginosul","definite-error-unrecognized-form-feminine-singular":"feruginoasa","definite-error-unrecognized-form-masculine-plural":"feruginoșii","definite-error-unrecognized-form-feminine-neuter-plural":"feruginoasele"}},{"word":"ferului","pos":"noun","definitions":["definite genitive/dative singular of fer"]},{"word":"fervent","pos":"adj","definitions":["fervent"],"forms":{"feminine-singular":"ferventă","masculine-plural":"fervenți","feminine-neuter-plural":"fervente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fervent","error-unrecognized-form-feminine-indefinite-singular":"ferventă","error-unrecognized-form-indefinite-masculine-plural":"fervenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fervente","definite-error-unrecognized-form-masculine-neuter-singular":"ferventul","definite-error-unrecognized-form-feminine-singular":"ferventa","definite-error-unrecognized-form-masculine-plural":"fervenții","definite-error-unrecognized-form-feminine-neuter-plural":"ferventele"}},{"word":"fervență","pos":"noun","definitions":["fervency"],"forms":{"plural":"fervențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fervență","accusative-definite-nominative-singular":"fervența","accusative-indefinite-nominative-plural":"fervențe","accusative-definite-nominative-plural":"fervențele","dative-genitive-indefinite-singular":"fervențe","dative-definite-genitive-singular":"fervenței","dative-genitive-indefinite-plural":"fervențe","dative-definite-genitive-plural":"fervențelor","singular-vocative":"fervență","plural-vocative":"fervențelor"}},{"word":"fervid","pos":"adj","definitions":["glowing"],"forms":{"feminine-singular":"fervidă","masculine-plural":"fervizi","feminine-neuter-plural":"fervide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fervid","error-unrecognized-form-feminine-indefinite-singular":"fervidă","error-unrecognized-form-indefinite-masculine-plural":"fervizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fervide","definite-error-unrecognized-form-masculine-neuter-singular":"fervidul","definite-error-unrecognized-form-feminine-singular":"fervida","definite-error-unrecognized-form-masculine-plural":"fervizii","definite-error-unrecognized-form-feminine-neuter-plural":"fervidele"}},{"word":"fervoare","pos":"noun","definitions":["fervour (intense, heated emotion; passion, ardor)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fervoare","accusative-definite-nominative":"fervoarea","dative-genitive-indefinite":"fervori","dative-definite-genitive":"fervorii","vocative":"fervoare"}},{"word":"fes","pos":"noun","definitions":["fez, hat","beanie"],"forms":{"plural":"fesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fes","accusative-definite-nominative-singular":"fesul","accusative-indefinite-nominative-plural":"fesuri","accusative-definite-nominative-plural":"fesurile","dative-genitive-indefinite-singular":"fes","dative-definite-genitive-singular":"fesului","dative-genitive-indefinite-plural":"fesuri","dative-definite-genitive-plural":"fesurilor","singular-vocative":"fesule","plural-vocative":"fesurilor"}},{"word":"fesa","pos":"noun","definitions":["definite nominative/accusative singular of fesă"],"pronunciation":"[ˈfesa]","gender":"f"},{"word":"fesă","pos":"noun","definitions":["buttock"],"pronunciation":"/ˈfe.sə/","forms":{"plural":"fese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fesă","accusative-definite-nominative-singular":"fesa","accusative-indefinite-nominative-plural":"fese","accusative-definite-nominative-plural":"fesele","dative-genitive-indefinite-singular":"fese","dative-definite-genitive-singular":"fesei","dative-genitive-indefinite-plural":"fese","dative-definite-genitive-plural":"feselor","singular-vocative":"fesă","plural-vocative":"feselor"}},{"word":"fescior","pos":"noun","definitions":["diminutive of fes"],"forms":{"plural":"fescioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fescior","accusative-definite-nominative-singular":"fesciorul","accusative-indefinite-nominative-plural":"fescioare","accusative-definite-nominative-plural":"fescioarele","dative-genitive-indefinite-singular":"fescior","dative-definite-genitive-singular":"fesciorului","dative-genitive-indefinite-plural":"fescioare","dative-definite-genitive-plural":"fescioarelor","singular-vocative":"fesciorule","plural-vocative":"fescioarelor"}},{"word":"fese","pos":"noun","definitions":["inflection of fesă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfese]","gender":"f"},{"word":"fesfesele","pos":"noun","definitions":["jewellery"],"pronunciation":"/fes.feˈse.le/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"fesfesele","accusative-definite-nominative":"fesfeselele","dative-genitive-indefinite":"fesfesele","dative-definite-genitive":"fesfeselelor","vocative":"-"}},{"word":"fesier","pos":"adj","definitions":["pertaining or belonging to the buttocks"],"forms":{"feminine-singular":"fesieră","masculine-plural":"fesieri","feminine-neuter-plural":"fesiere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fesier","error-unrecognized-form-feminine-indefinite-singular":"fesieră","error-unrecognized-form-indefinite-masculine-plural":"fesieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"fesiere","definite-error-unrecognized-form-masculine-neuter-singular":"fesierul","definite-error-unrecognized-form-feminine-singular":"fesiera","definite-error-unrecognized-form-masculine-plural":"fesierii","definite-error-unrecognized-form-feminine-neuter-plural":"fesierele"}},{"word":"fesișor","pos":"noun","definitions":["diminutive of fes"],"forms":{"plural":"fesișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fesișor","accusative-definite-nominative-singular":"fesișorul","accusative-indefinite-nominative-plural":"fesișoare","accusative-definite-nominative-plural":"fesișoarele","dative-genitive-indefinite-singular":"fesișor","dative-definite-genitive-singular":"fesișorului","dative-genitive-indefinite-plural":"fesișoare","dative-definite-genitive-plural":"fesișoarelor","singular-vocative":"fesișorule","plural-vocative":"fesișoarelor"}},{"word":"feșnic","pos":"noun","definitions":["alternative form of sfeșnic"],"forms":{"plural":"feșnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feșnic","accusative-definite-nominative-singular":"feșnicul","accusative-indefinite-nominative-plural":"feșnice","accusative-definite-nominative-plural":"feșnicele","dative-genitive-indefinite-singular":"feșnic","dative-definite-genitive-singular":"feșnicului","dative-genitive-indefinite-plural":"feșnice","dative-definite-genitive-plural":"feșnicelor","singular-vocative":"feșnicule","plural-vocative":"feșnicelor"}},{"word":"feso","pos":"noun","definitions":["vocative singular of fesă"],"pronunciation":"[ˈfeso]","gender":"f"},{"word":"festă","pos":"noun","definitions":["prank"],"forms":{"plural":"feste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"festă","accusative-definite-nominative-singular":"festa","accusative-indefinite-nominative-plural":"feste","accusative-definite-nominative-plural":"festele","dative-genitive-indefinite-singular":"feste","dative-definite-genitive-singular":"festei","dative-genitive-indefinite-plural":"feste","dative-definite-genitive-plural":"festelor","singular-vocative":"festă","plural-vocative":"festelor"}},{"word":"feștanie","pos":"noun","definitions":["alternative form of sfeștanie"],"forms":{"plural":"feștanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"feștanie","accusative-definite-nominative-singular":"feștania","accusative-indefinite-nominative-plural":"feștanii","accusative-definite-nominative-plural":"feștaniile","dative-genitive-indefinite-singular":"feștanii","dative-definite-genitive-singular":"feștaniei","dative-genitive-indefinite-plural":"feștanii","dative-definite-genitive-plural":"feștaniilor","singular-vocative":"feștanie","plural-vocative":"feștaniilor"}},{"word":"feșteală","pos":"noun","definitions":["paint"],"forms":{"plural":"feșteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feșteală","accusative-definite-nominative-singular":"feșteala","accusative-indefinite-nominative-plural":"feștele","accusative-definite-nominative-plural":"feștelele","dative-genitive-indefinite-singular":"feștele","dative-definite-genitive-singular":"feștelei","dative-genitive-indefinite-plural":"feștele","dative-definite-genitive-plural":"feștelelor","singular-vocative":"feșteală","plural-vocative":"feștelelor"}},{"word":"feșteli","pos":"verb","definitions":["to dirty, to tarnish"],"forms":{"canonical":"a feșteli 4th conjugation","present-singular-third-person":"feștelește","participle-past":"feștelit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a feșteli","gerund":"feștelind","first-person-indicative-present-singular":"feștelesc","indicative-present-second-person-singular":"feștelești","indicative-present-singular-third-person":"feștelește","first-person-indicative-plural-present":"feștelim","indicative-plural-present-second-person":"feșteliți","indicative-plural-present-third-person":"feștelesc","first-person-imperfect-indicative-singular":"feșteleam","imperfect-indicative-second-person-singular":"feșteleai","imperfect-indicative-singular-third-person":"feștelea","first-person-imperfect-indicative-plural":"feșteleam","imperfect-indicative-plural-second-person":"feșteleați","imperfect-indicative-plural-third-person":"feșteleau","first-person-indicative-perfect-singular":"feștelii","indicative-perfect-second-person-singular":"feșteliși","indicative-perfect-singular-third-person":"feșteli","first-person-indicative-perfect-plural":"feștelirăm","indicative-perfect-plural-second-person":"feștelirăți","indicative-perfect-plural-third-person":"feșteliră","first-person-indicative-pluperfect-singular":"feștelisem","indicative-pluperfect-second-person-singular":"feșteliseși","indicative-pluperfect-singular-third-person":"feștelise","first-person-indicative-pluperfect-plural":"feșteliserăm","indicative-pluperfect-plural-second-person":"feșteliserăți","indicative-pluperfect-plural-third-person":"feșteliseră","first-person-present-singular-subjunctive":"să feștelesc","present-second-person-singular-subjunctive":"să feștelești","present-singular-subjunctive-third-person":"să feștelească","first-person-plural-present-subjunctive":"să feștelim","plural-present-second-person-subjunctive":"să feșteliți","plural-present-subjunctive-third-person":"să feștelească","imperative-second-person-singular":"feștelește","imperative-plural-second-person":"feșteliți","imperative-negative-second-person-singular":"nu feșteli","imperative-negative-plural-second-person":"nu feșteliți"}},{"word":"feștelire","pos":"noun","definitions":["dirtying"],"forms":{"plural":"feșteliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"feștelire","accusative-definite-nominative-singular":"feștelirea","accusative-indefinite-nominative-plural":"feșteliri","accusative-definite-nominative-plural":"feștelirile","dative-genitive-indefinite-singular":"feșteliri","dative-definite-genitive-singular":"feștelirii","dative-genitive-indefinite-plural":"feșteliri","dative-definite-genitive-plural":"feștelirilor","singular-vocative":"feștelire","plural-vocative":"feștelirilor"}},{"word":"feștelit","pos":"adj","definitions":["dirty"],"forms":{"feminine-singular":"feștelită","masculine-plural":"feșteliți","feminine-neuter-plural":"feștelite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feștelit","error-unrecognized-form-feminine-indefinite-singular":"feștelită","error-unrecognized-form-indefinite-masculine-plural":"feșteliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"feștelite","definite-error-unrecognized-form-masculine-neuter-singular":"feștelitul","definite-error-unrecognized-form-feminine-singular":"feștelita","definite-error-unrecognized-form-masculine-plural":"feșteliții","definite-error-unrecognized-form-feminine-neuter-plural":"feștelitele"}},{"word":"feștelit","pos":"verb","definitions":["past participle of feșteli"],"forms":{"participle-past":"of feșteli"}},{"word":"feștelitoare","pos":"noun","definitions":["female equivalent of feștelitor"],"forms":{"plural":"feștelitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"feștelitoare","accusative-definite-nominative-singular":"feștelitoarea","accusative-indefinite-nominative-plural":"feștelitoare","accusative-definite-nominative-plural":"feștelitoarele","dative-genitive-indefinite-singular":"feștelitoare","dative-definite-genitive-singular":"feștelitoarei","dative-genitive-indefinite-plural":"feștelitoare","dative-definite-genitive-plural":"feștelitoarelor","singular-vocative":"feștelitoare","plural-vocative":"feștelitoarelor"}},{"word":"feștelitură","pos":"noun","definitions":["dirt, filth"],"forms":{"plural":"feștelituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"feștelitură","accusative-definite-nominative-singular":"feștelitura","accusative-indefinite-nominative-plural":"feștelituri","accusative-definite-nominative-plural":"feșteliturile","dative-genitive-indefinite-singular":"feștelituri","dative-definite-genitive-singular":"feșteliturii","dative-genitive-indefinite-plural":"feștelituri","dative-definite-genitive-plural":"feșteliturilor","singular-vocative":"feștelitură","plural-vocative":"feșteliturilor"}},{"word":"festență","pos":"noun","definitions":["female equivalent of feșter"],"forms":{"plural":"festențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"festență","accusative-definite-nominative-singular":"festența","accusative-indefinite-nominative-plural":"festențe","accusative-definite-nominative-plural":"festențele","dative-genitive-indefinite-singular":"festențe","dative-definite-genitive-singular":"festenței","dative-genitive-indefinite-plural":"festențe","dative-definite-genitive-plural":"festențelor","singular-vocative":"festență","plural-vocative":"festențelor"}},{"word":"fești","pos":"verb","definitions":["to paint"],"forms":{"canonical":"a fești 4th conjugation","present-singular-third-person":"feștește","participle-past":"feștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fești","gerund":"feștind","first-person-indicative-present-singular":"feștesc","indicative-present-second-person-singular":"feștești","indicative-present-singular-third-person":"feștește","first-person-indicative-plural-present":"feștim","indicative-plural-present-second-person":"feștiți","indicative-plural-present-third-person":"feștesc","first-person-imperfect-indicative-singular":"feșteam","imperfect-indicative-second-person-singular":"feșteai","imperfect-indicative-singular-third-person":"feștea","first-person-imperfect-indicative-plural":"feșteam","imperfect-indicative-plural-second-person":"feșteați","imperfect-indicative-plural-third-person":"feșteau","first-person-indicative-perfect-singular":"feștii","indicative-perfect-second-person-singular":"feștiși","indicative-perfect-singular-third-person":"fești","first-person-indicative-perfect-plural":"feștirăm","indicative-perfect-plural-second-person":"feștirăți","indicative-perfect-plural-third-person":"feștiră","first-person-indicative-pluperfect-singular":"feștisem","indicative-pluperfect-second-person-singular":"feștiseși","indicative-pluperfect-singular-third-person":"feștise","first-person-indicative-pluperfect-plural":"feștiserăm","indicative-pluperfect-plural-second-person":"feștiserăți","indicative-pluperfect-plural-third-person":"feștiseră","first-person-present-singular-subjunctive":"să feștesc","present-second-person-singular-subjunctive":"să feștești","present-singular-subjunctive-third-person":"să feștească","first-person-plural-present-subjunctive":"să feștim","plural-present-second-person-subjunctive":"să feștiți","plural-present-subjunctive-third-person":"să feștească","imperative-second-person-singular":"feștește","imperative-plural-second-person":"feștiți","imperative-negative-second-person-singular":"nu fești","imperative-negative-plural-second-person":"nu feștiți"}},{"word":"Feștilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Feștilă"}},{"word":"feștilă","pos":"noun","definitions":["wick"],"forms":{"plural":"feștile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feștilă","accusative-definite-nominative-singular":"feștila","accusative-indefinite-nominative-plural":"feștile","accusative-definite-nominative-plural":"feștilele","dative-genitive-indefinite-singular":"feștile","dative-definite-genitive-singular":"feștilei","dative-genitive-indefinite-plural":"feștile","dative-definite-genitive-plural":"feștilelor","singular-vocative":"feștilă","plural-vocative":"feștilelor"}},{"word":"festin","pos":"noun","definitions":["feast"],"forms":{"plural":"festinuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"festin","accusative-definite-nominative-singular":"festinul","accusative-indefinite-nominative-plural":"festinuri","accusative-definite-nominative-plural":"festinurile","dative-genitive-indefinite-singular":"festin","dative-definite-genitive-singular":"festinului","dative-genitive-indefinite-plural":"festinuri","dative-definite-genitive-plural":"festinurilor","singular-vocative":"festinule","plural-vocative":"festinurilor"}},{"word":"festiv","pos":"adj","definitions":["festive"],"forms":{"feminine-singular":"festivă","masculine-plural":"festivi","feminine-neuter-plural":"festive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"festiv","error-unrecognized-form-feminine-indefinite-singular":"festivă","error-unrecognized-form-indefinite-masculine-plural":"festivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"festive","definite-error-unrecognized-form-masculine-neuter-singular":"festivul","definite-error-unrecognized-form-feminine-singular":"festiva","definite-error-unrecognized-form-masculine-plural":"festivii","definite-error-unrecognized-form-feminine-neuter-plural":"festivele"}},{"word":"festival","pos":"noun","definitions":["festival"],"forms":{"plural":"festivaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"festival","accusative-definite-nominative-singular":"festivalul","accusative-indefinite-nominative-plural":"festivaluri","accusative-definite-nominative-plural":"festivalurile","dative-genitive-indefinite-singular":"festival","dative-definite-genitive-singular":"festivalului","dative-genitive-indefinite-plural":"festivaluri","dative-definite-genitive-plural":"festivalurilor","singular-vocative":"festivalule","plural-vocative":"festivalurilor"}},{"word":"festivalier","pos":"adj","definitions":["festival"],"forms":{"feminine-singular":"festivalieră","masculine-plural":"festivalieri","feminine-neuter-plural":"festivaliere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"festivalier","error-unrecognized-form-feminine-indefinite-singular":"festivalieră","error-unrecognized-form-indefinite-masculine-plural":"festivalieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"festivaliere","definite-error-unrecognized-form-masculine-neuter-singular":"festivalierul","definite-error-unrecognized-form-feminine-singular":"festivaliera","definite-error-unrecognized-form-masculine-plural":"festivalierii","definite-error-unrecognized-form-feminine-neuter-plural":"festivalierele"}},{"word":"festivalist","pos":"noun","definitions":["festivalist"],"forms":{"plural":"festivaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"festivalist","accusative-definite-nominative-singular":"festivalistul","accusative-indefinite-nominative-plural":"festivaliști","accusative-definite-nominative-plural":"festivaliștii","dative-genitive-indefinite-singular":"festivalist","dative-definite-genitive-singular":"festivalistului","dative-genitive-indefinite-plural":"festivaliști","dative-definite-genitive-plural":"festivaliștilor","singular-vocative":"festivalistule","plural-vocative":"festivaliștilor"}},{"word":"festivalistă","pos":"noun","definitions":["female equivalent of festivalist"],"forms":{"plural":"festivaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"festivalistă","accusative-definite-nominative-singular":"festivalista","accusative-indefinite-nominative-plural":"festivaliste","accusative-definite-nominative-plural":"festivalistele","dative-genitive-indefinite-singular":"festivaliste","dative-definite-genitive-singular":"festivalistei","dative-genitive-indefinite-plural":"festivaliste","dative-definite-genitive-plural":"festivalistelor","singular-vocative":"festivalistă","plural-vocative":"festivalistelor"}},{"word":"festivism","pos":"noun","definitions":["festiveness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"festivism","accusative-definite-nominative":"festivismul","dative-genitive-indefinite":"festivism","dative-definite-genitive":"festivismului","vocative":"festivismule"}},{"word":"festivist","pos":"adj","definitions":["festive"],"forms":{"feminine-singular":"festivistă","masculine-plural":"festiviști","feminine-neuter-plural":"festiviste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"festivist","error-unrecognized-form-feminine-indefinite-singular":"festivistă","error-unrecognized-form-indefinite-masculine-plural":"festiviști","error-unrecognized-form-feminine-indefinite-neuter-plural":"festiviste","definite-error-unrecognized-form-masculine-neuter-singular":"festivistul","definite-error-unrecognized-form-feminine-singular":"festivista","definite-error-unrecognized-form-masculine-plural":"festiviștii","definite-error-unrecognized-form-feminine-neuter-plural":"festivistele"}},{"word":"festivitate","pos":"noun","definitions":["festivity"],"forms":{"plural":"festivități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"festivitate","accusative-definite-nominative-singular":"festivitatea","accusative-indefinite-nominative-plural":"festivități","accusative-definite-nominative-plural":"festivitățile","dative-genitive-indefinite-singular":"festivități","dative-definite-genitive-singular":"festivității","dative-genitive-indefinite-plural":"festivități","dative-definite-genitive-plural":"festivităților","singular-vocative":"festivitate","plural-vocative":"festivităților"}},{"word":"feston","pos":"noun","definitions":["festoon"],"forms":{"plural":"festoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feston","accusative-definite-nominative-singular":"festonul","accusative-indefinite-nominative-plural":"festoane","accusative-definite-nominative-plural":"festoanele","dative-genitive-indefinite-singular":"feston","dative-definite-genitive-singular":"festonului","dative-genitive-indefinite-plural":"festoane","dative-definite-genitive-plural":"festoanelor","singular-vocative":"festonule","plural-vocative":"festoanelor"}},{"word":"festona","pos":"verb","definitions":["to festoon"],"forms":{"canonical":"a festona 1st conjugation","present-singular-third-person":"festonează","participle-past":"festonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a festona","gerund":"festonând","first-person-indicative-present-singular":"festonez","indicative-present-second-person-singular":"festonezi","indicative-present-singular-third-person":"festonează","first-person-indicative-plural-present":"festonăm","indicative-plural-present-second-person":"festonați","indicative-plural-present-third-person":"festonează","first-person-imperfect-indicative-singular":"festonam","imperfect-indicative-second-person-singular":"festonai","imperfect-indicative-singular-third-person":"festona","first-person-imperfect-indicative-plural":"festonam","imperfect-indicative-plural-second-person":"festonați","imperfect-indicative-plural-third-person":"festonau","first-person-indicative-perfect-singular":"festonai","indicative-perfect-second-person-singular":"festonași","indicative-perfect-singular-third-person":"festonă","first-person-indicative-perfect-plural":"festonarăm","indicative-perfect-plural-second-person":"festonarăți","indicative-perfect-plural-third-person":"festonară","first-person-indicative-pluperfect-singular":"festonasem","indicative-pluperfect-second-person-singular":"festonaseși","indicative-pluperfect-singular-third-person":"festonase","first-person-indicative-pluperfect-plural":"festonaserăm","indicative-pluperfect-plural-second-person":"festonaserăți","indicative-pluperfect-plural-third-person":"festonaseră","first-person-present-singular-subjunctive":"să festonez","present-second-person-singular-subjunctive":"să festonezi","present-singular-subjunctive-third-person":"să festoneze","first-person-plural-present-subjunctive":"să festonăm","plural-present-second-person-subjunctive":"să festonați","plural-present-subjunctive-third-person":"să festoneze","imperative-second-person-singular":"festonează","imperative-plural-second-person":"festonați","imperative-negative-second-person-singular":"nu festona","imperative-negative-plural-second-person":"nu festonați"}},{"word":"festonat","pos":"adj","definitions":["festooned"],"forms":{"feminine-singular":"festonată","masculine-plural":"festonați","feminine-neuter-plural":"festonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"festonat","error-unrecognized-form-feminine-indefinite-singular":"festonată","error-unrecognized-form-indefinite-masculine-plural":"festonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"festonate","definite-error-unrecognized-form-masculine-neuter-singular":"festonatul","definite-error-unrecognized-form-feminine-singular":"festonata","definite-error-unrecognized-form-masculine-plural":"festonații","definite-error-unrecognized-form-feminine-neuter-plural":"festonatele"}},{"word":"festung","pos":"noun","definitions":["fortress, fortification"],"forms":{"plural":"festunguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"festung","accusative-definite-nominative-singular":"festungul","accusative-indefinite-nominative-plural":"festunguri","accusative-definite-nominative-plural":"festungurile","dative-genitive-indefinite-singular":"festung","dative-definite-genitive-singular":"festungului","dative-genitive-indefinite-plural":"festunguri","dative-definite-genitive-plural":"festungurilor","singular-vocative":"festungule","plural-vocative":"festungurilor"}},{"word":"fesușor","pos":"noun","definitions":["diminutive of fes"],"forms":{"plural":"fesușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fesușor","accusative-definite-nominative-singular":"fesușorul","accusative-indefinite-nominative-plural":"fesușori","accusative-definite-nominative-plural":"fesușorii","dative-genitive-indefinite-singular":"fesușor","dative-definite-genitive-singular":"fesușorului","dative-genitive-indefinite-plural":"fesușori","dative-definite-genitive-plural":"fesușorilor","singular-vocative":"fesușorule","plural-vocative":"fesușorilor"}},{"word":"fetal","pos":"adj","definitions":["fetal"],"forms":{"feminine-singular":"fetală","masculine-plural":"fetali","feminine-neuter-plural":"fetale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fetal","error-unrecognized-form-feminine-indefinite-singular":"fetală","error-unrecognized-form-indefinite-masculine-plural":"fetali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fetale","definite-error-unrecognized-form-masculine-neuter-singular":"fetalul","definite-error-unrecognized-form-feminine-singular":"fetala","definite-error-unrecognized-form-masculine-plural":"fetalii","definite-error-unrecognized-form-feminine-neuter-plural":"fetalele"}},{"word":"fete","pos":"noun","definitions":["plural of fată"],"pronunciation":"[ˈfe.te]","gender":"f-p"},{"word":"fețe","pos":"noun","definitions":["plural of față"],"pronunciation":"[ˈfetse]","gender":"f-p"},{"word":"Feteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Feteanu"}},{"word":"Feteasca","pos":"name","definitions":["a village in Leușeni, Hîncești Raion, Moldova"],"gender":"f"},{"word":"fetei","pos":"noun","definitions":["definite genitive/dative singular of fată"],"pronunciation":"[ˈfetej]","gender":"f"},{"word":"feței","pos":"noun","definitions":["definite genitive/dative singular of față"],"pronunciation":"[ˈfetsej]","gender":"f"},{"word":"Feței Lungi","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Săritoarea"],"gender":"m"},{"word":"fetele","pos":"noun","definitions":["definite nominative/accusative plural of fată"],"pronunciation":"[ˈfetele]","gender":"f-p"},{"word":"fețele","pos":"noun","definitions":["definite nominative/accusative plural of față"],"pronunciation":"[ˈfetsele]","gender":"f-p"},{"word":"feteleu","pos":"noun","definitions":["obsolete form of fătălău"],"forms":{"plural":"fetelei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"feteleu","accusative-definite-nominative-singular":"feteleuul","accusative-indefinite-nominative-plural":"fetelei","accusative-definite-nominative-plural":"feteleii","dative-genitive-indefinite-singular":"feteleu","dative-definite-genitive-singular":"feteleuului","dative-genitive-indefinite-plural":"fetelei","dative-definite-genitive-plural":"feteleilor","singular-vocative":"feteleuule","plural-vocative":"feteleilor"}},{"word":"fetelor","pos":"noun","definitions":["definite genitive/dative/vocative plural of fată"],"pronunciation":"[ˈfetelor]","gender":"f-p"},{"word":"fețelor","pos":"noun","definitions":["definite genitive/dative plural of față"],"pronunciation":"[ˈfetselor]","gender":"f-p"},{"word":"Fețeni","pos":"name","definitions":["a locality in Cugir, Alba County, Romania","a village in Valea Mare, Dâmbovița County, Romania","a village in Râmnicu Vâlcea, Vâlcea County, Romania"],"gender":"m"},{"word":"fetesc","pos":"adj","definitions":["girlish"],"forms":{"feminine-singular":"fetească","plural":"fetești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fetesc","error-unrecognized-form-feminine-indefinite-singular":"fetească","error-unrecognized-form-indefinite-masculine-plural":"fetești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fetești","definite-error-unrecognized-form-masculine-neuter-singular":"fetescul","definite-error-unrecognized-form-feminine-singular":"feteasca","definite-error-unrecognized-form-masculine-plural":"feteștii","definite-error-unrecognized-form-feminine-neuter-plural":"feteștile"}},{"word":"Fetescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fetescu"}},{"word":"Fetești","pos":"name","definitions":["a city in Ialomița County, Romania","a village in Fetești, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova","a village in Scobinți, Iași County, Romania","a village in Adâncata, Suceava County, Romania"],"pronunciation":"/feˈteʃtʲ/","gender":"m"},{"word":"Fetești-Gară","pos":"name","definitions":["a locality in Fetești, Ialomița County, Romania"],"gender":"m"},{"word":"feți","pos":"noun","definitions":["plural of făt"],"pronunciation":"/fet͡sʲ/","gender":"m-p"},{"word":"Feți-Frumoși","pos":"noun","definitions":["plural of Făt-Frumos"],"pronunciation":"/fet͡sʲ.fruˈmoʃʲ/","gender":"m-p"},{"word":"fetică","pos":"noun","definitions":["diminutive of fată","lamb's lettuce"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fetică","accusative-definite-nominative":"fetica","dative-genitive-indefinite":"fetice","dative-definite-genitive":"feticei","vocative":"fetică"}},{"word":"feticid","pos":"noun","definitions":["feticide"],"forms":{"plural":"feticiduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"feticid","accusative-definite-nominative-singular":"feticidul","accusative-indefinite-nominative-plural":"feticiduri","accusative-definite-nominative-plural":"feticidurile","dative-genitive-indefinite-singular":"feticid","dative-definite-genitive-singular":"feticidului","dative-genitive-indefinite-plural":"feticiduri","dative-definite-genitive-plural":"feticidurilor","singular-vocative":"feticidule","plural-vocative":"feticidurilor"}},{"word":"fetid","pos":"adj","definitions":["fetid"],"forms":{"feminine-singular":"fetidă","masculine-plural":"fetizi","feminine-neuter-plural":"fetide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fetid","error-unrecognized-form-feminine-indefinite-singular":"fetidă","error-unrecognized-form-indefinite-masculine-plural":"fetizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fetide","definite-error-unrecognized-form-masculine-neuter-singular":"fetidul","definite-error-unrecognized-form-feminine-singular":"fetida","definite-error-unrecognized-form-masculine-plural":"fetizii","definite-error-unrecognized-form-feminine-neuter-plural":"fetidele"}},{"word":"fetiditate","pos":"noun","definitions":["foulness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fetiditate","accusative-definite-nominative-singular":"fetiditatea","accusative-indefinite-nominative-plural":"fetidități","accusative-definite-nominative-plural":"fetiditățile","dative-genitive-indefinite-singular":"fetidități","dative-definite-genitive-singular":"fetidității","dative-genitive-indefinite-plural":"fetidități","dative-definite-genitive-plural":"fetidităților","singular-vocative":"fetiditate","plural-vocative":"fetidităților"}},{"word":"fetie","pos":"noun","definitions":["virginity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fetie","accusative-definite-nominative":"fetia","dative-genitive-indefinite":"fetii","dative-definite-genitive":"fetiei","vocative":"fetie"}},{"word":"fetiș","pos":"noun","definitions":["fetish"],"forms":{"plural":"fetișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fetiș","accusative-definite-nominative-singular":"fetișul","accusative-indefinite-nominative-plural":"fetișuri","accusative-definite-nominative-plural":"fetișurile","dative-genitive-indefinite-singular":"fetiș","dative-definite-genitive-singular":"fetișului","dative-genitive-indefinite-plural":"fetișuri","dative-definite-genitive-plural":"fetișurilor","singular-vocative":"fetișule","plural-vocative":"fetișurilor"}},{"word":"fetișcană","pos":"noun","definitions":["diminutive of fată; small girl"],"forms":{"plural":"fetișcane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetișcană","accusative-definite-nominative-singular":"fetișcana","accusative-indefinite-nominative-plural":"fetișcane","accusative-definite-nominative-plural":"fetișcanele","dative-genitive-indefinite-singular":"fetișcane","dative-definite-genitive-singular":"fetișcanei","dative-genitive-indefinite-plural":"fetișcane","dative-definite-genitive-plural":"fetișcanelor","singular-vocative":"fetișcană","plural-vocative":"fetișcanelor"}},{"word":"fetișism","pos":"noun","definitions":["fetishism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fetișism","accusative-definite-nominative-singular":"fetișismul","accusative-indefinite-nominative-plural":"fetișisme","accusative-definite-nominative-plural":"fetișismele","dative-genitive-indefinite-singular":"fetișism","dative-definite-genitive-singular":"fetișismului","dative-genitive-indefinite-plural":"fetișisme","dative-definite-genitive-plural":"fetișismelor","singular-vocative":"fetișismule","plural-vocative":"fetișismelor"}},{"word":"fetișist","pos":"noun","definitions":["fetishist"],"forms":{"plural":"fetișiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fetișist","accusative-definite-nominative-singular":"fetișistul","accusative-indefinite-nominative-plural":"fetișiști","accusative-definite-nominative-plural":"fetișiștii","dative-genitive-indefinite-singular":"fetișist","dative-definite-genitive-singular":"fetișistului","dative-genitive-indefinite-plural":"fetișiști","dative-definite-genitive-plural":"fetișiștilor","singular-vocative":"fetișistule","plural-vocative":"fetișiștilor"}},{"word":"fetișistă","pos":"noun","definitions":["female equivalent of fetișist"],"forms":{"plural":"fetișiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetișistă","accusative-definite-nominative-singular":"fetișista","accusative-indefinite-nominative-plural":"fetișiste","accusative-definite-nominative-plural":"fetișistele","dative-genitive-indefinite-singular":"fetișiste","dative-definite-genitive-singular":"fetișistei","dative-genitive-indefinite-plural":"fetișiste","dative-definite-genitive-plural":"fetișistelor","singular-vocative":"fetișistă","plural-vocative":"fetișistelor"}},{"word":"fetișiza","pos":"verb","definitions":["to fetishize"],"forms":{"canonical":"a fetișiza 1st conjugation","present-singular-third-person":"fetișizează","participle-past":"fetișizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fetișiza","gerund":"fetișizând","first-person-indicative-present-singular":"fetișizez","indicative-present-second-person-singular":"fetișizezi","indicative-present-singular-third-person":"fetișizează","first-person-indicative-plural-present":"fetișizăm","indicative-plural-present-second-person":"fetișizați","indicative-plural-present-third-person":"fetișizează","first-person-imperfect-indicative-singular":"fetișizam","imperfect-indicative-second-person-singular":"fetișizai","imperfect-indicative-singular-third-person":"fetișiza","first-person-imperfect-indicative-plural":"fetișizam","imperfect-indicative-plural-second-person":"fetișizați","imperfect-indicative-plural-third-person":"fetișizau","first-person-indicative-perfect-singular":"fetișizai","indicative-perfect-second-person-singular":"fetișizași","indicative-perfect-singular-third-person":"fetișiză","first-person-indicative-perfect-plural":"fetișizarăm","indicative-perfect-plural-second-person":"fetișizarăți","indicative-perfect-plural-third-person":"fetișizară","first-person-indicative-pluperfect-singular":"fetișizasem","indicative-pluperfect-second-person-singular":"fetișizaseși","indicative-pluperfect-singular-third-person":"fetișizase","first-person-indicative-pluperfect-plural":"fetișizaserăm","indicative-pluperfect-plural-second-person":"fetișizaserăți","indicative-pluperfect-plural-third-person":"fetișizaseră","first-person-present-singular-subjunctive":"să fetișizez","present-second-person-singular-subjunctive":"să fetișizezi","present-singular-subjunctive-third-person":"să fetișizeze","first-person-plural-present-subjunctive":"să fetișizăm","plural-present-second-person-subjunctive":"să fetișizați","plural-present-subjunctive-third-person":"să fetișizeze","imperative-second-person-singular":"fetișizează","imperative-plural-second-person":"fetișizați","imperative-negative-second-person-singular":"nu fetișiza","imperative-negative-plural-second-person":"nu fetișizați"}},{"word":"fetișizant","pos":"adj","definitions":["fetishizing"],"forms":{"feminine-singular":"fetișizantă","masculine-plural":"fetișizanți","feminine-neuter-plural":"fetișizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fetișizant","error-unrecognized-form-feminine-indefinite-singular":"fetișizantă","error-unrecognized-form-indefinite-masculine-plural":"fetișizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fetișizante","definite-error-unrecognized-form-masculine-neuter-singular":"fetișizantul","definite-error-unrecognized-form-feminine-singular":"fetișizanta","definite-error-unrecognized-form-masculine-plural":"fetișizanții","definite-error-unrecognized-form-feminine-neuter-plural":"fetișizantele"}},{"word":"fetișizare","pos":"noun","definitions":["fetishization"],"forms":{"plural":"fetișizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fetișizare","accusative-definite-nominative-singular":"fetișizarea","accusative-indefinite-nominative-plural":"fetișizări","accusative-definite-nominative-plural":"fetișizările","dative-genitive-indefinite-singular":"fetișizări","dative-definite-genitive-singular":"fetișizării","dative-genitive-indefinite-plural":"fetișizări","dative-definite-genitive-plural":"fetișizărilor","singular-vocative":"fetișizare","plural-vocative":"fetișizărilor"}},{"word":"fetișoară","pos":"noun","definitions":["diminutive of fată; small girl"],"forms":{"plural":"fetișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetișoară","accusative-definite-nominative-singular":"fetișoara","accusative-indefinite-nominative-plural":"fetișoare","accusative-definite-nominative-plural":"fetișoarele","dative-genitive-indefinite-singular":"fetișoare","dative-definite-genitive-singular":"fetișoarei","dative-genitive-indefinite-plural":"fetișoare","dative-definite-genitive-plural":"fetișoarelor","singular-vocative":"fetișoară","plural-vocative":"fetișoarelor"}},{"word":"fețișoară","pos":"noun","definitions":["diminutive of față; little face"],"pronunciation":"/fe.t͡siˈʃo̯a.rə/","forms":{"plural":"fețișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fețișoară","accusative-definite-nominative-singular":"fețișoara","accusative-indefinite-nominative-plural":"fețișoare","accusative-definite-nominative-plural":"fețișoarele","dative-genitive-indefinite-singular":"fețișoare","dative-definite-genitive-singular":"fețișoarei","dative-genitive-indefinite-plural":"fețișoare","dative-definite-genitive-plural":"fețișoarelor","singular-vocative":"fețișoară","plural-vocative":"fețișoarelor"}},{"word":"fetișor","pos":"noun","definitions":["diminutive of făt"],"forms":{"plural":"fetișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fetișor","accusative-definite-nominative-singular":"fetișorul","accusative-indefinite-nominative-plural":"fetișori","accusative-definite-nominative-plural":"fetișorii","dative-genitive-indefinite-singular":"fetișor","dative-definite-genitive-singular":"fetișorului","dative-genitive-indefinite-plural":"fetișori","dative-definite-genitive-plural":"fetișorilor","singular-vocative":"fetișorule","plural-vocative":"fetișorilor"}},{"word":"Fetița","pos":"name","definitions":["a village in Albina, Cimișlia Raion, Moldova"],"gender":"f"},{"word":"fetița","pos":"noun","definitions":["definite nominative/accusative singular of fetiță"]},{"word":"Fetiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fetiță"}},{"word":"fetiță","pos":"noun","definitions":["diminutive of fată; little girl, baby girl"],"forms":{"plural":"fetițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetiță","accusative-definite-nominative-singular":"fetița","accusative-indefinite-nominative-plural":"fetițe","accusative-definite-nominative-plural":"fetițele","dative-genitive-indefinite-singular":"fetițe","dative-definite-genitive-singular":"fetiței","dative-genitive-indefinite-plural":"fetițe","dative-definite-genitive-plural":"fetițelor","singular-vocative":"fetiță","plural-vocative":"fetițelor"}},{"word":"fetnegică","pos":"noun","definitions":["diminutive of fetnigea"],"forms":{"plural":"fetnegele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetnegică","accusative-definite-nominative-singular":"fetnegica","accusative-indefinite-nominative-plural":"fetnegele","accusative-definite-nominative-plural":"fetnegelele","dative-genitive-indefinite-singular":"fetnegele","dative-definite-genitive-singular":"fetnegelei","dative-genitive-indefinite-plural":"fetnegele","dative-definite-genitive-plural":"fetnegelelor","singular-vocative":"fetnegică","plural-vocative":"fetnegelelor"}},{"word":"fetniguță","pos":"noun","definitions":["diminutive of fetnigea"],"forms":{"plural":"fetniguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fetniguță","accusative-definite-nominative-singular":"fetniguța","accusative-indefinite-nominative-plural":"fetniguțe","accusative-definite-nominative-plural":"fetniguțele","dative-genitive-indefinite-singular":"fetniguțe","dative-definite-genitive-singular":"fetniguței","dative-genitive-indefinite-plural":"fetniguțe","dative-definite-genitive-plural":"fetniguțelor","singular-vocative":"fetniguță","plural-vocative":"fetniguțelor"}},{"word":"fetomatern","pos":"adj","definitions":["fetomaternal"],"forms":{"feminine-singular":"fetomaternă","masculine-plural":"fetomaterni","feminine-neuter-plural":"fetomaterne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fetomatern","error-unrecognized-form-feminine-indefinite-singular":"fetomaternă","error-unrecognized-form-indefinite-masculine-plural":"fetomaterni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fetomaterne","definite-error-unrecognized-form-masculine-neuter-singular":"fetomaternul","definite-error-unrecognized-form-feminine-singular":"fetomaterna","definite-error-unrecognized-form-masculine-plural":"fetomaternii","definite-error-unrecognized-form-feminine-neuter-plural":"fetomaternele"}},{"word":"fetru","pos":"noun","definitions":["felt"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fetru","accusative-definite-nominative":"fetrul","dative-genitive-indefinite":"fetru","dative-definite-genitive":"fetrului","vocative":"fetrule"}},{"word":"fetus","pos":"noun","definitions":["fetus"],"forms":{"plural":"fetuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fetus","accusative-definite-nominative-singular":"fetusul","accusative-indefinite-nominative-plural":"fetuși","accusative-definite-nominative-plural":"fetușii","dative-genitive-indefinite-singular":"fetus","dative-definite-genitive-singular":"fetusului","dative-genitive-indefinite-plural":"fetuși","dative-definite-genitive-plural":"fetușilor","singular-vocative":"fetusule","plural-vocative":"fetușilor"}},{"word":"fetva","pos":"noun","definitions":["fatwa"],"forms":{"plural":"fetvale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"fetva","accusative-definite-nominative-singular":"fetvaua","accusative-indefinite-nominative-plural":"fetvale","accusative-definite-nominative-plural":"fetvalele","dative-genitive-indefinite-singular":"fetvale","dative-definite-genitive-singular":"fetvalei","dative-genitive-indefinite-plural":"fetvale","dative-definite-genitive-plural":"fetvalelor","singular-vocative":"fetva","plural-vocative":"fetvalelor"}},{"word":"feud","pos":"noun","definitions":["alternative form of feudă"],"forms":{"plural":"feude","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"feud","accusative-definite-nominative-singular":"feudul","accusative-indefinite-nominative-plural":"feude","accusative-definite-nominative-plural":"feudele","dative-genitive-indefinite-singular":"feud","dative-definite-genitive-singular":"feudului","dative-genitive-indefinite-plural":"feude","dative-definite-genitive-plural":"feudelor","singular-vocative":"feudule","plural-vocative":"feudelor"}},{"word":"feudă","pos":"noun","definitions":["fief","feud"],"forms":{"plural":"feude","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"feudă","accusative-definite-nominative-singular":"feuda","accusative-indefinite-nominative-plural":"feude","accusative-definite-nominative-plural":"feudele","dative-genitive-indefinite-singular":"feude","dative-definite-genitive-singular":"feudei","dative-genitive-indefinite-plural":"feude","dative-definite-genitive-plural":"feudelor","singular-vocative":"feudă","plural-vocative":"feudelor"}},{"word":"feudal","pos":"adj","definitions":["feudal"],"forms":{"feminine-singular":"feudală","masculine-plural":"feudali","feminine-neuter-plural":"feudale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feudal","error-unrecognized-form-feminine-indefinite-singular":"feudală","error-unrecognized-form-indefinite-masculine-plural":"feudali","error-unrecognized-form-feminine-indefinite-neuter-plural":"feudale","definite-error-unrecognized-form-masculine-neuter-singular":"feudalul","definite-error-unrecognized-form-feminine-singular":"feudala","definite-error-unrecognized-form-masculine-plural":"feudalii","definite-error-unrecognized-form-feminine-neuter-plural":"feudalele"}},{"word":"feudalism","pos":"noun","definitions":["feudalism"],"pronunciation":"/fe.u.da.ˈlism/"},{"word":"feudalitate","pos":"noun","definitions":["feudality, feudalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"feudalitate","accusative-definite-nominative":"feudalitatea","dative-genitive-indefinite":"feudalități","dative-definite-genitive":"feudalității","vocative":"feudalitate"}},{"word":"feudaliza","pos":"verb","definitions":["to feudalize"],"forms":{"canonical":"a feudaliza 1st conjugation","present-singular-third-person":"feudalizează","participle-past":"feudalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a feudaliza","gerund":"feudalizând","first-person-indicative-present-singular":"feudalizez","indicative-present-second-person-singular":"feudalizezi","indicative-present-singular-third-person":"feudalizează","first-person-indicative-plural-present":"feudalizăm","indicative-plural-present-second-person":"feudalizați","indicative-plural-present-third-person":"feudalizează","first-person-imperfect-indicative-singular":"feudalizam","imperfect-indicative-second-person-singular":"feudalizai","imperfect-indicative-singular-third-person":"feudaliza","first-person-imperfect-indicative-plural":"feudalizam","imperfect-indicative-plural-second-person":"feudalizați","imperfect-indicative-plural-third-person":"feudalizau","first-person-indicative-perfect-singular":"feudalizai","indicative-perfect-second-person-singular":"feudalizași","indicative-perfect-singular-third-person":"feudaliză","first-person-indicative-perfect-plural":"feudalizarăm","indicative-perfect-plural-second-person":"feudalizarăți","indicative-perfect-plural-third-person":"feudalizară","first-person-indicative-pluperfect-singular":"feudalizasem","indicative-pluperfect-second-person-singular":"feudalizaseși","indicative-pluperfect-singular-third-person":"feudalizase","first-person-indicative-pluperfect-plural":"feudalizaserăm","indicative-pluperfect-plural-second-person":"feudalizaserăți","indicative-pluperfect-plural-third-person":"feudalizaseră","first-person-present-singular-subjunctive":"să feudalizez","present-second-person-singular-subjunctive":"să feudalizezi","present-singular-subjunctive-third-person":"să feudalizeze","first-person-plural-present-subjunctive":"să feudalizăm","plural-present-second-person-subjunctive":"să feudalizați","plural-present-subjunctive-third-person":"să feudalizeze","imperative-second-person-singular":"feudalizează","imperative-plural-second-person":"feudalizați","imperative-negative-second-person-singular":"nu feudaliza","imperative-negative-plural-second-person":"nu feudalizați"}},{"word":"feudalizare","pos":"noun","definitions":["feudalization"],"forms":{"plural":"feudalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"feudalizare","accusative-definite-nominative-singular":"feudalizarea","accusative-indefinite-nominative-plural":"feudalizări","accusative-definite-nominative-plural":"feudalizările","dative-genitive-indefinite-singular":"feudalizări","dative-definite-genitive-singular":"feudalizării","dative-genitive-indefinite-plural":"feudalizări","dative-definite-genitive-plural":"feudalizărilor","singular-vocative":"feudalizare","plural-vocative":"feudalizărilor"}},{"word":"feudalizat","pos":"adj","definitions":["feudalized"],"forms":{"feminine-singular":"feudalizată","masculine-plural":"feudalizați","feminine-neuter-plural":"feudalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"feudalizat","error-unrecognized-form-feminine-indefinite-singular":"feudalizată","error-unrecognized-form-indefinite-masculine-plural":"feudalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"feudalizate","definite-error-unrecognized-form-masculine-neuter-singular":"feudalizatul","definite-error-unrecognized-form-feminine-singular":"feudalizata","definite-error-unrecognized-form-masculine-plural":"feudalizații","definite-error-unrecognized-form-feminine-neuter-plural":"feudalizatele"}},{"word":"fezabil","pos":"adj","definitions":["feasible"],"forms":{"feminine-singular":"fezabilă","masculine-plural":"fezabili","feminine-neuter-plural":"fezabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fezabil","error-unrecognized-form-feminine-indefinite-singular":"fezabilă","error-unrecognized-form-indefinite-masculine-plural":"fezabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fezabile","definite-error-unrecognized-form-masculine-neuter-singular":"fezabilul","definite-error-unrecognized-form-feminine-singular":"fezabila","definite-error-unrecognized-form-masculine-plural":"fezabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fezabilele"}},{"word":"fezabilitate","pos":"noun","definitions":["feasibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fezabilitate","accusative-definite-nominative-singular":"fezabilitatea","accusative-indefinite-nominative-plural":"fezabilități","accusative-definite-nominative-plural":"fezabilitățile","dative-genitive-indefinite-singular":"fezabilități","dative-definite-genitive-singular":"fezabilității","dative-genitive-indefinite-plural":"fezabilități","dative-definite-genitive-plural":"fezabilităților","singular-vocative":"fezabilitate","plural-vocative":"fezabilităților"}},{"word":"fezanda","pos":"verb","definitions":["to simmer"],"forms":{"canonical":"a fezanda 1st conjugation","present-singular-third-person":"fezandează","participle-past":"fezandat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fezanda","gerund":"fezandând","first-person-indicative-present-singular":"fezandez","indicative-present-second-person-singular":"fezandezi","indicative-present-singular-third-person":"fezandează","first-person-indicative-plural-present":"fezandăm","indicative-plural-present-second-person":"fezandați","indicative-plural-present-third-person":"fezandează","first-person-imperfect-indicative-singular":"fezandam","imperfect-indicative-second-person-singular":"fezandai","imperfect-indicative-singular-third-person":"fezanda","first-person-imperfect-indicative-plural":"fezandam","imperfect-indicative-plural-second-person":"fezandați","imperfect-indicative-plural-third-person":"fezandau","first-person-indicative-perfect-singular":"fezandai","indicative-perfect-second-person-singular":"fezandași","indicative-perfect-singular-third-person":"fezandă","first-person-indicative-perfect-plural":"fezandarăm","indicative-perfect-plural-second-person":"fezandarăți","indicative-perfect-plural-third-person":"fezandară","first-person-indicative-pluperfect-singular":"fezandasem","indicative-pluperfect-second-person-singular":"fezandaseși","indicative-pluperfect-singular-third-person":"fezandase","first-person-indicative-pluperfect-plural":"fezandaserăm","indicative-pluperfect-plural-second-person":"fezandaserăți","indicative-pluperfect-plural-third-person":"fezandaseră","first-person-present-singular-subjunctive":"să fezandez","present-second-person-singular-subjunctive":"să fezandezi","present-singular-subjunctive-third-person":"să fezandeze","first-person-plural-present-subjunctive":"să fezandăm","plural-present-second-person-subjunctive":"să fezandați","plural-present-subjunctive-third-person":"să fezandeze","imperative-second-person-singular":"fezandează","imperative-plural-second-person":"fezandați","imperative-negative-second-person-singular":"nu fezanda","imperative-negative-plural-second-person":"nu fezandați"}},{"word":"fezandare","pos":"noun","definitions":["simmering"],"forms":{"plural":"fezandări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fezandare","accusative-definite-nominative-singular":"fezandarea","accusative-indefinite-nominative-plural":"fezandări","accusative-definite-nominative-plural":"fezandările","dative-genitive-indefinite-singular":"fezandări","dative-definite-genitive-singular":"fezandării","dative-genitive-indefinite-plural":"fezandări","dative-definite-genitive-plural":"fezandărilor","singular-vocative":"fezandare","plural-vocative":"fezandărilor"}},{"word":"fezandat","pos":"adj","definitions":["simmered"],"forms":{"feminine-singular":"fezandată","masculine-plural":"fezandați","feminine-neuter-plural":"fezandate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fezandat","error-unrecognized-form-feminine-indefinite-singular":"fezandată","error-unrecognized-form-indefinite-masculine-plural":"fezandați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fezandate","definite-error-unrecognized-form-masculine-neuter-singular":"fezandatul","definite-error-unrecognized-form-feminine-singular":"fezandata","definite-error-unrecognized-form-masculine-plural":"fezandații","definite-error-unrecognized-form-feminine-neuter-plural":"fezandatele"}},{"word":"fezandat","pos":"verb","definitions":["past participle of fezanda"],"forms":{"participle-past":"of fezanda"}},{"word":"fi","pos":"verb","definitions":["to be","to feel (to experience a certain condition)","to be it in a game of tag"],"pronunciation":"/fi/","examples":[{"ro":"Ea este frumoasă.","en":"She is beautiful."},{"ro":"Aceasta este o casă.","en":"This is a house."},{"ro":"Îmi e frig.","en":"I feel cold."}],"forms":{"canonical":"a fi 4th conjugation","present-singular-third-person":"este","error-unknown-tag-informal-present-singular-third-person":"e","participle-past":"fost","subjunctive-third-person":"fie","table-tags":"conjugation-4","inflection-template":"ro-conj","infinitive":"a fi","gerund":"fiind","first-person-indicative-present-singular":"sunt","indicative-present-second-person-singular":"ești","indicative-present-singular-third-person":"este","first-person-indicative-plural-present":"suntem","indicative-plural-present-second-person":"sunteți","indicative-plural-present-third-person":"sunt","first-person-imperfect-indicative-singular":"eram","imperfect-indicative-second-person-singular":"erai","imperfect-indicative-singular-third-person":"era","first-person-imperfect-indicative-plural":"eram","imperfect-indicative-plural-second-person":"erați","imperfect-indicative-plural-third-person":"erau","first-person-indicative-perfect-singular":"fusei","indicative-perfect-second-person-singular":"fuseși","indicative-perfect-singular-third-person":"fuse","first-person-indicative-perfect-plural":"fuserăm","indicative-perfect-plural-second-person":"fuserăți","indicative-perfect-plural-third-person":"fuseră","first-person-indicative-pluperfect-singular":"fusesem","indicative-pluperfect-second-person-singular":"fuseseși","indicative-pluperfect-singular-third-person":"fusese","first-person-indicative-pluperfect-plural":"fuseserăm","indicative-pluperfect-plural-second-person":"fuseserăți","indicative-pluperfect-plural-third-person":"fuseseră","first-person-present-singular-subjunctive":"să fiu","present-second-person-singular-subjunctive":"să fii","present-singular-subjunctive-third-person":"să fie","first-person-plural-present-subjunctive":"să fim","plural-present-second-person-subjunctive":"să fiți","plural-present-subjunctive-third-person":"să fie","imperative-second-person-singular":"fii","imperative-plural-second-person":"fiți","imperative-negative-second-person-singular":"nu fi","imperative-negative-plural-second-person":"nu fiți","alternative":"фи","alternative-dialectal":"hi"}},{"word":"fi chit","pos":"verb","definitions":["be even (on equal moral terms)"],"forms":{"canonical":"a fi chit 4th conjugation","present-singular-third-person":"este chit","participle-past":"fost chit"}},{"word":"fi sănătos","pos":"verb","definitions":["Used other than figuratively or idiomatically: see fi, sănătos.","let be (a person), I don't care (about a person)"],"examples":[{"ro":"El este acum sănătos, cu toate că s-a îmbolnăvit cu ceva timp în urmă.","en":"He's now well again, even though he got sick a while ago."}],"forms":{"canonical":"a fi sănătos 4th conjugation","present-singular-third-person":"este sănătos","participle-past":"fost sănătos"}},{"word":"fiabil","pos":"adj","definitions":["reliable"],"forms":{"feminine-singular":"fiabilă","masculine-plural":"fiabili","feminine-neuter-plural":"fiabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiabil","error-unrecognized-form-feminine-indefinite-singular":"fiabilă","error-unrecognized-form-indefinite-masculine-plural":"fiabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiabile","definite-error-unrecognized-form-masculine-neuter-singular":"fiabilul","definite-error-unrecognized-form-feminine-singular":"fiabila","definite-error-unrecognized-form-masculine-plural":"fiabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fiabilele"}},{"word":"fiabilitate","pos":"noun","definitions":["reliability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fiabilitate","accusative-definite-nominative-singular":"fiabilitatea","accusative-indefinite-nominative-plural":"fiabilități","accusative-definite-nominative-plural":"fiabilitățile","dative-genitive-indefinite-singular":"fiabilități","dative-definite-genitive-singular":"fiabilității","dative-genitive-indefinite-plural":"fiabilități","dative-definite-genitive-plural":"fiabilităților","singular-vocative":"fiabilitate","plural-vocative":"fiabilităților"}},{"word":"fiacru","pos":"noun","definitions":["fiacre"],"forms":{"plural":"fiacre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fiacru","accusative-definite-nominative-singular":"fiacrul","accusative-indefinite-nominative-plural":"fiacre","accusative-definite-nominative-plural":"fiacrele","dative-genitive-indefinite-singular":"fiacru","dative-definite-genitive-singular":"fiacrului","dative-genitive-indefinite-plural":"fiacre","dative-definite-genitive-plural":"fiacrelor","singular-vocative":"fiacrule","plural-vocative":"fiacrelor"}},{"word":"Fiad","pos":"name","definitions":["a river in Bistrița-Năsăud, Romania, tributary to the Sălăuța","a village in Telciu, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"fiara","pos":"noun","definitions":["definite nominative/accusative singular of fiară"],"pronunciation":"[ˈfjara]","gender":"f"},{"word":"fiară","pos":"noun","definitions":["animal (organism)","wild beast"],"forms":{"plural":"fiare","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fiară","accusative-definite-nominative-singular":"fiara","accusative-indefinite-nominative-plural":"fiare","accusative-definite-nominative-plural":"fiarele","dative-genitive-indefinite-singular":"fiare","dative-definite-genitive-singular":"fiarei","dative-genitive-indefinite-plural":"fiare","dative-definite-genitive-plural":"fiarelor","singular-vocative":"-","plural-vocative":"-","alternative-archaic":"feară"}},{"word":"fiare","pos":"noun","definitions":["inflection of fiară:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfjare]","gender":"f"},{"word":"fiare","pos":"noun","definitions":["indefinite plural of fier"],"gender":"n"},{"word":"fiarei","pos":"noun","definitions":["definite genitive/dative singular of fiară"],"pronunciation":"/ˈfja.rej/","gender":"f"},{"word":"fiasco","pos":"noun","definitions":["fiasco."],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fiasco","accusative-definite-nominative":"fiascoul","dative-genitive-indefinite":"fiasco","dative-definite-genitive":"fiascoului","vocative":"fiascoule"}},{"word":"fiaștri","pos":"noun","definitions":["plural of fiastru"]},{"word":"fiastru","pos":"noun","definitions":["stepson"],"forms":{"plural":"fiaștri","feminine":"equivalent fiastră","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"fiastru","accusative-definite-nominative-singular":"fiastrul","accusative-indefinite-nominative-plural":"fiaștri","accusative-definite-nominative-plural":"fiaștrii","dative-genitive-indefinite-singular":"fiastru","dative-definite-genitive-singular":"fiastrului","dative-genitive-indefinite-plural":"fiaștri","dative-definite-genitive-plural":"fiaștrilor","singular-vocative":"fiastrule","plural-vocative":"fiaștrilor"}},{"word":"fiat","pos":"noun","definitions":["fee"],"forms":{"plural":"fiaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fiat","accusative-definite-nominative-singular":"fiatul","accusative-indefinite-nominative-plural":"fiaturi","accusative-definite-nominative-plural":"fiaturile","dative-genitive-indefinite-singular":"fiat","dative-definite-genitive-singular":"fiatului","dative-genitive-indefinite-plural":"fiaturi","dative-definite-genitive-plural":"fiaturilor","singular-vocative":"fiatule","plural-vocative":"fiaturilor"}},{"word":"Fibiș","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Fibiș, Timiș County, Romania"],"gender":"m"},{"word":"Fibișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fibișan"}},{"word":"fibra","pos":"noun","definitions":["definite nominative/accusative singular of fibră"],"pronunciation":"[ˈfibra]","gender":"f"},{"word":"fibră","pos":"noun","definitions":["fibre"],"forms":{"plural":"fibre"}},{"word":"fibră optică","pos":"noun","definitions":["optical fibre"],"forms":{"plural":"fibre optice"}},{"word":"fibre","pos":"noun","definitions":["inflection of fibră:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfibre]","gender":"f"},{"word":"fibrila","pos":"verb","definitions":["fibrillate"],"forms":{"canonical":"a fibrila 1st conjugation","present-singular-third-person":"fibrilează","participle-past":"fibrilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fibrila","gerund":"fibrilând","first-person-indicative-present-singular":"fibrilez","indicative-present-second-person-singular":"fibrilezi","indicative-present-singular-third-person":"fibrilează","first-person-indicative-plural-present":"fibrilăm","indicative-plural-present-second-person":"fibrilați","indicative-plural-present-third-person":"fibrilează","first-person-imperfect-indicative-singular":"fibrilam","imperfect-indicative-second-person-singular":"fibrilai","imperfect-indicative-singular-third-person":"fibrila","first-person-imperfect-indicative-plural":"fibrilam","imperfect-indicative-plural-second-person":"fibrilați","imperfect-indicative-plural-third-person":"fibrilau","first-person-indicative-perfect-singular":"fibrilai","indicative-perfect-second-person-singular":"fibrilași","indicative-perfect-singular-third-person":"fibrilă","first-person-indicative-perfect-plural":"fibrilarăm","indicative-perfect-plural-second-person":"fibrilarăți","indicative-perfect-plural-third-person":"fibrilară","first-person-indicative-pluperfect-singular":"fibrilasem","indicative-pluperfect-second-person-singular":"fibrilaseși","indicative-pluperfect-singular-third-person":"fibrilase","first-person-indicative-pluperfect-plural":"fibrilaserăm","indicative-pluperfect-plural-second-person":"fibrilaserăți","indicative-pluperfect-plural-third-person":"fibrilaseră","first-person-present-singular-subjunctive":"să fibrilez","present-second-person-singular-subjunctive":"să fibrilezi","present-singular-subjunctive-third-person":"să fibrileze","first-person-plural-present-subjunctive":"să fibrilăm","plural-present-second-person-subjunctive":"să fibrilați","plural-present-subjunctive-third-person":"să fibrileze","imperative-second-person-singular":"fibrilează","imperative-plural-second-person":"fibrilați","imperative-negative-second-person-singular":"nu fibrila","imperative-negative-plural-second-person":"nu fibrilați"}},{"word":"fibrilă","pos":"noun","definitions":["fibril"],"forms":{"plural":"fibrile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibrilă","accusative-definite-nominative-singular":"fibrila","accusative-indefinite-nominative-plural":"fibrile","accusative-definite-nominative-plural":"fibrilele","dative-genitive-indefinite-singular":"fibrile","dative-definite-genitive-singular":"fibrilei","dative-genitive-indefinite-plural":"fibrile","dative-definite-genitive-plural":"fibrilelor","singular-vocative":"fibrilă","plural-vocative":"fibrilelor"}},{"word":"fibrilar","pos":"adj","definitions":["fibrillary"],"forms":{"feminine-singular":"fibrilară","masculine-plural":"fibrilari","feminine-neuter-plural":"fibrilare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fibrilar","error-unrecognized-form-feminine-indefinite-singular":"fibrilară","error-unrecognized-form-indefinite-masculine-plural":"fibrilari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fibrilare","definite-error-unrecognized-form-masculine-neuter-singular":"fibrilarul","definite-error-unrecognized-form-feminine-singular":"fibrilara","definite-error-unrecognized-form-masculine-plural":"fibrilarii","definite-error-unrecognized-form-feminine-neuter-plural":"fibrilarele"}},{"word":"fibrilare","pos":"noun","definitions":["fibrillation"],"forms":{"plural":"fibrilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fibrilare","accusative-definite-nominative-singular":"fibrilarea","accusative-indefinite-nominative-plural":"fibrilări","accusative-definite-nominative-plural":"fibrilările","dative-genitive-indefinite-singular":"fibrilări","dative-definite-genitive-singular":"fibrilării","dative-genitive-indefinite-plural":"fibrilări","dative-definite-genitive-plural":"fibrilărilor","singular-vocative":"fibrilare","plural-vocative":"fibrilărilor"}},{"word":"fibrilație","pos":"noun","definitions":["fibrillation"],"forms":{"plural":"fibrilații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fibrilație","accusative-definite-nominative-singular":"fibrilația","accusative-indefinite-nominative-plural":"fibrilații","accusative-definite-nominative-plural":"fibrilațiile","dative-genitive-indefinite-singular":"fibrilații","dative-definite-genitive-singular":"fibrilației","dative-genitive-indefinite-plural":"fibrilații","dative-definite-genitive-plural":"fibrilațiilor","singular-vocative":"fibrilație","plural-vocative":"fibrilațiilor"}},{"word":"fibrilațiune","pos":"noun","definitions":["obsolete form of fibrilație"],"forms":{"plural":"fibrilațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fibrilațiune","accusative-definite-nominative-singular":"fibrilațiunea","accusative-indefinite-nominative-plural":"fibrilațiuni","accusative-definite-nominative-plural":"fibrilațiunile","dative-genitive-indefinite-singular":"fibrilațiuni","dative-definite-genitive-singular":"fibrilațiunii","dative-genitive-indefinite-plural":"fibrilațiuni","dative-definite-genitive-plural":"fibrilațiunilor","singular-vocative":"fibrilațiune","plural-vocative":"fibrilațiunilor"}},{"word":"fibrilizare","pos":"noun","definitions":["fibrilization"],"forms":{"plural":"fibrilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fibrilizare","accusative-definite-nominative-singular":"fibrilizarea","accusative-indefinite-nominative-plural":"fibrilizări","accusative-definite-nominative-plural":"fibrilizările","dative-genitive-indefinite-singular":"fibrilizări","dative-definite-genitive-singular":"fibrilizării","dative-genitive-indefinite-plural":"fibrilizări","dative-definite-genitive-plural":"fibrilizărilor","singular-vocative":"fibrilizare","plural-vocative":"fibrilizărilor"}},{"word":"fibrină","pos":"noun","definitions":["fibrin"],"forms":{"plural":"fibrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibrină","accusative-definite-nominative-singular":"fibrina","accusative-indefinite-nominative-plural":"fibrine","accusative-definite-nominative-plural":"fibrinele","dative-genitive-indefinite-singular":"fibrine","dative-definite-genitive-singular":"fibrinei","dative-genitive-indefinite-plural":"fibrine","dative-definite-genitive-plural":"fibrinelor","singular-vocative":"fibrină","plural-vocative":"fibrinelor"}},{"word":"fibrinemie","pos":"noun","definitions":["fibrinemia"],"forms":{"plural":"fibrinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fibrinemie","accusative-definite-nominative-singular":"fibrinemia","accusative-indefinite-nominative-plural":"fibrinemii","accusative-definite-nominative-plural":"fibrinemiile","dative-genitive-indefinite-singular":"fibrinemii","dative-definite-genitive-singular":"fibrinemiei","dative-genitive-indefinite-plural":"fibrinemii","dative-definite-genitive-plural":"fibrinemiilor","singular-vocative":"fibrinemie","plural-vocative":"fibrinemiilor"}},{"word":"fibrinogen","pos":"noun","definitions":["fibrinogen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fibrinogen","accusative-definite-nominative":"fibrinogenul","dative-genitive-indefinite":"fibrinogen","dative-definite-genitive":"fibrinogenului","vocative":"fibrinogenule"}},{"word":"fibrinoliză","pos":"noun","definitions":["fibrinolysis"],"forms":{"plural":"fibrinolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibrinoliză","accusative-definite-nominative-singular":"fibrinoliza","accusative-indefinite-nominative-plural":"fibrinolize","accusative-definite-nominative-plural":"fibrinolizele","dative-genitive-indefinite-singular":"fibrinolize","dative-definite-genitive-singular":"fibrinolizei","dative-genitive-indefinite-plural":"fibrinolize","dative-definite-genitive-plural":"fibrinolizelor","singular-vocative":"fibrinoliză","plural-vocative":"fibrinolizelor"}},{"word":"fibrișoară","pos":"noun","definitions":["diminutive of fibră"],"forms":{"plural":"fibrișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibrișoară","accusative-definite-nominative-singular":"fibrișoara","accusative-indefinite-nominative-plural":"fibrișoare","accusative-definite-nominative-plural":"fibrișoarele","dative-genitive-indefinite-singular":"fibrișoare","dative-definite-genitive-singular":"fibrișoarei","dative-genitive-indefinite-plural":"fibrișoare","dative-definite-genitive-plural":"fibrișoarelor","singular-vocative":"fibrișoară","plural-vocative":"fibrișoarelor"}},{"word":"fibroadenom","pos":"noun","definitions":["fibroadenoma"],"forms":{"plural":"fibroadenoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibroadenom","accusative-definite-nominative-singular":"fibroadenomul","accusative-indefinite-nominative-plural":"fibroadenoame","accusative-definite-nominative-plural":"fibroadenoamele","dative-genitive-indefinite-singular":"fibroadenom","dative-definite-genitive-singular":"fibroadenomului","dative-genitive-indefinite-plural":"fibroadenoame","dative-definite-genitive-plural":"fibroadenoamelor","singular-vocative":"fibroadenomule","plural-vocative":"fibroadenoamelor"}},{"word":"fibrobeton","pos":"noun","definitions":["fibrocement"],"forms":{"plural":"fibrobetonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fibrobeton","accusative-definite-nominative-singular":"fibrobetonul","accusative-indefinite-nominative-plural":"fibrobetonuri","accusative-definite-nominative-plural":"fibrobetonurile","dative-genitive-indefinite-singular":"fibrobeton","dative-definite-genitive-singular":"fibrobetonului","dative-genitive-indefinite-plural":"fibrobetonuri","dative-definite-genitive-plural":"fibrobetonurilor","singular-vocative":"fibrobetonule","plural-vocative":"fibrobetonurilor"}},{"word":"fibroblast","pos":"noun","definitions":["fibroblast"],"forms":{"plural":"fibroblaste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibroblast","accusative-definite-nominative-singular":"fibroblastul","accusative-indefinite-nominative-plural":"fibroblaste","accusative-definite-nominative-plural":"fibroblastele","dative-genitive-indefinite-singular":"fibroblast","dative-definite-genitive-singular":"fibroblastului","dative-genitive-indefinite-plural":"fibroblaste","dative-definite-genitive-plural":"fibroblastelor","singular-vocative":"fibroblastule","plural-vocative":"fibroblastelor"}},{"word":"fibroblastom","pos":"noun","definitions":["fibroblastoma"],"forms":{"plural":"fibroblastoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibroblastom","accusative-definite-nominative-singular":"fibroblastomul","accusative-indefinite-nominative-plural":"fibroblastoame","accusative-definite-nominative-plural":"fibroblastoamele","dative-genitive-indefinite-singular":"fibroblastom","dative-definite-genitive-singular":"fibroblastomului","dative-genitive-indefinite-plural":"fibroblastoame","dative-definite-genitive-plural":"fibroblastoamelor","singular-vocative":"fibroblastomule","plural-vocative":"fibroblastoamelor"}},{"word":"fibrocartilaginos","pos":"adj","definitions":["fibrocartilaginous"],"forms":{"feminine-singular":"fibrocartilaginoasă","masculine-plural":"fibrocartilaginoși","feminine-neuter-plural":"fibrocartilaginoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fibrocartilaginos","error-unrecognized-form-feminine-indefinite-singular":"fibrocartilaginoasă","error-unrecognized-form-indefinite-masculine-plural":"fibrocartilaginoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fibrocartilaginoase","definite-error-unrecognized-form-masculine-neuter-singular":"fibrocartilaginosul","definite-error-unrecognized-form-feminine-singular":"fibrocartilaginoasa","definite-error-unrecognized-form-masculine-plural":"fibrocartilaginoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fibrocartilaginoasele"}},{"word":"fibrocartilaj","pos":"noun","definitions":["fibrocartilage"],"forms":{"plural":"fibrocartilaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibrocartilaj","accusative-definite-nominative-singular":"fibrocartilajul","accusative-indefinite-nominative-plural":"fibrocartilaje","accusative-definite-nominative-plural":"fibrocartilajele","dative-genitive-indefinite-singular":"fibrocartilaj","dative-definite-genitive-singular":"fibrocartilajului","dative-genitive-indefinite-plural":"fibrocartilaje","dative-definite-genitive-plural":"fibrocartilajelor","singular-vocative":"fibrocartilajule","plural-vocative":"fibrocartilajelor"}},{"word":"fibrociment","pos":"noun","definitions":["fibre cement, fibrocement (containing asbestos etc.)"],"forms":{"plural":"fibrocimenturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fibrociment","accusative-definite-nominative-singular":"fibrocimentul","accusative-indefinite-nominative-plural":"fibrocimenturi","accusative-definite-nominative-plural":"fibrocimenturile","dative-genitive-indefinite-singular":"fibrociment","dative-definite-genitive-singular":"fibrocimentului","dative-genitive-indefinite-plural":"fibrocimenturi","dative-definite-genitive-plural":"fibrocimenturilor","singular-vocative":"fibrocimentule","plural-vocative":"fibrocimenturilor"}},{"word":"fibrocit","pos":"noun","definitions":["fibrocyte"],"forms":{"plural":"fibrocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibrocit","accusative-definite-nominative-singular":"fibrocitul","accusative-indefinite-nominative-plural":"fibrocite","accusative-definite-nominative-plural":"fibrocitele","dative-genitive-indefinite-singular":"fibrocit","dative-definite-genitive-singular":"fibrocitului","dative-genitive-indefinite-plural":"fibrocite","dative-definite-genitive-plural":"fibrocitelor","singular-vocative":"fibrocitule","plural-vocative":"fibrocitelor"}},{"word":"fibroină","pos":"noun","definitions":["fibroin"],"forms":{"plural":"fibroine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibroină","accusative-definite-nominative-singular":"fibroina","accusative-indefinite-nominative-plural":"fibroine","accusative-definite-nominative-plural":"fibroinele","dative-genitive-indefinite-singular":"fibroine","dative-definite-genitive-singular":"fibroinei","dative-genitive-indefinite-plural":"fibroine","dative-definite-genitive-plural":"fibroinelor","singular-vocative":"fibroină","plural-vocative":"fibroinelor"}},{"word":"fibrolipom","pos":"noun","definitions":["fibrolipoma"],"forms":{"plural":"fibrolipoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibrolipom","accusative-definite-nominative-singular":"fibrolipomul","accusative-indefinite-nominative-plural":"fibrolipoame","accusative-definite-nominative-plural":"fibrolipoamele","dative-genitive-indefinite-singular":"fibrolipom","dative-definite-genitive-singular":"fibrolipomului","dative-genitive-indefinite-plural":"fibrolipoame","dative-definite-genitive-plural":"fibrolipoamelor","singular-vocative":"fibrolipomule","plural-vocative":"fibrolipoamelor"}},{"word":"fibrom","pos":"noun","definitions":["fibroma"],"forms":{"plural":"fibroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibrom","accusative-definite-nominative-singular":"fibromul","accusative-indefinite-nominative-plural":"fibroame","accusative-definite-nominative-plural":"fibroamele","dative-genitive-indefinite-singular":"fibrom","dative-definite-genitive-singular":"fibromului","dative-genitive-indefinite-plural":"fibroame","dative-definite-genitive-plural":"fibroamelor","singular-vocative":"fibromule","plural-vocative":"fibroamelor"}},{"word":"fibromatos","pos":"adj","definitions":["fibromatous"],"forms":{"feminine-singular":"fibromatoasă","masculine-plural":"fibromatoși","feminine-neuter-plural":"fibromatoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fibromatos","error-unrecognized-form-feminine-indefinite-singular":"fibromatoasă","error-unrecognized-form-indefinite-masculine-plural":"fibromatoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fibromatoase","definite-error-unrecognized-form-masculine-neuter-singular":"fibromatosul","definite-error-unrecognized-form-feminine-singular":"fibromatoasa","definite-error-unrecognized-form-masculine-plural":"fibromatoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fibromatoasele"}},{"word":"fibromatoză","pos":"noun","definitions":["fibromatosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibromatoză","accusative-definite-nominative-singular":"fibromatoza","accusative-indefinite-nominative-plural":"fibromatoze","accusative-definite-nominative-plural":"fibromatozele","dative-genitive-indefinite-singular":"fibromatoze","dative-definite-genitive-singular":"fibromatozei","dative-genitive-indefinite-plural":"fibromatoze","dative-definite-genitive-plural":"fibromatozelor","singular-vocative":"fibromatoză","plural-vocative":"fibromatozelor"}},{"word":"fibromiom","pos":"noun","definitions":["fibromyoma"],"forms":{"plural":"fibromiomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fibromiom","accusative-definite-nominative-singular":"fibromiomul","accusative-indefinite-nominative-plural":"fibromiomuri","accusative-definite-nominative-plural":"fibromiomurile","dative-genitive-indefinite-singular":"fibromiom","dative-definite-genitive-singular":"fibromiomului","dative-genitive-indefinite-plural":"fibromiomuri","dative-definite-genitive-plural":"fibromiomurilor","singular-vocative":"fibromiomule","plural-vocative":"fibromiomurilor"}},{"word":"fibros","pos":"adj","definitions":["fibrous"],"pronunciation":"/fiˈbros/","forms":{"feminine-singular":"fibroasă","masculine-plural":"fibroși","feminine-neuter-plural":"fibroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fibros","error-unrecognized-form-feminine-indefinite-singular":"fibroasă","error-unrecognized-form-indefinite-masculine-plural":"fibroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fibroase","definite-error-unrecognized-form-masculine-neuter-singular":"fibrosul","definite-error-unrecognized-form-feminine-singular":"fibroasa","definite-error-unrecognized-form-masculine-plural":"fibroșii","definite-error-unrecognized-form-feminine-neuter-plural":"fibroasele"}},{"word":"fibrosarcom","pos":"noun","definitions":["fibrosarcoma"],"forms":{"plural":"fibrosarcoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibrosarcom","accusative-definite-nominative-singular":"fibrosarcomul","accusative-indefinite-nominative-plural":"fibrosarcoame","accusative-definite-nominative-plural":"fibrosarcoamele","dative-genitive-indefinite-singular":"fibrosarcom","dative-definite-genitive-singular":"fibrosarcomului","dative-genitive-indefinite-plural":"fibrosarcoame","dative-definite-genitive-plural":"fibrosarcoamelor","singular-vocative":"fibrosarcomule","plural-vocative":"fibrosarcoamelor"}},{"word":"fibroscop","pos":"noun","definitions":["fiberscope"],"forms":{"plural":"fibroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fibroscop","accusative-definite-nominative-singular":"fibroscopul","accusative-indefinite-nominative-plural":"fibroscoape","accusative-definite-nominative-plural":"fibroscoapele","dative-genitive-indefinite-singular":"fibroscop","dative-definite-genitive-singular":"fibroscopului","dative-genitive-indefinite-plural":"fibroscoape","dative-definite-genitive-plural":"fibroscoapelor","singular-vocative":"fibroscopule","plural-vocative":"fibroscoapelor"}},{"word":"fibroză","pos":"noun","definitions":["fibrosis"],"forms":{"plural":"fibroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fibroză","accusative-definite-nominative-singular":"fibroza","accusative-indefinite-nominative-plural":"fibroze","accusative-definite-nominative-plural":"fibrozele","dative-genitive-indefinite-singular":"fibroze","dative-definite-genitive-singular":"fibrozei","dative-genitive-indefinite-plural":"fibroze","dative-definite-genitive-plural":"fibrozelor","singular-vocative":"fibroză","plural-vocative":"fibrozelor"}},{"word":"fibula","pos":"noun","definitions":["definite nominative/accusative singular of fibulă"],"pronunciation":"[fiˈbula]","gender":"f"},{"word":"fibulă","pos":"noun","definitions":["fibula (bone)","decorative metal clip or clasp that served to complete a garment in ancient times"],"forms":{"plural":"fibule"}},{"word":"fibule","pos":"noun","definitions":["inflection of fibulă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[fiˈbule]","gender":"f"},{"word":"ficat","pos":"noun","definitions":["liver (organ of the body)"],"pronunciation":"/fiˈkat/","forms":{"plural":"ficați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficat","accusative-definite-nominative-singular":"ficatul","accusative-indefinite-nominative-plural":"ficați","accusative-definite-nominative-plural":"ficații","dative-genitive-indefinite-singular":"ficat","dative-definite-genitive-singular":"ficatului","dative-genitive-indefinite-plural":"ficați","dative-definite-genitive-plural":"ficaților","singular-vocative":"ficatule","plural-vocative":"ficaților","alternative":"фикат"}},{"word":"Ficătar","pos":"name","definitions":["a village in Racovița, Timiș County, Romania"],"gender":"f"},{"word":"ficățel","pos":"noun","definitions":["diminutive of ficat; small liver"],"forms":{"plural":"ficăței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficățel","accusative-definite-nominative-singular":"ficățelul","accusative-indefinite-nominative-plural":"ficățeli","accusative-definite-nominative-plural":"ficățelii","dative-genitive-indefinite-singular":"ficățel","dative-definite-genitive-singular":"ficățelului","dative-genitive-indefinite-plural":"ficățeli","dative-definite-genitive-plural":"ficățelilor","singular-vocative":"ficățelule","plural-vocative":"ficățelilor"}},{"word":"Fichitești","pos":"name","definitions":["a village in Podu Turcului, Bacău County, Romania"],"gender":"m"},{"word":"ficioară","pos":"noun","definitions":["obsolete form of fecioară"],"forms":{"plural":"ficioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ficioară","accusative-definite-nominative-singular":"ficioara","accusative-indefinite-nominative-plural":"ficioare","accusative-definite-nominative-plural":"ficioarele","dative-genitive-indefinite-singular":"ficioare","dative-definite-genitive-singular":"ficioarei","dative-genitive-indefinite-plural":"ficioare","dative-definite-genitive-plural":"ficioarelor","singular-vocative":"ficioară","plural-vocative":"ficioarelor"}},{"word":"Ficior","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ficior"}},{"word":"ficior","pos":"noun","definitions":["alternative form of fecior"],"forms":{"plural":"ficiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficior","accusative-definite-nominative-singular":"ficiorul","accusative-indefinite-nominative-plural":"ficiori","accusative-definite-nominative-plural":"ficiorii","dative-genitive-indefinite-singular":"ficior","dative-definite-genitive-singular":"ficiorului","dative-genitive-indefinite-plural":"ficiori","dative-definite-genitive-plural":"ficiorilor","singular-vocative":"ficiorule","plural-vocative":"ficiorilor"}},{"word":"Ficioru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ficioru"}},{"word":"ficlean","pos":"adj","definitions":["obsolete form of viclean"],"forms":{"feminine-singular":"ficleană","masculine-plural":"ficleni","feminine-neuter-plural":"ficlene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ficlean","error-unrecognized-form-feminine-indefinite-singular":"ficleană","error-unrecognized-form-indefinite-masculine-plural":"ficleni","error-unrecognized-form-feminine-indefinite-neuter-plural":"ficlene","definite-error-unrecognized-form-masculine-neuter-singular":"ficleanul","definite-error-unrecognized-form-feminine-singular":"ficleana","definite-error-unrecognized-form-masculine-plural":"ficlenii","definite-error-unrecognized-form-feminine-neuter-plural":"ficlenele"}},{"word":"ficocianină","pos":"noun","definitions":["phycocyanin"],"forms":{"plural":"ficocianine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ficocianină","accusative-definite-nominative-singular":"ficocianina","accusative-indefinite-nominative-plural":"ficocianine","accusative-definite-nominative-plural":"ficocianinele","dative-genitive-indefinite-singular":"ficocianine","dative-definite-genitive-singular":"ficocianinei","dative-genitive-indefinite-plural":"ficocianine","dative-definite-genitive-plural":"ficocianinelor","singular-vocative":"ficocianină","plural-vocative":"ficocianinelor"}},{"word":"ficoeritrină","pos":"noun","definitions":["phycoerythrin"],"forms":{"plural":"ficoeritrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ficoeritrină","accusative-definite-nominative-singular":"ficoeritrina","accusative-indefinite-nominative-plural":"ficoeritrine","accusative-definite-nominative-plural":"ficoeritrinele","dative-genitive-indefinite-singular":"ficoeritrine","dative-definite-genitive-singular":"ficoeritrinei","dative-genitive-indefinite-plural":"ficoeritrine","dative-definite-genitive-plural":"ficoeritrinelor","singular-vocative":"ficoeritrină","plural-vocative":"ficoeritrinelor"}},{"word":"ficolog","pos":"noun","definitions":["phycologist"],"forms":{"plural":"ficologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficolog","accusative-definite-nominative-singular":"ficologul","accusative-indefinite-nominative-plural":"ficologi","accusative-definite-nominative-plural":"ficologii","dative-genitive-indefinite-singular":"ficolog","dative-definite-genitive-singular":"ficologului","dative-genitive-indefinite-plural":"ficologi","dative-definite-genitive-plural":"ficologilor","singular-vocative":"ficologule","plural-vocative":"ficologilor"}},{"word":"ficologic","pos":"adj","definitions":["phycological"],"forms":{"feminine-singular":"ficologică","masculine-plural":"ficologici","feminine-neuter-plural":"ficologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ficologic","error-unrecognized-form-feminine-indefinite-singular":"ficologică","error-unrecognized-form-indefinite-masculine-plural":"ficologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ficologice","definite-error-unrecognized-form-masculine-neuter-singular":"ficologicul","definite-error-unrecognized-form-feminine-singular":"ficologica","definite-error-unrecognized-form-masculine-plural":"ficologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ficologicele"}},{"word":"ficologie","pos":"noun","definitions":["phycology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ficologie","accusative-definite-nominative":"ficologia","dative-genitive-indefinite":"ficologii","dative-definite-genitive":"ficologiei","vocative":"ficologie"}},{"word":"ficomicetă","pos":"noun","definitions":["phycomycete"],"forms":{"plural":"ficomicete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ficomicetă","accusative-definite-nominative-singular":"ficomiceta","accusative-indefinite-nominative-plural":"ficomicete","accusative-definite-nominative-plural":"ficomicetele","dative-genitive-indefinite-singular":"ficomicete","dative-definite-genitive-singular":"ficomicetei","dative-genitive-indefinite-plural":"ficomicete","dative-definite-genitive-plural":"ficomicetelor","singular-vocative":"ficomicetă","plural-vocative":"ficomicetelor"}},{"word":"ficțional","pos":"adj","definitions":["fictional"],"forms":{"feminine-singular":"ficțională","masculine-plural":"ficționali","feminine-neuter-plural":"ficționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ficțional","error-unrecognized-form-feminine-indefinite-singular":"ficțională","error-unrecognized-form-indefinite-masculine-plural":"ficționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"ficționale","definite-error-unrecognized-form-masculine-neuter-singular":"ficționalul","definite-error-unrecognized-form-feminine-singular":"ficționala","definite-error-unrecognized-form-masculine-plural":"ficționalii","definite-error-unrecognized-form-feminine-neuter-plural":"ficționalele"}},{"word":"ficționalism","pos":"noun","definitions":["fictionalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ficționalism","accusative-definite-nominative-singular":"ficționalismul","accusative-indefinite-nominative-plural":"ficționalisme","accusative-definite-nominative-plural":"ficționalismele","dative-genitive-indefinite-singular":"ficționalism","dative-definite-genitive-singular":"ficționalismului","dative-genitive-indefinite-plural":"ficționalisme","dative-definite-genitive-plural":"ficționalismelor","singular-vocative":"ficționalismule","plural-vocative":"ficționalismelor"}},{"word":"ficționalist","pos":"adj","definitions":["fictionalist"],"forms":{"feminine-singular":"ficționalistă","masculine-plural":"ficționaliști","feminine-neuter-plural":"ficționaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ficționalist","error-unrecognized-form-feminine-indefinite-singular":"ficționalistă","error-unrecognized-form-indefinite-masculine-plural":"ficționaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"ficționaliste","definite-error-unrecognized-form-masculine-neuter-singular":"ficționalistul","definite-error-unrecognized-form-feminine-singular":"ficționalista","definite-error-unrecognized-form-masculine-plural":"ficționaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"ficționalistele"}},{"word":"ficționalist","pos":"noun","definitions":["fictionalist"],"forms":{"plural":"ficționaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficționalist","accusative-definite-nominative-singular":"ficționalistul","accusative-indefinite-nominative-plural":"ficționaliști","accusative-definite-nominative-plural":"ficționaliștii","dative-genitive-indefinite-singular":"ficționalist","dative-definite-genitive-singular":"ficționalistului","dative-genitive-indefinite-plural":"ficționaliști","dative-definite-genitive-plural":"ficționaliștilor","singular-vocative":"ficționalistule","plural-vocative":"ficționaliștilor"}},{"word":"ficțiune","pos":"noun","definitions":["fiction"],"forms":{"plural":"ficțiuni"}},{"word":"fictiv","pos":"adj","definitions":["fictitious"],"forms":{"feminine-singular":"fictivă","masculine-plural":"fictivi","feminine-neuter-plural":"fictive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fictiv","error-unrecognized-form-feminine-indefinite-singular":"fictivă","error-unrecognized-form-indefinite-masculine-plural":"fictivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fictive","definite-error-unrecognized-form-masculine-neuter-singular":"fictivul","definite-error-unrecognized-form-feminine-singular":"fictiva","definite-error-unrecognized-form-masculine-plural":"fictivii","definite-error-unrecognized-form-feminine-neuter-plural":"fictivele"}},{"word":"ficus","pos":"noun","definitions":["ficus"],"forms":{"plural":"ficuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficus","accusative-definite-nominative-singular":"ficusul","accusative-indefinite-nominative-plural":"ficuși","accusative-definite-nominative-plural":"ficușii","dative-genitive-indefinite-singular":"ficus","dative-definite-genitive-singular":"ficusului","dative-genitive-indefinite-plural":"ficuși","dative-definite-genitive-plural":"ficușilor","singular-vocative":"ficusule","plural-vocative":"ficușilor"}},{"word":"ficuț","pos":"noun","definitions":["diminutive of fic"],"forms":{"plural":"ficuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ficuț","accusative-definite-nominative-singular":"ficuțul","accusative-indefinite-nominative-plural":"ficuți","accusative-definite-nominative-plural":"ficuții","dative-genitive-indefinite-singular":"ficuț","dative-definite-genitive-singular":"ficuțului","dative-genitive-indefinite-plural":"ficuți","dative-definite-genitive-plural":"ficuților","singular-vocative":"ficuțule","plural-vocative":"ficuților"}},{"word":"fidanțare","pos":"noun","definitions":["engagement"],"forms":{"plural":"fidanțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fidanțare","accusative-definite-nominative-singular":"fidanțarea","accusative-indefinite-nominative-plural":"fidanțări","accusative-definite-nominative-plural":"fidanțările","dative-genitive-indefinite-singular":"fidanțări","dative-definite-genitive-singular":"fidanțării","dative-genitive-indefinite-plural":"fidanțări","dative-definite-genitive-plural":"fidanțărilor","singular-vocative":"fidanțare","plural-vocative":"fidanțărilor"}},{"word":"fidanțat","pos":"noun","definitions":["fiancé"],"forms":{"plural":"fidanțați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fidanțat","accusative-definite-nominative-singular":"fidanțatul","accusative-indefinite-nominative-plural":"fidanțați","accusative-definite-nominative-plural":"fidanțații","dative-genitive-indefinite-singular":"fidanțat","dative-definite-genitive-singular":"fidanțatului","dative-genitive-indefinite-plural":"fidanțați","dative-definite-genitive-plural":"fidanțaților","singular-vocative":"fidanțatule","plural-vocative":"fidanțaților"}},{"word":"fidea","pos":"noun","definitions":["vermicelli"],"pronunciation":"/fiˈde̯a/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative":"fidea","accusative-definite-nominative":"fideaua","dative-genitive-indefinite":"fidele","dative-definite-genitive":"fidelei","vocative":"fidea"}},{"word":"fideism","pos":"noun","definitions":["fideism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fideism","accusative-definite-nominative":"fideismul","dative-genitive-indefinite":"fideism","dative-definite-genitive":"fideismului","vocative":"fideismule"}},{"word":"fideist","pos":"noun","definitions":["fideist"],"forms":{"plural":"fideiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fideist","accusative-definite-nominative-singular":"fideistul","accusative-indefinite-nominative-plural":"fideiști","accusative-definite-nominative-plural":"fideiștii","dative-genitive-indefinite-singular":"fideist","dative-definite-genitive-singular":"fideistului","dative-genitive-indefinite-plural":"fideiști","dative-definite-genitive-plural":"fideiștilor","singular-vocative":"fideistule","plural-vocative":"fideiștilor"}},{"word":"fideistă","pos":"noun","definitions":["female equivalent of fideist"],"forms":{"plural":"fideiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fideistă","accusative-definite-nominative-singular":"fideista","accusative-indefinite-nominative-plural":"fideiste","accusative-definite-nominative-plural":"fideistele","dative-genitive-indefinite-singular":"fideiste","dative-definite-genitive-singular":"fideistei","dative-genitive-indefinite-plural":"fideiste","dative-definite-genitive-plural":"fideistelor","singular-vocative":"fideistă","plural-vocative":"fideistelor"}},{"word":"fideiusiune","pos":"noun","definitions":["suretyship"],"pronunciation":"/fi.de.juˈsju.ne/","forms":{"plural":"fideiusiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fideiusiune","accusative-definite-nominative-singular":"fideiusiunea","accusative-indefinite-nominative-plural":"fideiusiuni","accusative-definite-nominative-plural":"fideiusiunile","dative-genitive-indefinite-singular":"fideiusiuni","dative-definite-genitive-singular":"fideiusiunii","dative-genitive-indefinite-plural":"fideiusiuni","dative-definite-genitive-plural":"fideiusiunilor","singular-vocative":"fideiusiune","plural-vocative":"fideiusiunilor"}},{"word":"fideiusor","pos":"noun","definitions":["guarantor (of a surety or bail)"],"forms":{"plural":"fideiusori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fideiusor","accusative-definite-nominative-singular":"fideiusorul","accusative-indefinite-nominative-plural":"fideiusori","accusative-definite-nominative-plural":"fideiusorii","dative-genitive-indefinite-singular":"fideiusor","dative-definite-genitive-singular":"fideiusorului","dative-genitive-indefinite-plural":"fideiusori","dative-definite-genitive-plural":"fideiusorilor","singular-vocative":"fideiusorule","plural-vocative":"fideiusorilor"}},{"word":"fidel","pos":"adj","definitions":["loyal"],"pronunciation":"/fiˈdel/","forms":{"feminine-singular":"fidelă","masculine-plural":"fideli","feminine-neuter-plural":"fidele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fidel","error-unrecognized-form-feminine-indefinite-singular":"fidelă","error-unrecognized-form-indefinite-masculine-plural":"fideli","error-unrecognized-form-feminine-indefinite-neuter-plural":"fidele","definite-error-unrecognized-form-masculine-neuter-singular":"fidelul","definite-error-unrecognized-form-feminine-singular":"fidela","definite-error-unrecognized-form-masculine-plural":"fidelii","definite-error-unrecognized-form-feminine-neuter-plural":"fidelele"}},{"word":"fidelitate","pos":"noun","definitions":["fidelity","trustworthiness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fidelitate","accusative-definite-nominative":"fidelitatea","dative-genitive-indefinite":"fidelități","dative-definite-genitive":"fidelității","vocative":"fidelitate","alternative":"фиделитате"}},{"word":"fiduciar","pos":"adj","definitions":["fiduciary"],"forms":{"feminine-singular":"fiduciară","masculine-plural":"fiduciari","feminine-neuter-plural":"fiduciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiduciar","error-unrecognized-form-feminine-indefinite-singular":"fiduciară","error-unrecognized-form-indefinite-masculine-plural":"fiduciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiduciare","definite-error-unrecognized-form-masculine-neuter-singular":"fiduciarul","definite-error-unrecognized-form-feminine-singular":"fiduciara","definite-error-unrecognized-form-masculine-plural":"fiduciarii","definite-error-unrecognized-form-feminine-neuter-plural":"fiduciarele"}},{"word":"fie","pos":"verb","definitions":["third-person singular/plural subjunctive of fi (“to be”)"],"pronunciation":"/ˈfi.e/"},{"word":"fie","pos":"noun","definitions":["daughter"],"pronunciation":"/ˈfi.e/","forms":{"plural":"fii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fie","accusative-definite-nominative-singular":"fia","accusative-indefinite-nominative-plural":"fii","accusative-definite-nominative-plural":"fiile","dative-genitive-indefinite-singular":"fii","dative-definite-genitive-singular":"fiei","dative-genitive-indefinite-plural":"fii","dative-definite-genitive-plural":"fiilor","singular-vocative":"fie","plural-vocative":"fiilor","alternative-obsolete":"fiie"}},{"word":"fie-sa","pos":"contraction","definitions":["contraction of fiică + sa his or her daughter"],"pronunciation":"/ˈfi.e.sa/"},{"word":"fiecare","pos":"det","definitions":["every, each"],"pronunciation":"/fi.eˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"fiecare","accusative-feminine-nominative-singular":"fiecare","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"fiecărui","dative-feminine-genitive-singular":"fiecărei","dative-genitive-masculine-plural":"fiecăror","dative-feminine-genitive-neuter-plural":"fiecăror","alternative":"fieșcare"}},{"word":"fiecare","pos":"pron","definitions":["everyone, each one"],"pronunciation":"/fi.eˈka.re/","forms":{"table-tags":"no-table-tags","inflection-template":"l-self","accusative-masculine-neuter-nominative-singular":"fiecare","accusative-feminine-nominative-singular":"fiecare","accusative-masculine-nominative-plural":"-","accusative-feminine-neuter-nominative-plural":"-","dative-genitive-masculine-neuter-singular":"fiecăruia","dative-feminine-genitive-singular":"fiecăreia","dative-genitive-masculine-plural":"fiecărora","dative-feminine-genitive-neuter-plural":"fiecărora","alternative":"fieșcare"}},{"word":"fiecum","pos":"adv","definitions":["anyhow"]},{"word":"fief","pos":"noun","definitions":["fief"],"forms":{"plural":"fiefuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fief","accusative-definite-nominative-singular":"fieful","accusative-indefinite-nominative-plural":"fiefuri","accusative-definite-nominative-plural":"fiefurile","dative-genitive-indefinite-singular":"fief","dative-definite-genitive-singular":"fiefului","dative-genitive-indefinite-plural":"fiefuri","dative-definite-genitive-plural":"fiefurilor","singular-vocative":"fiefule","plural-vocative":"fiefurilor"}},{"word":"Fieni","pos":"name","definitions":["a town in Dâmbovița County, Romania"],"gender":"m"},{"word":"Fier","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fier"}},{"word":"fier","pos":"noun","definitions":["iron","tool made of iron"],"pronunciation":"/fjer/","examples":[{"ro":"Fierul este un metal.","en":"Iron is a metal."},{"ro":"Bunica mea are multe oale de fier.","en":"My grandmother has many iron pots."}],"forms":{"plural":"fiare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fier","accusative-definite-nominative-singular":"fierul","accusative-indefinite-nominative-plural":"fiare","accusative-definite-nominative-plural":"fiarele","dative-genitive-indefinite-singular":"fier","dative-definite-genitive-singular":"fierului","dative-genitive-indefinite-plural":"fiare","dative-definite-genitive-plural":"fiarelor","singular-vocative":"fierule","plural-vocative":"fiarelor","alternative-regional":"fer"}},{"word":"fier de călcat","pos":"noun","definitions":["iron (for pressing clothes)"],"examples":[{"ro":"(Banat), utiug (Republic of Moldova), călcător","en":null}],"forms":{"plural":"fiare de călcat"}},{"word":"fier forjat","pos":"noun","definitions":["wrought iron"]},{"word":"fier vechi","pos":"noun","definitions":["scrap iron"]},{"word":"fierar","pos":"noun","definitions":["blacksmith, smith"],"forms":{"plural":"fierari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fierar","accusative-definite-nominative-singular":"fierarul","accusative-indefinite-nominative-plural":"fierari","accusative-definite-nominative-plural":"fierarii","dative-genitive-indefinite-singular":"fierar","dative-definite-genitive-singular":"fierarului","dative-genitive-indefinite-plural":"fierari","dative-definite-genitive-plural":"fierarilor","singular-vocative":"fierarule","plural-vocative":"fierarilor"}},{"word":"fierăraș","pos":"noun","definitions":["diminutive of fierar"],"forms":{"plural":"fierărași","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fierăraș","accusative-definite-nominative-singular":"fierărașul","accusative-indefinite-nominative-plural":"fierărași","accusative-definite-nominative-plural":"fierărașile","dative-genitive-indefinite-singular":"fierăraș","dative-definite-genitive-singular":"fierărașului","dative-genitive-indefinite-plural":"fierărași","dative-definite-genitive-plural":"fierărașilor","singular-vocative":"fierărașule","plural-vocative":"fierărașilor"}},{"word":"fierăreasă","pos":"noun","definitions":["female equivalent of fierar"],"forms":{"plural":"fierărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fierăreasă","accusative-definite-nominative-singular":"fierăreasa","accusative-indefinite-nominative-plural":"fierărese","accusative-definite-nominative-plural":"fierăresele","dative-genitive-indefinite-singular":"fierărese","dative-definite-genitive-singular":"fierăresei","dative-genitive-indefinite-plural":"fierărese","dative-definite-genitive-plural":"fierăreselor","singular-vocative":"fierăreasă","plural-vocative":"fierăreselor"}},{"word":"fierari","pos":"noun","definitions":["plural of fierar"],"gender":"m-p"},{"word":"Fierăria","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Ghimbav"],"gender":"f"},{"word":"fierărie","pos":"noun","definitions":["forge, smithy"],"forms":{"plural":"fierării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fierărie","accusative-definite-nominative-singular":"fierăria","accusative-indefinite-nominative-plural":"fierării","accusative-definite-nominative-plural":"fierăriile","dative-genitive-indefinite-singular":"fierării","dative-definite-genitive-singular":"fierăriei","dative-genitive-indefinite-plural":"fierării","dative-definite-genitive-plural":"fierăriilor","singular-vocative":"fierărie","plural-vocative":"fierăriilor"}},{"word":"fierărit","pos":"noun","definitions":["blacksmithing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fierărit","accusative-definite-nominative":"fierăritul","dative-genitive-indefinite":"fierărit","dative-definite-genitive":"fierăritului","vocative":"fierăritule"}},{"word":"fierăriță","pos":"noun","definitions":["female equivalent of fierar"],"forms":{"plural":"fierărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fierăriță","accusative-definite-nominative-singular":"fierărița","accusative-indefinite-nominative-plural":"fierărițe","accusative-definite-nominative-plural":"fierărițele","dative-genitive-indefinite-singular":"fierărițe","dative-definite-genitive-singular":"fierăriței","dative-genitive-indefinite-plural":"fierărițe","dative-definite-genitive-plural":"fierărițelor","singular-vocative":"fierăriță","plural-vocative":"fierărițelor"}},{"word":"Fierariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fierariu"}},{"word":"Fieraru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fieraru"}},{"word":"Fierarul","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Cormoș"],"gender":"m"},{"word":"Fierăscu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fierăscu"}},{"word":"fierăstrău","pos":"noun","definitions":["alternative form of ferăstrău"],"forms":{"plural":"fierăstraie"}},{"word":"Fierăstrăul","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Mureș"],"gender":"m"},{"word":"fierăstrui","pos":"verb","definitions":["alternative form of ferestrui"],"forms":{"canonical":"a fierăstrui 4th conjugation","present-singular-third-person":"fierăstruiește","participle-past":"fierăstruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fierăstrui","gerund":"fierăstruind","first-person-indicative-present-singular":"fierăstruiesc","indicative-present-second-person-singular":"fierăstruiești","indicative-present-singular-third-person":"fierăstruiește","first-person-indicative-plural-present":"fierăstruim","indicative-plural-present-second-person":"fierăstruiți","indicative-plural-present-third-person":"fierăstruiesc","first-person-imperfect-indicative-singular":"fierăstruiam","imperfect-indicative-second-person-singular":"fierăstruiai","imperfect-indicative-singular-third-person":"fierăstruia","first-person-imperfect-indicative-plural":"fierăstruiam","imperfect-indicative-plural-second-person":"fierăstruiați","imperfect-indicative-plural-third-person":"fierăstruiau","first-person-indicative-perfect-singular":"fierăstruii","indicative-perfect-second-person-singular":"fierăstruiși","indicative-perfect-singular-third-person":"fierăstrui","first-person-indicative-perfect-plural":"fierăstruirăm","indicative-perfect-plural-second-person":"fierăstruirăți","indicative-perfect-plural-third-person":"fierăstruiră","first-person-indicative-pluperfect-singular":"fierăstruisem","indicative-pluperfect-second-person-singular":"fierăstruiseși","indicative-pluperfect-singular-third-person":"fierăstruise","first-person-indicative-pluperfect-plural":"fierăstruiserăm","indicative-pluperfect-plural-second-person":"fierăstruiserăți","indicative-pluperfect-plural-third-person":"fierăstruiseră","first-person-present-singular-subjunctive":"să fierăstruiesc","present-second-person-singular-subjunctive":"să fierăstruiești","present-singular-subjunctive-third-person":"să fierăstruiască","first-person-plural-present-subjunctive":"să fierăstruim","plural-present-second-person-subjunctive":"să fierăstruiți","plural-present-subjunctive-third-person":"să fierăstruiască","imperative-second-person-singular":"fierăstruiește","imperative-plural-second-person":"fierăstruiți","imperative-negative-second-person-singular":"nu fierăstrui","imperative-negative-plural-second-person":"nu fierăstruiți"}},{"word":"fierăstruire","pos":"noun","definitions":["sawing"],"forms":{"plural":"fierăstruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fierăstruire","accusative-definite-nominative-singular":"fierăstruirea","accusative-indefinite-nominative-plural":"fierăstruiri","accusative-definite-nominative-plural":"fierăstruirile","dative-genitive-indefinite-singular":"fierăstruiri","dative-definite-genitive-singular":"fierăstruirii","dative-genitive-indefinite-plural":"fierăstruiri","dative-definite-genitive-plural":"fierăstruirilor","singular-vocative":"fierăstruire","plural-vocative":"fierăstruirilor"}},{"word":"fierăstruit","pos":"adj","definitions":["sawn"],"pronunciation":"/fie.rə.struˈit/","forms":{"feminine-singular":"fierăstruită","masculine-plural":"fierăstruiți","feminine-neuter-plural":"fierăstruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fierăstruit","error-unrecognized-form-feminine-indefinite-singular":"fierăstruită","error-unrecognized-form-indefinite-masculine-plural":"fierăstruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fierăstruite","definite-error-unrecognized-form-masculine-neuter-singular":"fierăstruitul","definite-error-unrecognized-form-feminine-singular":"fierăstruita","definite-error-unrecognized-form-masculine-plural":"fierăstruiții","definite-error-unrecognized-form-feminine-neuter-plural":"fierăstruitele"}},{"word":"fierăstruit","pos":"verb","definitions":["past participle of fierăstrui"],"pronunciation":"/fie.rə.struˈit/","forms":{"participle-past":"of fierăstrui"}},{"word":"fierătaie","pos":"noun","definitions":["many pieces of iron or instruments made from iron"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative":"fierătaie","accusative-definite-nominative":"fierătaia","dative-genitive-indefinite":"fierătăi","dative-definite-genitive":"fierătăii","vocative":"fierătaie"}},{"word":"fieratic","pos":"adj","definitions":["wild"],"forms":{"feminine-singular":"fieratică","masculine-plural":"fieratici","feminine-neuter-plural":"fieratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fieratic","error-unrecognized-form-feminine-indefinite-singular":"fieratică","error-unrecognized-form-indefinite-masculine-plural":"fieratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fieratice","definite-error-unrecognized-form-masculine-neuter-singular":"fieraticul","definite-error-unrecognized-form-feminine-singular":"fieratica","definite-error-unrecognized-form-masculine-plural":"fieraticii","definite-error-unrecognized-form-feminine-neuter-plural":"fieraticele"}},{"word":"fierb","pos":"verb","definitions":["inflection of fierbe:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"fierbânta","pos":"verb","definitions":["to make hotter"],"forms":{"canonical":"a fierbânta 1st conjugation","present-singular-third-person":"fierbântă","participle-past":"fierbântat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fierbânta","gerund":"fierbântând","first-person-indicative-present-singular":"fierbânt","indicative-present-second-person-singular":"fierbânți","indicative-present-singular-third-person":"fierbântă","first-person-indicative-plural-present":"fierbântăm","indicative-plural-present-second-person":"fierbântați","indicative-plural-present-third-person":"fierbântă","first-person-imperfect-indicative-singular":"fierbântam","imperfect-indicative-second-person-singular":"fierbântai","imperfect-indicative-singular-third-person":"fierbânta","first-person-imperfect-indicative-plural":"fierbântam","imperfect-indicative-plural-second-person":"fierbântați","imperfect-indicative-plural-third-person":"fierbântau","first-person-indicative-perfect-singular":"fierbântai","indicative-perfect-second-person-singular":"fierbântași","indicative-perfect-singular-third-person":"fierbântă","first-person-indicative-perfect-plural":"fierbântarăm","indicative-perfect-plural-second-person":"fierbântarăți","indicative-perfect-plural-third-person":"fierbântară","first-person-indicative-pluperfect-singular":"fierbântasem","indicative-pluperfect-second-person-singular":"fierbântaseși","indicative-pluperfect-singular-third-person":"fierbântase","first-person-indicative-pluperfect-plural":"fierbântaserăm","indicative-pluperfect-plural-second-person":"fierbântaserăți","indicative-pluperfect-plural-third-person":"fierbântaseră","first-person-present-singular-subjunctive":"să fierbânt","present-second-person-singular-subjunctive":"să fierbânți","present-singular-subjunctive-third-person":"să fierbânte","first-person-plural-present-subjunctive":"să fierbântăm","plural-present-second-person-subjunctive":"să fierbântați","plural-present-subjunctive-third-person":"să fierbânte","imperative-second-person-singular":"fierbântă","imperative-plural-second-person":"fierbântați","imperative-negative-second-person-singular":"nu fierbânta","imperative-negative-plural-second-person":"nu fierbântați"}},{"word":"fierbântat","pos":"adj","definitions":["heated"],"forms":{"feminine-singular":"fierbântată","masculine-plural":"fierbântați","feminine-neuter-plural":"fierbântate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fierbântat","error-unrecognized-form-feminine-indefinite-singular":"fierbântată","error-unrecognized-form-indefinite-masculine-plural":"fierbântați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fierbântate","definite-error-unrecognized-form-masculine-neuter-singular":"fierbântatul","definite-error-unrecognized-form-feminine-singular":"fierbântata","definite-error-unrecognized-form-masculine-plural":"fierbântații","definite-error-unrecognized-form-feminine-neuter-plural":"fierbântatele"}},{"word":"fierbântat","pos":"verb","definitions":["past participle of fierbânta"],"forms":{"participle-past":"of fierbânta"}},{"word":"fierbător","pos":"noun","definitions":["kettle"],"forms":{"plural":"fierbători","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fierbător","accusative-definite-nominative-singular":"fierbătorul","accusative-indefinite-nominative-plural":"fierbători","accusative-definite-nominative-plural":"fierbătorile","dative-genitive-indefinite-singular":"fierbător","dative-definite-genitive-singular":"fierbătorului","dative-genitive-indefinite-plural":"fierbători","dative-definite-genitive-plural":"fierbătorilor","singular-vocative":"fierbătorule","plural-vocative":"fierbătorilor"}},{"word":"fierbe","pos":"verb","definitions":["to boil (heat (a liquid) until it begins to turn into a gas)","to simmer","to scald","to seethe, bubble up"],"forms":{"canonical":"a fierbe 3rd conjugation","present-singular-third-person":"fierbe","participle-past":"fiert","subjunctive-third-person":"fiarbă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-t","infinitive":"a fierbe","gerund":"fierbând","first-person-indicative-present-singular":"fierb","indicative-present-second-person-singular":"fierbi","indicative-present-singular-third-person":"fierbe","first-person-indicative-plural-present":"fierbem","indicative-plural-present-second-person":"fierbeți","indicative-plural-present-third-person":"fierb","first-person-imperfect-indicative-singular":"fierbeam","imperfect-indicative-second-person-singular":"fierbeai","imperfect-indicative-singular-third-person":"fierbea","first-person-imperfect-indicative-plural":"fierbeam","imperfect-indicative-plural-second-person":"fierbeați","imperfect-indicative-plural-third-person":"fierbeau","first-person-indicative-perfect-singular":"fiersei","indicative-perfect-second-person-singular":"fierseși","indicative-perfect-singular-third-person":"fierse","first-person-indicative-perfect-plural":"fierserăm","indicative-perfect-plural-second-person":"fierserăți","indicative-perfect-plural-third-person":"fierseră","first-person-indicative-pluperfect-singular":"fiersesem","indicative-pluperfect-second-person-singular":"fierseseși","indicative-pluperfect-singular-third-person":"fiersese","first-person-indicative-pluperfect-plural":"fierseserăm","indicative-pluperfect-plural-second-person":"fierseserăți","indicative-pluperfect-plural-third-person":"fierseseră","first-person-present-singular-subjunctive":"să fierb","present-second-person-singular-subjunctive":"să fierbi","present-singular-subjunctive-third-person":"să fiarbă","first-person-plural-present-subjunctive":"să fierbem","plural-present-second-person-subjunctive":"să fierbeți","plural-present-subjunctive-third-person":"să fiarbă","imperative-second-person-singular":"fierbe","imperative-plural-second-person":"fierbeți","imperative-negative-second-person-singular":"nu fierbe","imperative-negative-plural-second-person":"nu fierbeți"}},{"word":"fierbere","pos":"noun","definitions":["boiling"],"forms":{"plural":"fierberi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fierbere","accusative-definite-nominative-singular":"fierberea","accusative-indefinite-nominative-plural":"fierberi","accusative-definite-nominative-plural":"fierberile","dative-genitive-indefinite-singular":"fierberi","dative-definite-genitive-singular":"fierberii","dative-genitive-indefinite-plural":"fierberi","dative-definite-genitive-plural":"fierberilor","singular-vocative":"fierbere","plural-vocative":"fierberilor"}},{"word":"fierbincior","pos":"adj","definitions":["rather hot"],"pronunciation":"/fjer.binˈt͡ʃʲor/","forms":{"feminine-singular":"fierbincioară","masculine-plural":"fierbinciori","feminine-neuter-plural":"fierbincioare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fierbincior","error-unrecognized-form-feminine-indefinite-singular":"fierbincioară","error-unrecognized-form-indefinite-masculine-plural":"fierbinciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fierbincioare","definite-error-unrecognized-form-masculine-neuter-singular":"fierbinciorul","definite-error-unrecognized-form-feminine-singular":"fierbincioara","definite-error-unrecognized-form-masculine-plural":"fierbinciorii","definite-error-unrecognized-form-feminine-neuter-plural":"fierbincioarele"}},{"word":"fierbinte","pos":"adj","definitions":["hot","scorching; burning","ardent, fervent"],"pronunciation":"[fjerˈbinte]","examples":[{"ro":"amor fierbinte","en":"burning love"}],"forms":{"plural":"fierbinți","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fierbinte","error-unrecognized-form-feminine-indefinite-singular":"fierbinte","error-unrecognized-form-indefinite-masculine-plural":"fierbinți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fierbinți","definite-error-unrecognized-form-masculine-neuter-singular":"fierbintele","definite-error-unrecognized-form-feminine-singular":"fierbintea","definite-error-unrecognized-form-masculine-plural":"fierbinții","definite-error-unrecognized-form-feminine-neuter-plural":"fierbințile"}},{"word":"fierbințeală","pos":"noun","definitions":["heat","fever"],"forms":{"plural":"fierbințeli"}},{"word":"Fierbințeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fierbințeanu"}},{"word":"Fierbinți","pos":"name","definitions":["a village in Șelaru, Dâmbovița County, Romania"],"gender":"m"},{"word":"Fierbinți-Târg","pos":"name","definitions":["a city in Ialomița County, Romania"],"gender":"m"},{"word":"Fierbinții de Jos","pos":"name","definitions":["a village in Fierbinți-Târg, Ialomița County, Romania"],"gender":"m"},{"word":"Fierbinții de Sus","pos":"name","definitions":["a village in Fierbinți-Târg, Ialomița County, Romania"],"gender":"m"},{"word":"fiere","pos":"noun","definitions":["bile, gall","venom, bitterness","sorrows, troubles"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fiere","accusative-definite-nominative":"fierea","dative-genitive-indefinite":"fieri","dative-definite-genitive":"fierii","vocative":"fiere"}},{"word":"fierea pământului","pos":"noun","definitions":["common liverwort (Marchantia polymorpha)"]},{"word":"Fierescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fierescu"}},{"word":"fierișor","pos":"noun","definitions":["diminutive of fier"],"forms":{"plural":"fierișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fierișor","accusative-definite-nominative-singular":"fierișorul","accusative-indefinite-nominative-plural":"fierișoare","accusative-definite-nominative-plural":"fierișoarele","dative-genitive-indefinite-singular":"fierișor","dative-definite-genitive-singular":"fierișorului","dative-genitive-indefinite-plural":"fierișoare","dative-definite-genitive-plural":"fierișoarelor","singular-vocative":"fierișorule","plural-vocative":"fierișoarelor"}},{"word":"Fieroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fieroiu"}},{"word":"fieros","pos":"adj","definitions":["ferocious, fierce"],"forms":{"feminine-singular":"fieroasă","masculine-plural":"fieroși","feminine-neuter-plural":"fieroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fieros","error-unrecognized-form-feminine-indefinite-singular":"fieroasă","error-unrecognized-form-indefinite-masculine-plural":"fieroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fieroase","definite-error-unrecognized-form-masculine-neuter-singular":"fierosul","definite-error-unrecognized-form-feminine-singular":"fieroasa","definite-error-unrecognized-form-masculine-plural":"fieroșii","definite-error-unrecognized-form-feminine-neuter-plural":"fieroasele"}},{"word":"fierse","pos":"verb","definitions":["third-person singular simple perfect indicative of fierbe"]},{"word":"fiert","pos":"verb","definitions":["past participle of fierbe"],"pronunciation":"/fjert/"},{"word":"fiert","pos":"adj","definitions":["boiled"],"pronunciation":"/fjert/","examples":[{"ro":"ouă fierte","en":"boiled eggs"}],"forms":{"feminine-singular":"fiartă","masculine-plural":"fierți","feminine-neuter-plural":"fierte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiert","error-unrecognized-form-feminine-indefinite-singular":"fiartă","error-unrecognized-form-indefinite-masculine-plural":"fierți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fierte","definite-error-unrecognized-form-masculine-neuter-singular":"fiertul","definite-error-unrecognized-form-feminine-singular":"fiarta","definite-error-unrecognized-form-masculine-plural":"fierții","definite-error-unrecognized-form-feminine-neuter-plural":"fiertele"}},{"word":"Fiertu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fiertu"}},{"word":"fiertură","pos":"noun","definitions":["a boiling (of anything, especially food)","decoction"],"forms":{"plural":"fierturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fiertură","accusative-definite-nominative-singular":"fiertura","accusative-indefinite-nominative-plural":"fierturi","accusative-definite-nominative-plural":"fierturile","dative-genitive-indefinite-singular":"fierturi","dative-definite-genitive-singular":"fierturii","dative-genitive-indefinite-plural":"fierturi","dative-definite-genitive-plural":"fierturilor","singular-vocative":"fiertură","plural-vocative":"fierturilor"}},{"word":"fierturică","pos":"noun","definitions":["diminutive of fiertură; small broth"],"forms":{"plural":"fierturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fierturică","accusative-definite-nominative-singular":"fierturica","accusative-indefinite-nominative-plural":"fierturice","accusative-definite-nominative-plural":"fierturicele","dative-genitive-indefinite-singular":"fierturice","dative-definite-genitive-singular":"fierturicei","dative-genitive-indefinite-plural":"fierturice","dative-definite-genitive-plural":"fierturicelor","singular-vocative":"fierturică","plural-vocative":"fierturicelor"}},{"word":"Fieru","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Bistrița","a river in Harghita, Romania, tributary to the Olt"],"gender":"m"},{"word":"fierul","pos":"noun","definitions":["definite nominative/accusative singular of fier"]},{"word":"fierului","pos":"noun","definitions":["definite genitive/dative singular of fier"]},{"word":"fieruș","pos":"noun","definitions":["diminutive of fier"],"forms":{"plural":"fierușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fieruș","accusative-definite-nominative-singular":"fierușul","accusative-indefinite-nominative-plural":"fierușe","accusative-definite-nominative-plural":"fierușele","dative-genitive-indefinite-singular":"fieruș","dative-definite-genitive-singular":"fierușului","dative-genitive-indefinite-plural":"fierușe","dative-definite-genitive-plural":"fierușelor","singular-vocative":"fierușule","plural-vocative":"fierușelor"}},{"word":"fiesc","pos":"adj","definitions":["filial"],"forms":{"feminine-singular":"fiască","plural":"fiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiesc","error-unrecognized-form-feminine-indefinite-singular":"fiască","error-unrecognized-form-indefinite-masculine-plural":"fiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiești","definite-error-unrecognized-form-masculine-neuter-singular":"fiescul","definite-error-unrecognized-form-feminine-singular":"fiasca","definite-error-unrecognized-form-masculine-plural":"fieștii","definite-error-unrecognized-form-feminine-neuter-plural":"fieștile"}},{"word":"fieșcare","pos":"det","definitions":["alternative form of fiecare"]},{"word":"fieșcare","pos":"pron","definitions":["alternative form of fiecare"]},{"word":"fieșce","pos":"adj","definitions":["alternative form of fiece"],"forms":{"masculine-plural":"fieșci","feminine-neuter-plural":"fieșce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fieșce","error-unrecognized-form-feminine-indefinite-singular":"fieșce","error-unrecognized-form-indefinite-masculine-plural":"fieșci","error-unrecognized-form-feminine-indefinite-neuter-plural":"fieșce","definite-error-unrecognized-form-masculine-neuter-singular":"fieșcele","definite-error-unrecognized-form-feminine-singular":"fieșcea","definite-error-unrecognized-form-masculine-plural":"fieșcii","definite-error-unrecognized-form-feminine-neuter-plural":"fieșcele"}},{"word":"fiestă","pos":"noun","definitions":["fiesta"],"forms":{"plural":"fieste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiestă","accusative-definite-nominative-singular":"fiesta","accusative-indefinite-nominative-plural":"fieste","accusative-definite-nominative-plural":"fiestele","dative-genitive-indefinite-singular":"fieste","dative-definite-genitive-singular":"fiestei","dative-genitive-indefinite-plural":"fieste","dative-definite-genitive-plural":"fiestelor","singular-vocative":"fiestă","plural-vocative":"fiestelor"}},{"word":"fieștecare","pos":"det","definitions":["alternative form of fiecare"]},{"word":"fieștecare","pos":"pron","definitions":["alternative form of fiecare"]},{"word":"fieștece","pos":"adj","definitions":["alternative form of fiece"],"forms":{"masculine-plural":"fieșteci","feminine-neuter-plural":"fieștece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fieștece","error-unrecognized-form-feminine-indefinite-singular":"fieștece","error-unrecognized-form-indefinite-masculine-plural":"fieșteci","error-unrecognized-form-feminine-indefinite-neuter-plural":"fieștece","definite-error-unrecognized-form-masculine-neuter-singular":"fieștecele","definite-error-unrecognized-form-feminine-singular":"fieștecea","definite-error-unrecognized-form-masculine-plural":"fieștecii","definite-error-unrecognized-form-feminine-neuter-plural":"fieștecele"}},{"word":"fieunde","pos":"adv","definitions":["anywhere"]},{"word":"fifirig","pos":"noun","definitions":["obsolete form of firfiric"],"forms":{"plural":"fifirigi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fifirig","accusative-definite-nominative-singular":"fifirigul","accusative-indefinite-nominative-plural":"fifirigi","accusative-definite-nominative-plural":"fifirigii","dative-genitive-indefinite-singular":"fifirig","dative-definite-genitive-singular":"fifirigului","dative-genitive-indefinite-plural":"fifirigi","dative-definite-genitive-plural":"fifirigilor","singular-vocative":"fifirigule","plural-vocative":"fifirigilor"}},{"word":"fifty-fifty","pos":"adv","definitions":["fifty-fifty"]},{"word":"fig","pos":"noun","definitions":["fig tree"],"forms":{"plural":"figi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fig","accusative-definite-nominative-singular":"figul","accusative-indefinite-nominative-plural":"figi","accusative-definite-nominative-plural":"figii","dative-genitive-indefinite-singular":"fig","dative-definite-genitive-singular":"figului","dative-genitive-indefinite-plural":"figi","dative-definite-genitive-plural":"figilor","singular-vocative":"figule","plural-vocative":"figilor"}},{"word":"Figa","pos":"name","definitions":["a village in Beclean, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Figan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Figan"}},{"word":"figura","pos":"noun","definitions":["definite nominative/accusative singular of figură"],"pronunciation":"[fiˈɡura]","gender":"f"},{"word":"figura","pos":"verb","definitions":["to appear (in a list, etc.), be included; to represent"],"forms":{"canonical":"a figura 1st conjugation","present-singular-third-person":"figurează","participle-past":"figurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a figura","gerund":"figurând","first-person-indicative-present-singular":"figurez","indicative-present-second-person-singular":"figurezi","indicative-present-singular-third-person":"figurează","first-person-indicative-plural-present":"figurăm","indicative-plural-present-second-person":"figurați","indicative-plural-present-third-person":"figurează","first-person-imperfect-indicative-singular":"figuram","imperfect-indicative-second-person-singular":"figurai","imperfect-indicative-singular-third-person":"figura","first-person-imperfect-indicative-plural":"figuram","imperfect-indicative-plural-second-person":"figurați","imperfect-indicative-plural-third-person":"figurau","first-person-indicative-perfect-singular":"figurai","indicative-perfect-second-person-singular":"figurași","indicative-perfect-singular-third-person":"figură","first-person-indicative-perfect-plural":"figurarăm","indicative-perfect-plural-second-person":"figurarăți","indicative-perfect-plural-third-person":"figurară","first-person-indicative-pluperfect-singular":"figurasem","indicative-pluperfect-second-person-singular":"figuraseși","indicative-pluperfect-singular-third-person":"figurase","first-person-indicative-pluperfect-plural":"figuraserăm","indicative-pluperfect-plural-second-person":"figuraserăți","indicative-pluperfect-plural-third-person":"figuraseră","first-person-present-singular-subjunctive":"să figurez","present-second-person-singular-subjunctive":"să figurezi","present-singular-subjunctive-third-person":"să figureze","first-person-plural-present-subjunctive":"să figurăm","plural-present-second-person-subjunctive":"să figurați","plural-present-subjunctive-third-person":"să figureze","imperative-second-person-singular":"figurează","imperative-plural-second-person":"figurați","imperative-negative-second-person-singular":"nu figura","imperative-negative-plural-second-person":"nu figurați"}},{"word":"figură","pos":"noun","definitions":["figure","diagram","face card; picture on a card"],"forms":{"plural":"figuri"}},{"word":"figură de șah","pos":"noun","definitions":["chess piece."],"forms":{"plural":"figuri de șah"}},{"word":"figură de stil","pos":"noun","definitions":["figure of speech"],"forms":{"plural":"figuri de stil"}},{"word":"figurant","pos":"noun","definitions":["extra"],"forms":{"plural":"figuranți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"figurant","accusative-definite-nominative-singular":"figurantul","accusative-indefinite-nominative-plural":"figuranți","accusative-definite-nominative-plural":"figuranții","dative-genitive-indefinite-singular":"figurant","dative-definite-genitive-singular":"figurantului","dative-genitive-indefinite-plural":"figuranți","dative-definite-genitive-plural":"figuranților","singular-vocative":"figurantule","plural-vocative":"figuranților"}},{"word":"figurantă","pos":"noun","definitions":["female equivalent of figurant"],"forms":{"plural":"figurante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"figurantă","accusative-definite-nominative-singular":"figuranta","accusative-indefinite-nominative-plural":"figurante","accusative-definite-nominative-plural":"figurantele","dative-genitive-indefinite-singular":"figurante","dative-definite-genitive-singular":"figurantei","dative-genitive-indefinite-plural":"figurante","dative-definite-genitive-plural":"figurantelor","singular-vocative":"figurantă","plural-vocative":"figurantelor"}},{"word":"figurare","pos":"noun","definitions":["figuration"],"forms":{"plural":"figurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"figurare","accusative-definite-nominative-singular":"figurarea","accusative-indefinite-nominative-plural":"figurări","accusative-definite-nominative-plural":"figurările","dative-genitive-indefinite-singular":"figurări","dative-definite-genitive-singular":"figurării","dative-genitive-indefinite-plural":"figurări","dative-definite-genitive-plural":"figurărilor","singular-vocative":"figurare","plural-vocative":"figurărilor"}},{"word":"figurat","pos":"adj","definitions":["figurative"],"forms":{"feminine-singular":"figurată","masculine-plural":"figurați","feminine-neuter-plural":"figurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"figurat","error-unrecognized-form-feminine-indefinite-singular":"figurată","error-unrecognized-form-indefinite-masculine-plural":"figurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"figurate","definite-error-unrecognized-form-masculine-neuter-singular":"figuratul","definite-error-unrecognized-form-feminine-singular":"figurata","definite-error-unrecognized-form-masculine-plural":"figurații","definite-error-unrecognized-form-feminine-neuter-plural":"figuratele"}},{"word":"figurație","pos":"noun","definitions":["figuration"],"forms":{"plural":"figurații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"figurație","accusative-definite-nominative-singular":"figurația","accusative-indefinite-nominative-plural":"figurații","accusative-definite-nominative-plural":"figurațiile","dative-genitive-indefinite-singular":"figurații","dative-definite-genitive-singular":"figurației","dative-genitive-indefinite-plural":"figurații","dative-definite-genitive-plural":"figurațiilor","singular-vocative":"figurație","plural-vocative":"figurațiilor"}},{"word":"figurațiune","pos":"noun","definitions":["obsolete form of figurație"],"forms":{"plural":"figurațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"figurațiune","accusative-definite-nominative-singular":"figurațiunea","accusative-indefinite-nominative-plural":"figurațiuni","accusative-definite-nominative-plural":"figurațiunile","dative-genitive-indefinite-singular":"figurațiuni","dative-definite-genitive-singular":"figurațiunii","dative-genitive-indefinite-plural":"figurațiuni","dative-definite-genitive-plural":"figurațiunilor","singular-vocative":"figurațiune","plural-vocative":"figurațiunilor"}},{"word":"figurativ","pos":"adj","definitions":["figurative"],"forms":{"feminine-singular":"figurativă","masculine-plural":"figurativi","feminine-neuter-plural":"figurative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"figurativ","error-unrecognized-form-feminine-indefinite-singular":"figurativă","error-unrecognized-form-indefinite-masculine-plural":"figurativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"figurative","definite-error-unrecognized-form-masculine-neuter-singular":"figurativul","definite-error-unrecognized-form-feminine-singular":"figurativa","definite-error-unrecognized-form-masculine-plural":"figurativii","definite-error-unrecognized-form-feminine-neuter-plural":"figurativele"}},{"word":"figuri","pos":"noun","definitions":["inflection of figură:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[fiˈɡurʲ]","gender":"f"},{"word":"figurina","pos":"noun","definitions":["definite nominative/accusative singular of figurină"],"pronunciation":"[fiɡuˈrina]","gender":"f"},{"word":"figurină","pos":"noun","definitions":["figurine"],"forms":{"plural":"figurine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"figurină","accusative-definite-nominative-singular":"figurina","accusative-indefinite-nominative-plural":"figurine","accusative-definite-nominative-plural":"figurinele","dative-genitive-indefinite-singular":"figurine","dative-definite-genitive-singular":"figurinei","dative-genitive-indefinite-plural":"figurine","dative-definite-genitive-plural":"figurinelor","singular-vocative":"figurină","plural-vocative":"figurinelor"}},{"word":"figurine","pos":"noun","definitions":["plural of figurină"],"gender":"f-p"},{"word":"figurist","pos":"noun","definitions":["figurist"],"forms":{"plural":"figuriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"figurist","accusative-definite-nominative-singular":"figuristul","accusative-indefinite-nominative-plural":"figuriști","accusative-definite-nominative-plural":"figuriștii","dative-genitive-indefinite-singular":"figurist","dative-definite-genitive-singular":"figuristului","dative-genitive-indefinite-plural":"figuriști","dative-definite-genitive-plural":"figuriștilor","singular-vocative":"figuristule","plural-vocative":"figuriștilor"}},{"word":"figuro","pos":"noun","definitions":["vocative singular of figură"],"pronunciation":"[fiˈɡuro]","gender":"f"},{"word":"fii","pos":"noun","definitions":["plural of fiu: sons"],"pronunciation":"[fiː]"},{"word":"fii","pos":"verb","definitions":["second-person singular present subjunctive of fi","second-person singular imperative of fi: be"],"pronunciation":"[fiː]","examples":[{"ro":"fii mai realist!","en":"be more realistic!"}]},{"word":"fii de cățea","pos":"noun","definitions":["plural of fiu de cățea"]},{"word":"fiica","pos":"noun","definitions":["definite nominative/accusative singular of fiică"]},{"word":"fiică","pos":"noun","definitions":["daughter"],"pronunciation":"[ˈfijkə]","examples":[{"ro":"Eu sunt fiica lui.","en":"I'm his daughter."},{"ro":"Au două fiice.","en":"They have two daughters."},{"ro":"Astăzi e ziua de naștere a fiicei mele.","en":"Today is my daughter's birthday."}],"forms":{"plural":"fiice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiică","accusative-definite-nominative-singular":"fiica","accusative-indefinite-nominative-plural":"fiice","accusative-definite-nominative-plural":"fiicele","dative-genitive-indefinite-singular":"fiice","dative-definite-genitive-singular":"fiicei","dative-genitive-indefinite-plural":"fiice","dative-definite-genitive-plural":"fiicelor","singular-vocative":"fiică","plural-vocative":"fiicelor"}},{"word":"fiice","pos":"noun","definitions":["plural of fiică"],"gender":"f"},{"word":"fiicei","pos":"noun","definitions":["definite dative/genitive singular of fiică"]},{"word":"fiicele","pos":"noun","definitions":["definite nominative/accusative plural of fiică"]},{"word":"fiicelor","pos":"noun","definitions":["inflection of fiică:","definite genitive/dative plural","vocative plural"]},{"word":"fiico","pos":"noun","definitions":["vocative singular of fiică"]},{"word":"fiiculeană","pos":"noun","definitions":["diminutive of fiică"],"forms":{"plural":"fiiculene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiiculeană","accusative-definite-nominative-singular":"fiiculeana","accusative-indefinite-nominative-plural":"fiiculene","accusative-definite-nominative-plural":"fiiculenele","dative-genitive-indefinite-singular":"fiiculene","dative-definite-genitive-singular":"fiiculenei","dative-genitive-indefinite-plural":"fiiculene","dative-definite-genitive-plural":"fiiculenelor","singular-vocative":"fiiculeană","plural-vocative":"fiiculenelor"}},{"word":"fiiculiță","pos":"noun","definitions":["diminutive of fiică"],"forms":{"plural":"fiiculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiiculiță","accusative-definite-nominative-singular":"fiiculița","accusative-indefinite-nominative-plural":"fiiculițe","accusative-definite-nominative-plural":"fiiculițele","dative-genitive-indefinite-singular":"fiiculițe","dative-definite-genitive-singular":"fiiculiței","dative-genitive-indefinite-plural":"fiiculițe","dative-definite-genitive-plural":"fiiculițelor","singular-vocative":"fiiculiță","plural-vocative":"fiiculițelor"}},{"word":"fiicuță","pos":"noun","definitions":["diminutive of fiică"],"forms":{"plural":"fiicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiicuță","accusative-definite-nominative-singular":"fiicuța","accusative-indefinite-nominative-plural":"fiicuțe","accusative-definite-nominative-plural":"fiicuțele","dative-genitive-indefinite-singular":"fiicuțe","dative-definite-genitive-singular":"fiicuței","dative-genitive-indefinite-plural":"fiicuțe","dative-definite-genitive-plural":"fiicuțelor","singular-vocative":"fiicuță","plural-vocative":"fiicuțelor"}},{"word":"fiii","pos":"noun","definitions":["definite nominative/accusative plural of fiu"]},{"word":"fiilor","pos":"noun","definitions":["inflection of fiu:","definite genitive/dative plural","vocative plural"]},{"word":"fiind","pos":"verb","definitions":["gerund of fi (“being”)"],"pronunciation":"/fiˈind/"},{"word":"fiindcă","pos":"conj","definitions":["because (literally, “being that”)"],"pronunciation":"/fiˈind.kə/","examples":[{"ro":"Nu știu care restaurant e cel mai bun, fiindcă nu locuiesc pe aici.","en":"I don't know which restaurant is the best, being that I don't live around here."}],"forms":{"alternative-dated":"fiind-că","alternative":"фииндкэ"}},{"word":"ființa","pos":"verb","definitions":["to exist"],"pronunciation":"/fi.inˈt͡sa/","forms":{"canonical":"a ființa 1st conjugation","present-singular-third-person":"ființează","participle-past":"ființat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ființa","gerund":"ființând","first-person-indicative-present-singular":"ființez","indicative-present-second-person-singular":"ființezi","indicative-present-singular-third-person":"ființează","first-person-indicative-plural-present":"ființăm","indicative-plural-present-second-person":"ființați","indicative-plural-present-third-person":"ființează","first-person-imperfect-indicative-singular":"ființam","imperfect-indicative-second-person-singular":"ființai","imperfect-indicative-singular-third-person":"ființa","first-person-imperfect-indicative-plural":"ființam","imperfect-indicative-plural-second-person":"ființați","imperfect-indicative-plural-third-person":"ființau","first-person-indicative-perfect-singular":"ființai","indicative-perfect-second-person-singular":"ființași","indicative-perfect-singular-third-person":"ființă","first-person-indicative-perfect-plural":"ființarăm","indicative-perfect-plural-second-person":"ființarăți","indicative-perfect-plural-third-person":"ființară","first-person-indicative-pluperfect-singular":"ființasem","indicative-pluperfect-second-person-singular":"ființaseși","indicative-pluperfect-singular-third-person":"ființase","first-person-indicative-pluperfect-plural":"ființaserăm","indicative-pluperfect-plural-second-person":"ființaserăți","indicative-pluperfect-plural-third-person":"ființaseră","first-person-present-singular-subjunctive":"să ființez","present-second-person-singular-subjunctive":"să ființezi","present-singular-subjunctive-third-person":"să ființeze","first-person-plural-present-subjunctive":"să ființăm","plural-present-second-person-subjunctive":"să ființați","plural-present-subjunctive-third-person":"să ființeze","imperative-second-person-singular":"ființează","imperative-plural-second-person":"ființați","imperative-negative-second-person-singular":"nu ființa","imperative-negative-plural-second-person":"nu ființați"}},{"word":"ființă","pos":"noun","definitions":["being (living being)","creature"],"pronunciation":"/fiˈin.t͡sə/","forms":{"plural":"ființe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ființă","accusative-definite-nominative-singular":"ființa","accusative-indefinite-nominative-plural":"ființe","accusative-definite-nominative-plural":"ființele","dative-genitive-indefinite-singular":"ființe","dative-definite-genitive-singular":"ființei","dative-genitive-indefinite-plural":"ființe","dative-definite-genitive-plural":"ființelor","singular-vocative":"ființă","plural-vocative":"ființelor"}},{"word":"ființare","pos":"noun","definitions":["being"],"forms":{"plural":"ființări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ființare","accusative-definite-nominative-singular":"ființarea","accusative-indefinite-nominative-plural":"ființări","accusative-definite-nominative-plural":"ființările","dative-genitive-indefinite-singular":"ființări","dative-definite-genitive-singular":"ființării","dative-genitive-indefinite-plural":"ființări","dative-definite-genitive-plural":"ființărilor","singular-vocative":"ființare","plural-vocative":"ființărilor"}},{"word":"ființe","pos":"noun","definitions":["plural of ființă"],"pronunciation":"/fiˈin.t͡se/"},{"word":"ființesc","pos":"adj","definitions":["real"],"forms":{"feminine-singular":"ființească","plural":"ființești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ființesc","error-unrecognized-form-feminine-indefinite-singular":"ființească","error-unrecognized-form-indefinite-masculine-plural":"ființești","error-unrecognized-form-feminine-indefinite-neuter-plural":"ființești","definite-error-unrecognized-form-masculine-neuter-singular":"ființescul","definite-error-unrecognized-form-feminine-singular":"ființeasca","definite-error-unrecognized-form-masculine-plural":"ființeștii","definite-error-unrecognized-form-feminine-neuter-plural":"ființeștile"}},{"word":"ființi","pos":"verb","definitions":["obsolete form of ființa"],"forms":{"canonical":"a ființi 4th conjugation","present-singular-third-person":"ființie","participle-past":"ființit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ființi","gerund":"ființind","first-person-indicative-present-singular":"ființ","indicative-present-second-person-singular":"ființi","indicative-present-singular-third-person":"ființe","first-person-indicative-plural-present":"ființim","indicative-plural-present-second-person":"ființiți","indicative-plural-present-third-person":"ființ","first-person-imperfect-indicative-singular":"ființeam","imperfect-indicative-second-person-singular":"ființeai","imperfect-indicative-singular-third-person":"ființea","first-person-imperfect-indicative-plural":"ființeam","imperfect-indicative-plural-second-person":"ființeați","imperfect-indicative-plural-third-person":"ființeau","first-person-indicative-perfect-singular":"ființii","indicative-perfect-second-person-singular":"ființiși","indicative-perfect-singular-third-person":"ființi","first-person-indicative-perfect-plural":"ființirăm","indicative-perfect-plural-second-person":"ființirăți","indicative-perfect-plural-third-person":"ființiră","first-person-indicative-pluperfect-singular":"ființisem","indicative-pluperfect-second-person-singular":"ființiseși","indicative-pluperfect-singular-third-person":"ființise","first-person-indicative-pluperfect-plural":"ființiserăm","indicative-pluperfect-plural-second-person":"ființiserăți","indicative-pluperfect-plural-third-person":"ființiseră","first-person-present-singular-subjunctive":"să ființ","present-second-person-singular-subjunctive":"să ființi","present-singular-subjunctive-third-person":"să ființă","first-person-plural-present-subjunctive":"să ființim","plural-present-second-person-subjunctive":"să ființiți","plural-present-subjunctive-third-person":"să ființă","imperative-second-person-singular":"ființe","imperative-plural-second-person":"ființiți","imperative-negative-second-person-singular":"nu ființi","imperative-negative-plural-second-person":"nu ființiți"}},{"word":"fiitor","pos":"adj","definitions":["existing or present","future"],"pronunciation":"/fi.iˈtor/","forms":{"feminine-singular":"fiitoare","masculine-plural":"fiitori","feminine-neuter-plural":"fiitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiitor","error-unrecognized-form-feminine-indefinite-singular":"fiitoare","error-unrecognized-form-indefinite-masculine-plural":"fiitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiitoare","definite-error-unrecognized-form-masculine-neuter-singular":"fiitorul","definite-error-unrecognized-form-feminine-singular":"fiitoarea","definite-error-unrecognized-form-masculine-plural":"fiitorii","definite-error-unrecognized-form-feminine-neuter-plural":"fiitoarele"}},{"word":"Fiji","pos":"name","definitions":["Fiji (a country and archipelago of over 300 islands in Melanesia in Oceania)"],"pronunciation":"/ˈfi.d͡ʒi/","gender":"m"},{"word":"fijian","pos":"noun","definitions":["Fijian"],"pronunciation":"/ˌfi.ʒiˈan/","forms":{"plural":"fijieni","feminine":"equivalent fijiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fijian","accusative-definite-nominative-singular":"fijianul","accusative-indefinite-nominative-plural":"fijieni","accusative-definite-nominative-plural":"fijienii","dative-genitive-indefinite-singular":"fijian","dative-definite-genitive-singular":"fijianului","dative-genitive-indefinite-plural":"fijieni","dative-definite-genitive-plural":"fijienilor","singular-vocative":"fijianule","plural-vocative":"fijienilor"}},{"word":"fijian","pos":"adj","definitions":["Fijian"],"pronunciation":"/ˌfi.ʒiˈan/","forms":{"feminine-singular":"fijiană","masculine-plural":"fijieni","feminine-neuter-plural":"fijiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fijian","error-unrecognized-form-feminine-indefinite-singular":"fijiană","error-unrecognized-form-indefinite-masculine-plural":"fijieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fijiene","definite-error-unrecognized-form-masculine-neuter-singular":"fijianul","definite-error-unrecognized-form-feminine-singular":"fijiana","definite-error-unrecognized-form-masculine-plural":"fijienii","definite-error-unrecognized-form-feminine-neuter-plural":"fijienele"}},{"word":"fijiană","pos":"noun","definitions":["female equivalent of fijian"],"forms":{"plural":"fijiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fijiană","accusative-definite-nominative-singular":"fijiana","accusative-indefinite-nominative-plural":"fijiene","accusative-definite-nominative-plural":"fijienele","dative-genitive-indefinite-singular":"fijiene","dative-definite-genitive-singular":"fijienei","dative-genitive-indefinite-plural":"fijiene","dative-definite-genitive-plural":"fijienelor","singular-vocative":"fijiană","plural-vocative":"fijienelor"}},{"word":"fil.","pos":"noun","definitions":["abbreviation of filozofie (“philosophy”)"]},{"word":"filă","pos":"noun","definitions":["page, leaf"],"forms":{"plural":"file","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filă","accusative-definite-nominative-singular":"fila","accusative-indefinite-nominative-plural":"file","accusative-definite-nominative-plural":"filele","dative-genitive-indefinite-singular":"file","dative-definite-genitive-singular":"filei","dative-genitive-indefinite-plural":"file","dative-definite-genitive-plural":"filelor","singular-vocative":"filă","plural-vocative":"filelor"}},{"word":"filabil","pos":"adj","definitions":["ductile (able to be drawn into wire)"],"forms":{"feminine-singular":"filabilă","masculine-plural":"filabili","feminine-neuter-plural":"filabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filabil","error-unrecognized-form-feminine-indefinite-singular":"filabilă","error-unrecognized-form-indefinite-masculine-plural":"filabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"filabile","definite-error-unrecognized-form-masculine-neuter-singular":"filabilul","definite-error-unrecognized-form-feminine-singular":"filabila","definite-error-unrecognized-form-masculine-plural":"filabilii","definite-error-unrecognized-form-feminine-neuter-plural":"filabilele"}},{"word":"filabilitate","pos":"noun","definitions":["fillability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"filabilitate","accusative-definite-nominative":"filabilitatea","dative-genitive-indefinite":"filabilități","dative-definite-genitive":"filabilității","vocative":"-"}},{"word":"filacteră","pos":"noun","definitions":["phylactery"],"forms":{"plural":"filactere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filacteră","accusative-definite-nominative-singular":"filacterăul","accusative-indefinite-nominative-plural":"filactere","accusative-definite-nominative-plural":"filacterele","dative-genitive-indefinite-singular":"filacteră","dative-definite-genitive-singular":"filacterăului","dative-genitive-indefinite-plural":"filactere","dative-definite-genitive-plural":"filacterelor","singular-vocative":"filacterăule","plural-vocative":"filacterelor"}},{"word":"filacteriu","pos":"noun","definitions":["alternative form of filacteră"],"forms":{"plural":"filacterii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filacteriu","accusative-definite-nominative-singular":"filacteriuul","accusative-indefinite-nominative-plural":"filacterii","accusative-definite-nominative-plural":"filacteriile","dative-genitive-indefinite-singular":"filacteriu","dative-definite-genitive-singular":"filacteriuului","dative-genitive-indefinite-plural":"filacterii","dative-definite-genitive-plural":"filacteriilor","singular-vocative":"filacteriuule","plural-vocative":"filacteriilor"}},{"word":"filadă","pos":"noun","definitions":["pamphlet, brochure"],"forms":{"plural":"filade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filadă","accusative-definite-nominative-singular":"filada","accusative-indefinite-nominative-plural":"filade","accusative-definite-nominative-plural":"filadele","dative-genitive-indefinite-singular":"filade","dative-definite-genitive-singular":"filadei","dative-genitive-indefinite-plural":"filade","dative-definite-genitive-plural":"filadelor","singular-vocative":"filadă","plural-vocative":"filadelor"}},{"word":"filaftie","pos":"noun","definitions":["selfishness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filaftie","accusative-definite-nominative":"filaftia","dative-genitive-indefinite":"filaftii","dative-definite-genitive":"filaftiei","vocative":"filaftie"}},{"word":"filament","pos":"noun","definitions":["filament"],"forms":{"plural":"filamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filament","accusative-definite-nominative-singular":"filamentul","accusative-indefinite-nominative-plural":"filamente","accusative-definite-nominative-plural":"filamentele","dative-genitive-indefinite-singular":"filament","dative-definite-genitive-singular":"filamentului","dative-genitive-indefinite-plural":"filamente","dative-definite-genitive-plural":"filamentelor","singular-vocative":"filamentule","plural-vocative":"filamentelor"}},{"word":"filamentos","pos":"adj","definitions":["filamentous"],"pronunciation":"/ˌfi.la.menˈtos/","forms":{"feminine-singular":"filamentoasă","masculine-plural":"filamentoși","feminine-neuter-plural":"filamentoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filamentos","error-unrecognized-form-feminine-indefinite-singular":"filamentoasă","error-unrecognized-form-indefinite-masculine-plural":"filamentoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"filamentoase","definite-error-unrecognized-form-masculine-neuter-singular":"filamentosul","definite-error-unrecognized-form-feminine-singular":"filamentoasa","definite-error-unrecognized-form-masculine-plural":"filamentoșii","definite-error-unrecognized-form-feminine-neuter-plural":"filamentoasele"}},{"word":"filantroapă","pos":"noun","definitions":["female equivalent of filantrop"],"forms":{"plural":"filantroape","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filantroapă","accusative-definite-nominative-singular":"filantroapa","accusative-indefinite-nominative-plural":"filantroape","accusative-definite-nominative-plural":"filantroapele","dative-genitive-indefinite-singular":"filantroape","dative-definite-genitive-singular":"filantroapei","dative-genitive-indefinite-plural":"filantroape","dative-definite-genitive-plural":"filantroapelor","singular-vocative":"filantroapă","plural-vocative":"filantroapelor"}},{"word":"filantrop","pos":"noun","definitions":["philanthropist"],"forms":{"plural":"filantropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filantrop","accusative-definite-nominative-singular":"filantropul","accusative-indefinite-nominative-plural":"filantropi","accusative-definite-nominative-plural":"filantropii","dative-genitive-indefinite-singular":"filantrop","dative-definite-genitive-singular":"filantropului","dative-genitive-indefinite-plural":"filantropi","dative-definite-genitive-plural":"filantropilor","singular-vocative":"filantropule","plural-vocative":"filantropilor"}},{"word":"filantropic","pos":"adj","definitions":["philanthropic"],"pronunciation":"/ˌfi.lanˈtro.pik/","forms":{"feminine-singular":"filantropică","masculine-plural":"filantropici","feminine-neuter-plural":"filantropice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"filantropic","error-unrecognized-form-feminine-indefinite-singular":"filantropică","error-unrecognized-form-indefinite-masculine-plural":"filantropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filantropice","definite-error-unrecognized-form-masculine-neuter-singular":"filantropicul","definite-error-unrecognized-form-feminine-singular":"filantropica","definite-error-unrecognized-form-masculine-plural":"filantropicii","definite-error-unrecognized-form-feminine-neuter-plural":"filantropicele"}},{"word":"filantropie","pos":"noun","definitions":["philanthropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filantropie","accusative-definite-nominative":"filantropia","dative-genitive-indefinite":"filantropii","dative-definite-genitive":"filantropiei","vocative":"filantropie"}},{"word":"filantropism","pos":"noun","definitions":["philanthropy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filantropism","accusative-definite-nominative-singular":"filantropismul","accusative-indefinite-nominative-plural":"filantropisme","accusative-definite-nominative-plural":"filantropismele","dative-genitive-indefinite-singular":"filantropism","dative-definite-genitive-singular":"filantropismului","dative-genitive-indefinite-plural":"filantropisme","dative-definite-genitive-plural":"filantropismelor","singular-vocative":"filantropismule","plural-vocative":"filantropismelor"}},{"word":"filantropist","pos":"adj","definitions":["philanthropic"],"forms":{"feminine-singular":"filantropistă","masculine-plural":"filantropiști","feminine-neuter-plural":"filantropiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filantropist","error-unrecognized-form-feminine-indefinite-singular":"filantropistă","error-unrecognized-form-indefinite-masculine-plural":"filantropiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"filantropiste","definite-error-unrecognized-form-masculine-neuter-singular":"filantropistul","definite-error-unrecognized-form-feminine-singular":"filantropista","definite-error-unrecognized-form-masculine-plural":"filantropiștii","definite-error-unrecognized-form-feminine-neuter-plural":"filantropistele"}},{"word":"Filaret","pos":"name","definitions":["a village in Giurgița, Dolj County, Romania"],"gender":"m"},{"word":"filarghirie","pos":"noun","definitions":["avarice"],"forms":{"plural":"filarghirii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filarghirie","accusative-definite-nominative-singular":"filarghiria","accusative-indefinite-nominative-plural":"filarghirii","accusative-definite-nominative-plural":"filarghiriile","dative-genitive-indefinite-singular":"filarghirii","dative-definite-genitive-singular":"filarghiriei","dative-genitive-indefinite-plural":"filarghirii","dative-definite-genitive-plural":"filarghiriilor","singular-vocative":"filarghirie","plural-vocative":"filarghiriilor"}},{"word":"filarioză","pos":"noun","definitions":["filariasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filarioză","accusative-definite-nominative-singular":"filarioza","accusative-indefinite-nominative-plural":"filarioze","accusative-definite-nominative-plural":"filariozele","dative-genitive-indefinite-singular":"filarioze","dative-definite-genitive-singular":"filariozei","dative-genitive-indefinite-plural":"filarioze","dative-definite-genitive-plural":"filariozelor","singular-vocative":"filarioză","plural-vocative":"filariozelor"}},{"word":"filarmonic","pos":"adj","definitions":["philharmonic"],"forms":{"feminine-singular":"filarmonică","masculine-plural":"filarmonici","feminine-neuter-plural":"filarmonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filarmonic","error-unrecognized-form-feminine-indefinite-singular":"filarmonică","error-unrecognized-form-indefinite-masculine-plural":"filarmonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filarmonice","definite-error-unrecognized-form-masculine-neuter-singular":"filarmonicul","definite-error-unrecognized-form-feminine-singular":"filarmonica","definite-error-unrecognized-form-masculine-plural":"filarmonicii","definite-error-unrecognized-form-feminine-neuter-plural":"filarmonicele"}},{"word":"filarmonică","pos":"noun","definitions":["philharmonic"],"forms":{"plural":"filarmonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"filarmonică","accusative-definite-nominative-singular":"filarmonica","accusative-indefinite-nominative-plural":"filarmonici","accusative-definite-nominative-plural":"filarmonicile","dative-genitive-indefinite-singular":"filarmonici","dative-definite-genitive-singular":"filarmonicii","dative-genitive-indefinite-plural":"filarmonici","dative-definite-genitive-plural":"filarmonicilor","singular-vocative":"filarmonică","plural-vocative":"filarmonicilor"}},{"word":"filarmonist","pos":"noun","definitions":["member of a philharmonic orchestra"],"forms":{"plural":"filarmoniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filarmonist","accusative-definite-nominative-singular":"filarmonistul","accusative-indefinite-nominative-plural":"filarmoniști","accusative-definite-nominative-plural":"filarmoniștii","dative-genitive-indefinite-singular":"filarmonist","dative-definite-genitive-singular":"filarmonistului","dative-genitive-indefinite-plural":"filarmoniști","dative-definite-genitive-plural":"filarmoniștilor","singular-vocative":"filarmonistule","plural-vocative":"filarmoniștilor"}},{"word":"filarmonistă","pos":"noun","definitions":["female equivalent of filarmonist"],"forms":{"plural":"filarmoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filarmonistă","accusative-definite-nominative-singular":"filarmonista","accusative-indefinite-nominative-plural":"filarmoniste","accusative-definite-nominative-plural":"filarmonistele","dative-genitive-indefinite-singular":"filarmoniste","dative-definite-genitive-singular":"filarmonistei","dative-genitive-indefinite-plural":"filarmoniste","dative-definite-genitive-plural":"filarmonistelor","singular-vocative":"filarmonistă","plural-vocative":"filarmonistelor"}},{"word":"filatelic","pos":"adj","definitions":["philatelic"],"forms":{"feminine-singular":"filatelică","masculine-plural":"filatelici","feminine-neuter-plural":"filatelice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filatelic","error-unrecognized-form-feminine-indefinite-singular":"filatelică","error-unrecognized-form-indefinite-masculine-plural":"filatelici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filatelice","definite-error-unrecognized-form-masculine-neuter-singular":"filatelicul","definite-error-unrecognized-form-feminine-singular":"filatelica","definite-error-unrecognized-form-masculine-plural":"filatelicii","definite-error-unrecognized-form-feminine-neuter-plural":"filatelicele"}},{"word":"filatelie","pos":"noun","definitions":["philately"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filatelie","accusative-definite-nominative":"filatelia","dative-genitive-indefinite":"filatelii","dative-definite-genitive":"filateliei","vocative":"filatelie"}},{"word":"filatelist","pos":"noun","definitions":["philatelist"],"forms":{"plural":"filateliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filatelist","accusative-definite-nominative-singular":"filatelistul","accusative-indefinite-nominative-plural":"filateliști","accusative-definite-nominative-plural":"filateliștii","dative-genitive-indefinite-singular":"filatelist","dative-definite-genitive-singular":"filatelistului","dative-genitive-indefinite-plural":"filateliști","dative-definite-genitive-plural":"filateliștilor","singular-vocative":"filatelistule","plural-vocative":"filateliștilor"}},{"word":"filatelistă","pos":"noun","definitions":["female equivalent of filatelist"],"forms":{"plural":"filateliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filatelistă","accusative-definite-nominative-singular":"filatelista","accusative-indefinite-nominative-plural":"filateliste","accusative-definite-nominative-plural":"filatelistele","dative-genitive-indefinite-singular":"filateliste","dative-definite-genitive-singular":"filatelistei","dative-genitive-indefinite-plural":"filateliste","dative-definite-genitive-plural":"filatelistelor","singular-vocative":"filatelistă","plural-vocative":"filatelistelor"}},{"word":"filatoare","pos":"noun","definitions":["female equivalent of filator"],"forms":{"plural":"filatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"filatoare","accusative-definite-nominative-singular":"filatoarea","accusative-indefinite-nominative-plural":"filatoare","accusative-definite-nominative-plural":"filatoarele","dative-genitive-indefinite-singular":"filatoare","dative-definite-genitive-singular":"filatoarei","dative-genitive-indefinite-plural":"filatoare","dative-definite-genitive-plural":"filatoarelor","singular-vocative":"filatoare","plural-vocative":"filatoarelor"}},{"word":"filator","pos":"noun","definitions":["spinner"],"forms":{"plural":"filatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filator","accusative-definite-nominative-singular":"filatorul","accusative-indefinite-nominative-plural":"filatori","accusative-definite-nominative-plural":"filatorii","dative-genitive-indefinite-singular":"filator","dative-definite-genitive-singular":"filatorului","dative-genitive-indefinite-plural":"filatori","dative-definite-genitive-plural":"filatorilor","singular-vocative":"filatorule","plural-vocative":"filatorilor"}},{"word":"filatură","pos":"noun","definitions":["spinning mill"],"forms":{"plural":"filaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filatură","accusative-definite-nominative-singular":"filatura","accusative-indefinite-nominative-plural":"filature","accusative-definite-nominative-plural":"filaturele","dative-genitive-indefinite-singular":"filature","dative-definite-genitive-singular":"filaturei","dative-genitive-indefinite-plural":"filature","dative-definite-genitive-plural":"filaturelor","singular-vocative":"filatură","plural-vocative":"filaturelor"}},{"word":"Filcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filcescu"}},{"word":"Fildan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fildan"}},{"word":"fildeș","pos":"noun","definitions":["an elephant's tusk"],"pronunciation":"[ˈfildeʃ]","forms":{"plural":"fildeși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fildeș","accusative-definite-nominative-singular":"fildeșul","accusative-indefinite-nominative-plural":"fildeși","accusative-definite-nominative-plural":"fildeșii","dative-genitive-indefinite-singular":"fildeș","dative-definite-genitive-singular":"fildeșului","dative-genitive-indefinite-plural":"fildeși","dative-definite-genitive-plural":"fildeșilor","singular-vocative":"fildeșule","plural-vocative":"fildeșilor"}},{"word":"fildeș","pos":"noun","definitions":["ivory"],"pronunciation":"[ˈfildeʃ]","forms":{"plural":"fildeșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fildeș","accusative-definite-nominative-singular":"fildeșul","accusative-indefinite-nominative-plural":"fildeșuri","accusative-definite-nominative-plural":"fildeșurile","dative-genitive-indefinite-singular":"fildeș","dative-definite-genitive-singular":"fildeșului","dative-genitive-indefinite-plural":"fildeșuri","dative-definite-genitive-plural":"fildeșurilor","singular-vocative":"fildeșule","plural-vocative":"fildeșurilor"}},{"word":"fildeș vegetal","pos":"noun","definitions":["vegetable ivory"]},{"word":"fildeși","pos":"noun","definitions":["plural of fildeș"],"gender":"m"},{"word":"fildeșiu","pos":"adj","definitions":["ivory-colored"],"forms":{"feminine-singular":"fildeșie","plural":"fildeșii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fildeșiu","error-unrecognized-form-feminine-indefinite-singular":"fildeșie","error-unrecognized-form-indefinite-masculine-plural":"fildeșii","error-unrecognized-form-feminine-indefinite-neuter-plural":"fildeșii","definite-error-unrecognized-form-masculine-neuter-singular":"fildeșiul","definite-error-unrecognized-form-feminine-singular":"fildeșia","definite-error-unrecognized-form-masculine-plural":"fildeșiii","definite-error-unrecognized-form-feminine-neuter-plural":"fildeșiile"}},{"word":"Fildu de Jos","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Fildu de Jos, Sălaj County, Romania"],"gender":"m"},{"word":"Fildu de Mijloc","pos":"name","definitions":["a village in Fildu de Jos, Sălaj County, Romania"],"gender":"m"},{"word":"Fildu de Sus","pos":"name","definitions":["a village in Fildu de Jos, Sălaj County, Romania"],"gender":"m"},{"word":"Filea de Jos","pos":"name","definitions":["a village in Ciurila, Cluj County, Romania"],"gender":"f"},{"word":"Filea de Sus","pos":"name","definitions":["a village in Ciurila, Cluj County, Romania"],"gender":"f"},{"word":"Fileghihaz","pos":"name","definitions":["a village in Bihor County, Romania. Renamed to Roșiori."],"gender":"m"},{"word":"Filep","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Filep"}},{"word":"Filer","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Filer"}},{"word":"filer","pos":"noun","definitions":["fillér"],"forms":{"plural":"fileri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filer","accusative-definite-nominative-singular":"filerul","accusative-indefinite-nominative-plural":"fileri","accusative-definite-nominative-plural":"filerii","dative-genitive-indefinite-singular":"filer","dative-definite-genitive-singular":"filerului","dative-genitive-indefinite-plural":"fileri","dative-definite-genitive-plural":"filerilor","singular-vocative":"filerule","plural-vocative":"filerilor"}},{"word":"filet","pos":"noun","definitions":["screw thread"],"forms":{"plural":"fileturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"filet","accusative-definite-nominative-singular":"filetul","accusative-indefinite-nominative-plural":"fileturi","accusative-definite-nominative-plural":"fileturile","dative-genitive-indefinite-singular":"filet","dative-definite-genitive-singular":"filetului","dative-genitive-indefinite-plural":"fileturi","dative-definite-genitive-plural":"fileturilor","singular-vocative":"filetule","plural-vocative":"fileturilor"}},{"word":"filetat","pos":"adj","definitions":["threaded"],"forms":{"feminine-singular":"filetată","masculine-plural":"filetați","feminine-neuter-plural":"filetate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filetat","error-unrecognized-form-feminine-indefinite-singular":"filetată","error-unrecognized-form-indefinite-masculine-plural":"filetați","error-unrecognized-form-feminine-indefinite-neuter-plural":"filetate","definite-error-unrecognized-form-masculine-neuter-singular":"filetatul","definite-error-unrecognized-form-feminine-singular":"filetata","definite-error-unrecognized-form-masculine-plural":"filetații","definite-error-unrecognized-form-feminine-neuter-plural":"filetatele"}},{"word":"filetic","pos":"adj","definitions":["phyletic"],"forms":{"feminine-singular":"filetică","masculine-plural":"filetici","feminine-neuter-plural":"filetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filetic","error-unrecognized-form-feminine-indefinite-singular":"filetică","error-unrecognized-form-indefinite-masculine-plural":"filetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filetice","definite-error-unrecognized-form-masculine-neuter-singular":"fileticul","definite-error-unrecognized-form-feminine-singular":"filetica","definite-error-unrecognized-form-masculine-plural":"fileticii","definite-error-unrecognized-form-feminine-neuter-plural":"fileticele"}},{"word":"fileu","pos":"noun","definitions":["net"],"forms":{"plural":"fileuri"}},{"word":"filfizon","pos":"noun","definitions":["dandy"],"forms":{"plural":"filfizoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filfizon","accusative-definite-nominative-singular":"filfizonul","accusative-indefinite-nominative-plural":"filfizoni","accusative-definite-nominative-plural":"filfizonii","dative-genitive-indefinite-singular":"filfizon","dative-definite-genitive-singular":"filfizonului","dative-genitive-indefinite-plural":"filfizoni","dative-definite-genitive-plural":"filfizonilor","singular-vocative":"filfizonule","plural-vocative":"filfizonilor"}},{"word":"filial","pos":"adj","definitions":["filial"],"forms":{"feminine-singular":"filială","masculine-plural":"filiali","feminine-neuter-plural":"filiale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filial","error-unrecognized-form-feminine-indefinite-singular":"filială","error-unrecognized-form-indefinite-masculine-plural":"filiali","error-unrecognized-form-feminine-indefinite-neuter-plural":"filiale","definite-error-unrecognized-form-masculine-neuter-singular":"filialul","definite-error-unrecognized-form-feminine-singular":"filiala","definite-error-unrecognized-form-masculine-plural":"filialii","definite-error-unrecognized-form-feminine-neuter-plural":"filialele"}},{"word":"filială","pos":"noun","definitions":["branch (of a bank or other institution)"],"forms":{"plural":"filiale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filială","accusative-definite-nominative-singular":"filiala","accusative-indefinite-nominative-plural":"filiale","accusative-definite-nominative-plural":"filialele","dative-genitive-indefinite-singular":"filiale","dative-definite-genitive-singular":"filialei","dative-genitive-indefinite-plural":"filiale","dative-definite-genitive-plural":"filialelor","singular-vocative":"filială","plural-vocative":"filialelor"}},{"word":"Filiași","pos":"name","definitions":["a town in Dolj County, Romania","a village in Bălțați, Iași County, Romania"],"gender":"m"},{"word":"filiație","pos":"noun","definitions":["filiation"],"forms":{"plural":"filiații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filiație","accusative-definite-nominative-singular":"filiația","accusative-indefinite-nominative-plural":"filiații","accusative-definite-nominative-plural":"filiațiile","dative-genitive-indefinite-singular":"filiații","dative-definite-genitive-singular":"filiației","dative-genitive-indefinite-plural":"filiații","dative-definite-genitive-plural":"filiațiilor","singular-vocative":"filiație","plural-vocative":"filiațiilor"}},{"word":"filiațiune","pos":"noun","definitions":["alternative form of filiație"],"forms":{"plural":"filiațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filiațiune","accusative-definite-nominative-singular":"filiațiunea","accusative-indefinite-nominative-plural":"filiațiuni","accusative-definite-nominative-plural":"filiațiunile","dative-genitive-indefinite-singular":"filiațiuni","dative-definite-genitive-singular":"filiațiunii","dative-genitive-indefinite-plural":"filiațiuni","dative-definite-genitive-plural":"filiațiunilor","singular-vocative":"filiațiune","plural-vocative":"filiațiunilor"}},{"word":"filibusterism","pos":"noun","definitions":["filibusterism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"filibusterism","accusative-definite-nominative":"filibusterismul","dative-genitive-indefinite":"filibusterism","dative-definite-genitive":"filibusterismului","vocative":"filibusterismule"}},{"word":"filieră","pos":"noun","definitions":["way, channel, intermediate"],"forms":{"plural":"filiere"}},{"word":"filiform","pos":"adj","definitions":["filiform"],"forms":{"feminine-singular":"filiformă","masculine-plural":"filiformi","feminine-neuter-plural":"filiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filiform","error-unrecognized-form-feminine-indefinite-singular":"filiformă","error-unrecognized-form-indefinite-masculine-plural":"filiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"filiforme","definite-error-unrecognized-form-masculine-neuter-singular":"filiformul","definite-error-unrecognized-form-feminine-singular":"filiforma","definite-error-unrecognized-form-masculine-plural":"filiformii","definite-error-unrecognized-form-feminine-neuter-plural":"filiformele"}},{"word":"filigean","pos":"noun","definitions":["alternative form of felegean"],"forms":{"plural":"filigene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filigean","accusative-definite-nominative-singular":"filigeanul","accusative-indefinite-nominative-plural":"filigene","accusative-definite-nominative-plural":"filigenele","dative-genitive-indefinite-singular":"filigean","dative-definite-genitive-singular":"filigeanului","dative-genitive-indefinite-plural":"filigene","dative-definite-genitive-plural":"filigenelor","singular-vocative":"filigeanule","plural-vocative":"filigenelor"}},{"word":"filigorie","pos":"noun","definitions":["pavilion"],"forms":{"plural":"filigorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filigorie","accusative-definite-nominative-singular":"filigoria","accusative-indefinite-nominative-plural":"filigorii","accusative-definite-nominative-plural":"filigoriile","dative-genitive-indefinite-singular":"filigorii","dative-definite-genitive-singular":"filigoriei","dative-genitive-indefinite-plural":"filigorii","dative-definite-genitive-plural":"filigoriilor","singular-vocative":"filigorie","plural-vocative":"filigoriilor"}},{"word":"filigoríe","pos":"noun","definitions":["alternative spelling of filigórie"],"forms":{"plural":"filigorii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filigoríe","accusative-definite-nominative-singular":"filigoríeul","accusative-indefinite-nominative-plural":"filigorii","accusative-definite-nominative-plural":"filigoriile","dative-genitive-indefinite-singular":"filigoríe","dative-definite-genitive-singular":"filigoríeului","dative-genitive-indefinite-plural":"filigorii","dative-definite-genitive-plural":"filigoriilor","singular-vocative":"filigoríeule","plural-vocative":"filigoriilor"}},{"word":"filigórie","pos":"noun","definitions":["A gazebo, a pavilion","A veranda"],"forms":{"plural":"filigórii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filigórie","accusative-definite-nominative-singular":"filigórieul","accusative-indefinite-nominative-plural":"filigórii","accusative-definite-nominative-plural":"filigóriile","dative-genitive-indefinite-singular":"filigórie","dative-definite-genitive-singular":"filigórieului","dative-genitive-indefinite-plural":"filigórii","dative-definite-genitive-plural":"filigóriilor","singular-vocative":"filigórieule","plural-vocative":"filigóriilor","alternative":"filigoríe"}},{"word":"filigorii","pos":"noun","definitions":["plural of filigoríe"]},{"word":"filigórii","pos":"noun","definitions":["plural of filigórie"]},{"word":"filigran","pos":"noun","definitions":["filigree (a delicate and intricate ornamentation made from gold or silver twisted wire)"],"pronunciation":"/fi.liˈɡran/","forms":{"plural":"filigrane"}},{"word":"filigrana","pos":"verb","definitions":["to watermark"],"forms":{"canonical":"a filigrana 1st conjugation","present-singular-third-person":"filigranează","participle-past":"filigranat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a filigrana","gerund":"filigranând","first-person-indicative-present-singular":"filigranez","indicative-present-second-person-singular":"filigranezi","indicative-present-singular-third-person":"filigranează","first-person-indicative-plural-present":"filigranăm","indicative-plural-present-second-person":"filigranați","indicative-plural-present-third-person":"filigranează","first-person-imperfect-indicative-singular":"filigranam","imperfect-indicative-second-person-singular":"filigranai","imperfect-indicative-singular-third-person":"filigrana","first-person-imperfect-indicative-plural":"filigranam","imperfect-indicative-plural-second-person":"filigranați","imperfect-indicative-plural-third-person":"filigranau","first-person-indicative-perfect-singular":"filigranai","indicative-perfect-second-person-singular":"filigranași","indicative-perfect-singular-third-person":"filigrană","first-person-indicative-perfect-plural":"filigranarăm","indicative-perfect-plural-second-person":"filigranarăți","indicative-perfect-plural-third-person":"filigranară","first-person-indicative-pluperfect-singular":"filigranasem","indicative-pluperfect-second-person-singular":"filigranaseși","indicative-pluperfect-singular-third-person":"filigranase","first-person-indicative-pluperfect-plural":"filigranaserăm","indicative-pluperfect-plural-second-person":"filigranaserăți","indicative-pluperfect-plural-third-person":"filigranaseră","first-person-present-singular-subjunctive":"să filigranez","present-second-person-singular-subjunctive":"să filigranezi","present-singular-subjunctive-third-person":"să filigraneze","first-person-plural-present-subjunctive":"să filigranăm","plural-present-second-person-subjunctive":"să filigranați","plural-present-subjunctive-third-person":"să filigraneze","imperative-second-person-singular":"filigranează","imperative-plural-second-person":"filigranați","imperative-negative-second-person-singular":"nu filigrana","imperative-negative-plural-second-person":"nu filigranați"}},{"word":"filigrană","pos":"noun","definitions":["alternative form of filigran"],"forms":{"plural":"filigrene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filigrană","accusative-definite-nominative-singular":"filigrana","accusative-indefinite-nominative-plural":"filigrene","accusative-definite-nominative-plural":"filigrenele","dative-genitive-indefinite-singular":"filigrene","dative-definite-genitive-singular":"filigrenei","dative-genitive-indefinite-plural":"filigrene","dative-definite-genitive-plural":"filigrenelor","singular-vocative":"filigrană","plural-vocative":"filigrenelor"}},{"word":"filigranare","pos":"noun","definitions":["watermarking"],"forms":{"plural":"filigranări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filigranare","accusative-definite-nominative-singular":"filigranarea","accusative-indefinite-nominative-plural":"filigranări","accusative-definite-nominative-plural":"filigranările","dative-genitive-indefinite-singular":"filigranări","dative-definite-genitive-singular":"filigranării","dative-genitive-indefinite-plural":"filigranări","dative-definite-genitive-plural":"filigranărilor","singular-vocative":"filigranare","plural-vocative":"filigranărilor"}},{"word":"filigranat","pos":"adj","definitions":["filigreed"],"forms":{"feminine-singular":"filigranată","masculine-plural":"filigranați","feminine-neuter-plural":"filigranate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filigranat","error-unrecognized-form-feminine-indefinite-singular":"filigranată","error-unrecognized-form-indefinite-masculine-plural":"filigranați","error-unrecognized-form-feminine-indefinite-neuter-plural":"filigranate","definite-error-unrecognized-form-masculine-neuter-singular":"filigranatul","definite-error-unrecognized-form-feminine-singular":"filigranata","definite-error-unrecognized-form-masculine-plural":"filigranații","definite-error-unrecognized-form-feminine-neuter-plural":"filigranatele"}},{"word":"filigranat","pos":"verb","definitions":["past participle of filigrana"],"forms":{"participle-past":"of filigrana"}},{"word":"filigrane","pos":"noun","definitions":["indefinite plural of filigran"],"pronunciation":"[filiˈɡrane]","gender":"n"},{"word":"filigranist","pos":"noun","definitions":["filigree expert or collector"],"forms":{"plural":"filigraniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filigranist","accusative-definite-nominative-singular":"filigranistul","accusative-indefinite-nominative-plural":"filigraniști","accusative-definite-nominative-plural":"filigraniștii","dative-genitive-indefinite-singular":"filigranist","dative-definite-genitive-singular":"filigranistului","dative-genitive-indefinite-plural":"filigraniști","dative-definite-genitive-plural":"filigraniștilor","singular-vocative":"filigranistule","plural-vocative":"filigraniștilor"}},{"word":"filigranologă","pos":"noun","definitions":["female equivalent of filigranolog"],"forms":{"plural":"filigranologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filigranologă","accusative-definite-nominative-singular":"filigranologa","accusative-indefinite-nominative-plural":"filigranologe","accusative-definite-nominative-plural":"filigranologele","dative-genitive-indefinite-singular":"filigranologe","dative-definite-genitive-singular":"filigranologei","dative-genitive-indefinite-plural":"filigranologe","dative-definite-genitive-plural":"filigranologelor","singular-vocative":"filigranologă","plural-vocative":"filigranologelor"}},{"word":"filimică","pos":"noun","definitions":["pot marigold (Calendula officinalis)"],"forms":{"plural":"filimele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filimică","accusative-definite-nominative-singular":"filimica","accusative-indefinite-nominative-plural":"filimele","accusative-definite-nominative-plural":"filimelele","dative-genitive-indefinite-singular":"filimele","dative-definite-genitive-singular":"filimelei","dative-genitive-indefinite-plural":"filimele","dative-definite-genitive-plural":"filimelelor","singular-vocative":"filimică","plural-vocative":"filimelelor"}},{"word":"filimină","pos":"noun","definitions":["pot marigold (Calendula officinalis)"],"forms":{"plural":"filimine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filimină","accusative-definite-nominative-singular":"filimina","accusative-indefinite-nominative-plural":"filimine","accusative-definite-nominative-plural":"filiminele","dative-genitive-indefinite-singular":"filimine","dative-definite-genitive-singular":"filiminei","dative-genitive-indefinite-plural":"filimine","dative-definite-genitive-plural":"filiminelor","singular-vocative":"filimină","plural-vocative":"filiminelor"}},{"word":"Filimonescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filimonescu"}},{"word":"Filionescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filionescu"}},{"word":"filioque","pos":"noun","definitions":["filioque"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"filioque","accusative-definite-nominative":"filioqueul","dative-genitive-indefinite":"filioque","dative-definite-genitive":"filioqueului","vocative":"filioqueule"}},{"word":"Filioreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Filioreanu"}},{"word":"Filipache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Filipache"}},{"word":"Filipachi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Filipachi"}},{"word":"Filipaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Filipaș"}},{"word":"Filipciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Filipciuc"}},{"word":"Filipeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Filipeanu"}},{"word":"Filipenco","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Filipenco"}},{"word":"Filipeni","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Filipeni, Bacău County, Romania"],"gender":"m"},{"word":"Filipescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filipescu"}},{"word":"Filipești","pos":"name","definitions":["a village in Bogdănești, Bacău County, Romania","a commune of Bacău County, Romania","a village in Filipești, Bacău County, Romania","a village in Surdila-Găiseanca, Brăila County, Romania"],"gender":"m"},{"word":"Filipeștii de Pădure","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Filipeștii de Pădure, Prahova County, Romania"],"gender":"m"},{"word":"Filipeștii de Târg","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Filipeștii de Târg, Prahova County, Romania"],"gender":"m"},{"word":"filipică","pos":"noun","definitions":["philippic"],"forms":{"plural":"filipice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filipică","accusative-definite-nominative-singular":"filipica","accusative-indefinite-nominative-plural":"filipice","accusative-definite-nominative-plural":"filipicele","dative-genitive-indefinite-singular":"filipice","dative-definite-genitive-singular":"filipicei","dative-genitive-indefinite-plural":"filipice","dative-definite-genitive-plural":"filipicelor","singular-vocative":"filipică","plural-vocative":"filipicelor"}},{"word":"Filipine","pos":"name","definitions":["Philippines (a country in Southeast Asia)"],"gender":"f-p","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Filipine","accusative-definite-nominative":"Filipinele","dative-genitive-indefinite":"Filipine","dative-definite-genitive":"Filipinelor","vocative":"Filipinelor"}},{"word":"filipinez","pos":"adj","definitions":["Filipino"],"forms":{"feminine-singular":"filipineză","masculine-plural":"filipinezi","feminine-neuter-plural":"filipineze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filipinez","error-unrecognized-form-feminine-indefinite-singular":"filipineză","error-unrecognized-form-indefinite-masculine-plural":"filipinezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"filipineze","definite-error-unrecognized-form-masculine-neuter-singular":"filipinezul","definite-error-unrecognized-form-feminine-singular":"filipineza","definite-error-unrecognized-form-masculine-plural":"filipinezii","definite-error-unrecognized-form-feminine-neuter-plural":"filipinezele"}},{"word":"filipinez","pos":"noun","definitions":["Filipino"],"forms":{"plural":"filipinezi","feminine":"equivalent filipineză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filipinez","accusative-definite-nominative-singular":"filipinezul","accusative-indefinite-nominative-plural":"filipinezi","accusative-definite-nominative-plural":"filipinezii","dative-genitive-indefinite-singular":"filipinez","dative-definite-genitive-singular":"filipinezului","dative-genitive-indefinite-plural":"filipinezi","dative-definite-genitive-plural":"filipinezilor","singular-vocative":"filipinezule","plural-vocative":"filipinezilor"}},{"word":"filipineză","pos":"noun","definitions":["female equivalent of filipinez"],"forms":{"plural":"filipineze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filipineză","accusative-definite-nominative-singular":"filipineza","accusative-indefinite-nominative-plural":"filipineze","accusative-definite-nominative-plural":"filipinezele","dative-genitive-indefinite-singular":"filipineze","dative-definite-genitive-singular":"filipinezei","dative-genitive-indefinite-plural":"filipineze","dative-definite-genitive-plural":"filipinezelor","singular-vocative":"filipineză","plural-vocative":"filipinezelor"}},{"word":"Filipiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Filipiuc"}},{"word":"Filipoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Filipoaia"}},{"word":"Filipoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filipoi"}},{"word":"Filipoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Filipoiu"}},{"word":"Filipovici","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Filipovici"}},{"word":"Filippi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Filippi"}},{"word":"Filișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Filișan"}},{"word":"filistean","pos":"noun","definitions":["Philistine"],"forms":{"plural":"filisteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filistean","accusative-definite-nominative-singular":"filisteanul","accusative-indefinite-nominative-plural":"filisteni","accusative-definite-nominative-plural":"filistenii","dative-genitive-indefinite-singular":"filistean","dative-definite-genitive-singular":"filisteanului","dative-genitive-indefinite-plural":"filisteni","dative-definite-genitive-plural":"filistenilor","singular-vocative":"filisteanule","plural-vocative":"filistenilor"}},{"word":"filisteancă","pos":"noun","definitions":["female equivalent of filistean"],"forms":{"plural":"filistence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filisteancă","accusative-definite-nominative-singular":"filisteanca","accusative-indefinite-nominative-plural":"filistence","accusative-definite-nominative-plural":"filistencele","dative-genitive-indefinite-singular":"filistence","dative-definite-genitive-singular":"filistencei","dative-genitive-indefinite-plural":"filistence","dative-definite-genitive-plural":"filistencelor","singular-vocative":"filisteancă","plural-vocative":"filistencelor"}},{"word":"filistin","pos":"noun","definitions":["Philistine"],"forms":{"plural":"filistini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filistin","accusative-definite-nominative-singular":"filistinul","accusative-indefinite-nominative-plural":"filistini","accusative-definite-nominative-plural":"filistinii","dative-genitive-indefinite-singular":"filistin","dative-definite-genitive-singular":"filistinului","dative-genitive-indefinite-plural":"filistini","dative-definite-genitive-plural":"filistinilor","singular-vocative":"filistinule","plural-vocative":"filistinilor"}},{"word":"filistinism","pos":"noun","definitions":["philistinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filistinism","accusative-definite-nominative-singular":"filistinismul","accusative-indefinite-nominative-plural":"filistinisme","accusative-definite-nominative-plural":"filistinismele","dative-genitive-indefinite-singular":"filistinism","dative-definite-genitive-singular":"filistinismului","dative-genitive-indefinite-plural":"filistinisme","dative-definite-genitive-plural":"filistinismelor","singular-vocative":"filistinismule","plural-vocative":"filistinismelor"}},{"word":"Filitelnic","pos":"name","definitions":["a village in Bălăușeri, Mureș County, Romania"],"gender":"m"},{"word":"Filiu","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Filiu"}},{"word":"film","pos":"noun","definitions":["movie, film"],"pronunciation":"/ˈfilm/","forms":{"plural":"filme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"film","accusative-definite-nominative-singular":"filmul","accusative-indefinite-nominative-plural":"filme","accusative-definite-nominative-plural":"filmele","dative-genitive-indefinite-singular":"film","dative-definite-genitive-singular":"filmului","dative-genitive-indefinite-plural":"filme","dative-definite-genitive-plural":"filmelor","singular-vocative":"filmule","plural-vocative":"filmelor","alternative":"филм"}},{"word":"film de lung metraj","pos":"noun","definitions":["feature film"],"forms":{"plural":"filme de lung metraj"}},{"word":"film de scurt metraj","pos":"noun","definitions":["short film"],"forms":{"plural":"filme de scurt metraj"}},{"word":"film mut","pos":"noun","definitions":["silent film"],"forms":{"plural":"filme mute"}},{"word":"filma","pos":"verb","definitions":["to film"],"pronunciation":"/filˈma/","forms":{"canonical":"a filma 1st conjugation","present-singular-third-person":"filmează","participle-past":"filmat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a filma","gerund":"filmând","first-person-indicative-present-singular":"filmez","indicative-present-second-person-singular":"filmezi","indicative-present-singular-third-person":"filmează","first-person-indicative-plural-present":"filmăm","indicative-plural-present-second-person":"filmați","indicative-plural-present-third-person":"filmează","first-person-imperfect-indicative-singular":"filmam","imperfect-indicative-second-person-singular":"filmai","imperfect-indicative-singular-third-person":"filma","first-person-imperfect-indicative-plural":"filmam","imperfect-indicative-plural-second-person":"filmați","imperfect-indicative-plural-third-person":"filmau","first-person-indicative-perfect-singular":"filmai","indicative-perfect-second-person-singular":"filmași","indicative-perfect-singular-third-person":"filmă","first-person-indicative-perfect-plural":"filmarăm","indicative-perfect-plural-second-person":"filmarăți","indicative-perfect-plural-third-person":"filmară","first-person-indicative-pluperfect-singular":"filmasem","indicative-pluperfect-second-person-singular":"filmaseși","indicative-pluperfect-singular-third-person":"filmase","first-person-indicative-pluperfect-plural":"filmaserăm","indicative-pluperfect-plural-second-person":"filmaserăți","indicative-pluperfect-plural-third-person":"filmaseră","first-person-present-singular-subjunctive":"să filmez","present-second-person-singular-subjunctive":"să filmezi","present-singular-subjunctive-third-person":"să filmeze","first-person-plural-present-subjunctive":"să filmăm","plural-present-second-person-subjunctive":"să filmați","plural-present-subjunctive-third-person":"să filmeze","imperative-second-person-singular":"filmează","imperative-plural-second-person":"filmați","imperative-negative-second-person-singular":"nu filma","imperative-negative-plural-second-person":"nu filmați"}},{"word":"filmare","pos":"noun","definitions":["filming"],"forms":{"plural":"filmări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filmare","accusative-definite-nominative-singular":"filmarea","accusative-indefinite-nominative-plural":"filmări","accusative-definite-nominative-plural":"filmările","dative-genitive-indefinite-singular":"filmări","dative-definite-genitive-singular":"filmării","dative-genitive-indefinite-plural":"filmări","dative-definite-genitive-plural":"filmărilor","singular-vocative":"filmare","plural-vocative":"filmărilor"}},{"word":"filmat","pos":"adj","definitions":["filmed"],"forms":{"feminine-singular":"filmată","masculine-plural":"filmați","feminine-neuter-plural":"filmate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filmat","error-unrecognized-form-feminine-indefinite-singular":"filmată","error-unrecognized-form-indefinite-masculine-plural":"filmați","error-unrecognized-form-feminine-indefinite-neuter-plural":"filmate","definite-error-unrecognized-form-masculine-neuter-singular":"filmatul","definite-error-unrecognized-form-feminine-singular":"filmata","definite-error-unrecognized-form-masculine-plural":"filmații","definite-error-unrecognized-form-feminine-neuter-plural":"filmatele"}},{"word":"filme","pos":"noun","definitions":["plural of film"]},{"word":"filmele","pos":"noun","definitions":["definite nominative/accusative plural of film"]},{"word":"filmelor","pos":"noun","definitions":["inflection of film:","definite genitive/dative plural","vocative plural"]},{"word":"filmic","pos":"adj","definitions":["filmic"],"forms":{"feminine-singular":"filmică","masculine-plural":"filmici","feminine-neuter-plural":"filmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filmic","error-unrecognized-form-feminine-indefinite-singular":"filmică","error-unrecognized-form-indefinite-masculine-plural":"filmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filmice","definite-error-unrecognized-form-masculine-neuter-singular":"filmicul","definite-error-unrecognized-form-feminine-singular":"filmica","definite-error-unrecognized-form-masculine-plural":"filmicii","definite-error-unrecognized-form-feminine-neuter-plural":"filmicele"}},{"word":"filmistic","pos":"adj","definitions":["filmic"],"forms":{"feminine-singular":"filmistică","masculine-plural":"filmistici","feminine-neuter-plural":"filmistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filmistic","error-unrecognized-form-feminine-indefinite-singular":"filmistică","error-unrecognized-form-indefinite-masculine-plural":"filmistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filmistice","definite-error-unrecognized-form-masculine-neuter-singular":"filmisticul","definite-error-unrecognized-form-feminine-singular":"filmistica","definite-error-unrecognized-form-masculine-plural":"filmisticii","definite-error-unrecognized-form-feminine-neuter-plural":"filmisticele"}},{"word":"filmografie","pos":"noun","definitions":["filmography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filmografie","accusative-definite-nominative":"filmografia","dative-genitive-indefinite":"filmografii","dative-definite-genitive":"filmografiei","vocative":"filmografie"}},{"word":"filmologic","pos":"adj","definitions":["filmological"],"forms":{"feminine-singular":"filmologică","masculine-plural":"filmologici","feminine-neuter-plural":"filmologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filmologic","error-unrecognized-form-feminine-indefinite-singular":"filmologică","error-unrecognized-form-indefinite-masculine-plural":"filmologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filmologice","definite-error-unrecognized-form-masculine-neuter-singular":"filmologicul","definite-error-unrecognized-form-feminine-singular":"filmologica","definite-error-unrecognized-form-masculine-plural":"filmologicii","definite-error-unrecognized-form-feminine-neuter-plural":"filmologicele"}}];
@@ -0,0 +1 @@
+export default [{"word":"filmologie","pos":"noun","definitions":["filmology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filmologie","accusative-definite-nominative":"filmologia","dative-genitive-indefinite":"filmologii","dative-definite-genitive":"filmologiei","vocative":"filmologie"}},{"word":"filmotecă","pos":"noun","definitions":["film library"],"forms":{"plural":"filmoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"filmotecă","accusative-definite-nominative-singular":"filmoteca","accusative-indefinite-nominative-plural":"filmoteci","accusative-definite-nominative-plural":"filmotecile","dative-genitive-indefinite-singular":"filmoteci","dative-definite-genitive-singular":"filmotecii","dative-genitive-indefinite-plural":"filmoteci","dative-definite-genitive-plural":"filmotecilor","singular-vocative":"filmotecă","plural-vocative":"filmotecilor"}},{"word":"filmul","pos":"noun","definitions":["definite nominative/accusative singular of film"],"pronunciation":"/ˈfil.mul/"},{"word":"filmuleț","pos":"noun","definitions":["diminutive of film","a short video, particularly on an internet video service"],"forms":{"plural":"filmulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filmuleț","accusative-definite-nominative-singular":"filmulețul","accusative-indefinite-nominative-plural":"filmulețe","accusative-definite-nominative-plural":"filmulețele","dative-genitive-indefinite-singular":"filmuleț","dative-definite-genitive-singular":"filmulețului","dative-genitive-indefinite-plural":"filmulețe","dative-definite-genitive-plural":"filmulețelor","singular-vocative":"filmulețule","plural-vocative":"filmulețelor"}},{"word":"filmului","pos":"noun","definitions":["definite dative/genitive singular of film"]},{"word":"filodendron","pos":"noun","definitions":["philodendron"],"forms":{"plural":"filodendroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filodendron","accusative-definite-nominative-singular":"filodendronul","accusative-indefinite-nominative-plural":"filodendroni","accusative-definite-nominative-plural":"filodendronii","dative-genitive-indefinite-singular":"filodendron","dative-definite-genitive-singular":"filodendronului","dative-genitive-indefinite-plural":"filodendroni","dative-definite-genitive-plural":"filodendronilor","singular-vocative":"filodendronule","plural-vocative":"filodendronilor"}},{"word":"filodormă","pos":"noun","definitions":["bribe"],"forms":{"plural":"filodorme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filodormă","accusative-definite-nominative-singular":"filodorma","accusative-indefinite-nominative-plural":"filodorme","accusative-definite-nominative-plural":"filodormele","dative-genitive-indefinite-singular":"filodorme","dative-definite-genitive-singular":"filodormei","dative-genitive-indefinite-plural":"filodorme","dative-definite-genitive-plural":"filodormelor","singular-vocative":"filodormă","plural-vocative":"filodormelor"}},{"word":"filoelen","pos":"adj","definitions":["philhellenic"],"forms":{"feminine-singular":"filoelenă","masculine-plural":"filoeleni","feminine-neuter-plural":"filoelene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filoelen","error-unrecognized-form-feminine-indefinite-singular":"filoelenă","error-unrecognized-form-indefinite-masculine-plural":"filoeleni","error-unrecognized-form-feminine-indefinite-neuter-plural":"filoelene","definite-error-unrecognized-form-masculine-neuter-singular":"filoelenul","definite-error-unrecognized-form-feminine-singular":"filoelena","definite-error-unrecognized-form-masculine-plural":"filoelenii","definite-error-unrecognized-form-feminine-neuter-plural":"filoelenele"}},{"word":"filoelenic","pos":"adj","definitions":["philhellenic"],"forms":{"feminine-singular":"filoelenică","masculine-plural":"filoelenici","feminine-neuter-plural":"filoelenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filoelenic","error-unrecognized-form-feminine-indefinite-singular":"filoelenică","error-unrecognized-form-indefinite-masculine-plural":"filoelenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filoelenice","definite-error-unrecognized-form-masculine-neuter-singular":"filoelenicul","definite-error-unrecognized-form-feminine-singular":"filoelenica","definite-error-unrecognized-form-masculine-plural":"filoelenicii","definite-error-unrecognized-form-feminine-neuter-plural":"filoelenicele"}},{"word":"filoelenism","pos":"noun","definitions":["philhellenism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"filoelenism","accusative-definite-nominative":"filoelenismul","dative-genitive-indefinite":"filoelenism","dative-definite-genitive":"filoelenismului","vocative":"filoelenismule"}},{"word":"filofag","pos":"adj","definitions":["phyllophagous"],"forms":{"feminine-singular":"filofagă","masculine-plural":"filofagi","feminine-neuter-plural":"filofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filofag","error-unrecognized-form-feminine-indefinite-singular":"filofagă","error-unrecognized-form-indefinite-masculine-plural":"filofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"filofage","definite-error-unrecognized-form-masculine-neuter-singular":"filofagul","definite-error-unrecognized-form-feminine-singular":"filofaga","definite-error-unrecognized-form-masculine-plural":"filofagii","definite-error-unrecognized-form-feminine-neuter-plural":"filofagele"}},{"word":"filofrancez","pos":"adj","definitions":["francophile"],"forms":{"feminine-singular":"filofranceză","masculine-plural":"filofrancezi","feminine-neuter-plural":"filofranceze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filofrancez","error-unrecognized-form-feminine-indefinite-singular":"filofranceză","error-unrecognized-form-indefinite-masculine-plural":"filofrancezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"filofranceze","definite-error-unrecognized-form-masculine-neuter-singular":"filofrancezul","definite-error-unrecognized-form-feminine-singular":"filofranceza","definite-error-unrecognized-form-masculine-plural":"filofrancezii","definite-error-unrecognized-form-feminine-neuter-plural":"filofrancezele"}},{"word":"filogenetic","pos":"adj","definitions":["phylogenetic"],"forms":{"feminine-singular":"filogenetică","masculine-plural":"filogenetici","feminine-neuter-plural":"filogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filogenetic","error-unrecognized-form-feminine-indefinite-singular":"filogenetică","error-unrecognized-form-indefinite-masculine-plural":"filogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"filogeneticul","definite-error-unrecognized-form-feminine-singular":"filogenetica","definite-error-unrecognized-form-masculine-plural":"filogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"filogeneticele"}},{"word":"filogeneza","pos":"noun","definitions":["nominative/accusative definite singular of filogeneză"],"gender":"f"},{"word":"filogeneză","pos":"noun","definitions":["phylogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filogeneză","accusative-definite-nominative-singular":"filogeneza","accusative-indefinite-nominative-plural":"filogeneze","accusative-definite-nominative-plural":"filogenezele","dative-genitive-indefinite-singular":"filogeneze","dative-definite-genitive-singular":"filogenezei","dative-genitive-indefinite-plural":"filogeneze","dative-definite-genitive-plural":"filogenezelor","singular-vocative":"filogeneză","plural-vocative":"filogenezelor"}},{"word":"filogenezo","pos":"noun","definitions":["vocative singular of filogeneză"],"gender":"f"},{"word":"filogenie","pos":"noun","definitions":["phylogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filogenie","accusative-definite-nominative-singular":"filogenia","accusative-indefinite-nominative-plural":"filogenii","accusative-definite-nominative-plural":"filogeniile","dative-genitive-indefinite-singular":"filogenii","dative-definite-genitive-singular":"filogeniei","dative-genitive-indefinite-plural":"filogenii","dative-definite-genitive-plural":"filogeniilor","singular-vocative":"filogenie","plural-vocative":"filogeniilor"}},{"word":"filogenist","pos":"noun","definitions":["phylogenist"],"forms":{"plural":"filogeniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filogenist","accusative-definite-nominative-singular":"filogenistul","accusative-indefinite-nominative-plural":"filogeniști","accusative-definite-nominative-plural":"filogeniștii","dative-genitive-indefinite-singular":"filogenist","dative-definite-genitive-singular":"filogenistului","dative-genitive-indefinite-plural":"filogeniști","dative-definite-genitive-plural":"filogeniștilor","singular-vocative":"filogenistule","plural-vocative":"filogeniștilor"}},{"word":"filogenistă","pos":"noun","definitions":["female equivalent of filogenist"],"forms":{"plural":"filogeniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filogenistă","accusative-definite-nominative-singular":"filogenista","accusative-indefinite-nominative-plural":"filogeniste","accusative-definite-nominative-plural":"filogenistele","dative-genitive-indefinite-singular":"filogeniste","dative-definite-genitive-singular":"filogenistei","dative-genitive-indefinite-plural":"filogeniste","dative-definite-genitive-plural":"filogenistelor","singular-vocative":"filogenistă","plural-vocative":"filogenistelor"}},{"word":"filogerman","pos":"adj","definitions":["Germanophile"],"forms":{"feminine-singular":"filogermană","masculine-plural":"filogermani","feminine-neuter-plural":"filogermane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filogerman","error-unrecognized-form-feminine-indefinite-singular":"filogermană","error-unrecognized-form-indefinite-masculine-plural":"filogermani","error-unrecognized-form-feminine-indefinite-neuter-plural":"filogermane","definite-error-unrecognized-form-masculine-neuter-singular":"filogermanul","definite-error-unrecognized-form-feminine-singular":"filogermana","definite-error-unrecognized-form-masculine-plural":"filogermanii","definite-error-unrecognized-form-feminine-neuter-plural":"filogermanele"}},{"word":"filolog","pos":"noun","definitions":["philologist"],"forms":{"plural":"filologi","feminine":"equivalent filologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filolog","accusative-definite-nominative-singular":"filologul","accusative-indefinite-nominative-plural":"filologi","accusative-definite-nominative-plural":"filologii","dative-genitive-indefinite-singular":"filolog","dative-definite-genitive-singular":"filologului","dative-genitive-indefinite-plural":"filologi","dative-definite-genitive-plural":"filologilor","singular-vocative":"filologule","plural-vocative":"filologilor"}},{"word":"filologă","pos":"noun","definitions":["female equivalent of filolog"],"forms":{"plural":"filologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filologă","accusative-definite-nominative-singular":"filologa","accusative-indefinite-nominative-plural":"filologe","accusative-definite-nominative-plural":"filologele","dative-genitive-indefinite-singular":"filologe","dative-definite-genitive-singular":"filologei","dative-genitive-indefinite-plural":"filologe","dative-definite-genitive-plural":"filologelor","singular-vocative":"filologă","plural-vocative":"filologelor"}},{"word":"filologic","pos":"adj","definitions":["philological"],"forms":{"feminine-singular":"filologică","masculine-plural":"filologici","feminine-neuter-plural":"filologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filologic","error-unrecognized-form-feminine-indefinite-singular":"filologică","error-unrecognized-form-indefinite-masculine-plural":"filologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filologice","definite-error-unrecognized-form-masculine-neuter-singular":"filologicul","definite-error-unrecognized-form-feminine-singular":"filologica","definite-error-unrecognized-form-masculine-plural":"filologicii","definite-error-unrecognized-form-feminine-neuter-plural":"filologicele"}},{"word":"filologie","pos":"noun","definitions":["philology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filologie","accusative-definite-nominative":"filologia","dative-genitive-indefinite":"filologii","dative-definite-genitive":"filologiei","vocative":"filologie"}},{"word":"filomelă","pos":"noun","definitions":["philomel"],"forms":{"plural":"filomele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filomelă","accusative-definite-nominative-singular":"filomela","accusative-indefinite-nominative-plural":"filomele","accusative-definite-nominative-plural":"filomelele","dative-genitive-indefinite-singular":"filomele","dative-definite-genitive-singular":"filomelei","dative-genitive-indefinite-plural":"filomele","dative-definite-genitive-plural":"filomelelor","singular-vocative":"filomelă","plural-vocative":"filomelelor"}},{"word":"filon","pos":"noun","definitions":["vein"],"forms":{"plural":"filoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filon","accusative-definite-nominative-singular":"filonul","accusative-indefinite-nominative-plural":"filoane","accusative-definite-nominative-plural":"filoanele","dative-genitive-indefinite-singular":"filon","dative-definite-genitive-singular":"filonului","dative-genitive-indefinite-plural":"filoane","dative-definite-genitive-plural":"filoanelor","singular-vocative":"filonule","plural-vocative":"filoanelor"}},{"word":"filoneism","pos":"noun","definitions":["philoneism"],"forms":{"plural":"filoneisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filoneism","accusative-definite-nominative-singular":"filoneismul","accusative-indefinite-nominative-plural":"filoneisme","accusative-definite-nominative-plural":"filoneismele","dative-genitive-indefinite-singular":"filoneism","dative-definite-genitive-singular":"filoneismului","dative-genitive-indefinite-plural":"filoneisme","dative-definite-genitive-plural":"filoneismelor","singular-vocative":"filoneismule","plural-vocative":"filoneismelor"}},{"word":"filoneisme","pos":"noun","definitions":["plural of filoneism"],"gender":"n"},{"word":"filonichie","pos":"noun","definitions":["argument, dispute"],"forms":{"plural":"filonichii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filonichie","accusative-definite-nominative-singular":"filonichia","accusative-indefinite-nominative-plural":"filonichii","accusative-definite-nominative-plural":"filonichiile","dative-genitive-indefinite-singular":"filonichii","dative-definite-genitive-singular":"filonichiei","dative-genitive-indefinite-plural":"filonichii","dative-definite-genitive-plural":"filonichiilor","singular-vocative":"filonichie","plural-vocative":"filonichiilor"}},{"word":"filosemit","pos":"adj","definitions":["philo-Semite"],"forms":{"feminine-singular":"filosemită","masculine-plural":"filosemiți","feminine-neuter-plural":"filosemite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filosemit","error-unrecognized-form-feminine-indefinite-singular":"filosemită","error-unrecognized-form-indefinite-masculine-plural":"filosemiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"filosemite","definite-error-unrecognized-form-masculine-neuter-singular":"filosemitul","definite-error-unrecognized-form-feminine-singular":"filosemita","definite-error-unrecognized-form-masculine-plural":"filosemiții","definite-error-unrecognized-form-feminine-neuter-plural":"filosemitele"}},{"word":"filosoafă","pos":"noun","definitions":["female equivalent of filosof"],"forms":{"plural":"filosoafe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filosoafă","accusative-definite-nominative-singular":"filosoafa","accusative-indefinite-nominative-plural":"filosoafe","accusative-definite-nominative-plural":"filosoafele","dative-genitive-indefinite-singular":"filosoafe","dative-definite-genitive-singular":"filosoafei","dative-genitive-indefinite-plural":"filosoafe","dative-definite-genitive-plural":"filosoafelor","singular-vocative":"filosoafă","plural-vocative":"filosoafelor"}},{"word":"filosofa","pos":"verb","definitions":["to philosophize"],"forms":{"canonical":"a filosofa 1st conjugation","present-singular-third-person":"filosofează","participle-past":"filosofat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a filosofa","gerund":"filosofând","first-person-indicative-present-singular":"filosofez","indicative-present-second-person-singular":"filosofezi","indicative-present-singular-third-person":"filosofează","first-person-indicative-plural-present":"filosofăm","indicative-plural-present-second-person":"filosofați","indicative-plural-present-third-person":"filosofează","first-person-imperfect-indicative-singular":"filosofam","imperfect-indicative-second-person-singular":"filosofai","imperfect-indicative-singular-third-person":"filosofa","first-person-imperfect-indicative-plural":"filosofam","imperfect-indicative-plural-second-person":"filosofați","imperfect-indicative-plural-third-person":"filosofau","first-person-indicative-perfect-singular":"filosofai","indicative-perfect-second-person-singular":"filosofași","indicative-perfect-singular-third-person":"filosofă","first-person-indicative-perfect-plural":"filosofarăm","indicative-perfect-plural-second-person":"filosofarăți","indicative-perfect-plural-third-person":"filosofară","first-person-indicative-pluperfect-singular":"filosofasem","indicative-pluperfect-second-person-singular":"filosofaseși","indicative-pluperfect-singular-third-person":"filosofase","first-person-indicative-pluperfect-plural":"filosofaserăm","indicative-pluperfect-plural-second-person":"filosofaserăți","indicative-pluperfect-plural-third-person":"filosofaseră","first-person-present-singular-subjunctive":"să filosofez","present-second-person-singular-subjunctive":"să filosofezi","present-singular-subjunctive-third-person":"să filosofeze","first-person-plural-present-subjunctive":"să filosofăm","plural-present-second-person-subjunctive":"să filosofați","plural-present-subjunctive-third-person":"să filosofeze","imperative-second-person-singular":"filosofează","imperative-plural-second-person":"filosofați","imperative-negative-second-person-singular":"nu filosofa","imperative-negative-plural-second-person":"nu filosofați"}},{"word":"filosofare","pos":"noun","definitions":["philosophizing"],"forms":{"plural":"filosofări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filosofare","accusative-definite-nominative-singular":"filosofarea","accusative-indefinite-nominative-plural":"filosofări","accusative-definite-nominative-plural":"filosofările","dative-genitive-indefinite-singular":"filosofări","dative-definite-genitive-singular":"filosofării","dative-genitive-indefinite-plural":"filosofări","dative-definite-genitive-plural":"filosofărilor","singular-vocative":"filosofare","plural-vocative":"filosofărilor"}},{"word":"filosofi","pos":"verb","definitions":["obsolete form of filozofa (“to philosophise”)"],"forms":{"canonical":"a filosofi 4th conjugation","present-singular-third-person":"filosofie","participle-past":"filosofit","subjunctive-third-person":"filosofește","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a filosofi","gerund":"filosofind","first-person-indicative-present-singular":"filosofesc","indicative-present-second-person-singular":"filosofești","indicative-present-singular-third-person":"filosofește","first-person-indicative-plural-present":"filosofim","indicative-plural-present-second-person":"filosofiți","indicative-plural-present-third-person":"filosofesc","first-person-imperfect-indicative-singular":"filosofeam","imperfect-indicative-second-person-singular":"filosofeai","imperfect-indicative-singular-third-person":"filosofea","first-person-imperfect-indicative-plural":"filosofeam","imperfect-indicative-plural-second-person":"filosofeați","imperfect-indicative-plural-third-person":"filosofeau","first-person-indicative-perfect-singular":"filosofii","indicative-perfect-second-person-singular":"filosofiși","indicative-perfect-singular-third-person":"filosofi","first-person-indicative-perfect-plural":"filosofirăm","indicative-perfect-plural-second-person":"filosofirăți","indicative-perfect-plural-third-person":"filosofiră","first-person-indicative-pluperfect-singular":"filosofisem","indicative-pluperfect-second-person-singular":"filosofiseși","indicative-pluperfect-singular-third-person":"filosofise","first-person-indicative-pluperfect-plural":"filosofiserăm","indicative-pluperfect-plural-second-person":"filosofiserăți","indicative-pluperfect-plural-third-person":"filosofiseră","first-person-present-singular-subjunctive":"să filosofesc","present-second-person-singular-subjunctive":"să filosofești","present-singular-subjunctive-third-person":"să filosofească","first-person-plural-present-subjunctive":"să filosofim","plural-present-second-person-subjunctive":"să filosofiți","plural-present-subjunctive-third-person":"să filosofească","imperative-second-person-singular":"filosofește","imperative-plural-second-person":"filosofiți","imperative-negative-second-person-singular":"nu filosofi","imperative-negative-plural-second-person":"nu filosofiți"}},{"word":"filosofic","pos":"adj","definitions":["alternative spelling of filozofic"],"pronunciation":"/fi.loˈso.fik/","forms":{"feminine-singular":"filosofică","masculine-plural":"filosofici","feminine-neuter-plural":"filosofice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filosofic","error-unrecognized-form-feminine-indefinite-singular":"filosofică","error-unrecognized-form-indefinite-masculine-plural":"filosofici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filosofice","definite-error-unrecognized-form-masculine-neuter-singular":"filosoficul","definite-error-unrecognized-form-feminine-singular":"filosofica","definite-error-unrecognized-form-masculine-plural":"filosoficii","definite-error-unrecognized-form-feminine-neuter-plural":"filosoficele","alternative":"философик"}},{"word":"filosoficește","pos":"adv","definitions":["philosophically"]},{"word":"filosofie","pos":"noun","definitions":["alternative spelling of filozofie"],"pronunciation":"/fi.lo.soˈfi.e/","forms":{"plural":"filosofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filosofie","accusative-definite-nominative-singular":"filosofia","accusative-indefinite-nominative-plural":"filosofii","accusative-definite-nominative-plural":"filosofiile","dative-genitive-indefinite-singular":"filosofii","dative-definite-genitive-singular":"filosofiei","dative-genitive-indefinite-plural":"filosofii","dative-definite-genitive-plural":"filosofiilor","singular-vocative":"filosofie","plural-vocative":"filosofiilor","alternative":"философие"}},{"word":"filosovietic","pos":"adj","definitions":["pro-Soviet"],"forms":{"feminine-singular":"filosovietică","masculine-plural":"filosovietici","feminine-neuter-plural":"filosovietice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filosovietic","error-unrecognized-form-feminine-indefinite-singular":"filosovietică","error-unrecognized-form-indefinite-masculine-plural":"filosovietici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filosovietice","definite-error-unrecognized-form-masculine-neuter-singular":"filosovieticul","definite-error-unrecognized-form-feminine-singular":"filosovietica","definite-error-unrecognized-form-masculine-plural":"filosovieticii","definite-error-unrecognized-form-feminine-neuter-plural":"filosovieticele"}},{"word":"filotaxie","pos":"noun","definitions":["phyllotaxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filotaxie","accusative-definite-nominative":"filotaxia","dative-genitive-indefinite":"filotaxii","dative-definite-genitive":"filotaxiei","vocative":"filotaxie"}},{"word":"Filoteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Filoteanu"}},{"word":"filotehnic","pos":"adj","definitions":["philotechnic"],"forms":{"feminine-singular":"filotehnică","masculine-plural":"filotehnici","feminine-neuter-plural":"filotehnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filotehnic","error-unrecognized-form-feminine-indefinite-singular":"filotehnică","error-unrecognized-form-indefinite-masculine-plural":"filotehnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filotehnice","definite-error-unrecognized-form-masculine-neuter-singular":"filotehnicul","definite-error-unrecognized-form-feminine-singular":"filotehnica","definite-error-unrecognized-form-masculine-plural":"filotehnicii","definite-error-unrecognized-form-feminine-neuter-plural":"filotehnicele"}},{"word":"filotim","pos":"adj","definitions":["generous"],"forms":{"feminine-singular":"filotimă","masculine-plural":"filotimi","feminine-neuter-plural":"filotime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filotim","error-unrecognized-form-feminine-indefinite-singular":"filotimă","error-unrecognized-form-indefinite-masculine-plural":"filotimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"filotime","definite-error-unrecognized-form-masculine-neuter-singular":"filotimul","definite-error-unrecognized-form-feminine-singular":"filotima","definite-error-unrecognized-form-masculine-plural":"filotimii","definite-error-unrecognized-form-feminine-neuter-plural":"filotimele"}},{"word":"filotimie","pos":"noun","definitions":["generosity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"filotimie","accusative-definite-nominative":"filotimia","dative-genitive-indefinite":"filotimii","dative-definite-genitive":"filotimiei","vocative":"filotimie"}},{"word":"filoturc","pos":"noun","definitions":["philo-Turk"],"forms":{"plural":"filoturci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filoturc","accusative-definite-nominative-singular":"filoturcul","accusative-indefinite-nominative-plural":"filoturci","accusative-definite-nominative-plural":"filoturcii","dative-genitive-indefinite-singular":"filoturc","dative-definite-genitive-singular":"filoturcului","dative-genitive-indefinite-plural":"filoturci","dative-definite-genitive-plural":"filoturcilor","singular-vocative":"filoturcule","plural-vocative":"filoturcilor"}},{"word":"filoxeră","pos":"noun","definitions":["phylloxera"],"forms":{"plural":"filoxere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filoxeră","accusative-definite-nominative-singular":"filoxera","accusative-indefinite-nominative-plural":"filoxere","accusative-definite-nominative-plural":"filoxerele","dative-genitive-indefinite-singular":"filoxere","dative-definite-genitive-singular":"filoxerei","dative-genitive-indefinite-plural":"filoxere","dative-definite-genitive-plural":"filoxerelor","singular-vocative":"filoxeră","plural-vocative":"filoxerelor"}},{"word":"filoz.","pos":"noun","definitions":["abbreviation of filozofie (“philosophy”)"]},{"word":"filozoafă","pos":"noun","definitions":["female equivalent of filozof"],"forms":{"plural":"filozoafe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"filozoafă","accusative-definite-nominative-singular":"filozoafa","accusative-indefinite-nominative-plural":"filozoafe","accusative-definite-nominative-plural":"filozoafele","dative-genitive-indefinite-singular":"filozoafe","dative-definite-genitive-singular":"filozoafei","dative-genitive-indefinite-plural":"filozoafe","dative-definite-genitive-plural":"filozoafelor","singular-vocative":"filozoafă","plural-vocative":"filozoafelor"}},{"word":"filozoafe","pos":"noun","definitions":["plural of filozoafă"],"gender":"f-p"},{"word":"filozof","pos":"noun","definitions":["philosopher"],"forms":{"plural":"filozofi","feminine":"equivalent filozoafă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filozof","accusative-definite-nominative-singular":"filozoful","accusative-indefinite-nominative-plural":"filozofi","accusative-definite-nominative-plural":"filozofii","dative-genitive-indefinite-singular":"filozof","dative-definite-genitive-singular":"filozofului","dative-genitive-indefinite-plural":"filozofi","dative-definite-genitive-plural":"filozofilor","singular-vocative":"filozofule","plural-vocative":"filozofilor","alternative":"filosof"}},{"word":"filozofa","pos":"verb","definitions":["to philosophize"],"forms":{"canonical":"a filozofa 1st conjugation","present-singular-third-person":"filozofează","participle-past":"filozofat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a filozofa","gerund":"filozofând","first-person-indicative-present-singular":"filozofez","indicative-present-second-person-singular":"filozofezi","indicative-present-singular-third-person":"filozofează","first-person-indicative-plural-present":"filozofăm","indicative-plural-present-second-person":"filozofați","indicative-plural-present-third-person":"filozofează","first-person-imperfect-indicative-singular":"filozofam","imperfect-indicative-second-person-singular":"filozofai","imperfect-indicative-singular-third-person":"filozofa","first-person-imperfect-indicative-plural":"filozofam","imperfect-indicative-plural-second-person":"filozofați","imperfect-indicative-plural-third-person":"filozofau","first-person-indicative-perfect-singular":"filozofai","indicative-perfect-second-person-singular":"filozofași","indicative-perfect-singular-third-person":"filozofă","first-person-indicative-perfect-plural":"filozofarăm","indicative-perfect-plural-second-person":"filozofarăți","indicative-perfect-plural-third-person":"filozofară","first-person-indicative-pluperfect-singular":"filozofasem","indicative-pluperfect-second-person-singular":"filozofaseși","indicative-pluperfect-singular-third-person":"filozofase","first-person-indicative-pluperfect-plural":"filozofaserăm","indicative-pluperfect-plural-second-person":"filozofaserăți","indicative-pluperfect-plural-third-person":"filozofaseră","first-person-present-singular-subjunctive":"să filozofez","present-second-person-singular-subjunctive":"să filozofezi","present-singular-subjunctive-third-person":"să filozofeze","first-person-plural-present-subjunctive":"să filozofăm","plural-present-second-person-subjunctive":"să filozofați","plural-present-subjunctive-third-person":"să filozofeze","imperative-second-person-singular":"filozofează","imperative-plural-second-person":"filozofați","imperative-negative-second-person-singular":"nu filozofa","imperative-negative-plural-second-person":"nu filozofați"}},{"word":"filozofal","pos":"adj","definitions":["philosopher"],"forms":{"feminine-singular":"filozofală","masculine-plural":"filozofali","feminine-neuter-plural":"filozofale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filozofal","error-unrecognized-form-feminine-indefinite-singular":"filozofală","error-unrecognized-form-indefinite-masculine-plural":"filozofali","error-unrecognized-form-feminine-indefinite-neuter-plural":"filozofale","definite-error-unrecognized-form-masculine-neuter-singular":"filozofalul","definite-error-unrecognized-form-feminine-singular":"filozofala","definite-error-unrecognized-form-masculine-plural":"filozofalii","definite-error-unrecognized-form-feminine-neuter-plural":"filozofalele"}},{"word":"filozofant","pos":"adj","definitions":["philosophying"],"forms":{"feminine-singular":"filozofantă","masculine-plural":"filozofanți","feminine-neuter-plural":"filozofante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filozofant","error-unrecognized-form-feminine-indefinite-singular":"filozofantă","error-unrecognized-form-indefinite-masculine-plural":"filozofanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"filozofante","definite-error-unrecognized-form-masculine-neuter-singular":"filozofantul","definite-error-unrecognized-form-feminine-singular":"filozofanta","definite-error-unrecognized-form-masculine-plural":"filozofanții","definite-error-unrecognized-form-feminine-neuter-plural":"filozofantele"}},{"word":"filozofard","pos":"noun","definitions":["philosophaster"],"forms":{"plural":"filozofarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"filozofard","accusative-definite-nominative-singular":"filozofardul","accusative-indefinite-nominative-plural":"filozofarzi","accusative-definite-nominative-plural":"filozofarzii","dative-genitive-indefinite-singular":"filozofard","dative-definite-genitive-singular":"filozofardului","dative-genitive-indefinite-plural":"filozofarzi","dative-definite-genitive-plural":"filozofarzilor","singular-vocative":"filozofardule","plural-vocative":"filozofarzilor"}},{"word":"filozofare","pos":"noun","definitions":["philosophizing"],"forms":{"plural":"filozofări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filozofare","accusative-definite-nominative-singular":"filozofarea","accusative-indefinite-nominative-plural":"filozofări","accusative-definite-nominative-plural":"filozofările","dative-genitive-indefinite-singular":"filozofări","dative-definite-genitive-singular":"filozofării","dative-genitive-indefinite-plural":"filozofări","dative-definite-genitive-plural":"filozofărilor","singular-vocative":"filozofare","plural-vocative":"filozofărilor"}},{"word":"filozofem","pos":"noun","definitions":["philosopheme"],"forms":{"plural":"filozofeme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filozofem","accusative-definite-nominative-singular":"filozofemul","accusative-indefinite-nominative-plural":"filozofeme","accusative-definite-nominative-plural":"filozofemele","dative-genitive-indefinite-singular":"filozofem","dative-definite-genitive-singular":"filozofemului","dative-genitive-indefinite-plural":"filozofeme","dative-definite-genitive-plural":"filozofemelor","singular-vocative":"filozofemule","plural-vocative":"filozofemelor"}},{"word":"filozofesc","pos":"adj","definitions":["philosophical"],"forms":{"feminine-singular":"filozofească","plural":"filozofești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filozofesc","error-unrecognized-form-feminine-indefinite-singular":"filozofească","error-unrecognized-form-indefinite-masculine-plural":"filozofești","error-unrecognized-form-feminine-indefinite-neuter-plural":"filozofești","definite-error-unrecognized-form-masculine-neuter-singular":"filozofescul","definite-error-unrecognized-form-feminine-singular":"filozofeasca","definite-error-unrecognized-form-masculine-plural":"filozofeștii","definite-error-unrecognized-form-feminine-neuter-plural":"filozofeștile"}},{"word":"filozofi","pos":"noun","definitions":["plural of filozof"],"gender":"m-p"},{"word":"filozofia","pos":"noun","definitions":["definite nominative/accusative singular of filozofie"],"pronunciation":"[filozoˈfi.a]","gender":"f"},{"word":"filozofic","pos":"adj","definitions":["philosophical"],"pronunciation":"/fi.loˈzo.fik/","forms":{"feminine-singular":"filozofică","masculine-plural":"filozofici","feminine-neuter-plural":"filozofice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filozofic","error-unrecognized-form-feminine-indefinite-singular":"filozofică","error-unrecognized-form-indefinite-masculine-plural":"filozofici","error-unrecognized-form-feminine-indefinite-neuter-plural":"filozofice","definite-error-unrecognized-form-masculine-neuter-singular":"filozoficul","definite-error-unrecognized-form-feminine-singular":"filozofica","definite-error-unrecognized-form-masculine-plural":"filozoficii","definite-error-unrecognized-form-feminine-neuter-plural":"filozoficele","alternative":"филозофик"}},{"word":"filozoficesc","pos":"adj","definitions":["philosophical"],"forms":{"feminine-singular":"filozoficească","plural":"filozoficești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filozoficesc","error-unrecognized-form-feminine-indefinite-singular":"filozoficească","error-unrecognized-form-indefinite-masculine-plural":"filozoficești","error-unrecognized-form-feminine-indefinite-neuter-plural":"filozoficești","definite-error-unrecognized-form-masculine-neuter-singular":"filozoficescul","definite-error-unrecognized-form-feminine-singular":"filozoficeasca","definite-error-unrecognized-form-masculine-plural":"filozoficeștii","definite-error-unrecognized-form-feminine-neuter-plural":"filozoficeștile"}},{"word":"filozoficește","pos":"adv","definitions":["philosophically"]},{"word":"filozofie","pos":"noun","definitions":["philosophy (academic discipline)","philosophy (set of fundamental concepts and principles underlying a domain)"],"pronunciation":"/fi.lo.zoˈfi.e/","forms":{"plural":"filozofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filozofie","accusative-definite-nominative-singular":"filozofia","accusative-indefinite-nominative-plural":"filozofii","accusative-definite-nominative-plural":"filozofiile","dative-genitive-indefinite-singular":"filozofii","dative-definite-genitive-singular":"filozofiei","dative-genitive-indefinite-plural":"filozofii","dative-definite-genitive-plural":"filozofiilor","singular-vocative":"filozofie","plural-vocative":"filozofiilor","alternative":"филозофие"}},{"word":"filozofio","pos":"noun","definitions":["vocative singular of filozofie"],"pronunciation":"[filozoˈfi.o]","gender":"f"},{"word":"filozofism","pos":"noun","definitions":["philosophism"],"forms":{"plural":"filozofisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filozofism","accusative-definite-nominative-singular":"filozofismul","accusative-indefinite-nominative-plural":"filozofisme","accusative-definite-nominative-plural":"filozofismele","dative-genitive-indefinite-singular":"filozofism","dative-definite-genitive-singular":"filozofismului","dative-genitive-indefinite-plural":"filozofisme","dative-definite-genitive-plural":"filozofismelor","singular-vocative":"filozofismule","plural-vocative":"filozofismelor"}},{"word":"Filpișu Mare","pos":"name","definitions":["a village in Breaza, Mureș County, Romania"],"gender":"m"},{"word":"Filpișu Mic","pos":"name","definitions":["a village in Breaza, Mureș County, Romania"],"gender":"m"},{"word":"filtra","pos":"verb","definitions":["to filter"],"pronunciation":"/filˈtra/","forms":{"canonical":"a filtra 1st conjugation","present-singular-third-person":"filtrează","participle-past":"filtrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a filtra","gerund":"filtrând","first-person-indicative-present-singular":"filtrez","indicative-present-second-person-singular":"filtrezi","indicative-present-singular-third-person":"filtrează","first-person-indicative-plural-present":"filtrăm","indicative-plural-present-second-person":"filtrați","indicative-plural-present-third-person":"filtrează","first-person-imperfect-indicative-singular":"filtram","imperfect-indicative-second-person-singular":"filtrai","imperfect-indicative-singular-third-person":"filtra","first-person-imperfect-indicative-plural":"filtram","imperfect-indicative-plural-second-person":"filtrați","imperfect-indicative-plural-third-person":"filtrau","first-person-indicative-perfect-singular":"filtrai","indicative-perfect-second-person-singular":"filtrași","indicative-perfect-singular-third-person":"filtră","first-person-indicative-perfect-plural":"filtrarăm","indicative-perfect-plural-second-person":"filtrarăți","indicative-perfect-plural-third-person":"filtrară","first-person-indicative-pluperfect-singular":"filtrasem","indicative-pluperfect-second-person-singular":"filtraseși","indicative-pluperfect-singular-third-person":"filtrase","first-person-indicative-pluperfect-plural":"filtraserăm","indicative-pluperfect-plural-second-person":"filtraserăți","indicative-pluperfect-plural-third-person":"filtraseră","first-person-present-singular-subjunctive":"să filtrez","present-second-person-singular-subjunctive":"să filtrezi","present-singular-subjunctive-third-person":"să filtreze","first-person-plural-present-subjunctive":"să filtrăm","plural-present-second-person-subjunctive":"să filtrați","plural-present-subjunctive-third-person":"să filtreze","imperative-second-person-singular":"filtrează","imperative-plural-second-person":"filtrați","imperative-negative-second-person-singular":"nu filtra","imperative-negative-plural-second-person":"nu filtrați"}},{"word":"filtrabil","pos":"adj","definitions":["filterable"],"pronunciation":"/filˈtra.bil/","forms":{"feminine-singular":"filtrabilă","masculine-plural":"filtrabili","feminine-neuter-plural":"filtrabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filtrabil","error-unrecognized-form-feminine-indefinite-singular":"filtrabilă","error-unrecognized-form-indefinite-masculine-plural":"filtrabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"filtrabile","definite-error-unrecognized-form-masculine-neuter-singular":"filtrabilul","definite-error-unrecognized-form-feminine-singular":"filtrabila","definite-error-unrecognized-form-masculine-plural":"filtrabilii","definite-error-unrecognized-form-feminine-neuter-plural":"filtrabilele"}},{"word":"filtraj","pos":"noun","definitions":["filtering"],"forms":{"plural":"filtraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filtraj","accusative-definite-nominative-singular":"filtrajul","accusative-indefinite-nominative-plural":"filtraje","accusative-definite-nominative-plural":"filtrajele","dative-genitive-indefinite-singular":"filtraj","dative-definite-genitive-singular":"filtrajului","dative-genitive-indefinite-plural":"filtraje","dative-definite-genitive-plural":"filtrajelor","singular-vocative":"filtrajule","plural-vocative":"filtrajelor"}},{"word":"filtrant","pos":"adj","definitions":["filtering"],"forms":{"feminine-singular":"filtrantă","masculine-plural":"filtranți","feminine-neuter-plural":"filtrante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filtrant","error-unrecognized-form-feminine-indefinite-singular":"filtrantă","error-unrecognized-form-indefinite-masculine-plural":"filtranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"filtrante","definite-error-unrecognized-form-masculine-neuter-singular":"filtrantul","definite-error-unrecognized-form-feminine-singular":"filtranta","definite-error-unrecognized-form-masculine-plural":"filtranții","definite-error-unrecognized-form-feminine-neuter-plural":"filtrantele"}},{"word":"filtrare","pos":"noun","definitions":["filtration"],"forms":{"plural":"filtrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"filtrare","accusative-definite-nominative-singular":"filtrarea","accusative-indefinite-nominative-plural":"filtrări","accusative-definite-nominative-plural":"filtrările","dative-genitive-indefinite-singular":"filtrări","dative-definite-genitive-singular":"filtrării","dative-genitive-indefinite-plural":"filtrări","dative-definite-genitive-plural":"filtrărilor","singular-vocative":"filtrare","plural-vocative":"filtrărilor"}},{"word":"filtrat","pos":"adj","definitions":["filtered"],"forms":{"feminine-singular":"filtrată","masculine-plural":"filtrați","feminine-neuter-plural":"filtrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"filtrat","error-unrecognized-form-feminine-indefinite-singular":"filtrată","error-unrecognized-form-indefinite-masculine-plural":"filtrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"filtrate","definite-error-unrecognized-form-masculine-neuter-singular":"filtratul","definite-error-unrecognized-form-feminine-singular":"filtrata","definite-error-unrecognized-form-masculine-plural":"filtrații","definite-error-unrecognized-form-feminine-neuter-plural":"filtratele"}},{"word":"filtrație","pos":"noun","definitions":["filtration"],"forms":{"plural":"filtrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"filtrație","accusative-definite-nominative-singular":"filtrația","accusative-indefinite-nominative-plural":"filtrații","accusative-definite-nominative-plural":"filtrațiile","dative-genitive-indefinite-singular":"filtrații","dative-definite-genitive-singular":"filtrației","dative-genitive-indefinite-plural":"filtrații","dative-definite-genitive-plural":"filtrațiilor","singular-vocative":"filtrație","plural-vocative":"filtrațiilor"}},{"word":"filtru","pos":"noun","definitions":["filter","philtrum"],"forms":{"plural":"filtre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"filtru","accusative-definite-nominative-singular":"filtrul","accusative-indefinite-nominative-plural":"filtre","accusative-definite-nominative-plural":"filtrele","dative-genitive-indefinite-singular":"filtru","dative-definite-genitive-singular":"filtrului","dative-genitive-indefinite-plural":"filtre","dative-definite-genitive-plural":"filtrelor","singular-vocative":"filtrule","plural-vocative":"filtrelor"}},{"word":"filtru de aer","pos":"noun","definitions":["air filter"],"forms":{"plural":"filtre de aer"}},{"word":"filum","pos":"noun","definitions":["phylum"],"forms":{"plural":"filumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"filum","accusative-definite-nominative-singular":"filumul","accusative-indefinite-nominative-plural":"filumuri","accusative-definite-nominative-plural":"filumurile","dative-genitive-indefinite-singular":"filum","dative-definite-genitive-singular":"filumului","dative-genitive-indefinite-plural":"filumuri","dative-definite-genitive-plural":"filumurilor","singular-vocative":"filumule","plural-vocative":"filumurilor"}},{"word":"fim","pos":"verb","definitions":["first-person plural present subjunctive of fi"],"pronunciation":"[fim]"},{"word":"fimbrie","pos":"noun","definitions":["fimbria"],"forms":{"plural":"fimbrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fimbrie","accusative-definite-nominative-singular":"fimbria","accusative-indefinite-nominative-plural":"fimbrii","accusative-definite-nominative-plural":"fimbriile","dative-genitive-indefinite-singular":"fimbrii","dative-definite-genitive-singular":"fimbriei","dative-genitive-indefinite-plural":"fimbrii","dative-definite-genitive-plural":"fimbriilor","singular-vocative":"fimbrie","plural-vocative":"fimbriilor"}},{"word":"fimoză","pos":"noun","definitions":["phimosis"],"forms":{"plural":"fimoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fimoză","accusative-definite-nominative-singular":"fimoza","accusative-indefinite-nominative-plural":"fimoze","accusative-definite-nominative-plural":"fimozele","dative-genitive-indefinite-singular":"fimoze","dative-definite-genitive-singular":"fimozei","dative-genitive-indefinite-plural":"fimoze","dative-definite-genitive-plural":"fimozelor","singular-vocative":"fimoză","plural-vocative":"fimozelor"}},{"word":"fin","pos":"adj","definitions":["fine, delicate","subtle"],"pronunciation":"/fin/","forms":{"feminine-singular":"fină","masculine-plural":"fini","feminine-neuter-plural":"fine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fin","error-unrecognized-form-feminine-indefinite-singular":"fină","error-unrecognized-form-indefinite-masculine-plural":"fini","error-unrecognized-form-feminine-indefinite-neuter-plural":"fine","definite-error-unrecognized-form-masculine-neuter-singular":"finul","definite-error-unrecognized-form-feminine-singular":"fina","definite-error-unrecognized-form-masculine-plural":"finii","definite-error-unrecognized-form-feminine-neuter-plural":"finele"}},{"word":"fin","pos":"noun","definitions":["godson"],"pronunciation":"/fin/","forms":{"plural":"fini","feminine":"equivalent fină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fin","accusative-definite-nominative-singular":"finul","accusative-indefinite-nominative-plural":"fini","accusative-definite-nominative-plural":"finii","dative-genitive-indefinite-singular":"fin","dative-definite-genitive-singular":"finului","dative-genitive-indefinite-plural":"fini","dative-definite-genitive-plural":"finilor","singular-vocative":"finule","plural-vocative":"finilor"}},{"word":"fină","pos":"noun","definitions":["goddaughter"],"forms":{"plural":"fine","masculine":"equivalent fin"}},{"word":"final","pos":"adj","definitions":["final"],"forms":{"feminine-singular":"finală","masculine-plural":"finali","feminine-neuter-plural":"finale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"final","error-unrecognized-form-feminine-indefinite-singular":"finală","error-unrecognized-form-indefinite-masculine-plural":"finali","error-unrecognized-form-feminine-indefinite-neuter-plural":"finale","definite-error-unrecognized-form-masculine-neuter-singular":"finalul","definite-error-unrecognized-form-feminine-singular":"finala","definite-error-unrecognized-form-masculine-plural":"finalii","definite-error-unrecognized-form-feminine-neuter-plural":"finalele"}},{"word":"final de partidă","pos":"noun","definitions":["endgame"],"forms":{"plural":"finaluri de partidă"}},{"word":"final fericit","pos":"noun","definitions":["happy ending"],"forms":{"plural":"finaluri fericite"}},{"word":"finală","pos":"noun","definitions":["final"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"finală","accusative-definite-nominative-singular":"finala","accusative-indefinite-nominative-plural":"finale","accusative-definite-nominative-plural":"finalele","dative-genitive-indefinite-singular":"finale","dative-definite-genitive-singular":"finalei","dative-genitive-indefinite-plural":"finale","dative-definite-genitive-plural":"finalelor","singular-vocative":"finală","plural-vocative":"finalelor"}},{"word":"finalism","pos":"noun","definitions":["finalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"finalism","accusative-definite-nominative":"finalismul","dative-genitive-indefinite":"finalism","dative-definite-genitive":"finalismului","vocative":"finalismule"}},{"word":"finalist","pos":"noun","definitions":["finalist"],"forms":{"plural":"finaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finalist","accusative-definite-nominative-singular":"finalistul","accusative-indefinite-nominative-plural":"finaliști","accusative-definite-nominative-plural":"finaliștii","dative-genitive-indefinite-singular":"finalist","dative-definite-genitive-singular":"finalistului","dative-genitive-indefinite-plural":"finaliști","dative-definite-genitive-plural":"finaliștilor","singular-vocative":"finalistule","plural-vocative":"finaliștilor"}},{"word":"finalistă","pos":"noun","definitions":["female equivalent of finalist"],"forms":{"plural":"finaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"finalistă","accusative-definite-nominative-singular":"finalista","accusative-indefinite-nominative-plural":"finaliste","accusative-definite-nominative-plural":"finalistele","dative-genitive-indefinite-singular":"finaliste","dative-definite-genitive-singular":"finalistei","dative-genitive-indefinite-plural":"finaliste","dative-definite-genitive-plural":"finalistelor","singular-vocative":"finalistă","plural-vocative":"finalistelor"}},{"word":"finalitate","pos":"noun","definitions":["finality","purpose"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"finalitate","accusative-definite-nominative":"finalitatea","dative-genitive-indefinite":"finalități","dative-definite-genitive":"finalității","vocative":"finalitate"}},{"word":"finaliza","pos":"verb","definitions":["to finalize"],"pronunciation":"/fi.na.liˈza/","forms":{"canonical":"a finaliza 1st conjugation","present-singular-third-person":"finalizează","participle-past":"finalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a finaliza","gerund":"finalizând","first-person-indicative-present-singular":"finalizez","indicative-present-second-person-singular":"finalizezi","indicative-present-singular-third-person":"finalizează","first-person-indicative-plural-present":"finalizăm","indicative-plural-present-second-person":"finalizați","indicative-plural-present-third-person":"finalizează","first-person-imperfect-indicative-singular":"finalizam","imperfect-indicative-second-person-singular":"finalizai","imperfect-indicative-singular-third-person":"finaliza","first-person-imperfect-indicative-plural":"finalizam","imperfect-indicative-plural-second-person":"finalizați","imperfect-indicative-plural-third-person":"finalizau","first-person-indicative-perfect-singular":"finalizai","indicative-perfect-second-person-singular":"finalizași","indicative-perfect-singular-third-person":"finaliză","first-person-indicative-perfect-plural":"finalizarăm","indicative-perfect-plural-second-person":"finalizarăți","indicative-perfect-plural-third-person":"finalizară","first-person-indicative-pluperfect-singular":"finalizasem","indicative-pluperfect-second-person-singular":"finalizaseși","indicative-pluperfect-singular-third-person":"finalizase","first-person-indicative-pluperfect-plural":"finalizaserăm","indicative-pluperfect-plural-second-person":"finalizaserăți","indicative-pluperfect-plural-third-person":"finalizaseră","first-person-present-singular-subjunctive":"să finalizez","present-second-person-singular-subjunctive":"să finalizezi","present-singular-subjunctive-third-person":"să finalizeze","first-person-plural-present-subjunctive":"să finalizăm","plural-present-second-person-subjunctive":"să finalizați","plural-present-subjunctive-third-person":"să finalizeze","imperative-second-person-singular":"finalizează","imperative-plural-second-person":"finalizați","imperative-negative-second-person-singular":"nu finaliza","imperative-negative-plural-second-person":"nu finalizați"}},{"word":"finalizai","pos":"verb","definitions":["inflection of finaliza:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[finaliˈzaj]"},{"word":"finalizam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of finaliza"],"pronunciation":"[finaliˈzam]"},{"word":"finalizare","pos":"noun","definitions":["completion"],"forms":{"plural":"finalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"finalizare","accusative-definite-nominative-singular":"finalizarea","accusative-indefinite-nominative-plural":"finalizări","accusative-definite-nominative-plural":"finalizările","dative-genitive-indefinite-singular":"finalizări","dative-definite-genitive-singular":"finalizării","dative-genitive-indefinite-plural":"finalizări","dative-definite-genitive-plural":"finalizărilor","singular-vocative":"finalizare","plural-vocative":"finalizărilor"}},{"word":"finalizase","pos":"verb","definitions":["third-person singular pluperfect indicative of finaliza"],"pronunciation":"[finaliˈzase]"},{"word":"finalizat","pos":"adj","definitions":["completed"],"forms":{"feminine-singular":"finalizată","masculine-plural":"finalizați","feminine-neuter-plural":"finalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finalizat","error-unrecognized-form-feminine-indefinite-singular":"finalizată","error-unrecognized-form-indefinite-masculine-plural":"finalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"finalizate","definite-error-unrecognized-form-masculine-neuter-singular":"finalizatul","definite-error-unrecognized-form-feminine-singular":"finalizata","definite-error-unrecognized-form-masculine-plural":"finalizații","definite-error-unrecognized-form-feminine-neuter-plural":"finalizatele"}},{"word":"finalmente","pos":"adv","definitions":["finally"]},{"word":"financiar","pos":"adj","definitions":["financial"],"forms":{"feminine-singular":"financiară","masculine-plural":"financiari","feminine-neuter-plural":"financiare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"financiar","error-unrecognized-form-feminine-indefinite-singular":"financiară","error-unrecognized-form-indefinite-masculine-plural":"financiari","error-unrecognized-form-feminine-indefinite-neuter-plural":"financiare","definite-error-unrecognized-form-masculine-neuter-singular":"financiarul","definite-error-unrecognized-form-feminine-singular":"financiara","definite-error-unrecognized-form-masculine-plural":"financiarii","definite-error-unrecognized-form-feminine-neuter-plural":"financiarele"}},{"word":"financiară","pos":"noun","definitions":["female equivalent of financiar"],"forms":{"plural":"financiare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"financiară","accusative-definite-nominative-singular":"financiara","accusative-indefinite-nominative-plural":"financiare","accusative-definite-nominative-plural":"financiarele","dative-genitive-indefinite-singular":"financiare","dative-definite-genitive-singular":"financiarei","dative-genitive-indefinite-plural":"financiare","dative-definite-genitive-plural":"financiarelor","singular-vocative":"financiară","plural-vocative":"financiarelor"}},{"word":"finanța","pos":"verb","definitions":["to finance"],"forms":{"canonical":"a finanța 1st conjugation","present-singular-third-person":"finanțează","participle-past":"finanțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a finanța","gerund":"finanțând","first-person-indicative-present-singular":"finanțez","indicative-present-second-person-singular":"finanțezi","indicative-present-singular-third-person":"finanțează","first-person-indicative-plural-present":"finanțăm","indicative-plural-present-second-person":"finanțați","indicative-plural-present-third-person":"finanțează","first-person-imperfect-indicative-singular":"finanțam","imperfect-indicative-second-person-singular":"finanțai","imperfect-indicative-singular-third-person":"finanța","first-person-imperfect-indicative-plural":"finanțam","imperfect-indicative-plural-second-person":"finanțați","imperfect-indicative-plural-third-person":"finanțau","first-person-indicative-perfect-singular":"finanțai","indicative-perfect-second-person-singular":"finanțași","indicative-perfect-singular-third-person":"finanță","first-person-indicative-perfect-plural":"finanțarăm","indicative-perfect-plural-second-person":"finanțarăți","indicative-perfect-plural-third-person":"finanțară","first-person-indicative-pluperfect-singular":"finanțasem","indicative-pluperfect-second-person-singular":"finanțaseși","indicative-pluperfect-singular-third-person":"finanțase","first-person-indicative-pluperfect-plural":"finanțaserăm","indicative-pluperfect-plural-second-person":"finanțaserăți","indicative-pluperfect-plural-third-person":"finanțaseră","first-person-present-singular-subjunctive":"să finanțez","present-second-person-singular-subjunctive":"să finanțezi","present-singular-subjunctive-third-person":"să finanțeze","first-person-plural-present-subjunctive":"să finanțăm","plural-present-second-person-subjunctive":"să finanțați","plural-present-subjunctive-third-person":"să finanțeze","imperative-second-person-singular":"finanțează","imperative-plural-second-person":"finanțați","imperative-negative-second-person-singular":"nu finanța","imperative-negative-plural-second-person":"nu finanțați"}},{"word":"finanță","pos":"noun","definitions":["alternative form of finanțe"],"forms":{"plural":"finanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"finanță","accusative-definite-nominative-singular":"finanța","accusative-indefinite-nominative-plural":"finanțe","accusative-definite-nominative-plural":"finanțele","dative-genitive-indefinite-singular":"finanțe","dative-definite-genitive-singular":"finanței","dative-genitive-indefinite-plural":"finanțe","dative-definite-genitive-plural":"finanțelor","singular-vocative":"finanță","plural-vocative":"finanțelor"}},{"word":"finanțare","pos":"noun","definitions":["funding"],"forms":{"plural":"finanțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"finanțare","accusative-definite-nominative-singular":"finanțarea","accusative-indefinite-nominative-plural":"finanțări","accusative-definite-nominative-plural":"finanțările","dative-genitive-indefinite-singular":"finanțări","dative-definite-genitive-singular":"finanțării","dative-genitive-indefinite-plural":"finanțări","dative-definite-genitive-plural":"finanțărilor","singular-vocative":"finanțare","plural-vocative":"finanțărilor"}},{"word":"finanțat","pos":"adj","definitions":["financed"],"forms":{"feminine-singular":"finanțată","masculine-plural":"finanțați","feminine-neuter-plural":"finanțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finanțat","error-unrecognized-form-feminine-indefinite-singular":"finanțată","error-unrecognized-form-indefinite-masculine-plural":"finanțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"finanțate","definite-error-unrecognized-form-masculine-neuter-singular":"finanțatul","definite-error-unrecognized-form-feminine-singular":"finanțata","definite-error-unrecognized-form-masculine-plural":"finanțații","definite-error-unrecognized-form-feminine-neuter-plural":"finanțatele"}},{"word":"finanțat","pos":"verb","definitions":["past participle of finanța"],"forms":{"participle-past":"of finanța"}},{"word":"finanțatoare","pos":"noun","definitions":["female equivalent of finanțator"],"forms":{"plural":"finanțatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"finanțatoare","accusative-definite-nominative-singular":"finanțatoarea","accusative-indefinite-nominative-plural":"finanțatoare","accusative-definite-nominative-plural":"finanțatoarele","dative-genitive-indefinite-singular":"finanțatoare","dative-definite-genitive-singular":"finanțatoarei","dative-genitive-indefinite-plural":"finanțatoare","dative-definite-genitive-plural":"finanțatoarelor","singular-vocative":"finanțatoare","plural-vocative":"finanțatoarelor"}},{"word":"finanțator","pos":"noun","definitions":["financer"],"forms":{"plural":"finanțatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finanțator","accusative-definite-nominative-singular":"finanțatorul","accusative-indefinite-nominative-plural":"finanțatori","accusative-definite-nominative-plural":"finanțatorii","dative-genitive-indefinite-singular":"finanțator","dative-definite-genitive-singular":"finanțatorului","dative-genitive-indefinite-plural":"finanțatori","dative-definite-genitive-plural":"finanțatorilor","singular-vocative":"finanțatorule","plural-vocative":"finanțatorilor"}},{"word":"finanțe","pos":"noun","definitions":["finance"],"forms":{"plural":"finanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"finanță","accusative-definite-nominative-singular":"finanța","accusative-indefinite-nominative-plural":"finanțe","accusative-definite-nominative-plural":"finanțele","dative-genitive-indefinite-singular":"finanțe","dative-definite-genitive-singular":"finanței","dative-genitive-indefinite-plural":"finanțe","dative-definite-genitive-plural":"finanțelor","singular-vocative":"finanță","plural-vocative":"finanțelor"}},{"word":"finanțiar","pos":"adj","definitions":["obsolete form of financiar"],"forms":{"feminine-singular":"finanțiară","masculine-plural":"finanțiari","feminine-neuter-plural":"finanțiare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finanțiar","error-unrecognized-form-feminine-indefinite-singular":"finanțiară","error-unrecognized-form-indefinite-masculine-plural":"finanțiari","error-unrecognized-form-feminine-indefinite-neuter-plural":"finanțiare","definite-error-unrecognized-form-masculine-neuter-singular":"finanțiarul","definite-error-unrecognized-form-feminine-singular":"finanțiara","definite-error-unrecognized-form-masculine-plural":"finanțiarii","definite-error-unrecognized-form-feminine-neuter-plural":"finanțiarele"}},{"word":"finanțist","pos":"noun","definitions":["financier"],"forms":{"plural":"finanțiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finanțist","accusative-definite-nominative-singular":"finanțistul","accusative-indefinite-nominative-plural":"finanțiști","accusative-definite-nominative-plural":"finanțiștii","dative-genitive-indefinite-singular":"finanțist","dative-definite-genitive-singular":"finanțistului","dative-genitive-indefinite-plural":"finanțiști","dative-definite-genitive-plural":"finanțiștilor","singular-vocative":"finanțistule","plural-vocative":"finanțiștilor"}},{"word":"Fînaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fînaru"}},{"word":"fine","pos":"noun","definitions":["end"]},{"word":"Finescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Finescu"}},{"word":"fineță","pos":"noun","definitions":["obsolete form of finețe"],"forms":{"plural":"fineți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fineță","accusative-definite-nominative-singular":"fineța","accusative-indefinite-nominative-plural":"fineți","accusative-definite-nominative-plural":"finețile","dative-genitive-indefinite-singular":"fineți","dative-definite-genitive-singular":"fineții","dative-genitive-indefinite-plural":"fineți","dative-definite-genitive-plural":"fineților","singular-vocative":"fineță","plural-vocative":"fineților"}},{"word":"finețe","pos":"noun","definitions":["fineness"],"forms":{"plural":"finețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"finețe","accusative-definite-nominative-singular":"finețea","accusative-indefinite-nominative-plural":"fineți","accusative-definite-nominative-plural":"finețile","dative-genitive-indefinite-singular":"fineți","dative-definite-genitive-singular":"fineții","dative-genitive-indefinite-plural":"fineți","dative-definite-genitive-plural":"fineților","singular-vocative":"finețe","plural-vocative":"fineților"}},{"word":"finez","pos":"adj","definitions":["Finnish"],"forms":{"feminine-singular":"fineză","masculine-plural":"finezi","feminine-neuter-plural":"fineze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finez","error-unrecognized-form-feminine-indefinite-singular":"fineză","error-unrecognized-form-indefinite-masculine-plural":"finezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fineze","definite-error-unrecognized-form-masculine-neuter-singular":"finezul","definite-error-unrecognized-form-feminine-singular":"fineza","definite-error-unrecognized-form-masculine-plural":"finezii","definite-error-unrecognized-form-feminine-neuter-plural":"finezele"}},{"word":"fini","pos":"verb","definitions":["to finish"],"forms":{"canonical":"a fini 4th conjugation","present-singular-third-person":"finește","participle-past":"finit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fini","gerund":"finind","first-person-indicative-present-singular":"finesc","indicative-present-second-person-singular":"finești","indicative-present-singular-third-person":"finește","first-person-indicative-plural-present":"finim","indicative-plural-present-second-person":"finiți","indicative-plural-present-third-person":"finesc","first-person-imperfect-indicative-singular":"fineam","imperfect-indicative-second-person-singular":"fineai","imperfect-indicative-singular-third-person":"finea","first-person-imperfect-indicative-plural":"fineam","imperfect-indicative-plural-second-person":"fineați","imperfect-indicative-plural-third-person":"fineau","first-person-indicative-perfect-singular":"finii","indicative-perfect-second-person-singular":"finiși","indicative-perfect-singular-third-person":"fini","first-person-indicative-perfect-plural":"finirăm","indicative-perfect-plural-second-person":"finirăți","indicative-perfect-plural-third-person":"finiră","first-person-indicative-pluperfect-singular":"finisem","indicative-pluperfect-second-person-singular":"finiseși","indicative-pluperfect-singular-third-person":"finise","first-person-indicative-pluperfect-plural":"finiserăm","indicative-pluperfect-plural-second-person":"finiserăți","indicative-pluperfect-plural-third-person":"finiseră","first-person-present-singular-subjunctive":"să finesc","present-second-person-singular-subjunctive":"să finești","present-singular-subjunctive-third-person":"să finească","first-person-plural-present-subjunctive":"să finim","plural-present-second-person-subjunctive":"să finiți","plural-present-subjunctive-third-person":"să finească","imperative-second-person-singular":"finește","imperative-plural-second-person":"finiți","imperative-negative-second-person-singular":"nu fini","imperative-negative-plural-second-person":"nu finiți"}},{"word":"finic","pos":"noun","definitions":["obsolete form of fenix"],"forms":{"plural":"finici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finic","accusative-definite-nominative-singular":"finicul","accusative-indefinite-nominative-plural":"finici","accusative-definite-nominative-plural":"finicii","dative-genitive-indefinite-singular":"finic","dative-definite-genitive-singular":"finicului","dative-genitive-indefinite-plural":"finici","dative-definite-genitive-plural":"finicilor","singular-vocative":"finicule","plural-vocative":"finicilor"}},{"word":"finicel","pos":"noun","definitions":["diminutive of fin"],"forms":{"plural":"finicei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finicel","accusative-definite-nominative-singular":"finicelul","accusative-indefinite-nominative-plural":"finicei","accusative-definite-nominative-plural":"finiceii","dative-genitive-indefinite-singular":"finicel","dative-definite-genitive-singular":"finicelului","dative-genitive-indefinite-plural":"finicei","dative-definite-genitive-plural":"finiceilor","singular-vocative":"finicelule","plural-vocative":"finiceilor"}},{"word":"finicet","pos":"noun","definitions":["date palm grove"],"forms":{"plural":"finiceturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"finicet","accusative-definite-nominative-singular":"finicetul","accusative-indefinite-nominative-plural":"finiceturi","accusative-definite-nominative-plural":"finiceturile","dative-genitive-indefinite-singular":"finicet","dative-definite-genitive-singular":"finicetului","dative-genitive-indefinite-plural":"finiceturi","dative-definite-genitive-plural":"finiceturilor","singular-vocative":"finicetule","plural-vocative":"finiceturilor"}},{"word":"finior","pos":"noun","definitions":["common juniper (Juniperus communis)"],"forms":{"plural":"finiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finior","accusative-definite-nominative-singular":"finiorul","accusative-indefinite-nominative-plural":"finiori","accusative-definite-nominative-plural":"finiorii","dative-genitive-indefinite-singular":"finior","dative-definite-genitive-singular":"finiorului","dative-genitive-indefinite-plural":"finiori","dative-definite-genitive-plural":"finiorilor","singular-vocative":"finiorule","plural-vocative":"finiorilor"}},{"word":"Finiș","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Finiș, Bihor County, Romania"],"gender":"m"},{"word":"finisa","pos":"verb","definitions":["to finish (apply final treatment on a surface)"],"pronunciation":"/finiˈsa/","forms":{"canonical":"a finisa 1st conjugation","present-singular-third-person":"finisează","participle-past":"finisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a finisa","gerund":"finisând","first-person-indicative-present-singular":"finisez","indicative-present-second-person-singular":"finisezi","indicative-present-singular-third-person":"finisează","first-person-indicative-plural-present":"finisăm","indicative-plural-present-second-person":"finisați","indicative-plural-present-third-person":"finisează","first-person-imperfect-indicative-singular":"finisam","imperfect-indicative-second-person-singular":"finisai","imperfect-indicative-singular-third-person":"finisa","first-person-imperfect-indicative-plural":"finisam","imperfect-indicative-plural-second-person":"finisați","imperfect-indicative-plural-third-person":"finisau","first-person-indicative-perfect-singular":"finisai","indicative-perfect-second-person-singular":"finisași","indicative-perfect-singular-third-person":"finisă","first-person-indicative-perfect-plural":"finisarăm","indicative-perfect-plural-second-person":"finisarăți","indicative-perfect-plural-third-person":"finisară","first-person-indicative-pluperfect-singular":"finisasem","indicative-pluperfect-second-person-singular":"finisaseși","indicative-pluperfect-singular-third-person":"finisase","first-person-indicative-pluperfect-plural":"finisaserăm","indicative-pluperfect-plural-second-person":"finisaserăți","indicative-pluperfect-plural-third-person":"finisaseră","first-person-present-singular-subjunctive":"să finisez","present-second-person-singular-subjunctive":"să finisezi","present-singular-subjunctive-third-person":"să finiseze","first-person-plural-present-subjunctive":"să finisăm","plural-present-second-person-subjunctive":"să finisați","plural-present-subjunctive-third-person":"să finiseze","imperative-second-person-singular":"finisează","imperative-plural-second-person":"finisați","imperative-negative-second-person-singular":"nu finisa","imperative-negative-plural-second-person":"nu finisați"}},{"word":"finisaj","pos":"noun","definitions":["finishing"],"pronunciation":"/fi.niˈsaʒ/","forms":{"plural":"finisaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"finisaj","accusative-definite-nominative-singular":"finisajul","accusative-indefinite-nominative-plural":"finisaje","accusative-definite-nominative-plural":"finisajele","dative-genitive-indefinite-singular":"finisaj","dative-definite-genitive-singular":"finisajului","dative-genitive-indefinite-plural":"finisaje","dative-definite-genitive-plural":"finisajelor","singular-vocative":"finisajule","plural-vocative":"finisajelor"}},{"word":"finisare","pos":"noun","definitions":["finishing"],"pronunciation":"/fi.niˈsa.re/","forms":{"plural":"finisări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"finisare","accusative-definite-nominative-singular":"finisarea","accusative-indefinite-nominative-plural":"finisări","accusative-definite-nominative-plural":"finisările","dative-genitive-indefinite-singular":"finisări","dative-definite-genitive-singular":"finisării","dative-genitive-indefinite-plural":"finisări","dative-definite-genitive-plural":"finisărilor","singular-vocative":"finisare","plural-vocative":"finisărilor"}},{"word":"finisat","pos":"adj","definitions":["finished (with finish applied)"],"pronunciation":"/fi.niˈsat/","forms":{"feminine-singular":"finisată","masculine-plural":"finisați","feminine-neuter-plural":"finisate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finisat","error-unrecognized-form-feminine-indefinite-singular":"finisată","error-unrecognized-form-indefinite-masculine-plural":"finisați","error-unrecognized-form-feminine-indefinite-neuter-plural":"finisate","definite-error-unrecognized-form-masculine-neuter-singular":"finisatul","definite-error-unrecognized-form-feminine-singular":"finisata","definite-error-unrecognized-form-masculine-plural":"finisații","definite-error-unrecognized-form-feminine-neuter-plural":"finisatele"}},{"word":"finisat","pos":"verb","definitions":["past participle of finisa"],"pronunciation":"/fi.niˈsat/"},{"word":"Finișel","pos":"name","definitions":["a village in Săvădisla, Cluj County, Romania"],"gender":"m"},{"word":"finisoare","pos":"noun","definitions":["female equivalent of finisor"],"forms":{"plural":"finisoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"finisoare","accusative-definite-nominative-singular":"finisoarea","accusative-indefinite-nominative-plural":"finisoare","accusative-definite-nominative-plural":"finisoarele","dative-genitive-indefinite-singular":"finisoare","dative-definite-genitive-singular":"finisoarei","dative-genitive-indefinite-plural":"finisoare","dative-definite-genitive-plural":"finisoarelor","singular-vocative":"finisoare","plural-vocative":"finisoarelor"}},{"word":"finisor","pos":"noun","definitions":["finisher"],"forms":{"plural":"finisori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finisor","accusative-definite-nominative-singular":"finisorul","accusative-indefinite-nominative-plural":"finisori","accusative-definite-nominative-plural":"finisorii","dative-genitive-indefinite-singular":"finisor","dative-definite-genitive-singular":"finisorului","dative-genitive-indefinite-plural":"finisori","dative-definite-genitive-plural":"finisorilor","singular-vocative":"finisorule","plural-vocative":"finisorilor"}},{"word":"finișor","pos":"noun","definitions":["diminutive of fin"],"forms":{"plural":"finișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finișor","accusative-definite-nominative-singular":"finișorul","accusative-indefinite-nominative-plural":"finișori","accusative-definite-nominative-plural":"finișorii","dative-genitive-indefinite-singular":"finișor","dative-definite-genitive-singular":"finișorului","dative-genitive-indefinite-plural":"finișori","dative-definite-genitive-plural":"finișorilor","singular-vocative":"finișorule","plural-vocative":"finișorilor"}},{"word":"finit","pos":"adj","definitions":["ended, terminated"],"forms":{"feminine-singular":"finită","masculine-plural":"finiți","feminine-neuter-plural":"finite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"finit","error-unrecognized-form-feminine-indefinite-singular":"finită","error-unrecognized-form-indefinite-masculine-plural":"finiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"finite","definite-error-unrecognized-form-masculine-neuter-singular":"finitul","definite-error-unrecognized-form-feminine-singular":"finita","definite-error-unrecognized-form-masculine-plural":"finiții","definite-error-unrecognized-form-feminine-neuter-plural":"finitele"}},{"word":"finiț","pos":"noun","definitions":["diminutive of fin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"finiț","accusative-definite-nominative":"finițul","dative-genitive-indefinite":"finiț","dative-definite-genitive":"finițului","vocative":"finițule"}},{"word":"finitate","pos":"noun","definitions":["finiteness"],"pronunciation":"[fi.niˈta.te]","forms":{"plural":"finități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"finitate","accusative-definite-nominative-singular":"finitatea","accusative-indefinite-nominative-plural":"finități","accusative-definite-nominative-plural":"finitățile","dative-genitive-indefinite-singular":"finități","dative-definite-genitive-singular":"finității","dative-genitive-indefinite-plural":"finități","dative-definite-genitive-plural":"finităților","singular-vocative":"finitate","plural-vocative":"finităților"}},{"word":"finiție","pos":"noun","definitions":["finishing (act of finishing)"],"forms":{"plural":"finiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"finiție","accusative-definite-nominative-singular":"finiția","accusative-indefinite-nominative-plural":"finiții","accusative-definite-nominative-plural":"finițiile","dative-genitive-indefinite-singular":"finiții","dative-definite-genitive-singular":"finiției","dative-genitive-indefinite-plural":"finiții","dative-definite-genitive-plural":"finițiilor","singular-vocative":"finiție","plural-vocative":"finițiilor"}},{"word":"finitism","pos":"noun","definitions":["finitism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"finitism","accusative-definite-nominative":"finitismul","dative-genitive-indefinite":"finitism","dative-definite-genitive":"finitismului","vocative":"finitismule"}},{"word":"Finlanda","pos":"name","definitions":["Finland (a country in Northern Europe)"],"pronunciation":"[finˈlan.da]","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Finlandă","accusative-definite-nominative":"Finlanda","dative-genitive-indefinite":"Finlande","dative-definite-genitive":"Finlandei","vocative":"Finlandă"}},{"word":"Finlandei","pos":"name","definitions":["definite genitive/dative singular of Finlanda"],"pronunciation":"[finˈlan.dej]","gender":"f","examples":[{"ro":"Locuitorii Finlandei se numesc finlandezi.","en":"The inhabitants of Finland are called Finnish."}]},{"word":"finlandez","pos":"adj","definitions":["Finnish"],"pronunciation":"[fin.lanˈdez]","forms":{"feminine-singular":"finlandeză","masculine-plural":"finlandezi","feminine-neuter-plural":"finlandeze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"finlandez","error-unrecognized-form-feminine-indefinite-singular":"finlandeză","error-unrecognized-form-indefinite-masculine-plural":"finlandezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"finlandeze","definite-error-unrecognized-form-masculine-neuter-singular":"finlandezul","definite-error-unrecognized-form-feminine-singular":"finlandeza","definite-error-unrecognized-form-masculine-plural":"finlandezii","definite-error-unrecognized-form-feminine-neuter-plural":"finlandezele"}},{"word":"finlandez","pos":"noun","definitions":["Finnish man"],"pronunciation":"[fin.lanˈdez]","forms":{"plural":"finlandezi","feminine":"equivalent finlandeză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finlandez","accusative-definite-nominative-singular":"finlandezul","accusative-indefinite-nominative-plural":"finlandezi","accusative-definite-nominative-plural":"finlandezii","dative-genitive-indefinite-singular":"finlandez","dative-definite-genitive-singular":"finlandezului","dative-genitive-indefinite-plural":"finlandezi","dative-definite-genitive-plural":"finlandezilor","singular-vocative":"finlandezule","plural-vocative":"finlandezilor"}},{"word":"finlandeză","pos":"adj","definitions":["nominative/accusative feminine singular of finlandez"],"pronunciation":"[fin.lanˈde.zə]"},{"word":"finlandeză","pos":"noun","definitions":["a Finnish woman"],"pronunciation":"[fin.lanˈde.zə]","forms":{"plural":"finlandeze","masculine":"equivalent finlandez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"finlandeză","accusative-definite-nominative-singular":"finlandeza","accusative-indefinite-nominative-plural":"finlandeze","accusative-definite-nominative-plural":"finlandezele","dative-genitive-indefinite-singular":"finlandeze","dative-definite-genitive-singular":"finlandezei","dative-genitive-indefinite-plural":"finlandeze","dative-definite-genitive-plural":"finlandezelor","singular-vocative":"finlandeză","plural-vocative":"finlandezelor"}},{"word":"finlandeză","pos":"noun","definitions":["Finnish (language)"],"pronunciation":"[fin.lanˈde.zə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"finlandeză","accusative-definite-nominative":"finlandeza","dative-genitive-indefinite":"finlandeze","dative-definite-genitive":"finlandezei","vocative":"finlandeză"}},{"word":"fino-ugric","pos":"adj","definitions":["Finno-Ugric"],"forms":{"feminine-singular":"fino-ugrică","masculine-plural":"fino-ugrici","feminine-neuter-plural":"fino-ugrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fino-ugric","error-unrecognized-form-feminine-indefinite-singular":"fino-ugrică","error-unrecognized-form-indefinite-masculine-plural":"fino-ugrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fino-ugrice","definite-error-unrecognized-form-masculine-neuter-singular":"fino-ugricul","definite-error-unrecognized-form-feminine-singular":"fino-ugrica","definite-error-unrecognized-form-masculine-plural":"fino-ugricii","definite-error-unrecognized-form-feminine-neuter-plural":"fino-ugricele"}},{"word":"Finta Mare","pos":"name","definitions":["a village in Finta, Dâmbovița County, Romania"],"gender":"f"},{"word":"Finta Veche","pos":"name","definitions":["a village in Finta, Dâmbovița County, Romania"],"gender":"f"},{"word":"Finteșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Finteșteanu"}},{"word":"Fințești","pos":"name","definitions":["a village in Năeni, Buzău County, Romania"],"gender":"m"},{"word":"Finteușu Mare","pos":"name","definitions":["a village in Șomcuta Mare, Maramureș County, Romania"],"gender":"m"},{"word":"Finteușu Mic","pos":"name","definitions":["a village in Satulung, Maramureș County, Romania"],"gender":"m"},{"word":"Fîntînă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fîntînă"}},{"word":"Fîntîna Albă","pos":"name","definitions":["a village in Parcova, Edineț Raion, Moldova"],"gender":"f"},{"word":"Fîntînariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fîntînariu"}},{"word":"Fîntînaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fîntînaru"}},{"word":"Fîntîneru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fîntîneru"}},{"word":"Fîntînița","pos":"name","definitions":["a village in Fîntînița, Drochia Raion, Moldova","a commune of Drochia Raion, Moldova"],"gender":"f"},{"word":"Fîntînoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fîntînoiu"}},{"word":"finuc","pos":"noun","definitions":["diminutive of fin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"finuc","accusative-definite-nominative":"finucul","dative-genitive-indefinite":"finuc","dative-definite-genitive":"finucului","vocative":"finucule"}},{"word":"finuț","pos":"noun","definitions":["diminutive of fin"],"forms":{"plural":"finuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"finuț","accusative-definite-nominative-singular":"finuțul","accusative-indefinite-nominative-plural":"finuți","accusative-definite-nominative-plural":"finuții","dative-genitive-indefinite-singular":"finuț","dative-definite-genitive-singular":"finuțului","dative-genitive-indefinite-plural":"finuți","dative-definite-genitive-plural":"finuților","singular-vocative":"finuțule","plural-vocative":"finuților"}},{"word":"fioc","pos":"noun","definitions":["drawer"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"fioc","accusative-definite-nominative":"fiocul","dative-genitive-indefinite":"fioc","dative-definite-genitive":"fiocului","vocative":"fiocule"}},{"word":"fiolă","pos":"noun","definitions":["vial"],"forms":{"plural":"fiole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiolă","accusative-definite-nominative-singular":"fiola","accusative-indefinite-nominative-plural":"fiole","accusative-definite-nominative-plural":"fiolele","dative-genitive-indefinite-singular":"fiole","dative-definite-genitive-singular":"fiolei","dative-genitive-indefinite-plural":"fiole","dative-definite-genitive-plural":"fiolelor","singular-vocative":"fiolă","plural-vocative":"fiolelor"}},{"word":"fionc","pos":"noun","definitions":["alternative form of fiong"],"forms":{"plural":"fioncuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fionc","accusative-definite-nominative-singular":"fioncul","accusative-indefinite-nominative-plural":"fioncuri","accusative-definite-nominative-plural":"fioncurile","dative-genitive-indefinite-singular":"fionc","dative-definite-genitive-singular":"fioncului","dative-genitive-indefinite-plural":"fioncuri","dative-definite-genitive-plural":"fioncurilor","singular-vocative":"fioncule","plural-vocative":"fioncurilor"}},{"word":"fior","pos":"noun","definitions":["shudder, shiver","wince","thrill"],"forms":{"plural":"fiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fior","accusative-definite-nominative-singular":"fiorul","accusative-indefinite-nominative-plural":"fiori","accusative-definite-nominative-plural":"fiorii","dative-genitive-indefinite-singular":"fior","dative-definite-genitive-singular":"fiorului","dative-genitive-indefinite-plural":"fiori","dative-definite-genitive-plural":"fiorilor","singular-vocative":"fiorule","plural-vocative":"fiorilor"}},{"word":"fiord","pos":"noun","definitions":["fjord"],"forms":{"plural":"fiorduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fiord","accusative-definite-nominative-singular":"fiordul","accusative-indefinite-nominative-plural":"fiorde","accusative-definite-nominative-plural":"fiordele","dative-genitive-indefinite-singular":"fiord","dative-definite-genitive-singular":"fiordului","dative-genitive-indefinite-plural":"fiorde","dative-definite-genitive-plural":"fiordelor","singular-vocative":"fiordule","plural-vocative":"fiordelor"}},{"word":"fiori","pos":"noun","definitions":["indefinite plural of fior"],"pronunciation":"[fiˈorʲ]","gender":"m"},{"word":"fiorii","pos":"noun","definitions":["definite nominative/accusative plural of fior"],"pronunciation":"[fiˈorij]","gender":"m"},{"word":"fiorin","pos":"noun","definitions":["alternative form of florin"],"forms":{"plural":"fiorini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiorin","accusative-definite-nominative-singular":"fiorinul","accusative-indefinite-nominative-plural":"fiorini","accusative-definite-nominative-plural":"fiorinii","dative-genitive-indefinite-singular":"fiorin","dative-definite-genitive-singular":"fiorinului","dative-genitive-indefinite-plural":"fiorini","dative-definite-genitive-plural":"fiorinilor","singular-vocative":"fiorinule","plural-vocative":"fiorinilor"}},{"word":"fiorint","pos":"noun","definitions":["alternative form of florin"],"forms":{"plural":"fiorinți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiorint","accusative-definite-nominative-singular":"fiorintul","accusative-indefinite-nominative-plural":"fiorinți","accusative-definite-nominative-plural":"fiorinții","dative-genitive-indefinite-singular":"fiorint","dative-definite-genitive-singular":"fiorintului","dative-genitive-indefinite-plural":"fiorinți","dative-definite-genitive-plural":"fiorinților","singular-vocative":"fiorintule","plural-vocative":"fiorinților"}},{"word":"fioritură","pos":"noun","definitions":["fioritura"],"forms":{"plural":"fiorituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fioritură","accusative-definite-nominative-singular":"fioritura","accusative-indefinite-nominative-plural":"fiorituri","accusative-definite-nominative-plural":"fioriturile","dative-genitive-indefinite-singular":"fiorituri","dative-definite-genitive-singular":"fioriturii","dative-genitive-indefinite-plural":"fiorituri","dative-definite-genitive-plural":"fioriturilor","singular-vocative":"fioritură","plural-vocative":"fioriturilor"}},{"word":"fioros","pos":"adj","definitions":["fierce"],"forms":{"feminine-singular":"fioroasă","masculine-plural":"fioroși","feminine-neuter-plural":"fioroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fioros","error-unrecognized-form-feminine-indefinite-singular":"fioroasă","error-unrecognized-form-indefinite-masculine-plural":"fioroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fioroase","definite-error-unrecognized-form-masculine-neuter-singular":"fiorosul","definite-error-unrecognized-form-feminine-singular":"fioroasa","definite-error-unrecognized-form-masculine-plural":"fioroșii","definite-error-unrecognized-form-feminine-neuter-plural":"fioroasele"}},{"word":"Fir","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fir"}},{"word":"fir","pos":"noun","definitions":["thread, string, filament, wire","a hair"],"pronunciation":"/fir/","forms":{"plural":"fire"}},{"word":"Firănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Firănescu"}},{"word":"firang","pos":"noun","definitions":["curtain"],"forms":{"plural":"firanguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"firang","accusative-definite-nominative-singular":"firangul","accusative-indefinite-nominative-plural":"firanguri","accusative-definite-nominative-plural":"firangurile","dative-genitive-indefinite-singular":"firang","dative-definite-genitive-singular":"firangului","dative-genitive-indefinite-plural":"firanguri","dative-definite-genitive-plural":"firangurilor","singular-vocative":"firangule","plural-vocative":"firangurilor","alternative":"firhang"}},{"word":"firanguri","pos":"noun","definitions":["plural of firang"]},{"word":"firav","pos":"adj","definitions":["weak, frail, feeble"],"pronunciation":"/fiˈrav/","forms":{"feminine-singular":"firavă","masculine-plural":"firavi","feminine-neuter-plural":"firave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"firav","error-unrecognized-form-feminine-indefinite-singular":"firavă","error-unrecognized-form-indefinite-masculine-plural":"firavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"firave","definite-error-unrecognized-form-masculine-neuter-singular":"firavul","definite-error-unrecognized-form-feminine-singular":"firava","definite-error-unrecognized-form-masculine-plural":"firavii","definite-error-unrecognized-form-feminine-neuter-plural":"firavele"}},{"word":"fire","pos":"noun","definitions":["plural of fir"],"pronunciation":"/ˈfi.re/","gender":"n"},{"word":"fire","pos":"noun","definitions":["essence, substance, nature","character, temper, disposition","mind"],"pronunciation":"/ˈfi.re/","forms":{"plural":"firi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fire","accusative-definite-nominative-singular":"firea","accusative-indefinite-nominative-plural":"firi","accusative-definite-nominative-plural":"firile","dative-genitive-indefinite-singular":"firi","dative-definite-genitive-singular":"firii","dative-genitive-indefinite-plural":"firi","dative-definite-genitive-plural":"firilor","singular-vocative":"fire","plural-vocative":"firilor"}},{"word":"firească","pos":"adj","definitions":["feminine singular of firesc"],"pronunciation":"/fiˈre̯as.kə/","gender":"f"},{"word":"fireo","pos":"noun","definitions":["vocative singular of fire"],"pronunciation":"/ˈfi.re̯o/","gender":"f"},{"word":"fireș","pos":"adj","definitions":["natural"],"forms":{"feminine-singular":"fireșă","masculine-plural":"fireși","feminine-neuter-plural":"fireșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fireș","error-unrecognized-form-feminine-indefinite-singular":"fireșă","error-unrecognized-form-indefinite-masculine-plural":"fireși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fireșe","definite-error-unrecognized-form-masculine-neuter-singular":"fireșul","definite-error-unrecognized-form-feminine-singular":"fireșa","definite-error-unrecognized-form-masculine-plural":"fireșii","definite-error-unrecognized-form-feminine-neuter-plural":"fireșele"}},{"word":"firesc","pos":"adj","definitions":["natural","normal"],"pronunciation":"/fiˈresk/","forms":{"feminine-singular":"firească","plural":"firești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"firesc","error-unrecognized-form-feminine-indefinite-singular":"firească","error-unrecognized-form-indefinite-masculine-plural":"firești","error-unrecognized-form-feminine-indefinite-neuter-plural":"firești","definite-error-unrecognized-form-masculine-neuter-singular":"firescul","definite-error-unrecognized-form-feminine-singular":"fireasca","definite-error-unrecognized-form-masculine-plural":"fireștii","definite-error-unrecognized-form-feminine-neuter-plural":"fireștile"}},{"word":"firesc","pos":"noun","definitions":["naturalness"],"pronunciation":"/fiˈresk/","forms":{"plural":"firești"}},{"word":"Firescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Firescu"}},{"word":"firește","pos":"adv","definitions":["of course"],"pronunciation":"/fiˈreʃ.te/"},{"word":"Firești","pos":"name","definitions":["a village in Bunești, Vâlcea County, Romania"],"gender":"m"},{"word":"firești","pos":"adj","definitions":["plural of firesc"],"pronunciation":"/fiˈreʃtʲ/"},{"word":"firetic","pos":"adj","definitions":["of an angry disposition, choleric, furious"],"pronunciation":"/fiˈre.tik/","forms":{"feminine-singular":"firetică","masculine-plural":"firetici","feminine-neuter-plural":"firetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"firetic","error-unrecognized-form-feminine-indefinite-singular":"firetică","error-unrecognized-form-indefinite-masculine-plural":"firetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"firetice","definite-error-unrecognized-form-masculine-neuter-singular":"fireticul","definite-error-unrecognized-form-feminine-singular":"firetica","definite-error-unrecognized-form-masculine-plural":"fireticii","definite-error-unrecognized-form-feminine-neuter-plural":"fireticele"}},{"word":"firez","pos":"noun","definitions":["alternative form of firiz"],"forms":{"plural":"firezuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"firez","accusative-definite-nominative-singular":"firezul","accusative-indefinite-nominative-plural":"firezuri","accusative-definite-nominative-plural":"firezurile","dative-genitive-indefinite-singular":"firez","dative-definite-genitive-singular":"firezului","dative-genitive-indefinite-plural":"firezuri","dative-definite-genitive-plural":"firezurilor","singular-vocative":"firezule","plural-vocative":"firezurilor"}},{"word":"Firezar","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Firezar"}},{"word":"firezar","pos":"noun","definitions":["Rhynchites cupreus"],"forms":{"plural":"firezari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"firezar","accusative-definite-nominative-singular":"firezarul","accusative-indefinite-nominative-plural":"firezari","accusative-definite-nominative-plural":"firezarii","dative-genitive-indefinite-singular":"firezar","dative-definite-genitive-singular":"firezarului","dative-genitive-indefinite-plural":"firezari","dative-definite-genitive-plural":"firezarilor","singular-vocative":"firezarule","plural-vocative":"firezarilor"}},{"word":"firfiric","pos":"noun","definitions":["small silver coin"],"forms":{"plural":"firfirici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"firfiric","accusative-definite-nominative-singular":"firfiricul","accusative-indefinite-nominative-plural":"firfirici","accusative-definite-nominative-plural":"firfiricii","dative-genitive-indefinite-singular":"firfiric","dative-definite-genitive-singular":"firfiricului","dative-genitive-indefinite-plural":"firfirici","dative-definite-genitive-plural":"firfiricilor","singular-vocative":"firfiricule","plural-vocative":"firfiricilor"}},{"word":"firfirică","pos":"noun","definitions":["alternative form of firfiric"],"forms":{"plural":"firfirici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"firfirică","accusative-definite-nominative-singular":"firfirica","accusative-indefinite-nominative-plural":"firfirici","accusative-definite-nominative-plural":"firfiricile","dative-genitive-indefinite-singular":"firfirici","dative-definite-genitive-singular":"firfiricii","dative-genitive-indefinite-plural":"firfirici","dative-definite-genitive-plural":"firfiricilor","singular-vocative":"firfirică","plural-vocative":"firfiricilor"}},{"word":"firfirig","pos":"noun","definitions":["alternative form of firfiric"],"forms":{"plural":"firfirigi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"firfirig","accusative-definite-nominative-singular":"firfirigul","accusative-indefinite-nominative-plural":"firfirigi","accusative-definite-nominative-plural":"firfirigii","dative-genitive-indefinite-singular":"firfirig","dative-definite-genitive-singular":"firfirigului","dative-genitive-indefinite-plural":"firfirigi","dative-definite-genitive-plural":"firfirigilor","singular-vocative":"firfirigule","plural-vocative":"firfirigilor"}},{"word":"firi","pos":"noun","definitions":["inflection of fire:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[firʲ]","gender":"f"},{"word":"Firicel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Firicel"}},{"word":"firicel","pos":"noun","definitions":["diminutive of fir; small thread"],"forms":{"plural":"firicele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firicel","accusative-definite-nominative-singular":"firicelul","accusative-indefinite-nominative-plural":"firicele","accusative-definite-nominative-plural":"firicelele","dative-genitive-indefinite-singular":"firicel","dative-definite-genitive-singular":"firicelului","dative-genitive-indefinite-plural":"firicele","dative-definite-genitive-plural":"firicelelor","singular-vocative":"firicelule","plural-vocative":"firicelelor"}},{"word":"firicică","pos":"noun","definitions":["common cudweed (Filago vulgaris)"],"forms":{"plural":"firicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"firicică","accusative-definite-nominative-singular":"firicica","accusative-indefinite-nominative-plural":"firicele","accusative-definite-nominative-plural":"firicelele","dative-genitive-indefinite-singular":"firicele","dative-definite-genitive-singular":"firicelei","dative-genitive-indefinite-plural":"firicele","dative-definite-genitive-plural":"firicelelor","singular-vocative":"firicică","plural-vocative":"firicelelor"}},{"word":"Firicioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Firicioiu"}},{"word":"firida","pos":"noun","definitions":["definite nominative/accusative singular of firidă"],"pronunciation":"[fiˈrida]","gender":"f"},{"word":"firidă","pos":"noun","definitions":["niche, recess (in a wall), alcove"],"forms":{"plural":"firide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"firidă","accusative-definite-nominative-singular":"firida","accusative-indefinite-nominative-plural":"firide","accusative-definite-nominative-plural":"firidele","dative-genitive-indefinite-singular":"firide","dative-definite-genitive-singular":"firidei","dative-genitive-indefinite-plural":"firide","dative-definite-genitive-plural":"firidelor","singular-vocative":"firidă","plural-vocative":"firidelor"}},{"word":"firii","pos":"noun","definitions":["definite genitive/dative singular of fire"],"pronunciation":"[ˈfirij]","gender":"f"},{"word":"firimitură","pos":"noun","definitions":["crumb"],"forms":{"plural":"firimituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"firimitură","accusative-definite-nominative-singular":"firimitura","accusative-indefinite-nominative-plural":"firimituri","accusative-definite-nominative-plural":"firimiturile","dative-genitive-indefinite-singular":"firimituri","dative-definite-genitive-singular":"firimiturii","dative-genitive-indefinite-plural":"firimituri","dative-definite-genitive-plural":"firimiturilor","singular-vocative":"firimitură","plural-vocative":"firimiturilor"}},{"word":"firișcă","pos":"noun","definitions":["alternative form of firușcă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"firișcă","accusative-definite-nominative":"firișca","dative-genitive-indefinite":"firișce","dative-definite-genitive":"firișcei","vocative":"firișcă"}},{"word":"firișor","pos":"noun","definitions":["diminutive of fir; small thread"],"forms":{"plural":"firișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firișor","accusative-definite-nominative-singular":"firișorul","accusative-indefinite-nominative-plural":"firișore","accusative-definite-nominative-plural":"firișorele","dative-genitive-indefinite-singular":"firișor","dative-definite-genitive-singular":"firișorului","dative-genitive-indefinite-plural":"firișore","dative-definite-genitive-plural":"firișorelor","singular-vocative":"firișorule","plural-vocative":"firișorelor"}},{"word":"Firiteaz","pos":"name","definitions":["a village in Șagu, Arad County, Romania"],"gender":"m"},{"word":"firitisi","pos":"verb","definitions":["to alternative form of hiritisi"],"forms":{"canonical":"a firitisi 4th conjugation","present-singular-third-person":"firitisește","participle-past":"firitisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a firitisi","gerund":"firitisind","first-person-indicative-present-singular":"firitisesc","indicative-present-second-person-singular":"firitisești","indicative-present-singular-third-person":"firitisește","first-person-indicative-plural-present":"firitisim","indicative-plural-present-second-person":"firitisiți","indicative-plural-present-third-person":"firitisesc","first-person-imperfect-indicative-singular":"firitiseam","imperfect-indicative-second-person-singular":"firitiseai","imperfect-indicative-singular-third-person":"firitisea","first-person-imperfect-indicative-plural":"firitiseam","imperfect-indicative-plural-second-person":"firitiseați","imperfect-indicative-plural-third-person":"firitiseau","first-person-indicative-perfect-singular":"firitisii","indicative-perfect-second-person-singular":"firitisiși","indicative-perfect-singular-third-person":"firitisi","first-person-indicative-perfect-plural":"firitisirăm","indicative-perfect-plural-second-person":"firitisirăți","indicative-perfect-plural-third-person":"firitisiră","first-person-indicative-pluperfect-singular":"firitisisem","indicative-pluperfect-second-person-singular":"firitisiseși","indicative-pluperfect-singular-third-person":"firitisise","first-person-indicative-pluperfect-plural":"firitisiserăm","indicative-pluperfect-plural-second-person":"firitisiserăți","indicative-pluperfect-plural-third-person":"firitisiseră","first-person-present-singular-subjunctive":"să firitisesc","present-second-person-singular-subjunctive":"să firitisești","present-singular-subjunctive-third-person":"să firitisească","first-person-plural-present-subjunctive":"să firitisim","plural-present-second-person-subjunctive":"să firitisiți","plural-present-subjunctive-third-person":"să firitisească","imperative-second-person-singular":"firitisește","imperative-plural-second-person":"firitisiți","imperative-negative-second-person-singular":"nu firitisi","imperative-negative-plural-second-person":"nu firitisiți"}},{"word":"firiz","pos":"noun","definitions":["handsaw"],"forms":{"plural":"firize","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firiz","accusative-definite-nominative-singular":"firizul","accusative-indefinite-nominative-plural":"firize","accusative-definite-nominative-plural":"firizele","dative-genitive-indefinite-singular":"firiz","dative-definite-genitive-singular":"firizului","dative-genitive-indefinite-plural":"firize","dative-definite-genitive-plural":"firizelor","singular-vocative":"firizule","plural-vocative":"firizelor"}},{"word":"Firiza","pos":"name","definitions":["a locality in Baia Mare, Maramureș County, Romania"],"gender":"f"},{"word":"Firizu","pos":"name","definitions":["a village in Ilovăț, Mehedinți County, Romania"],"gender":"m"},{"word":"Fîrlădenii Noi","pos":"name","definitions":["a village in Fîrlădeni, Căușeni Raion, Moldova"],"gender":"m"},{"word":"firma","pos":"noun","definitions":["definite nominative/accusative singular of firmă"],"gender":"f"},{"word":"firmă","pos":"noun","definitions":["company","shop sign"],"forms":{"plural":"firme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"firmă","accusative-definite-nominative-singular":"firma","accusative-indefinite-nominative-plural":"firme","accusative-definite-nominative-plural":"firmele","dative-genitive-indefinite-singular":"firme","dative-definite-genitive-singular":"firmei","dative-genitive-indefinite-plural":"firme","dative-definite-genitive-plural":"firmelor","singular-vocative":"firmă","plural-vocative":"firmelor"}},{"word":"firmament","pos":"noun","definitions":["firmament"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"firmament","accusative-definite-nominative":"firmamentul","dative-genitive-indefinite":"firmament","dative-definite-genitive":"firmamentului","vocative":"firmamentule"}},{"word":"Firman","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Firman"}},{"word":"firman","pos":"noun","definitions":["firman"],"forms":{"plural":"firmane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firman","accusative-definite-nominative-singular":"firmanul","accusative-indefinite-nominative-plural":"firmane","accusative-definite-nominative-plural":"firmanele","dative-genitive-indefinite-singular":"firman","dative-definite-genitive-singular":"firmanului","dative-genitive-indefinite-plural":"firmane","dative-definite-genitive-plural":"firmanelor","singular-vocative":"firmanule","plural-vocative":"firmanelor"}},{"word":"firmănaș","pos":"noun","definitions":["diminutive of firman"],"forms":{"plural":"firmănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firmănaș","accusative-definite-nominative-singular":"firmănașul","accusative-indefinite-nominative-plural":"firmănașe","accusative-definite-nominative-plural":"firmănașele","dative-genitive-indefinite-singular":"firmănaș","dative-definite-genitive-singular":"firmănașului","dative-genitive-indefinite-plural":"firmănașe","dative-definite-genitive-plural":"firmănașelor","singular-vocative":"firmănașule","plural-vocative":"firmănașelor"}},{"word":"Firminiș","pos":"name","definitions":["a village in Mirșid, Sălaj County, Romania"],"gender":"m"},{"word":"firmitură","pos":"noun","definitions":["alternative form of firimitură"],"forms":{"plural":"firmituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"firmitură","accusative-definite-nominative-singular":"firmitura","accusative-indefinite-nominative-plural":"firmituri","accusative-definite-nominative-plural":"firmiturile","dative-genitive-indefinite-singular":"firmituri","dative-definite-genitive-singular":"firmiturii","dative-genitive-indefinite-plural":"firmituri","dative-definite-genitive-plural":"firmiturilor","singular-vocative":"firmitură","plural-vocative":"firmiturilor"}},{"word":"firmuliță","pos":"noun","definitions":["diminutive of firmă; small company"],"forms":{"plural":"firmulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"firmuliță","accusative-definite-nominative-singular":"firmulița","accusative-indefinite-nominative-plural":"firmulițe","accusative-definite-nominative-plural":"firmulițele","dative-genitive-indefinite-singular":"firmulițe","dative-definite-genitive-singular":"firmuliței","dative-genitive-indefinite-plural":"firmulițe","dative-definite-genitive-plural":"firmulițelor","singular-vocative":"firmuliță","plural-vocative":"firmulițelor"}},{"word":"firnis","pos":"noun","definitions":["varnish"],"forms":{"plural":"firnisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"firnis","accusative-definite-nominative-singular":"firnisul","accusative-indefinite-nominative-plural":"firnisuri","accusative-definite-nominative-plural":"firnisurile","dative-genitive-indefinite-singular":"firnis","dative-definite-genitive-singular":"firnisului","dative-genitive-indefinite-plural":"firnisuri","dative-definite-genitive-plural":"firnisurilor","singular-vocative":"firnisule","plural-vocative":"firnisurilor"}},{"word":"firobuz","pos":"noun","definitions":["trolley bus"],"forms":{"plural":"firobuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firobuz","accusative-definite-nominative-singular":"firobuzul","accusative-indefinite-nominative-plural":"firobuze","accusative-definite-nominative-plural":"firobuzele","dative-genitive-indefinite-singular":"firobuz","dative-definite-genitive-singular":"firobuzului","dative-genitive-indefinite-plural":"firobuze","dative-definite-genitive-plural":"firobuzelor","singular-vocative":"firobuzule","plural-vocative":"firobuzelor"}},{"word":"Firoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Firoiu"}},{"word":"firos","pos":"adj","definitions":["thready"],"forms":{"feminine-singular":"firoasă","masculine-plural":"firoși","feminine-neuter-plural":"firoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"firos","error-unrecognized-form-feminine-indefinite-singular":"firoasă","error-unrecognized-form-indefinite-masculine-plural":"firoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"firoase","definite-error-unrecognized-form-masculine-neuter-singular":"firosul","definite-error-unrecognized-form-feminine-singular":"firoasa","definite-error-unrecognized-form-masculine-plural":"firoșii","definite-error-unrecognized-form-feminine-neuter-plural":"firoasele"}},{"word":"firoscoasă","pos":"noun","definitions":["female equivalent of firoscos"],"forms":{"plural":"firoscoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"firoscoasă","accusative-definite-nominative-singular":"firoscoasa","accusative-indefinite-nominative-plural":"firoscoase","accusative-definite-nominative-plural":"firoscoasele","dative-genitive-indefinite-singular":"firoscoase","dative-definite-genitive-singular":"firoscoasei","dative-genitive-indefinite-plural":"firoscoase","dative-definite-genitive-plural":"firoscoaselor","singular-vocative":"firoscoasă","plural-vocative":"firoscoaselor"}},{"word":"Firtănuș","pos":"name","definitions":["a village in Avrămești, Harghita County, Romania"],"gender":"m"},{"word":"Fîrtat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fîrtat"}},{"word":"Firtușu","pos":"name","definitions":["a village in Lupeni, Harghita County, Romania"],"gender":"m"},{"word":"Firu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Firu"}},{"word":"Firulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Firulescu"}},{"word":"firușor","pos":"noun","definitions":["diminutive of fir"],"forms":{"plural":"firușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"firușor","accusative-definite-nominative-singular":"firușorul","accusative-indefinite-nominative-plural":"firușori","accusative-definite-nominative-plural":"firușorii","dative-genitive-indefinite-singular":"firușor","dative-definite-genitive-singular":"firușorului","dative-genitive-indefinite-plural":"firușori","dative-definite-genitive-plural":"firușorilor","singular-vocative":"firușorule","plural-vocative":"firușorilor"}},{"word":"Firuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Firuț"}},{"word":"firuț","pos":"noun","definitions":["diminutive of fir; small thread"],"forms":{"plural":"firuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"firuț","accusative-definite-nominative-singular":"firuțul","accusative-indefinite-nominative-plural":"firuțe","accusative-definite-nominative-plural":"firuțele","dative-genitive-indefinite-singular":"firuț","dative-definite-genitive-singular":"firuțului","dative-genitive-indefinite-plural":"firuțe","dative-definite-genitive-plural":"firuțelor","singular-vocative":"firuțule","plural-vocative":"firuțelor"}},{"word":"fisă","pos":"noun","definitions":["token","coin"],"forms":{"plural":"fise","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fisă","accusative-definite-nominative-singular":"fisa","accusative-indefinite-nominative-plural":"fise","accusative-definite-nominative-plural":"fisele","dative-genitive-indefinite-singular":"fise","dative-definite-genitive-singular":"fisei","dative-genitive-indefinite-plural":"fise","dative-definite-genitive-plural":"fiselor","singular-vocative":"fisă","plural-vocative":"fiselor"}},{"word":"fișă","pos":"noun","definitions":["file (in a file system of a library, a hospital, etc.)","plug"],"forms":{"plural":"fișe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fișă","accusative-definite-nominative-singular":"fișa","accusative-indefinite-nominative-plural":"fișe","accusative-definite-nominative-plural":"fișele","dative-genitive-indefinite-singular":"fișe","dative-definite-genitive-singular":"fișei","dative-genitive-indefinite-plural":"fișe","dative-definite-genitive-plural":"fișelor","singular-vocative":"fișă","plural-vocative":"fișelor"}},{"word":"fîsă","pos":"noun","definitions":["Formerly standard spelling of fâsă which was introduced in 1953 and deprecated in 1993."],"forms":{"plural":"fîse"}},{"word":"Fișag","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Olt"],"gender":"m"},{"word":"fișat","pos":"adj","definitions":["filed, archived"],"forms":{"feminine-singular":"fișată","masculine-plural":"fișați","feminine-neuter-plural":"fișate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fișat","error-unrecognized-form-feminine-indefinite-singular":"fișată","error-unrecognized-form-indefinite-masculine-plural":"fișați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fișate","definite-error-unrecognized-form-masculine-neuter-singular":"fișatul","definite-error-unrecognized-form-feminine-singular":"fișata","definite-error-unrecognized-form-masculine-plural":"fișații","definite-error-unrecognized-form-feminine-neuter-plural":"fișatele"}},{"word":"fișat","pos":"verb","definitions":["past participle of fișa"],"forms":{"participle-past":"of fișa"}},{"word":"fisc","pos":"noun","definitions":["fiscal administration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fisc","accusative-definite-nominative":"fiscul","dative-genitive-indefinite":"fisc","dative-definite-genitive":"fiscului","vocative":"fiscule"}},{"word":"fiscal","pos":"adj","definitions":["fiscal"],"forms":{"feminine-singular":"fiscală","masculine-plural":"fiscali","feminine-neuter-plural":"fiscale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiscal","error-unrecognized-form-feminine-indefinite-singular":"fiscală","error-unrecognized-form-indefinite-masculine-plural":"fiscali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiscale","definite-error-unrecognized-form-masculine-neuter-singular":"fiscalul","definite-error-unrecognized-form-feminine-singular":"fiscala","definite-error-unrecognized-form-masculine-plural":"fiscalii","definite-error-unrecognized-form-feminine-neuter-plural":"fiscalele"}},{"word":"Fișcăleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fișcăleanu"}},{"word":"Fișcălia","pos":"name","definitions":["a village in Ionești, Vâlcea County, Romania"],"gender":"f"},{"word":"fiscalism","pos":"noun","definitions":["fiscalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fiscalism","accusative-definite-nominative":"fiscalismul","dative-genitive-indefinite":"fiscalism","dative-definite-genitive":"fiscalismului","vocative":"fiscalismule"}},{"word":"fiscalitate","pos":"noun","definitions":["fiscality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fiscalitate","accusative-definite-nominative-singular":"fiscalitatea","accusative-indefinite-nominative-plural":"fiscalități","accusative-definite-nominative-plural":"fiscalitățile","dative-genitive-indefinite-singular":"fiscalități","dative-definite-genitive-singular":"fiscalității","dative-genitive-indefinite-plural":"fiscalități","dative-definite-genitive-plural":"fiscalităților","singular-vocative":"fiscalitate","plural-vocative":"fiscalităților"}},{"word":"fiscaliza","pos":"verb","definitions":["to tax"],"forms":{"canonical":"a fiscaliza 1st conjugation","present-singular-third-person":"fiscalizează","participle-past":"fiscalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fiscaliza","gerund":"fiscalizând","first-person-indicative-present-singular":"fiscalizez","indicative-present-second-person-singular":"fiscalizezi","indicative-present-singular-third-person":"fiscalizează","first-person-indicative-plural-present":"fiscalizăm","indicative-plural-present-second-person":"fiscalizați","indicative-plural-present-third-person":"fiscalizează","first-person-imperfect-indicative-singular":"fiscalizam","imperfect-indicative-second-person-singular":"fiscalizai","imperfect-indicative-singular-third-person":"fiscaliza","first-person-imperfect-indicative-plural":"fiscalizam","imperfect-indicative-plural-second-person":"fiscalizați","imperfect-indicative-plural-third-person":"fiscalizau","first-person-indicative-perfect-singular":"fiscalizai","indicative-perfect-second-person-singular":"fiscalizași","indicative-perfect-singular-third-person":"fiscaliză","first-person-indicative-perfect-plural":"fiscalizarăm","indicative-perfect-plural-second-person":"fiscalizarăți","indicative-perfect-plural-third-person":"fiscalizară","first-person-indicative-pluperfect-singular":"fiscalizasem","indicative-pluperfect-second-person-singular":"fiscalizaseși","indicative-pluperfect-singular-third-person":"fiscalizase","first-person-indicative-pluperfect-plural":"fiscalizaserăm","indicative-pluperfect-plural-second-person":"fiscalizaserăți","indicative-pluperfect-plural-third-person":"fiscalizaseră","first-person-present-singular-subjunctive":"să fiscalizez","present-second-person-singular-subjunctive":"să fiscalizezi","present-singular-subjunctive-third-person":"să fiscalizeze","first-person-plural-present-subjunctive":"să fiscalizăm","plural-present-second-person-subjunctive":"să fiscalizați","plural-present-subjunctive-third-person":"să fiscalizeze","imperative-second-person-singular":"fiscalizează","imperative-plural-second-person":"fiscalizați","imperative-negative-second-person-singular":"nu fiscaliza","imperative-negative-plural-second-person":"nu fiscalizați"}},{"word":"fiscalizare","pos":"noun","definitions":["fiscalization"],"forms":{"plural":"fiscalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fiscalizare","accusative-definite-nominative-singular":"fiscalizarea","accusative-indefinite-nominative-plural":"fiscalizări","accusative-definite-nominative-plural":"fiscalizările","dative-genitive-indefinite-singular":"fiscalizări","dative-definite-genitive-singular":"fiscalizării","dative-genitive-indefinite-plural":"fiscalizări","dative-definite-genitive-plural":"fiscalizărilor","singular-vocative":"fiscalizare","plural-vocative":"fiscalizărilor"}},{"word":"fiscalizat","pos":"adj","definitions":["taxed"],"forms":{"feminine-singular":"fiscalizată","masculine-plural":"fiscalizați","feminine-neuter-plural":"fiscalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiscalizat","error-unrecognized-form-feminine-indefinite-singular":"fiscalizată","error-unrecognized-form-indefinite-masculine-plural":"fiscalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiscalizate","definite-error-unrecognized-form-masculine-neuter-singular":"fiscalizatul","definite-error-unrecognized-form-feminine-singular":"fiscalizata","definite-error-unrecognized-form-masculine-plural":"fiscalizații","definite-error-unrecognized-form-feminine-neuter-plural":"fiscalizatele"}},{"word":"fiscalizat","pos":"verb","definitions":["past participle of fiscaliza"],"forms":{"participle-past":"of fiscaliza"}},{"word":"Fiscencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Fiscencu"}},{"word":"Fiscut","pos":"name","definitions":["a village in Șagu, Arad County, Romania"],"gender":"m"},{"word":"Fiscutean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fiscutean"}},{"word":"Fiscuteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fiscuteanu"}},{"word":"Fișer","pos":"name","definitions":["a locality in Rupea, Brașov County, Romania"],"gender":"m"},{"word":"fisibilitate","pos":"noun","definitions":["fissibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fisibilitate","accusative-definite-nominative-singular":"fisibilitatea","accusative-indefinite-nominative-plural":"fisibilități","accusative-definite-nominative-plural":"fisibilitățile","dative-genitive-indefinite-singular":"fisibilități","dative-definite-genitive-singular":"fisibilității","dative-genitive-indefinite-plural":"fisibilități","dative-definite-genitive-plural":"fisibilităților","singular-vocative":"fisibilitate","plural-vocative":"fisibilităților"}},{"word":"fisic","pos":"adj","definitions":["obsolete form of fizic"],"forms":{"feminine-singular":"fisică","masculine-plural":"fisici","feminine-neuter-plural":"fisice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fisic","error-unrecognized-form-feminine-indefinite-singular":"fisică","error-unrecognized-form-indefinite-masculine-plural":"fisici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fisice","definite-error-unrecognized-form-masculine-neuter-singular":"fisicul","definite-error-unrecognized-form-feminine-singular":"fisica","definite-error-unrecognized-form-masculine-plural":"fisicii","definite-error-unrecognized-form-feminine-neuter-plural":"fisicele"}},{"word":"fisic","pos":"noun","definitions":["obsolete form of fizic"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"fisic","accusative-definite-nominative":"fisicul","dative-genitive-indefinite":"fisic","dative-definite-genitive":"fisicului","vocative":"fisicule"}},{"word":"fișic","pos":"noun","definitions":["coin roll"],"forms":{"plural":"fișicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fișic","accusative-definite-nominative-singular":"fișicul","accusative-indefinite-nominative-plural":"fișicuri","accusative-definite-nominative-plural":"fișicurile","dative-genitive-indefinite-singular":"fișic","dative-definite-genitive-singular":"fișicului","dative-genitive-indefinite-plural":"fișicuri","dative-definite-genitive-plural":"fișicurilor","singular-vocative":"fișicule","plural-vocative":"fișicurilor"}},{"word":"Fișici","pos":"name","definitions":["a village in Bozioru, Buzău County, Romania"],"gender":"m"},{"word":"Fîșie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fîșie"}},{"word":"fișier","pos":"noun","definitions":["file (computer terminology)"],"pronunciation":"[fi.ʃiˈer]","forms":{"plural":"fișiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fișier","accusative-definite-nominative-singular":"fișierul","accusative-indefinite-nominative-plural":"fișiere","accusative-definite-nominative-plural":"fișierele","dative-genitive-indefinite-singular":"fișier","dative-definite-genitive-singular":"fișierului","dative-genitive-indefinite-plural":"fișiere","dative-definite-genitive-plural":"fișierelor","singular-vocative":"fișierule","plural-vocative":"fișierelor"}},{"word":"fisiona","pos":"verb","definitions":["to fission"],"forms":{"canonical":"a fisiona 1st conjugation","present-singular-third-person":"fisionează","participle-past":"fisionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fisiona","gerund":"fisionând","first-person-indicative-present-singular":"fisionez","indicative-present-second-person-singular":"fisionezi","indicative-present-singular-third-person":"fisionează","first-person-indicative-plural-present":"fisionăm","indicative-plural-present-second-person":"fisionați","indicative-plural-present-third-person":"fisionează","first-person-imperfect-indicative-singular":"fisionam","imperfect-indicative-second-person-singular":"fisionai","imperfect-indicative-singular-third-person":"fisiona","first-person-imperfect-indicative-plural":"fisionam","imperfect-indicative-plural-second-person":"fisionați","imperfect-indicative-plural-third-person":"fisionau","first-person-indicative-perfect-singular":"fisionai","indicative-perfect-second-person-singular":"fisionași","indicative-perfect-singular-third-person":"fisionă","first-person-indicative-perfect-plural":"fisionarăm","indicative-perfect-plural-second-person":"fisionarăți","indicative-perfect-plural-third-person":"fisionară","first-person-indicative-pluperfect-singular":"fisionasem","indicative-pluperfect-second-person-singular":"fisionaseși","indicative-pluperfect-singular-third-person":"fisionase","first-person-indicative-pluperfect-plural":"fisionaserăm","indicative-pluperfect-plural-second-person":"fisionaserăți","indicative-pluperfect-plural-third-person":"fisionaseră","first-person-present-singular-subjunctive":"să fisionez","present-second-person-singular-subjunctive":"să fisionezi","present-singular-subjunctive-third-person":"să fisioneze","first-person-plural-present-subjunctive":"să fisionăm","plural-present-second-person-subjunctive":"să fisionați","plural-present-subjunctive-third-person":"să fisioneze","imperative-second-person-singular":"fisionează","imperative-plural-second-person":"fisionați","imperative-negative-second-person-singular":"nu fisiona","imperative-negative-plural-second-person":"nu fisionați"}},{"word":"fisionabil","pos":"adj","definitions":["fissionable"],"forms":{"feminine-singular":"fisionabilă","masculine-plural":"fisionabili","feminine-neuter-plural":"fisionabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fisionabil","error-unrecognized-form-feminine-indefinite-singular":"fisionabilă","error-unrecognized-form-indefinite-masculine-plural":"fisionabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fisionabile","definite-error-unrecognized-form-masculine-neuter-singular":"fisionabilul","definite-error-unrecognized-form-feminine-singular":"fisionabila","definite-error-unrecognized-form-masculine-plural":"fisionabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fisionabilele"}},{"word":"fisionare","pos":"noun","definitions":["fission"],"forms":{"plural":"fisionări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fisionare","accusative-definite-nominative-singular":"fisionarea","accusative-indefinite-nominative-plural":"fisionări","accusative-definite-nominative-plural":"fisionările","dative-genitive-indefinite-singular":"fisionări","dative-definite-genitive-singular":"fisionării","dative-genitive-indefinite-plural":"fisionări","dative-definite-genitive-plural":"fisionărilor","singular-vocative":"fisionare","plural-vocative":"fisionărilor"}},{"word":"fișiu","pos":"noun","definitions":["fichu (scarf)"],"forms":{"plural":"fișiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fișiu","accusative-definite-nominative-singular":"fișiul","accusative-indefinite-nominative-plural":"fișiuri","accusative-definite-nominative-plural":"fișiurile","dative-genitive-indefinite-singular":"fișiu","dative-definite-genitive-singular":"fișiului","dative-genitive-indefinite-plural":"fișiuri","dative-definite-genitive-plural":"fișiurilor","singular-vocative":"fișiule","plural-vocative":"fișiurilor"}},{"word":"fisiune","pos":"noun","definitions":["fission"],"forms":{"plural":"fisiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fisiune","accusative-definite-nominative-singular":"fisiunea","accusative-indefinite-nominative-plural":"fisiune","accusative-definite-nominative-plural":"fisiunele","dative-genitive-indefinite-singular":"fisiune","dative-definite-genitive-singular":"fisiunei","dative-genitive-indefinite-plural":"fisiune","dative-definite-genitive-plural":"fisiunelor","singular-vocative":"fisiune","plural-vocative":"fisiunelor"}},{"word":"fisiune binară","pos":"noun","definitions":["binary fission"],"forms":{"plural":"fisiuni binare"}},{"word":"fișpan","pos":"noun","definitions":["county leader"],"forms":{"plural":"fișpani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fișpan","accusative-definite-nominative-singular":"fișpanul","accusative-indefinite-nominative-plural":"fișpani","accusative-definite-nominative-plural":"fișpanii","dative-genitive-indefinite-singular":"fișpan","dative-definite-genitive-singular":"fișpanului","dative-genitive-indefinite-plural":"fișpani","dative-definite-genitive-plural":"fișpanilor","singular-vocative":"fișpanule","plural-vocative":"fișpanilor"}},{"word":"fiștecare","pos":"det","definitions":["alternative form of fiecare"]},{"word":"fiștecare","pos":"pron","definitions":["alternative form of fiecare"]},{"word":"fistic","pos":"noun","definitions":["pistachio (tree)"],"pronunciation":"/fisˈtik/","forms":{"plural":"fistici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fistic","accusative-definite-nominative-singular":"fisticul","accusative-indefinite-nominative-plural":"fistici","accusative-definite-nominative-plural":"fisticii","dative-genitive-indefinite-singular":"fistic","dative-definite-genitive-singular":"fisticului","dative-genitive-indefinite-plural":"fistici","dative-definite-genitive-plural":"fisticilor","singular-vocative":"fisticule","plural-vocative":"fisticilor","alternative":"fâstâc"}},{"word":"fistic","pos":"noun","definitions":["pistachio (fruit)"],"pronunciation":"/fisˈtik/","forms":{"plural":"fisticuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fistic","accusative-definite-nominative-singular":"fisticul","accusative-indefinite-nominative-plural":"fisticuri","accusative-definite-nominative-plural":"fisticurile","dative-genitive-indefinite-singular":"fistic","dative-definite-genitive-singular":"fisticului","dative-genitive-indefinite-plural":"fisticuri","dative-definite-genitive-plural":"fisticurilor","singular-vocative":"fisticule","plural-vocative":"fisticurilor","alternative":"fâstâc"}},{"word":"fistichiu","pos":"adj","definitions":["pistacchio-colored, yellow-green","eccentric, extravagant"],"pronunciation":"/fis.tiˈkiw/","forms":{"feminine-singular":"fistichie","plural":"fistichii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fistichiu","error-unrecognized-form-feminine-indefinite-singular":"fistichie","error-unrecognized-form-indefinite-masculine-plural":"fistichii","error-unrecognized-form-feminine-indefinite-neuter-plural":"fistichii","definite-error-unrecognized-form-masculine-neuter-singular":"fistichiul","definite-error-unrecognized-form-feminine-singular":"fistichia","definite-error-unrecognized-form-masculine-plural":"fistichiii","definite-error-unrecognized-form-feminine-neuter-plural":"fistichiile"}},{"word":"fistula","pos":"noun","definitions":["definite nominative/accusative singular of fistulă"],"pronunciation":"/ˈfis.tu.la/"},{"word":"fistulă","pos":"noun","definitions":["fistula"],"pronunciation":"/ˈfis.tu.lə/","forms":{"plural":"fistule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fistulă","accusative-definite-nominative-singular":"fistula","accusative-indefinite-nominative-plural":"fistule","accusative-definite-nominative-plural":"fistulele","dative-genitive-indefinite-singular":"fistule","dative-definite-genitive-singular":"fistulei","dative-genitive-indefinite-plural":"fistule","dative-definite-genitive-plural":"fistulelor","singular-vocative":"fistulă","plural-vocative":"fistulelor","alternative":"фистулэ"}},{"word":"fistular","pos":"adj","definitions":["fistular"],"forms":{"feminine-singular":"fistulară","masculine-plural":"fistulari","feminine-neuter-plural":"fistulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fistular","error-unrecognized-form-feminine-indefinite-singular":"fistulară","error-unrecognized-form-indefinite-masculine-plural":"fistulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fistulare","definite-error-unrecognized-form-masculine-neuter-singular":"fistularul","definite-error-unrecognized-form-feminine-singular":"fistulara","definite-error-unrecognized-form-masculine-plural":"fistularii","definite-error-unrecognized-form-feminine-neuter-plural":"fistularele"}},{"word":"fistule","pos":"noun","definitions":["inflection of fistulă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfistule]","gender":"f"},{"word":"fistulo","pos":"noun","definitions":["vocative singular of fistulă"],"pronunciation":"[ˈfistulo]","gender":"f"},{"word":"fistulos","pos":"adj","definitions":["fistulous"],"forms":{"feminine-singular":"fistuloasă","masculine-plural":"fistuloși","feminine-neuter-plural":"fistuloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fistulos","error-unrecognized-form-feminine-indefinite-singular":"fistuloasă","error-unrecognized-form-indefinite-masculine-plural":"fistuloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fistuloase","definite-error-unrecognized-form-masculine-neuter-singular":"fistulosul","definite-error-unrecognized-form-feminine-singular":"fistuloasa","definite-error-unrecognized-form-masculine-plural":"fistuloșii","definite-error-unrecognized-form-feminine-neuter-plural":"fistuloasele"}},{"word":"fisura","pos":"verb","definitions":["to crack"],"forms":{"canonical":"a fisura 1st conjugation","present-singular-third-person":"fisurează","participle-past":"fisurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fisura","gerund":"fisurând","first-person-indicative-present-singular":"fisurez","indicative-present-second-person-singular":"fisurezi","indicative-present-singular-third-person":"fisurează","first-person-indicative-plural-present":"fisurăm","indicative-plural-present-second-person":"fisurați","indicative-plural-present-third-person":"fisurează","first-person-imperfect-indicative-singular":"fisuram","imperfect-indicative-second-person-singular":"fisurai","imperfect-indicative-singular-third-person":"fisura","first-person-imperfect-indicative-plural":"fisuram","imperfect-indicative-plural-second-person":"fisurați","imperfect-indicative-plural-third-person":"fisurau","first-person-indicative-perfect-singular":"fisurai","indicative-perfect-second-person-singular":"fisurași","indicative-perfect-singular-third-person":"fisură","first-person-indicative-perfect-plural":"fisurarăm","indicative-perfect-plural-second-person":"fisurarăți","indicative-perfect-plural-third-person":"fisurară","first-person-indicative-pluperfect-singular":"fisurasem","indicative-pluperfect-second-person-singular":"fisuraseși","indicative-pluperfect-singular-third-person":"fisurase","first-person-indicative-pluperfect-plural":"fisuraserăm","indicative-pluperfect-plural-second-person":"fisuraserăți","indicative-pluperfect-plural-third-person":"fisuraseră","first-person-present-singular-subjunctive":"să fisurez","present-second-person-singular-subjunctive":"să fisurezi","present-singular-subjunctive-third-person":"să fisureze","first-person-plural-present-subjunctive":"să fisurăm","plural-present-second-person-subjunctive":"să fisurați","plural-present-subjunctive-third-person":"să fisureze","imperative-second-person-singular":"fisurează","imperative-plural-second-person":"fisurați","imperative-negative-second-person-singular":"nu fisura","imperative-negative-plural-second-person":"nu fisurați"}},{"word":"fisură","pos":"noun","definitions":["fissure"],"forms":{"plural":"fisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fisură","accusative-definite-nominative-singular":"fisura","accusative-indefinite-nominative-plural":"fisuri","accusative-definite-nominative-plural":"fisurile","dative-genitive-indefinite-singular":"fisuri","dative-definite-genitive-singular":"fisurii","dative-genitive-indefinite-plural":"fisuri","dative-definite-genitive-plural":"fisurilor","singular-vocative":"fisură","plural-vocative":"fisurilor"}},{"word":"fisurare","pos":"noun","definitions":["cracking"],"forms":{"plural":"fisurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fisurare","accusative-definite-nominative-singular":"fisurarea","accusative-indefinite-nominative-plural":"fisurări","accusative-definite-nominative-plural":"fisurările","dative-genitive-indefinite-singular":"fisurări","dative-definite-genitive-singular":"fisurării","dative-genitive-indefinite-plural":"fisurări","dative-definite-genitive-plural":"fisurărilor","singular-vocative":"fisurare","plural-vocative":"fisurărilor"}},{"word":"fisurat","pos":"adj","definitions":["cracked"],"forms":{"feminine-singular":"fisurată","masculine-plural":"fisurați","feminine-neuter-plural":"fisurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fisurat","error-unrecognized-form-feminine-indefinite-singular":"fisurată","error-unrecognized-form-indefinite-masculine-plural":"fisurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fisurate","definite-error-unrecognized-form-masculine-neuter-singular":"fisuratul","definite-error-unrecognized-form-feminine-singular":"fisurata","definite-error-unrecognized-form-masculine-plural":"fisurații","definite-error-unrecognized-form-feminine-neuter-plural":"fisuratele"}},{"word":"fiță","pos":"noun","definitions":["obsolete form of fâță"],"forms":{"plural":"fițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiță","accusative-definite-nominative-singular":"fița","accusative-indefinite-nominative-plural":"fițe","accusative-definite-nominative-plural":"fițele","dative-genitive-indefinite-singular":"fițe","dative-definite-genitive-singular":"fiței","dative-genitive-indefinite-plural":"fițe","dative-definite-genitive-plural":"fițelor","singular-vocative":"fiță","plural-vocative":"fițelor"}},{"word":"Fițcău","pos":"name","definitions":["a village in Aluniș, Mureș County, Romania"],"gender":"m"},{"word":"fiți","pos":"verb","definitions":["second-person plural present subjunctive of fi","second-person plural imperative of fi: be"],"pronunciation":"[fit͡sʲ]","examples":[{"ro":"vreau să încercați să fiți mai realiști","en":"I want you to try to be more realistic."}]},{"word":"fitil","pos":"noun","definitions":["wick","fuse"],"pronunciation":"/fiˈtil/","forms":{"plural":"fitiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fitil","accusative-definite-nominative-singular":"fitilul","accusative-indefinite-nominative-plural":"fitiluri","accusative-definite-nominative-plural":"fitilurile","dative-genitive-indefinite-singular":"fitil","dative-definite-genitive-singular":"fitilului","dative-genitive-indefinite-plural":"fitiluri","dative-definite-genitive-plural":"fitilurilor","singular-vocative":"fitilule","plural-vocative":"fitilurilor"}},{"word":"fitilistă","pos":"noun","definitions":["female equivalent of fitilist"],"forms":{"plural":"fitiliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitilistă","accusative-definite-nominative-singular":"fitilista","accusative-indefinite-nominative-plural":"fitiliste","accusative-definite-nominative-plural":"fitilistele","dative-genitive-indefinite-singular":"fitiliste","dative-definite-genitive-singular":"fitilistei","dative-genitive-indefinite-plural":"fitiliste","dative-definite-genitive-plural":"fitilistelor","singular-vocative":"fitilistă","plural-vocative":"fitilistelor"}},{"word":"Fitionești","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Fitionești, Vrancea County, Romania"],"gender":"m"},{"word":"fitness","pos":"noun","definitions":["fitness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fitness","accusative-definite-nominative":"fitnessul","dative-genitive-indefinite":"fitness","dative-definite-genitive":"fitnessului","vocative":"fitnessule"}},{"word":"fițoaică","pos":"noun","definitions":["spotted weather loach (Cobitis taenia)"],"forms":{"plural":"fițoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fițoaică","accusative-definite-nominative-singular":"fițoaica","accusative-indefinite-nominative-plural":"fițoaice","accusative-definite-nominative-plural":"fițoaicele","dative-genitive-indefinite-singular":"fițoaice","dative-definite-genitive-singular":"fițoaicei","dative-genitive-indefinite-plural":"fițoaice","dative-definite-genitive-plural":"fițoaicelor","singular-vocative":"fițoaică","plural-vocative":"fițoaicelor"}},{"word":"fitobiologic","pos":"adj","definitions":["phytobiological"],"forms":{"feminine-singular":"fitobiologică","masculine-plural":"fitobiologici","feminine-neuter-plural":"fitobiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitobiologic","error-unrecognized-form-feminine-indefinite-singular":"fitobiologică","error-unrecognized-form-indefinite-masculine-plural":"fitobiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitobiologice","definite-error-unrecognized-form-masculine-neuter-singular":"fitobiologicul","definite-error-unrecognized-form-feminine-singular":"fitobiologica","definite-error-unrecognized-form-masculine-plural":"fitobiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fitobiologicele"}},{"word":"fitobiologie","pos":"noun","definitions":["phytobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fitobiologie","accusative-definite-nominative":"fitobiologia","dative-genitive-indefinite":"fitobiologii","dative-definite-genitive":"fitobiologiei","vocative":"fitobiologie"}},{"word":"fitocenologie","pos":"noun","definitions":["phytocoenology"],"forms":{"plural":"fitocenologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitocenologie","accusative-definite-nominative-singular":"fitocenologia","accusative-indefinite-nominative-plural":"fitocenologii","accusative-definite-nominative-plural":"fitocenologiile","dative-genitive-indefinite-singular":"fitocenologii","dative-definite-genitive-singular":"fitocenologiei","dative-genitive-indefinite-plural":"fitocenologii","dative-definite-genitive-plural":"fitocenologiilor","singular-vocative":"fitocenologie","plural-vocative":"fitocenologiilor"}},{"word":"fitocenotic","pos":"adj","definitions":["phytocenotic"],"forms":{"feminine-singular":"fitocenotică","masculine-plural":"fitocenotici","feminine-neuter-plural":"fitocenotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitocenotic","error-unrecognized-form-feminine-indefinite-singular":"fitocenotică","error-unrecognized-form-indefinite-masculine-plural":"fitocenotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitocenotice","definite-error-unrecognized-form-masculine-neuter-singular":"fitocenoticul","definite-error-unrecognized-form-feminine-singular":"fitocenotica","definite-error-unrecognized-form-masculine-plural":"fitocenoticii","definite-error-unrecognized-form-feminine-neuter-plural":"fitocenoticele"}},{"word":"fitocenoză","pos":"noun","definitions":["phytocoenosis"],"forms":{"plural":"fitocenoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitocenoză","accusative-definite-nominative-singular":"fitocenoza","accusative-indefinite-nominative-plural":"fitocenoze","accusative-definite-nominative-plural":"fitocenozele","dative-genitive-indefinite-singular":"fitocenoze","dative-definite-genitive-singular":"fitocenozei","dative-genitive-indefinite-plural":"fitocenoze","dative-definite-genitive-plural":"fitocenozelor","singular-vocative":"fitocenoză","plural-vocative":"fitocenozelor"}},{"word":"fitochimie","pos":"noun","definitions":["phytochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fitochimie","accusative-definite-nominative":"fitochimia","dative-genitive-indefinite":"fitochimii","dative-definite-genitive":"fitochimiei","vocative":"fitochimie"}},{"word":"fitocid","pos":"noun","definitions":["phytocide"],"forms":{"plural":"fitocizi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fitocid","accusative-definite-nominative-singular":"fitocidul","accusative-indefinite-nominative-plural":"fitocizi","accusative-definite-nominative-plural":"fitocizile","dative-genitive-indefinite-singular":"fitocid","dative-definite-genitive-singular":"fitocidului","dative-genitive-indefinite-plural":"fitocizi","dative-definite-genitive-plural":"fitocizilor","singular-vocative":"fitocidule","plural-vocative":"fitocizilor"}},{"word":"Fitod","pos":"name","definitions":["a village in Leliceni, Harghita County, Romania"],"gender":"m"},{"word":"fitofag","pos":"noun","definitions":["phytophage, herbivore"],"forms":{"plural":"fitofagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitofag","accusative-definite-nominative-singular":"fitofagul","accusative-indefinite-nominative-plural":"fitofagi","accusative-definite-nominative-plural":"fitofagii","dative-genitive-indefinite-singular":"fitofag","dative-definite-genitive-singular":"fitofagului","dative-genitive-indefinite-plural":"fitofagi","dative-definite-genitive-plural":"fitofagilor","singular-vocative":"fitofagule","plural-vocative":"fitofagilor"}},{"word":"fitofagă","pos":"noun","definitions":["female equivalent of fitofag"],"forms":{"plural":"fitofage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitofagă","accusative-definite-nominative-singular":"fitofaga","accusative-indefinite-nominative-plural":"fitofage","accusative-definite-nominative-plural":"fitofagele","dative-genitive-indefinite-singular":"fitofage","dative-definite-genitive-singular":"fitofagei","dative-genitive-indefinite-plural":"fitofage","dative-definite-genitive-plural":"fitofagelor","singular-vocative":"fitofagă","plural-vocative":"fitofagelor"}},{"word":"fitofarmaceutic","pos":"adj","definitions":["phytopharmaceutical"],"forms":{"feminine-singular":"fitofarmaceutică","masculine-plural":"fitofarmaceutici","feminine-neuter-plural":"fitofarmaceutice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitofarmaceutic","error-unrecognized-form-feminine-indefinite-singular":"fitofarmaceutică","error-unrecognized-form-indefinite-masculine-plural":"fitofarmaceutici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitofarmaceutice","definite-error-unrecognized-form-masculine-neuter-singular":"fitofarmaceuticul","definite-error-unrecognized-form-feminine-singular":"fitofarmaceutica","definite-error-unrecognized-form-masculine-plural":"fitofarmaceuticii","definite-error-unrecognized-form-feminine-neuter-plural":"fitofarmaceuticele"}},{"word":"fitofarmacie","pos":"noun","definitions":["phytopharmacy"],"forms":{"plural":"fitofarmacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitofarmacie","accusative-definite-nominative-singular":"fitofarmacia","accusative-indefinite-nominative-plural":"fitofarmacii","accusative-definite-nominative-plural":"fitofarmaciile","dative-genitive-indefinite-singular":"fitofarmacii","dative-definite-genitive-singular":"fitofarmaciei","dative-genitive-indefinite-plural":"fitofarmacii","dative-definite-genitive-plural":"fitofarmaciilor","singular-vocative":"fitofarmacie","plural-vocative":"fitofarmaciilor"}},{"word":"fitofiziologie","pos":"noun","definitions":["phytophysiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitofiziologie","accusative-definite-nominative-singular":"fitofiziologia","accusative-indefinite-nominative-plural":"fitofiziologii","accusative-definite-nominative-plural":"fitofiziologiile","dative-genitive-indefinite-singular":"fitofiziologii","dative-definite-genitive-singular":"fitofiziologiei","dative-genitive-indefinite-plural":"fitofiziologii","dative-definite-genitive-plural":"fitofiziologiilor","singular-vocative":"fitofiziologie","plural-vocative":"fitofiziologiilor"}},{"word":"fitogen","pos":"adj","definitions":["phytogenic"],"forms":{"feminine-singular":"fitogenă","masculine-plural":"fitogeni","feminine-neuter-plural":"fitogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitogen","error-unrecognized-form-feminine-indefinite-singular":"fitogenă","error-unrecognized-form-indefinite-masculine-plural":"fitogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitogene","definite-error-unrecognized-form-masculine-neuter-singular":"fitogenul","definite-error-unrecognized-form-feminine-singular":"fitogena","definite-error-unrecognized-form-masculine-plural":"fitogenii","definite-error-unrecognized-form-feminine-neuter-plural":"fitogenele"}},{"word":"fitogenic","pos":"adj","definitions":["phytogenic"],"forms":{"feminine-singular":"fitogenică","masculine-plural":"fitogenici","feminine-neuter-plural":"fitogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitogenic","error-unrecognized-form-feminine-indefinite-singular":"fitogenică","error-unrecognized-form-indefinite-masculine-plural":"fitogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitogenice","definite-error-unrecognized-form-masculine-neuter-singular":"fitogenicul","definite-error-unrecognized-form-feminine-singular":"fitogenica","definite-error-unrecognized-form-masculine-plural":"fitogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"fitogenicele"}},{"word":"fitogeografic","pos":"adj","definitions":["phytogeographic"],"forms":{"feminine-singular":"fitogeografică","masculine-plural":"fitogeografici","feminine-neuter-plural":"fitogeografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitogeografic","error-unrecognized-form-feminine-indefinite-singular":"fitogeografică","error-unrecognized-form-indefinite-masculine-plural":"fitogeografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitogeografice","definite-error-unrecognized-form-masculine-neuter-singular":"fitogeograficul","definite-error-unrecognized-form-feminine-singular":"fitogeografica","definite-error-unrecognized-form-masculine-plural":"fitogeograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fitogeograficele"}},{"word":"fitogeografie","pos":"noun","definitions":["phytogeography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fitogeografie","accusative-definite-nominative":"fitogeografia","dative-genitive-indefinite":"fitogeografii","dative-definite-genitive":"fitogeografiei","vocative":"fitogeografie"}},{"word":"fitografie","pos":"noun","definitions":["phytography"],"forms":{"plural":"fitografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitografie","accusative-definite-nominative-singular":"fitografia","accusative-indefinite-nominative-plural":"fitografii","accusative-definite-nominative-plural":"fitografiile","dative-genitive-indefinite-singular":"fitografii","dative-definite-genitive-singular":"fitografiei","dative-genitive-indefinite-plural":"fitografii","dative-definite-genitive-plural":"fitografiilor","singular-vocative":"fitografie","plural-vocative":"fitografiilor"}},{"word":"fitohormon","pos":"noun","definitions":["phytohormone"],"forms":{"plural":"fitohormoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitohormon","accusative-definite-nominative-singular":"fitohormonul","accusative-indefinite-nominative-plural":"fitohormoni","accusative-definite-nominative-plural":"fitohormonii","dative-genitive-indefinite-singular":"fitohormon","dative-definite-genitive-singular":"fitohormonului","dative-genitive-indefinite-plural":"fitohormoni","dative-definite-genitive-plural":"fitohormonilor","singular-vocative":"fitohormonule","plural-vocative":"fitohormonilor"}},{"word":"Fițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fițoiu"}},{"word":"fitolog","pos":"noun","definitions":["phytologist"],"pronunciation":"/fi.toˈloɡ/","forms":{"plural":"fitologi","feminine":"equivalent fitologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitolog","accusative-definite-nominative-singular":"fitologul","accusative-indefinite-nominative-plural":"fitologi","accusative-definite-nominative-plural":"fitologii","dative-genitive-indefinite-singular":"fitolog","dative-definite-genitive-singular":"fitologului","dative-genitive-indefinite-plural":"fitologi","dative-definite-genitive-plural":"fitologilor","singular-vocative":"fitologule","plural-vocative":"fitologilor"}},{"word":"fitologă","pos":"noun","definitions":["female equivalent of fitolog"],"pronunciation":"/fi.toˈlo.ɡə/","forms":{"plural":"fitologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fitologă","accusative-definite-nominative-singular":"fitologa","accusative-indefinite-nominative-plural":"fitologe","accusative-definite-nominative-plural":"fitologele","dative-genitive-indefinite-singular":"fitologe","dative-definite-genitive-singular":"fitologei","dative-genitive-indefinite-plural":"fitologe","dative-definite-genitive-plural":"fitologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"fitologe","pos":"noun","definitions":["plural of fitologă"],"gender":"f"},{"word":"fitologi","pos":"noun","definitions":["plural of fitolog"],"gender":"m"},{"word":"fitologie","pos":"noun","definitions":["phytology, botany"],"forms":{"plural":"fitologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitologie","accusative-definite-nominative-singular":"fitologia","accusative-indefinite-nominative-plural":"fitologii","accusative-definite-nominative-plural":"fitologiile","dative-genitive-indefinite-singular":"fitologii","dative-definite-genitive-singular":"fitologiei","dative-genitive-indefinite-plural":"fitologii","dative-definite-genitive-plural":"fitologiilor","singular-vocative":"fitologie","plural-vocative":"fitologiilor"}},{"word":"fitomorf","pos":"adj","definitions":["phytomorphic"],"forms":{"feminine-singular":"fitomorfă","masculine-plural":"fitomorfi","feminine-neuter-plural":"fitomorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitomorf","error-unrecognized-form-feminine-indefinite-singular":"fitomorfă","error-unrecognized-form-indefinite-masculine-plural":"fitomorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitomorfe","definite-error-unrecognized-form-masculine-neuter-singular":"fitomorful","definite-error-unrecognized-form-feminine-singular":"fitomorfa","definite-error-unrecognized-form-masculine-plural":"fitomorfii","definite-error-unrecognized-form-feminine-neuter-plural":"fitomorfele"}},{"word":"fitoncid","pos":"noun","definitions":["phytoncide"],"forms":{"plural":"fitoncide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fitoncid","accusative-definite-nominative-singular":"fitoncidul","accusative-indefinite-nominative-plural":"fitoncide","accusative-definite-nominative-plural":"fitoncidele","dative-genitive-indefinite-singular":"fitoncid","dative-definite-genitive-singular":"fitoncidului","dative-genitive-indefinite-plural":"fitoncide","dative-definite-genitive-plural":"fitoncidelor","singular-vocative":"fitoncidule","plural-vocative":"fitoncidelor"}},{"word":"fitonimie","pos":"noun","definitions":["phytonomy"],"forms":{"plural":"fitonimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitonimie","accusative-definite-nominative-singular":"fitonimia","accusative-indefinite-nominative-plural":"fitonimii","accusative-definite-nominative-plural":"fitonimiile","dative-genitive-indefinite-singular":"fitonimii","dative-definite-genitive-singular":"fitonimiei","dative-genitive-indefinite-plural":"fitonimii","dative-definite-genitive-plural":"fitonimiilor","singular-vocative":"fitonimie","plural-vocative":"fitonimiilor"}},{"word":"fitoparazit","pos":"noun","definitions":["phytoparasite"],"forms":{"plural":"fitoparaziți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitoparazit","accusative-definite-nominative-singular":"fitoparazitul","accusative-indefinite-nominative-plural":"fitoparaziți","accusative-definite-nominative-plural":"fitoparaziții","dative-genitive-indefinite-singular":"fitoparazit","dative-definite-genitive-singular":"fitoparazitului","dative-genitive-indefinite-plural":"fitoparaziți","dative-definite-genitive-plural":"fitoparaziților","singular-vocative":"fitoparazitule","plural-vocative":"fitoparaziților"}},{"word":"fitopatogen","pos":"noun","definitions":["phytopathogen"],"forms":{"plural":"fitopatogeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitopatogen","accusative-definite-nominative-singular":"fitopatogenul","accusative-indefinite-nominative-plural":"fitopatogeni","accusative-definite-nominative-plural":"fitopatogenii","dative-genitive-indefinite-singular":"fitopatogen","dative-definite-genitive-singular":"fitopatogenului","dative-genitive-indefinite-plural":"fitopatogeni","dative-definite-genitive-plural":"fitopatogenilor","singular-vocative":"fitopatogenule","plural-vocative":"fitopatogenilor"}},{"word":"fitopatolog","pos":"noun","definitions":["phytopathologist"],"forms":{"plural":"fitopatologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitopatolog","accusative-definite-nominative-singular":"fitopatologul","accusative-indefinite-nominative-plural":"fitopatologi","accusative-definite-nominative-plural":"fitopatologii","dative-genitive-indefinite-singular":"fitopatolog","dative-definite-genitive-singular":"fitopatologului","dative-genitive-indefinite-plural":"fitopatologi","dative-definite-genitive-plural":"fitopatologilor","singular-vocative":"fitopatologule","plural-vocative":"fitopatologilor"}},{"word":"fitopatologă","pos":"noun","definitions":["female equivalent of fitopatolog"],"forms":{"plural":"fitopatologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitopatologă","accusative-definite-nominative-singular":"fitopatologa","accusative-indefinite-nominative-plural":"fitopatologe","accusative-definite-nominative-plural":"fitopatologele","dative-genitive-indefinite-singular":"fitopatologe","dative-definite-genitive-singular":"fitopatologei","dative-genitive-indefinite-plural":"fitopatologe","dative-definite-genitive-plural":"fitopatologelor","singular-vocative":"fitopatologă","plural-vocative":"fitopatologelor"}},{"word":"fitopatologic","pos":"adj","definitions":["phytopathological"],"forms":{"feminine-singular":"fitopatologică","masculine-plural":"fitopatologici","feminine-neuter-plural":"fitopatologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitopatologic","error-unrecognized-form-feminine-indefinite-singular":"fitopatologică","error-unrecognized-form-indefinite-masculine-plural":"fitopatologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitopatologice","definite-error-unrecognized-form-masculine-neuter-singular":"fitopatologicul","definite-error-unrecognized-form-feminine-singular":"fitopatologica","definite-error-unrecognized-form-masculine-plural":"fitopatologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fitopatologicele"}},{"word":"fitopatologie","pos":"noun","definitions":["phytopathology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fitopatologie","accusative-definite-nominative":"fitopatologia","dative-genitive-indefinite":"fitopatologii","dative-definite-genitive":"fitopatologiei","vocative":"fitopatologie"}},{"word":"fitoplancton","pos":"noun","definitions":["phytoplankton"],"forms":{"plural":"fitoplanctonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fitoplancton","accusative-definite-nominative-singular":"fitoplanctonul","accusative-indefinite-nominative-plural":"fitoplanctonuri","accusative-definite-nominative-plural":"fitoplanctonurile","dative-genitive-indefinite-singular":"fitoplancton","dative-definite-genitive-singular":"fitoplanctonului","dative-genitive-indefinite-plural":"fitoplanctonuri","dative-definite-genitive-plural":"fitoplanctonurilor","singular-vocative":"fitoplanctonule","plural-vocative":"fitoplanctonurilor"}},{"word":"fitosanitar","pos":"adj","definitions":["phytosanitary"],"forms":{"feminine-singular":"fitosanitară","masculine-plural":"fitosanitari","feminine-neuter-plural":"fitosanitare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitosanitar","error-unrecognized-form-feminine-indefinite-singular":"fitosanitară","error-unrecognized-form-indefinite-masculine-plural":"fitosanitari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitosanitare","definite-error-unrecognized-form-masculine-neuter-singular":"fitosanitarul","definite-error-unrecognized-form-feminine-singular":"fitosanitara","definite-error-unrecognized-form-masculine-plural":"fitosanitarii","definite-error-unrecognized-form-feminine-neuter-plural":"fitosanitarele"}},{"word":"fitosterină","pos":"noun","definitions":["phytosterol"],"forms":{"plural":"fitosterine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitosterină","accusative-definite-nominative-singular":"fitosterina","accusative-indefinite-nominative-plural":"fitosterine","accusative-definite-nominative-plural":"fitosterinele","dative-genitive-indefinite-singular":"fitosterine","dative-definite-genitive-singular":"fitosterinei","dative-genitive-indefinite-plural":"fitosterine","dative-definite-genitive-plural":"fitosterinelor","singular-vocative":"fitosterină","plural-vocative":"fitosterinelor"}},{"word":"fitosterol","pos":"noun","definitions":["phytosterol"],"forms":{"plural":"fitosteroli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitosterol","accusative-definite-nominative-singular":"fitosterolul","accusative-indefinite-nominative-plural":"fitosteroli","accusative-definite-nominative-plural":"fitosterolii","dative-genitive-indefinite-singular":"fitosterol","dative-definite-genitive-singular":"fitosterolului","dative-genitive-indefinite-plural":"fitosteroli","dative-definite-genitive-plural":"fitosterolilor","singular-vocative":"fitosterolule","plural-vocative":"fitosterolilor"}},{"word":"fitoterapeut","pos":"noun","definitions":["phytotherapist"],"forms":{"plural":"fitoterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fitoterapeut","accusative-definite-nominative-singular":"fitoterapeutul","accusative-indefinite-nominative-plural":"fitoterapeuți","accusative-definite-nominative-plural":"fitoterapeuții","dative-genitive-indefinite-singular":"fitoterapeut","dative-definite-genitive-singular":"fitoterapeutului","dative-genitive-indefinite-plural":"fitoterapeuți","dative-definite-genitive-plural":"fitoterapeuților","singular-vocative":"fitoterapeutule","plural-vocative":"fitoterapeuților"}},{"word":"fitoterapeută","pos":"noun","definitions":["female equivalent of fitoterapeut"],"forms":{"plural":"fitoterapeute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitoterapeută","accusative-definite-nominative-singular":"fitoterapeuta","accusative-indefinite-nominative-plural":"fitoterapeute","accusative-definite-nominative-plural":"fitoterapeutele","dative-genitive-indefinite-singular":"fitoterapeute","dative-definite-genitive-singular":"fitoterapeutei","dative-genitive-indefinite-plural":"fitoterapeute","dative-definite-genitive-plural":"fitoterapeutelor","singular-vocative":"fitoterapeută","plural-vocative":"fitoterapeutelor"}},{"word":"fitoterapic","pos":"adj","definitions":["related to phytotherapy"],"forms":{"feminine-singular":"fitoterapică","masculine-plural":"fitoterapici","feminine-neuter-plural":"fitoterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitoterapic","error-unrecognized-form-feminine-indefinite-singular":"fitoterapică","error-unrecognized-form-indefinite-masculine-plural":"fitoterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitoterapice","definite-error-unrecognized-form-masculine-neuter-singular":"fitoterapicul","definite-error-unrecognized-form-feminine-singular":"fitoterapica","definite-error-unrecognized-form-masculine-plural":"fitoterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"fitoterapicele"}},{"word":"fitoterapie","pos":"noun","definitions":["phytotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fitoterapie","accusative-definite-nominative":"fitoterapia","dative-genitive-indefinite":"fitoterapii","dative-definite-genitive":"fitoterapiei","vocative":"fitoterapie"}},{"word":"fitotomie","pos":"noun","definitions":["phytotomy"],"forms":{"plural":"fitotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fitotomie","accusative-definite-nominative-singular":"fitotomia","accusative-indefinite-nominative-plural":"fitotomii","accusative-definite-nominative-plural":"fitotomiile","dative-genitive-indefinite-singular":"fitotomii","dative-definite-genitive-singular":"fitotomiei","dative-genitive-indefinite-plural":"fitotomii","dative-definite-genitive-plural":"fitotomiilor","singular-vocative":"fitotomie","plural-vocative":"fitotomiilor"}},{"word":"fitotoxic","pos":"adj","definitions":["phytotoxic"],"forms":{"feminine-singular":"fitotoxică","masculine-plural":"fitotoxici","feminine-neuter-plural":"fitotoxice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fitotoxic","error-unrecognized-form-feminine-indefinite-singular":"fitotoxică","error-unrecognized-form-indefinite-masculine-plural":"fitotoxici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fitotoxice","definite-error-unrecognized-form-masculine-neuter-singular":"fitotoxicul","definite-error-unrecognized-form-feminine-singular":"fitotoxica","definite-error-unrecognized-form-masculine-plural":"fitotoxicii","definite-error-unrecognized-form-feminine-neuter-plural":"fitotoxicele"}},{"word":"fitotoxină","pos":"noun","definitions":["phytotoxin"],"forms":{"plural":"fitotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fitotoxină","accusative-definite-nominative-singular":"fitotoxina","accusative-indefinite-nominative-plural":"fitotoxine","accusative-definite-nominative-plural":"fitotoxinele","dative-genitive-indefinite-singular":"fitotoxine","dative-definite-genitive-singular":"fitotoxinei","dative-genitive-indefinite-plural":"fitotoxine","dative-definite-genitive-plural":"fitotoxinelor","singular-vocative":"fitotoxină","plural-vocative":"fitotoxinelor"}},{"word":"fitotron","pos":"noun","definitions":["phytotron"],"forms":{"plural":"fitotroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fitotron","accusative-definite-nominative-singular":"fitotronul","accusative-indefinite-nominative-plural":"fitotroane","accusative-definite-nominative-plural":"fitotroanele","dative-genitive-indefinite-singular":"fitotron","dative-definite-genitive-singular":"fitotronului","dative-genitive-indefinite-plural":"fitotroane","dative-definite-genitive-plural":"fitotroanelor","singular-vocative":"fitotronule","plural-vocative":"fitotroanelor"}},{"word":"fitozoar","pos":"noun","definitions":["zoophyte"],"forms":{"plural":"fitozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fitozoar","accusative-definite-nominative-singular":"fitozoarul","accusative-indefinite-nominative-plural":"fitozoare","accusative-definite-nominative-plural":"fitozoarele","dative-genitive-indefinite-singular":"fitozoar","dative-definite-genitive-singular":"fitozoarului","dative-genitive-indefinite-plural":"fitozoare","dative-definite-genitive-plural":"fitozoarelor","singular-vocative":"fitozoarule","plural-vocative":"fitozoarelor"}},{"word":"fițuică","pos":"noun","definitions":["Small piece of paper on which various notes are made","cheat sheet, crib note (sheet of paper used to assist on a test)","an insignificant newspaper"],"pronunciation":"/fiˈt͡suj.kə/","forms":{"plural":"fițuici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fițuică","accusative-definite-nominative-singular":"fițuica","accusative-indefinite-nominative-plural":"fițuici","accusative-definite-nominative-plural":"fițuicile","dative-genitive-indefinite-singular":"fițuici","dative-definite-genitive-singular":"fițuicii","dative-genitive-indefinite-plural":"fițuici","dative-definite-genitive-plural":"fițuicilor","singular-vocative":"fițuică","plural-vocative":"fițuicilor"}},{"word":"Fiu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fiu"}},{"word":"fiu","pos":"noun","definitions":["son"],"pronunciation":"[fiw]","examples":[{"ro":"Eu sunt fiul ei.","en":"I’m her son."},{"ro":"Au doi fii.","en":"They have two sons."},{"ro":"Astăzi e ziua de naștere a fiului meu.","en":"Today is my son’s birthday."}],"forms":{"plural":"fii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"fiu","accusative-definite-nominative-singular":"fiul","accusative-indefinite-nominative-plural":"fii","accusative-definite-nominative-plural":"fiii","dative-genitive-indefinite-singular":"fiu","dative-definite-genitive-singular":"fiului","dative-genitive-indefinite-plural":"fii","dative-definite-genitive-plural":"fiilor","singular-vocative":"fiule","plural-vocative":"fiilor"}},{"word":"fiu","pos":"verb","definitions":["first-person singular present subjunctive of fi"],"pronunciation":"[fiw]","examples":[{"ro":"O să fiu mai atent.","en":"I will be more careful."}]},{"word":"fiu de cățea","pos":"noun","definitions":["son of a bitch"],"forms":{"plural":"fii de cățea"}},{"word":"fiu vitreg","pos":"noun","definitions":["stepson"],"forms":{"plural":"fii vitregi"}},{"word":"fiul","pos":"noun","definitions":["definite nominative/accusative singular of fiu"]},{"word":"fiulare","pos":"noun","definitions":["a part of the underside of a yoke"],"forms":{"plural":"fiulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fiulare","accusative-definite-nominative-singular":"fiularea","accusative-indefinite-nominative-plural":"fiulări","accusative-definite-nominative-plural":"fiulările","dative-genitive-indefinite-singular":"fiulări","dative-definite-genitive-singular":"fiulării","dative-genitive-indefinite-plural":"fiulări","dative-definite-genitive-plural":"fiulărilor","singular-vocative":"fiulare","plural-vocative":"fiulărilor"}},{"word":"fiule","pos":"noun","definitions":["vocative singular of fiu"]},{"word":"fiuleț","pos":"noun","definitions":["diminutive of fiu; small son"],"forms":{"plural":"fiuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiuleț","accusative-definite-nominative-singular":"fiulețul","accusative-indefinite-nominative-plural":"fiuleți","accusative-definite-nominative-plural":"fiuleții","dative-genitive-indefinite-singular":"fiuleț","dative-definite-genitive-singular":"fiulețului","dative-genitive-indefinite-plural":"fiuleți","dative-definite-genitive-plural":"fiuleților","singular-vocative":"fiulețule","plural-vocative":"fiuleților"}},{"word":"fiului","pos":"noun","definitions":["definite dative/genitive singular of fiu"]},{"word":"fiuț","pos":"noun","definitions":["diminutive of fiu; small son"],"forms":{"plural":"fiuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiuț","accusative-definite-nominative-singular":"fiuțul","accusative-indefinite-nominative-plural":"fiuți","accusative-definite-nominative-plural":"fiuții","dative-genitive-indefinite-singular":"fiuț","dative-definite-genitive-singular":"fiuțului","dative-genitive-indefinite-plural":"fiuți","dative-definite-genitive-plural":"fiuților","singular-vocative":"fiuțule","plural-vocative":"fiuților"}},{"word":"fix","pos":"adj","definitions":["fixed"],"forms":{"feminine-singular":"fixă","masculine-plural":"ficși","feminine-neuter-plural":"fixe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fix","error-unrecognized-form-feminine-indefinite-singular":"fixă","error-unrecognized-form-indefinite-masculine-plural":"ficși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fixe","definite-error-unrecognized-form-masculine-neuter-singular":"fixul","definite-error-unrecognized-form-feminine-singular":"fixa","definite-error-unrecognized-form-masculine-plural":"ficșii","definite-error-unrecognized-form-feminine-neuter-plural":"fixele"}},{"word":"fixa","pos":"verb","definitions":["to fix (to attach firmly)"],"forms":{"canonical":"a fixa 1st conjugation","present-singular-third-person":"fixează","participle-past":"fixat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fixa","gerund":"fixând","first-person-indicative-present-singular":"fixez","indicative-present-second-person-singular":"fixezi","indicative-present-singular-third-person":"fixează","first-person-indicative-plural-present":"fixăm","indicative-plural-present-second-person":"fixați","indicative-plural-present-third-person":"fixează","first-person-imperfect-indicative-singular":"fixam","imperfect-indicative-second-person-singular":"fixai","imperfect-indicative-singular-third-person":"fixa","first-person-imperfect-indicative-plural":"fixam","imperfect-indicative-plural-second-person":"fixați","imperfect-indicative-plural-third-person":"fixau","first-person-indicative-perfect-singular":"fixai","indicative-perfect-second-person-singular":"fixași","indicative-perfect-singular-third-person":"fixă","first-person-indicative-perfect-plural":"fixarăm","indicative-perfect-plural-second-person":"fixarăți","indicative-perfect-plural-third-person":"fixară","first-person-indicative-pluperfect-singular":"fixasem","indicative-pluperfect-second-person-singular":"fixaseși","indicative-pluperfect-singular-third-person":"fixase","first-person-indicative-pluperfect-plural":"fixaserăm","indicative-pluperfect-plural-second-person":"fixaserăți","indicative-pluperfect-plural-third-person":"fixaseră","first-person-present-singular-subjunctive":"să fixez","present-second-person-singular-subjunctive":"să fixezi","present-singular-subjunctive-third-person":"să fixeze","first-person-plural-present-subjunctive":"să fixăm","plural-present-second-person-subjunctive":"să fixați","plural-present-subjunctive-third-person":"să fixeze","imperative-second-person-singular":"fixează","imperative-plural-second-person":"fixați","imperative-negative-second-person-singular":"nu fixa","imperative-negative-plural-second-person":"nu fixați"}},{"word":"fixabil","pos":"adj","definitions":["fixable"],"forms":{"feminine-singular":"fixabilă","masculine-plural":"fixabili","feminine-neuter-plural":"fixabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fixabil","error-unrecognized-form-feminine-indefinite-singular":"fixabilă","error-unrecognized-form-indefinite-masculine-plural":"fixabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fixabile","definite-error-unrecognized-form-masculine-neuter-singular":"fixabilul","definite-error-unrecognized-form-feminine-singular":"fixabila","definite-error-unrecognized-form-masculine-plural":"fixabilii","definite-error-unrecognized-form-feminine-neuter-plural":"fixabilele"}},{"word":"fixai","pos":"verb","definitions":["inflection of fixa:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fiˈksaj]"},{"word":"fixaj","pos":"noun","definitions":["fixing"],"forms":{"plural":"fixaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fixaj","accusative-definite-nominative-singular":"fixajul","accusative-indefinite-nominative-plural":"fixaje","accusative-definite-nominative-plural":"fixajele","dative-genitive-indefinite-singular":"fixaj","dative-definite-genitive-singular":"fixajului","dative-genitive-indefinite-plural":"fixaje","dative-definite-genitive-plural":"fixajelor","singular-vocative":"fixajule","plural-vocative":"fixajelor"}},{"word":"fixam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fixa"],"pronunciation":"/fikˈsam/"},{"word":"fixare","pos":"noun","definitions":["fixation"],"forms":{"plural":"fixări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fixare","accusative-definite-nominative-singular":"fixarea","accusative-indefinite-nominative-plural":"fixări","accusative-definite-nominative-plural":"fixările","dative-genitive-indefinite-singular":"fixări","dative-definite-genitive-singular":"fixării","dative-genitive-indefinite-plural":"fixări","dative-definite-genitive-plural":"fixărilor","singular-vocative":"fixare","plural-vocative":"fixărilor"}},{"word":"fixat","pos":"adj","definitions":["fixed, fastened"],"pronunciation":"[fiˈksat]","forms":{"feminine-singular":"fixată","masculine-plural":"fixați","feminine-neuter-plural":"fixate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fixat","error-unrecognized-form-feminine-indefinite-singular":"fixată","error-unrecognized-form-indefinite-masculine-plural":"fixați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fixate","definite-error-unrecognized-form-masculine-neuter-singular":"fixatul","definite-error-unrecognized-form-feminine-singular":"fixata","definite-error-unrecognized-form-masculine-plural":"fixații","definite-error-unrecognized-form-feminine-neuter-plural":"fixatele"}},{"word":"fixat","pos":"verb","definitions":["past participle of fixa"],"pronunciation":"[fiˈksat]","forms":{"participle-past":"of fixa"}},{"word":"fixație","pos":"noun","definitions":["fixation"],"forms":{"plural":"fixații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fixație","accusative-definite-nominative-singular":"fixația","accusative-indefinite-nominative-plural":"fixații","accusative-definite-nominative-plural":"fixațiile","dative-genitive-indefinite-singular":"fixații","dative-definite-genitive-singular":"fixației","dative-genitive-indefinite-plural":"fixații","dative-definite-genitive-plural":"fixațiilor","singular-vocative":"fixație","plural-vocative":"fixațiilor"}},{"word":"fixativ","pos":"noun","definitions":["fixative"],"forms":{"plural":"fixativi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fixativ","accusative-definite-nominative-singular":"fixativul","accusative-indefinite-nominative-plural":"fixativi","accusative-definite-nominative-plural":"fixativile","dative-genitive-indefinite-singular":"fixativ","dative-definite-genitive-singular":"fixativului","dative-genitive-indefinite-plural":"fixativi","dative-definite-genitive-plural":"fixativilor","singular-vocative":"fixativule","plural-vocative":"fixativilor"}},{"word":"fixator","pos":"noun","definitions":["fixative"],"forms":{"plural":"fixatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fixator","accusative-definite-nominative-singular":"fixatorul","accusative-indefinite-nominative-plural":"fixatori","accusative-definite-nominative-plural":"fixatorii","dative-genitive-indefinite-singular":"fixator","dative-definite-genitive-singular":"fixatorului","dative-genitive-indefinite-plural":"fixatori","dative-definite-genitive-plural":"fixatorilor","singular-vocative":"fixatorule","plural-vocative":"fixatorilor"}},{"word":"fixez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fixa"],"pronunciation":"[fiˈksez]"},{"word":"fixism","pos":"noun","definitions":["fixism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fixism","accusative-definite-nominative":"fixismul","dative-genitive-indefinite":"fixism","dative-definite-genitive":"fixismului","vocative":"fixismule"}},{"word":"fixist","pos":"noun","definitions":["fixist"],"forms":{"plural":"fixiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fixist","accusative-definite-nominative-singular":"fixistul","accusative-indefinite-nominative-plural":"fixiști","accusative-definite-nominative-plural":"fixiștii","dative-genitive-indefinite-singular":"fixist","dative-definite-genitive-singular":"fixistului","dative-genitive-indefinite-plural":"fixiști","dative-definite-genitive-plural":"fixiștilor","singular-vocative":"fixistule","plural-vocative":"fixiștilor"}},{"word":"fixistă","pos":"noun","definitions":["female equivalent of fixist"],"forms":{"plural":"fixiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fixistă","accusative-definite-nominative-singular":"fixista","accusative-indefinite-nominative-plural":"fixiste","accusative-definite-nominative-plural":"fixistele","dative-genitive-indefinite-singular":"fixiste","dative-definite-genitive-singular":"fixistei","dative-genitive-indefinite-plural":"fixiste","dative-definite-genitive-plural":"fixistelor","singular-vocative":"fixistă","plural-vocative":"fixistelor"}},{"word":"fixitate","pos":"noun","definitions":["fixity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fixitate","accusative-definite-nominative-singular":"fixitatea","accusative-indefinite-nominative-plural":"fixități","accusative-definite-nominative-plural":"fixitățile","dative-genitive-indefinite-singular":"fixități","dative-definite-genitive-singular":"fixității","dative-genitive-indefinite-plural":"fixități","dative-definite-genitive-plural":"fixităților","singular-vocative":"fixitate","plural-vocative":"fixităților"}},{"word":"Fizeș","pos":"name","definitions":["a village in Berzovia, Caraș-Severin County, Romania","a village in Băița, Hunedoara County, Romania","a village in Sâg, Sălaj County, Romania"],"gender":"m"},{"word":"Fizeșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fizeșan"}},{"word":"Fizești","pos":"name","definitions":["a village in Pui, Hunedoara County, Romania"],"gender":"m"},{"word":"Fizeșu Gherlii","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Fizeșu Gherlii, Cluj County, Romania"],"gender":"m"},{"word":"fizic","pos":"adj","definitions":["physical"],"pronunciation":"/ˈfi.zik/","forms":{"feminine-singular":"fizică","masculine-plural":"fizici","feminine-neuter-plural":"fizice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fizic","error-unrecognized-form-feminine-indefinite-singular":"fizică","error-unrecognized-form-indefinite-masculine-plural":"fizici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fizice","definite-error-unrecognized-form-masculine-neuter-singular":"fizicul","definite-error-unrecognized-form-feminine-singular":"fizica","definite-error-unrecognized-form-masculine-plural":"fizicii","definite-error-unrecognized-form-feminine-neuter-plural":"fizicele"}},{"word":"fizica","pos":"adj","definitions":["definite feminine nominative/accusative singular of fizic"]},{"word":"fizică","pos":"noun","definitions":["physics"]},{"word":"fizică chimică","pos":"noun","definitions":["chemical physics"]},{"word":"fizică clasică","pos":"noun","definitions":["classical physics"]},{"word":"fizică cuantică","pos":"noun","definitions":["quantum physics"]},{"word":"fizică nucleară","pos":"noun","definitions":["nuclear physics"]},{"word":"fizica particulelor","pos":"noun","definitions":["particle physics"]},{"word":"fizica particulelor elementare","pos":"noun","definitions":["particle physics"]},{"word":"fizica radiațiilor","pos":"noun","definitions":["radiation physics"]},{"word":"fizical","pos":"adj","definitions":["physical"],"forms":{"feminine-singular":"fizicală","masculine-plural":"fizicali","feminine-neuter-plural":"fizicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fizical","error-unrecognized-form-feminine-indefinite-singular":"fizicală","error-unrecognized-form-indefinite-masculine-plural":"fizicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fizicale","definite-error-unrecognized-form-masculine-neuter-singular":"fizicalul","definite-error-unrecognized-form-feminine-singular":"fizicala","definite-error-unrecognized-form-masculine-plural":"fizicalii","definite-error-unrecognized-form-feminine-neuter-plural":"fizicalele"}},{"word":"fizicalism","pos":"noun","definitions":["physicalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fizicalism","accusative-definite-nominative-singular":"fizicalismul","accusative-indefinite-nominative-plural":"fizicalisme","accusative-definite-nominative-plural":"fizicalismele","dative-genitive-indefinite-singular":"fizicalism","dative-definite-genitive-singular":"fizicalismului","dative-genitive-indefinite-plural":"fizicalisme","dative-definite-genitive-plural":"fizicalismelor","singular-vocative":"fizicalismule","plural-vocative":"fizicalismelor"}},{"word":"fizicalist","pos":"noun","definitions":["physicalist"],"forms":{"plural":"fizicaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fizicalist","accusative-definite-nominative-singular":"fizicalistul","accusative-indefinite-nominative-plural":"fizicaliști","accusative-definite-nominative-plural":"fizicaliștii","dative-genitive-indefinite-singular":"fizicalist","dative-definite-genitive-singular":"fizicalistului","dative-genitive-indefinite-plural":"fizicaliști","dative-definite-genitive-plural":"fizicaliștilor","singular-vocative":"fizicalistule","plural-vocative":"fizicaliștilor"}},{"word":"fizicalistă","pos":"noun","definitions":["female equivalent of fizicalist"],"forms":{"plural":"fizicaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fizicalistă","accusative-definite-nominative-singular":"fizicalista","accusative-indefinite-nominative-plural":"fizicaliste","accusative-definite-nominative-plural":"fizicalistele","dative-genitive-indefinite-singular":"fizicaliste","dative-definite-genitive-singular":"fizicalistei","dative-genitive-indefinite-plural":"fizicaliste","dative-definite-genitive-plural":"fizicalistelor","singular-vocative":"fizicalistă","plural-vocative":"fizicalistelor"}},{"word":"fizicește","pos":"adv","definitions":["physically"]},{"word":"fizician","pos":"noun","definitions":["physicist"],"pronunciation":"/fi.zi.t͡ʃiˈan/","forms":{"plural":"fizicieni","feminine":"equivalent fiziciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fizician","accusative-definite-nominative-singular":"fizicianul","accusative-indefinite-nominative-plural":"fizicieni","accusative-definite-nominative-plural":"fizicienii","dative-genitive-indefinite-singular":"fizician","dative-definite-genitive-singular":"fizicianului","dative-genitive-indefinite-plural":"fizicieni","dative-definite-genitive-plural":"fizicienilor","singular-vocative":"fizicianule","plural-vocative":"fizicienilor"}},{"word":"fiziciană","pos":"noun","definitions":["female equivalent of fizician"],"pronunciation":"/fi.zi.t͡ʃiˈa.nə/","forms":{"plural":"fiziciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fiziciană","accusative-definite-nominative-singular":"fiziciana","accusative-indefinite-nominative-plural":"fiziciene","accusative-definite-nominative-plural":"fizicienele","dative-genitive-indefinite-singular":"fiziciene","dative-definite-genitive-singular":"fizicienei","dative-genitive-indefinite-plural":"fiziciene","dative-definite-genitive-plural":"fizicienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"fiziciene","pos":"noun","definitions":["plural of fiziciană"],"gender":"f"},{"word":"fizicieni","pos":"noun","definitions":["plural of fizician"],"gender":"m"},{"word":"fiziocrat","pos":"noun","definitions":["physiocrat"],"forms":{"plural":"fiziocrați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiziocrat","accusative-definite-nominative-singular":"fiziocratul","accusative-indefinite-nominative-plural":"fiziocrați","accusative-definite-nominative-plural":"fiziocrații","dative-genitive-indefinite-singular":"fiziocrat","dative-definite-genitive-singular":"fiziocratului","dative-genitive-indefinite-plural":"fiziocrați","dative-definite-genitive-plural":"fiziocraților","singular-vocative":"fiziocratule","plural-vocative":"fiziocraților"}},{"word":"fiziocratic","pos":"adj","definitions":["physiocratic"],"forms":{"feminine-singular":"fiziocratică","masculine-plural":"fiziocratici","feminine-neuter-plural":"fiziocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziocratic","error-unrecognized-form-feminine-indefinite-singular":"fiziocratică","error-unrecognized-form-indefinite-masculine-plural":"fiziocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziocratice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziocraticul","definite-error-unrecognized-form-feminine-singular":"fiziocratica","definite-error-unrecognized-form-masculine-plural":"fiziocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziocraticele"}},{"word":"fiziocrație","pos":"noun","definitions":["physiocracy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziocrație","accusative-definite-nominative-singular":"fiziocrația","accusative-indefinite-nominative-plural":"fiziocrații","accusative-definite-nominative-plural":"fiziocrațiile","dative-genitive-indefinite-singular":"fiziocrații","dative-definite-genitive-singular":"fiziocrației","dative-genitive-indefinite-plural":"fiziocrații","dative-definite-genitive-plural":"fiziocrațiilor","singular-vocative":"fiziocrație","plural-vocative":"fiziocrațiilor"}},{"word":"fiziocratism","pos":"noun","definitions":["physiocratism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fiziocratism","accusative-definite-nominative-singular":"fiziocratismul","accusative-indefinite-nominative-plural":"fiziocratisme","accusative-definite-nominative-plural":"fiziocratismele","dative-genitive-indefinite-singular":"fiziocratism","dative-definite-genitive-singular":"fiziocratismului","dative-genitive-indefinite-plural":"fiziocratisme","dative-definite-genitive-plural":"fiziocratismelor","singular-vocative":"fiziocratismule","plural-vocative":"fiziocratismelor"}},{"word":"fiziognomic","pos":"adj","definitions":["obsolete form of fizionomie"],"forms":{"feminine-singular":"fiziognomică","masculine-plural":"fiziognomici","feminine-neuter-plural":"fiziognomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziognomic","error-unrecognized-form-feminine-indefinite-singular":"fiziognomică","error-unrecognized-form-indefinite-masculine-plural":"fiziognomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziognomice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziognomicul","definite-error-unrecognized-form-feminine-singular":"fiziognomica","definite-error-unrecognized-form-masculine-plural":"fiziognomicii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziognomicele"}},{"word":"fiziognomie","pos":"noun","definitions":["obsolete form of fizionomie"],"forms":{"plural":"fiziognomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziognomie","accusative-definite-nominative-singular":"fiziognomia","accusative-indefinite-nominative-plural":"fiziognomii","accusative-definite-nominative-plural":"fiziognomiile","dative-genitive-indefinite-singular":"fiziognomii","dative-definite-genitive-singular":"fiziognomiei","dative-genitive-indefinite-plural":"fiziognomii","dative-definite-genitive-plural":"fiziognomiilor","singular-vocative":"fiziognomie","plural-vocative":"fiziognomiilor"}},{"word":"fiziognomonic","pos":"adj","definitions":["physiognomonic"],"forms":{"feminine-singular":"fiziognomonică","masculine-plural":"fiziognomonici","feminine-neuter-plural":"fiziognomonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziognomonic","error-unrecognized-form-feminine-indefinite-singular":"fiziognomonică","error-unrecognized-form-indefinite-masculine-plural":"fiziognomonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziognomonice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziognomonicul","definite-error-unrecognized-form-feminine-singular":"fiziognomonica","definite-error-unrecognized-form-masculine-plural":"fiziognomonicii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziognomonicele"}},{"word":"fiziognomonie","pos":"noun","definitions":["physiognomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fiziognomonie","accusative-definite-nominative":"fiziognomonia","dative-genitive-indefinite":"fiziognomonii","dative-definite-genitive":"fiziognomoniei","vocative":"fiziognomonie"}},{"word":"fiziograf","pos":"noun","definitions":["physiographer"],"forms":{"plural":"fiziografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiziograf","accusative-definite-nominative-singular":"fiziograful","accusative-indefinite-nominative-plural":"fiziografi","accusative-definite-nominative-plural":"fiziografii","dative-genitive-indefinite-singular":"fiziograf","dative-definite-genitive-singular":"fiziografului","dative-genitive-indefinite-plural":"fiziografi","dative-definite-genitive-plural":"fiziografilor","singular-vocative":"fiziografule","plural-vocative":"fiziografilor"}},{"word":"fiziografic","pos":"adj","definitions":["physiographic"],"forms":{"feminine-singular":"fiziografică","masculine-plural":"fiziografici","feminine-neuter-plural":"fiziografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziografic","error-unrecognized-form-feminine-indefinite-singular":"fiziografică","error-unrecognized-form-indefinite-masculine-plural":"fiziografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziografice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziograficul","definite-error-unrecognized-form-feminine-singular":"fiziografica","definite-error-unrecognized-form-masculine-plural":"fiziograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziograficele"}},{"word":"fiziografie","pos":"noun","definitions":["physiography"],"forms":{"plural":"fiziografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziografie","accusative-definite-nominative-singular":"fiziografia","accusative-indefinite-nominative-plural":"fiziografii","accusative-definite-nominative-plural":"fiziografiile","dative-genitive-indefinite-singular":"fiziografii","dative-definite-genitive-singular":"fiziografiei","dative-genitive-indefinite-plural":"fiziografii","dative-definite-genitive-plural":"fiziografiilor","singular-vocative":"fiziografie","plural-vocative":"fiziografiilor"}},{"word":"fiziolatrie","pos":"noun","definitions":["physiolatry"],"forms":{"plural":"fiziolatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziolatrie","accusative-definite-nominative-singular":"fiziolatria","accusative-indefinite-nominative-plural":"fiziolatrii","accusative-definite-nominative-plural":"fiziolatriile","dative-genitive-indefinite-singular":"fiziolatrii","dative-definite-genitive-singular":"fiziolatriei","dative-genitive-indefinite-plural":"fiziolatrii","dative-definite-genitive-plural":"fiziolatriilor","singular-vocative":"fiziolatrie","plural-vocative":"fiziolatriilor"}},{"word":"fiziolog","pos":"noun","definitions":["physiologist"],"pronunciation":"/fi.zi.oˈloɡ/","forms":{"plural":"fiziologi","feminine":"equivalent fiziologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiziolog","accusative-definite-nominative-singular":"fiziologul","accusative-indefinite-nominative-plural":"fiziologi","accusative-definite-nominative-plural":"fiziologii","dative-genitive-indefinite-singular":"fiziolog","dative-definite-genitive-singular":"fiziologului","dative-genitive-indefinite-plural":"fiziologi","dative-definite-genitive-plural":"fiziologilor","singular-vocative":"fiziologule","plural-vocative":"fiziologilor"}},{"word":"fiziologa","pos":"noun","definitions":["definite nominative/accusative singular of fiziologă"]},{"word":"fiziologă","pos":"noun","definitions":["female equivalent of fiziolog"],"pronunciation":"/fi.zi.oˈlo.ɡə/","forms":{"plural":"fiziologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fiziologă","accusative-definite-nominative-singular":"fiziologa","accusative-indefinite-nominative-plural":"fiziologe","accusative-definite-nominative-plural":"fiziologele","dative-genitive-indefinite-singular":"fiziologe","dative-definite-genitive-singular":"fiziologei","dative-genitive-indefinite-plural":"fiziologe","dative-definite-genitive-plural":"fiziologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"fiziologe","pos":"noun","definitions":["plural of fiziologă"],"gender":"f"},{"word":"fiziologi","pos":"noun","definitions":["plural of fiziolog"],"gender":"m"},{"word":"fiziologic","pos":"adj","definitions":["physiological"],"forms":{"feminine-singular":"fiziologică","masculine-plural":"fiziologici","feminine-neuter-plural":"fiziologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziologic","error-unrecognized-form-feminine-indefinite-singular":"fiziologică","error-unrecognized-form-indefinite-masculine-plural":"fiziologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziologice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziologicul","definite-error-unrecognized-form-feminine-singular":"fiziologica","definite-error-unrecognized-form-masculine-plural":"fiziologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziologicele"}},{"word":"fiziologie","pos":"noun","definitions":["physiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziologie","accusative-definite-nominative-singular":"fiziologia","accusative-indefinite-nominative-plural":"fiziologii","accusative-definite-nominative-plural":"fiziologiile","dative-genitive-indefinite-singular":"fiziologii","dative-definite-genitive-singular":"fiziologiei","dative-genitive-indefinite-plural":"fiziologii","dative-definite-genitive-plural":"fiziologiilor","singular-vocative":"fiziologie","plural-vocative":"fiziologiilor"}},{"word":"fiziologist","pos":"noun","definitions":["physiologist"],"forms":{"plural":"fiziologiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiziologist","accusative-definite-nominative-singular":"fiziologistul","accusative-indefinite-nominative-plural":"fiziologiști","accusative-definite-nominative-plural":"fiziologiștii","dative-genitive-indefinite-singular":"fiziologist","dative-definite-genitive-singular":"fiziologistului","dative-genitive-indefinite-plural":"fiziologiști","dative-definite-genitive-plural":"fiziologiștilor","singular-vocative":"fiziologistule","plural-vocative":"fiziologiștilor"}},{"word":"fiziologistă","pos":"noun","definitions":["female equivalent of fiziologist"],"forms":{"plural":"fiziologiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiziologistă","accusative-definite-nominative-singular":"fiziologista","accusative-indefinite-nominative-plural":"fiziologiste","accusative-definite-nominative-plural":"fiziologistele","dative-genitive-indefinite-singular":"fiziologiste","dative-definite-genitive-singular":"fiziologistei","dative-genitive-indefinite-plural":"fiziologiste","dative-definite-genitive-plural":"fiziologistelor","singular-vocative":"fiziologistă","plural-vocative":"fiziologistelor"}},{"word":"fizionomic","pos":"adj","definitions":["physiognomic"],"forms":{"feminine-singular":"fizionomică","masculine-plural":"fizionomici","feminine-neuter-plural":"fizionomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fizionomic","error-unrecognized-form-feminine-indefinite-singular":"fizionomică","error-unrecognized-form-indefinite-masculine-plural":"fizionomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fizionomice","definite-error-unrecognized-form-masculine-neuter-singular":"fizionomicul","definite-error-unrecognized-form-feminine-singular":"fizionomica","definite-error-unrecognized-form-masculine-plural":"fizionomicii","definite-error-unrecognized-form-feminine-neuter-plural":"fizionomicele"}},{"word":"fizionomie","pos":"noun","definitions":["physiognomy"],"forms":{"plural":"fizionomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fizionomie","accusative-definite-nominative-singular":"fizionomia","accusative-indefinite-nominative-plural":"fizionomii","accusative-definite-nominative-plural":"fizionomiile","dative-genitive-indefinite-singular":"fizionomii","dative-definite-genitive-singular":"fizionomiei","dative-genitive-indefinite-plural":"fizionomii","dative-definite-genitive-plural":"fizionomiilor","singular-vocative":"fizionomie","plural-vocative":"fizionomiilor"}},{"word":"fizionomist","pos":"noun","definitions":["physiognomist"],"forms":{"plural":"fizionomiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fizionomist","accusative-definite-nominative-singular":"fizionomistul","accusative-indefinite-nominative-plural":"fizionomiști","accusative-definite-nominative-plural":"fizionomiștii","dative-genitive-indefinite-singular":"fizionomist","dative-definite-genitive-singular":"fizionomistului","dative-genitive-indefinite-plural":"fizionomiști","dative-definite-genitive-plural":"fizionomiștilor","singular-vocative":"fizionomistule","plural-vocative":"fizionomiștilor"}},{"word":"fizionomistă","pos":"noun","definitions":["female equivalent of fizionomist"],"forms":{"plural":"fizionomiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fizionomistă","accusative-definite-nominative-singular":"fizionomista","accusative-indefinite-nominative-plural":"fizionomiste","accusative-definite-nominative-plural":"fizionomistele","dative-genitive-indefinite-singular":"fizionomiste","dative-definite-genitive-singular":"fizionomistei","dative-genitive-indefinite-plural":"fizionomiste","dative-definite-genitive-plural":"fizionomistelor","singular-vocative":"fizionomistă","plural-vocative":"fizionomistelor"}},{"word":"fiziopatolog","pos":"noun","definitions":["pathophysiologist"],"forms":{"plural":"fiziopatologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fiziopatolog","accusative-definite-nominative-singular":"fiziopatologul","accusative-indefinite-nominative-plural":"fiziopatologi","accusative-definite-nominative-plural":"fiziopatologii","dative-genitive-indefinite-singular":"fiziopatolog","dative-definite-genitive-singular":"fiziopatologului","dative-genitive-indefinite-plural":"fiziopatologi","dative-definite-genitive-plural":"fiziopatologilor","singular-vocative":"fiziopatologule","plural-vocative":"fiziopatologilor"}},{"word":"fiziopatologă","pos":"noun","definitions":["female equivalent of fiziopatolog"],"forms":{"plural":"fiziopatologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fiziopatologă","accusative-definite-nominative-singular":"fiziopatologa","accusative-indefinite-nominative-plural":"fiziopatologe","accusative-definite-nominative-plural":"fiziopatologele","dative-genitive-indefinite-singular":"fiziopatologe","dative-definite-genitive-singular":"fiziopatologei","dative-genitive-indefinite-plural":"fiziopatologe","dative-definite-genitive-plural":"fiziopatologelor","singular-vocative":"fiziopatologă","plural-vocative":"fiziopatologelor"}},{"word":"fiziopatologic","pos":"adj","definitions":["physiopathological"],"forms":{"feminine-singular":"fiziopatologică","masculine-plural":"fiziopatologici","feminine-neuter-plural":"fiziopatologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fiziopatologic","error-unrecognized-form-feminine-indefinite-singular":"fiziopatologică","error-unrecognized-form-indefinite-masculine-plural":"fiziopatologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fiziopatologice","definite-error-unrecognized-form-masculine-neuter-singular":"fiziopatologicul","definite-error-unrecognized-form-feminine-singular":"fiziopatologica","definite-error-unrecognized-form-masculine-plural":"fiziopatologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fiziopatologicele"}},{"word":"fiziopatologie","pos":"noun","definitions":["pathophysiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fiziopatologie","accusative-definite-nominative-singular":"fiziopatologia","accusative-indefinite-nominative-plural":"fiziopatologii","accusative-definite-nominative-plural":"fiziopatologiile","dative-genitive-indefinite-singular":"fiziopatologii","dative-definite-genitive-singular":"fiziopatologiei","dative-genitive-indefinite-plural":"fiziopatologii","dative-definite-genitive-plural":"fiziopatologiilor","singular-vocative":"fiziopatologie","plural-vocative":"fiziopatologiilor"}},{"word":"fizioterapeut","pos":"noun","definitions":["physiotherapist"],"forms":{"plural":"fizioterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fizioterapeut","accusative-definite-nominative-singular":"fizioterapeutul","accusative-indefinite-nominative-plural":"fizioterapeuți","accusative-definite-nominative-plural":"fizioterapeuții","dative-genitive-indefinite-singular":"fizioterapeut","dative-definite-genitive-singular":"fizioterapeutului","dative-genitive-indefinite-plural":"fizioterapeuți","dative-definite-genitive-plural":"fizioterapeuților","singular-vocative":"fizioterapeutule","plural-vocative":"fizioterapeuților"}},{"word":"fizioterapeută","pos":"noun","definitions":["female equivalent of fizioterapeut"],"forms":{"plural":"fizioterapeute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fizioterapeută","accusative-definite-nominative-singular":"fizioterapeuta","accusative-indefinite-nominative-plural":"fizioterapeute","accusative-definite-nominative-plural":"fizioterapeutele","dative-genitive-indefinite-singular":"fizioterapeute","dative-definite-genitive-singular":"fizioterapeutei","dative-genitive-indefinite-plural":"fizioterapeute","dative-definite-genitive-plural":"fizioterapeutelor","singular-vocative":"fizioterapeută","plural-vocative":"fizioterapeutelor"}},{"word":"fizioterapic","pos":"adj","definitions":["physiotherapeutic"],"forms":{"feminine-singular":"fizioterapică","masculine-plural":"fizioterapici","feminine-neuter-plural":"fizioterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fizioterapic","error-unrecognized-form-feminine-indefinite-singular":"fizioterapică","error-unrecognized-form-indefinite-masculine-plural":"fizioterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fizioterapice","definite-error-unrecognized-form-masculine-neuter-singular":"fizioterapicul","definite-error-unrecognized-form-feminine-singular":"fizioterapica","definite-error-unrecognized-form-masculine-plural":"fizioterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"fizioterapicele"}},{"word":"fizioterapie","pos":"noun","definitions":["physiotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fizioterapie","accusative-definite-nominative-singular":"fizioterapia","accusative-indefinite-nominative-plural":"fizioterapii","accusative-definite-nominative-plural":"fizioterapiile","dative-genitive-indefinite-singular":"fizioterapii","dative-definite-genitive-singular":"fizioterapiei","dative-genitive-indefinite-plural":"fizioterapii","dative-definite-genitive-plural":"fizioterapiilor","singular-vocative":"fizioterapie","plural-vocative":"fizioterapiilor"}},{"word":"Fiziș","pos":"name","definitions":["a village in Finiș, Bihor County, Romania"],"gender":"m"},{"word":"flabel","pos":"noun","definitions":["flabellum (fan)"],"forms":{"plural":"flabeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flabel","accusative-definite-nominative-singular":"flabelul","accusative-indefinite-nominative-plural":"flabeluri","accusative-definite-nominative-plural":"flabelurile","dative-genitive-indefinite-singular":"flabel","dative-definite-genitive-singular":"flabelului","dative-genitive-indefinite-plural":"flabeluri","dative-definite-genitive-plural":"flabelurilor","singular-vocative":"flabelule","plural-vocative":"flabelurilor"}},{"word":"flabelat","pos":"adj","definitions":["flabellate"],"forms":{"feminine-singular":"flabelată","masculine-plural":"flabelați","feminine-neuter-plural":"flabelate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flabelat","error-unrecognized-form-feminine-indefinite-singular":"flabelată","error-unrecognized-form-indefinite-masculine-plural":"flabelați","error-unrecognized-form-feminine-indefinite-neuter-plural":"flabelate","definite-error-unrecognized-form-masculine-neuter-singular":"flabelatul","definite-error-unrecognized-form-feminine-singular":"flabelata","definite-error-unrecognized-form-masculine-plural":"flabelații","definite-error-unrecognized-form-feminine-neuter-plural":"flabelatele"}},{"word":"flabeliform","pos":"adj","definitions":["flabelliform, flabellate"],"forms":{"feminine-singular":"flabeliformă","masculine-plural":"flabeliformi","feminine-neuter-plural":"flabeliforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flabeliform","error-unrecognized-form-feminine-indefinite-singular":"flabeliformă","error-unrecognized-form-indefinite-masculine-plural":"flabeliformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"flabeliforme","definite-error-unrecognized-form-masculine-neuter-singular":"flabeliformul","definite-error-unrecognized-form-feminine-singular":"flabeliforma","definite-error-unrecognized-form-masculine-plural":"flabeliformii","definite-error-unrecognized-form-feminine-neuter-plural":"flabeliformele"}},{"word":"flăcăi","pos":"noun","definitions":["plural of flăcău"]},{"word":"flăcăiandru","pos":"noun","definitions":["stripling"],"forms":{"plural":"flăcăiandri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăiandru","accusative-definite-nominative-singular":"flăcăiandrul","accusative-indefinite-nominative-plural":"flăcăiandri","accusative-definite-nominative-plural":"flăcăiandrii","dative-genitive-indefinite-singular":"flăcăiandru","dative-definite-genitive-singular":"flăcăiandrului","dative-genitive-indefinite-plural":"flăcăiandri","dative-definite-genitive-plural":"flăcăiandrilor","singular-vocative":"flăcăiandrule","plural-vocative":"flăcăiandrilor"}},{"word":"flăcăiaș","pos":"noun","definitions":["diminutive of flăcău; small boy"],"forms":{"plural":"flăcăiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăiaș","accusative-definite-nominative-singular":"flăcăiașul","accusative-indefinite-nominative-plural":"flăcăiași","accusative-definite-nominative-plural":"flăcăiașii","dative-genitive-indefinite-singular":"flăcăiaș","dative-definite-genitive-singular":"flăcăiașului","dative-genitive-indefinite-plural":"flăcăiași","dative-definite-genitive-plural":"flăcăiașilor","singular-vocative":"flăcăiașule","plural-vocative":"flăcăiașilor"}},{"word":"flăcăiași","pos":"noun","definitions":["plural of flăcăiaș"]},{"word":"flăcăime","pos":"noun","definitions":["collective noun for lads"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"flăcăime","accusative-definite-nominative":"flăcăimea","dative-genitive-indefinite":"flăcăime","dative-definite-genitive":"flăcăimei","vocative":"flăcăime"}},{"word":"flacără","pos":"noun","definitions":["flame"],"pronunciation":"[ˈflakərə]","forms":{"plural":"flăcări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flacără","accusative-definite-nominative-singular":"flacăra","accusative-indefinite-nominative-plural":"flăcări","accusative-definite-nominative-plural":"flăcările","dative-genitive-indefinite-singular":"flăcări","dative-definite-genitive-singular":"flăcării","dative-genitive-indefinite-plural":"flăcări","dative-definite-genitive-plural":"flăcărilor","singular-vocative":"flacără","plural-vocative":"flăcărilor"}},{"word":"flăcăraie","pos":"noun","definitions":["flare"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"flăcăraie","accusative-definite-nominative":"flăcăraia","dative-genitive-indefinite":"flăcăraii","dative-definite-genitive":"flăcăraiei","vocative":"flăcăraie"}},{"word":"flăcărie","pos":"noun","definitions":["flame"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"flăcărie","accusative-definite-nominative":"flăcăria","dative-genitive-indefinite":"flăcării","dative-definite-genitive":"flăcăriei","vocative":"flăcărie"}},{"word":"flăcăruie","pos":"noun","definitions":["smalla flame"],"forms":{"plural":"flăcărui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"flăcăruie","accusative-definite-nominative-singular":"flăcăruia","accusative-indefinite-nominative-plural":"flăcărui","accusative-definite-nominative-plural":"flăcăruile","dative-genitive-indefinite-singular":"flăcărui","dative-definite-genitive-singular":"flăcăruii","dative-genitive-indefinite-plural":"flăcărui","dative-definite-genitive-plural":"flăcăruilor","singular-vocative":"flăcăruie","plural-vocative":"flăcăruilor"}},{"word":"flăcărușă","pos":"noun","definitions":["diminutive of flacără"],"forms":{"plural":"flăcărușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flăcărușă","accusative-definite-nominative-singular":"flăcărușa","accusative-indefinite-nominative-plural":"flăcărușe","accusative-definite-nominative-plural":"flăcărușele","dative-genitive-indefinite-singular":"flăcărușe","dative-definite-genitive-singular":"flăcărușei","dative-genitive-indefinite-plural":"flăcărușe","dative-definite-genitive-plural":"flăcărușelor","singular-vocative":"flăcărușă","plural-vocative":"flăcărușelor"}},{"word":"flăcăruță","pos":"noun","definitions":["diminutive of flacără"],"forms":{"plural":"flăcăruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flăcăruță","accusative-definite-nominative-singular":"flăcăruța","accusative-indefinite-nominative-plural":"flăcăruțe","accusative-definite-nominative-plural":"flăcăruțele","dative-genitive-indefinite-singular":"flăcăruțe","dative-definite-genitive-singular":"flăcăruței","dative-genitive-indefinite-plural":"flăcăruțe","dative-definite-genitive-plural":"flăcăruțelor","singular-vocative":"flăcăruță","plural-vocative":"flăcăruțelor"}},{"word":"flăcău","pos":"noun","definitions":["lad, youth","bachelor, single or unmarried man"],"pronunciation":"/fləˈkəw/","forms":{"plural":"flăcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"flăcău","accusative-definite-nominative-singular":"flăcăul","accusative-indefinite-nominative-plural":"flăcăi","accusative-definite-nominative-plural":"flăcăii","dative-genitive-indefinite-singular":"flăcău","dative-definite-genitive-singular":"flăcăului","dative-genitive-indefinite-plural":"flăcăi","dative-definite-genitive-plural":"flăcăilor","singular-vocative":"flăcăule","plural-vocative":"flăcăilor"}},{"word":"flăcăuan","pos":"noun","definitions":["lad, stripling"],"forms":{"plural":"flăcăuani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăuan","accusative-definite-nominative-singular":"flăcăuanul","accusative-indefinite-nominative-plural":"flăcăuani","accusative-definite-nominative-plural":"flăcăuanii","dative-genitive-indefinite-singular":"flăcăuan","dative-definite-genitive-singular":"flăcăuanului","dative-genitive-indefinite-plural":"flăcăuani","dative-definite-genitive-plural":"flăcăuanilor","singular-vocative":"flăcăuanule","plural-vocative":"flăcăuanilor"}},{"word":"flăcăuandru","pos":"noun","definitions":["alternative form of flăcăiandru"],"forms":{"plural":"flăcăuandri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăuandru","accusative-definite-nominative-singular":"flăcăuandruul","accusative-indefinite-nominative-plural":"flăcăuandri","accusative-definite-nominative-plural":"flăcăuandrii","dative-genitive-indefinite-singular":"flăcăuandru","dative-definite-genitive-singular":"flăcăuandruului","dative-genitive-indefinite-plural":"flăcăuandri","dative-definite-genitive-plural":"flăcăuandrilor","singular-vocative":"flăcăuandruule","plural-vocative":"flăcăuandrilor"}},{"word":"flăcăuaș","pos":"noun","definitions":["alternative form of flăcăiaș"],"forms":{"plural":"flăcăuași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăuaș","accusative-definite-nominative-singular":"flăcăuașul","accusative-indefinite-nominative-plural":"flăcăuași","accusative-definite-nominative-plural":"flăcăuașii","dative-genitive-indefinite-singular":"flăcăuaș","dative-definite-genitive-singular":"flăcăuașului","dative-genitive-indefinite-plural":"flăcăuași","dative-definite-genitive-plural":"flăcăuașilor","singular-vocative":"flăcăuașule","plural-vocative":"flăcăuașilor"}},{"word":"flăcăuș","pos":"noun","definitions":["diminutive of flăcău; small boy"],"forms":{"plural":"flăcăuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flăcăuș","accusative-definite-nominative-singular":"flăcăușul","accusative-indefinite-nominative-plural":"flăcăuși","accusative-definite-nominative-plural":"flăcăușii","dative-genitive-indefinite-singular":"flăcăuș","dative-definite-genitive-singular":"flăcăușului","dative-genitive-indefinite-plural":"flăcăuși","dative-definite-genitive-plural":"flăcăușilor","singular-vocative":"flăcăușule","plural-vocative":"flăcăușilor"}},{"word":"flacid","pos":"adj","definitions":["flaccid"],"forms":{"feminine-singular":"flacidă","masculine-plural":"flacizi","feminine-neuter-plural":"flacide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flacid","error-unrecognized-form-feminine-indefinite-singular":"flacidă","error-unrecognized-form-indefinite-masculine-plural":"flacizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"flacide","definite-error-unrecognized-form-masculine-neuter-singular":"flacidul","definite-error-unrecognized-form-feminine-singular":"flacida","definite-error-unrecognized-form-masculine-plural":"flacizii","definite-error-unrecognized-form-feminine-neuter-plural":"flacidele"}},{"word":"flaciditate","pos":"noun","definitions":["flaccidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"flaciditate","accusative-definite-nominative":"flaciditatea","dative-genitive-indefinite":"flacidități","dative-definite-genitive":"flacidității","vocative":"-"}},{"word":"flacon","pos":"noun","definitions":["small bottle (for medicine, cosmetics)"],"forms":{"plural":"flacoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flacon","accusative-definite-nominative-singular":"flaconul","accusative-indefinite-nominative-plural":"flacoane","accusative-definite-nominative-plural":"flacoanele","dative-genitive-indefinite-singular":"flacon","dative-definite-genitive-singular":"flaconului","dative-genitive-indefinite-plural":"flacoane","dative-definite-genitive-plural":"flacoanelor","singular-vocative":"flaconule","plural-vocative":"flacoanelor"}},{"word":"flaconaș","pos":"noun","definitions":["diminutive of flacon; small vial"],"forms":{"plural":"flaconașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flaconaș","accusative-definite-nominative-singular":"flaconașul","accusative-indefinite-nominative-plural":"flaconașe","accusative-definite-nominative-plural":"flaconașele","dative-genitive-indefinite-singular":"flaconaș","dative-definite-genitive-singular":"flaconașului","dative-genitive-indefinite-plural":"flaconașe","dative-definite-genitive-plural":"flaconașelor","singular-vocative":"flaconașule","plural-vocative":"flaconașelor"}},{"word":"flagel","pos":"noun","definitions":["scourge, whip","calamity, disaster"],"forms":{"plural":"flageluri"}},{"word":"flagela","pos":"verb","definitions":["to flog"],"pronunciation":"/fla.d͡ʒeˈla/","forms":{"canonical":"a flagela 1st conjugation","present-singular-third-person":"flagelează","participle-past":"flagelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flagela","gerund":"flagelând","first-person-indicative-present-singular":"flagelez","indicative-present-second-person-singular":"flagelezi","indicative-present-singular-third-person":"flagelează","first-person-indicative-plural-present":"flagelăm","indicative-plural-present-second-person":"flagelați","indicative-plural-present-third-person":"flagelează","first-person-imperfect-indicative-singular":"flagelam","imperfect-indicative-second-person-singular":"flagelai","imperfect-indicative-singular-third-person":"flagela","first-person-imperfect-indicative-plural":"flagelam","imperfect-indicative-plural-second-person":"flagelați","imperfect-indicative-plural-third-person":"flagelau","first-person-indicative-perfect-singular":"flagelai","indicative-perfect-second-person-singular":"flagelași","indicative-perfect-singular-third-person":"flagelă","first-person-indicative-perfect-plural":"flagelarăm","indicative-perfect-plural-second-person":"flagelarăți","indicative-perfect-plural-third-person":"flagelară","first-person-indicative-pluperfect-singular":"flagelasem","indicative-pluperfect-second-person-singular":"flagelaseși","indicative-pluperfect-singular-third-person":"flagelase","first-person-indicative-pluperfect-plural":"flagelaserăm","indicative-pluperfect-plural-second-person":"flagelaserăți","indicative-pluperfect-plural-third-person":"flagelaseră","first-person-present-singular-subjunctive":"să flagelez","present-second-person-singular-subjunctive":"să flagelezi","present-singular-subjunctive-third-person":"să flageleze","first-person-plural-present-subjunctive":"să flagelăm","plural-present-second-person-subjunctive":"să flagelați","plural-present-subjunctive-third-person":"să flageleze","imperative-second-person-singular":"flagelează","imperative-plural-second-person":"flagelați","imperative-negative-second-person-singular":"nu flagela","imperative-negative-plural-second-person":"nu flagelați"}},{"word":"flagelare","pos":"noun","definitions":["flogging"],"forms":{"plural":"flagelări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flagelare","accusative-definite-nominative-singular":"flagelarea","accusative-indefinite-nominative-plural":"flagelări","accusative-definite-nominative-plural":"flagelările","dative-genitive-indefinite-singular":"flagelări","dative-definite-genitive-singular":"flagelării","dative-genitive-indefinite-plural":"flagelări","dative-definite-genitive-plural":"flagelărilor","singular-vocative":"flagelare","plural-vocative":"flagelărilor"}},{"word":"flagelat","pos":"noun","definitions":["flagellate"],"forms":{"plural":"flagelate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flagelat","accusative-definite-nominative-singular":"flagelatul","accusative-indefinite-nominative-plural":"flagelate","accusative-definite-nominative-plural":"flagelatele","dative-genitive-indefinite-singular":"flagelat","dative-definite-genitive-singular":"flagelatului","dative-genitive-indefinite-plural":"flagelate","dative-definite-genitive-plural":"flagelatelor","singular-vocative":"flagelatule","plural-vocative":"flagelatelor"}},{"word":"flagelație","pos":"noun","definitions":["flagellation"],"forms":{"plural":"flagelații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flagelație","accusative-definite-nominative-singular":"flagelația","accusative-indefinite-nominative-plural":"flagelații","accusative-definite-nominative-plural":"flagelațiile","dative-genitive-indefinite-singular":"flagelații","dative-definite-genitive-singular":"flagelației","dative-genitive-indefinite-plural":"flagelații","dative-definite-genitive-plural":"flagelațiilor","singular-vocative":"flagelație","plural-vocative":"flagelațiilor"}},{"word":"flagelațiune","pos":"noun","definitions":["obsolete form of flagelație"],"forms":{"plural":"flagelațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flagelațiune","accusative-definite-nominative-singular":"flagelațiunea","accusative-indefinite-nominative-plural":"flagelațiuni","accusative-definite-nominative-plural":"flagelațiunile","dative-genitive-indefinite-singular":"flagelațiuni","dative-definite-genitive-singular":"flagelațiunii","dative-genitive-indefinite-plural":"flagelațiuni","dative-definite-genitive-plural":"flagelațiunilor","singular-vocative":"flagelațiune","plural-vocative":"flagelațiunilor"}},{"word":"flagelator","pos":"adj","definitions":["flagellator"],"forms":{"feminine-singular":"flagelatoare","masculine-plural":"flagelatori","feminine-neuter-plural":"flagelatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flagelator","error-unrecognized-form-feminine-indefinite-singular":"flagelatoare","error-unrecognized-form-indefinite-masculine-plural":"flagelatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"flagelatoare","definite-error-unrecognized-form-masculine-neuter-singular":"flagelatorul","definite-error-unrecognized-form-feminine-singular":"flagelatoarea","definite-error-unrecognized-form-masculine-plural":"flagelatorii","definite-error-unrecognized-form-feminine-neuter-plural":"flagelatoarele"}},{"word":"flagrant","pos":"adj","definitions":["flagrant"],"forms":{"feminine-singular":"flagrantă","masculine-plural":"flagranți","feminine-neuter-plural":"flagrante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flagrant","error-unrecognized-form-feminine-indefinite-singular":"flagrantă","error-unrecognized-form-indefinite-masculine-plural":"flagranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flagrante","definite-error-unrecognized-form-masculine-neuter-singular":"flagrantul","definite-error-unrecognized-form-feminine-singular":"flagranta","definite-error-unrecognized-form-masculine-plural":"flagranții","definite-error-unrecognized-form-feminine-neuter-plural":"flagrantele"}},{"word":"flagrant delict","pos":"noun","definitions":["flagrante delicto"]},{"word":"flagranță","pos":"noun","definitions":["flagrance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flagranță","accusative-definite-nominative-singular":"flagranța","accusative-indefinite-nominative-plural":"flagranțe","accusative-definite-nominative-plural":"flagranțele","dative-genitive-indefinite-singular":"flagranțe","dative-definite-genitive-singular":"flagranței","dative-genitive-indefinite-plural":"flagranțe","dative-definite-genitive-plural":"flagranțelor","singular-vocative":"flagranță","plural-vocative":"flagranțelor"}},{"word":"flaimoc","pos":"noun","definitions":["a fool"],"forms":{"plural":"flaimoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flaimoc","accusative-definite-nominative-singular":"flaimocul","accusative-indefinite-nominative-plural":"flaimoci","accusative-definite-nominative-plural":"flaimocii","dative-genitive-indefinite-singular":"flaimoc","dative-definite-genitive-singular":"flaimocului","dative-genitive-indefinite-plural":"flaimoci","dative-definite-genitive-plural":"flaimocilor","singular-vocative":"flaimocule","plural-vocative":"flaimocilor"}},{"word":"flaimuc","pos":"noun","definitions":["obsolete form of flaimoc"],"forms":{"plural":"flaimuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flaimuc","accusative-definite-nominative-singular":"flaimucul","accusative-indefinite-nominative-plural":"flaimuci","accusative-definite-nominative-plural":"flaimucii","dative-genitive-indefinite-singular":"flaimuc","dative-definite-genitive-singular":"flaimucului","dative-genitive-indefinite-plural":"flaimuci","dative-definite-genitive-plural":"flaimucilor","singular-vocative":"flaimucule","plural-vocative":"flaimucilor"}},{"word":"flajeolet","pos":"noun","definitions":["alternative form of flajolet"],"forms":{"plural":"flajeolete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flajeolet","accusative-definite-nominative-singular":"flajeoletul","accusative-indefinite-nominative-plural":"flajeolete","accusative-definite-nominative-plural":"flajeoletele","dative-genitive-indefinite-singular":"flajeolet","dative-definite-genitive-singular":"flajeoletului","dative-genitive-indefinite-plural":"flajeolete","dative-definite-genitive-plural":"flajeoletelor","singular-vocative":"flajeoletule","plural-vocative":"flajeoletelor"}},{"word":"flajolet","pos":"noun","definitions":["flageolet (flute)"],"forms":{"plural":"flajolete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flajolet","accusative-definite-nominative-singular":"flajoletul","accusative-indefinite-nominative-plural":"flajolete","accusative-definite-nominative-plural":"flajoletele","dative-genitive-indefinite-singular":"flajolet","dative-definite-genitive-singular":"flajoletului","dative-genitive-indefinite-plural":"flajolete","dative-definite-genitive-plural":"flajoletelor","singular-vocative":"flajoletule","plural-vocative":"flajoletelor"}},{"word":"flama","pos":"noun","definitions":["definite nominative/accusative singular of flamă"],"pronunciation":"[ˈflama]","gender":"f"},{"word":"flamă","pos":"noun","definitions":["flame"],"forms":{"plural":"flame"}},{"word":"flamand","pos":"noun","definitions":["Fleming"],"pronunciation":"/flaˈmand/","forms":{"plural":"flamanzi","feminine":"equivalent flamandă"}},{"word":"flamand","pos":"adj","definitions":["Flemish"],"pronunciation":"/flaˈmand/","forms":{"feminine-singular":"flamandă","masculine-plural":"flamanzi","feminine-neuter-plural":"flamande","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flamand","error-unrecognized-form-feminine-indefinite-singular":"flamandă","error-unrecognized-form-indefinite-masculine-plural":"flamanzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"flamande","definite-error-unrecognized-form-masculine-neuter-singular":"flamandul","definite-error-unrecognized-form-feminine-singular":"flamanda","definite-error-unrecognized-form-masculine-plural":"flamanzii","definite-error-unrecognized-form-feminine-neuter-plural":"flamandele"}},{"word":"Flămând","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flămând"}},{"word":"flămând","pos":"adj","definitions":["starving, famished, hungry"],"pronunciation":"/flə.ˈmɨnd/","forms":{"feminine-singular":"flămândă","masculine-plural":"flămânzi","feminine-neuter-plural":"flămânde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flămând","error-unrecognized-form-feminine-indefinite-singular":"flămândă","error-unrecognized-form-indefinite-masculine-plural":"flămânzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"flămânde","definite-error-unrecognized-form-masculine-neuter-singular":"flămândul","definite-error-unrecognized-form-feminine-singular":"flămânda","definite-error-unrecognized-form-masculine-plural":"flămânzii","definite-error-unrecognized-form-feminine-neuter-plural":"flămândele"}},{"word":"flamandă","pos":"noun","definitions":["female equivalent of flamand"],"forms":{"plural":"flamande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flamandă","accusative-definite-nominative-singular":"flamanda","accusative-indefinite-nominative-plural":"flamande","accusative-definite-nominative-plural":"flamandele","dative-genitive-indefinite-singular":"flamande","dative-definite-genitive-singular":"flamandei","dative-genitive-indefinite-plural":"flamande","dative-definite-genitive-plural":"flamandelor","singular-vocative":"flamandă","plural-vocative":"flamandelor"}},{"word":"Flămânda","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Șușița"],"gender":"f"},{"word":"flămânjor","pos":"adj","definitions":["diminutive of flămând"],"forms":{"feminine-singular":"flămânjoră","masculine-plural":"flămânjori","feminine-neuter-plural":"flămânjore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flămânjor","error-unrecognized-form-feminine-indefinite-singular":"flămânjoră","error-unrecognized-form-indefinite-masculine-plural":"flămânjori","error-unrecognized-form-feminine-indefinite-neuter-plural":"flămânjore","definite-error-unrecognized-form-masculine-neuter-singular":"flămânjorul","definite-error-unrecognized-form-feminine-singular":"flămânjora","definite-error-unrecognized-form-masculine-plural":"flămânjorii","definite-error-unrecognized-form-feminine-neuter-plural":"flămânjorele"}},{"word":"flămânjune","pos":"noun","definitions":["hunger, starvation"],"forms":{"plural":"flămânjuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flămânjune","accusative-definite-nominative-singular":"flămânjunea","accusative-indefinite-nominative-plural":"flămânjuni","accusative-definite-nominative-plural":"flămânjunile","dative-genitive-indefinite-singular":"flămânjuni","dative-definite-genitive-singular":"flămânjunii","dative-genitive-indefinite-plural":"flămânjuni","dative-definite-genitive-plural":"flămânjunilor","singular-vocative":"flămânjune","plural-vocative":"flămânjunilor"}},{"word":"flămănzăciune","pos":"noun","definitions":["famine"],"forms":{"plural":"flămănzăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flămănzăciune","accusative-definite-nominative-singular":"flămănzăciunea","accusative-indefinite-nominative-plural":"flămănzăciuni","accusative-definite-nominative-plural":"flămănzăciunile","dative-genitive-indefinite-singular":"flămănzăciuni","dative-definite-genitive-singular":"flămănzăciunii","dative-genitive-indefinite-plural":"flămănzăciuni","dative-definite-genitive-plural":"flămănzăciunilor","singular-vocative":"flămănzăciune","plural-vocative":"flămănzăciunilor"}},{"word":"flămânzenie","pos":"noun","definitions":["hunger"],"forms":{"plural":"flămânzenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flămânzenie","accusative-definite-nominative-singular":"flămânzenia","accusative-indefinite-nominative-plural":"flămânzenii","accusative-definite-nominative-plural":"flămânzeniile","dative-genitive-indefinite-singular":"flămânzenii","dative-definite-genitive-singular":"flămânzeniei","dative-genitive-indefinite-plural":"flămânzenii","dative-definite-genitive-plural":"flămânzeniilor","singular-vocative":"flămânzenie","plural-vocative":"flămânzeniilor"}},{"word":"Flămânzi","pos":"name","definitions":["a city in Botoșani County, Romania"],"gender":"m"},{"word":"flămânzi","pos":"verb","definitions":["to starve"],"pronunciation":"/flə.mɨnˈzi/","forms":{"canonical":"a flămânzi 4th conjugation","present-singular-third-person":"flămânzește","participle-past":"flămânzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a flămânzi","gerund":"flămânzind","first-person-indicative-present-singular":"flămânzesc","indicative-present-second-person-singular":"flămânzești","indicative-present-singular-third-person":"flămânzește","first-person-indicative-plural-present":"flămânzim","indicative-plural-present-second-person":"flămânziți","indicative-plural-present-third-person":"flămânzesc","first-person-imperfect-indicative-singular":"flămânzeam","imperfect-indicative-second-person-singular":"flămânzeai","imperfect-indicative-singular-third-person":"flămânzea","first-person-imperfect-indicative-plural":"flămânzeam","imperfect-indicative-plural-second-person":"flămânzeați","imperfect-indicative-plural-third-person":"flămânzeau","first-person-indicative-perfect-singular":"flămânzii","indicative-perfect-second-person-singular":"flămânziși","indicative-perfect-singular-third-person":"flămânzi","first-person-indicative-perfect-plural":"flămânzirăm","indicative-perfect-plural-second-person":"flămânzirăți","indicative-perfect-plural-third-person":"flămânziră","first-person-indicative-pluperfect-singular":"flămânzisem","indicative-pluperfect-second-person-singular":"flămânziseși","indicative-pluperfect-singular-third-person":"flămânzise","first-person-indicative-pluperfect-plural":"flămânziserăm","indicative-pluperfect-plural-second-person":"flămânziserăți","indicative-pluperfect-plural-third-person":"flămânziseră","first-person-present-singular-subjunctive":"să flămânzesc","present-second-person-singular-subjunctive":"să flămânzești","present-singular-subjunctive-third-person":"să flămânzească","first-person-plural-present-subjunctive":"să flămânzim","plural-present-second-person-subjunctive":"să flămânziți","plural-present-subjunctive-third-person":"să flămânzească","imperative-second-person-singular":"flămânzește","imperative-plural-second-person":"flămânziți","imperative-negative-second-person-singular":"nu flămânzi","imperative-negative-plural-second-person":"nu flămânziți"}},{"word":"flămânzică","pos":"noun","definitions":["Draba nemorosa"],"forms":{"plural":"flămânzele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flămânzică","accusative-definite-nominative-singular":"flămânzica","accusative-indefinite-nominative-plural":"flămânzele","accusative-definite-nominative-plural":"flămânzelele","dative-genitive-indefinite-singular":"flămânzele","dative-definite-genitive-singular":"flămânzelei","dative-genitive-indefinite-plural":"flămânzele","dative-definite-genitive-plural":"flămânzelelor","singular-vocative":"flămânzică","plural-vocative":"flămânzelelor"}},{"word":"flămânzie","pos":"noun","definitions":["hunger"],"forms":{"plural":"flămânzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flămânzie","accusative-definite-nominative-singular":"flămânzia","accusative-indefinite-nominative-plural":"flămânzii","accusative-definite-nominative-plural":"flămânziile","dative-genitive-indefinite-singular":"flămânzii","dative-definite-genitive-singular":"flămânziei","dative-genitive-indefinite-plural":"flămânzii","dative-definite-genitive-plural":"flămânziilor","singular-vocative":"flămânzie","plural-vocative":"flămânziilor"}},{"word":"flămânzilă","pos":"noun","definitions":["glutton"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"flămânzilă","accusative-definite-nominative":"flămânzilăul","dative-genitive-indefinite":"flămânzilă","dative-definite-genitive":"flămânzilăului","vocative":"flămânzilăule"}},{"word":"flămânzire","pos":"noun","definitions":["starvation"],"forms":{"plural":"flămânziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flămânzire","accusative-definite-nominative-singular":"flămânzirea","accusative-indefinite-nominative-plural":"flămânziri","accusative-definite-nominative-plural":"flămânzirile","dative-genitive-indefinite-singular":"flămânziri","dative-definite-genitive-singular":"flămânzirii","dative-genitive-indefinite-plural":"flămânziri","dative-definite-genitive-plural":"flămânzirilor","singular-vocative":"flămânzire","plural-vocative":"flămânzirilor"}},{"word":"flămânzit","pos":"adj","definitions":["hungry"],"forms":{"feminine-singular":"flămânzită","masculine-plural":"flămânziți","feminine-neuter-plural":"flămânzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flămânzit","error-unrecognized-form-feminine-indefinite-singular":"flămânzită","error-unrecognized-form-indefinite-masculine-plural":"flămânziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flămânzite","definite-error-unrecognized-form-masculine-neuter-singular":"flămânzitul","definite-error-unrecognized-form-feminine-singular":"flămânzita","definite-error-unrecognized-form-masculine-plural":"flămânziții","definite-error-unrecognized-form-feminine-neuter-plural":"flămânzitele"}},{"word":"Flamaropol","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Flamaropol"}}];
@@ -0,0 +1 @@
+export default [{"word":"flamba","pos":"verb","definitions":["to flame"],"forms":{"canonical":"a flamba 1st conjugation","present-singular-third-person":"flambează","participle-past":"flambat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flamba","gerund":"flambând","first-person-indicative-present-singular":"flambez","indicative-present-second-person-singular":"flambezi","indicative-present-singular-third-person":"flambează","first-person-indicative-plural-present":"flambăm","indicative-plural-present-second-person":"flambați","indicative-plural-present-third-person":"flambează","first-person-imperfect-indicative-singular":"flambam","imperfect-indicative-second-person-singular":"flambai","imperfect-indicative-singular-third-person":"flamba","first-person-imperfect-indicative-plural":"flambam","imperfect-indicative-plural-second-person":"flambați","imperfect-indicative-plural-third-person":"flambau","first-person-indicative-perfect-singular":"flambai","indicative-perfect-second-person-singular":"flambași","indicative-perfect-singular-third-person":"flambă","first-person-indicative-perfect-plural":"flambarăm","indicative-perfect-plural-second-person":"flambarăți","indicative-perfect-plural-third-person":"flambară","first-person-indicative-pluperfect-singular":"flambasem","indicative-pluperfect-second-person-singular":"flambaseși","indicative-pluperfect-singular-third-person":"flambase","first-person-indicative-pluperfect-plural":"flambaserăm","indicative-pluperfect-plural-second-person":"flambaserăți","indicative-pluperfect-plural-third-person":"flambaseră","first-person-present-singular-subjunctive":"să flambez","present-second-person-singular-subjunctive":"să flambezi","present-singular-subjunctive-third-person":"să flambeze","first-person-plural-present-subjunctive":"să flambăm","plural-present-second-person-subjunctive":"să flambați","plural-present-subjunctive-third-person":"să flambeze","imperative-second-person-singular":"flambează","imperative-plural-second-person":"flambați","imperative-negative-second-person-singular":"nu flamba","imperative-negative-plural-second-person":"nu flambați"}},{"word":"flambaj","pos":"noun","definitions":["buckling"],"forms":{"plural":"flambaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flambaj","accusative-definite-nominative-singular":"flambajul","accusative-indefinite-nominative-plural":"flambaje","accusative-definite-nominative-plural":"flambajele","dative-genitive-indefinite-singular":"flambaj","dative-definite-genitive-singular":"flambajului","dative-genitive-indefinite-plural":"flambaje","dative-definite-genitive-plural":"flambajelor","singular-vocative":"flambajule","plural-vocative":"flambajelor"}},{"word":"flambare","pos":"noun","definitions":["flambéing"],"forms":{"plural":"flambări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flambare","accusative-definite-nominative-singular":"flambarea","accusative-indefinite-nominative-plural":"flambări","accusative-definite-nominative-plural":"flambările","dative-genitive-indefinite-singular":"flambări","dative-definite-genitive-singular":"flambării","dative-genitive-indefinite-plural":"flambări","dative-definite-genitive-plural":"flambărilor","singular-vocative":"flambare","plural-vocative":"flambărilor"}},{"word":"flamboaiant","pos":"adj","definitions":["flamboyant"],"forms":{"feminine-singular":"flamboaiantă","masculine-plural":"flamboaianți","feminine-neuter-plural":"flamboaiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flamboaiant","error-unrecognized-form-feminine-indefinite-singular":"flamboaiantă","error-unrecognized-form-indefinite-masculine-plural":"flamboaianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flamboaiante","definite-error-unrecognized-form-masculine-neuter-singular":"flamboaiantul","definite-error-unrecognized-form-feminine-singular":"flamboaianta","definite-error-unrecognized-form-masculine-plural":"flamboaianții","definite-error-unrecognized-form-feminine-neuter-plural":"flamboaiantele"}},{"word":"flamboiant","pos":"adj","definitions":["flamboyant"],"forms":{"feminine-singular":"flamboiantă","masculine-plural":"flamboianți","feminine-neuter-plural":"flamboiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flamboiant","error-unrecognized-form-feminine-indefinite-singular":"flamboiantă","error-unrecognized-form-indefinite-masculine-plural":"flamboianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flamboiante","definite-error-unrecognized-form-masculine-neuter-singular":"flamboiantul","definite-error-unrecognized-form-feminine-singular":"flamboianta","definite-error-unrecognized-form-masculine-plural":"flamboianții","definite-error-unrecognized-form-feminine-neuter-plural":"flamboiantele"}},{"word":"flame","pos":"noun","definitions":["inflection of flamă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈflame]","gender":"f"},{"word":"flamenco","pos":"noun","definitions":["flamenco"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"flamenco","accusative-definite-nominative":"flamencoul","dative-genitive-indefinite":"flamenco","dative-definite-genitive":"flamencoului","vocative":"flamencoule"}},{"word":"flamin","pos":"noun","definitions":["flamen"],"forms":{"plural":"flamini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flamin","accusative-definite-nominative-singular":"flaminul","accusative-indefinite-nominative-plural":"flamini","accusative-definite-nominative-plural":"flaminii","dative-genitive-indefinite-singular":"flamin","dative-definite-genitive-singular":"flaminului","dative-genitive-indefinite-plural":"flamini","dative-definite-genitive-plural":"flaminilor","singular-vocative":"flaminule","plural-vocative":"flaminilor"}},{"word":"Flămînd","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flămînd"}},{"word":"Flămîndu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flămîndu"}},{"word":"flaming","pos":"noun","definitions":["obsolete form of flamingo"],"forms":{"plural":"flamingi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flaming","accusative-definite-nominative-singular":"flamingul","accusative-indefinite-nominative-plural":"flamingi","accusative-definite-nominative-plural":"flamingii","dative-genitive-indefinite-singular":"flaming","dative-definite-genitive-singular":"flamingului","dative-genitive-indefinite-plural":"flamingi","dative-definite-genitive-plural":"flamingilor","singular-vocative":"flamingule","plural-vocative":"flamingilor"}},{"word":"flamingi","pos":"noun","definitions":["plural of flamingo"],"gender":"m"},{"word":"flamingo","pos":"noun","definitions":["flamingo (bird)"],"pronunciation":"/flaˈmin.ɡo/","forms":{"plural":"flamingi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flamingo","accusative-definite-nominative-singular":"flamingoul","accusative-indefinite-nominative-plural":"flamingi","accusative-definite-nominative-plural":"flamingii","dative-genitive-indefinite-singular":"flamingo","dative-definite-genitive-singular":"flamingoului","dative-genitive-indefinite-plural":"flamingi","dative-definite-genitive-plural":"flamingilor","singular-vocative":"flamingoule","plural-vocative":"flamingilor","alternative-rare":"flaming"}},{"word":"Flămînzeni","pos":"name","definitions":["a village in Coșcodeni, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"flamură","pos":"noun","definitions":["flag, banner","pennon, pennant, streamer"],"forms":{"plural":"flamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flamură","accusative-definite-nominative-singular":"flamura","accusative-indefinite-nominative-plural":"flamuri","accusative-definite-nominative-plural":"flamurile","dative-genitive-indefinite-singular":"flamuri","dative-definite-genitive-singular":"flamurii","dative-genitive-indefinite-plural":"flamuri","dative-definite-genitive-plural":"flamurilor","singular-vocative":"flamură","plural-vocative":"flamurilor"}},{"word":"flan","pos":"noun","definitions":["baked custard tart"],"forms":{"plural":"flanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flan","accusative-definite-nominative-singular":"flanul","accusative-indefinite-nominative-plural":"flanuri","accusative-definite-nominative-plural":"flanurile","dative-genitive-indefinite-singular":"flan","dative-definite-genitive-singular":"flanului","dative-genitive-indefinite-plural":"flanuri","dative-definite-genitive-plural":"flanurilor","singular-vocative":"flanule","plural-vocative":"flanurilor"}},{"word":"flanc","pos":"noun","definitions":["flank"],"forms":{"plural":"flancuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flanc","accusative-definite-nominative-singular":"flancul","accusative-indefinite-nominative-plural":"flancuri","accusative-definite-nominative-plural":"flancurile","dative-genitive-indefinite-singular":"flanc","dative-definite-genitive-singular":"flancului","dative-genitive-indefinite-plural":"flancuri","dative-definite-genitive-plural":"flancurilor","singular-vocative":"flancule","plural-vocative":"flancurilor"}},{"word":"flanca","pos":"verb","definitions":["to flank"],"forms":{"canonical":"a flanca 1st conjugation","present-singular-third-person":"flanchează","participle-past":"flancat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flanca","gerund":"flancând","first-person-indicative-present-singular":"flanchez","indicative-present-second-person-singular":"flanchezi","indicative-present-singular-third-person":"flanchează","first-person-indicative-plural-present":"flancăm","indicative-plural-present-second-person":"flancați","indicative-plural-present-third-person":"flanchează","first-person-imperfect-indicative-singular":"flancam","imperfect-indicative-second-person-singular":"flancai","imperfect-indicative-singular-third-person":"flanca","first-person-imperfect-indicative-plural":"flancam","imperfect-indicative-plural-second-person":"flancați","imperfect-indicative-plural-third-person":"flancau","first-person-indicative-perfect-singular":"flancai","indicative-perfect-second-person-singular":"flancași","indicative-perfect-singular-third-person":"flancă","first-person-indicative-perfect-plural":"flancarăm","indicative-perfect-plural-second-person":"flancarăți","indicative-perfect-plural-third-person":"flancară","first-person-indicative-pluperfect-singular":"flancasem","indicative-pluperfect-second-person-singular":"flancaseși","indicative-pluperfect-singular-third-person":"flancase","first-person-indicative-pluperfect-plural":"flancaserăm","indicative-pluperfect-plural-second-person":"flancaserăți","indicative-pluperfect-plural-third-person":"flancaseră","first-person-present-singular-subjunctive":"să flanchez","present-second-person-singular-subjunctive":"să flanchezi","present-singular-subjunctive-third-person":"să flancheze","first-person-plural-present-subjunctive":"să flancăm","plural-present-second-person-subjunctive":"să flancați","plural-present-subjunctive-third-person":"să flancheze","imperative-second-person-singular":"flanchează","imperative-plural-second-person":"flancați","imperative-negative-second-person-singular":"nu flanca","imperative-negative-plural-second-person":"nu flancați"}},{"word":"flancare","pos":"noun","definitions":["flanking"],"forms":{"plural":"flancări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flancare","accusative-definite-nominative-singular":"flancarea","accusative-indefinite-nominative-plural":"flancări","accusative-definite-nominative-plural":"flancările","dative-genitive-indefinite-singular":"flancări","dative-definite-genitive-singular":"flancării","dative-genitive-indefinite-plural":"flancări","dative-definite-genitive-plural":"flancărilor","singular-vocative":"flancare","plural-vocative":"flancărilor"}},{"word":"flancat","pos":"adj","definitions":["flanked"],"forms":{"feminine-singular":"flancată","masculine-plural":"flancați","feminine-neuter-plural":"flancate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flancat","error-unrecognized-form-feminine-indefinite-singular":"flancată","error-unrecognized-form-indefinite-masculine-plural":"flancați","error-unrecognized-form-feminine-indefinite-neuter-plural":"flancate","definite-error-unrecognized-form-masculine-neuter-singular":"flancatul","definite-error-unrecognized-form-feminine-singular":"flancata","definite-error-unrecognized-form-masculine-plural":"flancații","definite-error-unrecognized-form-feminine-neuter-plural":"flancatele"}},{"word":"flancat","pos":"verb","definitions":["past participle of flanca"],"forms":{"participle-past":"of flanca"}},{"word":"flancgardă","pos":"noun","definitions":["flankguard"],"forms":{"plural":"flancgărzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flancgardă","accusative-definite-nominative-singular":"flancgarda","accusative-indefinite-nominative-plural":"flancgarde","accusative-definite-nominative-plural":"flancgardele","dative-genitive-indefinite-singular":"flancgarde","dative-definite-genitive-singular":"flancgardei","dative-genitive-indefinite-plural":"flancgarde","dative-definite-genitive-plural":"flancgardelor","singular-vocative":"flancgardă","plural-vocative":"flancgardelor"}},{"word":"flanea","pos":"noun","definitions":["alternative form of flanelă"],"forms":{"plural":"flanele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"flanea","accusative-definite-nominative-singular":"flaneaua","accusative-indefinite-nominative-plural":"flanele","accusative-definite-nominative-plural":"flanelele","dative-genitive-indefinite-singular":"flanele","dative-definite-genitive-singular":"flanelei","dative-genitive-indefinite-plural":"flanele","dative-definite-genitive-plural":"flanelelor","singular-vocative":"flanea","plural-vocative":"flanelelor"}},{"word":"flanel","pos":"noun","definitions":["alternative form of flanelă"],"forms":{"plural":"flanele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flanel","accusative-definite-nominative-singular":"flanelul","accusative-indefinite-nominative-plural":"flanele","accusative-definite-nominative-plural":"flanelele","dative-genitive-indefinite-singular":"flanel","dative-definite-genitive-singular":"flanelului","dative-genitive-indefinite-plural":"flanele","dative-definite-genitive-plural":"flanelelor","singular-vocative":"flanelule","plural-vocative":"flanelelor"}},{"word":"flanelă","pos":"noun","definitions":["flannel"],"forms":{"plural":"flanele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flanelă","accusative-definite-nominative-singular":"flanelăul","accusative-indefinite-nominative-plural":"flanele","accusative-definite-nominative-plural":"flanelele","dative-genitive-indefinite-singular":"flanelă","dative-definite-genitive-singular":"flanelăului","dative-genitive-indefinite-plural":"flanele","dative-definite-genitive-plural":"flanelelor","singular-vocative":"flanelăule","plural-vocative":"flanelelor"}},{"word":"flaneluță","pos":"noun","definitions":["diminutive of flanelă; small flannel"],"forms":{"plural":"flaneluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flaneluță","accusative-definite-nominative-singular":"flaneluța","accusative-indefinite-nominative-plural":"flaneluțe","accusative-definite-nominative-plural":"flaneluțele","dative-genitive-indefinite-singular":"flaneluțe","dative-definite-genitive-singular":"flaneluței","dative-genitive-indefinite-plural":"flaneluțe","dative-definite-genitive-plural":"flaneluțelor","singular-vocative":"flaneluță","plural-vocative":"flaneluțelor"}},{"word":"flaneur","pos":"noun","definitions":["loafer, idler, dawdler, loiterer"],"forms":{"plural":"flaneuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flaneur","accusative-definite-nominative-singular":"flaneurul","accusative-indefinite-nominative-plural":"flaneuri","accusative-definite-nominative-plural":"flaneurii","dative-genitive-indefinite-singular":"flaneur","dative-definite-genitive-singular":"flaneurului","dative-genitive-indefinite-plural":"flaneuri","dative-definite-genitive-plural":"flaneurilor","singular-vocative":"flaneurule","plural-vocative":"flaneurilor"}},{"word":"flanger","pos":"noun","definitions":["flanger"],"forms":{"plural":"flangere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flanger","accusative-definite-nominative-singular":"flangerul","accusative-indefinite-nominative-plural":"flangere","accusative-definite-nominative-plural":"flangerele","dative-genitive-indefinite-singular":"flanger","dative-definite-genitive-singular":"flangerului","dative-genitive-indefinite-plural":"flangere","dative-definite-genitive-plural":"flangerelor","singular-vocative":"flangerule","plural-vocative":"flangerelor"}},{"word":"flaps","pos":"noun","definitions":["flap"],"forms":{"plural":"flapsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flaps","accusative-definite-nominative-singular":"flapsul","accusative-indefinite-nominative-plural":"flapsuri","accusative-definite-nominative-plural":"flapsurile","dative-genitive-indefinite-singular":"flaps","dative-definite-genitive-singular":"flapsului","dative-genitive-indefinite-plural":"flapsuri","dative-definite-genitive-plural":"flapsurilor","singular-vocative":"flapsule","plural-vocative":"flapsurilor"}},{"word":"flașă","pos":"noun","definitions":["bottle; flask; flagon"],"forms":{"plural":"flașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flașă","accusative-definite-nominative-singular":"flașa","accusative-indefinite-nominative-plural":"flașe","accusative-definite-nominative-plural":"flașele","dative-genitive-indefinite-singular":"flașe","dative-definite-genitive-singular":"flașei","dative-genitive-indefinite-plural":"flașe","dative-definite-genitive-plural":"flașelor","singular-vocative":"flașă","plural-vocative":"flașelor"}},{"word":"flasc","pos":"adj","definitions":["floppy"],"forms":{"feminine-singular":"flască","masculine-plural":"flaști","feminine-neuter-plural":"flaște","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flasc","error-unrecognized-form-feminine-indefinite-singular":"flască","error-unrecognized-form-indefinite-masculine-plural":"flaști","error-unrecognized-form-feminine-indefinite-neuter-plural":"flaște","definite-error-unrecognized-form-masculine-neuter-singular":"flascul","definite-error-unrecognized-form-feminine-singular":"flasca","definite-error-unrecognized-form-masculine-plural":"flaștii","definite-error-unrecognized-form-feminine-neuter-plural":"flaștele"}},{"word":"flașerie","pos":"noun","definitions":["flacherie"],"forms":{"plural":"flașerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flașerie","accusative-definite-nominative-singular":"flașeria","accusative-indefinite-nominative-plural":"flașerii","accusative-definite-nominative-plural":"flașeriile","dative-genitive-indefinite-singular":"flașerii","dative-definite-genitive-singular":"flașeriei","dative-genitive-indefinite-plural":"flașerii","dative-definite-genitive-plural":"flașeriilor","singular-vocative":"flașerie","plural-vocative":"flașeriilor"}},{"word":"flash","pos":"noun","definitions":["flash"],"forms":{"plural":"flash-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flash","accusative-definite-nominative-singular":"flashul","accusative-indefinite-nominative-plural":"flash-uri","accusative-definite-nominative-plural":"flash-urile","dative-genitive-indefinite-singular":"flash","dative-definite-genitive-singular":"flashului","dative-genitive-indefinite-plural":"flash-uri","dative-definite-genitive-plural":"flash-urilor","singular-vocative":"flashule","plural-vocative":"flash-urilor"}},{"word":"flash-uri","pos":"noun","definitions":["plural of flash"]},{"word":"flashback","pos":"noun","definitions":["flashback"],"forms":{"plural":"flashbackuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flashback","accusative-definite-nominative-singular":"flashbackul","accusative-indefinite-nominative-plural":"flashbackuri","accusative-definite-nominative-plural":"flashbackurile","dative-genitive-indefinite-singular":"flashback","dative-definite-genitive-singular":"flashbackului","dative-genitive-indefinite-plural":"flashbackuri","dative-definite-genitive-plural":"flashbackurilor","singular-vocative":"flashbackule","plural-vocative":"flashbackurilor"}},{"word":"flașnetă","pos":"noun","definitions":["barrel organ"],"forms":{"plural":"flașnete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flașnetă","accusative-definite-nominative-singular":"flașneta","accusative-indefinite-nominative-plural":"flașnete","accusative-definite-nominative-plural":"flașnetele","dative-genitive-indefinite-singular":"flașnete","dative-definite-genitive-singular":"flașnetei","dative-genitive-indefinite-plural":"flașnete","dative-definite-genitive-plural":"flașnetelor","singular-vocative":"flașnetă","plural-vocative":"flașnetelor"}},{"word":"flașnetar","pos":"noun","definitions":["barrel organ player"],"forms":{"plural":"flașnetari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flașnetar","accusative-definite-nominative-singular":"flașnetarul","accusative-indefinite-nominative-plural":"flașnetari","accusative-definite-nominative-plural":"flașnetarii","dative-genitive-indefinite-singular":"flașnetar","dative-definite-genitive-singular":"flașnetarului","dative-genitive-indefinite-plural":"flașnetari","dative-definite-genitive-plural":"flașnetarilor","singular-vocative":"flașnetarule","plural-vocative":"flașnetarilor"}},{"word":"flata","pos":"verb","definitions":["to flatter"],"forms":{"canonical":"a flata 1st conjugation","present-singular-third-person":"flatează","participle-past":"flatat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flata","gerund":"flatând","first-person-indicative-present-singular":"flatez","indicative-present-second-person-singular":"flatezi","indicative-present-singular-third-person":"flatează","first-person-indicative-plural-present":"flatăm","indicative-plural-present-second-person":"flatați","indicative-plural-present-third-person":"flatează","first-person-imperfect-indicative-singular":"flatam","imperfect-indicative-second-person-singular":"flatai","imperfect-indicative-singular-third-person":"flata","first-person-imperfect-indicative-plural":"flatam","imperfect-indicative-plural-second-person":"flatați","imperfect-indicative-plural-third-person":"flatau","first-person-indicative-perfect-singular":"flatai","indicative-perfect-second-person-singular":"flatași","indicative-perfect-singular-third-person":"flată","first-person-indicative-perfect-plural":"flatarăm","indicative-perfect-plural-second-person":"flatarăți","indicative-perfect-plural-third-person":"flatară","first-person-indicative-pluperfect-singular":"flatasem","indicative-pluperfect-second-person-singular":"flataseși","indicative-pluperfect-singular-third-person":"flatase","first-person-indicative-pluperfect-plural":"flataserăm","indicative-pluperfect-plural-second-person":"flataserăți","indicative-pluperfect-plural-third-person":"flataseră","first-person-present-singular-subjunctive":"să flatez","present-second-person-singular-subjunctive":"să flatezi","present-singular-subjunctive-third-person":"să flateze","first-person-plural-present-subjunctive":"să flatăm","plural-present-second-person-subjunctive":"să flatați","plural-present-subjunctive-third-person":"să flateze","imperative-second-person-singular":"flatează","imperative-plural-second-person":"flatați","imperative-negative-second-person-singular":"nu flata","imperative-negative-plural-second-person":"nu flatați"}},{"word":"flatare","pos":"noun","definitions":["flatter"],"forms":{"plural":"flatări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flatare","accusative-definite-nominative-singular":"flatarea","accusative-indefinite-nominative-plural":"flatări","accusative-definite-nominative-plural":"flatările","dative-genitive-indefinite-singular":"flatări","dative-definite-genitive-singular":"flatării","dative-genitive-indefinite-plural":"flatări","dative-definite-genitive-plural":"flatărilor","singular-vocative":"flatare","plural-vocative":"flatărilor"}},{"word":"flatat","pos":"adj","definitions":["flattered"],"forms":{"feminine-singular":"flatată","masculine-plural":"flatați","feminine-neuter-plural":"flatate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flatat","error-unrecognized-form-feminine-indefinite-singular":"flatată","error-unrecognized-form-indefinite-masculine-plural":"flatați","error-unrecognized-form-feminine-indefinite-neuter-plural":"flatate","definite-error-unrecognized-form-masculine-neuter-singular":"flatatul","definite-error-unrecognized-form-feminine-singular":"flatata","definite-error-unrecognized-form-masculine-plural":"flatații","definite-error-unrecognized-form-feminine-neuter-plural":"flatatele"}},{"word":"flatat","pos":"verb","definitions":["past participle of flata"],"forms":{"participle-past":"of flata"}},{"word":"flatație","pos":"noun","definitions":["flattering"],"forms":{"plural":"flatații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flatație","accusative-definite-nominative-singular":"flatația","accusative-indefinite-nominative-plural":"flatații","accusative-definite-nominative-plural":"flatațiile","dative-genitive-indefinite-singular":"flatații","dative-definite-genitive-singular":"flatației","dative-genitive-indefinite-plural":"flatații","dative-definite-genitive-plural":"flatațiilor","singular-vocative":"flatație","plural-vocative":"flatațiilor"}},{"word":"flaterie","pos":"noun","definitions":["flattery"],"forms":{"plural":"flaterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flaterie","accusative-definite-nominative-singular":"flateria","accusative-indefinite-nominative-plural":"flaterii","accusative-definite-nominative-plural":"flateriile","dative-genitive-indefinite-singular":"flaterii","dative-definite-genitive-singular":"flateriei","dative-genitive-indefinite-plural":"flaterii","dative-definite-genitive-plural":"flateriilor","singular-vocative":"flaterie","plural-vocative":"flateriilor"}},{"word":"flatulent","pos":"adj","definitions":["flatulent"],"forms":{"feminine-singular":"flatulentă","masculine-plural":"flatulenți","feminine-neuter-plural":"flatulente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flatulent","error-unrecognized-form-feminine-indefinite-singular":"flatulentă","error-unrecognized-form-indefinite-masculine-plural":"flatulenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flatulente","definite-error-unrecognized-form-masculine-neuter-singular":"flatulentul","definite-error-unrecognized-form-feminine-singular":"flatulenta","definite-error-unrecognized-form-masculine-plural":"flatulenții","definite-error-unrecognized-form-feminine-neuter-plural":"flatulentele"}},{"word":"flatulență","pos":"noun","definitions":["flatulence"],"forms":{"plural":"flatulențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flatulență","accusative-definite-nominative-singular":"flatulența","accusative-indefinite-nominative-plural":"flatulențe","accusative-definite-nominative-plural":"flatulențele","dative-genitive-indefinite-singular":"flatulențe","dative-definite-genitive-singular":"flatulenței","dative-genitive-indefinite-plural":"flatulențe","dative-definite-genitive-plural":"flatulențelor","singular-vocative":"flatulență","plural-vocative":"flatulențelor"}},{"word":"flatuozitate","pos":"noun","definitions":["flatuosity"],"forms":{"plural":"flatuozitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flatuozitate","accusative-definite-nominative-singular":"flatuozitatea","accusative-indefinite-nominative-plural":"flatuozitatăți","accusative-definite-nominative-plural":"flatuozitatățile","dative-genitive-indefinite-singular":"flatuozitatăți","dative-definite-genitive-singular":"flatuozitatății","dative-genitive-indefinite-plural":"flatuozitatăți","dative-definite-genitive-plural":"flatuozitatăților","singular-vocative":"flatuozitate","plural-vocative":"flatuozitatăților"}},{"word":"flaur","pos":"noun","definitions":["flute"],"forms":{"plural":"flaure","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flaur","accusative-definite-nominative-singular":"flaurul","accusative-indefinite-nominative-plural":"flaure","accusative-definite-nominative-plural":"flaurele","dative-genitive-indefinite-singular":"flaur","dative-definite-genitive-singular":"flaurului","dative-genitive-indefinite-plural":"flaure","dative-definite-genitive-plural":"flaurelor","singular-vocative":"flaurule","plural-vocative":"flaurelor"}},{"word":"flauș","pos":"noun","definitions":["soft woolen fabric"],"forms":{"plural":"flaușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flauș","accusative-definite-nominative-singular":"flaușul","accusative-indefinite-nominative-plural":"flaușuri","accusative-definite-nominative-plural":"flaușurile","dative-genitive-indefinite-singular":"flauș","dative-definite-genitive-singular":"flaușului","dative-genitive-indefinite-plural":"flaușuri","dative-definite-genitive-plural":"flaușurilor","singular-vocative":"flaușule","plural-vocative":"flaușurilor"}},{"word":"flaut","pos":"noun","definitions":["flute"],"forms":{"plural":"flaute","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flaut","accusative-definite-nominative-singular":"flautul","accusative-indefinite-nominative-plural":"flaute","accusative-definite-nominative-plural":"flautele","dative-genitive-indefinite-singular":"flaut","dative-definite-genitive-singular":"flautului","dative-genitive-indefinite-plural":"flaute","dative-definite-genitive-plural":"flautelor","singular-vocative":"flautule","plural-vocative":"flautelor"}},{"word":"flaută","pos":"noun","definitions":["flute"],"forms":{"plural":"flaute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flaută","accusative-definite-nominative-singular":"flauta","accusative-indefinite-nominative-plural":"flaute","accusative-definite-nominative-plural":"flautele","dative-genitive-indefinite-singular":"flaute","dative-definite-genitive-singular":"flautei","dative-genitive-indefinite-plural":"flaute","dative-definite-genitive-plural":"flautelor","singular-vocative":"flaută","plural-vocative":"flautelor"}},{"word":"flaute","pos":"noun","definitions":["indefinite plural of flaut"],"pronunciation":"[ˈfla.ute]","gender":"n"},{"word":"flautist","pos":"noun","definitions":["flutist"],"forms":{"plural":"flautiști","feminine":"equivalent flautistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flautist","accusative-definite-nominative-singular":"flautistul","accusative-indefinite-nominative-plural":"flautiști","accusative-definite-nominative-plural":"flautiștii","dative-genitive-indefinite-singular":"flautist","dative-definite-genitive-singular":"flautistului","dative-genitive-indefinite-plural":"flautiști","dative-definite-genitive-plural":"flautiștilor","singular-vocative":"flautistule","plural-vocative":"flautiștilor"}},{"word":"flautista","pos":"noun","definitions":["definite nominative/accusative singular of flautistă"],"gender":"f"},{"word":"flautistă","pos":"noun","definitions":["female equivalent of flautist"],"forms":{"plural":"flautiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flautistă","accusative-definite-nominative-singular":"flautista","accusative-indefinite-nominative-plural":"flautiste","accusative-definite-nominative-plural":"flautistele","dative-genitive-indefinite-singular":"flautiste","dative-definite-genitive-singular":"flautistei","dative-genitive-indefinite-plural":"flautiste","dative-definite-genitive-plural":"flautistelor","singular-vocative":"flautistă","plural-vocative":"flautistelor"}},{"word":"flautiști","pos":"noun","definitions":["plural of flautist"]},{"word":"Flavia","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"Flaviu","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Flaviu"}},{"word":"Flavius","pos":"name","definitions":["a male given name"],"gender":"m"},{"word":"flavonă","pos":"noun","definitions":["flavone"],"forms":{"plural":"flavoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flavonă","accusative-definite-nominative-singular":"flavona","accusative-indefinite-nominative-plural":"flavone","accusative-definite-nominative-plural":"flavonele","dative-genitive-indefinite-singular":"flavone","dative-definite-genitive-singular":"flavonei","dative-genitive-indefinite-plural":"flavone","dative-definite-genitive-plural":"flavonelor","singular-vocative":"flavonă","plural-vocative":"flavonelor"}},{"word":"fleac","pos":"noun","definitions":["trifle, trinket","babble, prattle"],"pronunciation":"/fle̯ak/","forms":{"plural":"fleacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fleac","accusative-definite-nominative-singular":"fleacul","accusative-indefinite-nominative-plural":"fleacuri","accusative-definite-nominative-plural":"fleacurile","dative-genitive-indefinite-singular":"fleac","dative-definite-genitive-singular":"fleacului","dative-genitive-indefinite-plural":"fleacuri","dative-definite-genitive-plural":"fleacurilor","singular-vocative":"fleacule","plural-vocative":"fleacurilor"}},{"word":"fleancă","pos":"noun","definitions":["mouth"],"forms":{"plural":"flenci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fleancă","accusative-definite-nominative-singular":"fleanca","accusative-indefinite-nominative-plural":"flenci","accusative-definite-nominative-plural":"flencile","dative-genitive-indefinite-singular":"flenci","dative-definite-genitive-singular":"flencii","dative-genitive-indefinite-plural":"flenci","dative-definite-genitive-plural":"flencilor","singular-vocative":"fleancă","plural-vocative":"flencilor"}},{"word":"fleandră","pos":"noun","definitions":["alternative form of fleandură"],"forms":{"plural":"flendre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fleandră","accusative-definite-nominative-singular":"fleandra","accusative-indefinite-nominative-plural":"flendre","accusative-definite-nominative-plural":"flendrele","dative-genitive-indefinite-singular":"flendre","dative-definite-genitive-singular":"flendrei","dative-genitive-indefinite-plural":"flendre","dative-definite-genitive-plural":"flendrelor","singular-vocative":"fleandră","plural-vocative":"flendrelor"}},{"word":"fleașcă","pos":"noun","definitions":["a soft object","a soft person"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fleașcă","accusative-definite-nominative":"fleașca","dative-genitive-indefinite":"fleașce","dative-definite-genitive":"fleașcei","vocative":"fleașcă"}},{"word":"flebectomie","pos":"noun","definitions":["phlebectomy"],"forms":{"plural":"flebectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flebectomie","accusative-definite-nominative-singular":"flebectomia","accusative-indefinite-nominative-plural":"flebectomii","accusative-definite-nominative-plural":"flebectomiile","dative-genitive-indefinite-singular":"flebectomii","dative-definite-genitive-singular":"flebectomiei","dative-genitive-indefinite-plural":"flebectomii","dative-definite-genitive-plural":"flebectomiilor","singular-vocative":"flebectomie","plural-vocative":"flebectomiilor"}},{"word":"flebită","pos":"noun","definitions":["phlebitis"],"forms":{"plural":"flebite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flebită","accusative-definite-nominative-singular":"flebita","accusative-indefinite-nominative-plural":"flebite","accusative-definite-nominative-plural":"flebitele","dative-genitive-indefinite-singular":"flebite","dative-definite-genitive-singular":"flebitei","dative-genitive-indefinite-plural":"flebite","dative-definite-genitive-plural":"flebitelor","singular-vocative":"flebită","plural-vocative":"flebitelor"}},{"word":"flebografic","pos":"adj","definitions":["phlebographic"],"forms":{"feminine-singular":"flebografică","masculine-plural":"flebografici","feminine-neuter-plural":"flebografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flebografic","error-unrecognized-form-feminine-indefinite-singular":"flebografică","error-unrecognized-form-indefinite-masculine-plural":"flebografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flebografice","definite-error-unrecognized-form-masculine-neuter-singular":"flebograficul","definite-error-unrecognized-form-feminine-singular":"flebografica","definite-error-unrecognized-form-masculine-plural":"flebograficii","definite-error-unrecognized-form-feminine-neuter-plural":"flebograficele"}},{"word":"flebografie","pos":"noun","definitions":["phlebography"],"forms":{"plural":"flebografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flebografie","accusative-definite-nominative-singular":"flebografia","accusative-indefinite-nominative-plural":"flebografii","accusative-definite-nominative-plural":"flebografiile","dative-genitive-indefinite-singular":"flebografii","dative-definite-genitive-singular":"flebografiei","dative-genitive-indefinite-plural":"flebografii","dative-definite-genitive-plural":"flebografiilor","singular-vocative":"flebografie","plural-vocative":"flebografiilor"}},{"word":"flebogramă","pos":"noun","definitions":["phlebogram"],"forms":{"plural":"flebograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flebogramă","accusative-definite-nominative-singular":"flebograma","accusative-indefinite-nominative-plural":"flebograme","accusative-definite-nominative-plural":"flebogramele","dative-genitive-indefinite-singular":"flebograme","dative-definite-genitive-singular":"flebogramei","dative-genitive-indefinite-plural":"flebograme","dative-definite-genitive-plural":"flebogramelor","singular-vocative":"flebogramă","plural-vocative":"flebogramelor"}},{"word":"flebologie","pos":"noun","definitions":["phlebology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"flebologie","accusative-definite-nominative":"flebologia","dative-genitive-indefinite":"flebologii","dative-definite-genitive":"flebologiei","vocative":"flebologie"}},{"word":"fleboscleroză","pos":"noun","definitions":["phlebosclerosis"],"forms":{"plural":"fleboscleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fleboscleroză","accusative-definite-nominative-singular":"fleboscleroza","accusative-indefinite-nominative-plural":"fleboscleroze","accusative-definite-nominative-plural":"flebosclerozele","dative-genitive-indefinite-singular":"fleboscleroze","dative-definite-genitive-singular":"flebosclerozei","dative-genitive-indefinite-plural":"fleboscleroze","dative-definite-genitive-plural":"flebosclerozelor","singular-vocative":"fleboscleroză","plural-vocative":"flebosclerozelor"}},{"word":"flebotom","pos":"noun","definitions":["Phlebotomus"],"forms":{"plural":"flebotomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flebotom","accusative-definite-nominative-singular":"flebotomul","accusative-indefinite-nominative-plural":"flebotomi","accusative-definite-nominative-plural":"flebotomii","dative-genitive-indefinite-singular":"flebotom","dative-definite-genitive-singular":"flebotomului","dative-genitive-indefinite-plural":"flebotomi","dative-definite-genitive-plural":"flebotomilor","singular-vocative":"flebotomule","plural-vocative":"flebotomilor"}},{"word":"flebotomie","pos":"noun","definitions":["phlebotomy"],"forms":{"plural":"flebotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flebotomie","accusative-definite-nominative-singular":"flebotomia","accusative-indefinite-nominative-plural":"flebotomii","accusative-definite-nominative-plural":"flebotomiile","dative-genitive-indefinite-singular":"flebotomii","dative-definite-genitive-singular":"flebotomiei","dative-genitive-indefinite-plural":"flebotomii","dative-definite-genitive-plural":"flebotomiilor","singular-vocative":"flebotomie","plural-vocative":"flebotomiilor"}},{"word":"flecăitură","pos":"noun","definitions":["chatter"],"forms":{"plural":"flecăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flecăitură","accusative-definite-nominative-singular":"flecăitura","accusative-indefinite-nominative-plural":"flecăituri","accusative-definite-nominative-plural":"flecăiturile","dative-genitive-indefinite-singular":"flecăituri","dative-definite-genitive-singular":"flecăiturii","dative-genitive-indefinite-plural":"flecăituri","dative-definite-genitive-plural":"flecăiturilor","singular-vocative":"flecăitură","plural-vocative":"flecăiturilor"}},{"word":"flecar","pos":"adj","definitions":["overly talkative, chatty, garrulous"],"pronunciation":"/fleˈkar/","forms":{"feminine-singular":"flecară","masculine-plural":"flecari","feminine-neuter-plural":"flecare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"flecar","error-unrecognized-form-feminine-indefinite-singular":"flecară","error-unrecognized-form-indefinite-masculine-plural":"flecari","error-unrecognized-form-feminine-indefinite-neuter-plural":"flecare","definite-error-unrecognized-form-masculine-neuter-singular":"flecarul","definite-error-unrecognized-form-feminine-singular":"flecara","definite-error-unrecognized-form-masculine-plural":"flecarii","definite-error-unrecognized-form-feminine-neuter-plural":"flecarele"}},{"word":"flecar","pos":"noun","definitions":["one who talks too much, chatterbox"],"pronunciation":"/fleˈkar/","forms":{"plural":"flecari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flecar","accusative-definite-nominative-singular":"flecarul","accusative-indefinite-nominative-plural":"flecari","accusative-definite-nominative-plural":"flecarii","dative-genitive-indefinite-singular":"flecar","dative-definite-genitive-singular":"flecarului","dative-genitive-indefinite-plural":"flecari","dative-definite-genitive-plural":"flecarilor","singular-vocative":"flecarule","plural-vocative":"flecarilor"}},{"word":"flecară","pos":"noun","definitions":["female equivalent of flecar"],"forms":{"plural":"flecare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flecară","accusative-definite-nominative-singular":"flecara","accusative-indefinite-nominative-plural":"flecare","accusative-definite-nominative-plural":"flecarele","dative-genitive-indefinite-singular":"flecare","dative-definite-genitive-singular":"flecarei","dative-genitive-indefinite-plural":"flecare","dative-definite-genitive-plural":"flecarelor","singular-vocative":"flecară","plural-vocative":"flecarelor"}},{"word":"flecăreală","pos":"noun","definitions":["chatter"],"forms":{"plural":"flecăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flecăreală","accusative-definite-nominative-singular":"flecăreala","accusative-indefinite-nominative-plural":"flecăreli","accusative-definite-nominative-plural":"flecărelile","dative-genitive-indefinite-singular":"flecăreli","dative-definite-genitive-singular":"flecărelii","dative-genitive-indefinite-plural":"flecăreli","dative-definite-genitive-plural":"flecărelilor","singular-vocative":"flecăreală","plural-vocative":"flecărelilor"}},{"word":"flecări","pos":"verb","definitions":["to blather"],"forms":{"canonical":"a flecări 4th conjugation","present-singular-third-person":"flecărește","participle-past":"flecărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a flecări","gerund":"flecărind","first-person-indicative-present-singular":"flecăresc","indicative-present-second-person-singular":"flecărești","indicative-present-singular-third-person":"flecărește","first-person-indicative-plural-present":"flecărim","indicative-plural-present-second-person":"flecăriți","indicative-plural-present-third-person":"flecăresc","first-person-imperfect-indicative-singular":"flecăream","imperfect-indicative-second-person-singular":"flecăreai","imperfect-indicative-singular-third-person":"flecărea","first-person-imperfect-indicative-plural":"flecăream","imperfect-indicative-plural-second-person":"flecăreați","imperfect-indicative-plural-third-person":"flecăreau","first-person-indicative-perfect-singular":"flecării","indicative-perfect-second-person-singular":"flecăriși","indicative-perfect-singular-third-person":"flecări","first-person-indicative-perfect-plural":"flecărirăm","indicative-perfect-plural-second-person":"flecărirăți","indicative-perfect-plural-third-person":"flecăriră","first-person-indicative-pluperfect-singular":"flecărisem","indicative-pluperfect-second-person-singular":"flecăriseși","indicative-pluperfect-singular-third-person":"flecărise","first-person-indicative-pluperfect-plural":"flecăriserăm","indicative-pluperfect-plural-second-person":"flecăriserăți","indicative-pluperfect-plural-third-person":"flecăriseră","first-person-present-singular-subjunctive":"să flecăresc","present-second-person-singular-subjunctive":"să flecărești","present-singular-subjunctive-third-person":"să flecărească","first-person-plural-present-subjunctive":"să flecărim","plural-present-second-person-subjunctive":"să flecăriți","plural-present-subjunctive-third-person":"să flecărească","imperative-second-person-singular":"flecărește","imperative-plural-second-person":"flecăriți","imperative-negative-second-person-singular":"nu flecări","imperative-negative-plural-second-person":"nu flecăriți"}},{"word":"flecărie","pos":"noun","definitions":["chatter"],"forms":{"plural":"flecării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flecărie","accusative-definite-nominative-singular":"flecăria","accusative-indefinite-nominative-plural":"flecării","accusative-definite-nominative-plural":"flecăriile","dative-genitive-indefinite-singular":"flecării","dative-definite-genitive-singular":"flecăriei","dative-genitive-indefinite-plural":"flecării","dative-definite-genitive-plural":"flecăriilor","singular-vocative":"flecărie","plural-vocative":"flecăriilor"}},{"word":"flecăritură","pos":"noun","definitions":["chatter"],"forms":{"plural":"flecărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flecăritură","accusative-definite-nominative-singular":"flecăritura","accusative-indefinite-nominative-plural":"flecărituri","accusative-definite-nominative-plural":"flecăriturile","dative-genitive-indefinite-singular":"flecărituri","dative-definite-genitive-singular":"flecăriturii","dative-genitive-indefinite-plural":"flecărituri","dative-definite-genitive-plural":"flecăriturilor","singular-vocative":"flecăritură","plural-vocative":"flecăriturilor"}},{"word":"flecarnic","pos":"adj","definitions":["garrulous"],"forms":{"feminine-singular":"flecarnică","masculine-plural":"flecarnici","feminine-neuter-plural":"flecarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flecarnic","error-unrecognized-form-feminine-indefinite-singular":"flecarnică","error-unrecognized-form-indefinite-masculine-plural":"flecarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flecarnice","definite-error-unrecognized-form-masculine-neuter-singular":"flecarnicul","definite-error-unrecognized-form-feminine-singular":"flecarnica","definite-error-unrecognized-form-masculine-plural":"flecarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"flecarnicele"}},{"word":"flecționar","pos":"adj","definitions":["obsolete form of flexionar"],"forms":{"feminine-singular":"flecționară","masculine-plural":"flecționari","feminine-neuter-plural":"flecționare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flecționar","error-unrecognized-form-feminine-indefinite-singular":"flecționară","error-unrecognized-form-indefinite-masculine-plural":"flecționari","error-unrecognized-form-feminine-indefinite-neuter-plural":"flecționare","definite-error-unrecognized-form-masculine-neuter-singular":"flecționarul","definite-error-unrecognized-form-feminine-singular":"flecționara","definite-error-unrecognized-form-masculine-plural":"flecționarii","definite-error-unrecognized-form-feminine-neuter-plural":"flecționarele"}},{"word":"fleculeț","pos":"noun","definitions":["diminutive of fleac; trifle"],"forms":{"plural":"fleculețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fleculeț","accusative-definite-nominative-singular":"fleculețul","accusative-indefinite-nominative-plural":"fleculețe","accusative-definite-nominative-plural":"fleculețele","dative-genitive-indefinite-singular":"fleculeț","dative-definite-genitive-singular":"fleculețului","dative-genitive-indefinite-plural":"fleculețe","dative-definite-genitive-plural":"fleculețelor","singular-vocative":"fleculețule","plural-vocative":"fleculețelor"}},{"word":"flecușteț","pos":"noun","definitions":["diminutive of fleac; trifle"],"forms":{"plural":"flecuștețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flecușteț","accusative-definite-nominative-singular":"flecuștețul","accusative-indefinite-nominative-plural":"flecuștețe","accusative-definite-nominative-plural":"flecuștețele","dative-genitive-indefinite-singular":"flecușteț","dative-definite-genitive-singular":"flecuștețului","dative-genitive-indefinite-plural":"flecuștețe","dative-definite-genitive-plural":"flecuștețelor","singular-vocative":"flecuștețule","plural-vocative":"flecuștețelor"}},{"word":"Flegheru","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Flegheru"}},{"word":"flegmă","pos":"noun","definitions":["phlegm","viscous spit"],"pronunciation":"/ˈfleɡ.mə/","forms":{"plural":"flegme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flegmă","accusative-definite-nominative-singular":"flegma","accusative-indefinite-nominative-plural":"flegme","accusative-definite-nominative-plural":"flegmele","dative-genitive-indefinite-singular":"flegme","dative-definite-genitive-singular":"flegmei","dative-genitive-indefinite-plural":"flegme","dative-definite-genitive-plural":"flegmelor","singular-vocative":"flegmă","plural-vocative":"flegmelor"}},{"word":"flegmatic","pos":"adj","definitions":["phlegmatic"],"forms":{"feminine-singular":"flegmatică","masculine-plural":"flegmatici","feminine-neuter-plural":"flegmatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flegmatic","error-unrecognized-form-feminine-indefinite-singular":"flegmatică","error-unrecognized-form-indefinite-masculine-plural":"flegmatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flegmatice","definite-error-unrecognized-form-masculine-neuter-singular":"flegmaticul","definite-error-unrecognized-form-feminine-singular":"flegmatica","definite-error-unrecognized-form-masculine-plural":"flegmaticii","definite-error-unrecognized-form-feminine-neuter-plural":"flegmaticele"}},{"word":"flegmazic","pos":"adj","definitions":["phlegmatic"],"forms":{"feminine-singular":"flegmazică","masculine-plural":"flegmazici","feminine-neuter-plural":"flegmazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flegmazic","error-unrecognized-form-feminine-indefinite-singular":"flegmazică","error-unrecognized-form-indefinite-masculine-plural":"flegmazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flegmazice","definite-error-unrecognized-form-masculine-neuter-singular":"flegmazicul","definite-error-unrecognized-form-feminine-singular":"flegmazica","definite-error-unrecognized-form-masculine-plural":"flegmazicii","definite-error-unrecognized-form-feminine-neuter-plural":"flegmazicele"}},{"word":"flegmazie","pos":"noun","definitions":["phlegmasia"],"forms":{"plural":"flegmazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flegmazie","accusative-definite-nominative-singular":"flegmazia","accusative-indefinite-nominative-plural":"flegmazii","accusative-definite-nominative-plural":"flegmaziile","dative-genitive-indefinite-singular":"flegmazii","dative-definite-genitive-singular":"flegmaziei","dative-genitive-indefinite-plural":"flegmazii","dative-definite-genitive-plural":"flegmaziilor","singular-vocative":"flegmazie","plural-vocative":"flegmaziilor"}},{"word":"flegmon","pos":"noun","definitions":["phlegmon"],"forms":{"plural":"flegmoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flegmon","accusative-definite-nominative-singular":"flegmonul","accusative-indefinite-nominative-plural":"flegmoane","accusative-definite-nominative-plural":"flegmoanele","dative-genitive-indefinite-singular":"flegmon","dative-definite-genitive-singular":"flegmonului","dative-genitive-indefinite-plural":"flegmoane","dative-definite-genitive-plural":"flegmoanelor","singular-vocative":"flegmonule","plural-vocative":"flegmoanelor"}},{"word":"flegmonos","pos":"adj","definitions":["phlegmonous"],"forms":{"feminine-singular":"flegmonoasă","masculine-plural":"flegmonoși","feminine-neuter-plural":"flegmonoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flegmonos","error-unrecognized-form-feminine-indefinite-singular":"flegmonoasă","error-unrecognized-form-indefinite-masculine-plural":"flegmonoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"flegmonoase","definite-error-unrecognized-form-masculine-neuter-singular":"flegmonosul","definite-error-unrecognized-form-feminine-singular":"flegmonoasa","definite-error-unrecognized-form-masculine-plural":"flegmonoșii","definite-error-unrecognized-form-feminine-neuter-plural":"flegmonoasele"}},{"word":"Fleică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fleică"}},{"word":"fleică","pos":"noun","definitions":["meatloaf"],"pronunciation":"/ˈflej.kə/","forms":{"plural":"fleici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fleică","accusative-definite-nominative-singular":"fleica","accusative-indefinite-nominative-plural":"fleici","accusative-definite-nominative-plural":"fleicile","dative-genitive-indefinite-singular":"fleici","dative-definite-genitive-singular":"fleicii","dative-genitive-indefinite-plural":"fleici","dative-definite-genitive-plural":"fleicilor","singular-vocative":"fleică","plural-vocative":"fleicilor"}},{"word":"flencăni","pos":"verb","definitions":["to babble"],"forms":{"canonical":"a flencăni 4th conjugation","present-singular-third-person":"flencănește","participle-past":"flencănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a flencăni","gerund":"flencănind","first-person-indicative-present-singular":"flencănesc","indicative-present-second-person-singular":"flencănești","indicative-present-singular-third-person":"flencănește","first-person-indicative-plural-present":"flencănim","indicative-plural-present-second-person":"flencăniți","indicative-plural-present-third-person":"flencănesc","first-person-imperfect-indicative-singular":"flencăneam","imperfect-indicative-second-person-singular":"flencăneai","imperfect-indicative-singular-third-person":"flencănea","first-person-imperfect-indicative-plural":"flencăneam","imperfect-indicative-plural-second-person":"flencăneați","imperfect-indicative-plural-third-person":"flencăneau","first-person-indicative-perfect-singular":"flencănii","indicative-perfect-second-person-singular":"flencăniși","indicative-perfect-singular-third-person":"flencăni","first-person-indicative-perfect-plural":"flencănirăm","indicative-perfect-plural-second-person":"flencănirăți","indicative-perfect-plural-third-person":"flencăniră","first-person-indicative-pluperfect-singular":"flencănisem","indicative-pluperfect-second-person-singular":"flencăniseși","indicative-pluperfect-singular-third-person":"flencănise","first-person-indicative-pluperfect-plural":"flencăniserăm","indicative-pluperfect-plural-second-person":"flencăniserăți","indicative-pluperfect-plural-third-person":"flencăniseră","first-person-present-singular-subjunctive":"să flencănesc","present-second-person-singular-subjunctive":"să flencănești","present-singular-subjunctive-third-person":"să flencănească","first-person-plural-present-subjunctive":"să flencănim","plural-present-second-person-subjunctive":"să flencăniți","plural-present-subjunctive-third-person":"să flencănească","imperative-second-person-singular":"flencănește","imperative-plural-second-person":"flencăniți","imperative-negative-second-person-singular":"nu flencăni","imperative-negative-plural-second-person":"nu flencăniți"}},{"word":"flencănitură","pos":"noun","definitions":["chatter"],"forms":{"plural":"flencănituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flencănitură","accusative-definite-nominative-singular":"flencănitura","accusative-indefinite-nominative-plural":"flencănituri","accusative-definite-nominative-plural":"flencăniturile","dative-genitive-indefinite-singular":"flencănituri","dative-definite-genitive-singular":"flencăniturii","dative-genitive-indefinite-plural":"flencănituri","dative-definite-genitive-plural":"flencăniturilor","singular-vocative":"flencănitură","plural-vocative":"flencăniturilor"}},{"word":"flenduros","pos":"adj","definitions":["wearing ragged clothes"],"forms":{"feminine-singular":"flenduroasă","masculine-plural":"flenduroși","feminine-neuter-plural":"flenduroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flenduros","error-unrecognized-form-feminine-indefinite-singular":"flenduroasă","error-unrecognized-form-indefinite-masculine-plural":"flenduroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"flenduroase","definite-error-unrecognized-form-masculine-neuter-singular":"flendurosul","definite-error-unrecognized-form-feminine-singular":"flenduroasa","definite-error-unrecognized-form-masculine-plural":"flenduroșii","definite-error-unrecognized-form-feminine-neuter-plural":"flenduroasele"}},{"word":"fleoancă","pos":"noun","definitions":["alternative form of fleancă"],"forms":{"plural":"fleoance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fleoancă","accusative-definite-nominative-singular":"fleoanca","accusative-indefinite-nominative-plural":"fleoance","accusative-definite-nominative-plural":"fleoancele","dative-genitive-indefinite-singular":"fleoance","dative-definite-genitive-singular":"fleoancei","dative-genitive-indefinite-plural":"fleoance","dative-definite-genitive-plural":"fleoancelor","singular-vocative":"fleoancă","plural-vocative":"fleoancelor"}},{"word":"fleoarcă","pos":"noun","definitions":["alternative form of fleancă"],"forms":{"plural":"fleoarce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fleoarcă","accusative-definite-nominative-singular":"fleoarca","accusative-indefinite-nominative-plural":"fleoarce","accusative-definite-nominative-plural":"fleoarcele","dative-genitive-indefinite-singular":"fleoarce","dative-definite-genitive-singular":"fleoarcei","dative-genitive-indefinite-plural":"fleoarce","dative-definite-genitive-plural":"fleoarcelor","singular-vocative":"fleoarcă","plural-vocative":"fleoarcelor"}},{"word":"fleoșc","pos":"intj","definitions":["alternative form of fleașc"]},{"word":"fler","pos":"noun","definitions":["flair"],"forms":{"plural":"fleruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fler","accusative-definite-nominative-singular":"flerul","accusative-indefinite-nominative-plural":"fleruri","accusative-definite-nominative-plural":"flerurile","dative-genitive-indefinite-singular":"fler","dative-definite-genitive-singular":"flerului","dative-genitive-indefinite-plural":"fleruri","dative-definite-genitive-plural":"flerurilor","singular-vocative":"flerule","plural-vocative":"flerurilor"}},{"word":"fleșă","pos":"noun","definitions":["spire"],"forms":{"plural":"fleșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fleșă","accusative-definite-nominative-singular":"fleșa","accusative-indefinite-nominative-plural":"fleșe","accusative-definite-nominative-plural":"fleșele","dative-genitive-indefinite-singular":"fleșe","dative-definite-genitive-singular":"fleșei","dative-genitive-indefinite-plural":"fleșe","dative-definite-genitive-plural":"fleșelor","singular-vocative":"fleșă","plural-vocative":"fleșelor"}},{"word":"fleșărie","pos":"noun","definitions":["butchershop"],"forms":{"plural":"fleșării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fleșărie","accusative-definite-nominative-singular":"fleșăria","accusative-indefinite-nominative-plural":"fleșării","accusative-definite-nominative-plural":"fleșăriile","dative-genitive-indefinite-singular":"fleșării","dative-definite-genitive-singular":"fleșăriei","dative-genitive-indefinite-plural":"fleșării","dative-definite-genitive-plural":"fleșăriilor","singular-vocative":"fleșărie","plural-vocative":"fleșăriilor"}},{"word":"fleșcăi","pos":"verb","definitions":["to squelch through mud","to wilt","to be played out"],"forms":{"canonical":"a fleșcăi 4th conjugation","present-singular-third-person":"fleșcăiește","participle-past":"fleșcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fleșcăi","gerund":"fleșcăind","first-person-indicative-present-singular":"fleșcăiesc","indicative-present-second-person-singular":"fleșcăiești","indicative-present-singular-third-person":"fleșcăiește","first-person-indicative-plural-present":"fleșcăim","indicative-plural-present-second-person":"fleșcăiți","indicative-plural-present-third-person":"fleșcăiesc","first-person-imperfect-indicative-singular":"fleșcăiam","imperfect-indicative-second-person-singular":"fleșcăiai","imperfect-indicative-singular-third-person":"fleșcăia","first-person-imperfect-indicative-plural":"fleșcăiam","imperfect-indicative-plural-second-person":"fleșcăiați","imperfect-indicative-plural-third-person":"fleșcăiau","first-person-indicative-perfect-singular":"fleșcăii","indicative-perfect-second-person-singular":"fleșcăiși","indicative-perfect-singular-third-person":"fleșcăi","first-person-indicative-perfect-plural":"fleșcăirăm","indicative-perfect-plural-second-person":"fleșcăirăți","indicative-perfect-plural-third-person":"fleșcăiră","first-person-indicative-pluperfect-singular":"fleșcăisem","indicative-pluperfect-second-person-singular":"fleșcăiseși","indicative-pluperfect-singular-third-person":"fleșcăise","first-person-indicative-pluperfect-plural":"fleșcăiserăm","indicative-pluperfect-plural-second-person":"fleșcăiserăți","indicative-pluperfect-plural-third-person":"fleșcăiseră","first-person-present-singular-subjunctive":"să fleșcăiesc","present-second-person-singular-subjunctive":"să fleșcăiești","present-singular-subjunctive-third-person":"să fleșcăiască","first-person-plural-present-subjunctive":"să fleșcăim","plural-present-second-person-subjunctive":"să fleșcăiți","plural-present-subjunctive-third-person":"să fleșcăiască","imperative-second-person-singular":"fleșcăiește","imperative-plural-second-person":"fleșcăiți","imperative-negative-second-person-singular":"nu fleșcăi","imperative-negative-plural-second-person":"nu fleșcăiți"}},{"word":"fleșcăială","pos":"noun","definitions":["sleet"],"forms":{"plural":"fleșcăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fleșcăială","accusative-definite-nominative-singular":"fleșcăiala","accusative-indefinite-nominative-plural":"fleșcăieli","accusative-definite-nominative-plural":"fleșcăielile","dative-genitive-indefinite-singular":"fleșcăieli","dative-definite-genitive-singular":"fleșcăielii","dative-genitive-indefinite-plural":"fleșcăieli","dative-definite-genitive-plural":"fleșcăielilor","singular-vocative":"fleșcăială","plural-vocative":"fleșcăielilor"}},{"word":"fleșcăit","pos":"noun","definitions":["soft, flaccid"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fleșcăit","accusative-definite-nominative":"fleșcăitul","dative-genitive-indefinite":"fleșcăit","dative-definite-genitive":"fleșcăitului","vocative":"fleșcăitule"}},{"word":"fleșcăit","pos":"verb","definitions":["past participle of fleșcăi"],"forms":{"participle-past":"of fleșcăi"}},{"word":"fleșcăraie","pos":"noun","definitions":["mud mixed with water and snow"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fleșcăraie","accusative-definite-nominative":"fleșcăraia","dative-genitive-indefinite":"fleșcăraii","dative-definite-genitive":"fleșcăraiei","vocative":"fleșcăraie"}},{"word":"fleșcărie","pos":"noun","definitions":["mud mixed with water and snow"],"forms":{"plural":"fleșcării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fleșcărie","accusative-definite-nominative-singular":"fleșcăria","accusative-indefinite-nominative-plural":"fleșcării","accusative-definite-nominative-plural":"fleșcăriile","dative-genitive-indefinite-singular":"fleșcării","dative-definite-genitive-singular":"fleșcăriei","dative-genitive-indefinite-plural":"fleșcării","dative-definite-genitive-plural":"fleșcăriilor","singular-vocative":"fleșcărie","plural-vocative":"fleșcăriilor"}},{"word":"fleuron","pos":"noun","definitions":["fleuron"],"pronunciation":"/flø.ˈron/","forms":{"plural":"fleuroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fleuron","accusative-definite-nominative-singular":"fleuronul","accusative-indefinite-nominative-plural":"fleuroni","accusative-definite-nominative-plural":"fleuronii","dative-genitive-indefinite-singular":"fleuron","dative-definite-genitive-singular":"fleuronului","dative-genitive-indefinite-plural":"fleuroni","dative-definite-genitive-plural":"fleuronilor","singular-vocative":"fleuronule","plural-vocative":"fleuronilor"}},{"word":"flexibil","pos":"adj","definitions":["flexible"],"pronunciation":"/flekˈsi.bil/","forms":{"feminine-singular":"flexibilă","masculine-plural":"flexibili","feminine-neuter-plural":"flexibile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"flexibil","error-unrecognized-form-feminine-indefinite-singular":"flexibilă","error-unrecognized-form-indefinite-masculine-plural":"flexibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"flexibile","definite-error-unrecognized-form-masculine-neuter-singular":"flexibilul","definite-error-unrecognized-form-feminine-singular":"flexibila","definite-error-unrecognized-form-masculine-plural":"flexibilii","definite-error-unrecognized-form-feminine-neuter-plural":"flexibilele","alternative":"флексибил"}},{"word":"flexibilitate","pos":"noun","definitions":["flexibility"],"pronunciation":"[flek.si.bi.liˈta.te]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"flexibilitate","accusative-definite-nominative":"flexibilitatea","dative-genitive-indefinite":"flexibilități","dative-definite-genitive":"flexibilității","vocative":"flexibilitate"}},{"word":"flexibiliza","pos":"verb","definitions":["to make flexible"],"pronunciation":"/flek.si.bi.liˈza/","forms":{"canonical":"a flexibiliza 1st conjugation","present-singular-third-person":"flexibilizează","participle-past":"flexibilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flexibiliza","gerund":"flexibilizând","first-person-indicative-present-singular":"flexibilizez","indicative-present-second-person-singular":"flexibilizezi","indicative-present-singular-third-person":"flexibilizează","first-person-indicative-plural-present":"flexibilizăm","indicative-plural-present-second-person":"flexibilizați","indicative-plural-present-third-person":"flexibilizează","first-person-imperfect-indicative-singular":"flexibilizam","imperfect-indicative-second-person-singular":"flexibilizai","imperfect-indicative-singular-third-person":"flexibiliza","first-person-imperfect-indicative-plural":"flexibilizam","imperfect-indicative-plural-second-person":"flexibilizați","imperfect-indicative-plural-third-person":"flexibilizau","first-person-indicative-perfect-singular":"flexibilizai","indicative-perfect-second-person-singular":"flexibilizași","indicative-perfect-singular-third-person":"flexibiliză","first-person-indicative-perfect-plural":"flexibilizarăm","indicative-perfect-plural-second-person":"flexibilizarăți","indicative-perfect-plural-third-person":"flexibilizară","first-person-indicative-pluperfect-singular":"flexibilizasem","indicative-pluperfect-second-person-singular":"flexibilizaseși","indicative-pluperfect-singular-third-person":"flexibilizase","first-person-indicative-pluperfect-plural":"flexibilizaserăm","indicative-pluperfect-plural-second-person":"flexibilizaserăți","indicative-pluperfect-plural-third-person":"flexibilizaseră","first-person-present-singular-subjunctive":"să flexibilizez","present-second-person-singular-subjunctive":"să flexibilizezi","present-singular-subjunctive-third-person":"să flexibilizeze","first-person-plural-present-subjunctive":"să flexibilizăm","plural-present-second-person-subjunctive":"să flexibilizați","plural-present-subjunctive-third-person":"să flexibilizeze","imperative-second-person-singular":"flexibilizează","imperative-plural-second-person":"flexibilizați","imperative-negative-second-person-singular":"nu flexibiliza","imperative-negative-plural-second-person":"nu flexibilizați"}},{"word":"flexibilizare","pos":"noun","definitions":["flexibilization"],"forms":{"plural":"flexibilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flexibilizare","accusative-definite-nominative-singular":"flexibilizarea","accusative-indefinite-nominative-plural":"flexibilizări","accusative-definite-nominative-plural":"flexibilizările","dative-genitive-indefinite-singular":"flexibilizări","dative-definite-genitive-singular":"flexibilizării","dative-genitive-indefinite-plural":"flexibilizări","dative-definite-genitive-plural":"flexibilizărilor","singular-vocative":"flexibilizare","plural-vocative":"flexibilizărilor"}},{"word":"flexibilizat","pos":"adj","definitions":["made flexible"],"forms":{"feminine-singular":"flexibilizată","masculine-plural":"flexibilizați","feminine-neuter-plural":"flexibilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flexibilizat","error-unrecognized-form-feminine-indefinite-singular":"flexibilizată","error-unrecognized-form-indefinite-masculine-plural":"flexibilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"flexibilizate","definite-error-unrecognized-form-masculine-neuter-singular":"flexibilizatul","definite-error-unrecognized-form-feminine-singular":"flexibilizata","definite-error-unrecognized-form-masculine-plural":"flexibilizații","definite-error-unrecognized-form-feminine-neuter-plural":"flexibilizatele"}},{"word":"fleximetru","pos":"noun","definitions":["deflectometer"],"forms":{"plural":"fleximetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fleximetru","accusative-definite-nominative-singular":"fleximetruul","accusative-indefinite-nominative-plural":"fleximetre","accusative-definite-nominative-plural":"fleximetrele","dative-genitive-indefinite-singular":"fleximetru","dative-definite-genitive-singular":"fleximetruului","dative-genitive-indefinite-plural":"fleximetre","dative-definite-genitive-plural":"fleximetrelor","singular-vocative":"fleximetruule","plural-vocative":"fleximetrelor"}},{"word":"flexiona","pos":"verb","definitions":["to flex"],"forms":{"canonical":"a flexiona 1st conjugation","present-singular-third-person":"flexionează","participle-past":"flexionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flexiona","gerund":"flexionând","first-person-indicative-present-singular":"flexionez","indicative-present-second-person-singular":"flexionezi","indicative-present-singular-third-person":"flexionează","first-person-indicative-plural-present":"flexionăm","indicative-plural-present-second-person":"flexionați","indicative-plural-present-third-person":"flexionează","first-person-imperfect-indicative-singular":"flexionam","imperfect-indicative-second-person-singular":"flexionai","imperfect-indicative-singular-third-person":"flexiona","first-person-imperfect-indicative-plural":"flexionam","imperfect-indicative-plural-second-person":"flexionați","imperfect-indicative-plural-third-person":"flexionau","first-person-indicative-perfect-singular":"flexionai","indicative-perfect-second-person-singular":"flexionași","indicative-perfect-singular-third-person":"flexionă","first-person-indicative-perfect-plural":"flexionarăm","indicative-perfect-plural-second-person":"flexionarăți","indicative-perfect-plural-third-person":"flexionară","first-person-indicative-pluperfect-singular":"flexionasem","indicative-pluperfect-second-person-singular":"flexionaseși","indicative-pluperfect-singular-third-person":"flexionase","first-person-indicative-pluperfect-plural":"flexionaserăm","indicative-pluperfect-plural-second-person":"flexionaserăți","indicative-pluperfect-plural-third-person":"flexionaseră","first-person-present-singular-subjunctive":"să flexionez","present-second-person-singular-subjunctive":"să flexionezi","present-singular-subjunctive-third-person":"să flexioneze","first-person-plural-present-subjunctive":"să flexionăm","plural-present-second-person-subjunctive":"să flexionați","plural-present-subjunctive-third-person":"să flexioneze","imperative-second-person-singular":"flexionează","imperative-plural-second-person":"flexionați","imperative-negative-second-person-singular":"nu flexiona","imperative-negative-plural-second-person":"nu flexionați"}},{"word":"flexionar","pos":"adj","definitions":["inflectional"],"forms":{"feminine-singular":"flexionară","masculine-plural":"flexionari","feminine-neuter-plural":"flexionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flexionar","error-unrecognized-form-feminine-indefinite-singular":"flexionară","error-unrecognized-form-indefinite-masculine-plural":"flexionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"flexionare","definite-error-unrecognized-form-masculine-neuter-singular":"flexionarul","definite-error-unrecognized-form-feminine-singular":"flexionara","definite-error-unrecognized-form-masculine-plural":"flexionarii","definite-error-unrecognized-form-feminine-neuter-plural":"flexionarele"}},{"word":"flexiune","pos":"noun","definitions":["flexion","inflection"],"pronunciation":"/flek.siˈu.ne/","forms":{"plural":"flexiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flexiune","accusative-definite-nominative-singular":"flexiunea","accusative-indefinite-nominative-plural":"flexiuni","accusative-definite-nominative-plural":"flexiunile","dative-genitive-indefinite-singular":"flexiuni","dative-definite-genitive-singular":"flexiunii","dative-genitive-indefinite-plural":"flexiuni","dative-definite-genitive-plural":"flexiunilor","singular-vocative":"flexiune","plural-vocative":"flexiunilor"}},{"word":"flexografie","pos":"noun","definitions":["flexography"],"forms":{"plural":"flexografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flexografie","accusative-definite-nominative-singular":"flexografia","accusative-indefinite-nominative-plural":"flexografii","accusative-definite-nominative-plural":"flexografiile","dative-genitive-indefinite-singular":"flexografii","dative-definite-genitive-singular":"flexografiei","dative-genitive-indefinite-plural":"flexografii","dative-definite-genitive-plural":"flexografiilor","singular-vocative":"flexografie","plural-vocative":"flexografiilor"}},{"word":"flexuos","pos":"adj","definitions":["tortuous, flexuous, crooked"],"forms":{"feminine-singular":"flexuoasă","masculine-plural":"flexuoși","feminine-neuter-plural":"flexuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flexuos","error-unrecognized-form-feminine-indefinite-singular":"flexuoasă","error-unrecognized-form-indefinite-masculine-plural":"flexuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"flexuoase","definite-error-unrecognized-form-masculine-neuter-singular":"flexuosul","definite-error-unrecognized-form-feminine-singular":"flexuoasa","definite-error-unrecognized-form-masculine-plural":"flexuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"flexuoasele"}},{"word":"flexuozitate","pos":"noun","definitions":["flexuousness"],"forms":{"plural":"flexuozitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flexuozitate","accusative-definite-nominative-singular":"flexuozitatea","accusative-indefinite-nominative-plural":"flexuozitatăți","accusative-definite-nominative-plural":"flexuozitatățile","dative-genitive-indefinite-singular":"flexuozitatăți","dative-definite-genitive-singular":"flexuozitatății","dative-genitive-indefinite-plural":"flexuozitatăți","dative-definite-genitive-plural":"flexuozitatăților","singular-vocative":"flexuozitate","plural-vocative":"flexuozitatăților"}},{"word":"flexură","pos":"noun","definitions":["flexure"],"forms":{"plural":"flexuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"flexură","accusative-definite-nominative-singular":"flexura","accusative-indefinite-nominative-plural":"flexuri","accusative-definite-nominative-plural":"flexurile","dative-genitive-indefinite-singular":"flexuri","dative-definite-genitive-singular":"flexurii","dative-genitive-indefinite-plural":"flexuri","dative-definite-genitive-plural":"flexurilor","singular-vocative":"flexură","plural-vocative":"flexurilor"}},{"word":"flibusterie","pos":"noun","definitions":["piracy"],"forms":{"plural":"flibusterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flibusterie","accusative-definite-nominative-singular":"flibusteria","accusative-indefinite-nominative-plural":"flibusterii","accusative-definite-nominative-plural":"flibusteriile","dative-genitive-indefinite-singular":"flibusterii","dative-definite-genitive-singular":"flibusteriei","dative-genitive-indefinite-plural":"flibusterii","dative-definite-genitive-plural":"flibusteriilor","singular-vocative":"flibusterie","plural-vocative":"flibusteriilor"}},{"word":"flibustier","pos":"noun","definitions":["a filibuster, a pirate"],"forms":{"plural":"flibustieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flibustier","accusative-definite-nominative-singular":"flibustierul","accusative-indefinite-nominative-plural":"flibustieri","accusative-definite-nominative-plural":"flibustierii","dative-genitive-indefinite-singular":"flibustier","dative-definite-genitive-singular":"flibustierului","dative-genitive-indefinite-plural":"flibustieri","dative-definite-genitive-plural":"flibustierilor","singular-vocative":"flibustierule","plural-vocative":"flibustierilor"}},{"word":"flictenă","pos":"noun","definitions":["blister"],"forms":{"plural":"flictene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flictenă","accusative-definite-nominative-singular":"flictena","accusative-indefinite-nominative-plural":"flictene","accusative-definite-nominative-plural":"flictenele","dative-genitive-indefinite-singular":"flictene","dative-definite-genitive-singular":"flictenei","dative-genitive-indefinite-plural":"flictene","dative-definite-genitive-plural":"flictenelor","singular-vocative":"flictenă","plural-vocative":"flictenelor"}},{"word":"flictenulă","pos":"noun","definitions":["phlyctenule"],"forms":{"plural":"flictenule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flictenulă","accusative-definite-nominative-singular":"flictenula","accusative-indefinite-nominative-plural":"flictenule","accusative-definite-nominative-plural":"flictenulele","dative-genitive-indefinite-singular":"flictenule","dative-definite-genitive-singular":"flictenulei","dative-genitive-indefinite-plural":"flictenule","dative-definite-genitive-plural":"flictenulelor","singular-vocative":"flictenulă","plural-vocative":"flictenulelor"}},{"word":"fligorn","pos":"noun","definitions":["flugelhorn"],"forms":{"plural":"fligornuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fligorn","accusative-definite-nominative-singular":"fligornul","accusative-indefinite-nominative-plural":"fligornuri","accusative-definite-nominative-plural":"fligornurile","dative-genitive-indefinite-singular":"fligorn","dative-definite-genitive-singular":"fligornului","dative-genitive-indefinite-plural":"fligornuri","dative-definite-genitive-plural":"fligornurilor","singular-vocative":"fligornule","plural-vocative":"fligornurilor"}},{"word":"Flintă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flintă"}},{"word":"flintă","pos":"noun","definitions":["flintlock"],"forms":{"plural":"flinte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flintă","accusative-definite-nominative-singular":"flinta","accusative-indefinite-nominative-plural":"flinte","accusative-definite-nominative-plural":"flintele","dative-genitive-indefinite-singular":"flinte","dative-definite-genitive-singular":"flintei","dative-genitive-indefinite-plural":"flinte","dative-definite-genitive-plural":"flintelor","singular-vocative":"flintă","plural-vocative":"flintelor"}},{"word":"flintuliță","pos":"noun","definitions":["diminutive of flintă; small flintlock"],"forms":{"plural":"flintulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flintuliță","accusative-definite-nominative-singular":"flintulița","accusative-indefinite-nominative-plural":"flintulițe","accusative-definite-nominative-plural":"flintulițele","dative-genitive-indefinite-singular":"flintulițe","dative-definite-genitive-singular":"flintuliței","dative-genitive-indefinite-plural":"flintulițe","dative-definite-genitive-plural":"flintulițelor","singular-vocative":"flintuliță","plural-vocative":"flintulițelor"}},{"word":"flipper","pos":"noun","definitions":["pinball"],"forms":{"plural":"flippere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flipper","accusative-definite-nominative-singular":"flipperul","accusative-indefinite-nominative-plural":"flippere","accusative-definite-nominative-plural":"flipperele","dative-genitive-indefinite-singular":"flipper","dative-definite-genitive-singular":"flipperului","dative-genitive-indefinite-plural":"flippere","dative-definite-genitive-plural":"flipperelor","singular-vocative":"flipperule","plural-vocative":"flipperelor"}},{"word":"flirt","pos":"noun","definitions":["flirt"],"forms":{"plural":"flirturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flirt","accusative-definite-nominative-singular":"flirtul","accusative-indefinite-nominative-plural":"flirturi","accusative-definite-nominative-plural":"flirturile","dative-genitive-indefinite-singular":"flirt","dative-definite-genitive-singular":"flirtului","dative-genitive-indefinite-plural":"flirturi","dative-definite-genitive-plural":"flirturilor","singular-vocative":"flirtule","plural-vocative":"flirturilor"}},{"word":"flirta","pos":"verb","definitions":["to flirt"],"forms":{"canonical":"a flirta 1st conjugation","present-singular-third-person":"flirtează","participle-past":"flirtat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flirta","gerund":"flirtând","first-person-indicative-present-singular":"flirtez","indicative-present-second-person-singular":"flirtezi","indicative-present-singular-third-person":"flirtează","first-person-indicative-plural-present":"flirtăm","indicative-plural-present-second-person":"flirtați","indicative-plural-present-third-person":"flirtează","first-person-imperfect-indicative-singular":"flirtam","imperfect-indicative-second-person-singular":"flirtai","imperfect-indicative-singular-third-person":"flirta","first-person-imperfect-indicative-plural":"flirtam","imperfect-indicative-plural-second-person":"flirtați","imperfect-indicative-plural-third-person":"flirtau","first-person-indicative-perfect-singular":"flirtai","indicative-perfect-second-person-singular":"flirtași","indicative-perfect-singular-third-person":"flirtă","first-person-indicative-perfect-plural":"flirtarăm","indicative-perfect-plural-second-person":"flirtarăți","indicative-perfect-plural-third-person":"flirtară","first-person-indicative-pluperfect-singular":"flirtasem","indicative-pluperfect-second-person-singular":"flirtaseși","indicative-pluperfect-singular-third-person":"flirtase","first-person-indicative-pluperfect-plural":"flirtaserăm","indicative-pluperfect-plural-second-person":"flirtaserăți","indicative-pluperfect-plural-third-person":"flirtaseră","first-person-present-singular-subjunctive":"să flirtez","present-second-person-singular-subjunctive":"să flirtezi","present-singular-subjunctive-third-person":"să flirteze","first-person-plural-present-subjunctive":"să flirtăm","plural-present-second-person-subjunctive":"să flirtați","plural-present-subjunctive-third-person":"să flirteze","imperative-second-person-singular":"flirtează","imperative-plural-second-person":"flirtați","imperative-negative-second-person-singular":"nu flirta","imperative-negative-plural-second-person":"nu flirtați"}},{"word":"fliscă","pos":"noun","definitions":["white wagtail (Motacilla alba)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fliscă","accusative-definite-nominative":"flisca","dative-genitive-indefinite":"flisce","dative-definite-genitive":"fliscei","vocative":"fliscă"}},{"word":"Floare","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floare"}},{"word":"floare","pos":"noun","definitions":["flower"],"pronunciation":"/ˈflo̯a.re/","examples":[{"ro":"floare de cireș","en":"cherry blossom"},{"ro":"floare de măr","en":"apple blossom"},{"ro":"floare de portocal","en":"orange blossom"}],"forms":{"plural":"flori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"floare","accusative-definite-nominative-singular":"floarea","accusative-indefinite-nominative-plural":"flori","accusative-definite-nominative-plural":"florile","dative-genitive-indefinite-singular":"flori","dative-definite-genitive-singular":"florii","dative-genitive-indefinite-plural":"flori","dative-definite-genitive-plural":"florilor","singular-vocative":"floare","plural-vocative":"florilor"}},{"word":"floare la ureche","pos":"adj","definitions":["piece of cake"],"examples":[{"ro":"Testul a fost floare la ureche.","en":"The test was a piece of cake."}]},{"word":"floare-de-colț","pos":"noun","definitions":["edelweiss (Leontopodium nivale)"]},{"word":"Floarea","pos":"name","definitions":["a female given name","a surname originating as a matronymic"],"gender":"f"},{"word":"floarea","pos":"noun","definitions":["definite nominative/accusative singular of floare"],"pronunciation":"/ˈflo̯a.re̯a/","gender":"f"},{"word":"Floarea Mică","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Vadului"],"gender":"f"},{"word":"floarea pasiunii","pos":"noun","definitions":["passionflower"]},{"word":"floarea soarelui","pos":"noun","definitions":["sunflower (flower)"],"forms":{"plural":"florile soarelui","alternative":"floarea-soarelui"}},{"word":"floarea-cucului","pos":"noun","definitions":["ragged-robin (Silene flos-cuculi)"]},{"word":"flobafenă","pos":"noun","definitions":["phlobaphene"],"forms":{"plural":"flobafene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flobafenă","accusative-definite-nominative-singular":"flobafena","accusative-indefinite-nominative-plural":"flobafene","accusative-definite-nominative-plural":"flobafenele","dative-genitive-indefinite-singular":"flobafene","dative-definite-genitive-singular":"flobafenei","dative-genitive-indefinite-plural":"flobafene","dative-definite-genitive-plural":"flobafenelor","singular-vocative":"flobafenă","plural-vocative":"flobafenelor"}},{"word":"floc","pos":"noun","definitions":["floc, floccule","tuft (of hair)","flock (of wool)","pubic hair"],"forms":{"canonical-neuter":"floc m floc","plural":"floci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"floc","accusative-definite-nominative-singular":"flocul","accusative-indefinite-nominative-plural":"floci","accusative-definite-nominative-plural":"flocii","dative-genitive-indefinite-singular":"floc","dative-definite-genitive-singular":"flocului","dative-genitive-indefinite-plural":"floci","dative-definite-genitive-plural":"flocilor","singular-vocative":"flocule","plural-vocative":"flocilor"}},{"word":"flocan","pos":"adj","definitions":["hairy (about dogs)"],"forms":{"feminine-singular":"flocană","masculine-plural":"flocani","feminine-neuter-plural":"flocane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flocan","error-unrecognized-form-feminine-indefinite-singular":"flocană","error-unrecognized-form-indefinite-masculine-plural":"flocani","error-unrecognized-form-feminine-indefinite-neuter-plural":"flocane","definite-error-unrecognized-form-masculine-neuter-singular":"flocanul","definite-error-unrecognized-form-feminine-singular":"flocana","definite-error-unrecognized-form-masculine-plural":"flocanii","definite-error-unrecognized-form-feminine-neuter-plural":"flocanele"}},{"word":"floci","pos":"noun","definitions":["plural of floc pubes (slang for pubic hairs)"],"pronunciation":"[flot͡ʃʲ]","gender":"m-p"},{"word":"Flocică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flocică"}},{"word":"Flocoasa","pos":"name","definitions":["a village in Ciobalaccia, Cantemir Raion, Moldova"],"gender":"f"},{"word":"Flocos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flocos"}},{"word":"flocos","pos":"adj","definitions":["hairy, wooly","flocculent"],"pronunciation":"/floˈkos/","forms":{"feminine-singular":"flocoasă","masculine-plural":"flocoși","feminine-neuter-plural":"flocoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flocos","error-unrecognized-form-feminine-indefinite-singular":"flocoasă","error-unrecognized-form-indefinite-masculine-plural":"flocoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"flocoase","definite-error-unrecognized-form-masculine-neuter-singular":"flocosul","definite-error-unrecognized-form-feminine-singular":"flocoasa","definite-error-unrecognized-form-masculine-plural":"flocoșii","definite-error-unrecognized-form-feminine-neuter-plural":"flocoasele"}},{"word":"flocoșel","pos":"noun","definitions":["wood hedgehog (Hydnum repandum)"],"forms":{"plural":"flocoșei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flocoșel","accusative-definite-nominative-singular":"flocoșelul","accusative-indefinite-nominative-plural":"flocoșei","accusative-definite-nominative-plural":"flocoșeii","dative-genitive-indefinite-singular":"flocoșel","dative-definite-genitive-singular":"flocoșelului","dative-genitive-indefinite-plural":"flocoșei","dative-definite-genitive-plural":"flocoșeilor","singular-vocative":"flocoșelule","plural-vocative":"flocoșeilor"}},{"word":"Flocoși","pos":"name","definitions":["a village in Alba County, Romania. Renamed to Izlaz in 1964."],"gender":"m"},{"word":"flocoșică","pos":"noun","definitions":["Yorkshire fog"],"forms":{"plural":"flocoșele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flocoșică","accusative-definite-nominative-singular":"flocoșica","accusative-indefinite-nominative-plural":"flocoșele","accusative-definite-nominative-plural":"flocoșelele","dative-genitive-indefinite-singular":"flocoșele","dative-definite-genitive-singular":"flocoșelei","dative-genitive-indefinite-plural":"flocoșele","dative-definite-genitive-plural":"flocoșelelor","singular-vocative":"flocoșică","plural-vocative":"flocoșelelor"}},{"word":"flocoșiță","pos":"noun","definitions":["Yorkshire fog"],"forms":{"plural":"flocoșițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flocoșiță","accusative-definite-nominative-singular":"flocoșița","accusative-indefinite-nominative-plural":"flocoșițe","accusative-definite-nominative-plural":"flocoșițele","dative-genitive-indefinite-singular":"flocoșițe","dative-definite-genitive-singular":"flocoșiței","dative-genitive-indefinite-plural":"flocoșițe","dative-definite-genitive-plural":"flocoșițelor","singular-vocative":"flocoșiță","plural-vocative":"flocoșițelor"}},{"word":"Flocosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flocosu"}},{"word":"flocșor","pos":"noun","definitions":["diminutive of floc"],"forms":{"plural":"flocșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flocșor","accusative-definite-nominative-singular":"flocșorul","accusative-indefinite-nominative-plural":"flocșoare","accusative-definite-nominative-plural":"flocșoarele","dative-genitive-indefinite-singular":"flocșor","dative-definite-genitive-singular":"flocșorului","dative-genitive-indefinite-plural":"flocșoare","dative-definite-genitive-plural":"flocșoarelor","singular-vocative":"flocșorule","plural-vocative":"flocșoarelor"}},{"word":"flocul","pos":"noun","definitions":["flocculi"],"forms":{"plural":"floculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flocul","accusative-definite-nominative-singular":"floculul","accusative-indefinite-nominative-plural":"floculi","accusative-definite-nominative-plural":"floculii","dative-genitive-indefinite-singular":"flocul","dative-definite-genitive-singular":"floculului","dative-genitive-indefinite-plural":"floculi","dative-definite-genitive-plural":"floculilor","singular-vocative":"floculule","plural-vocative":"floculilor"}},{"word":"floculare","pos":"noun","definitions":["flocculation"],"forms":{"plural":"floculări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"floculare","accusative-definite-nominative-singular":"flocularea","accusative-indefinite-nominative-plural":"floculări","accusative-definite-nominative-plural":"floculările","dative-genitive-indefinite-singular":"floculări","dative-definite-genitive-singular":"floculării","dative-genitive-indefinite-plural":"floculări","dative-definite-genitive-plural":"floculărilor","singular-vocative":"floculare","plural-vocative":"floculărilor"}},{"word":"floculație","pos":"noun","definitions":["flocculation"],"forms":{"plural":"floculații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"floculație","accusative-definite-nominative-singular":"floculația","accusative-indefinite-nominative-plural":"floculații","accusative-definite-nominative-plural":"floculațiile","dative-genitive-indefinite-singular":"floculații","dative-definite-genitive-singular":"floculației","dative-genitive-indefinite-plural":"floculații","dative-definite-genitive-plural":"floculațiilor","singular-vocative":"floculație","plural-vocative":"floculațiilor"}},{"word":"flocușor","pos":"noun","definitions":["diminutive of floc"],"forms":{"plural":"flocușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flocușor","accusative-definite-nominative-singular":"flocușorul","accusative-indefinite-nominative-plural":"flocușori","accusative-definite-nominative-plural":"flocușorii","dative-genitive-indefinite-singular":"flocușor","dative-definite-genitive-singular":"flocușorului","dative-genitive-indefinite-plural":"flocușori","dative-definite-genitive-plural":"flocușorilor","singular-vocative":"flocușorule","plural-vocative":"flocușorilor"}},{"word":"flocuț","pos":"noun","definitions":["diminutive of floc"],"forms":{"plural":"flocuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flocuț","accusative-definite-nominative-singular":"flocuțul","accusative-indefinite-nominative-plural":"flocuțe","accusative-definite-nominative-plural":"flocuțele","dative-genitive-indefinite-singular":"flocuț","dative-definite-genitive-singular":"flocuțului","dative-genitive-indefinite-plural":"flocuțe","dative-definite-genitive-plural":"flocuțelor","singular-vocative":"flocuțule","plural-vocative":"flocuțelor"}},{"word":"Flocuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Flocuțescu"}},{"word":"floem","pos":"noun","definitions":["phloem"],"forms":{"plural":"floemuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"floem","accusative-definite-nominative-singular":"floemul","accusative-indefinite-nominative-plural":"floemuri","accusative-definite-nominative-plural":"floemurile","dative-genitive-indefinite-singular":"floem","dative-definite-genitive-singular":"floemului","dative-genitive-indefinite-plural":"floemuri","dative-definite-genitive-plural":"floemurilor","singular-vocative":"floemule","plural-vocative":"floemurilor"}},{"word":"flogistic","pos":"adj","definitions":["phlogistic"],"forms":{"feminine-singular":"flogistică","masculine-plural":"flogistici","feminine-neuter-plural":"flogistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flogistic","error-unrecognized-form-feminine-indefinite-singular":"flogistică","error-unrecognized-form-indefinite-masculine-plural":"flogistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flogistice","definite-error-unrecognized-form-masculine-neuter-singular":"flogisticul","definite-error-unrecognized-form-feminine-singular":"flogistica","definite-error-unrecognized-form-masculine-plural":"flogisticii","definite-error-unrecognized-form-feminine-neuter-plural":"flogisticele"}},{"word":"flogiston","pos":"noun","definitions":["phlogiston"],"forms":{"plural":"flogistoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flogiston","accusative-definite-nominative-singular":"flogistonul","accusative-indefinite-nominative-plural":"flogistoane","accusative-definite-nominative-plural":"flogistoanele","dative-genitive-indefinite-singular":"flogiston","dative-definite-genitive-singular":"flogistonului","dative-genitive-indefinite-plural":"flogistoane","dative-definite-genitive-plural":"flogistoanelor","singular-vocative":"flogistonule","plural-vocative":"flogistoanelor"}},{"word":"flogopit","pos":"noun","definitions":["phlogopite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flogopit","accusative-definite-nominative-singular":"flogopitul","accusative-indefinite-nominative-plural":"flogopite","accusative-definite-nominative-plural":"flogopitele","dative-genitive-indefinite-singular":"flogopit","dative-definite-genitive-singular":"flogopitului","dative-genitive-indefinite-plural":"flogopite","dative-definite-genitive-plural":"flogopitelor","singular-vocative":"flogopitule","plural-vocative":"flogopitelor"}},{"word":"flogoză","pos":"noun","definitions":["phlogosis"],"forms":{"plural":"flogoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flogoză","accusative-definite-nominative-singular":"flogoza","accusative-indefinite-nominative-plural":"flogoze","accusative-definite-nominative-plural":"flogozele","dative-genitive-indefinite-singular":"flogoze","dative-definite-genitive-singular":"flogozei","dative-genitive-indefinite-plural":"flogoze","dative-definite-genitive-plural":"flogozelor","singular-vocative":"flogoză","plural-vocative":"flogozelor"}},{"word":"Flondora","pos":"name","definitions":["a village in Manoleasa, Botoșani County, Romania"],"gender":"f"},{"word":"flor","pos":"adj","definitions":["blond, or with reddish-blond hair"],"pronunciation":"/flor/","forms":{"feminine-singular":"floară","masculine-plural":"flori","feminine-neuter-plural":"floare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flor","error-unrecognized-form-feminine-indefinite-singular":"floară","error-unrecognized-form-indefinite-masculine-plural":"flori","error-unrecognized-form-feminine-indefinite-neuter-plural":"floare","definite-error-unrecognized-form-masculine-neuter-singular":"florul","definite-error-unrecognized-form-feminine-singular":"floara","definite-error-unrecognized-form-masculine-plural":"florii","definite-error-unrecognized-form-feminine-neuter-plural":"floarele"}},{"word":"floră","pos":"noun","definitions":["flora"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"floră","accusative-definite-nominative":"flora","dative-genitive-indefinite":"flore","dative-definite-genitive":"florei","vocative":"floră"}},{"word":"floral","pos":"adj","definitions":["floral"],"forms":{"feminine-singular":"florală","masculine-plural":"florali","feminine-neuter-plural":"florale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"floral","error-unrecognized-form-feminine-indefinite-singular":"florală","error-unrecognized-form-indefinite-masculine-plural":"florali","error-unrecognized-form-feminine-indefinite-neuter-plural":"florale","definite-error-unrecognized-form-masculine-neuter-singular":"floralul","definite-error-unrecognized-form-feminine-singular":"florala","definite-error-unrecognized-form-masculine-plural":"floralii","definite-error-unrecognized-form-feminine-neuter-plural":"floralele"}},{"word":"Floran","pos":"name","definitions":["a village in Terpezița, Dolj County, Romania"],"gender":"m"},{"word":"florar","pos":"noun","definitions":["one who grows or sells flowers; flower vendor; florist","May (fifth month of the Gregorian calendar)"],"pronunciation":"/floˈrar/","forms":{"plural":"florari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florar","accusative-definite-nominative-singular":"florarul","accusative-indefinite-nominative-plural":"florari","accusative-definite-nominative-plural":"florarii","dative-genitive-indefinite-singular":"florar","dative-definite-genitive-singular":"florarului","dative-genitive-indefinite-plural":"florari","dative-definite-genitive-plural":"florarilor","singular-vocative":"florarule","plural-vocative":"florarilor"}},{"word":"florăreasă","pos":"noun","definitions":["female equivalent of florar"],"forms":{"plural":"florărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"florăreasă","accusative-definite-nominative-singular":"florăreasa","accusative-indefinite-nominative-plural":"florărese","accusative-definite-nominative-plural":"florăresele","dative-genitive-indefinite-singular":"florărese","dative-definite-genitive-singular":"florăresei","dative-genitive-indefinite-plural":"florărese","dative-definite-genitive-plural":"florăreselor","singular-vocative":"florăreasă","plural-vocative":"florăreselor"}},{"word":"florărie","pos":"noun","definitions":["flower shop"],"forms":{"plural":"florării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"florărie","accusative-definite-nominative-singular":"florăria","accusative-indefinite-nominative-plural":"florării","accusative-definite-nominative-plural":"florăriile","dative-genitive-indefinite-singular":"florării","dative-definite-genitive-singular":"florăriei","dative-genitive-indefinite-plural":"florării","dative-definite-genitive-plural":"florăriilor","singular-vocative":"florărie","plural-vocative":"florăriilor"}},{"word":"florăriță","pos":"noun","definitions":["female equivalent of florar"],"forms":{"plural":"florărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"florăriță","accusative-definite-nominative-singular":"florărița","accusative-indefinite-nominative-plural":"florărițe","accusative-definite-nominative-plural":"florărițele","dative-genitive-indefinite-singular":"florărițe","dative-definite-genitive-singular":"florăriței","dative-genitive-indefinite-plural":"florărițe","dative-definite-genitive-plural":"florărițelor","singular-vocative":"florăriță","plural-vocative":"florărițelor"}},{"word":"Florariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Florariu"}},{"word":"Florea","pos":"name","definitions":["a surname"]},{"word":"floreal","pos":"noun","definitions":["Floréal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"floreal","accusative-definite-nominative":"florealul","dative-genitive-indefinite":"floreal","dative-definite-genitive":"florealului","vocative":"florealule"}},{"word":"Floreasca","pos":"name","definitions":["a neighbourhood of Bucharest, Romania","a lake in Bucharest, Romania","a park in Bucharest, Romania"],"gender":"f"},{"word":"Florei","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Doftana","a river in Prahova, Romania, tributary to the Prahova"],"gender":"m"},{"word":"Floreni","pos":"name","definitions":["a locality in Murgeni, Vaslui County, Romania"],"gender":"m"},{"word":"Florența","pos":"name","definitions":["Florence (a city and comune, the capital of the Metropolitan City of Florence and the region of Tuscany, Italy)","Florence (a metropolitan city of Tuscany, established in 2015; in full, the Metropolitan City of Florence)"],"pronunciation":"/floˈren.t͡sa/","gender":"f"},{"word":"florentin","pos":"adj","definitions":["Florentine (of, from or relating to the city of Florence, Tuscany, Italy)"],"pronunciation":"/florenˈtin/","forms":{"feminine-singular":"florentină","masculine-plural":"florentini","feminine-neuter-plural":"florentine","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"florentin","error-unrecognized-form-feminine-indefinite-singular":"florentină","error-unrecognized-form-indefinite-masculine-plural":"florentini","error-unrecognized-form-feminine-indefinite-neuter-plural":"florentine","definite-error-unrecognized-form-masculine-neuter-singular":"florentinul","definite-error-unrecognized-form-feminine-singular":"florentina","definite-error-unrecognized-form-masculine-plural":"florentinii","definite-error-unrecognized-form-feminine-neuter-plural":"florentinele"}},{"word":"florentin","pos":"noun","definitions":["Florentine (native or inhabitant of the city of Florence, Tuscany, Italy) (usually male)"],"pronunciation":"/florenˈtin/","forms":{"plural":"florentini","feminine":"equivalent florentină","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florentin","accusative-definite-nominative-singular":"florentinul","accusative-indefinite-nominative-plural":"florentini","accusative-definite-nominative-plural":"florentinii","dative-genitive-indefinite-singular":"florentin","dative-definite-genitive-singular":"florentinului","dative-genitive-indefinite-plural":"florentini","dative-definite-genitive-plural":"florentinilor","singular-vocative":"florentine","plural-vocative":"florentinilor"}},{"word":"florentina","pos":"adj","definitions":["definite nominative feminine singular of florentin","definite accusative feminine singular of florentin"],"pronunciation":"/florenˈtina/"},{"word":"florentină","pos":"adj","definitions":["nominative/accusative feminine singular of florentin"],"pronunciation":"/florenˈtinə/"},{"word":"florentine","pos":"adj","definitions":["inflection of florentin:","genitive/dative feminine singular","nominative/accusative/genitive/dative feminine/neuter plural"],"pronunciation":"/florenˈtine/"},{"word":"florentine","pos":"noun","definitions":["vocative singular of florentin"],"pronunciation":"/florenˈtine/","gender":"m"},{"word":"florentini","pos":"adj","definitions":["nominative/accusative/genitive/dative masculine plural of florentin"],"pronunciation":"/florenˈtinʲ/"},{"word":"florentini","pos":"noun","definitions":["nominative/accusative/genitive/dative plural of florentin"],"pronunciation":"/florenˈtinʲ/","gender":"m-p"},{"word":"florer","pos":"noun","definitions":["alternative form of florar"],"forms":{"plural":"floreri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florer","accusative-definite-nominative-singular":"florerul","accusative-indefinite-nominative-plural":"floreri","accusative-definite-nominative-plural":"florerii","dative-genitive-indefinite-singular":"florer","dative-definite-genitive-singular":"florerului","dative-genitive-indefinite-plural":"floreri","dative-definite-genitive-plural":"florerilor","singular-vocative":"florerule","plural-vocative":"florerilor"}},{"word":"Florescu","pos":"name","definitions":["a surname"],"pronunciation":"/flo.ˈres.ku/","gender":"m","forms":{"dative-genitive":"lui Florescu"}},{"word":"Floreșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Floreșteanu"}},{"word":"Floreșteni","pos":"name","definitions":["a village in Târgu Cărbunești, Gorj County, Romania"],"gender":"m"},{"word":"Florești","pos":"name","definitions":["a city and district of Moldova","a locality in Câmpeni, Alba County, Romania","a village in Bucium, Alba County, Romania","a village in Râmeț, Alba County, Romania","a village in Scărișoara, Alba County, Romania"],"pronunciation":"/floˈreʃtʲ/","gender":"m"},{"word":"Florești-Stoenești","pos":"name","definitions":["a commune of Giurgiu County, Romania"],"gender":"m"},{"word":"floretă","pos":"noun","definitions":["foil"],"forms":{"plural":"florete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"floretă","accusative-definite-nominative-singular":"floreta","accusative-indefinite-nominative-plural":"florete","accusative-definite-nominative-plural":"floretele","dative-genitive-indefinite-singular":"florete","dative-definite-genitive-singular":"floretei","dative-genitive-indefinite-plural":"florete","dative-definite-genitive-plural":"floretelor","singular-vocative":"floretă","plural-vocative":"floretelor"}},{"word":"floretist","pos":"noun","definitions":["foil fencer"],"forms":{"plural":"floretiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"floretist","accusative-definite-nominative-singular":"floretistul","accusative-indefinite-nominative-plural":"floretiști","accusative-definite-nominative-plural":"floretiștii","dative-genitive-indefinite-singular":"floretist","dative-definite-genitive-singular":"floretistului","dative-genitive-indefinite-plural":"floretiști","dative-definite-genitive-plural":"floretiștilor","singular-vocative":"floretistule","plural-vocative":"floretiștilor"}},{"word":"floretistă","pos":"noun","definitions":["female equivalent of floretist"],"forms":{"plural":"floretiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"floretistă","accusative-definite-nominative-singular":"floretista","accusative-indefinite-nominative-plural":"floretiste","accusative-definite-nominative-plural":"floretistele","dative-genitive-indefinite-singular":"floretiste","dative-definite-genitive-singular":"floretistei","dative-genitive-indefinite-plural":"floretiste","dative-definite-genitive-plural":"floretistelor","singular-vocative":"floretistă","plural-vocative":"floretistelor"}},{"word":"flori","pos":"noun","definitions":["plural of floare (“flower”)"],"pronunciation":"[ florʲ ]","gender":"f-p"},{"word":"floribund","pos":"adj","definitions":["blooming, blossoming"],"forms":{"feminine-singular":"floribundă","masculine-plural":"floribunzi","feminine-neuter-plural":"floribunde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"floribund","error-unrecognized-form-feminine-indefinite-singular":"floribundă","error-unrecognized-form-indefinite-masculine-plural":"floribunzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"floribunde","definite-error-unrecognized-form-masculine-neuter-singular":"floribundul","definite-error-unrecognized-form-feminine-singular":"floribunda","definite-error-unrecognized-form-masculine-plural":"floribunzii","definite-error-unrecognized-form-feminine-neuter-plural":"floribundele"}},{"word":"Florica","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"Florică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Florică"}},{"word":"florică","pos":"noun","definitions":["diminutive of floare"],"forms":{"plural":"florici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"florică","accusative-definite-nominative-singular":"florica","accusative-indefinite-nominative-plural":"florici","accusative-definite-nominative-plural":"floricile","dative-genitive-indefinite-singular":"florici","dative-definite-genitive-singular":"floricii","dative-genitive-indefinite-plural":"florici","dative-definite-genitive-plural":"floricilor","singular-vocative":"florică","plural-vocative":"floricilor"}},{"word":"floricea","pos":"noun","definitions":["diminutive of floare; small flower"],"forms":{"plural":"floricele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"floricea","accusative-definite-nominative-singular":"floriceaua","accusative-indefinite-nominative-plural":"floricele","accusative-definite-nominative-plural":"floricelele","dative-genitive-indefinite-singular":"floricele","dative-definite-genitive-singular":"floricelei","dative-genitive-indefinite-plural":"floricele","dative-definite-genitive-plural":"floricelelor","singular-vocative":"floricea","plural-vocative":"floricelelor"}},{"word":"Floricel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floricel"}},{"word":"floricele de porumb","pos":"noun","definitions":["popcorn"]},{"word":"floricelele","pos":"noun","definitions":["definite nominative/accusative plural of floricea"]},{"word":"Floriceni","pos":"name","definitions":["a village in Căinarii Vechi, Soroca Raion, Moldova"],"gender":"m"},{"word":"Floricescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Floricescu"}},{"word":"Florichescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Florichescu"}},{"word":"Floricica","pos":"name","definitions":["a village in Enichioi, Cantemir Raion, Moldova"],"gender":"f"},{"word":"floricica","pos":"noun","definitions":["definite nominative/accusative singular of floricică"]},{"word":"Floricică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floricică"}},{"word":"floricică","pos":"noun","definitions":["diminutive of floare; small flower"],"pronunciation":"/flo.riˈt͡ʃi.kə/","forms":{"plural":"floricele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"floricică","accusative-definite-nominative-singular":"floricica","accusative-indefinite-nominative-plural":"floricele","accusative-definite-nominative-plural":"floricelele","dative-genitive-indefinite-singular":"floricele","dative-definite-genitive-singular":"floricelei","dative-genitive-indefinite-plural":"floricele","dative-definite-genitive-plural":"floricelelor","singular-vocative":"floricică","plural-vocative":"floricelelor","alternative":"floricea"}},{"word":"Floricioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Floricioiu"}},{"word":"Floricoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Floricoiu"}},{"word":"floricol","pos":"adj","definitions":["floricultural"],"forms":{"feminine-singular":"floricolă","masculine-plural":"floricoli","feminine-neuter-plural":"floricole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"floricol","error-unrecognized-form-feminine-indefinite-singular":"floricolă","error-unrecognized-form-indefinite-masculine-plural":"floricoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"floricole","definite-error-unrecognized-form-masculine-neuter-singular":"floricolul","definite-error-unrecognized-form-feminine-singular":"floricola","definite-error-unrecognized-form-masculine-plural":"floricolii","definite-error-unrecognized-form-feminine-neuter-plural":"floricolele"}},{"word":"floricultoare","pos":"noun","definitions":["female equivalent of floricultor"],"forms":{"plural":"floricultoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"floricultoare","accusative-definite-nominative-singular":"floricultoarea","accusative-indefinite-nominative-plural":"floricultoare","accusative-definite-nominative-plural":"floricultoarele","dative-genitive-indefinite-singular":"floricultoare","dative-definite-genitive-singular":"floricultoarei","dative-genitive-indefinite-plural":"floricultoare","dative-definite-genitive-plural":"floricultoarelor","singular-vocative":"floricultoare","plural-vocative":"floricultoarelor"}},{"word":"floricultor","pos":"noun","definitions":["florist (person who cultivates flowers)"],"forms":{"plural":"floricultori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"floricultor","accusative-definite-nominative-singular":"floricultorul","accusative-indefinite-nominative-plural":"floricultori","accusative-definite-nominative-plural":"floricultorii","dative-genitive-indefinite-singular":"floricultor","dative-definite-genitive-singular":"floricultorului","dative-genitive-indefinite-plural":"floricultori","dative-definite-genitive-plural":"floricultorilor","singular-vocative":"floricultorule","plural-vocative":"floricultorilor"}},{"word":"floricultură","pos":"noun","definitions":["floriculture"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"floricultură","accusative-definite-nominative":"floricultura","dative-genitive-indefinite":"floriculture","dative-definite-genitive":"floriculturei","vocative":"floricultură"}},{"word":"florid","pos":"adj","definitions":["blooming"],"forms":{"feminine-singular":"floridă","masculine-plural":"florizi","feminine-neuter-plural":"floride","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"florid","error-unrecognized-form-feminine-indefinite-singular":"floridă","error-unrecognized-form-indefinite-masculine-plural":"florizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"floride","definite-error-unrecognized-form-masculine-neuter-singular":"floridul","definite-error-unrecognized-form-feminine-singular":"florida","definite-error-unrecognized-form-masculine-plural":"florizii","definite-error-unrecognized-form-feminine-neuter-plural":"floridele"}},{"word":"Florieni","pos":"name","definitions":["a village in Albeștii de Argeș, Argeș County, Romania"],"gender":"m"},{"word":"florifer","pos":"adj","definitions":["floriferous"],"forms":{"feminine-singular":"floriferă","masculine-plural":"floriferi","feminine-neuter-plural":"florifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"florifer","error-unrecognized-form-feminine-indefinite-singular":"floriferă","error-unrecognized-form-indefinite-masculine-plural":"floriferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"florifere","definite-error-unrecognized-form-masculine-neuter-singular":"floriferul","definite-error-unrecognized-form-feminine-singular":"florifera","definite-error-unrecognized-form-masculine-plural":"floriferii","definite-error-unrecognized-form-feminine-neuter-plural":"floriferele"}},{"word":"Florii","pos":"noun","definitions":["Palm Sunday"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Florii","accusative-definite-nominative":"Floriile","dative-genitive-indefinite":"Florii","dative-definite-genitive":"Floriilor","vocative":"Floriilor"}},{"word":"florii","pos":"noun","definitions":["definite genitive/dative singular of floare"],"pronunciation":"[ˈflorij]","gender":"f"},{"word":"Floriile","pos":"name","definitions":["a village in Aliman, Constanța County, Romania"],"gender":"m"},{"word":"Florile Albe","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Galben"],"gender":"m"},{"word":"florilegiu","pos":"noun","definitions":["anthology, florilegium"],"forms":{"plural":"florilegii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"florilegiu","accusative-definite-nominative-singular":"florilegiuul","accusative-indefinite-nominative-plural":"florilegii","accusative-definite-nominative-plural":"florilegiile","dative-genitive-indefinite-singular":"florilegiu","dative-definite-genitive-singular":"florilegiuului","dative-genitive-indefinite-plural":"florilegii","dative-definite-genitive-plural":"florilegiilor","singular-vocative":"florilegiuule","plural-vocative":"florilegiilor"}},{"word":"florilor","pos":"noun","definitions":["definite genitive/dative plural of floare"]},{"word":"Florin","pos":"name","definitions":["a male given name comparable to Florian"],"pronunciation":"[ˈflo.rin]","gender":"m","forms":{"dative-genitive":"lui Florin","feminine":"Florina"}},{"word":"florin","pos":"noun","definitions":["florin"],"forms":{"plural":"florini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florin","accusative-definite-nominative-singular":"florinul","accusative-indefinite-nominative-plural":"florini","accusative-definite-nominative-plural":"florinii","dative-genitive-indefinite-singular":"florin","dative-definite-genitive-singular":"florinului","dative-genitive-indefinite-plural":"florini","dative-definite-genitive-plural":"florinilor","singular-vocative":"florinule","plural-vocative":"florinilor"}},{"word":"Florina","pos":"name","definitions":["a female given name comparable to Floriana"],"pronunciation":"[floˈri.na]","gender":"f","forms":{"dative-genitive":"Florinei","masculine":"Florin"}},{"word":"florincior","pos":"noun","definitions":["diminutive of florint"],"forms":{"plural":"florinciori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florincior","accusative-definite-nominative-singular":"florinciorul","accusative-indefinite-nominative-plural":"florinciori","accusative-definite-nominative-plural":"florinciorii","dative-genitive-indefinite-singular":"florincior","dative-definite-genitive-singular":"florinciorului","dative-genitive-indefinite-plural":"florinciori","dative-definite-genitive-plural":"florinciorilor","singular-vocative":"florinciorule","plural-vocative":"florinciorilor"}},{"word":"Florinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Florinescu"}},{"word":"florint","pos":"noun","definitions":["obsolete form of florin"],"forms":{"plural":"florinți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florint","accusative-definite-nominative-singular":"florintul","accusative-indefinite-nominative-plural":"florinți","accusative-definite-nominative-plural":"florinții","dative-genitive-indefinite-singular":"florint","dative-definite-genitive-singular":"florintului","dative-genitive-indefinite-plural":"florinți","dative-definite-genitive-plural":"florinților","singular-vocative":"florintule","plural-vocative":"florinților"}},{"word":"florinte","pos":"noun","definitions":["European greenfinch (Chloris chloris)"],"forms":{"plural":"florinți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florinte","accusative-definite-nominative-singular":"florinteul","accusative-indefinite-nominative-plural":"florinți","accusative-definite-nominative-plural":"florinții","dative-genitive-indefinite-singular":"florinte","dative-definite-genitive-singular":"florinteului","dative-genitive-indefinite-plural":"florinți","dative-definite-genitive-plural":"florinților","singular-vocative":"florinteule","plural-vocative":"florinților"}},{"word":"florințel","pos":"noun","definitions":["diminutive of florinte"],"forms":{"plural":"florinței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florințel","accusative-definite-nominative-singular":"florințelul","accusative-indefinite-nominative-plural":"florinței","accusative-definite-nominative-plural":"florințeii","dative-genitive-indefinite-singular":"florințel","dative-definite-genitive-singular":"florințelului","dative-genitive-indefinite-plural":"florinței","dative-definite-genitive-plural":"florințeilor","singular-vocative":"florințelule","plural-vocative":"florințeilor"}},{"word":"florioară","pos":"noun","definitions":["diminutive of floare"],"forms":{"plural":"florioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"florioară","accusative-definite-nominative-singular":"florioara","accusative-indefinite-nominative-plural":"florioare","accusative-definite-nominative-plural":"florioarele","dative-genitive-indefinite-singular":"florioare","dative-definite-genitive-singular":"florioarei","dative-genitive-indefinite-plural":"florioare","dative-definite-genitive-plural":"florioarelor","singular-vocative":"florioară","plural-vocative":"florioarelor"}},{"word":"florișoară","pos":"noun","definitions":["diminutive of floare; small flower"],"forms":{"plural":"florișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"florișoară","accusative-definite-nominative-singular":"florișoara","accusative-indefinite-nominative-plural":"florișoare","accusative-definite-nominative-plural":"florișoarele","dative-genitive-indefinite-singular":"florișoare","dative-definite-genitive-singular":"florișoarei","dative-genitive-indefinite-plural":"florișoare","dative-definite-genitive-plural":"florișoarelor","singular-vocative":"florișoară","plural-vocative":"florișoarelor"}},{"word":"florist","pos":"noun","definitions":["florist"],"pronunciation":"/floˈrist/","forms":{"plural":"floriști","feminine":"equivalent floristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"florist","accusative-definite-nominative-singular":"floristul","accusative-indefinite-nominative-plural":"floriști","accusative-definite-nominative-plural":"floriștii","dative-genitive-indefinite-singular":"florist","dative-definite-genitive-singular":"floristului","dative-genitive-indefinite-plural":"floriști","dative-definite-genitive-plural":"floriștilor","singular-vocative":"floristule","plural-vocative":"floriștilor"}},{"word":"florista","pos":"noun","definitions":["definite nominative/accusative singular of floristă"],"pronunciation":"[floˈrista]","gender":"f"},{"word":"floristă","pos":"noun","definitions":["female equivalent of florist"],"pronunciation":"/floˈris.tə/","forms":{"plural":"floriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"floristă","accusative-definite-nominative-singular":"florista","accusative-indefinite-nominative-plural":"floriste","accusative-definite-nominative-plural":"floristele","dative-genitive-indefinite-singular":"floriste","dative-definite-genitive-singular":"floristei","dative-genitive-indefinite-plural":"floriste","dative-definite-genitive-plural":"floristelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"floriste","pos":"noun","definitions":["plural of floristă"],"gender":"f"},{"word":"Floriștean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Floriștean"}},{"word":"Florișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Florișteanu"}},{"word":"floriști","pos":"noun","definitions":["plural of florist"],"gender":"m"},{"word":"floristic","pos":"adj","definitions":["floral (pertaining to the flora of a region), floristic"],"forms":{"feminine-singular":"floristică","masculine-plural":"floristici","feminine-neuter-plural":"floristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"floristic","error-unrecognized-form-feminine-indefinite-singular":"floristică","error-unrecognized-form-indefinite-masculine-plural":"floristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"floristice","definite-error-unrecognized-form-masculine-neuter-singular":"floristicul","definite-error-unrecognized-form-feminine-singular":"floristica","definite-error-unrecognized-form-masculine-plural":"floristicii","definite-error-unrecognized-form-feminine-neuter-plural":"floristicele"}},{"word":"floristică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of floristic"]},{"word":"Floriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floriță"}},{"word":"Florițoaia Nouă","pos":"name","definitions":["a village in Florițoaia Veche, Ungheni Raion, Moldova"],"gender":"f"},{"word":"Florițoaia Veche","pos":"name","definitions":["a village in Florițoaia Veche, Ungheni Raion, Moldova","a commune of Ungheni Raion, Moldova"],"gender":"f"},{"word":"floriu","pos":"adj","definitions":["flowery"],"forms":{"feminine-singular":"florie","plural":"florii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"floriu","error-unrecognized-form-feminine-indefinite-singular":"florie","error-unrecognized-form-indefinite-masculine-plural":"florii","error-unrecognized-form-feminine-indefinite-neuter-plural":"florii","definite-error-unrecognized-form-masculine-neuter-singular":"floriul","definite-error-unrecognized-form-feminine-singular":"floria","definite-error-unrecognized-form-masculine-plural":"floriii","definite-error-unrecognized-form-feminine-neuter-plural":"floriile"}},{"word":"Floroaia","pos":"name","definitions":["a village in Întorsura Buzăului, Covasna County, Romania"],"gender":"f"},{"word":"Floroaica","pos":"name","definitions":["a village in Vâlcelele, Călărași County, Romania"],"gender":"f"},{"word":"floroglucină","pos":"noun","definitions":["fluoroglycine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"floroglucină","accusative-definite-nominative-singular":"floroglucina","accusative-indefinite-nominative-plural":"floroglucine","accusative-definite-nominative-plural":"floroglucinele","dative-genitive-indefinite-singular":"floroglucine","dative-definite-genitive-singular":"floroglucinei","dative-genitive-indefinite-plural":"floroglucine","dative-definite-genitive-plural":"floroglucinelor","singular-vocative":"floroglucină","plural-vocative":"floroglucinelor"}},{"word":"Floroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Floroiu"}},{"word":"Floru","pos":"name","definitions":["a village in Icoana, Olt County, Romania"],"gender":"m"},{"word":"Floruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floruț"}},{"word":"Floruța","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floruța"}},{"word":"Floruță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Floruță"}},{"word":"flota","pos":"verb","definitions":["to float"],"pronunciation":"[floˈta]","forms":{"canonical":"a flota 1st conjugation","present-singular-third-person":"flotează","participle-past":"flotat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a flota","gerund":"flotând","first-person-indicative-present-singular":"flotez","indicative-present-second-person-singular":"flotezi","indicative-present-singular-third-person":"flotează","first-person-indicative-plural-present":"flotăm","indicative-plural-present-second-person":"flotați","indicative-plural-present-third-person":"flotează","first-person-imperfect-indicative-singular":"flotam","imperfect-indicative-second-person-singular":"flotai","imperfect-indicative-singular-third-person":"flota","first-person-imperfect-indicative-plural":"flotam","imperfect-indicative-plural-second-person":"flotați","imperfect-indicative-plural-third-person":"flotau","first-person-indicative-perfect-singular":"flotai","indicative-perfect-second-person-singular":"flotași","indicative-perfect-singular-third-person":"flotă","first-person-indicative-perfect-plural":"flotarăm","indicative-perfect-plural-second-person":"flotarăți","indicative-perfect-plural-third-person":"flotară","first-person-indicative-pluperfect-singular":"flotasem","indicative-pluperfect-second-person-singular":"flotaseși","indicative-pluperfect-singular-third-person":"flotase","first-person-indicative-pluperfect-plural":"flotaserăm","indicative-pluperfect-plural-second-person":"flotaserăți","indicative-pluperfect-plural-third-person":"flotaseră","first-person-present-singular-subjunctive":"să flotez","present-second-person-singular-subjunctive":"să flotezi","present-singular-subjunctive-third-person":"să floteze","first-person-plural-present-subjunctive":"să flotăm","plural-present-second-person-subjunctive":"să flotați","plural-present-subjunctive-third-person":"să floteze","imperative-second-person-singular":"flotează","imperative-plural-second-person":"flotați","imperative-negative-second-person-singular":"nu flota","imperative-negative-plural-second-person":"nu flotați"}},{"word":"flota","pos":"noun","definitions":["definite nominative/accusative singular of flotă"],"pronunciation":"[ˈflota]","gender":"f"},{"word":"flotă","pos":"noun","definitions":["fleet","navy"],"forms":{"plural":"flote","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"flotă","accusative-definite-nominative-singular":"flota","accusative-indefinite-nominative-plural":"flote","accusative-definite-nominative-plural":"flotele","dative-genitive-indefinite-singular":"flote","dative-definite-genitive-singular":"flotei","dative-genitive-indefinite-plural":"flote","dative-definite-genitive-plural":"flotelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"flotabil","pos":"adj","definitions":["buoyant"],"forms":{"feminine-singular":"flotabilă","masculine-plural":"flotabili","feminine-neuter-plural":"flotabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flotabil","error-unrecognized-form-feminine-indefinite-singular":"flotabilă","error-unrecognized-form-indefinite-masculine-plural":"flotabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"flotabile","definite-error-unrecognized-form-masculine-neuter-singular":"flotabilul","definite-error-unrecognized-form-feminine-singular":"flotabila","definite-error-unrecognized-form-masculine-plural":"flotabilii","definite-error-unrecognized-form-feminine-neuter-plural":"flotabilele"}},{"word":"flotabilitate","pos":"noun","definitions":["buoyancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"flotabilitate","accusative-definite-nominative":"flotabilitatea","dative-genitive-indefinite":"flotabilități","dative-definite-genitive":"flotabilității","vocative":"flotabilitate"}},{"word":"flotant","pos":"adj","definitions":["floating"],"pronunciation":"/floˈtant/","forms":{"feminine-singular":"flotantă","masculine-plural":"flotanți","feminine-neuter-plural":"flotante","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"flotant","error-unrecognized-form-feminine-indefinite-singular":"flotantă","error-unrecognized-form-indefinite-masculine-plural":"flotanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"flotante","definite-error-unrecognized-form-masculine-neuter-singular":"flotantul","definite-error-unrecognized-form-feminine-singular":"flotanta","definite-error-unrecognized-form-masculine-plural":"flotanții","definite-error-unrecognized-form-feminine-neuter-plural":"flotantele"}},{"word":"flotare","pos":"noun","definitions":["flotation"],"forms":{"plural":"flotări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"flotare","accusative-definite-nominative-singular":"flotarea","accusative-indefinite-nominative-plural":"flotări","accusative-definite-nominative-plural":"flotările","dative-genitive-indefinite-singular":"flotări","dative-definite-genitive-singular":"flotării","dative-genitive-indefinite-plural":"flotări","dative-definite-genitive-plural":"flotărilor","singular-vocative":"flotare","plural-vocative":"flotărilor"}},{"word":"flotație","pos":"noun","definitions":["floatation"],"forms":{"plural":"flotații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"flotație","accusative-definite-nominative-singular":"flotația","accusative-indefinite-nominative-plural":"flotații","accusative-definite-nominative-plural":"flotațiile","dative-genitive-indefinite-singular":"flotații","dative-definite-genitive-singular":"flotației","dative-genitive-indefinite-plural":"flotații","dative-definite-genitive-plural":"flotațiilor","singular-vocative":"flotație","plural-vocative":"flotațiilor"}},{"word":"flote","pos":"noun","definitions":["inflection of flotă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈflote]","gender":"f"},{"word":"flotilă","pos":"noun","definitions":["fleet, flotilla"],"forms":{"plural":"flotile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flotilă","accusative-definite-nominative-singular":"flotila","accusative-indefinite-nominative-plural":"flotile","accusative-definite-nominative-plural":"flotilele","dative-genitive-indefinite-singular":"flotile","dative-definite-genitive-singular":"flotilei","dative-genitive-indefinite-plural":"flotile","dative-definite-genitive-plural":"flotilelor","singular-vocative":"flotilă","plural-vocative":"flotilelor"}},{"word":"flotilaș","pos":"noun","definitions":["flotilla soldier"],"forms":{"plural":"flotilași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flotilaș","accusative-definite-nominative-singular":"flotilașul","accusative-indefinite-nominative-plural":"flotilași","accusative-definite-nominative-plural":"flotilașii","dative-genitive-indefinite-singular":"flotilaș","dative-definite-genitive-singular":"flotilașului","dative-genitive-indefinite-plural":"flotilași","dative-definite-genitive-plural":"flotilașilor","singular-vocative":"flotilașule","plural-vocative":"flotilașilor"}},{"word":"flotor","pos":"noun","definitions":["float"],"forms":{"plural":"flotoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"flotor","accusative-definite-nominative-singular":"flotorul","accusative-indefinite-nominative-plural":"flotoare","accusative-definite-nominative-plural":"flotoarele","dative-genitive-indefinite-singular":"flotor","dative-definite-genitive-singular":"flotorului","dative-genitive-indefinite-plural":"flotoare","dative-definite-genitive-plural":"flotoarelor","singular-vocative":"flotorule","plural-vocative":"flotoarelor"}},{"word":"flox","pos":"noun","definitions":["phlox"],"forms":{"plural":"flocși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flox","accusative-definite-nominative-singular":"floxul","accusative-indefinite-nominative-plural":"flocși","accusative-definite-nominative-plural":"flocșii","dative-genitive-indefinite-singular":"flox","dative-definite-genitive-singular":"floxului","dative-genitive-indefinite-plural":"flocși","dative-definite-genitive-plural":"flocșilor","singular-vocative":"floxule","plural-vocative":"flocșilor"}},{"word":"fluat","pos":"noun","definitions":["fluate"],"forms":{"plural":"fluați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluat","accusative-definite-nominative-singular":"fluatul","accusative-indefinite-nominative-plural":"fluați","accusative-definite-nominative-plural":"fluații","dative-genitive-indefinite-singular":"fluat","dative-definite-genitive-singular":"fluatului","dative-genitive-indefinite-plural":"fluați","dative-definite-genitive-plural":"fluaților","singular-vocative":"fluatule","plural-vocative":"fluaților"}},{"word":"fluctua","pos":"verb","definitions":["to fluctuate"],"forms":{"canonical":"a fluctua 1st conjugation","present-singular-third-person":"fluctuează","participle-past":"fluctuat","subjunctive-third-person":"fluctueze","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fluctua","gerund":"fluctuând","first-person-indicative-present-singular":"fluctuez","indicative-present-second-person-singular":"fluctuezi","indicative-present-singular-third-person":"fluctuează","first-person-indicative-plural-present":"fluctuăm","indicative-plural-present-second-person":"fluctuați","indicative-plural-present-third-person":"fluctuează","first-person-imperfect-indicative-singular":"fluctuam","imperfect-indicative-second-person-singular":"fluctuai","imperfect-indicative-singular-third-person":"fluctua","first-person-imperfect-indicative-plural":"fluctuam","imperfect-indicative-plural-second-person":"fluctuați","imperfect-indicative-plural-third-person":"fluctuau","first-person-indicative-perfect-singular":"fluctuai","indicative-perfect-second-person-singular":"fluctuași","indicative-perfect-singular-third-person":"fluctuă","first-person-indicative-perfect-plural":"fluctuarăm","indicative-perfect-plural-second-person":"fluctuarăți","indicative-perfect-plural-third-person":"fluctuară","first-person-indicative-pluperfect-singular":"fluctuasem","indicative-pluperfect-second-person-singular":"fluctuaseși","indicative-pluperfect-singular-third-person":"fluctuase","first-person-indicative-pluperfect-plural":"fluctuaserăm","indicative-pluperfect-plural-second-person":"fluctuaserăți","indicative-pluperfect-plural-third-person":"fluctuaseră","first-person-present-singular-subjunctive":"să fluctuez","present-second-person-singular-subjunctive":"să fluctuezi","present-singular-subjunctive-third-person":"să fluctueze","first-person-plural-present-subjunctive":"să fluctuăm","plural-present-second-person-subjunctive":"să fluctuați","plural-present-subjunctive-third-person":"să fluctueze","imperative-second-person-singular":"fluctuează","imperative-plural-second-person":"fluctuați","imperative-negative-second-person-singular":"nu fluctua","imperative-negative-plural-second-person":"nu fluctuați"}},{"word":"fluctuant","pos":"adj","definitions":["fluctuant"],"forms":{"feminine-singular":"fluctuantă","masculine-plural":"fluctuanți","feminine-neuter-plural":"fluctuante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluctuant","error-unrecognized-form-feminine-indefinite-singular":"fluctuantă","error-unrecognized-form-indefinite-masculine-plural":"fluctuanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluctuante","definite-error-unrecognized-form-masculine-neuter-singular":"fluctuantul","definite-error-unrecognized-form-feminine-singular":"fluctuanta","definite-error-unrecognized-form-masculine-plural":"fluctuanții","definite-error-unrecognized-form-feminine-neuter-plural":"fluctuantele"}},{"word":"fluctuare","pos":"noun","definitions":["fluctuation"],"forms":{"plural":"fluctuări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluctuare","accusative-definite-nominative-singular":"fluctuarea","accusative-indefinite-nominative-plural":"fluctuări","accusative-definite-nominative-plural":"fluctuările","dative-genitive-indefinite-singular":"fluctuări","dative-definite-genitive-singular":"fluctuării","dative-genitive-indefinite-plural":"fluctuări","dative-definite-genitive-plural":"fluctuărilor","singular-vocative":"fluctuare","plural-vocative":"fluctuărilor"}},{"word":"fluctuație","pos":"noun","definitions":["fluctuation"],"forms":{"plural":"fluctuații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fluctuație","accusative-definite-nominative-singular":"fluctuația","accusative-indefinite-nominative-plural":"fluctuații","accusative-definite-nominative-plural":"fluctuațiile","dative-genitive-indefinite-singular":"fluctuații","dative-definite-genitive-singular":"fluctuației","dative-genitive-indefinite-plural":"fluctuații","dative-definite-genitive-plural":"fluctuațiilor","singular-vocative":"fluctuație","plural-vocative":"fluctuațiilor"}},{"word":"fluctuațiune","pos":"noun","definitions":["obsolete form of fluctuație"],"forms":{"plural":"fluctuațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluctuațiune","accusative-definite-nominative-singular":"fluctuațiunea","accusative-indefinite-nominative-plural":"fluctuațiuni","accusative-definite-nominative-plural":"fluctuațiunile","dative-genitive-indefinite-singular":"fluctuațiuni","dative-definite-genitive-singular":"fluctuațiunii","dative-genitive-indefinite-plural":"fluctuațiuni","dative-definite-genitive-plural":"fluctuațiunilor","singular-vocative":"fluctuațiune","plural-vocative":"fluctuațiunilor"}},{"word":"fludor","pos":"noun","definitions":["solder"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fludor","accusative-definite-nominative":"fludorul","dative-genitive-indefinite":"fludor","dative-definite-genitive":"fludorului","vocative":"fludorule"}},{"word":"fluent","pos":"adj","definitions":["fluent"],"forms":{"feminine-singular":"fluentă","masculine-plural":"fluenți","feminine-neuter-plural":"fluente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluent","error-unrecognized-form-feminine-indefinite-singular":"fluentă","error-unrecognized-form-indefinite-masculine-plural":"fluenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluente","definite-error-unrecognized-form-masculine-neuter-singular":"fluentul","definite-error-unrecognized-form-feminine-singular":"fluenta","definite-error-unrecognized-form-masculine-plural":"fluenții","definite-error-unrecognized-form-feminine-neuter-plural":"fluentele"}},{"word":"fluență","pos":"noun","definitions":["fluency"],"forms":{"plural":"fluențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluență","accusative-definite-nominative-singular":"fluența","accusative-indefinite-nominative-plural":"fluențe","accusative-definite-nominative-plural":"fluențele","dative-genitive-indefinite-singular":"fluențe","dative-definite-genitive-singular":"fluenței","dative-genitive-indefinite-plural":"fluențe","dative-definite-genitive-plural":"fluențelor","singular-vocative":"fluență","plural-vocative":"fluențelor"}},{"word":"Flueraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flueraș"}},{"word":"fluid","pos":"adj","definitions":["fluid"],"forms":{"feminine-singular":"fluidă","masculine-plural":"fluizi","feminine-neuter-plural":"fluide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluid","error-unrecognized-form-feminine-indefinite-singular":"fluidă","error-unrecognized-form-indefinite-masculine-plural":"fluizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluide","definite-error-unrecognized-form-masculine-neuter-singular":"fluidul","definite-error-unrecognized-form-feminine-singular":"fluida","definite-error-unrecognized-form-masculine-plural":"fluizii","definite-error-unrecognized-form-feminine-neuter-plural":"fluidele"}},{"word":"fluid de frână","pos":"noun","definitions":["brake fluid"],"forms":{"plural":"fluide de frână"}},{"word":"fluidal","pos":"adj","definitions":["fluidal"],"forms":{"feminine-singular":"fluidală","masculine-plural":"fluidali","feminine-neuter-plural":"fluidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluidal","error-unrecognized-form-feminine-indefinite-singular":"fluidală","error-unrecognized-form-indefinite-masculine-plural":"fluidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluidale","definite-error-unrecognized-form-masculine-neuter-singular":"fluidalul","definite-error-unrecognized-form-feminine-singular":"fluidala","definite-error-unrecognized-form-masculine-plural":"fluidalii","definite-error-unrecognized-form-feminine-neuter-plural":"fluidalele"}},{"word":"fluidic","pos":"adj","definitions":["fluidic"],"forms":{"feminine-singular":"fluidică","masculine-plural":"fluidici","feminine-neuter-plural":"fluidice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluidic","error-unrecognized-form-feminine-indefinite-singular":"fluidică","error-unrecognized-form-indefinite-masculine-plural":"fluidici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluidice","definite-error-unrecognized-form-masculine-neuter-singular":"fluidicul","definite-error-unrecognized-form-feminine-singular":"fluidica","definite-error-unrecognized-form-masculine-plural":"fluidicii","definite-error-unrecognized-form-feminine-neuter-plural":"fluidicele"}},{"word":"fluidifica","pos":"verb","definitions":["to fluidize"],"forms":{"canonical":"a fluidifica 1st conjugation","present-singular-third-person":"fluidifică","participle-past":"fluidificat","subjunctive-third-person":"fluidifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fluidifica","gerund":"fluidificând","first-person-indicative-present-singular":"fluidific","indicative-present-second-person-singular":"fluidifici","indicative-present-singular-third-person":"fluidifică","first-person-indicative-plural-present":"fluidificăm","indicative-plural-present-second-person":"fluidificați","indicative-plural-present-third-person":"fluidifică","first-person-imperfect-indicative-singular":"fluidificam","imperfect-indicative-second-person-singular":"fluidificai","imperfect-indicative-singular-third-person":"fluidifica","first-person-imperfect-indicative-plural":"fluidificam","imperfect-indicative-plural-second-person":"fluidificați","imperfect-indicative-plural-third-person":"fluidificau","first-person-indicative-perfect-singular":"fluidificai","indicative-perfect-second-person-singular":"fluidificași","indicative-perfect-singular-third-person":"fluidifică","first-person-indicative-perfect-plural":"fluidificarăm","indicative-perfect-plural-second-person":"fluidificarăți","indicative-perfect-plural-third-person":"fluidificară","first-person-indicative-pluperfect-singular":"fluidificasem","indicative-pluperfect-second-person-singular":"fluidificaseși","indicative-pluperfect-singular-third-person":"fluidificase","first-person-indicative-pluperfect-plural":"fluidificaserăm","indicative-pluperfect-plural-second-person":"fluidificaserăți","indicative-pluperfect-plural-third-person":"fluidificaseră","first-person-present-singular-subjunctive":"să fluidific","present-second-person-singular-subjunctive":"să fluidifici","present-singular-subjunctive-third-person":"să fluidifice","first-person-plural-present-subjunctive":"să fluidificăm","plural-present-second-person-subjunctive":"să fluidificați","plural-present-subjunctive-third-person":"să fluidifice","imperative-second-person-singular":"fluidifică","imperative-plural-second-person":"fluidificați","imperative-negative-second-person-singular":"nu fluidifica","imperative-negative-plural-second-person":"nu fluidificați"}},{"word":"fluidificare","pos":"noun","definitions":["fluidization"],"forms":{"plural":"fluidificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluidificare","accusative-definite-nominative-singular":"fluidificarea","accusative-indefinite-nominative-plural":"fluidificări","accusative-definite-nominative-plural":"fluidificările","dative-genitive-indefinite-singular":"fluidificări","dative-definite-genitive-singular":"fluidificării","dative-genitive-indefinite-plural":"fluidificări","dative-definite-genitive-plural":"fluidificărilor","singular-vocative":"fluidificare","plural-vocative":"fluidificărilor"}},{"word":"fluiditate","pos":"noun","definitions":["fluidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fluiditate","accusative-definite-nominative":"fluiditatea","dative-genitive-indefinite":"fluidități","dative-definite-genitive":"fluidității","vocative":"fluiditate"}},{"word":"fluidiza","pos":"verb","definitions":["to fluidize"],"forms":{"canonical":"a fluidiza 1st conjugation","present-singular-third-person":"fluidizează","participle-past":"fluidizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fluidiza","gerund":"fluidizând","first-person-indicative-present-singular":"fluidizez","indicative-present-second-person-singular":"fluidizezi","indicative-present-singular-third-person":"fluidizează","first-person-indicative-plural-present":"fluidizăm","indicative-plural-present-second-person":"fluidizați","indicative-plural-present-third-person":"fluidizează","first-person-imperfect-indicative-singular":"fluidizam","imperfect-indicative-second-person-singular":"fluidizai","imperfect-indicative-singular-third-person":"fluidiza","first-person-imperfect-indicative-plural":"fluidizam","imperfect-indicative-plural-second-person":"fluidizați","imperfect-indicative-plural-third-person":"fluidizau","first-person-indicative-perfect-singular":"fluidizai","indicative-perfect-second-person-singular":"fluidizași","indicative-perfect-singular-third-person":"fluidiză","first-person-indicative-perfect-plural":"fluidizarăm","indicative-perfect-plural-second-person":"fluidizarăți","indicative-perfect-plural-third-person":"fluidizară","first-person-indicative-pluperfect-singular":"fluidizasem","indicative-pluperfect-second-person-singular":"fluidizaseși","indicative-pluperfect-singular-third-person":"fluidizase","first-person-indicative-pluperfect-plural":"fluidizaserăm","indicative-pluperfect-plural-second-person":"fluidizaserăți","indicative-pluperfect-plural-third-person":"fluidizaseră","first-person-present-singular-subjunctive":"să fluidizez","present-second-person-singular-subjunctive":"să fluidizezi","present-singular-subjunctive-third-person":"să fluidizeze","first-person-plural-present-subjunctive":"să fluidizăm","plural-present-second-person-subjunctive":"să fluidizați","plural-present-subjunctive-third-person":"să fluidizeze","imperative-second-person-singular":"fluidizează","imperative-plural-second-person":"fluidizați","imperative-negative-second-person-singular":"nu fluidiza","imperative-negative-plural-second-person":"nu fluidizați"}},{"word":"fluidizant","pos":"noun","definitions":["fluidizing"],"forms":{"plural":"fluidizanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluidizant","accusative-definite-nominative-singular":"fluidizantul","accusative-indefinite-nominative-plural":"fluidizanți","accusative-definite-nominative-plural":"fluidizanții","dative-genitive-indefinite-singular":"fluidizant","dative-definite-genitive-singular":"fluidizantului","dative-genitive-indefinite-plural":"fluidizanți","dative-definite-genitive-plural":"fluidizanților","singular-vocative":"fluidizantule","plural-vocative":"fluidizanților"}},{"word":"fluidizare","pos":"noun","definitions":["fluidization"],"forms":{"plural":"fluidizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluidizare","accusative-definite-nominative-singular":"fluidizarea","accusative-indefinite-nominative-plural":"fluidizări","accusative-definite-nominative-plural":"fluidizările","dative-genitive-indefinite-singular":"fluidizări","dative-definite-genitive-singular":"fluidizării","dative-genitive-indefinite-plural":"fluidizări","dative-definite-genitive-plural":"fluidizărilor","singular-vocative":"fluidizare","plural-vocative":"fluidizărilor"}},{"word":"fluidizat","pos":"adj","definitions":["fluidized"],"forms":{"feminine-singular":"fluidizată","masculine-plural":"fluidizați","feminine-neuter-plural":"fluidizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluidizat","error-unrecognized-form-feminine-indefinite-singular":"fluidizată","error-unrecognized-form-indefinite-masculine-plural":"fluidizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluidizate","definite-error-unrecognized-form-masculine-neuter-singular":"fluidizatul","definite-error-unrecognized-form-feminine-singular":"fluidizata","definite-error-unrecognized-form-masculine-plural":"fluidizații","definite-error-unrecognized-form-feminine-neuter-plural":"fluidizatele"}},{"word":"fluidizor","pos":"noun","definitions":["fluidizer"],"forms":{"plural":"fluidizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluidizor","accusative-definite-nominative-singular":"fluidizorul","accusative-indefinite-nominative-plural":"fluidizoare","accusative-definite-nominative-plural":"fluidizoarele","dative-genitive-indefinite-singular":"fluidizor","dative-definite-genitive-singular":"fluidizorului","dative-genitive-indefinite-plural":"fluidizoare","dative-definite-genitive-plural":"fluidizoarelor","singular-vocative":"fluidizorule","plural-vocative":"fluidizoarelor"}},{"word":"fluier","pos":"noun","definitions":["whistle; pipe (a sort of flute)","tibia, shinbone"],"forms":{"plural":"fluiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluier","accusative-definite-nominative-singular":"fluierul","accusative-indefinite-nominative-plural":"fluiere","accusative-definite-nominative-plural":"fluierele","dative-genitive-indefinite-singular":"fluier","dative-definite-genitive-singular":"fluierului","dative-genitive-indefinite-plural":"fluiere","dative-definite-genitive-plural":"fluierelor","singular-vocative":"fluierule","plural-vocative":"fluierelor"}},{"word":"fluiera","pos":"verb","definitions":["to whistle"],"pronunciation":"/flu.jeˈra/","forms":{"canonical":"a fluiera 1st conjugation","present-singular-third-person":"fluieră","participle-past":"fluierat","subjunctive-third-person":"fluiere","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fluiera","gerund":"fluierând","first-person-indicative-present-singular":"fluier","indicative-present-second-person-singular":"fluieri","indicative-present-singular-third-person":"fluieră","first-person-indicative-plural-present":"fluierăm","indicative-plural-present-second-person":"fluierați","indicative-plural-present-third-person":"fluieră","first-person-imperfect-indicative-singular":"fluieram","imperfect-indicative-second-person-singular":"fluierai","imperfect-indicative-singular-third-person":"fluiera","first-person-imperfect-indicative-plural":"fluieram","imperfect-indicative-plural-second-person":"fluierați","imperfect-indicative-plural-third-person":"fluierau","first-person-indicative-perfect-singular":"fluierai","indicative-perfect-second-person-singular":"fluierași","indicative-perfect-singular-third-person":"fluieră","first-person-indicative-perfect-plural":"fluierarăm","indicative-perfect-plural-second-person":"fluierarăți","indicative-perfect-plural-third-person":"fluierară","first-person-indicative-pluperfect-singular":"fluierasem","indicative-pluperfect-second-person-singular":"fluieraseși","indicative-pluperfect-singular-third-person":"fluierase","first-person-indicative-pluperfect-plural":"fluieraserăm","indicative-pluperfect-plural-second-person":"fluieraserăți","indicative-pluperfect-plural-third-person":"fluieraseră","first-person-present-singular-subjunctive":"să fluier","present-second-person-singular-subjunctive":"să fluieri","present-singular-subjunctive-third-person":"să fluiere","first-person-plural-present-subjunctive":"să fluierăm","plural-present-second-person-subjunctive":"să fluierați","plural-present-subjunctive-third-person":"să fluiere","imperative-second-person-singular":"fluieră","imperative-plural-second-person":"fluierați","imperative-negative-second-person-singular":"nu fluiera","imperative-negative-plural-second-person":"nu fluierați"}},{"word":"fluieră","pos":"noun","definitions":["obsolete form of fluier"],"forms":{"plural":"fluiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluieră","accusative-definite-nominative-singular":"fluiera","accusative-indefinite-nominative-plural":"fluiere","accusative-definite-nominative-plural":"fluierele","dative-genitive-indefinite-singular":"fluiere","dative-definite-genitive-singular":"fluierei","dative-genitive-indefinite-plural":"fluiere","dative-definite-genitive-plural":"fluierelor","singular-vocative":"fluieră","plural-vocative":"fluierelor"}},{"word":"fluiera în biserică","pos":"verb","definitions":["to flout; to disrespect rules; to do something shocking"],"forms":{"canonical":"a fluiera în biserică 1st conjugation","present-singular-third-person":"fluieră în biserică","participle-past":"fluierat în biserică"}},{"word":"fluierar","pos":"noun","definitions":["whistler","piper","sandpiper"],"forms":{"plural":"fluierari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluierar","accusative-definite-nominative-singular":"fluierarul","accusative-indefinite-nominative-plural":"fluierari","accusative-definite-nominative-plural":"fluierarii","dative-genitive-indefinite-singular":"fluierar","dative-definite-genitive-singular":"fluierarului","dative-genitive-indefinite-plural":"fluierari","dative-definite-genitive-plural":"fluierarilor","singular-vocative":"fluierarule","plural-vocative":"fluierarilor"}},{"word":"fluierar cu picioare roșii","pos":"noun","definitions":["redshank (Tringa totanus)"],"forms":{"plural":"fluierari cu picioare roșii"}},{"word":"fluierar cu picioare verzi","pos":"noun","definitions":["common greenshank (Tringa nebularia)"],"forms":{"plural":"fluierari cu picioare verzi"}},{"word":"fluierar cu piept gălbui","pos":"noun","definitions":["buff-breasted sandpiper (Calidris subruficollis)"],"forms":{"plural":"fluierari cu piept gălbui"}},{"word":"fluierar de lac","pos":"noun","definitions":["marsh sandpiper (Tringa stagnatilis)"],"forms":{"plural":"fluierari de lac"}},{"word":"fluierar de mlaștină","pos":"noun","definitions":["wood sandpiper (Tringa glareola)"],"forms":{"plural":"fluierari de mlaștină"}},{"word":"fluierar de munte","pos":"noun","definitions":["common sandpiper (Actitis hypoleucos)"],"forms":{"plural":"fluierari de munte"}},{"word":"fluierar de zăvoi","pos":"noun","definitions":["green sandpiper (Tringa ochropus)"],"forms":{"plural":"fluierari de zăvoi"}},{"word":"fluierar negru","pos":"noun","definitions":["spotted redshank (Tringa erythropus)"],"forms":{"plural":"fluierari negri"}},{"word":"fluierar sur","pos":"noun","definitions":["Terek sandpiper (Xenus cinereus)"],"forms":{"plural":"fluierari suri"}},{"word":"fluierare","pos":"noun","definitions":["whistle"],"forms":{"plural":"fluierări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluierare","accusative-definite-nominative-singular":"fluierarea","accusative-indefinite-nominative-plural":"fluierări","accusative-definite-nominative-plural":"fluierările","dative-genitive-indefinite-singular":"fluierări","dative-definite-genitive-singular":"fluierării","dative-genitive-indefinite-plural":"fluierări","dative-definite-genitive-plural":"fluierărilor","singular-vocative":"fluierare","plural-vocative":"fluierărilor"}},{"word":"Fluieraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fluieraș"}},{"word":"fluieraș","pos":"noun","definitions":["diminutive of fluier; small whistle","synonym of fluierar; flautist, whistler, piper"],"forms":{"plural":"fluierașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluieraș","accusative-definite-nominative-singular":"fluierașul","accusative-indefinite-nominative-plural":"fluierașe","accusative-definite-nominative-plural":"fluierașele","dative-genitive-indefinite-singular":"fluieraș","dative-definite-genitive-singular":"fluierașului","dative-genitive-indefinite-plural":"fluierașe","dative-definite-genitive-plural":"fluierașelor","singular-vocative":"fluierașule","plural-vocative":"fluierașelor"}},{"word":"fluierat","pos":"noun","definitions":["whistle"],"forms":{"plural":"fluierături","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fluierat","accusative-definite-nominative-singular":"fluieratul","accusative-indefinite-nominative-plural":"fluieraturi","accusative-definite-nominative-plural":"fluieraturile","dative-genitive-indefinite-singular":"fluierat","dative-definite-genitive-singular":"fluieratului","dative-genitive-indefinite-plural":"fluieraturi","dative-definite-genitive-plural":"fluieraturilor","singular-vocative":"fluieratule","plural-vocative":"fluieraturilor"}},{"word":"fluierător","pos":"adj","definitions":["whistling"],"forms":{"feminine-singular":"fluierătoare","masculine-plural":"fluierători","feminine-neuter-plural":"fluierătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluierător","error-unrecognized-form-feminine-indefinite-singular":"fluierătoare","error-unrecognized-form-indefinite-masculine-plural":"fluierători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluierătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fluierătorul","definite-error-unrecognized-form-feminine-singular":"fluierătoara","definite-error-unrecognized-form-masculine-plural":"fluierătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fluierătoarele"}},{"word":"fluierătură","pos":"noun","definitions":["whistle"],"forms":{"plural":"fluierături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fluierătură","accusative-definite-nominative-singular":"fluierătura","accusative-indefinite-nominative-plural":"fluierături","accusative-definite-nominative-plural":"fluierăturile","dative-genitive-indefinite-singular":"fluierături","dative-definite-genitive-singular":"fluierăturii","dative-genitive-indefinite-plural":"fluierături","dative-definite-genitive-plural":"fluierăturilor","singular-vocative":"fluierătură","plural-vocative":"fluierăturilor"}},{"word":"fluierice","pos":"noun","definitions":["diminutive of fluier"],"forms":{"plural":"fluierici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluierice","accusative-definite-nominative-singular":"fluiericea","accusative-indefinite-nominative-plural":"fluierici","accusative-definite-nominative-plural":"fluiericile","dative-genitive-indefinite-singular":"fluierici","dative-definite-genitive-singular":"fluiericii","dative-genitive-indefinite-plural":"fluierici","dative-definite-genitive-plural":"fluiericilor","singular-vocative":"fluierice","plural-vocative":"fluiericilor"}},{"word":"fluieriță","pos":"noun","definitions":["diminutive of fluier"],"forms":{"plural":"fluierițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluieriță","accusative-definite-nominative-singular":"fluierița","accusative-indefinite-nominative-plural":"fluierițe","accusative-definite-nominative-plural":"fluierițele","dative-genitive-indefinite-singular":"fluierițe","dative-definite-genitive-singular":"fluieriței","dative-genitive-indefinite-plural":"fluierițe","dative-definite-genitive-plural":"fluierițelor","singular-vocative":"fluieriță","plural-vocative":"fluierițelor"}},{"word":"fluieroi","pos":"noun","definitions":["augmentative of fluier"],"forms":{"plural":"fluieroaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluieroi","accusative-definite-nominative-singular":"fluieroiul","accusative-indefinite-nominative-plural":"fluieroaie","accusative-definite-nominative-plural":"fluieroaiele","dative-genitive-indefinite-singular":"fluieroi","dative-definite-genitive-singular":"fluieroiului","dative-genitive-indefinite-plural":"fluieroaie","dative-definite-genitive-plural":"fluieroaielor","singular-vocative":"fluieroiule","plural-vocative":"fluieroaielor"}},{"word":"fluieros","pos":"adj","definitions":["gossiping"],"forms":{"feminine-singular":"fluieroasă","masculine-plural":"fluieroși","feminine-neuter-plural":"fluieroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluieros","error-unrecognized-form-feminine-indefinite-singular":"fluieroasă","error-unrecognized-form-indefinite-masculine-plural":"fluieroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluieroase","definite-error-unrecognized-form-masculine-neuter-singular":"fluierosul","definite-error-unrecognized-form-feminine-singular":"fluieroasa","definite-error-unrecognized-form-masculine-plural":"fluieroșii","definite-error-unrecognized-form-feminine-neuter-plural":"fluieroasele"}},{"word":"fluometru","pos":"noun","definitions":["flowmeter"],"forms":{"plural":"fluometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluometru","accusative-definite-nominative-singular":"fluometruul","accusative-indefinite-nominative-plural":"fluometre","accusative-definite-nominative-plural":"fluometrele","dative-genitive-indefinite-singular":"fluometru","dative-definite-genitive-singular":"fluometruului","dative-genitive-indefinite-plural":"fluometre","dative-definite-genitive-plural":"fluometrelor","singular-vocative":"fluometruule","plural-vocative":"fluometrelor"}},{"word":"fluor","pos":"noun","definitions":["fluorine (chemical element)"],"pronunciation":"/fluˈor/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fluor","accusative-definite-nominative":"fluorul","dative-genitive-indefinite":"fluor","dative-definite-genitive":"fluorului","vocative":"fluorule"}},{"word":"fluoresceină","pos":"noun","definitions":["fluorescein"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluoresceină","accusative-definite-nominative-singular":"fluoresceina","accusative-indefinite-nominative-plural":"fluoresceine","accusative-definite-nominative-plural":"fluoresceinele","dative-genitive-indefinite-singular":"fluoresceine","dative-definite-genitive-singular":"fluoresceinei","dative-genitive-indefinite-plural":"fluoresceine","dative-definite-genitive-plural":"fluoresceinelor","singular-vocative":"fluoresceină","plural-vocative":"fluoresceinelor"}},{"word":"fluorescent","pos":"adj","definitions":["fluorescent"],"forms":{"feminine-singular":"fluorescentă","masculine-plural":"fluorescenți","feminine-neuter-plural":"fluorescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluorescent","error-unrecognized-form-feminine-indefinite-singular":"fluorescentă","error-unrecognized-form-indefinite-masculine-plural":"fluorescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluorescente","definite-error-unrecognized-form-masculine-neuter-singular":"fluorescentul","definite-error-unrecognized-form-feminine-singular":"fluorescenta","definite-error-unrecognized-form-masculine-plural":"fluorescenții","definite-error-unrecognized-form-feminine-neuter-plural":"fluorescentele"}},{"word":"fluorescență","pos":"noun","definitions":["fluorescence"],"forms":{"plural":"fluorescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluorescență","accusative-definite-nominative-singular":"fluorescența","accusative-indefinite-nominative-plural":"fluorescențe","accusative-definite-nominative-plural":"fluorescențele","dative-genitive-indefinite-singular":"fluorescențe","dative-definite-genitive-singular":"fluorescenței","dative-genitive-indefinite-plural":"fluorescențe","dative-definite-genitive-plural":"fluorescențelor","singular-vocative":"fluorescență","plural-vocative":"fluorescențelor"}},{"word":"fluorhidric","pos":"adj","definitions":["hydrofluoric"],"forms":{"feminine-singular":"fluorhidrică","masculine-plural":"fluorhidrici","feminine-neuter-plural":"fluorhidrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluorhidric","error-unrecognized-form-feminine-indefinite-singular":"fluorhidrică","error-unrecognized-form-indefinite-masculine-plural":"fluorhidrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluorhidrice","definite-error-unrecognized-form-masculine-neuter-singular":"fluorhidricul","definite-error-unrecognized-form-feminine-singular":"fluorhidrica","definite-error-unrecognized-form-masculine-plural":"fluorhidricii","definite-error-unrecognized-form-feminine-neuter-plural":"fluorhidricele"}},{"word":"fluorimetru","pos":"noun","definitions":["fluorimeter"],"forms":{"plural":"fluorimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluorimetru","accusative-definite-nominative-singular":"fluorimetrul","accusative-indefinite-nominative-plural":"fluorimetre","accusative-definite-nominative-plural":"fluorimetrele","dative-genitive-indefinite-singular":"fluorimetru","dative-definite-genitive-singular":"fluorimetrului","dative-genitive-indefinite-plural":"fluorimetre","dative-definite-genitive-plural":"fluorimetrelor","singular-vocative":"fluorimetrule","plural-vocative":"fluorimetrelor"}},{"word":"fluorină","pos":"noun","definitions":["fluorspar"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fluorină","accusative-definite-nominative":"fluorina","dative-genitive-indefinite":"fluorine","dative-definite-genitive":"fluorinei","vocative":"fluorină"}},{"word":"fluoriza","pos":"verb","definitions":["to fluorize"],"forms":{"canonical":"a fluoriza 1st conjugation","present-singular-third-person":"fluorizează","participle-past":"fluorizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fluoriza","gerund":"fluorizând","first-person-indicative-present-singular":"fluorizez","indicative-present-second-person-singular":"fluorizezi","indicative-present-singular-third-person":"fluorizează","first-person-indicative-plural-present":"fluorizăm","indicative-plural-present-second-person":"fluorizați","indicative-plural-present-third-person":"fluorizează","first-person-imperfect-indicative-singular":"fluorizam","imperfect-indicative-second-person-singular":"fluorizai","imperfect-indicative-singular-third-person":"fluoriza","first-person-imperfect-indicative-plural":"fluorizam","imperfect-indicative-plural-second-person":"fluorizați","imperfect-indicative-plural-third-person":"fluorizau","first-person-indicative-perfect-singular":"fluorizai","indicative-perfect-second-person-singular":"fluorizași","indicative-perfect-singular-third-person":"fluoriză","first-person-indicative-perfect-plural":"fluorizarăm","indicative-perfect-plural-second-person":"fluorizarăți","indicative-perfect-plural-third-person":"fluorizară","first-person-indicative-pluperfect-singular":"fluorizasem","indicative-pluperfect-second-person-singular":"fluorizaseși","indicative-pluperfect-singular-third-person":"fluorizase","first-person-indicative-pluperfect-plural":"fluorizaserăm","indicative-pluperfect-plural-second-person":"fluorizaserăți","indicative-pluperfect-plural-third-person":"fluorizaseră","first-person-present-singular-subjunctive":"să fluorizez","present-second-person-singular-subjunctive":"să fluorizezi","present-singular-subjunctive-third-person":"să fluorizeze","first-person-plural-present-subjunctive":"să fluorizăm","plural-present-second-person-subjunctive":"să fluorizați","plural-present-subjunctive-third-person":"să fluorizeze","imperative-second-person-singular":"fluorizează","imperative-plural-second-person":"fluorizați","imperative-negative-second-person-singular":"nu fluoriza","imperative-negative-plural-second-person":"nu fluorizați"}},{"word":"fluorizare","pos":"noun","definitions":["fluoridation"],"forms":{"plural":"fluorizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluorizare","accusative-definite-nominative-singular":"fluorizarea","accusative-indefinite-nominative-plural":"fluorizări","accusative-definite-nominative-plural":"fluorizările","dative-genitive-indefinite-singular":"fluorizări","dative-definite-genitive-singular":"fluorizării","dative-genitive-indefinite-plural":"fluorizări","dative-definite-genitive-plural":"fluorizărilor","singular-vocative":"fluorizare","plural-vocative":"fluorizărilor"}},{"word":"fluorografie","pos":"noun","definitions":["fluorography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fluorografie","accusative-definite-nominative-singular":"fluorografia","accusative-indefinite-nominative-plural":"fluorografii","accusative-definite-nominative-plural":"fluorografiile","dative-genitive-indefinite-singular":"fluorografii","dative-definite-genitive-singular":"fluorografiei","dative-genitive-indefinite-plural":"fluorografii","dative-definite-genitive-plural":"fluorografiilor","singular-vocative":"fluorografie","plural-vocative":"fluorografiilor"}},{"word":"fluorometric","pos":"adj","definitions":["fluorometric"],"forms":{"feminine-singular":"fluorometrică","masculine-plural":"fluorometrici","feminine-neuter-plural":"fluorometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluorometric","error-unrecognized-form-feminine-indefinite-singular":"fluorometrică","error-unrecognized-form-indefinite-masculine-plural":"fluorometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluorometrice","definite-error-unrecognized-form-masculine-neuter-singular":"fluorometricul","definite-error-unrecognized-form-feminine-singular":"fluorometrica","definite-error-unrecognized-form-masculine-plural":"fluorometricii","definite-error-unrecognized-form-feminine-neuter-plural":"fluorometricele"}},{"word":"fluorometrie","pos":"noun","definitions":["fluorometry"],"forms":{"plural":"fluorometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fluorometrie","accusative-definite-nominative-singular":"fluorometria","accusative-indefinite-nominative-plural":"fluorometrii","accusative-definite-nominative-plural":"fluorometriile","dative-genitive-indefinite-singular":"fluorometrii","dative-definite-genitive-singular":"fluorometriei","dative-genitive-indefinite-plural":"fluorometrii","dative-definite-genitive-plural":"fluorometriilor","singular-vocative":"fluorometrie","plural-vocative":"fluorometriilor"}},{"word":"fluorometru","pos":"noun","definitions":["fluorometer"],"forms":{"plural":"fluorometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluorometru","accusative-definite-nominative-singular":"fluorometruul","accusative-indefinite-nominative-plural":"fluorometre","accusative-definite-nominative-plural":"fluorometrele","dative-genitive-indefinite-singular":"fluorometru","dative-definite-genitive-singular":"fluorometruului","dative-genitive-indefinite-plural":"fluorometre","dative-definite-genitive-plural":"fluorometrelor","singular-vocative":"fluorometruule","plural-vocative":"fluorometrelor"}},{"word":"fluoroscop","pos":"noun","definitions":["fluoroscope"],"forms":{"plural":"fluoroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluoroscop","accusative-definite-nominative-singular":"fluoroscopul","accusative-indefinite-nominative-plural":"fluoroscoape","accusative-definite-nominative-plural":"fluoroscoapele","dative-genitive-indefinite-singular":"fluoroscop","dative-definite-genitive-singular":"fluoroscopului","dative-genitive-indefinite-plural":"fluoroscoape","dative-definite-genitive-plural":"fluoroscoapelor","singular-vocative":"fluoroscopule","plural-vocative":"fluoroscoapelor"}},{"word":"fluoroscopie","pos":"noun","definitions":["fluoroscopy"],"forms":{"plural":"fluoroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fluoroscopie","accusative-definite-nominative-singular":"fluoroscopia","accusative-indefinite-nominative-plural":"fluoroscopii","accusative-definite-nominative-plural":"fluoroscopiile","dative-genitive-indefinite-singular":"fluoroscopii","dative-definite-genitive-singular":"fluoroscopiei","dative-genitive-indefinite-plural":"fluoroscopii","dative-definite-genitive-plural":"fluoroscopiilor","singular-vocative":"fluoroscopie","plural-vocative":"fluoroscopiilor"}},{"word":"fluoroză","pos":"noun","definitions":["fluorosis"],"forms":{"plural":"fluoroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluoroză","accusative-definite-nominative-singular":"fluoroza","accusative-indefinite-nominative-plural":"fluoroze","accusative-definite-nominative-plural":"fluorozele","dative-genitive-indefinite-singular":"fluoroze","dative-definite-genitive-singular":"fluorozei","dative-genitive-indefinite-plural":"fluoroze","dative-definite-genitive-plural":"fluorozelor","singular-vocative":"fluoroză","plural-vocative":"fluorozelor"}},{"word":"fluorură","pos":"noun","definitions":["fluoride"],"forms":{"plural":"fluoruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fluorură","accusative-definite-nominative-singular":"fluorura","accusative-indefinite-nominative-plural":"fluoruri","accusative-definite-nominative-plural":"fluorurile","dative-genitive-indefinite-singular":"fluoruri","dative-definite-genitive-singular":"fluorurii","dative-genitive-indefinite-plural":"fluoruri","dative-definite-genitive-plural":"fluorurilor","singular-vocative":"fluorură","plural-vocative":"fluorurilor"}},{"word":"fluorurat","pos":"adj","definitions":["fluorinated"],"forms":{"feminine-singular":"fluorurată","masculine-plural":"fluorurați","feminine-neuter-plural":"fluorurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluorurat","error-unrecognized-form-feminine-indefinite-singular":"fluorurată","error-unrecognized-form-indefinite-masculine-plural":"fluorurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluorurate","definite-error-unrecognized-form-masculine-neuter-singular":"fluoruratul","definite-error-unrecognized-form-feminine-singular":"fluorurata","definite-error-unrecognized-form-masculine-plural":"fluorurații","definite-error-unrecognized-form-feminine-neuter-plural":"fluoruratele"}},{"word":"fluștura","pos":"verb","definitions":["to flutter"],"forms":{"canonical":"a fluștura 1st conjugation","present-singular-third-person":"fluștură","participle-past":"flușturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fluștura","gerund":"flușturând","first-person-indicative-present-singular":"fluștur","indicative-present-second-person-singular":"flușturi","indicative-present-singular-third-person":"fluștură","first-person-indicative-plural-present":"flușturăm","indicative-plural-present-second-person":"flușturați","indicative-plural-present-third-person":"fluștură","first-person-imperfect-indicative-singular":"flușturam","imperfect-indicative-second-person-singular":"flușturai","imperfect-indicative-singular-third-person":"fluștura","first-person-imperfect-indicative-plural":"flușturam","imperfect-indicative-plural-second-person":"flușturați","imperfect-indicative-plural-third-person":"flușturau","first-person-indicative-perfect-singular":"flușturai","indicative-perfect-second-person-singular":"flușturași","indicative-perfect-singular-third-person":"fluștură","first-person-indicative-perfect-plural":"flușturarăm","indicative-perfect-plural-second-person":"flușturarăți","indicative-perfect-plural-third-person":"flușturară","first-person-indicative-pluperfect-singular":"flușturasem","indicative-pluperfect-second-person-singular":"flușturaseși","indicative-pluperfect-singular-third-person":"flușturase","first-person-indicative-pluperfect-plural":"flușturaserăm","indicative-pluperfect-plural-second-person":"flușturaserăți","indicative-pluperfect-plural-third-person":"flușturaseră","first-person-present-singular-subjunctive":"să fluștur","present-second-person-singular-subjunctive":"să flușturi","present-singular-subjunctive-third-person":"să flușture","first-person-plural-present-subjunctive":"să flușturăm","plural-present-second-person-subjunctive":"să flușturați","plural-present-subjunctive-third-person":"să flușture","imperative-second-person-singular":"fluștură","imperative-plural-second-person":"flușturați","imperative-negative-second-person-singular":"nu fluștura","imperative-negative-plural-second-person":"nu flușturați"}},{"word":"flușturatec","pos":"adj","definitions":["alternative form of flușturatic"],"forms":{"feminine-singular":"flușturatecă","masculine-plural":"flușturateci","feminine-neuter-plural":"flușturatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flușturatec","error-unrecognized-form-feminine-indefinite-singular":"flușturatecă","error-unrecognized-form-indefinite-masculine-plural":"flușturateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"flușturatece","definite-error-unrecognized-form-masculine-neuter-singular":"flușturatecul","definite-error-unrecognized-form-feminine-singular":"flușturateca","definite-error-unrecognized-form-masculine-plural":"flușturatecii","definite-error-unrecognized-form-feminine-neuter-plural":"flușturatecele"}},{"word":"flușturatic","pos":"adj","definitions":["fickle"],"forms":{"feminine-singular":"flușturatică","masculine-plural":"flușturatici","feminine-neuter-plural":"flușturatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"flușturatic","error-unrecognized-form-feminine-indefinite-singular":"flușturatică","error-unrecognized-form-indefinite-masculine-plural":"flușturatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"flușturatice","definite-error-unrecognized-form-masculine-neuter-singular":"flușturaticul","definite-error-unrecognized-form-feminine-singular":"flușturatica","definite-error-unrecognized-form-masculine-plural":"flușturaticii","definite-error-unrecognized-form-feminine-neuter-plural":"flușturaticele"}},{"word":"flușturatică","pos":"noun","definitions":["female equivalent of flușturatic"],"forms":{"plural":"flușturatice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"flușturatică","accusative-definite-nominative-singular":"flușturatica","accusative-indefinite-nominative-plural":"flușturatice","accusative-definite-nominative-plural":"flușturaticele","dative-genitive-indefinite-singular":"flușturatice","dative-definite-genitive-singular":"flușturaticei","dative-genitive-indefinite-plural":"flușturatice","dative-definite-genitive-plural":"flușturaticelor","singular-vocative":"flușturatică","plural-vocative":"flușturaticelor"}},{"word":"Flutur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Flutur"}},{"word":"flutur","pos":"verb","definitions":["first-person singular present indicative/subjunctive of flutura"],"pronunciation":"[ˈflutur]"},{"word":"flutur","pos":"noun","definitions":["alternative form of fluture"],"pronunciation":"[ˈflutur]","forms":{"plural":"fluturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"flutur","accusative-definite-nominative-singular":"fluturul","accusative-indefinite-nominative-plural":"fluturi","accusative-definite-nominative-plural":"fluturii","dative-genitive-indefinite-singular":"flutur","dative-definite-genitive-singular":"fluturului","dative-genitive-indefinite-plural":"fluturi","dative-definite-genitive-plural":"fluturilor","singular-vocative":"fluturule","plural-vocative":"fluturilor"}},{"word":"Flutura","pos":"name","definitions":["a village in Tîrșiței, Telenești Raion, Moldova"],"gender":"f"},{"word":"flutura","pos":"verb","definitions":["to flutter, float, flit"],"forms":{"canonical":"a flutura 1st conjugation","present-singular-third-person":"flutură","participle-past":"fluturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a flutura","gerund":"fluturând","first-person-indicative-present-singular":"flutur","indicative-present-second-person-singular":"fluturi","indicative-present-singular-third-person":"flutură","first-person-indicative-plural-present":"fluturăm","indicative-plural-present-second-person":"fluturați","indicative-plural-present-third-person":"flutură","first-person-imperfect-indicative-singular":"fluturam","imperfect-indicative-second-person-singular":"fluturai","imperfect-indicative-singular-third-person":"flutura","first-person-imperfect-indicative-plural":"fluturam","imperfect-indicative-plural-second-person":"fluturați","imperfect-indicative-plural-third-person":"fluturau","first-person-indicative-perfect-singular":"fluturai","indicative-perfect-second-person-singular":"fluturași","indicative-perfect-singular-third-person":"flutură","first-person-indicative-perfect-plural":"fluturarăm","indicative-perfect-plural-second-person":"fluturarăți","indicative-perfect-plural-third-person":"fluturară","first-person-indicative-pluperfect-singular":"fluturasem","indicative-pluperfect-second-person-singular":"fluturaseși","indicative-pluperfect-singular-third-person":"fluturase","first-person-indicative-pluperfect-plural":"fluturaserăm","indicative-pluperfect-plural-second-person":"fluturaserăți","indicative-pluperfect-plural-third-person":"fluturaseră","first-person-present-singular-subjunctive":"să flutur","present-second-person-singular-subjunctive":"să fluturi","present-singular-subjunctive-third-person":"să fluture","first-person-plural-present-subjunctive":"să fluturăm","plural-present-second-person-subjunctive":"să fluturați","plural-present-subjunctive-third-person":"să fluture","imperative-second-person-singular":"flutură","imperative-plural-second-person":"fluturați","imperative-negative-second-person-singular":"nu flutura","imperative-negative-plural-second-person":"nu fluturați"}},{"word":"fluturare","pos":"noun","definitions":["flutter, fluttering"],"forms":{"plural":"fluturări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluturare","accusative-definite-nominative-singular":"fluturarea","accusative-indefinite-nominative-plural":"fluturări","accusative-definite-nominative-plural":"fluturările","dative-genitive-indefinite-singular":"fluturări","dative-definite-genitive-singular":"fluturării","dative-genitive-indefinite-plural":"fluturări","dative-definite-genitive-plural":"fluturărilor","singular-vocative":"fluturare","plural-vocative":"fluturărilor"}},{"word":"Fluturaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fluturaș"}},{"word":"fluturaș","pos":"noun","definitions":["diminutive of fluture; small butterfly","payslip"],"forms":{"plural":"fluturași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluturaș","accusative-definite-nominative-singular":"fluturașul","accusative-indefinite-nominative-plural":"fluturași","accusative-definite-nominative-plural":"fluturașii","dative-genitive-indefinite-singular":"fluturaș","dative-definite-genitive-singular":"fluturașului","dative-genitive-indefinite-plural":"fluturași","dative-definite-genitive-plural":"fluturașilor","singular-vocative":"fluturașule","plural-vocative":"fluturașilor"}},{"word":"fluturaș de stâncă","pos":"noun","definitions":["wallcreeper (Tichodroma muraria)"],"forms":{"plural":"fluturași de stâncă"}},{"word":"fluturat","pos":"noun","definitions":["flutter"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fluturat","accusative-definite-nominative":"fluturatul","dative-genitive-indefinite":"fluturat","dative-definite-genitive":"fluturatului","vocative":"fluturatule"}},{"word":"fluturat","pos":"verb","definitions":["past participle of flutura"],"forms":{"participle-past":"of flutura"}},{"word":"fluturatec","pos":"adj","definitions":["alternative form of fluturatic"],"forms":{"feminine-singular":"fluturatecă","masculine-plural":"fluturateci","feminine-neuter-plural":"fluturatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluturatec","error-unrecognized-form-feminine-indefinite-singular":"fluturatecă","error-unrecognized-form-indefinite-masculine-plural":"fluturateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluturatece","definite-error-unrecognized-form-masculine-neuter-singular":"fluturatecul","definite-error-unrecognized-form-feminine-singular":"fluturateca","definite-error-unrecognized-form-masculine-plural":"fluturatecii","definite-error-unrecognized-form-feminine-neuter-plural":"fluturatecele"}},{"word":"fluturatic","pos":"adj","definitions":["fickle"],"forms":{"feminine-singular":"fluturatică","masculine-plural":"fluturatici","feminine-neuter-plural":"fluturatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluturatic","error-unrecognized-form-feminine-indefinite-singular":"fluturatică","error-unrecognized-form-indefinite-masculine-plural":"fluturatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluturatice","definite-error-unrecognized-form-masculine-neuter-singular":"fluturaticul","definite-error-unrecognized-form-feminine-singular":"fluturatica","definite-error-unrecognized-form-masculine-plural":"fluturaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fluturaticele"}},{"word":"fluturatic","pos":"noun","definitions":["fickle person"],"forms":{"plural":"fluturatici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluturatic","accusative-definite-nominative-singular":"fluturaticul","accusative-indefinite-nominative-plural":"fluturatici","accusative-definite-nominative-plural":"fluturaticii","dative-genitive-indefinite-singular":"fluturatic","dative-definite-genitive-singular":"fluturaticului","dative-genitive-indefinite-plural":"fluturatici","dative-definite-genitive-plural":"fluturaticilor","singular-vocative":"fluturaticule","plural-vocative":"fluturaticilor"}},{"word":"fluturatică","pos":"noun","definitions":["female equivalent of fluturatic"],"forms":{"plural":"fluturatice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fluturatică","accusative-definite-nominative-singular":"fluturatica","accusative-indefinite-nominative-plural":"fluturatice","accusative-definite-nominative-plural":"fluturaticele","dative-genitive-indefinite-singular":"fluturatice","dative-definite-genitive-singular":"fluturaticei","dative-genitive-indefinite-plural":"fluturatice","dative-definite-genitive-plural":"fluturaticelor","singular-vocative":"fluturatică","plural-vocative":"fluturaticelor"}},{"word":"fluturător","pos":"adj","definitions":["fluttering"],"forms":{"feminine-singular":"fluturătoare","masculine-plural":"fluturători","feminine-neuter-plural":"fluturătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluturător","error-unrecognized-form-feminine-indefinite-singular":"fluturătoare","error-unrecognized-form-indefinite-masculine-plural":"fluturători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluturătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fluturătorul","definite-error-unrecognized-form-feminine-singular":"fluturătoarea","definite-error-unrecognized-form-masculine-plural":"fluturătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fluturătoarele"}},{"word":"Fluture","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fluture"}},{"word":"fluture","pos":"noun","definitions":["butterfly"],"pronunciation":"[ˈflu.tu.re]","forms":{"plural":"fluturi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"fluture","accusative-definite-nominative-singular":"fluturele","accusative-indefinite-nominative-plural":"fluturi","accusative-definite-nominative-plural":"fluturii","dative-genitive-indefinite-singular":"fluture","dative-definite-genitive-singular":"fluturelui","dative-genitive-indefinite-plural":"fluturi","dative-definite-genitive-plural":"fluturilor","singular-vocative":"fluture","plural-vocative":"fluturilor","alternative":"flutur"}},{"word":"fluture de mătase","pos":"noun","definitions":["domestic silk moth (Bombyx mori)"]},{"word":"Fluturel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fluturel"}},{"word":"fluturel","pos":"noun","definitions":["diminutive of fluture; small butterfly"],"forms":{"plural":"fluturei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fluturel","accusative-definite-nominative-singular":"fluturelul","accusative-indefinite-nominative-plural":"flutureli","accusative-definite-nominative-plural":"fluturelii","dative-genitive-indefinite-singular":"fluturel","dative-definite-genitive-singular":"fluturelului","dative-genitive-indefinite-plural":"flutureli","dative-definite-genitive-plural":"fluturelilor","singular-vocative":"fluturelule","plural-vocative":"fluturelilor"}},{"word":"Fluturu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fluturu"}},{"word":"fluvial","pos":"adj","definitions":["fluvial"],"pronunciation":"[fluviˈal]","forms":{"feminine-singular":"fluvială","masculine-plural":"fluviali","feminine-neuter-plural":"fluviale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluvial","error-unrecognized-form-feminine-indefinite-singular":"fluvială","error-unrecognized-form-indefinite-masculine-plural":"fluviali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluviale","definite-error-unrecognized-form-masculine-neuter-singular":"fluvialul","definite-error-unrecognized-form-feminine-singular":"fluviala","definite-error-unrecognized-form-masculine-plural":"fluvialii","definite-error-unrecognized-form-feminine-neuter-plural":"fluvialele"}},{"word":"fluviatil","pos":"adj","definitions":["fluvial"],"forms":{"feminine-singular":"fluviatilă","masculine-plural":"fluviatili","feminine-neuter-plural":"fluviatile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluviatil","error-unrecognized-form-feminine-indefinite-singular":"fluviatilă","error-unrecognized-form-indefinite-masculine-plural":"fluviatili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluviatile","definite-error-unrecognized-form-masculine-neuter-singular":"fluviatilul","definite-error-unrecognized-form-feminine-singular":"fluviatila","definite-error-unrecognized-form-masculine-plural":"fluviatilii","definite-error-unrecognized-form-feminine-neuter-plural":"fluviatilele"}},{"word":"fluvii","pos":"noun","definitions":["indefinite plural of fluviu"],"pronunciation":"[ˈfluvji]","gender":"n"},{"word":"fluviometric","pos":"adj","definitions":["fluviometric"],"forms":{"feminine-singular":"fluviometrică","masculine-plural":"fluviometrici","feminine-neuter-plural":"fluviometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fluviometric","error-unrecognized-form-feminine-indefinite-singular":"fluviometrică","error-unrecognized-form-indefinite-masculine-plural":"fluviometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fluviometrice","definite-error-unrecognized-form-masculine-neuter-singular":"fluviometricul","definite-error-unrecognized-form-feminine-singular":"fluviometrica","definite-error-unrecognized-form-masculine-plural":"fluviometricii","definite-error-unrecognized-form-feminine-neuter-plural":"fluviometricele"}},{"word":"fluviometru","pos":"noun","definitions":["fluviometer"],"forms":{"plural":"fluviometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluviometru","accusative-definite-nominative-singular":"fluviometrul","accusative-indefinite-nominative-plural":"fluviometre","accusative-definite-nominative-plural":"fluviometrele","dative-genitive-indefinite-singular":"fluviometru","dative-definite-genitive-singular":"fluviometrului","dative-genitive-indefinite-plural":"fluviometre","dative-definite-genitive-plural":"fluviometrelor","singular-vocative":"fluviometrule","plural-vocative":"fluviometrelor"}},{"word":"fluviu","pos":"noun","definitions":["a (large) river (large stream which drains a landmass)"],"pronunciation":"/ˈflu.vju/","forms":{"plural":"fluvii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluviu","accusative-definite-nominative-singular":"fluviul","accusative-indefinite-nominative-plural":"fluvii","accusative-definite-nominative-plural":"fluviile","dative-genitive-indefinite-singular":"fluviu","dative-definite-genitive-singular":"fluviului","dative-genitive-indefinite-plural":"fluvii","dative-definite-genitive-plural":"fluviilor","singular-vocative":"fluviule","plural-vocative":"fluviilor"}},{"word":"flux","pos":"noun","definitions":["flow (the flow of the tide)"],"forms":{"plural":"fluxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"flux","accusative-definite-nominative-singular":"fluxul","accusative-indefinite-nominative-plural":"fluxuri","accusative-definite-nominative-plural":"fluxurile","dative-genitive-indefinite-singular":"flux","dative-definite-genitive-singular":"fluxului","dative-genitive-indefinite-plural":"fluxuri","dative-definite-genitive-plural":"fluxurilor","singular-vocative":"fluxule","plural-vocative":"fluxurilor"}},{"word":"flux luminos","pos":"noun","definitions":["luminous flux"],"forms":{"plural":"fluxuri luminoase"}},{"word":"flux magnetic","pos":"noun","definitions":["magnetic flux"],"forms":{"plural":"fluxuri magnetice"}},{"word":"fluxiune","pos":"noun","definitions":["fluxion"],"forms":{"plural":"fluxiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fluxiune","accusative-definite-nominative-singular":"fluxiunea","accusative-indefinite-nominative-plural":"fluxiuni","accusative-definite-nominative-plural":"fluxiunile","dative-genitive-indefinite-singular":"fluxiuni","dative-definite-genitive-singular":"fluxiunii","dative-genitive-indefinite-plural":"fluxiuni","dative-definite-genitive-plural":"fluxiunilor","singular-vocative":"fluxiune","plural-vocative":"fluxiunilor"}},{"word":"fluxmetru","pos":"noun","definitions":["flowmeter"],"forms":{"plural":"fluxmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fluxmetru","accusative-definite-nominative-singular":"fluxmetrul","accusative-indefinite-nominative-plural":"fluxmetre","accusative-definite-nominative-plural":"fluxmetrele","dative-genitive-indefinite-singular":"fluxmetru","dative-definite-genitive-singular":"fluxmetrului","dative-genitive-indefinite-plural":"fluxmetre","dative-definite-genitive-plural":"fluxmetrelor","singular-vocative":"fluxmetrule","plural-vocative":"fluxmetrelor"}},{"word":"fluxuri","pos":"noun","definitions":["indefinite plural of flux"],"pronunciation":"[ˈfluksurʲ]","gender":"n"},{"word":"FMI","pos":"name","definitions":["IMF"],"pronunciation":"/fe.me.ˈi/","gender":"n","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"FMI","accusative-definite-nominative":"FMI-ul","dative-genitive-indefinite":"FMI","dative-definite-genitive":"FMI-ului","vocative":"FMI-ule"}},{"word":"FMM","pos":"phrase","definitions":["initialism of futu-ți morții mă-tii"]},{"word":"foac","pos":"noun","definitions":["European chub (Squalius cephalus)"],"forms":{"plural":"foaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foac","accusative-definite-nominative-singular":"foacul","accusative-indefinite-nominative-plural":"foaci","accusative-definite-nominative-plural":"foacii","dative-genitive-indefinite-singular":"foac","dative-definite-genitive-singular":"foacului","dative-genitive-indefinite-plural":"foaci","dative-definite-genitive-plural":"foacilor","singular-vocative":"foacule","plural-vocative":"foacilor"}},{"word":"foacăle","pos":"noun","definitions":["match (device to make fire)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"foacăle","accusative-definite-nominative":"foacălele","dative-genitive-indefinite":"foacăle","dative-definite-genitive":"foacălelor","vocative":"-"}},{"word":"foaie","pos":"noun","definitions":["sheet (of paper)","leaf"],"pronunciation":"/ˈfo̯a.je/","forms":{"plural":"foi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"foaie","accusative-definite-nominative-singular":"foaia","accusative-indefinite-nominative-plural":"foi","accusative-definite-nominative-plural":"foile","dative-genitive-indefinite-singular":"foi","dative-definite-genitive-singular":"foii","dative-genitive-indefinite-plural":"foi","dative-definite-genitive-plural":"foilor","singular-vocative":"foaie","plural-vocative":"foilor","alternative":"фоае"}},{"word":"foaie de calcul","pos":"noun","definitions":["spreadsheet"],"forms":{"plural":"foi de calcul"}},{"word":"foaie de dafin","pos":"noun","definitions":["bay leaf"],"forms":{"plural":"foi de dafin"}},{"word":"foaie volantă","pos":"noun","definitions":["leaflet"],"forms":{"plural":"foi volante"}},{"word":"foaier","pos":"noun","definitions":["lobby"],"forms":{"plural":"foaiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foaier","accusative-definite-nominative-singular":"foaierul","accusative-indefinite-nominative-plural":"foaiere","accusative-definite-nominative-plural":"foaierele","dative-genitive-indefinite-singular":"foaier","dative-definite-genitive-singular":"foaierului","dative-genitive-indefinite-plural":"foaiere","dative-definite-genitive-plural":"foaierelor","singular-vocative":"foaierule","plural-vocative":"foaierelor"}},{"word":"foaită","pos":"noun","definitions":["kin, lineage, stock"],"pronunciation":"/ˈfo̯ai.tə/","forms":{"plural":"foaite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foaită","accusative-definite-nominative-singular":"foaita","accusative-indefinite-nominative-plural":"foaite","accusative-definite-nominative-plural":"foaitele","dative-genitive-indefinite-singular":"foaite","dative-definite-genitive-singular":"foaitei","dative-genitive-indefinite-plural":"foaite","dative-definite-genitive-plural":"foaitelor","singular-vocative":"foaită","plural-vocative":"foaitelor"}},{"word":"foale","pos":"noun","definitions":["bellows","abdomen, belly, paunch"],"forms":{"plural":"foale","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"foale","accusative-definite-nominative-singular":"foalele","accusative-indefinite-nominative-plural":"foale","accusative-definite-nominative-plural":"foalele","dative-genitive-indefinite-singular":"foale","dative-definite-genitive-singular":"foalelui","dative-genitive-indefinite-plural":"foale","dative-definite-genitive-plural":"foalelor","singular-vocative":"foale","plural-vocative":"foalelor"}},{"word":"foaleș","pos":"adj","definitions":["big-bellied"],"forms":{"feminine-singular":"foaleșă","masculine-plural":"foaleși","feminine-neuter-plural":"foaleșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foaleș","error-unrecognized-form-feminine-indefinite-singular":"foaleșă","error-unrecognized-form-indefinite-masculine-plural":"foaleși","error-unrecognized-form-feminine-indefinite-neuter-plural":"foaleșe","definite-error-unrecognized-form-masculine-neuter-singular":"foaleșul","definite-error-unrecognized-form-feminine-singular":"foaleșa","definite-error-unrecognized-form-masculine-plural":"foaleșii","definite-error-unrecognized-form-feminine-neuter-plural":"foaleșele"}},{"word":"foaltine","pos":"noun","definitions":["wallflower (Cheiranthus cheiri)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"foaltine","accusative-definite-nominative":"foaltinele","dative-genitive-indefinite":"foaltine","dative-definite-genitive":"foaltinelor","vocative":"-"}},{"word":"foame","pos":"noun","definitions":["hunger"],"pronunciation":"/ˈfo̯a.me/","examples":[{"ro":"Mi-e foame.","en":"I'm hungry."},{"ro":"Te rog, dă-mi niște mâncare pentru că mor de foame.","en":"Please, give me some food because I'm dying of hunger."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"foame","accusative-definite-nominative":"foamea","dative-genitive-indefinite":"foame","dative-definite-genitive":"foamei","vocative":"foame","alternative":"фоаме"}},{"word":"foame de lup","pos":"noun","definitions":["ravenous hunger","Used other than figuratively or idiomatically: see foame, lup."]},{"word":"foamea","pos":"noun","definitions":["definite nominative/accusative singular of foame"]},{"word":"foamea este cel mai bun bucătar","pos":"proverb","definitions":["hunger is a good sauce"]},{"word":"foamei","pos":"noun","definitions":["definite dative/genitive singular of foame"]},{"word":"Foamete","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Foamete"}},{"word":"foamete","pos":"noun","definitions":["famine, starvation"],"pronunciation":"/ˈfo̯a.me.te/","forms":{"plural":"foamete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"foamete","accusative-definite-nominative-singular":"foametea","accusative-indefinite-nominative-plural":"foamete","accusative-definite-nominative-plural":"foametele","dative-genitive-indefinite-singular":"foamete","dative-definite-genitive-singular":"foametei","dative-genitive-indefinite-plural":"foamete","dative-definite-genitive-plural":"foametelor","singular-vocative":"foamete","plural-vocative":"foametelor","alternative":"фоамете"}},{"word":"foarfec","pos":"noun","definitions":["alternative form of foarfecă"],"forms":{"plural":"foarfeci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foarfec","accusative-definite-nominative-singular":"foarfecul","accusative-indefinite-nominative-plural":"foarfeci","accusative-definite-nominative-plural":"foarfecii","dative-genitive-indefinite-singular":"foarfec","dative-definite-genitive-singular":"foarfecului","dative-genitive-indefinite-plural":"foarfeci","dative-definite-genitive-plural":"foarfecilor","singular-vocative":"foarfecule","plural-vocative":"foarfecilor"}},{"word":"Foarfecă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Foarfecă"}},{"word":"foarfecă","pos":"noun","definitions":["scissors"],"forms":{"plural":"foarfeci","alternative":"foarfece"}},{"word":"foarfeca prețurilor","pos":"noun","definitions":["price scissors"]},{"word":"foarfece","pos":"noun","definitions":["scissors, pair of scissors","shears"],"forms":{"plural":"foarfece","alternative":"foarfecă"}},{"word":"foarte","pos":"adv","definitions":["very"],"pronunciation":"[ˈfo̯ar.te]","examples":[{"ro":"Ea este foarte frumoasă.","en":"She is very beautiful."},{"ro":"Eu sunt foarte bine, mulțumesc.","en":"I am very well, thank you."},{"ro":"Am uitat să fac ceva foarte important...","en":"I forgot to do something really important..."}]},{"word":"foarte mult","pos":"adv","definitions":["so much"]},{"word":"foasă","pos":"noun","definitions":["hole, pit"]},{"word":"foastăn","pos":"noun","definitions":["a thick plank, board"],"forms":{"plural":"foastăne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foastăn","accusative-definite-nominative-singular":"foastănul","accusative-indefinite-nominative-plural":"foastăne","accusative-definite-nominative-plural":"foastănele","dative-genitive-indefinite-singular":"foastăn","dative-definite-genitive-singular":"foastănului","dative-genitive-indefinite-plural":"foastăne","dative-definite-genitive-plural":"foastănelor","singular-vocative":"foastănule","plural-vocative":"foastănelor"}},{"word":"fobic","pos":"adj","definitions":["phobic"],"forms":{"feminine-singular":"fobică","masculine-plural":"fobici","feminine-neuter-plural":"fobice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fobic","error-unrecognized-form-feminine-indefinite-singular":"fobică","error-unrecognized-form-indefinite-masculine-plural":"fobici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fobice","definite-error-unrecognized-form-masculine-neuter-singular":"fobicul","definite-error-unrecognized-form-feminine-singular":"fobica","definite-error-unrecognized-form-masculine-plural":"fobicii","definite-error-unrecognized-form-feminine-neuter-plural":"fobicele"}},{"word":"fobie","pos":"noun","definitions":["phobia"],"forms":{"plural":"fobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fobie","accusative-definite-nominative-singular":"fobia","accusative-indefinite-nominative-plural":"fobii","accusative-definite-nominative-plural":"fobiile","dative-genitive-indefinite-singular":"fobii","dative-definite-genitive-singular":"fobiei","dative-genitive-indefinite-plural":"fobii","dative-definite-genitive-plural":"fobiilor","singular-vocative":"fobie","plural-vocative":"fobiilor"}},{"word":"foburg","pos":"noun","definitions":["suburb"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"foburg","accusative-definite-nominative":"foburgul","dative-genitive-indefinite":"foburg","dative-definite-genitive":"foburgului","vocative":"foburgule"}},{"word":"foc","pos":"noun","definitions":["fire, blaze"],"pronunciation":"/fok/","forms":{"plural":"focuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foc","accusative-definite-nominative-singular":"focul","accusative-indefinite-nominative-plural":"focuri","accusative-definite-nominative-plural":"focurile","dative-genitive-indefinite-singular":"foc","dative-definite-genitive-singular":"focului","dative-genitive-indefinite-plural":"focuri","dative-definite-genitive-plural":"focurilor","singular-vocative":"focule","plural-vocative":"focurilor"}},{"word":"foc bengal","pos":"noun","definitions":["Bengal light"],"forms":{"plural":"focuri bengale"}},{"word":"foc de armă","pos":"noun","definitions":["shot"],"forms":{"plural":"focuri de armă"}},{"word":"foc de artificii","pos":"noun","definitions":["fireworks"],"forms":{"plural":"focuri de artificii"}},{"word":"foca","pos":"noun","definitions":["definite nominative/accusative singular of focă"],"pronunciation":"[ˈfoka]","gender":"f"},{"word":"focă","pos":"noun","definitions":["seal (animal)"],"pronunciation":"/ˈfokə/","forms":{"plural":"foci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"focă","accusative-definite-nominative-singular":"foca","accusative-indefinite-nominative-plural":"foci","accusative-definite-nominative-plural":"focile","dative-genitive-indefinite-singular":"foci","dative-definite-genitive-singular":"focii","dative-genitive-indefinite-plural":"foci","dative-definite-genitive-plural":"focilor","singular-vocative":"focă","plural-vocative":"focilor"}},{"word":"focal","pos":"adj","definitions":["focal"],"forms":{"feminine-singular":"focală","masculine-plural":"focali","feminine-neuter-plural":"focale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"focal","error-unrecognized-form-feminine-indefinite-singular":"focală","error-unrecognized-form-indefinite-masculine-plural":"focali","error-unrecognized-form-feminine-indefinite-neuter-plural":"focale","definite-error-unrecognized-form-masculine-neuter-singular":"focalul","definite-error-unrecognized-form-feminine-singular":"focala","definite-error-unrecognized-form-masculine-plural":"focalii","definite-error-unrecognized-form-feminine-neuter-plural":"focalele"}},{"word":"focaliza","pos":"verb","definitions":["to focus"],"forms":{"canonical":"a focaliza 1st conjugation","present-singular-third-person":"focalizează","participle-past":"focalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a focaliza","gerund":"focalizând","first-person-indicative-present-singular":"focalizez","indicative-present-second-person-singular":"focalizezi","indicative-present-singular-third-person":"focalizează","first-person-indicative-plural-present":"focalizăm","indicative-plural-present-second-person":"focalizați","indicative-plural-present-third-person":"focalizează","first-person-imperfect-indicative-singular":"focalizam","imperfect-indicative-second-person-singular":"focalizai","imperfect-indicative-singular-third-person":"focaliza","first-person-imperfect-indicative-plural":"focalizam","imperfect-indicative-plural-second-person":"focalizați","imperfect-indicative-plural-third-person":"focalizau","first-person-indicative-perfect-singular":"focalizai","indicative-perfect-second-person-singular":"focalizași","indicative-perfect-singular-third-person":"focaliză","first-person-indicative-perfect-plural":"focalizarăm","indicative-perfect-plural-second-person":"focalizarăți","indicative-perfect-plural-third-person":"focalizară","first-person-indicative-pluperfect-singular":"focalizasem","indicative-pluperfect-second-person-singular":"focalizaseși","indicative-pluperfect-singular-third-person":"focalizase","first-person-indicative-pluperfect-plural":"focalizaserăm","indicative-pluperfect-plural-second-person":"focalizaserăți","indicative-pluperfect-plural-third-person":"focalizaseră","first-person-present-singular-subjunctive":"să focalizez","present-second-person-singular-subjunctive":"să focalizezi","present-singular-subjunctive-third-person":"să focalizeze","first-person-plural-present-subjunctive":"să focalizăm","plural-present-second-person-subjunctive":"să focalizați","plural-present-subjunctive-third-person":"să focalizeze","imperative-second-person-singular":"focalizează","imperative-plural-second-person":"focalizați","imperative-negative-second-person-singular":"nu focaliza","imperative-negative-plural-second-person":"nu focalizați"}},{"word":"focalizare","pos":"noun","definitions":["focalization"],"forms":{"plural":"focalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"focalizare","accusative-definite-nominative-singular":"focalizarea","accusative-indefinite-nominative-plural":"focalizări","accusative-definite-nominative-plural":"focalizările","dative-genitive-indefinite-singular":"focalizări","dative-definite-genitive-singular":"focalizării","dative-genitive-indefinite-plural":"focalizări","dative-definite-genitive-plural":"focalizărilor","singular-vocative":"focalizare","plural-vocative":"focalizărilor"}},{"word":"focalizație","pos":"noun","definitions":["focalization"],"forms":{"plural":"focalizații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"focalizație","accusative-definite-nominative-singular":"focalizația","accusative-indefinite-nominative-plural":"focalizații","accusative-definite-nominative-plural":"focalizațiile","dative-genitive-indefinite-singular":"focalizații","dative-definite-genitive-singular":"focalizației","dative-genitive-indefinite-plural":"focalizații","dative-definite-genitive-plural":"focalizațiilor","singular-vocative":"focalizație","plural-vocative":"focalizațiilor"}},{"word":"focar","pos":"noun","definitions":["focus","pyre","calamity, disaster, misfortune","hotbed","focus, center"],"forms":{"plural":"focare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focar","accusative-definite-nominative-singular":"focarul","accusative-indefinite-nominative-plural":"focare","accusative-definite-nominative-plural":"focarele","dative-genitive-indefinite-singular":"focar","dative-definite-genitive-singular":"focarului","dative-genitive-indefinite-plural":"focare","dative-definite-genitive-plural":"focarelor","singular-vocative":"focarule","plural-vocative":"focarelor"}},{"word":"focar","pos":"noun","definitions":["stoker, fireman"],"forms":{"plural":"focari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"focar","accusative-definite-nominative-singular":"focarul","accusative-indefinite-nominative-plural":"focari","accusative-definite-nominative-plural":"focarii","dative-genitive-indefinite-singular":"focar","dative-definite-genitive-singular":"focarului","dative-genitive-indefinite-plural":"focari","dative-definite-genitive-plural":"focarilor","singular-vocative":"focarule","plural-vocative":"focarilor"}},{"word":"focar seismic","pos":"noun","definitions":["an earthquake's focus"],"forms":{"plural":"focare seismice"}},{"word":"focar virtual","pos":"noun","definitions":["virtual focus"],"forms":{"plural":"focare virtuale"}},{"word":"focare","pos":"noun","definitions":["indefinite plural of focar"],"pronunciation":"[foˈkare]","gender":"n"},{"word":"focari","pos":"noun","definitions":["indefinite plural of focar"],"gender":"m"},{"word":"fochist","pos":"noun","definitions":["stoker"],"forms":{"plural":"fochiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fochist","accusative-definite-nominative-singular":"fochistul","accusative-indefinite-nominative-plural":"fochiști","accusative-definite-nominative-plural":"fochiștii","dative-genitive-indefinite-singular":"fochist","dative-definite-genitive-singular":"fochistului","dative-genitive-indefinite-plural":"fochiști","dative-definite-genitive-plural":"fochiștilor","singular-vocative":"fochistule","plural-vocative":"fochiștilor"}},{"word":"foci","pos":"noun","definitions":["inflection of focă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfot͡ʃʲ]","gender":"f"},{"word":"focile","pos":"noun","definitions":["definite nominative/accusative plural of focă"],"pronunciation":"[ˈfot͡ʃile]","gender":"f"},{"word":"focilor","pos":"noun","definitions":["inflection of focă:","definite genitive/dative plural","vocative plural"],"pronunciation":"[ˈfot͡ʃilor]","gender":"f"},{"word":"foco","pos":"noun","definitions":["vocative singular of focă"],"pronunciation":"[ˈfoko]","gender":"f"},{"word":"focomel","pos":"noun","definitions":["phocomelus"],"forms":{"plural":"focomeli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"focomel","accusative-definite-nominative-singular":"focomelul","accusative-indefinite-nominative-plural":"focomeli","accusative-definite-nominative-plural":"focomelii","dative-genitive-indefinite-singular":"focomel","dative-definite-genitive-singular":"focomelului","dative-genitive-indefinite-plural":"focomeli","dative-definite-genitive-plural":"focomelilor","singular-vocative":"focomelule","plural-vocative":"focomelilor"}},{"word":"focomelie","pos":"noun","definitions":["phocomelia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"focomelie","accusative-definite-nominative":"focomelia","dative-genitive-indefinite":"focomelii","dative-definite-genitive":"focomeliei","vocative":"focomelie"}},{"word":"focometrie","pos":"noun","definitions":["focimetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"focometrie","accusative-definite-nominative":"focometria","dative-genitive-indefinite":"focometrii","dative-definite-genitive":"focometriei","vocative":"focometrie"}},{"word":"focometru","pos":"noun","definitions":["focometer"],"forms":{"plural":"focometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focometru","accusative-definite-nominative-singular":"focometrul","accusative-indefinite-nominative-plural":"focometre","accusative-definite-nominative-plural":"focometrele","dative-genitive-indefinite-singular":"focometru","dative-definite-genitive-singular":"focometrului","dative-genitive-indefinite-plural":"focometre","dative-definite-genitive-plural":"focometrelor","singular-vocative":"focometrule","plural-vocative":"focometrelor"}},{"word":"focos","pos":"adj","definitions":["fiery","hotheaded, hot-tempered, passionate, ardent, fiery, impetuous"],"pronunciation":"/foˈkos/","forms":{"feminine-singular":"focoasă","masculine-plural":"focoși","feminine-neuter-plural":"focoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"focos","error-unrecognized-form-feminine-indefinite-singular":"focoasă","error-unrecognized-form-indefinite-masculine-plural":"focoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"focoase","definite-error-unrecognized-form-masculine-neuter-singular":"focosul","definite-error-unrecognized-form-feminine-singular":"focoasa","definite-error-unrecognized-form-masculine-plural":"focoșii","definite-error-unrecognized-form-feminine-neuter-plural":"focoasele"}},{"word":"Focșa","pos":"name","definitions":["a village in Lunca Banului, Vaslui County, Romania","a surname"],"gender":"f"},{"word":"focșănean","pos":"noun","definitions":["native or inhabitant of the city of Focşani, Vrancea County, Romania (usually male)"],"forms":{"plural":"focșăneni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"focșănean","accusative-definite-nominative-singular":"focșăneanul","accusative-indefinite-nominative-plural":"focșăneni","accusative-definite-nominative-plural":"focșănenii","dative-genitive-indefinite-singular":"focșănean","dative-definite-genitive-singular":"focșăneanului","dative-genitive-indefinite-plural":"focșăneni","dative-definite-genitive-plural":"focșănenilor","singular-vocative":"focșăneanule","plural-vocative":"focșănenilor"}},{"word":"focșăneană","pos":"noun","definitions":["female equivalent of focșănean"],"forms":{"plural":"focșănene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"focșăneană","accusative-definite-nominative-singular":"focșăneana","accusative-indefinite-nominative-plural":"focșănene","accusative-definite-nominative-plural":"focșănenele","dative-genitive-indefinite-singular":"focșănene","dative-definite-genitive-singular":"focșănenei","dative-genitive-indefinite-plural":"focșănene","dative-definite-genitive-plural":"focșănenelor","singular-vocative":"focșăneană","plural-vocative":"focșănenelor"}},{"word":"focșăneancă","pos":"noun","definitions":["female equivalent of focșănean"],"forms":{"plural":"focșănence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"focșăneancă","accusative-definite-nominative-singular":"focșăneanca","accusative-indefinite-nominative-plural":"focșănence","accusative-definite-nominative-plural":"focșănencele","dative-genitive-indefinite-singular":"focșănence","dative-definite-genitive-singular":"focșănencei","dative-genitive-indefinite-plural":"focșănence","dative-definite-genitive-plural":"focșănencelor","singular-vocative":"focșăneancă","plural-vocative":"focșănencelor"}},{"word":"Focșăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Focșăneanu"}},{"word":"Focșănei","pos":"name","definitions":["a village in Vadu Pașii, Buzău County, Romania"],"gender":"m"},{"word":"Focșani","pos":"name","definitions":["a city in Vrancea County, Romania"],"pronunciation":"/fokˈʃanʲ/","gender":"m"},{"word":"Focșeasca","pos":"name","definitions":["a village in Tăcuta, Vaslui County, Romania"],"gender":"f"},{"word":"Focșeneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Focșeneanu"}},{"word":"Focșineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Focșineanu"}},{"word":"focșor","pos":"noun","definitions":["alternative form of focușor"],"forms":{"plural":"focșoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focșor","accusative-definite-nominative-singular":"focșorul","accusative-indefinite-nominative-plural":"focșoare","accusative-definite-nominative-plural":"focșoarele","dative-genitive-indefinite-singular":"focșor","dative-definite-genitive-singular":"focșorului","dative-genitive-indefinite-plural":"focșoare","dative-definite-genitive-plural":"focșoarelor","singular-vocative":"focșorule","plural-vocative":"focșoarelor"}},{"word":"focșorel","pos":"noun","definitions":["diminutive of focșor"],"forms":{"plural":"focșorele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focșorel","accusative-definite-nominative-singular":"focșorelul","accusative-indefinite-nominative-plural":"focșorele","accusative-definite-nominative-plural":"focșorelele","dative-genitive-indefinite-singular":"focșorel","dative-definite-genitive-singular":"focșorelului","dative-genitive-indefinite-plural":"focșorele","dative-definite-genitive-plural":"focșorelelor","singular-vocative":"focșorelule","plural-vocative":"focșorelelor"}},{"word":"focul","pos":"noun","definitions":["definite nominative/accusative singular of foc"]},{"word":"focule","pos":"noun","definitions":["vocative singular of foc"],"pronunciation":"[ˈfokule]"},{"word":"foculeț","pos":"noun","definitions":["diminutive of foc; small fire"],"forms":{"plural":"foculețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foculeț","accusative-definite-nominative-singular":"foculețul","accusative-indefinite-nominative-plural":"foculețe","accusative-definite-nominative-plural":"foculețele","dative-genitive-indefinite-singular":"foculeț","dative-definite-genitive-singular":"foculețului","dative-genitive-indefinite-plural":"foculețe","dative-definite-genitive-plural":"foculețelor","singular-vocative":"foculețule","plural-vocative":"foculețelor"}},{"word":"focului","pos":"noun","definitions":["definite dative/genitive singular of foc"]},{"word":"focurel","pos":"noun","definitions":["diminutive of foc"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"focurel","accusative-definite-nominative":"focurelul","dative-genitive-indefinite":"focurel","dative-definite-genitive":"focurelului","vocative":"focurelule"}},{"word":"Focuri","pos":"name","definitions":["a commune of Iași County, Romania","a village in Focuri, Iași County, Romania"],"gender":"m"},{"word":"focuri","pos":"noun","definitions":["plural of foc"]},{"word":"focurile","pos":"noun","definitions":["definite nominative/accusative plural of foc"]},{"word":"focurilor","pos":"noun","definitions":["inflection of foc:","definite genitive/dative plural","vocative plural"]},{"word":"focus","pos":"noun","definitions":["focus"],"forms":{"plural":"focusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"focus","accusative-definite-nominative-singular":"focusul","accusative-indefinite-nominative-plural":"focusuri","accusative-definite-nominative-plural":"focusurile","dative-genitive-indefinite-singular":"focus","dative-definite-genitive-singular":"focusului","dative-genitive-indefinite-plural":"focusuri","dative-definite-genitive-plural":"focusurilor","singular-vocative":"focusule","plural-vocative":"focusurilor"}},{"word":"focușor","pos":"noun","definitions":["diminutive of foc; small fire"],"forms":{"plural":"focușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focușor","accusative-definite-nominative-singular":"focușorul","accusative-indefinite-nominative-plural":"focușore","accusative-definite-nominative-plural":"focușorele","dative-genitive-indefinite-singular":"focușor","dative-definite-genitive-singular":"focușorului","dative-genitive-indefinite-plural":"focușore","dative-definite-genitive-plural":"focușorelor","singular-vocative":"focușorule","plural-vocative":"focușorelor"}},{"word":"focuț","pos":"noun","definitions":["diminutive of foc"],"forms":{"plural":"focuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"focuț","accusative-definite-nominative-singular":"focuțul","accusative-indefinite-nominative-plural":"focuțe","accusative-definite-nominative-plural":"focuțele","dative-genitive-indefinite-singular":"focuț","dative-definite-genitive-singular":"focuțului","dative-genitive-indefinite-plural":"focuțe","dative-definite-genitive-plural":"focuțelor","singular-vocative":"focuțule","plural-vocative":"focuțelor"}},{"word":"Fodor","pos":"name","definitions":["a surname from Russian"],"gender":"m","forms":{"dative-genitive":"lui Fodor"}},{"word":"Fodorică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fodorică"}},{"word":"fodoriță","pos":"noun","definitions":["diminutive of fodor"],"forms":{"plural":"fodorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fodoriță","accusative-definite-nominative-singular":"fodorița","accusative-indefinite-nominative-plural":"fodorițe","accusative-definite-nominative-plural":"fodorițele","dative-genitive-indefinite-singular":"fodorițe","dative-definite-genitive-singular":"fodoriței","dative-genitive-indefinite-plural":"fodorițe","dative-definite-genitive-plural":"fodorițelor","singular-vocative":"fodoriță","plural-vocative":"fodorițelor"}},{"word":"fodormintă","pos":"noun","definitions":["spearmint (Mentha spicata)"],"forms":{"plural":"fodorminte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fodormintă","accusative-definite-nominative-singular":"fodorminta","accusative-indefinite-nominative-plural":"fodorminte","accusative-definite-nominative-plural":"fodormintele","dative-genitive-indefinite-singular":"fodorminte","dative-definite-genitive-singular":"fodormintei","dative-genitive-indefinite-plural":"fodorminte","dative-definite-genitive-plural":"fodormintelor","singular-vocative":"fodormintă","plural-vocative":"fodormintelor"}},{"word":"Fodoruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fodoruț"}},{"word":"foehn","pos":"noun","definitions":["hairdryer"],"pronunciation":"/ˈføn/","forms":{"plural":"foehnuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"foehn","accusative-definite-nominative-singular":"foehnul","accusative-indefinite-nominative-plural":"foehnuri","accusative-definite-nominative-plural":"foehnurile","dative-genitive-indefinite-singular":"foehn","dative-definite-genitive-singular":"foehnului","dative-genitive-indefinite-plural":"foehnuri","dative-definite-genitive-plural":"foehnurilor","singular-vocative":"foehnule","plural-vocative":"foehnurilor","alternative":"föhn"}},{"word":"Foeni","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Foeni, Timiș County, Romania"],"gender":"m"},{"word":"foeț","pos":"noun","definitions":["common minnow (Phoxinus phoxinus)"],"forms":{"plural":"foeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foeț","accusative-definite-nominative-singular":"foețul","accusative-indefinite-nominative-plural":"foeți","accusative-definite-nominative-plural":"foeții","dative-genitive-indefinite-singular":"foeț","dative-definite-genitive-singular":"foețului","dative-genitive-indefinite-plural":"foeți","dative-definite-genitive-plural":"foeților","singular-vocative":"foețule","plural-vocative":"foeților"}},{"word":"fofează","pos":"noun","definitions":["wing-shaped object"],"forms":{"plural":"fofeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fofează","accusative-definite-nominative-singular":"fofeaza","accusative-indefinite-nominative-plural":"fofeze","accusative-definite-nominative-plural":"fofezele","dative-genitive-indefinite-singular":"fofeze","dative-definite-genitive-singular":"fofezei","dative-genitive-indefinite-plural":"fofeze","dative-definite-genitive-plural":"fofezelor","singular-vocative":"fofează","plural-vocative":"fofezelor"}},{"word":"Fofeldea","pos":"name","definitions":["a village in Nocrich, Sibiu County, Romania"],"gender":"f"},{"word":"fofila","pos":"verb","definitions":["to sneak out"],"forms":{"canonical":"a fofila 1st conjugation","present-singular-third-person":"fofilează","participle-past":"fofilat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fofila","gerund":"fofilând","first-person-indicative-present-singular":"fofilez","indicative-present-second-person-singular":"fofilezi","indicative-present-singular-third-person":"fofilează","first-person-indicative-plural-present":"fofilăm","indicative-plural-present-second-person":"fofilați","indicative-plural-present-third-person":"fofilează","first-person-imperfect-indicative-singular":"fofilam","imperfect-indicative-second-person-singular":"fofilai","imperfect-indicative-singular-third-person":"fofila","first-person-imperfect-indicative-plural":"fofilam","imperfect-indicative-plural-second-person":"fofilați","imperfect-indicative-plural-third-person":"fofilau","first-person-indicative-perfect-singular":"fofilai","indicative-perfect-second-person-singular":"fofilași","indicative-perfect-singular-third-person":"fofilă","first-person-indicative-perfect-plural":"fofilarăm","indicative-perfect-plural-second-person":"fofilarăți","indicative-perfect-plural-third-person":"fofilară","first-person-indicative-pluperfect-singular":"fofilasem","indicative-pluperfect-second-person-singular":"fofilaseși","indicative-pluperfect-singular-third-person":"fofilase","first-person-indicative-pluperfect-plural":"fofilaserăm","indicative-pluperfect-plural-second-person":"fofilaserăți","indicative-pluperfect-plural-third-person":"fofilaseră","first-person-present-singular-subjunctive":"să fofilez","present-second-person-singular-subjunctive":"să fofilezi","present-singular-subjunctive-third-person":"să fofileze","first-person-plural-present-subjunctive":"să fofilăm","plural-present-second-person-subjunctive":"să fofilați","plural-present-subjunctive-third-person":"să fofileze","imperative-second-person-singular":"fofilează","imperative-plural-second-person":"fofilați","imperative-negative-second-person-singular":"nu fofila","imperative-negative-plural-second-person":"nu fofilați"}},{"word":"fofilare","pos":"noun","definitions":["avoiding work, sneaking"],"forms":{"plural":"fofilări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fofilare","accusative-definite-nominative-singular":"fofilarea","accusative-indefinite-nominative-plural":"fofilări","accusative-definite-nominative-plural":"fofilările","dative-genitive-indefinite-singular":"fofilări","dative-definite-genitive-singular":"fofilării","dative-genitive-indefinite-plural":"fofilări","dative-definite-genitive-plural":"fofilărilor","singular-vocative":"fofilare","plural-vocative":"fofilărilor"}},{"word":"Fofîrlică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fofîrlică"}},{"word":"fofoloagă","pos":"noun","definitions":["female equivalent of fofolog"],"forms":{"plural":"fofoloage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fofoloagă","accusative-definite-nominative-singular":"fofoloaga","accusative-indefinite-nominative-plural":"fofoloage","accusative-definite-nominative-plural":"fofoloagele","dative-genitive-indefinite-singular":"fofoloage","dative-definite-genitive-singular":"fofoloagei","dative-genitive-indefinite-plural":"fofoloage","dative-definite-genitive-plural":"fofoloagelor","singular-vocative":"fofoloagă","plural-vocative":"fofoloagelor"}},{"word":"fofoloancă","pos":"noun","definitions":["vulva"],"forms":{"plural":"fofoloance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fofoloancă","accusative-definite-nominative-singular":"fofoloanca","accusative-indefinite-nominative-plural":"fofoloance","accusative-definite-nominative-plural":"fofoloancele","dative-genitive-indefinite-singular":"fofoloance","dative-definite-genitive-singular":"fofoloancei","dative-genitive-indefinite-plural":"fofoloance","dative-definite-genitive-plural":"fofoloancelor","singular-vocative":"fofoloancă","plural-vocative":"fofoloancelor"}},{"word":"fofolog","pos":"adj","definitions":["slow, lazy"],"forms":{"feminine-singular":"fofologă","masculine-plural":"fofologi","feminine-neuter-plural":"fofologe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fofolog","error-unrecognized-form-feminine-indefinite-singular":"fofologă","error-unrecognized-form-indefinite-masculine-plural":"fofologi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fofologe","definite-error-unrecognized-form-masculine-neuter-singular":"fofologul","definite-error-unrecognized-form-feminine-singular":"fofologa","definite-error-unrecognized-form-masculine-plural":"fofologii","definite-error-unrecognized-form-feminine-neuter-plural":"fofologele"}},{"word":"fofolog","pos":"noun","definitions":["a slow or lazy person"],"forms":{"plural":"fofologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fofolog","accusative-definite-nominative-singular":"fofologul","accusative-indefinite-nominative-plural":"fofologi","accusative-definite-nominative-plural":"fofologii","dative-genitive-indefinite-singular":"fofolog","dative-definite-genitive-singular":"fofologului","dative-genitive-indefinite-plural":"fofologi","dative-definite-genitive-plural":"fofologilor","singular-vocative":"fofologule","plural-vocative":"fofologilor"}},{"word":"fofologă","pos":"noun","definitions":["female equivalent of fofolog"],"forms":{"plural":"fofologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fofologă","accusative-definite-nominative-singular":"fofologa","accusative-indefinite-nominative-plural":"fofologe","accusative-definite-nominative-plural":"fofologele","dative-genitive-indefinite-singular":"fofologe","dative-definite-genitive-singular":"fofologei","dative-genitive-indefinite-plural":"fofologe","dative-definite-genitive-plural":"fofologelor","singular-vocative":"fofologă","plural-vocative":"fofologelor"}},{"word":"fogăluit","pos":"adj","definitions":["busy"],"forms":{"feminine-singular":"fogăluită","masculine-plural":"fogăluiți","feminine-neuter-plural":"fogăluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fogăluit","error-unrecognized-form-feminine-indefinite-singular":"fogăluită","error-unrecognized-form-indefinite-masculine-plural":"fogăluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fogăluite","definite-error-unrecognized-form-masculine-neuter-singular":"fogăluitul","definite-error-unrecognized-form-feminine-singular":"fogăluita","definite-error-unrecognized-form-masculine-plural":"fogăluiții","definite-error-unrecognized-form-feminine-neuter-plural":"fogăluitele"}},{"word":"Fogarași","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Fogarași"}},{"word":"fogaș","pos":"noun","definitions":["coat hanger, coat rack, coat stand"],"forms":{"plural":"fogașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fogaș","accusative-definite-nominative-singular":"fogașul","accusative-indefinite-nominative-plural":"fogașe","accusative-definite-nominative-plural":"fogașele","dative-genitive-indefinite-singular":"fogaș","dative-definite-genitive-singular":"fogașului","dative-genitive-indefinite-plural":"fogașe","dative-definite-genitive-plural":"fogașelor","singular-vocative":"fogașule","plural-vocative":"fogașelor"}},{"word":"Foglaș","pos":"name","definitions":["a village in Suplacu de Barcău, Bihor County, Romania"],"gender":"m"},{"word":"foi","pos":"verb","definitions":["to fuss, bustle, move about","to be full of people who are busy, teem with"],"pronunciation":"/foˈi/","forms":{"canonical":"a foi 4th conjugation","present-singular-third-person":"foiește","participle-past":"foit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a foi","gerund":"foind","first-person-indicative-present-singular":"foiesc","indicative-present-second-person-singular":"foiești","indicative-present-singular-third-person":"foiește","first-person-indicative-plural-present":"foim","indicative-plural-present-second-person":"foiți","indicative-plural-present-third-person":"foiesc","first-person-imperfect-indicative-singular":"foiam","imperfect-indicative-second-person-singular":"foiai","imperfect-indicative-singular-third-person":"foia","first-person-imperfect-indicative-plural":"foiam","imperfect-indicative-plural-second-person":"foiați","imperfect-indicative-plural-third-person":"foiau","first-person-indicative-perfect-singular":"foii","indicative-perfect-second-person-singular":"foiși","indicative-perfect-singular-third-person":"foi","first-person-indicative-perfect-plural":"foirăm","indicative-perfect-plural-second-person":"foirăți","indicative-perfect-plural-third-person":"foiră","first-person-indicative-pluperfect-singular":"foisem","indicative-pluperfect-second-person-singular":"foiseși","indicative-pluperfect-singular-third-person":"foise","first-person-indicative-pluperfect-plural":"foiserăm","indicative-pluperfect-plural-second-person":"foiserăți","indicative-pluperfect-plural-third-person":"foiseră","first-person-present-singular-subjunctive":"să foiesc","present-second-person-singular-subjunctive":"să foiești","present-singular-subjunctive-third-person":"să foiască","first-person-plural-present-subjunctive":"să foim","plural-present-second-person-subjunctive":"să foiți","plural-present-subjunctive-third-person":"să foiască","imperative-second-person-singular":"foiește","imperative-plural-second-person":"foiți","imperative-negative-second-person-singular":"nu foi","imperative-negative-plural-second-person":"nu foiți"}},{"word":"foi","pos":"noun","definitions":["inflection of foaie (“sheet”):","indefinite plural","indefinite genitive singular"],"pronunciation":"/ˈfoj/"},{"word":"foia","pos":"verb","definitions":["third-person singular imperfect indicative of foi"],"pronunciation":"[foˈja]"},{"word":"foială","pos":"noun","definitions":["bustle"],"forms":{"plural":"foieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foială","accusative-definite-nominative-singular":"foiala","accusative-indefinite-nominative-plural":"foiele","accusative-definite-nominative-plural":"foielele","dative-genitive-indefinite-singular":"foiele","dative-definite-genitive-singular":"foielei","dative-genitive-indefinite-plural":"foiele","dative-definite-genitive-plural":"foielelor","singular-vocative":"foială","plural-vocative":"foielelor"}},{"word":"foicea","pos":"noun","definitions":["diminutive of foaie"],"forms":{"plural":"foicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"foicea","accusative-definite-nominative-singular":"foiceaua","accusative-indefinite-nominative-plural":"foicele","accusative-definite-nominative-plural":"foicelele","dative-genitive-indefinite-singular":"foicele","dative-definite-genitive-singular":"foicelei","dative-genitive-indefinite-plural":"foicele","dative-definite-genitive-plural":"foicelelor","singular-vocative":"foicea","plural-vocative":"foicelelor"}},{"word":"foicică","pos":"noun","definitions":["diminutive of foaie; small sheet of paper"],"pronunciation":"/fo.iˈt͡ʃi.kə/","forms":{"plural":"foicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foicică","accusative-definite-nominative-singular":"foicica","accusative-indefinite-nominative-plural":"foicele","accusative-definite-nominative-plural":"foicelele","dative-genitive-indefinite-singular":"foicele","dative-definite-genitive-singular":"foicelei","dative-genitive-indefinite-plural":"foicele","dative-definite-genitive-plural":"foicelelor","singular-vocative":"foicică","plural-vocative":"foicelelor"}}];
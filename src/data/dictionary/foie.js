@@ -0,0 +1 @@
+export default [{"word":"Foieni","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Foieni, Satu Mare County, Romania"],"gender":"m"},{"word":"foii","pos":"noun","definitions":["definite genitive/dative singular of foaie"]},{"word":"foileană","pos":"noun","definitions":["diminutive of foaie; small piece of paper"],"forms":{"plural":"foilene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foileană","accusative-definite-nominative-singular":"foileana","accusative-indefinite-nominative-plural":"foilene","accusative-definite-nominative-plural":"foilenele","dative-genitive-indefinite-singular":"foilene","dative-definite-genitive-singular":"foilenei","dative-genitive-indefinite-plural":"foilene","dative-definite-genitive-plural":"foilenelor","singular-vocative":"foileană","plural-vocative":"foilenelor"}},{"word":"foileta","pos":"verb","definitions":["to leaf through"],"forms":{"canonical":"a foileta 1st conjugation","present-singular-third-person":"foiletează","participle-past":"foiletat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a foileta","gerund":"foiletând","first-person-indicative-present-singular":"foiletez","indicative-present-second-person-singular":"foiletezi","indicative-present-singular-third-person":"foiletează","first-person-indicative-plural-present":"foiletăm","indicative-plural-present-second-person":"foiletați","indicative-plural-present-third-person":"foiletează","first-person-imperfect-indicative-singular":"foiletam","imperfect-indicative-second-person-singular":"foiletai","imperfect-indicative-singular-third-person":"foileta","first-person-imperfect-indicative-plural":"foiletam","imperfect-indicative-plural-second-person":"foiletați","imperfect-indicative-plural-third-person":"foiletau","first-person-indicative-perfect-singular":"foiletai","indicative-perfect-second-person-singular":"foiletași","indicative-perfect-singular-third-person":"foiletă","first-person-indicative-perfect-plural":"foiletarăm","indicative-perfect-plural-second-person":"foiletarăți","indicative-perfect-plural-third-person":"foiletară","first-person-indicative-pluperfect-singular":"foiletasem","indicative-pluperfect-second-person-singular":"foiletaseși","indicative-pluperfect-singular-third-person":"foiletase","first-person-indicative-pluperfect-plural":"foiletaserăm","indicative-pluperfect-plural-second-person":"foiletaserăți","indicative-pluperfect-plural-third-person":"foiletaseră","first-person-present-singular-subjunctive":"să foiletez","present-second-person-singular-subjunctive":"să foiletezi","present-singular-subjunctive-third-person":"să foileteze","first-person-plural-present-subjunctive":"să foiletăm","plural-present-second-person-subjunctive":"să foiletați","plural-present-subjunctive-third-person":"să foileteze","imperative-second-person-singular":"foiletează","imperative-plural-second-person":"foiletați","imperative-negative-second-person-singular":"nu foileta","imperative-negative-plural-second-person":"nu foiletați"}},{"word":"foileton","pos":"noun","definitions":["feature"],"forms":{"plural":"foiletoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foileton","accusative-definite-nominative-singular":"foiletonul","accusative-indefinite-nominative-plural":"foiletoane","accusative-definite-nominative-plural":"foiletoanele","dative-genitive-indefinite-singular":"foileton","dative-definite-genitive-singular":"foiletonului","dative-genitive-indefinite-plural":"foiletoane","dative-definite-genitive-plural":"foiletoanelor","singular-vocative":"foiletonule","plural-vocative":"foiletoanelor"}},{"word":"foiletonist","pos":"noun","definitions":["feuilletonist"],"forms":{"plural":"foiletoniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foiletonist","accusative-definite-nominative-singular":"foiletonistul","accusative-indefinite-nominative-plural":"foiletoniști","accusative-definite-nominative-plural":"foiletoniștii","dative-genitive-indefinite-singular":"foiletonist","dative-definite-genitive-singular":"foiletonistului","dative-genitive-indefinite-plural":"foiletoniști","dative-definite-genitive-plural":"foiletoniștilor","singular-vocative":"foiletonistule","plural-vocative":"foiletoniștilor"}},{"word":"foiletonistă","pos":"noun","definitions":["female equivalent of foiletonist"],"forms":{"plural":"foiletoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foiletonistă","accusative-definite-nominative-singular":"foiletonista","accusative-indefinite-nominative-plural":"foiletoniste","accusative-definite-nominative-plural":"foiletonistele","dative-genitive-indefinite-singular":"foiletoniste","dative-definite-genitive-singular":"foiletonistei","dative-genitive-indefinite-plural":"foiletoniste","dative-definite-genitive-plural":"foiletonistelor","singular-vocative":"foiletonistă","plural-vocative":"foiletonistelor"}},{"word":"foiletonistic","pos":"adj","definitions":["feuilletonistic"],"forms":{"feminine-singular":"foiletonistică","masculine-plural":"foiletonistici","feminine-neuter-plural":"foiletonistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foiletonistic","error-unrecognized-form-feminine-indefinite-singular":"foiletonistică","error-unrecognized-form-indefinite-masculine-plural":"foiletonistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"foiletonistice","definite-error-unrecognized-form-masculine-neuter-singular":"foiletonisticul","definite-error-unrecognized-form-feminine-singular":"foiletonistica","definite-error-unrecognized-form-masculine-plural":"foiletonisticii","definite-error-unrecognized-form-feminine-neuter-plural":"foiletonisticele"}},{"word":"foiliță","pos":"noun","definitions":["diminutive of foaie"],"forms":{"plural":"foilițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foiliță","accusative-definite-nominative-singular":"foilița","accusative-indefinite-nominative-plural":"foilițe","accusative-definite-nominative-plural":"foilițele","dative-genitive-indefinite-singular":"foilițe","dative-definite-genitive-singular":"foiliței","dative-genitive-indefinite-plural":"foilițe","dative-definite-genitive-plural":"foilițelor","singular-vocative":"foiliță","plural-vocative":"foilițelor"}},{"word":"foioară","pos":"noun","definitions":["diminutive of foaie"],"forms":{"plural":"foioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foioară","accusative-definite-nominative-singular":"foioara","accusative-indefinite-nominative-plural":"foioare","accusative-definite-nominative-plural":"foioarele","dative-genitive-indefinite-singular":"foioare","dative-definite-genitive-singular":"foioarei","dative-genitive-indefinite-plural":"foioare","dative-definite-genitive-plural":"foioarelor","singular-vocative":"foioară","plural-vocative":"foioarelor"}},{"word":"foioasă","pos":"noun","definitions":["broadleaf"],"forms":{"plural":"foioase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foioasă","accusative-definite-nominative-singular":"foioasa","accusative-indefinite-nominative-plural":"foioase","accusative-definite-nominative-plural":"foioasele","dative-genitive-indefinite-singular":"foioase","dative-definite-genitive-singular":"foioasei","dative-genitive-indefinite-plural":"foioase","dative-definite-genitive-plural":"foioaselor","singular-vocative":"foioasă","plural-vocative":"foioaselor"}},{"word":"foios","pos":"adj","definitions":["leafy, foliated, with luxurious foliage","omasum, manyplies"],"pronunciation":"/foˈjos/","forms":{"feminine-singular":"foioasă","masculine-plural":"foioși","feminine-neuter-plural":"foioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foios","error-unrecognized-form-feminine-indefinite-singular":"foioasă","error-unrecognized-form-indefinite-masculine-plural":"foioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"foioase","definite-error-unrecognized-form-masculine-neuter-singular":"foiosul","definite-error-unrecognized-form-feminine-singular":"foioasa","definite-error-unrecognized-form-masculine-plural":"foioșii","definite-error-unrecognized-form-feminine-neuter-plural":"foioasele"}},{"word":"foire","pos":"noun","definitions":["squirminess"],"forms":{"plural":"foiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"foire","accusative-definite-nominative-singular":"foirea","accusative-indefinite-nominative-plural":"foiri","accusative-definite-nominative-plural":"foirile","dative-genitive-indefinite-singular":"foiri","dative-definite-genitive-singular":"foirii","dative-genitive-indefinite-plural":"foiri","dative-definite-genitive-plural":"foirilor","singular-vocative":"foire","plural-vocative":"foirilor"}},{"word":"foise","pos":"verb","definitions":["third-person singular pluperfect indicative of foi"],"pronunciation":"[foˈise]"},{"word":"foișoară","pos":"noun","definitions":["diminutive of foaie"],"forms":{"plural":"foișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foișoară","accusative-definite-nominative-singular":"foișoara","accusative-indefinite-nominative-plural":"foișoare","accusative-definite-nominative-plural":"foișoarele","dative-genitive-indefinite-singular":"foișoare","dative-definite-genitive-singular":"foișoarei","dative-genitive-indefinite-plural":"foișoare","dative-definite-genitive-plural":"foișoarelor","singular-vocative":"foișoară","plural-vocative":"foișoarelor"}},{"word":"Foișor","pos":"name","definitions":["a village in Drănic, Dolj County, Romania"],"gender":"m"},{"word":"foișor","pos":"noun","definitions":["pavilion"],"forms":{"plural":"foișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foișor","accusative-definite-nominative-singular":"foișorul","accusative-indefinite-nominative-plural":"foișoare","accusative-definite-nominative-plural":"foișoarele","dative-genitive-indefinite-singular":"foișor","dative-definite-genitive-singular":"foișorului","dative-genitive-indefinite-plural":"foișoare","dative-definite-genitive-plural":"foișoarelor","singular-vocative":"foișorule","plural-vocative":"foișoarelor"}},{"word":"foișor de foc","pos":"noun","definitions":["fire tower"],"forms":{"plural":"foișoare de foc"}},{"word":"Foișoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Foișoreanu"}},{"word":"foișorului","pos":"noun","definitions":["definite genitive/dative singular of foișor"]},{"word":"Foiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Foiță"}},{"word":"foiță","pos":"noun","definitions":["diminutive of foaie; small piece of paper"],"forms":{"plural":"foițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foiță","accusative-definite-nominative-singular":"foița","accusative-indefinite-nominative-plural":"foițe","accusative-definite-nominative-plural":"foițele","dative-genitive-indefinite-singular":"foițe","dative-definite-genitive-singular":"foiței","dative-genitive-indefinite-plural":"foițe","dative-definite-genitive-plural":"foițelor","singular-vocative":"foiță","plural-vocative":"foițelor"}},{"word":"foitaj","pos":"noun","definitions":["puff pastry"],"forms":{"plural":"foitaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foitaj","accusative-definite-nominative-singular":"foitajul","accusative-indefinite-nominative-plural":"foitaje","accusative-definite-nominative-plural":"foitajele","dative-genitive-indefinite-singular":"foitaj","dative-definite-genitive-singular":"foitajului","dative-genitive-indefinite-plural":"foitaje","dative-definite-genitive-plural":"foitajelor","singular-vocative":"foitajule","plural-vocative":"foitajelor"}},{"word":"foițică","pos":"noun","definitions":["diminutive of foiță"],"forms":{"plural":"foițele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foițică","accusative-definite-nominative-singular":"foițica","accusative-indefinite-nominative-plural":"foițele","accusative-definite-nominative-plural":"foițelele","dative-genitive-indefinite-singular":"foițele","dative-definite-genitive-singular":"foițelei","dative-genitive-indefinite-plural":"foițele","dative-definite-genitive-plural":"foițelelor","singular-vocative":"foițică","plural-vocative":"foițelelor"}},{"word":"folcel","pos":"noun","definitions":["a small bellows or a small sack made from an animal stomach"],"forms":{"plural":"folcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"folcel","accusative-definite-nominative-singular":"folcelul","accusative-indefinite-nominative-plural":"folcei","accusative-definite-nominative-plural":"folceii","dative-genitive-indefinite-singular":"folcel","dative-definite-genitive-singular":"folcelului","dative-genitive-indefinite-plural":"folcei","dative-definite-genitive-plural":"folceilor","singular-vocative":"folcelule","plural-vocative":"folceilor"}},{"word":"folclor","pos":"noun","definitions":["folklore"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"folclor","accusative-definite-nominative":"folclorul","dative-genitive-indefinite":"folclor","dative-definite-genitive":"folclorului","vocative":"folclorule"}},{"word":"folcloric","pos":"adj","definitions":["folk (related to folklore)"],"forms":{"feminine-singular":"folclorică","masculine-plural":"folclorici","feminine-neuter-plural":"folclorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"folcloric","error-unrecognized-form-feminine-indefinite-singular":"folclorică","error-unrecognized-form-indefinite-masculine-plural":"folclorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"folclorice","definite-error-unrecognized-form-masculine-neuter-singular":"folcloricul","definite-error-unrecognized-form-feminine-singular":"folclorica","definite-error-unrecognized-form-masculine-plural":"folcloricii","definite-error-unrecognized-form-feminine-neuter-plural":"folcloricele"}},{"word":"folclorism","pos":"noun","definitions":["folklorism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"folclorism","accusative-definite-nominative":"folclorismul","dative-genitive-indefinite":"folclorism","dative-definite-genitive":"folclorismului","vocative":"folclorismule"}},{"word":"folclorist","pos":"noun","definitions":["folklorist"],"forms":{"plural":"folcloriști","feminine":"equivalent folcloristă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"folclorist","accusative-definite-nominative-singular":"folcloristul","accusative-indefinite-nominative-plural":"folcloriști","accusative-definite-nominative-plural":"folcloriștii","dative-genitive-indefinite-singular":"folclorist","dative-definite-genitive-singular":"folcloristului","dative-genitive-indefinite-plural":"folcloriști","dative-definite-genitive-plural":"folcloriștilor","singular-vocative":"folcloristule","plural-vocative":"folcloriștilor"}},{"word":"folcloristă","pos":"noun","definitions":["female equivalent of folclorist"],"forms":{"plural":"folcloriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"folcloristă","accusative-definite-nominative-singular":"folclorista","accusative-indefinite-nominative-plural":"folcloriste","accusative-definite-nominative-plural":"folcloristele","dative-genitive-indefinite-singular":"folcloriste","dative-definite-genitive-singular":"folcloristei","dative-genitive-indefinite-plural":"folcloriste","dative-definite-genitive-plural":"folcloristelor","singular-vocative":"folcloristă","plural-vocative":"folcloristelor"}},{"word":"folcloristic","pos":"adj","definitions":["folkloristic"],"forms":{"feminine-singular":"folcloristică","masculine-plural":"folcloristici","feminine-neuter-plural":"folcloristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"folcloristic","error-unrecognized-form-feminine-indefinite-singular":"folcloristică","error-unrecognized-form-indefinite-masculine-plural":"folcloristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"folcloristice","definite-error-unrecognized-form-masculine-neuter-singular":"folcloristicul","definite-error-unrecognized-form-feminine-singular":"folcloristica","definite-error-unrecognized-form-masculine-plural":"folcloristicii","definite-error-unrecognized-form-feminine-neuter-plural":"folcloristicele"}},{"word":"folcloristică","pos":"noun","definitions":["folkloristics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"folcloristică","accusative-definite-nominative-singular":"folcloristica","accusative-indefinite-nominative-plural":"folcloristice","accusative-definite-nominative-plural":"folcloristicele","dative-genitive-indefinite-singular":"folcloristice","dative-definite-genitive-singular":"folcloristicei","dative-genitive-indefinite-plural":"folcloristice","dative-definite-genitive-plural":"folcloristicelor","singular-vocative":"folcloristică","plural-vocative":"folcloristicelor"}},{"word":"Folcuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Folcuțescu"}},{"word":"Foleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Foleanu"}},{"word":"Foleștii de Jos","pos":"name","definitions":["a village in Tomșani, Vâlcea County, Romania"],"gender":"m"},{"word":"Foleștii de Sus","pos":"name","definitions":["a village in Tomșani, Vâlcea County, Romania"],"gender":"m"},{"word":"folfăi","pos":"verb","definitions":["to speak or chew slowly"],"forms":{"canonical":"a folfăi 4th conjugation","present-singular-third-person":"folfăiește","participle-past":"folfăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a folfăi","gerund":"folfăind","first-person-indicative-present-singular":"folfăiesc","indicative-present-second-person-singular":"folfăiești","indicative-present-singular-third-person":"folfăiește","first-person-indicative-plural-present":"folfăim","indicative-plural-present-second-person":"folfăiți","indicative-plural-present-third-person":"folfăiesc","first-person-imperfect-indicative-singular":"folfăiam","imperfect-indicative-second-person-singular":"folfăiai","imperfect-indicative-singular-third-person":"folfăia","first-person-imperfect-indicative-plural":"folfăiam","imperfect-indicative-plural-second-person":"folfăiați","imperfect-indicative-plural-third-person":"folfăiau","first-person-indicative-perfect-singular":"folfăii","indicative-perfect-second-person-singular":"folfăiși","indicative-perfect-singular-third-person":"folfăi","first-person-indicative-perfect-plural":"folfăirăm","indicative-perfect-plural-second-person":"folfăirăți","indicative-perfect-plural-third-person":"folfăiră","first-person-indicative-pluperfect-singular":"folfăisem","indicative-pluperfect-second-person-singular":"folfăiseși","indicative-pluperfect-singular-third-person":"folfăise","first-person-indicative-pluperfect-plural":"folfăiserăm","indicative-pluperfect-plural-second-person":"folfăiserăți","indicative-pluperfect-plural-third-person":"folfăiseră","first-person-present-singular-subjunctive":"să folfăiesc","present-second-person-singular-subjunctive":"să folfăiești","present-singular-subjunctive-third-person":"să folfăiască","first-person-plural-present-subjunctive":"să folfăim","plural-present-second-person-subjunctive":"să folfăiți","plural-present-subjunctive-third-person":"să folfăiască","imperative-second-person-singular":"folfăiește","imperative-plural-second-person":"folfăiți","imperative-negative-second-person-singular":"nu folfăi","imperative-negative-plural-second-person":"nu folfăiți"}},{"word":"foliaceu","pos":"adj","definitions":["foliaceous"],"forms":{"feminine-singular":"foliacee","masculine-plural":"foliacei","feminine-neuter-plural":"foliacee","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foliaceu","error-unrecognized-form-feminine-indefinite-singular":"foliacee","error-unrecognized-form-indefinite-masculine-plural":"foliacei","error-unrecognized-form-feminine-indefinite-neuter-plural":"foliacee","definite-error-unrecognized-form-masculine-neuter-singular":"foliaceul","definite-error-unrecognized-form-feminine-singular":"foliaceea","definite-error-unrecognized-form-masculine-plural":"foliaceii","definite-error-unrecognized-form-feminine-neuter-plural":"foliaceele"}},{"word":"foliant","pos":"noun","definitions":["a large book"],"forms":{"plural":"foliante","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foliant","accusative-definite-nominative-singular":"foliantul","accusative-indefinite-nominative-plural":"foliante","accusative-definite-nominative-plural":"foliantele","dative-genitive-indefinite-singular":"foliant","dative-definite-genitive-singular":"foliantului","dative-genitive-indefinite-plural":"foliante","dative-definite-genitive-plural":"foliantelor","singular-vocative":"foliantule","plural-vocative":"foliantelor"}},{"word":"foliar","pos":"adj","definitions":["foliar"],"forms":{"feminine-singular":"foliară","masculine-plural":"foliari","feminine-neuter-plural":"foliare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foliar","error-unrecognized-form-feminine-indefinite-singular":"foliară","error-unrecognized-form-indefinite-masculine-plural":"foliari","error-unrecognized-form-feminine-indefinite-neuter-plural":"foliare","definite-error-unrecognized-form-masculine-neuter-singular":"foliarul","definite-error-unrecognized-form-feminine-singular":"foliara","definite-error-unrecognized-form-masculine-plural":"foliarii","definite-error-unrecognized-form-feminine-neuter-plural":"foliarele"}},{"word":"foliat","pos":"adj","definitions":["foliate"],"forms":{"feminine-singular":"foliată","masculine-plural":"foliați","feminine-neuter-plural":"foliate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foliat","error-unrecognized-form-feminine-indefinite-singular":"foliată","error-unrecognized-form-indefinite-masculine-plural":"foliați","error-unrecognized-form-feminine-indefinite-neuter-plural":"foliate","definite-error-unrecognized-form-masculine-neuter-singular":"foliatul","definite-error-unrecognized-form-feminine-singular":"foliata","definite-error-unrecognized-form-masculine-plural":"foliații","definite-error-unrecognized-form-feminine-neuter-plural":"foliatele"}},{"word":"foliație","pos":"noun","definitions":["foliation"],"forms":{"plural":"foliații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"foliație","accusative-definite-nominative-singular":"foliația","accusative-indefinite-nominative-plural":"foliații","accusative-definite-nominative-plural":"foliațiile","dative-genitive-indefinite-singular":"foliații","dative-definite-genitive-singular":"foliației","dative-genitive-indefinite-plural":"foliații","dative-definite-genitive-plural":"foliațiilor","singular-vocative":"foliație","plural-vocative":"foliațiilor"}},{"word":"foliațiune","pos":"noun","definitions":["alternative form of foliație"],"forms":{"plural":"foliațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"foliațiune","accusative-definite-nominative-singular":"foliațiunea","accusative-indefinite-nominative-plural":"foliațiuni","accusative-definite-nominative-plural":"foliațiunile","dative-genitive-indefinite-singular":"foliațiuni","dative-definite-genitive-singular":"foliațiunii","dative-genitive-indefinite-plural":"foliațiuni","dative-definite-genitive-plural":"foliațiunilor","singular-vocative":"foliațiune","plural-vocative":"foliațiunilor"}},{"word":"folicică","pos":"noun","definitions":["diminutive of foale"],"forms":{"plural":"folicicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"folicică","accusative-definite-nominative-singular":"folicica","accusative-indefinite-nominative-plural":"folicicele","accusative-definite-nominative-plural":"folicicelele","dative-genitive-indefinite-singular":"folicicele","dative-definite-genitive-singular":"folicicelei","dative-genitive-indefinite-plural":"folicicele","dative-definite-genitive-plural":"folicicelelor","singular-vocative":"folicică","plural-vocative":"folicicelelor"}},{"word":"folicul","pos":"noun","definitions":["follicle"],"forms":{"plural":"foliculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"folicul","accusative-definite-nominative-singular":"foliculul","accusative-indefinite-nominative-plural":"foliculi","accusative-definite-nominative-plural":"foliculii","dative-genitive-indefinite-singular":"folicul","dative-definite-genitive-singular":"foliculului","dative-genitive-indefinite-plural":"foliculi","dative-definite-genitive-plural":"foliculilor","singular-vocative":"foliculule","plural-vocative":"foliculilor"}},{"word":"foliculă","pos":"noun","definitions":["follicle"],"forms":{"plural":"folicule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foliculă","accusative-definite-nominative-singular":"folicula","accusative-indefinite-nominative-plural":"folicule","accusative-definite-nominative-plural":"foliculele","dative-genitive-indefinite-singular":"folicule","dative-definite-genitive-singular":"foliculei","dative-genitive-indefinite-plural":"folicule","dative-definite-genitive-plural":"foliculelor","singular-vocative":"foliculă","plural-vocative":"foliculelor"}},{"word":"folicular","pos":"adj","definitions":["follicular"],"forms":{"feminine-singular":"foliculară","masculine-plural":"foliculari","feminine-neuter-plural":"foliculare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"folicular","error-unrecognized-form-feminine-indefinite-singular":"foliculară","error-unrecognized-form-indefinite-masculine-plural":"foliculari","error-unrecognized-form-feminine-indefinite-neuter-plural":"foliculare","definite-error-unrecognized-form-masculine-neuter-singular":"folicularul","definite-error-unrecognized-form-feminine-singular":"foliculara","definite-error-unrecognized-form-masculine-plural":"folicularii","definite-error-unrecognized-form-feminine-neuter-plural":"folicularele"}},{"word":"foliculină","pos":"noun","definitions":["folliculin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foliculină","accusative-definite-nominative-singular":"foliculina","accusative-indefinite-nominative-plural":"foliculine","accusative-definite-nominative-plural":"foliculinele","dative-genitive-indefinite-singular":"foliculine","dative-definite-genitive-singular":"foliculinei","dative-genitive-indefinite-plural":"foliculine","dative-definite-genitive-plural":"foliculinelor","singular-vocative":"foliculină","plural-vocative":"foliculinelor"}},{"word":"foliculită","pos":"noun","definitions":["folliculitis"],"forms":{"plural":"foliculite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foliculită","accusative-definite-nominative-singular":"foliculita","accusative-indefinite-nominative-plural":"foliculite","accusative-definite-nominative-plural":"foliculitele","dative-genitive-indefinite-singular":"foliculite","dative-definite-genitive-singular":"foliculitei","dative-genitive-indefinite-plural":"foliculite","dative-definite-genitive-plural":"foliculitelor","singular-vocative":"foliculită","plural-vocative":"foliculitelor"}},{"word":"foliculoză","pos":"noun","definitions":["follicular conjunctivitis"],"forms":{"plural":"foliculoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foliculoză","accusative-definite-nominative-singular":"foliculoza","accusative-indefinite-nominative-plural":"foliculoze","accusative-definite-nominative-plural":"foliculozele","dative-genitive-indefinite-singular":"foliculoze","dative-definite-genitive-singular":"foliculozei","dative-genitive-indefinite-plural":"foliculoze","dative-definite-genitive-plural":"foliculozelor","singular-vocative":"foliculoză","plural-vocative":"foliculozelor"}},{"word":"folie","pos":"noun","definitions":["madness, folly"],"forms":{"plural":"folii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"folie","accusative-definite-nominative-singular":"folia","accusative-indefinite-nominative-plural":"folii","accusative-definite-nominative-plural":"foliile","dative-genitive-indefinite-singular":"folii","dative-definite-genitive-singular":"foliei","dative-genitive-indefinite-plural":"folii","dative-definite-genitive-plural":"foliilor","singular-vocative":"folie","plural-vocative":"foliilor"}},{"word":"folii","pos":"noun","definitions":["nominative/accusative/genitive/dative indefinite plural of foliu"],"gender":"n"},{"word":"folio","pos":"noun","definitions":["folio"],"pronunciation":"/ˈfo.ljo/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"folio","accusative-definite-nominative":"folioul","dative-genitive-indefinite":"folio","dative-definite-genitive":"folioului","vocative":"folioule"}},{"word":"foliolă","pos":"noun","definitions":["foliole"],"forms":{"plural":"foliole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foliolă","accusative-definite-nominative-singular":"foliola","accusative-indefinite-nominative-plural":"foliole","accusative-definite-nominative-plural":"foliolele","dative-genitive-indefinite-singular":"foliole","dative-definite-genitive-singular":"foliolei","dative-genitive-indefinite-plural":"foliole","dative-definite-genitive-plural":"foliolelor","singular-vocative":"foliolă","plural-vocative":"foliolelor"}},{"word":"foliolat","pos":"adj","definitions":["foliolate"],"forms":{"feminine-singular":"foliolată","masculine-plural":"foliolați","feminine-neuter-plural":"foliolate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foliolat","error-unrecognized-form-feminine-indefinite-singular":"foliolată","error-unrecognized-form-indefinite-masculine-plural":"foliolați","error-unrecognized-form-feminine-indefinite-neuter-plural":"foliolate","definite-error-unrecognized-form-masculine-neuter-singular":"foliolatul","definite-error-unrecognized-form-feminine-singular":"foliolata","definite-error-unrecognized-form-masculine-plural":"foliolații","definite-error-unrecognized-form-feminine-neuter-plural":"foliolatele"}},{"word":"foliu","pos":"noun","definitions":["folium"],"forms":{"plural":"folii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foliu","accusative-definite-nominative-singular":"foliul","accusative-indefinite-nominative-plural":"folii","accusative-definite-nominative-plural":"foliile","dative-genitive-indefinite-singular":"foliu","dative-definite-genitive-singular":"foliului","dative-genitive-indefinite-plural":"folii","dative-definite-genitive-plural":"foliilor","singular-vocative":"foliule","plural-vocative":"foliilor"}},{"word":"folium","pos":"noun","definitions":["folium"],"forms":{"plural":"foliumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"folium","accusative-definite-nominative-singular":"foliumul","accusative-indefinite-nominative-plural":"foliumuri","accusative-definite-nominative-plural":"foliumurile","dative-genitive-indefinite-singular":"folium","dative-definite-genitive-singular":"foliumului","dative-genitive-indefinite-plural":"foliumuri","dative-definite-genitive-plural":"foliumurilor","singular-vocative":"foliumule","plural-vocative":"foliumurilor"}},{"word":"folk","pos":"noun","definitions":["folk music"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"folk","accusative-definite-nominative":"folkul","dative-genitive-indefinite":"folk","dative-definite-genitive":"folkului","vocative":"folkule"}},{"word":"folkist","pos":"noun","definitions":["folk music singer"],"forms":{"plural":"folkiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"folkist","accusative-definite-nominative-singular":"folkistul","accusative-indefinite-nominative-plural":"folkisti","accusative-definite-nominative-plural":"folkistii","dative-genitive-indefinite-singular":"folkist","dative-definite-genitive-singular":"folkistului","dative-genitive-indefinite-plural":"folkisti","dative-definite-genitive-plural":"folkistilor","singular-vocative":"folkistule","plural-vocative":"folkistilor"}},{"word":"folkistă","pos":"noun","definitions":["female equivalent of folkist"],"forms":{"plural":"folkiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"folkistă","accusative-definite-nominative-singular":"folkista","accusative-indefinite-nominative-plural":"folkiste","accusative-definite-nominative-plural":"folkistele","dative-genitive-indefinite-singular":"folkiste","dative-definite-genitive-singular":"folkistei","dative-genitive-indefinite-plural":"folkiste","dative-definite-genitive-plural":"folkistelor","singular-vocative":"folkistă","plural-vocative":"folkistelor"}},{"word":"folomocar","pos":"noun","definitions":["arsonist, incendiary"],"forms":{"plural":"folomocari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"folomocar","accusative-definite-nominative-singular":"folomocarul","accusative-indefinite-nominative-plural":"folomocari","accusative-definite-nominative-plural":"folomocarii","dative-genitive-indefinite-singular":"folomocar","dative-definite-genitive-singular":"folomocarului","dative-genitive-indefinite-plural":"folomocari","dative-definite-genitive-plural":"folomocarilor","singular-vocative":"folomocarule","plural-vocative":"folomocarilor"}},{"word":"folos","pos":"noun","definitions":["profit","utility"],"forms":{"plural":"foloase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"folos","accusative-definite-nominative-singular":"folosul","accusative-indefinite-nominative-plural":"foloase","accusative-definite-nominative-plural":"foloasele","dative-genitive-indefinite-singular":"folos","dative-definite-genitive-singular":"folosului","dative-genitive-indefinite-plural":"foloase","dative-definite-genitive-plural":"foloaselor","singular-vocative":"folosule","plural-vocative":"foloaselor"}},{"word":"folosea","pos":"verb","definitions":["third-person singular imperfect indicative of folosi"],"pronunciation":"[foloˈse̯a]"},{"word":"foloseai","pos":"verb","definitions":["second-person singular imperfect indicative of folosi"],"pronunciation":"[foloˈse̯aj]"},{"word":"foloseam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of folosi"],"pronunciation":"[foloˈse̯am]"},{"word":"folosească","pos":"verb","definitions":["third-person singular/plural present subjunctive of folosi"],"pronunciation":"[foloˈse̯askə]"},{"word":"foloseați","pos":"verb","definitions":["second-person plural imperfect indicative of folosi"],"pronunciation":"[foloˈse̯atsʲ]"},{"word":"foloseau","pos":"verb","definitions":["third-person plural imperfect indicative of folosi"],"pronunciation":"[foloˈse̯aw]"},{"word":"folosesc","pos":"verb","definitions":["inflection of folosi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[foloˈsesk]"},{"word":"folosește","pos":"verb","definitions":["inflection of folosi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[foloˈseʃte]"},{"word":"folosești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of folosi"],"pronunciation":"[foloˈseʃtʲ]"},{"word":"folosi","pos":"verb","definitions":["to use, employ","to serve","to be of use"],"pronunciation":"/foloˈsi/","examples":[{"ro":"a nu folosi la nimic","en":"to be of no use"}],"forms":{"canonical":"a folosi 4th conjugation","present-singular-third-person":"folosește","participle-past":"folosit","subjunctive-third-person":"folosească","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a folosi","gerund":"folosind","first-person-indicative-present-singular":"folosesc","indicative-present-second-person-singular":"folosești","indicative-present-singular-third-person":"folosește","first-person-indicative-plural-present":"folosim","indicative-plural-present-second-person":"folosiți","indicative-plural-present-third-person":"folosesc","first-person-imperfect-indicative-singular":"foloseam","imperfect-indicative-second-person-singular":"foloseai","imperfect-indicative-singular-third-person":"folosea","first-person-imperfect-indicative-plural":"foloseam","imperfect-indicative-plural-second-person":"foloseați","imperfect-indicative-plural-third-person":"foloseau","first-person-indicative-perfect-singular":"folosii","indicative-perfect-second-person-singular":"folosiși","indicative-perfect-singular-third-person":"folosi","first-person-indicative-perfect-plural":"folosirăm","indicative-perfect-plural-second-person":"folosirăți","indicative-perfect-plural-third-person":"folosiră","first-person-indicative-pluperfect-singular":"folosisem","indicative-pluperfect-second-person-singular":"folosiseși","indicative-pluperfect-singular-third-person":"folosise","first-person-indicative-pluperfect-plural":"folosiserăm","indicative-pluperfect-plural-second-person":"folosiserăți","indicative-pluperfect-plural-third-person":"folosiseră","first-person-present-singular-subjunctive":"să folosesc","present-second-person-singular-subjunctive":"să folosești","present-singular-subjunctive-third-person":"să folosească","first-person-plural-present-subjunctive":"să folosim","plural-present-second-person-subjunctive":"să folosiți","plural-present-subjunctive-third-person":"să folosească","imperative-second-person-singular":"folosește","imperative-plural-second-person":"folosiți","imperative-negative-second-person-singular":"nu folosi","imperative-negative-plural-second-person":"nu folosiți","alternative":"фолоси"}},{"word":"folosii","pos":"verb","definitions":["first-person singular simple perfect indicative of folosi"],"pronunciation":"[foloˈsiː]","forms":{"canonical":"folosíi"}},{"word":"folosim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of folosi"],"pronunciation":"[foloˈsim]","forms":{"canonical":"folosím"}},{"word":"folosind","pos":"verb","definitions":["gerund of folosi"],"pronunciation":"[foloˈsind]"},{"word":"folosință","pos":"noun","definitions":["use","benefit. advantage"],"pronunciation":"/fo.loˈsin.t͡sə/","forms":{"plural":"folosințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"folosință","accusative-definite-nominative-singular":"folosința","accusative-indefinite-nominative-plural":"folosințe","accusative-definite-nominative-plural":"folosințele","dative-genitive-indefinite-singular":"folosințe","dative-definite-genitive-singular":"folosinței","dative-genitive-indefinite-plural":"folosințe","dative-definite-genitive-plural":"folosințelor","singular-vocative":"folosință","plural-vocative":"folosințelor"}},{"word":"folosiră","pos":"verb","definitions":["third-person plural simple perfect indicative of folosi"],"pronunciation":"[foloˈsirə]","forms":{"canonical":"folosíră"}},{"word":"folosirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of folosi"],"pronunciation":"[foloˈsirəm]","forms":{"canonical":"folosírăm"}},{"word":"folosirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of folosi"],"pronunciation":"[foloˈsirətsʲ]","forms":{"canonical":"folosírăți"}},{"word":"folosire","pos":"noun","definitions":["use"],"forms":{"plural":"folosiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"folosire","accusative-definite-nominative-singular":"folosirea","accusative-indefinite-nominative-plural":"folosiri","accusative-definite-nominative-plural":"folosirile","dative-genitive-indefinite-singular":"folosiri","dative-definite-genitive-singular":"folosirii","dative-genitive-indefinite-plural":"folosiri","dative-definite-genitive-plural":"folosirilor","singular-vocative":"folosire","plural-vocative":"folosirilor"}},{"word":"folosise","pos":"verb","definitions":["third-person singular pluperfect indicative of folosi"],"pronunciation":"[foloˈsise]","forms":{"canonical":"folosíse"}},{"word":"folosisem","pos":"verb","definitions":["first-person singular pluperfect indicative of folosi"],"pronunciation":"[foloˈsisem]","forms":{"canonical":"folosísem"}},{"word":"folosiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of folosi"],"pronunciation":"[foloˈsiserə]","forms":{"canonical":"folosíseră"}},{"word":"folosiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of folosi"],"pronunciation":"[foloˈsiserəm]","forms":{"canonical":"folosíserăm"}},{"word":"folosiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of folosi"],"pronunciation":"[foloˈsiserətsʲ]","forms":{"canonical":"folosíserăți"}},{"word":"folosiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of folosi"],"pronunciation":"[foloˈsiseʃʲ]","forms":{"canonical":"folosíseși"}},{"word":"folosiși","pos":"verb","definitions":["second-person singular simple perfect indicative of folosi"],"pronunciation":"/fo.loˈsiʃʲ/","forms":{"canonical":"folosíși"}},{"word":"folosit","pos":"adj","definitions":["used"],"pronunciation":"[foloˈsit]","forms":{"feminine-singular":"folosită","masculine-plural":"folosiți","feminine-neuter-plural":"folosite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"folosit","error-unrecognized-form-feminine-indefinite-singular":"folosită","error-unrecognized-form-indefinite-masculine-plural":"folosiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"folosite","definite-error-unrecognized-form-masculine-neuter-singular":"folositul","definite-error-unrecognized-form-feminine-singular":"folosita","definite-error-unrecognized-form-masculine-plural":"folosiții","definite-error-unrecognized-form-feminine-neuter-plural":"folositele"}},{"word":"folosit","pos":"verb","definitions":["past participle of folosi"],"pronunciation":"[foloˈsit]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"folosit","error-unrecognized-form-feminine-indefinite-singular":"folosită","error-unrecognized-form-indefinite-masculine-plural":"folosiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"folosite","definite-error-unrecognized-form-masculine-neuter-singular":"folositul","definite-error-unrecognized-form-feminine-singular":"folosita","definite-error-unrecognized-form-masculine-plural":"folosiții","definite-error-unrecognized-form-feminine-neuter-plural":"folositele"}},{"word":"folosita","pos":"adj","definitions":["definite nominative/accusative feminine singular of folosit"],"pronunciation":"[foloˈsita]"},{"word":"folosită","pos":"adj","definitions":["feminine singular of folosit"],"pronunciation":"[foloˈsitə]"},{"word":"folosite","pos":"adj","definitions":["feminine/neuter plural of folosit"],"pronunciation":"[foloˈsite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"folosíte"}},{"word":"folositei","pos":"adj","definitions":["definite genitive/dative feminine singular of folosit"],"pronunciation":"[foloˈsitej]"},{"word":"folositele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of folosit"],"pronunciation":"[foloˈsitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"folosítele"}},{"word":"folositelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of folosit"],"pronunciation":"[foloˈsitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"folosítelor"}},{"word":"folosiți","pos":"adj","definitions":["masculine plural of folosit"],"pronunciation":"[foloˈsit͡sʲ]","forms":{"canonical":"folosíți"}},{"word":"folosiți","pos":"verb","definitions":["inflection of folosi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[foloˈsit͡sʲ]","forms":{"canonical":"folosíți"}},{"word":"folosiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of folosit"],"pronunciation":"[foloˈsit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"folosíții"}},{"word":"folosiților","pos":"adj","definitions":["definite genitive/dative masculine plural of folosit"],"pronunciation":"[foloˈsit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"folosíților"}},{"word":"folositor","pos":"adj","definitions":["useful"],"pronunciation":"[fo.lo.siˈtor]","forms":{"feminine-singular":"folositoare","masculine-plural":"folositori","feminine-neuter-plural":"folositoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"folositor","error-unrecognized-form-feminine-indefinite-singular":"folositoare","error-unrecognized-form-indefinite-masculine-plural":"folositori","error-unrecognized-form-feminine-indefinite-neuter-plural":"folositoare","definite-error-unrecognized-form-masculine-neuter-singular":"folositorul","definite-error-unrecognized-form-feminine-singular":"folositoarea","definite-error-unrecognized-form-masculine-plural":"folositorii","definite-error-unrecognized-form-feminine-neuter-plural":"folositoarele"}},{"word":"folositul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of folosit"],"pronunciation":"[foloˈsitul]","gender":"m","forms":{"canonical-masculine-neuter":"folosítul"}},{"word":"folositului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of folosit"],"pronunciation":"[foloˈsituluj]","gender":"m","forms":{"canonical-masculine-neuter":"folosítului"}},{"word":"Folt","pos":"name","definitions":["a village in Rapoltu Mare, Hunedoara County, Romania"],"gender":"m"},{"word":"folt","pos":"noun","definitions":["patch","rag"],"forms":{"plural":"folturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"folt","accusative-definite-nominative-singular":"foltul","accusative-indefinite-nominative-plural":"folturi","accusative-definite-nominative-plural":"folturile","dative-genitive-indefinite-singular":"folt","dative-definite-genitive-singular":"foltului","dative-genitive-indefinite-plural":"folturi","dative-definite-genitive-plural":"folturilor","singular-vocative":"foltule","plural-vocative":"folturilor"}},{"word":"Foltești","pos":"name","definitions":["a commune of Galați County, Romania","a village in Foltești, Galați County, Romania"],"gender":"m"},{"word":"foluț","pos":"noun","definitions":["diminutive of foale"],"forms":{"plural":"foluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foluț","accusative-definite-nominative-singular":"foluțul","accusative-indefinite-nominative-plural":"foluțe","accusative-definite-nominative-plural":"foluțele","dative-genitive-indefinite-singular":"foluț","dative-definite-genitive-singular":"foluțului","dative-genitive-indefinite-plural":"foluțe","dative-definite-genitive-plural":"foluțelor","singular-vocative":"foluțule","plural-vocative":"foluțelor"}},{"word":"fomentație","pos":"noun","definitions":["fomentation"],"forms":{"plural":"fomentații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fomentație","accusative-definite-nominative-singular":"fomentația","accusative-indefinite-nominative-plural":"fomentații","accusative-definite-nominative-plural":"fomentațiile","dative-genitive-indefinite-singular":"fomentații","dative-definite-genitive-singular":"fomentației","dative-genitive-indefinite-plural":"fomentații","dative-definite-genitive-plural":"fomentațiilor","singular-vocative":"fomentație","plural-vocative":"fomentațiilor"}},{"word":"Fometescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fometescu"}},{"word":"fometos","pos":"adj","definitions":["hungry"],"forms":{"feminine-singular":"fometoasă","masculine-plural":"fometoși","feminine-neuter-plural":"fometoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fometos","error-unrecognized-form-feminine-indefinite-singular":"fometoasă","error-unrecognized-form-indefinite-masculine-plural":"fometoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fometoase","definite-error-unrecognized-form-masculine-neuter-singular":"fometosul","definite-error-unrecognized-form-feminine-singular":"fometoasa","definite-error-unrecognized-form-masculine-plural":"fometoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fometoasele"}},{"word":"fon","pos":"noun","definitions":["phon"],"forms":{"plural":"foni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fon","accusative-definite-nominative-singular":"fonul","accusative-indefinite-nominative-plural":"foni","accusative-definite-nominative-plural":"fonii","dative-genitive-indefinite-singular":"fon","dative-definite-genitive-singular":"fonului","dative-genitive-indefinite-plural":"foni","dative-definite-genitive-plural":"fonilor","singular-vocative":"fonule","plural-vocative":"fonilor"}},{"word":"fonastenie","pos":"noun","definitions":["vocal fatigue"],"forms":{"plural":"fonastenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonastenie","accusative-definite-nominative-singular":"fonastenia","accusative-indefinite-nominative-plural":"fonastenii","accusative-definite-nominative-plural":"fonasteniile","dative-genitive-indefinite-singular":"fonastenii","dative-definite-genitive-singular":"fonasteniei","dative-genitive-indefinite-plural":"fonastenii","dative-definite-genitive-plural":"fonasteniilor","singular-vocative":"fonastenie","plural-vocative":"fonasteniilor"}},{"word":"fonațiune","pos":"noun","definitions":["phonation"],"forms":{"plural":"fonațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fonațiune","accusative-definite-nominative-singular":"fonațiunea","accusative-indefinite-nominative-plural":"fonațiuni","accusative-definite-nominative-plural":"fonațiunile","dative-genitive-indefinite-singular":"fonațiuni","dative-definite-genitive-singular":"fonațiunii","dative-genitive-indefinite-plural":"fonațiuni","dative-definite-genitive-plural":"fonațiunilor","singular-vocative":"fonațiune","plural-vocative":"fonațiunilor"}},{"word":"fonator","pos":"adj","definitions":["phonatory"],"forms":{"feminine-singular":"fonatoare","masculine-plural":"fonatori","feminine-neuter-plural":"fonatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonator","error-unrecognized-form-feminine-indefinite-singular":"fonatoare","error-unrecognized-form-indefinite-masculine-plural":"fonatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonatoare","definite-error-unrecognized-form-masculine-neuter-singular":"fonatorul","definite-error-unrecognized-form-feminine-singular":"fonatoarea","definite-error-unrecognized-form-masculine-plural":"fonatorii","definite-error-unrecognized-form-feminine-neuter-plural":"fonatoarele"}},{"word":"foncieră","pos":"noun","definitions":["land tax"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"foncieră","accusative-definite-nominative":"fonciera","dative-genitive-indefinite":"fonciere","dative-definite-genitive":"foncierei","vocative":"foncieră"}},{"word":"fond","pos":"noun","definitions":["fund","background","content, substance, essence"],"pronunciation":"/fond/","forms":{"plural":"fonduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fond","accusative-definite-nominative-singular":"fondul","accusative-indefinite-nominative-plural":"fonduri","accusative-definite-nominative-plural":"fondurile","dative-genitive-indefinite-singular":"fond","dative-definite-genitive-singular":"fondului","dative-genitive-indefinite-plural":"fonduri","dative-definite-genitive-plural":"fondurilor","singular-vocative":"fondule","plural-vocative":"fondurilor"}},{"word":"fond de ten","pos":"noun","definitions":["foundation"],"forms":{"plural":"fonduri de ten"}},{"word":"fonda","pos":"verb","definitions":["to found, to establish"],"forms":{"canonical":"a fonda 1st conjugation","present-singular-third-person":"fondează","participle-past":"fondat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fonda","gerund":"fondând","first-person-indicative-present-singular":"fondez","indicative-present-second-person-singular":"fondezi","indicative-present-singular-third-person":"fondează","first-person-indicative-plural-present":"fondăm","indicative-plural-present-second-person":"fondați","indicative-plural-present-third-person":"fondează","first-person-imperfect-indicative-singular":"fondam","imperfect-indicative-second-person-singular":"fondai","imperfect-indicative-singular-third-person":"fonda","first-person-imperfect-indicative-plural":"fondam","imperfect-indicative-plural-second-person":"fondați","imperfect-indicative-plural-third-person":"fondau","first-person-indicative-perfect-singular":"fondai","indicative-perfect-second-person-singular":"fondași","indicative-perfect-singular-third-person":"fondă","first-person-indicative-perfect-plural":"fondarăm","indicative-perfect-plural-second-person":"fondarăți","indicative-perfect-plural-third-person":"fondară","first-person-indicative-pluperfect-singular":"fondasem","indicative-pluperfect-second-person-singular":"fondaseși","indicative-pluperfect-singular-third-person":"fondase","first-person-indicative-pluperfect-plural":"fondaserăm","indicative-pluperfect-plural-second-person":"fondaserăți","indicative-pluperfect-plural-third-person":"fondaseră","first-person-present-singular-subjunctive":"să fondez","present-second-person-singular-subjunctive":"să fondezi","present-singular-subjunctive-third-person":"să fondeze","first-person-plural-present-subjunctive":"să fondăm","plural-present-second-person-subjunctive":"să fondați","plural-present-subjunctive-third-person":"să fondeze","imperative-second-person-singular":"fondează","imperative-plural-second-person":"fondați","imperative-negative-second-person-singular":"nu fonda","imperative-negative-plural-second-person":"nu fondați"}},{"word":"fondaco","pos":"noun","definitions":["fondaco"],"forms":{"plural":"fondacouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fondaco","accusative-definite-nominative-singular":"fondacoul","accusative-indefinite-nominative-plural":"fondacouri","accusative-definite-nominative-plural":"fondacourile","dative-genitive-indefinite-singular":"fondaco","dative-definite-genitive-singular":"fondacoului","dative-genitive-indefinite-plural":"fondacouri","dative-definite-genitive-plural":"fondacourilor","singular-vocative":"fondacoule","plural-vocative":"fondacourilor"}},{"word":"fondal","pos":"noun","definitions":["alternative form of fundal"],"forms":{"plural":"fondaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fondal","accusative-definite-nominative-singular":"fondalul","accusative-indefinite-nominative-plural":"fondaluri","accusative-definite-nominative-plural":"fondalurile","dative-genitive-indefinite-singular":"fondal","dative-definite-genitive-singular":"fondalului","dative-genitive-indefinite-plural":"fondaluri","dative-definite-genitive-plural":"fondalurilor","singular-vocative":"fondalule","plural-vocative":"fondalurilor"}},{"word":"fondant","pos":"adj","definitions":["melting"],"forms":{"feminine-singular":"fondantă","masculine-plural":"fondanți","feminine-neuter-plural":"fondante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fondant","error-unrecognized-form-feminine-indefinite-singular":"fondantă","error-unrecognized-form-indefinite-masculine-plural":"fondanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fondante","definite-error-unrecognized-form-masculine-neuter-singular":"fondantul","definite-error-unrecognized-form-feminine-singular":"fondanta","definite-error-unrecognized-form-masculine-plural":"fondanții","definite-error-unrecognized-form-feminine-neuter-plural":"fondantele"}},{"word":"fondantă","pos":"noun","definitions":["fondant (candy)"],"forms":{"plural":"fondante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fondantă","accusative-definite-nominative-singular":"fondanta","accusative-indefinite-nominative-plural":"fondante","accusative-definite-nominative-plural":"fondantele","dative-genitive-indefinite-singular":"fondante","dative-definite-genitive-singular":"fondantei","dative-genitive-indefinite-plural":"fondante","dative-definite-genitive-plural":"fondantelor","singular-vocative":"fondantă","plural-vocative":"fondantelor"}},{"word":"fondare","pos":"noun","definitions":["foundation"],"forms":{"plural":"fondări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fondare","accusative-definite-nominative-singular":"fondarea","accusative-indefinite-nominative-plural":"fondări","accusative-definite-nominative-plural":"fondările","dative-genitive-indefinite-singular":"fondări","dative-definite-genitive-singular":"fondării","dative-genitive-indefinite-plural":"fondări","dative-definite-genitive-plural":"fondărilor","singular-vocative":"fondare","plural-vocative":"fondărilor"}},{"word":"fondat","pos":"adj","definitions":["alternative form of fundat"],"forms":{"feminine-singular":"fondată","masculine-plural":"fondați","feminine-neuter-plural":"fondate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fondat","error-unrecognized-form-feminine-indefinite-singular":"fondată","error-unrecognized-form-indefinite-masculine-plural":"fondați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fondate","definite-error-unrecognized-form-masculine-neuter-singular":"fondatul","definite-error-unrecognized-form-feminine-singular":"fondata","definite-error-unrecognized-form-masculine-plural":"fondații","definite-error-unrecognized-form-feminine-neuter-plural":"fondatele"}},{"word":"fondatoare","pos":"noun","definitions":["female equivalent of fondator"],"forms":{"plural":"fondatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fondatoare","accusative-definite-nominative-singular":"fondatoarea","accusative-indefinite-nominative-plural":"fondatoare","accusative-definite-nominative-plural":"fondatoarele","dative-genitive-indefinite-singular":"fondatoare","dative-definite-genitive-singular":"fondatoarei","dative-genitive-indefinite-plural":"fondatoare","dative-definite-genitive-plural":"fondatoarelor","singular-vocative":"fondatoare","plural-vocative":"fondatoarelor"}},{"word":"fondator","pos":"noun","definitions":["founder"],"pronunciation":"/ˌfon.daˈtor/","forms":{"plural":"fondatori","alternative":"fundator"}},{"word":"fondator","pos":"adj","definitions":["founding"],"pronunciation":"/ˌfon.daˈtor/","forms":{"feminine-singular":"fondatoare","masculine-plural":"fondatori","feminine-neuter-plural":"fondatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fondator","error-unrecognized-form-feminine-indefinite-singular":"fondatoare","error-unrecognized-form-indefinite-masculine-plural":"fondatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fondatoare","definite-error-unrecognized-form-masculine-neuter-singular":"fondatorul","definite-error-unrecognized-form-feminine-singular":"fondatoarea","definite-error-unrecognized-form-masculine-plural":"fondatorii","definite-error-unrecognized-form-feminine-neuter-plural":"fondatoarele","alternative":"fundator"}},{"word":"fonderie","pos":"noun","definitions":["foundry"],"forms":{"plural":"fonderii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonderie","accusative-definite-nominative-singular":"fonderia","accusative-indefinite-nominative-plural":"fonderii","accusative-definite-nominative-plural":"fonderiile","dative-genitive-indefinite-singular":"fonderii","dative-definite-genitive-singular":"fonderiei","dative-genitive-indefinite-plural":"fonderii","dative-definite-genitive-plural":"fonderiilor","singular-vocative":"fonderie","plural-vocative":"fonderiilor"}},{"word":"fondistă","pos":"noun","definitions":["female equivalent of fondist"],"forms":{"plural":"fondiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fondistă","accusative-definite-nominative-singular":"fondista","accusative-indefinite-nominative-plural":"fondiste","accusative-definite-nominative-plural":"fondistele","dative-genitive-indefinite-singular":"fondiste","dative-definite-genitive-singular":"fondistei","dative-genitive-indefinite-plural":"fondiste","dative-definite-genitive-plural":"fondistelor","singular-vocative":"fondistă","plural-vocative":"fondistelor"}},{"word":"fondu","pos":"noun","definitions":["fade"],"forms":{"plural":"fonduuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fondu","accusative-definite-nominative-singular":"fonduul","accusative-indefinite-nominative-plural":"fonduuri","accusative-definite-nominative-plural":"fonduurile","dative-genitive-indefinite-singular":"fondu","dative-definite-genitive-singular":"fonduului","dative-genitive-indefinite-plural":"fonduuri","dative-definite-genitive-plural":"fonduurilor","singular-vocative":"fonduule","plural-vocative":"fonduurilor"}},{"word":"fondue","pos":"noun","definitions":["fondue (dish)"],"forms":{"plural":"fondue"}},{"word":"fonduri","pos":"noun","definitions":["plural of fond"],"pronunciation":"/ˈfon.durʲ/"},{"word":"fonem","pos":"noun","definitions":["phoneme"],"pronunciation":"/foˈnem/","forms":{"plural":"foneme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonem","accusative-definite-nominative-singular":"fonemul","accusative-indefinite-nominative-plural":"foneme","accusative-definite-nominative-plural":"fonemele","dative-genitive-indefinite-singular":"fonem","dative-definite-genitive-singular":"fonemului","dative-genitive-indefinite-plural":"foneme","dative-definite-genitive-plural":"fonemelor","singular-vocative":"fonemule","plural-vocative":"fonemelor"}},{"word":"fonematic","pos":"adj","definitions":["phonemic"],"forms":{"feminine-singular":"fonematică","masculine-plural":"fonematici","feminine-neuter-plural":"fonematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonematic","error-unrecognized-form-feminine-indefinite-singular":"fonematică","error-unrecognized-form-indefinite-masculine-plural":"fonematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonematice","definite-error-unrecognized-form-masculine-neuter-singular":"fonematicul","definite-error-unrecognized-form-feminine-singular":"fonematica","definite-error-unrecognized-form-masculine-plural":"fonematicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonematicele"}},{"word":"fonemic","pos":"adj","definitions":["phonemic"],"forms":{"feminine-singular":"fonemică","masculine-plural":"fonemici","feminine-neuter-plural":"fonemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonemic","error-unrecognized-form-feminine-indefinite-singular":"fonemică","error-unrecognized-form-indefinite-masculine-plural":"fonemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonemice","definite-error-unrecognized-form-masculine-neuter-singular":"fonemicul","definite-error-unrecognized-form-feminine-singular":"fonemica","definite-error-unrecognized-form-masculine-plural":"fonemicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonemicele"}},{"word":"fonendoscop","pos":"noun","definitions":["phonendoscope"],"forms":{"plural":"fonendoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonendoscop","accusative-definite-nominative-singular":"fonendoscopul","accusative-indefinite-nominative-plural":"fonendoscoape","accusative-definite-nominative-plural":"fonendoscoapele","dative-genitive-indefinite-singular":"fonendoscop","dative-definite-genitive-singular":"fonendoscopului","dative-genitive-indefinite-plural":"fonendoscoape","dative-definite-genitive-plural":"fonendoscoapelor","singular-vocative":"fonendoscopule","plural-vocative":"fonendoscoapelor"}},{"word":"fonetic","pos":"adj","definitions":["phonetic"],"pronunciation":"/foˈne.tik/","forms":{"feminine-singular":"fonetică","masculine-plural":"fonetici","feminine-neuter-plural":"fonetice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonetic","error-unrecognized-form-feminine-indefinite-singular":"fonetică","error-unrecognized-form-indefinite-masculine-plural":"fonetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonetice","definite-error-unrecognized-form-masculine-neuter-singular":"foneticul","definite-error-unrecognized-form-feminine-singular":"fonetica","definite-error-unrecognized-form-masculine-plural":"foneticii","definite-error-unrecognized-form-feminine-neuter-plural":"foneticele"}},{"word":"fonetica","pos":"adj","definitions":["definite nominative/accusative feminine singular of fonetic"],"pronunciation":"[foˈne.ti.ka]"},{"word":"fonetică","pos":"noun","definitions":["phonetics"]},{"word":"fonetici","pos":"adj","definitions":["nominative/accusative masculine plural of fonetic"],"pronunciation":"[foˈne.tit͡ʃʲ]"},{"word":"fonetician","pos":"noun","definitions":["phonetician"],"forms":{"plural":"foneticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fonetician","accusative-definite-nominative-singular":"foneticianul","accusative-indefinite-nominative-plural":"foneticieni","accusative-definite-nominative-plural":"foneticienii","dative-genitive-indefinite-singular":"fonetician","dative-definite-genitive-singular":"foneticianului","dative-genitive-indefinite-plural":"foneticieni","dative-definite-genitive-plural":"foneticienilor","singular-vocative":"foneticianule","plural-vocative":"foneticienilor"}},{"word":"foneticiană","pos":"noun","definitions":["female equivalent of fonetician"],"forms":{"plural":"foneticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foneticiană","accusative-definite-nominative-singular":"foneticiana","accusative-indefinite-nominative-plural":"foneticiene","accusative-definite-nominative-plural":"foneticienele","dative-genitive-indefinite-singular":"foneticiene","dative-definite-genitive-singular":"foneticienei","dative-genitive-indefinite-plural":"foneticiene","dative-definite-genitive-plural":"foneticienelor","singular-vocative":"foneticiană","plural-vocative":"foneticienelor"}},{"word":"fonetism","pos":"noun","definitions":["phonetics"],"forms":{"plural":"fonetisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonetism","accusative-definite-nominative-singular":"fonetismul","accusative-indefinite-nominative-plural":"fonetisme","accusative-definite-nominative-plural":"fonetismele","dative-genitive-indefinite-singular":"fonetism","dative-definite-genitive-singular":"fonetismului","dative-genitive-indefinite-plural":"fonetisme","dative-definite-genitive-plural":"fonetismelor","singular-vocative":"fonetismule","plural-vocative":"fonetismelor"}},{"word":"fonetist","pos":"noun","definitions":["phonetist"],"forms":{"plural":"fonetiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fonetist","accusative-definite-nominative-singular":"fonetistul","accusative-indefinite-nominative-plural":"fonetiști","accusative-definite-nominative-plural":"fonetiștii","dative-genitive-indefinite-singular":"fonetist","dative-definite-genitive-singular":"fonetistului","dative-genitive-indefinite-plural":"fonetiști","dative-definite-genitive-plural":"fonetiștilor","singular-vocative":"fonetistule","plural-vocative":"fonetiștilor"}},{"word":"fonetistă","pos":"noun","definitions":["female equivalent of fonetist"],"forms":{"plural":"fonetiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fonetistă","accusative-definite-nominative-singular":"fonetista","accusative-indefinite-nominative-plural":"fonetiste","accusative-definite-nominative-plural":"fonetistele","dative-genitive-indefinite-singular":"fonetiste","dative-definite-genitive-singular":"fonetistei","dative-genitive-indefinite-plural":"fonetiste","dative-definite-genitive-plural":"fonetistelor","singular-vocative":"fonetistă","plural-vocative":"fonetistelor"}},{"word":"fonfleu","pos":"noun","definitions":["entrée","fake news"],"forms":{"plural":"fonfleuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonfleu","accusative-definite-nominative-singular":"fonfleuul","accusative-indefinite-nominative-plural":"fonfleuri","accusative-definite-nominative-plural":"fonfleurile","dative-genitive-indefinite-singular":"fonfleu","dative-definite-genitive-singular":"fonfleuului","dative-genitive-indefinite-plural":"fonfleuri","dative-definite-genitive-plural":"fonfleurilor","singular-vocative":"fonfleuule","plural-vocative":"fonfleurilor"}},{"word":"foniatră","pos":"noun","definitions":["female equivalent of foniatru"],"forms":{"plural":"foniatre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foniatră","accusative-definite-nominative-singular":"foniatra","accusative-indefinite-nominative-plural":"foniatre","accusative-definite-nominative-plural":"foniatrele","dative-genitive-indefinite-singular":"foniatre","dative-definite-genitive-singular":"foniatrei","dative-genitive-indefinite-plural":"foniatre","dative-definite-genitive-plural":"foniatrelor","singular-vocative":"foniatră","plural-vocative":"foniatrelor"}},{"word":"foniatrie","pos":"noun","definitions":["phoniatrics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"foniatrie","accusative-definite-nominative":"foniatria","dative-genitive-indefinite":"foniatrii","dative-definite-genitive":"foniatriei","vocative":"foniatrie"}},{"word":"foniatru","pos":"noun","definitions":["phoniatrist"],"forms":{"plural":"foniatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foniatru","accusative-definite-nominative-singular":"foniatruul","accusative-indefinite-nominative-plural":"foniatri","accusative-definite-nominative-plural":"foniatrii","dative-genitive-indefinite-singular":"foniatru","dative-definite-genitive-singular":"foniatruului","dative-genitive-indefinite-plural":"foniatri","dative-definite-genitive-plural":"foniatrilor","singular-vocative":"foniatruule","plural-vocative":"foniatrilor"}},{"word":"fonic","pos":"adj","definitions":["phonic"],"forms":{"feminine-singular":"fonică","masculine-plural":"fonici","feminine-neuter-plural":"fonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonic","error-unrecognized-form-feminine-indefinite-singular":"fonică","error-unrecognized-form-indefinite-masculine-plural":"fonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonice","definite-error-unrecognized-form-masculine-neuter-singular":"fonicul","definite-error-unrecognized-form-feminine-singular":"fonica","definite-error-unrecognized-form-masculine-plural":"fonicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonicele"}},{"word":"fonoabsorbant","pos":"adj","definitions":["soundproof"],"forms":{"feminine-singular":"fonoabsorbantă","masculine-plural":"fonoabsorbanți","feminine-neuter-plural":"fonoabsorbante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonoabsorbant","error-unrecognized-form-feminine-indefinite-singular":"fonoabsorbantă","error-unrecognized-form-indefinite-masculine-plural":"fonoabsorbanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonoabsorbante","definite-error-unrecognized-form-masculine-neuter-singular":"fonoabsorbantul","definite-error-unrecognized-form-feminine-singular":"fonoabsorbanta","definite-error-unrecognized-form-masculine-plural":"fonoabsorbanții","definite-error-unrecognized-form-feminine-neuter-plural":"fonoabsorbantele"}},{"word":"fonoaudiologie","pos":"noun","definitions":["phonoaudiology, speech therapy"],"forms":{"plural":"fonoaudiologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonoaudiologie","accusative-definite-nominative-singular":"fonoaudiologia","accusative-indefinite-nominative-plural":"fonoaudiologii","accusative-definite-nominative-plural":"fonoaudiologiile","dative-genitive-indefinite-singular":"fonoaudiologii","dative-definite-genitive-singular":"fonoaudiologiei","dative-genitive-indefinite-plural":"fonoaudiologii","dative-definite-genitive-plural":"fonoaudiologiilor","singular-vocative":"fonoaudiologie","plural-vocative":"fonoaudiologiilor"}},{"word":"fonocardiograf","pos":"noun","definitions":["phonocardiograph"],"forms":{"plural":"fonicardiografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonocardiograf","accusative-definite-nominative-singular":"fonocardiograful","accusative-indefinite-nominative-plural":"fonocardiografe","accusative-definite-nominative-plural":"fonocardiografele","dative-genitive-indefinite-singular":"fonocardiograf","dative-definite-genitive-singular":"fonocardiografului","dative-genitive-indefinite-plural":"fonocardiografe","dative-definite-genitive-plural":"fonocardiografelor","singular-vocative":"fonocardiografule","plural-vocative":"fonocardiografelor"}},{"word":"fonocardiografie","pos":"noun","definitions":["phonocardiography"],"forms":{"plural":"fonocardiografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonocardiografie","accusative-definite-nominative-singular":"fonocardiografia","accusative-indefinite-nominative-plural":"fonocardiografii","accusative-definite-nominative-plural":"fonocardiografiile","dative-genitive-indefinite-singular":"fonocardiografii","dative-definite-genitive-singular":"fonocardiografiei","dative-genitive-indefinite-plural":"fonocardiografii","dative-definite-genitive-plural":"fonocardiografiilor","singular-vocative":"fonocardiografie","plural-vocative":"fonocardiografiilor"}},{"word":"fonocardiogramă","pos":"noun","definitions":["phonocardiogram"],"forms":{"plural":"fonocardiograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fonocardiogramă","accusative-definite-nominative-singular":"fonocardiograma","accusative-indefinite-nominative-plural":"fonocardiograme","accusative-definite-nominative-plural":"fonocardiogramele","dative-genitive-indefinite-singular":"fonocardiograme","dative-definite-genitive-singular":"fonocardiogramei","dative-genitive-indefinite-plural":"fonocardiograme","dative-definite-genitive-plural":"fonocardiogramelor","singular-vocative":"fonocardiogramă","plural-vocative":"fonocardiogramelor"}},{"word":"fonogenic","pos":"adj","definitions":["phonogenic"],"forms":{"feminine-singular":"fonogenică","masculine-plural":"fonogenici","feminine-neuter-plural":"fonogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonogenic","error-unrecognized-form-feminine-indefinite-singular":"fonogenică","error-unrecognized-form-indefinite-masculine-plural":"fonogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonogenice","definite-error-unrecognized-form-masculine-neuter-singular":"fonogenicul","definite-error-unrecognized-form-feminine-singular":"fonogenica","definite-error-unrecognized-form-masculine-plural":"fonogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonogenicele"}},{"word":"fonoghid","pos":"noun","definitions":["audio guide"],"forms":{"plural":"fonoghiduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fonoghid","accusative-definite-nominative-singular":"fonoghidul","accusative-indefinite-nominative-plural":"fonoghiduri","accusative-definite-nominative-plural":"fonoghidurile","dative-genitive-indefinite-singular":"fonoghid","dative-definite-genitive-singular":"fonoghidului","dative-genitive-indefinite-plural":"fonoghiduri","dative-definite-genitive-plural":"fonoghidurilor","singular-vocative":"fonoghidule","plural-vocative":"fonoghidurilor"}},{"word":"fonograf","pos":"noun","definitions":["phonograph"],"forms":{"plural":"fonografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonograf","accusative-definite-nominative-singular":"fonograful","accusative-indefinite-nominative-plural":"fonografe","accusative-definite-nominative-plural":"fonografele","dative-genitive-indefinite-singular":"fonograf","dative-definite-genitive-singular":"fonografului","dative-genitive-indefinite-plural":"fonografe","dative-definite-genitive-plural":"fonografelor","singular-vocative":"fonografule","plural-vocative":"fonografelor"}},{"word":"fonografic","pos":"adj","definitions":["phonographic"],"forms":{"feminine-singular":"fonografică","masculine-plural":"fonografici","feminine-neuter-plural":"fonografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonografic","error-unrecognized-form-feminine-indefinite-singular":"fonografică","error-unrecognized-form-indefinite-masculine-plural":"fonografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonografice","definite-error-unrecognized-form-masculine-neuter-singular":"fonograficul","definite-error-unrecognized-form-feminine-singular":"fonografica","definite-error-unrecognized-form-masculine-plural":"fonograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fonograficele"}},{"word":"fonografie","pos":"noun","definitions":["phonography"],"forms":{"plural":"fonografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonografie","accusative-definite-nominative-singular":"fonografia","accusative-indefinite-nominative-plural":"fonografii","accusative-definite-nominative-plural":"fonografiile","dative-genitive-indefinite-singular":"fonografii","dative-definite-genitive-singular":"fonografiei","dative-genitive-indefinite-plural":"fonografii","dative-definite-genitive-plural":"fonografiilor","singular-vocative":"fonografie","plural-vocative":"fonografiilor"}},{"word":"fonogramă","pos":"noun","definitions":["phonogram"],"forms":{"plural":"fonograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fonogramă","accusative-definite-nominative-singular":"fonograma","accusative-indefinite-nominative-plural":"fonograme","accusative-definite-nominative-plural":"fonogramele","dative-genitive-indefinite-singular":"fonograme","dative-definite-genitive-singular":"fonogramei","dative-genitive-indefinite-plural":"fonograme","dative-definite-genitive-plural":"fonogramelor","singular-vocative":"fonogramă","plural-vocative":"fonogramelor"}},{"word":"fonogramic","pos":"adj","definitions":["phonogram"],"forms":{"feminine-singular":"fonogramică","masculine-plural":"fonogramici","feminine-neuter-plural":"fonogramice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonogramic","error-unrecognized-form-feminine-indefinite-singular":"fonogramică","error-unrecognized-form-indefinite-masculine-plural":"fonogramici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonogramice","definite-error-unrecognized-form-masculine-neuter-singular":"fonogramicul","definite-error-unrecognized-form-feminine-singular":"fonogramica","definite-error-unrecognized-form-masculine-plural":"fonogramicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonogramicele"}},{"word":"fonoizolare","pos":"noun","definitions":["sound insulation"],"forms":{"plural":"fonoizolări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fonoizolare","accusative-definite-nominative-singular":"fonoizolarea","accusative-indefinite-nominative-plural":"fonoizolări","accusative-definite-nominative-plural":"fonoizolările","dative-genitive-indefinite-singular":"fonoizolări","dative-definite-genitive-singular":"fonoizolării","dative-genitive-indefinite-plural":"fonoizolări","dative-definite-genitive-plural":"fonoizolărilor","singular-vocative":"fonoizolare","plural-vocative":"fonoizolărilor"}},{"word":"fonolit","pos":"noun","definitions":["phonolite"],"forms":{"plural":"fonolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonolit","accusative-definite-nominative-singular":"fonolitul","accusative-indefinite-nominative-plural":"fonolite","accusative-definite-nominative-plural":"fonolitele","dative-genitive-indefinite-singular":"fonolit","dative-definite-genitive-singular":"fonolitului","dative-genitive-indefinite-plural":"fonolite","dative-definite-genitive-plural":"fonolitelor","singular-vocative":"fonolitule","plural-vocative":"fonolitelor"}},{"word":"fonolitic","pos":"adj","definitions":["phonolitic"],"forms":{"feminine-singular":"fonolitică","masculine-plural":"fonolitici","feminine-neuter-plural":"fonolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonolitic","error-unrecognized-form-feminine-indefinite-singular":"fonolitică","error-unrecognized-form-indefinite-masculine-plural":"fonolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonolitice","definite-error-unrecognized-form-masculine-neuter-singular":"fonoliticul","definite-error-unrecognized-form-feminine-singular":"fonolitica","definite-error-unrecognized-form-masculine-plural":"fonoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"fonoliticele"}},{"word":"fonolog","pos":"noun","definitions":["phonologist"],"forms":{"plural":"fonologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fonolog","accusative-definite-nominative-singular":"fonologul","accusative-indefinite-nominative-plural":"fonologi","accusative-definite-nominative-plural":"fonologii","dative-genitive-indefinite-singular":"fonolog","dative-definite-genitive-singular":"fonologului","dative-genitive-indefinite-plural":"fonologi","dative-definite-genitive-plural":"fonologilor","singular-vocative":"fonologule","plural-vocative":"fonologilor","alternative":"фонолог"}},{"word":"fonologă","pos":"noun","definitions":["female equivalent of fonolog"],"forms":{"plural":"fonologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fonologă","accusative-definite-nominative-singular":"fonologa","accusative-indefinite-nominative-plural":"fonologe","accusative-definite-nominative-plural":"fonologele","dative-genitive-indefinite-singular":"fonologe","dative-definite-genitive-singular":"fonologei","dative-genitive-indefinite-plural":"fonologe","dative-definite-genitive-plural":"fonologelor","singular-vocative":"fonologă","plural-vocative":"fonologelor"}},{"word":"fonologia","pos":"noun","definitions":["definite nominative/accusative singular of fonologie"],"gender":"f","forms":{"alternative":"фонолоӂия"}},{"word":"fonologic","pos":"adj","definitions":["phonological"],"forms":{"feminine-singular":"fonologică","masculine-plural":"fonologici","feminine-neuter-plural":"fonologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonologic","error-unrecognized-form-feminine-indefinite-singular":"fonologică","error-unrecognized-form-indefinite-masculine-plural":"fonologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonologice","definite-error-unrecognized-form-masculine-neuter-singular":"fonologicul","definite-error-unrecognized-form-feminine-singular":"fonologica","definite-error-unrecognized-form-masculine-plural":"fonologicii","definite-error-unrecognized-form-feminine-neuter-plural":"fonologicele"}},{"word":"fonologica","pos":"adj","definitions":["definite nominative/accusative feminine singular of fonologic"],"gender":"f-s","forms":{"alternative":"фонолоӂика"}},{"word":"fonologică","pos":"adj","definitions":["nominative/accusative feminine singular of fonologic"],"gender":"f-s","forms":{"alternative":"фонолоӂикэ"}},{"word":"fonologici","pos":"adj","definitions":["nominative/accusative masculine plural of fonologic"],"gender":"m-p"},{"word":"fonologie","pos":"noun","definitions":["phonology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fonologie","accusative-definite-nominative":"fonologia","dative-genitive-indefinite":"fonologii","dative-definite-genitive":"fonologiei","vocative":"fonologie","alternative":"фонолоӂие"}},{"word":"fonometric","pos":"adj","definitions":["phonometric"],"forms":{"feminine-singular":"fonometrică","masculine-plural":"fonometrici","feminine-neuter-plural":"fonometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fonometric","error-unrecognized-form-feminine-indefinite-singular":"fonometrică","error-unrecognized-form-indefinite-masculine-plural":"fonometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fonometrice","definite-error-unrecognized-form-masculine-neuter-singular":"fonometricul","definite-error-unrecognized-form-feminine-singular":"fonometrica","definite-error-unrecognized-form-masculine-plural":"fonometricii","definite-error-unrecognized-form-feminine-neuter-plural":"fonometricele"}},{"word":"fonometrie","pos":"noun","definitions":["phonometry"],"forms":{"plural":"fonometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fonometrie","accusative-definite-nominative-singular":"fonometria","accusative-indefinite-nominative-plural":"fonometrii","accusative-definite-nominative-plural":"fonometriile","dative-genitive-indefinite-singular":"fonometrii","dative-definite-genitive-singular":"fonometriei","dative-genitive-indefinite-plural":"fonometrii","dative-definite-genitive-plural":"fonometriilor","singular-vocative":"fonometrie","plural-vocative":"fonometriilor"}},{"word":"fonometru","pos":"noun","definitions":["phonometer"],"forms":{"plural":"fonometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fonometru","accusative-definite-nominative-singular":"fonometrul","accusative-indefinite-nominative-plural":"fonometre","accusative-definite-nominative-plural":"fonometrele","dative-genitive-indefinite-singular":"fonometru","dative-definite-genitive-singular":"fonometrului","dative-genitive-indefinite-plural":"fonometre","dative-definite-genitive-plural":"fonometrelor","singular-vocative":"fonometrule","plural-vocative":"fonometrelor"}},{"word":"fonon","pos":"noun","definitions":["phonon"],"forms":{"plural":"fononi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fonon","accusative-definite-nominative-singular":"fononul","accusative-indefinite-nominative-plural":"fononi","accusative-definite-nominative-plural":"fononii","dative-genitive-indefinite-singular":"fonon","dative-definite-genitive-singular":"fononului","dative-genitive-indefinite-plural":"fononi","dative-definite-genitive-plural":"fononilor","singular-vocative":"fononule","plural-vocative":"fononilor"}},{"word":"fonotecă","pos":"noun","definitions":["sound/record archive/library"],"forms":{"plural":"fonoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fonotecă","accusative-definite-nominative-singular":"fonoteca","accusative-indefinite-nominative-plural":"fonoteci","accusative-definite-nominative-plural":"fonotecile","dative-genitive-indefinite-singular":"fonoteci","dative-definite-genitive-singular":"fonotecii","dative-genitive-indefinite-plural":"fonoteci","dative-definite-genitive-plural":"fonotecilor","singular-vocative":"fonotecă","plural-vocative":"fonotecilor"}},{"word":"font","pos":"noun","definitions":["font"],"forms":{"plural":"fonturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"font","accusative-definite-nominative-singular":"fontul","accusative-indefinite-nominative-plural":"fonturi","accusative-definite-nominative-plural":"fonturile","dative-genitive-indefinite-singular":"font","dative-definite-genitive-singular":"fontului","dative-genitive-indefinite-plural":"fonturi","dative-definite-genitive-plural":"fonturilor","singular-vocative":"fontule","plural-vocative":"fonturilor"}},{"word":"fontă","pos":"noun","definitions":["cast iron"],"forms":{"plural":"fonte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fontă","accusative-definite-nominative-singular":"fonta","accusative-indefinite-nominative-plural":"fonte","accusative-definite-nominative-plural":"fontele","dative-genitive-indefinite-singular":"fonte","dative-definite-genitive-singular":"fontei","dative-genitive-indefinite-plural":"fonte","dative-definite-genitive-plural":"fontelor","singular-vocative":"fontă","plural-vocative":"fontelor"}},{"word":"fontal","pos":"noun","definitions":["well"],"forms":{"plural":"fontale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fontal","accusative-definite-nominative-singular":"fontalul","accusative-indefinite-nominative-plural":"fontale","accusative-definite-nominative-plural":"fontalele","dative-genitive-indefinite-singular":"fontal","dative-definite-genitive-singular":"fontalului","dative-genitive-indefinite-plural":"fontale","dative-definite-genitive-plural":"fontalelor","singular-vocative":"fontalule","plural-vocative":"fontalelor"}},{"word":"fontanelă","pos":"noun","definitions":["fontanelle"],"forms":{"plural":"fontanele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fontanelă","accusative-definite-nominative-singular":"fontanela","accusative-indefinite-nominative-plural":"fontanele","accusative-definite-nominative-plural":"fontanelele","dative-genitive-indefinite-singular":"fontanele","dative-definite-genitive-singular":"fontanelei","dative-genitive-indefinite-plural":"fontanele","dative-definite-genitive-plural":"fontanelelor","singular-vocative":"fontanelă","plural-vocative":"fontanelelor"}},{"word":"fontoș","pos":"adj","definitions":["important"],"forms":{"feminine-singular":"fontoșă","masculine-plural":"fontoși","feminine-neuter-plural":"fontoșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fontoș","error-unrecognized-form-feminine-indefinite-singular":"fontoșă","error-unrecognized-form-indefinite-masculine-plural":"fontoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fontoșe","definite-error-unrecognized-form-masculine-neuter-singular":"fontoșul","definite-error-unrecognized-form-feminine-singular":"fontoșa","definite-error-unrecognized-form-masculine-plural":"fontoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fontoșele"}},{"word":"for","pos":"noun","definitions":["forum"],"forms":{"plural":"foruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"for","accusative-definite-nominative-singular":"forul","accusative-indefinite-nominative-plural":"foruri","accusative-definite-nominative-plural":"forurile","dative-genitive-indefinite-singular":"for","dative-definite-genitive-singular":"forului","dative-genitive-indefinite-plural":"foruri","dative-definite-genitive-plural":"forurilor","singular-vocative":"forule","plural-vocative":"forurilor"}},{"word":"fora","pos":"verb","definitions":["to drill"],"forms":{"canonical":"a fora 1st conjugation","present-singular-third-person":"forează","participle-past":"forat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fora","gerund":"forând","first-person-indicative-present-singular":"forez","indicative-present-second-person-singular":"forezi","indicative-present-singular-third-person":"forează","first-person-indicative-plural-present":"forăm","indicative-plural-present-second-person":"forați","indicative-plural-present-third-person":"forează","first-person-imperfect-indicative-singular":"foram","imperfect-indicative-second-person-singular":"forai","imperfect-indicative-singular-third-person":"fora","first-person-imperfect-indicative-plural":"foram","imperfect-indicative-plural-second-person":"forați","imperfect-indicative-plural-third-person":"forau","first-person-indicative-perfect-singular":"forai","indicative-perfect-second-person-singular":"forași","indicative-perfect-singular-third-person":"foră","first-person-indicative-perfect-plural":"forarăm","indicative-perfect-plural-second-person":"forarăți","indicative-perfect-plural-third-person":"forară","first-person-indicative-pluperfect-singular":"forasem","indicative-pluperfect-second-person-singular":"foraseși","indicative-pluperfect-singular-third-person":"forase","first-person-indicative-pluperfect-plural":"foraserăm","indicative-pluperfect-plural-second-person":"foraserăți","indicative-pluperfect-plural-third-person":"foraseră","first-person-present-singular-subjunctive":"să forez","present-second-person-singular-subjunctive":"să forezi","present-singular-subjunctive-third-person":"să foreze","first-person-plural-present-subjunctive":"să forăm","plural-present-second-person-subjunctive":"să forați","plural-present-subjunctive-third-person":"să foreze","imperative-second-person-singular":"forează","imperative-plural-second-person":"forați","imperative-negative-second-person-singular":"nu fora","imperative-negative-plural-second-person":"nu forați"}},{"word":"forabil","pos":"adj","definitions":["drillable"],"forms":{"feminine-singular":"forabilă","masculine-plural":"forabili","feminine-neuter-plural":"forabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forabil","error-unrecognized-form-feminine-indefinite-singular":"forabilă","error-unrecognized-form-indefinite-masculine-plural":"forabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"forabile","definite-error-unrecognized-form-masculine-neuter-singular":"forabilul","definite-error-unrecognized-form-feminine-singular":"forabila","definite-error-unrecognized-form-masculine-plural":"forabilii","definite-error-unrecognized-form-feminine-neuter-plural":"forabilele"}},{"word":"forabilitate","pos":"noun","definitions":["drillability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forabilitate","accusative-definite-nominative-singular":"forabilitatea","accusative-indefinite-nominative-plural":"forabilități","accusative-definite-nominative-plural":"forabilitățile","dative-genitive-indefinite-singular":"forabilități","dative-definite-genitive-singular":"forabilității","dative-genitive-indefinite-plural":"forabilități","dative-definite-genitive-plural":"forabilităților","singular-vocative":"forabilitate","plural-vocative":"forabilităților"}},{"word":"Forai","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Forai"}},{"word":"foraj","pos":"noun","definitions":["drilling"],"forms":{"plural":"foraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foraj","accusative-definite-nominative-singular":"forajul","accusative-indefinite-nominative-plural":"foraje","accusative-definite-nominative-plural":"forajele","dative-genitive-indefinite-singular":"foraj","dative-definite-genitive-singular":"forajului","dative-genitive-indefinite-plural":"foraje","dative-definite-genitive-plural":"forajelor","singular-vocative":"forajule","plural-vocative":"forajelor"}},{"word":"foram","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fora"],"pronunciation":"[foˈram]"},{"word":"foraminifer","pos":"noun","definitions":["foraminifer"],"forms":{"plural":"foraminifere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foraminifer","accusative-definite-nominative-singular":"foraminiferul","accusative-indefinite-nominative-plural":"foraminifere","accusative-definite-nominative-plural":"foraminiferele","dative-genitive-indefinite-singular":"foraminifer","dative-definite-genitive-singular":"foraminiferului","dative-genitive-indefinite-plural":"foraminifere","dative-definite-genitive-plural":"foraminiferelor","singular-vocative":"foraminiferule","plural-vocative":"foraminiferelor"}},{"word":"Foran","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Foran"}},{"word":"forare","pos":"noun","definitions":["drilling"],"forms":{"plural":"forări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forare","accusative-definite-nominative-singular":"forarea","accusative-indefinite-nominative-plural":"forări","accusative-definite-nominative-plural":"forările","dative-genitive-indefinite-singular":"forări","dative-definite-genitive-singular":"forării","dative-genitive-indefinite-plural":"forări","dative-definite-genitive-plural":"forărilor","singular-vocative":"forare","plural-vocative":"forărilor"}},{"word":"foraș","pos":"noun","definitions":["alternative form of făraș"],"forms":{"plural":"forașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foraș","accusative-definite-nominative-singular":"forașul","accusative-indefinite-nominative-plural":"forașe","accusative-definite-nominative-plural":"forașele","dative-genitive-indefinite-singular":"foraș","dative-definite-genitive-singular":"forașului","dative-genitive-indefinite-plural":"forașe","dative-definite-genitive-plural":"forașelor","singular-vocative":"forașule","plural-vocative":"forașelor"}},{"word":"Forăști","pos":"name","definitions":["a village in Gropnița, Iași County, Romania","a commune of Suceava County, Romania","a village in Forăști, Suceava County, Romania"],"gender":"m"},{"word":"Forău","pos":"name","definitions":["a village in Uileacu de Beiuș, Bihor County, Romania"],"gender":"m"},{"word":"forban","pos":"noun","definitions":["pirate"],"forms":{"plural":"forbani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forban","accusative-definite-nominative-singular":"forbanul","accusative-indefinite-nominative-plural":"forbani","accusative-definite-nominative-plural":"forbanii","dative-genitive-indefinite-singular":"forban","dative-definite-genitive-singular":"forbanului","dative-genitive-indefinite-plural":"forbani","dative-definite-genitive-plural":"forbanilor","singular-vocative":"forbanule","plural-vocative":"forbanilor"}},{"word":"forceps","pos":"noun","definitions":["forceps"],"forms":{"plural":"forcepsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forceps","accusative-definite-nominative-singular":"forcepsul","accusative-indefinite-nominative-plural":"forcepsuri","accusative-definite-nominative-plural":"forcepsurile","dative-genitive-indefinite-singular":"forceps","dative-definite-genitive-singular":"forcepsului","dative-genitive-indefinite-plural":"forcepsuri","dative-definite-genitive-plural":"forcepsurilor","singular-vocative":"forcepsule","plural-vocative":"forcepsurilor"}},{"word":"forcipresură","pos":"noun","definitions":["forcipressure"],"forms":{"plural":"forcipresuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"forcipresură","accusative-definite-nominative-singular":"forcipresura","accusative-indefinite-nominative-plural":"forcipresuri","accusative-definite-nominative-plural":"forcipresurile","dative-genitive-indefinite-singular":"forcipresuri","dative-definite-genitive-singular":"forcipresurii","dative-genitive-indefinite-plural":"forcipresuri","dative-definite-genitive-plural":"forcipresurilor","singular-vocative":"forcipresură","plural-vocative":"forcipresurilor"}},{"word":"fordism","pos":"noun","definitions":["Fordism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fordism","accusative-definite-nominative":"fordismul","dative-genitive-indefinite":"fordism","dative-definite-genitive":"fordismului","vocative":"fordismule"}},{"word":"forditău","pos":"noun","definitions":["latch"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"forditău","accusative-definite-nominative":"fordităuul","dative-genitive-indefinite":"forditău","dative-definite-genitive":"fordităuului","vocative":"fordităuule"}},{"word":"fordulău","pos":"noun","definitions":["border"],"forms":{"plural":"fordulaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fordulău","accusative-definite-nominative-singular":"fordulăuul","accusative-indefinite-nominative-plural":"fordulaie","accusative-definite-nominative-plural":"fordulaiele","dative-genitive-indefinite-singular":"fordulău","dative-definite-genitive-singular":"fordulăuului","dative-genitive-indefinite-plural":"fordulaie","dative-definite-genitive-plural":"fordulaielor","singular-vocative":"fordulăuule","plural-vocative":"fordulaielor"}},{"word":"forestier","pos":"adj","definitions":["silvan, foresty"],"pronunciation":"/fo.res.tiˈer/","forms":{"feminine-singular":"forestieră","masculine-plural":"forestieri","feminine-neuter-plural":"forestiere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forestier","error-unrecognized-form-feminine-indefinite-singular":"forestieră","error-unrecognized-form-indefinite-masculine-plural":"forestieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"forestiere","definite-error-unrecognized-form-masculine-neuter-singular":"forestierul","definite-error-unrecognized-form-feminine-singular":"forestiera","definite-error-unrecognized-form-masculine-plural":"forestierii","definite-error-unrecognized-form-feminine-neuter-plural":"forestierele"}},{"word":"forez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fora"],"pronunciation":"[foˈrez]"},{"word":"foreză","pos":"noun","definitions":["drilling machine"],"forms":{"plural":"foreze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foreză","accusative-definite-nominative-singular":"foreza","accusative-indefinite-nominative-plural":"foreze","accusative-definite-nominative-plural":"forezele","dative-genitive-indefinite-singular":"foreze","dative-definite-genitive-singular":"forezei","dative-genitive-indefinite-plural":"foreze","dative-definite-genitive-plural":"forezelor","singular-vocative":"foreză","plural-vocative":"forezelor"}},{"word":"forezie","pos":"noun","definitions":["phoresis"],"forms":{"plural":"forezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"forezie","accusative-definite-nominative-singular":"forezia","accusative-indefinite-nominative-plural":"forezii","accusative-definite-nominative-plural":"foreziile","dative-genitive-indefinite-singular":"forezii","dative-definite-genitive-singular":"foreziei","dative-genitive-indefinite-plural":"forezii","dative-definite-genitive-plural":"foreziilor","singular-vocative":"forezie","plural-vocative":"foreziilor"}},{"word":"forfăi","pos":"verb","definitions":["to swarm"],"forms":{"canonical":"a forfăi 4th conjugation","present-singular-third-person":"forfăie","participle-past":"forfăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a forfăi","gerund":"forfăind","first-person-indicative-present-singular":"forfăiesc","indicative-present-second-person-singular":"forfăiești","indicative-present-singular-third-person":"forfăiește","first-person-indicative-plural-present":"forfăim","indicative-plural-present-second-person":"forfăiți","indicative-plural-present-third-person":"forfăiesc","first-person-imperfect-indicative-singular":"forfăiam","imperfect-indicative-second-person-singular":"forfăiai","imperfect-indicative-singular-third-person":"forfăia","first-person-imperfect-indicative-plural":"forfăiam","imperfect-indicative-plural-second-person":"forfăiați","imperfect-indicative-plural-third-person":"forfăiau","first-person-indicative-perfect-singular":"forfăii","indicative-perfect-second-person-singular":"forfăiși","indicative-perfect-singular-third-person":"forfăi","first-person-indicative-perfect-plural":"forfăirăm","indicative-perfect-plural-second-person":"forfăirăți","indicative-perfect-plural-third-person":"forfăiră","first-person-indicative-pluperfect-singular":"forfăisem","indicative-pluperfect-second-person-singular":"forfăiseși","indicative-pluperfect-singular-third-person":"forfăise","first-person-indicative-pluperfect-plural":"forfăiserăm","indicative-pluperfect-plural-second-person":"forfăiserăți","indicative-pluperfect-plural-third-person":"forfăiseră","first-person-present-singular-subjunctive":"să forfăiesc","present-second-person-singular-subjunctive":"să forfăiești","present-singular-subjunctive-third-person":"să forfăiască","first-person-plural-present-subjunctive":"să forfăim","plural-present-second-person-subjunctive":"să forfăiți","plural-present-subjunctive-third-person":"să forfăiască","imperative-second-person-singular":"forfăiește","imperative-plural-second-person":"forfăiți","imperative-negative-second-person-singular":"nu forfăi","imperative-negative-plural-second-person":"nu forfăiți"}},{"word":"forfăială","pos":"noun","definitions":["bustle"],"forms":{"plural":"forfăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"forfăială","accusative-definite-nominative-singular":"forfăiala","accusative-indefinite-nominative-plural":"forfăiele","accusative-definite-nominative-plural":"forfăielele","dative-genitive-indefinite-singular":"forfăiele","dative-definite-genitive-singular":"forfăielei","dative-genitive-indefinite-plural":"forfăiele","dative-definite-genitive-plural":"forfăielelor","singular-vocative":"forfăială","plural-vocative":"forfăielelor"}},{"word":"forfait","pos":"noun","definitions":["forfait"],"forms":{"plural":"forfait-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"forfait","accusative-definite-nominative-singular":"forfaitul","accusative-indefinite-nominative-plural":"forfait-uri","accusative-definite-nominative-plural":"forfait-urile","dative-genitive-indefinite-singular":"forfait","dative-definite-genitive-singular":"forfaitului","dative-genitive-indefinite-plural":"forfait-uri","dative-definite-genitive-plural":"forfait-urilor","singular-vocative":"forfaitule","plural-vocative":"forfait-urilor"}},{"word":"forfeca","pos":"verb","definitions":["to cut with scissors"],"forms":{"canonical":"a forfeca 1st conjugation","present-singular-third-person":"foarfecă","participle-past":"forfecat","subjunctive-third-person":"foarfece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a forfeca","gerund":"forfecând","first-person-indicative-present-singular":"foarfec","indicative-present-second-person-singular":"foarfeci","indicative-present-singular-third-person":"foarfecă","first-person-indicative-plural-present":"forfecăm","indicative-plural-present-second-person":"forfecați","indicative-plural-present-third-person":"foarfecă","first-person-imperfect-indicative-singular":"forfecam","imperfect-indicative-second-person-singular":"forfecai","imperfect-indicative-singular-third-person":"forfeca","first-person-imperfect-indicative-plural":"forfecam","imperfect-indicative-plural-second-person":"forfecați","imperfect-indicative-plural-third-person":"forfecau","first-person-indicative-perfect-singular":"forfecai","indicative-perfect-second-person-singular":"forfecași","indicative-perfect-singular-third-person":"forfecă","first-person-indicative-perfect-plural":"forfecarăm","indicative-perfect-plural-second-person":"forfecarăți","indicative-perfect-plural-third-person":"forfecară","first-person-indicative-pluperfect-singular":"forfecasem","indicative-pluperfect-second-person-singular":"forfecaseși","indicative-pluperfect-singular-third-person":"forfecase","first-person-indicative-pluperfect-plural":"forfecaserăm","indicative-pluperfect-plural-second-person":"forfecaserăți","indicative-pluperfect-plural-third-person":"forfecaseră","first-person-present-singular-subjunctive":"să foarfec","present-second-person-singular-subjunctive":"să foarfeci","present-singular-subjunctive-third-person":"să foarfece","first-person-plural-present-subjunctive":"să forfecăm","plural-present-second-person-subjunctive":"să forfecați","plural-present-subjunctive-third-person":"să foarfece","imperative-second-person-singular":"foarfecă","imperative-plural-second-person":"forfecați","imperative-negative-second-person-singular":"nu forfeca","imperative-negative-plural-second-person":"nu forfecați"}},{"word":"forfecar","pos":"noun","definitions":["Lethrus cephalotes"],"forms":{"plural":"forfecari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forfecar","accusative-definite-nominative-singular":"forfecarul","accusative-indefinite-nominative-plural":"forfecari","accusative-definite-nominative-plural":"forfecarii","dative-genitive-indefinite-singular":"forfecar","dative-definite-genitive-singular":"forfecarului","dative-genitive-indefinite-plural":"forfecari","dative-definite-genitive-plural":"forfecarilor","singular-vocative":"forfecarule","plural-vocative":"forfecarilor"}},{"word":"forfecăraș","pos":"noun","definitions":["red crossbill (Loxia curvirostra)"],"forms":{"plural":"forfecărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forfecăraș","accusative-definite-nominative-singular":"forfecărașul","accusative-indefinite-nominative-plural":"forfecărași","accusative-definite-nominative-plural":"forfecărașii","dative-genitive-indefinite-singular":"forfecăraș","dative-definite-genitive-singular":"forfecărașului","dative-genitive-indefinite-plural":"forfecărași","dative-definite-genitive-plural":"forfecărașilor","singular-vocative":"forfecărașule","plural-vocative":"forfecărașilor"}},{"word":"forfecare","pos":"noun","definitions":["cut with scissors"],"forms":{"plural":"forfecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forfecare","accusative-definite-nominative-singular":"forfecarea","accusative-indefinite-nominative-plural":"forfecări","accusative-definite-nominative-plural":"forfecările","dative-genitive-indefinite-singular":"forfecări","dative-definite-genitive-singular":"forfecării","dative-genitive-indefinite-plural":"forfecări","dative-definite-genitive-plural":"forfecărilor","singular-vocative":"forfecare","plural-vocative":"forfecărilor"}},{"word":"forfecărel","pos":"noun","definitions":["red crossbill (Loxia curvirostra)"],"forms":{"plural":"forfecărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forfecărel","accusative-definite-nominative-singular":"forfecărelul","accusative-indefinite-nominative-plural":"forfecărei","accusative-definite-nominative-plural":"forfecăreii","dative-genitive-indefinite-singular":"forfecărel","dative-definite-genitive-singular":"forfecărelului","dative-genitive-indefinite-plural":"forfecărei","dative-definite-genitive-plural":"forfecăreilor","singular-vocative":"forfecărelule","plural-vocative":"forfecăreilor"}},{"word":"forfecătură","pos":"noun","definitions":["shear"],"forms":{"plural":"forfecături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"forfecătură","accusative-definite-nominative-singular":"forfecătura","accusative-indefinite-nominative-plural":"forfecături","accusative-definite-nominative-plural":"forfecăturile","dative-genitive-indefinite-singular":"forfecături","dative-definite-genitive-singular":"forfecăturii","dative-genitive-indefinite-plural":"forfecături","dative-definite-genitive-plural":"forfecăturilor","singular-vocative":"forfecătură","plural-vocative":"forfecăturilor"}},{"word":"forfecel","pos":"noun","definitions":["diminutive of foarfece"],"forms":{"plural":"forfecei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forfecel","accusative-definite-nominative-singular":"forfecelul","accusative-indefinite-nominative-plural":"forfecei","accusative-definite-nominative-plural":"forfeceii","dative-genitive-indefinite-singular":"forfecel","dative-definite-genitive-singular":"forfecelului","dative-genitive-indefinite-plural":"forfecei","dative-definite-genitive-plural":"forfeceilor","singular-vocative":"forfecelule","plural-vocative":"forfeceilor"}},{"word":"forfecuță","pos":"noun","definitions":["diminutive of foarfece; small scissors","red crossbill (Loxia curvirostra)"],"forms":{"plural":"forfecuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"forfecuță","accusative-definite-nominative-singular":"forfecuța","accusative-indefinite-nominative-plural":"forfecuțe","accusative-definite-nominative-plural":"forfecuțele","dative-genitive-indefinite-singular":"forfecuțe","dative-definite-genitive-singular":"forfecuței","dative-genitive-indefinite-plural":"forfecuțe","dative-definite-genitive-plural":"forfecuțelor","singular-vocative":"forfecuță","plural-vocative":"forfecuțelor"}},{"word":"forfet","pos":"noun","definitions":["alternative form of forfait"],"forms":{"plural":"forfeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forfet","accusative-definite-nominative-singular":"forfetul","accusative-indefinite-nominative-plural":"forfeturi","accusative-definite-nominative-plural":"forfeturile","dative-genitive-indefinite-singular":"forfet","dative-definite-genitive-singular":"forfetului","dative-genitive-indefinite-plural":"forfeturi","dative-definite-genitive-plural":"forfeturilor","singular-vocative":"forfetule","plural-vocative":"forfeturilor"}},{"word":"forfetar","pos":"adj","definitions":["fixed-price, flat-rate"],"forms":{"feminine-singular":"forfetară","masculine-plural":"forfetari","feminine-neuter-plural":"forfetare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forfetar","error-unrecognized-form-feminine-indefinite-singular":"forfetară","error-unrecognized-form-indefinite-masculine-plural":"forfetari","error-unrecognized-form-feminine-indefinite-neuter-plural":"forfetare","definite-error-unrecognized-form-masculine-neuter-singular":"forfetarul","definite-error-unrecognized-form-feminine-singular":"forfetara","definite-error-unrecognized-form-masculine-plural":"forfetarii","definite-error-unrecognized-form-feminine-neuter-plural":"forfetarele"}},{"word":"forfot","pos":"noun","definitions":["alternative form of forfotă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"forfot","accusative-definite-nominative":"forfotul","dative-genitive-indefinite":"forfot","dative-definite-genitive":"forfotului","vocative":"forfotule"}},{"word":"Forfotă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Forfotă"}},{"word":"forfotă","pos":"noun","definitions":["bustle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"forfotă","accusative-definite-nominative":"forfotăul","dative-genitive-indefinite":"forfotă","dative-definite-genitive":"forfotăului","vocative":"forfotăule"}},{"word":"forfoteală","pos":"noun","definitions":["bustle"],"forms":{"plural":"forfoteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"forfoteală","accusative-definite-nominative-singular":"forfoteala","accusative-indefinite-nominative-plural":"forfoteli","accusative-definite-nominative-plural":"forfotelile","dative-genitive-indefinite-singular":"forfoteli","dative-definite-genitive-singular":"forfotelii","dative-genitive-indefinite-plural":"forfoteli","dative-definite-genitive-plural":"forfotelilor","singular-vocative":"forfoteală","plural-vocative":"forfotelilor"}},{"word":"forfoti","pos":"verb","definitions":["to bustle","to swarm","to fuss"],"forms":{"canonical":"a forfoti 4th conjugation","present-singular-third-person":"forfotește","participle-past":"forfotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a forfoti","gerund":"forfotind","first-person-indicative-present-singular":"forfotesc","indicative-present-second-person-singular":"forfotești","indicative-present-singular-third-person":"forfotește","first-person-indicative-plural-present":"forfotim","indicative-plural-present-second-person":"forfotiți","indicative-plural-present-third-person":"forfotesc","first-person-imperfect-indicative-singular":"forfoteam","imperfect-indicative-second-person-singular":"forfoteai","imperfect-indicative-singular-third-person":"forfotea","first-person-imperfect-indicative-plural":"forfoteam","imperfect-indicative-plural-second-person":"forfoteați","imperfect-indicative-plural-third-person":"forfoteau","first-person-indicative-perfect-singular":"forfotii","indicative-perfect-second-person-singular":"forfotiși","indicative-perfect-singular-third-person":"forfoti","first-person-indicative-perfect-plural":"forfotirăm","indicative-perfect-plural-second-person":"forfotirăți","indicative-perfect-plural-third-person":"forfotiră","first-person-indicative-pluperfect-singular":"forfotisem","indicative-pluperfect-second-person-singular":"forfotiseși","indicative-pluperfect-singular-third-person":"forfotise","first-person-indicative-pluperfect-plural":"forfotiserăm","indicative-pluperfect-plural-second-person":"forfotiserăți","indicative-pluperfect-plural-third-person":"forfotiseră","first-person-present-singular-subjunctive":"să forfotesc","present-second-person-singular-subjunctive":"să forfotești","present-singular-subjunctive-third-person":"să forfotească","first-person-plural-present-subjunctive":"să forfotim","plural-present-second-person-subjunctive":"să forfotiți","plural-present-subjunctive-third-person":"să forfotească","imperative-second-person-singular":"forfotește","imperative-plural-second-person":"forfotiți","imperative-negative-second-person-singular":"nu forfoti","imperative-negative-plural-second-person":"nu forfotiți"}},{"word":"forfotitor","pos":"adj","definitions":["bustling"],"forms":{"feminine-singular":"forfotitoare","masculine-plural":"forfotitori","feminine-neuter-plural":"forfotitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forfotitor","error-unrecognized-form-feminine-indefinite-singular":"forfotitoare","error-unrecognized-form-indefinite-masculine-plural":"forfotitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"forfotitoare","definite-error-unrecognized-form-masculine-neuter-singular":"forfotitorul","definite-error-unrecognized-form-feminine-singular":"forfotitoarea","definite-error-unrecognized-form-masculine-plural":"forfotitorii","definite-error-unrecognized-form-feminine-neuter-plural":"forfotitoarele"}},{"word":"Forgaci","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Forgaci"}},{"word":"forgașă","pos":"noun","definitions":["marking of a border"],"forms":{"plural":"forgașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"forgașă","accusative-definite-nominative-singular":"forgașa","accusative-indefinite-nominative-plural":"forgașe","accusative-definite-nominative-plural":"forgașele","dative-genitive-indefinite-singular":"forgașe","dative-definite-genitive-singular":"forgașei","dative-genitive-indefinite-plural":"forgașe","dative-definite-genitive-plural":"forgașelor","singular-vocative":"forgașă","plural-vocative":"forgașelor"}},{"word":"forhang","pos":"noun","definitions":["curtain"],"forms":{"plural":"forhanguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forhang","accusative-definite-nominative-singular":"forhangul","accusative-indefinite-nominative-plural":"forhanguri","accusative-definite-nominative-plural":"forhangurile","dative-genitive-indefinite-singular":"forhang","dative-definite-genitive-singular":"forhangului","dative-genitive-indefinite-plural":"forhanguri","dative-definite-genitive-plural":"forhangurilor","singular-vocative":"forhangule","plural-vocative":"forhangurilor"}},{"word":"forhend","pos":"noun","definitions":["alternative form of forehand"],"forms":{"plural":"forhenduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forhend","accusative-definite-nominative-singular":"forhendul","accusative-indefinite-nominative-plural":"forhenduri","accusative-definite-nominative-plural":"forhendurile","dative-genitive-indefinite-singular":"forhend","dative-definite-genitive-singular":"forhendului","dative-genitive-indefinite-plural":"forhenduri","dative-definite-genitive-plural":"forhendurilor","singular-vocative":"forhendule","plural-vocative":"forhendurilor"}},{"word":"forint","pos":"noun","definitions":["forint"],"forms":{"plural":"forinți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forint","accusative-definite-nominative-singular":"forintul","accusative-indefinite-nominative-plural":"forinți","accusative-definite-nominative-plural":"forinții","dative-genitive-indefinite-singular":"forint","dative-definite-genitive-singular":"forintului","dative-genitive-indefinite-plural":"forinți","dative-definite-genitive-plural":"forinților","singular-vocative":"forintule","plural-vocative":"forinților"}},{"word":"Foriș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Foriș"}},{"word":"forja","pos":"verb","definitions":["to forge"],"pronunciation":"/forˈʒa/","forms":{"canonical":"a forja 1st conjugation","present-singular-third-person":"forjează","participle-past":"forjat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a forja","gerund":"forjând","first-person-indicative-present-singular":"forjez","indicative-present-second-person-singular":"forjezi","indicative-present-singular-third-person":"forjează","first-person-indicative-plural-present":"forjăm","indicative-plural-present-second-person":"forjați","indicative-plural-present-third-person":"forjează","first-person-imperfect-indicative-singular":"forjam","imperfect-indicative-second-person-singular":"forjai","imperfect-indicative-singular-third-person":"forja","first-person-imperfect-indicative-plural":"forjam","imperfect-indicative-plural-second-person":"forjați","imperfect-indicative-plural-third-person":"forjau","first-person-indicative-perfect-singular":"forjai","indicative-perfect-second-person-singular":"forjași","indicative-perfect-singular-third-person":"forjă","first-person-indicative-perfect-plural":"forjarăm","indicative-perfect-plural-second-person":"forjarăți","indicative-perfect-plural-third-person":"forjară","first-person-indicative-pluperfect-singular":"forjasem","indicative-pluperfect-second-person-singular":"forjaseși","indicative-pluperfect-singular-third-person":"forjase","first-person-indicative-pluperfect-plural":"forjaserăm","indicative-pluperfect-plural-second-person":"forjaserăți","indicative-pluperfect-plural-third-person":"forjaseră","first-person-present-singular-subjunctive":"să forjez","present-second-person-singular-subjunctive":"să forjezi","present-singular-subjunctive-third-person":"să forjeze","first-person-plural-present-subjunctive":"să forjăm","plural-present-second-person-subjunctive":"să forjați","plural-present-subjunctive-third-person":"să forjeze","imperative-second-person-singular":"forjează","imperative-plural-second-person":"forjați","imperative-negative-second-person-singular":"nu forja","imperative-negative-plural-second-person":"nu forjați"}},{"word":"forjă","pos":"noun","definitions":["forge"],"forms":{"plural":"forje"}},{"word":"forjabil","pos":"adj","definitions":["forgeable"],"forms":{"feminine-singular":"forjabilă","masculine-plural":"forjabili","feminine-neuter-plural":"forjabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forjabil","error-unrecognized-form-feminine-indefinite-singular":"forjabilă","error-unrecognized-form-indefinite-masculine-plural":"forjabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"forjabile","definite-error-unrecognized-form-masculine-neuter-singular":"forjabilul","definite-error-unrecognized-form-feminine-singular":"forjabila","definite-error-unrecognized-form-masculine-plural":"forjabilii","definite-error-unrecognized-form-feminine-neuter-plural":"forjabilele"}},{"word":"forjabilitate","pos":"noun","definitions":["forgeability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forjabilitate","accusative-definite-nominative-singular":"forjabilitatea","accusative-indefinite-nominative-plural":"forjabilități","accusative-definite-nominative-plural":"forjabilitățile","dative-genitive-indefinite-singular":"forjabilități","dative-definite-genitive-singular":"forjabilității","dative-genitive-indefinite-plural":"forjabilități","dative-definite-genitive-plural":"forjabilităților","singular-vocative":"forjabilitate","plural-vocative":"forjabilităților"}},{"word":"forjai","pos":"verb","definitions":["inflection of forja:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[forˈʒaj]"},{"word":"forjam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of forja"],"pronunciation":"[forˈʒam]"},{"word":"forjar","pos":"noun","definitions":["forger"],"forms":{"plural":"forjari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forjar","accusative-definite-nominative-singular":"forjarul","accusative-indefinite-nominative-plural":"forjari","accusative-definite-nominative-plural":"forjarii","dative-genitive-indefinite-singular":"forjar","dative-definite-genitive-singular":"forjarului","dative-genitive-indefinite-plural":"forjari","dative-definite-genitive-plural":"forjarilor","singular-vocative":"forjarule","plural-vocative":"forjarilor"}},{"word":"forjare","pos":"noun","definitions":["forging"],"forms":{"plural":"forjări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forjare","accusative-definite-nominative-singular":"forjarea","accusative-indefinite-nominative-plural":"forjări","accusative-definite-nominative-plural":"forjările","dative-genitive-indefinite-singular":"forjări","dative-definite-genitive-singular":"forjării","dative-genitive-indefinite-plural":"forjări","dative-definite-genitive-plural":"forjărilor","singular-vocative":"forjare","plural-vocative":"forjărilor"}},{"word":"forjărie","pos":"noun","definitions":["forge"],"forms":{"plural":"forjării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"forjărie","accusative-definite-nominative-singular":"forjăria","accusative-indefinite-nominative-plural":"forjării","accusative-definite-nominative-plural":"forjăriile","dative-genitive-indefinite-singular":"forjării","dative-definite-genitive-singular":"forjăriei","dative-genitive-indefinite-plural":"forjării","dative-definite-genitive-plural":"forjăriilor","singular-vocative":"forjărie","plural-vocative":"forjăriilor"}},{"word":"forjase","pos":"verb","definitions":["third-person singular pluperfect indicative of forja"],"pronunciation":"[forˈʒase]"},{"word":"forjat","pos":"adj","definitions":["wrought, forged"],"pronunciation":"[forˈʒat]","examples":[{"ro":"fier forjat","en":"wrought iron"}],"forms":{"feminine-singular":"forjată","masculine-plural":"forjați","feminine-neuter-plural":"forjate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forjat","error-unrecognized-form-feminine-indefinite-singular":"forjată","error-unrecognized-form-indefinite-masculine-plural":"forjați","error-unrecognized-form-feminine-indefinite-neuter-plural":"forjate","definite-error-unrecognized-form-masculine-neuter-singular":"forjatul","definite-error-unrecognized-form-feminine-singular":"forjata","definite-error-unrecognized-form-masculine-plural":"forjații","definite-error-unrecognized-form-feminine-neuter-plural":"forjatele"}},{"word":"forjat","pos":"verb","definitions":["past participle of forja"],"pronunciation":"[forˈʒat]","forms":{"participle-past":"of forja"}},{"word":"forjerie","pos":"noun","definitions":["alternative form of forjărie"],"forms":{"plural":"forjerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"forjerie","accusative-definite-nominative-singular":"forjeria","accusative-indefinite-nominative-plural":"forjerii","accusative-definite-nominative-plural":"forjeriile","dative-genitive-indefinite-singular":"forjerii","dative-definite-genitive-singular":"forjeriei","dative-genitive-indefinite-plural":"forjerii","dative-definite-genitive-plural":"forjeriilor","singular-vocative":"forjerie","plural-vocative":"forjeriilor"}},{"word":"forjor","pos":"noun","definitions":["forger"],"forms":{"plural":"forjori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"forjor","accusative-definite-nominative-singular":"forjorul","accusative-indefinite-nominative-plural":"forjori","accusative-definite-nominative-plural":"forjorii","dative-genitive-indefinite-singular":"forjor","dative-definite-genitive-singular":"forjorului","dative-genitive-indefinite-plural":"forjori","dative-definite-genitive-plural":"forjorilor","singular-vocative":"forjorule","plural-vocative":"forjorilor"}},{"word":"forma","pos":"verb","definitions":["to form, to create, to make","to form, to make up"],"pronunciation":"[forˈma]","forms":{"canonical":"a forma 1st conjugation","present-singular-third-person":"formează","participle-past":"format","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a forma","gerund":"formând","first-person-indicative-present-singular":"formez","indicative-present-second-person-singular":"formezi","indicative-present-singular-third-person":"formează","first-person-indicative-plural-present":"formăm","indicative-plural-present-second-person":"formați","indicative-plural-present-third-person":"formează","first-person-imperfect-indicative-singular":"formam","imperfect-indicative-second-person-singular":"formai","imperfect-indicative-singular-third-person":"forma","first-person-imperfect-indicative-plural":"formam","imperfect-indicative-plural-second-person":"formați","imperfect-indicative-plural-third-person":"formau","first-person-indicative-perfect-singular":"formai","indicative-perfect-second-person-singular":"formași","indicative-perfect-singular-third-person":"formă","first-person-indicative-perfect-plural":"formarăm","indicative-perfect-plural-second-person":"formarăți","indicative-perfect-plural-third-person":"formară","first-person-indicative-pluperfect-singular":"formasem","indicative-pluperfect-second-person-singular":"formaseși","indicative-pluperfect-singular-third-person":"formase","first-person-indicative-pluperfect-plural":"formaserăm","indicative-pluperfect-plural-second-person":"formaserăți","indicative-pluperfect-plural-third-person":"formaseră","first-person-present-singular-subjunctive":"să formez","present-second-person-singular-subjunctive":"să formezi","present-singular-subjunctive-third-person":"să formeze","first-person-plural-present-subjunctive":"să formăm","plural-present-second-person-subjunctive":"să formați","plural-present-subjunctive-third-person":"să formeze","imperative-second-person-singular":"formează","imperative-plural-second-person":"formați","imperative-negative-second-person-singular":"nu forma","imperative-negative-plural-second-person":"nu formați"}},{"word":"forma","pos":"verb","definitions":["third-person singular imperfect indicative of forma"],"pronunciation":"[forˈma]"},{"word":"forma","pos":"noun","definitions":["definite nominative/accusative singular of formă"],"pronunciation":"[ˈforma]"},{"word":"formă","pos":"noun","definitions":["form"],"pronunciation":"[ˈformə]","forms":{"plural":"forme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"formă","accusative-definite-nominative-singular":"forma","accusative-indefinite-nominative-plural":"forme","accusative-definite-nominative-plural":"formele","dative-genitive-indefinite-singular":"forme","dative-definite-genitive-singular":"formei","dative-genitive-indefinite-plural":"forme","dative-definite-genitive-plural":"formelor","singular-vocative":"formă","plural-vocative":"formelor"}},{"word":"formă","pos":"verb","definitions":["third-person singular simple perfect indicative of forma"],"pronunciation":"[forˈmə]"},{"word":"formă de guvernământ","pos":"noun","definitions":["form of government"],"forms":{"plural":"forme de guvernământ"}},{"word":"formă de relief","pos":"noun","definitions":["landform"],"forms":{"plural":"forme de relief"}},{"word":"Formagiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Formagiu"}},{"word":"formagiu","pos":"noun","definitions":["baker"],"forms":{"plural":"formagii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"formagiu","accusative-definite-nominative-singular":"formagiuul","accusative-indefinite-nominative-plural":"formagii","accusative-definite-nominative-plural":"formagiii","dative-genitive-indefinite-singular":"formagiu","dative-definite-genitive-singular":"formagiuului","dative-genitive-indefinite-plural":"formagii","dative-definite-genitive-plural":"formagiilor","singular-vocative":"formagiuule","plural-vocative":"formagiilor"}},{"word":"formai","pos":"verb","definitions":["inflection of forma:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[forˈmaj]"},{"word":"formaj","pos":"noun","definitions":["forming (metalworking)"],"forms":{"plural":"formaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"formaj","accusative-definite-nominative-singular":"formajul","accusative-indefinite-nominative-plural":"formaje","accusative-definite-nominative-plural":"formajele","dative-genitive-indefinite-singular":"formaj","dative-definite-genitive-singular":"formajului","dative-genitive-indefinite-plural":"formaje","dative-definite-genitive-plural":"formajelor","singular-vocative":"formajule","plural-vocative":"formajelor"}},{"word":"formal","pos":"adj","definitions":["formal"],"pronunciation":"/forˈmal/","forms":{"feminine-singular":"formală","masculine-plural":"formali","feminine-neuter-plural":"formale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formal","error-unrecognized-form-feminine-indefinite-singular":"formală","error-unrecognized-form-indefinite-masculine-plural":"formali","error-unrecognized-form-feminine-indefinite-neuter-plural":"formale","definite-error-unrecognized-form-masculine-neuter-singular":"formalul","definite-error-unrecognized-form-feminine-singular":"formala","definite-error-unrecognized-form-masculine-plural":"formalii","definite-error-unrecognized-form-feminine-neuter-plural":"formalele"}},{"word":"formaldehidă","pos":"noun","definitions":["formaldehyde"],"forms":{"plural":"formaldehide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"formaldehidă","accusative-definite-nominative-singular":"formaldehida","accusative-indefinite-nominative-plural":"formaldehide","accusative-definite-nominative-plural":"formaldehidele","dative-genitive-indefinite-singular":"formaldehide","dative-definite-genitive-singular":"formaldehidei","dative-genitive-indefinite-plural":"formaldehide","dative-definite-genitive-plural":"formaldehidelor","singular-vocative":"formaldehidă","plural-vocative":"formaldehidelor"}},{"word":"formalină","pos":"noun","definitions":["formalin"],"forms":{"plural":"formaline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"formalină","accusative-definite-nominative-singular":"formalina","accusative-indefinite-nominative-plural":"formaline","accusative-definite-nominative-plural":"formalinele","dative-genitive-indefinite-singular":"formaline","dative-definite-genitive-singular":"formalinei","dative-genitive-indefinite-plural":"formaline","dative-definite-genitive-plural":"formalinelor","singular-vocative":"formalină","plural-vocative":"formalinelor"}},{"word":"formalism","pos":"noun","definitions":["formalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"formalism","accusative-definite-nominative":"formalismul","dative-genitive-indefinite":"formalism","dative-definite-genitive":"formalismului","vocative":"formalismule"}},{"word":"formalist","pos":"adj","definitions":["formalistic"],"forms":{"feminine-singular":"formalistă","masculine-plural":"formaliști","feminine-neuter-plural":"formaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formalist","error-unrecognized-form-feminine-indefinite-singular":"formalistă","error-unrecognized-form-indefinite-masculine-plural":"formaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"formaliste","definite-error-unrecognized-form-masculine-neuter-singular":"formalistul","definite-error-unrecognized-form-feminine-singular":"formalista","definite-error-unrecognized-form-masculine-plural":"formaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"formalistele"}},{"word":"formalistă","pos":"noun","definitions":["female equivalent of formalist"],"forms":{"plural":"formaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"formalistă","accusative-definite-nominative-singular":"formalista","accusative-indefinite-nominative-plural":"formaliste","accusative-definite-nominative-plural":"formalistele","dative-genitive-indefinite-singular":"formaliste","dative-definite-genitive-singular":"formalistei","dative-genitive-indefinite-plural":"formaliste","dative-definite-genitive-plural":"formalistelor","singular-vocative":"formalistă","plural-vocative":"formalistelor"}},{"word":"formalitate","pos":"noun","definitions":["formality"],"pronunciation":"[for.ma.liˈta.te]","forms":{"plural":"formalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"formalitate","accusative-definite-nominative-singular":"formalitatea","accusative-indefinite-nominative-plural":"formalități","accusative-definite-nominative-plural":"formalitățile","dative-genitive-indefinite-singular":"formalități","dative-definite-genitive-singular":"formalității","dative-genitive-indefinite-plural":"formalități","dative-definite-genitive-plural":"formalităților","singular-vocative":"formalitate","plural-vocative":"formalităților"}},{"word":"formaliza","pos":"verb","definitions":["to formalize"],"forms":{"canonical":"a formaliza 1st conjugation","present-singular-third-person":"formalizează","participle-past":"formalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a formaliza","gerund":"formalizând","first-person-indicative-present-singular":"formalizez","indicative-present-second-person-singular":"formalizezi","indicative-present-singular-third-person":"formalizează","first-person-indicative-plural-present":"formalizăm","indicative-plural-present-second-person":"formalizați","indicative-plural-present-third-person":"formalizează","first-person-imperfect-indicative-singular":"formalizam","imperfect-indicative-second-person-singular":"formalizai","imperfect-indicative-singular-third-person":"formaliza","first-person-imperfect-indicative-plural":"formalizam","imperfect-indicative-plural-second-person":"formalizați","imperfect-indicative-plural-third-person":"formalizau","first-person-indicative-perfect-singular":"formalizai","indicative-perfect-second-person-singular":"formalizași","indicative-perfect-singular-third-person":"formaliză","first-person-indicative-perfect-plural":"formalizarăm","indicative-perfect-plural-second-person":"formalizarăți","indicative-perfect-plural-third-person":"formalizară","first-person-indicative-pluperfect-singular":"formalizasem","indicative-pluperfect-second-person-singular":"formalizaseși","indicative-pluperfect-singular-third-person":"formalizase","first-person-indicative-pluperfect-plural":"formalizaserăm","indicative-pluperfect-plural-second-person":"formalizaserăți","indicative-pluperfect-plural-third-person":"formalizaseră","first-person-present-singular-subjunctive":"să formalizez","present-second-person-singular-subjunctive":"să formalizezi","present-singular-subjunctive-third-person":"să formalizeze","first-person-plural-present-subjunctive":"să formalizăm","plural-present-second-person-subjunctive":"să formalizați","plural-present-subjunctive-third-person":"să formalizeze","imperative-second-person-singular":"formalizează","imperative-plural-second-person":"formalizați","imperative-negative-second-person-singular":"nu formaliza","imperative-negative-plural-second-person":"nu formalizați"}},{"word":"formalizare","pos":"noun","definitions":["formalization"],"forms":{"plural":"formalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formalizare","accusative-definite-nominative-singular":"formalizarea","accusative-indefinite-nominative-plural":"formalizări","accusative-definite-nominative-plural":"formalizările","dative-genitive-indefinite-singular":"formalizări","dative-definite-genitive-singular":"formalizării","dative-genitive-indefinite-plural":"formalizări","dative-definite-genitive-plural":"formalizărilor","singular-vocative":"formalizare","plural-vocative":"formalizărilor"}},{"word":"formam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of forma"],"pronunciation":"[forˈmam]"},{"word":"formăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of forma"],"pronunciation":"[forˈməm]"},{"word":"formând","pos":"verb","definitions":["gerund of forma"],"pronunciation":"[forˈmɨnd]"},{"word":"formant","pos":"noun","definitions":["formant"],"forms":{"plural":"formanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"formant","accusative-definite-nominative-singular":"formantul","accusative-indefinite-nominative-plural":"formanți","accusative-definite-nominative-plural":"formanții","dative-genitive-indefinite-singular":"formant","dative-definite-genitive-singular":"formantului","dative-genitive-indefinite-plural":"formanți","dative-definite-genitive-plural":"formanților","singular-vocative":"formantule","plural-vocative":"formanților"}},{"word":"formar","pos":"noun","definitions":["moulder"],"forms":{"plural":"formari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"formar","accusative-definite-nominative-singular":"formarul","accusative-indefinite-nominative-plural":"formari","accusative-definite-nominative-plural":"formarii","dative-genitive-indefinite-singular":"formar","dative-definite-genitive-singular":"formarului","dative-genitive-indefinite-plural":"formari","dative-definite-genitive-plural":"formarilor","singular-vocative":"formarule","plural-vocative":"formarilor"}},{"word":"formară","pos":"verb","definitions":["third-person plural simple perfect indicative of forma"],"pronunciation":"[forˈmarə]"},{"word":"formarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of forma"],"pronunciation":"[forˈmarəm]"},{"word":"formarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of forma"],"pronunciation":"[forˈmarət͡sʲ]"},{"word":"formare","pos":"noun","definitions":["formation"],"forms":{"plural":"formări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formare","accusative-definite-nominative-singular":"formarea","accusative-indefinite-nominative-plural":"formări","accusative-definite-nominative-plural":"formările","dative-genitive-indefinite-singular":"formări","dative-definite-genitive-singular":"formării","dative-genitive-indefinite-plural":"formări","dative-definite-genitive-plural":"formărilor","singular-vocative":"formare","plural-vocative":"formărilor"}},{"word":"formase","pos":"verb","definitions":["third-person singular pluperfect indicative of forma"],"pronunciation":"[forˈmase]"},{"word":"formasem","pos":"verb","definitions":["first-person singular pluperfect indicative of forma"],"pronunciation":"[forˈmasem]"},{"word":"formaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of forma"],"pronunciation":"[forˈmaserə]"},{"word":"formaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of forma"],"pronunciation":"[forˈmaserəm]"},{"word":"formaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of forma"],"pronunciation":"[forˈmaserət͡sʲ]"},{"word":"formaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of forma"],"pronunciation":"[forˈmaseʃʲ]"},{"word":"formași","pos":"verb","definitions":["second-person singular simple perfect indicative of forma"],"pronunciation":"[forˈmaʃʲ]"},{"word":"format","pos":"noun","definitions":["format","template"],"pronunciation":"/forˈmat/","forms":{"plural":"formate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"format","accusative-definite-nominative-singular":"formatul","accusative-indefinite-nominative-plural":"formate","accusative-definite-nominative-plural":"formatele","dative-genitive-indefinite-singular":"format","dative-definite-genitive-singular":"formatului","dative-genitive-indefinite-plural":"formate","dative-definite-genitive-plural":"formatelor","singular-vocative":"formatule","plural-vocative":"formatelor"}},{"word":"format","pos":"verb","definitions":["past participle of forma"],"pronunciation":"/forˈmat/"},{"word":"formata","pos":"adj","definitions":["definite nominative/accusative feminine singular of format"],"pronunciation":"/forˈma.ta/"},{"word":"formata","pos":"verb","definitions":["to format"],"pronunciation":"/for.maˈta/","forms":{"canonical":"a formata 1st conjugation","present-singular-third-person":"formatează","participle-past":"formatat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a formata","gerund":"formatând","first-person-indicative-present-singular":"formatez","indicative-present-second-person-singular":"formatezi","indicative-present-singular-third-person":"formatează","first-person-indicative-plural-present":"formatăm","indicative-plural-present-second-person":"formatați","indicative-plural-present-third-person":"formatează","first-person-imperfect-indicative-singular":"formatam","imperfect-indicative-second-person-singular":"formatai","imperfect-indicative-singular-third-person":"formata","first-person-imperfect-indicative-plural":"formatam","imperfect-indicative-plural-second-person":"formatați","imperfect-indicative-plural-third-person":"formatau","first-person-indicative-perfect-singular":"formatai","indicative-perfect-second-person-singular":"formatași","indicative-perfect-singular-third-person":"formată","first-person-indicative-perfect-plural":"formatarăm","indicative-perfect-plural-second-person":"formatarăți","indicative-perfect-plural-third-person":"formatară","first-person-indicative-pluperfect-singular":"formatasem","indicative-pluperfect-second-person-singular":"formataseși","indicative-pluperfect-singular-third-person":"formatase","first-person-indicative-pluperfect-plural":"formataserăm","indicative-pluperfect-plural-second-person":"formataserăți","indicative-pluperfect-plural-third-person":"formataseră","first-person-present-singular-subjunctive":"să formatez","present-second-person-singular-subjunctive":"să formatezi","present-singular-subjunctive-third-person":"să formateze","first-person-plural-present-subjunctive":"să formatăm","plural-present-second-person-subjunctive":"să formatați","plural-present-subjunctive-third-person":"să formateze","imperative-second-person-singular":"formatează","imperative-plural-second-person":"formatați","imperative-negative-second-person-singular":"nu formata","imperative-negative-plural-second-person":"nu formatați"}},{"word":"formată","pos":"adj","definitions":["feminine singular of format"],"pronunciation":"/forˈma.tə/"},{"word":"formatare","pos":"noun","definitions":["format (of a hard disk)"],"forms":{"plural":"formatări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formatare","accusative-definite-nominative-singular":"formatarea","accusative-indefinite-nominative-plural":"formatări","accusative-definite-nominative-plural":"formatările","dative-genitive-indefinite-singular":"formatări","dative-definite-genitive-singular":"formatării","dative-genitive-indefinite-plural":"formatări","dative-definite-genitive-plural":"formatărilor","singular-vocative":"formatare","plural-vocative":"formatărilor"}},{"word":"formatei","pos":"adj","definitions":["definite genitive/dative feminine singular of format"],"pronunciation":"[forˈmatej]"},{"word":"formatele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter singular of format"],"pronunciation":"[forˈmatele]"},{"word":"formatele","pos":"noun","definitions":["definite nominative/accusative plural of format"],"pronunciation":"[forˈmatele]","gender":"n-p"},{"word":"formatelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter singular of format"],"pronunciation":"[forˈmatelor]"},{"word":"formatelor","pos":"noun","definitions":["definite genitive/dative plural of format"],"pronunciation":"[forˈmatelor]","gender":"n-p"},{"word":"formați","pos":"adj","definitions":["definite masculine plural of format"],"pronunciation":"[forˈmat͡sʲ]"},{"word":"formați","pos":"verb","definitions":["inflection of forma:","second-person singular present/imperfect indicative","second-person singular present subjunctive","second-person singular imperative"],"pronunciation":"[forˈmat͡sʲ]"},{"word":"formație","pos":"noun","definitions":["formation, structure","a team","a band"],"pronunciation":"/forˈmat͡si.e/","forms":{"plural":"formații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"formație","accusative-definite-nominative-singular":"formația","accusative-indefinite-nominative-plural":"formații","accusative-definite-nominative-plural":"formațiile","dative-genitive-indefinite-singular":"formații","dative-definite-genitive-singular":"formației","dative-genitive-indefinite-plural":"formații","dative-definite-genitive-plural":"formațiilor","singular-vocative":"formație","plural-vocative":"formațiilor"}},{"word":"formații","pos":"adj","definitions":["definite nominative/accusative masculine plural of format"],"pronunciation":"[forˈmat͡siː]"},{"word":"formaților","pos":"adj","definitions":["definite genitive/dative masculine plural of format"],"pronunciation":"[forˈmat͡silor]"},{"word":"formațional","pos":"adj","definitions":["formational"],"forms":{"feminine-singular":"formațională","masculine-plural":"formaționali","feminine-neuter-plural":"formaționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formațional","error-unrecognized-form-feminine-indefinite-singular":"formațională","error-unrecognized-form-indefinite-masculine-plural":"formaționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"formaționale","definite-error-unrecognized-form-masculine-neuter-singular":"formaționalul","definite-error-unrecognized-form-feminine-singular":"formaționala","definite-error-unrecognized-form-masculine-plural":"formaționalii","definite-error-unrecognized-form-feminine-neuter-plural":"formaționalele"}},{"word":"formațiune","pos":"noun","definitions":["alternative form of formație"],"forms":{"plural":"formațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formațiune","accusative-definite-nominative-singular":"formațiunea","accusative-indefinite-nominative-plural":"formațiuni","accusative-definite-nominative-plural":"formațiunile","dative-genitive-indefinite-singular":"formațiuni","dative-definite-genitive-singular":"formațiunii","dative-genitive-indefinite-plural":"formațiuni","dative-definite-genitive-plural":"formațiunilor","singular-vocative":"formațiune","plural-vocative":"formațiunilor"}},{"word":"formativ","pos":"adj","definitions":["formative"],"forms":{"feminine-singular":"formativă","masculine-plural":"formativi","feminine-neuter-plural":"formative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formativ","error-unrecognized-form-feminine-indefinite-singular":"formativă","error-unrecognized-form-indefinite-masculine-plural":"formativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"formative","definite-error-unrecognized-form-masculine-neuter-singular":"formativul","definite-error-unrecognized-form-feminine-singular":"formativa","definite-error-unrecognized-form-masculine-plural":"formativii","definite-error-unrecognized-form-feminine-neuter-plural":"formativele"}},{"word":"formatoare","pos":"noun","definitions":["female equivalent of formator"],"forms":{"plural":"formatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"formatoare","accusative-definite-nominative-singular":"formatoarea","accusative-indefinite-nominative-plural":"formatoare","accusative-definite-nominative-plural":"formatoarele","dative-genitive-indefinite-singular":"formatoare","dative-definite-genitive-singular":"formatoarei","dative-genitive-indefinite-plural":"formatoare","dative-definite-genitive-plural":"formatoarelor","singular-vocative":"formatoare","plural-vocative":"formatoarelor"}},{"word":"formator","pos":"adj","definitions":["forming"],"forms":{"feminine-singular":"formatoare","masculine-plural":"formatori","feminine-neuter-plural":"formatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formator","error-unrecognized-form-feminine-indefinite-singular":"formatoare","error-unrecognized-form-indefinite-masculine-plural":"formatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"formatoare","definite-error-unrecognized-form-masculine-neuter-singular":"formatorul","definite-error-unrecognized-form-feminine-singular":"formatoarea","definite-error-unrecognized-form-masculine-plural":"formatorii","definite-error-unrecognized-form-feminine-neuter-plural":"formatoarele"}},{"word":"formatul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of format"],"pronunciation":"/forˈmatul/"},{"word":"formatul","pos":"noun","definitions":["definite nominative/accusative singular of format"],"pronunciation":"/forˈmatul/","gender":"n"},{"word":"formatului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of format"],"pronunciation":"[forˈmatuluj]"},{"word":"formatului","pos":"noun","definitions":["definite genitive/dative singular of format"],"pronunciation":"[forˈmatuluj]","gender":"n"},{"word":"formau","pos":"verb","definitions":["third-person plural imperfect indicative of forma"],"pronunciation":"[forˈmaw]"},{"word":"forme","pos":"noun","definitions":["plural of formă"],"pronunciation":"[ˈforme]","gender":"f-p"},{"word":"formează","pos":"verb","definitions":["inflection of forma:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[forˈme̯azə]"},{"word":"formei","pos":"noun","definitions":["definite genitive/dative singular of formă"],"pronunciation":"[ˈformej]","gender":"f"},{"word":"formele","pos":"noun","definitions":["definite nominative/accusative plural of formă"],"pronunciation":"[ˈformele]","gender":"f-p"},{"word":"formelor","pos":"noun","definitions":["definite genitive/dative plural of formă"],"pronunciation":"[ˈformelor]","gender":"f-p"},{"word":"formez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of forma"],"pronunciation":"[forˈmez]"},{"word":"formeze","pos":"verb","definitions":["third-person singular/plural present subjunctive of forma"],"pronunciation":"[forˈmeze]"},{"word":"formezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of forma"],"pronunciation":"[forˈmezʲ]"},{"word":"formiat","pos":"noun","definitions":["formate"],"forms":{"plural":"formiați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"formiat","accusative-definite-nominative-singular":"formiatul","accusative-indefinite-nominative-plural":"formiați","accusative-definite-nominative-plural":"formiații","dative-genitive-indefinite-singular":"formiat","dative-definite-genitive-singular":"formiatului","dative-genitive-indefinite-plural":"formiați","dative-definite-genitive-plural":"formiaților","singular-vocative":"formiatule","plural-vocative":"formiaților"}},{"word":"formic","pos":"adj","definitions":["formic"],"forms":{"feminine-singular":"formică","masculine-plural":"formici","feminine-neuter-plural":"formice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"formic","error-unrecognized-form-feminine-indefinite-singular":"formică","error-unrecognized-form-indefinite-masculine-plural":"formici","error-unrecognized-form-feminine-indefinite-neuter-plural":"formice","definite-error-unrecognized-form-masculine-neuter-singular":"formicul","definite-error-unrecognized-form-feminine-singular":"formica","definite-error-unrecognized-form-masculine-plural":"formicii","definite-error-unrecognized-form-feminine-neuter-plural":"formicele"}},{"word":"formidabil","pos":"adj","definitions":["formidable"],"pronunciation":"/ˌfor.miˈda.bil/","forms":{"feminine-singular":"formidabilă","masculine-plural":"formidabili","feminine-neuter-plural":"formidabile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"formidabil","error-unrecognized-form-feminine-indefinite-singular":"formidabilă","error-unrecognized-form-indefinite-masculine-plural":"formidabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"formidabile","definite-error-unrecognized-form-masculine-neuter-singular":"formidabilul","definite-error-unrecognized-form-feminine-singular":"formidabila","definite-error-unrecognized-form-masculine-plural":"formidabilii","definite-error-unrecognized-form-feminine-neuter-plural":"formidabilele"}},{"word":"formo","pos":"noun","definitions":["vocative singular of formă"],"pronunciation":"[ˈformo]","gender":"f"},{"word":"formol","pos":"noun","definitions":["formol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"formol","accusative-definite-nominative":"formolul","dative-genitive-indefinite":"formol","dative-definite-genitive":"formolului","vocative":"formolule"}},{"word":"formolizare","pos":"noun","definitions":["treating with formaldehyde"],"forms":{"plural":"formolizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formolizare","accusative-definite-nominative-singular":"formolizarea","accusative-indefinite-nominative-plural":"formolizări","accusative-definite-nominative-plural":"formolizările","dative-genitive-indefinite-singular":"formolizări","dative-definite-genitive-singular":"formolizării","dative-genitive-indefinite-plural":"formolizări","dative-definite-genitive-plural":"formolizărilor","singular-vocative":"formolizare","plural-vocative":"formolizărilor"}},{"word":"formula","pos":"verb","definitions":["to formulate"],"pronunciation":"[for.muˈla]","forms":{"canonical":"a formula 1st conjugation","present-singular-third-person":"formulează","participle-past":"formulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a formula","gerund":"formulând","first-person-indicative-present-singular":"formulez","indicative-present-second-person-singular":"formulezi","indicative-present-singular-third-person":"formulează","first-person-indicative-plural-present":"formulăm","indicative-plural-present-second-person":"formulați","indicative-plural-present-third-person":"formulează","first-person-imperfect-indicative-singular":"formulam","imperfect-indicative-second-person-singular":"formulai","imperfect-indicative-singular-third-person":"formula","first-person-imperfect-indicative-plural":"formulam","imperfect-indicative-plural-second-person":"formulați","imperfect-indicative-plural-third-person":"formulau","first-person-indicative-perfect-singular":"formulai","indicative-perfect-second-person-singular":"formulași","indicative-perfect-singular-third-person":"formulă","first-person-indicative-perfect-plural":"formularăm","indicative-perfect-plural-second-person":"formularăți","indicative-perfect-plural-third-person":"formulară","first-person-indicative-pluperfect-singular":"formulasem","indicative-pluperfect-second-person-singular":"formulaseși","indicative-pluperfect-singular-third-person":"formulase","first-person-indicative-pluperfect-plural":"formulaserăm","indicative-pluperfect-plural-second-person":"formulaserăți","indicative-pluperfect-plural-third-person":"formulaseră","first-person-present-singular-subjunctive":"să formulez","present-second-person-singular-subjunctive":"să formulezi","present-singular-subjunctive-third-person":"să formuleze","first-person-plural-present-subjunctive":"să formulăm","plural-present-second-person-subjunctive":"să formulați","plural-present-subjunctive-third-person":"să formuleze","imperative-second-person-singular":"formulează","imperative-plural-second-person":"formulați","imperative-negative-second-person-singular":"nu formula","imperative-negative-plural-second-person":"nu formulați"}},{"word":"formula","pos":"noun","definitions":["definite nominative/accusative singular of formulă"],"pronunciation":"[forˈmu.la]","gender":"f"},{"word":"formulă","pos":"noun","definitions":["formula, method","phrase"],"pronunciation":"/forˈmulə/","forms":{"plural":"formule"}},{"word":"formulă empirică","pos":"noun","definitions":["empirical formula"],"forms":{"plural":"formule empirice"}},{"word":"formula lui Euler","pos":"noun","definitions":["Euler's formula"]},{"word":"formulă moleculară","pos":"noun","definitions":["molecular formula"],"forms":{"plural":"formule moleculare"}},{"word":"formulă structurală","pos":"noun","definitions":["structural formula"],"forms":{"plural":"formule structurale"}},{"word":"formular","pos":"noun","definitions":["form"],"forms":{"plural":"formulare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"formular","accusative-definite-nominative-singular":"formularul","accusative-indefinite-nominative-plural":"formulare","accusative-definite-nominative-plural":"formularele","dative-genitive-indefinite-singular":"formular","dative-definite-genitive-singular":"formularului","dative-genitive-indefinite-plural":"formulare","dative-definite-genitive-plural":"formularelor","singular-vocative":"formularule","plural-vocative":"formularelor"}},{"word":"formulare","pos":"noun","definitions":["formulation"],"forms":{"plural":"formulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"formulare","accusative-definite-nominative-singular":"formularea","accusative-indefinite-nominative-plural":"formulări","accusative-definite-nominative-plural":"formulările","dative-genitive-indefinite-singular":"formulări","dative-definite-genitive-singular":"formulării","dative-genitive-indefinite-plural":"formulări","dative-definite-genitive-plural":"formulărilor","singular-vocative":"formulare","plural-vocative":"formulărilor"}},{"word":"formule","pos":"noun","definitions":["inflection of formulă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[forˈmule]","gender":"f"},{"word":"formulei","pos":"noun","definitions":["definite genitive/dative singular of formulă"],"pronunciation":"[forˈmulej]","gender":"f"},{"word":"formulo","pos":"noun","definitions":["vocative singular of formulă"],"pronunciation":"[forˈmulo]","gender":"f"},{"word":"Fornădia","pos":"name","definitions":["a river in Romania, tributary to the Căian","a village in Șoimuș, Hunedoara County, Romania"],"gender":"f"},{"word":"fornica","pos":"verb","definitions":["to fornicate"],"forms":{"canonical":"a fornica 1st conjugation","present-singular-third-person":"fornică","participle-past":"fornicat","subjunctive-third-person":"fornice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fornica","gerund":"fornicând","first-person-indicative-present-singular":"fornic","indicative-present-second-person-singular":"fornici","indicative-present-singular-third-person":"fornică","first-person-indicative-plural-present":"fornicăm","indicative-plural-present-second-person":"fornicați","indicative-plural-present-third-person":"fornică","first-person-imperfect-indicative-singular":"fornicam","imperfect-indicative-second-person-singular":"fornicai","imperfect-indicative-singular-third-person":"fornica","first-person-imperfect-indicative-plural":"fornicam","imperfect-indicative-plural-second-person":"fornicați","imperfect-indicative-plural-third-person":"fornicau","first-person-indicative-perfect-singular":"fornicai","indicative-perfect-second-person-singular":"fornicași","indicative-perfect-singular-third-person":"fornică","first-person-indicative-perfect-plural":"fornicarăm","indicative-perfect-plural-second-person":"fornicarăți","indicative-perfect-plural-third-person":"fornicară","first-person-indicative-pluperfect-singular":"fornicasem","indicative-pluperfect-second-person-singular":"fornicaseși","indicative-pluperfect-singular-third-person":"fornicase","first-person-indicative-pluperfect-plural":"fornicaserăm","indicative-pluperfect-plural-second-person":"fornicaserăți","indicative-pluperfect-plural-third-person":"fornicaseră","first-person-present-singular-subjunctive":"să fornic","present-second-person-singular-subjunctive":"să fornici","present-singular-subjunctive-third-person":"să fornice","first-person-plural-present-subjunctive":"să fornicăm","plural-present-second-person-subjunctive":"să fornicați","plural-present-subjunctive-third-person":"să fornice","imperative-second-person-singular":"fornică","imperative-plural-second-person":"fornicați","imperative-negative-second-person-singular":"nu fornica","imperative-negative-plural-second-person":"nu fornicați"}},{"word":"fornicație","pos":"noun","definitions":["fornication"],"forms":{"plural":"fornicații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fornicație","accusative-definite-nominative-singular":"fornicația","accusative-indefinite-nominative-plural":"fornicații","accusative-definite-nominative-plural":"fornicațiile","dative-genitive-indefinite-singular":"fornicații","dative-definite-genitive-singular":"fornicației","dative-genitive-indefinite-plural":"fornicații","dative-definite-genitive-plural":"fornicațiilor","singular-vocative":"fornicație","plural-vocative":"fornicațiilor"}},{"word":"fornicator","pos":"noun","definitions":["fornicator"],"forms":{"plural":"fornicatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fornicator","accusative-definite-nominative-singular":"fornicatorul","accusative-indefinite-nominative-plural":"fornicatori","accusative-definite-nominative-plural":"fornicatorii","dative-genitive-indefinite-singular":"fornicator","dative-definite-genitive-singular":"fornicatorului","dative-genitive-indefinite-plural":"fornicatori","dative-definite-genitive-plural":"fornicatorilor","singular-vocative":"fornicatorule","plural-vocative":"fornicatorilor"}},{"word":"Forosig","pos":"name","definitions":["a village in Holod, Bihor County, Romania"],"gender":"m"},{"word":"Foroșigan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Foroșigan"}},{"word":"forostoi","pos":"verb","definitions":["to solder"],"forms":{"canonical":"a forostoi 4th conjugation","present-singular-third-person":"forostoiește","participle-past":"forostoit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a forostoi","gerund":"forostoind","first-person-indicative-present-singular":"forostoiesc","indicative-present-second-person-singular":"forostoiești","indicative-present-singular-third-person":"forostoiește","first-person-indicative-plural-present":"forostoim","indicative-plural-present-second-person":"forostoiți","indicative-plural-present-third-person":"forostoiesc","first-person-imperfect-indicative-singular":"forostoiam","imperfect-indicative-second-person-singular":"forostoiai","imperfect-indicative-singular-third-person":"forostoia","first-person-imperfect-indicative-plural":"forostoiam","imperfect-indicative-plural-second-person":"forostoiați","imperfect-indicative-plural-third-person":"forostoiau","first-person-indicative-perfect-singular":"forostoii","indicative-perfect-second-person-singular":"forostoiși","indicative-perfect-singular-third-person":"forostoi","first-person-indicative-perfect-plural":"forostoirăm","indicative-perfect-plural-second-person":"forostoirăți","indicative-perfect-plural-third-person":"forostoiră","first-person-indicative-pluperfect-singular":"forostoisem","indicative-pluperfect-second-person-singular":"forostoiseși","indicative-pluperfect-singular-third-person":"forostoise","first-person-indicative-pluperfect-plural":"forostoiserăm","indicative-pluperfect-plural-second-person":"forostoiserăți","indicative-pluperfect-plural-third-person":"forostoiseră","first-person-present-singular-subjunctive":"să forostoiesc","present-second-person-singular-subjunctive":"să forostoiești","present-singular-subjunctive-third-person":"să forostoiască","first-person-plural-present-subjunctive":"să forostoim","plural-present-second-person-subjunctive":"să forostoiți","plural-present-subjunctive-third-person":"să forostoiască","imperative-second-person-singular":"forostoiește","imperative-plural-second-person":"forostoiți","imperative-negative-second-person-singular":"nu forostoi","imperative-negative-plural-second-person":"nu forostoiți"}},{"word":"Foroticean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Foroticean"}},{"word":"Forotician","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Forotician"}},{"word":"forsiția","pos":"noun","definitions":["forsythia"],"forms":{"plural":"forsiții","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"forsiția","accusative-definite-nominative-singular":"forsiția","accusative-indefinite-nominative-plural":"forsiții","accusative-definite-nominative-plural":"forsițiile","dative-genitive-indefinite-singular":"forsiții","dative-definite-genitive-singular":"forsițiii","dative-genitive-indefinite-plural":"forsiții","dative-definite-genitive-plural":"forsițiilor","singular-vocative":"-","plural-vocative":"-"}},{"word":"forșpan","pos":"noun","definitions":["preview, trailer"],"forms":{"plural":"forșpanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forșpan","accusative-definite-nominative-singular":"forșpanul","accusative-indefinite-nominative-plural":"forșpanuri","accusative-definite-nominative-plural":"forșpanurile","dative-genitive-indefinite-singular":"forșpan","dative-definite-genitive-singular":"forșpanului","dative-genitive-indefinite-plural":"forșpanuri","dative-definite-genitive-plural":"forșpanurilor","singular-vocative":"forșpanule","plural-vocative":"forșpanurilor"}},{"word":"forsterit","pos":"noun","definitions":["forsterite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"forsterit","accusative-definite-nominative-singular":"forsteritul","accusative-indefinite-nominative-plural":"forsterite","accusative-definite-nominative-plural":"forsteritele","dative-genitive-indefinite-singular":"forsterit","dative-definite-genitive-singular":"forsteritului","dative-genitive-indefinite-plural":"forsterite","dative-definite-genitive-plural":"forsteritelor","singular-vocative":"forsteritule","plural-vocative":"forsteritelor"}},{"word":"fort","pos":"noun","definitions":["fort, fortification"],"forms":{"plural":"forturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fort","accusative-definite-nominative-singular":"fortul","accusative-indefinite-nominative-plural":"forturi","accusative-definite-nominative-plural":"forturile","dative-genitive-indefinite-singular":"fort","dative-definite-genitive-singular":"fortului","dative-genitive-indefinite-plural":"forturi","dative-definite-genitive-plural":"forturilor","singular-vocative":"fortule","plural-vocative":"forturilor"}},{"word":"forța","pos":"verb","definitions":["to force","to oblige"],"forms":{"canonical":"a forța 1st conjugation","present-singular-third-person":"forțează","participle-past":"forțat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a forța","gerund":"forțând","first-person-indicative-present-singular":"forțez","indicative-present-second-person-singular":"forțezi","indicative-present-singular-third-person":"forțează","first-person-indicative-plural-present":"forțăm","indicative-plural-present-second-person":"forțați","indicative-plural-present-third-person":"forțează","first-person-imperfect-indicative-singular":"forțam","imperfect-indicative-second-person-singular":"forțai","imperfect-indicative-singular-third-person":"forța","first-person-imperfect-indicative-plural":"forțam","imperfect-indicative-plural-second-person":"forțați","imperfect-indicative-plural-third-person":"forțau","first-person-indicative-perfect-singular":"forțai","indicative-perfect-second-person-singular":"forțași","indicative-perfect-singular-third-person":"forță","first-person-indicative-perfect-plural":"forțarăm","indicative-perfect-plural-second-person":"forțarăți","indicative-perfect-plural-third-person":"forțară","first-person-indicative-pluperfect-singular":"forțasem","indicative-pluperfect-second-person-singular":"forțaseși","indicative-pluperfect-singular-third-person":"forțase","first-person-indicative-pluperfect-plural":"forțaserăm","indicative-pluperfect-plural-second-person":"forțaserăți","indicative-pluperfect-plural-third-person":"forțaseră","first-person-present-singular-subjunctive":"să forțez","present-second-person-singular-subjunctive":"să forțezi","present-singular-subjunctive-third-person":"să forțeze","first-person-plural-present-subjunctive":"să forțăm","plural-present-second-person-subjunctive":"să forțați","plural-present-subjunctive-third-person":"să forțeze","imperative-second-person-singular":"forțează","imperative-plural-second-person":"forțați","imperative-negative-second-person-singular":"nu forța","imperative-negative-plural-second-person":"nu forțați"}},{"word":"forță","pos":"noun","definitions":["force","strength","power","sinew"],"forms":{"plural":"forțe"}},{"word":"forță aeriană","pos":"noun","definitions":["air force"],"forms":{"plural":"forțe aeriene"}},{"word":"forță armată","pos":"noun","definitions":["armed forces"],"forms":{"plural":"forțe armate"}},{"word":"forță centrifugă","pos":"noun","definitions":["centrifugal force"]},{"word":"forță centripetă","pos":"noun","definitions":["centripetal force"]},{"word":"forță de gravitație","pos":"noun","definitions":["gravitational force"],"forms":{"plural":"forțe de gravitație"}},{"word":"forță de muncă","pos":"noun","definitions":["labour force"],"pronunciation":"/ˌfort͡sə de ˈmuŋkə/","forms":{"plural":"forțe de muncă"}},{"word":"forță electromagnetică","pos":"noun","definitions":["electromagnetic force"]},{"word":"forță electromotoare","pos":"noun","definitions":["electromotive force"]},{"word":"forță fundamentală","pos":"noun","definitions":["fundamental interaction"],"forms":{"plural":"forțe fundamentale"}},{"word":"forță gravitațională","pos":"noun","definitions":["gravitational force"],"forms":{"plural":"forțe gravitaționale"}},{"word":"forță motoare","pos":"noun","definitions":["driving force"],"forms":{"plural":"forțe motoare"}},{"word":"forță motrice","pos":"noun","definitions":["driving force"],"forms":{"plural":"forțe motrice"}},{"word":"forță navală","pos":"noun","definitions":["navy"],"forms":{"plural":"forțe navale"}},{"word":"forță nucleară","pos":"noun","definitions":["nuclear force"],"forms":{"plural":"forțe nucleare"}},{"word":"forțamente","pos":"adv","definitions":["necessarily"]},{"word":"forțare","pos":"noun","definitions":["forcing"],"forms":{"plural":"forțări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"forțare","accusative-definite-nominative-singular":"forțarea","accusative-indefinite-nominative-plural":"forțări","accusative-definite-nominative-plural":"forțările","dative-genitive-indefinite-singular":"forțări","dative-definite-genitive-singular":"forțării","dative-genitive-indefinite-plural":"forțări","dative-definite-genitive-plural":"forțărilor","singular-vocative":"forțare","plural-vocative":"forțărilor"}},{"word":"fortăreață","pos":"noun","definitions":["fortress"],"forms":{"plural":"fortărețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fortăreață","accusative-definite-nominative-singular":"fortăreața","accusative-indefinite-nominative-plural":"fortărețe","accusative-definite-nominative-plural":"fortărețele","dative-genitive-indefinite-singular":"fortărețe","dative-definite-genitive-singular":"fortăreței","dative-genitive-indefinite-plural":"fortărețe","dative-definite-genitive-plural":"fortărețelor","singular-vocative":"fortăreață","plural-vocative":"fortărețelor"}},{"word":"fortăreață zburătoare","pos":"noun","definitions":["Flying Fortress"],"forms":{"plural":"fortărețe zburătoare"}},{"word":"forțat","pos":"adj","definitions":["forced"],"forms":{"feminine-singular":"forțată","masculine-plural":"forțați","feminine-neuter-plural":"forțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forțat","error-unrecognized-form-feminine-indefinite-singular":"forțată","error-unrecognized-form-indefinite-masculine-plural":"forțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"forțate","definite-error-unrecognized-form-masculine-neuter-singular":"forțatul","definite-error-unrecognized-form-feminine-singular":"forțata","definite-error-unrecognized-form-masculine-plural":"forțații","definite-error-unrecognized-form-feminine-neuter-plural":"forțatele"}},{"word":"forte","pos":"adj","definitions":["strong, powerful"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"forte","error-unrecognized-form-feminine-indefinite-singular":"forte","error-unrecognized-form-indefinite-masculine-plural":"forte","error-unrecognized-form-feminine-indefinite-neuter-plural":"forte","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"forte","pos":"adv","definitions":["strongly"]},{"word":"forțe armate","pos":"noun","definitions":["armed forces"]},{"word":"Forțeni","pos":"name","definitions":["a village in Feliceni, Harghita County, Romania"],"gender":"m"},{"word":"Forțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Forțescu"}},{"word":"forteță","pos":"noun","definitions":["fortress"],"forms":{"plural":"fortețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"forteță","accusative-definite-nominative-singular":"forteța","accusative-indefinite-nominative-plural":"fortețe","accusative-definite-nominative-plural":"fortețele","dative-genitive-indefinite-singular":"fortețe","dative-definite-genitive-singular":"forteței","dative-genitive-indefinite-plural":"fortețe","dative-definite-genitive-plural":"fortețelor","singular-vocative":"forteță","plural-vocative":"fortețelor"}},{"word":"fortifiant","pos":"adj","definitions":["fortifying"],"forms":{"feminine-singular":"fortifiantă","masculine-plural":"fortifianți","feminine-neuter-plural":"fortifiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fortifiant","error-unrecognized-form-feminine-indefinite-singular":"fortifiantă","error-unrecognized-form-indefinite-masculine-plural":"fortifianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fortifiante","definite-error-unrecognized-form-masculine-neuter-singular":"fortifiantul","definite-error-unrecognized-form-feminine-singular":"fortifianta","definite-error-unrecognized-form-masculine-plural":"fortifianții","definite-error-unrecognized-form-feminine-neuter-plural":"fortifiantele"}},{"word":"fortifica","pos":"verb","definitions":["to fortify (make stronger)"],"pronunciation":"/for.ti.fiˈka/","forms":{"canonical":"a fortifica 1st conjugation","present-singular-third-person":"fortifică","participle-past":"fortificat","subjunctive-third-person":"fortifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fortifica","gerund":"fortificând","first-person-indicative-present-singular":"fortific","indicative-present-second-person-singular":"fortifici","indicative-present-singular-third-person":"fortifică","first-person-indicative-plural-present":"fortificăm","indicative-plural-present-second-person":"fortificați","indicative-plural-present-third-person":"fortifică","first-person-imperfect-indicative-singular":"fortificam","imperfect-indicative-second-person-singular":"fortificai","imperfect-indicative-singular-third-person":"fortifica","first-person-imperfect-indicative-plural":"fortificam","imperfect-indicative-plural-second-person":"fortificați","imperfect-indicative-plural-third-person":"fortificau","first-person-indicative-perfect-singular":"fortificai","indicative-perfect-second-person-singular":"fortificași","indicative-perfect-singular-third-person":"fortifică","first-person-indicative-perfect-plural":"fortificarăm","indicative-perfect-plural-second-person":"fortificarăți","indicative-perfect-plural-third-person":"fortificară","first-person-indicative-pluperfect-singular":"fortificasem","indicative-pluperfect-second-person-singular":"fortificaseși","indicative-pluperfect-singular-third-person":"fortificase","first-person-indicative-pluperfect-plural":"fortificaserăm","indicative-pluperfect-plural-second-person":"fortificaserăți","indicative-pluperfect-plural-third-person":"fortificaseră","first-person-present-singular-subjunctive":"să fortific","present-second-person-singular-subjunctive":"să fortifici","present-singular-subjunctive-third-person":"să fortifice","first-person-plural-present-subjunctive":"să fortificăm","plural-present-second-person-subjunctive":"să fortificați","plural-present-subjunctive-third-person":"să fortifice","imperative-second-person-singular":"fortifică","imperative-plural-second-person":"fortificați","imperative-negative-second-person-singular":"nu fortifica","imperative-negative-plural-second-person":"nu fortificați"}},{"word":"fortificant","pos":"noun","definitions":["stimulant"],"forms":{"plural":"fortificanți","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fortificant","accusative-definite-nominative-singular":"fortificantul","accusative-indefinite-nominative-plural":"fortificanți","accusative-definite-nominative-plural":"fortificanțile","dative-genitive-indefinite-singular":"fortificant","dative-definite-genitive-singular":"fortificantului","dative-genitive-indefinite-plural":"fortificanți","dative-definite-genitive-plural":"fortificanților","singular-vocative":"fortificantule","plural-vocative":"fortificanților"}},{"word":"fortificare","pos":"noun","definitions":["fortification"],"forms":{"plural":"fortificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fortificare","accusative-definite-nominative-singular":"fortificarea","accusative-indefinite-nominative-plural":"fortificări","accusative-definite-nominative-plural":"fortificările","dative-genitive-indefinite-singular":"fortificări","dative-definite-genitive-singular":"fortificării","dative-genitive-indefinite-plural":"fortificări","dative-definite-genitive-plural":"fortificărilor","singular-vocative":"fortificare","plural-vocative":"fortificărilor"}},{"word":"fortificat","pos":"adj","definitions":["fortified"],"forms":{"feminine-singular":"fortificată","masculine-plural":"fortificați","feminine-neuter-plural":"fortificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fortificat","error-unrecognized-form-feminine-indefinite-singular":"fortificată","error-unrecognized-form-indefinite-masculine-plural":"fortificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fortificate","definite-error-unrecognized-form-masculine-neuter-singular":"fortificatul","definite-error-unrecognized-form-feminine-singular":"fortificata","definite-error-unrecognized-form-masculine-plural":"fortificații","definite-error-unrecognized-form-feminine-neuter-plural":"fortificatele"}},{"word":"fortificație","pos":"noun","definitions":["fortification"],"forms":{"plural":"fortificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fortificație","accusative-definite-nominative-singular":"fortificația","accusative-indefinite-nominative-plural":"fortificații","accusative-definite-nominative-plural":"fortificațiile","dative-genitive-indefinite-singular":"fortificații","dative-definite-genitive-singular":"fortificației","dative-genitive-indefinite-plural":"fortificații","dative-definite-genitive-plural":"fortificațiilor","singular-vocative":"fortificație","plural-vocative":"fortificațiilor"}},{"word":"fortificațiune","pos":"noun","definitions":["obsolete form of fortificație"],"forms":{"plural":"fortificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fortificațiune","accusative-definite-nominative-singular":"fortificațiunea","accusative-indefinite-nominative-plural":"fortificațiuni","accusative-definite-nominative-plural":"fortificațiunile","dative-genitive-indefinite-singular":"fortificațiuni","dative-definite-genitive-singular":"fortificațiunii","dative-genitive-indefinite-plural":"fortificațiuni","dative-definite-genitive-plural":"fortificațiunilor","singular-vocative":"fortificațiune","plural-vocative":"fortificațiunilor"}},{"word":"fortissimo","pos":"adv","definitions":["fortissimo"]},{"word":"fortuit","pos":"adj","definitions":["fortuitous"],"forms":{"feminine-singular":"fortuită","masculine-plural":"fortuiți","feminine-neuter-plural":"fortuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fortuit","error-unrecognized-form-feminine-indefinite-singular":"fortuită","error-unrecognized-form-indefinite-masculine-plural":"fortuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fortuite","definite-error-unrecognized-form-masculine-neuter-singular":"fortuitul","definite-error-unrecognized-form-feminine-singular":"fortuita","definite-error-unrecognized-form-masculine-plural":"fortuiții","definite-error-unrecognized-form-feminine-neuter-plural":"fortuitele"}},{"word":"fortul","pos":"noun","definitions":["definite nominative/accusative singular of fort"]},{"word":"Fortuna","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fortuna"}},{"word":"fortună","pos":"noun","definitions":["obsolete form of furtună"],"forms":{"plural":"fortuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fortună","accusative-definite-nominative-singular":"fortuna","accusative-indefinite-nominative-plural":"fortuni","accusative-definite-nominative-plural":"fortunile","dative-genitive-indefinite-singular":"fortuni","dative-definite-genitive-singular":"fortunii","dative-genitive-indefinite-plural":"fortuni","dative-definite-genitive-plural":"fortunilor","singular-vocative":"fortună","plural-vocative":"fortunilor"}},{"word":"Fortunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fortunescu"}},{"word":"forturi","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of fort"]},{"word":"forturile","pos":"noun","definitions":["definite nominative/accusative plural of fort"]},{"word":"forum","pos":"noun","definitions":["forum"],"forms":{"plural":"forumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forum","accusative-definite-nominative-singular":"forumul","accusative-indefinite-nominative-plural":"forumuri","accusative-definite-nominative-plural":"forumurile","dative-genitive-indefinite-singular":"forum","dative-definite-genitive-singular":"forumului","dative-genitive-indefinite-plural":"forumuri","dative-definite-genitive-plural":"forumurilor","singular-vocative":"forumule","plural-vocative":"forumurilor"}},{"word":"foruri","pos":"noun","definitions":["plural of for"]},{"word":"forzaț","pos":"noun","definitions":["flyleaf"],"forms":{"plural":"forzațuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"forzaț","accusative-definite-nominative-singular":"forzațul","accusative-indefinite-nominative-plural":"forzațuri","accusative-definite-nominative-plural":"forzațurile","dative-genitive-indefinite-singular":"forzaț","dative-definite-genitive-singular":"forzațului","dative-genitive-indefinite-plural":"forzațuri","dative-definite-genitive-plural":"forzațurilor","singular-vocative":"forzațule","plural-vocative":"forzațurilor"}},{"word":"fosa","pos":"noun","definitions":["definite nominative/accusative singular of fosă"],"pronunciation":"[ˈfosa]","gender":"f"},{"word":"fosă","pos":"noun","definitions":["pit, hole, cavity, gap (in an anatomical structure)","orchestra pit","oceanic trench"],"forms":{"plural":"fose"}},{"word":"foșcăi","pos":"verb","definitions":["alternative form of fojgăi"],"forms":{"canonical":"a foșcăi 4th conjugation","present-singular-third-person":"foșcăiește","participle-past":"foșcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a foșcăi","gerund":"foșcăind","first-person-indicative-present-singular":"foșcăiesc","indicative-present-second-person-singular":"foșcăiești","indicative-present-singular-third-person":"foșcăiește","first-person-indicative-plural-present":"foșcăim","indicative-plural-present-second-person":"foșcăiți","indicative-plural-present-third-person":"foșcăiesc","first-person-imperfect-indicative-singular":"foșcăiam","imperfect-indicative-second-person-singular":"foșcăiai","imperfect-indicative-singular-third-person":"foșcăia","first-person-imperfect-indicative-plural":"foșcăiam","imperfect-indicative-plural-second-person":"foșcăiați","imperfect-indicative-plural-third-person":"foșcăiau","first-person-indicative-perfect-singular":"foșcăii","indicative-perfect-second-person-singular":"foșcăiși","indicative-perfect-singular-third-person":"foșcăi","first-person-indicative-perfect-plural":"foșcăirăm","indicative-perfect-plural-second-person":"foșcăirăți","indicative-perfect-plural-third-person":"foșcăiră","first-person-indicative-pluperfect-singular":"foșcăisem","indicative-pluperfect-second-person-singular":"foșcăiseși","indicative-pluperfect-singular-third-person":"foșcăise","first-person-indicative-pluperfect-plural":"foșcăiserăm","indicative-pluperfect-plural-second-person":"foșcăiserăți","indicative-pluperfect-plural-third-person":"foșcăiseră","first-person-present-singular-subjunctive":"să foșcăiesc","present-second-person-singular-subjunctive":"să foșcăiești","present-singular-subjunctive-third-person":"să foșcăiască","first-person-plural-present-subjunctive":"să foșcăim","plural-present-second-person-subjunctive":"să foșcăiți","plural-present-subjunctive-third-person":"să foșcăiască","imperative-second-person-singular":"foșcăiește","imperative-plural-second-person":"foșcăiți","imperative-negative-second-person-singular":"nu foșcăi","imperative-negative-plural-second-person":"nu foșcăiți"}},{"word":"foșcăitură","pos":"noun","definitions":["alternative form of fojgăitură"],"forms":{"plural":"foșcăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"foșcăitură","accusative-definite-nominative-singular":"foșcăitura","accusative-indefinite-nominative-plural":"foșcăituri","accusative-definite-nominative-plural":"foșcăiturile","dative-genitive-indefinite-singular":"foșcăituri","dative-definite-genitive-singular":"foșcăiturii","dative-genitive-indefinite-plural":"foșcăituri","dative-definite-genitive-plural":"foșcăiturilor","singular-vocative":"foșcăitură","plural-vocative":"foșcăiturilor"}},{"word":"fose","pos":"noun","definitions":["inflection of fosă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfose]","gender":"f"},{"word":"fosetă","pos":"noun","definitions":["dimple"],"forms":{"plural":"fosete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosetă","accusative-definite-nominative-singular":"foseta","accusative-indefinite-nominative-plural":"fosete","accusative-definite-nominative-plural":"fosetele","dative-genitive-indefinite-singular":"fosete","dative-definite-genitive-singular":"fosetei","dative-genitive-indefinite-plural":"fosete","dative-definite-genitive-plural":"fosetelor","singular-vocative":"fosetă","plural-vocative":"fosetelor"}},{"word":"fosfat","pos":"noun","definitions":["phosphate"],"forms":{"plural":"fosfați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fosfat","accusative-definite-nominative-singular":"fosfatul","accusative-indefinite-nominative-plural":"fosfați","accusative-definite-nominative-plural":"fosfații","dative-genitive-indefinite-singular":"fosfat","dative-definite-genitive-singular":"fosfatului","dative-genitive-indefinite-plural":"fosfați","dative-definite-genitive-plural":"fosfaților","singular-vocative":"fosfatule","plural-vocative":"fosfaților"}},{"word":"fosfat de calciu","pos":"noun","definitions":["calcium phosphate"]},{"word":"fosfat de sodiu","pos":"noun","definitions":["sodium phosphate"]},{"word":"fosfata","pos":"verb","definitions":["to phosphatize"],"forms":{"canonical":"a fosfata 1st conjugation","present-singular-third-person":"fosfatează","participle-past":"fosfatat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fosfata","gerund":"fosfatând","first-person-indicative-present-singular":"fosfatez","indicative-present-second-person-singular":"fosfatezi","indicative-present-singular-third-person":"fosfatează","first-person-indicative-plural-present":"fosfatăm","indicative-plural-present-second-person":"fosfatați","indicative-plural-present-third-person":"fosfatează","first-person-imperfect-indicative-singular":"fosfatam","imperfect-indicative-second-person-singular":"fosfatai","imperfect-indicative-singular-third-person":"fosfata","first-person-imperfect-indicative-plural":"fosfatam","imperfect-indicative-plural-second-person":"fosfatați","imperfect-indicative-plural-third-person":"fosfatau","first-person-indicative-perfect-singular":"fosfatai","indicative-perfect-second-person-singular":"fosfatași","indicative-perfect-singular-third-person":"fosfată","first-person-indicative-perfect-plural":"fosfatarăm","indicative-perfect-plural-second-person":"fosfatarăți","indicative-perfect-plural-third-person":"fosfatară","first-person-indicative-pluperfect-singular":"fosfatasem","indicative-pluperfect-second-person-singular":"fosfataseși","indicative-pluperfect-singular-third-person":"fosfatase","first-person-indicative-pluperfect-plural":"fosfataserăm","indicative-pluperfect-plural-second-person":"fosfataserăți","indicative-pluperfect-plural-third-person":"fosfataseră","first-person-present-singular-subjunctive":"să fosfatez","present-second-person-singular-subjunctive":"să fosfatezi","present-singular-subjunctive-third-person":"să fosfateze","first-person-plural-present-subjunctive":"să fosfatăm","plural-present-second-person-subjunctive":"să fosfatați","plural-present-subjunctive-third-person":"să fosfateze","imperative-second-person-singular":"fosfatează","imperative-plural-second-person":"fosfatați","imperative-negative-second-person-singular":"nu fosfata","imperative-negative-plural-second-person":"nu fosfatați"}},{"word":"fosfatare","pos":"noun","definitions":["phosphatization"],"forms":{"plural":"fosfatări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fosfatare","accusative-definite-nominative-singular":"fosfatarea","accusative-indefinite-nominative-plural":"fosfatări","accusative-definite-nominative-plural":"fosfatările","dative-genitive-indefinite-singular":"fosfatări","dative-definite-genitive-singular":"fosfatării","dative-genitive-indefinite-plural":"fosfatări","dative-definite-genitive-plural":"fosfatărilor","singular-vocative":"fosfatare","plural-vocative":"fosfatărilor"}},{"word":"fosfatat","pos":"adj","definitions":["phosphated"],"forms":{"feminine-singular":"fosfatată","masculine-plural":"fosfatați","feminine-neuter-plural":"fosfatate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosfatat","error-unrecognized-form-feminine-indefinite-singular":"fosfatată","error-unrecognized-form-indefinite-masculine-plural":"fosfatați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosfatate","definite-error-unrecognized-form-masculine-neuter-singular":"fosfatatul","definite-error-unrecognized-form-feminine-singular":"fosfatata","definite-error-unrecognized-form-masculine-plural":"fosfatații","definite-error-unrecognized-form-feminine-neuter-plural":"fosfatatele"}},{"word":"fosfatat","pos":"verb","definitions":["past participle of fosfata"],"forms":{"participle-past":"of fosfata"}},{"word":"fosfatază","pos":"noun","definitions":["phosphatase"],"forms":{"plural":"fosfataze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosfatază","accusative-definite-nominative-singular":"fosfataza","accusative-indefinite-nominative-plural":"fosfataze","accusative-definite-nominative-plural":"fosfatazele","dative-genitive-indefinite-singular":"fosfataze","dative-definite-genitive-singular":"fosfatazei","dative-genitive-indefinite-plural":"fosfataze","dative-definite-genitive-plural":"fosfatazelor","singular-vocative":"fosfatază","plural-vocative":"fosfatazelor"}},{"word":"fosfatic","pos":"adj","definitions":["phosphatic"],"forms":{"feminine-singular":"fosfatică","masculine-plural":"fosfatici","feminine-neuter-plural":"fosfatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosfatic","error-unrecognized-form-feminine-indefinite-singular":"fosfatică","error-unrecognized-form-indefinite-masculine-plural":"fosfatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosfatice","definite-error-unrecognized-form-masculine-neuter-singular":"fosfaticul","definite-error-unrecognized-form-feminine-singular":"fosfatica","definite-error-unrecognized-form-masculine-plural":"fosfaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fosfaticele"}},{"word":"fosfatidă","pos":"noun","definitions":["phosphatide"],"forms":{"plural":"fosfatide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosfatidă","accusative-definite-nominative-singular":"fosfatida","accusative-indefinite-nominative-plural":"fosfatide","accusative-definite-nominative-plural":"fosfatidele","dative-genitive-indefinite-singular":"fosfatide","dative-definite-genitive-singular":"fosfatidei","dative-genitive-indefinite-plural":"fosfatide","dative-definite-genitive-plural":"fosfatidelor","singular-vocative":"fosfatidă","plural-vocative":"fosfatidelor"}},{"word":"fosfaturie","pos":"noun","definitions":["phosphaturia"],"forms":{"plural":"fosfaturii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fosfaturie","accusative-definite-nominative-singular":"fosfaturia","accusative-indefinite-nominative-plural":"fosfaturii","accusative-definite-nominative-plural":"fosfaturiile","dative-genitive-indefinite-singular":"fosfaturii","dative-definite-genitive-singular":"fosfaturiei","dative-genitive-indefinite-plural":"fosfaturii","dative-definite-genitive-plural":"fosfaturiilor","singular-vocative":"fosfaturie","plural-vocative":"fosfaturiilor"}},{"word":"fosfenă","pos":"noun","definitions":["phosphene"],"forms":{"plural":"fosfene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosfenă","accusative-definite-nominative-singular":"fosfena","accusative-indefinite-nominative-plural":"fosfene","accusative-definite-nominative-plural":"fosfenele","dative-genitive-indefinite-singular":"fosfene","dative-definite-genitive-singular":"fosfenei","dative-genitive-indefinite-plural":"fosfene","dative-definite-genitive-plural":"fosfenelor","singular-vocative":"fosfenă","plural-vocative":"fosfenelor"}},{"word":"fosfit","pos":"noun","definitions":["phosphite"],"forms":{"plural":"fosfiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fosfit","accusative-definite-nominative-singular":"fosfitul","accusative-indefinite-nominative-plural":"fosfiți","accusative-definite-nominative-plural":"fosfiții","dative-genitive-indefinite-singular":"fosfit","dative-definite-genitive-singular":"fosfitului","dative-genitive-indefinite-plural":"fosfiți","dative-definite-genitive-plural":"fosfiților","singular-vocative":"fosfitule","plural-vocative":"fosfiților"}},{"word":"fosfor","pos":"noun","definitions":["phosphorus (chemical element)"],"pronunciation":"/ˈfosfor/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fosfor","accusative-definite-nominative":"fosforul","dative-genitive-indefinite":"fosfor","dative-definite-genitive":"fosforului","vocative":"fosforule"}},{"word":"fosforat","pos":"adj","definitions":["phosphorous"],"forms":{"feminine-singular":"fosforată","masculine-plural":"fosforați","feminine-neuter-plural":"fosforate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosforat","error-unrecognized-form-feminine-indefinite-singular":"fosforată","error-unrecognized-form-indefinite-masculine-plural":"fosforați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosforate","definite-error-unrecognized-form-masculine-neuter-singular":"fosforatul","definite-error-unrecognized-form-feminine-singular":"fosforata","definite-error-unrecognized-form-masculine-plural":"fosforații","definite-error-unrecognized-form-feminine-neuter-plural":"fosforatele"}},{"word":"fosforescent","pos":"adj","definitions":["phosphorescent"],"forms":{"feminine-singular":"fosforescentă","masculine-plural":"fosforescenți","feminine-neuter-plural":"fosforescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosforescent","error-unrecognized-form-feminine-indefinite-singular":"fosforescentă","error-unrecognized-form-indefinite-masculine-plural":"fosforescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosforescente","definite-error-unrecognized-form-masculine-neuter-singular":"fosforescentul","definite-error-unrecognized-form-feminine-singular":"fosforescenta","definite-error-unrecognized-form-masculine-plural":"fosforescenții","definite-error-unrecognized-form-feminine-neuter-plural":"fosforescentele"}},{"word":"fosforescență","pos":"noun","definitions":["phosphorescence"],"forms":{"plural":"fosforescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosforescență","accusative-definite-nominative-singular":"fosforescența","accusative-indefinite-nominative-plural":"fosforescențe","accusative-definite-nominative-plural":"fosforescențele","dative-genitive-indefinite-singular":"fosforescențe","dative-definite-genitive-singular":"fosforescenței","dative-genitive-indefinite-plural":"fosforescențe","dative-definite-genitive-plural":"fosforescențelor","singular-vocative":"fosforescență","plural-vocative":"fosforescențelor"}},{"word":"fosforic","pos":"adj","definitions":["phosphoric"],"forms":{"feminine-singular":"fosforică","masculine-plural":"fosforici","feminine-neuter-plural":"fosforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosforic","error-unrecognized-form-feminine-indefinite-singular":"fosforică","error-unrecognized-form-indefinite-masculine-plural":"fosforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosforice","definite-error-unrecognized-form-masculine-neuter-singular":"fosforicul","definite-error-unrecognized-form-feminine-singular":"fosforica","definite-error-unrecognized-form-masculine-plural":"fosforicii","definite-error-unrecognized-form-feminine-neuter-plural":"fosforicele"}},{"word":"fosforism","pos":"noun","definitions":["phosphorism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fosforism","accusative-definite-nominative-singular":"fosforismul","accusative-indefinite-nominative-plural":"fosforisme","accusative-definite-nominative-plural":"fosforismele","dative-genitive-indefinite-singular":"fosforism","dative-definite-genitive-singular":"fosforismului","dative-genitive-indefinite-plural":"fosforisme","dative-definite-genitive-plural":"fosforismelor","singular-vocative":"fosforismule","plural-vocative":"fosforismelor"}},{"word":"fosforit","pos":"noun","definitions":["phosphorite"],"forms":{"plural":"fosforite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fosforit","accusative-definite-nominative-singular":"fosforitul","accusative-indefinite-nominative-plural":"fosforite","accusative-definite-nominative-plural":"fosforitele","dative-genitive-indefinite-singular":"fosforit","dative-definite-genitive-singular":"fosforitului","dative-genitive-indefinite-plural":"fosforite","dative-definite-genitive-plural":"fosforitelor","singular-vocative":"fosforitule","plural-vocative":"fosforitelor"}},{"word":"fosforos","pos":"adj","definitions":["phosphorous"],"forms":{"feminine-singular":"fosforoasă","masculine-plural":"fosforoși","feminine-neuter-plural":"fosforoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosforos","error-unrecognized-form-feminine-indefinite-singular":"fosforoasă","error-unrecognized-form-indefinite-masculine-plural":"fosforoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosforoase","definite-error-unrecognized-form-masculine-neuter-singular":"fosforosul","definite-error-unrecognized-form-feminine-singular":"fosforoasa","definite-error-unrecognized-form-masculine-plural":"fosforoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fosforoasele"}},{"word":"fosforoscop","pos":"noun","definitions":["phosphoroscope"],"forms":{"plural":"fosforoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fosforoscop","accusative-definite-nominative-singular":"fosforoscopul","accusative-indefinite-nominative-plural":"fosforoscoape","accusative-definite-nominative-plural":"fosforoscoapele","dative-genitive-indefinite-singular":"fosforoscop","dative-definite-genitive-singular":"fosforoscopului","dative-genitive-indefinite-plural":"fosforoscoape","dative-definite-genitive-plural":"fosforoscoapelor","singular-vocative":"fosforoscopule","plural-vocative":"fosforoscoapelor"}},{"word":"fosfură","pos":"noun","definitions":["phosphide"],"forms":{"plural":"fosfuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fosfură","accusative-definite-nominative-singular":"fosfura","accusative-indefinite-nominative-plural":"fosfuri","accusative-definite-nominative-plural":"fosfurile","dative-genitive-indefinite-singular":"fosfuri","dative-definite-genitive-singular":"fosfurii","dative-genitive-indefinite-plural":"fosfuri","dative-definite-genitive-plural":"fosfurilor","singular-vocative":"fosfură","plural-vocative":"fosfurilor"}},{"word":"fosgen","pos":"noun","definitions":["phosgene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fosgen","accusative-definite-nominative":"fosgenul","dative-genitive-indefinite":"fosgen","dative-definite-genitive":"fosgenului","vocative":"fosgenule"}},{"word":"fosil","pos":"adj","definitions":["fossil"],"forms":{"feminine-singular":"fosilă","masculine-plural":"fosili","feminine-neuter-plural":"fosile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosil","error-unrecognized-form-feminine-indefinite-singular":"fosilă","error-unrecognized-form-indefinite-masculine-plural":"fosili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosile","definite-error-unrecognized-form-masculine-neuter-singular":"fosilul","definite-error-unrecognized-form-feminine-singular":"fosila","definite-error-unrecognized-form-masculine-plural":"fosilii","definite-error-unrecognized-form-feminine-neuter-plural":"fosilele"}},{"word":"fosila","pos":"noun","definitions":["definite nominative/accusative singular of fosilă"],"pronunciation":"[foˈsila]","gender":"f"},{"word":"fosilă","pos":"noun","definitions":["fossil (mineralized remains of an animal or plant)","old fart (elderly person who holds old-fashioned views)"],"pronunciation":"/foˈsi.lə/","forms":{"plural":"fosile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fosilă","accusative-definite-nominative-singular":"fosila","accusative-indefinite-nominative-plural":"fosile","accusative-definite-nominative-plural":"fosilele","dative-genitive-indefinite-singular":"fosile","dative-definite-genitive-singular":"fosilei","dative-genitive-indefinite-plural":"fosile","dative-definite-genitive-plural":"fosilelor","singular-vocative":"fosilă","plural-vocative":"fosilelor"}},{"word":"fosilă vie","pos":"noun","definitions":["living fossil"],"forms":{"plural":"fosile vii"}},{"word":"fosilifer","pos":"adj","definitions":["fossiliferous"],"forms":{"feminine-singular":"fosiliferă","masculine-plural":"fosiliferi","feminine-neuter-plural":"fosilifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosilifer","error-unrecognized-form-feminine-indefinite-singular":"fosiliferă","error-unrecognized-form-indefinite-masculine-plural":"fosiliferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosilifere","definite-error-unrecognized-form-masculine-neuter-singular":"fosiliferul","definite-error-unrecognized-form-feminine-singular":"fosilifera","definite-error-unrecognized-form-masculine-plural":"fosiliferii","definite-error-unrecognized-form-feminine-neuter-plural":"fosiliferele"}},{"word":"fosiliza","pos":"verb","definitions":["to fossilize"],"pronunciation":"/fo.si.liˈza/","forms":{"canonical":"a fosiliza 1st conjugation","present-singular-third-person":"fosilizează","participle-past":"fosilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fosiliza","gerund":"fosilizând","first-person-indicative-present-singular":"fosilizez","indicative-present-second-person-singular":"fosilizezi","indicative-present-singular-third-person":"fosilizează","first-person-indicative-plural-present":"fosilizăm","indicative-plural-present-second-person":"fosilizați","indicative-plural-present-third-person":"fosilizează","first-person-imperfect-indicative-singular":"fosilizam","imperfect-indicative-second-person-singular":"fosilizai","imperfect-indicative-singular-third-person":"fosiliza","first-person-imperfect-indicative-plural":"fosilizam","imperfect-indicative-plural-second-person":"fosilizați","imperfect-indicative-plural-third-person":"fosilizau","first-person-indicative-perfect-singular":"fosilizai","indicative-perfect-second-person-singular":"fosilizași","indicative-perfect-singular-third-person":"fosiliză","first-person-indicative-perfect-plural":"fosilizarăm","indicative-perfect-plural-second-person":"fosilizarăți","indicative-perfect-plural-third-person":"fosilizară","first-person-indicative-pluperfect-singular":"fosilizasem","indicative-pluperfect-second-person-singular":"fosilizaseși","indicative-pluperfect-singular-third-person":"fosilizase","first-person-indicative-pluperfect-plural":"fosilizaserăm","indicative-pluperfect-plural-second-person":"fosilizaserăți","indicative-pluperfect-plural-third-person":"fosilizaseră","first-person-present-singular-subjunctive":"să fosilizez","present-second-person-singular-subjunctive":"să fosilizezi","present-singular-subjunctive-third-person":"să fosilizeze","first-person-plural-present-subjunctive":"să fosilizăm","plural-present-second-person-subjunctive":"să fosilizați","plural-present-subjunctive-third-person":"să fosilizeze","imperative-second-person-singular":"fosilizează","imperative-plural-second-person":"fosilizați","imperative-negative-second-person-singular":"nu fosiliza","imperative-negative-plural-second-person":"nu fosilizați"}},{"word":"fosilizare","pos":"noun","definitions":["fossilization"],"forms":{"plural":"fosilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fosilizare","accusative-definite-nominative-singular":"fosilizarea","accusative-indefinite-nominative-plural":"fosilizări","accusative-definite-nominative-plural":"fosilizările","dative-genitive-indefinite-singular":"fosilizări","dative-definite-genitive-singular":"fosilizării","dative-genitive-indefinite-plural":"fosilizări","dative-definite-genitive-plural":"fosilizărilor","singular-vocative":"fosilizare","plural-vocative":"fosilizărilor"}},{"word":"fosilizat","pos":"adj","definitions":["fossilized"],"forms":{"feminine-singular":"fosilizată","masculine-plural":"fosilizați","feminine-neuter-plural":"fosilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fosilizat","error-unrecognized-form-feminine-indefinite-singular":"fosilizată","error-unrecognized-form-indefinite-masculine-plural":"fosilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fosilizate","definite-error-unrecognized-form-masculine-neuter-singular":"fosilizatul","definite-error-unrecognized-form-feminine-singular":"fosilizata","definite-error-unrecognized-form-masculine-plural":"fosilizații","definite-error-unrecognized-form-feminine-neuter-plural":"fosilizatele"}},{"word":"fosilizat","pos":"verb","definitions":["past participle of fosiliza"],"forms":{"participle-past":"of fosiliza"}},{"word":"fosilo","pos":"noun","definitions":["vocative singular of fosilă"],"pronunciation":"[foˈsilo]","gender":"f"},{"word":"foșnăi","pos":"verb","definitions":["alternative form of foșni"],"forms":{"canonical":"a foșnăi 4th conjugation","present-singular-third-person":"foșnăiește","participle-past":"foșnăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a foșnăi","gerund":"foșnăind","first-person-indicative-present-singular":"foșnăiesc","indicative-present-second-person-singular":"foșnăiești","indicative-present-singular-third-person":"foșnăiește","first-person-indicative-plural-present":"foșnăim","indicative-plural-present-second-person":"foșnăiți","indicative-plural-present-third-person":"foșnăiesc","first-person-imperfect-indicative-singular":"foșnăiam","imperfect-indicative-second-person-singular":"foșnăiai","imperfect-indicative-singular-third-person":"foșnăia","first-person-imperfect-indicative-plural":"foșnăiam","imperfect-indicative-plural-second-person":"foșnăiați","imperfect-indicative-plural-third-person":"foșnăiau","first-person-indicative-perfect-singular":"foșnăii","indicative-perfect-second-person-singular":"foșnăiși","indicative-perfect-singular-third-person":"foșnăi","first-person-indicative-perfect-plural":"foșnăirăm","indicative-perfect-plural-second-person":"foșnăirăți","indicative-perfect-plural-third-person":"foșnăiră","first-person-indicative-pluperfect-singular":"foșnăisem","indicative-pluperfect-second-person-singular":"foșnăiseși","indicative-pluperfect-singular-third-person":"foșnăise","first-person-indicative-pluperfect-plural":"foșnăiserăm","indicative-pluperfect-plural-second-person":"foșnăiserăți","indicative-pluperfect-plural-third-person":"foșnăiseră","first-person-present-singular-subjunctive":"să foșnăiesc","present-second-person-singular-subjunctive":"să foșnăiești","present-singular-subjunctive-third-person":"să foșnăiască","first-person-plural-present-subjunctive":"să foșnăim","plural-present-second-person-subjunctive":"să foșnăiți","plural-present-subjunctive-third-person":"să foșnăiască","imperative-second-person-singular":"foșnăiește","imperative-plural-second-person":"foșnăiți","imperative-negative-second-person-singular":"nu foșnăi","imperative-negative-plural-second-person":"nu foșnăiți"}},{"word":"foșneală","pos":"noun","definitions":["rustling sound"],"forms":{"plural":"foșneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foșneală","accusative-definite-nominative-singular":"foșneala","accusative-indefinite-nominative-plural":"foșnele","accusative-definite-nominative-plural":"foșnelele","dative-genitive-indefinite-singular":"foșnele","dative-definite-genitive-singular":"foșnelei","dative-genitive-indefinite-plural":"foșnele","dative-definite-genitive-plural":"foșnelelor","singular-vocative":"foșneală","plural-vocative":"foșnelelor"}},{"word":"foșnet","pos":"noun","definitions":["swish"],"forms":{"plural":"foșnete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"foșnet","accusative-definite-nominative-singular":"foșnetul","accusative-indefinite-nominative-plural":"foșnete","accusative-definite-nominative-plural":"foșnetele","dative-genitive-indefinite-singular":"foșnet","dative-definite-genitive-singular":"foșnetului","dative-genitive-indefinite-plural":"foșnete","dative-definite-genitive-plural":"foșnetelor","singular-vocative":"foșnetule","plural-vocative":"foșnetelor"}},{"word":"foșni","pos":"verb","definitions":["to rustle (make soft crackling sounds)"],"forms":{"canonical":"a foșni 4th conjugation","present-singular-third-person":"foșnește","participle-past":"foșnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a foșni","gerund":"foșnind","first-person-indicative-present-singular":"foșnesc","indicative-present-second-person-singular":"foșnești","indicative-present-singular-third-person":"foșnește","first-person-indicative-plural-present":"foșnim","indicative-plural-present-second-person":"foșniți","indicative-plural-present-third-person":"foșnesc","first-person-imperfect-indicative-singular":"foșneam","imperfect-indicative-second-person-singular":"foșneai","imperfect-indicative-singular-third-person":"foșnea","first-person-imperfect-indicative-plural":"foșneam","imperfect-indicative-plural-second-person":"foșneați","imperfect-indicative-plural-third-person":"foșneau","first-person-indicative-perfect-singular":"foșnii","indicative-perfect-second-person-singular":"foșniși","indicative-perfect-singular-third-person":"foșni","first-person-indicative-perfect-plural":"foșnirăm","indicative-perfect-plural-second-person":"foșnirăți","indicative-perfect-plural-third-person":"foșniră","first-person-indicative-pluperfect-singular":"foșnisem","indicative-pluperfect-second-person-singular":"foșniseși","indicative-pluperfect-singular-third-person":"foșnise","first-person-indicative-pluperfect-plural":"foșniserăm","indicative-pluperfect-plural-second-person":"foșniserăți","indicative-pluperfect-plural-third-person":"foșniseră","first-person-present-singular-subjunctive":"să foșnesc","present-second-person-singular-subjunctive":"să foșnești","present-singular-subjunctive-third-person":"să foșnească","first-person-plural-present-subjunctive":"să foșnim","plural-present-second-person-subjunctive":"să foșniți","plural-present-subjunctive-third-person":"să foșnească","imperative-second-person-singular":"foșnește","imperative-plural-second-person":"foșniți","imperative-negative-second-person-singular":"nu foșni","imperative-negative-plural-second-person":"nu foșniți","alternative":"foșnăi"}},{"word":"foșnire","pos":"noun","definitions":["rustling"],"forms":{"plural":"foșniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"foșnire","accusative-definite-nominative-singular":"foșnirea","accusative-indefinite-nominative-plural":"foșniri","accusative-definite-nominative-plural":"foșnirile","dative-genitive-indefinite-singular":"foșniri","dative-definite-genitive-singular":"foșnirii","dative-genitive-indefinite-plural":"foșniri","dative-definite-genitive-plural":"foșnirilor","singular-vocative":"foșnire","plural-vocative":"foșnirilor"}},{"word":"foșnit","pos":"noun","definitions":["rustling"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"foșnit","accusative-definite-nominative":"foșnitul","dative-genitive-indefinite":"foșnit","dative-definite-genitive":"foșnitului","vocative":"foșnitule"}},{"word":"foșnit","pos":"verb","definitions":["past participle of foșni"],"forms":{"participle-past":"of foșni"}},{"word":"foșnitor","pos":"adj","definitions":["rustling"],"forms":{"feminine-singular":"foșnitoare","masculine-plural":"foșnitori","feminine-neuter-plural":"foșnitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"foșnitor","error-unrecognized-form-feminine-indefinite-singular":"foșnitoare","error-unrecognized-form-indefinite-masculine-plural":"foșnitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"foșnitoare","definite-error-unrecognized-form-masculine-neuter-singular":"foșnitorul","definite-error-unrecognized-form-feminine-singular":"foșnitoarea","definite-error-unrecognized-form-masculine-plural":"foșnitorii","definite-error-unrecognized-form-feminine-neuter-plural":"foșnitoarele"}},{"word":"foșnitură","pos":"noun","definitions":["swish"],"forms":{"plural":"foșnituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"foșnitură","accusative-definite-nominative-singular":"foșnitura","accusative-indefinite-nominative-plural":"foșniture","accusative-definite-nominative-plural":"foșniturele","dative-genitive-indefinite-singular":"foșniture","dative-definite-genitive-singular":"foșniturei","dative-genitive-indefinite-plural":"foșniture","dative-definite-genitive-plural":"foșniturelor","singular-vocative":"foșnitură","plural-vocative":"foșniturelor"}},{"word":"foso","pos":"noun","definitions":["vocative singular of fosă"],"pronunciation":"[ˈfoso]","gender":"f"},{"word":"fost","pos":"adj","definitions":["former"],"pronunciation":"/ˈfost/","forms":{"feminine-singular":"fostă","masculine-plural":"foști","feminine-neuter-plural":"foste","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fost","error-unrecognized-form-feminine-indefinite-singular":"fostă","error-unrecognized-form-indefinite-masculine-plural":"foști","error-unrecognized-form-feminine-indefinite-neuter-plural":"foste","definite-error-unrecognized-form-masculine-neuter-singular":"fostul","definite-error-unrecognized-form-feminine-singular":"fosta","definite-error-unrecognized-form-masculine-plural":"foștii","definite-error-unrecognized-form-feminine-neuter-plural":"fostele"}},{"word":"fost","pos":"noun","definitions":["ex-boyfriend"],"pronunciation":"/ˈfost/","forms":{"plural":"foști","feminine":"equivalent fostă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fost","accusative-definite-nominative-singular":"fostul","accusative-indefinite-nominative-plural":"foști","accusative-definite-nominative-plural":"foștii","dative-genitive-indefinite-singular":"fost","dative-definite-genitive-singular":"fostului","dative-genitive-indefinite-plural":"foști","dative-definite-genitive-plural":"foștilor","singular-vocative":"fostule","plural-vocative":"foștilor"}},{"word":"fost","pos":"verb","definitions":["past participle of fi; been"],"pronunciation":"/ˈfost/","examples":[{"ro":"Am fost la București.","en":"I have been to Bucharest."}]},{"word":"fosta","pos":"noun","definitions":["definite nominative/accusative singular of fostă"],"pronunciation":"[ˈfosta]","gender":"f"},{"word":"fostă","pos":"adj","definitions":["nominative/accusative feminine singular of fost (“former”)"],"pronunciation":"[ˈfos.tə]"},{"word":"fostă","pos":"noun","definitions":["ex-girlfriend"],"pronunciation":"[ˈfos.tə]","forms":{"plural":"foste","masculine":"equivalent fost","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fostă","accusative-definite-nominative-singular":"fosta","accusative-indefinite-nominative-plural":"foste","accusative-definite-nominative-plural":"fostele","dative-genitive-indefinite-singular":"foste","dative-definite-genitive-singular":"fostei","dative-genitive-indefinite-plural":"foste","dative-definite-genitive-plural":"fostelor","singular-vocative":"fostă","plural-vocative":"fostelor"}},{"word":"foste","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of fost (“former”)"],"pronunciation":"[ˈfos.te]"},{"word":"foști","pos":"adj","definitions":["nominative/accusative masculine plural of fost (“former”)"],"pronunciation":"[ˈfoʃtʲ]"},{"word":"fosto","pos":"noun","definitions":["vocative singular of fostă"],"pronunciation":"[ˈfosto]","gender":"f"},{"word":"fota","pos":"noun","definitions":["definite nominative/accusative singular of fotă"],"pronunciation":"[ˈfota]","gender":"f"},{"word":"fotă","pos":"noun","definitions":["a kind of peasant's skirt or a type of apron"],"forms":{"plural":"fote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotă","accusative-definite-nominative-singular":"fota","accusative-indefinite-nominative-plural":"fote","accusative-definite-nominative-plural":"fotele","dative-genitive-indefinite-singular":"fote","dative-definite-genitive-singular":"fotei","dative-genitive-indefinite-plural":"fote","dative-definite-genitive-plural":"fotelor","singular-vocative":"fotă","plural-vocative":"fotelor"}},{"word":"Fotache","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Fotache"}},{"word":"Fotachi","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Fotachi"}},{"word":"fotbal","pos":"noun","definitions":["football (UK); soccer (US, Australia)"],"pronunciation":"/ˈfot.bal/"},{"word":"fotbal american","pos":"noun","definitions":["American football"]},{"word":"fotbalist","pos":"noun","definitions":["footballer (British); football player (Britain), soccer player (US, Canada, Australia)"],"pronunciation":"/fot.baˈlist/","forms":{"plural":"fotbaliști","feminine":"equivalent fotbalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotbalist","accusative-definite-nominative-singular":"fotbalistul","accusative-indefinite-nominative-plural":"fotbaliști","accusative-definite-nominative-plural":"fotbaliștii","dative-genitive-indefinite-singular":"fotbalist","dative-definite-genitive-singular":"fotbalistului","dative-genitive-indefinite-plural":"fotbaliști","dative-definite-genitive-plural":"fotbaliștilor","singular-vocative":"fotbalistule","plural-vocative":"fotbaliștilor"}},{"word":"fotbalista","pos":"noun","definitions":["definite nominative/accusative singular of fotbalistă"],"gender":"f"},{"word":"fotbalistă","pos":"noun","definitions":["female equivalent of fotbalist"],"pronunciation":"/fot.baˈlis.tə/","forms":{"plural":"fotbaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fotbalistă","accusative-definite-nominative-singular":"fotbalista","accusative-indefinite-nominative-plural":"fotbaliste","accusative-definite-nominative-plural":"fotbalistele","dative-genitive-indefinite-singular":"fotbaliste","dative-definite-genitive-singular":"fotbalistei","dative-genitive-indefinite-plural":"fotbaliste","dative-definite-genitive-plural":"fotbalistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"fotbaliste","pos":"noun","definitions":["plural of fotbalistă"],"gender":"f"},{"word":"fotbaliști","pos":"noun","definitions":["plural of fotbalist"],"gender":"m"},{"word":"fotbalistic","pos":"adj","definitions":["related to soccer"],"forms":{"feminine-singular":"fotbalistică","masculine-plural":"fotbalistici","feminine-neuter-plural":"fotbalistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotbalistic","error-unrecognized-form-feminine-indefinite-singular":"fotbalistică","error-unrecognized-form-indefinite-masculine-plural":"fotbalistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotbalistice","definite-error-unrecognized-form-masculine-neuter-singular":"fotbalisticul","definite-error-unrecognized-form-feminine-singular":"fotbalistica","definite-error-unrecognized-form-masculine-plural":"fotbalisticii","definite-error-unrecognized-form-feminine-neuter-plural":"fotbalisticele"}},{"word":"fote","pos":"noun","definitions":["inflection of fotă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfote]","gender":"f"},{"word":"fotel","pos":"noun","definitions":["alternative form of fotoliu"],"forms":{"plural":"fotele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotel","accusative-definite-nominative-singular":"fotelul","accusative-indefinite-nominative-plural":"fotele","accusative-definite-nominative-plural":"fotelele","dative-genitive-indefinite-singular":"fotel","dative-definite-genitive-singular":"fotelului","dative-genitive-indefinite-plural":"fotele","dative-definite-genitive-plural":"fotelelor","singular-vocative":"fotelule","plural-vocative":"fotelelor"}},{"word":"Fotescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fotescu"}},{"word":"Fotești","pos":"name","definitions":["a village in Ionești, Vâlcea County, Romania"],"gender":"m"},{"word":"fotic","pos":"adj","definitions":["photic"],"forms":{"feminine-singular":"fotică","masculine-plural":"fotici","feminine-neuter-plural":"fotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotic","error-unrecognized-form-feminine-indefinite-singular":"fotică","error-unrecognized-form-indefinite-masculine-plural":"fotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotice","definite-error-unrecognized-form-masculine-neuter-singular":"foticul","definite-error-unrecognized-form-feminine-singular":"fotica","definite-error-unrecognized-form-masculine-plural":"foticii","definite-error-unrecognized-form-feminine-neuter-plural":"foticele"}},{"word":"Fotin","pos":"name","definitions":["a village in Râmnicelu, Buzău County, Romania"],"gender":"m"},{"word":"Fotino","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Fotino"}},{"word":"fotiță","pos":"noun","definitions":["diminutive of fotă"],"forms":{"plural":"fotițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotiță","accusative-definite-nominative-singular":"fotița","accusative-indefinite-nominative-plural":"fotițe","accusative-definite-nominative-plural":"fotițele","dative-genitive-indefinite-singular":"fotițe","dative-definite-genitive-singular":"fotiței","dative-genitive-indefinite-plural":"fotițe","dative-definite-genitive-plural":"fotițelor","singular-vocative":"fotiță","plural-vocative":"fotițelor"}},{"word":"foto","pos":"noun","definitions":["photo"],"forms":{"plural":"foto-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"foto","accusative-definite-nominative-singular":"foto-ul","accusative-indefinite-nominative-plural":"foto-uri","accusative-definite-nominative-plural":"foto-urile","dative-genitive-indefinite-singular":"foto","dative-definite-genitive-singular":"foto-ului","dative-genitive-indefinite-plural":"foto-uri","dative-definite-genitive-plural":"foto-urilor","singular-vocative":"foto-ule","plural-vocative":"foto-urilor"}},{"word":"fotoalergie","pos":"noun","definitions":["photoallergy"],"forms":{"plural":"fotoalergii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotoalergie","accusative-definite-nominative-singular":"fotoalergia","accusative-indefinite-nominative-plural":"fotoalergii","accusative-definite-nominative-plural":"fotoalergiile","dative-genitive-indefinite-singular":"fotoalergii","dative-definite-genitive-singular":"fotoalergiei","dative-genitive-indefinite-plural":"fotoalergii","dative-definite-genitive-plural":"fotoalergiilor","singular-vocative":"fotoalergie","plural-vocative":"fotoalergiilor"}},{"word":"fotoamator","pos":"noun","definitions":["amateur photographer"],"forms":{"plural":"fotoamatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotoamator","accusative-definite-nominative-singular":"fotoamatorul","accusative-indefinite-nominative-plural":"fotoamatori","accusative-definite-nominative-plural":"fotoamatorii","dative-genitive-indefinite-singular":"fotoamator","dative-definite-genitive-singular":"fotoamatorului","dative-genitive-indefinite-plural":"fotoamatori","dative-definite-genitive-plural":"fotoamatorilor","singular-vocative":"fotoamatorule","plural-vocative":"fotoamatorilor"}},{"word":"fotoaparat","pos":"noun","definitions":["camera"],"forms":{"plural":"fotoaparate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoaparat","accusative-definite-nominative-singular":"fotoaparatul","accusative-indefinite-nominative-plural":"fotoaparate","accusative-definite-nominative-plural":"fotoaparatele","dative-genitive-indefinite-singular":"fotoaparat","dative-definite-genitive-singular":"fotoaparatului","dative-genitive-indefinite-plural":"fotoaparate","dative-definite-genitive-plural":"fotoaparatelor","singular-vocative":"fotoaparatule","plural-vocative":"fotoaparatelor"}},{"word":"fotoautotrof","pos":"adj","definitions":["photoautotrophic"],"forms":{"feminine-singular":"fotoautotrofă","masculine-plural":"fotoautotrofi","feminine-neuter-plural":"fotoautotrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoautotrof","error-unrecognized-form-feminine-indefinite-singular":"fotoautotrofă","error-unrecognized-form-indefinite-masculine-plural":"fotoautotrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoautotrofe","definite-error-unrecognized-form-masculine-neuter-singular":"fotoautotroful","definite-error-unrecognized-form-feminine-singular":"fotoautotrofa","definite-error-unrecognized-form-masculine-plural":"fotoautotrofii","definite-error-unrecognized-form-feminine-neuter-plural":"fotoautotrofele"}},{"word":"fotobiologie","pos":"noun","definitions":["photobiology"],"pronunciation":"/fo.to.bi.o.loˈd͡ʒi.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fotobiologie","accusative-definite-nominative":"fotobiologia","dative-genitive-indefinite":"fotobiologii","dative-definite-genitive":"fotobiologiei","vocative":"fotobiologie"}},{"word":"fotocameră","pos":"noun","definitions":["camera"],"forms":{"plural":"fotocamere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotocameră","accusative-definite-nominative-singular":"fotocamera","accusative-indefinite-nominative-plural":"fotocamere","accusative-definite-nominative-plural":"fotocamerele","dative-genitive-indefinite-singular":"fotocamere","dative-definite-genitive-singular":"fotocamerei","dative-genitive-indefinite-plural":"fotocamere","dative-definite-genitive-plural":"fotocamerelor","singular-vocative":"fotocameră","plural-vocative":"fotocamerelor"}},{"word":"fotocartograf","pos":"noun","definitions":["photocartograph"],"forms":{"plural":"fotocartografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocartograf","accusative-definite-nominative-singular":"fotocartograful","accusative-indefinite-nominative-plural":"fotocartografe","accusative-definite-nominative-plural":"fotocartografele","dative-genitive-indefinite-singular":"fotocartograf","dative-definite-genitive-singular":"fotocartografului","dative-genitive-indefinite-plural":"fotocartografe","dative-definite-genitive-plural":"fotocartografelor","singular-vocative":"fotocartografule","plural-vocative":"fotocartografelor"}},{"word":"fotocataliză","pos":"noun","definitions":["photocatalysis"],"forms":{"plural":"fotocatalize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotocataliză","accusative-definite-nominative-singular":"fotocataliza","accusative-indefinite-nominative-plural":"fotocatalize","accusative-definite-nominative-plural":"fotocatalizele","dative-genitive-indefinite-singular":"fotocatalize","dative-definite-genitive-singular":"fotocatalizei","dative-genitive-indefinite-plural":"fotocatalize","dative-definite-genitive-plural":"fotocatalizelor","singular-vocative":"fotocataliză","plural-vocative":"fotocatalizelor"}},{"word":"fotocatalizator","pos":"adj","definitions":["photocatalyst"],"forms":{"feminine-singular":"fotocatalizatoare","masculine-plural":"fotocatalizatori","feminine-neuter-plural":"fotocatalizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotocatalizator","error-unrecognized-form-feminine-indefinite-singular":"fotocatalizatoare","error-unrecognized-form-indefinite-masculine-plural":"fotocatalizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotocatalizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"fotocatalizatorul","definite-error-unrecognized-form-feminine-singular":"fotocatalizatoarea","definite-error-unrecognized-form-masculine-plural":"fotocatalizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"fotocatalizatoarele"}},{"word":"fotocatod","pos":"noun","definitions":["photocathode"],"forms":{"plural":"fotocatozi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotocatod","accusative-definite-nominative-singular":"fotocatodul","accusative-indefinite-nominative-plural":"fotocatozi","accusative-definite-nominative-plural":"fotocatozii","dative-genitive-indefinite-singular":"fotocatod","dative-definite-genitive-singular":"fotocatodului","dative-genitive-indefinite-plural":"fotocatozi","dative-definite-genitive-plural":"fotocatozilor","singular-vocative":"fotocatodule","plural-vocative":"fotocatozilor"}},{"word":"fotocelulă","pos":"noun","definitions":["photocell"],"forms":{"plural":"fotocelule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotocelulă","accusative-definite-nominative-singular":"fotocelula","accusative-indefinite-nominative-plural":"fotocelule","accusative-definite-nominative-plural":"fotocelulele","dative-genitive-indefinite-singular":"fotocelule","dative-definite-genitive-singular":"fotocelulei","dative-genitive-indefinite-plural":"fotocelule","dative-definite-genitive-plural":"fotocelulelor","singular-vocative":"fotocelulă","plural-vocative":"fotocelulelor"}},{"word":"fotoceramică","pos":"noun","definitions":["photoceramics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoceramică","accusative-definite-nominative-singular":"fotoceramica","accusative-indefinite-nominative-plural":"fotoceramice","accusative-definite-nominative-plural":"fotoceramicele","dative-genitive-indefinite-singular":"fotoceramice","dative-definite-genitive-singular":"fotoceramicei","dative-genitive-indefinite-plural":"fotoceramice","dative-definite-genitive-plural":"fotoceramicelor","singular-vocative":"fotoceramică","plural-vocative":"fotoceramicelor"}},{"word":"fotochimic","pos":"adj","definitions":["photochemical"],"forms":{"feminine-singular":"fotochimică","masculine-plural":"fotochimici","feminine-neuter-plural":"fotochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotochimic","error-unrecognized-form-feminine-indefinite-singular":"fotochimică","error-unrecognized-form-indefinite-masculine-plural":"fotochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotochimice","definite-error-unrecognized-form-masculine-neuter-singular":"fotochimicul","definite-error-unrecognized-form-feminine-singular":"fotochimica","definite-error-unrecognized-form-masculine-plural":"fotochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"fotochimicele"}},{"word":"fotochimie","pos":"noun","definitions":["photochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotochimie","accusative-definite-nominative-singular":"fotochimia","accusative-indefinite-nominative-plural":"fotochimii","accusative-definite-nominative-plural":"fotochimiile","dative-genitive-indefinite-singular":"fotochimii","dative-definite-genitive-singular":"fotochimiei","dative-genitive-indefinite-plural":"fotochimii","dative-definite-genitive-plural":"fotochimiilor","singular-vocative":"fotochimie","plural-vocative":"fotochimiilor"}},{"word":"fotoclub","pos":"noun","definitions":["photography club, camera club"],"forms":{"plural":"fotocluburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fotoclub","accusative-definite-nominative-singular":"fotoclubul","accusative-indefinite-nominative-plural":"fotocluburi","accusative-definite-nominative-plural":"fotocluburile","dative-genitive-indefinite-singular":"fotoclub","dative-definite-genitive-singular":"fotoclubului","dative-genitive-indefinite-plural":"fotocluburi","dative-definite-genitive-plural":"fotocluburilor","singular-vocative":"fotoclubule","plural-vocative":"fotocluburilor"}},{"word":"fotocoagulare","pos":"noun","definitions":["photocoagulation"],"forms":{"plural":"fotocoagulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotocoagulare","accusative-definite-nominative-singular":"fotocoagularea","accusative-indefinite-nominative-plural":"fotocoagulari","accusative-definite-nominative-plural":"fotocoagularile","dative-genitive-indefinite-singular":"fotocoagulari","dative-definite-genitive-singular":"fotocoagularii","dative-genitive-indefinite-plural":"fotocoagulari","dative-definite-genitive-plural":"fotocoagularilor","singular-vocative":"fotocoagulare","plural-vocative":"fotocoagularilor"}},{"word":"fotocoagulator","pos":"noun","definitions":["photocoagulator"],"forms":{"plural":"fotocoagulatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocoagulator","accusative-definite-nominative-singular":"fotocoagulatorul","accusative-indefinite-nominative-plural":"fotocoagulatoare","accusative-definite-nominative-plural":"fotocoagulatoarele","dative-genitive-indefinite-singular":"fotocoagulator","dative-definite-genitive-singular":"fotocoagulatorului","dative-genitive-indefinite-plural":"fotocoagulatoare","dative-definite-genitive-plural":"fotocoagulatoarelor","singular-vocative":"fotocoagulatorule","plural-vocative":"fotocoagulatoarelor"}},{"word":"fotocolografie","pos":"noun","definitions":["photocolography"],"forms":{"plural":"fotocolografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotocolografie","accusative-definite-nominative-singular":"fotocolografia","accusative-indefinite-nominative-plural":"fotocolografii","accusative-definite-nominative-plural":"fotocolografiile","dative-genitive-indefinite-singular":"fotocolografii","dative-definite-genitive-singular":"fotocolografiei","dative-genitive-indefinite-plural":"fotocolografii","dative-definite-genitive-plural":"fotocolografiilor","singular-vocative":"fotocolografie","plural-vocative":"fotocolografiilor"}},{"word":"fotocolorimetru","pos":"noun","definitions":["photocolorimeter"],"forms":{"plural":"fotocolorimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocolorimetru","accusative-definite-nominative-singular":"fotocolorimetrul","accusative-indefinite-nominative-plural":"fotocolorimetre","accusative-definite-nominative-plural":"fotocolorimetrele","dative-genitive-indefinite-singular":"fotocolorimetru","dative-definite-genitive-singular":"fotocolorimetrului","dative-genitive-indefinite-plural":"fotocolorimetre","dative-definite-genitive-plural":"fotocolorimetrelor","singular-vocative":"fotocolorimetrule","plural-vocative":"fotocolorimetrelor"}},{"word":"fotocompoziție","pos":"noun","definitions":["photocomposition"],"forms":{"plural":"fotocompoziții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotocompoziție","accusative-definite-nominative-singular":"fotocompoziția","accusative-indefinite-nominative-plural":"fotocompoziții","accusative-definite-nominative-plural":"fotocompozițiile","dative-genitive-indefinite-singular":"fotocompoziții","dative-definite-genitive-singular":"fotocompoziției","dative-genitive-indefinite-plural":"fotocompoziții","dative-definite-genitive-plural":"fotocompozițiilor","singular-vocative":"fotocompoziție","plural-vocative":"fotocompozițiilor"}},{"word":"fotoconductibilitate","pos":"noun","definitions":["photoconductivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoconductibilitate","accusative-definite-nominative-singular":"fotoconductibilitatea","accusative-indefinite-nominative-plural":"fotoconductibilități","accusative-definite-nominative-plural":"fotoconductibilitățile","dative-genitive-indefinite-singular":"fotoconductibilități","dative-definite-genitive-singular":"fotoconductibilității","dative-genitive-indefinite-plural":"fotoconductibilități","dative-definite-genitive-plural":"fotoconductibilităților","singular-vocative":"fotoconductibilitate","plural-vocative":"fotoconductibilităților"}},{"word":"fotoconducție","pos":"noun","definitions":["photoconduction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotoconducție","accusative-definite-nominative-singular":"fotoconducția","accusative-indefinite-nominative-plural":"fotoconducții","accusative-definite-nominative-plural":"fotoconducțiile","dative-genitive-indefinite-singular":"fotoconducții","dative-definite-genitive-singular":"fotoconducției","dative-genitive-indefinite-plural":"fotoconducții","dative-definite-genitive-plural":"fotoconducțiilor","singular-vocative":"fotoconducție","plural-vocative":"fotoconducțiilor"}},{"word":"fotoconductiv","pos":"adj","definitions":["photoconductive"],"forms":{"feminine-singular":"fotoconductivă","masculine-plural":"fotoconductivi","feminine-neuter-plural":"fotoconductive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoconductiv","error-unrecognized-form-feminine-indefinite-singular":"fotoconductivă","error-unrecognized-form-indefinite-masculine-plural":"fotoconductivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoconductive","definite-error-unrecognized-form-masculine-neuter-singular":"fotoconductivul","definite-error-unrecognized-form-feminine-singular":"fotoconductiva","definite-error-unrecognized-form-masculine-plural":"fotoconductivii","definite-error-unrecognized-form-feminine-neuter-plural":"fotoconductivele"}},{"word":"fotoconductivitate","pos":"noun","definitions":["photoconductivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoconductivitate","accusative-definite-nominative-singular":"fotoconductivitatea","accusative-indefinite-nominative-plural":"fotoconductivități","accusative-definite-nominative-plural":"fotoconductivitățile","dative-genitive-indefinite-singular":"fotoconductivități","dative-definite-genitive-singular":"fotoconductivității","dative-genitive-indefinite-plural":"fotoconductivități","dative-definite-genitive-plural":"fotoconductivităților","singular-vocative":"fotoconductivitate","plural-vocative":"fotoconductivităților"}}];
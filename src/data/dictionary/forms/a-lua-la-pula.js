@@ -0,0 +1 @@
+export default {"a lua la pula [conj]":"lua la pulă","a lua painea de la gura 1st conjugation":"lua pâinea de la gură","a lua plasa 1st conjugation":"lua plasă","a lua viata 1st conjugation":"lua viața","a lubrifia":"lubrifia","a lubrifia 1st conjugation":"lubrifia","a luci":"luci","a luci 4th conjugation":"luci","a lucra":"lucra","a lucra 1st conjugation":"lucra","a lumina":"lumina","a lumina 1st conjugation":"lumina","a luneca":"luneca","a luneca 1st conjugation":"luneca","a lunga":"lunga","a lunga 1st conjugation":"lunga","a lungi":"lungi","a lungi 4th conjugation":"lungi","a luntri":"luntri","a luntri 4th conjugation":"luntri","a lupta":"lupta","a lupta 1st conjugation":"lupta","a lupta cu morile de vant 1st conjugation":"lupta cu morile de vânt","a lusa":"lușa","a lusa 1st conjugation":"lușa","a lustrui":"lustrui","a lustrui 4th conjugation":"lustrui","a luxa":"luxa","a luxa 1st conjugation":"luxa","a naboi":"năboi","a naboi 4th conjugation":"năboi","a nabusi":"năbuși","a nabusi 4th conjugation":"năbuși","a nacaji":"năcăji","a nacaji 4th conjugation":"năcăji","a naclai":"năclăi","a naclai 4th conjugation":"năclăi","a nadai":"nădăi","a nadai 4th conjugation":"nădăi","a nadajdui":"nădăjdui","a nadajdui 4th conjugation":"nădăjdui","a nadejdui":"nădejdui","a nadejdui 4th conjugation":"nădejdui","a naduri":"năduri","a naduri 4th conjugation":"năduri","a nadusi":"năduși","a nadusi 4th conjugation":"năduși","a nalbi":"nălbi","a nalbi 4th conjugation":"nălbi","a nalta":"nălța","a nalta 1st conjugation":"nălța","a naluci":"năluci","a naluci 4th conjugation":"năluci","a nameti":"nămeți","a nameti 4th conjugation":"nămeți","a nami":"nămi","a nami 4th conjugation":"nămi","a namoli":"nămoli","a namoli 4th conjugation":"nămoli","a napadi":"năpădi","a napadi 4th conjugation":"năpădi","a naparli":"năpârli","a naparli 4th conjugation":"năpârli","a napastui":"năpăstui","a napastui 4th conjugation":"năpăstui","a napoia":"napoia","a napoia 1st conjugation":"napoia","a napusti":"năpusti","a napusti 4th conjugation":"năpusti","a nara":"nara","a nara 1st conjugation":"nara","a naravi":"nărăvi","a naravi 4th conjugation":"nărăvi","a narcotiza":"narcotiza","a narcotiza 1st conjugation":"narcotiza","a narui":"nărui","a narui 4th conjugation":"nărui","a nascoci":"născoci","a nascoci 4th conjugation":"născoci","a nasi":"năși","a nasi 4th conjugation":"năși","a naslui":"năslui","a naslui 4th conjugation":"năslui","a nasoli":"nasoli","a nasoli 4th conjugation":"nasoli","a nastavi":"năstăvi","a nastavi 4th conjugation":"năstăvi","a naste":"naște","a naste 3rd conjugation":"naște","a natangi":"nătângi","a natangi 4th conjugation":"nătângi","a nationaliza":"naționaliza","a nationaliza 1st conjugation":"naționaliza","a naturaliza":"naturaliza","a naturaliza 1st conjugation":"naturaliza","a nauci":"năuci","a nauci 4th conjugation":"năuci","a naufragia":"naufragia","a naufragia 1st conjugation":"naufragia","a navali":"năvăli","a navali 4th conjugation":"năvăli","a naviga":"naviga","a naviga 1st conjugation":"naviga","a navigabiliza":"navigabiliza","a navigabiliza 1st conjugation":"navigabiliza","a navlosi":"navlosi","a navlosi 4th conjugation":"navlosi","a navodi":"năvodi","a navodi 4th conjugation":"năvodi","a nazaliza":"nazaliza","a nazaliza 1st conjugation":"nazaliza","a nazari":"năzări","a nazari 4th conjugation":"năzări","a nazui":"năzui","a nazui 4th conjugation":"năzui","a neantiza":"neantiza","a neantiza 1st conjugation":"neantiza","a nebuni":"nebuni","a nebuni 4th conjugation":"nebuni","a necaji":"necăji","a necaji 4th conjugation":"necăji","a necesita":"necesita","a necesita 1st conjugation":"necesita","a necheza":"necheza","a necheza 1st conjugation":"necheza","a necinsti":"necinsti","a necinsti 4th conjugation":"necinsti","a necroza":"necroza","a necroza 1st conjugation":"necroza","a necurati":"necurăți","a necurati 4th conjugation":"necurăți","a nedreptati":"nedreptăți","a nedreptati 4th conjugation":"nedreptăți","a nedumeri":"nedumeri","a nedumeri 4th conjugation":"nedumeri","a nedumiri":"nedumiri","a nedumiri 4th conjugation":"nedumiri","a neferici":"neferici","a neferici 4th conjugation":"neferici","a nega":"nega","a nega 1st conjugation":"nega","a negativa":"negativa","a negativa 1st conjugation":"negativa","a negativiza":"negativiza","a negativiza 1st conjugation":"negativiza","a neglija":"neglija","a neglija 1st conjugation":"neglija","a neglijarisi":"neglijarisi","a neglijarisi 4th conjugation":"neglijarisi","a negocia":"negocia","a negocia 1st conjugation":"negocia","a negri":"negri","a negri 4th conjugation":"negri","a negustori":"negustori","a negustori 4th conjugation":"negustori","a neguta":"neguța","a neguta 1st conjugation":"neguța","a negutatori":"neguțători","a negutatori 4th conjugation":"neguțători","a neingriji":"neîngriji","a neingriji 4th conjugation":"neîngriji","a nelinisti":"neliniști","a nelinisti 4th conjugation":"neliniști","a nemeri":"nemeri","a nemeri 4th conjugation":"nemeri","a nemernici":"nemernici","a nemernici 4th conjugation":"nemernici","a nemeti":"nemeți","a nemeti 4th conjugation":"nemeți","a nemti":"nemți","a nemti 4th conjugation":"nemți","a nemultami":"nemulțămi","a nemultami 4th conjugation":"nemulțămi","a nemultumi":"nemulțumi","a nemultumi 4th conjugation":"nemulțumi","a nemuri":"nemuri","a nemuri 4th conjugation":"nemuri","a nenoroci":"nenoroci","a nenoroci 4th conjugation":"nenoroci","a neodihni":"neodihni","a neodihni 4th conjugation":"neodihni","a neologiza":"neologiza","a neologiza 1st conjugation":"neologiza","a nesocoti":"nesocoti","a nesocoti 4th conjugation":"nesocoti","a nesti":"nești","a nesti 4th conjugation":"nești","a neteza":"neteza","a neteza 1st conjugation":"neteza","a netezi":"netezi","a netezi 4th conjugation":"netezi","a neurasteniza":"neurasteniza","a neurasteniza 1st conjugation":"neurasteniza","a neutraliza":"neutraliza","a neutraliza 1st conjugation":"neutraliza","a nevedi":"nevedi","a nevedi 4th conjugation":"nevedi","a nevesti":"nevesti","a nevesti 4th conjugation":"nevesti","a nevoi":"nevoi","a nevoi 4th conjugation":"nevoi","a nichela":"nichela","a nichela 1st conjugation":"nichela","a nicotiniza":"nicotiniza","a nicotiniza 1st conjugation":"nicotiniza","a nimeri":"nimeri","a nimeri 4th conjugation":"nimeri","a nimici":"nimici","a nimici 4th conjugation":"nimici","a nimicnici":"nimicnici","a nimicnici 4th conjugation":"nimicnici","a ninge":"ninge","a ninge 3rd conjugation":"ninge","a nitra":"nitra","a nitra 1st conjugation":"nitra","a nitrifica":"nitrifica","a nitrifica 1st conjugation":"nitrifica","a nitrura":"nitrura","a nitrura 1st conjugation":"nitrura","a nitui":"nitui","a nitui 4th conjugation":"nitui","a nivela":"nivela","a nivela 1st conjugation":"nivela","a niveli":"niveli","a niveli 4th conjugation":"niveli","a nividi":"nividi","a nividi 4th conjugation":"nividi","a nizui":"nizui","a nizui 4th conjugation":"nizui","a nobila":"nobila","a nobila 1st conjugation":"nobila","a nobilita":"nobilita","a nobilita 1st conjugation":"nobilita","a nominaliza":"nominaliza","a nominaliza 1st conjugation":"nominaliza","a nominativiza":"nominativiza","a nominativiza 1st conjugation":"nominativiza","a nomoli":"nomoli","a nomoli 4th conjugation":"nomoli","a nomotemisi":"nomotemisi","a nomotemisi 4th conjugation":"nomotemisi","a nopta":"nopta","a nopta 1st conjugation":"nopta","a norma":"norma","a norma 1st conjugation":"norma","a normaliza":"normaliza","a normaliza 1st conjugation":"normaliza","a noroci":"noroci","a noroci 4th conjugation":"noroci","a nostimivisi":"nostimivisi","a nostimivisi 4th conjugation":"nostimivisi","a nostrifica":"nostrifica","a nostrifica 1st conjugation":"nostrifica","a nota":"nota","a nota 1st conjugation":"nota","a notifica":"notifica","a notifica 1st conjugation":"notifica","a noua":["a noua","noua","a noua","nouălea"],"a nouaspea":["a nouășpea","nouășpea","a nouășpea","nouășpelea"],"a nouasprezecea":["a nouăsprezecea","nouăsprezecea","a nouăsprezecea","nouăsprezecelea"],"a nouazecea":["a nouăzecea","nouăzecea","a nouăzecea","nouăzecilea"],"a nouazeci si cincea":["a nouăzeci și cincea","nouăzeci și cincea","a nouăzeci și cincea","nouăzeci și cincilea"],"a nouazeci si doua":["a nouăzeci și doua","nouăzeci și doilea","a nouăzeci și doua","nouăzeci și doua"],"a nouazeci si noua":["a nouăzeci și noua","nouăzeci și noua","a nouăzeci și noua","nouăzeci și nouălea"],"a nouazeci si opta":["a nouăzeci și opta","nouăzeci și opta","a nouăzeci și opta","nouăzeci și optulea"],"a nouazeci si patra":["a nouăzeci și patra","nouăzeci și patra","a nouăzeci și patra","nouăzeci și patrulea"],"a nouazeci si saptea":["a nouăzeci și șaptea","nouăzeci și șaptea","a nouăzeci și șaptea","nouăzeci și șaptelea"],"a nouazeci si sasea":["a nouăzeci și șasea","nouăzeci și șasea","a nouăzeci și șasea","nouăzeci și șaselea"],"a nouazeci si treia":["a nouăzeci și treia","nouăzeci și treia","a nouăzeci și treia","nouăzeci și treilea"],"a nouazeci si una":["a nouăzeci și una","nouăzeci și una","a nouăzeci și una","nouăzeci și unulea"],"a nova":"nova","a nova 1st conjugation":"nova","a nuanta":"nuanța","a nuanta 1st conjugation":"nuanța","a nucleariza":"nucleariza","a nucleariza 1st conjugation":"nucleariza","a nulifica":"nulifica","a nulifica 1st conjugation":"nulifica","a numara":"număra","a numara 1st conjugation":"număra","a numeriza":"numeriza","a numeriza 1st conjugation":"numeriza","a numerota":"numerota","a numerota 1st conjugation":"numerota","a numi":"numi","a numi 4th conjugation":"numi","a nunti":"nunti","a nunti 4th conjugation":"nunti","a nutri":"nutri","a nutri 4th conjugation":"nutri","a nutrica":"nutrica","a nutrica 1st conjugation":"nutrica","a o da in bara 1st conjugation":"o da în bară","a o face de oaie 3rd conjugation":"o face de oaie","a o incurca 1st conjugation":"o încurca","a o intoarce ca la ploiesti 3rd conjugation":"o întoarce ca la Ploiești","a o lua din loc 1st conjugation":"o lua din loc","a o pati 4th conjugation":"o păți","a o sterge 3rd conjugation":"o șterge","a o trage 3rd conjugation":"o trage","a o tuli 4th conjugation":"o tuli","a obarsi":"obârși","a obarsi 4th conjugation":"obârși","a obicinui":"obicinui","a obicinui 4th conjugation":"obicinui","a obiciui":"obiciui","a obiciui 4th conjugation":"obiciui","a obicni":"obicni","a obicni 4th conjugation":"obicni","a obidi":"obidi","a obidi 4th conjugation":"obidi","a obiecta":"obiecta","a obiecta 1st conjugation":"obiecta","a obiectifica":"obiectifica","a obiectifica 1st conjugation":"obiectifica","a obiectiva":"obiectiva","a obiectiva 1st conjugation":"obiectiva","a obiectiviza":"obiectiviza","a obiectiviza 1st conjugation":"obiectiviza","a obijdui":"obijdui","a obijdui 4th conjugation":"obijdui","a obisnui":"obișnui","a obisnui 4th conjugation":"obișnui","a obladui":"oblădui","a obladui 4th conjugation":"oblădui","a oblici":"oblici","a oblici 4th conjugation":"oblici","a obliga":"obliga","a obliga 1st conjugation":"obliga","a oblitera":"oblitera","a oblitera 1st conjugation":"oblitera","a obloji":"obloji","a obloji 4th conjugation":"obloji","a obloni":"obloni","a obloni 4th conjugation":"obloni","a obnubila":"obnubila","a obnubila 1st conjugation":"obnubila","a obori":"oborî","a obori 4th conjugation":"oborî","a obosi":"obosi","a obosi 4th conjugation":"obosi","a obraci":"obrăci","a obraci 4th conjugation":"obrăci","a obranti":"obrânti","a obranti 4th conjugation":"obrânti","a obraznici":"obrăznici","a obraznici 4th conjugation":"obrăznici","a obrazui":"obrăzui","a obrazui 4th conjugation":"obrăzui","a obrezui":"obrezui","a obrezui 4th conjugation":"obrezui","a obrinti":"obrinti","a obrinti 4th conjugation":"obrinti","a obroci":"obroci","a obroci 4th conjugation":"obroci","a obscura":"obscura","a obscura 1st conjugation":"obscura","a obscuriza":"obscuriza","a obscuriza 1st conjugation":"obscuriza","a obseda":"obseda","a obseda 1st conjugation":"obseda","a observa":"observa","a observa 1st conjugation":"observa","a observarisi":"observarisi","a observarisi 4th conjugation":"observarisi","a obsti":"obști","a obsti 4th conjugation":"obști","a obstina":"obstina","a obstina 1st conjugation":"obstina","a obstrua":"obstrua","a obstrua 1st conjugation":"obstrua","a obstructiona":"obstrucționa","a obstructiona 1st conjugation":"obstrucționa","a obtine":"obține","a obtine 3rd conjugation":"obține","a obtura":"obtura","a obtura 1st conjugation":"obtura","a ocacai":"ocăcăi","a ocacai 4th conjugation":"ocăcăi","a ocari":["a ocări","ocări","a ocărî","ocărî"],"a ocari 4th conjugation":["a ocări 4th conjugation","ocări","a ocărî 4th conjugation","ocărî"],"a ocarmi":"ocârmi","a ocarmi 4th conjugation":"ocârmi","a ocarmui":"ocârmui","a ocarmui 4th conjugation":"ocârmui","a ocaziona":"ocaziona","a ocaziona 1st conjugation":"ocaziona","a occidentaliza":"occidentaliza","a occidentaliza 1st conjugation":"occidentaliza","a ochi":"ochi","a ochi 4th conjugation":"ochi","a ocina":"ocina","a ocina 1st conjugation":"ocina","a ocni":"ocni","a ocni 4th conjugation":"ocni","a ocoli":"ocoli","a ocoli 4th conjugation":"ocoli","a ocropi":"ocropi","a ocropi 4th conjugation":"ocropi","a ocroti":"ocroti","a ocroti 4th conjugation":"ocroti","a octroia":"octroia","a octroia 1st conjugation":"octroia","a oculta":"oculta","a oculta 1st conjugation":"oculta","a ocupa":"ocupa","a ocupa 1st conjugation":"ocupa","a ocuparisi":"ocuparisi","a ocuparisi 4th conjugation":"ocuparisi","a odgoni":"odgoni","a odgoni 4th conjugation":"odgoni","a odihni":"odihni","a odihni 4th conjugation":"odihni","a odini":"odini","a odini 4th conjugation":"odini","a odora":"odora","a odora 1st conjugation":"odora","a odoriza":"odoriza","a odoriza 1st conjugation":"odoriza","a odrasli":"odrăsli","a odrasli 4th conjugation":"odrăsli","a ofensa":"ofensa","a ofensa 1st conjugation":"ofensa","a oferi":"oferi","a oferi 4th conjugation":"oferi","a oferta":"oferta","a oferta 1st conjugation":"oferta","a oficia":"oficia","a oficia 1st conjugation":"oficia","a oficializa":"oficializa","a oficializa 1st conjugation":"oficializa","a ofili":"ofili","a ofili 4th conjugation":"ofili","a ofta":"ofta","a ofta 1st conjugation":"ofta","a oftica":"oftica","a oftica 1st conjugation":"oftica","a ofusca":"ofusca","a ofusca 1st conjugation":"ofusca","a oglinda":"oglinda","a oglinda 1st conjugation":"oglinda","a oglindi":"oglindi","a oglindi 4th conjugation":"oglindi","a ogodi":"ogodi","a ogodi 4th conjugation":"ogodi","a ogoia":"ogoia","a ogoia 1st conjugation":"ogoia","a ogori":"ogorî","a ogori 4th conjugation":"ogorî","a ojivoi":"ojivoi","a ojivoi 4th conjugation":"ojivoi","a olacai":"olăcăi","a olacai 4th conjugation":"olăcăi","a olecai":"olecăi","a olecai 4th conjugation":"olecăi","a oleia":"oleia","a oleia 1st conjugation":"oleia","a olicai":"olicăi","a olicai 4th conjugation":"olicăi","a ologi":"ologi","a ologi 4th conjugation":"ologi","a omagia":"omagia","a omagia 1st conjugation":"omagia","a omeni":"omeni","a omeni 4th conjugation":"omeni","a omesti":"omesti","a omesti 4th conjugation":"omesti","a omite":"omite","a omite 3rd conjugation":"omite","a omogeneiza":"omogeneiza","a omogeneiza 1st conjugation":"omogeneiza","a omogeniza":"omogeniza","a omogeniza 1st conjugation":"omogeniza","a omologa":"omologa","a omologa 1st conjugation":"omologa","a omori":"omorî","a omori 4th conjugation":"omorî","a omrazi":"omrăzi","a omrazi 4th conjugation":"omrăzi","a ondula":"ondula","a ondula 1st conjugation":"ondula","a onora":"onora","a onora 1st conjugation":"onora","a opaci":"opăci","a opaci 4th conjugation":"opăci","a opacifia":"opacifia","a opacifia 1st conjugation":"opacifia","a opaciza":"opaciza","a opaciza 1st conjugation":"opaciza","a opaliza":"opaliza","a opaliza 1st conjugation":"opaliza","a opari":"opări","a opari 4th conjugation":"opări","a opera":"opera","a opera 1st conjugation":"opera","a opina":"opina","a opina 1st conjugation":"opina","a opinti":"opinti","a opinti 4th conjugation":"opinti","a oplosi":"oploși","a oplosi 4th conjugation":"oploși","a opri":"opri","a opri 4th conjugation":"opri","a oprima":"oprima","a oprima 1st conjugation":"oprima","a opta":["a opta","opta","a opta","optulea"],"a opta 1st conjugation":"opta","a optimiza":"optimiza","a optimiza 1st conjugation":"optimiza","a optspea":["a optșpea","optșpea","a optșpea","optșpelea"],"a optsprezecea":["a optsprezecea","optsprezecea","a optsprezecea","optsprezecelea"],"a optzecea":["a optzecea","optzecea","a optzecea","optzecilea"],"a optzeci si cincea":["a optzeci și cincea","optzeci și cincea","a optzeci și cincea","optzeci și cincilea"],"a optzeci si doua":["a optzeci și doua","optzeci și doilea","a optzeci și doua","optzeci și doua"],"a optzeci si noua":["a optzeci și noua","optzeci și noua","a optzeci și noua","optzeci și nouălea"],"a optzeci si opta":["a optzeci și opta","optzeci și opta","a optzeci și opta","optzeci și optulea"],"a optzeci si patra":["a optzeci și patra","optzeci și patra","a optzeci și patra","optzeci și patrulea"],"a optzeci si saptea":["a optzeci și șaptea","optzeci și șaptea","a optzeci și șaptea","optzeci și șaptelea"],"a optzeci si sasea":["a optzeci și șasea","optzeci și șasea","a optzeci și șasea","optzeci și șaselea"],"a optzeci si treia":["a optzeci și treia","optzeci și treia","a optzeci și treia","optzeci și treilea"],"a optzeci si una":["a optzeci și una","optzeci și una","a optzeci și una","optzeci și unulea"],"a opune 3rd conjugation":"opune","a oracai":"orăcăi","a oracai 4th conjugation":"orăcăi","a orandui":"orândui","a orandui 4th conjugation":"orândui","a oraseniza":"orășeniza","a oraseniza 1st conjugation":"orășeniza","a orbacai":"orbăcăi","a orbacai 4th conjugation":"orbăcăi","a orbeca":"orbeca","a orbeca 1st conjugation":"orbeca","a orbecai":"orbecăi","a orbecai 4th conjugation":"orbecăi","a orbi":"orbi","a orbi 4th conjugation":"orbi","a orchestra":"orchestra","a orchestra 1st conjugation":"orchestra","a ordina":"ordina","a ordina 1st conjugation":"ordina","a ordona":"ordona","a ordona 1st conjugation":"ordona","a ordonanta":"ordonanța","a ordonanta 1st conjugation":"ordonanța","a organisi":"organisi","a organisi 4th conjugation":"organisi","a organiza":"organiza","a organiza 1st conjugation":"organiza","a orienta":"orienta","a orienta 1st conjugation":"orienta","a orientaliza":"orientaliza","a orientaliza 1st conjugation":"orientaliza","a oripila":"oripila","a oripila 1st conjugation":"oripila","a orizontaliza":"orizontaliza","a orizontaliza 1st conjugation":"orizontaliza","a orna":"orna","a orna 1st conjugation":"orna","a ornamenta":"ornamenta","a ornamenta 1st conjugation":"ornamenta","a oropsi":"oropsi","a oropsi 4th conjugation":"oropsi","a ortaci":"ortăci","a ortaci 4th conjugation":"ortăci","a ortografia":"ortografia","a ortografia 1st conjugation":"ortografia","a osambri":"osâmbri","a osambri 4th conjugation":"osâmbri","a osandi":"osândi","a osandi 4th conjugation":"osândi","a osardnici":"osârdnici","a osardnici 4th conjugation":"osârdnici","a oscila":"oscila","a oscila 1st conjugation":"oscila","a osebi":"osebi","a osebi 4th conjugation":"osebi","a osfestui":"osfeștui","a osfestui 4th conjugation":"osfeștui","a osfinti":"osfinti","a osfinti 4th conjugation":"osfinti","a osifica":"osifica","a osifica 1st conjugation":"osifica","a ospata":"ospăta","a ospata 1st conjugation":"ospăta","a ospeta":"ospeta","a ospeta 1st conjugation":"ospeta","a ospita":"ospita","a ospita 1st conjugation":"ospita","a ostampi":"ostâmpi","a ostampi 4th conjugation":"ostâmpi","a osteni":"osteni","a osteni 4th conjugation":"osteni","a osti":"oști","a osti 4th conjugation":"oști","a ostoi":"ostoi","a ostoi 4th conjugation":"ostoi","a ostoia":"ostoia","a ostoia 1st conjugation":"ostoia","a ostraciza":"ostraciza","a ostraciza 1st conjugation":"ostraciza","a osveti":"osveti","a osveti 4th conjugation":"osveti","a otanji":"otânji","a otanji 4th conjugation":"otânji","a otari":["a oțări","oțări","a oțărî","oțărî"],"a otari 4th conjugation":["a oțări 4th conjugation","oțări","a oțărî 4th conjugation","oțărî"],"a otcarmui":"otcârmui","a otcarmui 4th conjugation":"otcârmui","a oteli":"oțeli","a oteli 4th conjugation":"oțeli","a oteri":["a oțeri","oțeri","a oțerî","oțerî"],"a oteri 4th conjugation":["a oțeri 4th conjugation","oțeri","a oțerî 4th conjugation","oțerî"],"a oteti":["a oțeti","oțeti","a oțeți","oțeți"],"a oteti 4th conjugation":["a oțeti 4th conjugation","oțeti","a oțeți 4th conjugation","oțeți"],"a otravi":"otrăvi","a otravi 4th conjugation":"otrăvi","a oua":"oua","a oua 1st conjugation":"oua","a ovaliza":"ovaliza","a ovaliza 1st conjugation":"ovaliza","a ovationa":"ovaționa","a ovationa 1st conjugation":"ovaționa","a ovili":"ovili","a ovili 4th conjugation":"ovili","a oxida":"oxida","a oxida 1st conjugation":"oxida","a oxigena":"oxigena","a oxigena 1st conjugation":"oxigena","a ozona":"ozona","a ozona 1st conjugation":"ozona","a ozonifica":"ozonifica","a ozonifica 1st conjugation":"ozonifica","a ozoniza":"ozoniza","a ozoniza 1st conjugation":"ozoniza","a rabata":"rabata","a rabata 1st conjugation":"rabata","a rabda":"răbda","a rabda 1st conjugation":"răbda","a rablagi":["a rablagi","rablagi","a răblăgi","răblăgi"],"a rablagi 4th conjugation":["a rablagi 4th conjugation","rablagi","a răblăgi 4th conjugation","răblăgi"],"a raboji":"răboji","a raboji 4th conjugation":"răboji","a rabota":"rabota","a rabota 1st conjugation":"rabota","a rabufni":"răbufni","a rabufni 4th conjugation":"răbufni","a racadui":"răcădui","a racadui 4th conjugation":"răcădui","a racai":"râcâi","a racai 4th conjugation":"râcâi","a racani":"răcăni","a racani 4th conjugation":"răcăni","a raci":"răci","a raci 4th conjugation":"răci","a racla":"racla","a racla 1st conjugation":"racla","a racni":"răcni","a racni 4th conjugation":"răcni","a racola":"racola","a racola 1st conjugation":"racola","a raconta":"raconta","a raconta 1st conjugation":"raconta","a racorda":"racorda","a racorda 1st conjugation":"racorda","a racori":"răcori","a racori 4th conjugation":"răcori","a rade":["a rade","rade","a râde","râde"],"a rade 3rd conjugation":["a rade 3rd conjugation","rade","a râde 3rd conjugation","râde"],"a rade in barba 3rd conjugation":"râde în barbă","a rade pe sub mustata 3rd conjugation":"râde pe sub mustață","a radia 1st conjugation":"radia","a radica":"rădica","a radica 1st conjugation":"rădica","a radicaliza":"radicaliza","a radicaliza 1st conjugation":"radicaliza","a radiobaliza":"radiobaliza","a radiobaliza 1st conjugation":"radiobaliza","a radiodifuza":"radiodifuza","a radiodifuza 1st conjugation":"radiodifuza","a radioghida":"radioghida","a radioghida 1st conjugation":"radioghida","a radiografia":"radiografia","a radiografia 1st conjugation":"radiografia","a radiotelegrafia":"radiotelegrafia","a radiotelegrafia 1st conjugation":"radiotelegrafia","a rafina":"rafina","a rafina 1st conjugation":"rafina","a rafistola":"rafistola","a rafistola 1st conjugation":"rafistola","a rafui":"răfui","a rafui 4th conjugation":"răfui","a ragai 4th conjugation":"râgâi","a rage":"rage","a rage 3rd conjugation":"rage","a ragi":"răgi","a ragi 4th conjugation":"răgi","a ragni":"răgni","a ragni 4th conjugation":"răgni","a ragusi":"răguși","a ragusi 4th conjugation":"răguși","a raiona":"raiona","a raiona 1st conjugation":"raiona","a ralia":"ralia","a ralia 1st conjugation":"ralia","a rama":["a rama","rama","a râma","râma"],"a rama 1st conjugation":["a rama 1st conjugation","rama","a râma 1st conjugation","râma"],"a ramane":"rămâne","a ramane 3rd conjugation":"rămâne","a ramane cu buzele umflate 3rd conjugation":"rămâne cu buzele umflate","a ramanea":"rămânea","a ramanea 2nd conjugation":"rămânea","a ramasi":"rămăși","a ramasi 4th conjugation":"rămăși","a rambleia":"rambleia","a rambleia 1st conjugation":"rambleia","a rambursa":"rambursa","a rambursa 1st conjugation":"rambursa","a ramifica":"ramifica","a ramifica 1st conjugation":"ramifica","a ramni":"râmni","a ramni 4th conjugation":"râmni","a ramoli":"ramoli","a ramoli 4th conjugation":"ramoli","a ramplasa":"ramplasa","a ramplasa 1st conjugation":"ramplasa","a ramuri":"rămuri","a ramuri 4th conjugation":"rămuri","a rancezi":"râncezi","a rancezi 4th conjugation":"râncezi","a rancheza":"râncheza","a rancheza 1st conjugation":"râncheza","a randomiza":"randomiza","a randomiza 1st conjugation":"randomiza","a randui":"rândui","a randui 4th conjugation":"rândui","a ranforsa":"ranforsa","a ranforsa 1st conjugation":"ranforsa","a rani":["a râni","râni","a răni","răni"],"a rani 4th conjugation":["a râni 4th conjugation","râni","a răni 4th conjugation","răni"],"a ranji":"rânji","a ranji 4th conjugation":"rânji","a ranversa":"ranversa","a ranversa 1st conjugation":"ranversa","a rapai":"răpăi","a rapai 4th conjugation":"răpăi","a rapega":"răpega","a rapega 1st conjugation":"răpega","a rapi":"răpi","a rapi 4th conjugation":"răpi","a raporta":"raporta","a raporta 1st conjugation":"raporta","a raportui":"raportui","a raportui 4th conjugation":"raportui","a raposa":"răposa","a raposa 1st conjugation":"răposa","a rapsti":"răpști","a rapsti 4th conjugation":"răpști","a rapune":"răpune","a rapune 3rd conjugation":"răpune","a rarefia":"rarefia","a rarefia 1st conjugation":"rarefia","a rari":"rări","a rari 4th conjugation":"rări","a rarifica":"rarifica","a rarifica 1st conjugation":"rarifica","a rasadi":"răsădi","a rasadi 4th conjugation":"răsădi","a rasajdui":"răsăjdui","a rasajdui 4th conjugation":"răsăjdui","a rasari":"răsări","a rasari 4th conjugation":"răsări","a rascacara":"răscăcăra","a rascacara 1st conjugation":"răscăcăra","a rascheta":"rașcheta","a rascheta 1st conjugation":"rașcheta","a raschi":"răschi","a raschi 4th conjugation":"răschi","a raschia":"rășchia","a raschia 1st conjugation":"rășchia","a raschira":"răschira","a raschira 1st conjugation":"răschira","a rasciti":"răsciti","a rasciti 4th conjugation":"răsciti","a rascoace":"răscoace","a rascoace 3rd conjugation":"răscoace","a rascoli":"răscoli","a rascoli 4th conjugation":"răscoli","a rascracana":"răscrăcăna","a rascracana 1st conjugation":"răscrăcăna","a rascula":"răscula","a rascula 1st conjugation":"răscula","a rascumpara":"răscumpăra","a rascumpara 1st conjugation":"răscumpăra","a rasfata":"răsfăța","a rasfata 1st conjugation":"răsfăța","a rasfierbe":"răsfierbe","a rasfierbe 3rd conjugation":"răsfierbe","a rasfira":"răsfira","a rasfira 1st conjugation":"răsfira","a rasfoi":"răsfoi","a rasfoi 4th conjugation":"răsfoi","a rasfrange":"răsfrânge","a rasfrange 3rd conjugation":"răsfrânge","a rasni":"râșni","a rasni 4th conjugation":"râșni","a rasoli":"rasoli","a rasoli 4th conjugation":"rasoli","a raspandi":"răspândi","a raspandi 4th conjugation":"răspândi","a raspica":"răspica","a raspica 1st conjugation":"răspica","a rasplati":"răsplăti","a rasplati 4th conjugation":"răsplăti","a raspopi":"răspopi","a raspopi 4th conjugation":"răspopi","a raspunde":"răspunde","a raspunde 3rd conjugation":"răspunde","a rassti":"răsști","a rassti 4th conjugation":"răsști","a rastalmaci":"răstălmăci","a rastalmaci 4th conjugation":"răstălmăci","a rasti":"răsti","a rasti 4th conjugation":"răsti","a rastigni":"răstigni","a rastigni 4th conjugation":"răstigni","a rastoci":"răstoci","a rastoci 4th conjugation":"răstoci","a rasturna":"răsturna","a rasturna 1st conjugation":"răsturna","a rasuci":"răsuci","a rasuci 4th conjugation":"răsuci","a rasufla":"răsufla","a rasufla 1st conjugation":"răsufla","a rasui":"râsui","a rasui 4th conjugation":"râsui","a rasuna":"răsuna","a rasuna 1st conjugation":"răsuna","a rasvari":"răsvări","a rasvari 4th conjugation":"răsvări","a raszice":"răszice","a raszice 3rd conjugation":"răszice","a rata":"rata","a rata 1st conjugation":"rata","a rataci":"rătăci","a rataci 4th conjugation":"rătăci","a ratifica":"ratifica","a ratifica 1st conjugation":"ratifica","a rationa":"raționa","a rationa 1st conjugation":"raționa","a rationaliza":"raționaliza","a rationaliza 1st conjugation":"raționaliza","a ratunji":"rătunji","a ratunji 4th conjugation":"rătunji","a ratuti":"rătuti","a ratuti 4th conjugation":"rătuti","a raura":"râura","a raura 1st conjugation":"râura","a rauri":"râuri","a rauri 4th conjugation":"râuri","a rautati":"răutăți","a rautati 4th conjugation":"răutăți","a ravasi":"răvăși","a ravasi 4th conjugation":"răvăși","a ravni":"râvni","a ravni 4th conjugation":"râvni","a raza":"răza","a raza 1st conjugation":"răza","a razalui":"răzălui","a razalui 4th conjugation":"răzălui","a razbate 3rd conjugation":"răzbate","a razbi":"răzbi","a razbi 4th conjugation":"răzbi","a razboi":"război","a razboi 4th conjugation":"război","a razboli":"războli","a razboli 4th conjugation":"războli","a razboteza":"războteza","a razboteza 1st conjugation":"războteza","a razbuna":"răzbuna","a razbuna 1st conjugation":"răzbuna","a razdrusi":"răzdruși","a razdrusi 4th conjugation":"răzdruși","a razgaia":["a râzgâia","râzgâia","a răzgâia","răzgâia"],"a razgaia 1st conjugation":["a râzgâia 1st conjugation","râzgâia","a răzgâia 1st conjugation","răzgâia"],"a razgandi":"răzgândi","a razgandi 4th conjugation":"răzgândi","a razi":"răzi","a razi 4th conjugation":"răzi","a razima":"răzima","a razima 1st conjugation":"răzima","a razleti":"răzleți","a razleti 4th conjugation":"răzleți","a razni":"răzni","a razni 4th conjugation":"răzni","a razori":"răzori","a razori 4th conjugation":"răzori","a razui":"răzui","a razui 4th conjugation":"răzui","a razvesti":"răzvesti","a razvesti 4th conjugation":"răzvesti","a razvrati":"răzvrăti","a razvrati 4th conjugation":"răzvrăti","a reabilita":"reabilita","a reabilita 1st conjugation":"reabilita","a reabona":"reabona","a reabona 1st conjugation":"reabona","a reaborda":"reaborda","a reaborda 1st conjugation":"reaborda","a reaclimatiza":"reaclimatiza","a reaclimatiza 1st conjugation":"reaclimatiza","a reacoperi":"reacoperi","a reacoperi 4th conjugation":"reacoperi","a reacorda":"reacorda","a reacorda 1st conjugation":"reacorda","a reactiona":"reacționa","a reactiona 1st conjugation":"reacționa","a reactiva":"reactiva","a reactiva 1st conjugation":"reactiva","a reactualiza":"reactualiza","a reactualiza 1st conjugation":"reactualiza","a reacumula":"reacumula","a reacumula 1st conjugation":"reacumula","a readapta":"readapta","a readapta 1st conjugation":"readapta","a readmite":"readmite","a readmite 3rd conjugation":"readmite","a readmonesta":"readmonesta","a readmonesta 1st conjugation":"readmonesta","a readormi":"readormi","a readormi 4th conjugation":"readormi","a readuce":"readuce","a readuce 3rd conjugation":"readuce","a readuna":"readuna","a readuna 1st conjugation":"readuna","a reaerisi":"reaerisi","a reaerisi 4th conjugation":"reaerisi","a reafirma":"reafirma","a reafirma 1st conjugation":"reafirma","a reafla":"reafla","a reafla 1st conjugation":"reafla","a reagrava":"reagrava","a reagrava 1st conjugation":"reagrava","a reajunge":"reajunge","a reajunge 3rd conjugation":"reajunge","a reajusta":"reajusta","a reajusta 1st conjugation":"reajusta","a realege":"realege","a realege 3rd conjugation":"realege","a realimenta":"realimenta","a realimenta 1st conjugation":"realimenta","a realinia":"realinia","a realinia 1st conjugation":"realinia","a realipi":"realipi","a realipi 4th conjugation":"realipi","a realiza":"realiza","a realiza 1st conjugation":"realiza","a realta":"realța","a realta 1st conjugation":"realța","a realtoi":"realtoi","a realtoi 4th conjugation":"realtoi","a reambala":"reambala","a reambala 1st conjugation":"reambala","a reambarca":"reambarca","a reambarca 1st conjugation":"reambarca","a reamenaja":"reamenaja","a reamenaja 1st conjugation":"reamenaja","a reaminti":"reaminti","a reaminti 4th conjugation":"reaminti","a reamplasa":"reamplasa","a reamplasa 1st conjugation":"reamplasa","a reamputa":"reamputa","a reamputa 1st conjugation":"reamputa","a reanaliza":"reanaliza","a reanaliza 1st conjugation":"reanaliza","a reangaja":"reangaja","a reangaja 1st conjugation":"reangaja","a reanima":"reanima","a reanima 1st conjugation":"reanima","a reaparea":"reapărea","a reaparea 2nd conjugation":"reapărea","a reaprinde":"reaprinde","a reaprinde 3rd conjugation":"reaprinde","a reaproviziona":"reaproviziona","a reaproviziona 1st conjugation":"reaproviziona","a reapuca":"reapuca","a reapuca 1st conjugation":"reapuca","a rearanja":"rearanja","a rearanja 1st conjugation":"rearanja","a rearbitra":"rearbitra","a rearbitra 1st conjugation":"rearbitra","a rearenda":"rearenda","a rearenda 1st conjugation":"rearenda","a rearginta":"rearginta","a rearginta 1st conjugation":"rearginta","a rearma":"rearma","a rearma 1st conjugation":"rearma","a reasculta":"reasculta","a reasculta 1st conjugation":"reasculta","a reaseza":"reașeza","a reaseza 1st conjugation":"reașeza","a reasigura":"reasigura","a reasigura 1st conjugation":"reasigura","a reasocia":"reasocia","a reasocia 1st conjugation":"reasocia","a reatata":"reațâța","a reatata 1st conjugation":"reațâța","a reatribui":"reatribui","a reatribui 4th conjugation":"reatribui","a reaudia":"reaudia","a reaudia 1st conjugation":"reaudia","a reauzi":"reauzi","a reauzi 4th conjugation":"reauzi","a rebandaja":"rebandaja","a rebandaja 1st conjugation":"rebandaja","a rebate":"rebate","a rebate 3rd conjugation":"rebate","a reboteza":"reboteza","a reboteza 1st conjugation":"reboteza","a rebuta":"rebuta","a rebuta 1st conjugation":"rebuta","a recadea":"recădea","a recadea 2nd conjugation":"recădea","a recalcula":"recalcula","a recalcula 1st conjugation":"recalcula","a recalibra":"recalibra","a recalibra 1st conjugation":"recalibra","a recalifica":"recalifica","a recalifica 1st conjugation":"recalifica","a recalota":"recalota","a recalota 1st conjugation":"recalota","a recantari":"recântări","a recantari 4th conjugation":"recântări","a recapata":"recăpăta","a recapata 1st conjugation":"recăpăta","a recapitula":"recapitula","a recapitula 1st conjugation":"recapitula","a recarbura":"recarbura","a recarbura 1st conjugation":"recarbura","a recasatori":"recăsători","a recasatori 4th conjugation":"recăsători","a recastiga":"recâștiga","a recastiga 1st conjugation":"recâștiga","a recategorisi":"recategorisi","a recategorisi 4th conjugation":"recategorisi","a receda":"receda","a receda 1st conjugation":"receda","a recela":"recela","a recela 1st conjugation":"recela","a recenza":"recenza","a recenza 1st conjugation":"recenza","a recepe":"recepe","a recepe 3rd conjugation":"recepe","a receptiona":"recepționa","a receptiona 1st conjugation":"recepționa","a recerceta":"recerceta","a recerceta 1st conjugation":"recerceta","a rechema":"rechema","a rechema 1st conjugation":"rechema","a rechizitiona":"rechiziționa","a rechizitiona 1st conjugation":"rechiziționa","a recicla":"recicla","a recicla 1st conjugation":"recicla","a recidiva":"recidiva","a recidiva 1st conjugation":"recidiva","a recircula":"recircula","a recircula 1st conjugation":"recircula","a recita":"recita","a recita 1st conjugation":"recita","a reciti":"reciti","a reciti 4th conjugation":"reciti","a recladi":"reclădi","a recladi 4th conjugation":"reclădi","a reclama":"reclama","a reclama 1st conjugation":"reclama","a reclasa":"reclasa","a reclasa 1st conjugation":"reclasa","a reclasifica":"reclasifica","a reclasifica 1st conjugation":"reclasifica","a recoace":"recoace","a recoace 3rd conjugation":"recoace","a recobori":"recoborî","a recobori 4th conjugation":"recoborî","a recoloniza":"recoloniza","a recoloniza 1st conjugation":"recoloniza","a recolora":"recolora","a recolora 1st conjugation":"recolora","a recolta":"recolta","a recolta 1st conjugation":"recolta","a recomanda":"recomanda","a recomanda 1st conjugation":"recomanda","a recombina":"recombina","a recombina 1st conjugation":"recombina","a recomenta":"recomenta","a recomenta 1st conjugation":"recomenta","a recompartimenta":"recompartimenta","a recompartimenta 1st conjugation":"recompartimenta","a recompensa":"recompensa","a recompensa 1st conjugation":"recompensa","a recomprima":"recomprima","a recomprima 1st conjugation":"recomprima","a recompune":"recompune","a recompune 3rd conjugation":"recompune","a reconcilia 1st conjugation":"reconcilia","a reconditiona":"recondiționa","a reconditiona 1st conjugation":"recondiționa","a reconfigura":"reconfigura","a reconfigura 1st conjugation":"reconfigura","a reconfirma":"reconfirma","a reconfirma 1st conjugation":"reconfirma","a reconforta":"reconforta","a reconforta 1st conjugation":"reconforta","a reconsidera":"reconsidera","a reconsidera 1st conjugation":"reconsidera","a reconsolida":"reconsolida","a reconsolida 1st conjugation":"reconsolida","a reconstitui":"reconstitui","a reconstitui 4th conjugation":"reconstitui","a reconstrui":"reconstrui","a reconstrui 4th conjugation":"reconstrui","a reconverti":"reconverti","a reconverti 4th conjugation":"reconverti","a reconvoca":"reconvoca","a reconvoca 1st conjugation":"reconvoca","a recopia":"recopia","a recopia 1st conjugation":"recopia","a recrea":"recrea","a recrea 1st conjugation":"recrea","a recrimina":"recrimina","a recrimina 1st conjugation":"recrimina","a recroma":"recroma","a recroma 1st conjugation":"recroma","a recruta":"recruta","a recruta 1st conjugation":"recruta","a rectalui":"rectălui","a rectalui 4th conjugation":"rectălui","a rectifica":"rectifica","a rectifica 1st conjugation":"rectifica","a recuceri":"recuceri","a recuceri 4th conjugation":"recuceri","a recula":"recula","a recula 1st conjugation":"recula","a reculege":"reculege","a reculege 3rd conjugation":"reculege","a recunoaste":"recunoaște","a recunoaste 3rd conjugation":"recunoaște","a recupera":"recupera","a recupera 1st conjugation":"recupera","a recurba":"recurba","a recurba 1st conjugation":"recurba","a recurge":"recurge","a recurge 3rd conjugation":"recurge","a recuza":"recuza","a recuza 1st conjugation":"recuza","a reda":"reda","a reda 1st conjugation":"reda","a redacta":"redacta","a redacta 1st conjugation":"redacta","a redarui":"redărui","a redarui 4th conjugation":"redărui","a redata":"redata","a redata 1st conjugation":"redata","a redefini":"redefini","a redefini 4th conjugation":"redefini","a redeschide":"redeschide","a redeschide 3rd conjugation":"redeschide","a redescoperi":"redescoperi","a redescoperi 4th conjugation":"redescoperi","a redestepta":"redeștepta","a redestepta 1st conjugation":"redeștepta","a redeveni":"redeveni","a redeveni 4th conjugation":"redeveni","a redija":"redija","a redija 1st conjugation":"redija","a redimensiona":"redimensiona","a redimensiona 1st conjugation":"redimensiona","a rediscuta":"rediscuta","a rediscuta 1st conjugation":"rediscuta","a redisparea":"redispărea","a redisparea 2nd conjugation":"redispărea","a redistila":"redistila","a redistila 1st conjugation":"redistila","a redistribui":"redistribui","a redistribui 4th conjugation":"redistribui","a redizolva":"redizolva","a redizolva 1st conjugation":"redizolva","a redobandi":"redobândi","a redobandi 4th conjugation":"redobândi","a redresa":"redresa","a redresa 1st conjugation":"redresa","a reduce":"reduce","a reduce 3rd conjugation":"reduce","a reduplica":"reduplica","a reduplica 1st conjugation":"reduplica","a reechilibra":"reechilibra","a reechilibra 1st conjugation":"reechilibra","a reedifica":"reedifica","a reedifica 1st conjugation":"reedifica","a reedita":"reedita","a reedita 1st conjugation":"reedita","a reeduca":"reeduca","a reeduca 1st conjugation":"reeduca","a reesalona":"reeșalona","a reesalona 1st conjugation":"reeșalona","a reevalua":"reevalua","a reevalua 1st conjugation":"reevalua","a reexamina":"reexamina","a reexamina 1st conjugation":"reexamina","a reexpedia":"reexpedia","a reexpedia 1st conjugation":"reexpedia","a reexporta":"reexporta","a reexporta 1st conjugation":"reexporta","a reface":"reface","a reface 3rd conjugation":"reface","a refeca":"refeca","a refeca 1st conjugation":"refeca","a refera":"refera","a refera 1st conjugation":"refera","a referi":"referi","a referi 4th conjugation":"referi","a refierbe":"refierbe","a refierbe 3rd conjugation":"refierbe","a reflecta":"reflecta","a reflecta 1st conjugation":"reflecta","a refolosi":"refolosi","a refolosi 4th conjugation":"refolosi","a reforja":"reforja","a reforja 1st conjugation":"reforja","a reforma":"reforma","a reforma 1st conjugation":"reforma","a reformula":"reformula","a reformula 1st conjugation":"reformula","a refracta":"refracta","a refracta 1st conjugation":"refracta","a refrigera":"refrigera","a refrigera 1st conjugation":"refrigera","a refrisa":"refrișa","a refrisa 1st conjugation":"refrișa","a refrunta":"refrunta","a refrunta 1st conjugation":"refrunta","a refugi":"refugi","a refugi 4th conjugation":"refugi","a refugia":"refugia","a refugia 1st conjugation":"refugia","a refula":"refula","a refula 1st conjugation":"refula","a refuta":"refuta","a refuta 1st conjugation":"refuta","a refuza":"refuza","a refuza 1st conjugation":"refuza","a regala":"regala","a regala 1st conjugation":"regala","a regandi":"regândi","a regandi 4th conjugation":"regândi","a regasi":"regăsi","a regasi 4th conjugation":"regăsi","a regenera":"regenera","a regenera 1st conjugation":"regenera","a regiza":"regiza","a regiza 1st conjugation":"regiza","a regla":"regla","a regla 1st conjugation":"regla","a reglementa":"reglementa","a reglementa 1st conjugation":"reglementa","a regrada":"regrada","a regrada 1st conjugation":"regrada","a regresa":"regresa","a regresa 1st conjugation":"regresa","a regreta":"regreta","a regreta 1st conjugation":"regreta","a regrupa":"regrupa","a regrupa 1st conjugation":"regrupa","a regula":"regula","a regula 1st conjugation":"regula","a regulamenta":"regulamenta","a regulamenta 1st conjugation":"regulamenta","a regularisi":"regularisi","a regularisi 4th conjugation":"regularisi","a regulariza":"regulariza","a regulariza 1st conjugation":"regulariza","a regurgita":"regurgita","a regurgita 1st conjugation":"regurgita","a reiepta":"reiepta","a reiepta 1st conjugation":"reiepta","a reiesi":"reieși","a reiesi 4th conjugation":"reieși","a reimbarbata":"reîmbărbăta","a reimbarbata 1st conjugation":"reîmbărbăta","a reimpaca":"reîmpăca","a reimpaca 1st conjugation":"reîmpăca","a reimpaduri":"reîmpăduri","a reimpaduri 4th conjugation":"reîmpăduri","a reimparti":"reîmpărți","a reimparti 4th conjugation":"reîmpărți","a reimporta":"reimporta","a reimporta 1st conjugation":"reimporta","a reimpreuna":"reîmpreuna","a reimpreuna 1st conjugation":"reîmpreuna","a reimprieteni":"reîmprieteni","a reimprieteni 4th conjugation":"reîmprieteni","a reimprima":"reimprima","a reimprima 1st conjugation":"reimprima","a reimprospata":"reîmprospăta","a reimprospata 1st conjugation":"reîmprospăta","a reimprumuta":"reîmprumuta","a reimprumuta 1st conjugation":"reîmprumuta","a reinalta":"reînălța","a reinalta 1st conjugation":"reînălța","a reinarma":"reînarma","a reinarma 1st conjugation":"reînarma","a reincalzi":"reîncălzi","a reincalzi 4th conjugation":"reîncălzi","a reincarca":"reîncărca","a reincarca 1st conjugation":"reîncărca","a reincarna":["a reincarna","reincarna","a reîncarna","reîncarna"],"a reincarna 1st conjugation":["a reincarna 1st conjugation","reincarna","a reîncarna 1st conjugation","reîncarna"],"a reincepe":"reîncepe","a reincepe 3rd conjugation":"reîncepe","a reinchide":"reînchide","a reinchide 3rd conjugation":"reînchide","a reinchiria":"reînchiria","a reinchiria 1st conjugation":"reînchiria","a reincolti":"reîncolți","a reincolti 4th conjugation":"reîncolți","a reincorpora":"reîncorpora","a reincorpora 1st conjugation":"reîncorpora","a reindoi":"reîndoi","a reindoi 4th conjugation":"reîndoi","a reindrepta":"reîndrepta","a reindrepta 1st conjugation":"reîndrepta","a reindruma":"reîndruma","a reindruma 1st conjugation":"reîndruma","a reinfecta":"reinfecta","a reinfecta 1st conjugation":"reinfecta","a reinfiinta":"reînființa","a reinfiinta 1st conjugation":"reînființa","a reinflori":"reînflori","a reinflori 4th conjugation":"reînflori","a reinmatricula":"reînmatricula","a reinmatricula 1st conjugation":"reînmatricula","a reinnoda":"reînnoda","a reinnoda 1st conjugation":"reînnoda","a reinnoi":"reînnoi","a reinnoi 4th conjugation":"reînnoi","a reinsamanta":"reînsămânța","a reinsamanta 1st conjugation":"reînsămânța","a reinsanatosi":"reînsănătoși","a reinsanatosi 4th conjugation":"reînsănătoși","a reinscauna":"reînscăuna","a reinscauna 1st conjugation":"reînscăuna","a reinstala":"reinstala","a reinstala 1st conjugation":"reinstala","a reinstaura":"reinstaura","a reinstaura 1st conjugation":"reinstaura","a reinsufleti":"reînsufleți","a reinsufleti 4th conjugation":"reînsufleți","a reinsuruba":"reînșuruba","a reinsuruba 1st conjugation":"reînșuruba","a reintalni":"reîntâlni","a reintalni 4th conjugation":"reîntâlni","a reintampina":"reîntâmpina","a reintampina 1st conjugation":"reîntâmpina","a reintari":"reîntări","a reintari 4th conjugation":"reîntări","a reintarzia":"reîntârzia","a reintarzia 1st conjugation":"reîntârzia","a reintegra":"reintegra","a reintegra 1st conjugation":"reintegra","a reintemeia":"reîntemeia","a reintemeia 1st conjugation":"reîntemeia","a reinteroga":"reinteroga","a reinteroga 1st conjugation":"reinteroga","a reinterpreta":"reinterpreta","a reinterpreta 1st conjugation":"reinterpreta","a reintineri":"reîntineri","a reintineri 4th conjugation":"reîntineri","a reintoarce":"reîntoarce","a reintoarce 3rd conjugation":"reîntoarce","a reintra":["a reintra","reintra","a reîntra","reîntra"],"a reintra 1st conjugation":["a reintra 1st conjugation","reintra","a reîntra 1st conjugation","reîntra"],"a reintregi":"reîntregi","a reintregi 4th conjugation":"reîntregi","a reintroduce":"reintroduce","a reintroduce 3rd conjugation":"reintroduce","a reintrona":"reîntrona","a reintrona 1st conjugation":"reîntrona","a reintrupa":"reîntrupa","a reintrupa 1st conjugation":"reîntrupa","a reinturna":"reînturna","a reinturna 1st conjugation":"reînturna","a reinventaria":"reinventaria","a reinventaria 1st conjugation":"reinventaria","a reinverzi":"reînverzi","a reinverzi 4th conjugation":"reînverzi","a reinvesti":"reinvesti","a reinvesti 4th conjugation":"reinvesti","a reinvia":"reînvia","a reinvia 1st conjugation":"reînvia","a reinvita":"reinvita","a reinvita 1st conjugation":"reinvita","a reitera":"reitera","a reitera 1st conjugation":"reitera","a reivi":"reivi","a reivi 4th conjugation":"reivi","a reizbi":"reizbi","a reizbi 4th conjugation":"reizbi","a reizbucni":"reizbucni","a reizbucni 4th conjugation":"reizbucni","a rejuca":"rejuca","a rejuca 1st conjugation":"rejuca","a rejudeca":"rejudeca","a rejudeca 1st conjugation":"rejudeca","a relansa":"relansa","a relansa 1st conjugation":"relansa","a relata":"relata","a relata 1st conjugation":"relata","a relationa":"relaționa","a relationa 1st conjugation":"relaționa","a relativiza":"relativiza","a relativiza 1st conjugation":"relativiza","a relaxa":"relaxa","a relaxa 1st conjugation":"relaxa","a relega":"relega","a relega 1st conjugation":"relega","a releva":"releva","a releva 1st conjugation":"releva","a reliefa":"reliefa","a reliefa 1st conjugation":"reliefa","a relua":"relua","a relua 1st conjugation":"relua","a remaia":"remaia","a remaia 1st conjugation":"remaia","a remania":"remania","a remania 1st conjugation":"remania","a remarca":"remarca","a remarca 1st conjugation":"remarca","a remarita":"remărita","a remarita 1st conjugation":"remărita","a remasura":"remăsura","a remasura 1st conjugation":"remăsura","a remedia":"remedia","a remedia 1st conjugation":"remedia","a rememora":"rememora","a rememora 1st conjugation":"rememora","a remilitariza":"remilitariza","a remilitariza 1st conjugation":"remilitariza","a remineraliza":"remineraliza","a remineraliza 1st conjugation":"remineraliza","a remite":"remite","a remite 3rd conjugation":"remite","a remiza":"remiza","a remiza 1st conjugation":"remiza","a remobila":"remobila","a remobila 1st conjugation":"remobila","a remodela":"remodela","a remodela 1st conjugation":"remodela","a remorca":"remorca","a remorca 1st conjugation":"remorca","a remunera":"remunera","a remunera 1st conjugation":"remunera","a renaste":"renaște","a renaste 3rd conjugation":"renaște","a renega":"renega","a renega 1st conjugation":"renega","a renegocia":"renegocia","a renegocia 1st conjugation":"renegocia","a renivela":"renivela","a renivela 1st conjugation":"renivela","a renova":"renova","a renova 1st conjugation":"renova","a renta":"renta","a renta 1st conjugation":"renta","a rentabiliza":"rentabiliza","a rentabiliza 1st conjugation":"rentabiliza","a renumara":"renumăra","a renumara 1st conjugation":"renumăra","a renunta":"renunța","a renunta 1st conjugation":"renunța","a reocupa":"reocupa","a reocupa 1st conjugation":"reocupa","a reoglindi":"reoglindi","a reoglindi 4th conjugation":"reoglindi","a reorandui":"reorândui","a reorandui 4th conjugation":"reorândui","a reorchestra":"reorchestra","a reorchestra 1st conjugation":"reorchestra","a reordona":"reordona","a reordona 1st conjugation":"reordona","a reorganiza":"reorganiza","a reorganiza 1st conjugation":"reorganiza","a reorienta":"reorienta","a reorienta 1st conjugation":"reorienta","a repagina":"repagina","a repagina 1st conjugation":"repagina","a repara":"repara","a repara 1st conjugation":"repara","a repartiza":"repartiza","a repartiza 1st conjugation":"repartiza","a repatria":"repatria","a repatria 1st conjugation":"repatria","a repauza":"repauza","a repauza 1st conjugation":"repauza","a repera":"repera","a repera 1st conjugation":"repera","a repercuta":"repercuta","a repercuta 1st conjugation":"repercuta","a repertoriza":"repertoriza","a repertoriza 1st conjugation":"repertoriza","a repeta":"repeta","a repeta 1st conjugation":"repeta","a repeti":"repeți","a repeti 4th conjugation":"repeți","a repetirui 4th conjugation":"repetirui","a repezi":"repezi","a repezi 4th conjugation":"repezi","a replamadi":"replămădi","a replamadi 4th conjugation":"replămădi","a replanta":"replanta","a replanta 1st conjugation":"replanta","a replica":"replica","a replica 1st conjugation":"replica","a repopora":"repopora","a repopora 1st conjugation":"repopora","a repopula":"repopula","a repopula 1st conjugation":"repopula","a reporta":"reporta","a reporta 1st conjugation":"reporta","a repovesti":"repovesti","a repovesti 4th conjugation":"repovesti","a repoza":"repoza","a repoza 1st conjugation":"repoza","a reprezenta":"reprezenta","a reprezenta 1st conjugation":"reprezenta","a reprima":"reprima","a reprima 1st conjugation":"reprima","a reprimi":"reprimi","a reprimi 4th conjugation":"reprimi","a reprivatiza":"reprivatiza","a reprivatiza 1st conjugation":"reprivatiza","a reproba":"reproba","a reproba 1st conjugation":"reproba","a reproduce":"reproduce","a reproduce 3rd conjugation":"reproduce","a reprofila":"reprofila","a reprofila 1st conjugation":"reprofila","a reprograma":"reprograma","a reprograma 1st conjugation":"reprograma","a reprosa":"reproșa","a reprosa 1st conjugation":"reproșa","a republica":"republica","a republica 1st conjugation":"republica","a repudia":"repudia","a repudia 1st conjugation":"repudia","a repugna":"repugna","a repugna 1st conjugation":"repugna","a repune":"repune","a repune 3rd conjugation":"repune","a repurta":"repurta","a repurta 1st conjugation":"repurta","a reputa":"reputa","a reputa 1st conjugation":"reputa","a resapa":"reșapa","a resapa 1st conjugation":"reșapa","a resarja":"reșarja","a resarja 1st conjugation":"reșarja","a rescrie":"rescrie","a rescrie 3rd conjugation":"rescrie","a resedea":"reședea","a resedea 2nd conjugation":"reședea","a resemna":"resemna","a resemna 1st conjugation":"resemna","a reseta":"reseta","a reseta 1st conjugation":"reseta","a resfira":"resfira","a resfira 1st conjugation":"resfira","a resigna":"resigna","a resigna 1st conjugation":"resigna","a resimti":"resimți","a resimti 4th conjugation":"resimți","a resofta":"resofta","a resofta 1st conjugation":"resofta","a resorbi":"resorbi","a resorbi 4th conjugation":"resorbi","a respecta":"respecta","a respecta 1st conjugation":"respecta","a respectalui":"respectălui","a respectalui 4th conjugation":"respectălui","a respectui":"respectui","a respectui 4th conjugation":"respectui","a respinge":"respinge","a respinge 3rd conjugation":"respinge","a respira":"respira","a respira 1st conjugation":"respira","a responsabiliza":"responsabiliza","a responsabiliza 1st conjugation":"responsabiliza","a restabili":"restabili","a restabili 4th conjugation":"restabili","a restaura":"restaura","a restaura 1st conjugation":"restaura","a resti":"resti","a resti 4th conjugation":"resti","a restitui":"restitui","a restitui 4th conjugation":"restitui","a restrange":"restrânge","a restrange 3rd conjugation":"restrânge","a restructura":"restructura","a restructura 1st conjugation":"restructura","a resuscita":"resuscita","a resuscita 1st conjugation":"resuscita","a retaia":"retăia","a retaia 1st conjugation":"retăia","a retalmaci":"retălmăci","a retalmaci 4th conjugation":"retălmăci","a retarda":"retarda","a retarda 1st conjugation":"retarda","a reteza":"reteza","a reteza 1st conjugation":"reteza","a retine":"reține","a retine 3rd conjugation":"reține","a retipari":"retipări","a retipari 4th conjugation":"retipări","a retopi":"retopi","a retopi 4th conjugation":"retopi","a retracta":"retracta","a retracta 1st conjugation":"retracta","a retraduce":"retraduce","a retraduce 3rd conjugation":"retraduce","a retrage":"retrage","a retrage 3rd conjugation":"retrage","a retrai":"retrăi","a retrai 4th conjugation":"retrăi","a retranscrie":"retranscrie","a retranscrie 3rd conjugation":"retranscrie","a retransmite":"retransmite","a retransmite 3rd conjugation":"retransmite","a retribui":"retribui","a retribui 4th conjugation":"retribui","a retrimite":"retrimite","a retrimite 3rd conjugation":"retrimite","a retroceda":"retroceda","a retroceda 1st conjugation":"retroceda","a retrograda":"retrograda","a retrograda 1st conjugation":"retrograda","a returna":"returna","a returna 1st conjugation":"returna","a retusa":"retușa","a retusa 1st conjugation":"retușa","a reumfla":"reumfla","a reumfla 1st conjugation":"reumfla","a reumple":"reumple","a reumple 3rd conjugation":"reumple","a reuni":"reuni","a reuni 4th conjugation":"reuni","a reunifica":"reunifica","a reunifica 1st conjugation":"reunifica","a reusi":"reuși","a reusi 4th conjugation":"reuși","a reutila":"reutila","a reutila 1st conjugation":"reutila","a revaccina":"revaccina","a revaccina 1st conjugation":"revaccina","a revalida":"revalida","a revalida 1st conjugation":"revalida","a revaloriza":"revaloriza","a revaloriza 1st conjugation":"revaloriza","a revansa":"revanșa","a revansa 1st conjugation":"revanșa","a revarsa":"revărsa","a revarsa 1st conjugation":"revărsa","a revedea":"revedea","a revedea 2nd conjugation":"revedea","a revela":"revela","a revela 1st conjugation":"revela","a revendica":"revendica","a revendica 1st conjugation":"revendica","a reveni":"reveni","a reveni 4th conjugation":"reveni","a reverbera":"reverbera","a reverbera 1st conjugation":"reverbera","a revigora":"revigora","a revigora 1st conjugation":"revigora","a revinde":"revinde","a revinde 3rd conjugation":"revinde","a revitaliza":"revitaliza","a revitaliza 1st conjugation":"revitaliza","a revizui":"revizui","a revizui 4th conjugation":"revizui","a revoca":"revoca","a revoca 1st conjugation":"revoca","a revolta":"revolta","a revolta 1st conjugation":"revolta","a revolutiona":"revoluționa","a revolutiona 1st conjugation":"revoluționa","a revolutionariza":"revoluționariza","a revolutionariza 1st conjugation":"revoluționariza","a revopsi":"revopsi","a revopsi 4th conjugation":"revopsi","a rezambi":"rezâmbi","a rezambi 4th conjugation":"rezâmbi","a rezeca":"rezeca","a rezeca 1st conjugation":"rezeca","a rezema":"rezema","a rezema 1st conjugation":"rezema","a rezerva":"rezerva","a rezerva 1st conjugation":"rezerva","a rezice":"rezice","a rezice 3rd conjugation":"rezice","a rezida":"rezida","a rezida 1st conjugation":"rezida","a rezidi":"rezidi","a rezidi 4th conjugation":"rezidi","a rezilia":"rezilia","a rezilia 1st conjugation":"rezilia","a rezina":"rezina","a rezina 1st conjugation":"rezina","a rezinifica":"rezinifica","a rezinifica 1st conjugation":"rezinifica","a rezista":"rezista","a rezista 1st conjugation":"rezista","a rezolva":"rezolva","a rezolva 1st conjugation":"rezolva","a rezolvirui":"rezolvirui","a rezolvirui 4th conjugation":"rezolvirui","a rezona":"rezona","a rezona 1st conjugation":"rezona","a rezulta":"rezulta","a rezulta 1st conjugation":"rezulta","a rezuma":"rezuma","a rezuma 1st conjugation":"rezuma","a ricana":"ricana","a ricana 1st conjugation":"ricana","a ricosa":"ricoșa","a ricosa 1st conjugation":"ricoșa","a rida":"rida","a rida 1st conjugation":"rida","a ridica":"ridica","a ridica 1st conjugation":"ridica","a ridica din umeri 1st conjugation":"ridica din umeri","a ridiculiza":"ridiculiza","a ridiculiza 1st conjugation":"ridiculiza","a rigidiza":"rigidiza","a rigidiza 1st conjugation":"rigidiza","a rima":"rima","a rima 1st conjugation":"rima","a rimbomba":"rimbomba","a rimbomba 1st conjugation":"rimbomba","a rimela":"rimela","a rimela 1st conjugation":"rimela","a rindela":"rindela","a rindela 1st conjugation":"rindela","a rindelui":"rindelui","a rindelui 4th conjugation":"rindelui","a rinoceriza":"rinoceriza","a rinoceriza 1st conjugation":"rinoceriza","a riposta":"riposta","a riposta 1st conjugation":"riposta","a risca":"risca","a risca 1st conjugation":"risca","a risipi":"risipi","a risipi 4th conjugation":"risipi","a ritma":"ritma","a ritma 1st conjugation":"ritma","a ritorisi":"ritorisi","a ritorisi 4th conjugation":"ritorisi","a ritualiza":"ritualiza","a ritualiza 1st conjugation":"ritualiza","a rivaliza":"rivaliza","a rivaliza 1st conjugation":"rivaliza","a roade":"roade","a roade 3rd conjugation":"roade","a robi":"robi","a robi 4th conjugation":"robi","a roboti":"roboti","a roboti 4th conjugation":"roboti","a robotiza":"robotiza","a robotiza 1st conjugation":"robotiza","a rodi":"rodi","a rodi 4th conjugation":"rodi","a rodnici":"rodnici","a rodnici 4th conjugation":"rodnici","a romani":"români","a romani 4th conjugation":"români","a romaniza":["a romaniza","romaniza","a româniza","româniza"],"a romaniza 1st conjugation":["a romaniza 1st conjugation","romaniza","a româniza 1st conjugation","româniza"],"a romanta":"romanța","a romanta 1st conjugation":"romanța","a ronja":"ronja","a ronja 1st conjugation":"ronja","a rontai":"ronțăi","a rontai 4th conjugation":"ronțăi","a rosi":"roși","a rosi 4th conjugation":"roși","a rosti":"rosti","a rosti 4th conjugation":"rosti","a rostogoli":"rostogoli","a rostogoli 4th conjugation":"rostogoli","a rostui":"rostui","a rostui 4th conjugation":"rostui","a rota":"rota","a rota 1st conjugation":"rota","a rotaciza":"rotaciza","a rotaciza 1st conjugation":"rotaciza","a roti":"roti","a roti 4th conjugation":"roti","a rotocoli":"rotocoli","a rotocoli 4th conjugation":"rotocoli","a rotunji":"rotunji","a rotunji 4th conjugation":"rotunji","a rotunzi":"rotunzi","a rotunzi 4th conjugation":"rotunzi","a roua":"roua","a roua 1st conjugation":"roua","a roura":"roura","a roura 1st conjugation":"roura","a rudi":"rudi","a rudi 4th conjugation":"rudi","a ruga":"ruga","a ruga 1st conjugation":"ruga","a rugi":"rugi","a rugi 4th conjugation":"rugi","a rugini":"rugini","a rugini 4th conjugation":"rugini","a ruina":"ruina","a ruina 1st conjugation":"ruina","a ruja":"ruja","a ruja 1st conjugation":"ruja","a rula":"rula","a rula 1st conjugation":"rula","a rumega":"rumega","a rumega 1st conjugation":"rumega","a rumeni":"rumeni","a rumeni 4th conjugation":"rumeni","a rumpe":"rumpe","a rumpe 3rd conjugation":"rumpe","a rupe":"rupe","a rupe 3rd conjugation":"rupe","a rupe in bataie 3rd conjugation":"rupe în bătaie","a ruraliza":"ruraliza","a ruraliza 1st conjugation":"ruraliza","a rusifica":"rusifica","a rusifica 1st conjugation":"rusifica","a rusina":"rușina","a rusina 1st conjugation":"rușina","a rusticiza":"rusticiza","a rusticiza 1st conjugation":"rusticiza","a rutina":"rutina","a rutina 1st conjugation":"rutina","a se zdrentui 4th conjugation":"zdrențui","a tabaci":"tăbăci","a tabaci 4th conjugation":"tăbăci","a tabarci":"tăbârci","a tabarci 4th conjugation":"tăbârci","a tabari":"tăbărî","a tabari 4th conjugation":"tăbărî","a tabela":"tabela","a tabela 1st conjugation":"tabela","a tablui":"tăblui","a tablui 4th conjugation":"tăblui","a tacai":["a tâcâi","tâcâi","a tăcăi","tăcăi"],"a tacai 4th conjugation":["a tâcâi 4th conjugation","tâcâi","a tăcăi 4th conjugation","tăcăi"],"a tacani":"țăcăni","a tacani 4th conjugation":"țăcăni","a tacea":"tăcea","a tacea 2nd conjugation":"tăcea","a tachina":"tachina","a tachina 1st conjugation":"tachina","a taciuna":"tăciuna","a taciuna 1st conjugation":"tăciuna","a tacta":"tacta","a tacta 1st conjugation":"tacta","a tafni":"țâfni","a tafni 4th conjugation":"țâfni","a tagadui":"tăgădui","a tagadui 4th conjugation":"tăgădui","a taia":"tăia","a taia 1st conjugation":"tăia","a taia frunza la caini 1st conjugation":"tăia frunză la câini","a taia si spanzura 1st conjugation":"tăia și spânzura","a taifasui":"tăifăsui","a taifasui 4th conjugation":"tăifăsui","a tainui":"tăinui","a tainui 4th conjugation":"tăinui","a talalai":"tălălăi","a talalai 4th conjugation":"tălălăi","a talasmani":"tălășmăni","a talasmani 4th conjugation":"tălășmăni","a talcui":"tâlcui","a talcui 4th conjugation":"tâlcui","a talhari":"tâlhări","a talhari 4th conjugation":"tâlhări","a talhui":"tâlhui","a talhui 4th conjugation":"tâlhui","a talmaci":"tălmăci","a talmaci 4th conjugation":"tălmăci","a tamadui":"tămădui","a tamadui 4th conjugation":"tămădui","a tamaia":"tămâia","a tamaia 1st conjugation":"tămâia","a tamburina":"tamburina","a tamburina 1st conjugation":"tamburina","a tampi":"tâmpi","a tampi 4th conjugation":"tâmpi","a tampina":"tâmpina","a tampina 1st conjugation":"tâmpina","a tampla":"tâmpla","a tampla 1st conjugation":"tâmpla","a tampona":"tampona","a tampona 1st conjugation":"tampona","a tandali":"tândăli","a tandali 4th conjugation":"tândăli","a tandari":"țăndări","a tandari 4th conjugation":"țăndări","a tanga":"tanga","a tanga 1st conjugation":"tanga","a tangui":"tângui","a tangui 4th conjugation":"tângui","a taniza":"taniza","a taniza 1st conjugation":"taniza","a tanji":"tânji","a tanji 4th conjugation":"tânji","a tapa":["a tapa","tapa","a țâpa","țâpa"],"a tapa 1st conjugation":["a tapa 1st conjugation","tapa","a țâpa 1st conjugation","țâpa"],"a tapeta":"tapeta","a tapeta 1st conjugation":"tapeta","a tapisa":"tapisa","a tapisa 1st conjugation":"tapisa","a tapita":"tapița","a tapita 1st conjugation":"tapița","a tapota":"tapota","a tapota 1st conjugation":"tapota","a tapuri":"țâpuri","a tapuri 4th conjugation":"țâpuri","a taragai":"tărăgăi","a taragai 4th conjugation":"tărăgăi","a taragaia":"tărăgăia","a taragaia 1st conjugation":"tărăgăia","a taragana":"tărăgăna","a taragana 1st conjugation":"tărăgăna","a taragani":"tărăgăni","a taragani 4th conjugation":"tărăgăni","a tarai":["a târâi","târâi","a țârâi","țârâi"],"a tarai 4th conjugation":["a târâi 4th conjugation","târâi","a țârâi 4th conjugation","țârâi"],"a tarbaci":"tărbăci","a tarbaci 4th conjugation":"tărbăci","a tarcai":"țârcâi","a tarcai 4th conjugation":"țârcâi","a tarcoli":"târcoli","a tarcoli 4th conjugation":"târcoli","a tarcui":"țărcui","a tarcui 4th conjugation":"țărcui","a targui":"târgui","a targui 4th conjugation":"târgui","a tari":"târî","a tari 4th conjugation":"târî","a tarifa":"tarifa","a tarifa 1st conjugation":"tarifa","a tarlai":"țârlăi","a tarlai 4th conjugation":"țârlăi","a tarlaliza":"tarlaliza","a tarlaliza 1st conjugation":"tarlaliza","a tarnosi":"târnosi","a tarnosi 4th conjugation":"târnosi","a tarnui":"târnui","a tarnui 4th conjugation":"târnui","a tarsai":"târșâi","a tarsai 4th conjugation":"târșâi","a tarsi":"târși","a tarsi 4th conjugation":"târși","a tarsii":"târșii","a tarsii 4th conjugation":"târșii","a tasa":"tasa","a tasa 1st conjugation":"tasa","a tasni":"țâșni","a tasni 4th conjugation":"țâșni","a tasta":"tasta","a tasta 1st conjugation":"tasta","a tatari":"tătărî","a tatari 4th conjugation":"tătărî","a tatona":"tatona","a tatona 1st conjugation":"tatona","a tatua":"tatua","a tatua 1st conjugation":"tatua","a tavali":"tăvăli","a tavali 4th conjugation":"tăvăli","a taxa":"taxa"};
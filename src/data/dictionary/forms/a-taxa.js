@@ -0,0 +1 @@
+export default {"a taxa 1st conjugation":"taxa","a teatraliza":"teatraliza","a teatraliza 1st conjugation":"teatraliza","a tecsui":"tecsui","a tecsui 4th conjugation":"tecsui","a tehniciza":"tehniciza","a tehniciza 1st conjugation":"tehniciza","a tehnologiza":"tehnologiza","a tehnologiza 1st conjugation":"tehnologiza","a tehnoredacta":"tehnoredacta","a tehnoredacta 1st conjugation":"tehnoredacta","a tehui":"tehui","a tehui 4th conjugation":"tehui","a telecomanda":"telecomanda","a telecomanda 1st conjugation":"telecomanda","a teledifuza":"teledifuza","a teledifuza 1st conjugation":"teledifuza","a teledirija":"teledirija","a teledirija 1st conjugation":"teledirija","a telefona":"telefona","a telefona 1st conjugation":"telefona","a telefotografia":"telefotografia","a telefotografia 1st conjugation":"telefotografia","a teleghida":"teleghida","a teleghida 1st conjugation":"teleghida","a telegrafia":"telegrafia","a telegrafia 1st conjugation":"telegrafia","a teleimprima":"teleimprima","a teleimprima 1st conjugation":"teleimprima","a televiza":"televiza","a televiza 1st conjugation":"televiza","a tembeliza":"tembeliza","a tembeliza 1st conjugation":"tembeliza","a teme":"teme","a teme 3rd conjugation":"teme","a temeni":"temeni","a temeni 4th conjugation":"temeni","a temnita":"temnița","a temnita 1st conjugation":"temnița","a tempera":"tempera","a tempera 1st conjugation":"tempera","a temporiza":"temporiza","a temporiza 1st conjugation":"temporiza","a tencui":"tencui","a tencui 4th conjugation":"tencui","a tensiona":"tensiona","a tensiona 1st conjugation":"tensiona","a tenta":"tenta","a tenta 1st conjugation":"tenta","a teologiza":"teologiza","a teologiza 1st conjugation":"teologiza","a teoretiza":"teoretiza","a teoretiza 1st conjugation":"teoretiza","a teoriza":"teoriza","a teoriza 1st conjugation":"teoriza","a terasa":"terasa","a terasa 1st conjugation":"terasa","a terciui":"terciui","a terciui 4th conjugation":"terciui","a terfeli":"terfeli","a terfeli 4th conjugation":"terfeli","a tergiversa":"tergiversa","a tergiversa 1st conjugation":"tergiversa","a terifia":"terifia","a terifia 1st conjugation":"terifia","a termina":"termina","a termina 1st conjugation":"termina","a termina in coada de peste 1st conjugation":"termina în coadă de pește","a termoizola":"termoizola","a termoizola 1st conjugation":"termoizola","a termoregla":"termoregla","a termoregla 1st conjugation":"termoregla","a teroriza":"teroriza","a teroriza 1st conjugation":"teroriza","a tesala":"țesăla","a tesala 1st conjugation":"țesăla","a tescui":"tescui","a tescui 4th conjugation":"tescui","a tese":"țese","a tese 3rd conjugation":"țese","a tesi":"teși","a tesi 4th conjugation":"teși","a testa":"testa","a testa 1st conjugation":"testa","a tetaniza":"tetaniza","a tetaniza 1st conjugation":"tetaniza","a textura":"textura","a textura 1st conjugation":"textura","a tezauriza":"tezauriza","a tezauriza 1st conjugation":"tezauriza","a ticai":"ticăi","a ticai 4th conjugation":"ticăi","a ticalosi":"ticăloși","a ticalosi 4th conjugation":"ticăloși","a ticlui":"ticlui","a ticlui 4th conjugation":"ticlui","a ticni":["a ticni","ticni","a țicni","țicni"],"a ticni 4th conjugation":["a ticni 4th conjugation","ticni","a țicni 4th conjugation","țicni"],"a ticsi":"ticsi","a ticsi 4th conjugation":"ticsi","a tigani":"țigăni","a tigani 4th conjugation":"țigăni","a tigheli":"tigheli","a tigheli 4th conjugation":"tigheli","a tigni":"tigni","a tigni 4th conjugation":"tigni","a tihni":"tihni","a tihni 4th conjugation":"tihni","a timbra":"timbra","a timbra 1st conjugation":"timbra","a timora":"timora","a timora 1st conjugation":"timora","a tinali":"tinăli","a tinali 4th conjugation":"tinăli","a tinctura":"tinctura","a tinctura 1st conjugation":"tinctura","a tinde":"tinde","a tinde 3rd conjugation":"tinde","a tine":"ține","a tine 3rd conjugation":"ține","a tine minte 3rd conjugation":"ține minte","a tine pasul 3rd conjugation":"ține pasul","a tinea":"ținea","a tinea 2nd conjugation":"ținea","a tinti":"ținti","a tinti 4th conjugation":"ținti","a tintui":"țintui","a tintui 4th conjugation":"țintui","a tipa":"țipa","a tipa 1st conjugation":"țipa","a tipari":"tipări","a tipari 4th conjugation":"tipări","a tiparui":"tipărui","a tiparui 4th conjugation":"tipărui","a tipiza":"tipiza","a tipiza 1st conjugation":"tipiza","a tipoti":"țipoti","a tipoti 4th conjugation":"țipoti","a tiranisi":"tiranisi","a tiranisi 4th conjugation":"tiranisi","a tiraniza":"tiraniza","a tiraniza 1st conjugation":"tiraniza","a tisni":"țișni","a tisni 4th conjugation":"țișni","a titiri":"titiri","a titiri 4th conjugation":"titiri","a titirisi":"titirisi","a titirisi 4th conjugation":"titirisi","a titra":"titra","a titra 1st conjugation":"titra","a titulariza":"titulariza","a titulariza 1st conjugation":"titulariza","a tiui":"țiui","a tiui 4th conjugation":"țiui","a tivi":"tivi","a tivi 4th conjugation":"tivi","a toaleta":"toaleta","a toaleta 1st conjugation":"toaleta","a toarce":"toarce","a toarce 3rd conjugation":"toarce","a toasta":"toasta","a toasta 1st conjugation":"toasta","a toca":"toca","a toca 1st conjugation":"toca","a tocai":"țocăi","a tocai 4th conjugation":"țocăi","a tocani":"tocăni","a tocani 4th conjugation":"tocăni","a toci":"toci","a toci 4th conjugation":"toci","a tocmi":"tocmi","a tocmi 4th conjugation":"tocmi","a tojera":"tojera","a tojera 1st conjugation":"tojera","a tolani":"tolăni","a tolani 4th conjugation":"tolăni","a tolera":"tolera","a tolera 1st conjugation":"tolera","a tomna":"tomna","a tomna 1st conjugation":"tomna","a tonifica":"tonifica","a tonifica 1st conjugation":"tonifica","a topai":"țopăi","a topai 4th conjugation":"țopăi","a topi":"topi","a topi 4th conjugation":"topi","a topseca":"topseca","a topseca 1st conjugation":"topseca","a torai":"torăi","a torai 4th conjugation":"torăi","a toropi":"toropi","a toropi 4th conjugation":"toropi","a torpila":"torpila","a torpila 1st conjugation":"torpila","a torsiona":"torsiona","a torsiona 1st conjugation":"torsiona","a tortura":"tortura","a tortura 1st conjugation":"tortura","a totaliza":"totaliza","a totaliza 1st conjugation":"totaliza","a tracasa":"tracasa","a tracasa 1st conjugation":"tracasa","a tracta":"tracta","a tracta 1st conjugation":"tracta","a trada":"trăda","a trada 1st conjugation":"trăda","a traduce":"traduce","a traduce 3rd conjugation":"traduce","a trafica":"trafica","a trafica 1st conjugation":"trafica","a tragana":"trăgăna","a tragana 1st conjugation":"trăgăna","a trage":"trage","a trage 3rd conjugation":"trage","a trage apa [conj]":"trage apa","a trage cu ochiul 3rd conjugation":"trage cu ochiul","a trage cu urechea 3rd conjugation":"trage cu urechea","a trage de limba 3rd conjugation":"trage de limbă","a trage la cantar 3rd conjugation":"trage la cântar","a trage la masea 3rd conjugation":"trage la măsea","a trage la raspundere 3rd conjugation":"trage la răspundere","a trage mata de coada 3rd conjugation":"trage mâța de coadă","a trage nadejde 3rd conjugation":"trage nădejde","a trage pe dreapta 3rd conjugation":"trage pe dreapta","a trage pe nas 3rd conjugation":"trage pe nas","a trage pe roata 3rd conjugation":"trage pe roată","a trage pe sfoara 3rd conjugation":"trage pe sfoară","a trage sforile 3rd conjugation":"trage sforile","a trage targa pe uscat 3rd conjugation":"trage targa pe uscat","a trai":"trăi","a trai 4th conjugation":"trăi","a trambita":"trâmbița","a trambita 1st conjugation":"trâmbița","a trancani":"trăncăni","a trancani 4th conjugation":"trăncăni","a tranchiliza":"tranchiliza","a tranchiliza 1st conjugation":"tranchiliza","a trandavi":"trândăvi","a trandavi 4th conjugation":"trândăvi","a transa":"tranșa","a transa 1st conjugation":"tranșa","a transborda":"transborda","a transborda 1st conjugation":"transborda","a transcende":"transcende","a transcende 3rd conjugation":"transcende","a transcendentaliza":"transcendentaliza","a transcendentaliza 1st conjugation":"transcendentaliza","a transcrie":"transcrie","a transcrie 3rd conjugation":"transcrie","a transfera":"transfera","a transfera 1st conjugation":"transfera","a transfigura":"transfigura","a transfigura 1st conjugation":"transfigura","a transforma":"transforma","a transforma 1st conjugation":"transforma","a transfuza":"transfuza","a transfuza 1st conjugation":"transfuza","a transgresa":"transgresa","a transgresa 1st conjugation":"transgresa","a transhuma":"transhuma","a transhuma 1st conjugation":"transhuma","a transige":"transige","a transige 3rd conjugation":"transige","a transla":"transla","a transla 1st conjugation":"transla","a translata":"translata","a translata 1st conjugation":"translata","a translitera":"translitera","a translitera 1st conjugation":"translitera","a transloca":"transloca","a transloca 1st conjugation":"transloca","a transmigra":"transmigra","a transmigra 1st conjugation":"transmigra","a transmite":"transmite","a transmite 3rd conjugation":"transmite","a transmuta":"transmuta","a transmuta 1st conjugation":"transmuta","a transparea":"transpărea","a transparea 2nd conjugation":"transpărea","a transpira":"transpira","a transpira 1st conjugation":"transpira","a transplanta":"transplanta","a transplanta 1st conjugation":"transplanta","a transporta":"transporta","a transporta 1st conjugation":"transporta","a transportui":"transportui","a transportui 4th conjugation":"transportui","a transpune":"transpune","a transpune 3rd conjugation":"transpune","a transsubstantia":"transsubstanția","a transsubstantia 1st conjugation":"transsubstanția","a transvaza":"transvaza","a transvaza 1st conjugation":"transvaza","a tranti":"trânti","a tranti 4th conjugation":"trânti","a trantori":"trântori","a trantori 4th conjugation":"trântori","a tranzactiona":"tranzacționa","a tranzactiona 1st conjugation":"tranzacționa","a tranzistoriza":"tranzistoriza","a tranzistoriza 1st conjugation":"tranzistoriza","a tranzita":"tranzita","a tranzita 1st conjugation":"tranzita","a trasa":"trasa","a trasa 1st conjugation":"trasa","a trasni":"trăsni","a trasni 4th conjugation":"trăsni","a trata":"trata","a trata 1st conjugation":"trata","a traula":"traula","a traula 1st conjugation":"traula","a traumatiza":"traumatiza","a traumatiza 1st conjugation":"traumatiza","a traversa":"traversa","a traversa 1st conjugation":"traversa","a travesti":"travesti","a travesti 4th conjugation":"travesti","a trebalui":"trebălui","a trebalui 4th conjugation":"trebălui","a trebui":"trebui","a trebui 4th conjugation":"trebui","a trece":"trece","a trece 3rd conjugation":"trece","a trece baba cu colacii 3rd conjugation":"trece baba cu colacii","a trece ca gasca prin apa 3rd conjugation":"trece ca gâsca prin apă","a trece cu vederea 3rd conjugation":"trece cu vederea","a treia":["a treia","treia","a treia","treilea"],"a treiera":"treiera","a treiera 1st conjugation":"treiera","a treispea":["a treișpea","treișpea","a treișpea","treișpelea"],"a treisprezecea":["a treisprezecea","treisprezecea","a treisprezecea","treisprezecelea"],"a treizecea":["a treizecea","treizecea","a treizecea","treizecilea"],"a treizeci si cincea":["a treizeci și cincea","treizeci și cincea","a treizeci și cincea","treizeci și cincilea"],"a treizeci si doua":["a treizeci și doua","treizeci și doilea","a treizeci și doua","treizeci și doua"],"a treizeci si noua":["a treizeci și noua","treizeci și noua","a treizeci și noua","treizeci și nouălea"],"a treizeci si opta":["a treizeci și opta","treizeci și opta","a treizeci și opta","treizeci și optulea"],"a treizeci si patra":["a treizeci și patra","treizeci și patra","a treizeci și patra","treizeci și patrulea"],"a treizeci si saptea":["a treizeci și șaptea","treizeci și șaptea","a treizeci și șaptea","treizeci și șaptelea"],"a treizeci si sasea":["a treizeci și șasea","treizeci și șasea","a treizeci și șasea","treizeci și șaselea"],"a treizeci si treia":["a treizeci și treia","treizeci și treia","a treizeci și treia","treizeci și treilea"],"a treizeci si una":["a treizeci și una","treizeci și una","a treizeci și una","treizeci și unulea"],"a tremura":"tremura","a tremura 1st conjugation":"tremura","a trena":"trena","a trena 1st conjugation":"trena","a trentui":"trențui","a trentui 4th conjugation":"trențui","a trepada":"trepăda","a trepada 1st conjugation":"trepăda","a trepana":"trepana","a trepana 1st conjugation":"trepana","a trepida":"trepida","a trepida 1st conjugation":"trepida","a tresalta":"tresălta","a tresalta 1st conjugation":"tresălta","a tresari":"tresări","a tresari 4th conjugation":"tresări","a trezi":"trezi","a trezi 4th conjugation":"trezi","a tria":"tria","a tria 1st conjugation":"tria","a triangula":"triangula","a triangula 1st conjugation":"triangula","a tricota":"tricota","a tricota 1st conjugation":"tricota","a triera":"triera","a triera 1st conjugation":"triera","a trifurca":"trifurca","a trifurca 1st conjugation":"trifurca","a trilui":"trilui","a trilui 4th conjugation":"trilui","a trimete":"trimete","a trimete 3rd conjugation":"trimete","a trimite":"trimite","a trimite 3rd conjugation":"trimite","a tripla":"tripla","a tripla 1st conjugation":"tripla","a tripota":"tripota","a tripota 1st conjugation":"tripota","a trisa":"trișa","a trisa 1st conjugation":"trișa","a tritura":"tritura","a tritura 1st conjugation":"tritura","a triumfa":"triumfa","a triumfa 1st conjugation":"triumfa","a trivializa":"trivializa","a trivializa 1st conjugation":"trivializa","a troieni":"troieni","a troieni 4th conjugation":"troieni","a tromboni":"tromboni","a tromboni 4th conjugation":"tromboni","a trona":"trona","a trona 1st conjugation":"trona","a troncani":"troncăni","a troncani 4th conjugation":"troncăni","a tropai":"tropăi","a tropai 4th conjugation":"tropăi","a tropicaliza":"tropicaliza","a tropicaliza 1st conjugation":"tropicaliza","a tropota":"tropota","a tropota 1st conjugation":"tropota","a tropoti":"tropoti","a tropoti 4th conjugation":"tropoti","a trosni":"trosni","a trosni 4th conjugation":"trosni","a trota":"trota","a trota 1st conjugation":"trota","a trotina":"trotina","a trotina 1st conjugation":"trotina","a truca":"truca","a truca 1st conjugation":"truca","a trudi":"trudi","a trudi 4th conjugation":"trudi","a trunchia":"trunchia","a trunchia 1st conjugation":"trunchia","a tuberculiza":"tuberculiza","a tuberculiza 1st conjugation":"tuberculiza","a tuca":"țuca","a tuca 1st conjugation":"țuca","a tudumani":"tudumăni","a tudumani 4th conjugation":"tudumăni","a tufli":"tufli","a tufli 4th conjugation":"tufli","a tuicari":"țuicări","a tuicari 4th conjugation":"țuicări","a tuicui":"țuicui","a tuicui 4th conjugation":"țuicui","a tulbura":"tulbura","a tulbura 1st conjugation":"tulbura","a tuli":"tuli","a tuli 4th conjugation":"tuli","a tumani":"tumăni","a tumani 4th conjugation":"tumăni","a tumefia":"tumefia","a tumefia 1st conjugation":"tumefia","a tuna":"tuna","a tuna 1st conjugation":"tuna","a tunde":"tunde","a tunde 3rd conjugation":"tunde","a tupai":"țupăi","a tupai 4th conjugation":"țupăi","a tupila":"tupila","a tupila 1st conjugation":"tupila","a turba":"turba","a turba 1st conjugation":"turba","a turbura":"turbura","a turbura 1st conjugation":"turbura","a turci":"turci","a turci 4th conjugation":"turci","a turlaci":"turlăci","a turlaci 4th conjugation":"turlăci","a turmenta":"turmenta","a turmenta 1st conjugation":"turmenta","a turna":"turna","a turna 1st conjugation":"turna","a turna ulei pe foc 1st conjugation":"turna ulei pe foc","a turti":"turti","a turti 4th conjugation":"turti","a turui":"turui","a turui 4th conjugation":"turui","a tusa":"tușa","a tusa 1st conjugation":"tușa","a tusi":"tuși","a tusi 4th conjugation":"tuși","a tusina":"tușina","a tusina 1st conjugation":"tușina","a tutela":"tutela","a tutela 1st conjugation":"tutela","a tutora":"tutora","a tutora 1st conjugation":"tutora","a tutui":"tutui","a tutui 4th conjugation":"tutui","a tutuia":"țuțuia","a tutuia 1st conjugation":"țuțuia","a ucenici":"ucenici","a ucenici 4th conjugation":"ucenici","a ucide":"ucide","a ucide 3rd conjugation":"ucide","a uda":"uda","a uda 1st conjugation":"uda","a ui":"ui","a ui 4th conjugation":"ui","a uimi":"uimi","a uimi 4th conjugation":"uimi","a uita":"uita","a uita 1st conjugation":"uita","a ulcera":"ulcera","a ulcera 1st conjugation":"ulcera","a uleia":"uleia","a uleia 1st conjugation":"uleia","a ultragia":"ultragia","a ultragia 1st conjugation":"ultragia","a ului":"ului","a ului 4th conjugation":"ului","a umaniza":"umaniza","a umaniza 1st conjugation":"umaniza","a umbla":"umbla","a umbla 1st conjugation":"umbla","a umbla cu cioara vopsita 1st conjugation":"umbla cu cioara vopsită","a umbla teleleu 1st conjugation":"umbla teleleu","a umbri":"umbri","a umbri 4th conjugation":"umbri","a umecta":"umecta","a umecta 1st conjugation":"umecta","a umezi":"umezi","a umezi 4th conjugation":"umezi","a umfla":"umfla","a umfla 1st conjugation":"umfla","a umidifica":"umidifica","a umidifica 1st conjugation":"umidifica","a umila":"umila","a umila 1st conjugation":"umila","a umili":"umili","a umili 4th conjugation":"umili","a umple":"umple","a umple 3rd conjugation":"umple","a unda":"unda","a unda 1st conjugation":"unda","a undeza 1st conjugation":"undeza","a undi":"undi","a undi 4th conjugation":"undi","a undoi":"undoi","a undoi 4th conjugation":"undoi","a undoia":"undoia","a undoia 1st conjugation":"undoia","a undui":"undui","a undui 4th conjugation":"undui","a undula":"undula","a undula 1st conjugation":"undula","a unelti":"unelti","a unelti 4th conjugation":"unelti","a unge":"unge","a unge 3rd conjugation":"unge","a uni":"uni","a uni 4th conjugation":"uni","a uniciza":"uniciza","a uniciza 1st conjugation":"uniciza","a unidimensiona":"unidimensiona","a unidimensiona 1st conjugation":"unidimensiona","a unifica":"unifica","a unifica 1st conjugation":"unifica","a uniformiza":"uniformiza","a uniformiza 1st conjugation":"uniformiza","a universaliza":"universaliza","a universaliza 1st conjugation":"universaliza","a unspea":["a unșpea","unșpea","a unșpea","unșpelea"],"a unsprezecea":["a unsprezecea","unsprezecea","a unsprezecea","unsprezecelea"],"a upercuta":"upercuta","a upercuta 1st conjugation":"upercuta","a upovai":"upovăi","a upovai 4th conjugation":"upovăi","a ura":"ura","a ura 1st conjugation":"ura","a urati":"urâți","a urati 4th conjugation":"urâți","a urbaniza":"urbaniza","a urbaniza 1st conjugation":"urbaniza","a urca":"urca","a urca 1st conjugation":"urca","a urdi":"urdi","a urdi 4th conjugation":"urdi","a urdina":"urdina","a urdina 1st conjugation":"urdina","a urduca":"urduca","a urduca 1st conjugation":"urduca","a urechea":"urechea","a urechea 1st conjugation":"urechea","a urgenta":"urgenta","a urgenta 1st conjugation":"urgenta","a urgisi":"urgisi","a urgisi 4th conjugation":"urgisi","a uri":"urî","a uri 4th conjugation":"urî","a urina":"urina","a urina 1st conjugation":"urina","a urla":"urla","a urla 1st conjugation":"urla","a urlui":"urlui","a urlui 4th conjugation":"urlui","a urma":"urma","a urma 1st conjugation":"urma","a urmari":"urmări","a urmari 4th conjugation":"urmări","a urmui":"urmui","a urmui 4th conjugation":"urmui","a urni":"urni","a urni 4th conjugation":"urni","a ursi":"ursi","a ursi 4th conjugation":"ursi","a urui":"urui","a urui 4th conjugation":"urui","a urzi":"urzi","a urzi 4th conjugation":"urzi","a urzica":"urzica","a urzica 1st conjugation":"urzica","a usca":"usca","a usca 1st conjugation":"usca","a uschi":"ușchi","a uschi 4th conjugation":"ușchi","a ustura":"ustura","a ustura 1st conjugation":"ustura","a usturoia":"usturoia","a usturoia 1st conjugation":"usturoia","a usui":"ușui","a usui 4th conjugation":"ușui","a usura":"ușura","a usura 1st conjugation":"ușura","a utila":"utila","a utila 1st conjugation":"utila","a utiliza":"utiliza","a utiliza 1st conjugation":"utiliza","a uza":"uza","a uza 1st conjugation":"uza","a uzina":"uzina","a uzina 1st conjugation":"uzina","a uzita":"uzita","a uzita 1st conjugation":"uzita","a uzurpa":"uzurpa","a uzurpa 1st conjugation":"uzurpa","a vaccina":"vaccina","a vaccina 1st conjugation":"vaccina","a vacsui":"văcsui","a vacsui 4th conjugation":"văcsui","a vacui":"văcui","a vacui 4th conjugation":"văcui","a vadi":"vădi","a vadi 4th conjugation":"vădi","a vaduvi":"văduvi","a vaduvi 4th conjugation":"văduvi","a vagabonda":"vagabonda","a vagabonda 1st conjugation":"vagabonda","a vaicara":"văicăra","a vaicara 1st conjugation":"văicăra","a vaicari":"văicări","a vaicari 4th conjugation":"văicări","a vaieta":"văieta","a vaieta 1st conjugation":"văieta","a vaita":"văita","a vaita 1st conjugation":"văita","a vajai":"vâjâi","a vajai 4th conjugation":"vâjâi","a vaji":["a vâji","vâji","a văji","văji"],"a vaji 4th conjugation":["a vâji 4th conjugation","vâji","a văji 4th conjugation","văji"],"a vajii":"vâjii","a vajii 4th conjugation":"vâjii","a valida":"valida","a valida 1st conjugation":"valida","a valora":"valora","a valora 1st conjugation":"valora","a valorifica":"valorifica","a valorifica 1st conjugation":"valorifica","a valoriza":"valoriza","a valoriza 1st conjugation":"valoriza","a valsa":"valsa","a valsa 1st conjugation":"valsa","a valtui":"vălțui","a valtui 4th conjugation":"vălțui","a vampiriza":"vampiriza","a vampiriza 1st conjugation":"vampiriza","a vamui":"vămui","a vamui 4th conjugation":"vămui","a vana":"vâna","a vana 1st conjugation":"vâna","a vandaliza":"vandaliza","a vandaliza 1st conjugation":"vandaliza","a vansli":"vânsli","a vansli 4th conjugation":"vânsli","a vantui":"vântui","a vantui 4th conjugation":"vântui","a vantura":"vântura","a vantura 1st conjugation":"vântura","a vanzoli":"vânzoli","a vanzoli 4th conjugation":"vânzoli","a vapa":"vapa","a vapa 1st conjugation":"vapa","a vapaia":"văpăia","a vapaia 1st conjugation":"văpăia","a vaporiza":"vaporiza","a vaporiza 1st conjugation":"vaporiza","a vapsi":"văpsi","a vapsi 4th conjugation":"văpsi","a vara":"văra","a vara 1st conjugation":"văra","a varfui":"vârfui","a varfui 4th conjugation":"vârfui","a varga":"vărga","a varga 1st conjugation":"vărga","a vari":"vârî","a vari 4th conjugation":"vârî","a varia":"varia","a varia 1st conjugation":"varia","a varsa":"vărsa","a varsa 1st conjugation":"vărsa","a varsa sange 1st conjugation":"vărsa sânge","a varteji":"vârteji","a varteji 4th conjugation":"vârteji","a vartejui":"vârtejui","a vartejui 4th conjugation":"vârtejui","a varui":"vărui","a varui 4th conjugation":"vărui","a varzui":"vărzui","a varzui 4th conjugation":"vărzui","a vasari":"văsări","a vasari 4th conjugation":"văsări","a vasculariza":"vasculariza","a vasculariza 1st conjugation":"vasculariza","a vasla":"vâsla","a vasla 1st conjugation":"vâsla","a vasli":"vâsli","a vasli 4th conjugation":"vâsli","a vataji":"vătăji","a vataji 4th conjugation":"vătăji","a vatama":"vătăma","a vatama 1st conjugation":"vătăma","a vatui":"vătui","a vatui 4th conjugation":"vătui","a vecinui":"vecinui","a vecinui 4th conjugation":"vecinui","a vecui":"vecui","a vecui 4th conjugation":"vecui","a vedea":"vedea","a vedea 2nd conjugation":"vedea","a vedea lumina zilei 2nd conjugation":"vedea lumina zilei","a vedea negru inaintea ochilor 3rd conjugation":"vedea negru înaintea ochilor","a vedea rosu inaintea ochilor 2nd conjugation":"vedea roșu înaintea ochilor","a vedea stele verzi 2nd conjugation":"vedea stele verzi","a vegeta":"vegeta","a vegeta 1st conjugation":"vegeta","a veghea":"veghea","a veghea 1st conjugation":"veghea","a vehicula":"vehicula","a vehicula 1st conjugation":"vehicula","a velariza":"velariza","a velariza 1st conjugation":"velariza","a venera":"venera","a venera 1st conjugation":"venera","a veni":"veni","a veni 4th conjugation":"veni","a veni de hac 4th conjugation":"veni de hac","a veni pe nepusa masa 4th conjugation":"veni pe nepusă masă","a venina":"venina","a venina 1st conjugation":"venina","a ventila":"ventila","a ventila 1st conjugation":"ventila","a verbaliza":"verbaliza","a verbaliza 1st conjugation":"verbaliza","a verifica":"verifica","a verifica 1st conjugation":"verifica","a vermutiza":"vermutiza","a vermutiza 1st conjugation":"vermutiza","a vernaliza":"vernaliza","a vernaliza 1st conjugation":"vernaliza","a vernisa":"vernisa","a vernisa 1st conjugation":"vernisa","a versifica":"versifica","a versifica 1st conjugation":"versifica","a versui":"versui","a versui 4th conjugation":"versui","a veseli":"veseli","a veseli 4th conjugation":"veseli","a vesnici":"veșnici","a vesnici 4th conjugation":"veșnici","a vesteji":["a vesteji","vesteji","a veșteji","veșteji"],"a vesteji 4th conjugation":["a vesteji 4th conjugation","vesteji","a veșteji 4th conjugation","veșteji"],"a vestezi":["a vestezi","vestezi","a veștezi","veștezi"],"a vestezi 4th conjugation":["a vestezi 4th conjugation","vestezi","a veștezi 4th conjugation","veștezi"],"a vesti":["a vesti","vesti","a vești","vești"],"a vesti 4th conjugation":["a vesti 4th conjugation","vesti","a vești 4th conjugation","vești"],"a vestui":"vestui","a vestui 4th conjugation":"vestui","a vexa":"vexa","a vexa 1st conjugation":"vexa","a via":"via","a via 1st conjugation":"via","a vibra":"vibra","a vibra 1st conjugation":"vibra","a vicia":"vicia","a vicia 1st conjugation":"vicia","a vicleni":"vicleni","a vicleni 4th conjugation":"vicleni","a vicoli":"vicoli","a vicoli 4th conjugation":"vicoli","a victimiza":"victimiza","a victimiza 1st conjugation":"victimiza","a vida":"vida","a vida 1st conjugation":"vida","a vidanja":"vidanja","a vidanja 1st conjugation":"vidanja","a vie":"vie","a vie 3rd conjugation":"vie","a viermui":"viermui","a viermui 4th conjugation":"viermui","a viersui":"viersui","a viersui 4th conjugation":"viersui","a vietui":"viețui","a vietui 4th conjugation":"viețui","a vifori":"viforî","a vifori 4th conjugation":"viforî","a vilegiatura":"vilegiatura","a vilegiatura 1st conjugation":"vilegiatura","a vince":"vince","a vince 3rd conjugation":"vince","a vinde":"vinde","a vinde 3rd conjugation":"vinde","a vinde castraveti gradinarului 3rd conjugation":"vinde castraveți grădinarului","a vinde gogosi 3rd conjugation":"vinde gogoși","a vindeca":"vindeca","a vindeca 1st conjugation":"vindeca","a vinge":"vinge","a vinge 3rd conjugation":"vinge","a vinifica":"vinifica","a vinifica 1st conjugation":"vinifica","a vinovati":"vinovăți","a vinovati 4th conjugation":"vinovăți","a vinui":"vinui","a vinui 4th conjugation":"vinui","a viola":"viola","a viola 1st conjugation":"viola","a violenta":"violenta","a violenta 1st conjugation":"violenta","a vira":"vira","a vira 1st conjugation":"vira","a viriliza":"viriliza","a viriliza 1st conjugation":"viriliza","a virtualiza":"virtualiza","a virtualiza 1st conjugation":"virtualiza","a visa":"visa","a visa 1st conjugation":"visa","a viscoli":"viscoli","a viscoli 4th conjugation":"viscoli","a visti":"viști","a visti 4th conjugation":"viști","a vitaliza":"vitaliza","a vitaliza 1st conjugation":"vitaliza","a vitaminiza":"vitaminiza","a vitaminiza 1st conjugation":"vitaminiza","a viteji":"viteji","a viteji 4th conjugation":"viteji","a vitia":"viția","a vitia 1st conjugation":"viția","a vitrifica":"vitrifica","a vitrifica 1st conjugation":"vitrifica","a vitriola":"vitriola","a vitriola 1st conjugation":"vitriola","a vitrioliza":"vitrioliza","a vitrioliza 1st conjugation":"vitrioliza","a vitupera":"vitupera","a vitupera 1st conjugation":"vitupera","a vivifica":"vivifica","a vivifica 1st conjugation":"vivifica","a vivisectiona":"vivisecționa","a vivisectiona 1st conjugation":"vivisecționa","a viza":"viza","a viza 1st conjugation":"viza","a viziona":"viziona","a viziona 1st conjugation":"viziona","a vizita":"vizita","a vizita 1st conjugation":"vizita","a vizualiza":"vizualiza","a vizualiza 1st conjugation":"vizualiza","a vladui":"vlădui","a vladui 4th conjugation":"vlădui","a vlagui":"vlăgui","a vlagui 4th conjugation":"vlăgui","a voala":"voala","a voala 1st conjugation":"voala","a voame":"voame","a voame 3rd conjugation":"voame","a vocaliza":"vocaliza","a vocaliza 1st conjugation":"vocaliza","a vocifera":"vocifera","a vocifera 1st conjugation":"vocifera","a vodi":"vodi","a vodi 4th conjugation":"vodi","a voi":"voi","a voi 4th conjugation":"voi","a voiaja":"voiaja","a voiaja 1st conjugation":"voiaja","a volatiliza":"volatiliza","a volatiliza 1st conjugation":"volatiliza","a volnici":"volnici","a volnici 4th conjugation":"volnici","a voma":"voma","a voma 1st conjugation":"voma","a vomita":"vomita","a vomita 1st conjugation":"vomita","a vopsi":"vopsi","a vopsi 4th conjugation":"vopsi","a vorbi":"vorbi","a vorbi 4th conjugation":"vorbi","a vorbi de funie in casa spanzuratului 4th conjugation":"vorbi de funie în casa spânzuratului","a vorbi singur 4th conjugation":"vorbi singur","a vorovi":"vorovi","a vorovi 4th conjugation":"vorovi","a vota":"vota","a vota 1st conjugation":"vota","a vrafui":"vrăfui","a vrafui 4th conjugation":"vrăfui","a vraji":"vrăji","a vraji 4th conjugation":"vrăji","a vrajmasi":"vrăjmăși","a vrajmasi 4th conjugation":"vrăjmăși","a vravui":"vrăvui","a vravui 4th conjugation":"vrăvui","a vrea":"vrea","a vrea 2nd conjugation":"vrea","a vrednici":"vrednici","a vrednici 4th conjugation":"vrednici","a vroi":"vroi","a vroi 4th conjugation":"vroi","a vui":"vui","a vui 4th conjugation":"vui","a vuieta":"vuieta","a vuieta 1st conjugation":"vuieta","a vulcaniza":"vulcaniza","a vulcaniza 1st conjugation":"vulcaniza","a vulgariza":"vulgariza","a vulgariza 1st conjugation":"vulgariza","a vulnera":"vulnera","a vulnera 1st conjugation":"vulnera","a vuvui":"vuvui","a vuvui 4th conjugation":"vuvui","a xerocopia":"xerocopia","a xerocopia 1st conjugation":"xerocopia","a xerografia":"xerografia","a xerografia 1st conjugation":"xerografia","a xeroxa":"xeroxa","a xeroxa 1st conjugation":"xeroxa","a zabavi":"zăbăvi","a zabavi 4th conjugation":"zăbăvi","a zabovi":"zăbovi","a zabovi 4th conjugation":"zăbovi","a zacea":"zăcea","a zacea 2nd conjugation":"zăcea","a zacusi":"zacusi","a zacusi 4th conjugation":"zacusi","a zadari":["a zădări","zădări","a zădărî","zădărî"],"a zadari 4th conjugation":["a zădări 4th conjugation","zădări","a zădărî 4th conjugation","zădărî"],"a zadarnici":"zădărnici","a zadarnici 4th conjugation":"zădărnici","a zagazui":"zăgăzui","a zagazui 4th conjugation":"zăgăzui","a zaharifica":"zaharifica","a zaharifica 1st conjugation":"zaharifica","a zaharisi":"zaharisi","a zaharisi 4th conjugation":"zaharisi","a zahatui":"zăhătui","a zahatui 4th conjugation":"zăhătui","a zambi":"zâmbi","a zambi 4th conjugation":"zâmbi","a zamisli":"zămisli","a zamisli 4th conjugation":"zămisli","a zamislui":"zamislui","a zamislui 4th conjugation":"zamislui","a zangani":["a zângăni","zângăni","a zăngăni","zăngăni"],"a zangani 4th conjugation":["a zângăni 4th conjugation","zângăni","a zăngăni 4th conjugation","zăngăni"],"a zapa":"zapa","a zapa 1st conjugation":"zapa","a zapaci":"zăpăci","a zapaci 4th conjugation":"zăpăci","a zapcii":"zapcii","a zapcii 4th conjugation":"zapcii","a zapusi":"zăpuși","a zapusi 4th conjugation":"zăpuși","a zari":"zări","a zari 4th conjugation":"zări","a zatigni":"zătigni","a zatigni 4th conjugation":"zătigni","a zavergisi":"zavergisi","a zavergisi 4th conjugation":"zavergisi","a zavistii":"zavistii","a zavistii 4th conjugation":"zavistii","a zavori":["a zăvori","zăvori","a zăvorî","zăvorî"],"a zavori 4th conjugation":["a zăvori 4th conjugation","zăvori","a zăvorî 4th conjugation","zăvorî"],"a zbantui":"zbănțui","a zbantui 4th conjugation":"zbănțui","a zbarci":"zbârci","a zbarci 4th conjugation":"zbârci","a zbarli":"zbârli","a zbarli 4th conjugation":"zbârli","a zbarnai":"zbârnăi","a zbarnai 4th conjugation":["a zbârnâi 4th conjugation","zbârnâi","a zbârnăi 4th conjugation","zbârnăi"],"a zbate":"zbate","a zbate 3rd conjugation":"zbate","a zbea":"zbea","a zbea 2nd conjugation":"zbea","a zbengui":"zbengui","a zbengui 4th conjugation":"zbengui","a zbici":"zbici","a zbici 4th conjugation":"zbici","a zbiera":"zbiera","a zbiera 1st conjugation":"zbiera","a zbihui":"zbihui","a zbihui 4th conjugation":"zbihui","a zblendui":"zblendui","a zblendui 4th conjugation":"zblendui","a zbuciuma":"zbuciuma","a zbuciuma 1st conjugation":"zbuciuma","a zbucni":"zbucni","a zbucni 4th conjugation":"zbucni","a zbura":"zbura","a zbura 1st conjugation":"zbura","a zburatori":"zburători","a zburatori 4th conjugation":"zburători","a zburda":"zburda","a zburda 1st conjugation":"zburda","a zburli":"zburli","a zburli 4th conjugation":"zburli","a zdrancani":"zdrăncăni","a zdrancani 4th conjugation":"zdrăncăni","a zdrangani":["a zdrângăni","zdrângăni","a zdrăngăni","zdrăngăni"],"a zdrangani 4th conjugation":["a zdrângăni 4th conjugation","zdrângăni","a zdrăngăni 4th conjugation","zdrăngăni"],"a zdreli":"zdreli","a zdreli 4th conjugation":"zdreli","a zdrobi":"zdrobi","a zdrobi 4th conjugation":"zdrobi","a zdrumeca":"zdrumeca","a zdrumeca 1st conjugation":"zdrumeca","a zdrumica":"zdrumica","a zdrumica 1st conjugation":"zdrumica","a zdruncina":"zdruncina","a zdruncina 1st conjugation":"zdruncina","a zdrusi":"zdruși","a zdrusi 4th conjugation":"zdruși","a zdupai":"zdupăi","a zdupai 4th conjugation":"zdupăi","a zeberi":"zeberi","a zeberi 4th conjugation":"zeberi","a zecea":["a zecea","zecea","a zecea","zecelea"],"a zeciui":"zeciui","a zeciui 4th conjugation":"zeciui","a zeflemisi":"zeflemisi","a zeflemisi 4th conjugation":"zeflemisi","a zeifica":"zeifica","a zeifica 1st conjugation":"zeifica","a zemosi":"zemoși","a zemosi 4th conjugation":"zemoși","a zemui":"zemui","a zemui 4th conjugation":"zemui","a zetui":"zețui","a zetui 4th conjugation":"zețui","a zgai":"zgâi","a zgai 4th conjugation":"zgâi","a zgaltai":"zgâlțâi","a zgaltai 4th conjugation":"zgâlțâi","a zgancili":"zgâncili","a zgancili 4th conjugation":"zgâncili","a zgandari":"zgândări","a zgandari 4th conjugation":"zgândări","a zgarci":"zgârci","a zgarci 4th conjugation":"zgârci","a zgaria":"zgâria","a zgaria 1st conjugation":"zgâria","a zgaura":"zgăura","a zgaura 1st conjugation":"zgăura","a zgorni":"zgorni","a zgorni 4th conjugation":"zgorni","a zgrebuli":"zgrebuli","a zgrebuli 4th conjugation":"zgrebuli","a zgreptana":"zgrepțăna","a zgreptana 1st conjugation":"zgrepțăna","a zgribuli":"zgribuli","a zgribuli 4th conjugation":"zgribuli","a zgribura":"zgribura","a zgribura 1st conjugation":"zgribura","a zgriburi":"zgriburi","a zgriburi 4th conjugation":"zgriburi","a zgudui":"zgudui","a zgudui 4th conjugation":"zgudui","a zgurifica":"zgurifica","a zgurifica 1st conjugation":"zgurifica","a zice":"zice","a zice 3rd conjugation":"zice","a zidi":"zidi","a zidi 4th conjugation":"zidi","a zidui":"zidui","a zidui 4th conjugation":"zidui","a zigzaga":"zigzaga","a zigzaga 1st conjugation":"zigzaga","a zimbi":"zimbi","a zimbi 4th conjugation":"zimbi","a zimta":"zimța","a zimta 1st conjugation":"zimța","a zimtui":"zimțui","a zimtui 4th conjugation":"zimțui","a zinca":"zinca","a zinca 1st conjugation":"zinca","a zincografia":"zincografia","a zincografia 1st conjugation":"zincografia","a zincui":"zincui","a zincui 4th conjugation":"zincui","a zingani":"zingăni","a zingani 4th conjugation":"zingăni","a zingheni":"zingheni","a zingheni 4th conjugation":"zingheni","a zmaci":"zmâci","a zmaci 4th conjugation":"zmâci","a zmangali":"zmângăli","a zmangali 4th conjugation":"zmângăli","a zmeri":"zmeri","a zmeri 4th conjugation":"zmeri","a zminti":"zminti","a zminti 4th conjugation":"zminti","a zmuci":"zmuci","a zmuci 4th conjugation":"zmuci","a zobi":"zobi","a zobi 4th conjugation":"zobi","a zonifica":"zonifica","a zonifica 1st conjugation":"zonifica","a zopai":"zopăi","a zopai 4th conjugation":"zopăi","a zornai":"zornăi","a zornai 4th conjugation":"zornăi","a zorobi":"zorobi","a zorobi 4th conjugation":"zorobi","a zorzoi":"zorzoi","a zorzoi 4th conjugation":"zorzoi","a zugravi":"zugrăvi","a zugravi 4th conjugation":"zugrăvi","a zugruma":"zugruma","a zugruma 1st conjugation":"zugruma","a zulufa":"zulufa","a zulufa 1st conjugation":"zulufa","a zumzai":"zumzăi","a zumzai 4th conjugation":"zumzăi","a zupai":"zupăi","a zupai 4th conjugation":"zupăi","a zupui":"zupui","a zupui 4th conjugation":"zupui","a zurai":"zurăi","a zurai 4th conjugation":"zurăi","a zuzai":"zuzăi","a zuzai 4th conjugation":"zuzăi","a zvacni":"zvâcni","a zvacni 4th conjugation":"zvâcni","a zvanta":"zvânta","a zvanta 1st conjugation":"zvânta","a zvantura":"zvântura","a zvantura 1st conjugation":"zvântura","a zvarli":"zvârli","a zvarli 4th conjugation":"zvârli","a zvoni":"zvoni","a zvoni 4th conjugation":"zvoni","acana":"hacana","achinari":"tachinare","achinarii":"tachinare","achinarile":"tachinare","achinarilor":"tachinare","aciuni":"-ăciune","aciunii":"-ăciune","aciunile":"-ăciune","aciunilor":"-ăciune","agust":"gust","al 10-lea":"10-lea","al 3-lea":"3-lea","al 6-lea":"6-lea","al noualea":["al nouălea","noua","al nouălea","nouălea"],"al nouaspelea":["al nouășpelea","nouășpea","al nouășpelea","nouășpelea"],"al nouasprezecelea":["al nouăsprezecelea","nouăsprezecea","al nouăsprezecelea","nouăsprezecelea"],"al nouazeci si cincilea":["al nouăzeci și cincilea","nouăzeci și cincea","al nouăzeci și cincilea","nouăzeci și cincilea"],"al nouazeci si doilea":["al nouăzeci și doilea","nouăzeci și doilea","al nouăzeci și doilea","nouăzeci și doua"],"al nouazeci si noualea":["al nouăzeci și nouălea","nouăzeci și noua","al nouăzeci și nouălea","nouăzeci și nouălea"],"al nouazeci si optulea":["al nouăzeci și optulea","nouăzeci și opta","al nouăzeci și optulea","nouăzeci și optulea"],"al nouazeci si patrulea":["al nouăzeci și patrulea","nouăzeci și patra","al nouăzeci și patrulea","nouăzeci și patrulea"],"al nouazeci si saptelea":["al nouăzeci și șaptelea","nouăzeci și șaptea","al nouăzeci și șaptelea","nouăzeci și șaptelea"],"al nouazeci si saselea":["al nouăzeci și șaselea","nouăzeci și șasea","al nouăzeci și șaselea","nouăzeci și șaselea"],"al nouazeci si treilea":["al nouăzeci și treilea","nouăzeci și treia","al nouăzeci și treilea","nouăzeci și treilea"],"al nouazeci si unulea":["al nouăzeci și unulea","nouăzeci și una","al nouăzeci și unulea","nouăzeci și unulea"],"al nouazecilea":["al nouăzecilea","nouăzecea","al nouăzecilea","nouăzecilea"],"al optspelea":["al optșpelea","optșpea","al optșpelea","optșpelea"],"al optsprezecelea":["al optsprezecelea","optsprezecea","al optsprezecelea","optsprezecelea"],"al optulea":["al optulea","opta","al optulea","optulea"],"al optzeci si cincilea":["al optzeci și cincilea","optzeci și cincea","al optzeci și cincilea","optzeci și cincilea"],"al optzeci si doilea":["al optzeci și doilea","optzeci și doilea","al optzeci și doilea","optzeci și doua"],"al optzeci si noualea":["al optzeci și nouălea","optzeci și noua","al optzeci și nouălea","optzeci și nouălea"],"al optzeci si optulea":["al optzeci și optulea","optzeci și opta","al optzeci și optulea","optzeci și optulea"],"al optzeci si patrulea":["al optzeci și patrulea","optzeci și patra","al optzeci și patrulea","optzeci și patrulea"],"al optzeci si saptelea":["al optzeci și șaptelea","optzeci și șaptea","al optzeci și șaptelea","optzeci și șaptelea"],"al optzeci si saselea":["al optzeci și șaselea","optzeci și șasea","al optzeci și șaselea","optzeci și șaselea"],"al optzeci si treilea":["al optzeci și treilea","optzeci și treia","al optzeci și treilea","optzeci și treilea"],"al optzeci si unulea":["al optzeci și unulea","optzeci și una","al optzeci și unulea","optzeci și unulea"],"al optzecilea":["al optzecilea","optzecea","al optzecilea","optzecilea"],"al treilea":["al treilea","treia","al treilea","treilea"],"al treispelea":["al treișpelea","treișpea","al treișpelea","treișpelea"],"al treisprezecelea":["al treisprezecelea","treisprezecea","al treisprezecelea","treisprezecelea"],"al treizeci si cincilea":["al treizeci și cincilea","treizeci și cincea","al treizeci și cincilea","treizeci și cincilea"],"al treizeci si doilea":["al treizeci și doilea","treizeci și doilea","al treizeci și doilea","treizeci și doua"],"al treizeci si noualea":["al treizeci și nouălea","treizeci și noua","al treizeci și nouălea","treizeci și nouălea"],"al treizeci si optulea":["al treizeci și optulea","treizeci și opta","al treizeci și optulea","treizeci și optulea"],"al treizeci si patrulea":["al treizeci și patrulea","treizeci și patra","al treizeci și patrulea","treizeci și patrulea"],"al treizeci si saptelea":["al treizeci și șaptelea","treizeci și șaptea","al treizeci și șaptelea","treizeci și șaptelea"],"al treizeci si saselea":["al treizeci și șaselea","treizeci și șasea","al treizeci și șaselea","treizeci și șaselea"],"al treizeci si treilea":["al treizeci și treilea","treizeci și treia","al treizeci și treilea","treizeci și treilea"],"al treizeci si unulea":["al treizeci și unulea","treizeci și una","al treizeci și unulea","treizeci și unulea"],"al treizecilea":["al treizecilea","treizecea","al treizecilea","treizecilea"],"al unspelea":["al unșpelea","unșpea","al unșpelea","unșpelea"],"al unsprezecelea":["al unsprezecelea","unsprezecea","al unsprezecelea","unsprezecelea"],"al zecelea":["al zecelea","zecea","al zecelea","zecelea"],"alamaita":"lămâiță","alauta":"lăută","ambla":"umbla","arbuz":"harbuz","arfa":"harpă","aridicat":"ridicat","arpagon":"harpagon"};
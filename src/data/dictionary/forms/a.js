@@ -0,0 +1 @@
+export default {"a -a":"-a","a -e":"-e","a -ea":"-ea","a -i":["a -i","-i","a -î","-î"],"a 10-a":"10-lea","a 3-a":"3-lea","a 6-a":"6-lea","a babardi":"babardi","a babardi 4th conjugation":"babardi","a bacceli":"bacceli","a bacceli 4th conjugation":"bacceli","a baciui":"băciui","a baciui 4th conjugation":"băciui","a bacsi":"bâcsi","a bacsi 4th conjugation":"bâcsi","a badadai":"bădădăi","a badadai 4th conjugation":"bădădăi","a badadui":"bădădui","a badadui 4th conjugation":"bădădui","a badijona":"badijona","a badijona 1st conjugation":"badijona","a badina":"badina","a badina 1st conjugation":"badina","a baga":"băga","a baga 1st conjugation":"băga","a baga ca musca-n lapte 1st conjugation":"băga ca musca-n lapte","a baga capul la cutie [conj]":"băga capul la cutie","a baga in seama 1st conjugation":"băga în seamă","a baga mana in foc 1st conjugation":"băga mâna în foc","a baga pula [conj]":"băga pula","a bagateliza":"bagateliza","a bagiocuri":"bagiocuri","a bagiocuri 4th conjugation":"bagiocuri","a baia":"băia","a baia 1st conjugation":"băia","a baigui":"bâigui","a baigui 4th conjugation":"bâigui","a bajbai":"bâjbâi","a bajbai 4th conjugation":"bâjbâi","a bajenari":"băjenări","a bajenari 4th conjugation":"băjenări","a balaci":"bălăci","a balaci 4th conjugation":"bălăci","a balai":"bălăi","a balai 4th conjugation":"bălăi","a balansa":"balansa","a balansa 1st conjugation":"balansa","a balanta":"balanța","a balanta 1st conjugation":"balanța","a balasta":"balasta","a balasta 1st conjugation":"balasta","a balbai":"bâlbâi","a balbai 4th conjugation":"bâlbâi","a balega":"bălega","a balega 1st conjugation":"bălega","a baliga":"băliga","a baliga 1st conjugation":"băliga","a baliza":"baliza","a baliza 1st conjugation":"baliza","a balmaji":"bălmăji","a balmaji 4th conjugation":"bălmăji","a balmoji":"bălmoji","a balmoji 4th conjugation":"bălmoji","a balona":"balona","a balona 1st conjugation":"balona","a balsama":"bălsăma","a balsama 1st conjugation":"bălsăma","a balsami":"bălsămi","a balsami 4th conjugation":"bălsămi","a balsamui":"balsamui","a balsamui 4th conjugation":"balsamui","a banaliza":"banaliza","a banaliza 1st conjugation":"banaliza","a bancheta":"bancheta","a bancheta 1st conjugation":"bancheta","a bancruta":"bancruta","a bancruta 1st conjugation":"bancruta","a bandaja":"bandaja","a bandaja 1st conjugation":"bandaja","a bani":"băni","a bani 4th conjugation":"băni","a bantui":"bântui","a bantui 4th conjugation":"bântui","a banui":"bănui","a banui 4th conjugation":"bănui","a bara":"bara","a bara 1st conjugation":"bara","a barai":"bârâi","a barai 4th conjugation":"bârâi","a barani":"bărăni","a barani 4th conjugation":"bărăni","a barbariza":"barbariza","a barbariza 1st conjugation":"barbariza","a barbieri":"bărbieri","a barbieri 4th conjugation":"bărbieri","a bardui":"bărdui","a bardui 4th conjugation":"bărdui","a barfi":"bârfi","a barfi 4th conjugation":"bârfi","a baricada":"baricada","a baricada 1st conjugation":"baricada","a barliga":"bârliga","a barliga 1st conjugation":"bârliga","a bascula":"bascula","a bascula 1st conjugation":"bascula","a basi":"băși","a basi 4th conjugation":"băși","a basica":"bășica","a basica 1st conjugation":"bășica","a basmui":"băsmui","a basmui 4th conjugation":"băsmui","a basni":"băsni","a basni 4th conjugation":"băsni","a batai":"bâțâi","a batai 4th conjugation":"bâțâi","a batatori":"bătători","a batatori 4th conjugation":"bătători","a bataturi":"bătături","a bataturi 4th conjugation":"bătături","a bate":"bate","a bate 3rd conjugation":"bate","a bate la cap 3rd conjugation":"bate la cap","a bate la ochi 3rd conjugation":"bate la ochi","a bate la talpi 3rd conjugation":"bate la tălpi","a bate palma 3rd conjugation":"bate palma","a batgiocura":"batgiocura","a batgiocura 1st conjugation":"batgiocura","a batjocori":"batjocori","a batjocori 4th conjugation":"batjocori","a batjocura":"batjocura","a batjocura 1st conjugation":"batjocura","a batjocuri":"batjocuri","a batjocuri 4th conjugation":"batjocuri","a bauna 1st conjugation":"băuna","a baza":"baza","a baza 1st conjugation":"baza","a bazai":["a bâzâi","bâzâi","a bâzăi","bâzăi"],"a bazai 4th conjugation":["a bâzâi 4th conjugation","bâzâi","a bâzăi 4th conjugation","bâzăi"],"a bea":"bea","a bea 2nd conjugation":"bea","a bea tutun 2nd conjugation":"bea tutun","a beatifica":"beatifica","a beatifica 1st conjugation":"beatifica","a bedui":"bedui","a bedui 4th conjugation":"bedui","a behai 4th conjugation":"behăi","a bejanari":"bejănări","a bejanari 4th conjugation":"bejănări","a bejani":"bejăni","a bejani 4th conjugation":"bejăni","a bejeni":"bejeni","a bejeni 4th conjugation":"bejeni","a beli":"beli","a beli 4th conjugation":"beli","a beli pula":"beli pula","a beli pula 4th conjugation":"beli pula","a bemoliza":"bemoliza","a bemoliza 1st conjugation":"bemoliza","a benchetui":"benchetui","a benchetui 4th conjugation":"benchetui","a beneficia":"beneficia","a beneficia 1st conjugation":"beneficia","a berbeci":"berbeci","a berbeci 4th conjugation":"berbeci","a beregati":"beregăți","a beregati 4th conjugation":"beregăți","a beregatui":"beregătui","a beregatui 4th conjugation":"beregătui","a besica":"beșica","a besica 1st conjugation":"beșica","a besteli":"beșteli","a besteli 4th conjugation":"beșteli","a bestializa":"bestializa","a bestializa 1st conjugation":"bestializa","a beteji":"beteji","a beteji 4th conjugation":"beteji","a betivi":"bețivi","a betivi 4th conjugation":"bețivi","a betona":"betona","a betona 1st conjugation":"betona","a bezaconui":"bezaconui","a bezaconui 4th conjugation":"bezaconui","a bichiri":"bichiri","a bichiri 4th conjugation":"bichiri","a biciui":"biciui","a biciui 4th conjugation":"biciui","a bifa":"bifa","a bifa 1st conjugation":"bifa","a bifurca":"bifurca","a bifurca 1st conjugation":"bifurca","a bihindisi":"bihindisi","a bihindisi 4th conjugation":"bihindisi","a bindisi":"bindisi","a bindisi 4th conjugation":"bindisi","a binecuvanta":"binecuvânta","a binecuvanta 1st conjugation":"binecuvânta","a bineface":"bineface","a bineface 3rd conjugation":"bineface","a binemerita":"binemerita","a binemerita 1st conjugation":"binemerita","a binevesti":"binevesti","a binevesti 4th conjugation":"binevesti","a binevoi":"binevoi","a binevoi 4th conjugation":"binevoi","a binocla":"binocla","a binocla 1st conjugation":"binocla","a bintatui":"bintătui","a bintatui 4th conjugation":"bintătui","a biostimula":"biostimula","a biostimula 1st conjugation":"biostimula","a bipai":"bipăi","a bipai 4th conjugation":"bipăi","a birocratiza":"birocratiza","a birocratiza 1st conjugation":"birocratiza","a birsagalui":"birșăgălui","a birsagalui 4th conjugation":"birșăgălui","a birui":"birui","a birui 4th conjugation":"birui","a bisa":"bisa","a bisa 1st conjugation":"bisa","a bituma":"bituma","a bituma 1st conjugation":"bituma","a bivuaca":"bivuaca","a bivuaca 1st conjugation":"bivuaca","a bizui":"bizui","a bizui 4th conjugation":"bizui","a blagodari":"blagodari","a blagodari 4th conjugation":"blagodari","a blagoslovi":"blagoslovi","a blagoslovi 4th conjugation":"blagoslovi","a blama":"blama","a blama 1st conjugation":"blama","a blani":"blăni","a blani 4th conjugation":"blăni","a blanui":"blănui","a blanui 4th conjugation":"blănui","a blasfema":"blasfema","a blasfema 1st conjugation":"blasfema","a blastama":"blăstăma","a blastama 1st conjugation":"blăstăma","a blastema":"blăstema","a blastema 1st conjugation":"blăstema","a blaza":"blaza","a blaza 1st conjugation":"blaza","a bleorcoti":"bleorcoti","a bleorcoti 4th conjugation":"bleorcoti","a blestema":"blestema","a blestema 1st conjugation":"blestema","a blinda":"blinda","a blinda 1st conjugation":"blinda","a bloca":"bloca","a bloca 1st conjugation":"bloca","a blodogori":"blodogori","a blodogori 4th conjugation":"blodogori","a blonzi":"blonzi","a blonzi 4th conjugation":"blonzi","a bobina":"bobina","a bobina 1st conjugation":"bobina","a boboti":"boboti","a boboti 4th conjugation":"boboti","a bocani":"bocăni","a bocani 4th conjugation":"bocăni","a boci":"boci","a boci 4th conjugation":"boci","a bodogani":"bodogăni","a bodogani 4th conjugation":"bodogăni","a bodrogani":"bodrogăni","a bodrogani 4th conjugation":"bodrogăni","a bogdaprosti":"bogdaprosti","a bogdaprosti 4th conjugation":"bogdaprosti","a boi":"boi","a boi 4th conjugation":"boi","a boicota":"boicota","a boicota 1st conjugation":"boicota","a boieri":"boieri","a boieri 4th conjugation":"boieri","a bojogari":"bojogări","a bojogari 4th conjugation":"bojogări","a bolborosi":"bolborosi","a bolborosi 4th conjugation":"bolborosi","a boldi":"boldi","a boldi 4th conjugation":"boldi","a boli":"boli","a boli 4th conjugation":"boli","a bolmoji":"bolmoji","a bolmoji 4th conjugation":"bolmoji","a bolnavi":"bolnăvi","a bolnavi 4th conjugation":"bolnăvi","a bolseviza":"bolșeviza","a bolseviza 1st conjugation":"bolșeviza","a bolti":"bolti","a bolti 4th conjugation":"bolti","a bomba":"bomba","a bomba 1st conjugation":"bomba","a bombani":"bombăni","a bombani 4th conjugation":"bombăni","a bombarda":"bombarda","a bombarda 1st conjugation":"bombarda","a bonai":"bonăi","a bonai 4th conjugation":"bonăi","a bonifica":"bonifica","a bonifica 1st conjugation":"bonifica","a bori":["a bori","bori","a borî","borî"],"a bori 4th conjugation":["a bori 4th conjugation","bori","a borî 4th conjugation","borî"],"a borna":"borna","a borna 1st conjugation":"borna","a borsi":"borși","a borsi 4th conjugation":"borși","a bosorogi":"boșorogi","a bosorogi 4th conjugation":"boșorogi","a bosumfla":"bosumfla","a bosumfla 1st conjugation":"bosumfla","a botaniza":"botaniza","a botaniza 1st conjugation":"botaniza","a boteza":"boteza","a boteza 1st conjugation":"boteza","a boti":"boți","a boti 4th conjugation":"boți","a boxa":"boxa","a boxa 1st conjugation":"boxa","a bracona":"bracona","a bracona 1st conjugation":"bracona","a bramburi":"bramburi","a bramburi 4th conjugation":"bramburi","a brani":"brăni","a brani 4th conjugation":"brăni","a bransa":"branșa","a bransa 1st conjugation":"branșa","a branzi":"brânzi","a branzi 4th conjugation":"brânzi","a brava":"brava","a brava 1st conjugation":"brava","a brazda":"brăzda","a brazda 1st conjugation":"brăzda","a brazdui":"brăzdui","a brazdui 4th conjugation":"brăzdui","a breveta":"breveta","a breveta 1st conjugation":"breveta","a bria":"bria","a bria 1st conjugation":"bria","a bricola":"bricola","a bricola 1st conjugation":"bricola","a brobona":"brobona","a brobona 1st conjugation":"brobona","a broboni":"broboni","a broboni 4th conjugation":"broboni","a broda":"broda","a broda 1st conjugation":"broda","a bronza":"bronza","a bronza 1st conjugation":"bronza","a brosa":"broșa","a brosa 1st conjugation":"broșa","a bruftului":"bruftului","a bruftului 4th conjugation":"bruftului","a bruia":"bruia","a bruia 1st conjugation":"bruia","a bruma":"bruma","a bruma 1st conjugation":"bruma","a bruna":"bruna","a bruna 1st conjugation":"bruna","a brusca":"brusca","a brusca 1st conjugation":"brusca","a brutaliza":"brutaliza","a brutaliza 1st conjugation":"brutaliza","a bubui":"bubui","a bubui 4th conjugation":"bubui","a bucatari":"bucătări","a bucatari 4th conjugation":"bucătări","a bucateli":"bucățeli","a bucateli 4th conjugation":"bucățeli","a bucati":"bucăți","a bucati 4th conjugation":"bucăți","a buchisa":"buchisa","a buchisa 1st conjugation":"buchisa","a buchisi":"buchisi","a buchisi 4th conjugation":"buchisi","a buciuma":"buciuma","a buciuma 1st conjugation":"buciuma","a bucla":"bucla","a bucla 1st conjugation":"bucla","a bucura":"bucura","a bucura 1st conjugation":"bucura","a buda":"buda","a buda 1st conjugation":"buda","a budugari":"budugări","a budugari 4th conjugation":"budugări","a buduli":"buduli","a buduli 4th conjugation":"buduli","a bufni":"bufni","a bufni 4th conjugation":"bufni","a bufona":"bufona","a bufona 1st conjugation":"bufona","a buici":"buici","a buici 4th conjugation":"buici","a buimaci":"buimăci","a buimaci 4th conjugation":"buimăci","a bujdi":"bujdi","a bujdi 4th conjugation":"bujdi","a bulbuca":"bulbuca","a bulbuca 1st conjugation":"bulbuca","a bulbuci":"bulbuci","a bulbuci 4th conjugation":"bulbuci","a bulgari":"bulgări","a bulgari 4th conjugation":"bulgări","a bulgariza":"bulgariza","a bulgariza 1st conjugation":"bulgariza","a buli":"buli","a buli 4th conjugation":"buli","a bulibasi":"bulibăși","a bulibasi 4th conjugation":"bulibăși","a bulona":"bulona","a bulona 1st conjugation":"bulona","a buluci":"buluci","a buluci 4th conjugation":"buluci","a bulversa":"bulversa","a bulversa 1st conjugation":"bulversa","a bumbaci":"bumbăci","a bumbaci 4th conjugation":"bumbăci","a bura":"bura","a bura 1st conjugation":"bura","a burdusi":"burduși","a burdusi 4th conjugation":"burduși","a burghezi":"burghezi","a burghezi 4th conjugation":"burghezi","a burlaci":"burlăci","a burlaci 4th conjugation":"burlăci","a burnita":"burnița","a burnita 1st conjugation":"burnița","a bursuca":"bursuca","a bursuca 1st conjugation":"bursuca","a burzului":"burzului","a burzului 4th conjugation":"burzului","a buscula":"buscula","a buscula 1st conjugation":"buscula","a busi":"buși","a busi 4th conjugation":"buși","a busumfla":"busumfla","a busumfla 1st conjugation":"busumfla","a butnari":"butnări","a butnari 4th conjugation":"butnări","a butona":"butona","a butona 1st conjugation":"butona","a buzdugani":"buzdugăni","a buzdugani 4th conjugation":"buzdugăni","a buzoia":"buzoia","a buzoia 1st conjugation":"buzoia","a buzunari":"buzunări","a buzunari 4th conjugation":"buzunări","a echilibra":"echilibra","a echilibra 1st conjugation":"echilibra","a echipa":"echipa","a echipa 1st conjugation":"echipa","a echivala":"echivala","a echivala 1st conjugation":"echivala","a eclipsa":"eclipsa","a eclipsa 1st conjugation":"eclipsa","a ecloza":"ecloza","a ecloza 1st conjugation":"ecloza","a ecluza":"ecluza","a ecluza 1st conjugation":"ecluza","a economisi":"economisi","a economisi 4th conjugation":"economisi","a economiza":"economiza","a economiza 1st conjugation":"economiza","a ecrana":"ecrana","a ecrana 1st conjugation":"ecrana","a ecraniza":"ecraniza","a ecraniza 1st conjugation":"ecraniza","a edenta":"edenta","a edenta 1st conjugation":"edenta","a edifica":"edifica","a edifica 1st conjugation":"edifica","a edita":"edita","a edita 1st conjugation":"edita","a educa":"educa","a educa 1st conjugation":"educa","a edulcora":"edulcora","a edulcora 1st conjugation":"edulcora","a efectua":"efectua","a efectua 1st conjugation":"efectua","a efemeia":"efemeia","a efemeia 1st conjugation":"efemeia","a efemeriza":"efemeriza","a efemeriza 1st conjugation":"efemeriza","a efemina":"efemina","a efemina 1st conjugation":"efemina","a eficientiza":"eficientiza","a eficientiza 1st conjugation":"eficientiza","a efila":"efila","a efila 1st conjugation":"efila","a egala":"egala","a egala 1st conjugation":"egala","a egaliza":"egaliza","a egaliza 1st conjugation":"egaliza","a egrena":"egrena","a egrena 1st conjugation":"egrena","a ejacula":"ejacula","a ejacula 1st conjugation":"ejacula","a ejecta":"ejecta","a ejecta 1st conjugation":"ejecta","a elabora":"elabora","a elabora 1st conjugation":"elabora","a elansa":"elansa","a elansa 1st conjugation":"elansa","a electrifica":"electrifica","a electrifica 1st conjugation":"electrifica","a electriza":"electriza","a electriza 1st conjugation":"electriza","a electrocauteriza":"electrocauteriza","a electrocauteriza 1st conjugation":"electrocauteriza","a electrocoagula":"electrocoagula","a electrocoagula 1st conjugation":"electrocoagula","a electrocuta":"electrocuta","a electrocuta 1st conjugation":"electrocuta","a electroliza":"electroliza","a electroliza 1st conjugation":"electroliza","a electroniza":"electroniza","a electroniza 1st conjugation":"electroniza","a elefterosi":"elefterosi","a elefterosi 4th conjugation":"elefterosi","a elementariza":"elementariza","a elementariza 1st conjugation":"elementariza","a eleniza":"eleniza","a eleniza 1st conjugation":"eleniza","a elibera":"elibera","a elibera 1st conjugation":"elibera","a elibera din functie 1st conjugation":"elibera din funcție","a elida":"elida","a elida 1st conjugation":"elida","a elimina":"elimina","a elimina 1st conjugation":"elimina","a elogia":"elogia","a elogia 1st conjugation":"elogia","a elucida":"elucida","a elucida 1st conjugation":"elucida","a elucubra":"elucubra","a elucubra 1st conjugation":"elucubra","a eluda":"eluda","a eluda 1st conjugation":"eluda","a emacia":"emacia","a emacia 1st conjugation":"emacia","a emaila":"emaila","a emaila 1st conjugation":"emaila","a emana":"emana","a emana 1st conjugation":"emana","a emancipa":"emancipa","a emancipa 1st conjugation":"emancipa","a emascula":"emascula","a emascula 1st conjugation":"emascula","a embereclisi":"embereclisi","a embereclisi 4th conjugation":"embereclisi","a emenda":"emenda","a emenda 1st conjugation":"emenda","a emerge":"emerge","a emerge 3rd conjugation":"emerge","a emetiza":"emetiza","a emetiza 1st conjugation":"emetiza","a emigra":"emigra","a emigra 1st conjugation":"emigra","a eminescianiza":"eminescianiza","a eminescianiza 1st conjugation":"eminescianiza","a emite":"emite","a emite 3rd conjugation":"emite","a emotiona":"emoționa","a emotiona 1st conjugation":"emoționa","a emula":"emula","a emula 1st conjugation":"emula","a emulsiona":"emulsiona","a emulsiona 1st conjugation":"emulsiona","a enara":"enara","a enara 1st conjugation":"enara","a energhisi":"energhisi","a energhisi 4th conjugation":"energhisi","a enerva":"enerva","a enerva 1st conjugation":"enerva","a englezi":"englezi","a englezi 4th conjugation":"englezi","a enigmatiza":"enigmatiza","a enigmatiza 1st conjugation":"enigmatiza","a entuziasma":"entuziasma","a entuziasma 1st conjugation":"entuziasma","a enumera":"enumera","a enumera 1st conjugation":"enumera","a enunta":"enunța","a enunta 1st conjugation":"enunța","a epata":"epata","a epata 1st conjugation":"epata","a epila":"epila","a epila 1st conjugation":"epila","a epiloga":"epiloga","a epiloga 1st conjugation":"epiloga","a epimelisi":"epimelisi","a epimelisi 4th conjugation":"epimelisi","a epiteorisi":"epiteorisi","a epiteorisi 4th conjugation":"epiteorisi","a epuiza":"epuiza","a epuiza 1st conjugation":"epuiza","a epura":"epura","a epura 1st conjugation":"epura","a eradica":"eradica","a eradica 1st conjugation":"eradica","a erbicida":"erbicida","a erbicida 1st conjugation":"erbicida","a erboriza":"erboriza","a erboriza 1st conjugation":"erboriza","a ereda":"ereda","a ereda 1st conjugation":"ereda","a ermetiza":"ermetiza","a ermetiza 1st conjugation":"ermetiza","a eroda":"eroda","a eroda 1st conjugation":"eroda","a eroifica":"eroifica","a eroifica 1st conjugation":"eroifica","a eroiza":"eroiza","a eroiza 1st conjugation":"eroiza","a erotiza":"erotiza","a erotiza 1st conjugation":"erotiza","a eructa":"eructa","a eructa 1st conjugation":"eructa","a erupe":"erupe","a erupe 3rd conjugation":"erupe","a esalona":"eșalona","a esalona 1st conjugation":"eșalona","a esantiona":"eșantiona","a esantiona 1st conjugation":"eșantiona","a escalada":"escalada","a escalada 1st conjugation":"escalada","a escamota":"escamota","a escamota 1st conjugation":"escamota","a eschiva":"eschiva","a eschiva 1st conjugation":"eschiva","a escorta":"escorta","a escorta 1st conjugation":"escorta","a escroca":"escroca","a escroca 1st conjugation":"escroca","a esentializa":"esențializa","a esentializa 1st conjugation":"esențializa","a esplica":"esplica","a esplica 1st conjugation":"esplica","a esterifica":"esterifica","a esterifica 1st conjugation":"esterifica","a estetiza":"estetiza","a estetiza 1st conjugation":"estetiza","a estima":"estima","a estima 1st conjugation":"estima","a estompa":"estompa","a estompa 1st conjugation":"estompa","a estorca":"estorca","a estorca 1st conjugation":"estorca","a estropia":"estropia","a estropia 1st conjugation":"estropia","a esua":"eșua","a esua 1st conjugation":"eșua","a etaja":"etaja","a etaja 1st conjugation":"etaja","a etala":"etala","a etala 1st conjugation":"etala","a etalona":"etalona","a etalona 1st conjugation":"etalona","a etansa":"etanșa","a etansa 1st conjugation":"etanșa","a etanseiza":"etanșeiza","a etanseiza 1st conjugation":"etanșeiza","a etapiza":"etapiza","a etapiza 1st conjugation":"etapiza","a etatiza":"etatiza","a etatiza 1st conjugation":"etatiza","a eterifica":"eterifica","a eterifica 1st conjugation":"eterifica","a eteriza":"eteriza","a eteriza 1st conjugation":"eteriza","a eterniza":"eterniza","a eterniza 1st conjugation":"eterniza","a eticheta":"eticheta","a eticheta 1st conjugation":"eticheta","a eticiza":"eticiza","a eticiza 1st conjugation":"eticiza","a etila":"etila","a etila 1st conjugation":"etila","a etimologiza":"etimologiza","a etimologiza 1st conjugation":"etimologiza","a etiola":"etiola","a etiola 1st conjugation":"etiola","a etira":"etira","a etira 1st conjugation":"etira","a etniciza":"etniciza","a etniciza 1st conjugation":"etniciza","a europeniza":"europeniza","a europeniza 1st conjugation":"europeniza","a eutanasia":"eutanasia","a eutanasia 1st conjugation":"eutanasia","a evacua":"evacua","a evacua 1st conjugation":"evacua","a evada":"evada","a evada 1st conjugation":"evada","a evalua":"evalua","a evalua 1st conjugation":"evalua","a evangheliza":"evangheliza","a evangheliza 1st conjugation":"evangheliza","a evapora":"evapora","a evapora 1st conjugation":"evapora","a evaza":"evaza","a evaza 1st conjugation":"evaza","a eveni":"eveni","a eveni 4th conjugation":"eveni","a evghenisi":"evghenisi","a evghenisi 4th conjugation":"evghenisi","a evidentia":"evidenția","a evidentia 1st conjugation":"evidenția","a evinge":"evinge","a evinge 3rd conjugation":"evinge","a eviscera":"eviscera","a eviscera 1st conjugation":"eviscera","a evita":"evita","a evita 1st conjugation":"evita","a evoca":"evoca","a evoca 1st conjugation":"evoca","a evolua":"evolua","a evolua 1st conjugation":"evolua","a exacerba":"exacerba","a exacerba 1st conjugation":"exacerba","a exagera":"exagera","a exagera 1st conjugation":"exagera","a exala":"exala","a exala 1st conjugation":"exala","a exalta":"exalta","a exalta 1st conjugation":"exalta","a examina":"examina","a examina 1st conjugation":"examina","a exaspera":"exaspera","a exaspera 1st conjugation":"exaspera","a excava":"excava","a excava 1st conjugation":"excava","a exceda":"exceda","a exceda 1st conjugation":"exceda","a excela":"excela","a excela 1st conjugation":"excela","a excepta":"excepta","a excepta 1st conjugation":"excepta","a excerpta":"excerpta","a excerpta 1st conjugation":"excerpta","a excita":"excita","a excita 1st conjugation":"excita","a exciza":"exciza","a exciza 1st conjugation":"exciza","a exclama":"exclama","a exclama 1st conjugation":"exclama","a exclude":"exclude","a exclude 3rd conjugation":"exclude","a excogita":"excogita","a excogita 1st conjugation":"excogita","a excomunica":"excomunica","a excomunica 1st conjugation":"excomunica","a excoria":"excoria","a excoria 1st conjugation":"excoria","a excreta":"excreta","a excreta 1st conjugation":"excreta","a execra":"execra","a execra 1st conjugation":"execra","a executa":"executa","a executa 1st conjugation":"executa","a executarisi":"executarisi","a executarisi 4th conjugation":"executarisi","a exemplifica":"exemplifica","a exemplifica 1st conjugation":"exemplifica","a exercita":"exercita","a exercita 1st conjugation":"exercita","a exeredita":"exeredita","a exeredita 1st conjugation":"exeredita","a exersa":"exersa","a exersa 1st conjugation":"exersa","a exfolia":"exfolia","a exfolia 1st conjugation":"exfolia","a exhiba":"exhiba","a exhiba 1st conjugation":"exhiba","a exhuma":"exhuma","a exhuma 1st conjugation":"exhuma","a exige":"exige","a exige 3rd conjugation":"exige","a exila":"exila","a exila 1st conjugation":"exila","a exista":"exista","a exista 1st conjugation":"exista","a exmatricula":"exmatricula","a exmatricula 1st conjugation":"exmatricula","a exoflisi":"exoflisi","a exoflisi 4th conjugation":"exoflisi","a exonera":"exonera","a exonera 1st conjugation":"exonera","a exorciza":"exorciza","a exorciza 1st conjugation":"exorciza","a exorta":"exorta","a exorta 1st conjugation":"exorta","a exotiza":"exotiza","a exotiza 1st conjugation":"exotiza","a expanda":"expanda","a expanda 1st conjugation":"expanda","a expatria":"expatria","a expatria 1st conjugation":"expatria","a expectora":"expectora","a expectora 1st conjugation":"expectora","a expedia":"expedia","a expedia 1st conjugation":"expedia","a expedui":"expedui","a expedui 4th conjugation":"expedui","a experimenta":"experimenta","a experimenta 1st conjugation":"experimenta","a expertiza":"expertiza","a expertiza 1st conjugation":"expertiza","a expia":"expia","a expia 1st conjugation":"expia","a expira":"expira","a expira 1st conjugation":"expira","a explica":"explica","a explica 1st conjugation":"explica","a explicita":"explicita","a explicita 1st conjugation":"explicita","a exploata":"exploata","a exploata 1st conjugation":"exploata","a exploda":"exploda","a exploda 1st conjugation":"exploda","a explora":"explora","a explora 1st conjugation":"explora","a exporta":"exporta","a exporta 1st conjugation":"exporta","a exportui":"exportui","a exportui 4th conjugation":"exportui","a exprima":"exprima","a exprima 1st conjugation":"exprima","a expropria":"expropria","a expropria 1st conjugation":"expropria","a expulsa":"expulsa","a expulsa 1st conjugation":"expulsa","a expulza":"expulza","a expulza 1st conjugation":"expulza","a expune":"expune","a expune 3rd conjugation":"expune","a expurga":"expurga","a expurga 1st conjugation":"expurga","a extazia":"extazia","a extazia 1st conjugation":"extazia","a extenua":"extenua","a extenua 1st conjugation":"extenua","a exterioriza":"exterioriza","a exterioriza 1st conjugation":"exterioriza","a extermina":"extermina","a extermina 1st conjugation":"extermina","a externa":"externa","a externa 1st conjugation":"externa","a externaliza":"externaliza","a externaliza 1st conjugation":"externaliza","a extinde":"extinde","a extinde 3rd conjugation":"extinde","a extirpa":"extirpa","a extirpa 1st conjugation":"extirpa","a extorca":"extorca","a extorca 1st conjugation":"extorca","a extrada":"extrăda","a extrada 1st conjugation":"extrăda","a extrage":"extrage","a extrage 3rd conjugation":"extrage","a extrapola":"extrapola","a extrapola 1st conjugation":"extrapola","a exulta":"exulta","a exulta 1st conjugation":"exulta","a ezita":"ezita","a ezita 1st conjugation":"ezita","a fabrica":"fabrica","a fabrica 1st conjugation":"fabrica","a fabula":"fabula","a fabula 1st conjugation":"fabula","a face":"face","a face 3rd conjugation":"face","a face bine 3rd conjugation":"face bine","a face ca trenul 3rd conjugation":"face ca trenul","a face cinste 3rd conjugation":"face cinste","a face cu mana 3rd conjugation":"face cu mâna","a face cu ou si cu otet 3rd conjugation":"face cu ou și cu oțet","a face cunoscut 3rd conjugation":"face cunoscut","a face de ras 3rd conjugation":"face de râs","a face din rahat bici 3rd conjugation":"face din rahat bici","a face din tantar armasar":"face din țânțar armăsar","a face dragoste 3rd conjugation":"face dragoste","a face fata 3rd conjugation":"face față","a face harcea-parcea 3rd conjugation":"face harcea-parcea","a face haz de necaz 3rd conjugation":"face haz de necaz","a face in pofida 3rd conjugation":"face în pofidă","a face laba":"face labă","a face laba 3rd conjugation":"face labă","a face nazuri 3rd conjugation":"face nazuri","a face ochi dulci 3rd conjugation":"face ochi dulci","a face pe mortul in papusoi 3rd conjugation":"face pe mortul în păpușoi","a face pe prostul 3rd conjugation":"face pe prostul","a face prezenta 3rd conjugation":"face prezența","a face rost 3rd conjugation":"face rost","a face sex":"face sex","a face sex 3rd conjugation":"face sex","a face umbra pamantului degeaba 3rd conjugation":"face umbră pământului degeaba","a facilita":"facilita","a facilita 1st conjugation":"facilita","a facsimila":"facsimila","a facsimila 1st conjugation":"facsimila","a factoriza":"factoriza","a factoriza 1st conjugation":"factoriza","a factura":"factura","a factura 1st conjugation":"factura","a fagadui":"făgădui","a fagadui 4th conjugation":"făgădui","a faianta":"faianța","a faianta 1st conjugation":"faianța","a falfai":["a fâlfâi","fâlfâi","a fâlfăi","fâlfăi","a fălfâi","fălfâi"],"a falfai 4th conjugation":["a fâlfâi 4th conjugation","fâlfâi","a fâlfăi 4th conjugation","fâlfăi","a fălfâi 4th conjugation","fălfâi"],"a fali":"făli","a fali 4th conjugation":"făli","a falimenta":"falimenta","a falimenta 1st conjugation":"falimenta","a falosi":"făloși","a falosi 4th conjugation":"făloși","a falsifica":["a falsifica","falsifica","a falșifica","falșifica"],"a falsifica 1st conjugation":["a falsifica 1st conjugation","falsifica","a falșifica 1st conjugation","falșifica"],"a faltui":"fălțui","a faltui 4th conjugation":"fălțui","a familiariza":"familiariza","a familiariza 1st conjugation":"familiariza","a fanariotiza":"fanariotiza","a fanariotiza 1st conjugation":"fanariotiza","a fanatiza":"fanatiza","a fanatiza 1st conjugation":"fanatiza","a faptui":"făptui","a faptui 4th conjugation":"făptui","a faralegi":"fărălegi","a faralegi 4th conjugation":"fărălegi","a farama":"fărâma","a farama 1st conjugation":"fărâma","a faramaturi":"fărâmături","a faramaturi 4th conjugation":"fărâmături","a farami":"fărâmi","a farami 4th conjugation":"fărâmi","a faramita":"fărâmița","a faramita 1st conjugation":"fărâmița","a farbui":"fărbui","a farbui 4th conjugation":"fărbui","a farda":"farda","a farda 1st conjugation":"farda","a farma":"fărma","a farma 1st conjugation":"fărma","a farmaca":"fărmăca","a farmaca 1st conjugation":"fărmăca","a farsi":"fârși","a farsi 4th conjugation":"fârși","a fasai":["a fâsâi","fâsâi","a fâsăi","fâsăi","a fâșâi","fâșâi","a fâșăi","fâșăi"],"a fasai 4th conjugation":["a fâsâi 4th conjugation","fâsâi","a fâsăi 4th conjugation","fâsăi","a fâșâi 4th conjugation","fâșâi","a fâșăi 4th conjugation","fâșăi"],"a fascina":"fascina","a fascina 1st conjugation":"fascina","a fasciza":"fasciza","a fasciza 1st conjugation":"fasciza","a fasii":"fâșii","a fasii 4th conjugation":"fâșii","a fasona":"fasona","a fasona 1st conjugation":"fasona","a fastaci":"fâstâci","a fastaci 4th conjugation":"fâstâci","a fasura":"fășura","a fasura 1st conjugation":"fășura","a fata":"făta","a fata 1st conjugation":"făta","a fatai":"fâțâi","a fatai 4th conjugation":"fâțâi","a fatari":"fățări","a fatari 4th conjugation":"fățări","a fatarnici":"fățărnici","a fatarnici 4th conjugation":"fățărnici","a fateta":"fațeta","a fateta 1st conjugation":"fațeta","a fatui":"fățui","a fatui 4th conjugation":"fățui","a faulta":"faulta","a faulta 1st conjugation":"faulta","a fauri":"făuri","a fauri 4th conjugation":"făuri","a favoriza":"favoriza","a favoriza 1st conjugation":"favoriza","a feciori":"feciori","a feciori 4th conjugation":"feciori","a fecunda":"fecunda","a fecunda 1st conjugation":"fecunda","a federa":"federa","a federa 1st conjugation":"federa","a federaliza":"federaliza","a federaliza 1st conjugation":"federaliza","a felesui":"feleșui","a felesui 4th conjugation":"feleșui","a felia":"felia","a felia 1st conjugation":"felia","a felicita":"felicita","a felicita 1st conjugation":"felicita","a feliuri":"feliuri","a feliuri 4th conjugation":"feliuri","a feluri":"feluri","a feluri 4th conjugation":"feluri","a feminiza":"feminiza","a feminiza 1st conjugation":"feminiza","a fenta":"fenta","a fenta 1st conjugation":"fenta","a ferastrui":"ferăstrui","a ferastrui 4th conjugation":"ferăstrui","a ferchezui":"ferchezui","a ferchezui 4th conjugation":"ferchezui","a fereca":"fereca","a fereca 1st conjugation":"fereca","a ferestrui":"ferestrui","a ferestrui 4th conjugation":"ferestrui","a ferestui":"ferestui","a ferestui 4th conjugation":"ferestui","a ferfenita":"ferfenița","a ferfenita 1st conjugation":"ferfenița","a feri":"feri","a feri 4th conjugation":"feri","a ferica":"ferica","a ferica 1st conjugation":"ferica","a ferici":"ferici","a ferici 4th conjugation":"ferici","a fericita":"fericita","a fericita 1st conjugation":"fericita","a fermeca":"fermeca","a fermeca 1st conjugation":"fermeca","a fermenta":"fermenta","a fermenta 1st conjugation":"fermenta","a fertiliza":"fertiliza","a fertiliza 1st conjugation":"fertiliza","a festeli":"feșteli","a festeli 4th conjugation":"feșteli","a festi":"fești","a festi 4th conjugation":"fești","a festona":"festona","a festona 1st conjugation":"festona","a fetisiza":"fetișiza","a fetisiza 1st conjugation":"fetișiza","a feudaliza":"feudaliza","a feudaliza 1st conjugation":"feudaliza","a fezanda":"fezanda","a fezanda 1st conjugation":"fezanda","a fi":"fi","a fi 4th conjugation":"fi","a fi chit 4th conjugation":"fi chit","a fi sanatos 4th conjugation":"fi sănătos","a fibrila":"fibrila","a fibrila 1st conjugation":"fibrila","a fierastrui":"fierăstrui","a fierastrui 4th conjugation":"fierăstrui","a fierbanta":"fierbânta","a fierbanta 1st conjugation":"fierbânta","a fierbe":"fierbe","a fierbe 3rd conjugation":"fierbe","a figura":"figura","a figura 1st conjugation":"figura","a fiinta":"ființa","a fiinta 1st conjugation":"ființa","a fiinti":"ființi","a fiinti 4th conjugation":"ființi","a filigrana":"filigrana","a filigrana 1st conjugation":"filigrana","a filma":"filma","a filma 1st conjugation":"filma","a filosofa":"filosofa","a filosofa 1st conjugation":"filosofa","a filosofi":"filosofi","a filosofi 4th conjugation":"filosofi","a filozofa":"filozofa","a filozofa 1st conjugation":"filozofa","a filtra":"filtra","a filtra 1st conjugation":"filtra","a finaliza":"finaliza","a finaliza 1st conjugation":"finaliza","a finanta":"finanța","a finanta 1st conjugation":"finanța","a fini":"fini","a fini 4th conjugation":"fini","a finisa":"finisa","a finisa 1st conjugation":"finisa","a firitisi":"firitisi","a firitisi 4th conjugation":"firitisi","a fiscaliza":"fiscaliza","a fiscaliza 1st conjugation":"fiscaliza","a fisiona":"fisiona","a fisiona 1st conjugation":"fisiona","a fisura":"fisura","a fisura 1st conjugation":"fisura","a fixa":"fixa","a fixa 1st conjugation":"fixa","a flagela":"flagela","a flagela 1st conjugation":"flagela","a flamanzi":"flămânzi","a flamanzi 4th conjugation":"flămânzi","a flamba":"flamba","a flamba 1st conjugation":"flamba","a flanca":"flanca","a flanca 1st conjugation":"flanca","a flata":"flata","a flata 1st conjugation":"flata","a flecari":"flecări","a flecari 4th conjugation":"flecări","a flencani":"flencăni","a flencani 4th conjugation":"flencăni","a flescai":"fleșcăi","a flescai 4th conjugation":"fleșcăi","a flexibiliza":"flexibiliza","a flexibiliza 1st conjugation":"flexibiliza","a flexiona":"flexiona","a flexiona 1st conjugation":"flexiona","a flirta":"flirta","a flirta 1st conjugation":"flirta","a flota":"flota","a flota 1st conjugation":"flota","a fluctua":"fluctua","a fluctua 1st conjugation":"fluctua","a fluidifica":"fluidifica","a fluidifica 1st conjugation":"fluidifica","a fluidiza":"fluidiza","a fluidiza 1st conjugation":"fluidiza","a fluiera":"fluiera","a fluiera 1st conjugation":"fluiera","a fluiera in biserica 1st conjugation":"fluiera în biserică","a fluoriza":"fluoriza","a fluoriza 1st conjugation":"fluoriza","a flustura":"fluștura","a flustura 1st conjugation":"fluștura","a flutura":"flutura","a flutura 1st conjugation":"flutura","a focaliza":"focaliza","a focaliza 1st conjugation":"focaliza","a fofila":"fofila","a fofila 1st conjugation":"fofila","a foi":"foi","a foi 4th conjugation":"foi","a foileta":"foileta","a foileta 1st conjugation":"foileta","a folfai":"folfăi","a folfai 4th conjugation":"folfăi","a folosi":"folosi","a folosi 4th conjugation":"folosi","a fonda":"fonda","a fonda 1st conjugation":"fonda","a fora":"fora","a fora 1st conjugation":"fora","a forfai":"forfăi","a forfai 4th conjugation":"forfăi","a forfeca":"forfeca","a forfeca 1st conjugation":"forfeca","a forfoti":"forfoti","a forfoti 4th conjugation":"forfoti","a forja":"forja","a forja 1st conjugation":"forja","a forma":"forma","a forma 1st conjugation":"forma","a formaliza":"formaliza","a formaliza 1st conjugation":"formaliza","a formata":"formata","a formata 1st conjugation":"formata","a formula":"formula","a formula 1st conjugation":"formula","a fornica":"fornica","a fornica 1st conjugation":"fornica","a forostoi":"forostoi","a forostoi 4th conjugation":"forostoi","a forta":"forța","a forta 1st conjugation":"forța","a fortifica":"fortifica","a fortifica 1st conjugation":"fortifica","a foscai":"foșcăi","a foscai 4th conjugation":"foșcăi","a fosfata":"fosfata","a fosfata 1st conjugation":"fosfata","a fosiliza":"fosiliza","a fosiliza 1st conjugation":"fosiliza","a fosnai":"foșnăi","a fosnai 4th conjugation":"foșnăi","a fosni":"foșni","a fosni 4th conjugation":"foșni","a fotocopia":"fotocopia","a fotocopia 1st conjugation":"fotocopia","a fotografia":"fotografia","a fotografia 1st conjugation":"fotografia","a fractiona":"fracționa","a fractiona 1st conjugation":"fracționa","a fractura":"fractura","a fractura 1st conjugation":"fractura","a fragezi":"frăgezi","a fragezi 4th conjugation":"frăgezi","a fragmenta":"fragmenta","a fragmenta 1st conjugation":"fragmenta","a fraieri":"fraieri","a fraieri 4th conjugation":"fraieri","a framanta":"frământa","a framanta 1st conjugation":"frământa","a frana":"frâna","a frana 1st conjugation":"frâna","a franca":"franca","a franca 1st conjugation":"franca","a franciza":"franciza","a franciza 1st conjugation":"franciza","a frange":"frânge","a frange 3rd conjugation":"frânge","a frangi":"frângi","a frangi 4th conjugation":"frângi","a franjura":"franjura","a franjura 1st conjugation":"franjura","a frantuzi":"franțuzi","a frantuzi 4th conjugation":"franțuzi","a frapa":"frapa","a frapa 1st conjugation":"frapa","a fraterniza":"fraterniza","a fraterniza 1st conjugation":"fraterniza","a frauda":"frauda","a frauda 1st conjugation":"frauda","a fraza":"fraza","a fraza 1st conjugation":"fraza","a freca":"freca","a freca 1st conjugation":"freca","a freca menta 1st conjugation":"freca menta","a frectiona":"frecționa","a frectiona 1st conjugation":"frecționa","a frecventa":"frecventa","a frecventa 1st conjugation":"frecventa","a fredona":"fredona","a fredona 1st conjugation":"fredona","a fremata":"fremăta","a fremata 1st conjugation":"fremăta","a freza":"freza","a freza 1st conjugation":"freza","a frichini":"frichini","a frichini 4th conjugation":"frichini","a fricosa":"fricoșa","a fricosa 1st conjugation":"fricoșa","a frictiona":"fricționa","a frictiona 1st conjugation":"fricționa","a frige":"frige","a frige 3rd conjugation":"frige","a friza":"friza","a friza 1st conjugation":"friza","a fructifica":"fructifica","a fructifica 1st conjugation":"fructifica","a frumuseta":"frumuseța","a frumuseta 1st conjugation":"frumuseța","a frunzari":"frunzări","a frunzari 4th conjugation":"frunzări","a frunzi":"frunzi","a frunzi 4th conjugation":"frunzi","a frustra":"frustra","a frustra 1st conjugation":"frustra","a fuduli":"fuduli","a fuduli 4th conjugation":"fuduli","a fuga":"fuga","a fuga 1st conjugation":"fuga","a fugari":"fugări","a fugari 4th conjugation":"fugări","a fugi":"fugi","a fugi 4th conjugation":"fugi","a fugi ca dracul de tamaie 4th conjugation":"fugi ca dracul de tămâie","a fulgera":"fulgera","a fulgera 1st conjugation":"fulgera","a fulgui":"fulgui","a fulgui 4th conjugation":"fulgui","a fulgura":"fulgura","a fulgura 1st conjugation":"fulgura","a fuma":"fuma","a fuma 1st conjugation":"fuma","a fumega":"fumega","a fumega 1st conjugation":"fumega","a fumiza":"fumiza","a fumiza 1st conjugation":"fumiza","a functiona":"funcționa","a functiona 1st conjugation":"funcționa","a funda":"funda","a funda 1st conjugation":"funda","a fundamenta":"fundamenta","a fundamenta 1st conjugation":"fundamenta","a fundarisi":"fundarisi","a fundarisi 4th conjugation":"fundarisi","a fura":"fura","a fura 1st conjugation":"fura","a fura inima 1st conjugation":"fura inima","a furaja":"furaja","a furaja 1st conjugation":"furaja","a furbisa 1st conjugation":"furbisa","a furgasi":"furgăsi","a furgasi 4th conjugation":"furgăsi","a furisa":"furișa","a furisa 1st conjugation":"furișa","a furlandisi":"furlandisi","a furlandisi 4th conjugation":"furlandisi","a furlua":"furlua","a furlua 1st conjugation":"furlua","a furnica":"furnica","a furnica 1st conjugation":"furnica","a furnirui":"furnirui","a furnirui 4th conjugation":"furnirui","a furniza":"furniza","a furniza 1st conjugation":"furniza","a fute":"fute","a fute 3rd conjugation":"fute","a fuziona":"fuziona","a fuziona 1st conjugation":"fuziona","a gaci":"gâci","a gaci 4th conjugation":"gâci","a gadeli":"gâdeli","a gadeli 4th conjugation":"gâdeli","a gadila":"gâdila","a gadila 1st conjugation":"gâdila","a gadili":"gâdili","a gadili 4th conjugation":"gâdili","a gafa":"gafa","a gafa 1st conjugation":"gafa","a gafai 4th conjugation":"gâfâi","a gafui":"gâfui","a gafui 4th conjugation":"gâfui","a gagai":"gâgâi","a gagai 4th conjugation":"gâgâi","a gaina":"găina","a gaina 1st conjugation":"găina","a gainata":"găinăța","a gainata 1st conjugation":"găinăța","a gaini":"găini","a gaini 4th conjugation":"găini","a gainita":"găinița","a gainita 1st conjugation":"găinița","a gaitani":"găităni","a gaitani 4th conjugation":"găităni","a galagi":"gălăgi","a galagi 4th conjugation":"gălăgi","a galbeji":"gălbeji","a galbeji 4th conjugation":"gălbeji","a galbeni":"gălbeni","a galbeni 4th conjugation":"gălbeni","a galbini":"gălbini","a galbini 4th conjugation":"gălbini","a galcevi":"gâlcevi","a galcevi 4th conjugation":"gâlcevi","a galgai":"gâlgâi","a galgai 4th conjugation":"gâlgâi","a galopa":"galopa","a galopa 1st conjugation":"galopa","a galvaniza":"galvaniza","a galvaniza 1st conjugation":"galvaniza","a gamba":"gâmba","a gamba 1st conjugation":"gâmba","a gamfa":"gâmfa","a gamfa 1st conjugation":"gâmfa","a gandi":"gândi","a gandi 4th conjugation":"gândi","a gangrena":"gangrena","a gangrena 1st conjugation":"gangrena","a ganguri":"gânguri","a ganguri 4th conjugation":"gânguri","a gara":"gara","a gara 1st conjugation":"gara","a garanta":"garanta","a garanta 1st conjugation":"garanta","a gardui":"gărdui","a gardui 4th conjugation":"gărdui","a gargarisi":"gargarisi","a gargarisi 4th conjugation":"gargarisi","a gargariza":"gargariza","a gargariza 1st conjugation":"gargariza","a garnisi":"garnisi","a garnisi 4th conjugation":"garnisi","a gasi":"găsi","a gasi 4th conjugation":"găsi","a gasi de cuviinta 4th conjugation":"găsi de cuviință","a gata":"găta","a gata 1st conjugation":"găta","a gati":"găti","a gati 4th conjugation":"găti","a gatui":"gâtui","a gatui 4th conjugation":"gâtui","a gaunosi":"găunoși","a gaunosi 4th conjugation":"găunoși","a gauri":"găuri","a gauri 4th conjugation":"găuri","a gavozdi":"găvozdi","a gavozdi 4th conjugation":"găvozdi","a gaza":"gaza","a gaza 1st conjugation":"gaza","a gazdui":"găzdui","a gazdui 4th conjugation":"găzdui","a gazeifica":"gazeifica","a gazeifica 1st conjugation":"gazeifica","a gazifica":"gazifica","a gazifica 1st conjugation":"gazifica","a gazona":"gazona","a gazona 1st conjugation":"gazona","a gelapi":"gelăpi","a gelapi 4th conjugation":"gelăpi","a gelatiniza":"gelatiniza","a gelatiniza 1st conjugation":"gelatiniza","a gelifica":"gelifica","a gelifica 1st conjugation":"gelifica","a geme":"geme","a geme 3rd conjugation":"geme","a genera":"genera","a genera 1st conjugation":"genera","a generaliza":"generaliza","a generaliza 1st conjugation":"generaliza","a geometriza":"geometriza","a geometriza 1st conjugation":"geometriza","a gera":"gera","a gera 1st conjugation":"gera","a germaniza":"germaniza","a germaniza 1st conjugation":"germaniza","a germina":"germina","a germina 1st conjugation":"germina","a gerui":"gerui","a gerui 4th conjugation":"gerui","a gesticula":"gesticula","a gesticula 1st conjugation":"gesticula","a gestiona":"gestiona","a gestiona 1st conjugation":"gestiona","a ghebosi":"gheboși","a ghebosi 4th conjugation":"gheboși","a ghemui":"ghemui","a ghemui 4th conjugation":"ghemui","a ghera":"ghera","a ghera 1st conjugation":"ghera","a gheura":"gheura","a gheura 1st conjugation":"gheura","a ghici":"ghici","a ghici 4th conjugation":"ghici","a ghida":"ghida","a ghida 1st conjugation":"ghida","a ghiemali":"ghiemăli","a ghiemali 4th conjugation":"ghiemăli","a ghiftui":"ghiftui","a ghiftui 4th conjugation":"ghiftui","a ghilosa":"ghiloșa","a ghilosa 1st conjugation":"ghiloșa","a ghilotina":"ghilotina","a ghilotina 1st conjugation":"ghilotina","a ghionti":"ghionti","a ghionti 4th conjugation":"ghionti","a ghiontui":"ghiontui","a ghiontui 4th conjugation":"ghiontui","a ghiorai":"ghiorăi","a ghiorai 4th conjugation":"ghiorăi","a ghiortai":"ghiorțăi","a ghiortai 4th conjugation":"ghiorțăi","a gigantiza":"gigantiza","a gigantiza 1st conjugation":"gigantiza","a gilalui":"gilălui","a gilalui 4th conjugation":"gilălui","a gini":"gini","a gini 4th conjugation":"gini","a gira":"gira","a gira 1st conjugation":"gira","a giugiuli":"giugiuli","a giugiuli 4th conjugation":"giugiuli","a giulgiui":"giulgiui","a giulgiui 4th conjugation":"giulgiui","a glantui":"glănțui","a glantui 4th conjugation":"glănțui","a glasa":"glasa","a glasa 1st conjugation":"glasa","a glasui":"glăsui","a glasui 4th conjugation":"glăsui","a glazura":"glazura","a glazura 1st conjugation":"glazura","a glisa":"glisa","a glisa 1st conjugation":"glisa","a globaliza":"globaliza","a globaliza 1st conjugation":"globaliza","a glorifica":"glorifica","a glorifica 1st conjugation":"glorifica","a glumi":"glumi","a glumi 4th conjugation":"glumi","a gofra":"gofra","a gofra 1st conjugation":"gofra","a gogoli":"gogoli","a gogoli 4th conjugation":"gogoli","a goli":"goli","a goli 4th conjugation":"goli","a gologani":"gologăni","a gologani 4th conjugation":"gologăni","a gonfla":"gonfla","a gonfla 1st conjugation":"gonfla","a gonguri":"gonguri","a gonguri 4th conjugation":"gonguri","a goni":"goni","a goni 4th conjugation":"goni","a gospodari":"gospodări","a gospodari 4th conjugation":"gospodări","a gotovi":"gotovi","a gotovi 4th conjugation":"gotovi","a grabi":"grăbi","a grabi 4th conjugation":"grăbi","a grada":"grada","a grada 1st conjugation":"grada","a gradinari":"grădinări","a gradinari 4th conjugation":"grădinări","a gradua":"gradua","a gradua 1st conjugation":"gradua","a grafitiza":"grafitiza","a grafitiza 1st conjugation":"grafitiza","a grai":"grăi","a grai 4th conjugation":"grăi","a gramaticaliza":"gramaticaliza","a gramaticaliza 1st conjugation":"gramaticaliza","a granula":"granula","a granula 1st conjugation":"granula","a grapa":"grăpa","a grapa 1st conjugation":"grăpa","a graseia":"graseia","a graseia 1st conjugation":"graseia","a gratia":"grația","a gratia 1st conjugation":"grația","a gratifica":"gratifica","a gratifica 1st conjugation":"gratifica","a gratina":"gratina","a gratina 1st conjugation":"gratina","a gratula":"gratula","a gratula 1st conjugation":"gratula","a grava":"grava","a grava 1st conjugation":"grava","a gravita":"gravita","a gravita 1st conjugation":"gravita","a grea":"grea","a grea 1st conjugation":"grea","a grebla":"grebla","a grebla 1st conjugation":"grebla","a greciza":"greciza","a greciza 1st conjugation":"greciza","a grefa":"grefa","a grefa 1st conjugation":"grefa","a gresa":"gresa","a gresa 1st conjugation":"gresa","a gresi":"greși","a gresi 4th conjugation":"greși","a greva":"greva","a greva 1st conjugation":"greva","a griji":"griji","a griji 4th conjugation":"griji","a grima":"grima","a grima 1st conjugation":"grima","a grindina":"grindina","a grindina 1st conjugation":"grindina","a griza":"griza","a griza 1st conjugation":"griza","a grizona":"grizona","a grizona 1st conjugation":"grizona","a grohai":"grohăi","a grohai 4th conjugation":"grohăi","a grozavi":"grozăvi","a grozavi 4th conjugation":"grozăvi","a grumura":"grumura","a grumura 1st conjugation":"grumura","a grupa":"grupa","a grupa 1st conjugation":"grupa","a gudrona":"gudrona","a gudrona 1st conjugation":"gudrona","a gudura":"gudura","a gudura 1st conjugation":"gudura","a gugiuli":"gugiuli","a gugiuli 4th conjugation":"gugiuli","a guita":"guița","a guita 1st conjugation":"guița","a guma":"guma","a guma 1st conjugation":"guma","a gunguni":"gunguni","a gunguni 4th conjugation":"gunguni","a gunguri":"gunguri","a gunguri 4th conjugation":"gunguri","a gunoia":"gunoia","a gunoia 1st conjugation":"gunoia","a gurai":"gurăi","a gurai 4th conjugation":"gurăi","a gusta":"gusta","a gusta 1st conjugation":"gusta","a guverna":"guverna","a guverna 1st conjugation":"guverna","a habuci":"hăbuci","a habuci 4th conjugation":"hăbuci","a hacui":"hăcui","a hacui 4th conjugation":"hăcui","a hai":"hâi","a hai 4th conjugation":"hâi","a haiduci":"haiduci","a haiduci 4th conjugation":"haiduci","a haini":"hăini","a haini 4th conjugation":"hăini","a haitui":"hăitui","a haitui 4th conjugation":"hăitui","a halacai":"hălăcăi","a halacai 4th conjugation":"hălăcăi","a halalai":"hălălăi","a halalai 4th conjugation":"hălălăi","a hali":"hali","a hali 4th conjugation":"hali","a halogena":"halogena","a halogena 1st conjugation":"halogena","a halucina":"halucina","a halucina 1st conjugation":"halucina","a hamai":["a hâmâi","hâmâi","a hămăi","hămăi"],"a hamai 4th conjugation":["a hâmâi 4th conjugation","hâmâi","a hămăi 4th conjugation","hămăi"],"a hamesi":"hămesi","a hamesi 4th conjugation":"hămesi","a hamisi":"hămisi","a hamisi 4th conjugation":"hămisi","a hamletiza":"hamletiza","a hamletiza 1st conjugation":"hamletiza","a hamui":"hămui","a hamui 4th conjugation":"hămui","a handicapa":"handicapa","a handicapa 1st conjugation":"handicapa","a hapai":"hăpăi","a hapai 4th conjugation":"hăpăi","a haraci":"hărăci","a haraci 4th conjugation":"hărăci","a haracsi":"hărăcsi","a haracsi 4th conjugation":"hărăcsi","a haragi":"hărăgi","a haragi 4th conjugation":"hărăgi","a harai":"hârâi","a harai 4th conjugation":"hârâi","a harani":"hărăni","a harani 4th conjugation":"hărăni","a harazi":"hărăzi","a harazi 4th conjugation":"hărăzi","a harbui":"hârbui","a harbui 4th conjugation":"hârbui","a harcai":"hârcăi","a harcai 4th conjugation":"hârcăi","a harcati":"hărcăti","a harcati 4th conjugation":"hărcăti","a harjai":"hârjâi","a harjai 4th conjugation":"hârjâi","a harjoni":"hârjoni","a harjoni 4th conjugation":"hârjoni","a harnasa":"harnașa","a harnasa 1st conjugation":"harnașa","a harnici":"hărnici","a harnici 4th conjugation":"hărnici","a harsai":"hârșâi","a harsai 4th conjugation":"hârșâi","a harscai":"hârșcâi","a harscai 4th conjugation":"hârșcâi","a harsii":"hârșii","a harsii 4th conjugation":"hârșii","a harsni":"hârșni","a harsni 4th conjugation":"hârșni","a harsti":"hărști","a harsti 4th conjugation":"hărști","a hartui":["a hartui","hartui","a hârțui","hârțui","a hărțui","hărțui"],"a hartui 4th conjugation":["a hartui 4th conjugation","hartui","a hârțui 4th conjugation","hârțui","a hărțui 4th conjugation","hărțui"],"a hasura":"hașura","a hasura 1st conjugation":"hașura","a hatai":"hâțâi","a hatai 4th conjugation":"hâțâi","a hatana":"hâțâna","a hatana 1st conjugation":"hâțâna","a hatcai":"hâtcâi","a hatcai 4th conjugation":"hâtcâi","a hatui":"hățui","a hatui 4th conjugation":"hățui","a haui":"hăui","a haui 4th conjugation":"hăui","a hauli":"hăuli","a hauli 4th conjugation":"hăuli","a hazarda":"hazarda","a hazarda 1st conjugation":"hazarda","a hazi":"hâzi","a hazi 4th conjugation":"hâzi","a hecela":"hecela","a hecela 1st conjugation":"hecela","a heretisi":"heretisi","a heretisi 4th conjugation":"heretisi","a hiberna":"hiberna","a hiberna 1st conjugation":"hiberna","a hibrida":"hibrida","a hibrida 1st conjugation":"hibrida","a hibridiza":"hibridiza","a hibridiza 1st conjugation":"hibridiza","a hidrata":"hidrata","a hidrata 1st conjugation":"hidrata","a hidrofiliza":"hidrofiliza","a hidrofiliza 1st conjugation":"hidrofiliza","a hidrogena":"hidrogena","a hidrogena 1st conjugation":"hidrogena","a hidroizola":"hidroizola","a hidroizola 1st conjugation":"hidroizola","a hidroliza":"hidroliza","a hidroliza 1st conjugation":"hidroliza","a hidroplana":"hidroplana","a hidroplana 1st conjugation":"hidroplana","a hihoti":"hihoti","a hihoti 4th conjugation":"hihoti","a hingheri":"hingheri","a hingheri 4th conjugation":"hingheri","a hiperboliza":"hiperboliza","a hiperboliza 1st conjugation":"hiperboliza","a hipersensibiliza":"hipersensibiliza","a hipersensibiliza 1st conjugation":"hipersensibiliza","a hipertrofia":"hipertrofia","a hipertrofia 1st conjugation":"hipertrofia","a hipnotiza":"hipnotiza","a hipnotiza 1st conjugation":"hipnotiza","a hiritisi":"hiritisi","a hiritisi 4th conjugation":"hiritisi","a hirotoni":"hirotoni","a hirotoni 4th conjugation":"hirotoni","a hirotonisi":"hirotonisi","a hirotonisi 4th conjugation":"hirotonisi","a hirotonosi":"hirotonosi","a hirotonosi 4th conjugation":"hirotonosi","a hodini":"hodini","a hodini 4th conjugation":"hodini","a hodorogi":"hodorogi","a hodorogi 4th conjugation":"hodorogi","a hoheri":"hoheri","a hoheri 4th conjugation":"hoheri","a hohoti":"hohoti","a hohoti 4th conjugation":"hohoti","a hoinari":"hoinări","a hoinari 4th conjugation":"hoinări","a holba":"holba","a holba 1st conjugation":"holba","a hondrani":"hondrăni","a hondrani 4th conjugation":"hondrăni","a hopai":"hopăi","a hopai 4th conjugation":"hopăi","a horai":"horăi","a horai 4th conjugation":"horăi","a horcai":"horcăi","a horcai 4th conjugation":"horcăi","a horcani":"horcăni","a horcani 4th conjugation":"horcăni","a horhai":"horhăi","a horhai 4th conjugation":"horhăi","a hori":"hori","a hori 4th conjugation":"hori","a horipila":"horipila","a horipila 1st conjugation":"horipila","a horopsi":"horopsi","a horopsi 4th conjugation":"horopsi","a hotari":"hotărî","a hotari 4th conjugation":"hotărî","a hotarnici":"hotărnici","a hotarnici 4th conjugation":"hotărnici","a hoti":"hoți","a hoti 4th conjugation":"hoți","a hraconi":"hraconi","a hraconi 4th conjugation":"hraconi","a hrani":"hrăni","a hrani 4th conjugation":"hrăni","a hrapi":"hrăpi","a hrapi 4th conjugation":"hrăpi","a hrentui":"hrentui","a hrentui 4th conjugation":"hrentui","a hrepcui":"hrepcui","a hrepcui 4th conjugation":"hrepcui","a huhura":"huhura","a huhura 1st conjugation":"huhura","a huhureza":"huhureza","a huhureza 1st conjugation":"huhureza","a huidui":"huidui","a huidui 4th conjugation":"huidui","a huli":"huli","a huli 4th conjugation":"huli","a hultui":"hultui","a hultui 4th conjugation":"hultui","a hului":"hului","a hului 4th conjugation":"hului","a hurduca":"hurduca","a hurduca 1st conjugation":"hurduca","a hurducai":"hurducăi","a hurducai 4th conjugation":"hurducăi","a hurui":"hurui","a hurui 4th conjugation":"hurui","a hutupi":"hutupi","a hutupi 4th conjugation":"hutupi","a huzuri":"huzuri","a huzuri 4th conjugation":"huzuri","a jacmani":"jăcmăni","a jacmani 4th conjugation":"jăcmăni","a jacui":"jăcui","a jacui 4th conjugation":"jăcui","a jalona":"jalona","a jalona 1st conjugation":"jalona","a jari":"jări","a jari 4th conjugation":"jări","a jarui":"jărui","a jarui 4th conjugation":"jărui","a javeliza":"javeliza","a javeliza 1st conjugation":"javeliza","a jecmani":"jecmăni","a jecmani 4th conjugation":"jecmăni","a jecui":"jecui","a jecui 4th conjugation":"jecui","a jefui":"jefui","a jefui 4th conjugation":"jefui","a jeli":"jeli","a jeli 4th conjugation":"jeli","a jelui":"jelui","a jelui 4th conjugation":"jelui","a jena":"jena","a jena 1st conjugation":"jena","a jerpeli":"jerpeli","a jerpeli 4th conjugation":"jerpeli","a jertfi":"jertfi","a jertfi 4th conjugation":"jertfi","a jertfui":"jertfui","a jertfui 4th conjugation":"jertfui","a jerui":"jerui","a jerui 4th conjugation":"jerui","a jicni":"jicni","a jicni 4th conjugation":"jicni","a jigari":"jigări","a jigari 4th conjugation":"jigări","a jigni":"jigni","a jigni 4th conjugation":"jigni","a jilavi":"jilăvi","a jilavi 4th conjugation":"jilăvi","a jindui":"jindui","a jindui 4th conjugation":"jindui","a jnapai":"jnăpăi","a jnapai 4th conjugation":"jnăpăi","a jongla":"jongla","a jongla 1st conjugation":"jongla","a jubila":"jubila","a jubila 1st conjugation":"jubila","a juca":"juca","a juca 1st conjugation":"juca","a judeca":"judeca","a judeca 1st conjugation":"judeca","a judeci":"judeci","a judeci 4th conjugation":"judeci","a jugani":"jugăni","a jugani 4th conjugation":"jugăni","a jugula":"jugula","a jugula 1st conjugation":"jugula","a juisa":"juisa","a juisa 1st conjugation":"juisa","a juli":"juli","a juli 4th conjugation":"juli","a jumatati":"jumătăți","a jumatati 4th conjugation":"jumătăți","a jumuli":"jumuli","a jumuli 4th conjugation":"jumuli","a junghia":"junghia","a junghia 1st conjugation":"junghia","a jupi":"jupi","a jupi 4th conjugation":"jupi","a jupui":"jupui","a jupui 4th conjugation":"jupui","a jura":"jura","a jura 1st conjugation":"jura","a juriza":"juriza","a juriza 1st conjugation":"juriza","a jurui":"jurui","a jurui 4th conjugation":"jurui","a justifica":"justifica","a justifica 1st conjugation":"justifica","a juxtapune":"juxtapune","a juxtapune 3rd conjugation":"juxtapune","a kilometra":"kilometra","a kilometra 1st conjugation":"kilometra","a knockouta":"knockouta","a knockouta 1st conjugation":"knockouta","a la":"la","a la 1st conjugation":"la","a labadui":"lăbădui","a labadui 4th conjugation":"lăbădui","a labarta":"lăbărța","a labarta 1st conjugation":"lăbărța","a labializa":"labializa","a labializa 1st conjugation":"labializa","a labora":"labora","a labora 1st conjugation":"labora","a lacatui":"lăcătui","a lacatui 4th conjugation":"lăcătui","a lacera":"lacera","a lacera 1st conjugation":"lacera","a lacomi":"lăcomi","a lacomi 4th conjugation":"lăcomi","a lacrama":"lăcrăma","a lacrama 1st conjugation":"lăcrăma","a lacrima":"lăcrima","a lacrima 1st conjugation":"lăcrima","a lacui":"lăcui","a lacui 4th conjugation":"lăcui","a lafai":"lăfăi","a lafai 4th conjugation":"lăfăi","a lahtarisi":"lahtarisi","a lahtarisi 4th conjugation":"lahtarisi","a laiciza":"laiciza","a laiciza 1st conjugation":"laiciza","a lainici":"lăinici","a lainici 4th conjugation":"lăinici","a lamatisi":"lamatisi","a lamatisi 4th conjugation":"lamatisi","a lambicarisi":"lambicarisi","a lambicarisi 4th conjugation":"lambicarisi","a lambrisa":"lambrisa","a lambrisa 1st conjugation":"lambrisa","a lamenta":"lamenta","a lamenta 1st conjugation":"lamenta","a lamina":"lamina","a lamina 1st conjugation":"lamina","a lamuri":"lămuri","a lamuri 4th conjugation":"lămuri","a lancezi":"lâncezi","a lancezi 4th conjugation":"lâncezi","a langui":"langui","a langui 4th conjugation":"langui","a lansa":"lansa","a lansa 1st conjugation":"lansa","a lantui":"lănțui","a lantui 4th conjugation":"lănțui","a lapada":"lăpăda","a lapada 1st conjugation":"lăpăda","a lapai":"lăpăi","a lapai 4th conjugation":"lăpăi","a lapida":"lapida","a lapida 1st conjugation":"lapida","a lapovita":"lapovița","a lapovita 1st conjugation":"lapovița","a lapta":"lăpta","a lapta 1st conjugation":"lăpta","a laptuci":"lăptuci","a laptuci 4th conjugation":"lăptuci","a largi":"lărgi","a largi 4th conjugation":"lărgi","a larmui":"lărmui","a larmui 4th conjugation":"lărmui","a lasa":"lăsa","a lasa 1st conjugation":"lăsa","a lasa balta 1st conjugation":"lăsa baltă","a lasa in pace 1st conjugation":"lăsa în pace","a lasa in pom 1st conjugation":"lăsa în pom","a lasa loc de buna ziua 1st conjugation":"lăsa loc de bună ziua","a lastari":"lăstări","a lastari 4th conjugation":"lăstări","a lasti":"lăsti","a lasti 4th conjugation":"lăsti","a lati":"lăți","a lati 4th conjugation":"lăți","a latini":"latini","a latini 4th conjugation":"latini","a latiniza":"latiniza","a latiniza 1st conjugation":"latiniza","a latra":"lătra","a latra 1st conjugation":"lătra","a latura":"lătura","a latura 1st conjugation":"lătura","a lauda":"lăuda","a lauda 1st conjugation":"lăuda","a lauzi":"lăuzi","a lauzi 4th conjugation":"lăuzi","a lectura":"lectura","a lectura 1st conjugation":"lectura","a lecui":"lecui","a lecui 4th conjugation":"lecui","a lefteri":"lefteri","a lefteri 4th conjugation":"lefteri","a lega":"lega","a lega 1st conjugation":"lega","a legaliza":"legaliza","a legaliza 1st conjugation":"legaliza","a legana":"legăna","a legana 1st conjugation":"legăna","a legatui":"legatui","a legatui 4th conjugation":"legatui","a legifera":"legifera","a legifera 1st conjugation":"legifera","a legionariza":"legionariza","a legionariza 1st conjugation":"legionariza","a legisla":"legisla","a legisla 1st conjugation":"legisla","a legitima":"legitima","a legitima 1st conjugation":"legitima","a legitimiza":"legitimiza","a legitimiza 1st conjugation":"legitimiza","a legiui":"legiui","a legiui 4th conjugation":"legiui","a lehai":"lehăi","a lehai 4th conjugation":"lehăi","a lehameti":["a lehămeti","lehămeti","a lehămeți","lehămeți"],"a lehameti 4th conjugation":["a lehămeti 4th conjugation","lehămeti","a lehămeți 4th conjugation","lehămeți"],"a lehametisi":"lehămetisi","a lehametisi 4th conjugation":"lehămetisi","a lehametui":"lehămetui","a lehametui 4th conjugation":"lehămetui","a lehuzi":"lehuzi","a lehuzi 4th conjugation":"lehuzi","a lenevi":"lenevi","a lenevi 4th conjugation":"lenevi","a leopai":"leopăi","a leopai 4th conjugation":"leopăi","a leorbai":"leorbăi","a leorbai 4th conjugation":"leorbăi","a lepada":"lepăda","a lepada 1st conjugation":"lepăda","a lepai":"lepăi","a lepai 4th conjugation":"lepăi","a lesina":"leșina","a lesina 1st conjugation":"leșina","a lesta":"lesta","a lesta 1st conjugation":"lesta","a lesui":"leșui","a lesui 4th conjugation":"leșui","a leviga":"leviga","a leviga 1st conjugation":"leviga","a lexicaliza":"lexicaliza","a lexicaliza 1st conjugation":"lexicaliza","a leza":"leza","a leza 1st conjugation":"leza","a libela":"libela","a libela 1st conjugation":"libela","a libera":"libera","a libera 1st conjugation":"libera","a liberaliza":"liberaliza","a liberaliza 1st conjugation":"liberaliza","a licari":"licări","a licari 4th conjugation":"licări","a licentia":"licenția","a licentia 1st conjugation":"licenția","a lichefia":"lichefia","a lichefia 1st conjugation":"lichefia","a lichida":"lichida","a lichida 1st conjugation":"lichida","a licita":"licita","a licita 1st conjugation":"licita","a licura":"licura","a licura 1st conjugation":"licura","a licuri":"licuri","a licuri 4th conjugation":"licuri","a lifera":"lifera","a lifera 1st conjugation":"lifera","a lignifica":"lignifica","a lignifica 1st conjugation":"lignifica","a lihai":"lihăi","a lihai 4th conjugation":"lihăi","a limbuti":"limbuți","a limbuti 4th conjugation":"limbuți","a limita":"limita","a limita 1st conjugation":"limita","a limpezi":"limpezi","a limpezi 4th conjugation":"limpezi","a linciuri":"linciuri","a linciuri 4th conjugation":"linciuri","a lingari":"lingări","a lingari 4th conjugation":"lingări","a linge":"linge","a linge 3rd conjugation":"linge","a lingusi":"linguși","a lingusi 4th conjugation":"linguși","a linia":"linia","a linia 1st conjugation":"linia","a linisti":"liniști","a linisti 4th conjugation":"liniști","a linsa":"linșa","a linsa 1st conjugation":"linșa","a liofiliza":"liofiliza","a liofiliza 1st conjugation":"liofiliza","a lipi":"lipi","a lipi 4th conjugation":"lipi","a lipsi":"lipsi","a lipsi 4th conjugation":"lipsi","a liriciza":"liriciza","a liriciza 1st conjugation":"liriciza","a lista":"lista","a lista 1st conjugation":"lista","a litera":"litera","a litera 1st conjugation":"litera","a literariza":"literariza","a literariza 1st conjugation":"literariza","a literaturiza":"literaturiza","a literaturiza 1st conjugation":"literaturiza","a litografia":"litografia","a litografia 1st conjugation":"litografia","a livra":"livra","a livra 1st conjugation":"livra","a loba":"loba","a loba 1st conjugation":"loba","a localiza":"localiza","a localiza 1st conjugation":"localiza","a locui":"locui","a locui 4th conjugation":"locui","a loga":"loga","a loga 1st conjugation":"loga","a logaritma":"logaritma","a logaritma 1st conjugation":"logaritma","a logodi":"logodi","a logodi 4th conjugation":"logodi","a lombarda":"lombarda","a lombarda 1st conjugation":"lombarda","a lopata":"lopăta","a lopata 1st conjugation":"lopăta","a lotiona":"loționa","a lotiona 1st conjugation":"loționa","a lotiza":"lotiza","a lotiza 1st conjugation":"lotiza","a lotri":"lotri","a lotri 4th conjugation":"lotri","a lovi":"lovi","a lovi 4th conjugation":"lovi","a lua":"lua","a lua 1st conjugation":"lua","a lua caimacul 1st conjugation":"lua caimacul","a lua de bun 1st conjugation":"lua de bun","a lua de-a gata 1st conjugation":"lua de-a gata","a lua in consideratie 1st conjugation":"lua în considerație","a lua in seama":"lua în seamă","a lua in seama 1st conjugation":"lua în seamă","a lua la pula":"lua la pulă"};
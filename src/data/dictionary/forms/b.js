@@ -0,0 +1 @@
+export default {"bababai":"babaie","bababaii":"babaie","bababailor":"babaie","babachii":["babachii","babacă","băbachii","băbacă"],"babaci":["babaci","babac","babaci","babacă","băbaci","băbacă"],"babacii":["babacii","babac","babacii","babacă","băbacii","băbacă"],"babacilor":["babacilor","babac","babacilor","babacă","băbacilor","băbacă"],"babaciunea":"băbăciune","babaciuni":"băbăciune","babaciunii":"băbăciune","babaciunile":"băbăciune","babaciunilor":"băbăciune","babacul":"babac","babacule":"babac","babacului":"babac","babacuti":"băbăcuță","babacutii":"băbăcuță","babacutilor":"băbăcuță","babaieul":"babaie","babaieule":"babaie","babaieului":"babaie","babaitaul":"băbăiță","babaitaule":"băbăiță","babaitaului":"băbăiță","babaiti":"băbăiță","babaitii":"băbăiță","babaitilor":"băbăiță","babalaci":"babalâc","babalacii":"babalâc","babalacilor":"babalâc","babalacul":"babalâc","babalacule":"babalâc","babalacului":"babalâc","babalic":["babalîc","Babalâc","babalîc","babalâc"],"babana":["babană","baban","babana","baban","băbană","băban","băbana","băban"],"babane":["babane","baban","băbane","băban"],"babanele":["babanele","baban","băbanele","băban"],"babani":["babani","baban","băbani","băban"],"babanii":["babanii","baban","băbanii","băban"],"babanul":["babanul","baban","băbanul","băban"],"babardea":"babardi","babardeai":"babardi","babardeam":"babardi","babardeati":"babardi","babardeau":"babardi","babardeli":"babardeală","babardelii":"babardeală","babardelile":"babardeală","babardelilor":"babardeală","babardesc":"babardi","babardeste":"babardi","babardesti":"babardi","babardii":"babardi","babardim":"babardi","babardind":"babardi","babardira":"babardi","babardiram":"babardi","babardirati":"babardi","babardise":"babardi","babardisem":"babardi","babardisera":"babardi","babardiseram":"babardi","babardiserati":"babardi","babardisesi":"babardi","babardisi":"babardi","babardit":"babardi","babarditi":"babardi","babaroase":["babaroase","babaroasă","babaroase","babaros"],"babaroasei":"babaroasă","babaroasele":["babaroasele","babaroasă","babaroasele","babaros"],"babaroaselor":["babaroaselor","babaroasă","babaroaselor","babaros"],"babaroii":"babaroi","babaroilor":"babaroi","babaroiul":"babaroi","babaroiule":"babaroi","babaroiului":"babaroi","babarosul":"babaros","babarosule":"babaros","babarosului":"babaros","babascute":"băbășcuță","babascutei":"băbășcuță","babascutele":"băbășcuță","babascutelor":"băbășcuță","babatia":"băbătie","babatiei":"băbătie","babatii":"băbătie","babatiile":"băbătie","babatiilor":"băbătie","babe":"babă","babeasca":["băbească","băbesc","băbeasca","băbesc"],"babei":"babă","babele":"babă","babelica":["babelică","babelic","babelica","babelic"],"babelice":"babelic","babelicele":"babelic","babelici":"babelic","babelicii":"babelic","babelicul":"babelic","babelor":"babă","babescul":"băbesc","babesti":"băbesc","babestii":"băbesc","babestile":"băbesc","babete":"babetă","babetei":"babetă","babetele":"babetă","babetelor":"babetă","babeteul":"babete","babeteule":"babete","babeteului":"babete","babeti":"babete","babetii":"babete","babetilor":"babete","babici":"băbică","babicii":"băbică","babicile":"băbică","babicilor":"băbică","babiloneance":"babiloneancă","babiloneancei":"babiloneancă","babiloneancele":"babiloneancă","babiloneancelor":"babiloneancă","babiloneasca":["babilonească","babilonesc","babiloneasca","babilonesc"],"babilonene":"babiloneană","babilonenei":"babiloneană","babilonenele":"babiloneană","babilonenelor":"babiloneană","babilonescul":"babilonesc","babilonesti":"babilonesc","babilonestii":"babilonesc","babilonestile":"babilonesc","babilonia":"babilonie","babiloniana":["babiloniană","babilonian","babiloniana","babilonian"],"babilonianul":"babilonian","babilonianule":"babilonian","babilonianului":"babilonian","babilonica":["babilonică","babilonic","babilonica","babilonic"],"babilonice":"babilonic","babilonicele":"babilonic","babilonici":"babilonic","babilonicii":"babilonic","babilonicul":"babilonic","babiloniei":"babilonie","babilonience":"babiloneancă","babiloniene":["babiloniene","babilonian","babiloniene","babiloniană"],"babilonienei":"babiloniană","babilonienele":["babilonienele","babilonian","babilonienele","babiloniană"],"babilonienelor":"babiloniană","babilonieni":"babilonian","babilonienii":"babilonian","babilonienilor":"babilonian","babilonii":"babilonie","babiloniile":"babilonie","babiloniilor":"babilonie","babiruse":"babirusă","babirusei":"babirusă","babirusele":"babirusă","babiruselor":"babirusă","babite":["babițe","babiță","băbițe","băbiță"],"babitei":["babiței","babiță","băbiței","băbiță"],"babitele":["babițele","babiță","băbițele","băbiță"],"babitelor":["babițelor","babiță","băbițelor","băbiță"],"baboane":"babon","baboanele":"babon","baboanelor":"babon","baboiasi":"baboiaș","baboiasii":"baboiaș","baboiasilor":"baboiaș","baboiasul":"baboiaș","baboiasule":"baboiaș","baboiasului":"baboiaș","baboii":["baboii","baboi","băboii","băboi"],"baboilor":["baboilor","baboi","băboilor","băboi"],"baboiul":["baboiul","baboi","băboiul","băboi"],"baboiule":["baboiule","baboi","băboiule","băboi"],"baboiului":["baboiului","baboi","băboiului","băboi"],"babonul":"babon","babonule":"babon","babonului":"babon","babordul":"babord","babordule":"babord","babordului":"babord","baborduri":"babord","babordurile":"babord","babordurilor":"babord","babornite":"băborniță","babornitei":"băborniță","babornitele":"băborniță","babornitelor":"băborniță","babuci":"băbucă","babucii":"băbucă","babucile":"băbucă","babucilor":"băbucă","babui":"băbuie","babuia":"băbuie","babuii":"băbuie","babuile":"băbuie","babuilor":"băbuie","babuini":"babuin","babuinii":"babuin","babuinilor":"babuin","babuinul":"babuin","babuinule":"babuin","babuinului":"babuin","babure":"babură","baburei":"babură","baburele":"babură","baburelor":"babură","babusii":"babuși","babusilor":"babuși","babuste":["babuște","babușcă","băbuște","băbușcă"],"babustei":["babuștei","babușcă","băbuștei","băbușcă"],"babustele":["babuștele","babușcă","băbuștele","băbușcă"],"babustelor":["babuștelor","babușcă","băbuștelor","băbușcă"],"babusti":"băbușcă","babute":"băbuță","babutei":"băbuță","babutele":"băbuță","babutelor":"băbuță","babuti":"băbuț","babutii":"băbuț","babutilor":"băbuț","babutul":"băbuț","babutule":"băbuț","babutului":"băbuț","babuvisme":"babuvism","babuvismele":"babuvism","babuvismelor":"babuvism","babuvismul":"babuvism","babuvismule":"babuvism","babuvismului":"babuvism","babuvista":["babuvistă","babuvist","babuvista","babuvist"],"babuviste":"babuvist","babuvistele":"babuvist","babuvisti":"babuvist","babuvistii":"babuvist","babuvistilor":"babuvist","babuvistul":"babuvist","babuvistule":"babuvist","babuvistului":"babuvist","babysittera":"babysitter","babysittere":"babysitter","babysitterei":"babysitter","babysitterele":"babysitter","babysitterelor":"babysitter","babysitteri":"babysitter","babysitterii":"babysitter","babysitterilor":"babysitter","babysitterul":"babysitter","babysitterule":"babysitter","babysitterului":"babysitter","bac":"bacalaureat","bacalamul":"bacalâm","bacalamule":"bacalâm","bacalamului":"bacalâm","bacalamuri":"bacalâm","bacalamurile":"bacalâm","bacalamurilor":"bacalâm","bacalaureate":["bacalaureate","bacalaureat","bacalaureate","bacalaureată"],"bacalaureatei":"bacalaureată","bacalaureatele":["bacalaureatele","bacalaureat","bacalaureatele","bacalaureată"],"bacalaureatelor":["bacalaureatelor","bacalaureat","bacalaureatelor","bacalaureată"],"bacalaureati":"bacalaureat","bacalaureatii":"bacalaureat","bacalaureatilor":"bacalaureat","bacalaureatul":"bacalaureat","bacalaureatule":"bacalaureat","bacalaureatului":"bacalaureat","bacalbasaul":"bacalbașă","bacalbasaule":"bacalbașă","bacalbasaului":"bacalbașă","bacalbasi":"bacalbașă","bacalbasii":"bacalbașă","bacalbasilor":"bacalbașă","bacali":"bacal","bacalia":"băcălie","bacaliei":"băcălie","bacalii":["bacalii","bacal","băcălii","băcălie"],"bacaliile":"băcălie","bacaliilor":"băcălie","bacalilor":"bacal","bacalul":"bacal","bacalule":"bacal","bacalului":"bacal","bacanala":["bacanală","bacanal","bacanala","bacanal"],"bacanale":["bacanale","bacanal","bacanale","bacanală"],"bacanalei":"bacanală","bacanalele":["bacanalele","bacanal","bacanalele","bacanală"],"bacanalelor":"bacanală","bacanali":"bacanal","bacanalii":"bacanal","bacanalul":"bacanal","bacane":"băcan","bacaneasca":["băcănească","băcănesc","băcăneasca","băcănesc"],"bacanele":"băcan","bacanelor":"băcan","bacanescul":"băcănesc","bacanese":"băcăneasă","bacanesei":"băcăneasă","bacanesele":"băcăneasă","bacaneselor":"băcăneasă","bacanesti":"băcănesc","bacanestii":"băcănesc","bacanestile":"băcănesc","bacania":"băcănie","bacaniei":"băcănie","bacanii":"băcănie","bacaniile":"băcănie","bacaniilor":"băcănie","bacanimea":"băcănime","bacanimi":"băcănime","bacanimii":"băcănime","bacanimile":"băcănime","bacanimilor":"băcănime","bacanioare":"băcănioară","bacanioarei":"băcănioară","bacanioarele":"băcănioară","bacanioarelor":"băcănioară","bacanite":"băcăniță","bacanitei":"băcăniță","bacanitele":"băcăniță","bacanitelor":"băcăniță","bacante":"bacantă","bacantei":"bacantă","bacantele":"bacantă","bacantelor":"bacantă","bacanul":"băcan","bacanule":"băcan","bacanului":"băcan","bacaraua":"bacara","bacauance":"băcăuancă","bacauancei":"băcăuancă","bacauancele":"băcăuancă","bacauancelor":"băcăuancă","bacauane":"băcăuană","bacauanei":"băcăuană","bacauanele":"băcăuană","bacauanelor":"băcăuană","bacauani":"băcăuan","bacauanii":"băcăuan","bacauanilor":"băcăuan","bacauanul":"băcăuan","bacauanule":"băcăuan","bacauanului":"băcăuan","bacaul":"Bacău","bacaule":"Bacău","bacaului":"Bacău","bacceaua":"baccea","baccele":"baccea","baccelea":"bacceli","bacceleai":"bacceli","bacceleam":"bacceli","bacceleati":"bacceli","bacceleau":"bacceli","baccelei":"baccea","baccelele":"baccea","baccelelor":"baccea","baccelesc":"bacceli","bacceleste":"bacceli","baccelesti":"bacceli","baccelii":"bacceli","baccelim":"bacceli","baccelind":"bacceli","baccelira":"bacceli","bacceliram":"bacceli","baccelirati":"bacceli","baccelise":"bacceli","baccelisem":"bacceli","baccelisera":"bacceli","bacceliseram":"bacceli","bacceliserati":"bacceli","baccelisesi":"bacceli","baccelisi":"bacceli","baccelit":"bacceli","baccelita":["baccelită","baccelit","baccelita","baccelit"],"baccelite":"baccelit","baccelitele":"baccelit","bacceliti":["bacceliți","bacceli","bacceliți","baccelit"],"baccelitii":"baccelit","baccelitul":"baccelit","baccevani":"baccevan","baccevanii":"baccevan","baccevanilor":"baccevan","baccevanul":"baccevan","baccevanule":"baccevan","baccevanului":"baccevan","bace":"bacă","bacei":"bacă","bacele":"bacă","bacelor":"bacă","bachelite":"bachelită","bachelitei":"bachelită","bachelitele":"bachelită","bachelitelor":"bachelită","bachica":["bachică","bachic","bachica","bachic"],"bachice":"bachic","bachicele":"bachic","bachici":"bachic","bachicii":"bachic","bachicul":"bachic","bacicaul":"băcică","bacicaule":"băcică","bacicaului":"băcică","bacici":"băcică","bacicii":"băcică","bacicilor":"băcică","bacifera":["baciferă","bacifer","bacifera","bacifer"],"bacifere":"bacifer","baciferele":"bacifer","baciferi":"bacifer","baciferii":"bacifer","baciferul":"bacifer","baciforma":["baciformă","baciform","baciforma","baciform"],"baciforme":"baciform","baciformele":"baciform","baciformi":"baciform","baciformii":"baciform","baciformul":"baciform","bacii":"baci","bacilara":["bacilară","bacilar","bacilara","bacilar"],"bacilare":"bacilar","bacilarele":"bacilar","bacilari":"bacilar","bacilarii":"bacilar","bacilarul":"bacilar","bacilemia":"bacilemie","bacilemiei":"bacilemie","bacilemii":"bacilemie","bacilemiile":"bacilemie","bacilemiilor":"bacilemie","bacili":"bacil","baciliforma":["baciliformă","baciliform","baciliforma","baciliform"],"baciliforme":"baciliform","baciliformele":"baciliform","baciliformi":"baciliform","baciliformii":"baciliform","baciliformul":"baciliform","bacilii":"bacil","bacililor":"bacil","bacilor":"baci","baciloscopia":"baciloscopie","baciloscopiei":"baciloscopie","baciloscopii":"baciloscopie","baciloscopiile":"baciloscopie","baciloscopiilor":"baciloscopie","baciloze":"baciloză","bacilozei":"baciloză","bacilozele":"baciloză","bacilozelor":"baciloză","bacilul":"bacil","bacilule":"bacil","bacilului":"bacil","baciluria":"bacilurie","baciluriei":"bacilurie","bacilurii":"bacilurie","baciluriile":"bacilurie","baciluriilor":"bacilurie","bacioci":"bâcioc","baciocii":"bâcioc","baciocilor":"bâcioc","baciocul":"bâcioc","baciocule":"bâcioc","baciocului":"bâcioc","bacite":"băciță","bacitei":"băciță","bacitele":"băciță","bacitelor":"băciță","baciuia":"băciui","baciuiai":"băciui","baciuiam":"băciui","baciuiati":"băciui","baciuiau":"băciui","baciuiesc":"băciui","baciuieste":"băciui","baciuiesti":"băciui","baciuii":"băciui","baciuim":"băciui","baciuind":"băciui","baciuira":"băciui","baciuiram":"băciui","baciuirati":"băciui","baciuise":"băciui","baciuisem":"băciui","baciuisera":"băciui","baciuiseram":"băciui","baciuiserati":"băciui","baciuisesi":"băciui","baciuisi":"băciui","baciuit":"băciui","baciuiti":"băciui","baciuitul":"băciuit","baciuitule":"băciuit","baciuitului":"băciuit","baciuituri":"băciuit","baciuiturile":"băciuit","baciuiturilor":"băciuit","baciul":"baci","baciule":"baci","baciului":"baci","bacivora":["bacivoră","bacivor","bacivora","bacivor"],"bacivore":"bacivor","bacivorele":"bacivor","bacivori":"bacivor","bacivorii":"bacivor","bacivorul":"bacivor","backgroundul":"background","backgroundule":"background","backgroundului":"background","backgrounduri":"background","backgroundurile":"background","backgroundurilor":"background","backhandul":"backhand","backhandule":"backhand","backhandului":"backhand","backhanduri":"backhand","backhandurile":"backhand","backhandurilor":"backhand","baclavale":"baclava","baclavalei":"baclava","baclavalele":"baclava","baclavalelor":"baclava","baclavaua":"baclava","baconul":"bacon","baconule":"bacon","baconului":"bacon","bacsea":"bâcsi","bacseai":"bâcsi","bacseam":"bâcsi","bacseati":"bâcsi","bacseau":"bâcsi","bacsesc":"bâcsi","bacseste":"bâcsi","bacsesti":"bâcsi","bacsii":"bâcsi","bacsim":"bâcsi","bacsind":"bâcsi","bacsira":"bâcsi","bacsiram":"bâcsi","bacsirati":"bâcsi","bacsise":"bâcsi","bacsisem":"bâcsi","bacsisera":"bâcsi","bacsiseram":"bâcsi","bacsiserati":"bâcsi","bacsisesi":"bâcsi","bacsisi":"bâcsi","bacsisul":"bacșiș","bacsisule":"bacșiș","bacsisului":"bacșiș","bacsisuri":"bacșiș","bacsisurile":"bacșiș","bacsisurilor":"bacșiș","bacsit":"bâcsi","bacsiti":"bâcsi","bacteria":"bacterie","bacteriana":["bacteriană","bacterian","bacteriana","bacterian"],"bacterianul":"bacterian","bactericidul":"bactericid","bactericidule":"bactericid","bactericidului":"bactericid","bactericizi":"bactericid","bactericizile":"bactericid","bactericizilor":"bactericid","bacteridia":"bacteridie","bacteridiei":"bacteridie","bacteridii":"bacteridie","bacteridiile":"bacteridie","bacteridiilor":"bacteridie","bacteriei":"bacterie","bacteriemia":"bacteriemie","bacteriemiei":"bacteriemie","bacteriemii":"bacteriemie","bacteriemiile":"bacteriemie","bacteriemiilor":"bacteriemie","bacteriene":"bacterian","bacterienele":"bacterian","bacterieni":"bacterian","bacterienii":"bacterian","bacterii":"bacterie","bacteriile":"bacterie","bacteriilor":"bacterie","bacteriocecidia":"bacteriocecidie","bacteriocecidiei":"bacteriocecidie","bacteriocecidii":"bacteriocecidie","bacteriocecidiile":"bacteriocecidie","bacteriocecidiilor":"bacteriocecidie","bacteriofagi":"bacteriofag","bacteriofagia":"bacteriofagie","bacteriofagiei":"bacteriofagie","bacteriofagii":["bacteriofagii","bacteriofag","bacteriofagii","bacteriofagie"],"bacteriofagiile":"bacteriofagie","bacteriofagiilor":"bacteriofagie","bacteriofagilor":"bacteriofag","bacteriofagul":"bacteriofag","bacteriofagule":"bacteriofag","bacteriofagului":"bacteriofag","bacteriolize":"bacterioliză","bacteriolizei":"bacterioliză","bacteriolizele":"bacterioliză","bacteriolizelor":"bacterioliză","bacteriolizine":"bacteriolizină","bacteriolizinei":"bacteriolizină","bacteriolizinele":"bacteriolizină","bacteriolizinelor":"bacteriolizină","bacteriologe":"bacteriologă","bacteriologei":"bacteriologă","bacteriologele":"bacteriologă","bacteriologelor":"bacteriologă","bacteriologi":"bacteriolog","bacteriologia":"bacteriologie","bacteriologica":["bacteriologică","bacteriologic","bacteriologica","bacteriologic"],"bacteriologice":"bacteriologic","bacteriologicele":"bacteriologic","bacteriologici":"bacteriologic","bacteriologicii":"bacteriologic","bacteriologicul":"bacteriologic","bacteriologiei":"bacteriologie","bacteriologii":["bacteriologii","bacteriolog","bacteriologii","bacteriologie"],"bacteriologilor":"bacteriolog","bacteriologul":"bacteriolog","bacteriologule":"bacteriolog","bacteriologului":"bacteriolog","bacterioscopia":"bacterioscopie","bacterioscopiei":"bacterioscopie","bacterioscopii":"bacterioscopie","bacterioscopiile":"bacterioscopie","bacterioscopiilor":"bacterioscopie","bacteriostatica":["bacteriostatică","bacteriostatic","bacteriostatica","bacteriostatic"],"bacteriostaticaul":"bacteriostatică","bacteriostaticaule":"bacteriostatică","bacteriostaticaului":"bacteriostatică","bacteriostatice":"bacteriostatic","bacteriostaticele":"bacteriostatic","bacteriostatici":["bacteriostatici","bacteriostatic","bacteriostatici","bacteriostatică"],"bacteriostaticii":"bacteriostatic","bacteriostaticile":"bacteriostatică","bacteriostaticilor":"bacteriostatică","bacteriostaticul":"bacteriostatic","bacteriostaze":"bacteriostază","bacteriostazei":"bacteriostază","bacteriostazele":"bacteriostază","bacteriostazelor":"bacteriostază","bacterioterapia":"bacterioterapie","bacterioterapiei":"bacterioterapie","bacterioterapii":"bacterioterapie","bacterioterapiile":"bacterioterapie","bacterioterapiilor":"bacterioterapie","bacteriotoxine":"bacteriotoxină","bacteriotoxinei":"bacteriotoxină","bacteriotoxinele":"bacteriotoxină","bacteriotoxinelor":"bacteriotoxină","bacteriotropi":"bacteriotrop","bacteriotropii":"bacteriotrop","bacteriotropilor":"bacteriotrop","bacteriotropul":"bacteriotrop","bacteriotropule":"bacteriotrop","bacteriotropului":"bacteriotrop","bacterioze":"bacterioză","bacteriozei":"bacterioză","bacteriozele":"bacterioză","bacteriozelor":"bacterioză","bacteriuria":"bacteriurie","bacteriuriei":"bacteriurie","bacteriurii":"bacteriurie","bacteriuriile":"bacteriurie","bacteriuriilor":"bacteriurie","bacterivora":["bacterivoră","bacterivor","bacterivora","bacterivor"],"bacterivore":"bacterivor","bacterivorele":"bacterivor","bacterivori":"bacterivor","bacterivorii":"bacterivor","bacterivorul":"bacterivor","bacul":"bac","bacule":"bac","bacului":"bac","bacuri":"bac","bacurile":"bac","bacurilor":"bac","bada":"ba da","badadaia":"bădădăi","badadaiai":"bădădăi","badadaiam":"bădădăi","badadaiati":"bădădăi","badadaiau":"bădădăi","badadaiesc":"bădădăi","badadaieste":"bădădăi","badadaiesti":"bădădăi","badadaii":"bădădăi","badadaim":"bădădăi","badadaind":"bădădăi","badadaira":"bădădăi","badadairam":"bădădăi","badadairati":"bădădăi","badadaise":"bădădăi","badadaisem":"bădădăi","badadaisera":"bădădăi","badadaiseram":"bădădăi","badadaiserati":"bădădăi","badadaisesi":"bădădăi","badadaisi":"bădădăi","badadait":"bădădăi","badadaiti":"bădădăi","badaduia":"bădădui","badaduiai":"bădădui","badaduiam":"bădădui","badaduiati":"bădădui","badaduiau":"bădădui","badaduiesc":"bădădui","badaduieste":"bădădui","badaduiesti":"bădădui","badaduii":"bădădui","badaduim":"bădădui","badaduind":"bădădui","badaduira":"bădădui","badaduiram":"bădădui","badaduirati":"bădădui","badaduise":"bădădui","badaduisem":"bădădui","badaduisera":"bădădui","badaduiseram":"bădădui","badaduiserati":"bădădui","badaduisesi":"bădădui","badaduisi":"bădădui","badaduit":"bădădui","badaduiti":"bădădui","badanale":"badana","badanalei":"badana","badanalele":"badana","badanalelor":"badana","badanalute":"bădănăluță","badanalutei":"bădănăluță","badanalutele":"bădănăluță","badanalutelor":"bădănăluță","badanaua":"badana","badanute":"bădănuță","badanutei":"bădănuță","badanutele":"bădănuță","badanutelor":"bădănuță","badaraie":"bădărău","badaraiele":"bădărău","badaraielor":"bădărău","badarana":["bădărană","bădăran","bădărana","bădăran"],"badarance":"bădărancă","badarancei":"bădărancă","badarancele":"bădărancă","badarancelor":"bădărancă","badarane":["bădărane","bădăran","bădărane","bădărană"],"badaraneasca":["bădărănească","bădărănesc","bădărăneasca","bădărănesc"],"badaranei":"bădărană","badaranele":["bădăranele","bădăran","bădăranele","bădărană"],"badaranelor":"bădărană","badaranescul":"bădărănesc","badaranesti":"bădărănesc","badaranestii":"bădărănesc","badaranestile":"bădărănesc","badarani":"bădăran","badarania":"bădărănie","badaraniei":"bădărănie","badaranii":["bădăranii","bădăran","bădărănii","bădărănie"],"badaraniile":"bădărănie","badaraniilor":"bădărănie","badaranilor":"bădăran","badaranoasa":["bădărănoasă","bădărănos","bădărănoasa","bădărănos"],"badaranoase":"bădărănos","badaranoasele":"bădărănos","badaranosi":"bădărănos","badaranosii":"bădărănos","badaranosul":"bădărănos","badaranul":"bădăran","badaranule":"bădăran","badaranului":"bădăran","badarauul":"bădărău","badarauule":"bădărău","badarauului":"bădărău","badaroia":"bădăroi","badaroie":"bădăroi","badaroiele":"bădăroi","badaroii":"bădăroi","badaroiul":"bădăroi","badea":"bade","badei":"bade","badiani":"badian","badianii":"badian","badianilor":"badian","badianul":"badian","badianule":"badian","badianului":"badian","badichii":"bădică","badici":["bădici","bădic","bădici","bădică"],"badicii":["bădicii","bădic","bădicii","bădică"],"badicilor":["bădicilor","bădic","bădicilor","bădică"],"badicul":"bădic","badicule":"bădic","badicului":"bădic","badicutei":"bădicuță","badicuti":"bădicuță","badicutii":"bădicuță","badicutilor":"bădicuță","badiesi":"bădieș","badiesii":"bădieș","badiesilor":"bădieș","badiesul":"bădieș","badiesule":"bădieș","badiesului":"bădieș","badiicaul":"bădiică","badiicaule":"bădiică","badiicaului":"bădiică","badiici":"bădiică","badiicii":"bădiică","badiicilor":"bădiică","badiitaul":"bădiiță","badiitaule":"bădiiță","badiitaului":"bădiiță","badiiti":"bădiiță","badiitii":"bădiiță","badiitilor":"bădiiță","badijonai":"badijona","badijonaje":"badijonaj","badijonajele":"badijonaj","badijonajelor":"badijonaj","badijonajul":"badijonaj","badijonajule":"badijonaj","badijonajului":"badijonaj","badijonam":["badijonăm","badijona","badijonam","badijona"],"badijonand":"badijona","badijonara":"badijona","badijonaram":"badijona","badijonarati":"badijona","badijonarea":"badijonare","badijonari":"badijonare","badijonarii":"badijonare","badijonarile":"badijonare","badijonarilor":"badijonare","badijonase":"badijona","badijonasem":"badijona","badijonasera":"badijona","badijonaseram":"badijona","badijonaserati":"badijona","badijonasesi":"badijona","badijonasi":"badijona","badijonat":"badijona","badijonati":"badijona","badijonau":"badijona","badijoneaza":"badijona","badijonez":"badijona","badijonezi":"badijona","badilucaul":"bădilucă","badilucaule":"bădilucă","badilucaului":"bădilucă","badiluci":"bădilucă","badilucii":"bădilucă","badilucilor":"bădilucă","badinai":"badina","badinaje":"badinaj","badinajele":"badinaj","badinajelor":"badinaj","badinajul":"badinaj","badinajule":"badinaj","badinajului":"badinaj","badinam":["badinăm","badina","badinam","badina"],"badinand":"badina","badinara":"badina","badinaram":"badina","badinarati":"badina","badinase":"badina","badinasem":"badina","badinasera":"badina","badinaseram":"badina","badinaserati":"badina","badinasesi":"badina","badinasi":"badina","badinat":"badina","badinati":"badina","badinau":"badina","badineaza":"badina","badineria":"badinerie","badineriei":"badinerie","badinerii":"badinerie","badineriile":"badinerie","badineriilor":"badinerie","badinez":"badina","badinezi":"badina","badisori":"bădișor","badisorii":"bădișor","badisorilor":"bădișor","badisorul":"bădișor","badisorule":"bădișor","badisorului":"bădișor","baditaul":"bădiță","baditaule":"bădiță","baditaului":"bădiță","baditei":"bădițel","baditeii":"bădițel","baditeilor":"bădițel","baditelul":"bădițel","baditelule":"bădițel","baditelului":"bădițel","baditi":"bădiță","baditicii":"bădițică","baditii":"bădiță","baditilor":"bădiță","badiucaul":"bădiucă","badiucaule":"bădiucă","badiucaului":"bădiucă","badiuci":"bădiucă","badiucii":"bădiucă","badiucilor":"bădiucă","badiulitaul":"bădiuliță","badiulitaule":"bădiuliță","badiulitaului":"bădiuliță","badiuliti":"bădiuliță","badiulitii":"bădiuliță","badiulitilor":"bădiuliță","badiulutaul":"bădiuluță","badiulutaule":"bădiuluță","badiulutaului":"bădiuluță","badiuluti":"bădiuluță","badiulutii":"bădiuluță","badiulutilor":"bădiuluță","badmintonul":"badminton","badmintonule":"badminton","badmintonului":"badminton","badoace":"bădoacă","badoacei":"bădoacă","badoacele":"bădoacă","badoacelor":"bădoacă","badogi":"badog","badogii":"badog","badogilor":"badog","badogul":"badog","badogule":"badog","badogului":"badog","baedekerul":"baedeker","baedekerule":"baedeker","baedekerului":"baedeker","bafte":"baftă","baftei":"baftă","baftele":"baftă","baftelor":"baftă","bag":"băga","bag pula":"băga-mi-aș pula","bagacioasa":["băgăcioasă","băgăcios","băgăcioasa","băgăcios"],"bagacioase":"băgăcios","bagacioasele":"băgăcios","bagaciosi":"băgăcios","bagaciosii":"băgăcios","bagaciosul":"băgăcios","bagagie":"bagagiu","bagagiele":"bagagiu","bagagielor":"bagagiu","bagagiuul":"bagagiu","bagagiuule":"bagagiu","bagagiuului":"bagagiu","bagai":"băga","bagaje":"bagaj","bagajele":"bagaj","bagajelor":"bagaj","bagajul":"bagaj","bagajule":"bagaj","bagajului":"bagaj","bagale":"baga","bagam":["băgăm","băga","băgam","băga"],"bagand":"băga","bagara":"băga","bagaram":"băga","bagarati":"băga","bagarea":"băgare","bagareata":["băgăreață","băgăreț","băgăreața","băgăreț"],"bagarete":"băgăreț","bagaretele":"băgăreț","bagareti":"băgăreț","bagaretii":"băgăreț","bagaretul":"băgăreț","bagari":"băgare","bagarii":"băgare","bagase":"băga","bagasem":"băga","bagasera":"băga","bagaseram":"băga","bagaserati":"băga","bagasesi":"băga","bagasi":"băga","bagat":"băga","bagat ca musca-n lapte":"băga ca musca-n lapte","bagat capul la cutie":"băga capul la cutie","bagat in seama":"băga în seamă","bagat mana in foc":"băga mâna în foc","bagat pula":"băga pula","bagata":["băgată","băgat","băgata","băgat"],"bagatari":"bagatâr","bagatarii":"bagatâr","bagatarilor":"bagatâr","bagatarul":"bagatâr","bagatarule":"bagatâr","bagatarului":"bagatâr","bagate":"băgat","bagatele":["băgatele","băgat","bagatele","bagatel","bagatele","bagatelă"],"bagatelei":"bagatelă","bagatelele":"bagatelă","bagatelelor":"bagatelă","bagatelizai":"bagateliza","bagatelizam":["bagatelizăm","bagateliza","bagatelizam","bagateliza"],"bagatelizand":"bagateliza","bagatelizara":"bagateliza","bagatelizaram":"bagateliza","bagatelizarati":"bagateliza","bagatelizarea":"bagatelizare","bagatelizari":"bagatelizare","bagatelizarii":"bagatelizare","bagatelizase":"bagateliza","bagatelizasem":"bagateliza","bagatelizasera":"bagateliza","bagatelizaseram":"bagateliza","bagatelizaserati":"bagateliza","bagatelizasesi":"bagateliza","bagatelizasi":"bagateliza","bagatelizat":"bagateliza","bagatelizati":"bagateliza","bagatelizatul":"bagatelizat","bagatelizatule":"bagatelizat","bagatelizatului":"bagatelizat","bagatelizaturi":"bagatelizat","bagatelizaturile":"bagatelizat","bagatelizaturilor":"bagatelizat","bagatelizau":"bagateliza","bagatelizeaza":"bagateliza","bagatelizez":"bagateliza","bagatelizezi":"bagateliza","bagati":["băgați","băga","băgați","băgat"],"bagatii":"băgat","bagatoare":"băgător","bagatoarea":"băgător","bagatoarele":"băgător","bagatori":"băgător","bagatorii":"băgător","bagatorul":"băgător","bagatul":"băgat","bagaturi":"băgătură","bagaturii":"băgătură","bagaturile":"băgătură","bagaturilor":"băgătură","bagau":"băga","bagauri":"băgău","bagaurile":"băgău","bagaurilor":"băgău","bagauul":"băgău","bagauule":"băgău","bagauului":"băgău","bagdadia":"bagdadie","bagdadiei":"bagdadie","bagdadii":"bagdadie","bagdadiile":"bagdadie","bagdadiilor":"bagdadie","bage":"băga","bage mana in foc":"băga mâna în foc","bagece":"bageacă","bagecei":"bageacă","bagecele":"bageacă","bagecelor":"bageacă","bageci":"bageacă","baghete":"baghetă","baghete magice":"baghetă magică","baghetei":"baghetă","baghetele":"baghetă","baghetelor":"baghetă","bagi":"băga","bagiocur":"bagiocuri","bagiocure":"bagiocuri","bagiocurea":"bagiocuri","bagiocureai":"bagiocuri","bagiocuream":"bagiocuri","bagiocureati":"bagiocuri","bagiocureau":"bagiocuri","bagiocurie":"bagiocuri","bagiocurii":"bagiocuri","bagiocurim":"bagiocuri","bagiocurind":"bagiocuri","bagiocurira":"bagiocuri","bagiocuriram":"bagiocuri","bagiocurirati":"bagiocuri","bagiocurise":"bagiocuri","bagiocurisem":"bagiocuri","bagiocurisera":"bagiocuri","bagiocuriseram":"bagiocuri","bagiocuriserati":"bagiocuri","bagiocurisesi":"bagiocuri","bagiocurisi":"bagiocuri","bagiocurit":"bagiocuri","bagiocuriti":"bagiocuri","bahania":"băhanie","bahaniei":"băhanie","bahanii":"băhanie","bahaniile":"băhanie","bahaniilor":"băhanie","bahica":["bahică","bahic","bahica","bahic"],"bahice":"bahic","bahicele":"bahic","bahici":"bahic","bahicii":"bahic","bahicul":"bahic","bahlita":["bâhlită","bâhlit","bâhlita","bâhlit"],"bahlite":"bâhlit","bahlitele":"bâhlit","bahliti":"bâhlit","bahlitii":"bâhlit","bahlitul":"bâhlit","bahmeti":"bahmet","bahmetii":"bahmet","bahmetilor":"bahmet","bahmetul":"bahmet","bahmetule":"bahmet","bahmetului":"bahmet","bahnarul":"băhnar","bahnarule":"băhnar","bahnarului":"băhnar","bahne":"bahnă","bahnei":"bahnă","bahnele":"bahnă","bahnelor":"bahnă","bahnisul":"băhniș","bahnisule":"băhniș","bahnisului":"băhniș","bahnisuri":"băhniș","bahnisurile":"băhniș","bahnisurilor":"băhniș","bahnita":["băhnită","băhnit","băhnita","băhnit"],"bahnite":["băhnite","băhnit","bahnițe","bahniță"],"bahnitei":"bahniță","bahnitele":["băhnitele","băhnit","bahnițele","bahniță"],"bahnitelor":"bahniță","bahniti":"băhnit","bahnitii":"băhnit","bahnitul":"băhnit","bahnoasa":["băhnoasă","băhnos","băhnoasa","băhnos"],"bahnoase":"băhnos","bahnoasele":"băhnos","bahnosi":"băhnos","bahnosii":"băhnos","bahnosul":"băhnos","bahornita":["bahorniță","baborniță","bahornița","baborniță"],"bahornite":["bahornițe","baborniță","bahornițe","bahorniță"],"bahornitei":["bahorniței","baborniță","bahorniței","bahorniță"],"bahornitele":["bahornițele","baborniță","bahornițele","bahorniță"],"bahornitelor":["bahornițelor","baborniță","bahornițelor","bahorniță"],"bahtisirea":"bâhtisire","bahtisiri":"bâhtisire","bahtisirii":"bâhtisire","bahtisirile":"bâhtisire","bahtisirilor":"bâhtisire","bai":["băi","bă","băi","băia","băi","baie"],"bai de abur":"baie de abur","bai de aburi":"baie de aburi","bai de sange":"baie de sânge","bai de soare":"baie de soare","bai turcesti":"baie turcească","baia":"baie","baiadere":"baiaderă","baiaderei":"baiaderă","baiaderele":"baiaderă","baiaderelor":"baiaderă","baiai":"băia","baiam":"băia","baiara":"băia","baiaram":"băia","baiarati":"băia","baiase":"băia","baiasem":"băia","baiasera":"băia","baiaseram":"băia","baiaserati":"băia","baiasesi":"băia","baiasi":"băia","baiasul":"băiaș","baiasule":"băiaș","baiasului":"băiaș","baiat":"băia","baiati":"băia","baiatul":"băiat","baiatule":"băiat","baiatului":"băiat","baiau":"băia","baiaza":"băia","baici":"baică","baicii":"baică","baicile":"baică","baicilor":"baică","baicioci":"bâicioc","baiciocii":"bâicioc","baiciocilor":"bâicioc","baiciocul":"bâicioc","baiciocule":"bâicioc","baiciocului":"bâicioc","baiderase":"baideraș","baiderasele":"baideraș","baideraselor":"baideraș","baiderasul":"baideraș","baiderasule":"baideraș","baiderasului":"baideraș","baie":"băia","baiem":"băia","baier":"baieră","baiere":"baier","baierele":["baierele","baier","băierele","băierel"],"baierelele":"băierel","baierelelor":"băierel","baierelor":"baier","baierelul":"băierel","baierelule":"băierel","baierelului":"băierel","baieri":"baieră","baierii":"baieră","baierile":"baieră","baierilor":"baieră","baierul":"baier","baierule":"baier","baierului":"baier","baierute":"băieruță","baierutei":"băieruță","baierutele":"băieruță","baierutelor":"băieruță","baieseasca":["băieșească","băieșesc","băieșeasca","băieșesc"],"baiesescul":"băieșesc","baiesesti":"băieșesc","baiesestii":"băieșesc","baiesestile":"băieșesc","baiesi":["băieși","băiaș","băieși","băieș"],"baiesii":["băieșii","băiaș","băieșii","băieș"],"baiesilor":["băieșilor","băiaș","băieșilor","băieș"],"baiesimea":"băieșime","baiesimi":"băieșime","baiesimii":"băieșime","baiesite":"băieșiță","baiesitei":"băieșiță","baiesitele":"băieșiță","baiesitelor":"băieșiță","baiesul":"băieș","baiesule":"băieș","baiesului":"băieș","baietanasi":"băietănaș","baietanasii":"băietănaș","baietanasilor":"băietănaș","baietanasul":"băietănaș","baietanasule":"băietănaș","baietanasului":"băietănaș","baietandri":"băiețandru","baietandrii":"băiețandru","baietandrilor":"băiețandru","baietandruul":"băiețandru","baietandruule":"băiețandru","baietandruului":"băiețandru","baietane":"băietană","baietanei":"băietană","baietanele":"băietană","baietanelor":"băietană","baietani":["băietani","băietan","băiețani","băiețan"],"baietanii":["băietanii","băietan","băiețanii","băiețan"],"baietanilor":["băietanilor","băietan","băiețanilor","băiețan"],"baietanimea":"băietănime","baietanimi":"băietănime","baietanimii":"băietănime","baietanul":["băietanul","băietan","băiețanul","băiețan"],"baietanule":["băietanule","băietan","băiețanule","băiețan"],"baietanului":["băietanului","băietan","băiețanului","băiețan"],"baietasi":"băiețaș","baietasii":"băiețaș","baietasilor":"băiețaș","baietasul":"băiețaș","baietasule":"băiețaș","baietasului":"băiețaș","baiete":"băiată","baieteasca":["băiețească","băiețesc","băiețeasca","băiețesc"],"baieteaua":"băietea","baietei":["băietei","băiată","băieței","băiețel"],"baieteii":"băiețel","baieteilor":"băiețel","baietele":["băietele","băiată","băietele","băietea"],"baietelei":"băietea","baietelele":"băietea","baietelelor":"băietea","baietelor":"băiată","baietelul":"băiețel","baietelule":"băiețel","baietelului":"băiețel","baietescul":"băiețesc","baietesti":"băiețesc","baietestii":"băiețesc","baietestile":"băiețesc","baieti":["băieți","băiat","băieți","băiet"],"baietii":["băieții","băiat","băieții","băiet"],"baietilor":["băieților","băiat","băieților","băiet"],"baietimea":"băiețime","baietimi":"băiețime","baietimii":"băiețime","baietoii":"băiețoi","baietoilor":"băiețoi","baietoiul":"băiețoi","baietoiule":"băiețoi","baietoiului":"băiețoi","baietul":"băiet","baietule":"băiet","baietului":"băiet","baiguia":"bâigui","baiguiai":"bâigui","baiguiam":"bâigui","baiguiati":"bâigui","baiguiau":"bâigui","baiguie":"bâigui","baiguiele":"bâiguială","baiguielei":"bâiguială","baiguielele":"bâiguială","baiguielelor":"bâiguială","baiguieli":"bâiguială","baiguii":"bâigui","baiguim":"bâigui","baiguind":"bâigui","baiguira":"bâigui","baiguiram":"bâigui","baiguirati":"bâigui","baiguise":"bâigui","baiguisem":"bâigui","baiguisera":"bâigui","baiguiseram":"bâigui","baiguiserati":"bâigui","baiguisesi":"bâigui","baiguisi":"bâigui","baiguit":"bâigui","baiguiti":"bâigui","baiguitoare":"bâiguitor","baiguitoarea":"bâiguitor","baiguitoarele":"bâiguitor","baiguitori":"bâiguitor","baiguitorii":"bâiguitor","baiguitorul":"bâiguitor","baii":"baie","baile":"baie","baile drinceni":"Băile Drânceni","bailestiul":"Băilești","bailestiule":"Băilești","bailestiului":"Băilești","bailor":"baie","baimareana":["băimăreană","băimărean","băimăreana","băimărean"],"baimareanul":"băimărean","baimareanule":"băimărean","baimareanului":"băimărean","baimarence":"băimăreancă","baimarencei":"băimăreancă","baimarencele":"băimăreancă","baimarencelor":"băimăreancă","baimarene":["băimărene","băimărean","băimărene","băimăreană"],"baimarenei":"băimăreană","baimarenele":["băimărenele","băimărean","băimărenele","băimăreană"],"baimarenelor":"băimăreană","baimareni":"băimărean","baimarenii":"băimărean","baimarenilor":"băimărean","baind":"băia","baioare":"băioară","baioarei":"băioară","baioarele":"băioară","baioarelor":"băioară","baionete":"baionetă","baionetei":"baionetă","baionetele":"baionetă","baionetelor":"baionetă","bairace":"bairac","bairacele":"bairac","bairacelor":"bairac","bairactari":"bairactar","bairactarii":"bairactar","bairactarilor":"bairactar","bairactarul":"bairactar","bairactarule":"bairactar","bairactarului":"bairactar","bairacul":"bairac","bairacule":"bairac","bairacului":"bairac","bairamul":"bairam","bairamule":"bairam","bairamului":"bairam","bairamuri":"bairam","bairamurile":"bairam","bairamurilor":"bairam","bairea":"băire","bairi":"băire","bairii":"băire","bairile":"băire","bairilor":"băire","bairul":"bair","bairule":"bair","bairului":"bair","bairuri":"bair","bairurile":"bair","bairurilor":"bair","baistruci":"baistruc","baistrucii":"baistruc","baistrucilor":"baistruc","baistrucul":"baistruc","baistrucule":"baistruc","baistrucului":"baistruc","baitanasi":"băitănaș","baitanasii":"băitănaș","baitanasilor":"băitănaș","baitanasul":"băitănaș","baitanasule":"băitănaș","baitanasului":"băitănaș","baitasani":"băitășan","baitasanile":"băitășan","baitasanilor":"băitășan","baitasanul":"băitășan","baitasanule":"băitășan","baitasanului":"băitășan","baite":"băiță","baitei":"băiță","baitele":"băiță","baitelor":"băiță","baiti":"bait","baitii":"bait","baitilor":"bait","baitul":["baitul","bait","baițul","baiț"],"baitule":["baitule","bait","baițule","baiț"],"baitului":["baitului","bait","baițului","baiț"],"baituri":"baiț","baiturile":"baiț","baiturilor":"baiț","baiul":"bai","baiule":"bai","baiului":"bai","baiuri":"bai","baiurile":"bai","baiurilor":"bai","bajbaia":"bâjbâi","bajbaiai":"bâjbâi","bajbaiam":"bâjbâi","bajbaiati":"bâjbâi","bajbaiau":"bâjbâi","bajbaie":"bâjbâi","bajbaiele":"bâjbâială","bajbaielei":"bâjbâială","bajbaielele":"bâjbâială","bajbaielelor":"bâjbâială","bajbaieli":"bâjbâială","bajbaii":"bâjbâi","bajbaim":"bâjbâi","bajbaind":"bâjbâi","bajbaira":"bâjbâi","bajbairam":"bâjbâi","bajbairati":"bâjbâi","bajbairea":"bâjbâire","bajbairi":"bâjbâire","bajbairii":"bâjbâire","bajbairile":"bâjbâire","bajbairilor":"bâjbâire","bajbaise":"bâjbâi","bajbaisem":"bâjbâi","bajbaisera":"bâjbâi","bajbaiseram":"bâjbâi","bajbaiserati":"bâjbâi","bajbaisesi":"bâjbâi","bajbaisi":"bâjbâi","bajbait":"bâjbâi","bajbaiti":"bâjbâi","bajbaitul":"bâjbâit","bajbaitule":"bâjbâit","bajbaitului":"bâjbâit","bajbaituri":"bâjbâitură","bajbaiturii":"bâjbâitură","bajbaiturile":"bâjbâitură","bajbaiturilor":"bâjbâitură","bajenarea":"băjenări","bajenareai":"băjenări","bajenaream":"băjenări","bajenareati":"băjenări","bajenareau":"băjenări","bajenaresc":"băjenări","bajenareste":"băjenări","bajenaresti":"băjenări","bajenari":"băjenar","bajenaria":"băjenărie","bajenariei":"băjenărie","bajenarii":["băjenarii","băjenar","băjenării","băjenări","băjenării","băjenărie"],"bajenariile":"băjenărie","bajenariilor":"băjenărie","bajenarilor":"băjenar","bajenarim":"băjenări","bajenarind":"băjenări","bajenarira":"băjenări","bajenariram":"băjenări","bajenarirati":"băjenări","bajenarise":"băjenări","bajenarisem":"băjenări","bajenarisera":"băjenări","bajenariseram":"băjenări","bajenariserati":"băjenări","bajenarisesi":"băjenări","bajenarisi":"băjenări","bajenarit":"băjenări","bajenariti":"băjenări","bajenarul":"băjenar","bajenarule":"băjenar","bajenarului":"băjenar","bajenia":"băjenie","bajeniei":"băjenie","bajenii":"băjenie","bajeniile":"băjenie","bajeniilor":"băjenie","bala":["bălă","băl","băla","băl"],"balabanirea":"bălăbănire","balabaniri":"bălăbănire","balabanirii":"bălăbănire","balabanirile":"bălăbănire","balabanirilor":"bălăbănire","balabanoasa":["bălăbănoasă","bălăbănos","bălăbănoasa","bălăbănos"],"balabanoase":"bălăbănos","balabanoasele":"bălăbănos","balabanosi":"bălăbănos","balabanosii":"bălăbănos","balabanosul":"bălăbănos","balabuste":"balabustă","balabustei":"balabustă","balabustele":"balabustă","balabustelor":"balabustă","balacarele":"bălăcăreală","balacarelei":"bălăcăreală","balacarelele":"bălăcăreală","balacarelelor":"bălăcăreală","balacareli":"bălăcăreală","balacaria":"bălăcărie","balacariei":"bălăcărie","balacarii":"bălăcărie","balacariile":"bălăcărie","balacariilor":"bălăcărie","balacea":"bălăci","balaceai":"bălăci","balaceam":"bălăci","balaceati":"bălăci","balaceau":"bălăci","balacele":"bălăceală","balacelei":"bălăceală","balacelele":"bălăceală","balacelelor":"bălăceală","balaceli":"bălăceală","balacesc":"bălăci","balaceste":"bălăci","balacesti":"bălăci","balacii":"bălăci","balacim":"bălăci","balacind":"bălăci","balacira":"bălăci","balaciram":"bălăci","balacirati":"bălăci","balacirea":"bălăcire","balaciri":"bălăcire","balacirii":"bălăcire","balacirile":"bălăcire","balacirilor":"bălăcire","balacise":"bălăci","balacisem":"bălăci","balacisera":"bălăci","balaciseram":"bălăci","balaciserati":"bălăci","balacisesi":"bălăci","balacisi":"bălăci","balacit":"bălăci","balaciti":"bălăci","balacitul":"bălăcit","balacitule":"bălăcit","balacitului":"bălăcit","balacituri":"bălăcitură","balaciturii":"bălăcitură","balaciturile":"bălăcitură","balaciturilor":"bălăcitură","baladai":"bălădău","baladaii":"bălădău","baladailor":"bălădău","baladaul":"bălădău","baladaule":"bălădău","baladaului":"bălădău","balade":"baladă","baladeasca":["baladească","baladesc","baladeasca","baladesc"],"baladei":"baladă","baladele":"baladă","baladelor":"baladă","baladescul":"baladesc","baladesti":"baladesc","baladestii":"baladesc","baladestile":"baladesc","baladiera":["baladieră","baladier","baladiera","baladier"],"baladiere":"baladier","baladierele":"baladier","baladieri":"baladier","baladierii":"baladier","baladierul":"baladier","baladini":"baladin","baladinii":"baladin","baladinilor":"baladin","baladinul":"baladin","baladinule":"baladin","baladinului":"baladin","balafoane":"balafon","balafoanele":"balafon","balafoanelor":"balafon","balafonul":"balafon","balafonule":"balafon","balafonului":"balafon","balafre":"balafră","balafrei":"balafră","balafrele":"balafră","balafrelor":"balafră","balaia":["bălaia","bălai","bălăia","bălăi"],"balaiai":"bălăi","balaiam":"bălăi","balaiati":"bălăi","balaiau":"bălăi","balaie":"bălai","balaiela":["bălăielă","bălăiel","bălăiela","bălăiel"],"balaiele":["bălaiele","bălai","bălăiele","bălăiel"],"balaielele":"bălăiel","balaieli":"bălăiel","balaielii":"bălăiel","balaielul":"bălăiel","balaiesc":"bălăi","balaieste":"bălăi","balaiesti":"bălăi","balaii":["bălaii","bălai","bălăii","bălăi"],"balaim":"bălăi","balaind":"bălăi","balaioara":["bălăioară","bălăior","bălăioara","bălăior"],"balaioare":"bălăior","balaioarele":"bălăior","balaiori":"bălăior","balaiorii":"bălăior","balaiorul":"bălăior","balaira":"bălăi","balairam":"bălăi","balairati":"bălăi","balaise":"bălăi","balaisem":"bălăi","balaisera":"bălăi","balaiseram":"bălăi","balaiserati":"bălăi","balaisesi":"bălăi","balaisi":"bălăi","balait":"bălăi","balaiti":"bălăi","balaiul":"bălai","balalaa":["bălălăă","bălălău","bălălăa","bălălău"],"balalae":"bălălău","balalaele":"bălălău","balalai":"bălălău","balalaici":"balalaică","balalaicii":"balalaică","balalaicile":"balalaică","balalaicilor":"balalaică","balalaii":"bălălău","balalaul":"bălălău","balamale":"balama","balamalei":"balama","balamalele":"balama","balamalelor":"balama","balamalute":"bălămăluță","balamalutei":"bălămăluță","balamalutele":"bălămăluță","balamalutelor":"bălămăluță","balamaua":"balama","balamucul":"balamuc","balamucule":"balamuc","balamucului":"balamuc","balamucuri":"balamuc","balamucurile":"balamuc","balamucurilor":"balamuc","balamutia":"balamuție","balamutiei":"balamuție","balamutii":"balamuție","balamutiile":"balamuție","balamutiilor":"balamuție","balamutirea":"balamuțire","balamutiri":"balamuțire","balamutirii":"balamuțire","balamutirile":"balamuțire","balamutirilor":"balamuțire","balamutita":["balamuțită","balamuțit","balamuțita","balamuțit"],"balamutite":"balamuțit","balamutitele":"balamuțit","balamutiti":"balamuțit","balamutitii":"balamuțit","balamutitul":"balamuțit","balana":["balană","balan","balana","balan","bălană","bălan","bălana","bălan"],"balane":["balane","balan","bălane","bălan"],"balanela":["bălănelă","bălănel","bălănela","bălănel"],"balanele":["balanele","balan","bălanele","bălan","bălănele","bălănel"],"balanelele":"bălănel","balaneli":"bălănel","balanelii":"bălănel","balanelul":"bălănel","balanganirea":"bălăngănire","balanganiri":"bălăngănire","balanganirii":"bălăngănire","balanganirile":"bălăngănire","balanganirilor":"bălăngănire","balanganitoare":"bălăngănitor","balanganitoarea":"bălăngănitor","balanganitoarele":"bălăngănitor","balanganitori":"bălăngănitor","balanganitorii":"bălăngănitor","balanganitorul":"bălăngănitor","balani":["balani","balan","bălani","bălan"],"balanica":["balanică","balanic","balanica","balanic"],"balanice":["balanice","balanic","bălănice","bălănică"],"balanicei":"bălănică","balanicele":["balanicele","balanic","bălănicele","bălănică"],"balanici":"balanic","balanicii":"balanic","balanicul":"balanic","balanii":["balanii","balan","bălanii","bălan"],"balanite":"balanită","balanitei":"balanită","balanitele":"balanită","balanitelor":"balanită","balanopostite":"balanopostită","balanopostitei":"balanopostită","balanopostitele":"balanopostită","balanopostitelor":"balanopostită","balanopreputiala":["balanoprepuțială","balanoprepuțial","balanoprepuțiala","balanoprepuțial"],"balanopreputiale":"balanoprepuțial","balanopreputialele":"balanoprepuțial","balanopreputiali":"balanoprepuțial","balanopreputialii":"balanoprepuțial","balanopreputialul":"balanoprepuțial","balansai":"balansa","balansam":["balansăm","balansa","balansam","balansa"],"balansand":"balansa","balansara":"balansa","balansaram":"balansa","balansarati":"balansa","balansarea":"balansare","balansari":"balansare","balansarii":"balansare","balansarile":"balansare","balansarilor":"balansare","balansase":"balansa","balansasem":"balansa","balansasera":"balansa","balansaseram":"balansa","balansaserati":"balansa","balansasesi":"balansa","balansasi":"balansa","balansat":"balansa","balansata":["balansată","balansat","balansata","balansat"],"balansate":"balansat","balansatele":"balansat","balansati":["balansați","balansa","balansați","balansat"],"balansatii":"balansat","balansatul":"balansat","balansau":"balansa","balanseaza":"balansa","balansez":"balansa","balansezi":"balansa","balansine":"balansină","balansinei":"balansină","balansinele":"balansină","balansinelor":"balansină","balansoare":["balansoare","balansoar","balansoare","balansor"],"balansoarele":["balansoarele","balansoar","balansoarele","balansor"],"balansoarelor":["balansoarelor","balansoar","balansoarelor","balansor"],"balansoarul":"balansoar","balansoarule":"balansoar","balansoarului":"balansoar","balansorul":"balansor","balansorule":"balansor","balansorului":"balansor","balansul":"balans","balansule":"balans","balansului":"balans","balansuri":"balans","balansurile":"balans","balansurilor":"balans","balantai":"balanța","balantam":["balanțăm","balanța","balanțam","balanța"],"balantand":"balanța","balantara":"balanța","balantaram":"balanța","balantarati":"balanța","balantase":"balanța","balantasem":"balanța","balantasera":"balanța","balantaseram":"balanța","balantaserati":"balanța","balantasesi":"balanța","balantasi":"balanța","balantat":"balanța","balantata":["balanțată","balanțat","balanțata","balanțat"],"balantate":"balanțat","balantatele":"balanțat","balantati":["balanțați","balanța","balanțați","balanțat"],"balantatii":"balanțat","balantatul":"balanțat","balantau":"balanța","balante":"balanță","balante comerciale":"balanță comercială","balanteaza":"balanța","balantei":"balanță","balantele":"balanță","balantelor":"balanță","balantez":"balanța","balantezi":"balanța","balantiere":"balanțier","balantierele":"balanțier","balantierelor":"balanțier","balantierul":"balanțier","balantierule":"balanțier","balantierului":"balanțier","balanul":["balanul","balan","bălanul","bălan"],"balanuta":["bălănuță","bălănuț","bălănuța","bălănuț"],"balanute":"bălănuț","balanutele":"bălănuț","balanuti":"bălănuț","balanutii":"bălănuț","balanutul":"bălănuț","balaoachesa":["balaoacheșă","balaoacheș","balaoacheșa","balaoacheș"],"balaoachese":["balaoacheșe","balaoacheș","balaoacheșe","balaoacheșă"],"balaoachesei":"balaoacheșă","balaoachesele":["balaoacheșele","balaoacheș","balaoacheșele","balaoacheșă"],"balaoacheselor":"balaoacheșă","balaoachesi":"balaoacheș","balaoachesii":"balaoacheș","balaoachesilor":"balaoacheș","balaoachesul":"balaoacheș","balaoachesule":"balaoacheș","balaoachesului":"balaoacheș","balaria":"bălărie","balariei":"bălărie","balarii":"bălărie","balariile":"bălărie","balariilor":"bălărie","balastai":"balasta","balastam":["balastăm","balasta","balastam","balasta"],"balastand":"balasta","balastara":"balasta","balastaram":"balasta","balastarati":"balasta","balastarea":"balastare","balastari":"balastare","balastarii":"balastare","balastarile":"balastare","balastarilor":"balastare","balastase":"balasta","balastasem":"balasta","balastasera":"balasta","balastaseram":"balasta","balastaserati":"balasta","balastasesi":"balasta","balastasi":"balasta","balastat":"balasta","balastati":"balasta","balastatul":"balastat","balastatule":"balastat","balastatului":"balastat","balastaturi":"balastat","balastaturile":"balastat","balastaturilor":"balastat","balastau":"balasta","balasteaza":"balasta","balastez":"balasta","balastezi":"balasta","balastiere":"balastieră","balastierei":"balastieră","balastierele":"balastieră","balastierelor":"balastieră","balastioage":"bălăștioagă","balastioagei":"bălăștioagă","balastioagele":"bălăștioagă","balastioagelor":"bălăștioagă","balastul":"balast","balastule":"balast","balastului":"balast","balasturi":"balast","balasturile":"balast","balasturilor":"balast","balasul":"balaș","balasule":"balaș","balasului":"balaș","balasuri":"balaș","balasurile":"balaș","balasurilor":"balaș","balatirea":"bălățire","balatiri":"bălățire","balatirii":"bălățire","balatirile":"bălățire","balatirilor":"bălățire","balauca":["bălăucă","bălăuc","bălăuca","bălăuc"],"balauce":"bălăuc","balaucele":"bălăuc","balauci":"bălăuc","balaucii":"bălăuc","balaucul":"bălăuc","balaurasi":"bălăuraș","balaurasii":"bălăuraș","balaurasilor":"bălăuraș","balaurasul":"bălăuraș","balaurasule":"bălăuraș","balaurasului":"bălăuraș","balaurei":"balaurel","balaureii":"balaurel","balaureilor":"balaurel","balaurelul":"balaurel","balaurelule":"balaurel","balaurelului":"balaurel","balauri":"balaur","balaurii":"balaur","balaurilor":"balaur","balaurul":"balaur","balaurule":"balaur","balaurului":"balaur","balbai":"bălbău","balbaia":["bâlbâia","bâlbâi","bălbaia","bălbău"],"balbaiai":"bâlbâi","balbaiam":"bâlbâi","balbaiati":"bâlbâi","balbaiau":"bâlbâi","balbaie":["bâlbâie","bâlbâi","bălbaie","bălbău"],"balbaiele":["bâlbâiele","bâlbâială","bălbaiele","bălbău"],"balbaielei":"bâlbâială","balbaielele":"bâlbâială","balbaielelor":"bâlbâială","balbaieli":"bâlbâială","balbaii":["bâlbâii","bâlbâi","bălbăii","bălbău"],"balbaim":"bâlbâi","balbaind":"bâlbâi","balbaira":"bâlbâi","balbairam":"bâlbâi","balbairati":"bâlbâi","balbairea":"bâlbâire","balbairi":"bâlbâire","balbairii":"bâlbâire","balbairile":"bâlbâire","balbairilor":"bâlbâire","balbaise":"bâlbâi","balbaisem":"bâlbâi","balbaisera":"bâlbâi","balbaiseram":"bâlbâi","balbaiserati":"bâlbâi","balbaisesi":"bâlbâi","balbaisi":"bâlbâi","balbait":"bâlbâi","balbaita":["bâlbâită","bâlbâit","bâlbâita","bâlbâit"],"balbaite":"bâlbâit","balbaitele":"bâlbâit","balbaiti":["bâlbâiți","bâlbâi","bâlbâiți","bâlbâit"],"balbaitii":"bâlbâit","balbaitilor":"bâlbâit","balbaitoare":"bâlbâitor","balbaitoarea":"bâlbâitor","balbaitoarele":"bâlbâitor","balbaitori":"bâlbâitor","balbaitorii":"bâlbâitor","balbaitorul":"bâlbâitor","balbaitul":"bâlbâit","balbaitule":"bâlbâit","balbaitului":"bâlbâit","balbaituri":"bâlbâitură","balbaiturii":"bâlbâitură","balbaiturile":"bâlbâitură","balbaiturilor":"bâlbâitură","balbasul":"balbaș","balbasule":"balbaș","balbasului":"balbaș","balbaul":"bălbău","balbuirea":"bălbuire","balbuiri":"bălbuire","balbuirii":"bălbuire","balbuirile":"bălbuire","balbuirilor":"bălbuire","balbuita":["bălbuită","bălbuit","bălbuita","bălbuit"],"balbuite":"bălbuit","balbuitele":"bălbuit","balbuiti":"bălbuit","balbuitii":"bălbuit","balbuitul":"bălbuit","balcaniade":"balcaniadă","balcaniadei":"balcaniadă","balcaniadele":"balcaniadă","balcaniadelor":"balcaniadă","balcanica":["balcanică","balcanic","balcanica","balcanic"],"balcanice":"balcanic","balcanicele":"balcanic","balcanici":"balcanic","balcanicii":"balcanic","balcanicul":"balcanic","balcanisme":"balcanism","balcanismele":"balcanism","balcanismelor":"balcanism","balcanismul":"balcanism","balcanismule":"balcanism","balcanismului":"balcanism","balcaniste":"balcanistă","balcanistei":"balcanistă","balcanistele":"balcanistă","balcanistelor":"balcanistă","balcanisti":"balcanist","balcanistice":"balcanistică","balcanisticei":"balcanistică","balcanistii":"balcanist","balcanistilor":"balcanist","balcanistul":"balcanist","balcanistule":"balcanist","balcanistului":"balcanist","balcanologe":"balcanologă","balcanologei":"balcanologă","balcanologele":"balcanologă","balcanologelor":"balcanologă","balcanologi":"balcanolog","balcanologia":"balcanologie","balcanologiei":"balcanologie","balcanologii":["balcanologii","balcanolog","balcanologii","balcanologie"],"balcanologiile":"balcanologie","balcanologiilor":"balcanologie","balcanologilor":"balcanolog","balcanologul":"balcanolog","balcanologule":"balcanolog","balcanologului":"balcanolog","balcaul":"bâlcă","balcaule":"bâlcă","balcaului":"bâlcă","balcaza":["balcâză","balcâz","balcâza","balcâz"],"balcaze":"balcâz","balcazele":"balcâz","balcazi":"balcâz","balcazii":"balcâz","balcazul":"balcâz","balcicul":"balcic","balcicule":"balcic","balcicului":"balcic","balcicuri":"balcic","balcicurile":"balcic","balcicurilor":"balcic","balciul":"bâlci","balciule":"bâlci","balciului":"bâlci","balciuri":"bâlci","balciurile":"bâlci","balciurilor":"bâlci","balciz":"balcâz","balcoane":"balcon","balcoanele":"balcon","balcoanelor":"balcon","balcoasa":["bâlcoasă","bâlcos","bâlcoasa","bâlcos"],"balcoase":"bâlcos","balcoasele":"bâlcos","balconase":"balconaș","balconasele":"balconaș","balconaselor":"balconaș","balconasul":"balconaș","balconasule":"balconaș","balconasului":"balconaș","balconul":"balcon","balconule":"balcon","balconului":"balcon","balcosi":"bâlcos","balcosii":"bâlcos","balcosul":"bâlcos","baldachine":"baldachin","baldachinele":"baldachin","baldachinelor":"baldachin","baldachinul":"baldachin","baldachinule":"baldachin","baldachinului":"baldachin","baldahine":"baldahin","baldahinele":"baldahin","baldahinelor":"baldahin","baldahinul":"baldahin","baldahinule":"baldahin","baldahinului":"baldahin","baldare":"baldâr","baldarele":"baldâr","baldarelor":"baldâr","baldarul":"baldâr","baldarule":"baldâr","baldarului":"baldâr","baldir":"baldâr","bale":["băle","băl","bale","bală"],"baleg":"bălega","balega":"baligă","balegai":"bălega","balegam":["bălegăm","bălega","bălegam","bălega"],"balegand":"bălega","balegara":"bălega","balegaram":"bălega","balegarati":"bălega","balegari":"bălegar","balegarii":"bălegar","balegarilor":"bălegar","balegarul":"bălegar","balegarule":"bălegar","balegarului":"bălegar","balegaruri":"bălegar","balegarurile":"bălegar","balegarurilor":"bălegar","balegase":"bălega","balegasem":"bălega","balegasera":"bălega","balegaseram":"bălega","balegaserati":"bălega","balegasesi":"bălega","balegasi":"bălega","balegat":"bălega","balegati":"bălega","balegau":"bălega","balegi":["balegi","balegă","bălegi","bălega"],"balegii":"balegă","balegile":"balegă","balegilor":"balegă","balei":"bală","baleiaje":"baleiaj","baleiajele":"baleiaj","baleiajelor":"baleiaj","baleiajul":"baleiaj","baleiajule":"baleiaj","baleiajului":"baleiaj","balele":["bălele","băl","balele","bală","balele","bale"],"balelor":["balelor","bală","balelor","bale"],"balene":"balenă","balene albastre":"balenă albastră","balene cu cocoasa":"balenă cu cocoașă","balenei":"balenă","balenele":"balenă","balenelor":"balenă","baleni-romini":"Băleni-Români","baleni-sirbi":"Băleni-Sârbi","baleniere":"balenieră","balenierei":"balenieră","balenierele":"balenieră","balenierelor":"balenieră","balerce":"balercă","balercei":"balercă","balercele":"balercă","balercelor":"balercă","balercute":"balercuță","balercutei":"balercuță","balercutele":"balercuță","balercutelor":"balercuță","balerine":"balerină","balerinei":"balerină","balerinele":"balerină","balerinelor":"balerină","balerini":"balerin","balerinii":"balerin","balerinilor":"balerin","balerinul":"balerin","balerinule":"balerin","balerinului":"balerin","balete":"balet","baletele":"balet","baletelor":"balet","baletiste":"baletistă","baletistei":"baletistă","baletistele":"baletistă","baletistelor":"baletistă","baletisti":"baletist","baletistii":"baletist","baletistilor":"baletist","baletistul":"baletist","baletistule":"baletist","baletistului":"baletist","baletul":"balet","baletule":"balet","baletului":"balet","balgii":"balgiu","balgiii":"balgiu","balgiilor":"balgiu","balgiuul":"balgiu","balgiuule":"balgiu","balgiuului":"balgiu","bali":"băl","balia":"bâlie","baliairea":"băliăire","baliairi":"băliăire","baliairii":"băliăire","baliairile":"băliăire","baliairilor":"băliăire","balici":["balici","balic","balici","balică"],"balicii":["balicii","balic","balicii","balică"],"balicile":"balică","balicilor":["balicilor","balic","balicilor","balică"],"balicul":"balic","balicule":"balic","balicului":"balic","baliei":"bâlie","balig":"băliga","baligai":"băliga","baligam":["băligăm","băliga","băligam","băliga"],"baligand":"băliga","baligara":"băliga","baligaram":"băliga","baligarati":"băliga","baligari":"băligar","baligarii":"băligar","baligarilor":"băligar","baligarul":"băligar","baligarule":"băligar","baligarului":"băligar","baligase":"băliga","baligasem":"băliga","baligasera":"băliga","baligaseram":"băliga","baligaserati":"băliga","baligasesi":"băliga","baligasi":"băliga","baligat":"băliga","baligati":"băliga","baligau":"băliga","baligi":["baligi","baligă","băligi","băliga"],"baligii":"baligă","baligile":"baligă","baligilor":"baligă","baligute":"băliguță","baligutei":"băliguță","baligutele":"băliguță","baligutelor":"băliguță","balii":["bălii","băl","bâlii","bâlie"],"baliile":"bâlie","baliilor":"bâlie","balimezul":"balimez","balimezule":"balimez","balimezului":"balimez","balimezuri":"balimez","balimezurile":"balimez","balimezurilor":"balimez","baliste":"balistă","balistei":"balistă","balistele":"balistă","balistelor":"balistă","balistica":["balistică","balistic","balistica","balistic"],"balistice":"balistic","balisticele":"balistic","balistici":["balistici","balistic","balistici","balistică"],"balisticianul":"balistician","balisticianule":"balistician","balisticianului":"balistician","balisticiene":"balisticiană","balisticienei":"balisticiană","balisticienele":"balisticiană","balisticienelor":"balisticiană","balisticieni":"balistician","balisticienii":"balistician","balisticienilor":"balistician","balisticii":["balisticii","balistic","balisticii","balistică"],"balisticile":"balistică","balisticilor":"balistică","balisticul":"balistic","baliute":"băliuță","baliutei":"băliuță","baliutele":"băliuță","baliutelor":"băliuță","baliverne":"balivernă","balivernei":"balivernă","balivernele":"balivernă","balivernelor":"balivernă","balizai":"baliza","balizaje":"balizaj","balizajele":"balizaj","balizajelor":"balizaj","balizajul":"balizaj","balizajule":"balizaj","balizajului":"balizaj","balizam":["balizăm","baliza","balizam","baliza"],"balizand":"baliza","balizara":"baliza","balizaram":"baliza","balizarati":"baliza","balizarea":"balizare","balizari":"balizare","balizarii":"balizare","balizarile":"balizare","balizarilor":"balizare","balizase":"baliza","balizasem":"baliza","balizasera":"baliza","balizaseram":"baliza","balizaserati":"baliza","balizasesi":"baliza","balizasi":"baliza","balizat":"baliza","balizati":"baliza","balizau":"baliza","balize":"baliză","balizeaza":"baliza","balizei":"baliză","balizele":"baliză","balizelor":"baliză","balizez":"baliza","balizezi":"baliza","balizori":"balizor","balizorii":"balizor","balizorilor":"balizor","balizorul":"balizor","balizorule":"balizor","balizorului":"balizor","balmajea":"bălmăji","balmajeai":"bălmăji","balmajeam":"bălmăji","balmajeati":"bălmăji","balmajeau":"bălmăji","balmajeli":"bălmăjeală","balmajelii":"bălmăjeală","balmajelile":"bălmăjeală","balmajelilor":"bălmăjeală","balmajesc":"bălmăji","balmajeste":"bălmăji","balmajesti":"bălmăji","balmajii":"bălmăji","balmajim":"bălmăji","balmajind":"bălmăji","balmajira":"bălmăji","balmajiram":"bălmăji","balmajirati":"bălmăji","balmajise":"bălmăji","balmajisem":"bălmăji","balmajisera":"bălmăji","balmajiseram":"bălmăji","balmajiserati":"bălmăji","balmajisesi":"bălmăji","balmajisi":"bălmăji","balmajit":"bălmăji","balmajiti":"bălmăji","balmajitoare":"bălmăjitor","balmajitoarea":"bălmăjitor","balmajitoarele":"bălmăjitor","balmajitori":"bălmăjitor","balmajitorii":"bălmăjitor","balmajitorul":"bălmăjitor","balmojea":"bălmoji","balmojeai":"bălmoji","balmojeam":"bălmoji","balmojeati":"bălmoji","balmojeau":"bălmoji","balmojesc":"bălmoji","balmojeste":"bălmoji","balmojesti":"bălmoji","balmojii":"bălmoji","balmojim":"bălmoji","balmojind":"bălmoji","balmojira":"bălmoji","balmojiram":"bălmoji","balmojirati":"bălmoji","balmojise":"bălmoji","balmojisem":"bălmoji","balmojisera":"bălmoji","balmojiseram":"bălmoji","balmojiserati":"bălmoji","balmojisesi":"bălmoji","balmojisi":"bălmoji","balmojit":"bălmoji","balmojiti":"bălmoji","balmosul":"balmoș","balmosule":"balmoș","balmosului":"balmoș","balmusul":"balmuș","balmusule":"balmuș","balmusului":"balmuș","balmusuri":"balmuș","balmusurile":"balmuș","balmusurilor":"balmuș","balneara":["balneară","balnear","balneara","balnear"],"balneare":"balnear","balnearele":"balnear","balneari":"balnear","balnearii":"balnear","balnearul":"balnear","balneoclimatica":["balneoclimatică","balneoclimatic","balneoclimatica","balneoclimatic"],"balneoclimatice":"balneoclimatic","balneoclimaticele":"balneoclimatic","balneoclimatici":"balneoclimatic","balneoclimaticii":"balneoclimatic","balneoclimaticul":"balneoclimatic","balneologe":"balneologă","balneologei":"balneologă","balneologele":"balneologă","balneologelor":"balneologă","balneologi":"balneolog","balneologia":"balneologie","balneologica":["balneologică","balneologic","balneologica","balneologic"],"balneologice":"balneologic","balneologicele":"balneologic","balneologici":"balneologic","balneologicii":"balneologic","balneologicul":"balneologic"};
@@ -0,0 +1 @@
+export default {"balneologiei":"balneologie","balneologii":["balneologii","balneolog","balneologii","balneologie"],"balneologiile":"balneologie","balneologiilor":"balneologie","balneologilor":"balneolog","balneologul":"balneolog","balneologule":"balneolog","balneologului":"balneolog","balneoterapia":"balneoterapie","balneoterapiei":"balneoterapie","balneoterapii":"balneoterapie","baloane":"balon","baloane cu aer cald":"balon cu aer cald","baloane de sapun":"balon de săpun","baloane dirijabile":"balon dirijabil","baloanele":"balon","baloanelor":"balon","baloasa":["băloasă","bălos","băloasa","bălos"],"baloase":"bălos","baloasele":"bălos","balomiru de cimp":"Balomiru de Câmp","balonai":"balona","balonam":["balonăm","balona","balonam","balona"],"balonand":"balona","balonara":"balona","balonaram":"balona","balonarati":"balona","balonarea":"balonare","balonari":"balonare","balonarii":"balonare","balonarile":"balonare","balonarilor":"balonare","balonase":["balonase","balona","balonașe","balonaș"],"balonasele":"balonaș","balonaselor":"balonaș","balonasem":"balona","balonasera":"balona","balonaseram":"balona","balonaserati":"balona","balonasesi":"balona","balonasi":"balona","balonasul":"balonaș","balonasule":"balonaș","balonasului":"balonaș","balonat":"balona","balonata":["balonată","balonat","balonata","balonat"],"balonate":"balonat","balonatele":"balonat","balonati":["balonați","balona","balonați","balonat"],"balonatii":"balonat","balonatul":"balonat","balonau":"balona","baloneaza":"balona","balonete":"balonet","balonetele":"balonet","balonetelor":"balonet","balonetul":"balonet","balonetule":"balonet","balonetului":"balonet","balonez":"balona","balonezi":"balona","balonul":"balon","balonule":"balon","balonului":"balon","balonzaidele":"balonzaide","balonzaidelor":"balonzaide","balonzaidelui":"balonzaide","balosei":"băloșel","baloseii":"băloșel","baloseilor":"băloșel","baloselul":"băloșel","baloselule":"băloșel","baloselului":"băloșel","balosi":["baloși","baloș","băloși","bălos"],"balosii":"bălos","balosile":"baloș","balosilor":"baloș","balosul":["baloșul","baloș","bălosul","bălos"],"balosule":"baloș","balosului":"baloș","balotaje":"balotaj","balotajele":"balotaj","balotajelor":"balotaj","balotajul":"balotaj","balotajule":"balotaj","balotajului":"balotaj","balotul":"balot","balotule":"balot","balotului":"balot","baloturi":"balot","baloturile":"balot","baloturilor":"balot","balsamai":"bălsăma","balsamam":["bălsămăm","bălsăma","bălsămam","bălsăma"],"balsamand":"bălsăma","balsamara":"bălsăma","balsamaram":"bălsăma","balsamarati":"bălsăma","balsamase":"bălsăma","balsamasem":"bălsăma","balsamasera":"bălsăma","balsamaseram":"bălsăma","balsamaserati":"bălsăma","balsamasesi":"bălsăma","balsamasi":"bălsăma","balsamat":"bălsăma","balsamata":["bălsămată","bălsămat","bălsămata","bălsămat"],"balsamate":"bălsămat","balsamatele":"bălsămat","balsamati":["bălsămați","bălsăma","bălsămați","bălsămat"],"balsamatii":"bălsămat","balsamatul":"bălsămat","balsamau":"bălsăma","balsamea":"bălsămi","balsameai":"bălsămi","balsameam":"bălsămi","balsameati":"bălsămi","balsameau":"bălsămi","balsameaza":"bălsăma","balsamesc":"bălsămi","balsameste":"bălsămi","balsamesti":"bălsămi","balsamez":"bălsăma","balsamezi":"bălsăma","balsamica":["balsamică","balsamic","balsamica","balsamic"],"balsamice":"balsamic","balsamicele":"balsamic","balsamici":"balsamic","balsamicii":"balsamic","balsamicul":"balsamic","balsamii":"bălsămi","balsamim":"bălsămi","balsamind":"bălsămi","balsamine":"balsamină","balsaminei":"balsamină","balsaminele":"balsamină","balsaminelor":"balsamină","balsamira":"bălsămi","balsamiram":"bălsămi","balsamirati":"bălsămi","balsamise":"bălsămi","balsamisem":"bălsămi","balsamisera":"bălsămi","balsamiseram":"bălsămi","balsamiserati":"bălsămi","balsamisesi":"bălsămi","balsamisi":"bălsămi","balsamit":"bălsămi","balsamita":["bălsămită","bălsămit","bălsămita","bălsămit"],"balsamite":"bălsămit","balsamitele":"bălsămit","balsamiti":["bălsămiți","bălsămi","bălsămiți","bălsămit"],"balsamitii":"bălsămit","balsamitul":"bălsămit","balsamuia":"balsamui","balsamuiai":"balsamui","balsamuiam":"balsamui","balsamuiati":"balsamui","balsamuiau":"balsamui","balsamuie":"balsamui","balsamuii":"balsamui","balsamuim":"balsamui","balsamuind":"balsamui","balsamuira":"balsamui","balsamuiram":"balsamui","balsamuirati":"balsamui","balsamuise":"balsamui","balsamuisem":"balsamui","balsamuisera":"balsamui","balsamuiseram":"balsamui","balsamuiserati":"balsamui","balsamuisesi":"balsamui","balsamuisi":"balsamui","balsamuit":"balsamui","balsamuiti":"balsamui","balsamuri":"balsam","balsamuri de par":"balsam de păr","balsamuri de rufe":"balsam de rufe","balsaul":"balsa","balsaule":"balsa","balsaului":"balsa","baltace":"băltac","baltacele":["băltacele","băltac","băltăcele","băltăcel"],"baltacelele":"băltăcel","baltacelelor":"băltăcel","baltacelor":"băltac","baltacelul":"băltăcel","baltacelule":"băltăcel","baltacelului":"băltăcel","baltacul":["baltacul","baltac","băltacul","băltac"],"baltacule":["baltacule","baltac","băltacule","băltac"],"baltacului":["baltacului","baltac","băltacului","băltac"],"baltacuri":"baltac","baltacurile":"baltac","baltacurilor":"baltac","baltagase":"băltăgaș","baltagasele":"băltăgaș","baltagaselor":"băltăgaș","baltagasul":"băltăgaș","baltagasule":"băltăgaș","baltagasului":"băltăgaș","baltage":"baltag","baltagele":["baltagele","baltag","băltăgele","băltăgel"],"baltagelele":"băltăgel","baltagelelor":"băltăgel","baltagelor":"baltag","baltagelul":"băltăgel","baltagelule":"băltăgel","baltagelului":"băltăgel","baltagii":"baltagiu","baltagiii":"baltagiu","baltagiilor":"baltagiu","baltagiuul":"baltagiu","baltagiuule":"baltagiu","baltagiuului":"baltagiu","baltagul":"baltag","baltagule":"baltag","baltagului":"baltag","baltaie":"băltău","baltaiele":"băltău","baltaielor":"băltău","baltarea":"bălțare","baltareata":["băltăreață","băltăreț","băltăreața","băltăreț"],"baltarete":"băltăreț","baltaretele":"băltăreț","baltareti":"băltăreț","baltaretii":"băltăreț","baltaretul":"băltăreț","baltari":"bălțare","baltaria":"băltărie","baltariei":"băltărie","baltarii":["bălțarii","bălțare","băltării","băltărie"],"baltariile":"băltărie","baltariilor":"băltărie","baltarile":"bălțare","baltarilor":"bălțare","baltata":["bălțată","bălțat","bălțata","bălțat"],"baltate":"bălțat","baltatela":["băltățelă","băltățel","băltățela","băltățel"],"baltatele":["bălțatele","bălțat","băltățele","băltățel"],"baltatelele":"băltățel","baltateli":"băltățel","baltatelii":"băltățel","baltatelul":"băltățel","baltati":"bălțat","baltatii":"bălțat","baltatul":"bălțat","baltaturi":"bălțătură","baltaturii":"bălțătură","baltaturile":"bălțătură","baltaturilor":"bălțătură","baltaul":"băltău","baltaule":"băltău","baltaului":"băltău","balti":"baltă","baltica":["baltică","baltic","baltica","baltic"],"baltice":"baltic","balticeaua":"bălticea","balticele":["balticele","baltic","bălticele","bălticea","bălticele","bălticică"],"balticelei":["bălticelei","bălticea","bălticelei","bălticică"],"balticelele":["bălticelele","bălticea","bălticelele","bălticică"],"balticelelor":["bălticelelor","bălticea","bălticelelor","bălticică"],"baltici":["baltici","baltic","băltici","băltică","bălțici","bălțică"],"balticii":["balticii","baltic","bălticii","băltică","bălțicii","bălțică"],"balticile":["bălticile","băltică","bălțicile","bălțică"],"balticilor":["bălticilor","băltică","bălțicilor","bălțică"],"balticul":"baltic","baltigul":"băltig","baltigule":"băltig","baltigului":"băltig","baltiguri":"băltig","baltigurile":"băltig","baltigurilor":"băltig","baltii":"baltă","baltile":"baltă","baltilor":"baltă","baltine":"băltină","baltinei":"băltină","baltinele":"băltină","baltinelor":"băltină","baltisul":"băltiș","baltisule":"băltiș","baltisului":"băltiș","baltisuri":"băltiș","baltisurile":"băltiș","baltisurilor":"băltiș","baltite":"băltiță","baltitei":"băltiță","baltitele":"băltiță","baltitelor":"băltiță","baltoace":"băltoacă","baltoage":"băltoagă","baltoagei":"băltoagă","baltoagele":"băltoagă","baltoagelor":"băltoagă","baltoaie":"băltoi","baltoaiele":"băltoi","baltoaielor":"băltoi","baltoasa":["băltoasă","băltos","băltoasa","băltos"],"baltoase":"băltos","baltoasele":"băltos","baltoiul":"băltoi","baltoiule":"băltoi","baltoiului":"băltoi","baltosi":"băltos","baltosii":"băltos","baltosul":"băltos","baltuci":"băltucă","baltucii":"băltucă","baltucile":"băltucă","baltucilor":"băltucă","baltuici":"bălțuică","baltuicii":"bălțuică","baltuicile":"bălțuică","baltuicilor":"bălțuică","baltul":"balț","baltule":"balț","baltului":"balț","balturi":"balț","balturile":"balț","balturilor":"balț","baltute":"băltuță","baltutei":"băltuță","baltutele":"băltuță","baltutelor":"băltuță","baluce":"bălucă","balucei":"bălucă","balucele":"bălucă","balucelor":"bălucă","balul":["balul","bal","bălul","băl"],"balule":"bal","balului":"bal","baluri":"bal","baluri mascate":"bal mascat","balurile":"bal","balurilor":"bal","baluste":"bălușcă","balustei":"bălușcă","balustele":"bălușcă","balustelor":"bălușcă","balustrade":"balustradă","balustradei":"balustradă","balustradele":"balustradă","balustradelor":"balustradă","balustre":"balustră","balustrei":"balustră","balustrele":"balustră","balustrelor":"balustră","balustri":"balustru","balustrii":"balustru","balustrilor":"balustru","balustrul":"balustru","balustrule":"balustru","balustrului":"balustru","baluta":["băluță","băluț","băluța","băluț"],"balute":"băluț","balutele":"băluț","baluti":"băluț","balutii":"băluț","balutul":"băluț","balzaciana":["balzaciană","balzacian","balzaciana","balzacian"],"balzacianismul":"balzacianism","balzacianismule":"balzacianism","balzacianismului":"balzacianism","balzacianul":"balzacian","balzaciene":"balzacian","balzacienele":"balzacian","balzacieni":"balzacian","balzacienii":"balzacian","bambusi":"bambus","bambusii":"bambus","bambusilor":"bambus","bambusul":"bambus","bambusule":"bambus","bambusului":"bambus","bame":"bamă","bamei":"bamă","bamele":"bamă","bamelor":"bamă","banacutul":"bănăcuț","banacutule":"bănăcuț","banacutului":"bănăcuț","banacuturi":"bănăcuț","banacuturile":"bănăcuț","banacuturilor":"bănăcuț","banala":["banală","banal","banala","banal"],"banale":"banal","banalele":"banal","banali":"banal","banalii":"banal","banalitatea":"banalitate","banalitati":"banalitate","banalitatii":"banalitate","banalitatile":"banalitate","banalitatilor":"banalitate","banalizai":"banaliza","banalizam":["banalizăm","banaliza","banalizam","banaliza"],"banalizand":"banaliza","banalizara":"banaliza","banalizaram":"banaliza","banalizarati":"banaliza","banalizarea":"banalizare","banalizari":"banalizare","banalizarii":"banalizare","banalizase":"banaliza","banalizasem":"banaliza","banalizasera":"banaliza","banalizaseram":"banaliza","banalizaserati":"banaliza","banalizasesi":"banaliza","banalizasi":"banaliza","banalizat":"banaliza","banalizati":"banaliza","banalizatul":"banalizat","banalizatule":"banalizat","banalizatului":"banalizat","banalizaturi":"banalizat","banalizaturile":"banalizat","banalizaturilor":"banalizat","banalizau":"banaliza","banalizeaza":"banaliza","banalizez":"banaliza","banalizezi":"banaliza","banalul":"banal","bananaie":"bananau","bananaiele":"bananau","bananaielor":"bananau","bananauul":"bananau","bananauule":"bananau","bananauului":"bananau","banane":"banană","bananei":"banană","bananele":"banană","bananelor":"banană","banani":"banan","bananieri":"bananier","bananierile":"bananier","bananierilor":"bananier","bananierul":"bananier","bananierule":"bananier","bananierului":"bananier","bananii":"banan","bananilor":"banan","bananul":"banan","bananule":"banan","bananului":"banan","banari":"bănar","banaria":"bănărie","banariei":"bănărie","banarii":["bănarii","bănar","bănării","bănărie"],"banariile":"bănărie","banariilor":"bănărie","banarilor":"bănar","banaritul":"bănărit","banaritule":"bănărit","banaritului":"bănărit","banarituri":"bănărit","banariturile":"bănărit","banariturilor":"bănărit","banarul":"bănar","banarule":"bănar","banarului":"bănar","banate":"banat","banateana":["bănățeană","bănățean","bănățeana","bănățean"],"banateanul":"bănățean","banateanule":"bănățean","banateanului":"bănățean","banatele":["banatele","banat","bănățele","bănățel"],"banatelele":"bănățel","banatelelor":"bănățel","banatelor":"banat","banatelul":"bănățel","banatelule":"bănățel","banatelului":"bănățel","banatence":"bănățeancă","banatencei":"bănățeancă","banatencele":"bănățeancă","banatencelor":"bănățeancă","banatene":["bănățene","bănățean","bănățene","bănățeană"],"banateneasca":["bănățenească","bănățenesc","bănățeneasca","bănățenesc"],"banatenei":"bănățeană","banatenele":["bănățenele","bănățean","bănățenele","bănățeană"],"banatenelor":"bănățeană","banatenescul":"bănățenesc","banatenesti":"bănățenesc","banatenestii":"bănățenesc","banatenestile":"bănățenesc","banateni":"bănățean","banatenii":"bănățean","banatenilor":"bănățean","banatite":"banatit","banatitele":"banatit","banatitelor":"banatit","banatitul":"banatit","banatitule":"banatit","banatitului":"banatit","banatul":["banatul","banat","bănatul","bănat"],"banatule":["banatule","banat","bănatule","bănat"],"banatului":["banatului","banat","bănatului","bănat"],"banaturi":"bănat","banaturile":"bănat","banaturilor":"bănat","bancadita":["băncădită","băncădit","băncădita","băncădit"],"bancadite":"băncădit","bancaditele":"băncădit","bancaditi":"băncădit","bancaditii":"băncădit","bancaditul":"băncădit","bancara":["bancară","bancar","bancara","bancar"],"bancare":"bancar","bancarele":"bancar","bancari":"bancar","bancarii":"bancar","bancarul":"bancar","bancenii de jos":"Bâscenii de Jos","banchereasca":["bancherească","bancheresc","banchereasca","bancheresc"],"bancherescul":"bancheresc","bancheresti":"bancheresc","bancherestii":"bancheresc","bancherestile":"bancheresc","bancheri":"bancher","bancherii":"bancher","bancherilor":"bancher","bancherul":"bancher","bancherule":"bancher","bancherului":"bancher","banchetai":"bancheta","banchetam":["banchetăm","bancheta","banchetam","bancheta"],"banchetand":"bancheta","banchetara":"bancheta","banchetaram":"bancheta","banchetarati":"bancheta","banchetase":"bancheta","banchetasem":"bancheta","banchetasera":"bancheta","banchetaseram":"bancheta","banchetaserati":"bancheta","banchetasesi":"bancheta","banchetasi":"bancheta","banchetat":"bancheta","banchetati":"bancheta","banchetau":"bancheta","banchete":["banchete","banchet","banchete","banchetă"],"bancheteaza":"bancheta","banchetei":"banchetă","banchetele":["banchetele","banchet","banchetele","banchetă"],"banchetelor":["banchetelor","banchet","banchetelor","banchetă"],"banchetez":"bancheta","banchetezi":"bancheta","banchetul":"banchet","banchetule":"banchet","banchetului":"banchet","banchier":"bancher","banchize":"banchiză","banchizei":"banchiză","banchizele":"banchiză","banchizelor":"banchiză","banci":"bancă","banci centrale":"bancă centrală","bancii":"bancă","bancile":"bancă","bancilor":"bancă","bancnote":"bancnotă","bancnotei":"bancnotă","bancnotele":"bancnotă","bancnotelor":"bancnotă","bancomate":"bancomat","bancomatele":"bancomat","bancomatelor":"bancomat","bancomatul":"bancomat","bancomatule":"bancomat","bancomatului":"bancomat","bancrutai":"bancruta","bancrutam":["bancrutăm","bancruta","bancrutam","bancruta"],"bancrutand":"bancruta","bancrutara":"bancruta","bancrutaram":"bancruta","bancrutarati":"bancruta","bancrutari":"bancrutar","bancrutarii":"bancrutar","bancrutarilor":"bancrutar","bancrutarul":"bancrutar","bancrutarule":"bancrutar","bancrutarului":"bancrutar","bancrutase":"bancruta","bancrutasem":"bancruta","bancrutasera":"bancruta","bancrutaseram":"bancruta","bancrutaserati":"bancruta","bancrutasesi":"bancruta","bancrutasi":"bancruta","bancrutat":"bancruta","bancrutati":"bancruta","bancrutau":"bancruta","bancrute":"bancrută","bancruteaza":"bancruta","bancrutei":"bancrută","bancrutele":"bancrută","bancrutelor":"bancrută","bancrutez":"bancruta","bancrutezi":"bancruta","bancul":"banc","bancule":"banc","banculite":"bănculiță","banculitei":"bănculiță","banculitele":"bănculiță","banculitelor":"bănculiță","bancului":"banc","bancuri":"banc","bancuri de proba":"banc de probă","bancurile":"banc","bancurilor":"banc","bancute":"băncuță","bancutei":"băncuță","bancutele":"băncuță","bancutelor":"băncuță","band":"bea","bandajai":"bandaja","bandajam":["bandajăm","bandaja","bandajam","bandaja"],"bandajand":"bandaja","bandajara":"bandaja","bandajaram":"bandaja","bandajarati":"bandaja","bandajarea":"bandajare","bandajari":"bandajare","bandajarii":"bandajare","bandajarile":"bandajare","bandajarilor":"bandajare","bandajase":"bandaja","bandajasem":"bandaja","bandajasera":"bandaja","bandajaseram":"bandaja","bandajaserati":"bandaja","bandajasesi":"bandaja","bandajasi":"bandaja","bandajat":"bandaja","bandajati":"bandaja","bandajatul":"bandajat","bandajatule":"bandajat","bandajatului":"bandajat","bandajaturi":"bandajat","bandajaturile":"bandajat","bandajaturilor":"bandajat","bandajau":"bandaja","bandaje":"bandaj","bandajeaza":"bandaja","bandajele":"bandaj","bandajelor":"bandaj","bandajez":"bandaja","bandajezi":"bandaja","bandajul":"bandaj","bandajule":"bandaj","bandajului":"bandaj","bande":"bandă","bandei":"bandă","bandele":"bandă","bandelor":"bandă","banderii":"banderiu","banderiile":"banderiu","banderiilor":"banderiu","banderile":"banderilă","banderilei":"banderilă","banderilele":"banderilă","banderilelor":"banderilă","banderiuul":"banderiu","banderiuule":"banderiu","banderiuului":"banderiu","banderole":"banderolă","banderolei":"banderolă","banderolele":"banderolă","banderolelor":"banderolă","bandiere":"bandieră","bandierei":"bandieră","bandierele":"bandieră","bandierelor":"bandieră","banditeasca":["banditească","banditesc","banditeasca","banditesc"],"banditescul":"banditesc","banditesti":"banditesc","banditestii":"banditesc","banditestile":"banditesc","banditi":"bandit","banditii":"bandit","banditilor":"bandit","banditisme":"banditism","banditismele":"banditism","banditismelor":"banditism","banditismul":"banditism","banditismule":"banditism","banditismului":"banditism","banditul":"bandit","banditule":"bandit","banditului":"bandit","bandoliere":"bandolieră","bandolierei":"bandolieră","bandolierele":"bandolieră","bandolierelor":"bandolieră","bandraburcaul":"bandraburcă","bandraburcaule":"bandraburcă","bandraburcaului":"bandraburcă","bandraburce":"bandraburcă","bandraburcei":"bandraburcă","bandraburcelor":"bandraburcă","banduliere":"bandulieră","bandulierei":"bandulieră","bandulierele":"bandulieră","bandulierelor":"bandulieră","bandurari":"bandurar","bandurarii":"bandurar","bandurarilor":"bandurar","bandurarul":"bandurar","bandurarule":"bandurar","bandurarului":"bandurar","banduri":"bandură","bandurici":"băndurică","banduricii":"băndurică","banduricile":"băndurică","banduricilor":"băndurică","bandurii":"bandură","bandurile":"bandură","bandurilor":"bandură","banduriste":"banduristă","banduristei":"banduristă","banduristele":"banduristă","banduristelor":"banduristă","banduristi":"bandurist","banduristii":"bandurist","banduristilor":"bandurist","banduristul":"bandurist","banduristule":"bandurist","banduristului":"bandurist","banea":"băni","baneai":"băni","baneam":"băni","baneasca":["bănească","bănesc","băneasca","bănesc"],"banease":"băneasă","baneati":"băni","baneau":"băni","banesc":"băni","banescul":"bănesc","banese":"băneasă","banesei":"băneasă","banesele":"băneasă","baneselor":"băneasă","baneste":"băni","banesti":["bănești","bănesc","bănești","băni"],"banestii":"bănesc","banestile":"bănesc","banetul":"bănet","banetule":"bănet","banetului":"bănet","banguri sonice":"bang sonic","bani":"ban","bania":"bănie","baniceri":"bănicer","banicerii":"bănicer","banicerilor":"bănicer","banicerul":"bănicer","banicerule":"bănicer","banicerului":"bănicer","banici":"bănică","banicii":"bănică","banicile":"bănică","banicilor":"bănică","banicioare":"bănicioară","banicioarei":"bănicioară","banicioarele":"bănicioară","banicioarelor":"bănicioară","baniei":"bănie","baniere":"banieră","banierei":"banieră","banierele":"banieră","banierelor":"banieră","banii":["banii","ban","bănii","băni","bănii","bănie"],"baniile":"bănie","baniilor":"bănie","banilor":"ban","banim":"băni","banind":"băni","banira":"băni","baniram":"băni","banirati":"băni","banise":"băni","banisem":"băni","banisera":"băni","baniseram":"băni","baniserati":"băni","banisesi":"băni","banisi":"băni","banisori":"bănișor","banisorii":"bănișor","banisorilor":"bănișor","banisorul":"bănișor","banisorule":"bănișor","banisorului":"bănișor","banit":"băni","banite":"baniță","banitei":"baniță","banitele":"baniță","banitelor":"baniță","baniti":"băni","banjoul":"banjo","banjoule":"banjo","banjoului":"banjo","banjouri":"banjo","banjourile":"banjo","banjourilor":"banjo","bankingul":"banking","bankingule":"banking","bankingului":"banking","bannere":"banner","bannerele":"banner","bannerelor":"banner","bannerul":"banner","bannerule":"banner","bannerului":"banner","banoasa":["bănoasă","bănos","bănoasa","bănos"],"banoase":"bănos","banoasele":"bănos","banosi":"bănos","banosii":"bănos","banosul":"bănos","bantalirea":"băntălire","bantaliri":"băntălire","bantalirii":"băntălire","bantalirile":"băntălire","bantalirilor":"băntălire","bantalita":["băntălită","băntălit","băntălita","băntălit"],"bantalite":"băntălit","bantalitele":"băntălit","bantaliti":"băntălit","bantalitii":"băntălit","bantalitul":"băntălit","bantoida":["bantoidă","bantoid","bantoida","bantoid"],"bantoide":"bantoid","bantoidele":"bantoid","bantoidul":"bantoid","bantoizi":"bantoid","bantoizii":"bantoid","bantuia":"bântui","bantuiai":"bântui","bantuiam":"bântui","bantuiati":"bântui","bantuiau":"bântui","bantuie":"bântui","bantuiele":"bântuială","bantuielei":"bântuială","bantuielele":"bântuială","bantuielelor":"bântuială","bantuieli":"bântuială","bantuii":"bântui","bantuim":"bântui","bantuind":"bântui","bantuira":"bântui","bantuiram":"bântui","bantuirati":"bântui","bantuirea":"bântuire","bantuiri":"bântuire","bantuirii":"bântuire","bantuirile":"bântuire","bantuirilor":"bântuire","bantuise":"bântui","bantuisem":"bântui","bantuisera":"bântui","bantuiseram":"bântui","bantuiserati":"bântui","bantuisesi":"bântui","bantuisi":"bântui","bantuit":"bântui","bantuita":["bântuită","bântuit","bântuita","bântuit"],"bantuite":"bântuit","bantuitele":"bântuit","bantuiti":["bântuiți","bântui","bântuiți","bântuit"],"bantuitii":"bântuit","bantuitoare":"bântuitor","bantuitoarea":"bântuitor","bantuitoarele":"bântuitor","bantuitori":"bântuitor","bantuitorii":"bântuitor","bantuitorul":"bântuitor","bantuitul":"bântuit","bantul":"bantu","bantule":"bantu","bantului":"bantu","bantustane":"bantustan","bantustanele":"bantustan","bantustanelor":"bantustan","bantustanizarea":"bantustanizare","bantustanizari":"bantustanizare","bantustanizarii":"bantustanizare","bantustanizarile":"bantustanizare","bantustanizarilor":"bantustanizare","bantustanul":"bantustan","bantustanule":"bantustan","bantustanului":"bantustan","banuia":"bănui","banuiai":"bănui","banuiam":"bănui","banuiati":"bănui","banuiau":"bănui","banuieli":"bănuială","banuielii":"bănuială","banuielile":"bănuială","banuielilor":"bănuială","banuielnica":["bănuielnică","bănuielnic","bănuielnica","bănuielnic"],"banuielnice":"bănuielnic","banuielnicele":"bănuielnic","banuielnici":"bănuielnic","banuielnicii":"bănuielnic","banuielnicul":"bănuielnic","banuiesc":"bănui","banuieste":"bănui","banuiesti":"bănui","banuii":"bănui","banuim":"bănui","banuind":"bănui","banuira":"bănui","banuiram":"bănui","banuirati":"bănui","banuirea":"bănuire","banuiri":"bănuire","banuirii":"bănuire","banuirile":"bănuire","banuirilor":"bănuire","banuise":"bănui","banuisem":"bănui","banuisera":"bănui","banuiseram":"bănui","banuiserati":"bănui","banuisesi":"bănui","banuisi":"bănui","banuit":"bănui","banuita":["bănuită","bănuit","bănuita","bănuit"],"banuite":["bănuite","bănuit","bănuite","bănuită"],"banuitei":"bănuită","banuitele":["bănuitele","bănuit","bănuitele","bănuită"],"banuitelor":"bănuită","banuiti":["bănuiți","bănui","bănuiți","bănuit"],"banuitii":"bănuit","banuitilor":"bănuit","banuitoare":"bănuitor","banuitoarea":"bănuitor","banuitoarele":"bănuitor","banuitori":"bănuitor","banuitorii":"bănuitor","banuitorul":"bănuitor","banuitul":"bănuit","banuitule":"bănuit","banuitului":"bănuit","banul":"ban","banule":"ban","banuleti":"bănuleț","banuletii":"bănuleț","banuletilor":"bănuleț","banuletul":"bănuleț","banuletule":"bănuleț","banuletului":"bănuleț","banului":"ban","banutei":"bănuțel","banuteii":"bănuțel","banuteilor":"bănuțel","banutelul":"bănuțel","banutelule":"bănuțel","banutelului":"bănuțel","banuti":"bănuț","banutii":"bănuț","banutilor":"bănuț","banutul":"bănuț","banutule":"bănuț","banutului":"bănuț","banzoiul":"bânzoi","banzoiule":"bânzoi","banzoiului":"bânzoi","baobabi":"baobab","baobabii":"baobab","baobabilor":"baobab","baobabul":"baobab","baobabule":"baobab","baobabului":"baobab","baptismul":"baptism","baptismule":"baptism","baptismului":"baptism","baptiste":"baptistă","baptistei":"baptistă","baptistele":"baptistă","baptistelor":"baptistă","baptisterii":"baptisteriu","baptisteriile":"baptisteriu","baptisteriilor":"baptisteriu","baptisteriul":"baptisteriu","baptisteriule":"baptisteriu","baptisteriului":"baptisteriu","baptisti":"baptist","baptistii":"baptist","baptistilor":"baptist","baptistul":"baptist","baptistule":"baptist","baptistului":"baptist","barabe":"barabă","barabei":"barabă","barabele":"barabă","barabelor":"barabă","baraboii":"baraboi","baraboilor":"baraboi","baraboistea":"baraboiște","baraboisti":"baraboiște","baraboistii":"baraboiște","baraboistile":"baraboiște","baraboistilor":"baraboiște","baraboistine":"baraboiștină","baraboistinei":"baraboiștină","baraboistinele":"baraboiștină","baraboistinelor":"baraboiștină","baraboiul":"baraboi","baraboiule":"baraboi","baraboiului":"baraboi","barabule":"barabulă","barabulei":"barabulă","barabulele":"barabulă","barabulelor":"barabulă","barabulistea":"barabuliște","barabulisti":"barabuliște","barabulistii":"barabuliște","barabulistile":"barabuliște","barabulistilor":"barabuliște","barabuste":"barabușcă","barabustei":"barabușcă","barabustele":"barabușcă","barabustelor":"barabușcă","baracamente":"baracament","baracamentele":"baracament","baracamentelor":"baracament","baracamentul":"baracament","baracamentule":"baracament","baracamentului":"baracament","barace":"baracă","baracei":"baracă","baracele":"baracă","baracelor":"baracă","baraci":"baracă","baraciunea":"bărăciune","baraciuni":"bărăciune","baraciunii":"bărăciune","baraciunile":"bărăciune","baraciunilor":"bărăciune","baracude mari":"baracudă mare","baracute":"bărăcuță","baracutei":"bărăcuță","baracutele":"bărăcuță","baracutelor":"bărăcuță","baraganul":"bărăgan","baraganule":"bărăgan","baraganului":"bărăgan","baraganuri":"bărăgan","baraganurile":"bărăgan","baraganurilor":"bărăgan","barai":"bara","baraia":"bârâi","baraiai":"bârâi","baraiam":"bârâi","baraiati":"bârâi","baraiau":"bârâi","baraie":"bârâi","baraii":"bârâi","baraim":"bârâi","baraind":"bârâi","baraira":"bârâi","barairam":"bârâi","barairati":"bârâi","baraise":"bârâi","baraisem":"bârâi","baraisera":"bârâi","baraiseram":"bârâi","baraiserati":"bârâi","baraisesi":"bârâi","baraisi":"bârâi","barait":"bârâi","baraiti":"bârâi","baraje":"baraj","barajele":"baraj","barajelor":"baraj","barajul":"baraj","barajule":"baraj","barajului":"baraj","baram":["barăm","bara","baram","bara"],"baramoiuul":"baramoiu","baramoiuule":"baramoiu","baramoiuului":"baramoiu","baramoiuuri":"baramoiu","baramoiuurile":"baramoiu","baramoiuurilor":"baramoiu","barand":"bara","baranea":"bărăni","baraneai":"bărăni","baraneam":"bărăni","baraneati":"bărăni","baraneau":"bărăni","baranesc":"bărăni","baraneste":"bărăni","baranesti":"bărăni","baranii":"bărăni","baranim":"bărăni","baranind":"bărăni","baranira":"bărăni","baraniram":"bărăni","baranirati":"bărăni","baranise":"bărăni","baranisem":"bărăni","baranisera":"bărăni","baraniseram":"bărăni","baraniserati":"bărăni","baranisesi":"bărăni","baranisi":"bărăni","baranit":"bărăni","baraniti":"bărăni","barara":"bara","bararam":"bara","bararati":"bara","barase":"bara","barasem":"bara","barasera":"bara","baraseram":"bara","baraserati":"bara","barasesi":"bara","barasi":"bara","barat":"bara","barata":["barată","barat","barata","barat"],"baratci":"baratcă","baratcii":"baratcă","baratcile":"baratcă","baratcilor":"baratcă","barate":"barat","baratele":"barat","barateria":"baraterie","barateriei":"baraterie","baraterii":"baraterie","barateriile":"baraterie","barateriilor":"baraterie","baratesi":"bărateș","baratesii":"bărateș","baratesilor":"bărateș","baratesul":"bărateș","baratesule":"bărateș","baratesului":"bărateș","barati":["barați","bara","barați","barat","bărați","bărat"],"baratia":"bărăție","baratiei":"bărăție","baratii":["barații","barat","bărații","bărat","bărății","bărăție"],"baratiile":"bărăție","baratiilor":"bărăție","baratilor":"bărat","baratul":["baratul","barat","băratul","bărat"],"baratule":"bărat","baratului":"bărat","barau":"bara","barbacane":"barbacană","barbacanei":"barbacană","barbacanele":"barbacană","barbacanelor":"barbacană","barbacuti":"bărbăcuț","barbacutii":"bărbăcuț","barbacutilor":"bărbăcuț","barbacutul":"bărbăcuț","barbacutule":"bărbăcuț","barbacutului":"bărbăcuț","barbalai":"bărbălaie","barbalaiea":"bărbălaie","barbalaii":"bărbălaie","barbalaile":"bărbălaie","barbalailor":"bărbălaie","barbanoc":"brebenoc","barbare":"barbară","barbarei":"barbară","barbarele":"barbară","barbarelor":"barbară","barbari":"barbar","barbaria":["barbaria","barbarie","bărbăria","bărbărie"],"barbariei":["barbariei","barbarie","bărbăriei","bărbărie"],"barbarii":["barbarii","barbar","barbarii","barbarie","bărbării","bărbărie"],"barbariile":"barbarie","barbariilor":"barbarie","barbarilor":"barbar","barbarisme":"barbarism","barbarismele":"barbarism","barbarismelor":"barbarism","barbarismul":"barbarism","barbarismule":"barbarism","barbarismului":"barbarism","barbarizai":"barbariza","barbarizam":["barbarizăm","barbariza","barbarizam","barbariza"],"barbarizand":"barbariza","barbarizara":"barbariza","barbarizaram":"barbariza","barbarizarati":"barbariza","barbarizarea":"barbarizare","barbarizari":"barbarizare","barbarizarii":"barbarizare","barbarizarile":"barbarizare","barbarizarilor":"barbarizare","barbarizase":"barbariza","barbarizasem":"barbariza","barbarizasera":"barbariza","barbarizaseram":"barbariza","barbarizaserati":"barbariza","barbarizasesi":"barbariza","barbarizasi":"barbariza","barbarizat":"barbariza","barbarizati":"barbariza","barbarizatul":"barbarizat","barbarizatule":"barbarizat","barbarizatului":"barbarizat","barbarizaturi":"barbarizat","barbarizaturile":"barbarizat","barbarizaturilor":"barbarizat","barbarizau":"barbariza","barbarizeaza":"barbariza","barbarizez":"barbariza","barbarizezi":"barbariza","barbarul":"barbar","barbarule":"barbar","barbarului":"barbar","barbata":["bărbată","bărbat","bărbata","bărbat"],"barbate":["bărbate","bărbat","bărbate","bărbată"],"barbateasca":["bărbătească","bărbătesc","bărbăteasca","bărbătesc"],"barbatei":["bărbatei","bărbată","bărbăței","bărbățel"],"barbatele":["bărbatele","bărbat","bărbatele","bărbată"],"barbateli":"bărbățel","barbatelii":"bărbățel","barbatelilor":"bărbățel","barbatelor":"bărbată","barbatelul":"bărbățel","barbatelule":"bărbățel","barbatelului":"bărbățel","barbatescul":"bărbătesc","barbatesti":"bărbătesc","barbatestii":"bărbătesc","barbatestile":"bărbătesc","barbati":"bărbat","barbati de stat":"bărbat de stat","barbati politici":"bărbat politic","barbatia":"bărbăție","barbatiei":"bărbăție","barbatii":["bărbații","bărbat","bărbății","bărbăție"],"barbatiile":"bărbăție","barbatiilor":"bărbăție","barbatilor":"bărbat","barbatoasa":["bărbătoasă","bărbătos","bărbătoasa","bărbătos"],"barbatoase":"bărbătos","barbatoasele":"bărbătos","barbatoii":["bărbătoii","bărbătoi","bărbățoii","bărbățoi"],"barbatoilor":["bărbătoilor","bărbătoi","bărbățoilor","bărbățoi"],"barbatoiul":["bărbătoiul","bărbătoi","bărbățoiul","bărbățoi"],"barbatoiule":["bărbătoiule","bărbătoi","bărbățoiule","bărbățoi"],"barbatoiului":["bărbătoiului","bărbătoi","bărbățoiului","bărbățoi"],"barbatosi":"bărbătos","barbatosii":"bărbătos","barbatosul":"bărbătos","barbatul":"bărbat","barbatule":"bărbat","barbatului":"bărbat","barbatusi":"bărbătuș","barbatusii":"bărbătuș","barbatusilor":"bărbătuș","barbatusul":"bărbătuș","barbatusule":"bărbătuș","barbatusului":"bărbătuș","barbete":"barbetă","barbetei":"barbetă","barbetele":"barbetă","barbetelor":"barbetă","barbeti":"barbet","barbetii":"barbet","barbetilor":"barbet","barbetul":"barbet","barbetule":"barbet","barbetului":"barbet","barbi":"barbă","barbia":"bărbie","barbiei":"bărbie","barbierea":"bărbieri","barbiereai":"bărbieri","barbieream":"bărbieri","barbiereasca":["bărbierească","bărbieresc","bărbiereasca","bărbieresc"],"barbiereati":"bărbieri","barbiereau":"bărbieri","barbierele":"bărbiereală","barbierelei":"bărbiereală","barbierelele":"bărbiereală","barbierelelor":"bărbiereală","barbiereli":"bărbiereală","barbieresc":"bărbieri","barbierescul":"bărbieresc","barbierese":"bărbiereasă","barbieresei":"bărbiereasă","barbieresele":"bărbiereasă","barbiereselor":"bărbiereasă","barbiereste":"bărbieri","barbieresti":["bărbierești","bărbieresc","bărbierești","bărbieri"],"barbierestii":"bărbieresc","barbierestile":"bărbieresc","barbieri":"bărbier","barbieria":"bărbierie","barbieriei":"bărbierie","barbierii":["bărbierii","bărbier","bărbierii","bărbieri","bărbierii","bărbierie"],"barbieriile":"bărbierie","barbieriilor":"bărbierie","barbierilor":"bărbier","barbierim":"bărbieri","barbierind":"bărbieri","barbierira":"bărbieri","barbieriram":"bărbieri","barbierirati":"bărbieri","barbierirea":"bărbierire","barbieriri":"bărbierire","barbieririi":"bărbierire","barbieririle":"bărbierire","barbieririlor":"bărbierire","barbierise":"bărbieri","barbierisem":"bărbieri","barbierisera":"bărbieri","barbieriseram":"bărbieri","barbieriserati":"bărbieri","barbierisesi":"bărbieri","barbierisi":"bărbieri","barbierit":"bărbieri","barbierite":"bărbieriță","barbieritei":"bărbieriță","barbieritele":"bărbieriță","barbieritelor":"bărbieriță","barbieriti":"bărbieri","barbieritul":"bărbierit","barbieritule":"bărbierit","barbieritului":"bărbierit","barbierul":"bărbier","barbierule":"bărbier","barbierului":"bărbier","barbii":["bărbii","barbă","bărbii","bărbie"],"barbii duble":"bărbie dublă","barbiile":"bărbie","barbiilor":"bărbie","barbile":"barbă","barbilor":"barbă","barbioare":"bărbioară","barbioarei":"bărbioară","barbioarele":"bărbioară","barbioarelor":"bărbioară","barbise":"barbișă","barbisei":"barbișă","barbisele":"barbișă","barbiselor":"barbișă","barbisoane":"barbișon","barbisoanele":"barbișon","barbisoanelor":"barbișon","barbisoare":"bărbișoară","barbisoarei":"bărbișoară","barbisoarele":"bărbișoară","barbisoarelor":"bărbișoară","barbisonul":"barbișon","barbisonule":"barbișon","barbisonului":"barbișon","barbite":"bărbiță","barbitei":"bărbiță","barbitele":"bărbiță","barbitelor":"bărbiță","barbiturici":"barbituric","barbituricile":"barbituric","barbituricilor":"barbituric","barbituricul":"barbituric","barbituricule":"barbituric","barbituricului":"barbituric","barbiturismul":"barbiturism","barbiturismule":"barbiturism","barbiturismului":"barbiturism","barbiute":"bărbiuță","barbiutei":"bărbiuță","barbiutele":"bărbiuță","barbiutelor":"bărbiuță","barboaie":"bărboi","barboaiele":"bărboi","barboaielor":"bărboi","barboasa":["bărboasă","bărbos","bărboasa","bărbos"],"barboase":["bărboase","bărboasă","bărboase","bărbos"],"barboasei":"bărboasă","barboasele":["bărboasele","bărboasă","bărboasele","bărbos"],"barboaselor":"bărboasă","barboiul":"bărboi","barboiule":"bărboi","barboiului":"bărboi","barbologia":"barbologie","barbologiei":"barbologie","barbologii":"barbologie","barbora":"barbură","barbosi":"bărbos","barbosii":"bărbos","barbosul":"bărbos","barbotaje":"barbotaj","barbotajele":"barbotaj","barbotajelor":"barbotaj","barbotajul":"barbotaj","barbotajule":"barbotaj","barbotajului":"barbotaj","barbotarea":"barbotare","barbotari":"barbotare","barbotarii":"barbotare","barbotarile":"barbotare","barbotarilor":"barbotare","barbugii":"barbugiu","barbugiii":"barbugiu","barbugiilor":"barbugiu","barbugiuul":"barbugiu","barbugiuule":"barbugiu","barbugiuului":"barbugiu","barbuncul":"bărbunc","barbuncule":"bărbunc","barbuncului":"bărbunc","barbuni":"barbun","barbunii":"barbun","barbunilor":"barbun","barbunul":"barbun","barbunule":"barbun","barbunului":"barbun","barbure":["barbure","barbur","barbure","barbură"],"barburei":"barbură","barburele":"barbură","barburelor":"barbură","barburi":"barbur","barburii":"barbur","barburilor":"barbur","barburul":"barbur","barburule":"barbur","barburului":"barbur","barbusoare":"bărbușoară","barbusoarei":"bărbușoară","barbusoarele":"bărbușoară","barbusoarelor":"bărbușoară","barbute":["barbute","barbută","bărbuțe","bărbuță"],"barbutei":["barbutei","barbută","bărbuței","bărbuță"],"barbutele":["barbutele","barbută","bărbuțele","bărbuță"],"barbutelor":["barbutelor","barbută","bărbuțelor","bărbuță"],"barbutul":"barbut","barbutule":"barbut","barbutului":"barbut","barbuturi":"barbut","barbuturile":"barbut","barbuturilor":"barbut","barca":["bărcă","bărc","bărca","bărc"],"barcagii":"barcagiu","barcagiii":"barcagiu","barcagiilor":"barcagiu","barcagiul":"barcagiu","barcagiule":"barcagiu","barcagiului":"barcagiu","barcane":"barcană","barcanei":"barcană","barcanele":"barcană","barcanelor":"barcană","barcarole":"barcarolă","barcarolei":"barcarolă","barcarolele":"barcarolă","barcarolelor":"barcarolă","barcasi":"barcaș","barcasii":"barcaș","barcasilor":"barcaș","barcasul":"barcaș","barcasule":"barcaș","barcasului":"barcaș","barcazul":"barcaz","barcazule":"barcaz","barcazului":"barcaz","barcazuri":"barcaz","barcazurile":"barcaz","barcazurilor":"barcaz","barce":"bărc","barcele":"bărc","barchetul":"barchet","barchetule":"barchet","barchetului":"barchet","barcheturi":"barchet","barcheturile":"barchet","barcheturilor":"barchet","barci":["bărci","bărc","bărci","barcă"],"barci cu motor":"barcă cu motor","barcii":["bărcii","bărc","bărcii","barcă"],"barcile":"barcă","barcilor":"barcă","barcul":"bărc","barcute":"bărcuță","barcutei":"bărcuță","barcutele":"bărcuță","barcutelor":"bărcuță","barcutul":"bărcuț","barcutule":"bărcuț","barcutului":"bărcuț","bardacele":"bărdăcel","bardacelele":"bărdăcel","bardacelelor":"bărdăcel","bardacelul":"bărdăcel","bardacelule":"bărdăcel","bardacelului":"bărdăcel","bardaci":"bardac","bardacii":"bardac","bardacilor":"bardac","bardacul":"bardac","bardacule":"bardac","bardacului":"bardac","bardacute":["bărdăcuțe","bărdăcuț","bărdăcuțe","bărdăcuță"],"bardacutei":"bărdăcuță","bardacutele":["bărdăcuțele","bărdăcuț","bărdăcuțele","bărdăcuță"],"bardacutelor":["bărdăcuțelor","bărdăcuț","bărdăcuțelor","bărdăcuță"],"bardacutul":"bărdăcuț","bardacutule":"bărdăcuț","bardacutului":"bărdăcuț","bardahanoasa":["bărdăhănoasă","bărdăhănos","bărdăhănoasa","bărdăhănos"],"bardahanoase":"bărdăhănos","bardahanoasele":"bărdăhănos","bardahanosi":"bărdăhănos","bardahanosii":"bărdăhănos","bardahanosul":"bărdăhănos","bardahanul":"bărdăhan","bardahanule":"bărdăhan","bardahanului":"bărdăhan","bardahanuri":"bărdăhan","bardahanurile":"bărdăhan","bardahanurilor":"bărdăhan","bardane":"bârdan","bardanele":"bârdan","bardanelor":"bârdan","bardanirea":"bărdănire","bardaniri":"bărdănire","bardanirii":"bărdănire","bardanirile":"bărdănire","bardanirilor":"bărdănire","bardanoasa":["bărdănoasă","bărdănos","bărdănoasa","bărdănos"],"bardanoase":"bărdănos","bardanoasele":"bărdănos","bardanosi":"bărdănos","bardanosii":"bărdănos","bardanosul":"bărdănos","bardanul":"bârdan","bardanule":"bârdan","bardanului":"bârdan","bardas":"barză","bardasi":"bărdaș","bardasii":"bărdaș","bardasilor":"bărdaș","bardasirea":"bărdășire","bardasiri":"bărdășire","bardasirii":"bărdășire","bardasirile":"bărdășire","bardasirilor":"bărdășire","bardasul":"bărdaș","bardasule":"bărdaș","bardasului":"bărdaș","bardicioare":"bărdicioară","bardicioarei":"bărdicioară","bardicioarele":"bărdicioară","bardicioarelor":"bărdicioară","bardisaul":"bardișă","bardisaule":"bardișă","bardisaului":"bardișă","bardise":"bardișă","bardisele":"bardișă","bardiselor":"bardișă","bardite":"bărdiță","barditei":"bărdiță","barditele":"bărdiță","barditelor":"bărdiță","bardoi":"bardou","bardoii":"bardou","bardoilor":"bardou","bardoiul":"bărdoi","bardoiule":"bărdoi","bardoiului":"bărdoi","bardoul":"bardou","bardoule":"bardou","bardoului":"bardou","barduia":"bărdui","barduiai":"bărdui","barduiam":"bărdui","barduiati":"bărdui","barduiau":"bărdui","barduiesc":"bărdui","barduieste":"bărdui","barduiesti":"bărdui","barduii":"bărdui","barduim":"bărdui","barduind":"bărdui","barduira":"bărdui","barduiram":"bărdui","barduirati":"bărdui","barduirea":"bărduire","barduiri":"bărduire","barduirii":"bărduire","barduise":"bărdui","barduisem":"bărdui","barduisera":"bărdui","barduiseram":"bărdui","barduiserati":"bărdui","barduisesi":"bărdui","barduisi":"bărdui","barduit":"bărdui","barduita":["bărduită","bărduit","bărduita","bărduit"],"barduite":"bărduit","barduitele":"bărduit","barduiti":["bărduiți","bărdui","bărduiți","bărduit"],"barduitii":"bărduit","barduitul":"bărduit","bardul":"bard","bardule":"bard","bardului":"bard","bare":"bară","bare fixe":"bară fixă","bare oblice":"bară oblică","bare oblice inverse":"bară oblică inversă","bareagul":"băreag","bareagule":"băreag","bareagului":"băreag","bareaza":"bara","barei":"bară","bareje":"barej","barejele":"barej","barejelor":"barej","barejul":"barej","barejule":"barej","barejului":"barej","barele":"bară","barelor":"bară","barete":"baretă","baretei":"baretă","baretele":"baretă","baretelor":"baretă","barez":"bara","barezi":"bara","barfasul":"bârfaș","barfasule":"bârfaș","barfasului":"bârfaș","barfe":"bârfă","barfea":"bârfi","barfeai":"bârfi","barfeam":"bârfi","barfeati":"bârfi","barfeau":"bârfi","barfei":"bârfă","barfele":["bârfele","bârfă","bărfele","bârfeală"],"barfelei":"bârfeală","barfelele":"bârfeală","barfelelor":"bârfeală","barfeli":"bârfeală","barfelor":"bârfă","barfesc":"bârfi","barfeste":"bârfi","barfesti":"bârfi","barfii":"bârfi","barfim":"bârfi","barfind":"bârfi","barfira":"bârfi","barfiram":"bârfi","barfirati":"bârfi","barfirea":"bârfire","barfiri":"bârfire","barfirii":"bârfire","barfirile":"bârfire","barfirilor":"bârfire","barfise":"bârfi","barfisem":"bârfi","barfisera":"bârfi","barfiseram":"bârfi","barfiserati":"bârfi","barfisesi":"bârfi","barfisi":"bârfi","barfit":"bârfi","barfita":"bârfit","barfite":"bârfit","barfiti":["bârfiți","bârfi","bârfiți","bârfit"],"barfitoare":"bârfitor","barfitoarea":["bârfitoarea","bârfitoare","bârfitoarea","bârfitor"],"barfitoarei":"bârfitoare","barfitoarele":["bârfitoarele","bârfitoare","bârfitoarele","bârfitor"],"barfitoarelor":"bârfitoare","barfitori":"bârfitor","barfitorii":"bârfitor","barfitorilor":"bârfitor","barfitorul":"bârfitor","barfitorule":"bârfitor","barfitorului":"bârfitor","barfitul":"bârfit","barfitule":"bârfit","barfitului":"bârfit","barfituri":"bârfitură","barfiturii":"bârfitură","barfiturile":"bârfitură","barfiturilor":"bârfitură","bargine":"bârgină","barginei":"bârgină","barginele":"bârgină","barginelor":"bârgină","bargita":["bărgită","bărgit","bărgita","bărgit"],"bargite":"bărgit","bargitele":"bărgit","bargiti":"bărgit","bargitii":"bărgit","bargitul":"bărgit","bargladine":"baragladină","bargladinei":"baragladină","bargladinele":"baragladină","bargladinelor":"baragladină","bari":"bar","baria":"barie","barica":["barică","baric","barica","baric"],"baricadai":"baricada","baricadam":["baricadăm","baricada","baricadam","baricada"],"baricadand":"baricada","baricadara":"baricada","baricadaram":"baricada","baricadarati":"baricada","baricadarea":"baricadare","baricadari":"baricadare","baricadarii":"baricadare","baricadarile":"baricadare","baricadarilor":"baricadare","baricadase":"baricada","baricadasem":"baricada","baricadasera":"baricada","baricadaseram":"baricada","baricadaserati":"baricada","baricadasesi":"baricada","baricadasi":"baricada","baricadat":"baricada","baricadati":"baricada","baricadatul":"baricadat","baricadatule":"baricadat","baricadatului":"baricadat","baricadaturi":"baricadat","baricadaturile":"baricadat","baricadaturilor":"baricadat","baricadau":"baricada","baricade":"baricadă","baricadeaza":"baricada","baricadei":"baricadă","baricadele":"baricadă","baricadelor":"baricadă","baricadez":"baricada","baricadezi":"baricada","barice":"baric","baricele":"baric","baricentre":"baricentru","baricentrele":"baricentru","baricentrelor":"baricentru","baricentrul":"baricentru","baricentrule":"baricentru","baricentrului":"baricentru","barici":"baric","baricii":"baric","baricul":"baric","bariei":"barie","bariere":"barieră","barierei":"barieră","barierele":"barieră","barierelor":"barieră","barii":["barii","bar","barii","barie"],"bariile":"barie","bariilor":"barie","barili":"baril","barilii":"baril","barililor":"baril","barilor":"bar","barilul":"baril","barilule":"baril","barilului":"baril","barimetria":"barimetrie","barimetriei":"barimetrie","barimetrii":"barimetrie","barise":"bariș","barisele":"bariș","bariselor":"bariș","barisfere":"barisferă","barisferei":"barisferă","barisferele":"barisferă","barisferelor":"barisferă","barisul":"bariș","barisule":"bariș","barisului":"bariș","barite":["barite","barit","barite","barită"],"baritei":"barită","baritele":["baritele","barit","baritele","barită"],"baritelor":["baritelor","barit","baritelor","barită"],"baritine":"baritină","baritinei":"baritină","baritinele":"baritină","baritinelor":"baritină","baritonul":"bariton","baritonule":"bariton","baritonului":"bariton","baritul":"barit","baritule":"barit","baritului":"barit","bariul":"bariu","bariule":"bariu","bariului":"bariu","barizul":"bariz","barizule":"bariz","barizului":"bariz","barizuri":"bariz","barizurile":"bariz","barizurilor":"bariz","barje":"barjă","barjei":"barjă","barjele":"barjă","barjelor":"barjă","barji":"barz","barjii":"barz","barladeana":["bârlădeană","bârlădean","bârlădeana","bârlădean","bărlădeană","bărlădean","bărlădeana","bărlădean"],"barladeanul":["bârlădeanul","bârlădean","bărlădeanul","bărlădean"],"barladeanule":["bârlădeanule","bârlădean","bărlădeanule","bărlădean"],"barladeanului":["bârlădeanului","bârlădean","bărlădeanului","bărlădean"],"barladence":["bârlădence","bârlădeancă","bărlădence","bărlădeancă"],"barladencei":["bârlădencei","bârlădeancă","bărlădencei","bărlădeancă"],"barladencele":["bârlădencele","bârlădeancă","bărlădencele","bărlădeancă"],"barladencelor":["bârlădencelor","bârlădeancă","bărlădencelor","bărlădeancă"],"barladene":["bârlădene","bârlădean","bărlădene","bărlădean","bârlădene","bârlădeană"],"barladenei":"bârlădeană","barladenele":["bârlădenele","bârlădean","bărlădenele","bărlădean","bârlădenele","bârlădeană"],"barladenelor":"bârlădeană","barladeni":["bârlădeni","bârlădean","bărlădeni","bărlădean","bârlădeni","bărlădean"],"barladenii":["bârlădenii","bârlădean","bărlădenii","bărlădean"],"barladenilor":["bârlădenilor","bârlădean","bărlădenilor","bărlădean"],"barlig":"bârliga","barligai":"bârliga","barligam":["bârligăm","bârliga","bârligam","bârliga"],"barligand":"bârliga","barligara":"bârliga","barligaram":"bârliga","barligarati":"bârliga","barligase":"bârliga","barligasem":"bârliga","barligasera":"bârliga","barligaseram":"bârliga","barligaserati":"bârliga","barligasesi":"bârliga","barligasi":"bârliga","barligat":"bârliga","barligati":"bârliga","barligau":"bârliga","barligi":"bârliga","barlocul":"bârloc","barlocule":"bârloc","barlocului":"bârloc","barlocuri":"bârloc","barlocurile":"bârloc","barlocurilor":"bârloc","barlogele":"bârlogel","barlogelele":"bârlogel","barlogelelor":"bârlogel","barlogelul":"bârlogel","barlogelule":"bârlogel","barlogelului":"bârlogel","barlogul":"bârlog","barlogule":"bârlog","barlogului":"bârlog","barloguri":"bârlog","barlogurile":"bârlog","barlogurilor":"bârlog","barlugi":"bârlugă","barlugii":"bârlugă","barlugile":"bârlugă","barlugilor":"bârlugă","barmani":"barman","barmanii":"barman","barmanilor":"barman","barmanite":"barmaniță","barmanitei":"barmaniță","barmanitele":"barmaniță","barmanitelor":"barmaniță","barmanul":"barman","barmanule":"barman","barmanului":"barman","barnace":"bărnaci","barnacea":"bărnaci","barnaceaua":"bârnăcea","barnacele":["bârnăcele","bârnăcea","bărnacele","bărnaci"],"barnacelei":"bârnăcea","barnacelele":"bârnăcea","barnacelelor":"bârnăcea","barnacii":"bărnaci","barnaciul":"bărnaci","barnacuta":["bărnăcuță","bărnăcuț","bărnăcuța","bărnăcuț"],"barnacute":"bărnăcuț","barnacutele":"bărnăcuț","barnacuti":"bărnăcuț","barnacutii":"bărnăcuț","barnacutul":"bărnăcuț","barne":"bârnă","barnei":"bârnă","barnele":"bârnă","barnelor":"bârnă","barnete":"bârneț","barnetele":"bârneț","barnetelor":"bârneț","barnetul":"bârneț","barnetule":"bârneț","barnetului":"bârneț","baroane":"baroană","baroanei":"baroană","baroanele":"baroană","baroanelor":"baroană","baroca":["barocă","baroc","baroca","baroc"],"baroce":"baroc","barocele":"baroc","baroci":"baroc","barocii":"baroc","barocul":"baroc","barografe":"barograf","barografele":"barograf","barografelor":"barograf","barograful":"barograf","barografule":"barograf","barografului":"barograf","barograme":"barogramă","barogramei":"barogramă","barogramele":"barogramă","barogramelor":"barogramă","baroiul":"baroi","baroiule":"baroi","baroiului":"baroi","barometre":"barometru","barometre aneroide":"barometru aneroid","barometrele":"barometru","barometrelor":"barometru","barometrica":["barometrică","barometric","barometrica","barometric"],"barometrice":"barometric","barometricele":"barometric","barometrici":"barometric","barometricii":"barometric","barometricul":"barometric","barometrul":"barometru","barometrule":"barometru","barometrului":"barometru","baronese":"baroneasă","baronesei":"baroneasă","baronesele":"baroneasă","baroneselor":"baroneasă","baroneti":"baronet","baronetii":"baronet","baronetilor":"baronet","baronetul":"baronet","baronetule":"baronet","baronetului":"baronet","baroni":"baron","baronia":"baronie","baroniei":"baronie","baronii":["baronii","baron","baronii","baronie"],"baroniile":"baronie","baroniilor":"baronie","baronilor":"baron","baronite":"baroniță","baronitei":"baroniță","baronitele":"baroniță","baronitelor":"baroniță","baronul":"baron","baronule":"baron","baronului":"baron","barosani":"barosan","barosanii":"barosan","barosanilor":"barosan","barosanul":"barosan","barosanule":"barosan","barosanului":"barosan","baroscoape":"baroscop","baroscoapele":"baroscop","baroscoapelor":"baroscop","baroscopul":"baroscop","baroscopule":"baroscop","baroscopului":"baroscop","barosul":"baros","barosule":"baros","barosului":"baros","barosuri":"baros","barosurile":"baros","barosurilor":"baros","barotermografe":"barotermograf","barotermografele":"barotermograf","barotermografelor":"barotermograf","barotermograful":"barotermograf","barotermografule":"barotermograf","barotermografului":"barotermograf","barotul":"barot","barotule":"barot","barotului":"barot","baroul":"barou","baroule":"barou","baroului":"barou","barouri":"barou","barourile":"barou","barourilor":"barou","barsana":["bârsană","bârsan","bârsana","bârsan"],"barsane":"bârsan","barsanei":"bârsănel","barsaneii":"bârsănel","barsaneilor":"bârsănel","barsanele":"bârsan","barsanelul":"bârsănel","barsanelule":"bârsănel","barsanelului":"bârsănel","barsani":"bârsan","barsanii":"bârsan","barsanul":"bârsan","barse":"bârsă","barsei":"bârsă","barsele":"bârsă","barselor":"bârsă","barsoane":"barșon","barsoanele":"barșon","barsoanelor":"barșon","barsonul":"barșon","barsonule":"barșon","barsonului":"barșon","bartacule":"bărtăculă","bartaculei":"bărtăculă","bartaculele":"bărtăculă","bartaculelor":"bărtăculă","barul":"bar","barule":"bar","barului":"bar","barutane":"barutană","barutanei":"barutană","barutanele":"barutană","barutanelor":"barutană","barza":["barză","barz","barza","barz"],"barzauni":"bărzăun","barzaunii":"bărzăun","barzaunilor":"bărzăun","barzaunul":"bărzăun","barzaunule":"bărzăun","barzaunului":"bărzăun","barze":"barz","barzele":"barz","barzgani":"bârzgan","barzganii":"bârzgan","barzganilor":"bârzgan","barzganul":"bârzgan","barzganule":"bârzgan","barzganului":"bârzgan","barzi":["barzi","bard","bărzi","bardă","barzi","barz"],"barzii":["barzii","bard","bărzii","bardă"],"barzile":"bardă","barzilor":["barzilor","bard","bărzilor","bardă"],"barzoii":"bărzoi","barzoilor":"bărzoi","barzoiul":["barzoiul","barzoi","bărzoiul","bărzoi"],"barzoiule":["barzoiule","barzoi","bărzoiule","bărzoi"],"barzoiului":["barzoiului","barzoi","bărzoiului","bărzoi"],"barzul":"barz","bas":"băși","basada":"beseadă","basarabeana":["basarabeană","basarabean","basarabeana","basarabean"],"basarabeanul":"basarabean","basarabeanule":"basarabean","basarabeanului":"basarabean","basarabence":"basarabeancă","basarabencei":"basarabeancă","basarabencele":"basarabeancă","basarabencelor":"basarabeancă","basarabene":"basarabean","basarabenele":"basarabean","basarabeni":"basarabean","basarabenii":"basarabean","basarabenilor":"basarabean","basc":"bască","basca":["bască","basc","basca","basc"],"bascacaratela":["băscăcărățelă","băscăcărățel","băscăcărățela","băscăcărățel"],"bascacaratele":"băscăcărățel","bascacaratelele":"băscăcărățel","bascacarateli":"băscăcărățel","bascacaratelii":"băscăcărățel","bascacaratelul":"băscăcărățel","bascalia":"bășcălie","bascaliei":"bășcălie","bascalii":"bășcălie","bascaliile":"bășcălie","bascaliilor":"bășcălie","bascalioasa":["bășcălioasă","bășcălios","bășcălioasa","bășcălios"],"bascalioase":"bășcălios","bascalioasele":"bășcălios","bascaliosi":"bășcălios","bascaliosii":"bășcălios","bascaliosul":"bășcălios","bascanete":"bășcăneață","bascanetei":"bășcăneață","bascanetele":"bășcăneață","bascanetelor":"bășcăneață","basce":"bască","basceaua":"bascea","bascei":"bască","bascele":"bascea","bascelei":"bascea","bascelele":"bascea","bascelelor":"bascea","baschetbaliste":"baschetbalistă","baschetbalistei":"baschetbalistă","baschetbalistele":"baschetbalistă","baschetbalistelor":"baschetbalistă","baschetbalisti":["baschetbaliști","baschetbalist","baschetbalisti","baschetbalist"],"baschetbalistii":"baschetbalist","baschetbalistilor":"baschetbalist","baschetbalistul":"baschetbalist","baschetbalistule":"baschetbalist","baschetbalistului":"baschetbalist","baschetbalul":"baschetbal","baschetbalule":"baschetbal","baschetbalului":"baschetbal","bascheti":"baschet","baschetii":"baschet","baschetilor":"baschet","baschetul":"baschet","baschetule":"baschet","baschetului":"baschet","baschioale":"bașchiolă","baschioalei":"bașchiolă","baschioalele":"bașchiolă","baschioalelor":"bașchiolă","baschira":["bașchiră","bașchir","bașchira","bașchir"],"baschire":"bașchir","baschirele":"bașchir","baschiri":"bașchir","baschirii":"bașchir","baschirilor":"bașchir","baschirul":"bașchir","baschirule":"bașchir","baschirului":"bașchir","basci":"basc","bascii":"basc","bascilor":"basc","bascul":"basc","basculai":"bascula","basculam":["basculăm","bascula","basculam","bascula"],"basculand":"bascula","basculanta":["basculantă","basculant","basculanta","basculant"],"basculante":["basculante","basculant","basculante","basculantă"],"basculantei":"basculantă","basculantele":["basculantele","basculant","basculantele","basculantă"],"basculantelor":"basculantă","basculanti":"basculant","basculantii":"basculant","basculantul":"basculant","basculara":"bascula","bascularam":"bascula","bascularati":"bascula","basculase":"bascula","basculasem":"bascula","basculasera":"bascula","basculaseram":"bascula","basculaserati":"bascula","basculasesi":"bascula","basculasi":"bascula","basculat":"bascula","basculati":"bascula","basculau":"bascula","bascule":["bascule","basc","bascule","basculă"],"basculeaza":"bascula","basculei":"basculă","basculele":"basculă","basculelor":"basculă","basculez":"bascula","basculezi":"bascula","bascului":"basc","basea":"băși","baseai":"băși","baseam":"băși","baseareca":"biserică","baseati":"băși","baseau":"băși","baseballiste":"baseballistă","baseballistei":"baseballistă","baseballistele":"baseballistă","baseballistelor":"baseballistă","baseballul":"baseball","baseballule":"baseball","baseballului":"baseball","basedowiane":"basedowiană","basedowianei":"basedowiană","basedowianele":"basedowiană","basedowianelor":"basedowiană","baseti":"baset","basetii":"baset","basetilor":"baset","basetul":"baset","basetule":"baset","basetului":"baset","basibuzuci":"bașibuzuc","basibuzucii":"bașibuzuc","basibuzucilor":"bașibuzuc","basibuzucul":"bașibuzuc","basibuzucule":"bașibuzuc","basibuzucului":"bașibuzuc","basic":"bășica","basicai":"bășica","basicam":["bășicăm","bășica","bășicam","bășica"],"basicand":"bășica","basicara":"bășica","basicaram":"bășica","basicarati":"bășica","basicarea":"bășicare","basicari":"bășicare","basicarii":"bășicare","basicarile":"bășicare","basicarilor":"bășicare","basicase":"bășica","basicasem":"bășica","basicasera":"bășica","basicaseram":"bășica","basicaserati":"bășica","basicasesi":"bășica","basicasi":"bășica","basicat":"bășica","basicata":["bășicată","bășicat","bășicata","bășicat"],"basicate":"bășicat","basicatela":["bășicățelă","bășicățel","bășicățela","bășicățel"],"basicatele":["bășicatele","bășicat","bășicățele","bășicățel"],"basicatelele":"bășicățel","basicateli":"bășicățel","basicatelii":"bășicățel","basicatelul":"bășicățel","basicati":["bășicați","bășica","bășicați","bășicat"],"basicatii":"bășicat","basicatul":"bășicat","basicaturi":"bășicătură","basicaturii":"bășicătură","basicaturile":"bășicătură","basicaturilor":"bășicătură","basicau":"bășica","basici":["bășici","bășica","bășici","bășică"],"basicii":"bășică","basicile":"bășică","basicilor":"bășică","basicoasa":["bășicoasă","bășicos","bășicoasa","bășicos"],"basicoase":["bășicoase","bășicoasă","bășicoase","bășicos"],"basicoasei":"bășicoasă","basicoasele":["bășicoasele","bășicoasă","bășicoasele","bășicos"],"basicoaselor":"bășicoasă","basicosi":"bășicos","basicosii":"bășicos","basicosul":"bășicos","basicute":"bășicuță","basicutei":"bășicuță","basicutele":"bășicuță","basicutelor":"bășicuță","basidia":"basidie","basidiei":"basidie","basidii":"basidie","basidiile":"basidie","basidiilor":"basidie","basidiomicete":"basidiomicetă","basidiomicetei":"basidiomicetă","basidiomicetele":"basidiomicetă","basidiomicetelor":"basidiomicetă","basidiospori":"basidiospor","basidiosporii":"basidiospor","basidiosporilor":"basidiospor","basidiosporul":"basidiospor","basidiosporule":"basidiospor","basidiosporului":"basidiospor","basii":"băși","basim":"băși","basind":"băși","basini":"bășină","basinici":"bășinică","basinicii":"bășinică","basinicile":"bășinică","basinicilor":"bășinică","basinii":"bășină","basinile":"bășină","basinile-porcului":"bășina-porcului","basinilor":"bășină","basinite":"bășiniță","basinitei":"bășiniță","basinitele":"bășiniță","basinitelor":"bășiniță","basinoasa":["bășinoasă","bășinos","bășinoasa","bășinos"],"basinoase":"bășinos","basinoasele":"bășinos","basinosi":"bășinos","basinosii":"bășinos","basinosilor":"bășinos","basinosul":"bășinos","basinosule":"bășinos","basinosului":"bășinos","basinul":"basin","basinule":"basin","basinului":"basin","basinuri":"basin","basinurile":"basin","basinurilor":"basin","basinute":"bășinuță","basinutei":"bășinuță","basinutele":"bășinuță","basinutelor":"bășinuță","basira":"băși","basiram":"băși","basirati":"băși","basise":"băși","basisem":"băși","basisera":"băși","basiseram":"băși","basiserati":"băși","basisesi":"băși","basisi":"băși","basisti":"basist","basistii":"basist","basistilor":"basist","basistul":"basist","basistule":"basist","basistului":"basist","basit":"băși","basiti":"băși","baskir":"bașchir","baskire":"bașkiră","baskirei":"bașkiră","baskirele":"bașkiră","baskirelor":"bașkiră","baskiri":"bașkir","baskiria":"Bașchiria","baskirii":"bașkir","baskirilor":"bașkir","baskirul":"bașkir","baskirule":"bașkir","baskirului":"bașkir","basmale":["basmale","basma","băsmale","băsma"],"basmalei":["basmalei","basma","băsmalei","băsma"],"basmalele":["basmalele","basma","băsmalele","băsma"],"basmalelor":["basmalelor","basma","băsmalelor","băsma"],"basmalute":"băsmăluță","basmalutei":"băsmăluță","basmalutele":"băsmăluță","basmalutelor":"băsmăluță","basmangii":"basmangiu","basmangiii":"basmangiu","basmangiilor":"basmangiu","basmangiul":"basmangiu","basmangiule":"basmangiu","basmangiului":"basmangiu","basmaua":["basmaua","basma","băsmaua","băsma"],"basme":"basm","basmele":"basm","basmelor":"basm","basmirea":"băsmire","basmiri":"băsmire","basmirii":"băsmire","basmirile":"băsmire","basmirilor":"băsmire","basmita":["băsmită","băsmit","băsmita","băsmit"],"basmite":"băsmit","basmitele":"băsmit","basmiti":"băsmit","basmitii":"băsmit","basmitul":"băsmit","basmuia":"băsmui","basmuiai":"băsmui","basmuiam":"băsmui","basmuiati":"băsmui","basmuiau":"băsmui","basmuie":"băsmui","basmuiele":"băsmuială","basmuielei":"băsmuială","basmuielele":"băsmuială","basmuielelor":"băsmuială","basmuieli":"băsmuială","basmuii":"băsmui","basmuim":"băsmui","basmuind":"băsmui","basmuira":"băsmui","basmuiram":"băsmui","basmuirati":"băsmui","basmuise":"băsmui","basmuisem":"băsmui","basmuisera":"băsmui","basmuiseram":"băsmui","basmuiserati":"băsmui","basmuisesi":"băsmui","basmuisi":"băsmui","basmuit":"băsmui","basmuiti":"băsmui","basmul":"basm","basmule":"basm","basmului":"basm","basnari":"băsnar","basnarii":"băsnar","basnarilor":"băsnar","basnarul":"băsnar","basnarule":"băsnar","basnarului":"băsnar","basnasi":"băsnaș","basnasii":"băsnaș","basnasilor":"băsnaș","basnasul":"băsnaș","basnasule":"băsnaș","basnasului":"băsnaș","basne":"basnă","basnea":"băsni","basneai":"băsni","basneam":"băsni","basneati":"băsni","basneau":"băsni","basnei":"basnă","basnele":"basnă","basnelor":"basnă","basnesc":"băsni","basneste":"băsni","basnesti":"băsni","basnii":"băsni","basnim":"băsni","basnind":"băsni","basnira":"băsni","basniram":"băsni","basnirati":"băsni","basnirea":"băsnire","basniri":"băsnire","basnirii":"băsnire","basnirile":"băsnire","basnirilor":"băsnire","basnise":"băsni","basnisem":"băsni","basnisera":"băsni","basniseram":"băsni","basniserati":"băsni","basnisesi":"băsni","basnisi":"băsni","basnit":"băsni","basniti":"băsni","basnitoare":"băsnitor","basnitoarea":"băsnitor","basnitoarele":"băsnitor","basnitori":"băsnitor","basnitorii":"băsnitor","basnitorilor":"băsnitor","basnitorul":"băsnitor"};
@@ -0,0 +1 @@
+export default {"basnitorule":"băsnitor","basnitorului":"băsnitor","basnitul":"băsnit","basnitule":"băsnit","basnitului":"băsnit","basnituri":"băsnit","basniturile":"băsnit","basniturilor":"băsnit","basoalde":"bașoaldă","basoaldei":"bașoaldă","basoaldele":"bașoaldă","basoaldelor":"bașoaldă","basoane":"bason","basoanele":"bason","basoanelor":"bason","basonul":"bason","basonule":"bason","basonului":"bason","basorelieful":"basorelief","basoreliefule":"basorelief","basoreliefului":"basorelief","basoreliefuri":"basorelief","basoreliefurile":"basorelief","basoreliefurilor":"basorelief","basorelievul":"basoreliev","basorelievule":"basoreliev","basorelievului":"basoreliev","basorelievuri":"basoreliev","basorelievurile":"basoreliev","basorelievurilor":"basoreliev","basrelieful":"basrelief","basreliefule":"basrelief","basreliefului":"basrelief","basreliefuri":"basrelief","basreliefurile":"basrelief","basreliefurilor":"basrelief","bastana":["baștană","baștan","baștana","baștan"],"bastane":"baștan","bastanele":"baștan","bastani":"baștan","bastanii":"baștan","bastanilor":"baștan","bastanul":"baștan","bastanule":"baștan","bastanului":"baștan","bastardarea":"bastardare","bastardari":"bastardare","bastardarii":"bastardare","bastardarile":"bastardare","bastardarilor":"bastardare","bastarde":"bastardă","bastardei":"bastardă","bastardele":"bastardă","bastardelor":"bastardă","bastardul":"bastard","bastardule":"bastard","bastardului":"bastard","bastarna":["bastarnă","bastarn","bastarna","bastarn"],"bastarne":["bastarne","bastarn","bastarne","bastarnă"],"bastarnei":"bastarnă","bastarnele":["bastarnele","bastarn","bastarnele","bastarnă"],"bastarnelor":"bastarnă","bastarni":"bastarn","bastarnii":"bastarn","bastarnilor":"bastarn","bastarnul":"bastarn","bastarnule":"bastarn","bastarnului":"bastarn","bastarzi":"bastard","bastarzii":"bastard","bastarzilor":"bastard","baste":["baște","basc","băște","bașcă","baște","baștă"],"bastei":["băștei","bașcă","baștei","baștă"],"bastele":["baștele","basc","băștele","bașcă","baștele","baștă"],"bastelor":["băștelor","bașcă","baștelor","baștă"],"basti":["baști","basc","băști","bască","băști","bașcă"],"bastii":["baștii","basc","băștii","bască"],"bastile":"bască","bastilor":"bască","bastimente":"bastiment","bastimentele":"bastiment","bastimentelor":"bastiment","bastimentul":"bastiment","bastimentule":"bastiment","bastimentului":"bastiment","bastinasa":["băștinașă","băștinaș","băștinașa","băștinaș"],"bastinase":["băștinașe","băștinaș","băștinașe","băștinașă"],"bastinasei":"băștinașă","bastinasele":["băștinașele","băștinaș","băștinașele","băștinașă"],"bastinaselor":"băștinașă","bastinasi":"băștinaș","bastinasii":"băștinaș","bastinasilor":"băștinaș","bastinasul":"băștinaș","bastinasule":"băștinaș","bastinasului":"băștinaș","bastini":"baștină","bastinii":"baștină","bastinile":"baștină","bastinilor":"baștină","bastioane":"bastion","bastioanele":"bastion","bastioanelor":"bastion","bastionul":"bastion","bastionule":"bastion","bastionului":"bastion","bastoane":"baston","bastoanele":"baston","bastoanelor":"baston","bastonacheul":"bastonache","bastonacheule":"bastonache","bastonacheului":"bastonache","bastonade":"bastonadă","bastonadei":"bastonadă","bastonadele":"bastonadă","bastonadelor":"bastonadă","bastonase":"bastonaș","bastonasele":"bastonaș","bastonaselor":"bastonaș","bastonasul":"bastonaș","bastonasule":"bastonaș","bastonasului":"bastonaș","bastonele":"bastonel","bastonelele":"bastonel","bastonelelor":"bastonel","bastonelul":"bastonel","bastonelule":"bastonel","bastonelului":"bastonel","bastonul":"baston","bastonule":"baston","bastonului":"baston","bastroe":"Bîstroe","basul":"bas","basule":"bas","basului":"bas","bat":"bate","bata":["bâtă","bât","bâta","bât","bată","bate"],"bata apa-n piua":"bate apa-n piuă","bata la cap":"bate la cap","bata la ochi":"bate la ochi","bata la talpi":"bate la tălpi","bata palma":"bate palma","batai":"bătaie","batai de cap":"bătaie de cap","bataia":["bâțâia","bâțâi","bătaia","bătaie"],"bataiai":"bâțâi","bataiam":"bâțâi","bataiasi":"bătăiaș","bataiasii":"bătăiaș","bataiasilor":"bătăiaș","bataiasul":"bătăiaș","bataiasule":"bătăiaș","bataiasului":"bătăiaș","bataiati":"bâțâi","bataiau":"bâțâi","bataie":"bâțâi","bataiele":"bâțâială","bataielei":"bâțâială","bataielele":"bâțâială","bataielelor":"bâțâială","bataieli":"bâțâială","bataii":["bâțâii","bâțâi","bătăii","bătaie"],"bataile":"bătaie","batailor":"bătaie","bataim":"bâțâi","bataind":"bâțâi","bataioasa":["bătăioasă","bătăios","bătăioasa","bătăios"],"bataioase":"bătăios","bataioasele":"bătăios","bataiosi":"bătăios","bataiosii":"bătăios","bataiosul":"bătăios","bataira":"bâțâi","batairam":"bâțâi","batairati":"bâțâi","bataise":"bâțâi","bataisem":"bâțâi","bataisera":"bâțâi","bataiseram":"bâțâi","bataiserati":"bâțâi","bataisesi":"bâțâi","bataisi":"bâțâi","batait":"bâțâi","bataite":"bătăiță","bataitei":"bătăiță","bataitele":"bătăiță","bataitelor":"bătăiță","bataiti":"bâțâi","bataitul":"bătăit","bataitule":"bătăit","bataitului":"bătăit","bataiute":"bătăiuță","bataiutei":"bătăiuță","bataiutele":"bătăiuță","bataiutelor":"bătăiuță","bataje":"bataj","batajele":"bataj","batajelor":"bataj","batajul":"bataj","batajule":"bataj","batajului":"bataj","batalamale":"batalama","batalamalei":"batalama","batalamalele":"batalama","batalamalelor":"batalama","batalamaua":"batalama","batalani":"bătălan","batalanii":"bătălan","batalanilor":"bătălan","batalanul":"bătălan","batalanule":"bătălan","batalanului":"bătălan","batali":"batal","batalia":"bătălie","bataliei":"bătălie","batalii":["batalii","batal","bătălii","bătălie"],"bataliile":"bătălie","bataliilor":"bătălie","batalilor":"batal","batalioane":"batalion","batalioanele":"batalion","batalioanelor":"batalion","batalionul":"batalion","batalionule":"batalion","batalionului":"batalion","batalul":"batal","batalule":"batal","batalului":"batal","batand":"bate","batanta":["batantă","batant","batanta","batant"],"batante":"batant","batantele":"batant","batanti":"batant","batantii":"batant","batantul":"batant","batardoul":"batardou","batardoule":"batardou","batardoului":"batardou","batardouri":"batardou","batardourile":"batardou","batardourilor":"batardou","batate":"batată","batatei":"batată","batatele":"batată","batatelor":"batată","batati":"batat","batatii":"batat","batatilor":"batat","batatoare":"bătător","batatoarele":"bătător","batatoarelor":"bătător","batatorea":"bătători","batatoreai":"bătători","batatoream":"bătători","batatoreati":"bătători","batatoreau":"bătători","batatoresc":"bătători","batatoreste":"bătători","batatoresti":"bătători","batatorii":"bătători","batatorim":"bătători","batatorind":"bătători","batatorira":"bătători","batatoriram":"bătători","batatorirati":"bătători","batatorise":"bătători","batatorisem":"bătători","batatorisera":"bătători","batatoriseram":"bătători","batatoriserati":"bătători","batatorisesi":"bătători","batatorisi":"bătători","batatorit":"bătători","batatorita":["bătătorită","bătătorit","bătătorita","bătătorit"],"batatorite":"bătătorit","batatoritele":"bătătorit","batatoriti":["bătătoriți","bătători","bătătoriți","bătătorit"],"batatoritii":"bătătorit","batatoritul":"bătătorit","batatornite":"bătătorniță","batatornitei":"bătătorniță","batatornitele":"bătătorniță","batatornitelor":"bătătorniță","batatorul":"bătător","batatorule":"bătător","batatorului":"bătător","batatul":"batat","batatule":"batat","batatului":"batat","bataturatul":"bătăturat","bataturatule":"bătăturat","bataturatului":"bătăturat","bataturea":"bătături","batatureai":"bătături","batatuream":"bătături","batatureati":"bătături","batatureau":"bătături","bataturesc":"bătături","batatureste":"bătături","bataturesti":"bătături","bataturi":"bătătură","bataturii":["bătăturii","bătătură","bătăturii","bătături"],"bataturile":"bătătură","bataturilor":"bătătură","bataturim":"bătături","bataturind":"bătături","bataturira":"bătături","bataturiram":"bătături","bataturirati":"bătături","bataturise":"bătături","bataturisem":"bătături","bataturisera":"bătături","bataturiseram":"bătături","bataturiserati":"bătături","bataturisesi":"bătături","bataturisi":"bătături","bataturit":"bătături","bataturiti":"bătături","batausa":["bătăușă","bătăuș","bătăușa","bătăuș"],"batause":["bătăușe","bătăuș","bătăușe","bătăușă"],"batausei":"bătăușă","batausele":["bătăușele","bătăuș","bătăușele","bătăușă"],"batauselor":"bătăușă","batausi":"bătăuș","batausii":"bătăuș","batausilor":"bătăuș","batausul":"bătăuș","batausule":"bătăuș","batausului":"bătăuș","batave":"batavă","batavei":"batavă","batavele":"batavă","batavelor":"batavă","batavi":"batav","batavii":"batav","batavilor":"batav","batavul":"batav","batavule":"batav","batavului":"batav","batculite":"bătculiță","batculitei":"bătculiță","batculitele":"bătculiță","batculitelor":"bătculiță","batcute":"bâtcuță","batcutei":"bâtcuță","batcutele":"bâtcuță","batcutelor":"bâtcuță","bate":["bâte","bât","bâte","bâtă"],"bate apa-n piua 3rd conjugation":"bate apa-n piuă","bate de baseball":"bâtă de baseball","batea":"bate","bateai":"bate","bateam":"bate","bateati":"bate","bateau":"bate","batei":"bâtă","batele":["bâtele","bât","bâtele","bâtă"],"batelor":"bâtă","batelul":"batel","batelule":"batel","batelului":"batel","batem":"bate","baterea":"batere","bateri":"batere","bateria":"baterie","bateriei":"baterie","baterii":["baterii","batere","baterii","baterie"],"baterii alcaline":"baterie alcalină","baterii solare":"baterie solară","bateriile":"baterie","bateriilor":"baterie","baterile":"batere","baterilor":"batere","bateriste":"bateristă","bateristei":"bateristă","bateristele":"bateristă","bateristelor":"bateristă","bateristi":["bateriști","baterist","bateristi","baterist"],"bateristii":"baterist","bateristilor":"baterist","bateristul":"baterist","bateristule":"baterist","bateristului":"baterist","bateti":"bate","batgiocurai":"batgiocura","batgiocuram":["batgiocurăm","batgiocura","batgiocuram","batgiocura"],"batgiocurand":"batgiocura","batgiocurara":"batgiocura","batgiocuraram":"batgiocura","batgiocurarati":"batgiocura","batgiocurase":"batgiocura","batgiocurasem":"batgiocura","batgiocurasera":"batgiocura","batgiocuraseram":"batgiocura","batgiocuraserati":"batgiocura","batgiocurasesi":"batgiocura","batgiocurasi":"batgiocura","batgiocurat":"batgiocura","batgiocurati":"batgiocura","batgiocurau":"batgiocura","batgiocureaza":"batgiocura","batgiocurez":"batgiocura","batgiocurezi":"batgiocura","bathoniana":["bathoniană","bathonian","bathoniana","bathonian"],"bathonianul":"bathonian","bathonianule":"bathonian","bathonianului":"bathonian","bathoniene":"bathonian","bathonienele":"bathonian","bathonieni":"bathonian","bathonienii":"bathonian","bati":["bâți","bât","bați","bate"],"batiala":["batială","batial","batiala","batial"],"batiale":"batial","batialele":"batial","batiali":"batial","batialii":"batial","batialul":"batial","batice":"bâtică","baticeaua":"bâticea","baticei":"bâtică","baticele":["bâticele","bâtică","bâticele","bâticea","bâticele","bâticel"],"baticelei":"bâticea","baticelele":["bâticelele","bâticea","bâticelele","bâticel"],"baticelelor":["bâticelelor","bâticea","bâticelelor","bâticel"],"baticelor":"bâtică","baticelul":"bâticel","baticelule":"bâticel","baticelului":"bâticel","batici":"bâtic","baticii":"bâtic","baticilor":"bâtic","baticul":["baticul","batic","bâticul","bâtic"],"baticule":["baticule","batic","bâticule","bâtic"],"baticului":["baticului","batic","bâticului","bâtic"],"baticuri":"batic","baticurile":"batic","baticurilor":"batic","baticute":"bâticuță","baticutei":"bâticuță","baticutele":"bâticuță","baticutelor":"bâticuță","batigrafia":"batigrafie","batigrafica":["batigrafică","batigrafic","batigrafica","batigrafic"],"batigrafice":"batigrafic","batigraficele":"batigrafic","batigrafici":"batigrafic","batigraficii":"batigrafic","batigraficul":"batigrafic","batigrafiei":"batigrafie","batigrafii":"batigrafie","batigrafiile":"batigrafie","batigrafiilor":"batigrafie","batii":"bât","batilor":"bât","batimetre":"batimetru","batimetrele":"batimetru","batimetrelor":"batimetru","batimetria":"batimetrie","batimetrica":["batimetrică","batimetric","batimetrica","batimetric"],"batimetrice":"batimetric","batimetricele":"batimetric","batimetrici":"batimetric","batimetricii":"batimetric","batimetricul":"batimetric","batimetriei":"batimetrie","batimetrii":"batimetrie","batimetrul":"batimetru","batimetrule":"batimetru","batimetrului":"batimetru","batipelagica":["batipelagică","batipelagic","batipelagica","batipelagic"],"batipelagice":"batipelagic","batipelagicele":"batipelagic","batipelagici":"batipelagic","batipelagicii":"batipelagic","batipelagicul":"batipelagic","batiplanctonul":"batiplancton","batiplanctonule":"batiplancton","batiplanctonului":"batiplancton","batir":"batâr","batiscaful":"batiscaf","batiscafule":"batiscaf","batiscafului":"batiscaf","batiscafuri":"batiscaf","batiscafurile":"batiscaf","batiscafurilor":"batiscaf","batisfere":"batisferă","batisferei":"batisferă","batisferele":"batisferă","batisferelor":"batisferă","batiste":"batistă","batistea":"batiște","batistei":"batistă","batistele":"batistă","batistelor":"batistă","batisti":"batiște","batistii":"batiște","batistile":"batiște","batistilor":"batiște","batistul":"batist","batistule":"batist","batistului":"batist","batisturi":"batist","batisturile":"batist","batisturilor":"batist","batistute":"batistuță","batistutei":"batistuță","batistutele":"batistuță","batistutelor":"batistuță","batitermografe":"batitermograf","batitermografele":"batitermograf","batitermografelor":"batitermograf","batitermograful":"batitermograf","batitermografule":"batitermograf","batitermografului":"batitermograf","batiul":"batiu","batiule":"batiu","batiului":"batiu","batiuri":"batiu","batiurile":"batiu","batiurilor":"batiu","batiuscaul":"batiușca","batiuscaule":"batiușca","batiuscaului":"batiușca","batjocorea":"batjocori","batjocoreai":"batjocori","batjocoream":"batjocori","batjocoreati":"batjocori","batjocoreau":"batjocori","batjocoresc":"batjocori","batjocoreste":"batjocori","batjocoresti":"batjocori","batjocori":"batjocoră","batjocorii":["batjocorii","batjocoră","batjocorii","batjocori"],"batjocorile":"batjocoră","batjocorilor":"batjocoră","batjocorim":"batjocori","batjocorind":"batjocori","batjocorira":"batjocori","batjocoriram":"batjocori","batjocorirati":"batjocori","batjocorirea":"batjocorire","batjocoriri":"batjocorire","batjocoririi":"batjocorire","batjocoririle":"batjocorire","batjocoririlor":"batjocorire","batjocorise":"batjocori","batjocorisem":"batjocori","batjocorisera":"batjocori","batjocoriseram":"batjocori","batjocoriserati":"batjocori","batjocorisesi":"batjocori","batjocorisi":"batjocori","batjocorit":"batjocori","batjocorita":["batjocorită","batjocorit","batjocorita","batjocorit"],"batjocorite":"batjocorit","batjocoritele":"batjocorit","batjocoriti":["batjocoriți","batjocori","batjocoriți","batjocorit"],"batjocoritii":"batjocorit","batjocoritoare":"batjocoritor","batjocoritoarea":"batjocoritor","batjocoritoarele":"batjocoritor","batjocoritori":"batjocoritor","batjocoritorii":"batjocoritor","batjocoritorul":"batjocoritor","batjocoritul":"batjocorit","batjocoroasa":["batjocoroasă","batjocoros","batjocoroasa","batjocoros"],"batjocoroase":"batjocoros","batjocoroasele":"batjocoros","batjocorosi":"batjocoros","batjocorosii":"batjocoros","batjocorosilor":"batjocoros","batjocorosul":"batjocoros","batjocorosule":"batjocoros","batjocorosului":"batjocoros","batjocurai":"batjocura","batjocuram":["batjocurăm","batjocura","batjocuram","batjocura"],"batjocurand":"batjocura","batjocurara":"batjocura","batjocuraram":"batjocura","batjocurarati":"batjocura","batjocurase":"batjocura","batjocurasem":"batjocura","batjocurasera":"batjocura","batjocuraseram":"batjocura","batjocuraserati":"batjocura","batjocurasesi":"batjocura","batjocurasi":"batjocura","batjocurat":"batjocura","batjocurati":"batjocura","batjocurau":"batjocura","batjocurea":"batjocuri","batjocureai":"batjocuri","batjocuream":"batjocuri","batjocureati":"batjocuri","batjocureau":"batjocuri","batjocureaza":"batjocura","batjocuresc":"batjocuri","batjocureste":"batjocuri","batjocuresti":"batjocuri","batjocurez":"batjocura","batjocurezi":"batjocura","batjocuri":["batjocuri","batjocori","batjocuri","batjocură"],"batjocuria":"batjocurie","batjocuriei":"batjocurie","batjocurii":["batjocurii","batjocuri","batjocurii","batjocurie"],"batjocuriile":"batjocurie","batjocuriilor":"batjocurie","batjocurim":"batjocuri","batjocurind":"batjocuri","batjocurira":"batjocuri","batjocuriram":"batjocuri","batjocurirati":"batjocuri","batjocurirea":"batjocurire","batjocuriri":"batjocurire","batjocuririi":"batjocurire","batjocuririle":"batjocurire","batjocuririlor":"batjocurire","batjocurise":"batjocuri","batjocurisem":"batjocuri","batjocurisera":"batjocuri","batjocuriseram":"batjocuri","batjocuriserati":"batjocuri","batjocurisesi":"batjocuri","batjocurisi":"batjocuri","batjocurit":"batjocuri","batjocuriti":"batjocuri","batlage":"bâtlagă","batlagei":"bâtlagă","batlagele":["bâtlagele","bâtlagă","bâtlăgele","bâtlăgel"],"batlagelele":"bâtlăgel","batlagelelor":"bâtlăgel","batlagelor":"bâtlagă","batlagelul":"bâtlăgel","batlagelule":"bâtlăgel","batlagelului":"bâtlăgel","batlanasi":"bâtlănaș","batlanasii":"bâtlănaș","batlanasilor":"bâtlănaș","batlanasul":"bâtlănaș","batlanasule":"bâtlănaș","batlanasului":"bâtlănaș","batlani":"bâtlan","batlani-de-stuf":"bâtlan-de-stuf","batlanii":"bâtlan","batlanilor":"bâtlan","batlanul":"bâtlan","batlanule":"bâtlan","batlanului":"bâtlan","batloage":"bătlog","batloagele":"bătlog","batloagelor":"bătlog","batlogul":"bătlog","batlogule":"bătlog","batlogului":"bătlog","batmani":"batman","batmanii":"batman","batmanilor":"batman","batmanul":"batman","batmanule":"batman","batmanului":"batman","batoane":"baton","batoanele":"baton","batoanelor":"baton","batoasa":["bățoasă","bățos","bățoasa","bățos"],"batoase":"bățos","batoasele":"bățos","batocul":"batoc","batocule":"batoc","batocului":"batoc","batocuri":"batoc","batocurile":"batoc","batocurilor":"batoc","batofobia":"batofobie","batofobiei":"batofobie","batofobii":"batofobie","batofobiile":"batofobie","batofobiilor":"batofobie","batogul":"batog","batogule":"batog","batogului":"batog","batoguri":"batog","batogurile":"batog","batogurilor":"batog","batoinata":["bățoinată","bățoinat","bățoinata","bățoinat"],"batoinate":"bățoinat","batoinatele":"bățoinat","batoinati":"bățoinat","batoinatii":"bățoinat","batoinatul":"bățoinat","batojita":["batojită","batojit","batojita","batojit","bătojită","bătojit","bătojita","bătojit"],"batojite":["batojite","batojit","bătojite","bătojit"],"batojitele":["batojitele","batojit","bătojitele","bătojit"],"batojiti":["batojiți","batojit","bătojiți","bătojit"],"batojitii":["batojiții","batojit","bătojiții","bătojit"],"batojitul":["batojitul","batojit","bătojitul","bătojit"],"batoliti":"batolit","batolitii":"batolit","batolitilor":"batolit","batolitul":"batolit","batolitule":"batolit","batolitului":"batolit","batometre":"batometru","batometrele":"batometru","batometrelor":"batometru","batometruul":"batometru","batometruule":"batometru","batometruului":"batometru","batonul":"baton","batonule":"baton","batonului":"baton","batosi":"bățos","batosii":"bățos","batosul":"bățos","batozari":"batozar","batozarii":"batozar","batozarilor":"batozar","batozarul":"batozar","batozarule":"batozar","batozarului":"batozar","batoze":"batoză","batozei":"batoză","batozele":"batoză","batozelor":"batoză","batracianul":"batracian","batracianule":"batracian","batracianului":"batracian","batracieni":"batracian","batracienii":"batracian","batracienilor":"batracian","batraiora":["bătrâioră","bătrâior","bătrâiora","bătrâior"],"batraiore":"bătrâior","batraiorele":"bătrâior","batraiori":"bătrâior","batraiorii":"bătrâior","batraiorul":"bătrâior","batrana":["bătrână","bătrân","bătrâna","bătrân"],"batranciora":["bătrâncioră","bătrâncior","bătrânciora","bătrâncior"],"batranciore":"bătrâncior","batranciorele":"bătrâncior","batranciori":"bătrâncior","batranciorii":"bătrâncior","batranciorul":"bătrâncior","batrane":["bătrâne","bătrân","bătrâne","bătrână"],"batraneasca":["bătrânească","bătrânesc","bătrâneasca","bătrânesc"],"batranei":["bătrânei","bătrână","bătrânei","bătrânel"],"batraneii":"bătrânel","batraneilor":"bătrânel","batranele":["bătrânele","bătrân","bătrânele","bătrână","bătrânele","bătrânică"],"batranelei":"bătrânică","batranelele":"bătrânică","batranelelor":"bătrânică","batranelor":"bătrână","batranelul":"bătrânel","batranelule":"bătrânel","batranelului":"bătrânel","batranescul":"bătrânesc","batranesti":"bătrânesc","batranestii":"bătrânesc","batranestile":"bătrânesc","batranetea":"bătrânețe","batraneti":["bătrâneți","bătrâneță","bătrâneți","bătrânețe"],"batranetii":["bătrâneții","bătrâneță","bătrâneții","bătrânețe"],"batranetile":["bătrânețile","bătrâneță","bătrânețile","bătrânețe"],"batranetilor":["bătrâneților","bătrâneță","bătrâneților","bătrânețe"],"batranetul":"bătrânet","batranetule":"bătrânet","batranetului":"bătrânet","batrani":"bătrân","batranica":["bătrânică","bătrânel","bătrânica","bătrânel"],"batranici":"bătrânel","batranicile":"bătrânel","batranicioasa":["bătrânicioasă","bătrânicios","bătrânicioasa","bătrânicios"],"batranicioase":"bătrânicios","batranicioasele":"bătrânicios","batraniciosi":"bătrânicios","batraniciosii":"bătrânicios","batraniciosul":"bătrânicios","batranii":"bătrân","batranilor":"bătrân","batranimea":"bătrânime","batranimi":"bătrânime","batranimii":"bătrânime","batraniora":["bătrânioră","bătrânior","bătrâniora","bătrânior"],"batraniore":"bătrânior","batraniorele":"bătrânior","batraniori":"bătrânior","batraniorii":"bătrânior","batraniorul":"bătrânior","batranisul":"bătrâniș","batranisule":"bătrâniș","batranisului":"bătrâniș","batranul":"bătrân","batranule":"bătrân","batranului":"bătrân","batranuta":["bătrănuță","bătrănuț","bătrănuța","bătrănuț"],"batranute":"bătrănuț","batranutele":"bătrănuț","batranuti":"bătrănuț","batranutii":"bătrănuț","batranutul":"bătrănuț","batriior":"bătrâior","batrin":"bătrân","batrina":["bătrîna","Bătrâna","bătrîna","bătrâna","bătrînă","bătrână"],"batrincior":"bătrâncior","batrinel":"bătrânel","batrinesc":"bătrânesc","batrineste":"bătrânește","batrinesti":"Bătrânești","batrinet":"bătrânet","batrineta":"bătrâneță","batrinete":"bătrânețe","batrini":["bătrîni","Bătrâni","bătrîni","bătrâni"],"batrinica":"bătrânică","batrinicios":"bătrânicios","batrinime":"bătrânime","batrinis":"bătrâniș","batrinu":"Bătrânu","batrinut":"Bătrânuț","batu":"bate","batucaturi":"bătucătură","batucaturii":"bătucătură","batucaturile":"bătucătură","batucaturilor":"bătucătură","batucita":["bătucită","bătucit","bătucita","bătucit"],"batucite":"bătucit","batucitele":"bătucit","batuciti":"bătucit","batucitii":"bătucit","batucitul":"bătucit","batui":"bate","batul":["bâtul","bât","bățul","băț"],"batule":["bâtule","bât","bățule","băț"],"batulete":"bățuleț","batuletele":"bățuleț","batuletelor":"bățuleț","batuletul":"bățuleț","batuletule":"bățuleț","batuletului":"bățuleț","batului":["bâtului","bât","bățului","băț"],"batura":"bate","baturam":"bate","baturati":"bate","baturoaie":"băturoi","baturoaiele":"băturoi","baturoaielor":"băturoi","baturoiul":"băturoi","baturoiule":"băturoi","baturoiului":"băturoi","batuse":"bate","batusem":"bate","batusera":"bate","batuseram":"bate","batuserati":"bate","batusesi":"bate","batusi":"bate","batut":"bate","batut apa-n piua":"bate apa-n piuă","batut la cap":"bate la cap","batut la ochi":"bate la ochi","batut la talpi":"bate la tălpi","batut palma":"bate palma","batuta":["bătută","bătut","bătuta","bătut"],"batuta in cuie":"bătut în cuie","batute":["bătute","bătut","bătuțe","bătuț","bâtuțe","bâtuță","bătute","bătută"],"batute in cuie":"bătut în cuie","batutei":["bâtuței","bâtuță","bătutei","bătută"],"batutele":["bătutele","bătut","bătuțele","bătuț","bâtuțele","bâtuță","bătutele","bătută"],"batutelor":["bătuțelor","bătuț","bâtuțelor","bâtuță","bătutelor","bătută"],"batuti":"bătut","batuti in cuie":"bătut în cuie","batutii":"bătut","batutul":["bătutul","bătut","bătuțul","bătuț"],"batutule":"bătuț","batutului":"bătuț","bau":"bea","baubila":["băubilă","băubil","băubila","băubil"],"baubile":"băubil","baubilele":"băubil","baubili":"băubil","baubilii":"băubil","baubilul":"băubil","baudelairianul":"baudelairian","baudelairianule":"baudelairian","baudelairianului":"baudelairian","baudelairieni":"baudelairian","baudelairienii":"baudelairian","baudelairienilor":"baudelairian","baui":"bea","baunat":"băuna","bauni":"băuna","baura":"bea","bauram":"bea","baurati":"bea","bause":"bea","bausem":"bea","bausera":"bea","bauseram":"bea","bauserati":"bea","bausesi":"bea","bausi":"bea","baut":"bea","baut tutun":"bea tutun","bauta":["băută","băut","băuta","băut"],"baute":["băute","băut","băute","băută"],"bautei":"băută","bautele":["băutele","băut","băutele","băută"],"bautelor":"băută","bauti":"băut","bautii":"băut","bautoare":"băutor","bautoarea":["băutoarea","băutoare","băutoarea","băutor"],"bautoarei":"băutoare","bautoarele":["băutoarele","băutoare","băutoarele","băutor"],"bautoarelor":"băutoare","bautori":"băutor","bautorii":"băutor","bautorilor":"băutor","bautorul":"băutor","bautorule":"băutor","bautorului":"băutor","bautul":"băut","bauturi":"băutură","bauturi carbogazoase":"băutură carbogazoasă","bauturi racoritoare":"băutură răcoritoare","bauturice":"băuturică","bauturicei":"băuturică","bauturicele":"băuturică","bauturicelor":"băuturică","bauturici":"băuturică","bauturii":"băutură","bauturile":"băutură","bauturilor":"băutură","bauxite":"bauxită","bauxitei":"bauxită","bauxitele":"bauxită","bauxitelor":"bauxită","bavareza":["bavareză","bavarez","bavareza","bavarez"],"bavareze":["bavareze","bavarez","bavareze","bavareză"],"bavarezei":"bavareză","bavarezele":["bavarezele","bavarez","bavarezele","bavareză"],"bavarezelor":"bavareză","bavarezi":"bavarez","bavarezii":"bavarez","bavarezilor":"bavarez","bavarezul":"bavarez","bavarezule":"bavarez","bavarezului":"bavarez","bavasa":["bâvașă","bâvaș","bâvașa","bâvaș"],"bavase":"bâvaș","bavasele":"bâvaș","bavasi":"bâvaș","bavasii":"bâvaș","bavasul":"bâvaș","bavete":"bavetă","bavetei":"bavetă","bavetele":["bavetele","bavetă","bavețele","bavețică"],"bavetelor":"bavetă","bavetice":"bavețică","baveticei":"bavețică","baveticele":"bavețică","baveticelor":"bavețică","baxul":"bax","baxule":"bax","baxului":"bax","baxuri":"bax","baxurile":"bax","baxurilor":"bax","bazaconia":"bazaconie","bazaconiei":"bazaconie","bazaconii":"bazaconie","bazaconiile":"bazaconie","bazaconiilor":"bazaconie","bazai":"baza","bazaia":["bâzâia","bâzâi","bâzăia","bâzăi"],"bazaiai":["bâzâiai","bâzâi","bâzăiai","bâzăi"],"bazaiam":["bâzâiam","bâzâi","bâzăiam","bâzăi"],"bazaiati":["bâzâiați","bâzâi","bâzăiați","bâzăi"],"bazaiau":["bâzâiau","bâzâi","bâzăiau","bâzăi"],"bazaie":["bâzâie","bâzâi","bâzăie","bâzăi"],"bazaiele":"bâzâială","bazaielei":"bâzâială","bazaielele":"bâzâială","bazaielelor":"bâzâială","bazaieli":"bâzâială","bazaii":["bâzâii","bâzâi","bâzăii","bâzăi"],"bazaim":["bâzâim","bâzâi","bâzăim","bâzăi"],"bazaind":["bâzâind","bâzâi","bâzăind","bâzăi"],"bazaira":["bâzâiră","bâzâi","bâzăiră","bâzăi"],"bazairam":["bâzâirăm","bâzâi","bâzăirăm","bâzăi"],"bazairati":["bâzâirăți","bâzâi","bâzăirăți","bâzăi"],"bazaise":["bâzâise","bâzâi","bâzăise","bâzăi"],"bazaisem":["bâzâisem","bâzâi","bâzăisem","bâzăi"],"bazaisera":["bâzâiseră","bâzâi","bâzăiseră","bâzăi"],"bazaiseram":["bâzâiserăm","bâzâi","bâzăiserăm","bâzăi"],"bazaiserati":["bâzâiserăți","bâzâi","bâzăiserăți","bâzăi"],"bazaisesi":["bâzâiseși","bâzâi","bâzăiseși","bâzăi"],"bazaisi":["bâzâiși","bâzâi","bâzăiși","bâzăi"],"bazait":["bâzâit","bâzâi","bâzăit","bâzăi"],"bazaiti":["bâzâiți","bâzâi","bâzăiți","bâzăi"],"bazaitoare":"bâzâitor","bazaitoarea":"bâzâitor","bazaitoarele":"bâzâitor","bazaitori":"bâzâitor","bazaitorii":"bâzâitor","bazaitorul":"bâzâitor","bazaitul":"bâzâit","bazaitule":"bâzâit","bazaitului":"bâzâit","bazaituri":"bâzâitură","bazaiturii":"bâzâitură","bazaiturile":"bâzâitură","bazaiturilor":"bâzâitură","bazala":["bazală","bazal","bazala","bazal"],"bazale":"bazal","bazalele":"bazal","bazali":"bazal","bazalii":"bazal","bazaltica":["bazaltică","bazaltic","bazaltica","bazaltic"],"bazaltice":"bazaltic","bazalticele":"bazaltic","bazaltici":"bazaltic","bazalticii":"bazaltic","bazalticul":"bazaltic","bazaltine":"bazaltină","bazaltinei":"bazaltină","bazaltinele":"bazaltină","bazaltinelor":"bazaltină","bazaltul":"bazalt","bazaltule":"bazalt","bazaltului":"bazalt","bazalturi":"bazalt","bazalturile":"bazalt","bazalturilor":"bazalt","bazalul":"bazal","bazam":["bazăm","baza","bazam","baza"],"bazamente":"bazament","bazamentele":"bazament","bazamentelor":"bazament","bazamentul":"bazament","bazamentule":"bazament","bazamentului":"bazament","bazand":"baza","bazaoche":"bazaochi","bazaochea":"bazaochi","bazaochele":"bazaochi","bazaochii":"bazaochi","bazaochiul":"bazaochi","bazara":"baza","bazaram":"baza","bazarati":"baza","bazare":"bazar","bazarele":"bazar","bazarelor":"bazar","bazarul":"bazar","bazarule":"bazar","bazarului":"bazar","bazaruri":"bazar","bazase":"baza","bazasem":"baza","bazasera":"baza","bazaseram":"baza","bazaserati":"baza","bazasesi":"baza","bazasi":"baza","bazat":"baza","bazati":"baza","bazau":"baza","bazauca":["băzăucă","băzăuc","băzăuca","băzăuc"],"bazauce":"băzăuc","bazaucele":"băzăuc","bazauci":"băzăuc","bazaucii":"băzăuc","bazaucul":"băzăuc","bazdacoasa":["bâzdâcoasă","bâzdâcos","bâzdâcoasa","bâzdâcos"],"bazdacoase":"bâzdâcos","bazdacoasele":"bâzdâcos","bazdacosi":"bâzdâcos","bazdacosii":"bâzdâcos","bazdacosul":"bâzdâcos","bazdacuri":"bâzdâc","bazdagae":"bâzdâgău","bazdagaele":"bâzdâgău","bazdagaelor":"bâzdâgău","bazdagania":"bâzdâganie","bazdaganiei":"bâzdâganie","bazdaganii":"bâzdâganie","bazdaganiile":"bâzdâganie","bazdaganiilor":"bâzdâganie","bazdagauul":"bâzdâgău","bazdagauule":"bâzdâgău","bazdagauului":"bâzdâgău","baze":"bază","baze aeriene":"bază aeriană","baze de date ierarhice":"bază de date ierarhică","baze de date relationale":"bază de date relațională","baze navale":"bază navală","bazeaua":"bazea","bazeaza":"baza","bazedoviana":["bazedoviană","bazedovian","bazedoviana","bazedovian"],"bazedovianul":"bazedovian","bazedoviene":"bazedovian","bazedovienele":"bazedovian","bazedovieni":"bazedovian","bazedovienii":"bazedovian","bazei":"bază","bazele":["bazele","bază","bazele","bazea"],"bazelei":"bazea","bazelele":"bazea","bazelelor":"bazea","bazelor":"bază","bazez":"baza","bazezi":"baza","bazica":["bazică","bazic","bazica","bazic"],"bazice":"bazic","bazicele":"bazic","bazici":"bazic","bazicii":"bazic","bazicitatea":"bazicitate","bazicitati":"bazicitate","bazicitatii":"bazicitate","bazicul":"bazic","bazidia":"bazidie","bazidiei":"bazidie","bazidii":"bazidie","bazidiile":"bazidie","bazidiilor":"bazidie","bazidiospori":"bazidiospor","bazidiosporii":"bazidiospor","bazidiosporilor":"bazidiospor","bazidiosporul":"bazidiospor","bazidiosporule":"bazidiospor","bazidiosporului":"bazidiospor","bazilara":["bazilară","bazilar","bazilara","bazilar"],"bazilare":"bazilar","bazilarele":"bazilar","bazilari":"bazilar","bazilarii":"bazilar","bazilarul":"bazilar","bazilei":"bazileu","bazileii":"bazileu","bazileilor":"bazileu","bazileuul":"bazileu","bazileuule":"bazileu","bazileuului":"bazileu","bazilicala":["bazilicală","bazilical","bazilicala","bazilical"],"bazilicale":"bazilical","bazilicalea":"bazilicale","bazilicalei":"bazilicale","bazilicalele":["bazilicalele","bazilical","bazilicalele","bazilicale"],"bazilicalelor":"bazilicale","bazilicali":"bazilical","bazilicalii":"bazilical","bazilicalul":"bazilical","bazilici":"bazilică","bazilicii":"bazilică","bazilicile":"bazilică","bazilicilor":"bazilică","baziliscul":"bazilisc","baziliscule":"bazilisc","baziliscului":"bazilisc","bazilisti":"bazilisc","bazilistii":"bazilisc","bazilistilor":"bazilisc","bazinase":"bazinaș","bazinasele":"bazinaș","bazinaselor":"bazinaș","bazinasul":"bazinaș","bazinasule":"bazinaș","bazinasului":"bazinaș","bazine":"bazin","bazine de inot":"bazin de înot","bazine hidrografice":"bazin hidrografic","bazinele":"bazin","bazinelor":"bazin","bazinete":"bazinet","bazinetele":"bazinet","bazinetelor":"bazinet","bazinetul":"bazinet","bazinetule":"bazinet","bazinetului":"bazinet","bazinul":"bazin","bazinule":"bazin","bazinului":"bazin","bazoaie":"bâzoi","bazoaiele":"bâzoi","bazoaielor":"bâzoi","bazofile":"bazofil","bazofilele":"bazofil","bazofilelor":"bazofil","bazofilieul":"bazofilie","bazofilieule":"bazofilie","bazofilieului":"bazofilie","bazofilii":"bazofilie","bazofiliile":"bazofilie","bazofiliilor":"bazofilie","bazofilul":"bazofil","bazofilule":"bazofil","bazofilului":"bazofil","bazofobia":"bazofobie","bazofobiei":"bazofobie","bazofobii":"bazofobie","bazofobiile":"bazofobie","bazofobiilor":"bazofobie","bazoiul":"bâzoi","bazoiule":"bâzoi","bazoiului":"bâzoi","bdelionul":"bdelion","bdelionule":"bdelion","bdelionului":"bdelion","beai":"bea","beam":"bea","beamteri":"beamter","beamterii":"beamter","beamterilor":"beamter","beamterul":"beamter","beamterule":"beamter","beamterului":"beamter","beata":["beată","beat","beata","beat"],"beati":"bea","beatific":"beatifica","beatificai":"beatifica","beatificam":["beatificăm","beatifica","beatificam","beatifica"],"beatificand":"beatifica","beatificara":"beatifica","beatificaram":"beatifica","beatificarati":"beatifica","beatificarea":"beatificare","beatificari":"beatificare","beatificarii":"beatificare","beatificarile":"beatificare","beatificarilor":"beatificare","beatificase":"beatifica","beatificasem":"beatifica","beatificasera":"beatifica","beatificaseram":"beatifica","beatificaserati":"beatifica","beatificasesi":"beatifica","beatificasi":"beatifica","beatificat":"beatifica","beatificati":"beatifica","beatificau":"beatifica","beatifice":"beatifica","beatifici":"beatifica","beatitudinea":"beatitudine","beatitudinei":"beatitudine","beatnici":"beatnic","beatnicii":"beatnic","beatnicilor":"beatnic","beatnicul":"beatnic","beatnicule":"beatnic","beatnicului":"beatnic","beatul":"beat","beatule":"beat","beatului":"beat","beaturi":"beat","beaturile":"beat","beaturilor":"beat","beau":"bea","bebelusi":"bebeluș","bebelusii":"bebeluș","bebelusilor":"bebeluș","bebelusul":"bebeluș","bebelusule":"bebeluș","bebelusului":"bebeluș","bebeul":"bebe","bebeule":"bebe","bebeului":"bebe","bebiul":"bebi","bebiule":"bebi","bebiului":"bebi","becari":"becar","becarii":"becar","becarilor":"becar","becarul":"becar","becarule":"becar","becarului":"becar","becate":"becață","becatei":"becață","becatele":"becață","becatelor":"becață","becatine":"becațină","becatine comune":"becațină comună","becatine mari":"becațină mare","becatine mici":"becațină mică","becatinei":"becațină","becatinele":"becațină","becatinelor":"becațină","beccii":"becciu","becciii":"becciu","becciilor":"becciu","becciul":"becciu","becciule":"becciu","becciului":"becciu","beceri":"becer","beceria":"becerie","beceriei":"becerie","becerii":["becerii","becer","becerii","becerie"],"beceriile":"becerie","beceriilor":"becerie","becerilor":"becer","becerul":"becer","becerule":"becer","becerului":"becer","becherasi":"becheraș","becherasii":"becheraș","becherasilor":"becheraș","becherasul":"becheraș","becherasule":"becheraș","becherasului":"becheraș","becheri":"becher","becheria":"becherie","becheriei":"becherie","becherii":["becherii","becher","becherii","becherie"],"becheriile":"becherie","becheriilor":"becherie","becherilor":"becher","becheroiul":"becheroi","becheroiule":"becheroi","becheroiului":"becheroi","becherul":"becher","becherule":"becher","becherului":"becher","becisnica":["becisnică","becisnic","becisnica","becisnic"],"becisnice":["becisnice","becisnic","becisnice","becisnică"],"becisnicei":"becisnică","becisnicele":["becisnicele","becisnic","becisnicele","becisnică"],"becisnicelor":"becisnică","becisnici":"becisnic","becisnicia":"becisnicie","becisniciei":"becisnicie","becisnicii":["becisnicii","becisnic","becisnicii","becisnicie"],"becisniciile":"becisnicie","becisniciilor":"becisnicie","becisnicul":"becisnic","beciul":"beci","beciule":"beci","beciului":"beci","beciuri":"beci","beciurile":"beci","beciurilor":"beci","becquerelite":"becquerelit","becquerelitele":"becquerelit","becquerelitelor":"becquerelit","becquerelitul":"becquerelit","becquerelitule":"becquerelit","becquerelitului":"becquerelit","becul":"bec","becule":"bec","becului":"bec","becuri":"bec","becurile":"bec","becurilor":"bec","bedarnite":"bedarniță","bedarnitei":"bedarniță","bedarnitele":"bedarniță","bedarnitelor":"bedarniță","bedasi":"bedaș","bedasii":"bedaș","bedasilor":"bedaș","bedasul":"bedaș","bedasule":"bedaș","bedasului":"bedaș","bedernite":"bederniță","bedernitei":"bederniță","bedernitele":"bederniță","bedernitelor":"bederniță","beduia":"bedui","beduiai":"bedui","beduiam":"bedui","beduiati":"bedui","beduiau":"bedui","beduie":"bedui","beduii":"bedui","beduim":"bedui","beduind":"bedui","beduine":"beduină","beduinei":"beduină","beduinele":"beduină","beduinelor":"beduină","beduini":"beduin","beduinii":"beduin","beduinilor":"beduin","beduinul":"beduin","beduinule":"beduin","beduinului":"beduin","beduira":"bedui","beduiram":"bedui","beduirati":"bedui","beduise":"bedui","beduisem":"bedui","beduisera":"bedui","beduiseram":"bedui","beduiserati":"bedui","beduisesi":"bedui","beduisi":"bedui","beduit":"bedui","beduiti":"bedui","beefsteakul":"beefsteak","beefsteakule":"beefsteak","beefsteakului":"beefsteak","beefsteakuri":"beefsteak","beefsteakurile":"beefsteak","beefsteakurilor":"beefsteak","beep-ul":"beep","beep-ule":"beep","beep-ului":"beep","beep-uri":"beep","beep-urile":"beep","beep-urilor":"beep","beethoveniana":["beethoveniană","beethovenian","beethoveniana","beethovenian"],"beethovenianul":"beethovenian","beethoveniene":"beethovenian","beethovenienele":"beethovenian","beethovenieni":"beethovenian","beethovenienii":"beethovenian","befelul":"befel","befelule":"befel","befelului":"befel","befeluri":"befel","befelurile":"befel","befelurilor":"befel","beglerbegi":"beglerbeg","beglerbegii":"beglerbeg","beglerbegilor":"beglerbeg","beglerbegul":"beglerbeg","beglerbegule":"beglerbeg","beglerbegului":"beglerbeg","beglerbeii":"beglerbei","beglerbeilor":"beglerbei","beglerbeiul":"beglerbei","beglerbeiule":"beglerbei","beglerbeiului":"beglerbei","begonia":"begonie","begoniei":"begonie","begonii":"begonie","begoniile":"begonie","begoniilor":"begonie","behaie":"behăi","behairea":"behăire","behairi":"behăire","behairii":"behăire","behairile":"behăire","behairilor":"behăire","behait":"behăi","behaitoare":"behăitor","behaitoarea":"behăitor","behaitoarele":"behăitor","behaitori":"behăitor","behaitorii":"behăitor","behaitorul":"behăitor","behaitul":"behăit","behaitule":"behăit","behaitului":"behăit","behaituri":"behăitură","behaiturii":"behăitură","behaiturile":"behăitură","behaiturilor":"behăitură","behaviorismul":"behaviorism","behaviorismule":"behaviorism","behaviorismului":"behaviorism","behaviorista":["behavioristă","behaviorist","behaviorista","behaviorist"],"behavioriste":"behaviorist","behavioristele":"behaviorist","behavioristi":"behaviorist","behavioristii":"behaviorist","behavioristul":"behaviorist","bei":"bea","beicacheul":"beicache","beicacheule":"beicache","beicacheului":"beicache","beicachi":"beicache","beicachii":"beicache","beicachilor":"beicache","beie":"bea","beie tutun":"bea tutun","beii":"bei","beijingul":"Beijing","beijingule":"Beijing","beijingului":"Beijing","beilerbeii":"beilerbei","beilerbeilor":"beilerbei","beilerbeiul":"beilerbei","beilerbeiule":"beilerbei","beilerbeiului":"beilerbei","beiliccii":"beilicciu","beilicciii":"beilicciu","beilicciilor":"beilicciu","beilicciuul":"beilicciu","beilicciuule":"beilicciu","beilicciuului":"beilicciu","beilor":"bei","beiugi":"beiugă","beiugii":"beiugă","beiugile":"beiugă","beiugilor":"beiugă","beiul":"bei","beiule":"bei","beiului":"bei","beizadeasca":["beizadească","beizadesc","beizadeasca","beizadesc"],"beizadeaua":"beizadea","beizadele":"beizadea","beizadelei":"beizadea","beizadelele":"beizadea","beizadelelor":"beizadea","beizadescul":"beizadesc","beizadesti":"beizadesc","beizadestii":"beizadesc","beizadestile":"beizadesc","bejan-tirnavita":"Bejan-Târnăvița","bejanarea":"bejănări","bejanareai":"bejănări","bejanaream":"bejănări","bejanareati":"bejănări","bejanareau":"bejănări","bejanaresc":"bejănări","bejanareste":"bejănări","bejanaresti":"bejănări","bejanari":"bejănar","bejanaria":"bejănărie","bejanariei":"bejănărie","bejanarii":["bejănarii","bejănar","bejănării","bejănări","bejănării","bejănărie"],"bejanariile":"bejănărie","bejanariilor":"bejănărie","bejanarilor":"bejănar","bejanarim":"bejănări","bejanarind":"bejănări","bejanarira":"bejănări","bejanariram":"bejănări","bejanarirati":"bejănări","bejanarise":"bejănări","bejanarisem":"bejănări","bejanarisera":"bejănări","bejanariseram":"bejănări","bejanariserati":"bejănări","bejanarisesi":"bejănări","bejanarisi":"bejănări","bejanarit":"bejănări","bejanariti":"bejănări","bejanaritul":"bejănărit","bejanaritule":"bejănărit","bejanaritului":"bejănărit","bejanarul":"bejănar","bejanarule":"bejănar","bejanarului":"bejănar","bejanea":"bejăni","bejaneai":"bejăni","bejaneam":"bejăni","bejaneati":"bejăni","bejaneau":"bejăni","bejanesc":"bejăni","bejaneste":"bejăni","bejanesti":"bejăni","bejania":"bejanie","bejaniei":"bejanie","bejanii":["bejănii","bejăni","bejanii","bejanie"],"bejaniile":"bejanie","bejaniilor":"bejanie","bejanim":"bejăni","bejanind":"bejăni","bejanira":"bejăni","bejaniram":"bejăni","bejanirati":"bejăni","bejanise":"bejăni","bejanisem":"bejăni","bejanisera":"bejăni","bejaniseram":"bejăni","bejaniserati":"bejăni","bejanisesi":"bejăni","bejanisi":"bejăni","bejanit":"bejăni","bejaniti":"bejăni","bejenari":"bejenar","bejenarii":"bejenar","bejenarilor":"bejenar","bejenarul":"bejenar","bejenarule":"bejenar","bejenarului":"bejenar","bejenea":"bejeni","bejeneai":"bejeni","bejeneam":"bejeni","bejeneati":"bejeni","bejeneau":"bejeni","bejeneria":"bejenerie","bejeneriei":"bejenerie","bejenerii":"bejenerie","bejeneriile":"bejenerie","bejeneriilor":"bejenerie","bejenesc":"bejeni","bejeneste":"bejeni","bejenesti":"bejeni","bejenia":"bejenie","bejeniei":"bejenie","bejenii":["bejenii","bejeni","bejenii","bejenie"],"bejeniile":"bejenie","bejeniilor":"bejenie","bejenim":"bejeni","bejenind":"bejeni","bejenira":"bejeni","bejeniram":"bejeni","bejenirati":"bejeni","bejenise":"bejeni","bejenisem":"bejeni","bejenisera":"bejeni","bejeniseram":"bejeni","bejeniserati":"bejeni","bejenisesi":"bejeni","bejenisi":"bejeni","bejenit":"bejeni","bejeniti":"bejeni","belacoase":"belacoasă","belacoasei":"belacoasă","belacoasele":"belacoasă","belacoaselor":"belacoasă","beladone":"beladonă","beladonei":"beladonă","beladonele":"beladonă","beladonelor":"beladonă","belalia":"belaliu","belalie":"belaliu","belalii":"belaliu","belaliii":"belaliu","belaliile":"belaliu","belaliul":"belaliu","belaruse":"belarusă","belarusei":"belarusă","belarusele":"belarusă","belaruselor":"belarusă","belarusul":"Belarus","belarusule":"Belarus","belarusului":"Belarus","belatre":"belatru","belatrele":"belatru","belatrelor":"belatru","belatruul":"belatru","belatruule":"belatru","belatruului":"belatru","belcantoul":"belcanto","belcantoule":"belcanto","belcantoului":"belcanto","belceuri":"belceu","belceurile":"belceu","belceurilor":"belceu","belceuul":"belceu","belceuule":"belceu","belceuului":"belceu","belciugata":["belciugată","belciugat","belciugata","belciugat"],"belciugate":"belciugat","belciugatele":"belciugat","belciugati":"belciugat","belciugatii":"belciugat","belciugatul":"belciugat","belciuge":"belciug","belciugele":"belciug","belciugelor":"belciug","belciugul":"belciug","belciugule":"belciug","belciugului":"belciug","beldioare":"beldioară","beldioarei":"beldioară","beldioarele":"beldioară","beldioarelor":"beldioară","bele-artele":"bele-arte","bele-artelor":"bele-arte","belea":"beli","belea pula":"beli pula","beleai":"beli","beleai pula":"beli pula","beleajaul":"beleajă","beleajaule":"beleajă","beleajaului":"beleajă","beleaje":"beleajă","beleajei":"beleajă","beleajelor":"beleajă","beleam":"beli","beleam pula":"beli pula","beleati":"beli","beleati pula":"beli pula","beleau":"beli","beleau pula":"beli pula","beleaua":"belea","belele":"belea","belelei":"belea","belelele":"belea","belelelor":"belea","belemniti":"belemnit","belemnitii":"belemnit","belemnitilor":"belemnit","belemnitul":"belemnit","belemnitule":"belemnit","belemnitului":"belemnit","belenghere":"belengher","belengherele":"belengher","belengherelor":"belengher","belengherul":"belengher","belengherule":"belengher","belengherului":"belengher","belesc":"beli","belesc pula":"beli pula","beleste":"beli","beleste pula":"beli pula","belesti":"beli","belesti pula":"beli pula","belet":"bilet","beletristi":"beletrist","beletristica":["beletristică","beletristic","beletristica","beletristic"],"beletristice":"beletristic","beletristicele":"beletristic","beletristici":["beletristici","beletristic","beletristici","beletristică"],"beletristicii":["beletristicii","beletristic","beletristicii","beletristică"],"beletristicul":"beletristic","beletristii":"beletrist","beletristilor":"beletrist","beletristul":"beletrist","beletristule":"beletrist","beletristului":"beletrist","beleuza":["beleuză","beleuz","beleuza","beleuz"],"beleuze":"beleuz","beleuzele":"beleuz","beleuzi":"beleuz","beleuzii":"beleuz","beleuzul":"beleuz","belferi":"belfer","belferii":"belfer","belferilor":"belfer","belferul":"belfer","belferule":"belfer","belferului":"belfer","belgea":"belge","belghite":"belghiță","belghitei":"belghiță","belghitele":"belghiță","belghitelor":"belghiță","belgi":"belge","belgiana":["belgiană","belgian","belgiana","belgian"],"belgianul":"belgian","belgianule":"belgian","belgianului":"belgian","belgie":"Belgia","belgiei":"Belgia","belgience":"belgiancă","belgiencei":"belgiancă","belgiencele":"belgiancă","belgiencelor":"belgiancă","belgiene":["belgiene","belgian","belgiene","belgiană"],"belgienei":"belgiană","belgienele":["belgienele","belgian","belgienele","belgiană"],"belgienelor":"belgiană","belgieni":"belgian","belgienii":"belgian","belgienilor":"belgian","belgii":["belgii","belge","belgii","Belgia"],"belgile":"belge","belgilor":"belge","belgradeana":["belgrădeană","belgrădean","belgrădeana","belgrădean"],"belgradeanul":"belgrădean","belgradeanule":"belgrădean","belgradeanului":"belgrădean","belgradence":"belgrădeancă","belgradencei":"belgrădeancă","belgradencele":"belgrădeancă","belgradencelor":"belgrădeancă","belgradene":"belgrădean","belgradenele":"belgrădean","belgradeni":"belgrădean","belgradenii":"belgrădean","belgradenilor":"belgrădean","belicisme":"belicism","belicismele":"belicism","belicismelor":"belicism","belicismul":"belicism","belicismule":"belicism","belicismului":"belicism","belicista":["belicistă","belicist","belicista","belicist"],"beliciste":"belicist","belicistele":"belicist","belicisti":"belicist","belicistii":"belicist","belicistul":"belicist","belicoasa":["belicoasă","belicos","belicoasa","belicos"],"belicoase":"belicos","belicoasele":"belicos","belicosi":"belicos","belicosii":"belicos","belicosul":"belicos","beligeranta":["beligerantă","beligerant","beligeranta","beligerant"],"beligerante":["beligerante","beligerant","beligeranțe","beligeranță"],"beligerantei":"beligeranță","beligerantele":["beligerantele","beligerant","beligeranțele","beligeranță"],"beligerantelor":"beligeranță","beligeranti":"beligerant","beligerantii":"beligerant","beligerantul":"beligerant","belii":"beli","belii pula":"beli pula","belim":"beli","belim pula":"beli pula","belind":"beli","belind pula":"beli pula","belinografe":"belinograf","belinografele":"belinograf","belinografelor":"belinograf","belinograful":"belinograf","belinografule":"belinograf","belinografului":"belinograf","belinograme":"belinogramă","belinogramei":"belinogramă","belinogramele":"belinogramă","belinogramelor":"belinogramă","belira":"beli","belira pula":"beli pula","beliram":"beli","beliram pula":"beli pula","belirati":"beli","belirati pula":"beli pula","belise":"beli","belise pula":"beli pula","belisem":"beli","belisem pula":"beli pula","belisera":"beli","belisera pula":"beli pula","beliseram":"beli","beliseram pula":"beli pula","beliserati":"beli","beliserati pula":"beli pula","belisesi":"beli","belisesi pula":"beli pula","belisi":"beli","belisi pula":"beli pula","belisul":"beliș","belisule":"beliș","belisului":"beliș","belisuri":"beliș","belisurile":"beliș","belisurilor":"beliș","belit":"beli","belit pula":"beli pula","belita":["belită","belit","belita","belit"],"belite":["belite","belit","belite","belită"],"belitei":"belită","belitele":["belitele","belit","belitele","belită"],"belitelor":"belită","beliti":["beliți","beli","beliți","belit"],"beliti pula":"beli pula","belitii":"belit","belitoarea":"belitoare","belitori":"belitoare","belitorii":"belitoare","belitorile":"belitoare","belitorilor":"belitoare","belitul":"belit","belituri":"belitură","beliturii":"belitură","beliturile":"belitură","beliturilor":"belitură","belnite":"belniță","belnitei":"belniță","belnitele":"belniță","belnitelor":"belniță","belote":"belotă","belotei":"belotă","belsite":"belșiță","belsitei":"belșiță","belsitele":"belșiță","belsitelor":"belșiță","belsugul":"belșug","belsugule":"belșug","belsugului":"belșug","belsuguri":"belșug","belsugurile":"belșug","belsugurilor":"belșug","belteaua":"beltea","beltele":"beltea","beltelei":"beltea","beltelele":"beltea","beltelelor":"beltea","belvederea":"belvedere","belvederei":"belvedere","bem":"bea","bemoli":"bemol","bemolii":"bemol","bemolilor":"bemol","bemolizai":"bemoliza","bemolizam":["bemolizăm","bemoliza","bemolizam","bemoliza"],"bemolizand":"bemoliza","bemolizara":"bemoliza","bemolizaram":"bemoliza","bemolizarati":"bemoliza","bemolizase":"bemoliza","bemolizasem":"bemoliza","bemolizasera":"bemoliza","bemolizaseram":"bemoliza","bemolizaserati":"bemoliza","bemolizasesi":"bemoliza","bemolizasi":"bemoliza","bemolizat":"bemoliza","bemolizati":"bemoliza","bemolizau":"bemoliza","bemolizeaza":"bemoliza","bemolizez":"bemoliza","bemolizezi":"bemoliza","bemolul":"bemol","bemolule":"bemol","bemolului":"bemol","benchete":"benchet","benchetele":"benchet","benchetelor":"benchet","benchetuia":"benchetui","benchetuiai":"benchetui","benchetuiam":"benchetui","benchetuiati":"benchetui","benchetuiau":"benchetui","benchetuiele":"benchetuială","benchetuielei":"benchetuială","benchetuielele":"benchetuială","benchetuielelor":"benchetuială","benchetuieli":"benchetuială","benchetuiesc":"benchetui","benchetuieste":"benchetui","benchetuiesti":"benchetui","benchetuii":"benchetui","benchetuim":"benchetui","benchetuind":"benchetui","benchetuira":"benchetui","benchetuiram":"benchetui","benchetuirati":"benchetui","benchetuise":"benchetui","benchetuisem":"benchetui","benchetuisera":"benchetui","benchetuiseram":"benchetui","benchetuiserati":"benchetui","benchetuisesi":"benchetui","benchetuisi":"benchetui","benchetuit":"benchetui","benchetuiti":"benchetui","benchetul":"benchet","benchetule":"benchet","benchetului":"benchet","benchisoare":"benchișor","benchisoarele":"benchișor","benchisoarelor":"benchișor","benchisorul":"benchișor","benchisorule":"benchișor","benchisorului":"benchișor","benchiul":"benchi","benchiule":"benchi","benchiului":"benchi","benchiuri":"benchi","benchiurile":"benchi","benchiurilor":"benchi","bendeie":"bendeu","bendeiele":"bendeu","bendeielor":"bendeu","bendeul":"bendeu","bendeule":"bendeu","bendeului":"bendeu","bendeuri":"bendeu","bendite":"bendiță","benditei":"bendiță","benditele":"bendiță","benditelor":"bendiță","bene":"benă","benecu de jos":"Bencecu de Jos","benedictina":["benedictină","benedictin","benedictina","benedictin"],"benedictine":["benedictine","benedictin","benedictine","benedictină"],"benedictinei":"benedictină","benedictinele":["benedictinele","benedictin","benedictinele","benedictină"],"benedictinelor":"benedictină","benedictini":"benedictin","benedictinii":"benedictin","benedictinul":"benedictin","benedictiuni":"benedicțiune","benefica":["benefică","benefic","benefica","benefic"],"benefice":"benefic","beneficele":"benefic","benefici":"benefic","beneficiai":"beneficia","beneficiam":"beneficia","beneficiara":"beneficia","beneficiaram":"beneficia","beneficiarati":"beneficia","beneficiare":"beneficiară","beneficiarei":"beneficiară","beneficiarele":"beneficiară","beneficiarelor":"beneficiară","beneficiari":"beneficiar","beneficiarii":"beneficiar","beneficiarilor":"beneficiar","beneficiarul":"beneficiar","beneficiarule":"beneficiar","beneficiarului":"beneficiar","beneficiase":"beneficia","beneficiasem":"beneficia","beneficiasera":"beneficia","beneficiaseram":"beneficia","beneficiaserati":"beneficia","beneficiasesi":"beneficia","beneficiasi":"beneficia","beneficiat":"beneficia","beneficiati":"beneficia","beneficiau":"beneficia","beneficiaza":"beneficia","beneficie":"beneficia","beneficieaza":"beneficia","beneficiem":"beneficia","beneficierea":"beneficiere","beneficieri":"beneficiere","beneficierii":"beneficiere","beneficierile":"beneficiere","beneficierilor":"beneficiere","beneficiez":"beneficia","beneficiezi":"beneficia","beneficii":["beneficii","benefic","beneficii","beneficiu"],"beneficiile":"beneficiu","beneficiilor":"beneficiu","beneficiind":"beneficia","beneficiul":"beneficiu","beneficiule":"beneficiu","beneficiului":"beneficiu","beneficul":"benefic","benei":"benă","benele":"benă","benelor":"benă","benevola":["benevolă","benevol","benevola","benevol"],"benevole":"benevol","benevolele":"benevol","benevoli":"benevol","benevolii":"benevol","benevolul":"benevol","bengala":["bengală","bengal","bengala","bengal"],"bengale":"bengal","bengalele":"bengal","bengaleza":["bengaleză","bengalez","bengaleza","bengalez"],"bengaleze":["bengaleze","bengalez","bengaleze","bengaleză"],"bengalezei":"bengaleză","bengalezele":["bengalezele","bengalez","bengalezele","bengaleză"],"bengalezelor":"bengaleză","bengalezi":"bengalez","bengalezii":"bengalez","bengalezul":"bengalez","bengali":"bengal","bengalii":"bengal","bengalul":"bengal","benghiul":"benghi","benghiule":"benghi","benghiului":"benghi","benghiuri":"benghi","benghiurile":"benghi","benghiurilor":"benghi","bengoasa":["bengoasă","bengos","bengoasa","bengos"],"bengoase":"bengos","bengoasele":"bengos","bengosi":"bengos","bengosii":"bengos","bengosul":"bengos","bengulasi":"bengulaș","bengulasii":"bengulaș","bengulasilor":"bengulaș","bengulasul":"bengulaș","bengulasule":"bengulaș","bengulasului":"bengulaș","benguta":["benguță","benguț","benguța","benguț"],"bengute":"benguț","bengutele":"benguț","benguti":"benguț","bengutii":"benguț","bengutul":"benguț","benicul":"benic","benicule":"benic","benicului":"benic","benigna":["benignă","benign","benigna","benign"],"benigne":"benign","benignele":"benign","benigni":"benign","benignii":"benign","benignitatea":"benignitate","benignitati":"benignitate","benignitatii":"benignitate","benignul":"benign","benineza":["benineză","beninez","benineza","beninez"],"benineze":["benineze","beninez","benineze","benineză"],"beninezei":"benineză","beninezele":["beninezele","beninez","beninezele","benineză"],"beninezelor":"benineză","beninezi":"beninez","beninezii":"beninez","beninezilor":"beninez","beninezul":"beninez","beninezule":"beninez","beninezului":"beninez","benisul":"beniș","benisule":"beniș","benisului":"beniș","benisuri":"beniș","benisurile":"beniș","benisurilor":"beniș","benjamini":"benjamin","benjaminii":"benjamin","benjaminilor":"benjamin","benjaminul":"benjamin","benjaminule":"benjamin","benjaminului":"benjamin","benoare":"benoar","benoarele":"benoar","benoarelor":"benoar","benoarul":"benoar","benoarule":"benoar","benoarului":"benoar","bentite":"bentiță","bentitei":"bentiță","bentitele":"bentiță","bentitelor":"bentiță","bentonica":["bentonică","bentonic","bentonica","bentonic"],"bentonice":"bentonic","bentonicele":"bentonic","bentonici":"bentonic","bentonicii":"bentonic","bentonicul":"bentonic","bentonite":["bentonite","bentonit","bentonite","bentonită"],"bentonitei":"bentonită","bentonitele":["bentonitele","bentonit","bentonitele","bentonită"],"bentonitelor":["bentonitelor","bentonit","bentonitelor","bentonită"],"bentonitul":"bentonit","bentonitule":"bentonit","bentonitului":"bentonit","bentosul":"bentos","bentosule":"bentos","bentosului":"bentos","benzaldehide":"benzaldehidă","benzaldehidei":"benzaldehidă","benzaldehidele":"benzaldehidă","benzaldehidelor":"benzaldehidă","benzedrine":"benzedrină","benzedrinei":"benzedrină","benzeni":"benzen","benzenica":["benzenică","benzenic","benzenica","benzenic"],"benzenice":"benzenic","benzenicele":"benzenic","benzenici":"benzenic","benzenicii":"benzenic","benzenicul":"benzenic","benzenii":"benzen","benzenilor":"benzen","benzenisme":"benzenism","benzenismele":"benzenism","benzenismelor":"benzenism","benzenismul":"benzenism","benzenismule":"benzenism","benzenismului":"benzenism","benzenul":"benzen","benzenule":"benzen","benzenului":"benzen","benzi":"bandă","benzi adezive":"bandă adezivă","benzi de circulatie":"bandă de circulație","benzi de magnetofon":"bandă de magnetofon","benzi de montaj":"bandă de montaj","benzi de valenta":"bandă de valență","benzi desenate":"bandă desenată","benzi izolante":"bandă izolantă","benzi magnetice":"bandă magnetică","benzi rulante":"bandă rulantă","benzidine":"benzidină","benzidinei":"benzidină","benzidinele":"benzidină","benzidinelor":"benzidină","benzii":"bandă","benzile":"bandă","benzilor":"bandă","benzilul":"benzil","benzilule":"benzil","benzilului":"benzil","benzinari":"benzinar","benzinaria":"benzinărie","benzinariei":"benzinărie","benzinarii":["benzinarii","benzinar","benzinării","benzinărie"],"benzinariile":"benzinărie","benzinariilor":"benzinărie","benzinarilor":"benzinar","benzinarul":"benzinar","benzinarule":"benzinar","benzinarului":"benzinar","benzine":"benzină","benzinei":"benzină","benzoati":"benzoat","benzoatii":"benzoat","benzoatilor":"benzoat","benzoatul":"benzoat","benzoatule":"benzoat","benzoatului":"benzoat","benzoea":"benzoe","benzoei":"benzoe","benzoeii":"benzoe","benzofenone":"benzofenonă","benzofenonei":"benzofenonă","benzofenonele":"benzofenonă","benzofenonelor":"benzofenonă","benzoica":["benzoică","benzoic","benzoica","benzoic"],"benzoice":"benzoic","benzoicele":"benzoic","benzoici":"benzoic","benzoicii":"benzoic","benzoicul":"benzoic","benzoilarea":"benzoilare","benzoilari":"benzoilare","benzoilarii":"benzoilare","benzoilarile":"benzoilare","benzoilarilor":"benzoilare","benzoilul":"benzoil","benzoilule":"benzoil","benzoilului":"benzoil","benzoli":"benzol","benzolii":"benzol","benzolilor":"benzol","benzolisme":"benzolism","benzolismele":"benzolism","benzolismelor":"benzolism","benzolismul":"benzolism","benzolismule":"benzolism","benzolismului":"benzolism","benzolul":"benzol","benzolule":"benzol","benzolului":"benzol","benzonaftoli":"benzonaftol","benzonaftolii":"benzonaftol","benzonaftolilor":"benzonaftol","benzonaftolul":"benzonaftol","benzonaftolule":"benzonaftol","benzonaftolului":"benzonaftol","benzopirine":"benzopirină","benzopirinei":"benzopirină","benzopirinele":"benzopirină","benzopirinelor":"benzopirină","benzopurpurine":"benzopurpurină","benzopurpurinei":"benzopurpurină","benzopurpurinele":"benzopurpurină","benzopurpurinelor":"benzopurpurină","beotiana":["beoțiană","beoțian","beoțiana","beoțian"],"beotianul":"beoțian","beotiene":"beoțian","beotienele":"beoțian","beotieni":"beoțian","beotienii":"beoțian","berarese":"berăreasă","beraresei":"berăreasă","beraresele":"berăreasă","berareselor":"berăreasă","berari":"berar","beraria":"berărie","berariei":"berărie","berarii":["berarii","berar","berării","berărie"],"berariile":"berărie","berariilor":"berărie","berarilor":"berar","berarite":"berăriță","beraritei":"berăriță","beraritele":"berăriță","beraritelor":"berăriță","berarul":"berar","berarule":"berar","berarului":"berar","berbantaria":"berbăntărie","berbantariei":"berbăntărie","berbantarii":"berbăntărie","berbantariile":"berbăntărie","berbantariilor":"berbăntărie","berbanti":"berbant","berbantia":"berbănție","berbantiei":"berbănție","berbantii":["berbanții","berbant","berbănții","berbănție"],"berbantiile":"berbănție","berbantiilor":"berbănție","berbantilor":"berbant","berbantlacul":"berbantlâc","berbantlacule":"berbantlâc","berbantlacului":"berbantlâc","berbantlacuri":"berbantlâc","berbantlacurile":"berbantlâc","berbantlacurilor":"berbantlâc","berbantlic":"berbantlâc","berbantul":"berbant","berbantule":"berbant","berbantului":"berbant","berbecari":"berbecar","berbecaria":"berbecărie","berbecariei":"berbecărie","berbecarii":["berbecarii","berbecar","berbecării","berbecărie"],"berbecariile":"berbecărie","berbecariilor":"berbecărie","berbecarilor":"berbecar","berbecarul":"berbecar","berbecarule":"berbecar","berbecarului":"berbecar","berbece":"berbec","berbecea":"berbeci","berbeceai":"berbeci","berbeceam":"berbeci","berbeceasca":["berbecească","berbecesc","berbeceasca","berbecesc"],"berbeceati":"berbeci","berbeceau":"berbeci","berbecei":"berbecel","berbeceli":"berbecel","berbecelii":"berbecel","berbecelilor":"berbecel","berbecelul":"berbecel","berbecelule":"berbecel","berbecelului":"berbecel","berbecesc":"berbeci","berbecescul":"berbecesc","berbeceste":"berbeci","berbecesti":["berbecești","berbecesc","berbecești","berbeci"],"berbecestii":"berbecesc","berbecestile":"berbecesc","berbeceul":"berbece","berbeceule":"berbece","berbeceului":"berbece","berbeci":["berbeci","berbec","berbeci","berbece"],"berbecii":["berbecii","berbec","berbecii","berbece","berbecii","berbeci"],"berbecilor":["berbecilor","berbec","berbecilor","berbece"],"berbecim":"berbeci","berbecind":"berbeci","berbecira":"berbeci","berbeciram":"berbeci","berbecirati":"berbeci","berbecise":"berbeci","berbecisem":"berbeci","berbecisera":"berbeci","berbeciseram":"berbeci","berbeciserati":"berbeci","berbecisesi":"berbeci","berbecisi":"berbeci","berbecit":"berbeci","berbeciti":"berbeci","berbecul":"berbec","berbecule":"berbec","berbecului":"berbec","berbecuti":"berbecuț","berbecutii":"berbecuț","berbecutilor":"berbecuț","berbecutul":"berbecuț","berbecutule":"berbecuț","berbecutului":"berbecuț","berbera":["berberă","berber","berbera","berber"],"berbere":["berbere","berber","berbere","berberă"],"berberei":"berberă","berberele":["berberele","berber","berberele","berberă"],"berberelor":"berberă","berberi":"berber","berberii":"berber","berberul":"berber","berbinte":"berbință","berbintei":"berbință","berbintele":"berbință","berbintelor":"berbință","berceusea":"berceuse","berceusei":"berceuse","berceusele":"berceuse","berceuselor":"berceuse","bercul":"berc","bercule":"berc","bercului":"berc","bercuri":"berc","bercurile":"berc","bercurilor":"berc","bercutul":"bercuț","bercutule":"bercuț","bercutului":"bercuț","bercuturi":"bercuț","bercuturile":"bercuț","bercuturilor":"bercuț","berea":"bere","berechetul":"berechet","berechetule":"berechet","berechetului":"berechet","berecheturi":"berechet","berecheturile":"berechet","berecheturilor":"berechet","beregate":"beregată","beregatea":"beregăți","beregateai":"beregăți","beregateam":"beregăți","beregateati":"beregăți","beregateau":"beregăți","beregatei":"beregată","beregatele":"beregată","beregatelor":"beregată","beregatesc":"beregăți","beregateste":"beregăți","beregatesti":"beregăți"};
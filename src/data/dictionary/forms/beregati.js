@@ -0,0 +1 @@
+export default {"beregatii":"beregăți","beregatim":"beregăți","beregatind":"beregăți","beregatira":"beregăți","beregatiram":"beregăți","beregatirati":"beregăți","beregatise":"beregăți","beregatisem":"beregăți","beregatisera":"beregăți","beregatiseram":"beregăți","beregatiserati":"beregăți","beregatisesi":"beregăți","beregatisi":"beregăți","beregatit":"beregăți","beregatiti":"beregăți","beregatuia":"beregătui","beregatuiai":"beregătui","beregatuiam":"beregătui","beregatuiati":"beregătui","beregatuiau":"beregătui","beregatuiesc":"beregătui","beregatuieste":"beregătui","beregatuiesti":"beregătui","beregatuii":"beregătui","beregatuim":"beregătui","beregatuind":"beregătui","beregatuira":"beregătui","beregatuiram":"beregătui","beregatuirati":"beregătui","beregatuirea":"beregătuire","beregatuiri":"beregătuire","beregatuirii":"beregătuire","beregatuirile":"beregătuire","beregatuirilor":"beregătuire","beregatuise":"beregătui","beregatuisem":"beregătui","beregatuisera":"beregătui","beregatuiseram":"beregătui","beregatuiserati":"beregătui","beregatuisesi":"beregătui","beregatuisi":"beregătui","beregatuit":"beregătui","beregatuiti":"beregătui","beret":"beretă","berete":["berete","beret","berete","beretă"],"beretei":"beretă","beretele":["beretele","beret","beretele","beretă"],"beretelor":["beretelor","beret","beretelor","beretă"],"beretul":"beret","beretule":"beret","beretului":"beret","bereznici":"bereznic","bereznicii":"bereznic","bereznicilor":"bereznic","bereznicul":"bereznic","bereznicule":"bereznic","bereznicului":"bereznic","berga":["bergă","berg","berga","berg"],"bergamota":["bergamotă","bergamot","bergamota","bergamot"],"bergamote":"bergamot","bergamotele":"bergamot","bergamoti":"bergamot","bergamotii":"bergamot","bergamotul":"bergamot","bergamuta":["bergamută","bergamut","bergamuta","bergamut"],"bergamute":"bergamut","bergamutele":"bergamut","bergamuti":"bergamut","bergamutii":"bergamut","bergamutul":"bergamut","berge":"berg","bergele":"berg","bergerete":"bergeretă","bergeretei":"bergeretă","bergeretele":"bergeretă","bergeretelor":"bergeretă","bergi":"berg","bergii":"berg","bergsoniana":["bergsoniană","bergsonian","bergsoniana","bergsonian"],"bergsonianul":"bergsonian","bergsoniene":"bergsonian","bergsonienele":"bergsonian","bergsonieni":"bergsonian","bergsonienii":"bergsonian","bergsonismul":"bergsonism","bergsonismule":"bergsonism","bergsonismului":"bergsonism","bergul":"berg","beri":"bere","beri blonde":"bere blondă","beri de ghimber":"bere de ghimber","beri de ghimbir":"bere de ghimbir","beri-beriul":"beri-beri","beri-beriule":"beri-beri","beri-beriului":"beri-beri","berii":"bere","berile":"bere","beriliul":"beriliu","beriliule":"beriliu","beriliului":"beriliu","berilor":"bere","berilul":"beril","berilule":"beril","berilului":"beril","beriluri":"beril","berilurile":"beril","berilurilor":"beril","berjere":"berjeră","berjerei":"berjeră","berjerele":"berjeră","berjerelor":"berjeră","berkeleisme":"berkeleism","berkeleismele":"berkeleism","berkeleismelor":"berkeleism","berkeleismul":"berkeleism","berkeleismule":"berkeleism","berkeleismului":"berkeleism","berkeliul":"berkeliu","berkeliule":"berkeliu","berkeliului":"berkeliu","berlesul":"berleș","berlesule":"berleș","berlesului":"berleș","berlesuri":"berleș","berlesurile":"berleș","berlesurilor":"berleș","berline":"berlină","berlinei":"berlină","berlinele":"berlină","berlinelor":"berlină","berlineza":["berlineză","berlinez","berlineza","berlinez"],"berlineze":["berlineze","berlinez","berlineze","berlineză"],"berlinezei":"berlineză","berlinezele":["berlinezele","berlinez","berlinezele","berlineză"],"berlinezelor":"berlineză","berlinezi":"berlinez","berlinezii":"berlinez","berlinezilor":"berlinez","berlinezul":"berlinez","berlinezule":"berlinez","berlinezului":"berlinez","berlinul":"Berlin","berlinule":"Berlin","berlinului":"Berlin","berme":"bermă","bermei":"bermă","bermele":"bermă","bermelor":"bermă","bermude":"bermudă","bermudei":"bermudă","bermudele":"bermudă","bermudelor":"bermudă","bernardine":"bernardină","bernardinei":"bernardină","bernardinele":"bernardină","bernardinelor":"bernardină","bernardini":"bernardin","bernardinii":"bernardin","bernardinilor":"bernardin","bernardinul":"bernardin","bernardinule":"bernardin","bernardinului":"bernardin","bernevicii":"bernevici","bernevicilor":"bernevici","berneviciul":"bernevici","berneviciule":"bernevici","berneviciului":"bernevici","bernivicii":"bernivici","bernivicilor":"bernivici","berniviciul":"bernivici","berniviciule":"bernivici","berniviciului":"bernivici","bernsteiniana":["bernsteiniană","bernsteinian","bernsteiniana","bernsteinian"],"bernsteiniane":"bernsteiniană","bernsteinianei":"bernsteiniană","bernsteinianele":"bernsteiniană","bernsteinianelor":"bernsteiniană","bernsteinianul":"bernsteinian","bernsteinianule":"bernsteinian","bernsteinianului":"bernsteinian","bernsteiniene":"bernsteinian","bernsteinienele":"bernsteinian","bernsteinieni":"bernsteinian","bernsteinienii":"bernsteinian","bernsteinienilor":"bernsteinian","bernsteinista":["bernsteinistă","bernsteinist","bernsteinista","bernsteinist"],"bernsteiniste":["bernsteiniste","bernsteinist","bernsteiniste","bernsteinistă"],"bernsteinistei":"bernsteinistă","bernsteinistele":["bernsteinistele","bernsteinist","bernsteinistele","bernsteinistă"],"bernsteinistelor":"bernsteinistă","bernsteinisti":"bernsteinist","bernsteinistii":"bernsteinist","bernsteinistilor":"bernsteinist","bernsteinistul":"bernsteinist","bernsteinistule":"bernsteinist","bernsteinistului":"bernsteinist","bersalieri":"bersalier","bersalierii":"bersalier","bersalierilor":"bersalier","bersalierul":"bersalier","bersalierule":"bersalier","bersalierului":"bersalier","bertilonajul":"bertilonaj","bertilonajule":"bertilonaj","bertilonajului":"bertilonaj","bertoane":"berton","bertoanele":"berton","bertoanelor":"berton","bertonul":"berton","bertonule":"berton","bertonului":"berton","berze":"barză","berze albe":"barză albă","berze negre":"barză neagră","berze-albe":"barză-albă","berze-negre":"barză-neagră","berzei":"barză","berzele":"barză","berzelor":"barză","besacteaua":"besactea","besactele":"besactea","besactelei":"besactea","besactelele":"besactea","besactelelor":"besactea","besactelute":"besăcteluță","besactelutei":"besăcteluță","besactelutele":"besăcteluță","besactelutelor":"besăcteluță","besaie":"beșăl","besaiele":"beșăl","besaielor":"beșăl","besalul":"beșăl","besalule":"beșăl","besalului":"beșăl","besamelul":"beșamel","besamelule":"beșamel","besamelului":"beșamel","beschia":"beschie","beschiei":"beschie","beschii":"beschie","beschiile":"beschie","beschiilor":"beschie","bese":"băși","beseade":"beseadă","beseadei":"beseadă","beseadele":"beseadă","beseadelor":"beseadă","besecteaua":"besectea","besectele":"besectea","besectelei":"besectea","besectelele":"besectea","besectelelor":"besectea","besereci":"beserecă","beserecii":"beserecă","beserecile":"beserecă","beserecilor":"beserecă","besi":"băși","besic":"beșica","besica":["beșica","bășica","beșică","bășică"],"besicai":"beșica","besicam":["beșicăm","beșica","beșicam","beșica"],"besicand":"beșica","besicara":"beșica","besicaram":"beșica","besicarati":"beșica","besicarea":"beșicare","besicari":"beșicare","besicarii":"beșicare","besicarile":"beșicare","besicarilor":"beșicare","besicase":"beșica","besicasem":"beșica","besicasera":"beșica","besicaseram":"beșica","besicaserati":"beșica","besicasesi":"beșica","besicasi":"beșica","besicat":"beșica","besicata":["beșicată","beșicat","beșicata","beșicat"],"besicate":"beșicat","besicatele":"beșicat","besicati":["beșicați","beșica","beșicați","beșicat"],"besicatii":"beșicat","besicatul":"beșicat","besicau":"beșica","besici":["beșici","beșica","beșici","beșică"],"besicii":"beșică","besicile":"beșică","besicilor":"beșică","besicoasa":["beșicoasă","beșicos","beșicoasa","beșicos"],"besicoase":"beșicos","besicoasele":"beșicos","besicosi":"beșicos","besicosii":"beșicos","besicosul":"beșicos","besicute":"beșicuță","besicutei":"beșicuță","besicutele":"beșicuță","besicutelor":"beșicuță","besina":"bășină","besleagaul":"beșleagă","besleagaule":"beșleagă","besleagaului":"beșleagă","beslegi":"beșleagă","beslegii":"beșleagă","beslegilor":"beșleagă","besli-agale":"beșli-aga","besli-agalei":"beșli-aga","besli-agalelor":"beșli-aga","besli-agaul":"beșli-aga","besli-agaule":"beșli-aga","besli-agaului":"beșli-aga","beslici":"beșlic","beslicii":"beșlic","beslicilor":"beșlic","beslicul":"beșlic","beslicule":"beșlic","beslicului":"beșlic","beslii":"beșliu","besliii":"beșliu","besliilor":"beșliu","besliul":"beșliu","besliule":"beșliu","besliului":"beșliu","besmetica":["besmetică","besmetic","besmetica","besmetic"],"besmetice":"besmetic","besmeticele":"besmetic","besmetici":"besmetic","besmeticii":"besmetic","besmeticul":"besmetic","best-sellerul":"best-seller","best-sellerule":"best-seller","best-sellerului":"best-seller","besteaua":"beștea","bestele":"beștea","bestelea":"beșteli","besteleai":"beșteli","besteleam":"beșteli","besteleati":"beșteli","besteleau":"beșteli","bestelei":"beștea","bestelele":["beștelele","beștea","beștelele","beșteleală"],"bestelelei":"beșteleală","bestelelele":"beșteleală","bestelelelor":"beșteleală","besteleli":"beșteleală","bestelelor":"beștea","bestelesc":"beșteli","besteleste":"beșteli","bestelesti":"beșteli","bestelii":"beșteli","bestelim":"beșteli","bestelind":"beșteli","bestelira":"beșteli","besteliram":"beșteli","bestelirati":"beșteli","bestelirea":"beștelire","besteliri":"beștelire","bestelirii":"beștelire","bestelirile":"beștelire","bestelirilor":"beștelire","bestelise":"beșteli","bestelisem":"beșteli","bestelisera":"beșteli","besteliseram":"beșteli","besteliserati":"beșteli","bestelisesi":"beșteli","bestelisi":"beșteli","bestelit":"beșteli","besteliti":"beșteli","bestiala":["bestială","bestial","bestiala","bestial"],"bestiale":"bestial","bestialele":"bestial","bestiali":"bestial","bestialii":"bestial","bestialitatea":"bestialitate","bestialitati":"bestialitate","bestialitatii":"bestialitate","bestializai":"bestializa","bestializam":["bestializăm","bestializa","bestializam","bestializa"],"bestializand":"bestializa","bestializara":"bestializa","bestializaram":"bestializa","bestializarati":"bestializa","bestializarea":"bestializare","bestializari":"bestializare","bestializarii":"bestializare","bestializarile":"bestializare","bestializarilor":"bestializare","bestializase":"bestializa","bestializasem":"bestializa","bestializasera":"bestializa","bestializaseram":"bestializa","bestializaserati":"bestializa","bestializasesi":"bestializa","bestializasi":"bestializa","bestializat":"bestializa","bestializati":"bestializa","bestializau":"bestializa","bestializeaza":"bestializa","bestializez":"bestializa","bestializezi":"bestializa","bestialul":"bestial","bestiare":"bestiar","bestiarele":"bestiar","bestiarelor":"bestiar","bestiarul":"bestiar","bestiarule":"bestiar","bestiarului":"bestiar","bestii":"bestie","beta":["betă","bet","beta","bet"],"betai":"beta","betaine":"betaină","betainei":"betaină","betainele":"betaină","betainelor":"betaină","betalor":"beta","betarcul":"bețârc","betarcule":"bețârc","betarcului":"bețârc","betarcuri":"bețârc","betarcurile":"bețârc","betarcurilor":"bețârc","betatroane":"betatron","betatroanele":"betatron","betatroanelor":"betatron","betatronul":"betatron","betatronule":"betatron","betatronului":"betatron","betaul":"beta","betaule":"beta","betaului":"beta","bete":["bețe","băț","bete","bată","bete","beat","bete","bet"],"beteaga":["beteagă","beteag","beteaga","beteag"],"beteage":"beteagă","beteagei":"beteagă","beteagele":"beteagă","beteagelor":"beteagă","beteagul":"beteag","betege":["betege","beteag","betege","beteagă"],"betegele":["betegele","beteag","betegele","betegeală"],"betegelei":"betegeală","betegelele":"betegeală","betegelelor":"betegeală","betegeli":"betegeală","betegi":["betegi","beteag","betegi","beteji"],"betegia":"betegie","betegiei":"betegie","betegii":["betegii","beteag","betegii","betegie"],"betegiile":"betegie","betegiilor":"betegie","betegoasa":["betegoasă","betegos","betegoasa","betegos"],"betegoase":"betegos","betegoasele":"betegos","betegosi":"betegos","betegosii":"betegos","betegosul":"betegos","betei":"bată","betejea":"beteji","betejeai":"beteji","betejeam":"beteji","betejeati":"beteji","betejeau":"beteji","betejele":"betejeală","betejelei":"betejeală","betejelele":"betejeală","betejelelor":"betejeală","betejeli":"betejeală","betejesc":"beteji","betejeste":"beteji","betejesti":"beteji","betejii":"beteji","betejim":"beteji","betejind":"beteji","betejira":"beteji","betejiram":"beteji","betejirati":"beteji","betejise":"beteji","betejisem":"beteji","betejisera":"beteji","betejiseram":"beteji","betejiserati":"beteji","betejisesi":"beteji","betejisi":"beteji","betejit":"beteji","betejiti":"beteji","betejituri":"betejitură","betejiturii":"betejitură","betejiturile":"betejitură","betejiturilor":"betejitură","betele":["bețele","băț","betele","bată","betele","beat","betele","bet"],"beteli":["beteli","beteală","beteli","betel"],"betelia":"betelie","beteliei":"betelie","betelii":["betelii","beteală","betelii","betel","betelii","betelie"],"beteliile":"betelie","beteliilor":"betelie","betelilor":"betel","betelor":["bețelor","băț","betelor","bată"],"betelul":"betel","betelule":"betel","betelului":"betel","betesuge":"beteșug","betesugele":"beteșug","betesugelor":"beteșug","betesugul":"beteșug","betesugule":"beteșug","betesugului":"beteșug","betesuguri":"beteșug","beti":["beți","bea","beți","beat","beți","bet"],"betia":"beție","betiei":"beție","betigase":"bețigaș","betigasele":"bețigaș","betigaselor":"bețigaș","betigasul":"bețigaș","betigasule":"bețigaș","betigasului":"bețigaș","betii":["beții","beat","beții","bet","beții","beție"],"betiile":"beție","betiilor":"beție","betisoare":"bețișor","betisore":"bețișor","betisorele":"bețișor","betisorelor":"bețișor","betisorul":"bețișor","betisorule":"bețișor","betisorului":"bețișor","betite":"betiță","betitei":"betiță","betitele":"betiță","betitelor":"betiță","betiva":["bețivă","bețiv","bețiva","bețiv"],"betivana":["bețivană","bețivan","bețivana","bețivan"],"betivanaria":"bețivănărie","betivanariei":"bețivănărie","betivanarii":"bețivănărie","betivanariile":"bețivănărie","betivanariilor":"bețivănărie","betivane":["bețivane","bețivan","bețivane","bețivană"],"betivanei":"bețivană","betivanele":["bețivanele","bețivan","bețivanele","bețivană"],"betivanelor":"bețivană","betivani":"bețivan","betivanii":"bețivan","betivanilor":"bețivan","betivanul":"bețivan","betivanule":"bețivan","betivanului":"bețivan","betive":["bețive","bețiv","bețive","bețivă"],"betivea":"bețivi","betiveai":"bețivi","betiveam":"bețivi","betiveati":"bețivi","betiveau":"bețivi","betivei":"bețivă","betivele":["bețivele","bețiv","bețivele","bețivă"],"betivelor":"bețivă","betivesc":"bețivi","betiveste":"bețivi","betivesti":"bețivi","betivi":"bețiv","betivii":["bețivii","bețiv","bețivii","bețivi"],"betivilor":"bețiv","betivim":"bețivi","betivind":"bețivi","betivira":"bețivi","betiviram":"bețivi","betivirati":"bețivi","betivise":"bețivi","betivisem":"bețivi","betivisera":"bețivi","betiviseram":"bețivi","betiviserati":"bețivi","betivisesi":"bețivi","betivisi":"bețivi","betivit":"bețivi","betiviti":"bețivi","betivul":"bețiv","betivule":"bețiv","betivului":"bețiv","betoane":"beton","betoanele":"beton","betoanelor":"beton","betonai":"betona","betonaje":"betonaj","betonajele":"betonaj","betonajelor":"betonaj","betonajul":"betonaj","betonajule":"betonaj","betonajului":"betonaj","betonam":["betonăm","betona","betonam","betona"],"betonand":"betona","betonara":"betona","betonaram":"betona","betonarati":"betona","betonarea":"betonare","betonari":"betonare","betonarii":"betonare","betonarile":"betonare","betonarilor":"betonare","betonase":"betona","betonasem":"betona","betonasera":"betona","betonaseram":"betona","betonaserati":"betona","betonasesi":"betona","betonasi":"betona","betonat":"betona","betonata":["betonată","betonat","betonata","betonat"],"betonate":"betonat","betonatele":"betonat","betonati":["betonați","betona","betonați","betonat"],"betonatii":"betonat","betonatul":"betonat","betonau":"betona","betoneaza":"betona","betonez":"betona","betonezi":"betona","betonici":"betonică","betonicii":"betonică","betonicile":"betonică","betonicilor":"betonică","betoniere":"betonieră","betonierei":"betonieră","betonierele":"betonieră","betonierelor":"betonieră","betonieri":"betonier","betonierii":"betonier","betonierilor":"betonier","betonierul":"betonier","betonierule":"betonier","betonierului":"betonier","betoniste":"betonistă","betonistei":"betonistă","betonistele":"betonistă","betonistelor":"betonistă","betonisti":"betonist","betonistii":"betonist","betonistilor":"betonist","betonistul":"betonist","betonistule":"betonist","betonistului":"betonist","betonul":"beton","betonule":"beton","betonului":"beton","betul":"bet","beute":"beuță","beutei":"beuță","beutele":"beuță","beutelor":"beuță","beutura":"băutură","beuturi":"beutură","beuturii":"beutură","beuturile":"beutură","beuturilor":"beutură","bevatroane":"bevatron","bevatroanele":"bevatron","bevatroanelor":"bevatron","bevatronul":"bevatron","bevatronule":"bevatron","bevatronului":"bevatron","bezaconia":"bezaconie","bezaconica":["bezaconică","bezaconic","bezaconica","bezaconic"],"bezaconice":"bezaconic","bezaconicele":"bezaconic","bezaconici":"bezaconic","bezaconicii":"bezaconic","bezaconicul":"bezaconic","bezaconiei":"bezaconie","bezaconii":"bezaconie","bezaconiile":"bezaconie","bezaconiilor":"bezaconie","bezaconuia":"bezaconui","bezaconuiai":"bezaconui","bezaconuiam":"bezaconui","bezaconuiati":"bezaconui","bezaconuiau":"bezaconui","bezaconuiesc":"bezaconui","bezaconuieste":"bezaconui","bezaconuiesti":"bezaconui","bezaconuii":"bezaconui","bezaconuim":"bezaconui","bezaconuind":"bezaconui","bezaconuira":"bezaconui","bezaconuiram":"bezaconui","bezaconuirati":"bezaconui","bezaconuise":"bezaconui","bezaconuisem":"bezaconui","bezaconuisera":"bezaconui","bezaconuiseram":"bezaconui","bezaconuiserati":"bezaconui","bezaconuisesi":"bezaconui","bezaconuisi":"bezaconui","bezaconuit":"bezaconui","bezaconuiti":"bezaconui","bezbojnici":"bezbojnic","bezbojnicii":"bezbojnic","bezbojnicilor":"bezbojnic","bezbojnicul":"bezbojnic","bezbojnicule":"bezbojnic","bezbojnicului":"bezbojnic","bezeaua":"bezea","bezele":"bezea","bezelei":"bezea","bezelele":"bezea","bezelelor":"bezea","bezglasia":"bezglasie","bezglasiei":"bezglasie","bezglasii":"bezglasie","bezmeteca":["bezmetecă","bezmetec","bezmeteca","bezmetec"],"bezmetece":"bezmetec","bezmetecele":"bezmetec","bezmeteci":"bezmetec","bezmetecia":"bezmetecie","bezmeteciei":"bezmetecie","bezmetecii":["bezmetecii","bezmetec","bezmetecii","bezmetecie"],"bezmeteciile":"bezmetecie","bezmeteciilor":"bezmetecie","bezmetecul":"bezmetec","bezmetica":["bezmetică","bezmetic","bezmetica","bezmetic"],"bezmetice":"bezmetic","bezmeticele":"bezmetic","bezmetici":"bezmetic","bezmeticii":"bezmetic","bezmeticilor":"bezmetic","bezmeticul":"bezmetic","bezmeticule":"bezmetic","bezmeticului":"bezmetic","bezne":"beznă","beznei":"beznă","beznele":"beznă","beznelor":"beznă","bezoare":"bezoar","bezoarele":"bezoar","bezoarelor":"bezoar","bezoarul":"bezoar","bezoarule":"bezoar","bezoarului":"bezoar","bezrebarnica":["bezrebărnică","bezrebărnic","bezrebărnica","bezrebărnic"],"bezrebarnice":"bezrebărnic","bezrebarnicele":"bezrebărnic","bezrebarnici":"bezrebărnic","bezrebarnicii":"bezrebărnic","bezrebarnicul":"bezrebărnic","bhutaneze":"bhutaneză","bhutanezei":"bhutaneză","bhutanezele":"bhutaneză","bhutanezelor":"bhutaneză","bi-metalista":["bi-metalistă","bi-metalist","bi-metalista","bi-metalist"],"bi-metaliste":"bi-metalist","bi-metalistele":"bi-metalist","bi-metalisti":"bi-metalist","bi-metalistii":"bi-metalist","bi-metalistilor":"bi-metalist","bi-metalistul":"bi-metalist","bi-metalistule":"bi-metalist","bi-metalistului":"bi-metalist","biacida":["biacidă","biacid","biacida","biacid"],"biacide":"biacid","biacidele":"biacid","biacidul":"biacid","biacizi":"biacid","biacizii":"biacid","bianuala":["bianuală","bianual","bianuala","bianual"],"bianuale":"bianual","bianualele":"bianual","bianuali":"bianual","bianualii":"bianual","bianualul":"bianual","biata":["biată","biet","biata","biet"],"biatloane":"biatlon","biatloanele":"biatlon","biatloanelor":"biatlon","biatloniste":"biatlonistă","biatlonistei":"biatlonistă","biatlonistele":"biatlonistă","biatlonistelor":"biatlonistă","biatlonisti":"biatlonist","biatlonistii":"biatlonist","biatlonistilor":"biatlonist","biatlonistul":"biatlonist","biatlonistule":"biatlonist","biatlonistului":"biatlonist","biatlonul":"biatlon","biatlonule":"biatlon","biatlonului":"biatlon","biatomica":["biatomică","biatomic","biatomica","biatomic"],"biatomice":"biatomic","biatomicele":"biatomic","biatomici":"biatomic","biatomicii":"biatomic","biatomicul":"biatomic","biaxiala":["biaxială","biaxial","biaxiala","biaxial"],"biaxiale":"biaxial","biaxialele":"biaxial","biaxiali":"biaxial","biaxialii":"biaxial","biaxialul":"biaxial","bibane":"bibană","bibanei":"bibană","bibanele":"bibană","bibanelor":"bibană","bibani":"biban","bibanii":"biban","bibanilor":"biban","bibanul":"biban","bibanule":"biban","bibanului":"biban","bibazica":["bibazică","bibazic","bibazica","bibazic"],"bibazice":"bibazic","bibazicele":"bibazic","bibazici":"bibazic","bibazicii":"bibazic","bibazicul":"bibazic","bibeloul":"bibelou","bibeloule":"bibelou","bibeloului":"bibelou","bibelouri":"bibelou","bibelourile":"bibelou","bibelourilor":"bibelou","biberi":"biber","biberii":"biber","biberilor":"biber","biberoane":"biberon","biberoanele":"biberon","biberoanelor":"biberon","biberonul":"biberon","biberonule":"biberon","biberonului":"biberon","biberul":"biber","biberule":"biber","biberului":"biber","bibice":"bibică","bibicei":"bibică","bibicele":"bibică","bibicelor":"bibică","bibici":"bibic","bibicii":"bibic","bibicilor":"bibic","bibicul":"bibic","bibicule":"bibic","bibicului":"bibic","bibilici":"bibilică","bibilicii":"bibilică","bibilicile":"bibilică","bibilicilor":"bibilică","bibiloaice":"bibiloaică","bibiloaicei":"bibiloaică","bibiloaicele":"bibiloaică","bibiloaicelor":"bibiloaică","bibiloii":"bibiloi","bibiloilor":"bibiloi","bibiloiul":"bibiloi","bibiloiule":"bibiloi","bibiloiului":"bibiloi","biblia":["biblia","Biblie","biblia","biblie"],"biblica":["biblică","biblic","biblica","biblic"],"biblice":"biblic","biblicele":"biblic","biblici":"biblic","biblicii":"biblic","biblicisti":"biblicist","biblicistii":"biblicist","biblicistilor":"biblicist","biblicistul":"biblicist","biblicistule":"biblicist","biblicistului":"biblicist","biblicul":"biblic","bibliei":["bibliei","Biblie","bibliei","biblie"],"biblii":["biblii","Biblie","biblii","biblie"],"bibliile":["bibliile","Biblie","bibliile","biblie"],"bibliilor":["bibliilor","Biblie","bibliilor","biblie"],"bibliobuze":"bibliobuz","bibliobuzele":"bibliobuz","bibliobuzelor":"bibliobuz","bibliobuzul":"bibliobuz","bibliobuzule":"bibliobuz","bibliobuzului":"bibliobuz","bibliofage":"bibliofagă","bibliofagei":"bibliofagă","bibliofagele":"bibliofagă","bibliofagelor":"bibliofagă","bibliofagi":"bibliofag","bibliofagii":"bibliofag","bibliofagilor":"bibliofag","bibliofagul":"bibliofag","bibliofagule":"bibliofag","bibliofagului":"bibliofag","bibliofile":"bibliofilă","bibliofilei":"bibliofilă","bibliofilele":"bibliofilă","bibliofilelor":"bibliofilă","bibliofili":"bibliofil","bibliofilia":"bibliofilie","bibliofiliei":"bibliofilie","bibliofilii":["bibliofilii","bibliofil","bibliofilii","bibliofilie"],"bibliofililor":"bibliofil","bibliofilistica":["bibliofilistică","bibliofilistic","bibliofilistica","bibliofilistic"],"bibliofilistice":"bibliofilistic","bibliofilisticele":"bibliofilistic","bibliofilistici":"bibliofilistic","bibliofilisticii":"bibliofilistic","bibliofilisticul":"bibliofilistic","bibliofilme":"bibliofilm","bibliofilmele":"bibliofilm","bibliofilmelor":"bibliofilm","bibliofilmul":"bibliofilm","bibliofilmule":"bibliofilm","bibliofilmului":"bibliofilm","bibliofilul":"bibliofil","bibliofilule":"bibliofil","bibliofilului":"bibliofil","bibliofobe":"bibliofobă","bibliofobei":"bibliofobă","bibliofobele":"bibliofobă","bibliofobelor":"bibliofobă","bibliofobi":"bibliofob","bibliofobia":"bibliofobie","bibliofobiei":"bibliofobie","bibliofobii":["bibliofobii","bibliofob","bibliofobii","bibliofobie"],"bibliofobilor":"bibliofob","bibliofobul":"bibliofob","bibliofobule":"bibliofob","bibliofobului":"bibliofob","bibliografi":"bibliograf","bibliografia":"bibliografie","bibliografica":["bibliografică","bibliografic","bibliografica","bibliografic"],"bibliografice":"bibliografic","bibliograficele":"bibliografic","bibliografici":"bibliografic","bibliograficii":"bibliografic","bibliograficul":"bibliografic","bibliografiei":"bibliografie","bibliografii":["bibliografii","bibliograf","bibliografii","bibliografie"],"bibliografiile":"bibliografie","bibliografiilor":"bibliografie","bibliografilor":"bibliograf","bibliograful":"bibliograf","bibliografule":"bibliograf","bibliografului":"bibliograf","bibliolatria":"bibliolatrie","bibliolatriei":"bibliolatrie","bibliolatrii":"bibliolatrie","bibliologe":"bibliologă","bibliologei":"bibliologă","bibliologele":"bibliologă","bibliologelor":"bibliologă","bibliologi":"bibliolog","bibliologia":"bibliologie","bibliologica":["bibliologică","bibliologic","bibliologica","bibliologic"],"bibliologice":"bibliologic","bibliologicele":"bibliologic","bibliologici":"bibliologic","bibliologicii":"bibliologic","bibliologicul":"bibliologic","bibliologiei":"bibliologie","bibliologii":["bibliologii","bibliolog","bibliologii","bibliologie"],"bibliologilor":"bibliolog","bibliologul":"bibliolog","bibliologule":"bibliolog","bibliologului":"bibliolog","bibliomane":"bibliomană","bibliomanei":"bibliomană","bibliomanele":"bibliomană","bibliomanelor":"bibliomană","bibliomani":"biblioman","bibliomania":"bibliomanie","bibliomaniei":"bibliomanie","bibliomanii":["bibliomanii","biblioman","bibliomanii","bibliomanie"],"bibliomaniile":"bibliomanie","bibliomaniilor":"bibliomanie","bibliomanilor":"biblioman","bibliomanul":"biblioman","bibliomanule":"biblioman","bibliomanului":"biblioman","biblioraftul":"biblioraft","biblioraftule":"biblioraft","biblioraftului":"biblioraft","bibliorafturi":"biblioraft","bibliorafturile":"biblioraft","bibliorafturilor":"biblioraft","bibliotecara":["bibliotecară","bibliotecar","bibliotecara","bibliotecar"],"bibliotecare":["bibliotecare","bibliotecar","bibliotecare","bibliotecară"],"bibliotecarei":"bibliotecară","bibliotecarele":["bibliotecarele","bibliotecar","bibliotecarele","bibliotecară"],"bibliotecarelor":"bibliotecară","bibliotecari":"bibliotecar","bibliotecarii":"bibliotecar","bibliotecarul":"bibliotecar","biblioteci":"bibliotecă","biblioteci volante":"bibliotecă volantă","bibliotecii":"bibliotecă","bibliotecile":"bibliotecă","bibliotecilor":"bibliotecă","biblioteconomia":"biblioteconomie","biblioteconomica":["biblioteconomică","biblioteconomic","biblioteconomica","biblioteconomic"],"biblioteconomice":"biblioteconomic","biblioteconomicele":"biblioteconomic","biblioteconomici":"biblioteconomic","biblioteconomicii":"biblioteconomic","biblioteconomicul":"biblioteconomic","biblioteconomiei":"biblioteconomie","biblioteconomii":"biblioteconomie","bibliotecute":"bibliotecuță","bibliotecutei":"bibliotecuță","bibliotecutele":"bibliotecuță","bibliotecutelor":"bibliotecuță","bibliste":"biblistă","biblistei":"biblistă","biblistele":"biblistă","biblistelor":"biblistă","biblisti":"biblist","biblistii":"biblist","biblistilor":"biblist","biblistul":"biblist","biblistule":"biblist","biblistului":"biblist","biboarce":"biboarcă","biboarcei":"biboarcă","biboarcele":"biboarcă","biboarcelor":"biboarcă","bic":"Bâc","bicamerala":["bicamerală","bicameral","bicamerala","bicameral"],"bicamerale":"bicameral","bicameralele":"bicameral","bicamerali":"bicameral","bicameralii":"bicameral","bicameralisme":"bicameralism","bicameralismele":"bicameralism","bicameralismelor":"bicameralism","bicameralismul":"bicameralism","bicameralismule":"bicameralism","bicameralismului":"bicameralism","bicameralul":"bicameral","bicamerisme":"bicamerism","bicamerismei":"bicamerism","bicamerismelor":"bicamerism","bicamerismul":"bicamerism","bicamerismule":"bicamerism","bicamerismului":"bicamerism","bicarbonati":"bicarbonat","bicarbonatii":"bicarbonat","bicarbonatilor":"bicarbonat","bicarbonatul":"bicarbonat","bicarbonatule":"bicarbonat","bicarbonatului":"bicarbonat","bicarburi":"bicarbură","bicarburii":"bicarbură","bicarburile":"bicarbură","bicarburilor":"bicarbură","bicarpelara":["bicarpelară","bicarpelar","bicarpelara","bicarpelar"],"bicarpelare":"bicarpelar","bicarpelarele":"bicarpelar","bicarpelari":"bicarpelar","bicarpelarii":"bicarpelar","bicarpelarul":"bicarpelar","bicasei":"bicășel","bicaseii":"bicășel","bicaseilor":"bicășel","bicaselul":"bicășel","bicaselule":"bicășel","bicaselului":"bicășel","bicasi":"bicaș","bicasile":"bicaș","bicasilor":"bicaș","bicasul":"bicaș","bicasule":"bicaș","bicasului":"bicaș","bicasuti":"bicașuț","bicasutii":"bicașuț","bicasutilor":"bicașuț","bicasutul":"bicașuț","bicasutule":"bicașuț","bicasutului":"bicașuț","bice":"bici","bicefala":["bicefală","bicefal","bicefala","bicefal"],"bicefale":"bicefal","bicefalele":"bicefal","bicefali":"bicefal","bicefalia":"bicefalie","bicefalica":["bicefalică","bicefalic","bicefalica","bicefalic"],"bicefalice":"bicefalic","bicefalicele":"bicefalic","bicefalici":"bicefalic","bicefalicii":"bicefalic","bicefalicul":"bicefalic","bicefaliei":"bicefalie","bicefalii":["bicefalii","bicefal","bicefalii","bicefalie"],"bicefaliile":"bicefalie","bicefaliilor":"bicefalie","bicefalul":"bicefal","bicele":"bici","bicelor":"bici","bicentenari":"bicentenar","bicentenarile":"bicentenar","bicentenarilor":"bicentenar","bicentenarul":"bicentenar","bicentenarule":"bicentenar","bicentenarului":"bicentenar","bicepsi":"biceps","bicepsii":"biceps","bicepsilor":"biceps","bicepsul":"biceps","bicepsule":"biceps","bicepsului":"biceps","bicherasi":"bicheraș","bicherasii":"bicheraș","bicherasilor":"bicheraș","bicherasul":"bicheraș","bicherasule":"bicheraș","bicherasului":"bicheraș","bicheri":"bicher","bicherii":"bicher","bicherilor":"bicher","bicherul":"bicher","bicherule":"bicher","bicherului":"bicher","bichirea":"bichiri","bichireai":"bichiri","bichiream":"bichiri","bichireati":"bichiri","bichireau":"bichiri","bichiresc":"bichiri","bichireste":"bichiri","bichiresti":"bichiri","bichirii":"bichiri","bichirim":"bichiri","bichirind":"bichiri","bichirira":"bichiri","bichiriram":"bichiri","bichirirati":"bichiri","bichirise":"bichiri","bichirisem":"bichiri","bichirisera":"bichiri","bichiriseram":"bichiri","bichiriserati":"bichiri","bichirisesi":"bichiri","bichirisi":"bichiri","bichirit":"bichiri","bichiriti":"bichiri","bicicasi":"bicicaș","bicicasile":"bicicaș","bicicasilor":"bicicaș","bicicasul":"bicicaș","bicicasule":"bicicaș","bicicasului":"bicicaș","bicicle":"biciclu","biciclele":"biciclu","biciclelor":"biciclu","biciclete":"bicicletă","bicicletei":"bicicletă","bicicletele":"bicicletă","bicicletelor":"bicicletă","biciclica":["biciclică","biciclic","biciclica","biciclic"],"biciclice":"biciclic","biciclicele":"biciclic","biciclici":"biciclic","biciclicii":"biciclic","biciclicul":"biciclic","bicicliste":"biciclistă","biciclistei":"biciclistă","biciclistele":"biciclistă","biciclistelor":"biciclistă","biciclisti":"biciclist","biciclistii":"biciclist","biciclistilor":"biciclist","biciclistul":"biciclist","biciclistule":"biciclist","biciclistului":"biciclist","biciclul":"biciclu","biciclule":"biciclu","biciclului":"biciclu","bicioc":"bâcioc","bicisnica":["bicisnică","bicisnic","bicisnica","bicisnic"],"bicisnice":["bicisnice","bicisnic","bicisnice","bicisnică"],"bicisnicei":"bicisnică","bicisnicele":["bicisnicele","bicisnic","bicisnicele","bicisnică"],"bicisnicelor":"bicisnică","bicisnici":"bicisnic","bicisnicia":"bicisnicie","bicisniciei":"bicisnicie","bicisnicii":["bicisnicii","bicisnic","bicisnicii","bicisnicie"],"bicisniciile":"bicisnicie","bicisniciilor":"bicisnicie","bicisnicul":"bicisnic","bicisoare":"bicișor","bicisoarele":"bicișor","bicisoarelor":"bicișor","bicisorul":"bicișor","bicisorule":"bicișor","bicisorului":"bicișor","bicitoci":"bicitoc","bicitocii":"bicitoc","bicitocilor":"bicitoc","bicitocul":"bicitoc","bicitocule":"bicitoc","bicitocului":"bicitoc","biciuele":"biciuială","biciuelei":"biciuială","biciuelele":"biciuială","biciuelelor":"biciuială","biciueli":"biciuială","biciuia":"biciui","biciuiai":"biciui","biciuiam":"biciui","biciuiati":"biciui","biciuiau":"biciui","biciuiesc":"biciui","biciuieste":"biciui","biciuiesti":"biciui","biciuii":"biciui","biciuim":"biciui","biciuind":"biciui","biciuira":"biciui","biciuiram":"biciui","biciuirati":"biciui","biciuirea":"biciuire","biciuiri":"biciuire","biciuirii":"biciuire","biciuirile":"biciuire","biciuirilor":"biciuire","biciuise":"biciui","biciuisem":"biciui","biciuisera":"biciui","biciuiseram":"biciui","biciuiserati":"biciui","biciuisesi":"biciui","biciuisi":"biciui","biciuit":"biciui","biciuita":["biciuită","biciuit","biciuita","biciuit"],"biciuite":"biciuit","biciuitele":"biciuit","biciuiti":["biciuiți","biciui","biciuiți","biciuit"],"biciuitii":"biciuit","biciuitoare":"biciuitor","biciuitoarea":"biciuitor","biciuitoarele":"biciuitor","biciuitori":"biciuitor","biciuitorii":"biciuitor","biciuitorul":"biciuitor","biciuitul":"biciuit","biciuituri":"biciuitură","biciuiturii":"biciuitură","biciuiturile":"biciuitură","biciuiturilor":"biciuitură","biciul":"bici","biciule":"bici","biciulete":"biciuleț","biciuletele":"biciuleț","biciuletelor":"biciuleț","biciuletul":"biciuleț","biciuletule":"biciuleț","biciuletului":"biciuleț","biciului":"bici","biciuscute":"biciușcuță","biciuscutei":"biciușcuță","biciuscutele":"biciușcuță","biciuscutelor":"biciușcuță","biciusoare":"biciușor","biciusoarele":"biciușor","biciusoarelor":"biciușor","biciusorul":"biciușor","biciusorule":"biciușor","biciusorului":"biciușor","biciuste":"biciușcă","biciustei":"biciușcă","biciustele":"biciușcă","biciustelor":"biciușcă","biciusti":"biciușcă","biciutcae":"biciutcă","biciutcaei":"biciutcă","biciutcaele":"biciutcă","biciutcaelor":"biciutcă","bicle":"biclă","biclei":"biclă","biclele":"biclă","biclelor":"biclă","biclesti":"Bâclești","bicloruri":"biclorură","biclorurii":"biclorură","biclorurile":"biclorură","biclorurilor":"biclorură","bicolora":["bicoloră","bicolor","bicolora","bicolor"],"bicolore":"bicolor","bicolorele":"bicolor","bicolori":"bicolor","bicolorii":"bicolor","bicolorul":"bicolor","biconcava":["biconcavă","biconcav","biconcava","biconcav"],"biconcave":"biconcav","biconcavele":"biconcav","biconcavi":"biconcav","biconcavii":"biconcav","biconcavitatati":"biconcavitate","biconcavitatatii":"biconcavitate","biconcavitatatile":"biconcavitate","biconcavitatatilor":"biconcavitate","biconcavitatea":"biconcavitate","biconcavul":"biconcav","biconvecsi":"biconvex","biconvecsii":"biconvex","biconvexa":["biconvexă","biconvex","biconvexa","biconvex"],"biconvexe":"biconvex","biconvexele":"biconvex","biconvexitatati":"biconvexitate","biconvexitatatii":"biconvexitate","biconvexitatatile":"biconvexitate","biconvexitatatilor":"biconvexitate","biconvexitatea":"biconvexitate","biconvexul":"biconvex","bicornul":"bicorn","bicornule":"bicorn","bicornului":"bicorn","bicornuri":"bicorn","bicornurile":"bicorn","bicornurilor":"bicorn","bicotidiana":["bicotidiană","bicotidian","bicotidiana","bicotidian"],"bicotidianul":"bicotidian","bicotidiene":"bicotidian","bicotidienele":"bicotidian","bicotidieni":"bicotidian","bicotidienii":"bicotidian","bicromati":"bicromat","bicromatii":"bicromat","bicromatilor":"bicromat","bicromatul":"bicromat","bicromatule":"bicromat","bicromatului":"bicromat","bicromica":["bicromică","bicromic","bicromica","bicromic"],"bicromice":"bicromic","bicromicele":"bicromic","bicromici":"bicromic","bicromicii":"bicromic","bicromicul":"bicromic","bicuspida":["bicuspidă","bicuspid","bicuspida","bicuspid"],"bicuspide":"bicuspid","bicuspidele":"bicuspid","bicuspidul":"bicuspid","bicuspizi":"bicuspid","bicuspizii":"bicuspid","bicute":"bicuță","bicutei":"bicuță","bide":"bidă","bidei":"bidă","bidele":"bidă","bidelor":"bidă","bideul":"bideu","bideului":"bideu","bideuri":"bideu","bideurile":"bideu","bideurilor":"bideu","bidibii":"bidibiu","bidibiii":"bidibiu","bidibiilor":"bidibiu","bidibiuul":"bidibiu","bidibiuule":"bidibiu","bidibiuului":"bidibiu","bididei":"bididel","bidideii":"bididel","bidideilor":"bididel","bididelul":"bididel","bididelule":"bididel","bididelului":"bididel","bididii":"bididiu","bididiii":"bididiu","bididiilor":"bididiu","bididiuul":"bididiu","bididiuule":"bididiu","bididiuului":"bididiu","bidiganiea":"bidiganie","bidiganii":"bidiganie","bidiganiii":"bidiganie","bidiganiile":"bidiganie","bidiganiilor":"bidiganie","bidinarese":"bidinăreasă","bidinaresei":"bidinăreasă","bidinaresele":"bidinăreasă","bidinareselor":"bidinăreasă","bidinari":"bidinar","bidinarii":"bidinar","bidinarilor":"bidinar","bidinarul":"bidinar","bidinarule":"bidinar","bidinarului":"bidinar","bidineaua":"bidinea","bidinele":"bidinea","bidinelei":"bidinea","bidinelele":"bidinea","bidinelelor":"bidinea","bidinelute":"bidineluță","bidinelutei":"bidineluță","bidinelutele":"bidineluță","bidinelutelor":"bidineluță","bidivii":"bidiviu","bidiviii":"bidiviu","bidiviilor":"bidiviu","bidiviul":"bidiviu","bidiviule":"bidiviu","bidiviului":"bidiviu","bidoane":"bidon","bidoanele":"bidon","bidoanelor":"bidon","bidonul":"bidon","bidonule":"bidon","bidonului":"bidon","bidonville-uri":"bidonville","bidonville-urile":"bidonville","bidonville-urilor":"bidonville","bidonvilleul":"bidonville","bidonvilleule":"bidonville","bidonvilleului":"bidonville","bidonvilul":"bidonvil","bidonvilule":"bidonvil","bidonvilului":"bidonvil","bidonviluri":"bidonvil","bidonvilurile":"bidonvil","bidonvilurilor":"bidonvil","bidusa":["bidușă","biduș","bidușa","biduș"],"biduse":"biduș","bidusele":"biduș","bidusi":"biduș","bidusii":"biduș","bidusul":"biduș","biele":"bielă","bielei":"bielă","bielele":"bielă","bielelor":"bielă","bielete":"bieletă","bieletei":"bieletă","bieletele":"bieletă","bieletelor":"bieletă","bielorusa":["bielorusă","bielorus","bielorusa","bielorus"],"bieloruse":["bieloruse","bielorus","bieloruse","bielorusă"],"bielorusei":"bielorusă","bielorusele":["bielorusele","bielorus","bielorusele","bielorusă"],"bieloruselor":"bielorusă","bielorusi":"bielorus","bielorusii":"bielorus","bielorusilor":"bielorus","bielorusul":"bielorus","bielorusule":"bielorus","bielorusului":"bielorus","bielsugul":"bielșug","bielsugule":"bielșug","bielsugului":"bielșug","bielsuguri":"bielșug","bielsugurile":"bielșug","bielsugurilor":"bielșug","biena":"bienal","bienale":"bienală","bienalei":"bienală","bienalele":"bienală","bienalelor":"bienală","bienali":"bienal","bienalii":"bienal","bienalile":"bienal","bienalilor":"bienal","bieniuul":"bieniu","bieniuule":"bieniu","bieniuului":"bieniu","biete":"biet","bietele":"biet","bieti":"biet","bietii":"biet","bietuca":["bietucă","bietuc","bietuca","bietuc"],"bietuce":"bietuc","bietucele":"bietuc","bietuci":"bietuc","bietucii":"bietuc","bietucul":"bietuc","bietul":"biet","bietuleata":["bietuleață","bietuleț","bietuleața","bietuleț"],"bietulete":"bietuleț","bietuletele":"bietuleț","bietuleti":"bietuleț","bietuletii":"bietuleț","bietuletul":"bietuleț","bifai":"bifa","bifam":["bifăm","bifa","bifam","bifa"],"bifand":"bifa","bifara":"bifa","bifaram":"bifa","bifarati":"bifa","bifarea":"bifare","bifari":"bifare","bifarii":"bifare","bifarile":"bifare","bifarilor":"bifare","bifase":"bifa","bifasem":"bifa","bifasera":"bifa","bifaseram":"bifa","bifaserati":"bifa","bifasesi":"bifa","bifasi":"bifa","bifat":"bifa","bifati":"bifa","bifatul":"bifat","bifatule":"bifat","bifatului":"bifat","bifaturi":"bifat","bifaturile":"bifat","bifaturilor":"bifat","bifau":"bifa","bifazata":["bifazată","bifazat","bifazata","bifazat"],"bifazate":"bifazat","bifazatele":"bifazat","bifazati":"bifazat","bifazatii":"bifazat","bifazatul":"bifazat","bifazica":["bifazică","bifazic","bifazica","bifazic"],"bifazice":"bifazic","bifazicele":"bifazic","bifazici":"bifazic","bifazicii":"bifazic","bifazicul":"bifazic","bife":"bifă","bifeaza":"bifa","bifei":"bifă","bifele":"bifă","bifelor":"bifă","bifez":"bifa","bifezi":"bifa","bifida":["bifidă","bifid","bifida","bifid"],"bifide":"bifid","bifidele":"bifid","bifidul":"bifid","bifilara":["bifilară","bifilar","bifilara","bifilar"],"bifilare":"bifilar","bifilarele":"bifilar","bifilari":"bifilar","bifilarii":"bifilar","bifilarul":"bifilar","bifizi":"bifid","bifizii":"bifid","biflora":["bifloră","biflor","biflora","biflor"],"biflore":"biflor","biflorele":"biflor","biflori":"biflor","biflorii":"biflor","biflorul":"biflor","bifocala":["bifocală","bifocal","bifocala","bifocal"],"bifocale":"bifocal","bifocalele":"bifocal","bifocali":"bifocal","bifocalii":"bifocal","bifocalul":"bifocal","bifoliata":["bifoliată","bifoliat","bifoliata","bifoliat"],"bifoliate":"bifoliat","bifoliatele":"bifoliat","bifoliati":"bifoliat","bifoliatii":"bifoliat","bifoliatul":"bifoliat","bifoliolata":["bifoliolată","bifoliolat","bifoliolata","bifoliolat"],"bifoliolate":"bifoliolat","bifoliolatele":"bifoliolat","bifoliolati":"bifoliolat","bifoliolatii":"bifoliolat","bifoliolatul":"bifoliolat","biftece":"biftec","biftecele":"biftec","biftecelor":"biftec","biftecul":"biftec","biftecule":"biftec","biftecului":"biftec","biftecuri":"biftec","bifurc":"bifurca","bifurcai":"bifurca","bifurcam":["bifurcăm","bifurca","bifurcam","bifurca"],"bifurcand":"bifurca","bifurcara":"bifurca","bifurcaram":"bifurca","bifurcarati":"bifurca","bifurcarea":"bifurcare","bifurcari":"bifurcare","bifurcarii":"bifurcare","bifurcarile":"bifurcare","bifurcarilor":"bifurcare","bifurcase":"bifurca","bifurcasem":"bifurca","bifurcasera":"bifurca","bifurcaseram":"bifurca","bifurcaserati":"bifurca","bifurcasesi":"bifurca","bifurcasi":"bifurca","bifurcat":"bifurca","bifurcati":"bifurca","bifurcatia":"bifurcație","bifurcatiei":"bifurcație","bifurcatii":"bifurcație","bifurcatiile":"bifurcație","bifurcatiilor":"bifurcație","bifurcau":"bifurca","bifurci":"bifurca","bigame":"bigamă","bigamei":"bigamă","bigamele":"bigamă","bigamelor":"bigamă","bigami":"bigam","bigamia":"bigamie","bigamiei":"bigamie","bigamii":["bigamii","bigam","bigamii","bigamie"],"bigamiile":"bigamie","bigamiilor":"bigamie","bigamilor":"bigam","bigamul":"bigam","bigamule":"bigam","bigamului":"bigam","bigbandul":"bigband","bigbandule":"bigband","bigbandului":"bigband","bigbanduri":"bigband","bigbandurile":"bigband","bigbandurilor":"bigband","bigeminisme":"bigeminism","bigeminismele":"bigeminism","bigeminismelor":"bigeminism","bigeminismul":"bigeminism","bigeminismule":"bigeminism","bigeminismului":"bigeminism","bigesti":"Bâgești","bighimoti":"bighimot","bighistanul":"bighistan","bighistanule":"bighistan","bighistanului":"bighistan","bigi":"bigă","bigii":"bigă","bigile":"bigă","bigilor":"bigă","bigote":"bigotă","bigotei":"bigotă","bigotele":"bigotă","bigotelor":"bigotă","bigoteria":"bigoterie","bigoteriei":"bigoterie","bigoterii":"bigoterie","bigoteriile":"bigoterie","bigoteriilor":"bigoterie","bigoti":"bigot","bigotii":"bigot","bigotilor":"bigot","bigotisme":"bigotism","bigotismele":"bigotism","bigotismelor":"bigotism","bigotismul":"bigotism","bigotismule":"bigotism","bigotismului":"bigotism","bigotul":"bigot","bigotule":"bigot","bigotului":"bigot","bigudiul":"bigudiu","bigudiule":"bigudiu","bigudiului":"bigudiu","bigudiuri":"bigudiu","bigudiurile":"bigudiu","bigudiurilor":"bigudiu","biguine":"biguină","biguinei":"biguină","bihindisea":"bihindisi","bihindiseai":"bihindisi","bihindiseam":"bihindisi","bihindiseati":"bihindisi","bihindiseau":"bihindisi","bihindisesc":"bihindisi","bihindiseste":"bihindisi","bihindisesti":"bihindisi","bihindisii":"bihindisi","bihindisim":"bihindisi","bihindisind":"bihindisi","bihindisira":"bihindisi","bihindisiram":"bihindisi","bihindisirati":"bihindisi","bihindisise":"bihindisi","bihindisisem":"bihindisi","bihindisisera":"bihindisi","bihindisiseram":"bihindisi","bihindisiserati":"bihindisi","bihindisisesi":"bihindisi","bihindisisi":"bihindisi","bihindisit":"bihindisi","bihindisiti":"bihindisi","bihlit":"bâhlit","bihoreana":["bihoreană","bihorean","bihoreana","bihorean"],"bihoreanul":"bihorean","bihoreanule":"bihorean","bihoreanului":"bihorean","bihorence":"bihoreancă","bihorencei":"bihoreancă","bihorencele":"bihoreancă","bihorencelor":"bihoreancă","bihorene":["bihorene","bihorean","bihorene","bihoreană"],"bihorenei":"bihoreană","bihorenele":["bihorenele","bihorean","bihorenele","bihoreană"],"bihorenelor":"bihoreană","bihoreni":"bihorean","bihorenii":"bihorean","bihorenilor":"bihorean","bihorul":"Bihor","bihorule":"Bihor","bihorului":"Bihor","biigui":"bâigui","biiguiala":"bâiguială","biiguitor":"bâiguitor","bijbii":"bâjbâi","bijbiiala":"bâjbâială","bijbiire":"bâjbâire","bijbiit":"bâjbâit","bijbiitura":"bâjbâitură","bijectii":"bijecție","bijectiva":["bijectivă","bijectiv","bijectiva","bijectiv"],"bijective":"bijectiv","bijectivele":"bijectiv","bijectivi":"bijectiv","bijectivii":"bijectiv","bijectivul":"bijectiv","bijuteria":"bijuterie","bijuteriei":"bijuterie","bijuterii":"bijuterie","bijuteriile":"bijuterie","bijuteriilor":"bijuterie","bijutieri":"bijutier","bijutierii":"bijutier","bijutierilor":"bijutier","bijutierul":"bijutier","bijutierule":"bijutier","bijutierului":"bijutier","bijuul":"biju","bijuule":"biju","bijuului":"biju","bijuuri":"biju","bijuurile":"biju","bijuurilor":"biju","bikeri":"biker","bikerii":"biker","bikerilor":"biker","bikerul":"biker","bikerule":"biker","bikerului":"biker","bikiniene":"bikiniană","bikinienei":"bikiniană","bikinienele":"bikiniană","bikinienelor":"bikiniană","bikiniul":"bikini","bikiniule":"bikini","bikiniului":"bikini","bilabiala":["bilabială","bilabial","bilabiala","bilabial"],"bilabiale":["bilabiale","bilabial","bilabiale","bilabială"],"bilabialei":"bilabială","bilabialele":["bilabialele","bilabial","bilabialele","bilabială"],"bilabialelor":"bilabială","bilabiali":"bilabial","bilabialii":"bilabial","bilabialul":"bilabial","bilabiata":["bilabiată","bilabiat","bilabiata","bilabiat"],"bilabiate":"bilabiat","bilabiatele":"bilabiat","bilabiati":"bilabiat","bilabiatii":"bilabiat","bilabiatul":"bilabiat","bilantiera":["bilanțieră","bilanțier","bilanțiera","bilanțier"],"bilantiere":"bilanțier","bilantierele":"bilanțier","bilantieri":"bilanțier","bilantierii":"bilanțier","bilantierile":"bilanțier","bilantierilor":"bilanțier","bilantierul":"bilanțier","bilantierule":"bilanțier","bilantierului":"bilanțier","bilantul":"bilanț","bilantule":"bilanț","bilantului":"bilanț","bilanturi":"bilanț","bilanturile":"bilanț","bilanturilor":"bilanț","bilaterala":["bilaterală","bilateral","bilaterala","bilateral"],"bilaterale":"bilateral","bilateralele":"bilateral","bilaterali":"bilateral","bilateralii":"bilateral","bilateralismul":"bilateralism","bilateralismule":"bilateralism","bilateralismului":"bilateralism","bilateralul":"bilateral","bilbii":"bâlbâi","bilbiiala":"bâlbâială","bilbiire":"bâlbâire","bilbiit":"bâlbâit","bilbiitor":"bâlbâitor","bilbiitura":"bâlbâitură","bilca":"bâlcă","bilci":"bâlci","bilcos":"bâlcos","bildana":"Bâldana","bildibic":"bâldâbâc","bildungsromane":"bildungsroman","bildungsromaneasca":["bildungsromanească","bildungsromanesc","bildungsromaneasca","bildungsromanesc"],"bildungsromanele":"bildungsroman","bildungsromanelor":"bildungsroman","bildungsromanescul":"bildungsromanesc","bildungsromanesti":"bildungsromanesc","bildungsromanestii":"bildungsromanesc","bildungsromanestile":"bildungsromanesc","bildungsromanul":"bildungsroman","bildungsromanule":"bildungsroman","bildungsromanului":"bildungsroman","bile":"bilă","bile de popice":"bilă de popice","bile negre":"bilă neagră","bilei":"bilă","bilele":"bilă","bilelor":"bilă","bilet de ordin":"bilet la ordin","bilete":"bilet","bilete de adio":"bilet de adio","bilete de banca":"bilet de bancă","bilete de identitate":"bilet de identitate","bilete de ordin":"bilet de ordin","bilete doar dus":"bilet doar dus","bilete dus-intors":"bilet dus-întors","bilete la ordin":"bilet la ordin","biletele":["biletele","bilet","bilețele","bilețel"],"biletelele":"bilețel","biletelelor":"bilețel","biletelor":"bilet","biletelul":"bilețel","biletelule":"bilețel","biletelului":"bilețel","biletul":"bilet","biletule":"bilet","biletului":"bilet","bilezicul":"bilezic","bilezicule":"bilezic","bilezicului":"bilezic","bilhacu":"Bâlhacu","biliara":["biliară","biliar","biliara","biliar"],"biliarde":"biliard","biliardele":"biliard","biliardelor":"biliard","biliardul":"biliard","biliardule":"biliard","biliardului":"biliard","biliare":"biliar","biliarele":"biliar","biliargii":"biliargiu","biliargiii":"biliargiu","biliargiilor":"biliargiu","biliargiuul":"biliargiu","biliargiuule":"biliargiu","biliargiuului":"biliargiu","biliari":"biliar","biliarii":"biliar","biliarul":"biliar","biligeneze":"biligeneză","biligenezei":"biligeneză","biligenezele":"biligeneză","biligenezelor":"biligeneză","bilingva":["bilingvă","bilingv","bilingva","bilingv"],"bilingve":"bilingv","bilingvele":"bilingv","bilingvi":"bilingv","bilingvii":"bilingv","bilingvilor":"bilingv","bilingvismul":"bilingvism","bilingvismule":"bilingvism","bilingvismului":"bilingvism","bilingvul":"bilingv","bilingvule":"bilingv","bilingvului":"bilingv","bilioane":"bilion","bilioanele":"bilion","bilioanelor":"bilion","bilioasa":["bilioasă","bilios","bilioasa","bilios"],"bilioase":"bilios","bilioasele":"bilios","bilionul":"bilion","bilionule":"bilion","bilionului":"bilion","biliosi":"bilios","biliosii":"bilios","biliosul":"bilios","bilirea":"bilire","biliri":"bilire","bilirii":"bilire","bilirile":"bilire","bilirilor":"bilire","bilirubine":"bilirubină","bilirubinei":"bilirubină","bilirubinele":"bilirubină","bilirubinelor":"bilirubină","bilirubinemia":"bilirubinemie","bilirubinemiei":"bilirubinemie","bilirubinemii":"bilirubinemie","bilirubinemiile":"bilirubinemie","bilirubinemiilor":"bilirubinemie","bilita":["bilită","bilit","bilita","bilit"],"bilite":"bilit","bilitele":"bilit","biliti":"bilit","bilitii":"bilit","bilitul":"bilit","biliverdine":"biliverdină","biliverdinei":"biliverdină","biliverdinele":"biliverdină","biliverdinelor":"biliverdină","bilobata":["bilobată","bilobat","bilobata","bilobat"],"bilobate":"bilobat","bilobatele":"bilobat","bilobati":"bilobat","bilobatii":"bilobat","bilobatul":"bilobat","biloculara":["biloculară","bilocular","biloculara","bilocular"],"biloculare":"bilocular","bilocularele":"bilocular","biloculari":"bilocular","bilocularii":"bilocular","bilocularul":"bilocular","bilsugul":"bilșug","bilsugule":"bilșug","bilsugului":"bilșug","bilsuguri":"bilșug","bilsugurile":"bilșug","bilsugurilor":"bilșug","bilta":"Bâlta","biltanele":"Bâltanele","bilteni":"Bâlteni","biltic":"bâltâc","biltisoara":"Bâltișoara","bilunara":["bilunară","bilunar","bilunara","bilunar"],"bilunare":"bilunar","bilunarele":"bilunar","bilunari":"bilunar","bilunarii":"bilunar","bilunarul":"bilunar","bilvanesti":"Bâlvănești","bilvanestii de jos":"Bâlvăneștii de Jos","bimana":["bimană","biman","bimana","biman"],"bimane":"biman","bimanele":"biman","bimani":"biman","bimanii":"biman","bimanitatea":"bimanitate","bimanitati":"bimanitate","bimanitatii":"bimanitate","bimanul":"biman","bimbasei":"bimbașă","bimbasi":"bimbașă","bimbasii":"bimbașă","bimbasilor":"bimbașă","bimensuala":["bimensuală","bimensual","bimensuala","bimensual"],"bimensuale":"bimensual","bimensualele":"bimensual","bimensuali":"bimensual","bimensualii":"bimensual","bimensualul":"bimensual","bimestre":"bimestru","bimestrele":"bimestru","bimestrelor":"bimestru","bimestruul":"bimestru","bimestruule":"bimestru","bimestruului":"bimestru","bimetale":"bimetal","bimetalele":"bimetal","bimetalelor":"bimetal","bimetalica":["bimetalică","bimetalic","bimetalica","bimetalic"],"bimetalice":"bimetalic","bimetalicele":"bimetalic","bimetalici":"bimetalic","bimetalicii":"bimetalic","bimetalicul":"bimetalic","bimetalismul":"bimetalism","bimetalismule":"bimetalism","bimetalismului":"bimetalism","bimetalista":["bimetalistă","bimetalist","bimetalista","bimetalist"],"bimetaliste":"bimetalist","bimetalistele":"bimetalist","bimetalisti":"bimetalist","bimetalistii":"bimetalist","bimetalistul":"bimetalist","bimetalul":"bimetal","bimetalule":"bimetal","bimetalului":"bimetal","bimilenara":["bimilenară","bimilenar","bimilenara","bimilenar"],"bimilenare":"bimilenar","bimilenarele":"bimilenar","bimilenari":"bimilenar","bimilenarii":"bimilenar","bimilenarul":"bimilenar","bimilenii":"bimileniu","bimileniile":"bimileniu","bimileniilor":"bimileniu","bimileniul":"bimileniu","bimileniule":"bimileniu","bimileniului":"bimileniu","bimoleculara":["bimoleculară","bimolecular","bimoleculara","bimolecular"],"bimoleculare":"bimolecular","bimolecularele":"bimolecular","bimoleculari":"bimolecular","bimolecularii":"bimolecular","bimolecularul":"bimolecular","bimotoare":"bimotor","bimotoarea":"bimotor","bimotoarele":"bimotor","bimotoarelor":"bimotor","bimotori":"bimotor","bimotorii":"bimotor","bimotorul":"bimotor","bimotorule":"bimotor","bimotorului":"bimotor","bimpasei":"bimpașă","bimpasi":"bimpașă","bimpasii":"bimpașă","bimpasilor":"bimpașă","binagii":"binagiu","binagiii":"binagiu","binagiilor":"binagiu","binagiuul":"binagiu","binagiuule":"binagiu","binagiuului":"binagiu","binale":"bina","binalei":"bina","binalele":"bina","binalelor":"bina","binara":["binară","binar","binara","binar"],"binare":"binar","binarele":"binar","binari":"binar","binarii":"binar","binaritatea":"binaritate","binaritati":"binaritate","binaritatii":"binaritate","binarul":"binar","binaua":"bina","bindee":"bindeu","bindeele":"bindeu","bindeelor":"bindeu","bindeuul":"bindeu","bindeuule":"bindeu","bindeuului":"bindeu","bindisea":"bindisi","bindiseai":"bindisi","bindiseam":"bindisi","bindiseati":"bindisi","bindiseau":"bindisi","bindisesc":"bindisi","bindiseste":"bindisi","bindisesti":"bindisi","bindisii":"bindisi","bindisim":"bindisi","bindisind":"bindisi","bindisira":"bindisi","bindisiram":"bindisi","bindisirati":"bindisi","bindisise":"bindisi","bindisisem":"bindisi","bindisisera":"bindisi","bindisiseram":"bindisi","bindisiserati":"bindisi","bindisisesi":"bindisi","bindisisi":"bindisi","bindisit":"bindisi","bindisiti":"bindisi","bindul":"bind","bindule":"bind","bindului":"bind","binduri":"bind","bindurile":"bind","bindurilor":"bind","bine-nteles":"bineînțeles","binecrescuta":["binecrescută","binecrescut","binecrescuta","binecrescut"],"binecrescute":"binecrescut","binecrescutele":"binecrescut","binecrescuti":"binecrescut","binecrescutii":"binecrescut","binecrescutul":"binecrescut","binecuvantai":"binecuvânta","binecuvantam":["binecuvântăm","binecuvânta","binecuvântam","binecuvânta"],"binecuvantand":"binecuvânta","binecuvantara":"binecuvânta","binecuvantaram":"binecuvânta","binecuvantarati":"binecuvânta","binecuvantarea":"binecuvântare","binecuvantari":"binecuvântare","binecuvantarii":"binecuvântare","binecuvantarile":"binecuvântare","binecuvantarilor":"binecuvântare","binecuvantase":"binecuvânta","binecuvantasem":"binecuvânta","binecuvantasera":"binecuvânta","binecuvantaseram":"binecuvânta","binecuvantaserati":"binecuvânta","binecuvantasesi":"binecuvânta","binecuvantasi":"binecuvânta","binecuvantat":"binecuvânta","binecuvantata":["binecuvântată","binecuvântat","binecuvântata","binecuvântat"],"binecuvantate":"binecuvântat","binecuvantatele":"binecuvântat","binecuvantati":["binecuvântați","binecuvânta","binecuvântați","binecuvântat"],"binecuvantatii":"binecuvântat","binecuvantatul":"binecuvântat","binecuvantau":"binecuvânta","binecuvanteaza":"binecuvânta","binecuvantez":"binecuvânta","binecuvantezi":"binecuvânta","binecuventa":"binecuvânta","binecuventare":"binecuvântare","binecuvinta":"binecuvânta","binecuvintat":"binecuvântat","binefa":"bineface","binefac":"bineface","binefaca":"bineface","binefacand":"bineface","binefacatoare":"binefăcător","binefacatoarea":["binefăcătoarea","binefăcătoare","binefăcătoarea","binefăcător"],"binefacatoarei":"binefăcătoare","binefacatoarele":["binefăcătoarele","binefăcătoare","binefăcătoarele","binefăcător"],"binefacatoarelor":"binefăcătoare","binefacatori":"binefăcător","binefacatorii":"binefăcător","binefacatorilor":"binefăcător","binefacatorul":"binefăcător","binefacatorule":"binefăcător","binefacatorului":"binefăcător","binefacea":"bineface","binefaceai":"bineface","binefaceam":"bineface","binefaceati":"bineface","binefaceau":"bineface","binefacem":"bineface","binefacerea":"binefacere","binefaceri":"binefacere","binefacerii":"binefacere","binefacerile":"binefacere","binefacerilor":"binefacere","binefaceti":"bineface","binefaci":"bineface","binefacu":"bineface","binefacui":"bineface","binefacura":"bineface","binefacuram":"bineface","binefacurati":"bineface","binefacuse":"bineface","binefacusem":"bineface","binefacusera":"bineface","binefacuseram":"bineface","binefacuserati":"bineface","binefacusesi":"bineface","binefacusi":"bineface","binefacut":"bineface","binefapte":"binefaptă","binefaptei":"binefaptă","binefaptele":"binefaptă","binefaptelor":"binefaptă","binemerit":"binemerita","binemeritai":"binemerita","binemeritam":["binemerităm","binemerita","binemeritam","binemerita"],"binemeritand":"binemerita","binemeritara":"binemerita","binemeritaram":"binemerita","binemeritarati":"binemerita","binemeritase":"binemerita","binemeritasem":"binemerita","binemeritasera":"binemerita","binemeritaseram":"binemerita","binemeritaserati":"binemerita","binemeritasesi":"binemerita","binemeritasi":"binemerita","binemeritat":"binemerita","binemeritata":["binemeritată","binemeritat","binemeritata","binemeritat"],"binemeritate":"binemeritat","binemeritatele":"binemeritat","binemeritati":["binemeritați","binemerita","binemeritați","binemeritat"],"binemeritatii":"binemeritat","binemeritatul":"binemeritat","binemeritau":"binemerita","binemeriti":"binemerita","binetea":"binețe","binetei":"binețe","binevenita":["binevenită","binevenit","binevenita","binevenit"],"binevenite":"binevenit","binevenitele":"binevenit","bineveniti":"binevenit","binevenitii":"binevenit","binevenitul":"binevenit","binevestea":"binevesti","binevesteai":"binevesti","binevesteam":"binevesti","binevesteati":"binevesti","binevesteau":"binevesti","binevestesc":"binevesti","binevesteste":"binevesti","binevestesti":"binevesti","binevestii":"binevesti","binevestim":"binevesti","binevestind":"binevesti","binevestira":"binevesti","binevestiram":"binevesti","binevestirati":"binevesti","binevestise":"binevesti","binevestisem":"binevesti","binevestisera":"binevesti","binevestiseram":"binevesti","binevestiserati":"binevesti","binevestisesi":"binevesti","binevestisi":"binevesti","binevestit":"binevesti","binevestiti":"binevesti","binevestitoare":"binevestitor","binevestitoarea":"binevestitor","binevestitoarele":"binevestitor","binevestitori":"binevestitor","binevestitorii":"binevestitor","binevestitorul":"binevestitor","binevestitul":"binevestit","binevestitule":"binevestit","binevestitului":"binevestit","binevoia":"binevoi","binevoiai":"binevoi","binevoiam":"binevoi","binevoiati":"binevoi","binevoiau":"binevoi","binevoiesc":"binevoi","binevoieste":"binevoi","binevoiesti":"binevoi","binevoii":"binevoi","binevoim":"binevoi","binevoind":"binevoi","binevoira":"binevoi","binevoiram":"binevoi","binevoirati":"binevoi","binevoise":"binevoi","binevoisem":"binevoi","binevoisera":"binevoi","binevoiseram":"binevoi","binevoiserati":"binevoi","binevoisesi":"binevoi","binevoisi":"binevoi","binevoit":"binevoi","binevoiti":"binevoi","binevoitoare":"binevoitor","binevoitoarea":["binevoitoarea","binevoitoare","binevoitoarea","binevoitor"],"binevoitoarei":"binevoitoare","binevoitoarele":["binevoitoarele","binevoitoare","binevoitoarele","binevoitor"],"binevoitoarelor":"binevoitoare","binevoitori":"binevoitor","binevoitorii":"binevoitor","binevoitorilor":"binevoitor","binevoitorul":"binevoitor","binevoitorule":"binevoitor","binevoitorului":"binevoitor","binisele":"binișel","biniselele":"binișel","biniselelor":"binișel","biniselul":"binișel","biniselule":"binișel","biniselului":"binișel","binislii":"binișliu","binisliii":"binișliu","binisliilor":"binișliu","binisliuul":"binișliu","binisliuule":"binișliu","binisliuului":"binișliu","binisul":"biniș","binisule":"biniș","binisului":"biniș","binisuri":"biniș","binisurile":"biniș","binisurilor":"biniș","binoame":"binom","binoclai":"binocla","binoclam":["binoclăm","binocla","binoclam","binocla"],"binocland":"binocla","binoclara":"binocla","binoclaram":"binocla","binoclarati":"binocla","binoclase":"binocla","binoclasem":"binocla","binoclasera":"binocla","binoclaseram":"binocla","binoclaserati":"binocla","binoclasesi":"binocla","binoclasi":"binocla","binoclat":"binocla","binoclati":"binocla","binoclau":"binocla","binocleaza":"binocla","binoclez":"binocla","binoclezi":"binocla","binoclul":"binoclu","binoclule":"binoclu","binoclului":"binoclu","binocluri":"binoclu","binoclurile":"binoclu","binoclurilor":"binoclu","binoculara":["binoculară","binocular","binoculara","binocular"],"binoculare":"binocular","binocularele":"binocular","binoculari":"binocular","binocularii":"binocular","binocularul":"binocular","binomiala":["binomială","binomial","binomiala","binomial"],"binomiale":"binomial","binomialele":"binomial","binomiali":"binomial","binomialii":"binomial","binomialul":"binomial","binormale":"binormală","binormalei":"binormală","binormalele":"binormală","binormalelor":"binormală","bintatuia":"bintătui","bintatuiai":"bintătui","bintatuiam":"bintătui","bintatuiati":"bintătui","bintatuiau":"bintătui","bintatuiesc":"bintătui","bintatuieste":"bintătui","bintatuiesti":"bintătui","bintatuii":"bintătui","bintatuim":"bintătui","bintatuind":"bintătui","bintatuira":"bintătui","bintatuiram":"bintătui","bintatuirati":"bintătui","bintatuise":"bintătui","bintatuisem":"bintătui","bintatuisera":"bintătui","bintatuiseram":"bintătui","bintatuiserati":"bintătui","bintatuisesi":"bintătui","bintatuisi":"bintătui","bintatuit":"bintătui","bintatuiti":"bintătui","binte":"bintă","bintei":"bintă","bintele":"bintă","bintelor":"bintă","bintui":"bântui","bintuiala":"bântuială","bintuire":"bântuire","bintuit":"bântuit","bintuitor":"bântuitor","binzoi":"bânzoi","bioacumularea":"bioacumulare","bioacumulari":"bioacumulare","bioacumularii":"bioacumulare","bioacumularile":"bioacumulare","bioacumularilor":"bioacumulare","bioacustica":["bioacustică","bioacustic","bioacustica","bioacustic"],"bioacustice":"bioacustic","bioacusticele":"bioacustic","bioacustici":["bioacustici","bioacustic","bioacustici","bioacustică"],"bioacusticii":["bioacusticii","bioacustic","bioacusticii","bioacustică"],"bioacusticul":"bioacustic","bioamplificatoare":"bioamplificator","bioamplificatore":"bioamplificator","bioamplificatorele":"bioamplificator","bioamplificatorelor":"bioamplificator","bioamplificatorul":"bioamplificator","bioamplificatorule":"bioamplificator","bioamplificatorului":"bioamplificator","bioasa":["bioasă","bios","bioasa","bios"],"bioase":"bios","bioasele":"bios","bioastronautici":"bioastronautică","bioastronauticii":"bioastronautică","biobibliografia":"biobibliografie","biobibliografica":["biobibliografică","biobibliografic","biobibliografica","biobibliografic"],"biobibliografice":"biobibliografic","biobibliograficele":"biobibliografic","biobibliografici":"biobibliografic","biobibliograficii":"biobibliografic","biobibliograficul":"biobibliografic","biobibliografiei":"biobibliografie","biobibliografii":"biobibliografie","biobibliografiile":"biobibliografie","biobibliografiilor":"biobibliografie","biocatalizatori":"biocatalizator","biocatalizatorii":"biocatalizator","biocatalizatorilor":"biocatalizator","biocatalizatorul":"biocatalizator","biocatalizatorule":"biocatalizator","biocatalizatorului":"biocatalizator","biocenologia":"biocenologie","biocenologiei":"biocenologie","biocenologii":"biocenologie","biocenologiile":"biocenologie","biocenologiilor":"biocenologie","biocenotica":["biocenotică","biocenotic","biocenotica","biocenotic"],"biocenotice":"biocenotic","biocenoticele":"biocenotic","biocenotici":"biocenotic","biocenoticii":"biocenotic","biocenoticul":"biocenotic","biocenoze":"biocenoză","biocenozei":"biocenoză","biocenozele":"biocenoză","biocenozelor":"biocenoză","biochimia":"biochimie"};
@@ -0,0 +1 @@
+export default {"biochimica":["biochimică","biochimic","biochimica","biochimic"],"biochimice":"biochimic","biochimicele":"biochimic","biochimici":"biochimic","biochimicii":"biochimic","biochimicul":"biochimic","biochimiei":"biochimie","biochimii":"biochimie","biochimiste":"biochimistă","biochimistei":"biochimistă","biochimistele":"biochimistă","biochimistelor":"biochimistă","biochimisti":"biochimist","biochimistii":"biochimist","biochimistilor":"biochimist","biochimistul":"biochimist","biochimistule":"biochimist","biochimistului":"biochimist","biociberneti":"biocibernetic","biocibernetici":["biocibernetici","biocibernetic","biocibernetici","biocibernetică"],"biociberneticii":["biociberneticii","biocibernetic","biociberneticii","biocibernetică"],"biociberneticile":["biociberneticile","biocibernetic","biociberneticile","biocibernetică"],"biociberneticilor":["biociberneticilor","biocibernetic","biociberneticilor","biocibernetică"],"biocicluri":"biociclu","biociclurile":"biociclu","biociclurilor":"biociclu","biocicluul":"biociclu","biocicluule":"biociclu","biocicluului":"biociclu","biocineti":"biocinetic","biocinetici":["biocinetici","biocinetic","biocinetici","biocinetică"],"biocineticii":["biocineticii","biocinetic","biocineticii","biocinetică"],"biocineticile":["biocineticile","biocinetic","biocineticile","biocinetică"],"biocineticilor":["biocineticilor","biocinetic","biocineticilor","biocinetică"],"bioclimatica":["bioclimatică","bioclimatic","bioclimatica","bioclimatic"],"bioclimatice":"bioclimatic","bioclimaticele":"bioclimatic","bioclimatici":"bioclimatic","bioclimaticii":"bioclimatic","bioclimaticul":"bioclimatic","bioclimatologe":"bioclimatologă","bioclimatologei":"bioclimatologă","bioclimatologele":"bioclimatologă","bioclimatologelor":"bioclimatologă","bioclimatologi":"bioclimatolog","bioclimatologia":"bioclimatologie","bioclimatologiei":"bioclimatologie","bioclimatologii":["bioclimatologii","bioclimatolog","bioclimatologii","bioclimatologie"],"bioclimatologilor":"bioclimatolog","bioclimatologul":"bioclimatolog","bioclimatologule":"bioclimatolog","bioclimatologului":"bioclimatolog","biocombustibili":"biocombustibil","biocombustibilii":"biocombustibil","biocombustibililor":"biocombustibil","biocombustibilul":"biocombustibil","biocombustibilule":"biocombustibil","biocombustibilului":"biocombustibil","biocompatibila":["biocompatibilă","biocompatibil","biocompatibila","biocompatibil"],"biocompatibile":"biocompatibil","biocompatibilele":"biocompatibil","biocompatibili":"biocompatibil","biocompatibilii":"biocompatibil","biocompatibilul":"biocompatibil","biocomplexe":"biocomplex","biocomplexele":"biocomplex","biocomplexelor":"biocomplex","biocomplexul":"biocomplex","biocomplexule":"biocomplex","biocomplexului":"biocomplex","biocromul":"biocrom","biocromule":"biocrom","biocromului":"biocrom","biodegradabila":["biodegradabilă","biodegradabil","biodegradabila","biodegradabil"],"biodegradabile":"biodegradabil","biodegradabilele":"biodegradabil","biodegradabili":"biodegradabil","biodegradabilii":"biodegradabil","biodegradabilul":"biodegradabil","biodetectoare":"biodetector","biodetectoarele":"biodetector","biodetectoarelor":"biodetector","biodetectorul":"biodetector","biodetectorule":"biodetector","biodetectorului":"biodetector","biodeteriorarea":"biodeteriorare","biodeteriorari":"biodeteriorare","biodeteriorarii":"biodeteriorare","biodeteriorarile":"biodeteriorare","biodeteriorarilor":"biodeteriorare","biodinamica":["biodinamică","biodinamic","biodinamica","biodinamic"],"biodinamice":"biodinamic","biodinamicele":"biodinamic","biodinamici":["biodinamici","biodinamic","biodinamici","biodinamică"],"biodinamicii":["biodinamicii","biodinamic","biodinamicii","biodinamică"],"biodinamicile":"biodinamică","biodinamicilor":"biodinamică","biodinamicul":"biodinamic","biodiversitatea":"biodiversitate","biodiversitati":"biodiversitate","biodiversitatii":"biodiversitate","bioelectrica":["bioelectrică","bioelectric","bioelectrica","bioelectric"],"bioelectrice":"bioelectric","bioelectricele":"bioelectric","bioelectrici":"bioelectric","bioelectricii":"bioelectric","bioelectricitatea":"bioelectricitate","bioelectricitati":"bioelectricitate","bioelectricitatii":"bioelectricitate","bioelectricul":"bioelectric","bioelectronice":"bioelectronică","bioelectronicei":"bioelectronică","bioelemente":"bioelement","bioelementele":"bioelement","bioelementelor":"bioelement","bioelementul":"bioelement","bioelementule":"bioelement","bioelementului":"bioelement","bioenergetica":["bioenergetică","bioenergetic","bioenergetica","bioenergetic"],"bioenergetice":"bioenergetic","bioenergeticele":"bioenergetic","bioenergetici":["bioenergetici","bioenergetic","bioenergetici","bioenergetică"],"bioenergeticii":["bioenergeticii","bioenergetic","bioenergeticii","bioenergetică"],"bioenergeticile":"bioenergetică","bioenergeticilor":"bioenergetică","bioenergeticul":"bioenergetic","bioenergia":"bioenergie","bioenergiei":"bioenergie","bioenergii":"bioenergie","bioetici":"bioetică","bioeticii":"bioetică","biofila":["biofilă","biofil","biofila","biofil"],"biofile":"biofil","biofilele":"biofil","biofili":"biofil","biofilii":"biofil","biofiltre":"biofiltru","biofiltrele":"biofiltru","biofiltrelor":"biofiltru","biofiltrul":"biofiltru","biofiltrule":"biofiltru","biofiltrului":"biofiltru","biofilul":"biofil","biofizica":["biofizică","biofizic","biofizica","biofizic"],"biofizice":"biofizic","biofizicele":"biofizic","biofizici":["biofizici","biofizic","biofizici","biofizică"],"biofizicianul":"biofizician","biofizicianule":"biofizician","biofizicianului":"biofizician","biofiziciene":"biofiziciană","biofizicienei":"biofiziciană","biofizicienele":"biofiziciană","biofizicienelor":"biofiziciană","biofizicieni":"biofizician","biofizicienii":"biofizician","biofizicienilor":"biofizician","biofizicii":["biofizicii","biofizic","biofizicii","biofizică"],"biofizicul":"biofizic","biofotoni":"biofoton","biofotonii":"biofoton","biofotonilor":"biofoton","biofotonul":"biofoton","biofotonule":"biofoton","biofotonului":"biofoton","biogazul":"biogaz","biogazule":"biogaz","biogazului":"biogaz","biogena":["biogenă","biogen","biogena","biogen"],"biogene":"biogen","biogenele":"biogen","biogenetica":["biogenetică","biogenetic","biogenetica","biogenetic"],"biogenetice":"biogenetic","biogeneticele":"biogenetic","biogenetici":["biogenetici","biogenetic","biogenetici","biogenetică"],"biogeneticii":["biogeneticii","biogenetic","biogeneticii","biogenetică"],"biogeneticul":"biogenetic","biogeneze":"biogeneză","biogenezei":"biogeneză","biogenezele":"biogeneză","biogenezelor":"biogeneză","biogeni":"biogen","biogenia":"biogenie","biogeniei":"biogenie","biogenii":["biogenii","biogen","biogenii","biogenie"],"biogeniile":"biogenie","biogeniilor":"biogenie","biogenul":"biogen","biogeocenologia":"biogeocenologie","biogeocenologiei":"biogeocenologie","biogeocenologii":"biogeocenologie","biogeocenologiile":"biogeocenologie","biogeocenologiilor":"biogeocenologie","biogeochimia":"biogeochimie","biogeochimica":["biogeochimică","biogeochimic","biogeochimica","biogeochimic"],"biogeochimice":"biogeochimic","biogeochimicele":"biogeochimic","biogeochimici":"biogeochimic","biogeochimicii":"biogeochimic","biogeochimicul":"biogeochimic","biogeochimiei":"biogeochimie","biogeochimii":"biogeochimie","biogeochimiile":"biogeochimie","biogeochimiilor":"biogeochimie","biogeografe":"biogeografă","biogeografei":"biogeografă","biogeografele":"biogeografă","biogeografelor":"biogeografă","biogeografi":"biogeograf","biogeografia":"biogeografie","biogeografica":["biogeografică","biogeografic","biogeografica","biogeografic"],"biogeografice":"biogeografic","biogeograficele":"biogeografic","biogeografici":"biogeografic","biogeograficii":"biogeografic","biogeograficul":"biogeografic","biogeografiei":"biogeografie","biogeografii":["biogeografii","biogeograf","biogeografii","biogeografie"],"biogeografilor":"biogeograf","biogeograful":"biogeograf","biogeografule":"biogeograf","biogeografului":"biogeograf","bioglife":"bioglifă","bioglifei":"bioglifă","bioglifele":"bioglifă","bioglifelor":"bioglifă","biografe":"biografă","biografei":"biografă","biografele":"biografă","biografelor":"biografă","biografi":"biograf","biografia":"biografie","biografica":["biografică","biografic","biografica","biografic"],"biografice":"biografic","biograficele":"biografic","biografici":"biografic","biograficii":"biografic","biograficul":"biografic","biografiei":"biografie","biografii":["biografii","biograf","biografii","biografie"],"biografiile":"biografie","biografiilor":"biografie","biografilor":"biograf","biograful":"biograf","biografule":"biograf","biografului":"biograf","bioinformatici":"bioinformatică","bioinformaticii":"bioinformatică","bioinginere":"bioingineră","bioinginerei":"bioingineră","bioinginerele":"bioingineră","bioinginerelor":"bioingineră","bioingineri":"bioinginer","bioingineria":"bioinginerie","bioingineriei":"bioinginerie","bioinginerii":["bioinginerii","bioinginer","bioinginerii","bioinginerie"],"bioinginerilor":"bioinginer","bioinginerul":"bioinginer","bioinginerule":"bioinginer","bioinginerului":"bioinginer","biologe":"biologă","biologei":"biologă","biologele":"biologă","biologelor":"biologă","biologi":"biolog","biologia":"biologie","biologica":["biologică","biologic","biologica","biologic"],"biologice":"biologic","biologicele":"biologic","biologici":"biologic","biologicii":"biologic","biologicul":"biologic","biologiei":"biologie","biologii":["biologii","biolog","biologii","biologie"],"biologilor":"biolog","biologismul":"biologism","biologismule":"biologism","biologismului":"biologism","biologizanta":["biologizantă","biologizant","biologizanta","biologizant"],"biologizante":"biologizant","biologizantele":"biologizant","biologizanti":"biologizant","biologizantii":"biologizant","biologizantul":"biologizant","biologul":"biolog","biologule":"biolog","biologului":"biolog","bioluminescenta":["bioluminescentă","bioluminescent","bioluminescenta","bioluminescent"],"bioluminescente":["bioluminescente","bioluminescent","bioluminescențe","bioluminescență"],"bioluminescentei":"bioluminescență","bioluminescentele":"bioluminescent","bioluminescenti":"bioluminescent","bioluminescentii":"bioluminescent","bioluminescentul":"bioluminescent","bioluminiscenta":["bioluminiscentă","bioluminiscent","bioluminiscenta","bioluminiscent"],"bioluminiscente":["bioluminiscente","bioluminiscent","bioluminiscențe","bioluminiscență"],"bioluminiscentei":"bioluminiscență","bioluminiscentele":"bioluminiscent","bioluminiscenti":"bioluminiscent","bioluminiscentii":"bioluminiscent","bioluminiscentul":"bioluminiscent","biomagnetisme":"biomagnetism","biomagnetismele":"biomagnetism","biomagnetismelor":"biomagnetism","biomagnetismul":"biomagnetism","biomagnetismule":"biomagnetism","biomagnetismului":"biomagnetism","biomase":"biomasă","biomasei":"biomasă","biomasele":"biomasă","biomaselor":"biomasă","biomatematica":["biomatematică","biomatematic","biomatematica","biomatematic"],"biomatematice":["biomatematice","biomatematic","biomatematice","biomatematică"],"biomatematicei":"biomatematică","biomatematicele":["biomatematicele","biomatematic","biomatematicele","biomatematică"],"biomatematicelor":"biomatematică","biomatematici":"biomatematic","biomatematicianul":"biomatematician","biomatematicianule":"biomatematician","biomatematicianului":"biomatematician","biomatematiciene":"biomatematiciană","biomatematicienei":"biomatematiciană","biomatematicienele":"biomatematiciană","biomatematicienelor":"biomatematiciană","biomatematicieni":"biomatematician","biomatematicienii":"biomatematician","biomatematicienilor":"biomatematician","biomatematicii":"biomatematic","biomatematicul":"biomatematic","biomecanica":["biomecanică","biomecanic","biomecanica","biomecanic"],"biomecanice":["biomecanice","biomecanic","biomecanice","biomecanică"],"biomecanicei":"biomecanică","biomecanicele":["biomecanicele","biomecanic","biomecanicele","biomecanică"],"biomecanicelor":"biomecanică","biomecanici":"biomecanic","biomecanicii":"biomecanic","biomecanicul":"biomecanic","biomedicala":["biomedicală","biomedical","biomedicala","biomedical"],"biomedicale":"biomedical","biomedicalele":"biomedical","biomedicali":"biomedical","biomedicalii":"biomedical","biomedicalul":"biomedical","biomedicine":"biomedicină","biomedicinei":"biomedicină","biometanul":"biometan","biometanule":"biometan","biometanului":"biometan","biometeorologe":"biometeorologă","biometeorologei":"biometeorologă","biometeorologele":"biometeorologă","biometeorologelor":"biometeorologă","biometeorologi":"biometeorolog","biometeorologia":"biometeorologie","biometeorologica":["biometeorologică","biometeorologic","biometeorologica","biometeorologic"],"biometeorologice":"biometeorologic","biometeorologicele":"biometeorologic","biometeorologici":"biometeorologic","biometeorologicii":"biometeorologic","biometeorologicul":"biometeorologic","biometeorologiei":"biometeorologie","biometeorologii":["biometeorologii","biometeorolog","biometeorologii","biometeorologie"],"biometeorologilor":"biometeorolog","biometeorologul":"biometeorolog","biometeorologule":"biometeorolog","biometeorologului":"biometeorolog","biometria":"biometrie","biometriei":"biometrie","biometrii":"biometrie","biomicine":"biomicină","biomicinei":"biomicină","biomicinele":"biomicină","biomicinelor":"biomicină","biomicroscoape":"biomicroscop","biomicroscoapele":"biomicroscop","biomicroscoapelor":"biomicroscop","biomicroscopia":"biomicroscopie","biomicroscopiei":"biomicroscopie","biomicroscopii":"biomicroscopie","biomicroscopul":"biomicroscop","biomicroscopule":"biomicroscop","biomicroscopului":"biomicroscop","biomul":"biom","biomule":"biom","biomului":"biom","biomuri":"biom","biomurii":"biom","biomurilor":"biom","bionica":["bionică","bionic","bionica","bionic"],"bionice":["bionice","bionic","bionice","bionică"],"bionicei":"bionică","bionicele":["bionicele","bionic","bionicele","bionică"],"bionicelor":"bionică","bionici":"bionic","bionicii":"bionic","bionicul":"bionic","bioniste":"bionistă","bionistei":"bionistă","bionistele":"bionistă","bionistelor":"bionistă","bionomia":"bionomie","bionomiei":"bionomie","bionomii":"bionomie","bionomiile":"bionomie","bionomiilor":"bionomie","bioplasme":"bioplasmă","bioplasmei":"bioplasmă","bioplasmele":"bioplasmă","bioplasmelor":"bioplasmă","biopoieze":"biopoieză","biopoiezei":"biopoieză","biopoiezele":"biopoieză","biopoiezelor":"biopoieză","biopolitice":"biopolitică","biopoliticei":"biopolitică","biopoliticele":"biopolitică","biopoliticelor":"biopolitică","biopotentiale":"biopotențial","biopotentialele":"biopotențial","biopotentialelor":"biopotențial","biopotentialul":"biopotențial","biopotentialule":"biopotențial","biopotentialului":"biopotențial","biopsia":"biopsie","biopsica":["biopsică","biopsic","biopsica","biopsic"],"biopsice":"biopsic","biopsicele":"biopsic","biopsici":"biopsic","biopsicii":"biopsic","biopsicul":"biopsic","biopsiei":"biopsie","biopsii":"biopsie","biopsiile":"biopsie","biopsiilor":"biopsie","bioritmul":"bioritm","bioritmule":"bioritm","bioritmului":"bioritm","bioritmuri":"bioritm","bioritmurile":"bioritm","bioritmurilor":"bioritm","biosateliti":"biosatelit","biosatelitii":"biosatelit","biosatelitilor":"biosatelit","biosatelitul":"biosatelit","biosatelitule":"biosatelit","biosatelitului":"biosatelit","biosfere":"biosferă","biosferei":"biosferă","biosferele":"biosferă","biosferelor":"biosferă","biosi":"bios","biosii":"bios","biosimea":"biosime","biosimi":"biosime","biosimii":"biosime","biosinteze":"biosinteză","biosintezei":"biosinteză","biosintezele":"biosinteză","biosintezelor":"biosinteză","biosisteme":"biosistem","biosistemele":"biosistem","biosistemelor":"biosistem","biosistemul":"biosistem","biosistemule":"biosistem","biosistemului":"biosistem","biosociologia":"biosociologie","biosociologica":["biosociologică","biosociologic","biosociologica","biosociologic"],"biosociologice":"biosociologic","biosociologicele":"biosociologic","biosociologici":"biosociologic","biosociologicii":"biosociologic","biosociologicul":"biosociologic","biosociologiei":"biosociologie","biosociologii":"biosociologie","biospeologe":"biospeologă","biospeologei":"biospeologă","biospeologele":"biospeologă","biospeologelor":"biospeologă","biospeologi":"biospeolog","biospeologia":"biospeologie","biospeologica":["biospeologică","biospeologic","biospeologica","biospeologic"],"biospeologice":"biospeologic","biospeologicele":"biospeologic","biospeologici":"biospeologic","biospeologicii":"biospeologic","biospeologicul":"biospeologic","biospeologiei":"biospeologie","biospeologii":["biospeologii","biospeolog","biospeologii","biospeologie"],"biospeologilor":"biospeolog","biospeologul":"biospeolog","biospeologule":"biospeolog","biospeologului":"biospeolog","biostatistica":["biostatistică","biostatistic","biostatistica","biostatistic"],"biostatistice":"biostatistic","biostatisticele":"biostatistic","biostatistici":["biostatistici","biostatistic","biostatistici","biostatistică"],"biostatisticii":["biostatisticii","biostatistic","biostatisticii","biostatistică"],"biostatisticul":"biostatistic","biostazia":"biostazie","biostaziei":"biostazie","biostazii":"biostazie","biostiinte":"bioștiință","biostiintei":"bioștiință","biostiintele":"bioștiință","biostiintelor":"bioștiință","biostiinto":"bioștiință","biostimulai":"biostimula","biostimulam":["biostimulăm","biostimula","biostimulam","biostimula"],"biostimuland":"biostimula","biostimulara":"biostimula","biostimularam":"biostimula","biostimularati":"biostimula","biostimularea":"biostimulare","biostimulari":"biostimulare","biostimularii":"biostimulare","biostimularile":"biostimulare","biostimularilor":"biostimulare","biostimulase":"biostimula","biostimulasem":"biostimula","biostimulasera":"biostimula","biostimulaseram":"biostimula","biostimulaserati":"biostimula","biostimulasesi":"biostimula","biostimulasi":"biostimula","biostimulat":"biostimula","biostimulati":"biostimula","biostimulatori":"biostimulator","biostimulatoria":"biostimulatoriu","biostimulatorie":"biostimulatoriu","biostimulatorii":["biostimulatorii","biostimulator","biostimulatorii","biostimulatoriu"],"biostimulatoriii":"biostimulatoriu","biostimulatoriile":"biostimulatoriu","biostimulatorilor":"biostimulator","biostimulatoriul":"biostimulatoriu","biostimulatorul":"biostimulator","biostimulatorule":"biostimulator","biostimulatorului":"biostimulator","biostimulau":"biostimula","biostimuleaza":"biostimula","biostimulenti":"biostimulent","biostimulentii":"biostimulent","biostimulentilor":"biostimulent","biostimulentul":"biostimulent","biostimulentule":"biostimulent","biostimulentului":"biostimulent","biostimulez":"biostimula","biostimulezi":"biostimula","biostratigrafia":"biostratigrafie","biostratigrafiei":"biostratigrafie","biostratigrafii":"biostratigrafie","biostratigrafiile":"biostratigrafie","biostratigrafiilor":"biostratigrafie","biosul":"bios","biotaxia":"biotaxie","biotaxiei":"biotaxie","biotaxii":"biotaxie","biotaxiile":"biotaxie","biotaxiilor":"biotaxie","biotehnica":["biotehnică","biotehnic","biotehnica","biotehnic"],"biotehnice":["biotehnice","biotehnic","biotehnice","biotehnică"],"biotehnicei":"biotehnică","biotehnicele":["biotehnicele","biotehnic","biotehnicele","biotehnică"],"biotehnicelor":"biotehnică","biotehnici":"biotehnic","biotehnicianul":"biotehnician","biotehnicianule":"biotehnician","biotehnicianului":"biotehnician","biotehniciene":"biotehniciană","biotehnicienei":"biotehniciană","biotehnicienele":"biotehniciană","biotehnicienelor":"biotehniciană","biotehnicieni":"biotehnician","biotehnicienii":"biotehnician","biotehnicienilor":"biotehnician","biotehnicii":"biotehnic","biotehnicul":"biotehnic","biotehnologia":"biotehnologie","biotehnologiei":"biotehnologie","biotehnologii":"biotehnologie","biotehnologiile":"biotehnologie","biotehnologiilor":"biotehnologie","biotelemetria":"biotelemetrie","biotelemetrica":["biotelemetrică","biotelemetric","biotelemetrica","biotelemetric"],"biotelemetrice":"biotelemetric","biotelemetricele":"biotelemetric","biotelemetrici":"biotelemetric","biotelemetricii":"biotelemetric","biotelemetricul":"biotelemetric","biotelemetriei":"biotelemetrie","biotelemetrii":"biotelemetrie","bioterapia":"bioterapie","bioterapiei":"bioterapie","bioterapii":"bioterapie","bioti":"biot","biotica":["biotică","biotic","biotica","biotic"],"biotice":"biotic","bioticele":"biotic","biotici":"biotic","bioticii":"biotic","bioticul":"biotic","biotii":"biot","biotilor":"biot","biotine":"biotină","biotinei":"biotină","biotinele":"biotină","biotinelor":"biotină","biotipologia":"biotipologie","biotipologiei":"biotipologie","biotipologii":"biotipologie","biotipul":"biotip","biotipule":"biotip","biotipului":"biotip","biotipuri":"biotip","biotipurile":"biotip","biotipurilor":"biotip","biotite":"biotit","biotitele":"biotit","biotitelor":"biotit","biotitul":"biotit","biotitule":"biotit","biotitului":"biotit","biotopul":"biotop","biotopule":"biotop","biotopului":"biotop","biotopuri":"biotop","biotopurile":"biotop","biotopurilor":"biotop","biotul":"biot","biotule":"biot","biotului":"biot","biovulara":["biovulară","biovular","biovulara","biovular"],"biovulare":"biovular","biovularele":"biovular","biovulari":"biovular","biovularii":"biovular","biovularul":"biovular","biovulata":["biovulată","biovulat","biovulata","biovulat"],"biovulate":"biovulat","biovulatele":"biovulat","biovulati":"biovulat","biovulatii":"biovulat","biovulatul":"biovulat","bioxidul":"bioxid","bioxidule":"bioxid","bioxidului":"bioxid","bioxizi":"bioxid","bioxizii":"bioxid","bioxizilor":"bioxid","bipacul":"bipac","bipacule":"bipac","bipacului":"bipac","bipacuri":"bipac","bipacurile":"bipac","bipacurilor":"bipac","bipaia":"bipăi","bipaiai":"bipăi","bipaiam":"bipăi","bipaiati":"bipăi","bipaiau":"bipăi","bipaie":"bipăi","bipaii":"bipăi","bipaim":"bipăi","bipaind":"bipăi","bipaira":"bipăi","bipairam":"bipăi","bipairati":"bipăi","bipaise":"bipăi","bipaisem":"bipăi","bipaisera":"bipăi","bipaiseram":"bipăi","bipaiserati":"bipăi","bipaisesi":"bipăi","bipaisi":"bipăi","bipait":"bipăi","bipaiti":"bipăi","bipala":["bipală","bipal","bipala","bipal"],"bipale":"bipal","bipalele":"bipal","bipali":"bipal","bipalii":"bipal","bipalul":"bipal","bipartida":["bipartidă","bipartid","bipartida","bipartid"],"bipartide":"bipartid","bipartidele":"bipartid","bipartidul":"bipartid","bipartita":["bipartită","bipartit","bipartita","bipartit"],"bipartite":"bipartit","bipartitele":"bipartit","bipartiti":"bipartit","bipartitia":"bipartiție","bipartitiei":"bipartiție","bipartitii":["bipartiții","bipartit","bipartiții","bipartiție"],"bipartitiile":"bipartiție","bipartitiilor":"bipartiție","bipartitul":"bipartit","bipartizi":"bipartid","bipartizii":"bipartid","bipatrata":["bipătrată","bipătrat","bipătrata","bipătrat"],"bipatrate":"bipătrat","bipatratele":"bipătrat","bipatrati":"bipătrat","bipatratii":"bipătrat","bipatratul":"bipătrat","bipeda":["bipedă","biped","bipeda","biped"],"bipede":"biped","bipedele":"biped","bipedul":"biped","bipenata":["bipenată","bipenat","bipenata","bipenat"],"bipenate":"bipenat","bipenatele":"bipenat","bipenati":"bipenat","bipenatii":"bipenat","bipenatul":"bipenat","bipezi":"biped","bipezii":"biped","biplane":"biplan","biplanele":"biplan","biplanelor":"biplan","biplanul":"biplan","biplanule":"biplan","biplanului":"biplan","bipolara":["bipolară","bipolar","bipolara","bipolar"],"bipolare":"bipolar","bipolarele":"bipolar","bipolari":"bipolar","bipolarii":"bipolar","bipolaritatea":"bipolaritate","bipolaritati":"bipolaritate","bipolaritatii":"bipolaritate","bipolaritatile":"bipolaritate","bipolaritatilor":"bipolaritate","bipolarul":"bipolar","bipul":"bip","bipule":"bip","bipului":"bip","bipuri":"bip","bipurile":"bip","bipurilor":"bip","birai":"birău","biraiasi":"birăiaș","biraiasii":"birăiaș","biraiasilor":"birăiaș","biraiasul":"birăiaș","biraiasule":"birăiaș","biraiasului":"birăiaș","biraii":"birău","birailor":"birău","birari":"birar","biraria":"birărie","birariei":"birărie","birarii":["birarii","birar","birării","birărie"],"birariile":"birărie","birariilor":"birărie","birarilor":"birar","birarul":"birar","birarule":"birar","birarului":"birar","birauul":"birău","birauule":"birău","birauului":"birău","birborica":"Bârborică","bircea mare":"Bârcea Mare","bircea mica":"Bârcea Mică","birda":"Bârda","birdan":"bârdan","birdesti":"Bârdești","bire":"bir","bireactoare":"bireactor","bireactoarele":"bireactor","bireactoarelor":"bireactor","bireactorul":"bireactor","bireactorule":"bireactor","bireactorului":"bireactor","birefringenta":["birefringentă","birefringent","birefringenta","birefringent"],"birefringente":["birefringente","birefringent","birefringențe","birefringență"],"birefringentei":"birefringență","birefringentele":["birefringentele","birefringent","birefringențele","birefringență"],"birefringentelor":"birefringență","birefringenti":"birefringent","birefringentii":"birefringent","birefringentul":"birefringent","birele":"bir","birelor":"bir","bireme":"biremă","biremei":"biremă","biremele":"biremă","biremelor":"biremă","biresari":"bireșar","biresarii":"bireșar","biresarilor":"bireșar","biresarul":"bireșar","biresarule":"bireșar","biresarului":"bireșar","birfa":"bârfă","birfeala":"bârfeală","birfi":"bârfi","birfire":"bârfire","birfitoare":"bârfitoare","birfitor":"bârfitor","birfitura":"bârfitură","birgaoanu":"Bârgăoanu","birgauani":"Bârgăuani","birgauanu":"Bârgăuanu","birgina":"bârgină","birii":"bârâi","birinul":"birin","birinule":"birin","birinului":"birin","birinuri":"birin","birinurile":"birin","birinurilor":"birin","birisi":"biriș","birisii":"biriș","birisilor":"biriș","birisul":"biriș","birisule":"biriș","birisului":"biriș","birjareasca":["birjărească","birjăresc","birjăreasca","birjăresc"],"birjarescul":"birjăresc","birjaresti":"birjăresc","birjarestii":"birjăresc","birjarestile":"birjăresc","birjari":"birjar","birjaria":"birjărie","birjariei":"birjărie","birjarii":["birjarii","birjar","birjării","birjărie"],"birjariile":"birjărie","birjariilor":"birjărie","birjarilor":"birjar","birjarul":"birjar","birjarule":"birjar","birjarului":"birjar","birje":"birjă","birjea":"birje","birjei":"birjă","birjele":"birjă","birjelor":"birjă","birji":"birje","birjii":"birje","birjile":"birje","birjilor":"birje","birla":"Bârla","birlad":"Bârlad","birladean":"bârlădean","birladeana":"bârlădeană","birladeanca":"bârlădeancă","birladeanu":"Bârlădeanu","birladianu":"Bârlădianu","birlalesti":"Bârlălești","birlea":"Bârlea","birlescu":"Bârlescu","birlesti":"Bârlești","birlesti-catun":"Bârlești-Cătun","birlibas":"Bârlibaș","birlibasoaia":"Bârlibășoaia","birlicei":"birlicel","birliceii":"birlicel","birliceilor":"birlicel","birlicelul":"birlicel","birlicelule":"birlicel","birlicelului":"birlicel","birlici":"birlic","birlicii":"birlic","birlicilor":"birlic","birlicul":"birlic","birlicule":"birlic","birlicului":"birlic","birliga":"bârliga","birloc":"bârloc","birlog":["bîrlog","Bârlog","bîrlog","bârlog"],"birlogel":"bârlogel","birlogeni":"Bârlogeni","birlogu":"Bârlogu","birloi":"Bârloi","birlui":"Bârlui","birmana":["birmană","birman","birmana","birman"],"birmane":["birmane","birman","birmane","birmană"],"birmanei":"birmană","birmanele":["birmanele","birman","birmanele","birmană"],"birmanelor":"birmană","birmaneza":["birmaneză","birmanez","birmaneza","birmanez"],"birmaneze":["birmaneze","birmanez","birmaneze","birmaneză"],"birmanezei":"birmaneză","birmanezele":["birmanezele","birmanez","birmanezele","birmaneză"],"birmanezelor":"birmaneză","birmanezi":"birmanez","birmanezii":"birmanez","birmanezul":"birmanez","birmani":"birman","birmanii":"birman","birmanilor":"birman","birmanul":"birman","birmanule":"birman","birmanului":"birman","birna":["bîrna","Bârna","bîrnă","Bârnă","bîrnă","bârnă"],"birnacea":"bârnăcea","birnadu":"Bârnadu","birnet":"bârneț","birnice":"birnică","birnicei":"birnică","birnicele":"birnică","birnicelor":"birnică","birnici":"birnic","birnicii":"birnic","birnicilor":"birnic","birnicul":"birnic","birnicule":"birnic","birnicului":"birnic","birnoiu":"Bârnoiu","birnova":"Bârnova","birocrate":"birocrată","birocratei":"birocrată","birocratele":"birocrată","birocratelor":"birocrată","birocrati":"birocrat","birocratia":"birocrație","birocratica":["birocratică","birocratic","birocratica","birocratic"],"birocratice":"birocratic","birocraticele":"birocratic","birocratici":"birocratic","birocraticii":"birocratic","birocraticul":"birocratic","birocratiei":"birocrație","birocratii":["birocrații","birocrat","birocrații","birocrație"],"birocratiile":"birocrație","birocratiilor":"birocrație","birocratilor":"birocrat","birocratismul":"birocratism","birocratismule":"birocratism","birocratismului":"birocratism","birocratizai":"birocratiza","birocratizam":["birocratizăm","birocratiza","birocratizam","birocratiza"],"birocratizand":"birocratiza","birocratizara":"birocratiza","birocratizaram":"birocratiza","birocratizarati":"birocratiza","birocratizarea":"birocratizare","birocratizarei":"birocratizare","birocratizase":"birocratiza","birocratizasem":"birocratiza","birocratizasera":"birocratiza","birocratizaseram":"birocratiza","birocratizaserati":"birocratiza","birocratizasesi":"birocratiza","birocratizasi":"birocratiza","birocratizat":"birocratiza","birocratizata":["birocratizată","birocratizat","birocratizata","birocratizat"],"birocratizate":"birocratizat","birocratizatele":"birocratizat","birocratizati":["birocratizați","birocratiza","birocratizați","birocratizat"],"birocratizatii":"birocratizat","birocratizatul":"birocratizat","birocratizau":"birocratiza","birocratizeaza":"birocratiza","birocratizez":"birocratiza","birocratizezi":"birocratiza","birocratul":"birocrat","birocratule":"birocrat","birocratului":"birocrat","birotice":"birotică","biroticei":"birotică","biroul":"birou","biroule":"birou","biroului":"birou","birouri":"birou","birouri politice":"birou politic","birourile":"birou","birourilor":"birou","birsa":["bîrsa","Bârsa","bîrsă","bârsă"],"birsagaluia":"birșăgălui","birsagaluiai":"birșăgălui","birsagaluiam":"birșăgălui","birsagaluiati":"birșăgălui","birsagaluiau":"birșăgălui","birsagaluie":"birșăgălui","birsagaluii":"birșăgălui","birsagaluim":"birșăgălui","birsagaluind":"birșăgălui","birsagaluira":"birșăgălui","birsagaluiram":"birșăgălui","birsagaluirati":"birșăgălui","birsagaluise":"birșăgălui","birsagaluisem":"birșăgălui","birsagaluisera":"birșăgălui","birsagaluiseram":"birșăgălui","birsagaluiserati":"birșăgălui","birsagaluisesi":"birșăgălui","birsagaluisi":"birșăgălui","birsagaluit":"birșăgălui","birsagaluiti":"birșăgălui","birsagul":"birșag","birsagule":"birșag","birsagului":"birșag","birsaguri":"birșag","birsagurile":"birșag","birsagurilor":"birșag","birsan":"bârsan","birsana":"Bârsana","birsanescu":"Bârsănescu","birsanesti":"Bârsănești","birsasteanu":"Bârsășteanu","birsau":"Bârsău","birsau de jos":"Bârsău de Jos","birsau de sus":"Bârsău de Sus","birsau mare":"Bârsău Mare","birsauta":"Bârsăuța","birsescu":"Bârsescu","birsesti":"Bârsești","birsestii de jos":"Bârseștii de Jos","birsestii de sus":"Bârseștii de Sus","birsoiu":"Bârsoiu","birtasi":"birtaș","birtasii":"birtaș","birtasilor":"birtaș","birtasite":"birtășiță","birtasitei":"birtășiță","birtasitele":"birtășiță","birtasitelor":"birtășiță","birtasoaice":"birtășoaică","birtasoaicei":"birtășoaică","birtasoaicele":"birtășoaică","birtasoaicelor":"birtășoaică","birtasul":"birtaș","birtasule":"birtaș","birtasului":"birtaș","birte":"birtă","birtei":"birtă","birtele":"birtă","birtelor":"birtă","birtocasi":"birtocaș","birtocasii":"birtocaș","birtocasilor":"birtocaș","birtocasul":"birtocaș","birtocasule":"birtocaș","birtocasului":"birtocaș","birtocul":"birtoc","birtocule":"birtoc","birtocului":"birtoc","birtocuri":"birtoc","birtocurile":"birtoc","birtocurilor":"birtoc","birtul":"birt","birtule":"birt","birtului":"birt","birturi":"birt","birturile":"birt","birturilor":"birt","biruia":"birui","biruiai":"birui","biruiam":"birui","biruiati":"birui","biruiau":"birui","biruiesc":"birui","biruieste":"birui","biruiesti":"birui","biruii":"birui","biruim":"birui","biruind":"birui","biruinte":"biruință","biruintei":"biruință","biruintele":"biruință","biruintelor":"biruință","biruira":"birui","biruiram":"birui","biruirati":"birui","biruirea":"biruire","biruiri":"biruire","biruirii":"biruire","biruirile":"biruire","biruirilor":"biruire","biruise":"birui","biruisem":"birui","biruisera":"birui","biruiseram":"birui","biruiserati":"birui","biruisesi":"birui","biruisi":"birui","biruit":"birui","biruita":["biruită","biruit","biruita","biruit"],"biruite":"biruit","biruitele":"biruit","biruiti":["biruiți","birui","biruiți","biruit"],"biruitii":"biruit","biruitoare":"biruitor","biruitoarea":["biruitoarea","biruitoare","biruitoarea","biruitor"],"biruitoarei":"biruitoare","biruitoarele":["biruitoarele","biruitoare","biruitoarele","biruitor"],"biruitoarelor":"biruitoare","biruitori":"biruitor","biruitorii":"biruitor","biruitorilor":"biruitor","biruitorul":"biruitor","biruitorule":"biruitor","biruitorului":"biruitor","biruitul":"biruit","birul":"bir","birule":"bir","birului":"bir","biruri":"bir","birusce":"birușcă","biruscei":"birușcă","birz":"Bârz","birza":"Bârza","birzan":"Bârzan","birzava":"Bârzava","birzeiu":"Bârzeiu","birzeiu de gilort":"Bârzeiu de Gilort","birzescu":"Bârzescu","birzesti":"Bârzești","birzgan":"bârzgan","birzulesti":"Bârzulești","bisai":"bisa","bisam":["bisăm","bisa","bisam","bisa"],"bisand":"bisa","bisanuala":["bisanuală","bisanual","bisanuala","bisanual"],"bisanuale":"bisanual","bisanualele":"bisanual","bisanuali":"bisanual","bisanualii":"bisanual","bisanualul":"bisanual","bisaptamanala":["bisăptămânală","bisăptămânal","bisăptămânala","bisăptămânal"],"bisaptamanale":"bisăptămânal","bisaptamanalele":"bisăptămânal","bisaptamanali":"bisăptămânal","bisaptamanalii":"bisăptămânal","bisaptamanalul":"bisăptămânal","bisara":"bisa","bisaram":"bisa","bisarati":"bisa","bisase":"bisa","bisasem":"bisa","bisasera":"bisa","bisaseram":"bisa","bisaserati":"bisa","bisasesi":"bisa","bisasi":"bisa","bisat":"bisa","bisati":"bisa","bisau":"bisa","bisca chiojdului":"Bâsca Chiojdului","bisca mica":"Bâsca Mică","bisca rozilei":"Bâsca Rozilei","biscenii de jos":"Bâscenii de Jos","biscenii de sus":"Bâscenii de Sus","biscot":"biscuit","biscoveni":"Bâscoveni","biscuite":"biscuit","biscuiti":"biscuit","biscuitii":"biscuit","biscuitilor":"biscuit","biscuitul":"biscuit","biscuitule":"biscuit","biscuitului":"biscuit","bisculita":"Bâsculița","biseaza":"bisa","bisecta":["bisectă","bisect","bisecta","bisect"],"bisecte":"bisect","bisectele":"bisect","bisecti":"bisect","bisectii":"bisect","bisectoare":"bisector","bisectoarea":["bisectoarea","bisectoare","bisectoarea","bisector"],"bisectoarei":"bisectoare","bisectoarele":["bisectoarele","bisectoare","bisectoarele","bisector"],"bisectoarelor":"bisectoare","bisectori":"bisector","bisectorii":"bisector","bisectorul":"bisector","bisectul":"bisect","biseculara":["biseculară","bisecular","biseculara","bisecular"],"biseculare":"bisecular","bisecularele":"bisecular","biseculari":"bisecular","bisecularii":"bisecular","bisecularul":"bisecular","bisericeasca":["bisericească","bisericesc","bisericeasca","bisericesc"],"bisericescul":"bisericesc","bisericesti":"bisericesc","bisericestii":"bisericesc","bisericestile":"bisericesc","biserici":"biserică","biserici de stat":"biserică de stat","biserici parohiale":"biserică parohială","biserici pravoslavnice":"biserică pravoslavnică","bisericii":"biserică","bisericile":"biserică","bisericilor":"biserică","bisericoasa":["bisericoasă","bisericos","bisericoasa","bisericos"],"bisericoase":["bisericoase","bisericoasă","bisericoase","bisericos"],"bisericoasei":"bisericoasă","bisericoasele":["bisericoasele","bisericoasă","bisericoasele","bisericos"],"bisericoaselor":"bisericoasă","bisericosi":"bisericos","bisericosii":"bisericos","bisericosul":"bisericos","bisericute":"bisericuță","bisericutei":"bisericuță","bisericutele":"bisericuță","bisericutelor":"bisericuță","bisextila":["bisextilă","bisextil","bisextila","bisextil"],"bisextile":"bisextil","bisextilele":"bisextil","bisextili":"bisextil","bisextilii":"bisextil","bisextilul":"bisextil","bisexuala":["bisexuală","bisexual","bisexuala","bisexual"],"bisexuale":["bisexuale","bisexual","bisexuale","bisexuală"],"bisexualei":"bisexuală","bisexualele":["bisexualele","bisexual","bisexualele","bisexuală"],"bisexualelor":"bisexuală","bisexuali":"bisexual","bisexualii":"bisexual","bisexualilor":"bisexual","bisexualitatea":"bisexualitate","bisexualitati":"bisexualitate","bisexualitatii":"bisexualitate","bisexualul":"bisexual","bisexualule":"bisexual","bisexualului":"bisexual","bisexuata":["bisexuată","bisexuat","bisexuata","bisexuat"],"bisexuate":"bisexuat","bisexuatele":"bisexuat","bisexuati":"bisexuat","bisexuatii":"bisexuat","bisexuatul":"bisexuat","bisez":"bisa","bisezi":"bisa","bisilabica":["bisilabică","bisilabic","bisilabica","bisilabic"],"bisilabice":"bisilabic","bisilabicele":"bisilabic","bisilabici":"bisilabic","bisilabicii":"bisilabic","bisilabicul":"bisilabic","bisimetrica":["bisimetrică","bisimetric","bisimetrica","bisimetric"],"bisimetrice":"bisimetric","bisimetricele":"bisimetric","bisimetrici":"bisimetric","bisimetricii":"bisimetric","bisimetricul":"bisimetric","bismutati":"bismutat","bismutatii":"bismutat","bismutatilor":"bismutat","bismutatul":"bismutat","bismutatule":"bismutat","bismutatului":"bismutat","bismutili":"bismutil","bismutilii":"bismutil","bismutililor":"bismutil","bismutilul":"bismutil","bismutilule":"bismutil","bismutilului":"bismutil","bismutine":"bismutină","bismutinei":"bismutină","bismutinele":"bismutină","bismutinelor":"bismutină","bismutisme":"bismutism","bismutismele":"bismutism","bismutismelor":"bismutism","bismutismul":"bismutism","bismutismule":"bismutism","bismutismului":"bismutism","bismutite":"bismutit","bismutitele":"bismutit","bismutitelor":"bismutit","bismutitul":"bismutit","bismutitule":"bismutit","bismutitului":"bismutit","bismutul":"bismut","bismutule":"bismut","bismutului":"bismut","bisnitare":"bișnițară","bisnitarei":"bișnițară","bisnitarele":"bișnițară","bisnitarelor":"bișnițară","bisnitari":"bișnițar","bisnitarii":"bișnițar","bisnitarilor":"bișnițar","bisnitarul":"bișnițar","bisnitarule":"bișnițar","bisnitarului":"bișnițar","bisnite":"bișniță","bisnitei":"bișniță","bisnitele":"bișniță","bisnitelor":"bișniță","bistari":"biștar","bistarii":"biștar","bistarilor":"biștar","bistarul":"biștar","bistarule":"biștar","bistarului":"biștar","bistrita birgaului":"Bistrița Bârgăului","bistriteana":["bistrițeană","bistrițean","bistrițeana","bistrițean"],"bistriteanul":"bistrițean","bistriteanule":"bistrițean","bistriteanului":"bistrițean","bistritence":"bistrițeancă","bistritencei":"bistrițeancă","bistritencele":"bistrițeancă","bistritencelor":"bistrițeancă","bistritene":["bistrițene","bistrițean","bistrițene","bistrițeană"],"bistritenei":"bistrițeană","bistritenele":["bistrițenele","bistrițean","bistrițenele","bistrițeană"],"bistritenelor":"bistrițeană","bistriteni":"bistrițean","bistritenii":"bistrițean","bistritenilor":"bistrițean","bistroul":["bistroul","bistro","bistroul","bistrou"],"bistroule":["bistroule","bistro","bistroule","bistrou"],"bistroului":["bistroului","bistro","bistroului","bistrou"],"bistrouri":["bistrouri","bistro","bistrouri","bistrou"],"bistrourile":["bistrourile","bistro","bistrourile","bistrou"],"bistrourilor":["bistrourilor","bistro","bistrourilor","bistrou"],"bisturie":"bisturiu","bisturiele":"bisturiu","bisturielor":"bisturiu","bisturiul":"bisturiu","bisturiule":"bisturiu","bisturiului":"bisturiu","bisulca":["bisulcă","bisulc","bisulca","bisulc"],"bisulce":"bisulc","bisulcele":"bisulc","bisulci":"bisulc","bisulcii":"bisulc","bisulcul":"bisulc","bisulfati":"bisulfat","bisulfatii":"bisulfat","bisulfatilor":"bisulfat","bisulfatul":"bisulfat","bisulfatule":"bisulfat","bisulfatului":"bisulfat","bisulfiti":"bisulfit","bisulfitii":"bisulfit","bisulfitilor":"bisulfit","bisulfitul":"bisulfit","bisulfitule":"bisulfit","bisulfitului":"bisulfit","bisulfuri":"bisulfură","bisulfurii":"bisulfură","bisulfurile":"bisulfură","bisulfurilor":"bisulfură","bisuri":"bis","bit":"bât","bita":["bîtă","Bâtă","bîtă","bâtă","bîța","bâța"],"bitange":"bitangă","bitangei":"bitangă","bitangele":"bitangă","bitangelor":"bitangă","bitangi":"bitang","bitangii":"bitang","bitangilor":"bitang","bitangul":"bitang","bitangule":"bitang","bitangului":"bitang","bitcari":"Bâtcari","bitcoini":"bitcoin","bitcoinii":"bitcoin","bitcoinilor":"bitcoin","bitcoinul":"bitcoin","bitcoinule":"bitcoin","bitcoinului":"bitcoin","bitcuta":"bâtcuță","bitei":"biță","biterul":"biter","biterule":"biter","biterului":"biter","biti":"bit","bitic":"bâtic","bitica":"bâtică","biticea":"bâticea","biticel":"bâticel","biticuta":"bâticuță","bitii":["bîțîi","bâțâi","biții","bit"],"bitiiala":"bâțâială","bitilor":"bit","bitina-paminteni":"Bițina-Pământeni","bitlaga":"bâtlagă","bitlagel":"bâtlăgel","bitlan":["bîtlan","Bâtlan","bîtlan","bâtlan"],"bitlanas":"bâtlănaș","bitlani":"bîtlan","bitonalisme":"bitonalism","bitonalismele":"bitonalism","bitonalismelor":"bitonalism","bitonalismul":"bitonalism","bitonalismule":"bitonalism","bitonalismului":"bitonalism","bitonalitatati":"bitonalitate","bitonalitatatii":"bitonalitate","bitonalitatatile":"bitonalitate","bitonalitatatilor":"bitonalitate","bitonalitatea":"bitonalitate","bitul":"bit","bitule":"bit","bitului":"bit","bitumai":"bituma","bitumajul":"bitumaj","bitumajule":"bitumaj","bitumajului":"bitumaj","bitumam":["bitumăm","bituma","bitumam","bituma"],"bitumand":"bituma","bitumara":"bituma","bitumaram":"bituma","bitumarati":"bituma","bitumarea":"bitumare","bitumari":"bitumare","bitumarii":"bitumare","bitumarile":"bitumare","bitumarilor":"bitumare","bitumase":"bituma","bitumasem":"bituma","bitumasera":"bituma","bitumaseram":"bituma","bitumaserati":"bituma","bitumasesi":"bituma","bitumasi":"bituma","bitumat":"bituma","bitumati":"bituma","bitumau":"bituma","bitumeaza":"bituma","bitumenul":"bitumen","bitumenule":"bitumen","bitumenului":"bitumen","bitumez":"bituma","bitumezi":"bituma","bituminifera":["bituminiferă","bituminifer","bituminifera","bituminifer"],"bituminifere":"bituminifer","bituminiferele":"bituminifer","bituminiferi":"bituminifer","bituminiferii":"bituminifer","bituminiferul":"bituminifer","bituminizarea":"bituminizare","bituminizari":"bituminizare","bituminizarii":"bituminizare","bituminizarile":"bituminizare","bituminizarilor":"bituminizare","bituminoasa":["bituminoasă","bituminos","bituminoasa","bituminos"],"bituminoase":"bituminos","bituminoasele":"bituminos","bituminosi":"bituminos","bituminosii":"bituminos","bituminosul":"bituminos","bitumul":"bitum","bitumule":"bitum","bitumului":"bitum","bituta":"bâtuță","biunivoca":["biunivocă","biunivoc","biunivoca","biunivoc"],"biunivoce":"biunivoc","biunivocele":"biunivoc","biunivoci":"biunivoc","biunivocii":"biunivoc","biunivocitatati":"biunivocitate","biunivocitatatii":"biunivocitate","biunivocitatatile":"biunivocitate","biunivocitatatilor":"biunivocitate","biunivocitatea":"biunivocitate","biunivocul":"biunivoc","biurete":"biuretă","biuretei":"biuretă","biuretele":"biuretă","biuretelor":"biuretă","biurocratia":"biurocrație","biurocratica":["biurocratică","biurocratic","biurocratica","biurocratic"],"biurocratice":"biurocratic","biurocraticele":"biurocratic","biurocratici":"biurocratic","biurocraticii":"biurocratic","biurocraticul":"biurocratic","biurocratiei":"biurocrație","biurocratii":"biurocrație","biurocratiile":"biurocrație","biurocratiilor":"biurocrație","biurouri":"biurou","biurourile":"biurou","biurourilor":"biurou","biurouul":"biurou","biurouule":"biurou","biurouului":"biurou","bivalenta":["bivalentă","bivalent","bivalenta","bivalent"],"bivalente":["bivalente","bivalent","bivalențe","bivalență"],"bivalentei":"bivalență","bivalentele":["bivalentele","bivalent","bivalențele","bivalență"],"bivalentelor":"bivalență","bivalenti":"bivalent","bivalentii":"bivalent","bivalentul":"bivalent","bivalva":["bivalvă","bivalv","bivalva","bivalv"],"bivalve":"bivalv","bivalvele":"bivalv","bivalvi":"bivalv","bivalvii":"bivalv","bivalvul":"bivalv","bivolari":"bivolar","bivolaria":"bivolărie","bivolariei":"bivolărie","bivolarii":["bivolarii","bivolar","bivolării","bivolărie"],"bivolariile":"bivolărie","bivolariilor":"bivolărie","bivolarilor":"bivolar","bivolarul":"bivolar","bivolarule":"bivolar","bivolarului":"bivolar","bivolasi":"bivolaș","bivolasii":"bivolaș","bivolasilor":"bivolaș","bivolasul":"bivolaș","bivolasule":"bivolaș","bivolasului":"bivolaș","bivole":"bivolă","bivoleasca":["bivolească","bivolesc","bivoleasca","bivolesc"],"bivolei":"bivolă","bivolele":"bivolă","bivolelor":"bivolă","bivolescul":"bivolesc","bivolesti":"bivolesc","bivolestii":"bivolesc","bivolestile":"bivolesc","bivoli":"bivol","bivoli africani":"bivol african","bivoli indieni":"bivol indian","bivolii":"bivol","bivolilor":"bivol","bivolite":"bivoliță","bivolitei":"bivoliță","bivolitele":"bivoliță","bivolitelor":"bivoliță","bivoltina":["bivoltină","bivoltin","bivoltina","bivoltin"],"bivoltine":"bivoltin","bivoltinele":"bivoltin","bivoltini":"bivoltin","bivoltinii":"bivoltin","bivoltinul":"bivoltin","bivolul":"bivol","bivolule":"bivol","bivolului":"bivol","bivuacai":"bivuaca","bivuacam":["bivuacăm","bivuaca","bivuacam","bivuaca"],"bivuacand":"bivuaca","bivuacara":"bivuaca","bivuacaram":"bivuaca","bivuacarati":"bivuaca","bivuacase":"bivuaca","bivuacasem":"bivuaca","bivuacasera":"bivuaca","bivuacaseram":"bivuaca","bivuacaserati":"bivuaca","bivuacasesi":"bivuaca","bivuacasi":"bivuaca","bivuacat":"bivuaca","bivuacati":"bivuaca","bivuacau":"bivuaca","bivuacheaza":"bivuaca","bivuachez":"bivuaca","bivuachezi":"bivuaca","bivuacul":"bivuac","bivuacule":"bivuac","bivuacului":"bivuac","bivuacuri":"bivuac","bivuacurile":"bivuac","bivuacurilor":"bivuac","bixul":"bix","bixule":"bix","bixului":"bix","bixuri":"bix","bixurile":"bix","bixurilor":"bix","biz":"bâz","bizai":"bâzăi","bizami":"bizam","bizamii":"bizam","bizamilor":"bizam","bizamul":"bizam","bizamule":"bizam","bizamului":"bizam","bizantina":["bizantină","bizantin","bizantina","bizantin"],"bizantine":["bizantine","bizantin","bizantine","bizantină"],"bizantinei":"bizantină","bizantinele":["bizantinele","bizantin","bizantinele","bizantină"],"bizantinelor":"bizantină","bizantini":"bizantin","bizantinii":"bizantin","bizantinisme":"bizantinism","bizantinismele":"bizantinism","bizantinismelor":"bizantinism","bizantinismul":"bizantinism","bizantinismule":"bizantinism","bizantinismului":"bizantinism","bizantiniste":"bizantinistă","bizantinistei":"bizantinistă","bizantinistele":"bizantinistă","bizantinistelor":"bizantinistă","bizantinisti":"bizantinist","bizantinistice":"bizantinistică","bizantinisticei":"bizantinistică","bizantinistii":"bizantinist","bizantinistilor":"bizantinist","bizantinistul":"bizantinist","bizantinistule":"bizantinist","bizantinistului":"bizantinist","bizantinologe":"bizantinologă","bizantinologei":"bizantinologă","bizantinologele":"bizantinologă","bizantinologelor":"bizantinologă","bizantinologi":"bizantinolog","bizantinologia":"bizantinologie","bizantinologiei":"bizantinologie","bizantinologii":["bizantinologii","bizantinolog","bizantinologii","bizantinologie"],"bizantinologiile":"bizantinologie","bizantinologiilor":"bizantinologie","bizantinologilor":"bizantinolog","bizantinologul":"bizantinolog","bizantinologule":"bizantinolog","bizantinologului":"bizantinolog","bizantinul":"bizantin","bizantiu":"Bizanț","bizara":["bizară","bizar","bizara","bizar"],"bizare":"bizar","bizarele":"bizar","bizareria":"bizarerie","bizareriei":"bizarerie","bizarerii":"bizarerie","bizareriile":"bizarerie","bizareriilor":"bizarerie","bizari":"bizar","bizarii":"bizar","bizarul":"bizar","bizdic":["bîzdîc","Bâzdâc","bîzdîc","bâzdâc"],"bizdicos":"bâzdâcos","bizdiganie":"bâzdâganie","bizdigau":"bâzdâgău","bizdina":"Bâzdâna","bizii":"bâzâi","biziiala":"bâzâială","biziit":"bâzâit","biziitor":"bâzâitor","biziitura":"bâzâitură","bizoi":"bâzoi","bizoni":"bizon","bizoni americani":"bizon american","bizonii":"bizon","bizonilor":"bizon","bizonul":"bizon","bizonule":"bizon","bizonului":"bizon","bizouri":"bizou","bizourile":"bizou","bizourilor":"bizou","bizouul":"bizou","bizouule":"bizou","bizouului":"bizou","bizu":"bâzu","bizuia":"bizui","bizuiai":"bizui","bizuiam":"bizui","bizuiati":"bizui","bizuiau":"bizui","bizuie":"bizui","bizuieste":"bizui","bizuii":"bizui","bizuim":"bizui","bizuind":"bizui","bizuinte":"bizuință","bizuintei":"bizuință","bizuintele":"bizuință","bizuintelor":"bizuință","bizuira":"bizui","bizuiram":"bizui","bizuirati":"bizui","bizuirea":"bizuire","bizuiri":"bizuire","bizuirii":"bizuire","bizuirile":"bizuire","bizuirilor":"bizuire","bizuise":"bizui","bizuisem":"bizui","bizuisera":"bizui","bizuiseram":"bizui","bizuiserati":"bizui","bizuisesi":"bizui","bizuisi":"bizui","bizuit":"bizui","bizuiti":"bizui","bizunia":"bizunie","bizuniei":"bizunie","bizunii":"bizunie","bizuniile":"bizunie","bizuniilor":"bizunie","blade":"blâdă","bladei":"blâdă","bladele":"blâdă","bladelor":"blâdă","bladnica":["blâdnică","blâdnic","blâdnica","blâdnic"],"bladnice":"blâdnic","bladnicele":"blâdnic","bladnici":"blâdnic","bladnicii":"blâdnic","bladnicul":"blâdnic","blagaul":"blagă","blagaule":"blagă","blagaului":"blagă","blagoboreti":"blagoboreț","blagoboretii":"blagoboreț","blagoboretilor":"blagoboreț","blagoboretul":"blagoboreț","blagoboretule":"blagoboreț","blagoboretului":"blagoboreț","blagocestia":"blagocestie","blagocestiei":"blagocestie","blagocestii":"blagocestie","blagocestiile":"blagocestie","blagocestiilor":"blagocestie","blagocestiva":["blagocestivă","blagocestiv","blagocestiva","blagocestiv"],"blagocestive":"blagocestiv","blagocestivele":"blagocestiv","blagocestivi":"blagocestiv","blagocestivii":"blagocestiv","blagocestivul":"blagocestiv","blagodarea":"blagodari","blagodareai":"blagodari","blagodaream":"blagodari","blagodareati":"blagodari","blagodareau":"blagodari","blagodarenia":"blagodarenie","blagodareniei":"blagodarenie","blagodarenii":"blagodarenie","blagodareniile":"blagodarenie","blagodareniilor":"blagodarenie","blagodaresc":"blagodari","blagodareste":"blagodari","blagodaresti":"blagodari","blagodarii":"blagodari","blagodarim":"blagodari","blagodarind":"blagodari","blagodarira":"blagodari","blagodariram":"blagodari","blagodarirati":"blagodari","blagodarise":"blagodari","blagodarisem":"blagodari","blagodarisera":"blagodari","blagodariseram":"blagodari","blagodariserati":"blagodari","blagodarisesi":"blagodari","blagodarisi":"blagodari","blagodarit":"blagodari","blagodariti":"blagodari","blagoiavlenia":"blagoiavlenie","blagoiavleniei":"blagoiavlenie","blagoiavlenii":"blagoiavlenie","blagoiavleniile":"blagoiavlenie","blagoiavleniilor":"blagoiavlenie","blagonoseti":"blagonoseț","blagonosetii":"blagonoseț","blagonosetilor":"blagonoseț","blagonosetul":"blagonoseț","blagonosetule":"blagonoseț","blagonosetului":"blagonoseț","blagopriemnicul":"blagopriemnic","blagopriemnicule":"blagopriemnic","blagopriemnicului":"blagopriemnic","blagorecenia":"blagorecenie","blagoreceniei":"blagorecenie","blagorecenii":"blagorecenie","blagoreceniile":"blagorecenie","blagoreceniilor":"blagorecenie","blagorodnica":["blagorodnică","blagorodnic","blagorodnica","blagorodnic"],"blagorodnice":"blagorodnic","blagorodnicele":"blagorodnic","blagorodnici":"blagorodnic","blagorodnicia":"blagorodnicie","blagorodniciei":"blagorodnicie","blagorodnicii":["blagorodnicii","blagorodnic","blagorodnicii","blagorodnicie"],"blagorodniciile":"blagorodnicie","blagorodniciilor":"blagorodnicie","blagorodnicul":"blagorodnic","blagorojdenia":"blagorojdenie","blagorojdeniei":"blagorojdenie","blagorojdenii":"blagorojdenie","blagorojdeniile":"blagorojdenie","blagorojdeniilor":"blagorojdenie","blagoslovea":"blagoslovi","blagosloveai":"blagoslovi","blagosloveam":"blagoslovi","blagosloveati":"blagoslovi","blagosloveau":"blagoslovi","blagoslovenia":"blagoslovenie","blagosloveniei":"blagoslovenie","blagoslovenii":"blagoslovenie","blagosloveniile":"blagoslovenie","blagosloveniilor":"blagoslovenie","blagoslovesc":"blagoslovi","blagosloveste":"blagoslovi","blagoslovesti":"blagoslovi","blagoslovii":"blagoslovi","blagoslovim":"blagoslovi","blagoslovind":"blagoslovi","blagoslovira":"blagoslovi","blagosloviram":"blagoslovi","blagoslovirati":"blagoslovi","blagoslovirea":"blagoslovire","blagosloviri":"blagoslovire","blagoslovirii":"blagoslovire","blagoslovirile":"blagoslovire","blagoslovirilor":"blagoslovire","blagoslovise":"blagoslovi","blagoslovisem":"blagoslovi","blagoslovisera":"blagoslovi","blagosloviseram":"blagoslovi","blagosloviserati":"blagoslovi","blagoslovisesi":"blagoslovi","blagoslovisi":"blagoslovi","blagoslovit":"blagoslovi","blagoslovita":["blagoslovită","blagoslovit","blagoslovita","blagoslovit"],"blagoslovite":"blagoslovit","blagoslovitele":"blagoslovit","blagosloviti":["blagosloviți","blagoslovi","blagosloviți","blagoslovit"],"blagoslovitii":"blagoslovit","blagoslovitul":"blagoslovit","blagovestenia":["blagoveștenia","Blagoveștenie","blagoveștenia","blagoveștenie"],"blagovesteniei":["blagoveșteniei","Blagoveștenie","blagoveșteniei","blagoveștenie"],"blagovestenii":["blagoveștenii","Blagoveștenie","blagoveștenii","blagoveștenie"],"blagovesteniile":"blagoveștenie","blagovesteniilor":"blagoveștenie","blagovonia":"blagovonie","blagovoniei":"blagovonie","blagovonii":"blagovonie","blagovoniile":"blagovonie","blagovoniilor":"blagovonie","blaihuirea":"blaihuire","blaihuiri":"blaihuire","blaihuirii":"blaihuire","blaihuirile":"blaihuire","blaihuirilor":"blaihuire","blajeana":["blăjeană","blăjean","blăjeana","blăjean"],"blajeanul":"blăjean","blajeanule":"blăjean","blajeanului":"blăjean","blajence":"blăjeancă","blajencei":"blăjeancă","blajencele":"blăjeancă","blajencelor":"blăjeancă","blajene":"blăjean","blajenele":"blăjean","blajeni":"blăjean","blajenia":"blajenie","blajeniei":"blajenie","blajenii":["blăjenii","blăjean","blajenii","blajenie"],"blajeniile":"blajenie","blajeniilor":"blajenie","blajenilor":"blăjean","blajina":["blajină","blajin","blajina","blajin"],"blajinatatea":"blajinătate","blajinatati":"blajinătate","blajinatatii":"blajinătate","blajine":"blajin","blajinele":"blajin","blajini":"blajin","blajinia":"blajinie","blajiniei":"blajinie","blajinii":["blajinii","blajin","blajinii","blajinie"],"blajiniile":"blajinie","blajiniilor":"blajinie","blajinul":"blajin","blamabila":["blamabilă","blamabil","blamabila","blamabil"],"blamabile":"blamabil","blamabilele":"blamabil","blamabili":"blamabil","blamabilii":"blamabil","blamabilul":"blamabil","blamai":"blama","blamam":["blamăm","blama","blamam","blama"],"blamand":"blama","blamara":"blama","blamaram":"blama","blamarati":"blama","blamarea":"blamare","blamari":"blamare","blamarii":"blamare","blamarile":"blamare","blamarilor":"blamare","blamase":"blama","blamasem":"blama","blamasera":"blama","blamaseram":"blama","blamaserati":"blama","blamasesi":"blama","blamasi":"blama","blamat":"blama","blamata":["blamată","blamat","blamata","blamat"],"blamate":"blamat","blamatele":"blamat","blamati":["blamați","blama","blamați","blamat"],"blamatii":"blamat","blamatul":"blamat","blamau":"blama","blameaza":"blama","blamez":"blama","blamezi":"blama","blamul":"blam","blamule":"blam","blamului":"blam","blamuri":"blam","blamurile":"blam","blamurilor":"blam","blanarele":"blănăreală","blanarelei":"blănăreală","blanarelele":"blănăreală","blanarelelor":"blănăreală","blanareli":"blănăreală","blanarese":"blănăreasă","blanaresei":"blănăreasă","blanaresele":"blănăreasă","blanareselor":"blănăreasă","blanari":"blănar","blanaria":"blănărie","blanariei":"blănărie","blanarii":["blănarii","blănar","blănării","blănărie"],"blanariile":"blănărie","blanariilor":"blănărie","blanarilor":"blănar","blanarul":"blănar","blanarule":"blănar","blanarului":"blănar","blanchete":"blanchetă","blanchetei":"blanchetă","blanchetele":"blanchetă","blanchetelor":"blanchetă","blancul":"blanc","blancule":"blanc","blancului":"blanc","blancuri":"blanc","blancurile":"blanc","blancurilor":"blanc","blanda":["blândă","blând","blânda","blând"],"blanda ca un miel":"blând ca un miel","blande":["blânde","blând","blânde","blândă"],"blande ca niste miei":"blând ca un miel","blandei":"blândă","blandele":["blândele","blând","blândele","blândă"],"blandelor":"blândă","blandetea":"blândețe","blandeti":"blândețe","blandetii":"blândețe","blandisoara":["blândișoară","blândișor","blândișoara","blândișor"],"blandisoare":"blândișor","blandisoarele":"blândișor","blandisori":"blândișor","blandisorii":"blândișor","blandisorul":"blândișor","blandul":"blând","blandure":"blăndură","blandurei":"blăndură","blandurele":"blăndură","blandurelor":"blăndură","blane":"blană","blanea":"blăni","blaneai":"blăni","blaneam":"blăni","blaneati":"blăni","blaneau":"blăni","blanele":"blăneală","blanelei":"blăneală","blanelele":"blăneală","blanelelor":"blăneală","blaneli":"blăneală","blanesc":"blăni","blaneste":"blăni","blanesti":"blăni","blani":"blană","blanie":"blană","blaniei":"blană","blaniele":"blană","blanielor":"blană","blanii":"blăni","blanim":"blăni","blanind":"blăni","blanira":"blăni","blaniram":"blăni","blanirati":"blăni","blanise":"blăni","blanisem":"blăni","blanisera":"blăni","blaniseram":"blăni","blaniserati":"blăni","blanisesi":"blăni","blanisi":"blăni","blanisoare":"blănișoară","blanisoarei":"blănișoară","blanisoarele":"blănișoară","blanisoarelor":"blănișoară","blanit":"blăni","blanita":["blănită","blănit","blănita","blănit"],"blanite":["blănite","blănit","blănițe","blăniță"],"blanitei":"blăniță","blanitele":["blănitele","blănit","blănițele","blăniță"],"blanitelor":"blăniță","blaniti":["blăniți","blăni","blăniți","blănit"],"blanitii":"blănit","blanitul":"blănit","blanoasa":["blănoasă","blănos","blănoasa","blănos"],"blanoase":"blănos","blanoasele":"blănos","blanosi":"blănos","blanosii":"blănos","blanosul":"blănos","blanquisme":"blanquism","blanquismele":"blanquism","blanquismelor":"blanquism","blanquismul":"blanquism","blanquismule":"blanquism","blanquismului":"blanquism","blanquista":["blanquistă","blanquist","blanquista","blanquist"],"blanquiste":"blanquist","blanquistele":"blanquist","blanquisti":"blanquist","blanquistii":"blanquist","blanquistul":"blanquist","blanuia":"blănui","blanuiai":"blănui","blanuiam":"blănui","blanuiati":"blănui","blanuiau":"blănui","blanuiesc":"blănui","blanuieste":"blănui","blanuiesti":"blănui","blanuii":"blănui","blanuim":"blănui","blanuind":"blănui","blanuira":"blănui","blanuiram":"blănui","blanuirati":"blănui","blanuise":"blănui","blanuisem":"blănui","blanuisera":"blănui","blanuiseram":"blănui","blanuiserati":"blănui","blanuisesi":"blănui","blanuisi":"blănui","blanuit":"blănui","blanuiti":"blănui","blanuri":"blană","blanute":"blănuță","blanutei":"blănuță","blanutele":"blănuță","blanutelor":"blănuță","blanzi":"blând","blanzi ca niste miei":"blând ca un miel","blanzia":"blânzie","blanziei":"blânzie","blanzii":["blânzii","blând","blânzii","blânzie"],"blanziile":"blânzie","blanziilor":"blânzie","blasfem":"blasfema","blasfemai":"blasfema","blasfemam":["blasfemăm","blasfema","blasfemam","blasfema"],"blasfemand":"blasfema","blasfemara":"blasfema","blasfemaram":"blasfema","blasfemarati":"blasfema","blasfemase":"blasfema","blasfemasem":"blasfema","blasfemasera":"blasfema","blasfemaseram":"blasfema","blasfemaserati":"blasfema","blasfemasesi":"blasfema","blasfemasi":"blasfema","blasfemat":"blasfema","blasfemati":"blasfema","blasfematoarea":"blasfematoare","blasfematoarei":"blasfematoare","blasfematoarele":"blasfematoare","blasfematoarelor":"blasfematoare","blasfematori":"blasfemator","blasfematorii":"blasfemator","blasfematorilor":"blasfemator","blasfematorul":"blasfemator","blasfematorule":"blasfemator","blasfematorului":"blasfemator","blasfemau":"blasfema","blasfeme":"blasfema","blasfemi":"blasfema","blasfemia":"blasfemie","blasfemiei":"blasfemie","blasfemii":"blasfemie","blasfemiile":"blasfemie","blasfemiilor":"blasfemie","blastam":"blăstăma","blastamai":"blăstăma","blastamam":["blăstămăm","blăstăma","blăstămam","blăstăma"],"blastamand":"blăstăma","blastamara":"blăstăma","blastamaram":"blăstăma","blastamarati":"blăstăma","blastamase":"blăstăma","blastamasem":"blăstăma","blastamasera":"blăstăma","blastamaseram":"blăstăma","blastamaserati":"blăstăma","blastamasesi":"blăstăma","blastamasi":"blăstăma","blastamat":"blăstăma","blastamati":"blăstăma","blastamau":"blăstăma","blastame":"blăstăm","blastamele":"blăstăm","blastamelor":"blăstăm","blastami":"blăstăma","blastamul":"blăstăm","blastamule":"blăstăm","blastamului":"blăstăm","blastem":"blăstema","blastema":"blestema","blastemai":"blăstema","blastemam":["blăstemăm","blăstema","blăstemam","blăstema"],"blastemand":"blăstema","blastemara":"blăstema","blastemaram":"blăstema","blastemarati":"blăstema","blastemase":"blăstema","blastemasem":"blăstema","blastemasera":"blăstema","blastemaseram":"blăstema","blastemaserati":"blăstema","blastemasesi":"blăstema","blastemasi":"blăstema","blastemat":"blăstema","blastemati":"blăstema","blastemau":"blăstema","blasteme":"blastemă","blastemei":"blastemă","blastemele":"blastemă","blastemelor":"blastemă","blastemi":"blăstema","blastocele":"blastocel","blastocelele":"blastocel","blastocelelor":"blastocel","blastocelul":"blastocel","blastocelule":"blastocel","blastocelului":"blastocel","blastociste":"blastocist","blastocistele":"blastocist","blastocistelor":"blastocist","blastocistul":"blastocist","blastocistule":"blastocist","blastocistului":"blastocist","blastocite":"blastocit","blastocitele":"blastocit","blastocitelor":"blastocit","blastocitul":"blastocit","blastocitule":"blastocit","blastocitului":"blastocit","blastoderme":"blastoderm","blastodermele":"blastoderm","blastodermelor":"blastoderm","blastodermica":["blastodermică","blastodermic","blastodermica","blastodermic"],"blastodermice":"blastodermic","blastodermicele":"blastodermic","blastodermici":"blastodermic","blastodermicii":"blastodermic","blastodermicul":"blastodermic","blastodermul":"blastoderm","blastodermule":"blastoderm","blastodermului":"blastoderm","blastogeneze":"blastogeneză","blastogenezei":"blastogeneză","blastogenezele":"blastogeneză","blastogenezelor":"blastogeneză","blastomere":"blastomer","blastomerele":"blastomer","blastomerelor":"blastomer","blastomerul":"blastomer","blastomerule":"blastomer","blastomerului":"blastomer","blastomicoze":"blastomicoză","blastomicozei":"blastomicoză","blastomicozele":"blastomicoză","blastomicozelor":"blastomicoză","blastomul":"blastom","blastomule":"blastom","blastomului":"blastom","blastomuri":"blastom","blastomurile":"blastom","blastomurilor":"blastom","blastopori":"blastopor","blastoporii":"blastopor","blastoporilor":"blastopor","blastoporul":"blastopor","blastoporule":"blastopor","blastoporului":"blastopor","blastule":"blastulă","blastulei":"blastulă","blastulele":"blastulă","blastulelor":"blastulă","blatisti":"blatist","blatistii":"blatist","blatistilor":"blatist","blatistul":"blatist","blatistule":"blatist","blatistului":"blatist","blatul":"blat","blatule":"blat","blatului":"blat","blaturi":"blat","blaturile":"blat","blaturilor":"blat","blazai":"blaza","blazam":["blazăm","blaza","blazam","blaza"],"blazand":"blaza","blazara":"blaza","blazaram":"blaza","blazarati":"blaza","blazarea":"blazare","blazari":"blazare","blazarii":"blazare","blazase":"blaza","blazasem":"blaza","blazasera":"blaza","blazaseram":"blaza","blazaserati":"blaza","blazasesi":"blaza","blazasi":"blaza","blazat":"blaza","blazata":["blazată","blazat","blazata","blazat"],"blazate":"blazat","blazatele":"blazat","blazati":["blazați","blaza","blazați","blazat"],"blazatii":"blazat","blazatul":"blazat","blazau":"blaza","blazeaza":"blaza","blazere":"blazer","blazerele":"blazer","blazerelor":"blazer","blazerul":"blazer","blazerule":"blazer","blazerului":"blazer","blazez":"blaza","blazezi":"blaza","blazoane":"blazon","blazoanele":"blazon","blazoanelor":"blazon","blazonul":"blazon","blazonule":"blazon","blazonului":"blazon","bleaga":["bleagă","bleg","bleaga","bleg"],"bleahul":"bleah","bleahule":"bleah","bleahului":"bleah","bleahuri":"bleah","bleahurile":"bleah","bleahurilor":"bleah","bleascul":"bleasc"};
@@ -0,0 +1 @@
+export default {"bleascule":"bleasc","bleascului":"bleasc","bleascuri":"bleasc","bleascurile":"bleasc","bleascurilor":"bleasc","bleavul":"bleav","bleavule":"bleav","bleavului":"bleav","bleavuri":"bleav","bleavurile":"bleav","bleavurilor":"bleav","blefarite":"blefarită","blefaritei":"blefarită","blefaritele":"blefarită","blefaritelor":"blefarită","blefaroconjunctivite":"blefaroconjunctivită","blefaroconjunctivitei":"blefaroconjunctivită","blefaroconjunctivitele":"blefaroconjunctivită","blefaroconjunctivitelor":"blefaroconjunctivită","blefarofimoze":"blefarofimoză","blefarofimozei":"blefarofimoză","blefarofimozele":"blefarofimoză","blefarofimozelor":"blefarofimoză","blefaroplastia":"blefaroplastie","blefaroplastiei":"blefaroplastie","blefaroplastii":"blefaroplastie","blefaroplastiile":"blefaroplastie","blefaroplastiilor":"blefaroplastie","blefaroptoze":"blefaroptoză","blefaroptozei":"blefaroptoză","blefaroptozele":"blefaroptoză","blefaroptozelor":"blefaroptoză","blefarospasme":"blefarospasm","blefarospasmele":"blefarospasm","blefarospasmelor":"blefarospasm","blefarospasmul":"blefarospasm","blefarospasmule":"blefarospasm","blefarospasmului":"blefarospasm","blefarostatul":"blefarostat","blefarostatule":"blefarostat","blefarostatului":"blefarostat","blefarostaturi":"blefarostat","blefarostaturile":"blefarostat","blefarostaturilor":"blefarostat","blege":"bleg","blegele":"bleg","blegi":"bleg","blegii":"bleg","blegul":"bleg","blehairea":"blehăire","blehairi":"blehăire","blehairii":"blehăire","blehairile":"blehăire","blehairilor":"blehăire","bleharite":"blehariță","bleharitei":"blehariță","bleharitele":"blehariță","bleharitelor":"blehariță","blende":["blende","bleandă","blende","blendă"],"blendei":["blendei","bleandă","blendei","blendă"],"blendele":["blendele","bleandă","blendele","blendă"],"blendelor":["blendelor","bleandă","blendelor","blendă"],"blenoragia":"blenoragie","blenoragica":["blenoragică","blenoragic","blenoragica","blenoragic"],"blenoragice":"blenoragic","blenoragicele":"blenoragic","blenoragici":"blenoragic","blenoragicii":"blenoragic","blenoragicul":"blenoragic","blenoragiei":"blenoragie","blenoragii":"blenoragie","blenoragiile":"blenoragie","blenoragiilor":"blenoragie","blenoreea":"blenoree","blenoreei":"blenoree","blenoreele":"blenoree","blenoreelor":"blenoree","bleoazge":"bleoazgă","bleoazgei":"bleoazgă","bleojdirea":"bleojdire","bleojdiri":"bleojdire","bleojdirii":"bleojdire","bleojdirile":"bleojdire","bleojdirilor":"bleojdire","bleorcot":"bleorcoti","bleorcote":"bleorcoti","bleorcotea":"bleorcoti","bleorcoteai":"bleorcoti","bleorcoteam":"bleorcoti","bleorcoteati":"bleorcoti","bleorcoteau":"bleorcoti","bleorcotele":"bleorcoteală","bleorcotelei":"bleorcoteală","bleorcotelele":"bleorcoteală","bleorcotelelor":"bleorcoteală","bleorcoteli":"bleorcoteală","bleorcotie":"bleorcoti","bleorcotii":"bleorcoti","bleorcotim":"bleorcoti","bleorcotind":"bleorcoti","bleorcotira":"bleorcoti","bleorcotiram":"bleorcoti","bleorcotirati":"bleorcoti","bleorcotise":"bleorcoti","bleorcotisem":"bleorcoti","bleorcotisera":"bleorcoti","bleorcotiseram":"bleorcoti","bleorcotiserati":"bleorcoti","bleorcotisesi":"bleorcoti","bleorcotisi":"bleorcoti","bleorcotit":"bleorcoti","bleorcotiti":"bleorcoti","bleota":["bleotă","bleot","bleota","bleot"],"bleote":"bleot","bleotele":"bleot","bleoti":"bleot","bleotia":"bleoție","bleotiei":"bleoție","bleotii":["bleoții","bleot","bleoții","bleoție"],"bleotiile":"bleoție","bleotiilor":"bleoție","bleotocarele":"bleotocăreală","bleotocarelei":"bleotocăreală","bleotocarelele":"bleotocăreală","bleotocarelelor":"bleotocăreală","bleotocareli":"bleotocăreală","bleotul":"bleot","blescairea":"blescăire","blescairi":"blescăire","blescairii":"blescăire","blescairile":"blescăire","blescairilor":"blescăire","blescute":"bleșcuță","blescutei":"bleșcuță","blescutele":"bleșcuță","blescutelor":"bleșcuță","blestem":"blestema","blestemaciunea":"blestemăciune","blestemaciuni":"blestemăciune","blestemaciunii":"blestemăciune","blestemaciunile":"blestemăciune","blestemaciunilor":"blestemăciune","blestemai":"blestema","blestemam":["blestemăm","blestema","blestemam","blestema"],"blestemand":"blestema","blestemara":"blestema","blestemaram":"blestema","blestemarati":"blestema","blestemarea":"blestemare","blestemari":"blestemare","blestemarii":"blestemare","blestemarile":"blestemare","blestemarilor":"blestemare","blestemase":"blestema","blestemasem":"blestema","blestemasera":"blestema","blestemaseram":"blestema","blestemaserati":"blestema","blestemasesi":"blestema","blestemasi":"blestema","blestemat":"blestema","blestemata":["blestemată","blestemat","blestemata","blestemat"],"blestemate":"blestemat","blestemateasca":["blestemățească","blestemățesc","blestemățeasca","blestemățesc"],"blestematele":"blestemat","blestematescul":"blestemățesc","blestematesti":"blestemățesc","blestematestii":"blestemățesc","blestematestile":"blestemățesc","blestemati":["blestemați","blestema","blestemați","blestemat"],"blestematia":"blestemăție","blestematiei":"blestemăție","blestematii":["blestemații","blestemat","blestemății","blestemăție"],"blestematiile":"blestemăție","blestematiilor":"blestemăție","blestematul":"blestemat","blestemau":"blestema","blesteme":["blesteme","blestem","blesteme","blestema"],"blestemele":"blestem","blestemelor":"blestem","blestemi":"blestema","blestemul":"blestem","blestemule":"blestem","blestemului":"blestem","bleu-ul":"bleu","bleu-ule":"bleu","bleu-ului":"bleu","bleu-uri":"bleu","bleu-urile":"bleu","bleu-urilor":"bleu","bleumarinul":"bleumarin","bleumarinule":"bleumarin","bleumarinului":"bleumarin","blida":"blâdă","blidari":"blidar","blidarii":"blidar","blidarilor":"blidar","blidarul":"blidar","blidarule":"blidar","blidarului":"blidar","blidaruse":"blidăruș","blidarusele":"blidăruș","blidaruselor":"blidăruș","blidarusul":"blidăruș","blidarusule":"blidăruș","blidarusului":"blidăruș","blide":"blid","blidele":"blid","blidelor":"blid","blidisele":"blidișel","blidiselele":"blidișel","blidiselelor":"blidișel","blidiselul":"blidișel","blidiselule":"blidișel","blidiselului":"blidișel","blidnic":"blâdnic","blidul":"blid","blidule":"blid","blidului":"blid","blidute":"bliduț","blidutele":"bliduț","blidutelor":"bliduț","blidutul":"bliduț","blidutule":"bliduț","blidutului":"bliduț","blimpul":"blimp","blimpule":"blimp","blimpului":"blimp","blimpuri":"blimp","blimpurile":"blimp","blimpurilor":"blimp","blind":"blând","blinda":"blândă","blindai":"blinda","blindaje":"blindaj","blindajele":"blindaj","blindajelor":"blindaj","blindajul":"blindaj","blindajule":"blindaj","blindajului":"blindaj","blindam":["blindăm","blinda","blindam","blinda"],"blindand":"blinda","blindara":"blinda","blindaram":"blinda","blindarati":"blinda","blindarea":"blindare","blindari":"blindare","blindarii":"blindare","blindarile":"blindare","blindarilor":"blindare","blindase":"blinda","blindasem":"blinda","blindasera":"blinda","blindaseram":"blinda","blindaserati":"blinda","blindasesi":"blinda","blindasi":"blinda","blindat":"blinda","blindata":["blindată","blindat","blindata","blindat"],"blindate":"blindat","blindatele":"blindat","blindati":["blindați","blinda","blindați","blindat"],"blindatii":"blindat","blindatul":"blindat","blindau":"blinda","blindeaza":"blinda","blindesti":"Blândești","blindete":"blândețe","blindez":"blinda","blindezi":"blinda","blindisor":"blândișor","blindu":"Blându","blinia":"blinie","bliniei":"blinie","blinii":"blinie","bliniile":"blinie","bliniilor":"blinie","blinzi":"Blânzi","blinzie":"blânzie","blistere":"blister","blisterele":"blister","blisterelor":"blister","blisterul":"blister","blisterule":"blister","blisterului":"blister","blitul":"bliț","blitule":"bliț","blitului":"bliț","blituri":"bliț","bliturile":"bliț","bliturilor":"bliț","blitzkriegul":"blitzkrieg","blitzkriegule":"blitzkrieg","blitzkriegului":"blitzkrieg","blocade":"blocadă","blocadei":"blocadă","blocadele":"blocadă","blocadelor":"blocadă","blocai":"bloca","blocaje":"blocaj","blocajele":"blocaj","blocajelor":"blocaj","blocajul":"blocaj","blocajule":"blocaj","blocajului":"blocaj","blocam":["blocăm","bloca","blocam","bloca"],"blocand":"bloca","blocara":"bloca","blocaram":"bloca","blocarati":"bloca","blocarea":"blocare","blocari":"blocare","blocarii":"blocare","blocarile":"blocare","blocarilor":"blocare","blocase":"bloca","blocasem":"bloca","blocasera":"bloca","blocaseram":"bloca","blocaserati":"bloca","blocasesi":"bloca","blocasi":"bloca","blocat":"bloca","blocati":"bloca","blocatul":"blocat","blocatule":"blocat","blocatului":"blocat","blocaturi":"blocat","blocaturile":"blocat","blocaturilor":"blocat","blocau":"bloca","blocdiagrame":"blocdiagramă","blocdiagramei":"blocdiagramă","blocdiagramele":"blocdiagramă","blocdiagramelor":"blocdiagramă","blochausul":"blochaus","blochausule":"blochaus","blochausului":"blochaus","blochausuri":"blochaus","blochausurile":"blochaus","blochausurilor":"blochaus","blocheaza":"bloca","blochez":"bloca","blochezi":"bloca","blocnotesul":"blocnotes","blocnotesule":"blocnotes","blocnotesului":"blocnotes","blocnotesuri":"blocnotes","blocnotesurile":"blocnotes","blocnotesurilor":"blocnotes","blocul":"bloc","blocule":"bloc","blocului":"bloc","blocuri":"bloc","blocurile":"bloc","blocurilor":"bloc","blocusul":"blocus","blocusule":"blocus","blocusului":"blocus","blocusuri":"blocus","blocusurile":"blocus","blocusurilor":"blocus","blodaria":"blodărie","blodariei":"blodărie","blodarii":"blodărie","blodogorea":"blodogori","blodogoreai":"blodogori","blodogoream":"blodogori","blodogoreati":"blodogori","blodogoreau":"blodogori","blodogoresc":"blodogori","blodogoreste":"blodogori","blodogoresti":"blodogori","blodogorii":"blodogori","blodogorim":"blodogori","blodogorind":"blodogori","blodogorira":"blodogori","blodogoriram":"blodogori","blodogorirati":"blodogori","blodogorise":"blodogori","blodogorisem":"blodogori","blodogorisera":"blodogori","blodogoriseram":"blodogori","blodogoriserati":"blodogori","blodogorisesi":"blodogori","blodogorisi":"blodogori","blodogorit":"blodogori","blodogoriti":"blodogori","bloggeri":"blogger","bloggerii":"blogger","bloggerilor":"blogger","bloggerul":"blogger","bloggerule":"blogger","bloggerului":"blogger","blojarituri":"blojăritură","blojariturii":"blojăritură","blojariturile":"blojăritură","blojariturilor":"blojăritură","blojeritori":"blojeritor","blojeritorii":"blojeritor","blojeritorilor":"blojeritor","blojeritorul":"blojeritor","blojeritorule":"blojeritor","blojeritorului":"blojeritor","blojituri":"blojitură","blojiturii":"blojitură","blojiturile":"blojitură","blojiturilor":"blojitură","blonciul":"blonci","blonciule":"blonci","blonciului":"blonci","blonciuri":"blonci","blonciurile":"blonci","blonciurilor":"blonci","blonda":["blondă","blond","blonda","blond"],"blonde":["blonde","blond","blonde","blondă"],"blondei":"blondă","blondele":["blondele","blond","blondele","blondă"],"blondelor":"blondă","blondetea":"blondețe","blondeti":"blondețe","blondetii":"blondețe","blondina":["blondină","blondin","blondina","blondin"],"blondine":["blondine","blondin","blondine","blondină"],"blondinei":"blondină","blondinele":["blondinele","blondin","blondinele","blondină"],"blondinelor":"blondină","blondini":"blondin","blondinii":"blondin","blondinul":"blondin","blondul":"blond","blonzea":"blonzi","blonzeai":"blonzi","blonzeam":"blonzi","blonzeati":"blonzi","blonzeau":"blonzi","blonzesc":"blonzi","blonzeste":"blonzi","blonzesti":"blonzi","blonzi":"blond","blonzia":"blonziu","blonzie":"blonziu","blonzii":["blonzii","blond","blonzii","blonzi","blonzii","blonziu"],"blonziii":"blonziu","blonziile":"blonziu","blonzim":"blonzi","blonzind":"blonzi","blonzira":"blonzi","blonziram":"blonzi","blonzirati":"blonzi","blonzise":"blonzi","blonzisem":"blonzi","blonzisera":"blonzi","blonziseram":"blonzi","blonziserati":"blonzi","blonzisesi":"blonzi","blonzisi":"blonzi","blonzit":"blonzi","blonziti":"blonzi","blonziul":"blonziu","bluci":"blucă","blucii":"blucă","blucile":"blucă","blucilor":"blucă","bluejeansul":"bluejeans","bluejeansule":"bluejeans","bluejeansului":"bluejeans","bluesul":"blues","bluesule":"blues","bluesului":"blues","bluesuri":"blues","bluesurile":"blues","bluesurilor":"blues","blufful":"bluff","bluffule":"bluff","bluffului":"bluff","bluffuri":"bluff","bluffurile":"bluff","bluffurilor":"bluff","bluful":"bluf","blufule":"bluf","blufului":"bluf","blufuri":"bluf","blufurile":"bluf","blufurilor":"bluf","blug":"blugi","blugii":"blugi","blugilor":"blugi","blumul":"blum","blumule":"blum","blumului":"blum","blumuri":"blum","blumurile":"blum","blumurilor":"blum","bluzari":"bluzar","bluzarii":"bluzar","bluzarilor":"bluzar","bluzarul":"bluzar","bluzarule":"bluzar","bluzarului":"bluzar","bluze":"bluză","bluzei":"bluză","bluzele":"bluză","bluzelor":"bluză","bluzite":"bluziță","bluzitei":"bluziță","bluzitele":"bluziță","bluzitelor":"bluziță","bluzoane":"bluzon","bluzoanele":"bluzon","bluzoanelor":"bluzon","bluzonul":"bluzon","bluzonule":"bluzon","bluzonului":"bluzon","bluzulite":"bluzuliță","bluzulitei":"bluzuliță","bluzulitele":"bluzuliță","bluzulitelor":"bluzuliță","boababi":"boabab","boababii":"boabab","boababilor":"boabab","boababul":"boabab","boababule":"boabab","boababului":"boabab","boabe":["boabe","boabă","boabe","bob"],"boabei":"boabă","boabele":["boabele","boabă","boabele","bob"],"boabelor":["boabelor","boabă","boabelor","bob"],"boacane":"boacănă","boacanei":"boacănă","boacanele":"boacănă","boacanelor":"boacănă","boace":"boacă","boacei":"boacă","boacele":"boacă","boacelor":"boacă","boactari":"boactăr","boactarii":"boactăr","boactarilor":"boactăr","boactarul":"boactăr","boactarule":"boactăr","boactarului":"boactăr","boacteri":"boacter","boacterii":"boacter","boacterilor":"boacter","boacterul":"boacter","boacterule":"boacter","boacterului":"boacter","boaite":"boaită","boaitei":"boaită","boaitele":"boaită","boaitelor":"boaită","boalte":"boaltă","boaltei":"boaltă","boaltele":"boaltă","boaltelor":"boaltă","boambe":"boambă","boambei":"boambă","boambele":"boambă","boambelor":"boambă","boanghine":"boanghină","boanghinei":"boanghină","boanghinele":"boanghină","boanghinelor":"boanghină","boanta":["boantă","bont","boanta","bont"],"boante":"bont","boantele":"bont","boardul":"board","boardule":"board","boardului":"board","boarduri":"board","boardurile":"board","boardurilor":"board","boarea":"boare","boarei":"boare","boarfe":"boarfă","boari":"boar","boarii":"boar","boarilor":"boar","boarte":"boarță","boartei":"boarță","boartele":"boarță","boartelor":"boarță","boarul":"boar","boarule":"boar","boarului":"boar","boasa":"boș","boase":["boașe","boașă","boașe","boș"],"boasei":"boașă","boasele":["boașele","boașă","boașele","boș"],"boaselor":["boașelor","boașă","boașelor","boș"],"boate":["boate","boată","boațe","boață"],"boatei":["boatei","boată","boaței","boață"],"boatele":["boatele","boată","boațele","boață"],"boatelor":["boatelor","boată","boațelor","boață"],"boaul":"boa","boaule":"boa","boaului":"boa","bobaice":"bobaică","bobaicei":"bobaică","bobaicele":"bobaică","bobaicelor":"bobaică","bobaici":"bobaică","bobale":"bobală","bobalei":"bobală","bobalele":"bobală","bobalelor":"bobală","bobarnace":"bobârnac","bobarnacele":"bobârnac","bobarnacelor":"bobârnac","bobarnacul":"bobârnac","bobarnacule":"bobârnac","bobarnacului":"bobârnac","bobeici":"bobeică","bobeicii":"bobeică","bobeicile":"bobeică","bobeicilor":"bobeică","boberi":"bober","boberii":"bober","boberilor":"bober","boberul":"bober","boberule":"bober","boberului":"bober","bobicute":"bobicuță","bobicutei":"bobicuță","bobicutele":"bobicuță","bobicutelor":"bobicuță","bobilna":"Bobâlna","bobinai":"bobina","bobinaje":"bobinaj","bobinajele":"bobinaj","bobinajelor":"bobinaj","bobinajul":"bobinaj","bobinajule":"bobinaj","bobinajului":"bobinaj","bobinam":["bobinăm","bobina","bobinam","bobina"],"bobinand":"bobina","bobinara":"bobina","bobinaram":"bobina","bobinarati":"bobina","bobinase":"bobina","bobinasem":"bobina","bobinasera":"bobina","bobinaseram":"bobina","bobinaserati":"bobina","bobinasesi":"bobina","bobinasi":"bobina","bobinat":"bobina","bobinati":"bobina","bobinatoarea":"bobinatoare","bobinatoarei":"bobinatoare","bobinatoarele":"bobinatoare","bobinatoarelor":"bobinatoare","bobinatori":"bobinator","bobinatorii":"bobinator","bobinatorilor":"bobinator","bobinatorul":"bobinator","bobinatorule":"bobinator","bobinatorului":"bobinator","bobinau":"bobina","bobine":"bobină","bobineaza":"bobina","bobinei":"bobină","bobinele":"bobină","bobinelor":"bobină","bobinez":"bobina","bobinezi":"bobina","bobirnac":["bobîrnac","Bobârnac","bobîrnac","bobârnac"],"bobisoare":"bobișor","bobisoarele":"bobișor","bobisoarelor":"bobișor","bobisorul":"bobișor","bobisorule":"bobișor","bobisorului":"bobișor","bobistea":"bobiște","bobisti":"bobiște","bobistii":"bobiște","bobistile":"bobiște","bobistilor":"bobiște","bobite":"bobiță","bobitei":"bobiță","bobitele":"bobiță","bobitelor":"bobiță","boboane":"boboană","boboanei":"boboană","boboanele":"boboană","boboanelor":"boboană","bobocei":"bobocel","boboceli":"bobocel","bobocelii":"bobocel","bobocelilor":"bobocel","bobocelul":"bobocel","bobocelule":"bobocel","bobocelului":"bobocel","boboci":"boboc","bobocici":"bobocică","bobocicii":"bobocică","bobocicile":"bobocică","bobocicilor":"bobocică","bobocii":"boboc","bobocilor":"boboc","bobocul":"boboc","bobocule":"boboc","bobocului":"boboc","bobonosagul":"bobonoșag","bobonosagule":"bobonoșag","bobonosagului":"bobonoșag","bobonosaguri":"bobonoșag","bobonosagurile":"bobonoșag","bobonosagurilor":"bobonoșag","bobornici":"bobornic","bobornicii":"bobornic","bobornicilor":"bobornic","bobornicul":"bobornic","bobornicule":"bobornic","bobornicului":"bobornic","bobosarea":"boboșare","bobosari":"boboșare","bobosarii":"boboșare","bobosarile":"boboșare","bobosarilor":"boboșare","bobosora":["boboșoră","boboșor","boboșora","boboșor"],"bobosore":"boboșor","bobosorele":"boboșor","bobosori":"boboșor","bobosorii":"boboșor","bobosorul":"boboșor","bobotai":"bobotaie","bobotaiea":"bobotaie","bobotaii":"bobotaie","bobotaile":"bobotaie","bobotailor":"bobotaie","bobote":["bobote","bobot","bobote","bobotă"],"bobotea":"boboti","boboteai":"boboti","boboteam":"boboti","boboteati":"boboti","boboteau":"boboti","boboteaze":"bobotează","boboteazei":"bobotează","bobotei":"bobotă","bobotele":["bobotele","bobot","bobotele","bobotă"],"bobotelor":["bobotelor","bobot","bobotelor","bobotă"],"bobotesc":"boboti","boboteste":"boboti","bobotesti":"boboti","bobotii":"boboti","bobotim":"boboti","bobotind":"boboti","bobotira":"boboti","bobotiram":"boboti","bobotirati":"boboti","bobotirea":"bobotire","bobotiri":"bobotire","bobotirii":"bobotire","bobotirile":"bobotire","bobotirilor":"bobotire","bobotise":"boboti","bobotisem":"boboti","bobotisera":"boboti","bobotiseram":"boboti","bobotiserati":"boboti","bobotisesi":"boboti","bobotisi":"boboti","bobotit":"boboti","bobotiti":"boboti","bobotul":"bobot","bobotule":"bobot","bobotului":"bobot","boboua":"bobou","bobouale":"bobou","boboualor":"bobou","bobouul":"bobou","bobouule":"bobou","bobouului":"bobou","bobrici":"bobric","bobricii":"bobric","bobricilor":"bobric","bobricul":"bobric","bobricule":"bobric","bobricului":"bobric","bobslei":"bobsleigh","bobsleigh":"bobslei","bobsleigh-ul":"bobsleigh","bobsleigh-ule":"bobsleigh","bobsleigh-ului":"bobsleigh","bobsleigh-uri":"bobsleigh","bobsleigh-urile":"bobsleigh","bobsleigh-urilor":"bobsleigh","bobsleiul":"bobslei","bobsleiule":"bobslei","bobsleiului":"bobslei","bobul":"bob","bobule":"bob","bobulete":"bobuleț","bobuletele":"bobuleț","bobuletelor":"bobuleț","bobuletul":"bobuleț","bobuletule":"bobuleț","bobuletului":"bobuleț","bobului":"bob","boburi":"bob","boburile":"bob","boburilor":"bob","bobusori":"bobușor","bobusorii":"bobușor","bobusorilor":"bobușor","bobusorul":"bobușor","bobusorule":"bobușor","bobusorului":"bobușor","bocalul":"bocal","bocalule":"bocal","bocalului":"bocal","bocaluri":"bocal","bocalurile":"bocal","bocalurilor":"bocal","bocanca":"bocanc","bocance":"bocancă","bocancei":"bocancă","bocancele":"bocancă","bocancelor":"bocancă","bocanci":["bocanci","bocanc","bocănci","bocancă"],"bocancii":"bocanc","bocancilor":"bocanc","bocancul":"bocanc","bocancule":"bocanc","bocancului":"bocanc","bocanea":"bocăni","bocaneai":"bocăni","bocaneam":"bocăni","bocaneati":"bocăni","bocaneau":"bocăni","bocanele":"bocăneală","bocanelei":"bocăneală","bocanelele":"bocăneală","bocanelelor":"bocăneală","bocaneli":"bocăneală","bocanesc":"bocăni","bocaneste":"bocăni","bocanesti":"bocăni","bocanii":"bocăni","bocanim":"bocăni","bocanind":"bocăni","bocanira":"bocăni","bocaniram":"bocăni","bocanirati":"bocăni","bocanise":"bocăni","bocanisem":"bocăni","bocanisera":"bocăni","bocaniseram":"bocăni","bocaniserati":"bocăni","bocanisesi":"bocăni","bocanisi":"bocăni","bocanit":"bocăni","bocaniti":"bocăni","bocanitul":"bocănit","bocanitule":"bocănit","bocanitului":"bocănit","bocaniture":"bocănitură","bocaniturei":"bocănitură","bocaniturele":"bocănitură","bocaniturelor":"bocănitură","bocanituri":"bocănitură","bocaporti":"bocaport","bocaportii":"bocaport","bocaportilor":"bocaport","bocaportul":"bocaport","bocaportule":"bocaport","bocaportului":"bocaport","bocare":"bocar","bocarele":"bocar","bocarelor":"bocar","bocarul":"bocar","bocarule":"bocar","bocarului":"bocar","boccacceasca":["boccaccească","boccaccesc","boccacceasca","boccaccesc"],"boccaccescul":"boccaccesc","boccaccesti":"boccaccesc","boccaccestii":"boccaccesc","boccaccestile":"boccaccesc","bocceagii":"bocceagiu","bocceagiii":"bocceagiu","bocceagiilor":"bocceagiu","bocceagiuul":"bocceagiu","bocceagiuule":"bocceagiu","bocceagiuului":"bocceagiu","boccealacul":"boccealâc","boccealacule":"boccealâc","boccealacului":"boccealâc","boccealacuri":"boccealâc","boccealacurile":"boccealâc","boccealacurilor":"boccealâc","boccealic":"boccealâc","bocceaua":"boccea","boccegii":"boccegiu","boccegiii":"boccegiu","boccegiilor":"boccegiu","boccegiul":"boccegiu","boccegiule":"boccegiu","boccegiului":"boccegiu","boccele":"boccea","boccelei":"boccea","boccelele":"boccea","boccelelor":"boccea","boccelute":"bocceluță","boccelutei":"bocceluță","boccelutele":"bocceluță","boccelutelor":"bocceluță","bocceul":"bocce","bocceule":"bocce","bocceului":"bocce","boccia":"bocciu","boccie":"bocciu","boccii":"bocciu","bocciii":"bocciu","bocciile":"bocciu","bocciul":"bocciu","bocea":"boci","boceai":"boci","boceam":"boci","boceati":"boci","boceau":"boci","bocele":"boceală","bocelei":"boceală","bocelele":"boceală","bocelelor":"boceală","boceli":"boceală","bocesc":"boci","boceste":"boci","bocesti":"boci","bocete":"bocet","bocetele":"bocet","bocetelor":"bocet","bocetul":"bocet","bocetule":"bocet","bocetului":"bocet","boci":"boace","bocii":"boci","bocim":"boci","bocind":"boci","bocioacaul":"bocioacă","bocioacaule":"bocioacă","bocioacaului":"bocioacă","bocioace":"bocioacă","bocioacele":"bocioacă","bocioacelor":"bocioacă","bocira":"boci","bociram":"boci","bocirati":"boci","bocirea":"bocire","bociri":"bocire","bocirii":"bocire","bocirile":"bocire","bocirilor":"bocire","bocise":"boci","bocisem":"boci","bocisera":"boci","bociseram":"boci","bociserati":"boci","bocisesi":"boci","bocisi":"boci","bocit":"boci","bociti":"boci","bocitoare":"bocitor","bocitoarea":"bocitor","bocitoarele":"bocitor","bocitori":"bocitor","bocitorii":"bocitor","bocitorul":"bocitor","bocitul":"bocit","bocitule":"bocit","bocitului":"bocit","bociuluti":"bociuluț","bociulutii":"bociuluț","bociulutilor":"bociuluț","bociulutul":"bociuluț","bociulutule":"bociuluț","bociulutului":"bociuluț","boclucul":"bocluc","boclucule":"bocluc","boclucului":"bocluc","boclucuri":"bocluc","boclucurile":"bocluc","boclucurilor":"bocluc","bocotana":["bocotană","bocotan","bocotana","bocotan"],"bocotane":"bocotan","bocotanele":"bocotan","bocotani":"bocotan","bocotanii":"bocotan","bocotanul":"bocotan","bocse":"bocșă","bocsei":"bocșă","bocsele":"bocșă","bocselor":"bocșă","bocseri":"bocșer","bocserii":"bocșer","bocserilor":"bocșer","bocserul":"bocșer","bocserule":"bocșer","bocserului":"bocșer","boctaria":"boctărie","boctariei":"boctărie","boctarii":"boctărie","boctariile":"boctărie","boctariilor":"boctărie","bocul":"boc","bocule":"boc","bocului":"boc","bocuri":"boc","bocurile":"boc","bocurilor":"boc","bodarlai":"bodârlău","bodarlaii":"bodârlău","bodarlailor":"bodârlău","bodarlauul":"bodârlău","bodarlauule":"bodârlău","bodarlauului":"bodârlău","bodegi":"bodegă","bodegii":"bodegă","bodegile":"bodegă","bodegilor":"bodegă","bodicecul":"bodicec","bodicecule":"bodicec","bodicecului":"bodicec","bodicecuri":"bodicec","bodicecurile":"bodicec","bodicecurilor":"bodicec","bodigard":"bodyguard","bodigardul":"bodigard","bodigardule":"bodigard","bodigardului":"bodigard","bodigarzi":"bodigard","bodigarzii":"bodigard","bodigarzilor":"bodigard","bodirlau":"bodârlău","bodoganea":"bodogăni","bodoganeai":"bodogăni","bodoganeam":"bodogăni","bodoganeati":"bodogăni","bodoganeau":"bodogăni","bodoganeli":"bodogăneală","bodoganelii":"bodogăneală","bodoganelile":"bodogăneală","bodoganelilor":"bodogăneală","bodoganesc":"bodogăni","bodoganeste":"bodogăni","bodoganesti":"bodogăni","bodoganii":"bodogăni","bodoganim":"bodogăni","bodoganind":"bodogăni","bodoganira":"bodogăni","bodoganiram":"bodogăni","bodoganirati":"bodogăni","bodoganise":"bodogăni","bodoganisem":"bodogăni","bodoganisera":"bodogăni","bodoganiseram":"bodogăni","bodoganiserati":"bodogăni","bodoganisesi":"bodogăni","bodoganisi":"bodogăni","bodoganit":"bodogăni","bodoganiti":"bodogăni","bodroganea":"bodrogăni","bodroganeai":"bodrogăni","bodroganeam":"bodrogăni","bodroganeati":"bodrogăni","bodroganeau":"bodrogăni","bodroganesc":"bodrogăni","bodroganeste":"bodrogăni","bodroganesti":"bodrogăni","bodroganii":"bodrogăni","bodroganim":"bodrogăni","bodroganind":"bodrogăni","bodroganira":"bodrogăni","bodroganiram":"bodrogăni","bodroganirati":"bodrogăni","bodroganise":"bodrogăni","bodroganisem":"bodrogăni","bodroganisera":"bodrogăni","bodroganiseram":"bodrogăni","bodroganiserati":"bodrogăni","bodroganisesi":"bodrogăni","bodroganisi":"bodrogăni","bodroganit":"bodrogăni","bodroganiti":"bodrogăni","body buildingul":"body building","body buildingule":"body building","body buildingului":"body building","body-ul":"body","body-ule":"body","body-ului":"body","body-uri":"body","body-urile":"body","body-urilor":"body","bodyguardul":"bodyguard","bodyguardule":"bodyguard","bodyguardului":"bodyguard","bodyguarzi":"bodyguard","bodyguarzii":"bodyguard","bodyguarzilor":"bodyguard","boema":["boemă","boem","boema","boem"],"boeme":["boeme","boem","boeme","boemă"],"boemei":"boemă","boemele":["boemele","boem","boemele","boemă"],"boemelor":"boemă","boemi":"boem","boemiei":"Boemia","boemii":"boem","boemilor":"boem","boemoaice":"boemoaică","boemoaicei":"boemoaică","boemoaicele":"boemoaică","boemoaicelor":"boemoaică","boemul":"boem","boemule":"boem","boemului":"boem","bogacia":"bogacie","bogaciei":"bogacie","bogacii":"bogacie","bogaciile":"bogacie","bogaciilor":"bogacie","bogasieri":"bogasier","bogasieria":"bogasierie","bogasieriei":"bogasierie","bogasierii":["bogasierii","bogasier","bogasierii","bogasierie"],"bogasieriile":"bogasierie","bogasieriilor":"bogasierie","bogasierilor":"bogasier","bogasierul":"bogasier","bogasierule":"bogasier","bogasierului":"bogasier","bogasiul":"bogasiu","bogasiule":"bogasiu","bogasiului":"bogasiu","bogasiuri":"bogasiu","bogasiurile":"bogasiu","bogasiurilor":"bogasiu","bogata":["bogată","bogat","bogata","bogat"],"bogatance":"bogătancă","bogatancei":"bogătancă","bogatancele":"bogătancă","bogatancelor":"bogătancă","bogatane":"bogătană","bogatanei":"bogătană","bogatanele":"bogătană","bogatanelor":"bogătană","bogatani":"bogătan","bogatanii":"bogătan","bogatanilor":"bogătan","bogatanul":"bogătan","bogatanule":"bogătan","bogatanului":"bogătan","bogatari":["bogatâri","bogatâr","bogătari","bogătar"],"bogatarii":["bogatârii","bogatâr","bogătarii","bogătar"],"bogatarilor":["bogatârilor","bogatâr","bogătarilor","bogătar"],"bogatarul":["bogatârul","bogatâr","bogătarul","bogătar"],"bogatarule":["bogatârule","bogatâr","bogătarule","bogătar"],"bogatarului":["bogatârului","bogatâr","bogătarului","bogătar"],"bogatase":"bogătașă","bogatasei":"bogătașă","bogatasele":"bogătașă","bogataselor":"bogătașă","bogatasi":"bogătaș","bogatasii":"bogătaș","bogatasilor":"bogătaș","bogatasul":"bogătaș","bogatasule":"bogătaș","bogatasului":"bogătaș","bogatatea":"bogătate","bogatati":"bogătate","bogatatii":"bogătate","bogatatile":"bogătate","bogatatilor":"bogătate","bogate":["bogate","bogat","bogate","bogată"],"bogatei":["bogatei","bogată","bogăței","bogățel"],"bogateii":"bogățel","bogateilor":"bogățel","bogatele":["bogatele","bogat","bogatele","bogată","bogățele","bogățică"],"bogatelei":"bogățică","bogatelele":"bogățică","bogatelelor":"bogățică","bogatelor":"bogată","bogatelul":"bogățel","bogatelule":"bogățel","bogatelului":"bogățel","bogati":"bogat","bogatia":"bogăție","bogatice":"bogățică","bogaticele":"bogățică","bogatiei":"bogăție","bogatii":["bogații","bogat","bogății","bogăție"],"bogatii naturale":"bogăție naturală","bogatiile":"bogăție","bogatiilor":"bogăție","bogatilor":"bogat","bogatir":"bogatâr","bogatoiul":"bogătoi","bogatoiule":"bogătoi","bogatoiului":"bogătoi","bogatu romin":"Bogatu Român","bogatul":"bogat","bogatule":"bogat","bogatului":"bogat","bogazul":"bogaz","bogazule":"bogaz","bogazului":"bogaz","bogazuri":"bogaz","bogazurile":"bogaz","bogazurilor":"bogaz","bogdaneasca":["bogdănească","bogdănesc","bogdăneasca","bogdănesc"],"bogdanescul":"bogdănesc","bogdanesti":"bogdănesc","bogdanestii":"bogdănesc","bogdanestile":"bogdănesc","bogdani":"bogdan","bogdanii":"bogdan","bogdanilor":"bogdan","bogdanlii":"bogdanliu","bogdanliii":"bogdanliu","bogdanliilor":"bogdanliu","bogdanliuul":"bogdanliu","bogdanliuule":"bogdanliu","bogdanliuului":"bogdanliu","bogdanul":"bogdan","bogdanule":"bogdan","bogdanului":"bogdan","bogdaprost":"bogdaprosti","bogdaproste":"bogdaprosti","bogdaprostea":"bogdaprosti","bogdaprosteai":"bogdaprosti","bogdaprosteam":"bogdaprosti","bogdaprosteati":"bogdaprosti","bogdaprosteau":"bogdaprosti","bogdaprostie":"bogdaprosti","bogdaprostii":"bogdaprosti","bogdaprostim":"bogdaprosti","bogdaprostind":"bogdaprosti","bogdaprostira":"bogdaprosti","bogdaprostiram":"bogdaprosti","bogdaprostirati":"bogdaprosti","bogdaprostise":"bogdaprosti","bogdaprostisem":"bogdaprosti","bogdaprostisera":"bogdaprosti","bogdaprostiseram":"bogdaprosti","bogdaprostiserati":"bogdaprosti","bogdaprostisesi":"bogdaprosti","bogdaprostisi":"bogdaprosti","bogdaprostit":"bogdaprosti","bogdaprostiti":"bogdaprosti","boghecute":"boghecuță","boghecutei":"boghecuță","boghecutele":"boghecuță","boghecutelor":"boghecuță","bogheta":["boghetă","boghet","bogheta","boghet"],"boghete":"boghet","boghetele":"boghet","bogheti":"boghet","boghetii":"boghet","boghetul":"boghet","boghite":"boghiță","boghitei":"boghiță","boghitele":"boghiță","boghitelor":"boghiță","boghiuri":"boghiu","boghiurile":"boghiu","boghiurilor":"boghiu","boghiuul":"boghiu","boghiuule":"boghiu","boghiuului":"boghiu","boglari":"boglar","boglarii":["boglarii","boglar","boglarii","boglari"],"boglarilor":["boglarilor","boglar","boglarilor","boglari"],"boglariul":"boglari","boglariule":"boglari","boglariului":"boglari","boglarul":"boglar","boglarule":"boglar","boglarului":"boglar","bogoboreti":"bogoboreț","bogoboretii":"bogoboreț","bogoboretilor":"bogoboreț","bogoboretul":"bogoboreț","bogoboretule":"bogoboreț","bogoboretului":"bogoboreț","bogomili":"bogomil","bogomilica":["bogomilică","bogomilic","bogomilica","bogomilic"],"bogomilice":"bogomilic","bogomilicele":"bogomilic","bogomilici":"bogomilic","bogomilicii":"bogomilic","bogomilicul":"bogomilic","bogomilii":"bogomil","bogomililor":"bogomil","bogomilismul":"bogomilism","bogomilismule":"bogomilism","bogomilismului":"bogomilism","bogomilul":"bogomil","bogomilule":"bogomil","bogomilului":"bogomil","bogonoseti":"bogonoseț","bogonosetii":"bogonoseț","bogonosetilor":"bogonoseț","bogonosetul":"bogonoseț","bogonosetule":"bogonoseț","bogonosetului":"bogonoseț","bogonosnica":["bogonosnică","bogonosnic","bogonosnica","bogonosnic"],"bogonosnice":"bogonosnic","bogonosnicele":"bogonosnic","bogonosnici":"bogonosnic","bogonosnicii":"bogonosnic","bogonosnicul":"bogonosnic","bogorecenia":"bogorecenie","bogoreceniei":"bogorecenie","bogorecenii":"bogorecenie","bogoreceniile":"bogorecenie","bogoreceniilor":"bogorecenie","bogosloveasca":["bogoslovească","bogoslovesc","bogosloveasca","bogoslovesc"],"bogoslovescul":"bogoslovesc","bogoslovesti":"bogoslovesc","bogoslovestii":"bogoslovesc","bogoslovestile":"bogoslovesc","bogoslovi":"bogoslov","bogoslovia":"bogoslovie","bogosloviei":"bogoslovie","bogoslovii":["bogoslovii","bogoslov","bogoslovii","bogoslovie"],"bogosloviile":"bogoslovie","bogosloviilor":"bogoslovie","bogoslovilor":"bogoslov","bogoslovul":"bogoslov","bogoslovule":"bogoslov","bogoslovului":"bogoslov","bohriul":"bohriu","bohriule":"bohriu","bohriului":"bohriu","boi":"bou","boi de mare":"bou de mare","boi moscati":"bou moscat","boi-de-balta":"bou-de-baltă","boia":"boi","boia birzii":"Boia Bârzii","boiai":"boi","boiam":"boi","boiame":"boiamă","boiamei":"boiamă","boiamele":"boiamă","boiamelor":"boiamă","boiangeria":"boiangerie","boiangeriei":"boiangerie","boiangerii":"boiangerie","boiangeriile":"boiangerie","boiangeriilor":"boiangerie","boiangii":"boiangiu","boiangiii":"boiangiu","boiangiilor":"boiangiu","boiangilacul":"boiangilâc","boiangilacule":"boiangilâc","boiangilacului":"boiangilâc","boiangilacuri":"boiangilâc","boiangilacurile":"boiangilâc","boiangilacurilor":"boiangilâc","boiangilic":"boiangilâc","boiangiul":"boiangiu","boiangiule":"boiangiu","boiangiului":"boiangiu","boianiori":"boianior","boianiorii":"boianior","boianiorilor":"boianior","boianiorul":"boianior","boianiorule":"boianior","boianiorului":"boianior","boiarnici":"boiarnic","boiarnicii":"boiarnic","boiarnicilor":"boiarnic","boiarnicul":"boiarnic","boiarnicule":"boiarnic","boiarnicului":"boiarnic","boiasca":["boiască","boiesc","boiasca","boiesc"],"boiati":"boi","boiau":"boi","boiaua":"boia","boicotai":"boicota","boicotam":["boicotăm","boicota","boicotam","boicota"],"boicotand":"boicota","boicotara":"boicota","boicotaram":"boicota","boicotarati":"boicota","boicotarea":"boicotare","boicotari":"boicotare","boicotarii":"boicotare","boicotarile":"boicotare","boicotarilor":"boicotare","boicotase":"boicota","boicotasem":"boicota","boicotasera":"boicota","boicotaseram":"boicota","boicotaserati":"boicota","boicotasesi":"boicota","boicotasi":"boicota","boicotat":"boicota","boicotata":["boicotată","boicotat","boicotata","boicotat"],"boicotate":"boicotat","boicotatele":"boicotat","boicotati":["boicotați","boicota","boicotați","boicotat"],"boicotatii":"boicotat","boicotatul":"boicotat","boicotau":"boicota","boicoteaza":"boicota","boicotez":"boicota","boicotezi":"boicota","boicotul":"boicot","boicotule":"boicot","boicotului":"boicot","boicoturi":"boicot","boicoturile":"boicot","boicoturilor":"boicot","boicusi":"boicuș","boicusii":"boicuș","boicusilor":"boicuș","boicusul":"boicuș","boicusule":"boicuș","boicusului":"boicuș","boiele":"boia","boielei":"boia","boielele":"boia","boielelor":"boia","boieli":"boială","boielii":"boială","boielile":"boială","boielilor":"boială","boiengioaiea":"boiengioaie","boiengioaiei":"boiengioaie","boiengioaiele":"boiengioaie","boiengioaielor":"boiengioaie","boienuti":"boienuț","boienutii":"boienuț","boienutilor":"boienuț","boienutul":"boienuț","boienutule":"boienuț","boienutului":"boienuț","boierasi":"boieraș","boierasii":"boieraș","boierasilor":"boieraș","boierasul":"boieraș","boierasule":"boieraș","boierasului":"boieraș","boieratica":["boieratică","boieratic","boieratica","boieratic"],"boieratice":"boieratic","boieraticele":"boieratic","boieratici":"boieratic","boieraticii":"boieratic","boieraticul":"boieratic","boierea":"boieri","boiereai":"boieri","boieream":"boieri","boiereasca":["boierească","boieresc","boiereasca","boieresc"],"boiereati":"boieri","boiereau":"boieri","boieresc":"boieri","boierescul":"boieresc","boierese":"boiereasă","boieresei":"boiereasă","boieresele":"boiereasă","boiereselor":"boiereasă","boiereste":"boieri","boieresti":["boierești","boieresc","boierești","boieri"],"boierestii":"boieresc","boierestile":"boieresc","boieri":"boier","boieria":"boierie","boieriei":"boierie","boierii":["boierii","boier","boierii","boieri","boierii","boierie"],"boieriile":"boierie","boieriilor":"boierie","boierilor":"boier","boierim":"boieri","boierimea":"boierime","boierimi":"boierime","boierimii":"boierime","boierimile":"boierime","boierimilor":"boierime","boierinasi":"boierinaș","boierinasii":"boierinaș","boierinasilor":"boierinaș","boierinasul":"boierinaș","boierinasule":"boierinaș","boierinasului":"boierinaș","boierind":"boieri","boierira":"boieri","boieriram":"boieri","boierirati":"boieri","boierirea":"boierire","boieriri":"boierire","boieririi":"boierire","boieririle":"boierire","boieririlor":"boierire","boierisagul":"boierișag","boierisagule":"boierișag","boierisagului":"boierișag","boierisaguri":"boierișag","boierisagurile":"boierișag","boierisagurilor":"boierișag","boierise":"boieri","boierisem":"boieri","boierisera":"boieri","boieriseram":"boieri","boieriserati":"boieri","boierisesi":"boieri","boierisi":"boieri","boierismul":"boierism","boierismule":"boierism","boierismului":"boierism","boierit":"boieri","boierite":"boieriță","boieritei":"boieriță","boieritele":"boieriță","boieritelor":"boieriță","boieriti":"boieri","boieritul":"boierit","boieritule":"boierit","boieritului":"boierit","boierituri":"boierit","boieriturile":"boierit","boieriturilor":"boierit","boiernasi":"boiernaș","boiernasii":"boiernaș","boiernasilor":"boiernaș","boiernasul":"boiernaș","boiernasule":"boiernaș","boiernasului":"boiernaș","boieroaice":"boieroaică","boieroaicei":"boieroaică","boieroaicele":"boieroaică","boieroaicelor":"boieroaică","boieroaiea":"boieroaie","boieroaiei":"boieroaie","boieroaiele":"boieroaie","boieroaielor":"boieroaie","boieroasa":["boieroasă","boieros","boieroasa","boieros"],"boieroase":"boieros","boieroasele":"boieros","boierosi":"boieros","boierosii":"boieros","boierosul":"boieros","boierul":"boier","boierule":"boier","boierului":"boier","boiesc":"boi","boiescul":"boiesc","boiesi":"boieș","boiesii":"boieș","boiesilor":"boieș","boieste":"boi","boiesti":["boiești","boi","boiești","boiesc"],"boiestii":"boiesc","boiestile":"boiesc","boiesul":"boieș","boiesule":"boieș","boiesului":"boieș","boii":["boii","boi","boii","bou"],"boilere":"boiler","boilerele":"boiler","boilerelor":"boiler","boilerul":"boiler","boilerule":"boiler","boilerului":"boiler","boilor":"bou","boim":"boi","boind":"boi","boinica":["boinică","boinic","boinica","boinic"],"boinice":"boinic","boinicele":"boinic","boinici":"boinic","boinicii":"boinic","boinicilor":"boinic","boinicul":"boinic","boinicule":"boinic","boinicului":"boinic","boinite":"boiniță","boinitei":"boiniță","boinitele":"boiniță","boinitelor":"boiniță","boira":"boi","boiram":"boi","boirati":"boi","boirea":"boire","boiri":"boire","boirii":"boire","boirile":"boire","boirilor":"boire","boiscari":"boiscar","boiscarii":"boiscar","boiscarilor":"boiscar","boiscarul":"boiscar","boiscarule":"boiscar","boiscarului":"boiscar","boiscaul":"boișcă","boiscaule":"boișcă","boiscaului":"boișcă","boise":"boi","boisem":"boi","boisera":"boi","boiseram":"boi","boiserati":"boi","boisesi":"boi","boisi":"boi","boiste":"boișcă","boisteanul":"boiștean","boisteanule":"boiștean","boisteanului":"boiștean","boistei":"boișcă","boistelor":"boișcă","boisteni":"boiștean","boistenii":"boiștean","boistenilor":"boiștean","boit":"boi","boita":["boită","boit","boita","boit"],"boitari":"boitar","boitarii":"boitar","boitarilor":"boitar","boitarul":"boitar","boitarule":"boitar","boitarului":"boitar","boite":"boit","boitele":"boit","boiti":["boiți","boi","boiți","boit"],"boitii":"boit","boitul":"boit","boiul":"boi","boiule":"boi","boiului":"boi","boiuri":"boi","boiurile":"boi","boiurilor":"boi","bojdeuce":"bojdeucă","bojdeucei":"bojdeucă","bojdeucele":"bojdeucă","bojdeucelor":"bojdeucă","boji":"boz","bojii":"boz","bojilor":"boz","bojnite":"bojniță","bojnitei":"bojniță","bojnitele":"bojniță","bojnitelor":"bojniță","bojoci":"bojoc","bojocii":"bojoc","bojocilor":"bojoc","bojocul":"bojoc","bojocule":"bojoc","bojocului":"bojoc","bojogar":"bojogări","bojogare":"bojogări","bojogarea":"bojogări","bojogareai":"bojogări","bojogaream":"bojogări","bojogareati":"bojogări","bojogareau":"bojogări","bojogari":"bojogar","bojogarie":"bojogări","bojogarii":["bojogarii","bojogar","bojogării","bojogări"],"bojogarilor":"bojogar","bojogarim":"bojogări","bojogarind":"bojogări","bojogarira":"bojogări","bojogariram":"bojogări","bojogarirati":"bojogări","bojogarise":"bojogări","bojogarisem":"bojogări","bojogarisera":"bojogări","bojogariseram":"bojogări","bojogariserati":"bojogări","bojogarisesi":"bojogări","bojogarisi":"bojogări","bojogarit":"bojogări","bojogariti":"bojogări","bojogarul":"bojogar","bojogarule":"bojogar","bojogarului":"bojogar","bojogi":"bojog","bojogii":"bojog","bojogilor":"bojog","bojogul":"bojog","bojogule":"bojog","bojogului":"bojog","bolanda":["bolândă","bolând","bolânda","bolând"],"bolandatica":["bolândatică","bolândatic","bolândatica","bolândatic"],"bolandatice":"bolândatic","bolandaticele":"bolândatic","bolandatici":"bolândatic","bolandaticii":"bolândatic","bolandaticul":"bolândatic","bolande":"bolând","bolandele":"bolând","bolandul":"bolând","bolanzi":"bolând","bolanzia":"bolânzie","bolanziei":"bolânzie","bolanzii":["bolânzii","bolând","bolânzii","bolânzie"],"bolanziile":"bolânzie","bolanziilor":"bolânzie","bolardi":"bolard","bolardii":"bolard","bolardilor":"bolard","bolardul":"bolard","bolardule":"bolard","bolardului":"bolard","bolarzi":"bolard","bolboane":"bolboană","bolboanei":"bolboană","bolboanele":"bolboană","bolboanelor":"bolboană","bolboreul":"bolbore","bolboreule":"bolbore","bolboreului":"bolbore","bolbori":"bolbore","bolborii":"bolbore","bolborilor":"bolbore","bolborosea":"bolborosi","bolboroseai":"bolborosi","bolboroseam":"bolborosi","bolboroseati":"bolborosi","bolboroseau":"bolborosi","bolboroseli":"bolboroseală","bolboroselii":"bolboroseală","bolboroselile":"bolboroseală","bolboroselilor":"bolboroseală","bolborosesc":"bolborosi","bolboroseste":"bolborosi","bolborosesti":"bolborosi","bolborosii":"bolborosi","bolborosim":"bolborosi","bolborosind":"bolborosi","bolborosira":"bolborosi","bolborosiram":"bolborosi","bolborosirati":"bolborosi","bolborosirea":"bolborosire","bolborosiri":"bolborosire","bolborosirii":"bolborosire","bolborosirile":"bolborosire","bolborosirilor":"bolborosire","bolborosise":"bolborosi","bolborosisem":"bolborosi","bolborosisera":"bolborosi","bolborosiseram":"bolborosi","bolborosiserati":"bolborosi","bolborosisesi":"bolborosi","bolborosisi":"bolborosi","bolborosit":"bolborosi","bolborositi":"bolborosi","bolborositul":"bolborosit","bolborositule":"bolborosit","bolborositului":"bolborosit","bolborosituri":"bolborositură","bolborositurii":"bolborositură","bolborositurile":"bolborositură","bolborositurilor":"bolborositură","bolbotela":["bolboțelă","bolboțel","bolboțela","bolboțel"],"bolbotele":"bolboțel","bolbotelele":"bolboțel","bolboteli":"bolboțel","bolbotelii":"bolboțel","bolbotelul":"bolboțel","bolburi":"bolbură","bolcute":"bolcuță","bolcutei":"bolcuță","bolcutele":"bolcuță","bolcutelor":"bolcuță","boldane":"boldan","boldanele":"boldan","boldanelor":"boldan","boldanul":"boldan","boldanule":"boldan","boldanului":"boldan","boldaria":"boldărie","boldariei":"boldărie","boldarii":"boldărie","boldariile":"boldărie","boldariilor":"boldărie","boldea":"boldi","boldeai":"boldi","boldeam":"boldi","boldeati":"boldi","boldeau":"boldi","boldeicute":"boldeicuță","boldeicutei":"boldeicuță","boldeicutele":"boldeicuță","boldeicutelor":"boldeicuță","boldesc":"boldi","boldeste":"boldi","boldesti":"boldi","boldii":"boldi","boldim":"boldi","boldind":"boldi","boldira":"boldi","boldiram":"boldi","boldirati":"boldi","boldise":"boldi","boldisem":"boldi","boldisera":"boldi","boldiseram":"boldi","boldiserati":"boldi","boldisesi":"boldi","boldisi":"boldi","boldisoare":"boldișor","boldisoarele":"boldișor","boldisoarelor":"boldișor","boldisorul":"boldișor","boldisorule":"boldișor","boldisorului":"boldișor","boldit":"boldi","bolditela":["boldițelă","boldițel","boldițela","boldițel"],"bolditele":"boldițel","bolditelele":"boldițel","bolditeli":"boldițel","bolditelii":"boldițel","bolditelul":"boldițel","bolditi":"boldi","boldodine":"boldodină","boldodinei":"boldodină","boldodinele":"boldodină","boldodinelor":"boldodină","boldul":"bold","boldule":"bold","boldului":"bold","boldurele":"boldurel","boldurelele":"boldurel","boldurelelor":"boldurel","boldurelul":"boldurel","boldurelule":"boldurel","boldurelului":"boldurel","bolduri":"bold","boldurile":"bold","boldurilor":"bold","boldute":"bolduț","boldutele":"bolduț","boldutelor":"bolduț","boldutul":"bolduț","boldutule":"bolduț","boldutului":"bolduț","bolea":"boli","boleai":"boli","boleam":"boli","boleati":"boli","boleau":"boli","boleroul":["boleroul","bolero","boleroul","bolerou"],"boleroule":["boleroule","bolero","boleroule","bolerou"],"boleroului":["boleroului","bolero","boleroului","bolerou"],"bolerouri":["bolerouri","bolero","bolerouri","bolerou"],"bolerourile":["bolerourile","bolero","bolerourile","bolerou"],"bolerourilor":["bolerourilor","bolero","bolerourilor","bolerou"],"bolesc":"boli","bolesnite":"boleșniță","bolesnitei":"boleșniță","bolesnitele":"boleșniță","bolesnitelor":"boleșniță","boleste":"boli","bolesti":"boli","bolezne":"boleaznă","boleznei":"boleaznă","boleznele":"boleaznă","boleznelor":"boleaznă","bolfe":"bolfă","bolfei":"bolfă","bolfele":"bolfă","bolfelor":"bolfă","bolfusoare":"bolfușoară","bolfusoarei":"bolfușoară","bolfusoarele":"bolfușoară","bolfusoarelor":"bolfușoară","boli":"boală","boli lipicioase":"boală lipicioasă","boli profesionale":"boală profesională","boli transmise sexual":"boală transmisă sexual","bolidul":"bolid","bolidule":"bolid","bolidului":"bolid","bolii":["bolii","boală","bolii","boli"],"bolile":"boală","bolilor":"boală","bolim":"boli","bolind":["bolînd","bolând","bolind","boli"],"bolindete":"bolindeț","bolindetele":"bolindeț","bolindetelor":"bolindeț","bolindetul":"bolindeț","bolindetule":"bolindeț","bolindetului":"bolindeț","bolinzie":"bolânzie","bolira":"boli","boliram":"boli","bolirati":"boli","bolirea":"bolire","boliri":"bolire","bolirii":"bolire","bolirile":"bolire","bolirilor":"bolire","bolise":"boli","bolisem":"boli","bolisera":"boli","boliseram":"boli","boliserati":"boli","bolisesi":"boli","bolisi":"boli","bolistea":"boliște","bolisti":"boliște","bolistii":"boliște","bolistile":"boliște","bolistilor":"boliște","bolit":"boli","boliti":"boli","bolivari":"bolivar","bolivarii":"bolivar","bolivarilor":"bolivar","bolivarul":"bolivar","bolivarule":"bolivar","bolivarului":"bolivar","boliviana":["boliviană","bolivian","boliviana","bolivian"],"bolivianul":"bolivian","bolivianule":"bolivian","bolivianului":"bolivian","boliviene":["boliviene","bolivian","boliviene","boliviană"],"bolivienei":"boliviană","bolivienele":["bolivienele","bolivian","bolivienele","boliviană"],"bolivienelor":"boliviană","bolivieni":"bolivian","bolivienii":"bolivian","bolivienilor":"bolivian","bolizi":"bolid","bolizii":"bolid","bolizilor":"bolid","bolmojea":"bolmoji","bolmojeai":"bolmoji","bolmojeam":"bolmoji","bolmojeati":"bolmoji","bolmojeau":"bolmoji","bolmojesc":"bolmoji","bolmojeste":"bolmoji","bolmojesti":"bolmoji","bolmojii":"bolmoji","bolmojim":"bolmoji","bolmojind":"bolmoji","bolmojira":"bolmoji","bolmojiram":"bolmoji","bolmojirati":"bolmoji","bolmojise":"bolmoji","bolmojisem":"bolmoji","bolmojisera":"bolmoji","bolmojiseram":"bolmoji","bolmojiserati":"bolmoji","bolmojisesi":"bolmoji","bolmojisi":"bolmoji","bolmojit":"bolmoji","bolmojiti":"bolmoji","bolnava":["bolnavă","bolnav","bolnava","bolnav"],"bolnave":["bolnave","bolnav","bolnave","bolnavă"],"bolnavea":"bolnăvi","bolnaveai":"bolnăvi","bolnaveam":"bolnăvi","bolnaveati":"bolnăvi","bolnaveau":"bolnăvi","bolnavei":"bolnavă","bolnavele":["bolnavele","bolnav","bolnavele","bolnavă"],"bolnavelor":"bolnavă","bolnavesc":"bolnăvi","bolnaveste":"bolnăvi","bolnavesti":"bolnăvi","bolnavi":"bolnav","bolnavicioasa":["bolnăvicioasă","bolnăvicios","bolnăvicioasa","bolnăvicios"],"bolnavicioase":"bolnăvicios","bolnavicioasele":"bolnăvicios","bolnaviciosi":"bolnăvicios","bolnaviciosii":"bolnăvicios","bolnaviciosul":"bolnăvicios","bolnavii":["bolnavii","bolnav","bolnăvii","bolnăvi"],"bolnavim":"bolnăvi","bolnavind":"bolnăvi","bolnavioara":["bolnăvioară","bolnăvior","bolnăvioara","bolnăvior"],"bolnavioare":"bolnăvior","bolnavioarele":"bolnăvior","bolnaviori":"bolnăvior","bolnaviorii":"bolnăvior","bolnaviorul":"bolnăvior","bolnavira":"bolnăvi","bolnaviram":"bolnăvi","bolnavirati":"bolnăvi","bolnavise":"bolnăvi","bolnavisem":"bolnăvi","bolnavisera":"bolnăvi","bolnaviseram":"bolnăvi","bolnaviserati":"bolnăvi","bolnavisesi":"bolnăvi","bolnavisi":"bolnăvi","bolnavit":"bolnăvi","bolnaviti":"bolnăvi","bolnavul":"bolnav","bolnicerese":"bolnicereasă","bolniceresei":"bolnicereasă","bolniceresele":"bolnicereasă","bolnicereselor":"bolnicereasă","bolnite":"bolniță","bolnitei":"bolniță","bolnitele":"bolniță","bolnitelor":"bolniță","boloboace":["boloboace","boloboacă","boloboace","boloboc"],"bolobocele":"bolobocel","bolobocelele":"bolobocel","bolobocelelor":"bolobocel","bolobocelul":"bolobocel","bolobocelule":"bolobocel","bolobocelului":"bolobocel","bolocanei":"bolocănel","bolocaneii":"bolocănel","bolocaneilor":"bolocănel","bolocanelul":"bolocănel","bolocanelule":"bolocănel","bolocanelului":"bolocănel","bolohan":"bolovan","bolohani":"bolohan","bolohanii":"bolohan","bolohanilor":"bolohan","bolohanul":"bolohan","bolohanule":"bolohan","bolohanului":"bolohan","bolohonite":"bolohoniță","bolohonitei":"bolohoniță","bolohonitele":"bolohoniță","bolohonitelor":"bolohoniță","bolometre":"bolometru","bolometrele":"bolometru","bolometrelor":"bolometru","bolometrica":["bolometrică","bolometric","bolometrica","bolometric"],"bolometrice":"bolometric","bolometricele":"bolometric","bolometrici":"bolometric","bolometricii":"bolometric","bolometricul":"bolometric","bolometrul":"bolometru","bolometrule":"bolometru","bolometrului":"bolometru","bolonciagul":"bolonciag","bolonciagule":"bolonciag","bolonciagului":"bolonciag","bolonciaguri":"bolonciag","bolonciagurile":"bolonciag","bolonciagurilor":"bolonciag","bolovanei":"bolovănel","bolovaneli":"bolovănel","bolovanelii":"bolovănel","bolovanelilor":"bolovănel","bolovanelul":"bolovănel","bolovanelule":"bolovănel","bolovanelului":"bolovănel","bolovani":"bolovan","bolovanii":"bolovan","bolovanilor":"bolovan","bolovanisul":"bolovăniș","bolovanisule":"bolovăniș","bolovanisului":"bolovăniș","bolovanisuri":"bolovăniș","bolovanisurile":"bolovăniș","bolovanisurilor":"bolovăniș","bolovanoasa":["bolovănoasă","bolovănos","bolovănoasa","bolovănos"],"bolovanoase":"bolovănos","bolovanoasele":"bolovănos","bolovanosi":"bolovănos","bolovanosii":"bolovănos","bolovanosul":"bolovănos","bolovanul":"bolovan","bolovanule":"bolovan","bolovanului":"bolovan","bolozane":"bolozan","bolozanele":"bolozan","bolozanelor":"bolozan","bolozanul":"bolozan","bolozanule":"bolozan","bolozanului":"bolozan","bolsevice":"bolșevică","bolsevicei":"bolșevică","bolsevicele":"bolșevică","bolsevicelor":"bolșevică","bolsevici":"bolșevic","bolsevicii":"bolșevic","bolsevicilor":"bolșevic","bolsevicul":"bolșevic","bolsevicule":"bolșevic","bolsevicului":"bolșevic","bolsevismul":"bolșevism","bolsevismule":"bolșevism","bolsevismului":"bolșevism","bolsevizai":"bolșeviza","bolsevizam":["bolșevizăm","bolșeviza","bolșevizam","bolșeviza"],"bolsevizand":"bolșeviza","bolsevizara":"bolșeviza","bolsevizaram":"bolșeviza","bolsevizarati":"bolșeviza","bolsevizarea":"bolșevizare","bolsevizari":"bolșevizare","bolsevizarii":"bolșevizare","bolsevizarile":"bolșevizare","bolsevizarilor":"bolșevizare","bolsevizase":"bolșeviza","bolsevizasem":"bolșeviza","bolsevizasera":"bolșeviza","bolsevizaseram":"bolșeviza","bolsevizaserati":"bolșeviza","bolsevizasesi":"bolșeviza","bolsevizasi":"bolșeviza","bolsevizat":"bolșeviza","bolsevizata":["bolșevizată","bolșevizat","bolșevizata","bolșevizat"],"bolsevizate":"bolșevizat","bolsevizatele":"bolșevizat","bolsevizati":["bolșevizați","bolșeviza","bolșevizați","bolșevizat"],"bolsevizatii":"bolșevizat","bolsevizatul":"bolșevizat","bolsevizau":"bolșeviza","bolsevizeaza":"bolșeviza","bolsevizez":"bolșeviza","bolsevizezi":"bolșeviza","boltari":"bolțar","boltarii":"bolțar","boltarilor":"bolțar","boltarul":"bolțar","boltarule":"bolțar","boltarului":"bolțar","boltasi":"boltaș","boltasii":"boltaș","boltasilor":"boltaș","boltasul":"boltaș","boltasule":"boltaș","boltasului":"boltaș","bolte":"boltă","boltea":"bolti","bolteai":"bolti","bolteam":"bolti","bolteati":"bolti","bolteau":"bolti","boltei":"boltă","boltele":["boltele","boltă","boltele","bolteală"],"boltelei":"bolteală","boltelele":"bolteală","boltelelor":"bolteală","bolteli":"bolteală","boltelor":"boltă","boltesc":"bolti","bolteste":"bolti","boltesti":"bolti","boltii":"bolti","boltim":"bolti","boltind":"bolti","boltira":"bolti","boltiram":"bolti","boltirati":"bolti","boltirea":"boltire","boltiri":"boltire","boltirii":"boltire","boltirile":"boltire","boltirilor":"boltire","boltise":"bolti","boltisem":"bolti","boltisera":"bolti","boltiseram":"bolti","boltiserati":"bolti","boltisesi":"bolti","boltisi":"bolti","boltisoare":"boltișoară","boltisoarei":"boltișoară","boltisoarele":"boltișoară","boltisoarelor":"boltișoară","boltisul":"boltiș","boltisule":"boltiș","boltisului":"boltiș","boltisuri":"boltiș","boltisurile":"boltiș","boltisurilor":"boltiș","boltit":"bolti","boltita":["boltită","boltit","boltita","boltit"],"boltite":["boltite","boltit","boltițe","boltiță"],"boltitei":"boltiță","boltitele":["boltitele","boltit","boltițele","boltiță"],"boltitelor":"boltiță","boltiti":["boltiți","bolti","boltiți","boltit"],"boltitii":"boltit","boltitul":"boltit","boltituri":"boltitură","boltiturii":"boltitură","boltiturile":"boltitură","boltiturilor":"boltitură","boltul":"bolț","boltule":"bolț","boltului":"bolț","bolturi":"bolț","bolturile":"bolț","bolturilor":"bolț","bolul":"bol","bolule":"bol","bolului":"bol","bolunda":["bolundă","bolund","bolunda","bolund"],"bolunde":"bolund","bolundele":"bolund","bolundul":"bolund","bolunzi":"bolund","bolunzii":"bolund","boluri":"bol","bolurile":"bol","bolurilor":"bol","bombai":"bomba","bombaiale":"bombăială","bombaialei":"bombăială","bombairea":"bombăire","bombairi":"bombăire","bombairii":"bombăire","bombairile":"bombăire","bombairilor":"bombăire","bombaituri":"bombăitură","bombaiturii":"bombăitură","bombaiturile":"bombăitură","bombaiturilor":"bombăitură","bombam":["bombăm","bomba","bombam","bomba"],"bomband":"bomba","bombanea":"bombăni","bombaneai":"bombăni","bombaneam":"bombăni","bombaneati":"bombăni","bombaneau":"bombăni","bombaneli":"bombăneală","bombanelii":"bombăneală","bombanelile":"bombăneală","bombanelilor":"bombăneală","bombanesc":"bombăni","bombaneste":"bombăni","bombanesti":"bombăni","bombanii":"bombăni","bombanim":"bombăni","bombanind":"bombăni","bombanira":"bombăni","bombaniram":"bombăni","bombanirati":"bombăni","bombanirea":"bombănire","bombaniri":"bombănire","bombanirii":"bombănire","bombanirile":"bombănire","bombanirilor":"bombănire","bombanise":"bombăni","bombanisem":"bombăni","bombanisera":"bombăni","bombaniseram":"bombăni","bombaniserati":"bombăni","bombanisesi":"bombăni","bombanisi":"bombăni","bombanit":"bombăni","bombanita":["bombănită","bombănit","bombănita","bombănit"],"bombanite":"bombănit","bombanitele":"bombănit","bombaniti":["bombăniți","bombăni","bombăniți","bombănit"],"bombanitii":"bombănit","bombanitoare":"bombănitor","bombanitoarea":"bombănitor","bombanitoarele":"bombănitor","bombanitori":"bombănitor","bombanitorii":"bombănitor","bombanitorul":"bombănitor","bombanitul":"bombănit","bombanituri":"bombănitură","bombaniturii":"bombănitură","bombaniturile":"bombănitură","bombaniturilor":"bombănitură","bombara":"bomba","bombaram":"bomba","bombarati":"bomba","bombardai":"bombarda","bombardam":["bombardăm","bombarda","bombardam","bombarda"],"bombardamente":"bombardament","bombardamentele":"bombardament","bombardamentelor":"bombardament","bombardamentul":"bombardament","bombardamentule":"bombardament","bombardamentului":"bombardament","bombardand":"bombarda","bombardara":"bombarda","bombardaram":"bombarda","bombardarati":"bombarda","bombardarea":"bombardare","bombardari":"bombardare","bombardarii":"bombardare","bombardarile":"bombardare","bombardarilor":"bombardare","bombardase":"bombarda","bombardasem":"bombarda","bombardasera":"bombarda","bombardaseram":"bombarda","bombardaserati":"bombarda","bombardasesi":"bombarda","bombardasi":"bombarda","bombardat":"bombarda","bombardati":"bombarda","bombardau":"bombarda","bombarde":"bombardă","bombardeaza":"bombarda","bombardei":"bombardă","bombardele":"bombardă","bombardelor":"bombardă","bombardez":"bombarda","bombardezi":"bombarda","bombardiere":"bombardier","bombardierele":"bombardier","bombardierelor":"bombardier","bombardieri":"bombardier","bombardierii":"bombardier","bombardierilor":"bombardier","bombardierul":"bombardier","bombardierule":"bombardier","bombardierului":"bombardier","bombardoane":"bombardon","bombardoanele":"bombardon","bombardoanelor":"bombardon","bombardonul":"bombardon","bombardonule":"bombardon","bombardonului":"bombardon","bombarea":"bombare","bombari":["bombari","bombar","bombări","bombare"],"bombarii":["bombarii","bombar","bombării","bombare"],"bombarile":"bombare","bombarilor":["bombarilor","bombar","bombărilor","bombare"],"bombarul":"bombar","bombarule":"bombar","bombarului":"bombar","bombase":"bomba","bombasem":"bomba","bombasera":"bomba","bombaseram":"bomba","bombaserati":"bomba","bombasesi":"bomba","bombasi":"bomba","bombasta":["bombastă","bombast","bombasta","bombast"],"bombaste":"bombast","bombastele":"bombast","bombasti":"bombast","bombastica":["bombastică","bombastic","bombastica","bombastic"],"bombastice":"bombastic","bombasticele":"bombastic","bombastici":"bombastic","bombasticii":"bombastic","bombasticisme":"bombasticism","bombasticismele":"bombasticism","bombasticismelor":"bombasticism","bombasticismul":"bombasticism","bombasticismule":"bombasticism","bombasticismului":"bombasticism","bombasticul":"bombastic","bombastii":"bombast","bombastul":"bombast","bombat":"bomba","bombata":["bombată","bombat","bombata","bombat"],"bombate":"bombat","bombatele":"bombat","bombati":["bombați","bomba","bombați","bombat"],"bombatii":"bombat","bombatul":"bombat","bombau":"bomba","bombe":"bombă","bombe atomice":"bombă atomică","bombe cu cuie":"bombă cu cuie","bombe cu hidrogen":"bombă cu hidrogen","bombe h":"bombă H","bombe meteorologice":"bombă meteorologică","bombe nucleare":"bombă nucleară","bombe vulcanice":"bombă vulcanică","bombeaza":"bomba","bombei":"bombă","bombele":"bombă","bombelor":"bombă","bombeuri":"bombeu","bombeurile":"bombeu","bombeurilor":"bombeu","bombeuul":"bombeu","bombeuule":"bombeu","bombeuului":"bombeu","bombez":"bomba","bombezi":"bomba","bombite":"bombiță","bombitei":"bombiță","bombitele":"bombiță","bombitelor":"bombiță","bomboane":"bomboană","bomboane de menta":"bomboană de mentă","bomboanei":"bomboană","bomboanele":"bomboană","bomboanelor":"bomboană","bomboante":"bomboanță","bomboantei":"bomboanță","bomboantele":"bomboanță","bomboantelor":"bomboanță","bombon":"bomboană","bombona":"bomboană","bombonari":"bombonar","bombonarii":"bombonar","bombonarilor":"bombonar","bombonarul":"bombonar","bombonarule":"bombonar","bombonarului":"bombonar","bombone":"bombónă","bomboneaua":"bombonea","bombonei":"bombonel","bomboneii":"bombonel","bomboneilor":"bombonel","bombonele":"bombonea","bombonelei":"bombonea","bombonelele":"bombonea","bombonelelor":"bombonea","bombonelul":"bombonel","bombonelule":"bombonel","bombonelului":"bombonel","bomboneria":"bombonerie","bomboneriei":"bombonerie","bombonerii":"bombonerie","bomboneriile":"bombonerie","bomboneriilor":"bombonerie","bombonici":"bombonică","bombonicii":"bombonică","bombonicile":"bombonică","bombonicilor":"bombonică","bomboniere":"bombonieră","bombonierei":"bombonieră","bombonierele":"bombonieră","bombonierelor":"bombonieră","bomfaiere":"bomfaier","bomfaierele":"bomfaier","bomfaierelor":"bomfaier","bomfaierul":"bomfaier","bomfaierule":"bomfaier","bomfaierului":"bomfaier","bomprese":"bompres","bompresele":"bompres","bompreselor":"bompres","bompresul":"bompres","bompresule":"bompres","bompresului":"bompres","bonaeste":"bonăi","bonaia":"bonăi","bonaiai":"bonăi","bonaiam":"bonăi","bonaiati":"bonăi","bonaiau":"bonăi","bonaiesc":"bonăi","bonaieste":"bonăi","bonaiesti":"bonăi","bonaii":"bonăi","bonaim":"bonăi","bonaind":"bonăi","bonaira":"bonăi","bonairam":"bonăi","bonairati":"bonăi","bonaise":"bonăi","bonaisem":"bonăi","bonaisera":"bonăi","bonaiseram":"bonăi","bonaiserati":"bonăi","bonaisesi":"bonăi","bonaisi":"bonăi","bonait":"bonăi","bonaiti":"bonăi","bonaitul":"bonăit","bonaitule":"bonăit","bonaitului":"bonăit","bonaituri":"bonăit","bonaiturile":"bonăit","bonaiturilor":"bonăit","bonapartisme":"bonapartism","bonapartismele":"bonapartism","bonapartismelor":"bonapartism","bonapartismul":"bonapartism","bonapartismule":"bonapartism","bonapartismului":"bonapartism","bonapartiste":"bonapartistă","bonapartistei":"bonapartistă","bonapartistele":"bonapartistă","bonapartistelor":"bonapartistă","bonapartisti":"bonapartist","bonapartistii":"bonapartist","bonapartistilor":"bonapartist","bonapartistul":"bonapartist","bonapartistule":"bonapartist","bonapartistului":"bonapartist","bonboane":"bonbon","bonboanele":"bonbon","bonboanelor":"bonbon","bonbonul":"bonbon","bonbonule":"bonbon","bonbonului":"bonbon","boncanitul":"boncănit","boncanitule":"boncănit","boncanitului":"boncănit","boncanituri":"boncănit","boncaniturile":"boncănit","boncaniturilor":"boncănit","bondarasi":"bondăraș","bondarasii":"bondăraș","bondarasilor":"bondăraș","bondarasul":"bondăraș","bondarasule":"bondăraș","bondarasului":"bondăraș","bondari":"bondar","bondarii":"bondar","bondarilor":"bondar","bondarimea":"bondărime","bondarimi":"bondărime","bondarimii":"bondărime","bondarimile":"bondărime","bondarimilor":"bondărime","bondaroiul":"bondăroi","bondaroiule":"bondăroi","bondaroiului":"bondăroi","bondarul":"bondar","bondarule":"bondar","bondarului":"bondar","bonde":"bondă","bondei":"bondă","bondele":"bondă","bondelor":"bondă","bondite":"bondiță","bonditei":"bondiță","bonditele":"bondiță","bonditelor":"bondiță","bondoca":["bondocă","bondoc","bondoca","bondoc"],"bondoce":"bondoc","bondocela":["bondocelă","bondocel","bondocela","bondocel"],"bondocele":["bondocele","bondoc","bondocele","bondocel"],"bondocelele":"bondocel","bondoceli":"bondocel","bondocelii":"bondocel","bondocelul":"bondocel","bondoci":"bondoc","bondocii":"bondoc","bondocilor":"bondoc","bondocul":"bondoc","bondocule":"bondoc","bondocului":"bondoc","bondreti":"bondreț","bondretii":"bondreț","bondretilor":"bondreț","bondretul":"bondreț","bondretule":"bondreț","bondretului":"bondreț","bone":"bonă","bonei":"bonă","bonele":"bonă","bonelor":"bonă","bonete":"bonetă","bonete frigiene":"bonetă frigiană","bonetei":"bonetă","bonetele":["bonetele","bonetă","bonețele","bonețel","bonețele","bonețică"],"bonetelele":"bonețel","bonetelelor":"bonețel","bonetelor":"bonetă","bonetelul":"bonețel","bonetelule":"bonețel","bonetelului":"bonețel","bonetice":"bonețică","boneticei":"bonețică","boneticele":"bonețică","boneticelor":"bonețică","bongari":"bongar","bongarii":"bongar","bongarilor":"bongar","bongarul":"bongar","bongarule":"bongar","bongarului":"bongar","bongute":"bonguță","bongutei":"bonguță","bongutele":"bonguță","bongutelor":"bonguță","bonific":"bonifica","bonificai":"bonifica","bonificam":["bonificăm","bonifica","bonificam","bonifica"],"bonificand":"bonifica","bonificara":"bonifica","bonificaram":"bonifica","bonificarati":"bonifica","bonificarea":"bonificare","bonificari":"bonificare","bonificarii":"bonificare"};
@@ -0,0 +1 @@
+export default {"bonificarile":"bonificare","bonificarilor":"bonificare","bonificase":"bonifica","bonificasem":"bonifica","bonificasera":"bonifica","bonificaseram":"bonifica","bonificaserati":"bonifica","bonificasesi":"bonifica","bonificasi":"bonifica","bonificat":"bonifica","bonificati":"bonifica","bonificatia":"bonificație","bonificatiei":"bonificație","bonificatii":"bonificație","bonificatiile":"bonificație","bonificatiilor":"bonificație","bonificau":"bonifica","bonifice":"bonifica","bonifici":"bonifica","bonitatea":"bonitate","bonitati":"bonitate","bonitatii":"bonitate","bonitatile":"bonitate","bonitatilor":"bonitate","bonomi":"bonom","bonomia":"bonomie","bonomiei":"bonomie","bonomii":["bonomii","bonom","bonomii","bonomie"],"bonomilor":"bonom","bonomul":"bonom","bonomule":"bonom","bonomului":"bonom","bontanirea":"bontănire","bontaniri":"bontănire","bontanirii":"bontănire","bontanirile":"bontănire","bontanirilor":"bontănire","bontanituri":"bontănitură","bontaniturii":"bontănitură","bontaniturile":"bontănitură","bontaniturilor":"bontănitură","bontasi":"bontaș","bontasii":"bontaș","bontasilor":"bontaș","bontasul":"bontaș","bontasule":"bontaș","bontasului":"bontaș","bonti":"bont","bontii":"bont","bontul":"bont","bonul":"bon","bonule":"bon","bonului":"bon","bonuri":"bon","bonuri de tezaur":"bon de tezaur","bonurile":"bon","bonurilor":"bon","bonusul":"bonus","bonusule":"bonus","bonusului":"bonus","bonusuri":"bonus","bonusurile":"bonus","bonusurilor":"bonus","bonzalai":"bonzălău","bonzalaii":"bonzălău","bonzalailor":"bonzălău","bonzalauul":"bonzălău","bonzalauule":"bonzălău","bonzalauului":"bonzălău","bonzarasi":"bonzăraș","bonzarasii":"bonzăraș","bonzarasilor":"bonzăraș","bonzarasul":"bonzăraș","bonzarasule":"bonzăraș","bonzarasului":"bonzăraș","bonzaroiul":"bonzăroi","bonzaroiule":"bonzăroi","bonzaroiului":"bonzăroi","bonzi":"bonz","bonzii":"bonz","bonzilor":"bonz","bonzul":"bonz","bonzule":"bonz","bonzului":"bonz","boomul":"boom","boomule":"boom","boomului":"boom","boomuri":"boom","boomurile":"boom","boomurilor":"boom","bor":"bori","bora":"borî","borabari":"borabăr","borabarii":"borabăr","borabarilor":"borabăr","borabarul":"borabăr","borabarule":"borabăr","borabarului":"borabăr","boracitul":"boracit","boracitule":"boracit","boracitului":"boracit","boracituri":"boracit","boraciturile":"boracit","boraciturilor":"boracit","borai":["borai","borî","borâi","borî"],"boram":["borâm","borî","boram","borî"],"borand":"borî","borandaita":["borândăită","borândăit","borândăita","borândăit"],"borandaite":"borândăit","borandaitele":"borândăit","borandaiti":"borândăit","borandaitii":"borândăit","borandaitul":"borândăit","borane":"borană","boranei":"borană","borangicul":"borangic","borangicule":"borangic","borangicului":"borangic","borangicuri":"borangic","borangicurile":"borangic","borangicurilor":"borangic","borara":"borî","boraram":"borî","borarati":"borî","borarea":"borâre","borari":"borâre","borarii":"borâre","borarile":"borâre","borarilor":"borâre","borasc":"borî","borasca":"bori","borase":"borî","borasem":"borî","borasera":"borî","boraseram":"borî","boraserati":"borî","borasesi":"borî","borasi":"borî","boraste":"borî","borasti":"borî","borat":"borî","borata":["borâtă","borât","borâta","borât"],"borate":"borât","boratele":"borât","borati":["borați","borat","borâți","borât","borâți","borî","borați","borî"],"boratii":["borații","borat","borâții","borât"],"boratilor":"borat","boratul":["boratul","borat","borâtul","borât"],"boratule":"borat","boratului":"borat","borature":"borâtură","boraturei":"borâtură","boraturele":"borâtură","boraturelor":"borâtură","boraturi":"borâtură","borau":"borî","boraxul":"borax","boraxule":"borax","boraxului":"borax","borboline":"borbolină","borbolinei":"borbolină","borbolinele":"borbolină","borbolinelor":"borbolină","borborigmele":"borborigme","borborigmelor":"borborigme","borcanase":"borcănaș","borcanasele":"borcănaș","borcanaselor":"borcănaș","borcanasul":"borcănaș","borcanasule":"borcănaș","borcanasului":"borcănaș","borcanata":["borcănată","borcănat","borcănata","borcănat"],"borcanate":"borcănat","borcanatele":"borcănat","borcanati":"borcănat","borcanatii":"borcănat","borcanatul":"borcănat","borcane":"borcan","borcanece":"borcăneci","borcanecele":"borcăneci","borcanecelor":"borcăneci","borcaneciul":"borcăneci","borcaneciule":"borcăneci","borcaneciului":"borcăneci","borcanele":["borcanele","borcan","borcănele","borcănel"],"borcanelele":"borcănel","borcanelelor":"borcănel","borcanelor":"borcan","borcanelul":"borcănel","borcanelule":"borcănel","borcanelului":"borcănel","borcanoasa":["borcănoasă","borcănos","borcănoasa","borcănos"],"borcanoase":"borcănos","borcanoasele":"borcănos","borcanosi":"borcănos","borcanosii":"borcănos","borcanosul":"borcănos","borcanul":"borcan","borcanule":"borcan","borcanului":"borcan","borceagul":"borceag","borceagule":"borceag","borceagului":"borceag","borceaguri":"borceag","borceagurile":"borceag","borceagurilor":"borceag","borcii":"borci","borciii":"borci","borciilor":"borci","borciul":"borci","borciule":"borci","borciului":"borci","borcutul":"borcut","borcutule":"borcut","borcutului":"borcut","borcuturi":"borcut","borcuturile":"borcut","borcuturilor":"borcut","bordaje":"bordaj","bordajele":"bordaj","bordajelor":"bordaj","bordajul":"bordaj","bordajule":"bordaj","bordajului":"bordaj","bordani":"bordan","bordanii":"bordan","bordanilor":"bordan","bordanul":"bordan","bordanule":"bordan","bordanului":"bordan","bordeiase":"bordeiaș","bordeiasele":"bordeiaș","bordeiaselor":"bordeiaș","bordeiasul":"bordeiaș","bordeiasule":"bordeiaș","bordeiasului":"bordeiaș","bordeie":"bordei","bordeiele":"bordei","bordeielor":"bordei","bordeiul":"bordei","bordeiule":"bordei","bordeiului":"bordei","bordelul":"bordel","bordelule":"bordel","bordelului":"bordel","bordeluri":"bordel","bordelurile":"bordel","bordelurilor":"bordel","borderouri":"borderou","borderourile":"borderou","borderourilor":"borderou","borderouul":"borderou","borderouule":"borderou","borderouului":"borderou","bordeute":"bordeuț","bordeutele":"bordeuț","bordeutelor":"bordeuț","bordeutul":"bordeuț","bordeutule":"bordeuț","bordeutului":"bordeuț","bordiasa":["bordiașă","bordiaș","bordiașa","bordiaș"],"bordiase":"bordiaș","bordiasele":"bordiaș","bordiasi":"bordiaș","bordiasii":"bordiaș","bordiasul":"bordiaș","bordiceni":"bordicen","bordicenii":"bordicen","bordicenilor":"bordicen","bordicenul":"bordicen","bordicenule":"bordicen","bordicenului":"bordicen","bordioasa":["bordioasă","bordios","bordioasa","bordios"],"bordioase":"bordios","bordioasele":"bordios","bordiosi":"bordios","bordiosii":"bordios","bordiosul":"bordios","bordul":"bord","bordule":"bord","bordului":"bord","borduri":["borduri","bord","borduri","bordură"],"bordurii":"bordură","bordurile":["bordurile","bord","bordurile","bordură"],"bordurilor":["bordurilor","bord","bordurilor","bordură"],"borduse":"borduș","bordusele":"borduș","borduselor":"borduș","bordusul":"borduș","bordusule":"borduș","bordusului":"borduș","bore":"bori","borea":"bori","boreai":"bori","boreala":["boreală","boreal","boreala","boreal"],"boreale":"boreal","borealele":"boreal","boreali":"boreal","borealii":"boreal","borealul":"boreal","boream":"bori","boreati":"bori","boreau":"bori","borele":"boreală","borelei":"boreală","borelele":"boreală","borelelor":"boreală","boreli":"boreală","borese":"boreasă","boresei":"boreasă","boresele":"boreasă","boreselor":"boreasă","boreste":"bori","borfari":"borfar","borfarii":"borfar","borfarilor":"borfar","borfarul":"borfar","borfarule":"borfar","borfarului":"borfar","borfasi":"borfaș","borfasia":"borfășie","borfasiei":"borfășie","borfasii":["borfașii","borfaș","borfășii","borfășie"],"borfasiile":"borfășie","borfasiilor":"borfășie","borfasilor":"borfaș","borfasul":"borfaș","borfasule":"borfaș","borfasului":"borfaș","borfoii":"borfoi","borfoilor":"borfoi","borfoiul":"borfoi","borfoiule":"borfoi","borfoiului":"borfoi","borhotul":"borhot","borhotule":"borhot","borhotului":"borhot","borhoturi":"borhot","borhoturile":"borhot","borhoturilor":"borhot","borica":["borică","boric","borica","boric"],"boricata":["boricată","boricat","boricata","boricat"],"boricate":"boricat","boricatele":"boricat","boricati":"boricat","boricatii":"boricat","boricatul":"boricat","borice":"boric","boricele":"boric","borici":"boric","boricii":"boric","boricul":"boric","borii":"bori","borim":"bori","borind":"bori","borindait":"borândăit","borira":"bori","boriram":"bori","borirati":"bori","borire":"borâre","borise":"bori","borisem":"bori","borisera":"bori","boriseram":"bori","boriserati":"bori","borisesi":"bori","borisi":"bori","borit":["borît","borât","borit","bori"],"boriti":"bori","boritu":"Borâtu","boritul":"borit","boritule":"borit","boritului":"borit","boritura":"borâtură","borituri":"borit","boriturile":"borit","boriturilor":"borit","bormasini":"bormașină","bormasinii":"bormașină","bormasinile":"bormașină","bormasinilor":"bormașină","bornai":"borna","bornaje":"bornaj","bornajele":"bornaj","bornajelor":"bornaj","bornajul":"bornaj","bornajule":"bornaj","bornajului":"bornaj","bornam":["bornăm","borna","bornam","borna"],"bornand":"borna","bornara":"borna","bornaram":"borna","bornarati":"borna","bornarea":"bornare","bornari":"bornare","bornarii":"bornare","bornarile":"bornare","bornarilor":"bornare","bornase":"borna","bornasem":"borna","bornasera":"borna","bornaseram":"borna","bornaserati":"borna","bornasesi":"borna","bornasi":"borna","bornat":"borna","bornata":["bornată","bornat","bornata","bornat"],"bornate":"bornat","bornatele":"bornat","bornati":["bornați","borna","bornați","bornat"],"bornatii":"bornat","bornatul":"bornat","bornau":"borna","bornaul":"bornău","bornaule":"bornău","bornaului":"bornău","borne":"bornă","borneaza":"borna","bornee":"borneu","borneele":"borneu","borneelor":"borneu","bornei":"bornă","bornele":"bornă","bornelor":"bornă","borneolul":"borneol","borneolule":"borneol","borneolului":"borneol","borneoluri":"borneol","borneolurile":"borneol","borneolurilor":"borneol","borneuul":"borneu","borneuule":"borneu","borneuului":"borneu","bornez":"borna","bornezi":"borna","bornite":"borniță","bornitei":"borniță","bornitele":"borniță","bornitelor":"borniță","borniti":"bornit","bornitii":"bornit","bornitilor":"bornit","bornitul":"bornit","bornitule":"bornit","bornitului":"bornit","bornutul":"bornut","bornutule":"bornut","bornutului":"bornut","bornuturi":"bornut","bornuturile":"bornut","bornuturilor":"bornut","boroace":"boroacă","boroacei":"boroacă","boroacele":"boroacă","boroacelor":"boroacă","boroanaul":"boroană","boroanaule":"boroană","boroanaului":"boroană","boroane":"boroană","boroanele":"boroană","boroanelor":"boroană","boroboate":"boroboață","boroboatei":"boroboață","boroboatele":"boroboață","boroboatelor":"boroboață","borobotita":["borobotită","borobotit","borobotita","borobotit"],"borobotite":"borobotit","borobotitele":"borobotit","borobotiti":"borobotit","borobotitii":"borobotit","borobotitul":"borobotit","boroslani":"boroslan","boroslanii":"boroslan","boroslanilor":"boroslan","boroslanul":"boroslan","boroslanule":"boroslan","boroslanului":"boroslan","borosteanul":"boroștean","borosteanule":"boroștean","borosteanului":"boroștean","borosteni":"boroștean","borostenii":"boroștean","borostenilor":"boroștean","borosuci":"borosuc","borosucii":"borosuc","borosucilor":"borosuc","borosucul":"borosuc","borosucule":"borosuc","borosucului":"borosuc","bors":"borși","borse":"borși","borsea":"borși","borseai":"borși","borseam":"borși","borseati":"borși","borseau":"borși","borsete":"borsetă","borsetei":"borsetă","borsetele":"borsetă","borsetelor":"borsetă","borsici":"borșică","borsicii":"borșică","borsicile":"borșică","borsicilor":"borșică","borsie":"borși","borsii":"borși","borsim":"borși","borsind":"borși","borsira":"borși","borsiram":"borși","borsirati":"borși","borsise":"borși","borsisem":"borși","borsisera":"borși","borsiseram":"borși","borsiserati":"borși","borsisesi":"borși","borsisi":"borși","borsisorul":"borșișor","borsisorule":"borșișor","borsisorului":"borșișor","borsit":"borși","borsita":["borșită","borșit","borșita","borșit"],"borsite":"borșit","borsitele":"borșit","borsiti":["borșiți","borși","borșiți","borșit"],"borsitii":"borșit","borsitul":"borșit","borsul":"borș","borsule":"borș","borsului":"borș","borsuri":"borș","borsurile":"borș","borsurilor":"borș","borte":"bortă","bortei":"bortă","borteici":"borteică","borteicii":"borteică","borteicile":"borteică","borteicilor":"borteică","bortele":"bortă","bortelirea":"bortelire","borteliri":"bortelire","bortelirii":"bortelire","bortelirile":"bortelire","bortelirilor":"bortelire","bortelita":["bortelită","bortelit","bortelita","bortelit"],"bortelite":"bortelit","bortelitele":"bortelit","borteliti":"bortelit","bortelitii":"bortelit","bortelitul":"bortelit","bortelor":"bortă","borticeaua":"borticea","borticele":["borticele","borticea","borticele","borticică"],"borticelei":["borticelei","borticea","borticelei","borticică"],"borticelele":["borticelele","borticea","borticelele","borticică"],"borticelelor":["borticelelor","borticea","borticelelor","borticică"],"bortirea":"bortire","bortiri":"bortire","bortirii":"bortire","bortirile":"bortire","bortirilor":"bortire","bortite":"bortiță","bortitei":"bortiță","bortitele":"bortiță","bortitelor":"bortiță","bortituri":"bortitură","bortiturii":"bortitură","bortiturile":"bortitură","bortiturilor":"bortitură","bortoasa":["bortoasă","bortos","bortoasa","bortos","borțoasă","borțos","borțoasa","borțos"],"bortoase":["borțoase","borțoasă","bortoase","bortos","borțoase","borțos"],"bortoasei":"borțoasă","bortoasele":["borțoasele","borțoasă","bortoasele","bortos","borțoasele","borțos"],"bortoaselor":"borțoasă","bortosela":["borțoșelă","borțoșel","borțoșela","borțoșel"],"bortosele":"borțoșel","bortoselele":"borțoșel","bortoseli":"borțoșel","bortoselii":"borțoșel","bortoselul":"borțoșel","bortosi":["bortoși","bortos","borțoși","borțos"],"bortosii":["bortoșii","bortos","borțoșii","borțos"],"bortosul":["bortosul","bortos","borțosul","borțos"],"bortul":"borț","bortule":"borț","bortului":"borț","borturi":["borțuri","borț","borturi","bortură"],"borturii":"bortură","borturile":["borțurile","borț","borturile","bortură"],"borturilor":["borțurilor","borț","borturilor","bortură"],"borturoasa":["borturoasă","borturos","borturoasa","borturos"],"borturoase":"borturos","borturoasele":"borturos","borturosi":"borturos","borturosii":"borturos","borturosul":"borturos","borul":"bor","borule":"bor","borului":"bor","boruri":["boruri","bor","boruri","borură"],"borurii":"borură","borurile":["borurile","bor","borurile","borură"],"borurilor":["borurilor","bor","borurilor","borură"],"boruse":"borus","borusele":"borus","boruselor":"borus","borusul":"borus","borusule":"borus","borusului":"borus","borvizul":"borviz","borvizule":"borviz","borvizului":"borviz","borzosa":["borzoșă","borzoș","borzoșa","borzoș"],"borzose":"borzoș","borzosele":"borzoș","borzosi":"borzoș","borzosii":"borzoș","borzosul":"borzoș","bosaje":"bosaj","bosajele":"bosaj","bosajelor":"bosaj","bosajul":"bosaj","bosajule":"bosaj","bosajului":"bosaj","bosari":"boșar","bosarii":"boșar","bosarilor":"boșar","bosarul":"boșar","bosarule":"boșar","bosarului":"boșar","boscairea":"boscăire","boscairi":"boscăire","boscairii":"boscăire","boscairile":"boscăire","boscairilor":"boscăire","boscaita":["boscăită","boscăit","boscăita","boscăit"],"boscaite":"boscăit","boscaitele":"boscăit","boscaiti":"boscăit","boscaitii":"boscăit","boscaitul":"boscăit","boscari":"boscar","boscaria":"boscărie","boscariei":"boscărie","boscarii":["boscarii","boscar","boscării","boscărie"],"boscariile":"boscărie","boscariilor":"boscărie","boscarilor":"boscar","boscarul":"boscar","boscarule":"boscar","boscarului":"boscar","boscasul":"boșcaș","boscasule":"boșcaș","boscasului":"boșcaș","boscelute":"bosceluță","boscelutei":"bosceluță","boscelutele":"bosceluță","boscelutelor":"bosceluță","boschetare":"boschetară","boschetarei":"boschetară","boschetarele":"boschetară","boschetarelor":"boschetară","boschetari":"boschetar","boschetarii":"boschetar","boschetarilor":"boschetar","boschetarul":"boschetar","boschetarule":"boschetar","boschetarului":"boschetar","boschete":"boschet","boschetele":"boschet","boschetelor":"boschet","boschetul":"boschet","boschetule":"boschet","boschetului":"boschet","boschine":"boschină","boschinei":"boschină","boschinele":"boschină","boschinelor":"boschină","boscodirea":"boscodire","boscodiri":"boscodire","boscodirii":"boscodire","boscodirile":"boscodire","boscodirilor":"boscodire","boscodita":["boscodită","boscodit","boscodita","boscodit"],"boscodite":"boscodit","boscoditele":"boscodit","boscoditi":"boscodit","boscoditii":"boscodit","boscoditul":"boscodit","bosconite":"bosconiță","bosconitei":"bosconiță","bosconitele":"bosconiță","bosconitelor":"bosconiță","boscoroadele":"boscoroade","boscoroadelor":"boscoroade","boscorodeli":"boscorodeală","boscorodelii":"boscorodeală","boscorodelile":"boscorodeală","boscorodelilor":"boscorodeală","boscoroi":"bosorcoi","boscoroii":"bosorcoi","boscoroilor":"bosorcoi","bosi":["boși","bos","boși","boss"],"bosii":["boșii","bos","boșii","boss"],"bosilor":["boșilor","bos","boșilor","boss"],"bosimane":"boșimană","bosimanei":"boșimană","bosimanele":"boșimană","bosimanelor":"boșimană","bosimani":"boșiman","bosimanii":"boșiman","bosimanilor":"boșiman","bosimanul":"boșiman","bosimanule":"boșiman","bosimanului":"boșiman","bosmale":"bosma","bosmalei":"bosma","bosmalele":"bosma","bosmalelor":"bosma","bosmaua":"bosma","bosnata":["bosnată","bosnat","bosnata","bosnat"],"bosnate":"bosnat","bosnatele":"bosnat","bosnati":"bosnat","bosnatii":"bosnat","bosnatul":"bosnat","bosneana":["bosneană","bosnean","bosneana","bosnean"],"bosneanul":"bosnean","bosnene":"bosnean","bosnenele":"bosnean","bosneni":"bosnean","bosnenii":"bosnean","bosniaca":["bosniacă","bosniac","bosniaca","bosniac"],"bosniace":["bosniace","bosniac","bosniace","bosniacă"],"bosniacei":"bosniacă","bosniacele":["bosniacele","bosniac","bosniacele","bosniacă"],"bosniacelor":"bosniacă","bosniaci":"bosniac","bosniacii":"bosniac","bosniacilor":"bosniac","bosniacul":"bosniac","bosniacule":"bosniac","bosniacului":"bosniac","bosolirea":"bosolire","bosoliri":"bosolire","bosolirii":"bosolire","bosolirile":"bosolire","bosolirilor":"bosolire","bosolita":["bosolită","bosolit","bosolita","bosolit"],"bosolite":"bosolit","bosolitele":"bosolit","bosoliti":"bosolit","bosolitii":"bosolit","bosolitul":"bosolit","bosorcai":"bosorcaie","bosorcaiea":"bosorcaie","bosorcaii":"bosorcaie","bosorcaile":"bosorcaie","bosorcailor":"bosorcaie","bosorcoiul":"bosorcoi","bosorcoiule":"bosorcoi","bosorcoiului":"bosorcoi","bosoroaga":["boșoroagă","boșorog","boșoroaga","boșorog"],"bosoroage":["boșoroage","boșoroagă","boșoroage","boșorog"],"bosoroagei":"boșoroagă","bosoroagele":["boșoroagele","boșoroagă","boșoroagele","boșorog"],"bosoroagelor":"boșoroagă","bosorogea":"boșorogi","bosorogeai":"boșorogi","bosorogeam":"boșorogi","bosorogeati":"boșorogi","bosorogeau":"boșorogi","bosorogeli":"boșorogeală","bosorogelii":"boșorogeală","bosorogelile":"boșorogeală","bosorogelilor":"boșorogeală","bosorogesc":"boșorogi","bosorogeste":"boșorogi","bosorogesti":"boșorogi","bosorogi":"boșorog","bosorogii":["boșorogii","boșorog","boșorogii","boșorogi"],"bosorogilor":"boșorog","bosorogim":"boșorogi","bosorogind":"boșorogi","bosorogira":"boșorogi","bosorogiram":"boșorogi","bosorogirati":"boșorogi","bosorogise":"boșorogi","bosorogisem":"boșorogi","bosorogisera":"boșorogi","bosorogiseram":"boșorogi","bosorogiserati":"boșorogi","bosorogisesi":"boșorogi","bosorogisi":"boșorogi","bosorogit":"boșorogi","bosorogiti":"boșorogi","bosorogul":"boșorog","bosorogule":"boșorog","bosorogului":"boșorog","bossisme":"bossism","bossismele":"bossism","bossismelor":"bossism","bossismul":"bossism","bossismule":"bossism","bossismului":"bossism","bossul":"boss","bossule":"boss","bossului":"boss","bostanari":"bostănar","bostanaria":"bostănărie","bostanariei":"bostănărie","bostanarii":["bostănarii","bostănar","bostănării","bostănărie"],"bostanariile":"bostănărie","bostanariilor":"bostănărie","bostanarilor":"bostănar","bostanarul":"bostănar","bostanarule":"bostănar","bostanarului":"bostănar","bostanasi":"bostănaș","bostanasii":"bostănaș","bostanasilor":"bostănaș","bostanasul":"bostănaș","bostanasule":"bostănaș","bostanasului":"bostănaș","bostane":"bostană","bostanei":["bostanei","bostană","bostănei","bostănel"],"bostanele":"bostană","bostaneli":"bostănel","bostanelii":"bostănel","bostanelilor":"bostănel","bostanelor":"bostană","bostanelul":"bostănel","bostanelule":"bostănel","bostanelului":"bostănel","bostangii":"bostangiu","bostangiii":"bostangiu","bostangiilor":"bostangiu","bostangiul":"bostangiu","bostangiule":"bostangiu","bostangiului":"bostangiu","bostani":"bostan","bostanii":"bostan","bostanilor":"bostan","bostanoase":"bostănoasă","bostanoasei":"bostănoasă","bostanoasele":"bostănoasă","bostanoaselor":"bostănoasă","bostanul":"bostan","bostanule":"bostan","bostanului":"bostan","boste":"boșcă","bostei":"boșcă","bostele":"boșcă","bostelor":"boșcă","bosti":"boșcă","bostine":"boștină","bostinei":"boștină","bostinele":"boștină","bostinelor":"boștină","bosuioace":"bosuioc","bosuioacele":"bosuioc","bosuioacelor":"bosuioc","bosuiocul":"bosuioc","bosuiocule":"bosuioc","bosuiocului":"bosuioc","bosul":["bosul","bos","boșul","boș"],"bosule":["bosule","bos","boșule","boș"],"bosului":["bosului","bos","boșului","boș"],"bosumflai":"bosumfla","bosumflam":["bosumflăm","bosumfla","bosumflam","bosumfla"],"bosumfland":"bosumfla","bosumflara":"bosumfla","bosumflaram":"bosumfla","bosumflarati":"bosumfla","bosumflarea":"bosumflare","bosumflari":"bosumflare","bosumflarii":"bosumflare","bosumflarile":"bosumflare","bosumflarilor":"bosumflare","bosumflase":"bosumfla","bosumflasem":"bosumfla","bosumflasera":"bosumfla","bosumflaseram":"bosumfla","bosumflaserati":"bosumfla","bosumflasesi":"bosumfla","bosumflasi":"bosumfla","bosumflata":["bosumflată","bosumflat","bosumflata","bosumflat"],"bosumflate":"bosumflat","bosumflatele":"bosumflat","bosumflati":["bosumflați","bosumfla","bosumflați","bosumflat"],"bosumflatii":"bosumflat","bosumflatul":"bosumflat","bosumflau":"bosumfla","bosumfli":"bosumfla","bosumflu":"bosumfla","botance":"botâncă","botancei":"botâncă","botanica":["botanică","botanic","botanica","botanic"],"botanice":"botanic","botanicele":"botanic","botanici":["botanici","botanic","botanici","botanică"],"botanicii":["botanicii","botanic","botanicii","botanică"],"botanicul":"botanic","botanista":"botanist","botanistae":"botanist","botanistaui":"botanist","botaniste":"botanistă","botanistei":"botanistă","botanistele":"botanistă","botanistelor":"botanistă","botanisti":"botanist","botanistii":"botanist","botanistilor":"botanist","botanizai":"botaniza","botanizam":["botanizăm","botaniza","botanizam","botaniza"],"botanizand":"botaniza","botanizara":"botaniza","botanizaram":"botaniza","botanizarati":"botaniza","botanizarea":"botanizare","botanizari":"botanizare","botanizarii":"botanizare","botanizarile":"botanizare","botanizarilor":"botanizare","botanizase":"botaniza","botanizasem":"botaniza","botanizasera":"botaniza","botanizaseram":"botaniza","botanizaserati":"botaniza","botanizasesi":"botaniza","botanizasi":"botaniza","botanizat":"botaniza","botanizata":["botanizată","botanizat","botanizata","botanizat"],"botanizate":"botanizat","botanizatele":"botanizat","botanizati":["botanizați","botaniza","botanizați","botanizat"],"botanizatii":"botanizat","botanizatul":"botanizat","botanizau":"botaniza","botanizeaza":"botaniza","botanizez":"botaniza","botanizezi":"botaniza","botari":"botar","botarii":"botar","botarilor":"botar","botarul":"botar","botarule":"botar","botarului":"botar","botcea":"boccea","bote":"botă","botea":"boți","boteai":"boți","boteam":"boți","boteati":"boți","boteau":"boți","boteaza":"boteza","botegiune":"botejune","botei":"botă","boteiasul":"boteiaș","boteiasule":"boteiaș","boteiasului":"boteiaș","boteie":"botei","boteiele":"botei","boteielor":"botei","boteiul":"botei","boteiule":"botei","boteiului":"botei","botejunea":"botejune","botejuni":"botejune","botejunii":"botejune","botejunile":"botejune","botejunilor":"botejune","botele":"botă","botelnicul":"botelnic","botelnicule":"botelnic","botelnicului":"botelnic","botelnite":"botelniță","botelnitei":"botelniță","botelnitele":"botelniță","botelnitelor":"botelniță","botelor":"botă","botesc":"boți","boteste":"boți","botesti":"boți","botetul":"boteț","botetule":"boteț","botetului":"boteț","botez":"boteza","botezai":"boteza","botezam":["botezăm","boteza","botezam","boteza"],"botezand":"boteza","botezara":"boteza","botezaram":"boteza","botezarati":"boteza","botezari":"botezare","botezase":"boteza","botezasem":"boteza","botezasera":"boteza","botezaseram":"boteza","botezaserati":"boteza","botezasesi":"boteza","botezasi":"boteza","botezat":"boteza","botezata":["botezată","botezat","botezata","botezat"],"botezate":"botezat","botezatele":"botezat","botezati":["botezați","boteza","botezați","botezat"],"botezatii":"botezat","botezatoarea":"botezătoare","botezatori":["botezători","botezătoare","botezători","botezător"],"botezatorii":["botezătorii","botezătoare","botezătorii","botezător"],"botezatorile":"botezătoare","botezatorilor":["botezătorilor","botezătoare","botezătorilor","botezător"],"botezatorul":"botezător","botezatorule":"botezător","botezatorului":"botezător","botezatul":"botezat","botezau":"boteza","boteze":"boteza","botezi":"boteza","botezul":"botez","botezule":"botez","botezului":"botez","botezuri":"botez","botezurile":"botez","botezurilor":"botez","botfori":"botfor","botforii":"botfor","botforilor":"botfor","botforul":"botfor","botforule":"botfor","botforului":"botfor","botgrosi":"botgros","botgrosii":"botgros","botgrosilor":"botgros","botgrosul":"botgros","botgrosule":"botgros","botgrosului":"botgros","boti":"bot","botici":"botică","boticii":"botică","boticile":"botică","boticilor":"botică","boticute":"boticuță","boticutei":"boticuță","boticutele":"boticuță","boticutelor":"boticuță","botii":["boții","bot","boții","boți"],"botilor":"bot","botim":"boți","botinca":"botâncă","botind":"boți","botine":"botină","botinei":"botină","botinele":"botină","botinelor":"botină","botira":"boți","botiram":"boți","botirati":"boți","botircani":"Boțârcani","botise":"boți","botisem":"boți","botisera":"boți","botiseram":"boți","botiserati":"boți","botisesi":"boți","botisi":"boți","botisoare":["botișoare","botișor","boțișoare","boțișor"],"botisore":["botișore","botișor","boțișore","boțișor"],"botisorele":["botișorele","botișor","boțișorele","boțișor"],"botisorelor":["botișorelor","botișor","boțișorelor","boțișor"],"botisorul":["botișorul","botișor","boțișorul","boțișor"],"botisorule":["botișorule","botișor","boțișorule","boțișor"],"botisorului":["botișorului","botișor","boțișorului","boțișor"],"botit":"boți","botita":["boțită","boțit","boțita","boțit"],"botite":["boțite","boțit","botițe","botiță"],"botitei":"botiță","botitele":["boțitele","boțit","botițele","botiță"],"botitelor":"botiță","botiti":["boțiți","boți","boțiți","boțit"],"botitii":"boțit","botitul":"boțit","botituri":"boțitură","botiturii":"boțitură","botiturile":"boțitură","botiturilor":"boțitură","botmani":"boțman","botmanii":"boțman","botmanilor":"boțman","botmanul":"boțman","botmanule":"boțman","botmanului":"boțman","botnite":"botniță","botnitei":"botniță","botnitele":"botniță","botnitelor":"botniță","botoasa":["botoasă","botos","botoasa","botos"],"botoase":"botos","botoasele":"botos","botosaneanul":"botoșănean","botosaneanule":"botoșănean","botosaneanului":"botoșănean","botosanence":"botoșăneancă","botosanencei":"botoșăneancă","botosanencele":"botoșăneancă","botosanencelor":"botoșăneancă","botosanene":"botoșăneană","botosanenei":"botoșăneană","botosanenele":"botoșăneană","botosanenelor":"botoșăneană","botosaneni":"botoșănean","botosanenii":"botoșănean","botosanenilor":"botoșănean","botosaniul":"Botoșani","botosaniule":"Botoșani","botosaniului":"Botoșani","botosarea":"botoșare","botosari":"botoșare","botosarii":"botoșare","botosarile":"botoșare","botosarilor":"botoșare","botosata":["botoșată","botoșat","botoșata","botoșat"],"botosate":"botoșat","botosatele":"botoșat","botosati":"botoșat","botosatii":"botoșat","botosatul":"botoșat","botosei":"botoșel","botoseii":"botoșel","botoseilor":"botoșel","botoselul":"botoșel","botoselule":"botoșel","botoselului":"botoșel","botosi":["botoși","botos","botoși","botoș"],"botosii":["botoșii","botos","botoșii","botoș","botoșii","botoși"],"botosilor":["botoșilor","botoș","botoșilor","botoși"],"botosul":["botosul","botos","botoșul","botoș"],"botosule":"botoș","botosului":"botoș","botridia":"botridie","botridiei":"botridie","botridii":"botridie","botridiile":"botridie","botridiilor":"botridie","botriocefali":"botriocefal","botriocefalii":"botriocefal","botriocefalilor":"botriocefal","botriocefaloze":"botriocefaloză","botriocefalozei":"botriocefaloză","botriocefalozele":"botriocefaloză","botriocefalozelor":"botriocefaloză","botriocefalul":"botriocefal","botriocefalule":"botriocefal","botriocefalului":"botriocefal","botriomicoze":"botriomicoză","botriomicozei":"botriomicoză","botriomicozele":"botriomicoză","botriomicozelor":"botriomicoză","botrosi":"botroș","botrosii":"botroș","botrosilor":"botroș","botrosul":"botroș","botrosule":"botroș","botrosului":"botroș","botul":"bot","botule":"bot","botulete":"botuleț","botuletele":"botuleț","botuletelor":"botuleț","botuletul":"botuleț","botuletule":"botuleț","botuletului":"botuleț","botulica":["botulică","botulic","botulica","botulic"],"botulice":"botulic","botulicele":"botulic","botulici":"botulic","botulicii":"botulic","botulicul":"botulic","botulinica":["botulinică","botulinic","botulinica","botulinic"],"botulinice":"botulinic","botulinicele":"botulinic","botulinici":"botulinic","botulinicii":"botulinic","botulinicul":"botulinic","botulismul":"botulism","botulismule":"botulism","botulismului":"botulism","botului":"bot","boturi":"bot","boturile":"bot","boturilor":"bot","botusoare":"botușor","botusoarele":"botușor","botusoarelor":"botușor","botusorul":"botușor","botusorule":"botușor","botusorului":"botușor","botuti":"boțuț","botutii":"boțuț","botutilor":"boțuț","botutul":"boțuț","botutule":"boțuț","botutului":"boțuț","bouar":"boar","bouari":"bouar","bouarii":"bouar","bouarilor":"bouar","bouarul":"bouar","bouarule":"bouar","bouarului":"bouar","boul":"bou","boulangisme":"boulangism","boulangismele":"boulangism","boulangismelor":"boulangism","boulangismul":"boulangism","boulangismule":"boulangism","boulangismului":"boulangism","boule":"bou","bouleanul":"boulean","bouleanule":"boulean","bouleanului":"boulean","bouleni":"boulean","boulenii":"boulean","boulenilor":"boulean","bouleti":"bouleț","bouletii":"bouleț","bouletilor":"bouleț","bouletul":"bouleț","bouletule":"bouleț","bouletului":"bouleț","boului":"bou","boureana":["boureană","bourean","boureana","bourean"],"boureanul":"bourean","boureasca":["bourească","bouresc","boureasca","bouresc"],"bourei":"bourel","boureli":"bourel","bourelii":"bourel","bourelilor":"bourel","bourelul":"bourel","bourelule":"bourel","bourelului":"bourel","bourene":"bourean","bourenele":"bourean","boureni":"bourean","bourenii":"bourean","bourescul":"bouresc","bouresti":"bouresc","bourestii":"bouresc","bourestile":"bouresc","bouri":"bour","bourii":"bour","bourilor":"bour","bouroaice":"bouroaică","bouroaicei":"bouroaică","bouroaicele":"bouroaică","bouroaicelor":"bouroaică","bourul":"bour","bourule":"bour","bourului":"bour","bousori":"boușor","bousorii":"boușor","bousorilor":"boușor","bousorul":"boușor","bousorule":"boușor","bousorului":"boușor","bouti":"bouț","boutii":"bouț","boutilor":"bouț","boutul":"bouț","boutule":"bouț","boutului":"bouț","bovarismul":"bovarism","bovarismule":"bovarism","bovarismului":"bovarism","bovide":"bovid","bovidee":"bovideu","bovideele":"bovideu","bovideelor":"bovideu","bovidele":"bovid","bovidelor":"bovid","bovideul":"bovideu","bovideule":"bovideu","bovideului":"bovideu","bovidul":"bovid","bovidule":"bovid","bovidului":"bovid","bovina":["bovină","bovin","bovina","bovin"],"bovindoul":"bovindou","bovindoule":"bovindou","bovindoului":"bovindou","bovindouri":"bovindou","bovindourile":"bovindou","bovindourilor":"bovindou","bovine":["bovine","bovin","bovine","bovină"],"bovinei":"bovină","bovinele":["bovinele","bovin","bovinele","bovină"],"bovinelor":"bovină","bovini":"bovin","bovinii":"bovin","bovinul":"bovin","bowlingul":"bowling","bowlingule":"bowling","bowlingului":"bowling","box-officeul":"box-office","box-officeule":"box-office","box-officeului":"box-office","boxai":"boxa","boxam":["boxăm","boxa","boxam","boxa"],"boxand":"boxa","boxara":"boxa","boxaram":"boxa","boxarati":"boxa","boxase":"boxa","boxasem":"boxa","boxasera":"boxa","boxaseram":"boxa","boxaserati":"boxa","boxasesi":"boxa","boxasi":"boxa","boxat":"boxa","boxati":"boxa","boxau":"boxa","boxe":"boxă","boxeaza":"boxa","boxei":"boxă","boxele":"boxă","boxelor":"boxă","boxeri":"boxer","boxerii":"boxer","boxerilor":"boxer","boxerul":"boxer","boxerule":"boxer","boxerului":"boxer","boxez":"boxa","boxezi":"boxa","boxuri":"box","bozafera":["bozaferă","bozafer","bozafera","bozafer"],"bozafere":"bozafer","bozaferele":"bozafer","bozaferi":"bozafer","bozaferii":"bozafer","bozaferul":"bozafer","bozairea":"bozăire","bozairi":"bozăire","bozairii":"bozăire","bozairile":"bozăire","bozairilor":"bozăire","bozale":"boza","bozalei":"boza","bozalele":"boza","bozalelor":"boza","bozaria":"bozărie","bozariei":"bozărie","bozarii":"bozărie","bozariile":"bozărie","bozariilor":"bozărie","bozaua":"boza","bozgoii":"bozgoi","bozgoilor":"bozgoi","bozgoiul":"bozgoi","bozgoiule":"bozgoi","bozgoiului":"bozgoi","bozgori":"bozgor","bozgorii":"bozgor","bozgorilor":"bozgor","bozgorul":"bozgor","bozgorule":"bozgor","bozgorului":"bozgor","bozgunul":"bozgun","bozgunule":"bozgun","bozgunului":"bozgun","bozgunuri":"bozgun","bozgunurile":"bozgun","bozgunurilor":"bozgun","bozia":"bozie","boziei":"bozie","bozii":"bozie","boziile":"bozie","boziilor":"bozie","bozinta mare":"Bozânta Mare","bozinta mica":"Bozânta Mică","bozisori":"bozișor","bozisorii":"bozișor","bozisorilor":"bozișor","bozisorul":"bozișor","bozisorule":"bozișor","bozisorului":"bozișor","bozoaia":"bozoaie","bozoaiei":"bozoaie","bozoaii":"bozoaie","bozul":"boz","bozule":"boz","bozului":"boz","brabini":"brăbin","brabinii":"brăbin","brabinilor":"brăbin","brabinul":"brăbin","brabinule":"brăbin","brabinului":"brăbin","bracacele":"brăcăcel","bracacelele":"brăcăcel","bracacelelor":"brăcăcel","bracacelul":"brăcăcel","bracacelule":"brăcăcel","bracacelului":"brăcăcel","bracacici":"brăcăcică","bracacicii":"brăcăcică","bracacicile":"brăcăcică","bracacicilor":"brăcăcică","bracele":"brace","bracelor":"brace","braci":"brace","bracile":"brăcire","bracinare":"brăcinar","bracinarele":"brăcinar","bracinarelor":"brăcinar","bracinarul":"brăcinar","bracinarule":"brăcinar","bracinarului":"brăcinar","bracirea":"brăcire","braciri":"brăcire","bracirii":"brăcire","bracirile":"brăcire","bracirilor":"brăcire","braconai":"bracona","braconaje":"braconaj","braconajele":"braconaj","braconajelor":"braconaj","braconajul":"braconaj","braconajule":"braconaj","braconajului":"braconaj","braconam":["braconăm","bracona","braconam","bracona"],"braconand":"bracona","braconara":"bracona","braconaram":"bracona","braconarati":"bracona","braconase":"bracona","braconasem":"bracona","braconasera":"bracona","braconaseram":"bracona","braconaserati":"bracona","braconasesi":"bracona","braconasi":"bracona","braconat":"bracona","braconati":"bracona","braconau":"bracona","braconeaza":"bracona","braconez":"bracona","braconezi":"bracona","braconieri":"braconier","braconierii":"braconier","braconierilor":"braconier","braconierul":"braconier","braconierule":"braconier","braconierului":"braconier","bracteala":["bracteală","bracteal","bracteala","bracteal"],"bracteale":"bracteal","bractealele":"bracteal","bracteali":"bracteal","bractealii":"bracteal","bractealul":"bracteal","bracteea":"bractee","bracteei":"bractee","bracteele":"bractee","bracteelor":"bractee","bracteole":"bracteolă","bracteolei":"bracteolă","bracteolele":"bracteolă","bracteolelor":"bracteolă","bracul":"brac","bracule":"brac","bracului":"brac","bracuri":"brac","bracurile":"brac","bracurilor":"brac","bradanasi":"brădănaș","bradanasii":"brădănaș","bradanasilor":"brădănaș","bradanasul":"brădănaș","bradanasule":"brădănaș","bradanasului":"brădănaș","bradatele":"brădățel","bradatelele":"brădățel","bradatelelor":"brădățel","bradatelul":"brădățel","bradatelule":"brădățel","bradatelului":"brădățel","bradestii batrini":"Brădeștii Bătrâni","bradeti":"brădeț","bradetii":"brădeț","bradetilor":"brădeț","bradetul":"brădeț","bradetule":"brădeț","bradetului":"brădeț","bradeturi":"brădet","bradiartria":"bradiartrie","bradiartriei":"bradiartrie","bradiartrii":"bradiartrie","bradiartriile":"bradiartrie","bradiartriilor":"bradiartrie","bradicardia":"bradicardie","bradicardica":["bradicardică","bradicardic","bradicardica","bradicardic"],"bradicardice":"bradicardic","bradicardicele":"bradicardic","bradicardici":"bradicardic","bradicardicii":"bradicardic","bradicardicul":"bradicardic","bradicardiei":"bradicardie","bradicardii":"bradicardie","bradichinezia":"bradichinezie","bradichineziei":"bradichinezie","bradichinezii":"bradichinezie","bradifagia":"bradifagie","bradifagiei":"bradifagie","bradifagii":"bradifagie","bradifazia":"bradifazie","bradifaziei":"bradifazie","bradifazii":"bradifazie","bradifaziile":"bradifazie","bradifaziilor":"bradifazie","bradilalia":"bradilalie","bradilaliei":"bradilalie","bradilalii":"bradilalie","bradilaliile":"bradilalie","bradilaliilor":"bradilalie","bradioare":"brădioară","bradioarei":"brădioară","bradioarele":"brădioară","bradioarelor":"brădioară","bradipepsia":"bradipepsie","bradipepsiei":"bradipepsie","bradipepsii":"bradipepsie","bradipepsiile":"bradipepsie","bradipepsiilor":"bradipepsie","bradipsihia":"bradipsihie","bradipsihiei":"bradipsihie","bradipsihii":"bradipsihie","bradipsihiile":"bradipsihie","bradipsihiilor":"bradipsihie","bradiseismica":["bradiseismică","bradiseismic","bradiseismica","bradiseismic"],"bradiseismice":"bradiseismic","bradiseismicele":"bradiseismic","bradiseismici":"bradiseismic","bradiseismicii":"bradiseismic","bradiseismicul":"bradiseismic","bradisori":"brădișor","bradisorii":"brădișor","bradisorilor":"brădișor","bradisorul":"brădișor","bradisorule":"brădișor","bradisorului":"brădișor","bradisul":"brădiș","bradisule":"brădiș","bradisului":"brădiș","bradisuri":"brădiș","bradisurile":"brădiș","bradisurilor":"brădiș","braditrofia":"braditrofie","braditrofiei":"braditrofie","braditrofii":"braditrofie","braditrofiile":"braditrofie","braditrofiilor":"braditrofie","braduceanul":"brăducean","braduceanule":"brăducean","braduceanului":"brăducean","braduceni":"brăducean","braducenii":"brăducean","braducenilor":"brăducean","braduii":"brădui","braduilor":"brădui","braduite":"brăduiță","braduitei":"brăduiță","braduitele":"brăduiță","braduitelor":"brăduiță","braduiul":"brădui","braduiule":"brădui","braduiului":"brădui","bradul":"brad","bradule":"brad","braduleti":"brăduleț","braduletii":"brăduleț","braduletilor":"brăduleț","braduletul":"brăduleț","braduletule":"brăduleț","braduletului":"brăduleț","bradului":"brad","braduscani":"brădușcan","braduscanii":"brădușcan","braduscanilor":"brădușcan","braduscanul":"brădușcan","braduscanule":"brădușcan","braduscanului":"brădușcan","braduscareul":"brădușcare","braduscareule":"brădușcare","braduscareului":"brădușcare","braduscari":"brădușcare","braduscarii":"brădușcare","braduscarilor":"brădușcare","bradusori":"brădușor","bradusorii":"brădușor","bradusorilor":"brădușor","bradusorul":"brădușor","bradusorule":"brădușor","bradusorului":"brădușor","braduti":"brăduț","bradutii":"brăduț","bradutilor":"brăduț","bradutul":"brăduț","bradutule":"brăduț","bradutului":"brăduț","bragageria":"bragagerie","bragageriei":"bragagerie","bragagerii":"bragagerie","bragageriile":"bragagerie","bragageriilor":"bragagerie","bragagii":"bragagiu","bragagiii":"bragagiu","bragagiilor":"bragagiu","bragagiuul":"bragagiu","bragagiuule":"bragagiu","bragagiuului":"bragagiu","bragi":"bragă","bragii":"bragă","bragile":"bragă","bragilor":"bragă","brahagii":"brahagiu","brahagiii":"brahagiu","brahagiilor":"brahagiu","brahagiuul":"brahagiu","brahagiuule":"brahagiu","brahagiuului":"brahagiu","brahiala":["brahială","brahial","brahiala","brahial"],"brahiale":"brahial","brahialele":"brahial","brahialgia":"brahialgie","brahialgiei":"brahialgie","brahialgii":"brahialgie","brahialgiile":"brahialgie","brahialgiilor":"brahialgie","brahiali":"brahial","brahialii":"brahial","brahialul":"brahial","brahiblaste":"brahiblast","brahiblastele":"brahiblast","brahiblastelor":"brahiblast","brahiblastul":"brahiblast","brahiblastule":"brahiblast","brahiblastului":"brahiblast","brahicefala":["brahicefală","brahicefal","brahicefala","brahicefal"],"brahicefale":["brahicefale","brahicefal","brahicefale","brahicefală"],"brahicefalei":"brahicefală","brahicefalele":["brahicefalele","brahicefal","brahicefalele","brahicefală"],"brahicefalelor":"brahicefală","brahicefali":"brahicefal","brahicefalia":"brahicefalie","brahicefaliei":"brahicefalie","brahicefalii":["brahicefalii","brahicefal","brahicefalii","brahicefalie"],"brahicefaliile":"brahicefalie","brahicefaliilor":"brahicefalie","brahicefalilor":"brahicefal","brahicefalul":"brahicefal","brahicefalule":"brahicefal","brahicefalului":"brahicefal","brahidactilia":"brahidactilie","brahidactiliei":"brahidactilie","brahidactilii":"brahidactilie","brahidactiliile":"brahidactilie","brahidactiliilor":"brahidactilie","brahilogia":"brahilogie","brahilogiei":"brahilogie","brahilogii":"brahilogie","brahiocefalica":["brahiocefalică","brahiocefalic","brahiocefalica","brahiocefalic"],"brahiocefalice":"brahiocefalic","brahiocefalicele":"brahiocefalic","brahiocefalici":"brahiocefalic","brahiocefalicii":"brahiocefalic","brahiocefalicul":"brahiocefalic","brahiopode":"brahiopod","brahiopodele":"brahiopod","brahiopodelor":"brahiopod","brahiopodul":"brahiopod","brahiopodule":"brahiopod","brahiopodului":"brahiopod","brahistocrone":"brahistocronă","brahistocronei":"brahistocronă","brahistocronele":"brahistocronă","brahistocronelor":"brahistocronă","brahmane":"brahmană","brahmanei":"brahmană","brahmanele":"brahmană","brahmanelor":"brahmană","brahmani":"brahman","brahmanica":["brahmanică","brahmanic","brahmanica","brahmanic"],"brahmanice":"brahmanic","brahmanicele":"brahmanic","brahmanici":"brahmanic","brahmanicii":"brahmanic","brahmanicul":"brahmanic","brahmanii":"brahman","brahmanilor":"brahman","brahmanisme":"brahmanism","brahmanismele":"brahmanism","brahmanismelor":"brahmanism","brahmanismul":"brahmanism","brahmanismule":"brahmanism","brahmanismului":"brahmanism","brahmanul":"brahman","brahmanule":"brahman","brahmanului":"brahman","brahmini":"brahmin","brahminii":"brahmin","brahminilor":"brahmin","brahminul":"brahmin","brahminule":"brahmin","brahminului":"brahmin","braie":"brâu","braiele":"brâu","braielor":"brâu","brailale":"Brăila","brailalei":"Brăila","brailaua":"Brăila","braileanul":"brăilean","braileanule":"brăilean","braileanului":"brăilean","brailence":"brăileancă","brailencei":"brăileancă","brailencele":"brăileancă","brailencelor":"brăileancă","brailene":"brăileană","brailenei":"brăileană","brailenele":"brăileană","brailenelor":"brăileană","braileni":"brăilean","brailenii":"brăilean","brailenilor":"brăilean","brain drainul":"brain drain","brain drainule":"brain drain","brain drainului":"brain drain","brainstormingul":"brainstorming","brainstormingule":"brainstorming","brainstormingului":"brainstorming","brainstorminguri":"brainstorming","brainstormingurile":"brainstorming","brainstormingurilor":"brainstorming","braisvantul":"braișvanț","braisvantule":"braișvanț","braisvantului":"braișvanț","bramburea":"bramburi","brambureai":"bramburi","brambuream":"bramburi","brambureati":"bramburi","brambureau":"bramburi","brambureli":"brambureală","bramburelii":"brambureală","bramburelile":"brambureală","bramburelilor":"brambureală","bramburesc":"bramburi","brambureste":"bramburi","bramburesti":"bramburi","bramburii":"bramburi","bramburim":"bramburi","bramburind":"bramburi","bramburira":"bramburi","bramburiram":"bramburi","bramburirati":"bramburi","bramburirea":"bramburire","bramburiri":"bramburire","bramburirii":"bramburire","bramburirile":"bramburire","bramburirilor":"bramburire","bramburise":"bramburi","bramburisem":"bramburi","bramburisera":"bramburi","bramburiseram":"bramburi","bramburiserati":"bramburi","bramburisesi":"bramburi","bramburisi":"bramburi","bramburit":"bramburi","bramburiti":"bramburi","bramini":"bramin","braminii":"bramin","braminilor":"bramin","braminul":"bramin","braminule":"bramin","braminului":"bramin","bran":"brăni","brana":"brâu","branasul":"brânaș","branasule":"brânaș","branasului":"brânaș","brancarde":"brancardă","brancardei":"brancardă","brancardele":"brancardă","brancardelor":"brancardă","brancardiere":"brancardieră","brancardierei":"brancardieră","brancardierele":"brancardieră","brancardierelor":"brancardieră","brancardieri":"brancardier","brancardierii":"brancardier","brancardierilor":"brancardier","brancardierul":"brancardier","brancardierule":"brancardier","brancardierului":"brancardier","branci":"brâncă","brancii":["brâncii","brâncă","brâncii","brânci"],"brancile":"brâncă","brancilor":["brâncilor","brâncă","brâncilor","brânci"],"branciogul":"branciog","branciogule":"branciog","branciogului":"branciog","brancioguri":"branciog","branciogurile":"branciog","branciogurilor":"branciog","branciul":"brânci","branciule":"brânci","branciului":"brânci","brancoveneasca":["brâncovenească","brâncovenesc","brâncoveneasca","brâncovenesc"],"brancovenescul":"brâncovenesc","brancovenesti":"brâncovenesc","brancovenestii":"brâncovenesc","brancovenestile":"brâncovenesc","branculite":"brânculiță","branculitei":"brânculiță","branculitele":"brânculiță","branculitelor":"brânculiță","brancusiana":["brâncușiană","brâncușian","brâncușiana","brâncușian"],"brancusianul":"brâncușian","brancusiene":"brâncușian","brancusienele":"brâncușian","brancusieni":"brâncușian","brancusienii":"brâncușian","brandul":"brand","brandule":"brand","brandului":"brand","branduri":"brand","brandurile":"brand","brandurilor":"brand","branduse":"brândușă","branduse de munte":"brândușă de munte","branduse de toamna":"brândușă de toamnă","branduseaua":"brândușea","brandusei":"brândușă","brandusele":["brândușele","brândușă","brândușele","brândușea"],"branduselei":"brândușea","branduselele":"brândușea","branduselelor":"brândușea","branduselor":"brândușă","brandusite":"brândușiță","brandusitei":"brândușiță","brandusitele":"brândușiță","brandusitelor":"brândușiță","brandy-uri":"brandy","brandy-urile":"brandy","brandy-urilor":"brandy","brandyul":"brandy","brandyule":"brandy","brandyului":"brandy","brane":["brâne","brână","brăne","brăni"],"branea":"brăni","braneai":"brăni","braneam":"brăni","braneati":"brăni","braneau":"brăni","branei":"brână","branele":"brână","branelor":"brână","branhiala":["branhială","branhial","branhiala","branhial"],"branhiale":"branhial","branhialele":"branhial","branhiali":"branhial","branhialii":"branhial","branhialul":"branhial","branhii":"branhie","branhiopode":"branhiopod","branhiopodele":"branhiopod","branhiopodelor":"branhiopod","branhiopodul":"branhiopod","branhiopodule":"branhiopod","branhiopodului":"branhiopod","branhiozauri":"branhiozaur","branhiozaurii":"branhiozaur","branhiozaurilor":"branhiozaur","branhiozaurul":"branhiozaur","branhiozaurule":"branhiozaur","branhiozaurului":"branhiozaur","branie":"brăni","branii":"brăni","branim":"brăni","branind":"brăni","branira":"brăni","braniram":"brăni","branirati":"brăni","branise":"brăni","branisem":"brăni","branisera":"brăni","braniseram":"brăni","braniserati":"brăni","branisesi":"brăni","branisi":"brăni","branisoare":"brânișor","branisoarele":"brânișor","branisoarelor":"brânișor","branisorul":"brânișor","branisorule":"brânișor","branisorului":"brânișor","branistea":"braniște","branisti":"braniște","branistii":"braniște","branistile":"braniște","branistilor":"braniște","branit":"brăni","braniti":"brăni","bransai":"branșa","bransam":["branșăm","branșa","branșam","branșa"],"bransamente":"branșament","bransamentele":"branșament","bransamentelor":"branșament","bransamentul":"branșament","bransamentule":"branșament","bransamentului":"branșament","bransand":"branșa","bransara":"branșa","bransaram":"branșa","bransarati":"branșa","bransase":"branșa","bransasem":"branșa","bransasera":"branșa","bransaseram":"branșa","bransaserati":"branșa","bransasesi":"branșa","bransasi":"branșa","bransat":"branșa","bransati":"branșa","bransau":"branșa","branse":"branșă","branseaza":"branșa","bransei":"branșă","bransele":"branșă","branselor":"branșă","bransez":"branșa","bransezi":"branșa","brantul":"brânt","brantule":"brânt","brantului":"brânt","branutul":"brânuț","branutule":"brânuț","branutului":"brânuț","branz":"brânzi","branzarese":"brânzăreasă","branzaresei":"brânzăreasă","branzaresele":"brânzăreasă","branzareselor":"brânzăreasă","branzari":"brânzar","branzaria":"brânzărie","branzariei":"brânzărie","branzarii":["brânzarii","brânzar","brânzării","brânzărie"],"branzariile":"brânzărie","branzariilor":"brânzărie","branzarilor":"brânzar","branzarul":"brânzar","branzarule":"brânzar","branzarului":"brânzar","branze":["brânze","brânză","brânze","brânzi"],"branzea":"brânzi","branzeai":"brânzi","branzeam":"brânzi","branzeati":"brânzi","branzeau":"brânzi","branzei":"brânză","branzeste":"brânzi","branzeturi":"brânză","branzeturile":"brânză","branzeturilor":"brânză","branzici":"brânzică","branzicii":"brânzică","branzicile":"brânzică","branzicilor":"brânzică","branzii":"brânzi","branzim":"brânzi","branzind":"brânzi","branzira":"brânzi","branziram":"brânzi","branzirati":"brânzi","branzise":"brânzi","branzisem":"brânzi","branzisera":"brânzi","branziseram":"brânzi","branziserati":"brânzi","branzisesi":"brânzi","branzisi":"brânzi","branzisoare":"brânzișoară","branzisoarei":"brânzișoară","branzisoarele":"brânzișoară","branzisoarelor":"brânzișoară","branzit":"brânzi","branzita":["brânzită","brânzit","brânzita","brânzit"],"branzite":"brânzit","branzitele":"brânzit","branziti":["brânziți","brânzi","brânziți","brânzit"],"branzitii":"brânzit","branzitul":"brânzit","branzoaice":"brânzoaică","branzoaicei":"brânzoaică","branzoaicele":"brânzoaică","branzoaicelor":"brânzoaică","branzoasa":["brânzoasă","brânzos","brânzoasa","brânzos"],"branzoase":"brânzos","branzoasele":"brânzos","branzosi":"brânzos","branzosii":"brânzos","branzosul":"brânzos","brasajul":"brasaj","brasajule":"brasaj","brasajului":"brasaj","brasarde":"brasardă","brasardei":"brasardă","brasardele":"brasardă","brasardelor":"brasardă","braseria":"braserie","braseriei":"braserie","braserii":"braserie","braseriile":"braserie","braseriilor":"braserie","brasiere":"brasieră","brasierei":"brasieră","brasierele":"brasieră","brasierelor":"brasieră","brasiste":"brasistă","brasistei":"brasistă","brasistele":"brasistă","brasistelor":"brasistă","brasisti":"brasist","brasistii":"brasist","brasistilor":"brasist","brasistul":"brasist","brasistule":"brasist","brasistului":"brasist","brasoave":"brașoavă","brasoavei":"brașoavă","brasoavele":"brașoavă","brasoavelor":"brașoavă","brasoveanul":"brașovean","brasoveanule":"brașovean","brasoveanului":"brașovean","brasovence":"brașoveancă","brasovencei":"brașoveancă","brasovencele":"brașoveancă","brasovencelor":"brașoveancă","brasovene":"brașoveană","brasoveneasca":["brașovenească","brașovenesc","brașoveneasca","brașovenesc"],"brasovenei":"brașoveană","brasovenele":"brașoveană","brasovenelor":"brașoveană","brasovenescul":"brașovenesc","brasovenesti":"brașovenesc","brasovenestii":"brașovenesc","brasovenestile":"brașovenesc","brasoveni":"brașovean","brasovenia":"brașovenie","brasoveniei":"brașovenie","brasovenii":["brașovenii","brașovean","brașovenii","brașovenie"],"brasoveniile":"brașovenie","brasoveniilor":"brașovenie","brasovenilor":"brașovean","brasovul":"Brașov","brasovule":"Brașov","brasovului":"Brașov","brasul":"bras","brasule":"bras","brasului":"bras","brasuri":"bras","brasurile":"bras","brasurilor":"bras","bratari":"brățară","bratarui":"brățăruie","brataruia":"brățăruie","brataruii":"brățăruie","brataruile":"brățăruie","brataruilor":"brățăruie","bratarute":"brățăruță","bratarutei":"brățăruță","bratarutele":"brățăruță","bratarutelor":"brățăruță","brate":"braț","brateasca":["brățească","brățesc","brățeasca","brățesc"],"brateaua":"brățea","bratele":["brațele","braț","brățele","brățea"],"bratelei":"brățea","bratelele":"brățea","bratelelor":"brățea","bratelor":"braț","bratescul":"brățesc","bratesti":"brățesc","bratestii":"brățesc","bratestile":"brățesc","brati":"brat","bratii":"brat","bratilor":"brat","bratisele":"brățișel","bratiselele":"brățișel","bratiselelor":"brățișel","bratiselul":"brățișel","bratiselule":"brățișel","bratiselului":"brățișel","bratisoare":"brățișor","bratisore":"brățișor","bratisorele":"brățișor","bratisorelor":"brățișor","bratisorul":"brățișor","bratisorule":"brățișor","bratisorului":"brățișor","bratoaie":"brățoi","bratoaiele":"brățoi","bratoaielor":"brățoi","bratoiul":"brățoi","bratoiule":"brățoi","bratoiului":"brățoi","bratuci":"brățucă","bratucii":"brățucă","bratucile":"brățucă","bratucilor":"brățucă","bratul":["bratul","brat","brațul","braț"],"bratule":["bratule","brat","brațule","braț"],"bratului":["bratului","brat","brațului","braț"],"braul":"brâu","braule":"brâu","braulete":"brâuleț","brauletele":"brâuleț","brauletelor":"brâuleț","brauletul":"brâuleț","brauletule":"brâuleț","brauletului":"brâuleț","braului":"brâu","braunite":"braunit","braunitele":"braunit","braunitelor":"braunit","braunitul":"braunit","braunitule":"braunit","braunitului":"braunit","brauri":"brâu","braurile":"brâu","braurilor":"brâu","brausoare":"brâușor","brausoarele":"brâușor","brausoarelor":"brâușor","brausorul":"brâușor","brausorule":"brâușor","brausorului":"brâușor","braute":"brâuț","brautele":"brâuț","brautelor":"brâuț","brautul":"brâuț","brautule":"brâuț","brautului":"brâuț","brava":["bravă","brav","brava","brav"],"bravade":"bravadă","bravadei":"bravadă","bravadele":"bravadă","bravadelor":"bravadă","bravai":"brava","bravam":["bravăm","brava","bravam","brava"],"bravand":"brava","bravara":"brava","bravaram":"brava","bravarati":"brava","bravase":"brava","bravasem":"brava","bravasera":"brava","bravaseram":"brava","bravaserati":"brava","bravasesi":"brava","bravasi":"brava","bravat":"brava","bravati":"brava","bravau":"brava","brave":"brav","braveaza":"brava","bravele":"brav","bravez":"brava","bravezi":"brava","bravi":"brav","bravii":"brav","bravul":"brav","bravuri":"bravură","bravurii":"bravură","bravurile":"bravură","bravurilor":"bravură","brazdai":"brăzda","brazdam":["brăzdăm","brăzda","brăzdam","brăzda"],"brazdand":"brăzda","brazdara":"brăzda","brazdaram":"brăzda","brazdarati":"brăzda","brazdare":"brăzdar","brazdarea":"brăzdare","brazdarele":"brăzdar","brazdarelor":"brăzdar","brazdari":"brăzdare","brazdarii":"brăzdare","brazdarile":"brăzdare","brazdarilor":"brăzdare","brazdarul":"brăzdar","brazdarule":"brăzdar","brazdarului":"brăzdar","brazdase":"brăzda","brazdasem":"brăzda","brazdasera":"brăzda","brazdaseram":"brăzda","brazdaserati":"brăzda","brazdasesi":"brăzda","brazdasi":"brăzda","brazdat":"brăzda","brazdata":["brăzdată","brăzdat","brăzdata","brăzdat"],"brazdate":"brăzdat","brazdatele":"brăzdat","brazdati":["brăzdați","brăzda","brăzdați","brăzdat"],"brazdatii":"brăzdat","brazdatul":"brăzdat","brazdaturi":"brăzdătură","brazdaturii":"brăzdătură","brazdaturile":"brăzdătură","brazdaturilor":"brăzdătură","brazdau":"brăzda","brazde":"brazdă","brazdeaza":"brăzda","brazdei":"brazdă","brazdele":"brazdă","brazdelor":"brazdă","brazdez":"brăzda","brazdezi":"brăzda","brazdite":"brăzdiță","brazditei":"brăzdiță","brazditele":"brăzdiță","brazditelor":"brăzdiță","brazduia":"brăzdui","brazduiai":"brăzdui","brazduiam":"brăzdui","brazduiati":"brăzdui","brazduiau":"brăzdui","brazduiesc":"brăzdui","brazduieste":"brăzdui","brazduiesti":"brăzdui","brazduii":"brăzdui","brazduim":"brăzdui","brazduind":"brăzdui","brazduira":"brăzdui","brazduiram":"brăzdui","brazduirati":"brăzdui","brazduirea":"brăzduire","brazduiri":"brăzduire","brazduirii":"brăzduire","brazduirile":"brăzduire","brazduirilor":"brăzduire","brazduise":"brăzdui","brazduisem":"brăzdui","brazduisera":"brăzdui","brazduiseram":"brăzdui","brazduiserati":"brăzdui","brazduisesi":"brăzdui","brazduisi":"brăzdui","brazduit":"brăzdui","brazduita":["brăzduită","brăzduit","brăzduita","brăzduit"],"brazduite":"brăzduit","brazduitele":"brăzduit","brazduiti":["brăzduiți","brăzdui","brăzduiți","brăzduit"],"brazduitii":"brăzduit","brazduitul":"brăzduit","brazdute":"brăzduță","brazdutei":"brăzduță","brazdutele":"brăzduță","brazdutelor":"brăzduță","brazi":"brad","brazi de craciun":"brad de Crăciun","brazii":"brad","braziliana":["braziliană","brazilian","braziliana","brazilian"],"brazilianul":"brazilian","brazilianule":"brazilian","brazilianului":"brazilian","braziliei":"Brazilia","brazilience":"braziliancă","braziliencei":"braziliancă","braziliencele":"braziliancă","braziliencelor":"braziliancă","braziliene":["braziliene","brazilian","braziliene","braziliană"],"brazilienei":"braziliană","brazilienele":["brazilienele","brazilian","brazilienele","braziliană"],"brazilienelor":"braziliană","brazilieni":"brazilian","brazilienii":"brazilian","brazilienilor":"brazilian","brazilor":"brad","brazuri":"brazură","brazurii":"brazură","brazurile":"brazură","brazurilor":"brazură","breabanul":"breabăn","breabanule":"breabăn","breabanului":"breabăn","breancul":"breanc","breancule":"breanc","breancului":"breanc","breancuri":"breanc","breancurile":"breanc","breancurilor":"breanc","breaza":["brează","breaz","breaza","breaz"],"breazul":"breaz","brebeneaua":"brebenea","brebenei":"brebenel","brebeneii":"brebenel","brebeneilor":"brebenel","brebenele":"brebenea","brebenelei":"brebenea","brebenelele":"brebenea","brebenelelor":"brebenea","brebenelul":"brebenel","brebenelule":"brebenel","brebenelului":"brebenel","brebeni":"breabăn","brebenii":"breabăn","brebenilor":"breabăn","brebenoci":"brebenoc","brebenocii":"brebenoc","brebenocilor":"brebenoc","brebenocul":"brebenoc","brebenocule":"brebenoc","brebenocului":"brebenoc","brebi":"breb","brebii":"breb","brebilor":"breb","brebu minastirei":"Brebu Mânăstirei","brebul":"breb","brebule":"breb","brebului":"breb","bregmatica":["bregmatică","bregmatic","bregmatica","bregmatic"],"bregmatice":"bregmatic","bregmaticele":"bregmatic","bregmatici":"bregmatic","bregmaticii":"bregmatic","bregmaticul":"bregmatic","bregme":"bregmă","bregmei":"bregmă","bregmele":"bregmă","bregmelor":"bregmă","brehnacea":"brehnace","brehnaci":"brehnace","brehnacii":"brehnace","brehnacile":"brehnace","brehnacilor":"brehnace","breji":"breaz","brejii":"breaz","brelanul":"brelan","brelanule":"brelan","brelanului":"brelan","brelanuri":"brelan","brelanurile":"brelan","brelanurilor":"brelan","brelocul":"breloc","brelocule":"breloc","brelocului":"breloc","brelocuri":"breloc","brelocurile":"breloc","brelocurilor":"breloc","brese":"breșă","bresei":"breșă","bresele":"breșă","breselor":"breșă","breslasi":"breslaș","breslasii":"breslaș","breslasilor":"breslaș","breslasul":"breslaș","breslasule":"breslaș","breslasului":"breslaș","bresle":"breaslă","breslei":"breaslă","breslele":"breaslă","breslelor":"breaslă","bretea":"bretelă","bretea romina":"Bretea Română","breteaua":"bretea","bretela":"bretea","bretele":["bretele","bretea","bretele","bretelă"],"bretelei":["bretelei","bretea","bretelei","bretelă"],"bretelele":["bretelele","bretea","bretelele","bretelă"],"bretelelor":["bretelelor","bretea","bretelelor","bretelă"],"bretese":"bretesă","bretesei":"bretesă","bretesele":"bretesă","breteselor":"bretesă","bretoane":"breton","bretona":["bretonă","breton","bretona","breton"],"bretone":["bretone","breton","bretone","bretonă"],"bretonei":"bretonă","bretonele":["bretonele","breton","bretonele","bretonă"],"bretonelor":"bretonă","bretoni":"breton","bretonii":"breton","bretonul":"breton","breve":"brevă","brevei":"brevă","brevele":"brevă","brevelor":"brevă","brevetai":"breveta","brevetam":["brevetăm","breveta","brevetam","breveta"],"brevetand":"breveta","brevetara":"breveta","brevetaram":"breveta","brevetarati":"breveta","brevetarea":"brevetare","brevetari":"brevetare","brevetarii":"brevetare","brevetarile":"brevetare","brevetarilor":"brevetare","brevetase":"breveta","brevetasem":"breveta","brevetasera":"breveta","brevetaseram":"breveta","brevetaserati":"breveta","brevetasesi":"breveta","brevetasi":"breveta","brevetat":"breveta","brevetata":["brevetată","brevetat","brevetata","brevetat"],"brevetate":"brevetat","brevetatele":"brevetat","brevetati":["brevetați","breveta","brevetați","brevetat"],"brevetatii":"brevetat","brevetatul":"brevetat","brevetau":"breveta","brevete":"brevet","brevete de inventie":"brevet de invenție","breveteaza":"breveta","brevetele":"brevet","brevetelor":"brevet","brevetez":"breveta","brevetezi":"breveta","brevetul":"brevet","brevetule":"brevet","brevetului":"brevet","breviare":"breviar","breviarele":"breviar","breviarelor":"breviar","breviarul":"breviar","breviarule":"breviar","breviarului":"breviar","brevilina":["brevilină","brevilin","brevilina","brevilin"],"breviline":["breviline","brevilin","breviline","brevilină"],"brevilinei":"brevilină","brevilinele":["brevilinele","brevilin","brevilinele","brevilină"],"brevilinelor":"brevilină","brevilini":"brevilin","brevilinii":"brevilin","brevilinilor":"brevilin","brevilinul":"brevilin","brevilinule":"brevilin","brevilinului":"brevilin","brevilocventa":["brevilocventă","brevilocvent","brevilocventa","brevilocvent"],"brevilocvente":["brevilocvente","brevilocvent","brevilocvențe","brevilocvență"],"brevilocventei":"brevilocvență","brevilocventele":"brevilocvent","brevilocventi":"brevilocvent","brevilocventii":"brevilocvent","brevilocventul":"brevilocvent","brevitatea":"brevitate","brevitati":"brevitate","brevitatii":"brevitate","breze":"breaz","brezele":"breaz","briai":"bria","briam":"bria","brianta":["briantă","briant","brianta","briant"],"briante":["briante","briant","brianțe","brianță"],"briantei":"brianță","briantele":["briantele","briant","brianțele","brianță"],"briantelor":"brianță","brianti":"briant","briantii":"briant","briantine":"briantină","briantinei":"briantină","briantinele":"briantină","briantinelor":"briantină","briantul":"briant","briara":"bria","briaram":"bria","briarati":"bria","briase":"bria","briasem":"bria","briasera":"bria","briaseram":"bria","briaserati":"bria","briasesi":"bria","briasi":"bria","briat":"bria","briati":"bria","briau":"bria","briaza":"bria","briboii":"briboi","briboilor":"briboi","briboiul":"briboi","briboiule":"briboi","briboiului":"briboi","bric-a-bracul":"bric-à-brac","bric-a-bracule":"bric-à-brac","bric-a-bracului":"bric-à-brac","bricabracul":"bricabrac","bricabracule":"bricabrac","bricabracului":"bricabrac","bricabracuri":"bricabrac","bricabracurile":"bricabrac","bricabracurilor":"bricabrac","bricaul":"brică","bricaule":"brică","bricaului":"brică","bricauri":"brică","bricaurile":"brică","bricaurilor":"brică","brice":"brici","briceagul":"briceag","briceagule":"briceag","briceagului":"briceag","bricege":"briceag","bricegele":["bricegele","briceag","bricegele","bricegel"]};
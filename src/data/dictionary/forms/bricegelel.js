@@ -0,0 +1 @@
+export default {"bricegelele":"bricegel","bricegelelor":"bricegel","bricegelor":"briceag","bricegelul":"bricegel","bricegelule":"bricegel","bricegelului":"bricegel","bricegute":"briceguț","bricegutele":"briceguț","bricegutelor":"briceguț","bricegutul":"briceguț","bricegutule":"briceguț","bricegutului":"briceguț","bricele":"brici","bricelor":"brici","briceri":"bricer","bricerii":"bricer","bricerilor":"bricer","bricerul":"bricer","bricerule":"bricer","bricerului":"bricer","brichetajul":"brichetaj","brichetajule":"brichetaj","brichetajului":"brichetaj","brichetarea":"brichetare","brichetari":"brichetare","brichetarii":"brichetare","brichetarile":"brichetare","brichetarilor":"brichetare","brichetatul":"brichetat","brichetatule":"brichetat","brichetatului":"brichetat","brichetaturi":"brichetat","brichetaturile":"brichetat","brichetaturilor":"brichetat","brichete":"brichetă","brichetei":"brichetă","brichetele":"brichetă","brichetelor":"brichetă","brichinirea":"brichinire","brichiniri":"brichinire","brichinirii":"brichinire","brichinirile":"brichinire","brichinirilor":"brichinire","bricicari":"bricicar","bricicarii":"bricicar","bricicarilor":"bricicar","bricicarul":"bricicar","bricicarule":"bricicar","bricicarului":"bricicar","bricinarite":"bricinăriță","bricinaritei":"bricinăriță","bricinaritele":"bricinăriță","bricinaritelor":"bricinăriță","briciul":"brici","briciule":"brici","briciului":"brici","bricolai":"bricola","bricolaje":"bricolaj","bricolajele":"bricolaj","bricolajelor":"bricolaj","bricolajul":"bricolaj","bricolajule":"bricolaj","bricolajului":"bricolaj","bricolam":["bricolăm","bricola","bricolam","bricola"],"bricoland":"bricola","bricolara":"bricola","bricolaram":"bricola","bricolarati":"bricola","bricolase":"bricola","bricolasem":"bricola","bricolasera":"bricola","bricolaseram":"bricola","bricolaserati":"bricola","bricolasesi":"bricola","bricolasi":"bricola","bricolat":"bricola","bricolati":"bricola","bricolau":"bricola","bricole":"bricolă","bricoleaza":"bricola","bricolei":"bricolă","bricolele":"bricolă","bricolelor":"bricolă","bricolez":"bricola","bricolezi":"bricola","bricul":"bric","bricule":"bric","bricului":"bric","bricuri":["bricuri","bric","bricuri","brică"],"bricurile":"bric","bricurilor":"bric","bride":"bridă","bridei":"bridă","bridele":"bridă","bridelor":"bridă","bridge-ul":"bridge","bridge-ule":"bridge","bridge-ului":"bridge","bridge-uri":"bridge","bridge-urile":"bridge","bridge-urilor":"bridge","bridgiste":"bridgistă","bridgistei":"bridgistă","bridgistele":"bridgistă","bridgistelor":"bridgistă","bridgisti":["bridgiști","bridgist","bridgisti","bridgist"],"bridgistii":"bridgist","bridgistilor":"bridgist","bridgistul":"bridgist","bridgistule":"bridgist","bridgistului":"bridgist","brie":"bria","briefingul":"briefing","briefingule":"briefing","briefingului":"briefing","briefinguri":"briefing","briefingurile":"briefing","briefingurilor":"briefing","briem":"bria","brieul":"brie","brieule":"brie","brieului":"brie","briez":"bria","briezi":"bria","briful":"brif","brifule":"brif","brifului":"brif","brifuri":"brif","brifurile":"brif","brifurilor":"brif","brigade":"brigadă","brigadei":"brigadă","brigadele":"brigadă","brigadelor":"brigadă","brigadiere":"brigadieră","brigadierei":"brigadieră","brigadierele":"brigadieră","brigadierelor":"brigadieră","brigadieri":"brigadier","brigadierii":"brigadier","brigadierilor":"brigadier","brigadierul":"brigadier","brigadierule":"brigadier","brigadierului":"brigadier","brigandaje":"brigandaj","brigandajele":"brigandaj","brigandajelor":"brigandaj","brigandajul":"brigandaj","brigandajule":"brigandaj","brigandajului":"brigandaj","brigandul":"brigand","brigandule":"brigand","brigandului":"brigand","brigantine":"brigantină","brigantinei":"brigantină","brigantinele":"brigantină","brigantinelor":"brigantină","briganzi":"brigand","briganzii":"brigand","briganzilor":"brigand","brigazi":"brigadă","brigleasa":"Brâgleasa","briind":"bria","brilantele":"brilănțel","brilantelele":"brilănțel","brilantelelor":"brilănțel","brilantelul":"brilănțel","brilantelule":"brilănțel","brilantelului":"brilănțel","briliante":"briliant","briliantele":"briliant","briliantelor":"briliant","briliantina":["briliantină","briliantin","briliantina","briliantin"],"briliantine":["briliantine","briliantin","briliantine","briliantină"],"briliantinei":"briliantină","briliantinele":["briliantinele","briliantin","briliantinele","briliantină"],"briliantinelor":"briliantină","briliantini":"briliantin","briliantinii":"briliantin","briliantinul":"briliantin","briliantul":"briliant","briliantule":"briliant","briliantului":"briliant","brina":"brână","brinca":"brâncă","brinceni":"Brânceni","brinci":"brânci","brincoveanca":"Brâncoveanca","brincoveanu":"Brâncoveanu","brincovenesc":"brâncovenesc","brincovenesti":"Brâncovenești","brincoveni":"Brâncoveni","brinculita":"brânculiță","brincusi":"Brâncuși","brincusian":"brâncușian","brincusiana":"brîncușian","brincusiene":"brîncușian","brincusieni":"brîncușian","brindus":"Brânduș","brindusa":["brîndușa","Brândușa","brîndușă","Brândușă","brîndușă","brândușă"],"brindusea":"brândușea","brindusel":"Brândușel","brindusescu":"Brândușescu","brindusita":"brândușiță","brindusoiu":"Brândușoiu","brinisor":"brânișor","brinza":["brînză","Brânză","brînză","brânză"],"brinzar":"brânzar","brinzareasa":"brânzăreasă","brinzari":"Brânzari","brinzarie":"brânzărie","brinzaru":"Brânzaru","brinzas":"Brânzaș","brinze":"brînză","brinzei":"brînză","brinzeni":"Brânzeni","brinzeturi":"brînză","brinzeturile":"brînză","brinzeturilor":"brînză","brinzi":"brânzi","brinzica":"brânzică","brinzila":"Brânzilă","brinzisoara":"brânzișoară","brinzit":"brânzit","brinzoaica":["brînzoaică","Brânzoaică","brînzoaică","brânzoaică"],"brinzoi":"Brânzoi","brinzos":"brânzos","briofite":"briofită","briofitei":"briofită","briofitele":"briofită","briofitelor":"briofită","briologia":"briologie","briologica":["briologică","briologic","briologica","briologic"],"briologice":"briologic","briologicele":"briologic","briologici":"briologic","briologicii":"briologic","briologicul":"briologic","briologiei":"briologie","briologii":"briologie","briologiile":"briologie","briologiilor":"briologie","briose":"brioșă","briosei":"brioșă","briosele":"brioșă","brioselor":"brioșă","briozoare":"briozoar","briozoarele":"briozoar","briozoarelor":"briozoar","briozoarul":"briozoar","briozoarule":"briozoar","briozoarului":"briozoar","briscari":"brișcar","briscarii":"brișcar","briscarilor":"brișcar","briscarul":"brișcar","briscarule":"brișcar","briscarului":"brișcar","brisculite":"brișculiță","brisculitei":"brișculiță","brisculitele":"brișculiță","brisculitelor":"brișculiță","briscute":"brișcuță","briscutei":"brișcuță","briscutele":"brișcuță","briscutelor":"brișcuță","briste":"brișcă","bristei":"brișcă","bristele":"brișcă","bristelor":"brișcă","bristolul":"bristol","bristolule":"bristol","bristolului":"bristol","britanica":["britanică","britanic","britanica","britanic"],"britanice":["britanice","britanic","britanice","britanică"],"britanicei":"britanică","britanicele":["britanicele","britanic","britanicele","britanică"],"britanicelor":"britanică","britanici":"britanic","britanicii":"britanic","britanicul":"britanic","britaniul":"britani","britaniule":"britani","britaniului":"britani","brite":"brită","britei":"brită","britele":"brită","britelor":"brită","briti":"brită","britute":"brituță","britutei":"brituță","britutele":"brituță","britutelor":"brituță","briu":"brâu","briulet":"brâuleț","briusor":"brâușor","briut":"brâuț","brizanti":"brizant","brizantii":"brizant","brizantilor":"brizant","brizantul":"brizant","brizantule":"brizant","brizantului":"brizant","brizbize":"brizbiz","brizbizele":"brizbiz","brizbizelor":"brizbiz","brizbizul":"brizbiz","brizbizule":"brizbiz","brizbizului":"brizbiz","brizbrizul":"brizbriz","brizbrizule":"brizbriz","brizbrizului":"brizbriz","brizbrizuri":"brizbriz","brizbrizurile":"brizbriz","brizbrizurilor":"brizbriz","brize":"briză","brizei":"briză","brizele":"briză","brizelor":"briză","briznic":"Brâznic","brizuri":"brizură","brizurii":"brizură","brizurile":"brizură","brizurilor":"brizură","broaste":"broască","broaste raioase":"broască râioasă","broaste-testoase":"broască-țestoasă","broastei":"broască","broastele":"broască","broastelor":"broască","broatec":"brotac","broateci":"broatec","broatecii":"broatec","broatecilor":"broatec","broatecul":"broatec","broatecule":"broatec","broatecului":"broatec","broboade":"broboadă","broboadei":"broboadă","broboadele":"broboadă","broboadelor":"broboadă","broboane":"broboană","broboanei":"broboană","broboanele":"broboană","broboanelor":"broboană","brobodealnice":"brobodealnic","brobodealnicele":"brobodealnic","brobodealnicelor":"brobodealnic","brobodealnicul":"brobodealnic","brobodealnicule":"brobodealnic","brobodealnicului":"brobodealnic","brobodice":"brobodică","brobodicei":"brobodică","brobonai":"brobona","brobonam":["brobonăm","brobona","brobonam","brobona"],"brobonand":"brobona","brobonara":"brobona","brobonaram":"brobona","brobonarati":"brobona","brobonase":"brobona","brobonasem":"brobona","brobonasera":"brobona","brobonaseram":"brobona","brobonaserati":"brobona","brobonasesi":"brobona","brobonasi":"brobona","brobonat":"brobona","brobonati":"brobona","brobonau":"brobona","brobonea":"broboni","broboneai":"broboni","broboneam":"broboni","broboneati":"broboni","broboneau":"broboni","broboneaua":"brobonea","broboneaza":"brobona","brobonele":"brobonea","brobonelei":"brobonea","brobonelele":"brobonea","brobonelelor":"brobonea","brobonesc":"broboni","broboneste":"broboni","brobonesti":"broboni","brobonez":"brobona","brobonezi":"brobona","brobonici":"brobonică","brobonicii":"brobonică","brobonicile":"brobonică","brobonicilor":"brobonică","brobonii":"broboni","brobonim":"broboni","brobonind":"broboni","brobonira":"broboni","broboniram":"broboni","brobonirati":"broboni","brobonise":"broboni","brobonisem":"broboni","brobonisera":"broboni","broboniseram":"broboni","broboniserati":"broboni","brobonisesi":"broboni","brobonisi":"broboni","brobonit":"broboni","broboniti":"broboni","broborigmele":"broborigme","broborigmelor":"broborigme","brocardul":"brocard","brocardule":"brocard","brocardului":"brocard","brocarduri":"brocard","brocardurile":"brocard","brocardurilor":"brocard","brocartul":"brocart","brocartule":"brocart","brocartului":"brocart","brocarturi":"brocart","brocarturile":"brocart","brocarturilor":"brocart","brocatul":"brocat","brocatule":"brocat","brocatului":"brocat","brocaturi":"brocat","brocaturile":"brocat","brocaturilor":"brocat","broccoliul":"broccoli","broccoliule":"broccoli","broccoliului":"broccoli","brodai":"broda","brodam":["brodăm","broda","brodam","broda"],"brodand":"broda","brodara":"broda","brodaram":"broda","brodarati":"broda","brodarea":"brodare","brodarelul":"brodărel","brodarelule":"brodărel","brodarelului":"brodărel","brodari":"brodare","brodarii":"brodare","brodarile":"brodare","brodarilor":"brodare","brodase":"broda","brodasem":"broda","brodasera":"broda","brodaseram":"broda","brodaserati":"broda","brodasesi":"broda","brodasi":"broda","brodat":"broda","brodata":["brodată","brodat","brodata","brodat"],"brodate":"brodat","brodatele":"brodat","brodati":["brodați","broda","brodați","brodat"],"brodatii":"brodat","brodatul":"brodat","brodau":"broda","brodeaza":"broda","brodeli":"brodeală","brodelii":"brodeală","brodelile":"brodeală","brodelilor":"brodeală","broderia":"broderie","broderiei":"broderie","broderii":"broderie","broderiile":"broderie","broderiilor":"broderie","brodez":"broda","brodeze":"brodeză","brodezei":"brodeză","brodezele":"brodeză","brodezelor":"brodeză","brodezi":"broda","brodul":"brod","brodule":"brod","brodului":"brod","broduri":"brod","brodurile":"brod","brodurilor":"brod","brokeraje":"brokeraj","brokerajele":"brokeraj","brokerajelor":"brokeraj","brokerajul":"brokeraj","brokerajule":"brokeraj","brokerajului":"brokeraj","brokeri":"broker","brokerii":"broker","brokerilor":"broker","brokerul":"broker","brokerule":"broker","brokerului":"broker","bromati":"bromat","bromatii":"bromat","bromatilor":"bromat","bromatul":"bromat","bromatule":"bromat","bromatului":"bromat","bromhidrica":["bromhidrică","bromhidric","bromhidrica","bromhidric"],"bromhidrice":"bromhidric","bromhidricele":"bromhidric","bromhidrici":"bromhidric","bromhidricii":"bromhidric","bromhidricul":"bromhidric","bromhidroze":"bromhidroză","bromhidrozei":"bromhidroză","bromica":["bromică","bromic","bromica","bromic"],"bromice":"bromic","bromicele":"bromic","bromici":"bromic","bromicii":"bromic","bromicul":"bromic","bromismul":"bromism","bromismule":"bromism","bromismului":"bromism","bromoformul":"bromoform","bromoformule":"bromoform","bromoformului":"bromoform","bromul":"brom","bromule":"brom","bromului":"brom","bromurarea":"bromurare","bromurarei":"bromurare","bromuri":"bromură","bromurii":"bromură","bromurile":"bromură","bromurilor":"bromură","bronhia":"bronhie","bronhiala":["bronhială","bronhial","bronhiala","bronhial"],"bronhiale":"bronhial","bronhialele":"bronhial","bronhiali":"bronhial","bronhialii":"bronhial","bronhialul":"bronhial","bronhica":["bronhică","bronhic","bronhica","bronhic"],"bronhice":"bronhic","bronhicele":"bronhic","bronhici":"bronhic","bronhicii":"bronhic","bronhicul":"bronhic","bronhiei":"bronhie","bronhii":"bronhie","bronhiile":"bronhie","bronhiilor":"bronhie","bronhiole":"bronhiolă","bronhiolei":"bronhiolă","bronhiolele":"bronhiolă","bronhiolelor":"bronhiolă","bronhodilatatia":"bronhodilatație","bronhodilatatiei":"bronhodilatație","bronhodilatatii":"bronhodilatație","bronhodilatatiile":"bronhodilatație","bronhodilatatiilor":"bronhodilatație","bronhofonia":"bronhofonie","bronhofoniei":"bronhofonie","bronhofonii":"bronhofonie","bronhofoniile":"bronhofonie","bronhofoniilor":"bronhofonie","bronhografia":"bronhografie","bronhografiei":"bronhografie","bronhografii":"bronhografie","bronhografiile":"bronhografie","bronhografiilor":"bronhografie","bronhopneumonia":"bronhopneumonie","bronhopneumoniei":"bronhopneumonie","bronhopneumonii":"bronhopneumonie","bronhopneumoniile":"bronhopneumonie","bronhopneumoniilor":"bronhopneumonie","bronhoreea":"bronhoree","bronhorei":"bronhoree","bronhoreii":"bronhoree","bronhoscoape":"bronhoscop","bronhoscoapele":"bronhoscop","bronhoscoapelor":"bronhoscop","bronhoscopia":"bronhoscopie","bronhoscopiei":"bronhoscopie","bronhoscopii":"bronhoscopie","bronhoscopiile":"bronhoscopie","bronhoscopiilor":"bronhoscopie","bronhoscopul":"bronhoscop","bronhoscopule":"bronhoscop","bronhoscopului":"bronhoscop","bronhospasme":"bronhospasm","bronhospasmele":"bronhospasm","bronhospasmelor":"bronhospasm","bronhospasmul":"bronhospasm","bronhospasmule":"bronhospasm","bronhospasmului":"bronhospasm","bronhotomia":"bronhotomie","bronhotomiei":"bronhotomie","bronhotomii":"bronhotomie","bronhotomiile":"bronhotomie","bronhotomiilor":"bronhotomie","bronsectazia":"bronșectazie","bronsectaziei":"bronșectazie","bronsectazii":"bronșectazie","bronsectaziile":"bronșectazie","bronsectaziilor":"bronșectazie","bronsite":"bronșită","bronsitei":"bronșită","bronsitele":"bronșită","bronsitelor":"bronșită","bronsitica":["bronșitică","bronșitic","bronșitica","bronșitic"],"bronsitice":"bronșitic","bronsiticele":"bronșitic","bronsitici":"bronșitic","bronsiticii":"bronșitic","bronsiticul":"bronșitic","brontofobia":"brontofobie","brontofobiei":"brontofobie","brontofobii":"brontofobie","brontofobiile":"brontofobie","brontofobiilor":"brontofobie","brontozauri":"brontozaur","brontozaurii":"brontozaur","brontozaurilor":"brontozaur","brontozaurul":"brontozaur","brontozaurule":"brontozaur","brontozaurului":"brontozaur","bronzai":"bronza","bronzaje":"bronzaj","bronzajele":"bronzaj","bronzajelor":"bronzaj","bronzajul":"bronzaj","bronzajule":"bronzaj","bronzajului":"bronzaj","bronzam":["bronzăm","bronza","bronzam","bronza"],"bronzand":"bronza","bronzara":"bronza","bronzaram":"bronza","bronzarati":"bronza","bronzarea":"bronzare","bronzari":"bronzare","bronzarii":"bronzare","bronzarile":"bronzare","bronzarilor":"bronzare","bronzase":"bronza","bronzasem":"bronza","bronzasera":"bronza","bronzaseram":"bronza","bronzaserati":"bronza","bronzasesi":"bronza","bronzasi":"bronza","bronzat":"bronza","bronzata":["bronzată","bronzat","bronzata","bronzat"],"bronzate":"bronzat","bronzatele":"bronzat","bronzati":["bronzați","bronza","bronzați","bronzat"],"bronzatii":"bronzat","bronzatul":"bronzat","bronzau":"bronza","bronzeaza":"bronza","bronzez":"bronza","bronzezi":"bronza","bronzitul":"bronzit","bronzitule":"bronzit","bronzitului":"bronzit","bronzul":"bronz","bronzule":"bronz","bronzului":"bronz","bronzuri":"bronz","bronzurile":"bronz","bronzurilor":"bronz","brosai":"broșa","brosam":["broșăm","broșa","broșam","broșa"],"brosand":"broșa","brosara":"broșa","brosaram":"broșa","brosarati":"broșa","brosarea":"broșare","brosari":"broșare","brosarii":"broșare","brosarile":"broșare","brosarilor":"broșare","brosase":"broșa","brosasem":"broșa","brosasera":"broșa","brosaseram":"broșa","brosaserati":"broșa","brosasesi":"broșa","brosasi":"broșa","brosat":"broșa","brosati":"broșa","brosatul":"broșat","brosatule":"broșat","brosatului":"broșat","brosau":"broșa","broscaneasca":["broscănească","broscănesc","broscăneasca","broscănesc"],"broscanescul":"broscănesc","broscanesti":"broscănesc","broscanestii":"broscănesc","broscanestile":"broscănesc","broscareasca":["broscărească","broscăresc","broscăreasca","broscăresc"],"broscarescul":"broscăresc","broscaresti":"broscăresc","broscarestii":"broscăresc","broscarestile":"broscăresc","broscari":"broscar","broscaria":"broscărie","broscariei":"broscărie","broscarii":["broscarii","broscar","broscării","broscărie"],"broscariile":"broscărie","broscariilor":"broscărie","broscarilor":"broscar","broscarimea":"broscărime","broscarimi":"broscărime","broscarimii":"broscărime","broscarimile":"broscărime","broscarimilor":"broscărime","broscarite":"broscariță","broscaritei":"broscariță","broscaritele":"broscariță","broscaritelor":"broscariță","broscarul":"broscar","broscarule":"broscar","broscarului":"broscar","broscoaice":"broscoaică","broscoaicei":"broscoaică","broscoaicele":"broscoaică","broscoaicelor":"broscoaică","broscoii":"broscoi","broscoilor":"broscoi","broscoiul":"broscoi","broscoiule":"broscoi","broscoiului":"broscoi","brosculite":"brosculiță","brosculitei":"brosculiță","brosculitele":"brosculiță","brosculitelor":"brosculiță","broscute":"broscuță","broscutei":"broscuță","broscutele":"broscuță","broscutelor":"broscuță","broscuti":"broscuț","broscutii":"broscuț","broscutilor":"broscuț","broscutul":"broscuț","broscutule":"broscuț","broscutului":"broscuț","brose":"broșă","broseaza":"broșa","brosei":"broșă","brosele":"broșă","broselor":"broșă","brosete":"broșetă","brosetei":"broșetă","brosetele":"broșetă","brosetelor":"broșetă","brosez":"broșa","brosezi":"broșa","brosteanul":"broștean","brosteanule":"broștean","brosteanului":"broștean","brosteasca":["broștească","broștesc","broșteasca","broștesc"],"brosteni":"broștean","brostenii":"broștean","brostenilor":"broștean","brostescul":"broștesc","brostesti":"broștesc","brostestii":"broștesc","brostestile":"broștesc","brostimea":"broștime","brostimi":"broștime","brostimii":"broștime","brostimile":"broștime","brostimilor":"broștime","brosurele":"broșurică","brosuri":"broșură","brosurice":"broșurică","brosuricei":"broșurică","brosuricele":"broșurică","brosuricelor":"broșurică","brosurii":"broșură","brosurile":"broșură","brosurilor":"broșură","brotacei":"brotăcel","brotaceli":"brotăcel","brotacelii":"brotăcel","brotacelilor":"brotăcel","brotacelul":"brotăcel","brotacelule":"brotăcel","brotacelului":"brotăcel","brotaci":"brotac","brotacii":"brotac","brotacilor":"brotac","brotacimea":"brotăcime","brotacimi":"brotăcime","brotacimii":"brotăcime","brotacul":"brotac","brotacule":"brotac","brotacului":"brotac","brotani":"brotan","brotanii":"brotan","brotanilor":"brotan","brotanul":"brotan","brotanule":"brotan","brotanului":"brotan","broticia":"broticiu","broticie":"broticiu","broticii":"broticiu","broticiii":"broticiu","broticiile":"broticiu","broticiul":"broticiu","brotirea":"brotire","brotiri":"brotire","brotirii":"brotire","brotirile":"brotire","brotirilor":"brotire","browniana":["browniană","brownian","browniana","brownian"],"brownianul":"brownian","browniene":"brownian","brownienele":"brownian","brownieni":"brownian","brownienii":"brownian","browningul":"browning","browningule":"browning","browningului":"browning","browninguri":"browning","browningurile":"browning","browningurilor":"browning","bruceloze":"bruceloză","brucelozei":"bruceloză","brucelozele":"bruceloză","brucelozelor":"bruceloză","brucine":"brucină","brucinei":"brucină","brucinele":"brucină","brucinelor":"brucină","brudari":"brudar","brudarii":"brudar","brudarilor":"brudar","brudarul":"brudar","brudarule":"brudar","brudarului":"brudar","brudia":"brudiu","brudie":"brudiu","brudii":"brudiu","brudiii":"brudiu","brudiile":"brudiu","brudiul":"brudiu","brudnica":["brudnică","brudnic","brudnica","brudnic"],"brudnice":"brudnic","brudnicele":"brudnic","brudnici":"brudnic","brudnicii":"brudnic","brudnicul":"brudnic","brudute":"bruduț","brudutele":"bruduț","brudutelor":"bruduț","brudutul":"bruduț","brudutule":"bruduț","brudutului":"bruduț","bruftuiele":"bruftuială","bruftuielei":"bruftuială","bruftuielele":"bruftuială","bruftuielelor":"bruftuială","bruftuieli":"bruftuială","bruftuluia":"bruftului","bruftuluiai":"bruftului","bruftuluiam":"bruftului","bruftuluiati":"bruftului","bruftuluiau":"bruftului","bruftuluiele":"bruftuluială","bruftuluielei":"bruftuluială","bruftuluielele":"bruftuluială","bruftuluielelor":"bruftuluială","bruftuluieli":"bruftuluială","bruftuluiesc":"bruftului","bruftuluieste":"bruftului","bruftuluiesti":"bruftului","bruftuluii":"bruftului","bruftuluim":"bruftului","bruftuluind":"bruftului","bruftuluira":"bruftului","bruftuluiram":"bruftului","bruftuluirati":"bruftului","bruftuluise":"bruftului","bruftuluisem":"bruftului","bruftuluisera":"bruftului","bruftuluiseram":"bruftului","bruftuluiserati":"bruftului","bruftuluisesi":"bruftului","bruftuluisi":"bruftului","bruftuluit":"bruftului","bruftuluiti":"bruftului","bruiai":"bruia","bruiaje":"bruiaj","bruiajele":"bruiaj","bruiajelor":"bruiaj","bruiajul":"bruiaj","bruiajule":"bruiaj","bruiajului":"bruiaj","bruiam":"bruia","bruiara":"bruia","bruiaram":"bruia","bruiarati":"bruia","bruiase":"bruia","bruiasem":"bruia","bruiasera":"bruia","bruiaseram":"bruia","bruiaserati":"bruia","bruiasesi":"bruia","bruiasi":"bruia","bruiat":"bruia","bruiata":["bruiată","bruiat","bruiata","bruiat"],"bruiate":"bruiat","bruiatele":"bruiat","bruiati":["bruiați","bruia","bruiați","bruiat"],"bruiatii":"bruiat","bruiatul":"bruiat","bruiau":"bruia","bruiaza":"bruia","bruie":"bruia","bruiem":"bruia","bruierea":"bruiere","bruierei":"bruiere","bruiez":"bruia","bruiezi":"bruia","bruind":"bruia","bruioane":"bruion","bruioanele":"bruion","bruioanelor":"bruion","bruionul":"bruion","bruionule":"bruion","bruionului":"bruion","brumand":"bruma","brumara":"bruma","brumareaua":"brumărea","brumarele":"brumărea","brumarelei":"brumărea","brumarelele":"brumărea","brumarelelor":"brumărea","brumarelul":"brumărel","brumarelule":"brumărel","brumarelului":"brumărel","brumaria":"brumăriu","brumarie":"brumăriu","brumarii":"brumăriu","brumariii":"brumăriu","brumariile":"brumăriu","brumarite":"brumăriță","brumarite de padure":"brumăriță de pădure","brumarite de stanca":"brumăriță de stâncă","brumaritei":"brumăriță","brumaritele":"brumăriță","brumaritelor":"brumăriță","brumariul":"brumăriu","brumase":"bruma","brumasera":"bruma","brumat":"bruma","brumata":["brumată","brumat","brumata","brumat"],"brumate":"brumat","brumateca":["brumatecă","brumatec","brumateca","brumatec"],"brumatece":"brumatec","brumatecele":"brumatec","brumateci":"brumatec","brumatecii":"brumatec","brumatecul":"brumatec","brumatele":"brumat","brumati":"brumat","brumatica":["brumatică","brumatic","brumatica","brumatic"],"brumatice":"brumatic","brumaticele":"brumatic","brumatici":"brumatic","brumaticii":"brumatic","brumaticul":"brumatic","brumatii":"brumat","brumatul":"brumat","brumau":"bruma","brume":"brumă","brumeaza":"bruma","brumei":"brumă","brumele":"brumă","brumelor":"brumă","brumoasa":["brumoasă","brumos","brumoasa","brumos"],"brumoase":"brumos","brumoasele":"brumos","brumosi":"brumos","brumosii":"brumos","brumosul":"brumos","brumulite":"brumuliță","brumulitei":"brumuliță","brumulitele":"brumuliță","brumulitelor":"brumuliță","bruna":["brună","brun","bruna","brun"],"brunai":"bruna","brunam":["brunăm","bruna","brunam","bruna"],"brunand":"bruna","brunara":"bruna","brunaram":"bruna","brunarati":"bruna","brunarea":"brunare","brunari":"brunare","brunarii":"brunare","brunarile":"brunare","brunarilor":"brunare","brunase":"bruna","brunasem":"bruna","brunasera":"bruna","brunaseram":"bruna","brunaserati":"bruna","brunasesi":"bruna","brunasi":"bruna","brunat":"bruna","brunati":"bruna","brunau":"bruna","brunch-uri":"brunch","brunch-urile":"brunch","brunch-urilor":"brunch","brunchul":"brunch","brunchule":"brunch","brunchului":"brunch","brune":"brun","bruneaza":"bruna","brunele":"brun","bruneta":["brunetă","brunet","bruneta","brunet"],"brunete":"brunet","brunetele":"brunet","bruneti":"brunet","brunetii":"brunet","brunetul":"brunet","brunez":"bruna","brunezi":"bruna","bruni":"brun","brunii":"brun","brunul":"brun","brusca":["bruscă","brusc","brusca","brusc"],"bruscai":"brusca","bruscam":["bruscăm","brusca","bruscam","brusca"],"bruscand":"brusca","bruscara":"brusca","bruscaram":"brusca","bruscarati":"brusca","bruscarea":"bruscare","bruscari":"bruscare","bruscarii":"bruscare","bruscase":"brusca","bruscasem":"brusca","bruscasera":"brusca","bruscaseram":"brusca","bruscaserati":"brusca","bruscasesi":"brusca","bruscasi":"brusca","bruscat":"brusca","bruscati":"brusca","bruscau":"brusca","bruscheaza":"brusca","bruschetea":"bruschețe","bruschetei":"bruschețe","bruschez":"brusca","bruschezi":"brusca","bruscul":"brusc","brusei":"brușel","bruseii":"brușel","bruseilor":"brușel","bruselul":"brușel","bruselule":"brușel","bruselului":"brușel","brusini":"brusin","brusinii":"brusin","brusinilor":"brusin","brusinul":"brusin","brusinule":"brusin","brusinului":"brusin","bruste":"brusc","brustele":"brusc","brusti":"brusc","brustii":"brusc","brustinul":"bruștin","brustinule":"bruștin","brustinului":"bruștin","brustur":"brusture","brusturasi":"brusturaș","brusturasii":"brusturaș","brusturasilor":"brusturaș","brusturasul":"brusturaș","brusturasule":"brusturaș","brusturasului":"brusturaș","brusturei":"brusturel","brustureii":"brusturel","brustureilor":"brusturel","brusturele":"brusture","brusturelui":"brusture","brusturelul":"brusturel","brusturelule":"brusturel","brusturelului":"brusturel","brusturi":["brusturi","brustur","brusturi","brusture"],"brusturii":["brusturii","brustur","brusturii","brusture"],"brusturilor":["brusturilor","brustur","brusturilor","brusture"],"brusturul":"brustur","brusturule":"brustur","brusturului":"brustur","brusuletul":"brușuleț","brusuletule":"brușuleț","brusuletului":"brușuleț","brusutul":"brușuț","brusutule":"brușuț","brusutului":"brușuț","bruta":["brută","brut","bruta","brut"],"brutala":["brutală","brutal","brutala","brutal"],"brutale":"brutal","brutalele":"brutal","brutali":"brutal","brutalii":"brutal","brutalitatea":"brutalitate","brutalitati":"brutalitate","brutalitatii":"brutalitate","brutalitatile":"brutalitate","brutalitatilor":"brutalitate","brutalizai":"brutaliza","brutalizam":["brutalizăm","brutaliza","brutalizam","brutaliza"],"brutalizand":"brutaliza","brutalizara":"brutaliza","brutalizaram":"brutaliza","brutalizarati":"brutaliza","brutalizarea":"brutalizare","brutalizari":"brutalizare","brutalizarii":"brutalizare","brutalizarile":"brutalizare","brutalizarilor":"brutalizare","brutalizase":"brutaliza","brutalizasem":"brutaliza","brutalizasera":"brutaliza","brutalizaseram":"brutaliza","brutalizaserati":"brutaliza","brutalizasesi":"brutaliza","brutalizasi":"brutaliza","brutalizat":"brutaliza","brutalizata":["brutalizată","brutalizat","brutalizata","brutalizat"],"brutalizate":"brutalizat","brutalizatele":"brutalizat","brutalizati":["brutalizați","brutaliza","brutalizați","brutalizat"],"brutalizatii":"brutalizat","brutalizatul":"brutalizat","brutalizau":"brutaliza","brutalizeaza":"brutaliza","brutalizez":"brutaliza","brutalizezi":"brutaliza","brutalul":"brutal","brutarese":"brutăreasă","brutaresei":"brutăreasă","brutaresele":"brutăreasă","brutareselor":"brutăreasă","brutari":"brutar","brutaria":"brutărie","brutariei":"brutărie","brutarii":["brutarii","brutar","brutării","brutărie"],"brutariile":"brutărie","brutariilor":"brutărie","brutarilor":"brutar","brutarite":"brutăriță","brutaritei":"brutăriță","brutaritele":"brutăriță","brutaritelor":"brutăriță","brutarul":"brutar","brutarule":"brutar","brutarului":"brutar","brute":["brute","brut","brute","brută"],"brutei":"brută","brutele":["brutele","brut","brutele","brută"],"brutelor":"brută","bruti":"brut","brutii":"brut","brutul":"brut","bruxeleze":"bruxeleză","bruxelezei":"bruxeleză","bruxelezele":"bruxeleză","bruxelezelor":"bruxeleză","bruxelleze":"bruxelleză","bruxellezei":"bruxelleză","bruxellezele":"bruxelleză","bruxellezelor":"bruxelleză","bts-ul":"BTS","bts-ule":"BTS","bts-ului":"BTS","bts-uri":"BTS","bts-urile":"BTS","bts-urilor":"BTS","buar":"bour","bubaline":"bubalină","bubalinei":"bubalină","bubalinele":"bubalină","bubalinelor":"bubalină","bube":"bubă","bubei":"bubă","bubele":"bubă","bubelor":"bubă","buberici":"buberic","bubericii":"buberic","bubericilor":"buberic","bubericul":"buberic","bubericule":"buberic","bubericului":"buberic","bubite":"bubiță","bubitei":"bubiță","bubitele":"bubiță","bubitelor":"bubiță","buboaie":"buboi","buboaiele":"buboi","buboaielor":"buboi","buboane":"bubon","buboanele":"bubon","buboanelor":"bubon","buboasa":["buboasă","bubos","buboasa","bubos"],"buboase":"bubos","buboasele":"bubos","buboiul":"buboi","buboiule":"buboi","buboiului":"buboi","bubonica":["bubonică","bubonic","bubonica","bubonic"],"bubonice":"bubonic","bubonicele":"bubonic","bubonici":"bubonic","bubonicii":"bubonic","bubonicul":"bubonic","bubonul":"bubon","bubonule":"bubon","bubonului":"bubon","bubosi":"bubos","bubosii":"bubos","bubosul":"bubos","bubuia":"bubui","bubuiai":"bubui","bubuiam":"bubui","bubuiati":"bubui","bubuiau":"bubui","bubuie":"bubui","bubuii":"bubui","bubuim":"bubui","bubuind":"bubui","bubuioci":"bubuioc","bubuiocii":"bubuioc","bubuiocilor":"bubuioc","bubuiocul":"bubuioc","bubuiocule":"bubuioc","bubuiocului":"bubuioc","bubuira":"bubui","bubuiram":"bubui","bubuirati":"bubui","bubuirea":"bubuire","bubuiri":"bubuire","bubuirii":"bubuire","bubuirile":"bubuire","bubuirilor":"bubuire","bubuise":"bubui","bubuisem":"bubui","bubuisera":"bubui","bubuiseram":"bubui","bubuiserati":"bubui","bubuisesi":"bubui","bubuisi":"bubui","bubuit":"bubui","bubuiti":"bubui","bubuitoare":"bubuitor","bubuitoarea":"bubuitor","bubuitoarele":"bubuitor","bubuitori":"bubuitor","bubuitorii":"bubuitor","bubuitorul":"bubuitor","bubuitul":"bubuit","bubuitule":"bubuit","bubuitului":"bubuit","bubuituri":"bubuitură","bubuiturii":"bubuitură","bubuiturile":"bubuitură","bubuiturilor":"bubuitură","bubulite":"bubuliță","bubulitei":"bubuliță","bubulitele":"bubuliță","bubulitelor":"bubuliță","buburoasa":["buburoasă","buburos","buburoasa","buburos"],"buburoase":"buburos","buburoasele":"buburos","buburosi":"buburos","buburosii":"buburos","buburosul":"buburos","buburuze":"buburuză","buburuzei":"buburuză","buburuzele":"buburuză","buburuzelor":"buburuză","bubusoare":"bubușoară","bubusoarei":"bubușoară","bubusoarele":"bubușoară","bubusoarelor":"bubușoară","bubute":"bubuță","bubutei":"bubuță","bubutele":"bubuță","bubutelor":"bubuță","bucacioare":"bucăcioară","bucacioarei":"bucăcioară","bucacioarele":"bucăcioară","bucacioarelor":"bucăcioară","bucala":["bucală","bucal","bucala","bucal"],"bucalaia":["bucălaia","bucălai","bucălaia","bucălaie"],"bucalaie":"bucălai","bucalaiele":["bucălaiele","bucălai","bucălaiele","bucălaie"],"bucalaii":["bucălaii","bucălai","bucălaii","bucălaie"],"bucalaiii":"bucălaie","bucalaiul":"bucălai","bucalata":["bucălată","bucălat","bucălata","bucălat"],"bucalate":"bucălat","bucalatele":"bucălat","bucalati":"bucălat","bucalatii":"bucălat","bucalatul":"bucălat","bucale":"bucal","bucalele":"bucal","bucali":"bucal","bucalia":"bucăliu","bucalie":"bucăliu","bucalii":["bucalii","bucal","bucălii","bucăliu"],"bucaliii":"bucăliu","bucaliile":"bucăliu","bucalite":"bucăliță","bucalitei":"bucăliță","bucalitele":"bucăliță","bucalitelor":"bucăliță","bucaliul":"bucăliu","bucalul":"bucal","bucatarea":"bucătări","bucatareai":"bucătări","bucataream":"bucătări","bucatareati":"bucătări","bucatareau":"bucătări","bucataresc":"bucătări","bucatarese":"bucătăreasă","bucataresei":"bucătăreasă","bucataresele":"bucătăreasă","bucatareselor":"bucătăreasă","bucatareste":"bucătări","bucataresti":"bucătări","bucatari":"bucătar","bucataria":"bucătărie","bucatariei":"bucătărie","bucatarii":["bucătarii","bucătar","bucătării","bucătări","bucătării","bucătărie"],"bucatarii de campanie":"bucătărie de campanie","bucatariile":"bucătărie","bucatariilor":"bucătărie","bucatarilor":"bucătar","bucatarim":"bucătări","bucatarind":"bucătări","bucatarioare":"bucătărioară","bucatarioarei":"bucătărioară","bucatarioarele":"bucătărioară","bucatarioarelor":"bucătărioară","bucatarira":"bucătări","bucatariram":"bucătări","bucatarirati":"bucătări","bucatarise":"bucătări","bucatarisem":"bucătări","bucatarisera":"bucătări","bucatariseram":"bucătări","bucatariserati":"bucătări","bucatarisesi":"bucătări","bucatarisi":"bucătări","bucatarit":"bucătări","bucatariti":"bucătări","bucatarul":"bucătar","bucatarule":"bucătar","bucatarului":"bucătar","bucatea":["bucățea","bucăți","bucățea","bucățică"],"bucateai":"bucăți","bucateam":"bucăți","bucateati":"bucăți","bucateau":"bucăți","bucateaua":"bucățea","bucatele":["bucățele","bucățea","bucățele","bucățică"],"bucatelea":"bucățeli","bucateleai":"bucățeli","bucateleam":"bucățeli","bucateleati":"bucățeli","bucateleau":"bucățeli","bucatelei":["bucățelei","bucățea","bucățelei","bucățică"],"bucatelele":["bucățelele","bucățea","bucățelele","bucățică"],"bucatelelor":["bucățelelor","bucățea","bucățelelor","bucățică"],"bucatelesc":"bucățeli","bucateleste":"bucățeli","bucatelesti":"bucățeli","bucatelii":"bucățeli","bucatelim":"bucățeli","bucatelind":"bucățeli","bucatelira":"bucățeli","bucateliram":"bucățeli","bucatelirati":"bucățeli","bucatelise":"bucățeli","bucatelisem":"bucățeli","bucatelisera":"bucățeli","bucateliseram":"bucățeli","bucateliserati":"bucățeli","bucatelisesi":"bucățeli","bucatelisi":"bucățeli","bucatelit":"bucățeli","bucateliti":"bucățeli","bucatelul":"bucățel","bucatelule":"bucățel","bucatelului":"bucățel","bucatesc":"bucăți","bucateste":"bucăți","bucatesti":"bucăți","bucati":"bucată","bucatii":["bucății","bucată","bucății","bucăți"],"bucatile":"bucată","bucatilor":"bucată","bucatim":"bucăți","bucatind":"bucăți","bucatira":"bucăți","bucatiram":"bucăți","bucatirati":"bucăți","bucatise":"bucăți","bucatisem":"bucăți","bucatisera":"bucăți","bucatiseram":"bucăți","bucatiserati":"bucăți","bucatisesi":"bucăți","bucatisi":"bucăți","bucatit":"bucăți","bucatiti":"bucăți","bucatoaie":"bucățoi","bucatoaiele":"bucățoi","bucatoaielor":"bucățoi","bucatoiul":"bucățoi","bucatoiule":"bucățoi","bucatoiului":"bucățoi","bucaturi":"bucătură","bucaturici":"bucăturică","bucaturicii":"bucăturică","bucaturicile":"bucăturică","bucaturicilor":"bucăturică","bucaturii":"bucătură","bucaturile":"bucătură","bucaturilor":"bucătură","bucaturitae":"bucăturiță","bucaturitaei":"bucăturiță","bucaturitaele":"bucăturiță","bucaturitaelor":"bucăturiță","buccea":"bucea","bucceaua":"buccea","buccele":"buccea","buccelei":"buccea","buccelele":"buccea","buccelelor":"buccea","buccia":"bucciu","buccie":"bucciu","buccii":"bucciu","bucciii":"bucciu","bucciile":"bucciu","buccinatori":"buccinator","buccinatorii":"buccinator","buccinatorilor":"buccinator","buccinatorul":"buccinator","buccinatorule":"buccinator","buccinatorului":"buccinator","bucciul":"bucciu","bucele":"bucea","bucentauri":"bucentaur","bucentaurii":"bucentaur","bucentaurilor":"bucentaur","bucentaurul":"bucentaur","bucentaurule":"bucentaur","bucentaurului":"bucentaur","bucerdea grinoasa":"Bucerdea Grânoasă","bucerdea vinoasa":"Bucerdea Vânoasă","bucfarase":"bucfăraș","bucfarasele":"bucfăraș","bucfaraselor":"bucfăraș","bucfarasul":"bucfăraș","bucfarasule":"bucfăraș","bucfarasului":"bucfăraș","bucfarele":"bucfărel","bucfarelele":"bucfărel","bucfarelelor":"bucfărel","bucfarelul":"bucfărel","bucfarelule":"bucfărel","bucfarelului":"bucfărel","buchea":"buche","bucheaua":"buchea","buchelare":"buchelar","buchelarele":"buchelar","buchelarelor":"buchelar","buchelarul":"buchelar","buchelarule":"buchelar","buchelarului":"buchelar","buchele":"buchea","buchelei":"buchea","buchelele":"buchea","buchelelor":"buchea","buchereasca":["bucherească","bucheresc","buchereasca","bucheresc"],"buchereli":"buchereală","bucherelii":"buchereală","bucherelile":"buchereală","bucherelilor":"buchereală","bucherescul":"bucheresc","bucheresti":"bucheresc","bucherestii":"bucheresc","bucherestile":"bucheresc","bucheri":"bucher","bucheria":"bucherie","bucheriei":"bucherie","bucherii":["bucherii","bucher","bucherii","bucherie"],"bucherilor":"bucher","bucherirea":"bucherire","bucheriri":"bucherire","bucheririi":"bucherire","bucheririle":"bucherire","bucheririlor":"bucherire","bucherul":"bucher","bucherule":"bucher","bucherului":"bucher","buchete":"buchet","buchetele":["buchetele","buchet","buchețele","buchețel"],"buchetelele":"buchețel","buchetelelor":"buchețel","buchetelor":"buchet","buchetelul":"buchețel","buchetelule":"buchețel","buchetelului":"buchețel","buchetiere":"buchetieră","buchetierei":"buchetieră","buchetierele":"buchetieră","buchetierelor":"buchetieră","buchetul":"buchet","buchetule":"buchet","buchetului":"buchet","buchi":"buche","buchii":"buche","buchile":"buche","buchilor":"buche","buchinisti":"buchinist","buchinistii":"buchinist","buchinistilor":"buchinist","buchinistul":"buchinist","buchinistule":"buchinist","buchinistului":"buchinist","buchisai":"buchisa","buchisam":["buchisăm","buchisa","buchisam","buchisa"],"buchisand":"buchisa","buchisara":"buchisa","buchisaram":"buchisa","buchisarati":"buchisa","buchisase":"buchisa","buchisasem":"buchisa","buchisasera":"buchisa","buchisaseram":"buchisa","buchisaserati":"buchisa","buchisasesi":"buchisa","buchisasi":"buchisa","buchisat":"buchisa","buchisati":"buchisa","buchisau":"buchisa","buchisea":"buchisi","buchiseai":"buchisi","buchiseam":"buchisi","buchiseati":"buchisi","buchiseau":"buchisi","buchiseaza":"buchisa","buchiseli":"buchiseală","buchiselii":"buchiseală","buchiselile":"buchiseală","buchiselilor":"buchiseală","buchisesc":"buchisi","buchiseste":"buchisi","buchisesti":"buchisi","buchisez":"buchisa","buchisezi":"buchisa","buchisii":"buchisi","buchisim":"buchisi","buchisind":"buchisi","buchisira":"buchisi","buchisiram":"buchisi","buchisirati":"buchisi","buchisise":"buchisi","buchisisem":"buchisi","buchisisera":"buchisi","buchisiseram":"buchisi","buchisiserati":"buchisi","buchisisesi":"buchisi","buchisisi":"buchisi","buchisit":"buchisi","buchisiti":"buchisi","buci":["buci","buc","buci","bucă"],"buciarde":"buciardă","buciardei":"buciardă","buciardele":"buciardă","buciardelor":"buciardă","bucii":["bucii","buc","bucii","bucă"],"bucile":"bucă","bucilor":["bucilor","buc","bucilor","bucă"],"bucin":"bucium","bucina":"buciuma","bucinari":"bucinar","bucinarii":"bucinar","bucinarilor":"bucinar","bucinarul":"bucinar","bucinarule":"bucinar","bucinarului":"bucinar","bucine":"bucin","bucinele":"bucin","bucinelor":"bucin","bucinisi":"buciniș","bucinisii":"buciniș","bucinisilor":"buciniș","bucinisul":"buciniș","bucinisule":"buciniș","bucinisului":"buciniș","bucinul":"bucin","bucinule":"bucin","bucinului":"bucin","buciucasi":"buciucaș","buciucasii":"buciucaș","buciucasilor":"buciucaș","buciucasul":"buciucaș","buciucasule":"buciucaș","buciucasului":"buciucaș","buciucul":"buciuc","buciucule":"buciuc","buciucului":"buciuc","buciucuri":"buciuc","buciucurile":"buciuc","buciucurilor":"buciuc","bucium":"buciuma","buciumai":"buciuma","buciumam":["buciumăm","buciuma","buciumam","buciuma"],"buciumand":"buciuma","buciumara":"buciuma","buciumaram":"buciuma","buciumarati":"buciuma","buciumarea":"buciumare","buciumari":"buciumare","buciumarii":"buciumare","buciumarile":"buciumare","buciumarilor":"buciumare","buciumase":["buciumase","buciuma","buciumașe","buciumașă"],"buciumasei":"buciumașă","buciumasele":"buciumașă","buciumaselor":"buciumașă","buciumasem":"buciuma","buciumasera":"buciuma","buciumaseram":"buciuma","buciumaserati":"buciuma","buciumasesi":"buciuma","buciumasi":["buciumași","buciuma","buciumași","buciumaș"],"buciumasii":"buciumaș","buciumasilor":"buciumaș","buciumasul":"buciumaș","buciumasule":"buciumaș","buciumasului":"buciumaș","buciumat":"buciuma","buciumati":"buciuma","buciumau":"buciuma","buciume":"bucium","buciumei":"buciumel","buciumeii":"buciumel","buciumeilor":"buciumel","buciumelul":"buciumel","buciumelule":"buciumel","buciumelului":"buciumel","buciumi":"buciuma","buclai":"bucla","buclaje":"buclaj","buclajele":"buclaj","buclajelor":"buclaj","buclajul":"buclaj","buclajule":"buclaj","buclajului":"buclaj","buclam":["buclăm","bucla","buclam","bucla"],"bucland":"bucla","buclara":"bucla","buclaram":"bucla","buclarati":"bucla","buclarea":"buclare","buclari":"buclare","buclarii":"buclare","buclarile":"buclare","buclarilor":"buclare","buclase":"bucla","buclasem":"bucla","buclasera":"bucla","buclaseram":"bucla","buclaserati":"bucla","buclasesi":"bucla","buclasi":"bucla","buclat":"bucla","buclata":["buclată","buclat","buclata","buclat"],"buclate":"buclat","buclatele":"buclat","buclati":["buclați","bucla","buclați","buclat"],"buclatii":"buclat","buclatul":"buclat","buclau":"bucla","bucle":"buclă","bucleaza":"bucla","buclei":"buclă","buclele":"buclă","buclelor":"buclă","buclez":"bucla","buclezi":"bucla","buclia":"buclie","bucliei":"buclie","buclii":"buclie","bucliile":"buclie","bucliilor":"buclie","buclucari":"buclucar","buclucarii":"buclucar","buclucarilor":"buclucar","buclucarite":"buclucăriță","buclucaritei":"buclucăriță","buclucaritele":"buclucăriță","buclucaritelor":"buclucăriță","buclucarul":"buclucar","buclucarule":"buclucar","buclucarului":"buclucar","buclucasa":["buclucașă","buclucaș","buclucașa","buclucaș"],"buclucase":["buclucașe","buclucaș","buclucașe","buclucașă"],"buclucasei":"buclucașă","buclucasele":["buclucașele","buclucaș","buclucașele","buclucașă"],"buclucaselor":"buclucașă","buclucasi":"buclucaș","buclucasii":"buclucaș","buclucasul":"buclucaș","buclucul":"bucluc","buclucule":"bucluc","buclucului":"bucluc","buclucuri":"bucluc","buclucurile":"bucluc","buclucurilor":"bucluc","bucoavne":"bucoavnă","bucoavnei":"bucoavnă","bucoavnele":"bucoavnă","bucoavnelor":"bucoavnă","bucolica":["bucolică","bucolic","bucolica","bucolic"],"bucolice":["bucolice","bucolic","bucolice","bucolică"],"bucolicei":"bucolică","bucolicele":["bucolicele","bucolic","bucolicele","bucolică"],"bucolicelor":"bucolică","bucolici":"bucolic","bucolicii":"bucolic","bucolicul":"bucolic","bucolismul":"bucolism","bucolismule":"bucolism","bucolismului":"bucolism","bucovine":"Bucovina","bucovineanul":"bucovinean","bucovineanule":"bucovinean","bucovineanului":"bucovinean","bucovinei":"Bucovina","bucovinence":"bucovineancă","bucovinencei":"bucovineancă","bucovinencele":"bucovineancă","bucovinencelor":"bucovineancă","bucovinene":"bucovineană","bucovinenei":"bucovineană","bucovinenele":"bucovineană","bucovinenelor":"bucovineană","bucovineni":"bucovinean","bucovinenii":"bucovinean","bucovinenilor":"bucovinean","bucranii":"bucraniu","bucraniile":"bucraniu","bucraniilor":"bucraniu","bucraniuul":"bucraniu","bucraniuule":"bucraniu","bucraniuului":"bucraniu","bucse":"bucșă","bucsei":"bucșă","bucsele":"bucșă","bucselor":"bucșă","bucul":"buc","bucule":"buc","bucului":"buc","bucur":"bucura","bucurai":"bucura","bucuram":["bucurăm","bucura","bucuram","bucura"],"bucurand":"bucura","bucurara":"bucura","bucuraram":"bucura","bucurarati":"bucura","bucurase":"bucura","bucurasem":"bucura","bucurasera":"bucura","bucuraseram":"bucura","bucuraserati":"bucura","bucurasesi":"bucura","bucurasi":"bucura","bucurat":"bucura","bucurati":"bucura","bucurau":"bucura","bucure":"bucura","bucuresteana":["bucureșteană","bucureștean","bucureșteana","bucureștean"],"bucuresteanul":"bucureștean","bucuresteanule":"bucureștean","bucuresteanului":"bucureștean","bucurestence":"bucureșteancă","bucurestencei":"bucureșteancă","bucurestencele":"bucureșteancă","bucurestencelor":"bucureșteancă","bucurestene":["bucureștene","bucureștean","bucureștene","bucureșteană"],"bucurestenei":"bucureșteană","bucurestenele":["bucureștenele","bucureștean","bucureștenele","bucureșteană"],"bucurestenelor":"bucureșteană","bucuresteni":"bucureștean","bucurestenii":"bucureștean","bucurestenilor":"bucureștean","bucurestiul":"București","bucurestiule":"București","bucurestiului":"București","bucuri":"bucura","bucuria":"bucurie","bucuriei":"bucurie","bucurii":"bucurie","bucuriile":"bucurie","bucuriilor":"bucurie","bucurind":"bucurând","bucuroasa":["bucuroasă","bucuros","bucuroasa","bucuros"],"bucuroase":"bucuros","bucuroasele":"bucuros","bucurosi":"bucuros","bucurosii":"bucuros","bucurosul":"bucuros","bucute":"bucuță","bucutei":"bucuță","bucutele":"bucuță","bucutelor":"bucuță","bucvarii":"bucvariu","bucvariile":"bucvariu","bucvariilor":"bucvariu","bucvariul":"bucvariu","bucvariule":"bucvariu","bucvariului":"bucvariu","budacicice":"budăcică","budacicicei":"budăcică","budacicicele":"budăcică","budacicicelor":"budăcică","budacicici":"budăcică","budai":"buda","budalasi":"budalaș","budalasii":"budalaș","budalasilor":"budalaș","budalasul":"budalaș","budalasule":"budalaș","budalasului":"budalaș","budalaul":"budala","budalaule":"budala","budalaului":"budala","budam":["budăm","buda","budam","buda"],"budand":"buda","budapeste":"Budapesta","budapestei":"Budapesta","budara":"buda","budaram":"buda","budarati":"buda","budase":"buda","budasem":"buda","budasera":"buda","budaseram":"buda","budaserati":"buda","budasesi":"buda","budasi":"buda","budat":"buda","budati":"buda","budau":"buda","bude":"budă","budeaza":"buda","budei":"budă","budele":"budă","budelor":"budă","budesti-finate":"Budești-Fânațe","budez":"buda","budezi":"buda","budgetara":["budgetară","budgetar","budgetara","budgetar"],"budgetare":"budgetar","budgetarele":"budgetar","budgetari":"budgetar","budgetarii":"budgetar","budgetarul":"budgetar","budgete":"budget","budgetele":"budget","budgetelor":"budget","budgetul":"budget","budgetule":"budget","budgetului":"budget","budihacea":"budihace","budihacei":"budihace","budihacele":"budihace","budihacelor":"budihace","budinci":"budincă","budincii":"budincă","budincile":"budincă","budincilor":"budincă","budismul":"budism","budismule":"budism","budismului":"budism","budiste":"budistă","budistei":"budistă","budistele":"budistă","budistelor":"budistă","budisti":"budist","budistii":"budist","budistilor":"budist","budistul":"budist","budistule":"budist","budistului":"budist","budoare":"budoar","budoarele":"budoar","budoarelor":"budoar","budoarul":"budoar","budoarule":"budoar","budoarului":"budoar","budoinaiul":"budoinai","budoinaiule":"budoinai","budoinaiului":"budoinai","buduare":"buduar","buduarele":"buduar","buduarelor":"buduar","buduarul":"buduar","buduarule":"buduar","buduarului":"buduar","budugar":"budugări","budugare":"budugări","budugarea":"budugări","budugareai":"budugări","budugaream":"budugări","budugareati":"budugări","budugareau":"budugări","budugarie":"budugări","budugarii":"budugări","budugarim":"budugări","budugarind":"budugări","budugarira":"budugări","budugariram":"budugări","budugarirati":"budugări","budugarirea":"budugărire","budugariri":"budugărire","budugaririi":"budugărire","budugaririle":"budugărire","budugaririlor":"budugărire","budugarise":"budugări","budugarisem":"budugări","budugarisera":"budugări","budugariseram":"budugări","budugariserati":"budugări","budugarisesi":"budugări","budugarisi":"budugări","budugarit":"budugări","budugariti":"budugări","buduhalite":"buduhaliță","buduhalitei":"buduhaliță","buduhalitele":"buduhaliță","buduhalitelor":"buduhaliță","budulana":["budulană","budulan","budulana","budulan"],"budulane":"budulan","budulanele":"budulan","budulani":"budulan","budulanii":"budulan","budulanul":"budulan","budulea":"buduli","buduleai":"buduli","buduleam":"buduli","buduleati":"buduli","buduleau":"buduli","budulesc":"buduli","buduleste":"buduli","budulesti":"buduli","budulii":"buduli","budulim":"buduli","budulind":"buduli","budulira":"buduli","buduliram":"buduli","budulirati":"buduli","budulise":"buduli","budulisem":"buduli","budulisera":"buduli","buduliseram":"buduli","buduliserati":"buduli","budulisesi":"buduli","budulisi":"buduli","budulit":"buduli","buduliti":"buduli","buduslai":"budușlău","buduslaii":"budușlău","buduslailor":"budușlău","buduslauul":"budușlău","buduslauule":"budușlău","buduslauului":"budușlău","buf":"buh","bufa":"buhă","bufali":"bufal","bufalii":"bufal","bufalilor":"bufal","bufalul":"bufal","bufalule":"bufal","bufalului":"bufal","bufanta":["bufantă","bufant","bufanta","bufant"],"bufante":"bufant","bufantele":"bufant","bufanti":"bufant","bufantii":"bufant","bufantul":"bufant","bufarii":"bufari","bufariile":"bufari","bufariilor":"bufari","bufariul":"bufari","bufariule":"bufari","bufariului":"bufari","bufe":"bufă","bufei":"bufă","bufele":"bufă","bufelor":"bufă","bufete":"bufet","bufete expres":"bufet expres","bufetele":"bufet","bufetelor":"bufet","bufetiere":"bufetieră","bufetierei":"bufetieră","bufetierele":"bufetieră","bufetierelor":"bufetieră","bufetieri":"bufetier","bufetierii":"bufetier","bufetierilor":"bufetier","bufetierul":"bufetier","bufetierule":"bufetier","bufetierului":"bufetier","bufetul":"bufet","bufetule":"bufet","bufetului":"bufet","bufeuri":"bufeu","bufeurile":"bufeu","bufeurilor":"bufeu","bufeuul":"bufeu","bufeuule":"bufeu","bufeuului":"bufeu","bufi":"buf","bufii":"buf","bufilor":"buf","bufleii":"buflei","bufleilor":"buflei","bufleiul":"buflei","bufleiule":"buflei","bufleiului":"buflei","bufne":"bufnă","bufnea":"bufni","bufneai":"bufni","bufneam":"bufni","bufneati":"bufni","bufneau":"bufni","bufnei":"bufnă","bufnele":["bufnele","bufnă","bufnele","bufneală"],"bufnelei":"bufneală","bufnelele":"bufneală","bufnelelor":"bufneală","bufneli":"bufneală","bufnelor":"bufnă","bufnesc":"bufni","bufneste":"bufni","bufnesti":"bufni","bufnete":"bufnet","bufnetele":"bufnet","bufnetelor":"bufnet","bufnetul":"bufnet","bufnetule":"bufnet","bufnetului":"bufnet","bufnii":"bufni","bufnim":"bufni","bufnind":"bufni","bufnira":"bufni","bufniram":"bufni","bufnirati":"bufni","bufnise":"bufni","bufnisem":"bufni","bufnisera":"bufni","bufniseram":"bufni","bufniserati":"bufni","bufnisesi":"bufni","bufnisi":"bufni","bufnit":"bufni","bufnite":"bufniță","bufnite polare":"bufniță polară","bufnitei":"bufniță","bufnitele":"bufniță","bufnitelor":"bufniță","bufniti":"bufni","bufniture":"bufnitură","bufniturei":"bufnitură","bufniturele":"bufnitură","bufniturelor":"bufnitură","bufnituri":"bufnitură","bufonade":"bufonadă","bufonadei":"bufonadă","bufonadele":"bufonadă","bufonadelor":"bufonadă","bufonai":"bufona","bufonam":["bufonăm","bufona","bufonam","bufona"],"bufonand":"bufona","bufonara":"bufona","bufonaram":"bufona","bufonarati":"bufona","bufonase":"bufona","bufonasem":"bufona","bufonasera":"bufona","bufonaseram":"bufona","bufonaserati":"bufona","bufonasesi":"bufona","bufonasi":"bufona","bufonat":"bufona","bufonati":"bufona","bufonau":"bufona","bufoneaza":"bufona","bufoneria":"bufonerie","bufoneriei":"bufonerie","bufonerii":"bufonerie","bufoneriile":"bufonerie","bufoneriilor":"bufonerie","bufonez":"bufona","bufonezi":"bufona","bufoni":"bufon","bufonii":"bufon","bufonilor":"bufon","bufonul":"bufon","bufonule":"bufon","bufonului":"bufon","buful":"buf","bufule":"buf","bufului":"buf","bugeda":["bugedă","buged","bugeda","buged"],"bugede":"buged","bugedele":"buged","bugedul":"buged","buget":"buged","bugetara":["bugetară","bugetar","bugetara","bugetar"],"bugetare":["bugetare","bugetar","bugetare","bugetară"],"bugetarei":"bugetară","bugetarele":["bugetarele","bugetar","bugetarele","bugetară"],"bugetarelor":"bugetară","bugetari":"bugetar","bugetarii":"bugetar","bugetarul":"bugetar","bugete":"buget","bugetele":"buget","bugetelor":"buget","bugetivora":["bugetivoră","bugetivor","bugetivora","bugetivor"],"bugetivore":"bugetivor","bugetivorele":"bugetivor","bugetivori":"bugetivor","bugetivorii":"bugetivor","bugetivorul":"bugetivor","bugetul":"buget","bugetule":"buget","bugetului":"buget","bugezi":"buged","bugezii":"buged","buginita":["buginită","buginit","buginita","buginit"],"buginite":"buginit","buginitele":"buginit","buginiti":"buginit","buginitii":"buginit","buginitul":"buginit","buh":"buf","buha":"bufă","buhai-de-balta":"buhai de baltă","buhaiasul":"buhăiaș","buhaiasule":"buhăiaș","buhaiasului":"buhăiaș","buhaiesi":"buhăiaș","buhaiesii":"buhăiaș","buhaiesilor":"buhăiaș","buhaii":"buhai","buhailor":"buhai","buhaita":["buhăită","buhăit","buhăita","buhăit"],"buhaite":"buhăit","buhaitele":"buhăit","buhaiti":"buhăit","buhaitii":"buhăit","buhaitul":"buhăit","buhaiul":"buhai","buhaiule":"buhai","buhaiului":"buhai","buhalnite":"buhalniță","buhalnitei":"buhalniță","buhalnitele":"buhalniță","buhalnitelor":"buhalniță","buhava":["buhavă","buhav","buhava","buhav"],"buhave":"buhav","buhavele":"buhav","buhavi":"buhav","buhavii":"buhav","buhavul":"buhav","buhe":"buhă","buhei":"buhă","buhele":"buhă","buhelor":"buhă","buhi":"buh","buhii":"buh","buhilor":"buh","buhna":"bufnă","buhne":"buhnă","buhnei":"buhnă","buhnele":"buhnă","buhnelor":"buhnă","buhoasa":["buhoasă","buhos","buhoasa","buhos"],"buhoase":"buhos","buhoasele":"buhos","buhosi":"buhos","buhosii":"buhos","buhosul":"buhos","buhul":"buh","buhule":"buh","buhului":"buh","buhurdarul":"buhurdar","buhurdarule":"buhurdar","buhurdarului":"buhurdar","buhurdaruri":"buhurdar","buhurdarurile":"buhurdar","buhurdarurilor":"buhurdar","buhurul":"buhur","buhurule":"buhur","buhurului":"buhur","buhururi":"buhur","buhururile":"buhur","buhururilor":"buhur","buhuseana":["buhușeană","buhușean","buhușeana","buhușean"],"buhuseanul":"buhușean","buhuseanule":"buhușean","buhuseanului":"buhușean","buhusence":"buhușeancă","buhusencei":"buhușeancă","buhusencele":"buhușeancă","buhusencelor":"buhușeancă","buhusene":"buhușean","buhusenele":"buhușean","buhuseni":"buhușean","buhusenii":"buhușean","buhusenilor":"buhușean","buiastra":["buiastră","buiastru","buiastra","buiastru","buiastră","buiestru","buiastra","buiestru"],"buiastre":"buiastru","buiastrele":"buiastru","buiastri":"buiastru","buiastrii":"buiastru","buiastrul":"buiastru","buicea":"buici","buiceai":"buici","buiceam":"buici","buiceati":"buici","buiceau":"buici","buicesc":"buici","buiceste":"buici","buicesti":"buici","buicii":"buici","buicim":"buici","buicind":"buici","buicira":"buici","buiciram":"buici","buicirati":"buici","buicise":"buici","buicisem":"buici","buicisera":"buici","buiciseram":"buici","buiciserati":"buici","buicisesi":"buici","buicisi":"buici","buicit":"buici","buiciti":"buici","buicute":"buicuță","buicutei":"buicuță","buicutele":"buicuță","buicutelor":"buicuță","buiecela":["buiecelă","buiecel","buiecela","buiecel"],"buiecele":"buiecel","buiecelele":"buiecel","buieceli":"buiecel","buiecelii":"buiecel","buiecelul":"buiecel","buiecia":"buiecie","buieciei":"buiecie","buiecii":"buiecie","buieciile":"buiecie","buieciilor":"buiecie","buiecimea":"buiecime","buiecimi":"buiecime","buiecimii":"buiecime","buiecimile":"buiecime","buiecimilor":"buiecime","buiecituri":"buiecitură","buieciturii":"buiecitură","buieciturile":"buiecitură","buieciturilor":"buiecitură","buiestrasa":["buiestrașă","buiestraș","buiestrașa","buiestraș"],"buiestrase":"buiestraș","buiestrasele":"buiestraș","buiestrasi":"buiestraș","buiestrasii":"buiestraș","buiestrasul":"buiestraș","buiestre":"buiestru","buiestrele":"buiestru","buiestri":"buiestru","buiestrii":"buiestru","buiestrul":"buiestru","buimaca":["buimacă","buimac","buimaca","buimac"],"buimace":"buimac","buimacea":"buimăci","buimaceai":"buimăci","buimaceam":"buimăci","buimaceati":"buimăci","buimaceau":"buimăci","buimacele":"buimac","buimaceli":"buimăceală","buimacelii":"buimăceală","buimacelile":"buimăceală","buimacelilor":"buimăceală","buimacesc":"buimăci","buimaceste":"buimăci","buimacesti":"buimăci","buimaci":["buimaci","buimac","buimăci","buimăcie"],"buimacia":"buimăcie","buimacii":["buimacii","buimac","buimăcii","buimăci","buimăcii","buimăcie"],"buimacile":"buimăcie","buimacilor":"buimăcie","buimacim":"buimăci","buimacind":"buimăci","buimacira":"buimăci","buimaciram":"buimăci","buimacirati":"buimăci","buimacirea":"buimăcire","buimaciri":"buimăcire","buimacirii":"buimăcire","buimacirile":"buimăcire","buimacirilor":"buimăcire","buimacise":"buimăci","buimacisem":"buimăci","buimacisera":"buimăci","buimaciseram":"buimăci","buimaciserati":"buimăci","buimacisesi":"buimăci","buimacisi":"buimăci","buimacit":"buimăci","buimacita":["buimăcită","buimăcit","buimăcita","buimăcit"],"buimacite":"buimăcit","buimacitele":"buimăcit","buimaciti":["buimăciți","buimăci","buimăciți","buimăcit"],"buimacitii":"buimăcit","buimacitul":"buimăcit","buimacul":"buimac","buimatica":["buimatică","buimatic","buimatica","buimatic"],"buimatice":"buimatic","buimaticele":"buimatic","buimatici":"buimatic","buimaticii":"buimatic","buimaticul":"buimatic","bujde":"bujdă","bujdea":"bujdi","bujdeai":"bujdi","bujdeam":"bujdi","bujdeati":"bujdi","bujdeau":"bujdi","bujdei":"bujdă","bujdele":"bujdă","bujdelor":"bujdă","bujdesc":"bujdi","bujdeste":"bujdi","bujdesti":"bujdi","bujdii":"bujdi","bujdim":"bujdi","bujdind":"bujdi","bujdira":"bujdi","bujdiram":"bujdi","bujdirati":"bujdi","bujdise":"bujdi","bujdisem":"bujdi","bujdisera":"bujdi","bujdiseram":"bujdi","bujdiserati":"bujdi","bujdisesi":"bujdi","bujdisi":"bujdi","bujdit":"bujdi","bujditi":"bujdi","bujenite":"bujeniță","bujenitei":"bujeniță","bujenitele":"bujeniță","bujenitelor":"bujeniță","bujia":"bujie","bujiei":"bujie","bujii":"bujie","bujiile":"bujie","bujiilor":"bujie","bujorasi":"bujoraș","bujorasii":"bujoraș","bujorasilor":"bujoraș","bujorasul":"bujoraș","bujorasule":"bujoraș","bujorasului":"bujoraș","bujorei":"bujorel","bujoreli":"bujorel","bujorelii":"bujorel","bujorelilor":"bujorel","bujorelul":"bujorel","bujorelule":"bujorel","bujorelului":"bujorel","bujori":"bujor","bujori romanesti":"bujor românesc","bujorii":"bujor","bujorilor":"bujor","bujorul":"bujor","bujorule":"bujor","bujorului":"bujor","bulane":"bulan","bulangii":"bulangiu","bulangiii":"bulangiu","bulangiilor":"bulangiu","bulangioaice":"bulangioaică","bulangioaicei":"bulangioaică","bulangioaicele":"bulangioaică","bulangioaicelor":"bulangioaică","bulangiul":"bulangiu","bulangiule":"bulangiu","bulangiului":"bulangiu","bulani":"bulan","bulanii":"bulan","bulanilor":"bulan","bulanul":"bulan","bulanule":"bulan","bulanului":"bulan","bulaul":"bulău","bulaule":"bulău","bulaului":"bulău","bulbaci":"bulbac","bulbacii":"bulbac","bulbacilor":"bulbac","bulbacul":"bulbac","bulbacule":"bulbac","bulbacului":"bulbac","bulbara":["bulbară","bulbar","bulbara","bulbar"],"bulbare":"bulbar","bulbarele":"bulbar","bulbari":"bulbar","bulbarii":"bulbar","bulbarul":"bulbar","bulbi":"bulb","bulbifera":["bulbiferă","bulbifer","bulbifera","bulbifer"],"bulbifere":"bulbifer","bulbiferele":"bulbifer","bulbiferi":"bulbifer","bulbiferii":"bulbifer","bulbiferul":"bulbifer","bulbiforma":["bulbiformă","bulbiform","bulbiforma","bulbiform"],"bulbiforme":"bulbiform","bulbiformele":"bulbiform","bulbiformi":"bulbiform","bulbiformii":"bulbiform","bulbiformul":"bulbiform","bulbii":"bulb","bulbili":"bulbil","bulbilii":"bulbil","bulbililor":"bulbil","bulbilor":"bulb","bulbilul":"bulbil","bulbilule":"bulbil","bulbilului":"bulbil","bulboace":"bulboacă","bulboacei":"bulboacă","bulboacele":"bulboacă","bulboacelor":"bulboacă","bulboane":"bulboană","bulboanei":"bulboană","bulboanele":"bulboană","bulboanelor":"bulboană","bulboasa":["bulboasă","bulbos","bulboasa","bulbos"],"bulboase":"bulbos","bulboasele":"bulbos","bulbosi":"bulbos","bulbosii":"bulbos","bulbosul":"bulbos","bulbuc":["bulbuc","bulbuca","bulbuc","bulbuci"],"bulbucai":"bulbuca","bulbucam":["bulbucăm","bulbuca","bulbucam","bulbuca"],"bulbucand":"bulbuca","bulbucara":"bulbuca","bulbucaram":"bulbuca","bulbucarati":"bulbuca","bulbucase":"bulbuca","bulbucasem":"bulbuca","bulbucasera":"bulbuca","bulbucaseram":"bulbuca","bulbucaserati":"bulbuca","bulbucasesi":"bulbuca","bulbucasi":"bulbuca","bulbucat":"bulbuca","bulbucata":["bulbucată","bulbucat","bulbucata","bulbucat"],"bulbucate":"bulbucat","bulbucatele":"bulbucat","bulbucati":["bulbucați","bulbuca","bulbucați","bulbucat"],"bulbucatii":"bulbucat","bulbucatul":"bulbucat","bulbucaturi":"bulbucătură","bulbucaturii":"bulbucătură","bulbucaturile":"bulbucătură","bulbucaturilor":"bulbucătură","bulbucau":"bulbuca","bulbuce":"bulbuci","bulbucea":"bulbuci","bulbuceai":"bulbuci","bulbuceam":"bulbuci","bulbuceati":"bulbuci","bulbuceau":"bulbuci","bulbucei":"bulbucel","bulbuceii":"bulbucel","bulbuceilor":"bulbucel","bulbuceli":"bulbuceală","bulbucelii":"bulbuceală","bulbucelile":"bulbuceală","bulbucelilor":"bulbuceală","bulbucelul":"bulbucel","bulbucelule":"bulbucel","bulbucelului":"bulbucel","bulbuci":["bulbuci","bulbuc","bulbuci","bulbuca"],"bulbucie":"bulbuci","bulbucii":"bulbuci","bulbucim":"bulbuci","bulbucind":"bulbuci","bulbucira":"bulbuci","bulbuciram":"bulbuci","bulbucirati":"bulbuci","bulbucise":"bulbuci","bulbucisem":"bulbuci","bulbucisera":"bulbuci","bulbuciseram":"bulbuci","bulbuciserati":"bulbuci","bulbucisesi":"bulbuci","bulbucisi":"bulbuci","bulbucit":"bulbuci","bulbuciti":"bulbuci","bulbucuti":"bulbucuț","bulbucutii":"bulbucuț","bulbucutilor":"bulbucuț","bulbucutul":"bulbucuț","bulbucutule":"bulbucuț","bulbucutului":"bulbucuț","bulbul":"bulb","bulbule":"bulb","bulbului":"bulb","buldogi":"buldog","buldogi americani":"buldog american","buldogii":"buldog","buldogilor":"buldog","buldogul":"buldog","buldogule":"buldog","buldogului":"buldog","buldozere":"buldozer","buldozerele":"buldozer","buldozerelor":"buldozer","buldozerista":["buldozeristă","buldozerist","buldozerista","buldozerist"],"buldozeriste":["buldozeriste","buldozerist","buldozeriste","buldozeristă"],"buldozeristei":"buldozeristă","buldozeristele":["buldozeristele","buldozerist","buldozeristele","buldozeristă"],"buldozeristelor":"buldozeristă","buldozeristi":"buldozerist","buldozeristii":"buldozerist","buldozeristul":"buldozerist","buldozerul":"buldozer","buldozerule":"buldozer","buldozerului":"buldozer","bule":"bulă","bule papale":"bulă papală","bulea":"buli","buleai":"buli","buleam":"buli","buleati":"buli","buleau":"buli","bulei":"bulă","bulele":"bulă","bulelor":"bulă","bulendre":"buleandră","bulendrei":"buleandră","bulendrele":"buleandră","bulendrelor":"buleandră","bulesc":"buli","buleste":"buli","bulesti":"buli","buleti":"bulet","buletii":"bulet","buletilor":"bulet","buletine":"buletin","buletine de vot":"buletin de vot","buletine meteorologice":"buletin meteorologic","buletinele":"buletin","buletinelor":"buletin","buletinul":"buletin","buletinule":"buletin","buletinului":"buletin","buletul":"bulet","buletule":"bulet","buletului":"bulet","bulevarde":"bulevard","bulevardele":"bulevard","bulevardelor":"bulevard","bulevardiere":"bulevardieră","bulevardierei":"bulevardieră","bulevardierele":"bulevardieră","bulevardierelor":"bulevardieră","bulevardieri":"bulevardier","bulevardierii":"bulevardier","bulevardierilor":"bulevardier","bulevardierul":"bulevardier","bulevardierule":"bulevardier","bulevardierului":"bulevardier","bulevardiste":"bulevardistă","bulevardistei":"bulevardistă","bulevardistele":"bulevardistă","bulevardistelor":"bulevardistă","bulevardul":"bulevard","bulevardule":"bulevard"};
@@ -0,0 +1 @@
+export default {"bulevardului":"bulevard","bulg":"bulz","bulgangioaico":"bulangioaică","bulgara":["bulgară","bulgar","bulgara","bulgar"],"bulgarasi":"bulgăraș","bulgarasii":"bulgăraș","bulgarasilor":"bulgăraș","bulgarasul":"bulgăraș","bulgarasule":"bulgăraș","bulgarasului":"bulgăraș","bulgare":["bulgare","bulgar","bulgare","bulgară"],"bulgarea":"bulgări","bulgareai":"bulgări","bulgaream":"bulgări","bulgareasca":["bulgărească","bulgăresc","bulgăreasca","bulgăresc"],"bulgareati":"bulgări","bulgareau":"bulgări","bulgarei":["bulgarei","bulgară","bulgărei","bulgărel"],"bulgareii":"bulgărel","bulgareilor":"bulgărel","bulgarele":["bulgarele","bulgar","bulgarele","bulgară","bulgărele","bulgăre"],"bulgarelor":"bulgară","bulgarelui":"bulgăre","bulgarelul":"bulgărel","bulgarelule":"bulgărel","bulgarelului":"bulgărel","bulgaresc":"bulgări","bulgarescul":"bulgăresc","bulgareste":"bulgări","bulgaresti":["bulgărești","bulgăresc","bulgărești","bulgări"],"bulgarestii":"bulgăresc","bulgarestile":"bulgăresc","bulgari":["bulgari","bulgar","bulgări","bulgăr","bulgări","bulgăre"],"bulgari de zapada":"bulgăre de zăpadă","bulgaria":"bulgărie","bulgarie":"Bulgaria","bulgariei":["bulgariei","Bulgaria","bulgăriei","bulgărie"],"bulgarii":["bulgarii","bulgar","bulgării","bulgăr","bulgării","bulgăre","bulgării","bulgări","bulgarii","Bulgaria","bulgării","bulgărie"],"bulgariile":"bulgărie","bulgariilor":"bulgărie","bulgarilor":["bulgarilor","bulgar","bulgărilor","bulgăr","bulgărilor","bulgăre"],"bulgarim":"bulgări","bulgarimea":"bulgărime","bulgarimi":"bulgărime","bulgarimii":"bulgărime","bulgarind":"bulgări","bulgarira":"bulgări","bulgariram":"bulgări","bulgarirati":"bulgări","bulgarise":"bulgări","bulgarisem":"bulgări","bulgarisera":"bulgări","bulgariseram":"bulgări","bulgariserati":"bulgări","bulgarisesi":"bulgări","bulgarisi":"bulgări","bulgarisme":"bulgărism","bulgarismele":"bulgărism","bulgarismelor":"bulgărism","bulgarismul":"bulgărism","bulgarismule":"bulgărism","bulgarismului":"bulgărism","bulgarit":"bulgări","bulgarite":"bulgăriță","bulgaritei":"bulgăriță","bulgaritele":"bulgăriță","bulgaritelor":"bulgăriță","bulgariti":"bulgări","bulgarizai":"bulgariza","bulgarizam":["bulgarizăm","bulgariza","bulgarizam","bulgariza"],"bulgarizand":"bulgariza","bulgarizara":"bulgariza","bulgarizaram":"bulgariza","bulgarizarati":"bulgariza","bulgarizase":"bulgariza","bulgarizasem":"bulgariza","bulgarizasera":"bulgariza","bulgarizaseram":"bulgariza","bulgarizaserati":"bulgariza","bulgarizasesi":"bulgariza","bulgarizasi":"bulgariza","bulgarizat":"bulgariza","bulgarizati":"bulgariza","bulgarizatul":"bulgarizat","bulgarizatule":"bulgarizat","bulgarizatului":"bulgarizat","bulgarizaturi":"bulgarizat","bulgarizaturile":"bulgarizat","bulgarizaturilor":"bulgarizat","bulgarizau":"bulgariza","bulgarizeaza":"bulgariza","bulgarizez":"bulgariza","bulgarizezi":"bulgariza","bulgaroaice":"bulgăroaică","bulgaroaicei":"bulgăroaică","bulgaroaicele":"bulgăroaică","bulgaroaicelor":"bulgăroaică","bulgaroiul":"bulgăroi","bulgaroiule":"bulgăroi","bulgaroiului":"bulgăroi","bulgarul":["bulgarul","bulgar","bulgărul","bulgăr"],"bulgarule":["bulgarule","bulgar","bulgărule","bulgăr"],"bulgarului":["bulgarului","bulgar","bulgărului","bulgăr"],"bulgurul":"bulgur","bulgurule":"bulgur","bulgurului":"bulgur","bulhace":"bulhac","bulhacele":"bulhac","bulhacelor":"bulhac","bulhacul":"bulhac","bulhacule":"bulhac","bulhacului":"bulhac","bulibasea":"bulibăși","bulibaseai":"bulibăși","bulibaseam":"bulibăși","bulibaseati":"bulibăși","bulibaseau":"bulibăși","bulibasele":"bulibășeală","bulibaselei":"bulibășeală","bulibaselele":"bulibășeală","bulibaselelor":"bulibășeală","bulibaseli":"bulibășeală","bulibasesc":"bulibăși","bulibaseste":"bulibăși","bulibasesti":"bulibăși","bulibasi":"bulibașă","bulibasii":"bulibăși","bulibasim":"bulibăși","bulibasind":"bulibăși","bulibasira":"bulibăși","bulibasiram":"bulibăși","bulibasirati":"bulibăși","bulibasise":"bulibăși","bulibasisem":"bulibăși","bulibasisera":"bulibăși","bulibasiseram":"bulibăși","bulibasiserati":"bulibăși","bulibasisesi":"bulibăși","bulibasisi":"bulibăși","bulibasit":"bulibăși","bulibasiti":"bulibăși","bulii":"buli","bulim":"buli","bulimia":"bulimie","bulimica":["bulimică","bulimic","bulimica","bulimic"],"bulimice":["bulimice","bulimic","bulimice","bulimică"],"bulimicei":"bulimică","bulimicele":["bulimicele","bulimic","bulimicele","bulimică"],"bulimicelor":"bulimică","bulimici":"bulimic","bulimicii":"bulimic","bulimicul":"bulimic","bulimiei":"bulimie","bulimii":"bulimie","bulina":"bulin","bulind":"buli","buline":["buline","bulin","buline","bulină"],"bulinei":"bulină","bulinele":["bulinele","bulin","bulinele","bulină"],"bulinelor":["bulinelor","bulin","bulinelor","bulină"],"bulinul":"bulin","bulinule":"bulin","bulinului":"bulin","bulioane":"bulion","bulira":"buli","buliram":"buli","bulirati":"buli","bulise":"buli","bulisem":"buli","bulisera":"buli","buliseram":"buli","buliserati":"buli","bulisesi":"buli","bulisi":"buli","bulit":"buli","buliti":"buli","bulldogi americani":"bulldog american","buloane":"bulon","bulonai":"bulona","bulonaje":"bulonaj","bulonajele":"bulonaj","bulonajelor":"bulonaj","bulonajul":"bulonaj","bulonajule":"bulonaj","bulonajului":"bulonaj","bulonam":["bulonăm","bulona","bulonam","bulona"],"bulonand":"bulona","bulonara":"bulona","bulonaram":"bulona","bulonarati":"bulona","bulonase":"bulona","bulonasem":"bulona","bulonasera":"bulona","bulonaseram":"bulona","bulonaserati":"bulona","bulonasesi":"bulona","bulonasi":"bulona","bulonat":"bulona","bulonati":"bulona","bulonau":"bulona","buloneaza":"bulona","bulonez":"bulona","bulonezi":"bulona","bulubasaul":"bulubașă","bulubasaule":"bulubașă","bulubasaului":"bulubașă","bulubasi":"bulubașă","bulubasii":"bulubașă","bulubasilor":"bulubașă","bulucbasei":"bulucbașă","bulucbasi":["bulucbași","bulucbaș","bulucbași","bulucbașă"],"bulucbasii":["bulucbașii","bulucbaș","bulucbașii","bulucbașă"],"bulucbasilor":["bulucbașilor","bulucbaș","bulucbașilor","bulucbașă"],"bulucbasul":"bulucbaș","bulucbasule":"bulucbaș","bulucbasului":"bulucbaș","bulucea":"buluci","buluceai":"buluci","buluceam":"buluci","buluceati":"buluci","buluceau":"buluci","bulucesc":"buluci","buluceste":"buluci","bulucesti":"buluci","bulucii":"buluci","bulucim":"buluci","bulucind":"buluci","bulucira":"buluci","buluciram":"buluci","bulucirati":"buluci","bulucise":"buluci","bulucisem":"buluci","bulucisera":"buluci","buluciseram":"buluci","buluciserati":"buluci","bulucisesi":"buluci","bulucisi":"buluci","bulucit":"buluci","buluciti":"buluci","bulucuri":"buluc","bulughene":"bulugheană","bulughenei":"bulugheană","bulughenele":"bulugheană","bulughenelor":"bulugheană","bulumaci":"bulumac","bulumacii":"bulumac","bulumacilor":"bulumac","bulumacul":"bulumac","bulumacule":"bulumac","bulumacului":"bulumac","bulvani":"bulvan","bulvanii":"bulvan","bulvanilor":"bulvan","bulvanul":"bulvan","bulvanule":"bulvan","bulvanului":"bulvan","bulversai":"bulversa","bulversam":["bulversăm","bulversa","bulversam","bulversa"],"bulversand":"bulversa","bulversara":"bulversa","bulversaram":"bulversa","bulversarati":"bulversa","bulversarea":"bulversare","bulversari":"bulversare","bulversarii":"bulversare","bulversarile":"bulversare","bulversarilor":"bulversare","bulversase":"bulversa","bulversasem":"bulversa","bulversasera":"bulversa","bulversaseram":"bulversa","bulversaserati":"bulversa","bulversasesi":"bulversa","bulversasi":"bulversa","bulversat":"bulversa","bulversata":["bulversată","bulversat","bulversata","bulversat"],"bulversate":"bulversat","bulversatele":"bulversat","bulversati":["bulversați","bulversa","bulversați","bulversat"],"bulversatii":"bulversat","bulversatul":"bulversat","bulversau":"bulversa","bulverseaza":"bulversa","bulversez":"bulversa","bulversezi":"bulversa","bulz n bulz":"bulz","bulzisori":"bulzișor","bulzisorii":"bulzișor","bulzisorilor":"bulzișor","bulzisorul":"bulzișor","bulzisorule":"bulzișor","bulzisorului":"bulzișor","bulzoace":"bulzoc","bulzoacele":"bulzoc","bulzoacelor":"bulzoc","bulzocul":"bulzoc","bulzocule":"bulzoc","bulzocului":"bulzoc","bulzul":"bulz","bulzule":"bulz","bulzului":"bulz","bulzuri":"bulz","bulzurile":"bulz","bulzurilor":"bulz","bumaste":"bumașcă","bumastei":"bumașcă","bumastele":"bumașcă","bumastelor":"bumașcă","bumasti":"bumașcă","bumbacarese":"bumbăcăreasă","bumbacaresei":"bumbăcăreasă","bumbacaresele":"bumbăcăreasă","bumbacareselor":"bumbăcăreasă","bumbacari":"bumbăcar","bumbacaria":"bumbăcărie","bumbacariei":"bumbăcărie","bumbacarii":["bumbăcarii","bumbăcar","bumbăcării","bumbăcărie"],"bumbacariile":"bumbăcărie","bumbacariilor":"bumbăcărie","bumbacarilor":"bumbăcar","bumbacarite":["bumbăcărițe","bumbăcariță","bumbăcărițe","bumbăcăriță"],"bumbacaritei":["bumbăcăriței","bumbăcariță","bumbăcăriței","bumbăcăriță"],"bumbacaritele":["bumbăcărițele","bumbăcariță","bumbăcărițele","bumbăcăriță"],"bumbacaritelor":["bumbăcărițelor","bumbăcariță","bumbăcărițelor","bumbăcăriță"],"bumbacarul":"bumbăcar","bumbacarule":"bumbăcar","bumbacarului":"bumbăcar","bumbacea":"bumbăci","bumbaceai":"bumbăci","bumbaceam":"bumbăci","bumbaceati":"bumbăci","bumbaceau":"bumbăci","bumbacele":"bumbăceală","bumbacelei":"bumbăceală","bumbacelele":"bumbăceală","bumbacelelor":"bumbăceală","bumbaceli":"bumbăceală","bumbacelul":"bumbăcel","bumbacelule":"bumbăcel","bumbacelului":"bumbăcel","bumbaceluri":"bumbăcel","bumbacelurile":"bumbăcel","bumbacelurilor":"bumbăcel","bumbacesc":"bumbăci","bumbaceste":"bumbăci","bumbacesti":"bumbăci","bumbaci":"bumbac","bumbacii":["bumbacii","bumbac","bumbăcii","bumbăci"],"bumbacilor":"bumbac","bumbacim":"bumbăci","bumbacind":"bumbăci","bumbacira":"bumbăci","bumbaciram":"bumbăci","bumbacirati":"bumbăci","bumbacise":"bumbăci","bumbacisem":"bumbăci","bumbacisera":"bumbăci","bumbaciseram":"bumbăci","bumbaciserati":"bumbăci","bumbacisesi":"bumbăci","bumbacisi":"bumbăci","bumbacit":"bumbăci","bumbaciti":"bumbăci","bumbacitul":"bumbăcit","bumbacitule":"bumbăcit","bumbacitului":"bumbăcit","bumbacoasa":["bumbăcoasă","bumbăcos","bumbăcoasa","bumbăcos"],"bumbacoase":"bumbăcos","bumbacoasele":"bumbăcos","bumbacosi":"bumbăcos","bumbacosii":"bumbăcos","bumbacosul":"bumbăcos","bumbacul":"bumbac","bumbacule":"bumbac","bumbacului":"bumbac","bumbacuri":"bumbac","bumbacurile":"bumbac","bumbacurilor":"bumbac","bumbarale":"bumbara","bumbaralei":"bumbara","bumbaralele":"bumbara","bumbaralelor":"bumbara","bumbaraua":"bumbara","bumbarei":"bumbărel","bumbareii":"bumbărel","bumbareilor":"bumbărel","bumbarelul":"bumbărel","bumbarelule":"bumbărel","bumbarelului":"bumbărel","bumbasiri":"bumbașir","bumbasirii":"bumbașir","bumbasirilor":"bumbașir","bumbasirul":"bumbașir","bumbasirule":"bumbașir","bumbasirului":"bumbașir","bumbi":"bumb","bumbicul":"bumbic","bumbicule":"bumbic","bumbicului":"bumbic","bumbicuri":"bumbic","bumbicurile":"bumbic","bumbicurilor":"bumbic","bumbii":"bumb","bumbilor":"bumb","bumbisori":"bumbișor","bumbisorii":"bumbișor","bumbisorilor":"bumbișor","bumbisorul":"bumbișor","bumbisorule":"bumbișor","bumbisorului":"bumbișor","bumbul":"bumb","bumbule":"bumb","bumbuleti":"bumbuleț","bumbuletii":"bumbuleț","bumbuletilor":"bumbuleț","bumbuletul":"bumbuleț","bumbuletule":"bumbuleț","bumbuletului":"bumbuleț","bumbului":"bumb","bumbureaua":"bumburea","bumburele":"bumburea","bumburelei":"bumburea","bumburelele":"bumburea","bumburelelor":"bumburea","bumbusori":"bumbușor","bumbusorii":"bumbușor","bumbusorilor":"bumbușor","bumbusorul":"bumbușor","bumbusorule":"bumbușor","bumbusorului":"bumbușor","bumbuste":"bumbușcă","bumbustei":"bumbușcă","bumbustele":"bumbușcă","bumbustelor":"bumbușcă","bumbuti":"bumbuț","bumbutii":"bumbuț","bumbutilor":"bumbuț","bumbutul":"bumbuț","bumbutule":"bumbuț","bumbutului":"bumbuț","bumerangul":"bumerang","bumerangule":"bumerang","bumerangului":"bumerang","bumeranguri":"bumerang","bumerangurile":"bumerang","bumerangurilor":"bumerang","buna":["bună","bun","buna","bun"],"bunaciunea":"bunăciune","bunaciuni":"bunăciune","bunaciunii":"bunăciune","bunaciunile":"bunăciune","bunaciunilor":"bunăciune","bunari":"bunar","bunarii":"bunar","bunarilor":"bunar","bunarul":"bunar","bunarule":"bunar","bunarului":"bunar","bunastari":"bunăstare","bunatatea":"bunătate","bunatati":"bunătate","bunatatii":"bunătate","bunatatile":"bunătate","bunatatilor":"bunătate","bunavointe":"bunăvoință","bunavointei":"bunăvoință","buncare":"buncăr","buncarele":"buncăr","buncarelor":"buncăr","buncarul":"buncăr","buncarule":"buncăr","buncarului":"buncăr","bunde":"bundă","bundei":"bundă","bundele":"bundă","bundelor":"bundă","bundesratul":"bundesrat","bundesratule":"bundesrat","bundesratului":"bundesrat","bundestagul":"bundestag","bundestagule":"bundestag","bundestagului":"bundestag","bundite":"bundiță","bunditei":"bundiță","bunditele":"bundiță","bunditelor":"bundiță","bundul":"bund","bundule":"bund","bundului":"bund","bunduri":"bund","bundurile":"bund","bundurilor":"bund","bundute":"bunduță","bundutei":"bunduță","bundutele":"bunduță","bundutelor":"bunduță","bune":"bun","bunei":"bunel","bunei vestiri":"Buna Vestire","buneii":"bunel","buneilor":"bunel","bunele":"bun","bunelul":"bunel","bunelule":"bunel","bunelului":"bunel","bunetea":"bunețe","buneti":"bunețe","bunetii":"bunețe","bunetile":"bunețe","bunetilor":"bunețe","bungaloul":"bungalou","bungaloule":"bungalou","bungaloului":"bungalou","bungalouri":"bungalou","bungalourile":"bungalou","bungalourilor":"bungalou","bungalow-uri":"bungalow","bungalow-urile":"bungalow","bungalow-urilor":"bungalow","bungalowul":"bungalow","bungalowule":"bungalow","bungalowului":"bungalow","bungetul":"bunget","bungetule":"bunget","bungetului":"bunget","bungeturi":"bunget","bungeturile":"bunget","bungeturilor":"bunget","bungoiatul":"bungoiat","bungoiatule":"bungoiat","bungoiatului":"bungoiat","buni":"bun","bunicei":"bunicel","buniceii":"bunicel","bunicele":"bunicel","bunicelele":"bunicel","bunicelul":"bunicel","bunici":["bunici","bunic","bunici","bunică"],"bunicica":["bunicică","bunicel","bunicica","bunicel"],"bunicii":["bunicii","bunic","bunicii","bunică"],"bunicile":"bunică","bunicilor":["bunicilor","bunic","bunicilor","bunică"],"bunicul":"bunic","bunicule":"bunic","bunicului":"bunic","bunicute":"bunicuță","bunicutei":"bunicuță","bunicutele":"bunicuță","bunicutelor":"bunicuță","bunicuti":"bunicuț","bunicutii":"bunicuț","bunicutilor":"bunicuț","bunicutul":"bunicuț","bunicutule":"bunicuț","bunicutului":"bunicuț","bunii":"bun","bunilor":"bun","bunisoara":["bunișoară","bunișor","bunișoara","bunișor"],"bunisoare":"bunișor","bunisoarele":"bunișor","bunisori":"bunișor","bunisorii":"bunișor","bunisorul":"bunișor","bunite":"buniță","bunitei":"buniță","bunitele":"buniță","bunitelor":"buniță","buntari":"bunțăr","buntarii":"bunțăr","buntarilor":"bunțăr","buntarul":"bunțăr","buntarule":"bunțăr","buntarului":"bunțăr","buntusnici":"buntușnic","buntusnicii":"buntușnic","buntusnicilor":"buntușnic","buntusnicul":"buntușnic","buntusnicule":"buntușnic","buntusnicului":"buntușnic","bunul":"bun","bunule":"bun","bunului":"bun","bunuri":"bun","bunurile":"bun","bunurilor":"bun","bunuta":["bunuță","bunuț","bunuța","bunuț"],"bunute":"bunuț","bunutele":"bunuț","bunuti":"bunuț","bunutii":"bunuț","bunutul":"bunuț","burai":"bura","buraie":"burău","buraiele":"burău","buraielor":"burău","buraitoarea":"burăitoare","buraitori":"burăitoare","buraitorii":"burăitoare","buraitorile":"burăitoare","buraitorilor":"burăitoare","buram":["burăm","bura","buram","bura"],"burand":"bura","burangicul":"burangic","burangicule":"burangic","burangicului":"burangic","burangicuri":"burangic","burangicurile":"burangic","burangicurilor":"burangic","burara":"bura","buraram":"bura","burarati":"bura","burarea":"burare","burari":"burare","burarii":"burare","burarile":"burare","burarilor":"burare","burase":"bura","burasem":"bura","burasera":"bura","buraseram":"bura","buraserati":"bura","burasesi":"bura","burasi":"bura","burat":"bura","burateci":"buratec","buratecii":"buratec","buratecilor":"buratec","buratecul":"buratec","buratecule":"buratec","buratecului":"buratec","burati":"bura","buratici":"buratic","buraticii":"buratic","buraticilor":"buratic","buraticul":"buratic","buraticule":"buratic","buraticului":"buratic","burau":"bura","burauul":"burău","burauule":"burău","burauului":"burău","burbonul":"burbon","burbonule":"burbon","burbonului":"burbon","burcuseasca":["burcușească","burcușesc","burcușeasca","burcușesc"],"burcusescul":"burcușesc","burcusesti":"burcușesc","burcusestii":"burcușesc","burcusestile":"burcușesc","burcusi":"burcuș","burcusii":"burcuș","burcusilor":"burcuș","burcusoare":"burcușoară","burcusoarei":"burcușoară","burcusoarele":"burcușoară","burcusoarelor":"burcușoară","burcusul":"burcuș","burcusule":"burcuș","burcusului":"burcuș","burdihane":"burdihan","burdihanele":"burdihan","burdihanelor":"burdihan","burdihanul":"burdihan","burdihanule":"burdihan","burdihanului":"burdihan","burdioasa":["burdioasă","burdios","burdioasa","burdios"],"burdioase":"burdios","burdioasele":"burdios","burdiosi":"burdios","burdiosii":"burdios","burdiosul":"burdios","burduful":"burduf","burdufule":"burduf","burdufului":"burduf","burdufuri":"burduf","burdufurile":"burduf","burdufurilor":"burduf","burduhane":"burduhan","burduhanele":"burduhan","burduhanelor":"burduhan","burduhanoasa":["burduhănoasă","burduhănos","burduhănoasa","burduhănos"],"burduhanoase":"burduhănos","burduhanoasele":"burduhănos","burduhanosi":"burduhănos","burduhanosii":"burduhănos","burduhanosul":"burduhănos","burduhanul":"burduhan","burduhanule":"burduhan","burduhanului":"burduhan","burduhasi":"burduhaș","burduhasile":"burduhaș","burduhasilor":"burduhaș","burduhasul":"burduhaș","burduhasule":"burduhaș","burduhasului":"burduhaș","burduhoasa":["burduhoasă","burduhos","burduhoasa","burduhos"],"burduhoase":"burduhos","burduhoasele":"burduhos","burduhosela":["burduhoșelă","burduhoșel","burduhoșela","burduhoșel"],"burduhosele":"burduhoșel","burduhoselele":"burduhoșel","burduhoseli":"burduhoșel","burduhoselii":"burduhoșel","burduhoselul":"burduhoșel","burduhosi":"burduhos","burduhosii":"burduhos","burduhosul":"burduhos","burduhul":"burduh","burduhule":"burduh","burduhului":"burduh","burduhuri":"burduh","burduhurile":"burduh","burduhurilor":"burduh","burduloaie":"burduloi","burduloaiele":"burduloi","burduloaielor":"burduloi","burduloiul":"burduloi","burduloiule":"burduloi","burduloiului":"burduloi","burdusea":"burduși","burduseai":"burduși","burduseam":"burduși","burduseati":"burduși","burduseau":"burduși","burdusele":["burdușele","burdușeală","burdușele","burdușel"],"burduselei":"burdușeală","burduselele":["burdușelele","burdușeală","burdușelele","burdușel"],"burduselelor":["burdușelelor","burdușeală","burdușelelor","burdușel"],"burduseli":"burdușeală","burduselul":"burdușel","burduselule":"burdușel","burduselului":"burdușel","burdusesc":"burduși","burduseste":"burduși","burdusesti":"burduși","burdusii":"burduși","burdusim":"burduși","burdusind":"burduși","burdusira":"burduși","burdusiram":"burduși","burdusirati":"burduși","burdusirea":"burdușire","burdusiri":"burdușire","burdusirii":"burdușire","burdusirile":"burdușire","burdusirilor":"burdușire","burdusise":"burduși","burdusisem":"burduși","burdusisera":"burduși","burdusiseram":"burduși","burdusiserati":"burduși","burdusisesi":"burduși","burdusisi":"burduși","burdusit":"burduși","burdusita":["burdușită","burdușit","burdușita","burdușit"],"burdusite":"burdușit","burdusitele":"burdușit","burdusiti":["burdușiți","burduși","burdușiți","burdușit"],"burdusitii":"burdușit","burdusitul":"burdușit","burdusul":"burduș","burdusule":"burduș","burdusului":"burduș","burdusuri":"burduș","burdusurile":"burduș","burdusurilor":"burduș","burduv":"burduf","burduvul":"burduv","burduvule":"burduv","burduvului":"burduv","burduvuri":"burduv","burduvurile":"burduv","burduvurilor":"burduv","bure":"bură","bureaza":"bura","bureciori":"burecior","bureciorii":"burecior","bureciorilor":"burecior","bureciorul":"burecior","bureciorule":"burecior","bureciorului":"burecior","burei":"bură","burele":"bură","bureleti":"burelet","bureletii":"burelet","bureletilor":"burelet","bureletul":"burelet","bureletule":"burelet","bureletului":"burelet","burelor":"bură","buretei":"burețel","bureteii":"burețel","bureteilor":"burețel","buretele":"burete","buretelui":"burete","buretelul":"burețel","buretelule":"burețel","buretelului":"burețel","bureti":"burete","bureti de mare":"burete de mare","buretiere":"buretieră","buretierei":"buretieră","buretierele":"buretieră","buretierelor":"buretieră","buretii":"burete","buretilor":"burete","buretoasa":["buretoasă","buretos","buretoasa","buretos"],"buretoase":"buretos","buretoasele":"buretos","buretosi":"buretos","buretosii":"buretos","buretosul":"buretos","burez":"bura","burezi":"bura","burgade":"burgadă","burgadei":"burgadă","burgadele":"burgadă","burgadelor":"burgadă","burgheza":["burgheză","burghez","burgheza","burghez"],"burgheze":["burgheze","burghez","burgheze","burgheză"],"burghezea":"burghezi","burghezeai":"burghezi","burghezeam":"burghezi","burghezeati":"burghezi","burghezeau":"burghezi","burghezei":"burgheză","burghezele":["burghezele","burghez","burghezele","burgheză"],"burghezelor":"burgheză","burghezesc":"burghezi","burghezeste":"burghezi","burghezesti":"burghezi","burghezi":"burghez","burghezia":"burghezie","burgheziei":"burghezie","burghezii":["burghezii","burghez","burghezii","burghezi","burghezii","burghezie"],"burgheziile":"burghezie","burgheziilor":"burghezie","burghezilor":"burghez","burghezim":"burghezi","burghezimi":"burghezime","burghezimii":"burghezime","burghezimile":"burghezime","burghezimilor":"burghezime","burghezind":"burghezi","burghezira":"burghezi","burgheziram":"burghezi","burghezirati":"burghezi","burghezise":"burghezi","burghezisem":"burghezi","burghezisera":"burghezi","burgheziseram":"burghezi","burgheziserati":"burghezi","burghezisesi":"burghezi","burghezisi":"burghezi","burghezit":"burghezi","burgheziti":"burghezi","burghezul":"burghez","burghezule":"burghez","burghezului":"burghez","burghiasi":"burghiaș","burghiasii":"burghiaș","burghiasilor":"burghiaș","burghiasul":"burghiaș","burghiasule":"burghiaș","burghiasului":"burghiaș","burghie":"burghiu","burghie de foraj":"burghiu de foraj","burghiele":"burghiu","burghielor":"burghiu","burghierea":"burghiere","burghierei":"burghiere","burghiesi":"burghieș","burghiesii":"burghieș","burghiesilor":"burghieș","burghiesul":"burghieș","burghiesule":"burghieș","burghiesului":"burghieș","burghiul":"burghiu","burghiule":"burghiu","burghiului":"burghiu","burghiute":"burghiuț","burghiutele":"burghiuț","burghiutelor":"burghiuț","burghiutul":"burghiuț","burghiutule":"burghiuț","burghiutului":"burghiuț","burgmaistri":"burgmaistru","burgmaistrii":"burgmaistru","burgmaistrilor":"burgmaistru","burgmaistrul":"burgmaistru","burgmaistrule":"burgmaistru","burgmaistrului":"burgmaistru","burgravi":"burgrav","burgraviate":"burgraviat","burgraviatele":"burgraviat","burgraviatelor":"burgraviat","burgraviatul":"burgraviat","burgraviatule":"burgraviat","burgraviatului":"burgraviat","burgravii":"burgrav","burgravilor":"burgrav","burgravul":"burgrav","burgravule":"burgrav","burgravului":"burgrav","burgul":"burg","burgule":"burg","burgului":"burg","burgunda":["burgundă","burgund","burgunda","burgund"],"burgunde":["burgunde","burgund","burgunde","burgundă"],"burgundei":"burgundă","burgundele":["burgundele","burgund","burgundele","burgundă"],"burgundelor":"burgundă","burgundul":"burgund","burgunzi":"burgund","burgunzii":"burgund","burguri":"burg","burgurile":"burg","burgurilor":"burg","buricase":"buricaș","buricasele":"buricaș","buricaselor":"buricaș","buricasul":"buricaș","buricasule":"buricaș","buricasului":"buricaș","burice":"buric","buricele":["buricele","buric","buricele","buricel"],"buricelele":"buricel","buricelelor":"buricel","buricelor":"buric","buricelul":"buricel","buricelule":"buricel","buricelului":"buricel","buricice":"buricică","buricicei":"buricică","buricul":"buric","buricule":"buric","buricului":"buric","burie":"buriu","buriele":"buriu","burielor":"buriu","buriuul":"buriu","buriuule":"buriu","buriuului":"buriu","burjuii":"burjui","burjuilor":"burjui","burjuiul":"burjui","burjuiule":"burjui","burjuiului":"burjui","burlacaritul":"burlăcărit","burlacaritule":"burlăcărit","burlacaritului":"burlăcărit","burlacea":"burlăci","burlaceai":"burlăci","burlaceam":"burlăci","burlaceasca":["burlăcească","burlăcesc","burlăceasca","burlăcesc"],"burlaceati":"burlăci","burlaceau":"burlăci","burlacesc":"burlăci","burlacescul":"burlăcesc","burlaceste":"burlăci","burlacesti":["burlăcești","burlăcesc","burlăcești","burlăci"],"burlacestii":"burlăcesc","burlacestile":"burlăcesc","burlaci":"burlac","burlacia":"burlăcie","burlaciei":"burlăcie","burlacii":["burlacii","burlac","burlăcii","burlăci","burlăcii","burlăcie"],"burlacilor":"burlac","burlacim":"burlăci","burlacind":"burlăci","burlacira":"burlăci","burlaciram":"burlăci","burlacirati":"burlăci","burlacise":"burlăci","burlacisem":"burlăci","burlacisera":"burlăci","burlaciseram":"burlăci","burlaciserati":"burlăci","burlacisesi":"burlăci","burlacisi":"burlăci","burlacit":"burlăci","burlaciti":"burlăci","burlacul":"burlac","burlacule":"burlac","burlacului":"burlac","burlane":"burlan","burlanele":"burlan","burlanelor":"burlan","burlanul":"burlan","burlanule":"burlan","burlanului":"burlan","burles":"burlesc","burlesti":"burlesc","burlestii":"burlesc","burlestile":"burlesc","burlestilor":"burlesc","burlincasi":"burlincaș","burlincasii":"burlincaș","burlincasilor":"burlincaș","burlincasul":"burlincaș","burlincasule":"burlincaș","burlincasului":"burlincaș","burlincuti":"burlincuț","burlincutii":"burlincuț","burlincutilor":"burlincuț","burlincutul":"burlincuț","burlincutule":"burlincuț","burlincutului":"burlincuț","burme":"burmă","burmei":"burmă","burmele":"burmă","burmelor":"burmă","burnit":"burnița","burnitai":"burnița","burnitam":["burnițăm","burnița","burnițam","burnița"],"burnitand":"burnița","burnitara":"burnița","burnitaram":"burnița","burnitarati":"burnița","burnitase":"burnița","burnitasem":"burnița","burnitasera":"burnița","burnitaseram":"burnița","burnitaserati":"burnița","burnitasesi":"burnița","burnitasi":"burnița","burnitat":"burnița","burnitati":"burnița","burnitau":"burnița","burnite":"burniță","burniteaza":"burnița","burnitei":"burniță","burnitele":"burniță","burniteli":"burnițeală","burnitelii":"burnițeală","burnitelile":"burnițeală","burnitelilor":"burnițeală","burnitelor":"burniță","burniti":"burnița","burnitoasa":["burnițoasă","burnițos","burnițoasa","burnițos"],"burnitoase":"burnițos","burnitoasele":"burnițos","burnitosi":"burnițos","burnitosii":"burnițos","burnitosul":"burnițos","burnujele":"burnujel","burnujelele":"burnujel","burnujelelor":"burnujel","burnujelul":"burnujel","burnujelule":"burnujel","burnujelului":"burnujel","burnuze":"burnuz","burnuzele":"burnuz","burnuzelor":"burnuz","burnuzul":"burnuz","burnuzule":"burnuz","burnuzului":"burnuz","buroaice":"buroaică","buroaicei":"buroaică","buroaicele":"buroaică","buroaicelor":"buroaică","burse":"bursă","burse de valori":"bursă de valori","bursei":"bursă","bursele":"bursă","burselor":"bursă","bursiere":"bursieră","bursierei":"bursieră","bursierele":"bursieră","bursierelor":"bursieră","bursieri":"bursier","bursierii":"bursier","bursierilor":"bursier","bursierul":"bursier","bursierule":"bursier","bursierului":"bursier","bursuc":"bursuca","bursucai":"bursuca","bursucam":["bursucăm","bursuca","bursucam","bursuca"],"bursucand":"bursuca","bursucara":"bursuca","bursucaram":"bursuca","bursucarati":"bursuca","bursucase":"bursuca","bursucasem":"bursuca","bursucasera":"bursuca","bursucaseram":"bursuca","bursucaserati":"bursuca","bursucasesi":"bursuca","bursucasi":"bursuca","bursucat":"bursuca","bursucati":"bursuca","bursucau":"bursuca","bursuce":"bursucă","bursucei":["bursucei","bursucă","bursucei","bursucel"],"bursuceii":"bursucel","bursuceilor":"bursucel","bursucele":"bursucă","bursucelor":"bursucă","bursucelul":"bursucel","bursucelule":"bursucel","bursucelului":"bursucel","bursuci":["bursuci","bursuc","bursuci","bursuca"],"bursucii":"bursuc","bursucilor":"bursuc","bursucul":"bursuc","bursucule":"bursuc","bursucului":"bursuc","bursuflure":"bursuflură","bursuflurei":"bursuflură","bursuflurele":"bursuflură","bursuflurelor":"bursuflură","burta-verdei":"burtă-verde","burta-verdelor":"burtă-verde","burta-verdeul":"burtă-verde","burta-verdeule":"burtă-verde","burta-verdeului":"burtă-verde","burtaverzimea":"burtăverzime","burtaverzimi":"burtăverzime","burtaverzimii":"burtăverzime","burteaul":"burtea","burteaule":"burtea","burteaului":"burtea","burti":"burtă","burtice":"burtică","burticei":"burtică","burticele":["burticele","burtică","burticele","burticică"],"burticelor":"burtică","burtici":"burtică","burticice":"burticică","burticicei":"burticică","burticicele":"burticică","burticicelor":"burticică","burticoasa":["burticoasă","burticos","burticoasa","burticos"],"burticoase":"burticos","burticoasele":"burticos","burticosi":"burticos","burticosii":"burticos","burticosul":"burticos","burtiere":"burtieră","burtierei":"burtieră","burtierele":"burtieră","burtierelor":"burtieră","burtii":"burtă","burtile":"burtă","burtilor":"burtă","burtoasa":["burtoasă","burtos","burtoasa","burtos"],"burtoase":"burtos","burtoasele":"burtos","burtosi":"burtos","burtosii":"burtos","burtosul":"burtos","burtucanoasa":["burtucănoasă","burtucănos","burtucănoasa","burtucănos"],"burtucanoase":"burtucănos","burtucanoasele":"burtucănos","burtucanosi":"burtucănos","burtucanosii":"burtucănos","burtucanosul":"burtucănos","burtuci":"burtucă","burtucii":"burtucă","burtucile":"burtucă","burtucilor":"burtucă","buruge":"burugă","burugei":"burugă","buruianul":"buruian","buruianule":"buruian","buruianului":"buruian","buruieni":["buruieni","buruian","buruieni","buruiană"],"buruienii":"buruiană","buruienile":["buruienile","buruian","buruienile","buruiană"],"buruienilor":["buruienilor","buruian","buruienilor","buruiană"],"buruienisul":"buruieniș","buruienisule":"buruieniș","buruienisului":"buruieniș","buruienisuri":"buruieniș","buruienisurile":"buruieniș","buruienisurilor":"buruieniș","buruienite":"buruieniță","buruienitei":"buruieniță","buruienitele":"buruieniță","buruienitelor":"buruieniță","buruienoasa":["buruienoasă","buruienos","buruienoasa","buruienos"],"buruienoase":"buruienos","buruienoasele":"buruienos","buruienosi":"buruienos","buruienosii":"buruienos","buruienosul":"buruienos","buruienute":"buruienuță","buruienutei":"buruienuță","buruienutele":"buruienuță","buruienutelor":"buruienuță","burundeza":["burundeză","burundez","burundeza","burundez"],"burundeze":["burundeze","burundez","burundeze","burundeză"],"burundezei":"burundeză","burundezele":["burundezele","burundez","burundezele","burundeză"],"burundezelor":"burundeză","burundezi":"burundez","burundezii":"burundez","burundezilor":"burundez","burundezul":"burundez","burundezule":"burundez","burundezului":"burundez","burungiucul":"burungiuc","burungiucule":"burungiuc","burungiucului":"burungiuc","burungiucuri":"burungiuc","burungiucurile":"burungiuc","burungiucurilor":"burungiuc","burziluitoare":"burziluitor","burziluitoarea":"burziluitor","burziluitoarele":"burziluitor","burziluitori":"burziluitor","burziluitorii":"burziluitor","burziluitorul":"burziluitor","burzuluia":"burzului","burzuluiai":"burzului","burzuluiam":"burzului","burzuluiati":"burzului","burzuluiau":"burzului","burzuluieli":"burzuluială","burzuluielii":"burzuluială","burzuluielile":"burzuluială","burzuluielilor":"burzuluială","burzuluiesc":"burzului","burzuluieste":"burzului","burzuluiesti":"burzului","burzuluii":"burzului","burzuluim":"burzului","burzuluind":"burzului","burzuluira":"burzului","burzuluiram":"burzului","burzuluirati":"burzului","burzuluirea":"burzuluire","burzuluiri":"burzuluire","burzuluirii":"burzuluire","burzuluirile":"burzuluire","burzuluirilor":"burzuluire","burzuluise":"burzului","burzuluisem":"burzului","burzuluisera":"burzului","burzuluiseram":"burzului","burzuluiserati":"burzului","burzuluisesi":"burzului","burzuluisi":"burzului","burzuluit":"burzului","burzuluita":["burzuluită","burzuluit","burzuluita","burzuluit"],"burzuluite":"burzuluit","burzuluitele":"burzuluit","burzuluiti":["burzuluiți","burzului","burzuluiți","burzuluit"],"burzuluitii":"burzuluit","burzuluitul":"burzuluit","busculade":"busculadă","busculadei":"busculadă","busculadele":"busculadă","busculadelor":"busculadă","busculai":"buscula","busculam":["busculăm","buscula","busculam","buscula"],"busculand":"buscula","busculara":"buscula","buscularam":"buscula","buscularati":"buscula","busculase":"buscula","busculasem":"buscula","busculasera":"buscula","busculaseram":"buscula","busculaserati":"buscula","busculasesi":"buscula","busculasi":"buscula","busculat":"buscula","busculati":"buscula","busculau":"buscula","busculeaza":"buscula","busculez":"buscula","busculezi":"buscula","busea":"buși","buseai":"buși","buseam":"buși","buseati":"buși","buseau":"buși","busei":"bușel","buseii":"bușel","buseilor":"bușel","busele":"bușeală","buselei":"bușeală","buselele":"bușeală","buselelor":"bușeală","buseli":"bușeală","buselul":"bușel","buselule":"bușel","buselului":"bușel","busesc":"buși","buseste":"buși","busesti":"buși","buseuri":"bușeu","buseurile":"bușeu","buseurilor":"bușeu","buseuul":"bușeu","buseuule":"bușeu","buseuului":"bușeu","busheli":"bushel","bushelii":"bushel","bushelilor":"bushel","bushelul":"bushel","bushelule":"bushel","bushelului":"bushel","busia":"bușie","busiei":"bușie","busii":["bușii","buși","bușii","bușie"],"busim":"buși","busind":"buși","businessmanul":"businessman","businessmanule":"businessman","businessmanului":"businessman","businessmeni":"businessman","businessmenii":"businessman","businessmenilor":"businessman","businessul":"business","businessule":"business","businessului":"business","businessuri":"business","businessurile":"business","businessurilor":"business","busira":"buși","busiram":"buși","busirati":"buși","busise":"buși","busisem":"buși","busisera":"buși","busiseram":"buși","busiserati":"buși","busisesi":"buși","busisi":"buși","busit":"buși","busiti":"buși","busituri":"bușitură","busiturii":"bușitură","busiturile":"bușitură","busiturilor":"bușitură","busmachii":"bușmachiu","busmachiii":"bușmachiu","busmachiilor":"bușmachiu","busmachiul":"bușmachiu","busmachiule":"bușmachiu","busmachiului":"bușmachiu","busoane":"bușon","busoanele":"bușon","busoanelor":"bușon","busole":"busolă","busole magnetice":"busolă magnetică","busolei":"busolă","busolele":"busolă","busolelor":"busolă","busonul":"bușon","busonule":"bușon","busonului":"bușon","buste":"bușcă","busteanul":"buștean","busteanule":"buștean","busteanului":"buștean","bustei":"bușcă","bustele":"bușcă","bustelor":"bușcă","busteni":"buștean","bustenii":"buștean","bustenilor":"buștean","bustenita":["buștenită","buștenit","buștenita","buștenit"],"bustenite":"buștenit","bustenitele":"buștenit","busteniti":"buștenit","bustenitii":"buștenit","bustenitul":"buștenit","bustieri":"bustier","bustierii":"bustier","bustierilor":"bustier","bustierul":"bustier","bustierule":"bustier","bustierului":"bustier","bustihan":"buștean","bustihani":"buștihan","bustihanii":"buștihan","bustihanilor":"buștihan","bustihanul":"buștihan","bustihanule":"buștihan","bustihanului":"buștihan","bustine":"buștină","bustinei":"buștină","bustinele":"buștină","bustinelor":"buștină","bustrofedonul":"bustrofedon","bustrofedonule":"bustrofedon","bustrofedonului":"bustrofedon","bustul":"bust","bustule":"bust","bustului":"bust","busturi":"bust","busturile":"bust","busturilor":"bust","bustusagul":"bustușag","bustusagule":"bustușag","bustusagului":"bustușag","busuioace":"busuioacă","busuioacei":"busuioacă","busuioacele":"busuioacă","busuioacelor":"busuioacă","busuioceasca":["busuiocească","busuiocesc","busuioceasca","busuiocesc"],"busuiocescul":"busuiocesc","busuiocesti":"busuiocesc","busuiocestii":"busuiocesc","busuiocestile":"busuiocesc","busuiocul":"busuioc","busuiocule":"busuioc","busuiocului":"busuioc","busumflai":"busumfla","busumflam":["busumflăm","busumfla","busumflam","busumfla"],"busumfland":"busumfla","busumflara":"busumfla","busumflaram":"busumfla","busumflarati":"busumfla","busumflase":"busumfla","busumflasem":"busumfla","busumflasera":"busumfla","busumflaseram":"busumfla","busumflaserati":"busumfla","busumflasesi":"busumfla","busumflasi":"busumfla","busumflat":"busumfla","busumflati":"busumfla","busumflau":"busumfla","busumfli":"busumfla","busumflu":"busumfla","busurmani":"busurman","busurmanii":"busurman","busurmanilor":"busurman","busurmanul":"busurman","busurmanule":"busurman","busurmanului":"busurman","butade":"butadă","butadei":"butadă","butadele":"butadă","butadelor":"butadă","butadiene":"butadienă","butadienei":"butadienă","butadienele":"butadienă","butadienelor":"butadienă","butaforia":"butaforie","butaforica":["butaforică","butaforic","butaforica","butaforic"],"butaforice":"butaforic","butaforicele":"butaforic","butaforici":"butaforic","butaforicii":"butaforic","butaforicul":"butaforic","butaforiei":"butaforie","butaforii":"butaforie","butani":"butan","butanii":"butan","butanilor":"butan","butanoli":"butanol","butanolii":"butanol","butanolilor":"butanol","butanolul":"butanol","butanolule":"butanol","butanolului":"butanol","butanone":"butanonă","butanonei":"butanonă","butanonele":"butanonă","butanonelor":"butanonă","butanul":"butan","butanule":"butan","butanului":"butan","butarge":"butargă","butargei":"butargă","butari":"butar","butarii":"butar","butarilor":"butar","butarul":"butar","butarule":"butar","butarului":"butar","butasele":"butășeală","butaselei":"butășeală","butaselele":"butășeală","butaselelor":"butășeală","butaseli":"butășeală","butasi":"butaș","butasii":"butaș","butasilor":"butaș","butasirea":"butășire","butasiri":"butășire","butasirii":"butășire","butasirile":"butășire","butasirilor":"butășire","butasita":["butășită","butășit","butășita","butășit"],"butasite":"butășit","butasitele":"butășit","butasiti":"butășit","butasitii":"butășit","butasitul":"butășit","butasul":"butaș","butasule":"butaș","butasului":"butaș","butcaria":"butcărie","butcariei":"butcărie","butcarii":"butcărie","butcariile":"butcărie","butcariilor":"butcărie","butcarite":"butcariță","butcaritei":"butcariță","butcaritele":"butcariță","butcaritelor":"butcariță","butci":"butcă","butcii":"butcă","butcile":"butcă","butcilor":"butcă","butcosul":"butcos","butcosule":"butcos","butcosului":"butcos","butculite":"butculiță","butculitei":"butculiță","butculitele":"butculiță","butculitelor":"butculiță","butea":"bute","butelci":"butelcă","butelcii":"butelcă","butelcile":"butelcă","butelcilor":"butelcă","butelcute":"butelcuță","butelcutei":"butelcuță","butelcutele":"butelcuță","butelcutelor":"butelcuță","butelia":"butelie","buteliei":"butelie","butelii":"butelie","butelii de leyda":"butelie de Leyda","buteliile":"butelie","buteliilor":"butelie","butene":"butenă","butenei":"butenă","butenele":"butenă","butenelor":"butenă","buti":"bute","butia":"butie","buticele":"buticică","buticelei":"buticică","buticelele":"buticică","buticelelor":"buticică","butici":"butică","buticii":"butică","buticile":"butică","buticilor":"butică","buticul":"butic","buticule":"butic","buticului":"butic","buticuri":"butic","buticurile":"butic","buticurilor":"butic","butiei":"butie","butii":["buții","bute","butii","butie"],"butiile":"butie","butiilor":"butie","butile":"bute","butilene":"butilenă","butilenei":"butilenă","butilenele":"butilenă","butilenelor":"butilenă","butilica":["butilică","butilic","butilica","butilic"],"butilice":"butilic","butilicele":"butilic","butilici":"butilic","butilicii":"butilic","butilicul":"butilic","butilor":"bute","butirati":"butirat","butiratii":"butirat","butiratilor":"butirat","butiratul":"butirat","butiratule":"butirat","butiratului":"butirat","butirica":["butirică","butiric","butirica","butiric"],"butirice":"butiric","butiricele":"butiric","butirici":"butiric","butiricii":"butiric","butiricul":"butiric","butirine":"butirină","butirinei":"butirină","butirinele":"butirină","butirinelor":"butirină","butirometre":"butirometru","butirometrele":"butirometru","butirometrelor":"butirometru","butirometrul":"butirometru","butirometrule":"butirometru","butirometrului":"butirometru","butlanase":"butlănaș","butlanasele":"butlănaș","butlanaselor":"butlănaș","butlanasul":"butlănaș","butlanasule":"butlănaș","butlanasului":"butlănaș","butlane":"butlan","butlanele":"butlan","butlanelor":"butlan","butlanul":"butlan","butlanule":"butlan","butlanului":"butlan","butnar":"butnări","butnare":"butnări","butnarea":"butnări","butnareai":"butnări","butnaream":"butnări","butnareasca":["butnărească","butnăresc","butnăreasca","butnăresc"],"butnareati":"butnări","butnareau":"butnări","butnarescul":"butnăresc","butnaresti":"butnăresc","butnarestii":"butnăresc","butnarestile":"butnăresc","butnari":"butnar","butnaria":"butnărie","butnarie":"butnări","butnariei":"butnărie","butnarii":["butnarii","butnar","butnării","butnări","butnării","butnărie"],"butnariile":"butnărie","butnariilor":"butnărie","butnarilor":"butnar","butnarim":"butnări","butnarind":"butnări","butnarira":"butnări","butnariram":"butnări","butnarirati":"butnări","butnarirea":"butnărire","butnariri":"butnărire","butnaririi":"butnărire","butnaririle":"butnărire","butnaririlor":"butnărire","butnarise":"butnări","butnarisem":"butnări","butnarisera":"butnări","butnariseram":"butnări","butnariserati":"butnări","butnarisesi":"butnări","butnarisi":"butnări","butnarit":"butnări","butnarita":["butnărită","butnărit","butnărita","butnărit"],"butnarite":"butnărit","butnaritele":"butnărit","butnariti":["butnăriți","butnări","butnăriți","butnărit"],"butnaritii":"butnărit","butnaritul":"butnărit","butnarul":"butnar","butnarule":"butnar","butnarului":"butnar","butoaia":"butoaie","butoaice":"butoaică","butoaicei":"butoaică","butoaicele":"butoaică","butoaicelor":"butoaică","butoaie":"butoi","butoaiei":"butoaie","butoaiele":"butoi","butoaielor":"butoi","butoaii":"butoaie","butoane":["butoane","butoană","butoane","buton"],"butoanei":"butoană","butoanele":["butoanele","butoană","butoanele","buton"],"butoanelor":["butoanelor","butoană","butoanelor","buton"],"butoiase":"butoiaș","butoiasele":"butoiaș","butoiaselor":"butoiaș","butoiasul":"butoiaș","butoiasule":"butoiaș","butoiasului":"butoiaș","butoiul":"butoi","butoiule":"butoi","butoiului":"butoi","butonai":"butona","butonam":["butonăm","butona","butonam","butona"],"butonand":"butona","butonara":"butona","butonaram":"butona","butonarati":"butona","butonarea":"butonare","butonari":"butonare","butonarii":"butonare","butonarile":"butonare","butonarilor":"butonare","butonase":"butona","butonasem":"butona","butonasera":"butona","butonaseram":"butona","butonaserati":"butona","butonasesi":"butona","butonasi":"butona","butonat":"butona","butonati":"butona","butonau":"butona","butoneaza":"butona","butonez":"butona","butonezi":"butona","butoniere":"butonieră","butonierei":"butonieră","butonierele":"butonieră","butonierelor":"butonieră","butonul":"buton","butonule":"buton","butonului":"buton","butucanoasa":["butucănoasă","butucănos","butucănoasa","butucănos"],"butucanoase":"butucănos","butucanoasele":"butucănos","butucanosi":"butucănos","butucanosii":"butucănos","butucanosul":"butucănos","butucari":"butucar","butucarii":"butucar","butucarilor":"butucar","butucarul":"butucar","butucarule":"butucar","butucarului":"butucar","butucasi":"butucaș","butucasii":"butucaș","butucasilor":"butucaș","butucasul":"butucaș","butucasule":"butucaș","butucasului":"butucaș","butucei":"butucel","butuceli":"butucel","butucelii":"butucel","butucelilor":"butucel","butucelul":"butucel","butucelule":"butucel","butucelului":"butucel","butuci":"butuc","butucii":"butuc","butucilor":"butuc","butucoasa":["butucoasă","butucos","butucoasa","butucos"],"butucoase":"butucos","butucoasele":"butucos","butucosi":"butucos","butucosii":"butucos","butucosul":"butucos","butucul":"butuc","butucule":"butuc","butucului":"butuc","butuiasi":"buțuiaș","butuiasii":"buțuiaș","butuiasilor":"buțuiaș","butuiasul":"buțuiaș","butuiasule":"buțuiaș","butuiasului":"buțuiaș","butul":"but","butule":"but","butului":"but","buturaul":"butură","buturaule":"butură","buturaului":"butură","buturele":"buturel","buturelele":"buturel","buturelelor":"buturel","buturelul":"buturel","buturelule":"buturel","buturelului":"buturel","butureul":"buture","butureule":"buture","butureului":"buture","buturi":["buturi","but","buturi","butur","buturi","butură","buturi","buture"],"buturii":["buturii","butur","buturii","butură","buturii","buture"],"buturile":"but","buturilor":["buturilor","but","buturilor","butur","buturilor","butură","buturilor","buture"],"buturoasa":["buturoasă","buturos","buturoasa","buturos"],"buturoase":"buturos","buturoasele":"buturos","buturosi":"buturos","buturosii":"buturos","buturosul":"buturos","buturugi":"buturugă","buturugute":"buturuguță","buturugutei":"buturuguță","buturugutele":"buturuguță","buturugutelor":"buturuguță","buturul":"butur","buturule":"butur","buturului":"butur","buvabila":["buvabilă","buvabil","buvabila","buvabil"],"buvabile":"buvabil","buvabilele":"buvabil","buvabili":"buvabil","buvabilii":"buvabil","buvabilul":"buvabil","buvete":"buvetă","buvetei":"buvetă","buvetele":"buvetă","buvetelor":"buvetă","buzaine":"buzaină","buzainei":"buzaină","buzainele":"buzaină","buzainelor":"buzaină","buzaretul":"buzăreț","buzaretule":"buzăreț","buzaretului":"buzăreț","buzata":["buzată","buzat","buzata","buzat"],"buzate":"buzat","buzatela":["buzățelă","buzățel","buzățela","buzățel"],"buzatele":["buzatele","buzat","buzățele","buzățel"],"buzatelele":"buzățel","buzateli":"buzățel","buzatelii":"buzățel","buzatelul":"buzățel","buzati":"buzat","buzatice":"buzățică","buzaticele":"buzățică","buzatii":"buzat","buzatul":"buzat","buzaul":"Buzău","buzaule":"Buzău","buzaului":"Buzău","buzduganase":"buzdugănaș","buzduganasele":"buzdugănaș","buzduganaselor":"buzdugănaș","buzduganasul":"buzdugănaș","buzduganasule":"buzdugănaș","buzduganasului":"buzdugănaș","buzdugane":"buzdugan","buzduganea":"buzdugăni","buzduganeai":"buzdugăni","buzduganeam":"buzdugăni","buzduganeati":"buzdugăni","buzduganeau":"buzdugăni","buzduganele":"buzdugan","buzduganelor":"buzdugan","buzduganesc":"buzdugăni","buzduganeste":"buzdugăni","buzduganesti":"buzdugăni","buzduganii":"buzdugăni","buzduganim":"buzdugăni","buzduganind":"buzdugăni","buzduganira":"buzdugăni","buzduganiram":"buzdugăni","buzduganirati":"buzdugăni","buzduganise":"buzdugăni","buzduganisem":"buzdugăni","buzduganisera":"buzdugăni","buzduganiseram":"buzdugăni","buzduganiserati":"buzdugăni","buzduganisesi":"buzdugăni","buzduganisi":"buzdugăni","buzduganit":"buzdugăni","buzduganiti":"buzdugăni","buzduganul":"buzdugan","buzduganule":"buzdugan","buzduganului":"buzdugan","buzdugene":"buzdugeană","buzdugenei":"buzdugeană","buzdugenele":"buzdugeană","buzdugenelor":"buzdugeană","buze":"buză","buzei":"buză","buzele":"buză","buzelor":"buză","buzisoare":"buzișoară","buzisoarei":"buzișoară","buzisoarele":"buzișoară","buzisoarelor":"buzișoară","buzisori":"buzișor","buzisorii":"buzișor","buzisorilor":"buzișor","buzisorul":"buzișor","buzisorule":"buzișor","buzisorului":"buzișor","buzoaie":"buzoi","buzoaiele":"buzoi","buzoaielor":"buzoi","buzoaieul":"buzoaie","buzoaieule":"buzoaie","buzoaieului":"buzoaie","buzoasa":["buzoasă","buzos","buzoasa","buzos"],"buzoase":"buzos","buzoasele":"buzos","buzoi":"buzoia","buzoiai":"buzoia","buzoiam":"buzoia","buzoianul":"buzoian","buzoianule":"buzoian","buzoianului":"buzoian","buzoiara":"buzoia","buzoiaram":"buzoia","buzoiarati":"buzoia","buzoiase":"buzoia","buzoiasem":"buzoia","buzoiasera":"buzoia","buzoiaseram":"buzoia","buzoiaserati":"buzoia","buzoiasesi":"buzoia","buzoiasi":"buzoia","buzoiat":"buzoia","buzoiata":["buzoiată","buzoiat","buzoiata","buzoiat"],"buzoiate":"buzoiat","buzoiatele":"buzoiat","buzoiati":["buzoiați","buzoia","buzoiați","buzoiat"],"buzoiatii":"buzoiat","buzoiatul":"buzoiat","buzoiau":"buzoia","buzoie":"buzoia","buzoiem":"buzoia","buzoience":"buzoiancă","buzoiencei":"buzoiancă","buzoiencele":"buzoiancă","buzoiencelor":"buzoiancă","buzoiene":"buzoiană","buzoieneasca":["buzoienească","buzoienesc","buzoieneasca","buzoienesc"],"buzoienei":"buzoiană","buzoienele":"buzoiană","buzoienelor":"buzoiană","buzoienescul":"buzoienesc","buzoienesti":"buzoienesc","buzoienestii":"buzoienesc","buzoienestile":"buzoienesc","buzoieni":"buzoian","buzoienii":"buzoian","buzoienilor":"buzoian","buzoiesc":"buzoia","buzoind":"buzoia","buzoiul":"buzoi","buzoiule":"buzoi","buzoiului":"buzoi","buzosi":"buzos","buzosii":"buzos","buzosul":"buzos","buzulite":"buzuliță","buzulitei":"buzuliță","buzulitele":"buzuliță","buzulitelor":"buzuliță","buzunarase":"buzunăraș","buzunarasele":"buzunăraș","buzunaraselor":"buzunăraș","buzunarasul":"buzunăraș","buzunarasule":"buzunăraș","buzunarasului":"buzunăraș","buzunare":"buzunar","buzunarea":"buzunări","buzunareai":"buzunări","buzunaream":"buzunări","buzunareati":"buzunări","buzunareau":"buzunări","buzunarele":["buzunarele","buzunar","buzunărele","buzunăreală","buzunărele","buzunărel"],"buzunarelei":"buzunăreală","buzunarelele":["buzunărelele","buzunăreală","buzunărelele","buzunărel"],"buzunarelelor":["buzunărelelor","buzunăreală","buzunărelelor","buzunărel"],"buzunareli":"buzunăreală","buzunarelor":"buzunar","buzunarelul":"buzunărel","buzunarelule":"buzunărel","buzunarelului":"buzunărel","buzunaresc":"buzunări","buzunareste":"buzunări","buzunaresti":"buzunări","buzunarii":"buzunări","buzunarim":"buzunări","buzunarind":"buzunări","buzunarira":"buzunări","buzunariram":"buzunări","buzunarirati":"buzunări","buzunarirea":"buzunărire","buzunariri":"buzunărire","buzunaririi":"buzunărire","buzunaririle":"buzunărire","buzunaririlor":"buzunărire","buzunarise":"buzunări","buzunarisem":"buzunări","buzunarisera":"buzunări","buzunariseram":"buzunări","buzunariserati":"buzunări","buzunarisesi":"buzunări","buzunarisi":"buzunări","buzunarit":"buzunări","buzunarita":["buzunărită","buzunărit","buzunărita","buzunărit"],"buzunarite":"buzunărit","buzunaritele":"buzunărit","buzunariti":["buzunăriți","buzunări","buzunăriți","buzunărit"],"buzunaritii":"buzunărit","buzunaritul":"buzunărit","buzunarul":"buzunar","buzunarule":"buzunar","buzunarului":"buzunar","bypassul":"bypass","bypassule":"bypass","bypassului":"bypass","bypassuri":"bypass","bypassurile":"bypass","bypassurilor":"bypass","byroniana":["byroniană","byronian","byroniana","byronian"],"byronianul":"byronian","byroniene":"byronian","byronienele":"byronian","byronieni":"byronian","byronienii":"byronian","byteul":"byte","byteule":"byte","byteului":"byte","byti":"byte","bytii":"byte","bytilor":"byte"};
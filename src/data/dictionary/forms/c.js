@@ -0,0 +1 @@
+export default {"calbeaza":"gălbează","chilogram":"kilogram","chilometru":"kilometru","cristos":"Hristos"};
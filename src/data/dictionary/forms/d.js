@@ -0,0 +1 @@
+export default {"dana":"zână","dat in bara":"o da în bară","dau":"zău","dece":"zece","decimal":"zecimal","deita":"zeiță","deu":"zeu","di":"zi","dzarna":"zârnă"};
@@ -0,0 +1 @@
+export default {"e":["e","brizanță","e","buluceală","e","echistică","e","ecrazită","e","electronopunctură","e","elinică","e","feculență","e","fi","e","hămeseală","e","hipoazotidă","e","lânărică","e","levizită","e","litispendență","e","lombosciatică","e","naftă","e","nebeligeranță","e","olandă","e","râcă","e","răcușcă","e","rușală","e","tifoză","e","toreutică","e","ușcheală","e","zacherlină","e","zavescă"],"e-mailul":"e-mail","e-mailule":"e-mail","e-mailului":"e-mail","e-mailuri":"e-mail","e-mailurile":"e-mail","e-mailurilor":"e-mail","e-ul":"e","e-ule":"e","e-ului":"e","e-uri":"e","e-urile":"e","e-urilor":"e","ebdomadari":"ebdomadar","ebenina":["ebenină","ebenin","ebenina","ebenin"],"ebenine":"ebenin","ebeninele":"ebenin","ebenini":"ebenin","ebeninii":"ebenin","ebeninul":"ebenin","ebeniste":"ebenistă","ebenistei":"ebenistă","ebenistele":"ebenistă","ebenistelor":"ebenistă","ebenisteria":"ebenisterie","ebenisteriei":"ebenisterie","ebenisterii":"ebenisterie","ebenisti":"ebenist","ebenistice":"ebenistică","ebenisticei":"ebenistică","ebenistii":"ebenist","ebenistilor":"ebenist","ebenistul":"ebenist","ebenistule":"ebenist","ebenistului":"ebenist","ebenul":"eben","ebenule":"eben","ebenului":"eben","eberluizanta":["eberluizantă","eberluizant","eberluizanta","eberluizant"],"eberluizante":"eberluizant","eberluizantele":"eberluizant","eberluizanti":"eberluizant","eberluizantii":"eberluizant","eberluizantul":"eberluizant","ebluanta":["ebluantă","ebluant","ebluanta","ebluant"],"ebluante":"ebluant","ebluantele":"ebluant","ebluanti":"ebluant","ebluantii":"ebluant","ebluantul":"ebluant","ebluisanta":["ebluisantă","ebluisant","ebluisanta","ebluisant"],"ebluisante":"ebluisant","ebluisantele":"ebluisant","ebluisanti":"ebluisant","ebluisantii":"ebluisant","ebluisantul":"ebluisant","ebonite":["ebonite","ebonit","ebonite","ebonită"],"ebonitei":"ebonită","ebonitele":["ebonitele","ebonit","ebonitele","ebonită"],"ebonitelor":["ebonitelor","ebonit","ebonitelor","ebonită"],"ebonitul":"ebonit","ebonitule":"ebonit","ebonitului":"ebonit","ebraica":["ebraică","ebraic","ebraica","ebraic"],"ebraice":["ebraice","ebraic","ebraice","ebraică"],"ebraicei":"ebraică","ebraicele":"ebraic","ebraici":"ebraic","ebraicii":"ebraic","ebraicul":"ebraic","ebraisme":"ebraism","ebraismele":"ebraism","ebraismelor":"ebraism","ebraismul":"ebraism","ebraismule":"ebraism","ebraismului":"ebraism","ebraiste":"ebraistă","ebraistei":"ebraistă","ebraistele":"ebraistă","ebraistelor":"ebraistă","ebraisti":"ebraist","ebraistice":"ebraistică","ebraisticei":"ebraistică","ebraistii":"ebraist","ebraistilor":"ebraist","ebraistul":"ebraist","ebraistule":"ebraist","ebraistului":"ebraist","ebrastauul":"ebrastău","ebrastauule":"ebrastău","ebrastauului":"ebrastău","ebreu":"evreu","ebrietatea":"ebrietate","ebrietati":"ebrietate","ebrietatii":"ebrietate","ebriozitatea":"ebriozitate","ebriozitati":"ebriozitate","ebriozitatii":"ebriozitate","ebuliometre":"ebuliometru","ebuliometrele":"ebuliometru","ebuliometrelor":"ebuliometru","ebuliometria":"ebuliometrie","ebuliometrica":["ebuliometrică","ebuliometric","ebuliometrica","ebuliometric"],"ebuliometrice":"ebuliometric","ebuliometricele":"ebuliometric","ebuliometrici":"ebuliometric","ebuliometricii":"ebuliometric","ebuliometricul":"ebuliometric","ebuliometriei":"ebuliometrie","ebuliometrii":"ebuliometrie","ebuliometriile":"ebuliometrie","ebuliometriilor":"ebuliometrie","ebuliometrul":"ebuliometru","ebuliometrule":"ebuliometru","ebuliometrului":"ebuliometru","ebulioscoape":"ebulioscop","ebulioscoapele":"ebulioscop","ebulioscoapelor":"ebulioscop","ebulioscopia":"ebulioscopie","ebulioscopica":["ebulioscopică","ebulioscopic","ebulioscopica","ebulioscopic"],"ebulioscopice":"ebulioscopic","ebulioscopicele":"ebulioscopic","ebulioscopici":"ebulioscopic","ebulioscopicii":"ebulioscopic","ebulioscopicul":"ebulioscopic","ebulioscopiei":"ebulioscopie","ebulioscopii":"ebulioscopie","ebulioscopiile":"ebulioscopie","ebulioscopiilor":"ebulioscopie","ebulioscopul":"ebulioscop","ebulioscopule":"ebulioscop","ebulioscopului":"ebulioscop","ebulitia":"ebuliție","ebulitiei":"ebuliție","ebulitii":"ebuliție","ebulitiile":"ebuliție","ebulitiilor":"ebuliție","ebulitiunea":"ebulițiune","ebulitiuni":"ebulițiune","ebulitiunii":"ebulițiune","ebulitiunile":"ebulițiune","ebulitiunilor":"ebulițiune","ebulmente":"ebulment","ebulmentele":"ebulment","ebulmentelor":"ebulment","ebulmentul":"ebulment","ebulmentule":"ebulment","ebulmentului":"ebulment","eburnarea":"eburnare","eburnari":"eburnare","eburnarii":"eburnare","eburnarile":"eburnare","eburnarilor":"eburnare","eburnatia":"eburnație","eburnatiei":"eburnație","eburnatii":"eburnație","eburnatiile":"eburnație","eburnatiilor":"eburnație","eburnee":"eburneu","eburneea":"eburneu","eburneele":"eburneu","eburnei":"eburneu","eburneii":"eburneu","eburneul":"eburneu","ecarisajul":"ecarisaj","ecarisajule":"ecarisaj","ecarisajului":"ecarisaj","ecarisori":"ecarisor","ecarisorii":"ecarisor","ecarisorilor":"ecarisor","ecarisorul":"ecarisor","ecarisorule":"ecarisor","ecarisorului":"ecarisor","ecarlatul":"ecarlat","ecarlatule":"ecarlat","ecarlatului":"ecarlat","ecartamente":"ecartament","ecartamentele":"ecartament","ecartamentelor":"ecartament","ecartamentul":"ecartament","ecartamentule":"ecartament","ecartamentului":"ecartament","ecarteul":"ecarte","ecarteule":"ecarte","ecarteului":"ecarte","ecarteuri":"ecarte","ecarteurile":"ecarte","ecarteurilor":"ecarte","ecartul":"ecart","ecartule":"ecart","ecartului":"ecart","ecarturi":"ecart","ecarturile":"ecart","ecarturilor":"ecart","ecatombe":"ecatombă","ecdiconi":"ecdicon","ecdiconii":"ecdicon","ecdiconilor":"ecdicon","ecdiconul":"ecdicon","ecdiconule":"ecdicon","ecdiconului":"ecdicon","ecfonise":"ecfonis","ecfonisele":"ecfonis","ecfoniselor":"ecfonis","ecfonisul":"ecfonis","ecfonisule":"ecfonis","ecfonisului":"ecfonis","echere":"echer","echerele":"echer","echerelor":"echer","echerul":"echer","echerule":"echer","echerului":"echer","echicurenta":["echicurentă","echicurent","echicurenta","echicurent"],"echicurente":"echicurent","echicurentele":"echicurent","echicurenti":"echicurent","echicurentii":"echicurent","echicurentul":"echicurent","echidiferente":"echidiferență","echidiferentei":"echidiferență","echidiferentele":"echidiferență","echidiferentelor":"echidiferență","echidiferentiala":["echidiferențială","echidiferențial","echidiferențiala","echidiferențial"],"echidiferentiale":"echidiferențial","echidiferentialele":"echidiferențial","echidiferentiali":"echidiferențial","echidiferentialii":"echidiferențial","echidiferentialul":"echidiferențial","echidistanta":["echidistantă","echidistant","echidistanta","echidistant"],"echidistante":["echidistante","echidistant","echidistanțe","echidistanță"],"echidistantei":"echidistanță","echidistantele":["echidistantele","echidistant","echidistanțele","echidistanță"],"echidistantelor":"echidistanță","echidistanti":"echidistant","echidistantii":"echidistant","echidistantul":"echidistant","echidne":"echidnă","echidnei":"echidnă","echidnele":"echidnă","echidnelor":"echidnă","echigranulara":["echigranulară","echigranular","echigranulara","echigranular"],"echigranulare":"echigranular","echigranularele":"echigranular","echigranulari":"echigranular","echigranularii":"echigranular","echigranularul":"echigranular","echilaterala":["echilaterală","echilateral","echilaterala","echilateral"],"echilaterale":"echilateral","echilateralele":"echilateral","echilaterali":"echilateral","echilateralii":"echilateral","echilateralul":"echilateral","echilibrai":"echilibra","echilibraje":"echilibraj","echilibrajele":"echilibraj","echilibrajelor":"echilibraj","echilibrajul":"echilibraj","echilibrajule":"echilibraj","echilibrajului":"echilibraj","echilibrala":["echilibrală","echilibral","echilibrala","echilibral"],"echilibrale":"echilibral","echilibralele":"echilibral","echilibrali":"echilibral","echilibralii":"echilibral","echilibralul":"echilibral","echilibram":["echilibrăm","echilibra","echilibram","echilibra"],"echilibrand":"echilibra","echilibrara":"echilibra","echilibraram":"echilibra","echilibrarati":"echilibra","echilibrarea":"echilibrare","echilibrari":"echilibrare","echilibrarii":"echilibrare","echilibrarile":"echilibrare","echilibrarilor":"echilibrare","echilibrase":"echilibra","echilibrasem":"echilibra","echilibrasera":"echilibra","echilibraseram":"echilibra","echilibraserati":"echilibra","echilibrasesi":"echilibra","echilibrasi":"echilibra","echilibrat":"echilibra","echilibrata":["echilibrată","echilibrat","echilibrata","echilibrat"],"echilibrate":"echilibrat","echilibratele":"echilibrat","echilibrati":["echilibrați","echilibra","echilibrați","echilibrat"],"echilibratii":"echilibrat","echilibratoare":"echilibrator","echilibratoarea":"echilibrator","echilibratoarele":"echilibrator","echilibratori":"echilibrator","echilibratorii":"echilibrator","echilibratorul":"echilibrator","echilibratul":"echilibrat","echilibrau":"echilibra","echilibre":"echilibru","echilibreaza":"echilibra","echilibrele":"echilibru","echilibrelor":"echilibru","echilibrez":"echilibra","echilibrezi":"echilibra","echilibriste":"echilibristă","echilibristei":"echilibristă","echilibristele":"echilibristă","echilibristelor":"echilibristă","echilibristi":"echilibrist","echilibristice":"echilibristică","echilibristicei":"echilibristică","echilibristii":"echilibrist","echilibristilor":"echilibrist","echilibristul":"echilibrist","echilibristule":"echilibrist","echilibristului":"echilibrist","echilibroare":"echilibror","echilibroarele":"echilibror","echilibroarelor":"echilibror","echilibrorul":"echilibror","echilibrorule":"echilibror","echilibrorului":"echilibror","echilibrul":"echilibru","echilibrule":"echilibru","echilibrului":"echilibru","echimoleculara":["echimoleculară","echimolecular","echimoleculara","echimolecular"],"echimoleculare":"echimolecular","echimolecularele":"echimolecular","echimoleculari":"echimolecular","echimolecularii":"echimolecular","echimolecularul":"echimolecular","echimoze":"echimoză","echimozei":"echimoză","echimozele":"echimoză","echimozelor":"echimoză","echine":"echină","echinei":"echină","echinele":"echină","echinelor":"echină","echingii":"echingiu","echingiii":"echingiu","echingiilor":"echingiu","echingiuul":"echingiu","echingiuule":"echingiu","echingiuului":"echingiu","echinide":"echinidă","echinidei":"echinidă","echinidele":"echinidă","echinidelor":"echinidă","echinidul":"echinid","echinidule":"echinid","echinidului":"echinid","echinisme":"echinism","echinismele":"echinism","echinismelor":"echinism","echinismul":"echinism","echinismule":"echinism","echinismului":"echinism","echinizi":"echinid","echinizii":"echinid","echinizilor":"echinid","echinocactusi":"echinocactus","echinocactusii":"echinocactus","echinocactusilor":"echinocactus","echinocactusul":"echinocactus","echinocactusule":"echinocactus","echinocactusului":"echinocactus","echinococi":"echinococ","echinococii":"echinococ","echinococilor":"echinococ","echinococoze":"echinococoză","echinococozei":"echinococoză","echinococozele":"echinococoză","echinococozelor":"echinococoză","echinococul":"echinococ","echinococule":"echinococ","echinococului":"echinococ","echinoctiala":["echinocțială","echinocțial","echinocțiala","echinocțial"],"echinoctiale":"echinocțial","echinoctialele":"echinocțial","echinoctiali":"echinocțial","echinoctialii":"echinocțial","echinoctialul":"echinocțial","echinoctii":"echinocțiu","echinoctii de primavara":"echinocțiu de primăvară","echinoctii de toamna":"echinocțiu de toamnă","echinoctiile":"echinocțiu","echinoctiilor":"echinocțiu","echinoctiul":"echinocțiu","echinoctiule":"echinocțiu","echinoctiului":"echinocțiu","echinoderme":"echinoderm","echinodermele":"echinoderm","echinodermelor":"echinoderm","echinodermul":"echinoderm","echinodermule":"echinoderm","echinodermului":"echinoderm","echinoxiala":["echinoxială","echinoxial","echinoxiala","echinoxial"],"echinoxiale":"echinoxial","echinoxialele":"echinoxial","echinoxiali":"echinoxial","echinoxialii":"echinoxial","echinoxialul":"echinoxial","echinoxul":"echinox","echinoxule":"echinox","echinoxului":"echinox","echinoxuri":"echinox","echinoxurile":"echinox","echinoxurilor":"echinox","echipagii":"echipagiu","echipagiile":"echipagiu","echipagiilor":"echipagiu","echipagiuul":"echipagiu","echipagiuule":"echipagiu","echipagiuului":"echipagiu","echipai":"echipa","echipaje":"echipaj","echipajele":"echipaj","echipajelor":"echipaj","echipajul":"echipaj","echipajule":"echipaj","echipajului":"echipaj","echipam":["echipăm","echipa","echipam","echipa"],"echipamente":"echipament","echipamentele":"echipament","echipamentelor":"echipament","echipamentul":"echipament","echipamentule":"echipament","echipamentului":"echipament","echipand":"echipa","echipara":"echipa","echiparam":"echipa","echiparati":"echipa","echiparea":"echipare","echipari":"echipare","echiparii":"echipare","echiparile":"echipare","echiparilor":"echipare","echipartitia":"echipartiție","echipartitiei":"echipartiție","echipartitii":"echipartiție","echipartitiile":"echipartiție","echipartitiilor":"echipartiție","echipase":"echipa","echipasem":"echipa","echipasera":"echipa","echipaseram":"echipa","echipaserati":"echipa","echipasesi":"echipa","echipasi":"echipa","echipat":"echipa","echipata":["echipată","echipat","echipata","echipat"],"echipate":"echipat","echipatele":"echipat","echipati":["echipați","echipa","echipați","echipat"],"echipatii":"echipat","echipatul":"echipat","echipau":"echipa","echipe":"echipă","echipeaza":"echipa","echipei":"echipă","echipele":"echipă","echipelor":"echipă","echipez":"echipa","echipezi":"echipa","echipiere":"echipieră","echipierei":"echipieră","echipierele":"echipieră","echipierelor":"echipieră","echipieri":"echipier","echipierii":"echipier","echipierilor":"echipier","echipierul":"echipier","echipierule":"echipier","echipierului":"echipier","echipolenta":["echipolentă","echipolent","echipolenta","echipolent"],"echipolente":["echipolente","echipolent","echipolențe","echipolență"],"echipolentei":"echipolență","echipolentele":["echipolentele","echipolent","echipolențele","echipolență"],"echipolentelor":"echipolență","echipolenti":"echipolent","echipolentii":"echipolent","echipolentul":"echipolent","echipotente":"echipotență","echipotentei":"echipotență","echipotentele":"echipotență","echipotentelor":"echipotență","echipotentiala":["echipotențială","echipotențial","echipotențiala","echipotențial"],"echipotentiale":"echipotențial","echipotentialele":"echipotențial","echipotentiali":"echipotențial","echipotentialii":"echipotențial","echipotentialul":"echipotențial","echiprobabila":["echiprobabilă","echiprobabil","echiprobabila","echiprobabil"],"echiprobabile":"echiprobabil","echiprobabilele":"echiprobabil","echiprobabili":"echiprobabil","echiprobabilii":"echiprobabil","echiprobabilul":"echiprobabil","echitabila":["echitabilă","echitabil","echitabila","echitabil"],"echitabile":"echitabil","echitabilele":"echitabil","echitabili":"echitabil","echitabilii":"echitabil","echitabilul":"echitabil","echitati":"echitate","echitatia":"echitație","echitatiei":"echitație","echitatii":"echitație","echitatiunea":"echitațiune","echitatiuni":"echitațiune","echitatiunii":"echitațiune","echiunghiulara":["echiunghiulară","echiunghiular","echiunghiulara","echiunghiular"],"echiunghiulare":"echiunghiular","echiunghiularele":"echiunghiular","echiunghiulari":"echiunghiular","echiunghiularii":"echiunghiular","echiunghiularul":"echiunghiular","echivalai":"echivala","echivalam":["echivalăm","echivala","echivalam","echivala"],"echivaland":"echivala","echivalara":"echivala","echivalaram":"echivala","echivalarati":"echivala","echivalarea":"echivalare","echivalari":"echivalare","echivalarii":"echivalare","echivalarile":"echivalare","echivalarilor":"echivalare","echivalase":"echivala","echivalasem":"echivala","echivalasera":"echivala","echivalaseram":"echivala","echivalaserati":"echivala","echivalasesi":"echivala","echivalasi":"echivala","echivalat":"echivala","echivalati":"echivala","echivalau":"echivala","echivaleaza":"echivala","echivalente":"echivalență","echivalentei":"echivalență","echivalentele":"echivalență","echivalentelor":"echivalență","echivalenti":"echivalent","echivalentile":"echivalent","echivalentilor":"echivalent","echivalentul":"echivalent","echivalentule":"echivalent","echivalentului":"echivalent","echivalez":"echivala","echivalezi":"echivala","echivoca":"echivoc","echivoce":"echivoc","echivoci":"echivoc","echivocile":"echivoc","echivocilor":"echivoc","echivocitatea":"echivocitate","echivocitati":"echivocitate","echivocitatii":"echivocitate","echivocul":"echivoc","echivocule":"echivoc","echivocului":"echivoc","ecidieul":"ecidie","ecidieule":"ecidie","ecidieului":"ecidie","ecidii":"ecidie","ecidiile":"ecidie","ecidiilor":"ecidie","ecidiospori":"ecidiospor","ecidiosporii":"ecidiospor","ecidiosporilor":"ecidiospor","ecidiosporul":"ecidiospor","ecidiosporule":"ecidiospor","ecidiosporului":"ecidiospor","eclampsia":"eclampsie","eclampsiei":"eclampsie","eclampsii":"eclampsie","eclampsiile":"eclampsie","eclampsiilor":"eclampsie","eclampsismul":"eclampsism","eclampsismule":"eclampsism","eclampsismului":"eclampsism","eclamptica":["eclamptică","eclamptic","eclamptica","eclamptic"],"eclamptice":"eclamptic","eclampticele":"eclamptic","eclamptici":"eclamptic","eclampticii":"eclamptic","eclampticul":"eclamptic","eclatanta":["eclatantă","eclatant","eclatanta","eclatant"],"eclatante":"eclatant","eclatantele":"eclatant","eclatanti":"eclatant","eclatantii":"eclatant","eclatantul":"eclatant","eclate":"eclată","eclatei":"eclată","eclatele":"eclată","eclatelor":"eclată","eclatoare":"eclator","eclatoarele":"eclator","eclatoarelor":"eclator","eclatorul":"eclator","eclatorule":"eclator","eclatorului":"eclator","eclectica":["eclectică","eclectic","eclectica","eclectic"],"eclectice":"eclectic","eclecticele":"eclectic","eclectici":"eclectic","eclecticii":"eclectic","eclecticisme":"eclecticism","eclecticismele":"eclecticism","eclecticismelor":"eclecticism","eclecticismul":"eclecticism","eclecticismule":"eclecticism","eclecticismului":"eclecticism","eclecticul":"eclectic","eclectismul":"eclectism","eclectismule":"eclectism","eclectismului":"eclectism","ecleraje":"ecleraj","eclerajele":"ecleraj","eclerajelor":"ecleraj","eclerajul":"ecleraj","eclerajule":"ecleraj","eclerajului":"ecleraj","eclerori":"ecleror","eclerorii":"ecleror","eclerorilor":"ecleror","eclerorul":"ecleror","eclerorule":"ecleror","eclerorului":"ecleror","eclerul":"ecler","eclerule":"ecler","eclerului":"ecler","ecleruri":"ecler","eclerurile":"ecler","eclerurilor":"ecler","eclesia":"eclesie","eclesiarhi":"eclesiarh","eclesiarhii":"eclesiarh","eclesiarhilor":"eclesiarh","eclesiarhul":"eclesiarh","eclesiarhule":"eclesiarh","eclesiarhului":"eclesiarh","eclesiastica":["eclesiastică","eclesiastic","eclesiastica","eclesiastic"],"eclesiastice":"eclesiastic","eclesiasticele":"eclesiastic","eclesiastici":"eclesiastic","eclesiasticii":"eclesiastic","eclesiasticul":"eclesiastic","eclesiei":"eclesie","eclesieri":"eclesier","eclesierii":"eclesier","eclesierilor":"eclesier","eclesierul":"eclesier","eclesierule":"eclesier","eclesierului":"eclesier","eclesii":"eclesie","ecleziala":["eclezială","eclezial","ecleziala","eclezial"],"ecleziale":"eclezial","eclezialele":"eclezial","ecleziali":"eclezial","eclezialii":"eclezial","eclezialul":"eclezial","ecleziarhi":"ecleziarh","ecleziarhii":"ecleziarh","ecleziarhilor":"ecleziarh","ecleziarhul":"ecleziarh","ecleziarhule":"ecleziarh","ecleziarhului":"ecleziarh","ecleziastica":["ecleziastică","ecleziastic","ecleziastica","ecleziastic"],"ecleziastice":"ecleziastic","ecleziasticele":"ecleziastic","ecleziastici":"ecleziastic","ecleziasticii":"ecleziastic","ecleziasticul":"ecleziastic","ecleziastul":"ecleziast","ecleziastule":"ecleziast","ecleziastului":"ecleziast","eclimetre":"eclimetru","eclimetrele":"eclimetru","eclimetrelor":"eclimetru","eclimetrul":"eclimetru","eclimetrule":"eclimetru","eclimetrului":"eclimetru","eclipsai":"eclipsa","eclipsam":["eclipsăm","eclipsa","eclipsam","eclipsa"],"eclipsand":"eclipsa","eclipsara":"eclipsa","eclipsaram":"eclipsa","eclipsarati":"eclipsa","eclipsarea":"eclipsare","eclipsari":"eclipsare","eclipsarii":"eclipsare","eclipsarile":"eclipsare","eclipsarilor":"eclipsare","eclipsase":"eclipsa","eclipsasem":"eclipsa","eclipsasera":"eclipsa","eclipsaseram":"eclipsa","eclipsaserati":"eclipsa","eclipsasesi":"eclipsa","eclipsasi":"eclipsa","eclipsat":"eclipsa","eclipsati":"eclipsa","eclipsau":"eclipsa","eclipse":"eclipsă","eclipse lunare":"eclipsă lunară","eclipse solare":"eclipsă solară","eclipseaza":"eclipsa","eclipsei":"eclipsă","eclipsele":"eclipsă","eclipselor":"eclipsă","eclipsez":"eclipsa","eclipsezi":"eclipsa","ecliptica":["ecliptică","ecliptic","ecliptica","ecliptic"],"ecliptice":["ecliptice","ecliptic","ecliptice","ecliptică"],"eclipticei":"ecliptică","eclipticele":["eclipticele","ecliptic","eclipticele","ecliptică"],"eclipticelor":"ecliptică","ecliptici":"ecliptic","eclipticii":"ecliptic","eclipticul":"ecliptic","ecloge":"eclogă","eclogei":"eclogă","eclogele":"eclogă","eclogelor":"eclogă","eclogitul":"eclogit","eclogitule":"eclogit","eclogitului":"eclogit","eclozai":"ecloza","eclozam":["eclozăm","ecloza","eclozam","ecloza"],"eclozand":"ecloza","eclozara":"ecloza","eclozaram":"ecloza","eclozarati":"ecloza","eclozase":"ecloza","eclozasem":"ecloza","eclozasera":"ecloza","eclozaseram":"ecloza","eclozaserati":"ecloza","eclozasesi":"ecloza","eclozasi":"ecloza","eclozat":"ecloza","eclozati":"ecloza","eclozau":"ecloza","eclozeaza":"ecloza","eclozez":"ecloza","eclozezi":"ecloza","eclozionatoare":"eclozionator","eclozionatoarele":"eclozionator","eclozionatoarelor":"eclozionator","eclozionatorul":"eclozionator","eclozionatorule":"eclozionator","eclozionatorului":"eclozionator","ecloziunea":"ecloziune","ecloziuni":"ecloziune","ecloziunii":"ecloziune","ecloziunile":"ecloziune","ecloziunilor":"ecloziune","ecluzai":"ecluza","ecluzam":["ecluzăm","ecluza","ecluzam","ecluza"],"ecluzand":"ecluza","ecluzara":"ecluza","ecluzaram":"ecluza","ecluzarati":"ecluza","ecluzarea":"ecluzare","ecluzarei":"ecluzare","ecluzase":"ecluza","ecluzasem":"ecluza","ecluzasera":"ecluza","ecluzaseram":"ecluza","ecluzaserati":"ecluza","ecluzasesi":"ecluza","ecluzasi":"ecluza","ecluzat":"ecluza","ecluzati":"ecluza","ecluzau":"ecluza","ecluze":"ecluză","ecluzeaza":"ecluza","ecluzei":"ecluză","ecluzele":"ecluză","ecluzelor":"ecluză","ecluzez":"ecluza","ecluzezi":"ecluza","ecluziste":"ecluzistă","ecluzistei":"ecluzistă","ecluzistele":"ecluzistă","ecluzistelor":"ecluzistă","ecluziunea":"ecluziune","ecluziuni":"ecluziune","ecluziunii":"ecluziune","ecluziunile":"ecluziune","ecluziunilor":"ecluziune","ecoansoane":"ecoanson","ecoansoanele":"ecoanson","ecoansoanelor":"ecoanson","ecoansonul":"ecoanson","ecoansonule":"ecoanson","ecoansonului":"ecoanson","ecocidul":"ecocid","ecocidule":"ecocid","ecocidului":"ecocid","ecoencefalografia":"ecoencefalografie","ecoencefalografiei":"ecoencefalografie","ecoencefalografii":"ecoencefalografie","ecoencefalografiile":"ecoencefalografie","ecoencefalografiilor":"ecoencefalografie","ecofobia":"ecofobie","ecofobiei":"ecofobie","ecofobii":"ecofobie","ecofobiile":"ecofobie","ecofobiilor":"ecofobie","ecografe":"ecograf","ecografele":"ecograf","ecografelor":"ecograf","ecografia":"ecografie","ecografica":["ecografică","ecografic","ecografica","ecografic"],"ecografice":"ecografic","ecograficele":"ecografic","ecografici":"ecografic","ecograficii":"ecografic","ecograficul":"ecografic","ecografiei":"ecografie","ecografii":"ecografie","ecograful":"ecograf","ecografule":"ecograf","ecografului":"ecograf","ecograme":"ecogramă","ecogramei":"ecogramă","ecogramele":"ecogramă","ecogramelor":"ecogramă","ecolalia":"ecolalie","ecolaliei":"ecolalie","ecolalii":"ecolalie","ecolocatia":"ecolocație","ecolocatiei":"ecolocație","ecolocatii":"ecolocație","ecolocatiile":"ecolocație","ecolocatiilor":"ecolocație","ecologe":"ecologă","ecologei":"ecologă","ecologele":"ecologă","ecologelor":"ecologă","ecologi":"ecolog","ecologia":"ecologie","ecologica":["ecologică","ecologic","ecologica","ecologic"],"ecologice":"ecologic","ecologicele":"ecologic","ecologici":"ecologic","ecologicii":"ecologic","ecologicul":"ecologic","ecologiei":"ecologie","ecologii":["ecologii","ecolog","ecologii","ecologie"],"ecologilor":"ecolog","ecologismul":"ecologism","ecologismule":"ecologism","ecologismului":"ecologism","ecologista":["ecologistă","ecologist","ecologista","ecologist"],"ecologiste":["ecologiste","ecologist","ecologiste","ecologistă"],"ecologistei":"ecologistă","ecologistele":["ecologistele","ecologist","ecologistele","ecologistă"],"ecologistelor":"ecologistă","ecologisti":"ecologist","ecologistii":"ecologist","ecologistilor":"ecologist","ecologistul":"ecologist","ecologistule":"ecologist","ecologistului":"ecologist","ecologul":"ecolog","ecologule":"ecolog","ecologului":"ecolog","ecolotul":"ecolot","ecolotule":"ecolot","ecolotului":"ecolot","ecoloturi":"ecolot","ecoloturile":"ecolot","ecoloturilor":"ecolot","ecometre":"ecometru","ecometrele":"ecometru","ecometrelor":"ecometru","ecometria":"ecometrie","ecometrica":["ecometrică","ecometric","ecometrica","ecometric"],"ecometrice":"ecometric","ecometricele":"ecometric","ecometrici":"ecometric","ecometricii":"ecometric","ecometricul":"ecometric","ecometriei":"ecometrie","ecometrii":"ecometrie","ecometrul":"ecometru","ecometrule":"ecometru","ecometrului":"ecometru","ecomimia":"ecomimie","ecomimiei":"ecomimie","ecomimii":"ecomimie","ecomimiile":"ecomimie","ecomimiilor":"ecomimie","econdromul":"econdrom","econdromule":"econdrom","econdromului":"econdrom","econoame":"econoamă","econoamei":"econoamă","econoamele":"econoamă","econoamelor":"econoamă","economa":["economă","econom","economa","econom"],"econome":"econom","economele":"econom","econometria":"econometrie","econometrica":["econometrică","econometric","econometrica","econometric"],"econometrice":"econometric","econometricele":"econometric","econometrici":"econometric","econometricii":"econometric","econometricul":"econometric","econometriei":"econometrie","econometrii":"econometrie","economi":"econom","economia":"economie","economiasca":["economiască","economiesc","economiasca","economiesc"],"economica":["economică","economic","economica","economic"],"economice":"economic","economiceasca":["economicească","economicesc","economiceasca","economicesc"],"economicele":"economic","economicescul":"economicesc","economicesti":"economicesc","economicestii":"economicesc","economicestile":"economicesc","economici":"economic","economicii":"economic","economicitatati":"economicitate","economicitatatii":"economicitate","economicitatatile":"economicitate","economicitatatilor":"economicitate","economicitatea":"economicitate","economicoasa":["economicoasă","economicos","economicoasa","economicos"],"economicoase":"economicos","economicoasele":"economicos","economicosi":"economicos","economicosii":"economicos","economicosul":"economicos","economicul":"economic","economiei":"economie","economiescul":"economiesc","economiesti":"economiesc","economiestii":"economiesc","economiestile":"economiesc","economii":["economii","econom","economii","economie"],"economiile":"economie","economiilor":"economie","economisea":"economisi","economiseai":"economisi","economiseam":"economisi","economiseati":"economisi","economiseau":"economisi","economisesc":"economisi","economiseste":"economisi","economisesti":"economisi","economisii":"economisi","economisim":"economisi","economisind":"economisi","economisira":"economisi","economisiram":"economisi","economisirati":"economisi","economisirea":"economisire","economisiri":"economisire","economisirii":"economisire","economisirile":"economisire","economisirilor":"economisire","economisise":"economisi","economisisem":"economisi","economisisera":"economisi","economisiseram":"economisi","economisiserati":"economisi","economisisesi":"economisi","economisisi":"economisi","economisit":"economisi","economisita":["economisită","economisit","economisita","economisit"],"economisite":"economisit","economisitele":"economisit","economisiti":["economisiți","economisi","economisiți","economisit"],"economisitii":"economisit","economisitoare":"economisitor","economisitoarea":"economisitor","economisitoarele":"economisitor","economisitori":"economisitor","economisitorii":"economisitor","economisitorul":"economisitor","economisitul":"economisit","economismul":"economism","economismule":"economism","economismului":"economism","economiste":"economistă","economistei":"economistă","economistele":"economistă","economistelor":"economistă","economisti":"economist","economistii":"economist","economistilor":"economist","economistul":"economist","economistule":"economist","economistului":"economist","economizai":"economiza","economizam":["economizăm","economiza","economizam","economiza"],"economizand":"economiza","economizara":"economiza","economizaram":"economiza","economizarati":"economiza","economizarea":"economizare","economizari":"economizare","economizarii":"economizare","economizarile":"economizare","economizarilor":"economizare","economizase":"economiza","economizasem":"economiza","economizasera":"economiza","economizaseram":"economiza","economizaserati":"economiza","economizasesi":"economiza","economizasi":"economiza","economizat":"economiza","economizati":"economiza","economizau":"economiza","economizeaza":"economiza","economizez":"economiza","economizezi":"economiza","economizoare":"economizor","economizoarele":"economizor","economizoarelor":"economizor","economizorul":"economizor","economizorule":"economizor","economizorului":"economizor","economul":"econom","ecopraxia":"ecopraxie","ecopraxiei":"ecopraxie","ecopraxii":"ecopraxie","ecopraxiile":"ecopraxie","ecopraxiilor":"ecopraxie","ecorsee":"ecorșeu","ecorseele":"ecorșeu","ecorseelor":"ecorșeu","ecorseul":"ecorșeu","ecorseule":"ecorșeu","ecorseului":"ecorșeu","ecoscoape":"ecoscop","ecoscoapele":"ecoscop","ecoscoapelor":"ecoscop","ecoscopia":"ecoscopie","ecoscopiei":"ecoscopie","ecoscopii":"ecoscopie","ecoscopiile":"ecoscopie","ecoscopiilor":"ecoscopie","ecoscopul":"ecoscop","ecoscopule":"ecoscop","ecoscopului":"ecoscop","ecosisteme":"ecosistem","ecosistemele":"ecosistem","ecosistemelor":"ecosistem","ecosistemul":"ecosistem","ecosistemule":"ecosistem","ecosistemului":"ecosistem","ecosonde":"ecosondă","ecosondei":"ecosondă","ecosondele":"ecosondă","ecosondelor":"ecosondă","ecospecia":"ecospecie","ecospeciei":"ecospecie","ecospecii":"ecospecie","ecospeciile":"ecospecie","ecospeciilor":"ecospecie","ecostabilitatea":"ecostabilitate","ecostabilitati":"ecostabilitate","ecostabilitatii":"ecostabilitate","ecostabilitatile":"ecostabilitate","ecostabilitatilor":"ecostabilitate","ecotipul":"ecotip","ecotipule":"ecotip","ecotipului":"ecotip","ecotipuri":"ecotip","ecotipurile":"ecotip","ecotipurilor":"ecotip","ecoturisme":"ecoturism","ecoturismele":"ecoturism","ecoturismelor":"ecoturism","ecoturismul":"ecoturism","ecoturismule":"ecoturism","ecoturismului":"ecoturism","ecoul":"ecou","ecoule":"ecou","ecoului":"ecou","ecouri":"ecou","ecourile":"ecou","ecourilor":"ecou","ecra":["ecră","ecru","ecra","ecru"],"ecranai":"ecrana","ecranam":["ecranăm","ecrana","ecranam","ecrana"],"ecranand":"ecrana","ecranara":"ecrana","ecranaram":"ecrana","ecranarati":"ecrana","ecranarea":"ecranare","ecranari":"ecranare","ecranarii":"ecranare","ecranarile":"ecranare","ecranarilor":"ecranare","ecranase":"ecrana","ecranasem":"ecrana","ecranasera":"ecrana","ecranaseram":"ecrana","ecranaserati":"ecrana","ecranasesi":"ecrana","ecranasi":"ecrana","ecranat":"ecrana","ecranata":["ecranată","ecranat","ecranata","ecranat"],"ecranate":"ecranat","ecranatele":"ecranat","ecranati":["ecranați","ecrana","ecranați","ecranat"],"ecranatii":"ecranat","ecranatul":"ecranat","ecranau":"ecrana","ecrane":"ecran","ecrane panoramice":"ecran panoramic","ecraneaza":"ecrana","ecranele":"ecran","ecranelor":"ecran","ecranez":"ecrana","ecranezi":"ecrana","ecranizai":"ecraniza","ecranizam":["ecranizăm","ecraniza","ecranizam","ecraniza"],"ecranizand":"ecraniza","ecranizara":"ecraniza","ecranizaram":"ecraniza","ecranizarati":"ecraniza","ecranizarea":"ecranizare","ecranizari":"ecranizare","ecranizarii":"ecranizare","ecranizarile":"ecranizare","ecranizarilor":"ecranizare","ecranizase":"ecraniza","ecranizasem":"ecraniza","ecranizasera":"ecraniza","ecranizaseram":"ecraniza","ecranizaserati":"ecraniza","ecranizasesi":"ecraniza","ecranizasi":"ecraniza","ecranizat":"ecraniza","ecranizata":["ecranizată","ecranizat","ecranizata","ecranizat"],"ecranizate":"ecranizat","ecranizatele":"ecranizat","ecranizati":["ecranizați","ecraniza","ecranizați","ecranizat"],"ecranizatii":"ecranizat","ecranizatul":"ecranizat","ecranizau":"ecraniza","ecranizeaza":"ecraniza","ecranizez":"ecraniza","ecranizezi":"ecraniza","ecranul":"ecran","ecranule":"ecran","ecranului":"ecran","ecrazoare":"ecrazor","ecrazoarele":"ecrazor","ecrazoarelor":"ecrazor","ecrazorul":"ecrazor","ecrazorule":"ecrazor","ecrazorului":"ecrazor","ecre":"ecru","ecrele":"ecru","ecri":"ecru","ecrii":"ecru","ecrituri":"ecritură","ecriturii":"ecritură","ecriturile":"ecritură","ecriturilor":"ecritură","ecrul":"ecru","ectazia":"ectazie","ectaziei":"ectazie","ectazii":"ectazie","ectaziile":"ectazie","ectaziilor":"ectazie","ectenia":"ectenie","ecteniei":"ectenie","ectenii":"ectenie","ecteniile":"ectenie","ecteniilor":"ectenie","ectime":"ectimă","ectimei":"ectimă","ectimele":"ectimă","ectimelor":"ectimă","ectoblastica":["ectoblastică","ectoblastic","ectoblastica","ectoblastic"],"ectoblastice":"ectoblastic","ectoblasticele":"ectoblastic","ectoblastici":"ectoblastic","ectoblasticii":"ectoblastic","ectoblasticul":"ectoblastic","ectoblastul":"ectoblast","ectoblastule":"ectoblast","ectoblastului":"ectoblast","ectoblasturi":"ectoblast","ectoblasturile":"ectoblast","ectoblasturilor":"ectoblast","ectocardia":"ectocardie","ectocardiei":"ectocardie","ectocardii":"ectocardie","ectocardiile":"ectocardie","ectocardiilor":"ectocardie","ectoderme":"ectoderm","ectodermele":"ectoderm","ectodermelor":"ectoderm","ectodermica":["ectodermică","ectodermic","ectodermica","ectodermic"],"ectodermice":"ectodermic","ectodermicele":"ectodermic","ectodermici":"ectodermic","ectodermicii":"ectodermic","ectodermicul":"ectodermic","ectodermul":"ectoderm","ectodermule":"ectoderm","ectodermului":"ectoderm","ectoendoparazite":"ectoendoparazită","ectoendoparazitei":"ectoendoparazită","ectoendoparazitele":"ectoendoparazită","ectoendoparazitelor":"ectoendoparazită","ectofita":["ectofită","ectofit","ectofita","ectofit"],"ectofite":"ectofit","ectofitele":"ectofit","ectofiti":"ectofit","ectofitii":"ectofit","ectofitul":"ectofit","ectogeneze":"ectogeneză","ectogenezei":"ectogeneză","ectogenezele":"ectogeneză","ectogenezelor":"ectogeneză","ectoparazi":"ectoparazit","ectoparaziti":"ectoparazit","ectoparazitii":"ectoparazit","ectoparazitile":"ectoparazit","ectoparazitilor":"ectoparazit","ectopia":"ectopie","ectopica":["ectopică","ectopic","ectopica","ectopic"],"ectopice":"ectopic","ectopicele":"ectopic","ectopici":"ectopic","ectopicii":"ectopic","ectopicul":"ectopic","ectopiei":"ectopie","ectopii":"ectopie","ectoplasme":"ectoplasmă","ectoplasmei":"ectoplasmă","ectoplasmele":"ectoplasmă","ectoplasmelor":"ectoplasmă","ectosfere":"ectosferă","ectosferei":"ectosferă","ectosferele":"ectosferă","ectosferelor":"ectosferă","ectotrofa":["ectotrofă","ectotrof","ectotrofa","ectotrof"],"ectotrofe":"ectotrof","ectotrofele":"ectotrof","ectotrofi":"ectotrof","ectotrofii":"ectotrof","ectotroful":"ectotrof","ectrodactilia":"ectrodactilie","ectrodactiliei":"ectrodactilie","ectrodactilii":"ectrodactilie","ectrodactiliile":"ectrodactilie","ectrodactiliilor":"ectrodactilie","ectromeli":"ectromel","ectromelia":"ectromelie","ectromeliei":"ectromelie","ectromelii":["ectromelii","ectromel","ectromelii","ectromelie"],"ectromeliile":"ectromelie","ectromeliilor":"ectromelie","ectromelilor":"ectromel","ectromelul":"ectromel","ectromelule":"ectromel","ectromelului":"ectromel","ectropionul":"ectropion","ectropionule":"ectropion","ectropionului":"ectropion","ecuadoriana":["ecuadoriană","ecuadorian","ecuadoriana","ecuadorian"],"ecuadorianul":"ecuadorian","ecuadorianule":"ecuadorian","ecuadorianului":"ecuadorian","ecuadoriene":["ecuadoriene","ecuadorian","ecuadoriene","ecuadoriană"],"ecuadorienei":"ecuadoriană","ecuadorienele":["ecuadorienele","ecuadorian","ecuadorienele","ecuadoriană"],"ecuadorienelor":"ecuadoriană","ecuadorieni":"ecuadorian","ecuadorienii":"ecuadorian","ecuadorienilor":"ecuadorian","ecuatia":"ecuație","ecuatiei":"ecuație","ecuatii":"ecuație","ecuatii algebrice":"ecuație algebrică","ecuatii chimice":"ecuație chimică","ecuatii de gradul intai":"ecuație de gradul întâi","ecuatii diferentiale":"ecuație diferențială","ecuatii diofantice":"ecuație diofantică","ecuatii exponentiale":"ecuație exponențială","ecuatii integrale":"ecuație integrală","ecuatii parametrice":"ecuație parametrică","ecuatii patratice":"ecuație pătratică","ecuatii polinomiale":"ecuație polinomială","ecuatiile":"ecuație","ecuatiilor":"ecuație","ecuatiunea":"ecuațiune","ecuatiuni":"ecuațiune","ecuatiunii":"ecuațiune","ecuatiunile":"ecuațiune","ecuatiunilor":"ecuațiune","ecuatore":"ecuator","ecuatorele":"ecuator","ecuatorelor":"ecuator","ecuatoriala":["ecuatorială","ecuatorial","ecuatoriala","ecuatorial"],"ecuatoriale":"ecuatorial","ecuatorialele":"ecuatorial","ecuatoriali":"ecuatorial","ecuatorialii":"ecuatorial","ecuatorialul":"ecuatorial","ecuatorul":"ecuator","ecuatorule":"ecuator","ecuatorului":"ecuator","ecuestra":["ecuestră","ecuestru","ecuestra","ecuestru"],"ecuestre":"ecuestru","ecuestrele":"ecuestru","ecuestri":"ecuestru","ecuestrii":"ecuestru","ecuestrul":"ecuestru","ecuinarea":"ecuinare","ecuinari":"ecuinare","ecuinarii":"ecuinare","ecuinarile":"ecuinare","ecuinarilor":"ecuinare","ecumenica":["ecumenică","ecumenic","ecumenica","ecumenic"],"ecumenice":"ecumenic","ecumenicele":"ecumenic","ecumenici":"ecumenic","ecumenicii":"ecumenic","ecumenicitatea":"ecumenicitate","ecumenicitati":"ecumenicitate","ecumenicitatii":"ecumenicitate","ecumenicitatile":"ecumenicitate","ecumenicitatilor":"ecumenicitate","ecumenicul":"ecumenic","ecusoane":"ecuson","ecusoanele":"ecuson","ecusoanelor":"ecuson","ecusonul":"ecuson","ecusonule":"ecuson","ecusonului":"ecuson","ecvatoriala":["ecvatorială","ecvatorial","ecvatoriala","ecvatorial"],"ecvatoriale":"ecvatorial","ecvatorialele":"ecvatorial","ecvatoriali":"ecvatorial","ecvatorialii":"ecvatorial","ecvatorialul":"ecvatorial","ecvestra":["ecvestră","ecvestru","ecvestra","ecvestru"],"ecvestre":"ecvestru","ecvestrele":"ecvestru","ecvestri":"ecvestru","ecvestrii":"ecvestru","ecvestrul":"ecvestru","ecvidee":"ecvideu","ecvideele":"ecvideu","ecvideelor":"ecvideu","ecvideul":"ecvideu","ecvideule":"ecvideu","ecvideului":"ecvideu","eczematica":["eczematică","eczematic","eczematica","eczematic"],"eczematice":"eczematic","eczematicele":"eczematic","eczematici":"eczematic","eczematicii":"eczematic","eczematicul":"eczematic","eczematoasa":["eczematoasă","eczematos","eczematoasa","eczematos"],"eczematoase":["eczematoase","eczematoasă","eczematoase","eczematos"],"eczematoasei":"eczematoasă","eczematoasele":["eczematoasele","eczematoasă","eczematoasele","eczematos"],"eczematoaselor":"eczematoasă","eczematosi":"eczematos","eczematosii":"eczematos","eczematosul":"eczematos","eczeme":"eczemă","eczemei":"eczemă","eczemele":"eczemă","eczemelor":"eczemă","edacea":"edace","edacele":"edace","edaci":"edace","edacii":"edace","edacitatati":"edacitate","edacitatatii":"edacitate","edacitatatile":"edacitate","edacitatatilor":"edacitate","edacitatea":"edacitate","edafica":["edafică","edafic","edafica","edafic"],"edafice":"edafic","edaficele":"edafic","edafici":"edafic","edaficii":"edafic","edaficul":"edafic","edarea":"edare","edari":"edare","edarii":"edare","edecari":"edecar","edecarii":"edecar","edecarilor":"edecar","edecarul":"edecar","edecarule":"edecar","edecarului":"edecar","edeclii":"edecliu","edecliii":"edecliu","edecliilor":"edecliu","edecliuul":"edecliu","edecliuule":"edecliu","edecliuului":"edecliu","edecul":"edec","edecule":"edec","edecului":"edec","edecuri":"edec","edecurile":"edec","edecurilor":"edec","edelvaisul":"edelvais","edelvaisule":"edelvais","edelvaisului":"edelvais","edematica":["edematică","edematic","edematica","edematic"],"edematice":"edematic","edematicele":"edematic","edematici":"edematic","edematicii":"edematic","edematicul":"edematic","edematoasa":["edematoasă","edematos","edematoasa","edematos"],"edematoase":"edematos","edematoasele":"edematos","edematosi":"edematos","edematosii":"edematos","edematosul":"edematos","edeme":"edem","edemele":"edem","edemelor":"edem","edemul":"edem","edemule":"edem","edemului":"edem","edemuri pulmonare":"edem pulmonar","edeniana":["edeniană","edenian","edeniana","edenian"],"edenianul":"edenian","edenica":["edenică","edenic","edenica","edenic"],"edenice":"edenic","edenicele":"edenic","edenici":"edenic","edenicii":"edenic","edenicul":"edenic","edeniene":"edenian","edenienele":"edenian","edenieni":"edenian","edenienii":"edenian","edenitul":"edenit","edenitule":"edenit","edenitului":"edenit","edentai":"edenta","edentali":"edental","edentalile":"edental","edentalilor":"edental","edentalul":"edental","edentalule":"edental","edentalului":"edental","edentam":["edentăm","edenta","edentam","edenta"],"edentand":"edenta","edentara":"edenta","edentaram":"edenta","edentarati":"edenta","edentase":"edenta","edentasem":"edenta","edentasera":"edenta","edentaseram":"edenta","edentaserati":"edenta","edentasesi":"edenta","edentasi":"edenta","edentat":"edenta","edentati":["edentați","edenta","edentați","edentat"],"edentatile":"edentat","edentatilor":"edentat","edentatul":"edentat","edentatule":"edentat","edentatului":"edentat","edentau":"edenta","edenteaza":"edenta","edentez":"edenta","edentezi":"edenta","edenul":"eden","edenule":"eden","edenului":"eden","ederacee":"ederaceu","ederaceea":"ederaceu","ederaceele":"ederaceu","ederacei":"ederaceu","ederaceii":"ederaceu","ederaceul":"ederaceu","edictala":["edictală","edictal","edictala","edictal"],"edictale":"edictal","edictalele":"edictal","edictali":"edictal","edictalii":"edictal","edictalul":"edictal","edicte":"edict","edictele":"edict","edictelor":"edict","edictul":"edict","edictule":"edict","edictului":"edict","edicule":"edicul","ediculele":"edicul","ediculelor":"edicul","ediculul":"edicul","ediculule":"edicul","ediculului":"edicul","edifianta":["edifiantă","edifiant","edifianta","edifiant"],"edifiante":"edifiant","edifiantele":"edifiant","edifianti":"edifiant","edifiantii":"edifiant","edifiantul":"edifiant","edific":"edifica","edificai":"edifica","edificam":["edificăm","edifica","edificam","edifica"],"edificand":"edifica","edificara":"edifica","edificaram":"edifica","edificarati":"edifica","edificarea":"edificare","edificari":"edificare","edificarii":"edificare","edificarile":"edificare","edificarilor":"edificare","edificase":"edifica","edificasem":"edifica","edificasera":"edifica","edificaseram":"edifica","edificaserati":"edifica","edificasesi":"edifica","edificasi":"edifica","edificat":"edifica","edificata":["edificată","edificat","edificata","edificat"],"edificate":"edificat","edificatele":"edificat","edificati":["edificați","edifica","edificați","edificat"],"edificatia":"edificație","edificatiei":"edificație","edificatii":["edificații","edificat","edificații","edificație"],"edificatiile":"edificație","edificatiilor":"edificație","edificatiunea":"edificațiune","edificatiuni":"edificațiune","edificatiunii":"edificațiune","edificatiunile":"edificațiune","edificatiunilor":"edificațiune","edificatoare":"edificator","edificatoarea":"edificator","edificatoarele":"edificator","edificatori":"edificator","edificatorii":"edificator","edificatorul":"edificator","edificatul":"edificat","edificau":"edifica","edifice":"edifica","edifici":"edifica","edificii":"edificiu","edificiile":"edificiu","edificiilor":"edificiu","edificiul":"edificiu","edificiule":"edificiu","edificiului":"edificiu","edili":"edil","edilii":"edil","edililor":"edil","edilitara":["edilitară","edilitar","edilitara","edilitar"],"edilitare":"edilitar","edilitarele":"edilitar","edilitari":"edilitar","edilitarii":"edilitar","edilitarul":"edilitar","edilitatea":"edilitate","edilitati":"edilitate","edilitatii":"edilitate","edilitatile":"edilitate","edilitatilor":"edilitate","edilul":"edil","edilule":"edil","edilului":"edil","editai":"edita","editam":["edităm","edita","editam","edita"],"editand":"edita","editara":"edita","editaram":"edita","editarati":"edita","editarea":"editare","editari":"editare","editarii":"editare","editarile":"editare","editarilor":"editare","editase":"edita","editasem":"edita","editasera":"edita","editaseram":"edita","editaserati":"edita","editasesi":"edita","editasi":"edita","editat":"edita","editata":["editată","editat","editata","editat"],"editate":"editat","editatele":"editat","editati":["editați","edita","editați","editat"],"editatii":"editat","editatul":"editat","editau":"edita","editeaza":"edita","editez":"edita","editezi":"edita","editia":"ediție","editiei":"ediție","editii":"ediție","editii princeps":"ediție princeps","editiile":"ediție","editiilor":"ediție","editiune":"ediție","editiunea":"edițiune","editiuni":"edițiune","editiunii":"edițiune","editiunile":"edițiune","editiunilor":"edițiune","editoarea":"editoare","editoarei":"editoare","editoarele":"editoare","editoarelor":"editoare","editori":"editor","editoriala":["editorială","editorial","editoriala","editorial"],"editoriale":"editorial","editorialele":"editorial","editorialelor":"editorial","editoriali":"editorial","editorialii":"editorial","editorialiste":"editorialistă","editorialistei":"editorialistă","editorialistele":"editorialistă","editorialistelor":"editorialistă","editorialisti":"editorialist","editorialistii":"editorialist","editorialistilor":"editorialist","editorialistul":"editorialist","editorialistule":"editorialist","editorialistului":"editorialist","editorialul":"editorial","editorialule":"editorial","editorialului":"editorial","editorii":"editor","editorilor":"editor","editorul":"editor","editorule":"editor","editorului":"editor","edituri":"editură","editurii":"editură","editurile":"editură","editurilor":"editură","edometre":"edometru","edometrele":"edometru","edometrelor":"edometru","edometruul":"edometru","edometruule":"edometru","edometruului":"edometru","educ":"educa","educabila":["educabilă","educabil","educabila","educabil"],"educabile":"educabil","educabilele":"educabil","educabili":"educabil","educabilii":"educabil","educabilitatea":"educabilitate","educabilitati":"educabilitate","educabilitatii":"educabilitate","educabilitatile":"educabilitate","educabilitatilor":"educabilitate","educabilul":"educabil","educaciunea":"educăciune","educaciuni":"educăciune","educaciunii":"educăciune","educaciunile":"educăciune","educaciunilor":"educăciune","educai":"educa","educam":["educăm","educa","educam","educa"],"educand":"educa","educara":"educa","educaram":"educa","educarati":"educa","educarea":"educare","educarei":"educare","educarisita":["educarisită","educarisit","educarisita","educarisit"],"educarisite":"educarisit","educarisitele":"educarisit","educarisiti":"educarisit","educarisitii":"educarisit","educarisitul":"educarisit","educase":"educa","educasem":"educa","educasera":"educa","educaseram":"educa","educaserati":"educa","educasesi":"educa","educasi":"educa","educat":"educa","educata":["educată","educat","educata","educat"],"educate":"educat","educatele":"educat","educati":["educați","educa","educați","educat"],"educatii":["educații","educat","educații","educație"],"educationala":["educațională","educațional","educaționala","educațional"],"educationale":"educațional","educationalele":"educațional","educationali":"educațional","educationalii":"educațional","educationalul":"educațional","educatiune":"educație","educatiunea":"educațiune","educatiuni":"educațiune","educatiunii":"educațiune","educatiunile":"educațiune","educatiunilor":"educațiune","educativa":["educativă","educativ","educativa","educativ"],"educative":"educativ","educativele":"educativ","educativi":"educativ","educativii":"educativ","educativul":"educativ","educatoarea":"educatoare","educatoarei":"educatoare","educatoarele":"educatoare","educatoarelor":"educatoare","educatori":"educator","educatorii":"educator","educatorilor":"educator","educatorul":"educator","educatorule":"educator","educatorului":"educator","educatul":"educat","educau":"educa","educe":"educa","educi":"educa","educologia":"educologie","educologiei":"educologie","educologii":"educologie","edula":["edulă","edul","edula","edul"],"edulcorai":"edulcora","edulcoram":["edulcorăm","edulcora","edulcoram","edulcora"],"edulcorand":"edulcora","edulcoranti":"edulcorant","edulcorantile":"edulcorant","edulcorantilor":"edulcorant","edulcorantul":"edulcorant","edulcorantule":"edulcorant","edulcorantului":"edulcorant","edulcorara":"edulcora","edulcoraram":"edulcora","edulcorarati":"edulcora","edulcorarea":"edulcorare","edulcorari":"edulcorare","edulcorarii":"edulcorare","edulcorarile":"edulcorare","edulcorarilor":"edulcorare","edulcorase":"edulcora","edulcorasem":"edulcora","edulcorasera":"edulcora","edulcoraseram":"edulcora","edulcoraserati":"edulcora","edulcorasesi":"edulcora","edulcorasi":"edulcora","edulcorat":"edulcora","edulcorata":["edulcorată","edulcorat","edulcorata","edulcorat"],"edulcorate":"edulcorat","edulcoratele":"edulcorat","edulcorati":["edulcorați","edulcora","edulcorați","edulcorat"],"edulcoratia":"edulcorație","edulcoratiei":"edulcorație","edulcoratii":["edulcorații","edulcorat","edulcorații","edulcorație"],"edulcoratiile":"edulcorație","edulcoratiilor":"edulcorație","edulcoratul":"edulcorat","edulcorau":"edulcora","edulcoreaza":"edulcora","edulcorez":"edulcora","edulcorezi":"edulcora","edule":"edul","edulele":"edul","eduli":"edul","edulii":"edul","edulul":"edul","efebi":"efeb","efebii":"efeb","efebilor":"efeb","efebul":"efeb","efebule":"efeb","efebului":"efeb","efecatia":"efecație","efecatiei":"efecație","efecatii":"efecație","efecatiile":"efecație","efecatiilor":"efecație","efecte":"efect","efecte hall":"efect Hall","efecte secundare":"efect secundar","efecte sonore":"efect sonor","efecte speciale":"efect special","efectiva":["efectivă","efectiv","efectiva","efectiv"],"efective":"efectiv","efectivele":"efectiv","efectivelor":"efectiv","efectivi":"efectiv","efectivii":"efectiv","efectivitatati":"efectivitate","efectivitatatii":"efectivitate","efectivitatatile":"efectivitate","efectivitatatilor":"efectivitate","efectivitatea":"efectivitate","efectivul":"efectiv","efectivule":"efectiv","efectivului":"efectiv","efectori":"efector","efectorii":"efector","efectorilor":"efector","efectorul":"efector","efectorule":"efector","efectorului":"efector","efectuai":"efectua","efectuam":["efectuăm","efectua","efectuam","efectua"],"efectuand":"efectua","efectuara":"efectua","efectuaram":"efectua","efectuarati":"efectua","efectuarea":"efectuare","efectuari":"efectuare","efectuarii":"efectuare","efectuarile":"efectuare","efectuarilor":"efectuare","efectuase":"efectua","efectuasem":"efectua","efectuasera":"efectua","efectuaseram":"efectua","efectuaserati":"efectua","efectuasesi":"efectua","efectuasi":"efectua","efectuat":"efectua","efectuata":["efectuată","efectuat","efectuata","efectuat"],"efectuate":"efectuat","efectuatele":"efectuat","efectuati":["efectuați","efectua","efectuați","efectuat"],"efectuatii":"efectuat","efectuatul":"efectuat","efectuau":"efectua","efectueaza":"efectua","efectuez":"efectua","efectuezi":"efectua","efedre":"efedră","efedrei":"efedră","efedrele":"efedră","efedrelor":"efedră","efedrine":"efedrină","efedrinei":"efedrină","efedrinele":"efedrină","efedrinelor":"efedrină","efelia":"efelie","efelide":"efelidă","efelidei":"efelidă","efelidele":"efelidă","efelidelor":"efelidă","efeliei":"efelie","efelii":"efelie","efeliile":"efelie","efeliilor":"efelie","efemeiai":"efemeia","efemeiam":"efemeia","efemeiara":"efemeia","efemeiaram":"efemeia","efemeiarati":"efemeia","efemeiase":"efemeia","efemeiasem":"efemeia","efemeiasera":"efemeia","efemeiaseram":"efemeia","efemeiaserati":"efemeia","efemeiasesi":"efemeia","efemeiasi":"efemeia","efemeiat":"efemeia","efemeiata":["efemeiată","efemeiat","efemeiata","efemeiat"],"efemeiate":"efemeiat","efemeiatele":"efemeiat","efemeiati":["efemeiați","efemeia","efemeiați","efemeiat"],"efemeiatii":"efemeiat","efemeiatul":"efemeiat","efemeiau":"efemeia","efemeiaza":"efemeia","efemeie":"efemeia","efemeiem":"efemeia","efemeiez":"efemeia","efemeiezi":"efemeia","efemeind":"efemeia","efemera":["efemeră","efemer","efemera","efemer"],"efemere":["efemere","efemer","efemere","efemeră"],"efemerei":"efemeră","efemerele":["efemerele","efemer","efemerele","efemeră"],"efemerelor":"efemeră","efemeri":"efemer","efemerica":["efemerică","efemeric","efemerica","efemeric"],"efemerice":"efemeric","efemericele":"efemeric","efemerici":"efemeric","efemericii":"efemeric","efemericul":"efemeric","efemeride":"efemeridă","efemeridei":"efemeridă","efemeridele":"efemeridă","efemeridelor":"efemeridă","efemerii":"efemer","efemeritatea":"efemeritate","efemeritati":"efemeritate","efemeritatii":"efemeritate","efemeritatile":"efemeritate","efemeritatilor":"efemeritate","efemerizai":"efemeriza","efemerizam":["efemerizăm","efemeriza","efemerizam","efemeriza"],"efemerizand":"efemeriza","efemerizara":"efemeriza","efemerizaram":"efemeriza","efemerizarati":"efemeriza","efemerizarea":"efemerizare","efemerizari":"efemerizare","efemerizarii":"efemerizare","efemerizarile":"efemerizare","efemerizarilor":"efemerizare","efemerizase":"efemeriza","efemerizasem":"efemeriza","efemerizasera":"efemeriza","efemerizaseram":"efemeriza","efemerizaserati":"efemeriza","efemerizasesi":"efemeriza","efemerizasi":"efemeriza","efemerizat":"efemeriza","efemerizati":"efemeriza","efemerizau":"efemeriza","efemerizeaza":"efemeriza","efemerizez":"efemeriza","efemerizezi":"efemeriza","efemerul":"efemer","efeminai":"efemina","efeminam":["efeminăm","efemina","efeminam","efemina"],"efeminand":"efemina","efeminara":"efemina","efeminaram":"efemina","efeminarati":"efemina","efeminarea":"efeminare","efeminari":"efeminare","efeminarii":"efeminare","efeminarile":"efeminare","efeminarilor":"efeminare","efeminase":"efemina","efeminasem":"efemina","efeminasera":"efemina","efeminaseram":"efemina","efeminaserati":"efemina","efeminasesi":"efemina","efeminasi":"efemina","efeminat":"efemina","efeminata":["efeminată","efeminat","efeminata","efeminat"],"efeminate":"efeminat","efeminatele":"efeminat","efeminati":["efeminați","efemina","efeminați","efeminat"],"efeminatia":"efeminație","efeminatiei":"efeminație","efeminatii":["efeminații","efeminat","efeminații","efeminație"],"efeminatiunea":"efeminațiune","efeminatiuni":"efeminațiune","efeminatiunii":"efeminațiune","efeminatiunile":"efeminațiune","efeminatiunilor":"efeminațiune","efeminatul":"efeminat","efeminau":"efemina","efemineaza":"efemina","efeminez":"efemina","efeminezi":"efemina","efendiul":"efendi","efendiule":"efendi","efendiului":"efendi","eferenta":["eferentă","eferent","eferenta","eferent"],"eferente":"eferent","eferentele":"eferent","eferenti":"eferent","eferentii":"eferent","eferentul":"eferent","efervescenta":["efervescentă","efervescent","efervescenta","efervescent"],"efervescente":["efervescente","efervescent","efervescențe","efervescență"],"efervescentei":"efervescență","efervescentele":["efervescentele","efervescent","efervescențele","efervescență"],"efervescentelor":"efervescență","efervescenti":"efervescent","efervescentii":"efervescent","efervescentul":"efervescent","efeseana":["efeseană","efesean","efeseana","efesean"],"efeseanul":"efesean","efeseiasca":["efeseiască","efeseiesc","efeseiasca","efeseiesc"],"efeseiescul":"efeseiesc","efeseiesti":"efeseiesc","efeseiestii":"efeseiesc","efeseiestile":"efeseiesc","efesene":"efesean","efesenele":"efesean","efeseni":"efesean","efesenii":"efesean","efetonine":"efetonină","efetoninei":"efetonină","efetoninele":"efetonină","efetoninelor":"efetonină","efevrime":"efevrimă","efevrimei":"efevrimă","efevrimele":"efevrimă","efevrimelor":"efevrimă","eficacitatea":"eficacitate","eficacitati":"eficacitate","eficacitatii":"eficacitate","eficacitatile":"eficacitate","eficacitatilor":"eficacitate","eficienta":["eficientă","eficient","eficienta","eficient"],"eficiente":["eficiente","eficient","eficiențe","eficiență"],"eficientei":"eficiență","eficientele":["eficientele","eficient","eficiențele","eficiență"],"eficientelor":"eficiență","eficienti":"eficient","eficientii":"eficient","eficientizai":"eficientiza","eficientizam":["eficientizăm","eficientiza","eficientizam","eficientiza"],"eficientizand":"eficientiza","eficientizara":"eficientiza","eficientizaram":"eficientiza","eficientizarati":"eficientiza","eficientizarea":"eficientizare","eficientizari":"eficientizare","eficientizarii":"eficientizare","eficientizarile":"eficientizare","eficientizarilor":"eficientizare","eficientizase":"eficientiza","eficientizasem":"eficientiza","eficientizasera":"eficientiza","eficientizaseram":"eficientiza","eficientizaserati":"eficientiza","eficientizasesi":"eficientiza","eficientizasi":"eficientiza","eficientizat":"eficientiza","eficientizati":"eficientiza","eficientizau":"eficientiza","eficientizeaza":"eficientiza","eficientizez":"eficientiza","eficientizezi":"eficientiza","eficientul":"eficient","efigia":"efigie","efigiala":["efigială","efigial","efigiala","efigial"],"efigiale":"efigial","efigialele":"efigial","efigiali":"efigial","efigialii":"efigial","efigialul":"efigial","efigiei":"efigie","efigii":"efigie","efigiile":"efigie","efigiilor":"efigie","efilai":"efila","efilam":["efilăm","efila","efilam","efila"],"efiland":"efila","efilara":"efila","efilaram":"efila","efilarati":"efila","efilase":"efila","efilasem":"efila","efilasera":"efila","efilaseram":"efila","efilaserati":"efila","efilasesi":"efila","efilasi":"efila","efilat":"efila","efilati":"efila","efilau":"efila","efileaza":"efila","efilez":"efila","efilezi":"efila","efimeria":"efimerie","efimeriei":"efimerie","efimerii":"efimerie","efimeriile":"efimerie","efimeriilor":"efimerie","efirul":"efir","efirule":"efir","efirului":"efir","efiruri":"efir","efirurile":"efir","efirurilor":"efir","efleuraje":"efleuraj","efleurajele":"efleuraj","efleurajelor":"efleuraj","efleurajul":"efleuraj","efleurajule":"efleuraj","efleurajului":"efleuraj","eflorescenta":["eflorescentă","eflorescent","eflorescenta","eflorescent"],"eflorescente":["eflorescente","eflorescent","eflorescențe","eflorescență"],"eflorescentei":"eflorescență","eflorescentele":["eflorescentele","eflorescent","eflorescențele","eflorescență"],"eflorescentelor":"eflorescență","eflorescenti":"eflorescent","eflorescentii":"eflorescent","eflorescentul":"eflorescent","eflorismente":"eflorisment","eflorismentele":"eflorisment","eflorismentelor":"eflorisment","eflorismentul":"eflorisment","eflorismentule":"eflorisment","eflorismentului":"eflorisment","efluenta":["efluentă","efluent","efluenta","efluent"],"efluente":["efluente","efluent","efluențe","efluență"],"efluentei":"efluență","efluentele":["efluentele","efluent","efluențele","efluență"],"efluentelor":"efluență","efluenti":"efluent","efluentii":"efluent","efluentul":"efluent","efluvii":"efluviu","efluviile":"efluviu","efluviilor":"efluviu","efluviul":"efluviu","efluviule":"efluviu","efluviului":"efluviu","efluxul":"eflux","efluxule":"eflux","efluxului":"eflux","efluxuri":"eflux","efluxurile":"eflux","efluxurilor":"eflux","efoade":"efod","efoadele":"efod","efoadelor":"efod","efodul":"efod","efodule":"efod","efodului":"efod","eforate":"eforat","eforatele":"eforat","eforatelor":"eforat","eforatul":"eforat","eforatule":"eforat","eforatului":"eforat","eforeasca":["eforească","eforesc","eforeasca","eforesc"],"eforescul":"eforesc","eforesti":"eforesc","eforestii":"eforesc","eforestile":"eforesc","efori":"efor","eforia":"eforie","eforiceasca":["eforicească","eforicesc","eforiceasca","eforicesc"],"eforicescul":"eforicesc","eforicesti":"eforicesc","eforicestii":"eforicesc","eforicestile":"eforicesc","eforiei":"eforie","eforii":["eforii","efor","eforii","eforie"],"eforiile":"eforie","eforiilor":"eforie","eforilor":"efor","eforturi":"efort","eforul":"efor","eforule":"efor","eforului":"efor","efractia":"efracție","efractiei":"efracție","efractii":"efracție","efractiile":"efracție","efractiilor":"efracție","efractiunea":"efracțiune","efractiuni":"efracțiune","efractiunii":"efracțiune","efractiunile":"efracțiune","efractiunilor":"efracțiune","efractoarea":"efractoare","efractoarei":"efractoare","efractoarele":"efractoare","efractoarelor":"efractoare","efractori":"efractor","efractorii":"efractor","efractorilor":"efractor","efractorul":"efractor","efractorule":"efractor","efractorului":"efractor","efrenata":["efrenată","efrenat","efrenata","efrenat"],"efrenate":"efrenat","efrenatele":"efrenat","efrenati":"efrenat","efrenatii":"efrenat","efrenatul":"efrenat","efroaiabila":["efroaiabilă","efroaiabil","efroaiabila","efroaiabil"],"efroaiabile":"efroaiabil","efroaiabilele":"efroaiabil","efroaiabili":"efroaiabil","efroaiabilii":"efroaiabil","efroaiabilul":"efroaiabil","eftaxia":"eftaxie","eftaxiei":"eftaxie","eftaxii":"eftaxie","eftensugul":"eftenșug","eftensugule":"eftenșug","eftensugului":"eftenșug","eftensuguri":"eftenșug","eftensugurile":"eftenșug","eftensugurilor":"eftenșug","eftinatatea":"eftinătate","eftinatati":"eftinătate","eftinatatii":"eftinătate","eftinatatile":"eftinătate","eftinatatilor":"eftinătate","eftinia":"eftinie","eftiniei":"eftinie","eftinii":"eftinie","eftiniile":"eftinie","eftiniilor":"eftinie","efuzia":"efuzie","efuziei":"efuzie","efuzii":"efuzie","efuziile":"efuzie","efuziilor":"efuzie","efuziometre":"efuziometru","efuziometrele":"efuziometru","efuziometrelor":"efuziometru","efuziometrul":"efuziometru","efuziometrule":"efuziometru","efuziometrului":"efuziometru","efuziunea":"efuziune","efuziunei":"efuziune","efuziunele":"efuziune","efuziunelor":"efuziune","efuziuni":"efuziune","efuziva":["efuzivă","efuziv","efuziva","efuziv"],"efuzive":"efuziv","efuzivele":"efuziv","efuzivi":"efuziv","efuzivii":"efuziv","efuzivul":"efuziv","egala":["egală","egal","egala","egal"],"egalabila":["egalabilă","egalabil","egalabila","egalabil"],"egalabile":"egalabil","egalabilele":"egalabil","egalabili":"egalabil","egalabilii":"egalabil","egalabilul":"egalabil","egalai":"egala","egalam":["egalăm","egala","egalam","egala"],"egaland":"egala","egalara":"egala","egalaram":"egala","egalarati":"egala","egalarea":"egalare","egalari":"egalare","egalarii":"egalare","egalarile":"egalare","egalarilor":"egalare","egalase":"egala","egalasem":"egala","egalasera":"egala","egalaseram":"egala","egalaserati":"egala","egalasesi":"egala","egalasi":"egala","egalat":"egala","egalata":["egalată","egalat","egalata","egalat"],"egalate":"egalat","egalatele":"egalat","egalati":["egalați","egala","egalați","egalat"],"egalatii":"egalat","egalatul":"egalat","egalau":"egala","egale":"egal","egaleaza":"egala","egalele":"egal","egalez":"egala","egalezi":"egala","egali":"egal","egalii":"egal","egalilor":"egal","egalitara":["egalitară","egalitar","egalitara","egalitar"],"egalitare":"egalitar","egalitarele":"egalitar","egalitari":"egalitar","egalitarii":"egalitar","egalitarisme":"egalitarism","egalitarismele":"egalitarism","egalitarismelor":"egalitarism","egalitarismul":"egalitarism","egalitarismule":"egalitarism","egalitarismului":"egalitarism","egalitariste":"egalitaristă","egalitaristei":"egalitaristă","egalitaristele":"egalitaristă","egalitaristelor":"egalitaristă","egalitaristi":"egalitarist","egalitaristii":"egalitarist","egalitaristilor":"egalitarist","egalitaristul":"egalitarist","egalitaristule":"egalitarist","egalitaristului":"egalitarist","egalitarul":"egalitar","egalitatea":"egalitate","egalitati":"egalitate","egalitatii":"egalitate","egalitatile":"egalitate","egalitatilor":"egalitate","egalizai":"egaliza","egalizam":["egalizăm","egaliza","egalizam","egaliza"],"egalizand":"egaliza","egalizara":"egaliza","egalizaram":"egaliza","egalizarati":"egaliza","egalizarea":"egalizare","egalizari":"egalizare","egalizarii":"egalizare","egalizarile":"egalizare","egalizarilor":"egalizare","egalizase":"egaliza","egalizasem":"egaliza","egalizasera":"egaliza","egalizaseram":"egaliza","egalizaserati":"egaliza","egalizasesi":"egaliza","egalizasi":"egaliza","egalizat":"egaliza","egalizata":["egalizată","egalizat","egalizata","egalizat"],"egalizate":"egalizat","egalizatele":"egalizat","egalizati":["egalizați","egaliza","egalizați","egalizat"],"egalizatii":"egalizat","egalizatori":"egalizator","egalizatorile":"egalizator","egalizatorilor":"egalizator","egalizatorul":"egalizator","egalizatorule":"egalizator","egalizatorului":"egalizator","egalizatul":"egalizat","egalizau":"egaliza"};
@@ -0,0 +1 @@
+export default {"egalizeaza":"egaliza","egalizez":"egaliza","egalizezi":"egaliza","egalizoare":"egalizor","egalizoarele":"egalizor","egalizoarelor":"egalizor","egalizorul":"egalizor","egalizorule":"egalizor","egalizorului":"egalizor","egalul":"egal","egalule":"egal","egalului":"egal","egeeana":["egeeană","egeean","egeeana","egeean"],"egeeanul":"egeean","egeene":"egeean","egeenele":"egeean","egeeni":"egeean","egeenii":"egeean","egeria":"egerie","egeriei":"egerie","egerii":"egerie","egeriile":"egerie","egeriilor":"egerie","eghemoni":"eghemon","eghemonii":"eghemon","eghemonilor":"eghemon","eghemonul":"eghemon","eghemonule":"eghemon","eghemonului":"eghemon","eghileti":"eghilet","eghiletii":"eghilet","eghiletilor":"eghilet","eghiletul":"eghilet","eghiletule":"eghilet","eghiletului":"eghilet","eghipteana":["eghipteană","eghiptean","eghipteana","eghiptean"],"eghipteanul":"eghiptean","eghiptene":"eghiptean","eghiptenele":"eghiptean","eghipteni":"eghiptean","eghiptenii":"eghiptean","eghiptica":["eghiptică","eghiptic","eghiptica","eghiptic"],"eghiptice":"eghiptic","eghipticele":"eghiptic","eghiptici":"eghiptic","eghipticii":"eghiptic","eghipticul":"eghiptic","egide":"egidă","egidei":"egidă","egidele":"egidă","egidelor":"egidă","egipetul":"Egipet","egipetule":"Egipet","egipetului":"Egipet","egipteana":["egipteană","egiptean","egipteana","egiptean"],"egipteance":"egipteancă","egipteancei":"egipteancă","egipteancele":"egipteancă","egipteancelor":"egipteancă","egipteanul":"egiptean","egipteanule":"egiptean","egipteanului":"egiptean","egiptence":"egipteancă","egiptene":["egiptene","egiptean","egiptene","egipteană"],"egipteneasca":["egiptenească","egiptenesc","egipteneasca","egiptenesc"],"egiptenei":"egipteană","egiptenele":["egiptenele","egiptean","egiptenele","egipteană"],"egiptenelor":"egipteană","egiptenescul":"egiptenesc","egiptenesti":"egiptenesc","egiptenestii":"egiptenesc","egiptenestile":"egiptenesc","egipteni":"egiptean","egiptenii":"egiptean","egiptenilor":"egiptean","egiptiaca":["egipțiacă","egipțiac","egipțiaca","egipțiac"],"egiptiace":"egipțiac","egiptiacele":"egipțiac","egiptiaci":"egipțiac","egiptiacii":"egipțiac","egiptiacul":"egipțiac","egiptiana":["egipțiană","egipțian","egipțiana","egipțian"],"egiptianul":"egipțian","egiptica":["egiptică","egiptic","egiptica","egiptic"],"egiptice":"egiptic","egipticele":"egiptic","egiptici":"egiptic","egipticii":"egiptic","egipticul":"egiptic","egiptiene":"egipțian","egiptienele":"egipțian","egiptieni":"egipțian","egiptienii":"egipțian","egiptologi":"egiptolog","egiptologia":"egiptologie","egiptologica":["egiptologică","egiptologic","egiptologica","egiptologic"],"egiptologice":"egiptologic","egiptologicele":"egiptologic","egiptologici":"egiptologic","egiptologicii":"egiptologic","egiptologicul":"egiptologic","egiptologiei":"egiptologie","egiptologii":["egiptologii","egiptolog","egiptologii","egiptologie"],"egiptologiile":"egiptologie","egiptologiilor":"egiptologie","egiptologilor":"egiptolog","egiptologul":"egiptolog","egiptologule":"egiptolog","egiptologului":"egiptolog","egiptul":"Egipt","egiptule":"Egipt","egiptului":"Egipt","eglantine":"eglantină","eglantinei":"eglantină","eglantinele":"eglantină","eglantinelor":"eglantină","eglendisitoare":"eglendisitor","eglendisitoarea":"eglendisitor","eglendisitoarele":"eglendisitor","eglendisitori":"eglendisitor","eglendisitorii":"eglendisitor","eglendisitorul":"eglendisitor","eglengeaua":"eglengea","eglengele":"eglengea","eglengelei":"eglengea","eglengelele":"eglengea","eglengelelor":"eglengea","egloge":"eglogă","eglogei":"eglogă","eglogele":"eglogă","eglogelor":"eglogă","egocentrica":["egocentrică","egocentric","egocentrica","egocentric"],"egocentrice":"egocentric","egocentricele":"egocentric","egocentrici":"egocentric","egocentricii":"egocentric","egocentricitatati":"egocentricitate","egocentricitatatii":"egocentricitate","egocentricitatatile":"egocentricitate","egocentricitatatilor":"egocentricitate","egocentricitatea":"egocentricitate","egocentricul":"egocentric","egocentrismul":"egocentrism","egocentrismule":"egocentrism","egocentrismului":"egocentrism","egoismul":"egoism","egoismule":"egoism","egoismului":"egoism","egoista":["egoistă","egoist","egoista","egoist"],"egoiste":"egoist","egoistele":"egoist","egoisti":"egoist","egoistica":["egoistică","egoistic","egoistica","egoistic"],"egoistice":"egoistic","egoisticele":"egoistic","egoistici":"egoistic","egoisticii":"egoistic","egoisticul":"egoistic","egoistii":"egoist","egoistul":"egoist","egolatra":["egolatră","egolatru","egolatra","egolatru"],"egolatre":"egolatru","egolatrele":"egolatru","egolatri":"egolatru","egolatria":"egolatrie","egolatriei":"egolatrie","egolatrii":["egolatrii","egolatrie","egolatrii","egolatru"],"egolatrul":"egolatru","egomismul":"egomism","egomismule":"egomism","egomismului":"egomism","egotismul":"egotism","egotismule":"egotism","egotismului":"egotism","egotista":["egotistă","egotist","egotista","egotist"],"egotiste":"egotist","egotistele":"egotist","egotisti":"egotist","egotistii":"egotist","egotistul":"egotist","egregia":"egregiu","egregie":"egregiu","egregii":"egregiu","egregiii":"egregiu","egregiile":"egregiu","egregiul":"egregiu","egrenai":"egrena","egrenam":["egrenăm","egrena","egrenam","egrena"],"egrenand":"egrena","egrenara":"egrena","egrenaram":"egrena","egrenarati":"egrena","egrenase":"egrena","egrenasem":"egrena","egrenasera":"egrena","egrenaseram":"egrena","egrenaserati":"egrena","egrenasesi":"egrena","egrenasi":"egrena","egrenat":"egrena","egrenati":"egrena","egrenau":"egrena","egreneaza":"egrena","egrenez":"egrena","egrenezi":"egrena","egresiunea":"egresiune","egresiuni":"egresiune","egresiunii":"egresiune","egresiunile":"egresiune","egresiunilor":"egresiune","egrete":"egretă","egrete mari":"egretă mare","egrete mici":"egretă mică","egretei":"egretă","egretele":"egretă","egretelor":"egretă","egritudinea":"egritudine","egritudini":"egritudine","egritudinii":"egritudine","egritudinile":"egritudine","egritudinilor":"egritudine","egumene":"egumenă","egumeneasca":["egumenească","egumenesc","egumeneasca","egumenesc"],"egumenei":"egumenă","egumenele":"egumenă","egumenelor":"egumenă","egumenescul":"egumenesc","egumenese":"egumeneasă","egumenesei":"egumeneasă","egumenesele":"egumeneasă","egumeneselor":"egumeneasă","egumenesti":"egumenesc","egumenestii":"egumenesc","egumenestile":"egumenesc","egumeni":"egumen","egumenia":"egumenie","egumeniei":"egumenie","egumenii":["egumenii","egumen","egumenii","egumenie"],"egumenilor":"egumen","egumenite":"egumeniță","egumenitei":"egumeniță","egumenitele":"egumeniță","egumenitelor":"egumeniță","egumenul":"egumen","egumenule":"egumen","egumenului":"egumen","egutaje":"egutaj","egutajele":"egutaj","egutajelor":"egutaj","egutajul":"egutaj","egutajule":"egutaj","egutajului":"egutaj","eguul":"egu","eguule":"egu","eguului":"egu","eguuri":"egu","eguurile":"egu","eguurilor":"egu","ehli-islami":"ehli-islam","ehli-islamii":"ehli-islam","ehli-islamilor":"ehli-islam","ehli-islamul":"ehli-islam","ehli-islamule":"ehli-islam","ehli-islamului":"ehli-islam","ehlierza":["ehlierză","ehlierz","ehlierza","ehlierz"],"ehlierze":"ehlierz","ehlierzele":"ehlierz","ehlierzi":"ehlierz","ehlierzii":"ehlierz","ehlierzul":"ehlierz","ehoul":"eho","ehoule":"eho","ehoului":"eho","ehouri":"eho","ehourile":"eho","ehourilor":"eho","ei":["ei","brizanță","ei","buluceală","ei","ea","ei","echistică","ei","ecrazită","ei","el","ei","electronopunctură","ei","elinică","ei","feculență","ei","hămeseală","ei","hipoazotidă","ei","lânărică","ei","levizită","ei","litispendență","ei","lombosciatică","ei","naftă","ei","nebeligeranță","ei","olandă","ei","râcă","ei","răcușcă","ei","rușală","ei","tifoză","ei","toreutică","ei","ușcheală","ei","zacherlină","ei","zavescă"],"eialete":"eialet","eialetul":"eialet","eialetule":"eialet","eialetului":"eialet","eideri":"eider","eiderii":"eider","eiderilor":"eider","eiderul":"eider","eiderule":"eider","eiderului":"eider","eidetica":["eidetică","eidetic","eidetica","eidetic"],"eidetice":"eidetic","eideticele":"eidetic","eidetici":"eidetic","eideticii":"eidetic","eideticul":"eidetic","eidetisme":"eidetism","eidetismele":"eidetism","eidetismelor":"eidetism","eidetismul":"eidetism","eidetismule":"eidetism","eidetismului":"eidetism","eifeliana":["eifeliană","eifelian","eifeliana","eifelian"],"eifeliani":"eifelian","eifelianile":"eifelian","eifelianilor":"eifelian","eifelianul":"eifelian","eifelianule":"eifelian","eifelianului":"eifelian","eifeliene":"eifelian","eifelienele":"eifelian","eifelieni":"eifelian","eifelienii":"eifelian","einsteiniul":"einsteiniu","einsteiniule":"einsteiniu","einsteiniului":"einsteiniu","ejaculai":"ejacula","ejaculam":["ejaculăm","ejacula","ejaculam","ejacula"],"ejaculand":"ejacula","ejaculara":"ejacula","ejacularam":"ejacula","ejacularati":"ejacula","ejacularea":"ejaculare","ejaculari":"ejaculare","ejacularii":"ejaculare","ejacularile":"ejaculare","ejacularilor":"ejaculare","ejaculase":"ejacula","ejaculasem":"ejacula","ejaculasera":"ejacula","ejaculaseram":"ejacula","ejaculaserati":"ejacula","ejaculasesi":"ejacula","ejaculasi":"ejacula","ejaculat":"ejacula","ejaculati":"ejacula","ejaculatia":"ejaculație","ejaculatiei":"ejaculație","ejaculatii":"ejaculație","ejaculatiile":"ejaculație","ejaculatiilor":"ejaculație","ejaculatiunea":"ejaculațiune","ejaculatiuni":"ejaculațiune","ejaculatiunii":"ejaculațiune","ejaculatiunile":"ejaculațiune","ejaculatiunilor":"ejaculațiune","ejaculatoare":"ejaculator","ejaculatoarea":"ejaculator","ejaculatoarele":"ejaculator","ejaculatori":"ejaculator","ejaculatorii":"ejaculator","ejaculatorul":"ejaculator","ejaculatul":"ejaculat","ejaculatule":"ejaculat","ejaculatului":"ejaculat","ejaculaturi":"ejaculat","ejaculaturile":"ejaculat","ejaculaturilor":"ejaculat","ejaculau":"ejacula","ejaculeaza":"ejacula","ejaculez":"ejacula","ejaculezi":"ejacula","ejaculind":"ejaculând","ejectabila":["ejectabilă","ejectabil","ejectabila","ejectabil"],"ejectabile":"ejectabil","ejectabilele":"ejectabil","ejectabili":"ejectabil","ejectabilii":"ejectabil","ejectabilul":"ejectabil","ejectai":"ejecta","ejectam":["ejectăm","ejecta","ejectam","ejecta"],"ejectand":"ejecta","ejectara":"ejecta","ejectaram":"ejecta","ejectarati":"ejecta","ejectarea":"ejectare","ejectari":"ejectare","ejectarii":"ejectare","ejectarile":"ejectare","ejectarilor":"ejectare","ejectase":"ejecta","ejectasem":"ejecta","ejectasera":"ejecta","ejectaseram":"ejecta","ejectaserati":"ejecta","ejectasesi":"ejecta","ejectasi":"ejecta","ejectat":"ejecta","ejectata":["ejectată","ejectat","ejectata","ejectat"],"ejectate":"ejectat","ejectatele":"ejectat","ejectati":["ejectați","ejecta","ejectați","ejectat"],"ejectatii":"ejectat","ejectatul":"ejectat","ejectau":"ejecta","ejecteaza":"ejecta","ejectez":"ejecta","ejectezi":"ejecta","ejectia":"ejecție","ejectiei":"ejecție","ejectii":"ejecție","ejectiile":"ejecție","ejectiilor":"ejecție","ejectiunea":"ejecțiune","ejectiuni":"ejecțiune","ejectiunii":"ejecțiune","ejectiunile":"ejecțiune","ejectiunilor":"ejecțiune","ejectoare":"ejector","ejectoarele":"ejector","ejectoarelor":"ejector","ejectorul":"ejector","ejectorule":"ejector","ejectorului":"ejector","elaborai":"elabora","elaboram":["elaborăm","elabora","elaboram","elabora"],"elaborand":"elabora","elaborara":"elabora","elaboraram":"elabora","elaborarati":"elabora","elaborarea":"elaborare","elaborari":"elaborare","elaborarii":"elaborare","elaborarile":"elaborare","elaborarilor":"elaborare","elaborase":"elabora","elaborasem":"elabora","elaborasera":"elabora","elaboraseram":"elabora","elaboraserati":"elabora","elaborasesi":"elabora","elaborasi":"elabora","elaborat":"elabora","elaborati":"elabora","elaboratia":"elaborație","elaboratiei":"elaborație","elaboratii":"elaborație","elaboratiile":"elaborație","elaboratiilor":"elaborație","elaborau":"elabora","elaboreaza":"elabora","elaborez":"elabora","elaborezi":"elabora","elagaje":"elagaj","elagajele":"elagaj","elagajelor":"elagaj","elagajul":"elagaj","elagajule":"elagaj","elagajului":"elagaj","elamite":"elamită","elamitei":"elamită","elamitele":"elamită","elamitelor":"elamită","elamiti":"elamit","elamitii":"elamit","elamitilor":"elamit","elamitul":"elamit","elamitule":"elamit","elamitului":"elamit","elani":"elan","elanii":"elan","elanilor":"elan","elansai":"elansa","elansam":["elansăm","elansa","elansam","elansa"],"elansand":"elansa","elansara":"elansa","elansaram":"elansa","elansarati":"elansa","elansase":"elansa","elansasem":"elansa","elansasera":"elansa","elansaseram":"elansa","elansaserati":"elansa","elansasesi":"elansa","elansasi":"elansa","elansat":"elansa","elansata":["elansată","elansat","elansata","elansat"],"elansate":"elansat","elansatele":"elansat","elansati":["elansați","elansa","elansați","elansat"],"elansatii":"elansat","elansatul":"elansat","elansau":"elansa","elanseaza":"elansa","elansez":"elansa","elansezi":"elansa","elanul":"elan","elanule":"elan","elanului":"elan","elanuri":"elan","elanurile":"elan","elanurilor":"elan","elastica":["elastică","elastic","elastica","elastic"],"elastice":"elastic","elasticeasca":["elasticească","elasticesc","elasticeasca","elasticesc"],"elasticele":"elastic","elasticescul":"elasticesc","elasticesti":"elasticesc","elasticestii":"elasticesc","elasticestile":"elasticesc","elastici":"elastic","elasticii":"elastic","elasticitatea":"elasticitate","elasticitati":"elasticitate","elasticitatii":"elasticitate","elasticul":"elastic","elastine":"elastină","elastinei":"elastină","elastinele":"elastină","elastinelor":"elastină","elastomecanice":"elastomecanică","elastomecanicei":"elastomecanică","elastomeri":"elastomer","elastomerii":"elastomer","elastomerilor":"elastomer","elastomerul":"elastomer","elastomerule":"elastomer","elastomerului":"elastomer","elateride":"elaterid","elateridele":"elaterid","elateridelor":"elaterid","elateridul":"elaterid","elateridule":"elaterid","elateridului":"elaterid","elaterii":"elateriu","elateriile":"elateriu","elateriilor":"elateriu","elaterime":"elaterimă","elaterimei":"elaterimă","elaterimele":"elaterimă","elaterimelor":"elaterimă","elateriuul":"elateriu","elateriuule":"elateriu","elateriuului":"elateriu","elbe":"Elba","elbei":"Elba","elchegii":"elchegiu","elchegiii":"elchegiu","elchegiilor":"elchegiu","elchegiuul":"elchegiu","elchegiuule":"elchegiu","elchegiuului":"elchegiu","elcii":"elciu","elciii":"elciu","elciilor":"elciu","elciuul":"elciu","elciuule":"elciu","elciuului":"elciu","ele":"ea","eleati":"eleat","eleatica":["eleatică","eleatic","eleatica","eleatic"],"eleatice":"eleatic","eleaticele":"eleatic","eleatici":"eleatic","eleaticii":"eleatic","eleaticul":"eleatic","eleatii":"eleat","eleatilor":"eleat","eleatismul":"eleatism","eleatismule":"eleatism","eleatismului":"eleatism","eleatul":"eleat","eleatule":"eleat","eleatului":"eleat","elebori":"elebor","eleborii":"elebor","eleborilor":"elebor","eleborul":"elebor","eleborule":"elebor","eleborului":"elebor","electie":"elecțiune","electii":"elecție","electiunea":"elecțiune","electiuni":"elecțiune","electiunii":"elecțiune","electiunile":"elecțiune","electiunilor":"elecțiune","electiva":["electivă","electiv","electiva","electiv"],"elective":"electiv","electivele":"electiv","electivi":"electiv","electivii":"electiv","electivitatea":"electivitate","electivitati":"electivitate","electivitatii":"electivitate","electivitatile":"electivitate","electivitatilor":"electivitate","electivul":"electiv","electoarea":"electoare","electoarei":"electoare","electoarele":"electoare","electoarelor":"electoare","electorala":["electorală","electoral","electorala","electoral"],"electorale":"electoral","electoralele":"electoral","electorali":"electoral","electoralii":"electoral","electoralul":"electoral","electorate":"electorat","electoratele":"electorat","electoratelor":"electorat","electoratul":"electorat","electoratule":"electorat","electoratului":"electorat","electori":"elector","electorii":"elector","electorilor":"elector","electorimea":"electorime","electorimi":"electorime","electorimii":"electorime","electorimile":"electorime","electorimilor":"electorime","electorul":"elector","electorule":"elector","electorului":"elector","electreti":"electret","electretii":"electret","electretilor":"electret","electretul":"electret","electretule":"electret","electretului":"electret","electrica":["electrică","electric","electrica","electric"],"electrice":"electric","electriceasca":["electricească","electricesc","electriceasca","electricesc"],"electricele":"electric","electricescul":"electricesc","electricesti":"electricesc","electricestii":"electricesc","electricestile":"electricesc","electrici":"electric","electricianul":"electrician","electricianule":"electrician","electricianului":"electrician","electriciene":"electriciană","electricienei":"electriciană","electricienele":"electriciană","electricienelor":"electriciană","electricieni":"electrician","electricienii":"electrician","electricienilor":"electrician","electricii":"electric","electricitatea":"electricitate","electricitati":"electricitate","electricitatii":"electricitate","electricul":"electric","electrific":"electrifica","electrificai":"electrifica","electrificam":["electrificăm","electrifica","electrificam","electrifica"],"electrificand":"electrifica","electrificara":"electrifica","electrificaram":"electrifica","electrificarati":"electrifica","electrificarea":"electrificare","electrificari":"electrificare","electrificarii":"electrificare","electrificarile":"electrificare","electrificarilor":"electrificare","electrificase":"electrifica","electrificasem":"electrifica","electrificasera":"electrifica","electrificaseram":"electrifica","electrificaserati":"electrifica","electrificasesi":"electrifica","electrificasi":"electrifica","electrificat":"electrifica","electrificata":["electrificată","electrificat","electrificata","electrificat"],"electrificate":"electrificat","electrificatele":"electrificat","electrificati":["electrificați","electrifica","electrificați","electrificat"],"electrificatii":"electrificat","electrificatul":"electrificat","electrificau":"electrifica","electrifice":"electrifica","electrifici":"electrifica","electrismul":"electrism","electrismule":"electrism","electrismului":"electrism","electrisul":"electriș","electrisule":"electriș","electrisului":"electriș","electrizabila":["electrizabilă","electrizabil","electrizabila","electrizabil"],"electrizabile":"electrizabil","electrizabilele":"electrizabil","electrizabili":"electrizabil","electrizabilii":"electrizabil","electrizabilul":"electrizabil","electrizai":"electriza","electrizam":["electrizăm","electriza","electrizam","electriza"],"electrizand":"electriza","electrizanta":["electrizantă","electrizant","electrizanta","electrizant"],"electrizante":"electrizant","electrizantele":"electrizant","electrizanti":"electrizant","electrizantii":"electrizant","electrizantul":"electrizant","electrizara":"electriza","electrizaram":"electriza","electrizarati":"electriza","electrizarea":"electrizare","electrizari":"electrizare","electrizarii":"electrizare","electrizarile":"electrizare","electrizarilor":"electrizare","electrizase":"electriza","electrizasem":"electriza","electrizasera":"electriza","electrizaseram":"electriza","electrizaserati":"electriza","electrizasesi":"electriza","electrizasi":"electriza","electrizat":"electriza","electrizata":["electrizată","electrizat","electrizata","electrizat"],"electrizate":"electrizat","electrizatele":"electrizat","electrizati":["electrizați","electriza","electrizați","electrizat"],"electrizatia":"electrizație","electrizatiei":"electrizație","electrizatii":["electrizații","electrizat","electrizații","electrizație"],"electrizatiile":"electrizație","electrizatiilor":"electrizație","electrizatoare":"electrizator","electrizatoarea":"electrizator","electrizatoarele":"electrizator","electrizatori":"electrizator","electrizatorii":"electrizator","electrizatorul":"electrizator","electrizatul":"electrizat","electrizau":"electriza","electrizeaza":"electriza","electrizez":"electriza","electrizezi":"electriza","electroacupuncture":"electroacupunctură","electroacupuncturei":"electroacupunctură","electroacustica":["electroacustică","electroacustic","electroacustica","electroacustic"],"electroacustice":"electroacustic","electroacusticele":"electroacustic","electroacustici":["electroacustici","electroacustic","electroacustici","electroacustică"],"electroacusticii":["electroacusticii","electroacustic","electroacusticii","electroacustică"],"electroacusticile":"electroacustică","electroacusticilor":"electroacustică","electroacusticul":"electroacustic","electroanalize":"electroanaliză","electroanalizei":"electroanaliză","electroanalizele":"electroanaliză","electroanalizelor":"electroanaliză","electroanestezia":"electroanestezie","electroanesteziei":"electroanestezie","electroanestezii":"electroanestezie","electroanesteziile":"electroanestezie","electroanesteziilor":"electroanestezie","electrobiologia":"electrobiologie","electrobiologica":["electrobiologică","electrobiologic","electrobiologica","electrobiologic"],"electrobiologice":"electrobiologic","electrobiologicele":"electrobiologic","electrobiologici":"electrobiologic","electrobiologicii":"electrobiologic","electrobiologicul":"electrobiologic","electrobiologiei":"electrobiologie","electrobiologii":"electrobiologie","electrobiologiile":"electrobiologie","electrobiologiilor":"electrobiologie","electrobuze":"electrobuz","electrobuzele":"electrobuz","electrobuzelor":"electrobuz","electrobuzul":"electrobuz","electrobuzule":"electrobuz","electrobuzului":"electrobuz","electrocaldure":"electrocăldură","electrocaldurei":"electrocăldură","electrocalorimetre":"electrocalorimetru","electrocalorimetrele":"electrocalorimetru","electrocalorimetrelor":"electrocalorimetru","electrocalorimetruul":"electrocalorimetru","electrocalorimetruule":"electrocalorimetru","electrocalorimetruului":"electrocalorimetru","electrocapilara":["electrocapilară","electrocapilar","electrocapilara","electrocapilar"],"electrocapilare":"electrocapilar","electrocapilarele":"electrocapilar","electrocapilari":"electrocapilar","electrocapilarii":"electrocapilar","electrocapilaritatea":"electrocapilaritate","electrocapilaritati":"electrocapilaritate","electrocapilaritatii":"electrocapilaritate","electrocapilaritatile":"electrocapilaritate","electrocapilaritatilor":"electrocapilaritate","electrocapilarul":"electrocapilar","electrocardiografe":"electrocardiograf","electrocardiografele":"electrocardiograf","electrocardiografelor":"electrocardiograf","electrocardiografia":"electrocardiografie","electrocardiografica":["electrocardiografică","electrocardiografic","electrocardiografica","electrocardiografic"],"electrocardiografice":"electrocardiografic","electrocardiograficele":"electrocardiografic","electrocardiografici":"electrocardiografic","electrocardiograficii":"electrocardiografic","electrocardiograficul":"electrocardiografic","electrocardiografiei":"electrocardiografie","electrocardiografii":"electrocardiografie","electrocardiograful":"electrocardiograf","electrocardiografule":"electrocardiograf","electrocardiografului":"electrocardiograf","electrocardiograme":"electrocardiogramă","electrocardiogramei":"electrocardiogramă","electrocardiogramele":"electrocardiogramă","electrocardiogramelor":"electrocardiogramă","electrocardioscoape":"electrocardioscop","electrocardioscoapele":"electrocardioscop","electrocardioscoapelor":"electrocardioscop","electrocardioscopia":"electrocardioscopie","electrocardioscopiei":"electrocardioscopie","electrocardioscopii":"electrocardioscopie","electrocardioscopiile":"electrocardioscopie","electrocardioscopiilor":"electrocardioscopie","electrocardioscopul":"electrocardioscop","electrocardioscopule":"electrocardioscop","electrocardioscopului":"electrocardioscop","electrocasnica":["electrocasnică","electrocasnic","electrocasnica","electrocasnic"],"electrocasnice":"electrocasnic","electrocasnicele":"electrocasnic","electrocasnici":"electrocasnic","electrocasnicii":"electrocasnic","electrocasnicul":"electrocasnic","electrocautere":"electrocauter","electrocauterele":"electrocauter","electrocauterelor":"electrocauter","electrocauterizai":"electrocauteriza","electrocauterizam":["electrocauterizăm","electrocauteriza","electrocauterizam","electrocauteriza"],"electrocauterizand":"electrocauteriza","electrocauterizara":"electrocauteriza","electrocauterizaram":"electrocauteriza","electrocauterizarati":"electrocauteriza","electrocauterizarea":"electrocauterizare","electrocauterizari":"electrocauterizare","electrocauterizarii":"electrocauterizare","electrocauterizarile":"electrocauterizare","electrocauterizarilor":"electrocauterizare","electrocauterizase":"electrocauteriza","electrocauterizasem":"electrocauteriza","electrocauterizasera":"electrocauteriza","electrocauterizaseram":"electrocauteriza","electrocauterizaserati":"electrocauteriza","electrocauterizasesi":"electrocauteriza","electrocauterizasi":"electrocauteriza","electrocauterizat":"electrocauteriza","electrocauterizata":["electrocauterizată","electrocauterizat","electrocauterizata","electrocauterizat"],"electrocauterizate":"electrocauterizat","electrocauterizatele":"electrocauterizat","electrocauterizati":["electrocauterizați","electrocauteriza","electrocauterizați","electrocauterizat"],"electrocauterizatii":"electrocauterizat","electrocauterizatul":"electrocauterizat","electrocauterizau":"electrocauteriza","electrocauterizeaza":"electrocauteriza","electrocauterizez":"electrocauteriza","electrocauterizezi":"electrocauteriza","electrocauterul":"electrocauter","electrocauterule":"electrocauter","electrocauterului":"electrocauter","electroceramice":"electroceramică","electroceramicei":"electroceramică","electrochimia":"electrochimie","electrochimica":["electrochimică","electrochimic","electrochimica","electrochimic"],"electrochimice":"electrochimic","electrochimicele":"electrochimic","electrochimici":"electrochimic","electrochimicii":"electrochimic","electrochimicul":"electrochimic","electrochimiei":"electrochimie","electrochimii":"electrochimie","electrochimografe":"electrochimograf","electrochimografele":"electrochimograf","electrochimografelor":"electrochimograf","electrochimograful":"electrochimograf","electrochimografule":"electrochimograf","electrochimografului":"electrochimograf","electrochimograme":"electrochimogramă","electrochimogramei":"electrochimogramă","electrochimogramele":"electrochimogramă","electrochimogramelor":"electrochimogramă","electrochirurgia":"electrochirurgie","electrochirurgiei":"electrochirurgie","electrochirurgii":"electrochirurgie","electrocinetica":["electrocinetică","electrocinetic","electrocinetica","electrocinetic"],"electrocinetice":"electrocinetic","electrocineticele":"electrocinetic","electrocinetici":["electrocinetici","electrocinetic","electrocinetici","electrocinetică"],"electrocineticii":["electrocineticii","electrocinetic","electrocineticii","electrocinetică"],"electrocineticile":"electrocinetică","electrocineticilor":"electrocinetică","electrocineticul":"electrocinetic","electrocoagulai":"electrocoagula","electrocoagulam":["electrocoagulăm","electrocoagula","electrocoagulam","electrocoagula"],"electrocoaguland":"electrocoagula","electrocoagulara":"electrocoagula","electrocoagularam":"electrocoagula","electrocoagularati":"electrocoagula","electrocoagularea":"electrocoagulare","electrocoagulari":"electrocoagulare","electrocoagularii":"electrocoagulare","electrocoagularile":"electrocoagulare","electrocoagularilor":"electrocoagulare","electrocoagulase":"electrocoagula","electrocoagulasem":"electrocoagula","electrocoagulasera":"electrocoagula","electrocoagulaseram":"electrocoagula","electrocoagulaserati":"electrocoagula","electrocoagulasesi":"electrocoagula","electrocoagulasi":"electrocoagula","electrocoagulat":"electrocoagula","electrocoagulata":["electrocoagulată","electrocoagulat","electrocoagulata","electrocoagulat"],"electrocoagulate":"electrocoagulat","electrocoagulatele":"electrocoagulat","electrocoagulati":["electrocoagulați","electrocoagula","electrocoagulați","electrocoagulat"],"electrocoagulatii":"electrocoagulat","electrocoagulatul":"electrocoagulat","electrocoagulau":"electrocoagula","electrocoaguleaza":"electrocoagula","electrocoagulez":"electrocoagula","electrocoagulezi":"electrocoagula","electrocomunicatia":"electrocomunicație","electrocomunicatiei":"electrocomunicație","electrocomunicatii":"electrocomunicație","electrocomunicatiile":"electrocomunicație","electrocomunicatiilor":"electrocomunicație","electroconductibilitatea":"electroconductibilitate","electroconductibilitati":"electroconductibilitate","electroconductibilitatii":"electroconductibilitate","electrocorticografia":"electrocorticografie","electrocorticografiei":"electrocorticografie","electrocorticografii":"electrocorticografie","electrocorticograme":"electrocorticogramă","electrocorticogramei":"electrocorticogramă","electrocorticogramele":"electrocorticogramă","electrocorticogramelor":"electrocorticogramă","electroculture":"electrocultură","electroculturei":"electrocultură","electrocutai":"electrocuta","electrocutam":["electrocutăm","electrocuta","electrocutam","electrocuta"],"electrocutand":"electrocuta","electrocutara":"electrocuta","electrocutaram":"electrocuta","electrocutarati":"electrocuta","electrocutarea":"electrocutare","electrocutari":"electrocutare","electrocutarii":"electrocutare","electrocutarile":"electrocutare","electrocutarilor":"electrocutare","electrocutase":"electrocuta","electrocutasem":"electrocuta","electrocutasera":"electrocuta","electrocutaseram":"electrocuta","electrocutaserati":"electrocuta","electrocutasesi":"electrocuta","electrocutasi":"electrocuta","electrocutat":"electrocuta","electrocutata":["electrocutată","electrocutat","electrocutata","electrocutat"],"electrocutate":"electrocutat","electrocutatele":"electrocutat","electrocutati":["electrocutați","electrocuta","electrocutați","electrocutat"],"electrocutatii":"electrocutat","electrocutatul":"electrocutat","electrocutau":"electrocuta","electrocuteaza":"electrocuta","electrocutez":"electrocuta","electrocutezi":"electrocuta","electrocutiunea":"electrocuțiune","electrocutiuni":"electrocuțiune","electrocutiunii":"electrocuțiune","electrocutiunile":"electrocuțiune","electrocutiunilor":"electrocuțiune","electrodiagnostice":"electrodiagnostic","electrodiagnosticele":"electrodiagnostic","electrodiagnosticelor":"electrodiagnostic","electrodiagnosticul":"electrodiagnostic","electrodiagnosticule":"electrodiagnostic","electrodiagnosticului":"electrodiagnostic","electrodiagnoze":"electrodiagnoză","electrodiagnozei":"electrodiagnoză","electrodiagnozele":"electrodiagnoză","electrodiagnozelor":"electrodiagnoză","electrodialize":"electrodializă","electrodializei":"electrodializă","electrodializele":"electrodializă","electrodializelor":"electrodializă","electrodinamica":["electrodinamică","electrodinamic","electrodinamica","electrodinamic"],"electrodinamice":"electrodinamic","electrodinamicele":"electrodinamic","electrodinamici":["electrodinamici","electrodinamic","electrodinamici","electrodinamică"],"electrodinamicii":["electrodinamicii","electrodinamic","electrodinamicii","electrodinamică"],"electrodinamicile":"electrodinamică","electrodinamicilor":"electrodinamică","electrodinamicul":"electrodinamic","electrodinamismul":"electrodinamism","electrodinamismule":"electrodinamism","electrodinamismului":"electrodinamism","electrodinamometre":"electrodinamometru","electrodinamometrele":"electrodinamometru","electrodinamometrelor":"electrodinamometru","electrodinamometruul":"electrodinamometru","electrodinamometruule":"electrodinamometru","electrodinamometruului":"electrodinamometru","electrodul":"electrod","electrodule":"electrod","electrodului":"electrod","electroencefalografe":"electroencefalograf","electroencefalografele":"electroencefalograf","electroencefalografelor":"electroencefalograf","electroencefalografia":"electroencefalografie","electroencefalografiei":"electroencefalografie","electroencefalografii":"electroencefalografie","electroencefalografiile":"electroencefalografie","electroencefalografiilor":"electroencefalografie","electroencefalograful":"electroencefalograf","electroencefalografule":"electroencefalograf","electroencefalografului":"electroencefalograf","electroencefalograme":"electroencefalogramă","electroencefalogramei":"electroencefalogramă","electroencefalogramele":"electroencefalogramă","electroencefalogramelor":"electroencefalogramă","electroenergetica":["electroenergetică","electroenergetic","electroenergetica","electroenergetic"],"electroenergetice":"electroenergetic","electroenergeticele":"electroenergetic","electroenergetici":"electroenergetic","electroenergeticii":"electroenergetic","electroenergeticul":"electroenergetic","electroeroziunea":"electroeroziune","electroeroziuni":"electroeroziune","electroeroziunii":"electroeroziune","electroeroziunile":"electroeroziune","electroeroziunilor":"electroeroziune","electrofiltre":"electrofiltru","electrofiltrele":"electrofiltru","electrofiltrelor":"electrofiltru","electrofiltrul":"electrofiltru","electrofiltrule":"electrofiltru","electrofiltrului":"electrofiltru","electrofiziologia":"electrofiziologie","electrofiziologiei":"electrofiziologie","electrofiziologii":"electrofiziologie","electrofiziologiile":"electrofiziologie","electrofiziologiilor":"electrofiziologie","electrofoare":"electrofor","electrofoarele":"electrofor","electrofoarelor":"electrofor","electrofoni":"electrofon","electrofonile":"electrofon","electrofonilor":"electrofon","electrofonul":"electrofon","electrofonule":"electrofon","electrofonului":"electrofon","electroforegrame":"electroforegramă","electroforegramei":"electroforegramă","electroforegramele":"electroforegramă","electroforegramelor":"electroforegramă","electroforetica":["electroforetică","electroforetic","electroforetica","electroforetic"],"electroforetice":"electroforetic","electroforeticele":"electroforetic","electroforetici":"electroforetic","electroforeticii":"electroforetic","electroforeticul":"electroforetic","electroforeze":"electroforeză","electroforezei":"electroforeză","electroforezele":"electroforeză","electroforezelor":"electroforeză","electroforul":"electrofor","electroforule":"electrofor","electroforului":"electrofor","electrofotografia":"electrofotografie","electrofotografiei":"electrofotografie","electrofotografii":"electrofotografie","electrofotografiile":"electrofotografie","electrofotografiilor":"electrofotografie","electrogalvanica":["electrogalvanică","electrogalvanic","electrogalvanica","electrogalvanic"],"electrogalvanice":"electrogalvanic","electrogalvaniceasca":["electrogalvanicească","electrogalvanicesc","electrogalvaniceasca","electrogalvanicesc"],"electrogalvanicele":"electrogalvanic","electrogalvanicescul":"electrogalvanicesc","electrogalvanicesti":"electrogalvanicesc","electrogalvanicestii":"electrogalvanicesc","electrogalvanicestile":"electrogalvanicesc","electrogalvanici":"electrogalvanic","electrogalvanicii":"electrogalvanic","electrogalvanicul":"electrogalvanic","electrogalvanismul":"electrogalvanism","electrogalvanismule":"electrogalvanism","electrogalvanismului":"electrogalvanism","electrogena":["electrogenă","electrogen","electrogena","electrogen"],"electrogene":"electrogen","electrogenele":"electrogen","electrogeni":"electrogen","electrogenii":"electrogen","electrogenul":"electrogen","electroglotografe":"electroglotograf","electroglotografele":"electroglotograf","electroglotografelor":"electroglotograf","electroglotograful":"electroglotograf","electroglotografule":"electroglotograf","electroglotografului":"electroglotograf","electroglotograme":"electroglotogramă","electroglotogramei":"electroglotogramă","electroglotogramele":"electroglotogramă","electroglotogramelor":"electroglotogramă","electroglotospectrografii":"electroglotospectrografie","electrografe":"electrograf","electrografele":"electrograf","electrografelor":"electrograf","electrografia":"electrografie","electrografiei":"electrografie","electrografii":"electrografie","electrografiile":"electrografie","electrografiilor":"electrografie","electrograful":"electrograf","electrografule":"electrograf","electrografului":"electrograf","electrogravimetria":"electrogravimetrie","electrogravimetriei":"electrogravimetrie","electrogravimetrii":"electrogravimetrie","electrogravure":"electrogravură","electrogravurei":"electrogravură","electrogravurele":"electrogravură","electrogravurelor":"electrogravură","electroizolanta":["electroizolantă","electroizolant","electroizolanta","electroizolant"],"electroizolante":"electroizolant","electroizolantele":"electroizolant","electroizolanti":"electroizolant","electroizolantii":"electroizolant","electroizolantul":"electroizolant","electroliti":"electrolit","electrolitica":["electrolitică","electrolitic","electrolitica","electrolitic"],"electrolitice":"electrolitic","electroliticele":"electrolitic","electrolitici":"electrolitic","electroliticii":"electrolitic","electroliticul":"electrolitic","electrolitii":"electrolit","electrolitilor":"electrolit","electrolitul":"electrolit","electrolitule":"electrolit","electrolitului":"electrolit","electrolizabila":["electrolizabilă","electrolizabil","electrolizabila","electrolizabil"],"electrolizabile":"electrolizabil","electrolizabilele":"electrolizabil","electrolizabili":"electrolizabil","electrolizabilii":"electrolizabil","electrolizabilul":"electrolizabil","electrolizai":"electroliza","electrolizam":["electrolizăm","electroliza","electrolizam","electroliza"],"electrolizand":"electroliza","electrolizara":"electroliza","electrolizaram":"electroliza","electrolizarati":"electroliza","electrolizase":"electroliza","electrolizasem":"electroliza","electrolizasera":"electroliza","electrolizaseram":"electroliza","electrolizaserati":"electroliza","electrolizasesi":"electroliza","electrolizasi":"electroliza","electrolizat":"electroliza","electrolizati":"electroliza","electrolizau":"electroliza","electrolize":"electroliză","electrolizeaza":"electroliza","electrolizei":"electroliză","electrolizele":"electroliză","electrolizelor":"electroliză","electrolizez":"electroliza","electrolizezi":"electroliza","electrolizoare":"electrolizor","electrolizoarele":"electrolizor","electrolizoarelor":"electrolizor","electrolizorul":"electrolizor","electrolizorule":"electrolizor","electrolizorului":"electrolizor","electroluminescenta":["electroluminescentă","electroluminescent","electroluminescenta","electroluminescent"],"electroluminescente":["electroluminescente","electroluminescent","electroluminescențe","electroluminescență"],"electroluminescentei":"electroluminescență","electroluminescentele":["electroluminescentele","electroluminescent","electroluminescențele","electroluminescență"],"electroluminescentelor":"electroluminescență","electroluminescenti":"electroluminescent","electroluminescentii":"electroluminescent","electroluminescentul":"electroluminescent","electroluminiscente":"electroluminiscență","electroluminiscentei":"electroluminiscență","electromagneti":"electromagnet","electromagnetica":["electromagnetică","electromagnetic","electromagnetica","electromagnetic"],"electromagnetice":"electromagnetic","electromagneticele":"electromagnetic","electromagnetici":"electromagnetic","electromagneticii":"electromagnetic","electromagneticul":"electromagnetic","electromagnetii":"electromagnet","electromagnetilor":"electromagnet","electromagnetismul":"electromagnetism","electromagnetismule":"electromagnetism","electromagnetismului":"electromagnetism","electromagnetul":"electromagnet","electromagnetule":"electromagnet","electromagnetului":"electromagnet","electromasaje":"electromasaj","electromasajele":"electromasaj","electromasajelor":"electromasaj","electromasajul":"electromasaj","electromasajule":"electromasaj","electromasajului":"electromasaj","electromecanica":["electromecanică","electromecanic","electromecanica","electromecanic"],"electromecanice":"electromecanic","electromecanicele":"electromecanic","electromecanici":["electromecanici","electromecanic","electromecanici","electromecanică"],"electromecanicii":["electromecanicii","electromecanic","electromecanicii","electromecanică"],"electromecanicile":"electromecanică","electromecanicilor":"electromecanică","electromecanicul":"electromecanic","electromenajera":["electromenajeră","electromenajer","electromenajera","electromenajer"],"electromenajere":"electromenajer","electromenajerele":"electromenajer","electromenajeri":"electromenajer","electromenajerii":"electromenajer","electromenajerul":"electromenajer","electrometalurgia":"electrometalurgie","electrometalurgica":["electrometalurgică","electrometalurgic","electrometalurgica","electrometalurgic"],"electrometalurgice":"electrometalurgic","electrometalurgicele":"electrometalurgic","electrometalurgici":"electrometalurgic","electrometalurgicii":"electrometalurgic","electrometalurgicul":"electrometalurgic","electrometalurgiei":"electrometalurgie","electrometalurgii":"electrometalurgie","electrometalurgisti":"electrometalurgist","electrometalurgistii":"electrometalurgist","electrometalurgistilor":"electrometalurgist","electrometalurgistul":"electrometalurgist","electrometalurgistule":"electrometalurgist","electrometalurgistului":"electrometalurgist","electrometre":"electrometru","electrometrele":"electrometru","electrometrelor":"electrometru","electrometria":"electrometrie","electrometrica":["electrometrică","electrometric","electrometrica","electrometric"],"electrometrice":"electrometric","electrometricele":"electrometric","electrometrici":"electrometric","electrometricii":"electrometric","electrometricul":"electrometric","electrometriei":"electrometrie","electrometrii":"electrometrie","electrometrul":"electrometru","electrometrule":"electrometru","electrometrului":"electrometru","electromicroscopia":"electromicroscopie","electromicroscopiei":"electromicroscopie","electromicroscopii":"electromicroscopie","electromicroscopiile":"electromicroscopie","electromicroscopiilor":"electromicroscopie","electromiografe":"electromiograf","electromiografele":"electromiograf","electromiografelor":"electromiograf","electromiografia":"electromiografie","electromiografiei":"electromiografie","electromiografii":"electromiografie","electromiograful":"electromiograf","electromiografule":"electromiograf","electromiografului":"electromiograf","electromiograme":"electromiogramă","electromiogramei":"electromiogramă","electromiogramele":"electromiogramă","electromiogramelor":"electromiogramă","electromobile":"electromobil","electromobilele":"electromobil","electromobilelor":"electromobil","electromobilul":"electromobil","electromobilule":"electromobil","electromobilului":"electromobil","electromotori":"electromotor","electromotorile":"electromotor","electromotorilor":"electromotor","electromotorul":"electromotor","electromotorule":"electromotor","electromotorului":"electromotor","electromusculara":["electromusculară","electromuscular","electromusculara","electromuscular"],"electromusculare":"electromuscular","electromuscularele":"electromuscular","electromusculari":"electromuscular","electromuscularii":"electromuscular","electromuscularul":"electromuscular","electron-volti":"electron-volt","electron-voltii":"electron-volt","electron-voltilor":"electron-volt","electron-voltul":"electron-volt","electron-voltule":"electron-volt","electron-voltului":"electron-volt","electronarcoze":"electronarcoză","electronarcozei":"electronarcoză","electronarcozele":"electronarcoză","electronarcozelor":"electronarcoză","electronegativa":["electronegativă","electronegativ","electronegativa","electronegativ"],"electronegative":"electronegativ","electronegativele":"electronegativ","electronegativi":"electronegativ","electronegativii":"electronegativ","electronegativitatea":"electronegativitate","electronegativitati":"electronegativitate","electronegativitatii":"electronegativitate","electronegativitatile":"electronegativitate","electronegativitatilor":"electronegativitate","electronegativul":"electronegativ","electroneutralitatea":"electroneutralitate","electroneutralitati":"electroneutralitate","electroneutralitatii":"electroneutralitate","electroni":"electron","electronica":["electronică","electronic","electronica","electronic"],"electronice":"electronic","electronicele":"electronic","electronici":["electronici","electronic","electronici","electronică"],"electronicianul":"electronician","electronicianule":"electronician","electronicianului":"electronician","electronicieni":"electronician","electronicienii":"electronician","electronicienilor":"electronician","electronicii":["electronicii","electronic","electronicii","electronică"],"electronicile":"electronică","electronicilor":"electronică","electronicul":"electronic","electronii":"electron","electronilor":"electron","electroniste":"electronistă","electronistei":"electronistă","electronistele":"electronistă","electronistelor":"electronistă","electronisti":"electronist","electronistii":"electronist","electronistilor":"electronist","electronistul":"electronist","electronistule":"electronist","electronistului":"electronist","electronizai":"electroniza","electronizam":["electronizăm","electroniza","electronizam","electroniza"],"electronizand":"electroniza","electronizara":"electroniza","electronizaram":"electroniza","electronizarati":"electroniza","electronizarea":"electronizare","electronizari":"electronizare","electronizarii":"electronizare","electronizarile":"electronizare","electronizarilor":"electronizare","electronizase":"electroniza","electronizasem":"electroniza","electronizasera":"electroniza","electronizaseram":"electroniza","electronizaserati":"electroniza","electronizasesi":"electroniza","electronizasi":"electroniza","electronizat":"electroniza","electronizata":["electronizată","electronizat","electronizata","electronizat"],"electronizate":"electronizat","electronizatele":"electronizat","electronizati":["electronizați","electroniza","electronizați","electronizat"],"electronizatii":"electronizat","electronizatul":"electronizat","electronizau":"electroniza","electronizeaza":"electroniza","electronizez":"electroniza","electronizezi":"electroniza","electronografe":"electronograf","electronografele":"electronograf","electronografelor":"electronograf","electronografia":"electronografie","electronografica":["electronografică","electronografic","electronografica","electronografic"],"electronografice":"electronografic","electronograficele":"electronografic","electronografici":"electronografic","electronograficii":"electronografic","electronograficul":"electronografic","electronografiei":"electronografie","electronografii":"electronografie","electronografiile":"electronografie","electronografiilor":"electronografie","electronograful":"electronograf","electronografule":"electronograf","electronografului":"electronograf","electronul":"electron","electronule":"electron","electronului":"electron","electronvolti":"electronvolt","electronvoltii":"electronvolt","electronvoltilor":"electronvolt","electronvoltul":"electronvolt","electronvoltule":"electronvolt","electronvoltului":"electronvolt","electrooptice":"electrooptică","electroopticei":"electrooptică","electroopticele":"electrooptică","electroopticelor":"electrooptică","electroosmotica":["electroosmotică","electroosmotic","electroosmotica","electroosmotic"],"electroosmotice":"electroosmotic","electroosmoticele":"electroosmotic","electroosmotici":"electroosmotic","electroosmoticii":"electroosmotic","electroosmoticul":"electroosmotic","electroosmoze":"electroosmoză","electroosmozei":"electroosmoză","electroosmozele":"electroosmoză","electroosmozelor":"electroosmoză","electropatologia":"electropatologie","electropatologiei":"electropatologie","electropatologii":"electropatologie","electropatologiile":"electropatologie","electropatologiilor":"electropatologie","electroportelanul":"electroporțelan","electroportelanule":"electroporțelan","electroportelanului":"electroporțelan","electropozitiva":["electropozitivă","electropozitiv","electropozitiva","electropozitiv"],"electropozitive":"electropozitiv","electropozitivele":"electropozitiv","electropozitivi":"electropozitiv","electropozitivii":"electropozitiv","electropozitivitatea":"electropozitivitate","electropozitivitati":"electropozitivitate","electropozitivitatii":"electropozitivitate","electropozitivitatile":"electropozitivitate","electropozitivitatilor":"electropozitivitate","electropozitivul":"electropozitiv","electroprelucrarea":"electroprelucrare","electroprelucrari":"electroprelucrare","electroprelucrarii":"electroprelucrare","electropuncture":"electropunctură","electropuncturei":"electropunctură","electroradiologi":"electroradiolog","electroradiologia":"electroradiologie","electroradiologiei":"electroradiologie","electroradiologii":["electroradiologii","electroradiolog","electroradiologii","electroradiologie"],"electroradiologilor":"electroradiolog","electroradiologul":"electroradiolog","electroradiologule":"electroradiolog","electroradiologului":"electroradiolog","electroscoape":"electroscop","electroscoapele":"electroscop","electroscoapelor":"electroscop","electroscopia":"electroscopie","electroscopica":["electroscopică","electroscopic","electroscopica","electroscopic"],"electroscopice":"electroscopic","electroscopicele":"electroscopic","electroscopici":"electroscopic","electroscopicii":"electroscopic","electroscopicul":"electroscopic","electroscopiei":"electroscopie","electroscopii":"electroscopie","electroscopul":"electroscop","electroscopule":"electroscop","electroscopului":"electroscop","electrosecuritatea":"electrosecuritate","electrosecuritati":"electrosecuritate","electrosecuritatii":"electrosecuritate","electrosocul":"electroșoc","electrosocule":"electroșoc","electrosocului":"electroșoc","electrosocuri":"electroșoc","electrosocurile":"electroșoc","electrosocurilor":"electroșoc","electrosomnul":"electrosomn","electrosomnule":"electrosomn","electrosomnului":"electrosomn","electrostatica":["electrostatică","electrostatic","electrostatica","electrostatic"],"electrostatice":"electrostatic","electrostaticele":"electrostatic","electrostatici":["electrostatici","electrostatic","electrostatici","electrostatică"],"electrostaticii":["electrostaticii","electrostatic","electrostaticii","electrostatică"],"electrostaticile":"electrostatică","electrostaticilor":"electrostatică","electrostaticul":"electrostatic","electrostimularea":"electrostimulare","electrostimulari":"electrostimulare","electrostimularii":"electrostimulare","electrostrictiunea":"electrostricțiune","electrostrictiuni":"electrostricțiune","electrostrictiunii":"electrostricțiune","electrostrictiunile":"electrostricțiune","electrostrictiunilor":"electrostricțiune","electrotehni":"electrotehnic","electrotehnici":["electrotehnici","electrotehnic","electrotehnici","electrotehnică"],"electrotehniciana":["electrotehniciană","electrotehnician","electrotehniciana","electrotehnician"],"electrotehnicianul":"electrotehnician","electrotehnicianule":"electrotehnician","electrotehnicianului":"electrotehnician","electrotehniciene":"electrotehnician","electrotehnicienele":"electrotehnician","electrotehnicieni":"electrotehnician","electrotehnicienii":"electrotehnician","electrotehnicienilor":"electrotehnician","electrotehnicii":"electrotehnic","electrotehnicile":"electrotehnic","electrotehnicilor":"electrotehnic","electroterapeuta":["electroterapeută","electroterapeut","electroterapeuta","electroterapeut"],"electroterapeute":"electroterapeut","electroterapeutele":"electroterapeut","electroterapeuti":"electroterapeut","electroterapeutica":["electroterapeutică","electroterapeutic","electroterapeutica","electroterapeutic"],"electroterapeutice":"electroterapeutic","electroterapeuticele":"electroterapeutic","electroterapeutici":"electroterapeutic","electroterapeuticii":"electroterapeutic","electroterapeuticul":"electroterapeutic","electroterapeutii":"electroterapeut","electroterapeutul":"electroterapeut","electroterapia":"electroterapie","electroterapica":["electroterapică","electroterapic","electroterapica","electroterapic"],"electroterapice":"electroterapic","electroterapicele":"electroterapic","electroterapici":"electroterapic","electroterapicii":"electroterapic","electroterapicul":"electroterapic","electroterapiei":"electroterapie","electroterapii":"electroterapie","electrotermia":"electrotermie","electrotermica":["electrotermică","electrotermic","electrotermica","electrotermic"],"electrotermice":"electrotermic","electrotermicele":"electrotermic","electrotermici":"electrotermic","electrotermicii":"electrotermic","electrotermicul":"electrotermic","electrotermiei":"electrotermie","electrotermii":"electrotermie","electrotipia":"electrotipie","electrotipica":["electrotipică","electrotipic","electrotipica","electrotipic"],"electrotipice":"electrotipic","electrotipicele":"electrotipic","electrotipici":"electrotipic","electrotipicii":"electrotipic","electrotipicul":"electrotipic","electrotipiei":"electrotipie","electrotipii":"electrotipie","electrotomia":"electrotomie","electrotomiei":"electrotomie","electrotomii":"electrotomie","electrotomiile":"electrotomie","electrotomiilor":"electrotomie","electrotonica":["electrotonică","electrotonic","electrotonica","electrotonic"],"electrotonice":"electrotonic","electrotonicele":"electrotonic","electrotonici":"electrotonic","electrotonicii":"electrotonic","electrotonicul":"electrotonic","electrotonusul":"electrotonus","electrotonusule":"electrotonus","electrotonusului":"electrotonus","electrotonusuri":"electrotonus","electrotonusurile":"electrotonus","electrotonusurilor":"electrotonus","electrotraumatisme":"electrotraumatism","electrotraumatismele":"electrotraumatism","electrotraumatismelor":"electrotraumatism","electrotraumatismul":"electrotraumatism","electrotraumatismule":"electrotraumatism","electrotraumatismului":"electrotraumatism","electrotropismul":"electrotropism","electrotropismule":"electrotropism","electrotropismului":"electrotropism","electrovalente":"electrovalență","electrovalentei":"electrovalență","electrovalentele":"electrovalență","electrovalentelor":"electrovalență","electrovalve":"electrovalvă","electrovalvei":"electrovalvă","electrovalvele":"electrovalvă","electrovalvelor":"electrovalvă","electrozi":"electrod","electrozi de sticla":"electrod de sticlă","electrozii":"electrod","electrozilor":"electrod","electrumul":"electrum","electrumule":"electrum","electrumului":"electrum","electuare":"electuar","electuarele":"electuar","electuarelor":"electuar","electuarul":"electuar","electuarule":"electuar","electuarului":"electuar","eleemozina":"elemozină","elefanti":"elefant","elefanti africani":"elefant african","elefanti asiatici":"elefant asiatic","elefanti indiani":"elefant indian","elefantiazise":"elefantiazis","elefantiazisele":"elefantiazis","elefantiaziselor":"elefantiazis","elefantiazisul":"elefantiazis","elefantiazisule":"elefantiazis","elefantiazisului":"elefantiazis","elefantica":["elefantică","elefantic","elefantica","elefantic"],"elefantice":"elefantic","elefanticele":"elefantic","elefantici":"elefantic","elefanticii":"elefantic","elefanticul":"elefantic","elefantii":"elefant","elefantilor":"elefant","elefantina":["elefantină","elefantin","elefantina","elefantin"],"elefantine":"elefantin","elefantinele":"elefantin","elefantini":"elefantin","elefantinii":"elefantin","elefantinul":"elefantin","elefantoaice":"elefăntoaică","elefantoaicei":"elefăntoaică","elefantoaicele":"elefăntoaică","elefantoaicelor":"elefăntoaică","elefantul":"elefant","elefantule":"elefant","elefantului":"elefant","elefteros":"elefterosi","elefterose":"elefterosi","elefterosea":"elefterosi","elefteroseai":"elefterosi","elefteroseam":"elefterosi","elefteroseati":"elefterosi","elefteroseau":"elefterosi","elefterosie":"elefterosi","elefterosii":"elefterosi","elefterosim":"elefterosi","elefterosind":"elefterosi","elefterosira":"elefterosi","elefterosiram":"elefterosi","elefterosirati":"elefterosi","elefterosise":"elefterosi","elefterosisem":"elefterosi","elefterosisera":"elefterosi","elefterosiseram":"elefterosi","elefterosiserati":"elefterosi","elefterosisesi":"elefterosi","elefterosisi":"elefterosi","elefterosit":"elefterosi","elefterositi":"elefterosi","eleganta":["elegantă","elegant","eleganta","elegant"],"elegante":["elegante","elegant","eleganțe","eleganță"],"elegantei":"eleganță","elegantele":["elegantele","elegant","eleganțele","eleganță"],"elegantelor":"eleganță","eleganti":"elegant","elegantii":"elegant","elegantul":"elegant","eleghiaceasca":["eleghiacească","eleghiacesc","eleghiaceasca","eleghiacesc"],"eleghiacescul":"eleghiacesc","eleghiacesti":"eleghiacesc","eleghiacestii":"eleghiacesc","eleghiacestile":"eleghiacesc","elegia":"elegie","elegiaca":["elegiacă","elegiac","elegiaca","elegiac"],"elegiace":"elegiac","elegiacele":"elegiac","elegiaci":"elegiac","elegiacii":"elegiac","elegiacul":"elegiac","elegici":"elegic","elegicii":"elegic","elegicilor":"elegic","elegicul":"elegic","elegicule":"elegic","elegicului":"elegic","elegiei":"elegie","elegii":"elegie","elegiile":"elegie","elegiilor":"elegie","elegisti":"elegist","elegistii":"elegist","elegistilor":"elegist","elegistul":"elegist","elegistule":"elegist","elegistului":"elegist","elementara":["elementară","elementar","elementara","elementar"],"elementare":"elementar","elementarele":"elementar","elementari":"elementar","elementariceasca":["elementaricească","elementaricesc","elementariceasca","elementaricesc"],"elementaricescul":"elementaricesc","elementaricesti":"elementaricesc","elementaricestii":"elementaricesc","elementaricestile":"elementaricesc","elementarii":"elementar","elementaritatea":"elementaritate","elementaritati":"elementaritate","elementaritatii":"elementaritate","elementarizai":"elementariza","elementarizam":["elementarizăm","elementariza","elementarizam","elementariza"],"elementarizand":"elementariza","elementarizara":"elementariza","elementarizaram":"elementariza","elementarizarati":"elementariza","elementarizase":"elementariza","elementarizasem":"elementariza","elementarizasera":"elementariza","elementarizaseram":"elementariza","elementarizaserati":"elementariza","elementarizasesi":"elementariza","elementarizasi":"elementariza","elementarizat":"elementariza","elementarizati":"elementariza","elementarizau":"elementariza","elementarizeaza":"elementariza","elementarizez":"elementariza","elementarizezi":"elementariza","elementarul":"elementar","elemente":"element","elemente de tranzitie":"element de tranziție","elemente parazitice":"element parazitic","elementele":"element","elementelor":"element","elementul":"element","elementule":"element","elementului":"element","elemozine":"elemozină","elemozinei":"elemozină","elemozinele":"elemozină","elemozinelor":"elemozină","elencosul":"elencos","elencosule":"elencos","elencosului":"elencos","elene":"elenă","elenei":"elenă","elenele":"elenă","elenelor":"elenă","eleni":"elen","elenica":["elenică","elenic","elenica","elenic"],"elenice":"elenic","elenicele":"elenic","elenici":"elenic","elenicii":"elenic","elenicul":"elenic","elenii":"elen","elenilor":"elen","elenisme":"elenism","elenismele":"elenism","elenismelor":"elenism","elenismul":"elenism","elenismule":"elenism","elenismului":"elenism","eleniste":"elenistă","elenistei":"elenistă","elenistele":"elenistă","elenistelor":"elenistă","elenisti":"elenist","elenistica":["elenistică","elenistic","elenistica","elenistic"],"elenistice":"elenistic","elenisticele":"elenistic","elenistici":"elenistic","elenisticii":"elenistic","elenisticul":"elenistic","elenistii":"elenist","elenistilor":"elenist","elenistul":"elenist","elenistule":"elenist","elenistului":"elenist","elenizai":"eleniza","elenizam":["elenizăm","eleniza","elenizam","eleniza"],"elenizand":"eleniza","elenizara":"eleniza","elenizaram":"eleniza","elenizarati":"eleniza","elenizarea":"elenizare","elenizari":"elenizare","elenizarii":"elenizare","elenizarile":"elenizare","elenizarilor":"elenizare","elenizase":"eleniza","elenizasem":"eleniza","elenizasera":"eleniza","elenizaseram":"eleniza","elenizaserati":"eleniza","elenizasesi":"eleniza","elenizasi":"eleniza","elenizat":"eleniza","elenizati":"eleniza","elenizau":"eleniza","elenizeaza":"eleniza","elenizez":"eleniza","elenizezi":"eleniza","elensugul":"elenșug","elensugule":"elenșug","elensugului":"elenșug","elensuguri":"elenșug","elensugurile":"elenșug","elensugurilor":"elenșug","elenul":"elen","elenule":"elen","elenului":"elen","eleoliti":"eleolit","eleolitii":"eleolit","eleolitilor":"eleolit","eleolitul":"eleolit","eleolitule":"eleolit","eleolitului":"eleolit","eleroane":"eleron","eleroanele":"eleron","eleroanelor":"eleron","eleronul":"eleron","eleronule":"eleron","eleronului":"eleron","elesteie":"eleșteu","eletronmicroscopia":"eletronmicroscopie","eletronmicroscopiei":"eletronmicroscopie","eletronmicroscopii":"eletronmicroscopie","eletronmicroscopiile":"eletronmicroscopie","eletronmicroscopiilor":"eletronmicroscopie","elevarea":"elevare","elevari":"elevare","elevarii":"elevare","elevarile":"elevare","elevarilor":"elevare","elevata":["elevată","elevat","elevata","elevat"],"elevate":"elevat","elevatele":"elevat","elevati":"elevat","elevatia":"elevație","elevatiei":"elevație","elevatii":["elevații","elevat","elevații","elevație"],"elevatiile":"elevație","elevatiilor":"elevație","elevatiunea":"elevațiune","elevatiuni":"elevațiune","elevatiunii":"elevațiune","elevatiunile":"elevațiune","elevatiunilor":"elevațiune","elevatoare":"elevator","elevatoarele":"elevator","elevatoarelor":"elevator","elevatorul":"elevator","elevatorule":"elevator","elevatorului":"elevator","elevatul":"elevat","eleve":"elevă","elevei":"elevă","elevele":"elevă","elevelor":"elevă","elevi":"elev","elevii":"elev","elevilor":"elev","elevul":"elev","elevule":"elev","elevului":"elev","elfe":"elfă","elfei":"elfă","elfele":"elfă","elfelor":"elfă","elfi":"elf","elfii":"elf","elfilor":"elf","elful":"elf","elfule":"elf","elfului":"elf","eliaca":["eliacă","eliac","eliaca","eliac"],"eliace":"eliac","eliacele":"eliac","eliaci":"eliac","eliacii":"eliac","eliacul":"eliac","eliberai":"elibera","eliberam":["eliberăm","elibera","eliberam","elibera"],"eliberand":"elibera","eliberara":"elibera","eliberaram":"elibera","eliberarati":"elibera","eliberarea":"eliberare","eliberari":"eliberare","eliberarii":"eliberare","eliberarile":"eliberare","eliberarilor":"eliberare","eliberase":"elibera","eliberasem":"elibera","eliberasera":"elibera","eliberaseram":"elibera","eliberaserati":"elibera","eliberasesi":"elibera","eliberasi":"elibera","eliberat":"elibera","eliberat din functie":"elibera din funcție","eliberata":["eliberată","eliberat","eliberata","eliberat"],"eliberate":"eliberat","eliberatele":"eliberat","eliberati":["eliberați","elibera","eliberați","eliberat"],"eliberatia":"eliberație","eliberatiei":"eliberație","eliberatii":["eliberații","eliberat","eliberații","eliberație"],"eliberatiile":"eliberație","eliberatiilor":"eliberație","eliberatoare":"eliberator","eliberatoarea":"eliberator","eliberatoarele":"eliberator","eliberatori":"eliberator","eliberatorii":"eliberator","eliberatorul":"eliberator","eliberatul":"eliberat","eliberau":"elibera","elibereaza":"elibera","elibereaza din functie":"elibera din funcție","eliberez":"elibera","eliberezi":"elibera","elicea":"elice","elicei":"elice","elicele":"elice","elicelor":"elice","elicoidala":["elicoidală","elicoidal","elicoidala","elicoidal"],"elicoidale":"elicoidal","elicoidalele":"elicoidal","elicoidali":"elicoidal","elicoidalii":"elicoidal","elicoidalul":"elicoidal","elicoide":"elicoid","elicoidele":"elicoid","elicoidelor":"elicoid","elicoidul":"elicoid","elicoidule":"elicoid","elicoidului":"elicoid","elicoptere":"elicopter","elicoptere de atac":"elicopter de atac","elicoptere de lupta":"elicopter de luptă","elicopterele":"elicopter","elicopterelor":"elicopter","elicopteristi":["elicopteriști","elicopterist","elicopteristi","elicopterist"],"elicopteristii":"elicopterist","elicopteristilor":"elicopterist","elicopteristul":"elicopterist","elicopteristule":"elicopterist","elicopteristului":"elicopterist","elicopterul":"elicopter","elicopterule":"elicopter","elicopterului":"elicopter","elidai":"elida","elidam":["elidăm","elida","elidam","elida"],"elidand":"elida","elidara":"elida","elidaram":"elida","elidarati":"elida","elidarea":"elidare","elidari":"elidare","elidarii":"elidare","elidarile":"elidare","elidarilor":"elidare","elidase":"elida","elidasem":"elida","elidasera":"elida","elidaseram":"elida","elidaserati":"elida","elidasesi":"elida","elidasi":"elida","elidat":"elida","elidati":"elida","elidau":"elida","elideaza":"elida","elidez":"elida","elidezi":"elida","eligare":"eligară","eligarei":"eligară","eligarele":"eligară","eligarelor":"eligară","eligari":"eligară","eligibila":["eligibilă","eligibil","eligibila","eligibil"],"eligibile":"eligibil","eligibilele":"eligibil","eligibili":"eligibil","eligibilii":"eligibil","eligibilitatea":"eligibilitate","eligibilitati":"eligibilitate","eligibilitatii":"eligibilitate","eligibilul":"eligibil"};
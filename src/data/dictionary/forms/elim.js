@@ -0,0 +1 @@
+export default {"elimin":"elimina","eliminai":"elimina","eliminam":["eliminăm","elimina","eliminam","elimina"],"eliminand":"elimina","eliminara":"elimina","eliminaram":"elimina","eliminarati":"elimina","eliminarea":"eliminare","eliminari":"eliminare","eliminarii":"eliminare","eliminarile":"eliminare","eliminarilor":"eliminare","eliminase":"elimina","eliminasem":"elimina","eliminasera":"elimina","eliminaseram":"elimina","eliminaserati":"elimina","eliminasesi":"elimina","eliminasi":"elimina","eliminat":"elimina","eliminata":["eliminată","eliminat","eliminata","eliminat"],"eliminate":"eliminat","eliminatele":"eliminat","eliminati":["eliminați","elimina","eliminați","eliminat"],"eliminatia":"eliminație","eliminatiei":"eliminație","eliminatii":["eliminații","eliminat","eliminații","eliminație"],"eliminatiile":"eliminație","eliminatiilor":"eliminație","eliminatiunea":"eliminațiune","eliminatiuni":"eliminațiune","eliminatiunii":"eliminațiune","eliminatiunile":"eliminațiune","eliminatiunilor":"eliminațiune","eliminatoare":"eliminator","eliminatoarea":"eliminator","eliminatoarele":"eliminator","eliminatori":"eliminator","eliminatoria":"eliminatoriu","eliminatorie":"eliminatoriu","eliminatorii":["eliminatorii","eliminator","eliminatorii","eliminatoriu"],"eliminatoriii":"eliminatoriu","eliminatoriile":"eliminatoriu","eliminatorile":"eliminator","eliminatorilor":"eliminator","eliminatoriul":"eliminatoriu","eliminatorul":"eliminator","eliminatorule":"eliminator","eliminatorului":"eliminator","eliminatul":"eliminat","eliminau":"elimina","elimine":"elimina","elimini":"elimina","elina":["elină","elin","elina","elin"],"eline":"elin","elineasca":["elinească","elinesc","elineasca","elinesc"],"elinele":"elin","elinescul":"elinesc","elinesti":"elinesc","elinestii":"elinesc","elinestile":"elinesc","elini":"elin","elinii":"elin","elinul":"elin","eliofoba":["eliofobă","eliofob","eliofoba","eliofob"],"eliofobe":["eliofobe","eliofob","eliofobe","eliofobă"],"eliofobei":"eliofobă","eliofobele":["eliofobele","eliofob","eliofobele","eliofobă"],"eliofobelor":"eliofobă","eliofobi":"eliofob","eliofobii":"eliofob","eliofobul":"eliofob","eliportul":"eliport","eliportule":"eliport","eliportului":"eliport","eliporturi":"eliport","eliporturile":"eliport","eliporturilor":"eliport","elipse":"elipsă","elipsei":"elipsă","elipsele":"elipsă","elipselor":"elipsă","elipsografe":"elipsograf","elipsografele":"elipsograf","elipsografelor":"elipsograf","elipsograful":"elipsograf","elipsografule":"elipsograf","elipsografului":"elipsograf","elipsoidala":["elipsoidală","elipsoidal","elipsoidala","elipsoidal"],"elipsoidale":"elipsoidal","elipsoidalele":"elipsoidal","elipsoidali":"elipsoidal","elipsoidalii":"elipsoidal","elipsoidalul":"elipsoidal","elipsoide":"elipsoid","elipsoidele":"elipsoid","elipsoidelor":"elipsoid","elipsoidul":"elipsoid","elipsoidule":"elipsoid","elipsoidului":"elipsoid","eliptica":["eliptică","eliptic","eliptica","eliptic"],"eliptice":"eliptic","elipticele":"eliptic","eliptici":"eliptic","elipticii":"eliptic","elipticitatea":"elipticitate","elipticitati":"elipticitate","elipticitatii":"elipticitate","elipticitatile":"elipticitate","elipticitatilor":"elipticitate","elipticul":"eliptic","elisabetana":["elisabetană","elisabetan","elisabetana","elisabetan"],"elisabetane":"elisabetan","elisabetanele":"elisabetan","elisabetani":"elisabetan","elisabetanii":"elisabetan","elisabetanul":"elisabetan","elisabetei":"Elisabeta","eliseeasca":["eliseească","eliseesc","eliseeasca","eliseesc"],"eliseescul":"eliseesc","eliseesti":"eliseesc","eliseestii":"eliseesc","eliseestile":"eliseesc","elitara":["elitară","elitar","elitara","elitar"],"elitare":"elitar","elitarele":"elitar","elitari":"elitar","elitarii":"elitar","elitarul":"elitar","elite":"elită","elitei":"elită","elitele":"elită","elitelor":"elită","elitismul":"elitism","elitismule":"elitism","elitismului":"elitism","elitista":["elitistă","elitist","elitista","elitist"],"elitiste":"elitist","elitistele":"elitist","elitisti":"elitist","elitistii":"elitist","elitistul":"elitist","elitre":"elitră","elitrei":"elitră","elitrele":"elitră","elitrelor":"elitră","elitrotomia":"elitrotomie","elitrotomiei":"elitrotomie","elitrotomii":"elitrotomie","elitrotomiile":"elitrotomie","elitrotomiilor":"elitrotomie","elixire":"elixir","elixirele":"elixir","elixirelor":"elixir","elixirul":"elixir","elixirule":"elixir","elixirului":"elixir","elizee":"elizeu","elizeele":"elizeu","elizeelor":"elizeu","elizeica":["elizeică","elizeic","elizeica","elizeic"],"elizeice":"elizeic","elizeicele":"elizeic","elizeici":"elizeic","elizeicii":"elizeic","elizeicul":"elizeic","elizeul":"elizeu","elizeule":"elizeu","elizeului":"elizeu","eliziunea":"eliziune","eliziuni":"eliziune","eliziunii":"eliziune","eliziunile":"eliziune","eliziunilor":"eliziune","elminti":"elmint","elmintii":"elmint","elmintilor":"elmint","elmintul":"elmint","elmintule":"elmint","elmintului":"elmint","elocinte":"elocință","elocintea":"elocinte","elocintei":"elocință","elocintele":["elocințele","elocință","elocintele","elocinte"],"elocintelor":"elocință","elocinti":"elocinte","elocintii":"elocinte","elocutiunea":"elocuțiune","elocutiuni":"elocuțiune","elocutiunii":"elocuțiune","elocutiunile":"elocuțiune","elocutiunilor":"elocuțiune","elocventa":["elocventă","elocvent","elocventa","elocvent"],"elocvente":["elocvente","elocvent","elocvențe","elocvență"],"elocventei":"elocvență","elocventele":["elocventele","elocvent","elocvențele","elocvență"],"elocventelor":"elocvență","elocventi":"elocvent","elocventii":"elocvent","elocventul":"elocvent","elogiai":"elogia","elogiam":"elogia","elogiara":"elogia","elogiaram":"elogia","elogiarati":"elogia","elogiase":"elogia","elogiasem":"elogia","elogiasera":"elogia","elogiaseram":"elogia","elogiaserati":"elogia","elogiasesi":"elogia","elogiasi":"elogia","elogiat":"elogia","elogiata":["elogiată","elogiat","elogiata","elogiat"],"elogiate":"elogiat","elogiatele":"elogiat","elogiati":["elogiați","elogia","elogiați","elogiat"],"elogiatii":"elogiat","elogiatul":"elogiat","elogiau":"elogia","elogiaza":"elogia","elogie":"elogia","elogieaza":"elogia","elogiem":"elogia","elogierea":"elogiere","elogieri":"elogiere","elogierii":"elogiere","elogierile":"elogiere","elogierilor":"elogiere","elogiez":"elogia","elogiezi":"elogia","elogii":"elogiu","elogiile":"elogiu","elogiilor":"elogiu","elogiind":"elogia","elogioasa":["elogioasă","elogios","elogioasa","elogios"],"elogioase":"elogios","elogioasele":"elogios","elogiosi":"elogios","elogiosii":"elogios","elogiosul":"elogios","elogisti":"elogist","elogistii":"elogist","elogistilor":"elogist","elogistul":"elogist","elogistule":"elogist","elogistului":"elogist","elogiul":"elogiu","elogiule":"elogiu","elogiului":"elogiu","elongata":["elongată","elongat","elongata","elongat"],"elongate":"elongat","elongatele":"elongat","elongati":"elongat","elongatia":"elongație","elongatiei":"elongație","elongatii":["elongații","elongat","elongații","elongație"],"elongatiile":"elongație","elongatiilor":"elongație","elongatiunea":"elongațiune","elongatiuni":"elongațiune","elongatiunii":"elongațiune","elongatiunile":"elongațiune","elongatiunilor":"elongațiune","elongatul":"elongat","eloxata":["eloxată","eloxat","eloxata","eloxat"],"eloxate":"eloxat","eloxatele":"eloxat","eloxati":"eloxat","eloxatii":"eloxat","eloxatul":"eloxat","eluanti":"eluant","eluantii":"eluant","eluantilor":"eluant","eluantul":"eluant","eluantule":"eluant","eluantului":"eluant","elucidai":"elucida","elucidam":["elucidăm","elucida","elucidam","elucida"],"elucidand":"elucida","elucidara":"elucida","elucidaram":"elucida","elucidarati":"elucida","elucidarea":"elucidare","elucidari":"elucidare","elucidarii":"elucidare","elucidarile":"elucidare","elucidarilor":"elucidare","elucidase":"elucida","elucidasem":"elucida","elucidasera":"elucida","elucidaseram":"elucida","elucidaserati":"elucida","elucidasesi":"elucida","elucidasi":"elucida","elucidat":"elucida","elucidata":["elucidată","elucidat","elucidata","elucidat"],"elucidate":"elucidat","elucidatele":"elucidat","elucidati":["elucidați","elucida","elucidați","elucidat"],"elucidatia":"elucidație","elucidatiei":"elucidație","elucidatii":["elucidații","elucidat","elucidații","elucidație"],"elucidatiile":"elucidație","elucidatiilor":"elucidație","elucidatul":"elucidat","elucidau":"elucida","elucideaza":"elucida","elucidez":"elucida","elucidezi":"elucida","elucubrai":"elucubra","elucubram":["elucubrăm","elucubra","elucubram","elucubra"],"elucubrand":"elucubra","elucubranta":["elucubrantă","elucubrant","elucubranta","elucubrant"],"elucubrante":"elucubrant","elucubrantele":"elucubrant","elucubranti":"elucubrant","elucubrantii":"elucubrant","elucubrantul":"elucubrant","elucubrara":"elucubra","elucubraram":"elucubra","elucubrarati":"elucubra","elucubrase":"elucubra","elucubrasem":"elucubra","elucubrasera":"elucubra","elucubraseram":"elucubra","elucubraserati":"elucubra","elucubrasesi":"elucubra","elucubrasi":"elucubra","elucubrat":"elucubra","elucubrati":"elucubra","elucubratia":"elucubrație","elucubratiei":"elucubrație","elucubratii":"elucubrație","elucubratiile":"elucubrație","elucubratiilor":"elucubrație","elucubratiunea":"elucubrațiune","elucubratiuni":"elucubrațiune","elucubratiunii":"elucubrațiune","elucubratiunile":"elucubrațiune","elucubratiunilor":"elucubrațiune","elucubrativa":["elucubrativă","elucubrativ","elucubrativa","elucubrativ"],"elucubrative":"elucubrativ","elucubrativele":"elucubrativ","elucubrativi":"elucubrativ","elucubrativii":"elucubrativ","elucubrativul":"elucubrativ","elucubrau":"elucubra","elucubreaza":"elucubra","elucubrez":"elucubra","elucubrezi":"elucubra","eludabila":["eludabilă","eludabil","eludabila","eludabil"],"eludabile":"eludabil","eludabilele":"eludabil","eludabili":"eludabil","eludabilii":"eludabil","eludabilul":"eludabil","eludai":"eluda","eludam":["eludăm","eluda","eludam","eluda"],"eludand":"eluda","eludara":"eluda","eludaram":"eluda","eludarati":"eluda","eludarea":"eludare","eludari":"eludare","eludarii":"eludare","eludarile":"eludare","eludarilor":"eludare","eludase":"eluda","eludasem":"eluda","eludasera":"eluda","eludaseram":"eluda","eludaserati":"eluda","eludasesi":"eluda","eludasi":"eluda","eludat":"eluda","eludata":["eludată","eludat","eludata","eludat"],"eludate":"eludat","eludatele":"eludat","eludati":["eludați","eluda","eludați","eludat"],"eludatii":"eludat","eludatul":"eludat","eludau":"eluda","eludeaza":"eluda","eludez":"eluda","eludezi":"eluda","elutia":"eluție","elutiei":"eluție","elutii":"eluție","elutiile":"eluție","elutiilor":"eluție","elutiunea":"eluțiune","elutiuni":"eluțiune","elutiunii":"eluțiune","elutiunile":"eluțiune","elutiunilor":"eluțiune","elutrierea":"elutriere","elutrieri":"elutriere","elutrierii":"elutriere","eluviala":["eluvială","eluvial","eluviala","eluvial"],"eluviale":"eluvial","eluvialele":"eluvial","eluviali":"eluvial","eluvialii":"eluvial","eluvialul":"eluvial","eluvii":"eluviu","eluviile":"eluviu","eluviilor":"eluviu","eluviul":"eluviu","eluviule":"eluviu","eluviului":"eluviu","eluviunea":"eluviune","eluviuni":"eluviune","eluviunii":"eluviune","eluviunile":"eluviune","eluviunilor":"eluviune","elveti":"elvet","elvetiance":"elvețiancă","elvetiancei":"elvețiancă","elvetiancele":"elvețiancă","elvetiancelor":"elvețiancă","elvetianul":"elvețian","elvetianule":"elvețian","elvetianului":"elvețian","elvetica":["elvetică","elvetic","elvetica","elvetic"],"elvetice":"elvetic","elveticeasca":["elveticească","elveticesc","elveticeasca","elveticesc"],"elveticele":"elvetic","elveticescul":"elveticesc","elveticesti":"elveticesc","elveticestii":"elveticesc","elveticestile":"elveticesc","elvetici":"elvetic","elveticii":"elvetic","elveticul":"elvetic","elvetie":"Elveția","elvetiei":"Elveția","elvetience":"elvețiancă","elvetiene":"elvețiană","elvetienei":"elvețiană","elvetienele":"elvețiană","elvetienelor":"elvețiană","elvetieni":"elvețian","elvetienii":"elvețian","elvetienilor":"elvețian","elvetii":["elveții","elvet","elveții","Elveția"],"elvetilor":"elvet","elvetul":"elvet","elvetule":"elvet","elvetului":"elvet","elzevire":"elzevir","elzevirele":"elzevir","elzevirelor":"elzevir","elzevirul":"elzevir","elzevirule":"elzevir","elzevirului":"elzevir","emaciai":"emacia","emaciam":"emacia","emaciara":"emacia","emaciaram":"emacia","emaciarati":"emacia","emaciase":"emacia","emaciasem":"emacia","emaciasera":"emacia","emaciaseram":"emacia","emaciaserati":"emacia","emaciasesi":"emacia","emaciasi":"emacia","emaciat":"emacia","emaciata":["emaciată","emaciat","emaciata","emaciat"],"emaciate":"emaciat","emaciatele":"emaciat","emaciati":["emaciați","emacia","emaciați","emaciat"],"emaciatia":"emaciație","emaciatiei":"emaciație","emaciatii":["emaciații","emaciat","emaciații","emaciație"],"emaciatiile":"emaciație","emaciatiilor":"emaciație","emaciatul":"emaciat","emaciau":"emacia","emaciaza":"emacia","emacie":"emacia","emaciem":"emacia","emacierea":"emaciere","emacieri":"emaciere","emacierii":"emaciere","emacierile":"emaciere","emacierilor":"emaciere","emaciez":"emacia","emacieze":"emacia","emaciezi":"emacia","emaciind":"emacia","emagrame":"emagramă","emagramei":"emagramă","emagramele":"emagramă","emagramelor":"emagramă","emailai":"emaila","emailajul":"emailaj","emailajule":"emailaj","emailajului":"emailaj","emailam":["emailăm","emaila","emailam","emaila"],"emailand":"emaila","emailara":"emaila","emailaram":"emaila","emailarati":"emaila","emailarea":"emailare","emailari":"emailare","emailarii":"emailare","emailarile":"emailare","emailarilor":"emailare","emailase":"emaila","emailasem":"emaila","emailasera":"emaila","emailaseram":"emaila","emailaserati":"emaila","emailasesi":"emaila","emailasi":"emaila","emailat":"emaila","emailata":["emailată","emailat","emailata","emailat"],"emailate":"emailat","emailatele":"emailat","emailati":["emailați","emaila","emailați","emailat"],"emailatii":"emailat","emailatori":"emailator","emailatorii":"emailator","emailatorilor":"emailator","emailatorul":"emailator","emailatorule":"emailator","emailatorului":"emailator","emailatul":"emailat","emailau":"emaila","emaileaza":"emaila","emailez":"emaila","emailezi":"emaila","emailoarea":"emailoare","emailoarei":"emailoare","emailoarele":"emailoare","emailoarelor":"emailoare","emailori":"emailor","emailorii":"emailor","emailorilor":"emailor","emailorul":"emailor","emailorule":"emailor","emailorului":"emailor","emailul":"email","emailule":"email","emailului":"email","emailuri":"email","emailurile":"email","emailurilor":"email","eman":"emana","emanai":"emana","emanam":["emanăm","emana","emanam","emana"],"emanand":"emana","emanara":"emana","emanaram":"emana","emanarati":"emana","emanarea":"emanare","emanari":"emanare","emanarii":"emanare","emanarile":"emanare","emanarilor":"emanare","emanase":"emana","emanasem":"emana","emanasera":"emana","emanaseram":"emana","emanaserati":"emana","emanasesi":"emana","emanasi":"emana","emanat":"emana","emanati":"emana","emanatia":"emanație","emanatiei":"emanație","emanatii":"emanație","emanatiile":"emanație","emanatiilor":"emanație","emanationismul":"emanaționism","emanationismule":"emanaționism","emanationismului":"emanaționism","emanatismul":"emanatism","emanatismule":"emanatism","emanatismului":"emanatism","emanatiunea":"emanațiune","emanatiuni":"emanațiune","emanatiunii":"emanațiune","emanatiunile":"emanațiune","emanatiunilor":"emanațiune","emanau":"emana","emancipai":"emancipa","emancipam":["emancipăm","emancipa","emancipam","emancipa"],"emancipand":"emancipa","emancipara":"emancipa","emanciparam":"emancipa","emanciparati":"emancipa","emanciparea":"emancipare","emancipari":"emancipare","emanciparii":"emancipare","emanciparile":"emancipare","emanciparilor":"emancipare","emancipase":"emancipa","emancipasem":"emancipa","emancipasera":"emancipa","emancipaseram":"emancipa","emancipaserati":"emancipa","emancipasesi":"emancipa","emancipasi":"emancipa","emancipat":"emancipa","emancipata":["emancipată","emancipat","emancipata","emancipat"],"emancipate":"emancipat","emancipatele":"emancipat","emancipati":["emancipați","emancipa","emancipați","emancipat"],"emancipatia":"emancipație","emancipatiei":"emancipație","emancipatii":["emancipații","emancipat","emancipații","emancipație"],"emancipatiile":"emancipație","emancipatiilor":"emancipație","emancipatiunea":["emancipațiunea","emancipațiune","emancipățiunea","emancipățiune"],"emancipatiuni":["emancipațiuni","emancipațiune","emancipățiuni","emancipățiune"],"emancipatiunii":["emancipațiunii","emancipațiune","emancipățiunii","emancipățiune"],"emancipatiunile":["emancipațiunile","emancipațiune","emancipățiunile","emancipățiune"],"emancipatiunilor":["emancipațiunilor","emancipațiune","emancipățiunilor","emancipățiune"],"emancipatoare":"emancipator","emancipatoarea":"emancipator","emancipatoarele":"emancipator","emancipatori":"emancipator","emancipatorii":"emancipator","emancipatorul":"emancipator","emancipatul":"emancipat","emancipau":"emancipa","emancipeaza":"emancipa","emancipez":"emancipa","emancipezi":"emancipa","emane":"emana","emani":"emana","emarginaturi":"emarginatură","emarginaturii":"emarginatură","emarginaturile":"emarginatură","emarginaturilor":"emarginatură","emasculai":"emascula","emasculam":["emasculăm","emascula","emasculam","emascula"],"emasculand":"emascula","emasculara":"emascula","emascularam":"emascula","emascularati":"emascula","emascularea":"emasculare","emasculari":"emasculare","emascularii":"emasculare","emascularile":"emasculare","emascularilor":"emasculare","emasculase":"emascula","emasculasem":"emascula","emasculasera":"emascula","emasculaseram":"emascula","emasculaserati":"emascula","emasculasesi":"emascula","emasculasi":"emascula","emasculat":"emascula","emasculati":"emascula","emasculatia":"emasculație","emasculatiei":"emasculație","emasculatii":"emasculație","emasculatiile":"emasculație","emasculatiilor":"emasculație","emasculatul":"emasculat","emasculatule":"emasculat","emasculatului":"emasculat","emasculaturi":"emasculat","emasculaturile":"emasculat","emasculaturilor":"emasculat","emasculau":"emascula","emasculeaza":"emascula","emasculez":"emascula","emasculezi":"emascula","embargoul":"embargo","embargoule":"embargo","embargoului":"embargo","embargouri":"embargo","embargourile":"embargo","embargourilor":"embargo","embaticare":"embaticară","embaticarei":"embaticară","embaticarele":"embaticară","embaticarelor":"embaticară","embereclis":"embereclisi","embereclise":"embereclisi","embereclisea":"embereclisi","emberecliseai":"embereclisi","emberecliseam":"embereclisi","emberecliseati":"embereclisi","emberecliseau":"embereclisi","embereclisie":"embereclisi","embereclisii":"embereclisi","embereclisim":"embereclisi","embereclisind":"embereclisi","embereclisira":"embereclisi","embereclisiram":"embereclisi","embereclisirati":"embereclisi","embereclisirea":"embereclisire","embereclisiri":"embereclisire","embereclisirii":"embereclisire","embereclisirile":"embereclisire","embereclisirilor":"embereclisire","embereclisise":"embereclisi","embereclisisem":"embereclisi","embereclisisera":"embereclisi","embereclisiseram":"embereclisi","embereclisiserati":"embereclisi","embereclisisesi":"embereclisi","embereclisisi":"embereclisi","embereclisit":"embereclisi","embereclisita":["embereclisită","embereclisit","embereclisita","embereclisit"],"embereclisite":"embereclisit","embereclisitele":"embereclisit","embereclisiti":["embereclisiți","embereclisi","embereclisiți","embereclisit"],"embereclisitii":"embereclisit","embereclisitul":"embereclisit","emblematica":["emblematică","emblematic","emblematica","emblematic"],"emblematice":"emblematic","emblematicele":"emblematic","emblematici":"emblematic","emblematicii":"emblematic","emblematicul":"emblematic","embleme":["embleme","emblem","embleme","emblemă"],"emblemei":"emblemă","emblemele":["emblemele","emblem","emblemele","emblemă"],"emblemelor":["emblemelor","emblem","emblemelor","emblemă"],"emblemul":"emblem","emblemule":"emblem","emblemului":"emblem","embolia":"embolie","embolica":["embolică","embolic","embolica","embolic"],"embolice":"embolic","embolicele":"embolic","embolici":"embolic","embolicii":"embolic","embolicul":"embolic","emboliei":"embolie","emboligena":["emboligenă","emboligen","emboligena","emboligen"],"emboligene":"emboligen","emboligenele":"emboligen","emboligeni":"emboligen","emboligenii":"emboligen","emboligenul":"emboligen","embolii":"embolie","emboliile":"embolie","emboliilor":"embolie","embolismica":["embolismică","embolismic","embolismica","embolismic"],"embolismice":"embolismic","embolismicele":"embolismic","embolismici":"embolismic","embolismicii":"embolismic","embolismicul":"embolismic","embolismul":"embolism","embolismule":"embolism","embolismului":"embolism","embolismuri":"embolism","embolismurile":"embolism","embolismurilor":"embolism","embolitul":"embolit","embolitule":"embolit","embolitului":"embolit","embolul":"embol","embolule":"embol","embolului":"embol","emboluri":"embol","embolurile":"embol","embolurilor":"embol","embori":"embor","emboriceasca":["emboricească","emboricesc","emboriceasca","emboricesc"],"emboricescul":"emboricesc","emboricesti":"emboricesc","emboricestii":"emboricesc","emboricestile":"emboricesc","emborii":"embor","emborilor":"embor","emborul":"embor","emborule":"embor","emborului":"embor","embriocardia":"embriocardie","embriocardiei":"embriocardie","embriocardii":"embriocardie","embriocardiile":"embriocardie","embriocardiilor":"embriocardie","embriogeneze":"embriogeneză","embriogenezei":"embriogeneză","embriogenezele":"embriogeneză","embriogenezelor":"embriogeneză","embriogenia":"embriogenie","embriogeniei":"embriogenie","embriogenii":"embriogenie","embriogeniile":"embriogenie","embriogeniilor":"embriogenie","embriografia":"embriografie","embriografiei":"embriografie","embriografii":"embriografie","embriografiile":"embriografie","embriografiilor":"embriografie","embriologe":"embriologă","embriologei":"embriologă","embriologele":"embriologă","embriologelor":"embriologă","embriologi":"embriolog","embriologia":"embriologie","embriologica":["embriologică","embriologic","embriologica","embriologic"],"embriologice":"embriologic","embriologicele":"embriologic","embriologici":"embriologic","embriologicii":"embriologic","embriologicul":"embriologic","embriologiei":"embriologie","embriologii":["embriologii","embriolog","embriologii","embriologie"],"embriologilor":"embriolog","embriologul":"embriolog","embriologule":"embriolog","embriologului":"embriolog","embrionara":["embrionară","embrionar","embrionara","embrionar"],"embrionare":"embrionar","embrionarele":"embrionar","embrionari":"embrionar","embrionarii":"embrionar","embrionarul":"embrionar","embrionata":["embrionată","embrionat","embrionata","embrionat"],"embrionate":"embrionat","embrionatele":"embrionat","embrionati":"embrionat","embrionatii":"embrionat","embrionatul":"embrionat","embrioni":"embrion","embrionii":"embrion","embrionilor":"embrion","embrionul":"embrion","embrionule":"embrion","embrionului":"embrion","embriopatia":"embriopatie","embriopatiei":"embriopatie","embriopatii":"embriopatie","embriopatiile":"embriopatie","embriopatiilor":"embriopatie","embriotomia":"embriotomie","embriotomica":["embriotomică","embriotomic","embriotomica","embriotomic"],"embriotomice":"embriotomic","embriotomicele":"embriotomic","embriotomici":"embriotomic","embriotomicii":"embriotomic","embriotomicul":"embriotomic","embriotomiei":"embriotomie","embriotomii":"embriotomie","embriotomiile":"embriotomie","embriotomiilor":"embriotomie","embriotomul":"embriotom","embriotomule":"embriotom","embriotomului":"embriotom","embriotomuri":"embriotom","embriotomurile":"embriotom","embriotomurilor":"embriotom","emearga":"emerge","emectari":"emectar","emectarii":"emectar","emectarilor":"emectar","emectarul":"emectar","emectarule":"emectar","emectarului":"emectar","emeletiuri":"emeletiu","emeletiuul":"emeletiu","emeletiuule":"emeletiu","emeletiuului":"emeletiu","emeletiuuri":"emeletiu","emeletiuurile":"emeletiu","emeletiuurilor":"emeletiu","emenagoge":"emenagog","emenagogele":"emenagog","emenagogelor":"emenagog","emenagogul":"emenagog","emenagogule":"emenagog","emenagogului":"emenagog","emendabila":["emendabilă","emendabil","emendabila","emendabil"],"emendabile":"emendabil","emendabilele":"emendabil","emendabili":"emendabil","emendabilii":"emendabil","emendabilul":"emendabil","emendai":"emenda","emendam":["emendăm","emenda","emendam","emenda"],"emendand":"emenda","emendara":"emenda","emendaram":"emenda","emendarati":"emenda","emendarea":"emendare","emendari":"emendare","emendarii":"emendare","emendarile":"emendare","emendarilor":"emendare","emendase":"emenda","emendasem":"emenda","emendasera":"emenda","emendaseram":"emenda","emendaserati":"emenda","emendasesi":"emenda","emendasi":"emenda","emendat":"emenda","emendati":"emenda","emendatia":"emendație","emendatiei":"emendație","emendatii":"emendație","emendatiile":"emendație","emendatiilor":"emendație","emendatiunea":"emendațiune","emendatiuni":"emendațiune","emendatiunii":"emendațiune","emendatiunile":"emendațiune","emendatiunilor":"emendațiune","emendau":"emenda","emendeaza":"emenda","emendez":"emenda","emendezi":"emenda","emerg":"emerge","emergand":"emerge","emergea":"emerge","emergeai":"emerge","emergeam":"emerge","emergeati":"emerge","emergeau":"emerge","emergem":"emerge","emergenta":["emergentă","emergent","emergenta","emergent"],"emergente":["emergente","emergent","emergențe","emergență"],"emergentei":"emergență","emergentele":["emergentele","emergent","emergențele","emergență"],"emergentelor":"emergență","emergenti":"emergent","emergentii":"emergent","emergentul":"emergent","emergeti":"emerge","emergi":"emerge","emerita":["emerită","emerit","emerita","emerit"],"emeritata":["emeritată","emeritat","emeritata","emeritat"],"emeritate":"emeritat","emeritatele":"emeritat","emeritati":"emeritat","emeritatii":"emeritat","emeritatul":"emeritat","emerite":"emerit","emeritele":"emerit","emeriti":"emerit","emeritii":"emerit","emeritul":"emerit","emeriul":"emeri","emeriule":"emeri","emeriului":"emeri","emers":"emerge","emerse":"emerge","emersei":"emerge","emersera":"emerge","emerseram":"emerge","emerserati":"emerge","emersese":"emerge","emersesem":"emerge","emersesera":"emerge","emerseseram":"emerge","emerseserati":"emerge","emersesesi":"emerge","emersesi":"emerge","emersiunea":"emersiune","emersiuni":"emersiune","emersiunii":"emersiune","emersiunile":"emersiune","emersiunilor":"emersiune","emeticul":"emetic","emeticule":"emetic","emeticului":"emetic","emetine":"emetină","emetinei":"emetină","emetinele":"emetină","emetinelor":"emetină","emetizai":"emetiza","emetizam":["emetizăm","emetiza","emetizam","emetiza"],"emetizand":"emetiza","emetizara":"emetiza","emetizaram":"emetiza","emetizarati":"emetiza","emetizase":"emetiza","emetizasem":"emetiza","emetizasera":"emetiza","emetizaseram":"emetiza","emetizaserati":"emetiza","emetizasesi":"emetiza","emetizasi":"emetiza","emetizat":"emetiza","emetizati":"emetiza","emetizau":"emetiza","emetizeaza":"emetiza","emetizez":"emetiza","emetizezi":"emetiza","emetocatarctici":"emetocatarctic","emetocatarcticile":"emetocatarctic","emetocatarcticilor":"emetocatarctic","emetocatarcticul":"emetocatarctic","emetocatarcticule":"emetocatarctic","emetocatarcticului":"emetocatarctic","emetropa":["emetropă","emetrop","emetropa","emetrop"],"emetrope":["emetrope","emetrop","emetrope","emetropă"],"emetropei":"emetropă","emetropele":["emetropele","emetrop","emetropele","emetropă"],"emetropelor":"emetropă","emetropi":"emetrop","emetropia":"emetropie","emetropiei":"emetropie","emetropii":["emetropii","emetrop","emetropii","emetropie"],"emetropul":"emetrop","emfasul":"emfas","emfasule":"emfas","emfasului":"emfas","emfasuri":"emfas","emfasurile":"emfas","emfasurilor":"emfas","emfatica":["emfatică","emfatic","emfatica","emfatic"],"emfatice":"emfatic","emfaticeasca":["emfaticească","emfaticesc","emfaticeasca","emfaticesc"],"emfaticele":"emfatic","emfaticescul":"emfaticesc","emfaticesti":"emfaticesc","emfaticestii":"emfaticesc","emfaticestile":"emfaticesc","emfatici":"emfatic","emfaticii":"emfatic","emfaticul":"emfatic","emfaze":"emfază","emfazei":"emfază","emfiteotica":["emfiteotică","emfiteotic","emfiteotica","emfiteotic"],"emfiteotice":"emfiteotic","emfiteoticele":"emfiteotic","emfiteotici":"emfiteotic","emfiteoticii":"emfiteotic","emfiteoticul":"emfiteotic","emfiteoze":"emfiteoză","emfiteozei":"emfiteoză","emfiteozele":"emfiteoză","emfiteozelor":"emfiteoză","emfizematoasa":["emfizematoasă","emfizematos","emfizematoasa","emfizematos"],"emfizematoase":"emfizematos","emfizematoasele":"emfizematos","emfizematosi":"emfizematos","emfizematosii":"emfizematos","emfizematosul":"emfizematos","emfizeme":"emfizem","emfizemele":"emfizem","emfizemelor":"emfizem","emfizemul":"emfizem","emfizemule":"emfizem","emfizemului":"emfizem","emfizemuri pulmonare":"emfizem pulmonar","emfractica":["emfractică","emfractic","emfractica","emfractic"],"emfractice":"emfractic","emfracticele":"emfractic","emfractici":"emfractic","emfracticii":"emfractic","emfracticul":"emfractic","emfraxia":"emfraxie","emfraxiei":"emfraxie","emfraxii":"emfraxie","emfraxiile":"emfraxie","emfraxiilor":"emfraxie","emicicluri":"emiciclu","emiclicul":"emiclic","emiclicule":"emiclic","emiclicului":"emiclic","emiclicuri":"emiclic","emiclicurile":"emiclic","emiclicurilor":"emiclic","emigrai":"emigra","emigram":["emigrăm","emigra","emigram","emigra"],"emigrand":"emigra","emigrante":"emigrantă","emigrantei":"emigrantă","emigrantele":"emigrantă","emigrantelor":"emigrantă","emigranti":"emigrant","emigrantii":"emigrant","emigrantilor":"emigrant","emigrantul":"emigrant","emigrantule":"emigrant","emigrantului":"emigrant","emigrara":"emigra","emigraram":"emigra","emigrarati":"emigra","emigrarea":"emigrare","emigrari":"emigrare","emigrarii":"emigrare","emigrarile":"emigrare","emigrarilor":"emigrare","emigrase":"emigra","emigrasem":"emigra","emigrasera":"emigra","emigraseram":"emigra","emigraserati":"emigra","emigrasesi":"emigra","emigrasi":"emigra","emigrat":"emigra","emigrata":["emigrată","emigrat","emigrata","emigrat"],"emigrate":["emigrate","emigrat","emigrate","emigrată"],"emigratei":"emigrată","emigratele":["emigratele","emigrat","emigratele","emigrată"],"emigratelor":"emigrată","emigrati":["emigrați","emigra","emigrați","emigrat"],"emigratia":"emigrație","emigratiei":"emigrație","emigratii":["emigrații","emigrat","emigrații","emigrație"],"emigratiile":"emigrație","emigratiilor":"emigrație","emigratiunea":"emigrațiune","emigratiuni":"emigrațiune","emigratiunii":"emigrațiune","emigratiunile":"emigrațiune","emigratiunilor":"emigrațiune","emigratul":"emigrat","emigrau":"emigra","emigreaza":"emigra","emigrez":"emigra","emigrezi":"emigra","emil":"Emilia","emilia":"Emil","emiliei":"Emilia","eminenta":["eminentă","eminent","eminenta","eminent"],"eminente":["eminente","eminent","eminențe","eminență"],"eminente cenusii":"eminență cenușie","eminentei":"eminență","eminentele":["eminentele","eminent","eminențele","eminență"],"eminentelor":"eminență","eminenti":"eminent","eminentii":"eminent","eminentisima":["eminentisimă","eminentisim","eminentisima","eminentisim"],"eminentisime":"eminentisim","eminentisimele":"eminentisim","eminentisimi":"eminentisim","eminentisimii":"eminentisim","eminentisimilor":"eminentisim","eminentisimul":"eminentisim","eminentisimule":"eminentisim","eminentisimului":"eminentisim","eminentul":"eminent","eminesciana":["eminesciană","eminescian","eminesciana","eminescian"],"eminescianisme":"eminescianism","eminescianismele":"eminescianism","eminescianismelor":"eminescianism","eminescianismul":"eminescianism","eminescianismule":"eminescianism","eminescianismului":"eminescianism","eminescianizai":"eminescianiza","eminescianizam":["eminescianizăm","eminescianiza","eminescianizam","eminescianiza"],"eminescianizand":"eminescianiza","eminescianizara":"eminescianiza","eminescianizaram":"eminescianiza","eminescianizarati":"eminescianiza","eminescianizase":"eminescianiza","eminescianizasem":"eminescianiza","eminescianizasera":"eminescianiza","eminescianizaseram":"eminescianiza","eminescianizaserati":"eminescianiza","eminescianizasesi":"eminescianiza","eminescianizasi":"eminescianiza","eminescianizat":"eminescianiza","eminescianizati":"eminescianiza","eminescianizau":"eminescianiza","eminescianizeaza":"eminescianiza","eminescianizez":"eminescianiza","eminescianizezi":"eminescianiza","eminescianul":"eminescian","eminesciene":"eminescian","eminescienele":"eminescian","eminescieni":"eminescian","eminescienii":"eminescian","eminescologe":"eminescologă","eminescologei":"eminescologă","eminescologele":"eminescologă","eminescologelor":"eminescologă","emirate":"emirat","emiratele":"emirat","emiratelor":"emirat","emiratul":"emirat","emiratule":"emirat","emiratului":"emirat","emiri":"emir","emiriana":["emiriană","emirian","emiriana","emirian"],"emirianul":"emirian","emirianule":"emirian","emirianului":"emirian","emiriene":["emiriene","emirian","emiriene","emiriană"],"emirienei":"emiriană","emirienele":["emirienele","emirian","emirienele","emiriană"],"emirienelor":"emiriană","emirieni":"emirian","emirienii":"emirian","emirienilor":"emirian","emirii":"emir","emirilor":"emir","emirul":"emir","emirule":"emir","emirului":"emir","emis":"emite","emisa":["emisă","emis","emisa","emis"],"emisari":"emisar","emisarile":"emisar","emisarilor":"emisar","emisarul":"emisar","emisarule":"emisar","emisarului":"emisar","emise":["emise","emis","emise","emite"],"emisei":"emite","emisele":"emis","emisera":"emite","emiseram":"emite","emiserati":"emite","emisese":"emite","emisesem":"emite","emisesera":"emite","emiseseram":"emite","emiseserati":"emite","emisesesi":"emite","emisesi":"emite","emisfere":["emisfere","emisfer","emisfere","emisferă"],"emisferei":"emisferă","emisferele":["emisferele","emisfer","emisferele","emisferă"],"emisferelor":["emisferelor","emisfer","emisferelor","emisferă"],"emisferica":["emisferică","emisferic","emisferica","emisferic"],"emisferice":"emisferic","emisfericele":"emisferic","emisferici":"emisferic","emisfericii":"emisferic","emisfericul":"emisferic","emisferii":"emisferiu","emisferiile":"emisferiu","emisferiilor":"emisferiu","emisferiuul":"emisferiu","emisferiuule":"emisferiu","emisferiuului":"emisferiu","emisferul":"emisfer","emisferule":"emisfer","emisferului":"emisfer","emisi":"emis","emisia":"emisie","emisiei":"emisie","emisii":["emișii","emis","emisii","emisie"],"emisiile":"emisie","emisiilor":"emisie","emisile":"emis","emisilor":"emis","emisiunea":"emisiune","emisiuni":"emisiune","emisiunii":"emisiune","emisiunile":"emisiune","emisiunilor":"emisiune","emisiva":["emisivă","emisiv","emisiva","emisiv"],"emisive":"emisiv","emisivele":"emisiv","emisivi":"emisiv","emisivii":"emisiv","emisivul":"emisiv","emistihul":"emistih","emistihule":"emistih","emistihului":"emistih","emistihuri":"emistih","emistihurile":"emistih","emistihurilor":"emistih","emisul":"emis","emisule":"emis","emisului":"emis","emit":"emite","emita":["emită","emite","emiță","emite"],"emitand":"emite","emitante":"emitanță","emitantei":"emitanță","emitantele":"emitanță","emitantelor":"emitanță","emitatoare de radio":"emițător de radio","emitatori":"emițător","emitatorile":"emițător","emitatorilor":"emițător","emitatorul":"emițător","emitatorule":"emițător","emitatorului":"emițător","emitea":"emite","emiteai":"emite","emiteam":"emite","emiteati":"emite","emiteau":"emite","emitem":"emite","emitenta":["emitentă","emitent","emitenta","emitent"],"emitente":"emitent","emitentele":"emitent","emitenti":"emitent","emitentii":"emitent","emitentilor":"emitent","emitentul":"emitent","emitentule":"emitent","emitentului":"emitent","emiterea":"emitere","emiteri":"emitere","emiterii":"emitere","emiterile":"emitere","emiterilor":"emitere","emiteti":"emite","emiti":"emite","emitori":"emitor","emitorii":"emitor","emitorilor":"emitor","emitorul":"emitor","emitorule":"emitor","emitorului":"emitor","emnietul":"emniet","emnietule":"emniet","emnietului":"emniet","emnieturi":"emniet","emnieturile":"emniet","emnieturilor":"emniet","emociunea":"emociune","emociuni":"emociune","emociunii":"emociune","emojiul":"emoji","emojiule":"emoji","emojiului":"emoji","emojiuri":"emoji","emojiurile":"emoji","emojiurilor":"emoji","emolienti":"emolient","emolientile":"emolient","emolientilor":"emolient","emolientul":"emolient","emolientule":"emolient","emolientului":"emolient","emolumentara":["emolumentară","emolumentar","emolumentara","emolumentar"],"emolumentare":"emolumentar","emolumentarele":"emolumentar","emolumentari":"emolumentar","emolumentarii":"emolumentar","emolumentarul":"emolumentar","emolumente":"emolument","emolumentele":"emolument","emolumentelor":"emolument","emolumentul":"emolument","emolumentule":"emolument","emolumentului":"emolument","emonctiunea":"emoncțiune","emonctiuni":"emoncțiune","emonctiunii":"emoncțiune","emonctiunile":"emoncțiune","emonctiunilor":"emoncțiune","emonctorii":"emonctoriu","emonctoriile":"emonctoriu","emonctoriilor":"emonctoriu","emonctoriul":"emonctoriu","emonctoriule":"emonctoriu","emonctoriului":"emonctoriu","emotia":"emoție","emoticoane":"emoticon","emoticoanele":"emoticon","emoticoanelor":"emoticon","emoticonul":"emoticon","emoticonule":"emoticon","emoticonului":"emoticon","emotiei":"emoție","emotii":"emoție","emotiile":"emoție","emotiilor":"emoție","emotionabila":["emoționabilă","emoționabil","emoționabila","emoționabil"],"emotionabile":"emoționabil","emotionabilele":"emoționabil","emotionabili":"emoționabil","emotionabilii":"emoționabil","emotionabilitatati":"emoționabilitate","emotionabilitatatii":"emoționabilitate","emotionabilitatatile":"emoționabilitate","emotionabilitatatilor":"emoționabilitate","emotionabilitatea":"emoționabilitate","emotionabilul":"emoționabil","emotionai":"emoționa","emotionala":["emoțională","emoțional","emoționala","emoțional"],"emotionale":"emoțional","emotionalele":"emoțional","emotionali":"emoțional","emotionalii":"emoțional","emotionalitatea":"emoționalitate","emotionalitati":"emoționalitate","emotionalitatii":"emoționalitate","emotionalul":"emoțional","emotionam":["emoționăm","emoționa","emoționam","emoționa"],"emotionand":"emoționa","emotionanta":["emoționantă","emoționant","emoționanta","emoționant"],"emotionante":"emoționant","emotionantele":"emoționant","emotionanti":"emoționant","emotionantii":"emoționant","emotionantul":"emoționant","emotionara":"emoționa","emotionaram":"emoționa","emotionarati":"emoționa","emotionarea":"emoționare","emotionari":"emoționare","emotionarii":"emoționare","emotionarile":"emoționare","emotionarilor":"emoționare","emotionase":"emoționa","emotionasem":"emoționa","emotionasera":"emoționa","emotionaseram":"emoționa","emotionaserati":"emoționa","emotionasesi":"emoționa","emotionasi":"emoționa","emotionat":"emoționa","emotionata":["emoționată","emoționat","emoționata","emoționat"],"emotionate":"emoționat","emotionatele":"emoționat","emotionati":["emoționați","emoționa","emoționați","emoționat"],"emotionatii":"emoționat","emotionatul":"emoționat","emotionau":"emoționa","emotioneaza":"emoționa","emotionez":"emoționa","emotionezi":"emoționa","emotiunea":"emoțiune","emotiuni":"emoțiune","emotiunii":"emoțiune","emotiunile":"emoțiune","emotiunilor":"emoțiune","emotiva":["emotivă","emotiv","emotiva","emotiv"],"emotive":"emotiv","emotivele":"emotiv","emotivi":"emotiv","emotivii":"emotiv","emotivismul":"emotivism","emotivismule":"emotivism","emotivismului":"emotivism","emotivitatea":"emotivitate","emotivitati":"emotivitate","emotivitatii":"emotivitate","emotivitatile":"emotivitate","emotivitatilor":"emotivitate","emotivul":"emotiv","empatetica":["empatetică","empatetic","empatetica","empatetic"],"empatetice":"empatetic","empateticele":"empatetic","empatetici":"empatetic","empateticii":"empatetic","empateticul":"empatetic","empatia":"empatie","empatiei":"empatie","empatii":"empatie","empirea":"empire","empiree":"empireu","empireea":"empireu","empireele":"empireu","empirei":"empireu","empireii":"empireu","empirele":"empire","empireul":"empireu","empireumatica":["empireumatică","empireumatic","empireumatica","empireumatic"],"empireumatice":"empireumatic","empireumaticele":"empireumatic","empireumatici":"empireumatic","empireumaticii":"empireumatic","empireumaticul":"empireumatic","empiri":"empire","empiria":"empirie","empirica":["empirică","empiric","empirica","empiric"],"empirice":"empiric","empiriceasca":["empiricească","empiricesc","empiriceasca","empiricesc"],"empiricele":"empiric","empiricescul":"empiricesc","empiricesti":"empiricesc","empiricestii":"empiricesc","empiricestile":"empiricesc","empirici":"empiric","empiricii":"empiric","empiricul":"empiric","empiriei":"empirie","empirii":["empirii","empire","empirii","empirie"],"empiriile":"empirie","empiriilor":"empirie","empiriocritica":["empiriocritică","empiriocritic","empiriocritica","empiriocritic"],"empiriocritice":"empiriocritic","empiriocriticele":"empiriocritic","empiriocritici":"empiriocritic","empiriocriticii":"empiriocritic","empiriocriticilor":"empiriocritic","empiriocriticismul":"empiriocriticism","empiriocriticismule":"empiriocriticism","empiriocriticismului":"empiriocriticism","empiriocriticul":"empiriocritic","empiriocriticule":"empiriocritic","empiriocriticului":"empiriocritic","empiriomonisti":"empiriomonist","empiriomonistii":"empiriomonist","empiriomonistilor":"empiriomonist","empiriomonistul":"empiriomonist","empiriomonistule":"empiriomonist","empiriomonistului":"empiriomonist","empiriosimbolisme":"empiriosimbolism","empiriosimbolismele":"empiriosimbolism","empiriosimbolismelor":"empiriosimbolism","empiriosimbolismul":"empiriosimbolism","empiriosimbolismule":"empiriosimbolism","empiriosimbolismului":"empiriosimbolism","empirisme":"empirism","empirismele":"empirism","empirismelor":"empirism","empirismul":"empirism","empirismule":"empirism","empirismului":"empirism","empiriste":"empiristă","empiristei":"empiristă","empiristele":"empiristă","empiristelor":"empiristă","empiristi":"empirist","empiristii":"empirist","empiristilor":"empirist","empiristul":"empirist","empiristule":"empirist","empiristului":"empirist","emplastica":["emplastică","emplastic","emplastica","emplastic"],"emplastice":"emplastic","emplasticele":"emplastic","emplastici":"emplastic","emplasticii":"emplastic","emplasticul":"emplastic","emporii":"emporiu","emporiile":"emporiu","emporiilor":"emporiu","emporiul":"emporiu","emporiule":"emporiu","emporiului":"emporiu","emui":"emu","emulai":"emula","emulam":["emulăm","emula","emulam","emula"],"emuland":"emula","emulara":"emula","emularam":"emula","emularati":"emula","emularea":"emulare","emulari":"emulare","emularii":"emulare","emularile":"emulare","emularilor":"emulare","emulase":"emula","emulasem":"emula","emulasera":"emula","emulaseram":"emula","emulaserati":"emula","emulasesi":"emula","emulasi":"emula","emulat":"emula","emulati":"emula","emulatia":"emulație","emulatiei":"emulație","emulatii":"emulație","emulatiile":"emulație","emulatiilor":"emulație","emulatiunea":["emulațiunea","emulațiune","emulățiunea","emulățiune"],"emulatiuni":["emulațiuni","emulațiune","emulățiuni","emulățiune"],"emulatiunii":["emulațiunii","emulațiune","emulățiunii","emulățiune"],"emulatiunile":"emulațiune","emulatiunilor":"emulațiune","emulativa":["emulativă","emulativ","emulativa","emulativ"],"emulative":"emulativ","emulativele":"emulativ","emulativi":"emulativ","emulativii":"emulativ","emulativul":"emulativ","emulatoare":"emulator","emulatoarea":"emulator","emulatoarele":"emulator","emulatori":"emulator","emulatorii":"emulator","emulatorul":"emulator","emulau":"emula","emuleaza":"emula","emulez":"emula","emulezi":"emula","emulgatori":"emulgator","emulgatorii":"emulgator","emulgatorilor":"emulgator","emulgatorul":"emulgator","emulgatorule":"emulgator","emulgatorului":"emulgator","emuli":"emul","emulii":"emul","emulilor":"emul","emulor":"emu","emulsia":"emulsie","emulsiei":"emulsie","emulsii":"emulsie","emulsiile":"emulsie","emulsiilor":"emulsie","emulsine":"emulsină","emulsinei":"emulsină","emulsinele":"emulsină","emulsinelor":"emulsină","emulsionabila":["emulsionabilă","emulsionabil","emulsionabila","emulsionabil"],"emulsionabile":"emulsionabil","emulsionabilele":"emulsionabil","emulsionabili":"emulsionabil","emulsionabilii":"emulsionabil","emulsionabilul":"emulsionabil","emulsionai":"emulsiona","emulsionam":["emulsionăm","emulsiona","emulsionam","emulsiona"],"emulsionand":"emulsiona","emulsionante":"emulsionant","emulsionantele":"emulsionant","emulsionantelor":"emulsionant","emulsionantul":"emulsionant","emulsionantule":"emulsionant","emulsionantului":"emulsionant","emulsionara":"emulsiona","emulsionaram":"emulsiona","emulsionarati":"emulsiona","emulsionarea":"emulsionare","emulsionari":"emulsionare","emulsionarii":"emulsionare","emulsionarile":"emulsionare","emulsionarilor":"emulsionare","emulsionase":"emulsiona","emulsionasem":"emulsiona","emulsionasera":"emulsiona","emulsionaseram":"emulsiona","emulsionaserati":"emulsiona","emulsionasesi":"emulsiona","emulsionasi":"emulsiona","emulsionat":"emulsiona","emulsionati":"emulsiona","emulsionau":"emulsiona","emulsioneaza":"emulsiona","emulsionez":"emulsiona","emulsionezi":"emulsiona","emulsiunea":"emulsiune","emulsiuni":"emulsiune","emulsiunii":"emulsiune","emulsiunile":"emulsiune","emulsiunilor":"emulsiune","emulsivi":"emulsiv","emulsivile":"emulsiv","emulsivilor":"emulsiv","emulsivul":"emulsiv","emulsivule":"emulsiv","emulsivului":"emulsiv","emulsoare":"emulsor","emulsoarele":"emulsor","emulsoarelor":"emulsor","emulsorul":"emulsor","emulsorule":"emulsor","emulsorului":"emulsor","emulul":"emul","emulule":"emul","emulului":"emul","emuul":"emu","emuule":"emu","emuului":"emu","enanteme":"enantem","enantemele":"enantem","enantemelor":"enantem","enantemul":"enantem","enantemule":"enantem","enantemului":"enantem","enantica":["enantică","enantic","enantica","enantic"],"enantice":"enantic","enanticele":"enantic","enantici":"enantic","enanticii":"enantic","enanticul":"enantic","enantiomeri":"enantiomer","enantiomerii":"enantiomer","enantiomerilor":"enantiomer","enantiomerul":"enantiomer","enantiomerule":"enantiomer","enantiomerului":"enantiomer","enantiomorfa":["enantiomorfă","enantiomorf","enantiomorfa","enantiomorf"],"enantiomorfe":"enantiomorf","enantiomorfele":"enantiomorf","enantiomorfi":"enantiomorf","enantiomorfia":"enantiomorfie","enantiomorfiei":"enantiomorfie","enantiomorfii":["enantiomorfii","enantiomorf","enantiomorfii","enantiomorfie"],"enantiomorfiile":"enantiomorfie","enantiomorfiilor":"enantiomorfie","enantiomorfisme":"enantiomorfism","enantiomorfismele":"enantiomorfism","enantiomorfismelor":"enantiomorfism","enantiomorfismul":"enantiomorfism","enantiomorfismule":"enantiomorfism","enantiomorfismului":"enantiomorfism","enantiomorful":"enantiomorf","enantiotropa":["enantiotropă","enantiotrop","enantiotropa","enantiotrop"],"enantiotrope":"enantiotrop","enantiotropele":"enantiotrop","enantiotropi":"enantiotrop","enantiotropia":"enantiotropie","enantiotropiei":"enantiotropie","enantiotropii":["enantiotropii","enantiotrop","enantiotropii","enantiotropie"],"enantiotropul":"enantiotrop","enantioze":"enantioză","enantiozei":"enantioză","enantiozele":"enantioză","enantiozelor":"enantioză","enarai":"enara","enaram":["enarăm","enara","enaram","enara"],"enarand":"enara","enarara":"enara","enararam":"enara","enararati":"enara","enararea":"enarare","enarari":"enarare","enararii":"enarare","enararile":"enarare","enararilor":"enarare","enarase":"enara","enarasem":"enara","enarasera":"enara","enaraseram":"enara","enaraserati":"enara","enarasesi":"enara","enarasi":"enara","enarat":"enara","enarati":"enara","enarau":"enara","enareaza":"enara","enarez":"enara","enarezi":"enara","enargitul":"enargit","enargitule":"enargit","enargitului":"enargit","enarmonia":"enarmonie","enarmonica":["enarmonică","enarmonic","enarmonica","enarmonic"],"enarmonice":"enarmonic","enarmonicele":"enarmonic","enarmonici":"enarmonic","enarmonicii":"enarmonic","enarmonicul":"enarmonic","enarmoniei":"enarmonie","enarmonii":"enarmonie","enarmoniile":"enarmonie","enarmoniilor":"enarmonie","enarmonismul":"enarmonism","enarmonismule":"enarmonism","enarmonismului":"enarmonism","enartroze":"enartroză","enartrozei":"enartroză","enartrozele":"enartroză","enartrozelor":"enartroză","encarpaul":"encarpă","encarpaule":"encarpă","encarpaului":"encarpă","encarpe":"encarpă","encarpele":"encarpă","encarpelor":"encarpă","encaustici":"encaustic","encausticii":"encaustic","encausticilor":"encaustic","encausticul":"encaustic","encausticule":"encaustic","encausticului":"encaustic","encefale":"encefal","encefalele":"encefal","encefalelor":"encefal","encefalica":["encefalică","encefalic","encefalica","encefalic"],"encefalice":"encefalic","encefalicele":"encefalic","encefalici":"encefalic","encefalicii":"encefalic","encefalicul":"encefalic","encefaline":"encefalină","encefalinei":"encefalină","encefalinele":"encefalină","encefalinelor":"encefalină","encefalite":"encefalită","encefalitei":"encefalită","encefalitele":"encefalită","encefalitelor":"encefalită","encefalitica":["encefalitică","encefalitic","encefalitica","encefalitic"],"encefalitice":"encefalitic","encefaliticele":"encefalitic","encefalitici":"encefalitic","encefaliticii":"encefalitic","encefaliticul":"encefalitic","encefalocele":"encefalocel","encefalocelele":"encefalocel","encefalocelelor":"encefalocel","encefalocelul":"encefalocel","encefalocelule":"encefalocel","encefalocelului":"encefalocel","encefalografia":"encefalografie","encefalografiei":"encefalografie","encefalografii":"encefalografie","encefalografiile":"encefalografie","encefalografiilor":"encefalografie","encefalograme":"encefalogramă","encefalogramei":"encefalogramă","encefalogramele":"encefalogramă","encefalogramelor":"encefalogramă","encefaloida":["encefaloidă","encefaloid","encefaloida","encefaloid"],"encefaloide":"encefaloid","encefaloidele":"encefaloid","encefaloidul":"encefaloid","encefaloizi":"encefaloid","encefaloizii":"encefaloid","encefalomalacia":"encefalomalacie","encefalomalaciei":"encefalomalacie","encefalomalacii":"encefalomalacie","encefalomalaciile":"encefalomalacie","encefalomalaciilor":"encefalomalacie","encefalomielite":"encefalomielită","encefalomielitei":"encefalomielită","encefalomielitele":"encefalomielită","encefalomielitelor":"encefalomielită","encefalopatia":"encefalopatie","encefalopatiei":"encefalopatie","encefalopatii":"encefalopatie","encefalopatiile":"encefalopatie","encefalopatiilor":"encefalopatie","encefaloscoape":"encefaloscop","encefaloscoapele":"encefaloscop","encefaloscoapelor":"encefaloscop","encefaloscopul":"encefaloscop","encefaloscopule":"encefaloscop","encefaloscopului":"encefaloscop","encefaloze":"encefaloză","encefalozei":"encefaloză","encefalozele":"encefaloză","encefalozelor":"encefaloză","encefalul":"encefal","encefalule":"encefal","encefalului":"encefal","enchiclopediceasca":["enchiclopedicească","enchiclopedicesc","enchiclopediceasca","enchiclopedicesc"],"enchiclopedicescul":"enchiclopedicesc","enchiclopedicesti":"enchiclopedicesc","enchiclopedicestii":"enchiclopedicesc","enchiclopedicestile":"enchiclopedicesc","enchimoze":"enchimoză","enchimozei":"enchimoză","enchimozele":"enchimoză","enchimozelor":"enchimoză","encicleme":"enciclemă","enciclemei":"enciclemă","enciclica":["enciclică","enciclic","enciclica","enciclic"],"enciclice":["enciclice","enciclic","enciclice","enciclică"],"enciclicei":"enciclică","enciclicele":["enciclicele","enciclic","enciclicele","enciclică"],"enciclicelor":"enciclică","enciclici":"enciclic","enciclicii":"enciclic","enciclicul":"enciclic","enciclopedia":"enciclopedie","enciclopedica":["enciclopedică","enciclopedic","enciclopedica","enciclopedic"],"enciclopedice":"enciclopedic","enciclopedicele":"enciclopedic","enciclopedici":"enciclopedic","enciclopedicii":"enciclopedic","enciclopedicul":"enciclopedic","enciclopediei":"enciclopedie","enciclopedii":"enciclopedie","enciclopediile":"enciclopedie","enciclopediilor":"enciclopedie","enciclopedisme":"enciclopedism","enciclopedismele":"enciclopedism","enciclopedismelor":"enciclopedism","enciclopedismul":"enciclopedism","enciclopedismule":"enciclopedism","enciclopedismului":"enciclopedism","enciclopediste":"enciclopedistă","enciclopedistei":"enciclopedistă","enciclopedistele":"enciclopedistă","enciclopedistelor":"enciclopedistă","enciclopedisti":"enciclopedist","enciclopedistii":"enciclopedist","enciclopedistilor":"enciclopedist","enciclopedistul":"enciclopedist","enciclopedistule":"enciclopedist","enciclopedistului":"enciclopedist","enciclopedul":"encicloped","enciclopedule":"encicloped","enciclopedului":"encicloped","enciclopezi":"encicloped","enciclopezii":"encicloped","enciclopezilor":"encicloped","enclave":"enclavă","enclavei":"enclavă","enclavele":"enclavă","enclavelor":"enclavă","enclitica":["enclitică","enclitic","enclitica","enclitic"],"enclitice":"enclitic","encliticele":"enclitic","enclitici":"enclitic","encliticii":"enclitic","encliticul":"enclitic","enclize":"encliză","enclizei":"encliză","enclizele":"encliză","enclizelor":"encliză","encomiastica":["encomiastică","encomiastic","encomiastica","encomiastic"],"encomiastice":"encomiastic","encomiasticeasca":["encomiasticească","encomiasticesc","encomiasticeasca","encomiasticesc"],"encomiasticele":"encomiastic","encomiasticescul":"encomiasticesc","encomiasticesti":"encomiasticesc","encomiasticestii":"encomiasticesc","encomiasticestile":"encomiasticesc","encomiastici":"encomiastic","encomiasticii":"encomiastic","encomiasticul":"encomiastic","encomii":"encomiu","encomiii":"encomiu","encomiilor":"encomiu","encomioane":"encomion","encomioanele":"encomion","encomioanelor":"encomion","encomionul":"encomion","encomionule":"encomion","encomionului":"encomion","encomiul":"encomiu","encomiule":"encomiu","encomiului":"encomiu","encondroame":"encondrom","encondroamele":"encondrom","encondroamelor":"encondrom","encondromul":"encondrom","encondromule":"encondrom","encondromului":"encondrom","endarterectomia":"endarterectomie","endarterectomiei":"endarterectomie","endarterectomii":"endarterectomie","endarterectomiile":"endarterectomie","endarterectomiilor":"endarterectomie","endarterite":"endarterită","endarteritei":"endarterită","endarteritele":"endarterită","endarteritelor":"endarterită","endaseaua":"endasea","endasele":"endasea","endaselei":"endasea","endaselele":"endasea","endaselelor":"endasea","endecagoane":"endecagon","endecagoanele":"endecagon","endecagoanelor":"endecagon","endecagonul":"endecagon","endecagonule":"endecagon","endecagonului":"endecagon","endecasilabi":"endecasilab","endecasilabica":["endecasilabică","endecasilabic","endecasilabica","endecasilabic"],"endecasilabice":"endecasilabic","endecasilabicele":"endecasilabic","endecasilabici":"endecasilabic","endecasilabicii":"endecasilabic","endecasilabicul":"endecasilabic","endecasilabii":"endecasilab","endecasilabilor":"endecasilab","endecasilabul":"endecasilab","endecasilabule":"endecasilab","endecasilabului":"endecasilab","endemia":"endemie","endemica":["endemică","endemic","endemica","endemic"],"endemice":"endemic","endemicele":"endemic","endemici":"endemic","endemicii":"endemic","endemicitatea":"endemicitate","endemicitati":"endemicitate","endemicitatii":"endemicitate","endemicitatile":"endemicitate","endemicitatilor":"endemicitate","endemicul":"endemic","endemiei":"endemie","endemii":"endemie","endemiile":"endemie","endemiilor":"endemie","endemismul":"endemism","endemismule":"endemism","endemismului":"endemism","endemoepidemica":["endemoepidemică","endemoepidemic","endemoepidemica","endemoepidemic"],"endemoepidemice":"endemoepidemic","endemoepidemicele":"endemoepidemic","endemoepidemici":"endemoepidemic","endemoepidemicii":"endemoepidemic","endemoepidemicul":"endemoepidemic","endoblastica":["endoblastică","endoblastic","endoblastica","endoblastic"],"endoblastice":"endoblastic","endoblasticele":"endoblastic","endoblastici":"endoblastic","endoblasticii":"endoblastic","endoblasticul":"endoblastic","endoblastul":"endoblast","endoblastule":"endoblast","endoblastului":"endoblast","endocardica":["endocardică","endocardic","endocardica","endocardic"],"endocardice":"endocardic","endocardicele":"endocardic","endocardici":"endocardic","endocardicii":"endocardic","endocardicul":"endocardic","endocardite":"endocardită","endocarditei":"endocardită","endocarditele":"endocardită","endocarditelor":"endocardită","endocardul":"endocard","endocardule":"endocard","endocardului":"endocard","endocarduri":"endocard","endocardurile":"endocard","endocardurilor":"endocard","endocarpul":"endocarp","endocarpule":"endocarp","endocarpului":"endocarp","endocarpuri":"endocarp","endocarpurile":"endocarp","endocarpurilor":"endocarp","endocervicite":"endocervicită","endocervicitei":"endocervicită","endocervicitele":"endocervicită","endocervicitelor":"endocervicită","endocranii":"endocraniu","endocraniile":"endocraniu","endocraniilor":"endocraniu","endocraniul":"endocraniu","endocraniule":"endocraniu","endocraniului":"endocraniu","endocrina":["endocrină","endocrin","endocrina","endocrin"],"endocrine":"endocrin","endocrinele":"endocrin","endocrini":"endocrin","endocriniana":["endocriniană","endocrinian","endocriniana","endocrinian"],"endocrinianul":"endocrinian","endocrinica":["endocrinică","endocrinic","endocrinica","endocrinic"],"endocrinice":"endocrinic","endocrinicele":"endocrinic","endocrinici":"endocrinic","endocrinicii":"endocrinic","endocrinicul":"endocrinic","endocriniene":"endocrinian","endocrinienele":"endocrinian","endocrinieni":"endocrinian","endocrinienii":"endocrinian","endocrinii":"endocrin","endocrinologa":["endocrinologă","endocrinolog","endocrinologa","endocrinolog"],"endocrinologe":["endocrinologe","endocrinolog","endocrinologe","endocrinologă"],"endocrinologei":"endocrinologă","endocrinologele":["endocrinologele","endocrinolog","endocrinologele","endocrinologă"],"endocrinologelor":"endocrinologă","endocrinologi":"endocrinolog","endocrinologia":"endocrinologie","endocrinologica":["endocrinologică","endocrinologic","endocrinologica","endocrinologic"],"endocrinologice":"endocrinologic","endocrinologicele":"endocrinologic","endocrinologici":"endocrinologic","endocrinologicii":"endocrinologic","endocrinologicul":"endocrinologic","endocrinologiei":"endocrinologie","endocrinologii":["endocrinologii","endocrinolog","endocrinologii","endocrinologie"],"endocrinologul":"endocrinolog","endocrinopatia":"endocrinopatie","endocrinopatiei":"endocrinopatie","endocrinopatii":"endocrinopatie","endocrinopatiile":"endocrinopatie","endocrinopatiilor":"endocrinopatie","endocrinoterapia":"endocrinoterapie","endocrinoterapiei":"endocrinoterapie","endocrinoterapii":"endocrinoterapie","endocrinul":"endocrin","endoderme":"endoderm","endodermele":"endoderm","endodermelor":"endoderm","endodermica":["endodermică","endodermic","endodermica","endodermic"],"endodermice":"endodermic","endodermicele":"endodermic","endodermici":"endodermic","endodermicii":"endodermic","endodermicul":"endodermic","endodermul":"endoderm","endodermule":"endoderm","endodermului":"endoderm","endoenzime":"endoenzimă","endoenzimei":"endoenzimă","endoenzimele":"endoenzimă","endoenzimelor":"endoenzimă","endofazia":"endofazie","endofaziei":"endofazie","endofazii":"endofazie","endofaziile":"endofazie","endofaziilor":"endofazie","endofita":["endofită","endofit","endofita","endofit"],"endofite":"endofit","endofitele":"endofit","endofiti":"endofit","endofitii":"endofit","endofitul":"endofit","endoflebite":"endoflebită","endoflebitei":"endoflebită","endoflebitele":"endoflebită","endoflebitelor":"endoflebită","endogama":["endogamă","endogam","endogama","endogam"],"endogame":"endogam","endogamele":"endogam","endogami":"endogam","endogamia":"endogamie","endogamiei":"endogamie","endogamii":["endogamii","endogam","endogamii","endogamie"],"endogamul":"endogam","endogena":["endogenă","endogen","endogena","endogen"],"endogene":"endogen","endogenele":"endogen","endogeneze":"endogeneză","endogenezei":"endogeneză","endogenezele":"endogeneză","endogenezelor":"endogeneză","endogeni":"endogen","endogenii":"endogen","endogenul":"endogen","endolimfe":"endolimfă","endolimfei":"endolimfă","endometriala":["endometrială","endometrial","endometriala","endometrial"],"endometriale":"endometrial","endometrialele":"endometrial","endometriali":"endometrial","endometrialii":"endometrial","endometrialul":"endometrial","endometrioame":"endometriom","endometrioamele":"endometriom","endometrioamelor":"endometriom","endometriomul":"endometriom","endometriomule":"endometriom","endometriomului":"endometriom","endometrioze":"endometrioză","endometriozei":"endometrioză","endometriozele":"endometrioză","endometriozelor":"endometrioză","endometrite":"endometrită","endometritei":"endometrită","endometritele":"endometrită","endometritelor":"endometrită","endometrul":"endometru","endometrule":"endometru","endometrului":"endometru","endomitoze":"endomitoză","endomitozei":"endomitoză","endomitozele":"endomitoză","endomitozelor":"endomitoză","endomorfisme":"endomorfism","endomorfismele":"endomorfism","endomorfismelor":"endomorfism","endomorfismul":"endomorfism","endomorfismule":"endomorfism","endomorfismului":"endomorfism","endonazala":["endonazală","endonazal","endonazala","endonazal"],"endonazale":"endonazal","endonazalele":"endonazal","endonazali":"endonazal","endonazalii":"endonazal","endonazalul":"endonazal","endoparazita":["endoparazită","endoparazit","endoparazita","endoparazit"],"endoparazite":"endoparazit","endoparazitele":"endoparazit","endoparaziti":"endoparazit","endoparazitii":"endoparazit","endoparazitul":"endoparazit","endopericardite":"endopericardită","endopericarditei":"endopericardită","endopericarditele":"endopericardită","endopericarditelor":"endopericardită","endoplasmatica":["endoplasmatică","endoplasmatic","endoplasmatica","endoplasmatic"],"endoplasmatice":"endoplasmatic","endoplasmaticele":"endoplasmatic","endoplasmatici":"endoplasmatic","endoplasmaticii":"endoplasmatic","endoplasmaticul":"endoplasmatic","endoplasme":"endoplasmă","endoplasmei":"endoplasmă","endoplasmele":"endoplasmă","endoplasmelor":"endoplasmă","endoplaste":"endoplastă","endoplastei":"endoplastă","endoreica":["endoreică","endoreic","endoreica","endoreic"],"endoreice":"endoreic","endoreicele":"endoreic","endoreici":"endoreic","endoreicii":"endoreic","endoreicul":"endoreic","endosarce":"endosarc","endosarcele":"endosarc","endosarcelor":"endosarc","endosarcul":"endosarc","endosarcule":"endosarc","endosarcului":"endosarc","endoscheletul":"endoschelet","endoscheletule":"endoschelet","endoscheletului":"endoschelet","endoscoape":"endoscop","endoscoapele":"endoscop","endoscoapelor":"endoscop","endoscopia":"endoscopie","endoscopica":["endoscopică","endoscopic","endoscopica","endoscopic"],"endoscopice":"endoscopic","endoscopicele":"endoscopic","endoscopici":"endoscopic","endoscopicii":"endoscopic","endoscopicul":"endoscopic","endoscopiei":"endoscopie","endoscopii":"endoscopie","endoscopul":"endoscop","endoscopule":"endoscop","endoscopului":"endoscop","endosmometre":"endosmometru","endosmometrele":"endosmometru","endosmometrelor":"endosmometru","endosmometruul":"endosmometru","endosmometruule":"endosmometru","endosmometruului":"endosmometru","endosmotica":["endosmotică","endosmotic","endosmotica","endosmotic"],"endosmotice":"endosmotic","endosmoticele":"endosmotic","endosmotici":"endosmotic","endosmoticii":"endosmotic","endosmoticul":"endosmotic","endosmoze":"endosmoză","endosmozei":"endosmoză","endosmozele":"endosmoză","endosmozelor":"endosmoză","endosperme":"endosperm","endospermele":"endosperm","endospermelor":"endosperm","endospermul":"endosperm","endospermule":"endosperm","endospermului":"endosperm","endoteliala":["endotelială","endotelial","endoteliala","endotelial"],"endoteliale":"endotelial","endotelialele":"endotelial","endoteliali":"endotelial","endotelialii":"endotelial","endotelialul":"endotelial","endotelii":"endoteliu","endoteliile":"endoteliu","endoteliilor":"endoteliu","endotelioame":"endoteliom","endotelioamele":"endoteliom","endotelioamelor":"endoteliom","endoteliomul":"endoteliom","endoteliomule":"endoteliom","endoteliomului":"endoteliom","endotelite":"endotelită","endotelitei":"endotelită","endotelitele":"endotelită","endotelitelor":"endotelită","endoteliul":"endoteliu","endoteliule":"endoteliu","endoteliului":"endoteliu","endoterma":["endotermă","endoterm","endoterma","endoterm"],"endoterme":"endoterm","endotermele":"endoterm","endotermi":"endoterm","endotermia":"endotermie","endotermica":["endotermică","endotermic","endotermica","endotermic"],"endotermice":"endotermic","endotermicele":"endotermic","endotermici":"endotermic","endotermicii":"endotermic","endotermicul":"endotermic","endotermiei":"endotermie","endotermii":["endotermii","endoterm","endotermii","endotermie"],"endotermul":"endoterm"};
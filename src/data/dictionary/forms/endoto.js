@@ -0,0 +1 @@
+export default {"endotoxine":"endotoxină","endotoxinei":"endotoxină","endotoxinele":"endotoxină","endotoxinelor":"endotoxină","eneade":"eneadă","eneadei":"eneadă","eneagoane":"eneagon","eneagoanele":"eneagon","eneagoanelor":"eneagon","eneagonala":["eneagonală","eneagonal","eneagonala","eneagonal"],"eneagonale":"eneagonal","eneagonalele":"eneagonal","eneagonali":"eneagonal","eneagonalii":"eneagonal","eneagonalul":"eneagonal","eneagonul":"eneagon","eneagonule":"eneagon","eneagonului":"eneagon","eneoliticul":"eneolitic","eneoliticule":"eneolitic","eneoliticului":"eneolitic","energetica":["energetică","energetic","energetica","energetic"],"energetice":"energetic","energeticele":"energetic","energetici":["energetici","energetic","energetici","energetică"],"energeticianul":"energetician","energeticianule":"energetician","energeticianului":"energetician","energeticieni":"energetician","energeticienii":"energetician","energeticienilor":"energetician","energeticii":["energeticii","energetic","energeticii","energetică"],"energeticile":"energetică","energeticilor":"energetică","energeticul":"energetic","energetiste":"energetistă","energetistei":"energetistă","energetistele":"energetistă","energetistelor":"energetistă","energetisti":"energetist","energetistii":"energetist","energetistilor":"energetist","energetistul":"energetist","energetistule":"energetist","energetistului":"energetist","energhicoasa":["energhicoasă","energhicos","energhicoasa","energhicos"],"energhicoase":"energhicos","energhicoasele":"energhicos","energhicosi":"energhicos","energhicosii":"energhicos","energhicosul":"energhicos","energhie":"energie","energhis":"energhisi","energhise":"energhisi","energhisea":"energhisi","energhiseai":"energhisi","energhiseam":"energhisi","energhiseati":"energhisi","energhiseau":"energhisi","energhisie":"energhisi","energhisii":"energhisi","energhisim":"energhisi","energhisind":"energhisi","energhisira":"energhisi","energhisiram":"energhisi","energhisirati":"energhisi","energhisise":"energhisi","energhisisem":"energhisi","energhisisera":"energhisi","energhisiseram":"energhisi","energhisiserati":"energhisi","energhisisesi":"energhisi","energhisisi":"energhisi","energhisit":"energhisi","energhisiti":"energhisi","energia":"energie","energica":["energică","energic","energica","energic"],"energice":"energic","energicele":"energic","energici":"energic","energicii":"energic","energicul":"energic","energiei":"energie","energii":"energie","energii cinetice":"energie cinetică","energii nucleare":"energie nucleară","energii regenerabile":"energie regenerabilă","energiile":"energie","energiilor":"energie","energioasa":["energioasă","energios","energioasa","energios"],"energioase":"energios","energioasele":"energios","energiosi":"energios","energiosii":"energios","energiosul":"energios","energizanta":["energizantă","energizant","energizanta","energizant"],"energizante":"energizant","energizantele":"energizant","energizanti":"energizant","energizantii":"energizant","energizantul":"energizant","energofaga":["energofagă","energofag","energofaga","energofag"],"energofage":"energofag","energofagele":"energofag","energofagi":"energofag","energofagii":"energofag","energofagul":"energofag","energometre":"energometru","energometrele":"energometru","energometrelor":"energometru","energometrul":"energometru","energometrule":"energometru","energometrului":"energometru","energumeni":"energumen","energumenii":"energumen","energumenilor":"energumen","energumenul":"energumen","energumenule":"energumen","energumenului":"energumen","enervai":"enerva","enervam":["enervăm","enerva","enervam","enerva"],"enervand":"enerva","enervanta":["enervantă","enervant","enervanta","enervant"],"enervante":"enervant","enervantele":"enervant","enervanti":"enervant","enervantii":"enervant","enervantul":"enervant","enervara":"enerva","enervaram":"enerva","enervarati":"enerva","enervarea":"enervare","enervari":"enervare","enervarii":"enervare","enervarile":"enervare","enervarilor":"enervare","enervase":"enerva","enervasem":"enerva","enervasera":"enerva","enervaseram":"enerva","enervaserati":"enerva","enervasesi":"enerva","enervasi":"enerva","enervat":"enerva","enervata":["enervată","enervat","enervata","enervat"],"enervate":"enervat","enervatele":"enervat","enervati":["enervați","enerva","enervați","enervat"],"enervatii":"enervat","enervatul":"enervat","enervau":"enerva","enerveaza":"enerva","enervez":"enerva","enervezi":"enerva","enfaze":"enfaz","enfazele":"enfaz","enfazelor":"enfaz","enfazul":"enfaz","enfazule":"enfaz","enfazului":"enfaz","enfeuri":"enfeu","enfeurile":"enfeu","enfeurilor":"enfeu","enfeuul":"enfeu","enfeuule":"enfeu","enfeuului":"enfeu","engastrimiti":"engastrimit","engastrimitii":"engastrimit","engastrimitilor":"engastrimit","engastrimitul":"engastrimit","engastrimitule":"engastrimit","engastrimitului":"engastrimit","enghiuresali":"enghiureșal","enghiuresalii":"enghiureșal","enghiuresalilor":"enghiureșal","enghiuresalul":"enghiureșal","enghiuresalule":"enghiureșal","enghiuresalului":"enghiureșal","engineeringul":"engineering","engineeringule":"engineering","engineeringului":"engineering","engleza":["engleză","englez","engleza","englez"],"engleze":["engleze","englez","engleze","engleză"],"englezea":"englezi","englezeai":"englezi","englezeam":"englezi","englezeasca":["englezească","englezesc","englezeasca","englezesc"],"englezeati":"englezi","englezeau":"englezi","englezei":"engleză","englezele":"englez","englezesc":"englezi","englezescul":"englezesc","englezeste":"englezi","englezesti":["englezești","englezesc","englezești","englezi"],"englezestii":"englezesc","englezestile":"englezesc","englezi":"englez","englezii":["englezii","englez","englezii","englezi"],"englezilor":"englez","englezim":"englezi","englezind":"englezi","englezira":"englezi","engleziram":"englezi","englezirati":"englezi","englezise":"englezi","englezisem":"englezi","englezisera":"englezi","engleziseram":"englezi","engleziserati":"englezi","englezisesi":"englezi","englezisi":"englezi","englezisme":"englezism","englezismele":"englezism","englezismelor":"englezism","englezismul":"englezism","englezismule":"englezism","englezismului":"englezism","englezit":"englezi","englezita":["englezită","englezit","englezita","englezit"],"englezite":"englezit","englezitele":"englezit","engleziti":["engleziți","englezi","engleziți","englezit"],"englezitii":"englezit","englezitul":"englezit","englezoaice":"englezoaică","englezoaicei":"englezoaică","englezoaicele":"englezoaică","englezoaicelor":"englezoaică","englezul":"englez","englezule":"englez","englezului":"englez","engobe":"engobă","engobei":"engobă","engobele":"engobă","engobelor":"engobă","engolpioane":"engolpion","engolpioanele":"engolpion","engolpioanelor":"engolpion","engolpionul":"engolpion","engolpionule":"engolpion","engolpionului":"engolpion","engrame":"engramă","engramei":"engramă","engramele":"engramă","engramelor":"engramă","enhiridie":"enhiridiu","enhiridiele":"enhiridiu","enhiridielor":"enhiridiu","enhiridiuul":"enhiridiu","enhiridiuule":"enhiridiu","enhiridiuului":"enhiridiu","enigmatica":["enigmatică","enigmatic","enigmatica","enigmatic"],"enigmatice":"enigmatic","enigmaticeasca":["enigmaticească","enigmaticesc","enigmaticeasca","enigmaticesc"],"enigmaticele":"enigmatic","enigmaticescul":"enigmaticesc","enigmaticesti":"enigmaticesc","enigmaticestii":"enigmaticesc","enigmaticestile":"enigmaticesc","enigmatici":"enigmatic","enigmaticii":"enigmatic","enigmaticul":"enigmatic","enigmatizai":"enigmatiza","enigmatizam":["enigmatizăm","enigmatiza","enigmatizam","enigmatiza"],"enigmatizand":"enigmatiza","enigmatizara":"enigmatiza","enigmatizaram":"enigmatiza","enigmatizarati":"enigmatiza","enigmatizase":"enigmatiza","enigmatizasem":"enigmatiza","enigmatizasera":"enigmatiza","enigmatizaseram":"enigmatiza","enigmatizaserati":"enigmatiza","enigmatizasesi":"enigmatiza","enigmatizasi":"enigmatiza","enigmatizat":"enigmatiza","enigmatizati":"enigmatiza","enigmatizau":"enigmatiza","enigmatizeaza":"enigmatiza","enigmatizez":"enigmatiza","enigmatizezi":"enigmatiza","enigme":"enigmă","enigmei":"enigmă","enigmele":"enigmă","enigmelor":"enigmă","enjambamente":"enjambament","enjambamentele":"enjambament","enjambamentelor":"enjambament","enjambamentul":"enjambament","enjambamentule":"enjambament","enjambamentului":"enjambament","enocianine":"enocianină","enocianinei":"enocianină","enocianinele":"enocianină","enocianinelor":"enocianină","enofili":"enofil","enofilii":"enofil","enofililor":"enofil","enofilul":"enofil","enofilule":"enofil","enofilului":"enofil","enoftalmia":"enoftalmie","enoftalmiei":"enoftalmie","enoftalmii":"enoftalmie","enoftalmiile":"enoftalmie","enoftalmiilor":"enoftalmie","enolaze":"enolază","enolazei":"enolază","enolazele":"enolază","enolazelor":"enolază","enolica":["enolică","enolic","enolica","enolic"],"enolice":"enolic","enolicele":"enolic","enolici":"enolic","enolicii":"enolic","enolicul":"enolic","enolizarea":"enolizare","enolizari":"enolizare","enolizarii":"enolizare","enolizarile":"enolizare","enolizarilor":"enolizare","enologe":"enologă","enologei":"enologă","enologele":"enologă","enologelor":"enologă","enologi":"enolog","enologia":"enologie","enologica":["enologică","enologic","enologica","enologic"],"enologice":"enologic","enologicele":"enologic","enologici":"enologic","enologicii":"enologic","enologicul":"enologic","enologiei":"enologie","enologii":["enologii","enolog","enologii","enologie"],"enologilor":"enolog","enologul":"enolog","enologule":"enolog","enologului":"enolog","enoptromantia":"enoptromanție","enoptromantiei":"enoptromanție","enoptromantii":"enoptromanție","enoptromantiile":"enoptromanție","enoptromantiilor":"enoptromanție","enoria":"enorie","enoriala":["enorială","enorial","enoriala","enorial"],"enoriale":"enorial","enorialele":"enorial","enoriali":"enorial","enorialii":"enorial","enorialul":"enorial","enoriase":"enoriașă","enoriasei":"enoriașă","enoriasele":"enoriașă","enoriaselor":"enoriașă","enoriasi":"enoriaș","enoriei":"enorie","enorii":"enorie","enoriile":"enorie","enoriilor":"enorie","enorma":["enormă","enorm","enorma","enorm"],"enorme":"enorm","enormele":"enorm","enormi":"enorm","enormii":"enorm","enormitatea":"enormitate","enormitati":"enormitate","enormitatii":"enormitate","enormitatile":"enormitate","enormitatilor":"enormitate","enormul":"enorm","enostoze":"enostoză","enostozei":"enostoză","enostozele":"enostoză","enostozelor":"enostoză","enotehnice":"enotehnică","enotehnicei":"enotehnică","enoti":"enot","enotii":"enot","enotilor":"enot","enotul":"enot","enotule":"enot","enotului":"enot","ensiforma":["ensiformă","ensiform","ensiforma","ensiform"],"ensiforme":"ensiform","ensiformele":"ensiform","ensiformi":"ensiform","ensiformii":"ensiform","ensiformul":"ensiform","enstatitul":"enstatit","enstatitule":"enstatit","enstatitului":"enstatit","entalpia":"entalpie","entalpiei":"entalpie","entalpii":"entalpie","entelehia":"entelehie","entelehiei":"entelehie","entelehii":"entelehie","enteralgia":"enteralgie","enteralgiei":"enteralgie","enteralgii":"enteralgie","enteralgiile":"enteralgie","enteralgiilor":"enteralgie","enterectomia":"enterectomie","enterectomiei":"enterectomie","enterectomii":"enterectomie","enterectomiile":"enterectomie","enterectomiilor":"enterectomie","enterica":["enterică","enteric","enterica","enteric"],"enterice":"enteric","entericele":"enteric","enterici":"enteric","entericii":"enteric","entericul":"enteric","enterite":"enterită","enteritei":"enterită","enteritele":"enterită","enteritelor":"enterită","enteroanastomoze":"enteroanastomoză","enteroanastomozei":"enteroanastomoză","enteroanastomozele":"enteroanastomoză","enteroanastomozelor":"enteroanastomoză","enterobacteria":"enterobacterie","enterobacteriei":"enterobacterie","enterobacterii":"enterobacterie","enterobacteriile":"enterobacterie","enterobacteriilor":"enterobacterie","enterocelul":"enterocel","enterocelule":"enterocel","enterocelului":"enterocel","enterocenteze":"enterocenteză","enterocentezei":"enterocenteză","enterocentezele":"enterocenteză","enterocentezelor":"enterocenteză","enterochinaze":"enterochinază","enterochinazei":"enterochinază","enterochinazele":"enterochinază","enterochinazelor":"enterochinază","enteroclize":"enterocliză","enteroclizei":"enterocliză","enteroclizele":"enterocliză","enteroclizelor":"enterocliză","enterococi":"enterococ","enterococii":"enterococ","enterococilor":"enterococ","enterococul":"enterococ","enterococule":"enterococ","enterococului":"enterococ","enterocolite":"enterocolită","enterocolitei":"enterocolită","enterocolitele":"enterocolită","enterocolitelor":"enterocolită","enterogastrite":"enterogastrită","enterogastritei":"enterogastrită","enterogastritele":"enterogastrită","enterogastritelor":"enterogastrită","enterogastronaul":"enterogastronă","enterogastronaule":"enterogastronă","enterogastronaului":"enterogastronă","enterogastrone":["enterogastrone","enterogastron","enterogastrone","enterogastronă"],"enterogastronele":["enterogastronele","enterogastron","enterogastronele","enterogastronă"],"enterogastronelor":["enterogastronelor","enterogastron","enterogastronelor","enterogastronă"],"enterogastronul":"enterogastron","enterogastronule":"enterogastron","enterogastronului":"enterogastron","enterohemoragia":"enterohemoragie","enterohemoragiei":"enterohemoragie","enterohemoragii":"enterohemoragie","enterohemoragiile":"enterohemoragie","enterohemoragiilor":"enterohemoragie","enterohepatite":"enterohepatită","enterohepatitei":"enterohepatită","enterohepatitele":"enterohepatită","enterohepatitelor":"enterohepatită","enterologia":"enterologie","enterologiei":"enterologie","enterologii":"enterologie","enteropatia":"enteropatie","enteropatiei":"enteropatie","enteropatii":"enteropatie","enteropatiile":"enteropatie","enteropatiilor":"enteropatie","enteropexia":"enteropexie","enteropexiei":"enteropexie","enteropexii":"enteropexie","enteropexiile":"enteropexie","enteropexiilor":"enteropexie","enteroptoze":"enteroptoză","enteroptozei":"enteroptoză","enteroptozele":"enteroptoză","enteroptozelor":"enteroptoză","enteroragia":"enteroragie","enteroragiei":"enteroragie","enteroragii":"enteroragie","enteroragiile":"enteroragie","enteroragiilor":"enteroragie","enterorenala":["enterorenală","enterorenal","enterorenala","enterorenal"],"enterorenale":"enterorenal","enterorenalele":"enterorenal","enterorenali":"enterorenal","enterorenalii":"enterorenal","enterorenalul":"enterorenal","enterospasme":"enterospasm","enterospasmele":"enterospasm","enterospasmelor":"enterospasm","enterospasmul":"enterospasm","enterospasmule":"enterospasm","enterospasmului":"enterospasm","enterostenoze":"enterostenoză","enterostenozei":"enterostenoză","enterostenozele":"enterostenoză","enterostenozelor":"enterostenoză","enterostomia":"enterostomie","enterostomiei":"enterostomie","enterostomii":"enterostomie","enterostomiile":"enterostomie","enterostomiilor":"enterostomie","enterotoame":"enterotom","enterotoamele":"enterotom","enterotoamelor":"enterotom","enterotomia":"enterotomie","enterotomiei":"enterotomie","enterotomii":"enterotomie","enterotomiile":"enterotomie","enterotomiilor":"enterotomie","enterotomul":"enterotom","enterotomule":"enterotom","enterotomului":"enterotom","entimeme":"entimemă","entimemei":"entimemă","entimemele":"entimemă","entimemelor":"entimemă","entitatea":"entitate","entitati":"entitate","entitatii":"entitate","entitatile":"entitate","entitatilor":"entitate","entomofage":"entomofagă","entomofagei":"entomofagă","entomofagele":"entomofagă","entomofagelor":"entomofagă","entomofagi":"entomofag","entomofagii":"entomofag","entomofagilor":"entomofag","entomofagul":"entomofag","entomofagule":"entomofag","entomofagului":"entomofag","entomofila":["entomofilă","entomofil","entomofila","entomofil"],"entomofile":"entomofil","entomofilele":"entomofil","entomofili":"entomofil","entomofilia":"entomofilie","entomofiliei":"entomofilie","entomofilii":["entomofilii","entomofil","entomofilii","entomofilie"],"entomofiliile":"entomofilie","entomofiliilor":"entomofilie","entomofilul":"entomofil","entomofita":["entomofită","entomofit","entomofita","entomofit"],"entomofite":"entomofit","entomofitele":"entomofit","entomofiti":"entomofit","entomofitii":"entomofit","entomofitul":"entomofit","entomografia":"entomografie","entomografiei":"entomografie","entomografii":"entomografie","entomografiile":"entomografie","entomografiilor":"entomografie","entomologe":"entomologă","entomologei":"entomologă","entomologele":"entomologă","entomologelor":"entomologă","entomologi":"entomolog","entomologia":"entomologie","entomologica":["entomologică","entomologic","entomologica","entomologic"],"entomologice":"entomologic","entomologicele":"entomologic","entomologici":"entomologic","entomologicii":"entomologic","entomologicul":"entomologic","entomologiei":"entomologie","entomologii":["entomologii","entomolog","entomologii","entomologie"],"entomologilor":"entomolog","entomologiste":"entomologistă","entomologistei":"entomologistă","entomologistele":"entomologistă","entomologistelor":"entomologistă","entomologisti":"entomologist","entomologistii":"entomologist","entomologistilor":"entomologist","entomologistul":"entomologist","entomologistule":"entomologist","entomologistului":"entomologist","entomologul":"entomolog","entomologule":"entomolog","entomologului":"entomolog","entomostracee":"entomostraceu","entomostraceul":"entomostraceu","entomostraceule":"entomostraceu","entomostraceului":"entomostraceu","entoplasme":"entoplasmă","entoplasmei":"entoplasmă","entoplasmele":"entoplasmă","entoplasmelor":"entoplasmă","entorse":"entorsă","entorsei":"entorsă","entorsele":"entorsă","entorselor":"entorsă","entozoare":"entozoar","entozoarele":"entozoar","entozoarelor":"entozoar","entozoarul":"entozoar","entozoarule":"entozoar","entozoarului":"entozoar","entrate":"entrată","entratei":"entrată","entratele":"entrată","entratelor":"entrată","entrefiletul":"entrefilet","entrefiletule":"entrefilet","entrefiletului":"entrefilet","entrefileturi":"entrefilet","entrefileturile":"entrefilet","entrefileturilor":"entrefilet","entrelacsul":"entrelacs","entrelacsule":"entrelacs","entrelacsului":"entrelacs","entrelacsuri":"entrelacs","entrelacsurile":"entrelacs","entrelacsurilor":"entrelacs","entropia":"entropie","entropica":["entropică","entropic","entropica","entropic"],"entropice":"entropic","entropicele":"entropic","entropici":"entropic","entropicii":"entropic","entropicul":"entropic","entropiei":"entropie","entropii":"entropie","entropiile":"entropie","entropiilor":"entropie","entropionul":"entropion","entropionule":"entropion","entropionului":"entropion","entusiasmata":["entusiasmată","entusiasmat","entusiasmata","entusiasmat"],"entusiasmate":"entusiasmat","entusiasmatele":"entusiasmat","entusiasmati":"entusiasmat","entusiasmatii":"entusiasmat","entusiasmatul":"entusiasmat","entusiata":["entusiată","entusiat","entusiata","entusiat"],"entusiate":"entusiat","entusiatele":"entusiat","entusiati":"entusiat","entusiatii":"entusiat","entusiatul":"entusiat","entuziasmai":"entuziasma","entuziasmam":["entuziasmăm","entuziasma","entuziasmam","entuziasma"],"entuziasmand":"entuziasma","entuziasmara":"entuziasma","entuziasmaram":"entuziasma","entuziasmarati":"entuziasma","entuziasmarea":"entuziasmare","entuziasmari":"entuziasmare","entuziasmarii":"entuziasmare","entuziasmarile":"entuziasmare","entuziasmarilor":"entuziasmare","entuziasmase":"entuziasma","entuziasmasem":"entuziasma","entuziasmasera":"entuziasma","entuziasmaseram":"entuziasma","entuziasmaserati":"entuziasma","entuziasmasesi":"entuziasma","entuziasmasi":"entuziasma","entuziasmat":"entuziasma","entuziasmata":["entuziasmată","entuziasmat","entuziasmata","entuziasmat"],"entuziasmate":"entuziasmat","entuziasmatele":"entuziasmat","entuziasmati":["entuziasmați","entuziasma","entuziasmați","entuziasmat"],"entuziasmatii":"entuziasmat","entuziasmatul":"entuziasmat","entuziasmau":"entuziasma","entuziasme":"entuziasm","entuziasmeaza":"entuziasma","entuziasmele":"entuziasm","entuziasmelor":"entuziasm","entuziasmez":"entuziasma","entuziasmezi":"entuziasma","entuziasmul":"entuziasm","entuziasmule":"entuziasm","entuziasmului":"entuziasm","entuziasta":["entuziastă","entuziast","entuziasta","entuziast"],"entuziaste":"entuziast","entuziastele":"entuziast","entuziasti":"entuziast","entuziastica":["entuziastică","entuziastic","entuziastica","entuziastic"],"entuziastice":"entuziastic","entuziasticele":"entuziastic","entuziastici":"entuziastic","entuziasticii":"entuziastic","entuziasticul":"entuziastic","entuziastii":"entuziast","entuziastul":"entuziast","enuclearea":"enucleare","enucleari":"enucleare","enuclearii":"enucleare","enuclearile":"enucleare","enuclearilor":"enucleare","enucleatia":"enucleație","enucleatiei":"enucleație","enucleatii":"enucleație","enucleatiile":"enucleație","enucleatiilor":"enucleație","enucleatiunea":"enucleațiune","enucleatiuni":"enucleațiune","enucleatiunii":"enucleațiune","enucleatiunile":"enucleațiune","enucleatiunilor":"enucleațiune","enumer":"enumera","enumerabila":["enumerabilă","enumerabil","enumerabila","enumerabil"],"enumerabile":"enumerabil","enumerabilele":"enumerabil","enumerabili":"enumerabil","enumerabilii":"enumerabil","enumerabilul":"enumerabil","enumerai":"enumera","enumeram":["enumerăm","enumera","enumeram","enumera"],"enumerand":"enumera","enumerara":"enumera","enumeraram":"enumera","enumerarati":"enumera","enumerarea":"enumerare","enumerari":"enumerare","enumerarii":"enumerare","enumerarile":"enumerare","enumerarilor":"enumerare","enumerase":"enumera","enumerasem":"enumera","enumerasera":"enumera","enumeraseram":"enumera","enumeraserati":"enumera","enumerasesi":"enumera","enumerasi":"enumera","enumerat":"enumera","enumerata":["enumerată","enumerat","enumerata","enumerat"],"enumerate":"enumerat","enumeratele":"enumerat","enumerati":["enumerați","enumera","enumerați","enumerat"],"enumeratia":"enumerație","enumeratiei":"enumerație","enumeratii":["enumerații","enumerat","enumerații","enumerație"],"enumeratiile":"enumerație","enumeratiilor":"enumerație","enumeratiunea":"enumerațiune","enumeratiuni":"enumerațiune","enumeratiunii":"enumerațiune","enumeratiunile":"enumerațiune","enumeratiunilor":"enumerațiune","enumerativa":["enumerativă","enumerativ","enumerativa","enumerativ"],"enumerative":"enumerativ","enumerativele":"enumerativ","enumerativi":"enumerativ","enumerativii":"enumerativ","enumerativul":"enumerativ","enumeratul":"enumerat","enumerau":"enumera","enumere":"enumera","enumeri":"enumera","enunt":"enunța","enuntai":"enunța","enuntam":["enunțăm","enunța","enunțam","enunța"],"enuntand":"enunța","enuntara":"enunța","enuntaram":"enunța","enuntarati":"enunța","enuntarea":"enunțare","enuntari":"enunțare","enuntarii":"enunțare","enuntarile":"enunțare","enuntarilor":"enunțare","enuntase":"enunța","enuntasem":"enunța","enuntasera":"enunța","enuntaseram":"enunța","enuntaserati":"enunța","enuntasesi":"enunța","enuntasi":"enunța","enuntat":"enunța","enuntati":"enunța","enuntatoare":"enunțător","enuntatoarea":"enunțător","enuntatoarele":"enunțător","enuntatori":"enunțător","enuntatorii":"enunțător","enuntatorul":"enunțător","enuntau":"enunța","enunti":"enunța","enuntiativa":["enunțiativă","enunțiativ","enunțiativa","enunțiativ"],"enuntiative":"enunțiativ","enuntiativele":"enunțiativ","enuntiativi":"enunțiativ","enuntiativii":"enunțiativ","enuntiativul":"enunțiativ","enuntul":"enunț","enuntule":"enunț","enuntului":"enunț","enunturi":"enunț","enunturile":"enunț","enunturilor":"enunț","enuretica":["enuretică","enuretic","enuretica","enuretic"],"enuretice":"enuretic","enureticele":"enuretic","enuretici":"enuretic","enureticii":"enuretic","enureticul":"enuretic","enurezisul":"enurezis","enurezisule":"enurezis","enurezisului":"enurezis","enzimatica":["enzimatică","enzimatic","enzimatica","enzimatic"],"enzimatice":"enzimatic","enzimaticele":"enzimatic","enzimatici":"enzimatic","enzimaticii":"enzimatic","enzimaticul":"enzimatic","enzime":"enzimă","enzimei":"enzimă","enzimele":"enzimă","enzimelor":"enzimă","enzimologia":"enzimologie","enzimologiei":"enzimologie","enzimologii":"enzimologie","enzimopatia":"enzimopatie","enzimopatiei":"enzimopatie","enzimopatii":"enzimopatie","enzimopatiile":"enzimopatie","enzimopatiilor":"enzimopatie","enzootia":"enzootie","enzootica":["enzootică","enzootic","enzootica","enzootic"],"enzootice":"enzootic","enzooticele":"enzootic","enzootici":"enzootic","enzooticii":"enzootic","enzooticul":"enzootic","enzootiei":"enzootie","enzootii":"enzootie","eoantropi":"eoantrop","eoantropii":"eoantrop","eoantropilor":"eoantrop","eoantropul":"eoantrop","eoantropule":"eoantrop","eoantropului":"eoantrop","eoceni":"eocen","eocenica":["eocenică","eocenic","eocenica","eocenic"],"eocenice":"eocenic","eocenicele":"eocenic","eocenici":"eocenic","eocenicii":"eocenic","eocenicul":"eocenic","eocenile":"eocen","eocenilor":"eocen","eocenul":"eocen","eocenule":"eocen","eocenului":"eocen","eoliana":["eoliană","eolian","eoliana","eolian"],"eolianul":"eolian","eoliene":"eolian","eolienele":"eolian","eolieni":"eolian","eolienii":"eolian","eoline":"eolină","eolinei":"eolină","eolinele":"eolină","eolinelor":"eolină","eolite":"eolit","eolitele":"eolit","eolitelor":"eolit","eolitica":["eolitică","eolitic","eolitica","eolitic"],"eolitice":"eolitic","eoliticele":"eolitic","eolitici":"eolitic","eoliticii":"eolitic","eoliticul":"eolitic","eolitul":"eolit","eolitule":"eolit","eolitului":"eolit","eolotropa":["eolotropă","eolotrop","eolotropa","eolotrop"],"eolotrope":"eolotrop","eolotropele":"eolotrop","eolotropi":"eolotrop","eolotropia":"eolotropie","eolotropiei":"eolotropie","eolotropii":["eolotropii","eolotrop","eolotropii","eolotropie"],"eolotropiile":"eolotropie","eolotropiilor":"eolotropie","eolotropul":"eolotrop","eoni":"eon","eonii":"eon","eonilor":"eon","eonul":"eon","eonule":"eon","eonului":"eon","eozine":"eozină","eozinei":"eozină","eozinele":"eozină","eozinelor":"eozină","eozinocite":"eozinocit","eozinocitele":"eozinocit","eozinocitelor":"eozinocit","eozinocitul":"eozinocit","eozinocitule":"eozinocit","eozinocitului":"eozinocit","eozinofila":["eozinofilă","eozinofil","eozinofila","eozinofil"],"eozinofile":"eozinofil","eozinofilele":"eozinofil","eozinofili":"eozinofil","eozinofilia":"eozinofilie","eozinofiliei":"eozinofilie","eozinofilii":["eozinofilii","eozinofil","eozinofilii","eozinofilie"],"eozinofilul":"eozinofil","eozinopenia":"eozinopenie","eozinopeniei":"eozinopenie","eozinopenii":"eozinopenie","eozoica":["eozoică","eozoic","eozoica","eozoic"],"eozoice":"eozoic","eozoicele":"eozoic","eozoici":"eozoic","eozoicii":"eozoic","eozoicile":"eozoic","eozoicilor":"eozoic","eozoicul":"eozoic","eozoicule":"eozoic","eozoicului":"eozoic","epactala":["epactală","epactal","epactala","epactal"],"epactale":"epactal","epactalele":"epactal","epactali":"epactal","epactalii":"epactal","epactalul":"epactal","epacte":"epactă","epactei":"epactă","epactele":"epactă","epactelor":"epactă","epagoge":"epagogă","epagogei":"epagogă","epagogele":"epagogă","epagogelor":"epagogă","epagogica":["epagogică","epagogic","epagogica","epagogic"],"epagogice":"epagogic","epagogicele":"epagogic","epagogici":"epagogic","epagogicii":"epagogic","epagogicul":"epagogic","epanafore":"epanaforă","epanaforei":"epanaforă","epanaforele":"epanaforă","epanaforelor":"epanaforă","epanalepse":"epanalepsă","epanalepsei":"epanalepsă","epanalepsele":"epanalepsă","epanalepselor":"epanalepsă","epandajul":"epandaj","epandajule":"epandaj","epandajului":"epandaj","epanioli":"epaniol","epaniolii":"epaniol","epaniolilor":"epaniol","epaniolul":"epaniol","epaniolule":"epaniol","epaniolului":"epaniol","epanode":"epanodă","epanodei":"epanodă","epanodele":"epanodă","epanodelor":"epanodă","epansamente":"epanșament","epansamentele":"epanșament","epansamentelor":"epanșament","epansamentul":"epanșament","epansamentule":"epanșament","epansamentului":"epanșament","eparhi":"eparh","eparhia":"eparhie","eparhiala":["eparhială","eparhial","eparhiala","eparhial"],"eparhiale":"eparhial","eparhialele":"eparhial","eparhiali":"eparhial","eparhialii":"eparhial","eparhialnica":["eparhialnică","eparhialnic","eparhialnica","eparhialnic"],"eparhialnice":"eparhialnic","eparhialnicele":"eparhialnic","eparhialnici":"eparhialnic","eparhialnicii":"eparhialnic","eparhialnicul":"eparhialnic","eparhialul":"eparhial","eparhiani":"eparhian","eparhianii":"eparhian","eparhianilor":"eparhian","eparhianul":"eparhian","eparhianule":"eparhian","eparhianului":"eparhian","eparhica":["eparhică","eparhic","eparhica","eparhic"],"eparhice":"eparhic","eparhicele":"eparhic","eparhici":"eparhic","eparhicii":"eparhic","eparhicul":"eparhic","eparhiei":"eparhie","eparhii":["eparhii","eparh","eparhii","eparhie"],"eparhiile":"eparhie","eparhiilor":"eparhie","eparhilor":"eparh","eparhiota":["eparhiotă","eparhiot","eparhiota","eparhiot"],"eparhiote":"eparhiot","eparhiotele":"eparhiot","eparhioti":"eparhiot","eparhiotii":"eparhiot","eparhiotilor":"eparhiot","eparhiotul":"eparhiot","eparhiotule":"eparhiot","eparhiotului":"eparhiot","eparhul":"eparh","eparhule":"eparh","eparhului":"eparh","eparsiceasca":["eparșicească","eparșicesc","eparșiceasca","eparșicesc"],"eparsicescul":"eparșicesc","eparsicesti":"eparșicesc","eparsicestii":"eparșicesc","eparsicestile":"eparșicesc","eparvene":"eparven","eparvenele":"eparven","eparvenelor":"eparven","eparvenul":"eparven","eparvenule":"eparven","eparvenului":"eparven","epatai":"epata","epatam":["epatăm","epata","epatam","epata"],"epatand":"epata","epatanta":["epatantă","epatant","epatanta","epatant"],"epatante":"epatant","epatantele":"epatant","epatanti":"epatant","epatantii":"epatant","epatantul":"epatant","epatara":"epata","epataram":"epata","epatarati":"epata","epatase":"epata","epatasem":"epata","epatasera":"epata","epataseram":"epata","epataserati":"epata","epatasesi":"epata","epatasi":"epata","epatat":"epata","epatati":"epata","epatau":"epata","epateaza":"epata","epatez":"epata","epatezi":"epata","epave":"epavă","epavei":"epavă","epavele":"epavă","epavelor":"epavă","epee":"epeu","epeele":"epeu","epeelor":"epeu","ependimara":["ependimară","ependimar","ependimara","ependimar"],"ependimare":"ependimar","ependimarele":"ependimar","ependimari":"ependimar","ependimarii":"ependimar","ependimarul":"ependimar","ependime":"ependim","ependimele":"ependim","ependimelor":"ependim","ependimite":"ependimită","ependimitei":"ependimită","ependimitele":"ependimită","ependimitelor":"ependimită","ependimul":"ependim","ependimule":"ependim","ependimului":"ependim","epentetica":["epentetică","epentetic","epentetica","epentetic"],"epentetice":"epentetic","epenteticele":"epentetic","epentetici":"epentetic","epenteticii":"epentetic","epenteticul":"epentetic","epenteze":"epenteză","epentezei":"epenteză","epentezele":"epenteză","epentezelor":"epenteză","epeuul":"epeu","epeuule":"epeu","epeuului":"epeu","epexegetica":["epexegetică","epexegetic","epexegetica","epexegetic"],"epexegetice":"epexegetic","epexegeticele":"epexegetic","epexegetici":"epexegetic","epexegeticii":"epexegetic","epexegeticul":"epexegetic","epexegeze":"epexegeză","epexegezei":"epexegeză","epexegezele":"epexegeză","epexegezelor":"epexegeză","epibati":"epibat","epibatii":"epibat","epibatilor":"epibat","epibatul":"epibat","epibatule":"epibat","epibatului":"epibat","epica":["epică","epic","epica","epic"],"epicardite":"epicardită","epicarditei":"epicardită","epicarditele":"epicardită","epicarditelor":"epicardită","epicardul":"epicard","epicardule":"epicard","epicardului":"epicard","epicarduri":"epicard","epicardurile":"epicard","epicardurilor":"epicard","epicarpul":"epicarp","epicarpule":"epicarp","epicarpului":"epicarp","epicarpuri":"epicarp","epicarpurile":"epicarp","epicarpurilor":"epicarp","epice":["epice","epic","epice","epică"],"epicei":"epică","epicele":["epicele","epic","epicele","epică"],"epicelor":"epică","epicena":["epicenă","epicen","epicena","epicen"],"epicene":"epicen","epicenele":"epicen","epiceni":"epicen","epicenii":"epicen","epicentrala":["epicentrală","epicentral","epicentrala","epicentral"],"epicentrale":"epicentral","epicentralele":"epicentral","epicentrali":"epicentral","epicentralii":"epicentral","epicentralul":"epicentral","epicentre":"epicentru","epicentrele":"epicentru","epicentrelor":"epicentru","epicentrica":["epicentrică","epicentric","epicentrica","epicentric"],"epicentrice":"epicentric","epicentricele":"epicentric","epicentrici":"epicentric","epicentricii":"epicentric","epicentricul":"epicentric","epicentrul":"epicentru","epicentrule":"epicentru","epicentrului":"epicentru","epicenul":"epicen","epicercul":"epicerc","epicercule":"epicerc","epicercului":"epicerc","epicercuri":"epicerc","epicercurile":"epicerc","epicercurilor":"epicerc","epichereme":"epicheremă","epicheremei":"epicheremă","epicheremele":"epicheremă","epicheremelor":"epicheremă","epici":"epic","epicicloidala":["epicicloidală","epicicloidal","epicicloidala","epicicloidal"],"epicicloidale":"epicicloidal","epicicloidalele":"epicicloidal","epicicloidali":"epicicloidal","epicicloidalii":"epicicloidal","epicicloidalul":"epicicloidal","epicicloide":"epicicloidă","epicicloidei":"epicicloidă","epicicloidele":"epicicloidă","epicicloidelor":"epicicloidă","epiciclul":"epiciclu","epiciclule":"epiciclu","epiciclului":"epiciclu","epicicluri":"epiciclu","epiciclurile":"epiciclu","epiciclurilor":"epiciclu","epicii":"epic","epicitatea":"epicitate","epicitati":"epicitate","epicitatii":"epicitate","epicitatile":"epicitate","epicitatilor":"epicitate","epicondile":"epicondil","epicondilele":"epicondil","epicondilelor":"epicondil","epicondilite":"epicondilită","epicondilitei":"epicondilită","epicondilitele":"epicondilită","epicondilitelor":"epicondilită","epicondilul":"epicondil","epicondilule":"epicondil","epicondilului":"epicondil","epicontinentala":["epicontinentală","epicontinental","epicontinentala","epicontinental"],"epicontinentale":"epicontinental","epicontinentalele":"epicontinental","epicontinentali":"epicontinental","epicontinentalii":"epicontinental","epicontinentalul":"epicontinental","epicotile":"epicotil","epicotilele":"epicotil","epicotilelor":"epicotil","epicotilul":"epicotil","epicotilule":"epicotil","epicotilului":"epicotil","epicraniana":["epicraniană","epicranian","epicraniana","epicranian"],"epicranianul":"epicranian","epicraniene":"epicranian","epicranienele":"epicranian","epicranieni":"epicranian","epicranienii":"epicranian","epicranii":"epicraniu","epicraniile":"epicraniu","epicraniilor":"epicraniu","epicraniuul":"epicraniu","epicraniuule":"epicraniu","epicraniuului":"epicraniu","epicratia":"epicrație","epicratiei":"epicrație","epicratii":"epicrație","epicratiile":"epicrație","epicratiilor":"epicrație","epicrize":"epicriză","epicrizei":"epicriză","epicrizele":"epicriză","epicrizelor":"epicriză","epicul":"epic","epicureana":["epicureană","epicurean","epicureana","epicurean"],"epicureanul":"epicurean","epicuree":"epicureu","epicureea":"epicureu","epicureele":"epicureu","epicurei":"epicureu","epicureica":["epicureică","epicureic","epicureica","epicureic"],"epicureice":"epicureic","epicureicele":"epicureic","epicureici":"epicureic","epicureicii":"epicureic","epicureicul":"epicureic","epicureii":"epicureu","epicureismul":"epicureism","epicureismule":"epicureism","epicureismului":"epicureism","epicurene":"epicurean","epicurenele":"epicurean","epicureni":"epicurean","epicurenii":"epicurean","epicureul":"epicureu","epicurianul":"epicurian","epicurianule":"epicurian","epicurianului":"epicurian","epicuriasca":["epicuriască","epicuriesc","epicuriasca","epicuriesc"],"epicuriene":"epicuriană","epicurienei":"epicuriană","epicurienele":"epicuriană","epicurienelor":"epicuriană","epicurieni":"epicurian","epicurienii":"epicurian","epicurienilor":"epicurian","epicuriescul":"epicuriesc","epicuriesti":"epicuriesc","epicuriestii":"epicuriesc","epicuriestile":"epicuriesc","epicurismul":"epicurism","epicurismule":"epicurism","epicurismului":"epicurism","epicurista":["epicuristă","epicurist","epicurista","epicurist"],"epicuriste":"epicurist","epicuristele":"epicurist","epicuristi":"epicurist","epicuristii":"epicurist","epicuristul":"epicurist","epidemia":"epidemie","epidemiasca":["epidemiască","epidemiesc","epidemiasca","epidemiesc"],"epidemica":["epidemică","epidemic","epidemica","epidemic"],"epidemice":"epidemic","epidemicele":"epidemic","epidemici":"epidemic","epidemicii":"epidemic","epidemicul":"epidemic","epidemiei":"epidemie","epidemiescul":"epidemiesc","epidemiesti":"epidemiesc","epidemiestii":"epidemiesc","epidemiestile":"epidemiesc","epidemii":"epidemie","epidemiile":"epidemie","epidemiilor":"epidemie","epidemiologe":"epidemiologă","epidemiologei":"epidemiologă","epidemiologele":"epidemiologă","epidemiologelor":"epidemiologă","epidemiologi":"epidemiolog","epidemiologia":"epidemiologie","epidemiologica":["epidemiologică","epidemiologic","epidemiologica","epidemiologic"],"epidemiologice":"epidemiologic","epidemiologicele":"epidemiologic","epidemiologici":"epidemiologic","epidemiologicii":"epidemiologic","epidemiologicul":"epidemiologic","epidemiologiei":"epidemiologie","epidemiologii":["epidemiologii","epidemiolog","epidemiologii","epidemiologie"],"epidemiologilor":"epidemiolog","epidemiologul":"epidemiolog","epidemiologule":"epidemiolog","epidemiologului":"epidemiolog","epiderme":"epidermă","epidermei":"epidermă","epidermele":"epidermă","epidermelor":"epidermă","epidermica":["epidermică","epidermic","epidermica","epidermic"],"epidermice":"epidermic","epidermiceasca":["epidermicească","epidermicesc","epidermiceasca","epidermicesc"],"epidermicele":"epidermic","epidermicescul":"epidermicesc","epidermicesti":"epidermicesc","epidermicestii":"epidermicesc","epidermicestile":"epidermicesc","epidermici":"epidermic","epidermicii":"epidermic","epidermicul":"epidermic","epidermite":"epidermită","epidermitei":"epidermită","epidermitele":"epidermită","epidermitelor":"epidermită","epidermizarea":"epidermizare","epidermizari":"epidermizare","epidermizarii":"epidermizare","epidermizarile":"epidermizare","epidermizarilor":"epidermizare","epidermofitia":"epidermofiție","epidermofitiei":"epidermofiție","epidermofitii":"epidermofiție","epidermofitiile":"epidermofiție","epidermofitiilor":"epidermofiție","epidermoida":["epidermoidă","epidermoid","epidermoida","epidermoid"],"epidermoidala":["epidermoidală","epidermoidal","epidermoidala","epidermoidal"],"epidermoidale":"epidermoidal","epidermoidalele":"epidermoidal","epidermoidali":"epidermoidal","epidermoidalii":"epidermoidal","epidermoidalul":"epidermoidal","epidermoide":"epidermoid","epidermoidele":"epidermoid","epidermoidul":"epidermoid","epidermoizi":"epidermoid","epidermoizii":"epidermoid","epidermolize":"epidermoliză","epidermolizei":"epidermoliză","epidermolizele":"epidermoliză","epidermolizelor":"epidermoliză","epidermomicoze":"epidermomicoză","epidermomicozei":"epidermomicoză","epidermomicozele":"epidermomicoză","epidermomicozelor":"epidermomicoză","epidiascoape":"epidiascop","epidiascoapele":"epidiascop","epidiascoapelor":"epidiascop","epidiascopul":"epidiascop","epidiascopule":"epidiascop","epidiascopului":"epidiascop","epidictica":["epidictică","epidictic","epidictica","epidictic"],"epidictice":"epidictic","epidicticele":"epidictic","epidictici":"epidictic","epidicticii":"epidictic","epidicticul":"epidictic","epididime":"epididim","epididimectomia":"epididimectomie","epididimectomiei":"epididimectomie","epididimectomii":"epididimectomie","epididimectomiile":"epididimectomie","epididimectomiilor":"epididimectomie","epididimele":"epididim","epididimelor":"epididim","epididimite":"epididimită","epididimitei":"epididimită","epididimitele":"epididimită","epididimitelor":"epididimită","epididimotomia":"epididimotomie","epididimotomiei":"epididimotomie","epididimotomii":"epididimotomie","epididimotomiile":"epididimotomie","epididimotomiilor":"epididimotomie","epididimul":"epididim","epididimule":"epididim","epididimului":"epididim","epidotul":"epidot","epidotule":"epidot","epidotului":"epidot","epifania":"epifanie","epifaniei":"epifanie","epifanii":"epifanie","epifaniile":"epifanie","epifaniilor":"epifanie","epifenomenalisme":"epifenomenalism","epifenomenalismele":"epifenomenalism","epifenomenalismelor":"epifenomenalism","epifenomenalismul":"epifenomenalism","epifenomenalismule":"epifenomenalism","epifenomenalismului":"epifenomenalism","epifenomene":"epifenomen","epifenomenele":"epifenomen","epifenomenelor":"epifenomen","epifenomenista":["epifenomenistă","epifenomenist","epifenomenista","epifenomenist"],"epifenomeniste":"epifenomenist","epifenomenistele":"epifenomenist","epifenomenisti":"epifenomenist","epifenomenistii":"epifenomenist","epifenomenistul":"epifenomenist","epifenomenul":"epifenomen","epifenomenule":"epifenomen","epifenomenului":"epifenomen","epifila":["epifilă","epifil","epifila","epifil"],"epifile":"epifil","epifilele":"epifil","epifili":"epifil","epifilii":"epifil","epifilul":"epifil","epifita":["epifită","epifit","epifita","epifit"],"epifite":"epifit","epifitele":"epifit","epifiti":"epifit","epifitia":"epifitie","epifitiei":"epifitie","epifitii":["epifiții","epifit","epifitii","epifitie"],"epifitiile":"epifitie","epifitiilor":"epifitie","epifitul":"epifit","epifizana":["epifizană","epifizan","epifizana","epifizan"],"epifizane":"epifizan","epifizanele":"epifizan","epifizani":"epifizan","epifizanii":"epifizan","epifizanul":"epifizan","epifizara":["epifizară","epifizar","epifizara","epifizar"],"epifizare":"epifizar","epifizarele":"epifizar","epifizari":"epifizar","epifizarii":"epifizar","epifizarul":"epifizar","epifize":"epifiză","epifizei":"epifiză","epifizele":"epifiză","epifizelor":"epifiză","epifizite":"epifizită","epifizitei":"epifizită","epifizitele":"epifizită","epifizitelor":"epifizită","epifoneme":"epifonem","epifonemele":"epifonem","epifonemelor":"epifonem","epifonemul":"epifonem","epifonemule":"epifonem","epifonemului":"epifonem","epifore":"epiforă","epiforei":"epiforă","epiforele":"epiforă","epiforelor":"epiforă","epifraze":"epifrază","epifrazei":"epifrază","epifrazele":"epifrază","epifrazelor":"epifrază","epigastralgia":"epigastralgie","epigastralgiei":"epigastralgie","epigastralgii":"epigastralgie","epigastre":"epigastru","epigastrele":"epigastru","epigastrelor":"epigastru","epigastrica":["epigastrică","epigastric","epigastrica","epigastric"],"epigastrice":"epigastric","epigastricele":"epigastric","epigastrici":"epigastric","epigastricii":"epigastric","epigastricul":"epigastric","epigastrul":"epigastru","epigastrule":"epigastru","epigastrului":"epigastru","epigee":"epigeu","epigeea":"epigeu","epigeele":"epigeu","epigei":"epigeu","epigeii":"epigeu","epigenetica":["epigenetică","epigenetic","epigenetica","epigenetic"],"epigenetice":"epigenetic","epigeneticele":"epigenetic","epigenetici":"epigenetic","epigeneticii":"epigenetic","epigeneticul":"epigenetic","epigeneze":"epigeneză","epigenezei":"epigeneză","epigenezele":"epigeneză","epigenezelor":"epigeneză","epigenia":"epigenie","epigeniei":"epigenie","epigenii":"epigenie","epigeniile":"epigenie","epigeniilor":"epigenie","epigeul":"epigeu","epigina":["epigină","epigin","epigina","epigin"],"epigine":"epigin","epiginele":"epigin","epigini":"epigin","epiginia":"epiginie","epiginiei":"epiginie","epiginii":["epiginii","epigin","epiginii","epiginie"],"epiginiile":"epiginie","epiginiilor":"epiginie","epiginul":"epigin","epiglote":"epiglotă","epiglotei":"epiglotă","epiglotele":"epiglotă","epiglotelor":"epiglotă","epiglotitae":"epiglotită","epiglotitaei":"epiglotită","epiglotitaele":"epiglotită","epiglotitaelor":"epiglotită","epigoni":"epigon","epigonica":["epigonică","epigonic","epigonica","epigonic"],"epigonice":"epigonic","epigonicele":"epigonic","epigonici":"epigonic","epigonicii":"epigonic","epigonicul":"epigonic","epigonii":"epigon","epigonilor":"epigon","epigonismul":"epigonism","epigonismule":"epigonism","epigonismului":"epigonism","epigonul":"epigon","epigonule":"epigon","epigonului":"epigon","epigrafe":"epigraf","epigrafele":"epigraf","epigrafelor":"epigraf","epigrafia":"epigrafie","epigrafica":["epigrafică","epigrafic","epigrafica","epigrafic"],"epigrafice":"epigrafic","epigraficele":"epigrafic","epigrafici":"epigrafic","epigraficii":"epigrafic","epigraficul":"epigrafic","epigrafiei":"epigrafie","epigrafii":"epigrafie","epigrafiste":"epigrafistă","epigrafistei":"epigrafistă","epigrafistele":"epigrafistă","epigrafistelor":"epigrafistă","epigrafisti":"epigrafist","epigrafistii":"epigrafist","epigrafistilor":"epigrafist","epigrafistul":"epigrafist","epigrafistule":"epigrafist","epigrafistului":"epigrafist","epigraful":"epigraf","epigrafule":"epigraf","epigrafului":"epigraf","epigramatica":["epigramatică","epigramatic","epigramatica","epigramatic"],"epigramatice":"epigramatic","epigramaticele":"epigramatic","epigramatici":"epigramatic","epigramaticii":"epigramatic","epigramaticul":"epigramatic","epigramatisti":"epigramatist","epigramatistii":"epigramatist","epigramatistilor":"epigramatist","epigramatistul":"epigramatist","epigramatistule":"epigramatist","epigramatistului":"epigramatist","epigrame":"epigramă","epigramei":"epigramă","epigramele":"epigramă","epigramelor":"epigramă","epigramiste":"epigramistă","epigramistei":"epigramistă","epigramistele":"epigramistă","epigramistelor":"epigramistă","epigramisti":["epigramiști","epigramist","epigramisti","epigramist"],"epigramistii":"epigramist","epigramistilor":"epigramist","epigramistul":"epigramist","epigramistule":"epigramist","epigramistului":"epigramist","epihirosirea":"epihirosire","epihirosiri":"epihirosire","epihirosirii":"epihirosire","epihirosirile":"epihirosire","epihirosirilor":"epihirosire","epilai":"epila","epilam":["epilăm","epila","epilam","epila"],"epiland":"epila","epilara":"epila","epilaram":"epila","epilarati":"epila","epilarea":"epilare","epilari":"epilare","epilarii":"epilare","epilarile":"epilare","epilarilor":"epilare","epilase":"epila","epilasem":"epila","epilasera":"epila","epilaseram":"epila","epilaserati":"epila","epilasesi":"epila","epilasi":"epila","epilat":"epila","epilati":"epila","epilatia":"epilație","epilatiei":"epilație","epilatii":"epilație","epilatiile":"epilație","epilatiilor":"epilație","epilatiunea":"epilațiune","epilatiuni":"epilațiune","epilatiunii":"epilațiune","epilatiunile":"epilațiune","epilatiunilor":"epilațiune","epilatori":"epilator","epilatorile":"epilator","epilatorilor":"epilator","epilatorul":"epilator","epilatorule":"epilator","epilatorului":"epilator","epilau":"epila","epileaza":"epila","epilepsia":"epilepsie","epilepsiei":"epilepsie","epilepsii":"epilepsie","epilepsiile":"epilepsie","epilepsiilor":"epilepsie","epileptica":["epileptică","epileptic","epileptica","epileptic"],"epileptice":["epileptice","epileptic","epileptice","epileptică"],"epilepticei":"epileptică","epilepticele":["epilepticele","epileptic","epilepticele","epileptică"],"epilepticelor":"epileptică","epileptici":"epileptic","epilepticii":"epileptic","epilepticoasa":["epilepticoasă","epilepticos","epilepticoasa","epilepticos"],"epilepticoase":"epilepticos","epilepticoasele":"epilepticos","epilepticosi":"epilepticos","epilepticosii":"epilepticos","epilepticosul":"epilepticos","epilepticul":"epileptic","epileptiforma":["epileptiformă","epileptiform","epileptiforma","epileptiform"],"epileptiforme":"epileptiform","epileptiformele":"epileptiform","epileptiformi":"epileptiform","epileptiformii":"epileptiform","epileptiformul":"epileptiform","epileptogena":["epileptogenă","epileptogen","epileptogena","epileptogen"],"epileptogene":"epileptogen","epileptogenele":"epileptogen","epileptogeni":"epileptogen","epileptogenii":"epileptogen","epileptogenul":"epileptogen","epileptoida":["epileptoidă","epileptoid","epileptoida","epileptoid"],"epileptoide":"epileptoid","epileptoidele":"epileptoid","epileptoidul":"epileptoid","epileptoizi":"epileptoid","epileptoizii":"epileptoid","epilez":"epila","epilezi":"epila","epilogai":"epiloga","epilogala":["epilogală","epilogal","epilogala","epilogal"],"epilogale":"epilogal","epilogalele":"epilogal","epilogali":"epilogal","epilogalii":"epilogal","epilogalul":"epilogal","epilogam":["epilogăm","epiloga","epilogam","epiloga"],"epilogand":"epiloga","epilogara":"epiloga","epilogaram":"epiloga","epilogarati":"epiloga","epilogarea":"epilogare","epilogari":"epilogare","epilogarii":"epilogare","epilogarile":"epilogare","epilogarilor":"epilogare","epilogase":"epiloga","epilogasem":"epiloga","epilogasera":"epiloga","epilogaseram":"epiloga","epilogaserati":"epiloga","epilogasesi":"epiloga","epilogasi":"epiloga","epilogat":"epiloga","epilogata":["epilogată","epilogat","epilogata","epilogat"],"epilogate":"epilogat","epilogatele":"epilogat","epilogati":["epilogați","epiloga","epilogați","epilogat"],"epilogatii":"epilogat","epilogatul":"epilogat","epilogau":"epiloga","epiloge":"epilog","epilogele":"epilog","epilogelor":"epilog","epilogheaza":"epiloga","epiloghez":"epiloga","epiloghezi":"epiloga","epilogisme":"epilogism","epilogismele":"epilogism","epilogismelor":"epilogism","epilogismul":"epilogism","epilogismule":"epilogism","epilogismului":"epilogism","epilogul":"epilog","epilogule":"epilog","epilogului":"epilog","epiloguri":"epilog","epimelia":"epimelie","epimeliei":"epimelie","epimelii":"epimelie","epimeliile":"epimelie","epimeliilor":"epimelie","epimelis":"epimelisi","epimelise":"epimelisi","epimelisea":"epimelisi","epimeliseai":"epimelisi","epimeliseam":"epimelisi","epimeliseati":"epimelisi","epimeliseau":"epimelisi","epimelisie":"epimelisi","epimelisii":"epimelisi","epimelisim":"epimelisi","epimelisind":"epimelisi","epimelisira":"epimelisi","epimelisiram":"epimelisi","epimelisirati":"epimelisi","epimelisirea":"epimelisire","epimelisiri":"epimelisire","epimelisirii":"epimelisire","epimelisirile":"epimelisire","epimelisirilor":"epimelisire","epimelisise":"epimelisi","epimelisisem":"epimelisi","epimelisisera":"epimelisi","epimelisiseram":"epimelisi","epimelisiserati":"epimelisi","epimelisisesi":"epimelisi","epimelisisi":"epimelisi","epimelisit":"epimelisi","epimelisita":["epimelisită","epimelisit","epimelisita","epimelisit"],"epimelisite":"epimelisit","epimelisitele":"epimelisit","epimelisiti":["epimelisiți","epimelisi","epimelisiți","epimelisit"],"epimelisitii":"epimelisit","epimelisitul":"epimelisit","epimone":"epimonă","epimonei":"epimonă","epimonele":"epimonă","epimonelor":"epimonă","epinefrine":"epinefrină","epinefrinei":"epinefrină","epinefrinele":"epinefrină","epinefrinelor":"epinefrină","epinete":"epinetă","epinetei":"epinetă","epinetele":"epinetă","epinetelor":"epinetă","epingeaua":"epingea","epingele":"epingea","epingelei":"epingea","epingelele":"epingea","epingelelor":"epingea","epiorchia":"epiorchie","epiorchiei":"epiorchie","epiorchii":"epiorchie","epiorchiile":"epiorchie","epiorchiilor":"epiorchie","epipitide":"epipitidă","epipitidei":"epipitidă","epipitidele":"epipitidă","epipitidelor":"epipitidă","epiploane":"epiplon","epiploanele":"epiplon","epiploanelor":"epiplon","epiploce":"epiplocă","epiplocei":"epiplocă","epiplocele":"epiplocă","epiplocelor":"epiplocă","epiplonul":"epiplon","epiplonule":"epiplon","epiplonului":"epiplon","epirogenetica":["epirogenetică","epirogenetic","epirogenetica","epirogenetic"],"epirogenetice":"epirogenetic","epirogeneticele":"epirogenetic","epirogenetici":"epirogenetic","epirogeneticii":"epirogenetic","epirogeneticul":"epirogenetic","epirogeneze":"epirogeneză","epirogenezei":"epirogeneză","epirogenezele":"epirogeneză","epirogenezelor":"epirogeneză","epirogenica":["epirogenică","epirogenic","epirogenica","epirogenic"],"epirogenice":"epirogenic","epirogenicele":"epirogenic","epirogenici":"epirogenic","epirogenicii":"epirogenic","epirogenicul":"epirogenic","epirota":["epirotă","epirot","epirota","epirot"],"epirote":"epirot","epirotele":"epirot","epiroti":"epirot","epirotica":["epirotică","epirotic","epirotica","epirotic"],"epirotice":"epirotic","epiroticele":"epirotic","epirotici":"epirotic","epiroticii":"epirotic","epiroticul":"epirotic","epirotii":"epirot","epirotilor":"epirot","epirotul":"epirot","epirotule":"epirot","epirotului":"epirot","episcoape":"episcop","episcoapele":"episcop","episcoapelor":"episcop","episcopala":["episcopală","episcopal","episcopala","episcopal"],"episcopale":"episcopal","episcopalele":"episcopal","episcopali":"episcopal","episcopalii":"episcopal","episcopalul":"episcopal","episcopate":"episcopat","episcopatele":"episcopat","episcopatelor":"episcopat","episcopatul":"episcopat","episcopatule":"episcopat","episcopatului":"episcopat","episcopeasca":["episcopească","episcopesc","episcopeasca","episcopesc"],"episcopescul":"episcopesc","episcopese":"episcopeasă","episcopesei":"episcopeasă","episcopesele":"episcopeasă","episcopeselor":"episcopeasă","episcopesti":"episcopesc","episcopestii":"episcopesc","episcopestile":"episcopesc","episcopi":"episcop","episcopia":"episcopie","episcopica":["episcopică","episcopic","episcopica","episcopic"],"episcopice":"episcopic","episcopiceasca":["episcopicească","episcopicesc","episcopiceasca","episcopicesc"],"episcopicele":"episcopic","episcopicescul":"episcopicesc","episcopicesti":"episcopicesc","episcopicestii":"episcopicesc","episcopicestile":"episcopicesc","episcopici":"episcopic","episcopicii":"episcopic","episcopicul":"episcopic","episcopiei":"episcopie","episcopii":["episcopii","episcop","episcopii","episcopie"],"episcopiile":"episcopie","episcopiilor":"episcopie","episcopilor":"episcop","episcopul":"episcop","episcopule":"episcop","episcopului":"episcop","episeria":"episerie","episeriei":"episerie","episerii":"episerie","episeriile":"episerie","episeriilor":"episerie","episilogisme":"episilogism","episilogismele":"episilogism","episilogismelor":"episilogism","episilogismul":"episilogism","episilogismule":"episilogism","episilogismului":"episilogism","episoade":"episod","episoadele":"episod","episoadelor":"episod","episodica":["episodică","episodic","episodica","episodic"],"episodice":"episodic","episodicele":"episodic","episodici":"episodic","episodicii":"episodic","episodicul":"episodic","episodul":"episod","episodule":"episod","episodului":"episod","epispadiasul":"epispadias","epispadiasule":"epispadias","epispadiasului":"epispadias","epispadiasuri":"epispadias","epispadiasurile":"epispadias","epispadiasurilor":"epispadias","episperme":"episperm","epispermele":"episperm","epispermelor":"episperm","epispermul":"episperm","epispermule":"episperm","epispermului":"episperm","epistati":"epistat","epistatii":"epistat","epistatilor":"epistat","epistatul":"epistat","epistatule":"epistat","epistatului":"epistat","epistaxisul":"epistaxis","epistaxisule":"epistaxis","epistaxisului":"epistaxis","epistemologi":"epistemolog","epistemologia":"epistemologie","epistemologica":["epistemologică","epistemologic","epistemologica","epistemologic"],"epistemologice":"epistemologic","epistemologicele":"epistemologic","epistemologici":"epistemologic","epistemologicii":"epistemologic","epistemologicul":"epistemologic","epistemologiei":"epistemologie","epistemologii":["epistemologii","epistemolog","epistemologii","epistemologie"],"epistemologilor":"epistemolog","epistemologul":"epistemolog","epistemologule":"epistemolog","epistemologului":"epistemolog","epistilbitul":"epistilbit","epistilbitule":"epistilbit","epistilbitului":"epistilbit","epistilbituri":"epistilbit","epistilbiturile":"epistilbit","epistilbiturilor":"epistilbit","epistilul":"epistil","epistilule":"epistil","epistilului":"epistil","epistiluri":"epistil","epistilurile":"epistil","epistilurilor":"epistil","epistimieul":"epistimie","epistimieule":"epistimie","epistimieului":"epistimie","epistimii":"epistimie","epistimiile":"epistimie","epistimiilor":"epistimie","epistolara":["epistolară","epistolar","epistolara","epistolar"],"epistolare":"epistolar","epistolarele":"epistolar","epistolari":"epistolar","epistolarii":"epistolar","epistolarul":"epistolar","epistole":"epistolă","epistolei":"epistolă","epistolele":"epistolă","epistolelor":"epistolă","epistolera":["epistoleră","epistoler","epistolera","epistoler"],"epistolere":"epistoler","epistolerele":"epistoler","epistoleri":"epistoler","epistolerii":"epistoler","epistolerul":"epistoler","epistolia":"epistolie","epistoliei":"epistolie","epistolieri":"epistolier","epistolierii":"epistolier","epistolierilor":"epistolier","epistolierul":"epistolier","epistolierule":"epistolier","epistolierului":"epistolier","epistolii":"epistolie","epistoliile":"epistolie","epistoliilor":"epistolie","epistolografi":"epistolograf","epistolografia":"epistolografie","epistolografiei":"epistolografie","epistolografii":["epistolografii","epistolograf","epistolografii","epistolografie"],"epistolografiile":"epistolografie","epistolografiilor":"epistolografie","epistolografilor":"epistolograf","epistolograful":"epistolograf","epistolografule":"epistolograf","epistolografului":"epistolograf","epistrofe":"epistrofă","epistrofei":"epistrofă","epistrofele":"epistrofă","epistrofelor":"epistrofă","epitaful":"epitaf","epitafule":"epitaf","epitafului":"epitaf","epitafuri":"epitaf","epitafurile":"epitaf","epitafurilor":"epitaf","epitalamul":"epitalam","epitalamule":"epitalam","epitalamului":"epitalam","epitalamuri":"epitalam","epitalamurile":"epitalam","epitalamurilor":"epitalam","epitaze":"epitază","epitazei":"epitază","epitazele":"epitază","epitazelor":"epitază","epiteliala":["epitelială","epitelial","epiteliala","epitelial"],"epiteliale":"epitelial","epitelialele":"epitelial","epiteliali":"epitelial","epitelialii":"epitelial","epitelialul":"epitelial","epitelii":"epiteliu","epiteliile":"epiteliu","epiteliilor":"epiteliu","epiteliomul":"epiteliom","epiteliomule":"epiteliom","epiteliomului":"epiteliom","epiteliomuri":"epiteliom","epiteliomurile":"epiteliom","epiteliomurilor":"epiteliom","epiteliul":"epiteliu","epiteliule":"epiteliu","epiteliului":"epiteliu","epitelizarea":"epitelizare","epitelizari":"epitelizare","epitelizarii":"epitelizare","epitelizarile":"epitelizare","epitelizarilor":"epitelizare","epiteoris":"epiteorisi","epiteorise":"epiteorisi","epiteorisea":"epiteorisi","epiteoriseai":"epiteorisi","epiteoriseam":"epiteorisi","epiteoriseati":"epiteorisi","epiteoriseau":"epiteorisi","epiteorisie":"epiteorisi","epiteorisii":"epiteorisi","epiteorisim":"epiteorisi","epiteorisind":"epiteorisi","epiteorisira":"epiteorisi","epiteorisiram":"epiteorisi","epiteorisirati":"epiteorisi","epiteorisise":"epiteorisi","epiteorisisem":"epiteorisi","epiteorisisera":"epiteorisi","epiteorisiseram":"epiteorisi","epiteorisiserati":"epiteorisi","epiteorisisesi":"epiteorisi","epiteorisisi":"epiteorisi","epiteorisit":"epiteorisi","epiteorisiti":"epiteorisi","epitermala":["epitermală","epitermal","epitermala","epitermal"],"epitermale":"epitermal","epitermalele":"epitermal","epitermali":"epitermal","epitermalii":"epitermal","epitermalul":"epitermal","epitete":"epitet","epitetele":"epitet","epitetelor":"epitet","epitetica":["epitetică","epitetic","epitetica","epitetic"],"epitetice":"epitetic","epiteticele":"epitetic","epitetici":"epitetic","epiteticii":"epitetic","epiteticul":"epitetic","epitetul":"epitet","epitetule":"epitet","epitetului":"epitet","epiteze":"epiteză","epitezei":"epiteză","epitezele":"epiteză","epitezelor":"epiteză","epitimia":"epitimie","epitimiei":"epitimie","epitimii":"epitimie","epitimiile":"epitimie","epitimiilor":"epitimie","epitomatori":"epitomator","epitomatorii":"epitomator","epitomatorilor":"epitomator","epitomatorul":"epitomator","epitomatorule":"epitomator","epitomatorului":"epitomator","epitrahile":"epitrahil","epitrahilele":"epitrahil","epitrahilelor":"epitrahil","epitrahilul":"epitrahil","epitrahilule":"epitrahil","epitrahilului":"epitrahil","epitre":"epitră","epitrei":"epitră","epitrele":"epitră","epitrelor":"epitră","epitropi":"epitrop","epitropia":"epitropie","epitropiei":"epitropie","epitropii":["epitropii","epitrop","epitropii","epitropie"],"epitropiile":"epitropie","epitropiilor":"epitropie","epitropilor":"epitrop","epitropirea":"epitropire","epitropiri":"epitropire","epitropirii":"epitropire","epitropirile":"epitropire","epitropirilor":"epitropire","epitropisirea":"epitropisire","epitropisiri":"epitropisire","epitropisirii":"epitropisire","epitropisirile":"epitropisire","epitropisirilor":"epitropisire","epitropita":["epitropită","epitropit","epitropita","epitropit"],"epitropite":"epitropit","epitropitele":"epitropit","epitropiti":"epitropit","epitropitii":"epitropit","epitropitul":"epitropit","epitropul":"epitrop","epitropule":"epitrop","epitropului":"epitrop","epizeuxisul":"epizeuxis","epizeuxisule":"epizeuxis","epizeuxisului":"epizeuxis","epizoade":"epizod","epizoadele":"epizod","epizoadelor":"epizod","epizoare":"epizoar","epizoarele":"epizoar","epizoarelor":"epizoar","epizoarul":"epizoar","epizoarule":"epizoar","epizoarului":"epizoar","epizodul":"epizod","epizodule":"epizod","epizodului":"epizod","epizootia":"epizootie","epizootica":["epizootică","epizootic","epizootica","epizootic"],"epizootice":"epizootic","epizooticele":"epizootic","epizootici":"epizootic","epizooticii":"epizootic","epizooticul":"epizootic","epizootiei":"epizootie","epizootii":"epizootie","epizootiile":"epizootie","epizootiilor":"epizootie","epocala":["epocală","epocal","epocala","epocal"],"epocale":"epocal","epocalele":"epocal","epocali":"epocal","epocalii":"epocal","epocalul":"epocal","epoci":"epocă","epoci de aur":"epocă de aur","epoci glaciare":"epocă glaciară","epocii":"epocă","epocile":"epocă","epocilor":"epocă","epode":"epodă","epodei":"epodă","epodele":"epodă","epodelor":"epodă","epohe":"epohă","epohei":"epohă","epohele":"epohă","epohelor":"epohă","epolete":"epoletă","epoletei":"epoletă","epoletele":"epoletă","epoletelor":"epoletă","epoleti":"epolet","epoletii":"epolet","epoletilor":"epolet","epoletul":"epolet","epoletule":"epolet","epoletului":"epolet","eponimi":"eponim","eponimia":"eponimie","eponimiei":"eponimie","eponimii":["eponimii","eponim","eponimii","eponimie"],"eponimilor":"eponim","eponimul":"eponim","eponimule":"eponim","eponimului":"eponim","eponjul":"eponj","eponjule":"eponj","eponjului":"eponj","epopeea":"epopee","epopei":"epopee","epopeica":["epopeică","epopeic","epopeica","epopeic"],"epopeice":"epopeic","epopeicele":"epopeic","epopeici":"epopeic","epopeicii":"epopeic","epopeicul":"epopeic","epopeii":"epopee","epopeile":"epopee","epopeilor":"epopee","eposul":"epos","eposule":"epos","eposului":"epos","eposuri":"epos","eposurile":"epos","eposurilor":"epos","epoxidul":"epoxid","epoxidule":"epoxid","epoxidului":"epoxid","epoxizi":"epoxid","epoxizile":"epoxid","epoxizilor":"epoxid","eprubete":"eprubetă","eprubetei":"eprubetă","eprubetele":"eprubetă","eprubetelor":"eprubetă","epruvete":"epruvetă","epruvetei":"epruvetă","epruvetele":"epruvetă","epruvetelor":"epruvetă","epsomitul":"epsomit","epsomitule":"epsomit","epsomitului":"epsomit","epuizabila":["epuizabilă","epuizabil","epuizabila","epuizabil"],"epuizabile":"epuizabil","epuizabilele":"epuizabil","epuizabili":"epuizabil","epuizabilii":"epuizabil","epuizabilul":"epuizabil","epuizai":"epuiza","epuizam":["epuizăm","epuiza","epuizam","epuiza"],"epuizand":"epuiza","epuizanta":["epuizantă","epuizant","epuizanta","epuizant"],"epuizante":"epuizant","epuizantele":"epuizant","epuizanti":"epuizant","epuizantii":"epuizant","epuizantul":"epuizant","epuizara":"epuiza","epuizaram":"epuiza","epuizarati":"epuiza","epuizarea":"epuizare","epuizari":"epuizare","epuizarii":"epuizare","epuizarile":"epuizare","epuizarilor":"epuizare","epuizase":"epuiza","epuizasem":"epuiza","epuizasera":"epuiza","epuizaseram":"epuiza","epuizaserati":"epuiza","epuizasesi":"epuiza","epuizasi":"epuiza","epuizat":"epuiza","epuizata":["epuizată","epuizat","epuizata","epuizat"],"epuizate":"epuizat","epuizatele":"epuizat","epuizati":["epuizați","epuiza","epuizați","epuizat"],"epuizatii":"epuizat","epuizatul":"epuizat","epuizau":"epuiza","epuizeaza":"epuiza","epuizez":"epuiza","epuizezi":"epuiza","epurai":"epura","epuram":["epurăm","epura","epuram","epura"],"epurand":"epura","epurara":"epura","epuraram":"epura","epurarati":"epura","epurarea":"epurare","epurarea etnica":"epurare etnică","epurari":"epurare","epurari etnice":"epurare etnică","epurarii":"epurare","epurarii etnice":"epurare etnică","epurarile":"epurare","epurarile etnice":"epurare etnică","epurarilor":"epurare","epurarilor etnice":"epurare etnică","epurase":"epura","epurasem":"epura","epurasera":"epura","epuraseram":"epura","epuraserati":"epura","epurasesi":"epura","epurasi":"epura","epurat":"epura","epurata":["epurată","epurat","epurata","epurat"],"epurate":"epurat","epuratele":"epurat","epurati":["epurați","epura","epurați","epurat"],"epuratia":"epurație","epuratiei":"epurație","epuratii":["epurații","epurat","epurații","epurație"],"epuratiile":"epurație","epuratiilor":"epurație","epuratiunea":"epurațiune","epuratiuni":"epurațiune","epuratiunii":"epurațiune","epuratiunile":"epurațiune"};
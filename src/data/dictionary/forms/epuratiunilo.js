@@ -0,0 +1 @@
+export default {"epuratiunilor":"epurațiune","epurativa":["epurativă","epurativ","epurativa","epurativ"],"epurative":"epurativ","epurativele":"epurativ","epurativi":"epurativ","epurativii":"epurativ","epurativul":"epurativ","epuratoare":"epurator","epuratoarele":"epurator","epuratoarelor":"epurator","epuratorul":"epurator","epuratorule":"epurator","epuratorului":"epurator","epuratul":"epurat","epurau":"epura","epure":"epură","epureaza":"epura","epurei":"epură","epurele":"epură","epurelor":"epură","epurez":"epura","epurezi":"epura","epuvantabila":["epuvantabilă","epuvantabil","epuvantabila","epuvantabil"],"epuvantabile":"epuvantabil","epuvantabilele":"epuvantabil","epuvantabili":"epuvantabil","epuvantabilii":"epuvantabil","epuvantabilul":"epuvantabil","equivalent -oaia":"-oiu","equivalent -oi":"-oaie","equivalent babiloniana":"babilonian","equivalent babysitter":"babysitter","equivalent bacalaureata":"bacalaureat","equivalent bacaneasa":"băcan","equivalent bacauana":"băcăuan","equivalent bacteriologa":"bacteriolog","equivalent badarana":"bădăran","equivalent baimareanca":"băimărean","equivalent balcanista":"balcanist","equivalent balcanologa":"balcanolog","equivalent balerina":"balerin","equivalent baletista":"baletist","equivalent balica":"balic","equivalent balisticiana":"balistician","equivalent balneologa":"balneolog","equivalent banateana":"bănățean","equivalent banchera":"bancher","equivalent bandurista":"bandurist","equivalent baptista":"baptist","equivalent barbara":"barbar","equivalent barbiereasa":"bărbier","equivalent barladeana":"bârlădean","equivalent barmanita":"barman","equivalent baroneasa":"baron","equivalent basarabeanca":"basarabean","equivalent baschetbalista":"baschetbalist","equivalent baschira":"bașchir","equivalent baskira":"bașkir","equivalent batava":"batav","equivalent baterista":"baterist","equivalent bautoare":"băutor","equivalent beduina":"beduin","equivalent belgiana":"belgian","equivalent belgradeanca":"belgrădean","equivalent beneficiara":"beneficiar","equivalent benineza":"beninez","equivalent berareasa":"berar","equivalent bernardina":"bernardin","equivalent betiva":"bețiv","equivalent betivana":"bețivan","equivalent betonista":"betonist","equivalent biatlonista":"biatlonist","equivalent bibica":"bibic","equivalent bibliofaga":"bibliofag","equivalent bibliofila":"bibliofil","equivalent bibliofoba":"bibliofob","equivalent bibliologa":"bibliolog","equivalent bibliomana":"biblioman","equivalent bibliotecara":"bibliotecar","equivalent biciclista":"biciclist","equivalent bielorusa":"bielorus","equivalent bigama":"bigam","equivalent bigota":"bigot","equivalent bihoreana":"bihorean","equivalent bilingva":"bilingv","equivalent binefacatoare":"binefăcător","equivalent biochimista":"biochimist","equivalent bioclimatologa":"bioclimatolog","equivalent biofiziciana":"biofizician","equivalent biogeografa":"biogeograf","equivalent biografa":"biograf","equivalent bioinginera":"bioinginer","equivalent biologa":"biolog","equivalent biomatematiciana":"biomatematician","equivalent biometeorologa":"biometeorolog","equivalent biospeologa":"biospeolog","equivalent biotehniciana":"biotehnician","equivalent birmana":"birman","equivalent birnica":"birnic","equivalent birocrata":"birocrat","equivalent bisexuala":"bisexual","equivalent bisnitara":"bișnițar","equivalent bistriteana":"bistrițean","equivalent bitanga":"bitang","equivalent bizantinista":"bizantinist","equivalent bizantinologa":"bizantinolog","equivalent blajeanca":"blăjean","equivalent blanareasa":"blănar","equivalent blasfematoare":"blasfemator","equivalent bobinatoare":"bobinator","equivalent bocitor":"bocitoare","equivalent boema":"boem","equivalent bogata":"bogat","equivalent bogatana":"bogătan","equivalent bogatasa":"bogătaș","equivalent boiereasa":"boier","equivalent boliviana":"bolivian","equivalent bolsevica":"bolșevic","equivalent bonapartista":"bonapartist","equivalent boschetara":"boschetar","equivalent bosimana":"boșiman","equivalent bosniaca":"bosniac","equivalent botanista":"botanist","equivalent botosaneana":"botoșănean","equivalent boxera":"boxer","equivalent bozgoroaica":"bozgor","equivalent brahicefala":"brahicefal","equivalent brahmana":"brahman","equivalent braileana":"brăilean","equivalent branzareasa":"brânzar","equivalent brasista":"brasist","equivalent brasoveana":"brașovean","equivalent brazilianca":"brazilian","equivalent bridgista":"bridgist","equivalent brigadiera":"brigadier","equivalent brutareasa":"brutar","equivalent bucatareasa":"bucătar","equivalent buciumasa":"buciumaș","equivalent bucovineana":"bucovinean","equivalent bucuresteanca":"bucureștean","equivalent budista":"budist","equivalent bufetiera":"bufetier","equivalent bufona":"bufon","equivalent bugetara":"bugetar","equivalent buhuseanca":"buhușean","equivalent bulangioaica":"bulangiu","equivalent bulevardiera":"bulevardier","equivalent bulgara":"bulgar","equivalent bumbacareasa":"bumbăcar","equivalent buna":"bun","equivalent bunic":"bunică","equivalent burgheza":"burghez","equivalent bursiera":"bursier","equivalent burundeza":"burundez","equivalent buzoiana":"buzoian","equivalent ea":"el","equivalent ecologa":"ecolog","equivalent ecologista":"ecologist","equivalent economista":"economist","equivalent ecuadoriana":"ecuadorian","equivalent educatoare":"educator","equivalent egala":"egal","equivalent egipteana":"egiptean","equivalent ei":["equivalent ei","ele","equivalent ei","lui"],"equivalent el":"ea","equivalent ele":"ei","equivalent electriciana":"electrician","equivalent eleva":"elev","equivalent elvetiana":"elvețian","equivalent engleza":"englez","equivalent enologa":"enolog","equivalent entomologa":"entomolog","equivalent eretica":"eretic","equivalent ergonomista":"ergonomist","equivalent eroina":"erou","equivalent erpetologa":"erpetolog","equivalent escroaca":"escroc","equivalent esperantista":"esperantist","equivalent esteticiana":"estetician","equivalent estona":"eston","equivalent estonian":"estoniană","equivalent estoniana":"estonian","equivalent etimologista":"etimologist","equivalent etiopiana":"etiopian","equivalent etnologa":"etnolog","equivalent etrusca":"etrusc","equivalent eurocomunista":"eurocomunist","equivalent europeana":"european","equivalent evreica":"evreu","equivalent evreu":"evreică","equivalent excursionista":"excursionist","equivalent exhibitionista":"exhibiționist","equivalent existentialista":"existențialist","equivalent experta":"expert","equivalent exploatatoare":"exploatator","equivalent expresionista":"expresionist","equivalent falsificatoare":["equivalent falsificatoare","falsificator","equivalent falșificatoare","falșificator"],"equivalent faptasa":"făptaș","equivalent farmacista":"farmacist","equivalent farmacologa":"farmacolog","equivalent farsarota":"fărșărot","equivalent farserota":["equivalent fârșerotă","fârșerot","equivalent fărșerotă","fărșerot"],"equivalent fascista":"fascist","equivalent federalista":"federalist","equivalent fermiera":"fermier","equivalent fiastra":"fiastru","equivalent fijiana":"fijian","equivalent filipineza":"filipinez","equivalent filologa":"filolog","equivalent filozoafa":"filozof","equivalent fin":"fină","equivalent fina":"fin","equivalent finlandez":"finlandeză","equivalent finlandeza":"finlandez","equivalent fitologa":"fitolog","equivalent fiziciana":"fizician","equivalent fiziologa":"fiziolog","equivalent flamanda":"flamand","equivalent flautista":"flautist","equivalent florentina":"florentin","equivalent florista":"florist","equivalent folclorista":"folclorist","equivalent fost":"fostă","equivalent fosta":"fost","equivalent fotbalista":"fotbalist","equivalent fraiera":"fraier","equivalent francez":["equivalent francez","franceză","equivalent francez","franțuzoaică"],"equivalent franteza":"franțez","equivalent frantuzoaica":"francez","equivalent frizerita":"frizer","equivalent fumatoare":"fumător","equivalent fundamentalista":"fundamentalist","equivalent gaboneza":"gabonez","equivalent galiciana":"galician","equivalent gambiana":"gambian","equivalent gascan":"gâscă","equivalent genealogista":"genealogist","equivalent geneticiana":"genetician","equivalent geofiziciana":"geofizician","equivalent geografa":"geograf","equivalent geologa":"geolog","equivalent georgiana":"georgian","equivalent geriatra":"geriatru","equivalent germana":"german","equivalent geta":"get","equivalent ghid":"ghidă","equivalent ghida":"ghid","equivalent gimnasta":"gimnast","equivalent ginecologa":"ginecolog","equivalent ginere":"noră","equivalent glaciologa":"glaciolog","equivalent gnostica":"gnostic","equivalent gradinareasa":"grădinar","equivalent grec":["equivalent grec","greacă","equivalent grec","grecoaică"],"equivalent grecoaica":"grec","equivalent gunoiera":"gunoier","equivalent guvernanta":"guvernant","equivalent guvernor":"guvernantă","equivalent habarnamista":"habarnamist","equivalent haitiana":"haitian","equivalent harpista":"harpist","equivalent harsoveanca":"hârșovean","equivalent hedonista":"hedonist","equivalent hegemona":"hegemon","equivalent heterosexuala":"heterosexual","equivalent hidrologa":"hidrolog","equivalent histologa":"histolog","equivalent hoata":"hoț","equivalent homeopata":"homeopat","equivalent homosexual":"homosexuală","equivalent homosexuala":"homosexual","equivalent horezeanca":"horezean","equivalent horticultoare":"horticultor","equivalent humorista":"humorist","equivalent jainista":"jainist","equivalent jamaicana":"jamaican","equivalent japonez":"japoneză","equivalent japoneza":"japonez","equivalent javaneza":"javanez","equivalent jidanca":"jidan","equivalent jidoavca":"jidov","equivalent jucatoare":"jucător","equivalent jucator":"jucătoare","equivalent junc":"juncă","equivalent junca":"junc","equivalent jupaneasa":"jupân","equivalent jurista":"jurist","equivalent jurnalista":"jurnalist","equivalent kargaza":"kârgâz","equivalent khmera":"khmer","equivalent kirghiza":"kirghiz","equivalent kiribatiana":"kiribatian","equivalent kosovara":"kosovar","equivalent kurda":"kurd","equivalent lamaista":"lamaist","equivalent laudatoare":"lăudător","equivalent lenesa":"leneș","equivalent lepidopterologa":"lepidopterolog","equivalent leton":"letonă","equivalent letona":"leton","equivalent levreta":"levrier","equivalent levrier":"levretă","equivalent lexicografa":"lexicograf","equivalent liberiana":"liberian","equivalent libiana":"libian","equivalent limbuta":"limbut","equivalent limnologa":"limnolog","equivalent linguista":"linguist","equivalent lingusitoare":"lingușitor","equivalent lingvista":"lingvist","equivalent litografa":"litograf","equivalent lituaniana":"lituanian","equivalent lobbyista":"lobbyist","equivalent logodnic":"logodnică","equivalent logodnica":"logodnic","equivalent loialista":"loialist","equivalent longeviva":"longeviv","equivalent lucratoare":"lucrător","equivalent lui":"ei","equivalent luxemburgheza":"luxemburghez","equivalent namibiana":"namibian","equivalent nasa":"naș","equivalent nasuca":"nășuc","equivalent naturalista":"naturalist","equivalent nauruana":"nauruan","equivalent navigatoare":"navigator","equivalent nebuna":"nebun","equivalent necromanta":"necromant","equivalent neerlandez":"neerlandeză","equivalent neerlandeza":"neerlandez","equivalent negociatoare":"negociator","equivalent negresa":"negru","equivalent negru":"negresă","equivalent negustoreasa":"negustor","equivalent neocolonialista":"neocolonialist","equivalent nepaleza":"nepalez","equivalent nepoata":"nepot","equivalent nepot":"nepoată","equivalent neurologa":"neurolog","equivalent nevazatoare":"nevăzător","equivalent nevrotica":"nevrotic","equivalent nicaraguana":"nicaraguan","equivalent nigeriana":"nigerian","equivalent niueana":"niuean","equivalent nomada":"nomad","equivalent nonconformista":"nonconformist","equivalent nora":"ginere","equivalent nord-europeana":"nord-european","equivalent norvegiana":"norvegian","equivalent nudista":"nudist","equivalent nuna":"nun","equivalent nutritionista":"nutriționist","equivalent oarba":"orb","equivalent observatoare":"observator","equivalent oceanografa":"oceanograf","equivalent ocupatoare":"ocupator","equivalent olandeza":"olandez","equivalent omaneza":"omanez","equivalent oncologa":"oncolog","equivalent oportunista":"oportunist","equivalent opticiana":"optician","equivalent optimista":"optimist","equivalent oraseana":"orășean","equivalent oratoare":"orator","equivalent orbeata":"orbeț","equivalent orfana":"orfan","equivalent ornitologa":"ornitolog","equivalent ortopeda":"ortoped","equivalent ortopedista":"ortopedist","equivalent ospatar":"ospătăriță","equivalent ospatarita":"ospătar","equivalent ostrogota":"ostrogot","equivalent otologa":"otolog","equivalent quakera":"quaker","equivalent radicalista":"radicalist","equivalent ramanca":"râmân","equivalent rasista":"rasist","equivalent rasnoveanca":"râșnovean","equivalent rata":"rățoi","equivalent ratoi":"rață","equivalent raufacatoare":"răufăcător","equivalent rege":"regină","equivalent regina":"rege","equivalent regizoare":"regizor","equivalent regizoare de film":"regizor de film","equivalent repetenta":"repetent","equivalent reprezentanta":"reprezentant","equivalent restauratoare":"restaurator","equivalent revizionista":"revizionist","equivalent rezidenta":"rezident","equivalent roaba":"rob","equivalent roma":"rom","equivalent roman":"româncă","equivalent romana":"roman","equivalent romanca":"român","equivalent romanciera":"romancier","equivalent rus":"rusoaică","equivalent rusoaica":"rus","equivalent rusofona":"rusofon","equivalent tahitiana":"tahitian","equivalent tampita":"tâmpit","equivalent tanara":"tânăr","equivalent tanzaniana":"tanzanian","equivalent taranca":"țăran","equivalent tarigradeana":"țarigrădean","equivalent tataroaica":"tătar","equivalent telefonista":"telefonist","equivalent telegrafista":"telegrafist","equivalent tenismana":"tenisman","equivalent teoretica":"teoretic","equivalent terorista":"terorist","equivalent textologa":"textolog","equivalent thailandeza":"thailandez","equivalent tibetana":"tibetan","equivalent tiganca":"țigan","equivalent tigroaica":"tigru","equivalent tigru":"tigroaică","equivalent tip":"tipă","equivalent tipa":"tip","equivalent tirana":"tiran","equivalent toanta":"tont","equivalent tolteca":"toltec","equivalent tongana":"tongan","equivalent tovarasa":"tovarăș","equivalent tradatoare":"trădător","equivalent traducatoare":"traducător","equivalent tragediana":"tragedian","equivalent transilvaneanca":"transilvănean","equivalent translatoare":"translator","equivalent transnistreana":"transnistrean","equivalent trecatoare":"trecător","equivalent tretioara":"tretior","equivalent triatlonista":"triatlonist","equivalent trinidadiana":"trinidadian","equivalent tunisiana":"tunisian","equivalent turca":"turc","equivalent turdeanca":"turdean","equivalent turista":"turist","equivalent turkmena":"turkmen","equivalent turneanca":"turnean","equivalent tuvaluana":"tuvaluan","equivalent ucraineana":"ucrainean","equivalent udmurta":"udmurt","equivalent ugandeza":"ugandez","equivalent umanista":"umanist","equivalent umorista":"umorist","equivalent ungureana":"ungurean","equivalent uracioasa":"urâcios","equivalent urmasa":"urmaș","equivalent urologa":"urolog","equivalent urs":"ursă","equivalent ursa":"urs","equivalent uruguayana":"uruguayan","equivalent utilitarista":"utilitarist","equivalent utilizatoare":"utilizator","equivalent uzbeca":"uzbec","equivalent vaduvioara":"văduvior","equivalent valaha":"valah","equivalent valona":"valon","equivalent vampir":"vampiră","equivalent vampira":"vampir","equivalent vanzatoare":"vânzător","equivalent vanzator":"vânzătoare","equivalent var":"vară","equivalent vara":"văr","equivalent vatmanita":"vatman","equivalent vechiuta":"vechiuț","equivalent vecin":"vecină","equivalent vecina":"vecin","equivalent vecinasa":"vecinaș","equivalent venetiana":"venețian","equivalent venetica":"venetic","equivalent vicepresedinta":"vicepreședinte","equivalent vietnamez":"vietnameză","equivalent vietnameza":"vietnamez","equivalent viezuroaica":"viezure","equivalent vindecatoare":"vindecător","equivalent violoncelista":"violoncelist","equivalent violonista":"violonist","equivalent virologa":"virolog","equivalent visatoare":"visător","equivalent visator":"visătoare","equivalent viticultoare":"viticultor","equivalent vlasceana":"vlășcean","equivalent voievodeasa":"voievod","equivalent voluntara":"voluntar","equivalent vopsitoare":"vopsitor","equivalent vorbitoare":"vorbitor","equivalent vorbitor":"vorbitoare","equivalent vrajitoare":"vrăjitor","equivalent vulcanologa":"vulcanolog","equivalent vulpoi":"vulpe","equivalent xenofoba":"xenofob","equivalent xilofonista":"xilofonist","equivalent zalauanca":"zălăuan","equivalent zambiana":"zambian","equivalent zarzavagioaica":"zarzavagiu","equivalent zee":"zeu","equivalent zeu":"zeiță","equivalent zevzeaca":"zevzec","equivalent ziarista":"ziarist","equivalent zoologa":"zoolog","equivalent анархистэ":"анархист","equivalent империалистэ":"империалист","equivalent капиталистэ":"капиталист","equivalent комунистэ":"комунист","equivalent космонаутэ":"космонаут","equivalent националистэ":"националист","equivalent сепаратистэ":"сепаратист","equivalent терористэ":"терорист","era":"fi","eradicabila":["eradicabilă","eradicabil","eradicabila","eradicabil"],"eradicabile":"eradicabil","eradicabilele":"eradicabil","eradicabili":"eradicabil","eradicabilii":"eradicabil","eradicabilul":"eradicabil","eradicai":"eradica","eradicam":["eradicăm","eradica","eradicam","eradica"],"eradicand":"eradica","eradicara":"eradica","eradicaram":"eradica","eradicarati":"eradica","eradicarea":"eradicare","eradicari":"eradicare","eradicarii":"eradicare","eradicarile":"eradicare","eradicarilor":"eradicare","eradicase":"eradica","eradicasem":"eradica","eradicasera":"eradica","eradicaseram":"eradica","eradicaserati":"eradica","eradicasesi":"eradica","eradicasi":"eradica","eradicat":"eradica","eradicata":["eradicată","eradicat","eradicata","eradicat"],"eradicate":"eradicat","eradicatele":"eradicat","eradicati":["eradicați","eradica","eradicați","eradicat"],"eradicatia":"eradicație","eradicatiei":"eradicație","eradicatii":["eradicații","eradicat","eradicații","eradicație"],"eradicatiile":"eradicație","eradicatiilor":"eradicație","eradicatul":"eradicat","eradicau":"eradica","eradicheaza":"eradica","eradichez":"eradica","eradichezi":"eradica","erai":"fi","eram":"fi","erasmiana":["erasmiană","erasmian","erasmiana","erasmian"],"erasmianul":"erasmian","erasmica":["erasmică","erasmic","erasmica","erasmic"],"erasmice":"erasmic","erasmicele":"erasmic","erasmici":"erasmic","erasmicii":"erasmic","erasmicul":"erasmic","erasmiene":"erasmian","erasmienele":"erasmian","erasmieni":"erasmian","erasmienii":"erasmian","erataul":"erată","erataule":"erată","erataului":"erată","erate":"erată","eratele":"erată","eratelor":"erată","erati":"fi","eratica":["eratică","eratic","eratica","eratic"],"eratice":"eratic","eraticele":"eratic","eratici":"eratic","eraticii":"eratic","eraticul":"eratic","erau":"fi","erbacee":"erbaceu","erbaceea":["erbaceea","erbacee","erbaceea","erbaceu"],"erbaceei":"erbacee","erbaceele":["erbaceele","erbacee","erbaceele","erbaceu"],"erbaceelor":"erbacee","erbacei":"erbaceu","erbaceii":"erbaceu","erbaceul":"erbaceu","erbicidai":"erbicida","erbicidam":["erbicidăm","erbicida","erbicidam","erbicida"],"erbicidand":"erbicida","erbicidara":"erbicida","erbicidaram":"erbicida","erbicidarati":"erbicida","erbicidarea":"erbicidare","erbicidari":"erbicidare","erbicidarii":"erbicidare","erbicidarile":"erbicidare","erbicidarilor":"erbicidare","erbicidase":"erbicida","erbicidasem":"erbicida","erbicidasera":"erbicida","erbicidaseram":"erbicida","erbicidaserati":"erbicida","erbicidasesi":"erbicida","erbicidasi":"erbicida","erbicidat":"erbicida","erbicidata":["erbicidată","erbicidat","erbicidata","erbicidat"],"erbicidate":"erbicidat","erbicidatele":"erbicidat","erbicidati":["erbicidați","erbicida","erbicidați","erbicidat"],"erbicidatii":"erbicidat","erbicidatul":"erbicidat","erbicidau":"erbicida","erbicide":"erbicid","erbicideaza":"erbicida","erbicidele":"erbicid","erbicidelor":"erbicid","erbicidez":"erbicida","erbicidezi":"erbicida","erbicidul":"erbicid","erbicidule":"erbicid","erbicidului":"erbicid","erbiul":"erbiu","erbiule":"erbiu","erbiului":"erbiu","erbivori":"erbivor","erbivorile":"erbivor","erbivorilor":"erbivor","erbivorul":"erbivor","erbivorule":"erbivor","erbivorului":"erbivor","erboristi":"erborist","erboristii":"erborist","erboristilor":"erborist","erboristul":"erborist","erboristule":"erborist","erboristului":"erborist","erborizai":"erboriza","erborizam":["erborizăm","erboriza","erborizam","erboriza"],"erborizand":"erboriza","erborizara":"erboriza","erborizaram":"erboriza","erborizarati":"erboriza","erborizase":"erboriza","erborizasem":"erboriza","erborizasera":"erboriza","erborizaseram":"erboriza","erborizaserati":"erboriza","erborizasesi":"erboriza","erborizasi":"erboriza","erborizat":"erboriza","erborizati":"erboriza","erborizatia":"erborizație","erborizatiei":"erborizație","erborizatii":"erborizație","erborizatiile":"erborizație","erborizatiilor":"erborizație","erborizau":"erboriza","erborizeaza":"erboriza","erborizez":"erboriza","erborizezi":"erboriza","ercazisul":"ercăziș","ercazisule":"ercăziș","ercazisului":"ercăziș","erculeana":["erculeană","erculean","erculeana","erculean"],"erculeanul":"erculean","erculene":"erculean","erculenele":"erculean","erculeni":"erculean","erculenii":"erculean","ere":"eră","ere glaciare":"eră glaciară","erecta":["erectă","erect","erecta","erect"],"erecte":"erect","erectele":"erect","erecti":"erect","erectia":"erecție","erectiei":"erecție","erectii":["erecții","erect","erecții","erecție"],"erectiile":"erecție","erectiilor":"erecție","erectila":["erectilă","erectil","erectila","erectil"],"erectile":"erectil","erectilele":"erectil","erectili":"erectil","erectilii":"erectil","erectilitatati":"erectilitate","erectilitatatii":"erectilitate","erectilitatatile":"erectilitate","erectilitatatilor":"erectilitate","erectilitatea":"erectilitate","erectilul":"erectil","erectiune":"erecție","erectiunea":"erecțiune","erectiuni":"erecțiune","erectiunii":"erecțiune","erectiunile":"erecțiune","erectiunilor":"erecțiune","erectori":"erector","erectorile":"erector","erectorilor":"erector","erectorul":"erector","erectorule":"erector","erectorului":"erector","erectul":"erect","eredai":"ereda","eredam":["eredăm","ereda","eredam","ereda"],"eredand":"ereda","eredara":"ereda","eredaram":"ereda","eredarati":"ereda","eredase":"ereda","eredasem":"ereda","eredasera":"ereda","eredaseram":"ereda","eredaserati":"ereda","eredasesi":"ereda","eredasi":"ereda","eredat":"ereda","eredati":"ereda","eredau":"ereda","eredeaza":"ereda","eredeul":"erede","eredeule":"erede","eredeului":"erede","eredez":"ereda","eredezi":"ereda","ereditara":["ereditară","ereditar","ereditara","ereditar"],"ereditare":"ereditar","ereditarele":"ereditar","ereditari":"ereditar","ereditarii":"ereditar","ereditarul":"ereditar","ereditata":["ereditată","ereditat","ereditata","ereditat"],"ereditate":"ereditat","ereditatea":"ereditate","ereditatele":"ereditat","ereditati":["ereditați","ereditat","eredități","ereditate"],"ereditatii":["ereditații","ereditat","eredității","ereditate"],"ereditatile":"ereditate","ereditatilor":"ereditate","ereditatori":"ereditator","ereditatorii":"ereditator","ereditatorilor":"ereditator","ereditatorul":"ereditator","ereditatorule":"ereditator","ereditatorului":"ereditator","ereditatul":"ereditat","eredobiologia":"eredobiologie","eredobiologiei":"eredobiologie","eredobiologii":"eredobiologie","eredobiologiile":"eredobiologie","eredobiologiilor":"eredobiologie","eredopatia":"eredopatie","eredopatiei":"eredopatie","eredopatii":"eredopatie","eredopatiile":"eredopatie","eredopatiilor":"eredopatie","eredosifilisul":"eredosifilis","eredosifilisule":"eredosifilis","eredosifilisului":"eredosifilis","eredosifilitica":["eredosifilitică","eredosifilitic","eredosifilitica","eredosifilitic"],"eredosifilitice":"eredosifilitic","eredosifiliticele":"eredosifilitic","eredosifilitici":"eredosifilitic","eredosifiliticii":"eredosifilitic","eredosifiliticul":"eredosifilitic","erei":"eră","erele":"eră","erelor":"eră","erema":["eremă","erem","erema","erem"],"ereme":"erem","eremele":"erem","eremi":"erem","eremii":"erem","eremita":["eremită","eremit","eremita","eremit"],"eremitagii":"eremitagiu","eremitagiile":"eremitagiu","eremitagiilor":"eremitagiu","eremitagiuul":"eremitagiu","eremitagiuule":"eremitagiu","eremitagiuului":"eremitagiu","eremitatati":"eremitate","eremitatatii":"eremitate","eremitatatile":"eremitate","eremitatatilor":"eremitate","eremitatea":"eremitate","eremite":"eremit","eremitele":"eremit","eremiti":"eremit","eremitica":["eremitică","eremitic","eremitica","eremitic"],"eremitice":"eremitic","eremiticele":"eremitic","eremitici":"eremitic","eremiticii":"eremitic","eremiticul":"eremitic","eremitii":"eremit","eremitul":"eremit","eremul":"erem","eremule":"erem","eremului":"erem","erepsine":"erepsină","erepsinei":"erepsină","erepsinele":"erepsină","erepsinelor":"erepsină","eresipele":"eresipelă","eresipelei":"eresipelă","eresipelele":"eresipelă","eresipelelor":"eresipelă","eresul":"eres","eresule":"eres","eresului":"eres","eresuri":"eres","eresurile":"eres","eresurilor":"eres","ereteul":"erete","ereteule":"erete","ereteului":"erete","ereti":"erete","ereti albi":"erete alb","ereti de stuf":"erete de stuf","ereti suri":"erete sur","ereti vineti":"erete vânăt","eretica":["eretică","eretic","eretica","eretic"],"ereticala":["ereticală","eretical","ereticala","eretical"],"ereticale":"eretical","ereticalele":"eretical","ereticali":"eretical","ereticalii":"eretical","ereticalul":"eretical","eretice":"eretic","ereticeasca":["ereticească","ereticesc","ereticeasca","ereticesc"],"ereticele":"eretic","ereticescul":"ereticesc","ereticesti":"ereticesc","ereticestii":"ereticesc","ereticestile":"ereticesc","eretici":["eretici","eretic","eretici","eretică"],"ereticia":"ereticie","ereticiei":"ereticie","ereticii":["ereticii","eretic","ereticii","eretică","ereticii","ereticie"],"ereticiile":"ereticie","ereticiilor":"ereticie","ereticile":"eretică","ereticilor":["ereticilor","eretic","ereticilor","eretică"],"ereticitatati":"ereticitate","ereticitatatii":"ereticitate","ereticitatatile":"ereticitate","ereticitatatilor":"ereticitate","ereticitatea":"ereticitate","ereticituri":"ereticitură","ereticiturii":"ereticitură","ereticiturile":"ereticitură","ereticiturilor":"ereticitură","ereticul":"eretic","ereticule":"eretic","ereticului":"eretic","eretii":"erete","eretilor":"erete","eretisme":"eretism","eretismele":"eretism","eretismelor":"eretism","eretismul":"eretism","eretismule":"eretism","eretismului":"eretism","eretocrisia":"eretocrisie","eretocrisiei":"eretocrisie","eretocrisii":"eretocrisie","ereutofobia":"ereutofobie","ereutofobiei":"ereutofobie","ereutofobii":"ereutofobie","ereutofobiile":"ereutofobie","ereutofobiilor":"ereutofobie","erezi":"erede","erezia":"erezie","ereziei":"erezie","erezii":["erezii","erede","erezii","erezie"],"ereziile":"erezie","ereziilor":"erezie","erezilor":"erede","erezitari":"erezitar","erezitarii":"erezitar","erezitarilor":"erezitar","erezitarul":"erezitar","erezitarule":"erezitar","erezitarului":"erezitar","ergastoplasme":"ergastoplasmă","ergastoplasmei":"ergastoplasmă","ergastoplasmele":"ergastoplasmă","ergastoplasmelor":"ergastoplasmă","ergative":"ergativ","ergativele":"ergativ","ergativelor":"ergativ","ergativul":"ergativ","ergativule":"ergativ","ergativului":"ergativ","ergi":"erg","ergii":"erg","ergilor":"erg","ergocalciferolul":"ergocalciferol","ergocalciferolule":"ergocalciferol","ergocalciferolului":"ergocalciferol","ergocicluul":"ergociclu","ergocicluule":"ergociclu","ergocicluului":"ergociclu","ergocicluuri":"ergociclu","ergocicluurile":"ergociclu","ergocicluurilor":"ergociclu","ergografe":"ergograf","ergografele":"ergograf","ergografelor":"ergograf","ergograful":"ergograf","ergografule":"ergograf","ergografului":"ergograf","ergoli":"ergol","ergolii":"ergol","ergolilor":"ergol","ergolul":"ergol","ergolule":"ergol","ergolului":"ergol","ergometre":"ergometru","ergometrele":"ergometru","ergometrelor":"ergometru","ergometria":"ergometrie","ergometrica":["ergometrică","ergometric","ergometrica","ergometric"],"ergometrice":"ergometric","ergometricele":"ergometric","ergometrici":"ergometric","ergometricii":"ergometric","ergometricul":"ergometric","ergometriei":"ergometrie","ergometrii":"ergometrie","ergometrine":"ergometrină","ergometrinei":"ergometrină","ergometrinele":"ergometrină","ergometrinelor":"ergometrină","ergometrul":"ergometru","ergometrule":"ergometru","ergometrului":"ergometru","ergonomia":"ergonomie","ergonomica":["ergonomică","ergonomic","ergonomica","ergonomic"],"ergonomice":"ergonomic","ergonomicele":"ergonomic","ergonomici":"ergonomic","ergonomicii":"ergonomic","ergonomicul":"ergonomic","ergonomiei":"ergonomie","ergonomii":"ergonomie","ergonomiste":"ergonomistă","ergonomistei":"ergonomistă","ergonomistele":"ergonomistă","ergonomistelor":"ergonomistă","ergonomisti":"ergonomist","ergonomistii":"ergonomist","ergonomistilor":"ergonomist","ergonomistul":"ergonomist","ergonomistule":"ergonomist","ergonomistului":"ergonomist","ergospirometre":"ergospirometru","ergospirometrele":"ergospirometru","ergospirometrelor":"ergospirometru","ergospirometruul":"ergospirometru","ergospirometruule":"ergospirometru","ergospirometruului":"ergospirometru","ergosterine":"ergosterină","ergosterinei":"ergosterină","ergosterinele":"ergosterină","ergosterinelor":"ergosterină","ergosteroli":"ergosterol","ergosterolii":"ergosterol","ergosterolilor":"ergosterol","ergosterolul":"ergosterol","ergosterolule":"ergosterol","ergosterolului":"ergosterol","ergotamine":"ergotamină","ergotaminei":"ergotamină","ergoterapeuti":"ergoterapeut","ergoterapeutii":"ergoterapeut","ergoterapeutilor":"ergoterapeut","ergoterapeutul":"ergoterapeut","ergoterapeutule":"ergoterapeut","ergoterapeutului":"ergoterapeut","ergoterapia":"ergoterapie","ergoterapiei":"ergoterapie","ergoterapii":"ergoterapie","ergotine":"ergotină","ergotinei":"ergotină","ergotinele":"ergotină","ergotinelor":"ergotină","ergotismul":"ergotism","ergotismule":"ergotism","ergotismului":"ergotism","ergotoxine":"ergotoxină","ergotoxinei":"ergotoxină","ergotoxinele":"ergotoxină","ergotoxinelor":"ergotoxină","ergotul":"ergot","ergotule":"ergot","ergotului":"ergot","ergoturi":"ergot","ergoturile":"ergot","ergoturilor":"ergot","ergul":"erg","ergule":"erg","ergului":"erg","erhe":"erhă","erhei":"erhă","erisipelase":"erisipelas","erisipelasele":"erisipelas","erisipelaselor":"erisipelas","erisipelasul":"erisipelas","erisipelasule":"erisipelas","erisipelasului":"erisipelas","eristica":["eristică","eristic","eristica","eristic"],"eristice":"eristic","eristicele":"eristic","eristici":"eristic","eristicii":"eristic","eristicul":"eristic","eritaje":"eritaj","eritajele":"eritaj","eritajelor":"eritaj","eritajul":"eritaj","eritajule":"eritaj","eritajului":"eritaj","eritematoasa":["eritematoasă","eritematos","eritematoasa","eritematos"],"eritematoase":["eritematoase","eritematoasă","eritematoase","eritematos"],"eritematoasei":"eritematoasă","eritematoasele":["eritematoasele","eritematoasă","eritematoasele","eritematos"],"eritematoaselor":"eritematoasă","eritematosi":"eritematos","eritematosii":"eritematos","eritematosul":"eritematos","eriteme":"eritem","eritemele":"eritem","eritemelor":"eritem","eritemul":"eritem","eritemule":"eritem","eritemului":"eritem","eriticoasa":["eriticoasă","eriticos","eriticoasa","eriticos"],"eriticoase":"eriticos","eriticoasele":"eriticos","eriticosi":"eriticos","eriticosii":"eriticos","eriticosul":"eriticos","eritreeane":"eritreeană","eritreeanei":"eritreeană","eritreeanele":"eritreeană","eritreeanelor":"eritreeană","eritremia":"eritremie","eritremiei":"eritremie","eritremii":"eritremie","eritremiile":"eritremie","eritremiilor":"eritremie","eritrine":"eritrină","eritrinei":"eritrină","eritrinele":"eritrină","eritrinelor":"eritrină","eritrite":"eritrită","eritritei":"eritrită","eritritele":"eritrită","eritritelor":"eritrită","eritroblastemia":"eritroblastemie","eritroblastemiei":"eritroblastemie","eritroblastemii":"eritroblastemie","eritroblastemiile":"eritroblastemie","eritroblastemiilor":"eritroblastemie","eritroblasti":"eritroblast","eritroblastii":"eritroblast","eritroblastilor":"eritroblast","eritroblastopenia":"eritroblastopenie","eritroblastopeniei":"eritroblastopenie","eritroblastopenii":"eritroblastopenie","eritroblastopeniile":"eritroblastopenie","eritroblastopeniilor":"eritroblastopenie","eritroblastoze":"eritroblastoză","eritroblastozei":"eritroblastoză","eritroblastozele":"eritroblastoză","eritroblastozelor":"eritroblastoză","eritroblastul":"eritroblast","eritroblastule":"eritroblast","eritroblastului":"eritroblast","eritrocite":"eritrocit","eritrocitele":"eritrocit","eritrocitelor":"eritrocit","eritrocitoze":"eritrocitoză","eritrocitozei":"eritrocitoză","eritrocitozele":"eritrocitoză","eritrocitozelor":"eritrocitoză","eritrocitul":"eritrocit","eritrocitule":"eritrocit","eritrocitului":"eritrocit","eritrodermia":"eritrodermie","eritrodermiei":"eritrodermie","eritrodermii":"eritrodermie","eritrodermiile":"eritrodermie","eritrodermiilor":"eritrodermie","eritrofobia":"eritrofobie","eritrofobiei":"eritrofobie","eritrofobii":"eritrofobie","eritrofobiile":"eritrofobie","eritrofobiilor":"eritrofobie","eritroleucemia":"eritroleucemie","eritroleucemiei":"eritroleucemie","eritroleucemii":"eritroleucemie","eritroleucemiile":"eritroleucemie","eritroleucemiilor":"eritroleucemie","eritroleucoze":"eritroleucoză","eritroleucozei":"eritroleucoză","eritroleucozele":"eritroleucoză","eritroleucozelor":"eritroleucoză","eritromicine":"eritromicină","eritromicinei":"eritromicină","eritromicinele":"eritromicină","eritromicinelor":"eritromicină","eritropatia":"eritropatie","eritropatiei":"eritropatie","eritropatii":"eritropatie","eritropatiile":"eritropatie","eritropatiilor":"eritropatie","eritropenia":"eritropenie","eritropeniei":"eritropenie","eritropenii":"eritropenie","eritropeniile":"eritropenie","eritropeniilor":"eritropenie","eritropoieze":"eritropoieză","eritropoiezei":"eritropoieză","eritropoiezele":"eritropoieză","eritropoiezelor":"eritropoieză","eritropsia":"eritropsie","eritropsiei":"eritropsie","eritropsii":"eritropsie","eritropsiile":"eritropsie","eritropsiilor":"eritropsie","eritropsine":"eritropsină","eritropsinei":"eritropsină","eritropsinele":"eritropsină","eritropsinelor":"eritropsină","eritroze":"eritroză","eritrozei":"eritroză","eritrozele":"eritroză","eritrozelor":"eritroză","eritrozine":"eritrozină","eritrozinei":"eritrozină","eritrozinele":"eritrozină","eritrozinelor":"eritrozină","erizipelatoasa":["erizipelatoasă","erizipelatos","erizipelatoasa","erizipelatos"],"erizipelatoase":"erizipelatos","erizipelatoasele":"erizipelatos","erizipelatosi":"erizipelatos","erizipelatosii":"erizipelatos","erizipelatosul":"erizipelatos","erizipele":["erizipele","erizipel","erizipele","erizipelă"],"erizipelei":"erizipelă","erizipelele":["erizipelele","erizipel","erizipelele","erizipelă"],"erizipelelor":["erizipelelor","erizipel","erizipelelor","erizipelă"],"erizipelul":"erizipel","erizipelule":"erizipel","erizipelului":"erizipel","ermeneutic":"hermeneutic","ermeneutica":["ermeneutică","ermeneutic","ermeneutica","ermeneutic"],"ermeneutice":["ermeneutice","ermeneutic","ermeneutice","ermeneutică"],"ermeneuticei":"ermeneutică","ermeneuticele":"ermeneutic","ermeneutici":"ermeneutic","ermeneuticii":"ermeneutic","ermeneuticul":"ermeneutic","ermetica":["ermetică","ermetic","ermetica","ermetic"],"ermetice":"ermetic","ermeticele":"ermetic","ermetici":"ermetic","ermeticii":"ermetic","ermeticul":"ermetic","ermetisme":"ermetism","ermetismele":"ermetism","ermetismelor":"ermetism","ermetismul":"ermetism","ermetismule":"ermetism","ermetismului":"ermetism","ermetizai":"ermetiza","ermetizam":["ermetizăm","ermetiza","ermetizam","ermetiza"],"ermetizand":"ermetiza","ermetizara":"ermetiza","ermetizaram":"ermetiza","ermetizarati":"ermetiza","ermetizarea":"ermetizare","ermetizari":"ermetizare","ermetizarii":"ermetizare","ermetizarile":"ermetizare","ermetizarilor":"ermetizare","ermetizase":"ermetiza","ermetizasem":"ermetiza","ermetizasera":"ermetiza","ermetizaseram":"ermetiza","ermetizaserati":"ermetiza","ermetizasesi":"ermetiza","ermetizasi":"ermetiza","ermetizat":"ermetiza","ermetizati":"ermetiza","ermetizau":"ermetiza","ermetizeaza":"ermetiza","ermetizez":"ermetiza","ermetizezi":"ermetiza","ermitagii":"ermitagiu","ermitagiile":"ermitagiu","ermitagiilor":"ermitagiu","ermitagiuul":"ermitagiu","ermitagiuule":"ermitagiu","ermitagiuului":"ermitagiu","ermitaje":"ermitaj","ermitajele":"ermitaj","ermitajelor":"ermitaj","ermitajul":"ermitaj","ermitajule":"ermitaj","ermitajului":"ermitaj","ermiti":"ermit","ermitii":"ermit","ermitilor":"ermit","ermitul":"ermit","ermitule":"ermit","ermitului":"ermit","eroarea":"eroare","erodai":"eroda","erodam":["erodăm","eroda","erodam","eroda"],"erodand":"eroda","erodara":"eroda","erodaram":"eroda","erodarati":"eroda","erodarea":"erodare","erodari":"erodare","erodarii":"erodare","erodarile":"erodare","erodarilor":"erodare","erodase":"eroda","erodasem":"eroda","erodasera":"eroda","erodaseram":"eroda","erodaserati":"eroda","erodasesi":"eroda","erodasi":"eroda","erodat":"eroda","erodata":["erodată","erodat","erodata","erodat"],"erodate":"erodat","erodatele":"erodat","erodati":["erodați","eroda","erodați","erodat"],"erodatii":"erodat","erodatul":"erodat","erodau":"eroda","erodeaza":"eroda","erodez":"eroda","erodeze":"eroda","erodezi":"eroda","erodii":"erodiu","erodiii":"erodiu","erodiilor":"erodiu","erodiuul":"erodiu","erodiuule":"erodiu","erodiuului":"erodiu","erogatia":"erogație","erogatiei":"erogație","erogatii":"erogație","erogatiile":"erogație","erogatiilor":"erogație","erogena":["erogenă","erogen","erogena","erogen"],"erogene":"erogen","erogenele":"erogen","erogeni":"erogen","erogenii":"erogen","erogenul":"erogen","eroi":"erou","eroica":["eroică","eroic","eroica","eroic"],"eroice":"eroic","eroiceasca":["eroicească","eroicesc","eroiceasca","eroicesc"],"eroicele":"eroic","eroicescul":"eroicesc","eroicesti":"eroicesc","eroicestii":"eroicesc","eroicestile":"eroicesc","eroici":"eroic","eroicii":"eroic","eroicitatati":"eroicitate","eroicitatatii":"eroicitate","eroicitatatile":"eroicitate","eroicitatatilor":"eroicitate","eroicitatea":"eroicitate","eroicomica":["eroicomică","eroicomic","eroicomica","eroicomic"],"eroicomice":"eroicomic","eroicomicele":"eroicomic","eroicomici":"eroicomic","eroicomicii":"eroicomic","eroicomicul":"eroicomic","eroicul":"eroic","eroific":"eroifica","eroificai":"eroifica","eroificam":["eroificăm","eroifica","eroificam","eroifica"],"eroificand":"eroifica","eroificara":"eroifica","eroificaram":"eroifica","eroificarati":"eroifica","eroificase":"eroifica","eroificasem":"eroifica","eroificasera":"eroifica","eroificaseram":"eroifica","eroificaserati":"eroifica","eroificasesi":"eroifica","eroificasi":"eroifica","eroificat":"eroifica","eroificati":"eroifica","eroificau":"eroifica","eroifici":"eroifica","eroii":"erou","eroilor":"erou","eroine":"eroină","eroinei":"eroină","eroinele":"eroină","eroinelor":"eroină","eroismul":"eroism","eroismule":"eroism","eroismului":"eroism","eroitatati":"eroitate","eroitatatii":"eroitate","eroitatatile":"eroitate","eroitatatilor":"eroitate","eroitatea":"eroitate","eroizai":"eroiza","eroizam":["eroizăm","eroiza","eroizam","eroiza"],"eroizand":"eroiza","eroizara":"eroiza","eroizaram":"eroiza","eroizarati":"eroiza","eroizase":"eroiza","eroizasem":"eroiza","eroizasera":"eroiza","eroizaseram":"eroiza","eroizaserati":"eroiza","eroizasesi":"eroiza","eroizasi":"eroiza","eroizat":"eroiza","eroizata":["eroizată","eroizat","eroizata","eroizat"],"eroizate":"eroizat","eroizatele":"eroizat","eroizati":["eroizați","eroiza","eroizați","eroizat"],"eroizatii":"eroizat","eroizatul":"eroizat","eroizau":"eroiza","eroizeaza":"eroiza","eroizez":"eroiza","eroizezi":"eroiza","erold":"herald","eromana":["eromană","eroman","eromana","eroman"],"eromane":"eroman","eromanele":"eroman","eromani":"eroman","eromanii":"eroman","eromanilor":"eroman","eromanul":"eroman","eromanule":"eroman","eromanului":"eroman","eronata":["eronată","eronat","eronata","eronat"],"eronate":"eronat","eronatele":"eronat","eronati":"eronat","eronatii":"eronat","eronatul":"eronat","eronee":"eroneu","eroneea":"eroneu","eroneele":"eroneu","eronei":"eroneu","eroneii":"eroneu","eroneul":"eroneu","erori":"eroare","erorii":"eroare","erorile":"eroare","erorilor":"eroare","erosul":"eros","erosule":"eros","erosului":"eros","erotematica":["erotematică","erotematic","erotematica","erotematic"],"erotematice":"erotematic","erotematicele":"erotematic","erotematici":"erotematic","erotematicii":"erotematic","erotematicul":"erotematic","erotica":["erotică","erotic","erotica","erotic"],"erotice":"erotic","eroticele":"erotic","erotici":["erotici","erotic","erotici","erotică"],"eroticii":["eroticii","erotic","eroticii","erotică"],"eroticul":"erotic","erotimia":"erotimie","erotimiei":"erotimie","erotimii":"erotimie","erotimiile":"erotimie","erotimiilor":"erotimie","erotismul":"erotism","erotismule":"erotism","erotismului":"erotism","erotizai":"erotiza","erotizam":["erotizăm","erotiza","erotizam","erotiza"],"erotizand":"erotiza","erotizara":"erotiza","erotizaram":"erotiza","erotizarati":"erotiza","erotizarea":"erotizare","erotizari":"erotizare","erotizarii":"erotizare","erotizarile":"erotizare","erotizarilor":"erotizare","erotizase":"erotiza","erotizasem":"erotiza","erotizasera":"erotiza","erotizaseram":"erotiza","erotizaserati":"erotiza","erotizasesi":"erotiza","erotizasi":"erotiza","erotizat":"erotiza","erotizati":"erotiza","erotizau":"erotiza","erotizeaza":"erotiza","erotizez":"erotiza","erotizezi":"erotiza","erotologi":"erotolog","erotologia":"erotologie","erotologiei":"erotologie","erotologii":["erotologii","erotolog","erotologii","erotologie"],"erotologiile":"erotologie","erotologiilor":"erotologie","erotologilor":"erotolog","erotologul":"erotolog","erotologule":"erotolog","erotologului":"erotolog","erotomane":"erotomană","erotomanei":"erotomană","erotomanele":"erotomană","erotomanelor":"erotomană","erotomani":"erotoman","erotomania":"erotomanie","erotomaniaca":["erotomaniacă","erotomaniac","erotomaniaca","erotomaniac"],"erotomaniace":"erotomaniac","erotomaniacele":"erotomaniac","erotomaniaci":"erotomaniac","erotomaniacii":"erotomaniac","erotomaniacul":"erotomaniac","erotomaniei":"erotomanie","erotomanii":["erotomanii","erotoman","erotomanii","erotomanie"],"erotomaniile":"erotomanie","erotomaniilor":"erotomanie","erotomanilor":"erotoman","erotomanul":"erotoman","erotomanule":"erotoman","erotomanului":"erotoman","eroul":"erou","eroule":"erou","eroului":"erou","eroziunea":"eroziune","eroziunei":"eroziune","eroziunele":"eroziune","eroziunelor":"eroziune","eroziuni":"eroziune","eroziva":["erozivă","eroziv","eroziva","eroziv"],"erozive":"eroziv","erozivele":"eroziv","erozivi":"eroziv","erozivii":"eroziv","erozivul":"eroziv","erpetografia":"erpetografie","erpetografica":["erpetografică","erpetografic","erpetografica","erpetografic"],"erpetografice":"erpetografic","erpetograficele":"erpetografic","erpetografici":"erpetografic","erpetograficii":"erpetografic","erpetograficul":"erpetografic","erpetografiei":"erpetografie","erpetografii":"erpetografie","erpetografiile":"erpetografie","erpetografiilor":"erpetografie","erpetologe":"erpetologă","erpetologei":"erpetologă","erpetologele":"erpetologă","erpetologelor":"erpetologă","erpetologi":"erpetolog","erpetologia":"erpetologie","erpetologica":["erpetologică","erpetologic","erpetologica","erpetologic"],"erpetologice":"erpetologic","erpetologicele":"erpetologic","erpetologici":"erpetologic","erpetologicii":"erpetologic","erpetologicul":"erpetologic","erpetologiei":"erpetologie","erpetologii":["erpetologii","erpetolog","erpetologii","erpetologie"],"erpetologilor":"erpetolog","erpetologisti":"erpetologist","erpetologistii":"erpetologist","erpetologistilor":"erpetologist","erpetologistul":"erpetologist","erpetologistule":"erpetologist","erpetologistului":"erpetologist","erpetologul":["erpetologul","erpetolog","erpetologul","erpetologă"],"erpetologule":"erpetolog","erpetologului":"erpetolog","eruciforma":["eruciformă","eruciform","eruciforma","eruciform"],"eruciforme":"eruciform","eruciformele":"eruciform","eruciformi":"eruciform","eruciformii":"eruciform","eruciformul":"eruciform","eructai":"eructa","eructam":["eructăm","eructa","eructam","eructa"],"eructand":"eructa","eructara":"eructa","eructaram":"eructa","eructarati":"eructa","eructase":"eructa","eructasem":"eructa","eructasera":"eructa","eructaseram":"eructa","eructaserati":"eructa","eructasesi":"eructa","eructasi":"eructa","eructat":"eructa","eructati":"eructa","eructatia":"eructație","eructatiei":"eructație","eructatii":"eructație","eructatiile":"eructație","eructatiilor":"eructație","eructatiunea":"eructațiune","eructatiuni":"eructațiune","eructatiunii":"eructațiune","eructatiunile":"eructațiune","eructatiunilor":"eructațiune","eructau":"eructa","eructeaza":"eructa","eructez":"eructa","eructezi":"eructa","erudita":["erudită","erudit","erudita","erudit"],"erudite":"erudit","eruditele":"erudit","eruditi":"erudit","eruditia":"erudiție","eruditiei":"erudiție","eruditii":["erudiții","erudit","erudiții","erudiție"],"eruditiile":"erudiție","eruditiilor":"erudiție","eruditisima":["eruditisimă","eruditisim","eruditisima","eruditisim"],"eruditisime":"eruditisim","eruditisimele":"eruditisim","eruditisimi":"eruditisim","eruditisimii":"eruditisim","eruditisimul":"eruditisim","eruditiunea":"erudițiune","eruditiuni":"erudițiune","eruditiunii":"erudițiune","eruditiunile":"erudițiune","eruditiunilor":"erudițiune","eruditul":"erudit","erumpe":"erupe","erup":"erupe","erupa":"erupe","erupand":"erupe","erupea":"erupe","erupeai":"erupe","erupeam":"erupe","erupeati":"erupe","erupeau":"erupe","erupem":"erupe","eruperea":"erupere","eruperi":"erupere","eruperii":"erupere","eruperile":"erupere","eruperilor":"erupere","erupeti":"erupe","erupi":"erupe","erupse":"erupe","erupsei":"erupe","erupsera":"erupe","erupseram":"erupe","erupserati":"erupe","erupsese":"erupe","erupsesem":"erupe","erupsesera":"erupe","erupseseram":"erupe","erupseserati":"erupe","erupsesesi":"erupe","erupsesi":"erupe","erupt":"erupe","eruptia":"erupție","eruptiei":"erupție","eruptii":"erupție","eruptiile":"erupție","eruptiilor":"erupție","eruptiunea":"erupțiune","eruptiuni":"erupțiune","eruptiunii":"erupțiune","eruptiunile":"erupțiune","eruptiunilor":"erupțiune","eruptiva":["eruptivă","eruptiv","eruptiva","eruptiv"],"eruptive":"eruptiv","eruptivele":"eruptiv","eruptivi":"eruptiv","eruptivii":"eruptiv","eruptivisme":"eruptivism","eruptivismele":"eruptivism","eruptivismelor":"eruptivism","eruptivismul":"eruptivism","eruptivismule":"eruptivism","eruptivismului":"eruptivism","eruptivul":"eruptiv","erzatul":"erzaț","erzatule":"erzaț","erzatului":"erzaț","erzaturi":"erzaț","erzaturile":"erzaț","erzaturilor":"erzaț","esafoade":"eșafod","esafodaje":"eșafodaj","esafodajele":"eșafodaj","esafodajelor":"eșafodaj","esafodajul":"eșafodaj","esafodajule":"eșafodaj","esafodajului":"eșafodaj","esafodul":"eșafod","esafodule":"eșafod","esafodului":"eșafod","esafoduri":"eșafod","esafodurile":"eșafod","esafodurilor":"eșafod","esageratiunea":"esagerațiune","esageratiuni":"esagerațiune","esageratiunii":"esagerațiune","esageratiunile":"esagerațiune","esageratiunilor":"esagerațiune","esaloane":"eșalon","esaloanele":"eșalon","esaloanelor":"eșalon","esalonai":"eșalona","esalonam":["eșalonăm","eșalona","eșalonam","eșalona"],"esalonand":"eșalona","esalonara":"eșalona","esalonaram":"eșalona","esalonarati":"eșalona","esalonarea":"eșalonare","esalonari":"eșalonare","esalonarii":"eșalonare","esalonarile":"eșalonare","esalonarilor":"eșalonare","esalonase":"eșalona","esalonasem":"eșalona","esalonasera":"eșalona","esalonaseram":"eșalona","esalonaserati":"eșalona","esalonasesi":"eșalona","esalonasi":"eșalona","esalonat":"eșalona","esalonata":["eșalonată","eșalonat","eșalonata","eșalonat"],"esalonate":"eșalonat","esalonatele":"eșalonat","esalonati":["eșalonați","eșalona","eșalonați","eșalonat"],"esalonatii":"eșalonat","esalonatul":"eșalonat","esalonau":"eșalona","esaloneaza":"eșalona","esalonez":"eșalona","esalonezi":"eșalona","esalonul":"eșalon","esalonule":"eșalon","esalonului":"eșalon","esaltaciunea":"esăltăciune","esaltaciuni":"esăltăciune","esaltaciunii":"esăltăciune","esaltaciunile":"esăltăciune","esaltaciunilor":"esăltăciune","esaltatiunea":"esaltațiune","esaltatiuni":"esaltațiune","esaltatiunii":"esaltațiune","esaltatiunile":"esaltațiune","esaltatiunilor":"esaltațiune","esamene":"esamen","esamenele":"esamen","esamenelor":"esamen","esamenul":"esamen","esamenule":"esamen","esamenului":"esamen","esaminatoare":"esaminator","esaminatoarea":"esaminator","esaminatoarele":"esaminator","esaminatori":"esaminator","esaminatorii":"esaminator","esaminatorul":"esaminator","esantioane":"eșantion","esantionai":"eșantiona","esantionaje":"eșantionaj","esantionajele":"eșantionaj","esantionajelor":"eșantionaj","esantionajul":"eșantionaj","esantionajule":"eșantionaj","esantionajului":"eșantionaj","esantionam":["eșantionăm","eșantiona","eșantionam","eșantiona"],"esantionand":"eșantiona","esantionara":"eșantiona","esantionaram":"eșantiona","esantionarati":"eșantiona","esantionarea":"eșantionare","esantionari":"eșantionare","esantionarii":"eșantionare","esantionarile":"eșantionare","esantionarilor":"eșantionare","esantionase":"eșantiona","esantionasem":"eșantiona","esantionasera":"eșantiona","esantionaseram":"eșantiona","esantionaserati":"eșantiona","esantionasesi":"eșantiona","esantionasi":"eșantiona","esantionat":"eșantiona","esantionata":["eșantionată","eșantionat","eșantionata","eșantionat"],"esantionate":"eșantionat","esantionatele":"eșantionat","esantionati":["eșantionați","eșantiona","eșantionați","eșantionat"],"esantionatii":"eșantionat","esantionatul":"eșantionat","esantionau":"eșantiona","esantione":"eșantion","esantioneaza":"eșantiona","esantionele":"eșantion","esantionelor":"eșantion","esantionez":"eșantiona","esantionezi":"eșantiona","esantionul":"eșantion","esantionule":"eșantion","esantionului":"eșantion","esapamente":"eșapament","esapamentele":"eșapament","esapamentelor":"eșapament","esapamentul":"eșapament","esapamentule":"eșapament","esapamentului":"eșapament","esarfe":"eșarfă","esarfei":"eșarfă","esarfele":"eșarfă","esarfelor":"eșarfă","esarpa":"eșarfă","esarpe":"eșarpă","esarpei":"eșarpă","esarpele":"eșarpă","esarpelor":"eșarpă","escadre":"escadră","escadrei":"escadră","escadrele":"escadră","escadrelor":"escadră","escadrile":"escadrilă","escadrilei":"escadrilă","escadrilele":"escadrilă","escadrilelor":"escadrilă","escadroane":"escadron","escadroanele":"escadron","escadroanelor":"escadron","escadronul":"escadron","escadronule":"escadron","escadronului":"escadron","escaladai":"escalada","escaladam":["escaladăm","escalada","escaladam","escalada"],"escaladand":"escalada","escaladara":"escalada","escaladaram":"escalada","escaladarati":"escalada","escaladarea":"escaladare","escaladari":"escaladare","escaladarii":"escaladare","escaladarile":"escaladare","escaladarilor":"escaladare","escaladase":"escalada","escaladasem":"escalada","escaladasera":"escalada","escaladaseram":"escalada","escaladaserati":"escalada","escaladasesi":"escalada","escaladasi":"escalada","escaladat":"escalada","escaladati":"escalada","escaladau":"escalada","escalade":"escaladă","escaladeaza":"escalada","escaladei":"escaladă","escaladele":"escaladă","escaladelor":"escaladă","escaladez":"escalada","escaladezi":"escalada","escalatoare":"escalator","escalatoarele":"escalator","escalatoarelor":"escalator","escalatorul":"escalator","escalatorule":"escalator","escalatorului":"escalator","escale":"escală","escalei":"escală","escalele":"escală","escalelor":"escală","escalopul":"escalop","escalopule":"escalop","escalopului":"escalop","escalopuri":"escalop","escalopurile":"escalop","escalopurilor":"escalop","escamotabila":["escamotabilă","escamotabil","escamotabila","escamotabil"],"escamotabile":"escamotabil","escamotabilele":"escamotabil","escamotabili":"escamotabil","escamotabilii":"escamotabil","escamotabilul":"escamotabil","escamotai":"escamota","escamotam":["escamotăm","escamota","escamotam","escamota"],"escamotand":"escamota","escamotara":"escamota","escamotaram":"escamota","escamotarati":"escamota","escamotarea":"escamotare","escamotari":"escamotare","escamotarii":"escamotare","escamotarile":"escamotare","escamotarilor":"escamotare","escamotase":"escamota","escamotasem":"escamota","escamotasera":"escamota","escamotaseram":"escamota","escamotaserati":"escamota","escamotasesi":"escamota","escamotasi":"escamota","escamotat":"escamota","escamotati":"escamota","escamotau":"escamota","escamoteaza":"escamota","escamotez":"escamota","escamotezi":"escamota","escapade":"escapadă","escapadei":"escapadă","escapadele":"escapadă","escapadelor":"escapadă","escapisme":"escapism","escapismele":"escapism","escapismelor":"escapism","escapismul":"escapism","escapismule":"escapism","escapismului":"escapism","escapista":["escapistă","escapist","escapista","escapist"],"escapiste":"escapist","escapistele":"escapist","escapisti":"escapist","escapistii":"escapist","escapistul":"escapist","escare":"escară","escarei":"escară","escarele":"escară","escarelor":"escară","escarmusaul":"escarmușă","escarmusaule":"escarmușă","escarmusaului":"escarmușă","escarmuse":"escarmușă","escarmusele":"escarmușă","escarmuselor":"escarmușă","escarotica":["escarotică","escarotic","escarotica","escarotic"],"escarotice":"escarotic","escaroticele":"escarotic","escarotici":"escarotic","escaroticii":"escarotic","escaroticul":"escarotic","escarpe":"escarpă","escarpei":"escarpă","escarpele":"escarpă","escarpelor":"escarpă","escarpeni":"escarpen","escarpenii":"escarpen","escarpenilor":"escarpen","escarpenul":"escarpen","escarpenule":"escarpen","escarpenului":"escarpen","escatologia":"escatologie","escatologica":["escatologică","escatologic","escatologica","escatologic"],"escatologice":"escatologic","escatologicele":"escatologic","escatologici":"escatologic","escatologicii":"escatologic","escatologicul":"escatologic","escatologiei":"escatologie","escatologii":"escatologie","escavatoare":"escavator","escavatoarele":"escavator","escavatoarelor":"escavator","escavatorul":"escavator","escavatorule":"escavator","escavatorului":"escavator","escelente":"escelență","escelentei":"escelență","escelentele":"escelență","escelentelor":"escelență","escelinte":"escelință","escelintei":"escelință","escelintele":"escelință","escelintelor":"escelință","escepsiunea":"escepsiune","escepsiuni":"escepsiune","escepsiunii":"escepsiune","escepsiunile":"escepsiune","escepsiunilor":"escepsiune","esceptia":"escepție","esceptiei":"escepție","esceptii":"escepție","esceptiile":"escepție","esceptiilor":"escepție","esceptiunea":"escepțiune","esceptiuni":"escepțiune","esceptiunii":"escepțiune","esceptiunile":"escepțiune","esceptiunilor":"escepțiune","escesul":"esces","escesule":"esces","escesului":"esces","escesuri":"esces","escesurile":"esces","escesurilor":"esces","eschile":"eschilă","eschilei":"eschilă","eschilele":"eschilă","eschilelor":"eschilă","eschimoase":"eschimoasă","eschimoasei":"eschimoasă","eschimoasele":"eschimoasă","eschimoaselor":"eschimoasă","eschimose":"eschimosă","eschimosei":"eschimosă","eschimosele":"eschimosă","eschimoselor":"eschimosă","eschimosi":"eschimos","eschimosii":"eschimos","eschimosilor":"eschimos","eschimosul":"eschimos","eschimosule":"eschimos","eschimosului":"eschimos","eschise":"eschisă","eschisei":"eschisă","eschisele":"eschisă","eschiselor":"eschisă","eschivai":"eschiva","eschivam":["eschivăm","eschiva","eschivam","eschiva"],"eschivand":"eschiva","eschivara":"eschiva","eschivaram":"eschiva","eschivarati":"eschiva","eschivarea":"eschivare","eschivari":"eschivare","eschivarii":"eschivare","eschivarile":"eschivare","eschivarilor":"eschivare","eschivase":"eschiva","eschivasem":"eschiva","eschivasera":"eschiva","eschivaseram":"eschiva","eschivaserati":"eschiva","eschivasesi":"eschiva","eschivasi":"eschiva","eschivat":"eschiva","eschivata":["eschivată","eschivat","eschivata","eschivat"],"eschivate":"eschivat","eschivatele":"eschivat","eschivati":["eschivați","eschiva","eschivați","eschivat"],"eschivatii":"eschivat","eschivatul":"eschivat","eschivau":"eschiva","eschive":"eschivă","eschiveaza":"eschiva","eschivei":"eschivă","eschivele":"eschivă","eschivelor":"eschivă","eschivez":"eschiva","eschivezi":"eschiva","escitata":["escitată","escitat","escitata","escitat"],"escitate":"escitat","escitatele":"escitat","escitati":"escitat","escitatii":"escitat","escitatul":"escitat","esclamatiunea":"esclamațiune","esclamatiuni":"esclamațiune","esclamatiunii":"esclamațiune","escluderea":"escludere","escluderi":"escludere","escluderii":"escludere","escluderile":"escludere","escluderilor":"escludere","esclusivista":["esclusivistă","esclusivist","esclusivista","esclusivist"],"esclusiviste":"esclusivist","esclusivistele":"esclusivist","esclusivisti":"esclusivist","esclusivistii":"esclusivist","esclusivistul":"esclusivist","escontori":"escontor","escontorii":"escontor","escontorilor":"escontor","escontorul":"escontor","escontorule":"escontor","escontorului":"escontor","escopete":"escopetă","escopetei":"escopetă","escopetele":"escopetă","escopetelor":"escopetă","escortai":"escorta","escortam":["escortăm","escorta","escortam","escorta"],"escortand":"escorta","escortara":"escorta","escortaram":"escorta","escortarati":"escorta","escortarea":"escortare","escortari":"escortare","escortarii":"escortare","escortarile":"escortare","escortarilor":"escortare","escortase":"escorta","escortasem":"escorta","escortasera":"escorta","escortaseram":"escorta","escortaserati":"escorta","escortasesi":"escorta","escortasi":"escorta","escortat":"escorta","escortata":["escortată","escortat","escortata","escortat"],"escortate":"escortat","escortatele":"escortat","escortati":["escortați","escorta","escortați","escortat"],"escortatii":"escortat","escortatul":"escortat","escortau":"escorta","escorte":"escortă","escorteaza":"escorta","escortei":"escortă","escortele":"escortă","escortelor":"escortă","escortez":"escorta","escortezi":"escorta","escortoare":"escortor","escortoarele":"escortor","escortoarelor":"escortor","escortorul":"escortor","escortorule":"escortor","escortorului":"escortor","escroace":"escroacă","escroacei":"escroacă","escroacele":"escroacă","escroacelor":"escroacă","escrocai":"escroca","escrocam":["escrocăm","escroca","escrocam","escroca"],"escrocand":"escroca","escrocara":"escroca","escrocaram":"escroca","escrocarati":"escroca","escrocarea":"escrocare","escrocari":"escrocare","escrocarii":"escrocare","escrocarile":"escrocare","escrocarilor":"escrocare","escrocase":"escroca","escrocasem":"escroca","escrocasera":"escroca","escrocaseram":"escroca","escrocaserati":"escroca","escrocasesi":"escroca","escrocasi":"escroca","escrocat":"escroca","escrocata":["escrocată","escrocat","escrocata","escrocat"],"escrocate":"escrocat","escrocatele":"escrocat","escrocati":["escrocați","escroca","escrocați","escrocat"],"escrocatii":"escrocat","escrocatul":"escrocat","escrocau":"escroca","escroce":"escrocă","escrocei":"escrocă","escrocele":"escrocă","escrocelor":"escrocă","escrocheaza":"escroca","escrocheria":"escrocherie","escrocheriei":"escrocherie","escrocherii":"escrocherie","escrocheriile":"escrocherie","escrocheriilor":"escrocherie","escrochez":"escroca","escrochezi":"escroca","escroci":"escroc","escrocii":"escroc","escrocilor":"escroc","escrocul":"escroc","escrocule":"escroc","escrocului":"escroc","escuade":"escuadă","escuadei":"escuadă","escuadele":"escuadă","escuadelor":"escuadă","escudoi":"escudo","escudolor":"escudo","escudoul":"escudo","escudoule":"escudo","escudoului":"escudo","esculapi":"esculap","esculapii":"esculap","esculapilor":"esculap","esculapul":"esculap","esculapule":"esculap","esculapului":"esculap","esculine":"esculină","esculinei":"esculină","esculinele":"esculină","esculinelor":"esculină","escursiunea":"escursiune","escursiuni":"escursiune","escursiunii":"escursiune","esecul":"eșec","esecule":"eșec","esecului":"eșec","esecuri":"eșec","esecurile":"eșec","esecurilor":"eșec","eseiaje":"eseiaj","eseiajele":"eseiaj","eseiajelor":"eseiaj","eseiajul":"eseiaj","eseiajule":"eseiaj","eseiajului":"eseiaj","eseiori":"eseior","eseiorii":"eseior","eseiorilor":"eseior","eseiorul":"eseior","eseiorule":"eseior","eseiorului":"eseior","eseiste":"eseistă","eseistei":"eseistă","eseistele":"eseistă","eseistelor":"eseistă","eseisti":"eseist","eseistica":["eseistică","eseistic","eseistica","eseistic"],"eseistice":"eseistic","eseisticele":"eseistic","eseistici":["eseistici","eseistic","eseistici","eseistică"],"eseisticii":["eseisticii","eseistic","eseisticii","eseistică"],"eseisticile":"eseistică","eseisticilor":"eseistică","eseisticul":"eseistic","eseistii":"eseist","eseistilor":"eseist","eseistul":"eseist","eseistule":"eseist","eseistului":"eseist","esele":"eșelă","eselei":"eșelă","esente":"esență","esentei":"esență","esentele":"esență","esentelor":"esență","esentiala":["esențială","esențial","esențiala","esențial"],"esentiale":"esențial","esentialele":"esențial","esentiali":"esențial","esentialii":"esențial","esentialismul":"esențialism","esentialismule":"esențialism","esentialismului":"esențialism","esentialitatea":"esențialitate","esentialitati":"esențialitate","esentialitatii":"esențialitate","esentialitatile":"esențialitate","esentialitatilor":"esențialitate","esentializai":"esențializa","esentializam":["esențializăm","esențializa","esențializam","esențializa"],"esentializand":"esențializa","esentializara":"esențializa","esentializaram":"esențializa","esentializarati":"esențializa","esentializarea":"esențializare","esentializari":"esențializare","esentializarii":"esențializare","esentializarile":"esențializare","esentializarilor":"esențializare","esentializase":"esențializa","esentializasem":"esențializa","esentializasera":"esențializa","esentializaseram":"esențializa","esentializaserati":"esențializa","esentializasesi":"esențializa","esentializasi":"esențializa","esentializat":"esențializa","esentializata":["esențializată","esențializat","esențializata","esențializat"],"esentializate":"esențializat","esentializatele":"esențializat","esentializati":["esențializați","esențializa","esențializați","esențializat"],"esentializatii":"esențializat","esentializatul":"esențializat","esentializau":"esențializa","esentializeaza":"esențializa","esentializez":"esențializa","esentializezi":"esențializa","esentialul":"esențial","eseri":"eșerneu","eserile":"eșerneu","eserilor":"eșerneu","eserneuul":"eșerneu","eserneuule":"eșerneu","eserneuului":"eșerneu","eseul":"eseu","eseule":"eseu","eseului":"eseu","eseuri":"eseu","eseurile":"eseu","eseurilor":"eseu","esibitoriu":"exhibitoriu","esichiere":"eșichier","esichierele":"eșichier","esichierelor":"eșichier","esichierul":"eșichier","esichierule":"eșichier","esichierului":"eșichier","esofage":"esofag","esofagectomia":"esofagectomie","esofagectomiei":"esofagectomie","esofagectomii":"esofagectomie","esofagectomiile":"esofagectomie","esofagectomiilor":"esofagectomie","esofagele":"esofag","esofagelor":"esofag","esofagiana":["esofagiană","esofagian","esofagiana","esofagian"],"esofagianul":"esofagian","esofagiene":"esofagian","esofagienele":"esofagian","esofagieni":"esofagian","esofagienii":"esofagian","esofagisme":"esofagism","esofagismele":"esofagism","esofagismelor":"esofagism","esofagismul":"esofagism","esofagismule":"esofagism","esofagismului":"esofagism","esofagite":"esofagită","esofagitei":"esofagită","esofagoplastia":"esofagoplastie","esofagoplastiei":"esofagoplastie","esofagoplastii":"esofagoplastie","esofagoplastiile":"esofagoplastie","esofagoplastiilor":"esofagoplastie","esofagoscoape":"esofagoscop","esofagoscoapele":"esofagoscop","esofagoscoapelor":"esofagoscop","esofagoscopia":"esofagoscopie","esofagoscopiei":"esofagoscopie","esofagoscopii":"esofagoscopie","esofagoscopiile":"esofagoscopie","esofagoscopiilor":"esofagoscopie","esofagoscopul":"esofagoscop","esofagoscopule":"esofagoscop","esofagoscopului":"esofagoscop","esofagostomia":"esofagostomie","esofagostomiei":"esofagostomie","esofagostomii":"esofagostomie","esofagostomiile":"esofagostomie","esofagostomiilor":"esofagostomie","esofagotomia":"esofagotomie","esofagotomiei":"esofagotomie"};
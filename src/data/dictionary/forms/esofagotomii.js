@@ -0,0 +1 @@
+export default {"esofagotomii":"esofagotomie","esofagotomiile":"esofagotomie","esofagotomiilor":"esofagotomie","esofagotomul":"esofagotom","esofagotomule":"esofagotom","esofagotomului":"esofagotom","esofagotomuri":"esofagotom","esofagotomurile":"esofagotom","esofagotomurilor":"esofagotom","esofagul":"esofag","esofagule":"esofag","esofagului":"esofag","esopica":["esopică","esopic","esopica","esopic"],"esopice":"esopic","esopiceasca":["esopicească","esopicesc","esopiceasca","esopicesc"],"esopicele":"esopic","esopicescul":"esopicesc","esopicesti":"esopicesc","esopicestii":"esopicesc","esopicestile":"esopicesc","esopici":"esopic","esopicii":"esopic","esopicul":"esopic","espade":"espadă","espadei":"espadă","espadele":"espadă","espadelor":"espadă","espadoane":"espadon","espadoanele":"espadon","espadoanelor":"espadon","espadonul":"espadon","espadonule":"espadon","espadonului":"espadon","espadrile":"espadrilă","espadrilei":"espadrilă","espadrilele":"espadrilă","espadrilelor":"espadrilă","espargute":"espargută","espargutei":"espargută","espargutele":"espargută","espargutelor":"espargută","espeditia":"espediție","espeditiei":"espediție","espeditii":"espediție","espeditiile":"espediție","espeditiilor":"espediție","espeditiunea":"espedițiune","espeditiuni":"espedițiune","espeditiunii":"espedițiune","esperantisme":"esperantism","esperantismele":"esperantism","esperantismelor":"esperantism","esperantismul":"esperantism","esperantismule":"esperantism","esperantismului":"esperantism","esperantiste":"esperantistă","esperantistei":"esperantistă","esperantistele":"esperantistă","esperantistelor":"esperantistă","esperantisti":"esperantist","esperantistii":"esperantist","esperantistilor":"esperantist","esperantistul":"esperantist","esperantistule":"esperantist","esperantistului":"esperantist","esperiente":"esperiență","esperientei":"esperiență","esperientele":"esperiență","esperientelor":"esperiență","esperiinte":"esperiință","esperiintei":"esperiință","esperiintele":"esperiință","esperiintelor":"esperiință","esperimente":"esperiment","esperimentele":"esperiment","esperimentelor":"esperiment","esperimentul":"esperiment","esperimentule":"esperiment","esperimentului":"esperiment","esperta":["espertă","espert","esperta","espert"],"esperte":"espert","espertele":"espert","esperti":"espert","espertii":"espert","espertul":"espert","espiarea":"espiare","espieri":"espiare","espierii":"espiare","espierile":"espiare","espierilor":"espiare","espingole":"espingolă","espingolei":"espingolă","espingolele":"espingolă","espingolelor":"espingolă","esplanade":"esplanadă","esplanadei":"esplanadă","esplanadele":"esplanadă","esplanadelor":"esplanadă","esplic":"esplica","esplicai":"esplica","esplicam":["esplicăm","esplica","esplicam","esplica"],"esplicand":"esplica","esplicara":"esplica","esplicaram":"esplica","esplicarati":"esplica","esplicarea":"esplicare","esplicari":"esplicare","esplicarii":"esplicare","esplicarile":"esplicare","esplicarilor":"esplicare","esplicase":"esplica","esplicasem":"esplica","esplicasera":"esplica","esplicaseram":"esplica","esplicaserati":"esplica","esplicasesi":"esplica","esplicasi":"esplica","esplicat":"esplica","esplicati":"esplica","esplicatia":"esplicație","esplicatiei":"esplicație","esplicatii":"esplicație","esplicatiile":"esplicație","esplicatiilor":"esplicație","esplicatiunea":"esplicațiune","esplicatiuni":"esplicațiune","esplicatiunii":"esplicațiune","esplicatiunile":"esplicațiune","esplicatiunilor":"esplicațiune","esplicativa":["esplicativă","esplicativ","esplicativa","esplicativ"],"esplicative":"esplicativ","esplicativele":"esplicativ","esplicativi":"esplicativ","esplicativii":"esplicativ","esplicativul":"esplicativ","esplicau":"esplica","esplice":"esplica","esplici":"esplica","esplosiunea":"esplosiune","esplosiuni":"esplosiune","esplosiunii":"esplosiune","esplosive":"esplosiv","esplosivele":"esplosiv","esplosivelor":"esplosiv","esplosivul":"esplosiv","esplosivule":"esplosiv","esplosivului":"esplosiv","esploziunea":"esploziune","esploziuni":"esploziune","esploziunii":"esploziune","esploziunile":"esploziune","esploziunilor":"esploziune","esportatiunea":"esportațiune","esportatiuni":"esportațiune","esportatiunii":"esportațiune","espozitiunea":"espozițiune","espozitiuni":"espozițiune","espozitiunii":"espozițiune","espressole":"espresso","espressolor":"espresso","espressoul":"espresso","espressoule":"espresso","espressoului":"espresso","espropriata":["espropriată","espropriat","espropriata","espropriat"],"espropriate":"espropriat","espropriatele":"espropriat","espropriati":"espropriat","espropriatii":"espropriat","espropriatul":"espropriat","espunerea":"espunere","espuneri":"espunere","espunerii":"espunere","espunerile":"espunere","espunerilor":"espunere","est-europeana":["est-europeană","est-european","est-europeana","est-european"],"est-europeane":"est-europeană","est-europeanei":"est-europeană","est-europeanele":"est-europeană","est-europeanelor":"est-europeană","est-europeanul":"est-european","est-europene":"est-european","est-europenele":"est-european","est-europeni":"est-european","est-europenii":"est-european","est-europenilor":"est-european","est-germana":["est-germană","est-german","est-germana","est-german"],"est-germane":"est-german","est-germanele":"est-german","est-germani":"est-german","est-germanii":"est-german","est-germanilor":"est-german","est-germanul":"est-german","est-germanule":"est-german","est-germanului":"est-german","estacade":"estacadă","estacadei":"estacadă","estacadele":"estacadă","estacadelor":"estacadă","estafilade":"estafiladă","estafiladei":"estafiladă","estafiladele":"estafiladă","estafiladelor":"estafiladă","estaze":"estaz","estazele":"estaz","estazelor":"estaz","estazul":"estaz","estazule":"estaz","estazului":"estaz","este":"fi","este chit":"fi chit","este sanatos":"fi sănătos","esteraze":"esterază","esterazei":"esterază","esterazele":"esterază","esterazelor":"esterază","estergaiul":"estergai","estergaiule":"estergai","estergaiului":"estergai","estergaiuri":"estergai","estergaiurile":"estergai","estergaiurilor":"estergai","estergi":"estergă","estergii":"estergă","estergile":"estergă","estergilor":"estergă","esteri":"ester","esterific":"esterifica","esterificai":"esterifica","esterificam":["esterificăm","esterifica","esterificam","esterifica"],"esterificand":"esterifica","esterificara":"esterifica","esterificaram":"esterifica","esterificarati":"esterifica","esterificarea":"esterificare","esterificari":"esterificare","esterificarii":"esterificare","esterificarile":"esterificare","esterificarilor":"esterificare","esterificase":"esterifica","esterificasem":"esterifica","esterificasera":"esterifica","esterificaseram":"esterifica","esterificaserati":"esterifica","esterificasesi":"esterifica","esterificasi":"esterifica","esterificat":"esterifica","esterificati":"esterifica","esterificau":"esterifica","esterifice":"esterifica","esterifici":"esterifica","esterii":"ester","esterilor":"ester","esterna":["esternă","estern","esterna","estern"],"esterne":"estern","esternele":"estern","esterni":"estern","esternii":"estern","esternul":"estern","esterul":"ester","esterule":"ester","esterului":"ester","estete":"estetă","estetei":"estetă","estetele":"estetă","estetelor":"estetă","esteti":"estet","estetica":["estetică","estetic","estetica","estetic"],"estetice":["estetice","estetic","estetice","estetică"],"esteticeasca":["esteticească","esteticesc","esteticeasca","esteticesc"],"esteticei":"estetică","esteticele":["esteticele","estetic","esteticele","estetică"],"esteticelor":"estetică","esteticescul":"esteticesc","esteticesti":"esteticesc","esteticestii":"esteticesc","esteticestile":"esteticesc","estetici":"estetic","esteticianul":"estetician","esteticianule":"estetician","esteticianului":"estetician","esteticiene":"esteticiană","esteticienei":"esteticiană","esteticienele":"esteticiană","esteticienelor":"esteticiană","esteticieni":"estetician","esteticienii":"estetician","esteticienilor":"estetician","esteticii":"estetic","esteticul":"estetic","estetii":"estet","estetilor":"estet","estetisme":"estetism","estetismele":"estetism","estetismelor":"estetism","estetismul":"estetism","estetismule":"estetism","estetismului":"estetism","estetista":["estetistă","estetist","estetista","estetist"],"estetiste":"estetist","estetistele":"estetist","estetisti":"estetist","estetistii":"estetist","estetistul":"estetist","estetizai":"estetiza","estetizam":["estetizăm","estetiza","estetizam","estetiza"],"estetizand":"estetiza","estetizanta":["estetizantă","estetizant","estetizanta","estetizant"],"estetizante":["estetizante","estetizant","estetizante","estetizantă"],"estetizantei":"estetizantă","estetizantele":["estetizantele","estetizant","estetizantele","estetizantă"],"estetizantelor":"estetizantă","estetizanti":"estetizant","estetizantii":"estetizant","estetizantul":"estetizant","estetizara":"estetiza","estetizaram":"estetiza","estetizarati":"estetiza","estetizarea":"estetizare","estetizari":"estetizare","estetizarii":"estetizare","estetizarile":"estetizare","estetizarilor":"estetizare","estetizase":"estetiza","estetizasem":"estetiza","estetizasera":"estetiza","estetizaseram":"estetiza","estetizaserati":"estetiza","estetizasesi":"estetiza","estetizasi":"estetiza","estetizat":"estetiza","estetizati":"estetiza","estetizau":"estetiza","estetizeaza":"estetiza","estetizez":"estetiza","estetizezi":"estetiza","estetul":"estet","estetule":"estet","estetului":"estet","estezia":"estezie","esteziei":"estezie","estezii":"estezie","esteziile":"estezie","esteziilor":"estezie","esteziologia":"esteziologie","esteziologiei":"esteziologie","esteziologii":"esteziologie","esteziologiile":"esteziologie","esteziologiilor":"esteziologie","esteziometre":"esteziometru","esteziometrele":"esteziometru","esteziometrelor":"esteziometru","esteziometria":"esteziometrie","esteziometriei":"esteziometrie","esteziometrii":"esteziometrie","esteziometriile":"esteziometrie","esteziometriilor":"esteziometrie","esteziometrul":"esteziometru","esteziometrule":"esteziometru","esteziometrului":"esteziometru","esti":"fi","estica":["estică","estic","estica","estic"],"estice":"estic","esticele":"estic","estici":"estic","esticii":"estic","esticul":"estic","estimabila":["estimabilă","estimabil","estimabila","estimabil"],"estimabile":"estimabil","estimabilele":"estimabil","estimabili":"estimabil","estimabilii":"estimabil","estimabilul":"estimabil","estimai":"estima","estimam":["estimăm","estima","estimam","estima"],"estimand":"estima","estimara":"estima","estimaram":"estima","estimarati":"estima","estimarea":"estimare","estimari":"estimare","estimarii":"estimare","estimarile":"estimare","estimarilor":"estimare","estimase":"estima","estimasem":"estima","estimasera":"estima","estimaseram":"estima","estimaserati":"estima","estimasesi":"estima","estimasi":"estima","estimat":"estima","estimate":"estimat","estimatele":"estimat","estimatelor":"estimat","estimati":"estima","estimatia":"estimație","estimatiei":"estimație","estimatii":"estimație","estimatiile":"estimație","estimatiilor":"estimație","estimatiunea":"estimațiune","estimatiuni":"estimațiune","estimatiunii":"estimațiune","estimatiunile":"estimațiune","estimatiunilor":"estimațiune","estimativa":["estimativă","estimativ","estimativa","estimativ"],"estimative":"estimativ","estimativele":"estimativ","estimativi":"estimativ","estimativii":"estimativ","estimativul":"estimativ","estimatori":"estimator","estimatoria":"estimatoriu","estimatorie":"estimatoriu","estimatorii":["estimatorii","estimator","estimatorii","estimatoriu"],"estimatoriii":"estimatoriu","estimatoriile":"estimatoriu","estimatorilor":"estimator","estimatoriul":"estimatoriu","estimatorul":"estimator","estimatorule":"estimator","estimatorului":"estimator","estimatul":"estimat","estimatule":"estimat","estimatului":"estimat","estimau":"estima","estimeaza":"estima","estimez":"estima","estimezi":"estima","estirpatiunea":"estirpațiune","estirpatiuni":"estirpațiune","estirpatiunii":"estirpațiune","estiva":["estivă","estiv","estiva","estiv"],"estivala":["estivală","estival","estivala","estival"],"estivale":"estival","estivalele":"estival","estivali":"estival","estivalii":"estival","estivalul":"estival","estivatia":"estivație","estivatiei":"estivație","estivatii":"estivație","estivatiile":"estivație","estivatiilor":"estivație","estive":"estiv","estivele":"estiv","estivi":"estiv","estivii":"estiv","estivul":"estiv","estocul":"estoc","estocule":"estoc","estocului":"estoc","estompai":"estompa","estompam":["estompăm","estompa","estompam","estompa"],"estompand":"estompa","estompara":"estompa","estomparam":"estompa","estomparati":"estompa","estomparea":"estompare","estompari":"estompare","estomparii":"estompare","estomparile":"estompare","estomparilor":"estompare","estompase":"estompa","estompasem":"estompa","estompasera":"estompa","estompaseram":"estompa","estompaserati":"estompa","estompasesi":"estompa","estompasi":"estompa","estompat":"estompa","estompata":["estompată","estompat","estompata","estompat"],"estompate":"estompat","estompatele":"estompat","estompati":["estompați","estompa","estompați","estompat"],"estompatii":"estompat","estompatul":"estompat","estompau":"estompa","estompeaza":"estompa","estompez":"estompa","estompezi":"estompa","estona":["estonă","eston","estona","eston"],"estone":["estone","eston","estone","estonă"],"estonei":"estonă","estonele":["estonele","eston","estonele","estonă"],"estonelor":"estonă","estoni":"eston","estoniana":["estoniană","estonian","estoniana","estonian"],"estonianul":"estonian","estonianule":"estonian","estonianului":"estonian","estonie":"Estonia","estoniei":"Estonia","estoniene":["estoniene","estonian","estoniene","estoniană"],"estonienei":"estoniană","estonienele":["estonienele","estonian","estonienele","estoniană"],"estonienelor":"estoniană","estonieni":"estonian","estonienii":"estonian","estonienilor":"estonian","estonii":["estonii","eston","estonii","Estonia"],"estonul":"eston","estorcai":"estorca","estorcam":["estorcăm","estorca","estorcam","estorca"],"estorcand":"estorca","estorcara":"estorca","estorcaram":"estorca","estorcarati":"estorca","estorcarea":"estorcare","estorcari":"estorcare","estorcarii":"estorcare","estorcarile":"estorcare","estorcarilor":"estorcare","estorcase":"estorca","estorcasem":"estorca","estorcasera":"estorca","estorcaseram":"estorca","estorcaserati":"estorca","estorcasesi":"estorca","estorcasi":"estorca","estorcat":"estorca","estorcati":"estorca","estorcau":"estorca","estorcheaza":"estorca","estorchez":"estorca","estorchezi":"estorca","estractiunea":"estracțiune","estractiuni":"estracțiune","estractiunii":"estracțiune","estrade":"estradă","estradei":"estradă","estradele":"estradă","estradelor":"estradă","estradioli":"estradiol","estradiolii":"estradiol","estradiolilor":"estradiol","estradiolul":"estradiol","estradiolule":"estradiol","estradiolului":"estradiol","estrala":["estrală","estral","estrala","estral"],"estrale":"estral","estralele":"estral","estrali":"estral","estralii":"estral","estralul":"estral","estre":"estru","estrele":"estru","estrelor":"estru","estrioli":"estriol","estriolii":"estriol","estriolilor":"estriol","estriolul":"estriol","estriolule":"estriol","estriolului":"estriol","estrogene":"estrogen","estrogenele":"estrogen","estrogenelor":"estrogen","estrogenul":"estrogen","estrogenule":"estrogen","estrogenului":"estrogen","estrone":"estronă","estronei":"estronă","estronele":"estronă","estronelor":"estronă","estropiai":"estropia","estropiam":"estropia","estropiara":"estropia","estropiaram":"estropia","estropiarati":"estropia","estropiase":"estropia","estropiasem":"estropia","estropiasera":"estropia","estropiaseram":"estropia","estropiaserati":"estropia","estropiasesi":"estropia","estropiasi":"estropia","estropiat":"estropia","estropiata":["estropiată","estropiat","estropiata","estropiat"],"estropiate":"estropiat","estropiatele":"estropiat","estropiati":["estropiați","estropia","estropiați","estropiat"],"estropiatia":"estropiație","estropiatiei":"estropiație","estropiatii":["estropiații","estropiat","estropiații","estropiație"],"estropiatiile":"estropiație","estropiatiilor":"estropiație","estropiatul":"estropiat","estropiau":"estropia","estropiaza":"estropia","estropie":"estropia","estropieaza":"estropia","estropiem":"estropia","estropierea":"estropiere","estropieri":"estropiere","estropierii":"estropiere","estropierile":"estropiere","estropierilor":"estropiere","estropiez":"estropia","estropiezi":"estropia","estropiind":"estropia","estrul":"estru","estrule":"estru","estrului":"estru","estuare":"estuar","estuarele":"estuar","estuarelor":"estuar","estuarul":"estuar","estuarule":"estuar","estuarului":"estuar","estul":"est","estule":"est","estului":"est","esuai":"eșua","esuam":["eșuăm","eșua","eșuam","eșua"],"esuand":"eșua","esuara":"eșua","esuaram":"eșua","esuarati":"eșua","esuarea":"eșuare","esuari":"eșuare","esuarii":"eșuare","esuarile":"eșuare","esuarilor":"eșuare","esuase":"eșua","esuasem":"eșua","esuasera":"eșua","esuaseram":"eșua","esuaserati":"eșua","esuasesi":"eșua","esuasi":"eșua","esuat":"eșua","esuata":["eșuată","eșuat","eșuata","eșuat"],"esuate":"eșuat","esuatele":"eșuat","esuati":["eșuați","eșua","eșuați","eșuat"],"esuatii":"eșuat","esuatul":"eșuat","esuau":"eșua","esueaza":"eșua","esuez":"eșua","esuezi":"eșua","esundata":["esundată","esundat","esundata","esundat"],"esundate":"esundat","esundatele":"esundat","esundati":"esundat","esundatii":"esundat","esundatiunea":"esundațiune","esundatiuni":"esundațiune","esundatiunii":"esundațiune","esundatiunile":"esundațiune","esundatiunilor":"esundațiune","esundatul":"esundat","et cetera":"etcetera","etagiuul":"etagiu","etagiuule":"etagiu","etagiuului":"etagiu","etajai":"etaja","etajam":["etajăm","etaja","etajam","etaja"],"etajand":"etaja","etajara":"etaja","etajaram":"etaja","etajarati":"etaja","etajarea":"etajare","etajari":"etajare","etajarii":"etajare","etajarile":"etajare","etajarilor":"etajare","etajase":"etaja","etajasem":"etaja","etajasera":"etaja","etajaseram":"etaja","etajaserati":"etaja","etajasesi":"etaja","etajasi":"etaja","etajat":"etaja","etajata":["etajată","etajat","etajata","etajat"],"etajate":"etajat","etajatele":"etajat","etajati":["etajați","etaja","etajați","etajat"],"etajatii":"etajat","etajatul":"etajat","etajau":"etaja","etaje":"etaj","etaje intai":"etaj întâi","etajeaza":"etaja","etajele":"etaj","etajelor":"etaj","etajere":"etajeră","etajerei":"etajeră","etajerele":"etajeră","etajerelor":"etajeră","etajez":"etaja","etajezi":"etaja","etajul":"etaj","etajule":"etaj","etajului":"etaj","etalai":"etala","etalaje":"etalaj","etalajele":"etalaj","etalajelor":"etalaj","etalajul":"etalaj","etalajule":"etalaj","etalajului":"etalaj","etalam":["etalăm","etala","etalam","etala"],"etaland":"etala","etalara":"etala","etalaram":"etala","etalarati":"etala","etalarea":"etalare","etalari":"etalare","etalarii":"etalare","etalarile":"etalare","etalarilor":"etalare","etalase":"etala","etalasem":"etala","etalasera":"etala","etalaseram":"etala","etalaserati":"etala","etalasesi":"etala","etalasi":"etala","etalat":"etala","etalata":["etalată","etalat","etalata","etalat"],"etalate":"etalat","etalatele":"etalat","etalati":["etalați","etala","etalați","etalat"],"etalatii":"etalat","etalatul":"etalat","etalau":"etala","etaleaza":"etala","etalez":"etala","etalezi":"etala","etaloane":"etalon","etaloanele":"etalon","etaloanelor":"etalon","etalonai":"etalona","etalonam":["etalonăm","etalona","etalonam","etalona"],"etalonand":"etalona","etalonara":"etalona","etalonaram":"etalona","etalonarati":"etalona","etalonarea":"etalonare","etalonari":"etalonare","etalonarii":"etalonare","etalonarile":"etalonare","etalonarilor":"etalonare","etalonase":"etalona","etalonasem":"etalona","etalonasera":"etalona","etalonaseram":"etalona","etalonaserati":"etalona","etalonasesi":"etalona","etalonasi":"etalona","etalonat":"etalona","etalonata":["etalonată","etalonat","etalonata","etalonat"],"etalonate":"etalonat","etalonatele":"etalonat","etalonati":["etalonați","etalona","etalonați","etalonat"],"etalonatii":"etalonat","etalonatul":"etalonat","etalonau":"etalona","etaloneaza":"etalona","etalonez":"etalona","etalonezi":"etalona","etalonisti":"etalonist","etalonistii":"etalonist","etalonistilor":"etalonist","etalonistul":"etalonist","etalonistule":"etalonist","etalonistului":"etalonist","etalonori":"etalonor","etalonorii":"etalonor","etalonorilor":"etalonor","etalonorul":"etalonor","etalonorule":"etalonor","etalonorului":"etalonor","etalonul":"etalon","etalonule":"etalon","etalonului":"etalon","etamine":"etamină","etaminei":"etamină","etaminele":"etamină","etaminelor":"etamină","etanoica":["etanoică","etanoic","etanoica","etanoic"],"etanoice":"etanoic","etanoicele":"etanoic","etanoici":"etanoic","etanoicii":"etanoic","etanoicul":"etanoic","etanolamine":"etanolamină","etanolaminei":"etanolamină","etanolaminele":"etanolamină","etanolaminelor":"etanolamină","etanoli":"etanol","etanolii":"etanol","etanolilor":"etanol","etanolul":"etanol","etanolule":"etanol","etanolului":"etanol","etansa":["etanșă","etanș","etanșa","etanș"],"etansai":"etanșa","etansam":["etanșăm","etanșa","etanșam","etanșa"],"etansand":"etanșa","etansara":"etanșa","etansaram":"etanșa","etansarati":"etanșa","etansarea":"etanșare","etansari":"etanșare","etansarii":"etanșare","etansarile":"etanșare","etansarilor":"etanșare","etansase":"etanșa","etansasem":"etanșa","etansasera":"etanșa","etansaseram":"etanșa","etansaserati":"etanșa","etansasesi":"etanșa","etansasi":"etanșa","etansat":"etanșa","etansata":["etanșată","etanșat","etanșata","etanșat"],"etansate":"etanșat","etansatele":"etanșat","etansati":["etanșați","etanșa","etanșați","etanșat"],"etansatii":"etanșat","etansatul":"etanșat","etansau":"etanșa","etanse":"etanș","etanseaza":"etanșa","etanseitatea":"etanșeitate","etanseitati":"etanșeitate","etanseitatii":"etanșeitate","etanseitatile":"etanșeitate","etanseitatilor":"etanșeitate","etanseizai":"etanșeiza","etanseizam":["etanșeizăm","etanșeiza","etanșeizam","etanșeiza"],"etanseizand":"etanșeiza","etanseizara":"etanșeiza","etanseizaram":"etanșeiza","etanseizarati":"etanșeiza","etanseizarea":"etanșeizare","etanseizari":"etanșeizare","etanseizarii":"etanșeizare","etanseizarile":"etanșeizare","etanseizarilor":"etanșeizare","etanseizase":"etanșeiza","etanseizasem":"etanșeiza","etanseizasera":"etanșeiza","etanseizaseram":"etanșeiza","etanseizaserati":"etanșeiza","etanseizasesi":"etanșeiza","etanseizasi":"etanșeiza","etanseizat":"etanșeiza","etanseizati":"etanșeiza","etanseizau":"etanșeiza","etanseizeaza":"etanșeiza","etanseizez":"etanșeiza","etanseizezi":"etanșeiza","etansele":"etanș","etansez":"etanșa","etansezi":"etanșa","etansi":"etanș","etansii":"etanș","etansoare":"etanșor","etansoarele":"etanșor","etansoarelor":"etanșor","etansorul":"etanșor","etansorule":"etanșor","etansorului":"etanșor","etansul":"etanș","etanul":"etan","etanule":"etan","etanului":"etan","etape":"etapă","etapei":"etapă","etapele":"etapă","etapelor":"etapă","etapizai":"etapiza","etapizam":["etapizăm","etapiza","etapizam","etapiza"],"etapizand":"etapiza","etapizara":"etapiza","etapizaram":"etapiza","etapizarati":"etapiza","etapizarea":"etapizare","etapizari":"etapizare","etapizarii":"etapizare","etapizarile":"etapizare","etapizarilor":"etapizare","etapizase":"etapiza","etapizasem":"etapiza","etapizasera":"etapiza","etapizaseram":"etapiza","etapizaserati":"etapiza","etapizasesi":"etapiza","etapizasi":"etapiza","etapizat":"etapiza","etapizata":["etapizată","etapizat","etapizata","etapizat"],"etapizate":"etapizat","etapizatele":"etapizat","etapizati":["etapizați","etapiza","etapizați","etapizat"],"etapizatii":"etapizat","etapizatul":"etapizat","etapizau":"etapiza","etapizeaza":"etapiza","etapizez":"etapiza","etapizezi":"etapiza","etatea":"etate","etati":"etate","etatii":"etate","etatile":"etate","etatilor":"etate","etatismul":"etatism","etatismule":"etatism","etatismului":"etatism","etatista":["etatistă","etatist","etatista","etatist"],"etatiste":"etatist","etatistele":"etatist","etatisti":"etatist","etatistii":"etatist","etatistilor":"etatist","etatistul":"etatist","etatistule":"etatist","etatistului":"etatist","etatizai":"etatiza","etatizam":["etatizăm","etatiza","etatizam","etatiza"],"etatizand":"etatiza","etatizara":"etatiza","etatizaram":"etatiza","etatizarati":"etatiza","etatizarea":"etatizare","etatizari":"etatizare","etatizarii":"etatizare","etatizarile":"etatizare","etatizarilor":"etatizare","etatizase":"etatiza","etatizasem":"etatiza","etatizasera":"etatiza","etatizaseram":"etatiza","etatizaserati":"etatiza","etatizasesi":"etatiza","etatizasi":"etatiza","etatizat":"etatiza","etatizata":["etatizată","etatizat","etatizata","etatizat"],"etatizate":"etatizat","etatizatele":"etatizat","etatizati":["etatizați","etatiza","etatizați","etatizat"],"etatizatii":"etatizat","etatizatul":"etatizat","etatizau":"etatiza","etatizeaza":"etatiza","etatizez":"etatiza","etatizezi":"etatiza","etene":"etenă","etenei":"etenă","etenele":"etenă","etenelor":"etenă","eterati":"eterat","eteratii":"eterat","eteratilor":"eterat","eteratul":"eterat","eteratule":"eterat","eteratului":"eterat","eteree":"etereu","etereea":"etereu","etereele":"etereu","eterei":"etereu","etereii":"etereu","etereul":"etereu","eteri":"eter","eterica":["eterică","eteric","eterica","eteric"],"eterice":"eteric","etericele":"eteric","eterici":"eteric","etericii":"eteric","etericul":"eteric","eterific":"eterifica","eterificai":"eterifica","eterificam":["eterificăm","eterifica","eterificam","eterifica"],"eterificand":"eterifica","eterificara":"eterifica","eterificaram":"eterifica","eterificarati":"eterifica","eterificarea":"eterificare","eterificari":"eterificare","eterificarii":"eterificare","eterificarile":"eterificare","eterificarilor":"eterificare","eterificase":"eterifica","eterificasem":"eterifica","eterificasera":"eterifica","eterificaseram":"eterifica","eterificaserati":"eterifica","eterificasesi":"eterifica","eterificasi":"eterifica","eterificat":"eterifica","eterificati":"eterifica","eterificau":"eterifica","eterifice":"eterifica","eterifici":"eterifica","eterii":"eter","eterilor":"eter","eterismul":"eterism","eterismule":"eterism","eterismului":"eterism","eteristi":["eteriști","eterist","eteristi","eterist"],"eteristii":"eterist","eteristilor":"eterist","eteristul":"eterist","eteristule":"eterist","eteristului":"eterist","eterizai":"eteriza","eterizam":["eterizăm","eteriza","eterizam","eteriza"],"eterizand":"eteriza","eterizara":"eteriza","eterizaram":"eteriza","eterizarati":"eteriza","eterizarea":"eterizare","eterizari":"eterizare","eterizarii":"eterizare","eterizarile":"eterizare","eterizarilor":"eterizare","eterizase":"eteriza","eterizasem":"eteriza","eterizasera":"eteriza","eterizaseram":"eteriza","eterizaserati":"eteriza","eterizasesi":"eteriza","eterizasi":"eteriza","eterizat":"eteriza","eterizati":"eteriza","eterizau":"eteriza","eterizeaza":"eteriza","eterizez":"eteriza","eterizezi":"eteriza","eterna":["eternă","etern","eterna","etern"],"eterne":"etern","eternele":"etern","eterni":"etern","eternii":"etern","eternitatea":"eternitate","eternitati":"eternitate","eternitatii":"eternitate","eternitatile":"eternitate","eternitatilor":"eternitate","eternitul":"eternit","eternitule":"eternit","eternitului":"eternit","eternizai":"eterniza","eternizam":["eternizăm","eterniza","eternizam","eterniza"],"eternizand":"eterniza","eternizara":"eterniza","eternizaram":"eterniza","eternizarati":"eterniza","eternizarea":"eternizare","eternizarei":"eternizare","eternizase":"eterniza","eternizasem":"eterniza","eternizasera":"eterniza","eternizaseram":"eterniza","eternizaserati":"eterniza","eternizasesi":"eterniza","eternizasi":"eterniza","eternizat":"eterniza","eternizata":["eternizată","eternizat","eternizata","eternizat"],"eternizate":"eternizat","eternizatele":"eternizat","eternizati":["eternizați","eterniza","eternizați","eternizat"],"eternizatii":"eternizat","eternizatul":"eternizat","eternizau":"eterniza","eternizeaza":"eterniza","eternizez":"eterniza","eternizezi":"eterniza","eternul":"etern","eteroclita":["eteroclită","eteroclit","eteroclita","eteroclit"],"eteroclite":"eteroclit","eteroclitele":"eteroclit","eterocliti":"eteroclit","eteroclitii":"eteroclit","eteroclitul":"eteroclit","eterodine":"eterodină","eterodinei":"eterodină","eterodinele":"eterodină","eterodinelor":"eterodină","eterodocsi":"eterodox","eterodocsii":"eterodox","eterodoxa":["eterodoxă","eterodox","eterodoxa","eterodox"],"eterodoxe":"eterodox","eterodoxele":"eterodox","eterodoxia":"eterodoxie","eterodoxiei":"eterodoxie","eterodoxii":"eterodoxie","eterodoxul":"eterodox","eterofona":["eterofonă","eterofon","eterofona","eterofon"],"eterofone":"eterofon","eterofonele":"eterofon","eterofoni":"eterofon","eterofonia":"eterofonie","eterofoniei":"eterofonie","eterofonii":["eterofonii","eterofon","eterofonii","eterofonie"],"eterofoniile":"eterofonie","eterofoniilor":"eterofonie","eterofonul":"eterofon","eterogena":["eterogenă","eterogen","eterogena","eterogen"],"eterogene":"eterogen","eterogenele":"eterogen","eterogeni":"eterogen","eterogenia":"eterogenie","eterogeniei":"eterogenie","eterogenii":["eterogenii","eterogen","eterogenii","eterogenie"],"eterogeniile":"eterogenie","eterogeniilor":"eterogenie","eterogenitatea":"eterogenitate","eterogenitati":"eterogenitate","eterogenitatii":"eterogenitate","eterogenul":"eterogen","eterogrefe":"eterogrefă","eterogrefei":"eterogrefă","eterogrefele":"eterogrefă","eterogrefelor":"eterogrefă","eteromane":"eteromană","eteromanei":"eteromană","eteromanele":"eteromană","eteromanelor":"eteromană","eteromani":"eteroman","eteromania":"eteromanie","eteromaniei":"eteromanie","eteromanii":["eteromanii","eteroman","eteromanii","eteromanie"],"eteromaniile":"eteromanie","eteromaniilor":"eteromanie","eteromanilor":"eteroman","eteromanul":"eteroman","eteromanule":"eteroman","eteromanului":"eteroman","eterometrica":["eterometrică","eterometric","eterometrica","eterometric"],"eterometrice":"eterometric","eterometricele":"eterometric","eterometrici":"eterometric","eterometricii":"eterometric","eterometricul":"eterometric","eteromorfa":["eteromorfă","eteromorf","eteromorfa","eteromorf"],"eteromorfe":"eteromorf","eteromorfele":"eteromorf","eteromorfi":"eteromorf","eteromorfii":"eteromorf","eteromorful":"eteromorf","eteronima":["eteronimă","eteronim","eteronima","eteronim"],"eteronime":"eteronim","eteronimele":"eteronim","eteronimi":"eteronim","eteronimii":"eteronim","eteronimul":"eteronim","eteronoma":["eteronomă","eteronom","eteronoma","eteronom"],"eteronome":"eteronom","eteronomele":"eteronom","eteronomi":"eteronom","eteronomia":"eteronomie","eteronomiei":"eteronomie","eteronomii":["eteronomii","eteronom","eteronomii","eteronomie"],"eteronomiile":"eteronomie","eteronomiilor":"eteronomie","eteronomul":"eteronom","eteroproteide":"eteroproteidă","eterosfere":"eterosferă","eterosferei":"eterosferă","eterosferele":"eterosferă","eterosferelor":"eterosferă","eterosugestia":"eterosugestie","eterosugestiei":"eterosugestie","eterosugestii":"eterosugestie","eterosugestiile":"eterosugestie","eterosugestiilor":"eterosugestie","eterul":"eter","eterule":"eter","eterului":"eter","eteruri":"eter","eterurile":"eter","eterurilor":"eter","etiaje":"etiaj","etiajele":"etiaj","etiajelor":"etiaj","etiajul":"etiaj","etiajule":"etiaj","etiajului":"etiaj","etica":["etică","etic","etica","etic"],"etice":"etic","eticeasca":["eticească","eticesc","eticeasca","eticesc"],"eticele":"etic","eticescul":"eticesc","eticesti":"eticesc","eticestii":"eticesc","eticestile":"eticesc","etichet":"etichetă","etichetai":"eticheta","etichetam":["etichetăm","eticheta","etichetam","eticheta"],"etichetand":"eticheta","etichetara":"eticheta","etichetaram":"eticheta","etichetarati":"eticheta","etichetarea":"etichetare","etichetari":"etichetare","etichetarii":"etichetare","etichetarile":"etichetare","etichetarilor":"etichetare","etichetase":"eticheta","etichetasem":"eticheta","etichetasera":"eticheta","etichetaseram":"eticheta","etichetaserati":"eticheta","etichetasesi":"eticheta","etichetasi":"eticheta","etichetat":"eticheta","etichetata":["etichetată","etichetat","etichetata","etichetat"],"etichetate":"etichetat","etichetatele":"etichetat","etichetati":["etichetați","eticheta","etichetați","etichetat"],"etichetatii":"etichetat","etichetatul":"etichetat","etichetau":"eticheta","etichete":"etichetă","eticheteaza":"eticheta","etichetei":"etichetă","etichetele":"etichetă","etichetelor":"etichetă","etichetez":"eticheta","etichetezi":"eticheta","etici":["etici","etic","etici","etică"],"eticianul":"etician","eticianule":"etician","eticianului":"etician","eticiene":"eticiană","eticienei":"eticiană","eticienele":"eticiană","eticienelor":"eticiană","eticieni":"etician","eticienii":"etician","eticienilor":"etician","eticii":["eticii","etic","eticii","etică"],"eticismul":"eticism","eticismule":"eticism","eticismului":"eticism","eticizai":"eticiza","eticizam":["eticizăm","eticiza","eticizam","eticiza"],"eticizand":"eticiza","eticizara":"eticiza","eticizaram":"eticiza","eticizarati":"eticiza","eticizase":"eticiza","eticizasem":"eticiza","eticizasera":"eticiza","eticizaseram":"eticiza","eticizaserati":"eticiza","eticizasesi":"eticiza","eticizasi":"eticiza","eticizat":"eticiza","eticizati":"eticiza","eticizau":"eticiza","eticizeaza":"eticiza","eticizez":"eticiza","eticizezi":"eticiza","eticul":"etic","etilai":"etila","etilam":["etilăm","etila","etilam","etila"],"etilamine":"etilamină","etilaminei":"etilamină","etilaminele":"etilamină","etilaminelor":"etilamină","etiland":"etila","etilara":"etila","etilaram":"etila","etilarati":"etila","etilarea":"etilare","etilari":"etilare","etilarii":"etilare","etilarile":"etilare","etilarilor":"etilare","etilase":"etila","etilasem":"etila","etilasera":"etila","etilaseram":"etila","etilaserati":"etila","etilasesi":"etila","etilasi":"etila","etilat":"etila","etilati":"etila","etilau":"etila","etilbenzeni":"etilbenzen","etilbenzenii":"etilbenzen","etilbenzenilor":"etilbenzen","etilbenzenul":"etilbenzen","etilbenzenule":"etilbenzen","etilbenzenului":"etilbenzen","etileaza":"etila","etilendiamine":"etilendiamină","etilendiaminei":"etilendiamină","etilendiaminele":"etilendiamină","etilendiaminelor":"etilendiamină","etilene":"etilenă","etilenei":"etilenă","etilenele":"etilenă","etilenelor":"etilenă","etilenglicoli":"etilenglicol","etilenglicolii":"etilenglicol","etilenglicolilor":"etilenglicol","etilenglicolul":"etilenglicol","etilenglicolule":"etilenglicol","etilenglicolului":"etilenglicol","etilenica":["etilenică","etilenic","etilenica","etilenic"],"etilenice":"etilenic","etilenicele":"etilenic","etilenici":"etilenic","etilenicii":"etilenic","etilenicul":"etilenic","etilenoxidul":"etilenoxid","etilenoxidule":"etilenoxid","etilenoxidului":"etilenoxid","etilenoxizi":"etilenoxid","etilenoxizii":"etilenoxid","etilenoxizilor":"etilenoxid","etilez":"etila","etilezi":"etila","etili":"etil","etilica":["etilică","etilic","etilica","etilic"],"etilice":"etilic","etilicele":"etilic","etilici":"etilic","etilicii":"etilic","etilicul":"etilic","etilii":"etil","etililor":"etil","etilisme":"etilism","etilismele":"etilism","etilismelor":"etilism","etilismul":"etilism","etilismule":"etilism","etilismului":"etilism","etilul":"etil","etilule":"etil","etilului":"etil","etimoane":"etimon","etimoanele":"etimon","etimoanelor":"etimon","etimologe":"etimologă","etimologei":"etimologă","etimologele":"etimologă","etimologelor":"etimologă","etimologi":"etimolog","etimologia":"etimologie","etimologica":["etimologică","etimologic","etimologica","etimologic"],"etimologice":"etimologic","etimologiceasca":["etimologicească","etimologicesc","etimologiceasca","etimologicesc"],"etimologicele":"etimologic","etimologicescul":"etimologicesc","etimologicesti":"etimologicesc","etimologicestii":"etimologicesc","etimologicestile":"etimologicesc","etimologici":"etimologic","etimologicii":"etimologic","etimologicul":"etimologic","etimologiei":"etimologie","etimologii":["etimologii","etimolog","etimologii","etimologie"],"etimologii populare":"etimologie populară","etimologiile":"etimologie","etimologiilor":"etimologie","etimologilor":"etimolog","etimologisme":"etimologism","etimologismele":"etimologism","etimologismelor":"etimologism","etimologismul":"etimologism","etimologismule":"etimologism","etimologismului":"etimologism","etimologiste":"etimologistă","etimologistei":"etimologistă","etimologistele":"etimologistă","etimologistelor":"etimologistă","etimologisti":"etimologist","etimologistii":"etimologist","etimologistilor":"etimologist","etimologistul":"etimologist","etimologistule":"etimologist","etimologistului":"etimologist","etimologizai":"etimologiza","etimologizam":["etimologizăm","etimologiza","etimologizam","etimologiza"],"etimologizand":"etimologiza","etimologizanta":["etimologizantă","etimologizant","etimologizanta","etimologizant"],"etimologizante":"etimologizant","etimologizantele":"etimologizant","etimologizanti":"etimologizant","etimologizantii":"etimologizant","etimologizantul":"etimologizant","etimologizara":"etimologiza","etimologizaram":"etimologiza","etimologizarati":"etimologiza","etimologizarea":"etimologizare","etimologizari":"etimologizare","etimologizarii":"etimologizare","etimologizarile":"etimologizare","etimologizarilor":"etimologizare","etimologizase":"etimologiza","etimologizasem":"etimologiza","etimologizasera":"etimologiza","etimologizaseram":"etimologiza","etimologizaserati":"etimologiza","etimologizasesi":"etimologiza","etimologizasi":"etimologiza","etimologizat":"etimologiza","etimologizati":"etimologiza","etimologizau":"etimologiza","etimologizeaza":"etimologiza","etimologizez":"etimologiza","etimologizezi":"etimologiza","etimologul":"etimolog","etimologule":"etimolog","etimologului":"etimolog","etimonul":"etimon","etimonule":"etimon","etimonului":"etimon","etine":"etină","etinei":"etină","etinele":"etină","etinelor":"etină","etiolai":"etiola","etiolam":["etiolăm","etiola","etiolam","etiola"],"etioland":"etiola","etiolara":"etiola","etiolaram":"etiola","etiolarati":"etiola","etiolarea":"etiolare","etiolari":"etiolare","etiolarii":"etiolare","etiolarile":"etiolare","etiolarilor":"etiolare","etiolase":"etiola","etiolasem":"etiola","etiolasera":"etiola","etiolaseram":"etiola","etiolaserati":"etiola","etiolasesi":"etiola","etiolasi":"etiola","etiolat":"etiola","etiolati":"etiola","etiolau":"etiola","etioleaza":"etiola","etiolez":"etiola","etiolezi":"etiola","etiologia":"etiologie","etiologica":["etiologică","etiologic","etiologica","etiologic"],"etiologice":"etiologic","etiologicele":"etiologic","etiologici":"etiologic","etiologicii":"etiologic","etiologicul":"etiologic","etiologiei":"etiologie","etiologii":"etiologie","etiopeasca":["etiopească","etiopesc","etiopeasca","etiopesc"],"etiopeneasca":["etiopenească","etiopenesc","etiopeneasca","etiopenesc"],"etiopenescul":"etiopenesc","etiopenesti":"etiopenesc","etiopenestii":"etiopenesc","etiopenestile":"etiopenesc","etiopescul":"etiopesc","etiopesti":"etiopesc","etiopestii":"etiopesc","etiopestile":"etiopesc","etiopi":"etiop","etiopiana":["etiopiană","etiopian","etiopiana","etiopian"],"etiopianul":"etiopian","etiopianule":"etiopian","etiopianului":"etiopian","etiopiceasca":["etiopicească","etiopicesc","etiopiceasca","etiopicesc"],"etiopicescul":"etiopicesc","etiopicesti":"etiopicesc","etiopicestii":"etiopicesc","etiopicestile":"etiopicesc","etiopiei":"Etiopia","etiopiene":["etiopiene","etiopian","etiopiene","etiopiană"],"etiopienei":"etiopiană","etiopienele":["etiopienele","etiopian","etiopienele","etiopiană"],"etiopienelor":"etiopiană","etiopieni":"etiopian","etiopienii":"etiopian","etiopienilor":"etiopian","etiopii":"etiop","etiopilor":"etiop","etiopul":"etiop","etiopule":"etiop","etiopului":"etiop","etirai":"etira","etiram":["etirăm","etira","etiram","etira"],"etirand":"etira","etirara":"etira","etiraram":"etira","etirarati":"etira","etirase":"etira","etirasem":"etira","etirasera":"etira","etiraseram":"etira","etiraserati":"etira","etirasesi":"etira","etirasi":"etira","etirat":"etira","etirata":["etirată","etirat","etirata","etirat"],"etirate":"etirat","etiratele":"etirat","etirati":["etirați","etira","etirați","etirat"],"etiratii":"etirat","etiratul":"etirat","etirau":"etira","etireaza":"etira","etirez":"etira","etirezi":"etira","etmoidala":["etmoidală","etmoidal","etmoidala","etmoidal"],"etmoidale":"etmoidal","etmoidalele":"etmoidal","etmoidali":"etmoidal","etmoidalii":"etmoidal","etmoidalul":"etmoidal","etmoide":"etmoid","etmoidectomia":"etmoidectomie","etmoidectomiei":"etmoidectomie","etmoidectomii":"etmoidectomie","etmoidectomiile":"etmoidectomie","etmoidectomiilor":"etmoidectomie","etmoidele":"etmoid","etmoidelor":"etmoid","etmoidite":"etmoidită","etmoiditei":"etmoidită","etmoiditele":"etmoidită","etmoiditelor":"etmoidită","etmoidul":"etmoid","etmoidule":"etmoid","etmoidului":"etmoid","etnarhi":"etnarh","etnarhia":"etnarhie","etnarhiei":"etnarhie","etnarhii":["etnarhii","etnarh","etnarhii","etnarhie"],"etnarhiile":"etnarhie","etnarhiilor":"etnarhie","etnarhilor":"etnarh","etnarhul":"etnarh","etnarhule":"etnarh","etnarhului":"etnarh","etnia":"etnie","etnica":["etnică","etnic","etnica","etnic"],"etnice":"etnic","etniceasca":["etnicească","etnicesc","etniceasca","etnicesc"],"etnicele":"etnic","etnicescul":"etnicesc","etnicesti":"etnicesc","etnicestii":"etnicesc","etnicestile":"etnicesc","etnici":"etnic","etnicii":"etnic","etnicismul":"etnicism","etnicismule":"etnicism","etnicismului":"etnicism","etnicitatea":"etnicitate","etnicitati":"etnicitate","etnicitatii":"etnicitate","etnicitatile":"etnicitate","etnicitatilor":"etnicitate","etnicizai":"etniciza","etnicizam":["etnicizăm","etniciza","etnicizam","etniciza"],"etnicizand":"etniciza","etnicizara":"etniciza","etnicizaram":"etniciza","etnicizarati":"etniciza","etnicizase":"etniciza","etnicizasem":"etniciza","etnicizasera":"etniciza","etnicizaseram":"etniciza","etnicizaserati":"etniciza","etnicizasesi":"etniciza","etnicizasi":"etniciza","etnicizat":"etniciza","etnicizati":"etniciza","etnicizau":"etniciza","etnicizeaza":"etniciza","etnicizez":"etniciza","etnicizezi":"etniciza","etnicul":"etnic","etniei":"etnie","etnii":"etnie","etniile":"etnie","etniilor":"etnie","etnobotanica":["etnobotanică","etnobotanic","etnobotanica","etnobotanic"],"etnobotanice":["etnobotanice","etnobotanic","etnobotanice","etnobotanică"],"etnobotanicei":"etnobotanică","etnobotanicele":"etnobotanic","etnobotanici":"etnobotanic","etnobotanicii":"etnobotanic","etnobotanicul":"etnobotanic","etnocentrisme":"etnocentrism","etnocentrismele":"etnocentrism","etnocentrismelor":"etnocentrism","etnocentrismul":"etnocentrism","etnocentrismule":"etnocentrism","etnocentrismului":"etnocentrism","etnocratia":"etnocrație","etnocratica":["etnocratică","etnocratic","etnocratica","etnocratic"],"etnocratice":"etnocratic","etnocraticele":"etnocratic","etnocratici":"etnocratic","etnocraticii":"etnocratic","etnocraticul":"etnocratic","etnocratiei":"etnocrație","etnocratii":"etnocrație","etnocratiile":"etnocrație","etnocratiilor":"etnocrație","etnoculturala":["etnoculturală","etnocultural","etnoculturala","etnocultural"],"etnoculturale":"etnocultural","etnoculturalele":"etnocultural","etnoculturali":"etnocultural","etnoculturalii":"etnocultural","etnoculturalul":"etnocultural","etnoculturi":"etnocultură","etnoculturii":"etnocultură","etnoculturile":"etnocultură","etnoculturilor":"etnocultură","etnofolclorica":["etnofolclorică","etnofolcloric","etnofolclorica","etnofolcloric"],"etnofolclorice":"etnofolcloric","etnofolcloricele":"etnofolcloric","etnofolclorici":"etnofolcloric","etnofolcloricii":"etnofolcloric","etnofolcloricul":"etnofolcloric","etnogenetica":["etnogenetică","etnogenetic","etnogenetica","etnogenetic"],"etnogenetice":"etnogenetic","etnogeneticele":"etnogenetic","etnogenetici":"etnogenetic","etnogeneticii":"etnogenetic","etnogeneticul":"etnogenetic","etnogeneze":"etnogeneză","etnogenezei":"etnogeneză","etnogenezele":"etnogeneză","etnogenezelor":"etnogeneză","etnogenia":"etnogenie","etnogeniei":"etnogenie","etnogenii":"etnogenie","etnogeniile":"etnogenie","etnogeniilor":"etnogenie","etnogeografia":"etnogeografie","etnogeografica":["etnogeografică","etnogeografic","etnogeografica","etnogeografic"],"etnogeografice":"etnogeografic","etnogeograficeasca":["etnogeograficească","etnogeograficesc","etnogeograficeasca","etnogeograficesc"],"etnogeograficele":"etnogeografic","etnogeograficescul":"etnogeograficesc","etnogeograficesti":"etnogeograficesc","etnogeograficestii":"etnogeograficesc","etnogeograficestile":"etnogeograficesc","etnogeografici":"etnogeografic","etnogeograficii":"etnogeografic","etnogeograficul":"etnogeografic","etnogeografiei":"etnogeografie","etnogeografii":"etnogeografie","etnogeografiile":"etnogeografie","etnogeografiilor":"etnogeografie","etnografe":"etnografă","etnografei":"etnografă","etnografele":"etnografă","etnografelor":"etnografă","etnografi":"etnograf","etnografia":"etnografie","etnografica":["etnografică","etnografic","etnografica","etnografic"],"etnografice":"etnografic","etnograficele":"etnografic","etnografici":"etnografic","etnograficii":"etnografic","etnograficul":"etnografic","etnografiei":"etnografie","etnografii":["etnografii","etnograf","etnografii","etnografie"],"etnografilor":"etnograf","etnograful":"etnograf","etnografule":"etnograf","etnografului":"etnograf","etnolingvistica":["etnolingvistică","etnolingvistic","etnolingvistica","etnolingvistic"],"etnolingvistice":["etnolingvistice","etnolingvistic","etnolingvistice","etnolingvistică"],"etnolingvisticei":"etnolingvistică","etnolingvisticele":["etnolingvisticele","etnolingvistic","etnolingvisticele","etnolingvistică"],"etnolingvisticelor":"etnolingvistică","etnolingvistici":"etnolingvistic","etnolingvisticii":"etnolingvistic","etnolingvisticul":"etnolingvistic","etnologe":"etnologă","etnologei":"etnologă","etnologele":"etnologă","etnologelor":"etnologă","etnologi":"etnolog","etnologia":"etnologie","etnologica":["etnologică","etnologic","etnologica","etnologic"],"etnologice":"etnologic","etnologicele":"etnologic","etnologici":"etnologic","etnologicii":"etnologic","etnologicul":"etnologic","etnologiei":"etnologie","etnologii":["etnologii","etnolog","etnologii","etnologie"],"etnologilor":"etnolog","etnologisti":"etnologist","etnologistii":"etnologist","etnologistilor":"etnologist","etnologistul":"etnologist","etnologistule":"etnologist","etnologistului":"etnologist","etnologul":"etnolog","etnologule":"etnolog","etnologului":"etnolog","etnomuzicologe":"etnomuzicologă","etnomuzicologei":"etnomuzicologă","etnomuzicologele":"etnomuzicologă","etnomuzicologelor":"etnomuzicologă","etnomuzicologi":"etnomuzicolog","etnomuzicologia":"etnomuzicologie","etnomuzicologiei":"etnomuzicologie","etnomuzicologii":["etnomuzicologii","etnomuzicolog","etnomuzicologii","etnomuzicologie"],"etnomuzicologilor":"etnomuzicolog","etnomuzicologul":"etnomuzicolog","etnomuzicologule":"etnomuzicolog","etnomuzicologului":"etnomuzicolog","etnonime":"etnonim","etnonimele":"etnonim","etnonimelor":"etnonim","etnonimul":"etnonim","etnonimule":"etnonim","etnonimului":"etnonim","etnopsihologia":"etnopsihologie","etnopsihologiei":"etnopsihologie","etnopsihologii":"etnopsihologie","etnopsihologiile":"etnopsihologie","etnopsihologiilor":"etnopsihologie","etnosociologia":"etnosociologie","etnosociologiei":"etnosociologie","etnosociologii":"etnosociologie","etnosociologiile":"etnosociologie","etnosociologiilor":"etnosociologie","etografia":"etografie","etografiei":"etografie","etografii":"etografie","etografiile":"etografie","etografiilor":"etografie","etole":"etolă","etolei":"etolă","etolele":"etolă","etolelor":"etolă","etologi":"etolog","etologia":"etologie","etologica":["etologică","etologic","etologica","etologic"],"etologice":"etologic","etologicele":"etologic","etologici":"etologic","etologicii":"etologic","etologicul":"etologic","etologiei":"etologie","etologii":["etologii","etolog","etologii","etologie"],"etologilor":"etolog","etologul":"etolog","etologule":"etolog","etologului":"etolog","etonamente":"etonament","etonamentele":"etonament","etonamentelor":"etonament","etonamentul":"etonament","etonamentule":"etonament","etonamentului":"etonament","etosul":"etos","etosule":"etos","etosului":"etos","etrave":"etravă","etravei":"etravă","etravele":"etravă","etravelor":"etravă","etriere":"etrier","etrierele":"etrier","etrierelor":"etrier","etrierul":"etrier","etrierule":"etrier","etrierului":"etrier","etrusce":"etruscă","etruscei":"etruscă","etruscele":"etruscă","etruscelor":"etruscă","etrusci":"etrusc","etruscii":"etrusc","etruscilor":"etrusc","etruscologi":"etruscolog","etruscologia":"etruscologie","etruscologiei":"etruscologie","etruscologii":["etruscologii","etruscolog","etruscologii","etruscologie"],"etruscologilor":"etruscolog","etruscologul":"etruscolog","etruscologule":"etruscolog","etruscologului":"etruscolog","etruscul":"etrusc","etruscule":"etrusc","etruscului":"etrusc","etufanta":["etufantă","etufant","etufanta","etufant"],"etufante":"etufant","etufantele":"etufant","etufanti":"etufant","etufantii":"etufant","etufantul":"etufant","etuiul":"etui","etuiule":"etui","etuiului":"etui","etuiuri":"etui","etuiurile":"etui","etuiurilor":"etui","etuve":"etuvă","etuvei":"etuvă","etuvele":"etuvă","etuvelor":"etuvă","eucalipti":"eucalipt","eucaliptii":"eucalipt","eucaliptilor":"eucalipt","eucaliptolul":"eucaliptol","eucaliptolule":"eucaliptol","eucaliptolului":"eucaliptol","eucaliptul":"eucalipt","eucaliptule":"eucalipt","eucaliptului":"eucalipt","eucariote":"eucariotă","eucariotei":"eucariotă","eucariotele":"eucariotă","eucariotelor":"eucariotă","euclazul":"euclaz","euclazule":"euclaz","euclazului":"euclaz","euclidiana":["euclidiană","euclidian","euclidiana","euclidian"],"euclidianul":"euclidian","euclidica":["euclidică","euclidic","euclidica","euclidic"],"euclidice":"euclidic","euclidicele":"euclidic","euclidici":"euclidic","euclidicii":"euclidic","euclidicul":"euclidic","euclidiene":"euclidian","euclidienele":"euclidian","euclidieni":"euclidian","euclidienii":"euclidian","eucoloidul":"eucoloid","eucoloidule":"eucoloid","eucoloidului":"eucoloid","eucoloizi":"eucoloid","eucoloizii":"eucoloid","eucoloizilor":"eucoloid","eucrazia":"eucrazie","eucraziei":"eucrazie","eucrazii":"eucrazie","eucromozomi":"eucromozom","eucromozomii":"eucromozom","eucromozomilor":"eucromozom","eucromozomul":"eucromozom","eucromozomule":"eucromozom","eucromozomului":"eucromozom","eudemonia":"eudemonie","eudemonica":["eudemonică","eudemonic","eudemonica","eudemonic"],"eudemonice":"eudemonic","eudemonicele":"eudemonic","eudemonici":"eudemonic","eudemonicii":"eudemonic","eudemonicul":"eudemonic","eudemoniei":"eudemonie","eudemonii":"eudemonie","eudemoniile":"eudemonie","eudemoniilor":"eudemonie","eudemonismul":"eudemonism","eudemonismule":"eudemonism","eudemonismului":"eudemonism","eudemoniste":"eudemonistă","eudemonistei":"eudemonistă","eudemonistele":"eudemonistă","eudemonistelor":"eudemonistă","eudemonisti":"eudemonist","eudemonistii":"eudemonist","eudemonistilor":"eudemonist","eudemonistul":"eudemonist","eudemonistule":"eudemonist","eudemonistului":"eudemonist","eudiometre":"eudiometru","eudiometrele":"eudiometru","eudiometrelor":"eudiometru","eudiometria":"eudiometrie","eudiometrica":["eudiometrică","eudiometric","eudiometrica","eudiometric"],"eudiometrice":"eudiometric","eudiometricele":"eudiometric","eudiometrici":"eudiometric","eudiometricii":"eudiometric","eudiometricul":"eudiometric","eudiometriei":"eudiometrie","eudiometrii":"eudiometrie","eudiometriile":"eudiometrie","eudiometriilor":"eudiometrie","eudiometrul":"eudiometru","eudiometrule":"eudiometru","eudiometrului":"eudiometru","eudiste":"eudistă","eudistei":"eudistă","eudistele":"eudistă","eudistelor":"eudistă","eudisti":"eudist","eudistii":"eudist","eudistilor":"eudist","eudistul":"eudist","eudistule":"eudist","eudistului":"eudist","eufemica":["eufemică","eufemic","eufemica","eufemic"],"eufemice":"eufemic","eufemicele":"eufemic","eufemici":"eufemic","eufemicii":"eufemic","eufemicul":"eufemic","eufemisme":"eufemism","eufemismele":"eufemism","eufemismelor":"eufemism","eufemismul":"eufemism","eufemismule":"eufemism","eufemismului":"eufemism","eufemista":["eufemistă","eufemist","eufemista","eufemist"],"eufemiste":"eufemist","eufemistele":"eufemist","eufemisti":"eufemist","eufemistica":["eufemistică","eufemistic","eufemistica","eufemistic"],"eufemistice":"eufemistic","eufemisticele":"eufemistic","eufemistici":"eufemistic","eufemisticii":"eufemistic","eufemisticul":"eufemistic","eufemistii":"eufemist","eufemistul":"eufemist","eufonia":"eufonie","eufonica":["eufonică","eufonic","eufonica","eufonic"],"eufonice":"eufonic","eufonicele":"eufonic","eufonici":"eufonic","eufonicii":"eufonic","eufonicul":"eufonic","eufoniei":"eufonie","eufonii":["eufonii","eufonie","eufonii","eufoniu"],"eufoniile":["eufoniile","eufonie","eufoniile","eufoniu"],"eufoniilor":["eufoniilor","eufonie","eufoniilor","eufoniu"],"eufonisme":"eufonism","eufonismele":"eufonism","eufonismelor":"eufonism","eufonismul":"eufonism","eufonismule":"eufonism","eufonismului":"eufonism","eufoniuul":"eufoniu","eufoniuule":"eufoniu","eufoniuului":"eufoniu","euforbieul":"euforbie","euforbieule":"euforbie","euforbieului":"euforbie","euforbii":"euforbie","euforbiile":"euforbie","euforbiilor":"euforbie","euforia":"euforie","euforica":["euforică","euforic","euforica","euforic"],"euforice":"euforic","euforicele":"euforic","euforici":"euforic","euforicii":"euforic","euforicul":"euforic","euforiei":"euforie","euforii":"euforie","euforiile":"euforie","euforiilor":"euforie","euforizanta":["euforizantă","euforizant","euforizanta","euforizant"],"euforizante":"euforizant","euforizantele":"euforizant","euforizanti":"euforizant","euforizantii":"euforizant","euforizantul":"euforizant","eufuismul":"eufuism","eufuismule":"eufuism","eufuismului":"eufuism","eufuistica":["eufuistică","eufuistic","eufuistica","eufuistic"],"eufuistice":"eufuistic","eufuisticele":"eufuistic","eufuistici":"eufuistic","eufuisticii":"eufuistic","eufuisticul":"eufuistic","eugenetici":"eugenetică","eugeneticii":"eugenetică","eugenezica":["eugenezică","eugenezic","eugenezica","eugenezic"],"eugenezice":"eugenezic","eugenezicele":"eugenezic","eugenezici":"eugenezic","eugenezicii":"eugenezic","eugenezicul":"eugenezic","eugenia":"eugenie","eugenica":["eugenică","eugenic","eugenica","eugenic"],"eugenice":"eugenic","eugenicele":"eugenic","eugenici":"eugenic","eugenicii":"eugenic","eugenicul":"eugenic","eugeniei":"eugenie","eugenii":"eugenie","eugenismul":"eugenism","eugenismule":"eugenism","eugenismului":"eugenism","eugenista":["eugenistă","eugenist","eugenista","eugenist"],"eugeniste":"eugenist","eugenistele":"eugenist","eugenisti":"eugenist","eugenistii":"eugenist","eugenistul":"eugenist","eugenolul":"eugenol","eugenolule":"eugenol","eugenolului":"eugenol","euglene":"euglenă","euglenei":"euglenă","euglenele":"euglenă","euglenelor":"euglenă","euharistia":"euharistie","euharistica":["euharistică","euharistic","euharistica","euharistic"],"euharistice":"euharistic","euharisticele":"euharistic","euharistici":"euharistic","euharisticii":"euharistic","euharisticul":"euharistic","euharistiei":"euharistie","euharistii":"euharistie","euharistiile":"euharistie","euharistiilor":"euharistie","euhemerismul":"euhemerism","euhemerismule":"euhemerism","euhemerismului":"euhemerism","euismul":"euism","euismule":"euism","euismului":"euism","eul":"eu","eule":"eu","eulogia":"eulogie","eulogiei":"eulogie","eulogii":"eulogie","eulogiile":"eulogie","eulogiilor":"eulogie","eului":"eu","eunuchismul":"eunuchism","eunuchismule":"eunuchism","eunuchismului":"eunuchism","eunuci":"eunuc","eunucii":"eunuc","eunucilor":"eunuc","eunucoida":["eunucoidă","eunucoid","eunucoida","eunucoid"],"eunucoide":"eunucoid","eunucoidele":"eunucoid","eunucoidismul":"eunucoidism","eunucoidismule":"eunucoidism","eunucoidismului":"eunucoidism","eunucoidul":"eunucoid","eunucoizi":"eunucoid","eunucoizii":"eunucoid","eunucul":"eunuc","eunucule":"eunuc","eunucului":"eunuc","eupatia":"eupatie","eupatiei":"eupatie","eupatii":"eupatie","eupatridul":"eupatrid","eupatridule":"eupatrid","eupatridului":"eupatrid","eupatrizi":"eupatrid","eupatrizii":"eupatrid","eupatrizilor":"eupatrid","eupepsia":"eupepsie","eupepsiei":"eupepsie","eupepsii":"eupepsie","eupepsiile":"eupepsie","eupepsiilor":"eupepsie","eupeptica":["eupeptică","eupeptic","eupeptica","eupeptic"],"eupeptice":"eupeptic","eupepticele":"eupeptic","eupeptici":"eupeptic","eupepticii":"eupeptic","eupepticul":"eupeptic","euploide":"euploid","euploidele":"euploid","euploidelor":"euploid","euploidul":"euploid","euploidule":"euploid","euploidului":"euploid","eupneea":"eupnee","eupneei":"eupnee","eurafricana":["eurafricană","eurafrican","eurafricana","eurafrican"],"eurafricane":"eurafrican","eurafricanele":"eurafrican","eurafricani":"eurafrican","eurafricanii":"eurafrican","eurafricanul":"eurafrican","eurasiana":["eurasiană","eurasian","eurasiana","eurasian"],"eurasianul":"eurasian","eurasiatica":["eurasiatică","eurasiatic","eurasiatica","eurasiatic"],"eurasiatice":"eurasiatic","eurasiaticele":"eurasiatic","eurasiatici":"eurasiatic","eurasiaticii":"eurasiatic","eurasiaticul":"eurasiatic","eurasiene":"eurasian","eurasienele":"eurasian","eurasieni":"eurasian","eurasienii":"eurasian","euri":"eu","euricefala":["euricefală","euricefal","euricefala","euricefal"],"euricefale":"euricefal","euricefalele":"euricefal","euricefali":"euricefal","euricefalii":"euricefal","euricefalul":"euricefal","eurignatisme":"eurignatism","eurignatismele":"eurignatism","eurignatismelor":"eurignatism","eurignatismul":"eurignatism","eurignatismule":"eurignatism","eurignatismului":"eurignatism","eurihalina":["eurihalină","eurihalin","eurihalina","eurihalin"],"eurihaline":"eurihalin","eurihalinele":"eurihalin","eurihalini":"eurihalin","eurihalinii":"eurihalin","eurihalinul":"eurihalin","eurile":"eu","eurilor":"eu","euristica":["euristică","euristic","euristica","euristic"],"euristice":"euristic","euristicele":"euristic","euristici":["euristici","euristic","euristici","euristică"],"euristicii":["euristicii","euristic","euristicii","euristică"],"euristicile":"euristică","euristicilor":"euristică","euristicul":"euristic","euriterma":["euritermă","euriterm","euriterma","euriterm"],"euriterme":"euriterm","euritermele":"euriterm","euritermi":"euriterm","euritermii":"euriterm","euritermul":"euriterm","euritmia":"euritmie","euritmica":["euritmică","euritmic","euritmica","euritmic"],"euritmice":"euritmic","euritmicele":"euritmic","euritmici":"euritmic","euritmicii":"euritmic","euritmicul":"euritmic","euritmiei":"euritmie","euritmii":"euritmie","euritmiile":"euritmie","euritmiilor":"euritmie","euroasiatice":"euroasiatică","euroasiaticei":"euroasiatică","euroasiaticele":"euroasiatică","euroasiaticelor":"euroasiatică","euroatlantica":["euroatlantică","euroatlantic","euroatlantica","euroatlantic"],"euroatlantice":"euroatlantic","euroatlanticele":"euroatlantic","euroatlantici":"euroatlantic","euroatlanticii":"euroatlantic","euroatlanticul":"euroatlantic","eurobance":"eurobancă","eurobancei":"eurobancă","eurobancele":"eurobancă","eurobancelor":"eurobancă","eurobanci":"eurobancă","eurocenti":"eurocent","eurocentii":"eurocent","eurocentilor":"eurocent","eurocentul":"eurocent","eurocentule":"eurocent","eurocentului":"eurocent","eurocomunismul":"eurocomunism","eurocomunismule":"eurocomunism","eurocomunismului":"eurocomunism","eurocomunista":["eurocomunistă","eurocomunist","eurocomunista","eurocomunist"],"eurocomuniste":"eurocomunist","eurocomunistele":"eurocomunist","eurocomunisti":"eurocomunist","eurocomunistii":"eurocomunist","eurocomunistilor":"eurocomunist","eurocomunistul":"eurocomunist","eurocomunistule":"eurocomunist","eurocomunistului":"eurocomunist","eurodolari":"eurodolar","eurodolarii":"eurodolar","eurodolarilor":"eurodolar","eurodolarul":"eurodolar","eurodolarule":"eurodolar","eurodolarului":"eurodolar","euroi":"euro","eurolor":"euro","euroobligatiunea":"euroobligațiune","euroobligatiuni":"euroobligațiune","euroobligatiunii":"euroobligațiune","euroobligatiunile":"euroobligațiune","euroobligatiunilor":"euroobligațiune","europarlamentari":"europarlamentar","europarlamentarii":"europarlamentar","europarlamentarilor":"europarlamentar","europarlamentarul":"europarlamentar","europarlamentarule":"europarlamentar","europarlamentarului":"europarlamentar","europe":"Europa","europeana":["europeană","european","europeana","european"],"europeanul":"european","europeanule":"european","europeanului":"european","europeasca":["europească","europesc","europeasca","europesc"],"europee":"europeu","europeea":"europeu","europeele":"europeu","europei":["europei","Europa","europei","europeu"],"europei centrale":"Europa Centrală","europei de est":"Europa de Est","europei de nord":"Europa de Nord","europei de sud":"Europa de Sud","europei de vest":"Europa de Vest","europeii":"europeu","europeismul":"europeism","europeismule":"europeism","europeismului":"europeism","europence":"europeancă","europencei":"europeancă","europencele":"europeancă","europencelor":"europeancă","europene":["europene","european","europene","europeană"],"europeneasca":["europenească","europenesc","europeneasca","europenesc"],"europenei":"europeană","europenele":["europenele","european","europenele","europeană"],"europenelor":"europeană","europenescul":"europenesc","europenesti":"europenesc","europenestii":"europenesc","europenestile":"europenesc","europeni":"european","europenii":"european","europenilor":"european","europenizai":"europeniza","europenizam":["europenizăm","europeniza","europenizam","europeniza"],"europenizand":"europeniza","europenizara":"europeniza","europenizaram":"europeniza","europenizarati":"europeniza","europenizarea":"europenizare","europenizari":"europenizare","europenizarii":"europenizare","europenizase":"europeniza","europenizasem":"europeniza","europenizasera":"europeniza","europenizaseram":"europeniza","europenizaserati":"europeniza","europenizasesi":"europeniza","europenizasi":"europeniza","europenizat":"europeniza","europenizata":["europenizată","europenizat","europenizata","europenizat"],"europenizate":"europenizat","europenizatele":"europenizat","europenizati":["europenizați","europeniza","europenizați","europenizat"],"europenizatii":"europenizat","europenizatul":"europenizat","europenizau":"europeniza","europenizeaza":"europeniza","europenizez":"europeniza","europenizezi":"europeniza","europescul":"europesc","europesti":"europesc","europestii":"europesc","europestile":"europesc","europeul":"europeu","europiul":"europiu","europiule":"europiu","europiului":"europiu","eurosceptici":"eurosceptic","euroscepticii":"eurosceptic","euroscepticilor":"eurosceptic","euroscepticul":"eurosceptic","euroscepticule":"eurosceptic","euroscepticului":"eurosceptic","euroul":"euro","euroule":"euro","euroului":"euro","eurovisionul":"Eurovision","eurovisionule":"Eurovision","eurovisionului":"Eurovision","eustatica":["eustatică","eustatic","eustatica","eustatic"],"eustatice":"eustatic","eustaticele":"eustatic","eustatici":"eustatic","eustaticii":"eustatic","eustaticul":"eustatic","eustatisme":"eustatism","eustatismele":"eustatism","eustatismelor":"eustatism","eustatismul":"eustatism","eustatismule":"eustatism","eustatismului":"eustatism","eustilul":"eustil","eustilule":"eustil","eustilului":"eustil","eustiluri":"eustil","eustilurile":"eustil","eustilurilor":"eustil","eutanasia":"eutanasie","eutanasiai":"eutanasia","eutanasiam":"eutanasia","eutanasiara":"eutanasia","eutanasiaram":"eutanasia","eutanasiarati":"eutanasia","eutanasiase":"eutanasia","eutanasiasem":"eutanasia","eutanasiasera":"eutanasia","eutanasiaseram":"eutanasia","eutanasiaserati":"eutanasia","eutanasiasesi":"eutanasia","eutanasiasi":"eutanasia","eutanasiat":"eutanasia","eutanasiati":"eutanasia","eutanasiau":"eutanasia","eutanasiaza":"eutanasia","eutanasie":"eutanasia","eutanasiei":"eutanasie","eutanasiem":"eutanasia","eutanasierea":"eutanasiere","eutanasieri":"eutanasiere","eutanasierii":"eutanasiere","eutanasiez":"eutanasia","eutanasiezi":"eutanasia","eutanasii":"eutanasie","eutanasiile":"eutanasie","eutanasiilor":"eutanasie","eutanasiind":"eutanasia","eutectica":["eutectică","eutectic","eutectica","eutectic"],"eutectice":"eutectic","eutecticele":"eutectic","eutectici":"eutectic","eutecticii":"eutectic","eutecticul":"eutectic","eutectoide":"eutectoid","eutectoidele":"eutectoid","eutectoidelor":"eutectoid","eutectoidul":"eutectoid","eutectoidule":"eutectoid","eutectoidului":"eutectoid","eutexia":"eutexie","eutexiei":"eutexie","eutexii":"eutexie","eutexiile":"eutexie","eutexiilor":"eutexie","euthanasie":"eutanasie","eutimia":"eutimie","eutimiei":"eutimie","eutimii":"eutimie","eutimiile":"eutimie","eutimiilor":"eutimie","eutocia":"eutocie","eutocica":["eutocică","eutocic","eutocica","eutocic"],"eutocice":"eutocic"};
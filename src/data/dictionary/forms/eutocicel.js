@@ -0,0 +1 @@
+export default {"eutocicele":"eutocic","eutocici":"eutocic","eutocicii":"eutocic","eutocicul":"eutocic","eutociei":"eutocie","eutocii":"eutocie","eutociile":"eutocie","eutociilor":"eutocie","eutrofa":["eutrofă","eutrof","eutrofa","eutrof"],"eutrofe":"eutrof","eutrofele":"eutrof","eutrofi":"eutrof","eutrofia":"eutrofie","eutrofica":["eutrofică","eutrofic","eutrofica","eutrofic"],"eutrofice":"eutrofic","eutroficele":"eutrofic","eutrofici":"eutrofic","eutroficii":"eutrofic","eutroficul":"eutrofic","eutrofiei":"eutrofie","eutrofii":["eutrofii","eutrof","eutrofii","eutrofie"],"eutrofiile":"eutrofie","eutrofiilor":"eutrofie","eutroful":"eutrof","euxenite":"euxenit","euxenitele":"euxenit","euxenitelor":"euxenit","euxenitul":"euxenit","euxenitule":"euxenit","euxenitului":"euxenit","evacuabila":["evacuabilă","evacuabil","evacuabila","evacuabil"],"evacuabile":"evacuabil","evacuabilele":"evacuabil","evacuabili":"evacuabil","evacuabilii":"evacuabil","evacuabilul":"evacuabil","evacuai":"evacua","evacuam":["evacuăm","evacua","evacuam","evacua"],"evacuand":"evacua","evacuara":"evacua","evacuaram":"evacua","evacuarati":"evacua","evacuari":"evacuare","evacuase":"evacua","evacuasem":"evacua","evacuasera":"evacua","evacuaseram":"evacua","evacuaserati":"evacua","evacuasesi":"evacua","evacuasi":"evacua","evacuat":"evacua","evacuata":["evacuată","evacuat","evacuata","evacuat"],"evacuate":"evacuat","evacuatele":"evacuat","evacuati":["evacuați","evacua","evacuați","evacuat"],"evacuatia":"evacuație","evacuatiei":"evacuație","evacuatii":["evacuații","evacuat","evacuații","evacuație"],"evacuatiile":"evacuație","evacuatiilor":"evacuație","evacuatiunea":"evacuațiune","evacuatiuni":"evacuațiune","evacuatiunii":"evacuațiune","evacuatiunile":"evacuațiune","evacuatiunilor":"evacuațiune","evacuatoare":"evacuator","evacuatoarea":"evacuator","evacuatoarele":"evacuator","evacuatori":"evacuator","evacuatorii":"evacuator","evacuatorile":"evacuator","evacuatorilor":"evacuator","evacuatorul":"evacuator","evacuatorule":"evacuator","evacuatorului":"evacuator","evacuatul":"evacuat","evacuau":"evacua","evacueaza":"evacua","evacuez":"evacua","evacuezi":"evacua","evadai":"evada","evadam":["evadăm","evada","evadam","evada"],"evadand":"evada","evadara":"evada","evadaram":"evada","evadarati":"evada","evadarea":"evadare","evadari":"evadare","evadarii":"evadare","evadarile":"evadare","evadarilor":"evadare","evadase":"evada","evadasem":"evada","evadasera":"evada","evadaseram":"evada","evadaserati":"evada","evadasesi":"evada","evadasi":"evada","evadat":"evada","evadata":["evadată","evadat","evadata","evadat"],"evadate":"evadat","evadatele":"evadat","evadati":["evadați","evada","evadați","evadat"],"evadatii":"evadat","evadatul":"evadat","evadau":"evada","evadeaza":"evada","evadez":"evada","evadezi":"evada","evaluabila":["evaluabilă","evaluabil","evaluabila","evaluabil"],"evaluabile":"evaluabil","evaluabilele":"evaluabil","evaluabili":"evaluabil","evaluabilii":"evaluabil","evaluabilul":"evaluabil","evaluai":"evalua","evaluam":["evaluăm","evalua","evaluam","evalua"],"evaluand":"evalua","evaluara":"evalua","evaluaram":"evalua","evaluarati":"evalua","evaluarea":"evaluare","evaluari":"evaluare","evaluarii":"evaluare","evaluarile":"evaluare","evaluarilor":"evaluare","evaluase":"evalua","evaluasem":"evalua","evaluasera":"evalua","evaluaseram":"evalua","evaluaserati":"evalua","evaluasesi":"evalua","evaluasi":"evalua","evaluat":"evalua","evaluata":["evaluată","evaluat","evaluata","evaluat"],"evaluate":"evaluat","evaluatele":"evaluat","evaluati":["evaluați","evalua","evaluați","evaluat"],"evaluatia":"evaluație","evaluatiei":"evaluație","evaluatii":["evaluații","evaluat","evaluații","evaluație"],"evaluatiile":"evaluație","evaluatiilor":"evaluație","evaluativa":["evaluativă","evaluativ","evaluativa","evaluativ"],"evaluative":"evaluativ","evaluativele":"evaluativ","evaluativi":"evaluativ","evaluativii":"evaluativ","evaluativul":"evaluativ","evaluatul":"evaluat","evaluau":"evalua","evalueaza":"evalua","evaluez":"evalua","evaluezi":"evalua","evanescenta":["evanescentă","evanescent","evanescenta","evanescent"],"evanescente":["evanescente","evanescent","evanescențe","evanescență"],"evanescentei":"evanescență","evanescentele":["evanescentele","evanescent","evanescențele","evanescență"],"evanescentelor":"evanescență","evanescenti":"evanescent","evanescentii":"evanescent","evanescentul":"evanescent","evangelica":["evangelică","evangelic","evangelica","evangelic"],"evangelice":"evangelic","evangelicele":"evangelic","evangelici":"evangelic","evangelicii":"evangelic","evangelicul":"evangelic","evanghelia":"evanghelie","evangheliare":"evangheliar","evangheliarele":"evangheliar","evangheliarelor":"evangheliar","evangheliarul":"evangheliar","evangheliarule":"evangheliar","evangheliarului":"evangheliar","evanghelica":["evanghelică","evanghelic","evanghelica","evanghelic"],"evanghelice":"evanghelic","evangheliceasca":["evanghelicească","evanghelicesc","evangheliceasca","evanghelicesc"],"evanghelicele":"evanghelic","evanghelicescul":"evanghelicesc","evanghelicesti":"evanghelicesc","evanghelicestii":"evanghelicesc","evanghelicestile":"evanghelicesc","evanghelici":"evanghelic","evanghelicii":"evanghelic","evanghelicul":"evanghelic","evangheliei":"evanghelie","evanghelii":"evanghelie","evangheliile":"evanghelie","evangheliilor":"evanghelie","evanghelisirea":"evanghelisire","evanghelisiri":"evanghelisire","evanghelisirii":"evanghelisire","evanghelisirile":"evanghelisire","evanghelisirilor":"evanghelisire","evanghelismul":"evanghelism","evanghelismule":"evanghelism","evanghelismului":"evanghelism","evanghelisti":"evanghelist","evanghelistii":"evanghelist","evanghelistilor":"evanghelist","evanghelistul":"evanghelist","evanghelistule":"evanghelist","evanghelistului":"evanghelist","evanghelizai":"evangheliza","evanghelizam":["evanghelizăm","evangheliza","evanghelizam","evangheliza"],"evanghelizand":"evangheliza","evanghelizara":"evangheliza","evanghelizaram":"evangheliza","evanghelizarati":"evangheliza","evanghelizarea":"evanghelizare","evanghelizari":"evanghelizare","evanghelizarii":"evanghelizare","evanghelizarile":"evanghelizare","evanghelizarilor":"evanghelizare","evanghelizase":"evangheliza","evanghelizasem":"evangheliza","evanghelizasera":"evangheliza","evanghelizaseram":"evangheliza","evanghelizaserati":"evangheliza","evanghelizasesi":"evangheliza","evanghelizasi":"evangheliza","evanghelizat":"evangheliza","evanghelizati":"evangheliza","evanghelizatoare":"evanghelizator","evanghelizatoarea":"evanghelizator","evanghelizatoarele":"evanghelizator","evanghelizatori":"evanghelizator","evanghelizatorii":"evanghelizator","evanghelizatorilor":"evanghelizator","evanghelizatorul":"evanghelizator","evanghelizatorule":"evanghelizator","evanghelizatorului":"evanghelizator","evanghelizau":"evangheliza","evanghelizeaza":"evangheliza","evanghelizez":"evangheliza","evanghelizezi":"evangheliza","evantaie":"evantai","evantaiele":"evantai","evantaielor":"evantai","evantaiul":"evantai","evantaiule":"evantai","evantaiului":"evantai","evantalii":"evantaliu","evantaliile":"evantaliu","evantaliilor":"evantaliu","evantaliuul":"evantaliu","evantaliuule":"evantaliu","evantaliuului":"evantaliu","evapor":"evapora","evaporabila":["evaporabilă","evaporabil","evaporabila","evaporabil"],"evaporabile":"evaporabil","evaporabilele":"evaporabil","evaporabili":"evaporabil","evaporabilii":"evaporabil","evaporabilul":"evaporabil","evaporai":"evapora","evaporam":["evaporăm","evapora","evaporam","evapora"],"evaporand":"evapora","evaporara":"evapora","evaporaram":"evapora","evaporarati":"evapora","evaporarea":"evaporare","evaporari":"evaporare","evaporarii":"evaporare","evaporarile":"evaporare","evaporarilor":"evaporare","evaporase":"evapora","evaporasem":"evapora","evaporasera":"evapora","evaporaseram":"evapora","evaporaserati":"evapora","evaporasesi":"evapora","evaporasi":"evapora","evaporat":"evapora","evaporata":["evaporată","evaporat","evaporata","evaporat"],"evaporate":"evaporat","evaporatele":"evaporat","evaporati":["evaporați","evapora","evaporați","evaporat"],"evaporatia":"evaporație","evaporatiei":"evaporație","evaporatii":["evaporații","evaporat","evaporații","evaporație"],"evaporatiile":"evaporație","evaporatiilor":"evaporație","evaporatiunea":"evaporațiune","evaporatiuni":"evaporațiune","evaporatiunii":"evaporațiune","evaporatiunile":"evaporațiune","evaporatiunilor":"evaporațiune","evaporatul":"evaporat","evaporau":"evapora","evapori":"evapora","evaporimetre":"evaporimetru","evaporimetrele":"evaporimetru","evaporimetrelor":"evaporimetru","evaporimetrul":"evaporimetru","evaporimetrule":"evaporimetru","evaporimetrului":"evaporimetru","evazai":"evaza","evazam":["evazăm","evaza","evazam","evaza"],"evazand":"evaza","evazara":"evaza","evazaram":"evaza","evazarati":"evaza","evazase":"evaza","evazasem":"evaza","evazasera":"evaza","evazaseram":"evaza","evazaserati":"evaza","evazasesi":"evaza","evazasi":"evaza","evazat":"evaza","evazati":"evaza","evazau":"evaza","evazeaza":"evaza","evazez":"evaza","evazezi":"evaza","evazionisme":"evazionism","evazionismei":"evazionism","evazionismelor":"evazionism","evazionismul":"evazionism","evazionismule":"evazionism","evazionismului":"evazionism","evazioniste":"evazionistă","evazionistei":"evazionistă","evazionistele":"evazionistă","evazionistelor":"evazionistă","evazionisti":["evazioniști","evazionist","evazionisti","evazionist"],"evazionistii":"evazionist","evazionistilor":"evazionist","evazionistul":"evazionist","evazionistule":"evazionist","evazionistului":"evazionist","evaziunea":"evaziune","evaziuni":"evaziune","evaziunii":"evaziune","evaziunile":"evaziune","evaziunilor":"evaziune","evaziva":["evazivă","evaziv","evaziva","evaziv"],"evazive":"evaziv","evazivele":"evaziv","evazivi":"evaziv","evazivii":"evaziv","evazivitatati":"evazivitate","evazivitatatii":"evazivitate","evazivitatatile":"evazivitate","evazivitatatilor":"evazivitate","evazivitatea":"evazivitate","evazivul":"evaziv","evdemoni":"evdemon","evdemonii":"evdemon","evdemonilor":"evdemon","evdemonul":"evdemon","evdemonule":"evdemon","evdemonului":"evdemon","evectiunea":"evecțiune","evectiuni":"evecțiune","evectiunii":"evecțiune","evectiunile":"evecțiune","evectiunilor":"evecțiune","evenea":"eveni","eveneai":"eveni","eveneam":"eveni","eveneasca":"eveni","eveneati":"eveni","eveneau":"eveni","evenesc":"eveni","eveneste":"eveni","evenesti":"eveni","evenii":"eveni","evenim":"eveni","evenimente":"eveniment","evenimentele":"eveniment","evenimentelor":"eveniment","evenimentiala":["evenimențială","evenimențial","evenimențiala","evenimențial"],"evenimentiale":"evenimențial","evenimentialele":"evenimențial","evenimentiali":"evenimențial","evenimentialii":"evenimențial","evenimentialul":"evenimențial","evenimentul":"eveniment","evenimentule":"eveniment","evenimentului":"eveniment","evenind":"eveni","evenira":"eveni","eveniram":"eveni","evenirati":"eveni","evenirea":"evenire","eveniri":"evenire","evenirii":"evenire","evenirile":"evenire","evenirilor":"evenire","evenise":"eveni","evenisem":"eveni","evenisera":"eveni","eveniseram":"eveni","eveniserati":"eveni","evenisesi":"eveni","evenisi":"eveni","evenit":"eveni","eveniti":"eveni","eventiva":["eventivă","eventiv","eventiva","eventiv"],"eventive":"eventiv","eventivele":"eventiv","eventivi":"eventiv","eventivii":"eventiv","eventivul":"eventiv","eventratia":"eventrație","eventratiei":"eventrație","eventratii":"eventrație","eventratiile":"eventrație","eventratiilor":"eventrație","eventuala":["eventuală","eventual","eventuala","eventual"],"eventuale":"eventual","eventualele":"eventual","eventuali":"eventual","eventualii":"eventual","eventualitatea":"eventualitate","eventualitati":"eventualitate","eventualitatii":"eventualitate","eventualitatile":"eventualitate","eventualitatilor":"eventualitate","eventualul":"eventual","everghesia":"everghesie","everghesiei":"everghesie","everghesii":"everghesie","everghesiile":"everghesie","everghesiilor":"everghesie","evergheti":"everghet","everghetii":"everghet","everghetilor":"everghet","everghetul":"everghet","everghetule":"everghet","everghetului":"everghet","eversiunea":"eversiune","eversiuni":"eversiune","eversiunii":"eversiune","eversiunile":"eversiune","eversiunilor":"eversiune","evghenia":"evghenie","evgheniceasca":["evghenicească","evghenicesc","evgheniceasca","evghenicesc"],"evghenicescul":"evghenicesc","evghenicesti":"evghenicesc","evghenicestii":"evghenicesc","evghenicestile":"evghenicesc","evghenicoasa":["evghenicoasă","evghenicos","evghenicoasa","evghenicos"],"evghenicoase":"evghenicos","evghenicoasele":"evghenicos","evghenicosi":"evghenicos","evghenicosii":"evghenicos","evghenicosul":"evghenicos","evgheniei":"evghenie","evghenii":"evghenie","evgheniile":"evghenie","evgheniilor":"evghenie","evghenisea":"evghenisi","evgheniseai":"evghenisi","evgheniseam":"evghenisi","evgheniseati":"evghenisi","evgheniseau":"evghenisi","evghenisesc":"evghenisi","evgheniseste":"evghenisi","evghenisesti":"evghenisi","evghenisii":"evghenisi","evghenisim":"evghenisi","evghenisind":"evghenisi","evghenisira":"evghenisi","evghenisiram":"evghenisi","evghenisirati":"evghenisi","evghenisirea":"evghenisire","evghenisiri":"evghenisire","evghenisirii":"evghenisire","evghenisirile":"evghenisire","evghenisirilor":"evghenisire","evghenisise":"evghenisi","evghenisisem":"evghenisi","evghenisisera":"evghenisi","evghenisiseram":"evghenisi","evghenisiserati":"evghenisi","evghenisisesi":"evghenisi","evghenisisi":"evghenisi","evghenisit":"evghenisi","evghenisita":["evghenisită","evghenisit","evghenisita","evghenisit"],"evghenisite":"evghenisit","evghenisitele":"evghenisit","evghenisiti":["evghenisiți","evghenisi","evghenisiți","evghenisit"],"evghenisitii":"evghenisit","evghenisitul":"evghenisit","evghenista":["evghenistă","evghenist","evghenista","evghenist"],"evgheniste":"evghenist","evghenistele":"evghenist","evghenisti":"evghenist","evghenistii":"evghenist","evghenistul":"evghenist","evghenisul":"evghenis","evghenisule":"evghenis","evghenisului":"evghenis","evghenitatea":"evghenitate","evghenitati":"evghenitate","evghenitatii":"evghenitate","evghenitatile":"evghenitate","evghenitatilor":"evghenitate","evgheniti":"evghenit","evghenitii":"evghenit","evghenitilor":"evghenit","evghenitul":"evghenit","evghenitule":"evghenit","evghenitului":"evghenit","evglotia":"evglotie","evglotiei":"evglotie","evglotii":"evglotie","evglotiile":"evglotie","evglotiilor":"evglotie","evgnomosinea":"evgnomosine","evgnomosini":"evgnomosine","evgnomosinii":"evgnomosine","evgnomosinile":"evgnomosine","evgnomosinilor":"evgnomosine","evhemerismul":"evhemerism","evhemerismule":"evhemerism","evhemerismului":"evhemerism","evictiunea":"evicțiune","evictiuni":"evicțiune","evictiunii":"evicțiune","evictiunile":"evicțiune","evictiunilor":"evicțiune","evidenta":["evidentă","evident","evidenta","evident"],"evidente":["evidente","evident","evidențe","evidență"],"evidentei":"evidență","evidentele":["evidentele","evident","evidențele","evidență"],"evidentelor":"evidență","evidenti":"evident","evidentiai":"evidenția","evidentiam":"evidenția","evidentiara":"evidenția","evidentiaram":"evidenția","evidentiarati":"evidenția","evidentiase":"evidenția","evidentiasem":"evidenția","evidentiasera":"evidenția","evidentiaseram":"evidenția","evidentiaserati":"evidenția","evidentiasesi":"evidenția","evidentiasi":"evidenția","evidentiat":"evidenția","evidentiata":["evidențiată","evidențiat","evidențiata","evidențiat"],"evidentiate":"evidențiat","evidentiatele":"evidențiat","evidentiati":["evidențiați","evidenția","evidențiați","evidențiat"],"evidentiatii":"evidențiat","evidentiatul":"evidențiat","evidentiau":"evidenția","evidentiaza":"evidenția","evidentie":"evidenția","evidentieaza":"evidenția","evidentiem":"evidenția","evidentierea":"evidențiere","evidentieri":"evidențiere","evidentierii":"evidențiere","evidentierile":"evidențiere","evidentierilor":"evidențiere","evidentiez":"evidenția","evidentiezi":"evidenția","evidentii":"evident","evidentiind":"evidenția","evidentul":"evident","eving":"evinge","evinga":"evinge","evingand":"evinge","evingea":"evinge","evingeai":"evinge","evingeam":"evinge","evingeati":"evinge","evingeau":"evinge","evingem":"evinge","evingeti":"evinge","evingi":"evinge","evins":"evinge","evinse":"evinge","evinsei":"evinge","evinsera":"evinge","evinseram":"evinge","evinserati":"evinge","evinsese":"evinge","evinsesem":"evinge","evinsesera":"evinge","evinseseram":"evinge","evinseserati":"evinge","evinsesesi":"evinge","evinsesi":"evinge","eviratia":"evirație","eviratiei":"evirație","eviratii":"evirație","eviratiile":"evirație","eviratiilor":"evirație","eviscerai":"eviscera","evisceram":["eviscerăm","eviscera","evisceram","eviscera"],"eviscerand":"eviscera","eviscerara":"eviscera","evisceraram":"eviscera","eviscerarati":"eviscera","eviscerarea":"eviscerare","eviscerari":"eviscerare","eviscerarii":"eviscerare","eviscerarile":"eviscerare","eviscerarilor":"eviscerare","eviscerase":"eviscera","eviscerasem":"eviscera","eviscerasera":"eviscera","evisceraseram":"eviscera","evisceraserati":"eviscera","eviscerasesi":"eviscera","eviscerasi":"eviscera","eviscerat":"eviscera","eviscerata":["eviscerată","eviscerat","eviscerata","eviscerat"],"eviscerate":"eviscerat","evisceratele":"eviscerat","eviscerati":["eviscerați","eviscera","eviscerați","eviscerat"],"evisceratii":"eviscerat","evisceratul":"eviscerat","eviscerau":"eviscera","eviscereaza":"eviscera","eviscerez":"eviscera","eviscerezi":"eviscera","evit":"evita","evitabila":["evitabilă","evitabil","evitabila","evitabil"],"evitabile":"evitabil","evitabilele":"evitabil","evitabili":"evitabil","evitabilii":"evitabil","evitabilitatea":"evitabilitate","evitabilitati":"evitabilitate","evitabilitatii":"evitabilitate","evitabilitatile":"evitabilitate","evitabilitatilor":"evitabilitate","evitabilul":"evitabil","evitai":"evita","evitam":["evităm","evita","evitam","evita"],"evitand":"evita","evitara":"evita","evitaram":"evita","evitarati":"evita","evitarea":"evitare","evitari":"evitare","evitarii":"evitare","evitarile":"evitare","evitarilor":"evitare","evitase":"evita","evitasem":"evita","evitasera":"evita","evitaseram":"evita","evitaserati":"evita","evitasesi":"evita","evitasi":"evita","evitat":"evita","evitati":"evita","evitatia":"evitație","evitatiei":"evitație","evitatii":"evitație","evitatiile":"evitație","evitatiilor":"evitație","evitau":"evita","evite":"evita","eviti":"evita","evlavia":"evlavie","evlaviei":"evlavie","evlavii":"evlavie","evlaviile":"evlavie","evlaviilor":"evlavie","evlavioasa":["evlavioasă","evlavios","evlavioasa","evlavios"],"evlavioase":"evlavios","evlavioasele":"evlavios","evlaviosi":"evlavios","evlaviosii":"evlavios","evlaviosul":"evlavios","evlavnica":["evlavnică","evlavnic","evlavnica","evlavnic"],"evlavnice":"evlavnic","evlavnicele":"evlavnic","evlavnici":"evlavnic","evlavnicii":"evlavnic","evlavnicul":"evlavnic","evmenia":"evmenie","evmeniei":"evmenie","evmenii":"evmenie","evoc":"evoca","evocabila":["evocabilă","evocabil","evocabila","evocabil"],"evocabile":"evocabil","evocabilele":"evocabil","evocabili":"evocabil","evocabilii":"evocabil","evocabilul":"evocabil","evocai":"evoca","evocam":["evocăm","evoca","evocam","evoca"],"evocand":"evoca","evocanta":["evocantă","evocant","evocanta","evocant"],"evocante":"evocant","evocantele":"evocant","evocanti":"evocant","evocantii":"evocant","evocantul":"evocant","evocara":"evoca","evocaram":"evoca","evocarati":"evoca","evocarea":"evocare","evocari":"evocare","evocarii":"evocare","evocarile":"evocare","evocarilor":"evocare","evocase":"evoca","evocasem":"evoca","evocasera":"evoca","evocaseram":"evoca","evocaserati":"evoca","evocasesi":"evoca","evocasi":"evoca","evocat":"evoca","evocata":["evocată","evocat","evocata","evocat"],"evocate":"evocat","evocatele":"evocat","evocati":["evocați","evoca","evocați","evocat"],"evocatia":"evocație","evocatiei":"evocație","evocatii":["evocații","evocat","evocații","evocație"],"evocatiile":"evocație","evocatiilor":"evocație","evocatiunea":"evocațiune","evocatiuni":"evocațiune","evocatiunii":"evocațiune","evocatiunile":"evocațiune","evocatiunilor":"evocațiune","evocativa":["evocativă","evocativ","evocativa","evocativ"],"evocative":"evocativ","evocativele":"evocativ","evocativi":"evocativ","evocativii":"evocativ","evocativul":"evocativ","evocatoare":"evocator","evocatoarea":"evocator","evocatoarele":"evocator","evocatori":"evocator","evocatorii":"evocator","evocatorul":"evocator","evocatul":"evocat","evocau":"evoca","evoce":"evoca","evoci":"evoca","evoluabila":["evoluabilă","evoluabil","evoluabila","evoluabil"],"evoluabile":"evoluabil","evoluabilele":"evoluabil","evoluabili":"evoluabil","evoluabilii":"evoluabil","evoluabilul":"evoluabil","evoluai":"evolua","evoluam":["evoluăm","evolua","evoluam","evolua"],"evoluand":"evolua","evoluara":"evolua","evoluaram":"evolua","evoluarati":"evolua","evoluarea":"evoluare","evoluari":"evoluare","evoluarii":"evoluare","evoluarile":"evoluare","evoluarilor":"evoluare","evoluase":"evolua","evoluasem":"evolua","evoluasera":"evolua","evoluaseram":"evolua","evoluaserati":"evolua","evoluasesi":"evolua","evoluasi":"evolua","evoluat":"evolua","evoluata":["evoluată","evoluat","evoluata","evoluat"],"evoluate":"evoluat","evoluatele":"evoluat","evoluati":["evoluați","evolua","evoluați","evoluat"],"evoluatii":"evoluat","evoluatul":"evoluat","evoluau":"evolua","evolueaza":"evolua","evoluez":"evolua","evoluezi":"evolua","evolutia":"evoluție","evolutiei":"evoluție","evolutii":"evoluție","evolutiile":"evoluție","evolutiilor":"evoluție","evolutionara":["evoluționară","evoluționar","evoluționara","evoluționar"],"evolutionare":"evoluționar","evolutionarele":"evoluționar","evolutionari":"evoluționar","evolutionarii":"evoluționar","evolutionarul":"evoluționar","evolutioniste":"evoluționistă","evolutionistei":"evoluționistă","evolutionistele":"evoluționistă","evolutionistelor":"evoluționistă","evolutionisti":"evoluționist","evolutionistii":"evoluționist","evolutionistilor":"evoluționist","evolutionistul":"evoluționist","evolutionistule":"evoluționist","evolutionistului":"evoluționist","evolutiunea":"evoluțiune","evolutiuni":"evoluțiune","evolutiunii":"evoluțiune","evolutiunile":"evoluțiune","evolutiunilor":"evoluțiune","evolutiva":["evolutivă","evolutiv","evolutiva","evolutiv"],"evolutive":"evolutiv","evolutivele":"evolutiv","evolutivi":"evolutiv","evolutivii":"evolutiv","evolutivul":"evolutiv","evrei":"evreu","evreiasca":["evreiască","evreiesc","evreiasca","evreiesc"],"evreice":"evreică","evreicei":"evreică","evreicele":"evreică","evreicelor":"evreică","evreicute":"evreicuță","evreicutei":"evreicuță","evreicutele":"evreicuță","evreicutelor":"evreicuță","evreiescul":"evreiesc","evreiesti":"evreiesc","evreiestii":"evreiesc","evreiestile":"evreiesc","evreii":"evreu","evreilor":"evreu","evreimea":"evreime","evreimi":"evreime","evreimii":"evreime","evreismul":"evreism","evreismule":"evreism","evreismului":"evreism","evreul":"evreu","evreule":"evreu","evreului":"evreu","evropaiceasca":["evropaicească","evropaicesc","evropaiceasca","evropaicesc"],"evropaicescul":"evropaicesc","evropaicesti":"evropaicesc","evropaicestii":"evropaicesc","evropaicestile":"evropaicesc","evsevia":"evsevie","evseviei":"evsevie","evsevii":"evsevie","evul":"ev","evule":"ev","evulsia":"evulsie","evulsiei":"evulsie","evulsii":"evulsie","evulsiile":"evulsie","evulsiilor":"evulsie","evulsiunea":"evulsiune","evulsiuni":"evulsiune","evulsiunii":"evulsiune","evulsiunile":"evulsiune","evulsiunilor":"evulsiune","evului":"ev","evuri":"ev","evurile":"ev","evurilor":"ev","ex-campioane":"ex-campioană","ex-campioanei":"ex-campioană","ex-campioanele":"ex-campioană","ex-campioanelor":"ex-campioană","ex-campioni":"ex-campion","ex-campionii":"ex-campion","ex-campionilor":"ex-campion","ex-campionul":"ex-campion","ex-campionule":"ex-campion","ex-campionului":"ex-campion","ex-comunista":["ex-comunistă","ex-comunist","ex-comunista","ex-comunist"],"ex-comuniste":"ex-comunist","ex-comunistele":"ex-comunist","ex-comunisti":"ex-comunist","ex-comunistii":"ex-comunist","ex-comunistul":"ex-comunist","ex-librisul":"ex-libris","ex-librisule":"ex-libris","ex-librisului":"ex-libris","ex-librisuri":"ex-libris","ex-librisurile":"ex-libris","ex-librisurilor":"ex-libris","ex-ministri":"ex-ministru","ex-ministrii":"ex-ministru","ex-ministrilor":"ex-ministru","ex-ministrul":"ex-ministru","ex-ministrule":"ex-ministru","ex-ministrului":"ex-ministru","ex-presedinteul":"ex-președinte","ex-presedinteule":"ex-președinte","ex-presedinteului":"ex-președinte","ex-presedinti":"ex-președinte","ex-presedintii":"ex-președinte","ex-presedintilor":"ex-președinte","exacerbai":"exacerba","exacerbam":["exacerbăm","exacerba","exacerbam","exacerba"],"exacerband":"exacerba","exacerbara":"exacerba","exacerbaram":"exacerba","exacerbarati":"exacerba","exacerbarea":"exacerbare","exacerbari":"exacerbare","exacerbarii":"exacerbare","exacerbarile":"exacerbare","exacerbarilor":"exacerbare","exacerbase":"exacerba","exacerbasem":"exacerba","exacerbasera":"exacerba","exacerbaseram":"exacerba","exacerbaserati":"exacerba","exacerbasesi":"exacerba","exacerbasi":"exacerba","exacerbat":"exacerba","exacerbata":["exacerbată","exacerbat","exacerbata","exacerbat"],"exacerbate":"exacerbat","exacerbatele":"exacerbat","exacerbati":["exacerbați","exacerba","exacerbați","exacerbat"],"exacerbatia":"exacerbație","exacerbatiei":"exacerbație","exacerbatii":["exacerbații","exacerbat","exacerbații","exacerbație"],"exacerbatiile":"exacerbație","exacerbatiilor":"exacerbație","exacerbatiunea":"exacerbațiune","exacerbatiuni":"exacerbațiune","exacerbatiunii":"exacerbațiune","exacerbatiunile":"exacerbațiune","exacerbatiunilor":"exacerbațiune","exacerbatul":"exacerbat","exacerbau":"exacerba","exacerbeaza":"exacerba","exacerbez":"exacerba","exacerbezi":"exacerba","exacta":["exactă","exact","exacta","exact"],"exacte":"exact","exactele":"exact","exacti":"exact","exactii":"exact","exactitatea":"exactitate","exactitati":"exactitate","exactitatii":"exactitate","exactitatile":"exactitate","exactitatilor":"exactitate","exactitudinea":"exactitudine","exactitudini":"exactitudine","exactitudinii":"exactitudine","exactitudinile":"exactitudine","exactitudinilor":"exactitudine","exactul":"exact","exaedre":"exaedru","exagerai":"exagera","exageram":["exagerăm","exagera","exageram","exagera"],"exagerand":"exagera","exagerara":"exagera","exageraram":"exagera","exagerarati":"exagera","exagerarea":"exagerare","exagerari":"exagerare","exagerarii":"exagerare","exagerarile":"exagerare","exagerarilor":"exagerare","exagerase":"exagera","exagerasem":"exagera","exagerasera":"exagera","exageraseram":"exagera","exageraserati":"exagera","exagerasesi":"exagera","exagerasi":"exagera","exagerat":"exagera","exagerata":["exagerată","exagerat","exagerata","exagerat"],"exagerate":"exagerat","exageratele":"exagerat","exagerati":["exagerați","exagera","exagerați","exagerat"],"exageratia":"exagerație","exageratiei":"exagerație","exageratii":["exagerații","exagerat","exagerații","exagerație"],"exageratiile":"exagerație","exageratiilor":"exagerație","exageratiunea":"exagerațiune","exageratiuni":"exagerațiune","exageratiunii":"exagerațiune","exageratiunile":"exagerațiune","exageratiunilor":"exagerațiune","exageratul":"exagerat","exagerau":"exagera","exagereaza":"exagera","exagerez":"exagera","exagerezi":"exagera","exagoane":"exagon","exal":"exala","exalai":"exala","exalam":["exalăm","exala","exalam","exala"],"exaland":"exala","exalara":"exala","exalaram":"exala","exalarati":"exala","exalarea":"exalare","exalari":"exalare","exalarii":"exalare","exalarile":"exalare","exalarilor":"exalare","exalase":"exala","exalasem":"exala","exalasera":"exala","exalaseram":"exala","exalaserati":"exala","exalasesi":"exala","exalasi":"exala","exalat":"exala","exalati":"exala","exalatia":"exalație","exalatiei":"exalație","exalatii":"exalație","exalatiile":"exalație","exalatiilor":"exalație","exalatiunea":"exalațiune","exalatiuni":"exalațiune","exalatiunii":"exalațiune","exalatiunile":"exalațiune","exalatiunilor":"exalațiune","exalau":"exala","exalginaul":"exalgină","exalginaule":"exalgină","exalginaului":"exalgină","exalgine":"exalgină","exalginele":"exalgină","exalginelor":"exalgină","exali":"exala","exalt":"exalta","exaltai":"exalta","exaltam":["exaltăm","exalta","exaltam","exalta"],"exaltand":"exalta","exaltara":"exalta","exaltaram":"exalta","exaltarati":"exalta","exaltarea":"exaltare","exaltari":"exaltare","exaltarii":"exaltare","exaltarile":"exaltare","exaltarilor":"exaltare","exaltase":"exalta","exaltasem":"exalta","exaltasera":"exalta","exaltaseram":"exalta","exaltaserati":"exalta","exaltasesi":"exalta","exaltasi":"exalta","exaltat":"exalta","exaltata":["exaltată","exaltat","exaltata","exaltat"],"exaltate":"exaltat","exaltatele":"exaltat","exaltati":["exaltați","exalta","exaltați","exaltat"],"exaltatia":"exaltație","exaltatiei":"exaltație","exaltatii":["exaltații","exaltat","exaltații","exaltație"],"exaltatiile":"exaltație","exaltatiilor":"exaltație","exaltatiunea":["exaltațiunea","exaltațiune","exaltățiunea","exaltățiune"],"exaltatiuni":["exaltațiuni","exaltațiune","exaltățiuni","exaltățiune"],"exaltatiunii":["exaltațiunii","exaltațiune","exaltățiunii","exaltățiune"],"exaltatiunile":["exaltațiunile","exaltațiune","exaltățiunile","exaltățiune"],"exaltatiunilor":["exaltațiunilor","exaltațiune","exaltățiunilor","exaltățiune"],"exaltatul":"exaltat","exaltau":"exalta","exalte":"exalta","exalti":"exalta","examene":"examen","examene clinice":"examen clinic","examene de admitere":"examen de admitere","examene fizice":"examen fizic","examenele":"examen","examenelor":"examen","examenuirea":"examenuire","examenuiri":"examenuire","examenuirii":"examenuire","examenuirile":"examenuire","examenuirilor":"examenuire","examenuita":["examenuită","examenuit","examenuita","examenuit"],"examenuite":"examenuit","examenuitele":"examenuit","examenuiti":"examenuit","examenuitii":"examenuit","examenuitul":"examenuit","examenul":"examen","examenule":"examen","examenului":"examen","exametri":"exametru","exametru":"hexametru","examinai":"examina","examinaluirea":"examinăluire","examinaluiri":"examinăluire","examinaluirii":"examinăluire","examinaluirile":"examinăluire","examinaluirilor":"examinăluire","examinaluita":["examinăluită","examinăluit","examinăluita","examinăluit"],"examinaluite":"examinăluit","examinaluitele":"examinăluit","examinaluiti":"examinăluit","examinaluitii":"examinăluit","examinaluitul":"examinăluit","examinam":["examinăm","examina","examinam","examina"],"examinand":"examina","examinara":"examina","examinaram":"examina","examinarati":"examina","examinari":"examinare","examinase":"examina","examinasem":"examina","examinasera":"examina","examinaseram":"examina","examinaserati":"examina","examinasesi":"examina","examinasi":"examina","examinat":"examina","examinata":["examinată","examinat","examinata","examinat"],"examinate":"examinat","examinatele":"examinat","examinati":["examinați","examina","examinați","examinat"],"examinatia":"examinație","examinatiei":"examinație","examinatii":["examinații","examinat","examinații","examinație"],"examinatiile":"examinație","examinatiilor":"examinație","examinatoarea":"examinatoare","examinatoarei":"examinatoare","examinatoarele":"examinatoare","examinatoarelor":"examinatoare","examinatori":"examinator","examinatorii":"examinator","examinatorilor":"examinator","examinatorul":"examinator","examinatorule":"examinator","examinatorului":"examinator","examinatul":"examinat","examinau":"examina","examineaza":"examina","examinez":"examina","examinezi":"examina","exanoli":"exanol","exanolii":"exanol","exanolilor":"exanol","exanolul":"exanol","exanolule":"exanol","exanolului":"exanol","exantematica":["exantematică","exantematic","exantematica","exantematic"],"exantematice":"exantematic","exantematicele":"exantematic","exantematici":"exantematic","exantematicii":"exantematic","exantematicul":"exantematic","exantematoasa":["exantematoasă","exantematos","exantematoasa","exantematos"],"exantematoase":"exantematos","exantematoasele":"exantematos","exantematosi":"exantematos","exantematosii":"exantematos","exantematosul":"exantematos","exanteme":"exantem","exantemele":"exantem","exantemelor":"exantem","exantemul":"exantem","exantemule":"exantem","exantemului":"exantem","exarhate":"exarhat","exarhatele":"exarhat","exarhatelor":"exarhat","exarhatul":"exarhat","exarhatule":"exarhat","exarhatului":"exarhat","exarhi":"exarh","exarhia":"exarhie","exarhiei":"exarhie","exarhieria":"exarhierie","exarhieriei":"exarhierie","exarhierii":"exarhierie","exarhieriile":"exarhierie","exarhieriilor":"exarhierie","exarhii":["exarhii","exarh","exarhii","exarhie"],"exarhiile":"exarhie","exarhiilor":"exarhie","exarhilor":"exarh","exarhul":"exarh","exarhule":"exarh","exarhului":"exarh","exarticulatiunea":"exarticulațiune","exarticulatiuni":"exarticulațiune","exarticulatiunii":"exarticulațiune","exarticulatiunile":"exarticulațiune","exarticulatiunilor":"exarticulațiune","exasperai":"exaspera","exasperam":["exasperăm","exaspera","exasperam","exaspera"],"exasperand":"exaspera","exasperanta":["exasperantă","exasperant","exasperanta","exasperant"],"exasperante":"exasperant","exasperantele":"exasperant","exasperanti":"exasperant","exasperantii":"exasperant","exasperantul":"exasperant","exasperara":"exaspera","exasperaram":"exaspera","exasperarati":"exaspera","exasperarea":"exasperare","exasperari":"exasperare","exasperarii":"exasperare","exasperarile":"exasperare","exasperarilor":"exasperare","exasperase":"exaspera","exasperasem":"exaspera","exasperasera":"exaspera","exasperaseram":"exaspera","exasperaserati":"exaspera","exasperasesi":"exaspera","exasperasi":"exaspera","exasperat":"exaspera","exasperata":["exasperată","exasperat","exasperata","exasperat"],"exasperate":"exasperat","exasperatele":"exasperat","exasperati":["exasperați","exaspera","exasperați","exasperat"],"exasperatia":"exasperație","exasperatiei":"exasperație","exasperatii":["exasperații","exasperat","exasperații","exasperație"],"exasperatiile":"exasperație","exasperatiilor":"exasperație","exasperatul":"exasperat","exasperau":"exaspera","exaspereaza":"exaspera","exasperez":"exaspera","exasperezi":"exaspera","exaurienta":["exaurientă","exaurient","exaurienta","exaurient"],"exauriente":"exaurient","exaurientele":"exaurient","exaurienti":"exaurient","exaurientii":"exaurient","exaurientul":"exaurient","excavai":"excava","excavam":["excavăm","excava","excavam","excava"],"excavand":"excava","excavara":"excava","excavaram":"excava","excavarati":"excava","excavarea":"excavare","excavari":"excavare","excavarii":"excavare","excavarile":"excavare","excavarilor":"excavare","excavase":"excava","excavasem":"excava","excavasera":"excava","excavaseram":"excava","excavaserati":"excava","excavasesi":"excava","excavasi":"excava","excavat":"excava","excavata":["excavată","excavat","excavata","excavat"],"excavate":"excavat","excavatele":"excavat","excavati":["excavați","excava","excavați","excavat"],"excavatia":"excavație","excavatiei":"excavație","excavatii":["excavații","excavat","excavații","excavație"],"excavatiile":"excavație","excavatiilor":"excavație","excavatiunea":"excavațiune","excavatiuni":"excavațiune","excavatiunii":"excavațiune","excavatiunile":"excavațiune","excavatiunilor":"excavațiune","excavatoare":"excavator","excavatoarele":"excavator","excavatoarelor":"excavator","excavatoriste":"excavatoristă","excavatoristei":"excavatoristă","excavatoristele":"excavatoristă","excavatoristelor":"excavatoristă","excavatoristi":["excavatoriști","excavatorist","excavatoristi","excavatorist"],"excavatoristii":"excavatorist","excavatoristilor":"excavatorist","excavatoristul":"excavatorist","excavatoristule":"excavatorist","excavatoristului":"excavatorist","excavatorul":"excavator","excavatorule":"excavator","excavatorului":"excavator","excavatul":"excavat","excavau":"excava","excaveaza":"excava","excavez":"excava","excavezi":"excava","excavind":"excavând","excedai":"exceda","excedam":["excedăm","exceda","excedam","exceda"],"excedand":"exceda","excedara":"exceda","excedaram":"exceda","excedarati":"exceda","excedase":"exceda","excedasem":"exceda","excedasera":"exceda","excedaseram":"exceda","excedaserati":"exceda","excedasesi":"exceda","excedasi":"exceda","excedat":"exceda","excedata":["excedată","excedat","excedata","excedat"],"excedate":"excedat","excedatele":"excedat","excedati":["excedați","exceda","excedați","excedat"],"excedatii":"excedat","excedatul":"excedat","excedau":"exceda","excedeaza":"exceda","excedentara":["excedentară","excedentar","excedentara","excedentar"],"excedentare":"excedentar","excedentarele":"excedentar","excedentari":"excedentar","excedentarii":"excedentar","excedentarul":"excedentar","excedente":"excedent","excedentele":"excedent","excedentelor":"excedent","excedentul":"excedent","excedentule":"excedent","excedentului":"excedent","excedez":"exceda","excedezi":"exceda","excelai":"excela","excelam":["excelăm","excela","excelam","excela"],"exceland":"excela","excelara":"excela","excelaram":"excela","excelarati":"excela","excelase":"excela","excelasem":"excela","excelasera":"excela","excelaseram":"excela","excelaserati":"excela","excelasesi":"excela","excelasi":"excela","excelat":"excela","excelati":"excela","excelau":"excela","exceleaza":"excela","excelenta":["excelentă","excelent","excelenta","excelent"],"excelente":["excelente","excelent","excelențe","excelență"],"excelentei":"excelență","excelentele":["excelentele","excelent","excelențele","excelență"],"excelentelor":"excelență","excelenti":"excelent","excelentia":"excelenție","excelentiei":"excelenție","excelentii":["excelenții","excelent","excelenții","excelenție"],"excelentiile":"excelenție","excelentiilor":"excelenție","excelentissima":["excelentissimă","excelentissim","excelentissima","excelentissim"],"excelentissime":"excelentissim","excelentissimele":"excelentissim","excelentissimi":"excelentissim","excelentissimii":"excelentissim","excelentissimul":"excelentissim","excelentul":"excelent","excelez":"excela","excelezi":"excela","excentrica":["excentrică","excentric","excentrica","excentric"],"excentrice":"excentric","excentricele":"excentric","excentrici":"excentric","excentricii":"excentric","excentricitatea":"excentricitate","excentricitati":"excentricitate","excentricitatii":"excentricitate","excentricitatile":"excentricitate","excentricitatilor":"excentricitate","excentricul":"excentric","excepciunea":"excepciune","excepciuni":"excepciune","excepciunii":"excepciune","excepciunile":"excepciune","excepciunilor":"excepciune","excepta":["exceptă","except","excepta","except"],"exceptabila":["exceptabilă","exceptabil","exceptabila","exceptabil"],"exceptabile":"exceptabil","exceptabilele":"exceptabil","exceptabili":"exceptabil","exceptabilii":"exceptabil","exceptabilul":"exceptabil","exceptai":"excepta","exceptam":["exceptăm","excepta","exceptam","excepta"],"exceptand":"excepta","exceptara":"excepta","exceptaram":"excepta","exceptarati":"excepta","exceptarea":"exceptare","exceptarei":"exceptare","exceptase":"excepta","exceptasem":"excepta","exceptasera":"excepta","exceptaseram":"excepta","exceptaserati":"excepta","exceptasesi":"excepta","exceptasi":"excepta","exceptat":"excepta","exceptata":["exceptată","exceptat","exceptata","exceptat"],"exceptate":"exceptat","exceptatele":"exceptat","exceptati":["exceptați","excepta","exceptați","exceptat"],"exceptatii":"exceptat","exceptatul":"exceptat","exceptau":"excepta","excepte":"except","excepteaza":"excepta","exceptele":"except","exceptez":"excepta","exceptezi":"excepta","excepti":"except","exceptia":"excepție","exceptiei":"excepție","exceptii":["excepții","except","excepții","excepție"],"exceptiile":"excepție","exceptiilor":"excepție","exceptionala":["excepțională","excepțional","excepționala","excepțional"],"exceptionale":"excepțional","exceptionalele":"excepțional","exceptionali":"excepțional","exceptionalii":"excepțional","exceptionalitatea":"excepționalitate","exceptionalitati":"excepționalitate","exceptionalitatii":"excepționalitate","exceptionalul":"excepțional","exceptionarea":"excepționare","exceptionari":"excepționare","exceptionarii":"excepționare","exceptionarile":"excepționare","exceptionarilor":"excepționare","exceptiunea":"excepțiune","exceptiuni":"excepțiune","exceptiunii":"excepțiune","exceptiunile":"excepțiune","exceptiunilor":"excepțiune","exceptul":"except","excerptai":"excerpta","excerptam":["excerptăm","excerpta","excerptam","excerpta"],"excerptand":"excerpta","excerptara":"excerpta","excerptaram":"excerpta","excerptarati":"excerpta","excerptase":"excerpta","excerptasem":"excerpta","excerptasera":"excerpta","excerptaseram":"excerpta","excerptaserati":"excerpta","excerptasesi":"excerpta","excerptasi":"excerpta","excerptat":"excerpta","excerptati":"excerpta","excerptau":"excerpta","excerpteaza":"excerpta","excerptez":"excerpta","excerptezi":"excerpta","excese":"exces","excesele":"exces","exceselor":"exces","excesiva":["excesivă","excesiv","excesiva","excesiv"],"excesive":"excesiv","excesivele":"excesiv","excesivi":"excesiv","excesivii":"excesiv","excesivitatea":"excesivitate","excesivitati":"excesivitate","excesivitatii":"excesivitate","excesivitatile":"excesivitate","excesivitatilor":"excesivitate","excesivul":"excesiv","excesul":"exces","excesule":"exces","excesului":"exces","exchiza":["exchiză","exchiz","exchiza","exchiz"],"exchize":"exchiz","exchizele":"exchiz","exchizi":"exchiz","exchizii":"exchiz","exchizul":"exchiz","excipienti":"excipient","excipientile":"excipient","excipientilor":"excipient","excipientul":"excipient","excipientule":"excipient","excipientului":"excipient","excit":"excita","excitabila":["excitabilă","excitabil","excitabila","excitabil"],"excitabile":"excitabil","excitabilele":"excitabil","excitabili":"excitabil","excitabilii":"excitabil","excitabilitatea":"excitabilitate","excitabilitati":"excitabilitate","excitabilitatii":"excitabilitate","excitabilitatile":"excitabilitate","excitabilitatilor":"excitabilitate","excitabilul":"excitabil","excitai":"excita","excitam":["excităm","excita","excitam","excita"],"excitand":"excita","excitanta":["excitantă","excitant","excitanta","excitant"],"excitante":"excitant","excitantele":"excitant","excitanti":"excitant","excitantii":"excitant","excitantul":"excitant","excitara":"excita","excitaram":"excita","excitarati":"excita","excitarea":"excitare","excitari":"excitare","excitarii":"excitare","excitarile":"excitare","excitarilor":"excitare","excitase":"excita","excitasem":"excita","excitasera":"excita","excitaseram":"excita","excitaserati":"excita","excitasesi":"excita","excitasi":"excita","excitat":"excita","excitata":["excitată","excitat","excitata","excitat"],"excitate":"excitat","excitatele":"excitat","excitati":["excitați","excita","excitați","excitat"],"excitatia":"excitație","excitatiei":"excitație","excitatii":["excitații","excitat","excitații","excitație"],"excitatiile":"excitație","excitatiilor":"excitație","excitatiunea":"excitațiune","excitatiuni":"excitațiune","excitatiunii":"excitațiune","excitatiunile":"excitațiune","excitatiunilor":"excitațiune","excitativa":["excitativă","excitativ","excitativa","excitativ"],"excitative":"excitativ","excitativele":"excitativ","excitativi":"excitativ","excitativii":"excitativ","excitativul":"excitativ","excitatoare":"excitator","excitatoarele":"excitator","excitatoarelor":"excitator","excitatorul":"excitator","excitatorule":"excitator","excitatorului":"excitator","excitatul":"excitat","excitau":"excita","excite":"excita","exciti":"excita","excitomotoare":"excitomotor","excitomotoarea":"excitomotor","excitomotoarele":"excitomotor","excitomotori":"excitomotor","excitomotorii":"excitomotor","excitomotorul":"excitomotor","excitroane":"excitron","excitroanele":"excitron","excitroanelor":"excitron","excitronul":"excitron","excitronule":"excitron","excitronului":"excitron","excizai":"exciza","excizam":["excizăm","exciza","excizam","exciza"],"excizand":"exciza","excizara":"exciza","excizaram":"exciza","excizarati":"exciza","excizarea":"excizare","excizari":"excizare","excizarii":"excizare","excizase":"exciza","excizasem":"exciza","excizasera":"exciza","excizaseram":"exciza","excizaserati":"exciza","excizasesi":"exciza","excizasi":"exciza","excizat":"exciza","excizata":["excizată","excizat","excizata","excizat"],"excizate":"excizat","excizatele":"excizat","excizati":["excizați","exciza","excizați","excizat"],"excizatii":"excizat","excizatul":"excizat","excizau":"exciza","excize":"exciză","excizeaza":"exciza","excizei":"exciză","excizele":"exciză","excizelor":"exciză","excizez":"exciza","excizezi":"exciza","excizia":"excizie","exciziei":"excizie","excizii":"excizie","exciziile":"excizie","exciziilor":"excizie","exclam":"exclama","exclamai":"exclama","exclamam":["exclamăm","exclama","exclamam","exclama"],"exclamand":"exclama","exclamara":"exclama","exclamaram":"exclama","exclamarati":"exclama","exclamarea":"exclamare","exclamari":"exclamare","exclamarii":"exclamare","exclamarile":"exclamare","exclamarilor":"exclamare","exclamase":"exclama","exclamasem":"exclama","exclamasera":"exclama","exclamaseram":"exclama","exclamaserati":"exclama","exclamasesi":"exclama","exclamasi":"exclama","exclamat":"exclama","exclamati":"exclama","exclamatia":"exclamație","exclamatiei":"exclamație","exclamatii":"exclamație","exclamatiile":"exclamație","exclamatiilor":"exclamație","exclamatiunea":"exclamațiune","exclamatiuni":"exclamațiune","exclamatiunii":"exclamațiune","exclamatiunile":"exclamațiune","exclamatiunilor":"exclamațiune","exclamativa":["exclamativă","exclamativ","exclamativa","exclamativ"],"exclamative":["exclamative","exclamativ","exclamative","exclamativă"],"exclamativei":"exclamativă","exclamativele":["exclamativele","exclamativ","exclamativele","exclamativă"],"exclamativelor":"exclamativă","exclamativi":"exclamativ","exclamativii":"exclamativ","exclamativul":"exclamativ","exclamau":"exclama","exclame":"exclama","exclami":"exclama","exclud":"exclude","excluda":"exclude","excludea":"exclude","excludeai":"exclude","excludeam":"exclude","excludeati":"exclude","excludeau":"exclude","excludem":"exclude","excluderea":"excludere","excluderi":"excludere","excluderii":"excludere","excluderile":"excludere","excluderilor":"excludere","excludeti":"exclude","exclus":"exclude","exclusa":["exclusă","exclus","exclusa","exclus"],"excluse":["excluse","exclude","excluse","exclus"],"exclusei":"exclude","exclusele":"exclus","exclusera":"exclude","excluseram":"exclude","excluserati":"exclude","exclusese":"exclude","exclusesem":"exclude","exclusesera":"exclude","excluseseram":"exclude","excluseserati":"exclude","exclusesesi":"exclude","exclusesi":"exclude","exclusi":"exclus","exclusii":"exclus","exclusiva":["exclusivă","exclusiv","exclusiva","exclusiv"],"exclusive":"exclusiv","exclusivele":"exclusiv","exclusivi":"exclusiv","exclusivii":"exclusiv","exclusivismul":"exclusivism","exclusivismule":"exclusivism","exclusivismului":"exclusivism","exclusivista":["exclusivistă","exclusivist","exclusivista","exclusivist"],"exclusiviste":"exclusivist","exclusivistele":"exclusivist","exclusivisti":"exclusivist","exclusivistii":"exclusivist","exclusivistul":"exclusivist","exclusivitatea":"exclusivitate","exclusivitati":"exclusivitate","exclusivitatii":"exclusivitate","exclusivul":"exclusiv","exclusul":"exclus","excluzand":"exclude","excluzi":"exclude","excluzia":"excluzie","excluziei":"excluzie","excluzii":"excluzie","excluziile":"excluzie","excluziilor":"excluzie","excluziunea":"excluziune","excluziuni":"excluziune","excluziunii":"excluziune","excluziunile":"excluziune","excluziunilor":"excluziune","excluzivitatea":"excluzivitate","excluzivitati":"excluzivitate","excluzivitatii":"excluzivitate","excluzivitatile":"excluzivitate","excluzivitatilor":"excluzivitate","excogitai":"excogita","excogitam":["excogităm","excogita","excogitam","excogita"],"excogitand":"excogita","excogitara":"excogita","excogitaram":"excogita","excogitarati":"excogita","excogitarea":"excogitare","excogitari":"excogitare","excogitarii":"excogitare","excogitarile":"excogitare","excogitarilor":"excogitare","excogitase":"excogita","excogitasem":"excogita","excogitasera":"excogita","excogitaseram":"excogita","excogitaserati":"excogita","excogitasesi":"excogita","excogitasi":"excogita","excogitat":"excogita","excogitati":"excogita","excogitatia":"excogitație","excogitatiei":"excogitație","excogitatii":"excogitație","excogitatiile":"excogitație","excogitatiilor":"excogitație","excogitau":"excogita","excogiteaza":"excogita","excogitez":"excogita","excogiteze":"excogita","excogitezi":"excogita","excomunic":"excomunica","excomunicai":"excomunica","excomunicam":["excomunicăm","excomunica","excomunicam","excomunica"],"excomunicand":"excomunica","excomunicara":"excomunica","excomunicaram":"excomunica","excomunicarati":"excomunica","excomunicari":"excomunicare","excomunicase":"excomunica","excomunicasem":"excomunica","excomunicasera":"excomunica","excomunicaseram":"excomunica","excomunicaserati":"excomunica","excomunicasesi":"excomunica","excomunicasi":"excomunica","excomunicat":"excomunica","excomunicata":["excomunicată","excomunicat","excomunicata","excomunicat"],"excomunicate":"excomunicat","excomunicatele":"excomunicat","excomunicati":["excomunicați","excomunica","excomunicați","excomunicat"],"excomunicatia":"excomunicație","excomunicatiei":"excomunicație","excomunicatii":["excomunicații","excomunicat","excomunicații","excomunicație"],"excomunicatiile":"excomunicație","excomunicatiilor":"excomunicație","excomunicatul":"excomunicat","excomunicau":"excomunica","excomunici":"excomunica","excoriai":"excoria","excoriam":"excoria","excoriara":"excoria","excoriaram":"excoria","excoriarati":"excoria","excoriase":"excoria","excoriasem":"excoria","excoriasera":"excoria","excoriaseram":"excoria","excoriaserati":"excoria","excoriasesi":"excoria","excoriasi":"excoria","excoriat":"excoria","excoriati":"excoria","excoriatia":"excoriație","excoriatiei":"excoriație","excoriatii":"excoriație","excoriatiile":"excoriație","excoriatiilor":"excoriație","excoriau":"excoria","excoriaza":"excoria","excorie":"excoria","excoriem":"excoria","excorierea":"excoriere","excorieri":"excoriere","excorierii":"excoriere","excorierile":"excoriere","excorierilor":"excoriere","excorii":"excoria","excoriind":"excoria","excorporatia":"excorporație","excorporatiei":"excorporație","excorporatii":"excorporație","excorporatiile":"excorporație","excorporatiilor":"excorporație","excrementala":["excrementală","excremental","excrementala","excremental"],"excrementale":"excremental","excrementalele":"excremental","excrementali":"excremental","excrementalii":"excremental","excrementalul":"excremental","excremente":["excremente","excrement","excremențe","excremență"],"excrementei":"excremență","excrementele":["excrementele","excrement","excremențele","excremență"],"excrementelor":["excrementelor","excrement","excremențelor","excremență"],"excrementiala":["excremențială","excremențial","excremențiala","excremențial"],"excrementiale":"excremențial","excrementialele":"excremențial","excrementiali":"excremențial","excrementialii":"excremențial","excrementialul":"excremențial","excrementul":"excrement","excrementule":"excrement","excrementului":"excrement","excrescente":"excrescență","excrescentei":"excrescență","excrescentele":"excrescență","excrescentelor":"excrescență","excretai":"excreta","excretam":["excretăm","excreta","excretam","excreta"],"excretand":"excreta","excretara":"excreta","excretaram":"excreta","excretarati":"excreta","excretase":"excreta","excretasem":"excreta","excretasera":"excreta","excretaseram":"excreta","excretaserati":"excreta","excretasesi":"excreta","excretasi":"excreta","excretat":"excreta","excretati":"excreta","excretau":"excreta","excreteaza":"excreta","excretez":"excreta","excretezi":"excreta","excretia":"excreție","excretiei":"excreție","excretii":"excreție","excretiile":"excreție","excretiilor":"excreție","excretiunea":"excrețiune","excretiuni":"excrețiune","excretiunii":"excrețiune","excretiunile":"excrețiune","excretiunilor":"excrețiune","excretiva":["excretivă","excretiv","excretiva","excretiv"],"excretive":"excretiv","excretivele":"excretiv","excretivi":"excretiv","excretivii":"excretiv","excretivul":"excretiv","excretoare":"excretor","excretoarea":"excretor","excretoarele":"excretor","excretori":"excretor","excretoria":"excretoriu","excretorie":"excretoriu","excretorii":["excretorii","excretor","excretorii","excretoriu"],"excretoriii":"excretoriu","excretoriile":"excretoriu","excretoriul":"excretoriu","excretorul":"excretor","excrocheria":"excrocherie","excrocheriei":"excrocherie","excrocherii":"excrocherie","excrocheriile":"excrocherie","excrocheriilor":"excrocherie","excursia":"excursie","excursiei":"excursie","excursii":"excursie","excursiile":"excursie","excursiilor":"excursie","excursionismul":"excursionism","excursionismule":"excursionism","excursionismului":"excursionism","excursioniste":"excursionistă","excursionistei":"excursionistă","excursionistele":"excursionistă","excursionistelor":"excursionistă","excursionisti":"excursionist","excursionistii":"excursionist","excursionistilor":"excursionist","excursionistul":"excursionist","excursionistule":"excursionist","excursionistului":"excursionist","excursiunea":"excursiune","excursiuni":"excursiune","excursiunii":"excursiune","excursiunile":"excursiune","excursiunilor":"excursiune","excursiva":["excursivă","excursiv","excursiva","excursiv"],"excursive":"excursiv","excursivele":"excursiv","excursivi":"excursiv","excursivii":"excursiv","excursivul":"excursiv","excursul":"excurs","excursule":"excurs","excursului":"excurs","excursuri":"excurs","excursurile":"excurs","excursurilor":"excurs","excuzatia":"excuzație","excuzatiei":"excuzație","excuzatii":"excuzație","excuzatiile":"excuzație","excuzatiilor":"excuzație","execrabila":["execrabilă","execrabil","execrabila","execrabil"],"execrabile":"execrabil","execrabilele":"execrabil","execrabili":"execrabil","execrabilii":"execrabil","execrabilul":"execrabil","execraciunea":"execrăciune","execraciuni":"execrăciune","execraciunii":"execrăciune","execrai":"execra","execram":["execrăm","execra","execram","execra"],"execrand":"execra","execrara":"execra","execraram":"execra","execrarati":"execra","execrarea":"execrare","execrari":"execrare","execrarii":"execrare","execrarile":"execrare","execrarilor":"execrare","execrase":"execra","execrasem":"execra","execrasera":"execra","execraseram":"execra","execraserati":"execra","execrasesi":"execra","execrasi":"execra","execrat":"execra","execrati":"execra","execratia":"execrație","execratiei":"execrație","execratii":"execrație","execratiile":"execrație","execratiilor":"execrație","execratiunea":"execrațiune","execratiuni":"execrațiune","execratiunii":"execrațiune","execratiunile":"execrațiune","execratiunilor":"execrațiune","execrau":"execra","execreaza":"execra","execrez":"execra","execrezi":"execra","execut":"executa","executabila":["executabilă","executabil","executabila","executabil"],"executabile":"executabil","executabilele":"executabil","executabili":"executabil","executabilii":"executabil","executabilul":"executabil","executai":"executa","executam":["executăm","executa","executam","executa"],"executand":"executa","executanta":["executantă","executant","executanta","executant"],"executante":"executant","executantele":"executant","executanti":"executant","executantii":"executant","executantul":"executant","executara":"executa","executaram":"executa","executarati":"executa","executarea":"executare","executari":"executare","executarii":"executare","executarile":"executare","executarilor":"executare","executaris":"executarisi","executarise":"executarisi","executarisea":"executarisi","executariseai":"executarisi","executariseam":"executarisi","executariseati":"executarisi","executariseau":"executarisi","executarisie":"executarisi","executarisii":"executarisi","executarisim":"executarisi","executarisind":"executarisi","executarisira":"executarisi","executarisiram":"executarisi","executarisirati":"executarisi","executarisirea":"executarisire","executarisiri":"executarisire","executarisirii":"executarisire","executarisirile":"executarisire","executarisirilor":"executarisire","executarisise":"executarisi","executarisisem":"executarisi","executarisisera":"executarisi","executarisiseram":"executarisi","executarisiserati":"executarisi","executarisisesi":"executarisi","executarisisi":"executarisi","executarisit":"executarisi","executarisiti":"executarisi","executase":"executa","executasem":"executa","executasera":"executa","executaseram":"executa","executaserati":"executa","executasesi":"executa","executasi":"executa","executat":"executa","executata":["executată","executat","executata","executat"],"executate":"executat","executatele":"executat","executati":["executați","executa","executați","executat"],"executatii":"executat","executatul":"executat","executau":"executa","execute":"executa","executi":"executa","executia":["execuția","execuție","execuția","execuțiu"],"executie":"execuțiu","executiei":"execuție","executii":["execuții","execuție","execuții","execuțiu"],"executiii":"execuțiu","executiile":["execuțiile","execuție","execuțiile","execuțiu"],"executiilor":"execuție","executiul":"execuțiu","executiunea":"execuțiune","executiuni":"execuțiune","executiunii":"execuțiune","executiunile":"execuțiune","executiunilor":"execuțiune","executiva":["executivă","executiv","executiva","executiv"],"executive":"executiv","executivele":"executiv","executivi":"executiv","executivii":"executiv","executivul":"executiv","executoare":"executor","executoarea":"executor","executoarele":"executor","executori":"executor","executori judecatoresti":"executor judecătoresc","executori testamentari":"executor testamentar","executoria":"executoriu","executorie":"executoriu","executorii":["executorii","executor","executorii","executoriu"],"executoriii":"executoriu","executoriile":"executoriu","executoriul":"executoriu","executorul":"executor","exedre":"exedră","exedrei":"exedră","exedrele":"exedră","exedrelor":"exedră","exegeti":"exeget","exegetica":["exegetică","exegetic","exegetica","exegetic"],"exegetice":"exegetic","exegeticele":"exegetic","exegetici":"exegetic","exegeticii":"exegetic","exegeticul":"exegetic","exegetii":"exeget","exegetilor":"exeget","exegetul":"exeget","exegetule":"exeget","exegetului":"exeget","exegeze":"exegeză","exegezei":"exegeză","exegezele":"exegeză","exegezelor":"exegeză","exelbantul":"exelbant","exelbantule":"exelbant","exelbantului":"exelbant","exelbanturi":"exelbant","exelbanturile":"exelbant","exelbanturilor":"exelbant","exelente":"exelență","exelentei":"exelență","exelentele":"exelență","exelentelor":"exelență","exemplare":"exemplar","exemplarele":"exemplar","exemplarelor":"exemplar","exemplaritatea":"exemplaritate","exemplaritati":"exemplaritate","exemplaritatii":"exemplaritate","exemplarnica":["exemplarnică","exemplarnic","exemplarnica","exemplarnic"],"exemplarnice":"exemplarnic","exemplarnicele":"exemplarnic","exemplarnici":"exemplarnic","exemplarnicii":"exemplarnic","exemplarnicul":"exemplarnic","exemplarul":"exemplar","exemplarule":"exemplar","exemplarului":"exemplar","exemple":"exemplu","exemplele":"exemplu","exemplelor":"exemplu","exemplific":"exemplifica","exemplificai":"exemplifica","exemplificam":["exemplificăm","exemplifica","exemplificam","exemplifica"],"exemplificand":"exemplifica","exemplificara":"exemplifica","exemplificaram":"exemplifica","exemplificarati":"exemplifica","exemplificarea":"exemplificare","exemplificari":"exemplificare","exemplificarii":"exemplificare","exemplificarile":"exemplificare","exemplificarilor":"exemplificare","exemplificase":"exemplifica","exemplificasem":"exemplifica","exemplificasera":"exemplifica","exemplificaseram":"exemplifica","exemplificaserati":"exemplifica","exemplificasesi":"exemplifica","exemplificasi":"exemplifica","exemplificat":"exemplifica","exemplificata":["exemplificată","exemplificat","exemplificata","exemplificat"],"exemplificate":"exemplificat","exemplificatele":"exemplificat","exemplificati":["exemplificați","exemplifica","exemplificați","exemplificat"],"exemplificatia":"exemplificație","exemplificatiei":"exemplificație","exemplificatii":["exemplificații","exemplificat","exemplificații","exemplificație"],"exemplificatiile":"exemplificație","exemplificatiilor":"exemplificație","exemplificativa":["exemplificativă","exemplificativ","exemplificativa","exemplificativ"],"exemplificative":"exemplificativ","exemplificativele":"exemplificativ","exemplificativi":"exemplificativ","exemplificativii":"exemplificativ","exemplificativul":"exemplificativ","exemplificatul":"exemplificat","exemplificau":"exemplifica","exemplifici":"exemplifica","exemplul":"exemplu","exemplule":"exemplu","exemplului":"exemplu","exempta":["exemptă","exempt","exempta","exempt"],"exempte":"exempt","exemptele":"exempt","exempti":"exempt","exemptii":"exempt","exemptiunea":"exempțiune","exemptiuni":"exempțiune","exemptiunii":"exempțiune","exemptiunile":"exempțiune","exemptiunilor":"exempțiune","exemptul":"exempt","exencefali":"exencefal","exencefalia":"exencefalie","exencefaliei":"exencefalie","exencefalii":["exencefalii","exencefal","exencefalii","exencefalie"],"exencefaliile":"exencefalie","exencefaliilor":"exencefalie","exencefalilor":"exencefal","exencefalul":"exencefal","exencefalule":"exencefal","exencefalului":"exencefal","exenteratia":"exenterație","exenteratiei":"exenterație","exenteratii":"exenterație","exenteratiile":"exenterație","exenteratiilor":"exenterație","exercit":"exercita","exercitai":"exercita","exercitam":["exercităm","exercita","exercitam","exercita"],"exercitand":"exercita","exercitara":"exercita","exercitaram":"exercita","exercitarati":"exercita","exercitarea":"exercitare","exercitari":"exercitare","exercitarii":"exercitare","exercitarile":"exercitare","exercitarilor":"exercitare","exercitase":"exercita","exercitasem":"exercita","exercitasera":"exercita","exercitaseram":"exercita","exercitaserati":"exercita","exercitasesi":"exercita","exercitasi":"exercita","exercitat":"exercita","exercitata":["exercitată","exercitat","exercitata","exercitat"],"exercitate":"exercitat","exercitatele":"exercitat","exercitati":["exercitați","exercita","exercitați","exercitat"],"exercitatia":"exercitație","exercitatiei":"exercitație","exercitatii":["exercitații","exercitat","exercitații","exercitație"],"exercitatiile":"exercitație","exercitatiilor":"exercitație","exercitatul":"exercitat","exercitau":"exercita","exerciti":"exercita","exercitii":"exercițiu","exercitii la sol":"exercițiu la sol","exercitiile":"exercițiu","exercitiilor":"exercițiu","exercitiul":"exercițiu","exercitiule":"exercițiu","exercitiului":"exercițiu","exeredit":"exeredita","exereditai":"exeredita","exereditam":["exeredităm","exeredita","exereditam","exeredita"],"exereditand":"exeredita","exereditara":"exeredita","exereditaram":"exeredita","exereditarati":"exeredita","exereditarea":"exereditare","exereditari":"exereditare","exereditarii":"exereditare","exereditarile":"exereditare","exereditarilor":"exereditare","exereditase":"exeredita","exereditasem":"exeredita","exereditasera":"exeredita","exereditaseram":"exeredita","exereditaserati":"exeredita","exereditasesi":"exeredita","exereditasi":"exeredita","exereditat":"exeredita","exereditati":"exeredita","exereditau":"exeredita","exerediti":"exeredita","exereze":"exereză","exerezei":"exereză","exerezele":"exereză","exerezelor":"exereză","exerge":"exergă","exergei":"exergă","exergele":"exergă","exergelor":"exergă","exergia":"exergie","exergiei":"exergie","exergii":"exergie","exergiile":"exergie","exergiilor":"exergie","exersai":"exersa","exersam":["exersăm","exersa","exersam","exersa"],"exersand":"exersa","exersara":"exersa","exersaram":"exersa","exersarati":"exersa","exersarea":"exersare","exersari":"exersare","exersarii":"exersare","exersarile":"exersare","exersarilor":"exersare","exersase":"exersa","exersasem":"exersa","exersasera":"exersa","exersaseram":"exersa","exersaserati":"exersa","exersasesi":"exersa","exersasi":"exersa","exersat":"exersa","exersati":"exersa","exersau":"exersa","exerseaza":"exersa","exersez":"exersa","exersezi":"exersa","exfiltratia":"exfiltrație","exfiltratiei":"exfiltrație","exfiltratii":"exfiltrație","exfiltratiile":"exfiltrație","exfiltratiilor":"exfiltrație","exfoliai":"exfolia","exfoliam":"exfolia","exfoliara":"exfolia","exfoliaram":"exfolia","exfoliarati":"exfolia","exfoliase":"exfolia","exfoliasem":"exfolia","exfoliasera":"exfolia","exfoliaseram":"exfolia","exfoliaserati":"exfolia","exfoliasesi":"exfolia","exfoliasi":"exfolia","exfoliat":"exfolia","exfoliati":"exfolia","exfoliatia":"exfoliație","exfoliatiei":"exfoliație"};
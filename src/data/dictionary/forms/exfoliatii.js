@@ -0,0 +1 @@
+export default {"exfoliatii":"exfoliație","exfoliatiile":"exfoliație","exfoliatiilor":"exfoliație","exfoliatiunea":"exfoliațiune","exfoliatiuni":"exfoliațiune","exfoliatiunii":"exfoliațiune","exfoliatiunile":"exfoliațiune","exfoliatiunilor":"exfoliațiune","exfoliativa":["exfoliativă","exfoliativ","exfoliativa","exfoliativ"],"exfoliative":"exfoliativ","exfoliativele":"exfoliativ","exfoliativi":"exfoliativ","exfoliativii":"exfoliativ","exfoliativul":"exfoliativ","exfoliatoare":"exfoliator","exfoliatoarea":"exfoliator","exfoliatoarele":"exfoliator","exfoliatori":"exfoliator","exfoliatorii":"exfoliator","exfoliatorul":"exfoliator","exfoliau":"exfolia","exfoliaza":"exfolia","exfolie":"exfolia","exfoliem":"exfolia","exfolierea":"exfoliere","exfolieri":"exfoliere","exfolierii":"exfoliere","exfolierile":"exfoliere","exfolierilor":"exfoliere","exfoliez":"exfolia","exfoliezi":"exfolia","exfoliind":"exfolia","exhaustiva":["exhaustivă","exhaustiv","exhaustiva","exhaustiv"],"exhaustive":"exhaustiv","exhaustivele":"exhaustiv","exhaustivi":"exhaustiv","exhaustivii":"exhaustiv","exhaustivitatea":"exhaustivitate","exhaustivitati":"exhaustivitate","exhaustivitatii":"exhaustivitate","exhaustivitatile":"exhaustivitate","exhaustivitatilor":"exhaustivitate","exhaustivul":"exhaustiv","exhaustoare":"exhaustor","exhaustoarele":"exhaustor","exhaustoarelor":"exhaustor","exhaustorul":"exhaustor","exhaustorule":"exhaustor","exhaustorului":"exhaustor","exhibai":"exhiba","exhibam":["exhibăm","exhiba","exhibam","exhiba"],"exhiband":"exhiba","exhibara":"exhiba","exhibaram":"exhiba","exhibarati":"exhiba","exhibarea":"exhibare","exhibari":"exhibare","exhibarii":"exhibare","exhibarile":"exhibare","exhibarilor":"exhibare","exhibase":"exhiba","exhibasem":"exhiba","exhibasera":"exhiba","exhibaseram":"exhiba","exhibaserati":"exhiba","exhibasesi":"exhiba","exhibasi":"exhiba","exhibat":"exhiba","exhibata":["exhibată","exhibat","exhibata","exhibat"],"exhibate":"exhibat","exhibatele":"exhibat","exhibati":["exhibați","exhiba","exhibați","exhibat"],"exhibatii":"exhibat","exhibatul":"exhibat","exhibau":"exhiba","exhibeaza":"exhiba","exhibez":"exhiba","exhibezi":"exhiba","exhibitia":"exhibiție","exhibitiei":"exhibiție","exhibitii":"exhibiție","exhibitiile":"exhibiție","exhibitiilor":"exhibiție","exhibitionisme":"exhibiționism","exhibitionismele":"exhibiționism","exhibitionismelor":"exhibiționism","exhibitionismul":"exhibiționism","exhibitionismule":"exhibiționism","exhibitionismului":"exhibiționism","exhibitioniste":"exhibiționistă","exhibitionistei":"exhibiționistă","exhibitionistele":"exhibiționistă","exhibitionistelor":"exhibiționistă","exhibitionisti":"exhibiționist","exhibitionistii":"exhibiționist","exhibitionistilor":"exhibiționist","exhibitionistul":"exhibiționist","exhibitionistule":"exhibiționist","exhibitionistului":"exhibiționist","exhibitiunea":"exhibițiune","exhibitiuni":"exhibițiune","exhibitiunii":"exhibițiune","exhibitiunile":"exhibițiune","exhibitiunilor":"exhibițiune","exhibitoria":"exhibitoriu","exhibitorie":"exhibitoriu","exhibitorii":"exhibitoriu","exhibitoriii":"exhibitoriu","exhibitoriile":"exhibitoriu","exhibitoriul":"exhibitoriu","exhortatiunea":"exhortațiune","exhortatiuni":"exhortațiune","exhortatiunii":"exhortațiune","exhortatiunile":"exhortațiune","exhortatiunilor":"exhortațiune","exhumai":"exhuma","exhumam":["exhumăm","exhuma","exhumam","exhuma"],"exhumand":"exhuma","exhumara":"exhuma","exhumaram":"exhuma","exhumarati":"exhuma","exhumarea":"exhumare","exhumari":"exhumare","exhumarii":"exhumare","exhumarile":"exhumare","exhumarilor":"exhumare","exhumase":"exhuma","exhumasem":"exhuma","exhumasera":"exhuma","exhumaseram":"exhuma","exhumaserati":"exhuma","exhumasesi":"exhuma","exhumasi":"exhuma","exhumat":"exhuma","exhumati":"exhuma","exhumatia":"exhumație","exhumatiei":"exhumație","exhumatii":"exhumație","exhumatiile":"exhumație","exhumatiilor":"exhumație","exhumau":"exhuma","exhumeaza":"exhuma","exhumez":"exhuma","exhumezi":"exhuma","exibitiunea":"exibițiune","exibitiuni":"exibițiune","exibitiunii":"exibițiune","exibitiunile":"exibițiune","exibitiunilor":"exibițiune","exig":"exige","exiga":"exige","exigand":"exige","exigea":"exige","exigeai":"exige","exigeam":"exige","exigeati":"exige","exigeau":"exige","exigem":"exige","exigenta":["exigentă","exigent","exigenta","exigent"],"exigente":["exigente","exigent","exigențe","exigență"],"exigentei":"exigență","exigentele":["exigentele","exigent","exigențele","exigență"],"exigentelor":"exigență","exigenti":"exigent","exigentii":"exigent","exigentul":"exigent","exigeti":"exige","exigi":"exige","exigibila":["exigibilă","exigibil","exigibila","exigibil"],"exigibile":"exigibil","exigibilele":"exigibil","exigibili":"exigibil","exigibilii":"exigibil","exigibilitatea":"exigibilitate","exigibilitati":"exigibilitate","exigibilitatii":"exigibilitate","exigibilitatile":"exigibilitate","exigibilitatilor":"exigibilitate","exigibilul":"exigibil","exigua":["exiguă","exiguu","exigua","exiguu"],"exigue":"exiguu","exiguele":"exiguu","exigui":"exiguu","exiguii":"exiguu","exiguitatea":"exiguitate","exiguitati":"exiguitate","exiguitatii":"exiguitate","exiguitatile":"exiguitate","exiguitatilor":"exiguitate","exiguul":"exiguu","exilai":"exila","exilam":["exilăm","exila","exilam","exila"],"exiland":"exila","exilara":"exila","exilaram":"exila","exilarati":"exila","exilarea":"exilare","exilarhi":"exilarh","exilarhii":"exilarh","exilarhilor":"exilarh","exilarhul":"exilarh","exilarhule":"exilarh","exilarhului":"exilarh","exilari":"exilare","exilarii":"exilare","exilarile":"exilare","exilarilor":"exilare","exilase":"exila","exilasem":"exila","exilasera":"exila","exilaseram":"exila","exilaserati":"exila","exilasesi":"exila","exilasi":"exila","exilat":"exila","exilata":["exilată","exilat","exilata","exilat"],"exilate":"exilat","exilatele":"exilat","exilati":["exilați","exila","exilați","exilat"],"exilatia":"exilație","exilatiei":"exilație","exilatii":["exilații","exilat","exilații","exilație"],"exilatiile":"exilație","exilatiilor":"exilație","exilatul":"exilat","exilau":"exila","exileaza":"exila","exilez":"exila","exilezi":"exila","exiluri":"exil","exine":"exină","exinei":"exină","exinele":"exină","exinelor":"exină","exise":"exige","exisei":"exige","exisera":"exige","exiseram":"exige","exiserati":"exige","exisese":"exige","exisesem":"exige","exisesera":"exige","exiseseram":"exige","exiseserati":"exige","exisesesi":"exige","exisesi":"exige","exist":"exista","existai":"exista","existam":["existăm","exista","existam","exista"],"existand":"exista","existara":"exista","existaram":"exista","existarati":"exista","existarea":"existare","existari":"existare","existarii":"existare","existarile":"existare","existarilor":"existare","existase":"exista","existasem":"exista","existasera":"exista","existaseram":"exista","existaserati":"exista","existasesi":"exista","existasi":"exista","existat":"exista","existati":"exista","existau":"exista","existe":"exista","existenta":["existentă","existent","existenta","existent"],"existente":["existente","existent","existențe","existență"],"existentei":"existență","existentele":["existentele","existent","existențele","existență"],"existentelor":"existență","existenti":"existent","existentiala":["existențială","existențial","existențiala","existențial"],"existentiale":"existențial","existentialele":"existențial","existentiali":"existențial","existentialii":"existențial","existentialisme":"existențialism","existentialismele":"existențialism","existentialismelor":"existențialism","existentialismul":"existențialism","existentialismule":"existențialism","existentialismului":"existențialism","existentialiste":"existențialistă","existentialistei":"existențialistă","existentialistele":"existențialistă","existentialistelor":"existențialistă","existentialisti":"existențialist","existentialistii":"existențialist","existentialistilor":"existențialist","existentialistul":"existențialist","existentialistule":"existențialist","existentialistului":"existențialist","existentialul":"existențial","existentii":"existent","existentul":"existent","existi":"exista","exit-pollul":"exit-poll","exit-pollule":"exit-poll","exit-pollului":"exit-poll","exit-polluri":"exit-poll","exit-pollurile":"exit-poll","exit-pollurilor":"exit-poll","exitusul":"exitus","exitusule":"exitus","exitusului":"exitus","exmatriculai":"exmatricula","exmatriculam":["exmatriculăm","exmatricula","exmatriculam","exmatricula"],"exmatriculand":"exmatricula","exmatriculara":"exmatricula","exmatricularam":"exmatricula","exmatricularati":"exmatricula","exmatricularea":"exmatriculare","exmatriculari":"exmatriculare","exmatricularii":"exmatriculare","exmatricularile":"exmatriculare","exmatricularilor":"exmatriculare","exmatriculase":"exmatricula","exmatriculasem":"exmatricula","exmatriculasera":"exmatricula","exmatriculaseram":"exmatricula","exmatriculaserati":"exmatricula","exmatriculasesi":"exmatricula","exmatriculasi":"exmatricula","exmatriculat":"exmatricula","exmatriculata":["exmatriculată","exmatriculat","exmatriculata","exmatriculat"],"exmatriculate":"exmatriculat","exmatriculatele":"exmatriculat","exmatriculati":["exmatriculați","exmatricula","exmatriculați","exmatriculat"],"exmatriculatii":"exmatriculat","exmatriculatul":"exmatriculat","exmatriculau":"exmatricula","exmatriculeaza":"exmatricula","exmatriculez":"exmatricula","exmatriculezi":"exmatricula","exobiologia":"exobiologie","exobiologiei":"exobiologie","exobiologii":"exobiologie","exocarpul":"exocarp","exocarpule":"exocarp","exocarpului":"exocarp","exocarpuri":"exocarp","exocarpurile":"exocarp","exocarpurilor":"exocarp","exocastronul":"exocastron","exocastronule":"exocastron","exocastronului":"exocastron","exocitoze":"exocitoză","exocitozei":"exocitoză","exocitozele":"exocitoză","exocitozelor":"exocitoză","exocortexul":"exocortex","exocortexule":"exocortex","exocortexului":"exocortex","exocortexuri":"exocortex","exocortexurile":"exocortex","exocortexurilor":"exocortex","exocrina":["exocrină","exocrin","exocrina","exocrin"],"exocrine":"exocrin","exocrinele":"exocrin","exocrini":"exocrin","exocrinii":"exocrin","exocrinopatia":"exocrinopatie","exocrinopatiei":"exocrinopatie","exocrinopatii":"exocrinopatie","exocrinopatiile":"exocrinopatie","exocrinopatiilor":"exocrinopatie","exocrinul":"exocrin","exoderme":"exoderm","exodermele":"exoderm","exodermelor":"exoderm","exodermul":"exoderm","exodermule":"exoderm","exodermului":"exoderm","exodul":"exod","exodule":"exod","exodului":"exod","exoduri":"exod","exodurile":"exod","exodurilor":"exod","exoelectroni":"exoelectron","exoelectronii":"exoelectron","exoelectronilor":"exoelectron","exoelectronul":"exoelectron","exoelectronule":"exoelectron","exoelectronului":"exoelectron","exoenzime":"exoenzimă","exoenzimei":"exoenzimă","exoenzimele":"exoenzimă","exoenzimelor":"exoenzimă","exofaga":["exofagă","exofag","exofaga","exofag"],"exofage":"exofag","exofagele":"exofag","exofagi":"exofag","exofagii":"exofag","exofagul":"exofag","exoflisea":"exoflisi","exofliseai":"exoflisi","exofliseam":"exoflisi","exofliseati":"exoflisi","exofliseau":"exoflisi","exoflisesc":"exoflisi","exofliseste":"exoflisi","exoflisesti":"exoflisi","exoflisii":"exoflisi","exoflisim":"exoflisi","exoflisind":"exoflisi","exoflisira":"exoflisi","exoflisiram":"exoflisi","exoflisirati":"exoflisi","exoflisise":"exoflisi","exoflisisem":"exoflisi","exoflisisera":"exoflisi","exoflisiseram":"exoflisi","exoflisiserati":"exoflisi","exoflisisesi":"exoflisi","exoflisisi":"exoflisi","exoflisit":"exoflisi","exoflisiti":"exoflisi","exofliticonul":"exofliticon","exofliticonule":"exofliticon","exofliticonului":"exofliticon","exoftalmia":"exoftalmie","exoftalmica":["exoftalmică","exoftalmic","exoftalmica","exoftalmic"],"exoftalmice":"exoftalmic","exoftalmicele":"exoftalmic","exoftalmici":"exoftalmic","exoftalmicii":"exoftalmic","exoftalmicul":"exoftalmic","exoftalmiei":"exoftalmie","exoftalmii":"exoftalmie","exoftalmiile":"exoftalmie","exoftalmiilor":"exoftalmie","exoftalmometre":"exoftalmometru","exoftalmometrele":"exoftalmometru","exoftalmometrelor":"exoftalmometru","exoftalmometria":"exoftalmometrie","exoftalmometriei":"exoftalmometrie","exoftalmometrii":"exoftalmometrie","exoftalmometriile":"exoftalmometrie","exoftalmometriilor":"exoftalmometrie","exoftalmometruul":"exoftalmometru","exoftalmometruule":"exoftalmometru","exoftalmometruului":"exoftalmometru","exogama":["exogamă","exogam","exogama","exogam"],"exogame":"exogam","exogamele":"exogam","exogami":"exogam","exogamia":"exogamie","exogamiei":"exogamie","exogamii":["exogamii","exogam","exogamii","exogamie"],"exogamiile":"exogamie","exogamiilor":"exogamie","exogamul":"exogam","exogena":["exogenă","exogen","exogena","exogen"],"exogene":"exogen","exogenele":"exogen","exogeni":"exogen","exogenii":"exogen","exogenul":"exogen","exomorfa":["exomorfă","exomorf","exomorfa","exomorf"],"exomorfe":"exomorf","exomorfele":"exomorf","exomorfi":"exomorf","exomorfii":"exomorf","exomorfisme":"exomorfism","exomorfismele":"exomorfism","exomorfismelor":"exomorfism","exomorfismul":"exomorfism","exomorfismule":"exomorfism","exomorfismului":"exomorfism","exomorful":"exomorf","exonartexul":"exonartex","exonartexule":"exonartex","exonartexului":"exonartex","exonartexuri":"exonartex","exonartexurile":"exonartex","exonartexurilor":"exonartex","exonerai":"exonera","exoneram":["exonerăm","exonera","exoneram","exonera"],"exonerand":"exonera","exonerara":"exonera","exoneraram":"exonera","exonerarati":"exonera","exonerarea":"exonerare","exonerari":"exonerare","exonerarii":"exonerare","exonerarile":"exonerare","exonerarilor":"exonerare","exonerase":"exonera","exonerasem":"exonera","exonerasera":"exonera","exoneraseram":"exonera","exoneraserati":"exonera","exonerasesi":"exonera","exonerasi":"exonera","exonerat":"exonera","exonerati":"exonera","exoneratia":"exonerație","exoneratiei":"exonerație","exoneratii":"exonerație","exoneratiile":"exonerație","exoneratiilor":"exonerație","exonerau":"exonera","exonereaza":"exonera","exonerez":"exonera","exonerezi":"exonera","exopeptidaze":"exopeptidază","exopeptidazei":"exopeptidază","exopeptidazele":"exopeptidază","exopeptidazelor":"exopeptidază","exoplasme":"exoplasmă","exoplasmei":"exoplasmă","exoplasmele":"exoplasmă","exoplasmelor":"exoplasmă","exoplasmica":["exoplasmică","exoplasmic","exoplasmica","exoplasmic"],"exoplasmice":"exoplasmic","exoplasmicele":"exoplasmic","exoplasmici":"exoplasmic","exoplasmicii":"exoplasmic","exoplasmicul":"exoplasmic","exorabila":["exorabilă","exorabil","exorabila","exorabil"],"exorabile":"exorabil","exorabilele":"exorabil","exorabili":"exorabil","exorabilii":"exorabil","exorabilul":"exorabil","exoratia":"exorație","exoratiei":"exorație","exoratii":"exorație","exoratiile":"exorație","exoratiilor":"exorație","exorbitanta":["exorbitantă","exorbitant","exorbitanta","exorbitant"],"exorbitante":["exorbitante","exorbitant","exorbitanțe","exorbitanță"],"exorbitantei":"exorbitanță","exorbitantele":["exorbitantele","exorbitant","exorbitanțele","exorbitanță"],"exorbitantelor":"exorbitanță","exorbitanti":"exorbitant","exorbitantii":"exorbitant","exorbitantul":"exorbitant","exorbitata":["exorbitată","exorbitat","exorbitata","exorbitat"],"exorbitate":"exorbitat","exorbitatele":"exorbitat","exorbitati":"exorbitat","exorbitatii":"exorbitat","exorbitatul":"exorbitat","exorchisirea":"exorchisire","exorchisiri":"exorchisire","exorchisirii":"exorchisire","exorchisirile":"exorchisire","exorchisirilor":"exorchisire","exorcismul":"exorcism","exorcismule":"exorcism","exorcismului":"exorcism","exorciste":"exorcistă","exorcistei":"exorcistă","exorcistele":"exorcistă","exorcistelor":"exorcistă","exorcisti":"exorcist","exorcistii":"exorcist","exorcistilor":"exorcist","exorcistul":"exorcist","exorcistule":"exorcist","exorcistului":"exorcist","exorcizai":"exorciza","exorcizam":["exorcizăm","exorciza","exorcizam","exorciza"],"exorcizand":"exorciza","exorcizara":"exorciza","exorcizaram":"exorciza","exorcizarati":"exorciza","exorcizarea":"exorcizare","exorcizari":"exorcizare","exorcizarii":"exorcizare","exorcizarile":"exorcizare","exorcizarilor":"exorcizare","exorcizase":"exorciza","exorcizasem":"exorciza","exorcizasera":"exorciza","exorcizaseram":"exorciza","exorcizaserati":"exorciza","exorcizasesi":"exorciza","exorcizasi":"exorciza","exorcizat":"exorciza","exorcizati":"exorciza","exorcizau":"exorciza","exorcizeaza":"exorciza","exorcizez":"exorciza","exorcizezi":"exorciza","exordii":"exordiu","exordiile":"exordiu","exordiilor":"exordiu","exordiuul":"exordiu","exordiuule":"exordiu","exordiuului":"exordiu","exoreica":["exoreică","exoreic","exoreica","exoreic"],"exoreice":"exoreic","exoreicele":"exoreic","exoreici":"exoreic","exoreicii":"exoreic","exoreicul":"exoreic","exoria":"exorie","exoriei":"exorie","exorii":"exorie","exoriile":"exorie","exoriilor":"exorie","exorisirea":"exorisire","exorisiri":"exorisire","exorisirii":"exorisire","exorisirile":"exorisire","exorisirilor":"exorisire","exorisita":["exorisită","exorisit","exorisita","exorisit"],"exorisite":"exorisit","exorisitele":"exorisit","exorisiti":"exorisit","exorisitii":"exorisit","exorisitul":"exorisit","exortai":"exorta","exortam":["exortăm","exorta","exortam","exorta"],"exortand":"exorta","exortara":"exorta","exortaram":"exorta","exortarati":"exorta","exortarea":"exortare","exortari":"exortare","exortarii":"exortare","exortarile":"exortare","exortarilor":"exortare","exortase":"exorta","exortasem":"exorta","exortasera":"exorta","exortaseram":"exorta","exortaserati":"exorta","exortasesi":"exorta","exortasi":"exorta","exortat":"exorta","exortati":"exorta","exortatia":"exortație","exortatiei":"exortație","exortatii":"exortație","exortatiile":"exortație","exortatiilor":"exortație","exortatiunea":"exortațiune","exortatiuni":"exortațiune","exortatiunii":"exortațiune","exortatiunile":"exortațiune","exortatiunilor":"exortațiune","exortativa":["exortativă","exortativ","exortativa","exortativ"],"exortative":"exortativ","exortativele":"exortativ","exortativi":"exortativ","exortativii":"exortativ","exortativul":"exortativ","exortau":"exorta","exorteaza":"exorta","exortez":"exorta","exortezi":"exorta","exoschelete":"exoschelet","exoscheletele":"exoschelet","exoscheletelor":"exoschelet","exoscheletul":"exoschelet","exoscheletule":"exoschelet","exoscheletului":"exoschelet","exoseroze":"exoseroză","exoserozei":"exoseroză","exoserozele":"exoseroză","exoserozelor":"exoseroză","exosfere":"exosferă","exosferei":"exosferă","exosferele":"exosferă","exosferelor":"exosferă","exosferica":["exosferică","exosferic","exosferica","exosferic"],"exosferice":"exosferic","exosfericele":"exosferic","exosferici":"exosferic","exosfericii":"exosferic","exosfericul":"exosferic","exosmotica":["exosmotică","exosmotic","exosmotica","exosmotic"],"exosmotice":"exosmotic","exosmoticele":"exosmotic","exosmotici":"exosmotic","exosmoticii":"exosmotic","exosmoticul":"exosmotic","exosmoze":"exosmoză","exosmozei":"exosmoză","exosmozele":"exosmoză","exosmozelor":"exosmoză","exostoze":"exostoză","exostozei":"exostoză","exostozele":"exostoză","exostozelor":"exostoză","exostozica":["exostozică","exostozic","exostozica","exostozic"],"exostozice":"exostozic","exostozicele":"exostozic","exostozici":"exostozic","exostozicii":"exostozic","exostozicul":"exostozic","exoterica":["exoterică","exoteric","exoterica","exoteric"],"exoterice":"exoteric","exotericele":"exoteric","exoterici":"exoteric","exotericii":"exoteric","exotericul":"exoteric","exoterismul":"exoterism","exoterismule":"exoterism","exoterismului":"exoterism","exoterma":["exotermă","exoterm","exoterma","exoterm"],"exoterme":"exoterm","exotermele":"exoterm","exotermi":"exoterm","exotermica":["exotermică","exotermic","exotermica","exotermic"],"exotermice":"exotermic","exotermicele":"exotermic","exotermici":"exotermic","exotermicii":"exotermic","exotermicul":"exotermic","exotermii":"exoterm","exotermul":"exoterm","exotica":["exotică","exotic","exotica","exotic"],"exotice":"exotic","exoticele":"exotic","exotici":"exotic","exoticii":"exotic","exoticul":"exotic","exotismul":"exotism","exotismule":"exotism","exotismului":"exotism","exotizai":"exotiza","exotizam":["exotizăm","exotiza","exotizam","exotiza"],"exotizand":"exotiza","exotizara":"exotiza","exotizaram":"exotiza","exotizarati":"exotiza","exotizarea":"exotizare","exotizari":"exotizare","exotizarii":"exotizare","exotizase":"exotiza","exotizasem":"exotiza","exotizasera":"exotiza","exotizaseram":"exotiza","exotizaserati":"exotiza","exotizasesi":"exotiza","exotizasi":"exotiza","exotizat":"exotiza","exotizati":"exotiza","exotizau":"exotiza","exotizeaza":"exotiza","exotizez":"exotiza","exotizezi":"exotiza","exotoxine":"exotoxină","exotoxinei":"exotoxină","exotoxinele":"exotoxină","exotoxinelor":"exotoxină","exotrofa":["exotrofă","exotrof","exotrofa","exotrof"],"exotrofe":"exotrof","exotrofele":"exotrof","exotrofi":"exotrof","exotrofii":"exotrof","exotroful":"exotrof","exotropia":"exotropie","exotropiei":"exotropie","exotropii":"exotropie","exotropiile":"exotropie","exotropiilor":"exotropie","expandabila":["expandabilă","expandabil","expandabila","expandabil"],"expandabile":"expandabil","expandabilele":"expandabil","expandabili":"expandabil","expandabilii":"expandabil","expandabilul":"expandabil","expandai":"expanda","expandam":["expandăm","expanda","expandam","expanda"],"expandand":"expanda","expandara":"expanda","expandaram":"expanda","expandarati":"expanda","expandase":"expanda","expandasem":"expanda","expandasera":"expanda","expandaseram":"expanda","expandaserati":"expanda","expandasesi":"expanda","expandasi":"expanda","expandat":"expanda","expandati":"expanda","expandau":"expanda","expandeaza":"expanda","expandez":"expanda","expandezi":"expanda","expansia":"expansie","expansibila":["expansibilă","expansibil","expansibila","expansibil"],"expansibile":"expansibil","expansibilele":"expansibil","expansibili":"expansibil","expansibilii":"expansibil","expansibilitatea":"expansibilitate","expansibilitati":"expansibilitate","expansibilitatii":"expansibilitate","expansibilitatile":"expansibilitate","expansibilitatilor":"expansibilitate","expansibilul":"expansibil","expansiei":"expansie","expansii":"expansie","expansiile":"expansie","expansiilor":"expansie","expansionismul":"expansionism","expansionismule":"expansionism","expansionismului":"expansionism","expansionista":["expansionistă","expansionist","expansionista","expansionist"],"expansioniste":"expansionist","expansionistele":"expansionist","expansionisti":"expansionist","expansionistii":"expansionist","expansionistul":"expansionist","expansiunea":"expansiune","expansiuni":"expansiune","expansiunii":"expansiune","expansiunile":"expansiune","expansiunilor":"expansiune","expansiva":["expansivă","expansiv","expansiva","expansiv"],"expansive":"expansiv","expansivele":"expansiv","expansivi":"expansiv","expansivii":"expansiv","expansivitatea":"expansivitate","expansivitati":"expansivitate","expansivitatii":"expansivitate","expansivitatile":"expansivitate","expansivitatilor":"expansivitate","expansivul":"expansiv","expatriai":"expatria","expatriam":"expatria","expatriara":"expatria","expatriaram":"expatria","expatriarati":"expatria","expatriase":"expatria","expatriasem":"expatria","expatriasera":"expatria","expatriaseram":"expatria","expatriaserati":"expatria","expatriasesi":"expatria","expatriasi":"expatria","expatriat":"expatria","expatriata":["expatriată","expatriat","expatriata","expatriat"],"expatriate":["expatriate","expatriat","expatriate","expatriată"],"expatriatei":"expatriată","expatriatele":["expatriatele","expatriat","expatriatele","expatriată"],"expatriatelor":"expatriată","expatriati":["expatriați","expatria","expatriați","expatriat"],"expatriatia":"expatriație","expatriatiei":"expatriație","expatriatii":["expatriații","expatriat","expatriații","expatriație"],"expatriatiile":"expatriație","expatriatiilor":"expatriație","expatriatul":"expatriat","expatriau":"expatria","expatriaza":"expatria","expatrie":"expatria","expatrieaza":"expatria","expatriem":"expatria","expatrierea":"expatriere","expatrieri":"expatriere","expatrierii":"expatriere","expatrierile":"expatriere","expatrierilor":"expatriere","expatriez":"expatria","expatriezi":"expatria","expatriind":"expatria","expectante":"expectanță","expectantei":"expectanță","expectantele":"expectanță","expectantelor":"expectanță","expectatia":"expectație","expectatiei":"expectație","expectatii":"expectație","expectatiile":"expectație","expectatiilor":"expectație","expectatiunea":"expectațiune","expectatiuni":"expectațiune","expectatiunii":"expectațiune","expectatiunile":"expectațiune","expectatiunilor":"expectațiune","expectativa":["expectativă","expectativ","expectativa","expectativ"],"expectative":["expectative","expectativ","expectative","expectativă"],"expectativei":"expectativă","expectativele":["expectativele","expectativ","expectativele","expectativă"],"expectativelor":"expectativă","expectativi":"expectativ","expectativii":"expectativ","expectativul":"expectativ","expectorai":"expectora","expectoram":["expectorăm","expectora","expectoram","expectora"],"expectorand":"expectora","expectoranta":["expectorantă","expectorant","expectoranta","expectorant"],"expectorante":"expectorant","expectorantele":"expectorant","expectoranti":"expectorant","expectorantii":"expectorant","expectorantul":"expectorant","expectorara":"expectora","expectoraram":"expectora","expectorarati":"expectora","expectorarea":"expectorare","expectorari":"expectorare","expectorarii":"expectorare","expectorarile":"expectorare","expectorarilor":"expectorare","expectorase":"expectora","expectorasem":"expectora","expectorasera":"expectora","expectoraseram":"expectora","expectoraserati":"expectora","expectorasesi":"expectora","expectorasi":"expectora","expectorat":"expectora","expectorati":"expectora","expectoratia":"expectorație","expectoratiei":"expectorație","expectoratii":"expectorație","expectoratiile":"expectorație","expectoratiilor":"expectorație","expectoratiunea":"expectorațiune","expectoratiuni":"expectorațiune","expectoratiunii":"expectorațiune","expectoratiunile":"expectorațiune","expectoratiunilor":"expectorațiune","expectorau":"expectora","expectoreaza":"expectora","expectorez":"expectora","expectorezi":"expectora","expediai":"expedia","expediam":"expedia","expediara":"expedia","expediaram":"expedia","expediarati":"expedia","expediarea":"expediare","expediase":"expedia","expediasem":"expedia","expediasera":"expedia","expediaseram":"expedia","expediaserati":"expedia","expediasesi":"expedia","expediasi":"expedia","expediat":"expedia","expediata":["expediată","expediat","expediata","expediat"],"expediate":"expediat","expediatele":"expediat","expediati":["expediați","expedia","expediați","expediat"],"expediatii":"expediat","expediatul":"expediat","expediau":"expedia","expediaza":"expedia","expedie":"expedia","expediem":"expedia","expediente":"expedient","expedientele":"expedient","expedientelor":"expedient","expedientul":"expedient","expedientule":"expedient","expedientului":"expedient","expedierea":"expediere","expedieri":["expedieri","expediare","expedieri","expediere"],"expedierii":["expedierii","expediare","expedierii","expediere"],"expedierile":["expedierile","expediare","expedierile","expediere"],"expedierilor":["expedierilor","expediare","expedierilor","expediere"],"expediez":"expedia","expediezi":"expedia","expediind":"expedia","expeditia":"expediție","expeditiei":"expediție","expeditii":"expediție","expeditiile":"expediție","expeditiilor":"expediție","expeditionara":["expediționară","expediționar","expediționara","expediționar"],"expeditionare":"expediționar","expeditionarele":"expediționar","expeditionari":"expediționar","expeditionarii":"expediționar","expeditionarul":"expediționar","expeditiunea":"expedițiune","expeditiuni":"expedițiune","expeditiunii":"expedițiune","expeditiunile":"expedițiune","expeditiunilor":"expedițiune","expeditiva":["expeditivă","expeditiv","expeditiva","expeditiv"],"expeditive":"expeditiv","expeditivele":"expeditiv","expeditivi":"expeditiv","expeditivii":"expeditiv","expeditivul":"expeditiv","expeditoarea":"expeditoare","expeditoarei":"expeditoare","expeditoarele":"expeditoare","expeditoarelor":"expeditoare","expeditori":"expeditor","expeditorii":"expeditor","expeditorilor":"expeditor","expeditorul":"expeditor","expeditorule":"expeditor","expeditorului":"expeditor","expeduia":"expedui","expeduiai":"expedui","expeduiam":"expedui","expeduiati":"expedui","expeduiau":"expedui","expeduiesc":"expedui","expeduieste":"expedui","expeduiesti":"expedui","expeduii":"expedui","expeduim":"expedui","expeduind":"expedui","expeduira":"expedui","expeduiram":"expedui","expeduirati":"expedui","expeduirea":"expeduire","expeduiri":"expeduire","expeduirii":"expeduire","expeduirile":"expeduire","expeduirilor":"expeduire","expeduise":"expedui","expeduisem":"expedui","expeduisera":"expedui","expeduiseram":"expedui","expeduiserati":"expedui","expeduisesi":"expedui","expeduisi":"expedui","expeduit":"expedui","expeduita":["expeduită","expeduit","expeduita","expeduit"],"expeduite":"expeduit","expeduitele":"expeduit","expeduiti":["expeduiți","expedui","expeduiți","expeduit"],"expeduitii":"expeduit","expeduitul":"expeduit","experienta":["experientă","experient","experienta","experient"],"experiente":["experiente","experient","experiențe","experiență"],"experientei":"experiență","experientele":["experientele","experient","experiențele","experiență"],"experientelor":"experiență","experienti":"experient","experientiala":["experiențială","experiențial","experiențiala","experiențial"],"experientiale":"experiențial","experientialele":"experiențial","experientiali":"experiențial","experientialii":"experiențial","experientialul":"experiențial","experientii":"experient","experientul":"experient","experimentabila":["experimentabilă","experimentabil","experimentabila","experimentabil"],"experimentabile":"experimentabil","experimentabilele":"experimentabil","experimentabili":"experimentabil","experimentabilii":"experimentabil","experimentabilul":"experimentabil","experimentai":"experimenta","experimentala":["experimentală","experimental","experimentala","experimental"],"experimentale":"experimental","experimentalele":"experimental","experimentali":"experimental","experimentalii":"experimental","experimentalismul":"experimentalism","experimentalismule":"experimentalism","experimentalismului":"experimentalism","experimentalista":["experimentalistă","experimentalist","experimentalista","experimentalist"],"experimentaliste":"experimentalist","experimentalistele":"experimentalist","experimentalisti":"experimentalist","experimentalistii":"experimentalist","experimentalistul":"experimentalist","experimentalul":"experimental","experimentam":["experimentăm","experimenta","experimentam","experimenta"],"experimentand":"experimenta","experimentara":"experimenta","experimentaram":"experimenta","experimentarati":"experimenta","experimentarea":"experimentare","experimentari":"experimentare","experimentarii":"experimentare","experimentarile":"experimentare","experimentarilor":"experimentare","experimentase":"experimenta","experimentasem":"experimenta","experimentasera":"experimenta","experimentaseram":"experimenta","experimentaserati":"experimenta","experimentasesi":"experimenta","experimentasi":"experimenta","experimentat":"experimenta","experimentata":["experimentată","experimentat","experimentata","experimentat"],"experimentate":"experimentat","experimentatele":"experimentat","experimentati":["experimentați","experimenta","experimentați","experimentat"],"experimentatii":"experimentat","experimentatoarea":"experimentatoare","experimentatoarei":"experimentatoare","experimentatoarele":"experimentatoare","experimentatoarelor":"experimentatoare","experimentatori":"experimentator","experimentatorii":"experimentator","experimentatorilor":"experimentator","experimentatorul":"experimentator","experimentatorule":"experimentator","experimentatorului":"experimentator","experimentatul":"experimentat","experimentau":"experimenta","experimente":"experiment","experimenteaza":"experimenta","experimentele":"experiment","experimentelor":"experiment","experimentez":"experimenta","experimentezi":"experimenta","experimentul":"experiment","experimentule":"experiment","experimentului":"experiment","experte":"expertă","expertei":"expertă","expertele":"expertă","expertelor":"expertă","experti":"expert","expertii":"expert","expertilor":"expert","expertizai":"expertiza","expertizam":["expertizăm","expertiza","expertizam","expertiza"],"expertizand":"expertiza","expertizara":"expertiza","expertizaram":"expertiza","expertizarati":"expertiza","expertizarea":"expertizare","expertizari":"expertizare","expertizarii":"expertizare","expertizarile":"expertizare","expertizarilor":"expertizare","expertizase":"expertiza","expertizasem":"expertiza","expertizasera":"expertiza","expertizaseram":"expertiza","expertizaserati":"expertiza","expertizasesi":"expertiza","expertizasi":"expertiza","expertizat":"expertiza","expertizata":["expertizată","expertizat","expertizata","expertizat"],"expertizate":"expertizat","expertizatele":"expertizat","expertizati":["expertizați","expertiza","expertizați","expertizat"],"expertizatii":"expertizat","expertizatul":"expertizat","expertizau":"expertiza","expertize":"expertiză","expertizeaza":"expertiza","expertizei":"expertiză","expertizele":"expertiză","expertizelor":"expertiză","expertizez":"expertiza","expertizezi":"expertiza","expertul":"expert","expertule":"expert","expertului":"expert","expiabila":["expiabilă","expiabil","expiabila","expiabil"],"expiabile":"expiabil","expiabilele":"expiabil","expiabili":"expiabil","expiabilii":"expiabil","expiabilul":"expiabil","expiai":"expia","expiam":"expia","expiara":"expia","expiaram":"expia","expiarati":"expia","expiase":"expia","expiasem":"expia","expiasera":"expia","expiaseram":"expia","expiaserati":"expia","expiasesi":"expia","expiasi":"expia","expiat":"expia","expiati":"expia","expiatia":"expiație","expiatiei":"expiație","expiatii":"expiație","expiatiile":"expiație","expiatiilor":"expiație","expiatiunea":"expiațiune","expiatiuni":"expiațiune","expiatiunii":"expiațiune","expiatiunile":"expiațiune","expiatiunilor":"expiațiune","expiatoare":"expiator","expiatoarea":"expiator","expiatoarele":"expiator","expiatori":"expiator","expiatorii":"expiator","expiatorul":"expiator","expiau":"expia","expiaza":"expia","expie":"expia","expieaza":"expia","expiem":"expia","expierea":"expiere","expieri":"expiere","expierii":"expiere","expierile":"expiere","expierilor":"expiere","expiez":"expia","expiezi":"expia","expiind":"expia","expir":"expira","expirai":"expira","expiram":["expirăm","expira","expiram","expira"],"expirand":"expira","expirara":"expira","expiraram":"expira","expirarati":"expira","expirarea":"expirare","expirari":"expirare","expirarii":"expirare","expirarile":"expirare","expirarilor":"expirare","expirase":"expira","expirasem":"expira","expirasera":"expira","expiraseram":"expira","expiraserati":"expira","expirasesi":"expira","expirasi":"expira","expirat":"expira","expirata":["expirată","expirat","expirata","expirat"],"expirate":"expirat","expiratele":"expirat","expirati":["expirați","expira","expirați","expirat"],"expiratii":["expirații","expirat","expirații","expirație"],"expiratiunea":"expirațiune","expiratiuni":"expirațiune","expiratiunii":"expirațiune","expiratiunile":"expirațiune","expiratiunilor":"expirațiune","expiratoare":"expirator","expiratoarea":"expirator","expiratoarele":"expirator","expiratori":"expirator","expiratorii":"expirator","expiratorul":"expirator","expiratul":"expirat","expirau":"expira","expire":"expira","expiri":"expira","expletiva":["expletivă","expletiv","expletiva","expletiv"],"expletive":"expletiv","expletivele":"expletiv","expletivi":"expletiv","expletivii":"expletiv","expletivul":"expletiv","explic":"explica","explicabila":["explicabilă","explicabil","explicabila","explicabil"],"explicabile":"explicabil","explicabilele":"explicabil","explicabili":"explicabil","explicabilii":"explicabil","explicabilul":"explicabil","explicai":"explica","explicam":["explicăm","explica","explicam","explica"],"explicand":"explica","explicara":"explica","explicaram":"explica","explicarati":"explica","explicarea":"explicare","explicari":"explicare","explicarii":"explicare","explicarile":"explicare","explicarilor":"explicare","explicase":"explica","explicasem":"explica","explicasera":"explica","explicaseram":"explica","explicaserati":"explica","explicasesi":"explica","explicasi":"explica","explicat":"explica","explicata":["explicată","explicat","explicata","explicat"],"explicate":"explicat","explicatele":"explicat","explicati":["explicați","explica","explicați","explicat"],"explicatia":"explicație","explicatiei":"explicație","explicatii":["explicații","explicat","explicații","explicație"],"explicatiile":"explicație","explicatiilor":"explicație","explicatiunea":"explicațiune","explicatiuni":"explicațiune","explicatiunii":"explicațiune","explicatiunile":"explicațiune","explicatiunilor":"explicațiune","explicativa":["explicativă","explicativ","explicativa","explicativ"],"explicative":"explicativ","explicativele":"explicativ","explicativi":"explicativ","explicativii":"explicativ","explicativul":"explicativ","explicatoare":"explicator","explicatoarea":"explicator","explicatoarele":"explicator","explicatori":"explicator","explicatorii":"explicator","explicatorul":"explicator","explicatul":"explicat","explicau":"explica","explice":"explica","explici":"explica","explicita":["explicită","explicit","explicita","explicit"],"explicitai":"explicita","explicitam":["explicităm","explicita","explicitam","explicita"],"explicitand":"explicita","explicitara":"explicita","explicitaram":"explicita","explicitarati":"explicita","explicitarea":"explicitare","explicitari":"explicitare","explicitarii":"explicitare","explicitarile":"explicitare","explicitarilor":"explicitare","explicitase":"explicita","explicitasem":"explicita","explicitasera":"explicita","explicitaseram":"explicita","explicitaserati":"explicita","explicitasesi":"explicita","explicitasi":"explicita","explicitat":"explicita","explicitatea":"explicitate","explicitati":["explicitați","explicita","explicități","explicitate"],"explicitatii":"explicitate","explicitatul":"explicitat","explicitatule":"explicitat","explicitatului":"explicitat","explicitaturi":"explicitat","explicitaturile":"explicitat","explicitaturilor":"explicitat","explicitau":"explicita","explicite":"explicit","expliciteaza":"explicita","explicitele":"explicit","explicitez":"explicita","explicitezi":"explicita","expliciti":"explicit","explicitii":"explicit","explicitul":"explicit","exploatabila":["exploatabilă","exploatabil","exploatabila","exploatabil"],"exploatabile":"exploatabil","exploatabilele":"exploatabil","exploatabili":"exploatabil","exploatabilii":"exploatabil","exploatabilitatea":"exploatabilitate","exploatabilitati":"exploatabilitate","exploatabilitatii":"exploatabilitate","exploatabilitatile":"exploatabilitate","exploatabilitatilor":"exploatabilitate","exploatabilul":"exploatabil","exploatai":"exploata","exploatam":["exploatăm","exploata","exploatam","exploata"],"exploatand":"exploata","exploatanta":["exploatantă","exploatant","exploatanta","exploatant"],"exploatante":"exploatant","exploatantele":"exploatant","exploatanti":"exploatant","exploatantii":"exploatant","exploatantilor":"exploatant","exploatantul":"exploatant","exploatantule":"exploatant","exploatantului":"exploatant","exploatara":"exploata","exploataram":"exploata","exploatarati":"exploata","exploatarea":"exploatare","exploatari":"exploatare","exploatarii":"exploatare","exploatarile":"exploatare","exploatarilor":"exploatare","exploatase":"exploata","exploatasem":"exploata","exploatasera":"exploata","exploataseram":"exploata","exploataserati":"exploata","exploatasesi":"exploata","exploatasi":"exploata","exploatat":"exploata","exploatata":["exploatată","exploatat","exploatata","exploatat"],"exploatate":["exploatate","exploatat","exploatate","exploatată"],"exploatatei":"exploatată","exploatatele":["exploatatele","exploatat","exploatatele","exploatată"],"exploatatelor":"exploatată","exploatati":["exploatați","exploata","exploatați","exploatat"],"exploatatia":"exploatație","exploatatiei":"exploatație","exploatatii":["exploatații","exploatat","exploatații","exploatație"],"exploatatiile":"exploatație","exploatatiilor":"exploatație","exploatatiunea":"exploatațiune","exploatatiuni":"exploatațiune","exploatatiunii":"exploatațiune","exploatatiunile":"exploatațiune","exploatatiunilor":"exploatațiune","exploatatoare":"exploatator","exploatatoarea":"exploatatoare","exploatatoarei":"exploatatoare","exploatatoarele":"exploatatoare","exploatatoarelor":"exploatatoare","exploatatori":"exploatator","exploatatorii":"exploatator","exploatatorilor":"exploatator","exploatatorul":"exploatator","exploatatorule":"exploatator","exploatatorului":"exploatator","exploatatul":"exploatat","exploatau":"exploata","exploateaza":"exploata","exploatez":"exploata","exploatezi":"exploata","explodai":"exploda","explodam":["explodăm","exploda","explodam","exploda"],"explodand":"exploda","explodara":"exploda","explodaram":"exploda","explodarati":"exploda","explodarea":"explodare","explodari":"explodare","explodarii":"explodare","explodarile":"explodare","explodarilor":"explodare","explodase":"exploda","explodasem":"exploda","explodasera":"exploda","explodaseram":"exploda","explodaserati":"exploda","explodasesi":"exploda","explodasi":"exploda","explodat":"exploda","explodata":["explodată","explodat","explodata","explodat"],"explodate":"explodat","explodatele":"explodat","explodati":["explodați","exploda","explodați","explodat"],"explodatii":"explodat","explodatul":"explodat","explodau":"exploda","explodeaza":"exploda","explodez":"exploda","explodezi":"exploda","explodoare":"explodor","explodoarele":"explodor","explodoarelor":"explodor","explodorul":"explodor","explodorule":"explodor","explodorului":"explodor","explorabila":["explorabilă","explorabil","explorabila","explorabil"],"explorabile":"explorabil","explorabilele":"explorabil","explorabili":"explorabil","explorabilii":"explorabil","explorabilul":"explorabil","explorai":"explora","exploram":["explorăm","explora","exploram","explora"],"explorand":"explora","explorara":"explora","exploraram":"explora","explorarati":"explora","explorarea":"explorare","explorari":"explorare","explorarii":"explorare","explorarile":"explorare","explorarilor":"explorare","explorase":"explora","explorasem":"explora","explorasera":"explora","exploraseram":"explora","exploraserati":"explora","explorasesi":"explora","explorasi":"explora","explorat":"explora","explorata":["explorată","explorat","explorata","explorat"],"explorate":"explorat","exploratele":"explorat","explorati":["explorați","explora","explorați","explorat"],"exploratia":"explorație","exploratiei":"explorație","exploratii":["explorații","explorat","explorații","explorație"],"exploratiile":"explorație","exploratiilor":"explorație","exploratiunea":"explorațiune","exploratiuni":"explorațiune","exploratiunii":"explorațiune","exploratiunile":"explorațiune","exploratiunilor":"explorațiune","explorativa":["explorativă","explorativ","explorativa","explorativ"],"explorative":"explorativ","explorativele":"explorativ","explorativi":"explorativ","explorativii":"explorativ","explorativul":"explorativ","exploratoarea":"exploratoare","exploratoarei":"exploratoare","exploratoarele":"exploratoare","exploratoarelor":"exploratoare","exploratori":"explorator","exploratorii":"explorator","exploratorilor":"explorator","exploratorul":"explorator","exploratorule":"explorator","exploratorului":"explorator","exploratul":"explorat","explorau":"explora","exploreaza":"explora","explorez":"explora","explorezi":"explora","explosiunea":"explosiune","explosiuni":"explosiune","explosiunii":"explosiune","explosiunile":"explosiune","explosiunilor":"explosiune","explozia":"explozie","explozibila":"explozibil","explozibile":"explozibil","explozibili":"explozibil","explozibilile":"explozibil","explozibililor":"explozibil","explozibilul":"explozibil","explozibilule":"explozibil","explozibilului":"explozibil","exploziei":"explozie","explozii":"explozie","exploziile":"explozie","exploziilor":"explozie","explozimetre":"explozimetru","explozimetrele":"explozimetru","explozimetrelor":"explozimetru","explozimetruul":"explozimetru","explozimetruule":"explozimetru","explozimetruului":"explozimetru","explozitivitatea":"explozitivitate","explozitivitati":"explozitivitate","explozitivitatii":"explozitivitate","explozitivitatile":"explozitivitate","explozitivitatilor":"explozitivitate","exploziunea":"exploziune","exploziuni":"exploziune","exploziunii":"exploziune","exploziunile":"exploziune","exploziunilor":"exploziune","explozive":"explozivă","explozivei":"explozivă","explozivele":"explozivă","explozivelor":"explozivă","explozivi":"exploziv","explozivile":"exploziv","explozivilor":"exploziv","explozivitatea":"explozivitate","explozivitati":"explozivitate","explozivitatii":"explozivitate","explozivitatile":"explozivitate","explozivitatilor":"explozivitate","explozivul":"exploziv","explozivule":"exploziv","explozivului":"exploziv","explozoare":"explozor","explozoarele":"explozor","explozoarelor":"explozor","explozorul":"explozor","explozorule":"explozor","explozorului":"explozor","exponate":"exponat","exponatele":"exponat","exponatelor":"exponat","exponatul":"exponat","exponatule":"exponat","exponatului":"exponat","exponente":"exponentă","exponentei":"exponentă","exponentele":"exponentă","exponentelor":"exponentă","exponenti":"exponent","exponentiala":["exponențială","exponențial","exponențiala","exponențial"],"exponentiale":"exponențial","exponentialele":"exponențial","exponentiali":"exponențial","exponentialii":"exponențial","exponentialul":"exponențial","exponentii":"exponent","exponentilor":"exponent","exponentul":"exponent","exponentule":"exponent","exponentului":"exponent","exponometre":"exponometru","exponometrele":"exponometru","exponometrelor":"exponometru","exponometrul":"exponometru","exponometrule":"exponometru","exponometrului":"exponometru","export":"exporta","exportabila":["exportabilă","exportabil","exportabila","exportabil"],"exportabile":"exportabil","exportabilele":"exportabil","exportabili":"exportabil","exportabilii":"exportabil","exportabilul":"exportabil","exportai":"exporta","exportam":["exportăm","exporta","exportam","exporta"],"exportand":"exporta","exportara":"exporta","exportaram":"exporta","exportarati":"exporta","exportarea":"exportare","exportari":"exportare","exportarii":"exportare","exportarile":"exportare","exportarilor":"exportare","exportase":"exporta","exportasem":"exporta","exportasera":"exporta","exportaseram":"exporta","exportaserati":"exporta","exportasesi":"exporta","exportasi":"exporta","exportat":"exporta","exportata":["exportată","exportat","exportata","exportat"],"exportate":"exportat","exportatele":"exportat","exportati":["exportați","exporta","exportați","exportat"],"exportatia":"exportație","exportatiei":"exportație","exportatii":["exportații","exportat","exportații","exportație"],"exportatiile":"exportație","exportatiilor":"exportație","exportatiunea":"exportațiune","exportatiuni":"exportațiune","exportatiunii":"exportațiune","exportatiunile":"exportațiune","exportatiunilor":"exportațiune","exportatoarea":"exportatoare","exportatoarei":"exportatoare","exportatoarele":"exportatoare","exportatoarelor":"exportatoare","exportatori":"exportator","exportatorii":"exportator","exportatorilor":"exportator","exportatorul":"exportator","exportatorule":"exportator","exportatorului":"exportator","exportatul":"exportat","exportau":"exporta","exporte":"exporta","exporti":"exporta","exportuia":"exportui","exportuiai":"exportui","exportuiam":"exportui","exportuiati":"exportui","exportuiau":"exportui","exportuie":"exportui","exportuii":"exportui","exportuim":"exportui","exportuind":"exportui","exportuira":"exportui","exportuiram":"exportui","exportuirati":"exportui","exportuise":"exportui","exportuisem":"exportui","exportuisera":"exportui","exportuiseram":"exportui","exportuiserati":"exportui","exportuisesi":"exportui","exportuisi":"exportui","exportuit":"exportui","exportuiti":"exportui","exportul":"export","exportule":"export","exportului":"export","exporturi":"export","exporturi invizibile":"export invizibil","exporturile":"export","exporturilor":"export","expozabila":["expozabilă","expozabil","expozabila","expozabil"],"expozabile":"expozabil","expozabilele":"expozabil","expozabili":"expozabil","expozabilii":"expozabil","expozabilul":"expozabil","expozante":"expozantă","expozantei":"expozantă","expozantele":"expozantă","expozantelor":"expozantă","expozanti":"expozant","expozantii":"expozant","expozantilor":"expozant","expozantul":"expozant","expozantule":"expozant","expozantului":"expozant","expozeul":"expozeu","expozeule":"expozeu","expozeului":"expozeu","expozeuri":"expozeu","expozeurile":"expozeu","expozeurilor":"expozeu","expozitia":"expoziție","expozitiei":"expoziție","expozitii":"expoziție","expozitiile":"expoziție","expozitiilor":"expoziție","expozitionala":["expozițională","expozițional","expoziționala","expozițional"],"expozitionale":"expozițional","expozitionalele":"expozițional","expozitionali":"expozițional","expozitionalii":"expozițional","expozitionalul":"expozițional","expozitiunea":"expozițiune","expozitiuni":"expozițiune","expozitiunii":"expozițiune","expozitiunile":"expozițiune","expozitiunilor":"expozițiune","expozitiva":["expozitivă","expozitiv","expozitiva","expozitiv"],"expozitive":"expozitiv","expozitivele":"expozitiv","expozitivi":"expozitiv","expozitivii":"expozitiv","expozitivul":"expozitiv","expresa":["expresă","expres","expresa","expres"],"exprese":"expres","expresele":"expres","expresi":"expres","expresia":"expresie","expresiei":"expresie","expresii":["expreșii","expres","expresii","expresie"],"expresii lambda":"expresie lambda","expresiile":"expresie","expresiilor":"expresie","expresionisme":"expresionism","expresionismele":"expresionism","expresionismelor":"expresionism","expresionismul":"expresionism","expresionismule":"expresionism","expresionismului":"expresionism","expresionista":["expresionistă","expresionist","expresionista","expresionist"],"expresioniste":["expresioniste","expresionist","expresioniste","expresionistă"],"expresionistei":"expresionistă","expresionistele":["expresionistele","expresionist","expresionistele","expresionistă"],"expresionistelor":"expresionistă","expresionisti":"expresionist","expresionistii":"expresionist","expresionistilor":"expresionist","expresionistul":"expresionist","expresionistule":"expresionist","expresionistului":"expresionist","expresiunea":"expresiune","expresiuni":"expresiune","expresiunii":"expresiune","expresiunile":"expresiune","expresiunilor":"expresiune","expresiva":["expresivă","expresiv","expresiva","expresiv"],"expresive":"expresiv","expresivele":"expresiv","expresivi":"expresiv","expresivii":"expresiv","expresivitatea":"expresivitate","expresivitati":"expresivitate","expresivitatii":"expresivitate","expresivitatile":"expresivitate","expresivitatilor":"expresivitate","expresivul":"expresiv","expresul":"expres","exprim":"exprima","exprimabila":["exprimabilă","exprimabil","exprimabila","exprimabil"],"exprimabile":"exprimabil","exprimabilele":"exprimabil","exprimabili":"exprimabil","exprimabilii":"exprimabil","exprimabilul":"exprimabil","exprimai":"exprima","exprimam":["exprimăm","exprima","exprimam","exprima"],"exprimand":"exprima","exprimara":"exprima","exprimaram":"exprima","exprimarati":"exprima","exprimari":"exprimare","exprimase":"exprima","exprimasem":"exprima","exprimasera":"exprima","exprimaseram":"exprima","exprimaserati":"exprima","exprimasesi":"exprima","exprimasi":"exprima","exprimat":"exprima","exprimata":["exprimată","exprimat","exprimata","exprimat"],"exprimate":"exprimat","exprimatele":"exprimat","exprimati":["exprimați","exprima","exprimați","exprimat"],"exprimatii":"exprimat","exprimatul":"exprimat","exprimau":"exprima","exprime":"exprima","exprimi":"exprima","expropriai":"expropria","expropriam":"expropria","expropriara":"expropria","expropriaram":"expropria","expropriarati":"expropria","expropriase":"expropria","expropriasem":"expropria","expropriasera":"expropria","expropriaseram":"expropria","expropriaserati":"expropria","expropriasesi":"expropria","expropriasi":"expropria","expropriat":"expropria","expropriata":["expropriată","expropriat","expropriata","expropriat"],"expropriate":["expropriate","expropriat","expropriate","expropriată"],"expropriatei":"expropriată","expropriatele":["expropriatele","expropriat","expropriatele","expropriată"],"expropriatelor":"expropriată","expropriati":["expropriați","expropria","expropriați","expropriat"],"expropriatia":"expropriație","expropriatiei":"expropriație","expropriatii":["expropriații","expropriat","expropriații","expropriație"],"expropriatiile":"expropriație","expropriatiilor":"expropriație","expropriatoarea":"expropriatoare","expropriatoarei":"expropriatoare","expropriatoarele":"expropriatoare","expropriatoarelor":"expropriatoare","expropriatori":"expropriator","expropriatorii":"expropriator","expropriatorilor":"expropriator","expropriatorul":"expropriator","expropriatorule":"expropriator","expropriatorului":"expropriator","expropriatul":"expropriat","expropriau":"expropria","expropriaza":"expropria","exproprie":"expropria","expropriem":"expropria","exproprierea":"expropriere","exproprieri":"expropriere","exproprierii":"expropriere","exproprierile":"expropriere","exproprierilor":"expropriere","expropriez":"expropria","expropriezi":"expropria","expropriind":"expropria","expui":"expune","expulsai":"expulsa","expulsam":["expulsăm","expulsa","expulsam","expulsa"],"expulsand":"expulsa","expulsara":"expulsa","expulsaram":"expulsa","expulsarati":"expulsa","expulsase":"expulsa","expulsasem":"expulsa","expulsasera":"expulsa","expulsaseram":"expulsa","expulsaserati":"expulsa","expulsasesi":"expulsa","expulsasi":"expulsa","expulsat":"expulsa","expulsati":"expulsa","expulsau":"expulsa","expulseaza":"expulsa","expulsez":"expulsa","expulsezi":"expulsa","expulsia":"expulsie","expulsiei":"expulsie","expulsii":"expulsie","expulsiile":"expulsie","expulsiilor":"expulsie","expulsiunea":"expulsiune","expulsiuni":"expulsiune","expulsiunii":"expulsiune","expulsiunile":"expulsiune","expulsiunilor":"expulsiune","expulzai":"expulza","expulzam":["expulzăm","expulza","expulzam","expulza"],"expulzand":"expulza","expulzara":"expulza","expulzaram":"expulza","expulzarati":"expulza","expulzarea":"expulzare","expulzari":"expulzare","expulzarii":"expulzare","expulzarile":"expulzare","expulzarilor":"expulzare","expulzase":"expulza","expulzasem":"expulza","expulzasera":"expulza","expulzaseram":"expulza","expulzaserati":"expulza","expulzasesi":"expulza","expulzasi":"expulza","expulzat":"expulza","expulzata":["expulzată","expulzat","expulzata","expulzat"],"expulzate":"expulzat","expulzatele":"expulzat","expulzati":["expulzați","expulza","expulzați","expulzat"],"expulzatii":"expulzat","expulzatul":"expulzat","expulzau":"expulza","expulzeaza":"expulza","expulzez":"expulza","expulzezi":"expulza","expulziunea":"expulziune","expulziuni":"expulziune","expulziunii":"expulziune","expulziunile":"expulziune","expulziunilor":"expulziune","expun":"expune","expuna":"expune","expunand":"expune","expunctiunea":"expuncțiune","expunctiuni":"expuncțiune","expunctiunii":"expuncțiune","expunctiunile":"expuncțiune","expunctiunilor":"expuncțiune","expunea":"expune","expuneai":"expune","expuneam":"expune","expuneati":"expune","expuneau":"expune","expunem":"expune","expunerea":"expunere","expuneri":"expunere","expunerii":"expunere","expunerile":"expunere","expunerilor":"expunere","expuneti":"expune","expurg":"expurga","expurgai":"expurga","expurgam":["expurgăm","expurga","expurgam","expurga"],"expurgand":"expurga","expurgara":"expurga","expurgaram":"expurga","expurgarati":"expurga","expurgarea":"expurgare","expurgari":"expurgare","expurgarii":"expurgare","expurgarile":"expurgare","expurgarilor":"expurgare","expurgase":"expurga","expurgasem":"expurga","expurgasera":"expurga","expurgaseram":"expurga","expurgaserati":"expurga","expurgasesi":"expurga","expurgasi":"expurga","expurgat":"expurga","expurgata":["expurgată","expurgat","expurgata","expurgat"],"expurgate":"expurgat","expurgatele":"expurgat","expurgati":["expurgați","expurga","expurgați","expurgat"],"expurgatia":"expurgație","expurgatiei":"expurgație","expurgatii":["expurgații","expurgat","expurgații","expurgație"],"expurgatiile":"expurgație","expurgatiilor":"expurgație","expurgatul":"expurgat","expurgau":"expurga","expurgi":"expurga","expus":"expune","expusa":["expusă","expus","expusa","expus"],"expuse":["expuse","expune","expuse","expus"],"expusei":"expune","expusele":"expus","expusera":"expune","expuseram":"expune","expuserati":"expune","expusese":"expune","expusesem":"expune","expusesera":"expune","expuseseram":"expune","expuseserati":"expune","expusesesi":"expune","expusesi":"expune","expusi":"expus","expusii":"expus","expusul":"expus","exsangua":["exsanguă","exsanguu","exsangua","exsanguu"],"exsangue":"exsanguu","exsanguele":"exsanguu","exsangui":"exsanguu","exsanguii":"exsanguu","exsanguinotransfuzia":"exsanguinotransfuzie","exsanguinotransfuzie":"exsangvinotransfuzie","exsanguinotransfuziei":"exsanguinotransfuzie","exsanguinotransfuzii":"exsanguinotransfuzie","exsanguinotransfuziile":"exsanguinotransfuzie","exsanguinotransfuziilor":"exsanguinotransfuzie","exsanguul":"exsanguu","exsangvinotransfuzia":"exsangvinotransfuzie","exsangvinotransfuziei":"exsangvinotransfuzie","exsangvinotransfuzii":"exsangvinotransfuzie","exsangvinotransfuziile":"exsangvinotransfuzie","exsangvinotransfuziilor":"exsangvinotransfuzie","exsicatoare":"exsicator","exsicatoarele":"exsicator","exsicatoarelor":"exsicator","exsicatorul":"exsicator","exsicatorule":"exsicator","exsicatorului":"exsicator","exsudanta":["exsudantă","exsudant","exsudanta","exsudant"],"exsudante":"exsudant","exsudantele":"exsudant","exsudanti":"exsudant","exsudantii":"exsudant","exsudantul":"exsudant","exsudate":"exsudat","exsudatele":"exsudat","exsudatelor":"exsudat","exsudatia":"exsudație","exsudatiei":"exsudație","exsudatii":"exsudație","exsudatiile":"exsudație","exsudatiilor":"exsudație","exsudatul":"exsudat","exsudatule":"exsudat","exsudatului":"exsudat","extatica":["extatică","extatic","extatica","extatic"],"extatice":"extatic","extaticele":"extatic","extatici":"extatic","extaticii":"extatic","extaticul":"extatic","extaze":"extaz","extazele":"extaz","extazelor":"extaz","extaziai":"extazia","extaziam":"extazia","extaziara":"extazia","extaziaram":"extazia","extaziarati":"extazia","extaziase":"extazia","extaziasem":"extazia","extaziasera":"extazia","extaziaseram":"extazia","extaziaserati":"extazia","extaziasesi":"extazia","extaziasi":"extazia","extaziat":"extazia","extaziata":["extaziată","extaziat","extaziata","extaziat"],"extaziate":"extaziat","extaziatele":"extaziat","extaziati":["extaziați","extazia","extaziați","extaziat"],"extaziatii":"extaziat","extaziatul":"extaziat","extaziau":"extazia","extaziaza":"extazia","extazie":"extazia","extazieaza":"extazia","extaziem":"extazia","extazierea":"extaziere","extazieri":"extaziere","extazierii":"extaziere","extazierile":"extaziere","extazierilor":"extaziere","extaziez":"extazia","extaziezi":"extazia","extaziind":"extazia","extazul":"extaz","extazule":"extaz","extazului":"extaz","extemporale":"extemporal","extemporalele":"extemporal","extemporalelor":"extemporal","extemporalul":"extemporal","extemporalule":"extemporal","extemporalului":"extemporal","extemporanee":"extemporaneu","extemporaneea":"extemporaneu","extemporaneele":"extemporaneu","extemporanei":"extemporaneu","extemporaneii":"extemporaneu","extemporaneul":"extemporaneu","extensibila":["extensibilă","extensibil","extensibila","extensibil"],"extensibile":"extensibil","extensibilele":"extensibil","extensibili":"extensibil","extensibilii":"extensibil","extensibilitatea":"extensibilitate","extensibilitati":"extensibilitate","extensibilitatii":"extensibilitate","extensibilitatile":"extensibilitate","extensibilitatilor":"extensibilitate","extensibilul":"extensibil","extensie":"extensiune","extensii":"extensie","extensiuni":"extensiune","extensiva":["extensivă","extensiv","extensiva","extensiv"],"extensive":"extensiv","extensivele":"extensiv","extensivi":"extensiv","extensivii":"extensiv","extensivul":"extensiv","extensografe":"extensograf","extensografele":"extensograf","extensografelor":"extensograf","extensograful":"extensograf","extensografule":"extensograf","extensografului":"extensograf","extensori":"extensor","extensorile":"extensor","extensorilor":"extensor","extensorul":"extensor","extensorule":"extensor","extensorului":"extensor","extenuai":"extenua","extenuam":["extenuăm","extenua","extenuam","extenua"],"extenuand":"extenua","extenuanta":["extenuantă","extenuant","extenuanta","extenuant"],"extenuante":"extenuant","extenuantele":"extenuant","extenuanti":"extenuant","extenuantii":"extenuant","extenuantul":"extenuant","extenuara":"extenua","extenuaram":"extenua","extenuarati":"extenua","extenuarea":"extenuare","extenuari":"extenuare","extenuarii":"extenuare","extenuarile":"extenuare","extenuarilor":"extenuare","extenuase":"extenua","extenuasem":"extenua","extenuasera":"extenua","extenuaseram":"extenua","extenuaserati":"extenua","extenuasesi":"extenua","extenuasi":"extenua","extenuat":"extenua","extenuata":["extenuată","extenuat","extenuata","extenuat"],"extenuate":"extenuat","extenuatele":"extenuat","extenuati":["extenuați","extenua","extenuați","extenuat"],"extenuatii":"extenuat","extenuatul":"extenuat","extenuau":"extenua","extenueaza":"extenua","extenuez":"extenua","extenuezi":"extenua","exterioara":["exterioară","exterior","exterioara","exterior"],"exterioare":"exterior","exterioarele":"exterior","exterioarelor":"exterior","exteriori":"exterior","exteriorii":"exterior","exterioritatea":"exterioritate","exterioritati":"exterioritate","exterioritatii":"exterioritate","exterioritatile":"exterioritate","exterioritatilor":"exterioritate","exteriorizai":"exterioriza","exteriorizam":["exteriorizăm","exterioriza","exteriorizam","exterioriza"],"exteriorizand":"exterioriza","exteriorizara":"exterioriza","exteriorizaram":"exterioriza","exteriorizarati":"exterioriza","exteriorizarea":"exteriorizare","exteriorizari":"exteriorizare","exteriorizarii":"exteriorizare","exteriorizarile":"exteriorizare","exteriorizarilor":"exteriorizare","exteriorizase":"exterioriza","exteriorizasem":"exterioriza","exteriorizasera":"exterioriza","exteriorizaseram":"exterioriza","exteriorizaserati":"exterioriza","exteriorizasesi":"exterioriza","exteriorizasi":"exterioriza","exteriorizat":"exterioriza","exteriorizata":["exteriorizată","exteriorizat","exteriorizata","exteriorizat"],"exteriorizate":"exteriorizat","exteriorizatele":"exteriorizat","exteriorizati":["exteriorizați","exterioriza","exteriorizați","exteriorizat"],"exteriorizatii":"exteriorizat","exteriorizatul":"exteriorizat","exteriorizau":"exterioriza","exteriorizeaza":"exterioriza","exteriorizez":"exterioriza","exteriorizezi":"exterioriza","exteriorul":"exterior","exteriorule":"exterior","exteriorului":"exterior","exteritoriala":["exteritorială","exteritorial","exteritoriala","exteritorial"],"exteritoriale":"exteritorial","exteritorialele":"exteritorial","exteritoriali":"exteritorial","exteritorialii":"exteritorial","exteritorialitatea":"exteritorialitate","exteritorialitati":"exteritorialitate","exteritorialitatii":"exteritorialitate","exteritorialitatile":"exteritorialitate","exteritorialitatilor":"exteritorialitate","exteritorialul":"exteritorial","extermin":"extermina","exterminai":"extermina","exterminam":["exterminăm","extermina","exterminam","extermina"],"exterminand":"extermina","exterminanta":["exterminantă","exterminant","exterminanta","exterminant"],"exterminante":"exterminant","exterminantele":"exterminant","exterminanti":"exterminant","exterminantii":"exterminant","exterminantul":"exterminant","exterminara":"extermina","exterminaram":"extermina","exterminarati":"extermina","exterminarea":"exterminare","exterminari":"exterminare","exterminarii":"exterminare","exterminarile":"exterminare","exterminarilor":"exterminare","exterminase":"extermina","exterminasem":"extermina","exterminasera":"extermina","exterminaseram":"extermina","exterminaserati":"extermina","exterminasesi":"extermina","exterminasi":"extermina","exterminat":"extermina","exterminata":["exterminată","exterminat","exterminata","exterminat"],"exterminate":"exterminat","exterminatele":"exterminat","exterminati":["exterminați","extermina","exterminați","exterminat"],"exterminatii":"exterminat","exterminatiunea":"exterminațiune","exterminatiuni":"exterminațiune","exterminatiunii":"exterminațiune"};
@@ -0,0 +1 @@
+export default {"exterminatiunile":"exterminațiune","exterminatiunilor":"exterminațiune","exterminatoarea":"exterminatoare","exterminatoarei":"exterminatoare","exterminatoarele":"exterminatoare","exterminatoarelor":"exterminatoare","exterminatori":"exterminator","exterminatorii":"exterminator","exterminatorilor":"exterminator","exterminatorul":"exterminator","exterminatorule":"exterminator","exterminatorului":"exterminator","exterminatul":"exterminat","exterminau":"extermina","extermine":"extermina","extermini":"extermina","externa":["externă","extern","externa","extern"],"externai":"externa","externalizai":"externaliza","externalizam":["externalizăm","externaliza","externalizam","externaliza"],"externalizand":"externaliza","externalizara":"externaliza","externalizaram":"externaliza","externalizarati":"externaliza","externalizase":"externaliza","externalizasem":"externaliza","externalizasera":"externaliza","externalizaseram":"externaliza","externalizaserati":"externaliza","externalizasesi":"externaliza","externalizasi":"externaliza","externalizat":"externaliza","externalizati":"externaliza","externalizau":"externaliza","externalizeaza":"externaliza","externalizez":"externaliza","externalizezi":"externaliza","externam":["externăm","externa","externam","externa"],"externand":"externa","externara":"externa","externaram":"externa","externarati":"externa","externarea":"externare","externari":"externare","externarii":"externare","externarile":"externare","externarilor":"externare","externase":"externa","externasem":"externa","externasera":"externa","externaseram":"externa","externaserati":"externa","externasesi":"externa","externasi":"externa","externat":"externa","externata":["externată","externat","externata","externat"],"externate":"externat","externatele":"externat","externati":["externați","externa","externați","externat"],"externatii":"externat","externatul":"externat","externau":"externa","externe":["externe","extern","externe","externă"],"externeaza":"externa","externei":"externă","externele":["externele","extern","externele","externă"],"externelor":"externă","externez":"externa","externezi":"externa","externi":"extern","externii":"extern","externul":"extern","exteroceptiva":["exteroceptivă","exteroceptiv","exteroceptiva","exteroceptiv"],"exteroceptive":"exteroceptiv","exteroceptivele":"exteroceptiv","exteroceptivi":"exteroceptiv","exteroceptivii":"exteroceptiv","exteroceptivul":"exteroceptiv","exteroceptori":"exteroceptor","exteroceptorii":"exteroceptor","exteroceptorilor":"exteroceptor","exteroceptorul":"exteroceptor","exteroceptorule":"exteroceptor","exteroceptorului":"exteroceptor","extinctia":"extincție","extinctiei":"extincție","extinctii":"extincție","extinctiile":"extincție","extinctiilor":"extincție","extinctiunea":"extincțiune","extinctiuni":"extincțiune","extinctiunii":"extincțiune","extinctiunile":"extincțiune","extinctiunilor":"extincțiune","extinctiva":["extinctivă","extinctiv","extinctiva","extinctiv"],"extinctive":"extinctiv","extinctivele":"extinctiv","extinctivi":"extinctiv","extinctivii":"extinctiv","extinctivul":"extinctiv","extinctoare":"extinctor","extinctoarele":"extinctor","extinctoarelor":"extinctor","extinctorul":"extinctor","extinctorule":"extinctor","extinctorului":"extinctor","extind":"extinde","extinda":"extinde","extindea":"extinde","extindeai":"extinde","extindeam":"extinde","extindeati":"extinde","extindeau":"extinde","extindem":"extinde","extinderi":"extindere","extindeti":"extinde","extingibila":["extingibilă","extingibil","extingibila","extingibil"],"extingibile":"extingibil","extingibilele":"extingibil","extingibili":"extingibil","extingibilii":"extingibil","extingibilul":"extingibil","extins":"extinde","extinsa":["extinsă","extins","extinsa","extins"],"extinse":["extinse","extinde","extinse","extins"],"extinsei":"extinde","extinsele":"extins","extinsera":"extinde","extinseram":"extinde","extinserati":"extinde","extinsese":"extinde","extinsesem":"extinde","extinsesera":"extinde","extinseseram":"extinde","extinseserati":"extinde","extinsesesi":"extinde","extinsesi":"extinde","extinsi":"extins","extinsii":"extins","extinsul":"extins","extinzand":"extinde","extinzi":"extinde","extirp":"extirpa","extirpabila":["extirpabilă","extirpabil","extirpabila","extirpabil"],"extirpabile":"extirpabil","extirpabilele":"extirpabil","extirpabili":"extirpabil","extirpabilii":"extirpabil","extirpabilul":"extirpabil","extirpai":"extirpa","extirpam":["extirpăm","extirpa","extirpam","extirpa"],"extirpand":"extirpa","extirpara":"extirpa","extirparam":"extirpa","extirparati":"extirpa","extirparea":"extirpare","extirpari":"extirpare","extirparii":"extirpare","extirparile":"extirpare","extirparilor":"extirpare","extirpase":"extirpa","extirpasem":"extirpa","extirpasera":"extirpa","extirpaseram":"extirpa","extirpaserati":"extirpa","extirpasesi":"extirpa","extirpasi":"extirpa","extirpat":"extirpa","extirpata":["extirpată","extirpat","extirpata","extirpat"],"extirpate":"extirpat","extirpatele":"extirpat","extirpati":["extirpați","extirpa","extirpați","extirpat"],"extirpatia":"extirpație","extirpatiei":"extirpație","extirpatii":["extirpații","extirpat","extirpații","extirpație"],"extirpatiile":"extirpație","extirpatiilor":"extirpație","extirpatiunea":"extirpațiune","extirpatiuni":"extirpațiune","extirpatiunii":"extirpațiune","extirpatiunile":"extirpațiune","extirpatiunilor":"extirpațiune","extirpatori":"extirpator","extirpatorile":"extirpator","extirpatorilor":"extirpator","extirpatorul":"extirpator","extirpatorule":"extirpator","extirpatorului":"extirpator","extirpatul":"extirpat","extirpau":"extirpa","extirpe":"extirpa","extirpi":"extirpa","extispicii":"extispiciu","extispiciile":"extispiciu","extispiciilor":"extispiciu","extispiciul":"extispiciu","extispiciule":"extispiciu","extispiciului":"extispiciu","extorcai":"extorca","extorcam":["extorcăm","extorca","extorcam","extorca"],"extorcand":"extorca","extorcara":"extorca","extorcaram":"extorca","extorcarati":"extorca","extorcarea":"extorcare","extorcari":"extorcare","extorcarii":"extorcare","extorcarile":"extorcare","extorcarilor":"extorcare","extorcase":"extorca","extorcasem":"extorca","extorcasera":"extorca","extorcaseram":"extorca","extorcaserati":"extorca","extorcasesi":"extorca","extorcasi":"extorca","extorcat":"extorca","extorcata":["extorcată","extorcat","extorcata","extorcat"],"extorcate":"extorcat","extorcatele":"extorcat","extorcati":["extorcați","extorca","extorcați","extorcat"],"extorcatii":"extorcat","extorcatul":"extorcat","extorcau":"extorca","extorcheaza":"extorca","extorchez":"extorca","extorchezi":"extorca","extorsiunea":"extorsiune","extorsiuni":"extorsiune","extorsiunii":"extorsiune","extorsiunile":"extorsiune","extorsiunilor":"extorsiune","extraatmosferica":["extraatmosferică","extraatmosferic","extraatmosferica","extraatmosferic"],"extraatmosferice":"extraatmosferic","extraatmosfericele":"extraatmosferic","extraatmosferici":"extraatmosferic","extraatmosfericii":"extraatmosferic","extraatmosfericul":"extraatmosferic","extrabugetara":["extrabugetară","extrabugetar","extrabugetara","extrabugetar"],"extrabugetare":"extrabugetar","extrabugetarele":"extrabugetar","extrabugetari":"extrabugetar","extrabugetarii":"extrabugetar","extrabugetarul":"extrabugetar","extracelulara":["extracelulară","extracelular","extracelulara","extracelular"],"extracelulare":"extracelular","extracelularele":"extracelular","extracelulari":"extracelular","extracelularii":"extracelular","extracelularul":"extracelular","extraconjugala":["extraconjugală","extraconjugal","extraconjugala","extraconjugal"],"extraconjugale":"extraconjugal","extraconjugalele":"extraconjugal","extraconjugali":"extraconjugal","extraconjugalii":"extraconjugal","extraconjugalul":"extraconjugal","extraconstitutionala":["extraconstituțională","extraconstituțional","extraconstituționala","extraconstituțional"],"extraconstitutionale":"extraconstituțional","extraconstitutionalele":"extraconstituțional","extraconstitutionali":"extraconstituțional","extraconstitutionalii":"extraconstituțional","extraconstitutionalul":"extraconstituțional","extracorporala":["extracorporală","extracorporal","extracorporala","extracorporal"],"extracorporale":"extracorporal","extracorporalele":"extracorporal","extracorporali":"extracorporal","extracorporalii":"extracorporal","extracorporalul":"extracorporal","extracte":"extract","extractele":"extract","extractelor":"extract","extractia":"extracție","extractiei":"extracție","extractii":"extracție","extractiile":"extracție","extractiilor":"extracție","extractiunea":"extracțiune","extractiuni":"extracțiune","extractiunii":"extracțiune","extractiunile":"extracțiune","extractiunilor":"extracțiune","extractiva":["extractivă","extractiv","extractiva","extractiv"],"extractive":"extractiv","extractivele":"extractiv","extractivi":"extractiv","extractivii":"extractiv","extractivul":"extractiv","extractori":"extractor","extractorile":"extractor","extractorilor":"extractor","extractorul":"extractor","extractorule":"extractor","extractorului":"extractor","extractul":"extract","extractule":"extract","extractului":"extract","extradai":"extrăda","extradam":["extrădăm","extrăda","extrădam","extrăda"],"extradand":"extrăda","extradara":"extrăda","extradaram":"extrăda","extradarati":"extrăda","extradarea":"extrădare","extradari":"extrădare","extradarii":"extrădare","extradarile":"extrădare","extradarilor":"extrădare","extradase":"extrăda","extradasem":"extrăda","extradasera":"extrăda","extradaseram":"extrăda","extradaserati":"extrăda","extradasesi":"extrăda","extradasi":"extrăda","extradat":"extrăda","extradata":["extrădată","extrădat","extrădata","extrădat"],"extradate":"extrădat","extradatele":"extrădat","extradati":["extrădați","extrăda","extrădați","extrădat"],"extradatii":"extrădat","extradatul":"extrădat","extradau":"extrăda","extradeaza":"extrăda","extradez":"extrăda","extradezi":"extrăda","extraditia":"extradiție","extraditiei":"extradiție","extraditii":"extradiție","extraditiile":"extradiție","extraditiilor":"extradiție","extradosul":"extrados","extradosule":"extrados","extradosului":"extrados","extradosuri":"extrados","extradosurile":"extrados","extradosurilor":"extrados","extradotala":["extradotală","extradotal","extradotala","extradotal"],"extradotale":"extradotal","extradotalele":"extradotal","extradotali":"extradotal","extradotalii":"extradotal","extradotalul":"extradotal","extradura":["extradură","extradur","extradura","extradur"],"extradure":"extradur","extradurele":"extradur","extraduri":"extradur","extradurii":"extradur","extradurul":"extradur","extrafina":["extrafină","extrafin","extrafina","extrafin"],"extrafine":"extrafin","extrafinele":"extrafin","extrafini":"extrafin","extrafinii":"extrafin","extrafinul":"extrafin","extrag":"extrage","extraga":"extrage","extragalactica":["extragalactică","extragalactic","extragalactica","extragalactic"],"extragalactice":"extragalactic","extragalacticele":"extragalactic","extragalactici":"extragalactic","extragalacticii":"extragalactic","extragalacticul":"extragalactic","extragand":"extrage","extragea":"extrage","extrageai":"extrage","extrageam":"extrage","extrageati":"extrage","extrageau":"extrage","extragem":"extrage","extragerea":"extragere","extrageri":"extragere","extragerii":"extragere","extragerile":"extragere","extragerilor":"extragere","extrageti":"extrage","extragi":"extrage","extrajudiciara":["extrajudiciară","extrajudiciar","extrajudiciara","extrajudiciar"],"extrajudiciare":"extrajudiciar","extrajudiciarele":"extrajudiciar","extrajudiciari":"extrajudiciar","extrajudiciarii":"extrajudiciar","extrajudiciarul":"extrajudiciar","extralegala":["extralegală","extralegal","extralegala","extralegal"],"extralegale":"extralegal","extralegalele":"extralegal","extralegali":"extralegal","extralegalii":"extralegal","extralegalul":"extralegal","extralingvistica":["extralingvistică","extralingvistic","extralingvistica","extralingvistic"],"extralingvistice":"extralingvistic","extralingvisticele":"extralingvistic","extralingvistici":"extralingvistic","extralingvisticii":"extralingvistic","extralingvisticul":"extralingvistic","extramaritala":["extramaritală","extramarital","extramaritala","extramarital"],"extramaritale":"extramarital","extramaritalele":"extramarital","extramaritali":"extramarital","extramaritalii":"extramarital","extramaritalul":"extramarital","extranee":"extraneu","extraneea":"extraneu","extraneele":"extraneu","extranei":"extraneu","extraneii":"extraneu","extraneitatea":"extraneitate","extraneitati":"extraneitate","extraneitatii":"extraneitate","extraneitatile":"extraneitate","extraneitatilor":"extraneitate","extraneul":"extraneu","extranucleara":["extranucleară","extranuclear","extranucleara","extranuclear"],"extranucleare":"extranuclear","extranuclearele":"extranuclear","extranucleari":"extranuclear","extranuclearii":"extranuclear","extranuclearul":"extranuclear","extraordinara":["extraordinară","extraordinar","extraordinara","extraordinar"],"extraordinare":"extraordinar","extraordinarele":"extraordinar","extraordinari":"extraordinar","extraordinarii":"extraordinar","extraordinarul":"extraordinar","extraparlamentara":["extraparlamentară","extraparlamentar","extraparlamentara","extraparlamentar"],"extraparlamentare":"extraparlamentar","extraparlamentarele":"extraparlamentar","extraparlamentari":"extraparlamentar","extraparlamentarii":"extraparlamentar","extraparlamentarul":"extraparlamentar","extraperitoneala":["extraperitoneală","extraperitoneal","extraperitoneala","extraperitoneal"],"extraperitoneale":"extraperitoneal","extraperitonealele":"extraperitoneal","extraperitoneali":"extraperitoneal","extraperitonealii":"extraperitoneal","extraperitonealul":"extraperitoneal","extraplata":["extraplată","extraplat","extraplata","extraplat"],"extraplate":"extraplat","extraplatele":"extraplat","extraplati":"extraplat","extraplatii":"extraplat","extraplatul":"extraplat","extrapleurala":["extrapleurală","extrapleural","extrapleurala","extrapleural"],"extrapleurale":"extrapleural","extrapleuralele":"extrapleural","extrapleurali":"extrapleural","extrapleuralii":"extrapleural","extrapleuralul":"extrapleural","extrapolai":"extrapola","extrapolam":["extrapolăm","extrapola","extrapolam","extrapola"],"extrapoland":"extrapola","extrapolara":"extrapola","extrapolaram":"extrapola","extrapolarati":"extrapola","extrapolarea":"extrapolare","extrapolari":"extrapolare","extrapolarii":"extrapolare","extrapolarile":"extrapolare","extrapolarilor":"extrapolare","extrapolase":"extrapola","extrapolasem":"extrapola","extrapolasera":"extrapola","extrapolaseram":"extrapola","extrapolaserati":"extrapola","extrapolasesi":"extrapola","extrapolasi":"extrapola","extrapolat":"extrapola","extrapolati":"extrapola","extrapolatia":"extrapolație","extrapolatiei":"extrapolație","extrapolatii":"extrapolație","extrapolatiile":"extrapolație","extrapolatiilor":"extrapolație","extrapolau":"extrapola","extrapoleaza":"extrapola","extrapolez":"extrapola","extrapolezi":"extrapola","extraprofesionala":["extraprofesională","extraprofesional","extraprofesionala","extraprofesional"],"extraprofesionale":"extraprofesional","extraprofesionalele":"extraprofesional","extraprofesionali":"extraprofesional","extraprofesionalii":"extraprofesional","extraprofesionalul":"extraprofesional","extraretiniana":["extraretiniană","extraretinian","extraretiniana","extraretinian"],"extraretinianul":"extraretinian","extraretiniene":"extraretinian","extraretinienele":"extraretinian","extraretinieni":"extraretinian","extraretinienii":"extraretinian","extras":"extrage","extrasaturi":"extrăsătură","extrasaturii":"extrăsătură","extrasaturile":"extrăsătură","extrasaturilor":"extrăsătură","extrascolara":["extrașcolară","extrașcolar","extrașcolara","extrașcolar"],"extrascolare":"extrașcolar","extrascolarele":"extrașcolar","extrascolari":"extrașcolar","extrascolarii":"extrașcolar","extrascolarul":"extrașcolar","extrase":["extrase","extrage","extrase","extras"],"extrase de cont":"extras de cont","extrasei":"extrage","extrasele":"extras","extraselor":"extras","extrasensibila":["extrasensibilă","extrasensibil","extrasensibila","extrasensibil"],"extrasensibile":"extrasensibil","extrasensibilele":"extrasensibil","extrasensibili":"extrasensibil","extrasensibilii":"extrasensibil","extrasensibilul":"extrasensibil","extrasenzoriala":["extrasenzorială","extrasenzorial","extrasenzoriala","extrasenzorial"],"extrasenzoriale":"extrasenzorial","extrasenzorialele":"extrasenzorial","extrasenzoriali":"extrasenzorial","extrasenzorialii":"extrasenzorial","extrasenzorialul":"extrasenzorial","extrasera":"extrage","extraseram":"extrage","extraserati":"extrage","extrasese":"extrage","extrasesem":"extrage","extrasesera":"extrage","extraseseram":"extrage","extraseserati":"extrage","extrasesesi":"extrage","extrasesi":"extrage","extrasezonul":"extrasezon","extrasezonule":"extrasezon","extrasezonului":"extrasezon","extrasistole":"extrasistolă","extrasistolei":"extrasistolă","extrasistolele":"extrasistolă","extrasistolelor":"extrasistolă","extrastatutara":["extrastatutară","extrastatutar","extrastatutara","extrastatutar"],"extrastatutare":"extrastatutar","extrastatutarele":"extrastatutar","extrastatutari":"extrastatutar","extrastatutarii":"extrastatutar","extrastatutarul":"extrastatutar","extrasul":"extras","extrasule":"extras","extrasului":"extras","extraterestre":"extraterestră","extraterestrei":"extraterestră","extraterestrele":"extraterestră","extraterestrelor":"extraterestră","extraterestri":"extraterestru","extraterestrii":"extraterestru","extraterestrilor":"extraterestru","extraterestrul":"extraterestru","extraterestrule":"extraterestru","extraterestrului":"extraterestru","extrateritoriala":["extrateritorială","extrateritorial","extrateritoriala","extrateritorial"],"extrateritoriale":"extrateritorial","extrateritorialele":"extrateritorial","extrateritoriali":"extrateritorial","extrateritorialii":"extrateritorial","extrateritorialitatea":"extrateritorialitate","extrateritorialitati":"extrateritorialitate","extrateritorialitatii":"extrateritorialitate","extrateritorialitatile":"extrateritorialitate","extrateritorialitatilor":"extrateritorialitate","extrateritorialul":"extrateritorial","extraurbana":["extraurbană","extraurban","extraurbana","extraurban"],"extraurbane":"extraurban","extraurbanele":"extraurban","extraurbani":"extraurban","extraurbanii":"extraurban","extraurbanul":"extraurban","extrauterina":["extrauterină","extrauterin","extrauterina","extrauterin"],"extrauterine":"extrauterin","extrauterinele":"extrauterin","extrauterini":"extrauterin","extrauterinii":"extrauterin","extrauterinul":"extrauterin","extravaganta":["extravagantă","extravagant","extravaganta","extravagant"],"extravagante":["extravagante","extravagant","extravaganțe","extravaganță"],"extravagantei":"extravaganță","extravagantele":["extravagantele","extravagant","extravaganțele","extravaganță"],"extravagantelor":"extravaganță","extravaganti":"extravagant","extravagantii":"extravagant","extravagantul":"extravagant","extravazarea":"extravazare","extravazari":"extravazare","extravazarii":"extravazare","extravazarile":"extravazare","extravazarilor":"extravazare","extraversiunea":"extraversiune","extraversiuni":"extraversiune","extraversiunii":"extraversiune","extraversiunile":"extraversiune","extraversiunilor":"extraversiune","extravertita":["extravertită","extravertit","extravertita","extravertit"],"extravertite":"extravertit","extravertitele":"extravertit","extravertiti":"extravertit","extravertitii":"extravertit","extravertitul":"extravertit","extravilana":["extravilană","extravilan","extravilana","extravilan"],"extravilane":"extravilan","extravilanele":"extravilan","extravilani":"extravilan","extravilanii":"extravilan","extravilanul":"extravilan","extravilanule":"extravilan","extravilanului":"extravilan","extrema":["extremă","extrem","extrema","extrem"],"extremale":"extremală","extremalei":"extremală","extremalele":"extremală","extremalelor":"extremală","extreme":"extrem","extremele":"extrem","extremi":"extrem","extremii":"extrem","extremismul":"extremism","extremismule":"extremism","extremismului":"extremism","extremiste":"extremistă","extremistei":"extremistă","extremistele":"extremistă","extremistelor":"extremistă","extremisti":"extremist","extremistii":"extremist","extremistilor":"extremist","extremistul":"extremist","extremistule":"extremist","extremistului":"extremist","extremitatea":"extremitate","extremitati":"extremitate","extremitatii":"extremitate","extremitatile":"extremitate","extremitatilor":"extremitate","extremul":"extrem","extrinseca":["extrinsecă","extrinsec","extrinseca","extrinsec"],"extrinsece":"extrinsec","extrinsecele":"extrinsec","extrinseci":"extrinsec","extrinsecii":"extrinsec","extrinsecul":"extrinsec","extrofia":"extrofie","extrofiei":"extrofie","extrofii":"extrofie","extrofiile":"extrofie","extrofiilor":"extrofie","extrospectia":"extrospecție","extrospectiei":"extrospecție","extrospectii":"extrospecție","extrospectiile":"extrospecție","extrospectiilor":"extrospecție","extrospectiva":["extrospectivă","extrospectiv","extrospectiva","extrospectiv"],"extrospective":"extrospectiv","extrospectivele":"extrospectiv","extrospectivi":"extrospectiv","extrospectivii":"extrospectiv","extrospectivul":"extrospectiv","extroversiunea":"extroversiune","extroversiuni":"extroversiune","extroversiunii":"extroversiune","extroversiunile":"extroversiune","extroversiunilor":"extroversiune","extrovertita":["extrovertită","extrovertit","extrovertita","extrovertit"],"extrovertite":"extrovertit","extrovertitele":"extrovertit","extrovertiti":"extrovertit","extrovertitii":"extrovertit","extrovertitul":"extrovertit","extrudarea":"extrudare","extrudari":"extrudare","extrudarii":"extrudare","extrudarile":"extrudare","extrudarilor":"extrudare","extruderea":"extrudere","extruderi":"extrudere","extruderii":"extrudere","extruderile":"extrudere","extruderilor":"extrudere","extruziunea":"extruziune","extruziuni":"extruziune","extruziunii":"extruziune","extruziunile":"extruziune","extruziunilor":"extruziune","exuberanta":["exuberantă","exuberant","exuberanta","exuberant"],"exuberante":["exuberante","exuberant","exuberanțe","exuberanță"],"exuberantei":"exuberanță","exuberantele":["exuberantele","exuberant","exuberanțele","exuberanță"],"exuberantelor":"exuberanță","exuberanti":"exuberant","exuberantii":"exuberant","exuberantul":"exuberant","exulceratia":"exulcerație","exulceratiei":"exulcerație","exulceratii":"exulcerație","exulceratiile":"exulcerație","exulceratiilor":"exulcerație","exult":"exulta","exultai":"exulta","exultam":["exultăm","exulta","exultam","exulta"],"exultand":"exulta","exultanta":["exultantă","exultant","exultanta","exultant"],"exultante":"exultant","exultantele":"exultant","exultanti":"exultant","exultantii":"exultant","exultantul":"exultant","exultara":"exulta","exultaram":"exulta","exultarati":"exulta","exultarea":"exultare","exultari":"exultare","exultarii":"exultare","exultarile":"exultare","exultarilor":"exultare","exultase":"exulta","exultasem":"exulta","exultasera":"exulta","exultaseram":"exulta","exultaserati":"exulta","exultasesi":"exulta","exultasi":"exulta","exultat":"exulta","exultati":"exulta","exultatia":"exultație","exultatiei":"exultație","exultatii":"exultație","exultatiile":"exultație","exultatiilor":"exultație","exultatiunea":"exultațiune","exultatiuni":"exultațiune","exultatiunii":"exultațiune","exultatiunile":"exultațiune","exultatiunilor":"exultațiune","exultau":"exulta","exulte":"exulta","exulti":"exulta","exuvia":"exuvie","exuviabila":["exuviabilă","exuviabil","exuviabila","exuviabil"],"exuviabile":"exuviabil","exuviabilele":"exuviabil","exuviabili":"exuviabil","exuviabilii":"exuviabil","exuviabilul":"exuviabil","exuviala":["exuvială","exuvial","exuviala","exuvial"],"exuviale":"exuvial","exuvialele":"exuvial","exuviali":"exuvial","exuvialii":"exuvial","exuvialul":"exuvial","exuviei":"exuvie","exuvii":"exuvie","exuviile":"exuvie","exuviilor":"exuvie","ezerine":"ezerină","ezerinei":"ezerină","ezerinele":"ezerină","ezerinelor":"ezerină","ezietul":"eziet","ezietule":"eziet","ezietului":"eziet","ezieturi":"eziet","ezieturile":"eziet","ezieturilor":"eziet","ezit":"ezita","ezitai":"ezita","ezitam":["ezităm","ezita","ezitam","ezita"],"ezitand":"ezita","ezitanta":["ezitantă","ezitant","ezitanta","ezitant"],"ezitante":"ezitant","ezitantele":"ezitant","ezitanti":"ezitant","ezitantii":"ezitant","ezitantul":"ezitant","ezitara":"ezita","ezitaram":"ezita","ezitarati":"ezita","ezitarea":"ezitare","ezitari":"ezitare","ezitarii":"ezitare","ezitarile":"ezitare","ezitarilor":"ezitare","ezitase":"ezita","ezitasem":"ezita","ezitasera":"ezita","ezitaseram":"ezita","ezitaserati":"ezita","ezitasesi":"ezita","ezitasi":"ezita","ezitat":"ezita","ezitati":"ezita","ezitatiunea":"ezitațiune","ezitatiuni":"ezitațiune","ezitatiunii":"ezitațiune","ezitatiunile":"ezitațiune","ezitatiunilor":"ezitațiune","ezitau":"ezita","eziti":"ezita","ezoterica":["ezoterică","ezoteric","ezoterica","ezoteric"],"ezoterice":"ezoteric","ezotericele":"ezoteric","ezoterici":"ezoteric","ezotericii":"ezoteric","ezotericul":"ezoteric","ezoterisme":"ezoterism","ezoterismele":"ezoterism","ezoterismelor":"ezoterism","ezoterismul":"ezoterism","ezoterismule":"ezoterism","ezoterismului":"ezoterism","ezredesi":"ezredeș","ezredesii":"ezredeș","ezredesilor":"ezredeș","ezredesul":"ezredeș","ezredesule":"ezredeș","ezredesului":"ezredeș","ezredul":"ezred","ezredule":"ezred","ezredului":"ezred","ezreduri":"ezred","ezredurile":"ezred","ezredurilor":"ezred"};
@@ -0,0 +1 @@
+export default {"f":"ft","fa":"face","fa laba":"face labă","fa sex":"face sex","fabianismul":"fabianism","fabianismule":"fabianism","fabianismului":"fabianism","fabiene":"fabiană","fabienei":"fabiană","fabienele":"fabiană","fabienelor":"fabiană","fabric":"fabrica","fabricai":"fabrica","fabricam":["fabricăm","fabrica","fabricam","fabrica"],"fabricand":"fabrica","fabricante":"fabricantă","fabricantei":"fabricantă","fabricantele":"fabricantă","fabricantelor":"fabricantă","fabricanti":["fabricanți","fabricant","fabricanti","fabricant"],"fabricantii":"fabricant","fabricantilor":"fabricant","fabricantul":"fabricant","fabricantule":"fabricant","fabricantului":"fabricant","fabricara":"fabrica","fabricaram":"fabrica","fabricarati":"fabrica","fabricarea":"fabricare","fabricari":"fabricare","fabricarii":"fabricare","fabricarile":"fabricare","fabricarilor":"fabricare","fabricase":"fabrica","fabricasem":"fabrica","fabricasera":"fabrica","fabricaseram":"fabrica","fabricaserati":"fabrica","fabricasesi":"fabrica","fabricasi":"fabrica","fabricat":"fabrica","fabricate":"fabricat","fabricatele":"fabricat","fabricatelor":"fabricat","fabricati":"fabrica","fabricatia":"fabricație","fabricatiei":"fabricație","fabricatii":"fabricație","fabricatiile":"fabricație","fabricatiilor":"fabricație","fabricatiunea":"fabricațiune","fabricatiuni":"fabricațiune","fabricatiunii":"fabricațiune","fabricatiunile":"fabricațiune","fabricatiunilor":"fabricațiune","fabricatoare":"fabricator","fabricatoarea":"fabricator","fabricatoarele":"fabricator","fabricatori":"fabricator","fabricatorii":"fabricator","fabricatorul":"fabricator","fabricatul":"fabricat","fabricatule":"fabricat","fabricatului":"fabricat","fabricau":"fabrica","fabrice":"fabrica","fabrici":["fabrici","fabrica","fabrici","fabrică"],"fabricii":"fabrică","fabricile":"fabrică","fabricilor":"fabrică","fabricute":"făbricuță","fabricutei":"făbricuță","fabricutele":"făbricuță","fabricutelor":"făbricuță","fabulai":"fabula","fabulam":["fabulăm","fabula","fabulam","fabula"],"fabuland":"fabula","fabulara":"fabula","fabularam":"fabula","fabularati":"fabula","fabularea":"fabulare","fabulari":"fabulare","fabularii":"fabulare","fabularile":"fabulare","fabularilor":"fabulare","fabulase":"fabula","fabulasem":"fabula","fabulasera":"fabula","fabulaseram":"fabula","fabulaserati":"fabula","fabulasesi":"fabula","fabulasi":"fabula","fabulat":"fabula","fabulati":"fabula","fabulatia":"fabulație","fabulatiei":"fabulație","fabulatii":"fabulație","fabulatiile":"fabulație","fabulatiilor":"fabulație","fabulau":"fabula","fabule":"fabulă","fabuleaza":"fabula","fabulei":"fabulă","fabulele":"fabulă","fabulelor":"fabulă","fabulez":"fabula","fabulezi":"fabula","fabuliste":"fabulistă","fabulistei":"fabulistă","fabulistele":"fabulistă","fabulistelor":"fabulistă","fabulisti":"fabulist","fabulistii":"fabulist","fabulistilor":"fabulist","fabulistul":"fabulist","fabulistule":"fabulist","fabulistului":"fabulist","fabuloasa":["fabuloasă","fabulos","fabuloasa","fabulos"],"fabuloase":"fabulos","fabuloasele":"fabulos","fabulosi":"fabulos","fabulosii":"fabulos","fabulosul":"fabulos","fac":"face","fac laba":"face labă","fac sex":"face sex","faca":"face","faca bine":"face bine","faca ca trenul":"face ca trenul","faca cinste":"face cinste","faca cu mana":"face cu mâna","faca cu ou si cu otet":"face cu ou și cu oțet","faca cunoscut":"face cunoscut","faca de ras":"face de râs","faca din rahat bici":"face din rahat bici","faca dragoste":"face dragoste","faca fata":"face față","faca haz de necaz":"face haz de necaz","faca in pofida":"face în pofidă","faca laba":"face labă","faca nazuri":"face nazuri","faca ochi dulci":"face ochi dulci","faca pe mortul in papusoi":"face pe mortul în păpușoi","faca pe prostul":"face pe prostul","faca prezenta":"face prezența","faca rost":"face rost","faca sex":"face sex","faca umbra pamantului degeaba":"face umbră pământului degeaba","facaiase":"făcăiaș","facaiasele":"făcăiaș","facaiaselor":"făcăiaș","facaiasul":"făcăiaș","facaiasule":"făcăiaș","facaiasului":"făcăiaș","facalete":"făcăleț","facaletele":"făcăleț","facaletelor":"făcăleț","facaleteul":"făcălete","facaleteule":"făcălete","facaleteului":"făcălete","facaletul":"făcăleț","facaletule":"făcăleț","facaletului":"făcăleț","facand":"face","facand laba":"face labă","facand sex":"face sex","facasi":"făcaș","facasii":"făcaș","facasilor":"făcaș","facasul":"făcaș","facasule":"făcaș","facasului":"făcaș","facatela":["făcățelă","făcățel","făcățela","făcățel"],"facatele":"făcățel","facatelele":"făcățel","facateli":"făcățel","facatelii":"făcățel","facatelul":"făcățel","facatoare":"făcător","facatoarea":["făcătoarea","făcătoare","făcătoarea","făcător"],"facatoarei":"făcătoare","facatoarele":["făcătoarele","făcătoare","făcătoarele","făcător"],"facatoarelor":"făcătoare","facatori":"făcător","facatorii":"făcător","facatorilor":"făcător","facatorul":"făcător","facatorule":"făcător","facatorului":"făcător","facaturi":"făcătură","facaturii":"făcătură","facaturile":"făcătură","facaturilor":"făcătură","face ca trenul in gara":"face ca trenul","facea":"face","facea laba":"face labă","facea sex":"face sex","faceai":"face","faceai laba":"face labă","faceai sex":"face sex","faceam":"face","faceam laba":"face labă","faceam sex":"face sex","faceati":"face","faceati laba":"face labă","faceati sex":"face sex","faceau":"face","faceau laba":"face labă","faceau sex":"face sex","facem":"face","facem laba":"face labă","facem sex":"face sex","facerea":"facere","faceri":"facere","facerii":"facere","facerile":"facere","facerilor":"facere","faceti":"face","faceti laba":"face labă","faceti sex":"face sex","facetia":"faceție","facetiei":"faceție","facetii":"faceție","facetiile":"faceție","facetiilor":"faceție","facetioasa":["facețioasă","facețios","facețioasa","facețios"],"facetioase":"facețios","facetioasele":"facețios","facetiosi":"facețios","facetiosii":"facețios","facetiosul":"facețios","fachia":"fachie","fachiei":"fachie","fachii":"fachie","fachiile":"fachie","fachiilor":"fachie","fachioale":"fachiol","fachioalele":"fachiol","fachioalelor":"fachiol","fachiolul":"fachiol","fachiolule":"fachiol","fachiolului":"fachiol","fachiri":"fachir","fachirii":"fachir","fachirilor":"fachir","fachirisme":"fachirism","fachirismele":"fachirism","fachirismelor":"fachirism","fachirismul":"fachirism","fachirismule":"fachirism","fachirismului":"fachirism","fachirul":"fachir","fachirule":"fachir","fachirului":"fachir","faci":"face","faci laba":"face labă","faci sex":"face sex","faciala":["facială","facial","faciala","facial"],"faciale":"facial","facialele":"facial","faciali":"facial","facialii":"facial","facialul":"facial","facila":["facilă","facil","facila","facil"],"facile":"facil","facilele":"facil","facili":"facil","facilii":"facil","facilitai":"facilita","facilitam":["facilităm","facilita","facilitam","facilita"],"facilitand":"facilita","facilitara":"facilita","facilitaram":"facilita","facilitarati":"facilita","facilitarea":"facilitare","facilitari":"facilitare","facilitarii":"facilitare","facilitarile":"facilitare","facilitarilor":"facilitare","facilitase":"facilita","facilitasem":"facilita","facilitasera":"facilita","facilitaseram":"facilita","facilitaserati":"facilita","facilitasesi":"facilita","facilitasi":"facilita","facilitat":"facilita","facilitata":["facilitată","facilitat","facilitata","facilitat"],"facilitate":"facilitat","facilitatea":"facilitate","facilitatele":"facilitat","facilitati":["facilitați","facilita","facilitați","facilitat","facilități","facilitate"],"facilitatii":["facilitații","facilitat","facilității","facilitate"],"facilitatile":"facilitate","facilitatilor":"facilitate","facilitatul":"facilitat","facilitau":"facilita","faciliteaza":"facilita","facilitez":"facilita","facilitezi":"facilita","facilul":"facil","facind":"făcând","facle":"faclă","faclei":"faclă","faclele":"faclă","faclelor":"faclă","faclia":"făclie","facliasi":"făcliaș","facliasii":"făcliaș","facliasilor":"făcliaș","facliasul":"făcliaș","facliasule":"făcliaș","facliasului":"făcliaș","facliei":"făclie","faclieri":"făclier","faclierii":"făclier","faclierilor":"făclier","faclierul":"făclier","faclierule":"făclier","faclierului":"făclier","facliesi":"făclieș","facliesii":"făclieș","facliesilor":"făclieș","facliesul":"făclieș","facliesule":"făclieș","facliesului":"făclieș","faclii":"făclie","facliile":"făclie","facliilor":"făclie","faclioare":"făclioară","faclioarei":"făclioară","faclioarele":"făclioară","faclioarelor":"făclioară","facliute":"făcliuță","facliutei":"făcliuță","facliutele":"făcliuță","facliutelor":"făcliuță","facoceri":"facocer","facocerii":"facocer","facocerilor":"facocer","facocerul":"facocer","facocerule":"facocer","facocerului":"facocer","facomatoze":"facomatoză","facomatozei":"facomatoză","facomatozele":"facomatoză","facomatozelor":"facomatoză","facometre":"facometru","facometrele":"facometru","facometrelor":"facometru","facometruul":"facometru","facometruule":"facometru","facometruului":"facometru","facoscoape":"facoscop","facoscoapele":"facoscop","facoscoapelor":"facoscop","facoscopul":"facoscop","facoscopule":"facoscop","facoscopului":"facoscop","facsimilai":"facsimila","facsimilam":["facsimilăm","facsimila","facsimilam","facsimila"],"facsimiland":"facsimila","facsimilara":"facsimila","facsimilaram":"facsimila","facsimilarati":"facsimila","facsimilase":"facsimila","facsimilasem":"facsimila","facsimilasera":"facsimila","facsimilaseram":"facsimila","facsimilaserati":"facsimila","facsimilasesi":"facsimila","facsimilasi":"facsimila","facsimilat":"facsimila","facsimilata":["facsimilată","facsimilat","facsimilata","facsimilat"],"facsimilate":"facsimilat","facsimilatele":"facsimilat","facsimilati":["facsimilați","facsimila","facsimilați","facsimilat"],"facsimilatii":"facsimilat","facsimilatul":"facsimilat","facsimilau":"facsimila","facsimile":"facsimil","facsimileaza":"facsimila","facsimilele":"facsimil","facsimilelor":"facsimil","facsimilez":"facsimila","facsimilezi":"facsimila","facsimilul":"facsimil","facsimilule":"facsimil","facsimilului":"facsimil","factaje":"factaj","factajele":"factaj","factajelor":"factaj","factajul":"factaj","factajule":"factaj","factajului":"factaj","factia":"facție","facticea":"factice","facticele":"factice","factici":"factice","facticii":"factice","factiei":"facție","factii":"facție","factiile":"facție","factiilor":"facție","factioasa":["facțioasă","facțios","facțioasa","facțios"],"factioase":"facțios","factioasele":"facțios","factionara":["facționară","facționar","facționara","facționar"],"factionare":"facționar","factionarele":"facționar","factionari":"facționar","factionarii":"facționar","factionarul":"facționar","factiosi":"facțios","factiosii":"facțios","factiosul":"facțios","factitiva":["factitivă","factitiv","factitiva","factitiv"],"factitive":"factitiv","factitivele":"factitiv","factitivi":"factitiv","factitivii":"factitiv","factitivul":"factitiv","factiunea":"facțiune","factiuni":"facțiune","factiunii":"facțiune","factiunile":"facțiune","factiunilor":"facțiune","factori":"factor","factori comuni":"factor comun","factori de absorbtie":"factor de absorbție","factori politici":"factor politic","factori postali":"factor poștal","factori primi":"factor prim","factoriala":["factorială","factorial","factoriala","factorial"],"factoriale":"factorial","factorialele":"factorial","factoriali":"factorial","factorialii":"factorial","factorialul":"factorial","factorii":"factor","factorilor":"factor","factorite":"factoriță","factoritei":"factoriță","factoritele":"factoriță","factoritelor":"factoriță","factorizai":"factoriza","factorizam":["factorizăm","factoriza","factorizam","factoriza"],"factorizand":"factoriza","factorizara":"factoriza","factorizaram":"factoriza","factorizarati":"factoriza","factorizarea":"factorizare","factorizari":"factorizare","factorizarii":"factorizare","factorizarile":"factorizare","factorizarilor":"factorizare","factorizase":"factoriza","factorizasem":"factoriza","factorizasera":"factoriza","factorizaseram":"factoriza","factorizaserati":"factoriza","factorizasesi":"factoriza","factorizasi":"factoriza","factorizat":"factoriza","factorizata":["factorizată","factorizat","factorizata","factorizat"],"factorizate":"factorizat","factorizatele":"factorizat","factorizati":["factorizați","factoriza","factorizați","factorizat"],"factorizatii":"factorizat","factorizatul":"factorizat","factorizau":"factoriza","factorizeaza":"factoriza","factorizez":"factoriza","factorizezi":"factoriza","factorul":"factor","factorule":"factor","factorului":"factor","factotumi":"factotum","factotumlor":"factotum","factotumul":"factotum","factotumule":"factotum","factotumului":"factotum","factuala":["factuală","factual","factuala","factual"],"factuale":"factual","factualele":"factual","factuali":"factual","factualii":"factual","factualul":"factual","facturai":"factura","facturam":["facturăm","factura","facturam","factura"],"facturand":"factura","facturara":"factura","facturaram":"factura","facturarati":"factura","facturarea":"facturare","facturarei":"facturare","facturase":"factura","facturasem":"factura","facturasera":"factura","facturaseram":"factura","facturaserati":"factura","facturasesi":"factura","facturasi":"factura","facturat":"factura","facturata":["facturată","facturat","facturata","facturat"],"facturate":"facturat","facturatele":"facturat","facturati":["facturați","factura","facturați","facturat"],"facturatii":"facturat","facturatul":"facturat","facturau":"factura","factureaza":"factura","facturez":"factura","facturezi":"factura","facturi":"factură","facturiere":"facturier","facturierele":"facturier","facturierelor":"facturier","facturierul":"facturier","facturierule":"facturier","facturierului":"facturier","facturii":"factură","facturile":"factură","facturilor":"factură","facu":"face","facu laba":"face labă","facu sex":"face sex","facui":"face","facui laba":"face labă","facui sex":"face sex","facultatea":"facultate","facultati":"facultate","facultatii":"facultate","facultatile":"facultate","facultatilor":"facultate","facultativa":["facultativă","facultativ","facultativa","facultativ"],"facultative":"facultativ","facultativele":"facultativ","facultativi":"facultativ","facultativii":"facultativ","facultativul":"facultativ","facura":"face","facura laba":"face labă","facura sex":"face sex","facuram":"face","facuram laba":"face labă","facuram sex":"face sex","facurati":"face","facurati laba":"face labă","facurati sex":"face sex","facuse":"face","facuse laba":"face labă","facuse sex":"face sex","facusem":"face","facusem laba":"face labă","facusem sex":"face sex","facusera":"face","facusera laba":"face labă","facusera sex":"face sex","facuseram":"face","facuseram laba":"face labă","facuseram sex":"face sex","facuserati":"face","facuserati laba":"face labă","facuserati sex":"face sex","facusesi":"face","facusesi laba":"face labă","facusesi sex":"face sex","facusi":"face","facusi laba":"face labă","facusi sex":"face sex","facut":"face","facut bine":"face bine","facut ca trenul":"face ca trenul","facut cinste":"face cinste","facut cu mana":"face cu mâna","facut cu ou si cu otet":"face cu ou și cu oțet","facut cunoscut":"face cunoscut","facut de ras":"face de râs","facut din rahat bici":"face din rahat bici","facut dragoste":"face dragoste","facut fata":"face față","facut harcea-parcea":"face harcea-parcea","facut haz de necaz":"face haz de necaz","facut in pofida":"face în pofidă","facut laba":"face labă","facut nazuri":"face nazuri","facut ochi dulci":"face ochi dulci","facut pe mortul in papusoi":"face pe mortul în păpușoi","facut pe prostul":"face pe prostul","facut prezenta":"face prezența","facut rost":"face rost","facut sex":"face sex","facut umbra pamantului degeaba":"face umbră pământului degeaba","facut-o de oaie":"o face de oaie","facuta":["făcută","făcut","făcuta","făcut"],"facute":"făcut","facutele":"făcut","facuti":"făcut","facutii":"făcut","facutul":"făcut","fada":["fadă","fad","fada","fad"],"fade":"fad","fadele":"fad","fadeometre":"fadeometru","fadeometrele":"fadeometru","fadeometrelor":"fadeometru","fadeometruul":"fadeometru","fadeometruule":"fadeometru","fadeometruului":"fadeometru","fadul":"fad","faetoane":"faeton","faetoanele":"faeton","faetoanelor":"faeton","faetonul":"faeton","faetonule":"faeton","faetonului":"faeton","fagadaie":"făgădău","fagadaiele":"făgădău","fagadaielor":"făgădău","fagadari":"făgădar","fagadarii":"făgădar","fagadarilor":"făgădar","fagadarite":"făgădăriță","fagadaritei":"făgădăriță","fagadaritele":"făgădăriță","fagadaritelor":"făgădăriță","fagadarul":"făgădar","fagadarule":"făgădar","fagadarului":"făgădar","fagadasul":"făgădaș","fagadasule":"făgădaș","fagadasului":"făgădaș","fagadasuri":"făgădaș","fagadasurile":"făgădaș","fagadasurilor":"făgădaș","fagadaul":"făgădău","fagadaule":"făgădău","fagadaului":"făgădău","fagade":"făgadă","fagadei":"făgadă","fagadele":"făgadă","fagadelor":"făgadă","fagaduia":"făgădui","fagaduiai":"făgădui","fagaduiam":"făgădui","fagaduiati":"făgădui","fagaduiau":"făgădui","fagaduieli":"făgăduială","fagaduielii":"făgăduială","fagaduielile":"făgăduială","fagaduielilor":"făgăduială","fagaduiesc":"făgădui","fagaduieste":"făgădui","fagaduiesti":"făgădui","fagaduii":"făgădui","fagaduim":"făgădui","fagaduind":"făgădui","fagaduinte":"făgăduință","fagaduintei":"făgăduință","fagaduintele":"făgăduință","fagaduintelor":"făgăduință","fagaduira":"făgădui","fagaduiram":"făgădui","fagaduirati":"făgădui","fagaduirea":"făgăduire","fagaduiri":"făgăduire","fagaduirii":"făgăduire","fagaduirile":"făgăduire","fagaduirilor":"făgăduire","fagaduise":"făgădui","fagaduisem":"făgădui","fagaduisera":"făgădui","fagaduiseram":"făgădui","fagaduiserati":"făgădui","fagaduisesi":"făgădui","fagaduisi":"făgădui","fagaduit":"făgădui","fagaduiti":"făgădui","fagaduitoare":"făgăduitor","fagaduitoarea":"făgăduitor","fagaduitoarele":"făgăduitor","fagaduitori":"făgăduitor","fagaduitorii":"făgăduitor","fagaduitorul":"făgăduitor","fagaduitul":"făgăduit","fagaduitule":"făgăduit","fagaduitului":"făgăduit","fagaduituri":["făgăduituri","făgăduit","făgăduituri","făgăduitură"],"fagaduiturii":"făgăduitură","fagaduiturile":["făgăduiturile","făgăduit","făgăduiturile","făgăduitură"],"fagaduiturilor":["făgăduiturilor","făgăduit","făgăduiturilor","făgăduitură"],"faganisul":"faganiș","faganisule":"faganiș","faganisului":"faganiș","faganisuri":"faganiș","faganisurile":"faganiș","faganisurilor":"faganiș","fagaraseanul":"făgărășean","fagaraseanule":"făgărășean","fagaraseanului":"făgărășean","fagarasence":"făgărășeancă","fagarasencei":"făgărășeancă","fagarasencele":"făgărășeancă","fagarasencelor":"făgărășeancă","fagarasene":"făgărășeană","fagarasenei":"făgărășeană","fagarasenele":"făgărășeană","fagarasenelor":"făgărășeană","fagaraseni":"făgărășean","fagarasenii":"făgărășean","fagarasenilor":"făgărășean","fagare":"făgar","fagarele":"făgar","fagarelor":"făgar","fagarisul":"făgăriș","fagarisule":"făgăriș","fagarisului":"făgăriș","fagarisuri":"făgăriș","fagarisurile":"făgăriș","fagarisurilor":"făgăriș","fagarul":"făgar","fagarule":"făgar","fagarului":"făgar","fagase":"făgaș","fagasele":"făgaș","fagaselor":"făgaș","fagasul":"făgaș","fagasule":"făgaș","fagasului":"făgaș","fage":"fagă","fagedenica":["fagedenică","fagedenic","fagedenica","fagedenic"],"fagedenice":"fagedenic","fagedenicele":"fagedenic","fagedenici":"fagedenic","fagedenicii":"fagedenic","fagedenicul":"fagedenic","fagedenisme":"fagedenism","fagedenismele":"fagedenism","fagedenismelor":"fagedenism","fagedenismul":"fagedenism","fagedenismule":"fagedenism","fagedenismului":"fagedenism","fagei":"fagă","fagele":"fagă","fagelor":"fagă","fagete":"făget","fagetele":"făget","fagetelor":"făget","fagetelul":"făgețel","fagetelule":"făgețel","fagetelului":"făgețel","fagetul":"făget","fagetule":"făget","fagetului":"făget","fagi":"fag","fagii":"fag","fagilor":"fag","fagistea":"făgiște","fagisti":"făgiște","fagistii":"făgiște","fagistile":"făgiște","fagistilor":"făgiște","fagoaia":"făgoaie","fagoaiei":"făgoaie","fagoaii":"făgoaie","fagocite":"fagocit","fagocitele":"fagocit","fagocitelor":"fagocit","fagocitoze":"fagocitoză","fagocitozei":"fagocitoză","fagocitozele":"fagocitoză","fagocitozelor":"fagocitoză","fagocitul":"fagocit","fagocitule":"fagocit","fagocitului":"fagocit","fagopirisme":"fagopirism","fagopirismele":"fagopirism","fagopirismelor":"fagopirism","fagopirismul":"fagopirism","fagopirismule":"fagopirism","fagopirismului":"fagopirism","fagoterapia":"fagoterapie","fagoterapiei":"fagoterapie","fagoterapii":"fagoterapie","fagoterapiile":"fagoterapie","fagoterapiilor":"fagoterapie","fagotiste":"fagotistă","fagotistei":"fagotistă","fagotistele":"fagotistă","fagotistelor":"fagotistă","fagotisti":"fagotist","fagotistii":"fagotist","fagotistilor":"fagotist","fagotistul":"fagotist","fagotistule":"fagotist","fagotistului":"fagotist","fagotul":"fagot","fagotule":"fagot","fagotului":"fagot","fagoturi":"fagot","fagoturile":"fagot","fagoturilor":"fagot","faguiul":"făgui","faguiule":"făgui","faguiului":"făgui","fagul":"fag","fagule":"fag","faguleanul":"făgulean","faguleanule":"făgulean","faguleanului":"făgulean","faguleni":"făgulean","fagulenii":"făgulean","fagulenilor":"făgulean","faguleti":"făguleț","faguletii":"făguleț","faguletilor":"făguleț","faguletul":"făguleț","faguletule":"făguleț","faguletului":"făguleț","fagului":"fag","fagurasi":"făguraș","fagurasii":"făguraș","fagurasilor":"făguraș","fagurasul":"făguraș","fagurasule":"făguraș","fagurasului":"făguraș","fagurei":"făgurel","fagureii":"făgurel","fagureilor":"făgurel","fagurele":"fagure","fagurelui":"fagure","fagurelul":"făgurel","fagurelule":"făgurel","fagurelului":"făgurel","faguri":["faguri","fag","faguri","fagur","faguri","fagure"],"fagurii":["fagurii","fagur","fagurii","fagure"],"fagurilor":["fagurilor","fagur","fagurilor","fagure"],"fagurul":"fagur","fagurule":"fagur","fagurului":"fagur","faguti":"făguț","fagutii":"făguț","fagutilor":"făguț","fagutul":"făguț","fagutule":"făguț","fagutului":"făguț","faiantai":"faianța","faiantam":["faianțăm","faianța","faianțam","faianța"],"faiantand":"faianța","faiantara":"faianța","faiantaram":"faianța","faiantarati":"faianța","faiantarea":"faianțare","faiantari":["faianțari","faianțar","faianțări","faianțare"],"faiantarii":["faianțarii","faianțar","faianțării","faianțare"],"faiantarile":"faianțare","faiantarilor":["faianțarilor","faianțar","faianțărilor","faianțare"],"faiantarul":"faianțar","faiantarule":"faianțar","faiantarului":"faianțar","faiantase":"faianța","faiantasem":"faianța","faiantasera":"faianța","faiantaseram":"faianța","faiantaserati":"faianța","faiantasesi":"faianța","faiantasi":"faianța","faiantat":"faianța","faiantata":["faianțată","faianțat","faianțata","faianțat"],"faiantate":"faianțat","faiantatele":"faianțat","faiantati":["faianțați","faianța","faianțați","faianțat"],"faiantatii":"faianțat","faiantatoarea":"faianțatoare","faiantatoarei":"faianțatoare","faiantatoarele":"faianțatoare","faiantatoarelor":"faianțatoare","faiantatori":"faianțator","faiantatorii":"faianțator","faiantatorilor":"faianțator","faiantatorul":"faianțator","faiantatorule":"faianțator","faiantatorului":"faianțator","faiantatul":"faianțat","faiantau":"faianța","faiante":"faianță","faianteaza":"faianța","faiantei":"faianță","faiantele":"faianță","faiantelor":"faianță","faiantez":"faianța","faiantezi":"faianța","faicava":["fâicavă","fâicav","fâicava","fâicav"],"faicave":"fâicav","faicavele":"fâicav","faicavi":"fâicav","faicavii":"fâicav","faicavul":"fâicav","faientaria":"faiențărie","faientariei":"faiențărie","faientarii":"faiențărie","faientariile":"faiențărie","faientariilor":"faiențărie","faiere":"faier","faierele":"faier","faierelor":"faier","faierul":"faier","faierule":"faier","faierului":"faier","failibila":["failibilă","failibil","failibila","failibil"],"failibile":"failibil","failibilele":"failibil","failibili":"failibil","failibilii":"failibil","failibilitatati":"failibilitate","failibilitatatii":"failibilitate","failibilitatatile":"failibilitate","failibilitatatilor":"failibilitate","failibilitatea":"failibilitate","failibilul":"failibil","faime":"faimă","faimoasa":["faimoasă","faimos","faimoasa","faimos"],"faimoase":"faimos","faimoasele":"faimos","faimosi":"faimos","faimosii":"faimos","faimosul":"faimos","faina":["faină","fain","faina","fain"],"fainare":"făinar","fainarea":"făinare","fainarese":"făinăreasă","fainaresei":"făinăreasă","fainaresele":"făinăreasă","fainareselor":"făinăreasă","fainari":["făinari","făinar","făinări","făinare"],"fainaria":"făinărie","fainariei":"făinărie","fainarii":["făinării","făinare","făinării","făinărie"],"fainariile":"făinărie","fainariilor":"făinărie","faine":"fain","fainele":["fainele","fain","făinele","făineală"],"fainelei":"făineală","fainelele":"făineală","fainelelor":"făineală","faineli":"făineală","faini":["faini","fain","făini","făină"],"fainii":["fainii","fain","făinii","făină"],"fainoasa":["făinoasă","făinos","făinoasa","făinos"],"fainoase":"făinos","fainoasele":"făinos","fainosi":"făinos","fainosii":"făinos","fainosul":"făinos","fainul":"fain","fainuri":"făină","fainurile":"făină","fainurilor":"făină","faioare":"făioară","faioarei":"făioară","fairplayul":"fairplay","fairplayule":"fairplay","fairplayului":"fairplay","faitoane":"faiton","faitoanele":"faiton","faitoanelor":"faiton","faitonul":"faiton","faitonule":"faiton","faitonului":"faiton","falacioasa":["falacioasă","falacios","falacioasa","falacios"],"falacioase":"falacios","falacioasele":"falacios","falaciosi":"falacios","falaciosii":"falacios","falaciosul":"falacios","falaitari":"falaitar","falaitarii":"falaitar","falaitarilor":"falaitar","falaitarul":"falaitar","falaitarule":"falaitar","falaitarului":"falaitar","falange":"falangă","falange medii":"falangă medie","falangei":"falangă","falangele":"falangă","falangelor":"falangă","falangete":"falangetă","falangetei":"falangetă","falangetele":"falangetă","falangetelor":"falangetă","falangiana":["falangiană","falangian","falangiana","falangian"],"falangianul":"falangian","falangiene":"falangian","falangienele":"falangian","falangieni":"falangian","falangienii":"falangian","falangisti":"falangist","falangistii":"falangist","falangistilor":"falangist","falangistul":"falangist","falangistule":"falangist","falangistului":"falangist","falanstere":"falanster","falansterele":"falanster","falansterelor":"falanster","falansterianisme":"falansterianism","falansterianismele":"falansterianism","falansterianismelor":"falansterianism","falansterianismul":"falansterianism","falansterianismule":"falansterianism","falansterianismului":"falansterianism","falansterianul":"falansterian","falansterianule":"falansterian","falansterianului":"falansterian","falansteriene":"falansteriană","falansterienei":"falansteriană","falansterienele":"falansteriană","falansterienelor":"falansteriană","falansterieni":"falansterian","falansterienii":"falansterian","falansterienilor":"falansterian","falansterul":"falanster","falansterule":"falanster","falansterului":"falanster","falbalale":"falbala","falbalalei":"falbala","falbalalele":"falbala","falbalalelor":"falbala","falbalaua":"falbala","falcarite":"fălcariță","falcaritei":"fălcariță","falci":["fălci","falcă","fălci","falce"],"falciforma":["falciformă","falciform","falciforma","falciform"],"falciforme":"falciform","falciformele":"falciform","falciformi":"falciform","falciformii":"falciform","falciformul":"falciform","falcii":"falcă","falcile":"falcă","falcilor":"falcă","falciori":"fălcior","falciorii":"fălcior","falciorilor":"fălcior","falciorul":"fălcior","falciorule":"fălcior","falciorului":"fălcior","falcoasa":["fălcoasă","fălcos","fălcoasa","fălcos"],"falcoase":"fălcos","falcoasele":"fălcos","falconete":"falconet","falconetele":"falconet","falconetelor":"falconet","falconetul":"falconet","falconetule":"falconet","falconetului":"falconet","falconide":"falconidă","falconidei":"falconidă","falconidele":"falconidă","falconidelor":"falconidă","falconiforme":["falconiforme","falconiform","falconiforme","falconiformă"],"falconiformei":"falconiformă","falconiformele":["falconiformele","falconiform","falconiformele","falconiformă"],"falconiformelor":["falconiformelor","falconiform","falconiformelor","falconiformă"],"falconiformul":"falconiform","falconiformule":"falconiform","falconiformului":"falconiform","falcosi":"fălcos","falcosii":"fălcos","falcosul":"fălcos","falcute":"fălcuță","falcutei":"fălcuță","falcutele":"fălcuță","falcutelor":"fălcuță","faldul":"fald","faldule":"fald","faldului":"fald","falduri":["falduri","fald","falduri","faldur"],"faldurii":["faldurii","fald","faldurii","faldur"],"faldurilor":["faldurilor","fald","faldurilor","faldur"],"faldurul":"faldur","faldurule":"faldur","faldurului":"faldur","fale":"fală","falea":"făli","faleai":"făli","faleam":"făli","faleati":"făli","faleau":"făli","falei":"fală","falene":"falenă","falenei":"falenă","falenele":"falenă","falenelor":"falenă","faleraul":"faleră","faleraule":"faleră","faleraului":"faleră","falere":"faleră","falerele":"faleră","falerelor":"faleră","falesc":"făli","faleste":"făli","falesti":"făli","faleze":"faleză","falezei":"faleză","falezele":"faleză","falezelor":"faleză","falfaia":["fâlfâia","fâlfâi","fâlfăia","fâlfăi","fălfâia","fălfâi"],"falfaiai":["fâlfâiai","fâlfâi","fâlfăiai","fâlfăi","fălfâiai","fălfâi"],"falfaiam":["fâlfâiam","fâlfâi","fâlfăiam","fâlfăi","fălfâiam","fălfâi"],"falfaiati":["fâlfâiați","fâlfâi","fâlfăiați","fâlfăi","fălfâiați","fălfâi"],"falfaiau":["fâlfâiau","fâlfâi","fâlfăiau","fâlfăi","fălfâiau","fălfâi"],"falfaie":["fâlfâie","fâlfâi","fâlfăie","fâlfăi","fălfâie","fălfâi"],"falfaii":["fâlfâii","fâlfâi","fâlfăii","fâlfăi","fălfâii","fălfâi"],"falfaim":["fâlfâim","fâlfâi","fâlfăim","fâlfăi","fălfâim","fălfâi"],"falfaind":["fâlfâind","fâlfâi","fâlfăind","fâlfăi","fălfâind","fălfâi"],"falfaira":["fâlfâiră","fâlfâi","fâlfăiră","fâlfăi","fălfâiră","fălfâi"],"falfairam":["fâlfâirăm","fâlfâi","fâlfăirăm","fâlfăi","fălfâirăm","fălfâi"],"falfairati":["fâlfâirăți","fâlfâi","fâlfăirăți","fâlfăi","fălfâirăți","fălfâi"],"falfairea":"fâlfâire","falfairi":"fâlfâire","falfairii":"fâlfâire","falfairile":"fâlfâire","falfairilor":"fâlfâire","falfaise":["fâlfâise","fâlfâi","fâlfăise","fâlfăi","fălfâise","fălfâi"],"falfaisem":["fâlfâisem","fâlfâi","fâlfăisem","fâlfăi","fălfâisem","fălfâi"],"falfaisera":["fâlfâiseră","fâlfâi","fâlfăiseră","fâlfăi","fălfâiseră","fălfâi"],"falfaiseram":["fâlfâiserăm","fâlfâi","fâlfăiserăm","fâlfăi","fălfâiserăm","fălfâi"],"falfaiserati":["fâlfâiserăți","fâlfâi","fâlfăiserăți","fâlfăi","fălfâiserăți","fălfâi"],"falfaisesi":["fâlfâiseși","fâlfâi","fâlfăiseși","fâlfăi","fălfâiseși","fălfâi"],"falfaisi":["fâlfâiși","fâlfâi","fâlfăiși","fâlfăi","fălfâiși","fălfâi"],"falfait":["fâlfâit","fâlfâi","fâlfăit","fâlfăi","fălfâit","fălfâi"],"falfaiti":["fâlfâiți","fâlfâi","fâlfăiți","fâlfăi","fălfâiți","fălfâi"],"falfaitoare":"fâlfâitor","falfaitoarea":"fâlfâitor","falfaitoarele":"fâlfâitor","falfaitori":"fâlfâitor","falfaitorii":"fâlfâitor","falfaitorul":"fâlfâitor","falfaitul":"fâlfâit","falfaitule":"fâlfâit","falfaitului":"fâlfâit","falfaiture":"fâlfâitură","falfaiturei":"fâlfâitură","falfaiturele":"fâlfâitură","falfaiturelor":"fâlfâitură","falfaituri":"fâlfâitură","falia":["falia","falie","fălia","fălie"],"falica":["falică","falic","falica","falic"],"falice":"falic","falicele":"falic","falici":"falic","falicii":"falic","falicul":"falic","faliei":["faliei","falie","făliei","fălie"],"falii":["fălii","făli","falii","falie","fălii","fălie"],"faliile":["faliile","falie","făliile","fălie"],"faliilor":["faliilor","falie","făliilor","fălie"],"falim":"făli","falimentai":"falimenta","falimentam":["falimentăm","falimenta","falimentam","falimenta"],"falimentand":"falimenta","falimentara":["falimentară","falimenta","falimentară","falimentar","falimentara","falimentar"],"falimentaram":"falimenta","falimentarati":"falimenta","falimentare":"falimentar","falimentarea":"falimentare","falimentarele":"falimentar","falimentari":["falimentari","falimentar","falimentări","falimentare"],"falimentarii":["falimentarii","falimentar","falimentării","falimentare"],"falimentarile":"falimentare","falimentarilor":"falimentare","falimentarul":"falimentar","falimentase":"falimenta","falimentasem":"falimenta","falimentasera":"falimenta","falimentaseram":"falimenta","falimentaserati":"falimenta","falimentasesi":"falimenta","falimentasi":"falimenta","falimentat":"falimenta","falimentati":"falimenta","falimentau":"falimenta","falimente":"faliment","falimenteaza":"falimenta","falimentele":"faliment","falimentelor":"faliment","falimentez":"falimenta","falimentezi":"falimenta","falimentul":"faliment","falimentule":"faliment","falimentului":"faliment","falind":"făli","falira":"făli","faliram":"făli","falirati":"făli","falirea":"fălire","faliri":"fălire","falirii":"fălire","falirile":"fălire","falirilor":"fălire","falise":"făli","falisem":"făli","falisera":"făli","faliseram":"făli","faliserati":"făli","falisesi":"făli","falisi":"făli","falit":"făli","falite":"falită","falitei":"falită","falitele":"falită","falitelor":"falită","faliti":["făliți","făli","faliți","falit"],"falitii":"falit","falitilor":"falit","falitoare":"fălitor","falitoarea":["fălitoarea","fălitoare","fălitoarea","fălitor"],"falitoarei":"fălitoare","falitoarele":["fălitoarele","fălitoare","fălitoarele","fălitor"],"falitoarelor":"fălitoare","falitori":"fălitor","falitorii":"fălitor","falitorul":"fălitor","falitul":"falit","falitule":"falit","falitului":"falit","falnica":["falnică","falnic","falnica","falnic"],"falnice":"falnic","falnicele":"falnic","falnici":"falnic","falnicia":"fălnicie","falniciei":"fălnicie","falnicii":["falnicii","falnic","fălnicii","fălnicie"],"falnicul":"falnic","falnogi":"fălnogiu","falnogii":"fălnogiu","falnogilor":"fălnogiu","falnogiuul":"fălnogiu","falnogiuule":"fălnogiu","falnogiuului":"fălnogiu","faloasa":["făloasă","fălos","făloasa","fălos"],"faloase":"fălos","faloasele":"fălos","falocentrica":["falocentrică","falocentric","falocentrica","falocentric"],"falocentrice":"falocentric","falocentricele":"falocentric","falocentrici":"falocentric","falocentricii":"falocentric","falocentricul":"falocentric","falocentrismul":"falocentrism","falocentrismule":"falocentrism","falocentrismului":"falocentrism","falocratia":"falocrație","falocratica":["falocratică","falocratic","falocratica","falocratic"],"falocratice":"falocratic","falocraticele":"falocratic","falocratici":"falocratic","falocraticii":"falocratic","falocraticul":"falocratic","falocratiei":"falocrație","falocratii":"falocrație","falocratiile":"falocrație","falocratiilor":"falocrație","falosea":"făloși","faloseai":"făloși","faloseam":"făloși","faloseati":"făloși","faloseau":"făloși","falosela":["făloșelă","făloșel","făloșela","făloșel"],"falosele":"făloșel","faloselele":"făloșel","faloseli":"făloșel","faloselii":"făloșel","faloselul":"făloșel","falosesc":"făloși","faloseste":"făloși","falosesti":"făloși","falosi":"fălos","falosia":"făloșie","falosiei":"făloșie","falosii":["făloșii","fălos","făloșii","făloși","făloșii","făloșie"],"falosiile":"făloșie","falosiilor":"făloșie","falosim":"făloși","falosind":"făloși","falosira":"făloși","falosiram":"făloși","falosirati":"făloși","falosise":"făloși","falosisem":"făloși","falosisera":"făloși","falosiseram":"făloși","falosiserati":"făloși","falosisesi":"făloși","falosisi":"făloși","falosit":"făloși","falositi":"făloși","falosul":"fălos","falsa":["falsă","fals","falsa","fals","falșă","falș","falșa","falș"],"falsari":"falsar","falsarii":"falsar","falsarilor":"falsar","falsarul":"falsar","falsarule":"falsar","falsarului":"falsar","false":["false","fals","falșe","falș"],"falsele":["falsele","fals","falșele","falș"],"falsete":"falset","falsetele":"falset","falsetelor":"falset","falsetul":"falset","falsetule":"falset","falsetului":"falset","falsi":["falși","fals","falși","falș"],"falsific":["falsific","falsifica","falșific","falșifica"],"falsificabila":["falsificabilă","falsificabil","falsificabila","falsificabil"],"falsificabile":"falsificabil","falsificabilele":"falsificabil","falsificabili":"falsificabil","falsificabilii":"falsificabil","falsificabilitatea":"falsificabilitate","falsificabilitati":"falsificabilitate","falsificabilitatii":"falsificabilitate","falsificabilul":"falsificabil","falsificai":["falsificai","falsifica","falșificai","falșifica"],"falsificam":["falsificăm","falsifica","falsificam","falsifica","falșificăm","falșifica","falșificam","falșifica"],"falsificand":["falsificând","falsifica","falșificând","falșifica"],"falsificara":["falsificară","falsifica","falșificară","falșifica"],"falsificaram":["falsificarăm","falsifica","falșificarăm","falșifica"],"falsificarati":["falsificarăți","falsifica","falșificarăți","falșifica"],"falsificarea":["falsificarea","falsificare","falșificarea","falșificare"],"falsificari":["falsificări","falsificare","falșificări","falșificare","falșificari","falșificare"],"falsificarii":["falsificării","falsificare","falșificarii","falșificare"],"falsificarile":["falsificările","falsificare","falșificarile","falșificare"],"falsificarilor":["falsificărilor","falsificare","falșificarilor","falșificare"],"falsificase":["falsificase","falsifica","falșificase","falșifica"],"falsificasem":["falsificasem","falsifica","falșificasem","falșifica"],"falsificasera":["falsificaseră","falsifica","falșificaseră","falșifica"],"falsificaseram":["falsificaserăm","falsifica","falșificaserăm","falșifica"],"falsificaserati":["falsificaserăți","falsifica","falșificaserăți","falșifica"],"falsificasesi":["falsificaseși","falsifica","falșificaseși","falșifica"],"falsificasi":["falsificași","falsifica","falșificași","falșifica"],"falsificat":["falsificat","falsifica","falșificat","falșifica"],"falsificata":["falsificată","falsificat","falsificata","falsificat","falșificată","falșificat","falșificata","falșificat"],"falsificate":["falsificate","falsificat","falșificate","falșificat"],"falsificatele":["falsificatele","falsificat","falșificatele","falșificat"],"falsificati":["falsificați","falsifica","falșificați","falșifica","falsificați","falsificat","falșificați","falșificat"],"falsificatia":"falsificație","falsificatiei":"falsificație","falsificatii":["falsificații","falsificat","falșificații","falșificat","falsificații","falsificație"],"falsificatiile":"falsificație","falsificatiilor":"falsificație","falsificatiunea":"falsificațiune","falsificatiuni":"falsificațiune","falsificatiunii":"falsificațiune","falsificatiunile":"falsificațiune","falsificatiunilor":"falsificațiune","falsificatoarea":["falsificatoarea","falsificatoare","falșificatoarea","falșificatoare"],"falsificatoarei":["falsificatoarei","falsificatoare","falșificatoarei","falșificatoare"],"falsificatoarele":["falsificatoarele","falsificatoare","falșificatoarele","falșificatoare"],"falsificatoarelor":["falsificatoarelor","falsificatoare","falșificatoarelor","falșificatoare"],"falsificatori":["falsificatori","falsificator","falșificatori","falșificator"],"falsificatorii":["falsificatorii","falsificator","falșificatorii","falșificator"],"falsificatorilor":["falsificatorilor","falsificator","falșificatorilor","falșificator"],"falsificatorul":["falsificatorul","falsificator","falșificatorul","falșificator"],"falsificatorule":["falsificatorule","falsificator","falșificatorule","falșificator"],"falsificatorului":["falsificatorului","falsificator","falșificatorului","falșificator"],"falsificatul":["falsificatul","falsificat","falșificatul","falșificat"],"falsificau":["falsificau","falsifica","falșificau","falșifica"],"falsifice":"falsifica","falsifici":["falsifici","falsifica","falșifici","falșifica"],"falsii":["falșii","fals","falșii","falș"],"falsitatea":"falsitate","falsitati":"falsitate","falsitatii":"falsitate","falsitatile":"falsitate","falsitatilor":"falsitate","falsul":["falsul","fals","falșul","falș"],"falticeneana":["fălticeneană","fălticenean","fălticeneana","fălticenean"],"falticeneanul":"fălticenean","falticeneanule":"fălticenean","falticeneanului":"fălticenean","falticenence":"fălticeneancă","falticenencei":"fălticeneancă","falticenencele":"fălticeneancă","falticenencelor":"fălticeneancă","falticenene":"fălticenean","falticenenele":"fălticenean","falticeneni":["fălticeneni","fălticenean","fălticeneni","fălticinean"],"falticenenii":["fălticenenii","fălticenean","fălticenenii","fălticinean"],"falticenenilor":["fălticenenilor","fălticenean","fălticenenilor","fălticinean"],"falticineana":["fălticineană","fălticinean","fălticineana","fălticinean"],"falticineanul":"fălticinean","falticineanule":"fălticinean","falticineanului":"fălticinean","falticinence":"fălticineancă","falticinencei":"fălticineancă","falticinencele":"fălticineancă","falticinencelor":"fălticineancă","falticinene":"fălticinean","falticinenele":"fălticinean","falticineni":"fălticinean","falticinenii":"fălticinean","faltuia":"fălțui","faltuiai":"fălțui","faltuiam":"fălțui","faltuiati":"fălțui","faltuiau":"fălțui","faltuiesc":"fălțui","faltuieste":"fălțui","faltuiesti":"fălțui","faltuii":"fălțui","faltuim":"fălțui","faltuind":"fălțui","faltuira":"fălțui","faltuiram":"fălțui","faltuirati":"fălțui","faltuise":"fălțui","faltuisem":"fălțui","faltuisera":"fălțui","faltuiseram":"fălțui","faltuiserati":"fălțui","faltuisesi":"fălțui","faltuisi":"fălțui","faltuit":"fălțui","faltuiti":"fălțui","faltuitoarea":"fălțuitoare","faltuitoarei":"fălțuitoare","faltuitoarele":"fălțuitoare","faltuitoarelor":"fălțuitoare","faltul":"falț","faltule":"falț","faltului":"falț","falturi":"falț","falturile":"falț","falturilor":"falț","falusul":"falus","falusule":"falus","falusului":"falus","falusuri":"falus","falusurile":"falus","falusurilor":"falus","falxul":"falx","falxule":"falx","falxului":"falx","falxuri":"falx","falxurile":"falx","falxurilor":"falx","fama":"faimă","fameaia":"femeie","famelica":["famelică","famelic","famelica","famelic"],"famelice":"famelic","famelicele":"famelic","famelici":"famelic","famelicii":"famelic","famelicul":"famelic","fameni":"famen","famenii":"famen","famenilor":"famen","famenul":"famen","famenule":"famen","famenului":"famen","famfare":"famfară","famfarei":"famfară","famfarele":"famfară","famfarelor":"famfară","familia":"familie","familiala":["familială","familial","familiala","familial"],"familiale":"familial","familialele":"familial","familiali":"familial","familialii":"familial","familialul":"familial","familiara":["familiară","familiar","familiara","familiar"],"familiare":"familiar","familiarele":"familiar","familiari":"familiar","familiarii":"familiar","familiarisme":"familiarism","familiarismele":"familiarism","familiarismelor":"familiarism","familiarismul":"familiarism","familiarismule":"familiarism","familiarismului":"familiarism","familiaritatea":"familiaritate","familiaritati":"familiaritate","familiaritatii":"familiaritate","familiaritatile":"familiaritate","familiaritatilor":"familiaritate","familiarizai":"familiariza","familiarizam":["familiarizăm","familiariza","familiarizam","familiariza"],"familiarizand":"familiariza","familiarizara":"familiariza","familiarizaram":"familiariza","familiarizarati":"familiariza","familiarizarea":"familiarizare","familiarizarei":"familiarizare","familiarizase":"familiariza","familiarizasem":"familiariza","familiarizasera":"familiariza","familiarizaseram":"familiariza","familiarizaserati":"familiariza","familiarizasesi":"familiariza","familiarizasi":"familiariza","familiarizat":"familiariza","familiarizata":["familiarizată","familiarizat","familiarizata","familiarizat"],"familiarizate":"familiarizat","familiarizatele":"familiarizat","familiarizati":["familiarizați","familiariza","familiarizați","familiarizat"],"familiarizatii":"familiarizat","familiarizatul":"familiarizat","familiarizau":"familiariza","familiarizeaza":"familiariza","familiarizez":"familiariza","familiarizezi":"familiariza","familiarul":"familiar","familiei":"familie","familii":"familie","familii de limbi":"familie de limbi","familii extinse":"familie extinsă","familii lingvistice":"familie lingvistică","familii nucleare":"familie nucleară","familii regale":"familie regală","familiile":"familie","familiilor":"familie","familiste":"familistă","familistei":"familistă","familistele":"familistă","familistelor":"familistă","familisti":["familiști","familist","familisti","familist"],"familistii":"familist","familistilor":"familist","familistul":"familist","familistule":"familist","familistului":"familist","famoasa":["famoasă","famos","famoasa","famos"],"famoase":"famos","famoasele":"famos","famosi":"famos","famosii":"famos","famosul":"famos","fanale":"fanal","fanalele":"fanal","fanalelor":"fanal","fanalul":"fanal","fanalule":"fanal","fanalului":"fanal","fanaragii":"fanaragiu","fanaragiii":"fanaragiu","fanaragiilor":"fanaragiu","fanaragiul":"fanaragiu","fanaragiule":"fanaragiu","fanaragiului":"fanaragiu","fanarase":"fânăraș","fanarasele":"fânăraș","fanaraselor":"fânăraș","fanarasul":"fânăraș","fanarasule":"fânăraș","fanarasului":"fânăraș","fanare":["fanare","fanar","fânare","fânar"],"fanarele":["fanarele","fanar","fânarele","fânar","fânărele","fânărel"],"fanarelele":"fânărel","fanarelelor":"fânărel","fanarelor":["fanarelor","fanar","fânarelor","fânar"],"fanarelul":"fânărel","fanarelule":"fânărel","fanarelului":"fânărel","fanaria":"fânărie","fanariei":"fânărie","fanarii":"fânărie","fanariile":"fânărie","fanariilor":"fânărie","fanariota":["fanariotă","fanariot","fanariota","fanariot"],"fanariote":["fanariote","fanariot","fanariote","fanariotă"],"fanariotei":"fanariotă","fanariotele":["fanariotele","fanariot","fanariotele","fanariotă"],"fanariotelor":"fanariotă","fanarioti":"fanariot","fanariotii":"fanariot","fanariotisme":"fanariotism","fanariotismele":"fanariotism","fanariotismelor":"fanariotism","fanariotismul":"fanariotism","fanariotismule":"fanariotism","fanariotismului":"fanariotism","fanariotizai":"fanariotiza","fanariotizam":["fanariotizăm","fanariotiza","fanariotizam","fanariotiza"],"fanariotizand":"fanariotiza","fanariotizara":"fanariotiza","fanariotizaram":"fanariotiza","fanariotizarati":"fanariotiza","fanariotizase":"fanariotiza","fanariotizasem":"fanariotiza","fanariotizasera":"fanariotiza","fanariotizaseram":"fanariotiza","fanariotizaserati":"fanariotiza","fanariotizasesi":"fanariotiza","fanariotizasi":"fanariotiza","fanariotizat":"fanariotiza","fanariotizati":"fanariotiza","fanariotizau":"fanariotiza","fanariotizeaza":"fanariotiza","fanariotizez":"fanariotiza","fanariotizezi":"fanariotiza","fanariotul":"fanariot","fanarul":["fanarul","fanar","fânarul","fânar"],"fanarule":["fanarule","fanar","fânarule","fânar"],"fanarului":["fanarului","fanar","fânarului","fânar"],"fanatica":["fanatică","fanatic","fanatica","fanatic"],"fanatice":["fanatice","fanatic","fanatice","fanatică"],"fanaticeasca":["fanaticească","fanaticesc","fanaticeasca","fanaticesc"],"fanaticei":"fanatică","fanaticele":["fanaticele","fanatic","fanaticele","fanatică"],"fanaticelor":"fanatică","fanaticescul":"fanaticesc","fanaticesti":"fanaticesc","fanaticestii":"fanaticesc","fanaticestile":"fanaticesc","fanatici":"fanatic","fanaticii":"fanatic","fanaticul":"fanatic","fanatismul":"fanatism","fanatismule":"fanatism","fanatismului":"fanatism","fanatizai":"fanatiza","fanatizam":["fanatizăm","fanatiza","fanatizam","fanatiza"],"fanatizand":"fanatiza","fanatizara":"fanatiza","fanatizaram":"fanatiza","fanatizarati":"fanatiza","fanatizarea":"fanatizare","fanatizari":"fanatizare","fanatizarii":"fanatizare","fanatizarile":"fanatizare","fanatizarilor":"fanatizare","fanatizase":"fanatiza","fanatizasem":"fanatiza","fanatizasera":"fanatiza","fanatizaseram":"fanatiza","fanatizaserati":"fanatiza","fanatizasesi":"fanatiza","fanatizasi":"fanatiza","fanatizat":"fanatiza","fanatizati":"fanatiza","fanatizau":"fanatiza","fanatizeaza":"fanatiza","fanatizez":"fanatiza","fanatizezi":"fanatiza","fanatul":"fânaț","fanatule":"fânaț","fanatului":"fânaț","fanaturi":"fânaț","fanaturile":"fânaț","fanaturilor":"fânaț","fanchiue":"fanchiu","fanchiuele":"fanchiu","fanchiuelor":"fanchiu","fanchiuul":"fanchiu","fanchiuule":"fanchiu","fanchiuului":"fanchiu","fandasiosi":"fandasios","fandasiosii":"fandasios","fandasiosilor":"fandasios","fandasiosul":"fandasios","fandasiosule":"fandasios","fandasiosului":"fandasios","fandoseli":"fandoseală","fandoselii":"fandoseală","fandoselile":"fandoseală","fandoselilor":"fandoseală","fandosita":["fandosită","fandosit","fandosita","fandosit"],"fandosite":["fandosite","fandosit","fandosite","fandosită"],"fandositei":"fandosită","fandositele":["fandositele","fandosit","fandositele","fandosită"],"fandositelor":"fandosită","fandositi":"fandosit","fandositii":"fandosit","fandositilor":"fandosit","fandositul":"fandosit","fandositule":"fandosit","fandositului":"fandosit","fanerite":"fanerit","faneritele":"fanerit","faneritelor":"fanerit","faneritul":"fanerit","faneritule":"fanerit","faneritului":"fanerit","fanerogame":"fanerogamă","fanerogamei":"fanerogamă","fanerogamele":"fanerogamă","fanerogamelor":"fanerogamă","fanete":"fâneață","fanetei":"fâneață","fanetele":"fâneață","fanetelor":"fâneață","fanfare":"fanfară","fanfarei":"fanfară","fanfarele":"fanfară","fanfarelor":"fanfară","fanfaroane":"fanfaroană","fanfaroanei":"fanfaroană","fanfaroanele":"fanfaroană","fanfaroanelor":"fanfaroană","fanfarona":["fanfaronă","fanfaron","fanfarona","fanfaron"],"fanfaronade":"fanfaronadă","fanfaronadei":"fanfaronadă","fanfaronadele":"fanfaronadă","fanfaronadelor":"fanfaronadă","fanfarone":"fanfaron","fanfaronele":"fanfaron","fanfaroni":"fanfaron","fanfaronii":"fanfaron","fanfaronilor":"fanfaron","fanfaronul":"fanfaron","fanfaronule":"fanfaron","fanfaronului":"fanfaron","fangoterapia":"fangoterapie","fangoterapiei":"fangoterapie","fangoterapii":"fangoterapie","fangoterapiile":"fangoterapie","fangoterapiilor":"fangoterapie","fangoul":"fango","fangoule":"fango","fangoului":"fango","fangouri":"fango","fangourile":"fango","fangourilor":"fango","fani":"fan","fanii":"fan","fanilor":"fan","fanioane":"fanion","fanioanele":"fanion","fanioanelor":"fanion","fanionul":"fanion","fanionule":"fanion","fanionului":"fanion","fanisoare":"fânișor","fanisore":"fânișor","fanisorele":"fânișor","fanisorelor":"fânișor","fanisorul":"fânișor","fanisorule":"fânișor","fanisorului":"fânișor","fanoane":"fanon","fanoanele":"fanon","fanoanelor":"fanon","fanonul":"fanon","fanonule":"fanon","fanonului":"fanon","fanotroane":"fanotron","fanotroanele":"fanotron","fanotroanelor":"fanotron","fanotronul":"fanotron","fanotronule":"fanotron","fanotronului":"fanotron","fantaioare":"fântâioară","fantaioarei":"fântâioară","fantaioarele":"fântâioară","fantaioarelor":"fântâioară","fantanari":"fântânar","fantanarii":"fântânar","fantanarilor":"fântânar","fantanarul":"fântânar","fantanarule":"fântânar","fantanarului":"fântânar","fantaneaua":"fântânea","fantanei":"fântânel","fantaneii":"fântânel","fantaneilor":"fântânel","fantanele":"fântânea","fantanelei":"fântânea","fantanelele":"fântânea","fantanelelor":"fântânea","fantanelul":"fântânel","fantanelule":"fântânel","fantanelului":"fântânel","fantani":"fântână","fantani arteziene":"fântână arteziană","fantanici":"fântânică","fantanicii":"fântânică","fantanicile":"fântânică","fantanicilor":"fântânică","fantanieri":"fântânier","fantanierii":"fântânier","fantanierilor":"fântânier","fantanierul":"fântânier","fantanierule":"fântânier","fantanierului":"fântânier","fantanii":"fântână","fantanile":"fântână","fantanilor":"fântână","fantanioare":"fântânioară","fantanioarei":"fântânioară","fantanioarele":"fântânioară","fantanioarelor":"fântânioară","fantanite":"fântâniță","fantanitei":"fântâniță","fantanitele":"fântâniță","fantanitelor":"fântâniță","fantanute":"fântânuță","fantanutei":"fântânuță","fantanutele":"fântânuță","fantanutelor":"fântânuță","fantasca":["fantască","fantasc","fantasca","fantasc"],"fantascul":"fantasc","fantasia":"fantasie","fantasiei":"fantasie","fantasii":"fantasie","fantasiile":"fantasie","fantasiilor":"fantasie","fantasini":"fantasin","fantasinii":"fantasin","fantasinilor":"fantasin","fantasinul":"fantasin","fantasinule":"fantasin","fantasinului":"fantasin","fantasmagoria":"fantasmagorie","fantasmagorica":["fantasmagorică","fantasmagoric","fantasmagorica","fantasmagoric"],"fantasmagorice":"fantasmagoric","fantasmagoricele":"fantasmagoric","fantasmagorici":"fantasmagoric","fantasmagoricii":"fantasmagoric","fantasmagoricul":"fantasmagoric","fantasmagoriei":"fantasmagorie","fantasmagorii":"fantasmagorie","fantasmagoriile":"fantasmagorie","fantasmagoriilor":"fantasmagorie","fantasmatica":["fantasmatică","fantasmatic","fantasmatica","fantasmatic"],"fantasmatice":"fantasmatic","fantasmaticele":"fantasmatic","fantasmatici":"fantasmatic","fantasmaticii":"fantasmatic","fantasmaticul":"fantasmatic","fantasme":"fantasmă","fantasmei":"fantasmă","fantasmele":"fantasmă","fantasmelor":"fantasmă","fantaste":["fantaște","fantasc","fantaste","fantastă"],"fantastei":"fantastă","fantastele":["fantaștele","fantasc","fantastele","fantastă"],"fantastelor":"fantastă","fantasti":["fantaști","fantasc","fantaști","fantast"],"fantastica":["fantastică","fantastic","fantastica","fantastic"],"fantastice":"fantastic","fantasticele":"fantastic","fantastici":"fantastic","fantasticii":"fantastic","fantasticitatati":"fantasticitate","fantasticitatatii":"fantasticitate","fantasticitatatile":"fantasticitate","fantasticitatatilor":"fantasticitate","fantasticitatea":"fantasticitate","fantasticul":"fantastic","fantastii":["fantaștii","fantasc","fantaștii","fantast"],"fantastilor":"fantast","fantastul":"fantast","fantastule":"fantast","fantastului":"fantast","fantazarea":"fantazare","fantazari":"fantazare","fantazarii":"fantazare","fantazarile":"fantazare","fantazarilor":"fantazare","fantazia":"fantazie","fantaziei":"fantazie","fantazii":"fantazie","fantaziile":"fantazie","fantaziilor":"fantazie","fante":"fantă","fantei":"fantă","fantele":"fantă","fantelor":"fantă","fanteul":"fante","fanteule":"fante","fanteului":"fante","fantezia":"fantezie","fanteziei":"fantezie","fantezii":"fantezie","fanteziile":"fantezie","fanteziilor":"fantezie","fantezista":["fantezistă","fantezist","fantezista","fantezist"],"fanteziste":"fantezist","fantezistele":"fantezist","fantezisti":"fantezist","fantezistii":"fantezist","fantezistul":"fantezist","fanti":"fante","fantii":"fante","fantilor":"fante","fantomatica":["fantomatică","fantomatic","fantomatica","fantomatic"],"fantomatice":"fantomatic","fantomaticele":"fantomatic","fantomatici":"fantomatic","fantomaticii":"fantomatic","fantomaticul":"fantomatic","fantome":"fantomă","fantomul":"fantom","fantomule":"fantom","fantomului":"fantom","fantomuri":"fantom","fantomurile":"fantom","fantomurilor":"fantom","fantose":"fantoșă","fantosei":"fantoșă","fantosele":"fantoșă","fantoselor":"fantoșă","fanul":"fan","fanule":"fan","fanului":"fan","fanumul":"fanum","fanumule":"fanum","fanumului":"fanum","fanumuri":"fanum","fanumurile":"fanum","fanumurilor":"fanum","fanuri":"fân","faptase":"făptașă","faptasei":"făptașă","faptasele":"făptașă","faptaselor":"făptașă","faptasi":"făptaș","faptasii":"făptaș","faptasilor":"făptaș","faptasul":"făptaș","faptasule":"făptaș","faptasului":"făptaș","fapte":["fapte","fapt","fapte","faptă"],"fapte penale":"fapt penal","faptei":"faptă","faptele":["faptele","fapt","faptele","faptă"],"faptelor":["faptelor","fapt","faptelor","faptă"],"faptica":["faptică","faptic","faptica","faptic"],"faptice":"faptic","fapticele":"faptic","faptici":"faptic","fapticii":"faptic","fapticul":"faptic","faptuia":"făptui","faptuiai":"făptui","faptuiam":"făptui","faptuiati":"făptui","faptuiau":"făptui","faptuiesc":"făptui","faptuieste":"făptui","faptuiesti":"făptui","faptuii":"făptui","faptuim":"făptui","faptuind":"făptui","faptuira":"făptui","faptuiram":"făptui","faptuirati":"făptui","faptuirea":"făptuire","faptuiri":"făptuire","faptuirii":"făptuire","faptuirile":"făptuire","faptuirilor":"făptuire","faptuise":"făptui","faptuisem":"făptui","faptuisera":"făptui","faptuiseram":"făptui","faptuiserati":"făptui","faptuisesi":"făptui","faptuisi":"făptui","faptuit":"făptui","faptuiti":"făptui","faptuitoarea":"făptuitoare","faptuitoarei":"făptuitoare","faptuitoarele":"făptuitoare","faptuitoarelor":"făptuitoare","faptuitori":"făptuitor","faptuitorii":"făptuitor","faptuitorilor":"făptuitor","faptuitorul":"făptuitor","faptuitorule":"făptuitor","faptuitorului":"făptuitor","faptul":"fapt","faptule":"fapt","faptului":"fapt","fapturi":"făptură","fapturii":"făptură","fapturile":"făptură","fapturilor":"făptură","fara cusura":"fără cusur","fara cusure":"fără cusur","fara cusuri":"fără cusur","faradelegea":"fărădelege","faradelegi":"fărădelege","faradelegii":"fărădelege","faradelegile":"fărădelege","faradelegilor":"fărădelege","faradica":["faradică","faradic","faradica","faradic"],"faradice":"faradic","faradicele":"faradic","faradici":"faradic","faradicii":"faradic","faradicul":"faradic","faradizarea":"faradizare","faradizari":"faradizare","faradizarii":"faradizare","faradizarile":"faradizare","faradizarilor":"faradizare","faradmetre":"faradmetru","faradmetrele":"faradmetru","faradmetrelor":"faradmetru","faradmetruul":"faradmetru","faradmetruule":"faradmetru","faradmetruului":"faradmetru","faradoterapia":"faradoterapie","faradoterapiei":"faradoterapie","faradoterapii":"faradoterapie","faradoterapiile":"faradoterapie","faradoterapiilor":"faradoterapie","faradul":"farad","faradule":"farad","faradului":"farad","faralegea":"fărălegi","faralegeai":"fărălegi","faralegeam":"fărălegi","faralegeati":"fărălegi","faralegeau":"fărălegi","faralegesc":"fărălegi","faralegeste":"fărălegi","faralegesti":"fărălegi","faralegii":"fărălegi","faralegim":"fărălegi","faralegind":"fărălegi","faralegira":"fărălegi","faralegiram":"fărălegi","faralegirati":"fărălegi","faralegise":"fărălegi","faralegisem":"fărălegi","faralegisera":"fărălegi","faralegiseram":"fărălegi","faralegiserati":"fărălegi","faralegisesi":"fărălegi","faralegisi":"fărălegi","faralegit":"fărălegi","faralegiti":"fărălegi","faram":["fărâm","fărâma","fărâm","fărâmi"],"faramai":"fărâma","faramam":["fărâmăm","fărâma","fărâmam","fărâma"],"faramand":"fărâma","faramara":"fărâma","faramaram":"fărâma","faramarati":"fărâma","faramarea":"fărâmare","faramarei":"fărâmare","faramase":"fărâma","faramasem":"fărâma","faramasera":"fărâma","faramaseram":"fărâma","faramaserati":"fărâma","faramasesi":"fărâma","faramasi":"fărâma","faramat":"fărâma","faramata":["fărâmată","fărâmat","fărâmata","fărâmat","fărămată","fărămat","fărămata","fărămat"],"faramate":["fărâmate","fărâmat","fărămate","fărămat"],"faramatele":["fărâmatele","fărâmat","fărămatele","fărămat"],"faramati":["fărâmați","fărâma","fărâmați","fărâmat","fărămați","fărămat"],"faramatii":["fărâmații","fărâmat","fărămații","fărămat"],"faramatoare":"fărâmător","faramatoarele":"fărâmător","faramatoarelor":"fărâmător","faramatorul":"fărâmător","faramatorule":"fărâmător","faramatorului":"fărâmător","faramatul":["fărâmatul","fărâmat","fărămatul","fărămat"],"faramatur":"fărâmături","faramature":["fărâmăture","fărâmătură","fărâmăture","fărâmături"],"faramaturea":"fărâmături","faramatureai":"fărâmături","faramatuream":"fărâmături","faramatureati":"fărâmături","faramatureau":"fărâmături","faramaturei":"fărâmătură","faramaturele":["fărâmăturele","fărâmătură","fărâmăturele","fărâmăturică"],"faramaturelei":"fărâmăturică","faramaturelele":"fărâmăturică","faramaturelelor":"fărâmăturică","faramaturelor":"fărâmătură","faramaturi":["fărâmături","fărâmătură","fărămături","fărămătură"],"faramaturie":"fărâmături","faramaturii":["fărămăturii","fărămătură","fărâmăturii","fărâmături"],"faramaturile":"fărămătură","faramaturilor":"fărămătură","faramaturim":"fărâmături","faramaturind":"fărâmături","faramaturira":"fărâmături","faramaturiram":"fărâmături","faramaturirati":"fărâmături","faramaturise":"fărâmături","faramaturisem":"fărâmături","faramaturisera":"fărâmături","faramaturiseram":"fărâmături","faramaturiserati":"fărâmături","faramaturisesi":"fărâmături","faramaturisi":"fărâmături","faramaturit":"fărâmături","faramaturiti":"fărâmături","faramau":"fărâma","farame":["fărâme","fărâma","fărâme","fărâmă","fărâme","fărâmi"],"faramea":"fărâmi","farameai":"fărâmi","farameam":"fărâmi","farameati":"fărâmi","farameau":"fărâmi","faramei":"fărâmă","faramele":"fărâmă","faramelor":"fărâmă","farami":"fărâma","faramicata":["fărâmicată","fărâmicat","fărâmicata","fărâmicat"],"faramicate":"fărâmicat","faramicatele":"fărâmicat","faramicati":"fărâmicat","faramicatii":"fărâmicat","faramicatul":"fărâmicat","faramice":"fărâmică","faramicea":"fărâmice","faramicei":"fărâmică","faramicele":"fărâmică","faramicelor":"fărâmică","faramici":["fărâmici","fărâmică","fărâmici","fărâmice"],"faramicii":"fărâmice","faramicile":"fărâmice","faramicilor":"fărâmice","faramicioasa":["fărâmicioasă","fărâmicios","fărâmicioasa","fărâmicios"],"faramicioase":"fărâmicios","faramicioasele":"fărâmicios","faramiciosi":"fărâmicios","faramiciosii":"fărâmicios","faramiciosul":"fărâmicios","faramie":"fărâmi","faramii":"fărâmi","faramim":"fărâmi","faramind":"fărâmi","faramira":"fărâmi","faramiram":"fărâmi","faramirati":"fărâmi","faramise":"fărâmi","faramisem":"fărâmi","faramisera":"fărâmi","faramiseram":"fărâmi","faramiserati":"fărâmi","faramisesi":"fărâmi","faramisi":"fărâmi","faramit":"fărâmi","faramita":["fărâmită","fărâmit","fărâmita","fărâmit"],"faramitai":"fărâmița","faramitam":["fărâmițăm","fărâmița","fărâmițam","fărâmița"],"faramitand":"fărâmița","faramitara":"fărâmița","faramitaram":"fărâmița","faramitarati":"fărâmița","faramitarea":"fărâmițare","faramitari":"fărâmițare","faramitarii":"fărâmițare","faramitarile":"fărâmițare","faramitarilor":"fărâmițare","faramitase":"fărâmița","faramitasem":"fărâmița","faramitasera":"fărâmița","faramitaseram":"fărâmița","faramitaserati":"fărâmița","faramitasesi":"fărâmița","faramitasi":"fărâmița","faramitat":"fărâmița","faramitata":["fărâmițată","fărâmițat","fărâmițata","fărâmițat"],"faramitate":"fărâmițat","faramitatele":"fărâmițat","faramitati":["fărâmițați","fărâmița","fărâmițați","fărâmițat"],"faramitatii":"fărâmițat","faramitatul":"fărâmițat","faramitau":"fărâmița","faramite":["fărâmite","fărâmit","fărâmițe","fărâmiță"],"faramiteaza":"fărâmița","faramitei":"fărâmiță","faramitele":["fărâmitele","fărâmit","fărâmițele","fărâmiță"],"faramitelor":"fărâmiță","faramitez":"fărâmița","faramitezi":"fărâmița","faramiti":["fărâmiți","fărâmi","fărâmiți","fărâmit"],"faramitii":"fărâmit","faramitul":"fărâmit","faramituri":"fărâmitură","faramiturii":"fărâmitură","faramiturile":"fărâmitură","faramiturilor":"fărâmitură","faramuse":"fărâmușă","faramusei":"fărâmușă","faramusele":"fărâmușă","faramuselor":"fărâmușă","farandole":"farandolă","farandolei":"farandolă","farandolele":"farandolă"};
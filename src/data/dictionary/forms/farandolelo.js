@@ -0,0 +1 @@
+export default {"farandolelor":"farandolă","faraoance":"faraoancă","faraoancei":"faraoancă","faraoancele":"faraoancă","faraoancelor":"faraoancă","faraoni":"faraon","faraonica":["faraonică","faraonic","faraonica","faraonic"],"faraonice":"faraonic","faraonicele":"faraonic","faraonici":"faraonic","faraonicii":"faraonic","faraonicul":"faraonic","faraonii":"faraon","faraonilor":"faraon","faraonul":"faraon","faraonule":"faraon","faraonului":"faraon","farase":"făraș","farasele":"făraș","faraselor":"făraș","farasul":"făraș","farasule":"făraș","farasului":"făraș","farazi":"farad","farazii":"farad","farazilor":"farad","farbuia":"fărbui","farbuiai":"fărbui","farbuiam":"fărbui","farbuiati":"fărbui","farbuiau":"fărbui","farbuiesc":"fărbui","farbuieste":"fărbui","farbuiesti":"fărbui","farbuii":"fărbui","farbuim":"fărbui","farbuind":"fărbui","farbuira":"fărbui","farbuiram":"fărbui","farbuirati":"fărbui","farbuise":"fărbui","farbuisem":"fărbui","farbuisera":"fărbui","farbuiseram":"fărbui","farbuiserati":"fărbui","farbuisesi":"fărbui","farbuisi":"fărbui","farbuit":"fărbui","farbuiti":"fărbui","farburi":"farbă","farburii":"farbă","farburile":"farbă","farburilor":"farbă","fardai":"farda","fardam":["fardăm","farda","fardam","farda"],"fardand":"farda","fardara":"farda","fardaram":"farda","fardarati":"farda","fardarea":"fardare","fardari":"fardare","fardarii":"fardare","fardarile":"fardare","fardarilor":"fardare","fardase":"farda","fardasem":"farda","fardasera":"farda","fardaseram":"farda","fardaserati":"farda","fardasesi":"farda","fardasi":"farda","fardat":"farda","fardati":"farda","fardau":"farda","fardeaza":"farda","fardelegea":"fărdelege","fardelegi":"fărdelege","fardelegii":"fărdelege","fardelegile":"fărdelege","fardelegilor":"fărdelege","fardez":"farda","fardezi":"farda","fardul":"fard","fardule":"fard","fardului":"fard","farduri":"fard","fardurile":"fard","fardurilor":"fard","faretre":"faretră","faretrei":"faretră","faretrele":"faretră","faretrelor":"faretră","farfarale":"farfara","farfaralei":"farfara","farfaralele":"farfara","farfaralelor":"farfara","farfaraua":"farfara","farfasita":["farfasită","farfasit","farfasita","farfasit"],"farfasite":["farfasite","farfasit","farfasite","farfasită"],"farfasitei":"farfasită","farfasitele":["farfasitele","farfasit","farfasitele","farfasită"],"farfasitelor":"farfasită","farfasiti":"farfasit","farfasitii":"farfasit","farfasitilor":"farfasit","farfasitul":"farfasit","farfasitule":"farfasit","farfasitului":"farfasit","farfuraria":"farfurărie","farfurariei":"farfurărie","farfurarii":"farfurărie","farfuria":"farfurie","farfuriei":"farfurie","farfurigii":"farfurigiu","farfurigiii":"farfurigiu","farfurigiilor":"farfurigiu","farfurigiuul":"farfurigiu","farfurigiuule":"farfurigiu","farfurigiuului":"farfurigiu","farfurii":"farfurie","farfurii zburatoare":"farfurie zburătoare","farfuriile":"farfurie","farfuriilor":"farfurie","farfurioare":"farfurioară","farfurioarei":"farfurioară","farfurioarele":"farfurioară","farfurioarelor":"farfurioară","farfuriute":"farfuriuță","farfuriutei":"farfuriuță","farfuriutele":"farfuriuță","farfuriutelor":"farfuriuță","fargae":"fărgău","fargaele":"fărgău","fargaelor":"fărgău","fargataie":"fărgătău","fargataiele":"fărgătău","fargataielor":"fărgătău","fargatauul":"fărgătău","fargatauule":"fărgătău","fargatauului":"fărgătău","fargauul":"fărgău","fargauule":"fărgău","fargauului":"fărgău","farimituri":"fărimitură","farimiturii":"fărimitură","farimiturile":"fărimitură","farimiturilor":"fărimitură","farina":"făină","farinacee":"farinaceu","farinaceea":"farinaceu","farinaceele":"farinaceu","farinacei":"farinaceu","farinaceii":"farinaceu","farinaceul":"farinaceu","farinar":"făinar","faringala":["faringală","faringal","faringala","faringal"],"faringale":"faringal","faringalele":"faringal","faringali":"faringal","faringalii":"faringal","faringalul":"faringal","faringele":"faringe","faringelor":"faringe","faringeul":"faringe","faringeule":"faringe","faringeului":"faringe","faringiana":["faringiană","faringian","faringiana","faringian"],"faringianul":"faringian","faringiene":"faringian","faringienele":"faringian","faringieni":"faringian","faringienii":"faringian","faringisme":"faringism","faringismele":"faringism","faringismelor":"faringism","faringismul":"faringism","faringismule":"faringism","faringismului":"faringism","faringite":"faringită","faringitei":"faringită","faringitele":"faringită","faringitelor":"faringită","faringolaringite":"faringolaringită","faringolaringitei":"faringolaringită","faringolaringitele":"faringolaringită","faringolaringitelor":"faringolaringită","faringologia":"faringologie","faringologiei":"faringologie","faringologii":"faringologie","faringologiile":"faringologie","faringologiilor":"faringologie","faringoscoape":"faringoscop","faringoscoapele":"faringoscop","faringoscoapelor":"faringoscop","faringoscopia":"faringoscopie","faringoscopiei":"faringoscopie","faringoscopii":"faringoscopie","faringoscopul":"faringoscop","faringoscopule":"faringoscop","faringoscopului":"faringoscop","faringospasme":"faringospasm","faringospasmele":"faringospasm","faringospasmelor":"faringospasm","faringospasmul":"faringospasm","faringospasmule":"faringospasm","faringospasmului":"faringospasm","faringostomia":"faringostomie","faringostomiei":"faringostomie","faringostomii":"faringostomie","faringostomiile":"faringostomie","faringostomiilor":"faringostomie","faringotomia":"faringotomie","faringotomiei":"faringotomie","faringotomii":"faringotomie","faringotomiile":"faringotomie","faringotomiilor":"faringotomie","farini":"fărină","farinii":"fărină","farinoasa":["farinoasă","farinos","farinoasa","farinos"],"farinoase":"farinos","farinoasele":"farinos","farinografe":"farinograf","farinografele":"farinograf","farinografelor":"farinograf","farinograful":"farinograf","farinografule":"farinograf","farinografului":"farinograf","farinos":"făinos","farinosi":"farinos","farinosii":"farinos","farinosul":"farinos","farinuri":"fărină","farinurile":"fărină","farinurilor":"fărină","farinxul":"farinx","farinxule":"farinx","farinxului":"farinx","farinxuri":"farinx","farinxurile":"farinx","farinxurilor":"farinx","fariseeana":["fariseeană","fariseean","fariseeana","fariseean"],"fariseeani":"fariseean","fariseeanii":"fariseean","fariseeanilor":"fariseean","fariseeanul":"fariseean","fariseeanule":"fariseean","fariseeanului":"fariseean","fariseeasca":["fariseească","fariseesc","fariseeasca","fariseesc"],"fariseene":"fariseean","fariseenele":"fariseean","fariseeni":"fariseean","fariseenii":"fariseean","fariseescul":"fariseesc","fariseesti":"fariseesc","fariseestii":"fariseesc","fariseestile":"fariseesc","farisei":"fariseu","fariseica":["fariseică","fariseic","fariseica","fariseic"],"fariseice":"fariseic","fariseicele":"fariseic","fariseici":"fariseic","fariseicii":"fariseic","fariseicul":"fariseic","fariseii":"fariseu","fariseilor":"fariseu","fariseisme":"fariseism","fariseismele":"fariseism","fariseismelor":"fariseism","fariseismul":"fariseism","fariseismule":"fariseism","fariseismului":"fariseism","fariseul":"fariseu","fariseule":"fariseu","fariseului":"fariseu","farm":"fărma","farma":"fărâma","farmac":"fărmăca","farmacaciunea":"fărmăcăciune","farmacaciuni":"fărmăcăciune","farmacaciunii":"fărmăcăciune","farmacaciunile":"fărmăcăciune","farmacaciunilor":"fărmăcăciune","farmacai":"fărmăca","farmacam":["fărmăcăm","fărmăca","fărmăcam","fărmăca"],"farmacand":"fărmăca","farmacara":"fărmăca","farmacaram":"fărmăca","farmacarati":"fărmăca","farmacareasca":["fărmăcărească","fărmăcăresc","fărmăcăreasca","fărmăcăresc"],"farmacarescul":"fărmăcăresc","farmacaresti":"fărmăcăresc","farmacarestii":"fărmăcăresc","farmacarestile":"fărmăcăresc","farmacase":"fărmăca","farmacasem":"fărmăca","farmacasera":"fărmăca","farmacaseram":"fărmăca","farmacaserati":"fărmăca","farmacasesi":"fărmăca","farmacasi":"fărmăca","farmacat":"fărmăca","farmacata":["fărmăcată","fărmăcat","fărmăcata","fărmăcat"],"farmacate":"fărmăcat","farmacatele":"fărmăcat","farmacati":["fărmăcați","fărmăca","fărmăcați","fărmăcat"],"farmacatii":"fărmăcat","farmacatoare":"fărmăcător","farmacatoarea":"fărmăcător","farmacatoarele":"fărmăcător","farmacatori":"fărmăcător","farmacatorii":"fărmăcător","farmacatorul":"fărmăcător","farmacatul":"fărmăcat","farmacau":"fărmăca","farmaceasca":["fărmăcească","fărmăcesc","fărmăceasca","fărmăcesc"],"farmacescul":"fărmăcesc","farmacesti":"fărmăcesc","farmacestii":"fărmăcesc","farmacestile":"fărmăcesc","farmaceutica":["farmaceutică","farmaceutic","farmaceutica","farmaceutic"],"farmaceutice":["farmaceutice","farmaceutic","farmaceutice","farmaceutică"],"farmaceuticei":"farmaceutică","farmaceuticele":["farmaceuticele","farmaceutic","farmaceuticele","farmaceutică"],"farmaceuticelor":"farmaceutică","farmaceutici":"farmaceutic","farmaceuticii":"farmaceutic","farmaceuticul":"farmaceutic","farmaci":"fărmăca","farmacia":"farmacie","farmaciei":"farmacie","farmacii":"farmacie","farmaciile":"farmacie","farmaciilor":"farmacie","farmaciste":"farmacistă","farmacistei":"farmacistă","farmacistele":"farmacistă","farmacistelor":"farmacistă","farmacisti":"farmacist","farmacistii":"farmacist","farmacistilor":"farmacist","farmacistul":"farmacist","farmacistule":"farmacist","farmacistului":"farmacist","farmacodinamia":"farmacodinamie","farmacodinamici":"farmacodinamică","farmacodinamicii":"farmacodinamică","farmacodinamicile":"farmacodinamică","farmacodinamicilor":"farmacodinamică","farmacodinamiei":"farmacodinamie","farmacodinamii":"farmacodinamie","farmacofilia":"farmacofilie","farmacofiliei":"farmacofilie","farmacofilii":"farmacofilie","farmacofiliile":"farmacofilie","farmacofiliilor":"farmacofilie","farmacofobia":"farmacofobie","farmacofobiei":"farmacofobie","farmacofobii":"farmacofobie","farmacofobiile":"farmacofobie","farmacofobiilor":"farmacofobie","farmacografia":"farmacografie","farmacografiei":"farmacografie","farmacografii":"farmacografie","farmacografiile":"farmacografie","farmacografiilor":"farmacografie","farmacologe":"farmacologă","farmacologei":"farmacologă","farmacologele":"farmacologă","farmacologelor":"farmacologă","farmacologi":"farmacolog","farmacologica":["farmacologică","farmacologic","farmacologica","farmacologic"],"farmacologice":"farmacologic","farmacologicele":"farmacologic","farmacologici":"farmacologic","farmacologicii":"farmacologic","farmacologicul":"farmacologic","farmacologii":"farmacolog","farmacologilor":"farmacolog","farmacologul":"farmacolog","farmacologule":"farmacolog","farmacologului":"farmacolog","farmacomania":"farmacomanie","farmacomaniei":"farmacomanie","farmacomanii":"farmacomanie","farmacomaniile":"farmacomanie","farmacomaniilor":"farmacomanie","farmacopeea":"farmacopee","farmacopeei":"farmacopee","farmacopeele":"farmacopee","farmacopeelor":"farmacopee","farmacopei":"farmacopee","farmacoterapia":"farmacoterapie","farmacoterapiei":"farmacoterapie","farmacoterapii":"farmacoterapie","farmacovigilente":"farmacovigilență","farmacovigilentei":"farmacovigilență","farmacovigilentele":"farmacovigilență","farmacovigilentelor":"farmacovigilență","farmai":"fărma","farmam":["fărmăm","fărma","fărmam","fărma"],"farmand":"fărma","farmara":"fărma","farmaram":"fărma","farmarati":"fărma","farmarea":"fărmare","farmari":"fărmare","farmarii":"fărmare","farmarile":"fărmare","farmarilor":"fărmare","farmase":"fărma","farmasem":"fărma","farmasera":"fărma","farmaseram":"fărma","farmaserati":"fărma","farmasesi":"fărma","farmasi":"fărma","farmat":"fărma","farmata":["fărmată","fărmat","fărmata","fărmat"],"farmate":"fărmat","farmatele":"fărmat","farmati":["fărmați","fărma","fărmați","fărmat"],"farmatii":"fărmat","farmatul":"fărmat","farmaturi":"fărmătură","farmaturii":"fărmătură","farmaturile":"fărmătură","farmaturilor":"fărmătură","farmau":"fărma","farmazoane":"farmazoană","farmazoanei":"farmazoană","farmazoanele":"farmazoană","farmazoanelor":"farmazoană","farmazoni":"farmazon","farmazonia":"farmazonie","farmazoniei":"farmazonie","farmazonii":["farmazonii","farmazon","farmazonii","farmazonie"],"farmazoniile":"farmazonie","farmazoniilor":"farmazonie","farmazonilor":"farmazon","farmazonul":"farmazon","farmazonule":"farmazon","farmazonului":"farmazon","farmec":"fermeca","farmeca":["farmecă","fermeca","fărmeca","fermeca"],"farmece":["farmece","farmec","farmece","fermeca"],"farmecele":"farmec","farmecelor":"farmec","farmeci":"fermeca","farmecul":"farmec","farmecule":"farmec","farmecului":"farmec","farmi":"fărma","farnienteul":"farniente","farnienteule":"farniente","farnienteului":"farniente","farobrazia":"fărobrăzie","farobraziei":"fărobrăzie","farobrazii":"fărobrăzie","farobraziile":"fărobrăzie","farobraziilor":"fărobrăzie","faroeze":"faroeză","faroezei":"faroeză","faroezele":"faroeză","faroezelor":"faroeză","farsangul":"fărșang","farsangule":"fărșang","farsangului":"fărșang","farsanguri":"fărșang","farsangurile":"fărșang","farsangurilor":"fărșang","farsarot":"fărșerot","farsarota":"fărșerotă","farsarote":"fărșărotă","farsaroteasca":["fărșărotească","fărșărotesc","fărșăroteasca","fărșărotesc"],"farsarotei":"fărșărotă","farsarotele":"fărșărotă","farsarotelor":"fărșărotă","farsarotesc":"fărșerotesc","farsarotescul":"fărșărotesc","farsarotesti":"fărșărotesc","farsarotestii":"fărșărotesc","farsarotestile":"fărșărotesc","farsaroti":"fărșărot","farsarotii":"fărșărot","farsarotilor":"fărșărot","farsarotul":"fărșărot","farsarotule":"fărșărot","farsarotului":"fărșărot","farse":"farsă","farsea":"fârși","farseai":"fârși","farseam":"fârși","farseati":"fârși","farseau":"fârși","farsei":"farsă","farsele":"farsă","farselor":"farsă","farserot":"fărșărot","farserota":"fărșărotă","farserote":["fârșerote","fârșerotă","fărșerote","fărșerotă"],"farseroteasca":["fărșerotească","fărșerotesc","fărșeroteasca","fărșerotesc"],"farserotei":["fârșerotei","fârșerotă","fărșerotei","fărșerotă"],"farserotele":["fârșerotele","fârșerotă","fărșerotele","fărșerotă"],"farserotelor":["fârșerotelor","fârșerotă","fărșerotelor","fărșerotă"],"farserotesc":"fărșărotesc","farserotescul":"fărșerotesc","farserotesti":"fărșerotesc","farserotestii":"fărșerotesc","farserotestile":"fărșerotesc","farseroti":["fârşeroți","fârșerot","fărșeroți","fărșerot"],"farserotii":["fârşeroții","fârșerot","fărșeroții","fărșerot"],"farserotilor":["fârşeroților","fârșerot","fărșeroților","fărșerot"],"farserotul":["fârșerotul","fârșerot","fărșerotul","fărșerot"],"farserotule":["fârșerotule","fârșerot","fărșerotule","fărșerot"],"farserotului":["fârșerotului","fârșerot","fărșerotului","fărșerot"],"farsesc":"fârși","farseste":"fârși","farsesti":"fârși","farsii":"fârși","farsim":"fârși","farsind":"fârși","farsira":"fârși","farsiram":"fârși","farsirati":"fârși","farsise":"fârși","farsisem":"fârși","farsisera":"fârși","farsiseram":"fârși","farsiserati":"fârși","farsisesi":"fârși","farsisi":"fârși","farsit":"fârși","farsite":"fârșit","farsitele":"fârșit","farsitelor":"fârșit","farsiti":"fârși","farsitul":"fârșit","farsitule":"fârșit","farsitului":"fârșit","farsituri":"fârșit","farsoarea":"farsoare","farsoarei":"farsoare","farsoarele":"farsoare","farsoarelor":"farsoare","farsori":"farsor","farsorii":"farsor","farsorilor":"farsor","farsorul":"farsor","farsorule":"farsor","farsorului":"farsor","fartaie":"fârtai","fartaiele":"fârtai","fartaielor":"fârtai","fartaiul":"fârtai","fartaiule":"fârtai","fartaiului":"fârtai","fartatei":"fărtățel","fartateii":"fărtățel","fartateilor":"fărtățel","fartatelul":"fărtățel","fartatelule":"fărtățel","fartatelului":"fărtățel","fartati":["fârtați","fârtat","fârtati","fârtat","fărtați","fărtat"],"fartatii":["fârtatii","fârtat","fărtații","fărtat"],"fartatilor":["fârtatilor","fârtat","fărtaților","fărtat"],"fartatul":["fârtatul","fârtat","fărtatul","fărtat"],"fartatule":["fârtatule","fârtat","fărtatule","fărtat"],"fartatului":["fârtatului","fârtat","fărtatului","fărtat"],"farticuse":"fârticușă","farticusei":"fârticușă","farticusele":"fârticușă","farticuselor":"fârticușă","fartoasa":["fârțoasă","fârțos","fârțoasa","fârțos"],"fartoase":"fârțos","fartoasele":"fârțos","fartosi":"fârțos","fartosii":"fârțos","fartosul":"fârțos","farul":"far","farule":"far","farului":"far","faruri":"far","farurile":"far","farurilor":"far","fasaia":["fâsâia","fâsâi","fâsăia","fâsăi","fâșâia","fâșâi","fâșăia","fâșăi"],"fasaiai":["fâsâiai","fâsâi","fâsăiai","fâsăi","fâșâiai","fâșâi","fâșăiai","fâșăi"],"fasaiam":["fâsâiam","fâsâi","fâsăiam","fâsăi","fâșâiam","fâșâi","fâșăiam","fâșăi"],"fasaiati":["fâsâiați","fâsâi","fâsăiați","fâsăi","fâșâiați","fâșâi","fâșăiați","fâșăi"],"fasaiau":["fâsâiau","fâsâi","fâsăiau","fâsăi","fâșâiau","fâșâi","fâșăiau","fâșăi"],"fasaie":["fâsâie","fâsâi","fâsăie","fâsăi","fâșâie","fâșâi","fâșăie","fâșăi"],"fasaiele":["fâsăiele","fâsăială","fâșâiele","fâșâială","fâșăiele","fâșăială"],"fasaielei":["fâsăielei","fâsăială","fâșâielei","fâșâială","fâșăielei","fâșăială"],"fasaielele":["fâsăielele","fâsăială","fâșâielele","fâșâială","fâșăielele","fâșăială"],"fasaielelor":["fâsăielelor","fâsăială","fâșâielelor","fâșâială","fâșăielelor","fâșăială"],"fasaieli":["fâsâieli","fâsâială","fâsăieli","fâsăială","fâșâieli","fâșâială","fâșăieli","fâșăială"],"fasaielii":"fâsâială","fasaielile":"fâsâială","fasaielilor":"fâsâială","fasaii":["fâsâii","fâsâi","fâsăii","fâsăi","fâșâii","fâșâi","fâșăii","fâșăi"],"fasaim":["fâsâim","fâsâi","fâsăim","fâsăi","fâșâim","fâșâi","fâșăim","fâșăi"],"fasaind":["fâsâind","fâsâi","fâsăind","fâsăi","fâșâind","fâșâi","fâșăind","fâșăi"],"fasaira":["fâsâiră","fâsâi","fâsăiră","fâsăi","fâșâiră","fâșâi","fâșăiră","fâșăi"],"fasairam":["fâsâirăm","fâsâi","fâsăirăm","fâsăi","fâșâirăm","fâșâi","fâșăirăm","fâșăi"],"fasairati":["fâsâirăți","fâsâi","fâsăirăți","fâsăi","fâșâirăți","fâșâi","fâșăirăți","fâșăi"],"fasairea":["fâsâirea","fâsâire","fâsăirea","fâsăire","fâșâirea","fâșâire"],"fasairi":["fâsâiri","fâsâire","fâsăiri","fâsăire","fâșâiri","fâșâire"],"fasairii":["fâsâirii","fâsâire","fâsăirii","fâsăire","fâșâirii","fâșâire"],"fasairile":["fâsâirile","fâsâire","fâsăirile","fâsăire","fâșâirile","fâșâire"],"fasairilor":["fâsâirilor","fâsâire","fâsăirilor","fâsăire","fâșâirilor","fâșâire"],"fasaise":["fâsâise","fâsâi","fâsăise","fâsăi","fâșâise","fâșâi","fâșăise","fâșăi"],"fasaisem":["fâsâisem","fâsâi","fâsăisem","fâsăi","fâșâisem","fâșâi","fâșăisem","fâșăi"],"fasaisera":["fâsâiseră","fâsâi","fâsăiseră","fâsăi","fâșâiseră","fâșâi","fâșăiseră","fâșăi"],"fasaiseram":["fâsâiserăm","fâsâi","fâsăiserăm","fâsăi","fâșâiserăm","fâșâi","fâșăiserăm","fâșăi"],"fasaiserati":["fâsâiserăți","fâsâi","fâsăiserăți","fâsăi","fâșâiserăți","fâșâi","fâșăiserăți","fâșăi"],"fasaisesi":["fâsâiseși","fâsâi","fâsăiseși","fâsăi","fâșâiseși","fâșâi","fâșăiseși","fâșăi"],"fasaisi":["fâsâiși","fâsâi","fâsăiși","fâsăi","fâșâiși","fâșâi","fâșăiși","fâșăi"],"fasait":["fâsâit","fâsâi","fâsăit","fâsăi","fâșâit","fâșâi","fâșăit","fâșăi"],"fasaiti":["fâsâiți","fâsâi","fâsăiți","fâsăi","fâșâiți","fâșâi","fâșăiți","fâșăi"],"fasaitoare":"fâșâitor","fasaitoarea":"fâșâitor","fasaitoarele":"fâșâitor","fasaitori":"fâșâitor","fasaitorii":"fâșâitor","fasaitorul":"fâșâitor","fasaitul":["fâsâitul","fâsâit","fâsăitul","fâsăit","fâșâitul","fâșâit"],"fasaitule":["fâsâitule","fâsâit","fâsăitule","fâsăit","fâșâitule","fâșâit"],"fasaitului":["fâsâitului","fâsâit","fâsăitului","fâsăit","fâșâitului","fâșâit"],"fasaituri":["fâsâituri","fâsâit","fâsăituri","fâsăit","fâsâituri","fâsâitură","fâsăituri","fâsăitură","fâșâituri","fâșâitură"],"fasaiturii":["fâsâiturii","fâsâitură","fâsăiturii","fâsăitură","fâșâiturii","fâșâitură"],"fasaiturile":["fâsâiturile","fâsâit","fâsăiturile","fâsăit","fâsâiturile","fâsâitură","fâsăiturile","fâsăitură","fâșâiturile","fâșâitură"],"fasaiturilor":["fâsâiturilor","fâsâit","fâsăiturilor","fâsăit","fâsâiturilor","fâsâitură","fâsăiturilor","fâsăitură","fâșâiturilor","fâșâitură"],"fasamene":"fasamen","fasamenele":"fasamen","fasamenelor":"fasamen","fasamenul":"fasamen","fasamenule":"fasamen","fasamenului":"fasamen","fasaseaua":"fășașea","fasasele":"fășașea","fasaselei":"fășașea","fasaselele":"fășașea","fasaselelor":"fășașea","fasata":["fășată","fășat","fășata","fășat"],"fasate":"fășat","fasatela":["fășățelă","fășățel","fășățela","fășățel"],"fasatele":["fășatele","fășat","fășățele","fășățel"],"fasatelele":"fășățel","fasateli":"fășățel","fasatelii":"fășățel","fasatelul":"fășățel","fasati":"fășat","fasatii":"fășat","fasatul":"fășat","fascia":"fascie","fasciatia":"fasciație","fasciatiei":"fasciație","fasciatii":"fasciație","fasciatiile":"fasciație","fasciatiilor":"fasciație","fascicole":["fascicole","fascicol","fascicole","fascicolă"],"fascicolei":"fascicolă","fascicolele":["fascicolele","fascicol","fascicolele","fascicolă"],"fascicolelor":["fascicolelor","fascicol","fascicolelor","fascicolă"],"fascicolul":"fascicol","fascicolule":"fascicol","fascicolului":"fascicol","fasciculata":["fasciculată","fasciculat","fasciculata","fasciculat"],"fasciculate":"fasciculat","fasciculatele":"fasciculat","fasciculati":"fasciculat","fasciculatii":"fasciculat","fasciculatul":"fasciculat","fascicule":["fascicule","fascicul","fascicule","fasciculă"],"fasciculei":"fasciculă","fasciculele":["fasciculele","fascicul","fasciculele","fasciculă"],"fasciculelor":["fasciculelor","fascicul","fasciculelor","fasciculă"],"fasciculul":"fascicul","fasciculule":"fascicul","fasciculului":"fascicul","fasciei":"fascie","fascii":"fascie","fasciile":"fascie","fasciilor":"fascie","fascinai":"fascina","fascinam":["fascinăm","fascina","fascinam","fascina"],"fascinand":"fascina","fascinanta":["fascinantă","fascinant","fascinanta","fascinant"],"fascinante":"fascinant","fascinantele":"fascinant","fascinanti":"fascinant","fascinantii":"fascinant","fascinantul":"fascinant","fascinara":"fascina","fascinaram":"fascina","fascinarati":"fascina","fascinarea":"fascinare","fascinari":"fascinare","fascinarii":"fascinare","fascinarile":"fascinare","fascinarilor":"fascinare","fascinase":"fascina","fascinasem":"fascina","fascinasera":"fascina","fascinaseram":"fascina","fascinaserati":"fascina","fascinasesi":"fascina","fascinasi":"fascina","fascinat":"fascina","fascinata":["fascinată","fascinat","fascinata","fascinat"],"fascinate":"fascinat","fascinatele":"fascinat","fascinati":["fascinați","fascina","fascinați","fascinat"],"fascinatia":"fascinație","fascinatiei":"fascinație","fascinatii":["fascinații","fascinat","fascinații","fascinație"],"fascinatiile":"fascinație","fascinatiilor":"fascinație","fascinatiunea":"fascinațiune","fascinatiuni":"fascinațiune","fascinatiunii":"fascinațiune","fascinatiunile":"fascinațiune","fascinatiunilor":"fascinațiune","fascinatoare":"fascinator","fascinatoarea":"fascinator","fascinatoarele":"fascinator","fascinatori":"fascinator","fascinatorii":"fascinator","fascinatorul":"fascinator","fascinatul":"fascinat","fascinau":"fascina","fascineaza":"fascina","fascinez":"fascina","fascinezi":"fascina","fascioara":"fâșioară","fascioare":"făscioară","fascioarei":"făscioară","fascioarele":"făscioară","fascioarelor":"făscioară","fascioloze":"fascioloză","fasciolozei":"fascioloză","fasciolozele":"fascioloză","fasciolozelor":"fascioloză","fascismul":"fascism","fascismule":"fascism","fascismului":"fascism","fascista":["fascistă","fascist","fascista","fascist"],"fasciste":["fasciste","fascist","fasciste","fascistă"],"fascistei":"fascistă","fascistele":["fascistele","fascist","fascistele","fascistă"],"fascistelor":"fascistă","fascisti":"fascist","fascistii":"fascist","fascistilor":"fascist","fascistul":"fascist","fascistule":"fascist","fascistului":"fascist","fascizai":"fasciza","fascizam":["fascizăm","fasciza","fascizam","fasciza"],"fascizand":"fasciza","fascizara":"fasciza","fascizaram":"fasciza","fascizarati":"fasciza","fascizarea":"fascizare","fascizarei":"fascizare","fascizase":"fasciza","fascizasem":"fasciza","fascizasera":"fasciza","fascizaseram":"fasciza","fascizaserati":"fasciza","fascizasesi":"fasciza","fascizasi":"fasciza","fascizat":"fasciza","fascizati":"fasciza","fascizau":"fasciza","fascizeaza":"fasciza","fascizez":"fasciza","fascizezi":"fasciza","fascute":"fășcuță","fascutei":"fășcuță","fascutele":"fășcuță","fascutelor":"fășcuță","fase":"fâsă","fase de camp":"fâsă de câmp","fase de lunca":"fâsă de luncă","fase de munte":"fâsă de munte","fase de padure":"fâsă de pădure","fase de stanca":"fâsă de stâncă","fase rosiatice":"fâsă roșiatică","fasei":"fâsă","fasele":"fâsă","faselor":"fâsă","faseoline":"faseolină","faseolinei":"faseolină","faseolinele":"faseolină","faseolinelor":"faseolină","fasia":["fâșia","fâșie","fășia","fășie"],"fasicul":"fâșic","fasicule":"fâșic","fasicului":"fâșic","fasicuri":"fâșic","fasicurile":"fâșic","fasicurilor":"fâșic","fasie":"fâșii","fasiei":["fâșiei","fâșie","fășiei","fășie"],"fasii":["fâșii","fâșie","fășii","fășie"],"fasiia":"fâșii","fasiiai":"fâșii","fasiiam":"fâșii","fasiiati":"fâșii","fasiiau":"fâșii","fasiie":"fâșii","fasiii":"fâșii","fasiile":["fâșiile","fâșie","fășiile","fășie"],"fasiilor":["fâșiilor","fâșie","fășiilor","fășie"],"fasiim":"fâșii","fasiind":"fâșii","fasiira":"fâșii","fasiiram":"fâșii","fasiirati":"fâșii","fasiise":"fâșii","fasiisem":"fâșii","fasiisera":"fâșii","fasiiseram":"fâșii","fasiiserati":"fâșii","fasiisesi":"fâșii","fasiisi":"fâșii","fasiit":"fâșii","fasiiti":"fâșii","fasiitoare":"fâșiitor","fasiitoarea":"fâșiitor","fasiitoarele":"fâșiitor","fasiitori":"fâșiitor","fasiitorii":"fâșiitor","fasiitorul":"fâșiitor","fasiitul":"fâșiit","fasiitule":"fâșiit","fasiitului":"fâșiit","fasiituri":["fâșiituri","fâșiit","fâșiituri","fâșiitură"],"fasiiturii":"fâșiitură","fasiiturile":["fâșiiturile","fâșiit","fâșiiturile","fâșiitură"],"fasiiturilor":["fâșiiturilor","fâșiit","fâșiiturilor","fâșiitură"],"fasine":"fașină","fasinei":"fașină","fasinele":"fașină","fasinelor":"fașină","fasioare":"fâșioară","fasioarei":"fâșioară","fasioarele":"fâșioară","fasioarelor":"fâșioară","fasionabila":["fașionabilă","fașionabil","fașionabila","fașionabil"],"fasionabile":"fașionabil","fasionabilele":"fașionabil","fasionabili":"fașionabil","fasionabilii":"fașionabil","fasionabilul":"fașionabil","fasiute":"fâșiuță","fasiutei":"fâșiuță","fasiutele":"fâșiuță","fasiutelor":"fâșiuță","fasoane":"fason","fasoanele":"fason","fasoanelor":"fason","fasoare":"fășoară","fasoarei":"fășoară","fasoarele":"fășoară","fasoarelor":"fășoară","fasola":"fasole","fasole":"fasolă","fasolea":"fasole","fasolei":["fasolei","fasolă","fasolei","fasole"],"fasolele":["fasolele","fasolă","fasolele","fasole","fasolele","fasoleală"],"fasolelei":"fasoleală","fasolelele":"fasoleală","fasolelelor":"fasoleală","fasoleli":"fasoleală","fasolelor":["fasolelor","fasolă","fasolelor","fasole"],"fasolice":"fasolică","fasolicei":"fasolică","fasolicele":"fasolică","fasolicelor":"fasolică","fasolici":"fasolică","fasolistea":"fasoliște","fasolisti":"fasoliște","fasolistii":"fasoliște","fasolistile":"fasoliște","fasolistilor":"fasoliște","fasolita":["fasolită","fasolit","fasolita","fasolit"],"fasolite":"fasolit","fasolitele":"fasolit","fasoliti":"fasolit","fasolitii":"fasolit","fasolitul":"fasolit","fasonai":"fasona","fasonajul":"fasonaj","fasonajule":"fasonaj","fasonajului":"fasonaj","fasonam":["fasonăm","fasona","fasonam","fasona"],"fasonand":"fasona","fasonara":"fasona","fasonaram":"fasona","fasonarati":"fasona","fasonase":"fasona","fasonasem":"fasona","fasonasera":"fasona","fasonaseram":"fasona","fasonaserati":"fasona","fasonasesi":"fasona","fasonasi":"fasona","fasonat":"fasona","fasonati":"fasona","fasonatoarea":"fasonatoare","fasonatoarei":"fasonatoare","fasonatoarele":"fasonatoare","fasonatoarelor":"fasonatoare","fasonau":"fasona","fasoneaza":"fasona","fasonez":"fasona","fasonezi":"fasona","fasonul":"fason","fasonule":"fason","fasonului":"fason","fast-foodul":"fast-food","fast-foodule":"fast-food","fast-foodului":"fast-food","fast-fooduri":"fast-food","fast-foodurile":"fast-food","fast-foodurilor":"fast-food","fastac":"fistic","fastacea":"fâstâci","fastaceai":"fâstâci","fastaceam":"fâstâci","fastaceati":"fâstâci","fastaceau":"fâstâci","fastacele":"fâstâceală","fastacelei":"fâstâceală","fastacelele":"fâstâceală","fastacelelor":"fâstâceală","fastaceli":"fâstâceală","fastacesc":"fâstâci","fastaceste":"fâstâci","fastacesti":"fâstâci","fastaci":"fâstâc","fastacii":["fâstâcii","fâstâc","fâstâcii","fâstâci"],"fastacilor":"fâstâc","fastacim":"fâstâci","fastacind":"fâstâci","fastacira":"fâstâci","fastaciram":"fâstâci","fastacirati":"fâstâci","fastacirea":"fâstâcire","fastaciri":"fâstâcire","fastacirii":"fâstâcire","fastacirile":"fâstâcire","fastacirilor":"fâstâcire","fastacise":"fâstâci","fastacisem":"fâstâci","fastacisera":"fâstâci","fastaciseram":"fâstâci","fastaciserati":"fâstâci","fastacisesi":"fâstâci","fastacisi":"fâstâci","fastacit":"fâstâci","fastacita":["fâstâcită","fâstâcit","fâstâcita","fâstâcit"],"fastacite":"fâstâcit","fastacitele":"fâstâcit","fastaciti":["fâstâciți","fâstâci","fâstâciți","fâstâcit"],"fastacitii":"fâstâcit","fastacitul":"fâstâcit","fastacul":"fâstâc","fastacule":"fâstâc","fastacului":"fâstâc","fastidioasa":["fastidioasă","fastidios","fastidioasa","fastidios"],"fastidioase":"fastidios","fastidioasele":"fastidios","fastidiosi":"fastidios","fastidiosii":"fastidios","fastidiosul":"fastidios","fastul":"fast","fastule":"fast","fastului":"fast","fastuoasa":["fastuoasă","fastuos","fastuoasa","fastuos"],"fastuoase":"fastuos","fastuoasele":"fastuos","fastuosi":"fastuos","fastuosii":"fastuos","fastuosul":"fastuos","fasule":"fasulă","fasulea":["fasulea","fasule","făsulea","făsule"],"fasulei":["fasulei","fasulă","fasulei","fasule","făsulei","făsule"],"fasulele":["fasulele","fasulă","fasulele","fasule","făsulele","făsule"],"fasulelor":["fasulelor","fasulă","fasulelor","fasule","făsulelor","făsule"],"fasungul":"fasung","fasungule":"fasung","fasungului":"fasung","fasunguri":"fasung","fasungurile":"fasung","fasungurilor":"fasung","fasur":"fășura","fasurai":"fășura","fasuram":["fășurăm","fășura","fășuram","fășura"],"fasurand":"fășura","fasurara":"fășura","fasuraram":"fășura","fasurarati":"fășura","fasurase":"fășura","fasurasem":"fășura","fasurasera":"fășura","fasuraseram":"fășura","fasuraserati":"fășura","fasurasesi":"fășura","fasurasi":"fășura","fasurat":"fășura","fasurati":"fășura","fasurau":"fășura","fasuri":"fășura","fasute":"fășuță","fasutei":"fășuță","fasutele":"fășuță","fasutelor":"fășuță","fat":"făta","fatade":"fațadă","fatai":"făta","fataia":"fâțâi","fataiai":"fâțâi","fataiali":"fâțâială","fataialii":"fâțâială","fataialile":"fâțâială","fataialilor":"fâțâială","fataiam":"fâțâi","fataiati":"fâțâi","fataiau":"fâțâi","fataie":"fâțâi","fataieli":"fâțâială","fataii":"fâțâi","fataim":"fâțâi","fataind":"fâțâi","fataira":"fâțâi","fatairam":"fâțâi","fatairati":"fâțâi","fatairea":"fâțâire","fatairi":"fâțâire","fatairii":"fâțâire","fatairile":"fâțâire","fatairilor":"fâțâire","fataise":"fâțâi","fataisem":"fâțâi","fataisera":"fâțâi","fataiseram":"fâțâi","fataiserati":"fâțâi","fataisesi":"fâțâi","fataisi":"fâțâi","fatait":"fâțâi","fataiti":"fâțâi","fataitul":"fâțâit","fataitule":"fâțâit","fataitului":"fâțâit","fataituri":"fâțâitură","fataiturii":"fâțâitură","fataiturile":"fâțâitură","fataiturilor":"fâțâitură","fatala":["fatală","fatal","fatala","fatal"],"fatalai":"fătălău","fatalaii":"fătălău","fatalailor":"fătălău","fatalaul":"fătălău","fatalaule":"fătălău","fatalaului":"fătălău","fatale":"fatal","fatalele":"fatal","fatali":"fatal","fatalii":"fatal","fatalismul":"fatalism","fatalismule":"fatalism","fatalismului":"fatalism","fatalista":["fatalistă","fatalist","fatalista","fatalist"],"fataliste":["fataliste","fatalist","fataliste","fatalistă"],"fatalistei":"fatalistă","fatalistele":["fatalistele","fatalist","fatalistele","fatalistă"],"fatalistelor":"fatalistă","fatalisti":"fatalist","fatalistii":"fatalist","fatalistul":"fatalist","fatalitatea":"fatalitate","fatalitati":"fatalitate","fatalitatii":"fatalitate","fatalitatile":"fatalitate","fatalitatilor":"fatalitate","fatalul":"fatal","fatam":["fătăm","făta","fătam","făta"],"fatand":"făta","fatara":"făta","fataram":"făta","fatarati":"făta","fatarea":["fătarea","fătare","fățărea","fățări"],"fatareai":"fățări","fataream":"fățări","fatareati":"fățări","fatareau":"fățări","fataresc":"fățări","fatareste":"fățări","fataresti":"fățări","fatari":"fătare","fataria":"fățărie","fatariei":"fățărie","fatarii":["fătării","fătare","fățării","fățări","fățării","fățărie"],"fatariile":"fățărie","fatariilor":"fățărie","fatarile":"fătare","fatarilor":"fătare","fatarim":"fățări","fatarind":"fățări","fatarira":"fățări","fatariram":"fățări","fatarirati":"fățări","fatarise":"fățări","fatarisem":"fățări","fatarisera":"fățări","fatariseram":"fățări","fatariserati":"fățări","fatarisesi":"fățări","fatarisi":"fățări","fatarit":"fățări","fatariti":"fățări","fatarnica":["fățarnică","fățarnic","fățarnica","fățarnic"],"fatarnice":"fățarnic","fatarnicea":"fățărnici","fatarniceai":"fățărnici","fatarniceam":"fățărnici","fatarniceati":"fățărnici","fatarniceau":"fățărnici","fatarnicele":"fățarnic","fatarnicesc":"fățărnici","fatarniceste":"fățărnici","fatarnicesti":"fățărnici","fatarnici":"fățarnic","fatarnicia":"fățărnicie","fatarniciei":"fățărnicie","fatarnicii":["fățarnicii","fățarnic","fățărnicii","fățărnici","fățărnicii","fățărnicie"],"fatarniciile":"fățărnicie","fatarniciilor":"fățărnicie","fatarnicim":"fățărnici","fatarnicind":"fățărnici","fatarnicira":"fățărnici","fatarniciram":"fățărnici","fatarnicirati":"fățărnici","fatarnicise":"fățărnici","fatarnicisem":"fățărnici","fatarnicisera":"fățărnici","fatarniciseram":"fățărnici","fatarniciserati":"fățărnici","fatarnicisesi":"fățărnici","fatarnicisi":"fățărnici","fatarnicit":"fățărnici","fatarniciti":"fățărnici","fatarnicul":"fățarnic","fatase":"făta","fatasem":"făta","fatasera":"făta","fataseram":"făta","fataserati":"făta","fatasesi":"făta","fatasi":"făta","fatat":"făta","fatati":"făta","fatatoarea":"fătătoare","fatatoarele":"fătătoare","fatatoari":"fătătoare","fatatoarii":"fătătoare","fatatul":"fătat","fatatule":"fătat","fatatului":"fătat","fataturi":["fătaturi","fătat","fătături","fătătură"],"fataturii":"fătătură","fataturile":["fătaturile","fătat","fătăturile","fătătură"],"fataturilor":["fătaturilor","fătat","fătăturilor","fătătură"],"fatau":"făta","fate":"fâță","fatei":"fâță","fatele":"fâță","fatelor":"fâță","fatetai":"fațeta","fatetam":["fațetăm","fațeta","fațetam","fațeta"],"fatetand":"fațeta","fatetara":"fațeta","fatetaram":"fațeta","fatetarati":"fațeta","fatetase":"fațeta","fatetasem":"fațeta","fatetasera":"fațeta","fatetaseram":"fațeta","fatetaserati":"fațeta","fatetasesi":"fațeta","fatetasi":"fațeta","fatetat":"fațeta","fatetata":["fațetată","fațetat","fațetata","fațetat"],"fatetate":"fațetat","fatetatele":"fațetat","fatetati":["fațetați","fațeta","fațetați","fațetat"],"fatetatii":"fațetat","fatetatul":"fațetat","fatetau":"fațeta","fatete":"fațetă","fateteaza":"fațeta","fatetei":"fațetă","fatetele":"fațetă","fatetelor":"fațetă","fatetez":"fațeta","fatetezi":"fațeta","fatidica":["fatidică","fatidic","fatidica","fatidic"],"fatidice":"fatidic","fatidicele":"fatidic","fatidici":"fatidic","fatidicii":"fatidic","fatidicul":"fatidic","fatigabilitatea":"fatigabilitate","fatigabilitati":"fatigabilitate","fatigabilitatii":"fatigabilitate","fatigabilitatile":"fatigabilitate","fatigabilitatilor":"fatigabilitate","fatisa":["fățișă","fățiș","fățișa","fățiș"],"fatisarea":"fățișare","fatisari":"fățișare","fatisarii":"fățișare","fatise":"fățiș","fatisele":"fățiș","fatisi":"fățiș","fatisii":"fățiș","fatisoare":"fâțișoară","fatisoarei":"fâțișoară","fatisoarele":"fâțișoară","fatisoarelor":"fâțișoară","fatisul":"fățiș","fatoaie":"fătoi","fatoaiele":"fătoi","fatoaielor":"fătoi","fatoiul":"fătoi","fatoiule":"fătoi","fatoiului":"fătoi","fatuci":"fătucă","fatucii":"fătucă","fatucile":"fătucă","fatucilor":"fătucă","fatuia":"fățui","fatuiai":"fățui","fatuiale":"fățuială","fatuialei":"fățuială","fatuiam":"fățui","fatuiati":"fățui","fatuiau":"fățui","fatuici":"fătuică","fatuicii":"fătuică","fatuicile":"fătuică","fatuicilor":"fătuică","fatuiesc":"fățui","fatuieste":"fățui","fatuiesti":"fățui","fatuii":"fățui","fatuim":"fățui","fatuind":"fățui","fatuira":"fățui","fatuiram":"fățui","fatuirati":"fățui","fatuise":"fățui","fatuisem":"fățui","fatuisera":"fățui","fatuiseram":"fățui","fatuiserati":"fățui","fatuisesi":"fățui","fatuisi":"fățui","fatuit":"fățui","fatuitatea":"fatuitate","fatuitati":"fatuitate","fatuitatii":"fatuitate","fatuiti":"fățui","fatuitoarea":"fățuitoare","fatuitoarei":"fățuitoare","fatuitoarele":"fățuitoare","fatuitoarelor":"fățuitoare","fatuitori":"fățuitor","fatuitorii":"fățuitor","fatuitorilor":"fățuitor","fatuitorul":"fățuitor","fatuitorule":"fățuitor","fatuitorului":"fățuitor","fatuitul":"fățuit","fatuitule":"fățuit","fatuitului":"fățuit","fatul":"făt","fatule":"făt","fatului":"făt","fatumul":"fatum","fatumule":"fatum","fatumului":"fatum","fatute":"fătuță","fatutei":"fătuță","fatutele":"fătuță","fatutelor":"fătuță","faule":"faulă","faulei":"faulă","faulele":"faulă","faulelor":"faulă","faultai":"faulta","faultam":["faultăm","faulta","faultam","faulta"],"faultand":"faulta","faultara":"faulta","faultaram":"faulta","faultarati":"faulta","faultarea":"faultare","faultari":"faultare","faultarii":"faultare","faultarile":"faultare","faultarilor":"faultare","faultase":"faulta","faultasem":"faulta","faultasera":"faulta","faultaseram":"faulta","faultaserati":"faulta","faultasesi":"faulta","faultasi":"faulta","faultat":"faulta","faultati":"faulta","faultau":"faulta","faulteaza":"faulta","faultez":"faulta","faultezi":"faulta","faultul":"fault","faultule":"fault","faultului":"fault","faulturi":"fault","faulturile":"fault","faulturilor":"fault","faune":"faună","fauneasca":["faunească","faunesc","fauneasca","faunesc"],"faunei":"faună","faunele":"faună","faunelor":"faună","faunescul":"faunesc","faunesti":"faunesc","faunestii":"faunesc","faunestile":"faunesc","fauni":"faun","faunii":"faun","faunilor":"faun","faunistica":["faunistică","faunistic","faunistica","faunistic"],"faunistice":"faunistic","faunisticele":"faunistic","faunistici":"faunistic","faunisticii":"faunistic","faunisticul":"faunistic","faunul":"faun","faunule":"faun","faunului":"faun","faurarese":"făurăreasă","fauraresei":"făurăreasă","fauraresele":"făurăreasă","faurareselor":"făurăreasă","faurari":"făurar","fauraria":"făurărie","faurariei":"făurărie","faurarii":["făurarii","făurar","făurării","făurărie"],"faurariile":"făurărie","faurariilor":"făurărie","faurarilor":"făurar","faurarul":"făurar","faurarule":"făurar","faurarului":"făurar","faurea":"făuri","faureai":"făuri","fauream":"făuri","faureati":"făuri","faureau":"făuri","faurei":"făurel","faureii":"făurel","faureilor":"făurel","faurele":"făureală","faurelei":"făureală","faurelele":"făureală","faurelelor":"făureală","faureli":"făureală","faurelul":"făurel","faurelule":"făurel","faurelului":"făurel","fauresc":"făuri","faureste":"făuri","fauresti":"făuri","fauri":"faur","fauria":"făurie","fauriei":"făurie","faurii":["faurii","faur","făurii","făuri","făurii","făurie"],"fauriile":"făurie","fauriilor":"făurie","faurilor":"faur","faurim":"făuri","faurind":"făuri","faurira":"făuri","fauriram":"făuri","faurirati":"făuri","faurirea":"făurire","faurirei":"făurire","faurise":"făuri","faurisem":"făuri","faurisera":"făuri","fauriseram":"făuri","fauriserati":"făuri","faurisesi":"făuri","faurisi":"făuri","fauristea":"făuriște","fauristi":"făuriște","fauristii":"făuriște","fauristile":"făuriște","fauristilor":"făuriște","faurit":"făuri","faurita":["făurită","făurit","făurita","făurit"],"faurite":["făurite","făurit","făurițe","făuriță"],"fauritei":"făuriță","fauritele":["făuritele","făurit","făurițele","făuriță"],"fauritelor":"făuriță","fauriti":["făuriți","făuri","făuriți","făurit"],"fauritii":"făurit","fauritoarea":"făuritoare","fauritoarei":"făuritoare","fauritoarele":"făuritoare","fauritoarelor":"făuritoare","fauritori":"făuritor","fauritorii":"făuritor","fauritorilor":"făuritor","fauritorul":"făuritor","fauritorule":"făuritor","fauritorului":"făuritor","fauritul":"făurit","faurul":"faur","faurule":"faur","faurului":"faur","fausele":"făușel","fauselele":"făușel","fauselelor":"făușel","fauselul":"făușel","fauselule":"făușel","fauselului":"făușel","fave":"favă","favei":"favă","favele":["favele","favă","favele","favelă"],"favelei":"favelă","favelele":"favelă","favelelor":"favelă","favelor":"favă","favisme":"favism","favismele":"favism","favismelor":"favism","favismul":"favism","favismule":"favism","favismului":"favism","favorabila":["favorabilă","favorabil","favorabila","favorabil"],"favorabile":"favorabil","favorabilele":"favorabil","favorabili":"favorabil","favorabilii":"favorabil","favorabilul":"favorabil","favorita":["favorită","favorit","favorita","favorit"],"favorite":["favorite","favorit","favorite","favorită"],"favoritei":"favorită","favoritele":["favoritele","favorit","favoritele","favorită"],"favoritelor":"favorită","favoriti":"favorit","favoritii":"favorit","favoritisme":"favoritism","favoritismele":"favoritism","favoritismelor":"favoritism","favoritismul":"favoritism","favoritismule":"favoritism","favoritismului":"favoritism","favoritul":"favorit","favorizai":"favoriza","favorizam":["favorizăm","favoriza","favorizam","favoriza"],"favorizand":"favoriza","favorizanta":["favorizantă","favorizant","favorizanta","favorizant"],"favorizante":"favorizant","favorizantele":"favorizant","favorizanti":"favorizant","favorizantii":"favorizant","favorizantul":"favorizant","favorizara":"favoriza","favorizaram":"favoriza","favorizarati":"favoriza","favorizarea":"favorizare","favorizari":"favorizare","favorizarii":"favorizare","favorizarile":"favorizare","favorizarilor":"favorizare","favorizase":"favoriza","favorizasem":"favoriza","favorizasera":"favoriza","favorizaseram":"favoriza","favorizaserati":"favoriza","favorizasesi":"favoriza","favorizasi":"favoriza","favorizat":"favoriza","favorizata":["favorizată","favorizat","favorizata","favorizat"],"favorizate":"favorizat","favorizatele":"favorizat","favorizati":["favorizați","favoriza","favorizați","favorizat"],"favorizatii":"favorizat","favorizatul":"favorizat","favorizau":"favoriza","favorizeaza":"favoriza","favorizez":"favoriza","favorizezi":"favoriza","favorul":"favor","favorule":"favor","favorului":"favor","favoruri":["favoruri","favoare","favoruri","favor"],"favorurile":"favor","favorurilor":"favor","favusul":"favus","favusule":"favus","favusului":"favus","favusuri":"favus","favusurile":"favus","favusurilor":"favus","faxul":"fax","faxule":"fax","faxului":"fax","faxuri":"fax","faxurile":"fax","faxurilor":"fax","fazaneria":"fazanerie","fazaneriei":"fazanerie","fazanerii":"fazanerie","fazaneriile":"fazanerie","fazaneriilor":"fazanerie","fazani":"fazan","fazanieri":"fazanier","fazanierii":"fazanier","fazanierilor":"fazanier","fazanierul":"fazanier","fazanierule":"fazanier","fazanierului":"fazanier","fazanii":"fazan","fazanilor":"fazan","fazanite":"făzăniță","fazanitei":"făzăniță","fazanitele":"făzăniță","fazanitelor":"făzăniță","fazanul":"fazan","fazanule":"fazan","fazanului":"fazan","faze":"fază","faze lichide":"fază lichidă","faze lunare":"fază lunară","faze solide":"fază solidă","fazei":"fază","fazele":"fază","fazelor":"fază","fazi":"fad","fazii":"fad","fazitroane":"fazitron","fazitroanele":"fazitron","fazitroanelor":"fazitron","fazitronul":"fazitron","fazitronule":"fazitron","fazitronului":"fazitron","fazmetre":"fazmetru","fazmetrele":"fazmetru","fazmetrelor":"fazmetru","fazmetrul":"fazmetru","fazmetrule":"fazmetru","fazmetrului":"fazmetru","fc":"fct","fct":"făcut","feara":"fiară","feare":"fer","fearele":"fer","fearelor":"fer","febletea":"feblețe","febleti":"feblețe","febletii":"feblețe","febre":"febră","febre musculare":"febră musculară","febre recurente":"febră recurentă","febrei":"febră","febrele":"febră","febrelor":"febră","febricitatea":"febricitate","febricitati":"febricitate","febricitatii":"febricitate","febrifugi":"febrifug","febrifugile":"febrifug","febrifugilor":"febrifug","febrifugul":"febrifug","febrifugule":"febrifug","febrifugului":"febrifug","febrila":["febrilă","febril","febrila","febril"],"febrile":"febril","febrilele":"febril","febrili":"febril","febrilii":"febril","febrilitatea":"febrilitate","febrilitati":"febrilitate","febrilitatii":"febrilitate","febrilitatile":"febrilitate","febrilitatilor":"febrilitate","febrilul":"febril","februar":"februarie","februariele":"februarie","februarul":"februar","februarule":"februar","februarului":"februar","fecala":["fecală","fecal","fecala","fecal"],"fecale":["fecale","fecal","fecale","fecală"],"fecalei":"fecală","fecalele":["fecalele","fecal","fecalele","fecală"],"fecalelor":"fecală","fecali":"fecal","fecalii":"fecal","fecaloame":"fecalom","fecaloamele":"fecalom","fecaloamelor":"fecalom","fecaloida":["fecaloidă","fecaloid","fecaloida","fecaloid"],"fecaloide":"fecaloid","fecaloidele":"fecaloid","fecaloidul":"fecaloid","fecaloidule":"fecaloid","fecaloidului":"fecaloid","fecaloizi":"fecaloid","fecaloizii":"fecaloid","fecaloizile":"fecaloid","fecaloizilor":"fecaloid","fecalomul":"fecalom","fecalomule":"fecalom","fecalomului":"fecalom","fecalul":"fecal","fecioare":"fecioară","fecioarei":"fecioară","fecioarele":"fecioară","fecioarelor":"fecioară","feciora":"fecioară","feciorandri":"feciorandru","feciorandrii":"feciorandru","feciorandrilor":"feciorandru","feciorandruul":"feciorandru","feciorandruule":"feciorandru","feciorandruului":"feciorandru","feciorasi":"fecioraș","feciorasii":"fecioraș","feciorasilor":"fecioraș","feciorasul":"fecioraș","feciorasule":"fecioraș","feciorasului":"fecioraș","feciorea":"feciori","fecioreai":"feciori","fecioream":"feciori","fecioreasca":["feciorească","fecioresc","fecioreasca","fecioresc"],"fecioreati":"feciori","fecioreau":"feciori","fecioreaua":"feciorea","feciorei":"feciorel","fecioreii":"feciorel","fecioreilor":"feciorel","feciorele":["feciorele","fecioarică","feciorele","feciorea","feciorele","feciorică"],"feciorelei":["feciorelei","feciorea","feciorelei","feciorică"],"feciorelele":["feciorelele","feciorea","feciorelele","feciorică"],"feciorelelor":["feciorelelor","feciorea","feciorelelor","feciorică"],"feciorelnica":["feciorelnică","feciorelnic","feciorelnica","feciorelnic"],"feciorelnice":"feciorelnic","feciorelnicele":"feciorelnic","feciorelnici":"feciorelnic","feciorelnicii":"feciorelnic","feciorelnicul":"feciorelnic","feciorelul":"feciorel","feciorelule":"feciorel","feciorelului":"feciorel","feciorenia":"feciorenie","fecioreniei":"feciorenie","feciorenii":"feciorenie","fecioresc":"feciori","feciorescul":"fecioresc","fecioreste":"feciori","fecioresti":["feciorești","fecioresc","feciorești","feciori"],"feciorestii":"fecioresc","feciorestile":"fecioresc","feciori":"fecior","feciori tomnatici":"fecior tomnatic","fecioria":"feciorie","feciorica":["feciorică","fecioarică","feciorica","fecioarică"],"feciorice":"fecioarică","fecioricei":"fecioarică","fecioricele":"fecioarică","fecioricelor":"fecioarică","fecioriei":"feciorie","feciorii":["feciorii","fecior","feciorii","feciori","feciorii","feciorie"],"feciorilor":"fecior","feciorim":"feciori","feciorind":"feciori","feciorira":"feciori","fecioriram":"feciori","feciorirati":"feciori","feciorise":"feciori","feciorisem":"feciori","feciorisera":"feciori","fecioriseram":"feciori","fecioriserati":"feciori","feciorisesi":"feciori","feciorisi":"feciori","feciorit":"feciori","feciorite":"fecioriță","fecioritei":"fecioriță","fecioritele":"fecioriță","fecioritelor":"fecioriță","fecioriti":"feciori","feciorul":"fecior","feciorule":"fecior","feciorului":"fecior","fecule":"feculă","feculei":"feculă","feculenta":["feculentă","feculent","feculenta","feculent"],"feculente":"feculent","feculentele":"feculent","feculenti":"feculent","feculentii":"feculent","feculentul":"feculent","feculeria":"feculerie","feculeriei":"feculerie","feculerii":"feculerie","feculeriile":"feculerie","feculeriilor":"feculerie","fecunda":["fecundă","fecund","fecunda","fecund"],"fecundabila":["fecundabilă","fecundabil","fecundabila","fecundabil"],"fecundabile":"fecundabil","fecundabilele":"fecundabil","fecundabili":"fecundabil","fecundabilii":"fecundabil","fecundabilul":"fecundabil","fecundai":"fecunda","fecundam":["fecundăm","fecunda","fecundam","fecunda"],"fecundand":"fecunda","fecundara":"fecunda","fecundaram":"fecunda","fecundarati":"fecunda","fecundarea":"fecundare","fecundari":"fecundare","fecundarii":"fecundare","fecundarile":"fecundare","fecundarilor":"fecundare","fecundase":"fecunda","fecundasem":"fecunda","fecundasera":"fecunda","fecundaseram":"fecunda","fecundaserati":"fecunda","fecundasesi":"fecunda","fecundasi":"fecunda","fecundat":"fecunda","fecundata":["fecundată","fecundat","fecundata","fecundat"],"fecundate":"fecundat","fecundatele":"fecundat","fecundati":["fecundați","fecunda","fecundați","fecundat"],"fecundatia":"fecundație","fecundatiei":"fecundație","fecundatii":["fecundații","fecundat","fecundații","fecundație"],"fecundatiile":"fecundație","fecundatiilor":"fecundație","fecundatiunea":"fecundațiune","fecundatiuni":"fecundațiune","fecundatiunii":"fecundațiune","fecundatiunile":"fecundațiune","fecundatiunilor":"fecundațiune","fecundatul":"fecundat","fecundau":"fecunda","fecunde":"fecund","fecundeaza":"fecunda","fecundele":"fecund","fecundez":"fecunda","fecundezi":"fecunda","fecunditatea":"fecunditate","fecunditati":"fecunditate","fecunditatii":"fecunditate","fecundul":"fecund","fecunzi":"fecund","fecunzii":"fecund","fedelesul":"fedeleș","fedelesule":"fedeleș","fedelesului":"fedeleș","fedelesuri":"fedeleș","fedelesurile":"fedeleș","fedelesurilor":"fedeleș","federai":"federa","federala":["federală","federal","federala","federal"],"federale":"federal","federalele":"federal","federali":"federal","federalii":"federal","federalismul":"federalism","federalismule":"federalism","federalismului":"federalism","federaliste":"federalistă","federalistei":"federalistă","federalistele":"federalistă","federalistelor":"federalistă","federalisti":"federalist","federalistii":"federalist","federalistilor":"federalist","federalistul":"federalist","federalistule":"federalist","federalistului":"federalist","federaliz":"federaliza","federalizai":"federaliza","federalizam":["federalizăm","federaliza","federalizam","federaliza"],"federalizand":"federaliza","federalizara":"federaliza","federalizaram":"federaliza","federalizarati":"federaliza","federalizarea":"federalizare","federalizari":"federalizare","federalizarii":"federalizare","federalizarile":"federalizare","federalizarilor":"federalizare","federalizase":"federaliza","federalizasem":"federaliza","federalizasera":"federaliza","federalizaseram":"federaliza","federalizaserati":"federaliza","federalizasesi":"federaliza","federalizasi":"federaliza","federalizat":"federaliza","federalizati":"federaliza","federalizau":"federaliza","federalizeaza":"federaliza","federalizi":"federaliza","federalul":"federal","federam":["federăm","federa","federam","federa"],"federand":"federa","federara":"federa","federaram":"federa","federarati":"federa","federase":"federa","federasem":"federa","federasera":"federa","federaseram":"federa","federaserati":"federa","federasesi":"federa","federasi":"federa","federat":"federa","federati":["federați","federa","federați","federat"],"federatia":"federație","federatiei":"federație","federatii":["federații","federat","federații","federație"],"federatiile":"federație","federatiilor":"federație","federatilor":"federat","federatiune":"federație","federatiunea":"federațiune","federatiuni":"federațiune","federatiunii":"federațiune","federatiunile":"federațiune","federatiunilor":"federațiune","federativa":["federativă","federativ","federativa","federativ"],"federative":"federativ","federativele":"federativ","federativi":"federativ","federativii":"federativ","federativul":"federativ","federatul":"federat","federatule":"federat","federatului":"federat","federau":"federa","federeaza":"federa","federez":"federa","federezi":"federa","federvaisul":"federvais","federvaisule":"federvais","federvaisului":"federvais","feea":"fee","feedbackul":"feedback","feedbackule":"feedback","feedbackului":"feedback","feedbackuri":"feedback","feedbackurile":"feedback","feedbackurilor":"feedback","feei":"fee","feele":"fee","feelingul":"feeling","feelingule":"feeling","feelingului":"feeling","feelinguri":"feeling","feelingurile":"feeling","feelingurilor":"feeling","feelor":"fee","feeria":"feerie","feerica":["feerică","feeric","feerica","feeric"],"feerice":"feeric","feericele":"feeric","feerici":"feeric","feericii":"feeric","feericul":"feeric","feeriei":"feerie","feerii":"feerie","feeriile":"feerie","feeriilor":"feerie","felahi":"felah","felahii":"felah","felahilor":"felah","felahul":"felah","felahule":"felah","felahului":"felah","felatia":"felație","felatiei":"felație","felatii":"felație","felatiile":"felație","felatiilor":"felație","felcere":"felceră","felcerei":"felceră","felcerele":"felceră","felcerelor":"felceră","felceri":"felcer","felcerii":"felcer","felcerilor":"felcer","felcerite":"felceriță","felceritei":"felceriță","felceritele":"felceriță","felceritelor":"felceriță","felcerul":"felcer","felcerule":"felcer","felcerului":"felcer","felcute":"felcuță","felcutei":"felcuță","felcutele":"felcuță","felcutelor":"felcuță","feldere":"felderă","felderei":"felderă","felderele":"felderă","felderelor":"felderă","feldmaresali":"feldmareșal","feldmaresalii":"feldmareșal","feldmaresalilor":"feldmareșal","feldmaresalul":"feldmareșal","feldmaresalule":"feldmareșal","feldmaresalului":"feldmareșal","feldspati":"feldspat","feldspatica":["feldspatică","feldspatic","feldspatica","feldspatic"],"feldspatice":"feldspatic","feldspaticele":"feldspatic","feldspatici":"feldspatic","feldspaticii":"feldspatic","feldspaticul":"feldspatic","feldspatii":"feldspat","feldspatilor":"feldspat","feldspatoidul":"feldspatoid","feldspatoidule":"feldspatoid","feldspatoidului":"feldspatoid","feldspatoizi":"feldspatoid","feldspatoizii":"feldspatoid","feldspatoizilor":"feldspatoid","feldspatul":"feldspat","feldspatule":"feldspat","feldspatului":"feldspat","feldvebali":"feldvebăl","feldvebalii":"feldvebăl","feldvebalilor":"feldvebăl","feldvebalul":"feldvebăl","feldvebalule":"feldvebăl","feldvebalului":"feldvebăl","feldwebeli":"feldwebel","feldwebelii":"feldwebel","feldwebelilor":"feldwebel","feldwebelul":"feldwebel","feldwebelule":"feldwebel","feldwebelului":"feldwebel","felegeanul":"felegean","felegeanule":"felegean","felegeanului":"felegean","felegene":"felegean","felegenele":"felegean","felegenelor":"felegean","felegute":"feleguță","felegutei":"feleguță","felegutele":"feleguță","felegutelor":"feleguță","felesagul":"feleșag","felesagule":"feleșag","felesagului":"feleșag","felesaguri":"feleșag","felesagurile":"feleșag","felesagurilor":"feleșag","felesuia":"feleșui","felesuiai":"feleșui","felesuiam":"feleșui","felesuiati":"feleșui","felesuiau":"feleșui","felesuie":"feleșui","felesuii":"feleșui","felesuim":"feleșui","felesuind":"feleșui","felesuira":"feleșui","felesuiram":"feleșui","felesuirati":"feleșui","felesuise":"feleșui","felesuisem":"feleșui","felesuisera":"feleșui","felesuiseram":"feleșui","felesuiserati":"feleșui","felesuisesi":"feleșui","felesuisi":"feleșui","felesuit":"feleșui","felesuiti":"feleșui","felia":"felie","feliai":"felia","feliam":"felia","feliara":"felia","feliaram":"felia","feliarati":"felia","feliase":"felia","feliasem":"felia","feliasera":"felia","feliaseram":"felia","feliaserati":"felia","feliasesi":"felia","feliasi":"felia","feliat":"felia","feliati":"felia","feliau":"felia","feliaza":"felia","felibri":"felibru","felibrii":"felibru","felibrilor":"felibru","felibrul":"felibru","felibrule":"felibru","felibrului":"felibru","feliceaua":"felicea","felicele":"felicea","felicelei":"felicea","felicelele":"felicea","felicelelor":"felicea","felicit":"felicita","felicitai":"felicita","felicitam":["felicităm","felicita","felicitam","felicita"],"felicitand":"felicita","felicitara":"felicita","felicitaram":"felicita","felicitarati":"felicita","felicitarea":"felicitare","felicitari":"felicitare","felicitarii":"felicitare","felicitarile":"felicitare","felicitarilor":"felicitare","felicitase":"felicita","felicitasem":"felicita","felicitasera":"felicita","felicitaseram":"felicita","felicitaserati":"felicita","felicitasesi":"felicita","felicitasi":"felicita","felicitat":"felicita","felicitata":["felicitată","felicitat","felicitata","felicitat"],"felicitate":"felicitat","felicitatele":"felicitat","felicitati":["felicitați","felicita","felicitați","felicitat"],"felicitatii":"felicitat","felicitatul":"felicitat","felicitau":"felicita","felicite":"felicita","feliciti":"felicita","felide":"felidă","felidei":"felidă","felidele":"felidă","felidelor":"felidă","felie":"felia","feliei":"felie","feliem":"felia","felierea":"feliere","felieri":"feliere","felierii":"feliere","felierile":"feliere","felierilor":"feliere","feliez":"felia","feliezi":"felia","feligeanul":"feligean","feligeanule":"feligean","feligeanului":"feligean","feligene":"feligean","feligenele":"feligean","feligenelor":"feligean","felii":"felie","feliile":"felie","feliilor":"felie","feliind":"felia","felina":["felină","felin","felina","felin"],"felinare":"felinar","felinarele":"felinar","felinarelor":"felinar","felinarul":"felinar","felinarule":"felinar","felinarului":"felinar","feline":["feline","felin","feline","felină"],"felinei":"felină","felinele":["felinele","felin","felinele","felină"],"felinelor":"felină","felini":"felin","felinii":"felin","felinitatea":"felinitate","felinitati":"felinitate","felinitatii":"felinitate","felinitatile":"felinitate","felinitatilor":"felinitate","felinul":"felin","felioare":"felioară","felioarei":"felioară","felioarele":"felioară","felioarelor":"felioară","felisce":"felișcă","feliscei":"felișcă","felite":"feliță","felitei":"feliță","felitele":"feliță","felitelor":"feliță","feliur":"feliuri","feliure":"feliuri","feliurea":"feliuri","feliureai":"feliuri","feliuream":"feliuri","feliureati":"feliuri","feliureau":"feliuri","feliurie":"feliuri","feliurii":"feliuri","feliurim":"feliuri","feliurimea":"feliurime","feliurimi":"feliurime","feliurimii":"feliurime","feliurimile":"feliurime","feliurimilor":"feliurime","feliurind":"feliuri","feliurira":"feliuri","feliuriram":"feliuri","feliurirati":"feliuri","feliurise":"feliuri","feliurisem":"feliuri","feliurisera":"feliuri","feliuriseram":"feliuri","feliuriserati":"feliuri","feliurisesi":"feliuri","feliurisi":"feliuri","feliurit":"feliuri","feliurita":["feliurită","feliurit","feliurita","feliurit"],"feliurite":"feliurit","feliuritele":"feliurit","feliuriti":["feliuriți","feliuri","feliuriți","feliurit"],"feliuritii":"feliurit","feliuritul":"feliurit","feliusagul":"feliușag","feliusagule":"feliușag","feliusagului":"feliușag","feliusaguri":"feliușag","feliusagurile":"feliușag","feliusagurilor":"feliușag","feliute":"feliuță","feliutei":"feliuță","feliutele":"feliuță","feliutelor":"feliuță","feloane":"felon","feloanele":"felon","feloanelor":"felon","feloderme":"feloderm","felodermele":"feloderm","felodermelor":"feloderm","felodermul":"feloderm","felodermule":"feloderm","felodermului":"feloderm","felogene":"felogen","felogenele":"felogen","felogenelor":"felogen","felogenul":"felogen","felogenule":"felogen","felogenului":"felogen","felonia":"felonie","feloniei":"felonie","felonii":"felonie","felonul":"felon","felonule":"felon","felonului":"felon","felpinzul":"felpinz","felpinzule":"felpinz","felpinzului":"felpinz","felpinzuri":"felpinz","felpinzurile":"felpinz","felpinzurilor":"felpinz","feluci":"felucă","felucii":"felucă","felucile":"felucă","felucilor":"felucă","felul":"fel","felule":"fel","felului":"fel","felurea":"feluri","felureai":"feluri","feluream":"feluri","felureati":"feluri","felureau":"feluri","feluresc":"feluri","felureste":"feluri","feluresti":"feluri","feluri":"fel","felurii":"feluri","felurile":"fel","felurilor":"fel","felurim":"feluri","felurimea":"felurime","felurimi":"felurime","felurimii":"felurime","felurimile":"felurime","felurimilor":"felurime","felurind":"feluri","felurira":"feluri","feluriram":"feluri","felurirati":"feluri","felurise":"feluri","felurisem":"feluri","felurisera":"feluri","feluriseram":"feluri","feluriserati":"feluri","felurisesi":"feluri","felurisi":"feluri","felurit":"feluri","felurita":["felurită","felurit","felurita","felurit"],"felurite":"felurit","feluritele":"felurit","feluriti":["feluriți","feluri","feluriți","felurit"],"feluritii":"felurit","feluritul":"felurit","femei":"femeie","femei de serviciu":"femeie de serviciu","femei publice":"femeie publică","femei transsexuale":"femeie transsexuală","femeia":"femeie","femeiasca":["femeiască","femeiesc","femeiasca","femeiesc"],"femeiescul":"femeiesc","femeiesti":"femeiesc","femeiestii":"femeiesc","femeiestile":"femeiesc","femeietul":"femeiet","femeietule":"femeiet","femeietului":"femeiet","femeieturi":"femeiet","femeieturile":"femeiet","femeieturilor":"femeiet","femeii":"femeie","femeile":"femeie","femeilor":"femeie","femeiuste":"femeiușcă","femeiustei":"femeiușcă","femeiustele":"femeiușcă","femeiustelor":"femeiușcă","femeiute":"femeiuță","femeiutei":"femeiuță","femeiutele":"femeiuță","femeiutelor":"femeiuță","femele":"femelă","femelei":"femelă","femelele":"femelă","femelelor":"femelă","femenina":["femenină","femenin","femenina","femenin"],"femenine":"femenin","femeninele":"femenin","femenini":"femenin","femeninii":"femenin","femeninul":"femenin","feminina":["feminină","feminin","feminina","feminin"],"feminine":"feminin","femininele":"feminin","feminini":"feminin","femininii":"feminin","femininul":"feminin","feminismul":"feminism","feminismule":"feminism","feminismului":"feminism","feministe":"feministă","feministei":"feministă","feministele":"feministă","feministelor":"feministă","feministi":"feminist","feministii":"feminist","feministilor":"feminist","feministul":"feminist","feministule":"feminist","feministului":"feminist","feminitatea":"feminitate","feminitati":"feminitate","feminitatii":"feminitate","feminizai":"feminiza","feminizam":["feminizăm","feminiza","feminizam","feminiza"],"feminizand":"feminiza","feminizara":"feminiza","feminizaram":"feminiza","feminizarati":"feminiza","feminizarea":"feminizare","feminizari":"feminizare","feminizarii":"feminizare","feminizarile":"feminizare","feminizarilor":"feminizare","feminizase":"feminiza","feminizasem":"feminiza","feminizasera":"feminiza","feminizaseram":"feminiza","feminizaserati":"feminiza"};
@@ -0,0 +1 @@
+export default {"feminizasesi":"feminiza","feminizasi":"feminiza","feminizat":"feminiza","feminizati":"feminiza","feminizau":"feminiza","feminizeaza":"feminiza","feminizez":"feminiza","feminizezi":"feminiza","femurala":["femurală","femural","femurala","femural"],"femurale":"femural","femuralele":"femural","femurali":"femural","femuralii":"femural","femuralul":"femural","femurul":"femur","femurule":"femur","femurului":"femur","femururi":"femur","femururile":"femur","femururilor":"femur","fenantrene":"fenantren","fenantrenele":"fenantren","fenantrenelor":"fenantren","fenantrenul":"fenantren","fenantrenule":"fenantren","fenantrenului":"fenantren","fenati":"fenat","fenatii":"fenat","fenatilor":"fenat","fenatul":"fenat","fenatule":"fenat","fenatului":"fenat","fenazone":"fenazonă","fenazonei":"fenazonă","fenazonele":"fenazonă","fenazonelor":"fenazonă","feneantismul":"feneantism","feneantismule":"feneantism","feneantismului":"feneantism","feneci":"fenec","fenecii":"fenec","fenecilor":"fenec","fenecul":"fenec","fenecule":"fenec","fenecului":"fenec","fenestratia":"fenestrație","fenestratiei":"fenestrație","fenestratii":"fenestrație","fenestratiile":"fenestrație","fenestratiilor":"fenestrație","fenestre":"fenestra","fenhiele":"fenhiel","fenhielei":"fenhiel","fenhielelor":"fenhiel","fenhielul":"fenhiel","fenhielule":"fenhiel","fenhielului":"fenhiel","fenianisme":"fenianism","fenianismele":"fenianism","fenianismelor":"fenianism","fenianismul":"fenianism","fenianismule":"fenianism","fenianismului":"fenianism","fenianul":"fenian","fenianule":"fenian","fenianului":"fenian","feniari":"feniar","feniarii":"feniar","feniarilor":"feniar","feniarul":"feniar","feniarule":"feniar","feniarului":"feniar","fenica":["fenică","fenic","fenica","fenic"],"fenice":"fenic","fenicele":"fenic","feniceli":"fenicel","fenicelii":"fenicel","fenicelilor":"fenicel","fenicelul":"fenicel","fenicelule":"fenicel","fenicelului":"fenicel","feniceul":"fenice","feniceule":"fenice","feniceului":"fenice","fenici":["fenici","fenic","fenici","fenice"],"fenicianul":"fenician","fenicianule":"fenician","fenicianului":"fenician","feniciene":"feniciană","fenicienei":"feniciană","fenicienele":"feniciană","fenicienelor":"feniciană","fenicieni":"fenician","fenicienii":"fenician","fenicienilor":"fenician","fenicii":["fenicii","fenic","fenicii","fenice"],"fenicilor":"fenice","fenicsi":"fenix","fenicsii":"fenix","fenicsilor":"fenix","fenicul":"fenic","feniculi":"fenicul","fenieni":"fenian","fenienile":"fenian","fenienilor":"fenian","fenilalanine":"fenilalanină","fenilalaninei":"fenilalanină","fenilalaninele":"fenilalanină","fenilalaninelor":"fenilalanină","fenilamine":"fenilamină","fenilaminei":"fenilamină","fenilaminele":"fenilamină","fenilaminelor":"fenilamină","fenilbutazone":"fenilbutazonă","fenilbutazonei":"fenilbutazonă","fenilbutazonele":"fenilbutazonă","fenilbutazonelor":"fenilbutazonă","fenilene":"fenilen","fenilenele":"fenilen","fenilenelor":"fenilen","fenilenul":"fenilen","fenilenule":"fenilen","fenilenului":"fenilen","fenili":"fenil","fenilii":"fenil","fenililor":"fenil","fenilul":"fenil","fenilule":"fenil","fenilului":"fenil","fenixul":"fenix","fenixule":"fenix","fenixului":"fenix","fenobarbitalul":"fenobarbital","fenobarbitalule":"fenobarbital","fenobarbitalului":"fenobarbital","fenofaze":"fenofază","fenofazei":"fenofază","fenofazele":"fenofază","fenofazelor":"fenofază","fenolati":"fenolat","fenolatii":"fenolat","fenolatilor":"fenolat","fenolatul":"fenolat","fenolatule":"fenolat","fenolatului":"fenolat","fenolftaleine":"fenolftaleină","fenolftaleinei":"fenolftaleină","fenolftaleinele":"fenolftaleină","fenolftaleinelor":"fenolftaleină","fenoli":"fenol","fenolica":["fenolică","fenolic","fenolica","fenolic"],"fenolice":"fenolic","fenolicele":"fenolic","fenolici":"fenolic","fenolicii":"fenolic","fenolicul":"fenolic","fenolii":"fenol","fenolilor":"fenol","fenologia":"fenologie","fenologica":["fenologică","fenologic","fenologica","fenologic"],"fenologice":"fenologic","fenologicele":"fenologic","fenologici":"fenologic","fenologicii":"fenologic","fenologicul":"fenologic","fenologiei":"fenologie","fenologii":"fenologie","fenolul":"fenol","fenolule":"fenol","fenolului":"fenol","fenomenala":["fenomenală","fenomenal","fenomenala","fenomenal"],"fenomenale":"fenomenal","fenomenalele":"fenomenal","fenomenali":"fenomenal","fenomenalii":"fenomenal","fenomenalismul":"fenomenalism","fenomenalismule":"fenomenalism","fenomenalismului":"fenomenalism","fenomenalista":["fenomenalistă","fenomenalist","fenomenalista","fenomenalist"],"fenomenaliste":["fenomenaliste","fenomenalist","fenomenaliste","fenomenalistă"],"fenomenalistei":"fenomenalistă","fenomenalistele":["fenomenalistele","fenomenalist","fenomenalistele","fenomenalistă"],"fenomenalistelor":"fenomenalistă","fenomenalisti":"fenomenalist","fenomenalistii":"fenomenalist","fenomenalistilor":"fenomenalist","fenomenalistul":"fenomenalist","fenomenalistule":"fenomenalist","fenomenalistului":"fenomenalist","fenomenalitatea":"fenomenalitate","fenomenalitati":"fenomenalitate","fenomenalitatii":"fenomenalitate","fenomenalitatile":"fenomenalitate","fenomenalitatilor":"fenomenalitate","fenomenalul":"fenomenal","fenomene":"fenomen","fenomenele":"fenomen","fenomenelor":"fenomen","fenomenismul":"fenomenism","fenomenismule":"fenomenism","fenomenismului":"fenomenism","fenomenologi":"fenomenolog","fenomenologia":"fenomenologie","fenomenologica":["fenomenologică","fenomenologic","fenomenologica","fenomenologic"],"fenomenologice":"fenomenologic","fenomenologicele":"fenomenologic","fenomenologici":"fenomenologic","fenomenologicii":"fenomenologic","fenomenologicul":"fenomenologic","fenomenologiei":"fenomenologie","fenomenologii":["fenomenologii","fenomenolog","fenomenologii","fenomenologie"],"fenomenologilor":"fenomenolog","fenomenologul":"fenomenolog","fenomenologule":"fenomenolog","fenomenologului":"fenomenolog","fenomenul":"fenomen","fenomenule":"fenomen","fenomenului":"fenomen","fenoplaste":"fenoplastă","fenoplastei":"fenoplastă","fenotiazine":"fenotiazină","fenotiazinei":"fenotiazină","fenotiazinele":"fenotiazină","fenotiazinelor":"fenotiazină","fenotipica":["fenotipică","fenotipic","fenotipica","fenotipic"],"fenotipice":"fenotipic","fenotipicele":"fenotipic","fenotipici":"fenotipic","fenotipicii":"fenotipic","fenotipicul":"fenotipic","fenotipul":"fenotip","fenotipule":"fenotip","fenotipului":"fenotip","fentai":"fenta","fentam":["fentăm","fenta","fentam","fenta"],"fentand":"fenta","fentara":"fenta","fentaram":"fenta","fentarati":"fenta","fentase":"fenta","fentasem":"fenta","fentasera":"fenta","fentaseram":"fenta","fentaserati":"fenta","fentasesi":"fenta","fentasi":"fenta","fentat":"fenta","fentati":"fenta","fentau":"fenta","fente":"fentă","fenteaza":"fenta","fentei":"fentă","fentele":"fentă","fentelor":"fentă","fentez":"fenta","fentezi":"fenta","feodala":["feodală","feodal","feodala","feodal"],"feodale":"feodal","feodalele":"feodal","feodali":"feodal","feodalii":"feodal","feodalul":"feodal","fer":"fier","feraluminiuul":"feraluminiu","feraluminiuule":"feraluminiu","feraluminiuului":"feraluminiu","ferastraiasi":"ferăstrăiaș","ferastraiasii":"ferăstrăiaș","ferastraiasilor":"ferăstrăiaș","ferastraiasul":"ferăstrăiaș","ferastraiasule":"ferăstrăiaș","ferastraiasului":"ferăstrăiaș","ferastraie":"ferăstrău","ferastraie circulare":"ferăstrău circular","ferastraiele":"ferăstrău","ferastraielor":"ferăstrău","ferastraul":"ferăstrău","ferastraule":"ferăstrău","ferastraului":"ferăstrău","ferastrui":"ferăstruie","ferastruia":["ferăstruia","ferăstrui","ferăstruia","ferăstruie"],"ferastruiai":"ferăstrui","ferastruiam":"ferăstrui","ferastruiati":"ferăstrui","ferastruiau":"ferăstrui","ferastruiesc":"ferăstrui","ferastruieste":"ferăstrui","ferastruiesti":"ferăstrui","ferastruii":["ferăstruii","ferăstrui","ferăstruii","ferăstruie"],"ferastruile":"ferăstruie","ferastruilor":"ferăstruie","ferastruim":"ferăstrui","ferastruind":"ferăstrui","ferastruira":"ferăstrui","ferastruiram":"ferăstrui","ferastruirati":"ferăstrui","ferastruirea":"ferăstruire","ferastruiri":"ferăstruire","ferastruirii":"ferăstruire","ferastruirile":"ferăstruire","ferastruirilor":"ferăstruire","ferastruise":"ferăstrui","ferastruisem":"ferăstrui","ferastruisera":"ferăstrui","ferastruiseram":"ferăstrui","ferastruiserati":"ferăstrui","ferastruisesi":"ferăstrui","ferastruisi":"ferăstrui","ferastruit":"ferăstrui","ferastruita":["ferăstruită","ferăstruit","ferăstruita","ferăstruit"],"ferastruite":"ferăstruit","ferastruitele":"ferăstruit","ferastruiti":["ferăstruiți","ferăstrui","ferăstruiți","ferăstruit"],"ferastruitii":"ferăstruit","ferastruitul":"ferăstruit","ferati":"ferat","feratii":"ferat","feratilor":"ferat","feratul":"ferat","feratule":"ferat","feratului":"ferat","ferbere":"ferber","ferberele":"ferber","ferberelor":"ferber","ferberul":"ferber","ferberule":"ferber","ferberului":"ferber","ferbintele":"ferbințeală","ferbintelei":"ferbințeală","ferbintelele":"ferbințeală","ferbintelelor":"ferbințeală","ferbinteli":"ferbințeală","ferchesa":["fercheșă","fercheș","fercheșa","fercheș"],"ferchese":"fercheș","ferchesele":"fercheș","ferchesi":"fercheș","ferchesii":"fercheș","ferchesul":"fercheș","ferchezuia":"ferchezui","ferchezuiai":"ferchezui","ferchezuiam":"ferchezui","ferchezuiati":"ferchezui","ferchezuiau":"ferchezui","ferchezuiele":"ferchezuială","ferchezuielei":"ferchezuială","ferchezuielele":"ferchezuială","ferchezuielelor":"ferchezuială","ferchezuieli":"ferchezuială","ferchezuiesc":"ferchezui","ferchezuieste":"ferchezui","ferchezuiesti":"ferchezui","ferchezuii":"ferchezui","ferchezuim":"ferchezui","ferchezuind":"ferchezui","ferchezuira":"ferchezui","ferchezuiram":"ferchezui","ferchezuirati":"ferchezui","ferchezuise":"ferchezui","ferchezuisem":"ferchezui","ferchezuisera":"ferchezui","ferchezuiseram":"ferchezui","ferchezuiserati":"ferchezui","ferchezuisesi":"ferchezui","ferchezuisi":"ferchezui","ferchezuit":"ferchezui","ferchezuita":["ferchezuită","ferchezuit","ferchezuita","ferchezuit"],"ferchezuite":"ferchezuit","ferchezuitele":"ferchezuit","ferchezuiti":["ferchezuiți","ferchezui","ferchezuiți","ferchezuit"],"ferchezuitii":"ferchezuit","ferchezuitul":"ferchezuit","ferea":"feri","fereai":"feri","fereale":"fereală","ferealei":"fereală","feream":"feri","fereasta":"fereastră","fereati":"feri","fereau":"feri","ferec":"fereca","ferecai":"fereca","ferecam":["ferecăm","fereca","ferecam","fereca"],"ferecand":"fereca","ferecara":"fereca","ferecaram":"fereca","ferecarati":"fereca","ferecarea":"ferecare","ferecari":"ferecare","ferecarii":"ferecare","ferecarile":"ferecare","ferecarilor":"ferecare","ferecase":"fereca","ferecasem":"fereca","ferecasera":"fereca","ferecaseram":"fereca","ferecaserati":"fereca","ferecasesi":"fereca","ferecasi":"fereca","ferecat":"fereca","ferecati":"fereca","ferecatul":"ferecat","ferecatule":"ferecat","ferecatului":"ferecat","ferecaturi":"ferecătură","ferecaturii":"ferecătură","ferecaturile":"ferecătură","ferecaturilor":"ferecătură","ferecau":"fereca","ferece":["ferece","fereca","ferece","ferigă"],"fereci":["fereci","fereca","fereci","ferecă"],"ferecii":"ferecă","ferecile":"ferecă","ferecilor":"ferecă","feredeie":"feredeu","feredeiele":"feredeu","feredeielor":"feredeu","feredeuul":"feredeu","feredeuule":"feredeu","feredeuului":"feredeu","ferega":"ferigă","feregeaua":"feregea","feregele":"feregea","feregelei":"feregea","feregelele":"feregea","feregelelor":"feregea","feregi":"feregă","feregii":"feregă","feregile":"feregă","feregilor":"feregă","ferentari":"ferentar","ferentarii":"ferentar","ferentarilor":"ferentar","ferentarul":"ferentar","ferentarule":"ferentar","ferentarului":"ferentar","feresc":"feri","fereste":["ferește","fereastă","ferește","feri"],"ferestei":"fereastă","ferestele":"fereastă","ferestelor":"fereastă","feresti":["ferești","fereastă","ferești","feri"],"ferestici":"ferestică","feresticii":"ferestică","feresticile":"ferestică","feresticilor":"ferestică","ferestraie":"ferestrău","ferestrasi mari":"ferestraș mare","ferestrasi mici":"ferestraș mic","ferestrasi motati":"ferestraș moțat","ferestre":"fereastră","ferestrei":"fereastră","ferestrele":"fereastră","ferestrelor":"fereastră","ferestrice":"ferestrică","ferestricei":"ferestrică","ferestricele":"ferestrică","ferestricelor":"ferestrică","ferestrici":"ferestrică","ferestrui":"ferestruie","ferestruia":["ferestruia","ferestrui","ferestruia","ferestruie"],"ferestruiai":"ferestrui","ferestruiam":"ferestrui","ferestruiati":"ferestrui","ferestruiau":"ferestrui","ferestruici":"ferestruică","ferestruicii":"ferestruică","ferestruicile":"ferestruică","ferestruicilor":"ferestruică","ferestruiei":"ferestruie","ferestruiesc":"ferestrui","ferestruieste":"ferestrui","ferestruiesti":"ferestrui","ferestruii":["ferestruii","ferestrui","ferestruii","ferestruie"],"ferestruiile":"ferestruie","ferestruiilor":"ferestruie","ferestruim":"ferestrui","ferestruind":"ferestrui","ferestruira":"ferestrui","ferestruiram":"ferestrui","ferestruirati":"ferestrui","ferestruirea":"ferestruire","ferestruiri":"ferestruire","ferestruirii":"ferestruire","ferestruirile":"ferestruire","ferestruirilor":"ferestruire","ferestruise":"ferestrui","ferestruisem":"ferestrui","ferestruisera":"ferestrui","ferestruiseram":"ferestrui","ferestruiserati":"ferestrui","ferestruisesi":"ferestrui","ferestruisi":"ferestrui","ferestruit":"ferestrui","ferestruita":["ferestruită","ferestruit","ferestruita","ferestruit"],"ferestruite":"ferestruit","ferestruitele":"ferestruit","ferestruiti":["ferestruiți","ferestrui","ferestruiți","ferestruit"],"ferestruitii":"ferestruit","ferestruitul":"ferestruit","ferestrute":"ferestruță","ferestrutei":"ferestruță","ferestrutele":"ferestruță","ferestrutelor":"ferestruță","ferestui":"ferestuie","ferestuia":["ferestuia","ferestui","ferestuia","ferestuie"],"ferestuiai":"ferestui","ferestuiam":"ferestui","ferestuiati":"ferestui","ferestuiau":"ferestui","ferestuici":"ferestuică","ferestuicii":"ferestuică","ferestuicile":"ferestuică","ferestuicilor":"ferestuică","ferestuiesc":"ferestui","ferestuieste":"ferestui","ferestuiesti":"ferestui","ferestuii":["ferestuii","ferestui","ferestuii","ferestuie"],"ferestuile":"ferestuie","ferestuilor":"ferestuie","ferestuim":"ferestui","ferestuind":"ferestui","ferestuira":"ferestui","ferestuiram":"ferestui","ferestuirati":"ferestui","ferestuirea":"ferestuire","ferestuiri":"ferestuire","ferestuirii":"ferestuire","ferestuirile":"ferestuire","ferestuirilor":"ferestuire","ferestuise":"ferestui","ferestuisem":"ferestui","ferestuisera":"ferestui","ferestuiseram":"ferestui","ferestuiserati":"ferestui","ferestuisesi":"ferestui","ferestuisi":"ferestui","ferestuit":"ferestui","ferestuita":["ferestuită","ferestuit","ferestuita","ferestuit"],"ferestuite":"ferestuit","ferestuitele":"ferestuit","ferestuiti":["ferestuiți","ferestui","ferestuiți","ferestuit"],"ferestuitii":"ferestuit","ferestuitul":"ferestuit","ferfelite":"ferfeliță","ferfelitei":"ferfeliță","ferfenitai":"ferfenița","ferfenitam":["ferfenițăm","ferfenița","ferfenițam","ferfenița"],"ferfenitand":"ferfenița","ferfenitara":"ferfenița","ferfenitaram":"ferfenița","ferfenitarati":"ferfenița","ferfenitase":"ferfenița","ferfenitasem":"ferfenița","ferfenitasera":"ferfenița","ferfenitaseram":"ferfenița","ferfenitaserati":"ferfenița","ferfenitasesi":"ferfenița","ferfenitasi":"ferfenița","ferfenitat":"ferfenița","ferfenitati":"ferfenița","ferfenitau":"ferfenița","ferfenite":"ferfeniță","ferfeniteaza":"ferfenița","ferfenitei":"ferfeniță","ferfenitez":"ferfenița","ferfenitezi":"ferfenița","ferfenititul":"ferfenițit","ferfenititule":"ferfenițit","ferfenititului":"ferfenițit","ferfenitoasa":["ferfenițoasă","ferfenițos","ferfenițoasa","ferfenițos"],"ferfenitoase":"ferfenițos","ferfenitoasele":"ferfenițos","ferfenitosi":"ferfenițos","ferfenitosii":"ferfenițos","ferfenitosul":"ferfenițos","fergheteagul":"fergheteag","fergheteagule":"fergheteag","fergheteagului":"fergheteag","feribotul":"feribot","feribotule":"feribot","feribotului":"feribot","feriboturi":"feribot","feriboturile":"feribot","feriboturilor":"feribot","feric":"ferica","ferica":["ferică","feric","ferica","feric"],"fericaciunea":"fericăciune","fericaciuni":"fericăciune","fericaciunii":"fericăciune","fericaciunile":"fericăciune","fericaciunilor":"fericăciune","fericai":"ferica","fericam":["fericăm","ferica","fericam","ferica"],"fericand":"ferica","fericara":"ferica","fericaram":"ferica","fericarati":"ferica","fericase":"ferica","fericasem":"ferica","fericasera":"ferica","fericaseram":"ferica","fericaserati":"ferica","fericasesi":"ferica","fericasi":"ferica","fericat":"ferica","fericati":"ferica","fericau":"ferica","ferice":["ferice","feric","ferice","ferigă"],"fericea":"ferici","fericeai":"ferici","fericeam":"ferici","fericeati":"ferici","fericeau":"ferici","fericele":"feric","fericesc":"ferici","fericeste":"ferici","fericesti":"ferici","ferici":["ferici","feric","ferici","ferica"],"fericianuri":"fericianură","fericianurii":"fericianură","fericianurile":"fericianură","fericianurilor":"fericianură","fericii":["fericii","feric","fericii","ferici"],"fericim":"ferici","fericind":"ferici","fericinte":"fericință","fericintei":"fericință","fericintele":"fericință","fericintelor":"fericință","fericira":"ferici","fericiram":"ferici","fericirati":"ferici","fericirea":"fericire","fericiri":"fericire","fericirii":"fericire","fericirile":"fericire","fericirilor":"fericire","fericise":"ferici","fericisem":"ferici","fericisera":"ferici","fericiseram":"ferici","fericiserati":"ferici","fericisesi":"ferici","fericisi":"ferici","fericit":["fericit","ferici","fericit","fericita"],"fericita":["fericită","fericit","fericita","fericit"],"fericitai":"fericita","fericitam":["fericităm","fericita","fericitam","fericita"],"fericitand":"fericita","fericitara":"fericita","fericitaram":"fericita","fericitarati":"fericita","fericitase":"fericita","fericitasem":"fericita","fericitasera":"fericita","fericitaseram":"fericita","fericitaserati":"fericita","fericitasesi":"fericita","fericitasi":"fericita","fericitat":"fericita","fericitati":"fericita","fericitau":"fericita","fericite":["fericite","fericit","fericite","fericită"],"fericitei":"fericită","fericitele":["fericitele","fericit","fericitele","fericită"],"fericitelor":"fericită","fericiti":["fericiți","ferici","fericiți","fericit","fericiți","fericita"],"fericitii":"fericit","fericitoare":"fericitor","fericitoarea":"fericitor","fericitoarele":"fericitor","fericitori":"fericitor","fericitorii":"fericitor","fericitorul":"fericitor","fericitul":"fericit","fericul":"feric","ferigi":"ferigă","ferii":"feri","ferim":"feri","ferimagnetica":["ferimagnetică","ferimagnetic","ferimagnetica","ferimagnetic"],"ferimagnetice":"ferimagnetic","ferimagneticele":"ferimagnetic","ferimagnetici":"ferimagnetic","ferimagneticii":"ferimagnetic","ferimagneticul":"ferimagnetic","ferimagnetismul":"ferimagnetism","ferimagnetismule":"ferimagnetism","ferimagnetismului":"ferimagnetism","ferind":"feri","ferinte":"ferință","ferintei":"ferință","ferintele":"ferință","ferintelor":"ferință","feriptiva":["feriptivă","feriptiv","feriptiva","feriptiv"],"feriptive":"feriptiv","feriptivele":"feriptiv","feriptivi":"feriptiv","feriptivii":"feriptiv","feriptivul":"feriptiv","ferira":"feri","feriram":"feri","ferirati":"feri","ferirea":"ferire","feriri":"ferire","feririi":"ferire","feririle":"ferire","feririlor":"ferire","ferise":"feri","ferisem":"feri","ferisera":"feri","feriseram":"feri","feriserati":"feri","ferisesi":"feri","ferisi":"feri","ferit":"feri","ferita":["ferită","ferit","ferita","ferit"],"ferite":["ferite","ferit","ferite","ferită"],"feritei":"ferită","feritele":["feritele","ferit","feritele","ferită"],"feritelor":"ferită","feriti":["feriți","feri","feriți","ferit"],"feritica":["feritică","feritic","feritica","feritic"],"feritice":"feritic","feriticele":"feritic","feritici":"feritic","feriticii":"feritic","feriticul":"feritic","feritii":"ferit","feritul":"ferit","ferma":["fermă","ferm","ferma","ferm"],"fermate":"fermată","fermatei":"fermată","fermatele":"fermată","fermatelor":"fermată","ferme":["ferme","ferm","ferme","fermă"],"fermecai":"fermeca","fermecam":["fermecăm","fermeca","fermecam","fermeca"],"fermecand":"fermeca","fermecara":"fermeca","fermecaram":"fermeca","fermecarati":"fermeca","fermecarea":"fermecare","fermecari":"fermecare","fermecarii":"fermecare","fermecarile":"fermecare","fermecarilor":"fermecare","fermecase":"fermeca","fermecasem":"fermeca","fermecasera":"fermeca","fermecaseram":"fermeca","fermecaserati":"fermeca","fermecasesi":"fermeca","fermecasi":"fermeca","fermecat":"fermeca","fermecata":["fermecată","fermecat","fermecata","fermecat"],"fermecate":"fermecat","fermecatele":"fermecat","fermecati":["fermecați","fermeca","fermecați","fermecat"],"fermecatii":"fermecat","fermecatoare":"fermecător","fermecatoarea":"fermecător","fermecatoarele":"fermecător","fermecatoreasca":["fermecătorească","fermecătoresc","fermecătoreasca","fermecătoresc"],"fermecatorescul":"fermecătoresc","fermecatorese":"fermecătoreasă","fermecatoresei":"fermecătoreasă","fermecatoresele":"fermecătoreasă","fermecatoreselor":"fermecătoreasă","fermecatoresti":"fermecătoresc","fermecatorestii":"fermecătoresc","fermecatorestile":"fermecătoresc","fermecatori":"fermecător","fermecatoria":"fermecătorie","fermecatoriei":"fermecătorie","fermecatorii":["fermecătorii","fermecător","fermecătorii","fermecătorie"],"fermecatoriile":"fermecătorie","fermecatoriilor":"fermecătorie","fermecatorul":"fermecător","fermecatul":"fermecat","fermecaturi":"fermecătură","fermecaturii":"fermecătură","fermecaturile":"fermecătură","fermecaturilor":"fermecătură","fermecau":"fermeca","fermei":"fermă","fermele":["fermele","ferm","fermele","fermă"],"fermelor":"fermă","fermenase":"fermenaș","fermenasele":"fermenaș","fermenaselor":"fermenaș","fermenasul":"fermenaș","fermenasule":"fermenaș","fermenasului":"fermenaș","fermentabila":["fermentabilă","fermentabil","fermentabila","fermentabil"],"fermentabile":"fermentabil","fermentabilele":"fermentabil","fermentabili":"fermentabil","fermentabilii":"fermentabil","fermentabilul":"fermentabil","fermentai":"fermenta","fermentam":["fermentăm","fermenta","fermentam","fermenta"],"fermentand":"fermenta","fermentara":"fermenta","fermentaram":"fermenta","fermentarati":"fermenta","fermentarea":"fermentare","fermentari":"fermentare","fermentarii":"fermentare","fermentarile":"fermentare","fermentarilor":"fermentare","fermentase":"fermenta","fermentasem":"fermenta","fermentasera":"fermenta","fermentaseram":"fermenta","fermentaserati":"fermenta","fermentasesi":"fermenta","fermentasi":"fermenta","fermentat":"fermenta","fermentati":"fermenta","fermentatii":"fermentație","fermentatiunea":"fermentațiune","fermentatiuni":"fermentațiune","fermentatiunii":"fermentațiune","fermentatiunile":"fermentațiune","fermentatiunilor":"fermentațiune","fermentativa":["fermentativă","fermentativ","fermentativa","fermentativ"],"fermentative":"fermentativ","fermentativele":"fermentativ","fermentativi":"fermentativ","fermentativii":"fermentativ","fermentativul":"fermentativ","fermentatul":"fermentat","fermentatule":"fermentat","fermentatului":"fermentat","fermentau":"fermenta","fermenteaza":"fermenta","fermentescibila":["fermentescibilă","fermentescibil","fermentescibila","fermentescibil"],"fermentescibile":"fermentescibil","fermentescibilele":"fermentescibil","fermentescibili":"fermentescibil","fermentescibilii":"fermentescibil","fermentescibilitatati":"fermentescibilitate","fermentescibilitatatii":"fermentescibilitate","fermentescibilitatatile":"fermentescibilitate","fermentescibilitatatilor":"fermentescibilitate","fermentescibilitatea":"fermentescibilitate","fermentescibilul":"fermentescibil","fermentez":"fermenta","fermentezi":"fermenta","fermenti":"ferment","fermentii":"ferment","fermentilor":"ferment","fermentul":"ferment","fermentule":"ferment","fermentului":"ferment","fermi":"ferm","fermiere":"fermieră","fermierei":"fermieră","fermierele":"fermieră","fermierelor":"fermieră","fermieri":"fermier","fermierii":"fermier","fermierilor":"fermier","fermierul":"fermier","fermierule":"fermier","fermierului":"fermier","fermii":"ferm","fermioni":"fermion","fermionii":"fermion","fermionilor":"fermion","fermionul":"fermion","fermionule":"fermion","fermionului":"fermion","fermitatea":"fermitate","fermitati":"fermitate","fermitatii":"fermitate","fermiul":"fermiu","fermiule":"fermiu","fermiului":"fermiu","fermoare":"fermoar","fermoarele":"fermoar","fermoarelor":"fermoar","fermoarul":"fermoar","fermoarule":"fermoar","fermoarului":"fermoar","fermul":"ferm","fernambucul":"fernambuc","fernambucule":"fernambuc","fernambucului":"fernambuc","fernambucuri":"fernambuc","fernambucurile":"fernambuc","fernambucurilor":"fernambuc","feroaliaje":"feroaliaj","feroaliajele":"feroaliaj","feroaliajelor":"feroaliaj","feroaliajul":"feroaliaj","feroaliajule":"feroaliaj","feroaliajului":"feroaliaj","feroaluminiul":"feroaluminiu","feroaluminiule":"feroaluminiu","feroaluminiului":"feroaluminiu","feroasa":["feroasă","feros","feroasa","feros"],"feroase":"feros","feroasele":"feros","ferobacteri":"ferobacter","ferobacterii":"ferobacter","ferobacterilor":"ferobacter","ferobacterul":"ferobacter","ferobacterule":"ferobacter","ferobacterului":"ferobacter","ferocea":"feroce","ferocele":"feroce","feroci":"feroce","ferocianuri":"ferocianură","ferocianurii":"ferocianură","ferocianurile":"ferocianură","ferocianurilor":"ferocianură","ferocii":"feroce","ferocitatea":"ferocitate","ferocitati":"ferocitate","ferocitatii":"ferocitate","ferocromul":"ferocrom","ferocromule":"ferocrom","ferocromului":"ferocrom","ferodoul":"ferodo","ferodoule":"ferodo","ferodoului":"ferodo","ferodouri":"ferodo","ferodourile":"ferodo","ferodourilor":"ferodo","feroelectrica":["feroelectrică","feroelectric","feroelectrica","feroelectric"],"feroelectrice":"feroelectric","feroelectricele":"feroelectric","feroelectrici":"feroelectric","feroelectricii":"feroelectric","feroelectricitatea":"feroelectricitate","feroelectricitati":"feroelectricitate","feroelectricitatii":"feroelectricitate","feroelectricul":"feroelectric","feroeze":"feroeză","feroezei":"feroeză","feroezele":"feroeză","feroezelor":"feroeză","feromagnetica":["feromagnetică","feromagnetic","feromagnetica","feromagnetic"],"feromagnetice":"feromagnetic","feromagneticele":"feromagnetic","feromagnetici":"feromagnetic","feromagneticii":"feromagnetic","feromagneticul":"feromagnetic","feromagnetismul":"feromagnetism","feromagnetismule":"feromagnetism","feromagnetismului":"feromagnetism","feromolibdenul":"feromolibden","feromolibdenule":"feromolibden","feromolibdenului":"feromolibden","feromoni":"feromon","feromonii":"feromon","feromonilor":"feromon","feromonul":"feromon","feromonule":"feromon","feromonului":"feromon","feroneria":"feronerie","feroneriei":"feronerie","feronerii":"feronerie","feroneriile":"feronerie","feroneriilor":"feronerie","feronichelul":"feronichel","feronichelule":"feronichel","feronichelului":"feronichel","ferosi":"feros","ferosii":"feros","ferosiliciuul":"ferosiliciu","ferosiliciuule":"ferosiliciu","ferosiliciuului":"ferosiliciu","ferosul":"feros","ferotipia":"ferotipie","ferotipiei":"ferotipie","ferotipii":"ferotipie","ferotipiile":"ferotipie","ferotipiilor":"ferotipie","ferotitanul":"ferotitan","ferotitanule":"ferotitan","ferotitanului":"ferotitan","ferovanadiuul":"ferovanadiu","ferovanadiuule":"ferovanadiu","ferovanadiuului":"ferovanadiu","feroviara":"feroviar","feroviare":["feroviare","feroviar","feroviare","feroviară"],"feroviarei":"feroviară","feroviarele":"feroviară","feroviarelor":"feroviară","feroviari":"feroviar","feroviarii":"feroviar","feroviarilor":"feroviar","feroviarul":"feroviar","feroviarule":"feroviar","feroviarului":"feroviar","ferpare":"ferpar","ferparele":"ferpar","ferparelor":"ferpar","ferparul":"ferpar","ferparule":"ferpar","ferparului":"ferpar","fertila":["fertilă","fertil","fertila","fertil"],"fertile":"fertil","fertilele":"fertil","fertili":"fertil","fertilii":"fertil","fertilitatea":"fertilitate","fertilitati":"fertilitate","fertilitatii":"fertilitate","fertilizabila":["fertilizabilă","fertilizabil","fertilizabila","fertilizabil"],"fertilizabile":"fertilizabil","fertilizabilele":"fertilizabil","fertilizabili":"fertilizabil","fertilizabilii":"fertilizabil","fertilizabilul":"fertilizabil","fertilizai":"fertiliza","fertilizam":["fertilizăm","fertiliza","fertilizam","fertiliza"],"fertilizand":"fertiliza","fertilizanta":["fertilizantă","fertilizant","fertilizanta","fertilizant"],"fertilizante":"fertilizant","fertilizantele":"fertilizant","fertilizanti":"fertilizant","fertilizantii":"fertilizant","fertilizantul":"fertilizant","fertilizara":"fertiliza","fertilizaram":"fertiliza","fertilizarati":"fertiliza","fertilizarea":"fertilizare","fertilizarei":"fertilizare","fertilizase":"fertiliza","fertilizasem":"fertiliza","fertilizasera":"fertiliza","fertilizaseram":"fertiliza","fertilizaserati":"fertiliza","fertilizasesi":"fertiliza","fertilizasi":"fertiliza","fertilizat":"fertiliza","fertilizata":["fertilizată","fertilizat","fertilizata","fertilizat"],"fertilizate":"fertilizat","fertilizatele":"fertilizat","fertilizati":["fertilizați","fertiliza","fertilizați","fertilizat"],"fertilizatii":"fertilizat","fertilizatul":"fertilizat","fertilizau":"fertiliza","fertilizeaza":"fertiliza","fertilizez":"fertiliza","fertilizezi":"fertiliza","fertilul":"fertil","feruginoasa":["feruginoasă","feruginos","feruginoasa","feruginos"],"feruginoase":"feruginos","feruginoasele":"feruginos","feruginosi":"feruginos","feruginosii":"feruginos","feruginosul":"feruginos","ferul":"fer","ferule":"fer","ferului":"fer","ferventa":["ferventă","fervent","ferventa","fervent"],"fervente":["fervente","fervent","fervențe","fervență"],"ferventei":"fervență","ferventele":["ferventele","fervent","fervențele","fervență"],"ferventelor":"fervență","ferventi":"fervent","ferventii":"fervent","ferventul":"fervent","fervida":["fervidă","fervid","fervida","fervid"],"fervide":"fervid","fervidele":"fervid","fervidul":"fervid","fervizi":"fervid","fervizii":"fervid","fervoarea":"fervoare","fervori":"fervoare","fervorii":"fervoare","fescioare":"fescior","fescioarele":"fescior","fescioarelor":"fescior","fesciorul":"fescior","fesciorule":"fescior","fesciorului":"fescior","fese":["feșe","fașă","fese","fesă"],"fesei":["feșei","fașă","fesei","fesă"],"fesele":["feșele","fașă","fesele","fesă"],"feselor":["feșelor","fașă","feselor","fesă"],"fesfeselele":"fesfesele","fesfeselelor":"fesfesele","fesiera":["fesieră","fesier","fesiera","fesier"],"fesiere":"fesier","fesierele":"fesier","fesieri":"fesier","fesierii":"fesier","fesierul":"fesier","fesisoare":"fesișor","fesisoarele":"fesișor","fesisoarelor":"fesișor","fesisorul":"fesișor","fesisorule":"fesișor","fesisorului":"fesișor","fesnice":"feșnic","fesnicele":"feșnic","fesnicelor":"feșnic","fesnicul":"feșnic","fesnicule":"feșnic","fesnicului":"feșnic","festania":"feștanie","festaniei":"feștanie","festanii":"feștanie","festaniile":"feștanie","festaniilor":"feștanie","feste":"festă","festea":"fești","festeai":"fești","festeam":"fești","festeati":"fești","festeau":"fești","festei":"festă","festele":["festele","festă","feștele","feșteală"],"festelea":"feșteli","festeleai":"feșteli","festeleam":"feșteli","festeleati":"feșteli","festeleau":"feșteli","festelei":"feșteală","festelele":"feșteală","festelelor":"feșteală","festelesc":"feșteli","festeleste":"feșteli","festelesti":"feșteli","festeli":"feșteală","festelii":"feșteli","festelim":"feșteli","festelind":"feșteli","festelira":"feșteli","festeliram":"feșteli","festelirati":"feșteli","festelirea":"feștelire","festeliri":"feștelire","festelirii":"feștelire","festelirile":"feștelire","festelirilor":"feștelire","festelise":"feșteli","festelisem":"feșteli","festelisera":"feșteli","festeliseram":"feșteli","festeliserati":"feșteli","festelisesi":"feșteli","festelisi":"feșteli","festelit":"feșteli","festelita":["feștelită","feștelit","feștelita","feștelit"],"festelite":"feștelit","festelitele":"feștelit","festeliti":["feșteliți","feșteli","feșteliți","feștelit"],"festelitii":"feștelit","festelitoarea":"feștelitoare","festelitoarei":"feștelitoare","festelitoarele":"feștelitoare","festelitoarelor":"feștelitoare","festelitul":"feștelit","festelituri":"feștelitură","festeliturii":"feștelitură","festeliturile":"feștelitură","festeliturilor":"feștelitură","festelor":"festă","festente":"festență","festentei":"festență","festentele":"festență","festentelor":"festență","festesc":"fești","festeste":"fești","festesti":"fești","festii":"fești","festile":"feștilă","festilei":"feștilă","festilele":"feștilă","festilelor":"feștilă","festim":"fești","festind":"fești","festinul":"festin","festinule":"festin","festinului":"festin","festinuri":"festin","festinurile":"festin","festinurilor":"festin","festira":"fești","festiram":"fești","festirati":"fești","festise":"fești","festisem":"fești","festisera":"fești","festiseram":"fești","festiserati":"fești","festisesi":"fești","festisi":"fești","festit":"fești","festiti":"fești","festiva":["festivă","festiv","festiva","festiv"],"festivaliera":["festivalieră","festivalier","festivaliera","festivalier"],"festivaliere":"festivalier","festivalierele":"festivalier","festivalieri":"festivalier","festivalierii":"festivalier","festivalierul":"festivalier","festivaliste":"festivalistă","festivalistei":"festivalistă","festivalistele":"festivalistă","festivalistelor":"festivalistă","festivalisti":"festivalist","festivalistii":"festivalist","festivalistilor":"festivalist","festivalistul":"festivalist","festivalistule":"festivalist","festivalistului":"festivalist","festivalul":"festival","festivalule":"festival","festivalului":"festival","festivaluri":"festival","festivalurile":"festival","festivalurilor":"festival","festive":"festiv","festivele":"festiv","festivi":"festiv","festivii":"festiv","festivismul":"festivism","festivismule":"festivism","festivismului":"festivism","festivista":["festivistă","festivist","festivista","festivist"],"festiviste":"festivist","festivistele":"festivist","festivisti":"festivist","festivistii":"festivist","festivistul":"festivist","festivitatea":"festivitate","festivitati":"festivitate","festivitatii":"festivitate","festivitatile":"festivitate","festivitatilor":"festivitate","festivul":"festiv","festoane":"feston","festoanele":"feston","festoanelor":"feston","festonai":"festona","festonam":["festonăm","festona","festonam","festona"],"festonand":"festona","festonara":"festona","festonaram":"festona","festonarati":"festona","festonase":"festona","festonasem":"festona","festonasera":"festona","festonaseram":"festona","festonaserati":"festona","festonasesi":"festona","festonasi":"festona","festonat":"festona","festonata":["festonată","festonat","festonata","festonat"],"festonate":"festonat","festonatele":"festonat","festonati":["festonați","festona","festonați","festonat"],"festonatii":"festonat","festonatul":"festonat","festonau":"festona","festoneaza":"festona","festonez":"festona","festonezi":"festona","festonul":"feston","festonule":"feston","festonului":"feston","festungul":"festung","festungule":"festung","festungului":"festung","festunguri":"festung","festungurile":"festung","festungurilor":"festung","fesul":"fes","fesule":"fes","fesului":"fes","fesuri":"fes","fesurile":"fes","fesurilor":"fes","fesusori":"fesușor","fesusorii":"fesușor","fesusorilor":"fesușor","fesusorul":"fesușor","fesusorule":"fesușor","fesusorului":"fesușor","fetala":["fetală","fetal","fetala","fetal"],"fetale":"fetal","fetalele":"fetal","fetali":"fetal","fetalii":"fetal","fetalul":"fetal","fete":["fete","fată","fețe","față","fete","făta"],"fete batrane":"fată bătrână","fete bisericesti":"față bisericească","fete de masa":"față de masă","fete de perna":"față de pernă","fete in casa":"fată în casă","fete mari":"fată mare","feteasca":["fetească","fetesc","feteasca","fetesc"],"fetei":["fetei","fată","feței","față"],"fetele":["fetele","fată","fețele","față"],"fetelei":"feteleu","feteleii":"feteleu","feteleilor":"feteleu","feteleuul":"feteleu","feteleuule":"feteleu","feteleuului":"feteleu","fetelor":["fetelor","fată","fețelor","față"],"fetescul":"fetesc","fetesti":"fetesc","fetestii":"fetesc","fetestile":"fetesc","feti":["feți","făt","feți","făta"],"feti-frumosi":"Făt-Frumos","fetia":"fetie","fetice":"fetică","feticei":"fetică","feticidul":"feticid","feticidule":"feticid","feticidului":"feticid","feticiduri":"feticid","feticidurile":"feticid","feticidurilor":"feticid","fetida":["fetidă","fetid","fetida","fetid"],"fetide":"fetid","fetidele":"fetid","fetiditatea":"fetiditate","fetiditati":"fetiditate","fetiditatii":"fetiditate","fetiditatile":"fetiditate","fetiditatilor":"fetiditate","fetidul":"fetid","fetiei":"fetie","fetii":["feții","făt","fetii","fetie"],"fetilor":"făt","fetiscane":"fetișcană","fetiscanei":"fetișcană","fetiscanele":"fetișcană","fetiscanelor":"fetișcană","fetisisme":"fetișism","fetisismele":"fetișism","fetisismelor":"fetișism","fetisismul":"fetișism","fetisismule":"fetișism","fetisismului":"fetișism","fetisiste":"fetișistă","fetisistei":"fetișistă","fetisistele":"fetișistă","fetisistelor":"fetișistă","fetisisti":"fetișist","fetisistii":"fetișist","fetisistilor":"fetișist","fetisistul":"fetișist","fetisistule":"fetișist","fetisistului":"fetișist","fetisizai":"fetișiza","fetisizam":["fetișizăm","fetișiza","fetișizam","fetișiza"],"fetisizand":"fetișiza","fetisizanta":["fetișizantă","fetișizant","fetișizanta","fetișizant"],"fetisizante":"fetișizant","fetisizantele":"fetișizant","fetisizanti":"fetișizant","fetisizantii":"fetișizant","fetisizantul":"fetișizant","fetisizara":"fetișiza","fetisizaram":"fetișiza","fetisizarati":"fetișiza","fetisizarea":"fetișizare","fetisizari":"fetișizare","fetisizarii":"fetișizare","fetisizarile":"fetișizare","fetisizarilor":"fetișizare","fetisizase":"fetișiza","fetisizasem":"fetișiza","fetisizasera":"fetișiza","fetisizaseram":"fetișiza","fetisizaserati":"fetișiza","fetisizasesi":"fetișiza","fetisizasi":"fetișiza","fetisizat":"fetișiza","fetisizati":"fetișiza","fetisizau":"fetișiza","fetisizeaza":"fetișiza","fetisizez":"fetișiza","fetisizezi":"fetișiza","fetisoare":["fetișoare","fetișoară","fețișoare","fețișoară"],"fetisoarei":["fetișoarei","fetișoară","fețișoarei","fețișoară"],"fetisoarele":["fetișoarele","fetișoară","fețișoarele","fețișoară"],"fetisoarelor":["fetișoarelor","fetișoară","fețișoarelor","fețișoară"],"fetisori":"fetișor","fetisorii":"fetișor","fetisorilor":"fetișor","fetisorul":"fetișor","fetisorule":"fetișor","fetisorului":"fetișor","fetisul":"fetiș","fetisule":"fetiș","fetisului":"fetiș","fetisuri":"fetiș","fetisurile":"fetiș","fetisurilor":"fetiș","fetite":"fetiță","fetitei":"fetiță","fetitele":"fetiță","fetitelor":"fetiță","fetizi":"fetid","fetizii":"fetid","fetnegele":"fetnegică","fetnegelei":"fetnegică","fetnegelele":"fetnegică","fetnegelelor":"fetnegică","fetnigute":"fetniguță","fetnigutei":"fetniguță","fetnigutele":"fetniguță","fetnigutelor":"fetniguță","fetomaterna":["fetomaternă","fetomatern","fetomaterna","fetomatern"],"fetomaterne":"fetomatern","fetomaternele":"fetomatern","fetomaterni":"fetomatern","fetomaternii":"fetomatern","fetomaternul":"fetomatern","fetrul":"fetru","fetrule":"fetru","fetrului":"fetru","fetusi":"fetus","fetusii":"fetus","fetusilor":"fetus","fetusul":"fetus","fetusule":"fetus","fetusului":"fetus","fetvale":"fetva","fetvalei":"fetva","fetvalele":"fetva","fetvalelor":"fetva","fetvaua":"fetva","feudala":["feudală","feudal","feudala","feudal"],"feudale":"feudal","feudalele":"feudal","feudali":"feudal","feudalii":"feudal","feudalitatea":"feudalitate","feudalitati":"feudalitate","feudalitatii":"feudalitate","feudalizai":"feudaliza","feudalizam":["feudalizăm","feudaliza","feudalizam","feudaliza"],"feudalizand":"feudaliza","feudalizara":"feudaliza","feudalizaram":"feudaliza","feudalizarati":"feudaliza","feudalizarea":"feudalizare","feudalizari":"feudalizare","feudalizarii":"feudalizare","feudalizarile":"feudalizare","feudalizarilor":"feudalizare","feudalizase":"feudaliza","feudalizasem":"feudaliza","feudalizasera":"feudaliza","feudalizaseram":"feudaliza","feudalizaserati":"feudaliza","feudalizasesi":"feudaliza","feudalizasi":"feudaliza","feudalizat":"feudaliza","feudalizata":["feudalizată","feudalizat","feudalizata","feudalizat"],"feudalizate":"feudalizat","feudalizatele":"feudalizat","feudalizati":["feudalizați","feudaliza","feudalizați","feudalizat"],"feudalizatii":"feudalizat","feudalizatul":"feudalizat","feudalizau":"feudaliza","feudalizeaza":"feudaliza","feudalizez":"feudaliza","feudalizezi":"feudaliza","feudalul":"feudal","feude":["feude","feud","feude","feudă"],"feudei":"feudă","feudele":["feudele","feud","feudele","feudă"],"feudelor":["feudelor","feud","feudelor","feudă"],"feudul":"feud","feudule":"feud","feudului":"feud","fevruarie":"februarie","fezabila":["fezabilă","fezabil","fezabila","fezabil"],"fezabile":"fezabil","fezabilele":"fezabil","fezabili":"fezabil","fezabilii":"fezabil","fezabilitatea":"fezabilitate","fezabilitati":"fezabilitate","fezabilitatii":"fezabilitate","fezabilitatile":"fezabilitate","fezabilitatilor":"fezabilitate","fezabilul":"fezabil","fezandai":"fezanda","fezandam":["fezandăm","fezanda","fezandam","fezanda"],"fezandand":"fezanda","fezandara":"fezanda","fezandaram":"fezanda","fezandarati":"fezanda","fezandarea":"fezandare","fezandari":"fezandare","fezandarii":"fezandare","fezandarile":"fezandare","fezandarilor":"fezandare","fezandase":"fezanda","fezandasem":"fezanda","fezandasera":"fezanda","fezandaseram":"fezanda","fezandaserati":"fezanda","fezandasesi":"fezanda","fezandasi":"fezanda","fezandat":"fezanda","fezandata":["fezandată","fezandat","fezandata","fezandat"],"fezandate":"fezandat","fezandatele":"fezandat","fezandati":["fezandați","fezanda","fezandați","fezandat"],"fezandatii":"fezandat","fezandatul":"fezandat","fezandau":"fezanda","fezandeaza":"fezanda","fezandez":"fezanda","fezandezi":"fezanda","fia":"fie","fiabila":["fiabilă","fiabil","fiabila","fiabil"],"fiabile":"fiabil","fiabilele":"fiabil","fiabili":"fiabil","fiabilii":"fiabil","fiabilitatea":"fiabilitate","fiabilitati":"fiabilitate","fiabilitatii":"fiabilitate","fiabilitatile":"fiabilitate","fiabilitatilor":"fiabilitate","fiabilul":"fiabil","fiacre":"fiacru","fiacrele":"fiacru","fiacrelor":"fiacru","fiacrul":"fiacru","fiacrule":"fiacru","fiacrului":"fiacru","fiarba":"fierbe","fiare":["fiare","fiară","fiare","fier"],"fiare de calcat":"fier de călcat","fiarei":"fiară","fiarele":["fiarele","fiară","fiarele","fier"],"fiarelor":["fiarelor","fiară","fiarelor","fier"],"fiarta":["fiartă","fiert","fiarta","fiert"],"fiasca":["fiască","fiesc","fiasca","fiesc"],"fiascoul":"fiasco","fiascoule":"fiasco","fiascoului":"fiasco","fiastri":"fiastru","fiastrii":"fiastru","fiastrilor":"fiastru","fiastrul":"fiastru","fiastrule":"fiastru","fiastrului":"fiastru","fiatul":"fiat","fiatule":"fiat","fiatului":"fiat","fiaturi":"fiat","fiaturile":"fiat","fiaturilor":"fiat","fibre":"fibră","fibre optice":"fibră optică","fibrilai":"fibrila","fibrilam":["fibrilăm","fibrila","fibrilam","fibrila"],"fibriland":"fibrila","fibrilara":["fibrilară","fibrila","fibrilară","fibrilar","fibrilara","fibrilar"],"fibrilaram":"fibrila","fibrilarati":"fibrila","fibrilare":"fibrilar","fibrilarea":"fibrilare","fibrilarele":"fibrilar","fibrilari":["fibrilari","fibrilar","fibrilări","fibrilare"],"fibrilarii":["fibrilarii","fibrilar","fibrilării","fibrilare"],"fibrilarile":"fibrilare","fibrilarilor":"fibrilare","fibrilarul":"fibrilar","fibrilase":"fibrila","fibrilasem":"fibrila","fibrilasera":"fibrila","fibrilaseram":"fibrila","fibrilaserati":"fibrila","fibrilasesi":"fibrila","fibrilasi":"fibrila","fibrilat":"fibrila","fibrilati":"fibrila","fibrilatia":"fibrilație","fibrilatiei":"fibrilație","fibrilatii":"fibrilație","fibrilatiile":"fibrilație","fibrilatiilor":"fibrilație","fibrilatiunea":"fibrilațiune","fibrilatiuni":"fibrilațiune","fibrilatiunii":"fibrilațiune","fibrilatiunile":"fibrilațiune","fibrilatiunilor":"fibrilațiune","fibrilau":"fibrila","fibrile":"fibrilă","fibrileaza":"fibrila","fibrilei":"fibrilă","fibrilele":"fibrilă","fibrilelor":"fibrilă","fibrilez":"fibrila","fibrilezi":"fibrila","fibrilizarea":"fibrilizare","fibrilizari":"fibrilizare","fibrilizarii":"fibrilizare","fibrilizarile":"fibrilizare","fibrilizarilor":"fibrilizare","fibrine":"fibrină","fibrinei":"fibrină","fibrinele":"fibrină","fibrinelor":"fibrină","fibrinemia":"fibrinemie","fibrinemiei":"fibrinemie","fibrinemii":"fibrinemie","fibrinemiile":"fibrinemie","fibrinemiilor":"fibrinemie","fibrinogenul":"fibrinogen","fibrinogenule":"fibrinogen","fibrinogenului":"fibrinogen","fibrinolize":"fibrinoliză","fibrinolizei":"fibrinoliză","fibrinolizele":"fibrinoliză","fibrinolizelor":"fibrinoliză","fibrisoare":"fibrișoară","fibrisoarei":"fibrișoară","fibrisoarele":"fibrișoară","fibrisoarelor":"fibrișoară","fibroadenoame":"fibroadenom","fibroadenoamele":"fibroadenom","fibroadenoamelor":"fibroadenom","fibroadenomul":"fibroadenom","fibroadenomule":"fibroadenom","fibroadenomului":"fibroadenom","fibroame":"fibrom","fibroamele":"fibrom","fibroamelor":"fibrom","fibroasa":["fibroasă","fibros","fibroasa","fibros"],"fibroase":"fibros","fibroasele":"fibros","fibrobetonul":"fibrobeton","fibrobetonule":"fibrobeton","fibrobetonului":"fibrobeton","fibrobetonuri":"fibrobeton","fibrobetonurile":"fibrobeton","fibrobetonurilor":"fibrobeton","fibroblaste":"fibroblast","fibroblastele":"fibroblast","fibroblastelor":"fibroblast","fibroblastoame":"fibroblastom","fibroblastoamele":"fibroblastom","fibroblastoamelor":"fibroblastom","fibroblastomul":"fibroblastom","fibroblastomule":"fibroblastom","fibroblastomului":"fibroblastom","fibroblastul":"fibroblast","fibroblastule":"fibroblast","fibroblastului":"fibroblast","fibrocartilaginoasa":["fibrocartilaginoasă","fibrocartilaginos","fibrocartilaginoasa","fibrocartilaginos"],"fibrocartilaginoase":"fibrocartilaginos","fibrocartilaginoasele":"fibrocartilaginos","fibrocartilaginosi":"fibrocartilaginos","fibrocartilaginosii":"fibrocartilaginos","fibrocartilaginosul":"fibrocartilaginos","fibrocartilaje":"fibrocartilaj","fibrocartilajele":"fibrocartilaj","fibrocartilajelor":"fibrocartilaj","fibrocartilajul":"fibrocartilaj","fibrocartilajule":"fibrocartilaj","fibrocartilajului":"fibrocartilaj","fibrocimentul":"fibrociment","fibrocimentule":"fibrociment","fibrocimentului":"fibrociment","fibrocimenturi":"fibrociment","fibrocimenturile":"fibrociment","fibrocimenturilor":"fibrociment","fibrocite":"fibrocit","fibrocitele":"fibrocit","fibrocitelor":"fibrocit","fibrocitul":"fibrocit","fibrocitule":"fibrocit","fibrocitului":"fibrocit","fibroine":"fibroină","fibroinei":"fibroină","fibroinele":"fibroină","fibroinelor":"fibroină","fibrolipoame":"fibrolipom","fibrolipoamele":"fibrolipom","fibrolipoamelor":"fibrolipom","fibrolipomul":"fibrolipom","fibrolipomule":"fibrolipom","fibrolipomului":"fibrolipom","fibromatoasa":["fibromatoasă","fibromatos","fibromatoasa","fibromatos"],"fibromatoase":"fibromatos","fibromatoasele":"fibromatos","fibromatosi":"fibromatos","fibromatosii":"fibromatos","fibromatosul":"fibromatos","fibromatoze":"fibromatoză","fibromatozei":"fibromatoză","fibromatozele":"fibromatoză","fibromatozelor":"fibromatoză","fibromiomul":"fibromiom","fibromiomule":"fibromiom","fibromiomului":"fibromiom","fibromiomuri":"fibromiom","fibromiomurile":"fibromiom","fibromiomurilor":"fibromiom","fibromul":"fibrom","fibromule":"fibrom","fibromului":"fibrom","fibrosarcoame":"fibrosarcom","fibrosarcoamele":"fibrosarcom","fibrosarcoamelor":"fibrosarcom","fibrosarcomul":"fibrosarcom","fibrosarcomule":"fibrosarcom","fibrosarcomului":"fibrosarcom","fibroscoape":"fibroscop","fibroscoapele":"fibroscop","fibroscoapelor":"fibroscop","fibroscopul":"fibroscop","fibroscopule":"fibroscop","fibroscopului":"fibroscop","fibrosi":"fibros","fibrosii":"fibros","fibrosul":"fibros","fibroze":"fibroză","fibrozei":"fibroză","fibrozele":"fibroză","fibrozelor":"fibroză","fibule":"fibulă","ficatei":"ficățel","ficateli":"ficățel","ficatelii":"ficățel","ficatelilor":"ficățel","ficatelul":"ficățel","ficatelule":"ficățel","ficatelului":"ficățel","ficati":"ficat","ficatii":"ficat","ficatilor":"ficat","ficatul":"ficat","ficatule":"ficat","ficatului":"ficat","ficioare":"ficioară","ficioarei":"ficioară","ficioarele":"ficioară","ficioarelor":"ficioară","ficior":"fecior","ficiori":"ficior","ficiorii":"ficior","ficiorilor":"ficior","ficiorul":"ficior","ficiorule":"ficior","ficiorului":"ficior","ficleana":["ficleană","ficlean","ficleana","ficlean"],"ficleanul":"ficlean","ficlene":"ficlean","ficlenele":"ficlean","ficleni":"ficlean","ficlenii":"ficlean","ficocianine":"ficocianină","ficocianinei":"ficocianină","ficocianinele":"ficocianină","ficocianinelor":"ficocianină","ficoeritrine":"ficoeritrină","ficoeritrinei":"ficoeritrină","ficoeritrinele":"ficoeritrină","ficoeritrinelor":"ficoeritrină","ficologi":"ficolog","ficologia":"ficologie","ficologica":["ficologică","ficologic","ficologica","ficologic"],"ficologice":"ficologic","ficologicele":"ficologic","ficologici":"ficologic","ficologicii":"ficologic","ficologicul":"ficologic","ficologiei":"ficologie","ficologii":["ficologii","ficolog","ficologii","ficologie"],"ficologilor":"ficolog","ficologul":"ficolog","ficologule":"ficolog","ficologului":"ficolog","ficomicete":"ficomicetă","ficomicetei":"ficomicetă","ficomicetele":"ficomicetă","ficomicetelor":"ficomicetă","ficsi":"fix","ficsii":"fix","fictionala":["ficțională","ficțional","ficționala","ficțional"],"fictionale":"ficțional","fictionalele":"ficțional","fictionali":"ficțional","fictionalii":"ficțional","fictionalisme":"ficționalism","fictionalismele":"ficționalism","fictionalismelor":"ficționalism","fictionalismul":"ficționalism","fictionalismule":"ficționalism","fictionalismului":"ficționalism","fictionalista":["ficționalistă","ficționalist","ficționalista","ficționalist"],"fictionaliste":"ficționalist","fictionalistele":"ficționalist","fictionalisti":"ficționalist","fictionalistii":"ficționalist","fictionalistilor":"ficționalist","fictionalistul":"ficționalist","fictionalistule":"ficționalist","fictionalistului":"ficționalist","fictionalul":"ficțional","fictiuni":"ficțiune","fictiva":["fictivă","fictiv","fictiva","fictiv"],"fictive":"fictiv","fictivele":"fictiv","fictivi":"fictiv","fictivii":"fictiv","fictivul":"fictiv","ficusi":"ficus","ficusii":"ficus","ficusilor":"ficus","ficusul":"ficus","ficusule":"ficus","ficusului":"ficus","ficuti":"ficuț","ficutii":"ficuț","ficutilor":"ficuț","ficutul":"ficuț","ficutule":"ficuț","ficutului":"ficuț","fidantarea":"fidanțare","fidantari":"fidanțare","fidantarii":"fidanțare","fidantarile":"fidanțare","fidantarilor":"fidanțare","fidantati":"fidanțat","fidantatii":"fidanțat","fidantatilor":"fidanțat","fidantatul":"fidanțat","fidantatule":"fidanțat","fidantatului":"fidanțat","fideaua":"fidea","fideismul":"fideism","fideismule":"fideism","fideismului":"fideism","fideiste":"fideistă","fideistei":"fideistă","fideistele":"fideistă","fideistelor":"fideistă","fideisti":"fideist","fideistii":"fideist","fideistilor":"fideist","fideistul":"fideist","fideistule":"fideist","fideistului":"fideist","fideiusiunea":"fideiusiune","fideiusiuni":"fideiusiune","fideiusiunii":"fideiusiune","fideiusiunile":"fideiusiune","fideiusiunilor":"fideiusiune","fideiusori":"fideiusor","fideiusorii":"fideiusor","fideiusorilor":"fideiusor","fideiusorul":"fideiusor","fideiusorule":"fideiusor","fideiusorului":"fideiusor","fidela":["fidelă","fidel","fidela","fidel"],"fidele":["fidele","fidea","fidele","fidel"],"fidelei":"fidea","fidelele":"fidel","fideli":"fidel","fidelii":"fidel","fidelitatea":"fidelitate","fidelitati":"fidelitate","fidelitatii":"fidelitate","fidelul":"fidel","fiduciara":["fiduciară","fiduciar","fiduciara","fiduciar"],"fiduciare":"fiduciar","fiduciarele":"fiduciar","fiduciari":"fiduciar","fiduciarii":"fiduciar","fiduciarul":"fiduciar","fie":"fi","fiecarei":"fiecare","fiecareia":"fiecare","fiecaror":"fiecare","fiecarora":"fiecare","fiecarui":"fiecare","fiecaruia":"fiecare","fieful":"fief","fiefule":"fief","fiefului":"fief","fiefuri":"fief","fiefurile":"fief","fiefurilor":"fief","fiei":"fie","fierarasi":"fierăraș","fierarasile":"fierăraș","fierarasilor":"fierăraș","fierarasul":"fierăraș","fierarasule":"fierăraș","fierarasului":"fierăraș","fierarese":"fierăreasă","fieraresei":"fierăreasă","fieraresele":"fierăreasă","fierareselor":"fierăreasă","fierari":"fierar","fieraria":"fierărie","fierariei":"fierărie","fierarii":["fierarii","fierar","fierării","fierărie"],"fierariile":"fierărie","fierariilor":"fierărie","fierarilor":"fierar","fierarite":"fierăriță","fieraritei":"fierăriță","fieraritele":"fierăriță","fieraritelor":"fierăriță","fieraritul":"fierărit","fieraritule":"fierărit","fieraritului":"fierărit","fierarul":"fierar","fierarule":"fierar","fierarului":"fierar","fierastraie":"fierăstrău","fierastrau":"ferăstrău","fierastrui":"ferestrui","fierastruia":"fierăstrui","fierastruiai":"fierăstrui","fierastruiam":"fierăstrui","fierastruiati":"fierăstrui","fierastruiau":"fierăstrui","fierastruiesc":"fierăstrui","fierastruieste":"fierăstrui","fierastruiesti":"fierăstrui","fierastruii":"fierăstrui","fierastruim":"fierăstrui","fierastruind":"fierăstrui","fierastruira":"fierăstrui","fierastruiram":"fierăstrui","fierastruirati":"fierăstrui","fierastruirea":"fierăstruire","fierastruiri":"fierăstruire","fierastruirii":"fierăstruire","fierastruirile":"fierăstruire","fierastruirilor":"fierăstruire","fierastruise":"fierăstrui","fierastruisem":"fierăstrui","fierastruisera":"fierăstrui","fierastruiseram":"fierăstrui","fierastruiserati":"fierăstrui","fierastruisesi":"fierăstrui","fierastruisi":"fierăstrui","fierastruit":"fierăstrui","fierastruita":["fierăstruită","fierăstruit","fierăstruita","fierăstruit"],"fierastruite":"fierăstruit","fierastruitele":"fierăstruit","fierastruiti":["fierăstruiți","fierăstrui","fierăstruiți","fierăstruit"],"fierastruitii":"fierăstruit","fierastruitul":"fierăstruit","fieratai":"fierătaie","fierataia":"fierătaie","fierataii":"fierătaie","fieratica":["fieratică","fieratic","fieratica","fieratic"],"fieratice":"fieratic","fieraticele":"fieratic","fieratici":"fieratic","fieraticii":"fieratic","fieraticul":"fieratic","fierb":"fierbe","fierband":"fierbe","fierbant":"fierbânta","fierbantai":"fierbânta","fierbantam":["fierbântăm","fierbânta","fierbântam","fierbânta"],"fierbantand":"fierbânta","fierbantara":"fierbânta","fierbantaram":"fierbânta","fierbantarati":"fierbânta","fierbantase":"fierbânta","fierbantasem":"fierbânta","fierbantasera":"fierbânta","fierbantaseram":"fierbânta","fierbantaserati":"fierbânta","fierbantasesi":"fierbânta","fierbantasi":"fierbânta","fierbantat":"fierbânta","fierbantata":["fierbântată","fierbântat","fierbântata","fierbântat"],"fierbantate":"fierbântat","fierbantatele":"fierbântat","fierbantati":["fierbântați","fierbânta","fierbântați","fierbântat"],"fierbantatii":"fierbântat","fierbantatul":"fierbântat","fierbantau":"fierbânta","fierbanti":"fierbânta","fierbatori":"fierbător","fierbatorile":"fierbător","fierbatorilor":"fierbător","fierbatorul":"fierbător","fierbatorule":"fierbător","fierbatorului":"fierbător","fierbea":"fierbe","fierbeai":"fierbe","fierbeam":"fierbe","fierbeati":"fierbe","fierbeau":"fierbe","fierbem":"fierbe","fierberea":"fierbere","fierberi":"fierbere","fierberii":"fierbere","fierberile":"fierbere","fierberilor":"fierbere","fierbeti":"fierbe","fierbi":"fierbe","fierbincioara":["fierbincioară","fierbincior","fierbincioara","fierbincior"],"fierbincioare":"fierbincior","fierbincioarele":"fierbincior","fierbinciori":"fierbincior","fierbinciorii":"fierbincior","fierbinciorul":"fierbincior","fierbintea":"fierbinte","fierbintele":"fierbinte","fierbinteli":"fierbințeală","fierbinti":"fierbinte","fierbintii":"fierbinte","fierbintile":"fierbinte","fierea":"fiere","fieri":"fiere","fierii":"fiere","fierisoare":"fierișor","fierisoarele":"fierișor","fierisoarelor":"fierișor","fierisorul":"fierișor","fierisorule":"fierișor","fierisorului":"fierișor","fieroasa":["fieroasă","fieros","fieroasa","fieros"],"fieroase":"fieros","fieroasele":"fieros","fierosi":"fieros","fierosii":"fieros","fierosul":"fieros","fierse":"fierbe","fiersei":"fierbe","fiersera":"fierbe","fierseram":"fierbe","fierserati":"fierbe","fiersese":"fierbe","fiersesem":"fierbe","fiersesera":"fierbe","fierseseram":"fierbe","fierseserati":"fierbe","fiersesesi":"fierbe","fiersesi":"fierbe","fiert":"fierbe","fierte":"fiert","fiertele":"fiert","fierti":"fiert","fiertii":"fiert","fiertul":"fiert","fierturi":"fiertură","fierturice":"fierturică","fierturicei":"fierturică","fierturicele":"fierturică","fierturicelor":"fierturică","fierturici":"fierturică","fierturii":"fiertură","fierturile":"fiertură","fierturilor":"fiertură","fierul":"fier","fierule":"fier","fierului":"fier","fieruse":"fieruș","fierusele":"fieruș","fieruselor":"fieruș","fierusul":"fieruș","fierusule":"fieruș","fierusului":"fieruș","fiescare":"fiecare","fiescea":"fieșce","fiescele":"fieșce","fiesci":"fieșce","fiescii":"fieșce","fiescul":"fiesc","fieste":"fiestă","fiestecea":"fieștece","fiestecele":"fieștece","fiesteci":"fieștece","fiestecii":"fieștece","fiestei":"fiestă","fiestele":"fiestă","fiestelor":"fiestă","fiesti":"fiesc","fiestii":"fiesc","fiestile":"fiesc","fifirigi":"fifirig","fifirigii":"fifirig","fifirigilor":"fifirig","fifirigul":"fifirig","fifirigule":"fifirig","fifirigului":"fifirig","figi":"fig","figii":"fig","figilor":"fig","figul":"fig","figule":"fig","figului":"fig","figurai":"figura","figuram":["figurăm","figura","figuram","figura"],"figurand":"figura","figurante":"figurantă","figurantei":"figurantă","figurantele":"figurantă","figurantelor":"figurantă","figuranti":"figurant","figurantii":"figurant","figurantilor":"figurant","figurantul":"figurant","figurantule":"figurant","figurantului":"figurant","figurara":"figura","figuraram":"figura","figurarati":"figura","figurarea":"figurare","figurari":"figurare","figurarii":"figurare","figurarile":"figurare","figurarilor":"figurare","figurase":"figura","figurasem":"figura","figurasera":"figura","figuraseram":"figura","figuraserati":"figura","figurasesi":"figura","figurasi":"figura","figurat":"figura","figurata":["figurată","figurat","figurata","figurat"],"figurate":"figurat","figuratele":"figurat","figurati":["figurați","figura","figurați","figurat"],"figuratia":"figurație","figuratiei":"figurație","figuratii":["figurații","figurat","figurații","figurație"],"figuratiile":"figurație","figuratiilor":"figurație","figuratiunea":"figurațiune","figuratiuni":"figurațiune","figuratiunii":"figurațiune","figuratiunile":"figurațiune","figuratiunilor":"figurațiune","figurativa":["figurativă","figurativ","figurativa","figurativ"],"figurative":"figurativ","figurativele":"figurativ","figurativi":"figurativ","figurativii":"figurativ","figurativul":"figurativ","figuratul":"figurat","figurau":"figura","figureaza":"figura","figurez":"figura","figurezi":"figura","figuri":"figură","figuri de sah":"figură de șah","figuri de stil":"figură de stil","figurine":"figurină","figurinei":"figurină","figurinele":"figurină","figurinelor":"figurină","figuristi":"figurist","figuristii":"figurist","figuristilor":"figurist","figuristul":"figurist","figuristule":"figurist","figuristului":"figurist","fii":["fii","fi","fii","fie","fii","fiu"],"fii de catea":"fiu de cățea","fii vitregi":"fiu vitreg","fiice":"fiică","fiicei":"fiică","fiicele":"fiică","fiicelor":"fiică","fiiculene":"fiiculeană","fiiculenei":"fiiculeană","fiiculenele":"fiiculeană","fiiculenelor":"fiiculeană","fiiculite":"fiiculiță","fiiculitei":"fiiculiță","fiiculitele":"fiiculiță","fiiculitelor":"fiiculiță","fiicute":"fiicuță","fiicutei":"fiicuță","fiicutele":"fiicuță","fiicutelor":"fiicuță","fiie":"fie","fiii":"fiu","fiile":"fie","fiilor":["fiilor","fie","fiilor","fiu"],"fiind":"fi","fiind-ca":"fiindcă","fiint":"ființi","fiintai":"ființa","fiintam":["ființăm","ființa","ființam","ființa"],"fiintand":"ființa","fiintara":"ființa","fiintaram":"ființa","fiintarati":"ființa","fiintarea":"ființare","fiintari":"ființare","fiintarii":"ființare","fiintarile":"ființare","fiintarilor":"ființare","fiintase":"ființa","fiintasem":"ființa","fiintasera":"ființa","fiintaseram":"ființa","fiintaserati":"ființa","fiintasesi":"ființa","fiintasi":"ființa","fiintat":"ființa","fiintati":"ființa","fiintau":"ființa","fiinte":["ființe","ființă","ființe","ființi"],"fiintea":"ființi","fiinteai":"ființi","fiinteam":"ființi","fiinteasca":["ființească","ființesc","ființeasca","ființesc"],"fiinteati":"ființi","fiinteau":"ființi","fiinteaza":"ființa","fiintei":"ființă","fiintele":"ființă","fiintelor":"ființă","fiintescul":"ființesc","fiintesti":"ființesc","fiintestii":"ființesc","fiintestile":"ființesc","fiintez":"ființa","fiintezi":"ființa","fiintie":"ființi","fiintii":"ființi","fiintim":"ființi","fiintind":"ființi","fiintira":"ființi","fiintiram":"ființi","fiintirati":"ființi","fiintise":"ființi","fiintisem":"ființi","fiintisera":"ființi","fiintiseram":"ființi","fiintiserati":"ființi","fiintisesi":"ființi","fiintisi":"ființi","fiintit":"ființi","fiintiti":"ființi","fiitoare":"fiitor","fiitoarea":"fiitor","fiitoarele":"fiitor","fiitori":"fiitor","fiitorii":"fiitor","fiitorul":"fiitor","fijiana":["fijiană","fijian","fijiana","fijian"],"fijianul":"fijian","fijianule":"fijian","fijianului":"fijian","fijiene":["fijiene","fijian","fijiene","fijiană"],"fijienei":"fijiană","fijienele":["fijienele","fijian","fijienele","fijiană"],"fijienelor":"fijiană","fijieni":"fijian","fijienii":"fijian","fijienilor":"fijian","filabila":["filabilă","filabil","filabila","filabil"],"filabile":"filabil","filabilele":"filabil","filabili":"filabil","filabilii":"filabil","filabilitatea":"filabilitate","filabilitati":"filabilitate","filabilitatii":"filabilitate","filabilul":"filabil","filacteraul":"filacteră","filacteraule":"filacteră","filacteraului":"filacteră","filactere":"filacteră","filacterele":"filacteră","filacterelor":"filacteră","filacterii":"filacteriu","filacteriile":"filacteriu","filacteriilor":"filacteriu","filacteriuul":"filacteriu","filacteriuule":"filacteriu","filacteriuului":"filacteriu","filade":"filadă","filadei":"filadă","filadele":"filadă","filadelor":"filadă","filaftia":"filaftie","filaftiei":"filaftie","filaftii":"filaftie","filamente":"filament","filamentele":"filament","filamentelor":"filament","filamentoasa":["filamentoasă","filamentos","filamentoasa","filamentos"],"filamentoase":"filamentos","filamentoasele":"filamentos","filamentosi":"filamentos","filamentosii":"filamentos","filamentosul":"filamentos","filamentul":"filament","filamentule":"filament","filamentului":"filament","filantroape":"filantroapă","filantroapei":"filantroapă","filantroapele":"filantroapă","filantroapelor":"filantroapă","filantropi":"filantrop","filantropia":"filantropie","filantropica":["filantropică","filantropic","filantropica","filantropic"],"filantropice":"filantropic","filantropicele":"filantropic","filantropici":"filantropic","filantropicii":"filantropic","filantropicul":"filantropic","filantropiei":"filantropie","filantropii":["filantropii","filantrop","filantropii","filantropie"],"filantropilor":"filantrop","filantropisme":"filantropism","filantropismele":"filantropism","filantropismelor":"filantropism","filantropismul":"filantropism","filantropismule":"filantropism","filantropismului":"filantropism","filantropista":["filantropistă","filantropist","filantropista","filantropist"],"filantropiste":"filantropist","filantropistele":"filantropist","filantropisti":"filantropist","filantropistii":"filantropist","filantropistul":"filantropist","filantropul":"filantrop","filantropule":"filantrop","filantropului":"filantrop","filarghiria":"filarghirie","filarghiriei":"filarghirie","filarghirii":"filarghirie","filarghiriile":"filarghirie","filarghiriilor":"filarghirie","filarioze":"filarioză","filariozei":"filarioză","filariozele":"filarioză","filariozelor":"filarioză","filarmonica":["filarmonică","filarmonic","filarmonica","filarmonic"],"filarmonice":"filarmonic","filarmonicele":"filarmonic","filarmonici":["filarmonici","filarmonic","filarmonici","filarmonică"],"filarmonicii":["filarmonicii","filarmonic","filarmonicii","filarmonică"],"filarmonicile":"filarmonică","filarmonicilor":"filarmonică"};
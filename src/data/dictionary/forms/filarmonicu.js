@@ -0,0 +1 @@
+export default {"filarmonicul":"filarmonic","filarmoniste":"filarmonistă","filarmonistei":"filarmonistă","filarmonistele":"filarmonistă","filarmonistelor":"filarmonistă","filarmonisti":"filarmonist","filarmonistii":"filarmonist","filarmonistilor":"filarmonist","filarmonistul":"filarmonist","filarmonistule":"filarmonist","filarmonistului":"filarmonist","filatelia":"filatelie","filatelica":["filatelică","filatelic","filatelica","filatelic"],"filatelice":"filatelic","filatelicele":"filatelic","filatelici":"filatelic","filatelicii":"filatelic","filatelicul":"filatelic","filateliei":"filatelie","filatelii":"filatelie","filateliste":"filatelistă","filatelistei":"filatelistă","filatelistele":"filatelistă","filatelistelor":"filatelistă","filatelisti":"filatelist","filatelistii":"filatelist","filatelistilor":"filatelist","filatelistul":"filatelist","filatelistule":"filatelist","filatelistului":"filatelist","filatoarea":"filatoare","filatoarei":"filatoare","filatoarele":"filatoare","filatoarelor":"filatoare","filatori":"filator","filatorii":"filator","filatorilor":"filator","filatorul":"filator","filatorule":"filator","filatorului":"filator","filature":"filatură","filaturei":"filatură","filaturele":"filatură","filaturelor":"filatură","filaturi":"filatură","fildesi":"fildeș","fildesia":"fildeșiu","fildesie":"fildeșiu","fildesii":["fildeșii","fildeș","fildeșii","fildeșiu"],"fildesiii":"fildeșiu","fildesiile":"fildeșiu","fildesilor":"fildeș","fildesiul":"fildeșiu","fildesul":"fildeș","fildesule":"fildeș","fildesului":"fildeș","fildesuri":"fildeș","fildesurile":"fildeș","fildesurilor":"fildeș","file":"filă","filei":"filă","filele":"filă","filelor":"filă","fileri":"filer","filerii":"filer","filerilor":"filer","filerul":"filer","filerule":"filer","filerului":"filer","filetata":["filetată","filetat","filetata","filetat"],"filetate":"filetat","filetatele":"filetat","filetati":"filetat","filetatii":"filetat","filetatul":"filetat","filetica":["filetică","filetic","filetica","filetic"],"filetice":"filetic","fileticele":"filetic","filetici":"filetic","fileticii":"filetic","fileticul":"filetic","filetul":"filet","filetule":"filet","filetului":"filet","fileturi":"filet","fileturile":"filet","fileturilor":"filet","fileuri":"fileu","filfizoni":"filfizon","filfizonii":"filfizon","filfizonilor":"filfizon","filfizonul":"filfizon","filfizonule":"filfizon","filfizonului":"filfizon","filiala":["filială","filial","filiala","filial"],"filiale":["filiale","filial","filiale","filială"],"filialei":"filială","filialele":["filialele","filial","filialele","filială"],"filialelor":"filială","filiali":"filial","filialii":"filial","filialul":"filial","filiatia":"filiație","filiatiei":"filiație","filiatii":"filiație","filiatiile":"filiație","filiatiilor":"filiație","filiatiunea":"filiațiune","filiatiuni":"filiațiune","filiatiunii":"filiațiune","filiatiunile":"filiațiune","filiatiunilor":"filiațiune","filibusterismul":"filibusterism","filibusterismule":"filibusterism","filibusterismului":"filibusterism","filiere":"filieră","filiforma":["filiformă","filiform","filiforma","filiform"],"filiforme":"filiform","filiformele":"filiform","filiformi":"filiform","filiformii":"filiform","filiformul":"filiform","filigean":"felegean","filigeanul":"filigean","filigeanule":"filigean","filigeanului":"filigean","filigene":"filigean","filigenele":"filigean","filigenelor":"filigean","filigoria":"filigorie","filigoriei":"filigorie","filigorieul":["filigoríeul","filigoríe","filigórieul","filigórie"],"filigorieule":["filigoríeule","filigoríe","filigórieule","filigórie"],"filigorieului":["filigoríeului","filigoríe","filigórieului","filigórie"],"filigorii":["filigorii","filigorie","filigorii","filigoríe","filigórii","filigórie"],"filigoriile":["filigoriile","filigorie","filigoriile","filigoríe","filigóriile","filigórie"],"filigoriilor":["filigoriilor","filigorie","filigoriilor","filigoríe","filigóriilor","filigórie"],"filigranai":"filigrana","filigranam":["filigranăm","filigrana","filigranam","filigrana"],"filigranand":"filigrana","filigranara":"filigrana","filigranaram":"filigrana","filigranarati":"filigrana","filigranarea":"filigranare","filigranari":"filigranare","filigranarii":"filigranare","filigranarile":"filigranare","filigranarilor":"filigranare","filigranase":"filigrana","filigranasem":"filigrana","filigranasera":"filigrana","filigranaseram":"filigrana","filigranaserati":"filigrana","filigranasesi":"filigrana","filigranasi":"filigrana","filigranat":"filigrana","filigranata":["filigranată","filigranat","filigranata","filigranat"],"filigranate":"filigranat","filigranatele":"filigranat","filigranati":["filigranați","filigrana","filigranați","filigranat"],"filigranatii":"filigranat","filigranatul":"filigranat","filigranau":"filigrana","filigrane":"filigran","filigraneaza":"filigrana","filigranez":"filigrana","filigranezi":"filigrana","filigranisti":"filigranist","filigranistii":"filigranist","filigranistilor":"filigranist","filigranistul":"filigranist","filigranistule":"filigranist","filigranistului":"filigranist","filigranologe":"filigranologă","filigranologei":"filigranologă","filigranologele":"filigranologă","filigranologelor":"filigranologă","filigrene":"filigrană","filigrenei":"filigrană","filigrenele":"filigrană","filigrenelor":"filigrană","filimele":"filimică","filimelei":"filimică","filimelele":"filimică","filimelelor":"filimică","filimine":"filimină","filiminei":"filimină","filiminele":"filimină","filiminelor":"filimină","filioqueul":"filioque","filioqueule":"filioque","filioqueului":"filioque","filipice":"filipică","filipicei":"filipică","filipicele":"filipică","filipicelor":"filipică","filipinele":"Filipine","filipinelor":"Filipine","filipineza":["filipineză","filipinez","filipineza","filipinez"],"filipineze":["filipineze","filipinez","filipineze","filipineză"],"filipinezei":"filipineză","filipinezele":["filipinezele","filipinez","filipinezele","filipineză"],"filipinezelor":"filipineză","filipinezi":"filipinez","filipinezii":"filipinez","filipinezilor":"filipinez","filipinezul":"filipinez","filipinezule":"filipinez","filipinezului":"filipinez","filisteanul":"filistean","filisteanule":"filistean","filisteanului":"filistean","filistence":"filisteancă","filistencei":"filisteancă","filistencele":"filisteancă","filistencelor":"filisteancă","filisteni":"filistean","filistenii":"filistean","filistenilor":"filistean","filistini":"filistin","filistinii":"filistin","filistinilor":"filistin","filistinisme":"filistinism","filistinismele":"filistinism","filistinismelor":"filistinism","filistinismul":"filistinism","filistinismule":"filistinism","filistinismului":"filistinism","filistinul":"filistin","filistinule":"filistin","filistinului":"filistin","filmai":"filma","filmam":["filmăm","filma","filmam","filma"],"filmand":"filma","filmara":"filma","filmaram":"filma","filmarati":"filma","filmarea":"filmare","filmari":"filmare","filmarii":"filmare","filmarile":"filmare","filmarilor":"filmare","filmase":"filma","filmasem":"filma","filmasera":"filma","filmaseram":"filma","filmaserati":"filma","filmasesi":"filma","filmasi":"filma","filmat":"filma","filmata":["filmată","filmat","filmata","filmat"],"filmate":"filmat","filmatele":"filmat","filmati":["filmați","filma","filmați","filmat"],"filmatii":"filmat","filmatul":"filmat","filmau":"filma","filme":"film","filme de lung metraj":"film de lung metraj","filme de scurt metraj":"film de scurt metraj","filme mute":"film mut","filmeaza":"filma","filmele":"film","filmelor":"film","filmez":"filma","filmezi":"filma","filmica":["filmică","filmic","filmica","filmic"],"filmice":"filmic","filmicele":"filmic","filmici":"filmic","filmicii":"filmic","filmicul":"filmic","filmistica":["filmistică","filmistic","filmistica","filmistic"],"filmistice":"filmistic","filmisticele":"filmistic","filmistici":"filmistic","filmisticii":"filmistic","filmisticul":"filmistic","filmografia":"filmografie","filmografiei":"filmografie","filmografii":"filmografie","filmologia":"filmologie","filmologica":["filmologică","filmologic","filmologica","filmologic"],"filmologice":"filmologic","filmologicele":"filmologic","filmologici":"filmologic","filmologicii":"filmologic","filmologicul":"filmologic","filmologiei":"filmologie","filmologii":"filmologie","filmoteci":"filmotecă","filmotecii":"filmotecă","filmotecile":"filmotecă","filmotecilor":"filmotecă","filmul":"film","filmule":"film","filmulete":"filmuleț","filmuletele":"filmuleț","filmuletelor":"filmuleț","filmuletul":"filmuleț","filmuletule":"filmuleț","filmuletului":"filmuleț","filmului":"film","filoane":"filon","filoanele":"filon","filoanelor":"filon","filodendroni":"filodendron","filodendronii":"filodendron","filodendronilor":"filodendron","filodendronul":"filodendron","filodendronule":"filodendron","filodendronului":"filodendron","filodorme":"filodormă","filodormei":"filodormă","filodormele":"filodormă","filodormelor":"filodormă","filoelena":["filoelenă","filoelen","filoelena","filoelen"],"filoelene":"filoelen","filoelenele":"filoelen","filoeleni":"filoelen","filoelenica":["filoelenică","filoelenic","filoelenica","filoelenic"],"filoelenice":"filoelenic","filoelenicele":"filoelenic","filoelenici":"filoelenic","filoelenicii":"filoelenic","filoelenicul":"filoelenic","filoelenii":"filoelen","filoelenismul":"filoelenism","filoelenismule":"filoelenism","filoelenismului":"filoelenism","filoelenul":"filoelen","filofaga":["filofagă","filofag","filofaga","filofag"],"filofage":"filofag","filofagele":"filofag","filofagi":"filofag","filofagii":"filofag","filofagul":"filofag","filofranceza":["filofranceză","filofrancez","filofranceza","filofrancez"],"filofranceze":"filofrancez","filofrancezele":"filofrancez","filofrancezi":"filofrancez","filofrancezii":"filofrancez","filofrancezul":"filofrancez","filogenetica":["filogenetică","filogenetic","filogenetica","filogenetic"],"filogenetice":"filogenetic","filogeneticele":"filogenetic","filogenetici":"filogenetic","filogeneticii":"filogenetic","filogeneticul":"filogenetic","filogeneze":"filogeneză","filogenezei":"filogeneză","filogenezele":"filogeneză","filogenezelor":"filogeneză","filogenia":"filogenie","filogeniei":"filogenie","filogenii":"filogenie","filogeniile":"filogenie","filogeniilor":"filogenie","filogeniste":"filogenistă","filogenistei":"filogenistă","filogenistele":"filogenistă","filogenistelor":"filogenistă","filogenisti":"filogenist","filogenistii":"filogenist","filogenistilor":"filogenist","filogenistul":"filogenist","filogenistule":"filogenist","filogenistului":"filogenist","filogermana":["filogermană","filogerman","filogermana","filogerman"],"filogermane":"filogerman","filogermanele":"filogerman","filogermani":"filogerman","filogermanii":"filogerman","filogermanul":"filogerman","filologe":"filologă","filologei":"filologă","filologele":"filologă","filologelor":"filologă","filologi":"filolog","filologia":"filologie","filologica":["filologică","filologic","filologica","filologic"],"filologice":"filologic","filologicele":"filologic","filologici":"filologic","filologicii":"filologic","filologicul":"filologic","filologiei":"filologie","filologii":["filologii","filolog","filologii","filologie"],"filologilor":"filolog","filologul":"filolog","filologule":"filolog","filologului":"filolog","filomele":"filomelă","filomelei":"filomelă","filomelele":"filomelă","filomelelor":"filomelă","filoneisme":"filoneism","filoneismele":"filoneism","filoneismelor":"filoneism","filoneismul":"filoneism","filoneismule":"filoneism","filoneismului":"filoneism","filonichia":"filonichie","filonichiei":"filonichie","filonichii":"filonichie","filonichiile":"filonichie","filonichiilor":"filonichie","filonul":"filon","filonule":"filon","filonului":"filon","filosemita":["filosemită","filosemit","filosemita","filosemit"],"filosemite":"filosemit","filosemitele":"filosemit","filosemiti":"filosemit","filosemitii":"filosemit","filosemitul":"filosemit","filosoafe":"filosoafă","filosoafei":"filosoafă","filosoafele":"filosoafă","filosoafelor":"filosoafă","filosof":"filozof","filosofai":"filosofa","filosofam":["filosofăm","filosofa","filosofam","filosofa"],"filosofand":"filosofa","filosofara":"filosofa","filosofaram":"filosofa","filosofarati":"filosofa","filosofarea":"filosofare","filosofari":"filosofare","filosofarii":"filosofare","filosofarile":"filosofare","filosofarilor":"filosofare","filosofase":"filosofa","filosofasem":"filosofa","filosofasera":"filosofa","filosofaseram":"filosofa","filosofaserati":"filosofa","filosofasesi":"filosofa","filosofasi":"filosofa","filosofat":"filosofa","filosofati":"filosofa","filosofau":"filosofa","filosofea":"filosofi","filosofeai":"filosofi","filosofeam":"filosofi","filosofeati":"filosofi","filosofeau":"filosofi","filosofeaza":"filosofa","filosofesc":"filosofi","filosofeste":"filosofi","filosofesti":"filosofi","filosofez":"filosofa","filosofezi":"filosofa","filosofia":"filosofie","filosofica":["filosofică","filosofic","filosofica","filosofic"],"filosofice":"filosofic","filosoficele":"filosofic","filosofici":"filosofic","filosoficii":"filosofic","filosoficul":"filosofic","filosofie":"filosofi","filosofiei":"filosofie","filosofii":["filosofii","filosofi","filosofii","filosofie"],"filosofiile":"filosofie","filosofiilor":"filosofie","filosofim":"filosofi","filosofind":"filosofi","filosofira":"filosofi","filosofiram":"filosofi","filosofirati":"filosofi","filosofise":"filosofi","filosofisem":"filosofi","filosofisera":"filosofi","filosofiseram":"filosofi","filosofiserati":"filosofi","filosofisesi":"filosofi","filosofisi":"filosofi","filosofit":"filosofi","filosofiti":"filosofi","filosovietica":["filosovietică","filosovietic","filosovietica","filosovietic"],"filosovietice":"filosovietic","filosovieticele":"filosovietic","filosovietici":"filosovietic","filosovieticii":"filosovietic","filosovieticul":"filosovietic","filotaxia":"filotaxie","filotaxiei":"filotaxie","filotaxii":"filotaxie","filotehnica":["filotehnică","filotehnic","filotehnica","filotehnic"],"filotehnice":"filotehnic","filotehnicele":"filotehnic","filotehnici":"filotehnic","filotehnicii":"filotehnic","filotehnicul":"filotehnic","filotima":["filotimă","filotim","filotima","filotim"],"filotime":"filotim","filotimele":"filotim","filotimi":"filotim","filotimia":"filotimie","filotimiei":"filotimie","filotimii":["filotimii","filotim","filotimii","filotimie"],"filotimul":"filotim","filoturci":"filoturc","filoturcii":"filoturc","filoturcilor":"filoturc","filoturcul":"filoturc","filoturcule":"filoturc","filoturcului":"filoturc","filoxere":"filoxeră","filoxerei":"filoxeră","filoxerele":"filoxeră","filoxerelor":"filoxeră","filozoafe":"filozoafă","filozoafei":"filozoafă","filozoafele":"filozoafă","filozoafelor":"filozoafă","filozofai":"filozofa","filozofala":["filozofală","filozofal","filozofala","filozofal"],"filozofale":"filozofal","filozofalele":"filozofal","filozofali":"filozofal","filozofalii":"filozofal","filozofalul":"filozofal","filozofam":["filozofăm","filozofa","filozofam","filozofa"],"filozofand":"filozofa","filozofanta":["filozofantă","filozofant","filozofanta","filozofant"],"filozofante":"filozofant","filozofantele":"filozofant","filozofanti":"filozofant","filozofantii":"filozofant","filozofantul":"filozofant","filozofara":"filozofa","filozofaram":"filozofa","filozofarati":"filozofa","filozofardul":"filozofard","filozofardule":"filozofard","filozofardului":"filozofard","filozofarea":"filozofare","filozofari":"filozofare","filozofarii":"filozofare","filozofarile":"filozofare","filozofarilor":"filozofare","filozofarzi":"filozofard","filozofarzii":"filozofard","filozofarzilor":"filozofard","filozofase":"filozofa","filozofasem":"filozofa","filozofasera":"filozofa","filozofaseram":"filozofa","filozofaserati":"filozofa","filozofasesi":"filozofa","filozofasi":"filozofa","filozofat":"filozofa","filozofati":"filozofa","filozofau":"filozofa","filozofeasca":["filozofească","filozofesc","filozofeasca","filozofesc"],"filozofeaza":"filozofa","filozofeme":"filozofem","filozofemele":"filozofem","filozofemelor":"filozofem","filozofemul":"filozofem","filozofemule":"filozofem","filozofemului":"filozofem","filozofescul":"filozofesc","filozofesti":"filozofesc","filozofestii":"filozofesc","filozofestile":"filozofesc","filozofez":"filozofa","filozofezi":"filozofa","filozofi":"filozof","filozofia":"filozofie","filozofica":["filozofică","filozofic","filozofica","filozofic"],"filozofice":"filozofic","filozoficeasca":["filozoficească","filozoficesc","filozoficeasca","filozoficesc"],"filozoficele":"filozofic","filozoficescul":"filozoficesc","filozoficesti":"filozoficesc","filozoficestii":"filozoficesc","filozoficestile":"filozoficesc","filozofici":"filozofic","filozoficii":"filozofic","filozoficul":"filozofic","filozofiei":"filozofie","filozofii":["filozofii","filozof","filozofii","filozofie"],"filozofiile":"filozofie","filozofiilor":"filozofie","filozofilor":"filozof","filozofisme":"filozofism","filozofismele":"filozofism","filozofismelor":"filozofism","filozofismul":"filozofism","filozofismule":"filozofism","filozofismului":"filozofism","filozoful":"filozof","filozofule":"filozof","filozofului":"filozof","filtrabila":["filtrabilă","filtrabil","filtrabila","filtrabil"],"filtrabile":"filtrabil","filtrabilele":"filtrabil","filtrabili":"filtrabil","filtrabilii":"filtrabil","filtrabilul":"filtrabil","filtrai":"filtra","filtraje":"filtraj","filtrajele":"filtraj","filtrajelor":"filtraj","filtrajul":"filtraj","filtrajule":"filtraj","filtrajului":"filtraj","filtram":["filtrăm","filtra","filtram","filtra"],"filtrand":"filtra","filtranta":["filtrantă","filtrant","filtranta","filtrant"],"filtrante":"filtrant","filtrantele":"filtrant","filtranti":"filtrant","filtrantii":"filtrant","filtrantul":"filtrant","filtrara":"filtra","filtraram":"filtra","filtrarati":"filtra","filtrarea":"filtrare","filtrari":"filtrare","filtrarii":"filtrare","filtrarile":"filtrare","filtrarilor":"filtrare","filtrase":"filtra","filtrasem":"filtra","filtrasera":"filtra","filtraseram":"filtra","filtraserati":"filtra","filtrasesi":"filtra","filtrasi":"filtra","filtrat":"filtra","filtrata":["filtrată","filtrat","filtrata","filtrat"],"filtrate":"filtrat","filtratele":"filtrat","filtrati":["filtrați","filtra","filtrați","filtrat"],"filtratia":"filtrație","filtratiei":"filtrație","filtratii":["filtrații","filtrat","filtrații","filtrație"],"filtratiile":"filtrație","filtratiilor":"filtrație","filtratul":"filtrat","filtrau":"filtra","filtre":"filtru","filtre de aer":"filtru de aer","filtreaza":"filtra","filtrele":"filtru","filtrelor":"filtru","filtrez":"filtra","filtrezi":"filtra","filtrul":"filtru","filtrule":"filtru","filtrului":"filtru","filumul":"filum","filumule":"filum","filumului":"filum","filumuri":"filum","filumurile":"filum","filumurilor":"filum","fimbria":"fimbrie","fimbriei":"fimbrie","fimbrii":"fimbrie","fimbriile":"fimbrie","fimbriilor":"fimbrie","fimoze":"fimoză","fimozei":"fimoză","fimozele":"fimoză","fimozelor":"fimoză","fin":"fân","fina":["fină","fin","fina","fin"],"finala":["finală","final","finala","final"],"finale":["finale","final","finale","finală"],"finalei":"finală","finalele":["finalele","final","finalele","finală"],"finalelor":"finală","finali":"final","finalii":"final","finalismul":"finalism","finalismule":"finalism","finalismului":"finalism","finaliste":"finalistă","finalistei":"finalistă","finalistele":"finalistă","finalistelor":"finalistă","finalisti":"finalist","finalistii":"finalist","finalistilor":"finalist","finalistul":"finalist","finalistule":"finalist","finalistului":"finalist","finalitatea":"finalitate","finalitati":"finalitate","finalitatii":"finalitate","finalizai":"finaliza","finalizam":["finalizăm","finaliza","finalizam","finaliza"],"finalizand":"finaliza","finalizara":"finaliza","finalizaram":"finaliza","finalizarati":"finaliza","finalizarea":"finalizare","finalizari":"finalizare","finalizarii":"finalizare","finalizarile":"finalizare","finalizarilor":"finalizare","finalizase":"finaliza","finalizasem":"finaliza","finalizasera":"finaliza","finalizaseram":"finaliza","finalizaserati":"finaliza","finalizasesi":"finaliza","finalizasi":"finaliza","finalizat":"finaliza","finalizata":["finalizată","finalizat","finalizata","finalizat"],"finalizate":"finalizat","finalizatele":"finalizat","finalizati":["finalizați","finaliza","finalizați","finalizat"],"finalizatii":"finalizat","finalizatul":"finalizat","finalizau":"finaliza","finalizeaza":"finaliza","finalizez":"finaliza","finalizezi":"finaliza","finalul":"final","finaluri de partida":"final de partidă","finaluri fericite":"final fericit","financiara":["financiară","financiar","financiara","financiar"],"financiare":["financiare","financiar","financiare","financiară"],"financiarei":"financiară","financiarele":["financiarele","financiar","financiarele","financiară"],"financiarelor":"financiară","financiari":"financiar","financiarii":"financiar","financiarul":"financiar","finanta":["finanță","finanțe","finanța","finanțe"],"finantai":"finanța","finantam":["finanțăm","finanța","finanțam","finanța"],"finantand":"finanța","finantara":"finanța","finantaram":"finanța","finantarati":"finanța","finantarea":"finanțare","finantari":"finanțare","finantarii":"finanțare","finantarile":"finanțare","finantarilor":"finanțare","finantase":"finanța","finantasem":"finanța","finantasera":"finanța","finantaseram":"finanța","finantaserati":"finanța","finantasesi":"finanța","finantasi":"finanța","finantat":"finanța","finantata":["finanțată","finanțat","finanțata","finanțat"],"finantate":"finanțat","finantatele":"finanțat","finantati":["finanțați","finanța","finanțați","finanțat"],"finantatii":"finanțat","finantatoarea":"finanțatoare","finantatoarei":"finanțatoare","finantatoarele":"finanțatoare","finantatoarelor":"finanțatoare","finantatori":"finanțator","finantatorii":"finanțator","finantatorilor":"finanțator","finantatorul":"finanțator","finantatorule":"finanțator","finantatorului":"finanțator","finantatul":"finanțat","finantau":"finanța","finante":"finanță","finanteaza":"finanța","finantei":["finanței","finanță","finanței","finanțe"],"finantele":["finanțele","finanță","finanțele","finanțe"],"finantelor":["finanțelor","finanță","finanțelor","finanțe"],"finantez":"finanța","finantezi":"finanța","finantiara":["finanțiară","finanțiar","finanțiara","finanțiar"],"finantiare":"finanțiar","finantiarele":"finanțiar","finantiari":"finanțiar","finantiarii":"finanțiar","finantiarul":"finanțiar","finantisti":"finanțist","finantistii":"finanțist","finantistilor":"finanțist","finantistul":"finanțist","finantistule":"finanțist","finantistului":"finanțist","fine":["fine","fin","fine","fină"],"finea":"fini","fineai":"fini","fineam":"fini","fineati":"fini","fineau":"fini","finele":"fin","finesc":"fini","fineste":"fini","finesti":"fini","finetea":"finețe","fineti":["fineți","fineță","fineți","finețe"],"finetii":["fineții","fineță","fineții","finețe"],"finetile":["finețile","fineță","finețile","finețe"],"finetilor":["fineților","fineță","fineților","finețe"],"fineturi":"finețe","fineza":["fineză","finez","fineza","finez"],"fineze":"finez","finezele":"finez","finezi":"finez","finezii":"finez","finezul":"finez","fini":"fin","finicei":"finicel","finiceii":"finicel","finiceilor":"finicel","finicelul":"finicel","finicelule":"finicel","finicelului":"finicel","finicetul":"finicet","finicetule":"finicet","finicetului":"finicet","finiceturi":"finicet","finiceturile":"finicet","finiceturilor":"finicet","finici":"finic","finicii":"finic","finicilor":"finic","finicul":"finic","finicule":"finic","finicului":"finic","finii":["finii","fin","finii","fini"],"finilor":"fin","finim":"fini","finind":"fini","finiori":"finior","finiorii":"finior","finiorilor":"finior","finiorul":"finior","finiorule":"finior","finiorului":"finior","finira":"fini","finiram":"fini","finirati":"fini","finisai":"finisa","finisaje":"finisaj","finisajele":"finisaj","finisajelor":"finisaj","finisajul":"finisaj","finisajule":"finisaj","finisajului":"finisaj","finisam":["finisăm","finisa","finisam","finisa"],"finisand":"finisa","finisara":"finisa","finisaram":"finisa","finisarati":"finisa","finisarea":"finisare","finisari":"finisare","finisarii":"finisare","finisarile":"finisare","finisarilor":"finisare","finisase":"finisa","finisasem":"finisa","finisasera":"finisa","finisaseram":"finisa","finisaserati":"finisa","finisasesi":"finisa","finisasi":"finisa","finisat":"finisa","finisata":["finisată","finisat","finisata","finisat"],"finisate":"finisat","finisatele":"finisat","finisati":["finisați","finisa","finisați","finisat"],"finisatii":"finisat","finisatul":"finisat","finisau":"finisa","finise":"fini","finiseaza":"finisa","finisem":"fini","finisera":"fini","finiseram":"fini","finiserati":"fini","finisesi":"fini","finisez":"finisa","finisezi":"finisa","finisi":"fini","finisoarea":"finisoare","finisoarei":"finisoare","finisoarele":"finisoare","finisoarelor":"finisoare","finisori":["finisori","finisor","finișori","finișor"],"finisorii":["finisorii","finisor","finișorii","finișor"],"finisorilor":["finisorilor","finisor","finișorilor","finișor"],"finisorul":["finisorul","finisor","finișorul","finișor"],"finisorule":["finisorule","finisor","finișorule","finișor"],"finisorului":["finisorului","finisor","finișorului","finișor"],"finit":"fini","finita":["finită","finit","finita","finit"],"finitatea":"finitate","finitati":"finitate","finitatii":"finitate","finitatile":"finitate","finitatilor":"finitate","finite":"finit","finitele":"finit","finiti":["finiți","fini","finiți","finit"],"finitia":"finiție","finitiei":"finiție","finitii":["finiții","finit","finiții","finiție"],"finitiile":"finiție","finitiilor":"finiție","finitismul":"finitism","finitismule":"finitism","finitismului":"finitism","finitul":["finitul","finit","finițul","finiț"],"finitule":"finiț","finitului":"finiț","finlande":"Finlanda","finlandei":"Finlanda","finlandeza":["finlandeză","finlandez","finlandeza","finlandez"],"finlandeze":["finlandeze","finlandez","finlandeze","finlandeză"],"finlandezei":"finlandeză","finlandezele":["finlandezele","finlandez","finlandezele","finlandeză"],"finlandezelor":"finlandeză","finlandezi":"finlandez","finlandezii":"finlandez","finlandezilor":"finlandez","finlandezul":"finlandez","finlandezule":"finlandez","finlandezului":"finlandez","fino-ugrica":["fino-ugrică","fino-ugric","fino-ugrica","fino-ugric"],"fino-ugrice":"fino-ugric","fino-ugricele":"fino-ugric","fino-ugrici":"fino-ugric","fino-ugricii":"fino-ugric","fino-ugricul":"fino-ugric","finucul":"finuc","finucule":"finuc","finucului":"finuc","finul":"fin","finule":"fin","finului":"fin","finuti":"finuț","finutii":"finuț","finutilor":"finuț","finutul":"finuț","finutule":"finuț","finutului":"finuț","fiocul":"fioc","fiocule":"fioc","fiocului":"fioc","fiola":"hiolă","fiole":"fiolă","fiolei":"fiolă","fiolele":"fiolă","fiolelor":"fiolă","fioncul":"fionc","fioncule":"fionc","fioncului":"fionc","fioncuri":"fionc","fioncurile":"fionc","fioncurilor":"fionc","fiorde":"fiord","fiordele":"fiord","fiordelor":"fiord","fiordul":"fiord","fiordule":"fiord","fiordului":"fiord","fiorduri":"fiord","fiori":"fior","fiorii":"fior","fiorilor":"fior","fiorini":"fiorin","fiorinii":"fiorin","fiorinilor":"fiorin","fiorinti":"fiorint","fiorintii":"fiorint","fiorintilor":"fiorint","fiorintul":"fiorint","fiorintule":"fiorint","fiorintului":"fiorint","fiorinul":"fiorin","fiorinule":"fiorin","fiorinului":"fiorin","fiorituri":"fioritură","fioriturii":"fioritură","fioriturile":"fioritură","fioriturilor":"fioritură","fioroasa":["fioroasă","fioros","fioroasa","fioros"],"fioroase":"fioros","fioroasele":"fioros","fiorosi":"fioros","fiorosii":"fioros","fiorosul":"fioros","fiorul":"fior","fiorule":"fior","fiorului":"fior","firangul":"firang","firangule":"firang","firangului":"firang","firanguri":"firang","firangurile":"firang","firangurilor":"firang","firava":["firavă","firav","firava","firav"],"firave":"firav","firavele":"firav","firavi":"firav","firavii":"firav","firavul":"firav","fire":"fir","firea":"fire","fireasca":["firească","firesc","fireasca","firesc"],"firesa":["fireșă","fireș","fireșa","fireș"],"firescul":"firesc","firese":"fireș","firesele":"fireș","firesi":"fireș","firesii":"fireș","firesti":"firesc","firestii":"firesc","firestile":"firesc","firesul":"fireș","firetica":["firetică","firetic","firetica","firetic"],"firetice":"firetic","fireticele":"firetic","firetici":"firetic","fireticii":"firetic","fireticul":"firetic","firezari":"firezar","firezarii":"firezar","firezarilor":"firezar","firezarul":"firezar","firezarule":"firezar","firezarului":"firezar","firezul":"firez","firezule":"firez","firezului":"firez","firezuri":"firez","firezurile":"firez","firezurilor":"firez","firfirici":["firfirici","firfiric","firfirici","firfirică"],"firfiricii":["firfiricii","firfiric","firfiricii","firfirică"],"firfiricile":"firfirică","firfiricilor":["firfiricilor","firfiric","firfiricilor","firfirică"],"firfiricul":"firfiric","firfiricule":"firfiric","firfiricului":"firfiric","firfirigi":"firfirig","firfirigii":"firfirig","firfirigilor":"firfirig","firfirigul":"firfirig","firfirigule":"firfirig","firfirigului":"firfirig","firhang":"firang","firi":"fire","firicele":["firicele","firicel","firicele","firicică"],"firicelei":"firicică","firicelele":["firicelele","firicel","firicelele","firicică"],"firicelelor":["firicelelor","firicel","firicelelor","firicică"],"firicelul":"firicel","firicelule":"firicel","firicelului":"firicel","firide":"firidă","firidei":"firidă","firidele":"firidă","firidelor":"firidă","firii":"fire","firile":"fire","firilor":"fire","firimituri":"firimitură","firimiturii":"firimitură","firimiturile":"firimitură","firimiturilor":"firimitură","firisce":"firișcă","firiscei":"firișcă","firisoare":"firișor","firisore":"firișor","firisorele":"firișor","firisorelor":"firișor","firisorul":"firișor","firisorule":"firișor","firisorului":"firișor","firitisea":"firitisi","firitiseai":"firitisi","firitiseam":"firitisi","firitiseati":"firitisi","firitiseau":"firitisi","firitisesc":"firitisi","firitiseste":"firitisi","firitisesti":"firitisi","firitisii":"firitisi","firitisim":"firitisi","firitisind":"firitisi","firitisira":"firitisi","firitisiram":"firitisi","firitisirati":"firitisi","firitisise":"firitisi","firitisisem":"firitisi","firitisisera":"firitisi","firitisiseram":"firitisi","firitisiserati":"firitisi","firitisisesi":"firitisi","firitisisi":"firitisi","firitisit":"firitisi","firitisiti":"firitisi","firize":"firiz","firizele":"firiz","firizelor":"firiz","firizul":"firiz","firizule":"firiz","firizului":"firiz","firmamentul":"firmament","firmamentule":"firmament","firmamentului":"firmament","firmanase":"firmănaș","firmanasele":"firmănaș","firmanaselor":"firmănaș","firmanasul":"firmănaș","firmanasule":"firmănaș","firmanasului":"firmănaș","firmane":"firman","firmanele":"firman","firmanelor":"firman","firmanul":"firman","firmanule":"firman","firmanului":"firman","firme":"firmă","firmei":"firmă","firmele":"firmă","firmelor":"firmă","firmituri":"firmitură","firmiturii":"firmitură","firmiturile":"firmitură","firmiturilor":"firmitură","firmulite":"firmuliță","firmulitei":"firmuliță","firmulitele":"firmuliță","firmulitelor":"firmuliță","firnisul":"firnis","firnisule":"firnis","firnisului":"firnis","firnisuri":"firnis","firnisurile":"firnis","firnisurilor":"firnis","firoasa":["firoasă","firos","firoasa","firos"],"firoase":"firos","firoasele":"firos","firobuze":"firobuz","firobuzele":"firobuz","firobuzelor":"firobuz","firobuzul":"firobuz","firobuzule":"firobuz","firobuzului":"firobuz","firoscoase":"firoscoasă","firoscoasei":"firoscoasă","firoscoasele":"firoscoasă","firoscoaselor":"firoscoasă","firosi":"firos","firosii":"firos","firosul":"firos","firusori":"firușor","firusorii":"firușor","firusorilor":"firușor","firusorul":"firușor","firusorule":"firușor","firusorului":"firușor","firute":"firuț","firutele":"firuț","firutelor":"firuț","firutul":"firuț","firutule":"firuț","firutului":"firuț","fisa":"fâsă","fisata":["fișată","fișat","fișata","fișat"],"fisate":"fișat","fisatele":"fișat","fisati":"fișat","fisatii":"fișat","fisatul":"fișat","fiscala":["fiscală","fiscal","fiscala","fiscal"],"fiscale":"fiscal","fiscalele":"fiscal","fiscali":"fiscal","fiscalii":"fiscal","fiscalismul":"fiscalism","fiscalismule":"fiscalism","fiscalismului":"fiscalism","fiscalitatea":"fiscalitate","fiscalitati":"fiscalitate","fiscalitatii":"fiscalitate","fiscalitatile":"fiscalitate","fiscalitatilor":"fiscalitate","fiscalizai":"fiscaliza","fiscalizam":["fiscalizăm","fiscaliza","fiscalizam","fiscaliza"],"fiscalizand":"fiscaliza","fiscalizara":"fiscaliza","fiscalizaram":"fiscaliza","fiscalizarati":"fiscaliza","fiscalizarea":"fiscalizare","fiscalizari":"fiscalizare","fiscalizarii":"fiscalizare","fiscalizarile":"fiscalizare","fiscalizarilor":"fiscalizare","fiscalizase":"fiscaliza","fiscalizasem":"fiscaliza","fiscalizasera":"fiscaliza","fiscalizaseram":"fiscaliza","fiscalizaserati":"fiscaliza","fiscalizasesi":"fiscaliza","fiscalizasi":"fiscaliza","fiscalizat":"fiscaliza","fiscalizata":["fiscalizată","fiscalizat","fiscalizata","fiscalizat"],"fiscalizate":"fiscalizat","fiscalizatele":"fiscalizat","fiscalizati":["fiscalizați","fiscaliza","fiscalizați","fiscalizat"],"fiscalizatii":"fiscalizat","fiscalizatul":"fiscalizat","fiscalizau":"fiscaliza","fiscalizeaza":"fiscaliza","fiscalizez":"fiscaliza","fiscalizezi":"fiscaliza","fiscalul":"fiscal","fiscul":"fisc","fiscule":"fisc","fiscului":"fisc","fise":["fise","fisă","fișe","fișă","fîse","fîsă"],"fisei":["fisei","fisă","fișei","fișă"],"fisele":["fisele","fisă","fișele","fișă"],"fiselor":["fiselor","fisă","fișelor","fișă"],"fisibilitatea":"fisibilitate","fisibilitati":"fisibilitate","fisibilitatii":"fisibilitate","fisibilitatile":"fisibilitate","fisibilitatilor":"fisibilitate","fisica":["fisică","fisic","fisica","fisic"],"fisice":"fisic","fisicele":"fisic","fisici":"fisic","fisicii":"fisic","fisicul":["fisicul","fisic","fișicul","fișic"],"fisicule":["fisicule","fisic","fișicule","fișic"],"fisicului":["fisicului","fisic","fișicului","fișic"],"fisicuri":"fișic","fisicurile":"fișic","fisicurilor":"fișic","fisiere":"fișier","fisierele":"fișier","fisierelor":"fișier","fisierul":"fișier","fisierule":"fișier","fisierului":"fișier","fisioara":"fâșioară","fisionabila":["fisionabilă","fisionabil","fisionabila","fisionabil"],"fisionabile":"fisionabil","fisionabilele":"fisionabil","fisionabili":"fisionabil","fisionabilii":"fisionabil","fisionabilul":"fisionabil","fisionai":"fisiona","fisionam":["fisionăm","fisiona","fisionam","fisiona"],"fisionand":"fisiona","fisionara":"fisiona","fisionaram":"fisiona","fisionarati":"fisiona","fisionarea":"fisionare","fisionari":"fisionare","fisionarii":"fisionare","fisionarile":"fisionare","fisionarilor":"fisionare","fisionase":"fisiona","fisionasem":"fisiona","fisionasera":"fisiona","fisionaseram":"fisiona","fisionaserati":"fisiona","fisionasesi":"fisiona","fisionasi":"fisiona","fisionat":"fisiona","fisionati":"fisiona","fisionau":"fisiona","fisioneaza":"fisiona","fisionez":"fisiona","fisionezi":"fisiona","fisiul":"fișiu","fisiule":"fișiu","fisiului":"fișiu","fisiunea":"fisiune","fisiunei":"fisiune","fisiunele":"fisiune","fisiunelor":"fisiune","fisiuni":"fisiune","fisiuni binare":"fisiune binară","fisiuri":"fișiu","fisiurile":"fișiu","fisiurilor":"fișiu","fispani":"fișpan","fispanii":"fișpan","fispanilor":"fișpan","fispanul":"fișpan","fispanule":"fișpan","fispanului":"fișpan","fistichia":"fistichiu","fistichie":"fistichiu","fistichii":"fistichiu","fistichiii":"fistichiu","fistichiile":"fistichiu","fistichiul":"fistichiu","fistici":"fistic","fisticii":"fistic","fisticilor":"fistic","fisticul":"fistic","fisticule":"fistic","fisticului":"fistic","fisticuri":"fistic","fisticurile":"fistic","fisticurilor":"fistic","fistulara":["fistulară","fistular","fistulara","fistular"],"fistulare":"fistular","fistularele":"fistular","fistulari":"fistular","fistularii":"fistular","fistularul":"fistular","fistule":"fistulă","fistulei":"fistulă","fistulele":"fistulă","fistulelor":"fistulă","fistuloasa":["fistuloasă","fistulos","fistuloasa","fistulos"],"fistuloase":"fistulos","fistuloasele":"fistulos","fistulosi":"fistulos","fistulosii":"fistulos","fistulosul":"fistulos","fisurai":"fisura","fisuram":["fisurăm","fisura","fisuram","fisura"],"fisurand":"fisura","fisurara":"fisura","fisuraram":"fisura","fisurarati":"fisura","fisurarea":"fisurare","fisurari":"fisurare","fisurarii":"fisurare","fisurarile":"fisurare","fisurarilor":"fisurare","fisurase":"fisura","fisurasem":"fisura","fisurasera":"fisura","fisuraseram":"fisura","fisuraserati":"fisura","fisurasesi":"fisura","fisurasi":"fisura","fisurat":"fisura","fisurata":["fisurată","fisurat","fisurata","fisurat"],"fisurate":"fisurat","fisuratele":"fisurat","fisurati":["fisurați","fisura","fisurați","fisurat"],"fisuratii":"fisurat","fisuratul":"fisurat","fisurau":"fisura","fisureaza":"fisura","fisurez":"fisura","fisurezi":"fisura","fisuri":"fisură","fisurii":"fisură","fisurile":"fisură","fisurilor":"fisură","fite":"fiță","fitei":"fiță","fitele":"fiță","fitelor":"fiță","fiti":"fi","fitiliste":"fitilistă","fitilistei":"fitilistă","fitilistele":"fitilistă","fitilistelor":"fitilistă","fitilul":"fitil","fitilule":"fitil","fitilului":"fitil","fitiluri":"fitil","fitilurile":"fitil","fitilurilor":"fitil","fitnessul":"fitness","fitnessule":"fitness","fitnessului":"fitness","fitoaice":"fițoaică","fitoaicei":"fițoaică","fitoaicele":"fițoaică","fitoaicelor":"fițoaică","fitobiologia":"fitobiologie","fitobiologica":["fitobiologică","fitobiologic","fitobiologica","fitobiologic"],"fitobiologice":"fitobiologic","fitobiologicele":"fitobiologic","fitobiologici":"fitobiologic","fitobiologicii":"fitobiologic","fitobiologicul":"fitobiologic","fitobiologiei":"fitobiologie","fitobiologii":"fitobiologie","fitocenologia":"fitocenologie","fitocenologiei":"fitocenologie","fitocenologii":"fitocenologie","fitocenologiile":"fitocenologie","fitocenologiilor":"fitocenologie","fitocenotica":["fitocenotică","fitocenotic","fitocenotica","fitocenotic"],"fitocenotice":"fitocenotic","fitocenoticele":"fitocenotic","fitocenotici":"fitocenotic","fitocenoticii":"fitocenotic","fitocenoticul":"fitocenotic","fitocenoze":"fitocenoză","fitocenozei":"fitocenoză","fitocenozele":"fitocenoză","fitocenozelor":"fitocenoză","fitochimia":"fitochimie","fitochimiei":"fitochimie","fitochimii":"fitochimie","fitocidul":"fitocid","fitocidule":"fitocid","fitocidului":"fitocid","fitocizi":"fitocid","fitocizile":"fitocid","fitocizilor":"fitocid","fitofage":"fitofagă","fitofagei":"fitofagă","fitofagele":"fitofagă","fitofagelor":"fitofagă","fitofagi":"fitofag","fitofagii":"fitofag","fitofagilor":"fitofag","fitofagul":"fitofag","fitofagule":"fitofag","fitofagului":"fitofag","fitofarmaceutica":["fitofarmaceutică","fitofarmaceutic","fitofarmaceutica","fitofarmaceutic"],"fitofarmaceutice":"fitofarmaceutic","fitofarmaceuticele":"fitofarmaceutic","fitofarmaceutici":"fitofarmaceutic","fitofarmaceuticii":"fitofarmaceutic","fitofarmaceuticul":"fitofarmaceutic","fitofarmacia":"fitofarmacie","fitofarmaciei":"fitofarmacie","fitofarmacii":"fitofarmacie","fitofarmaciile":"fitofarmacie","fitofarmaciilor":"fitofarmacie","fitofiziologia":"fitofiziologie","fitofiziologiei":"fitofiziologie","fitofiziologii":"fitofiziologie","fitofiziologiile":"fitofiziologie","fitofiziologiilor":"fitofiziologie","fitogena":["fitogenă","fitogen","fitogena","fitogen"],"fitogene":"fitogen","fitogenele":"fitogen","fitogeni":"fitogen","fitogenica":["fitogenică","fitogenic","fitogenica","fitogenic"],"fitogenice":"fitogenic","fitogenicele":"fitogenic","fitogenici":"fitogenic","fitogenicii":"fitogenic","fitogenicul":"fitogenic","fitogenii":"fitogen","fitogenul":"fitogen","fitogeografia":"fitogeografie","fitogeografica":["fitogeografică","fitogeografic","fitogeografica","fitogeografic"],"fitogeografice":"fitogeografic","fitogeograficele":"fitogeografic","fitogeografici":"fitogeografic","fitogeograficii":"fitogeografic","fitogeograficul":"fitogeografic","fitogeografiei":"fitogeografie","fitogeografii":"fitogeografie","fitografia":"fitografie","fitografiei":"fitografie","fitografii":"fitografie","fitografiile":"fitografie","fitografiilor":"fitografie","fitohormoni":"fitohormon","fitohormonii":"fitohormon","fitohormonilor":"fitohormon","fitohormonul":"fitohormon","fitohormonule":"fitohormon","fitohormonului":"fitohormon","fitologe":"fitologă","fitologei":"fitologă","fitologele":"fitologă","fitologelor":"fitologă","fitologi":"fitolog","fitologia":"fitologie","fitologiei":"fitologie","fitologii":["fitologii","fitolog","fitologii","fitologie"],"fitologiile":"fitologie","fitologiilor":"fitologie","fitologilor":"fitolog","fitologul":"fitolog","fitologule":"fitolog","fitologului":"fitolog","fitomorfa":["fitomorfă","fitomorf","fitomorfa","fitomorf"],"fitomorfe":"fitomorf","fitomorfele":"fitomorf","fitomorfi":"fitomorf","fitomorfii":"fitomorf","fitomorful":"fitomorf","fitoncide":"fitoncid","fitoncidele":"fitoncid","fitoncidelor":"fitoncid","fitoncidul":"fitoncid","fitoncidule":"fitoncid","fitoncidului":"fitoncid","fitonimia":"fitonimie","fitonimiei":"fitonimie","fitonimii":"fitonimie","fitonimiile":"fitonimie","fitonimiilor":"fitonimie","fitoparaziti":"fitoparazit","fitoparazitii":"fitoparazit","fitoparazitilor":"fitoparazit","fitoparazitul":"fitoparazit","fitoparazitule":"fitoparazit","fitoparazitului":"fitoparazit","fitopatogeni":"fitopatogen","fitopatogenii":"fitopatogen","fitopatogenilor":"fitopatogen","fitopatogenul":"fitopatogen","fitopatogenule":"fitopatogen","fitopatogenului":"fitopatogen","fitopatologe":"fitopatologă","fitopatologei":"fitopatologă","fitopatologele":"fitopatologă","fitopatologelor":"fitopatologă","fitopatologi":"fitopatolog","fitopatologia":"fitopatologie","fitopatologica":["fitopatologică","fitopatologic","fitopatologica","fitopatologic"],"fitopatologice":"fitopatologic","fitopatologicele":"fitopatologic","fitopatologici":"fitopatologic","fitopatologicii":"fitopatologic","fitopatologicul":"fitopatologic","fitopatologiei":"fitopatologie","fitopatologii":["fitopatologii","fitopatolog","fitopatologii","fitopatologie"],"fitopatologilor":"fitopatolog","fitopatologul":"fitopatolog","fitopatologule":"fitopatolog","fitopatologului":"fitopatolog","fitoplanctonul":"fitoplancton","fitoplanctonule":"fitoplancton","fitoplanctonului":"fitoplancton","fitoplanctonuri":"fitoplancton","fitoplanctonurile":"fitoplancton","fitoplanctonurilor":"fitoplancton","fitosanitara":["fitosanitară","fitosanitar","fitosanitara","fitosanitar"],"fitosanitare":"fitosanitar","fitosanitarele":"fitosanitar","fitosanitari":"fitosanitar","fitosanitarii":"fitosanitar","fitosanitarul":"fitosanitar","fitosterine":"fitosterină","fitosterinei":"fitosterină","fitosterinele":"fitosterină","fitosterinelor":"fitosterină","fitosteroli":"fitosterol","fitosterolii":"fitosterol","fitosterolilor":"fitosterol","fitosterolul":"fitosterol","fitosterolule":"fitosterol","fitosterolului":"fitosterol","fitoterapeute":"fitoterapeută","fitoterapeutei":"fitoterapeută","fitoterapeutele":"fitoterapeută","fitoterapeutelor":"fitoterapeută","fitoterapeuti":"fitoterapeut","fitoterapeutii":"fitoterapeut","fitoterapeutilor":"fitoterapeut","fitoterapeutul":"fitoterapeut","fitoterapeutule":"fitoterapeut","fitoterapeutului":"fitoterapeut","fitoterapia":"fitoterapie","fitoterapica":["fitoterapică","fitoterapic","fitoterapica","fitoterapic"],"fitoterapice":"fitoterapic","fitoterapicele":"fitoterapic","fitoterapici":"fitoterapic","fitoterapicii":"fitoterapic","fitoterapicul":"fitoterapic","fitoterapiei":"fitoterapie","fitoterapii":"fitoterapie","fitotomia":"fitotomie","fitotomiei":"fitotomie","fitotomii":"fitotomie","fitotomiile":"fitotomie","fitotomiilor":"fitotomie","fitotoxica":["fitotoxică","fitotoxic","fitotoxica","fitotoxic"],"fitotoxice":"fitotoxic","fitotoxicele":"fitotoxic","fitotoxici":"fitotoxic","fitotoxicii":"fitotoxic","fitotoxicul":"fitotoxic","fitotoxine":"fitotoxină","fitotoxinei":"fitotoxină","fitotoxinele":"fitotoxină","fitotoxinelor":"fitotoxină","fitotroane":"fitotron","fitotroanele":"fitotron","fitotroanelor":"fitotron","fitotronul":"fitotron","fitotronule":"fitotron","fitotronului":"fitotron","fitozoare":"fitozoar","fitozoarele":"fitozoar","fitozoarelor":"fitozoar","fitozoarul":"fitozoar","fitozoarule":"fitozoar","fitozoarului":"fitozoar","fituici":"fițuică","fituicii":"fițuică","fituicile":"fițuică","fituicilor":"fițuică","fiul":"fiu","fiularea":"fiulare","fiulari":"fiulare","fiularii":"fiulare","fiularile":"fiulare","fiularilor":"fiulare","fiule":"fiu","fiuleti":"fiuleț","fiuletii":"fiuleț","fiuletilor":"fiuleț","fiuletul":"fiuleț","fiuletule":"fiuleț","fiuletului":"fiuleț","fiului":"fiu","fiuti":"fiuț","fiutii":"fiuț","fiutilor":"fiuț","fiutul":"fiuț","fiutule":"fiuț","fiutului":"fiuț","fixa":["fixă","fix","fixa","fix"],"fixabila":["fixabilă","fixabil","fixabila","fixabil"],"fixabile":"fixabil","fixabilele":"fixabil","fixabili":"fixabil","fixabilii":"fixabil","fixabilul":"fixabil","fixai":"fixa","fixaje":"fixaj","fixajele":"fixaj","fixajelor":"fixaj","fixajul":"fixaj","fixajule":"fixaj","fixajului":"fixaj","fixam":["fixăm","fixa","fixam","fixa"],"fixand":"fixa","fixara":"fixa","fixaram":"fixa","fixarati":"fixa","fixarea":"fixare","fixari":"fixare","fixarii":"fixare","fixarile":"fixare","fixarilor":"fixare","fixase":"fixa","fixasem":"fixa","fixasera":"fixa","fixaseram":"fixa","fixaserati":"fixa","fixasesi":"fixa","fixasi":"fixa","fixat":"fixa","fixata":["fixată","fixat","fixata","fixat"],"fixate":"fixat","fixatele":"fixat","fixati":["fixați","fixa","fixați","fixat"],"fixatia":"fixație","fixatiei":"fixație","fixatii":["fixații","fixat","fixații","fixație"],"fixatiile":"fixație","fixatiilor":"fixație","fixativi":"fixativ","fixativile":"fixativ","fixativilor":"fixativ","fixativul":"fixativ","fixativule":"fixativ","fixativului":"fixativ","fixatori":"fixator","fixatorii":"fixator","fixatorilor":"fixator","fixatorul":"fixator","fixatorule":"fixator","fixatorului":"fixator","fixatul":"fixat","fixau":"fixa","fixe":"fix","fixeaza":"fixa","fixele":"fix","fixez":"fixa","fixezi":"fixa","fixismul":"fixism","fixismule":"fixism","fixismului":"fixism","fixiste":"fixistă","fixistei":"fixistă","fixistele":"fixistă","fixistelor":"fixistă","fixisti":"fixist","fixistii":"fixist","fixistilor":"fixist","fixistul":"fixist","fixistule":"fixist","fixistului":"fixist","fixitatea":"fixitate","fixitati":"fixitate","fixitatii":"fixitate","fixitatile":"fixitate","fixitatilor":"fixitate","fixul":"fix","fizica":["fizică","fizic","fizica","fizic"],"fizicala":["fizicală","fizical","fizicala","fizical"],"fizicale":"fizical","fizicalele":"fizical","fizicali":"fizical","fizicalii":"fizical","fizicalisme":"fizicalism","fizicalismele":"fizicalism","fizicalismelor":"fizicalism","fizicalismul":"fizicalism","fizicalismule":"fizicalism","fizicalismului":"fizicalism","fizicaliste":"fizicalistă","fizicalistei":"fizicalistă","fizicalistele":"fizicalistă","fizicalistelor":"fizicalistă","fizicalisti":"fizicalist","fizicalistii":"fizicalist","fizicalistilor":"fizicalist","fizicalistul":"fizicalist","fizicalistule":"fizicalist","fizicalistului":"fizicalist","fizicalul":"fizical","fizice":"fizic","fizicele":"fizic","fizici":"fizic","fizicianul":"fizician","fizicianule":"fizician","fizicianului":"fizician","fiziciene":"fiziciană","fizicienei":"fiziciană","fizicienele":"fiziciană","fizicienelor":"fiziciană","fizicieni":"fizician","fizicienii":"fizician","fizicienilor":"fizician","fizicii":"fizic","fizicul":"fizic","fiziocrati":"fiziocrat","fiziocratia":"fiziocrație","fiziocratica":["fiziocratică","fiziocratic","fiziocratica","fiziocratic"],"fiziocratice":"fiziocratic","fiziocraticele":"fiziocratic","fiziocratici":"fiziocratic","fiziocraticii":"fiziocratic","fiziocraticul":"fiziocratic","fiziocratiei":"fiziocrație","fiziocratii":["fiziocrații","fiziocrat","fiziocrații","fiziocrație"],"fiziocratiile":"fiziocrație","fiziocratiilor":"fiziocrație","fiziocratilor":"fiziocrat","fiziocratisme":"fiziocratism","fiziocratismele":"fiziocratism","fiziocratismelor":"fiziocratism","fiziocratismul":"fiziocratism","fiziocratismule":"fiziocratism","fiziocratismului":"fiziocratism","fiziocratul":"fiziocrat","fiziocratule":"fiziocrat","fiziocratului":"fiziocrat","fiziognomia":"fiziognomie","fiziognomica":["fiziognomică","fiziognomic","fiziognomica","fiziognomic"],"fiziognomice":"fiziognomic","fiziognomicele":"fiziognomic","fiziognomici":"fiziognomic","fiziognomicii":"fiziognomic","fiziognomicul":"fiziognomic","fiziognomiei":"fiziognomie","fiziognomii":"fiziognomie","fiziognomiile":"fiziognomie","fiziognomiilor":"fiziognomie","fiziognomonia":"fiziognomonie","fiziognomonica":["fiziognomonică","fiziognomonic","fiziognomonica","fiziognomonic"],"fiziognomonice":"fiziognomonic","fiziognomonicele":"fiziognomonic","fiziognomonici":"fiziognomonic","fiziognomonicii":"fiziognomonic","fiziognomonicul":"fiziognomonic","fiziognomoniei":"fiziognomonie","fiziognomonii":"fiziognomonie","fiziografi":"fiziograf","fiziografia":"fiziografie","fiziografica":["fiziografică","fiziografic","fiziografica","fiziografic"],"fiziografice":"fiziografic","fiziograficele":"fiziografic","fiziografici":"fiziografic","fiziograficii":"fiziografic","fiziograficul":"fiziografic","fiziografiei":"fiziografie","fiziografii":["fiziografii","fiziograf","fiziografii","fiziografie"],"fiziografiile":"fiziografie","fiziografiilor":"fiziografie","fiziografilor":"fiziograf","fiziograful":"fiziograf","fiziografule":"fiziograf","fiziografului":"fiziograf","fiziolatria":"fiziolatrie","fiziolatriei":"fiziolatrie","fiziolatrii":"fiziolatrie","fiziolatriile":"fiziolatrie","fiziolatriilor":"fiziolatrie","fiziologe":"fiziologă","fiziologei":"fiziologă","fiziologele":"fiziologă","fiziologelor":"fiziologă","fiziologi":"fiziolog","fiziologia":"fiziologie","fiziologica":["fiziologică","fiziologic","fiziologica","fiziologic"],"fiziologice":"fiziologic","fiziologicele":"fiziologic","fiziologici":"fiziologic","fiziologicii":"fiziologic","fiziologicul":"fiziologic","fiziologiei":"fiziologie","fiziologii":["fiziologii","fiziolog","fiziologii","fiziologie"],"fiziologiile":"fiziologie","fiziologiilor":"fiziologie","fiziologilor":"fiziolog","fiziologiste":"fiziologistă","fiziologistei":"fiziologistă","fiziologistele":"fiziologistă","fiziologistelor":"fiziologistă","fiziologisti":"fiziologist","fiziologistii":"fiziologist","fiziologistilor":"fiziologist","fiziologistul":"fiziologist","fiziologistule":"fiziologist","fiziologistului":"fiziologist","fiziologul":"fiziolog","fiziologule":"fiziolog","fiziologului":"fiziolog","fizionomia":"fizionomie","fizionomica":["fizionomică","fizionomic","fizionomica","fizionomic"],"fizionomice":"fizionomic","fizionomicele":"fizionomic","fizionomici":"fizionomic","fizionomicii":"fizionomic","fizionomicul":"fizionomic","fizionomiei":"fizionomie","fizionomii":"fizionomie","fizionomiile":"fizionomie","fizionomiilor":"fizionomie","fizionomiste":"fizionomistă","fizionomistei":"fizionomistă","fizionomistele":"fizionomistă","fizionomistelor":"fizionomistă","fizionomisti":"fizionomist","fizionomistii":"fizionomist","fizionomistilor":"fizionomist","fizionomistul":"fizionomist","fizionomistule":"fizionomist","fizionomistului":"fizionomist","fiziopatologe":"fiziopatologă","fiziopatologei":"fiziopatologă","fiziopatologele":"fiziopatologă","fiziopatologelor":"fiziopatologă","fiziopatologi":"fiziopatolog","fiziopatologia":"fiziopatologie","fiziopatologica":["fiziopatologică","fiziopatologic","fiziopatologica","fiziopatologic"],"fiziopatologice":"fiziopatologic","fiziopatologicele":"fiziopatologic","fiziopatologici":"fiziopatologic","fiziopatologicii":"fiziopatologic","fiziopatologicul":"fiziopatologic","fiziopatologiei":"fiziopatologie","fiziopatologii":["fiziopatologii","fiziopatolog","fiziopatologii","fiziopatologie"],"fiziopatologiile":"fiziopatologie","fiziopatologiilor":"fiziopatologie","fiziopatologilor":"fiziopatolog","fiziopatologul":"fiziopatolog","fiziopatologule":"fiziopatolog","fiziopatologului":"fiziopatolog","fizioterapeute":"fizioterapeută","fizioterapeutei":"fizioterapeută","fizioterapeutele":"fizioterapeută","fizioterapeutelor":"fizioterapeută","fizioterapeuti":"fizioterapeut","fizioterapeutii":"fizioterapeut","fizioterapeutilor":"fizioterapeut","fizioterapeutul":"fizioterapeut","fizioterapeutule":"fizioterapeut","fizioterapeutului":"fizioterapeut","fizioterapia":"fizioterapie","fizioterapica":["fizioterapică","fizioterapic","fizioterapica","fizioterapic"],"fizioterapice":"fizioterapic","fizioterapicele":"fizioterapic","fizioterapici":"fizioterapic","fizioterapicii":"fizioterapic","fizioterapicul":"fizioterapic","fizioterapiei":"fizioterapie","fizioterapii":"fizioterapie","fizioterapiile":"fizioterapie","fizioterapiilor":"fizioterapie","flabelata":["flabelată","flabelat","flabelata","flabelat"],"flabelate":"flabelat","flabelatele":"flabelat","flabelati":"flabelat","flabelatii":"flabelat","flabelatul":"flabelat","flabeliforma":["flabeliformă","flabeliform","flabeliforma","flabeliform"],"flabeliforme":"flabeliform","flabeliformele":"flabeliform","flabeliformi":"flabeliform","flabeliformii":"flabeliform","flabeliformul":"flabeliform","flabelul":"flabel","flabelule":"flabel","flabelului":"flabel","flabeluri":"flabel","flabelurile":"flabel","flabelurilor":"flabel","flacai":"flăcău","flacaiandri":"flăcăiandru","flacaiandrii":"flăcăiandru","flacaiandrilor":"flăcăiandru","flacaiandrul":"flăcăiandru","flacaiandrule":"flăcăiandru","flacaiandrului":"flăcăiandru","flacaiasi":"flăcăiaș","flacaiasii":"flăcăiaș","flacaiasilor":"flăcăiaș","flacaiasul":"flăcăiaș","flacaiasule":"flăcăiaș","flacaiasului":"flăcăiaș","flacaii":"flăcău","flacailor":"flăcău","flacaimea":"flăcăime","flacaimei":"flăcăime","flacaraia":"flăcăraie","flacaraiei":"flăcăraie","flacaraii":"flăcăraie","flacari":"flacără","flacaria":"flăcărie","flacariei":"flăcărie","flacarii":["flăcării","flacără","flăcării","flăcărie"],"flacarile":"flacără","flacarilor":"flacără","flacarui":"flăcăruie","flacaruia":"flăcăruie","flacaruii":"flăcăruie","flacaruile":"flăcăruie","flacaruilor":"flăcăruie","flacaruse":"flăcărușă","flacarusei":"flăcărușă","flacarusele":"flăcărușă","flacaruselor":"flăcărușă","flacarute":"flăcăruță","flacarutei":"flăcăruță","flacarutele":"flăcăruță","flacarutelor":"flăcăruță","flacauandri":"flăcăuandru","flacauandrii":"flăcăuandru","flacauandrilor":"flăcăuandru","flacauandruul":"flăcăuandru","flacauandruule":"flăcăuandru","flacauandruului":"flăcăuandru","flacauani":"flăcăuan","flacauanii":"flăcăuan","flacauanilor":"flăcăuan","flacauanul":"flăcăuan","flacauanule":"flăcăuan","flacauanului":"flăcăuan","flacauasi":"flăcăuaș","flacauasii":"flăcăuaș","flacauasilor":"flăcăuaș","flacauasul":"flăcăuaș","flacauasule":"flăcăuaș","flacauasului":"flăcăuaș","flacaul":"flăcău","flacaule":"flăcău","flacaului":"flăcău","flacausi":"flăcăuș","flacausii":"flăcăuș","flacausilor":"flăcăuș","flacausul":"flăcăuș","flacausule":"flăcăuș","flacausului":"flăcăuș","flacida":["flacidă","flacid","flacida","flacid"],"flacide":"flacid","flacidele":"flacid","flaciditatea":"flaciditate","flaciditati":"flaciditate","flaciditatii":"flaciditate","flacidul":"flacid","flacizi":"flacid","flacizii":"flacid","flacoane":"flacon","flacoanele":"flacon","flacoanelor":"flacon","flaconase":"flaconaș","flaconasele":"flaconaș","flaconaselor":"flaconaș","flaconasul":"flaconaș","flaconasule":"flaconaș","flaconasului":"flaconaș","flaconul":"flacon","flaconule":"flacon","flaconului":"flacon","flagelai":"flagela","flagelam":["flagelăm","flagela","flagelam","flagela"],"flageland":"flagela","flagelara":"flagela","flagelaram":"flagela","flagelarati":"flagela","flagelarea":"flagelare","flagelari":"flagelare","flagelarii":"flagelare","flagelarile":"flagelare","flagelarilor":"flagelare","flagelase":"flagela","flagelasem":"flagela","flagelasera":"flagela","flagelaseram":"flagela","flagelaserati":"flagela","flagelasesi":"flagela","flagelasi":"flagela","flagelat":"flagela","flagelate":"flagelat","flagelatele":"flagelat","flagelatelor":"flagelat","flagelati":"flagela","flagelatia":"flagelație","flagelatiei":"flagelație","flagelatii":"flagelație","flagelatiile":"flagelație","flagelatiilor":"flagelație","flagelatiunea":"flagelațiune","flagelatiuni":"flagelațiune","flagelatiunii":"flagelațiune","flagelatiunile":"flagelațiune","flagelatiunilor":"flagelațiune","flagelatoare":"flagelator","flagelatoarea":"flagelator","flagelatoarele":"flagelator","flagelatori":"flagelator","flagelatorii":"flagelator","flagelatorul":"flagelator","flagelatul":"flagelat","flagelatule":"flagelat","flagelatului":"flagelat","flagelau":"flagela","flageleaza":"flagela","flagelez":"flagela","flagelezi":"flagela","flageluri":"flagel","flagranta":["flagrantă","flagrant","flagranta","flagrant"],"flagrante":["flagrante","flagrant","flagranțe","flagranță"],"flagrantei":"flagranță","flagrantele":["flagrantele","flagrant","flagranțele","flagranță"],"flagrantelor":"flagranță","flagranti":"flagrant","flagrantii":"flagrant","flagrantul":"flagrant","flaimoci":"flaimoc","flaimocii":"flaimoc","flaimocilor":"flaimoc","flaimocul":"flaimoc","flaimocule":"flaimoc","flaimocului":"flaimoc","flaimuci":"flaimuc","flaimucii":"flaimuc","flaimucilor":"flaimuc","flaimucul":"flaimuc","flaimucule":"flaimuc","flaimucului":"flaimuc","flajeolete":"flajeolet","flajeoletele":"flajeolet","flajeoletelor":"flajeolet","flajeoletul":"flajeolet","flajeoletule":"flajeolet","flajeoletului":"flajeolet","flajolete":"flajolet","flajoletele":"flajolet","flajoletelor":"flajolet","flajoletul":"flajolet","flajoletule":"flajolet","flajoletului":"flajolet","flamanda":["flamandă","flamand","flamanda","flamand","flămândă","flămând","flămânda","flămând"],"flamande":["flamande","flamand","flămânde","flămând","flamande","flamandă"],"flamandei":"flamandă","flamandele":["flamandele","flamand","flămândele","flămând","flamandele","flamandă"],"flamandelor":"flamandă","flamandul":["flamandul","flamand","flămândul","flămând"],"flamanjora":["flămânjoră","flămânjor","flămânjora","flămânjor"],"flamanjore":"flămânjor","flamanjorele":"flămânjor","flamanjori":"flămânjor","flamanjorii":"flămânjor","flamanjorul":"flămânjor","flamanjunea":"flămânjune","flamanjuni":"flămânjune","flamanjunii":"flămânjune","flamanjunile":"flămânjune","flamanjunilor":"flămânjune","flamanzaciunea":"flămănzăciune","flamanzaciuni":"flămănzăciune","flamanzaciunii":"flămănzăciune","flamanzaciunile":"flămănzăciune","flamanzaciunilor":"flămănzăciune","flamanzea":"flămânzi","flamanzeai":"flămânzi","flamanzeam":"flămânzi","flamanzeati":"flămânzi","flamanzeau":"flămânzi","flamanzele":"flămânzică","flamanzelei":"flămânzică","flamanzelele":"flămânzică","flamanzelelor":"flămânzică","flamanzenia":"flămânzenie","flamanzeniei":"flămânzenie","flamanzenii":"flămânzenie","flamanzeniile":"flămânzenie","flamanzeniilor":"flămânzenie","flamanzesc":"flămânzi","flamanzeste":"flămânzi","flamanzesti":"flămânzi","flamanzi":["flamanzi","flamand","flămânzi","flămând"],"flamanzia":"flămânzie","flamanziei":"flămânzie","flamanzii":["flamanzii","flamand","flămânzii","flămând","flămânzii","flămânzi","flămânzii","flămânzie"],"flamanziile":"flămânzie","flamanziilor":"flămânzie","flamanzilaul":"flămânzilă","flamanzilaule":"flămânzilă","flamanzilaului":"flămânzilă","flamanzim":"flămânzi","flamanzind":"flămânzi","flamanzira":"flămânzi","flamanziram":"flămânzi","flamanzirati":"flămânzi","flamanzirea":"flămânzire","flamanziri":"flămânzire","flamanzirii":"flămânzire","flamanzirile":"flămânzire","flamanzirilor":"flămânzire","flamanzise":"flămânzi","flamanzisem":"flămânzi","flamanzisera":"flămânzi","flamanziseram":"flămânzi","flamanziserati":"flămânzi","flamanzisesi":"flămânzi","flamanzisi":"flămânzi","flamanzit":"flămânzi","flamanzita":["flămânzită","flămânzit","flămânzita","flămânzit"],"flamanzite":"flămânzit","flamanzitele":"flămânzit","flamanziti":["flămânziți","flămânzi","flămânziți","flămânzit"],"flamanzitii":"flămânzit","flamanzitul":"flămânzit","flambai":"flamba","flambaje":"flambaj","flambajele":"flambaj","flambajelor":"flambaj","flambajul":"flambaj","flambajule":"flambaj","flambajului":"flambaj","flambam":["flambăm","flamba","flambam","flamba"],"flamband":"flamba","flambara":"flamba","flambaram":"flamba","flambarati":"flamba","flambarea":"flambare","flambari":"flambare","flambarii":"flambare","flambarile":"flambare","flambarilor":"flambare","flambase":"flamba","flambasem":"flamba","flambasera":"flamba","flambaseram":"flamba","flambaserati":"flamba","flambasesi":"flamba","flambasi":"flamba","flambat":"flamba","flambati":"flamba","flambau":"flamba","flambeaza":"flamba","flambez":"flamba","flambezi":"flamba","flamboaianta":["flamboaiantă","flamboaiant","flamboaianta","flamboaiant"],"flamboaiante":"flamboaiant","flamboaiantele":"flamboaiant","flamboaianti":"flamboaiant","flamboaiantii":"flamboaiant","flamboaiantul":"flamboaiant","flamboianta":["flamboiantă","flamboiant","flamboianta","flamboiant"],"flamboiante":"flamboiant","flamboiantele":"flamboiant","flamboianti":"flamboiant","flamboiantii":"flamboiant","flamboiantul":"flamboiant","flame":"flamă","flamencoul":"flamenco","flamencoule":"flamenco","flamencoului":"flamenco","flaming":"flamingo","flamingi":["flamingi","flaming","flamingi","flamingo"],"flamingii":["flamingii","flaming","flamingii","flamingo"],"flamingilor":["flamingilor","flaming","flamingilor","flamingo"],"flamingoul":"flamingo","flamingoule":"flamingo","flamingoului":"flamingo","flamingul":"flaming","flamingule":"flaming","flamingului":"flaming","flamini":"flamin","flaminii":"flamin","flaminilor":"flamin","flaminul":"flamin","flaminule":"flamin","flaminului":"flamin","flamuri":"flamură","flamurii":"flamură","flamurile":"flamură","flamurilor":"flamură","flancai":"flanca","flancam":["flancăm","flanca","flancam","flanca"],"flancand":"flanca","flancara":"flanca","flancaram":"flanca","flancarati":"flanca","flancarea":"flancare","flancari":"flancare","flancarii":"flancare","flancarile":"flancare","flancarilor":"flancare","flancase":"flanca","flancasem":"flanca","flancasera":"flanca","flancaseram":"flanca","flancaserati":"flanca","flancasesi":"flanca","flancasi":"flanca","flancat":"flanca","flancata":["flancată","flancat","flancata","flancat"],"flancate":"flancat","flancatele":"flancat","flancati":["flancați","flanca","flancați","flancat"],"flancatii":"flancat","flancatul":"flancat","flancau":"flanca","flancgarde":"flancgardă","flancgardei":"flancgardă","flancgardele":"flancgardă","flancgardelor":"flancgardă","flancgarzi":"flancgardă","flancheaza":"flanca","flanchez":"flanca","flanchezi":"flanca","flancul":"flanc","flancule":"flanc","flancului":"flanc","flancuri":"flanc","flancurile":"flanc","flancurilor":"flanc","flaneaua":"flanea","flanelaul":"flanelă","flanelaule":"flanelă","flanelaului":"flanelă","flanele":["flanele","flanea","flanele","flanel","flanele","flanelă"],"flanelei":"flanea","flanelele":["flanelele","flanea","flanelele","flanel","flanelele","flanelă"],"flanelelor":["flanelelor","flanea","flanelelor","flanel","flanelelor","flanelă"],"flanelul":"flanel","flanelule":"flanel","flanelului":"flanel","flanelute":"flaneluță","flanelutei":"flaneluță","flanelutele":"flaneluță","flanelutelor":"flaneluță","flaneuri":"flaneur","flaneurii":"flaneur","flaneurilor":"flaneur","flaneurul":"flaneur","flaneurule":"flaneur","flaneurului":"flaneur","flangere":"flanger","flangerele":"flanger","flangerelor":"flanger","flangerul":"flanger","flangerule":"flanger","flangerului":"flanger","flanul":"flan","flanule":"flan","flanului":"flan","flanuri":"flan","flanurile":"flan","flanurilor":"flan","flapsul":"flaps","flapsule":"flaps","flapsului":"flaps","flapsuri":"flaps","flapsurile":"flaps","flapsurilor":"flaps","flasca":["flască","flasc","flasca","flasc"],"flascul":"flasc","flase":"flașă","flasei":"flașă","flasele":"flașă","flaselor":"flașă","flaseria":"flașerie","flaseriei":"flașerie","flaserii":"flașerie","flaseriile":"flașerie","flaseriilor":"flașerie","flash-uri":"flash","flash-urile":"flash","flash-urilor":"flash","flashbackul":"flashback","flashbackule":"flashback","flashbackului":"flashback","flashbackuri":"flashback","flashbackurile":"flashback","flashbackurilor":"flashback","flashul":"flash","flashule":"flash","flashului":"flash","flasnetari":"flașnetar","flasnetarii":"flașnetar","flasnetarilor":"flașnetar","flasnetarul":"flașnetar","flasnetarule":"flașnetar","flasnetarului":"flașnetar","flasnete":"flașnetă"};
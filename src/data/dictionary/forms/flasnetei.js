@@ -0,0 +1 @@
+export default {"flasnetei":"flașnetă","flasnetele":"flașnetă","flasnetelor":"flașnetă","flaste":"flasc","flastele":"flasc","flasti":"flasc","flastii":"flasc","flatai":"flata","flatam":["flatăm","flata","flatam","flata"],"flatand":"flata","flatara":"flata","flataram":"flata","flatarati":"flata","flatarea":"flatare","flatari":"flatare","flatarii":"flatare","flatarile":"flatare","flatarilor":"flatare","flatase":"flata","flatasem":"flata","flatasera":"flata","flataseram":"flata","flataserati":"flata","flatasesi":"flata","flatasi":"flata","flatat":"flata","flatata":["flatată","flatat","flatata","flatat"],"flatate":"flatat","flatatele":"flatat","flatati":["flatați","flata","flatați","flatat"],"flatatia":"flatație","flatatiei":"flatație","flatatii":["flatații","flatat","flatații","flatație"],"flatatiile":"flatație","flatatiilor":"flatație","flatatul":"flatat","flatau":"flata","flateaza":"flata","flateria":"flaterie","flateriei":"flaterie","flaterii":"flaterie","flateriile":"flaterie","flateriilor":"flaterie","flatez":"flata","flatezi":"flata","flatulenta":["flatulentă","flatulent","flatulenta","flatulent"],"flatulente":["flatulente","flatulent","flatulențe","flatulență"],"flatulentei":"flatulență","flatulentele":["flatulentele","flatulent","flatulențele","flatulență"],"flatulentelor":"flatulență","flatulenti":"flatulent","flatulentii":"flatulent","flatulentul":"flatulent","flatuozitatati":"flatuozitate","flatuozitatatii":"flatuozitate","flatuozitatatile":"flatuozitate","flatuozitatatilor":"flatuozitate","flatuozitatea":"flatuozitate","flaure":"flaur","flaurele":"flaur","flaurelor":"flaur","flaurul":"flaur","flaurule":"flaur","flaurului":"flaur","flausul":"flauș","flausule":"flauș","flausului":"flauș","flausuri":"flauș","flausurile":"flauș","flausurilor":"flauș","flaute":["flaute","flaut","flaute","flaută"],"flautei":"flaută","flautele":["flautele","flaut","flautele","flaută"],"flautelor":["flautelor","flaut","flautelor","flaută"],"flautiste":"flautistă","flautistei":"flautistă","flautistele":"flautistă","flautistelor":"flautistă","flautisti":"flautist","flautistii":"flautist","flautistilor":"flautist","flautistul":"flautist","flautistule":"flautist","flautistului":"flautist","flautul":"flaut","flautule":"flaut","flautului":"flaut","flavoane":"flavonă","flavone":"flavonă","flavonei":"flavonă","flavonele":"flavonă","flavonelor":"flavonă","fleacul":"fleac","fleacule":"fleac","fleacului":"fleac","fleacuri":"fleac","fleacurile":"fleac","fleacurilor":"fleac","fleasce":"fleașcă","fleascei":"fleașcă","flebectomia":"flebectomie","flebectomiei":"flebectomie","flebectomii":"flebectomie","flebectomiile":"flebectomie","flebectomiilor":"flebectomie","flebite":"flebită","flebitei":"flebită","flebitele":"flebită","flebitelor":"flebită","flebografia":"flebografie","flebografica":["flebografică","flebografic","flebografica","flebografic"],"flebografice":"flebografic","flebograficele":"flebografic","flebografici":"flebografic","flebograficii":"flebografic","flebograficul":"flebografic","flebografiei":"flebografie","flebografii":"flebografie","flebografiile":"flebografie","flebografiilor":"flebografie","flebograme":"flebogramă","flebogramei":"flebogramă","flebogramele":"flebogramă","flebogramelor":"flebogramă","flebologia":"flebologie","flebologiei":"flebologie","flebologii":"flebologie","fleboscleroze":"fleboscleroză","flebosclerozei":"fleboscleroză","flebosclerozele":"fleboscleroză","flebosclerozelor":"fleboscleroză","flebotomi":"flebotom","flebotomia":"flebotomie","flebotomiei":"flebotomie","flebotomii":["flebotomii","flebotom","flebotomii","flebotomie"],"flebotomiile":"flebotomie","flebotomiilor":"flebotomie","flebotomilor":"flebotom","flebotomul":"flebotom","flebotomule":"flebotom","flebotomului":"flebotom","flecaituri":"flecăitură","flecaiturii":"flecăitură","flecaiturile":"flecăitură","flecaiturilor":"flecăitură","flecara":["flecară","flecar","flecara","flecar"],"flecare":["flecare","flecar","flecare","flecară"],"flecarea":"flecări","flecareai":"flecări","flecaream":"flecări","flecareati":"flecări","flecareau":"flecări","flecarei":"flecară","flecarele":["flecarele","flecar","flecarele","flecară"],"flecareli":"flecăreală","flecarelii":"flecăreală","flecarelile":"flecăreală","flecarelilor":"flecăreală","flecarelor":"flecară","flecaresc":"flecări","flecareste":"flecări","flecaresti":"flecări","flecari":"flecar","flecaria":"flecărie","flecariei":"flecărie","flecarii":["flecarii","flecar","flecării","flecări","flecării","flecărie"],"flecariile":"flecărie","flecariilor":"flecărie","flecarilor":"flecar","flecarim":"flecări","flecarind":"flecări","flecarira":"flecări","flecariram":"flecări","flecarirati":"flecări","flecarise":"flecări","flecarisem":"flecări","flecarisera":"flecări","flecariseram":"flecări","flecariserati":"flecări","flecarisesi":"flecări","flecarisi":"flecări","flecarit":"flecări","flecariti":"flecări","flecarituri":"flecăritură","flecariturii":"flecăritură","flecariturile":"flecăritură","flecariturilor":"flecăritură","flecarnica":["flecarnică","flecarnic","flecarnica","flecarnic"],"flecarnice":"flecarnic","flecarnicele":"flecarnic","flecarnici":"flecarnic","flecarnicii":"flecarnic","flecarnicul":"flecarnic","flecarul":"flecar","flecarule":"flecar","flecarului":"flecar","flectionara":["flecționară","flecționar","flecționara","flecționar"],"flectionare":"flecționar","flectionarele":"flecționar","flectionari":"flecționar","flectionarii":"flecționar","flectionarul":"flecționar","fleculete":"fleculeț","fleculetele":"fleculeț","fleculetelor":"fleculeț","fleculetul":"fleculeț","fleculetule":"fleculeț","fleculetului":"fleculeț","flecustete":"flecușteț","flecustetele":"flecușteț","flecustetelor":"flecușteț","flecustetul":"flecușteț","flecustetule":"flecușteț","flecustetului":"flecușteț","flegmatica":["flegmatică","flegmatic","flegmatica","flegmatic"],"flegmatice":"flegmatic","flegmaticele":"flegmatic","flegmatici":"flegmatic","flegmaticii":"flegmatic","flegmaticul":"flegmatic","flegmazia":"flegmazie","flegmazica":["flegmazică","flegmazic","flegmazica","flegmazic"],"flegmazice":"flegmazic","flegmazicele":"flegmazic","flegmazici":"flegmazic","flegmazicii":"flegmazic","flegmazicul":"flegmazic","flegmaziei":"flegmazie","flegmazii":"flegmazie","flegmaziile":"flegmazie","flegmaziilor":"flegmazie","flegme":"flegmă","flegmei":"flegmă","flegmele":"flegmă","flegmelor":"flegmă","flegmoane":"flegmon","flegmoanele":"flegmon","flegmoanelor":"flegmon","flegmonoasa":["flegmonoasă","flegmonos","flegmonoasa","flegmonos"],"flegmonoase":"flegmonos","flegmonoasele":"flegmonos","flegmonosi":"flegmonos","flegmonosii":"flegmonos","flegmonosul":"flegmonos","flegmonul":"flegmon","flegmonule":"flegmon","flegmonului":"flegmon","fleici":"fleică","fleicii":"fleică","fleicile":"fleică","fleicilor":"fleică","flencanea":"flencăni","flencaneai":"flencăni","flencaneam":"flencăni","flencaneati":"flencăni","flencaneau":"flencăni","flencanesc":"flencăni","flencaneste":"flencăni","flencanesti":"flencăni","flencanii":"flencăni","flencanim":"flencăni","flencanind":"flencăni","flencanira":"flencăni","flencaniram":"flencăni","flencanirati":"flencăni","flencanise":"flencăni","flencanisem":"flencăni","flencanisera":"flencăni","flencaniseram":"flencăni","flencaniserati":"flencăni","flencanisesi":"flencăni","flencanisi":"flencăni","flencanit":"flencăni","flencaniti":"flencăni","flencanituri":"flencănitură","flencaniturii":"flencănitură","flencaniturile":"flencănitură","flencaniturilor":"flencănitură","flenci":"fleancă","flencii":"fleancă","flencile":"fleancă","flencilor":"fleancă","flendre":"fleandră","flendrei":"fleandră","flendrele":"fleandră","flendrelor":"fleandră","flenduroasa":["flenduroasă","flenduros","flenduroasa","flenduros"],"flenduroase":"flenduros","flenduroasele":"flenduros","flendurosi":"flenduros","flendurosii":"flenduros","flendurosul":"flenduros","fleoance":"fleoancă","fleoancei":"fleoancă","fleoancele":"fleoancă","fleoancelor":"fleoancă","fleoarce":"fleoarcă","fleoarcei":"fleoarcă","fleoarcele":"fleoarcă","fleoarcelor":"fleoarcă","flerul":"fler","flerule":"fler","flerului":"fler","fleruri":"fler","flerurile":"fler","flerurilor":"fler","flesaria":"fleșărie","flesariei":"fleșărie","flesarii":"fleșărie","flesariile":"fleșărie","flesariilor":"fleșărie","flescaia":"fleșcăi","flescaiai":"fleșcăi","flescaiam":"fleșcăi","flescaiati":"fleșcăi","flescaiau":"fleșcăi","flescaieli":"fleșcăială","flescaielii":"fleșcăială","flescaielile":"fleșcăială","flescaielilor":"fleșcăială","flescaiesc":"fleșcăi","flescaieste":"fleșcăi","flescaiesti":"fleșcăi","flescaii":"fleșcăi","flescaim":"fleșcăi","flescaind":"fleșcăi","flescaira":"fleșcăi","flescairam":"fleșcăi","flescairati":"fleșcăi","flescaise":"fleșcăi","flescaisem":"fleșcăi","flescaisera":"fleșcăi","flescaiseram":"fleșcăi","flescaiserati":"fleșcăi","flescaisesi":"fleșcăi","flescaisi":"fleșcăi","flescait":"fleșcăi","flescaiti":"fleșcăi","flescaitul":"fleșcăit","flescaitule":"fleșcăit","flescaitului":"fleșcăit","flescaraia":"fleșcăraie","flescaraiei":"fleșcăraie","flescaraii":"fleșcăraie","flescaria":"fleșcărie","flescariei":"fleșcărie","flescarii":"fleșcărie","flescariile":"fleșcărie","flescariilor":"fleșcărie","flese":"fleșă","flesei":"fleșă","flesele":"fleșă","fleselor":"fleșă","fleuroni":"fleuron","fleuronii":"fleuron","fleuronilor":"fleuron","fleuronul":"fleuron","fleuronule":"fleuron","fleuronului":"fleuron","flexibila":["flexibilă","flexibil","flexibila","flexibil"],"flexibile":"flexibil","flexibilele":"flexibil","flexibili":"flexibil","flexibilii":"flexibil","flexibilitatea":"flexibilitate","flexibilitati":"flexibilitate","flexibilitatii":"flexibilitate","flexibilizai":"flexibiliza","flexibilizam":["flexibilizăm","flexibiliza","flexibilizam","flexibiliza"],"flexibilizand":"flexibiliza","flexibilizara":"flexibiliza","flexibilizaram":"flexibiliza","flexibilizarati":"flexibiliza","flexibilizarea":"flexibilizare","flexibilizari":"flexibilizare","flexibilizarii":"flexibilizare","flexibilizarile":"flexibilizare","flexibilizarilor":"flexibilizare","flexibilizase":"flexibiliza","flexibilizasem":"flexibiliza","flexibilizasera":"flexibiliza","flexibilizaseram":"flexibiliza","flexibilizaserati":"flexibiliza","flexibilizasesi":"flexibiliza","flexibilizasi":"flexibiliza","flexibilizat":"flexibiliza","flexibilizata":["flexibilizată","flexibilizat","flexibilizata","flexibilizat"],"flexibilizate":"flexibilizat","flexibilizatele":"flexibilizat","flexibilizati":["flexibilizați","flexibiliza","flexibilizați","flexibilizat"],"flexibilizatii":"flexibilizat","flexibilizatul":"flexibilizat","flexibilizau":"flexibiliza","flexibilizeaza":"flexibiliza","flexibilizez":"flexibiliza","flexibilizezi":"flexibiliza","flexibilul":"flexibil","fleximetre":"fleximetru","fleximetrele":"fleximetru","fleximetrelor":"fleximetru","fleximetruul":"fleximetru","fleximetruule":"fleximetru","fleximetruului":"fleximetru","flexionai":"flexiona","flexionam":["flexionăm","flexiona","flexionam","flexiona"],"flexionand":"flexiona","flexionara":["flexionară","flexiona","flexionară","flexionar","flexionara","flexionar"],"flexionaram":"flexiona","flexionarati":"flexiona","flexionare":"flexionar","flexionarele":"flexionar","flexionari":"flexionar","flexionarii":"flexionar","flexionarul":"flexionar","flexionase":"flexiona","flexionasem":"flexiona","flexionasera":"flexiona","flexionaseram":"flexiona","flexionaserati":"flexiona","flexionasesi":"flexiona","flexionasi":"flexiona","flexionat":"flexiona","flexionati":"flexiona","flexionau":"flexiona","flexioneaza":"flexiona","flexionez":"flexiona","flexionezi":"flexiona","flexiunea":"flexiune","flexiuni":"flexiune","flexiunii":"flexiune","flexiunile":"flexiune","flexiunilor":"flexiune","flexografia":"flexografie","flexografiei":"flexografie","flexografii":"flexografie","flexografiile":"flexografie","flexografiilor":"flexografie","flexuoasa":["flexuoasă","flexuos","flexuoasa","flexuos"],"flexuoase":"flexuos","flexuoasele":"flexuos","flexuosi":"flexuos","flexuosii":"flexuos","flexuosul":"flexuos","flexuozitatati":"flexuozitate","flexuozitatatii":"flexuozitate","flexuozitatatile":"flexuozitate","flexuozitatatilor":"flexuozitate","flexuozitatea":"flexuozitate","flexuri":"flexură","flexurii":"flexură","flexurile":"flexură","flexurilor":"flexură","flibusteria":"flibusterie","flibusteriei":"flibusterie","flibusterii":"flibusterie","flibusteriile":"flibusterie","flibusteriilor":"flibusterie","flibustieri":"flibustier","flibustierii":"flibustier","flibustierilor":"flibustier","flibustierul":"flibustier","flibustierule":"flibustier","flibustierului":"flibustier","flictene":"flictenă","flictenei":"flictenă","flictenele":"flictenă","flictenelor":"flictenă","flictenule":"flictenulă","flictenulei":"flictenulă","flictenulele":"flictenulă","flictenulelor":"flictenulă","fligornul":"fligorn","fligornule":"fligorn","fligornului":"fligorn","fligornuri":"fligorn","fligornurile":"fligorn","fligornurilor":"fligorn","flinte":"flintă","flintei":"flintă","flintele":"flintă","flintelor":"flintă","flintulite":"flintuliță","flintulitei":"flintuliță","flintulitele":"flintuliță","flintulitelor":"flintuliță","flippere":"flipper","flipperele":"flipper","flipperelor":"flipper","flipperul":"flipper","flipperule":"flipper","flipperului":"flipper","flirtai":"flirta","flirtam":["flirtăm","flirta","flirtam","flirta"],"flirtand":"flirta","flirtara":"flirta","flirtaram":"flirta","flirtarati":"flirta","flirtase":"flirta","flirtasem":"flirta","flirtasera":"flirta","flirtaseram":"flirta","flirtaserati":"flirta","flirtasesi":"flirta","flirtasi":"flirta","flirtat":"flirta","flirtati":"flirta","flirtau":"flirta","flirteaza":"flirta","flirtez":"flirta","flirtezi":"flirta","flirtul":"flirt","flirtule":"flirt","flirtului":"flirt","flirturi":"flirt","flirturile":"flirt","flirturilor":"flirt","flisce":"fliscă","fliscei":"fliscă","floara":["floară","flor","floara","flor"],"floare":"flor","floarea":"floare","floarea-soarelui":"floarea soarelui","floarele":"flor","flobafene":"flobafenă","flobafenei":"flobafenă","flobafenele":"flobafenă","flobafenelor":"flobafenă","floc m floc":"floc","flocana":["flocană","flocan","flocana","flocan"],"flocane":"flocan","flocanele":"flocan","flocani":"flocan","flocanii":"flocan","flocanul":"flocan","floci":"floc","flocii":"floc","flocilor":"floc","flocoasa":["flocoasă","flocos","flocoasa","flocos"],"flocoase":"flocos","flocoasele":"flocos","flocosei":"flocoșel","flocoseii":"flocoșel","flocoseilor":"flocoșel","flocosele":"flocoșică","flocoselei":"flocoșică","flocoselele":"flocoșică","flocoselelor":"flocoșică","flocoselul":"flocoșel","flocoselule":"flocoșel","flocoselului":"flocoșel","flocosi":"flocos","flocosii":"flocos","flocosite":"flocoșiță","flocositei":"flocoșiță","flocositele":"flocoșiță","flocositelor":"flocoșiță","flocosul":"flocos","flocsi":"flox","flocsii":"flox","flocsilor":"flox","flocsoare":"flocșor","flocsoarele":"flocșor","flocsoarelor":"flocșor","flocsorul":"flocșor","flocsorule":"flocșor","flocsorului":"flocșor","flocul":"floc","flocularea":"floculare","floculari":"floculare","flocularii":"floculare","flocularile":"floculare","flocularilor":"floculare","floculatia":"floculație","floculatiei":"floculație","floculatii":"floculație","floculatiile":"floculație","floculatiilor":"floculație","flocule":"floc","floculi":"flocul","floculii":"flocul","floculilor":"flocul","flocului":"floc","floculul":"flocul","floculule":"flocul","floculului":"flocul","flocusori":"flocușor","flocusorii":"flocușor","flocusorilor":"flocușor","flocusorul":"flocușor","flocusorule":"flocușor","flocusorului":"flocușor","flocute":"flocuț","flocutele":"flocuț","flocutelor":"flocuț","flocutul":"flocuț","flocutule":"flocuț","flocutului":"flocuț","floemul":"floem","floemule":"floem","floemului":"floem","floemuri":"floem","floemurile":"floem","floemurilor":"floem","flogistica":["flogistică","flogistic","flogistica","flogistic"],"flogistice":"flogistic","flogisticele":"flogistic","flogistici":"flogistic","flogisticii":"flogistic","flogisticul":"flogistic","flogistoane":"flogiston","flogistoanele":"flogiston","flogistoanelor":"flogiston","flogistonul":"flogiston","flogistonule":"flogiston","flogistonului":"flogiston","flogopite":"flogopit","flogopitele":"flogopit","flogopitelor":"flogopit","flogopitul":"flogopit","flogopitule":"flogopit","flogopitului":"flogopit","flogoze":"flogoză","flogozei":"flogoză","flogozele":"flogoză","flogozelor":"flogoză","florala":["florală","floral","florala","floral"],"florale":"floral","floralele":"floral","florali":"floral","floralii":"floral","floralul":"floral","florarese":"florăreasă","floraresei":"florăreasă","floraresele":"florăreasă","florareselor":"florăreasă","florari":"florar","floraria":"florărie","florariei":"florărie","florarii":["florarii","florar","florării","florărie"],"florariile":"florărie","florariilor":"florărie","florarilor":"florar","florarite":"florăriță","floraritei":"florăriță","floraritele":"florăriță","floraritelor":"florăriță","florarul":"florar","florarule":"florar","florarului":"florar","flore":"floră","florealul":"floreal","florealule":"floreal","florealului":"floreal","florei":"floră","florentina":["florentină","florentin","florentina","florentin"],"florentine":"florentin","florentinele":"florentin","florentini":"florentin","florentinii":"florentin","florentinilor":"florentin","florentinul":"florentin","florentinului":"florentin","floreri":"florer","florerii":"florer","florerilor":"florer","florerul":"florer","florerule":"florer","florerului":"florer","florete":"floretă","floretei":"floretă","floretele":"floretă","floretelor":"floretă","floretiste":"floretistă","floretistei":"floretistă","floretistele":"floretistă","floretistelor":"floretistă","floretisti":"floretist","floretistii":"floretist","floretistilor":"floretist","floretistul":"floretist","floretistule":"floretist","floretistului":"floretist","flori":["flori","floare","flori","flor"],"floria":"floriu","floribunda":["floribundă","floribund","floribunda","floribund"],"floribunde":"floribund","floribundele":"floribund","floribundul":"floribund","floribunzi":"floribund","floribunzii":"floribund","floricea":"floricică","floriceaua":"floricea","floricele":["floricele","floricea","floricele","floricică"],"floricelei":["floricelei","floricea","floricelei","floricică"],"floricelele":["floricelele","floricea","floricelele","floricică"],"floricelelor":["floricelelor","floricea","floricelelor","floricică"],"florici":"florică","floricii":"florică","floricile":"florică","floricilor":"florică","floricola":["floricolă","floricol","floricola","floricol"],"floricole":"floricol","floricolele":"floricol","floricoli":"floricol","floricolii":"floricol","floricolul":"floricol","floricultoarea":"floricultoare","floricultoarei":"floricultoare","floricultoarele":"floricultoare","floricultoarelor":"floricultoare","floricultori":"floricultor","floricultorii":"floricultor","floricultorilor":"floricultor","floricultorul":"floricultor","floricultorule":"floricultor","floricultorului":"floricultor","floriculture":"floricultură","floriculturei":"floricultură","florida":["floridă","florid","florida","florid"],"floride":"florid","floridele":"florid","floridul":"florid","florie":"floriu","florifera":["floriferă","florifer","florifera","florifer"],"florifere":"florifer","floriferele":"florifer","floriferi":"florifer","floriferii":"florifer","floriferul":"florifer","florii":["florii","floare","florii","flor","florii","floriu"],"floriii":"floriu","floriile":["floriile","Florii","floriile","floriu"],"floriilor":"Florii","florile":"floare","florile soarelui":"floarea soarelui","florilegii":"florilegiu","florilegiile":"florilegiu","florilegiilor":"florilegiu","florilegiuul":"florilegiu","florilegiuule":"florilegiu","florilegiuului":"florilegiu","florilor":"floare","florin":"Florina","florina":"Florin","florinciori":"florincior","florinciorii":"florincior","florinciorilor":"florincior","florinciorul":"florincior","florinciorule":"florincior","florinciorului":"florincior","florinei":"Florina","florini":"florin","florinii":"florin","florinilor":"florin","florintei":"florințel","florinteii":"florințel","florinteilor":"florințel","florintelul":"florințel","florintelule":"florințel","florintelului":"florințel","florinteul":"florinte","florinteule":"florinte","florinteului":"florinte","florinti":["florinți","florint","florinți","florinte"],"florintii":["florinții","florint","florinții","florinte"],"florintilor":["florinților","florint","florinților","florinte"],"florintul":"florint","florintule":"florint","florintului":"florint","florinul":"florin","florinule":"florin","florinului":"florin","florioare":"florioară","florioarei":"florioară","florioarele":"florioară","florioarelor":"florioară","florisoare":"florișoară","florisoarei":"florișoară","florisoarele":"florișoară","florisoarelor":"florișoară","floriste":"floristă","floristei":"floristă","floristele":"floristă","floristelor":"floristă","floristi":"florist","floristica":["floristică","floristic","floristica","floristic"],"floristice":"floristic","floristicele":"floristic","floristici":"floristic","floristicii":"floristic","floristicul":"floristic","floristii":"florist","floristilor":"florist","floristul":"florist","floristule":"florist","floristului":"florist","floriul":"floriu","florizi":"florid","florizii":"florid","floroglucine":"floroglucină","floroglucinei":"floroglucină","floroglucinele":"floroglucină","floroglucinelor":"floroglucină","florul":"flor","flotabila":["flotabilă","flotabil","flotabila","flotabil"],"flotabile":"flotabil","flotabilele":"flotabil","flotabili":"flotabil","flotabilii":"flotabil","flotabilitatea":"flotabilitate","flotabilitati":"flotabilitate","flotabilitatii":"flotabilitate","flotabilul":"flotabil","flotai":"flota","flotam":["flotăm","flota","flotam","flota"],"flotand":"flota","flotanta":["flotantă","flotant","flotanta","flotant"],"flotante":"flotant","flotantele":"flotant","flotanti":"flotant","flotantii":"flotant","flotantul":"flotant","flotara":"flota","flotaram":"flota","flotarati":"flota","flotarea":"flotare","flotari":"flotare","flotarii":"flotare","flotarile":"flotare","flotarilor":"flotare","flotase":"flota","flotasem":"flota","flotasera":"flota","flotaseram":"flota","flotaserati":"flota","flotasesi":"flota","flotasi":"flota","flotat":"flota","flotati":"flota","flotatia":"flotație","flotatiei":"flotație","flotatii":"flotație","flotatiile":"flotație","flotatiilor":"flotație","flotau":"flota","flote":"flotă","floteaza":"flota","flotei":"flotă","flotele":"flotă","flotelor":"flotă","flotez":"flota","flotezi":"flota","flotilasi":"flotilaș","flotilasii":"flotilaș","flotilasilor":"flotilaș","flotilasul":"flotilaș","flotilasule":"flotilaș","flotilasului":"flotilaș","flotile":"flotilă","flotilei":"flotilă","flotilele":"flotilă","flotilelor":"flotilă","flotoare":"flotor","flotoarele":"flotor","flotoarelor":"flotor","flotorul":"flotor","flotorule":"flotor","flotorului":"flotor","floxul":"flox","floxule":"flox","floxului":"flox","fluati":"fluat","fluatii":"fluat","fluatilor":"fluat","fluatul":"fluat","fluatule":"fluat","fluatului":"fluat","fluctuai":"fluctua","fluctuam":["fluctuăm","fluctua","fluctuam","fluctua"],"fluctuand":"fluctua","fluctuanta":["fluctuantă","fluctuant","fluctuanta","fluctuant"],"fluctuante":"fluctuant","fluctuantele":"fluctuant","fluctuanti":"fluctuant","fluctuantii":"fluctuant","fluctuantul":"fluctuant","fluctuara":"fluctua","fluctuaram":"fluctua","fluctuarati":"fluctua","fluctuarea":"fluctuare","fluctuari":"fluctuare","fluctuarii":"fluctuare","fluctuarile":"fluctuare","fluctuarilor":"fluctuare","fluctuase":"fluctua","fluctuasem":"fluctua","fluctuasera":"fluctua","fluctuaseram":"fluctua","fluctuaserati":"fluctua","fluctuasesi":"fluctua","fluctuasi":"fluctua","fluctuat":"fluctua","fluctuati":"fluctua","fluctuatia":"fluctuație","fluctuatiei":"fluctuație","fluctuatii":"fluctuație","fluctuatiile":"fluctuație","fluctuatiilor":"fluctuație","fluctuatiunea":"fluctuațiune","fluctuatiuni":"fluctuațiune","fluctuatiunii":"fluctuațiune","fluctuatiunile":"fluctuațiune","fluctuatiunilor":"fluctuațiune","fluctuau":"fluctua","fluctueaza":"fluctua","fluctuez":"fluctua","fluctueze":"fluctua","fluctuezi":"fluctua","fludorul":"fludor","fludorule":"fludor","fludorului":"fludor","fluenta":["fluentă","fluent","fluenta","fluent"],"fluente":["fluente","fluent","fluențe","fluență"],"fluentei":"fluență","fluentele":["fluentele","fluent","fluențele","fluență"],"fluentelor":"fluență","fluenti":"fluent","fluentii":"fluent","fluentul":"fluent","fluida":["fluidă","fluid","fluida","fluid"],"fluidala":["fluidală","fluidal","fluidala","fluidal"],"fluidale":"fluidal","fluidalele":"fluidal","fluidali":"fluidal","fluidalii":"fluidal","fluidalul":"fluidal","fluide":"fluid","fluide de frana":"fluid de frână","fluidele":"fluid","fluidica":["fluidică","fluidic","fluidica","fluidic"],"fluidice":"fluidic","fluidicele":"fluidic","fluidici":"fluidic","fluidicii":"fluidic","fluidicul":"fluidic","fluidific":"fluidifica","fluidificai":"fluidifica","fluidificam":["fluidificăm","fluidifica","fluidificam","fluidifica"],"fluidificand":"fluidifica","fluidificara":"fluidifica","fluidificaram":"fluidifica","fluidificarati":"fluidifica","fluidificarea":"fluidificare","fluidificari":"fluidificare","fluidificarii":"fluidificare","fluidificarile":"fluidificare","fluidificarilor":"fluidificare","fluidificase":"fluidifica","fluidificasem":"fluidifica","fluidificasera":"fluidifica","fluidificaseram":"fluidifica","fluidificaserati":"fluidifica","fluidificasesi":"fluidifica","fluidificasi":"fluidifica","fluidificat":"fluidifica","fluidificati":"fluidifica","fluidificau":"fluidifica","fluidifice":"fluidifica","fluidifici":"fluidifica","fluiditatea":"fluiditate","fluiditati":"fluiditate","fluiditatii":"fluiditate","fluidizai":"fluidiza","fluidizam":["fluidizăm","fluidiza","fluidizam","fluidiza"],"fluidizand":"fluidiza","fluidizanti":"fluidizant","fluidizantii":"fluidizant","fluidizantilor":"fluidizant","fluidizantul":"fluidizant","fluidizantule":"fluidizant","fluidizantului":"fluidizant","fluidizara":"fluidiza","fluidizaram":"fluidiza","fluidizarati":"fluidiza","fluidizarea":"fluidizare","fluidizari":"fluidizare","fluidizarii":"fluidizare","fluidizarile":"fluidizare","fluidizarilor":"fluidizare","fluidizase":"fluidiza","fluidizasem":"fluidiza","fluidizasera":"fluidiza","fluidizaseram":"fluidiza","fluidizaserati":"fluidiza","fluidizasesi":"fluidiza","fluidizasi":"fluidiza","fluidizat":"fluidiza","fluidizata":["fluidizată","fluidizat","fluidizata","fluidizat"],"fluidizate":"fluidizat","fluidizatele":"fluidizat","fluidizati":["fluidizați","fluidiza","fluidizați","fluidizat"],"fluidizatii":"fluidizat","fluidizatul":"fluidizat","fluidizau":"fluidiza","fluidizeaza":"fluidiza","fluidizez":"fluidiza","fluidizezi":"fluidiza","fluidizoare":"fluidizor","fluidizoarele":"fluidizor","fluidizoarelor":"fluidizor","fluidizorul":"fluidizor","fluidizorule":"fluidizor","fluidizorului":"fluidizor","fluidul":"fluid","fluier":"fluiera","fluierai":"fluiera","fluieram":["fluierăm","fluiera","fluieram","fluiera"],"fluierand":"fluiera","fluierara":"fluiera","fluieraram":"fluiera","fluierarati":"fluiera","fluierarea":"fluierare","fluierari":["fluierari","fluierar","fluierări","fluierare"],"fluierari cu picioare rosii":"fluierar cu picioare roșii","fluierari cu picioare verzi":"fluierar cu picioare verzi","fluierari cu piept galbui":"fluierar cu piept gălbui","fluierari de lac":"fluierar de lac","fluierari de mlastina":"fluierar de mlaștină","fluierari de munte":"fluierar de munte","fluierari de zavoi":"fluierar de zăvoi","fluierari negri":"fluierar negru","fluierari suri":"fluierar sur","fluierarii":["fluierarii","fluierar","fluierării","fluierare"],"fluierarile":"fluierare","fluierarilor":["fluierarilor","fluierar","fluierărilor","fluierare"],"fluierarul":"fluierar","fluierarule":"fluierar","fluierarului":"fluierar","fluierase":["fluierase","fluiera","fluierașe","fluieraș"],"fluierasele":"fluieraș","fluieraselor":"fluieraș","fluierasem":"fluiera","fluierasera":"fluiera","fluieraseram":"fluiera","fluieraserati":"fluiera","fluierasesi":"fluiera","fluierasi":"fluiera","fluierasul":"fluieraș","fluierasule":"fluieraș","fluierasului":"fluieraș","fluierat":"fluiera","fluierat in biserica":"fluiera în biserică","fluierati":"fluiera","fluieratoara":"fluierător","fluieratoare":"fluierător","fluieratoarele":"fluierător","fluieratori":"fluierător","fluieratorii":"fluierător","fluieratorul":"fluierător","fluieratul":"fluierat","fluieratule":"fluierat","fluieratului":"fluierat","fluieraturi":["fluierături","fluierat","fluieraturi","fluierat","fluierături","fluierătură"],"fluieraturii":"fluierătură","fluieraturile":["fluieraturile","fluierat","fluierăturile","fluierătură"],"fluieraturilor":["fluieraturilor","fluierat","fluierăturilor","fluierătură"],"fluierau":"fluiera","fluiere":["fluiere","fluier","fluiere","fluiera","fluiere","fluieră"],"fluierei":"fluieră","fluierele":["fluierele","fluier","fluierele","fluieră"],"fluierelor":["fluierelor","fluier","fluierelor","fluieră"],"fluieri":"fluiera","fluiericea":"fluierice","fluierici":"fluierice","fluiericii":"fluierice","fluiericile":"fluierice","fluiericilor":"fluierice","fluierite":"fluieriță","fluieritei":"fluieriță","fluieritele":"fluieriță","fluieritelor":"fluieriță","fluieroaie":"fluieroi","fluieroaiele":"fluieroi","fluieroaielor":"fluieroi","fluieroasa":["fluieroasă","fluieros","fluieroasa","fluieros"],"fluieroase":"fluieros","fluieroasele":"fluieros","fluieroiul":"fluieroi","fluieroiule":"fluieroi","fluieroiului":"fluieroi","fluierosi":"fluieros","fluierosii":"fluieros","fluierosul":"fluieros","fluierul":"fluier","fluierule":"fluier","fluierului":"fluier","fluizi":"fluid","fluizii":"fluid","fluometre":"fluometru","fluometrele":"fluometru","fluometrelor":"fluometru","fluometruul":"fluometru","fluometruule":"fluometru","fluometruului":"fluometru","fluoresceine":"fluoresceină","fluoresceinei":"fluoresceină","fluoresceinele":"fluoresceină","fluoresceinelor":"fluoresceină","fluorescenta":["fluorescentă","fluorescent","fluorescenta","fluorescent"],"fluorescente":["fluorescente","fluorescent","fluorescențe","fluorescență"],"fluorescentei":"fluorescență","fluorescentele":["fluorescentele","fluorescent","fluorescențele","fluorescență"],"fluorescentelor":"fluorescență","fluorescenti":"fluorescent","fluorescentii":"fluorescent","fluorescentul":"fluorescent","fluorhidrica":["fluorhidrică","fluorhidric","fluorhidrica","fluorhidric"],"fluorhidrice":"fluorhidric","fluorhidricele":"fluorhidric","fluorhidrici":"fluorhidric","fluorhidricii":"fluorhidric","fluorhidricul":"fluorhidric","fluorimetre":"fluorimetru","fluorimetrele":"fluorimetru","fluorimetrelor":"fluorimetru","fluorimetrul":"fluorimetru","fluorimetrule":"fluorimetru","fluorimetrului":"fluorimetru","fluorine":"fluorină","fluorinei":"fluorină","fluorizai":"fluoriza","fluorizam":["fluorizăm","fluoriza","fluorizam","fluoriza"],"fluorizand":"fluoriza","fluorizara":"fluoriza","fluorizaram":"fluoriza","fluorizarati":"fluoriza","fluorizarea":"fluorizare","fluorizari":"fluorizare","fluorizarii":"fluorizare","fluorizarile":"fluorizare","fluorizarilor":"fluorizare","fluorizase":"fluoriza","fluorizasem":"fluoriza","fluorizasera":"fluoriza","fluorizaseram":"fluoriza","fluorizaserati":"fluoriza","fluorizasesi":"fluoriza","fluorizasi":"fluoriza","fluorizat":"fluoriza","fluorizati":"fluoriza","fluorizau":"fluoriza","fluorizeaza":"fluoriza","fluorizez":"fluoriza","fluorizezi":"fluoriza","fluorografia":"fluorografie","fluorografiei":"fluorografie","fluorografii":"fluorografie","fluorografiile":"fluorografie","fluorografiilor":"fluorografie","fluorometre":"fluorometru","fluorometrele":"fluorometru","fluorometrelor":"fluorometru","fluorometria":"fluorometrie","fluorometrica":["fluorometrică","fluorometric","fluorometrica","fluorometric"],"fluorometrice":"fluorometric","fluorometricele":"fluorometric","fluorometrici":"fluorometric","fluorometricii":"fluorometric","fluorometricul":"fluorometric","fluorometriei":"fluorometrie","fluorometrii":"fluorometrie","fluorometriile":"fluorometrie","fluorometriilor":"fluorometrie","fluorometruul":"fluorometru","fluorometruule":"fluorometru","fluorometruului":"fluorometru","fluoroscoape":"fluoroscop","fluoroscoapele":"fluoroscop","fluoroscoapelor":"fluoroscop","fluoroscopia":"fluoroscopie","fluoroscopiei":"fluoroscopie","fluoroscopii":"fluoroscopie","fluoroscopiile":"fluoroscopie","fluoroscopiilor":"fluoroscopie","fluoroscopul":"fluoroscop","fluoroscopule":"fluoroscop","fluoroscopului":"fluoroscop","fluoroze":"fluoroză","fluorozei":"fluoroză","fluorozele":"fluoroză","fluorozelor":"fluoroză","fluorul":"fluor","fluorule":"fluor","fluorului":"fluor","fluorurata":["fluorurată","fluorurat","fluorurata","fluorurat"],"fluorurate":"fluorurat","fluoruratele":"fluorurat","fluorurati":"fluorurat","fluoruratii":"fluorurat","fluoruratul":"fluorurat","fluoruri":"fluorură","fluorurii":"fluorură","fluorurile":"fluorură","fluorurilor":"fluorură","flustur":"fluștura","flusturai":"fluștura","flusturam":["flușturăm","fluștura","flușturam","fluștura"],"flusturand":"fluștura","flusturara":"fluștura","flusturaram":"fluștura","flusturarati":"fluștura","flusturase":"fluștura","flusturasem":"fluștura","flusturasera":"fluștura","flusturaseram":"fluștura","flusturaserati":"fluștura","flusturasesi":"fluștura","flusturasi":"fluștura","flusturat":"fluștura","flusturateca":["flușturatecă","flușturatec","flușturateca","flușturatec"],"flusturatece":"flușturatec","flusturatecele":"flușturatec","flusturateci":"flușturatec","flusturatecii":"flușturatec","flusturatecul":"flușturatec","flusturati":"fluștura","flusturatica":["flușturatică","flușturatic","flușturatica","flușturatic"],"flusturatice":["flușturatice","flușturatic","flușturatice","flușturatică"],"flusturaticei":"flușturatică","flusturaticele":["flușturaticele","flușturatic","flușturaticele","flușturatică"],"flusturaticelor":"flușturatică","flusturatici":"flușturatic","flusturaticii":"flușturatic","flusturaticul":"flușturatic","flusturau":"fluștura","flusturi":"fluștura","flutur":["flutur","flutura","flutur","fluture"],"fluturai":"flutura","fluturam":["fluturăm","flutura","fluturam","flutura"],"fluturand":"flutura","fluturara":"flutura","fluturaram":"flutura","fluturarati":"flutura","fluturarea":"fluturare","fluturari":"fluturare","fluturarii":"fluturare","fluturarile":"fluturare","fluturarilor":"fluturare","fluturase":"flutura","fluturasem":"flutura","fluturasera":"flutura","fluturaseram":"flutura","fluturaserati":"flutura","fluturasesi":"flutura","fluturasi":["fluturași","flutura","fluturași","fluturaș"],"fluturasi de stanca":"fluturaș de stâncă","fluturasii":"fluturaș","fluturasilor":"fluturaș","fluturasul":"fluturaș","fluturasule":"fluturaș","fluturasului":"fluturaș","fluturat":"flutura","fluturateca":["fluturatecă","fluturatec","fluturateca","fluturatec"],"fluturatece":"fluturatec","fluturatecele":"fluturatec","fluturateci":"fluturatec","fluturatecii":"fluturatec","fluturatecul":"fluturatec","fluturati":"flutura","fluturatica":["fluturatică","fluturatic","fluturatica","fluturatic"],"fluturatice":["fluturatice","fluturatic","fluturatice","fluturatică"],"fluturaticei":"fluturatică","fluturaticele":["fluturaticele","fluturatic","fluturaticele","fluturatică"],"fluturaticelor":"fluturatică","fluturatici":"fluturatic","fluturaticii":"fluturatic","fluturaticilor":"fluturatic","fluturaticul":"fluturatic","fluturaticule":"fluturatic","fluturaticului":"fluturatic","fluturatoare":"fluturător","fluturatoarea":"fluturător","fluturatoarele":"fluturător","fluturatori":"fluturător","fluturatorii":"fluturător","fluturatorul":"fluturător","fluturatul":"fluturat","fluturatule":"fluturat","fluturatului":"fluturat","fluturau":"flutura","fluturei":"fluturel","fluturele":"fluture","flutureli":"fluturel","fluturelii":"fluturel","fluturelilor":"fluturel","fluturelui":"fluture","fluturelul":"fluturel","fluturelule":"fluturel","fluturelului":"fluturel","fluturi":["fluturi","flutur","fluturi","flutura","fluturi","fluture"],"fluturii":["fluturii","flutur","fluturii","fluture"],"fluturilor":["fluturilor","flutur","fluturilor","fluture"],"fluturul":"flutur","fluturule":"flutur","fluturului":"flutur","fluviala":["fluvială","fluvial","fluviala","fluvial"],"fluviale":"fluvial","fluvialele":"fluvial","fluviali":"fluvial","fluvialii":"fluvial","fluvialul":"fluvial","fluviatila":["fluviatilă","fluviatil","fluviatila","fluviatil"],"fluviatile":"fluviatil","fluviatilele":"fluviatil","fluviatili":"fluviatil","fluviatilii":"fluviatil","fluviatilul":"fluviatil","fluvii":"fluviu","fluviile":"fluviu","fluviilor":"fluviu","fluviometre":"fluviometru","fluviometrele":"fluviometru","fluviometrelor":"fluviometru","fluviometrica":["fluviometrică","fluviometric","fluviometrica","fluviometric"],"fluviometrice":"fluviometric","fluviometricele":"fluviometric","fluviometrici":"fluviometric","fluviometricii":"fluviometric","fluviometricul":"fluviometric","fluviometrul":"fluviometru","fluviometrule":"fluviometru","fluviometrului":"fluviometru","fluviul":"fluviu","fluviule":"fluviu","fluviului":"fluviu","fluxiunea":"fluxiune","fluxiuni":"fluxiune","fluxiunii":"fluxiune","fluxiunile":"fluxiune","fluxiunilor":"fluxiune","fluxmetre":"fluxmetru","fluxmetrele":"fluxmetru","fluxmetrelor":"fluxmetru","fluxmetrul":"fluxmetru","fluxmetrule":"fluxmetru","fluxmetrului":"fluxmetru","fluxul":"flux","fluxule":"flux","fluxului":"flux","fluxuri":"flux","fluxuri luminoase":"flux luminos","fluxuri magnetice":"flux magnetic","fluxurile":"flux","fluxurilor":"flux","fmi-ul":"FMI","fmi-ule":"FMI","fmi-ului":"FMI","foacalele":"foacăle","foacalelor":"foacăle","foaci":"foac","foacii":"foac","foacilor":"foac","foacul":"foac","foacule":"foac","foacului":"foac","foaia":"foaie","foaiere":"foaier","foaierele":"foaier","foaierelor":"foaier","foaierul":"foaier","foaierule":"foaier","foaierului":"foaier","foaite":"foaită","foaitei":"foaită","foaitele":"foaită","foaitelor":"foaită","foalele":"foale","foalelor":"foale","foalelui":"foale","foalesa":["foaleșă","foaleș","foaleșa","foaleș"],"foalese":"foaleș","foalesele":"foaleș","foalesi":"foaleș","foalesii":"foaleș","foalesul":"foaleș","foaltinele":"foaltine","foaltinelor":"foaltine","foamea":"foame","foamei":"foame","foametea":"foamete","foametei":"foamete","foametele":"foamete","foametelor":"foamete","foarfec":"forfeca","foarfeca":["foarfecă","foarfece","foarfecă","forfeca"],"foarfece":["foarfece","foarfecă","foarfece","forfeca"],"foarfeci":["foarfeci","foarfec","foarfeci","foarfecă","foarfeci","forfeca"],"foarfecii":"foarfec","foarfecilor":"foarfec","foarfecul":"foarfec","foarfecule":"foarfec","foarfecului":"foarfec","foastane":"foastăn","foastanele":"foastăn","foastanelor":"foastăn","foastanul":"foastăn","foastanule":"foastăn","foastanului":"foastăn","fobia":"fobie","fobica":["fobică","fobic","fobica","fobic"],"fobice":"fobic","fobicele":"fobic","fobici":"fobic","fobicii":"fobic","fobicul":"fobic","fobiei":"fobie","fobii":"fobie","fobiile":"fobie","fobiilor":"fobie","foburgul":"foburg","foburgule":"foburg","foburgului":"foburg","focala":["focală","focal","focala","focal"],"focale":"focal","focalele":"focal","focali":"focal","focalii":"focal","focalizai":"focaliza","focalizam":["focalizăm","focaliza","focalizam","focaliza"],"focalizand":"focaliza","focalizara":"focaliza","focalizaram":"focaliza","focalizarati":"focaliza","focalizarea":"focalizare","focalizari":"focalizare","focalizarii":"focalizare","focalizarile":"focalizare","focalizarilor":"focalizare","focalizase":"focaliza","focalizasem":"focaliza","focalizasera":"focaliza","focalizaseram":"focaliza","focalizaserati":"focaliza","focalizasesi":"focaliza","focalizasi":"focaliza","focalizat":"focaliza","focalizati":"focaliza","focalizatia":"focalizație","focalizatiei":"focalizație","focalizatii":"focalizație","focalizatiile":"focalizație","focalizatiilor":"focalizație","focalizau":"focaliza","focalizeaza":"focaliza","focalizez":"focaliza","focalizezi":"focaliza","focalul":"focal","focare":"focar","focare seismice":"focar seismic","focare virtuale":"focar virtual","focarele":"focar","focarelor":"focar","focari":"focar","focarii":"focar","focarilor":"focar","focarul":"focar","focarule":"focar","focarului":"focar","fochisti":"fochist","fochistii":"fochist","fochistilor":"fochist","fochistul":"fochist","fochistule":"fochist","fochistului":"fochist","foci":"focă","focii":"focă","focile":"focă","focilor":"focă","focoasa":["focoasă","focos","focoasa","focos"],"focoase":"focos","focoasele":"focos","focomeli":"focomel","focomelia":"focomelie","focomeliei":"focomelie","focomelii":["focomelii","focomel","focomelii","focomelie"],"focomelilor":"focomel","focomelul":"focomel","focomelule":"focomel","focomelului":"focomel","focometre":"focometru","focometrele":"focometru","focometrelor":"focometru","focometria":"focometrie","focometriei":"focometrie","focometrii":"focometrie","focometrul":"focometru","focometrule":"focometru","focometrului":"focometru","focosi":"focos","focosii":"focos","focosul":"focos","focsaneanul":"focșănean","focsaneanule":"focșănean","focsaneanului":"focșănean","focsanence":"focșăneancă","focsanencei":"focșăneancă","focsanencele":"focșăneancă","focsanencelor":"focșăneancă","focsanene":"focșăneană","focsanenei":"focșăneană","focsanenele":"focșăneană","focsanenelor":"focșăneană","focsaneni":"focșănean","focsanenii":"focșănean","focsanenilor":"focșănean","focsi":"fox","focsii":"fox","focsilor":"fox","focsoare":"focșor","focsoarele":"focșor","focsoarelor":"focșor","focsorele":"focșorel","focsorelele":"focșorel","focsorelelor":"focșorel","focsorelul":"focșorel","focsorelule":"focșorel","focsorelului":"focșorel","focsorul":"focșor","focsorule":"focșor","focsorului":"focșor","focul":"foc","focule":"foc","foculete":"foculeț","foculetele":"foculeț","foculetelor":"foculeț","foculetul":"foculeț","foculetule":"foculeț","foculetului":"foculeț","focului":"foc","focurelul":"focurel","focurelule":"focurel","focurelului":"focurel","focuri":"foc","focuri bengale":"foc bengal","focuri de arma":"foc de armă","focuri de artificii":"foc de artificii","focurile":"foc","focurilor":"foc","focusoare":"focușor","focusore":"focușor","focusorele":"focușor","focusorelor":"focușor","focusorul":"focușor","focusorule":"focușor","focusorului":"focușor","focusul":"focus","focusule":"focus","focusului":"focus","focusuri":"focus","focusurile":"focus","focusurilor":"focus","focute":"focuț","focutele":"focuț","focutelor":"focuț","focutul":"focuț","focutule":"focuț","focutului":"focuț","fodorite":"fodoriță","fodoritei":"fodoriță","fodoritele":"fodoriță","fodoritelor":"fodoriță","fodorminte":"fodormintă","fodormintei":"fodormintă","fodormintele":"fodormintă","fodormintelor":"fodormintă","foehnul":"foehn","foehnule":"foehn","foehnului":"foehn","foehnuri":"foehn","foehnurile":"foehn","foehnurilor":"foehn","foeti":"foeț","foetii":"foeț","foetilor":"foeț","foetul":"foeț","foetule":"foeț","foetului":"foeț","fofeze":"fofează","fofezei":"fofează","fofezele":"fofează","fofezelor":"fofează","fofilai":"fofila","fofilam":["fofilăm","fofila","fofilam","fofila"],"fofiland":"fofila","fofilara":"fofila","fofilaram":"fofila","fofilarati":"fofila","fofilarea":"fofilare","fofilari":"fofilare","fofilarii":"fofilare","fofilarile":"fofilare","fofilarilor":"fofilare","fofilase":"fofila","fofilasem":"fofila","fofilasera":"fofila","fofilaseram":"fofila","fofilaserati":"fofila","fofilasesi":"fofila","fofilasi":"fofila","fofilat":"fofila","fofilati":"fofila","fofilau":"fofila","fofileaza":"fofila","fofilez":"fofila","fofilezi":"fofila","fofoloage":"fofoloagă","fofoloagei":"fofoloagă","fofoloagele":"fofoloagă","fofoloagelor":"fofoloagă","fofoloance":"fofoloancă","fofoloancei":"fofoloancă","fofoloancele":"fofoloancă","fofoloancelor":"fofoloancă","fofologa":["fofologă","fofolog","fofologa","fofolog"],"fofologe":["fofologe","fofolog","fofologe","fofologă"],"fofologei":"fofologă","fofologele":["fofologele","fofolog","fofologele","fofologă"],"fofologelor":"fofologă","fofologi":"fofolog","fofologii":"fofolog","fofologilor":"fofolog","fofologul":"fofolog","fofologule":"fofolog","fofologului":"fofolog","fogaluita":["fogăluită","fogăluit","fogăluita","fogăluit"],"fogaluite":"fogăluit","fogaluitele":"fogăluit","fogaluiti":"fogăluit","fogaluitii":"fogăluit","fogaluitul":"fogăluit","fogase":"fogaș","fogasele":"fogaș","fogaselor":"fogaș","fogasul":"fogaș","fogasule":"fogaș","fogasului":"fogaș","fohn":"foehn","foi":"foaie","foi de calcul":"foaie de calcul","foi de dafin":"foaie de dafin","foi volante":"foaie volantă","foia":"foi","foiai":"foi","foiam":"foi","foiati":"foi","foiau":"foi","foiceaua":"foicea","foicele":["foicele","foicea","foicele","foicică"],"foicelei":["foicelei","foicea","foicelei","foicică"],"foicelele":["foicelele","foicea","foicelele","foicică"],"foicelelor":["foicelelor","foicea","foicelelor","foicică"],"foiele":"foială","foielei":"foială","foielele":"foială","foielelor":"foială","foieli":"foială","foiesc":"foi","foieste":"foi","foiesti":"foi","foii":["foii","foaie","foii","foi"],"foile":"foaie","foilene":"foileană","foilenei":"foileană","foilenele":"foileană","foilenelor":"foileană","foiletai":"foileta","foiletam":["foiletăm","foileta","foiletam","foileta"],"foiletand":"foileta","foiletara":"foileta","foiletaram":"foileta","foiletarati":"foileta","foiletase":"foileta","foiletasem":"foileta","foiletasera":"foileta","foiletaseram":"foileta","foiletaserati":"foileta","foiletasesi":"foileta","foiletasi":"foileta","foiletat":"foileta","foiletati":"foileta","foiletau":"foileta","foileteaza":"foileta","foiletez":"foileta","foiletezi":"foileta","foiletoane":"foileton","foiletoanele":"foileton","foiletoanelor":"foileton","foiletoniste":"foiletonistă","foiletonistei":"foiletonistă","foiletonistele":"foiletonistă","foiletonistelor":"foiletonistă","foiletonisti":"foiletonist","foiletonistica":["foiletonistică","foiletonistic","foiletonistica","foiletonistic"],"foiletonistice":"foiletonistic","foiletonisticele":"foiletonistic","foiletonistici":"foiletonistic","foiletonisticii":"foiletonistic","foiletonisticul":"foiletonistic","foiletonistii":"foiletonist","foiletonistilor":"foiletonist","foiletonistul":"foiletonist","foiletonistule":"foiletonist","foiletonistului":"foiletonist","foiletonul":"foileton","foiletonule":"foileton","foiletonului":"foileton","foilite":"foiliță","foilitei":"foiliță","foilitele":"foiliță","foilitelor":"foiliță","foilor":"foaie","foim":"foi","foind":"foi","foioare":"foioară","foioarei":"foioară","foioarele":"foioară","foioarelor":"foioară","foioasa":["foioasă","foios","foioasa","foios"],"foioase":["foioase","foioasă","foioase","foios"],"foioasei":"foioasă","foioasele":["foioasele","foioasă","foioasele","foios"],"foioaselor":"foioasă","foiosi":"foios","foiosii":"foios","foiosul":"foios","foira":"foi","foiram":"foi","foirati":"foi","foirea":"foire","foiri":"foire","foirii":"foire","foirile":"foire","foirilor":"foire","foise":"foi","foisem":"foi","foisera":"foi","foiseram":"foi","foiserati":"foi","foisesi":"foi","foisi":"foi","foisoare":["foișoare","foișoară","foișoare","foișor"],"foisoare de foc":"foișor de foc","foisoarei":"foișoară","foisoarele":["foișoarele","foișoară","foișoarele","foișor"],"foisoarelor":["foișoarelor","foișoară","foișoarelor","foișor"],"foisorul":"foișor","foisorule":"foișor","foisorului":"foișor","foit":"foi","foitaje":"foitaj","foitajele":"foitaj","foitajelor":"foitaj","foitajul":"foitaj","foitajule":"foitaj","foitajului":"foitaj","foite":"foiță","foitei":"foiță","foitele":["foițele","foiță","foițele","foițică"],"foitelei":"foițică","foitelele":"foițică","foitelelor":"foițică","foitelor":"foiță","foiti":"foi","folcei":"folcel","folceii":"folcel","folceilor":"folcel","folcelul":"folcel","folcelule":"folcel","folcelului":"folcel","folclorica":["folclorică","folcloric","folclorica","folcloric"],"folclorice":"folcloric","folcloricele":"folcloric","folclorici":"folcloric","folcloricii":"folcloric","folcloricul":"folcloric","folclorismul":"folclorism","folclorismule":"folclorism","folclorismului":"folclorism","folcloriste":"folcloristă","folcloristei":"folcloristă","folcloristele":"folcloristă","folcloristelor":"folcloristă","folcloristi":"folclorist","folcloristica":["folcloristică","folcloristic","folcloristica","folcloristic"],"folcloristice":["folcloristice","folcloristic","folcloristice","folcloristică"],"folcloristicei":"folcloristică","folcloristicele":["folcloristicele","folcloristic","folcloristicele","folcloristică"],"folcloristicelor":"folcloristică","folcloristici":"folcloristic","folcloristicii":"folcloristic","folcloristicul":"folcloristic","folcloristii":"folclorist","folcloristilor":"folclorist","folcloristul":"folclorist","folcloristule":"folclorist","folcloristului":"folclorist","folclorul":"folclor","folclorule":"folclor","folclorului":"folclor","folfaia":"folfăi","folfaiai":"folfăi","folfaiam":"folfăi","folfaiati":"folfăi","folfaiau":"folfăi","folfaiesc":"folfăi","folfaieste":"folfăi","folfaiesti":"folfăi","folfaii":"folfăi","folfaim":"folfăi","folfaind":"folfăi","folfaira":"folfăi","folfairam":"folfăi","folfairati":"folfăi","folfaise":"folfăi","folfaisem":"folfăi","folfaisera":"folfăi","folfaiseram":"folfăi","folfaiserati":"folfăi","folfaisesi":"folfăi","folfaisi":"folfăi","folfait":"folfăi","folfaiti":"folfăi","folia":"folie","foliacee":"foliaceu","foliaceea":"foliaceu","foliaceele":"foliaceu","foliacei":"foliaceu","foliaceii":"foliaceu","foliaceul":"foliaceu","foliante":"foliant","foliantele":"foliant","foliantelor":"foliant","foliantul":"foliant","foliantule":"foliant","foliantului":"foliant","foliara":["foliară","foliar","foliara","foliar"],"foliare":"foliar","foliarele":"foliar","foliari":"foliar","foliarii":"foliar","foliarul":"foliar","foliata":["foliată","foliat","foliata","foliat"],"foliate":"foliat","foliatele":"foliat","foliati":"foliat","foliatia":"foliație","foliatiei":"foliație","foliatii":["foliații","foliat","foliații","foliație"],"foliatiile":"foliație","foliatiilor":"foliație","foliatiunea":"foliațiune","foliatiuni":"foliațiune","foliatiunii":"foliațiune","foliatiunile":"foliațiune","foliatiunilor":"foliațiune","foliatul":"foliat","folicicele":"folicică","folicicelei":"folicică","folicicelele":"folicică","folicicelelor":"folicică","foliculara":["foliculară","folicular","foliculara","folicular"],"foliculare":"folicular","folicularele":"folicular","foliculari":"folicular","folicularii":"folicular","folicularul":"folicular","folicule":"foliculă","foliculei":"foliculă","foliculele":"foliculă","foliculelor":"foliculă","foliculi":"folicul","foliculii":"folicul","foliculilor":"folicul","foliculine":"foliculină","foliculinei":"foliculină","foliculinele":"foliculină","foliculinelor":"foliculină","foliculite":"foliculită","foliculitei":"foliculită","foliculitele":"foliculită","foliculitelor":"foliculită","foliculoze":"foliculoză","foliculozei":"foliculoză","foliculozele":"foliculoză","foliculozelor":"foliculoză","foliculul":"folicul","foliculule":"folicul","foliculului":"folicul","foliei":"folie","folii":["folii","folie","folii","foliu"],"foliile":["foliile","folie","foliile","foliu"],"foliilor":["foliilor","folie","foliilor","foliu"],"foliolata":["foliolată","foliolat","foliolata","foliolat"],"foliolate":"foliolat","foliolatele":"foliolat","foliolati":"foliolat","foliolatii":"foliolat","foliolatul":"foliolat","foliole":"foliolă","foliolei":"foliolă","foliolele":"foliolă","foliolelor":"foliolă","folioul":"folio","folioule":"folio","folioului":"folio","foliul":"foliu","foliule":"foliu","foliului":"foliu","foliumul":"folium","foliumule":"folium","foliumului":"folium","foliumuri":"folium","foliumurile":"folium","foliumurilor":"folium","folkiste":"folkistă","folkistei":"folkistă","folkistele":"folkistă","folkistelor":"folkistă","folkisti":["folkiști","folkist","folkisti","folkist"],"folkistii":"folkist","folkistilor":"folkist","folkistul":"folkist","folkistule":"folkist","folkistului":"folkist","folkul":"folk","folkule":"folk","folkului":"folk","foloase":"folos","foloasele":"folos","foloaselor":"folos","folomocari":"folomocar","folomocarii":"folomocar","folomocarilor":"folomocar","folomocarul":"folomocar","folomocarule":"folomocar","folomocarului":"folomocar","folosea":"folosi","foloseai":"folosi","foloseam":"folosi","foloseasca":"folosi","foloseati":"folosi","foloseau":"folosi","folosesc":"folosi","foloseste":"folosi","folosesti":"folosi","folosii":"folosi","folosim":"folosi","folosind":"folosi","folosinte":"folosință","folosintei":"folosință","folosintele":"folosință","folosintelor":"folosință","folosira":"folosi","folosiram":"folosi","folosirati":"folosi","folosirea":"folosire","folosiri":"folosire","folosirii":"folosire","folosirile":"folosire","folosirilor":"folosire","folosise":"folosi","folosisem":"folosi","folosisera":"folosi","folosiseram":"folosi","folosiserati":"folosi","folosisesi":"folosi","folosisi":"folosi","folosit":"folosi","folosita":["folosită","folosit","folosita","folosit"],"folosite":"folosit","folositele":"folosit","folositi":["folosiți","folosi","folosiți","folosit"],"folositii":"folosit","folositoare":"folositor","folositoarea":"folositor","folositoarele":"folositor","folositori":"folositor","folositorii":"folositor","folositorul":"folositor","folositul":"folosit","folosul":"folos","folosule":"folos","folosului":"folos","foltul":"folt","foltule":"folt","foltului":"folt","folturi":"folt","folturile":"folt","folturilor":"folt","folute":"foluț","folutele":"foluț","folutelor":"foluț","folutul":"foluț","folutule":"foluț","folutului":"foluț","fomeie":"femeie","fomentatia":"fomentație","fomentatiei":"fomentație","fomentatii":"fomentație","fomentatiile":"fomentație","fomentatiilor":"fomentație","fometoasa":["fometoasă","fometos","fometoasa","fometos"],"fometoase":"fometos","fometoasele":"fometos","fometosi":"fometos","fometosii":"fometos","fometosul":"fometos","fonastenia":"fonastenie","fonasteniei":"fonastenie","fonastenii":"fonastenie","fonasteniile":"fonastenie","fonasteniilor":"fonastenie","fonatiunea":"fonațiune","fonatiuni":"fonațiune","fonatiunii":"fonațiune","fonatiunile":"fonațiune","fonatiunilor":"fonațiune","fonatoare":"fonator","fonatoarea":"fonator","fonatoarele":"fonator","fonatori":"fonator","fonatorii":"fonator","fonatorul":"fonator","fonciere":"foncieră","foncierei":"foncieră","fondacoul":"fondaco","fondacoule":"fondaco","fondacoului":"fondaco","fondacouri":"fondaco","fondacourile":"fondaco","fondacourilor":"fondaco","fondai":"fonda","fondalul":"fondal","fondalule":"fondal","fondalului":"fondal","fondaluri":"fondal","fondalurile":"fondal","fondalurilor":"fondal","fondam":["fondăm","fonda","fondam","fonda"],"fondand":"fonda","fondanta":["fondantă","fondant","fondanta","fondant"],"fondante":["fondante","fondant","fondante","fondantă"],"fondantei":"fondantă","fondantele":["fondantele","fondant","fondantele","fondantă"],"fondantelor":"fondantă","fondanti":"fondant","fondantii":"fondant","fondantul":"fondant","fondara":"fonda","fondaram":"fonda","fondarati":"fonda","fondarea":"fondare","fondari":"fondare","fondarii":"fondare","fondarile":"fondare","fondarilor":"fondare","fondase":"fonda","fondasem":"fonda","fondasera":"fonda","fondaseram":"fonda","fondaserati":"fonda","fondasesi":"fonda","fondasi":"fonda","fondat":"fonda","fondata":["fondată","fondat","fondata","fondat"],"fondate":"fondat","fondatele":"fondat","fondati":["fondați","fonda","fondați","fondat"],"fondatii":"fondat","fondatoare":"fondator","fondatoarea":["fondatoarea","fondatoare","fondatoarea","fondator"],"fondatoarei":"fondatoare","fondatoarele":["fondatoarele","fondatoare","fondatoarele","fondator"],"fondatoarelor":"fondatoare","fondatori":"fondator","fondatorii":"fondator","fondatorul":"fondator","fondatul":"fondat","fondau":"fonda","fondeaza":"fonda","fonderia":"fonderie","fonderiei":"fonderie","fonderii":"fonderie","fonderiile":"fonderie","fonderiilor":"fonderie","fondez":"fonda","fondezi":"fonda","fondiste":"fondistă","fondistei":"fondistă","fondistele":"fondistă","fondistelor":"fondistă","fondul":"fond","fondule":"fond","fondului":"fond","fonduri":"fond","fonduri de ten":"fond de ten","fondurile":"fond","fondurilor":"fond","fonduul":"fondu","fonduule":"fondu","fonduului":"fondu","fonduuri":"fondu","fonduurile":"fondu","fonduurilor":"fondu","fonematica":["fonematică","fonematic","fonematica","fonematic"],"fonematice":"fonematic","fonematicele":"fonematic","fonematici":"fonematic","fonematicii":"fonematic","fonematicul":"fonematic","foneme":"fonem","fonemele":"fonem","fonemelor":"fonem","fonemica":["fonemică","fonemic","fonemica","fonemic"],"fonemice":"fonemic","fonemicele":"fonemic","fonemici":"fonemic","fonemicii":"fonemic","fonemicul":"fonemic","fonemul":"fonem","fonemule":"fonem","fonemului":"fonem","fonendoscoape":"fonendoscop","fonendoscoapele":"fonendoscop","fonendoscoapelor":"fonendoscop","fonendoscopul":"fonendoscop","fonendoscopule":"fonendoscop","fonendoscopului":"fonendoscop","fonetica":["fonetică","fonetic","fonetica","fonetic"],"fonetice":"fonetic","foneticele":"fonetic","fonetici":"fonetic","foneticianul":"fonetician","foneticianule":"fonetician","foneticianului":"fonetician","foneticiene":"foneticiană","foneticienei":"foneticiană","foneticienele":"foneticiană","foneticienelor":"foneticiană","foneticieni":"fonetician","foneticienii":"fonetician","foneticienilor":"fonetician","foneticii":"fonetic","foneticul":"fonetic","fonetisme":"fonetism","fonetismele":"fonetism","fonetismelor":"fonetism","fonetismul":"fonetism","fonetismule":"fonetism","fonetismului":"fonetism","fonetiste":"fonetistă","fonetistei":"fonetistă","fonetistele":"fonetistă","fonetistelor":"fonetistă","fonetisti":"fonetist","fonetistii":"fonetist","fonetistilor":"fonetist","fonetistul":"fonetist","fonetistule":"fonetist","fonetistului":"fonetist","fonfleuri":"fonfleu","fonfleurile":"fonfleu","fonfleurilor":"fonfleu","fonfleuul":"fonfleu","fonfleuule":"fonfleu","fonfleuului":"fonfleu","foni":"fon","foniatre":"foniatră","foniatrei":"foniatră","foniatrele":"foniatră","foniatrelor":"foniatră","foniatri":"foniatru","foniatria":"foniatrie","foniatriei":"foniatrie","foniatrii":["foniatrii","foniatrie","foniatrii","foniatru"],"foniatrilor":"foniatru","foniatruul":"foniatru","foniatruule":"foniatru","foniatruului":"foniatru","fonica":["fonică","fonic","fonica","fonic"],"fonicardiografe":"fonocardiograf","fonice":"fonic","fonicele":"fonic","fonici":"fonic","fonicii":"fonic","fonicul":"fonic","fonii":"fon","fonilor":"fon","fonoabsorbanta":["fonoabsorbantă","fonoabsorbant","fonoabsorbanta","fonoabsorbant"],"fonoabsorbante":"fonoabsorbant","fonoabsorbantele":"fonoabsorbant","fonoabsorbanti":"fonoabsorbant","fonoabsorbantii":"fonoabsorbant","fonoabsorbantul":"fonoabsorbant","fonoaudiologia":"fonoaudiologie","fonoaudiologiei":"fonoaudiologie","fonoaudiologii":"fonoaudiologie","fonoaudiologiile":"fonoaudiologie","fonoaudiologiilor":"fonoaudiologie","fonocardiografe":"fonocardiograf","fonocardiografele":"fonocardiograf","fonocardiografelor":"fonocardiograf","fonocardiografia":"fonocardiografie","fonocardiografiei":"fonocardiografie","fonocardiografii":"fonocardiografie","fonocardiografiile":"fonocardiografie","fonocardiografiilor":"fonocardiografie","fonocardiograful":"fonocardiograf","fonocardiografule":"fonocardiograf","fonocardiografului":"fonocardiograf","fonocardiograme":"fonocardiogramă","fonocardiogramei":"fonocardiogramă","fonocardiogramele":"fonocardiogramă","fonocardiogramelor":"fonocardiogramă","fonogenica":["fonogenică","fonogenic","fonogenica","fonogenic"],"fonogenice":"fonogenic","fonogenicele":"fonogenic","fonogenici":"fonogenic","fonogenicii":"fonogenic","fonogenicul":"fonogenic","fonoghidul":"fonoghid","fonoghidule":"fonoghid","fonoghidului":"fonoghid","fonoghiduri":"fonoghid","fonoghidurile":"fonoghid","fonoghidurilor":"fonoghid","fonografe":"fonograf","fonografele":"fonograf","fonografelor":"fonograf","fonografia":"fonografie","fonografica":["fonografică","fonografic","fonografica","fonografic"],"fonografice":"fonografic","fonograficele":"fonografic","fonografici":"fonografic","fonograficii":"fonografic","fonograficul":"fonografic","fonografiei":"fonografie","fonografii":"fonografie","fonografiile":"fonografie","fonografiilor":"fonografie","fonograful":"fonograf","fonografule":"fonograf","fonografului":"fonograf","fonograme":"fonogramă","fonogramei":"fonogramă","fonogramele":"fonogramă","fonogramelor":"fonogramă","fonogramica":["fonogramică","fonogramic","fonogramica","fonogramic"],"fonogramice":"fonogramic","fonogramicele":"fonogramic","fonogramici":"fonogramic","fonogramicii":"fonogramic","fonogramicul":"fonogramic","fonoizolarea":"fonoizolare","fonoizolari":"fonoizolare","fonoizolarii":"fonoizolare","fonoizolarile":"fonoizolare","fonoizolarilor":"fonoizolare","fonolite":"fonolit","fonolitele":"fonolit","fonolitelor":"fonolit","fonolitica":["fonolitică","fonolitic","fonolitica","fonolitic"],"fonolitice":"fonolitic","fonoliticele":"fonolitic","fonolitici":"fonolitic","fonoliticii":"fonolitic","fonoliticul":"fonolitic","fonolitul":"fonolit","fonolitule":"fonolit","fonolitului":"fonolit","fonologe":"fonologă","fonologei":"fonologă","fonologele":"fonologă","fonologelor":"fonologă","fonologi":"fonolog","fonologia":"fonologie","fonologica":["fonologică","fonologic","fonologica","fonologic"],"fonologice":"fonologic","fonologicele":"fonologic","fonologici":"fonologic","fonologicii":"fonologic","fonologicul":"fonologic","fonologiei":"fonologie","fonologii":["fonologii","fonolog","fonologii","fonologie"],"fonologilor":"fonolog","fonologul":"fonolog","fonologule":"fonolog","fonologului":"fonolog","fonometre":"fonometru","fonometrele":"fonometru","fonometrelor":"fonometru","fonometria":"fonometrie","fonometrica":["fonometrică","fonometric","fonometrica","fonometric"],"fonometrice":"fonometric","fonometricele":"fonometric","fonometrici":"fonometric","fonometricii":"fonometric","fonometricul":"fonometric","fonometriei":"fonometrie","fonometrii":"fonometrie","fonometriile":"fonometrie","fonometriilor":"fonometrie","fonometrul":"fonometru","fonometrule":"fonometru","fonometrului":"fonometru","fononi":"fonon","fononii":"fonon","fononilor":"fonon","fononul":"fonon","fononule":"fonon","fononului":"fonon","fonoteci":"fonotecă","fonotecii":"fonotecă","fonotecile":"fonotecă","fonotecilor":"fonotecă","fontale":"fontal","fontalele":"fontal","fontalelor":"fontal","fontalul":"fontal","fontalule":"fontal","fontalului":"fontal","fontana":"fântână","fontanele":"fontanelă","fontanelei":"fontanelă","fontanelele":"fontanelă","fontanelelor":"fontanelă","fonte":"fontă","fontei":"fontă","fontele":"fontă","fontelor":"fontă","fontosa":["fontoșă","fontoș","fontoșa","fontoș"],"fontose":"fontoș","fontosele":"fontoș","fontosi":"fontoș","fontosii":"fontoș","fontosul":"fontoș","fontul":"font","fontule":"font","fontului":"font","fonturi":"font","fonturile":"font","fonturilor":"font","fonul":"fon","fonule":"fon","fonului":"fon","forabila":["forabilă","forabil","forabila","forabil"],"forabile":"forabil","forabilele":"forabil","forabili":"forabil","forabilii":"forabil","forabilitatea":"forabilitate","forabilitati":"forabilitate","forabilitatii":"forabilitate","forabilitatile":"forabilitate","forabilitatilor":"forabilitate","forabilul":"forabil","forai":"fora","foraje":"foraj","forajele":"foraj","forajelor":"foraj","forajul":"foraj","forajule":"foraj","forajului":"foraj","foram":["forăm","fora","foram","fora"],"foraminifere":"foraminifer","foraminiferele":"foraminifer","foraminiferelor":"foraminifer","foraminiferul":"foraminifer","foraminiferule":"foraminifer","foraminiferului":"foraminifer","forand":"fora","forara":"fora","foraram":"fora","forarati":"fora","forarea":"forare","forari":"forare","forarii":"forare","forarile":"forare","forarilor":"forare","foras":"făraș","forase":["forase","fora","forașe","foraș"],"forasele":"foraș","foraselor":"foraș","forasem":"fora","forasera":"fora","foraseram":"fora","foraserati":"fora","forasesi":"fora","forasi":"fora","forasul":"foraș","forasule":"foraș","forasului":"foraș","forat":"fora","forati":"fora","forau":"fora","forbani":"forban","forbanii":"forban","forbanilor":"forban","forbanul":"forban","forbanule":"forban","forbanului":"forban","forcepsul":"forceps","forcepsule":"forceps","forcepsului":"forceps","forcepsuri":"forceps","forcepsurile":"forceps","forcepsurilor":"forceps","forcipresuri":"forcipresură"};
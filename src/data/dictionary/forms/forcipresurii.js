@@ -0,0 +1 @@
+export default {"forcipresurii":"forcipresură","forcipresurile":"forcipresură","forcipresurilor":"forcipresură","fordismul":"fordism","fordismule":"fordism","fordismului":"fordism","forditauul":"forditău","forditauule":"forditău","forditauului":"forditău","fordulaie":"fordulău","fordulaiele":"fordulău","fordulaielor":"fordulău","fordulauul":"fordulău","fordulauule":"fordulău","fordulauului":"fordulău","foreaza":"fora","forestiera":["forestieră","forestier","forestiera","forestier"],"forestiere":"forestier","forestierele":"forestier","forestieri":"forestier","forestierii":"forestier","forestierul":"forestier","forez":"fora","foreze":"foreză","forezei":"foreză","forezele":"foreză","forezelor":"foreză","forezi":"fora","forezia":"forezie","foreziei":"forezie","forezii":"forezie","foreziile":"forezie","foreziilor":"forezie","forfaia":"forfăi","forfaiai":"forfăi","forfaiam":"forfăi","forfaiati":"forfăi","forfaiau":"forfăi","forfaie":"forfăi","forfaiele":"forfăială","forfaielei":"forfăială","forfaielele":"forfăială","forfaielelor":"forfăială","forfaieli":"forfăială","forfaiesc":"forfăi","forfaieste":"forfăi","forfaiesti":"forfăi","forfaii":"forfăi","forfaim":"forfăi","forfaind":"forfăi","forfaira":"forfăi","forfairam":"forfăi","forfairati":"forfăi","forfaise":"forfăi","forfaisem":"forfăi","forfaisera":"forfăi","forfaiseram":"forfăi","forfaiserati":"forfăi","forfaisesi":"forfăi","forfaisi":"forfăi","forfait":"forfăi","forfait-uri":"forfait","forfait-urile":"forfait","forfait-urilor":"forfait","forfaiti":"forfăi","forfaitul":"forfait","forfaitule":"forfait","forfaitului":"forfait","forfecai":"forfeca","forfecam":["forfecăm","forfeca","forfecam","forfeca"],"forfecand":"forfeca","forfecara":"forfeca","forfecaram":"forfeca","forfecarasi":"forfecăraș","forfecarasii":"forfecăraș","forfecarasilor":"forfecăraș","forfecarasul":"forfecăraș","forfecarasule":"forfecăraș","forfecarasului":"forfecăraș","forfecarati":"forfeca","forfecarea":"forfecare","forfecarei":"forfecărel","forfecareii":"forfecărel","forfecareilor":"forfecărel","forfecarelul":"forfecărel","forfecarelule":"forfecărel","forfecarelului":"forfecărel","forfecari":["forfecari","forfecar","forfecări","forfecare"],"forfecarii":["forfecarii","forfecar","forfecării","forfecare"],"forfecarile":"forfecare","forfecarilor":["forfecarilor","forfecar","forfecărilor","forfecare"],"forfecarul":"forfecar","forfecarule":"forfecar","forfecarului":"forfecar","forfecase":"forfeca","forfecasem":"forfeca","forfecasera":"forfeca","forfecaseram":"forfeca","forfecaserati":"forfeca","forfecasesi":"forfeca","forfecasi":"forfeca","forfecat":"forfeca","forfecati":"forfeca","forfecaturi":"forfecătură","forfecaturii":"forfecătură","forfecaturile":"forfecătură","forfecaturilor":"forfecătură","forfecau":"forfeca","forfecei":"forfecel","forfeceii":"forfecel","forfeceilor":"forfecel","forfecelul":"forfecel","forfecelule":"forfecel","forfecelului":"forfecel","forfecute":"forfecuță","forfecutei":"forfecuță","forfecutele":"forfecuță","forfecutelor":"forfecuță","forfetara":["forfetară","forfetar","forfetara","forfetar"],"forfetare":"forfetar","forfetarele":"forfetar","forfetari":"forfetar","forfetarii":"forfetar","forfetarul":"forfetar","forfetul":"forfet","forfetule":"forfet","forfetului":"forfet","forfeturi":"forfet","forfeturile":"forfet","forfeturilor":"forfet","forfotaul":"forfotă","forfotaule":"forfotă","forfotaului":"forfotă","forfotea":"forfoti","forfoteai":"forfoti","forfoteam":"forfoti","forfoteati":"forfoti","forfoteau":"forfoti","forfoteli":"forfoteală","forfotelii":"forfoteală","forfotelile":"forfoteală","forfotelilor":"forfoteală","forfotesc":"forfoti","forfoteste":"forfoti","forfotesti":"forfoti","forfotii":"forfoti","forfotim":"forfoti","forfotind":"forfoti","forfotira":"forfoti","forfotiram":"forfoti","forfotirati":"forfoti","forfotise":"forfoti","forfotisem":"forfoti","forfotisera":"forfoti","forfotiseram":"forfoti","forfotiserati":"forfoti","forfotisesi":"forfoti","forfotisi":"forfoti","forfotit":"forfoti","forfotiti":"forfoti","forfotitoare":"forfotitor","forfotitoarea":"forfotitor","forfotitoarele":"forfotitor","forfotitori":"forfotitor","forfotitorii":"forfotitor","forfotitorul":"forfotitor","forfotul":"forfot","forfotule":"forfot","forfotului":"forfot","forgase":"forgașă","forgasei":"forgașă","forgasele":"forgașă","forgaselor":"forgașă","forhangul":"forhang","forhangule":"forhang","forhangului":"forhang","forhanguri":"forhang","forhangurile":"forhang","forhangurilor":"forhang","forhendul":"forhend","forhendule":"forhend","forhendului":"forhend","forhenduri":"forhend","forhendurile":"forhend","forhendurilor":"forhend","forinti":"forint","forintii":"forint","forintilor":"forint","forintul":"forint","forintule":"forint","forintului":"forint","forjabila":["forjabilă","forjabil","forjabila","forjabil"],"forjabile":"forjabil","forjabilele":"forjabil","forjabili":"forjabil","forjabilii":"forjabil","forjabilitatea":"forjabilitate","forjabilitati":"forjabilitate","forjabilitatii":"forjabilitate","forjabilitatile":"forjabilitate","forjabilitatilor":"forjabilitate","forjabilul":"forjabil","forjai":"forja","forjam":["forjăm","forja","forjam","forja"],"forjand":"forja","forjara":"forja","forjaram":"forja","forjarati":"forja","forjarea":"forjare","forjari":["forjari","forjar","forjări","forjare"],"forjaria":"forjărie","forjariei":"forjărie","forjarii":["forjarii","forjar","forjării","forjare","forjării","forjărie"],"forjariile":"forjărie","forjariilor":"forjărie","forjarile":"forjare","forjarilor":["forjarilor","forjar","forjărilor","forjare"],"forjarul":"forjar","forjarule":"forjar","forjarului":"forjar","forjase":"forja","forjasem":"forja","forjasera":"forja","forjaseram":"forja","forjaserati":"forja","forjasesi":"forja","forjasi":"forja","forjat":"forja","forjata":["forjată","forjat","forjata","forjat"],"forjate":"forjat","forjatele":"forjat","forjati":["forjați","forja","forjați","forjat"],"forjatii":"forjat","forjatul":"forjat","forjau":"forja","forje":"forjă","forjeaza":"forja","forjeria":"forjerie","forjeriei":"forjerie","forjerii":"forjerie","forjeriile":"forjerie","forjeriilor":"forjerie","forjez":"forja","forjezi":"forja","forjori":"forjor","forjorii":"forjor","forjorilor":"forjor","forjorul":"forjor","forjorule":"forjor","forjorului":"forjor","formagii":"formagiu","formagiii":"formagiu","formagiilor":"formagiu","formagiuul":"formagiu","formagiuule":"formagiu","formagiuului":"formagiu","formai":"forma","formaje":"formaj","formajele":"formaj","formajelor":"formaj","formajul":"formaj","formajule":"formaj","formajului":"formaj","formala":["formală","formal","formala","formal"],"formaldehide":"formaldehidă","formaldehidei":"formaldehidă","formaldehidele":"formaldehidă","formaldehidelor":"formaldehidă","formale":"formal","formalele":"formal","formali":"formal","formalii":"formal","formaline":"formalină","formalinei":"formalină","formalinele":"formalină","formalinelor":"formalină","formalismul":"formalism","formalismule":"formalism","formalismului":"formalism","formalista":["formalistă","formalist","formalista","formalist"],"formaliste":["formaliste","formalist","formaliste","formalistă"],"formalistei":"formalistă","formalistele":["formalistele","formalist","formalistele","formalistă"],"formalistelor":"formalistă","formalisti":"formalist","formalistii":"formalist","formalistul":"formalist","formalitatea":"formalitate","formalitati":"formalitate","formalitatii":"formalitate","formalitatile":"formalitate","formalitatilor":"formalitate","formalizai":"formaliza","formalizam":["formalizăm","formaliza","formalizam","formaliza"],"formalizand":"formaliza","formalizara":"formaliza","formalizaram":"formaliza","formalizarati":"formaliza","formalizarea":"formalizare","formalizari":"formalizare","formalizarii":"formalizare","formalizarile":"formalizare","formalizarilor":"formalizare","formalizase":"formaliza","formalizasem":"formaliza","formalizasera":"formaliza","formalizaseram":"formaliza","formalizaserati":"formaliza","formalizasesi":"formaliza","formalizasi":"formaliza","formalizat":"formaliza","formalizati":"formaliza","formalizau":"formaliza","formalizeaza":"formaliza","formalizez":"formaliza","formalizezi":"formaliza","formalul":"formal","formam":["formăm","forma","formam","forma"],"formand":"forma","formanti":"formant","formantii":"formant","formantilor":"formant","formantul":"formant","formantule":"formant","formantului":"formant","formara":"forma","formaram":"forma","formarati":"forma","formarea":"formare","formari":["formari","formar","formări","formare"],"formarii":["formarii","formar","formării","formare"],"formarile":"formare","formarilor":["formarilor","formar","formărilor","formare"],"formarul":"formar","formarule":"formar","formarului":"formar","formase":"forma","formasem":"forma","formasera":"forma","formaseram":"forma","formaserati":"forma","formasesi":"forma","formasi":"forma","format":"forma","formatai":"formata","formatam":["formatăm","formata","formatam","formata"],"formatand":"formata","formatara":"formata","formataram":"formata","formatarati":"formata","formatarea":"formatare","formatari":"formatare","formatarii":"formatare","formatarile":"formatare","formatarilor":"formatare","formatase":"formata","formatasem":"formata","formatasera":"formata","formataseram":"formata","formataserati":"formata","formatasesi":"formata","formatasi":"formata","formatat":"formata","formatati":"formata","formatau":"formata","formate":"format","formateaza":"formata","formatele":"format","formatelor":"format","formatez":"formata","formatezi":"formata","formati":"forma","formatia":"formație","formatiei":"formație","formatii":"formație","formatiile":"formație","formatiilor":"formație","formationala":["formațională","formațional","formaționala","formațional"],"formationale":"formațional","formationalele":"formațional","formationali":"formațional","formationalii":"formațional","formationalul":"formațional","formatiunea":"formațiune","formatiuni":"formațiune","formatiunii":"formațiune","formatiunile":"formațiune","formatiunilor":"formațiune","formativa":["formativă","formativ","formativa","formativ"],"formative":"formativ","formativele":"formativ","formativi":"formativ","formativii":"formativ","formativul":"formativ","formatoare":"formator","formatoarea":["formatoarea","formatoare","formatoarea","formator"],"formatoarei":"formatoare","formatoarele":["formatoarele","formatoare","formatoarele","formator"],"formatoarelor":"formatoare","formatori":"formator","formatorii":"formator","formatorul":"formator","formatul":"format","formatule":"format","formatului":"format","formau":"forma","forme":"formă","forme de guvernamant":"formă de guvernământ","forme de relief":"formă de relief","formeaza":"forma","formei":"formă","formele":"formă","formelor":"formă","formez":"forma","formezi":"forma","formiati":"formiat","formiatii":"formiat","formiatilor":"formiat","formiatul":"formiat","formiatule":"formiat","formiatului":"formiat","formica":["formică","formic","formica","formic"],"formice":"formic","formicele":"formic","formici":"formic","formicii":"formic","formicul":"formic","formidabila":["formidabilă","formidabil","formidabila","formidabil"],"formidabile":"formidabil","formidabilele":"formidabil","formidabili":"formidabil","formidabilii":"formidabil","formidabilul":"formidabil","formolizarea":"formolizare","formolizari":"formolizare","formolizarii":"formolizare","formolizarile":"formolizare","formolizarilor":"formolizare","formolul":"formol","formolule":"formol","formolului":"formol","formulai":"formula","formulam":["formulăm","formula","formulam","formula"],"formuland":"formula","formulara":"formula","formularam":"formula","formularati":"formula","formulare":"formular","formularea":"formulare","formularele":"formular","formularelor":"formular","formulari":"formulare","formularii":"formulare","formularile":"formulare","formularilor":"formulare","formularul":"formular","formularule":"formular","formularului":"formular","formulase":"formula","formulasem":"formula","formulasera":"formula","formulaseram":"formula","formulaserati":"formula","formulasesi":"formula","formulasi":"formula","formulat":"formula","formulati":"formula","formulau":"formula","formule":"formulă","formule empirice":"formulă empirică","formule moleculare":"formulă moleculară","formule structurale":"formulă structurală","formuleaza":"formula","formulez":"formula","formulezi":"formula","fornic":"fornica","fornicai":"fornica","fornicam":["fornicăm","fornica","fornicam","fornica"],"fornicand":"fornica","fornicara":"fornica","fornicaram":"fornica","fornicarati":"fornica","fornicase":"fornica","fornicasem":"fornica","fornicasera":"fornica","fornicaseram":"fornica","fornicaserati":"fornica","fornicasesi":"fornica","fornicasi":"fornica","fornicat":"fornica","fornicati":"fornica","fornicatia":"fornicație","fornicatiei":"fornicație","fornicatii":"fornicație","fornicatiile":"fornicație","fornicatiilor":"fornicație","fornicatori":"fornicator","fornicatorii":"fornicator","fornicatorilor":"fornicator","fornicatorul":"fornicator","fornicatorule":"fornicator","fornicatorului":"fornicator","fornicau":"fornica","fornice":"fornica","fornici":"fornica","forostoia":"forostoi","forostoiai":"forostoi","forostoiam":"forostoi","forostoiati":"forostoi","forostoiau":"forostoi","forostoiesc":"forostoi","forostoieste":"forostoi","forostoiesti":"forostoi","forostoii":"forostoi","forostoim":"forostoi","forostoind":"forostoi","forostoira":"forostoi","forostoiram":"forostoi","forostoirati":"forostoi","forostoise":"forostoi","forostoisem":"forostoi","forostoisera":"forostoi","forostoiseram":"forostoi","forostoiserati":"forostoi","forostoisesi":"forostoi","forostoisi":"forostoi","forostoit":"forostoi","forostoiti":"forostoi","forsitii":"forsiția","forsitiii":"forsiția","forsitiile":"forsiția","forsitiilor":"forsiția","forspanul":"forșpan","forspanule":"forșpan","forspanului":"forșpan","forspanuri":"forșpan","forspanurile":"forșpan","forspanurilor":"forșpan","forsterite":"forsterit","forsteritele":"forsterit","forsteritelor":"forsterit","forsteritul":"forsterit","forsteritule":"forsterit","forsteritului":"forsterit","fortai":"forța","fortam":["forțăm","forța","forțam","forța"],"fortand":"forța","fortara":"forța","fortaram":"forța","fortarati":"forța","fortarea":"forțare","fortarete":"fortăreață","fortarete zburatoare":"fortăreață zburătoare","fortaretei":"fortăreață","fortaretele":"fortăreață","fortaretelor":"fortăreață","fortari":"forțare","fortarii":"forțare","fortarile":"forțare","fortarilor":"forțare","fortase":"forța","fortasem":"forța","fortasera":"forța","fortaseram":"forța","fortaserati":"forța","fortasesi":"forța","fortasi":"forța","fortat":"forța","fortata":["forțată","forțat","forțata","forțat"],"fortate":"forțat","fortatele":"forțat","fortati":["forțați","forța","forțați","forțat"],"fortatii":"forțat","fortatul":"forțat","fortau":"forța","forte":"forță","forte aeriene":"forță aeriană","forte armate":"forță armată","forte de gravitatie":"forță de gravitație","forte de munca":"forță de muncă","forte fundamentale":"forță fundamentală","forte gravitationale":"forță gravitațională","forte motoare":"forță motoare","forte motrice":"forță motrice","forte navale":"forță navală","forte nucleare":"forță nucleară","forteaza":"forța","fortete":"forteță","fortetei":"forteță","fortetele":"forteță","fortetelor":"forteță","fortez":"forța","fortezi":"forța","fortifianta":["fortifiantă","fortifiant","fortifianta","fortifiant"],"fortifiante":"fortifiant","fortifiantele":"fortifiant","fortifianti":"fortifiant","fortifiantii":"fortifiant","fortifiantul":"fortifiant","fortific":"fortifica","fortificai":"fortifica","fortificam":["fortificăm","fortifica","fortificam","fortifica"],"fortificand":"fortifica","fortificanti":"fortificant","fortificantile":"fortificant","fortificantilor":"fortificant","fortificantul":"fortificant","fortificantule":"fortificant","fortificantului":"fortificant","fortificara":"fortifica","fortificaram":"fortifica","fortificarati":"fortifica","fortificarea":"fortificare","fortificari":"fortificare","fortificarii":"fortificare","fortificarile":"fortificare","fortificarilor":"fortificare","fortificase":"fortifica","fortificasem":"fortifica","fortificasera":"fortifica","fortificaseram":"fortifica","fortificaserati":"fortifica","fortificasesi":"fortifica","fortificasi":"fortifica","fortificat":"fortifica","fortificata":["fortificată","fortificat","fortificata","fortificat"],"fortificate":"fortificat","fortificatele":"fortificat","fortificati":["fortificați","fortifica","fortificați","fortificat"],"fortificatia":"fortificație","fortificatiei":"fortificație","fortificatii":["fortificații","fortificat","fortificații","fortificație"],"fortificatiile":"fortificație","fortificatiilor":"fortificație","fortificatiunea":"fortificațiune","fortificatiuni":"fortificațiune","fortificatiunii":"fortificațiune","fortificatiunile":"fortificațiune","fortificatiunilor":"fortificațiune","fortificatul":"fortificat","fortificau":"fortifica","fortifice":"fortifica","fortifici":"fortifica","fortuita":["fortuită","fortuit","fortuita","fortuit"],"fortuite":"fortuit","fortuitele":"fortuit","fortuiti":"fortuit","fortuitii":"fortuit","fortuitul":"fortuit","fortul":"fort","fortule":"fort","fortului":"fort","fortuni":"fortună","fortunii":"fortună","fortunile":"fortună","fortunilor":"fortună","forturi":"fort","forturile":"fort","forturilor":"fort","forul":"for","forule":"for","forului":"for","forumul":"forum","forumule":"forum","forumului":"forum","forumuri":"forum","forumurile":"forum","forumurilor":"forum","foruri":"for","forurile":"for","forurilor":"for","forzatul":"forzaț","forzatule":"forzaț","forzatului":"forzaț","forzaturi":"forzaț","forzaturile":"forzaț","forzaturilor":"forzaț","foscaia":"foșcăi","foscaiai":"foșcăi","foscaiam":"foșcăi","foscaiati":"foșcăi","foscaiau":"foșcăi","foscaiesc":"foșcăi","foscaieste":"foșcăi","foscaiesti":"foșcăi","foscaii":"foșcăi","foscaim":"foșcăi","foscaind":"foșcăi","foscaira":"foșcăi","foscairam":"foșcăi","foscairati":"foșcăi","foscaise":"foșcăi","foscaisem":"foșcăi","foscaisera":"foșcăi","foscaiseram":"foșcăi","foscaiserati":"foșcăi","foscaisesi":"foșcăi","foscaisi":"foșcăi","foscait":"foșcăi","foscaiti":"foșcăi","foscaituri":"foșcăitură","foscaiturii":"foșcăitură","foscaiturile":"foșcăitură","foscaiturilor":"foșcăitură","fose":"fosă","fosete":"fosetă","fosetei":"fosetă","fosetele":"fosetă","fosetelor":"fosetă","fosfatai":"fosfata","fosfatam":["fosfatăm","fosfata","fosfatam","fosfata"],"fosfatand":"fosfata","fosfatara":"fosfata","fosfataram":"fosfata","fosfatarati":"fosfata","fosfatarea":"fosfatare","fosfatari":"fosfatare","fosfatarii":"fosfatare","fosfatarile":"fosfatare","fosfatarilor":"fosfatare","fosfatase":"fosfata","fosfatasem":"fosfata","fosfatasera":"fosfata","fosfataseram":"fosfata","fosfataserati":"fosfata","fosfatasesi":"fosfata","fosfatasi":"fosfata","fosfatat":"fosfata","fosfatata":["fosfatată","fosfatat","fosfatata","fosfatat"],"fosfatate":"fosfatat","fosfatatele":"fosfatat","fosfatati":["fosfatați","fosfata","fosfatați","fosfatat"],"fosfatatii":"fosfatat","fosfatatul":"fosfatat","fosfatau":"fosfata","fosfataze":"fosfatază","fosfatazei":"fosfatază","fosfatazele":"fosfatază","fosfatazelor":"fosfatază","fosfateaza":"fosfata","fosfatez":"fosfata","fosfatezi":"fosfata","fosfati":"fosfat","fosfatica":["fosfatică","fosfatic","fosfatica","fosfatic"],"fosfatice":"fosfatic","fosfaticele":"fosfatic","fosfatici":"fosfatic","fosfaticii":"fosfatic","fosfaticul":"fosfatic","fosfatide":"fosfatidă","fosfatidei":"fosfatidă","fosfatidele":"fosfatidă","fosfatidelor":"fosfatidă","fosfatii":"fosfat","fosfatilor":"fosfat","fosfatul":"fosfat","fosfatule":"fosfat","fosfatului":"fosfat","fosfaturia":"fosfaturie","fosfaturiei":"fosfaturie","fosfaturii":"fosfaturie","fosfaturiile":"fosfaturie","fosfaturiilor":"fosfaturie","fosfene":"fosfenă","fosfenei":"fosfenă","fosfenele":"fosfenă","fosfenelor":"fosfenă","fosfiti":"fosfit","fosfitii":"fosfit","fosfitilor":"fosfit","fosfitul":"fosfit","fosfitule":"fosfit","fosfitului":"fosfit","fosforata":["fosforată","fosforat","fosforata","fosforat"],"fosforate":"fosforat","fosforatele":"fosforat","fosforati":"fosforat","fosforatii":"fosforat","fosforatul":"fosforat","fosforescenta":["fosforescentă","fosforescent","fosforescenta","fosforescent"],"fosforescente":["fosforescente","fosforescent","fosforescențe","fosforescență"],"fosforescentei":"fosforescență","fosforescentele":["fosforescentele","fosforescent","fosforescențele","fosforescență"],"fosforescentelor":"fosforescență","fosforescenti":"fosforescent","fosforescentii":"fosforescent","fosforescentul":"fosforescent","fosforica":["fosforică","fosforic","fosforica","fosforic"],"fosforice":"fosforic","fosforicele":"fosforic","fosforici":"fosforic","fosforicii":"fosforic","fosforicul":"fosforic","fosforisme":"fosforism","fosforismele":"fosforism","fosforismelor":"fosforism","fosforismul":"fosforism","fosforismule":"fosforism","fosforismului":"fosforism","fosforite":"fosforit","fosforitele":"fosforit","fosforitelor":"fosforit","fosforitul":"fosforit","fosforitule":"fosforit","fosforitului":"fosforit","fosforoasa":["fosforoasă","fosforos","fosforoasa","fosforos"],"fosforoase":"fosforos","fosforoasele":"fosforos","fosforoscoape":"fosforoscop","fosforoscoapele":"fosforoscop","fosforoscoapelor":"fosforoscop","fosforoscopul":"fosforoscop","fosforoscopule":"fosforoscop","fosforoscopului":"fosforoscop","fosforosi":"fosforos","fosforosii":"fosforos","fosforosul":"fosforos","fosforul":"fosfor","fosforule":"fosfor","fosforului":"fosfor","fosfuri":"fosfură","fosfurii":"fosfură","fosfurile":"fosfură","fosfurilor":"fosfură","fosgenul":"fosgen","fosgenule":"fosgen","fosgenului":"fosgen","fosila":["fosilă","fosil","fosila","fosil"],"fosile":["fosile","fosil","fosile","fosilă"],"fosile vii":"fosilă vie","fosilei":"fosilă","fosilele":["fosilele","fosil","fosilele","fosilă"],"fosilelor":"fosilă","fosili":"fosil","fosilifera":["fosiliferă","fosilifer","fosilifera","fosilifer"],"fosilifere":"fosilifer","fosiliferele":"fosilifer","fosiliferi":"fosilifer","fosiliferii":"fosilifer","fosiliferul":"fosilifer","fosilii":"fosil","fosilizai":"fosiliza","fosilizam":["fosilizăm","fosiliza","fosilizam","fosiliza"],"fosilizand":"fosiliza","fosilizara":"fosiliza","fosilizaram":"fosiliza","fosilizarati":"fosiliza","fosilizarea":"fosilizare","fosilizari":"fosilizare","fosilizarii":"fosilizare","fosilizarile":"fosilizare","fosilizarilor":"fosilizare","fosilizase":"fosiliza","fosilizasem":"fosiliza","fosilizasera":"fosiliza","fosilizaseram":"fosiliza","fosilizaserati":"fosiliza","fosilizasesi":"fosiliza","fosilizasi":"fosiliza","fosilizat":"fosiliza","fosilizata":["fosilizată","fosilizat","fosilizata","fosilizat"],"fosilizate":"fosilizat","fosilizatele":"fosilizat","fosilizati":["fosilizați","fosiliza","fosilizați","fosilizat"],"fosilizatii":"fosilizat","fosilizatul":"fosilizat","fosilizau":"fosiliza","fosilizeaza":"fosiliza","fosilizez":"fosiliza","fosilizezi":"fosiliza","fosilul":"fosil","fosnai":"foșni","fosnaia":"foșnăi","fosnaiai":"foșnăi","fosnaiam":"foșnăi","fosnaiati":"foșnăi","fosnaiau":"foșnăi","fosnaiesc":"foșnăi","fosnaieste":"foșnăi","fosnaiesti":"foșnăi","fosnaii":"foșnăi","fosnaim":"foșnăi","fosnaind":"foșnăi","fosnaira":"foșnăi","fosnairam":"foșnăi","fosnairati":"foșnăi","fosnaise":"foșnăi","fosnaisem":"foșnăi","fosnaisera":"foșnăi","fosnaiseram":"foșnăi","fosnaiserati":"foșnăi","fosnaisesi":"foșnăi","fosnaisi":"foșnăi","fosnait":"foșnăi","fosnaiti":"foșnăi","fosnea":"foșni","fosneai":"foșni","fosneam":"foșni","fosneati":"foșni","fosneau":"foșni","fosnele":"foșneală","fosnelei":"foșneală","fosnelele":"foșneală","fosnelelor":"foșneală","fosneli":"foșneală","fosnesc":"foșni","fosneste":"foșni","fosnesti":"foșni","fosnete":"foșnet","fosnetele":"foșnet","fosnetelor":"foșnet","fosnetul":"foșnet","fosnetule":"foșnet","fosnetului":"foșnet","fosnii":"foșni","fosnim":"foșni","fosnind":"foșni","fosnira":"foșni","fosniram":"foșni","fosnirati":"foșni","fosnirea":"foșnire","fosniri":"foșnire","fosnirii":"foșnire","fosnirile":"foșnire","fosnirilor":"foșnire","fosnise":"foșni","fosnisem":"foșni","fosnisera":"foșni","fosniseram":"foșni","fosniserati":"foșni","fosnisesi":"foșni","fosnisi":"foșni","fosnit":"foșni","fosniti":"foșni","fosnitoare":"foșnitor","fosnitoarea":"foșnitor","fosnitoarele":"foșnitor","fosnitori":"foșnitor","fosnitorii":"foșnitor","fosnitorul":"foșnitor","fosnitul":"foșnit","fosnitule":"foșnit","fosnitului":"foșnit","fosniture":"foșnitură","fosniturei":"foșnitură","fosniturele":"foșnitură","fosniturelor":"foșnitură","fosnituri":"foșnitură","fost":"fi","fost chit":"fi chit","fost sanatos":"fi sănătos","fosta":["fostă","fost","fosta","fost"],"foste":["foste","fost","foste","fostă"],"fostei":"fostă","fostele":["fostele","fost","fostele","fostă"],"fostelor":"fostă","fosti":"fost","fostii":"fost","fostilor":"fost","fostul":"fost","fostule":"fost","fostului":"fost","fotbaliste":"fotbalistă","fotbalistei":"fotbalistă","fotbalistele":"fotbalistă","fotbalistelor":"fotbalistă","fotbalisti":"fotbalist","fotbalistica":["fotbalistică","fotbalistic","fotbalistica","fotbalistic"],"fotbalistice":"fotbalistic","fotbalisticele":"fotbalistic","fotbalistici":"fotbalistic","fotbalisticii":"fotbalistic","fotbalisticul":"fotbalistic","fotbalistii":"fotbalist","fotbalistilor":"fotbalist","fotbalistul":"fotbalist","fotbalistule":"fotbalist","fotbalistului":"fotbalist","fote":"fotă","fotei":"fotă","fotele":["fotele","fotă","fotele","fotel"],"fotelele":"fotel","fotelelor":"fotel","fotelor":"fotă","fotelul":"fotel","fotelule":"fotel","fotelului":"fotel","fotica":["fotică","fotic","fotica","fotic"],"fotice":"fotic","foticele":"fotic","fotici":"fotic","foticii":"fotic","foticul":"fotic","fotite":"fotiță","fotitei":"fotiță","fotitele":"fotiță","fotitelor":"fotiță","foto-ul":"foto","foto-ule":"foto","foto-ului":"foto","foto-uri":"foto","foto-urile":"foto","foto-urilor":"foto","fotoalergia":"fotoalergie","fotoalergiei":"fotoalergie","fotoalergii":"fotoalergie","fotoalergiile":"fotoalergie","fotoalergiilor":"fotoalergie","fotoamatori":"fotoamator","fotoamatorii":"fotoamator","fotoamatorilor":"fotoamator","fotoamatorul":"fotoamator","fotoamatorule":"fotoamator","fotoamatorului":"fotoamator","fotoaparate":"fotoaparat","fotoaparatele":"fotoaparat","fotoaparatelor":"fotoaparat","fotoaparatul":"fotoaparat","fotoaparatule":"fotoaparat","fotoaparatului":"fotoaparat","fotoautotrofa":["fotoautotrofă","fotoautotrof","fotoautotrofa","fotoautotrof"],"fotoautotrofe":"fotoautotrof","fotoautotrofele":"fotoautotrof","fotoautotrofi":"fotoautotrof","fotoautotrofii":"fotoautotrof","fotoautotroful":"fotoautotrof","fotobiologia":"fotobiologie","fotobiologiei":"fotobiologie","fotobiologii":"fotobiologie","fotocamere":"fotocameră","fotocamerei":"fotocameră","fotocamerele":"fotocameră","fotocamerelor":"fotocameră","fotocartografe":"fotocartograf","fotocartografele":"fotocartograf","fotocartografelor":"fotocartograf","fotocartograful":"fotocartograf","fotocartografule":"fotocartograf","fotocartografului":"fotocartograf","fotocatalizatoare":"fotocatalizator","fotocatalizatoarea":"fotocatalizator","fotocatalizatoarele":"fotocatalizator","fotocatalizatori":"fotocatalizator","fotocatalizatorii":"fotocatalizator","fotocatalizatorul":"fotocatalizator","fotocatalize":"fotocataliză","fotocatalizei":"fotocataliză","fotocatalizele":"fotocataliză","fotocatalizelor":"fotocataliză","fotocatodul":"fotocatod","fotocatodule":"fotocatod","fotocatodului":"fotocatod","fotocatozi":"fotocatod","fotocatozii":"fotocatod","fotocatozilor":"fotocatod","fotocelule":"fotocelulă","fotocelulei":"fotocelulă","fotocelulele":"fotocelulă","fotocelulelor":"fotocelulă","fotoceramice":"fotoceramică","fotoceramicei":"fotoceramică","fotoceramicele":"fotoceramică","fotoceramicelor":"fotoceramică","fotochimia":"fotochimie","fotochimica":["fotochimică","fotochimic","fotochimica","fotochimic"],"fotochimice":"fotochimic","fotochimicele":"fotochimic","fotochimici":"fotochimic","fotochimicii":"fotochimic","fotochimicul":"fotochimic","fotochimiei":"fotochimie","fotochimii":"fotochimie","fotochimiile":"fotochimie","fotochimiilor":"fotochimie","fotoclubul":"fotoclub","fotoclubule":"fotoclub","fotoclubului":"fotoclub","fotocluburi":"fotoclub","fotocluburile":"fotoclub","fotocluburilor":"fotoclub","fotocoagularea":"fotocoagulare","fotocoagulari":["fotocoagulări","fotocoagulare","fotocoagulari","fotocoagulare"],"fotocoagularii":"fotocoagulare","fotocoagularile":"fotocoagulare","fotocoagularilor":"fotocoagulare","fotocoagulatoare":"fotocoagulator","fotocoagulatoarele":"fotocoagulator","fotocoagulatoarelor":"fotocoagulator","fotocoagulatorul":"fotocoagulator","fotocoagulatorule":"fotocoagulator","fotocoagulatorului":"fotocoagulator","fotocolografia":"fotocolografie","fotocolografiei":"fotocolografie","fotocolografii":"fotocolografie","fotocolografiile":"fotocolografie","fotocolografiilor":"fotocolografie","fotocolorimetre":"fotocolorimetru","fotocolorimetrele":"fotocolorimetru","fotocolorimetrelor":"fotocolorimetru","fotocolorimetrul":"fotocolorimetru","fotocolorimetrule":"fotocolorimetru","fotocolorimetrului":"fotocolorimetru","fotocompozitia":"fotocompoziție","fotocompozitiei":"fotocompoziție","fotocompozitii":"fotocompoziție","fotocompozitiile":"fotocompoziție","fotocompozitiilor":"fotocompoziție","fotoconductia":"fotoconducție","fotoconductibilitatea":"fotoconductibilitate","fotoconductibilitati":"fotoconductibilitate","fotoconductibilitatii":"fotoconductibilitate","fotoconductibilitatile":"fotoconductibilitate","fotoconductibilitatilor":"fotoconductibilitate","fotoconductiei":"fotoconducție","fotoconductii":"fotoconducție","fotoconductiile":"fotoconducție","fotoconductiilor":"fotoconducție","fotoconductiva":["fotoconductivă","fotoconductiv","fotoconductiva","fotoconductiv"],"fotoconductive":"fotoconductiv","fotoconductivele":"fotoconductiv","fotoconductivi":"fotoconductiv","fotoconductivii":"fotoconductiv","fotoconductivitatea":"fotoconductivitate","fotoconductivitati":"fotoconductivitate","fotoconductivitatii":"fotoconductivitate","fotoconductivitatile":"fotoconductivitate","fotoconductivitatilor":"fotoconductivitate","fotoconductivul":"fotoconductiv","fotoconductoare":"fotoconductor","fotoconductoarea":"fotoconductor","fotoconductoarele":"fotoconductor","fotoconductori":"fotoconductor","fotoconductorii":"fotoconductor","fotoconductorul":"fotoconductor","fotocopia":"fotocopie","fotocopiai":"fotocopia","fotocopiam":"fotocopia","fotocopiara":"fotocopia","fotocopiaram":"fotocopia","fotocopiarati":"fotocopia","fotocopiase":"fotocopia","fotocopiasem":"fotocopia","fotocopiasera":"fotocopia","fotocopiaseram":"fotocopia","fotocopiaserati":"fotocopia","fotocopiasesi":"fotocopia","fotocopiasi":"fotocopia","fotocopiat":"fotocopia","fotocopiati":"fotocopia","fotocopiatoare":"fotocopiator","fotocopiatoarele":"fotocopiator","fotocopiatoarelor":"fotocopiator","fotocopiatorul":"fotocopiator","fotocopiatorule":"fotocopiator","fotocopiatorului":"fotocopiator","fotocopiau":"fotocopia","fotocopiaza":"fotocopia","fotocopie":"fotocopia","fotocopiei":"fotocopie","fotocopiem":"fotocopia","fotocopiere":"fotocopier","fotocopierele":"fotocopier","fotocopierelor":"fotocopier","fotocopierul":"fotocopier","fotocopierule":"fotocopier","fotocopierului":"fotocopier","fotocopiez":"fotocopia","fotocopiezi":"fotocopia","fotocopii":"fotocopie","fotocopiile":"fotocopie","fotocopiilor":"fotocopie","fotocopiind":"fotocopia","fotocroma":["fotocromă","fotocrom","fotocroma","fotocrom"],"fotocromatica":["fotocromatică","fotocromatic","fotocromatica","fotocromatic"],"fotocromatice":"fotocromatic","fotocromaticele":"fotocromatic","fotocromatici":"fotocromatic","fotocromaticii":"fotocromatic","fotocromaticul":"fotocromatic","fotocrome":"fotocrom","fotocromele":"fotocrom","fotocromi":"fotocrom","fotocromia":"fotocromie","fotocromiei":"fotocromie","fotocromii":["fotocromii","fotocrom","fotocromii","fotocromie"],"fotocromiile":"fotocromie","fotocromiilor":"fotocromie","fotocromografia":"fotocromografie","fotocromografiei":"fotocromografie","fotocromografii":"fotocromografie","fotocromografiile":"fotocromografie","fotocromografiilor":"fotocromografie","fotocromul":"fotocrom","fotocronografe":"fotocronograf","fotocronografele":"fotocronograf","fotocronografelor":"fotocronograf","fotocronograful":"fotocronograf","fotocronografule":"fotocronograf","fotocronografului":"fotocronograf","fotoculegerea":"fotoculegere","fotoculegeri":"fotoculegere","fotoculegerii":"fotoculegere","fotoculegerile":"fotoculegere","fotoculegerilor":"fotoculegere","fotocuploare":"fotocuplor","fotocuplore":"fotocuplor","fotocuplorele":"fotocuplor","fotocuplorelor":"fotocuplor","fotocuplorul":"fotocuplor","fotocuplorule":"fotocuplor","fotocuplorului":"fotocuplor","fotodermatoze":"fotodermatoză","fotodermatozei":"fotodermatoză","fotodermatozele":"fotodermatoză","fotodermatozelor":"fotodermatoză","fotodezintegrarea":"fotodezintegrare","fotodezintegrari":["fotodezintegrări","fotodezintegrare","fotodezintegrari","fotodezintegrare"],"fotodezintegrarii":"fotodezintegrare","fotodezintegrarile":"fotodezintegrare","fotodezintegrarilor":"fotodezintegrare","fotodiode":"fotodiodă","fotodiodei":"fotodiodă","fotodiodele":"fotodiodă","fotodiodelor":"fotodiodă","fotodocumente":"fotodocument","fotodocumentele":"fotodocument","fotodocumentelor":"fotodocument","fotodocumentul":"fotodocument","fotodocumentule":"fotodocument","fotodocumentului":"fotodocument","fotoelasticimetre":"fotoelasticimetru","fotoelasticimetrele":"fotoelasticimetru","fotoelasticimetrelor":"fotoelasticimetru","fotoelasticimetria":"fotoelasticimetrie","fotoelasticimetriei":"fotoelasticimetrie","fotoelasticimetrii":"fotoelasticimetrie","fotoelasticimetriile":"fotoelasticimetrie","fotoelasticimetriilor":"fotoelasticimetrie","fotoelasticimetrul":"fotoelasticimetru","fotoelasticimetrule":"fotoelasticimetru","fotoelasticimetrului":"fotoelasticimetru","fotoelasticitatea":"fotoelasticitate","fotoelasticitati":"fotoelasticitate","fotoelasticitatii":"fotoelasticitate","fotoelasticitatile":"fotoelasticitate","fotoelasticitatilor":"fotoelasticitate","fotoelectrica":["fotoelectrică","fotoelectric","fotoelectrica","fotoelectric"],"fotoelectrice":"fotoelectric","fotoelectricele":"fotoelectric","fotoelectrici":"fotoelectric","fotoelectricii":"fotoelectric","fotoelectricitatea":"fotoelectricitate","fotoelectricitati":"fotoelectricitate","fotoelectricitatii":"fotoelectricitate","fotoelectricitatile":"fotoelectricitate","fotoelectricitatilor":"fotoelectricitate","fotoelectricul":"fotoelectric","fotoelectroni":"fotoelectron","fotoelectronii":"fotoelectron","fotoelectronilor":"fotoelectron","fotoelectronul":"fotoelectron","fotoelectronule":"fotoelectron","fotoelectronului":"fotoelectron","fotoelemente":"fotoelement","fotoelementele":"fotoelement","fotoelementelor":"fotoelement","fotoelementul":"fotoelement","fotoelementule":"fotoelement","fotoelementului":"fotoelement","fotoemisia":"fotoemisie","fotoemisiei":"fotoemisie","fotoemisii":"fotoemisie","fotoemisiile":"fotoemisie","fotoemisiilor":"fotoemisie","fotoemisiunea":"fotoemisiune","fotoemisiuni":"fotoemisiune","fotoemisiunii":"fotoemisiune","fotoemisiunile":"fotoemisiune","fotoemisiunilor":"fotoemisiune","fotoenergetice":"fotoenergetică","fotoenergeticei":"fotoenergetică","fotoenergeticele":"fotoenergetică","fotoenergeticelor":"fotoenergetică","fotofisiunea":"fotofisiune","fotofisiuni":"fotofisiune","fotofisiunii":"fotofisiune","fotofisiunile":"fotofisiune","fotofisiunilor":"fotofisiune","fotofoane":"fotofon","fotofoanele":"fotofon","fotofoanelor":"fotofon","fotofoba":["fotofobă","fotofob","fotofoba","fotofob"],"fotofobe":["fotofobe","fotofob","fotofobe","fotofobă"],"fotofobei":"fotofobă","fotofobele":["fotofobele","fotofob","fotofobele","fotofobă"],"fotofobelor":"fotofobă","fotofobi":"fotofob","fotofobia":"fotofobie","fotofobiei":"fotofobie","fotofobii":["fotofobii","fotofob","fotofobii","fotofobie"],"fotofobiile":"fotofobie","fotofobiilor":"fotofobie","fotofobul":"fotofob","fotofonia":"fotofonie","fotofoniei":"fotofonie","fotofonii":"fotofonie","fotofoniile":"fotofonie","fotofoniilor":"fotofonie","fotofonul":"fotofon","fotofonule":"fotofon","fotofonului":"fotofon","fotoforeze":"fotoforeză","fotoforezei":"fotoforeză","fotoforezele":"fotoforeză","fotoforezelor":"fotoforeză","fotogena":["fotogenă","fotogen","fotogena","fotogen"],"fotogene":"fotogen","fotogenele":"fotogen","fotogeni":"fotogen","fotogenia":"fotogenie","fotogenica":["fotogenică","fotogenic","fotogenica","fotogenic"],"fotogenice":"fotogenic","fotogenicele":"fotogenic","fotogenici":"fotogenic","fotogenicii":"fotogenic","fotogenicul":"fotogenic","fotogeniei":"fotogenie","fotogenii":["fotogenii","fotogen","fotogenii","fotogenie"],"fotogenul":"fotogen","fotoghinul":"fotoghin","fotoghinule":"fotoghin","fotoghinului":"fotoghin","fotogoniometre":"fotogoniometru","fotogoniometrele":"fotogoniometru","fotogoniometrelor":"fotogoniometru","fotogoniometruul":"fotogoniometru","fotogoniometruule":"fotogoniometru","fotogoniometruului":"fotogoniometru","fotografe":"fotografă","fotografei":"fotografă","fotografele":"fotografă","fotografelor":"fotografă","fotografi":"fotograf","fotografia":"fotografie","fotografiai":"fotografia","fotografiam":"fotografia","fotografiara":"fotografia","fotografiaram":"fotografia","fotografiarati":"fotografia","fotografiase":"fotografia","fotografiasem":"fotografia","fotografiasera":"fotografia","fotografiaseram":"fotografia","fotografiaserati":"fotografia","fotografiasesi":"fotografia","fotografiasi":"fotografia","fotografiat":"fotografia","fotografiati":"fotografia","fotografiatul":"fotografiat","fotografiatule":"fotografiat","fotografiatului":"fotografiat","fotografiau":"fotografia","fotografiaza":"fotografia","fotografica":["fotografică","fotografic","fotografica","fotografic"],"fotografice":"fotografic","fotograficele":"fotografic","fotografici":"fotografic","fotograficii":"fotografic","fotograficul":"fotografic","fotografie":"fotografia","fotografiei":"fotografie","fotografiem":"fotografia","fotografierea":"fotografiere","fotografieri":"fotografiere","fotografierii":"fotografiere","fotografierile":"fotografiere","fotografierilor":"fotografiere","fotografiez":"fotografia","fotografiezi":"fotografia","fotografii":["fotografii","fotograf","fotografii","fotografie"],"fotografiile":"fotografie","fotografiilor":"fotografie","fotografiind":"fotografia","fotografilor":"fotograf","fotograful":"fotograf","fotografule":"fotograf","fotografului":"fotograf","fotograme":"fotogramă","fotogramei":"fotogramă","fotogramele":"fotogramă","fotogramelor":"fotogramă","fotogrammetri":"fotogrammetru","fotogrammetria":"fotogrammetrie","fotogrammetrica":["fotogrammetrică","fotogrammetric","fotogrammetrica","fotogrammetric"],"fotogrammetrice":"fotogrammetric","fotogrammetricele":"fotogrammetric","fotogrammetrici":"fotogrammetric","fotogrammetricii":"fotogrammetric","fotogrammetricul":"fotogrammetric","fotogrammetriei":"fotogrammetrie","fotogrammetrii":["fotogrammetrii","fotogrammetrie","fotogrammetrii","fotogrammetru"],"fotogrammetrilor":"fotogrammetru","fotogrammetriste":"fotogrammetristă","fotogrammetristei":"fotogrammetristă","fotogrammetristele":"fotogrammetristă","fotogrammetristelor":"fotogrammetristă","fotogrammetristi":"fotogrammetrist","fotogrammetristii":"fotogrammetrist","fotogrammetristilor":"fotogrammetrist","fotogrammetristul":"fotogrammetrist","fotogrammetristule":"fotogrammetrist","fotogrammetristului":"fotogrammetrist","fotogrammetruul":"fotogrammetru","fotogrammetruule":"fotogrammetru","fotogrammetruului":"fotogrammetru","fotogravori":"fotogravor","fotogravorii":"fotogravor","fotogravorilor":"fotogravor","fotogravorul":"fotogravor","fotogravorule":"fotogravor","fotogravorului":"fotogravor","fotogravuri":"fotogravură","fotogravurii":"fotogravură","fotogravurile":"fotogravură","fotogravurilor":"fotogravură","fotoharte":"fotohartă","fotohartei":"fotohartă","fotohartele":"fotohartă","fotohartelor":"fotohartă","fotoharti":"fotohartă","fotointrerupatoare":"fotoîntrerupător","fotointrerupatoarele":"fotoîntrerupător","fotointrerupatoarelor":"fotoîntrerupător","fotointrerupatorul":"fotoîntrerupător","fotointrerupatorule":"fotoîntrerupător","fotointrerupatorului":"fotoîntrerupător","fotolii":"fotoliu","fotoliile":"fotoliu","fotoliilor":"fotoliu","fotolitografia":"fotolitografie","fotolitografica":["fotolitografică","fotolitografic","fotolitografica","fotolitografic"],"fotolitografice":"fotolitografic","fotolitograficele":"fotolitografic","fotolitografici":"fotolitografic","fotolitograficii":"fotolitografic","fotolitograficul":"fotolitografic","fotolitografiei":"fotolitografie","fotolitografii":"fotolitografie","fotolitografiile":"fotolitografie","fotolitografiilor":"fotolitografie","fotoliul":"fotoliu","fotoliule":"fotoliu","fotoliului":"fotoliu","fotolize":"fotoliză","fotolizei":"fotoliză","fotolizele":"fotoliză","fotolizelor":"fotoliză","fotoluminescenta":["fotoluminescentă","fotoluminescent","fotoluminescenta","fotoluminescent"],"fotoluminescente":["fotoluminescente","fotoluminescent","fotoluminescențe","fotoluminescență"],"fotoluminescentei":"fotoluminescență","fotoluminescentele":["fotoluminescentele","fotoluminescent","fotoluminescențele","fotoluminescență"],"fotoluminescentelor":"fotoluminescență","fotoluminescenti":"fotoluminescent","fotoluminescentii":"fotoluminescent","fotoluminescentul":"fotoluminescent","fotoluminiscenta":["fotoluminiscentă","fotoluminiscent","fotoluminiscenta","fotoluminiscent"],"fotoluminiscente":["fotoluminiscente","fotoluminiscent","fotoluminiscențe","fotoluminiscență"],"fotoluminiscentei":"fotoluminiscență","fotoluminiscentele":"fotoluminiscent","fotoluminiscenti":"fotoluminiscent","fotoluminiscentii":"fotoluminiscent","fotoluminiscentul":"fotoluminiscent","fotomecanica":["fotomecanică","fotomecanic","fotomecanica","fotomecanic"],"fotomecanice":["fotomecanice","fotomecanic","fotomecanice","fotomecanică"],"fotomecanicele":["fotomecanicele","fotomecanic","fotomecanicele","fotomecanică"],"fotomecanici":"fotomecanic","fotomecanicii":"fotomecanic","fotomecanicul":"fotomecanic","fotometalografiste":"fotometalografistă","fotometalografistei":"fotometalografistă","fotometalografistele":"fotometalografistă","fotometalografistelor":"fotometalografistă","fotometalografisti":["fotometalografiști","fotometalografist","fotometalografisti","fotometalografist"],"fotometalografistii":"fotometalografist","fotometalografistilor":"fotometalografist","fotometalografistul":"fotometalografist","fotometalografistule":"fotometalografist","fotometalografistului":"fotometalografist","fotometeori":"fotometeor","fotometeorii":"fotometeor","fotometeorilor":"fotometeor","fotometeorul":"fotometeor","fotometeorule":"fotometeor","fotometeorului":"fotometeor","fotometre":"fotometru","fotometrele":"fotometru","fotometrelor":"fotometru","fotometria":"fotometrie","fotometrica":["fotometrică","fotometric","fotometrica","fotometric"],"fotometrice":"fotometric","fotometricele":"fotometric","fotometrici":"fotometric","fotometricii":"fotometric","fotometricul":"fotometric","fotometriei":"fotometrie","fotometrii":"fotometrie","fotometrul":"fotometru","fotometrule":"fotometru","fotometrului":"fotometru","fotomicrografia":"fotomicrografie","fotomicrografica":["fotomicrografică","fotomicrografic","fotomicrografica","fotomicrografic"],"fotomicrografice":"fotomicrografic","fotomicrograficele":"fotomicrografic","fotomicrografici":"fotomicrografic","fotomicrograficii":"fotomicrografic","fotomicrograficul":"fotomicrografic","fotomicrografiei":"fotomicrografie","fotomicrografii":"fotomicrografie","fotomicrografiile":"fotomicrografie","fotomicrografiilor":"fotomicrografie","fotomicroscopia":"fotomicroscopie","fotomicroscopiei":"fotomicroscopie","fotomicroscopii":"fotomicroscopie","fotomicroscopiile":"fotomicroscopie","fotomicroscopiilor":"fotomicroscopie","fotomodele":"fotomodel","fotomodelele":"fotomodel","fotomodelelor":"fotomodel","fotomodelul":"fotomodel","fotomodelule":"fotomodel","fotomodelului":"fotomodel","fotomontaje":"fotomontaj","fotomontajele":"fotomontaj","fotomontajelor":"fotomontaj","fotomontajul":"fotomontaj","fotomontajule":"fotomontaj","fotomontajului":"fotomontaj","fotomozaicul":"fotomozaic","fotomozaicule":"fotomozaic","fotomozaicului":"fotomozaic","fotomozaicuri":"fotomozaic","fotomozaicurile":"fotomozaic","fotomozaicurilor":"fotomozaic","fotomultiplicatoare":"fotomultiplicator","fotomultiplicatore":"fotomultiplicator","fotomultiplicatorele":"fotomultiplicator","fotomultiplicatorelor":"fotomultiplicator","fotomultiplicatorul":"fotomultiplicator","fotomultiplicatorule":"fotomultiplicator","fotomultiplicatorului":"fotomultiplicator","fotonastia":"fotonastie","fotonastiei":"fotonastie","fotonastii":"fotonastie","fotonastiile":"fotonastie","fotonastiilor":"fotonastie","fotoni":"foton","fotonica":["fotonică","fotonic","fotonica","fotonic"],"fotonice":"fotonic","fotonicele":"fotonic","fotonici":"fotonic","fotonicii":"fotonic","fotonicul":"fotonic","fotonii":"foton","fotonilor":"foton","fotonul":"foton","fotonule":"foton","fotonului":"foton","fotoobiective":"fotoobiectiv","fotoobiectivele":"fotoobiectiv","fotoobiectivelor":"fotoobiectiv","fotoobiectivul":"fotoobiectiv","fotoobiectivule":"fotoobiectiv","fotoobiectivului":"fotoobiectiv","fotoperiodisme":"fotoperiodism","fotoperiodismele":"fotoperiodism","fotoperiodismelor":"fotoperiodism","fotoperiodismul":"fotoperiodism","fotoperiodismule":"fotoperiodism","fotoperiodismului":"fotoperiodism","fotopile":"fotopilă","fotopilei":"fotopilă","fotopilele":"fotopilă","fotopilelor":"fotopilă","fotopolarimetre":"fotopolarimetru","fotopolarimetrele":"fotopolarimetru","fotopolarimetrelor":"fotopolarimetru","fotopolarimetruul":"fotopolarimetru","fotopolarimetruule":"fotopolarimetru","fotopolarimetruului":"fotopolarimetru","fotopsia":"fotopsie","fotopsiei":"fotopsie","fotopsii":"fotopsie","fotopsiile":"fotopsie","fotopsiilor":"fotopsie","fotoreactia":"fotoreacție","fotoreactiei":"fotoreacție","fotoreactii":"fotoreacție","fotoreactiile":"fotoreacție","fotoreactiilor":"fotoreacție","fotoreceptori":"fotoreceptor","fotoreceptorii":"fotoreceptor","fotoreceptorilor":"fotoreceptor","fotoreceptorul":"fotoreceptor","fotoreceptorule":"fotoreceptor","fotoreceptorului":"fotoreceptor","fotoreportaje":"fotoreportaj","fotoreportajele":"fotoreportaj","fotoreportajelor":"fotoreportaj","fotoreportajul":"fotoreportaj","fotoreportajule":"fotoreportaj","fotoreportajului":"fotoreportaj","fotoreportere":"fotoreporteră","fotoreporterei":"fotoreporteră","fotoreporterele":"fotoreporteră","fotoreporterelor":"fotoreporteră","fotoreporteri":"fotoreporter","fotoreporterii":"fotoreporter","fotoreporterilor":"fotoreporter","fotoreporterul":"fotoreporter","fotoreporterule":"fotoreporter","fotoreporterului":"fotoreporter","fotoreproducerea":"fotoreproducere","fotoreproduceri":"fotoreproducere","fotoreproducerii":"fotoreproducere","fotoreproducerile":"fotoreproducere","fotoreproducerilor":"fotoreproducere","fotorezistiva":["fotorezistivă","fotorezistiv","fotorezistiva","fotorezistiv"],"fotorezistive":"fotorezistiv","fotorezistivele":"fotorezistiv","fotorezistivi":"fotorezistiv","fotorezistivii":"fotorezistiv","fotorezistivul":"fotorezistiv","fotorezistoare":"fotorezistor","fotorezistoarele":"fotorezistor","fotorezistoarelor":"fotorezistor","fotorezistorul":"fotorezistor","fotorezistorule":"fotorezistor","fotorezistorului":"fotorezistor","fotosculpture":"fotosculptură","fotosculpturei":"fotosculptură","fotosculpturele":"fotosculptură","fotosculpturelor":"fotosculptură","fotosculpturi":"fotosculptură","fotosensibila":["fotosensibilă","fotosensibil","fotosensibila","fotosensibil"],"fotosensibile":"fotosensibil","fotosensibilele":"fotosensibil","fotosensibili":"fotosensibil","fotosensibilii":"fotosensibil","fotosensibilitatea":"fotosensibilitate","fotosensibilitati":"fotosensibilitate","fotosensibilitatii":"fotosensibilitate","fotosensibilitatile":"fotosensibilitate","fotosensibilitatilor":"fotosensibilitate","fotosensibilizarea":"fotosensibilizare","fotosensibilizari":"fotosensibilizare","fotosensibilizarii":"fotosensibilizare","fotosensibilizarile":"fotosensibilizare","fotosensibilizarilor":"fotosensibilizare","fotosensibilul":"fotosensibil","fotosfere":"fotosferă","fotosferei":"fotosferă","fotosferele":"fotosferă","fotosferelor":"fotosferă","fotosferica":["fotosferică","fotosferic","fotosferica","fotosferic"],"fotosferice":"fotosferic","fotosfericele":"fotosferic","fotosferici":"fotosferic","fotosfericii":"fotosferic","fotosfericul":"fotosferic","fotosintetica":["fotosintetică","fotosintetic","fotosintetica","fotosintetic"],"fotosintetice":"fotosintetic","fotosinteticele":"fotosintetic","fotosintetici":"fotosintetic","fotosinteticii":"fotosintetic","fotosinteticul":"fotosintetic","fotosintetizanta":["fotosintetizantă","fotosintetizant","fotosintetizanta","fotosintetizant"],"fotosintetizante":"fotosintetizant","fotosintetizantele":"fotosintetizant","fotosintetizanti":"fotosintetizant","fotosintetizantii":"fotosintetizant","fotosintetizantul":"fotosintetizant","fotosintetizatoare":"fotosintetizator","fotosintetizatoarea":"fotosintetizator","fotosintetizatoarele":"fotosintetizator","fotosintetizatori":"fotosintetizator","fotosintetizatorii":"fotosintetizator","fotosintetizatorul":"fotosintetizator","fotosinteze":"fotosinteză","fotosintezei":"fotosinteză","fotosintezele":"fotosinteză","fotosintezelor":"fotosinteză","fotostate":"fotostat","fotostatele":"fotostat","fotostatelor":"fotostat","fotostatul":"fotostat","fotostatule":"fotostat","fotostatului":"fotostat","fototactisme":"fototactism","fototactismele":"fototactism","fototactismelor":"fototactism","fototactismul":"fototactism","fototactismule":"fototactism","fototactismului":"fototactism","fototaxia":"fototaxie","fototaxiei":"fototaxie","fototaxii":"fototaxie","fototaxiile":"fototaxie","fototaxiilor":"fototaxie","fototeci":"fototecă","fototecii":"fototecă","fototecile":"fototecă","fototecilor":"fototecă","fototelegrafe":"fototelegraf","fototelegrafele":"fototelegraf","fototelegrafelor":"fototelegraf","fototelegrafia":"fototelegrafie","fototelegrafica":["fototelegrafică","fototelegrafic","fototelegrafica","fototelegrafic"],"fototelegrafice":"fototelegrafic","fototelegraficele":"fototelegrafic","fototelegrafici":"fototelegrafic","fototelegraficii":"fototelegrafic","fototelegraficul":"fototelegrafic","fototelegrafiei":"fototelegrafie","fototelegrafii":"fototelegrafie","fototelegraful":"fototelegraf","fototelegrafule":"fototelegraf","fototelegrafului":"fototelegraf","fototelegrame":"fototelegramă","fototelegramei":"fototelegramă","fototelegramele":"fototelegramă","fototelegramelor":"fototelegramă","fototeodolite":"fototeodolit","fototeodolitele":"fototeodolit","fototeodolitelor":"fototeodolit","fototeodolitul":"fototeodolit","fototeodolitule":"fototeodolit","fototeodolitului":"fototeodolit","fototerapia":"fototerapie","fototerapica":["fototerapică","fototerapic","fototerapica","fototerapic"],"fototerapice":"fototerapic","fototerapicele":"fototerapic","fototerapici":"fototerapic","fototerapicii":"fototerapic","fototerapicul":"fototerapic","fototerapiei":"fototerapie","fototerapii":"fototerapie","fototerapiile":"fototerapie","fototerapiilor":"fototerapie","fototipia":"fototipie","fototipiei":"fototipie","fototipii":"fototipie","fototipiile":"fototipie","fototipiilor":"fototipie","fototiristoare":"fototiristor","fototiristoarele":"fototiristor","fototiristoarelor":"fototiristor","fototiristorul":"fototiristor","fototiristorule":"fototiristor","fototiristorului":"fototiristor","fototopografia":"fototopografie","fototopografiei":"fototopografie","fototopografii":"fototopografie","fototopografiile":"fototopografie","fototopografiilor":"fototopografie","fototranzistoare":"fototranzistor","fototranzistoarele":"fototranzistor","fototranzistoarelor":"fototranzistor","fototranzistorul":"fototranzistor","fototranzistorule":"fototranzistor","fototranzistorului":"fototranzistor","fototriangulatia":"fototriangulație","fototriangulatiei":"fototriangulație","fototriangulatii":"fototriangulație","fototriangulatiile":"fototriangulație","fototriangulatiilor":"fototriangulație","fototropia":"fototropie","fototropica":["fototropică","fototropic","fototropica","fototropic"],"fototropice":"fototropic","fototropicele":"fototropic","fototropici":"fototropic","fototropicii":"fototropic","fototropicul":"fototropic","fototropiei":"fototropie","fototropii":"fototropie","fototropisme":"fototropism","fototropismele":"fototropism","fototropismelor":"fototropism","fototropismul":"fototropism","fototropismule":"fototropism","fototropismului":"fototropism","fotovoltaica":["fotovoltaică","fotovoltaic","fotovoltaica","fotovoltaic"],"fotovoltaice":"fotovoltaic","fotovoltaicele":"fotovoltaic","fotovoltaici":"fotovoltaic","fotovoltaicii":"fotovoltaic","fotovoltaicul":"fotovoltaic","fotozincografia":"fotozincografie","fotozincografiei":"fotozincografie","fotozincografii":"fotozincografie","fotozincografiile":"fotozincografie","fotozincografiilor":"fotozincografie","fourierisme":"fourierism","fourierismele":"fourierism","fourierismelor":"fourierism","fourierismul":"fourierism","fourierismule":"fourierism","fourierismului":"fourierism","fourierista":["fourieristă","fourierist","fourierista","fourierist"],"fourieriste":"fourierist","fourieristele":"fourierist","fourieristi":"fourierist","fourieristii":"fourierist","fourieristul":"fourierist","fovi":"fov","fovii":"fov","fovilor":"fov","fovisme":"fovism","fovismele":"fovism","fovismelor":"fovism","fovismul":"fovism","fovismule":"fovism","fovismului":"fovism","fovisti":"fovist","fovistii":"fovist","fovistilor":"fovist","fovistul":"fovist","fovistule":"fovist","fovistului":"fovist","fovul":"fov","fovule":"fov","fovului":"fov","fox sarmosi":"fox sârmos","foxterieri":"foxterier","foxterierii":"foxterier","foxterierilor":"foxterier","foxterierul":"foxterier","foxterierule":"foxterier","foxterierului":"foxterier","foxtrotul":"foxtrot","foxtrotule":"foxtrot","foxtrotului":"foxtrot","foxtroturi":"foxtrot","foxtroturile":"foxtrot","foxtroturilor":"foxtrot","foxul":"fox","foxule":"fox","foxului":"fox","fractia":"fracție","fractiei":"fracție","fractii":"fracție","fractii zecimale":"fracție zecimală","fractiile":"fracție","fractiilor":"fracție","fractionai":"fracționa","fractionala":["fracțională","fracțional","fracționala","fracțional"],"fractionale":"fracțional","fractionalele":"fracțional","fractionali":"fracțional","fractionalii":"fracțional","fractionalul":"fracțional","fractionam":["fracționăm","fracționa","fracționam","fracționa"],"fractionand":"fracționa","fractionara":["fracționară","fracționa","fracționară","fracționar","fracționara","fracționar"],"fractionaram":"fracționa","fractionarati":"fracționa","fractionare":"fracționar","fractionarea":"fracționare","fractionarele":"fracționar","fractionari":["fracționari","fracționar","fracționări","fracționare"],"fractionarii":["fracționarii","fracționar","fracționării","fracționare"],"fractionarile":"fracționare","fractionarilor":"fracționare","fractionarul":"fracționar","fractionase":"fracționa","fractionasem":"fracționa","fractionasera":"fracționa","fractionaseram":"fracționa","fractionaserati":"fracționa","fractionasesi":"fracționa","fractionasi":"fracționa","fractionat":"fracționa","fractionata":["fracționată","fracționat","fracționata","fracționat"],"fractionate":"fracționat","fractionatele":"fracționat","fractionati":["fracționați","fracționa","fracționați","fracționat"],"fractionatii":"fracționat","fractionatul":"fracționat","fractionau":"fracționa","fractioneaza":"fracționa","fractionez":"fracționa","fractionezi":"fracționa","fractionisme":"fracționism","fractionismele":"fracționism","fractionismelor":"fracționism","fractionismul":"fracționism","fractionismule":"fracționism","fractionismului":"fracționism","fractionista":["fracționistă","fracționist","fracționista","fracționist"],"fractioniste":["fracționiste","fracționist","fracționiste","fracționistă"],"fractionistei":"fracționistă","fractionistele":["fracționistele","fracționist","fracționistele","fracționistă"],"fractionistelor":"fracționistă","fractionisti":"fracționist","fractionistii":"fracționist","fractionistul":"fracționist","fractiunea":"fracțiune","fractiuni":"fracțiune","fractiunii":"fracțiune","fractiunile":"fracțiune","fractiunilor":"fracțiune","fractocumulusul":"fractocumulus","fractocumulusule":"fractocumulus","fractocumulusului":"fractocumulus","fractocumulusuri":"fractocumulus","fractocumulusurile":"fractocumulus","fractocumulusurilor":"fractocumulus","fracturai":"fractura","fracturam":["fracturăm","fractura","fracturam","fractura"],"fracturand":"fractura","fracturara":"fractura","fracturaram":"fractura","fracturarati":"fractura","fracturarea":"fracturare","fracturari":"fracturare","fracturarii":"fracturare","fracturarile":"fracturare","fracturarilor":"fracturare","fracturase":"fractura","fracturasem":"fractura","fracturasera":"fractura","fracturaseram":"fractura","fracturaserati":"fractura","fracturasesi":"fractura","fracturasi":"fractura","fracturat":"fractura","fracturata":["fracturată","fracturat","fracturata","fracturat"],"fracturate":"fracturat","fracturatele":"fracturat","fracturati":["fracturați","fractura","fracturați","fracturat"],"fracturatii":"fracturat","fracturatul":"fracturat","fracturau":"fractura","fractureaza":"fractura","fracturez":"fractura","fracturezi":"fractura","fracturi":"fractură","fracturii":"fractură","fracturile":"fractură","fracturilor":"fractură","fracturul":"fractur","fracturule":"fractur","fracturului":"fractur","fractururi":"fractur","fractururile":"fractur","fractururilor":"fractur","fracul":"frac","fracule":"frac","fracului":"frac","fracuri":"frac","fracurile":"frac","fracurilor":"frac","fragari":"frăgar","fragarii":"frăgar","fragarilor":"frăgar","fragarul":"frăgar","fragarule":"frăgar","fragarului":"frăgar","frageda":["fragedă","fraged","frageda","fraged"],"fragede":"fraged","fragedele":"fraged","fragedul":"fraged","fragezea":"frăgezi","fragezeai":"frăgezi","fragezeam":"frăgezi","fragezeati":"frăgezi","fragezeau":"frăgezi","fragezesc":"frăgezi","fragezeste":"frăgezi","fragezesti":"frăgezi","fragezi":"fraged","fragezia":"frăgezie","frageziei":"frăgezie","fragezii":["fragezii","fraged","frăgezii","frăgezi","frăgezii","frăgezie"],"fragezim":"frăgezi","fragezimea":"frăgezime","fragezimi":"frăgezime","fragezimii":"frăgezime","fragezind":"frăgezi","fragezira":"frăgezi","frageziram":"frăgezi","fragezirati":"frăgezi","fragezirea":"frăgezire","frageziri":"frăgezire","fragezirii":"frăgezire","fragezirile":"frăgezire","fragezirilor":"frăgezire","fragezise":"frăgezi","fragezisem":"frăgezi","fragezisera":"frăgezi","frageziseram":"frăgezi","frageziserati":"frăgezi","fragezisesi":"frăgezi","fragezisi":"frăgezi","fragezit":"frăgezi","fragezita":["frăgezită","frăgezit","frăgezita","frăgezit"],"fragezite":"frăgezit","fragezitele":"frăgezit","frageziti":["frăgeziți","frăgezi","frăgeziți","frăgezit"],"fragezitii":"frăgezit","fragezitul":"frăgezit","fragi":["fragi","frag","fragi","fragă"],"fragii":["fragii","frag","fragii","fragă"],"fragila":["fragilă","fragil","fragila","fragil"],"fragile":["fragile","fragă","fragile","fragil"],"fragilele":"fragil","fragili":"fragil","fragilii":"fragil","fragilitatea":"fragilitate","fragilitati":"fragilitate","fragilitatii":"fragilitate","fragilizarea":"fragilizare","fragilizari":"fragilizare","fragilizarii":"fragilizare","fragilor":["fragilor","frag","fragilor","fragă"],"fragilul":"fragil","fragmentai":"fragmenta","fragmentam":["fragmentăm","fragmenta","fragmentam","fragmenta"],"fragmentand":"fragmenta","fragmentara":["fragmentară","fragmenta","fragmentară","fragmentar","fragmentara","fragmentar"],"fragmentaram":"fragmenta","fragmentarati":"fragmenta","fragmentare":"fragmentar","fragmentarea":"fragmentare","fragmentarele":"fragmentar","fragmentari":["fragmentari","fragmentar","fragmentări","fragmentare"],"fragmentarii":["fragmentarii","fragmentar","fragmentării","fragmentare"],"fragmentarile":"fragmentare","fragmentarilor":"fragmentare","fragmentarul":"fragmentar","fragmentase":"fragmenta","fragmentasem":"fragmenta","fragmentasera":"fragmenta","fragmentaseram":"fragmenta","fragmentaserati":"fragmenta","fragmentasesi":"fragmenta","fragmentasi":"fragmenta","fragmentat":"fragmenta","fragmentata":["fragmentată","fragmentat","fragmentata","fragmentat"],"fragmentate":"fragmentat","fragmentatele":"fragmentat","fragmentati":["fragmentați","fragmenta","fragmentați","fragmentat"],"fragmentatia":"fragmentație","fragmentatiei":"fragmentație","fragmentatii":["fragmentații","fragmentat","fragmentații","fragmentație"],"fragmentatiile":"fragmentație","fragmentatiilor":"fragmentație","fragmentatiunea":"fragmentațiune","fragmentatiuni":"fragmentațiune","fragmentatiunii":"fragmentațiune","fragmentatiunile":"fragmentațiune","fragmentatiunilor":"fragmentațiune","fragmentatul":"fragmentat","fragmentau":"fragmenta","fragmente":"fragment","fragmenteaza":"fragmenta","fragmentele":"fragment","fragmentelor":"fragment","fragmentez":"fragmenta","fragmentezi":"fragmenta","fragmentul":"fragment","fragmentule":"fragment","fragmentului":"fragment","fragranta":["fragrantă","fragrant","fragranta","fragrant"],"fragrante":["fragrante","fragrant","fragranțe","fragranță"],"fragrantei":"fragranță","fragrantele":["fragrantele","fragrant","fragranțele","fragranță"],"fragrantelor":"fragranță","fragranti":"fragrant","fragrantii":"fragrant","fragrantul":"fragrant","fragul":"frag","fragule":"frag","fragulite":"frăguliță","fragulitei":"frăguliță","fragulitele":"frăguliță","fragulitelor":"frăguliță","fragului":"frag","fragusoare":"frăgușoară","fragusoarei":"frăgușoară","fragusoarele":"frăgușoară","fragusoarelor":"frăgușoară","fragusori":"frăgușor","fragusorii":"frăgușor","fragusorilor":"frăgușor","fragusorul":"frăgușor","fragusorule":"frăgușor","fragusorului":"frăgușor","fragute":["frăguțe","fraguță","frăguțe","frăguță"],"fragutei":["frăguței","fraguță","frăguței","frăguță"],"fragutele":["frăguțele","fraguță","frăguțele","frăguță"],"fragutelor":["frăguțelor","fraguță","frăguțelor","frăguță"],"frahtul":"fraht","frahtule":"fraht","frahtului":"fraht","frahturi":"fraht","frahturile":"fraht","frahturilor":"fraht","fraidorf":"Freidorf","fraie":"frâu","fraiele":"frâu","fraielor":"frâu","fraiere":"fraieră","fraierea":"fraieri","fraiereai":"fraieri","fraieream":"fraieri","fraiereati":"fraieri","fraiereau":"fraieri","fraierei":"fraieră","fraierele":["fraierele","fraieră","fraierele","fraiereală"],"fraierelei":"fraiereală","fraierelele":"fraiereală","fraierelelor":"fraiereală","fraiereli":"fraiereală","fraierelor":"fraieră","fraieresc":"fraieri","fraiereste":"fraieri","fraieresti":"fraieri","fraieri":"fraier","fraierii":["fraierii","fraier","fraierii","fraieri"],"fraierilor":"fraier","fraierim":"fraieri","fraierind":"fraieri","fraierira":"fraieri","fraieriram":"fraieri","fraierirati":"fraieri","fraierise":"fraieri","fraierisem":"fraieri","fraierisera":"fraieri","fraieriseram":"fraieri","fraieriserati":"fraieri","fraierisesi":"fraieri","fraierisi":"fraieri","fraierit":"fraieri","fraieriti":"fraieri","fraierul":"fraier","fraierule":"fraier","fraierului":"fraier","fraisoare":"frâișor","fraisoarele":"frâișor","fraisoarelor":"frâișor","fraisorul":"frâișor","fraisorule":"frâișor","fraisorului":"frâișor","framant":"frământa","framantai":"frământa","framantam":["frământăm","frământa","frământam","frământa"],"framantand":"frământa","framantara":"frământa","framantaram":"frământa","framantarati":"frământa","framantarea":"frământare","framantari":"frământare","framantarii":"frământare","framantarile":"frământare","framantarilor":"frământare","framantase":"frământa","framantasem":"frământa","framantasera":"frământa","framantaseram":"frământa","framantaserati":"frământa","framantasesi":"frământa","framantasi":"frământa","framantat":"frământa","framantata":["frământată","frământat","frământata","frământat"],"framantate":"frământat","framantatele":"frământat","framantati":["frământați","frământa","frământați","frământat"],"framantatii":"frământat","framantatoare":"frământător","framantatoarele":"frământător","framantatoarelor":"frământător","framantatorul":"frământător","framantatorule":"frământător","framantatorului":"frământător"};
@@ -0,0 +1 @@
+export default {"framantatul":"frământat","framantaturi":"frământătură","framantaturii":"frământătură","framantaturile":"frământătură","framantaturilor":"frământătură","framantau":"frământa","framante":"frământa","framanti":"frământa","framantul":"frământ","framantule":"frământ","framantului":"frământ","frambia":"frâmbie","frambiata":["frâmbiată","frâmbiat","frâmbiata","frâmbiat"],"frambiate":"frâmbiat","frambiatele":"frâmbiat","frambiati":"frâmbiat","frambiatii":"frâmbiat","frambiatul":"frâmbiat","frambie":"frânghie","frambiei":"frâmbie","frambii":"frâmbie","frambiile":"frâmbie","frambiilor":"frâmbie","framinta":"frământa","franai":"frâna","franaje":"frânaj","franajele":"frânaj","franajelor":"frânaj","franajul":"frânaj","franajule":"frânaj","franajului":"frânaj","franam":["frânăm","frâna","frânam","frâna"],"franand":"frâna","franara":"frâna","franaram":"frâna","franarati":"frâna","franarea":"frânare","franari":["frânari","frânar","frânări","frânare"],"franarii":["frânarii","frânar","frânării","frânare"],"franarile":"frânare","franarilor":["frânarilor","frânar","frânărilor","frânare"],"franarul":"frânar","franarule":"frânar","franarului":"frânar","franase":"frâna","franasem":"frâna","franasera":"frâna","franaseram":"frâna","franaserati":"frâna","franasesi":"frâna","franasi":"frâna","franat":"frâna","franati":"frâna","franatul":"frânat","franatule":"frânat","franatului":"frânat","franau":"frâna","franca":["francă","franc","franca","franc"],"francai":"franca","francam":["francăm","franca","francam","franca"],"francand":"franca","francara":"franca","francaram":"franca","francarati":"franca","francarea":"francare","francari":"francare","francarii":"francare","francarile":"francare","francarilor":"francare","francase":"franca","francasem":"franca","francasera":"franca","francaseram":"franca","francaserati":"franca","francasesi":"franca","francasi":"franca","francat":"franca","francata":["francată","francat","francata","francat"],"francate":"francat","francatele":"francat","francati":["francați","franca","francați","francat"],"francatii":"francat","francatul":"francat","francature":"francatură","francaturei":"francatură","francaturele":"francatură","francaturelor":"francatură","francaturi":"francatură","francau":"franca","france":["france","franc","frânce","frâncă"],"franceasca":["frâncească","frâncesc","frânceasca","frâncesc"],"francei":"frâncă","francele":["francele","franc","frâncele","frâncă"],"francelor":"frâncă","francescul":"frâncesc","francesti":"frâncesc","francestii":"frâncesc","francestile":"frâncesc","franceza":["franceză","francez","franceza","francez"],"franceze":["franceze","francez","franceze","franceză"],"francezei":"franceză","francezele":["francezele","francez","francezele","franceză"],"francezelor":"franceză","francezi":"francez","francezii":"francez","francezilor":"francez","francezul":"francez","francezule":"francez","francezului":"francez","francheaza":"franca","franchete":"francheță","franchetea":"franchețe","franchetei":["francheței","francheță","francheței","franchețe"],"franchez":"franca","franchezi":"franca","franchismul":"franchism","franchismule":"franchism","franchismului":"franchism","franchista":["franchistă","franchist","franchista","franchist"],"franchiste":"franchist","franchistele":"franchist","franchisti":"franchist","franchistii":"franchist","franchistul":"franchist","franci":["franci","franc","frânci","frânc"],"francia":"frâncie","franciei":"frâncie","francii":["francii","franc","frâncii","frânc","frâncii","frâncie"],"francilor":["francilor","franc","frâncilor","frânc"],"franciscane":"franciscană","franciscanei":"franciscană","franciscanele":"franciscană","franciscanelor":"franciscană","franciscani":"franciscan","franciscanii":"franciscan","franciscanilor":"franciscan","franciscanismul":"franciscanism","franciscanismule":"franciscanism","franciscanismului":"franciscanism","franciscanul":"franciscan","franciscanule":"franciscan","franciscanului":"franciscan","franciste":"franciscă","francistei":"franciscă","francistele":"franciscă","francistelor":"franciscă","franciul":"franciu","franciule":"franciu","franciului":"franciu","francizai":"franciza","francizam":["francizăm","franciza","francizam","franciza"],"francizand":"franciza","francizara":"franciza","francizaram":"franciza","francizarati":"franciza","francizarea":"francizare","francizari":"francizare","francizarii":"francizare","francizarile":"francizare","francizarilor":"francizare","francizase":"franciza","francizasem":"franciza","francizasera":"franciza","francizaseram":"franciza","francizaserati":"franciza","francizasesi":"franciza","francizasi":"franciza","francizat":"franciza","francizata":["francizată","francizat","francizata","francizat"],"francizate":"francizat","francizatele":"francizat","francizati":["francizați","franciza","francizați","francizat"],"francizatii":"francizat","francizatul":"francizat","francizau":"franciza","francize":"franciză","francizeaza":"franciza","francizei":"franciză","francizele":"franciză","francizelor":"franciză","francizez":"franciza","francizezi":"franciza","francizori":"francizor","francizorii":"francizor","francizorilor":"francizor","francizorul":"francizor","francizorule":"francizor","francizorului":"francizor","francmasoneria":"francmasonerie","francmasoneriei":"francmasonerie","francmasonerii":"francmasonerie","francmasoneriile":"francmasonerie","francmasoneriilor":"francmasonerie","francmasoni":"francmason","francmasonia":"francmasonie","francmasonica":["francmasonică","francmasonic","francmasonica","francmasonic"],"francmasonice":"francmasonic","francmasonicele":"francmasonic","francmasonici":"francmasonic","francmasonicii":"francmasonic","francmasonicul":"francmasonic","francmasoniei":"francmasonie","francmasonii":["francmasonii","francmason","francmasonii","francmasonie"],"francmasonilor":"francmason","francmasonul":"francmason","francmasonule":"francmason","francmasonului":"francmason","francofile":"francofilă","francofilei":"francofilă","francofilele":"francofilă","francofilelor":"francofilă","francofili":"francofil","francofilia":"francofilie","francofiliei":"francofilie","francofilii":["francofilii","francofil","francofilii","francofilie"],"francofiliile":"francofilie","francofiliilor":"francofilie","francofililor":"francofil","francofilul":"francofil","francofilule":"francofil","francofilului":"francofil","francofoane":"francofoană","francofoanei":"francofoană","francofoanele":"francofoană","francofoanelor":"francofoană","francofobia":"francofobie","francofobiei":"francofobie","francofobii":"francofobie","francofobiile":"francofobie","francofobiilor":"francofobie","francofone":"francofonă","francofonei":"francofonă","francofonele":"francofonă","francofonelor":"francofonă","francofoni":"francofon","francofonia":"francofonie","francofoniei":"francofonie","francofonii":["francofonii","francofon","francofonii","francofonie"],"francofonilor":"francofon","francofonul":"francofon","francofonule":"francofon","francofonului":"francofon","franctirori":"franctiror","franctirorii":"franctiror","franctirorilor":"franctiror","franctirorul":"franctiror","franctirorule":"franctiror","franctirorului":"franctiror","francuiele":"frăncuială","francuielei":"frăncuială","francuielele":"frăncuială","francuielelor":"frăncuială","francuieli":"frăncuială","francul":["francul","franc","frâncul","frânc"],"francule":["francule","franc","frâncule","frânc"],"francului":["francului","franc","frâncului","frânc"],"francuse":"frâncușă","francusei":"frâncușă","francusele":"frâncușă","francuselor":"frâncușă","francusori":"frăncușor","francusorii":"frăncușor","francusorilor":"frăncușor","francusorul":"frăncușor","francusorule":"frăncușor","francusorului":"frăncușor","francuti":"frăncuț","francutii":"frăncuț","francutilor":"frăncuț","francutul":"frăncuț","francutule":"frăncuț","francutului":"frăncuț","frane":"frână","franeaza":"frâna","franei":"frână","franele":"frână","franelor":"frână","franete":"frâneț","franetele":"frâneț","franetelor":"frâneț","franetul":"frâneț","franetule":"frâneț","franetului":"frâneț","franez":"frâna","franezi":"frâna","frang":["frâng","frânge","frâng","frângi"],"franga":"frânge","frangand":"frânge","frange":"frângi","frangea":["frângea","frânge","frângea","frângi"],"frangeai":["frângeai","frânge","frângeai","frângi"],"frangeam":["frângeam","frânge","frângeam","frângi"],"frangeati":["frângeați","frânge","frângeați","frângi"],"frangeau":["frângeau","frânge","frângeau","frângi"],"frangem":"frânge","frangerea":"frângere","frangeri":"frângere","frangerii":"frângere","frangerile":"frângere","frangerilor":"frângere","frangeti":"frânge","franghia":"frânghie","franghiei":"frânghie","franghieri":"frânghier","franghieria":"frânghierie","franghieriei":"frânghierie","franghierii":["frânghierii","frânghier","frânghierii","frânghierie"],"franghieriile":"frânghierie","franghieriilor":"frânghierie","franghierilor":"frânghier","franghieritul":"frânghierit","franghieritule":"frânghierit","franghieritului":"frânghierit","franghierul":"frânghier","franghierule":"frânghier","franghierului":"frânghier","franghii":"frânghie","franghiile":"frânghie","franghiilor":"frânghie","franghioare":"frânghioară","franghioarei":"frânghioară","franghioarele":"frânghioară","franghioarelor":"frânghioară","franghiute":"frânghiuță","franghiutei":"frânghiuță","franghiutele":"frânghiuță","franghiutelor":"frânghiuță","frangi":"frânge","frangie":"frângi","frangii":"frângi","frangim":"frângi","frangind":"frângi","frangira":"frângi","frangiram":"frângi","frangirati":"frângi","frangise":"frângi","frangisem":"frângi","frangisera":"frângi","frangiseram":"frângi","frangiserati":"frângi","frangisesi":"frângi","frangisi":"frângi","frangit":"frângi","frangiti":"frângi","frangulia":"frangulie","franguliei":"frangulie","frangulii":"frangulie","franguliile":"frangulie","franguliilor":"frangulie","franitica":["frănitică","frănitic","frănitica","frănitic"],"franitice":"frănitic","franiticele":"frănitic","franitici":"frănitic","franiticii":"frănitic","franiticul":"frănitic","franje":"franjă","franjei":"franjă","franjele":"franjă","franjelor":"franjă","franjul":"franj","franjule":"franj","franjului":"franj","franjurai":"franjura","franjuram":["franjurăm","franjura","franjuram","franjura"],"franjurand":"franjura","franjurara":"franjura","franjuraram":"franjura","franjurarati":"franjura","franjurase":"franjura","franjurasem":"franjura","franjurasera":"franjura","franjuraseram":"franjura","franjuraserati":"franjura","franjurasesi":"franjura","franjurasi":"franjura","franjurat":"franjura","franjurata":["franjurată","franjurat","franjurata","franjurat"],"franjurate":"franjurat","franjuratele":"franjurat","franjurati":["franjurați","franjura","franjurați","franjurat"],"franjuratii":"franjurat","franjuratul":"franjurat","franjurau":"franjura","franjureaza":"franjura","franjurez":"franjura","franjurezi":"franjura","franjuri":"franj","franjurile":"franj","franjurilor":"franj","fransa":["franșă","franș","franșa","franș"],"franse":["frânse","frânge","franșe","franș"],"fransei":"frânge","fransele":"franș","fransera":"frânge","franseram":"frânge","franserati":"frânge","fransese":"frânge","fransesem":"frânge","fransesera":"frânge","franseseram":"frânge","franseserati":"frânge","fransesesi":"frânge","fransesi":"frânge","fransi":"franș","fransii":"franș","fransize":"franșiză","fransizei":"franșiză","fransizele":"franșiză","fransizelor":"franșiză","fransul":"franș","frant":"frânge","franta":["frântă","frânt","frânta","frânt"],"frante":["frânte","frânt","franțe","Franța"],"frantei":"Franța","frantele":"frânt","franteza":["franțeză","franțez","franțeza","franțez"],"franteze":"franțez","frantezele":"franțez","frantezi":"franțez","frantezii":"franțez","frantezilor":"franțez","frantezul":"franțez","frantezule":"franțez","frantezului":"franțez","franti":"frânt","frantii":"frânt","frantoarea":"frântoare","frantori":"frântoare","frantorii":"frântoare","frantorile":"frântoare","frantorilor":"frântoare","frantozi":"franțoz","frantozii":"franțoz","frantozilor":"franțoz","frantozita":["franțozită","franțozit","franțozita","franțozit"],"frantozite":"franțozit","frantozitele":"franțozit","frantoziti":"franțozit","frantozitii":"franțozit","frantozitul":"franțozit","frantozul":"franțoz","frantozule":"franțoz","frantozului":"franțoz","frantuji":"franțuz","frantujii":"franțuz","frantujilor":"franțuz","frantul":"frânt","franturi":"frântură","franturii":"frântură","franturile":"frântură","franturilor":"frântură","frantuste":"franțușcă","frantustei":"franțușcă","frantustele":"franțușcă","frantustelor":"franțușcă","frantuzea":"franțuzi","frantuzeai":"franțuzi","frantuzeam":"franțuzi","frantuzeasca":["franțuzească","franțuzesc","franțuzeasca","franțuzesc"],"frantuzeati":"franțuzi","frantuzeau":"franțuzi","frantuzesc":"franțuzi","frantuzescul":"franțuzesc","frantuzeste":"franțuzi","frantuzesti":["franțuzești","franțuzesc","franțuzești","franțuzi"],"frantuzestii":"franțuzesc","frantuzestile":"franțuzesc","frantuzii":"franțuzi","frantuzim":"franțuzi","frantuzind":"franțuzi","frantuzira":"franțuzi","frantuziram":"franțuzi","frantuzirati":"franțuzi","frantuzirea":"franțuzire","frantuziri":"franțuzire","frantuzirii":"franțuzire","frantuzirile":"franțuzire","frantuzirilor":"franțuzire","frantuzise":"franțuzi","frantuzisem":"franțuzi","frantuzisera":"franțuzi","frantuziseram":"franțuzi","frantuziserati":"franțuzi","frantuzisesi":"franțuzi","frantuzisi":"franțuzi","frantuzisme":"franțuzism","frantuzismele":"franțuzism","frantuzismelor":"franțuzism","frantuzismul":"franțuzism","frantuzismule":"franțuzism","frantuzismului":"franțuzism","frantuzista":["franțuzistă","franțuzist","franțuzista","franțuzist"],"frantuziste":"franțuzist","frantuzistele":"franțuzist","frantuzisti":"franțuzist","frantuzistii":"franțuzist","frantuzistul":"franțuzist","frantuzit":"franțuzi","frantuzita":["franțuzită","franțuzit","franțuzita","franțuzit"],"frantuzite":"franțuzit","frantuzitele":"franțuzit","frantuziti":["franțuziți","franțuzi","franțuziți","franțuzit"],"frantuzitii":"franțuzit","frantuzitul":"franțuzit","frantuzoaice":"franțuzoaică","frantuzoaicei":"franțuzoaică","frantuzoaicele":"franțuzoaică","frantuzoaicelor":"franțuzoaică","frantuzul":"franțuz","frantuzule":"franțuz","frantuzului":"franțuz","franzelarese":"franzelăreasă","franzelaresei":"franzelăreasă","franzelaresele":"franzelăreasă","franzelareselor":"franzelăreasă","franzelari":"franzelar","franzelaria":"franzelărie","franzelariei":"franzelărie","franzelarii":["franzelarii","franzelar","franzelării","franzelărie"],"franzelariile":"franzelărie","franzelariilor":"franzelărie","franzelarilor":"franzelar","franzelarul":"franzelar","franzelarule":"franzelar","franzelarului":"franzelar","franzele":"franzelă","franzelei":"franzelă","franzelele":"franzelă","franzelelor":"franzelă","franzelute":"franzeluță","franzelutei":"franzeluță","franzelutele":"franzeluță","franzelutelor":"franzeluță","frapai":"frapa","frapam":["frapăm","frapa","frapam","frapa"],"frapand":"frapa","frapanta":["frapantă","frapant","frapanta","frapant"],"frapante":"frapant","frapantele":"frapant","frapanti":"frapant","frapantii":"frapant","frapantul":"frapant","frapara":"frapa","fraparam":"frapa","fraparati":"frapa","frapase":"frapa","frapasem":"frapa","frapasera":"frapa","frapaseram":"frapa","frapaserati":"frapa","frapasesi":"frapa","frapasi":"frapa","frapat":"frapa","frapata":["frapată","frapat","frapata","frapat"],"frapate":"frapat","frapatele":"frapat","frapati":["frapați","frapa","frapați","frapat"],"frapatii":"frapat","frapatul":"frapat","frapau":"frapa","frapeaza":"frapa","frapez":"frapa","frapezi":"frapa","frapiere":"frapieră","frapierei":"frapieră","frapierele":"frapieră","frapierelor":"frapieră","frapsan":"frasin","frascai":"frășcău","frascaii":"frășcău","frascailor":"frășcău","frascauul":"frășcău","frascauule":"frășcău","frascauului":"frășcău","frasinaria":"frăsinărie","frasinariei":"frăsinărie","frasinarii":"frăsinărie","frasinariile":"frăsinărie","frasinariilor":"frăsinărie","frasinei":"frăsinel","frasineli":"frăsinel","frasinelii":"frăsinel","frasinelilor":"frăsinel","frasinelul":"frăsinel","frasinelule":"frăsinel","frasinelului":"frăsinel","frasinetul":"frăsinet","frasinetule":"frăsinet","frasinetului":"frăsinet","frasineturi":"frăsinet","frasineturile":"frăsinet","frasineturilor":"frăsinet","frasini":"frasin","frasinici":"frăsinică","frasinicii":"frăsinică","frasinicile":"frăsinică","frasinicilor":"frăsinică","frasinii":"frasin","frasinilor":"frasin","frasinistea":"frăsiniște","frasinisti":"frăsiniște","frasinistii":"frăsiniște","frasinistile":"frăsiniște","frasinistilor":"frăsiniște","frasinisul":"frăsiniș","frasinisule":"frăsiniș","frasinisului":"frăsiniș","frasinisuri":"frăsiniș","frasinisurile":"frăsiniș","frasinisurilor":"frăsiniș","frasinul":"frasin","frasinule":"frasin","frasinului":"frasin","frasirea":"frăsire","frasiri":"frăsire","frasirii":"frăsire","frasirile":"frăsire","frasirilor":"frăsire","fraste":"frașcă","frastei":"frașcă","frastele":"frașcă","frastelor":"frașcă","frasti":"frașcă","fratanatatati":"frățânătate","fratanatatatii":"frățânătate","fratanatatatile":"frățânătate","fratanatatatilor":"frățânătate","fratanatatea":"frățânătate","frataneul":"frățâne","frataneule":"frățâne","frataneului":"frățâne","fratani":["frățâni","frățân","frățâni","frățâne"],"fratanii":["frățânii","frățân","frățânii","frățâne"],"fratanilor":["frățânilor","frățân","frățânilor","frățâne"],"fratanul":"frățân","fratanule":"frățân","fratanului":"frățân","frateasca":["frățească","frățesc","frățeasca","frățesc"],"fratele":"frate","fratelui":"frate","fratenia":"frățenie","frateniei":"frățenie","fratenii":"frățenie","frateniile":"frățenie","frateniilor":"frățenie","fraterna":["fraternă","fratern","fraterna","fratern"],"fraterne":"fratern","fraternela":["fraternelă","fraternel","fraternela","fraternel"],"fraternele":["fraternele","fratern","fraternele","fraternel"],"fraternelele":"fraternel","fraterneli":"fraternel","fraternelii":"fraternel","fraternelul":"fraternel","fraterni":"fratern","fraternii":"fratern","fraternitatea":"fraternitate","fraternitati":"fraternitate","fraternitatii":"fraternitate","fraternizai":"fraterniza","fraternizam":["fraternizăm","fraterniza","fraternizam","fraterniza"],"fraternizand":"fraterniza","fraternizara":"fraterniza","fraternizaram":"fraterniza","fraternizarati":"fraterniza","fraternizarea":"fraternizare","fraternizari":"fraternizare","fraternizarii":"fraternizare","fraternizarile":"fraternizare","fraternizarilor":"fraternizare","fraternizase":"fraterniza","fraternizasem":"fraterniza","fraternizasera":"fraterniza","fraternizaseram":"fraterniza","fraternizaserati":"fraterniza","fraternizasesi":"fraterniza","fraternizasi":"fraterniza","fraternizat":"fraterniza","fraternizati":"fraterniza","fraternizau":"fraterniza","fraternizeaza":"fraterniza","fraternizez":"fraterniza","fraternizezi":"fraterniza","fraternul":"fratern","fratescul":"frățesc","fratesti":"frățesc","fratestii":"frățesc","fratestile":"frățesc","frati":"frate","frati de lapte":"frate de lapte","frati de sange":"frate de sânge","frati pe jumatate":"frate pe jumătate","frati vitregi":"frate vitreg","fratici":"frătic","fraticii":"frătic","fraticilor":"frătic","fraticul":"frătic","fraticule":"frătic","fraticului":"frătic","fratietatea":"frățietate","fratietatei":"frățietate","fratii":["frații","frate","frății","frăție"],"fratilor":"frate","fratiori":"frățior","fratiorii":"frățior","fratiorilor":"frățior","fratiorul":"frățior","fratiorule":"frățior","fratiorului":"frățior","fratisori":"frățișor","fratisorii":"frățișor","fratisorilor":"frățișor","fratisorul":"frățișor","fratisorule":"frățișor","fratisorului":"frățișor","fratiuci":["frătiuci","frătiuc","frățiuci","frățiuc"],"fratiucii":["frătiucii","frătiuc","frățiucii","frățiuc"],"fratiucilor":["frătiucilor","frătiuc","frățiucilor","frățiuc"],"fratiucul":["frătiucul","frătiuc","frățiucul","frățiuc"],"fratiucule":["frătiucule","frătiuc","frățiucule","frățiuc"],"fratiucului":["frătiucului","frătiuc","frățiucului","frățiuc"],"fratiuluci":"frătiuluc","fratiulucii":"frătiuluc","fratiulucilor":"frătiuluc","fratiulucul":"frătiuluc","fratiulucule":"frătiuluc","fratiulucului":"frătiuluc","fratiuluti":"frătiuluț","fratiulutii":"frătiuluț","fratiulutilor":"frătiuluț","fratiulutul":"frătiuluț","fratiulutule":"frătiuluț","fratiulutului":"frătiuluț","fratiuti":"frătiuț","fratiutii":"frătiuț","fratiutilor":"frătiuț","fratiutul":"frătiuț","fratiutule":"frătiuț","fratiutului":"frătiuț","fratria":"fratrie","fratricida":["fratricidă","fratricid","fratricida","fratricid"],"fratricide":["fratricide","fratricid","fratricide","fratricidă"],"fratricidei":"fratricidă","fratricidele":["fratricidele","fratricid","fratricidele","fratricidă"],"fratricidelor":"fratricidă","fratricidul":"fratricid","fratricizi":"fratricid","fratricizii":"fratricid","fratriei":"fratrie","fratrii":"fratrie","fratriile":"fratrie","fratriilor":"fratrie","fraudai":"frauda","fraudam":["fraudăm","frauda","fraudam","frauda"],"fraudand":"frauda","fraudara":"frauda","fraudaram":"frauda","fraudarati":"frauda","fraudarea":"fraudare","fraudari":"fraudare","fraudarii":"fraudare","fraudarile":"fraudare","fraudarilor":"fraudare","fraudase":"frauda","fraudasem":"frauda","fraudasera":"frauda","fraudaseram":"frauda","fraudaserati":"frauda","fraudasesi":"frauda","fraudasi":"frauda","fraudat":"frauda","fraudati":"frauda","fraudatori":"fraudator","fraudatorii":"fraudator","fraudatorilor":"fraudator","fraudatorul":"fraudator","fraudatorule":"fraudator","fraudatorului":"fraudator","fraudau":"frauda","fraude":"fraudă","fraude fiscale":"fraudă fiscală","fraudeaza":"frauda","fraudei":"fraudă","fraudele":"fraudă","fraudelor":"fraudă","fraudez":"frauda","fraudezi":"frauda","frauduloasa":["frauduloasă","fraudulos","frauduloasa","fraudulos"],"frauduloase":"fraudulos","frauduloasele":"fraudulos","fraudulosi":"fraudulos","fraudulosii":"fraudulos","fraudulosul":"fraudulos","fraul":"frâu","fraule":"frâu","fraulete":"frâuleț","frauletele":"frâuleț","frauletelor":"frâuleț","frauletul":"frâuleț","frauletule":"frâuleț","frauletului":"frâuleț","fraului":"frâu","frausoare":"frâușor","frausoarei":"frâușor","frausoarelor":"frâușor","frausorul":"frâușor","frausorule":"frâușor","frausorului":"frâușor","fraute":"frâuț","frautei":"frâuț","frautelor":"frâuț","frautul":"frâuț","frautule":"frâuț","frautului":"frâuț","frazai":"fraza","frazam":["frazăm","fraza","frazam","fraza"],"frazand":"fraza","frazara":"fraza","frazaram":"fraza","frazarati":"fraza","frazarea":"frazare","frazari":"frazare","frazarii":"frazare","frazarile":"frazare","frazarilor":"frazare","frazase":"fraza","frazasem":"fraza","frazasera":"fraza","frazaseram":"fraza","frazaserati":"fraza","frazasesi":"fraza","frazasi":"fraza","frazat":"fraza","frazati":"fraza","frazau":"fraza","fraze":"frază","frazeaza":"fraza","frazei":"frază","frazele":"frază","frazelor":"frază","frazeologe":"frazeologă","frazeologei":"frazeologă","frazeologele":"frazeologă","frazeologelor":"frazeologă","frazeologi":"frazeolog","frazeologia":"frazeologie","frazeologica":["frazeologică","frazeologic","frazeologica","frazeologic"],"frazeologice":"frazeologic","frazeologicele":"frazeologic","frazeologici":"frazeologic","frazeologicii":"frazeologic","frazeologicul":"frazeologic","frazeologiei":"frazeologie","frazeologii":["frazeologii","frazeolog","frazeologii","frazeologie"],"frazeologiile":"frazeologie","frazeologiilor":"frazeologie","frazeologilor":"frazeolog","frazeologul":"frazeolog","frazeologule":"frazeolog","frazeologului":"frazeolog","frazez":"fraza","frazezi":"fraza","freaca":"freca","freaca menta":"freca menta","freamata":"fremăta","freamate":"freamăt","freamatele":"freamăt","freamatelor":"freamăt","freamatul":"freamăt","freamatule":"freamăt","freamatului":"freamăt","freatica":["freatică","freatic","freatica","freatic"],"freatice":"freatic","freaticele":"freatic","freatici":"freatic","freaticii":"freatic","freaticul":"freatic","frec":"freca","frecai":"freca","frecalauul":"frecălău","frecalauule":"frecălău","frecalauului":"frecălău","frecam":["frecăm","freca","frecam","freca"],"frecand":"freca","frecangii":"frecangiu","frecangiii":"frecangiu","frecangiilor":"frecangiu","frecangiuul":"frecangiu","frecangiuule":"frecangiu","frecangiuului":"frecangiu","frecara":"freca","frecaram":"freca","frecarati":"freca","frecarea":"frecare","frecari":"frecare","frecarii":"frecare","frecarile":"frecare","frecarilor":"frecare","frecase":"freca","frecasem":"freca","frecasera":"freca","frecaseram":"freca","frecaserati":"freca","frecasesi":"freca","frecasi":"freca","frecat":"freca","frecat menta":"freca menta","frecati":"freca","frecatul":"frecat","frecatule":"frecat","frecatului":"frecat","frecaturi":"frecătură","frecaturii":"frecătură","frecaturile":"frecătură","frecaturilor":"frecătură","frecau":"freca","frece":"freca","freci":"freca","frectia":"frecție","frectiei":"frecție","frectii":"frecție","frectiile":"frecție","frectiilor":"frecție","frectionai":"frecționa","frectionam":["frecționăm","frecționa","frecționam","frecționa"],"frectionand":"frecționa","frectionara":"frecționa","frectionaram":"frecționa","frectionarati":"frecționa","frectionase":"frecționa","frectionasem":"frecționa","frectionasera":"frecționa","frectionaseram":"frecționa","frectionaserati":"frecționa","frectionasesi":"frecționa","frectionasi":"frecționa","frectionat":"frecționa","frectionati":"frecționa","frectionau":"frecționa","frectioneaza":"frecționa","frectionez":"frecționa","frectionezi":"frecționa","frecuent":"frecvent","frecusul":"frecuș","frecusule":"frecuș","frecusului":"frecuș","frecusuri":"frecuș","frecusurile":"frecuș","frecusurilor":"frecuș","frecventa":["frecventă","frecvent","frecventa","frecvent"],"frecventabila":["frecventabilă","frecventabil","frecventabila","frecventabil"],"frecventabile":"frecventabil","frecventabilele":"frecventabil","frecventabili":"frecventabil","frecventabilii":"frecventabil","frecventabilul":"frecventabil","frecventai":"frecventa","frecventam":["frecventăm","frecventa","frecventam","frecventa"],"frecventand":"frecventa","frecventara":"frecventa","frecventaram":"frecventa","frecventarati":"frecventa","frecventarea":"frecventare","frecventari":"frecventare","frecventarii":"frecventare","frecventarile":"frecventare","frecventarilor":"frecventare","frecventase":"frecventa","frecventasem":"frecventa","frecventasera":"frecventa","frecventaseram":"frecventa","frecventaserati":"frecventa","frecventasesi":"frecventa","frecventasi":"frecventa","frecventat":"frecventa","frecventati":"frecventa","frecventativa":["frecventativă","frecventativ","frecventativa","frecventativ"],"frecventative":"frecventativ","frecventativele":"frecventativ","frecventativi":"frecventativ","frecventativii":"frecventativ","frecventativul":"frecventativ","frecventatoare":"frecventator","frecventatoarea":["frecventatoarea","frecventatoare","frecventatoarea","frecventator"],"frecventatoarei":"frecventatoare","frecventatoarele":["frecventatoarele","frecventatoare","frecventatoarele","frecventator"],"frecventatoarelor":"frecventatoare","frecventatori":"frecventator","frecventatorii":"frecventator","frecventatorilor":"frecventator","frecventatorul":"frecventator","frecventatorule":"frecventator","frecventatorului":"frecventator","frecventau":"frecventa","frecvente":["frecvente","frecvent","frecvențe","frecvență"],"frecvente fundamentale":"frecvență fundamentală","frecvente radio":"frecvență radio","frecventeaza":"frecventa","frecventele":"frecvent","frecventez":"frecventa","frecventezi":"frecventa","frecventi":"frecvent","frecventii":"frecvent","frecventmetre":"frecvențmetru","frecventmetrele":"frecvențmetru","frecventmetrelor":"frecvențmetru","frecventmetruul":"frecvențmetru","frecventmetruule":"frecvențmetru","frecventmetruului":"frecvențmetru","frecventul":"frecvent","fredonai":"fredona","fredonam":["fredonăm","fredona","fredonam","fredona"],"fredonand":"fredona","fredonara":"fredona","fredonaram":"fredona","fredonarati":"fredona","fredonarea":"fredonare","fredonari":"fredonare","fredonarii":"fredonare","fredonarile":"fredonare","fredonarilor":"fredonare","fredonase":"fredona","fredonasem":"fredona","fredonasera":"fredona","fredonaseram":"fredona","fredonaserati":"fredona","fredonasesi":"fredona","fredonasi":"fredona","fredonat":"fredona","fredonata":["fredonată","fredonat","fredonata","fredonat"],"fredonate":"fredonat","fredonatele":"fredonat","fredonati":["fredonați","fredona","fredonați","fredonat"],"fredonatii":"fredonat","fredonatul":"fredonat","fredonau":"fredona","fredoneaza":"fredona","fredonez":"fredona","fredonezi":"fredona","fregate":"fregată","fregatei":"fregată","fregatele":"fregată","fregatelor":"fregată","fremat":"fremăta","frematai":"fremăta","frematam":["fremătăm","fremăta","fremătam","fremăta"],"frematand":"fremăta","frematanda":["fremătândă","fremătând","fremătânda","fremătând"],"frematande":"fremătând","frematandele":"fremătând","frematandul":"fremătând","frematanzi":"fremătând","frematanzii":"fremătând","frematara":"fremăta","fremataram":"fremăta","frematarati":"fremăta","frematarea":"fremătare","frematari":"fremătare","frematarii":"fremătare","frematarile":"fremătare","frematarilor":"fremătare","frematase":"fremăta","frematasem":"fremăta","frematasera":"fremăta","fremataseram":"fremăta","fremataserati":"fremăta","frematasesi":"fremăta","frematasi":"fremăta","frematat":"fremăta","frematati":"fremăta","frematatoare":"fremătător","frematatoarea":"fremătător","frematatoarele":"fremătător","frematatori":"fremătător","frematatorii":"fremătător","frematatorul":"fremătător","frematau":"fremăta","fremeti":"fremăta","fremismente":"fremisment","fremismentele":"fremisment","fremismentelor":"fremisment","fremismentul":"fremisment","fremismentule":"fremisment","fremismentului":"fremisment","frenetica":["frenetică","frenetic","frenetica","frenetic"],"frenetice":"frenetic","freneticele":"frenetic","frenetici":"frenetic","freneticii":"frenetic","freneticul":"frenetic","frenezia":"frenezie","freneziei":"frenezie","frenezii":"frenezie","freneziile":"frenezie","freneziilor":"frenezie","frenghia":"frenghie","frenghiei":"frenghie","frenghii":"frenghie","frenghiile":"frenghie","frenghiilor":"frenghie","frenica":["frenică","frenic","frenica","frenic"],"frenice":"frenic","frenicele":"frenic","frenici":"frenic","frenicii":"frenic","frenicotomia":"frenicotomie","frenicotomiei":"frenicotomie","frenicotomii":"frenicotomie","frenicotomiile":"frenicotomie","frenicotomiilor":"frenicotomie","frenicul":"frenic","frenite":"frenită","frenitei":"frenită","frenitele":"frenită","frenitelor":"frenită","frenologi":"frenolog","frenologia":"frenologie","frenologica":["frenologică","frenologic","frenologica","frenologic"],"frenologice":"frenologic","frenologicele":"frenologic","frenologici":"frenologic","frenologicii":"frenologic","frenologicul":"frenologic","frenologiei":"frenologie","frenologii":["frenologii","frenolog","frenologii","frenologie"],"frenologilor":"frenolog","frenologul":"frenolog","frenologule":"frenolog","frenologului":"frenolog","frenopatia":"frenopatie","frenopatiei":"frenopatie","frenopatii":"frenopatie","frenopatiile":"frenopatie","frenopatiilor":"frenopatie","frenoptoze":"frenoptoză","frenoptozei":"frenoptoză","frenoptozele":"frenoptoză","frenoptozelor":"frenoptoză","frenotomia":"frenotomie","frenotomiei":"frenotomie","frenotomii":"frenotomie","frenotomiile":"frenotomie","frenotomiilor":"frenotomie","frentele":"frențe","frentelor":"frențe","frentita":["frențită","frențit","frențita","frențit"],"frentite":"frențit","frentitele":"frențit","frentiti":"frențit","frentitii":"frențit","frentitul":"frențit","frentusita":["frențușită","frențușit","frențușita","frențușit"],"frentusite":"frențușit","frentusitele":"frențușit","frentusiti":"frențușit","frentusitii":"frențușit","frentusitul":"frențușit","frentusul":"frențuș","frentusule":"frențuș","frentusului":"frențuș","frentusuri":"frențuș","frentusurile":"frențuș","frentusurilor":"frențuș","freoni":"freon","freonii":"freon","freonilor":"freon","freonul":"freon","freonule":"freon","freonului":"freon","fresa":["freșă","freș","freșa","freș"],"fresce":["fresce","fresc","fresce","frescă"],"frescei":"frescă","frescele":["frescele","fresc","frescele","frescă"],"frescelor":["frescelor","fresc","frescelor","frescă"],"frescul":"fresc","frescule":"fresc","frescului":"fresc","frese":"freș","fresele":"freș","fresi":"freș","fresii":"freș","fresul":"freș","frete":"fretă","fretei":"fretă","fretele":"fretă","fretelor":"fretă","freudiana":["freudiană","freudian","freudiana","freudian"],"freudianul":"freudian","freudiene":"freudian","freudienele":"freudian","freudieni":"freudian","freudienii":"freudian","freudisme":"freudism","freudismele":"freudism","freudismelor":"freudism","freudismul":"freudism","freudismule":"freudism","freudismului":"freudism","freza":["freză","frez","freza","frez"],"frezai":"freza","frezam":["frezăm","freza","frezam","freza"],"frezand":"freza","frezara":"freza","frezaram":"freza","frezarati":"freza","frezarea":"frezare","frezari":["frezări","frezare","frezari","frezare"],"frezarii":"frezare","frezarile":"frezare","frezarilor":"frezare","frezase":"freza","frezasem":"freza","frezasera":"freza","frezaseram":"freza","frezaserati":"freza","frezasesi":"freza","frezasi":"freza","frezat":"freza","frezati":"freza","frezau":"freza","freze":["freze","frez","freze","freză"],"frezeaza":"freza","frezele":"frez","frezez":"freza","frezezi":"freza","frezi":"frez","frezia":"frezie","freziei":"frezie","frezii":["frezii","frez","frezii","frezie"],"freziile":"frezie","freziilor":"frezie","frezilul":"frezil","frezilule":"frezil","frezilului":"frezil","freziluri":"frezil","frezilurile":"frezil","frezilurilor":"frezil","frezmasini":"frezmașină","frezmasinii":"frezmașină","frezmasinile":"frezmașină","frezmasinilor":"frezmașină","frezoare":"frezor","frezoarea":"frezoare","frezoarei":"frezoare","frezoarele":["frezoarele","frezoare","frezoarele","frezor"],"frezoarelor":["frezoarelor","frezoare","frezoarelor","frezor"],"frezorul":"frezor","frezorule":"frezor","frezorului":"frezor","frezul":"frez","friabila":["friabilă","friabil","friabila","friabil"],"friabile":"friabil","friabilele":"friabil","friabili":"friabil","friabilii":"friabil","friabilitatea":"friabilitate","friabilitati":"friabilitate","friabilitatii":"friabilitate","friabilitatile":"friabilitate","friabilitatilor":"friabilitate","friabilul":"friabil","fricativa":["fricativă","fricativ","fricativa","fricativ"],"fricative":["fricative","fricativ","fricative","fricativă"],"fricativei":"fricativă","fricativele":["fricativele","fricativ","fricativele","fricativă"],"fricativelor":"fricativă","fricativi":"fricativ","fricativii":"fricativ","fricativul":"fricativ","frichinea":"frichini","frichineai":"frichini","frichineam":"frichini","frichineati":"frichini","frichineau":"frichini","frichinesc":"frichini","frichineste":"frichini","frichinesti":"frichini","frichinii":"frichini","frichinim":"frichini","frichinind":"frichini","frichinira":"frichini","frichiniram":"frichini","frichinirati":"frichini","frichinirea":"frichinire","frichiniri":"frichinire","frichinirii":"frichinire","frichinirile":"frichinire","frichinirilor":"frichinire","frichinise":"frichini","frichinisem":"frichini","frichinisera":"frichini","frichiniseram":"frichini","frichiniserati":"frichini","frichinisesi":"frichini","frichinisi":"frichini","frichinit":"frichini","frichinita":["frichinită","frichinit","frichinita","frichinit"],"frichinite":"frichinit","frichinitele":"frichinit","frichiniti":["frichiniți","frichini","frichiniți","frichinit"],"frichinitii":"frichinit","frichinitul":"frichinit","frici":"frică","fricii":"frică","fricile":"frică","fricilor":"frică","fricoasa":["fricoasă","fricos","fricoasa","fricos"],"fricoase":"fricos","fricoasele":"fricos","fricosai":"fricoșa","fricosam":["fricoșăm","fricoșa","fricoșam","fricoșa"],"fricosand":"fricoșa","fricosara":"fricoșa","fricosaram":"fricoșa","fricosarati":"fricoșa","fricosase":"fricoșa","fricosasem":"fricoșa","fricosasera":"fricoșa","fricosaseram":"fricoșa","fricosaserati":"fricoșa","fricosasesi":"fricoșa","fricosasi":"fricoșa","fricosat":"fricoșa","fricosata":["fricoșată","fricoșat","fricoșata","fricoșat"],"fricosate":"fricoșat","fricosatele":"fricoșat","fricosati":["fricoșați","fricoșa","fricoșați","fricoșat"],"fricosatii":"fricoșat","fricosatul":"fricoșat","fricosau":"fricoșa","fricoseaza":"fricoșa","fricosez":"fricoșa","fricosezi":"fricoșa","fricosi":"fricos","fricosii":"fricos","fricosul":"fricos","frictia":"fricție","frictiei":"fricție","frictii":"fricție","frictiile":"fricție","frictiilor":"fricție","frictionai":"fricționa","frictionam":["fricționăm","fricționa","fricționam","fricționa"],"frictionand":"fricționa","frictionara":"fricționa","frictionaram":"fricționa","frictionarati":"fricționa","frictionarea":"fricționare","frictionari":"fricționare","frictionarii":"fricționare","frictionarile":"fricționare","frictionarilor":"fricționare","frictionase":"fricționa","frictionasem":"fricționa","frictionasera":"fricționa","frictionaseram":"fricționa","frictionaserati":"fricționa","frictionasesi":"fricționa","frictionasi":"fricționa","frictionat":"fricționa","frictionati":"fricționa","frictionau":"fricționa","frictioneaza":"fricționa","frictionez":"fricționa","frictionezi":"fricționa","frictiuni":"fricțiune","friculite":"friculiță","friculitei":"friculiță","friculitele":"friculiță","friculitelor":"friculiță","friderici":"frideric","fridericii":"frideric","fridericilor":"frideric","fridericul":"frideric","fridericule":"frideric","fridericului":"frideric","frig":"frige","friga":"frige","frigand":"frige","friganeaua":["friganeaua","friganea","frigăneaua","frigănea"],"friganele":["friganele","friganea","frigănele","frigănea"],"friganelei":["friganelei","friganea","frigănelei","frigănea"],"friganelele":["friganelele","friganea","frigănelele","frigănea"],"friganelelor":["friganelelor","friganea","frigănelelor","frigănea"],"frigarea":"frigare","frigari":"frigare","frigarii":"frigare","frigarile":"frigare","frigarilor":"frigare","frigarite":"frigăriță","frigaritei":"frigăriță","frigaritele":"frigăriță","frigaritelor":"frigăriță","frigarui":"frigăruie","frigaruia":"frigăruie","frigaruici":"frigăruică","frigaruicii":"frigăruică","frigaruicile":"frigăruică","frigaruicilor":"frigăruică","frigaruiei":"frigăruie","frigaruii":"frigăruie","frigaruiile":"frigăruie","frigaruiilor":"frigăruie","frigarute":"frigăruță","frigarutei":"frigăruță","frigarutele":"frigăruță","frigarutelor":"frigăruță","frigea":"frige","frigeai":"frige","frigeam":"frige","frigeati":"frige","frigeau":"frige","frigem":"frige","frigerea":"frigere","frigeri":"frigere","frigerii":"frigere","frigerile":"frigere","frigerilor":"frigere","frigeti":"frige","frigi":"frige","frigianul":"frigian","frigianule":"frigian","frigianului":"frigian","frigida":["frigidă","frigid","frigida","frigid"],"frigide":"frigid","frigidele":"frigid","frigidere":"frigider","frigiderele":"frigider","frigiderelor":"frigider","frigiderul":"frigider","frigiderule":"frigider","frigiderului":"frigider","frigiditatea":"frigiditate","frigiditati":"frigiditate","frigiditatii":"frigiditate","frigiditatile":"frigiditate","frigiditatilor":"frigiditate","frigidul":"frigid","frigiene":"frigiană","frigienei":"frigiană","frigienele":"frigiană","frigienelor":"frigiană","frigieni":"frigian","frigienii":"frigian","frigienilor":"frigian","frigizi":"frigid","frigizii":"frigid","frigoria":"frigorie","frigoriei":"frigorie","frigorifera":["frigoriferă","frigorifer","frigorifera","frigorifer"],"frigorifere":"frigorifer","frigoriferele":"frigorifer","frigoriferi":"frigorifer","frigoriferii":"frigorifer","frigoriferul":"frigorifer","frigorifica":["frigorifică","frigorific","frigorifica","frigorific"],"frigorifice":"frigorific","frigorificele":"frigorific","frigorifici":"frigorific","frigorificii":"frigorific","frigorificul":"frigorific","frigorigena":["frigorigenă","frigorigen","frigorigena","frigorigen"],"frigorigene":"frigorigen","frigorigenele":"frigorigen","frigorigeni":"frigorigen","frigorigenii":"frigorigen","frigorigenul":"frigorigen","frigorii":"frigorie","frigoriile":"frigorie","frigoriilor":"frigorie","frigotehnice":"frigotehnică","frigotehnicei":"frigotehnică","frigotehnisti":"frigotehnist","frigotehnistii":"frigotehnist","frigotehnistilor":"frigotehnist","frigotehnistul":"frigotehnist","frigotehnistule":"frigotehnist","frigotehnistului":"frigotehnist","frigoterapia":"frigoterapie","frigoterapiei":"frigoterapie","frigoterapii":"frigoterapie","frigoterapiile":"frigoterapie","frigoterapiilor":"frigoterapie","frigul":"frig","frigule":"frig","frigulete":"friguleț","friguletele":"friguleț","friguletelor":"friguleț","friguletul":"friguleț","friguletule":"friguleț","friguletului":"friguleț","frigului":"frig","friguri":["friguri","frig","friguri","frigură"],"frigurii":"frigură","frigurile":["frigurile","frig","frigurile","frigură"],"frigurilor":["frigurilor","frig","frigurilor","frigură"],"friguroasa":["friguroasă","friguros","friguroasa","friguros"],"friguroase":"friguros","friguroasele":"friguros","frigurosi":"friguros","frigurosii":"friguros","frigurosul":"friguros","frigusorul":"frigușor","frigusorule":"frigușor","frigusorului":"frigușor","frigutul":"friguț","frigutule":"friguț","frigutului":"friguț","frimituri":"frimitură","frimiturii":"frimitură","frimiturile":"frimitură","frimiturilor":"frimitură","fringhie":"frânghie","fringilide":"fringilid","fringilidele":"fringilid","fringilidelor":"fringilid","fringilidul":"fringilid","fringilidule":"fringilid","fringilidului":"fringilid","friponi":"fripon","friponii":"fripon","friponilor":"fripon","friponul":"fripon","friponule":"fripon","friponului":"fripon","fripse":"frige","fripsei":"frige","fripsera":"frige","fripseram":"frige","fripserati":"frige","fripsese":"frige","fripsesem":"frige","fripsesera":"frige","fripseseram":"frige","fripseserati":"frige","fripsesesi":"frige","fripsesi":"frige","fript":"frige","fripta":["friptă","fript","fripta","fript"],"friptane":"friptană","friptanei":"friptană","friptanele":"friptană","friptanelor":"friptană","fripte":"fript","friptele":"fript","fripti":"fript","friptii":"fript","friptul":"fript","fripturi":"friptură","fripturice":"fripturică","fripturicei":"fripturică","fripturicele":"fripturică","fripturicelor":"fripturică","fripturici":"fripturică","fripturii":"friptură","fripturile":"friptură","fripturilor":"friptură","fripturismul":"fripturism","fripturismule":"fripturism","fripturismului":"fripturism","fripturisti":"fripturist","fripturistii":"fripturist","fripturistilor":"fripturist","fripturistul":"fripturist","fripturistule":"fripturist","fripturistului":"fripturist","frisoane":"frison","frisoanele":"frison","frisoanelor":"frison","frisonul":"frison","frisonule":"frison","frisonului":"frison","fristi":"frișcă","fristii":"frișcă","fristile":"frișcă","fristilor":"frișcă","fritaje":"fritaj","fritajele":"fritaj","fritajelor":"fritaj","fritajul":"fritaj","fritajule":"fritaj","fritajului":"fritaj","friteuze":"friteuză","friteuzei":"friteuză","friteuzele":"friteuză","friteuzelor":"friteuză","friulane":"friulană","friulanei":"friulană","frivola":["frivolă","frivol","frivola","frivol"],"frivole":"frivol","frivolele":"frivol","frivoli":"frivol","frivolii":"frivol","frivolitatea":"frivolitate","frivolitati":"frivolitate","frivolitatii":"frivolitate","frivolitatile":"frivolitate","frivolitatilor":"frivolitate","frivolul":"frivol","friza":"freză","frizai":"friza","frizam":["frizăm","friza","frizam","friza"],"frizand":"friza","frizara":"friza","frizaram":"friza","frizarati":"friza","frizase":"friza","frizasem":"friza","frizasera":"friza","frizaseram":"friza","frizaserati":"friza","frizasesi":"friza","frizasi":"friza","frizat":"friza","frizati":"friza","frizau":"friza","frizaul":"friză","frizaule":"friză","frizaului":"friză","frize":"friză","frizeaza":"friza","frizele":"friză","frizelor":"friză","frizeri":"frizer","frizeria":"frizerie","frizeriei":"frizerie","frizerii":["frizerii","frizer","frizerii","frizerie"],"frizeriile":"frizerie","frizeriilor":"frizerie","frizerilor":"frizer","frizerite":"frizeriță","frizeritei":"frizeriță","frizeritele":"frizeriță","frizeritelor":"frizeriță","frizerul":"frizer","frizerule":"frizer","frizerului":"frizer","frizez":"friza","frizezi":"friza","frizoane":"frizon","frizoanele":"frizon","frizoanelor":"frizon","frizonul":"frizon","frizonule":"frizon","frizonului":"frizon","frizul":"friz","frizule":"friz","frizului":"friz","frizuri":["frizuri","friz","frizuri","frizură"],"frizurile":"friz","frizurilor":"friz","fronde":"frondă","frondei":"frondă","frondele":"frondă","frondelor":"frondă","frondeuri":"frondeur","frondeurii":"frondeur","frondeurilor":"frondeur","frondeurul":"frondeur","frondeurule":"frondeur","frondeurului":"frondeur","frondori":"frondor","frondorii":"frondor","frondorilor":"frondor","frondorul":"frondor","frondorule":"frondor","frondorului":"frondor","frontala":["frontală","frontal","frontala","frontal"],"frontale":"frontal","frontalele":"frontal","frontali":"frontal","frontaliera":["frontalieră","frontalier","frontaliera","frontalier"],"frontaliere":"frontalier","frontalierele":"frontalier","frontalieri":"frontalier","frontalierii":"frontalier","frontalierul":"frontalier","frontalii":"frontal","frontalitatea":"frontalitate","frontalitati":"frontalitate","frontalitatii":"frontalitate","frontalitatile":"frontalitate","frontalitatilor":"frontalitate","frontalul":"frontal","frontiere":"frontieră","frontierei":"frontieră","frontierele":"frontieră","frontierelor":"frontieră","frontispicii":"frontispiciu","frontispiciile":"frontispiciu","frontispiciilor":"frontispiciu","frontispiciul":"frontispiciu","frontispiciule":"frontispiciu","frontispiciului":"frontispiciu","frontoane":"fronton","frontoanele":"fronton","frontoanelor":"fronton","frontogeneze":"frontogeneză","frontogenezei":"frontogeneză","frontogenezele":"frontogeneză","frontogenezelor":"frontogeneză","frontolize":"frontoliză","frontolizei":"frontoliză","frontolizele":"frontoliză","frontolizelor":"frontoliză","frontonul":"fronton","frontonule":"fronton","frontonului":"fronton","frontul":"front","frontule":"front","frontului":"front","fronturi":"front","fronturi arctice":"front arctic","fronturi de lucru":"front de lucru","fronturi de unda":"front de undă","fronturi stationare":"front staționar","fronturile":"front","fronturilor":"front","frotiul":"frotiu","frotiule":"frotiu","frotiului":"frotiu","frotiuri":"frotiu","frotiurile":"frotiu","frotiurilor":"frotiu","fructari":"fructar","fructaria":"fructărie","fructariei":"fructărie","fructarii":["fructarii","fructar","fructării","fructărie"],"fructariile":"fructărie","fructariilor":"fructărie","fructarilor":"fructar","fructarul":"fructar","fructarule":"fructar","fructarului":"fructar","fructata":["fructată","fructat","fructata","fructat"],"fructate":"fructat","fructatele":"fructat","fructati":"fructat","fructatii":"fructat","fructatul":"fructat","fructe":["fructe","fruct","fructe","fructă"],"fructe compuse":"fruct compus","fructei":"fructă","fructele":["fructele","fruct","fructele","fructă"],"fructelor":["fructelor","fruct","fructelor","fructă"],"fructidorul":"fructidor","fructidorule":"fructidor","fructidorului":"fructidor","fructiere":"fructieră","fructierei":"fructieră","fructierele":"fructieră","fructierelor":"fructieră","fructifera":["fructiferă","fructifer","fructifera","fructifer"],"fructifere":"fructifer","fructiferele":"fructifer","fructiferi":"fructifer","fructiferii":"fructifer","fructiferul":"fructifer","fructific":"fructifica","fructificai":"fructifica","fructificam":["fructificăm","fructifica","fructificam","fructifica"],"fructificand":"fructifica","fructificara":"fructifica","fructificaram":"fructifica","fructificarati":"fructifica","fructificarea":"fructificare","fructificari":"fructificare","fructificarii":"fructificare","fructificarile":"fructificare","fructificarilor":"fructificare","fructificase":"fructifica","fructificasem":"fructifica","fructificasera":"fructifica","fructificaseram":"fructifica","fructificaserati":"fructifica","fructificasesi":"fructifica","fructificasi":"fructifica","fructificat":"fructifica","fructificata":["fructificată","fructificat","fructificata","fructificat"],"fructificate":"fructificat","fructificatele":"fructificat","fructificati":["fructificați","fructifica","fructificați","fructificat"],"fructificatia":"fructificație","fructificatiei":"fructificație","fructificatii":["fructificații","fructificat","fructificații","fructificație"],"fructificatiile":"fructificație","fructificatiilor":"fructificație","fructificatul":"fructificat","fructificau":"fructifica","fructifice":"fructifica","fructifici":"fructifica","fructoarea":"fructoare","fructoari":"fructoare","fructoarii":"fructoare","fructoze":"fructoză","fructozei":"fructoză","fructozele":"fructoză","fructozelor":"fructoză","fructozemia":"fructozemie","fructozemiei":"fructozemie","fructozemii":"fructozemie","fructozemiile":"fructozemie","fructozemiilor":"fructozemie","fructozuria":"fructozurie","fructozuriei":"fructozurie","fructozurii":"fructozurie","fructozuriile":"fructozurie","fructozuriilor":"fructozurie","fructul":"fruct","fructule":"fruct","fructului":"fruct","fructuoasa":["fructuoasă","fructuos","fructuoasa","fructuos"],"fructuoase":"fructuos","fructuoasele":"fructuos","fructuosi":"fructuos","fructuosii":"fructuos","fructuosul":"fructuos","frugala":["frugală","frugal","frugala","frugal"],"frugale":"frugal","frugalele":"frugal","frugali":"frugal","frugalii":"frugal","frugalitatea":"frugalitate","frugalitati":"frugalitate","frugalitatii":"frugalitate","frugalul":"frugal","frugifera":["frugiferă","frugifer","frugifera","frugifer"],"frugifere":"frugifer","frugiferele":"frugifer","frugiferi":"frugifer","frugiferii":"frugifer","frugiferul":"frugifer","frugivora":["frugivoră","frugivor","frugivora","frugivor"],"frugivore":["frugivore","frugivor","frugivore","frugivoră"],"frugivorei":"frugivoră","frugivorele":["frugivorele","frugivor","frugivorele","frugivoră"],"frugivorelor":"frugivoră","frugivori":"frugivor","frugivorii":"frugivor","frugivorul":"frugivor","frumoasa":["frumoasă","frumos","frumoasa","frumos"],"frumoase":["frumoase","frumoasă","frumoase","frumos"],"frumoasei":"frumoasă","frumoasele":["frumoasele","frumoasă","frumoasele","frumos"],"frumoaselor":"frumoasă","frumosi":"frumos","frumosii":"frumos","frumosul":"frumos","frumsetea":"frumsețe","frumseti":"frumsețe","frumsetii":"frumsețe","frumsetile":"frumsețe","frumsetilor":"frumsețe","frumusela":["frumușelă","frumușel","frumușela","frumușel"],"frumusele":"frumușel","frumuselele":"frumușel","frumuseli":"frumușel","frumuselii":"frumușel","frumuselul":"frumușel","frumusetai":"frumuseța","frumusetam":["frumusețăm","frumuseța","frumusețam","frumuseța"],"frumusetand":"frumuseța","frumusetara":"frumuseța","frumusetaram":"frumuseța","frumusetarati":"frumuseța","frumusetase":"frumuseța","frumusetasem":"frumuseța","frumusetasera":"frumuseța","frumusetaseram":"frumuseța","frumusetaserati":"frumuseța","frumusetasesi":"frumuseța","frumusetasi":"frumuseța","frumusetat":"frumuseța","frumusetati":"frumuseța","frumusetau":"frumuseța","frumusetea":"frumusețe","frumuseteaza":"frumuseța","frumusetez":"frumuseța","frumusetezi":"frumuseța","frumuseti":["frumuseți","frumuseță","frumuseți","frumusețe"],"frumusetii":["frumuseții","frumuseță","frumuseții","frumusețe"],"frumusetile":["frumusețile","frumuseță","frumusețile","frumusețe"],"frumusetilor":["frumuseților","frumuseță","frumuseților","frumusețe"],"frunda":"frunză","fruntare":"fruntar","fruntarele":"fruntar","fruntarelor":"fruntar","fruntaria":"fruntarie","fruntariei":"fruntarie","fruntarii":"fruntarie","fruntariile":"fruntarie","fruntariilor":"fruntarie","fruntarul":"fruntar","fruntarule":"fruntar","fruntarului":"fruntar","fruntase":"fruntașă","fruntasei":"fruntașă","fruntasele":"fruntașă","fruntaselor":"fruntașă","fruntasi":"fruntaș","fruntasii":"fruntaș","fruntasilor":"fruntaș","fruntasimea":"fruntășime","fruntasimi":"fruntășime","fruntasimii":"fruntășime","fruntasimile":"fruntășime","fruntasimilor":"fruntășime","fruntasul":"fruntaș","fruntasule":"fruntaș","fruntasului":"fruntaș","fruntea":"frunte","frunti":"frunte","frunticicele":"frunticică","frunticicelei":"frunticică","frunticicelele":"frunticică","frunticicelelor":"frunticică","fruntii":"frunte","fruntile":"frunte","fruntilor":"frunte","fruntisoare":"fruntișoară","fruntisoarei":"fruntișoară","fruntite":"fruntiță","fruntitei":"fruntiță","fruntitele":"fruntiță","fruntitelor":"fruntiță","fruntoasa":["fruntoasă","fruntos","fruntoasa","fruntos"],"fruntoase":"fruntos","fruntoasele":"fruntos","fruntosi":"fruntos","fruntosii":"fruntos","fruntosilor":"fruntos","fruntosul":"fruntos","fruntosule":"fruntos","fruntosului":"fruntos","frunzare":"frunzar","frunzarea":"frunzări","frunzareai":"frunzări","frunzaream":"frunzări","frunzareati":"frunzări","frunzareau":"frunzări","frunzarei":["frunzarei","frunzar","frunzărei","frunzărel"],"frunzareii":"frunzărel","frunzareilor":"frunzărel","frunzarele":"frunzăreală","frunzarelei":"frunzăreală","frunzarelele":"frunzăreală","frunzarelelor":"frunzăreală","frunzareli":"frunzăreală","frunzarelor":"frunzar","frunzarelul":"frunzărel","frunzarelule":"frunzărel","frunzarelului":"frunzărel","frunzaresc":"frunzări","frunzareste":"frunzări","frunzaresti":"frunzări","frunzaretul":"frunzăret","frunzaretule":"frunzăret","frunzaretului":"frunzăret","frunzareturi":"frunzăret","frunzareturile":"frunzăret","frunzareturilor":"frunzăret","frunzaria":"frunzărie","frunzariei":"frunzărie","frunzarii":["frunzării","frunzări","frunzării","frunzărie"],"frunzariile":"frunzărie","frunzariilor":"frunzărie","frunzarim":"frunzări","frunzarimea":"frunzărime","frunzarimi":"frunzărime","frunzarimii":"frunzărime","frunzarimile":"frunzărime","frunzarimilor":"frunzărime","frunzarind":"frunzări","frunzarira":"frunzări","frunzariram":"frunzări","frunzarirati":"frunzări","frunzarirea":"frunzărire","frunzariri":"frunzărire","frunzaririi":"frunzărire","frunzaririle":"frunzărire","frunzaririlor":"frunzărire","frunzarise":"frunzări","frunzarisem":"frunzări","frunzarisera":"frunzări","frunzariseram":"frunzări","frunzariserati":"frunzări","frunzarisesi":"frunzări","frunzarisi":"frunzări","frunzarit":"frunzări","frunzarita":["frunzărită","frunzărit","frunzărita","frunzărit"],"frunzarite":"frunzărit","frunzarite cenusii":"frunzăriță cenușie","frunzarite galbene":"frunzăriță galbenă","frunzaritele":"frunzărit","frunzariti":["frunzăriți","frunzări","frunzăriți","frunzărit"],"frunzaritii":"frunzărit","frunzaritul":"frunzărit","frunzarul":"frunzar","frunzarule":"frunzar","frunzarului":"frunzar","frunzaturi":"frunzătură","frunzaturii":"frunzătură","frunzaturile":"frunzătură","frunzaturilor":"frunzătură","frunze":"frunză","frunze compuse":"frunză compusă","frunze simple":"frunză simplă","frunzea":"frunzi","frunzeai":"frunzi","frunzeam":"frunzi","frunzeati":"frunzi","frunzeau":"frunzi","frunzei":"frunză","frunzele":"frunză","frunzelor":"frunză","frunzesc":"frunzi","frunzeste":"frunzi","frunzesti":"frunzi","frunzetul":"frunzet","frunzetule":"frunzet","frunzetului":"frunzet","frunzeturi":"frunzet","frunzeturile":"frunzet","frunzeturilor":"frunzet","frunzice":"frunzică","frunziceaua":"frunzicea","frunzicei":"frunzică","frunzicele":["frunzicele","frunzică","frunzicele","frunzicea"],"frunzicelei":"frunzicea","frunzicelele":"frunzicea","frunzicelelor":"frunzicea","frunzicelor":"frunzică","frunzici":"frunzică","frunzii":"frunzi","frunzim":"frunzi","frunzind":"frunzi","frunzioare":"frunzioară","frunzioarei":"frunzioară","frunzira":"frunzi","frunziram":"frunzi","frunzirati":"frunzi","frunzise":"frunzi","frunzisem":"frunzi","frunzisera":"frunzi","frunziseram":"frunzi","frunziserati":"frunzi","frunzisesi":"frunzi","frunzisi":"frunzi","frunzisoare":"frunzișoară","frunzisoarei":"frunzișoară","frunzisoarele":"frunzișoară","frunzisoarelor":"frunzișoară","frunzisul":"frunziș","frunzisule":"frunziș","frunzisului":"frunziș","frunzisuri":"frunziș","frunzisurile":"frunziș","frunzisurilor":"frunziș","frunzit":"frunzi","frunzite":"frunziță","frunzitei":"frunziță","frunzitele":"frunziță","frunzitelor":"frunziță","frunziti":"frunzi","frunzoasa":["frunzoasă","frunzos","frunzoasa","frunzos"],"frunzoase":"frunzos","frunzoasele":"frunzos","frunzosi":"frunzos","frunzosii":"frunzos","frunzosul":"frunzos","frunzuce":"frunzucă","frunzucei":"frunzucă","frunzucele":"frunzucă","frunzucelor":"frunzucă","frunzuci":"frunzucă","frunzulene":"frunzuleană","frunzulenei":"frunzuleană","frunzulenele":"frunzuleană","frunzulenelor":"frunzuleană","frunzulici":"frunzulică","frunzulicii":"frunzulică","frunzulicile":"frunzulică","frunzulicilor":"frunzulică","frunzuline":"frunzulină","frunzulinei":"frunzulină","frunzulinele":"frunzulină","frunzulinelor":"frunzulină","frunzulite":"frunzuliță","frunzulitei":"frunzuliță","frunzulitele":"frunzuliță","frunzulitelor":"frunzuliță","frunzusoare":"frunzușoară","frunzusoarei":"frunzușoară","frunzusoarele":"frunzușoară","frunzusoarelor":"frunzușoară","frunzute":"frunzuță","frunzutei":"frunzuță","frunzutele":"frunzuță","frunzutelor":"frunzuță","fruptul":"frupt","fruptule":"frupt","fruptului":"frupt","frupturi":"frupt","frupturile":"frupt","frupturilor":"frupt","frusite":"frușiță","frusitei":"frușiță","frusitele":"frușiță","frusitelor":"frușiță","frusta":["frustă","frust","frusta","frust"],"fruste":"frust","frustele":"frust","frusti":"frust","frustii":"frust","frustrai":"frustra","frustram":["frustrăm","frustra","frustram","frustra"],"frustrand":"frustra","frustrara":"frustra","frustraram":"frustra","frustrarati":"frustra","frustrarea":"frustrare","frustrari":"frustrare","frustrarii":"frustrare","frustrarile":"frustrare","frustrarilor":"frustrare","frustrase":"frustra","frustrasem":"frustra","frustrasera":"frustra","frustraseram":"frustra","frustraserati":"frustra","frustrasesi":"frustra","frustrasi":"frustra","frustrat":"frustra","frustrata":["frustrată","frustrat","frustrata","frustrat"],"frustrate":"frustrat","frustratele":"frustrat","frustrati":["frustrați","frustra","frustrați","frustrat"],"frustratia":"frustrație","frustratiei":"frustrație","frustratii":["frustrații","frustrat","frustrații","frustrație"],"frustratiile":"frustrație","frustratiilor":"frustrație","frustratoarea":"frustratoare","frustratoarei":"frustratoare","frustratoarele":"frustratoare","frustratoarelor":"frustratoare","frustratul":"frustrat","frustrau":"frustra","frustreaza":"frustra","frustrez":"frustra","frustrezi":"frustra","frustucul":"fruștuc","frustucule":"fruștuc","frustucului":"fruștuc","frustul":"frust","frutescenta":["frutescentă","frutescent","frutescenta","frutescent"],"frutescente":"frutescent","frutescentele":"frutescent","frutescenti":"frutescent","frutescentii":"frutescent","frutescentul":"frutescent","ftalati":"ftalat","ftalatii":"ftalat","ftalatilor":"ftalat","ftalatul":"ftalat","ftalatule":"ftalat","ftalatului":"ftalat","ftaleine":"ftaleină","ftaleinei":"ftaleină","ftaleinele":"ftaleină","ftaleinelor":"ftaleină","ftalica":["ftalică","ftalic","ftalica","ftalic"],"ftalice":"ftalic","ftalicele":"ftalic","ftalici":"ftalic","ftalicii":"ftalic","ftalicul":"ftalic","ftiriaze":"ftiriază","ftiriazei":"ftiriază","ftiriazele":"ftiriază","ftiriazelor":"ftiriază","ftizice":"ftizică","ftizicei":"ftizică","ftizicele":"ftizică","ftizicelor":"ftizică","ftizici":"ftizic","ftizicii":"ftizic","ftizicilor":"ftizic","ftizicul":"ftizic","ftizicule":"ftizic","ftizicului":"ftizic","ftizii":"ftizie","ftiziologe":"ftiziologă","ftiziologei":"ftiziologă","ftiziologele":"ftiziologă","ftiziologelor":"ftiziologă","ftiziologi":"ftiziolog","ftiziologia":"ftiziologie","ftiziologica":["ftiziologică","ftiziologic","ftiziologica","ftiziologic"],"ftiziologice":"ftiziologic","ftiziologicele":"ftiziologic","ftiziologici":"ftiziologic","ftiziologicii":"ftiziologic","ftiziologicul":"ftiziologic","ftiziologiei":"ftiziologie","ftiziologii":["ftiziologii","ftiziolog","ftiziologii","ftiziologie"],"ftiziologiile":"ftiziologie","ftiziologiilor":"ftiziologie","ftiziologilor":"ftiziolog","ftiziologul":"ftiziolog","ftiziologule":"ftiziolog","ftiziologului":"ftiziolog","ftizioterapia":"ftizioterapie","ftizioterapiei":"ftizioterapie","ftizioterapii":"ftizioterapie","ftizioterapiile":"ftizioterapie","ftizioterapiilor":"ftizioterapie","fucoide":"fucoidă","fucoidei":"fucoidă","fucoidele":"fucoidă","fucoidelor":"fucoidă","fucoxantine":"fucoxantină","fucoxantinei":"fucoxantină","fucoxantinele":"fucoxantină","fucoxantinelor":"fucoxantină","fucsia":"fucsie","fucsiei":"fucsie","fucsii":"fucsie","fucsiile":"fucsie","fucsiilor":"fucsie","fucsine":"fucsină","fucsinei":"fucsină","fucsinele":"fucsină","fucsinelor":"fucsină","fudula":["fudulă","fudul","fudula","fudul"],"fudulasa":["fudulașă","fudulaș","fudulașa","fudulaș"],"fudulase":"fudulaș","fudulasele":"fudulaș","fudulasi":"fudulaș","fudulasii":"fudulaș","fudulasul":"fudulaș","fudule":"fudul","fudulea":"fuduli","fuduleai":"fuduli","fuduleam":"fuduli","fuduleati":"fuduli","fuduleau":"fuduli","fudulele":"fudul","fudulesc":"fuduli","fuduleste":"fuduli","fudulesti":"fuduli","fuduli":"fudul","fudulia":"fudulie","fuduliei":"fudulie","fudulii":["fudulii","fudul","fudulii","fuduli","fudulii","fudulie"],"fuduliile":"fudulie","fuduliilor":"fudulie","fudulim":"fuduli","fudulind":"fuduli","fudulira":"fuduli","fuduliram":"fuduli","fudulirati":"fuduli","fudulirea":"fudulire","fuduliri":"fudulire","fudulirii":"fudulire","fudulirile":"fudulire","fudulirilor":"fudulire","fudulise":"fuduli","fudulisem":"fuduli","fudulisera":"fuduli","fuduliseram":"fuduli","fuduliserati":"fuduli","fudulisesi":"fuduli","fudulisi":"fuduli","fudulit":"fuduli","fuduliti":"fuduli","fudulul":"fudul","fufe":"fufă","fufei":"fufă","fufele":"fufă","fufelor":"fufă","fug":["fug","fuga","fug","fugi"],"fuga":"fugi","fugace":"fugaci","fugacea":"fugaci","fugacele":"fugaci","fugaci mari":"fugaci mare","fugaci mici":"fugaci mic","fugaci patati":"fugaci pătat","fugaci pitici":"fugaci pitic","fugaci roscati":"fugaci roșcat","fugacii":"fugaci","fugacilor":"fugaci","fugacitatea":"fugacitate","fugacitati":"fugacitate","fugacitatii":"fugacitate","fugaciul":"fugaci","fugaciule":"fugaci","fugaciului":"fugaci","fugai":["fugai","fuga","fugăi","fugău"],"fugaii":"fugău","fugailor":"fugău","fugam":["fugăm","fuga","fugam","fuga"],"fugand":"fuga","fugara":"fuga","fugaram":"fuga","fugarati":"fuga","fugare":"fugară","fugarea":"fugări","fugareai":"fugări","fugaream":"fugări","fugareata":["fugareață","fugareț","fugareața","fugareț"],"fugareati":"fugări","fugareau":"fugări","fugarei":"fugară","fugarele":["fugarele","fugară","fugărele","fugăreală"],"fugarelei":"fugăreală","fugarelele":"fugăreală","fugarelelor":"fugăreală","fugareli":"fugăreală","fugarelor":"fugară","fugaresc":"fugări","fugareste":"fugări","fugaresti":"fugări","fugarete":"fugareț","fugaretele":"fugareț","fugareti":"fugareț","fugaretii":"fugareț","fugaretul":"fugareț","fugari":"fugar","fugarii":"fugări","fugarim":"fugări","fugarind":"fugări","fugarira":"fugări","fugariram":"fugări","fugarirati":"fugări","fugarirea":"fugărire","fugariri":"fugărire","fugaririi":"fugărire","fugaririle":"fugărire","fugaririlor":"fugărire","fugarise":"fugări","fugarisem":"fugări","fugarisera":"fugări","fugariseram":"fugări","fugariserati":"fugări","fugarisesi":"fugări","fugarisi":"fugări","fugarit":"fugări","fugarita":["fugărită","fugărit","fugărita","fugărit"],"fugarite":"fugărit","fugaritele":"fugărit","fugariti":["fugăriți","fugări","fugăriți","fugărit"],"fugaritii":"fugărit","fugaritul":"fugărit"};
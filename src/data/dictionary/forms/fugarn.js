@@ -0,0 +1 @@
+export default {"fugarnica":["fugarnică","fugarnic","fugarnica","fugarnic"],"fugarnice":"fugarnic","fugarnicele":"fugarnic","fugarnici":"fugarnic","fugarnicii":"fugarnic","fugarnicul":"fugarnic","fugasa":["fugașă","fugaș","fugașa","fugaș"],"fugase":["fugase","fuga","fugașe","fugaș","fugase","fugasă"],"fugasei":"fugasă","fugasele":["fugașele","fugaș","fugasele","fugasă"],"fugaselor":"fugasă","fugasem":"fuga","fugasera":"fuga","fugaseram":"fuga","fugaserati":"fuga","fugasesi":"fuga","fugasi":["fugași","fuga","fugași","fugaș"],"fugasii":"fugaș","fugasilor":"fugaș","fugasul":"fugaș","fugasule":"fugaș","fugasului":"fugaș","fugat":"fuga","fugati":"fuga","fugatoare":"fugător","fugatoarea":"fugător","fugatoarele":"fugător","fugatori":"fugător","fugatorii":"fugător","fugatorul":"fugător","fugatoul":"fugato","fugatoule":"fugato","fugatoului":"fugato","fugau":"fuga","fugaul":"fugău","fugaule":"fugău","fugaului":"fugău","fuge":["fuge","fuga","fuge","fugi"],"fuge ca dracul de tamaie":"fugi ca dracul de tămâie","fugea":"fugi","fugeai":"fugi","fugeam":"fugi","fugeati":"fugi","fugeau":"fugi","fugete":"fuget","fugetele":"fuget","fugetelor":"fuget","fugetul":"fuget","fugetule":"fuget","fugetului":"fuget","fughete":"fughetă","fughetei":"fughetă","fughetele":"fughetă","fughetelor":"fughetă","fugi":["fugi","fuga","fugi","fugă"],"fugii":"fugi","fugim":"fugi","fugind":"fugi","fugira":"fugi","fugiram":"fugi","fugirati":"fugi","fugirea":"fugire","fugiri":"fugire","fugirii":"fugire","fugirile":"fugire","fugirilor":"fugire","fugise":"fugi","fugisem":"fugi","fugisera":"fugi","fugiseram":"fugi","fugiserati":"fugi","fugisesi":"fugi","fugisi":"fugi","fugit":"fugi","fugit ca dracul de tamaie":"fugi ca dracul de tămâie","fugita":["fugită","fugit","fugita","fugit"],"fugite":"fugit","fugitele":"fugit","fugiti":["fugiți","fugi","fugiți","fugit"],"fugitii":"fugit","fugitiva":["fugitivă","fugitiv","fugitiva","fugitiv"],"fugitive":"fugitiv","fugitivele":"fugitiv","fugitivi":"fugitiv","fugitivii":"fugitiv","fugitivul":"fugitiv","fugitul":"fugit","fugli":"fuglu","fuglii":"fuglu","fuglilor":"fuglu","fugluul":"fuglu","fugluule":"fuglu","fugluului":"fuglu","fugoasa":["fugoasă","fugos","fugoasa","fugos"],"fugoase":"fugos","fugoasele":"fugos","fugosi":"fugos","fugosii":"fugos","fugosul":"fugos","fugozitatati":"fugozitate","fugozitatatii":"fugozitate","fugozitatatile":"fugozitate","fugozitatatilor":"fugozitate","fugozitatea":"fugozitate","fugulite":"fuguliță","fugulitei":"fuguliță","fugulitele":"fuguliță","fugulitelor":"fuguliță","fugusoare":"fugușoară","fugusoarei":"fugușoară","fugusoarele":"fugușoară","fugusoarelor":"fugușoară","fugute":"fuguță","fugutei":"fuguță","fugutele":"fuguță","fugutelor":"fuguță","fuhreri":"führer","fuhrerii":"führer","fuhrerilor":"führer","fuhrerul":"führer","fuhrerule":"führer","fuhrerului":"führer","fuiagi":"fuiag","fuiagii":"fuiag","fuiagilor":"fuiag","fuiagul":"fuiag","fuiagule":"fuiag","fuiagului":"fuiag","fuicasi":"fuicaș","fuicasii":"fuicaș","fuicasilor":"fuicaș","fuicasul":"fuicaș","fuicasule":"fuicaș","fuicasului":"fuicaș","fuioara":"fuior","fuioare":"fuior","fuioarele":"fuior","fuioarelor":"fuior","fuiorase":"fuioraș","fuiorasele":"fuioraș","fuioraselor":"fuioraș","fuiorasul":"fuioraș","fuiorasule":"fuioraș","fuiorasului":"fuioraș","fuiorul":"fuior","fuiorule":"fuior","fuiorului":"fuior","fulare":"fular","fulger":"fulgera","fulgerai":"fulgera","fulgeram":["fulgerăm","fulgera","fulgeram","fulgera"],"fulgerand":"fulgera","fulgerara":"fulgera","fulgeraram":"fulgera","fulgerarati":"fulgera","fulgerarea":"fulgerare","fulgerari":"fulgerare","fulgerarii":"fulgerare","fulgerarile":"fulgerare","fulgerarilor":"fulgerare","fulgerase":"fulgera","fulgerasem":"fulgera","fulgerasera":"fulgera","fulgeraseram":"fulgera","fulgeraserati":"fulgera","fulgerasesi":"fulgera","fulgerasi":"fulgera","fulgerat":"fulgera","fulgerata":["fulgerată","fulgerat","fulgerata","fulgerat"],"fulgerate":"fulgerat","fulgeratele":"fulgerat","fulgerati":["fulgerați","fulgera","fulgerați","fulgerat"],"fulgeratii":"fulgerat","fulgeratoare":"fulgerător","fulgeratoarea":"fulgerător","fulgeratoarele":"fulgerător","fulgeratori":"fulgerător","fulgeratorii":"fulgerător","fulgeratorul":"fulgerător","fulgeratul":"fulgerat","fulgeraturi":"fulgerătură","fulgeraturii":"fulgerătură","fulgeraturile":"fulgerătură","fulgeraturilor":"fulgerătură","fulgerau":"fulgera","fulgere":["fulgere","fulger","fulgere","fulgera"],"fulgere globulare":"fulger globular","fulgerei":"fulgerel","fulgereii":"fulgerel","fulgereilor":"fulgerel","fulgerele":"fulger","fulgerelor":"fulger","fulgerelul":"fulgerel","fulgerelule":"fulgerel","fulgerelului":"fulgerel","fulgeri":"fulgera","fulgerul":"fulger","fulgerule":"fulger","fulgerului":"fulger","fulgi":"fulg","fulgi de nea":"fulg de nea","fulgi de zapada":"fulg de zăpadă","fulgii":"fulg","fulgilor":"fulg","fulguia":"fulgui","fulguieli":"fulguială","fulguielii":"fulguială","fulguielile":"fulguială","fulguielilor":"fulguială","fulguieste":"fulgui","fulguind":"fulgui","fulguirea":"fulguire","fulguiri":"fulguire","fulguirii":"fulguire","fulguirile":"fulguire","fulguirilor":"fulguire","fulguise":"fulgui","fulguit":"fulgui","fulguitul":"fulguit","fulguitule":"fulguit","fulguitului":"fulguit","fulguituri":"fulguitură","fulguiturii":"fulguitură","fulguiturile":"fulguitură","fulguiturilor":"fulguitură","fulgul":"fulg","fulgule":"fulg","fulguleti":"fulguleț","fulguletii":"fulguleț","fulguletilor":"fulguleț","fulguletul":"fulguleț","fulguletule":"fulguleț","fulguletului":"fulguleț","fulgului":"fulg","fulgurai":"fulgura","fulguram":["fulgurăm","fulgura","fulguram","fulgura"],"fulgurand":"fulgura","fulguranta":["fulgurantă","fulgurant","fulguranta","fulgurant"],"fulgurante":"fulgurant","fulgurantele":"fulgurant","fulguranti":"fulgurant","fulgurantii":"fulgurant","fulgurantul":"fulgurant","fulgurara":"fulgura","fulguraram":"fulgura","fulgurarati":"fulgura","fulgurase":"fulgura","fulgurasem":"fulgura","fulgurasera":"fulgura","fulguraseram":"fulgura","fulguraserati":"fulgura","fulgurasesi":"fulgura","fulgurasi":"fulgura","fulgurat":"fulgura","fulgurati":"fulgura","fulguratia":"fulgurație","fulguratiei":"fulgurație","fulguratii":"fulgurație","fulguratiile":"fulgurație","fulguratiilor":"fulgurație","fulguratiunea":"fulgurațiune","fulguratiuni":"fulgurațiune","fulguratiunii":"fulgurațiune","fulguratiunile":"fulgurațiune","fulguratiunilor":"fulgurațiune","fulgurau":"fulgura","fulgureaza":"fulgura","fulgurez":"fulgura","fulgurezi":"fulgura","fulgurite":"fulgurit","fulguritele":"fulgurit","fulguritelor":"fulgurit","fulguritul":"fulgurit","fulguritule":"fulgurit","fulguritului":"fulgurit","fulgusorul":"fulgușor","fulgusorule":"fulgușor","fulgusorului":"fulgușor","fulia":"fulie","fuliei":"fulie","fulii":"fulie","fuliile":"fulie","fuliilor":"fulie","fulmicotonul":"fulmicoton","fulmicotonule":"fulmicoton","fulmicotonului":"fulmicoton","fulminanta":["fulminantă","fulminant","fulminanta","fulminant"],"fulminante":"fulminant","fulminantele":"fulminant","fulminanti":"fulminant","fulminantii":"fulminant","fulminantul":"fulminant","fulminati":"fulminat","fulminatia":"fulminație","fulminatiei":"fulminație","fulminatii":["fulminații","fulminat","fulminații","fulminație"],"fulminatiile":"fulminație","fulminatiilor":"fulminație","fulminatilor":"fulminat","fulminatiunea":"fulminațiune","fulminatiuni":"fulminațiune","fulminatiunii":"fulminațiune","fulminatiunile":"fulminațiune","fulminatiunilor":"fulminațiune","fulminatul":"fulminat","fulminatule":"fulminat","fulminatului":"fulminat","fulminica":["fulminică","fulminic","fulminica","fulminic"],"fulminice":"fulminic","fulminicele":"fulminic","fulminici":"fulminic","fulminicii":"fulminic","fulminicul":"fulminic","fultuiele":"fultuială","fultuielei":"fultuială","fultuielele":"fultuială","fultuielelor":"fultuială","fultuieli":"fultuială","fultuitoare":"fultuitor","fultuitoarele":"fultuitor","fultuitoarelor":"fultuitor","fultuitorul":"fultuitor","fultuitorule":"fultuitor","fultuitorului":"fultuitor","fulul":"ful","fulule":"ful","fulului":"ful","fuluri":"ful","fulurile":"ful","fulurilor":"ful","fumagaie":"fumăgău","fumagaiele":"fumăgău","fumagaielor":"fumăgău","fumagauul":"fumăgău","fumagauule":"fumăgău","fumagauului":"fumăgău","fumagine":"fumagină","fumaginei":"fumagină","fumaginele":"fumagină","fumaginelor":"fumagină","fumai":"fuma","fumam":["fumăm","fuma","fumam","fuma"],"fumand":"fuma","fumara":"fuma","fumaraia":"fumăraie","fumaraiei":"fumăraie","fumaraii":"fumăraie","fumaram":"fuma","fumarari":"fumărar","fumararii":"fumărar","fumararilor":"fumărar","fumararul":"fumărar","fumararule":"fumărar","fumararului":"fumărar","fumarati":"fuma","fumare":"fumar","fumarea":"fumare","fumarele":"fumar","fumarelor":"fumar","fumari":"fumare","fumaria":"fumărie","fumarica":["fumarică","fumaric","fumarica","fumaric"],"fumarice":"fumaric","fumaricele":"fumaric","fumarici":["fumarici","fumaric","fumărici","fumărică"],"fumaricii":["fumaricii","fumaric","fumăricii","fumărică"],"fumaricile":"fumărică","fumaricilor":"fumărică","fumaricul":"fumaric","fumariei":"fumărie","fumarii":["fumării","fumare","fumării","fumărie"],"fumarile":"fumare","fumarilor":"fumare","fumarite":"fumăriță","fumaritei":"fumăriță","fumaritele":"fumăriță","fumaritelor":"fumăriță","fumaritul":"fumărit","fumaritule":"fumărit","fumaritului":"fumărit","fumarole":"fumarolă","fumarolei":"fumarolă","fumarolele":"fumarolă","fumarolelor":"fumarolă","fumarul":"fumar","fumarule":"fumar","fumarului":"fumar","fumase":"fuma","fumasem":"fuma","fumasera":"fuma","fumaseram":"fuma","fumaserati":"fuma","fumasesi":"fuma","fumasi":"fuma","fumat":"fuma","fumata":["fumată","fumat","fumata","fumat"],"fumate":"fumat","fumatele":"fumat","fumati":["fumați","fuma","fumați","fumat"],"fumatii":"fumat","fumatoare":"fumător","fumatoarea":["fumătoarea","fumătoare","fumătoarea","fumător"],"fumatoarei":"fumătoare","fumatoarele":["fumătoarele","fumătoare","fumătoarele","fumător"],"fumatoarelor":"fumătoare","fumatori":"fumător","fumatori inraiti":"fumător înrăit","fumatorii":"fumător","fumatorilor":"fumător","fumatorul":"fumător","fumatorule":"fumător","fumatorului":"fumător","fumatul":"fumat","fumatule":"fumat","fumatului":"fumat","fumau":"fuma","fumeaza":"fuma","fumeg":"fumega","fumegai":"fumega","fumegaiul":"fumegai","fumegaiule":"fumegai","fumegaiului":"fumegai","fumegam":["fumegăm","fumega","fumegam","fumega"],"fumegand":"fumega","fumegara":"fumega","fumegaram":"fumega","fumegarati":"fumega","fumegarea":"fumegare","fumegari":"fumegare","fumegaria":"fumegărie","fumegariei":"fumegărie","fumegarii":["fumegării","fumegare","fumegării","fumegărie"],"fumegarile":"fumegare","fumegarilor":"fumegare","fumegase":"fumega","fumegasem":"fumega","fumegasera":"fumega","fumegaseram":"fumega","fumegaserati":"fumega","fumegasesi":"fumega","fumegasi":"fumega","fumegat":"fumega","fumegata":["fumegată","fumegat","fumegata","fumegat"],"fumegate":"fumegat","fumegatele":"fumegat","fumegati":["fumegați","fumega","fumegați","fumegat"],"fumegatii":"fumegat","fumegatul":"fumegat","fumegau":"fumega","fumege":"fumega","fumegi":"fumega","fumegoasa":["fumegoasă","fumegos","fumegoasa","fumegos"],"fumegoase":"fumegos","fumegoasele":"fumegos","fumegosi":"fumegos","fumegosii":"fumegos","fumegosul":"fumegos","fumez":"fuma","fumezi":"fuma","fumiganti":"fumigant","fumigantii":"fumigant","fumigantilor":"fumigant","fumigantul":"fumigant","fumigantule":"fumigant","fumigantului":"fumigant","fumigatia":"fumigație","fumigatiei":"fumigație","fumigatii":"fumigație","fumigatiile":"fumigație","fumigatiilor":"fumigație","fumigatiunea":"fumigațiune","fumigatiuni":"fumigațiune","fumigatiunii":"fumigațiune","fumigatiunile":"fumigațiune","fumigatiunilor":"fumigațiune","fumigena":["fumigenă","fumigen","fumigena","fumigen"],"fumigene":["fumigene","fumigen","fumigene","fumigenă"],"fumigenei":"fumigenă","fumigenele":["fumigenele","fumigen","fumigenele","fumigenă"],"fumigenelor":"fumigenă","fumigeni":"fumigen","fumigenii":"fumigen","fumigenul":"fumigen","fumisteria":"fumisterie","fumisteriei":"fumisterie","fumisterii":"fumisterie","fumisteriile":"fumisterie","fumisteriilor":"fumisterie","fumivora":["fumivoră","fumivor","fumivora","fumivor"],"fumivore":"fumivor","fumivorele":"fumivor","fumivori":"fumivor","fumivorii":"fumivor","fumivorul":"fumivor","fumizai":"fumiza","fumizam":["fumizăm","fumiza","fumizam","fumiza"],"fumizand":"fumiza","fumizara":"fumiza","fumizaram":"fumiza","fumizarati":"fumiza","fumizarea":"fumizare","fumizari":"fumizare","fumizarii":"fumizare","fumizarile":"fumizare","fumizarilor":"fumizare","fumizase":"fumiza","fumizasem":"fumiza","fumizasera":"fumiza","fumizaseram":"fumiza","fumizaserati":"fumiza","fumizasesi":"fumiza","fumizasi":"fumiza","fumizat":"fumiza","fumizati":"fumiza","fumizau":"fumiza","fumizeaza":"fumiza","fumizez":"fumiza","fumizezi":"fumiza","fumoare":"fumoar","fumoarele":"fumoar","fumoarelor":"fumoar","fumoarul":"fumoar","fumoarule":"fumoar","fumoarului":"fumoar","fumuare":"fumuar","fumuarele":"fumuar","fumuarelor":"fumuar","fumuarul":"fumuar","fumuarule":"fumuar","fumuarului":"fumuar","fumul":"fum","fumule":"fum","fumului":"fum","fumura":["fumură","fumur","fumura","fumur"],"fumure":"fumur","fumurele":"fumur","fumuri":["fumuri","fum","fumuri","fumur"],"fumuria":"fumuriu","fumurie":"fumuriu","fumurii":["fumurii","fumur","fumurii","fumuriu"],"fumuriii":"fumuriu","fumuriile":"fumuriu","fumurile":"fum","fumurilor":"fum","fumuriul":"fumuriu","fumuroasa":["fumuroasă","fumuros","fumuroasa","fumuros"],"fumuroase":"fumuros","fumuroasele":"fumuros","fumurosi":"fumuros","fumurosii":"fumuros","fumurosul":"fumuros","fumurul":"fumur","funambule":"funambulă","funambuleasca":["funambulească","funambulesc","funambuleasca","funambulesc"],"funambulei":"funambulă","funambulele":"funambulă","funambulelor":"funambulă","funambulescul":"funambulesc","funambulesti":"funambulesc","funambulestii":"funambulesc","funambulestile":"funambulesc","funambuli":"funambul","funambulii":"funambul","funambulilor":"funambul","funambulul":"funambul","funambulule":"funambul","funambulului":"funambul","funari":"funar","funarii":"funar","funarilor":"funar","funarul":"funar","funarule":"funar","funarului":"funar","funceuul":"funceu","funceuule":"funceu","funceuului":"funceu","funciara":["funciară","funciar","funciara","funciar"],"funciare":"funciar","funciarele":"funciar","funciari":"funciar","funciarii":"funciar","funciarul":"funciar","functia":"funcție","functiei":"funcție","functii":"funcție","functii bijective":"funcție bijectivă","functii continue":"funcție continuă","functii de unda":"funcție de undă","functii generice":"funcție generică","functii injective":"funcție injectivă","functii integrabile":"funcție integrabilă","functii masurabile":"funcție măsurabilă","functii obiectiv":"funcție obiectiv","functii periodice":"funcție periodică","functii simetrice":"funcție simetrică","functii surjective":"funcție surjectivă","functii trigonometrice":"funcție trigonometrică","functiile":"funcție","functiilor":"funcție","functionai":"funcționa","functionala":["funcțională","funcțional","funcționala","funcțional"],"functionale":"funcțional","functionalele":"funcțional","functionali":"funcțional","functionalii":"funcțional","functionalisme":"funcționalism","functionalismele":"funcționalism","functionalismelor":"funcționalism","functionalismul":"funcționalism","functionalismule":"funcționalism","functionalismului":"funcționalism","functionalisti":"funcționalist","functionalistii":"funcționalist","functionalistilor":"funcționalist","functionalistul":"funcționalist","functionalistule":"funcționalist","functionalistului":"funcționalist","functionalitatea":"funcționalitate","functionalitati":"funcționalitate","functionalitatii":"funcționalitate","functionalitatile":"funcționalitate","functionalitatilor":"funcționalitate","functionalul":"funcțional","functionam":["funcționăm","funcționa","funcționam","funcționa"],"functionand":"funcționa","functionara":"funcționa","functionaram":"funcționa","functionarasi":"funcționăraș","functionarasii":"funcționăraș","functionarasilor":"funcționăraș","functionarasul":"funcționăraș","functionarasule":"funcționăraș","functionarasului":"funcționăraș","functionarati":"funcționa","functionare":"funcționară","functionarea":"funcționare","functionareasca":["funcționărească","funcționăresc","funcționăreasca","funcționăresc"],"functionarei":"funcționară","functionarele":"funcționară","functionarelor":"funcționară","functionarescul":"funcționăresc","functionaresti":"funcționăresc","functionarestii":"funcționăresc","functionarestile":"funcționăresc","functionari":["funcționari","funcționar","funcționări","funcționare"],"functionari publici":"funcționar public","functionarii":["funcționarii","funcționar","funcționării","funcționare"],"functionarile":"funcționare","functionarilor":["funcționarilor","funcționar","funcționărilor","funcționare"],"functionarimea":"funcționărime","functionarimi":"funcționărime","functionarimii":"funcționărime","functionarimile":"funcționărime","functionarimilor":"funcționărime","functionarisme":"funcționarism","functionarismele":"funcționarism","functionarismelor":"funcționarism","functionarismul":"funcționarism","functionarismule":"funcționarism","functionarismului":"funcționarism","functionarul":"funcționar","functionarule":"funcționar","functionarului":"funcționar","functionase":"funcționa","functionasem":"funcționa","functionasera":"funcționa","functionaseram":"funcționa","functionaserati":"funcționa","functionasesi":"funcționa","functionasi":"funcționa","functionat":"funcționa","functionata":["funcționată","funcționat","funcționata","funcționat"],"functionate":"funcționat","functionatele":"funcționat","functionati":["funcționați","funcționa","funcționați","funcționat"],"functionatii":"funcționat","functionatul":"funcționat","functionau":"funcționa","functioneaza":"funcționa","functionez":"funcționa","functionezi":"funcționa","functiune":"funcție","functiuni":"funcțiune","functori":"functor","functorii":"functor","functorilor":"functor","functorul":"functor","functorule":"functor","functorului":"functor","fundaci":"fundac","fundacile":"fundac","fundacilor":"fundac","fundacul":"fundac","fundacule":"fundac","fundacului":"fundac","fundai":"funda","fundale":"fundal","fundalele":"fundal","fundalelor":"fundal","fundalul":"fundal","fundalule":"fundal","fundalului":"fundal","fundam":["fundăm","funda","fundam","funda"],"fundamecul":"fundamec","fundamecule":"fundamec","fundamecului":"fundamec","fundamecuri":"fundamec","fundamecurile":"fundamec","fundamecurilor":"fundamec","fundamentai":"fundamenta","fundamentala":["fundamentală","fundamental","fundamentala","fundamental"],"fundamentale":"fundamental","fundamentalele":"fundamental","fundamentali":"fundamental","fundamentalii":"fundamental","fundamentalismul":"fundamentalism","fundamentalismule":"fundamentalism","fundamentalismului":"fundamentalism","fundamentalista":["fundamentalistă","fundamentalist","fundamentalista","fundamentalist"],"fundamentaliste":["fundamentaliste","fundamentalist","fundamentaliste","fundamentalistă"],"fundamentalistei":"fundamentalistă","fundamentalistele":["fundamentalistele","fundamentalist","fundamentalistele","fundamentalistă"],"fundamentalistelor":"fundamentalistă","fundamentalisti":"fundamentalist","fundamentalistii":"fundamentalist","fundamentalistilor":"fundamentalist","fundamentalistul":"fundamentalist","fundamentalistule":"fundamentalist","fundamentalistului":"fundamentalist","fundamentalul":"fundamental","fundamentam":["fundamentăm","fundamenta","fundamentam","fundamenta"],"fundamentand":"fundamenta","fundamentara":"fundamenta","fundamentaram":"fundamenta","fundamentarati":"fundamenta","fundamentarea":"fundamentare","fundamentari":"fundamentare","fundamentarii":"fundamentare","fundamentarile":"fundamentare","fundamentarilor":"fundamentare","fundamentase":"fundamenta","fundamentasem":"fundamenta","fundamentasera":"fundamenta","fundamentaseram":"fundamenta","fundamentaserati":"fundamenta","fundamentasesi":"fundamenta","fundamentasi":"fundamenta","fundamentat":"fundamenta","fundamentati":"fundamenta","fundamentau":"fundamenta","fundamente":"fundament","fundamenteaza":"fundamenta","fundamentele":"fundament","fundamentelor":"fundament","fundamentez":"fundamenta","fundamentezi":"fundamenta","fundamentul":"fundament","fundamentule":"fundament","fundamentului":"fundament","fundand":"funda","fundara":"funda","fundaram":"funda","fundarati":"funda","fundarea":"fundare","fundari":"fundare","fundarii":"fundare","fundarile":"fundare","fundarilor":"fundare","fundarisea":"fundarisi","fundariseai":"fundarisi","fundariseam":"fundarisi","fundariseati":"fundarisi","fundariseau":"fundarisi","fundarisesc":"fundarisi","fundariseste":"fundarisi","fundarisesti":"fundarisi","fundarisii":"fundarisi","fundarisim":"fundarisi","fundarisind":"fundarisi","fundarisira":"fundarisi","fundarisiram":"fundarisi","fundarisirati":"fundarisi","fundarisirea":"fundarisire","fundarisiri":"fundarisire","fundarisirii":"fundarisire","fundarisirile":"fundarisire","fundarisirilor":"fundarisire","fundarisise":"fundarisi","fundarisisem":"fundarisi","fundarisisera":"fundarisi","fundarisiseram":"fundarisi","fundarisiserati":"fundarisi","fundarisisesi":"fundarisi","fundarisisi":"fundarisi","fundarisit":"fundarisi","fundarisiti":"fundarisi","fundase":"funda","fundasem":"funda","fundasera":"funda","fundaseram":"funda","fundaserati":"funda","fundasesi":"funda","fundasi":["fundași","funda","fundași","fundaș"],"fundasii":"fundaș","fundasilor":"fundaș","fundasul":"fundaș","fundasule":"fundaș","fundasului":"fundaș","fundat":"funda","fundata":["fundată","fundat","fundata","fundat"],"fundate":"fundat","fundatele":"fundat","fundati":["fundați","funda","fundați","fundat"],"fundatii":["fundații","fundat","fundații","fundație"],"fundatiunea":"fundațiune","fundatiuni":"fundațiune","fundatiunii":"fundațiune","fundatiunile":"fundațiune","fundatiunilor":"fundațiune","fundatoarea":"fundatoare","fundatoarei":"fundatoare","fundatoarele":"fundatoare","fundatoarelor":"fundatoare","fundator":"fondator","fundatori":"fundator","fundatorii":"fundator","fundatorilor":"fundator","fundatorul":"fundator","fundatorule":"fundator","fundatorului":"fundator","fundatul":"fundat","fundaturi":"fundătură","fundaturii":"fundătură","fundaturile":"fundătură","fundaturilor":"fundătură","fundau":"funda","funde":"fundă","fundeaza":"funda","fundei":"fundă","fundele":"fundă","fundelor":"fundă","fundez":"funda","fundezi":"funda","fundicii":"fundici","fundicilor":"fundici","fundiciul":"fundici","fundiciule":"fundici","fundiciului":"fundici","fundite":"fundiță","funditei":"fundiță","funditele":"fundiță","funditelor":"fundiță","funduci":"funduc","funducii":"funduc","funducilor":"funduc","funduclii":"funducliu","funducliii":"funducliu","funducliilor":"funducliu","funducliuul":"funducliu","funducliuule":"funducliu","funducliuului":"funducliu","funducul":"funduc","funducule":"funduc","funducului":"funduc","fundul":"fund","fundule":"fund","fundulete":"funduleț","funduletele":"funduleț","funduletelor":"funduleț","funduletul":"funduleț","funduletule":"funduleț","funduletului":"funduleț","fundului":"fund","funduri":"fund","fundurile":"fund","fundurilor":"fund","fundutul":"funduț","fundutule":"funduț","fundutului":"funduț","funduturi":"funduț","funduturile":"funduț","funduturilor":"funduț","funeaua":"funea","funebra":["funebră","funebru","funebra","funebru"],"funebre":"funebru","funebrele":"funebru","funebri":"funebru","funebrii":"funebru","funebrul":"funebru","funecel":"furnicel","funele":"funea","funelei":"funea","funelele":"funea","funelelor":"funea","funeraliiul":"funeralii","funeraliiule":"funeralii","funeraliiului":"funeralii","funerara":["funerară","funerar","funerara","funerar"],"funerare":"funerar","funerarele":"funerar","funerari":"funerar","funerarii":"funerar","funerarul":"funerar","funesta":["funestă","funest","funesta","funest"],"funeste":"funest","funestele":"funest","funesti":"funest","funestii":"funest","funestul":"funest","fungibila":["fungibilă","fungibil","fungibila","fungibil"],"fungibile":"fungibil","fungibilele":"fungibil","fungibili":"fungibil","fungibilii":"fungibil","fungibilul":"fungibil","fungica":["fungică","fungic","fungica","fungic"],"fungice":"fungic","fungicele":"fungic","fungici":"fungic","fungicide":"fungicid","fungicidele":"fungicid","fungicidelor":"fungicid","fungicidul":"fungicid","fungicidule":"fungicid","fungicidului":"fungicid","fungicii":"fungic","fungicul":"fungic","fungiforma":["fungiformă","fungiform","fungiforma","fungiform"],"fungiforme":"fungiform","fungiformele":"fungiform","fungiformi":"fungiform","fungiformii":"fungiform","fungiformul":"fungiform","fungii":"fungi","fungilor":"fungi","fungistatica":["fungistatică","fungistatic","fungistatica","fungistatic"],"fungistatice":"fungistatic","fungistaticele":"fungistatic","fungistatici":"fungistatic","fungistaticii":"fungistatic","fungistaticile":"fungistatic","fungistaticilor":"fungistatic","fungistaticul":"fungistatic","fungistaticule":"fungistatic","fungistaticului":"fungistatic","fungoida":["fungoidă","fungoid","fungoida","fungoid"],"fungoide":"fungoid","fungoidele":"fungoid","fungoidul":"fungoid","fungoizi":"fungoid","fungoizii":"fungoid","fungozitatati":"fungozitate","fungozitatatii":"fungozitate","fungozitatatile":"fungozitate","fungozitatatilor":"fungozitate","fungozitatea":"fungozitate","funia":"funie","funiceaua":"funicea","funicele":"funicea","funicelei":"funicea","funicicele":"funicică","funicicelei":"funicică","funicicelele":"funicică","funicicelelor":"funicică","funiculariste":"funicularistă","funicularistei":"funicularistă","funicularistele":"funicularistă","funicularistelor":"funicularistă","funicularisti":"funicularist","funicularistii":"funicularist","funicularistilor":"funicularist","funicularistul":"funicularist","funicularistule":"funicularist","funicularistului":"funicularist","funiculi":"funicul","funiculii":"funicul","funiculilor":"funicul","funiculite":"funiculită","funiculitei":"funiculită","funiculitele":"funiculită","funiculitelor":"funiculită","funiculul":"funicul","funiculule":"funicul","funiculului":"funicul","funiei":"funie","funier":"funar","funieri":"funier","funierii":"funier","funierilor":"funier","funierul":"funier","funierule":"funier","funierului":"funier","funigei":"funigel","funigeii":"funigel","funigeilor":"funigel","funigelul":"funigel","funigelule":"funigel","funigelului":"funigel","funii":"funie","funiile":"funie","funiilor":"funie","funinginata":["funinginată","funinginat","funinginata","funinginat"],"funinginate":"funinginat","funinginatele":"funinginat","funinginati":"funinginat","funinginatii":"funinginat","funinginatul":"funinginat","funingini":"funingine","funinginoasa":["funinginoasă","funinginos","funinginoasa","funinginos"],"funinginoase":"funinginos","funinginoasele":"funinginos","funinginosi":"funinginos","funinginosii":"funinginos","funinginosul":"funinginos","funioare":"funioară","funioarei":"funioară","funioarele":"funioară","funioarelor":"funioară","funisoare":"funișoară","funisoarei":"funișoară","funisoarele":"funișoară","funisoarelor":"funișoară","funiute":"funiuță","funiutei":"funiuță","funiutele":"funiuță","funiutelor":"funiuță","funta":"fundă","funti":"funt","funtii":"funt","funtilor":"funt","funtul":"funt","funtule":"funt","funtului":"funt","fur":"fura","furaciunea":"furăciune","furaciuni":"furăciune","furaciunii":"furăciune","furaciunile":"furăciune","furaciunilor":"furăciune","furai":"fura","furajai":"furaja","furajam":["furajăm","furaja","furajam","furaja"],"furajand":"furaja","furajara":"furaja","furajaram":"furaja","furajarati":"furaja","furajarea":"furajare","furajari":"furajare","furajarii":"furajare","furajarile":"furajare","furajarilor":"furajare","furajase":"furaja","furajasem":"furaja","furajasera":"furaja","furajaseram":"furaja","furajaserati":"furaja","furajasesi":"furaja","furajasi":"furaja","furajat":"furaja","furajata":["furajată","furajat","furajata","furajat"],"furajate":"furajat","furajatele":"furajat","furajati":["furajați","furaja","furajați","furajat"],"furajatii":"furajat","furajatul":"furajat","furajau":"furaja","furaje":"furaj","furajeaza":"furaja","furajele":"furaj","furajelor":"furaj","furajera":["furajeră","furajer","furajera","furajer"],"furajere":"furajer","furajerele":"furajer","furajeri":"furajer","furajerii":"furajer","furajerul":"furajer","furajez":"furaja","furajezi":"furaja","furajiere":"furajieră","furajierei":"furajieră","furajierele":"furajieră","furajierelor":"furajieră","furajori":"furajor","furajorii":"furajor","furajorilor":"furajor","furajorul":"furajor","furajorule":"furajor","furajorului":"furajor","furajul":"furaj","furajule":"furaj","furajului":"furaj","furam":["furăm","fura","furam","fura"],"furand":"fura","furanul":"furan","furanule":"furan","furanului":"furan","furara":"fura","furaram":"fura","furarati":"fura","furase":"fura","furasem":"fura","furasera":"fura","furaseram":"fura","furaserati":"fura","furasesi":"fura","furasi":"fura","furat":"fura","furat inima":"fura inima","furati":"fura","furatoare":"furător","furatoarea":["furătoarea","furătoare","furătoarea","furător"],"furatoarei":"furătoare","furatoarele":["furătoarele","furătoare","furătoarele","furător"],"furatoarelor":"furătoare","furatori":"furător","furatorii":"furător","furatorul":"furător","furatul":"furat","furatule":"furat","furatului":"furat","furaturi":"furătură","furaturii":"furătură","furaturile":"furătură","furaturilor":"furătură","furau":"fura","furbisat":"furbisa","furbiseaza":"furbisa","furcata":["furcată","furcat","furcata","furcat"],"furcate":"furcat","furcatele":"furcat","furcati":"furcat","furcatii":"furcat","furcatul":"furcat","furcaturi":"furcătură","furcaturii":"furcătură","furcaturile":"furcătură","furcaturilor":"furcătură","furceaua":"furcea","furcele":"furcea","furcelei":"furcea","furcelele":"furcea","furcelelor":"furcea","furcelusi":"furceluș","furcelusii":"furceluș","furcelusilor":"furceluș","furcelusul":"furceluș","furcelusule":"furceluș","furcelusului":"furceluș","furcheti":"furchet","furchetii":"furchet","furchetilor":"furchet","furchetul":"furchet","furchetule":"furchet","furchetului":"furchet","furchite":"furchiță","furchitei":"furchiță","furchitele":"furchiță","furchitelor":"furchiță","furci":"furcă","furcii":"furcă","furcile":"furcă","furcilor":"furcă","furcoaie":"furcoi","furcoaiele":"furcoi","furcoaielor":"furcoi","furcoiul":"furcoi","furcoiule":"furcoi","furcoiului":"furcoi","furculite":"furculiță","furculitei":"furculiță","furculitele":"furculiță","furculitelor":"furculiță","furcusoare":"furcușoară","furcusoarei":"furcușoară","furcute":"furcuță","furcutei":"furcuță","furcutele":"furcuță","furcutelor":"furcuță","furdale":"furda","furdalei":"furda","furdalele":"furda","furdalelor":"furda","furdaua":"furda","furdoane":"furdoană","furdoanei":"furdoană","furdoanele":"furdoană","furdoanelor":"furdoană","fure":"fura","fure inima":"fura inima","furfuroli":"furfurol","furfurolii":"furfurol","furfurolilor":"furfurol","furfurolul":"furfurol","furfurolule":"furfurol","furfurolului":"furfurol","furgasea":"furgăsi","furgaseai":"furgăsi","furgaseam":"furgăsi","furgaseati":"furgăsi","furgaseau":"furgăsi","furgasele":"furgăseală","furgaselei":"furgăseală","furgaselele":"furgăseală","furgaselelor":"furgăseală","furgaseli":"furgăseală","furgasesc":"furgăsi","furgaseste":"furgăsi","furgasesti":"furgăsi","furgasii":"furgăsi","furgasim":"furgăsi","furgasind":"furgăsi","furgasira":"furgăsi","furgasiram":"furgăsi","furgasirati":"furgăsi","furgasise":"furgăsi","furgasisem":"furgăsi","furgasisera":"furgăsi","furgasiseram":"furgăsi","furgasiserati":"furgăsi","furgasisesi":"furgăsi","furgasisi":"furgăsi","furgasit":"furgăsi","furgasita":["furgăsită","furgăsit","furgăsita","furgăsit"],"furgasite":"furgăsit","furgasitele":"furgăsit","furgasiti":["furgăsiți","furgăsi","furgăsiți","furgăsit"],"furgasitii":"furgăsit","furgasitul":"furgăsit","furgoane":"furgon","furgoanele":"furgon","furgoanelor":"furgon","furgonari":"furgonar","furgonarii":"furgonar","furgonarilor":"furgonar","furgonarul":"furgonar","furgonarule":"furgonar","furgonarului":"furgonar","furgonete":"furgonetă","furgonetei":"furgonetă","furgonetele":"furgonetă","furgonetelor":"furgonetă","furgonul":"furgon","furgonule":"furgon","furgonului":"furgon","furi":["furi","fur","furi","fura"],"furia":["furia","furie","furia","furlua"],"furibunda":["furibundă","furibund","furibunda","furibund"],"furibunde":"furibund","furibundele":"furibund","furibundul":"furibund","furibunzi":"furibund","furibunzii":"furibund","furiei":"furie","furieri":"furier","furierii":"furier","furierilor":"furier","furierul":"furier","furierule":"furier","furierului":"furier","furii":"furie","furiile":"furie","furiilor":"furie","furioasa":["furioasă","furios","furioasa","furios"],"furioase":"furios","furioasele":"furios","furiosi":"furios","furiosii":"furios","furiosoul":"furioso","furiosoule":"furioso","furiosoului":"furioso","furiosul":"furios","furisa":["furișă","furiș","furișa","furiș"],"furisai":"furișa","furisam":["furișăm","furișa","furișam","furișa"],"furisand":"furișa","furisara":"furișa","furisaram":"furișa","furisarati":"furișa","furisarea":"furișare","furisari":"furișare","furisarii":"furișare","furisarile":"furișare","furisarilor":"furișare","furisase":"furișa","furisasem":"furișa","furisasera":"furișa","furisaseram":"furișa","furisaserati":"furișa","furisasesi":"furișa","furisasi":"furișa","furisat":"furișa","furisata":["furișată","furișat","furișata","furișat"],"furisate":"furișat","furisatele":"furișat","furisati":["furișați","furișa","furișați","furișat"],"furisatii":"furișat","furisatul":"furișat","furisau":"furișa","furise":"furiș","furiseaza":"furișa","furisele":"furiș","furisez":"furișa","furisezi":"furișa","furisi":"furiș","furisii":"furiș","furisori":"furișor","furisorii":"furișor","furisorilor":"furișor","furisorul":"furișor","furisorule":"furișor","furisorului":"furișor","furisul":"furiș","furlandisea":"furlandisi","furlandiseai":"furlandisi","furlandiseam":"furlandisi","furlandiseati":"furlandisi","furlandiseau":"furlandisi","furlandisesc":"furlandisi","furlandiseste":"furlandisi","furlandisesti":"furlandisi","furlandisii":"furlandisi","furlandisim":"furlandisi","furlandisind":"furlandisi","furlandisira":"furlandisi","furlandisiram":"furlandisi","furlandisirati":"furlandisi","furlandisise":"furlandisi","furlandisisem":"furlandisi","furlandisisera":"furlandisi","furlandisiseram":"furlandisi","furlandisiserati":"furlandisi","furlandisisesi":"furlandisi","furlandisisi":"furlandisi","furlandisit":"furlandisi","furlandisiti":"furlandisi","furlu":"furlua","furluai":"furlua","furluam":["furluăm","furlua","furluam","furlua"],"furluand":"furlua","furluara":"furlua","furluaram":"furlua","furluarati":"furlua","furluase":"furlua","furluasem":"furlua","furluasera":"furlua","furluaseram":"furlua","furluaserati":"furlua","furluasesi":"furlua","furluasi":"furlua","furluat":"furlua","furluati":"furlua","furluau":"furlua","furlui":"furlua","furmintul":"furmint","furmintule":"furmint","furmintului":"furmint","furnalisti":"furnalist","furnalistii":"furnalist","furnalistilor":"furnalist","furnalistul":"furnalist","furnalistule":"furnalist","furnalistului":"furnalist","furnalul":"furnal","furnalule":"furnal","furnalului":"furnal","furnaluri":"furnal","furnalurile":"furnal","furnalurilor":"furnal","furnecaie":"furnecai","furnecaiele":"furnecai","furnecaielor":"furnecai","furnecaiul":"furnecai","furnecaiule":"furnecai","furnecaiului":"furnecai","furnic":"furnica","furnicai":"furnica","furnicam":["furnicăm","furnica","furnicam","furnica"],"furnicand":"furnica","furnicara":"furnica","furnicaram":"furnica","furnicarati":"furnica","furnicare":"furnicar","furnicarea":"furnicare","furnicarele":["furnicarele","furnicar","furnicărele","furnicăreală"],"furnicarelei":"furnicăreală","furnicarelele":"furnicăreală","furnicarelelor":"furnicăreală","furnicareli":"furnicăreală","furnicarelor":"furnicar","furnicari":["furnicari","furnicar","furnicări","furnicare"],"furnicarii":["furnicarii","furnicar","furnicării","furnicare"],"furnicarile":"furnicare","furnicarilor":["furnicarilor","furnicar","furnicărilor","furnicare"],"furnicarul":"furnicar","furnicarule":"furnicar","furnicarului":"furnicar","furnicase":"furnica","furnicasem":"furnica","furnicasera":"furnica","furnicaseram":"furnica","furnicaserati":"furnica","furnicasesi":"furnica","furnicasi":"furnica","furnicat":"furnica","furnicati":"furnica","furnicaturi":"furnicătură","furnicaturii":"furnicătură","furnicaturile":"furnicătură","furnicaturilor":"furnicătură","furnicau":"furnica","furnice":"furnica","furnicei":"furnicel","furniceii":"furnicel","furniceilor":"furnicel","furnicelul":"furnicel","furnicelule":"furnicel","furnicelului":"furnicel","furnici":["furnici","furnica","furnici","furnică"],"furnicii":"furnică","furnicile":"furnică","furnicilor":"furnică","furnicoasa":["furnicoasă","furnicos","furnicoasa","furnicos"],"furnicoase":"furnicos","furnicoasele":"furnicos","furnicosi":"furnicos","furnicosii":"furnicos","furnicosul":"furnicos","furnicute":"furnicuță","furnicutei":"furnicuță","furnicutele":"furnicuță","furnicutelor":"furnicuță","furnire":"furnir","furnirele":"furnir","furnirelor":"furnir","furniruia":"furnirui","furniruiai":"furnirui","furniruiam":"furnirui","furniruiati":"furnirui","furniruiau":"furnirui","furniruiesc":"furnirui","furniruieste":"furnirui","furniruiesti":"furnirui","furniruii":"furnirui","furniruim":"furnirui","furniruind":"furnirui","furniruira":"furnirui","furniruiram":"furnirui","furniruirati":"furnirui","furniruise":"furnirui","furniruisem":"furnirui","furniruisera":"furnirui","furniruiseram":"furnirui","furniruiserati":"furnirui","furniruisesi":"furnirui","furniruisi":"furnirui","furniruit":"furnirui","furniruita":["furniruită","furniruit","furniruita","furniruit"],"furniruite":"furniruit","furniruitele":"furniruit","furniruiti":["furniruiți","furnirui","furniruiți","furniruit"],"furniruitii":"furniruit","furniruitul":"furniruit","furnirul":"furnir","furnirule":"furnir","furnirului":"furnir","furnituri":"furnitură","furniturii":"furnitură","furniturile":"furnitură","furniturilor":"furnitură","furnizai":"furniza","furnizam":["furnizăm","furniza","furnizam","furniza"],"furnizand":"furniza","furnizara":"furniza","furnizaram":"furniza","furnizarati":"furniza","furnizarea":"furnizare","furnizari":"furnizare","furnizarii":"furnizare","furnizarile":"furnizare","furnizarilor":"furnizare","furnizase":"furniza","furnizasem":"furniza","furnizasera":"furniza","furnizaseram":"furniza","furnizaserati":"furniza","furnizasesi":"furniza","furnizasi":"furniza","furnizat":"furniza","furnizata":["furnizată","furnizat","furnizata","furnizat"],"furnizate":"furnizat","furnizatele":"furnizat","furnizati":["furnizați","furniza","furnizați","furnizat"],"furnizatii":"furnizat","furnizatul":"furnizat","furnizau":"furniza","furnizeaza":"furniza","furnizez":"furniza","furnizezi":"furniza","furnizoarea":"furnizoare","furnizoarei":"furnizoare","furnizoarele":"furnizoare","furnizoarelor":"furnizoare","furnizori":"furnizor","furnizorii":"furnizor","furnizorilor":"furnizor","furnizorul":"furnizor","furnizorule":"furnizor","furnizorului":"furnizor","furoarea":"furoare","furori":"furoare","furorii":"furoare","furorile":"furoare","furorilor":"furoare","furouri":"furou","furourile":"furou","furourilor":"furou","furouul":"furou","furouule":"furou","furouului":"furou","fursecul":"fursec","fursecule":"fursec","fursecului":"fursec","fursecuri":"fursec","fursecurile":"fursec","fursecurilor":"fursec","furtisagul":"furtișag","furtisagule":"furtișag","furtisagului":"furtișag","furtisaguri":"furtișag","furtisagurile":"furtișag","furtisagurilor":"furtișag","furtiva":["furtivă","furtiv","furtiva","furtiv"],"furtive":"furtiv","furtivele":"furtiv","furtivi":"furtiv","furtivii":"furtiv","furtivul":"furtiv","furtunari":"furtunar","furtunarii":"furtunar","furtunarilor":"furtunar","furtunarul":"furtunar","furtunarule":"furtunar","furtunarului":"furtunar","furtunata":["furtunată","furtunat","furtunata","furtunat"],"furtunate":"furtunat","furtunateca":["furtunatecă","furtunatec","furtunateca","furtunatec"],"furtunatece":"furtunatec","furtunatecele":"furtunatec","furtunateci":"furtunatec","furtunatecii":"furtunatec","furtunatecul":"furtunatec","furtunatele":"furtunat","furtunati":"furtunat","furtunatica":["furtunatică","furtunatic","furtunatica","furtunatic"],"furtunatice":"furtunatic","furtunaticele":"furtunatic","furtunatici":"furtunatic","furtunaticii":"furtunatic","furtunaticul":"furtunatic","furtunatii":"furtunat","furtunatul":"furtunat","furtuni":"furtună","furtuni de zapada":"furtună de zăpadă","furtunii":"furtună","furtunile":"furtună","furtunilor":"furtună","furtunoasa":["furtunoasă","furtunos","furtunoasa","furtunos"],"furtunoase":"furtunos","furtunoasele":"furtunos","furtunosi":"furtunos","furtunosii":"furtunos","furtunosul":"furtunos","furtunul":"furtun","furtunule":"furtun","furtunului":"furtun","furtunuri":"furtun","furtunurile":"furtun","furtunurilor":"furtun","furturi":"furt","furuncule":"furuncul","furunculele":"furuncul","furunculelor":"furuncul","furunculoasa":["furunculoasă","furunculos","furunculoasa","furunculos"],"furunculoase":"furunculos","furunculoasele":"furunculos","furunculosi":"furunculos","furunculosii":"furunculos","furunculosul":"furunculos","furunculoze":"furunculoză","furunculozei":"furunculoză","furunculozele":"furunculoză","furunculozelor":"furunculoză","furunculul":"furuncul","furunculule":"furuncul","furunculului":"furuncul","fusari":"fusar","fusarii":["fusarii","fusar","fusarii","fusariu"],"fusariii":"fusariu","fusariilor":"fusariu","fusarilor":"fusar","fusariu":"fusar","fusariul":"fusariu","fusariule":"fusariu","fusariului":"fusariu","fusarole":"fusarolă","fusarolei":"fusarolă","fusarolele":"fusarolă","fusarolelor":"fusarolă","fusarul":"fusar","fusarule":"fusar","fusarului":"fusar","fuscei":["fuscei","fuscel","fușcei","fușcel"],"fusceii":"fuscel","fusceilor":"fuscel","fusceli":"fușcel","fuscelii":"fușcel","fuscelilor":"fușcel","fuscelul":["fuscelul","fuscel","fușcelul","fușcel"],"fuscelule":["fuscelule","fuscel","fușcelule","fușcel"],"fuscelului":["fuscelului","fuscel","fușcelului","fușcel"],"fuscioare":"fuscior","fuscioarele":"fuscior","fuscioarelor":"fuscior","fusciorul":"fuscior","fusciorule":"fuscior","fusciorului":"fuscior","fuse":["fuse","fi","fuse","fus"],"fusei":"fi","fusele":"fus","fuselor":"fus","fusera":"fi","fuseram":"fi","fuserati":"fi","fusese":"fi","fusesem":"fi","fusesera":"fi","fuseseram":"fi","fuseserati":"fi","fusesesi":"fi","fusesi":"fi","fusiforma":["fusiformă","fusiform","fusiforma","fusiform"],"fusiforme":"fusiform","fusiformele":"fusiform","fusiformi":"fusiform","fusiformii":"fusiform","fusiformul":"fusiform","fustanele":"fustanelă","fustanelei":"fustanelă","fustanelele":"fustanelă","fustanelelor":"fustanelă","fustangii":"fustangiu","fustangiii":"fustangiu","fustangiilor":"fustangiu","fustangiul":"fustangiu","fustangiule":"fustangiu","fustangiului":"fustangiu","fustasi":["fustași","fustaș","fuștași","fuștaș"],"fustasii":["fustașii","fustaș","fuștașii","fuștaș"],"fustasilor":["fustașilor","fustaș","fuștașilor","fuștaș"],"fustasul":["fustașul","fustaș","fuștașul","fuștaș"],"fustasule":["fustașule","fustaș","fuștașule","fuștaș"],"fustasului":["fustașului","fustaș","fuștașului","fuștaș"],"fuste":"fustă","fustea":"fuște","fustei":["fustei","fustă","fuștei","fuștel"],"fustele":"fustă","fusteli":"fuștel","fustelii":"fuștel","fustelilor":"fuștel","fustelor":"fustă","fustelul":"fuștel","fustelule":"fuștel","fustelului":"fuștel","fusti":"fuște","fustigatia":"fustigație","fustigatiei":"fustigație","fustigatii":"fustigație","fustigatiile":"fustigație","fustigatiilor":"fustigație","fustii":"fuște","fustile":"fuște","fustilor":"fuște","fustisoare":"fustișoară","fustisoarei":"fustișoară","fustisoarele":"fustișoară","fustisoarelor":"fustișoară","fustite":"fustiță","fustitei":"fustiță","fustitele":"fustiță","fustitelor":"fustiță","fusul":"fus","fusule":"fus","fusului":"fus","fusuri":"fus","fusuri orare":"fus orar","fusuri sferice":"fus sferic","fut":"fute","futa":"fute","futabila":["futabilă","futabil","futabila","futabil"],"futabile":"futabil","futabilele":"futabil","futabili":"futabil","futabilii":"futabil","futabilul":"futabil","futaciosi":"futăcios","futaciosii":"futăcios","futaciosilor":"futăcios","futaciosul":"futăcios","futaciosule":"futăcios","futaciosului":"futăcios","futaiul":"futai","futaiule":"futai","futaiului":"futai","futalai":"futălău","futalaii":"futălău","futalailor":"futălău","futalauul":"futălău","futalauule":"futălău","futalauului":"futălău","futand":"fute","futangii":"futangiu","futangiii":"futangiu","futangiilor":"futangiu","futangiul":"futangiu","futangiule":"futangiu","futangiului":"futangiu","futea":"fute","futeai":"fute","futeam":"fute","futeati":"fute","futeau":"fute","futelnite":"futelniță","futelnitei":"futelniță","futelnitele":"futelniță","futelnitelor":"futelniță","futem":"fute","futerea":"futere","futeri":"futere","futerii":"futere","futerile":"futere","futerilor":"futere","futeti":"fute","futi":"fute","futila":["futilă","futil","futila","futil"],"futile":"futil","futilele":"futil","futili":"futil","futilii":"futil","futilitatea":"futilitate","futilitati":"futilitate","futilitatii":"futilitate","futilitatile":"futilitate","futilitatilor":"futilitate","futilul":"futil","futu":"fute","futui":"fute","futura":"fute","futuram":"fute","futurati":"fute","futurismul":"futurism","futurismule":"futurism","futurismului":"futurism","futuriste":"futuristă","futuristei":"futuristă","futuristele":"futuristă","futuristelor":"futuristă","futuristi":"futurist","futuristii":"futurist","futuristilor":"futurist","futuristul":"futurist","futuristule":"futurist","futuristului":"futurist","futurologe":"futurologă","futurologei":"futurologă","futurologele":"futurologă","futurologelor":"futurologă","futurologi":"futurolog","futurologia":"futurologie","futurologiei":"futurologie","futurologii":["futurologii","futurolog","futurologii","futurologie"],"futurologilor":"futurolog","futurologul":"futurolog","futurologule":"futurolog","futurologului":"futurolog","futuse":"fute","futusem":"fute","futusera":"fute","futuseram":"fute","futuserati":"fute","futusesi":"fute","futusi":"fute","futut":"fute","fututa":["futută","futut","fututa","futut"],"futute":"futut","fututele":"futut","fututi":"futut","fututii":"futut","fututul":"futut","fuzanta":["fuzantă","fuzant","fuzanta","fuzant"],"fuzante":"fuzant","fuzantele":"fuzant","fuzanti":"fuzant","fuzantii":"fuzant","fuzantul":"fuzant","fuzarioze":"fuzarioză","fuzariozei":"fuzarioză","fuzariozele":"fuzarioză","fuzariozelor":"fuzarioză","fuzeea":"fuzee","fuzeei":"fuzee","fuzeele":"fuzee","fuzeelor":"fuzee","fuzelaje":"fuzelaj","fuzelajele":"fuzelaj","fuzelajelor":"fuzelaj","fuzelajul":"fuzelaj","fuzelajule":"fuzelaj","fuzelajului":"fuzelaj","fuzibila":["fuzibilă","fuzibil","fuzibila","fuzibil"],"fuzibile":"fuzibil","fuzibilele":"fuzibil","fuzibili":"fuzibil","fuzibilii":"fuzibil","fuzibilitatea":"fuzibilitate","fuzibilitati":"fuzibilitate","fuzibilitatii":"fuzibilitate","fuzibilitatile":"fuzibilitate","fuzibilitatilor":"fuzibilitate","fuzibilul":"fuzibil","fuziforma":["fuziformă","fuziform","fuziforma","fuziform"],"fuziforme":"fuziform","fuziformele":"fuziform","fuziformi":"fuziform","fuziformii":"fuziform","fuziformul":"fuziform","fuzionai":"fuziona","fuzionam":["fuzionăm","fuziona","fuzionam","fuziona"],"fuzionand":"fuziona","fuzionara":"fuziona","fuzionaram":"fuziona","fuzionarati":"fuziona","fuzionarea":"fuzionare","fuzionari":"fuzionare","fuzionarii":"fuzionare","fuzionarile":"fuzionare","fuzionarilor":"fuzionare","fuzionase":"fuziona","fuzionasem":"fuziona","fuzionasera":"fuziona","fuzionaseram":"fuziona","fuzionaserati":"fuziona","fuzionasesi":"fuziona","fuzionasi":"fuziona","fuzionat":"fuziona","fuzionata":["fuzionată","fuzionat","fuzionata","fuzionat"],"fuzionate":"fuzionat","fuzionatele":"fuzionat","fuzionati":["fuzionați","fuziona","fuzionați","fuzionat"],"fuzionatii":"fuzionat","fuzionatul":"fuzionat","fuzionau":"fuziona","fuzioneaza":"fuziona","fuzionez":"fuziona","fuzionezi":"fuziona","fuzioniste":"fuzionistă","fuzionistei":"fuzionistă","fuzionistele":"fuzionistă","fuzionistelor":"fuzionistă","fuzionisti":"fuzionist","fuzionistii":"fuzionist","fuzionistilor":"fuzionist","fuzionistul":"fuzionist","fuzionistule":"fuzionist","fuzionistului":"fuzionist","fuziuni":"fuziune","fuziuni nucleare":"fuziune nucleară"};
@@ -0,0 +1 @@
+export default {"gaba":["gâbă","gâb","gâba","gâb"],"gabanase":"găbănaș","gabanasele":"găbănaș","gabanaselor":"găbănaș","gabanasul":"găbănaș","gabanasule":"găbănaș","gabanasului":"găbănaș","gabardine":"gabardină","gabardinei":"gabardină","gabardinele":"gabardină","gabardinelor":"gabardină","gabare":"gabară","gabarei":"gabară","gabarele":"gabară","gabarelor":"gabară","gabarite":"gabarit","gabaritele":"gabarit","gabaritelor":"gabarit","gabaritul":"gabarit","gabaritule":"gabarit","gabaritului":"gabarit","gabe":"gâb","gabele":["gâbele","gâb","gabele","gabelă"],"gabelei":"gabelă","gabi":"gâb","gabii":"gâb","gabioane":"gabion","gabioanele":"gabion","gabioanelor":"gabion","gabionade":"gabionadă","gabionadei":"gabionadă","gabionadele":"gabionadă","gabionadelor":"gabionadă","gabionul":"gabion","gabionule":"gabion","gabionului":"gabion","gabje":"gabjă","gabjei":"gabjă","gabjele":"gabjă","gabjelor":"gabjă","gaboneza":["gaboneză","gabonez","gaboneza","gabonez"],"gaboneze":["gaboneze","gabonez","gaboneze","gaboneză"],"gabonezei":"gaboneză","gabonezele":["gabonezele","gabonez","gabonezele","gaboneză"],"gabonezelor":"gaboneză","gabonezi":"gabonez","gabonezii":"gabonez","gabonezilor":"gabonez","gabonezul":"gabonez","gabonezule":"gabonez","gabonezului":"gabonez","gabori":"gabor","gaborii":"gabor","gaborilor":"gabor","gaborul":"gabor","gaborule":"gabor","gaborului":"gabor","gabriolete":"gabrioletă","gabrioletei":"gabrioletă","gabrioletele":"gabrioletă","gabrioletelor":"gabrioletă","gabroul":"gabro","gabroule":"gabro","gabroului":"gabro","gabrouri":["gabrouri","gabro","gabrouri","gabrou"],"gabrourile":["gabrourile","gabro","gabrourile","gabrou"],"gabrourilor":["gabrourilor","gabro","gabrourilor","gabrou"],"gabrouul":"gabrou","gabrouule":"gabrou","gabrouului":"gabrou","gabroveanul":"gabrovean","gabroveanule":"gabrovean","gabroveanului":"gabrovean","gabroveni":"gabrovean","gabrovenii":"gabrovean","gabrovenilor":"gabrovean","gabul":"gâb","gacea":"gâci","gaceai":"gâci","gaceam":"gâci","gaceati":"gâci","gaceau":"gâci","gacesc":"gâci","gaceste":"gâci","gacesti":"gâci","gacii":"gâci","gacim":"gâci","gacind":"gâci","gacinii":"gacini","gacinilor":"gacini","gacira":"gâci","gaciram":"gâci","gacirati":"gâci","gacise":"gâci","gacisem":"gâci","gacisera":"gâci","gaciseram":"gâci","gaciserati":"gâci","gacisesi":"gâci","gacisi":"gâci","gacit":"gâci","gaciti":"gâci","gadasi":"gădaș","gadasii":"gădaș","gadasilor":"gădaș","gadasul":"gădaș","gadasule":"gădaș","gadasului":"gădaș","gadel":"gâdeli","gadela":"gâdeli","gadele":"gâdeli","gadelea":"gâdeli","gadeleai":"gâdeli","gadeleam":"gâdeli","gadeleati":"gâdeli","gadeleau":"gâdeli","gadelii":"gâdeli","gadelim":"gâdeli","gadelind":"gâdeli","gadelira":"gâdeli","gadeliram":"gâdeli","gadelirati":"gâdeli","gadelise":"gâdeli","gadelisem":"gâdeli","gadelisera":"gâdeli","gadeliseram":"gâdeli","gadeliserati":"gâdeli","gadelisesi":"gâdeli","gadelisi":"gâdeli","gadelit":"gâdeli","gadeliti":"gâdeli","gadeul":"gâde","gadeule":"gâde","gadeului":"gâde","gadgetul":"gadget","gadgetule":"gadget","gadgetului":"gadget","gadgeturi":"gadget","gadgeturile":"gadget","gadgeturilor":"gadget","gadil":["gâdil","gâdila","gâdil","gâdili"],"gadilai":"gâdila","gadilam":["gâdilăm","gâdila","gâdilam","gâdila"],"gadiland":"gâdila","gadilara":"gâdila","gadilaram":"gâdila","gadilarati":"gâdila","gadilarea":"gâdilare","gadilari":"gâdilare","gadilarii":"gâdilare","gadilarile":"gâdilare","gadilarilor":"gâdilare","gadilase":"gâdila","gadilasem":"gâdila","gadilasera":"gâdila","gadilaseram":"gâdila","gadilaserati":"gâdila","gadilasesi":"gâdila","gadilasi":"gâdila","gadilat":"gâdila","gadilati":"gâdila","gadilatoare":"gâdilător","gadilatoarea":"gâdilător","gadilatoarele":"gâdilător","gadilatori":"gâdilător","gadilatorii":"gâdilător","gadilatorul":"gâdilător","gadilatul":"gâdilat","gadilatule":"gâdilat","gadilatului":"gâdilat","gadilaturi":"gâdilătură","gadilaturii":"gâdilătură","gadilaturile":"gâdilătură","gadilaturilor":"gâdilătură","gadilau":"gâdila","gadile":["gâdile","gâdila","gâdile","gâdili"],"gadilea":"gâdili","gadileai":"gâdili","gadileam":"gâdili","gadileati":"gâdili","gadileau":"gâdili","gadilele":"gâdileală","gadilelei":"gâdileală","gadilelele":"gâdileală","gadilelelor":"gâdileală","gadileli":"gâdileală","gadili":"gâdila","gadilicioasa":["gâdilicioasă","gâdilicios","gâdilicioasa","gâdilicios"],"gadilicioase":"gâdilicios","gadilicioasele":"gâdilicios","gadiliciosi":"gâdilicios","gadiliciosii":"gâdilicios","gadiliciosul":"gâdilicios","gadiliciul":"gâdilici","gadiliciule":"gâdilici","gadiliciului":"gâdilici","gadilii":"gâdili","gadilim":"gâdili","gadilind":"gâdili","gadilira":"gâdili","gadiliram":"gâdili","gadilirati":"gâdili","gadilise":"gâdili","gadilisem":"gâdili","gadilisera":"gâdili","gadiliseram":"gâdili","gadiliserati":"gâdili","gadilisesi":"gâdili","gadilisi":"gâdili","gadilit":"gâdili","gadiliti":"gâdili","gadilitoare":"gâdilitor","gadilitoarea":"gâdilitor","gadilitoarele":"gâdilitor","gadilitori":"gâdilitor","gadilitorii":"gâdilitor","gadilitorul":"gâdilitor","gadilituri":"gâdilitură","gadolinite":"gadolinit","gadolinitele":"gadolinit","gadolinitelor":"gadolinit","gadolinitul":"gadolinit","gadolinitule":"gadolinit","gadolinitului":"gadolinit","gadoliniul":"gadoliniu","gadoliniule":"gadoliniu","gadoliniului":"gadoliniu","gaeli":"gael","gaelice":"gaelică","gaelicei":"gaelică","gaelul":"gael","gaelule":"gael","gaelului":"gael","gafai":"gafa","gafaie":"gâfâi","gafaieli":"gâfâială","gafaielii":"gâfâială","gafaielile":"gâfâială","gafaielilor":"gâfâială","gafairea":"gâfâire","gafairi":"gâfâire","gafairii":"gâfâire","gafairile":"gâfâire","gafairilor":"gâfâire","gafait":"gâfâi","gafaitoare":"gâfâitor","gafaitoarea":"gâfâitor","gafaitoarele":"gâfâitor","gafaitori":"gâfâitor","gafaitorii":"gâfâitor","gafaitorul":"gâfâitor","gafaitul":"gâfâit","gafaitule":"gâfâit","gafaitului":"gâfâit","gafam":["gafăm","gafa","gafam","gafa"],"gafand":"gafa","gafara":"gafa","gafaram":"gafa","gafarati":"gafa","gafase":"gafa","gafasem":"gafa","gafasera":"gafa","gafaseram":"gafa","gafaserati":"gafa","gafasesi":"gafa","gafasi":"gafa","gafat":"gafa","gafati":"gafa","gafau":"gafa","gafe":"gafă","gafeaza":"gafa","gafei":"gafă","gafele":"gafă","gafelor":"gafă","gafeuri":"gafeur","gafeurii":"gafeur","gafeurilor":"gafeur","gafeurul":"gafeur","gafeurule":"gafeur","gafeurului":"gafeur","gafeuze":"gafeuză","gafeuzei":"gafeuză","gafeuzele":"gafeuză","gafeuzelor":"gafeuză","gafez":"gafa","gafezi":"gafa","gafiste":"gafistă","gafistei":"gafistă","gafistele":"gafistă","gafistelor":"gafistă","gafuia":"gâfui","gafuiai":"gâfui","gafuiam":"gâfui","gafuiati":"gâfui","gafuiau":"gâfui","gafuiesc":"gâfui","gafuieste":"gâfui","gafuiesti":"gâfui","gafuii":"gâfui","gafuim":"gâfui","gafuind":"gâfui","gafuira":"gâfui","gafuiram":"gâfui","gafuirati":"gâfui","gafuise":"gâfui","gafuisem":"gâfui","gafuisera":"gâfui","gafuiseram":"gâfui","gafuiserati":"gâfui","gafuisesi":"gâfui","gafuisi":"gâfui","gafuit":"gâfui","gafuiti":"gâfui","gagaia":"gâgâi","gagaiai":"gâgâi","gagaiam":"gâgâi","gagaiati":"gâgâi","gagaiau":"gâgâi","gagaie":"gâgâi","gagaii":"gâgâi","gagaim":"gâgâi","gagaind":"gâgâi","gagaira":"gâgâi","gagairam":"gâgâi","gagairati":"gâgâi","gagairea":"gâgâire","gagairi":"gâgâire","gagairii":"gâgâire","gagairile":"gâgâire","gagairilor":"gâgâire","gagaise":"gâgâi","gagaisem":"gâgâi","gagaisera":"gâgâi","gagaiseram":"gâgâi","gagaiserati":"gâgâi","gagaisesi":"gâgâi","gagaisi":"gâgâi","gagait":"gâgâi","gagaiti":"gâgâi","gagaiture":"gâgâitură","gagaiturei":"gâgâitură","gagaiturele":"gâgâitură","gagaiturelor":"gâgâitură","gagaituri":"gâgâitură","gagalicea":"gâgâlice","gagalici":"gâgâlice","gagalicii":"gâgâlice","gagalicile":"gâgâlice","gagalicilor":"gâgâlice","gagatul":"gagat","gagatule":"gagat","gagatului":"gagat","gagaturi":"gagat","gagaturile":"gagat","gagaturilor":"gagat","gagautaul":"găgăuță","gagautaule":"găgăuță","gagautaului":"găgăuță","gagauti":["găgăuți","găgăuț","găgăuți","găgăuță"],"gagautii":["găgăuții","găgăuț","găgăuții","găgăuță"],"gagautilor":["găgăuților","găgăuț","găgăuților","găgăuță"],"gagautul":"găgăuț","gagautule":"găgăuț","gagautului":"găgăuț","gagauza":["găgăuză","găgăuz","găgăuza","găgăuz"],"gagauze":["găgăuze","găgăuz","găgăuze","găgăuză"],"gagauzei":"găgăuză","gagauzele":["găgăuzele","găgăuz","găgăuzele","găgăuză"],"gagauzelor":"găgăuză","gagauzi":"găgăuz","gagauzii":"găgăuz","gagauzilor":"găgăuz","gagauzul":"găgăuz","gagauzule":"găgăuz","gagauzului":"găgăuz","gagicarele":"gagicăreală","gagicarelei":"gagicăreală","gagicarelele":"gagicăreală","gagicarelelor":"gagicăreală","gagicareli":"gagicăreală","gagicari":"gagicar","gagicarii":"gagicar","gagicarilor":"gagicar","gagicarul":"gagicar","gagicarule":"gagicar","gagicarului":"gagicar","gagice":"gagică","gagicei":"gagică","gagicele":"gagică","gagicelor":"gagică","gagici":["gagici","gagic","gagici","gagică"],"gagicii":"gagic","gagicilor":"gagic","gagicul":"gagic","gagicule":"gagic","gagicului":"gagic","gagicute":"gagicuță","gagicutei":"gagicuță","gagicutele":"gagicuță","gagicutelor":"gagicuță","gagii":"gagiu","gagiii":"gagiu","gagiilor":"gagiu","gagiste":"gagistă","gagistei":"gagistă","gagistele":"gagistă","gagistelor":"gagistă","gagiul":"gagiu","gagiule":"gagiu","gagiului":"gagiu","gagliarde":"gagliardă","gagliardei":"gagliardă","gagliardele":"gagliardă","gagliardelor":"gagliardă","gagul":"gag","gagule":"gag","gagului":"gag","gaguri":"gag","gagurile":"gag","gagurilor":"gag","gai":"gaie","gai negre":"gaie neagră","gai rosii":"gaie roșie","gaia":"gaie","gaiaci":"gaiac","gaiacii":"gaiac","gaiacilor":"gaiac","gaiacolul":"gaiacol","gaiacolule":"gaiacol","gaiacolului":"gaiacol","gaiacul":"gaiac","gaiacule":"gaiac","gaiacului":"gaiac","gaicute":"găicuță","gaicutei":"găicuță","gaicutele":"găicuță","gaicutelor":"găicuță","gaide":"gaidă","gaidei":"gaidă","gaidele":"gaidă","gaidelor":"gaidă","gaietanata":["găietănată","găietănat","găietănata","găietănat"],"gaietanate":"găietănat","gaietanatele":"găietănat","gaietanati":"găietănat","gaietanatii":"găietănat","gaietanatul":"găietănat","gaietane":"găietan","gaietanele":"găietan","gaietanelor":"găietan","gaietanul":"găietan","gaietanule":"găietan","gaietanului":"găietan","gaigane":"găigană","gaiganei":"găigană","gaii":"gaie","gailardii":"gailardia","gaile":"gaie","gailor":"gaie","gain":"găina","gainai":"găina","gainam":["găinăm","găina","găinam","găina"],"gainand":"găina","gainara":"găina","gainaram":"găina","gainarati":"găina","gainarese":"găinăreasă","gainaresei":"găinăreasă","gainaresele":"găinăreasă","gainareselor":"găinăreasă","gainari":"găinar","gainaria":"găinărie","gainariei":"găinărie","gainarii":["găinarii","găinar","găinării","găinărie"],"gainariile":"găinărie","gainariilor":"găinărie","gainarilor":"găinar","gainaristea":"găinăriște","gainaristi":"găinăriște","gainaristii":"găinăriște","gainaristile":"găinăriște","gainaristilor":"găinăriște","gainarite":"găinăriță","gainaritei":"găinăriță","gainaritele":"găinăriță","gainaritelor":"găinăriță","gainarul":"găinar","gainarule":"găinar","gainarului":"găinar","gainase":"găina","gainasem":"găina","gainasera":"găina","gainaseram":"găina","gainaserati":"găina","gainasesi":"găina","gainasi":"găina","gainat":["găinat","găina","găinăț","găinăța"],"gainatai":"găinăța","gainatam":["găinățăm","găinăța","găinățam","găinăța"],"gainatand":"găinăța","gainatara":"găinăța","gainataram":"găinăța","gainatarati":"găinăța","gainatase":"găinăța","gainatasem":"găinăța","gainatasera":"găinăța","gainataseram":"găinăța","gainataserati":"găinăța","gainatasesi":"găinăța","gainatasi":"găinăța","gainatat":"găinăța","gainatata":["găinățată","găinățat","găinățata","găinățat"],"gainatate":"găinățat","gainatatele":"găinățat","gainatati":["găinățați","găinăța","găinățați","găinățat"],"gainatatii":"găinățat","gainatatul":"găinățat","gainatau":"găinăța","gainati":["găinați","găina","găinați","găinaț","găinăți","găinăța"],"gainatica":["găinatică","găinatic","găinatica","găinatic"],"gainatice":"găinatic","gainaticele":"găinatic","gainatici":"găinatic","gainaticii":"găinatic","gainaticul":"găinatic","gainau":"găina","gainea":"găini","gaineai":"găini","gaineam":"găini","gaineati":"găini","gaineau":"găini","gainesc":"găini","gaineste":"găini","gainesti":"găini","gaini":["găini","găina","găini","găină"],"gainii":["găinii","găină","găinii","găini"],"gainile":"găină","gainilor":"găină","gainim":"găini","gainind":"găini","gainira":"găini","gainiram":"găini","gainirati":"găini","gainise":"găini","gainisem":"găini","gainisera":"găini","gainiseram":"găini","gainiserati":"găini","gainisesi":"găini","gainisi":"găini","gainit":["găinit","găini","găiniț","găinița"],"gainitai":"găinița","gainitam":["găinițăm","găinița","găinițam","găinița"],"gainitand":"găinița","gainitara":"găinița","gainitaram":"găinița","gainitarati":"găinița","gainitase":"găinița","gainitasem":"găinița","gainitasera":"găinița","gainitaseram":"găinița","gainitaserati":"găinița","gainitasesi":"găinița","gainitasi":"găinița","gainitat":"găinița","gainitati":"găinița","gainitau":"găinița","gainite":"găiniță","gainiteaza":"găinița","gainitei":"găiniță","gainitele":"găiniță","gainitelor":"găiniță","gainiti":["găiniți","găini","găiniți","găinița"],"gainuse":"găinușă","gainuse de balta":"găinușă de baltă","gainusei":"găinușă","gainusele":"găinușă","gainuselor":"găinușă","gainuste":"găinușcă","gainustei":"găinușcă","gainustele":"găinușcă","gainustelor":"găinușcă","gainute":"găinuță","gainutei":"găinuță","gainutele":"găinuță","gainutelor":"găinuță","gaioare":"găioară","gaioarei":"găioară","gaioarele":"găioară","gaioarelor":"găioară","gaisoare":"găișoară","gaisoarei":"găișoară","gaisoarele":"găișoară","gaisoarelor":"găișoară","gaitanari":"găitănar","gaitanaria":"găitănărie","gaitanariei":"găitănărie","gaitanarii":["găitănarii","găitănar","găitănării","găitănărie"],"gaitanariile":"găitănărie","gaitanariilor":"găitănărie","gaitanarilor":"găitănar","gaitanarul":"găitănar","gaitanarule":"găitănar","gaitanarului":"găitănar","gaitanase":"găitănaș","gaitanasele":"găitănaș","gaitanaselor":"găitănaș","gaitanasul":"găitănaș","gaitanasule":"găitănaș","gaitanasului":"găitănaș","gaitane":"găitan","gaitanea":"găităni","gaitaneai":"găităni","gaitaneam":"găităni","gaitaneati":"găităni","gaitaneau":"găităni","gaitanele":"găitan","gaitanelor":"găitan","gaitanesc":"găităni","gaitaneste":"găităni","gaitanesti":"găităni","gaitanii":"găităni","gaitanim":"găităni","gaitanind":"găităni","gaitanira":"găităni","gaitaniram":"găităni","gaitanirati":"găităni","gaitanise":"găităni","gaitanisem":"găităni","gaitanisera":"găităni","gaitaniseram":"găităni","gaitaniserati":"găităni","gaitanisesi":"găităni","gaitanisi":"găităni","gaitanit":"găităni","gaitaniti":"găităni","gaitanul":"găitan","gaitanule":"găitan","gaitanului":"găitan","gaite":"gaiță","gaite de munte":"gaiță de munte","gaitei":"gaiță","gaitele":"gaiță","gaitelor":"gaiță","gaitisoare":"găițișoară","gaitisoarei":"găițișoară","gaitisoarele":"găițișoară","gaitisoarelor":"găițișoară","gajul":"gaj","gajule":"gaj","gajului":"gaj","gajuri":"gaj","gajurile":"gaj","gajurilor":"gaj","galactica":["galactică","galactic","galactica","galactic"],"galactice":"galactic","galacticele":"galactic","galactici":"galactic","galacticii":"galactic","galacticul":"galactic","galactocele":"galactocel","galactocelele":"galactocel","galactocelelor":"galactocel","galactocelul":"galactocel","galactocelule":"galactocel","galactocelului":"galactocel","galactofaga":["galactofagă","galactofag","galactofaga","galactofag"],"galactofage":"galactofag","galactofagele":"galactofag","galactofagi":"galactofag","galactofagii":"galactofag","galactofagul":"galactofag","galactofora":["galactoforă","galactofor","galactofora","galactofor"],"galactofore":"galactofor","galactoforele":"galactofor","galactofori":"galactofor","galactoforii":"galactofor","galactoforite":"galactoforită","galactoforitei":"galactoforită","galactoforitele":"galactoforită","galactoforitelor":"galactoforită","galactoforul":"galactofor","galactogeneze":"galactogeneză","galactogenezei":"galactogeneză","galactogenezele":"galactogeneză","galactogenezelor":"galactogeneză","galactogeni":"galactogen","galactogenile":"galactogen","galactogenilor":"galactogen","galactogenul":"galactogen","galactogenule":"galactogen","galactogenului":"galactogen","galactogoge":"galactogog","galactogogele":"galactogog","galactogogelor":"galactogog","galactogogul":"galactogog","galactogogule":"galactogog","galactogogului":"galactogog","galactografia":"galactografie","galactografiei":"galactografie","galactografii":"galactografie","galactografiile":"galactografie","galactografiilor":"galactografie","galactometre":"galactometru","galactometrele":"galactometru","galactometrelor":"galactometru","galactometrul":"galactometru","galactometrule":"galactometru","galactometrului":"galactometru","galactopoieze":"galactopoieză","galactopoiezei":"galactopoieză","galactopoiezele":"galactopoieză","galactopoiezelor":"galactopoieză","galactoreea":"galactoree","galactoreei":"galactoree","galactoreele":"galactoree","galactoreelor":"galactoree","galactoze":"galactoză","galactozei":"galactoză","galactozele":"galactoză","galactozelor":"galactoză","galactozemia":"galactozemie","galactozemiei":"galactozemie","galactozemii":"galactozemie","galactozemiile":"galactozemie","galactozemiilor":"galactozemie","galagea":"gălăgi","galageai":"gălăgi","galageam":"gălăgi","galageati":"gălăgi","galageau":"gălăgi","galagesc":"gălăgi","galageste":"gălăgi","galagesti":"gălăgi","galagia":"gălăgie","galagiei":"gălăgie","galagii":["gălăgii","gălăgi","gălăgii","gălăgie"],"galagim":"gălăgi","galagind":"gălăgi","galagioasa":["gălăgioasă","gălăgios","gălăgioasa","gălăgios"],"galagioase":"gălăgios","galagioasele":"gălăgios","galagiosi":"gălăgios","galagiosii":"gălăgios","galagiosul":"gălăgios","galagira":"gălăgi","galagiram":"gălăgi","galagirati":"gălăgi","galagise":"gălăgi","galagisem":"gălăgi","galagisera":"gălăgi","galagiseram":"gălăgi","galagiserati":"gălăgi","galagisesi":"gălăgi","galagisi":"gălăgi","galagit":"gălăgi","galagiti":"gălăgi","galalitul":"galalit","galalitule":"galalit","galalitului":"galalit","galamoaze":"gălămoz","galamoazele":"gălămoz","galamoazelor":"gălămoz","galamozul":"gălămoz","galamozule":"gălămoz","galamozului":"gălămoz","galanta":["galantă","galant","galanta","galant"],"galantare":"galantar","galantarele":"galantar","galantarelor":"galantar","galantarul":"galantar","galantarule":"galantar","galantarului":"galantar","galante":"galant","galantele":"galant","galanteria":"galanterie","galanteriei":"galanterie","galanterii":"galanterie","galanteriile":"galanterie","galanteriilor":"galanterie","galanti":"galant","galantii":"galant","galantine":"galantină","galantinei":"galantină","galantinele":"galantină","galantinelor":"galantină","galantoma":["galantomă","galantom","galantoma","galantom"],"galantome":"galantom","galantomele":"galantom","galantomi":"galantom","galantomia":"galantomie","galantomiei":"galantomie","galantomii":["galantomii","galantom","galantomii","galantomie"],"galantomul":"galantom","galantona":["galantonă","galanton","galantona","galanton"],"galantone":"galanton","galantonele":"galanton","galantoni":"galanton","galantonia":"galantonie","galantoniei":"galantonie","galantonii":["galantonii","galanton","galantonii","galantonie"],"galantonul":"galanton","galantul":"galant","galateanul":"gălățean","galateanule":"gălățean","galateanului":"gălățean","galatence":"gălățeancă","galatencei":"gălățeancă","galatencele":"gălățeancă","galatencelor":"gălățeancă","galatene":"gălățeană","galatenei":"gălățeană","galatenele":"gălățeană","galatenelor":"gălățeană","galateni":"gălățean","galatenii":"gălățean","galatenilor":"gălățean","galaxia":"galaxie","galaxiei":"galaxie","galaxii":"galaxie","galaxii sferoidale pitice":"galaxie sferoidală pitică","galaxiile":"galaxie","galaxiilor":"galaxie","galbana":["galbână","galbân","galbâna","galbân","galbănă","galbăn","galbăna","galbăn"],"galbanarite":"gălbănariță","galbanaritei":"gălbănariță","galbanaritele":"gălbănariță","galbanaritelor":"gălbănariță","galbane":["galbâne","galbân","galbăne","galbăn"],"galbanele":["galbânele","galbân","galbănele","galbăn"],"galbani":["galbâni","galbân","galbăni","galbăn"],"galbanii":["galbânii","galbân","galbănii","galbăn"],"galbanul":["galbanul","galban","galbânul","galbân","galbănul","galbăn"],"galbanule":"galban","galbanului":"galban","galbe":"galbă","galbei":"galbă","galbejea":"gălbeji","galbejeai":"gălbeji","galbejeam":"gălbeji","galbejeati":"gălbeji","galbejeau":"gălbeji","galbejeli":"gălbejeală","galbejelii":"gălbejeală","galbejelile":"gălbejeală","galbejelilor":"gălbejeală","galbejesc":"gălbeji","galbejeste":"gălbeji","galbejesti":"gălbeji","galbejii":"gălbeji","galbejim":"gălbeji","galbejind":"gălbeji","galbejira":"gălbeji","galbejiram":"gălbeji","galbejirati":"gălbeji","galbejise":"gălbeji","galbejisem":"gălbeji","galbejisera":"gălbeji","galbejiseram":"gălbeji","galbejiserati":"gălbeji","galbejisesi":"gălbeji","galbejisi":"gălbeji","galbejit":"gălbeji","galbejita":["gălbejită","gălbejit","gălbejita","gălbejit"],"galbejite":"gălbejit","galbejitele":"gălbejit","galbejiti":["gălbejiți","gălbeji","gălbejiți","gălbejit"],"galbejitii":"gălbejit","galbejitilor":"gălbejit","galbejitul":"gălbejit","galbejitule":"gălbejit","galbejitului":"gălbejit","galbejoara":["gălbejoară","gălbejor","gălbejoara","gălbejor"],"galbejoare":"gălbejor","galbejoarele":"gălbejor","galbejori":"gălbejor","galbejorii":"gălbejor","galbejorul":"gălbejor","galbele":["galbele","galbă","gălbele","gălbenică"],"galbelei":"gălbenică","galbelele":"gălbenică","galbelelor":"gălbenică","galbelor":"galbă","galbena":["galbenă","galben","galbena","galben"],"galbenare":"gălbinare","galbenari":"gălbenare","galbenasi":"gălbenaș","galbenasii":"gălbenaș","galbenasilor":"gălbenaș","galbenasul":"gălbenaș","galbenasule":"gălbenaș","galbenasului":"gălbenaș","galbenateca":["gălbenatecă","gălbenatec","gălbenateca","gălbenatec"],"galbenatece":"gălbenatec","galbenatecele":"gălbenatec","galbenateci":"gălbenatec","galbenatecii":"gălbenatec","galbenatecul":"gălbenatec","galbenatica":["gălbenatică","gălbenatic","gălbenatica","gălbenatic"],"galbenatice":"gălbenatic","galbenaticele":"gălbenatic","galbenatici":"gălbenatic","galbenaticii":"gălbenatic","galbenaticul":"gălbenatic","galbene":"galben","galbenea":"gălbeni","galbeneai":"gălbeni","galbeneam":"gălbeni","galbeneata":["gălbeneață","gălbeneț","gălbeneața","gălbeneț"],"galbeneati":"gălbeni","galbeneau":"gălbeni","galbeneaua":"gălbenea","galbenele":["galbenele","galben","gălbenele","gălbenea"],"galbenelei":"gălbenea","galbenelele":"gălbenea","galbenelelor":"gălbenea","galbeneli":["gălbeneli","gălbeneală","gălbeneli","gălbenel"],"galbenelii":["gălbenelii","gălbeneală","gălbenelii","gălbenel"],"galbenelile":"gălbeneală","galbenelilor":["gălbenelilor","gălbeneală","gălbenelilor","gălbenel"],"galbenelul":"gălbenel","galbenelule":"gălbenel","galbenelului":"gălbenel","galbenesc":"gălbeni","galbeneste":"gălbeni","galbenesti":"gălbeni","galbenete":"gălbeneț","galbenetele":"gălbeneț","galbeneti":"gălbeneț","galbenetii":"gălbeneț","galbenetul":["gălbenetul","gălbenet","gălbenețul","gălbeneț"],"galbenetule":"gălbenet","galbenetului":"gălbenet","galbeneturi":"gălbenet","galbeneturile":"gălbenet","galbeneturilor":"gălbenet","galbeni":"galben","galbenia":"gălbeniu","galbenie":"gălbeniu","galbenii":["galbenii","galben","gălbenii","gălbeni","gălbenii","gălbeniu"],"galbeniii":"gălbeniu","galbeniile":"gălbeniu","galbenilor":"galben","galbenim":"gălbeni","galbenind":"gălbeni","galbenira":"gălbeni","galbeniram":"gălbeni","galbenirati":"gălbeni","galbenirea":"gălbenire","galbeniri":"gălbenire","galbenirii":"gălbenire","galbenirile":"gălbenire","galbenirilor":"gălbenire","galbenise":"gălbeni","galbenisem":"gălbeni","galbenisera":"gălbeni","galbeniseram":"gălbeni","galbeniserati":"gălbeni","galbenisesi":"gălbeni","galbenisi":"gălbeni","galbenit":"gălbeni","galbenita":["gălbenită","gălbenit","gălbenita","gălbenit"],"galbenite":"gălbenit","galbenitele":"gălbenit","galbeniti":["gălbeniți","gălbeni","gălbeniți","gălbenit"],"galbenitii":"gălbenit","galbenitul":"gălbenit","galbeniul":"gălbeniu","galbenul":"galben","galbenule":"galben","galbenului":"galben","galbenuse":"gălbenușă","galbenusei":"gălbenușă","galbenusele":"gălbenușă","galbenuselor":"gălbenușă","galbenusul":"gălbenuș","galbenusule":"gălbenuș","galbenusului":"gălbenuș","galbenusuri":"gălbenuș","galbenusurile":"gălbenuș","galbenusurilor":"gălbenuș","galbete":"gălbeață","galbetei":"gălbeață","galbetele":"gălbeață","galbetelor":"gălbeață","galbeze":"gălbează","galbezei":"gălbează","galbezele":"gălbează","galbezelor":"gălbează","galbia":"gălbiu","galbicioasa":["gălbicioasă","gălbicios","gălbicioasa","gălbicios"],"galbicioase":"gălbicios","galbicioasele":"gălbicios","galbiciosi":"gălbicios","galbiciosii":"gălbicios","galbiciosul":"gălbicios","galbiciunea":"gălbiciune","galbiciuni":"gălbiciune","galbiciunii":"gălbiciune","galbiciunile":"gălbiciune","galbiciunilor":"gălbiciune","galbie":"gălbiu","galbii":"gălbiu","galbiii":"gălbiu","galbiile":"gălbiu","galbin":"galben","galbina":["galbină","galbin","galbina","galbin"],"galbinarea":"gălbinare","galbinari":"gălbinare","galbinarii":"gălbinare","galbinarile":"gălbinare","galbinarilor":"gălbinare","galbinasi":"gălbinaș","galbinasii":"gălbinaș","galbinasilor":"gălbinaș","galbinasul":"gălbinaș","galbinasule":"gălbinaș","galbinasului":"gălbinaș","galbine":"galbin","galbinea":"gălbini","galbineai":"gălbini","galbineam":"gălbini","galbineati":"gălbini","galbineau":"gălbini","galbinele":"galbin","galbinesc":"gălbini","galbineste":"gălbini","galbinesti":"gălbini","galbini":"galbin","galbinicioasa":["gălbinicioasă","gălbinicios","gălbinicioasa","gălbinicios"],"galbinicioase":"gălbinicios","galbinicioasele":"gălbinicios","galbiniciosi":"gălbinicios","galbiniciosii":"gălbinicios","galbiniciosul":"gălbinicios","galbinii":["galbinii","galbin","gălbinii","gălbini"],"galbinim":"gălbini","galbinind":"gălbini","galbinira":"gălbini","galbiniram":"gălbini","galbinirati":"gălbini","galbinise":"gălbini","galbinisem":"gălbini","galbinisera":"gălbini","galbiniseram":"gălbini","galbiniserati":"gălbini","galbinisesi":"gălbini","galbinisi":"gălbini","galbinit":"gălbini","galbinite":"gălbiniță","galbinitei":"gălbiniță","galbinitele":"gălbiniță","galbinitelor":"gălbiniță","galbiniti":"gălbini","galbinul":"galbin","galbiori":"gălbior","galbiorii":"gălbior","galbiorilor":"gălbior","galbiorul":"gălbior","galbiorule":"gălbior","galbiorului":"gălbior","galbiul":"gălbiu","galbuia":"gălbui","galbuie":"gălbui","galbuii":"gălbui","galbuile":"gălbui","galbuiul":"gălbui","galcaturi":"gâlcătură","galcaturii":"gâlcătură","galcaturile":"gâlcătură","galcaturilor":"gâlcătură","galcevea":"gâlcevi","galceveai":"gâlcevi","galceveam":"gâlcevi","galceveati":"gâlcevi","galceveau":"gâlcevi","galcevesc":"gâlcevi","galceveste":"gâlcevi","galcevesti":"gâlcevi","galcevi":"gâlceavă","galcevii":["gâlcevii","gâlceavă","gâlcevii","gâlcevi"],"galcevile":"gâlceavă","galcevilor":"gâlceavă","galcevim":"gâlcevi","galcevind":"gâlcevi","galcevira":"gâlcevi","galceviram":"gâlcevi","galcevirati":"gâlcevi","galcevirea":"gâlcevire","galceviri":"gâlcevire","galcevirii":"gâlcevire","galcevirile":"gâlcevire","galcevirilor":"gâlcevire","galcevise":"gâlcevi","galcevisem":"gâlcevi","galcevisera":"gâlcevi","galceviseram":"gâlcevi","galceviserati":"gâlcevi","galcevisesi":"gâlcevi","galcevisi":"gâlcevi","galcevit":"gâlcevi","galceviti":"gâlcevi","galcevitoarea":"gâlcevitoare","galcevitoarei":"gâlcevitoare","galcevitoarele":"gâlcevitoare","galcevitoarelor":"gâlcevitoare","galcevitori":"gâlcevitor","galcevitorii":"gâlcevitor","galcevitorilor":"gâlcevitor","galcevitorul":"gâlcevitor","galcevitorule":"gâlcevitor","galcevitorului":"gâlcevitor","galcevitul":"gâlcevit","galcevitule":"gâlcevit","galcevitului":"gâlcevit","galcevoasa":["gâlcevoasă","gâlcevos","gâlcevoasa","gâlcevos"],"galcevoase":"gâlcevos","galcevoasele":"gâlcevos","galcevosi":"gâlcevos","galcevosii":"gâlcevos","galcevosul":"gâlcevos","galci":"gâlcă","galcii":"gâlcă","galcile":"gâlcă","galcilor":"gâlcă","galculite":"gâlculiță","galculitei":"gâlculiță","galculitele":"gâlculiță","galculitelor":"gâlculiță","galcusoare":"gâlcușoară","galcusoarei":"gâlcușoară","galcusoarele":"gâlcușoară","galcusoarelor":"gâlcușoară","galcute":"gâlcuță","galcutei":"gâlcuță","galcutele":"gâlcuță","galcutelor":"gâlcuță","gale":"gală","galei":"gală","galele":"gală","galelor":"gală","galene":"galenă","galenei":"galenă","galenele":"galenă","galenelor":"galenă","galenica":["galenică","galenic","galenica","galenic"],"galenice":"galenic","galenicele":"galenic","galenici":"galenic","galenicii":"galenic","galenicul":"galenic","galenisme":"galenism","galenismele":"galenism","galenismelor":"galenism","galenismul":"galenism","galenismule":"galenism","galenismului":"galenism","galeopiteci":"galeopitec","galeopitecii":"galeopitec","galeopitecilor":"galeopitec","galeopitecul":"galeopitec","galeopitecule":"galeopitec","galeopitecului":"galeopitec","galere":"galeră","galerei":"galeră","galerele":"galeră","galerelor":"galeră","galeria":"galerie","galerianul":"galerian","galerianule":"galerian","galerianului":"galerian","galeriei":"galerie","galerieni":"galerian","galerienii":"galerian","galerienilor":"galerian","galerii":"galerie","galeriile":"galerie","galeriilor":"galerie","galesa":["galeșă","galeș","galeșa","galeș"],"galese":"galeș","galesele":"galeș","galesi":"galeș","galesii":"galeș","galesul":"galeș","galetare":"găletar","galetarei":"găletar","galetarelor":"găletar","galetarese":"găletăreasă","galetaresei":"găletăreasă","galetaresele":"găletăreasă","galetareselor":"găletăreasă","galetarul":"găletar","galetarule":"găletar","galetarului":"găletar","galete":"galetă","galetei":"galetă","galetele":"galetă","galetelor":"galetă","galeti":["găleți","găleată","galeți","galet"],"galetii":"găleată","galetile":"găleată","galetilor":"găleată","galetuse":"găletușă","galetusei":"găletușă","galetusele":"găletușă","galetuselor":"găletușă","galeze":"galeză","galezei":"galeză","galezele":"galeză","galezelor":"galeză","galfad":"galfed","galfada":["galfădă","galfăd","galfăda","galfăd"],"galfade":"galfăd","galfadele":"galfăd","galfadul":"galfăd","galfazi":"galfăd","galfazii":"galfăd","galfeda":["galfedă","galfed","galfeda","galfed"],"galfede":"galfed","galfedele":"galfed","galfedul":"galfed","galfezi":"galfed","galfezii":"galfed","galgaia":"gâlgâi","galgaiai":"gâlgâi","galgaiam":"gâlgâi","galgaiati":"gâlgâi","galgaiau":"gâlgâi","galgaie":"gâlgâi","galgaieli":"gâlgâială","galgaielii":"gâlgâială","galgaielile":"gâlgâială","galgaielilor":"gâlgâială","galgaii":"gâlgâi","galgaim":"gâlgâi","galgaind":"gâlgâi","galgaira":"gâlgâi","galgairam":"gâlgâi","galgairati":"gâlgâi","galgairea":"gâlgâire","galgairi":"gâlgâire","galgairii":"gâlgâire","galgairile":"gâlgâire","galgairilor":"gâlgâire","galgaise":"gâlgâi","galgaisem":"gâlgâi","galgaisera":"gâlgâi","galgaiseram":"gâlgâi","galgaiserati":"gâlgâi","galgaisesi":"gâlgâi","galgaisi":"gâlgâi","galgait":"gâlgâi","galgaiti":"gâlgâi","galgaitoare":"gâlgâitor","galgaitoarea":"gâlgâitor","galgaitoarele":"gâlgâitor","galgaitori":"gâlgâitor","galgaitorii":"gâlgâitor","galgaitorul":"gâlgâitor","galgaitul":"gâlgâit","galgaitule":"gâlgâit","galgaitului":"gâlgâit","galgaiture":"gâlgâitură","galgaiturei":"gâlgâitură","galgaiturele":"gâlgâitură","galgaiturelor":"gâlgâitură","galgaituri":"gâlgâitură","gali":"gal","galiarde":"galiardă","galiardei":"galiardă","galiardele":"galiardă","galiardelor":"galiardă","galiardul":"galiard","galiardule":"galiard","galiardului":"galiard","galica":["galică","galic","galica","galic"],"galicane":"galicană","galicanei":"galicană","galicanele":"galicană","galicanelor":"galicană","galicani":"galican","galicanii":"galican","galicanilor":"galican","galicanisme":"galicanism","galicanismele":"galicanism","galicanismelor":"galicanism","galicanismul":"galicanism","galicanismule":"galicanism","galicanismului":"galicanism","galicanul":"galican","galicanule":"galican","galicanului":"galican","galice":"galic","galicele":"galic","galici":"galic","galiciana":["galiciană","galician","galiciana","galician"],"galiciane":"galiciană","galicianul":"galician","galicianule":"galician","galicianului":"galician","galiciene":["galiciene","galician","galiciene","galiciană"],"galicienei":"galiciană","galicienele":["galicienele","galician","galicienele","galiciană"],"galicienelor":"galiciană","galicieni":"galician","galicienii":"galician","galicienilor":"galician","galicii":"galic","galicisme":"galicism","galicismele":"galicism","galicismelor":"galicism","galicismul":"galicism","galicismule":"galicism","galicismului":"galicism","galicul":"galic","galiforme":"galiformă","galiformei":"galiformă","galiformele":"galiformă","galiformelor":"galiformă","galigana":["găligană","găligan","găligana","găligan"],"galigane":"găligan","galiganele":"găligan","galigani":["gâligani","gâligan","găligani","găligan"],"galiganii":["gâliganii","gâligan","găliganii","găligan"],"galiganilor":["gâliganilor","gâligan","găliganilor","găligan"],"galiganul":["gâliganul","gâligan","găliganul","găligan"],"galiganule":["gâliganule","gâligan","găliganule","găligan"],"galiganului":["gâliganului","gâligan","găliganului","găligan"],"galileana":["galileană","galilean","galileana","galilean"],"galileanul":"galilean","galileanule":"galilean","galileanului":"galilean","galileeni":"galilean","galileenii":"galilean","galileenilor":"galilean","galilene":"galilean","galilenele":"galilean","galileni":"galilean","galilenii":"galilean","galimatia":"galimatie","galimatiasul":"galimatias","galimatiasule":"galimatias","galimatiasului":"galimatias","galimatiei":"galimatie","galimatii":"galimatie","galimatiile":"galimatie","galimatiilor":"galimatie","galinacee":"galinaceu","galinaceea":["galinaceea","galinacee","galinaceea","galinaceu"],"galinaceei":"galinacee","galinaceele":["galinaceele","galinacee","galinaceele","galinaceu"],"galinaceelor":"galinacee","galinacei":"galinaceu","galinaceii":"galinaceu","galinaceul":"galinaceu","galioane":"galion","galioanele":"galion","galioanelor":"galion","galiongii":"galiongiu","galiongiii":"galiongiu","galiongiilor":"galiongiu","galiongiuul":"galiongiu","galiongiuule":"galiongiu","galiongiuului":"galiongiu","galionul":"galion","galionule":"galion","galionului":"galion","galiote":"galiotă","galiotei":"galiotă","galiotele":"galiotă","galiotelor":"galiotă","galisa":["galișă","galiș","galișa","galiș"],"galise":"galiș","galisele":"galiș","galisi":"galiș","galisii":"galiș","galisul":"galiș","galitce":"galițcă","galitcei":"galițcă","galite":"galiță","galitei":"galiță","galitele":"galiță","galitelor":"galiță","galitianul":"galițian","galitianule":"galițian","galitianului":"galițian","galitiene":"galițiană","galitienei":"galițiană","galitienele":"galițiană","galitienelor":"galițiană","galitieni":"galițian","galitienii":"galițian","galitienilor":"galițian","galiul":"galiu","galiule":"galiu","galiului":"galiu","galme":"gâlmă","galmei":"gâlmă","galmele":"gâlmă","galmelor":"gâlmă","galoane":"galon","galoanele":"galon","galoanelor":"galon","galofila":["galofilă","galofil","galofila","galofil"],"galofile":"galofil","galofilele":"galofil","galofili":"galofil","galofilia":"galofilie","galofiliei":"galofilie","galofilii":["galofilii","galofil","galofilii","galofilie"],"galofiliile":"galofilie","galofiliilor":"galofilie","galofilul":"galofil","galofobe":"galofobă","galofobei":"galofobă","galofobele":"galofobă","galofobelor":"galofobă","galofobi":"galofob","galofobia":"galofobie","galofobiei":"galofobie","galofobii":["galofobii","galofob","galofobii","galofobie"],"galofobiile":"galofobie","galofobiilor":"galofobie","galofobilor":"galofob","galofobul":"galofob","galofobule":"galofob","galofobului":"galofob","galomana":["galomană","galoman","galomana","galoman"],"galomane":["galomane","galoman","galomane","galomană"],"galomanei":"galomană","galomanele":["galomanele","galoman","galomanele","galomană"],"galomanelor":"galomană","galomani":"galoman","galomania":"galomanie","galomaniei":"galomanie","galomanii":["galomanii","galoman","galomanii","galomanie"],"galomanilor":"galoman","galomanul":"galoman","galomanule":"galoman","galomanului":"galoman","galonata":["galonată","galonat","galonata","galonat"],"galonate":"galonat","galonatele":"galonat","galonati":"galonat","galonatii":"galonat","galonatul":"galonat","galonul":"galon","galonule":"galon","galonului":"galon","galopade":"galopadă","galopadei":"galopadă","galopadele":"galopadă","galopadelor":"galopadă","galopai":"galopa","galopam":["galopăm","galopa","galopam","galopa"],"galopand":"galopa","galopanta":["galopantă","galopant","galopanta","galopant"],"galopante":"galopant","galopantele":"galopant","galopanti":"galopant","galopantii":"galopant","galopantul":"galopant","galopara":"galopa","galoparam":"galopa","galoparati":"galopa","galoparea":"galopare","galopari":"galopare","galoparii":"galopare","galoparile":"galopare","galoparilor":"galopare","galopase":"galopa","galopasem":"galopa","galopasera":"galopa","galopaseram":"galopa","galopaserati":"galopa","galopasesi":"galopa","galopasi":"galopa","galopat":"galopa","galopati":"galopa","galopau":"galopa","galopeaza":"galopa","galopez":"galopa","galopezi":"galopa","galopul":"galop","galopule":"galop","galopului":"galop","galopuri":"galop","galopurile":"galop","galopurilor":"galop","galoromane":"galoromană","galoromanei":"galoromană","galoromanele":"galoromană","galoromanelor":"galoromană","galoromani":"galoroman","galoromanica":["galoromanică","galoromanic","galoromanica","galoromanic"],"galoromanice":"galoromanic","galoromanicele":"galoromanic","galoromanici":"galoromanic","galoromanicii":"galoromanic","galoromanicul":"galoromanic","galoromanii":"galoroman","galoromanilor":"galoroman","galoromanul":"galoroman","galoromanule":"galoroman","galoromanului":"galoroman","galosi":"galoș","galosii":"galoș","galosilor":"galoș","galosul":"galoș","galosule":"galoș","galosului":"galoș","galtul":"gâlt","galtule":"gâlt","galtului":"gâlt","galturi":"gâlt","galturile":"gâlt","galturilor":"gâlt","galuscute":"gălușcuță","galuscutei":"gălușcuță","galuscutele":"gălușcuță","galuscutelor":"gălușcuță","galuste":"gălușcă","galusteaua":"găluștea","galustei":"gălușcă","galustele":["găluștele","gălușcă","găluștele","găluștea"],"galustelei":"găluștea","galustelele":"găluștea","galustelelor":"găluștea","galustelor":"gălușcă","galvanica":["galvanică","galvanic","galvanica","galvanic"],"galvanice":"galvanic","galvanicele":"galvanic","galvanici":"galvanic","galvanicii":"galvanic","galvanicul":"galvanic","galvanismul":"galvanism","galvanismule":"galvanism","galvanismului":"galvanism","galvanizai":"galvaniza","galvanizam":["galvanizăm","galvaniza","galvanizam","galvaniza"],"galvanizand":"galvaniza","galvanizara":"galvaniza","galvanizaram":"galvaniza","galvanizarati":"galvaniza","galvanizarea":"galvanizare","galvanizari":"galvanizare","galvanizarii":"galvanizare","galvanizarile":"galvanizare","galvanizarilor":"galvanizare","galvanizase":"galvaniza","galvanizasem":"galvaniza","galvanizasera":"galvaniza","galvanizaseram":"galvaniza","galvanizaserati":"galvaniza","galvanizasesi":"galvaniza","galvanizasi":"galvaniza","galvanizat":"galvaniza","galvanizata":["galvanizată","galvanizat","galvanizata","galvanizat"],"galvanizate":"galvanizat","galvanizatele":"galvanizat","galvanizati":["galvanizați","galvaniza","galvanizați","galvanizat"],"galvanizatii":"galvanizat","galvanizatori":"galvanizator","galvanizatorii":"galvanizator","galvanizatorilor":"galvanizator","galvanizatorul":"galvanizator","galvanizatorule":"galvanizator","galvanizatorului":"galvanizator","galvanizatul":"galvanizat","galvanizau":"galvaniza","galvanizeaza":"galvaniza","galvanizez":"galvaniza","galvanizezi":"galvaniza","galvanocaustice":"galvanocaustică","galvanocausticei":"galvanocaustică","galvanocausticele":"galvanocaustică","galvanocausticelor":"galvanocaustică","galvanocautere":"galvanocauter","galvanocauterele":"galvanocauter","galvanocauterelor":"galvanocauter","galvanocauterizarea":"galvanocauterizare","galvanocauterizari":"galvanocauterizare","galvanocauterizarii":"galvanocauterizare","galvanocauterizarile":"galvanocauterizare","galvanocauterizarilor":"galvanocauterizare","galvanocauterul":"galvanocauter","galvanocauterule":"galvanocauter","galvanocauterului":"galvanocauter","galvanografia":"galvanografie","galvanografiei":"galvanografie","galvanografii":"galvanografie","galvanografiile":"galvanografie","galvanografiilor":"galvanografie","galvanometre":"galvanometru","galvanometrele":"galvanometru","galvanometrelor":"galvanometru","galvanometrica":["galvanometrică","galvanometric","galvanometrica","galvanometric"],"galvanometrice":"galvanometric","galvanometricele":"galvanometric","galvanometrici":"galvanometric","galvanometricii":"galvanometric","galvanometricul":"galvanometric","galvanometrieul":"galvanometrie","galvanometrieule":"galvanometrie","galvanometrieului":"galvanometrie","galvanometrii":"galvanometrie","galvanometriile":"galvanometrie","galvanometriilor":"galvanometrie","galvanometrul":"galvanometru","galvanometrule":"galvanometru","galvanometrului":"galvanometru","galvanonarcoze":"galvanonarcoză","galvanonarcozei":"galvanonarcoză","galvanonarcozele":"galvanonarcoză","galvanonarcozelor":"galvanonarcoză","galvanoplastia":"galvanoplastie","galvanoplastica":["galvanoplastică","galvanoplastic","galvanoplastica","galvanoplastic"],"galvanoplastice":"galvanoplastic","galvanoplasticele":"galvanoplastic","galvanoplastici":"galvanoplastic","galvanoplasticii":"galvanoplastic","galvanoplasticul":"galvanoplastic","galvanoplastiei":"galvanoplastie","galvanoplastii":"galvanoplastie","galvanopuncturi":"galvanopunctură","galvanopuncturii":"galvanopunctură","galvanopuncturile":"galvanopunctură","galvanopuncturilor":"galvanopunctură","galvanoscoape":"galvanoscop","galvanoscoapele":"galvanoscop","galvanoscoapelor":"galvanoscop","galvanoscopul":"galvanoscop","galvanoscopule":"galvanoscop","galvanoscopului":"galvanoscop","galvanostegia":"galvanostegie","galvanostegiei":"galvanostegie","galvanostegii":"galvanostegie","galvanotaxia":"galvanotaxie","galvanotaxiei":"galvanotaxie","galvanotaxii":"galvanotaxie","galvanotaxiile":"galvanotaxie","galvanotaxiilor":"galvanotaxie","galvanotehnice":"galvanotehnică","galvanotehnicei":"galvanotehnică","galvanotehnicele":"galvanotehnică","galvanotehnicelor":"galvanotehnică","galvanoterapia":"galvanoterapie","galvanoterapiei":"galvanoterapie","galvanoterapii":"galvanoterapie","galvanotipia":"galvanotipie","galvanotipiei":"galvanotipie","galvanotipii":"galvanotipie","galvanotipiile":"galvanotipie","galvanotipiilor":"galvanotipie","galvanotipul":"galvanotip","galvanotipule":"galvanotip","galvanotipului":"galvanotip","galvanotipuri":"galvanotip","galvanotipurile":"galvanotip","galvanotipurilor":"galvanotip","galvanotropisme":"galvanotropism","galvanotropismele":"galvanotropism","galvanotropismelor":"galvanotropism","galvanotropismul":"galvanotropism","galvanotropismule":"galvanotropism","galvanotropismului":"galvanotropism","gamaglobuline":"gamaglobulină","gamaglobulinei":"gamaglobulină","gamaglobulinele":"gamaglobulină","gamaglobulinelor":"gamaglobulină","gamalia":"gămălie","gamaliei":"gămălie","gamalii":"gămălie","gamaliile":"gămălie","gamaliilor":"gămălie","gamalioare":"gămălioară","gamalioarei":"gămălioară","gamalioarele":"gămălioară","gamalioarelor":"gămălioară","gamaliute":"gămăliuță","gamaliutei":"gămăliuță","gamaliutele":"gămăliuță","gamaliutelor":"gămăliuță","gamani":"găman","gamanii":"găman","gamanilor":"găman","gamanul":"găman","gamanule":"găman","gamanului":"găman","gamaul":"gama","gamaule":"gama","gamaului":"gama","gamb":"gâmba","gambai":"gâmba","gambam":["gâmbăm","gâmba","gâmbam","gâmba"],"gamband":"gâmba","gambara":"gâmba","gambaram":"gâmba","gambarati":"gâmba","gambase":"gâmba","gambasem":"gâmba","gambasera":"gâmba","gambaseram":"gâmba","gambaserati":"gâmba","gambasesi":"gâmba","gambasi":"gâmba","gambat":"gâmba","gambati":"gâmba","gambau":"gâmba","gambe":["gambe","gambă","gâmbe","gâmba"],"gambei":"gambă","gambele":"gambă","gambelor":"gambă","gambi":"gâmba","gambiana":["gambiană","gambian","gambiana","gambian"],"gambiane":"gambiană","gambianei":"gambiană","gambianele":"gambiană","gambianelor":"gambiană","gambianul":"gambian","gambianule":"gambian","gambianului":"gambian","gambiene":"gambian","gambienele":"gambian","gambieni":"gambian","gambienii":"gambian","gambienilor":"gambian","gambiri":"gambir","gambirii":"gambir","gambirilor":"gambir","gambirul":"gambir","gambirule":"gambir","gambirului":"gambir","gambitul":"gambit","gambitule":"gambit","gambitului":"gambit","gambituri":"gambit","gambiturile":"gambit","gambiturilor":"gambit","gambuzia":"gambuzie","gambuziei":"gambuzie","gambuzii":"gambuzie","gambuziile":"gambuzie","gambuziilor":"gambuzie","game":"gamă","game cromatice":"gamă cromatică","game diatonice":"gamă diatonică","game majore":"gamă majoră","game minore":"gamă minoră","game pentatonice":"gamă pentatonică","gamei":"gamă","gamele":["gamele","gamă","gamele","gamelă"],"gamelei":"gamelă","gamelele":"gamelă","gamelelor":"gamelă","gamelor":"gamă","gameti":"gamet","gametii":"gamet","gametilor":"gamet","gametofiti":"gametofit","gametofitii":"gametofit","gametofitilor":"gametofit","gametofitul":"gametofit","gametofitule":"gametofit","gametofitului":"gametofit","gametofori":"gametofor","gametoforii":"gametofor","gametoforilor":"gametofor","gametoforul":"gametofor","gametoforule":"gametofor","gametoforului":"gametofor","gametogeneze":"gametogeneză","gametogenezei":"gametogeneză","gametogenezele":"gametogeneză","gametogenezelor":"gametogeneză","gametul":"gamet","gametule":"gamet","gametului":"gamet","gamf":"gâmfa","gamfai":"gâmfa","gamfam":["gâmfăm","gâmfa","gâmfam","gâmfa"],"gamfand":"gâmfa","gamfara":"gâmfa","gamfaram":"gâmfa","gamfarati":"gâmfa","gamfarea":"gâmfare","gamfari":"gâmfare","gamfarii":"gâmfare","gamfarile":"gâmfare","gamfarilor":"gâmfare","gamfase":"gâmfa","gamfasem":"gâmfa","gamfasera":"gâmfa","gamfaseram":"gâmfa","gamfaserati":"gâmfa","gamfasesi":"gâmfa","gamfasi":"gâmfa","gamfat":"gâmfa","gamfati":"gâmfa","gamfaturi":"gâmfătură","gamfaturii":"gâmfătură","gamfaturile":"gâmfătură","gamfaturilor":"gâmfătură","gamfau":"gâmfa","gamfe":"gâmfă","gamfei":"gâmfă","gamfele":"gâmfă","gamfelor":"gâmfă","gamfi":"gâmfa","gamofoba":["gamofobă","gamofob","gamofoba","gamofob"],"gamofobe":"gamofob","gamofobele":"gamofob","gamofobi":"gamofob","gamofobia":"gamofobie","gamofobiei":"gamofobie","gamofobii":["gamofobii","gamofob","gamofobii","gamofobie"],"gamofobiile":"gamofobie","gamofobiilor":"gamofobie","gamofobilor":"gamofob","gamofobul":"gamofob","gamofobule":"gamofob","gamofobului":"gamofob","gamogeneze":"gamogeneză","gamogenezei":"gamogeneză","gamogenezele":"gamogeneză","gamogenezelor":"gamogeneză","gamomana":["gamomană","gamoman","gamomana","gamoman"],"gamomane":"gamoman","gamomanele":"gamoman","gamomani":"gamoman","gamomania":"gamomanie","gamomaniei":"gamomanie","gamomanii":["gamomanii","gamoman","gamomanii","gamomanie"],"gamomaniile":"gamomanie","gamomaniilor":"gamomanie","gamomanilor":"gamoman","gamomanul":"gamoman","gamomanule":"gamoman","gamomanului":"gamoman","gamosepala":["gamosepală","gamosepal","gamosepala","gamosepal"],"gamosepale":"gamosepal","gamosepalele":"gamosepal","gamosepali":"gamosepal","gamosepalii":"gamosepal","gamosepalul":"gamosepal","ganasaul":"ganașă","ganasaule":"ganașă","ganasaului":"ganașă","ganase":["ganașe","ganaș","ganașe","ganașă"],"ganasele":["ganașele","ganaș","ganașele","ganașă"],"ganaselor":["ganașelor","ganaș","ganașelor","ganașă"],"ganasul":"ganaș","ganasule":"ganaș","ganasului":"ganaș","ganceluita":["gănceluită","gănceluit","gănceluita","gănceluit"],"ganceluite":"gănceluit","ganceluitele":"gănceluit","ganceluiti":"gănceluit","ganceluitii":"gănceluit","ganceluitul":"gănceluit","gandacei":"gândăcel","gandaceli":"gândăcel","gandacelii":"gândăcel","gandacelilor":"gândăcel","gandacelul":"gândăcel","gandacelule":"gândăcel","gandacelului":"gândăcel","gandaci":"gândac","gandacii":"gândac","gandacilor":"gândac","gandacul":"gândac","gandacule":"gândac","gandacului":"gândac","gandea":"gândi","gandeai":"gândi","gandeam":"gândi","gandeati":"gândi","gandeau":"gândi","gandesc":"gândi","gandeste":"gândi","gandesti":"gândi","gandii":"gândi","gandim":"gândi","gandind":"gândi","gandira":"gândi","gandiram":"gândi","gandirati":"gândi","gandiri":"gândire","gandirista":["gândiristă","gândirist","gândirista","gândirist"],"gandiriste":["gândiriste","gândirist","gândiriste","gândiristă"],"gandiristei":"gândiristă","gandiristele":["gândiristele","gândirist","gândiristele","gândiristă"],"gandiristelor":"gândiristă","gandiristi":"gândirist","gandiristii":"gândirist","gandiristul":"gândirist","gandise":"gândi","gandisem":"gândi","gandisera":"gândi","gandiseram":"gândi","gandiserati":"gândi","gandisesi":"gândi","gandisi":"gândi","gandit":"gândi","ganditi":"gândi","ganditoarea":"gânditoare","ganditoarei":"gânditoare","ganditoarele":"gânditoare","ganditoarelor":"gânditoare","ganditori":"gânditor","ganditorii":"gânditor","ganditorilor":"gânditor","ganditorul":"gânditor","ganditorule":"gânditor","ganditorului":"gânditor","ganditul":"gândit","ganditule":"gândit","ganditului":"gândit","gandul":"gând","gandule":"gând","gandului":"gând","gandurele":"gândurel","gandurelele":"gândurel","gandurelelor":"gândurel","gandurelul":"gândurel","gandurelule":"gândurel","gandurelului":"gândurel","ganduri":"gând","gandurile":"gând","gandurilor":"gând","gangaioasa":["gângăioasă","gângăios","gângăioasa","gângăios"],"gangaioase":"gângăios","gangaioasele":"gângăios","gangaiosi":"gângăios","gangaiosii":"gângăios","gangaiosul":"gângăios","gangania":"gânganie","ganganiei":"gânganie","ganganii":["gângănii","gânganie","gânganii","gânganie"],"ganganiile":"gânganie","ganganiilor":"gânganie","gangava":["gângavă","gângav","gângava","gângav"],"gangave":["gângave","gângav","gângave","gângavă"],"gangavei":"gângavă","gangavele":["gângavele","gângav","gângavele","gângavă","gângăvele","gângăveală"],"gangavelei":"gângăveală","gangavelele":"gângăveală","gangavelelor":"gângăveală","gangaveli":"gângăveală","gangavelor":"gângavă","gangavi":"gângav","gangavia":"gângăvie","gangaviei":"gângăvie","gangavii":["gângavii","gângav","gângăvii","gângăvie"],"gangaviile":"gângăvie","gangaviilor":"gângăvie","gangavirea":"gângăvire","gangaviri":"gângăvire","gangavirii":"gângăvire","gangavirile":"gângăvire","gangavirilor":"gângăvire","gangavita":["gângăvită","gângăvit","gângăvita","gângăvit"],"gangavite":"gângăvit","gangavitele":"gângăvit","gangaviti":"gângăvit","gangavitii":"gângăvit","gangavitul":"gângăvit","gangavul":"gângav","gange":"gangă","gangei":"gangă","gangele":"gangă","gangelor":"gangă","gangliectomia":"gangliectomie","gangliectomiei":"gangliectomie","gangliectomii":"gangliectomie","gangliectomiile":"gangliectomie","gangliectomiilor":"gangliectomie","ganglionara":["ganglionară","ganglionar","ganglionara","ganglionar"],"ganglionare":"ganglionar","ganglionarele":"ganglionar","ganglionari":"ganglionar","ganglionarii":"ganglionar","ganglionarul":"ganglionar","ganglioni":"ganglion","ganglionii":"ganglion","ganglionilor":"ganglion","ganglionul":"ganglion","ganglionule":"ganglion","ganglionului":"ganglion","ganglioplegica":["ganglioplegică","ganglioplegic","ganglioplegica","ganglioplegic"],"ganglioplegice":"ganglioplegic","ganglioplegicele":"ganglioplegic","ganglioplegici":"ganglioplegic","ganglioplegicii":"ganglioplegic","ganglioplegicile":"ganglioplegic","ganglioplegicilor":"ganglioplegic","ganglioplegicul":"ganglioplegic","ganglioplegicule":"ganglioplegic","ganglioplegicului":"ganglioplegic","gangrenai":"gangrena","gangrenam":["gangrenăm","gangrena","gangrenam","gangrena"],"gangrenand":"gangrena","gangrenara":"gangrena","gangrenaram":"gangrena","gangrenarati":"gangrena","gangrenarea":"gangrenare","gangrenari":"gangrenare","gangrenarii":"gangrenare","gangrenarile":"gangrenare","gangrenarilor":"gangrenare","gangrenase":"gangrena","gangrenasem":"gangrena","gangrenasera":"gangrena","gangrenaseram":"gangrena","gangrenaserati":"gangrena","gangrenasesi":"gangrena","gangrenasi":"gangrena","gangrenat":"gangrena","gangrenata":["gangrenată","gangrenat","gangrenata","gangrenat"],"gangrenate":"gangrenat","gangrenatele":"gangrenat","gangrenati":["gangrenați","gangrena","gangrenați","gangrenat"],"gangrenatii":"gangrenat","gangrenatul":"gangrenat","gangrenau":"gangrena","gangrene":"gangrenă","gangreneaza":"gangrena","gangrenei":"gangrenă","gangrenele":"gangrenă","gangrenelor":"gangrenă","gangrenez":"gangrena","gangrenezi":"gangrena","gangrenoasa":["gangrenoasă","gangrenos","gangrenoasa","gangrenos"],"gangrenoase":"gangrenos","gangrenoasele":"gangrenos","gangrenosi":"gangrenos","gangrenosii":"gangrenos","gangrenosul":"gangrenos","gangstereasca":["gangsterească","gangsteresc","gangstereasca","gangsteresc"],"gangsterescul":"gangsteresc","gangsteresti":"gangsteresc","gangsterestii":"gangsteresc","gangsterestile":"gangsteresc","gangsteri":"gangster","gangsterii":"gangster","gangsterilor":"gangster","gangsterismul":"gangsterism","gangsterismule":"gangsterism","gangsterismului":"gangsterism","gangsterul":"gangster","gangsterule":"gangster","gangsterului":"gangster","gangul":"gang","gangule":"gang","gangului":"gang","gangur":"grangur","gangurea":"gânguri","gangureai":"gânguri","ganguream":"gânguri","gangureati":"gânguri","gangureau":"gânguri","ganguresc":"gânguri","gangureste":"gânguri","ganguresti":"gânguri","ganguri":["ganguri","gang","ganguri","gangur"],"gangurii":["gangurii","gangur","gângurii","gânguri"],"gangurile":"gang","gangurilor":["gangurilor","gang","gangurilor","gangur"],"gangurim":"gânguri","gangurind":"gânguri","gangurira":"gânguri","ganguriram":"gânguri","gangurirati":"gânguri","gangurirea":"gângurire","ganguriri":"gângurire","ganguririi":"gângurire","ganguririle":"gângurire","ganguririlor":"gângurire","gangurise":"gânguri","gangurisem":"gânguri","gangurisera":"gânguri","ganguriseram":"gânguri","ganguriserati":"gânguri","gangurisesi":"gânguri","gangurisi":"gânguri","gangurit":"gânguri","ganguriti":"gânguri","ganguritul":"gângurit","ganguritule":"gângurit","ganguritului":"gângurit","gangurul":"gangur","gangurule":"gangur","gangurului":"gangur","ganoidul":"ganoid","ganoidule":"ganoid","ganoidului":"ganoid","ganoizi":"ganoid","ganoizii":"ganoid","ganoizilor":"ganoid","gansacei":"gânsăcel","gansaceii":"gânsăcel","gansaceilor":"gânsăcel","gansacelul":"gânsăcel","gansacelule":"gânsăcel","gansacelului":"gânsăcel","gansaci":"gânsac","gansacii":"gânsac","gansacilor":"gânsac","gansacul":"gânsac","gansacule":"gânsac","gansacului":"gânsac","gaoacea":"găoace","gaoaze":"găoază","gaoazei":"găoază","gaoazele":"găoază","gaoazelor":"găoază","gaoc":"găoace","gaoce":"găoace","gaoci":"găoace","gaocii":"găoace","gaocile":"găoace","gaocilor":"găoace","gaozari":"găozar","gaozarii":"găozar","gaozarilor":"găozar","gaozarul":"găozar","gaozarule":"găozar","gaozarului":"găozar","garafe":"garafă","garafei":"garafă","garafele":"garafă","garafelor":"garafă","garafioare":"gărăfioară","garafioarei":"gărăfioară","garafioarele":"gărăfioară","garafioarelor":"gărăfioară","garagate":"garagață","garagatei":"garagață","garagatele":"garagață","garagatelor":"garagață","garai":"gara","garaje":"garaj","garajele":"garaj","garajelor":"garaj","garajisti":"garajist","garajistii":"garajist","garajistilor":"garajist","garajistul":"garajist","garajistule":"garajist","garajistului":"garajist","garajul":"garaj","garajule":"garaj","garajului":"garaj","garam":["garăm","gara","garam","gara"],"garand":"gara","garantai":"garanta","garantam":["garantăm","garanta","garantam","garanta"],"garantand":"garanta","garantara":"garanta","garantaram":"garanta","garantarati":"garanta","garantarea":"garantare","garantari":"garantare","garantarii":"garantare","garantase":"garanta","garantasem":"garanta","garantasera":"garanta","garantaseram":"garanta","garantaserati":"garanta","garantasesi":"garanta","garantasi":"garanta","garantat":"garanta","garantata":["garantată","garantat","garantata","garantat"],"garantate":"garantat","garantatele":"garantat","garantati":["garantați","garanta","garantați","garantat"],"garantatii":"garantat","garantatul":"garantat","garantau":"garanta","garante":["garante","garantă","garanțe","garanță"],"garanteaza":"garanta","garantei":["garantei","garantă","garanței","garanță"],"garantele":["garantele","garantă","garanțele","garanță"],"garantelor":["garantelor","garantă","garanțelor","garanță"],"garantez":"garanta","garantezi":"garanta","garanti":"garant","garantia":"garanție","garantiei":"garanție","garantii":["garanții","garant","garanții","garanție"],"garantiile":"garanție","garantiilor":"garanție","garantilor":"garant","garantine":"garanțină","garantinei":"garanțină","garantinele":"garanțină","garantinelor":"garanțină","garantul":"garant","garantule":"garant","garantului":"garant","garara":"gara","gararam":"gara","gararati":"gara","gararea":"garare","gararei":"garare","garase":"gara","garasem":"gara","garasera":"gara","garaseram":"gara","garaserati":"gara","garasesi":"gara","garasi":"gara","garasite":"gărășiță","garasitei":"gărășiță","garasitele":"gărășiță","garasitelor":"gărășiță","garat":"gara","garata":["garată","garat","garata","garat"],"garate":"garat","garatele":"garat","garati":["garați","gara","garați","garat"],"garatii":"garat","garatul":"garat","garau":"gara","garbaul":"gârbă","garbaule":"gârbă","garbaului":"gârbă","garbe":"gârbă","garbele":"gârbă","garbelor":"gârbă","garbite":"gârbiță","garbitei":"gârbiță","garbitele":"gârbiță","garbitelor":"gârbiță","garbova":["gârbovă","gârbov","gârbova","gârbov"],"garbove":"gârbov","garbovele":"gârbov","garbovi":"gârbov","garbovii":"gârbov","garbovirea":"gârbovire","garboviri":"gârbovire","garbovirii":"gârbovire","garbovirile":"gârbovire","garbovirilor":"gârbovire","garbovita":["gârbovită","gârbovit","gârbovita","gârbovit"],"garbovite":"gârbovit","garbovitele":"gârbovit","garboviti":"gârbovit","garbovitii":"gârbovit","garbovitul":"gârbovit","garbovul":"gârbov","gardasi":"gărdaș","gardasii":"gărdaș","gardasilor":"gărdaș","gardasul":"gărdaș","gardasule":"gărdaș","gardasului":"gărdaș","gardenia":"gardenie","gardeniei":"gardenie","gardenii":"gardenie","gardeniile":"gardenie","gardeniilor":"gardenie","garderobe":"garderobă","garderobei":"garderobă","garderobele":"garderobă","garderobelor":"garderobă","garderobiere":"garderobieră","garderobierei":"garderobieră","garderobierele":"garderobieră","garderobierelor":"garderobieră","garderobieri":"garderobier","garderobierii":"garderobier","garderobierilor":"garderobier","garderobierul":"garderobier","garderobierule":"garderobier","garderobierului":"garderobier","garderobul":"garderob","garderobule":"garderob","garderobului":"garderob","garderoburi":"garderob","garderoburile":"garderob","garderoburilor":"garderob","gardia":"gardie","gardiei":"gardie","gardieni":"gardian","gardii":"gardie","gardiile":"gardie","gardiilor":"gardie","gardisti":"gardist","gardistii":"gardist","gardistilor":"gardist","gardistul":"gardist","gardistule":"gardist","gardistului":"gardist","garduceanul":"gărducean","garduceanule":"gărducean","garduceanului":"gărducean","garducene":"gărducean","garducenele":"gărducean","garducenelor":"gărducean","garduia":"gărdui","garduiai":"gărdui","garduiam":"gărdui","garduiati":"gărdui","garduiau":"gărdui","garduiesc":"gărdui","garduieste":"gărdui","garduiesti":"gărdui","garduii":"gărdui","garduim":"gărdui","garduind":"gărdui","garduira":"gărdui","garduiram":"gărdui","garduirati":"gărdui","garduise":"gărdui","garduisem":"gărdui","garduisera":"gărdui","garduiseram":"gărdui","garduiserati":"gărdui","garduisesi":"gărdui","garduisi":"gărdui","garduit":"gărdui","garduita":["gărduită","gărduit","gărduita","gărduit"],"garduite":"gărduit","garduitele":"gărduit","garduiti":["gărduiți","gărdui","gărduiți","gărduit"],"garduitii":"gărduit","garduitul":"gărduit","gardul":"gard","gardule":"gard","gardulete":"gărduleț","garduletele":"gărduleț","garduletelor":"gărduleț","garduletul":"gărduleț","garduletule":"gărduleț","garduletului":"gărduleț","gardului":"gard","gardurele":"gărdurel","gardurelele":"gărdurel","gardurelelor":"gărdurel","gardurelul":"gărdurel","gardurelule":"gărdurel","gardurelului":"gărdurel","garduri":"gard","garduri vii":"gard viu","gardurile":"gard","gardurilor":"gard","gardusi":"gărduș","gardusii":"gărduș","gardusilor":"gărduș","gardusul":"gărduș","gardusule":"gărduș","gardusului":"gărduș","gardutul":"gărduț","gardutule":"gărduț","gardutului":"gărduț","garduturi":"gărduț","garduturile":"gărduț","garduturilor":"gărduț","gareaza":"gara","garez":"gara","garezi":"gara","gargalane":"gărgălan","gargalanele":"gărgălan","gargalanelor":"gărgălan","gargalanul":"gărgălan","gargalanule":"gărgălan","gargalanului":"gărgălan","gargalotul":"gârgăloț","gargalotule":"gârgăloț","gargalotului":"gârgăloț","gargantueasca":["gargantuească","gargantuesc","gargantueasca","gargantuesc"],"gargantuescul":"gargantuesc","gargantuesti":"gargantuesc","gargantuestii":"gargantuesc","gargantuestile":"gargantuesc","gargaragii":"gargaragiu","gargaragiii":"gargaragiu","gargaragiilor":"gargaragiu","gargaragiuul":"gargaragiu","gargaragiuule":"gargaragiu","gargaragiuului":"gargaragiu","gargare":["gargare","gargară","gârgăre","gârgără"],"gargarei":["gargarei","gargară","gârgărei","gârgără"],"gargarele":["gargarele","gargară","gârgărele","gârgără"],"gargarelor":["gargarelor","gargară","gârgărelor","gârgără"],"gargarisea":"gargarisi","gargariseai":"gargarisi","gargariseam":"gargarisi","gargariseati":"gargarisi","gargariseau":"gargarisi","gargarisele":"gargariseală","gargariselei":"gargariseală","gargariselele":"gargariseală","gargariselelor":"gargariseală","gargariseli":"gargariseală","gargarisesc":"gargarisi","gargariseste":"gargarisi","gargarisesti":"gargarisi","gargarisii":"gargarisi","gargarisim":"gargarisi","gargarisind":"gargarisi","gargarisira":"gargarisi","gargarisiram":"gargarisi","gargarisirati":"gargarisi","gargarisirea":"gargarisire","gargarisiri":"gargarisire","gargarisirii":"gargarisire","gargarisirile":"gargarisire","gargarisirilor":"gargarisire","gargarisise":"gargarisi","gargarisisem":"gargarisi","gargarisisera":"gargarisi","gargarisiseram":"gargarisi","gargarisiserati":"gargarisi","gargarisisesi":"gargarisi","gargarisisi":"gargarisi","gargarisit":"gargarisi","gargarisiti":"gargarisi","gargarisme":"gargarism","gargarismele":"gargarism","gargarismelor":"gargarism","gargarismul":"gargarism","gargarismule":"gargarism","gargarismului":"gargarism"};
@@ -0,0 +1 @@
+export default {"gargarite":"gărgăriță","gargaritei":"gărgăriță","gargaritele":"gărgăriță","gargaritelor":"gărgăriță","gargarizai":"gargariza","gargarizam":["gargarizăm","gargariza","gargarizam","gargariza"],"gargarizand":"gargariza","gargarizara":"gargariza","gargarizaram":"gargariza","gargarizarati":"gargariza","gargarizase":"gargariza","gargarizasem":"gargariza","gargarizasera":"gargariza","gargarizaseram":"gargariza","gargarizaserati":"gargariza","gargarizasesi":"gargariza","gargarizasi":"gargariza","gargarizat":"gargariza","gargarizati":"gargariza","gargarizau":"gargariza","gargarizeaza":"gargariza","gargarizez":"gargariza","gargarizezi":"gargariza","gargaune":"gărgăun","gargauneul":"gărgăune","gargauneule":"gărgăune","gargauneului":"gărgăune","gargauni":["gărgăuni","gărgăun","gărgăuni","gărgăune"],"gargaunii":["gărgăunii","gărgăun","gărgăunii","gărgăune"],"gargaunilor":["gărgăunilor","gărgăun","gărgăunilor","gărgăune"],"gargaunul":"gărgăun","gargaunule":"gărgăun","gargaunului":"gărgăun","garghite":"gârghiță","garghitei":"gârghiță","garghitele":"gârghiță","garghitelor":"gârghiță","gargolot":"gârgăloț","gargolotul":"gârgoloț","gargolotule":"gârgoloț","gargolotului":"gârgoloț","garguie":"gargui","garguiele":"gargui","garguielor":"gargui","garguiul":"gargui","garguiule":"gargui","garguiului":"gargui","gari":"gară","gari feroviare":"gară feroviară","garii":"gară","garile":"gară","garilor":"gară","garistea":"gariște","garisti":"gariște","garistii":"gariște","garistile":"gariște","garistilor":"gariște","garlana":["gârlană","gârlan","gârlana","gârlan"],"garlane":"gârlan","garlanele":"gârlan","garlani":"gârlan","garlanii":"gârlan","garlanul":"gârlan","garle":"gârlă","garlicioare":"gârlicior","garlicioarele":"gârlicior","garlicioarelor":"gârlicior","garliciorul":"gârlicior","garliciorule":"gârlicior","garliciorului":"gârlicior","garliciul":"gârlici","garliciule":"gârlici","garliciului":"gârlici","garliciuri":"gârlici","garliciurile":"gârlici","garliciurilor":"gârlici","garlisoare":"gârlișoară","garlisoarei":"gârlișoară","garlisoarele":"gârlișoară","garlisoarelor":"gârlișoară","garlite":"gârliță","garlite mari":"gârliță mare","garlite mici":"gârliță mică","garlitei":"gârliță","garlitele":"gârliță","garlitelor":"gârliță","garloaie":"gârloi","garloaiele":"gârloi","garloaielor":"gârloi","garloiul":"gârloi","garloiule":"gârloi","garloiului":"gârloi","garnete":["gârnețe","gârneață","garnete","garnetă"],"garnetei":["gârneței","gârneață","garnetei","garnetă"],"garnetele":["gârnețele","gârneață","garnetele","garnetă"],"garnetelor":["gârnețelor","gârneață","garnetelor","garnetă"],"garnicioare":"gărnicioară","garnicioarei":"gărnicioară","garnicioarele":"gărnicioară","garnicioarelor":"gărnicioară","garnierite":"garnierit","garnieritele":"garnierit","garnieritelor":"garnierit","garnieritul":"garnierit","garnieritule":"garnierit","garnieritului":"garnierit","garnisea":"garnisi","garniseai":"garnisi","garniseam":"garnisi","garniseati":"garnisi","garniseau":"garnisi","garnisesc":"garnisi","garniseste":"garnisi","garnisesti":"garnisi","garnisii":"garnisi","garnisim":"garnisi","garnisind":"garnisi","garnisira":"garnisi","garnisiram":"garnisi","garnisirati":"garnisi","garnisirea":"garnisire","garnisirei":"garnisire","garnisise":"garnisi","garnisisem":"garnisi","garnisisera":"garnisi","garnisiseram":"garnisi","garnisiserati":"garnisi","garnisisesi":"garnisi","garnisisi":"garnisi","garnisit":"garnisi","garnisita":["garnisită","garnisit","garnisita","garnisit"],"garnisite":"garnisit","garnisitele":"garnisit","garnisiti":["garnisiți","garnisi","garnisiți","garnisit"],"garnisitii":"garnisit","garnisitul":"garnisit","garnite":["garnițe","garniță","gârnițe","gârniță"],"garnitei":["garniței","garniță","gârniței","gârniță"],"garnitele":["garnițele","garniță","gârnițele","gârniță"],"garnitelor":["garnițelor","garniță","gârnițelor","gârniță"],"garnitetul":"gârnițet","garnitetule":"gârnițet","garnitetului":"gârnițet","garniteturi":"gârnițet","garniteturile":"gârnițet","garniteturilor":"gârnițet","garniture":"garnitură","garniturei":"garnitură","garniturele":"garnitură","garniturelor":"garnitură","garnituri":"garnitură","garnizoane":"garnizoană","garnizoanei":"garnizoană","garnizoanele":"garnizoană","garnizoanelor":"garnizoană","garnul":"gârn","garnule":"gârn","garnului":"gârn","garoafe":"garoafă","garoafei":"garoafă","garoafele":"garoafă","garoafelor":"garoafă","garofioare":"garofioară","garofioarei":"garofioară","garofioarele":"garofioară","garofioarelor":"garofioară","garofite":"garofiță","garofitei":"garofiță","garofitele":"garofiță","garofitelor":"garofiță","garoii":"garoi","garoilor":"garoi","garoiul":"garoi","garoiule":"garoi","garoiului":"garoi","garoul":"garou","garoule":"garou","garoului":"garou","garouri":"garou","garourile":"garou","garourilor":"garou","garsoni":"garson","garsoniere":"garsonieră","garsonierei":"garsonieră","garsonierele":"garsonieră","garsonierelor":"garsonieră","garsonii":"garson","garsonilor":"garson","garsonul":"garson","garsonule":"garson","garsonului":"garson","gartanul":"gârtan","gartanule":"gârtan","gartanului":"gârtan","garzi":"gardă","garzi de onoare":"gardă de onoare","garzi personale":"gardă personală","garzii":"gardă","garzile":"gardă","garzilor":"gardă","gascani":"gâscan","gascania":"gâscănie","gascaniei":"gâscănie","gascanii":["gâscanii","gâscan","gâscănii","gâscănie"],"gascaniile":"gâscănie","gascaniilor":"gâscănie","gascanilor":"gâscan","gascanul":"gâscan","gascanule":"gâscan","gascanului":"gâscan","gascari":"gâscar","gascarii":"gâscar","gascarilor":"gâscar","gascarite":"gâscăriță","gascaritei":"gâscăriță","gascaritele":"gâscăriță","gascaritelor":"gâscăriță","gascarul":"gâscar","gascarule":"gâscar","gascarului":"gâscar","gascoii":"gâscoi","gascoilor":"gâscoi","gascoiul":"gâscoi","gascoiule":"gâscoi","gascoiului":"gâscoi","gasconade":"gasconadă","gasconadei":"gasconadă","gasconadele":"gasconadă","gasconadelor":"gasconadă","gasconeria":"gasconerie","gasconeriei":"gasconerie","gasconerii":"gasconerie","gasconeriile":"gasconerie","gasconeriilor":"gasconerie","gasconisme":"gasconism","gasconismele":"gasconism","gasconismelor":"gasconism","gasconismul":"gasconism","gasconismule":"gasconism","gasconismului":"gasconism","gasculite":"gâsculiță","gasculitei":"gâsculiță","gasculitele":"gâsculiță","gasculitelor":"gâsculiță","gascusoare":"gâscușoară","gascusoarei":"gâscușoară","gascusoarele":"gâscușoară","gascusoarelor":"gâscușoară","gascute":"gâscuță","gascutei":"gâscuță","gascutele":"gâscuță","gascutelor":"gâscuță","gasea":"găsi","gaseai":"găsi","gaseam":"găsi","gaseati":"găsi","gaseau":"găsi","gaselnite":"găselniță","gaselnitei":"găselniță","gaselnitele":"găselniță","gaselnitelor":"găselniță","gasesc":"găsi","gaseste":"găsi","gaseste de cuviinta":"găsi de cuviință","gasesti":"găsi","gasii":"găsi","gasim":"găsi","gasind":"găsi","gasira":"găsi","gasiram":"găsi","gasirati":"găsi","gasirea":"găsire","gasirei":"găsire","gasise":"găsi","gasisem":"găsi","gasisera":"găsi","gasiseram":"găsi","gasiserati":"găsi","gasisesi":"găsi","gasisi":"găsi","gasit":"găsi","gasit de cuviinta":"găsi de cuviință","gasiti":"găsi","gasitoarea":"găsitoare","gasitoarei":"găsitoare","gasitoarele":"găsitoare","gasitoarelor":"găsitoare","gasitori":"găsitor","gasitorii":"găsitor","gasitorilor":"găsitor","gasitorul":"găsitor","gasitorule":"găsitor","gasitorului":"găsitor","gasitul":"găsit","gasitule":"găsit","gasitului":"găsit","gasperi":"gașper","gasperii":"gașper","gasperilor":"gașper","gasperite":"gașperiță","gasperitei":"gașperiță","gasperitele":"gașperiță","gasperitelor":"gașperiță","gasperul":"gașper","gasperule":"gașper","gasperului":"gașper","gaste":["găște","gașcă","gâște","gâscă"],"gaste calugarita":"gâscă călugăriță","gaste canadiene":"gâscă canadiană","gaste cu cioc scurt":"gâscă cu cioc scurt","gaste cu gat rosu":"gâscă cu gât roșu","gaste cu oua de aur":"gâscă cu ouă de aur","gaste de india":"gâscă de India","gaste de semanatura":"gâscă de semănătură","gaste de vara":"gâscă de vară","gaste de zapada":"gâscă de zăpadă","gaste egiptene":"gâscă egipteană","gaste negre":"gâscă neagră","gaste salbatice":"gâscă sălbatică","gastei":["găștei","gașcă","gâștei","gâscă"],"gastele":["găștele","gașcă","gâștele","gâscă"],"gastelor":["găștelor","gașcă","gâștelor","gâscă"],"gasteropode":"gasteropod","gasteropodele":"gasteropod","gasteropodelor":"gasteropod","gasteropodul":"gasteropod","gasteropodule":"gasteropod","gasteropodului":"gasteropod","gasti":"gașcă","gastralgia":"gastralgie","gastralgica":["gastralgică","gastralgic","gastralgica","gastralgic"],"gastralgice":"gastralgic","gastralgicele":"gastralgic","gastralgici":"gastralgic","gastralgicii":"gastralgic","gastralgicul":"gastralgic","gastralgiei":"gastralgie","gastralgii":"gastralgie","gastralgiile":"gastralgie","gastralgiilor":"gastralgie","gastrectazia":"gastrectazie","gastrectaziei":"gastrectazie","gastrectazii":"gastrectazie","gastrectaziile":"gastrectazie","gastrectaziilor":"gastrectazie","gastrectomia":"gastrectomie","gastrectomiei":"gastrectomie","gastrectomii":"gastrectomie","gastrectomiile":"gastrectomie","gastrectomiilor":"gastrectomie","gastrica":["gastrică","gastric","gastrica","gastric"],"gastrice":"gastric","gastricele":"gastric","gastrici":"gastric","gastricii":"gastric","gastricul":"gastric","gastrine":"gastrină","gastrinei":"gastrină","gastrinele":"gastrină","gastrinelor":"gastrină","gastrite":"gastrită","gastritei":"gastrită","gastritele":"gastrită","gastritelor":"gastrită","gastrocele":"gastrocel","gastrocelele":"gastrocel","gastrocelelor":"gastrocel","gastrocelul":"gastrocel","gastrocelule":"gastrocel","gastrocelului":"gastrocel","gastrodinia":"gastrodinie","gastrodiniei":"gastrodinie","gastrodinii":"gastrodinie","gastrodiniile":"gastrodinie","gastrodiniilor":"gastrodinie","gastroduodenite":"gastroduodenită","gastroduodenitei":"gastroduodenită","gastroduodenitele":"gastroduodenită","gastroduodenitelor":"gastroduodenită","gastroenterite":"gastroenterită","gastroenteritei":"gastroenterită","gastroenteritele":"gastroenterită","gastroenteritelor":"gastroenterită","gastroenterocolite":"gastroenterocolită","gastroenterocolitei":"gastroenterocolită","gastroenterocolitele":"gastroenterocolită","gastroenterocolitelor":"gastroenterocolită","gastroenterologe":"gastroenterologă","gastroenterologei":"gastroenterologă","gastroenterologele":"gastroenterologă","gastroenterologelor":"gastroenterologă","gastroenterologi":"gastroenterolog","gastroenterologia":"gastroenterologie","gastroenterologiei":"gastroenterologie","gastroenterologii":["gastroenterologii","gastroenterolog","gastroenterologii","gastroenterologie"],"gastroenterologilor":"gastroenterolog","gastroenterologul":"gastroenterolog","gastroenterologule":"gastroenterolog","gastroenterologului":"gastroenterolog","gastroenterostomia":"gastroenterostomie","gastroenterostomiei":"gastroenterostomie","gastroenterostomii":"gastroenterostomie","gastroenterostomiile":"gastroenterostomie","gastroenterostomiilor":"gastroenterostomie","gastrografe":"gastrograf","gastrografele":"gastrograf","gastrografelor":"gastrograf","gastrograful":"gastrograf","gastrografule":"gastrograf","gastrografului":"gastrograf","gastrointestinala":["gastrointestinală","gastrointestinal","gastrointestinala","gastrointestinal"],"gastrointestinale":"gastrointestinal","gastrointestinalele":"gastrointestinal","gastrointestinali":"gastrointestinal","gastrointestinalii":"gastrointestinal","gastrointestinalul":"gastrointestinal","gastrolatri":"gastrolatru","gastrolatrii":"gastrolatru","gastrolatrilor":"gastrolatru","gastrolatruul":"gastrolatru","gastrolatruule":"gastrolatru","gastrolatruului":"gastrolatru","gastrolitul":"gastrolit","gastrolitule":"gastrolit","gastrolitului":"gastrolit","gastrologia":"gastrologie","gastrologica":["gastrologică","gastrologic","gastrologica","gastrologic"],"gastrologice":"gastrologic","gastrologicele":"gastrologic","gastrologici":"gastrologic","gastrologicii":"gastrologic","gastrologicul":"gastrologic","gastrologiei":"gastrologie","gastrologii":"gastrologie","gastrologiile":"gastrologie","gastrologiilor":"gastrologie","gastromalacia":"gastromalacie","gastromalaciei":"gastromalacie","gastromalacii":"gastromalacie","gastromalaciile":"gastromalacie","gastromalaciilor":"gastromalacie","gastronoame":"gastronoamă","gastronoamei":"gastronoamă","gastronoamele":"gastronoamă","gastronoamelor":"gastronoamă","gastronome":"gastronomă","gastronomei":"gastronomă","gastronomele":"gastronomă","gastronomelor":"gastronomă","gastronomi":"gastronom","gastronomia":"gastronomie","gastronomica":["gastronomică","gastronomic","gastronomica","gastronomic"],"gastronomice":"gastronomic","gastronomicele":"gastronomic","gastronomici":"gastronomic","gastronomicii":"gastronomic","gastronomicul":"gastronomic","gastronomiei":"gastronomie","gastronomii":["gastronomii","gastronom","gastronomii","gastronomie"],"gastronomilor":"gastronom","gastronomul":"gastronom","gastronomule":"gastronom","gastronomului":"gastronom","gastropatia":"gastropatie","gastropatiei":"gastropatie","gastropatii":"gastropatie","gastropatiile":"gastropatie","gastropatiilor":"gastropatie","gastropexia":"gastropexie","gastropexiei":"gastropexie","gastropexii":"gastropexie","gastropexiile":"gastropexie","gastropexiilor":"gastropexie","gastroplegia":"gastroplegie","gastroplegiei":"gastroplegie","gastroplegii":"gastroplegie","gastroplegiile":"gastroplegie","gastroplegiilor":"gastroplegie","gastropode":"gastropod","gastropodele":"gastropod","gastropodelor":"gastropod","gastropodul":"gastropod","gastropodule":"gastropod","gastropodului":"gastropod","gastroragia":"gastroragie","gastroragiei":"gastroragie","gastroragii":"gastroragie","gastroragiile":"gastroragie","gastroragiilor":"gastroragie","gastroscoape":"gastroscop","gastroscoapele":"gastroscop","gastroscoapelor":"gastroscop","gastroscopia":"gastroscopie","gastroscopiei":"gastroscopie","gastroscopii":"gastroscopie","gastroscopiile":"gastroscopie","gastroscopiilor":"gastroscopie","gastroscopul":"gastroscop","gastroscopule":"gastroscop","gastroscopului":"gastroscop","gastrospasme":"gastrospasm","gastrospasmele":"gastrospasm","gastrospasmelor":"gastrospasm","gastrospasmul":"gastrospasm","gastrospasmule":"gastrospasm","gastrospasmului":"gastrospasm","gastrostomia":"gastrostomie","gastrostomiei":"gastrostomie","gastrostomii":"gastrostomie","gastrostomiile":"gastrostomie","gastrostomiilor":"gastrostomie","gastrotomia":"gastrotomie","gastrotomiei":"gastrotomie","gastrotomii":"gastrotomie","gastrotomiile":"gastrotomie","gastrotomiilor":"gastrotomie","gastrulatia":"gastrulație","gastrulatiei":"gastrulație","gastrulatii":"gastrulație","gastrulatiile":"gastrulație","gastrulatiilor":"gastrulație","gastrule":"gastrulă","gastrulei":"gastrulă","gat":"găta","gata":"găti","gatai":"găta","gatam":["gătăm","găta","gătam","găta"],"gatand":"găta","gatara":"găta","gataram":"găta","gatarati":"găta","gatare":"gâtar","gatarele":"gâtar","gatarelor":"gâtar","gatarul":"gâtar","gatarule":"gâtar","gatarului":"gâtar","gatase":"găta","gatasem":"găta","gatasera":"găta","gataseram":"găta","gataserati":"găta","gatasesi":"găta","gatasi":"găta","gatat":"găta","gatata":["gătată","gătat","gătata","gătat"],"gatate":"gătat","gatatele":"gătat","gatati":["gătați","găta","gătați","gătat"],"gatatii":"gătat","gatatul":"gătat","gatau":"găta","gatea":"găti","gateai":"găti","gateam":"găti","gateati":"găti","gateau":"găti","gateje":"gătej","gatejele":["gătejele","gătej","gătejele","gătejel"],"gatejelele":"gătejel","gatejelelor":"gătejel","gatejelor":"gătej","gatejelul":"gătejel","gatejelule":"gătejel","gatejelului":"gătejel","gatejisoare":"gătejișor","gatejisoarele":"gătejișor","gatejisoarelor":"gătejișor","gatejisorul":"gătejișor","gatejisorule":"gătejișor","gatejisorului":"gătejișor","gatejul":"gătej","gatejule":"gătej","gatejului":"gătej","gateli":"găteală","gatelii":"găteală","gatelile":"găteală","gatelilor":"găteală","gatere":"gater","gaterele":"gater","gaterelor":"gater","gateristi":["gateriști","gaterist","gateristi","gaterist"],"gateristii":"gaterist","gateristilor":"gaterist","gateristul":"gaterist","gateristule":"gaterist","gateristului":"gaterist","gaterul":"gater","gaterule":"gater","gaterului":"gater","gatesc":"găti","gateste":"găti","gatesti":"găti","gati":"găta","gatii":"găti","gatiile":"gatii","gatiilor":"gatii","gatim":"găti","gatind":"găti","gatine":"gătin","gatinele":"gătin","gatinelor":"gătin","gatinul":"gătin","gatinule":"gătin","gatinului":"gătin","gatira":"găti","gatiram":"găti","gatirati":"găti","gatirea":"gătire","gatirei":"gătire","gatise":"găti","gatisem":"găti","gatisera":"găti","gatiseram":"găti","gatiserati":"găti","gatisesi":"găti","gatisi":"găti","gatisme":"gatism","gatismele":"gatism","gatismelor":"gatism","gatismul":"gatism","gatismule":"gatism","gatismului":"gatism","gatisoare":["gâțișoare","gâțișoară","gâtișoare","gâtișor"],"gatisoarei":"gâțișoară","gatisoarele":"gâțișoară","gatisoarelor":"gâțișoară","gatisore":"gâtișor","gatisorele":"gâtișor","gatisorelor":"gâtișor","gatisorul":"gâtișor","gatisorule":"gâtișor","gatisorului":"gâtișor","gatit":"găti","gatita":["gătită","gătit","gătita","gătit"],"gatite":["gătite","gătit","gâtițe","gâtiță"],"gatitei":"gâtiță","gatitela":["gătițelă","gătițel","gătițela","gătițel"],"gatitele":["gătitele","gătit","gâtițele","gâtiță","gătițele","gătițel"],"gatitelele":"gătițel","gatiteli":"gătițel","gatitelii":"gătițel","gatitelor":"gâtiță","gatitelul":"gătițel","gatiti":["gătiți","găti","gătiți","gătit"],"gatitii":"gătit","gatitul":"gătit","gatlana":["gâtlană","gâtlan","gâtlana","gâtlan"],"gatlane":"gâtlan","gatlanele":"gâtlan","gatlanelor":"gâtlan","gatlani":"gâtlan","gatlanii":"gâtlan","gatlanul":"gâtlan","gatlanule":"gâtlan","gatlanului":"gâtlan","gatlegaul":"gâtlegău","gatlegaule":"gâtlegău","gatlegaului":"gâtlegău","gatlejul":"gâtlej","gatlejule":"gâtlej","gatlejului":"gâtlej","gatlejuri":"gâtlej","gatlejurile":"gâtlej","gatlejurilor":"gâtlej","gatoasa":["gâtoasă","gâtos","gâtoasa","gâtos"],"gatoase":"gâtos","gatoasele":"gâtos","gatosi":"gâtos","gatosii":"gâtos","gatosul":"gâtos","gatuia":"gâtui","gatuiai":"gâtui","gatuiam":"gâtui","gatuiati":"gâtui","gatuiau":"gâtui","gatuie":"gâtui","gatuiele":"gâtuială","gatuielei":"gâtuială","gatuielele":"gâtuială","gatuielelor":"gâtuială","gatuieli":"gâtuială","gatuii":"gâtui","gatuim":"gâtui","gatuind":"gâtui","gatuira":"gâtui","gatuiram":"gâtui","gatuirati":"gâtui","gatuirea":"gâtuire","gatuiri":"gâtuire","gatuirii":"gâtuire","gatuirile":"gâtuire","gatuirilor":"gâtuire","gatuise":"gâtui","gatuisem":"gâtui","gatuisera":"gâtui","gatuiseram":"gâtui","gatuiserati":"gâtui","gatuisesi":"gâtui","gatuisi":"gâtui","gatuit":"gâtui","gatuita":["gâtuită","gâtuit","gâtuita","gâtuit"],"gatuite":"gâtuit","gatuitele":"gâtuit","gatuiti":["gâtuiți","gâtui","gâtuiți","gâtuit"],"gatuitii":"gâtuit","gatuitul":"gâtuit","gatul":["gatul","gat","gâtul","gât"],"gatule":["gatule","gat","gâtule","gât"],"gatului":["gatului","gat","gâtului","gât"],"gaturi":["gaturi","gat","gâturi","gât"],"gaturile":["gaturile","gat","gâturile","gât"],"gaturilor":["gaturilor","gat","gâturilor","gât"],"gauchoi":"gaucho","gaucholor":"gaucho","gauchoul":"gaucho","gauchoule":"gaucho","gauchoului":"gaucho","gauleiteri":"gauleiter","gauleiterii":"gauleiter","gauleiterilor":"gauleiter","gauleiterul":"gauleiter","gauleiterule":"gauleiter","gauleiterului":"gauleiter","gaullismul":"gaullism","gaullismule":"gaullism","gaullismului":"gaullism","gaullista":["gaullistă","gaullist","gaullista","gaullist"],"gaulliste":["gaulliste","gaullist","gaulliste","gaullistă"],"gaullistei":"gaullistă","gaullistele":["gaullistele","gaullist","gaullistele","gaullistă"],"gaullistelor":"gaullistă","gaullisti":"gaullist","gaullistii":"gaullist","gaullistilor":"gaullist","gaullistul":"gaullist","gaullistule":"gaullist","gaullistului":"gaullist","gauna":"găun","gaunasi":"găunaș","gaunasii":"găunaș","gaunasilor":"găunaș","gaunasite":"găunășită","gaunasitei":"găunășită","gaunasitele":"găunășită","gaunasitelor":"găunășită","gaunasul":"găunaș","gaunasule":"găunaș","gaunasului":"găunaș","gaune":"găun","gauneii":"găunei","gauneilor":"găunei","gauneiul":"găunei","gauneiule":"găunei","gauneiului":"găunei","gaunele":"găun","gaunelor":"găun","gauni":"găună","gaunoaie":"găunoi","gaunoaiele":"găunoi","gaunoaielor":"găunoi","gaunoasa":["găunoasă","găunos","găunoasa","găunos"],"gaunoase":"găunos","gaunoasele":"găunos","gaunoiul":"găunoi","gaunoiule":"găunoi","gaunoiului":"găunoi","gaunosaturi":"găunoșătură","gaunosaturii":"găunoșătură","gaunosaturile":"găunoșătură","gaunosaturilor":"găunoșătură","gaunosea":"găunoși","gaunoseai":"găunoși","gaunoseam":"găunoși","gaunoseati":"găunoși","gaunoseau":"găunoși","gaunosesc":"găunoși","gaunoseste":"găunoși","gaunosesti":"găunoși","gaunosi":"găunos","gaunosii":["găunoșii","găunos","găunoșii","găunoși"],"gaunosim":"găunoși","gaunosind":"găunoși","gaunosira":"găunoși","gaunosiram":"găunoși","gaunosirati":"găunoși","gaunosise":"găunoși","gaunosisem":"găunoși","gaunosisera":"găunoși","gaunosiseram":"găunoși","gaunosiserati":"găunoși","gaunosisesi":"găunoși","gaunosisi":"găunoși","gaunosit":"găunoși","gaunositi":"găunoși","gaunosituri":"găunoșitură","gaunositurii":"găunoșitură","gaunositurile":"găunoșitură","gaunositurilor":"găunoșitură","gaunosul":"găunos","gaunul":"găun","gaunule":"găun","gaunului":"găun","gaurea":"găuri","gaureai":"găuri","gauream":"găuri","gaureati":"găuri","gaureau":"găuri","gaureaua":"găurea","gaurele":"găurea","gaurelei":"găurea","gaurelele":"găurea","gaurelelor":"găurea","gauresc":"găuri","gaureste":"găuri","gauresti":"găuri","gauri":["gauri","gaur","găuri","gaură"],"gauri negre":"gaură neagră","gaurice":"găurică","gauricea":"găurice","gauricei":"găurică","gauricele":"găurică","gauricelor":"găurică","gaurici":["găurici","găurică","găurici","găurice"],"gauricii":"găurice","gauricile":"găurice","gauricilor":"găurice","gaurii":["gaurii","gaur","găurii","gaură","găurii","găuri"],"gaurile":"gaură","gaurilor":["gaurilor","gaur","găurilor","gaură"],"gaurim":"găuri","gaurind":"găuri","gaurira":"găuri","gauriram":"găuri","gaurirati":"găuri","gaurirea":"găurire","gauriri":"găurire","gauririi":"găurire","gauririle":"găurire","gauririlor":"găurire","gaurise":"găuri","gaurisem":"găuri","gaurisera":"găuri","gauriseram":"găuri","gauriserati":"găuri","gaurisesi":"găuri","gaurisi":"găuri","gaurit":"găuri","gaurita":["găurită","găurit","găurita","găurit"],"gaurite":"găurit","gauritele":"găurit","gauriti":["găuriți","găuri","găuriți","găurit"],"gauritii":"găurit","gauritoarea":"găuritoare","gauritoarei":"găuritoare","gauritoarele":"găuritoare","gauritoarelor":"găuritoare","gauritori":"găuritor","gauritul":"găurit","gaurituri":"găuritură","gauriturii":"găuritură","gauriturile":"găuritură","gauriturilor":"găuritură","gauroaie":"găuroi","gauroaiele":"găuroi","gauroaielor":"găuroi","gauroasa":["găuroasă","găuros","găuroasa","găuros"],"gauroase":"găuros","gauroasele":"găuros","gauroiul":"găuroi","gauroiule":"găuroi","gauroiului":"găuroi","gaurosi":"găuros","gaurosii":"găuros","gaurosul":"găuros","gaurul":"gaur","gaurule":"gaur","gaurului":"gaur","gaurute":"găuruță","gaurutei":"găuruță","gaurutele":"găuruță","gaurutelor":"găuruță","gausi":"gauss","gausii":"gauss","gausilor":"gauss","gaussmetre":"gaussmetru","gaussmetrele":"gaussmetru","gaussmetrelor":"gaussmetru","gaussmetruul":"gaussmetru","gaussmetruule":"gaussmetru","gaussmetruului":"gaussmetru","gaussul":"gauss","gaussule":"gauss","gaussului":"gauss","gavaje":"gavaj","gavajele":"gavaj","gavajelor":"gavaj","gavajul":"gavaj","gavajule":"gavaj","gavajului":"gavaj","gavalia":"găvălie","gavaliei":"găvălie","gavalii":"găvălie","gavaliile":"găvălie","gavaliilor":"găvălie","gavanata":["găvănată","găvănat","găvănata","găvănat"],"gavanate":"găvănat","gavanatele":"găvănat","gavanati":"găvănat","gavanatii":"găvănat","gavanatul":"găvănat","gavanaturi":"găvănătură","gavanaturii":"găvănătură","gavanaturile":"găvănătură","gavanaturilor":"găvănătură","gavane":"găvan","gavanele":"găvan","gavanelor":"găvan","gavanoase":"gavanos","gavanoasele":"gavanos","gavanoaselor":"gavanos","gavanosele":["gavanoșele","gavanoșel","găvănoșele","găvănoșel"],"gavanoselele":"găvănoșel","gavanoselelor":"găvănoșel","gavanoselul":"găvănoșel","gavanoselule":"găvănoșel","gavanoselului":"găvănoșel","gavanosita":["găvănoșită","găvănoșit","găvănoșita","găvănoșit"],"gavanosite":"găvănoșit","gavanositele":"găvănoșit","gavanositi":"găvănoșit","gavanositii":"găvănoșit","gavanositul":"găvănoșit","gavanosul":"gavanos","gavanosule":"gavanos","gavanosului":"gavanos","gavanul":"găvan","gavanule":"găvan","gavanului":"găvan","gavauna":"văgăună","gaviali":"gavial","gavialii":"gavial","gavialilor":"gavial","gavialul":"gavial","gavialule":"gavial","gavialului":"gavial","gavoazde":"găvozd","gavoazdele":"găvozd","gavoazdelor":"găvozd","gavote":"gavotă","gavotei":"gavotă","gavotele":"gavotă","gavotelor":"gavotă","gavozdea":"găvozdi","gavozdeai":"găvozdi","gavozdeam":"găvozdi","gavozdeati":"găvozdi","gavozdeau":"găvozdi","gavozdesc":"găvozdi","gavozdeste":"găvozdi","gavozdesti":"găvozdi","gavozdii":"găvozdi","gavozdim":"găvozdi","gavozdind":"găvozdi","gavozdira":"găvozdi","gavozdiram":"găvozdi","gavozdirati":"găvozdi","gavozdise":"găvozdi","gavozdisem":"găvozdi","gavozdisera":"găvozdi","gavozdiseram":"găvozdi","gavozdiserati":"găvozdi","gavozdisesi":"găvozdi","gavozdisi":"găvozdi","gavozdit":"găvozdi","gavozdita":["găvozdită","găvozdit","găvozdita","găvozdit"],"gavozdite":"găvozdit","gavozditele":"găvozdit","gavozditi":["găvozdiți","găvozdi","găvozdiți","găvozdit"],"gavozditii":"găvozdit","gavozditul":"găvozdit","gavozdul":"găvozd","gavozdule":"găvozd","gavozdului":"găvozd","gavozita":["găvozită","găvozit","găvozita","găvozit"],"gavozite":"găvozit","gavozitele":"găvozit","gavoziti":"găvozit","gavozitii":"găvozit","gavozitul":"găvozit","gazai":"gaza","gazam":["gazăm","gaza","gazam","gaza"],"gazand":"gaza","gazara":"gaza","gazaram":"gaza","gazarati":"gaza","gazarea":"gazare","gazari":["găzari","găzar","gazări","gazare"],"gazaria":"găzărie","gazariei":"găzărie","gazarii":["găzarii","găzar","gazării","gazare","găzării","găzărie"],"gazariile":"găzărie","gazariilor":"găzărie","gazarile":"gazare","gazarilor":["găzarilor","găzar","gazărilor","gazare"],"gazarul":"găzar","gazarule":"găzar","gazarului":"găzar","gazase":"gaza","gazasem":"gaza","gazasera":"gaza","gazaseram":"gaza","gazaserati":"gaza","gazasesi":"gaza","gazasi":"gaza","gazat":"gaza","gazata":["gazată","gazat","gazata","gazat"],"gazate":"gazat","gazatele":"gazat","gazati":["gazați","gaza","gazați","gazat"],"gazatii":"gazat","gazatul":"gazat","gazau":"gaza","gazbetonul":"gazbeton","gazbetonule":"gazbeton","gazbetonului":"gazbeton","gazdaci":"găzdac","gazdacia":"găzdăcie","gazdaciei":"găzdăcie","gazdacii":["găzdacii","găzdac","găzdăcii","găzdăcie"],"gazdaciile":"găzdăcie","gazdaciilor":"găzdăcie","gazdacilor":"găzdac","gazdacoiul":"găzdăcoi","gazdacoiule":"găzdăcoi","gazdacoiului":"găzdăcoi","gazdacul":"găzdac","gazdacule":"găzdac","gazdacului":"găzdac","gazdani":"găzdan","gazdanii":"găzdan","gazdanilor":"găzdan","gazdanul":"găzdan","gazdanule":"găzdan","gazdanului":"găzdan","gazdasagul":"găzdășag","gazdasagule":"găzdășag","gazdasagului":"găzdășag","gazdasaguri":"găzdășag","gazdasagurile":"găzdășag","gazdasagurilor":"găzdășag","gazdasi":"găzdaș","gazdasia":"găzdășie","gazdasiei":"găzdășie","gazdasii":["găzdașii","găzdaș","găzdășii","găzdășie"],"gazdasiile":"găzdășie","gazdasiilor":"găzdășie","gazdasilor":"găzdaș","gazdasul":"găzdaș","gazdasule":"găzdaș","gazdasului":"găzdaș","gazde":"gazdă","gazdei":"gazdă","gazdele":"gazdă","gazdelor":"gazdă","gazdisoare":"găzdișoară","gazdisoarei":"găzdișoară","gazdisoarele":"găzdișoară","gazdisoarelor":"găzdișoară","gazdite":"găzdiță","gazditei":"găzdiță","gazditele":"găzdiță","gazditelor":"găzdiță","gazdoaice":"găzdoaică","gazdoaicei":"găzdoaică","gazdoaicele":"găzdoaică","gazdoaicelor":"găzdoaică","gazdoii":"găzdoi","gazdoilor":"găzdoi","gazdoiul":"găzdoi","gazdoiule":"găzdoi","gazdoiului":"găzdoi","gazduia":"găzdui","gazduiai":"găzdui","gazduiam":"găzdui","gazduiati":"găzdui","gazduiau":"găzdui","gazduiesc":"găzdui","gazduieste":"găzdui","gazduiesti":"găzdui","gazduii":"găzdui","gazduim":"găzdui","gazduind":"găzdui","gazduira":"găzdui","gazduiram":"găzdui","gazduirati":"găzdui","gazduirea":"găzduire","gazduiri":"găzduire","gazduirii":"găzduire","gazduirile":"găzduire","gazduirilor":"găzduire","gazduise":"găzdui","gazduisem":"găzdui","gazduisera":"găzdui","gazduiseram":"găzdui","gazduiserati":"găzdui","gazduisesi":"găzdui","gazduisi":"găzdui","gazduit":"găzdui","gazduiti":"găzdui","gazduitori":"găzduitor","gazduitorii":"găzduitor","gazduitorilor":"găzduitor","gazduitorul":"găzduitor","gazduitorule":"găzduitor","gazduitorului":"găzduitor","gazduta":["găzduță","găzduț","găzduța","găzduț"],"gazdute":"găzduț","gazdutele":"găzduț","gazduti":"găzduț","gazdutii":"găzduț","gazdutul":"găzduț","gaze":["gaze","gaz","gâze","gâză"],"gaze cu efect de sera":"gaz cu efect de seră","gaze ideale":"gaz ideal","gaze naturale":"gaz natural","gaze nobile":"gaz nobil","gazeaza":"gaza","gazei":"gâză","gazeific":"gazeifica","gazeificai":"gazeifica","gazeificam":["gazeificăm","gazeifica","gazeificam","gazeifica"],"gazeificand":"gazeifica","gazeificara":"gazeifica","gazeificaram":"gazeifica","gazeificarati":"gazeifica","gazeificarea":"gazeificare","gazeificari":"gazeificare","gazeificarii":"gazeificare","gazeificarile":"gazeificare","gazeificarilor":"gazeificare","gazeificase":"gazeifica","gazeificasem":"gazeifica","gazeificasera":"gazeifica","gazeificaseram":"gazeifica","gazeificaserati":"gazeifica","gazeificasesi":"gazeifica","gazeificasi":"gazeifica","gazeificat":"gazeifica","gazeificati":"gazeifica","gazeificau":"gazeifica","gazeifici":"gazeifica","gazele":["gazele","gaz","gâzele","gâză","gazele","gazel","gazele","gazelă"],"gazelei":"gazelă","gazelele":["gazelele","gazel","gazelele","gazelă"],"gazelelor":["gazelelor","gazel","gazelelor","gazelă"],"gazelor":["gazelor","gaz","gâzelor","gâză"],"gazelul":"gazel","gazelule":"gazel","gazelului":"gazel","gazetarasi":"gazetăraș","gazetarasii":"gazetăraș","gazetarasilor":"gazetăraș","gazetarasul":"gazetăraș","gazetarasule":"gazetăraș","gazetarasului":"gazetăraș","gazetare":"gazetară","gazetareasca":["gazetărească","gazetăresc","gazetăreasca","gazetăresc"],"gazetarei":"gazetară","gazetarele":"gazetară","gazetarelor":"gazetară","gazetarescul":"gazetăresc","gazetaresti":"gazetăresc","gazetarestii":"gazetăresc","gazetarestile":"gazetăresc","gazetari":"gazetar","gazetaria":"gazetărie","gazetariei":"gazetărie","gazetarii":["gazetarii","gazetar","gazetării","gazetărie"],"gazetarilor":"gazetar","gazetarul":"gazetar","gazetarule":"gazetar","gazetarului":"gazetar","gazete":"gazetă","gazete de perete":"gazetă de perete","gazetei":"gazetă","gazetele":"gazetă","gazetelor":"gazetă","gazeuri":"gazeu","gazeurile":"gazeu","gazeurilor":"gazeu","gazeuul":"gazeu","gazeuule":"gazeu","gazeuului":"gazeu","gazez":"gaza","gazezi":"gaza","gazi":"gâde","gazifera":["gaziferă","gazifer","gazifera","gazifer"],"gazifere":"gazifer","gaziferele":"gazifer","gaziferi":"gazifer","gaziferii":"gazifer","gaziferul":"gazifer","gazific":"gazifica","gazificai":"gazifica","gazificam":["gazificăm","gazifica","gazificam","gazifica"],"gazificand":"gazifica","gazificara":"gazifica","gazificaram":"gazifica","gazificarati":"gazifica","gazificarea":"gazificare","gazificari":"gazificare","gazificarii":"gazificare","gazificarile":"gazificare","gazificarilor":"gazificare","gazificase":"gazifica","gazificasem":"gazifica","gazificasera":"gazifica","gazificaseram":"gazifica","gazificaserati":"gazifica","gazificasesi":"gazifica","gazificasi":"gazifica","gazificat":"gazifica","gazificati":"gazifica","gazificatoare":"gazificator","gazificatoarele":"gazificator","gazificatoarelor":"gazificator","gazificatorul":"gazificator","gazificatorule":"gazificator","gazificatorului":"gazificator","gazificau":"gazifica","gazifici":"gazifica","gazii":"gâde","gazilor":"gâde","gazoanalizatoare":"gazoanalizator","gazoanalizatoarele":"gazoanalizator","gazoanalizatoarelor":"gazoanalizator","gazoanalizatorul":"gazoanalizator","gazoanalizatorule":"gazoanalizator","gazoanalizatorului":"gazoanalizator","gazoasa":["gazoasă","gazos","gazoasa","gazos"],"gazoase":"gazos","gazoasele":"gazos","gazobute":"gâzobuță","gazobutei":"gâzobuță","gazobutele":"gâzobuță","gazobutelor":"gâzobuță","gazoducte":"gazoduct","gazoductele":"gazoduct","gazoductelor":"gazoduct","gazoductul":"gazoduct","gazoductule":"gazoduct","gazoductului":"gazoduct","gazofilachia":"gazofilachie","gazofilachiei":"gazofilachie","gazofilachii":"gazofilachie","gazofilachiile":"gazofilachie","gazofilachiilor":"gazofilachie","gazogene":"gazogen","gazogenele":"gazogen","gazogenelor":"gazogen","gazogenul":"gazogen","gazogenule":"gazogen","gazogenului":"gazogen","gazoline":"gazolină","gazolinei":"gazolină","gazolinele":"gazolină","gazolinelor":"gazolină","gazometre":"gazometru","gazometrele":"gazometru","gazometrelor":"gazometru","gazometria":"gazometrie","gazometrica":["gazometrică","gazometric","gazometrica","gazometric"],"gazometrice":"gazometric","gazometricele":"gazometric","gazometrici":"gazometric","gazometricii":"gazometric","gazometricul":"gazometric","gazometriei":"gazometrie","gazometrii":"gazometrie","gazometriile":"gazometrie","gazometriilor":"gazometrie","gazometrul":"gazometru","gazometrule":"gazometru","gazometrului":"gazometru","gazonai":"gazona","gazonam":["gazonăm","gazona","gazonam","gazona"],"gazonand":"gazona","gazonara":"gazona","gazonaram":"gazona","gazonarati":"gazona","gazonarea":"gazonare","gazonari":"gazonare","gazonarii":"gazonare","gazonarile":"gazonare","gazonarilor":"gazonare","gazonase":"gazona","gazonasem":"gazona","gazonasera":"gazona","gazonaseram":"gazona","gazonaserati":"gazona","gazonasesi":"gazona","gazonasi":"gazona","gazonat":"gazona","gazonata":["gazonată","gazonat","gazonata","gazonat"],"gazonate":"gazonat","gazonatele":"gazonat","gazonati":["gazonați","gazona","gazonați","gazonat"],"gazonatii":"gazonat","gazonatul":"gazonat","gazonau":"gazona","gazoneaza":"gazona","gazonez":"gazona","gazonezi":"gazona","gazonul":"gazon","gazonule":"gazon","gazonului":"gazon","gazonuri artificiale":"gazon artificial","gazonuri sintetice":"gazon sintetic","gazornite":"gazorniță","gazornitei":"gazorniță","gazornitele":"gazorniță","gazornitelor":"gazorniță","gazoscoape":"gazoscop","gazoscoapele":"gazoscop","gazoscoapelor":"gazoscop","gazoscopul":"gazoscop","gazoscopule":"gazoscop","gazoscopului":"gazoscop","gazosi":"gazos","gazosii":"gazos","gazosul":"gazos","gazul":"gaz","gazule":"gaz","gazulia":"gâzulie","gazuliei":"gâzulie","gazulii":"gâzulie","gazuliile":"gâzulie","gazuliilor":"gâzulie","gazulite":"gâzuliță","gazulitei":"gâzuliță","gazulitele":"gâzuliță","gazulitelor":"gâzuliță","gazului":"gaz","gazute":"gâzuță","gazutei":"gâzuță","gazutele":"gâzuță","gazutelor":"gâzuță","geacul":"geac","geacule":"geac","geacului":"geac","geacuri":"geac","geacurile":"geac","geacurilor":"geac","gealaie":"gealău","gealaiele":"gealău","gealaielor":"gealău","gealati":"gealat","gealatii":"gealat","gealatilor":"gealat","gealatul":"gealat","gealatule":"gealat","gealatului":"gealat","gealauul":"gealău","gealauule":"gealău","gealauului":"gealău","geama":"geme","geamale":"geamală","geamalei":"geamală","geamalele":"geamală","geamalelor":"geamală","geamana":["geamănă","geamăn","geamăna","geamăn"],"geamandane":"geamandan","geamanduri":"geamandură","geamandurii":"geamandură","geamandurile":"geamandură","geamandurilor":"geamandură","geamane":"geamănă","geamanei":"geamănă","geamanele":"geamănă","geamanelor":"geamănă","geamantanase":["geamantanașe","geamantanaș","geamantănașe","geamantănaș"],"geamantanasele":["geamantanașele","geamantanaș","geamantănașele","geamantănaș"],"geamantanaselor":["geamantanașelor","geamantanaș","geamantănașelor","geamantănaș"],"geamantanasul":["geamantanașul","geamantanaș","geamantănașul","geamantănaș"],"geamantanasule":["geamantanașule","geamantanaș","geamantănașule","geamantănaș"],"geamantanasului":["geamantanașului","geamantanaș","geamantănașului","geamantănaș"],"geamantane":"geamantan","geamantanele":"geamantan","geamantanelor":"geamantan","geamantanul":"geamantan","geamantanule":"geamantan","geamantanului":"geamantan","geamanul":"geamăn","geamatul":"geamăt","geamatule":"geamăt","geamatului":"geamăt","geambaralea":"geambarale","geambaralei":"geambarale","geambaralele":"geambarale","geambaralelor":"geambarale","geambasi":"geambaș","geambasia":"geambașie","geambasiei":"geambașie","geambasii":["geambașii","geambaș","geambașii","geambașie"],"geambasiile":"geambașie","geambasiilor":"geambașie","geambasilor":"geambaș","geambaslacul":"geambașlâc","geambaslacule":"geambașlâc","geambaslacului":"geambașlâc","geambaslacuri":"geambașlâc","geambaslacurile":"geambașlâc","geambaslacurilor":"geambașlâc","geambasul":"geambaș","geambasule":"geambaș","geambasului":"geambaș","geamgii":"geamgiu","geamgiii":"geamgiu","geamgiilor":"geamgiu","geamgiul":"geamgiu","geamgiule":"geamgiu","geamgiului":"geamgiu","geamia":"geamie","geamiei":"geamie","geamii":"geamie","geamiile":"geamie","geamiilor":"geamie","geamlacul":"geamlâc","geamlacule":"geamlâc","geamlacului":"geamlâc","geamlacuri":"geamlâc","geamlacurile":"geamlâc","geamlacurilor":"geamlâc","geamparalele":"geamparale","geamparalelor":"geamparale","geamul":"geam","geamule":"geam","geamului":"geam","geamuri":"geam","geamurile":"geam","geamurilor":"geam","geanabeti":"geanabet","geanabetii":"geanabet","geanabetilor":"geanabet","geanabetul":"geanabet","geanabetule":"geanabet","geanabetului":"geanabet","gebegii":"gebegiu","gebegiii":"gebegiu","gebegiilor":"gebegiu","gebegiuul":"gebegiu","gebegiuule":"gebegiu","gebegiuului":"gebegiu","gebhaneaua":"gebhanea","gebhanele":"gebhanea","gebhanelei":"gebhanea","gebhanelele":"gebhanea","gebhanelelor":"gebhanea","geci":"geacă","gecii":"geacă","gecile":"geacă","gecilor":"geacă","geckoul":"gecko","geckoule":"gecko","geckoului":"gecko","gelaie":"gelău","gelaiele":"gelău","gelaielor":"gelău","gelap":"gelăpi","gelape":"gelăpi","gelapea":"gelăpi","gelapeai":"gelăpi","gelapeam":"gelăpi","gelapeati":"gelăpi","gelapeau":"gelăpi","gelapie":"gelăpi","gelapii":"gelăpi","gelapim":"gelăpi","gelapind":"gelăpi","gelapira":"gelăpi","gelapiram":"gelăpi","gelapirati":"gelăpi","gelapise":"gelăpi","gelapisem":"gelăpi","gelapisera":"gelăpi","gelapiseram":"gelăpi","gelapiserati":"gelăpi","gelapisesi":"gelăpi","gelapisi":"gelăpi","gelapit":"gelăpi","gelapiti":"gelăpi","gelati":"gelat","gelatia":"gelație","gelatiei":"gelație","gelatii":["gelații","gelat","gelații","gelație"],"gelatiile":"gelație","gelatiilor":"gelație","gelatilor":"gelat","gelatine":"gelatină","gelatinei":"gelatină","gelatinele":"gelatină","gelatinelor":"gelatină","gelatinizai":"gelatiniza","gelatinizam":["gelatinizăm","gelatiniza","gelatinizam","gelatiniza"],"gelatinizand":"gelatiniza","gelatinizara":"gelatiniza","gelatinizaram":"gelatiniza","gelatinizarati":"gelatiniza","gelatinizarea":"gelatinizare","gelatinizari":"gelatinizare","gelatinizarii":"gelatinizare","gelatinizarile":"gelatinizare","gelatinizarilor":"gelatinizare","gelatinizase":"gelatiniza","gelatinizasem":"gelatiniza","gelatinizasera":"gelatiniza","gelatinizaseram":"gelatiniza","gelatinizaserati":"gelatiniza","gelatinizasesi":"gelatiniza","gelatinizasi":"gelatiniza","gelatinizat":"gelatiniza","gelatinizati":"gelatiniza","gelatinizau":"gelatiniza","gelatinizeaza":"gelatiniza","gelatinizez":"gelatiniza","gelatinizezi":"gelatiniza","gelatinoasa":["gelatinoasă","gelatinos","gelatinoasa","gelatinos"],"gelatinoase":"gelatinos","gelatinoasele":"gelatinos","gelatinosi":"gelatinos","gelatinosii":"gelatinos","gelatinosul":"gelatinos","gelatul":"gelat","gelatule":"gelat","gelatului":"gelat","gelauul":"gelău","gelauule":"gelău","gelauului":"gelău","gelepcii":"gelepciu","gelepciii":"gelepciu","gelepciilor":"gelepciu","gelepciuul":"gelepciu","gelepciuule":"gelepciu","gelepciuului":"gelepciu","gelific":"gelifica","gelificai":"gelifica","gelificam":["gelificăm","gelifica","gelificam","gelifica"],"gelificand":"gelifica","gelificara":"gelifica","gelificaram":"gelifica","gelificarati":"gelifica","gelificarea":"gelificare","gelificari":"gelificare","gelificarii":"gelificare","gelificarile":"gelificare","gelificarilor":"gelificare","gelificase":"gelifica","gelificasem":"gelifica","gelificasera":"gelifica","gelificaseram":"gelifica","gelificaserati":"gelifica","gelificasesi":"gelifica","gelificasi":"gelifica","gelificat":"gelifica","gelificati":"gelifica","gelificau":"gelifica","gelifice":"gelifica","gelifici":"gelifica","gelifractia":"gelifracție","gelifractiei":"gelifracție","gelifractii":"gelifracție","gelivatia":"gelivație","gelivatiei":"gelivație","gelivatii":"gelivație","gelivatiile":"gelivație","gelivatiilor":"gelivație","gelivitatea":"gelivitate","gelivitati":"gelivitate","gelivitatii":"gelivitate","gelivitatile":"gelivitate","gelivitatilor":"gelivitate","geloasa":["geloasă","gelos","geloasa","gelos"],"geloase":"gelos","geloasele":"gelos","gelosi":"gelos","gelosii":"gelos","gelosul":"gelos","geloze":"geloză","gelozei":"geloză","gelozele":"geloză","gelozelor":"geloză","gelozia":"gelozie","geloziei":"gelozie","gelozii":"gelozie","geloziile":"gelozie","geloziilor":"gelozie","gelul":"gel","gelule":"gel","gelului":"gel","geluri":"gel","gelurile":"gel","gelurilor":"gel","gem":"geme","gemanara":["gemănară","gemănar","gemănara","gemănar"],"gemanare":"gemănar","gemanarea":"gemănare","gemanarele":"gemănar","gemanari":["gemănari","gemănar","gemănări","gemănare"],"gemanarii":["gemănarii","gemănar","gemănării","gemănare"],"gemanarile":"gemănare","gemanarilor":["gemănarilor","gemănar","gemănărilor","gemănare"],"gemanarul":"gemănar","gemanarule":"gemănar","gemanarului":"gemănar","gemanasi":"gemănaș","gemanasii":"gemănaș","gemanasilor":"gemănaș","gemanasul":"gemănaș","gemanasule":"gemănaș","gemanasului":"gemănaș","gemand":"geme","gemat":"geamăt","gematoare":"gemător","gematoarea":"gemător","gematoarele":"gemător","gematori":"gemător","gematorii":"gemător","gematorul":"gemător","gematuri":"gemătură","gematurii":"gemătură","gematurile":"gemătură","gematurilor":"gemătură","geme":"gemă","gemea":"geme","gemeai":"geme","gemeam":"geme","gemeati":"geme","gemeau":"geme","gemei":"gemă","gemelara":["gemelară","gemelar","gemelara","gemelar"],"gemelare":"gemelar","gemelarele":"gemelar","gemelari":"gemelar","gemelarii":"gemelar","gemelarul":"gemelar","gemele":"gemă","gemelipare":"gemelipară","gemeliparei":"gemelipară","gemeliparele":"gemelipară","gemeliparelor":"gemelipară","gemelitatati":"gemelitate","gemelitatatii":"gemelitate","gemelitatatile":"gemelitate","gemelitatatilor":"gemelitate","gemelitatea":"gemelitate","gemelor":"gemă","gemem":"geme","gemen":"geamăn","gemena":["gemenă","gemen","gemena","gemen"],"gemene":["gemene","geamăn","gemene","gemen"],"gemene siameze":"geamănă siameză","gemenele":["gemenele","geamăn","gemenele","gemen"],"gemeni":["gemeni","geamăn","gemeni","gemen"],"gemeni siamezi":"geamăn siamez","gemenii":["gemenii","geamăn","gemenii","gemen"],"gemenul":"gemen","gemete":["gemete","geamăt","gemete","gemăt","gemete","gemet"],"gemetele":"geamăt","gemetelor":"geamăt","gemeti":"geme","gemi":"geme","gemina":["gemină","gemin","gemina","gemin"],"geminata":["geminată","geminat","geminata","geminat"],"geminate":"geminat","geminatele":"geminat","geminati":"geminat","geminatia":"geminație","geminatiei":"geminație","geminatii":["geminații","geminat","geminații","geminație"],"geminatiile":"geminație","geminatiilor":"geminație","geminatiunea":"geminațiune","geminatiuni":"geminațiune","geminatiunii":"geminațiune","geminatiunile":"geminațiune","geminatiunilor":"geminațiune","geminatul":"geminat","gemine":"gemin","geminele":"gemin","gemini":"gemin","geminii":"gemin","geminul":"gemin","gemipara":["gemipară","gemipar","gemipara","gemipar"],"gemipare":"gemipar","gemiparele":"gemipar","gemipari":"gemipar","gemiparii":"gemipar","gemiparul":"gemipar","gemu":"geme","gemui":"geme","gemul":"gem","gemule":["gemule","gem","gemule","gemulă"],"gemulei":"gemulă","gemulele":"gemulă","gemulelor":"gemulă","gemulete":"gemuleț","gemuletele":"gemuleț","gemuletelor":"gemuleț","gemuletul":"gemuleț","gemuletule":"gemuleț","gemuletului":"gemuleț","gemului":"gem","gemura":"geme","gemuram":"geme","gemurati":"geme","gemuri":"gem","gemurile":"gem","gemurilor":"gem","gemuse":"geme","gemusem":"geme","gemusera":"geme","gemuseram":"geme","gemuserati":"geme","gemusesi":"geme","gemusi":"geme","gemut":"geme","gemutul":"gemut","gemutule":"gemut","gemutului":"gemut","genata":["genată","genat","genata","genat"],"genate":"genat","genatele":"genat","genati":"genat","genatii":"genat","genatul":"genat","gendarmi":"gendarm","gendarmii":"gendarm","gendarmilor":"gendarm","gendarmul":"gendarm","gendarmule":"gendarm","gendarmului":"gendarm","gene":["gene","geană","gene","genă"],"genealoge":"genealogă","genealogei":"genealogă","genealogele":"genealogă","genealogelor":"genealogă","genealogi":"genealog","genealogia":"genealogie","genealogica":["genealogică","genealogic","genealogica","genealogic"],"genealogice":"genealogic","genealogiceasca":["genealogicească","genealogicesc","genealogiceasca","genealogicesc"],"genealogicele":"genealogic","genealogicescul":"genealogicesc","genealogicesti":"genealogicesc","genealogicestii":"genealogicesc","genealogicestile":"genealogicesc","genealogici":"genealogic","genealogicii":"genealogic","genealogicul":"genealogic","genealogiei":"genealogie","genealogii":["genealogii","genealog","genealogii","genealogie"],"genealogiile":"genealogie","genealogiilor":"genealogie","genealogilor":"genealog","genealogiste":"genealogistă","genealogistei":"genealogistă","genealogistele":"genealogistă","genealogistelor":"genealogistă","genealogisti":"genealogist","genealogistii":"genealogist","genealogistilor":"genealogist","genealogistul":"genealogist","genealogistule":"genealogist","genealogistului":"genealogist","genealogul":"genealog","genealogule":"genealog","genealogului":"genealog","genei":["genei","geană","genei","genă"],"genele":["genele","geană","genele","genă"],"genelor":["genelor","geană","genelor","genă"],"generai":"genera","generala":["generală","general","generala","general"],"generale":"general","generalele":"general","generalese":"generăleasă","generalesei":"generăleasă","generalesele":"generăleasă","generaleselor":"generăleasă","generali":"general","generali de brigada":"general de brigadă","generalii":"general","generalilor":"general","generalisimi":"generalisim","generalisimii":"generalisim","generalisimilor":"generalisim","generalisimul":"generalisim","generalisimule":"generalisim","generalisimului":"generalisim","generaliste":"generalistă","generalistei":"generalistă","generalistele":"generalistă","generalistelor":"generalistă","generalisti":"generalist","generalistii":"generalist","generalistilor":"generalist","generalistul":"generalist","generalistule":"generalist","generalistului":"generalist","generalitatea":"generalitate","generalitati":"generalitate","generalitatii":"generalitate","generalitatile":"generalitate","generalitatilor":"generalitate","generalizabila":["generalizabilă","generalizabil","generalizabila","generalizabil"],"generalizabile":"generalizabil","generalizabilele":"generalizabil","generalizabili":"generalizabil","generalizabilii":"generalizabil","generalizabilul":"generalizabil","generalizai":"generaliza","generalizam":["generalizăm","generaliza","generalizam","generaliza"],"generalizand":"generaliza","generalizara":"generaliza","generalizaram":"generaliza","generalizarati":"generaliza","generalizarea":"generalizare","generalizari":"generalizare","generalizarii":"generalizare","generalizarile":"generalizare","generalizarilor":"generalizare","generalizase":"generaliza","generalizasem":"generaliza","generalizasera":"generaliza","generalizaseram":"generaliza","generalizaserati":"generaliza","generalizasesi":"generaliza","generalizasi":"generaliza","generalizat":"generaliza","generalizata":["generalizată","generalizat","generalizata","generalizat"],"generalizate":"generalizat","generalizatele":"generalizat","generalizati":["generalizați","generaliza","generalizați","generalizat"],"generalizatii":"generalizat","generalizatoare":"generalizator","generalizatoarea":"generalizator","generalizatoarele":"generalizator","generalizatori":"generalizator","generalizatorii":"generalizator","generalizatorul":"generalizator","generalizatul":"generalizat","generalizau":"generaliza","generalizeaza":"generaliza","generalizez":"generaliza","generalizezi":"generaliza","generalul":"general","generalule":"general","generalului":"general","generam":["generăm","genera","generam","genera"],"generand":"genera","generara":"genera","generaram":"genera","generarati":"genera","generarea":"generare","generari":"generare","generarii":"generare","generarile":"generare","generarilor":"generare","generase":"genera","generasem":"genera","generasera":"genera","generaseram":"genera","generaserati":"genera","generasesi":"genera","generasi":"genera","generat":"genera","generata":["generată","generat","generata","generat"],"generate":"generat","generatele":"generat","generati":["generați","genera","generați","generat"],"generatia":"generație","generatiei":"generație","generatii":["generații","generat","generații","generație"],"generatiile":"generație","generatiilor":"generație","generatiunea":"generațiune","generatiuni":"generațiune","generatiunii":"generațiune","generatiunile":"generațiune","generatiunilor":"generațiune","generativa":["generativă","generativ","generativa","generativ"],"generative":"generativ","generativele":"generativ","generativi":"generativ","generativii":"generativ","generativismul":"generativism","generativismule":"generativism","generativismului":"generativism","generativista":["generativistă","generativist","generativista","generativist"],"generativiste":["generativiste","generativist","generativiste","generativistă"],"generativistei":"generativistă","generativistele":["generativistele","generativist","generativistele","generativistă"],"generativistelor":"generativistă","generativisti":"generativist","generativistii":"generativist","generativistul":"generativist","generativul":"generativ","generatoare":"generator","generatoarea":"generator","generatoarele":"generator","generatoarelor":"generator","generatori":"generator","generatorii":"generator","generatorul":"generator","generatorule":"generator","generatorului":"generator","generatricea":"generatrice","generatricei":"generatrice","generatricele":"generatrice","generatricelor":"generatrice","generatul":"generat","generau":"genera","genereaza":"genera","genereul":"genere","genereule":"genere","genereului":"genere","generez":"genera","generezi":"genera","generica":["generică","generic","generica","generic"],"generice":"generic","genericele":"generic","genericelor":"generic","generici":"generic","genericii":"generic","genericul":"generic","genericule":"generic","genericului":"generic","generoasa":["generoasă","generos","generoasa","generos"],"generoase":"generos","generoasele":"generos","generosi":"generos","generosii":"generos","generosul":"generos","generozitatea":"generozitate","generozitati":"generozitate","generozitatii":"generozitate","genetica":["genetică","genetic","genetica","genetic"],"genetice":"genetic","geneticele":"genetic","genetici":["genetici","genetic","genetici","genetică"],"geneticianul":"genetician","geneticianule":"genetician","geneticianului":"genetician","geneticiene":"geneticiană","geneticienei":"geneticiană","geneticienele":"geneticiană","geneticienelor":"geneticiană","geneticieni":"genetician","geneticienii":"genetician","geneticienilor":"genetician","geneticii":["geneticii","genetic","geneticii","genetică"],"geneticul":"genetic","genetista":["genetistă","genetist","genetista","genetist"],"genetiste":["genetiste","genetist","genetiste","genetistă"],"genetistei":"genetistă","genetistele":["genetistele","genetist","genetistele","genetistă"],"genetistelor":"genetistă","genetisti":"genetist","genetistii":"genetist","genetistul":"genetist","genetive":"genetiv","genetivele":"genetiv","genetivelor":"genetiv","genetivul":"genetiv","genetivule":"genetiv","genetivului":"genetiv","geneze":"geneză","genezei":"geneză","genezele":"geneză","genezelor":"geneză","genezica":["genezică","genezic","genezica","genezic"],"genezice":"genezic","genezicele":"genezic","genezici":"genezic","genezicii":"genezic","genezicul":"genezic","geneziologia":"geneziologie","geneziologiei":"geneziologie","geneziologii":"geneziologie","geniala":["genială","genial","geniala","genial"],"geniale":"genial","genialele":"genial","geniali":"genial","genialii":"genial","genialitatea":"genialitate","genialitati":"genialitate","genialitatii":"genialitate","genialul":"genial","geniculata":["geniculată","geniculat","geniculata","geniculat"],"geniculate":"geniculat","geniculatele":"geniculat","geniculati":"geniculat","geniculatii":"geniculat","geniculatul":"geniculat","genii":"geniu","geniile":"geniu","geniilor":"geniu","genisti":["geniști","genist","genisti","genist"],"genistii":"genist","genistilor":"genist","genistul":"genist","genistule":"genist","genistului":"genist","genitala":["genitală","genital","genitala","genital"],"genitale":"genital","genitalele":"genital","genitali":"genital","genitalii":"genital","genitalul":"genital","genite":"geniță","genitei":"geniță","genitele":"geniță","genitelor":"geniță","genitivala":["genitivală","genitival","genitivala","genitival"],"genitivale":"genitival","genitivalele":"genitival","genitivali":"genitival","genitivalii":"genitival","genitivalul":"genitival","genitive":"genitiv","genitivele":"genitiv","genitivelor":"genitiv","genitivul":"genitiv","genitivule":"genitiv","genitivului":"genitiv","genito-urinara":["genito-urinară","genito-urinar","genito-urinara","genito-urinar"],"genito-urinare":"genito-urinar","genito-urinarele":"genito-urinar","genito-urinari":"genito-urinar","genito-urinarii":"genito-urinar","genito-urinarul":"genito-urinar","genitori":"genitor","genitorii":"genitor","genitorilor":"genitor","genitorul":"genitor","genitorule":"genitor","genitorului":"genitor","geniul":"geniu","geniule":"geniu","geniului":"geniu","genoame":"genom","genoamele":"genom","genoamelor":"genom","genoasa":["genoasă","genos","genoasa","genos"],"genoase":"genos","genoasele":"genos","genocidul":"genocid","genocidule":"genocid","genocidului":"genocid","genociduri":"genocid","genocidurile":"genocid","genocidurilor":"genocid","genofondul":"genofond","genofondule":"genofond","genofondului":"genofond","genofonduri":"genofond","genofondurile":"genofond","genofondurilor":"genofond","genomul":"genom","genomule":"genom","genomului":"genom","genosi":"genos","genosii":"genos","genosul":"genos","genotipica":["genotipică","genotipic","genotipica","genotipic"],"genotipice":"genotipic","genotipicele":"genotipic","genotipici":"genotipic","genotipicii":"genotipic","genotipicul":"genotipic","genotipul":"genotip","genotipule":"genotip","genotipului":"genotip","genotipuri":"genotip","genotipurile":"genotip","genotipurilor":"genotip","genoveza":["genoveză","genovez","genoveza","genovez"],"genoveze":"genovez","genovezele":"genovez","genovezi":"genovez","genovezii":"genovez","genovezul":"genovez","genti":"geantă","gentiane":"gențiană","gentianei":"gențiană","gentianele":"gențiană","gentianelor":"gențiană","gentii":"geantă","gentila":["gentilă","gentil","gentila","gentil"],"gentile":["gențile","geantă","gentile","gentil"],"gentilele":"gentil","gentiletea":"gentilețe","gentiletei":"gentilețe","gentili":"gentil","gentilica":["gentilică","gentilic","gentilica","gentilic"],"gentilice":"gentilic","gentilicele":"gentilic","gentilici":"gentilic","gentilicii":"gentilic","gentilicul":"gentilic","gentilii":"gentil","gentilomi":"gentilom","gentilomii":"gentilom","gentilomilor":"gentilom","gentilomul":"gentilom","gentilomule":"gentilom","gentilomului":"gentilom","gentilor":"geantă","gentilul":"gentil","gentlemanul":"gentleman","gentlemanule":"gentleman","gentlemanului":"gentleman","gentlemeni":"gentleman","gentlemenii":"gentleman","gentlemenilor":"gentleman","gentulite":"gentuliță","gentulitei":"gentuliță","gentulitele":"gentuliță","gentulitelor":"gentuliță","gentute":"gentuță","gentutei":"gentuță","gentutele":"gentuță","gentutelor":"gentuță","genuchi":["genuchi","genuche","genuchi","genunchi"],"genuchii":"genuchi","genuchilor":"genuchi","genuchiul":"genuchi","genuchiule":"genuchi","genuchiului":"genuchi","genuflexiunea":"genuflexiune","genuflexiunei":"genuflexiune","genuflexiunele":"genuflexiune","genuflexiunelor":"genuflexiune","genuflexiuni":"genuflexiune","genuina":["genuină","genuin","genuina","genuin"],"genuine":"genuin","genuinele":"genuin","genuini":"genuin","genuinii":"genuin","genuinitatea":"genuinitate","genuinitati":"genuinitate","genuinitatii":"genuinitate","genuinul":"genuin","genul":"gen","genule":"gen","genuliere":"genulieră","genulierei":"genulieră","genului":"gen","genuna":"genune","genunchele":"genunche","genunchelui":"genunche","genunchere":"genuncher","genuncherele":"genuncher","genuncherelor":"genuncher","genuncherul":"genuncher","genuncherule":"genuncher","genuncherului":"genuncher","genunchi":"genunche","genunchiere":"genunchieră","genunchierei":"genunchieră","genunchierele":"genunchieră","genunchierelor":"genunchieră","genunchii":["genunchii","genunche","genunchii","genunchi"],"genunchilor":["genunchilor","genunche","genunchilor","genunchi"],"genunchiul":"genunchi","genunchiule":"genunchi","genunchiului":"genunchi","genunea":"genune","genuni":["genuni","genună","genuni","genune"],"genunii":["genunii","genună","genunii","genune"],"genunile":["genunile","genună","genunile","genune"],"genunilor":["genunilor","genună","genunilor","genune"],"genuri":"gen","genurile":"gen","genurilor":"gen","geobiologia":"geobiologie","geobiologiei":"geobiologie","geobiologii":"geobiologie","geobotanica":["geobotanică","geobotanic","geobotanica","geobotanic"],"geobotanice":"geobotanic","geobotanicele":"geobotanic","geobotanici":["geobotanici","geobotanic","geobotanici","geobotanică"],"geobotanicii":["geobotanicii","geobotanic","geobotanicii","geobotanică"],"geobotanicile":"geobotanică","geobotanicilor":"geobotanică","geobotanicul":"geobotanic","geobotaniste":"geobotanistă","geobotanistei":"geobotanistă","geobotanistele":"geobotanistă","geobotanistelor":"geobotanistă","geobotanisti":"geobotanist","geobotanistii":"geobotanist","geobotanistilor":"geobotanist","geobotanistul":"geobotanist","geobotanistule":"geobotanist","geobotanistului":"geobotanist","geocancerologia":"geocancerologie","geocancerologiei":"geocancerologie","geocancerologii":"geocancerologie","geocancerologiile":"geocancerologie","geocancerologiilor":"geocancerologie","geocentrica":["geocentrică","geocentric","geocentrica","geocentric"],"geocentrice":"geocentric","geocentricele":"geocentric","geocentrici":"geocentric","geocentricii":"geocentric","geocentricul":"geocentric","geocentrismul":"geocentrism","geocentrismule":"geocentrism","geocentrismului":"geocentrism","geochimia":"geochimie","geochimica":["geochimică","geochimic","geochimica","geochimic"],"geochimice":"geochimic","geochimicele":"geochimic","geochimici":"geochimic","geochimicii":"geochimic","geochimicul":"geochimic","geochimiei":"geochimie","geochimii":"geochimie","geochimiile":"geochimie","geochimiilor":"geochimie","geochimiste":"geochimistă","geochimistei":"geochimistă","geochimistele":"geochimistă","geochimistelor":"geochimistă","geochimisti":"geochimist","geochimistii":"geochimist","geochimistilor":"geochimist","geochimistul":"geochimist","geochimistule":"geochimist","geochimistului":"geochimist","geocriologia":"geocriologie","geocriologiei":"geocriologie","geocriologii":"geocriologie","geocriologiile":"geocriologie","geocriologiilor":"geocriologie","geocronologia":"geocronologie","geocronologiei":"geocronologie","geocronologii":"geocronologie","geode":"geodă","geodei":"geodă","geodele":"geodă","geodelor":"geodă","geodeze":"geodeză","geodezei":"geodeză","geodezele":"geodeză","geodezelor":"geodeză","geodezi":"geodez","geodezia":"geodezie","geodezica":["geodezică","geodezic","geodezica","geodezic"],"geodezice":"geodezic","geodezicele":"geodezic","geodezici":"geodezic","geodezicii":"geodezic","geodezicul":"geodezic","geodeziei":"geodezie","geodezii":["geodezii","geodez","geodezii","geodezie"],"geodeziile":"geodezie","geodeziilor":"geodezie","geodezilor":"geodez","geodezul":"geodez","geodezule":"geodez","geodezului":"geodez","geodimetre":"geodimetru","geodimetrele":"geodimetru","geodimetrelor":"geodimetru","geodimetrul":"geodimetru","geodimetrule":"geodimetru","geodimetrului":"geodimetru","geodinamica":["geodinamică","geodinamic","geodinamica","geodinamic"],"geodinamice":"geodinamic","geodinamicele":"geodinamic","geodinamici":["geodinamici","geodinamic","geodinamici","geodinamică"],"geodinamicii":["geodinamicii","geodinamic","geodinamicii","geodinamică"],"geodinamicile":"geodinamică","geodinamicilor":"geodinamică","geodinamicul":"geodinamic","geofagia":"geofagie","geofagiei":"geofagie","geofagii":"geofagie","geofite":"geofită","geofitei":"geofită","geofitele":"geofită","geofitelor":"geofită","geofizica":["geofizică","geofizic","geofizica","geofizic"],"geofizice":"geofizic","geofizicele":"geofizic","geofizici":["geofizici","geofizic","geofizici","geofizică"],"geofizicianul":"geofizician","geofizicianule":"geofizician","geofizicianului":"geofizician","geofiziciene":"geofiziciană","geofizicienei":"geofiziciană","geofizicienele":"geofiziciană","geofizicienelor":"geofiziciană","geofizicieni":"geofizician","geofizicienii":"geofizician","geofizicienilor":"geofizician","geofizicii":["geofizicii","geofizic","geofizicii","geofizică"],"geofizicile":"geofizică","geofizicilor":"geofizică","geofizicul":"geofizic","geofoane":"geofon","geofoanele":"geofon","geofoanelor":"geofon","geofonul":"geofon","geofonule":"geofon","geofonului":"geofon","geofotogrammetria":"geofotogrammetrie","geofotogrammetriei":"geofotogrammetrie","geofotogrammetrii":"geofotogrammetrie","geofotogrammetriile":"geofotogrammetrie","geofotogrammetriilor":"geofotogrammetrie","geogenia":"geogenie","geogenica":["geogenică","geogenic","geogenica","geogenic"],"geogenice":"geogenic","geogenicele":"geogenic","geogenici":"geogenic","geogenicii":"geogenic","geogenicul":"geogenic","geogeniei":"geogenie","geogenii":"geogenie","geogeniile":"geogenie","geogeniilor":"geogenie","geognosti":"geognost","geognostica":["geognostică","geognostic","geognostica","geognostic"],"geognostice":"geognostic","geognosticele":"geognostic","geognostici":"geognostic","geognosticii":"geognostic","geognosticul":"geognostic","geognostii":"geognost","geognostilor":"geognost","geognostul":"geognost","geognostule":"geognost","geognostului":"geognost","geognozia":"geognozie","geognozica":["geognozică","geognozic","geognozica","geognozic"],"geognozice":"geognozic","geognozicele":"geognozic","geognozici":"geognozic","geognozicii":"geognozic","geognozicul":"geognozic","geognoziei":"geognozie","geognozii":"geognozie","geografe":"geografă","geografei":"geografă","geografele":"geografă","geografelor":"geografă","geografi":"geograf","geografia":"geografie","geografica":["geografică","geografic","geografica","geografic"],"geografice":"geografic","geograficele":"geografic","geografici":"geografic","geograficii":"geografic","geograficul":"geografic"};
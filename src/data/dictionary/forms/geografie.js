@@ -0,0 +1 @@
+export default {"geografiei":"geografie","geografii":["geografii","geograf","geografii","geografie"],"geografiile":"geografie","geografiilor":"geografie","geografilor":"geograf","geograful":"geograf","geografule":"geograf","geografului":"geograf","geoidul":"geoid","geoidule":"geoid","geoidului":"geoid","geoizoterme":"geoizotermă","geoizotermei":"geoizotermă","geoizotermele":"geoizotermă","geoizotermelor":"geoizotermă","geologe":"geologă","geologei":"geologă","geologele":"geologă","geologelor":"geologă","geologi":"geolog","geologia":"geologie","geologica":["geologică","geologic","geologica","geologic"],"geologice":"geologic","geologiceasca":["geologicească","geologicesc","geologiceasca","geologicesc"],"geologicele":"geologic","geologicescul":"geologicesc","geologicesti":"geologicesc","geologicestii":"geologicesc","geologicestile":"geologicesc","geologici":"geologic","geologicii":"geologic","geologicul":"geologic","geologiei":"geologie","geologii":["geologii","geolog","geologii","geologie"],"geologilor":"geolog","geologul":"geolog","geologule":"geolog","geologului":"geolog","geomagnetica":["geomagnetică","geomagnetic","geomagnetica","geomagnetic"],"geomagnetice":"geomagnetic","geomagneticele":"geomagnetic","geomagnetici":"geomagnetic","geomagneticii":"geomagnetic","geomagneticul":"geomagnetic","geomagnetismul":"geomagnetism","geomagnetismule":"geomagnetism","geomagnetismului":"geomagnetism","geomantia":"geomanție","geomantica":["geomantică","geomantic","geomantica","geomantic"],"geomantice":"geomantic","geomanticele":"geomantic","geomantici":"geomantic","geomanticii":"geomantic","geomanticul":"geomantic","geomantiei":"geomanție","geomantii":"geomanție","geomecanice":"geomecanică","geomecanicei":"geomecanică","geomecanicele":"geomecanică","geomecanicelor":"geomecanică","geomedicine":"geomedicină","geomedicinei":"geomedicină","geometre":"geometră","geometrei":"geometră","geometrele":"geometră","geometrelor":"geometră","geometri":"geometru","geometria":"geometrie","geometrica":["geometrică","geometric","geometrica","geometric"],"geometrice":"geometric","geometricele":"geometric","geometrici":"geometric","geometricii":"geometric","geometricul":"geometric","geometriei":"geometrie","geometrii":["geometrii","geometrie","geometrii","geometru"],"geometrilor":"geometru","geometrismul":"geometrism","geometrismule":"geometrism","geometrismului":"geometrism","geometrizai":"geometriza","geometrizam":["geometrizăm","geometriza","geometrizam","geometriza"],"geometrizand":"geometriza","geometrizara":"geometriza","geometrizaram":"geometriza","geometrizarati":"geometriza","geometrizarea":"geometrizare","geometrizari":"geometrizare","geometrizarii":"geometrizare","geometrizarile":"geometrizare","geometrizarilor":"geometrizare","geometrizase":"geometriza","geometrizasem":"geometriza","geometrizasera":"geometriza","geometrizaseram":"geometriza","geometrizaserati":"geometriza","geometrizasesi":"geometriza","geometrizasi":"geometriza","geometrizat":"geometriza","geometrizata":["geometrizată","geometrizat","geometrizata","geometrizat"],"geometrizate":"geometrizat","geometrizatele":"geometrizat","geometrizati":["geometrizați","geometriza","geometrizați","geometrizat"],"geometrizatii":"geometrizat","geometrizatul":"geometrizat","geometrizau":"geometriza","geometrizeaza":"geometriza","geometrizez":"geometriza","geometrizezi":"geometriza","geometrografia":"geometrografie","geometrografiei":"geometrografie","geometrografii":"geometrografie","geometrografiile":"geometrografie","geometrografiilor":"geometrografie","geometrul":"geometru","geometrule":"geometru","geometrului":"geometru","geomorfia":"geomorfie","geomorfica":["geomorfică","geomorfic","geomorfica","geomorfic"],"geomorfice":"geomorfic","geomorficele":"geomorfic","geomorfici":"geomorfic","geomorficii":"geomorfic","geomorficul":"geomorfic","geomorfiei":"geomorfie","geomorfii":"geomorfie","geomorfiile":"geomorfie","geomorfiilor":"geomorfie","geomorfogenia":"geomorfogenie","geomorfogeniei":"geomorfogenie","geomorfogenii":"geomorfogenie","geomorfogeniile":"geomorfogenie","geomorfogeniilor":"geomorfogenie","geomorfologe":"geomorfologă","geomorfologei":"geomorfologă","geomorfologele":"geomorfologă","geomorfologelor":"geomorfologă","geomorfologi":"geomorfolog","geomorfologia":"geomorfologie","geomorfologica":["geomorfologică","geomorfologic","geomorfologica","geomorfologic"],"geomorfologice":"geomorfologic","geomorfologicele":"geomorfologic","geomorfologici":"geomorfologic","geomorfologicii":"geomorfologic","geomorfologicul":"geomorfologic","geomorfologiei":"geomorfologie","geomorfologii":["geomorfologii","geomorfolog","geomorfologii","geomorfologie"],"geomorfologilor":"geomorfolog","geomorfologul":"geomorfolog","geomorfologule":"geomorfolog","geomorfologului":"geomorfolog","geonime":"geonim","geonimele":"geonim","geonimelor":"geonim","geonimul":"geonim","geonimule":"geonim","geonimului":"geonim","geonomia":"geonomie","geonomica":["geonomică","geonomic","geonomica","geonomic"],"geonomice":"geonomic","geonomicele":"geonomic","geonomici":"geonomic","geonomicii":"geonomic","geonomicul":"geonomic","geonomiei":"geonomie","geonomii":"geonomie","geonomiile":"geonomie","geonomiilor":"geonomie","geopolitica":["geopolitică","geopolitic","geopolitica","geopolitic"],"geopolitice":"geopolitic","geopoliticele":"geopolitic","geopolitici":["geopolitici","geopolitic","geopolitici","geopolitică"],"geopoliticii":["geopoliticii","geopolitic","geopoliticii","geopolitică"],"geopoliticul":"geopolitic","geopotentialul":"geopotențial","geopotentialule":"geopotențial","geopotentialului":"geopotențial","georame":"georamă","georamei":"georamă","georamele":"georamă","georamelor":"georamă","georgiana":["georgiană","georgian","georgiana","georgian"],"georgianul":"georgian","georgianule":"georgian","georgianului":"georgian","georgica":["georgică","georgic","georgica","georgic"],"georgice":"georgic","georgicele":"georgic","georgici":"georgic","georgicii":"georgic","georgicul":"georgic","georgie":"Georgia","georgiei":"Georgia","georgiene":["georgiene","georgian","georgiene","georgiană"],"georgienei":"georgiană","georgienele":["georgienele","georgian","georgienele","georgiană"],"georgienelor":"georgiană","georgieni":"georgian","georgienii":"georgian","georgienilor":"georgian","georgii":"Georgia","geoscopia":"geoscopie","geoscopiei":"geoscopie","geoscopii":"geoscopie","geoscopiile":"geoscopie","geoscopiilor":"geoscopie","geosfere":"geosferă","geosferei":"geosferă","geosferele":"geosferă","geosferelor":"geosferă","geosferica":["geosferică","geosferic","geosferica","geosferic"],"geosferice":"geosferic","geosfericele":"geosferic","geosferici":"geosferic","geosfericii":"geosferic","geosfericul":"geosferic","geosinclinale":"geosinclinal","geosinclinalele":"geosinclinal","geosinclinalelor":"geosinclinal","geosinclinalul":"geosinclinal","geosinclinalule":"geosinclinal","geosinclinalului":"geosinclinal","geostatice":"geostatică","geostaticei":"geostatică","geostationara":["geostaționară","geostaționar","geostaționara","geostaționar"],"geostationare":"geostaționar","geostationarele":"geostaționar","geostationari":"geostaționar","geostationarii":"geostaționar","geostationarul":"geostaționar","geostrofica":["geostrofică","geostrofic","geostrofica","geostrofic"],"geostrofice":"geostrofic","geostroficele":"geostrofic","geostrofici":"geostrofic","geostroficii":"geostrofic","geostroficul":"geostrofic","geotactisme":"geotactism","geotactismele":"geotactism","geotactismelor":"geotactism","geotactismul":"geotactism","geotactismule":"geotactism","geotactismului":"geotactism","geotaxia":"geotaxie","geotaxiei":"geotaxie","geotaxii":"geotaxie","geotaxiile":"geotaxie","geotaxiilor":"geotaxie","geotectonica":["geotectonică","geotectonic","geotectonica","geotectonic"],"geotectonice":["geotectonice","geotectonic","geotectonice","geotectonică"],"geotectonicei":"geotectonică","geotectonicele":"geotectonic","geotectonici":"geotectonic","geotectonicii":"geotectonic","geotectonicul":"geotectonic","geotehnica":["geotehnică","geotehnic","geotehnica","geotehnic"],"geotehnice":"geotehnic","geotehnicele":"geotehnic","geotehnici":["geotehnici","geotehnic","geotehnici","geotehnică"],"geotehnicii":["geotehnicii","geotehnic","geotehnicii","geotehnică"],"geotehnicile":"geotehnică","geotehnicilor":"geotehnică","geotehnicul":"geotehnic","geotermala":["geotermală","geotermal","geotermala","geotermal"],"geotermale":"geotermal","geotermalele":"geotermal","geotermali":"geotermal","geotermalii":"geotermal","geotermalul":"geotermal","geotermia":"geotermie","geotermica":["geotermică","geotermic","geotermica","geotermic"],"geotermice":"geotermic","geotermicele":"geotermic","geotermici":"geotermic","geotermicii":"geotermic","geotermicul":"geotermic","geotermiei":"geotermie","geotermii":"geotermie","geotermometre":"geotermometru","geotermometrele":"geotermometru","geotermometrelor":"geotermometru","geotermometrul":"geotermometru","geotermometrule":"geotermometru","geotermometrului":"geotermometru","geotropica":["geotropică","geotropic","geotropica","geotropic"],"geotropice":"geotropic","geotropicele":"geotropic","geotropici":"geotropic","geotropicii":"geotropic","geotropicul":"geotropic","geotropismul":"geotropism","geotropismule":"geotropism","geotropismului":"geotropism","gepide":"gepidă","gepidei":"gepidă","gepidele":"gepidă","gepidelor":"gepidă","gepidul":"gepid","gepidule":"gepid","gepidului":"gepid","gepizi":"gepid","gepizii":"gepid","gepizilor":"gepid","gerahi":"gerah","gerai":"gera","geram":["gerăm","gera","geram","gera"],"gerand":"gera","geraniaceea":"geraniacee","geraniaceei":"geraniacee","geraniaceele":"geraniacee","geraniaceelor":"geraniacee","geraniolul":"geraniol","geraniolule":"geraniol","geraniolului":"geraniol","geraniul":"geraniu","geraniule":"geraniu","geraniului":"geraniu","geraniumul":"geranium","geraniumule":"geranium","geraniumului":"geranium","gerante":"gerantă","gerantei":"gerantă","gerantele":"gerantă","gerantelor":"gerantă","geranti":"gerant","gerantii":"gerant","gerantilor":"gerant","gerantul":"gerant","gerantule":"gerant","gerantului":"gerant","gerara":"gera","geraram":"gera","gerarati":"gera","gerarea":"gerare","gerari":"gerare","gerarii":"gerare","gerarile":"gerare","gerarilor":"gerare","gerase":"gera","gerasem":"gera","gerasera":"gera","geraseram":"gera","geraserati":"gera","gerasesi":"gera","gerasi":"gera","gerat":"gera","gerata":["gerată","gerat","gerata","gerat"],"gerate":"gerat","geratele":"gerat","gerati":["gerați","gera","gerați","gerat"],"geratii":"gerat","geratul":"gerat","gerau":"gera","gerbili":"gerbil","gerbilii":"gerbil","gerbililor":"gerbil","gerbilul":"gerbil","gerbilule":"gerbil","gerbilului":"gerbil","gereaza":"gera","geremeaua":"geremea","geremele":"geremea","geremelei":"geremea","geremelele":"geremea","geremelelor":"geremea","geretul":"geret","geretule":"geret","geretului":"geret","gereturi":"geret","gereturile":"geret","gereturilor":"geret","gerez":"gera","gerezi":"gera","gergeveaua":"gergevea","gergevele":"gergevea","gergevelei":"gergevea","gergevelele":"gergevea","gergevelelor":"gergevea","gergul":"gerg","gergule":"gerg","gergului":"gerg","gerguri":"gerg","gergurile":"gerg","gergurilor":"gerg","geriatre":"geriatră","geriatrei":"geriatră","geriatrele":"geriatră","geriatrelor":"geriatră","geriatri":"geriatru","geriatria":"geriatrie","geriatriei":"geriatrie","geriatrii":["geriatrii","geriatrie","geriatrii","geriatru"],"geriatrilor":"geriatru","geriatrul":"geriatru","geriatrule":"geriatru","geriatrului":"geriatru","geridul":"gerid","geridule":"gerid","geridului":"gerid","geriduri":"gerid","geridurile":"gerid","geridurilor":"gerid","gerisoare":"gerișor","gerisoarele":"gerișor","gerisoarelor":"gerișor","gerisorul":"gerișor","gerisorule":"gerișor","gerisorului":"gerișor","germana":["germană","german","germana","german"],"germance":"germancă","germancei":"germancă","germancele":"germancă","germancelor":"germancă","germane":["germane","german","germane","germană"],"germanei":"germană","germanele":"german","germani":"german","germanica":["germanică","germanic","germanica","germanic"],"germanice":"germanic","germanicele":"germanic","germanici":"germanic","germanicii":"germanic","germanicul":"germanic","germanie":"Germania","germaniei":"Germania","germanii":["germanii","german","germanii","Germania"],"germanisme":"germanism","germanismele":"germanism","germanismelor":"germanism","germanismul":"germanism","germanismule":"germanism","germanismului":"germanism","germaniste":"germanistă","germanistei":"germanistă","germanistele":"germanistă","germanistelor":"germanistă","germanisti":"germanist","germanistici":"germanistică","germanisticii":"germanistică","germanistii":"germanist","germanistilor":"germanist","germanistul":"germanist","germanistule":"germanist","germanistului":"germanist","germaniul":"germaniu","germaniule":"germaniu","germaniului":"germaniu","germanizai":"germaniza","germanizam":["germanizăm","germaniza","germanizam","germaniza"],"germanizand":"germaniza","germanizara":"germaniza","germanizaram":"germaniza","germanizarati":"germaniza","germanizarea":"germanizare","germanizari":"germanizare","germanizarii":"germanizare","germanizarile":"germanizare","germanizarilor":"germanizare","germanizase":"germaniza","germanizasem":"germaniza","germanizasera":"germaniza","germanizaseram":"germaniza","germanizaserati":"germaniza","germanizasesi":"germaniza","germanizasi":"germaniza","germanizat":"germaniza","germanizata":["germanizată","germanizat","germanizata","germanizat"],"germanizate":"germanizat","germanizatele":"germanizat","germanizati":["germanizați","germaniza","germanizați","germanizat"],"germanizatii":"germanizat","germanizatul":"germanizat","germanizau":"germaniza","germanizeaza":"germaniza","germanizez":"germaniza","germanizezi":"germaniza","germanofile":"germanofilă","germanofilei":"germanofilă","germanofilele":"germanofilă","germanofilelor":"germanofilă","germanofili":"germanofil","germanofilia":"germanofilie","germanofiliei":"germanofilie","germanofilii":["germanofilii","germanofil","germanofilii","germanofilie"],"germanofiliile":"germanofilie","germanofiliilor":"germanofilie","germanofililor":"germanofil","germanofilul":"germanofil","germanofilule":"germanofil","germanofilului":"germanofil","germanofobe":"germanofobă","germanofobei":"germanofobă","germanofobele":"germanofobă","germanofobelor":"germanofobă","germanofobi":"germanofob","germanofobia":"germanofobie","germanofobiei":"germanofobie","germanofobii":["germanofobii","germanofob","germanofobii","germanofobie"],"germanofobiile":"germanofobie","germanofobiilor":"germanofobie","germanofobilor":"germanofob","germanofobul":"germanofob","germanofobule":"germanofob","germanofobului":"germanofob","germanomania":"germanomanie","germanomaniei":"germanomanie","germanomanii":"germanomanie","germanomaniile":"germanomanie","germanomaniilor":"germanomanie","germanul":"german","germene":"germen","germeni":["germeni","germen","germeni","germene"],"germenii":"germen","germenilor":"germen","germenul":"germen","germenule":"germen","germenului":"germen","germicide":"germicid","germicidele":"germicid","germicidelor":"germicid","germicidul":"germicid","germicidule":"germicid","germicidului":"germicid","germinai":"germina","germinalul":"germinal","germinalule":"germinal","germinalului":"germinal","germinam":["germinăm","germina","germinam","germina"],"germinand":"germina","germinara":"germina","germinaram":"germina","germinarati":"germina","germinarea":"germinare","germinari":"germinare","germinarii":"germinare","germinarile":"germinare","germinarilor":"germinare","germinase":"germina","germinasem":"germina","germinasera":"germina","germinaseram":"germina","germinaserati":"germina","germinasesi":"germina","germinasi":"germina","germinat":"germina","germinati":"germina","germinatia":"germinație","germinatiei":"germinație","germinatii":"germinație","germinatiile":"germinație","germinatiilor":"germinație","germinatiunea":"germinațiune","germinatiuni":"germinațiune","germinatiunii":"germinațiune","germinatiunile":"germinațiune","germinatiunilor":"germinațiune","germinativa":["germinativă","germinativ","germinativa","germinativ"],"germinative":"germinativ","germinativele":"germinativ","germinativi":"germinativ","germinativii":"germinativ","germinativul":"germinativ","germinatori":"germinator","germinatorile":"germinator","germinatorilor":"germinator","germinatorul":"germinator","germinatorule":"germinator","germinatorului":"germinator","germinau":"germina","germineaza":"germina","germineul":"germine","germineule":"germine","germineului":"germine","germinez":"germina","germinezi":"germina","germini":"germine","germinii":"germine","germinilor":"germine","geroasa":["geroasă","geros","geroasa","geros"],"geroase":"geros","geroasele":"geros","gerocratia":"gerocrație","gerocratiei":"gerocrație","gerocratii":"gerocrație","gerocratiile":"gerocrație","gerocratiilor":"gerocrație","gerontocratica":["gerontocratică","gerontocratic","gerontocratica","gerontocratic"],"gerontocratice":"gerontocratic","gerontocraticele":"gerontocratic","gerontocratici":"gerontocratic","gerontocraticii":"gerontocratic","gerontocraticul":"gerontocratic","gerontocratii":"gerontocrație","gerontofila":["gerontofilă","gerontofil","gerontofila","gerontofil"],"gerontofile":"gerontofil","gerontofilele":"gerontofil","gerontofili":"gerontofil","gerontofilia":"gerontofilie","gerontofiliei":"gerontofilie","gerontofilii":["gerontofilii","gerontofil","gerontofilii","gerontofilie"],"gerontofiliile":"gerontofilie","gerontofiliilor":"gerontofilie","gerontofilul":"gerontofil","gerontologe":"gerontologă","gerontologei":"gerontologă","gerontologele":"gerontologă","gerontologelor":"gerontologă","gerontologi":"gerontolog","gerontologia":"gerontologie","gerontologica":["gerontologică","gerontologic","gerontologica","gerontologic"],"gerontologice":"gerontologic","gerontologicele":"gerontologic","gerontologici":"gerontologic","gerontologicii":"gerontologic","gerontologicul":"gerontologic","gerontologiei":"gerontologie","gerontologii":["gerontologii","gerontolog","gerontologii","gerontologie"],"gerontologilor":"gerontolog","gerontologul":"gerontolog","gerontologule":"gerontolog","gerontologului":"gerontolog","gerosi":"geros","gerosii":"geros","gerosul":"geros","geruia":"gerui","geruiai":"gerui","geruiam":"gerui","geruiati":"gerui","geruiau":"gerui","geruie":"gerui","geruieli":"geruială","geruielii":"geruială","geruielile":"geruială","geruielilor":"geruială","geruii":"gerui","geruim":"gerui","geruind":"gerui","geruira":"gerui","geruiram":"gerui","geruirati":"gerui","geruirea":"geruire","geruiri":"geruire","geruirii":"geruire","geruirile":"geruire","geruirilor":"geruire","geruise":"gerui","geruisem":"gerui","geruisera":"gerui","geruiseram":"gerui","geruiserati":"gerui","geruisesi":"gerui","geruisi":"gerui","geruit":"gerui","geruita":["geruită","geruit","geruita","geruit"],"geruite":"geruit","geruitele":"geruit","geruiti":["geruiți","gerui","geruiți","geruit"],"geruitii":"geruit","geruitul":"geruit","gerul":"ger","gerule":"ger","gerulete":"geruleț","geruletele":"geruleț","geruletelor":"geruleț","geruletul":"geruleț","geruletule":"geruleț","geruletului":"geruleț","gerului":"ger","gerundivala":["gerundivală","gerundival","gerundivala","gerundival"],"gerundivale":"gerundival","gerundivalele":"gerundival","gerundivali":"gerundival","gerundivalii":"gerundival","gerundivalul":"gerundival","gerundive":"gerundiv","gerundivele":"gerundiv","gerundivelor":"gerundiv","gerundivul":"gerundiv","gerundivule":"gerundiv","gerundivului":"gerundiv","gerune":"genune","gerunziala":["gerunzială","gerunzial","gerunziala","gerunzial"],"gerunziale":"gerunzial","gerunzialele":"gerunzial","gerunziali":"gerunzial","gerunzialii":"gerunzial","gerunzialul":"gerunzial","gerunzii":"gerunziu","gerunziile":"gerunziu","gerunziilor":"gerunziu","gerunziul":"gerunziu","gerunziule":"gerunziu","gerunziului":"gerunziu","gerure":"genune","geruri":"ger","gerurile":"ger","gerurilor":"ger","gestaltismul":"gestaltism","gestaltismule":"gestaltism","gestaltismului":"gestaltism","gestaltiste":"gestaltistă","gestaltistei":"gestaltistă","gestaltistele":"gestaltistă","gestaltistelor":"gestaltistă","gestaltisti":"gestaltist","gestaltistii":"gestaltist","gestaltistilor":"gestaltist","gestaltistul":"gestaltist","gestaltistule":"gestaltist","gestaltistului":"gestaltist","gestatia":"gestație","gestatiei":"gestație","gestatii":"gestație","gestatiile":"gestație","gestatiilor":"gestație","gestatiunea":"gestațiune","gestatiuni":"gestațiune","gestatiunii":"gestațiune","gestatiunile":"gestațiune","gestatiunilor":"gestațiune","geste":"gestă","gestei":"gestă","gestele":"gestă","gestelor":"gestă","gesticulai":"gesticula","gesticulam":["gesticulăm","gesticula","gesticulam","gesticula"],"gesticuland":"gesticula","gesticulanta":["gesticulantă","gesticulant","gesticulanta","gesticulant"],"gesticulante":"gesticulant","gesticulantele":"gesticulant","gesticulanti":"gesticulant","gesticulantii":"gesticulant","gesticulantul":"gesticulant","gesticulara":"gesticula","gesticularam":"gesticula","gesticularati":"gesticula","gesticularea":"gesticulare","gesticulari":"gesticulare","gesticularii":"gesticulare","gesticularile":"gesticulare","gesticularilor":"gesticulare","gesticulase":"gesticula","gesticulasem":"gesticula","gesticulasera":"gesticula","gesticulaseram":"gesticula","gesticulaserati":"gesticula","gesticulasesi":"gesticula","gesticulasi":"gesticula","gesticulat":"gesticula","gesticulati":"gesticula","gesticulatia":"gesticulație","gesticulatiei":"gesticulație","gesticulatii":"gesticulație","gesticulatiile":"gesticulație","gesticulatiilor":"gesticulație","gesticulatiunea":"gesticulațiune","gesticulatiuni":"gesticulațiune","gesticulatiunii":"gesticulațiune","gesticulatiunile":"gesticulațiune","gesticulatiunilor":"gesticulațiune","gesticulau":"gesticula","gesticuleaza":"gesticula","gesticulez":"gesticula","gesticulezi":"gesticula","gestionai":"gestiona","gestionam":["gestionăm","gestiona","gestionam","gestiona"],"gestionand":"gestiona","gestionara":["gestionară","gestiona","gestionară","gestionar","gestionara","gestionar"],"gestionaram":"gestiona","gestionarati":"gestiona","gestionare":["gestionare","gestionar","gestionare","gestionară"],"gestionarea":"gestionare","gestionarei":"gestionară","gestionarele":["gestionarele","gestionar","gestionarele","gestionară"],"gestionarelor":"gestionară","gestionari":["gestionari","gestionar","gestionări","gestionare"],"gestionarii":["gestionarii","gestionar","gestionării","gestionare"],"gestionarile":"gestionare","gestionarilor":["gestionarilor","gestionar","gestionărilor","gestionare"],"gestionarul":"gestionar","gestionarule":"gestionar","gestionarului":"gestionar","gestionase":"gestiona","gestionasem":"gestiona","gestionasera":"gestiona","gestionaseram":"gestiona","gestionaserati":"gestiona","gestionasesi":"gestiona","gestionasi":"gestiona","gestionat":"gestiona","gestionati":"gestiona","gestionau":"gestiona","gestioneaza":"gestiona","gestionez":"gestiona","gestionezi":"gestiona","gestiunea":"gestiune","gestiuni":"gestiune","gestiunii":"gestiune","gestiunile":"gestiune","gestiunilor":"gestiune","gestoze":"gestoză","gestozei":"gestoză","gestuala":["gestuală","gestual","gestuala","gestual"],"gestuale":"gestual","gestualele":"gestual","gestuali":"gestual","gestualii":"gestual","gestualul":"gestual","gesturi":"gest","gete":"getă","getei":"getă","getele":"getă","getelor":"getă","geti":["geți","get","geti","get"],"getica":["getică","getic","getica","getic"],"getice":"getic","geticele":"getic","getici":"getic","geticii":"getic","geticul":"getic","getii":"get","getilor":"get","getterul":"getter","getterule":"getter","getterului":"getter","getul":"get","getule":"get","getului":"get","gevreaua":"gevrea","gevrele":"gevrea","gevrelei":"gevrea","gevrelele":"gevrea","gevrelelor":"gevrea","ghaneze":"ghaneză","ghanezei":"ghaneză","ghanezele":"ghaneză","ghanezelor":"ghaneză","ghanezi":"ghanez","ghanezii":"ghanez","ghanezilor":"ghanez","ghanezul":"ghanez","ghanezule":"ghanez","ghanezului":"ghanez","gheaba":"gheb","gheare":"gheară","ghearei":"gheară","ghearele":"gheară","ghearelor":"gheară","ghebe":"gheabă","ghebeaua":"ghebea","ghebei":"gheabă","ghebele":["ghebele","gheabă","ghebele","ghebea"],"ghebelei":"ghebea","ghebelele":"ghebea","ghebelelor":"ghebea","ghebelor":"gheabă","gheboase":"gheboasă","gheboasei":"gheboasă","gheboasele":"gheboasă","gheboaselor":"gheboasă","ghebosarea":"gheboșare","ghebosari":"gheboșare","ghebosarii":"gheboșare","ghebosarile":"gheboșare","ghebosarilor":"gheboșare","ghebosea":"gheboși","gheboseai":"gheboși","gheboseam":"gheboși","gheboseati":"gheboși","gheboseau":"gheboși","ghebosesc":"gheboși","gheboseste":"gheboși","ghebosesti":"gheboși","ghebosi":"ghebos","ghebosii":["gheboșii","ghebos","gheboșii","gheboși"],"ghebosilor":"ghebos","ghebosim":"gheboși","ghebosind":"gheboși","ghebosira":"gheboși","ghebosiram":"gheboși","ghebosirati":"gheboși","ghebosise":"gheboși","ghebosisem":"gheboși","ghebosisera":"gheboși","ghebosiseram":"gheboși","ghebosiserati":"gheboși","ghebosisesi":"gheboși","ghebosisi":"gheboși","ghebosit":"gheboși","ghebosita":["gheboșită","gheboșit","gheboșita","gheboșit"],"ghebosite":"gheboșit","ghebositele":"gheboșit","ghebositi":["gheboșiți","gheboși","gheboșiți","gheboșit"],"ghebositii":"gheboșit","ghebositul":"gheboșit","ghebosul":"ghebos","ghebosule":"ghebos","ghebosului":"ghebos","ghebul":"gheb","ghebule":"gheb","ghebului":"gheb","gheburi":"gheb","gheburile":"gheb","gheburilor":"gheb","gheene":"gheenă","gheenei":"gheenă","gheise":"gheișă","gheisei":"gheișă","gheisele":"gheișă","gheiselor":"gheișă","gheizere":"gheizer","gheizerele":"gheizer","gheizerelor":"gheizer","gheizerite":"gheizerit","gheizeritele":"gheizerit","gheizeritelor":"gheizerit","gheizeritul":"gheizerit","gheizeritule":"gheizerit","gheizeritului":"gheizerit","gheizerul":"gheizer","gheizerule":"gheizer","gheizerului":"gheizer","ghelcusori":"ghelcușor","ghelcusorii":"ghelcușor","ghelcusorilor":"ghelcușor","ghelcusorul":"ghelcușor","ghelcusorule":"ghelcușor","ghelcusorului":"ghelcușor","ghele":"ghelă","ghelei":"ghelă","ghelele":"ghelă","ghelelor":"ghelă","ghelirul":"ghelir","ghelirule":"ghelir","ghelirului":"ghelir","gheliruri":"ghelir","ghelirurile":"ghelir","ghelirurilor":"ghelir","gheme":"ghem","ghemele":"ghem","ghemelor":"ghem","ghemotoace":"ghemotoc","ghemotoacele":"ghemotoc","ghemotoacelor":"ghemotoc","ghemotocul":"ghemotoc","ghemotocule":"ghemotoc","ghemotocului":"ghemotoc","ghemuia":"ghemui","ghemuiai":"ghemui","ghemuiam":"ghemui","ghemuiati":"ghemui","ghemuiau":"ghemui","ghemuiesc":"ghemui","ghemuieste":"ghemui","ghemuiesti":"ghemui","ghemuii":"ghemui","ghemuim":"ghemui","ghemuind":"ghemui","ghemuira":"ghemui","ghemuiram":"ghemui","ghemuirati":"ghemui","ghemuise":"ghemui","ghemuisem":"ghemui","ghemuisera":"ghemui","ghemuiseram":"ghemui","ghemuiserati":"ghemui","ghemuisesi":"ghemui","ghemuisi":"ghemui","ghemuit":"ghemui","ghemuiti":"ghemui","ghemuitul":"ghemuit","ghemuitule":"ghemuit","ghemuitului":"ghemuit","ghemuituri":"ghemuit","ghemuiturile":"ghemuit","ghemuiturilor":"ghemuit","ghemul":"ghem","ghemule":"ghem","ghemulete":"ghemuleț","ghemuletele":"ghemuleț","ghemuletelor":"ghemuleț","ghemuletul":"ghemuleț","ghemuletule":"ghemuleț","ghemuletului":"ghemuleț","ghemului":"ghem","ghemusoare":"ghemușor","ghemusore":"ghemușor","ghemusorele":"ghemușor","ghemusorelor":"ghemușor","ghemusorul":"ghemușor","ghemusorule":"ghemușor","ghemusorului":"ghemușor","ghemute":"ghemuț","ghemutele":"ghemuț","ghemutelor":"ghemuț","ghemutul":"ghemuț","ghemutule":"ghemuț","ghemutului":"ghemuț","ghenarieul":"ghenarie","ghenarieule":"ghenarie","ghenarieului":"ghenarie","ghenerari":"ghenerar","ghenunchii":"ghenunchi","ghenunchilor":"ghenunchi","ghenunchiul":"ghenunchi","ghenunchiule":"ghenunchi","ghenunchiului":"ghenunchi","gheomotoace":"gheomotoc","gheomotoacele":"gheomotoc","gheomotoacelor":"gheomotoc","gheomotocul":"gheomotoc","gheomotocule":"gheomotoc","gheomotocului":"gheomotoc","gheonoaia":"gheonoaie","gheonoaie":"ghionoaie","gheonoi":"gheonoaie","gheonoii":"gheonoaie","gheonoile":"gheonoaie","gheonoilor":"gheonoaie","gheora":"gheura","gheosi":"gheoș","gheosii":"gheoș","gheosilor":"gheoș","gheosul":"gheoș","gheosule":"gheoș","gheosului":"gheoș","ghepardul":"ghepard","ghepardule":"ghepard","ghepardului":"ghepard","gheparzi":"ghepard","gheparzii":"ghepard","gheparzilor":"ghepard","gherai":"ghera","gheram":["gherăm","ghera","gheram","ghera"],"gherand":"ghera","gherara":"ghera","gheraram":"ghera","gherarati":"ghera","gherase":"ghera","gherasem":"ghera","gherasera":"ghera","gheraseram":"ghera","gheraserati":"ghera","gherasesi":"ghera","gherasi":"ghera","gherat":"ghera","gherati":"ghera","gherau":"ghera","gherbevase":"gherbevaș","gherbevasele":"gherbevaș","gherbevaselor":"gherbevaș","gherbevasul":"gherbevaș","gherbevasule":"gherbevaș","gherbevasului":"gherbevaș","gherdane":"gherdan","gherdanele":"gherdan","gherdanelor":"gherdan","gherdanul":"gherdan","gherdanule":"gherdan","gherdanului":"gherdan","ghereaza":"ghera","gherete":"gheretă","gheretei":"gheretă","gheretele":"gheretă","gheretelor":"gheretă","gherez":"ghera","gherezi":"ghera","ghergheful":"gherghef","gherghefule":"gherghef","gherghefului":"gherghef","gherghefuri":"gherghef","gherghefurile":"gherghef","gherghefurilor":"gherghef","gherghine":"gherghină","gherghinei":"gherghină","gherghinele":"gherghină","gherghinelor":"gherghină","gherghini":"gherghin","gherghinii":"gherghin","gherghinilor":"gherghin","gherghinul":"gherghin","gherghinule":"gherghin","gherghinului":"gherghin","gherghire":"gherghir","gherghirele":"gherghir","gherghirelor":"gherghir","gherghirul":"gherghir","gherghirule":"gherghir","gherghirului":"gherghir","gheridoane":"gheridon","gheridoanele":"gheridon","gheridoanelor":"gheridon","gheridonul":"gheridon","gheridonule":"gheridon","gheridonului":"gheridon","gherile":"gherilă","gherilei":"gherilă","gherilele":"gherilă","gherilelor":"gherilă","gherisoare":"gherișoară","gherisoarei":"gherișoară","gherisoarele":"gherișoară","gherisoarelor":"gherișoară","gherle":"gherlă","gherlei":"gherlă","gherlele":"gherlă","gherlelor":"gherlă","ghermana":["ghermană","gherman","ghermana","gherman"],"ghermane":"gherman","ghermanele":"gherman","ghermani":"gherman","ghermanii":"gherman","ghermanul":"gherman","ghermesitul":"ghermeșit","ghermesitule":"ghermeșit","ghermesitului":"ghermeșit","ghermesituri":"ghermeșit","ghermesiturile":"ghermeșit","ghermesiturilor":"ghermeșit","ghermesutul":"ghermesut","ghermesutule":"ghermesut","ghermesutului":"ghermesut","ghermesuturi":"ghermesut","ghermesuturile":"ghermesut","ghermesuturilor":"ghermesut","gherocul":"gheroc","gherocule":"gheroc","gherocului":"gheroc","gherocuri":"gheroc","gherocurile":"gheroc","gherocurilor":"gheroc","ghertoii":"gherțoi","ghertoilor":"gherțoi","ghertoiul":"gherțoi","ghertoiule":"gherțoi","ghertoiului":"gherțoi","gherulite":"gheruliță","gherulitei":"gheruliță","gherulitele":"gheruliță","gherulitelor":"gheruliță","gherute":"gheruță","gherutei":"gheruță","gherutele":"gheruță","gherutelor":"gheruță","gheseftari":"gheșeftar","gheseftaria":"gheșeftărie","gheseftariei":"gheșeftărie","gheseftarii":["gheșeftarii","gheșeftar","gheșeftării","gheșeftărie"],"gheseftariile":"gheșeftărie","gheseftariilor":"gheșeftărie","gheseftarilor":"gheșeftar","gheseftarul":"gheșeftar","gheseftarule":"gheșeftar","gheseftarului":"gheșeftar","gheseftul":"gheșeft","gheseftule":"gheșeft","gheseftului":"gheșeft","ghesefturi":"gheșeft","ghesefturile":"gheșeft","ghesefturilor":"gheșeft","ghetari":["ghetari","ghetar","ghețari","ghețar"],"ghetaria":"ghețărie","ghetariei":"ghețărie","ghetarii":["ghetarii","ghetar","ghețarii","ghețar","ghețării","ghețărie"],"ghetariile":"ghețărie","ghetariilor":"ghețărie","ghetarilor":["ghetarilor","ghetar","ghețarilor","ghețar"],"ghetarul":["ghetarul","ghetar","ghețarul","ghețar"],"ghetarule":["ghetarule","ghetar","ghețarule","ghețar"],"ghetarului":["ghetarului","ghetar","ghețarului","ghețar"],"ghete":"gheată","ghetei":"gheată","ghetele":"gheată","ghetelor":"gheată","gheti":"gheață","ghetii":"gheață","ghetisoare":"ghețișoară","ghetisoarei":"ghețișoară","ghetisoarele":"ghețișoară","ghetisoarelor":"ghețișoară","ghetoaie":"ghețoi","ghetoaiele":"ghețoi","ghetoaielor":"ghețoi","ghetoasa":["ghețoasă","ghețos","ghețoasa","ghețos"],"ghetoase":"ghețos","ghetoasele":"ghețos","ghetoiul":"ghețoi","ghetoiule":"ghețoi","ghetoiului":"ghețoi","ghetosi":"ghețos","ghetosii":"ghețos","ghetosul":"ghețos","ghetoul":["ghetoul","gheto","ghetoul","ghetou"],"ghetoule":["ghetoule","gheto","ghetoule","ghetou"],"ghetoului":["ghetoului","gheto","ghetoului","ghetou"],"ghetouri":["ghetouri","gheto","ghetouri","ghetou"],"ghetourile":["ghetourile","gheto","ghetourile","ghetou"],"ghetourilor":["ghetourilor","gheto","ghetourilor","ghetou"],"ghetre":"ghetră","ghetrei":"ghetră","ghetrele":"ghetră","ghetrelor":"ghetră","gheturi":"gheață","gheturile":"gheață","gheturilor":"gheață","ghetusul":"ghețuș","ghetusule":"ghețuș","ghetusului":"ghețuș","ghetusuri":"ghețuș","ghetusurile":"ghețuș","ghetusurilor":"ghețuș","ghetute":"ghetuță","ghetutei":"ghetuță","ghetutele":"ghetuță","ghetutelor":"ghetuță","gheunoaia":"gheunoaie","gheunoi":"gheunoaie","gheunoii":"gheunoaie","gheunoile":"gheunoaie","gheunoilor":"gheunoaie","gheurai":"gheura","gheuram":["gheurăm","gheura","gheuram","gheura"],"gheurand":"gheura","gheurara":"gheura","gheuraram":"gheura","gheurarati":"gheura","gheurase":"gheura","gheurasem":"gheura","gheurasera":"gheura","gheuraseram":"gheura","gheuraserati":"gheura","gheurasesi":"gheura","gheurasi":"gheura","gheurat":"gheura","gheurati":"gheura","gheurau":"gheura","gheureaza":"gheura","gheurez":"gheura","gheurezi":"gheura","ghezase":"ghezăș","ghezasele":"ghezăș","ghezaselor":"ghezăș","ghezasul":"ghezăș","ghezasule":"ghezăș","ghezasului":"ghezăș","ghiara":"gheară","ghiare":"ghiară","ghiarei":"ghiară","ghiarele":"ghiară","ghiarelor":"ghiară","ghiarghile":"ghiarghilă","ghiarghilei":"ghiarghilă","ghiarghilele":"ghiarghilă","ghiarghilelor":"ghiarghilă","ghiata":"gheață","ghiauri":"ghiaur","ghiaurii":"ghiaur","ghiaurilor":"ghiaur","ghiaurul":"ghiaur","ghiaurule":"ghiaur","ghiaurului":"ghiaur","ghibanasi":"ghibănaș","ghibanasii":"ghibănaș","ghibanasilor":"ghibănaș","ghibanasul":"ghibănaș","ghibanasule":"ghibănaș","ghibanasului":"ghibănaș","ghibelini":"ghibelin","ghibelinii":"ghibelin","ghibelinilor":"ghibelin","ghibelinul":"ghibelin","ghibelinule":"ghibelin","ghibelinului":"ghibelin","ghibirdici":"ghibirdic","ghibirdicii":"ghibirdic","ghibirdicilor":"ghibirdic","ghibirdicul":"ghibirdic","ghibirdicule":"ghibirdic","ghibirdicului":"ghibirdic","ghibiroance":"ghibiroancă","ghibiroancei":"ghibiroancă","ghibiroancele":"ghibiroancă","ghibiroancelor":"ghibiroancă","ghiboasa":["ghiboasă","ghibos","ghiboasa","ghibos"],"ghiboase":"ghibos","ghiboasele":"ghibos","ghibortasi":"ghiborțaș","ghibortasii":"ghiborțaș","ghibortasilor":"ghiborțaș","ghibortasul":"ghiborțaș","ghibortasule":"ghiborțaș","ghibortasului":"ghiborțaș","ghiborti":"ghiborț","ghibortii":"ghiborț","ghibortilor":"ghiborț","ghibortul":"ghiborț","ghibortule":"ghiborț","ghibortului":"ghiborț","ghibosi":"ghibos","ghibosii":"ghibos","ghibosul":"ghibos","ghicea":"ghici","ghiceai":"ghici","ghiceam":"ghici","ghiceati":"ghici","ghiceau":"ghici","ghicelice":"ghicelic","ghicelicele":"ghicelic","ghicelicelor":"ghicelic","ghicelicul":"ghicelic","ghicelicule":"ghicelic","ghicelicului":"ghicelic","ghicesc":"ghici","ghiceste":"ghici","ghicesti":"ghici","ghicii":"ghici","ghicim":"ghici","ghicind":"ghici","ghicira":"ghici","ghiciram":"ghici","ghicirati":"ghici","ghicirea":"ghicire","ghiciri":"ghicire","ghicirii":"ghicire","ghicirile":"ghicire","ghicirilor":"ghicire","ghicise":"ghici","ghicisem":"ghici","ghicisera":"ghici","ghiciseram":"ghici","ghiciserati":"ghici","ghicisesi":"ghici","ghicisi":"ghici","ghicit":"ghici","ghicita":["ghicită","ghicit","ghicita","ghicit"],"ghicite":"ghicit","ghicitele":"ghicit","ghicitelor":"ghicit","ghiciti":["ghiciți","ghici","ghiciți","ghicit"],"ghicitii":"ghicit","ghicitoarea":"ghicitoare","ghicitoarei":"ghicitoare","ghicitoarele":"ghicitoare","ghicitoarelor":"ghicitoare","ghicitorese":"ghicitoreasă","ghicitoresei":"ghicitoreasă","ghicitoresele":"ghicitoreasă","ghicitoreselor":"ghicitoreasă","ghicitori":["ghicitori","ghicitoare","ghicitori","ghicitor"],"ghicitorii":["ghicitorii","ghicitoare","ghicitorii","ghicitor"],"ghicitorile":"ghicitoare","ghicitorilor":["ghicitorilor","ghicitoare","ghicitorilor","ghicitor"],"ghicitorul":"ghicitor","ghicitorule":"ghicitor","ghicitorului":"ghicitor","ghicitul":"ghicit","ghicitule":"ghicit","ghicitului":"ghicit","ghicituri":"ghicitură","ghiciturii":"ghicitură","ghiciturile":"ghicitură","ghiciturilor":"ghicitură","ghidai":"ghida","ghidaje":"ghidaj","ghidajele":"ghidaj","ghidajelor":"ghidaj","ghidajul":"ghidaj","ghidajule":"ghidaj","ghidajului":"ghidaj","ghidam":["ghidăm","ghida","ghidam","ghida"],"ghidand":"ghida","ghidara":"ghida","ghidaram":"ghida","ghidarati":"ghida","ghidarea":"ghidare","ghidarei":"ghidare","ghidase":"ghida","ghidasem":"ghida","ghidasera":"ghida","ghidaseram":"ghida","ghidaserati":"ghida","ghidasesi":"ghida","ghidasi":"ghida","ghidat":"ghida","ghidata":["ghidată","ghidat","ghidata","ghidat"],"ghidate":"ghidat","ghidatele":"ghidat","ghidati":["ghidați","ghida","ghidați","ghidat"],"ghidatii":"ghidat","ghidatul":"ghidat","ghidau":"ghida","ghide":"ghidă","ghideaza":"ghida","ghidei":"ghidă","ghidele":"ghidă","ghidelor":"ghidă","ghidez":"ghida","ghidezi":"ghida","ghidoane":"ghidon","ghidoanele":"ghidon","ghidoanelor":"ghidon","ghidonul":"ghidon","ghidonule":"ghidon","ghidonului":"ghidon","ghidrini":"ghidrin","ghidrinii":"ghidrin","ghidrinilor":"ghidrin","ghidrinul":"ghidrin","ghidrinule":"ghidrin","ghidrinului":"ghidrin","ghidul":"ghid","ghidule":"ghid","ghidului":"ghid","ghiduri":"ghid","ghiduri de calatorie":"ghid de călătorie","ghiduri turistice":"ghid turistic","ghidurile":"ghid","ghidurilor":"ghid","ghidusa":["ghidușă","ghiduș","ghidușa","ghiduș"],"ghidusari":"ghidușar","ghidusaria":"ghidușărie","ghidusariei":"ghidușărie","ghidusarii":["ghidușarii","ghidușar","ghidușării","ghidușărie"],"ghidusariile":"ghidușărie","ghidusariilor":"ghidușărie","ghidusarilor":"ghidușar","ghidusarul":"ghidușar","ghidusarule":"ghidușar","ghidusarului":"ghidușar","ghiduse":"ghiduș","ghidusele":"ghiduș","ghidusi":"ghiduș","ghidusia":"ghidușie","ghidusiei":"ghidușie","ghidusii":["ghidușii","ghiduș","ghidușii","ghidușie"],"ghidusiile":"ghidușie","ghidusiilor":"ghidușie","ghiduslacul":"ghidușlâc","ghiduslacule":"ghidușlâc","ghiduslacului":"ghidușlâc","ghiduslacuri":"ghidușlâc","ghiduslacurile":"ghidușlâc","ghiduslacurilor":"ghidușlâc","ghidusul":"ghiduș","ghiemal":"ghiemăli","ghiemale":"ghiemăli","ghiemalea":"ghiemăli","ghiemaleai":"ghiemăli","ghiemaleam":"ghiemăli","ghiemaleati":"ghiemăli","ghiemaleau":"ghiemăli","ghiemalie":"ghiemăli","ghiemalii":"ghiemăli","ghiemalim":"ghiemăli","ghiemalind":"ghiemăli","ghiemalira":"ghiemăli","ghiemaliram":"ghiemăli","ghiemalirati":"ghiemăli","ghiemalise":"ghiemăli","ghiemalisem":"ghiemăli","ghiemalisera":"ghiemăli","ghiemaliseram":"ghiemăli","ghiemaliserati":"ghiemăli","ghiemalisesi":"ghiemăli","ghiemalisi":"ghiemăli","ghiemalit":"ghiemăli","ghiemaliti":"ghiemăli","ghiers":"viers","ghiersul":"ghiers","ghiersule":"ghiers","ghiersului":"ghiers","ghiersuri":"ghiers","ghiersurile":"ghiers","ghiersurilor":"ghiers","ghiftuia":"ghiftui","ghiftuiai":"ghiftui","ghiftuiam":"ghiftui","ghiftuiati":"ghiftui","ghiftuiau":"ghiftui","ghiftuiesc":"ghiftui","ghiftuieste":"ghiftui","ghiftuiesti":"ghiftui","ghiftuii":"ghiftui","ghiftuim":"ghiftui","ghiftuind":"ghiftui","ghiftuira":"ghiftui","ghiftuiram":"ghiftui","ghiftuirati":"ghiftui","ghiftuirea":"ghiftuire","ghiftuiri":"ghiftuire","ghiftuirii":"ghiftuire","ghiftuirile":"ghiftuire","ghiftuirilor":"ghiftuire","ghiftuise":"ghiftui","ghiftuisem":"ghiftui","ghiftuisera":"ghiftui","ghiftuiseram":"ghiftui","ghiftuiserati":"ghiftui","ghiftuisesi":"ghiftui","ghiftuisi":"ghiftui","ghiftuit":"ghiftui","ghiftuita":["ghiftuită","ghiftuit","ghiftuita","ghiftuit"],"ghiftuite":"ghiftuit","ghiftuitele":"ghiftuit","ghiftuiti":["ghiftuiți","ghiftui","ghiftuiți","ghiftuit"],"ghiftuitii":"ghiftuit","ghiftuitul":"ghiftuit","ghiganta":["ghigantă","ghigant","ghiganta","ghigant"],"ghigante":"ghigant","ghigantele":"ghigant","ghiganti":"ghigant","ghigantii":"ghigant","ghigantul":"ghigant","ghigari":"ghigar","ghigarii":"ghigar","ghigarilor":"ghigar","ghigarul":"ghigar","ghigarule":"ghigar","ghigarului":"ghigar","ghige":"ghigă","ghigei":"ghigă","ghigele":"ghigă","ghigelor":"ghigă","ghigilice":"ghigilic","ghigilicele":"ghigilic","ghigilicelor":"ghigilic","ghigilicul":"ghigilic","ghigilicule":"ghigilic","ghigilicului":"ghigilic","ghigortei":"ghigorțel","ghigorteii":"ghigorțel","ghigorteilor":"ghigorțel","ghigortelul":"ghigorțel","ghigortelule":"ghigorțel","ghigortelului":"ghigorțel","ghigorti":"ghigorț","ghigortii":"ghigorț","ghigortilor":"ghigorț","ghigortul":"ghigorț","ghigortule":"ghigorț","ghigortului":"ghigorț","ghigul":"ghig","ghigule":"ghig","ghigului":"ghig","ghiguri":"ghig","ghigurile":"ghig","ghigurilor":"ghig","ghijoage":"ghijoagă","ghijoagei":"ghijoagă","ghijoagele":"ghijoagă","ghijoagelor":"ghijoagă","ghilanta":["ghilantă","ghilant","ghilanta","ghilant"],"ghilante":"ghilant","ghilantele":"ghilant","ghilanti":"ghilant","ghilantii":"ghilant","ghilantul":"ghilant","ghilde":"ghildă","ghildei":"ghildă","ghildele":"ghildă","ghildelor":"ghildă","ghilemelea":"ghilemele","ghilemelei":"ghilemele","ghilemelele":"ghilemele","ghilemelelor":"ghilemele","ghilicei":"ghilicel","ghiliceii":"ghilicel","ghiliceilor":"ghilicel","ghilicelul":"ghilicel","ghilicelule":"ghilicel","ghilicelului":"ghilicel","ghilimeli":"ghilimele","ghilimelile":"ghilimele","ghilimelilor":"ghilimele","ghilimetea":"ghilimete","ghilimetei":"ghilimete","ghilimetele":"ghilimete","ghilimetelor":"ghilimete","ghilosai":"ghiloșa","ghilosam":["ghiloșăm","ghiloșa","ghiloșam","ghiloșa"],"ghilosand":"ghiloșa","ghilosara":"ghiloșa","ghilosaram":"ghiloșa","ghilosarati":"ghiloșa","ghilosarea":"ghiloșare","ghilosari":"ghiloșare","ghilosarii":"ghiloșare","ghilosarile":"ghiloșare","ghilosarilor":"ghiloșare","ghilosase":"ghiloșa","ghilosasem":"ghiloșa","ghilosasera":"ghiloșa","ghilosaseram":"ghiloșa","ghilosaserati":"ghiloșa","ghilosasesi":"ghiloșa","ghilosasi":"ghiloșa","ghilosat":"ghiloșa","ghilosati":"ghiloșa","ghilosau":"ghiloșa","ghiloseaza":"ghiloșa","ghilosez":"ghiloșa","ghilosezi":"ghiloșa","ghilosul":"ghiloș","ghilosule":"ghiloș","ghilosului":"ghiloș","ghilosuri":"ghiloș","ghilosurile":"ghiloș","ghilosurilor":"ghiloș","ghilotinai":"ghilotina","ghilotinam":["ghilotinăm","ghilotina","ghilotinam","ghilotina"],"ghilotinand":"ghilotina","ghilotinara":"ghilotina","ghilotinaram":"ghilotina","ghilotinarati":"ghilotina","ghilotinarea":"ghilotinare","ghilotinari":"ghilotinare","ghilotinarii":"ghilotinare","ghilotinarile":"ghilotinare","ghilotinarilor":"ghilotinare","ghilotinase":"ghilotina","ghilotinasem":"ghilotina","ghilotinasera":"ghilotina","ghilotinaseram":"ghilotina","ghilotinaserati":"ghilotina","ghilotinasesi":"ghilotina","ghilotinasi":"ghilotina","ghilotinat":"ghilotina","ghilotinata":["ghilotinată","ghilotinat","ghilotinata","ghilotinat"],"ghilotinate":"ghilotinat","ghilotinatele":"ghilotinat","ghilotinati":["ghilotinați","ghilotina","ghilotinați","ghilotinat"],"ghilotinatii":"ghilotinat","ghilotinatul":"ghilotinat","ghilotinau":"ghilotina","ghilotine":"ghilotină","ghilotineaza":"ghilotina","ghilotinei":"ghilotină","ghilotinele":"ghilotină","ghilotinelor":"ghilotină","ghilotinez":"ghilotina","ghilotinezi":"ghilotina","ghilti":"ghilț","ghiltii":"ghilț","ghiltilor":"ghilț","ghiltul":"ghilț","ghiltule":"ghilț","ghiltului":"ghilț","ghimberul":"ghimber","ghimberule":"ghimber","ghimberului":"ghimber","ghimbir":"ghimber","ghimbirul":"ghimbir","ghimbirule":"ghimbir","ghimbirului":"ghimbir","ghimerlia":"ghimerlie","ghimerliei":"ghimerlie","ghimerlii":"ghimerlie","ghimerliile":"ghimerlie","ghimerliilor":"ghimerlie","ghimia":"ghimie","ghimiei":"ghimie","ghimigii":"ghimigiu","ghimigiii":"ghimigiu","ghimigiilor":"ghimigiu","ghimigiuul":"ghimigiu","ghimigiuule":"ghimigiu","ghimigiuului":"ghimigiu","ghimii":"ghimie","ghimiile":"ghimie","ghimiilor":"ghimie","ghimirlia":"ghimirlie","ghimirliei":"ghimirlie","ghimirlii":"ghimirlie","ghimirliile":"ghimirlie","ghimirliilor":"ghimirlie","ghimp":"ghimpe","ghimparite":"ghimpariță","ghimparitei":"ghimpariță","ghimparitele":"ghimpariță","ghimparitelor":"ghimpariță","ghimpata":["ghimpată","ghimpat","ghimpata","ghimpat"],"ghimpate":"ghimpat","ghimpatele":"ghimpat","ghimpati":"ghimpat","ghimpatii":"ghimpat","ghimpatul":"ghimpat","ghimpele":"ghimpe","ghimpelui":"ghimpe","ghimpi":"ghimpe","ghimpii":"ghimpe","ghimpilor":"ghimpe","ghimpoasa":["ghimpoasă","ghimpos","ghimpoasa","ghimpos"],"ghimpoase":"ghimpos","ghimpoasele":"ghimpos","ghimposi":"ghimpos","ghimposii":"ghimpos","ghimposul":"ghimpos","ghimpurusi":"ghimpuruș","ghimpurusii":"ghimpuruș","ghimpurusilor":"ghimpuruș","ghimpurusul":"ghimpuruș","ghimpurusule":"ghimpuruș","ghimpurusului":"ghimpuruș","ghinarari":"ghinărar","ghincari":"ghincar","ghincarii":"ghincar","ghincarilor":"ghincar","ghincarul":"ghincar","ghincarule":"ghincar","ghincarului":"ghincar","ghindari":"ghindar","ghindarii":"ghindar","ghindarilor":"ghindar","ghindarul":"ghindar","ghindarule":"ghindar","ghindarului":"ghindar","ghinde":"ghindă","ghindei":"ghindă","ghindele":"ghindă","ghindelor":"ghindă","ghindisori":"ghindișor","ghindisorii":"ghindișor","ghindisorilor":"ghindișor","ghindisorul":"ghindișor","ghindisorule":"ghindișor","ghindisorului":"ghindișor","ghindoci":"ghindoc","ghindocii":"ghindoc","ghindocilor":"ghindoc","ghindocul":"ghindoc","ghindocule":"ghindoc","ghindocului":"ghindoc","ghindurarari":"ghindurare","ghindurararii":"ghindurare","ghindurararile":"ghindurare","ghindurararilor":"ghindurare","ghindurarea":"ghindurare","ghindureaua":"ghindurea","ghindurele":"ghindurea","ghindurelei":"ghindurea","ghindurelele":"ghindurea","ghindurelelor":"ghindurea","ghinduri":"ghindură","ghindurici":"ghindurică","ghinduricii":"ghindurică","ghinduricile":"ghindurică","ghinduricilor":"ghindurică","ghindurii":"ghindură","ghindurile":"ghindură","ghindurilor":"ghindură","ghinduroasa":["ghinduroasă","ghinduros","ghinduroasa","ghinduros"],"ghinduroase":"ghinduros","ghinduroasele":"ghinduros","ghindurosi":"ghinduros","ghindurosii":"ghinduros","ghindurosul":"ghinduros","ghine":"ghină","ghinei":"ghină","ghinele":"ghină","ghinelor":"ghină","ghinioniste":"ghinionistă","ghinionistei":"ghinionistă","ghinionistele":"ghinionistă","ghinionistelor":"ghinionistă","ghinionisti":["ghinioniști","ghinionist","ghinionisti","ghinionist"],"ghinionistii":"ghinionist","ghinionistilor":"ghinionist","ghinionistul":"ghinionist","ghinionistule":"ghinionist","ghinionistului":"ghinionist","ghinoane":"ghinion","ghintiane":"ghințiană","ghintuirea":"ghintuire","ghintuiri":"ghintuire","ghintuirii":"ghintuire","ghintuirile":"ghintuire","ghintuirilor":"ghintuire","ghintulete":"ghintuleț","ghintuletele":"ghintuleț","ghintuletelor":"ghintuleț","ghintuletul":"ghintuleț","ghintuletule":"ghintuleț","ghintuletului":"ghintuleț","ghinture":"ghințură","ghintureaua":"ghințurea","ghinturei":"ghințură","ghinturele":["ghințurele","ghințură","ghințurele","ghințurea"],"ghinturelei":"ghințurea","ghinturelele":"ghințurea","ghinturelelor":"ghințurea","ghinturelor":"ghințură","ghioaca":"ghioc","ghioage":"ghioagă","ghioagei":"ghioagă","ghioagele":"ghioagă","ghioagelor":"ghioagă","ghioambe":"ghioambă","ghioambei":"ghioambă","ghioambele":"ghioambă","ghioambelor":"ghioambă","ghiobul":"ghiob","ghiobule":"ghiob","ghiobulete":"ghiobuleț","ghiobuletele":"ghiobuleț","ghiobuletelor":"ghiobuleț","ghiobuletul":"ghiobuleț","ghiobuletule":"ghiobuleț","ghiobuletului":"ghiobuleț","ghiobului":"ghiob","ghioburi":"ghiob","ghioburile":"ghiob","ghioburilor":"ghiob","ghiocei":"ghiocel","ghioceii":"ghiocel","ghioceilor":"ghiocel","ghiocelul":"ghiocel","ghiocelule":"ghiocel","ghiocelului":"ghiocel","ghioci":"ghioc","ghiocii":"ghioc","ghiocilor":"ghioc","ghiocul":"ghioc","ghiocule":"ghioc","ghiocului":"ghioc","ghiocuri":"ghioc","ghiocurile":"ghioc","ghiocurilor":"ghioc","ghioldasi":"ghioldaș","ghioldasii":"ghioldaș","ghioldasilor":"ghioldaș","ghioldasul":"ghioldaș","ghioldasule":"ghioldaș","ghioldasului":"ghioldaș","ghioldul":"ghiold","ghioldule":"ghiold","ghioldului":"ghiold","ghioldumul":"ghioldum","ghioldumule":"ghioldum","ghioldumului":"ghioldum","ghioldumuri":"ghioldum","ghioldumurile":"ghioldum","ghioldumurilor":"ghioldum","ghiolduri":"ghiold","ghioldurile":"ghiold","ghioldurilor":"ghiold","ghiolul":"ghiol","ghiolule":"ghiol","ghiolului":"ghiol","ghioluri":"ghiol","ghiolurile":"ghiol","ghiolurilor":"ghiol","ghiomotoace":"ghiomotoc","ghiomotoacele":"ghiomotoc","ghiomotoacelor":"ghiomotoc","ghiomotocul":"ghiomotoc","ghiomotocule":"ghiomotoc","ghiomotocului":"ghiomotoc","ghionoaie sure":"ghionoaie sură","ghionoaie verzi":"ghionoaie verde","ghionoaiea":"ghionoaie","ghionoi":"ghionoaie","ghionoii":"ghionoaie","ghionoile":"ghionoaie","ghionoilor":"ghionoaie","ghiontea":"ghionti","ghionteai":"ghionti","ghionteam":"ghionti","ghionteati":"ghionti","ghionteau":"ghionti","ghiontesc":"ghionti","ghionteste":"ghionti","ghiontesti":"ghionti","ghiontii":"ghionti","ghiontim":"ghionti","ghiontind":"ghionti","ghiontira":"ghionti","ghiontiram":"ghionti","ghiontirati":"ghionti","ghiontirea":"ghiontire","ghiontiri":"ghiontire","ghiontirii":"ghiontire","ghiontirile":"ghiontire","ghiontirilor":"ghiontire","ghiontise":"ghionti","ghiontisem":"ghionti","ghiontisera":"ghionti","ghiontiseram":"ghionti","ghiontiserati":"ghionti","ghiontisesi":"ghionti","ghiontisi":"ghionti","ghiontit":"ghionti","ghiontiti":"ghionti","ghiontitul":"ghiontit","ghiontitule":"ghiontit","ghiontitului":"ghiontit","ghiontituri":"ghiontit","ghiontiturile":"ghiontit","ghiontiturilor":"ghiontit","ghiontueste":"ghiontui","ghiontuia":"ghiontui","ghiontuiai":"ghiontui","ghiontuiam":"ghiontui","ghiontuiati":"ghiontui","ghiontuiau":"ghiontui","ghiontuiele":"ghiontuială","ghiontuielei":"ghiontuială","ghiontuielele":"ghiontuială","ghiontuielelor":"ghiontuială","ghiontuieli":"ghiontuială","ghiontuiesc":"ghiontui","ghiontuieste":"ghiontui","ghiontuiesti":"ghiontui","ghiontuii":"ghiontui","ghiontuim":"ghiontui","ghiontuind":"ghiontui","ghiontuira":"ghiontui","ghiontuiram":"ghiontui","ghiontuirati":"ghiontui","ghiontuise":"ghiontui","ghiontuisem":"ghiontui","ghiontuisera":"ghiontui","ghiontuiseram":"ghiontui","ghiontuiserati":"ghiontui","ghiontuisesi":"ghiontui","ghiontuisi":"ghiontui","ghiontuit":"ghiontui","ghiontuiti":"ghiontui","ghiontul":"ghiont","ghiontule":"ghiont","ghiontului":"ghiont","ghionturi":"ghiont","ghionturile":"ghiont","ghionturilor":"ghiont","ghioraia":"ghiorăi","ghioraiai":"ghiorăi","ghioraiam":"ghiorăi","ghioraiati":"ghiorăi","ghioraiau":"ghiorăi","ghioraie":"ghiorăi","ghioraiele":"ghiorăială","ghioraielei":"ghiorăială","ghioraielele":"ghiorăială","ghioraielelor":"ghiorăială","ghioraieli":"ghiorăială","ghioraii":"ghiorăi","ghioraim":"ghiorăi","ghioraind":"ghiorăi","ghioraira":"ghiorăi","ghiorairam":"ghiorăi","ghiorairati":"ghiorăi","ghioraise":"ghiorăi","ghioraisem":"ghiorăi","ghioraisera":"ghiorăi","ghioraiseram":"ghiorăi","ghioraiserati":"ghiorăi","ghioraisesi":"ghiorăi","ghioraisi":"ghiorăi","ghiorait":"ghiorăi","ghioraiti":"ghiorăi","ghioraitul":"ghiorăit","ghioraitule":"ghiorăit","ghioraitului":"ghiorăit","ghioraituri":["ghiorăituri","ghiorăit","ghiorăituri","ghiorăitură"],"ghioraiturile":"ghiorăit","ghioraiturilor":"ghiorăit","ghiordane":"ghiordan","ghiordanele":"ghiordan","ghiordanelor":"ghiordan","ghiordanul":"ghiordan","ghiordanule":"ghiordan","ghiordanului":"ghiordan","ghiordeici":"ghiordeică","ghiordeicii":"ghiordeică","ghiordeicile":"ghiordeică","ghiordeicilor":"ghiordeică","ghiordumul":"ghiordum","ghiordumule":"ghiordum","ghiordumului":"ghiordum","ghiordumuri":"ghiordum","ghiordumurile":"ghiordum","ghiordumurilor":"ghiordum","ghiorlani":"ghiorlan","ghiorlanii":"ghiorlan","ghiorlanilor":"ghiorlan","ghiorlanul":"ghiorlan","ghiorlanule":"ghiorlan","ghiorlanului":"ghiorlan","ghiorsi":"ghiorș","ghiorsii":"ghiorș","ghiorsilor":"ghiorș","ghiorsul":"ghiorș","ghiorsule":"ghiorș","ghiorsului":"ghiorș","ghiortaia":"ghiorțăi","ghiortaiai":"ghiorțăi","ghiortaiam":"ghiorțăi","ghiortaiati":"ghiorțăi","ghiortaiau":"ghiorțăi","ghiortaie":"ghiorțăi","ghiortaii":"ghiorțăi","ghiortaim":"ghiorțăi","ghiortaind":"ghiorțăi","ghiortaira":"ghiorțăi","ghiortairam":"ghiorțăi","ghiortairati":"ghiorțăi","ghiortaise":"ghiorțăi","ghiortaisem":"ghiorțăi","ghiortaisera":"ghiorțăi","ghiortaiseram":"ghiorțăi","ghiortaiserati":"ghiorțăi","ghiortaisesi":"ghiorțăi","ghiortaisi":"ghiorțăi","ghiortait":"ghiorțăi","ghiortaiti":"ghiorțăi","ghiose":"ghioșă","ghiosei":"ghioșă","ghiosele":"ghioșă","ghioselor":"ghioșă","ghioslomeaua":"ghioslomea","ghioslomele":"ghioslomea","ghioslomelei":"ghioslomea","ghioslomelele":"ghioslomea","ghioslomelelor":"ghioslomea","ghiota":["ghiotă","ghiot","ghiota","ghiot"],"ghiote":"ghiot","ghiotele":"ghiot","ghioti":"ghiot","ghiotii":"ghiot","ghiotul":"ghiot","ghioture":"ghiotură","ghioturei":"ghiotură","ghioturele":"ghiotură","ghioturelor":"ghiotură","ghiozdanase":"ghiozdănaș","ghiozdanasele":"ghiozdănaș","ghiozdanaselor":"ghiozdănaș","ghiozdanasul":"ghiozdănaș","ghiozdanasule":"ghiozdănaș","ghiozdanasului":"ghiozdănaș","ghiozdane":"ghiozdan","ghiozdanele":["ghiozdanele","ghiozdan","ghiozdănele","ghiozdănel"],"ghiozdanelele":"ghiozdănel","ghiozdanelelor":"ghiozdănel","ghiozdanelor":"ghiozdan","ghiozdanelul":"ghiozdănel","ghiozdanelule":"ghiozdănel","ghiozdanelului":"ghiozdănel","ghiozdanul":"ghiozdan","ghiozdanule":"ghiozdan","ghiozdanului":"ghiozdan","ghipcani":"ghipcan","ghipcanii":"ghipcan","ghipcanilor":"ghipcan","ghipcanul":"ghipcan","ghipcanule":"ghipcan","ghipcanului":"ghipcan","ghipiuri":"ghipiură","ghipiurii":"ghipiură","ghipiurile":"ghipiură","ghipiurilor":"ghipiură","ghips":"gips","ghipsoteci":"ghipsotecă","ghipsotecii":"ghipsotecă","ghipsotecile":"ghipsotecă","ghipsotecilor":"ghipsotecă","ghipsul":"ghips","ghipsule":"ghips","ghipsului":"ghips","ghipsuri":"ghips","ghipsurile":"ghips","ghipsurilor":"ghips","ghirdane":"ghirdan","ghirdanele":"ghirdan","ghirdanelor":"ghirdan","ghirdanul":"ghirdan","ghirdanule":"ghirdan","ghirdanului":"ghirdan","ghire":"ghiră","ghirei":"ghiră","ghirele":"ghiră","ghirelor":"ghiră","ghirete":"ghireată","ghiretei":"ghireată","ghiretele":"ghireată","ghiretelor":"ghireată","ghirlande":"ghirlandă","ghirlandei":"ghirlandă","ghirlandele":"ghirlandă","ghirlandelor":"ghirlandă","ghirlante":"ghirlantă","ghisee":"ghișeu","ghiseele":"ghișeu","ghiseelor":"ghișeu","ghisete":"ghișet","ghisetele":"ghișet","ghisetelor":"ghișet","ghisetul":"ghișet","ghisetule":"ghișet","ghisetului":"ghișet","ghiseul":"ghișeu","ghiseule":"ghișeu","ghiseului":"ghișeu","ghitanelul":"ghitănel","ghitanelule":"ghitănel","ghitanelului":"ghitănel","ghitare":"ghitară","ghitarei":"ghitară","ghitarele":"ghitară","ghitarelor":"ghitară","ghitariste":"ghitaristă","ghitaristei":"ghitaristă","ghitaristele":"ghitaristă","ghitaristelor":"ghitaristă","ghitaristi":"ghitarist","ghitoasa":["ghițoasă","ghițos","ghițoasa","ghițos"],"ghitoase":"ghițos","ghitoasele":"ghițos","ghitosi":"ghițos","ghitosii":"ghițos","ghitosul":"ghițos","ghiudemul":"ghiudem","ghiudemule":"ghiudem","ghiudemului":"ghiudem","ghiudemuri":"ghiudem","ghiudemurile":"ghiudem","ghiudemurilor":"ghiudem","ghiudenul":"ghiuden","ghiudenule":"ghiuden","ghiudenului":"ghiuden","ghiudenuri":"ghiuden","ghiudenurile":"ghiuden","ghiudenurilor":"ghiuden","ghiufe":"ghiufă","ghiufei":"ghiufă","ghiufele":"ghiufă","ghiufelor":"ghiufă","ghiuitauul":"ghiuitău","ghiuitauule":"ghiuitău","ghiuitauului":"ghiuitău","ghiuji":"ghiuj","ghiujii":"ghiuj","ghiujilor":"ghiuj","ghiujul":"ghiuj","ghiujule":"ghiuj","ghiujului":"ghiuj","ghiuleaua":"ghiulea","ghiulele":"ghiulea","ghiulelei":"ghiulea","ghiulelele":"ghiulea","ghiulelelor":"ghiulea","ghiulul":"ghiul","ghiulule":"ghiul","ghiulului":"ghiul","ghiuluri":"ghiul","ghiulurile":"ghiul","ghiulurilor":"ghiul","ghiulusul":"ghiuluș","ghiulusule":"ghiuluș","ghiulusului":"ghiuluș","ghiulusuri":"ghiuluș","ghiulusurile":"ghiuluș","ghiulusurilor":"ghiuluș","ghiumbruccii":"ghiumbrucciu","ghiumbrucciii":"ghiumbrucciu","ghiumbrucciilor":"ghiumbrucciu","ghiumbrucciuul":"ghiumbrucciu","ghiumbrucciuule":"ghiumbrucciu","ghiumbrucciuului":"ghiumbrucciu","ghiumbrucul":"ghiumbruc","ghiumbrucule":"ghiumbruc","ghiumbrucului":"ghiumbruc","ghiumbrucuri":"ghiumbruc","ghiumbrucurile":"ghiumbruc","ghiumbrucurilor":"ghiumbruc","ghiumul":"ghium","ghiumule":"ghium","ghiumului":"ghium","ghiumuri":"ghium","ghiumurile":"ghium","ghiumurilor":"ghium","ghiundelicul":"ghiundelic","ghiundelicule":"ghiundelic","ghiundelicului":"ghiundelic","ghiundelicuri":"ghiundelic","ghiundelicurile":"ghiundelic","ghiundelicurilor":"ghiundelic","ghiunia":"ghiunie","ghiuniei":"ghiunie","ghiunii":"ghiunie","ghiuniile":"ghiunie","ghiuniilor":"ghiunie","ghiurghiulia":"ghiurghiuliu","ghiurghiulie":"ghiurghiuliu","ghiurghiulii":"ghiurghiuliu","ghiurghiuliii":"ghiurghiuliu","ghiurghiuliile":"ghiurghiuliu","ghiurghiuliul":"ghiurghiuliu","ghiurtul":"ghiurt","ghiurtule":"ghiurt","ghiurtului":"ghiurt","ghiuvergileaua":"ghiuvergilea","ghiuvergilele":"ghiuvergilea","ghiuvergilelei":"ghiuvergilea","ghiuzita":["ghiuzită","ghiuzit","ghiuzita","ghiuzit"],"ghiuzite":"ghiuzit","ghiuzitele":"ghiuzit","ghiuziti":"ghiuzit","ghiuzitii":"ghiuzit","ghiuzitul":"ghiuzit","ghivece":"ghiveci","ghivecele":"ghiveci","ghivecelor":"ghiveci","ghiveciul":"ghiveci","ghiveciule":"ghiveci","ghiveciului":"ghiveci","ghivizia":"ghiviziu","ghivizie":"ghiviziu","ghivizii":"ghiviziu","ghiviziii":"ghiviziu","ghiviziile":"ghiviziu","ghiviziul":"ghiviziu","ghizdane":"ghizdan","ghizdava":["ghizdavă","ghizdav","ghizdava","ghizdav"],"ghizdave":"ghizdav","ghizdavele":"ghizdav","ghizdavi":"ghizdav","ghizdavii":"ghizdav","ghizdavul":"ghizdav","ghizde":"ghizd","ghizdeaua":"ghizdea","ghizdeii":"ghizdei","ghizdeilor":"ghizdei","ghizdeiul":"ghizdei","ghizdeiule":"ghizdei","ghizdeiului":"ghizdei","ghizdele":["ghizdele","ghizd","ghizdele","ghizdea"],"ghizdelei":"ghizdea","ghizdelele":"ghizdea","ghizdelelor":"ghizdea","ghizdelor":"ghizd","ghizdul":"ghizd","ghizdule":"ghizd","ghizdului":"ghizd","ghizi":"ghid","ghizi turistici":"ghid turistic","ghizia":"ghizie","ghiziei":"ghizie","ghizii":["ghizii","ghid","ghizii","ghizie"],"ghizilor":"ghid","ghizlucele":"ghizlucel","ghizlucelele":"ghizlucel","ghizlucelelor":"ghizlucel","ghizlucelul":"ghizlucel","ghizlucelule":"ghizlucel","ghizlucelului":"ghizlucel","giaca":"geacă","giace":"giacă","giacei":"giacă","giacele":"giacă","giacelor":"giacă","giardiaze":"giardiază","giardiazei":"giardiază","giardiazele":"giardiază","giardiazelor":"giardiază","gibereline":"giberelină","giberelinei":"giberelină","giberelinele":"giberelină","giberelinelor":"giberelină","giberne":"gibernă","gibernei":"gibernă","gibernele":"gibernă","gibernelor":"gibernă","giboni":"gibon","gibonii":"gibon","gibonilor":"gibon","gibonul":"gibon","gibonule":"gibon","gibonului":"gibon","gibozitatea":"gibozitate","gibozitati":"gibozitate","gibozitatii":"gibozitate","gibozitatile":"gibozitate","gibozitatilor":"gibozitate","gidogini":"gidogină","gidoginii":"gidogină","gidoginile":"gidogină","gidoginilor":"gidogină","gidunia":"gidunie","giduniei":"gidunie","gidunii":"gidunie","giduniile":"gidunie","giduniilor":"gidunie","gigacaloria":"gigacalorie","gigacaloriei":"gigacalorie","gigacalorii":"gigacalorie","gigacaloriile":"gigacalorie","gigacaloriilor":"gigacalorie","gigahertzi":"gigahertz","gigahertzii":"gigahertz","gigahertzilor":"gigahertz","gigahertzul":"gigahertz","gigahertzule":"gigahertz","gigahertzului":"gigahertz","gigante":"gigantă","giganteasca":["gigantească","gigantesc","giganteasca","gigantesc"],"gigantei":"gigantă","gigantele":"gigantă","gigantelor":"gigantă","gigantescul":"gigantesc","gigantesti":"gigantesc","gigantestii":"gigantesc","gigantestile":"gigantesc","giganti":"gigant","gigantica":["gigantică","gigantic","gigantica","gigantic"],"gigantice":"gigantic","giganticele":"gigantic","gigantici":"gigantic","giganticii":"gigantic","giganticul":"gigantic","gigantii":"gigant","gigantilor":"gigant","gigantismul":"gigantism","gigantismule":"gigantism","gigantismului":"gigantism","gigantizai":"gigantiza","gigantizam":["gigantizăm","gigantiza","gigantizam","gigantiza"],"gigantizand":"gigantiza","gigantizara":"gigantiza","gigantizaram":"gigantiza","gigantizarati":"gigantiza","gigantizarea":"gigantizare","gigantizari":"gigantizare","gigantizarii":"gigantizare","gigantizarile":"gigantizare","gigantizarilor":"gigantizare","gigantizase":"gigantiza","gigantizasem":"gigantiza","gigantizasera":"gigantiza","gigantizaseram":"gigantiza","gigantizaserati":"gigantiza","gigantizasesi":"gigantiza","gigantizasi":"gigantiza","gigantizat":"gigantiza","gigantizati":"gigantiza","gigantizau":"gigantiza","gigantizeaza":"gigantiza","gigantizez":"gigantiza","gigantizezi":"gigantiza","gigantomahia":"gigantomahie","gigantomahiei":"gigantomahie","gigantomahii":"gigantomahie","gigantul":"gigant","gigantule":"gigant","gigantului":"gigant","gige":"gigă","gigei":"gigă","gigice":"gigică","gigicele":"gigică","gigolete":"gigoletă","gigoletei":"gigoletă","gigoletele":"gigoletă","gigoletelor":"gigoletă","gigoloul":"gigolo","gigoloule":"gigolo","gigoloului":"gigolo","gilaluia":"gilălui","gilaluiai":"gilălui","gilaluiam":"gilălui","gilaluiati":"gilălui","gilaluiau":"gilălui","gilaluiesc":"gilălui","gilaluieste":"gilălui","gilaluiesti":"gilălui","gilaluii":"gilălui","gilaluim":"gilălui","gilaluind":"gilălui","gilaluira":"gilălui","gilaluiram":"gilălui","gilaluirati":"gilălui","gilaluise":"gilălui","gilaluisem":"gilălui","gilaluisera":"gilălui","gilaluiseram":"gilălui","gilaluiserati":"gilălui","gilaluisesi":"gilălui","gilaluisi":"gilălui","gilaluit":"gilălui","gilaluiti":"gilălui","giletci":"giletcă","giletcii":"giletcă","giletcile":"giletcă","giletcilor":"giletcă","gilosagul":"giloșag","gilosagule":"giloșag","gilosagului":"giloșag","gilosaguri":"giloșag","gilosagurile":"giloșag","gilosagurilor":"giloșag","gilotajul":"gilotaj","gilotajule":"gilotaj","gilotajului":"gilotaj","gimba":"gâmba","gimnaste":"gimnastă","gimnastei":"gimnastă","gimnastele":"gimnastă","gimnastelor":"gimnastă","gimnasti":"gimnast","gimnastica":["gimnastică","gimnastic","gimnastica","gimnastic"],"gimnastice":"gimnastic","gimnasticele":"gimnastic","gimnastici":["gimnastici","gimnastic","gimnastici","gimnastică"],"gimnasticii":["gimnasticii","gimnastic","gimnasticii","gimnastică"],"gimnasticile":"gimnastică","gimnasticilor":"gimnastică","gimnasticul":"gimnastic","gimnastii":"gimnast","gimnastilor":"gimnast","gimnastul":"gimnast","gimnastule":"gimnast","gimnastului":"gimnast","gimnaziala":["gimnazială","gimnazial","gimnaziala","gimnazial"],"gimnaziale":"gimnazial","gimnazialele":"gimnazial","gimnaziali":"gimnazial","gimnazialii":"gimnazial","gimnazialul":"gimnazial","gimnaziarhi":"gimnaziarh","gimnaziarhii":"gimnaziarh","gimnaziarhilor":"gimnaziarh","gimnaziarhul":"gimnaziarh","gimnaziarhule":"gimnaziarh","gimnaziarhului":"gimnaziarh","gimnaziasti":"gimnaziast","gimnaziastii":"gimnaziast","gimnaziastilor":"gimnaziast","gimnaziastul":"gimnaziast","gimnaziastule":"gimnaziast","gimnaziastului":"gimnaziast","gimnazieri":"gimnazier","gimnazierii":"gimnazier","gimnazierilor":"gimnazier","gimnazierul":"gimnazier","gimnazierule":"gimnazier","gimnazierului":"gimnazier","gimnazii":"gimnaziu","gimnaziste":"gimnazistă","gimnazistei":"gimnazistă","gimnazistele":"gimnazistă","gimnazistelor":"gimnazistă","gimnazisti":"gimnazist","gimnazistii":"gimnazist","gimnazistilor":"gimnazist","gimnazistul":"gimnazist","gimnazistule":"gimnazist","gimnazistului":"gimnazist","gimnica":["gimnică","gimnic","gimnica","gimnic"],"gimnice":"gimnic","gimnicele":"gimnic","gimnici":"gimnic","gimnicii":"gimnic","gimnicul":"gimnic","gimnofobia":"gimnofobie","gimnofobiei":"gimnofobie","gimnofobii":"gimnofobie","gimnofobiile":"gimnofobie","gimnofobiilor":"gimnofobie","gimnosperme":"gimnospermă","gimnospermei":"gimnospermă","gimnospermele":"gimnospermă","gimnospermelor":"gimnospermă","gimnosporul":"gimnospor","gimnosporule":"gimnospor","gimnosporului":"gimnospor"};
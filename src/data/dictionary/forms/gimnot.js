@@ -0,0 +1 @@
+export default {"gimnoti":"gimnot","gimnotii":"gimnot","gimnotilor":"gimnot","gimnotul":"gimnot","gimnotule":"gimnot","gimnotului":"gimnot","gimnozofia":"gimnozofie","gimnozofiei":"gimnozofie","gimnozofii":"gimnozofie","gimnozofisti":"gimnozofist","gimnozofistii":"gimnozofist","gimnozofistilor":"gimnozofist","gimnozofistul":"gimnozofist","gimnozofistule":"gimnozofist","gimnozofistului":"gimnozofist","ginandra":["ginandră","ginandru","ginandra","ginandru"],"ginandre":"ginandru","ginandrele":"ginandru","ginandri":"ginandru","ginandria":"ginandrie","ginandriei":"ginandrie","ginandrii":["ginandrii","ginandrie","ginandrii","ginandru"],"ginandriile":"ginandrie","ginandriilor":"ginandrie","ginandrul":"ginandru","ginea":"gini","gineai":"gini","gineam":"gini","gineati":"gini","gineau":"gini","ginecee":"gineceu","ginecocratia":"ginecocrație","ginecocratiei":"ginecocrație","ginecocratii":"ginecocrație","ginecocratiile":"ginecocrație","ginecocratiilor":"ginecocrație","ginecofobia":"ginecofobie","ginecofobiei":"ginecofobie","ginecofobii":"ginecofobie","ginecofobiile":"ginecofobie","ginecofobiilor":"ginecofobie","ginecologe":"ginecologă","ginecologei":"ginecologă","ginecologele":"ginecologă","ginecologelor":"ginecologă","ginecologi":"ginecolog","ginecologia":"ginecologie","ginecologica":["ginecologică","ginecologic","ginecologica","ginecologic"],"ginecologice":"ginecologic","ginecologicele":"ginecologic","ginecologici":"ginecologic","ginecologicii":"ginecologic","ginecologicul":"ginecologic","ginecologiei":"ginecologie","ginecologii":["ginecologii","ginecolog","ginecologii","ginecologie"],"ginecologilor":"ginecolog","ginecologul":"ginecolog","ginecologule":"ginecolog","ginecologului":"ginecolog","ginecomania":"ginecomanie","ginecomaniei":"ginecomanie","ginecomanii":"ginecomanie","ginecomaniile":"ginecomanie","ginecomaniilor":"ginecomanie","ginecomastia":"ginecomastie","ginecomastiei":"ginecomastie","ginecomastii":"ginecomastie","ginecopatia":"ginecopatie","ginecopatiei":"ginecopatie","ginecopatii":"ginecopatie","ginerasi":"gineraș","ginerasii":"gineraș","ginerasilor":"gineraș","ginerasul":"gineraș","ginerasule":"gineraș","ginerasului":"gineraș","ginerei":"ginerel","ginereii":"ginerel","ginereilor":"ginerel","ginerele":"ginere","ginerelui":"ginere","ginerelul":"ginerel","ginerelule":"ginerel","ginerelului":"ginerel","gineri":"ginere","gineria":"ginerie","gineriei":"ginerie","ginerii":["ginerii","ginere","ginerii","ginerie"],"gineriile":"ginerie","gineriilor":"ginerie","ginerilor":"ginere","gineroaice":"gineroaică","gineroaicei":"gineroaică","gineroaicele":"gineroaică","gineroaicelor":"gineroaică","ginesc":"gini","gineste":"gini","ginesti":"gini","ginestre":"ginestră","ginestrei":"ginestră","ginestrele":"ginestră","ginestrelor":"ginestră","gingasa":["gingașă","gingaș","gingașa","gingaș"],"gingase":"gingaș","gingasela":["gingășelă","gingășel","gingășela","gingășel"],"gingasele":["gingașele","gingaș","gingășele","gingășel"],"gingaselele":"gingășel","gingaseli":"gingășel","gingaselii":"gingășel","gingaselul":"gingășel","gingasi":"gingaș","gingasia":"gingășie","gingasiei":"gingășie","gingasii":["gingașii","gingaș","gingășii","gingășie"],"gingasiile":"gingășie","gingasiilor":"gingășie","gingasimea":"gingășime","gingasimi":"gingășime","gingasimii":"gingășime","gingasimile":"gingășime","gingasimilor":"gingășime","gingasituri":"gingășitură","gingasiturii":"gingășitură","gingasiturile":"gingășitură","gingasiturilor":"gingășitură","gingasul":"gingaș","gingeni":"gingenă","gingenii":"gingenă","gingenile":"gingenă","gingenilor":"gingenă","gingia":"gingie","gingieaua":"gingiea","gingiei":"gingie","gingiele":"gingiea","gingielei":"gingiea","gingielele":"gingiea","gingielelor":"gingiea","gingii":"gingie","gingiile":"gingie","gingiilor":"gingie","gingini":"gingină","ginginii":"gingină","ginginile":"gingină","ginginilor":"gingină","gingioare":"gingioară","gingioarei":"gingioară","gingioarele":"gingioară","gingioarelor":"gingioară","gingirici":"gingirică","gingiricii":"gingirică","gingiricile":"gingirică","gingiricilor":"gingirică","gingivala":["gingivală","gingival","gingivala","gingival"],"gingivale":"gingival","gingivalele":"gingival","gingivali":"gingival","gingivalii":"gingival","gingivalul":"gingival","gingivectomia":"gingivectomie","gingivectomiei":"gingivectomie","gingivectomii":"gingivectomie","gingivectomiile":"gingivectomie","gingivectomiilor":"gingivectomie","gingivite":"gingivită","gingivitei":"gingivită","gingivitele":"gingivită","gingivitelor":"gingivită","gingivoragia":"gingivoragie","gingivoragiei":"gingivoragie","gingivoragii":"gingivoragie","ginglimul":"ginglim","ginglimule":"ginglim","ginglimului":"ginglim","ginglimuri":"ginglim","ginglimurile":"ginglim","ginglimurilor":"ginglim","ginii":"gini","ginim":"gini","ginind":"gini","ginira":"gini","giniram":"gini","ginirati":"gini","ginirea":"ginire","giniri":"ginire","ginirii":"ginire","ginirile":"ginire","ginirilor":"ginire","ginise":"gini","ginisem":"gini","ginisera":"gini","giniseram":"gini","giniserati":"gini","ginisesi":"gini","ginisi":"gini","ginit":"gini","giniti":"gini","ginkgoi":"ginkgo","ginkgolor":"ginkgo","ginkgoul":"ginkgo","ginkgoule":"ginkgo","ginkgoului":"ginkgo","ginofore":"ginofor","ginoforele":"ginofor","ginoforelor":"ginofor","ginoforul":"ginofor","ginoforule":"ginofor","ginoforului":"ginofor","ginsengul":"ginseng","ginsengule":"ginseng","ginsengului":"ginseng","ginti":"gintă","ginturi":"gint","ginul":"gin","ginule":"gin","ginului":"gin","ginuri":"gin","ginurile":"gin","ginurilor":"gin","gioavle":"gioavlă","gioavlei":"gioavlă","gioavlele":"gioavlă","gioavlelor":"gioavlă","giobertite":"giobertit","giobertitele":"giobertit","giobertitelor":"giobertit","giobertitul":"giobertit","giobertitule":"giobertit","giobertitului":"giobertit","giolari":"giolar","giolarii":"giolar","giolarilor":"giolar","giolarul":"giolar","giolarule":"giolar","giolarului":"giolar","gionate":"gionat","gionatele":"gionat","gionatelor":"gionat","gionatul":"gionat","gionatule":"gionat","gionatului":"gionat","gipaeti":"gipaet","gipaetii":"gipaet","gipaetilor":"gipaet","gipaetul":"gipaet","gipaetule":"gipaet","gipaetului":"gipaet","gipsofile":"gipsofilă","gipsofilei":"gipsofilă","gipsofilele":"gipsofilă","gipsofilelor":"gipsofilă","gipsoteci":"gipsotecă","gipsul":"gips","gipsule":"gips","gipsului":"gips","girafe":"girafă","girafei":"girafă","girafele":"girafă","girafelor":"girafă","girai":"gira","giram":["girăm","gira","giram","gira"],"girand":"gira","girandole":"girandolă","girandolei":"girandolă","girandolele":"girandolă","girandolelor":"girandolă","giranti":"girant","girara":"gira","giraram":"gira","girarati":"gira","girase":"gira","girasem":"gira","girasera":"gira","giraseram":"gira","giraserati":"gira","girasesi":"gira","girasi":"gira","girat":"gira","girati":"gira","giratia":"girație","giratiei":"girație","giratii":"girație","giratiile":"girație","giratiilor":"girație","giratoria":"giratoriu","giratorie":"giratoriu","giratorii":"giratoriu","giratoriii":"giratoriu","giratoriile":"giratoriu","giratoriul":"giratoriu","girau":"gira","gireaza":"gira","girez":"gira","girezi":"gira","girobusole":"girobusolă","girobusolei":"girobusolă","girobusolele":"girobusolă","girobusolelor":"girobusolă","giroclinometre":"giroclinometru","giroclinometrele":"giroclinometru","giroclinometrelor":"giroclinometru","giroclinometrul":"giroclinometru","giroclinometrule":"giroclinometru","giroclinometrului":"giroclinometru","girocompase":"girocompas","girocompasele":"girocompas","girocompaselor":"girocompas","girocompasul":"girocompas","girocompasule":"girocompas","girocompasului":"girocompas","girodine":"girodină","girodinei":"girodină","girodinele":"girodină","girodinelor":"girodină","girodirectionale":"girodirecțional","girodirectionalele":"girodirecțional","girodirectionalelor":"girodirecțional","girodirectionalul":"girodirecțional","girodirectionalule":"girodirecțional","girodirectionalului":"girodirecțional","giromantia":"giromanție","giromantiei":"giromanție","giromantii":"giromanție","giromantiile":"giromanție","giromantiilor":"giromanție","girometre":"girometru","girometrele":"girometru","girometrelor":"girometru","girometrul":"girometru","girometrule":"girometru","girometrului":"girometru","girondini":"girondin","girondinii":"girondin","girondinilor":"girondin","girondinul":"girondin","girondinule":"girondin","girondinului":"girondin","giroorizontul":"giroorizont","giroorizontule":"giroorizont","giroorizontului":"giroorizont","giroorizonturi":"giroorizont","giroorizonturile":"giroorizont","giroorizonturilor":"giroorizont","giropiloti":"giropilot","giropilotii":"giropilot","giropilotilor":"giropilot","giropilotul":"giropilot","giropilotule":"giropilot","giropilotului":"giropilot","giroplane":"giroplan","giroplanele":"giroplan","giroplanelor":"giroplan","giroplanul":"giroplan","giroplanule":"giroplan","giroplanului":"giroplan","giroscoape":"giroscop","giroscoapele":"giroscop","giroscoapelor":"giroscop","giroscopica":["giroscopică","giroscopic","giroscopica","giroscopic"],"giroscopice":"giroscopic","giroscopicele":"giroscopic","giroscopici":"giroscopic","giroscopicii":"giroscopic","giroscopicul":"giroscopic","giroscopul":"giroscop","giroscopule":"giroscop","giroscopului":"giroscop","girostatica":["girostatică","girostatic","girostatica","girostatic"],"girostatice":"girostatic","girostaticele":"girostatic","girostatici":"girostatic","girostaticii":"girostatic","girostaticul":"girostatic","girostatul":"girostat","girostatule":"girostat","girostatului":"girostat","girostaturi":"girostat","girostaturile":"girostat","girostaturilor":"girostat","giruete":"giruetă","giruetei":"giruetă","giruetele":"giruetă","giruetelor":"giruetă","girusul":"girus","girusule":"girus","girusului":"girus","girusuri":"girus","girusurile":"girus","girusurilor":"girus","gisca":"gâscă","giscan":"gâscan","gitane":"gitană","gitanei":"gitană","gitanele":"gitană","gitanelor":"gitană","giubeaua":"giubea","giubele":"giubea","giubelei":"giubea","giubelele":"giubea","giubelelor":"giubea","giubelii":"giubeliu","giubeliii":"giubeliu","giubeliilor":"giubeliu","giubeliuul":"giubeliu","giubeliuule":"giubeliu","giubeliuului":"giubeliu","giubeluse":"giubelușă","giubelusei":"giubelușă","giubelusele":"giubelușă","giubeluselor":"giubelușă","giubelute":"giubeluță","giubelutei":"giubeluță","giubelutele":"giubeluță","giubelutelor":"giubeluță","giubene":"giuben","giubenele":"giuben","giubenelor":"giuben","giubenul":"giuben","giubenule":"giuben","giubenului":"giuben","giudeaua":"giudea","giudecate":"giudecată","giudecatei":"giudecată","giudecatele":"giudecată","giudecatelor":"giudecată","giudecati":"giudecată","giudecatoarea":"giudecătoare","giudecatoarei":"giudecătoare","giudecatoarele":"giudecătoare","giudecatoarelor":"giudecătoare","giudele":"giudea","giudelei":"giudea","giudelele":"giudea","giudelelor":"giudea","giugeaul":"giugea","giugeaule":"giugea","giugeaului":"giugea","giugiulea":"giugiuli","giugiuleai":"giugiuli","giugiuleam":"giugiuli","giugiuleati":"giugiuli","giugiuleau":"giugiuli","giugiuleli":"giugiuleală","giugiulelii":"giugiuleală","giugiulelile":"giugiuleală","giugiulelilor":"giugiuleală","giugiulesc":"giugiuli","giugiuleste":"giugiuli","giugiulesti":"giugiuli","giugiulii":"giugiuli","giugiulim":"giugiuli","giugiulind":"giugiuli","giugiulira":"giugiuli","giugiuliram":"giugiuli","giugiulirati":"giugiuli","giugiulirea":"giugiulire","giugiuliri":"giugiulire","giugiulirii":"giugiulire","giugiulirile":"giugiulire","giugiulirilor":"giugiulire","giugiulise":"giugiuli","giugiulisem":"giugiuli","giugiulisera":"giugiuli","giugiuliseram":"giugiuli","giugiuliserati":"giugiuli","giugiulisesi":"giugiuli","giugiulisi":"giugiuli","giugiulit":"giugiuli","giugiulita":["giugiulită","giugiulit","giugiulita","giugiulit"],"giugiulite":"giugiulit","giugiulitele":"giugiulit","giugiuliti":["giugiuliți","giugiuli","giugiuliți","giugiulit"],"giugiulitii":"giugiulit","giugiulitul":"giugiulit","giugiulituri":"giugiulitură","giugiuliturii":"giugiulitură","giugiuliturile":"giugiulitură","giugiuliturilor":"giugiulitură","giulesteane":"giuleșteană","giulesteanei":"giuleșteană","giulesteanele":"giuleșteană","giulesteanelor":"giuleșteană","giulgiuia":"giulgiui","giulgiuiai":"giulgiui","giulgiuiam":"giulgiui","giulgiuiati":"giulgiui","giulgiuiau":"giulgiui","giulgiuie":"giulgiui","giulgiuii":"giulgiui","giulgiuim":"giulgiui","giulgiuind":"giulgiui","giulgiuira":"giulgiui","giulgiuiram":"giulgiui","giulgiuirati":"giulgiui","giulgiuise":"giulgiui","giulgiuisem":"giulgiui","giulgiuisera":"giulgiui","giulgiuiseram":"giulgiui","giulgiuiserati":"giulgiui","giulgiuisesi":"giulgiui","giulgiuisi":"giulgiui","giulgiuit":"giulgiui","giulgiuiti":"giulgiui","giulgiul":["giulgiul","giulgi","giulgiul","giulgiu"],"giulgiule":["giulgiule","giulgi","giulgiule","giulgiu"],"giulgiului":["giulgiului","giulgi","giulgiului","giulgiu"],"giulgiuri":["giulgiuri","giulgi","giulgiuri","giulgiu"],"giulgiurile":["giulgiurile","giulgi","giulgiurile","giulgiu"],"giulgiurilor":["giulgiurilor","giulgi","giulgiurilor","giulgiu"],"giulusul":"giuluș","giulusule":"giuluș","giulusului":"giuluș","giulusuri":"giuluș","giulusurile":"giuluș","giulusurilor":"giuluș","giumbuslucul":"giumbușluc","giumbuslucule":"giumbușluc","giumbuslucului":"giumbușluc","giumbuslucuri":"giumbușluc","giumbuslucurile":"giumbușluc","giumbuslucurilor":"giumbușluc","giumbusul":"giumbuș","giumbusule":"giumbuș","giumbusului":"giumbuș","giumbusuri":"giumbuș","giumbusurile":"giumbuș","giumbusurilor":"giumbuș","giumerta":["giumertă","giumert","giumerta","giumert"],"giumerte":"giumert","giumertele":"giumert","giumerti":"giumert","giumertii":"giumert","giumertul":"giumert","giunci":"giuncă","giuncii":"giuncă","giuncile":"giuncă","giuncilor":"giuncă","giupani":"giupân","giupanii":"giupân","giupanilor":"giupân","giupanul":"giupân","giupanule":"giupân","giupanului":"giupân","giuramantul":"giurământ","giuramantule":"giurământ","giuramantului":"giurământ","giuraminte":"giurământ","giuramintele":"giurământ","giuramintelor":"giurământ","giurgine":"giurgină","giurginei":"giurgină","giurginele":"giurgină","giurginelor":"giurgină","giurgiuveanul":"giurgiuvean","giurgiuveanule":"giurgiuvean","giurgiuveanului":"giurgiuvean","giurgiuveaua":"giurgiuvea","giurgiuvele":"giurgiuvea","giurgiuvelei":"giurgiuvea","giurgiuvelele":"giurgiuvea","giurgiuvelelor":"giurgiuvea","giurgiuvence":"giurgiuveancă","giurgiuvencei":"giurgiuveancă","giurgiuvencele":"giurgiuveancă","giurgiuvencelor":"giurgiuveancă","giurgiuvene":"giurgiuveană","giurgiuvenei":"giurgiuveană","giurgiuvenele":"giurgiuveană","giurgiuvenelor":"giurgiuveană","giurgiuveni":"giurgiuvean","giurgiuvenii":"giurgiuvean","giurgiuvenilor":"giurgiuvean","giuste":"giușcă","giustei":"giușcă","giustele":"giușcă","giustelor":"giușcă","giuvaiere":"giuvaier","giuvaierele":"giuvaier","giuvaierelor":"giuvaier","giuvaiergerese":"giuvaiergereasă","giuvaiergeresei":"giuvaiergereasă","giuvaiergeresele":"giuvaiergereasă","giuvaiergereselor":"giuvaiergereasă","giuvaiergeria":"giuvaiergerie","giuvaiergeriei":"giuvaiergerie","giuvaiergerii":"giuvaiergerie","giuvaiergeriile":"giuvaiergerie","giuvaiergeriilor":"giuvaiergerie","giuvaiergii":"giuvaiergiu","giuvaiergiii":"giuvaiergiu","giuvaiergiilor":"giuvaiergiu","giuvaiergiul":"giuvaiergiu","giuvaiergiule":"giuvaiergiu","giuvaiergiului":"giuvaiergiu","giuvaiericalele":"giuvaiericale","giuvaiericalelor":"giuvaiericale","giuvaierul":"giuvaier","giuvaierule":"giuvaier","giuvaierului":"giuvaier","givornite":"givorniță","givornitei":"givorniță","givornitele":"givorniță","givornitelor":"givorniță","givrajul":"givraj","givrajule":"givraj","givrajului":"givraj","givrata":["givrată","givrat","givrata","givrat"],"givrate":"givrat","givratele":"givrat","givrati":"givrat","givratii":"givrat","givratul":"givrat","glabele":"glabelă","glabelei":"glabelă","glabelele":"glabelă","glabelelor":"glabelă","glabra":["glabră","glabru","glabra","glabru"],"glabre":"glabru","glabrele":"glabru","glabri":"glabru","glabrii":"glabru","glabrul":"glabru","glaciala":["glacială","glacial","glaciala","glacial"],"glaciale":"glacial","glacialele":"glacial","glaciali":"glacial","glacialii":"glacial","glacialul":"glacial","glaciara":["glaciară","glaciar","glaciara","glaciar"],"glaciare":"glaciar","glaciarele":"glaciar","glaciari":"glaciar","glaciarii":"glaciar","glaciarizatia":"glaciarizație","glaciarizatiei":"glaciarizație","glaciarizatii":"glaciarizație","glaciarul":"glaciar","glaciatia":"glaciație","glaciatiei":"glaciație","glaciatii":"glaciație","glaciatiile":"glaciație","glaciatiilor":"glaciație","glaciatiuni":"glaciațiune","glaciologe":"glaciologă","glaciologei":"glaciologă","glaciologele":"glaciologă","glaciologelor":"glaciologă","glaciologi":"glaciolog","glaciologia":"glaciologie","glaciologica":["glaciologică","glaciologic","glaciologica","glaciologic"],"glaciologice":"glaciologic","glaciologicele":"glaciologic","glaciologici":"glaciologic","glaciologicii":"glaciologic","glaciologicul":"glaciologic","glaciologiei":"glaciologie","glaciologii":["glaciologii","glaciolog","glaciologii","glaciologie"],"glaciologilor":"glaciolog","glaciologul":"glaciolog","glaciologule":"glaciolog","glaciologului":"glaciolog","glaciotectonici":"glaciotectonică","glaciotectonicii":"glaciotectonică","glaciotectonicile":"glaciotectonică","glaciotectonicilor":"glaciotectonică","glacisul":"glacis","glacisule":"glacis","glacisului":"glacis","glacisuri":"glacis","glacisurile":"glacis","glacisurilor":"glacis","gladia":"gladie","gladiatori":"gladiator","gladiatorica":["gladiatorică","gladiatoric","gladiatorica","gladiatoric"],"gladiatorice":"gladiatoric","gladiatoricele":"gladiatoric","gladiatorici":"gladiatoric","gladiatoricii":"gladiatoric","gladiatoricul":"gladiatoric","gladiatorii":"gladiator","gladiatorilor":"gladiator","gladiatorul":"gladiator","gladiatorule":"gladiator","gladiatorului":"gladiator","gladicii":"glădici","gladicilor":"glădici","gladiciul":"glădici","gladiciule":"glădici","gladiciului":"glădici","gladiei":"gladie","gladii":"gladie","gladiile":"gladie","gladiilor":"gladie","gladiole":"gladiolă","gladiolei":"gladiolă","gladiolele":"gladiolă","gladiolelor":"gladiolă","gladite":"glădiță","gladitei":"glădiță","gladitele":"glădiță","gladitelor":"glădiță","gladiumul":"gladium","gladiumule":"gladium","gladiumului":"gladium","gladiumuri":"gladium","gladiumurile":"gladium","gladiumurilor":"gladium","glagolitica":["glagolitică","glagolitic","glagolitica","glagolitic"],"glagolitice":"glagolitic","glagoliticele":"glagolitic","glagolitici":"glagolitic","glagoliticii":"glagolitic","glagoliticul":"glagolitic","glagoreul":"glagore","glagoreule":"glagore","glagoreului":"glagore","glajari":"glăjar","glajarii":"glăjar","glajarilor":"glăjar","glajarul":"glăjar","glajarule":"glăjar","glajarului":"glăjar","glaje":"glajă","glajei":"glajă","glajele":"glajă","glajelor":"glajă","glajeria":"glăjerie","glajeriei":"glăjerie","glajerii":"glăjerie","glajeriile":"glăjerie","glajeriilor":"glăjerie","glaji":"glajă","glajite":"glăjiță","glajitei":"glăjiță","glajitele":"glăjiță","glajitelor":"glăjiță","glajute":"glăjuță","glajutei":"glăjuță","glajutele":"glăjuță","glajutelor":"glăjuță","glande":"glandă","glande endocrine":"glandă endocrină","glande exocrine":"glandă exocrină","glande lacrimale":"glandă lacrimală","glande mamare":"glandă mamară","glande paratiroide":"glandă paratiroidă","glande parotide":"glandă parotidă","glande pineale":"glandă pineală","glande salivare":"glandă salivară","glande sebacee":"glandă sebacee","glande sudoripare":"glandă sudoripară","glandei":"glandă","glandele":"glandă","glandelor":"glandă","glandul":"gland","glandulara":["glandulară","glandular","glandulara","glandular"],"glandulare":"glandular","glandularele":"glandular","glandulari":"glandular","glandularii":"glandular","glandularul":"glandular","glandule":["glandule","gland","glandule","glandulă"],"glandulei":"glandulă","glandulele":"glandulă","glandulelor":"glandulă","glanduloasa":["glanduloasă","glandulos","glanduloasa","glandulos"],"glanduloase":"glandulos","glanduloasele":"glandulos","glandulosi":"glandulos","glandulosii":"glandulos","glandulosul":"glandulos","glandului":"gland","glanduri":"gland","glandurile":"gland","glandurilor":"gland","glantuia":"glănțui","glantuiai":"glănțui","glantuiam":"glănțui","glantuiati":"glănțui","glantuiau":"glănțui","glantuiesc":"glănțui","glantuieste":"glănțui","glantuiesti":"glănțui","glantuii":"glănțui","glantuim":"glănțui","glantuind":"glănțui","glantuira":"glănțui","glantuiram":"glănțui","glantuirati":"glănțui","glantuise":"glănțui","glantuisem":"glănțui","glantuisera":"glănțui","glantuiseram":"glănțui","glantuiserati":"glănțui","glantuisesi":"glănțui","glantuisi":"glănțui","glantuit":"glănțui","glantuiti":"glănțui","glantul":"glanț","glantule":"glanț","glantului":"glanț","glasai":"glasa","glasam":["glasăm","glasa","glasam","glasa"],"glasand":"glasa","glasara":"glasa","glasaram":"glasa","glasarati":"glasa","glasase":"glasa","glasasem":"glasa","glasasera":"glasa","glasaseram":"glasa","glasaserati":"glasa","glasasesi":"glasa","glasasi":"glasa","glasat":"glasa","glasata":["glasată","glasat","glasata","glasat"],"glasate":"glasat","glasatele":"glasat","glasati":["glasați","glasa","glasați","glasat"],"glasatii":"glasat","glasatul":"glasat","glasau":"glasa","glascioare":"glăscior","glascioarele":"glăscior","glascioarelor":"glăscior","glasciorul":"glăscior","glasciorule":"glăscior","glasciorului":"glăscior","glaseaza":"glasa","glasez":"glasa","glasezi":"glasa","glasnice":"glasnică","glasnicei":"glasnică","glasnicele":"glasnică","glasnicelor":"glasnică","glasnostul":"glasnost","glasnostule":"glasnost","glasnostului":"glasnost","glaspapirul":"glaspapir","glaspapirule":"glaspapir","glaspapirului":"glaspapir","glastre":"glastră","glastrei":"glastră","glastrele":"glastră","glastrelor":"glastră","glasuia":"glăsui","glasuiai":"glăsui","glasuiam":"glăsui","glasuiati":"glăsui","glasuiau":"glăsui","glasuiesc":"glăsui","glasuieste":"glăsui","glasuiesti":"glăsui","glasuii":"glăsui","glasuim":"glăsui","glasuind":"glăsui","glasuira":"glăsui","glasuiram":"glăsui","glasuirati":"glăsui","glasuiri":"glăsuire","glasuise":"glăsui","glasuisem":"glăsui","glasuisera":"glăsui","glasuiseram":"glăsui","glasuiserati":"glăsui","glasuisesi":"glăsui","glasuisi":"glăsui","glasuit":"glăsui","glasuita":["glăsuită","glăsuit","glăsuita","glăsuit"],"glasuite":"glăsuit","glasuitele":"glăsuit","glasuiti":["glăsuiți","glăsui","glăsuiți","glăsuit"],"glasuitii":"glăsuit","glasuitoare":"glăsuitor","glasuitoarea":"glăsuitor","glasuitoarele":"glăsuitor","glasuitori":"glăsuitor","glasuitorii":"glăsuitor","glasuitorul":"glăsuitor","glasuitul":"glăsuit","glasul":"glas","glasule":"glas","glasulete":"glăsuleț","glasuletele":"glăsuleț","glasuletelor":"glăsuleț","glasuletul":"glăsuleț","glasuletule":"glăsuleț","glasuletului":"glăsuleț","glasului":"glas","glasuri":"glas","glasurile":"glas","glasurilor":"glas","glasusoare":"glăsușor","glasusoarele":"glăsușor","glasusoarelor":"glăsușor","glasusorul":"glăsușor","glasusorule":"glăsușor","glasusorului":"glăsușor","glasute":"glăsuț","glasutele":"glăsuț","glasutelor":"glăsuț","glasutul":"glăsuț","glasutule":"glăsuț","glasutului":"glăsuț","glasvandul":"glasvand","glasvandule":"glasvand","glasvandului":"glasvand","glasvanduri":"glasvand","glasvandurile":"glasvand","glasvandurilor":"glasvand","glauca":["glaucă","glauc","glauca","glauc"],"glauce":"glauc","glaucele":"glauc","glauci":"glauc","glaucii":"glauc","glaucomatoasa":["glaucomatoasă","glaucomatos","glaucomatoasa","glaucomatos"],"glaucomatoase":"glaucomatos","glaucomatoasele":"glaucomatos","glaucomatosi":"glaucomatos","glaucomatosii":"glaucomatos","glaucomatosul":"glaucomatos","glaucomul":"glaucom","glaucomule":"glaucom","glaucomului":"glaucom","glaucomuri":"glaucom","glaucomurile":"glaucom","glaucomurilor":"glaucom","glauconite":"glauconit","glauconitele":"glauconit","glauconitelor":"glauconit","glauconitul":"glauconit","glauconitule":"glauconit","glauconitului":"glauconit","glaucul":"glauc","glave":"glavă","glavei":"glavă","glavele":"glavă","glavelor":"glavă","glavizne":"glaviznă","glaviznei":"glaviznă","glaviznele":"glaviznă","glaviznelor":"glaviznă","glavoace":"glăvoacă","glavoacei":"glăvoacă","glavoacele":"glăvoacă","glavoacelor":"glăvoacă","glazurai":"glazura","glazuram":["glazurăm","glazura","glazuram","glazura"],"glazurand":"glazura","glazurara":"glazura","glazuraram":"glazura","glazurarati":"glazura","glazurarea":"glazurare","glazurari":"glazurare","glazurarii":"glazurare","glazurarile":"glazurare","glazurarilor":"glazurare","glazurase":"glazura","glazurasem":"glazura","glazurasera":"glazura","glazuraseram":"glazura","glazuraserati":"glazura","glazurasesi":"glazura","glazurasi":"glazura","glazurat":"glazura","glazurata":["glazurată","glazurat","glazurata","glazurat"],"glazurate":"glazurat","glazuratele":"glazurat","glazurati":["glazurați","glazura","glazurați","glazurat"],"glazuratii":"glazurat","glazuratul":"glazurat","glazurau":"glazura","glazureaza":"glazura","glazurez":"glazura","glazurezi":"glazura","glazuri":"glazură","glazurii":"glazură","glazurile":"glazură","glazurilor":"glazură","gledicicii":"gledicie","glediciciii":"gledicie","glediciciile":"gledicie","glediciciilor":"gledicie","glediciea":"gledicie","gleica":["gleică","gleic","gleica","gleic"],"gleice":"gleic","gleicele":"gleic","gleici":"gleic","gleicii":"gleic","gleicul":"gleic","glene":"glenă","glenei":"glenă","glenele":"glenă","glenelor":"glenă","glenoida":["glenoidă","glenoid","glenoida","glenoid"],"glenoide":"glenoid","glenoidele":"glenoid","glenoidul":"glenoid","glenoizi":"glenoid","glenoizii":"glenoid","gletul":"glet","gletule":"glet","gletului":"glet","gleturi":"glet","gleturile":"glet","gleturilor":"glet","glezne":"gleznă","gleznei":"gleznă","gleznele":"gleznă","gleznelor":"gleznă","gleznisoare":"gleznișoară","gleznisoarei":"gleznișoară","gleznisoarele":"gleznișoară","gleznisoarelor":"gleznișoară","glia":"glie","gliadine":"gliadină","gliadinei":"gliadină","gliadinele":"gliadină","gliadinelor":"gliadină","gliala":["glială","glial","gliala","glial"],"gliale":"glial","glialele":"glial","gliali":"glial","glialii":"glial","glialul":"glial","glicemia":"glicemie","glicemiei":"glicemie","glicemii":"glicemie","glicemiile":"glicemie","glicemiilor":"glicemie","gliceride":"gliceridă","gliceridei":"gliceridă","gliceridele":"gliceridă","gliceridelor":"gliceridă","glicerine":"glicerină","glicerinei":"glicerină","glicerinele":"glicerină","glicerinelor":"glicerină","glicerofosfati":"glicerofosfat","glicerofosfatii":"glicerofosfat","glicerofosfatilor":"glicerofosfat","glicerofosfatul":"glicerofosfat","glicerofosfatule":"glicerofosfat","glicerofosfatului":"glicerofosfat","glicerofosforica":["glicerofosforică","glicerofosforic","glicerofosforica","glicerofosforic"],"glicerofosforice":"glicerofosforic","glicerofosforicele":"glicerofosforic","glicerofosforici":"glicerofosforic","glicerofosforicii":"glicerofosforic","glicerofosforicul":"glicerofosforic","glicerolul":"glicerol","glicerolule":"glicerol","glicerolului":"glicerol","glicine":"glicină","glicinei":"glicină","glicinele":"glicină","glicinelor":"glicină","glicocoli":"glicocol","glicocolii":"glicocol","glicocolilor":"glicocol","glicocolul":"glicocol","glicocolule":"glicocol","glicocolului":"glicocol","glicogenetica":["glicogenetică","glicogenetic","glicogenetica","glicogenetic"],"glicogenetice":"glicogenetic","glicogeneticele":"glicogenetic","glicogenetici":"glicogenetic","glicogeneticii":"glicogenetic","glicogeneticul":"glicogenetic","glicogeneze":"glicogeneză","glicogenezei":"glicogeneză","glicogenezele":"glicogeneză","glicogenezelor":"glicogeneză","glicogeni":"glicogen","glicogenica":["glicogenică","glicogenic","glicogenica","glicogenic"],"glicogenice":"glicogenic","glicogenicele":"glicogenic","glicogenici":"glicogenic","glicogenicii":"glicogenic","glicogenicul":"glicogenic","glicogenii":"glicogen","glicogenilor":"glicogen","glicogenogeneze":"glicogenogeneză","glicogenogenezei":"glicogenogeneză","glicogenogenezele":"glicogenogeneză","glicogenogenezelor":"glicogenogeneză","glicogenolize":"glicogenoliză","glicogenolizei":"glicogenoliză","glicogenolizele":"glicogenoliză","glicogenolizelor":"glicogenoliză","glicogenul":"glicogen","glicogenule":"glicogen","glicogenului":"glicogen","glicoli":"glicol","glicolii":"glicol","glicolilor":"glicol","glicolize":"glicoliză","glicolizei":"glicoliză","glicolizele":"glicoliză","glicolizelor":"glicoliză","glicolul":"glicol","glicolule":"glicol","glicolului":"glicol","glicometre":"glicometru","glicometrele":"glicometru","glicometrelor":"glicometru","glicometrul":"glicometru","glicometrule":"glicometru","glicometrului":"glicometru","gliconica":["gliconică","gliconic","gliconica","gliconic"],"gliconice":"gliconic","gliconicele":"gliconic","gliconici":"gliconic","gliconicii":"gliconic","gliconicul":"gliconic","glicopenia":"glicopenie","glicopeniei":"glicopenie","glicopenii":"glicopenie","glicopeniile":"glicopenie","glicopeniilor":"glicopenie","glicoproteide":"glicoproteidă","glicoproteidei":"glicoproteidă","glicoproteidele":"glicoproteidă","glicoproteidelor":"glicoproteidă","glicozide":"glicozidă","glicozidei":"glicozidă","glicozidele":"glicozidă","glicozidelor":"glicozidă","glicozuria":"glicozurie","glicozurica":["glicozurică","glicozuric","glicozurica","glicozuric"],"glicozurice":"glicozuric","glicozuricele":"glicozuric","glicozurici":"glicozuric","glicozuricii":"glicozuric","glicozuricul":"glicozuric","glicozuriei":"glicozurie","glicozurii":"glicozurie","glicozuriile":"glicozurie","glicozuriilor":"glicozurie","gliei":"glie","gligani":"gligan","gliganii":"gligan","gliganilor":"gligan","gliganul":"gligan","gliganule":"gligan","gliganului":"gligan","glii":"glie","gliile":"glie","gliilor":"glie","gliomul":"gliom","gliomule":"gliom","gliomului":"gliom","gliomuri":"gliom","gliomurile":"gliom","gliomurilor":"gliom","gliosarcoame":"gliosarcom","gliosarcoamei":"gliosarcom","gliosarcoamelor":"gliosarcom","gliosarcomul":"gliosarcom","gliosarcomule":"gliosarcom","gliosarcomului":"gliosarcom","glioze":"glioză","gliozei":"glioză","gliozele":"glioză","gliozelor":"glioză","gliptalul":"gliptal","gliptalule":"gliptal","gliptalului":"gliptal","gliptaluri":"gliptal","gliptalurile":"gliptal","gliptalurilor":"gliptal","gliptica":["gliptică","gliptic","gliptica","gliptic"],"gliptice":"gliptic","glipticele":"gliptic","gliptici":["gliptici","gliptic","gliptici","gliptică"],"glipticii":["glipticii","gliptic","glipticii","gliptică"],"glipticile":"gliptică","glipticilor":"gliptică","glipticul":"gliptic","gliptodoni":"gliptodon","gliptodonii":"gliptodon","gliptodonilor":"gliptodon","gliptodonul":"gliptodon","gliptodonule":"gliptodon","gliptodonului":"gliptodon","gliptogeneze":"gliptogeneză","gliptogenezei":"gliptogeneză","gliptogenezele":"gliptogeneză","gliptogenezelor":"gliptogeneză","gliptografia":"gliptografie","gliptografiei":"gliptografie","gliptografii":"gliptografie","gliptografiile":"gliptografie","gliptografiilor":"gliptografie","gliptologia":"gliptologie","gliptologiei":"gliptologie","gliptologii":"gliptologie","gliptologiile":"gliptologie","gliptologiilor":"gliptologie","gliptoteci":"gliptotecă","gliptotecii":"gliptotecă","gliptotecile":"gliptotecă","gliptotecilor":"gliptotecă","glisade":"glisadă","glisadei":"glisadă","glisadele":"glisadă","glisadelor":"glisadă","glisai":"glisa","glisam":["glisăm","glisa","glisam","glisa"],"glisand":"glisa","glisanta":["glisantă","glisant","glisanta","glisant"],"glisante":"glisant","glisantele":"glisant","glisanti":"glisant","glisantii":"glisant","glisantul":"glisant","glisara":"glisa","glisaram":"glisa","glisarati":"glisa","glisarea":"glisare","glisari":"glisare","glisarii":"glisare","glisarile":"glisare","glisarilor":"glisare","glisase":"glisa","glisasem":"glisa","glisasera":"glisa","glisaseram":"glisa","glisaserati":"glisa","glisasesi":"glisa","glisasi":"glisa","glisat":"glisa","glisati":"glisa","glisau":"glisa","gliseaza":"glisa","glisez":"glisa","glisezi":"glisa","glisiere":"glisieră","glisierei":"glisieră","glisierele":"glisieră","glisierelor":"glisieră","glisoare":"glisor","glisoarele":"glisor","glisoarelor":"glisor","glisorul":"glisor","glisorule":"glisor","glisorului":"glisor","gliute":"gliuță","gliutei":"gliuță","gliutele":"gliuță","gliutelor":"gliuță","gloabe":"gloabă","gloabei":"gloabă","gloabele":"gloabă","gloabelor":"gloabă","gloante":["gloanțe","gloanță","gloanțe","glonț"],"gloantei":"gloanță","gloantele":["gloanțele","gloanță","gloanțele","glonț"],"gloantelor":["gloanțelor","gloanță","gloanțelor","glonț"],"gloate":"gloată","gloatei":"gloată","gloatele":"gloată","gloatelor":"gloată","globala":["globală","global","globala","global"],"globale":"global","globalele":"global","globali":"global","globalii":"global","globalisme":"globalism","globalismele":"globalism","globalismelor":"globalism","globalismul":"globalism","globalismule":"globalism","globalismului":"globalism","globalitatea":"globalitate","globalitati":"globalitate","globalitatii":"globalitate","globalizai":"globaliza","globalizam":["globalizăm","globaliza","globalizam","globaliza"],"globalizand":"globaliza","globalizara":"globaliza","globalizaram":"globaliza","globalizarati":"globaliza","globalizarea":"globalizare","globalizari":"globalizare","globalizarii":"globalizare","globalizase":"globaliza","globalizasem":"globaliza","globalizasera":"globaliza","globalizaseram":"globaliza","globalizaserati":"globaliza","globalizasesi":"globaliza","globalizasi":"globaliza","globalizat":"globaliza","globalizati":"globaliza","globalizau":"globaliza","globalizeaza":"globaliza","globalizez":"globaliza","globalizezi":"globaliza","globalul":"global","globigerine":"globigerină","globigerinei":"globigerină","globigerinele":"globigerină","globigerinelor":"globigerină","globine":"globină","globinei":"globină","globinele":"globină","globinelor":"globină","globnici":"globnic","globnicii":"globnic","globnicilor":"globnic","globnicul":"globnic","globnicule":"globnic","globnicului":"globnic","globoidul":"globoid","globoidule":"globoid","globoidului":"globoid","globoizi":"globoid","globoizile":"globoid","globoizilor":"globoid","globul":"glob","globulara":["globulară","globular","globulara","globular"],"globulare":"globular","globularele":"globular","globulari":"globular","globularii":"globular","globularul":"globular","globule":["globule","glob","globule","globulă"],"globule albe":"globulă albă","globule rosii":"globulă roșie","globulei":"globulă","globulele":"globulă","globulelor":"globulă","globulete":"globuleț","globuletele":"globuleț","globuletelor":"globuleț","globuletul":"globuleț","globuletule":"globuleț","globuletului":"globuleț","globuli":"globul","globulii":"globul","globulilor":"globul","globuline":"globulină","globulinei":"globulină","globulinele":"globulină","globulinelor":"globulină","globulinemia":"globulinemie","globulinemiei":"globulinemie","globulinemii":"globulinemie","globulinemiile":"globulinemie","globulinemiilor":"globulinemie","globulinuria":"globulinurie","globulinuriei":"globulinurie","globulinurii":"globulinurie","globulinuriile":"globulinurie","globulinuriilor":"globulinurie","globulizarea":"globulizare","globulizari":"globulizare","globulizarii":"globulizare","globulizarile":"globulizare","globulizarilor":"globulizare","globuloasa":["globuloasă","globulos","globuloasa","globulos"],"globuloase":"globulos","globuloasele":"globulos","globulosi":"globulos","globulosii":"globulos","globulosul":"globulos","globului":"glob","globulul":"globul","globulule":"globul","globulului":"globul","globuri":"glob","globuri de cristal":"glob de cristal","globuri de zapada":"glob de zăpadă","globuri luminoase":"glob luminos","globuri oculare":"glob ocular","globurile":"glob","globurilor":"glob","globusoare":"globușor","globusore":"globușor","globusorele":"globușor","globusorelor":"globușor","globusorul":"globușor","globusorule":"globușor","globusorului":"globușor","glockenspielul":"glockenspiel","glockenspielule":"glockenspiel","glockenspielului":"glockenspiel","glockenspieluri":"glockenspiel","glockenspielurile":"glockenspiel","glockenspielurilor":"glockenspiel","glodaraia":"glodăraie","glodaraiei":"glodăraie","glodaraii":"glodăraie","glodistea":"glodiște","glodisti":"glodiște","glodistii":"glodiște","glodistile":"glodiște","glodistilor":"glodiște","glodoasa":["glodoasă","glodos","glodoasa","glodos"],"glodoase":"glodos","glodoasele":"glodos","glodoroasa":["glodoroasă","glodoros","glodoroasa","glodoros"],"glodoroase":"glodoros","glodoroasele":"glodoros","glodorosi":"glodoros","glodorosii":"glodoros","glodorosul":"glodoros","glodosi":"glodos","glodosii":"glodos","glodosul":"glodos","glodul":"glod","glodule":"glod","glodului":"glod","gloduroasa":["gloduroasă","gloduros","gloduroasa","gloduros"],"gloduroase":"gloduros","gloduroasele":"gloduros","glodurosi":"gloduros","glodurosii":"gloduros","glodurosul":"gloduros","glomerulara":["glomerulară","glomerular","glomerulara","glomerular"],"glomerulare":"glomerular","glomerularele":"glomerular","glomerulari":"glomerular","glomerularii":"glomerular","glomerularul":"glomerular","glomerulaul":"glomerulă","glomerulaule":"glomerulă","glomerulaului":"glomerulă","glomerule":["glomerule","glomerul","glomerule","glomerulă"],"glomerulele":["glomerulele","glomerul","glomerulele","glomerulă"],"glomerulelor":["glomerulelor","glomerul","glomerulelor","glomerulă"],"glomerulite":"glomerulită","glomerulitei":"glomerulită","glomerulitele":"glomerulită","glomerulitelor":"glomerulită","glomerulonefrite":"glomerulonefrită","glomerulonefritei":"glomerulonefrită","glomerulonefritele":"glomerulonefrită","glomerulonefritelor":"glomerulonefrită","glomeruloscleroze":"glomeruloscleroză","glomerulosclerozei":"glomeruloscleroză","glomerulosclerozele":"glomeruloscleroză","glomerulosclerozelor":"glomeruloscleroză","glomerulul":"glomerul","glomerulule":"glomerul","glomerulului":"glomerul","glonte":"glonț","glontele":"glonte","glontelor":"glonte","glontelui":"glonte","glontisoare":"glonțișor","glontisoarei":"glonțișor","glontisoarelor":"glonțișor","glontisorul":"glonțișor","glontisorule":"glonțișor","glontisorului":"glonțișor","glontul":"glonț","glontule":"glonț","glontulete":"glonțuleț","glontuletele":"glonțuleț","glontuletelor":"glonțuleț","glontuletul":"glonțuleț","glontuletule":"glonțuleț","glontuletului":"glonțuleț","glontului":"glonț","glorific":"glorifica","glorificai":"glorifica","glorificam":["glorificăm","glorifica","glorificam","glorifica"],"glorificand":"glorifica","glorificara":"glorifica","glorificaram":"glorifica","glorificarati":"glorifica","glorificarea":"glorificare","glorificari":"glorificare","glorificarii":"glorificare","glorificarile":"glorificare","glorificarilor":"glorificare","glorificase":"glorifica","glorificasem":"glorifica","glorificasera":"glorifica","glorificaseram":"glorifica","glorificaserati":"glorifica","glorificasesi":"glorifica","glorificasi":"glorifica","glorificat":"glorifica","glorificati":"glorifica","glorificatoare":"glorificator","glorificatoarea":"glorificator","glorificatoarele":"glorificator","glorificatori":"glorificator","glorificatorii":"glorificator","glorificatorul":"glorificator","glorificau":"glorifica","glorifice":"glorifica","glorifici":"glorifica","glorii":"glorie","glorioasa":["glorioasă","glorios","glorioasa","glorios"],"glorioase":"glorios","glorioasele":"glorios","gloriole":"gloriolă","gloriolei":"gloriolă","gloriolele":"gloriolă","gloriolelor":"gloriolă","gloriosi":"glorios","gloriosii":"glorios","gloriosul":"glorios","glosalgia":"glosalgie","glosalgiei":"glosalgie","glosalgii":"glosalgie","glosalgiile":"glosalgie","glosalgiilor":"glosalgie","glosare":"glosar","glosarele":"glosar","glosarelor":"glosar","glosarul":"glosar","glosarule":"glosar","glosarului":"glosar","glosatoarea":"glosatoare","glosatoarei":"glosatoare","glosatoarele":"glosatoare","glosatoarelor":"glosatoare","glosatori":"glosator","glosatorii":"glosator","glosatorilor":"glosator","glosatorul":"glosator","glosatorule":"glosator","glosatorului":"glosator","glose":"glosă","glosei":"glosă","glosele":"glosă","gloselor":"glosă","glosematice":"glosematică","glosematicei":"glosematică","glosia":"glosie","glosiei":"glosie","glosii":"glosie","glosiile":"glosie","glosiilor":"glosie","glosite":"glosită","glositei":"glosită","glositele":"glosită","glositelor":"glosită","glosodinia":"glosodinie","glosodiniei":"glosodinie","glosodinii":"glosodinie","glosodiniile":"glosodinie","glosodiniilor":"glosodinie","glosofaringiana":["glosofaringiană","glosofaringian","glosofaringiana","glosofaringian"],"glosofaringianul":"glosofaringian","glosofaringiene":"glosofaringian","glosofaringienele":"glosofaringian","glosofaringieni":"glosofaringian","glosofaringienii":"glosofaringian","glosografia":"glosografie","glosografiei":"glosografie","glosografii":"glosografie","glosografiile":"glosografie","glosografiilor":"glosografie","glosolalia":"glosolalie","glosolaliei":"glosolalie","glosolalii":"glosolalie","glosolaliile":"glosolalie","glosolaliilor":"glosolalie","glosologia":"glosologie","glosologiei":"glosologie","glosologii":"glosologie","glosologiile":"glosologie","glosologiilor":"glosologie","glosoplegia":"glosoplegie","glosoplegiei":"glosoplegie","glosoplegii":"glosoplegie","glosoplegiile":"glosoplegie","glosoplegiilor":"glosoplegie","glosoptoze":"glosoptoză","glosoptozei":"glosoptoză","glosoptozele":"glosoptoză","glosoptozelor":"glosoptoză","glosotomia":"glosotomie","glosotomiei":"glosotomie","glosotomii":"glosotomie","glosotomiile":"glosotomie","glosotomiilor":"glosotomie","glotala":["glotală","glotal","glotala","glotal"],"glotale":"glotal","glotalele":"glotal","glotali":"glotal","glotalii":"glotal","glotalul":"glotal","glotasi":"glotaș","glotasii":"glotaș","glotasilor":"glotaș","glotasul":"glotaș","glotasule":"glotaș","glotasului":"glotaș","glote":"glotă","glotei":"glotă","glotele":"glotă","glotelor":"glotă","glotite":"glotită","glotitei":"glotită","glotitele":"glotită","glotitelor":"glotită","glotologe":"glotologă","glotologei":"glotologă","glotologele":"glotologă","glotologelor":"glotologă","glotologia":"glotologie","glotologiei":"glotologie","glotologii":"glotologie","glotologiile":"glotologie","glotologiilor":"glotologie","glucide":"glucidă","glucidei":"glucidă","glucidele":"glucidă","glucidelor":"glucidă","glucidica":["glucidică","glucidic","glucidica","glucidic"],"glucidice":"glucidic","glucidicele":"glucidic","glucidici":"glucidic","glucidicii":"glucidic","glucidicul":"glucidic","gluciniul":"gluciniu","gluciniule":"gluciniu","gluciniului":"gluciniu","glucocorticoidul":"glucocorticoid","glucocorticoidule":"glucocorticoid","glucocorticoidului":"glucocorticoid","glucocorticoizi":"glucocorticoid","glucocorticoizii":"glucocorticoid","glucocorticoizilor":"glucocorticoid","glucometre":"glucometru","glucometrele":"glucometru","glucometrelor":"glucometru","glucometria":"glucometrie","glucometriei":"glucometrie","glucometrii":"glucometrie","glucometrul":"glucometru","glucometrule":"glucometru","glucometrului":"glucometru","gluconati":"gluconat","gluconatii":"gluconat","gluconatilor":"gluconat","gluconatul":"gluconat","gluconatule":"gluconat","gluconatului":"gluconat","gluconica":["gluconică","gluconic","gluconica","gluconic"],"gluconice":"gluconic","gluconicele":"gluconic","gluconici":"gluconic","gluconicii":"gluconic","gluconicul":"gluconic","glucozamine":"glucozamină","glucozaminei":"glucozamină","glucozaminele":"glucozamină","glucozaminelor":"glucozamină","glucoze":"glucoză","glucozei":"glucoză","glucozele":"glucoză","glucozelor":"glucoză","glucozide":"glucozidă","glucozidei":"glucozidă","glucozidele":"glucozidă","glucozidelor":"glucozidă","glugi":"glugă","glugii":"glugă","glugile":"glugă","glugilor":"glugă","glugute":"gluguță","glugutei":"gluguță","glugutele":"gluguță","glugutelor":"gluguță","glumasa":["glumașă","glumaș","glumașa","glumaș"],"glumase":"glumaș","glumasele":"glumaș","glumasi":"glumaș","glumasii":"glumaș","glumasul":"glumaș","glume":"glumă","glumea":"glumi","glumeai":"glumi","glumeam":"glumi","glumeata":["glumeață","glumeț","glumeața","glumeț"],"glumeati":"glumi","glumeau":"glumi","glumei":"glumă","glumele":["glumele","glumă","glumele","glumelă"],"glumelei":"glumelă","glumelele":"glumelă","glumelelor":"glumelă","glumelor":"glumă","glumesc":"glumi","glumeste":"glumi","glumesti":"glumi","glumete":"glumeț","glumetele":"glumeț","glumeti":"glumeț","glumetii":"glumeț","glumetul":"glumeț","glumia":"glumie","glumiei":"glumie","glumii":["glumii","glumi","glumii","glumie"],"glumiile":"glumie","glumiilor":"glumie","glumim":"glumi","glumind":"glumi","glumira":"glumi","glumiram":"glumi","glumirati":"glumi","glumise":"glumi","glumisem":"glumi","glumisera":"glumi","glumiseram":"glumi","glumiserati":"glumi","glumisesi":"glumi","glumisi":"glumi","glumit":"glumi","glumiti":"glumi","glupava":["glupavă","glupav","glupava","glupav"],"glupave":"glupav","glupavele":"glupav","glupavi":"glupav","glupavii":"glupav","glupavul":"glupav","glutamine":"glutamină","glutaminei":"glutamină","glutaminele":"glutamină","glutaminelor":"glutamină","gluteine":"gluteină","gluteinei":"gluteină","gluteinele":"gluteină","gluteinelor":"gluteină","glutenine":"glutenină","gluteninei":"glutenină","gluteninele":"glutenină","gluteninelor":"glutenină","glutenul":"gluten","glutenule":"gluten","glutenului":"gluten","glutinatia":"glutinație","glutinatiei":"glutinație","glutinatii":"glutinație","glutinatiile":"glutinație","glutinatiilor":"glutinație","glutinoasa":["glutinoasă","glutinos","glutinoasa","glutinos"],"glutinoase":"glutinos","glutinoasele":"glutinos","glutinosi":"glutinos","glutinosii":"glutinos","glutinosul":"glutinos","glutoni":"gluton","glutonii":"gluton","glutonilor":"gluton","glutonul":"gluton","glutonule":"gluton","glutonului":"gluton","gnaisul":"gnais","gnaisule":"gnais","gnaisului":"gnais","gnaisuri":"gnais","gnaisurile":"gnais","gnaisurilor":"gnais","gnochile":"gnochi","gnochilor":"gnochi","gnomi":"gnom","gnomica":["gnomică","gnomic","gnomica","gnomic"],"gnomice":"gnomic","gnomicele":"gnomic","gnomici":"gnomic","gnomicii":"gnomic","gnomicul":"gnomic","gnomii":"gnom","gnomilor":"gnom","gnomismul":"gnomism","gnomismule":"gnomism","gnomismului":"gnomism","gnomoane":"gnomon","gnomoanele":"gnomon","gnomoanelor":"gnomon","gnomologia":"gnomologie","gnomologica":["gnomologică","gnomologic","gnomologica","gnomologic"],"gnomologice":"gnomologic","gnomologicele":"gnomologic","gnomologici":"gnomologic","gnomologicii":"gnomologic","gnomologicul":"gnomologic","gnomologiei":"gnomologie","gnomologii":"gnomologie","gnomologiile":"gnomologie","gnomologiilor":"gnomologie","gnomonice":"gnomonică","gnomonicei":"gnomonică","gnomonul":"gnomon","gnomonule":"gnomon","gnomonului":"gnomon","gnomul":"gnom","gnomule":"gnom","gnomului":"gnom","gnoseologia":"gnoseologie","gnoseologica":["gnoseologică","gnoseologic","gnoseologica","gnoseologic"],"gnoseologice":"gnoseologic","gnoseologicele":"gnoseologic","gnoseologici":"gnoseologic","gnoseologicii":"gnoseologic","gnoseologicul":"gnoseologic","gnoseologiei":"gnoseologie","gnoseologii":"gnoseologie","gnostica":["gnostică","gnostic","gnostica","gnostic"],"gnostice":["gnostice","gnostic","gnostice","gnostică"],"gnosticei":"gnostică","gnosticele":["gnosticele","gnostic","gnosticele","gnostică"],"gnosticelor":"gnostică","gnostici":"gnostic","gnosticii":"gnostic","gnosticilor":"gnostic","gnosticismul":"gnosticism","gnosticismule":"gnosticism","gnosticismului":"gnosticism","gnosticul":"gnostic","gnosticule":"gnostic","gnosticului":"gnostic","gnoze":"gnoză","gnozei":"gnoză","gnozele":"gnoză","gnozelor":"gnoză","gnozia":"gnozie","gnoziei":"gnozie","gnozii":"gnozie","gnul":"gnu","gnule":"gnu","gnului":"gnu","goaga":"gogă","goal":"gol","goala":["goală","gol","goala","gol"],"goale":"gol","goalele":"gol","goane":"goană","goanei":"goană","goanele":"goană","goanelor":"goană","goange":"goangă","goangei":"goangă","goangele":"goangă","goangelor":"goangă","goarne":"goarnă","goarnei":"goarnă","goarnele":"goarnă","goarnelor":"goarnă","goate":"goață","goatei":"goață","goatele":"goață","goatelor":"goață","gobeletul":"gobelet","gobeletule":"gobelet","gobeletului":"gobelet","gobeleturi":"gobelet","gobeleturile":"gobelet","gobeleturilor":"gobelet","goblenul":"goblen","goblenule":"goblen","goblenului":"goblen","goblenuri":"goblen","goblenurile":"goblen","goblenurilor":"goblen","goblizani":"goblizan","goblizanii":"goblizan","goblizanilor":"goblizan","goblizanul":"goblizan","goblizanule":"goblizan","goblizanului":"goblizan","gocimani":"gociman","gocimanii":"gociman","gocimanilor":"gociman","gocimanul":"gociman","gocimanule":"gociman","gocimanului":"gociman","godacei":"godăcel","godaceii":"godăcel","godaceilor":"godăcel","godacelul":"godăcel","godacelule":"godăcel","godacelului":"godăcel","godaci":"godac","godacii":"godac","godacilor":"godac","godacul":"godac","godacule":"godac","godacului":"godac","godavilul":"godavil","godavilule":"godavil","godavilului":"godavil","godaviluri":"godavil","godavilurile":"godavil","godavilurilor":"godavil","godenul":"goden","godenule":"goden","godenului":"goden","godenuri":"goden","godenurile":"goden","godenurilor":"goden","godeuri":"godeu","godeurile":"godeu","godeurilor":"godeu","godeuul":"godeu","godeuule":"godeu","godeuului":"godeu","godia":"godie","godiei":"godie","godii":"godie","godiile":"godie","godiilor":"godie","godinasi":"godinaș","godinasii":"godinaș","godinasilor":"godinaș","godinasul":"godinaș","godinasule":"godinaș","godinasului":"godinaș","godine":"godină","godinei":"godină","godinele":"godină","godinelor":"godină","godroane":"godron","godroanele":"godron","godroanelor":"godron","godronata":["godronată","godronat","godronata","godronat"],"godronate":"godronat","godronatele":"godronat","godronati":"godronat","godronatii":"godronat","godronatul":"godronat","godronul":"godron","godronule":"godron","godronului":"godron","goelandul":"goeland","goelandule":"goeland","goelandului":"goeland","goelanzi":"goeland","goelanzii":"goeland","goelanzilor":"goeland","goelete":"goeletă","goeletei":"goeletă","goeletele":"goeletă","goeletelor":"goeletă","goetheana":["goetheană","goethean","goetheana","goethean"],"goetheanul":"goethean","goethene":"goethean","goethenele":"goethean","goetheni":"goethean","goethenii":"goethean","gofrai":"gofra","gofram":["gofrăm","gofra","gofram","gofra"],"gofrand":"gofra","gofrara":"gofra","gofraram":"gofra","gofrarati":"gofra","gofrase":"gofra","gofrasem":"gofra","gofrasera":"gofra","gofraseram":"gofra","gofraserati":"gofra","gofrasesi":"gofra","gofrasi":"gofra","gofrat":"gofra","gofrata":["gofrată","gofrat","gofrata","gofrat"],"gofrate":"gofrat","gofratele":"gofrat","gofrati":["gofrați","gofra","gofrați","gofrat"],"gofratii":"gofrat","gofratul":"gofrat","gofrau":"gofra","gofreaza":"gofra","gofrez":"gofra","gofrezi":"gofra","gogi":["gogi","gog","gogi","gogă"],"gogii":["gogii","gog","gogii","gogă"],"gogile":"gogă","gogilor":["gogilor","gog","gogilor","gogă"],"gogolea":"gogoli","gogoleai":"gogoli","gogoleam":"gogoli","gogoleati":"gogoli","gogoleau":"gogoli","gogolesc":"gogoli","gogoleste":"gogoli","gogolesti":"gogoli","gogolii":"gogoli","gogolim":"gogoli","gogolind":"gogoli","gogolira":"gogoli","gogoliram":"gogoli","gogolirati":"gogoli","gogolise":"gogoli","gogolisem":"gogoli","gogolisera":"gogoli","gogoliseram":"gogoli","gogoliserati":"gogoli","gogolisesi":"gogoli","gogolisi":"gogoli","gogolit":"gogoli","gogoliti":"gogoli","gogoliuul":"gogoliu","gogoliuule":"gogoliu","gogoliuului":"gogoliu","gogoloaie":"gogoloi","gogoloaiele":"gogoloi","gogoloaielor":"gogoloi","gogoloiul":"gogoloi","gogoloiule":"gogoloi","gogoloiului":"gogoloi","gogomana":["gogomană","gogoman","gogomana","gogoman"],"gogomane":"gogoman","gogomanei":"gogomănel","gogomaneii":"gogomănel","gogomaneilor":"gogomănel","gogomanele":"gogoman","gogomanelul":"gogomănel","gogomanelule":"gogomănel","gogomanelului":"gogomănel","gogomani":"gogoman","gogomania":"gogomănie","gogomaniei":"gogomănie","gogomanii":["gogomanii","gogoman","gogomănii","gogomănie"],"gogomaniile":"gogomănie","gogomaniilor":"gogomănie","gogomanilor":"gogoman","gogomanul":"gogoman","gogomanule":"gogoman","gogomanului":"gogoman","gogonata":["gogonată","gogonat","gogonata","gogonat"],"gogonate":"gogonat","gogonatele":"gogonat","gogonati":"gogonat","gogonatii":"gogonat","gogonatul":"gogonat","gogoneata":["gogoneață","gogoneț","gogoneața","gogoneț"],"gogoneaua":"gogonea","gogonele":"gogonea","gogonelei":"gogonea","gogonelele":"gogonea","gogonelelor":"gogonea","gogonete":"gogoneț","gogonetele":"gogoneț","gogoneti":"gogoneț","gogonetii":"gogoneț","gogonetul":"gogoneț","gogoni":"gogon","gogonile":"gogon","gogonilor":"gogon","gogonul":"gogon","gogonule":"gogon","gogonului":"gogon","gogorite":"gogoriță","gogoritei":"gogoriță","gogoritele":"gogoriță","gogoritelor":"gogoriță","gogosari":"gogoșar","gogosarii":"gogoșar","gogosarilor":"gogoșar","gogosarul":"gogoșar","gogosarule":"gogoșar","gogosarului":"gogoșar","gogoseaua":"gogoșea","gogosele":"gogoșea","gogoselei":"gogoșea","gogoselele":"gogoșea","gogoselelor":"gogoșea","gogoseria":"gogoșerie","gogoseriei":"gogoșerie","gogoserii":"gogoșerie","gogoseriile":"gogoșerie","gogoseriilor":"gogoșerie","gogosi":"gogoașă","gogosi de matase":"gogoașă de mătase","gogosii":"gogoașă","gogosile":"gogoașă","gogosilor":"gogoașă","gogrene":["gogrene","gogren","gogrene","gogrenă"],"gogul":"gog","gogule":"gog","gogului":"gog","goi":"gol","goii":"gol","golanasi":"golănaș","golanasii":"golănaș","golanasilor":"golănaș","golanasul":"golănaș","golanasule":"golănaș","golanasului":"golănaș","golance":"golancă","golancei":"golancă","golancele":"golancă","golancelor":"golancă","golane":"golană","golaneasca":["golănească","golănesc","golăneasca","golănesc"],"golaneata":["golăneață","golăneț","golăneața","golăneț"],"golanei":["golanei","golană","golănei","golănel"],"golanele":"golană","golaneli":"golănel","golanelii":"golănel","golanelilor":"golănel","golanelor":"golană","golanelul":"golănel","golanelule":"golănel","golanelului":"golănel","golanescul":"golănesc","golanesti":"golănesc","golanestii":"golănesc","golanestile":"golănesc","golanete":"golăneț","golanetele":"golăneț","golaneti":"golăneț","golanetii":"golăneț","golanetul":"golăneț","golani":"golan","golania":"golănie","golaniei":"golănie","golanii":"golănie","golaniile":"golănie","golaniilor":"golănie","golanimea":"golănime","golanimei":"golănime","golasa":["golașă","golaș","golașa","golaș"],"golase":"golaș","golasela":["golășelă","golășel","golășela","golășel"],"golasele":["golașele","golaș","golășele","golășel"],"golaselele":"golășel","golaseli":"golășel","golaselii":"golășel","golaselul":"golășel","golasi":"golaș","golasii":"golaș","golasul":"golaș","golatatea":"golătate","golatati":"golătate","golatatii":"golătate","golaveraje":"golaveraj","golaverajele":"golaveraj","golaverajelor":"golaveraj","golaverajul":"golaveraj","golaverajule":"golaveraj","golaverajului":"golaveraj","goldane":"goldană","goldanei":"goldană","goldanele":"goldană","goldanelor":"goldană","goldani":"goldan","goldanii":"goldan","goldanilor":"goldan","goldanul":"goldan","goldanule":"goldan","goldanului":"goldan","golea":"goli","goleai":"goli","goleam":"goli","goleati":"goli","goleau":"goli","golesc":"goli","goleste":"goli","golesti":"goli","golful":"golf","golfule":"golf","golfului":"golf","golfuri":"golf","golfurile":"golf","golfurilor":"golf","golgheteri":"golgheter","golgheterii":"golgheter","golgheterilor":"golgheter","golgheterul":"golgheter","golgheterule":"golgheter","golgheterului":"golgheter","golgojine":"golgojină","golgojinei":"golgojină","golgojinele":"golgojină","golgojinelor":"golgojină","golia":"golie","goliardul":"goliard","goliardule":"goliard","goliardului":"goliard","goliarzi":"goliard","goliarzii":"goliard","goliarzilor":"goliard","golicele":"golicică","golicelei":"golicică","golicelele":"golicică","golicelelor":"golicică","goliciunea":"goliciune","goliciuni":"goliciune","goliciunii":"goliciune","goliciunile":"goliciune","goliciunilor":"goliciune","goliei":"golie","golii":["golii","goli","golii","golie"],"goliile":"golie","goliilor":"golie","golim":"goli","golind":"goli","golira":"goli","goliram":"goli","golirati":"goli","golirea":"golire","goliri":"golire","golirii":"golire","golirile":"golire","golirilor":"golire","golise":"goli","golisem":"goli","golisera":"goli","goliseram":"goli","goliserati":"goli","golisesi":"goli","golisi":"goli","golit":"goli","golita":["golită","golit","golita","golit"],"golite":"golit","golitele":"golit","goliti":["goliți","goli","goliți","golit"],"golitii":"golit","golitul":"golit","gologanea":"gologăni","gologaneai":"gologăni","gologaneam":"gologăni","gologaneati":"gologăni","gologaneau":"gologăni","gologanei":"gologănel","gologaneii":"gologănel","gologaneilor":"gologănel","gologanelul":"gologănel","gologanelule":"gologănel","gologanelului":"gologănel","gologanesc":"gologăni","gologaneste":"gologăni","gologanesti":"gologăni","gologani":"gologan","gologanii":["gologanii","gologan","gologănii","gologăni"],"gologanilor":"gologan","gologanim":"gologăni","gologanind":"gologăni","gologanira":"gologăni","gologaniram":"gologăni","gologanirati":"gologăni","gologanise":"gologăni","gologanisem":"gologăni","gologanisera":"gologăni","gologaniseram":"gologăni","gologaniserati":"gologăni","gologanisesi":"gologăni","gologanisi":"gologăni","gologanit":"gologăni","gologaniti":"gologăni","gologanul":"gologan","gologanule":"gologan","gologanului":"gologan","golomatul":"golomăț","golomatule":"golomăț","golomatului":"golomăț","golomozi":"golomoz","golomozii":"golomoz","golomozilor":"golomoz","golomozul":"golomoz","golomozule":"golomoz","golomozului":"golomoz","golul":"gol","golule":"gol","golului":"gol","golumbaria":"golumbărie","golumbariei":"golumbărie","golumbarii":"golumbărie","golumbariile":"golumbărie","golumbariilor":"golumbărie","golumbei":"golumbel","golumbeii":"golumbel","golumbeilor":"golumbel","golumbelul":"golumbel","golumbelule":"golumbel","golumbelului":"golumbel","golumbi":"golumb","golumbii":"golumb","golumbilor":"golumb","golumbite":"golumbiță","golumbitei":"golumbiță","golumbitele":"golumbiță","golumbitelor":"golumbiță","golumbul":"golumb","golumbule":"golumb","golumbului":"golumb","goluri":"gol","goluri de aur":"gol de aur","golurile":"gol","golurilor":"gol","goluta":["goluță","goluț","goluța","goluț"],"golute":"goluț","golutele":"goluț","goluti":"goluț","golutii":"goluț","golutul":"goluț","gombose":"gomboș","gombosele":"gomboș","gomboselor":"gomboș","gombosul":"gomboș","gombosule":"gomboș","gombosului":"gomboș","gome":"gomă","gomei":"gomă","gomele":"gomă","gomelor":"gomă","gomile":"gomilă","gomilei":"gomilă","gomilele":"gomilă","gomilelor":"gomilă","gomoasa":["gomoasă","gomos","gomoasa","gomos"],"gomoase":["gomoase","gomoasă","gomoase","gomos"],"gomoasei":"gomoasă","gomoasele":["gomoasele","gomoasă","gomoasele","gomos"],"gomoaselor":"gomoasă","gomonul":"gomon","gomonule":"gomon","gomonului":"gomon","gomonuri":"gomon","gomonurile":"gomon","gomonurilor":"gomon","gomosi":"gomos","gomosii":"gomos","gomosul":"gomos","gomoze":"gomoză","gomozei":"gomoză","gomozele":"gomoză","gomozelor":"gomoză","gonade":"gonadă","gonadei":"gonadă","gonadele":"gonadă","gonadelor":"gonadă","gonadotropi":"gonadotrop","gonadotropii":"gonadotrop","gonadotropilor":"gonadotrop","gonadotropul":"gonadotrop","gonadotropule":"gonadotrop","gonadotropului":"gonadotrop","gonalgia":"gonalgie","gonalgiei":"gonalgie","gonalgii":"gonalgie","gonalgiile":"gonalgie","gonalgiilor":"gonalgie","gonartrite":"gonartrită","gonartritei":"gonartrită","gonartritele":"gonartrită","gonartritelor":"gonartrită","gonartroze":"gonartroză","gonartrozei":"gonartroză","gonartrozele":"gonartroză","gonartrozelor":"gonartroză","gondole":"gondolă","gondolei":"gondolă","gondolele":"gondolă","gondolelor":"gondolă","gondolete":"gondoletă","gondoletei":"gondoletă","gondoletele":"gondoletă","gondoletelor":"gondoletă","gondoliere":"gondolieră","gondolierei":"gondolieră","gondolierele":"gondolieră","gondolierelor":"gondolieră","gondolieri":"gondolier","gondolierii":"gondolier","gondolierilor":"gondolier","gondolierul":"gondolier","gondolierule":"gondolier","gondolierului":"gondolier","gonea":"goni","goneai":"goni","goneam":"goni","goneati":"goni","goneau":"goni","gonesc":"goni","goneste":"goni","gonesti":"goni","gonfaloane":"gonfalon","gonfaloanele":"gonfalon","gonfaloanelor":"gonfalon","gonfalonieri":"gonfalonier","gonfalonierii":"gonfalonier","gonfalonierilor":"gonfalonier","gonfalonierul":"gonfalonier","gonfalonierule":"gonfalonier","gonfalonierului":"gonfalonier","gonfalonul":"gonfalon","gonfalonule":"gonfalon","gonfalonului":"gonfalon","gonflabila":["gonflabilă","gonflabil","gonflabila","gonflabil"],"gonflabile":"gonflabil","gonflabilele":"gonflabil","gonflabili":"gonflabil","gonflabilii":"gonflabil","gonflabilul":"gonflabil","gonflai":"gonfla","gonflam":["gonflăm","gonfla","gonflam","gonfla"],"gonfland":"gonfla","gonflara":"gonfla","gonflaram":"gonfla","gonflarati":"gonfla","gonflarea":"gonflare","gonflari":"gonflare","gonflarii":"gonflare","gonflarile":"gonflare","gonflarilor":"gonflare","gonflase":"gonfla","gonflasem":"gonfla","gonflasera":"gonfla","gonflaseram":"gonfla","gonflaserati":"gonfla","gonflasesi":"gonfla","gonflasi":"gonfla","gonflat":"gonfla","gonflata":["gonflată","gonflat","gonflata","gonflat"],"gonflate":"gonflat","gonflatele":"gonflat","gonflati":["gonflați","gonfla","gonflați","gonflat"],"gonflatii":"gonflat","gonflatul":"gonflat","gonflau":"gonfla","gonfleaza":"gonfla","gonflez":"gonfla","gonflezi":"gonfla","gongalia":"gongălie","gongaliei":"gongălie","gongalii":"gongălie","gongaliile":"gongălie","gongaliilor":"gongălie","gonghicioarele":"gonghicioare","gonghicioarelor":"gonghicioare","gongorica":["gongorică","gongoric","gongorica","gongoric"],"gongorice":"gongoric","gongoricele":"gongoric","gongorici":"gongoric","gongoricii":"gongoric","gongoricul":"gongoric","gongorisme":"gongorism","gongorismele":"gongorism","gongorismelor":"gongorism","gongorismul":"gongorism","gongorismule":"gongorism","gongorismului":"gongorism","gongorite":"gongoriță","gongoritei":"gongoriță","gongoritele":"gongoriță","gongoritelor":"gongoriță","gongul":"gong","gongule":"gong","gongului":"gong","gongurea":"gonguri","gongureai":"gonguri","gonguream":"gonguri","gongureati":"gonguri","gongureau":"gonguri","gonguresc":"gonguri","gongureste":"gonguri","gonguresti":"gonguri","gonguri":"gong","gongurii":"gonguri","gongurile":"gong","gongurilor":"gong","gongurim":"gonguri","gongurind":"gonguri","gongurira":"gonguri","gonguriram":"gonguri","gongurirati":"gonguri","gongurise":"gonguri","gongurisem":"gonguri","gongurisera":"gonguri","gonguriseram":"gonguri","gonguriserati":"gonguri","gongurisesi":"gonguri","gongurisi":"gonguri","gongurit":"gonguri","gonguriti":"gonguri","gongute":"gonguță","gongutei":"gonguță","gongutele":"gonguță","gongutelor":"gonguță","goniciunea":"goniciune","goniciuni":"goniciune","goniciunii":"goniciune","goniciunile":"goniciune","goniciunilor":"goniciune","gonidia":"gonidie","gonidiei":"gonidie","gonidii":"gonidie","gonidiile":"gonidie","gonidiilor":"gonidie","gonii":"goni","gonim":"goni","gonind":"goni","goniometre":"goniometru","goniometrele":"goniometru","goniometrelor":"goniometru","goniometria":"goniometrie","goniometrica":["goniometrică","goniometric","goniometrica","goniometric"],"goniometrice":"goniometric","goniometricele":"goniometric","goniometrici":"goniometric","goniometricii":"goniometric","goniometricul":"goniometric","goniometriei":"goniometrie","goniometrii":"goniometrie","goniometrul":"goniometru","goniometrule":"goniometru","goniometrului":"goniometru","gonira":"goni","goniram":"goni","gonirati":"goni","gonirea":"gonire","goniri":"gonire","gonirii":"gonire","gonirile":"gonire","gonirilor":"gonire","gonise":"goni","gonisem":"goni","gonisera":"goni","goniseram":"goni","goniserati":"goni","gonisesi":"goni","gonisi":"goni","gonit":"goni","gonite":"goniță","gonitei":"goniță","gonitele":"goniță","gonitelor":"goniță","goniti":"goni","gonitoarea":"gonitoare","gonitoarei":"gonitoare","gonitoarele":"gonitoare","gonitoarelor":"gonitoare","gonituri":"gonitură"};
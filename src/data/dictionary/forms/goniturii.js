@@ -0,0 +1 @@
+export default {"goniturii":"gonitură","goniturile":"gonitură","goniturilor":"gonitură","gonocite":"gonocit","gonocitele":"gonocit","gonocitelor":"gonocit","gonocitul":"gonocit","gonocitule":"gonocit","gonocitului":"gonocit","gonococi":"gonococ","gonococia":"gonococie","gonocociei":"gonococie","gonococii":["gonococii","gonococ","gonococii","gonococie"],"gonococilor":"gonococ","gonococul":"gonococ","gonococule":"gonococ","gonococului":"gonococ","gonocorismul":"gonocorism","gonocorismule":"gonocorism","gonocorismului":"gonocorism","gonoiul":"gonoi","gonoiule":"gonoi","gonoiului":"gonoi","gonoreea":"gonoree","gonoreei":"gonoree","gonoreele":"gonoree","gonoreelor":"gonoree","gordiana":["gordiană","gordian","gordiana","gordian"],"gordianul":"gordian","gordiene":"gordian","gordienele":"gordian","gordieni":"gordian","gordienii":"gordian","gordunasi":"gordunaș","gordunasii":"gordunaș","gordunasilor":"gordunaș","gordunasul":"gordunaș","gordunasule":"gordunaș","gordunasului":"gordunaș","gorgane":"gorgan","gorganele":"gorgan","gorganelor":"gorgan","gorganul":"gorgan","gorganule":"gorgan","gorganului":"gorgan","gorgone":"gorgonă","gorgonei":"gorgonă","gorgonele":"gorgonă","gorgonelor":"gorgonă","gorile":"gorilă","gorilei":"gorilă","gorilele":"gorilă","gorilelor":"gorilă","gorjeana":["gorjeană","gorjean","gorjeana","gorjean"],"gorjeanul":"gorjean","gorjeanule":"gorjean","gorjeanului":"gorjean","gorjence":"gorjeancă","gorjencei":"gorjeancă","gorjencele":"gorjeancă","gorjencelor":"gorjeancă","gorjene":"gorjean","gorjenele":"gorjean","gorjeni":"gorjean","gorjenii":"gorjean","gorjenilor":"gorjean","gornicese":"gorniceasă","gornicesei":"gorniceasă","gornicesele":"gorniceasă","gorniceselor":"gorniceasă","gornici":"gornic","gornicia":"gornicie","gorniciei":"gornicie","gornicii":["gornicii","gornic","gornicii","gornicie"],"gorniciile":"gornicie","gorniciilor":"gornicie","gornicilor":"gornic","gornicul":"gornic","gornicule":"gornic","gornicului":"gornic","gornisti":"gornist","gornistii":"gornist","gornistilor":"gornist","gornistul":"gornist","gornistule":"gornist","gornistului":"gornist","gornite":"gorniță","gornitei":"gorniță","gornitele":"gorniță","gornitelor":"gorniță","goroncute":"goroncuță","goroncutei":"goroncuță","goroncutele":"goroncuță","goroncutelor":"goroncuță","goronetul":"goronet","goronetule":"goronet","goronetului":"goronet","goroneturi":"goronet","goroneturile":"goronet","goroneturilor":"goronet","gorunei":"gorunel","goruneii":"gorunel","goruneilor":"gorunel","gorunelul":"gorunel","gorunelule":"gorunel","gorunelului":"gorunel","gorunetul":"gorunet","gorunetule":"gorunet","gorunetului":"gorunet","goruneturi":"gorunet","goruneturile":"gorunet","goruneturilor":"gorunet","goruni":"gorun","gorunii":"gorun","gorunilor":"gorun","gorunistea":"goruniște","gorunistei":"goruniște","gorunistele":"goruniște","gorunistelor":"goruniște","gorunisul":"goruniș","gorunisule":"goruniș","gorunisului":"goruniș","gorunisuri":"goruniș","gorunisurile":"goruniș","gorunisurilor":"goruniș","gorunul":"gorun","gorunule":"gorun","gorunului":"gorun","gosipolul":"gosipol","gosipolule":"gosipol","gosipolului":"gosipol","gosipoluri":"gosipol","gosipolurile":"gosipol","gosipolurilor":"gosipol","gospoda":["gospodă","gospod","gospoda","gospod"],"gospodara":["gospodară","gospodar","gospodara","gospodar"],"gospodarasi":"gospodăraș","gospodarasii":"gospodăraș","gospodarasilor":"gospodăraș","gospodarasul":"gospodăraș","gospodarasule":"gospodăraș","gospodarasului":"gospodăraș","gospodare":"gospodar","gospodarea":"gospodări","gospodareai":"gospodări","gospodaream":"gospodări","gospodareasca":["gospodărească","gospodăresc","gospodăreasca","gospodăresc"],"gospodareati":"gospodări","gospodareau":"gospodări","gospodarele":"gospodar","gospodaresc":"gospodări","gospodarescul":"gospodăresc","gospodareste":"gospodări","gospodaresti":["gospodărești","gospodăresc","gospodărești","gospodări"],"gospodarestii":"gospodăresc","gospodarestile":"gospodăresc","gospodari":"gospodar","gospodarii":["gospodarii","gospodar","gospodării","gospodări","gospodării","gospodărie"],"gospodarilor":"gospodar","gospodarim":"gospodări","gospodarind":"gospodări","gospodarioare":"gospodărioară","gospodarioarei":"gospodărioară","gospodarioarele":"gospodărioară","gospodarioarelor":"gospodărioară","gospodarira":"gospodări","gospodariram":"gospodări","gospodarirati":"gospodări","gospodarirea":"gospodărire","gospodariri":"gospodărire","gospodaririi":"gospodărire","gospodaririle":"gospodărire","gospodaririlor":"gospodărire","gospodarise":"gospodări","gospodarisem":"gospodări","gospodarisera":"gospodări","gospodariseram":"gospodări","gospodariserati":"gospodări","gospodarisesi":"gospodări","gospodarisi":"gospodări","gospodarit":"gospodări","gospodarita":["gospodărită","gospodărit","gospodărita","gospodărit"],"gospodarite":["gospodărite","gospodărit","gospodărițe","gospodăriță"],"gospodaritei":"gospodăriță","gospodaritele":["gospodăritele","gospodărit","gospodărițele","gospodăriță"],"gospodaritelor":"gospodăriță","gospodariti":["gospodăriți","gospodări","gospodăriți","gospodărit"],"gospodaritii":"gospodărit","gospodaritul":"gospodărit","gospodarul":"gospodar","gospodarule":"gospodar","gospodarului":"gospodar","gospode":"gospod","gospodele":"gospod","gospodine":"gospodină","gospodinei":"gospodină","gospodinele":"gospodină","gospodinelor":"gospodină","gospodini":"gospodin","gospodinii":"gospodin","gospodinilor":"gospodin","gospodinul":"gospodin","gospodinule":"gospodin","gospodinului":"gospodin","gospodul":"gospod","gospojde":"gospojdă","gospojdei":"gospojdă","gospojdele":"gospojdă","gospojdelor":"gospojdă","gospozi":"gospod","gospozii":"gospod","gostini":"goștină","gostinii":"goștină","gostinile":"goștină","gostinilor":"goștină","gotcani":"gotcan","gotcanii":"gotcan","gotcanilor":"gotcan","gotcanul":"gotcan","gotcanule":"gotcan","gotcanului":"gotcan","gotci":"gotcă","gotcii":"gotcă","gotcile":"gotcă","gotcilor":"gotcă","goti":"got","gotica":["gotică","gotic","gotica","gotic"],"gotice":["gotice","gotic","gotice","gotică"],"goticei":"gotică","goticele":["goticele","gotic","goticele","gotică"],"goticelor":"gotică","gotici":"gotic","goticii":"gotic","goticul":"gotic","gotii":"got","gotilor":"got","gotovea":"gotovi","gotoveai":"gotovi","gotoveam":"gotovi","gotoveati":"gotovi","gotoveau":"gotovi","gotovesc":"gotovi","gotoveste":"gotovi","gotovesti":"gotovi","gotovii":"gotovi","gotovim":"gotovi","gotovind":"gotovi","gotovira":"gotovi","gotoviram":"gotovi","gotovirati":"gotovi","gotovirea":"gotovire","gotoviri":"gotovire","gotovirii":"gotovire","gotovirile":"gotovire","gotovirilor":"gotovire","gotovise":"gotovi","gotovisem":"gotovi","gotovisera":"gotovi","gotoviseram":"gotovi","gotoviserati":"gotovi","gotovisesi":"gotovi","gotovisi":"gotovi","gotovit":"gotovi","gotoviti":"gotovi","gotul":"got","gotule":"got","gotului":"got","govioare":"govioară","govioarei":"govioară","govioarele":"govioară","govioarelor":"govioară","gozarul":"gozar","gozarule":"gozar","gozarului":"gozar","gozometeul":"gozomete","gozometeule":"gozomete","gozometeului":"gozomete","gozometi":"gozomete","gozometii":"gozomete","gozometilor":"gozomete","gozul":"goz","gozule":"goz","gozului":"goz","gozuri":["gozuri","goz","gozuri","gozură"],"gozurii":"gozură","gozurile":["gozurile","goz","gozurile","gozură"],"gozurilor":["gozurilor","goz","gozurilor","gozură"],"grabari":"grăbar","grabarii":"grăbar","grabarilor":"grăbar","grabarul":"grăbar","grabarule":"grăbar","grabarului":"grăbar","grabe":"grabă","grabea":"grăbi","grabeai":"grăbi","grabeam":"grăbi","grabeati":"grăbi","grabeau":"grăbi","grabei":"grabă","grabene":"graben","grabenele":"graben","grabenelor":"graben","grabenul":"graben","grabenule":"graben","grabenului":"graben","grabesc":"grăbi","grabeste":"grăbi","grabesti":"grăbi","grabii":"grăbi","grabim":"grăbi","grabind":"grăbi","grabira":"grăbi","grabiram":"grăbi","grabirati":"grăbi","grabirea":"grăbire","grabiri":"grăbire","grabirii":"grăbire","grabirile":"grăbire","grabirilor":"grăbire","grabise":"grăbi","grabisem":"grăbi","grabisera":"grăbi","grabiseram":"grăbi","grabiserati":"grăbi","grabisesi":"grăbi","grabisi":"grăbi","grabit":"grăbi","grabita":["grăbită","grăbit","grăbita","grăbit"],"grabite":"grăbit","grabitele":"grăbit","grabiti":["grăbiți","grăbi","grăbiți","grăbit"],"grabitii":"grăbit","grabitul":"grăbit","grabnica":["grabnică","grabnic","grabnica","grabnic"],"grabnice":"grabnic","grabnicele":"grabnic","grabnici":"grabnic","grabnicia":"grăbnicie","grabniciei":"grăbnicie","grabnicii":["grabnicii","grabnic","grăbnicii","grăbnicie"],"grabniciile":"grăbnicie","grabniciilor":"grăbnicie","grabnicul":"grabnic","gracilitatea":"gracilitate","gracilitati":"gracilitate","gracilitatii":"gracilitate","gradai":"grada","gradam":["gradăm","grada","gradam","grada"],"gradand":"grada","gradara":"grada","gradaram":"grada","gradarati":"grada","gradarea":"gradare","gradari":"gradare","gradarii":"gradare","gradarile":"gradare","gradarilor":"gradare","gradase":"grada","gradasem":"grada","gradasera":"grada","gradaseram":"grada","gradaserati":"grada","gradasesi":"grada","gradasi":"grada","gradat":"grada","gradati":["gradați","grada","gradați","gradat"],"gradatia":"gradație","gradatiei":"gradație","gradatii":["gradații","gradat","gradații","gradație"],"gradatiile":"gradație","gradatiilor":"gradație","gradatilor":"gradat","gradatiunea":"gradațiune","gradatiuni":"gradațiune","gradatiunii":"gradațiune","gradatiunile":"gradațiune","gradatiunilor":"gradațiune","gradatul":"gradat","gradatule":"gradat","gradatului":"gradat","gradau":"grada","grade":"grad","grade celsius":"grad Celsius","grade de comparatie":"grad de comparație","grade de libertate":"grad de libertate","gradeaza":"grada","gradele":"grădelă","gradelei":"grădelă","gradelele":"grădelă","gradelelor":"grădelă","gradez":"grada","gradezi":"grada","gradienti":"gradient","gradientii":"gradient","gradientilor":"gradient","gradientul":"gradient","gradientule":"gradient","gradientului":"gradient","gradinarea":"grădinări","gradinareai":"grădinări","gradinaream":"grădinări","gradinareasca":["grădinărească","grădinăresc","grădinăreasca","grădinăresc"],"gradinareati":"grădinări","gradinareau":"grădinări","gradinaresc":"grădinări","gradinarescul":"grădinăresc","gradinarese":"grădinăreasă","gradinaresei":"grădinăreasă","gradinaresele":"grădinăreasă","gradinareselor":"grădinăreasă","gradinareste":"grădinări","gradinaresti":["grădinărești","grădinăresc","grădinărești","grădinări"],"gradinarestii":"grădinăresc","gradinarestile":"grădinăresc","gradinari":"grădinar","gradinaria":"grădinărie","gradinariei":"grădinărie","gradinarii":["grădinarii","grădinar","grădinării","grădinări","grădinării","grădinărie"],"gradinariile":"grădinărie","gradinariilor":"grădinărie","gradinarilor":"grădinar","gradinarim":"grădinări","gradinarind":"grădinări","gradinarira":"grădinări","gradinariram":"grădinări","gradinarirati":"grădinări","gradinarise":"grădinări","gradinarisem":"grădinări","gradinarisera":"grădinări","gradinariseram":"grădinări","gradinariserati":"grădinări","gradinarisesi":"grădinări","gradinarisi":"grădinări","gradinarite":"grădinăriță","gradinaritei":"grădinăriță","gradinaritele":"grădinăriță","gradinaritelor":"grădinăriță","gradinariti":"grădinări","gradinaritul":"grădinărit","gradinaritule":"grădinărit","gradinaritului":"grădinărit","gradinarul":"grădinar","gradinarule":"grădinar","gradinarului":"grădinar","gradini":"grădină","gradini botanice":"grădină botanică","gradini de copii":"grădină de copii","gradini de legume":"grădină de legume","gradini publice":"grădină publică","gradini zoologice":"grădină zoologică","gradinici":"grădinică","gradinicii":"grădinică","gradinicile":"grădinică","gradinicilor":"grădinică","gradinii":"grădină","gradinile":"grădină","gradinilor":"grădină","gradinite":"grădiniță","gradinite de copii":"grădiniță de copii","gradinitei":"grădiniță","gradinitele":"grădiniță","gradinitelor":"grădiniță","gradinute":"grădinuță","gradinutei":"grădinuță","gradinutele":"grădinuță","gradinutelor":"grădinuță","gradioare":"grădioară","gradioarei":"grădioară","gradioarele":"grădioară","gradioarelor":"grădioară","gradistea":"grădiște","gradisti":"grădiște","gradistii":"grădiște","gradistile":"grădiște","gradistilor":"grădiște","graduai":"gradua","graduam":["graduăm","gradua","graduam","gradua"],"graduand":"gradua","graduara":"gradua","graduaram":"gradua","graduarati":"gradua","graduase":"gradua","graduasem":"gradua","graduasera":"gradua","graduaseram":"gradua","graduaserati":"gradua","graduasesi":"gradua","graduasi":"gradua","graduat":"gradua","graduata":["graduată","graduat","graduata","graduat"],"graduate":"graduat","graduatele":"graduat","graduati":["graduați","gradua","graduați","graduat"],"graduatii":"graduat","graduatul":"graduat","graduau":"gradua","gradueaza":"gradua","graduez":"gradua","graduezi":"gradua","grafeme":"grafem","grafemele":"grafem","grafemelor":"grafem","grafemul":"grafem","grafemule":"grafem","grafemului":"grafem","graffitiste":"graffitistă","graffitistei":"graffitistă","graffitistele":"graffitistă","graffitistelor":"graffitistă","graffitiul":"graffiti","graffitiule":"graffiti","graffitiului":"graffiti","grafi":"graf","grafia":"grafie","grafica":["grafică","grafic","grafica","grafic"],"graficaul":"grafică","graficaule":"grafică","graficaului":"grafică","grafice":"grafic","graficele":"grafic","graficelor":"grafic","grafici":["grafici","grafic","grafici","grafică"],"graficianul":"grafician","graficianule":"grafician","graficianului":"grafician","graficiene":"graficiană","graficienei":"graficiană","graficienele":"graficiană","graficienelor":"graficiană","graficieni":"grafician","graficienii":"grafician","graficienilor":"grafician","graficii":"grafic","graficile":"grafică","graficilor":"grafică","graficul":"grafic","graficule":"grafic","graficului":"grafic","grafiei":"grafie","grafii":["grafii","graf","grafii","grafie","grafii","grafiu"],"grafiile":["grafiile","grafie","grafiile","grafiu"],"grafiilor":["grafiilor","grafie","grafiilor","grafiu"],"grafilor":"graf","grafine":"grafină","grafinei":"grafină","grafinele":"grafină","grafinelor":"grafină","grafitica":["grafitică","grafitic","grafitica","grafitic"],"grafitice":"grafitic","grafiticele":"grafitic","grafitici":"grafitic","grafiticii":"grafitic","grafiticul":"grafitic","grafitizai":"grafitiza","grafitizam":["grafitizăm","grafitiza","grafitizam","grafitiza"],"grafitizand":"grafitiza","grafitizara":"grafitiza","grafitizaram":"grafitiza","grafitizarati":"grafitiza","grafitizarea":"grafitizare","grafitizari":"grafitizare","grafitizarii":"grafitizare","grafitizarile":"grafitizare","grafitizarilor":"grafitizare","grafitizase":"grafitiza","grafitizasem":"grafitiza","grafitizasera":"grafitiza","grafitizaseram":"grafitiza","grafitizaserati":"grafitiza","grafitizasesi":"grafitiza","grafitizasi":"grafitiza","grafitizat":"grafitiza","grafitizati":"grafitiza","grafitizau":"grafitiza","grafitizeaza":"grafitiza","grafitizez":"grafitiza","grafitizezi":"grafitiza","grafitoasa":["grafitoasă","grafitos","grafitoasa","grafitos"],"grafitoase":"grafitos","grafitoasele":"grafitos","grafitosi":"grafitos","grafitosii":"grafitos","grafitosul":"grafitos","grafitul":"grafit","grafitule":"grafit","grafitului":"grafit","grafiuul":"grafiu","grafiuule":"grafiu","grafiuului":"grafiu","grafofoane":"grafofon","grafofoanele":"grafofon","grafofoanelor":"grafofon","grafofobia":"grafofobie","grafofobiei":"grafofobie","grafofobii":"grafofobie","grafofobiile":"grafofobie","grafofobiilor":"grafofobie","grafofonul":"grafofon","grafofonule":"grafofon","grafofonului":"grafofon","grafologe":"grafologă","grafologei":"grafologă","grafologele":"grafologă","grafologelor":"grafologă","grafologi":"grafolog","grafologia":"grafologie","grafologica":["grafologică","grafologic","grafologica","grafologic"],"grafologice":"grafologic","grafologicele":"grafologic","grafologici":"grafologic","grafologicii":"grafologic","grafologicul":"grafologic","grafologiei":"grafologie","grafologii":"grafologie","grafomane":"grafomană","grafomanei":"grafomană","grafomanele":"grafomană","grafomanelor":"grafomană","grafomani":"grafoman","grafomania":"grafomanie","grafomaniei":"grafomanie","grafomanii":["grafomanii","grafoman","grafomanii","grafomanie"],"grafomanilor":"grafoman","grafomanul":"grafoman","grafomanule":"grafoman","grafomanului":"grafoman","grafometre":"grafometru","grafometrele":"grafometru","grafometrelor":"grafometru","grafometria":"grafometrie","grafometrica":["grafometrică","grafometric","grafometrica","grafometric"],"grafometrice":"grafometric","grafometricele":"grafometric","grafometrici":"grafometric","grafometricii":"grafometric","grafometricul":"grafometric","grafometriei":"grafometrie","grafometrii":"grafometrie","grafometriile":"grafometrie","grafometriilor":"grafometrie","grafometrul":"grafometru","grafometrule":"grafometru","grafometrului":"grafometru","graforeea":"graforee","graforeei":"graforee","grafospasme":"grafospasm","grafospasmele":"grafospasm","grafospasmelor":"grafospasm","grafospasmul":"grafospasm","grafospasmule":"grafospasm","grafospasmului":"grafospasm","graful":"graf","grafule":"graf","grafului":"graf","grafuri":"graf","grafurile":"graf","grafurilor":"graf","grahamul":"graham","grahamule":"graham","grahamului":"graham","graia":"grăi","graiai":"grăi","graiam":"grăi","graiati":"grăi","graiau":"grăi","graiesc":"grăi","graieste":"grăi","graiesti":"grăi","graifare":"graifăr","graifarele":"graifăr","graifarelor":"graifăr","graifarul":"graifăr","graifarule":"graifăr","graifarului":"graifăr","graii":"grăi","graim":"grăi","graind":"grăi","graira":"grăi","grairam":"grăi","grairati":"grăi","grairea":"grăire","grairi":"grăire","grairii":"grăire","grairile":"grăire","grairilor":"grăire","graise":"grăi","graisem":"grăi","graisera":"grăi","graiseram":"grăi","graiserati":"grăi","graisesi":"grăi","graisi":"grăi","grait":"grăi","graiti":["grăiți","grăi","grăiți","grăit"],"graitoare":"grăitor","graitoarea":"grăitor","graitoarele":"grăitor","graitori":"grăitor","graitorii":"grăitor","graitorul":"grăitor","graiuri":"grai","graiutul":"grăiuț","graiutule":"grăiuț","graiutului":"grăiuț","graiuturi":"grăiuț","graiuturile":"grăiuț","graiuturilor":"grăiuț","grajdari":"grăjdar","grajdarii":"grăjdar","grajdarilor":"grăjdar","grajdarul":"grăjdar","grajdarule":"grăjdar","grajdarului":"grăjdar","grajdisoare":"grăjdișor","grajdisoarele":"grăjdișor","grajdisoarelor":"grăjdișor","grajdisorul":"grăjdișor","grajdisorule":"grăjdișor","grajdisorului":"grăjdișor","grajdul":"grajd","grajdule":"grajd","grajdulete":"grăjduleț","grajduletele":"grăjduleț","grajduletelor":"grăjduleț","grajduletul":"grăjduleț","grajduletule":"grăjduleț","grajduletului":"grăjduleț","grajdului":"grajd","grajduri":"grajd","grajdurile":"grajd","grajdurilor":"grajd","grajdutul":"grăjduț","grajdutule":"grăjduț","grajdutului":"grăjduț","grajduturi":"grăjduț","grajduturile":"grăjduț","grajduturilor":"grăjduț","gramadeli":"grămădeală","gramadelii":"grămădeală","gramadelile":"grămădeală","gramadelilor":"grămădeală","gramadirea":"grămădire","gramadiri":"grămădire","gramadirii":"grămădire","gramadirile":"grămădire","gramadirilor":"grămădire","gramajeaua":"grămăjea","gramajele":"grămăjea","gramajelei":"grămăjea","gramajelele":"grămăjea","gramajelelor":"grămăjea","gramajoare":"grămăjoară","gramajoarei":"grămăjoară","gramajoarele":"grămăjoară","gramajoarelor":"grămăjoară","gramajui":"grămăjuie","gramajuia":"grămăjuie","gramajuiei":"grămăjuie","gramajuii":"grămăjuie","gramajuiile":"grămăjuie","gramajuiilor":"grămăjuie","gramajul":"gramaj","gramajule":"gramaj","gramajului":"gramaj","gramatia":"gramatie","gramaticala":["gramaticală","gramatical","gramaticala","gramatical"],"gramaticale":"gramatical","gramaticalele":"gramatical","gramaticali":"gramatical","gramaticalii":"gramatical","gramaticalitatea":"gramaticalitate","gramaticalitati":"gramaticalitate","gramaticalitatii":"gramaticalitate","gramaticalizai":"gramaticaliza","gramaticalizam":["gramaticalizăm","gramaticaliza","gramaticalizam","gramaticaliza"],"gramaticalizand":"gramaticaliza","gramaticalizara":"gramaticaliza","gramaticalizaram":"gramaticaliza","gramaticalizarati":"gramaticaliza","gramaticalizarea":"gramaticalizare","gramaticalizari":"gramaticalizare","gramaticalizarii":"gramaticalizare","gramaticalizarile":"gramaticalizare","gramaticalizarilor":"gramaticalizare","gramaticalizase":"gramaticaliza","gramaticalizasem":"gramaticaliza","gramaticalizasera":"gramaticaliza","gramaticalizaseram":"gramaticaliza","gramaticalizaserati":"gramaticaliza","gramaticalizasesi":"gramaticaliza","gramaticalizasi":"gramaticaliza","gramaticalizat":"gramaticaliza","gramaticalizati":"gramaticaliza","gramaticalizau":"gramaticaliza","gramaticalizeaza":"gramaticaliza","gramaticalizez":"gramaticaliza","gramaticalizezi":"gramaticaliza","gramaticalul":"gramatical","gramaticeasca":["gramaticească","gramaticesc","gramaticeasca","gramaticesc"],"gramaticescul":"gramaticesc","gramaticesti":"gramaticesc","gramaticestii":"gramaticesc","gramaticestile":"gramaticesc","gramatici":["gramatici","gramatic","grămătici","grămătic","gramatici","gramatică"],"gramaticia":"grămăticie","gramaticianul":"gramatician","gramaticianule":"gramatician","gramaticianului":"gramatician","gramaticiei":"grămăticie","gramaticiene":"gramaticiană","gramaticienei":"gramaticiană","gramaticienele":"gramaticiană","gramaticienelor":"gramaticiană","gramaticieni":"gramatician","gramaticienii":"gramatician","gramaticienilor":"gramatician","gramaticii":["gramaticii","gramatic","grămăticii","grămătic","gramaticii","gramatică","grămăticii","grămăticie"],"gramaticiile":"grămăticie","gramaticiilor":"grămăticie","gramaticile":"gramatică","gramaticilor":["gramaticilor","gramatic","grămăticilor","grămătic","gramaticilor","gramatică"],"gramaticul":["gramaticul","gramatic","grămăticul","grămătic"],"gramaticule":["gramaticule","gramatic","grămăticule","grămătic"],"gramaticului":["gramaticului","gramatic","grămăticului","grămătic"],"gramatiei":"gramatie","gramatii":"gramatie","gramatiile":"gramatie","gramatiilor":"gramatie","gramatisti":"gramatist","gramatistii":"gramatist","gramatistilor":"gramatist","gramatistul":"gramatist","gramatistule":"gramatist","gramatistului":"gramatist","grame":"gram","gramele":"gram","gramelor":"gram","gramezi":"grămadă","gramezii":"grămadă","gramezile":"grămadă","gramezilor":"grămadă","gramineea":"graminee","gramineei":"graminee","gramineele":"graminee","gramineelor":"graminee","gramnegativa":["gramnegativă","gramnegativ","gramnegativa","gramnegativ"],"gramnegative":"gramnegativ","gramnegativele":"gramnegativ","gramnegativi":"gramnegativ","gramnegativii":"gramnegativ","gramnegativul":"gramnegativ","gramofoane":"gramofon","gramofoanele":"gramofon","gramofoanelor":"gramofon","gramofonul":"gramofon","gramofonule":"gramofon","gramofonului":"gramofon","gramole":"gramolă","gramolei":"gramolă","gramolele":"gramolă","gramolelor":"gramolă","grampiri":"grampir","grampirii":"grampir","grampirilor":"grampir","grampirul":"grampir","grampirule":"grampir","grampirului":"grampir","grampozitiva":["grampozitivă","grampozitiv","grampozitiva","grampozitiv"],"grampozitive":"grampozitiv","grampozitivele":"grampozitiv","grampozitivi":"grampozitiv","grampozitivii":"grampozitiv","grampozitivul":"grampozitiv","gramul":"gram","gramule":"gram","gramului":"gram","granadiri":"granadir","granadirii":"granadir","granadirilor":"granadir","granadirul":"granadir","granadirule":"granadir","granadirului":"granadir","granare":"grânar","granarele":"grânar","granarelor":"grânar","granarul":"grânar","granarule":"grânar","granarului":"grânar","granat":"granată","granata":"grenadă","granate":["granate","granat","granate","granată"],"granatei":"granată","granatele":["granatele","granat","granatele","granată"],"granatelor":["granatelor","granat","granatelor","granată"],"granatul":"granat","granatule":"granat","granatului":"granat","grandangulare":"grandangular","grandangularele":"grandangular","grandangularelor":"grandangular","grandangularul":"grandangular","grandangularule":"grandangular","grandangularului":"grandangular","grandilocventa":["grandilocventă","grandilocvent","grandilocventa","grandilocvent"],"grandilocvente":["grandilocvente","grandilocvent","grandilocvențe","grandilocvență"],"grandilocventei":"grandilocvență","grandilocventele":["grandilocventele","grandilocvent","grandilocvențele","grandilocvență"],"grandilocventelor":"grandilocvență","grandilocventi":"grandilocvent","grandilocventii":"grandilocvent","grandilocventul":"grandilocvent","grandioasa":["grandioasă","grandios","grandioasa","grandios"],"grandioase":"grandios","grandioasele":"grandios","grandiosi":"grandios","grandiosii":"grandios","grandiosul":"grandios","grandioza":["grandioză","grandioz","grandioza","grandioz"],"grandioze":"grandioz","grandiozele":"grandioz","grandiozi":"grandioz","grandiozii":"grandioz","grandiozitatea":"grandiozitate","grandiozitati":"grandiozitate","grandiozitatii":"grandiozitate","grandiozitatile":"grandiozitate","grandiozitatilor":"grandiozitate","grandiozul":"grandioz","grandoarea":"grandoare","grandoari":"grandoare","grandoarii":"grandoare","grandoarile":"grandoare","grandoarilor":"grandoare","grandomane":"grandomană","grandomanei":"grandomană","grandomanele":"grandomană","grandomanelor":"grandomană","grandomani":"grandoman","grandomania":"grandomanie","grandomaniei":"grandomanie","grandomanii":["grandomanii","grandoman","grandomanii","grandomanie"],"grandomanilor":"grandoman","grandomanul":"grandoman","grandomanule":"grandoman","grandomanului":"grandoman","grandori":"grandoare","granducaul":"granducă","granducaule":"granducă","granducaului":"granducă","granduci":"granducă","granducii":"granducă","granducilor":"granducă","grane":["grane","gran","grâne","grâu"],"granele":["granele","gran","grânele","grâu"],"granelor":["granelor","gran","grânelor","grâu"],"grangoase":"grângoașă","grangoasei":"grângoașă","grangoasele":"grângoașă","grangoaselor":"grângoașă","grangori":"grangor","grangorii":"grangor","grangorilor":"grangor","grangorul":"grangor","grangorule":"grangor","grangorului":"grangor","grangurasi":"grânguraș","grangurasii":"grânguraș","grangurasilor":"grânguraș","grangurasul":"grânguraș","grangurasule":"grânguraș","grangurasului":"grânguraș","grangurei":"grăngurel","grangureii":"grăngurel","grangureilor":"grăngurel","grangurelul":"grăngurel","grangurelule":"grăngurel","grangurelului":"grăngurel","grangureul":"grangure","grangureule":"grangure","grangureului":"grangure","granguri":["granguri","grangur","granguri","grangure"],"grangurii":["grangurii","grangur","grangurii","grangure"],"grangurilor":["grangurilor","grangur","grangurilor","grangure"],"grangurul":"grangur","grangurule":"grangur","grangurului":"grangur","granicereasca":["grănicerească","grăniceresc","grănicereasca","grăniceresc"],"granicerescul":"grăniceresc","graniceresti":"grăniceresc","granicerestii":"grăniceresc","granicerestile":"grăniceresc","graniceri":"grănicer","granicerii":"grănicer","granicerilor":"grănicer","granicerul":"grănicer","granicerule":"grănicer","granicerului":"grănicer","granifera":["graniferă","granifer","granifera","granifer"],"granifere":"granifer","graniferele":"granifer","graniferi":"granifer","graniferii":"granifer","graniferul":"granifer","granitarea":"grănițare","granitari":"grănițare","granitarii":"grănițare","granitarile":"grănițare","granitarilor":"grănițare","granitata":["grănițată","grănițat","grănițata","grănițat"],"granitate":"grănițat","granitatele":"grănițat","granitati":"grănițat","granitatii":"grănițat","granitatul":"grănițat","granite":"graniță","granitei":"graniță","granitele":"graniță","granitelor":"graniță","granitica":["granitică","granitic","granitica","granitic"],"granitice":"granitic","graniticele":"granitic","granitici":"granitic","graniticii":"granitic","graniticul":"granitic","granitizarea":"granitizare","granitizari":"granitizare","granitizarii":"granitizare","granitul":"granit","granitule":"granit","granitului":"granit","granituri":"granit","graniturile":"granit","graniturilor":"granit","granivori":"granivor","granivorii":"granivor","granivorilor":"granivor","granivorul":"granivor","granivorule":"granivor","granivorului":"granivor","granodiorite":"granodiorit","granodioritele":"granodiorit","granodioritelor":"granodiorit","granodioritul":"granodiorit","granodioritule":"granodiorit","granodioritului":"granodiorit","grantasi":"grăntaș","grantasii":"grăntaș","grantasilor":"grăntaș","grantasul":"grăntaș","grantasule":"grăntaș","grantasului":"grăntaș","granul":"gran","granulai":"granula","granulam":["granulăm","granula","granulam","granula"],"granuland":"granula","granulara":["granulară","granula","granulară","granular","granulara","granular"],"granularam":"granula","granularati":"granula","granulare":"granular","granularea":"granulare","granularele":"granular","granulari":["granulari","granular","granulări","granulare"],"granularii":["granularii","granular","granulării","granulare"],"granularile":"granulare","granularilor":"granulare","granularul":"granular","granulase":"granula","granulasem":"granula","granulasera":"granula","granulaseram":"granula","granulaserati":"granula","granulasesi":"granula","granulasi":"granula","granulat":"granula","granulata":["granulată","granulat","granulata","granulat"],"granulate":"granulat","granulatele":"granulat","granulati":["granulați","granula","granulați","granulat"],"granulatia":"granulație","granulatiei":"granulație","granulatii":["granulații","granulat","granulații","granulație"],"granulatiile":"granulație","granulatiilor":"granulație","granulatiunea":"granulațiune","granulatiuni":"granulațiune","granulatiunii":"granulațiune","granulatiunile":"granulațiune","granulatiunilor":"granulațiune","granulatoare":"granulator","granulatoarele":"granulator","granulatoarelor":"granulator","granulatorul":"granulator","granulatorule":"granulator","granulatorului":"granulator","granulatul":"granulat","granulau":"granula","granule":["granule","gran","granule","granulă"],"granuleaza":"granula","granulei":"granulă","granulele":"granulă","granulelor":"granulă","granulez":"granula","granulezi":"granula","granulia":"granulie","granuliei":"granulie","granulii":"granulie","granulite":"granulit","granulitele":"granulit","granulitelor":"granulit","granulitul":"granulit","granulitule":"granulit","granulitului":"granulit","granuloame":"granulom","granuloamele":"granulom","granuloamelor":"granulom","granuloasa":["granuloasă","granulos","granuloasa","granulos"],"granuloase":"granulos","granuloasele":"granulos","granulocite":"granulocit","granulocitele":"granulocit","granulocitelor":"granulocit","granulocitopenia":"granulocitopenie","granulocitopeniei":"granulocitopenie","granulocitopenii":"granulocitopenie","granulocitopeniile":"granulocitopenie","granulocitopeniilor":"granulocitopenie","granulocitoze":"granulocitoză","granulocitozei":"granulocitoză","granulocitozele":"granulocitoză","granulocitozelor":"granulocitoză","granulocitul":"granulocit","granulocitule":"granulocit","granulocitului":"granulocit","granulomatoasa":["granulomatoasă","granulomatos","granulomatoasa","granulomatos"],"granulomatoase":"granulomatos","granulomatoasele":"granulomatos","granulomatosi":"granulomatos","granulomatosii":"granulomatos","granulomatosul":"granulomatos","granulometria":"granulometrie","granulometrica":["granulometrică","granulometric","granulometrica","granulometric"],"granulometrice":"granulometric","granulometricele":"granulometric","granulometrici":"granulometric","granulometricii":"granulometric","granulometricul":"granulometric","granulometriei":"granulometrie","granulometrii":"granulometrie","granulomul":"granulom","granulomule":"granulom","granulomului":"granulom","granulopenia":"granulopenie","granulopeniei":"granulopenie","granulopenii":"granulopenie","granulopeniile":"granulopenie","granulopeniilor":"granulopenie","granulosi":"granulos","granulosii":"granulos","granulosul":"granulos","granulozitatea":"granulozitate","granulozitati":"granulozitate","granulozitatii":"granulozitate","granulozitatile":"granulozitate","granulozitatilor":"granulozitate","granului":"gran","grapai":"grăpa","grapam":["grăpăm","grăpa","grăpam","grăpa"],"grapand":"grăpa","grapara":"grăpa","graparam":"grăpa","graparati":"grăpa","grapase":"grăpa","grapasem":"grăpa","grapasera":"grăpa","grapaseram":"grăpa","grapaserati":"grăpa","grapasesi":"grăpa","grapasi":"grăpa","grapat":"grăpa","grapata":["grăpată","grăpat","grăpata","grăpat"],"grapate":"grăpat","grapatele":"grăpat","grapati":["grăpați","grăpa","grăpați","grăpat"],"grapatii":"grăpat","grapatoarea":"grăpătoare","grapatori":"grăpătoare","grapatorii":"grăpătoare","grapatorile":"grăpătoare","grapatorilor":"grăpătoare","grapatul":"grăpat","grapau":"grăpa","grape":"grapă","grape-fruit":"grepfrut","grapeaza":"grăpa","grapei":"grapă","grapele":"grapă","grapelor":"grapă","grapez":"grăpa","grapezi":"grăpa","grapine":"grapină","grapinei":"grapină","grapinele":"grapină","grapinelor":"grapină","graptoliti":"graptolit","graptolitii":"graptolit","graptolitilor":"graptolit","graptolitul":"graptolit","graptolitule":"graptolit","graptolitului":"graptolit","grasa":["grasă","gras","grasa","gras"],"grasani":"grăsan","grasanii":"grăsan","grasanilor":"grăsan","grasanul":"grăsan","grasanule":"grăsan","grasanului":"grăsan","grasceanul":"grăscean","grasceanule":"grăscean","grasceanului":"grăscean","grasceni":"grăscean","grascenii":"grăscean","grascenilor":"grăscean","grasciora":["grăscioră","grăscior","grăsciora","grăscior"],"grasciore":"grăscior","grasciorele":"grăscior","grasciori":"grăscior","grasciorii":"grăscior","grasciorul":"grăscior","grase":["grase","gras","grase","grasă"],"grasei":"grasă","graseiai":"graseia","graseiam":"graseia","graseiara":"graseia","graseiaram":"graseia","graseiarati":"graseia","graseiase":"graseia","graseiasem":"graseia","graseiasera":"graseia","graseiaseram":"graseia","graseiaserati":"graseia","graseiasesi":"graseia","graseiasi":"graseia","graseiat":"graseia","graseiati":"graseia","graseiau":"graseia","graseiaza":"graseia","graseie":"graseia","graseieaza":"graseia","graseiem":"graseia","graseiez":"graseia","graseiezi":"graseia","graseind":"graseia","grasele":["grasele","gras","grasele","grasă"],"graselor":"grasă","grasi":"gras","grasii":"gras","grasimea":"grăsime","grasimi":"grăsime","grasimii":"grăsime","grasimile":"grăsime","grasimilor":"grăsime","grasoasa":["grăsoasă","grăsos","grăsoasa","grăsos"],"grasoase":"grăsos","grasoasele":"grăsos","grasosi":"grăsos","grasosii":"grăsos","grasosul":"grăsos","grasuca":["grăsucă","grăsuc","grăsuca","grăsuc"],"grasuce":"grăsuc","grasucele":"grăsuc","grasuci":"grăsuc","grasucii":"grăsuc","grasucul":"grăsuc","grasul":"gras","grasuleana":["grăsuleană","grăsulean","grăsuleana","grăsulean"],"grasuleanul":"grăsulean","grasuleata":["grăsuleață","grăsuleț","grăsuleața","grăsuleț"],"grasulene":"grăsulean","grasulenele":"grăsulean","grasuleni":"grăsulean","grasulenii":"grăsulean","grasulete":"grăsuleț","grasuletele":"grăsuleț","grasuleti":"grăsuleț","grasuletii":"grăsuleț","grasuletul":"grăsuleț","grasulia":"grăsuliu","grasulie":"grăsuliu","grasulii":"grăsuliu","grasuliii":"grăsuliu","grasuliile":"grăsuliu","grasuliul":"grăsuliu","grasuna":["grăsună","grăsun","grăsuna","grăsun"],"grasune":["grăsune","grăsun","grăsune","grăsună"],"grasunei":"grăsună","grasunela":["grăsunelă","grăsunel","grăsunela","grăsunel"],"grasunele":["grăsunele","grăsun","grăsunele","grăsună","grăsunele","grăsunel"],"grasunelele":"grăsunel","grasuneli":"grăsunel","grasunelii":"grăsunel","grasunelor":"grăsună","grasunelul":"grăsunel","grasuni":"grăsun","grasunii":"grăsun","grasunilor":"grăsun","grasunul":"grăsun","grasunule":"grăsun","grasunului":"grăsun","grasuta":["grăsuță","grăsuț","grăsuța","grăsuț"],"grasute":"grăsuț","grasutele":"grăsuț","grasuti":"grăsuț","grasutii":"grăsuț","grasutul":"grăsuț","gratarase":"grătăraș","gratarasele":"grătăraș","grataraselor":"grătăraș","gratarasul":"grătăraș","gratarasule":"grătăraș","gratarasului":"grătăraș","gratare":"grătar","gratarele":"grătar","gratarelor":"grătar","gratargii":"gratargiu","gratargiile":"gratargiu","gratargiilor":"gratargiu","gratargiuul":"gratargiu","gratargiuule":"gratargiu","gratargiuului":"gratargiu","gratarul":"grătar","gratarule":"grătar","gratarului":"grătar","gratenul":"graten","gratenule":"graten","gratenului":"graten","gratia":["gratia","gratie","grația","grație"],"gratiai":"grația","gratiam":"grația","gratiara":"grația","gratiaram":"grația","gratiarati":"grația","gratiase":"grația","gratiasem":"grația","gratiasera":"grația","gratiaseram":"grația","gratiaserati":"grația","gratiasesi":"grația","gratiasi":"grația","gratiat":"grația","gratiata":["grațiată","grațiat","grațiata","grațiat"],"gratiate":"grațiat","gratiatele":"grațiat","gratiati":["grațiați","grația","grațiați","grațiat"],"gratiatii":"grațiat","gratiatul":"grațiat","gratiau":"grația","gratiaza":"grația","gratie":"grația","gratieaza":"grația","gratiei":["gratiei","gratie","grației","grație"],"gratiem":"grația","gratierea":"grațiere","gratieri":"grațiere","gratierii":"grațiere","gratierile":"grațiere","gratierilor":"grațiere","gratiez":"grația","gratiezi":"grația","gratific":"gratifica","gratificai":"gratifica","gratificam":["gratificăm","gratifica","gratificam","gratifica"],"gratificand":"gratifica","gratificara":"gratifica","gratificaram":"gratifica","gratificarati":"gratifica","gratificarea":"gratificare","gratificari":"gratificare","gratificarii":"gratificare","gratificarile":"gratificare","gratificarilor":"gratificare","gratificase":"gratifica","gratificasem":"gratifica","gratificasera":"gratifica","gratificaseram":"gratifica","gratificaserati":"gratifica","gratificasesi":"gratifica","gratificasi":"gratifica","gratificat":"gratifica","gratificata":["gratificată","gratificat","gratificata","gratificat"],"gratificate":"gratificat","gratificatele":"gratificat","gratificati":["gratificați","gratifica","gratificați","gratificat"],"gratificatia":"gratificație","gratificatiei":"gratificație","gratificatii":["gratificații","gratificat","gratificații","gratificație"],"gratificatiile":"gratificație","gratificatiilor":"gratificație","gratificatiunea":"gratificațiune","gratificatiuni":"gratificațiune","gratificatiunii":"gratificațiune","gratificatiunile":"gratificațiune","gratificatiunilor":"gratificațiune","gratificatul":"gratificat","gratificau":"gratifica","gratifice":"gratifica","gratifici":"gratifica","gratii":["gratii","gratie","grații","grație"],"gratiile":["gratiile","gratie","grațiile","grație"],"gratiilor":["gratiilor","gratie","grațiilor","grație"],"gratiind":"grația","gratinai":"gratina","gratinam":["gratinăm","gratina","gratinam","gratina"],"gratinand":"gratina","gratinara":"gratina","gratinaram":"gratina","gratinarati":"gratina","gratinase":"gratina","gratinasem":"gratina","gratinasera":"gratina","gratinaseram":"gratina","gratinaserati":"gratina","gratinasesi":"gratina","gratinasi":"gratina","gratinat":"gratina","gratinati":"gratina","gratinau":"gratina","gratineaza":"gratina","gratinez":"gratina","gratinezi":"gratina","gratioare":"grătioară","gratioarei":"grătioară","gratioarele":"grătioară","gratioarelor":"grătioară","gratioasa":["grațioasă","grațios","grațioasa","grațios"],"gratioase":"grațios","gratioasele":"grațios","gratiosi":"grațios","gratiosii":"grațios","gratiosul":"grațios","gratiozitatea":"grațiozitate","gratiozitati":"grațiozitate","gratiozitatii":"grațiozitate","gratiozitatile":"grațiozitate","gratiozitatilor":"grațiozitate","gratitudinea":"gratitudine","gratitudini":"gratitudine","gratitudinii":"gratitudine","gratitudinile":"gratitudine","gratitudinilor":"gratitudine","gratuita":["gratuită","gratuit","gratuita","gratuit"],"gratuitatea":"gratuitate","gratuitati":"gratuitate","gratuitatii":"gratuitate","gratuitatile":"gratuitate","gratuitatilor":"gratuitate","gratuite":"gratuit","gratuitele":"gratuit","gratuiti":"gratuit","gratuitii":"gratuit","gratuitul":"gratuit","gratulai":"gratula","gratulam":["gratulăm","gratula","gratulam","gratula"],"gratuland":"gratula","gratulara":"gratula","gratularam":"gratula","gratularati":"gratula","gratularea":"gratulare","gratulari":"gratulare","gratularii":"gratulare","gratularile":"gratulare","gratularilor":"gratulare","gratulase":"gratula","gratulasem":"gratula","gratulasera":"gratula","gratulaseram":"gratula","gratulaserati":"gratula","gratulasesi":"gratula","gratulasi":"gratula","gratulat":"gratula","gratulati":"gratula","gratulatia":"gratulație","gratulatiei":"gratulație","gratulatii":"gratulație","gratulatiile":"gratulație","gratulatiilor":"gratulație","gratulau":"gratula","gratuleaza":"gratula","gratulez":"gratula","gratulezi":"gratula","graul":"grâu","graule":"grâu","grauleti":"grâuleț","grauletii":"grâuleț","grauletilor":"grâuleț","grauletul":"grâuleț","grauletule":"grâuleț","grauletului":"grâuleț","graului":"grâu","grauncioare":"grăuncior","grauncioarele":"grăuncior","grauncioarelor":"grăuncior","graunciorul":"grăuncior","graunciorule":"grăuncior","graunciorului":"grăuncior","graunt":"grăunte","grauntata":["grăunțată","grăunțat","grăunțata","grăunțat"],"grauntate":"grăunțat","grauntatele":"grăunțat","grauntati":"grăunțat","grauntatii":"grăunțat","grauntatul":"grăunțat","graunte":["grăunțe","grăunț","grăunțe","grăunță"],"grauntele":"grăunț","grauntelor":"grăunț","grauntelul":"grăunțel","grauntelule":"grăunțel","grauntelului":"grăunțel","graunteul":"grăunte","graunteule":"grăunte","graunteului":"grăunte","graunti":"grăunte","grauntii":"grăunte","grauntilor":"grăunte","grauntoasa":["grăunțoasă","grăunțos","grăunțoasa","grăunțos"],"grauntoase":"grăunțos","grauntoasele":"grăunțos","grauntosi":"grăunțos","grauntosii":"grăunțos","grauntosul":"grăunțos","grauntul":"grăunț","grauntule":"grăunț","grauntului":"grăunț","graurasi":"grăuraș","graurasii":"grăuraș","graurasilor":"grăuraș","graurasul":"grăuraș","graurasule":"grăuraș","graurasului":"grăuraș","graure":"graur","graurei":"grăurel","graureii":"grăurel","graureilor":"grăurel","graurele":"graure","graurelui":"graure","graurelul":"grăurel","graurelule":"grăurel","graurelului":"grăurel","grauri":["grauri","graur","grauri","graure"],"graurii":["graurii","graur","graurii","graure"],"graurilor":["graurilor","graur","graurilor","graure"],"graurite":"grăuriță","grauritei":"grăuriță","grauritele":"grăuriță","grauritelor":"grăuriță","graurul":"graur","graurule":"graur","graurului":"graur","grausorul":"grâușor","grausorule":"grâușor","grausorului":"grâușor","grautul":"grâuț","grautule":"grâuț","grautului":"grâuț","grauturi":"grâuț","grauturile":"grâuț","grauturilor":"grâuț","grava":["gravă","grav","grava","grav"],"gravai":"grava","gravam":["gravăm","grava","gravam","grava"],"gravand":"grava","gravara":"grava","gravaram":"grava","gravarati":"grava","gravarea":"gravare","gravari":"gravare","gravarii":"gravare","gravarile":"gravare","gravarilor":"gravare","gravase":"grava","gravasem":"grava","gravasera":"grava","gravaseram":"grava","gravaserati":"grava","gravasesi":"grava","gravasi":"grava","gravat":"grava","gravata":["gravată","gravat","gravata","gravat"],"gravate":"gravat","gravatele":"gravat","gravati":["gravați","grava","gravați","gravat"],"gravatii":"gravat","gravatul":"gravat","gravau":"grava","grave":"grav","graveaza":"grava","gravele":["gravele","grav","gravele","gravelă"],"gravelei":"gravelă","gravelele":"gravelă","gravelelor":"gravelă","gravez":"grava","gravezi":"grava","gravi":"grav","gravida":["gravidă","gravid","gravida","gravid"],"gravide":["gravide","gravid","gravide","gravidă"],"gravidei":"gravidă","gravidele":["gravidele","gravid","gravidele","gravidă"],"gravidelor":"gravidă","gravidia":"gravidie","gravidiei":"gravidie","gravidii":"gravidie","graviditatea":"graviditate","graviditati":"graviditate","graviditatii":"graviditate","graviditatile":"graviditate","graviditatilor":"graviditate","gravidul":"gravid","gravifica":["gravifică","gravific","gravifica","gravific"],"gravifice":"gravific","gravificele":"gravific","gravifici":"gravific","gravificii":"gravific","gravificul":"gravific","gravii":"grav","gravimetre":"gravimetru","gravimetrele":"gravimetru","gravimetrelor":"gravimetru","gravimetria":"gravimetrie","gravimetrica":["gravimetrică","gravimetric","gravimetrica","gravimetric"],"gravimetrice":"gravimetric","gravimetricele":"gravimetric","gravimetrici":"gravimetric","gravimetricii":"gravimetric","gravimetricul":"gravimetric","gravimetriei":"gravimetrie","gravimetrii":"gravimetrie","gravimetrul":"gravimetru","gravimetrule":"gravimetru","gravimetrului":"gravimetru","gravitai":"gravita","gravitam":["gravităm","gravita","gravitam","gravita"],"gravitand":"gravita","gravitara":"gravita","gravitaram":"gravita","gravitarati":"gravita","gravitase":"gravita","gravitasem":"gravita","gravitasera":"gravita","gravitaseram":"gravita","gravitaserati":"gravita","gravitasesi":"gravita","gravitasi":"gravita","gravitat":"gravita","gravitata":["gravitată","gravitat","gravitata","gravitat"],"gravitate":"gravitat","gravitatea":"gravitate","gravitatele":"gravitat","gravitati":["gravitați","gravita","gravitați","gravitat","gravități","gravitate"],"gravitatia":"gravitație","gravitatiei":"gravitație","gravitatii":["gravitații","gravitat","gravității","gravitate","gravitații","gravitație"],"gravitationala":["gravitațională","gravitațional","gravitaționala","gravitațional"],"gravitationale":"gravitațional","gravitationalele":"gravitațional","gravitationali":"gravitațional","gravitationalii":"gravitațional","gravitationalul":"gravitațional","gravitatiunea":"gravitațiune","gravitatiuni":"gravitațiune","gravitatiunii":"gravitațiune","gravitatul":"gravitat","gravitau":"gravita","graviteaza":"gravita","gravitez":"gravita","gravitezi":"gravita","gravitoni":"graviton","gravitonii":"graviton","gravitonilor":"graviton","gravitonul":"graviton","gravitonule":"graviton","gravitonului":"graviton","gravizi":"gravid","gravizii":"gravid","gravori":"gravor","gravorii":"gravor","gravorilor":"gravor","gravorul":"gravor","gravorule":"gravor","gravorului":"gravor","gravul":"grav","gravuri":"gravură","gravurii":"gravură","gravurile":"gravură","gravurilor":"gravură","grazde":"grazdă","grazdei":"grazdă","grazdele":"grazdă","grazdelor":"grazdă","grea":"greu","greabanul":"greabăn","greabanule":"greabăn","greabanului":"greabăn","greaca":["greacă","grec","greaca","grec"],"greai":"grea","gream":["greăm","grea","gream","grea"],"greand":"grea","greara":"grea","grearam":"grea","grearati":"grea","grease":"grea","greasem":"grea","greasera":"grea","greaseram":"grea","greaserati":"grea","greasesi":"grea","greasi":"grea","greasnici":"greașnic","greasnicii":"greașnic","greasnicilor":"greașnic","greasnicul":"greașnic","greasnicule":"greașnic","greasnicului":"greașnic","great":"grea","greati":"grea","greau":"grea","greaua":"greu","grebalute":"grebăluță","grebalutei":"grebăluță","grebalutele":"grebăluță","grebalutelor":"grebăluță","grebanosela":["grebănoșelă","grebănoșel","grebănoșela","grebănoșel"],"grebanosele":"grebănoșel","grebanoselele":"grebănoșel","grebanoseli":"grebănoșel","grebanoselii":"grebănoșel","grebanoselul":"grebănoșel","grebanosici":"grebănoșică","grebanosicii":"grebănoșică","grebanosicile":"grebănoșică","grebanosicilor":"grebănoșică","grebene":"greabăn","grebenele":"greabăn","grebenelor":"greabăn","greblai":"grebla","greblam":["greblăm","grebla","greblam","grebla"],"grebland":"grebla","greblara":"grebla","greblaram":"grebla","greblarati":"grebla","greblarea":"greblare","greblari":"greblare","greblarii":"greblare","greblarile":"greblare","greblarilor":"greblare","greblase":"grebla","greblasem":"grebla","greblasera":"grebla","greblaseram":"grebla","greblaserati":"grebla","greblasesi":"grebla","greblasi":["greblași","grebla","greblași","greblaș"],"greblasii":"greblaș","greblasilor":"greblaș","greblasul":"greblaș","greblasule":"greblaș","greblasului":"greblaș","greblat":"grebla","greblati":"grebla","greblatul":"greblat","greblatule":"greblat","greblatului":"greblat","greblaturi":"greblat","greblaturile":"greblat","greblaturilor":"greblat","greblau":"grebla","greble":"greblă","grebleaza":"grebla","greblei":"greblă","greblele":"greblă","greblelor":"greblă","greblez":"grebla","greblezi":"grebla","greblite":"grebliță","greblitei":"grebliță","greblitele":"grebliță","greblitelor":"grebliță","greblutae":"grebluță","greblutaei":"grebluță","greblutaele":"grebluță","greblutaelor":"grebluță","grebulite":"grebuliță","grebulitei":"grebuliță","grebulitele":"grebuliță","grebulitelor":"grebuliță","grece":["grece","greacă","grece","grec"],"greceasca":["grecească","grecesc","greceasca","grecesc"],"grecei":"greacă","grecele":["grecele","greacă","grecele","grec"],"grecelor":"greacă","grecescul":"grecesc","grecesti":"grecesc","grecestii":"grecesc","grecestile":"grecesc","greci":["greci","greacă","greci","grec"],"grecia":"grecie","grecie":"Grecia","greciei":["greciei","Grecia","greciei","grecie"],"grecii":["grecii","greacă","grecii","grec","grecii","Grecia","grecii","grecie"],"grecilor":"grec","grecisme":"grecism","grecismele":"grecism","grecismelor":"grecism","grecismul":"grecism","grecismule":"grecism","grecismului":"grecism","grecita":["grecită","grecit","grecita","grecit"],"grecitatea":"grecitate","grecitati":"grecitate","grecitatii":"grecitate","grecite":"grecit","grecitele":"grecit","greciti":"grecit","grecitii":"grecit","grecitul":"grecit","grecizai":"greciza","grecizam":["grecizăm","greciza","grecizam","greciza"],"grecizand":"greciza","grecizara":"greciza","grecizaram":"greciza","grecizarati":"greciza","grecizarea":"grecizare","grecizarei":"grecizare","grecizase":"greciza","grecizasem":"greciza","grecizasera":"greciza","grecizaseram":"greciza","grecizaserati":"greciza","grecizasesi":"greciza","grecizasi":"greciza","grecizat":"greciza","grecizata":["grecizată","grecizat","grecizata","grecizat"],"grecizate":"grecizat","grecizatele":"grecizat","grecizati":["grecizați","greciza","grecizați","grecizat"],"grecizatii":"grecizat","grecizatul":"grecizat","grecizau":"greciza","grecizeaza":"greciza","grecizez":"greciza","grecizezi":"greciza","greco-catolica":["greco-catolică","greco-catolic","greco-catolica","greco-catolic"],"greco-catolice":["greco-catolice","greco-catolic","greco-catolice","greco-catolică"],"greco-catolicei":"greco-catolică","greco-catolicele":["greco-catolicele","greco-catolic","greco-catolicele","greco-catolică"],"greco-catolicelor":"greco-catolică","greco-catolici":"greco-catolic","greco-catolicii":"greco-catolic","greco-catolicilor":"greco-catolic","greco-catolicul":"greco-catolic","greco-catolicule":"greco-catolic","greco-catolicului":"greco-catolic","greco-orientale":"greco-orientală","greco-orientalei":"greco-orientală","greco-orientalele":"greco-orientală","greco-orientalelor":"greco-orientală","greco-orientali":"greco-oriental","greco-orientalii":"greco-oriental","greco-orientalilor":"greco-oriental","greco-orientalul":"greco-oriental","greco-orientalule":"greco-oriental","greco-orientalului":"greco-oriental","greco-rasariteanul":"greco-răsăritean","greco-rasariteanule":"greco-răsăritean","greco-rasariteanului":"greco-răsăritean","greco-rasaritene":"greco-răsăriteană","greco-rasaritenei":"greco-răsăriteană","greco-rasaritenele":"greco-răsăriteană","greco-rasaritenelor":"greco-răsăriteană","greco-rasariteni":"greco-răsăritean","greco-rasaritenii":"greco-răsăritean","greco-rasaritenilor":"greco-răsăritean","greco-romana":["greco-romană","greco-roman","greco-romana","greco-roman","greco-română","greco-român","greco-româna","greco-român"],"greco-romane":["greco-romane","greco-roman","greco-române","greco-român"],"greco-romanele":["greco-romanele","greco-roman","greco-românele","greco-român"],"greco-romani":["greco-romani","greco-roman","greco-români","greco-român"],"greco-romanii":["greco-romanii","greco-roman","greco-românii","greco-român"],"greco-romanul":["greco-romanul","greco-roman","greco-românul","greco-român"],"grecoaice":"grecoaică","grecoaicei":"grecoaică","grecoaicele":"grecoaică","grecoaicelor":"grecoaică","grecoite":"grecoiță","grecoitei":"grecoiță","grecoitele":"grecoiță","grecoitelor":"grecoiță","grecomani":"grecoman","grecomania":"grecomanie","grecomaniei":"grecomanie","grecomanii":["grecomanii","grecoman","grecomanii","grecomanie"],"grecomaniile":"grecomanie","grecomaniilor":"grecomanie","grecomanilor":"grecoman","grecomanul":"grecoman","grecomanule":"grecoman","grecomanului":"grecoman","grecoteiasca":["grecoteiască","grecoteiesc","grecoteiasca","grecoteiesc"],"grecoteiescul":"grecoteiesc","grecoteiesti":"grecoteiesc","grecoteiestii":"grecoteiesc","grecoteiestile":"grecoteiesc","grecoteii":"grecotei","grecoteilor":"grecotei","grecoteiul":"grecotei","grecoteiule":"grecotei","grecoteiului":"grecotei","grecul":"grec","grecule":"grec","grecului":"grec","grecusori":"grecușor","grecusorii":"grecușor","grecusorilor":"grecușor","grecusorul":"grecușor","grecusorule":"grecușor","grecusorului":"grecușor","greeaza":"grea","greemente":"greement","greementele":"greement","greementelor":"greement","greementul":"greement","greementule":"greement","greementului":"greement","greenul":"green","greenule":"green","greenului":"green","greenuri":"green","greenurile":"green","greenurilor":"green","greez":"grea","greezi":"grea","grefai":"grefa","grefam":["grefăm","grefa","grefam","grefa"],"grefand":"grefa","grefara":"grefa","grefaram":"grefa","grefarati":"grefa","grefarea":"grefare","grefari":"grefare","grefarii":"grefare","grefarile":"grefare","grefarilor":"grefare","grefase":"grefa","grefasem":"grefa","grefasera":"grefa","grefaseram":"grefa","grefaserati":"grefa","grefasesi":"grefa","grefasi":"grefa","grefat":"grefa","grefata":["grefată","grefat","grefata","grefat"],"grefate":"grefat","grefatele":"grefat","grefati":["grefați","grefa","grefați","grefat"],"grefatii":"grefat","grefatul":"grefat","grefau":"grefa","grefe":"grefă","grefeaza":"grefa","grefei":"grefă","grefele":"grefă","grefelor":"grefă","grefez":"grefa","grefezi":"grefa","grefiere":"grefieră","grefierei":"grefieră","grefierele":"grefieră","grefierelor":"grefieră","grefieri":"grefier","grefierii":"grefier","grefierilor":"grefier","grefierite":"grefieriță","grefieritei":"grefieriță","grefieritele":"grefieriță","grefieritelor":"grefieriță","grefierul":"grefier","grefierule":"grefier","grefierului":"grefier","grefoane":"grefon","grefoanele":"grefon","grefoanelor":"grefon","grefonul":"grefon","grefonule":"grefon","grefonului":"grefon","greful":"gref","grefule":"gref","grefului":"gref","grefuri":"gref","grefurile":"gref","grefurilor":"gref","gregara":["gregară","gregar","gregara","gregar"],"gregare":"gregar","gregarele":"gregar","gregari":"gregar","gregarii":"gregar","gregarismul":"gregarism","gregarismule":"gregarism","gregarismului":"gregarism","gregarul":"gregar","gregoriana":["gregoriană","gregorian","gregoriana","gregorian"],"gregorianul":"gregorian","gregoriene":"gregorian","gregorienele":"gregorian","gregorieni":"gregorian","gregorienii":"gregorian","grei":"greu","greierasi":"greieraș","greierasii":"greieraș","greierasilor":"greieraș","greierasul":"greieraș","greierasule":"greieraș","greierasului":"greieraș","greiere":"greier","greierei":"greierel","greiereli":"greierel","greierelii":"greierel","greierelilor":"greierel","greierelul":"greierel","greierelule":"greierel","greierelului":"greierel","greieri":["greieri","greier","greieri","greiere"],"greierii":"greier","greierilor":"greier","greierul":"greier","greierule":"greier","greierului":"greier","greierusi":"greieruș","greierusii":"greieruș","greierusilor":"greieruș","greierusul":"greieruș","greierusule":"greieruș","greierusului":"greieruș","greii":"greu","greimea":"greime","greimi":"greime","greimii":"greime","greimile":"greime","greimilor":"greime","grejul":"grej","grejule":"grej","grejului":"grej","grele":"greu","grelele":"greu","grelusei de stuf":"grelușel de stuf","grelusei de zavoi":"grelușel de zăvoi","grelusei patati":"grelușel pătat","grenade":"grenadă","grenade de mana":"grenadă de mână","grenadei":"grenadă","grenadele":"grenadă","grenadelor":"grenadă","grenadiana":["grenadiană","grenadian","grenadiana","grenadian"],"grenadiane":"grenadiană","grenadianul":"grenadian","grenadianule":"grenadian","grenadianului":"grenadian","grenadiene":["grenadiene","grenadian","grenadiene","grenadiană"],"grenadienei":"grenadiană","grenadienele":["grenadienele","grenadian","grenadienele","grenadiană"],"grenadienelor":"grenadiană","grenadieni":"grenadian","grenadienii":"grenadian","grenadienilor":"grenadian","grenadieri":"grenadier","grenadierii":"grenadier","grenadierilor":"grenadier","grenadierul":"grenadier","grenadierule":"grenadier","grenadierului":"grenadier","grenadine":"grenadină","grenadinei":"grenadină","grenadinele":"grenadină","grenadinelor":"grenadină","grenadiri":"grenadir","grenate":"grenată","grenatei":"grenată","grenatele":"grenată","grenatelor":"grenată","greoaia":"greoi","greoaie":"greoi","greoaiele":"greoi","greoii":"greoi","greoiul":"greoi","grepfrutul":"grepfrut","grepfrutule":"grepfrut","grepfrutului":"grepfrut","grepfruturi":"grepfrut","grepfruturile":"grepfrut","grepfruturilor":"grepfrut","grepul":"grep","grepule":"grep","grepului":"grep","grepuri":"grep","grepurile":"grep","grepurilor":"grep","gresai":"gresa","gresaje":"gresaj","gresajele":"gresaj","gresajelor":"gresaj","gresajul":"gresaj","gresajule":"gresaj","gresajului":"gresaj","gresam":["gresăm","gresa","gresam","gresa"],"gresand":"gresa","gresara":"gresa","gresaram":"gresa","gresarati":"gresa","gresarea":"gresare","gresari":"gresare","gresarii":"gresare","gresarile":"gresare","gresarilor":"gresare","gresase":"gresa","gresasem":"gresa","gresasera":"gresa","gresaseram":"gresa","gresaserati":"gresa","gresasesi":"gresa","gresasi":"gresa","gresat":"gresa","gresata":["gresată","gresat","gresata","gresat"],"gresate":"gresat","gresatele":"gresat","gresati":["gresați","gresa","gresați","gresat"],"gresatii":"gresat","gresatul":"gresat","gresau":"gresa","gresea":"greși","greseai":"greși","greseam":"greși","greseati":"greși","greseau":"greși","greseaza":"gresa","gresele":"greșală","greselei":"greșală","greselele":"greșală","greselelor":"greșală","greseli":["greșeli","greșală","greșeli","greșeală"],"greselii":"greșeală","greselile":"greșeală","greselilor":"greșeală","greselute":"greșeluță","greselutei":"greșeluță","greselutele":"greșeluță","greselutelor":"greșeluță","gresesc":"greși","greseste":"greși","gresesti":"greși","gresez":"gresa","gresezi":"gresa","gresia":"gresie","gresiei":"gresie","gresii":["greșii","greși","gresii","gresie"],"gresiile":"gresie","gresiilor":"gresie","gresim":"greși","gresind":"greși","gresira":"greși","gresiram":"greși","gresirati":"greși","gresise":"greși","gresisem":"greși","gresisera":"greși","gresiseram":"greși","gresiserati":"greși","gresisesi":"greși","gresisi":"greși","gresit":"greși","gresita":["greșită","greșit","greșita","greșit"],"gresite":"greșit","gresitele":"greșit","gresiti":["greșiți","greși","greșiți","greșit"],"gresitii":"greșit","gresitul":"greșit","gresnici":"greșnic","gresnicii":"greșnic","gresnicilor":"greșnic","gresnicul":"greșnic","gresnicule":"greșnic","gresnicului":"greșnic","gresoare":"gresor","gresore":"gresor","gresorele":"gresor","gresorelor":"gresor","gresorul":"gresor","gresorule":"gresor","gresorului":"gresor","gresul":["gresul","gres","greșul","greș"],"gresule":["gresule","gres","greșule","greș"],"gresului":["gresului","gres","greșului","greș"],"gresuri":["gresuri","gres","greșuri","greș"],"gresurile":["gresurile","gres","greșurile","greș"],"gresurilor":["gresurilor","gres","greșurilor","greș"],"greti":"greață","gretii":"greață","gretoasa":["grețoasă","grețos","grețoasa","grețos"],"gretoase":"grețos","gretoasele":"grețos","gretosi":"grețos","gretosii":"grețos","gretosul":"grețos","greturi":"greață","greturile":"greață","greturilor":"greață","greuinte":"greuință","greuintei":"greuință","greul":"greu","greule":"greu","greului":"greu","greunatica":["greunatică","greunatic","greunatica","greunatic"],"greunatice":"greunatic","greunaticele":"greunatic","greunatici":"greunatic","greunaticii":"greunatic","greunaticul":"greunatic","greusora":["greușoră","greușor","greușora","greușor"],"greusore":"greușor","greusorele":"greușor","greusori":"greușor","greusorii":"greușor","greusorul":"greușor","greuta":["greuță","greuț","greuța","greuț"],"greutatea":"greutate","greutati":"greutate","greutati atomice":"greutate atomică","greutati moleculare":"greutate moleculară","greutatii":"greutate","greutatile":"greutate","greutatilor":"greutate","greute":"greuț","greutele":"greuț","greuti":"greuț","greutii":"greuț","greutul":"greuț","grevai":"greva","grevam":["grevăm","greva","grevam","greva"],"grevand":"greva","grevara":"greva","grevaram":"greva","grevarati":"greva","grevase":"greva","grevasem":"greva","grevasera":"greva","grevaseram":"greva","grevaserati":"greva","grevasesi":"greva","grevasi":"greva","grevat":"greva","grevata":["grevată","grevat","grevata","grevat"],"grevate":"grevat","grevatele":"grevat","grevati":["grevați","greva","grevați","grevat"],"grevatii":"grevat","grevatul":"grevat","grevau":"greva","greve":"grevă","greveaza":"greva","grevei":"grevă","grevele":"grevă","grevelor":"grevă","grevez":"greva","grevezi":"greva","greviste":"grevistă","grevistei":"grevistă","grevistele":"grevistă","grevistelor":"grevistă","grevisti":"grevist","grevistii":"grevist","grevistilor":"grevist","grevistul":"grevist","grevistule":"grevist","grevistului":"grevist","grezii":"grezie","grezoasa":["grezoasă","grezos","grezoasa","grezos"],"grezoase":"grezos","grezoasele":"grezos","grezosi":"grezos","grezosii":"grezos","grezosul":"grezos","grierei":"grierel","griereul":"griere","griereule":"griere","griereului":"griere","grieri":["grieri","grier","grieri","griere"],"grierii":"griere","grierilor":"griere","grifoni":"grifon","grifonii":"grifon","grifonilor":"grifon","grifonul":"grifon","grifonule":"grifon","grifonului":"grifon","grijania":"grijanie","grijaniei":"grijanie","grijanii":"grijanie","grijaniile":"grijanie","grijaniilor":"grijanie","grije":"grijă","grijea":["grijea","grije","grijea","griji"],"grijeai":"griji","grijeam":"griji","grijeati":"griji","grijeau":"griji","grijesc":"griji","grijeste":"griji","grijesti":"griji","griji":["griji","grijă","griji","grije"],"grijii":["grijii","grijă","grijii","grije","grijii","griji"],"grijile":["grijile","grijă","grijile","grije"],"grijilor":["grijilor","grijă","grijilor","grije"],"grijim":"griji","grijind":"griji","grijinte":"grijință","grijintei":"grijință","grijintele":"grijință","grijintelor":"grijință","grijira":"griji","grijiram":"griji","grijirati":"griji","grijirea":"grijire","grijiri":"grijire","grijirii":"grijire","grijirile":"grijire","grijirilor":"grijire","grijise":"griji","grijisem":"griji","grijisera":"griji","grijiseram":"griji","grijiserati":"griji","grijisesi":"griji","grijisi":"griji","grijit":"griji","grijiti":"griji","grijitoare":"grijitor","grijitoarea":"grijitor","grijitoarele":"grijitor","grijitori":"grijitor","grijitorii":"grijitor","grijitorul":"grijitor","grijitul":"grijit","grijitule":"grijit","grijitului":"grijit","grijituri":"grijitură","grijiturii":"grijitură","grijiturile":"grijitură","grijiturilor":"grijitură","grijliva":["grijlivă","grijliv","grijliva","grijliv"],"grijlive":"grijliv","grijlivele":"grijliv","grijlivi":"grijliv","grijlivii":"grijliv","grijlivul":"grijliv","grijulia":"grijuliu","grijulie":"grijuliu","grijulii":"grijuliu","grijuliii":"grijuliu","grijuliile":"grijuliu","grijuliul":"grijuliu","grijuliva":["grijulivă","grijuliv","grijuliva","grijuliv"],"grijulive":"grijuliv","grijulivele":"grijuliv","grijulivi":"grijuliv","grijulivii":"grijuliv","grijulivul":"grijuliv","grilaje":"grilaj","grilajele":"grilaj","grilajelor":"grilaj","grilajul":"grilaj","grilajule":"grilaj"};
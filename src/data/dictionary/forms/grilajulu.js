@@ -0,0 +1 @@
+export default {"grilajului":"grilaj","grile":"grilă","grilei":"grilă","grilele":"grilă","grilelor":"grilă","grimai":"grima","grimam":["grimăm","grima","grimam","grima"],"grimand":"grima","grimara":"grima","grimaram":"grima","grimarati":"grima","grimarea":"grimare","grimari":"grimare","grimarii":"grimare","grimarile":"grimare","grimarilor":"grimare","grimase":["grimase","grima","grimase","grimasă"],"grimasem":"grima","grimasera":"grima","grimaseram":"grima","grimaserati":"grima","grimasesi":"grima","grimasi":"grima","grimat":"grima","grimata":["grimată","grimat","grimata","grimat"],"grimate":"grimat","grimatele":"grimat","grimati":["grimați","grima","grimați","grimat"],"grimatii":"grimat","grimatul":"grimat","grimau":"grima","grime":"grimă","grimeaua":"grimea","grimeaza":"grima","grimei":"grimă","grimele":["grimele","grimă","grimele","grimea"],"grimelei":"grimea","grimelele":"grimea","grimelelor":"grimea","grimelor":"grimă","grimelute":"grimeluță","grimelutei":"grimeluță","grimelutele":"grimeluță","grimelutelor":"grimeluță","grimere":"grimeră","grimerei":"grimeră","grimerele":"grimeră","grimerelor":"grimeră","grimeri":"grimer","grimeuri":["grimeuri","grimeur","grimeuri","grimeură"],"grimeurii":["grimeurii","grimeur","grimeurii","grimeură"],"grimeurile":"grimeură","grimeurilor":["grimeurilor","grimeur","grimeurilor","grimeură"],"grimeurul":"grimeur","grimeurule":"grimeur","grimeurului":"grimeur","grimez":"grima","grimezi":"grima","grimoare":"grimoar","grimoarele":"grimoar","grimoarelor":"grimoar","grimoarul":"grimoar","grimoarule":"grimoar","grimoarului":"grimoar","grimpanta":["grimpantă","grimpant","grimpanta","grimpant"],"grimpante":"grimpant","grimpantele":"grimpant","grimpanti":"grimpant","grimpantii":"grimpant","grimpantul":"grimpant","grinde":"grindă","grindei":"grindă","grindeie":"grindei","grindele":"grindă","grindelor":"grindă","grindeni":"grindenă","grindenii":"grindenă","grindenile":"grindenă","grindenilor":"grindenă","grindinand":"grindina","grindinase":"grindina","grindinat":"grindina","grindini":"grindină","grindinii":"grindină","grindinile":"grindină","grindinilor":"grindină","grindisoare":"grindișoară","grindisoarei":"grindișoară","grindisoarele":"grindișoară","grindisoarelor":"grindișoară","grindisul":"grindiș","grindisule":"grindiș","grindisului":"grindiș","grindisuri":"grindiș","grindisurile":"grindiș","grindisurilor":"grindiș","grindulite":"grinduliță","grindulitei":"grinduliță","grindulitele":"grinduliță","grindulitelor":"grinduliță","grindute":"grinduță","grindutei":"grinduță","grindutele":"grinduță","grindutelor":"grinduță","grinspanul":"grinșpan","grinspanule":"grinșpan","grinspanului":"grinșpan","grinspanuri":"grinșpan","grinspanurile":"grinșpan","grinspanurilor":"grinșpan","gripala":["gripală","gripal","gripala","gripal"],"gripale":"gripal","gripalele":"gripal","gripali":"gripal","gripalii":"gripal","gripalul":"gripal","griparea":"gripare","gripari":"gripare","griparii":"gripare","griparile":"gripare","griparilor":"gripare","gripata":["gripată","gripat","gripata","gripat"],"gripate":"gripat","gripatele":"gripat","gripati":"gripat","gripatii":"gripat","gripatul":"gripat","gripe":"gripă","gripei":"gripă","gripele":"gripă","gripelor":"gripă","gripsori":"gripsor","gripsorii":"gripsor","gripsorilor":"gripsor","gripsorul":"gripsor","gripsorule":"gripsor","gripsorului":"gripsor","grisaiul":"grisai","grisaiule":"grisai","grisaiului":"grisai","grisaiuri":"grisai","grisaiurile":"grisai","grisaiurilor":"grisai","grisul":["grisul","gris","grișul","griș"],"grisule":["grisule","gris","grișule","griș"],"grisului":["grisului","gris","grișului","griș"],"griul":"gri","griule":"gri","griului":"gri","griuri":"gri","griurile":"gri","griurilor":"gri","griva":["grivă","griv","griva","griv"],"grive":"griv","griveia":"grivei","griveie":"grivei","griveiele":"grivei","griveii":"grivei","griveiul":"grivei","grivele":"griv","grivi":"griv","grivii":"griv","grivne":"grivnă","grivnei":"grivnă","grivnele":"grivnă","grivnelor":"grivnă","grivul":"griv","grizai":"griza","grizam":["grizăm","griza","grizam","griza"],"grizand":"griza","grizara":"griza","grizaram":"griza","grizarati":"griza","grizarea":"grizare","grizari":"grizare","grizarii":"grizare","grizarile":"grizare","grizarilor":"grizare","grizase":"griza","grizasem":"griza","grizasera":"griza","grizaseram":"griza","grizaserati":"griza","grizasesi":"griza","grizasi":"griza","grizat":"griza","grizata":["grizată","grizat","grizata","grizat"],"grizate":"grizat","grizatele":"grizat","grizati":["grizați","griza","grizați","grizat"],"grizatii":"grizat","grizatul":"grizat","grizau":"griza","grizeaza":"griza","grizete":"grizetă","grizetei":"grizetă","grizetele":"grizetă","grizetelor":"grizetă","grizez":"griza","grizezi":"griza","grizonai":"grizona","grizonam":["grizonăm","grizona","grizonam","grizona"],"grizonand":"grizona","grizonanta":["grizonantă","grizonant","grizonanta","grizonant"],"grizonante":"grizonant","grizonantele":"grizonant","grizonanti":"grizonant","grizonantii":"grizonant","grizonantul":"grizonant","grizonara":"grizona","grizonaram":"grizona","grizonarati":"grizona","grizonarea":"grizonare","grizonari":"grizonare","grizonarii":"grizonare","grizonarile":"grizonare","grizonarilor":"grizonare","grizonase":"grizona","grizonasem":"grizona","grizonasera":"grizona","grizonaseram":"grizona","grizonaserati":"grizona","grizonasesi":"grizona","grizonasi":"grizona","grizonat":"grizona","grizonati":"grizona","grizonau":"grizona","grizoneaza":"grizona","grizonez":"grizona","grizonezi":"grizona","grizul":"grizu","grizule":"grizu","grizului":"grizu","grizumetre":"grizumetru","grizumetrele":"grizumetru","grizumetrelor":"grizumetru","grizumetrul":"grizumetru","grizumetrule":"grizumetru","grizumetrului":"grizumetru","grizutine":"grizutină","grizutinei":"grizutină","grizutinele":"grizutină","grizutinelor":"grizutină","grizutoasa":["grizutoasă","grizutos","grizutoasa","grizutos"],"grizutoase":"grizutos","grizutoasele":"grizutos","grizutosi":"grizutos","grizutosii":"grizutos","grizutosul":"grizutos","grizzly-i":"grizzly","grizzly-lor":"grizzly","grizzly-ul":"grizzly","grizzly-ului":"grizzly","groasa":["groasă","gros","groasa","gros"],"groase":"gros","groasele":"gros","groaze":"groază","groazei":"groază","groazele":"groază","groazelor":"groază","groaznica":["groaznică","groaznic","groaznica","groaznic"],"groaznice":"groaznic","groaznicele":"groaznic","groaznici":"groaznic","groaznicii":"groaznic","groaznicul":"groaznic","groba":["grobă","grob","groba","grob"],"grobe":"grob","grobele":"grob","grobi":"grob","grobiana":["grobiană","grobian","grobiana","grobian"],"grobianul":"grobian","grobiene":"grobian","grobienele":"grobian","grobieni":"grobian","grobienia":"grobienie","grobieniei":"grobienie","grobienii":["grobienii","grobian","grobienii","grobienie"],"grobieniile":"grobienie","grobieniilor":"grobienie","grobii":"grob","grobistea":"grobiște","grobisti":"grobiște","grobistii":"grobiște","grobistile":"grobiște","grobistilor":"grobiște","grobnice":"grobnic","grobnicele":"grobnic","grobnicelor":"grobnic","grobnicul":"grobnic","grobnicule":"grobnic","grobnicului":"grobnic","grobul":"grob","groenlandeze":"groenlandeză","groenlandezei":"groenlandeză","groenlandezele":"groenlandeză","groenlandezelor":"groenlandeză","grofeasca":["grofească","grofesc","grofeasca","grofesc"],"grofescul":"grofesc","grofesti":"grofesc","grofestii":"grofesc","grofestile":"grofesc","grofi":"grof","grofii":"grof","grofilor":"grof","grofoaiea":"grofoaie","grofoaiei":"grofoaie","grofoaiele":"grofoaie","grofoaielor":"grofoaie","groful":"grof","grofule":"grof","grofului":"grof","grogrenaul":"grogrenă","grogrenaule":"grogrenă","grogrenaului":"grogrenă","grogrene":"grogrenă","grogrenele":"grogrenă","grogrenelor":"grogrenă","grogul":"grog","grogule":"grog","grogului":"grog","groguri":"grog","grogurile":"grog","grogurilor":"grog","grohaia":"grohăi","grohaiai":"grohăi","grohaiam":"grohăi","grohaiati":"grohăi","grohaiau":"grohăi","grohaie":"grohăi","grohaii":"grohăi","grohaim":"grohăi","grohaind":"grohăi","grohaira":"grohăi","grohairam":"grohăi","grohairati":"grohăi","grohairea":"grohăire","grohairi":"grohăire","grohairii":"grohăire","grohairile":"grohăire","grohairilor":"grohăire","grohaise":"grohăi","grohaisem":"grohăi","grohaisera":"grohăi","grohaiseram":"grohăi","grohaiserati":"grohăi","grohaisesi":"grohăi","grohaisi":"grohăi","grohait":"grohăi","grohaiti":"grohăi","grohaitoare":"grohăitor","grohaitoarea":"grohăitor","grohaitoarele":"grohăitor","grohaitori":"grohăitor","grohaitorii":"grohăitor","grohaitorul":"grohăitor","grohaitul":"grohăit","grohaitule":"grohăit","grohaitului":"grohăit","grohaiture":"grohăitură","grohaiturei":"grohăitură","grohaiturele":"grohăitură","grohaiturelor":"grohăitură","grohaituri":["grohăituri","grohăit","grohăituri","grohăitură"],"grohaiturile":"grohăit","grohaiturilor":"grohăit","grohotici":"grohotic","grohoticii":"grohotic","grohoticilor":"grohotic","grohoticul":"grohotic","grohoticule":"grohotic","grohoticului":"grohotic","grohotisul":"grohotiș","grohotisule":"grohotiș","grohotisului":"grohotiș","grohotisuri":"grohotiș","grohotisurile":"grohotiș","grohotisurilor":"grohotiș","grohotitul":"grohotit","grohotitule":"grohotit","grohotitului":"grohotit","grohotituri":"grohotit","grohotiturile":"grohotit","grohotiturilor":"grohotit","gromi":"grom","gromii":"grom","gromilor":"grom","gromovnice":"gromovnic","gromovnicele":"gromovnic","gromovnicelor":"gromovnic","gromovnicul":"gromovnic","gromovnicule":"gromovnic","gromovnicului":"gromovnic","gromul":"grom","gromule":"grom","gromului":"grom","gropanaul":"gropană","gropanaule":"gropană","gropanaului":"gropană","gropane":["gropane","gropan","gropane","gropană"],"gropanele":["gropanele","gropan","gropanele","gropană"],"gropanelor":["gropanelor","gropan","gropanelor","gropană"],"gropanul":"gropan","gropanule":"gropan","gropanului":"gropan","groparese":"gropăreasă","groparesei":"gropăreasă","groparesele":"gropăreasă","gropareselor":"gropăreasă","gropari":"gropar","gropasi":"gropaș","gropasii":"gropaș","gropasilor":"gropaș","gropasul":"gropaș","gropasule":"gropaș","gropasului":"gropaș","gropi":"groapă","gropi comune":"groapă comună","gropii":"groapă","gropile":["gropile","groapă","gropile","gropilă"],"gropilei":"gropilă","gropilele":"gropilă","gropilelor":"gropilă","gropilite":"gropiliță","gropilitei":"gropiliță","gropilitele":"gropiliță","gropilitelor":"gropiliță","gropilor":"groapă","gropita":["gropită","gropit","gropita","gropit"],"gropitasi":"gropițaș","gropitasii":"gropițaș","gropitasilor":"gropițaș","gropitasul":"gropițaș","gropitasule":"gropițaș","gropitasului":"gropițaș","gropite":["gropite","gropit","gropițe","gropiță"],"gropitei":"gropiță","gropitele":["gropitele","gropit","gropițele","gropiță"],"gropitelor":"gropiță","gropiti":"gropit","gropitii":"gropit","gropitul":"gropit","gropniceri":"gropnicer","gropnicerii":"gropnicer","gropnicerilor":"gropnicer","gropnicerul":"gropnicer","gropnicerule":"gropnicer","gropnicerului":"gropnicer","gropnite":"gropniță","gropnitei":"gropniță","gropnitele":"gropniță","gropnitelor":"gropniță","gropusoare":"gropușoară","gropusoarei":"gropușoară","gropusoarele":"gropușoară","gropusoarelor":"gropușoară","gropute":"gropuță","groputei":"gropuță","groputele":"gropuță","groputelor":"gropuță","grosari":"groșar","grosarii":"groșar","grosarilor":"groșar","grosarul":"groșar","grosarule":"groșar","grosarului":"groșar","grosciora":["groscioră","groscior","grosciora","groscior","groșcioră","groșcior","groșciora","groșcior"],"grosciore":["grosciore","groscior","groșciore","groșcior"],"grosciorele":["grosciorele","groscior","groșciorele","groșcior"],"grosciori":["grosciori","groscior","groșciori","groșcior"],"grosciorii":["grosciorii","groscior","groșciorii","groșcior"],"grosciorul":["grosciorul","groscior","groșciorul","groșcior"],"grosi":["groși","gros","groși","groș"],"grosiera":["grosieră","grosier","grosiera","grosier"],"grosiere":"grosier","grosierele":"grosier","grosieri":"grosier","grosierii":"grosier","grosierul":"grosier","grosii":["groșii","gros","groșii","groș"],"grosilor":"groș","grosimea":"grosime","grosimi":"grosime","grosimii":"grosime","grosimile":"grosime","grosimilor":"grosime","grosismente":"grosisment","grosismentele":"grosisment","grosismentelor":"grosisment","grosismentul":"grosisment","grosismentule":"grosisment","grosismentului":"grosisment","grosisora":["grosișoră","grosișor","grosișora","grosișor"],"grosisore":"grosișor","grosisorele":"grosișor","grosisori":"grosișor","grosisorii":"grosișor","grosisorul":"grosișor","grosite":"groșiță","grositei":"groșiță","grositele":"groșiță","grositelor":"groșiță","grosolana":["grosolană","grosolan","grosolana","grosolan"],"grosolane":"grosolan","grosolanele":"grosolan","grosolani":"grosolan","grosolania":"grosolănie","grosolaniei":"grosolănie","grosolanii":["grosolanii","grosolan","grosolănii","grosolănie"],"grosolaniile":"grosolănie","grosolaniilor":"grosolănie","grosolanul":"grosolan","grosomani":"grosoman","grosomanii":"grosoman","grosomanilor":"grosoman","grosomanul":"grosoman","grosomanule":"grosoman","grosomanului":"grosoman","grostei":"groșteu","grosteii":["groșteii","groștei","groșteii","groșteu"],"grosteilor":["groșteilor","groștei","groșteilor","groșteu"],"grosteiul":"groștei","grosteiule":"groștei","grosteiului":"groștei","grosteri":"groster","grosterii":"groster","grosterilor":"groster","grosterul":"groster","grosterule":"groster","grosterului":"groster","grosteuul":"groșteu","grosteuule":"groșteu","grosteuului":"groșteu","grosul":["grosul","gros","groșul","groș"],"grosulare":"grosular","grosularele":"grosular","grosularelor":"grosular","grosularul":"grosular","grosularule":"grosular","grosularului":"grosular","grosule":"groș","grosului":"groș","grosuta":["grosuță","grosuț","grosuța","grosuț"],"grosute":"grosuț","grosutele":"grosuț","grosuti":"grosuț","grosutii":"grosuț","grosutul":"grosuț","grote":"grotă","groteasca":["grotească","grotesc","groteasca","grotesc"],"grotei":"grotă","grotele":"grotă","grotelor":"grotă","grotescul":"grotesc","grotesti":"grotesc","grotestii":"grotesc","grotestile":"grotesc","grozame":"grozamă","grozamei":"grozamă","grozamele":"grozamă","grozamelor":"grozamă","grozava":"grozav","grozave":"grozav","grozavea":"grozăvi","grozaveai":"grozăvi","grozaveam":"grozăvi","grozaveati":"grozăvi","grozaveau":"grozăvi","grozavenia":"grozăvenie","grozaveniei":"grozăvenie","grozavenii":"grozăvenie","grozaveniile":"grozăvenie","grozaveniilor":"grozăvenie","grozavesc":"grozăvi","grozaveste":"grozăvi","grozavesti":"grozăvi","grozavi":"grozav","grozavia":"grozăvie","grozaviei":"grozăvie","grozavii":["grozăvii","grozăvi","grozăvii","grozăvie"],"grozaviile":"grozăvie","grozaviilor":"grozăvie","grozavim":"grozăvi","grozavind":"grozăvi","grozaviora":["grozăvioră","grozăvior","grozăviora","grozăvior"],"grozaviore":"grozăvior","grozaviorele":"grozăvior","grozaviori":"grozăvior","grozaviorii":"grozăvior","grozaviorul":"grozăvior","grozavira":"grozăvi","grozaviram":"grozăvi","grozavirati":"grozăvi","grozavirea":"grozăvire","grozaviri":"grozăvire","grozavirii":"grozăvire","grozavirile":"grozăvire","grozavirilor":"grozăvire","grozavise":"grozăvi","grozavisem":"grozăvi","grozavisera":"grozăvi","grozaviseram":"grozăvi","grozaviserati":"grozăvi","grozavisesi":"grozăvi","grozavisi":"grozăvi","grozavit":"grozăvi","grozaviti":"grozăvi","grozavnica":["grozavnică","grozavnic","grozavnica","grozavnic"],"grozavnice":"grozavnic","grozavnicele":"grozavnic","grozavnici":"grozavnic","grozavnicii":"grozavnic","grozavnicul":"grozavnic","grozliva":["grozlivă","grozliv","grozliva","grozliv"],"grozlive":"grozliv","grozlivele":"grozliv","grozlivi":"grozliv","grozlivii":"grozliv","grozlivul":"grozliv","groznica":["groznică","groznic","groznica","groznic"],"groznice":"groznic","groznicele":"groznic","groznici":"groznic","groznicia":"groznicie","grozniciei":"groznicie","groznicii":["groznicii","groznic","groznicii","groznicie"],"grozniciile":"groznicie","grozniciilor":"groznicie","groznicul":"groznic","grue":"grui","gruia":"gruie","gruiei":"gruie","gruiele":"gruie","gruielor":"gruie","gruiete":"gruieț","gruietele":"gruieț","gruietelor":"gruieț","gruietul":"gruieț","gruietule":"gruieț","gruietului":"gruieț","gruii":"grui","gruilor":"grui","gruioasa":["gruioasă","gruios","gruioasa","gruios"],"gruioase":"gruios","gruioasele":"gruios","gruiosi":"gruios","gruiosii":"gruios","gruiosul":"gruios","gruisori":"gruișor","gruisorii":"gruișor","gruisorilor":"gruișor","gruisorul":"gruișor","gruisorule":"gruișor","gruisorului":"gruișor","gruiul":"grui","gruiule":"grui","gruiului":"grui","gruiuri":"grui","gruiurile":"grui","gruiurilor":"grui","grumajei":"grumăjel","grumajeii":"grumăjel","grumajeilor":"grumăjel","grumajelul":"grumăjel","grumajelule":"grumăjel","grumajelului":"grumăjel","grumajere":"grumăjer","grumajerele":"grumăjer","grumajerelor":"grumăjer","grumajerul":"grumăjer","grumajerule":"grumăjer","grumajerului":"grumăjer","grumajori":"grumăjor","grumajorii":"grumăjor","grumajorilor":"grumăjor","grumajorul":"grumăjor","grumajorule":"grumăjor","grumajorului":"grumăjor","grumazul":"grumaz","grumazule":"grumaz","grumazului":"grumaz","grumazuri":"grumaz","grumazurii":"grumaz","grumazurilor":"grumaz","grumazuti":"grumăzuț","grumazutii":"grumăzuț","grumazutilor":"grumăzuț","grumazutul":"grumăzuț","grumazutule":"grumăzuț","grumazutului":"grumăzuț","grumba":["grumbă","grumb","grumba","grumb"],"grumbe":"grumb","grumbele":"grumb","grumbi":"grumb","grumbii":"grumb","grumbistea":"grumbiște","grumbisti":"grumbiște","grumbistii":"grumbiște","grumbistile":"grumbiște","grumbistilor":"grumbiște","grumbuhul":"grumbuh","grumbuhule":"grumbuh","grumbuhului":"grumbuh","grumbuhuri":"grumbuh","grumbuhurile":"grumbuh","grumbuhurilor":"grumbuh","grumbul":"grumb","grumuleie":"grumuleu","grumuleiele":"grumuleu","grumuleielor":"grumuleu","grumuleuul":"grumuleu","grumuleuule":"grumuleu","grumuleuului":"grumuleu","grumur":"grumura","grumurai":"grumura","grumuram":["grumurăm","grumura","grumuram","grumura"],"grumurand":"grumura","grumurara":"grumura","grumuraram":"grumura","grumurarati":"grumura","grumurase":"grumura","grumurasem":"grumura","grumurasera":"grumura","grumuraseram":"grumura","grumuraserati":"grumura","grumurasesi":"grumura","grumurasi":"grumura","grumurat":"grumura","grumurati":"grumura","grumurau":"grumura","grumuri":["grumuri","grum","grumuri","grumura"],"grunji":"grunz","grunjii":"grunz","grunjilor":"grunz","grunjoasa":["grunjoasă","grunjos","grunjoasa","grunjos"],"grunjoase":"grunjos","grunjoasele":"grunjos","grunjosi":"grunjos","grunjosii":"grunjos","grunjosul":"grunjos","grunt":"grunz","gruntuiele":"grunțuială","gruntuielei":"grunțuială","gruntuielele":"grunțuială","gruntuielelor":"grunțuială","gruntuieli":"grunțuială","grunturoasa":["grunțuroasă","grunțuros","grunțuroasa","grunțuros"],"grunturoase":"grunțuros","grunturoasele":"grunțuros","grunturosi":"grunțuros","grunturosii":"grunțuros","grunturosul":"grunțuros","grunzul":"grunz","grunzule":"grunz","grunzului":"grunz","grunzurasi":"grunzuraș","grunzurasii":"grunzuraș","grunzurasilor":"grunzuraș","grunzurasul":"grunzuraș","grunzurasule":"grunzuraș","grunzurasului":"grunzuraș","grunzuroasa":["grunzuroasă","grunzuros","grunzuroasa","grunzuros"],"grunzuroase":"grunzuros","grunzuroasele":"grunzuros","grunzurosi":"grunzuros","grunzurosii":"grunzuros","grunzurosul":"grunzuros","grupai":"grupa","grupaje":"grupaj","grupajele":"grupaj","grupajelor":"grupaj","grupajul":"grupaj","grupajule":"grupaj","grupajului":"grupaj","grupam":["grupăm","grupa","grupam","grupa"],"grupand":"grupa","grupara":"grupa","gruparam":"grupa","gruparati":"grupa","gruparea":"grupare","grupari":"grupare","gruparii":"grupare","gruparile":"grupare","gruparilor":"grupare","grupase":"grupa","grupasem":"grupa","grupasera":"grupa","grupaseram":"grupa","grupaserati":"grupa","grupasesi":"grupa","grupasi":"grupa","grupat":"grupa","grupata":["grupată","grupat","grupata","grupat"],"grupate":"grupat","grupatele":"grupat","grupati":["grupați","grupa","grupați","grupat"],"grupatii":"grupat","grupatul":"grupat","grupau":"grupa","grupe":"grupă","grupe sangvine":"grupă sangvină","grupeaza":"grupa","grupei":"grupă","grupele":"grupă","grupelor":"grupă","grupez":"grupa","grupezi":"grupa","grupul":"grup","grupule":"grup","grupulete":"grupuleț","grupuletele":"grupuleț","grupuletelor":"grupuleț","grupuletul":"grupuleț","grupuletule":"grupuleț","grupuletului":"grupuleț","grupului":"grup","grupuri":"grup","grupuri abeliene":"grup abelian","grupuri comutative":"grup comutativ","grupuri de control":"grup de control","grupuri de influenta":"grup de influență","grupuri de presiune":"grup de presiune","grupuri de sprijin":"grup de sprijin","grupuri etnice":"grup etnic","grupuri sanitare":"grup sanitar","grupurile":"grup","grupurilor":"grup","grupusoare":"grupușor","grupusore":"grupușor","grupusorele":"grupușor","grupusorelor":"grupușor","grupusorul":"grupușor","grupusorule":"grupușor","grupusorului":"grupușor","gruzie":"Gruzia","gruziei":"Gruzia","gruzii":"Gruzia","gruzine":"gruzină","gruzinei":"gruzină","gruzinele":"gruzină","gruzinelor":"gruzină","gruzini":"gruzin","gruzinii":"gruzin","gruzinilor":"gruzin","gruzinul":"gruzin","gruzinule":"gruzin","gruzinului":"gruzin","guanidine":"guanidină","guanidinei":"guanidină","guanidinele":"guanidină","guanidinelor":"guanidină","guanine":"guanină","guaninei":"guanină","guaninele":"guanină","guaninelor":"guanină","guanoul":"guano","guanoule":"guano","guanoului":"guano","guaranaua":"guarana","guaraniul":"guarani","guaraniule":"guarani","guaraniului":"guarani","guardamane":"guardaman","guardamanele":"guardaman","guardamanelor":"guardaman","guardamanul":"guardaman","guardamanule":"guardaman","guardamanului":"guardaman","guardia":"guardie","guardiei":"guardie","guardii":"guardie","guardiile":"guardie","guardiilor":"guardie","guardul":"guard","guardule":"guard","guardului":"guard","guarzi":"guard","guarzii":"guard","guarzilor":"guard","guas":"guașă","guasaul":"guașă","guasaule":"guașă","guasaului":"guașă","guase":["guașe","guaș","guașe","guașă"],"guasele":"guașă","guaselor":"guașă","guatemaleze":"guatemaleză","guatemalezei":"guatemaleză","guatemalezele":"guatemaleză","guatemalezelor":"guatemaleză","guatemalezi":"guatemalez","guatemalezii":"guatemalez","guatemalezilor":"guatemalez","guatemalezul":"guatemalez","guatemalezule":"guatemalez","guatemalezului":"guatemalez","gubanasi":"gubănaș","gubanasii":"gubănaș","gubanasilor":"gubănaș","gubanasul":"gubănaș","gubanasule":"gubănaș","gubanasului":"gubănaș","gubavenia":"gubăvenie","gubaveniei":"gubăvenie","gubavenii":"gubăvenie","gubaveniile":"gubăvenie","gubaveniilor":"gubăvenie","gube":"gubă","gubei":"gubă","gubele":"gubă","gubelor":"gubă","gubernati":"gubernat","gubernatii":"gubernat","gubernatilor":"gubernat","gubernatul":"gubernat","gubernatule":"gubernat","gubernatului":"gubernat","gubernia":"gubernie","guberniei":"gubernie","gubernii":"gubernie","guberniile":"gubernie","guberniilor":"gubernie","gubernite":"guberniță","gubernitei":"guberniță","gubernitele":"guberniță","gubernitelor":"guberniță","gudaria":"gudărie","gudariei":"gudărie","gudarii":"gudărie","gudariile":"gudărie","gudariilor":"gudărie","gudroane":"gudron","gudroanele":"gudron","gudroanelor":"gudron","gudronai":"gudrona","gudronaje":"gudronaj","gudronajele":"gudronaj","gudronajelor":"gudronaj","gudronajul":"gudronaj","gudronajule":"gudronaj","gudronajului":"gudronaj","gudronam":["gudronăm","gudrona","gudronam","gudrona"],"gudronand":"gudrona","gudronara":"gudrona","gudronaram":"gudrona","gudronarati":"gudrona","gudronarea":"gudronare","gudronari":"gudronare","gudronarii":"gudronare","gudronarile":"gudronare","gudronarilor":"gudronare","gudronase":"gudrona","gudronasem":"gudrona","gudronasera":"gudrona","gudronaseram":"gudrona","gudronaserati":"gudrona","gudronasesi":"gudrona","gudronasi":"gudrona","gudronat":"gudrona","gudronata":["gudronată","gudronat","gudronata","gudronat"],"gudronate":"gudronat","gudronatele":"gudronat","gudronati":["gudronați","gudrona","gudronați","gudronat"],"gudronatii":"gudronat","gudronatul":"gudronat","gudronau":"gudrona","gudroneaza":"gudrona","gudronez":"gudrona","gudronezi":"gudrona","gudronul":"gudron","gudronule":"gudron","gudronului":"gudron","gudur":"gudura","gudurai":"gudura","guduram":["gudurăm","gudura","guduram","gudura"],"gudurand":"gudura","gudurara":"gudura","guduraram":"gudura","gudurarari":"gudurare","gudurararii":"gudurare","gudurararile":"gudurare","gudurararilor":"gudurare","gudurarati":"gudura","gudurarea":"gudurare","gudurase":"gudura","gudurasem":"gudura","gudurasera":"gudura","guduraseram":"gudura","guduraserati":"gudura","gudurasesi":"gudura","gudurasi":"gudura","gudurat":"gudura","gudurati":"gudura","gudurau":"gudura","gudure":"gudura","guduri":"gudura","guelfi":"guelf","guelfii":"guelf","guelfilor":"guelf","guelfismul":"guelfism","guelfismule":"guelfism","guelfismului":"guelfism","guelful":"guelf","guelfule":"guelf","guelfului":"guelf","guerile":"guerilă","guerilei":"guerilă","guerilele":"guerilă","guerilelor":"guerilă","guetul":"guet","guetule":"guet","guetului":"guet","gugiulea":"gugiuli","gugiuleai":"gugiuli","gugiuleam":"gugiuli","gugiuleati":"gugiuli","gugiuleau":"gugiuli","gugiulesc":"gugiuli","gugiuleste":"gugiuli","gugiulesti":"gugiuli","gugiulii":"gugiuli","gugiulim":"gugiuli","gugiulind":"gugiuli","gugiulira":"gugiuli","gugiuliram":"gugiuli","gugiulirati":"gugiuli","gugiulise":"gugiuli","gugiulisem":"gugiuli","gugiulisera":"gugiuli","gugiuliseram":"gugiuli","gugiuliserati":"gugiuli","gugiulisesi":"gugiuli","gugiulisi":"gugiuli","gugiulit":"gugiuli","gugiuliti":"gugiuli","gugiumane":"gugiuman","gugiumanele":"gugiuman","gugiumanelor":"gugiuman","gugiumanul":"gugiuman","gugiumanule":"gugiuman","gugiumanului":"gugiuman","gugosele":"gugoșea","gugosi":"gugoașă","gugulicea":"gugulice","gugulici":"gugulice","gugulicii":"gugulice","gugulicile":"gugulice","gugulicilor":"gugulice","gugumana":["gugumană","guguman","gugumana","guguman"],"gugumane":"guguman","gugumanele":"guguman","gugumani":"guguman","gugumania":"gugumănie","gugumaniei":"gugumănie","gugumanii":["gugumanii","guguman","gugumănii","gugumănie"],"gugumaniile":"gugumănie","gugumaniilor":"gugumănie","gugumanul":"guguman","gugusi":"guguș","gugusii":"guguș","gugusilor":"guguș","gugustiuce":"guguștiucă","gugustiucei":"guguștiucă","gugustiucele":"guguștiucă","gugustiucelor":"guguștiucă","gugustiuci":"guguștiuc","gugustiucii":"guguștiuc","gugustiucilor":"guguștiuc","gugustiucul":"guguștiuc","gugustiucule":"guguștiuc","gugustiucului":"guguștiuc","gugusul":"guguș","gugusule":"guguș","gugusului":"guguș","guilemote":"guilemotă","guilemotei":"guilemotă","guilemotele":"guilemotă","guilemotelor":"guilemotă","guineea":"guinee","guineeana":["guineeană","guineean","guineeana","guineean"],"guineeane":"guineeană","guineeanei":"guineeană","guineeanele":"guineeană","guineeanelor":"guineeană","guineeanul":"guineean","guineeanule":"guineean","guineeanului":"guineean","guineei":"guinee","guineele":"guinee","guineelor":"guinee","guineene":"guineean","guineenele":"guineean","guineeni":"guineean","guineenii":"guineean","guineenilor":"guineean","guineeze":"guineeză","guineezei":"guineeză","guineezele":"guineeză","guineezelor":"guineeză","guineobissauana":["guineobissauană","guineobissauan","guineobissauana","guineobissauan"],"guineobissauane":["guineobissauane","guineobissauan","guineobissauane","guineobissauană"],"guineobissauanei":"guineobissauană","guineobissauanele":["guineobissauanele","guineobissauan","guineobissauanele","guineobissauană"],"guineobissauanelor":"guineobissauană","guineobissauani":"guineobissauan","guineobissauanii":"guineobissauan","guineobissauanilor":"guineobissauan","guineobissauanul":"guineobissauan","guineobissauanule":"guineobissauan","guineobissauanului":"guineobissauan","guineoecuatoriana":["guineoecuatoriană","guineoecuatorian","guineoecuatoriana","guineoecuatorian"],"guineoecuatoriane":"guineoecuatoriană","guineoecuatorianei":"guineoecuatoriană","guineoecuatorianele":"guineoecuatoriană","guineoecuatorianelor":"guineoecuatoriană","guineoecuatorianul":"guineoecuatorian","guineoecuatorianule":"guineoecuatorian","guineoecuatorianului":"guineoecuatorian","guineoecuatoriene":"guineoecuatorian","guineoecuatorienele":"guineoecuatorian","guineoecuatorieni":"guineoecuatorian","guineoecuatorienii":"guineoecuatorian","guineoecuatorienilor":"guineoecuatorian","guit":"guița","guitai":"guița","guitam":["guițăm","guița","guițam","guița"],"guitand":"guița","guitara":"guița","guitaram":"guița","guitarati":"guița","guitarea":"guițare","guitari":"guițare","guitarii":"guițare","guitarile":"guițare","guitarilor":"guițare","guitase":"guița","guitasem":"guița","guitasera":"guița","guitaseram":"guița","guitaserati":"guița","guitasesi":"guița","guitasi":"guița","guitat":"guița","guitati":"guița","guitatul":"guițat","guitatule":"guițat","guitatului":"guițat","guitaturi":"guițătură","guitaturii":"guițătură","guitaturile":"guițătură","guitaturilor":"guițătură","guitau":"guița","guiti":"guița","gulagul":"gulag","gulagule":"gulag","gulagului":"gulag","gulaguri":"gulag","gulagurile":"gulag","gulagurilor":"gulag","gulasul":"gulaș","gulasule":"gulaș","gulasului":"gulaș","gulasuri":"gulaș","gulasurile":"gulaș","gulasurilor":"gulaș","guldeni":"gulden","guldenii":"gulden","guldenilor":"gulden","guldenul":"gulden","guldenule":"gulden","guldenului":"gulden","gulerase":"guleraș","gulerasele":"guleraș","guleraselor":"guleraș","gulerasul":"guleraș","gulerasule":"guleraș","gulerasului":"guleraș","gulerata":["gulerată","gulerat","gulerata","gulerat"],"gulerate":["gulerate","gulerat","gulerate","gulerată"],"guleratei":"gulerată","guleratele":["guleratele","gulerat","guleratele","gulerată"],"guleratelor":"gulerată","gulerati":"gulerat","guleratii":"gulerat","guleratilor":"gulerat","guleratul":"gulerat","guleratule":"gulerat","guleratului":"gulerat","gulere":"guler","gulerele":["gulerele","guler","gulerele","gulerel"],"gulerelele":"gulerel","gulerelelor":"gulerel","gulerelor":"guler","gulerelul":"gulerel","gulerelule":"gulerel","gulerelului":"gulerel","gulerul":"guler","gulerule":"guler","gulerului":"guler","gulguleaua":"gulgulea","gulgulele":"gulgulea","gulgulelei":"gulgulea","gulgulelele":"gulgulea","gulgulelelor":"gulgulea","gulia":"gulie","guliei":"gulie","gulii":"gulie","guliile":"gulie","guliilor":"gulie","gulimosul":"gulimos","gulimosule":"gulimos","gulimosului":"gulimos","guliubai":"guliubaie","guliubaia":"guliubaie","guliubaii":"guliubaie","guliubaile":"guliubaie","guliubailor":"guliubaie","gumai":"guma","gumam":["gumăm","guma","gumam","guma"],"gumand":"guma","gumara":"guma","gumaram":"guma","gumarati":"guma","gumase":"guma","gumasem":"guma","gumasera":"guma","gumaseram":"guma","gumaserati":"guma","gumasesi":"guma","gumasi":"guma","gumat":"guma","gumata":["gumată","gumat","gumata","gumat"],"gumate":"gumat","gumatele":"gumat","gumati":["gumați","guma","gumați","gumat"],"gumatii":"gumat","gumatul":"gumat","gumau":"guma","gume":"gumă","gume de mestecat":"gumă de mestecat","gume de sters":"gumă de șters","gumeaza":"guma","gumez":"guma","gumezi":"guma","gumifera":["gumiferă","gumifer","gumifera","gumifer"],"gumifere":"gumifer","gumiferele":"gumifer","gumiferi":"gumifer","gumiferii":"gumifer","gumiferul":"gumifer","gumilastice":"gumilastic","gumilasticele":"gumilastic","gumilasticelor":"gumilastic","gumilasticul":"gumilastic","gumilasticule":"gumilastic","gumilasticului":"gumilastic","guneatul":"guneaț","guneatule":"guneaț","guneatului":"guneaț","gunete":"guneaț","gunetele":"guneaț","gunetelor":"guneaț","gungun":"gunguni","gungune":"gunguni","gungunea":"gunguni","gunguneai":"gunguni","gunguneam":"gunguni","gunguneati":"gunguni","gunguneau":"gunguni","gunguneste":"gunguni","gungunii":"gunguni","gungunim":"gunguni","gungunind":"gunguni","gungunira":"gunguni","gunguniram":"gunguni","gungunirati":"gunguni","gungunise":"gunguni","gungunisem":"gunguni","gungunisera":"gunguni","gunguniseram":"gunguni","gunguniserati":"gunguni","gungunisesi":"gunguni","gungunisi":"gunguni","gungunit":"gunguni","gunguniti":"gunguni","gungur":"gunguri","gungure":"gunguri","gungurea":"gunguri","gungureai":"gunguri","gunguream":"gunguri","gungureati":"gunguri","gungureau":"gunguri","gungureste":"gunguri","gungurii":"gunguri","gungurim":"gunguri","gungurind":"gunguri","gungurira":"gunguri","gunguriram":"gunguri","gungurirati":"gunguri","gungurise":"gunguri","gungurisem":"gunguri","gungurisera":"gunguri","gunguriseram":"gunguri","gunguriserati":"gunguri","gungurisesi":"gunguri","gungurisi":"gunguri","gungurit":"gunguri","gunguriti":"gunguri","gunoaie":"gunoi","gunoaiele":"gunoi","gunoaielor":"gunoi","gunoi":"gunoia","gunoiai":"gunoia","gunoiam":"gunoia","gunoiara":"gunoia","gunoiaram":"gunoia","gunoiarati":"gunoia","gunoiase":["gunoiase","gunoia","gunoiașe","gunoiaș"],"gunoiasele":"gunoiaș","gunoiaselor":"gunoiaș","gunoiasem":"gunoia","gunoiasera":"gunoia","gunoiaseram":"gunoia","gunoiaserati":"gunoia","gunoiasesi":"gunoia","gunoiasi":"gunoia","gunoiasul":"gunoiaș","gunoiasule":"gunoiaș","gunoiasului":"gunoiaș","gunoiat":"gunoia","gunoiati":"gunoia","gunoiau":"gunoia","gunoiaza":"gunoia","gunoie":"gunoia","gunoiem":"gunoia","gunoiere":"gunoieră","gunoierei":"gunoieră","gunoierele":"gunoieră","gunoierelor":"gunoieră","gunoieri":"gunoier","gunoierii":"gunoier","gunoierilor":"gunoier","gunoierul":"gunoier","gunoierule":"gunoier","gunoierului":"gunoier","gunoiete":"gunoiață","gunoietei":"gunoiață","gunoietele":"gunoiață","gunoietelor":"gunoiață","gunoind":"gunoia","gunoioasa":["gunoioasă","gunoios","gunoioasa","gunoios"],"gunoioase":"gunoios","gunoioasele":"gunoios","gunoiosi":"gunoios","gunoiosii":"gunoios","gunoiosul":"gunoios","gunoirea":"gunoire","gunoiri":"gunoire","gunoirii":"gunoire","gunoirile":"gunoire","gunoirilor":"gunoire","gunoistea":"gunoiște","gunoisti":"gunoiște","gunoistii":"gunoiște","gunoistile":"gunoiște","gunoistilor":"gunoiște","gunoistine":"gunoiștină","gunoistinei":"gunoiștină","gunoistinele":"gunoiștină","gunoistinelor":"gunoiștină","gunoita":["gunoită","gunoit","gunoita","gunoit"],"gunoite":"gunoit","gunoitele":"gunoit","gunoiti":"gunoit","gunoitii":"gunoit","gunoitul":"gunoit","gunoiul":"gunoi","gunoiule":"gunoi","gunoiului":"gunoi","guraia":"gurăi","guraiai":"gurăi","guraiam":"gurăi","guraiati":"gurăi","guraiau":"gurăi","guraie":"gurăi","guraii":"gurăi","guraim":"gurăi","guraind":"gurăi","guraira":"gurăi","gurairam":"gurăi","gurairati":"gurăi","guraise":"gurăi","guraisem":"gurăi","guraisera":"gurăi","guraiseram":"gurăi","guraiserati":"gurăi","guraisesi":"gurăi","guraisi":"gurăi","gurait":"gurăi","guraiti":"gurăi","guralia":"guraliu","guralie":"guraliu","guralii":"guraliu","guraliii":"guraliu","guraliile":"guraliu","guraliu":"guraliv","guraliul":"guraliu","guraliva":["guralivă","guraliv","guraliva","guraliv"],"guralive":["guralive","guraliv","guralive","guralivă"],"guralivei":"guralivă","guralivele":["guralivele","guraliv","guralivele","guralivă"],"guralivelor":"guralivă","guralivi":"guraliv","guralivii":"guraliv","guralivul":"guraliv","guratica":["guratică","guratic","guratica","guratic"],"guratice":"guratic","guraticele":"guratic","guratici":"guratic","guraticii":"guratic","guraticul":"guratic","guresa":["gureșă","gureș","gureșa","gureș"],"gurese":"gureș","guresele":"gureș","guresi":"gureș","guresii":"gureș","guresul":"gureș","gurguiata":["gurguiată","gurguiat","gurguiata","gurguiat"],"gurguiate":"gurguiat","gurguiatele":"gurguiat","gurguiati":"gurguiat","gurguiatii":"gurguiat","gurguiatul":"gurguiat","gurguie":"gurgui","gurguiele":"gurguială","gurguielei":"gurguială","gurguielele":"gurguială","gurguielelor":"gurguială","gurguieli":"gurguială","gurgutata":["gurguțată","gurguțat","gurguțata","gurguțat"],"gurgutate":"gurguțat","gurgutatele":"gurguțat","gurgutati":"gurguțat","gurgutatii":"gurguțat","gurgutatul":"gurguțat","guri":"gură","guri de incendiu":"gură de incendiu","guri mari":"gură mare","guri sparte":"gură spartă","guricicele":"guricică","guricicelei":"guricică","guricicelele":"guricică","guricicelelor":"guricică","guricioare":"guricioară","guricioarei":"guricioară","guricioarele":"guricioară","guricioarelor":"guricioară","gurii":"gură","gurilatela":["gurilățelă","gurilățel","gurilățela","gurilățel"],"gurilatele":"gurilățel","gurilatelele":"gurilățel","gurilateli":"gurilățel","gurilatelii":"gurilățel","gurilatelul":"gurilățel","gurile":"gură","gurilor":"gură","gurioare":"gurioară","gurioarei":"gurioară","gurioarele":"gurioară","gurioarelor":"gurioară","gurisoare":"gurișoară","gurisoarei":"gurișoară","guriste":"guristă","guristei":"guristă","guristele":"guristă","guristelor":"guristă","gurite":"guriță","guritei":"guriță","guritele":"guriță","guritelor":"guriță","gurluie":"gurlui","gurluiele":"gurlui","gurluielor":"gurlui","gurluiul":"gurlui","gurluiule":"gurlui","gurluiului":"gurlui","gurmanda":["gurmandă","gurmand","gurmanda","gurmand"],"gurmande":["gurmande","gurmand","gurmande","gurmandă"],"gurmandei":"gurmandă","gurmandele":["gurmandele","gurmand","gurmandele","gurmandă"],"gurmandelor":"gurmandă","gurmandul":"gurmand","gurmanzi":"gurmand","gurmanzii":"gurmand","gurme":"gurmă","gurmei":"gurmă","gurmele":"gurmă","gurmelor":"gurmă","gurmire":"gurmir","gurmirele":"gurmir","gurmirelor":"gurmir","gurmirul":"gurmir","gurmirule":"gurmir","gurmirului":"gurmir","gurnia":"gurnie","gurniei":"gurnie","gurnii":"gurnie","gurniile":"gurnie","gurniilor":"gurnie","guruci":"gurucă","gurucii":"gurucă","gurucile":"gurucă","gurucilor":"gurucă","gurui":"guru","gurulor":"guru","gurusei":"gurușel","guruseii":"gurușel","guruseilor":"gurușel","guruselul":"gurușel","guruselule":"gurușel","guruselului":"gurușel","gurute":"guruță","gurutei":"guruță","gurutele":"guruță","gurutelor":"guruță","guruul":"guru","guruule":"guru","guruului":"guru","guruzoi":"guzuroi","guruzoii":"guzuroi","guruzoilor":"guzuroi","gusate":"gușată","gusatei":"gușată","gusatele":"gușată","gusatelor":"gușată","gusati":"gușat","gusatii":"gușat","gusatilor":"gușat","gusatul":"gușat","gusatule":"gușat","gusatului":"gușat","guse albastra":"gușă albastră","guse vinete":"gușă vânătă","guse-rosii":"gușă-roșie","guseul":"guseu","guseule":"guseu","guseului":"guseu","guseuri":"guseu","guseurile":"guseu","guseurilor":"guseu","gusi":"gușă","gusii":"gușă","gusile":"gușă","gusilor":"gușă","gusite":"gușiță","gusitei":"gușiță","gusitele":"gușiță","gusitelor":"gușiță","gust":["gust","gusta","gust","gustar"],"gustai":"gusta","gustam":["gustăm","gusta","gustam","gusta"],"gustand":"gusta","gustara":"gusta","gustaram":"gusta","gustarati":"gusta","gustarea":"gustare","gustarele":"gustăreală","gustarelei":"gustăreală","gustarelele":"gustăreală","gustarelelor":"gustăreală","gustareli":"gustăreală","gustari":"gustare","gustarice":"gustărică","gustaricei":"gustărică","gustaricele":"gustărică","gustaricelor":"gustărică","gustarici":"gustărică","gustarii":"gustare","gustarile":"gustare","gustarilor":"gustare","gustaritul":"gustărit","gustaritule":"gustărit","gustaritului":"gustărit","gustarituri":"gustărit","gustariturile":"gustărit","gustariturilor":"gustărit","gustase":"gusta","gustasem":"gusta","gustasera":"gusta","gustaseram":"gusta","gustaserati":"gusta","gustasesi":"gusta","gustasi":"gusta","gustat":"gusta","gustata":["gustată","gustat","gustata","gustat"],"gustate":"gustat","gustatele":"gustat","gustati":["gustați","gusta","gustați","gustat"],"gustatii":"gustat","gustativa":["gustativă","gustativ","gustativa","gustativ"],"gustative":"gustativ","gustativele":"gustativ","gustativi":"gustativ","gustativii":"gustativ","gustativitatea":"gustativitate","gustativitati":"gustativitate","gustativitatii":"gustativitate","gustativul":"gustativ","gustatoarea":"gustătoare","gustatoarei":"gustătoare","gustatoarele":"gustătoare","gustatoarelor":"gustătoare","gustatori":"gustător","gustatorii":"gustător","gustatorilor":"gustător","gustatorul":"gustător","gustatorule":"gustător","gustatorului":"gustător","gustatul":"gustat","gustau":"gusta","guste":"gusta","gusteri":"gușter","gusterile":"gușter","gusterilor":"gușter","gusteroaice":"gușteroaică","gusteroaicei":"gușteroaică","gusteroaicele":"gușteroaică","gusteroaicelor":"gușteroaică","gusterul":"gușter","gusterule":"gușter","gusterului":"gușter","gusti":"gusta","gustoasa":["gustoasă","gustos","gustoasa","gustos"],"gustoase":"gustos","gustoasele":"gustos","gustosi":"gustos","gustosii":"gustos","gustosul":"gustos","gustul":"gust","gustule":"gust","gustului":"gust","gusturi":"gust","gusturile":"gust","gusturilor":"gust","gusulite":"gușuliță","gusulitei":"gușuliță","gusulitele":"gușuliță","gusulitelor":"gușuliță","gutai":"gutăie","gutaia":"gutăie","gutaii":"gutăie","gutaile":"gutăie","gutailor":"gutăie","gutaperce":"gutapercă","gutapercei":"gutapercă","gutatia":"gutație","gutatiei":"gutație","gutatii":"gutație","gutatiile":"gutație","gutatiilor":"gutație","gute":"gută","gutei":"gută","gutele":"gută","gutelor":"gută","gutoasa":["gutoasă","gutos","gutoasa","gutos"],"gutoase":["gutoase","gutoasă","gutoase","gutos"],"gutoasei":"gutoasă","gutoasele":["gutoasele","gutoasă","gutoasele","gutos"],"gutoaselor":"gutoasă","gutosi":"gutos","gutosii":"gutos","gutosilor":"gutos","gutosul":"gutos","gutosule":"gutos","gutosului":"gutos","gutui":"gutuie","gutui japonezi":"gutui japonez","gutuia":"gutuie","gutuii":["gutuii","gutui","gutuii","gutuie"],"gutuile":"gutuie","gutuilor":["gutuilor","gutui","gutuilor","gutuie"],"gutuiul":"gutui","gutuiule":"gutui","gutuiului":"gutui","gutunar":"guturai","gutunare":"gutunar","gutunarele":"gutunar","gutunarelor":"gutunar","gutunarul":"gutunar","gutunarule":"gutunar","gutunarului":"gutunar","guturaiul":"guturai","guturaiule":"guturai","guturaiului":"guturai","guturaiuri":"guturai","guturaiurile":"guturai","guturaiurilor":"guturai","guturala":["guturală","gutural","guturala","gutural"],"guturale":["guturale","gutural","guturale","guturală"],"guturalei":"guturală","guturalele":["guturalele","gutural","guturalele","guturală"],"guturalelor":"guturală","guturali":"gutural","guturalii":"gutural","guturalul":"gutural","guve":"guvă","guvernabila":["guvernabilă","guvernabil","guvernabila","guvernabil"],"guvernabile":"guvernabil","guvernabilele":"guvernabil","guvernabili":"guvernabil","guvernabilii":"guvernabil","guvernabilitatea":"guvernabilitate","guvernabilitati":"guvernabilitate","guvernabilitatii":"guvernabilitate","guvernabilul":"guvernabil","guvernai":"guverna","guvernam":["guvernăm","guverna","guvernam","guverna"],"guvernamantul":"guvernământ","guvernamantule":"guvernământ","guvernamantului":"guvernământ","guvernamentala":["guvernamentală","guvernamental","guvernamentala","guvernamental"],"guvernamentale":"guvernamental","guvernamentalele":"guvernamental","guvernamentali":"guvernamental","guvernamentalii":"guvernamental","guvernamentalisme":"guvernamentalism","guvernamentalismele":"guvernamentalism","guvernamentalismelor":"guvernamentalism","guvernamentalismul":"guvernamentalism","guvernamentalismule":"guvernamentalism","guvernamentalismului":"guvernamentalism","guvernamentalul":"guvernamental","guvernaminte":"guvernământ","guvernamintele":"guvernământ","guvernamintelor":"guvernământ","guvernand":"guverna","guvernanta":["guvernantă","guvernant","guvernanta","guvernant"],"guvernante":["guvernante","guvernant","guvernante","guvernantă","guvernanțe","guvernanță"],"guvernantei":["guvernantei","guvernantă","guvernanței","guvernanță"],"guvernantele":["guvernantele","guvernant","guvernantele","guvernantă"],"guvernantelor":"guvernantă","guvernanti":"guvernant","guvernantii":"guvernant","guvernantilor":"guvernant","guvernantul":"guvernant","guvernantule":"guvernant","guvernantului":"guvernant","guvernara":"guverna","guvernaram":"guverna","guvernarati":"guverna","guvernarea":"guvernare","guvernari":"guvernare","guvernarii":"guvernare","guvernarile":"guvernare","guvernarilor":"guvernare","guvernase":"guverna","guvernasem":"guverna","guvernasera":"guverna","guvernaseram":"guverna","guvernaserati":"guverna","guvernasesi":"guverna","guvernasi":"guverna","guvernat":"guverna","guvernata":["guvernată","guvernat","guvernata","guvernat"],"guvernate":"guvernat","guvernatele":"guvernat","guvernati":["guvernați","guverna","guvernați","guvernat"],"guvernatii":"guvernat","guvernatorate":"guvernatorat","guvernatoratele":"guvernatorat","guvernatoratelor":"guvernatorat","guvernatoratul":"guvernatorat","guvernatoratule":"guvernatorat","guvernatoratului":"guvernatorat","guvernatori":"guvernator","guvernatori-generali":"guvernator general","guvernatorii":"guvernator","guvernatorilor":"guvernator","guvernatorul":"guvernator","guvernatorule":"guvernator","guvernatorului":"guvernator","guvernatul":"guvernat","guvernau":"guverna","guverne":"guvern","guverne federale":"guvern federal","guverneaza":"guverna","guvernele":"guvern","guvernelor":"guvern","guvernez":"guverna","guvernezi":"guverna","guverniala":["guvernială","guvernial","guverniala","guvernial"],"guverniale":"guvernial","guvernialele":"guvernial","guverniali":"guvernial","guvernialii":"guvernial","guvernialul":"guvernial","guvernori":"guvernor","guvernorii":"guvernor","guvernorilor":"guvernor","guvernorul":"guvernor","guvernorule":"guvernor","guvernorului":"guvernor","guvernul":"guvern","guvernule":"guvern","guvernului":"guvern","guvidul":"guvid","guvidule":"guvid","guvidului":"guvid","guvizi":"guvid","guvizii":"guvid","guvizilor":"guvid","guyaneza":["guyaneză","guyanez","guyaneza","guyanez"],"guyaneze":["guyaneze","guyanez","guyaneze","guyaneză"],"guyanezei":"guyaneză","guyanezele":["guyanezele","guyanez","guyanezele","guyaneză"],"guyanezelor":"guyaneză","guyanezi":"guyanez","guyanezii":"guyanez","guyanezilor":"guyanez","guyanezul":"guyanez","guyanezule":"guyanez","guyanezului":"guyanez","guze":"guză","guzei":"guză","guzele":"guză","guzelor":"guză","guzgani":"guzgan","guzganii":"guzgan","guzganilor":"guzgan","guzganul":"guzgan","guzganule":"guzgan","guzganului":"guzgan","guzle":"guzlă","guzlei":"guzlă","guzlele":"guzlă","guzlelor":"guzlă","guzuroiul":"guzuroi","guzuroiule":"guzuroi","guzuroiului":"guzuroi","gvaltul":"gvalt","gvaltule":"gvalt","gvaltului":"gvalt","gvalturi":"gvalt","gvalturile":"gvalt","gvalturilor":"gvalt","gvardia":"gvardie","gvardiei":"gvardie","gvardii":"gvardie","gvardiile":"gvardie","gvardiilor":"gvardie"};
@@ -0,0 +1 @@
+export default {"habacii":"habaciu","habaciii":"habaciu","habaciilor":"habaciu","habaciuul":"habaciu","habaciuule":"habaciu","habaciuului":"habaciu","habarnamiste":"habarnamistă","habarnamistei":"habarnamistă","habarnamistele":"habarnamistă","habarnamistelor":"habarnamistă","habarnamisti":"habarnamist","habarnamistii":"habarnamist","habarnamistilor":"habarnamist","habarnamistul":"habarnamist","habarnamistule":"habarnamist","habarnamistului":"habarnamist","habarul":"habar","habarule":"habar","habarului":"habar","habauca":["hăbăucă","hăbăuc","hăbăuca","hăbăuc"],"habauce":"hăbăuc","habaucele":"hăbăuc","habauci":"hăbăuc","habaucia":"hăbăucie","habauciei":"hăbăucie","habaucii":["hăbăucii","hăbăuc","hăbăucii","hăbăucie"],"habauciile":"hăbăucie","habauciilor":"hăbăucie","habaucul":"hăbăuc","habe":"habă","habei":"habă","habele":"habă","habelor":"habă","habitacle":"habitaclu","habitaclele":"habitaclu","habitaclelor":"habitaclu","habitaclul":"habitaclu","habitaclule":"habitaclu","habitaclului":"habitaclu","habitate":"habitat","habitatele":"habitat","habitatelor":"habitat","habitatul":"habitat","habitatule":"habitat","habitatului":"habitat","habituala":["habituală","habitual","habituala","habitual"],"habituale":"habitual","habitualele":"habitual","habituali":"habitual","habitualii":"habitual","habitualul":"habitual","habitudinea":"habitudine","habitudini":"habitudine","habitudinii":"habitudine","habitudinile":"habitudine","habitudinilor":"habitudine","habitusul":"habitus","habitusule":"habitus","habitusului":"habitus","habitusuri":"habitus","habitusurile":"habitus","habitusurilor":"habitus","habotnice":"habotnică","habotnicei":"habotnică","habotnicele":"habotnică","habotnicelor":"habotnică","habotnici":"habotnic","habotnicia":"habotnicie","habotniciei":"habotnicie","habotnicii":["habotnicii","habotnic","habotnicii","habotnicie"],"habotniciile":"habotnicie","habotniciilor":"habotnicie","habotnicilor":"habotnic","habotnicul":"habotnic","habotnicule":"habotnic","habotnicului":"habotnic","habsburgica":["habsburgică","habsburgic","habsburgica","habsburgic"],"habsburgice":"habsburgic","habsburgicele":"habsburgic","habsburgici":"habsburgic","habsburgicii":"habsburgic","habsburgicul":"habsburgic","habucea":"hăbuci","habuceai":"hăbuci","habuceam":"hăbuci","habuceati":"hăbuci","habuceau":"hăbuci","habucesc":"hăbuci","habuceste":"hăbuci","habucesti":"hăbuci","habuci":"hăbuc","habucii":["hăbucii","hăbuc","hăbucii","hăbuci"],"habucilor":"hăbuc","habucim":"hăbuci","habucind":"hăbuci","habucira":"hăbuci","habuciram":"hăbuci","habucirati":"hăbuci","habucise":"hăbuci","habucisem":"hăbuci","habucisera":"hăbuci","habuciseram":"hăbuci","habuciserati":"hăbuci","habucisesi":"hăbuci","habucisi":"hăbuci","habucit":"hăbuci","habuciti":"hăbuci","habucul":"hăbuc","habucule":"hăbuc","habucului":"hăbuc","haciende":"haciendă","haciendei":"haciendă","haciendele":"haciendă","haciendelor":"haciendă","hackeri":"hacker","hackerii":"hacker","hackerilor":"hacker","hackerul":"hacker","hackerule":"hacker","hackerului":"hacker","hacuia":"hăcui","hacuiai":"hăcui","hacuiam":"hăcui","hacuiati":"hăcui","hacuiau":"hăcui","hacuiesc":"hăcui","hacuieste":"hăcui","hacuiesti":"hăcui","hacuii":"hăcui","hacuim":"hăcui","hacuind":"hăcui","hacuira":"hăcui","hacuiram":"hăcui","hacuirati":"hăcui","hacuirea":"hăcuire","hacuiri":"hăcuire","hacuirii":"hăcuire","hacuirile":"hăcuire","hacuirilor":"hăcuire","hacuise":"hăcui","hacuisem":"hăcui","hacuisera":"hăcui","hacuiseram":"hăcui","hacuiserati":"hăcui","hacuisesi":"hăcui","hacuisi":"hăcui","hacuit":"hăcui","hacuita":["hăcuită","hăcuit","hăcuita","hăcuit"],"hacuite":"hăcuit","hacuitele":"hăcuit","hacuiti":["hăcuiți","hăcui","hăcuiți","hăcuit"],"hacuitii":"hăcuit","hacuitul":"hăcuit","hadambi":"hadâmb","hadambii":"hadâmb","hadambilor":"hadâmb","hadambul":"hadâmb","hadambule":"hadâmb","hadambului":"hadâmb","hadami":"hadâm","hadamii":"hadâm","hadamilor":"hadâm","hadamul":"hadâm","hadamule":"hadâm","hadamului":"hadâm","hadaragi":"hadarag","hadaragii":"hadarag","hadaragilor":"hadarag","hadaragul":"hadarag","hadaragule":"hadarag","hadaragului":"hadarag","hadosenia":"hâdoșenie","hadoseniei":"hâdoșenie","hadosenii":"hâdoșenie","hadoseniile":"hâdoșenie","hadoseniilor":"hâdoșenie","hadroni":"hadron","hadronii":"hadron","hadronilor":"hadron","hadronul":"hadron","hadronule":"hadron","hadronului":"hadron","hadrozauri":"hadrozaur","hadrozaurii":"hadrozaur","hadrozaurilor":"hadrozaur","hadrozaurul":"hadrozaur","hadrozaurule":"hadrozaur","hadrozaurului":"hadrozaur","haduta":["hâduță","hâduț","hâduța","hâduț"],"hadute":"hâduț","hadutele":"hâduț","haduti":"hâduț","hadutii":"hâduț","hadutul":"hâduț","hafniul":"hafniu","hafniule":"hafniu","hafniului":"hafniu","hagauul":"hăgău","hagauule":"hăgău","hagauului":"hăgău","hagauuri":"hăgău","hagauurile":"hăgău","hagauurilor":"hăgău","hagemisul":"hagemiș","hagemisule":"hagemiș","hagemisului":"hagemiș","hagemisuri":"hagemiș","hagemisurile":"hagemiș","hagemisurilor":"hagemiș","hagialacul":"hagialâc","hagialacule":"hagialâc","hagialacului":"hagialâc","hagialacuri":"hagialâc","hagialacurile":"hagialâc","hagialacurilor":"hagialâc","hagii":"hagiu","hagiii":"hagiu","hagiilor":"hagiu","hagime":"hagimă","hagimei":"hagimă","hagimele":"hagimă","hagimelor":"hagimă","hagiografi":"hagiograf","hagiografia":"hagiografie","hagiografica":["hagiografică","hagiografic","hagiografica","hagiografic"],"hagiografice":"hagiografic","hagiograficele":"hagiografic","hagiografici":"hagiografic","hagiograficii":"hagiografic","hagiograficul":"hagiografic","hagiografiei":"hagiografie","hagiografii":["hagiografii","hagiograf","hagiografii","hagiografie"],"hagiografilor":"hagiograf","hagiograful":"hagiograf","hagiografule":"hagiograf","hagiografului":"hagiograf","hagiologia":"hagiologie","hagiologica":["hagiologică","hagiologic","hagiologica","hagiologic"],"hagiologice":"hagiologic","hagiologicele":"hagiologic","hagiologici":"hagiologic","hagiologicii":"hagiologic","hagiologicul":"hagiologic","hagiologiei":"hagiologie","hagiologii":"hagiologie","hagionime":"hagionim","hagionimele":"hagionim","hagionimelor":"hagionim","hagionimul":"hagionim","hagionimule":"hagionim","hagionimului":"hagionim","hagiul":"hagiu","hagiule":"hagiu","hagiului":"hagiu","hahalere":"hahaleră","hahalerei":"hahaleră","hahalerele":"hahaleră","hahalerelor":"hahaleră","hahami":"haham","hahamii":"haham","hahamilor":"haham","hahamul":"haham","hahamule":"haham","hahamului":"haham","haholi":"hahol","haia":"hâi","haiai":"hâi","haiam":"hâi","haiati":"hâi","haiau":"hâi","haida":"haide","haidai":"haidău","haidaii":"haidău","haidailor":"haidău","haidamaci":"haidamac","haidamacii":"haidamac","haidamacilor":"haidamac","haidamacul":"haidamac","haidamacule":"haidamac","haidamacului":"haidamac","haidaul":"haidău","haidaule":"haidău","haidaului":"haidău","haiduce":"haiducă","haiducea":"haiduci","haiduceai":"haiduci","haiduceam":"haiduci","haiduceasca":["haiducească","haiducesc","haiduceasca","haiducesc"],"haiduceati":"haiduci","haiduceau":"haiduci","haiducei":["haiducei","haiducă","haiducei","haiducel"],"haiducele":"haiducă","haiduceli":"haiducel","haiducelii":"haiducel","haiducelilor":"haiducel","haiducelor":"haiducă","haiducelul":"haiducel","haiducelule":"haiducel","haiducelului":"haiducel","haiducesc":"haiduci","haiducescul":"haiducesc","haiduceste":"haiduci","haiducesti":["haiducești","haiducesc","haiducești","haiduci"],"haiducestii":"haiducesc","haiducestile":"haiducesc","haiduci":"haiduc","haiducia":"haiducie","haiduciei":"haiducie","haiducii":["haiducii","haiduc","haiducii","haiduci","haiducii","haiducie"],"haiduciile":"haiducie","haiduciilor":"haiducie","haiducilor":"haiduc","haiducim":"haiduci","haiducimea":"haiducime","haiducimi":"haiducime","haiducimii":"haiducime","haiducimile":"haiducime","haiducimilor":"haiducime","haiducind":"haiduci","haiducira":"haiduci","haiduciram":"haiduci","haiducirati":"haiduci","haiducise":"haiduci","haiducisem":"haiduci","haiducisera":"haiduci","haiduciseram":"haiduci","haiduciserati":"haiduci","haiducisesi":"haiduci","haiducisi":"haiduci","haiducit":"haiduci","haiduciti":"haiduci","haiducul":"haiduc","haiducule":"haiduc","haiducului":"haiduc","haiesc":"hâi","haieste":"hâi","haiesti":"hâi","haieuul":"haieu","haieuule":"haieu","haieuului":"haieu","haieuuri":"haieu","haieuurile":"haieu","haieuurilor":"haieu","haihuia":"haihui","haihuie":"haihui","haihuiele":"haihui","haihuii":"haihui","haihuiul":"haihui","haii":"hâi","haikul":"haiku","haikule":"haiku","haikului":"haiku","haikuuri":"haiku","haikuurile":"haiku","haikuurilor":"haiku","hailaiful":"hailaif","hailaifule":"hailaif","hailaifului":"hailaif","haim":"hâi","haimanalacul":"haimanalâc","haimanalacule":"haimanalâc","haimanalacului":"haimanalâc","haimanalacuri":"haimanalâc","haimanalacurile":"haimanalâc","haimanalacurilor":"haimanalâc","haimanale":"haimana","haimanalei":"haimana","haimanalele":"haimana","haimanalelor":"haimana","haimanaua":"haimana","haina":["haină","hain","haina","hain"],"hainari":"hăinar","hainaria":"hăinărie","hainariei":"hăinărie","hainarii":["hăinarii","hăinar","hăinării","hăinărie"],"hainariile":"hăinărie","hainariilor":"hăinărie","hainarilor":"hăinar","hainarul":"hăinar","hainarule":"hăinar","hainarului":"hăinar","haind":"hâi","haine":["haine","hain","haine","haină"],"hainea":"hăini","haineai":"hăini","haineam":"hăini","haineana":["hăineană","hăinean","hăineana","hăinean"],"haineanul":"hăinean","haineati":"hăini","haineau":"hăini","hainei":"haină","hainele":["hainele","hain","hainele","haină"],"hainelor":"haină","hainene":"hăinean","hainenele":"hăinean","haineni":"hăinean","hainenii":"hăinean","hainesc":"hăini","haineste":"hăini","hainesti":"hăini","haini":"hain","hainia":"hainie","hainiceaua":"hăinicea","hainicele":"hăinicea","hainicelei":"hăinicea","hainicelele":"hăinicea","hainicelelor":"hăinicea","hainici":"hăinică","hainicii":"hăinică","hainicile":"hăinică","hainicilor":"hăinică","hainiei":"hainie","hainii":["hainii","hain","hăinii","hăini","hainii","hainie"],"hainiile":"hainie","hainiilor":"hainie","hainim":"hăini","hainind":"hăini","hainira":"hăini","hainiram":"hăini","hainirati":"hăini","hainise":"hăini","hainisem":"hăini","hainisera":"hăini","hainiseram":"hăini","hainiserati":"hăini","hainisesi":"hăini","hainisi":"hăini","hainisoare":"hăinișoară","hainisoarei":"hăinișoară","hainisoarele":"hăinișoară","hainisoarelor":"hăinișoară","hainit":"hăini","hainite":"hăiniță","hainitei":"hăiniță","hainitele":"hăiniță","hainitelor":"hăiniță","hainiti":"hăini","hainlacul":"hainlâc","hainlacule":"hainlâc","hainlacului":"hainlâc","hainlacuri":"hainlâc","hainlacurile":"hainlâc","hainlacurilor":"hainlâc","hainuci":"hăinucă","hainucii":"hăinucă","hainucile":"hăinucă","hainucilor":"hăinucă","hainul":"hain","hainute":"hăinuță","hainutei":"hăinuță","hainutele":"hăinuță","hainutelor":"hăinuță","haioasa":["haioasă","haios","haioasa","haios"],"haioase":"haios","haioasele":"haios","haiosi":"haios","haiosii":"haios","haiosul":"haios","haira":"hâi","hairam":"hâi","hairati":"hâi","hairul":"hair","hairule":"hair","hairului":"hair","hairuri":"hair","hairurile":"hair","hairurilor":"hair","haise":"hâi","haisem":"hâi","haisera":"hâi","haiseram":"hâi","haiserati":"hâi","haisesi":"hâi","haisi":"hâi","hait":"hâi","haita":["hâită","hâit","hâita","hâit","hăită","hăit","hăita","hăit"],"haitari":"hăitar","haitarii":"hăitar","haitarilor":"hăitar","haitarul":"hăitar","haitarule":"hăitar","haitarului":"hăitar","haitase":"hăitaș","haitasele":"hăitaș","haitaselor":"hăitaș","haitasul":"hăitaș","haitasule":"hăitaș","haitasului":"hăitaș","haite":["hâite","hâit","hăite","hăit","haite","haită"],"haitei":"haită","haitele":["hâitele","hâit","hăitele","hăit","haitele","haită"],"haitelor":"haită","haiti":["hâiți","hâi","hâiți","hâit","hăiți","hăit"],"haitiana":["haitiană","haitian","haitiana","haitian"],"haitiane":"haitiană","haitianul":"haitian","haitianule":"haitian","haitianului":"haitian","haiticul":"haitic","haiticule":"haitic","haiticului":"haitic","haiticuri":"haitic","haiticurile":"haitic","haiticurilor":"haitic","haitiene":["haitiene","haitian","haitiene","haitiană"],"haitienei":"haitiană","haitienele":["haitienele","haitian","haitienele","haitiană"],"haitienelor":"haitiană","haitieni":"haitian","haitienii":"haitian","haitienilor":"haitian","haitii":["hâiții","hâit","hăiții","hăit"],"haitosa":["haitoșă","haitoș","haitoșa","haitoș"],"haitose":"haitoș","haitosele":"haitoș","haitosi":"haitoș","haitosii":"haitoș","haitosul":"haitoș","haituia":"hăitui","haituiai":"hăitui","haituiam":"hăitui","haituiati":"hăitui","haituiau":"hăitui","haituieli":"hăituială","haituielii":"hăituială","haituielile":"hăituială","haituielilor":"hăituială","haituiesc":"hăitui","haituieste":"hăitui","haituiesti":"hăitui","haituii":"hăitui","haituim":"hăitui","haituind":"hăitui","haituira":"hăitui","haituiram":"hăitui","haituirati":"hăitui","haituise":"hăitui","haituisem":"hăitui","haituisera":"hăitui","haituiseram":"hăitui","haituiserati":"hăitui","haituisesi":"hăitui","haituisi":"hăitui","haituit":"hăitui","haituiti":"hăitui","haitul":["hâitul","hâit","hăitul","hăit"],"haituste":"hăitușcă","haitustei":"hăitușcă","haitustele":"hăitușcă","haitustelor":"hăitușcă","haitute":"hăituță","haitutei":"hăituță","haitutele":"hăituță","haitutelor":"hăituță","haizaselul":"haizășel","haizaselule":"haizășel","haizaselului":"haizășel","haizaseluri":"haizășel","haizaselurile":"haizășel","haizaselurilor":"haizășel","hajme":"hajmă","hajmei":"hajmă","hajmele":"hajmă","hajmelor":"hajmă","hajutul":"hâjuț","hajutule":"hâjuț","hajutului":"hâjuț","hajuturi":"hâjuț","hajuturile":"hâjuț","hajuturilor":"hâjuț","hakasie":"Hakasia","hakasiei":"Hakasia","hakasii":"Hakasia","halacaia":"hălăcăi","halacaiai":"hălăcăi","halacaiam":"hălăcăi","halacaiati":"hălăcăi","halacaiau":"hălăcăi","halacaie":"hălăcăi","halacaii":"hălăcăi","halacaim":"hălăcăi","halacaind":"hălăcăi","halacaira":"hălăcăi","halacairam":"hălăcăi","halacairati":"hălăcăi","halacaise":"hălăcăi","halacaisem":"hălăcăi","halacaisera":"hălăcăi","halacaiseram":"hălăcăi","halacaiserati":"hălăcăi","halacaisesi":"hălăcăi","halacaisi":"hălăcăi","halacait":"hălăcăi","halacaiti":"hălăcăi","halaciugi":"hălăciugă","halaciugii":"hălăciugă","halaciugile":"hălăciugă","halaciugilor":"hălăciugă","haladuinte":"hălăduință","haladuintei":"hălăduință","haladuintele":"hălăduință","haladuintelor":"hălăduință","halageaua":"halagea","halagele":"halagea","halagelei":"halagea","halagelele":"halagea","halagelelor":"halagea","halagia":"hălăgie","halagiei":"hălăgie","halagii":"hălăgie","halagiile":"hălăgie","halagiilor":"hălăgie","halaiul":"halai","halaiule":"halai","halaiului":"halai","halaiuri":"halai","halaiurile":"halai","halaiurilor":"halai","halaje":"halaj","halajele":"halaj","halajelor":"halaj","halajul":"halaj","halajule":"halaj","halajului":"halaj","halalai":["hălălăi","halalaie","hălălăi","hălălaie"],"halalaia":"hălălăi","halalaiai":"hălălăi","halalaiam":"hălălăi","halalaiati":"hălălăi","halalaiau":"hălălăi","halalaiea":["halalaiea","halalaie","hălălaiea","hălălaie"],"halalaiesc":"hălălăi","halalaieste":"hălălăi","halalaiesti":"hălălăi","halalaii":["hălălăii","hălălăi","hălălăii","halalaie","hălălăii","hălălaie"],"halalaile":["hălălăile","halalaie","hălălăile","hălălaie"],"halalailor":["hălălăilor","halalaie","hălălăilor","hălălaie"],"halalaim":"hălălăi","halalaind":"hălălăi","halalaira":"hălălăi","halalairam":"hălălăi","halalairati":"hălălăi","halalairea":"hălălăire","halalairi":"hălălăire","halalairii":"hălălăire","halalairile":"hălălăire","halalairilor":"hălălăire","halalaise":"hălălăi","halalaisem":"hălălăi","halalaisera":"hălălăi","halalaiseram":"hălălăi","halalaiserati":"hălălăi","halalaisesi":"hălălăi","halalaisi":"hălălăi","halalait":"hălălăi","halalaiti":"hălălăi","halaripi":"halarip","halaripii":"halarip","halaripilor":"halarip","halaripul":"halarip","halaripule":"halarip","halaripului":"halarip","halastance":"halastâncă","halastancei":"halastâncă","halate":"halat","halate de baie":"halat de baie","halatele":"halat","halatelor":"halat","halatul":"halat","halatule":"halat","halatului":"halat","halaul":"halău","halaule":"halău","halaului":"halău","halbe":"halbă","halbei":"halbă","halbele":"halbă","halbelor":"halbă","halbusoarele":"hâlbușoare","halbusoarelor":"hâlbușoare","halcale":"halca","halcalei":"halca","halcalele":"halca","halcalelor":"halca","halcalute":"hălcăluță","halcalutei":"hălcăluță","halcalutele":"hălcăluță","halcalutelor":"hălcăluță","halcateaua":"halcățea","halcatele":"halcățea","halcatelei":"halcățea","halcatelele":"halcățea","halcatelelor":"halcățea","halcaua":"halca","halci":"halcă","halcii":"halcă","halcile":"halcă","halcilor":"halcă","halcografia":"halcografie","halcografiei":"halcografie","halcografii":"halcografie","halcografiile":"halcografie","halcografiilor":"halcografie","halcute":"hălcuță","halcutei":"hălcuță","halcutele":"hălcuță","halcutelor":"hălcuță","haldanasi":"hăldănaș","haldanasii":"hăldănaș","haldanasilor":"hăldănaș","haldanasul":"hăldănaș","haldanasule":"hăldănaș","haldanasului":"hăldănaș","haldani":"hăldan","halde":"haldă","haldei":"haldă","haldele":"haldă","haldelor":"haldă","hale":"hală","halea":"hali","haleai":"hali","haleam":"hali","haleati":"hali","haleau":"hali","halebarde":"halebardă","halebardei":"halebardă","halebardele":"halebardă","halebardelor":"halebardă","halebardieri":"halebardier","halebardierii":"halebardier","halebardierilor":"halebardier","halebardierul":"halebardier","halebardierule":"halebardier","halebardierului":"halebardier","halei":"hală","halele":"hală","haleli":"haleală","halelii":"haleală","halelile":"haleală","halelilor":"haleală","halelor":"hală","halene":"halenă","halenei":"halenă","halesc":"hali","haleste":"hali","halesteute":"hăleșteuță","halesteutei":"hăleșteuță","halesteutele":"hăleșteuță","halesteutelor":"hăleșteuță","halesti":"hali","haleuul":"haleu","haleuule":"haleu","haleuului":"haleu","halicea":"halice","halicei":"halice","halicele":"halice","halicelor":"halice","haliciuri":"haliciu","haliciurile":"haliciu","haliciurilor":"haliciu","haliciuul":"haliciu","haliciuule":"haliciu","haliciuului":"haliciu","halieutica":["halieutică","halieutic","halieutica","halieutic"],"halieutice":["halieutice","halieutic","halieutice","halieutică"],"halieuticei":"halieutică","halieuticele":["halieuticele","halieutic","halieuticele","halieutică"],"halieuticelor":"halieutică","halieutici":"halieutic","halieuticii":"halieutic","halieuticul":"halieutic","halii":"hali","halim":"hali","halind":"hali","halira":"hali","haliram":"hali","halirati":"hali","halise":"hali","halisem":"hali","halisera":"hali","haliseram":"hali","haliserati":"hali","halisesi":"hali","halisi":"hali","halit":"hali","halite":"halit","halitele":"halit","halitelor":"halit","haliti":"hali","halitul":"halit","halitule":"halit","halitului":"halit","halloweenul":"Halloween","halloweenule":"Halloween","halloweenului":"Halloween","hallul":"hall","hallule":"hall","hallului":"hall","halluri":"hall","hallurile":"hall","hallurilor":"hall","halme":"hâlmă","halmei":"hâlmă","halmele":"hâlmă","halmelor":"hâlmă","halocromia":"halocromie","halocromiei":"halocromie","halocromii":"halocromie","halocromiile":"halocromie","halocromiilor":"halocromie","halofila":["halofilă","halofil","halofila","halofil"],"halofile":"halofil","halofilele":"halofil","halofili":"halofil","halofilii":"halofil","halofilul":"halofil","halofite":"halofită","halofitei":"halofită","halofitele":"halofită","halofitelor":"halofită","halogena":["halogenă","halogen","halogena","halogen"],"halogenai":"halogena","halogenam":["halogenăm","halogena","halogenam","halogena"],"halogenand":"halogena","halogenara":"halogena","halogenaram":"halogena","halogenarati":"halogena","halogenarea":"halogenare","halogenari":"halogenare","halogenarii":"halogenare","halogenarile":"halogenare","halogenarilor":"halogenare","halogenase":"halogena","halogenasem":"halogena","halogenasera":"halogena","halogenaseram":"halogena","halogenaserati":"halogena","halogenasesi":"halogena","halogenasi":"halogena","halogenat":"halogena","halogenati":"halogena","halogenatia":"halogenație","halogenatiei":"halogenație","halogenatii":"halogenație","halogenatiile":"halogenație","halogenatiilor":"halogenație","halogenau":"halogena","halogene":"halogen","halogeneaza":"halogena","halogenele":"halogen","halogenez":"halogena","halogenezi":"halogena","halogeni":"halogen","halogenii":"halogen","halogenul":"halogen","halogenuri":"halogenură","halogenurii":"halogenură","halogenurile":"halogenură","halogenurilor":"halogenură","halografia":"halografie","halografiei":"halografie","halografii":"halografie","halografiile":"halografie","halografiilor":"halografie","haloida":["haloidă","haloid","haloida","haloid"],"haloide":"haloid","haloidele":"haloid","haloidul":"haloid","haloizi":"haloid","haloizii":"haloid","haloizite":"haloizit","haloizitele":"haloizit","haloizitelor":"haloizit","haloizitul":"haloizit","haloizitule":"haloizit","haloizitului":"haloizit","halometre":"halometru","halometrele":"halometru","halometrelor":"halometru","halometrul":"halometru","halometrule":"halometru","halometrului":"halometru","halomorfa":["halomorfă","halomorf","halomorfa","halomorf"],"halomorfe":"halomorf","halomorfele":"halomorf","halomorfi":"halomorf","halomorfii":"halomorf","halomorful":"halomorf","halonul":"halon","halonule":"halon","halonului":"halon","halori":"halor","halorii":"halor","halorilor":"halor","halorul":"halor","halorule":"halor","halorului":"halor","haloul":["haloul","halo","haloul","halou"],"haloule":["haloule","halo","haloule","halou"],"haloului":["haloului","halo","haloului","halou"],"halouri":["halouri","halo","halouri","halou"],"halourile":["halourile","halo","halourile","halou"],"halourilor":["halourilor","halo","halourilor","halou"],"halpava":["hâlpavă","hâlpav","hâlpava","hâlpav"],"halpave":"hâlpav","halpavele":"hâlpav","halpavi":"hâlpav","halpavii":"hâlpav","halpavul":"hâlpav","halpova":["hâlpovă","hâlpov","hâlpova","hâlpov"],"halpove":"hâlpov","halpovele":"hâlpov","halpovi":"hâlpov","halpovii":"hâlpov","halpovul":"hâlpov","halte":"haltă","haltei":"haltă","haltele":"haltă","haltelor":"haltă","haltere":"halteră","halterei":"halteră","halterele":"halteră","halterelor":"halteră","halterofile":"halterofilă","halterofilei":"halterofilă","halterofilele":"halterofilă","halterofilelor":"halterofilă","halterofili":"halterofil","halterofilia":"halterofilie","halterofiliei":"halterofilie","halterofilii":["halterofilii","halterofil","halterofilii","halterofilie"],"halterofiliile":"halterofilie","halterofiliilor":"halterofilie","halterofililor":"halterofil","halterofilul":"halterofil","halterofilule":"halterofil","halterofilului":"halterofil","halube":"halubă","halubei":"halubă","halubele":"halubă","halubelor":"halubă","halucinai":"halucina","halucinam":["halucinăm","halucina","halucinam","halucina"],"halucinand":"halucina","halucinanta":["halucinantă","halucinant","halucinanta","halucinant"],"halucinante":"halucinant","halucinantele":"halucinant","halucinanti":"halucinant","halucinantii":"halucinant","halucinantul":"halucinant","halucinara":"halucina","halucinaram":"halucina","halucinarati":"halucina","halucinarea":"halucinare","halucinari":"halucinare","halucinarii":"halucinare","halucinarile":"halucinare","halucinarilor":"halucinare","halucinase":"halucina","halucinasem":"halucina","halucinasera":"halucina","halucinaseram":"halucina","halucinaserati":"halucina","halucinasesi":"halucina","halucinasi":"halucina","halucinat":"halucina","halucinate":"halucinată","halucinatei":"halucinată","halucinatele":"halucinată","halucinatelor":"halucinată","halucinati":["halucinați","halucina","halucinați","halucinat"],"halucinatia":"halucinație","halucinatiei":"halucinație","halucinatii":["halucinații","halucinat","halucinații","halucinație"],"halucinatiile":"halucinație","halucinatiilor":"halucinație","halucinatilor":"halucinat","halucinatiunea":"halucinațiune","halucinatiuni":"halucinațiune","halucinatiunii":"halucinațiune","halucinatiunile":"halucinațiune","halucinatiunilor":"halucinațiune","halucinatoria":"halucinatoriu","halucinatorie":"halucinatoriu","halucinatorii":"halucinatoriu","halucinatoriii":"halucinatoriu","halucinatoriile":"halucinatoriu","halucinatoriul":"halucinatoriu","halucinatul":"halucinat","halucinatule":"halucinat","halucinatului":"halucinat","halucinau":"halucina","halucineaza":"halucina","halucinez":"halucina","halucinezi":"halucina","halucinogena":["halucinogenă","halucinogen","halucinogena","halucinogen"],"halucinogene":"halucinogen","halucinogenele":"halucinogen","halucinogenelor":"halucinogen","halucinogeni":"halucinogen","halucinogenii":"halucinogen","halucinogenul":"halucinogen","halucinogenule":"halucinogen","halucinogenului":"halucinogen","halucinoze":"halucinoză","halucinozei":"halucinoză","halucinozele":"halucinoză","halucinozelor":"halucinoză","halul":"hal","halule":"hal","halului":"hal","halusce":"halușcă","haluscei":"halușcă","haluscele":"halușcă","haluscelor":"halușcă","halvageria":"halvagerie","halvageriei":"halvagerie","halvagerii":"halvagerie","halvageriile":"halvagerie","halvageriilor":"halvagerie","halvagii":"halvagiu","halvagiii":"halvagiu","halvagiilor":"halvagiu","halvagiul":"halvagiu","halvagiule":"halvagiu","halvagiului":"halvagiu","halvale":"halva","halvalei":"halva","halvalele":"halva","halvalelor":"halva","halvaua":"halva","halvetul":"halvet","halvetule":"halvet","halvetului":"halvet","halveturi":"halvet","halveturile":"halvet","halveturilor":"halvet","halvitari":"halvițar","halvitarii":"halvițar","halvitarilor":"halvițar","halvitarul":"halvițar","halvitarule":"halvițar","halvitarului":"halvițar","halvite":"halviță","halvitei":"halviță","halvitele":"halviță","halvitelor":"halviță","ham!":"ham","hamacul":"hamac","hamacule":"hamac","hamacului":"hamac","hamacuri":"hamac","hamacurile":"hamac","hamacurilor":"hamac","hamade":"hamadă","hamadei":"hamadă","hamadele":"hamadă","hamadelor":"hamadă","hamadriade":"hamadriadă","hamadriadei":"hamadriadă","hamadriadele":"hamadriadă","hamadriadelor":"hamadriadă","hamaia":["hâmâia","hâmâi","hămăia","hămăi"],"hamaiai":["hâmâiai","hâmâi","hămăiai","hămăi"],"hamaiam":["hâmâiam","hâmâi","hămăiam","hămăi"],"hamaiati":["hâmâiați","hâmâi","hămăiați","hămăi"],"hamaiau":["hâmâiau","hâmâi","hămăiau","hămăi"],"hamaie":["hâmâie","hâmâi","hămăie","hămăi"],"hamaieli":"hămăială","hamaielii":"hămăială","hamaielile":"hămăială","hamaielilor":"hămăială","hamaii":["hâmâii","hâmâi","hămăii","hămăi"],"hamailaie":"hămailâu","hamailaiele":"hămailâu","hamailaielor":"hămailâu","hamailauul":"hămailâu","hamailauule":"hămailâu","hamailauului":"hămailâu","hamaim":["hâmâim","hâmâi","hămăim","hămăi"],"hamaind":["hâmâind","hâmâi","hămăind","hămăi"],"hamaira":["hâmâiră","hâmâi","hămăiră","hămăi"],"hamairam":["hâmâirăm","hâmâi","hămăirăm","hămăi"],"hamairati":["hâmâirăți","hâmâi","hămăirăți","hămăi"],"hamaise":["hâmâise","hâmâi","hămăise","hămăi"],"hamaisem":["hâmâisem","hâmâi","hămăisem","hămăi"],"hamaisera":["hâmâiseră","hâmâi","hămăiseră","hămăi"],"hamaiseram":["hâmâiserăm","hâmâi","hămăiserăm","hămăi"],"hamaiserati":["hâmâiserăți","hâmâi","hămăiserăți","hămăi"],"hamaisesi":["hâmâiseși","hâmâi","hămăiseși","hămăi"],"hamaisi":["hâmâiși","hâmâi","hămăiși","hămăi"],"hamait":["hâmâit","hâmâi","hămăit","hămăi"],"hamaiti":["hâmâiți","hâmâi","hămăiți","hămăi"],"hamaitul":"hămăit","hamaitule":"hămăit","hamaitului":"hămăit","hamaiture":"hămăitură","hamaiturei":"hămăitură","hamaiturele":"hămăitură","hamaiturelor":"hămăitură","hamaituri":["hămăituri","hămăit","hămăituri","hămăitură"],"hamaiturile":"hămăit","hamaiturilor":"hămăit","hamalacul":"hamalâc","hamalacule":"hamalâc","hamalacului":"hamalâc","hamalacuri":"hamalâc","hamalacurile":"hamalâc","hamalacurilor":"hamalâc","hamali":"hamal","hamalii":"hamal","hamalilor":"hamal","hamalul":"hamal","hamalule":"hamal","hamalului":"hamal","hamamelisul":"hamamelis","hamamelisule":"hamamelis","hamamelisului":"hamamelis","hamani":"hamân","hamanii":"hamân","hamanilor":"hamân","hamanul":"hamân","hamanule":"hamân","hamanului":"hamân","hambacul":"hambac","hambacule":"hambac","hambacului":"hambac","hambacuri":"hambac","hambacurile":"hambac","hambacurilor":"hambac","hambarase":"hămbăraș","hambarasele":"hămbăraș","hambaraselor":"hămbăraș","hambarasul":"hămbăraș","hambarasule":"hămbăraș","hambarasului":"hămbăraș","hambare":"hambar","hambarele":"hambar","hambarelor":"hambar","hambarul":"hambar","hambarule":"hambar","hambarului":"hambar","hamburgeri":"hamburger","hamburgerii":"hamburger","hamburgerilor":"hamburger","hamburgerul":"hamburger","hamburgerule":"hamburger","hamburgerului":"hamburger","hameirea":"hămeire","hameiri":"hămeire","hameirii":"hămeire","hameirile":"hămeire","hameirilor":"hămeire","hameiul":["hameiul","hamei","hămeiul","hămei"],"hameiule":["hameiule","hamei","hămeiule","hămei"],"hameiului":["hameiului","hamei","hămeiului","hămei"],"hamesea":"hămesi","hameseai":"hămesi","hameseam":"hămesi","hameseati":"hămesi","hameseau":"hămesi","hamesesc":"hămesi","hameseste":"hămesi","hamesesti":"hămesi","hamesia":"hămesie","hamesiei":"hămesie","hamesii":["hămesii","hămesi","hămesii","hămesie"],"hamesiile":"hămesie","hamesiilor":"hămesie","hamesim":"hămesi","hamesind":"hămesi","hamesira":"hămesi","hamesiram":"hămesi","hamesirati":"hămesi","hamesise":"hămesi","hamesisem":"hămesi","hamesisera":"hămesi","hamesiseram":"hămesi","hamesiserati":"hămesi","hamesisesi":"hămesi","hamesisi":"hămesi","hamesit":"hămesi","hamesita":["hămesită","hămesit","hămesita","hămesit"],"hamesite":"hămesit","hamesitele":"hămesit","hamesiti":["hămesiți","hămesi","hămesiți","hămesit"],"hamesitii":"hămesit","hamesitul":"hămesit","hamgere":"hamger","hamis":"hămisi","hamisa":["hamișă","hamiș","hamișa","hamiș"],"hamisagul":"hămișag","hamisagule":"hămișag","hamisagului":"hămișag","hamisaguri":"hămișag","hamisagurile":"hămișag","hamisagurilor":"hămișag","hamise":["hamișe","hamiș","hămise","hămisi"],"hamisea":"hămisi","hamiseai":"hămisi","hamiseam":"hămisi","hamiseati":"hămisi","hamiseau":"hămisi","hamisele":["hamișele","hamiș","hămisele","hămiseală"],"hamiselei":"hămiseală","hamiselele":"hămiseală","hamiselelor":"hămiseală","hamiseli":"hămiseală","hamiseste":"hămisi","hamisi":"hamiș","hamisii":["hamișii","hamiș","hămisii","hămisi"],"hamisim":"hămisi","hamisind":"hămisi","hamisira":"hămisi","hamisiram":"hămisi","hamisirati":"hămisi","hamisise":"hămisi","hamisisem":"hămisi","hamisisera":"hămisi","hamisiseram":"hămisi","hamisiserati":"hămisi","hamisisesi":"hămisi","hamisisi":"hămisi","hamisit":"hămisi","hamisita":["hămisită","hămisit","hămisita","hămisit"],"hamisite":"hămisit","hamisitele":"hămisit","hamisiti":["hămisiți","hămisi","hămisiți","hămisit"],"hamisitii":"hămisit","hamisitul":"hămisit","hamisul":"hamiș","hamite":"hamită","hamitei":"hamită","hamitele":"hamită","hamitelor":"hamită","hamiti":"hamit","hamitica":["hamitică","hamitic","hamitica","hamitic"],"hamitice":"hamitic","hamiticele":"hamitic","hamitici":"hamitic","hamiticii":"hamitic","hamiticul":"hamitic","hamitii":"hamit","hamitilor":"hamit","hamito-semitica":["hamito-semitică","hamito-semitic","hamito-semitica","hamito-semitic"],"hamito-semitice":["hamito-semitice","hamito-semitic","hamito-semitice","hamito-semitică"],"hamito-semiticei":"hamito-semitică","hamito-semiticele":["hamito-semiticele","hamito-semitic","hamito-semiticele","hamito-semitică"],"hamito-semiticelor":"hamito-semitică","hamito-semitici":"hamito-semitic","hamito-semiticii":"hamito-semitic","hamito-semiticul":"hamito-semitic","hamitul":"hamit","hamitule":"hamit","hamitului":"hamit","hamletizai":"hamletiza","hamletizam":["hamletizăm","hamletiza","hamletizam","hamletiza"],"hamletizand":"hamletiza","hamletizara":"hamletiza","hamletizaram":"hamletiza","hamletizarati":"hamletiza","hamletizase":"hamletiza","hamletizasem":"hamletiza","hamletizasera":"hamletiza","hamletizaseram":"hamletiza","hamletizaserati":"hamletiza","hamletizasesi":"hamletiza","hamletizasi":"hamletiza","hamletizat":"hamletiza","hamletizati":"hamletiza","hamletizau":"hamletiza","hamletizeaza":"hamletiza","hamletizez":"hamletiza","hamletizezi":"hamletiza","hamnere":"hamner","hamnerele":"hamner","hamnerelor":"hamner","hamnerul":"hamner","hamnerule":"hamner","hamnerului":"hamner","hamsia":"hamsie","hamsiei":"hamsie","hamsii":"hamsie","hamsiile":"hamsie","hamsiilor":"hamsie","hamsteri":"hamster","hamsterii":"hamster","hamsterilor":"hamster","hamsterul":"hamster","hamsterule":"hamster","hamsterului":"hamster","hamuce":"hămucă","hamucei":"hămucă","hamucele":"hămucă","hamucelor":"hămucă","hamuia":"hămui","hamuiai":"hămui","hamuiam":"hămui","hamuiati":"hămui","hamuiau":"hămui","hamuiesc":"hămui","hamuieste":"hămui","hamuiesti":"hămui","hamuii":"hămui","hamuim":"hămui","hamuind":"hămui","hamuira":"hămui","hamuiram":"hămui","hamuirati":"hămui","hamuise":"hămui","hamuisem":"hămui","hamuisera":"hămui","hamuiseram":"hămui","hamuiserati":"hămui","hamuisesi":"hămui","hamuisi":"hămui","hamuit":"hămui","hamuiti":"hămui","hamul":"ham","hamule":"ham","hamului":"ham","hamuri":"ham","hamurile":"ham","hamurilor":"ham","hamusele":"hămușală","hamuselei":"hămușală","hamuselele":"hămușală","hamuselelor":"hămușală","hamuseli":"hămușală","hamutul":"hamut","hamutule":"hamut","hamutului":"hamut","hamuturi":"hamut","hamuturile":"hamut","hamuturilor":"hamut","hamzai":"hamzău","hamzaii":"hamzău","hamzailor":"hamzău","hamzauul":"hamzău","hamzauule":"hamzău","hamzauului":"hamzău","haname":"hanâmă","hanamei":"hanâmă","hanamele":"hanâmă","hanamelor":"hanâmă","hanapul":"hanap","hanapule":"hanap","hanapului":"hanap","hanatul":"hanat","hanatule":"hanat","hanatului":"hanat","hanaturi":"hanat","hanaturile":"hanat","hanaturilor":"hanat","handbaliste":"handbalistă","handbalistei":"handbalistă","handbalistele":"handbalistă","handbalistelor":"handbalistă","handbalisti":["handbaliști","handbalist","handbalisti","handbalist"],"handbalistica":["handbalistică","handbalistic","handbalistica","handbalistic"],"handbalistice":"handbalistic","handbalisticele":"handbalistic","handbalistici":"handbalistic","handbalisticii":"handbalistic","handbalisticul":"handbalistic","handbalistii":"handbalist","handbalistilor":"handbalist","handbalistul":"handbalist","handbalistule":"handbalist","handbalistului":"handbalist","handbalul":"handbal","handbalule":"handbal","handbalului":"handbal","handicapai":"handicapa","handicapam":["handicapăm","handicapa","handicapam","handicapa"],"handicapand":"handicapa","handicapara":"handicapa","handicaparam":"handicapa","handicaparati":"handicapa","handicaparea":"handicapare","handicapari":"handicapare","handicaparii":"handicapare","handicaparile":"handicapare","handicaparilor":"handicapare","handicapase":"handicapa","handicapasem":"handicapa","handicapasera":"handicapa","handicapaseram":"handicapa","handicapaserati":"handicapa","handicapasesi":"handicapa","handicapasi":"handicapa","handicapat":"handicapa","handicapate":"handicapată","handicapatei":"handicapată","handicapatele":"handicapată","handicapatelor":"handicapată","handicapati":["handicapați","handicapa","handicapați","handicapat"],"handicapatii":"handicapat","handicapatilor":"handicapat","handicapatul":"handicapat","handicapatule":"handicapat","handicapatului":"handicapat","handicapau":"handicapa","handicapeaza":"handicapa","handicapez":"handicapa","handicapezi":"handicapa","handicapul":"handicap","handicapule":"handicap","handicapului":"handicap","handicapuri":"handicap","handicapurile":"handicap","handicapurilor":"handicap","handichiul":"hândichi","handichiule":"hândichi","handichiului":"hândichi","handichiuri":"hândichi","handichiurile":"hândichi","handichiurilor":"hândichi","handlingul":"handling","handlingule":"handling","handlingului":"handling","handralai":["handralăi","handralău","hăndrălăi","hăndrălău"],"handralaii":["handralăii","handralău","hăndrălăii","hăndrălău"],"handralailor":["handralăilor","handralău","hăndrălăilor","hăndrălău"],"handralauul":["handralăuul","handralău","hăndrălăuul","hăndrălău"],"handralauule":["handralăuule","handralău","hăndrălăuule","hăndrălău"],"handralauului":["handralăuului","handralău","hăndrălăuului","hăndrălău"],"handraleti":"handraleț","handraletii":"handraleț","handraletilor":"handraleț","handraletul":"handraleț","handraletule":"handraleț","handraletului":"handraleț","hangai":"hangău","hangaii":"hangău","hangailor":"hangău","hangare":"hangar","hangarele":"hangar","hangarelor":"hangar","hangarul":"hangar","hangarule":"hangar","hangarului":"hangar","hangauul":"hangău","hangauule":"hangău","hangauului":"hangău","hangere":"hanger","hangerele":"hanger","hangerelor":"hanger","hangerul":"hanger","hangerule":"hanger","hangerului":"hanger","hangherase":"hăngheraș","hangherasei":"hăngheraș","hangheraselor":"hăngheraș","hangherasul":"hăngheraș","hangherasule":"hăngheraș","hangherasului":"hăngheraș","hangii":"hangiu","hangiii":"hangiu","hangiilor":"hangiu","hangioace":"hangioacă","hangioacei":"hangioacă","hangioacele":"hangioacă","hangioacelor":"hangioacă","hangioaice":"hangioaică","hangioaicei":"hangioaică","hangioaicele":"hangioaică","hangioaicelor":"hangioaică","hangite":"hangiță","hangitei":"hangiță","hangitele":"hangiță","hangitelor":"hangiță","hangiul":"hangiu","hangiule":"hangiu","hangiului":"hangiu","hania":"hănie","haniei":"hănie","hanii":"hănie","haniile":"hănie","haniilor":"hănie","hanlacul":"hanlâc","hanlacule":"hanlâc","hanlacului":"hanlâc","hanlacuri":"hanlâc","hanlacurile":"hanlâc","hanlacurilor":"hanlâc","hanorace":"hanorac","hanoracele":"hanorac","hanoracelor":"hanorac","hanoracul":"hanorac","hanoracule":"hanorac","hanoracului":"hanorac","hansari":"hânsar","hansarii":"hânsar","hansarilor":"hânsar","hansarul":"hânsar","hansarule":"hânsar","hansarului":"hânsar","hanse":"hansă","hanseatica":["hanseatică","hanseatic","hanseatica","hanseatic"],"hanseatice":"hanseatic","hanseaticele":"hanseatic","hanseatici":"hanseatic","hanseaticii":"hanseatic","hanseaticul":"hanseatic","hansei":"hansă","hansele":"hansă","hanselor":"hansă","hante":"hanță","hantei":"hanță","hantele":["hanțele","hanță","hantele","hantelă"],"hantelei":"hantelă","hantelele":"hantelă","hantelelor":"hantelă","hantelor":"hanță","hanul":"han","hanule":"han","hanului":"han","hanuri":"han","hanurile":"han","hanurilor":"han","hanusi":"hanus","hanusii":"hanus","hanusilor":"hanus","hanusul":"hanus","hanusule":"hanus","hanusului":"hanus","haosul":"haos","haosule":"haos","haosului":"haos","haosuri":"haos","haosurile":"haos","haosurilor":"haos","haotica":["haotică","haotic","haotica","haotic"],"haotice":"haotic","haoticele":"haotic","haotici":"haotic","haoticii":"haotic","haoticul":"haotic","hapaia":"hăpăi","hapaiai":"hăpăi","hapaiam":"hăpăi","hapaiati":"hăpăi","hapaiau":"hăpăi","hapaiesc":"hăpăi","hapaieste":"hăpăi","hapaiesti":"hăpăi","hapaii":"hăpăi","hapaim":"hăpăi","hapaind":"hăpăi","hapaira":"hăpăi","hapairam":"hăpăi","hapairati":"hăpăi","hapaise":"hăpăi","hapaisem":"hăpăi","hapaisera":"hăpăi","hapaiseram":"hăpăi","hapaiserati":"hăpăi","hapaisesi":"hăpăi","hapaisi":"hăpăi","hapait":"hăpăi","hapaiti":"hăpăi","hapalige":"hăpălig","hapaligele":"hăpălig","hapaligelor":"hăpălig","hapaligul":"hăpălig","hapaligule":"hăpălig","hapaligului":"hăpălig","hapci":"hapcă","hapcii":"hapcă","hapcile":"hapcă","hapcilor":"hapcă","hapleaua":"haplea","haplele":"haplea","haplelei":"haplea","hapleul":"haple","hapleule":"haple","hapleului":"haple","haplofaze":"haplofază","haplofazei":"haplofază","haplofazele":"haplofază","haplofazelor":"haplofază","haploida":["haploidă","haploid","haploida","haploid"],"haploide":"haploid","haploidele":"haploid","haploidia":"haploidie","haploidiei":"haploidie","haploidii":"haploidie","haploidiile":"haploidie","haploidiilor":"haploidie","haploidul":"haploid","haploizi":"haploid","haploizii":"haploid","haplologia":"haplologie","haplologiei":"haplologie","haplologii":"haplologie","haplologiile":"haplologie","haplologiilor":"haplologie","haploze":"haploză","haplozei":"haploză","happeningul":"happening","happeningule":"happening","happeningului":"happening","happeninguri":"happening","happeningurile":"happening","happeningurilor":"happening","hapsana":["hapsână","hapsân","hapsâna","hapsân"],"hapsane":"hapsân","hapsanele":"hapsân","hapsani":"hapsân","hapsanii":"hapsân","hapsanul":"hapsân","hapsina":["hapsină","hapsin","hapsina","hapsin"],"hapsine":"hapsin","hapsinele":"hapsin","hapsini":"hapsin","hapsinii":"hapsin","hapsinul":"hapsin","hapucul":"hapuc","hapucule":"hapuc","hapucului":"hapuc","hapucuri":"hapuc","hapucurile":"hapuc","hapucurilor":"hapuc","hapul":"hap","hapule":"hap","hapului":"hap","hapuri":"hap","hapurile":"hap","hapurilor":"hap","hapuschiul":"hapușchi","hapuschiule":"hapușchi","hapuschiului":"hapușchi","harababuri":"harababură","harababurii":"harababură","harababurile":"harababură","harababurilor":"harababură","harabagia":"harabagie","harabagiei":"harabagie","harabagii":["harabagii","harabagie","harabagii","harabagiu"],"harabagiii":"harabagiu","harabagiile":"harabagie","harabagiilor":["harabagiilor","harabagie","harabagiilor","harabagiu"],"harabagilacul":"harabagilâc","harabagilacule":"harabagilâc","harabagilacului":"harabagilâc","harabagilacuri":"harabagilâc","harabagilacurile":"harabagilâc","harabagilacurilor":"harabagilâc","harabagiul":"harabagiu","harabagiule":"harabagiu","harabagiului":"harabagiu","harabai":"harabaie","harabaiea":"harabaie","harabaii":"harabaie","harabaile":"harabaie","harabailor":"harabaie","harabale":"haraba","harabalei":"haraba","harabalele":"haraba","harabalelor":"haraba","harabaua":"haraba","harabusce":"hărăbușcă","harabuscei":"hărăbușcă","haracea":"hărăci","haraceai":"hărăci","haraceale":"hărăceală","haracealei":"hărăceală","haraceam":"hărăci","haraceati":"hărăci","haraceau":"hărăci","haraceli":"hărăceală","haracesc":"hărăci","haraceste":"hărăci","haracesti":"hărăci","harachiriul":"harachiri","harachiriule":"harachiri","harachiriului":"harachiri","haraci":"harac","haracii":"hărăci","haracim":"hărăci","haracind":"hărăci","haracira":"hărăci","haraciram":"hărăci","haracirati":"hărăci","haracise":"hărăci","haracisem":"hărăci","haracisera":"hărăci","haraciseram":"hărăci","haraciserati":"hărăci","haracisesi":"hărăci","haracisi":"hărăci","haracit":"hărăci","haraciti":"hărăci","haracitul":"hărăcit","haracitule":"hărăcit","haracitului":"hărăcit","haraciul":"haraci","haraciule":"haraci","haraciului":"haraci","haraciuri":"haraci","haraciurile":"haraci","haraciurilor":"haraci","haracsea":"hărăcsi","haracseai":"hărăcsi","haracseam":"hărăcsi","haracseati":"hărăcsi","haracseau":"hărăcsi","haracsesc":"hărăcsi","haracseste":"hărăcsi","haracsesti":"hărăcsi","haracsii":"hărăcsi","haracsim":"hărăcsi","haracsind":"hărăcsi","haracsira":"hărăcsi","haracsiram":"hărăcsi","haracsirati":"hărăcsi","haracsise":"hărăcsi","haracsisem":"hărăcsi","haracsisera":"hărăcsi","haracsiseram":"hărăcsi","haracsiserati":"hărăcsi","haracsisesi":"hărăcsi","haracsisi":"hărăcsi","haracsit":"hărăcsi","haracsiti":"hărăcsi","haractirul":"haractir","haractirule":"haractir","haractirului":"haractir","haractiruri":"haractir","haractirurile":"haractir","haractirurilor":"haractir","haragea":"hărăgi","harageai":"hărăgi","harageam":"hărăgi","harageati":"hărăgi","harageau":"hărăgi","haragesc":"hărăgi","harageste":"hărăgi","haragesti":"hărăgi","haragi":"harag","haragii":"hărăgi","haragim":"hărăgi","haragind":"hărăgi","haragira":"hărăgi","haragiram":"hărăgi","haragirati":"hărăgi","haragise":"hărăgi","haragisem":"hărăgi","haragisera":"hărăgi","haragiseram":"hărăgi","haragiserati":"hărăgi","haragisesi":"hărăgi","haragisi":"hărăgi","haragit":"hărăgi","haragiti":"hărăgi","haragitul":"hărăgit","haragitule":"hărăgit","haragitului":"hărăgit","harai":["hârăi","hârău","hărăi","hărău"],"haraia":"hârâi","haraiai":"hârâi","haraiam":"hârâi","haraiati":"hârâi","haraiau":"hârâi","haraie":"hârâi","haraieli":"hârâială","haraielii":"hârâială","haraielile":"hârâială","haraielilor":"hârâială","haraii":["hârâii","hârâi","hârăii","hârău","hărăii","hărău"],"harailor":["hârăilor","hârău","hărăilor","hărău"],"haraim":"hârâi","haraind":"hârâi","haraira":"hârâi","harairam":"hârâi","harairati":"hârâi","haraise":"hârâi","haraisem":"hârâi","haraisera":"hârâi","haraiseram":"hârâi","haraiserati":"hârâi","haraisesi":"hârâi","haraisi":"hârâi","harait":"hârâi","haraiti":"hârâi","haraituri":"hârâitură","haraiturii":"hârâitură","haraiturile":"hârâitură","haraiturilor":"hârâitură","harambasaul":"harambașă","harambasaule":"harambașă","harambasaului":"harambașă","harambasi":"harambașă","harambasii":"harambașă","harambasilor":"harambașă","haramgii":"haramgiu","haramgiii":"haramgiu","haramgiilor":"haramgiu","haramgiuul":"haramgiu","haramgiuule":"haramgiu","haramgiuului":"haramgiu","haramini":"haramin","haraminii":"haramin","haraminilor":"haramin","haraminul":"haramin","haraminule":"haramin","haraminului":"haramin","haramnini":"haramnin","haramninii":"haramnin","haramninilor":"haramnin","haramninul":"haramnin","haramninule":"haramnin","haramninului":"haramnin","haramul":"haram","haramule":"haram","haramului":"haram","haramuri":"haram","haramurile":"haram","haramurilor":"haram","haranea":"hărăni","haraneai":"hărăni","haraneam":"hărăni","haraneati":"hărăni","haraneau":"hărăni","haranesc":"hărăni","haraneste":"hărăni","haranesti":"hărăni","harangazai":"hărăngăzău","harangazaii":"hărăngăzău","harangazailor":"hărăngăzău","harangazauul":"hărăngăzău","harangazauule":"hărăngăzău","harangazauului":"hărăngăzău","harangei":"hărăngel","harangeii":"hărăngel","harangeilor":"hărăngel","harangelul":"hărăngel","harangelule":"hărăngel","harangelului":"hărăngel","harangi":"harang","harangile":"harang","harangilor":"harang","harangul":"harang","harangule":"harang","harangului":"harang","haranii":"hărăni","haranim":"hărăni","haranind":"hărăni","haranira":"hărăni","haraniram":"hărăni","haranirati":"hărăni","haranise":"hărăni","haranisem":"hărăni","haranisera":"hărăni","haraniseram":"hărăni","haraniserati":"hărăni","haranisesi":"hărăni","haranisi":"hărăni","haranit":"hărăni","haraniti":"hărăni","haraoaia":"hărăoaie","haraoaiei":"hărăoaie","haraoaii":"hărăoaie","harapi":"harap","haratagul":"hărățag","haratagule":"hărățag","haratagului":"hărățag","harataguri":"hărățag","haratagurile":"hărățag","haratagurilor":"hărățag","haratele":"hărățeală","haratelei":"hărățeală","haratelele":"hărățeală","haratelelor":"hărățeală","harateli":"hărățeală","haratia":"hărăție","haratiei":"hărăție","haratii":"hărăție","harauul":["hârăuul","hârău","hărăuul","hărău"],"harauule":["hârăuule","hârău","hărăuule","hărău"],"harauului":["hârăuului","hârău","hărăuului","hărău"],"harazea":"hărăzi","harazeai":"hărăzi","harazeam":"hărăzi","harazeati":"hărăzi","harazeau":"hărăzi","harazele":"hărăzeală","harazelei":"hărăzeală","harazelele":"hărăzeală","harazelelor":"hărăzeală","harazeli":"hărăzeală","harazesc":"hărăzi","harazeste":"hărăzi","harazesti":"hărăzi","harazii":"hărăzi","harazim":"hărăzi","harazind":"hărăzi","harazira":"hărăzi","haraziram":"hărăzi","harazirati":"hărăzi","harazirea":"hărăzire","haraziri":"hărăzire","harazirii":"hărăzire","harazirile":"hărăzire","harazirilor":"hărăzire","harazise":"hărăzi","harazisem":"hărăzi","harazisera":"hărăzi","haraziseram":"hărăzi","haraziserati":"hărăzi","harazisesi":"hărăzi","harazisi":"hărăzi","harazit":"hărăzi","harazita":["hărăzită","hărăzit","hărăzita","hărăzit"],"harazite":"hărăzit","harazitele":"hărăzit","haraziti":["hărăziți","hărăzi","hărăziți","hărăzit"],"harazitii":"hărăzit","harazitul":"hărăzit","harbara":["hârbară","hârbar","hârbara","hârbar"],"harbare":"hârbar","harbarele":"hârbar","harbari":"hârbar","harbarii":"hârbar","harbarul":"hârbar","harboaie":"hârboi","harboaiele":"hârboi","harboaielor":"hârboi","harboiul":"hârboi","harboiule":"hârboi","harboiului":"hârboi","harbuia":"hârbui","harbuiai":"hârbui","harbuiam":"hârbui","harbuiati":"hârbui","harbuiau":"hârbui","harbuiesc":"hârbui","harbuieste":"hârbui","harbuiesti":"hârbui","harbuii":"hârbui","harbuim":"hârbui","harbuind":"hârbui","harbuira":"hârbui","harbuiram":"hârbui","harbuirati":"hârbui","harbuirea":"hârbuire","harbuiri":"hârbuire","harbuirii":"hârbuire","harbuirile":"hârbuire","harbuirilor":"hârbuire","harbuise":"hârbui","harbuisem":"hârbui","harbuisera":"hârbui","harbuiseram":"hârbui","harbuiserati":"hârbui","harbuisesi":"hârbui","harbuisi":"hârbui","harbuit":"hârbui","harbuiti":"hârbui","harbujei":"harbujel","harbujeii":"harbujel","harbujeilor":"harbujel","harbujelul":"harbujel","harbujelule":"harbujel","harbujelului":"harbujel","harbuji":"harbuz","harbujii":"harbuz","harbujilor":"harbuz","harbul":"hârb","harbule":"hârb","harbului":"hârb","harburi":"hârb","harburile":"hârb","harburilor":"hârb","harbusoare":"hârbușor","harbusoarele":"hârbușor","harbusoarelor":"hârbușor","harbusorul":"hârbușor","harbusorule":"hârbușor","harbusorului":"hârbușor","harbute":"hârbuț","harbutele":"hârbuț","harbutelor":"hârbuț","harbutul":"hârbuț","harbutule":"hârbuț","harbutului":"hârbuț","harbuzaria":"harbuzărie","harbuzariei":"harbuzărie","harbuzarii":"harbuzărie","harbuzariile":"harbuzărie","harbuzariilor":"harbuzărie","harbuzul":"harbuz","harbuzule":"harbuz","harbuzului":"harbuz","harcaia":"hârcăi","harcaiai":"hârcăi","harcaiam":"hârcăi","harcaiati":"hârcăi","harcaiau":"hârcăi","harcaie":"hârcăi","harcaii":"hârcăi","harcaim":"hârcăi","harcaind":"hârcăi","harcaira":"hârcăi","harcairam":"hârcăi","harcairati":"hârcăi","harcaise":"hârcăi","harcaisem":"hârcăi","harcaisera":"hârcăi","harcaiseram":"hârcăi","harcaiserati":"hârcăi","harcaisesi":"hârcăi","harcaisi":"hârcăi","harcait":"hârcăi","harcaiti":"hârcăi","harcaitul":"hărcăit","harcaitule":"hărcăit","harcaitului":"hărcăit","harcatea":"hărcăti","harcateai":"hărcăti","harcateam":"hărcăti","harcateati":"hărcăti","harcateau":"hărcăti","harcatesc":"hărcăti","harcateste":"hărcăti","harcatesti":"hărcăti","harcatii":"hărcăti","harcatim":"hărcăti","harcatind":"hărcăti","harcatira":"hărcăti","harcatiram":"hărcăti","harcatirati":"hărcăti","harcatise":"hărcăti","harcatisem":"hărcăti","harcatisera":"hărcăti","harcatiseram":"hărcăti","harcatiserati":"hărcăti","harcatisesi":"hărcăti","harcatisi":"hărcăti","harcatit":"hărcăti","harcatiti":"hărcăti","harcava":["hârcavă","hârcav","hârcava","hârcav"],"harcave":"hârcav","harcavele":"hârcav","harcavi":"hârcav","harcavii":"hârcav","harcavul":"hârcav","harci":"hârcă","harcii":"hârcă","harcile":"hârcă","harcilor":"hârcă","harciogi":"hârciog","harciogii":"hârciog","harciogilor":"hârciog","harciogul":"hârciog","harciogule":"hârciog","harciogului":"hârciog","hard discuri":"hard disk","hardaiase":"hârdăiaș","hardaiasele":"hârdăiaș","hardaiaselor":"hârdăiaș","hardaiasul":"hârdăiaș","hardaiasule":"hârdăiaș","hardaiasului":"hârdăiaș","hardaie":"hârdău","hardaiele":"hârdău","hardaielor":"hârdău","hardaiorul":"hârdăior","hardaiorule":"hârdăior","hardaiorului":"hârdăior","hardaul":"hârdău","hardaule":"hârdău","hardaului":"hârdău","hardaute":"hârdăuț","hardautele":"hârdăuț","hardautelor":"hârdăuț","hardautul":"hârdăuț","hardautule":"hârdăuț","hardautului":"hârdăuț","hardwareul":"hardware","hardwareule":"hardware","hardwareului":"hardware","haremul":"harem","haremule":"harem","haremului":"harem","haremuri":"harem","haremurile":"harem","haremurilor":"harem","harfe":"harfă","harfei":"harfă","harfele":"harfă","harfelor":"harfă","harfoniste":"harfonistă","harfonistei":"harfonistă","harfonistele":"harfonistă","harfonistelor":"harfonistă","hargaie":"hârgău","hargaiele":"hârgău","hargaielor":"hârgău","hargani":"hârgan","harganii":"hârgan","harganilor":"hârgan","harganul":"hârgan","harganule":"hârgan","harganului":"hârgan","hargaute":"hârgăuță","hargautei":"hârgăuță","hargauul":"hârgău","hargauule":"hârgău","hargauului":"hârgău","harghiteanul":"harghitean","harghiteanule":"harghitean","harghiteanului":"harghitean","harghitence":"harghiteancă","harghitencei":"harghiteancă","harghitencele":"harghiteancă","harghitencelor":"harghiteancă","harghitene":"harghiteană","harghitenei":"harghiteană","harghitenele":"harghiteană","harghitenelor":"harghiteană","harghiteni":"harghitean","harghitenii":"harghitean","harghitenilor":"harghitean","hargilacul":"hargilâc","hargilacule":"hargilâc","hargilacului":"hargilâc","hargilacuri":"hargilâc","hargilacurile":"hargilâc","hargilacurilor":"hargilâc","hargolasul":"hărgolaș","hargolasule":"hărgolaș","hargolasului":"hărgolaș","harhalaia":"hărhălaie","harhalaie":"harhalău","harhalaiei":"hărhălaie","harhalaiele":"harhalău","harhalaielor":"harhalău","harhalaii":"hărhălaie","harhalauul":"harhalău","harhalauule":"harhalău","harhalauului":"harhalău","harhalul":"harhal","harhalule":"harhal","harhalului":"harhal","harhaluri":"harhal","harhalurile":"harhal","harhalurilor":"harhal","harhari":"harhăr","harharii":"harhăr","harharilor":"harhăr","harharul":"harhăr","harharule":"harhăr","harharului":"harhăr","harhate":"harhăt","harhatele":"harhăt","harhatelor":"harhăt","harhatul":"harhăt","harhatule":"harhăt","harhatului":"harhăt","harjaia":"hârjâi","harjaiai":"hârjâi","harjaiam":"hârjâi","harjaiati":"hârjâi","harjaiau":"hârjâi","harjaie":"hârjâi","harjaii":"hârjâi","harjaim":"hârjâi","harjaind":"hârjâi","harjaira":"hârjâi","harjairam":"hârjâi","harjairati":"hârjâi","harjaise":"hârjâi","harjaisem":"hârjâi","harjaisera":"hârjâi","harjaiseram":"hârjâi","harjaiserati":"hârjâi","harjaisesi":"hârjâi","harjaisi":"hârjâi","harjait":"hârjâi","harjaiti":"hârjâi","harjaitul":"hârjâit","harjaitule":"hârjâit","harjaitului":"hârjâit","harjaituri":"hârjâitură","harjaiturii":"hârjâitură","harjaiturile":"hârjâitură","harjaiturilor":"hârjâitură","harjetari":"hârjetar","harjetarii":"hârjetar","harjetarilor":"hârjetar","harjetarul":"hârjetar","harjetarule":"hârjetar","harjetarului":"hârjetar","harjoane":"hârjoană","harjoanei":"hârjoană","harjoanele":"hârjoană","harjoanelor":"hârjoană","harjonea":"hârjoni","harjoneai":"hârjoni","harjoneam":"hârjoni","harjoneati":"hârjoni","harjoneau":"hârjoni","harjoneli":"hârjoneală","harjonelii":"hârjoneală","harjonelile":"hârjoneală","harjonelilor":"hârjoneală","harjonesc":"hârjoni","harjoneste":"hârjoni","harjonesti":"hârjoni","harjonii":"hârjoni","harjonim":"hârjoni","harjonind":"hârjoni","harjonira":"hârjoni","harjoniram":"hârjoni","harjonirati":"hârjoni","harjonise":"hârjoni","harjonisem":"hârjoni","harjonisera":"hârjoni","harjoniseram":"hârjoni","harjoniserati":"hârjoni","harjonisesi":"hârjoni","harjonisi":"hârjoni","harjonit":"hârjoni","harjoniti":"hârjoni","harlauana":["hârlăuană","hârlăuan","hârlăuana","hârlăuan"],"harlauance":"hârlăuancă","harlauancei":"hârlăuancă","harlauancele":"hârlăuancă","harlauancelor":"hârlăuancă","harlauane":"hârlăuan","harlauanele":"hârlăuan","harlauani":"hârlăuan","harlauanii":"hârlăuan","harlauanilor":"hârlăuan","harlauanul":"hârlăuan","harlauanule":"hârlăuan","harlauanului":"hârlăuan","harlete":"hârleț","harletele":["hârlețele","hârleț","hârlețele","hârlețel"],"harletelele":"hârlețel","harletelelor":"hârlețel","harletelor":"hârleț","harletelul":"hârlețel","harletelule":"hârlețel","harletelului":"hârlețel","harletul":"hârleț","harletule":"hârleț","harletului":"hârleț","harmalaia":"hărmălaie","harmalaiea":"harmalaie","harmalaiei":["harmalaiei","harmalaie","hărmălaiei","hărmălaie"],"harmalaiele":"harmalaie","harmalaielor":"harmalaie","harmalaii":"hărmălaie","harmalioace":"hărmălioacă","harmalioacei":"hărmălioacă","harmalioacele":"hărmălioacă","harmalioacelor":"hărmălioacă","harmasari":"harmăsar","harmasarii":"harmăsar","harmasarilor":"harmăsar","harmasarul":"harmăsar","harmasarule":"harmăsar","harmasarului":"harmăsar","harmintia":"hărminție","harmintiei":"hărminție","harmintii":"hărminție","harnasai":"harnașa","harnasam":["harnașăm","harnașa","harnașam","harnașa"],"harnasamente":"harnașament","harnasamentele":"harnașament","harnasamentelor":"harnașament","harnasamentul":"harnașament","harnasamentule":"harnașament","harnasamentului":"harnașament","harnasand":"harnașa","harnasara":"harnașa","harnasaram":"harnașa","harnasarati":"harnașa","harnasarea":"harnașare","harnasarei":"harnașare","harnasase":"harnașa","harnasasem":"harnașa","harnasasera":"harnașa","harnasaseram":"harnașa","harnasaserati":"harnașa","harnasasesi":"harnașa","harnasasi":"harnașa","harnasat":"harnașa","harnasati":"harnașa","harnasau":"harnașa","harnaseaza":"harnașa","harnasez":"harnașa","harnasezi":"harnașa","harnica":["harnică","harnic","harnica","harnic"],"harnice":"harnic","harnicea":"hărnici","harniceai":"hărnici","harniceam":"hărnici","harniceati":"hărnici","harniceau":"hărnici","harnicela":["hărnicelă","hărnicel","hărnicela","hărnicel"],"harnicele":["harnicele","harnic","hărnicele","hărnicel"],"harnicelele":"hărnicel","harniceli":"hărnicel","harnicelii":"hărnicel","harnicelul":"hărnicel","harnicesc":"hărnici","harniceste":"hărnici","harnicesti":"hărnici","harnici":"harnic","harnicii":["harnicii","harnic","hărnicii","hărnici"],"harnicim":"hărnici","harnicind":"hărnici","harnicira":"hărnici","harniciram":"hărnici","harnicirati":"hărnici","harnicise":"hărnici","harnicisem":"hărnici","harnicisera":"hărnici","harniciseram":"hărnici","harniciserati":"hărnici","harnicisesi":"hărnici","harnicisi":"hărnici","harnicit":"hărnici","harniciti":"hărnici","harnicul":"harnic","harnicuta":["hărnicuță","hărnicuț","hărnicuța","hărnicuț"],"harnicute":"hărnicuț","harnicutele":"hărnicuț","harnicuti":"hărnicuț","harnicutii":"hărnicuț","harnicutul":"hărnicuț","harpagoni":"harpagon","harpagonii":"harpagon","harpagonilor":"harpagon","harpagonul":"harpagon","harpagonule":"harpagon","harpagonului":"harpagon","harpe":"harpă","harpei":"harpă","harpele":"harpă","harpelor":"harpă","harpia":"harpie","harpiei":"harpie","harpii":"harpie","harpiile":"harpie","harpiilor":"harpie","harpiste":"harpistă","harpistei":"harpistă","harpistele":"harpistă","harpistelor":"harpistă","harpisti":"harpist","harpistii":"harpist","harpistilor":"harpist","harpistul":"harpist","harpistule":"harpist","harpistului":"harpist","harpoane":"harpon","harpoanele":"harpon","harpoanelor":"harpon","harponieri":"harponier","harponierii":"harponier","harponierilor":"harponier","harponierul":"harponier","harponierule":"harponier","harponierului":"harponier","harponul":"harpon","harponule":"harpon","harponului":"harpon","harpsichord":"harpsicord","harpsicordul":"harpsicord","harpsicordule":"harpsicord","harpsicordului":"harpsicord","harpsicorduri":"harpsicord","harpsicordurile":"harpsicord","harpsicordurilor":"harpsicord","harsaia":"hârșâi","harsaiai":"hârșâi","harsaiam":"hârșâi","harsaiati":"hârșâi","harsaiau":"hârșâi","harsaie":"hârșâi","harsaii":"hârșâi","harsaim":"hârșâi","harsaind":"hârșâi","harsaira":"hârșâi","harsairam":"hârșâi","harsairati":"hârșâi","harsairea":"hârșâire","harsairi":"hârșâire","harsairii":"hârșâire","harsairile":"hârșâire","harsairilor":"hârșâire","harsaise":"hârșâi","harsaisem":"hârșâi","harsaisera":"hârșâi","harsaiseram":"hârșâi","harsaiserati":"hârșâi","harsaisesi":"hârșâi","harsaisi":"hârșâi","harsait":"hârșâi","harsaiti":"hârșâi","harsaitul":"hârșâit","harsaitule":"hârșâit","harsaitului":"hârșâit","harsaituri":"hârșâitură","harsaiturii":"hârșâitură","harsaiturile":"hârșâitură","harsaiturilor":"hârșâitură","harscaia":"hârșcâi","harscaiai":"hârșcâi","harscaiam":"hârșcâi","harscaiati":"hârșcâi","harscaiau":"hârșcâi","harscaie":"hârșcâi","harscaii":"hârșcâi","harscaim":"hârșcâi","harscaind":"hârșcâi","harscaira":"hârșcâi","harscairam":"hârșcâi","harscairati":"hârșcâi","harscaise":"hârșcâi","harscaisem":"hârșcâi","harscaisera":"hârșcâi","harscaiseram":"hârșcâi","harscaiserati":"hârșcâi","harscaisesi":"hârșcâi","harscaisi":"hârșcâi","harscait":"hârșcâi","harscaiti":"hârșcâi","harscaitul":"hârșcâit","harscaitule":"hârșcâit","harscaitului":"hârșcâit","harscaituri":"hârșcâitură","harscaiturii":"hârșcâitură","harscaiturile":"hârșcâitură","harscaiturilor":"hârșcâitură","harschine":"harșchină","harschinei":"harșchină","harschinele":"harșchină","harschinelor":"harșchină","harsenia":"hârsenie","harseniei":"hârsenie","harsenii":"hârsenie","harseniile":"hârsenie","harseniilor":"hârsenie","harsia":["hărșia","hărșie","hârșia","hârșii"],"harsiai":"hârșii","harsiam":"hârșii","harsiati":"hârșii","harsiau":"hârșii","harsiei":"hărșie","harsiesc":"hârșii","harsieste":"hârșii","harsiesti":"hârșii","harsii":"hărșie","harsiii":"hârșii","harsiile":"hărșie","harsiilor":"hărșie","harsiim":"hârșii","harsiind":"hârșii","harsiira":"hârșii","harsiiram":"hârșii","harsiirati":"hârșii","harsiirea":"hârșiire","harsiiri":"hârșiire","harsiirii":"hârșiire","harsiirile":"hârșiire","harsiirilor":"hârșiire","harsiise":"hârșii","harsiisem":"hârșii","harsiisera":"hârșii","harsiiseram":"hârșii","harsiiserati":"hârșii","harsiisesi":"hârșii","harsiisi":"hârșii","harsiit":"hârșii","harsiiti":"hârșii","harsiitul":"hârșiit","harsiitule":"hârșiit","harsiitului":"hârșiit","harsita":["hârsită","hârsit","hârsita","hârsit","hârșită","hârșit","hârșita","hârșit","hărsită","hărsit","hărsita","hărsit"],"harsite":["hârsite","hârsit","hârșite","hârșit","hărsite","hărsit"],"harsitele":["hârsitele","hârsit","hârșitele","hârșit","hărsitele","hărsit"],"harsiti":["hârsiți","hârsit","hârșiți","hârșit","hărsiți","hărsit"],"harsitii":["hârsiții","hârsit","hârșiții","hârșit","hărsiții","hărsit"],"harsitul":["hârsitul","hârsit","hârșitul","hârșit","hărsitul","hărsit"],"harsnea":"hârșni","harsneai":"hârșni","harsneam":"hârșni","harsneati":"hârșni","harsneau":"hârșni","harsnesc":"hârșni","harsneste":"hârșni","harsnesti":"hârșni","harsnii":"hârșni","harsnim":"hârșni","harsnind":"hârșni","harsnira":"hârșni","harsniram":"hârșni","harsnirati":"hârșni","harsnise":"hârșni","harsnisem":"hârșni","harsnisera":"hârșni","harsniseram":"hârșni","harsniserati":"hârșni","harsnisesi":"hârșni","harsnisi":"hârșni","harsnit":"hârșni","harsniti":"hârșni","harsoveana":["hârșoveană","hârșovean","hârșoveana","hârșovean"],"harsoveanul":"hârșovean","harsoveanule":"hârșovean","harsoveanului":"hârșovean","harsovence":"hârșoveancă","harsovencei":"hârșoveancă","harsovencele":"hârșoveancă","harsovencelor":"hârșoveancă","harsovene":"hârșovean","harsovenele":"hârșovean","harsoveni":"hârșovean","harsovenii":"hârșovean","harsovenilor":"hârșovean","harstea":"hărști","harsteai":"hărști","harsteam":"hărști","harsteati":"hărști","harsteau":"hărști","harstesc":"hărști","harsteste":"hărști","harstesti":"hărști","harstii":"hărști","harstim":"hărști"};
@@ -0,0 +1 @@
+export default {"harstind":"hărști","harstira":"hărști","harstiram":"hărști","harstirati":"hărști","harstise":"hărști","harstisem":"hărști","harstisera":"hărști","harstiseram":"hărști","harstiserati":"hărști","harstisesi":"hărști","harstisi":"hărști","harstit":"hărști","harstiti":"hărști","hartagoasa":["harțăgoasă","harțăgos","harțăgoasa","harțăgos","hărțăgoasă","hărțăgos","hărțăgoasa","hărțăgos"],"hartagoase":["harțăgoase","harțăgos","hărțăgoase","hărțăgos"],"hartagoasele":["harțăgoasele","harțăgos","hărțăgoasele","hărțăgos"],"hartagosi":["harțăgoși","harțăgos","hărțăgoși","hărțăgos"],"hartagosii":["harțăgoșii","harțăgos","hărțăgoșii","hărțăgos"],"hartagosul":["harțăgosul","harțăgos","hărțăgosul","hărțăgos"],"hartagul":"harțag","hartagule":"harțag","hartagului":"harțag","hartaguri":"harțag","hartagurile":"harțag","hartagurilor":"harțag","hartaie":"hârtău","hartaiele":"hârtău","hartaielor":"hârtău","hartanase":"hărtănaș","hartanasele":"hărtănaș","hartanaselor":"hărtănaș","hartanasul":"hărtănaș","hartanasule":"hărtănaș","hartanasului":"hărtănaș","hartane":"hărtan","hartararia":"hârtărărie","hartarariei":"hârtărărie","hartararii":"hârtărărie","hartarariile":"hârtărărie","hartarariilor":"hârtărărie","hartaul":["harțăul","harță","hârtăul","hârtău"],"hartaule":["harțăule","harță","hârtăule","hârtău"],"hartaului":["harțăului","harță","hârtăului","hârtău"],"harte":"hârță","hartei":"hârță","hartele":"hârță","hartelor":"hârță","hartesei":"hărțeșel","harteseii":"hărțeșel","harteseilor":"hărțeșel","harteselul":"hărțeșel","harteselule":"hărțeșel","harteselului":"hărțeșel","harti":"hartă","harti meteorologice":"hartă meteorologică","harti rutiere":"hartă rutieră","harti stelare":"hartă stelară","hartia":["hârtia","hârtie","hărtia","hărtie"],"hartice":"hârtică","harticeaua":"hărticea","harticei":"hârtică","harticele":"hărticea","harticelei":"hărticea","harticelele":"hărticea","harticelelor":"hărticea","hartici":"hârtică","hartiei":["hârtiei","hârtie","hărtiei","hărtie"],"hartieri":"hârtier","hartieria":"hârtierie","hartieriei":"hârtierie","hartierii":["hârtierii","hârtier","hârtierii","hârtierie"],"hartieriile":"hârtierie","hartieriilor":"hârtierie","hartierilor":"hârtier","hartierul":"hârtier","hartierule":"hârtier","hartierului":"hârtier","hartii":["hărții","hartă","hârtii","hârtie","hărtii","hărtie"],"hartii albe":"hârtie albă","hartii alfa":"hârtie alfa","hartii cerate":"hârtie cerată","hartii de banca":"hârtie de bancă","hartii de calc":"hârtie de calc","hartii de filtru":"hârtie de filtru","hartii filtru":"hârtie filtru","hartii fotografice":"hârtie fotografică","hartii igienice":"hârtie igienică","hartii indigo":"hârtie indigo","hartii milimetrice":"hârtie milimetrică","hartii-carbon":"hârtie-carbon","hartiile":["hârtiile","hârtie","hărtiile","hărtie"],"hartiilor":["hârtiilor","hârtie","hărtiilor","hărtie"],"hartile":"hartă","hartilor":"hartă","hartioare":"hârtioară","hartioarei":"hârtioară","hartioarele":"hârtioară","hartioarelor":"hârtioară","hartisorul":"hârțișor","hartisorule":"hârțișor","hartisorului":"hârțișor","hartiute":"hârtiuță","hartiutei":"hârtiuță","hartiutele":"hârtiuță","hartiutelor":"hârtiuță","hartoage":["hârțoage","hârțoagă","hârțoage","hârțog"],"hartoagei":"hârțoagă","hartoagele":"hârțoagă","hartoagelor":"hârțoagă","hartoale":"hârțoală","hartoalei":"hârțoală","hartoalele":"hârțoală","hartoalelor":"hârțoală","hartoapa":"hârtop","hartoape":["hârtoape","hârtoapă","hârtoape","hârtop"],"hartoapele":"hârtop","hartoapelor":"hârtop","hartoii":"hârțoi","hartoilor":"hârțoi","hartoiul":"hârțoi","hartoiule":"hârțoi","hartoiului":"hârțoi","hartopul":"hârtop","hartopule":"hârtop","hartopului":"hârtop","hartuia":["hartuia","hartui","hârțuia","hârțui","hărțuia","hărțui"],"hartuiai":["hartuiai","hartui","hârțuiai","hârțui","hărțuiai","hărțui"],"hartuiam":["hartuiam","hartui","hârțuiam","hârțui","hărțuiam","hărțui"],"hartuiati":["hartuiați","hartui","hârțuiați","hârțui","hărțuiați","hărțui"],"hartuiau":["hartuiau","hartui","hârțuiau","hârțui","hărțuiau","hărțui"],"hartuieli":"hărțuială","hartuielii":"hărțuială","hartuielile":"hărțuială","hartuielilor":"hărțuială","hartuiesc":["hartuiesc","hartui","hârțuiesc","hârțui","hărțuiesc","hărțui"],"hartuieste":["hartuiește","hartui","hârțuiește","hârțui","hărțuiește","hărțui"],"hartuiesti":["hartuiești","hartui","hârțuiești","hârțui","hărțuiești","hărțui"],"hartuii":["hartuii","hartui","hârțuii","hârțui","hărțuii","hărțui"],"hartuim":["hartuim","hartui","hârțuim","hârțui","hărțuim","hărțui"],"hartuind":["hartuind","hartui","hârțuind","hârțui","hărțuind","hărțui"],"hartuira":["hartuiră","hartui","hârțuiră","hârțui","hărțuiră","hărțui"],"hartuiram":["hartuirăm","hartui","hârțuirăm","hârțui","hărțuirăm","hărțui"],"hartuirati":["hartuirăți","hartui","hârțuirăți","hârțui","hărțuirăți","hărțui"],"hartuirea":"hărțuire","hartuiri":"hărțuire","hartuiri sexuale":"hărțuire sexuală","hartuirii":"hărțuire","hartuirile":"hărțuire","hartuirilor":"hărțuire","hartuise":["hartuise","hartui","hârțuise","hârțui","hărțuise","hărțui"],"hartuisem":["hartuisem","hartui","hârțuisem","hârțui","hărțuisem","hărțui"],"hartuisera":["hartuiseră","hartui","hârțuiseră","hârțui","hărțuiseră","hărțui"],"hartuiseram":["hartuiserăm","hartui","hârțuiserăm","hârțui","hărțuiserăm","hărțui"],"hartuiserati":["hartuiserăți","hartui","hârțuiserăți","hârțui","hărțuiserăți","hărțui"],"hartuisesi":["hartuiseși","hartui","hârțuiseși","hârțui","hărțuiseși","hărțui"],"hartuisi":["hartuiși","hartui","hârțuiși","hârțui","hărțuiși","hărțui"],"hartuit":["hartuit","hartui","hârțuit","hârțui","hărțuit","hărțui"],"hartuita":["hârțuită","hârțuit","hârțuita","hârțuit","hărțuită","hărțuit","hărțuita","hărțuit"],"hartuite":["hârțuite","hârțuit","hărțuite","hărțuit"],"hartuitele":["hârțuitele","hârțuit","hărțuitele","hărțuit"],"hartuiti":["hartuiți","hartui","hârțuiți","hârțui","hărțuiți","hărțui","hârțuiți","hârțuit","hărțuiți","hărțuit"],"hartuitii":["hârțuiții","hârțuit","hărțuiții","hărțuit"],"hartuitori":"hărțuitor","hartuitorii":"hărțuitor","hartuitorilor":"hărțuitor","hartuitorul":"hărțuitor","hartuitorule":"hărțuitor","hartuitorului":"hărțuitor","hartuitul":["hârțuitul","hârțuit","hărțuitul","hărțuit"],"hartul":"harț","hartule":"harț","hartulia":"hărțulie","hartuliei":"hărțulie","hartulii":"hărțulie","hartului":"harț","harul":"har","harule":"har","harului":"har","haruri":"har","harurile":"har","harurilor":"har","haruspicii":"haruspiciu","haruspiciii":"haruspiciu","haruspiciilor":"haruspiciu","haruspiciul":"haruspiciu","haruspiciule":"haruspiciu","haruspiciului":"haruspiciu","harzobase":"hârzobaș","harzobasele":"hârzobaș","harzobaselor":"hârzobaș","harzobasul":"hârzobaș","harzobasule":"hârzobaș","harzobasului":"hârzobaș","haschia":"hașchie","haschiei":"hașchie","haschii":"hașchie","haschiile":"hașchie","haschiilor":"hașchie","haseuri":"hașeu","haseurile":"hașeu","haseurilor":"hașeu","haseuul":"hașeu","haseuule":"hașeu","haseuului":"hașeu","hasisismul":"hașișism","hasisismule":"hașișism","hasisismului":"hașișism","hasisul":"hașiș","hasisule":"hașiș","hasisului":"hașiș","hasleite":"hașleiță","hasleitei":"hașleiță","hasleitele":"hașleiță","hasleitelor":"hașleiță","hasmaciuce":"hașmaciucă","hasmaciucei":"hașmaciucă","hasmatuchiul":"hasmațuchi","hasmatuchiule":"hasmațuchi","hasmatuchiului":"hasmațuchi","hasme":"hașmă","hasmei":"hașmă","hasmele":"hașmă","hasmelor":"hașmă","hasna":"hazna","hasnari":"hăsnar","hasnarii":"hăsnar","hasnarilor":"hăsnar","hasnarul":"hăsnar","hasnarule":"hăsnar","hasnarului":"hăsnar","hasnasa":["hăsnașă","hăsnaș","hăsnașa","hăsnaș"],"hasnase":"hăsnaș","hasnasele":"hăsnaș","hasnasi":"hăsnaș","hasnasii":"hăsnaș","hasnasul":"hăsnaș","hasne":"hasnă","hasnei":"hasnă","hasnele":"hasnă","hasnelor":"hasnă","hasnuiele":"hăsnuială","hasnuielei":"hăsnuială","hasnuielele":"hăsnuială","hasnuielelor":"hăsnuială","hasnuieli":"hăsnuială","hassiul":"hassiu","hassiule":"hassiu","hassiului":"hassiu","hasurai":"hașura","hasuram":["hașurăm","hașura","hașuram","hașura"],"hasurand":"hașura","hasurara":"hașura","hasuraram":"hașura","hasurarati":"hașura","hasurarea":"hașurare","hasurari":"hașurare","hasurarii":"hașurare","hasurarile":"hașurare","hasurarilor":"hașurare","hasurase":"hașura","hasurasem":"hașura","hasurasera":"hașura","hasuraseram":"hașura","hasuraserati":"hașura","hasurasesi":"hașura","hasurasi":"hașura","hasurat":"hașura","hasurata":["hașurată","hașurat","hașurata","hașurat"],"hasurate":"hașurat","hasuratele":"hașurat","hasurati":["hașurați","hașura","hașurați","hașurat"],"hasuratii":"hașurat","hasuratoare":"hașurator","hasuratoarele":"hașurator","hasuratoarelor":"hașurator","hasuratorul":"hașurator","hasuratorule":"hașurator","hasuratorului":"hașurator","hasuratul":"hașurat","hasurau":"hașura","hasureaza":"hașura","hasurez":"hașura","hasurezi":"hașura","hasuri":"hașură","hasurii":"hașură","hasurile":"hașură","hasurilor":"hașură","hataia":"hâțâi","hataiai":"hâțâi","hataiam":"hâțâi","hataiati":"hâțâi","hataiau":"hâțâi","hataiaua":"hataia","hataie":"hâțâi","hataiele":"hataia","hataielei":"hataia","hataii":"hâțâi","hataim":"hâțâi","hataind":"hâțâi","hataira":"hâțâi","hatairam":"hâțâi","hatairati":"hâțâi","hataise":"hâțâi","hataisem":"hâțâi","hataisera":"hâțâi","hataiseram":"hâțâi","hataiserati":"hâțâi","hataisesi":"hâțâi","hataisi":"hâțâi","hatait":"hâțâi","hataiti":"hâțâi","hatale":"hata","hatalei":"hata","hatalici":"hătălic","hatalicii":"hătălic","hatalicilor":"hătălic","hatalicul":"hătălic","hatalicule":"hătălic","hatalicului":"hătălic","hatan":"hâțâna","hatanai":"hâțâna","hatanam":["hâțânăm","hâțâna","hâțânam","hâțâna"],"hatanand":"hâțâna","hatanara":"hâțâna","hatanaram":"hâțâna","hatanarati":"hâțâna","hatanase":"hâțâna","hatanasem":"hâțâna","hatanasera":"hâțâna","hatanaseram":"hâțâna","hatanaserati":"hâțâna","hatanasesi":"hâțâna","hatanasi":"hâțâna","hatanat":"hâțâna","hatanati":"hâțâna","hatanau":"hâțâna","hatani":"hâțâna","hatarul":"hatâr","hatarule":"hatâr","hatarului":"hatâr","hataruri":"hatâr","hatarurile":"hatâr","hatarurilor":"hatâr","hatcaia":"hâtcâi","hatcaiai":"hâtcâi","hatcaiam":"hâtcâi","hatcaiati":"hâtcâi","hatcaiau":"hâtcâi","hatcaiesc":"hâtcâi","hatcaieste":"hâtcâi","hatcaiesti":"hâtcâi","hatcaii":"hâtcâi","hatcaim":"hâtcâi","hatcaind":"hâtcâi","hatcaira":"hâtcâi","hatcairam":"hâtcâi","hatcairati":"hâtcâi","hatcaise":"hâtcâi","hatcaisem":"hâtcâi","hatcaisera":"hâtcâi","hatcaiseram":"hâtcâi","hatcaiserati":"hâtcâi","hatcaisesi":"hâtcâi","hatcaisi":"hâtcâi","hatcait":"hâtcâi","hatcaiti":"hâtcâi","hate-ul":"hate","hate-ului":"hate","hategance":"hațegancă","hategancei":"hațegancă","hategancele":"hațegancă","hategancelor":"hațegancă","hategane":"hațegană","hateganei":"hațegană","hateganele":"hațegană","hateganelor":"hațegană","hategani":"hațegan","hateganii":"hațegan","hateganilor":"hațegan","hateganul":"hațegan","hateganule":"hațegan","hateganului":"hațegan","hateie":"hăței","hateiele":"hăței","hateielor":"hăței","hateiul":"hăței","hateiule":"hăței","hateiului":"hăței","hateri":"hater","haterii":"hater","haterilor":"hater","haterul":"hater","haterule":"hater","haterului":"hater","hatesi":"hateș","hatesii":"hateș","hatesilor":"hateș","hatesul":"hateș","hatesule":"hateș","hatesului":"hateș","hatihumaiumul":"hatihumaium","hatihumaiumule":"hatihumaium","hatihumaiumului":"hatihumaium","hatihumaiumuri":"hatihumaium","hatihumaiumurile":"hatihumaium","hatihumaiumurilor":"hatihumaium","hatiseriful":"hatișerif","hatiserifule":"hatișerif","hatiserifului":"hatișerif","hatiserifuri":"hatișerif","hatiserifurile":"hatișerif","hatiserifurilor":"hatișerif","hatisul":"hățiș","hatisule":"hățiș","hatisului":"hățiș","hatisuri":"hățiș","hatisurile":"hățiș","hatisurilor":"hățiș","hatite":"hatiță","hatitei":"hatiță","hatitele":"hatiță","hatitelor":"hatiță","hatmaneasca":["hătmănească","hătmănesc","hătmăneasca","hătmănesc"],"hatmanescul":"hătmănesc","hatmanese":"hătmăneasă","hatmanesei":"hătmăneasă","hatmanesele":"hătmăneasă","hatmaneselor":"hătmăneasă","hatmanesti":"hătmănesc","hatmanestii":"hătmănesc","hatmanestile":"hătmănesc","hatmani":"hatman","hatmania":["hatmania","hatmanie","hătmănia","hătmănie"],"hatmaniei":["hatmaniei","hatmanie","hătmăniei","hătmănie"],"hatmanii":["hatmanii","hatman","hatmanii","hatmanie","hătmănii","hătmănie"],"hatmaniile":["hatmaniile","hatmanie","hătmăniile","hătmănie"],"hatmaniilor":["hatmaniilor","hatmanie","hătmăniilor","hătmănie"],"hatmanilor":"hatman","hatmanul":"hatman","hatmanule":"hatman","hatmanului":"hatman","hatra":["hâtră","hâtru","hâtra","hâtru"],"hatre":["hâtre","hâtră","hâtre","hâtru"],"hatrei":"hâtră","hatrele":["hâtrele","hâtră","hâtrele","hâtru"],"hatrelor":"hâtră","hatri":"hâtru","hatria":"hâtrie","hatriei":"hâtrie","hatrii":["hâtrii","hâtrie","hâtrii","hâtru"],"hatriile":"hâtrie","hatriilor":"hâtrie","hatrul":"hâtru","hatuia":"hățui","hatuiai":"hățui","hatuiam":"hățui","hatuiati":"hățui","hatuiau":"hățui","hatuiesc":"hățui","hatuieste":"hățui","hatuiesti":"hățui","hatuii":"hățui","hatuim":"hățui","hatuind":"hățui","hatuira":"hățui","hatuiram":"hățui","hatuirati":"hățui","hatuise":"hățui","hatuisem":"hățui","hatuisera":"hățui","hatuiseram":"hățui","hatuiserati":"hățui","hatuisesi":"hățui","hatuisi":"hățui","hatuit":"hățui","hatuiti":"hățui","hatul":"hăț","hatule":"hăț","hatului":"hăț","haturi":"hăț","haturile":"hăț","haturilor":"hăț","hau!":"hau","haugase":"hăugaș","haugasele":"hăugaș","haugaselor":"hăugaș","haugasul":"hăugaș","haugasule":"hăugaș","haugasului":"hăugaș","hauia":"hăui","hauiai":"hăui","hauiam":"hăui","hauiati":"hăui","hauiau":"hăui","hauie":"hăui","hauiele":"hăuială","hauielei":"hăuială","hauielele":"hăuială","hauielelor":"hăuială","hauieli":"hăuială","hauieste":"hăui","hauii":"hăui","hauim":"hăui","hauind":"hăui","hauira":"hăui","hauiram":"hăui","hauirati":"hăui","hauise":"hăui","hauisem":"hăui","hauisera":"hăui","hauiseram":"hăui","hauiserati":"hăui","hauisesi":"hăui","hauisi":"hăui","hauit":"hăui","hauiti":"hăui","hauitul":"hăuit","hauitule":"hăuit","hauitului":"hăuit","hauituri":"hăuit","hauiturile":"hăuit","hauiturilor":"hăuit","haulea":"hăuli","hauleai":"hăuli","hauleam":"hăuli","hauleati":"hăuli","hauleau":"hăuli","haulesc":"hăuli","hauleste":"hăuli","haulesti":"hăuli","haulii":"hăuli","haulim":"hăuli","haulind":"hăuli","haulira":"hăuli","hauliram":"hăuli","haulirati":"hăuli","haulirea":"hăulire","hauliri":"hăulire","haulirii":"hăulire","haulirile":"hăulire","haulirilor":"hăulire","haulise":"hăuli","haulisem":"hăuli","haulisera":"hăuli","hauliseram":"hăuli","hauliserati":"hăuli","haulisesi":"hăuli","haulisi":"hăuli","haulit":"hăuli","hauliti":"hăuli","haulitul":"hăulit","haulitule":"hăulit","haulitului":"hăulit","haulituri":"hăulit","hauliturile":"hăulit","hauliturilor":"hăulit","hauri":"hău","haurile":"hău","haurilor":"hău","hauul":"hău","hauule":"hău","hauului":"hău","havadisul":"havadis","havadisule":"havadis","havadisului":"havadis","havaia":"havaiu","havaiana":["havaiană","havaian","havaiana","havaian"],"havaianul":"havaian","havaie":"havaiu","havaiene":"havaian","havaienele":"havaian","havaieni":"havaian","havaienii":"havaian","havaii":"havaiu","havaiii":"havaiu","havaiile":"havaiu","havaiul":"havaiu","havana":["havană","havan","havana","havan"],"havane":["havane","havan","havane","havană"],"havanei":"havană","havanele":["havanele","havan","havanele","havană"],"havanelor":"havană","havani":"havan","havanii":"havan","havanul":"havan","haveze":"haveză","havezei":"haveză","havezele":"haveză","havezelor":"haveză","havre":"havră","havrei":"havră","havrele":"havră","havrelor":"havră","havuzul":"havuz","havuzule":"havuz","havuzului":"havuz","havuzuri":"havuz","havuzurile":"havuz","havuzurilor":"havuz","hawaiiana":["hawaiiană","hawaiian","hawaiiana","hawaiian"],"hawaiiane":"hawaiiană","hawaiianei":"hawaiiană","hawaiianele":"hawaiiană","hawaiianelor":"hawaiiană","hawaiianul":"hawaiian","hawaiianule":"hawaiian","hawaiianului":"hawaiian","hawaiiene":"hawaiian","hawaiienele":"hawaiian","hawaiieni":"hawaiian","hawaiienii":"hawaiian","hawaiienilor":"hawaiian","hazardai":"hazarda","hazardam":["hazardăm","hazarda","hazardam","hazarda"],"hazardand":"hazarda","hazardara":"hazarda","hazardaram":"hazarda","hazardarati":"hazarda","hazardarea":"hazardare","hazardari":"hazardare","hazardarii":"hazardare","hazardarile":"hazardare","hazardarilor":"hazardare","hazardase":"hazarda","hazardasem":"hazarda","hazardasera":"hazarda","hazardaseram":"hazarda","hazardaserati":"hazarda","hazardasesi":"hazarda","hazardasi":"hazarda","hazardat":"hazarda","hazardata":["hazardată","hazardat","hazardata","hazardat"],"hazardate":"hazardat","hazardatele":"hazardat","hazardati":["hazardați","hazarda","hazardați","hazardat"],"hazardatii":"hazardat","hazardatul":"hazardat","hazardau":"hazarda","hazardeaza":"hazarda","hazardez":"hazarda","hazardezi":"hazarda","hazardul":"hazard","hazardule":"hazard","hazardului":"hazard","hazarduri":"hazard","hazardurile":"hazard","hazardurilor":"hazard","hazea":"hâzi","hazeai":"hâzi","hazeam":"hâzi","hazeati":"hâzi","hazeau":"hâzi","hazenia":"hâzenie","hazeniei":"hâzenie","hazenii":"hâzenie","hazeniile":"hâzenie","hazeniilor":"hâzenie","hazesc":"hâzi","hazeste":"hâzi","hazesti":"hâzi","hazii":"hâzi","hazim":"hâzi","hazimea":"hâzime","hazimi":"hâzime","hazimii":"hâzime","hazimile":"hâzime","hazimilor":"hâzime","hazind":"hâzi","hazira":"hâzi","haziram":"hâzi","hazirati":"hâzi","hazirea":"hâzire","haziri":"hâzire","hazirii":"hâzire","hazirile":"hâzire","hazirilor":"hâzire","hazise":"hâzi","hazisem":"hâzi","hazisera":"hâzi","haziseram":"hâzi","haziserati":"hâzi","hazisesi":"hâzi","hazisi":"hâzi","hazit":"hâzi","hazita":["hâzită","hâzit","hâzita","hâzit"],"hazite":"hâzit","hazitele":"hâzit","haziti":["hâziți","hâzi","hâziți","hâzit"],"hazitii":"hâzit","hazitul":"hâzit","hazlae":"hazlâu","hazlaea":"hazlâu","hazlaele":"hazlâu","hazlai":"hazlâu","hazlaii":"hazlâu","hazlaul":"hazlâu","hazlia":"hazliu","hazlie":"hazliu","hazlii":"hazliu","hazliii":"hazliu","hazliile":"hazliu","hazliul":"hazliu","hazmodia":"hazmodie","hazmodiei":"hazmodie","hazmodii":"hazmodie","hazmodiile":"hazmodie","hazmodiilor":"hazmodie","haznadar":"haznatar","haznale":"hazna","haznalei":"hazna","haznalele":"hazna","haznalelor":"hazna","haznatari":"haznatar","haznatarii":"haznatar","haznatarilor":"haznatar","haznatarul":"haznatar","haznatarule":"haznatar","haznatarului":"haznatar","haznaua":"hazna","hazne":"haznă","haznei":"haznă","haznele":"haznă","haznelor":"haznă","hazrane":"hazran","hazranele":"hazran","hazranelor":"hazran","hazranul":"hazran","hazranule":"hazran","hazranului":"hazran","hazul":"haz","hazule":"haz","hazulia":"hazuliu","hazulie":"hazuliu","hazulii":"hazuliu","hazuliii":"hazuliu","hazuliile":"hazuliu","hazuliul":"hazuliu","hazului":"haz","heavy metalul":"heavy metal","heavy metalule":"heavy metal","heavy metalului":"heavy metal","hebdomadara":["hebdomadară","hebdomadar","hebdomadara","hebdomadar"],"hebdomadare":"hebdomadar","hebdomadarele":"hebdomadar","hebdomadari":"hebdomadar","hebdomadarii":"hebdomadar","hebdomadarile":"hebdomadar","hebdomadarilor":"hebdomadar","hebdomadarul":"hebdomadar","hebdomadarule":"hebdomadar","hebdomadarului":"hebdomadar","hebefrenia":"hebefrenie","hebefrenica":["hebefrenică","hebefrenic","hebefrenica","hebefrenic"],"hebefrenice":["hebefrenice","hebefrenic","hebefrenice","hebefrenică"],"hebefrenicei":"hebefrenică","hebefrenicele":["hebefrenicele","hebefrenic","hebefrenicele","hebefrenică"],"hebefrenicelor":"hebefrenică","hebefrenici":"hebefrenic","hebefrenicii":"hebefrenic","hebefrenicul":"hebefrenic","hebefreniei":"hebefrenie","hebefrenii":"hebefrenie","hebefreniile":"hebefrenie","hebefreniilor":"hebefrenie","hebelogia":"hebelogie","hebelogiei":"hebelogie","hebelogii":"hebelogie","hebelogiile":"hebelogie","hebelogiilor":"hebelogie","hebetudinea":"hebetudine","hebetudini":"hebetudine","hebetudinii":"hebetudine","hebetudinile":"hebetudine","hebetudinilor":"hebetudine","hecatombe":"hecatombă","hecatombei":"hecatombă","hecatombele":"hecatombă","hecatombelor":"hecatombă","hecelai":"hecela","hecelam":["hecelăm","hecela","hecelam","hecela"],"heceland":"hecela","hecelara":"hecela","hecelaram":"hecela","hecelarati":"hecela","hecelase":"hecela","hecelasem":"hecela","hecelasera":"hecela","hecelaseram":"hecela","hecelaserati":"hecela","hecelasesi":"hecela","hecelasi":"hecela","hecelat":"hecela","hecelati":"hecela","hecelau":"hecela","hecelaul":"hecelă","hecelaule":"hecelă","hecelaului":"hecelă","hecele":"hecelă","heceleaza":"hecela","hecelele":"hecelă","hecelelor":"hecelă","hecelez":"hecela","hecelezi":"hecela","hecimpeciul":"hecimpeci","hecimpeciule":"hecimpeci","hecimpeciului":"hecimpeci","hecimpeciuri":"hecimpeci","hecimpeciurile":"hecimpeci","hecimpeciurilor":"hecimpeci","heciumpeci":"hecimpeci","hectare":"hectar","hectarele":"hectar","hectarelor":"hectar","hectarul":"hectar","hectarule":"hectar","hectarului":"hectar","hectica":["hectică","hectic","hectica","hectic"],"hectice":"hectic","hecticele":"hectic","hectici":"hectic","hecticii":"hectic","hecticul":"hectic","hectografe":"hectograf","hectografele":"hectograf","hectografelor":"hectograf","hectograful":"hectograf","hectografule":"hectograf","hectografului":"hectograf","hectograme":"hectogram","hectogramele":"hectogram","hectogramelor":"hectogram","hectogramul":"hectogram","hectogramule":"hectogram","hectogramului":"hectogram","hectolitri":"hectolitru","hectolitrica":["hectolitrică","hectolitric","hectolitrica","hectolitric"],"hectolitrice":"hectolitric","hectolitricele":"hectolitric","hectolitrici":"hectolitric","hectolitricii":"hectolitric","hectolitricul":"hectolitric","hectometrica":["hectometrică","hectometric","hectometrica","hectometric"],"hectometrice":"hectometric","hectometricele":"hectometric","hectometrici":"hectometric","hectometricii":"hectometric","hectometricul":"hectometric","hectowati":"hectowatt","hectowatii":"hectowatt","hectowatilor":"hectowatt","hectowattul":"hectowatt","hectowattule":"hectowatt","hectowattului":"hectowatt","hedonismul":"hedonism","hedonismule":"hedonism","hedonismului":"hedonism","hedoniste":"hedonistă","hedonistei":"hedonistă","hedonistele":"hedonistă","hedonistelor":"hedonistă","hedonisti":"hedonist","hedonistica":["hedonistică","hedonistic","hedonistica","hedonistic"],"hedonistice":"hedonistic","hedonisticele":"hedonistic","hedonistici":"hedonistic","hedonisticii":"hedonistic","hedonisticul":"hedonistic","hedonistii":"hedonist","hedonistilor":"hedonist","hedonistul":"hedonist","hedonistule":"hedonist","hedonistului":"hedonist","hegedusi":"hegeduș","hegedusii":"hegeduș","hegedusilor":"hegeduș","hegedusul":"hegeduș","hegedusule":"hegeduș","hegedusului":"hegeduș","hegelianisme":"hegelianism","hegelianismele":"hegelianism","hegelianismelor":"hegelianism","hegelianismul":"hegelianism","hegelianismule":"hegelianism","hegelianismului":"hegelianism","hegelianul":"hegelian","hegelianule":"hegelian","hegelianului":"hegelian","hegeliene":"hegeliană","hegelienei":"hegeliană","hegelienele":"hegeliană","hegelienelor":"hegeliană","hegelieni":"hegelian","hegelienii":"hegelian","hegelienilor":"hegelian","hegemone":"hegemonă","hegemonei":"hegemonă","hegemonele":"hegemonă","hegemonelor":"hegemonă","hegemoni":"hegemon","hegemonia":"hegemonie","hegemonica":["hegemonică","hegemonic","hegemonica","hegemonic"],"hegemonice":"hegemonic","hegemonicele":"hegemonic","hegemonici":"hegemonic","hegemonicii":"hegemonic","hegemonicul":"hegemonic","hegemoniei":"hegemonie","hegemonii":["hegemonii","hegemon","hegemonii","hegemonie"],"hegemonilor":"hegemon","hegemonismul":"hegemonism","hegemonismule":"hegemonism","hegemonismului":"hegemonism","hegemonul":"hegemon","hegemonule":"hegemon","hegemonului":"hegemon","heghemon":"hegemon","heghemone":"heghemonă","heghemonei":"heghemonă","heghemonele":"heghemonă","heghemonelor":"heghemonă","heghemoni":"heghemon","heghemonia":"heghemonie","heghemonica":["heghemonică","heghemonic","heghemonica","heghemonic"],"heghemonice":"heghemonic","heghemonicele":"heghemonic","heghemonici":"heghemonic","heghemonicii":"heghemonic","heghemonicul":"heghemonic","heghemoniei":"heghemonie","heghemonii":"heghemonie","heghemoniile":"heghemonie","heghemoniilor":"heghemonie","heghemonismul":"heghemonism","heghemonismule":"heghemonism","heghemonismului":"heghemonism","hegire":"hegiră","hegirei":"hegiră","heimatlosi":"heimatlos","heimatlosii":"heimatlos","heimatlosilor":"heimatlos","heimatlosul":"heimatlos","heimatlosule":"heimatlos","heimatlosului":"heimatlos","helance":"helancă","helancei":"helancă","helcologia":"helcologie","helcologiei":"helcologie","helcologii":"helcologie","helcologiile":"helcologie","helcologiilor":"helcologie","helcometre":"helcometru","helcometrele":"helcometru","helcometrelor":"helcometru","helcometrul":"helcometru","helcometrule":"helcometru","helcometrului":"helcometru","helcoze":"helcoză","helcozei":"helcoză","helcozele":"helcoză","helcozelor":"helcoză","helenista":["helenistă","helenist","helenista","helenist"],"heleniste":"helenist","helenistele":"helenist","helenisti":"helenist","helenistii":"helenist","helenistul":"helenist","helepolul":"helepol","helepolule":"helepol","helepolului":"helepol","helepoluri":"helepol","helepolurile":"helepol","helepolurilor":"helepol","helesteie":"heleșteu","helesteiele":"heleșteu","helesteielor":"heleșteu","helesteul":"heleșteu","helesteule":"heleșteu","helesteului":"heleșteu","helgea":"helge","helgi":"helge","helgii":"helge","helgile":"helge","helgilor":"helge","heliaca":["heliacă","heliac","heliaca","heliac"],"heliace":"heliac","heliacele":"heliac","heliaci":"heliac","heliacii":"heliac","heliacul":"heliac","helianti":"heliant","heliantii":"heliant","heliantilor":"heliant","heliantine":"heliantină","heliantinei":"heliantină","heliantinele":"heliantină","heliantinelor":"heliantină","heliantul":"heliant","heliantule":"heliant","heliantului":"heliant","heliasti":"heliast","heliastii":"heliast","heliastilor":"heliast","heliastul":"heliast","heliastule":"heliast","heliastului":"heliast","helicoane":"helicon","helicoanele":"helicon","helicoanelor":"helicon","helicoidala":["helicoidală","helicoidal","helicoidala","helicoidal"],"helicoidale":"helicoidal","helicoidalele":"helicoidal","helicoidali":"helicoidal","helicoidalii":"helicoidal","helicoidalul":"helicoidal","heliconul":"helicon","heliconule":"helicon","heliconului":"helicon","helicopter":"elicopter","helicoptere":"helicopter","helicopterele":"helicopter","helicopterelor":"helicopter","helicopterul":"helicopter","helicopterule":"helicopter","helicopterului":"helicopter","helictite":"helictită","helictitei":"helictită","helictitele":"helictită","helictitelor":"helictită","heliocentrale":"heliocentrală","heliocentralei":"heliocentrală","heliocentralele":"heliocentrală","heliocentralelor":"heliocentrală","heliocentrica":["heliocentrică","heliocentric","heliocentrica","heliocentric"],"heliocentrice":"heliocentric","heliocentricele":"heliocentric","heliocentrici":"heliocentric","heliocentricii":"heliocentric","heliocentricul":"heliocentric","heliocentrismul":"heliocentrism","heliocentrismule":"heliocentrism","heliocentrismului":"heliocentrism","heliocromia":"heliocromie","heliocromiei":"heliocromie","heliocromii":"heliocromie","heliocromiile":"heliocromie","heliocromiilor":"heliocromie","heliodorul":"heliodor","heliodorule":"heliodor","heliodorului":"heliodor","heliofila":["heliofilă","heliofil","heliofila","heliofil"],"heliofile":"heliofil","heliofilele":"heliofil","heliofili":"heliofil","heliofilia":"heliofilie","heliofiliei":"heliofilie","heliofilii":["heliofilii","heliofil","heliofilii","heliofilie"],"heliofilul":"heliofil","heliofoba":["heliofobă","heliofob","heliofoba","heliofob"],"heliofobe":["heliofobe","heliofob","heliofobe","heliofobă"],"heliofobei":"heliofobă","heliofobele":["heliofobele","heliofob","heliofobele","heliofobă"],"heliofobelor":"heliofobă","heliofobi":"heliofob","heliofobia":"heliofobie","heliofobiei":"heliofobie","heliofobii":["heliofobii","heliofob","heliofobii","heliofobie"],"heliofobiile":"heliofobie","heliofobiilor":"heliofobie","heliofobul":"heliofob","heliografe":"heliograf","heliografele":"heliograf","heliografelor":"heliograf","heliografia":"heliografie","heliografica":["heliografică","heliografic","heliografica","heliografic"],"heliografice":"heliografic","heliograficele":"heliografic","heliografici":"heliografic","heliograficii":"heliografic","heliograficul":"heliografic","heliografiei":"heliografie","heliografii":"heliografie","heliograful":"heliograf","heliografule":"heliograf","heliografului":"heliograf","heliogravori":"heliogravor","heliogravorii":"heliogravor","heliogravorilor":"heliogravor","heliogravorul":"heliogravor","heliogravorule":"heliogravor","heliogravorului":"heliogravor","heliogravuri":"heliogravură","heliogravurii":"heliogravură","heliogravurile":"heliogravură","heliogravurilor":"heliogravură","heliomarina":["heliomarină","heliomarin","heliomarina","heliomarin"],"heliomarine":"heliomarin","heliomarinele":"heliomarin","heliomarini":"heliomarin","heliomarinii":"heliomarin","heliomarinul":"heliomarin","heliometre":"heliometru","heliometrele":"heliometru","heliometrelor":"heliometru","heliometrica":["heliometrică","heliometric","heliometrica","heliometric"],"heliometrice":"heliometric","heliometricele":"heliometric","heliometrici":"heliometric","heliometricii":"heliometric","heliometricul":"heliometric","heliometrul":"heliometru","heliometrule":"heliometru","heliometrului":"heliometru","helioni":"helion","helionii":"helion","helionilor":"helion","helionul":"helion","helionule":"helion","helionului":"helion","helioscoape":"helioscop","helioscoapele":"helioscop","helioscoapelor":"helioscop","helioscopul":"helioscop","helioscopule":"helioscop","helioscopului":"helioscop","heliostate":"heliostat","heliostatele":"heliostat","heliostatelor":"heliostat","heliostatul":"heliostat","heliostatule":"heliostat","heliostatului":"heliostat","heliotactismul":"heliotactism","heliotactismule":"heliotactism","heliotactismului":"heliotactism","heliotehnica":["heliotehnică","heliotehnic","heliotehnica","heliotehnic"],"heliotehnice":["heliotehnice","heliotehnic","heliotehnice","heliotehnică"],"heliotehnicei":"heliotehnică","heliotehnicele":["heliotehnicele","heliotehnic","heliotehnicele","heliotehnică"],"heliotehnicelor":"heliotehnică","heliotehnici":"heliotehnic","heliotehniciene":"heliotehniciană","heliotehnicienei":"heliotehniciană","heliotehnicienele":"heliotehniciană","heliotehnicienelor":"heliotehniciană","heliotehnicii":"heliotehnic","heliotehnicul":"heliotehnic","helioterapia":"helioterapie","helioterapica":["helioterapică","helioterapic","helioterapica","helioterapic"],"helioterapice":"helioterapic","helioterapicele":"helioterapic","helioterapici":"helioterapic","helioterapicii":"helioterapic","helioterapicul":"helioterapic","helioterapiei":"helioterapie","helioterapii":"helioterapie","helioterapiile":"helioterapie","helioterapiilor":"helioterapie","helioterma":["heliotermă","helioterm","helioterma","helioterm"],"helioterme":"helioterm","heliotermele":"helioterm","heliotermi":"helioterm","heliotermia":"heliotermie","heliotermica":["heliotermică","heliotermic","heliotermica","heliotermic"],"heliotermice":"heliotermic","heliotermicele":"heliotermic","heliotermici":"heliotermic","heliotermicii":"heliotermic","heliotermicul":"heliotermic","heliotermiei":"heliotermie","heliotermii":["heliotermii","helioterm","heliotermii","heliotermie"],"heliotermiile":"heliotermie","heliotermiilor":"heliotermie","heliotermul":"helioterm","heliotipia":"heliotipie","heliotipiei":"heliotipie","heliotipii":"heliotipie","heliotipiile":"heliotipie","heliotipiilor":"heliotipie","heliotrope":"heliotrop","heliotropele":"heliotrop","heliotropelor":"heliotrop","heliotropica":["heliotropică","heliotropic","heliotropica","heliotropic"],"heliotropice":"heliotropic","heliotropicele":"heliotropic","heliotropici":"heliotropic","heliotropicii":"heliotropic","heliotropicul":"heliotropic","heliotropine":"heliotropină","heliotropinei":"heliotropină","heliotropinele":"heliotropină","heliotropinelor":"heliotropină","heliotropismul":"heliotropism","heliotropismule":"heliotropism","heliotropismului":"heliotropism","heliotropul":"heliotrop","heliotropule":"heliotrop","heliotropului":"heliotrop","helioze":"helioză","heliozei":"helioză","heliozele":"helioză","heliozelor":"helioză","heliporturi":"heliport","heliul":"heliu","heliule":"heliu","heliului":"heliu","helixul":"helix","helixule":"helix","helixului":"helix","helixuri":"helix","helixurile":"helix","helixurilor":"helix","helminti":"helmint","helmintiaze":"helmintiază","helmintiazei":"helmintiază","helmintiazele":"helmintiază","helmintiazelor":"helmintiază","helmintica":["helmintică","helmintic","helmintica","helmintic"],"helmintice":"helmintic","helminticele":"helmintic","helmintici":"helmintic","helminticii":"helmintic","helminticul":"helmintic","helmintii":"helmint","helmintilor":"helmint","helmintologia":"helmintologie","helmintologiei":"helmintologie","helmintologii":"helmintologie","helmintologiile":"helmintologie","helmintologiilor":"helmintologie","helmintosporioze":"helmintosporioză","helmintosporiozei":"helmintosporioză","helmintosporiozele":"helmintosporioză","helmintosporiozelor":"helmintosporioză","helmintul":"helmint","helmintule":"helmint","helmintului":"helmint","helofite":"helofită","helofitei":"helofită","helofitele":"helofită","helofitelor":"helofită","helveti":"helvet","helvetica":["helvetică","helvetic","helvetica","helvetic"],"helvetice":"helvetic","helveticele":"helvetic","helvetici":"helvetic","helveticii":"helvetic","helveticul":"helvetic","helvetii":"helvet","helvetilor":"helvet","helvetul":"helvet","helvetule":"helvet","helvetului":"helvet","hemangioame":"hemangiom","hemangioamele":"hemangiom","hemangioamelor":"hemangiom","hemangiomul":"hemangiom","hemangiomule":"hemangiom","hemangiomului":"hemangiom","hemartroze":"hemartroză","hemartrozei":"hemartroză","hemartrozele":"hemartroză","hemartrozelor":"hemartroză","hematemeze":"hematemeză","hematemezei":"hematemeză","hematemezele":"hematemeză","hematemezelor":"hematemeză","hematia":"hematie","hematica":["hematică","hematic","hematica","hematic"],"hematice":"hematic","hematicele":"hematic","hematici":"hematic","hematicii":"hematic","hematicul":"hematic","hematiei":"hematie","hematii":"hematie","hematiile":"hematie","hematiilor":"hematie","hematimetre":"hematimetru","hematimetrele":"hematimetru","hematimetrelor":"hematimetru","hematimetrul":"hematimetru","hematimetrule":"hematimetru","hematimetrului":"hematimetru","hematine":"hematină","hematinei":"hematină","hematinele":"hematină","hematinelor":"hematină","hematitul":"hematit","hematitule":"hematit","hematitului":"hematit","hematoame":"hematom","hematoamele":"hematom","hematoamelor":"hematom","hematoblastul":"hematoblast","hematoblastule":"hematoblast","hematoblastului":"hematoblast","hematoblasturi":"hematoblast","hematoblasturile":"hematoblast","hematoblasturilor":"hematoblast","hematocele":"hematocel","hematocelele":"hematocel","hematocelelor":"hematocel","hematocelul":"hematocel","hematocelule":"hematocel","hematocelului":"hematocel","hematocheratoze":"hematocheratoză","hematocheratozei":"hematocheratoză","hematocheratozele":"hematocheratoză","hematocheratozelor":"hematocheratoză","hematocolposul":"hematocolpos","hematocolposule":"hematocolpos","hematocolposului":"hematocolpos","hematocolposuri":"hematocolpos","hematocolposurile":"hematocolpos","hematocolposurilor":"hematocolpos","hematocrite":"hematocrit","hematocritele":"hematocrit","hematocritelor":"hematocrit","hematocritul":"hematocrit","hematocritule":"hematocrit","hematocritului":"hematocrit","hematocromul":"hematocrom","hematocromule":"hematocrom","hematocromului":"hematocrom","hematofage":"hematofagă","hematofagei":"hematofagă","hematofagele":"hematofagă","hematofagelor":"hematofagă","hematofagi":"hematofag","hematofagia":"hematofagie","hematofagiei":"hematofagie","hematofagii":["hematofagii","hematofag","hematofagii","hematofagie"],"hematofagiile":"hematofagie","hematofagiilor":"hematofagie","hematofagilor":"hematofag","hematofagul":"hematofag","hematofagule":"hematofag","hematofagului":"hematofag","hematofobia":"hematofobie","hematofobiei":"hematofobie","hematofobii":"hematofobie","hematofobiile":"hematofobie","hematofobiilor":"hematofobie","hematogeni":"hematogen","hematogenile":"hematogen","hematogenilor":"hematogen","hematogenul":"hematogen","hematogenule":"hematogen","hematogenului":"hematogen","hematoglobinometre":"hematoglobinometru","hematoglobinometrele":"hematoglobinometru","hematoglobinometrelor":"hematoglobinometru","hematoglobinometrul":"hematoglobinometru","hematoglobinometrule":"hematoglobinometru","hematoglobinometrului":"hematoglobinometru","hematologe":"hematologă","hematologei":"hematologă","hematologele":"hematologă","hematologelor":"hematologă","hematologi":"hematolog","hematologica":["hematologică","hematologic","hematologica","hematologic"],"hematologice":"hematologic","hematologicele":"hematologic","hematologici":"hematologic","hematologicii":"hematologic","hematologicul":"hematologic","hematologii":"hematolog","hematologilor":"hematolog","hematologul":"hematolog","hematologule":"hematolog","hematologului":"hematolog","hematometre":"hematometru","hematometrele":"hematometru","hematometrelor":"hematometru","hematometruul":"hematometru","hematometruule":"hematometru","hematometruului":"hematometru","hematomielia":"hematomielie","hematomieliei":"hematomielie","hematomielii":"hematomielie","hematomul":"hematom","hematomule":"hematom","hematomului":"hematom","hematopoietica":["hematopoietică","hematopoietic","hematopoietica","hematopoietic"],"hematopoietice":"hematopoietic","hematopoieticele":"hematopoietic","hematopoietici":"hematopoietic","hematopoieticii":"hematopoietic","hematopoieticul":"hematopoietic","hematopoieze":"hematopoieză","hematopoiezei":"hematopoieză","hematopoiezele":"hematopoieză","hematopoiezelor":"hematopoieză","hematoporfirine":"hematoporfirină","hematoporfirinei":"hematoporfirină","hematoporfirinele":"hematoporfirină","hematoporfirinelor":"hematoporfirină","hematosalpinxul":"hematosalpinx","hematosalpinxule":"hematosalpinx","hematosalpinxului":"hematosalpinx","hematosalpinxuri":"hematosalpinx","hematosalpinxurile":"hematosalpinx","hematosalpinxurilor":"hematosalpinx","hematospermia":"hematospermie","hematospermiei":"hematospermie","hematospermii":"hematospermie","hematospermiile":"hematospermie","hematospermiilor":"hematospermie","hematoterapia":"hematoterapie","hematoterapiei":"hematoterapie","hematoterapii":"hematoterapie","hematoterapiile":"hematoterapie","hematoterapiilor":"hematoterapie","hematoxiline":"hematoxilină","hematoxilinei":"hematoxilină","hematoxilinele":"hematoxilină","hematoxilinelor":"hematoxilină","hematoze":"hematoză","hematozei":"hematoză","hematozele":"hematoză","hematozelor":"hematoză","hematozoare":"hematozoar","hematozoarele":"hematozoar","hematozoarelor":"hematozoar","hematozoarul":"hematozoar","hematozoarule":"hematozoar","hematozoarului":"hematozoar","hematuria":"hematurie","hematurica":["hematurică","hematuric","hematurica","hematuric"],"hematurice":"hematuric","hematuricele":"hematuric","hematurici":"hematuric","hematuricii":"hematuric","hematuricul":"hematuric","hematuriei":"hematurie","hematurii":"hematurie","hematuriile":"hematurie","hematuriilor":"hematurie","hemeiuge":"hemeiugă","hemeiugei":"hemeiugă","hemeralope":"hemeralopă","hemeralopei":"hemeralopă","hemeralopele":"hemeralopă","hemeralopelor":"hemeralopă","hemeralopia":"hemeralopie","hemeralopiei":"hemeralopie","hemeralopii":"hemeralopie","hemeralopiile":"hemeralopie","hemeralopiilor":"hemeralopie","hemerocalul":"hemerocal","hemerocalule":"hemerocal","hemerocalului":"hemerocal","hemerologe":"hemerologă","hemerologei":"hemerologă","hemerologele":"hemerologă","hemerologelor":"hemerologă","hemerologi":"hemerolog","hemerologia":"hemerologie","hemerologica":["hemerologică","hemerologic","hemerologica","hemerologic"],"hemerologice":"hemerologic","hemerologicele":"hemerologic","hemerologici":"hemerologic","hemerologicii":"hemerologic","hemerologicul":"hemerologic","hemerologiei":"hemerologie","hemerologii":["hemerologii","hemerolog","hemerologii","hemerologie"],"hemerologiile":"hemerologie","hemerologiilor":"hemerologie","hemerologilor":"hemerolog","hemerologul":"hemerolog","hemerologule":"hemerolog","hemerologului":"hemerolog","hemeroteci":"hemerotecă","hemerotecii":"hemerotecă","hemerotecile":"hemerotecă","hemerotecilor":"hemerotecă","hemesita":["hemesită","hemesit","hemesita","hemesit"],"hemesite":"hemesit","hemesitele":"hemesit","hemesiti":"hemesit","hemesitii":"hemesit","hemesitul":"hemesit","hemialgia":"hemialgie","hemialgiei":"hemialgie","hemialgii":"hemialgie","hemialgiile":"hemialgie","hemialgiilor":"hemialgie","hemianestezia":"hemianestezie","hemianesteziei":"hemianestezie","hemianestezii":"hemianestezie","hemianesteziile":"hemianestezie","hemianesteziilor":"hemianestezie","hemianopsia":"hemianopsie","hemianopsiei":"hemianopsie","hemianopsii":"hemianopsie","hemianopsiile":"hemianopsie","hemianopsiilor":"hemianopsie","hemiataxia":"hemiataxie","hemiataxiei":"hemiataxie","hemiataxii":"hemiataxie","hemiatrofia":"hemiatrofie","hemiatrofiei":"hemiatrofie","hemiatrofii":"hemiatrofie","hemiatrofiile":"hemiatrofie","hemiatrofiilor":"hemiatrofie","hemiceluloze":"hemiceluloză","hemicelulozei":"hemiceluloză","hemicelulozele":"hemiceluloză","hemicelulozelor":"hemiceluloză","hemiciclul":"hemiciclu","hemiciclule":"hemiciclu","hemiciclului":"hemiciclu","hemicicluri":"hemiciclu","hemiciclurile":"hemiciclu","hemiciclurilor":"hemiciclu","hemicrania":"hemicranie","hemicraniei":"hemicranie","hemicranii":"hemicranie","hemicraniile":"hemicranie","hemicraniilor":"hemicranie","hemicriptofite":"hemicriptofită","hemicriptofitei":"hemicriptofită","hemicriptofitele":"hemicriptofită","hemicriptofitelor":"hemicriptofită","hemicristalina":["hemicristalină","hemicristalin","hemicristalina","hemicristalin"],"hemicristaline":"hemicristalin","hemicristalinele":"hemicristalin","hemicristalini":"hemicristalin","hemicristalinii":"hemicristalin","hemicristalinul":"hemicristalin","hemiedria":"hemiedrie","hemiedrica":["hemiedrică","hemiedric","hemiedrica","hemiedric"],"hemiedrice":"hemiedric","hemiedricele":"hemiedric","hemiedrici":"hemiedric","hemiedricii":"hemiedric","hemiedricul":"hemiedric","hemiedriei":"hemiedrie","hemiedrii":"hemiedrie","hemimele":"hemimelă","hemimelei":"hemimelă","hemimelele":"hemimelă","hemimelelor":"hemimelă","hemimelia":"hemimelie","hemimeliei":"hemimelie","hemimelii":"hemimelie","hemimeliile":"hemimelie","hemimeliilor":"hemimelie","hemimetabola":["hemimetabolă","hemimetabol","hemimetabola","hemimetabol"],"hemimetabole":["hemimetabole","hemimetabol","hemimetabole","hemimetabolă"],"hemimetabolele":["hemimetabolele","hemimetabol","hemimetabolele","hemimetabolă"],"hemimetaboli":"hemimetabol","hemimetabolii":"hemimetabol","hemimetabolul":"hemimetabol","hemimorfite":"hemimorfit","hemimorfitele":"hemimorfit","hemimorfitelor":"hemimorfit","hemimorfitul":"hemimorfit","hemimorfitule":"hemimorfit","hemimorfitului":"hemimorfit","hemine":"hemină","heminei":"hemină","heminele":"hemină","heminelor":"hemină","hemioni":"hemion","hemionii":"hemion","hemionilor":"hemion","hemionul":"hemion","hemionule":"hemion","hemionului":"hemion","hemiopia":"hemiopie","hemiopiei":"hemiopie","hemiopii":"hemiopie","hemiopiile":"hemiopie","hemiopiilor":"hemiopie","hemiparestezia":"hemiparestezie","hemiparesteziei":"hemiparestezie","hemiparestezii":"hemiparestezie","hemiparesteziile":"hemiparestezie","hemiparesteziilor":"hemiparestezie","hemipareze":"hemipareză","hemiparezei":"hemipareză","hemiparezele":"hemipareză","hemiparezelor":"hemipareză","hemiplegia":"hemiplegie","hemiplegice":"hemiplegică","hemiplegicei":"hemiplegică","hemiplegicele":"hemiplegică","hemiplegicelor":"hemiplegică","hemiplegici":"hemiplegic","hemiplegicii":"hemiplegic","hemiplegicilor":"hemiplegic","hemiplegicul":"hemiplegic","hemiplegicule":"hemiplegic","hemiplegicului":"hemiplegic","hemiplegiei":"hemiplegie","hemiplegii":"hemiplegie","hemiplegiile":"hemiplegie","hemiplegiilor":"hemiplegie","hemiplexia":"hemiplexie","hemiplexiei":"hemiplexie","hemiplexii":"hemiplexie","hemiptere":"hemipter","hemipterele":"hemipter","hemipterelor":"hemipter","hemipterul":"hemipter","hemipterule":"hemipter","hemipterului":"hemipter","hemisfere":"hemisferă","hemisferei":"hemisferă","hemisferele":"hemisferă","hemisferelor":"hemisferă","hemispasme":"hemispasm","hemispasmele":"hemispasm","hemispasmelor":"hemispasm","hemispasmul":"hemispasm","hemispasmule":"hemispasm","hemispasmului":"hemispasm","hemistihuri":"hemistih","hemocianine":"hemocianină","hemocianinei":"hemocianină","hemocianinele":"hemocianină","hemocianinelor":"hemocianină","hemocite":"hemocit","hemocitele":"hemocit","hemocitelor":"hemocit","hemocitometre":"hemocitometru","hemocitometrele":"hemocitometru","hemocitometrelor":"hemocitometru","hemocitometrul":"hemocitometru","hemocitometrule":"hemocitometru","hemocitometrului":"hemocitometru","hemocitul":"hemocit","hemocitule":"hemocit","hemocitului":"hemocit","hemoculture":"hemocultură","hemoculturei":"hemocultură","hemoculturele":"hemocultură","hemoculturelor":"hemocultură","hemoculturi":"hemocultură","hemodialize":"hemodializă","hemodializei":"hemodializă","hemodializele":"hemodializă","hemodializelor":"hemodializă","hemodializori":"hemodializor","hemodializorii":"hemodializor","hemodializorilor":"hemodializor","hemodializorul":"hemodializor","hemodializorule":"hemodializor","hemodializorului":"hemodializor","hemodinamice":"hemodinamică","hemodinamicei":"hemodinamică","hemodinamicele":"hemodinamică","hemodinamicelor":"hemodinamică","hemodinamometre":"hemodinamometru","hemodinamometrele":"hemodinamometru","hemodinamometrelor":"hemodinamometru","hemodinamometrul":"hemodinamometru","hemodinamometrule":"hemodinamometru","hemodinamometrului":"hemodinamometru","hemofaga":["hemofagă","hemofag","hemofaga","hemofag"],"hemofage":"hemofag","hemofagele":"hemofag","hemofagi":"hemofag","hemofagii":"hemofag","hemofagul":"hemofag","hemofilia":"hemofilie","hemofilica":["hemofilică","hemofilic","hemofilica","hemofilic"],"hemofilice":"hemofilic","hemofilicele":"hemofilic","hemofilici":"hemofilic","hemofilicii":"hemofilic","hemofilicilor":"hemofilic","hemofilicul":"hemofilic","hemofilicule":"hemofilic","hemofilicului":"hemofilic","hemofiliei":"hemofilie","hemofilii":"hemofilie","hemofiliile":"hemofilie","hemofiliilor":"hemofilie","hemoftalmia":"hemoftalmie","hemoftalmiei":"hemoftalmie","hemoftalmii":"hemoftalmie","hemogenia":"hemogenie","hemogenice":"hemogenică","hemogenicei":"hemogenică","hemogenicele":"hemogenică","hemogenicelor":"hemogenică","hemogenici":"hemogenic","hemogenicii":"hemogenic","hemogenicilor":"hemogenic","hemogenicul":"hemogenic","hemogenicule":"hemogenic","hemogenicului":"hemogenic","hemogeniei":"hemogenie","hemogenii":"hemogenie","hemogeniile":"hemogenie","hemogeniilor":"hemogenie","hemoglobine":"hemoglobină","hemoglobinei":"hemoglobină","hemoglobinele":"hemoglobină","hemoglobinelor":"hemoglobină","hemoglobinemia":"hemoglobinemie","hemoglobinemiei":"hemoglobinemie","hemoglobinemii":"hemoglobinemie","hemoglobinemiile":"hemoglobinemie","hemoglobinemiilor":"hemoglobinemie","hemoglobinometre":"hemoglobinometru","hemoglobinometrele":"hemoglobinometru","hemoglobinometrelor":"hemoglobinometru","hemoglobinometria":"hemoglobinometrie","hemoglobinometriei":"hemoglobinometrie","hemoglobinometrii":"hemoglobinometrie","hemoglobinometriile":"hemoglobinometrie","hemoglobinometriilor":"hemoglobinometrie","hemoglobinometrul":"hemoglobinometru","hemoglobinometrule":"hemoglobinometru","hemoglobinometrului":"hemoglobinometru","hemoglobinopatia":"hemoglobinopatie","hemoglobinopatiei":"hemoglobinopatie","hemoglobinopatii":"hemoglobinopatie","hemoglobinopatiile":"hemoglobinopatie","hemoglobinopatiilor":"hemoglobinopatie","hemoglobinuria":"hemoglobinurie","hemoglobinuriei":"hemoglobinurie","hemoglobinurii":"hemoglobinurie","hemoglobinuriile":"hemoglobinurie","hemoglobinuriilor":"hemoglobinurie","hemograme":"hemogramă","hemogramei":"hemogramă","hemogramele":"hemogramă","hemogramelor":"hemogramă","hemoleucograme":"hemoleucogramă","hemoleucogramei":"hemoleucogramă","hemoleucogramele":"hemoleucogramă","hemoleucogramelor":"hemoleucogramă","hemolimfe":"hemolimfă","hemolimfei":"hemolimfă","hemolimfele":"hemolimfă","hemolimfelor":"hemolimfă","hemolitica":["hemolitică","hemolitic","hemolitica","hemolitic"],"hemolitice":"hemolitic","hemoliticele":"hemolitic","hemolitici":"hemolitic","hemoliticii":"hemolitic","hemoliticul":"hemolitic","hemolize":"hemoliză","hemolizei":"hemoliză","hemolizele":"hemoliză","hemolizelor":"hemoliză","hemolizine":"hemolizină","hemolizinei":"hemolizină","hemolizinele":"hemolizină","hemolizinelor":"hemolizină","hemometre":"hemometru","hemometrele":"hemometru","hemometrelor":"hemometru","hemometrul":"hemometru","hemometrule":"hemometru","hemometrului":"hemometru","hemopatia":"hemopatie","hemopatica":["hemopatică","hemopatic","hemopatica","hemopatic"],"hemopatice":"hemopatic","hemopaticele":"hemopatic","hemopatici":"hemopatic","hemopaticii":"hemopatic","hemopaticul":"hemopatic","hemopatiei":"hemopatie","hemopatii":"hemopatie","hemopatiile":"hemopatie","hemopatiilor":"hemopatie","hemopoieze":"hemopoieză","hemopoiezei":"hemopoieză","hemopoiezele":"hemopoieză","hemopoiezelor":"hemopoieză","hemoptizia":"hemoptizie","hemoptizice":"hemoptizică","hemoptizicei":"hemoptizică","hemoptizicele":"hemoptizică","hemoptizicelor":"hemoptizică","hemoptiziei":"hemoptizie","hemoptizii":"hemoptizie","hemoptiziile":"hemoptizie","hemoptiziilor":"hemoptizie","hemoragia":"hemoragie","hemoragica":["hemoragică","hemoragic","hemoragica","hemoragic"],"hemoragice":"hemoragic","hemoragicele":"hemoragic","hemoragici":"hemoragic","hemoragicii":"hemoragic","hemoragicul":"hemoragic","hemoragiei":"hemoragie","hemoragii":"hemoragie","hemoragii nazale":"hemoragie nazală","hemoragiile":"hemoragie","hemoragiilor":"hemoragie","hemoreea":"hemoree","hemoreei":"hemoree","hemoreele":"hemoree","hemoreelor":"hemoree","hemoroidala":["hemoroidală","hemoroidal","hemoroidala","hemoroidal"],"hemoroidale":"hemoroidal","hemoroidalele":"hemoroidal","hemoroidali":"hemoroidal","hemoroidalii":"hemoroidal","hemoroidalul":"hemoroidal","hemoroidara":["hemoroidară","hemoroidar","hemoroidara","hemoroidar"],"hemoroidare":"hemoroidar","hemoroidarele":"hemoroidar","hemoroidari":"hemoroidar","hemoroidarii":"hemoroidar","hemoroidarul":"hemoroidar","hemoroidectomia":"hemoroidectomie","hemoroidectomiei":"hemoroidectomie","hemoroidectomii":"hemoroidectomie","hemoroidectomiile":"hemoroidectomie","hemoroidectomiilor":"hemoroidectomie","hemoroidul":"hemoroid","hemoroidule":"hemoroid","hemoroidului":"hemoroid","hemoroizi":"hemoroid","hemoroizii":"hemoroid","hemoroizilor":"hemoroid","hemosiderine":"hemosiderină","hemosiderinei":"hemosiderină","hemosiderinele":"hemosiderină","hemosiderinelor":"hemosiderină","hemosideroze":"hemosideroză","hemosiderozei":"hemosideroză","hemosiderozele":"hemosideroză","hemosiderozelor":"hemosideroză","hemospermia":"hemospermie","hemospermiei":"hemospermie","hemospermii":"hemospermie","hemospermiile":"hemospermie","hemospermiilor":"hemospermie","hemostatica":["hemostatică","hemostatic","hemostatica","hemostatic"],"hemostatice":"hemostatic","hemostaticele":"hemostatic","hemostatici":"hemostatic","hemostaticii":"hemostatic","hemostaticul":"hemostatic","hemostaze":"hemostază","hemostazei":"hemostază","hemostazele":"hemostază","hemostazelor":"hemostază","hemoterapia":"hemoterapie","hemoterapiei":"hemoterapie","hemoterapii":"hemoterapie","hemoterapiile":"hemoterapie","hemoterapiilor":"hemoterapie","hemotoraxul":"hemotorax","hemotoraxule":"hemotorax","hemotoraxului":"hemotorax","hemotoxia":"hemotoxie","hemotoxiei":"hemotoxie","hemotoxii":"hemotoxie","hemotoxiile":"hemotoxie","hemotoxiilor":"hemotoxie","hemotoxine":"hemotoxină","hemotoxinei":"hemotoxină","hemotoxinele":"hemotoxină","hemotoxinelor":"hemotoxină","hemotropa":["hemotropă","hemotrop","hemotropa","hemotrop"],"hemotrope":"hemotrop","hemotropele":"hemotrop","hemotropi":"hemotrop","hemotropii":"hemotrop","hemotropul":"hemotrop","hemul":"hem","hemule":"hem","hemului":"hem","hemuri":"hem","hemurile":"hem","hemurilor":"hem","hendiade":"hendiadă","hendiadei":"hendiadă","hendiadele":"hendiadă","hendiadelor":"hendiadă","hengheri":"hengher","hengherii":"hengher","hengherilor":"hengher","hengherul":"hengher","hengherule":"hengher","hengherului":"hengher","henoteismul":"henoteism","henoteismule":"henoteism","henoteismului":"henoteism","henriul":"henri","henriule":"henri","henriului":"henri","henryul":"henry","henryule":"henry","henryului":"henry","hentiparestezia":"hentiparestezie","hentiparesteziei":"hentiparestezie","hentiparestezii":"hentiparestezie","hentul":"henț","hentule":"henț","hentului":"henț","henturi":"henț","henturile":"henț","henturilor":"henț","heortologia":"heortologie","heortologiei":"heortologie","heortologii":"heortologie","heparine":"heparină","heparinei":"heparină","heparinele":"heparină","heparinelor":"heparină","heparinemia":"heparinemie","heparinemiei":"heparinemie","heparinemii":"heparinemie","hepatalgia":"hepatalgie","hepatalgiei":"hepatalgie","hepatalgii":"hepatalgie","hepatalgiile":"hepatalgie","hepatalgiilor":"hepatalgie","hepatectomia":"hepatectomie","hepatectomiei":"hepatectomie","hepatectomii":"hepatectomie","hepatectomiile":"hepatectomie","hepatectomiilor":"hepatectomie","hepatica":["hepatică","hepatic","hepatica","hepatic"],"hepatice":"hepatic","hepaticele":"hepatic","hepatici":"hepatic","hepaticii":"hepatic","hepaticotomia":"hepaticotomie","hepaticotomiei":"hepaticotomie","hepaticotomii":"hepaticotomie","hepaticotomiile":"hepaticotomie","hepaticotomiilor":"hepaticotomie","hepaticul":"hepatic","hepatite":"hepatită","hepatitei":"hepatită","hepatitele":"hepatită","hepatitelor":"hepatită","hepatizatia":"hepatizație","hepatizatiei":"hepatizație","hepatizatii":"hepatizație","hepatoame":"hepatom","hepatoamele":"hepatom","hepatoamelor":"hepatom","hepatocele":"hepatocel","hepatocelele":"hepatocel","hepatocelelor":"hepatocel","hepatocelul":"hepatocel","hepatocelule":"hepatocel","hepatocelului":"hepatocel","hepatocite":"hepatocit","hepatocitele":"hepatocit","hepatocitelor":"hepatocit","hepatocitul":"hepatocit","hepatocitule":"hepatocit","hepatocitului":"hepatocit","hepatogena":["hepatogenă","hepatogen","hepatogena","hepatogen"],"hepatogene":"hepatogen","hepatogenele":"hepatogen","hepatogeni":"hepatogen","hepatogenii":"hepatogen","hepatogenul":"hepatogen","hepatografia":"hepatografie","hepatografiei":"hepatografie","hepatografii":"hepatografie","hepatografiile":"hepatografie","hepatografiilor":"hepatografie","hepatologe":"hepatologă","hepatologei":"hepatologă","hepatologele":"hepatologă","hepatologelor":"hepatologă","hepatologi":"hepatolog","hepatologia":"hepatologie","hepatologica":["hepatologică","hepatologic","hepatologica","hepatologic"],"hepatologice":"hepatologic","hepatologicele":"hepatologic","hepatologici":"hepatologic","hepatologicii":"hepatologic","hepatologicul":"hepatologic","hepatologiei":"hepatologie","hepatologii":["hepatologii","hepatolog","hepatologii","hepatologie"],"hepatologilor":"hepatolog","hepatologul":"hepatolog","hepatologule":"hepatolog","hepatologului":"hepatolog","hepatomegalia":"hepatomegalie","hepatomegaliei":"hepatomegalie","hepatomegalii":"hepatomegalie","hepatomegaliile":"hepatomegalie","hepatomegaliilor":"hepatomegalie","hepatomul":"hepatom","hepatomule":"hepatom","hepatomului":"hepatom","hepatopancrease":"hepatopancreas","hepatopancreasele":"hepatopancreas","hepatopancreaselor":"hepatopancreas","hepatopancreasul":"hepatopancreas","hepatopancreasule":"hepatopancreas","hepatopancreasului":"hepatopancreas","hepatopatia":"hepatopatie","hepatopatiei":"hepatopatie","hepatopatii":"hepatopatie","hepatopatiile":"hepatopatie","hepatopatiilor":"hepatopatie","hepatopexia":"hepatopexie","hepatopexiei":"hepatopexie","hepatopexii":"hepatopexie","hepatoptoze":"hepatoptoză","hepatoptozei":"hepatoptoză","hepatoptozele":"hepatoptoză","hepatoptozelor":"hepatoptoză","hepatorafia":"hepatorafie","hepatorafiei":"hepatorafie","hepatorafii":"hepatorafie","hepatoragia":"hepatoragie","hepatoragiei":"hepatoragie","hepatoragii":"hepatoragie","hepatoragiile":"hepatoragie","hepatoragiilor":"hepatoragie","hepatostomia":"hepatostomie","hepatostomiei":"hepatostomie","hepatostomii":"hepatostomie","hepatostomiile":"hepatostomie","hepatostomiilor":"hepatostomie","hepatotomia":"hepatotomie","hepatotomiei":"hepatotomie","hepatotomii":"hepatotomie","hepatotomiile":"hepatotomie","hepatotomiilor":"hepatotomie","hepatotoxemia":"hepatotoxemie","hepatotoxemiei":"hepatotoxemie","hepatotoxemii":"hepatotoxemie","hepatotoxemiile":"hepatotoxemie","hepatotoxemiilor":"hepatotoxemie","hepatotoxine":"hepatotoxină","hepatotoxinei":"hepatotoxină","hepatotoxinele":"hepatotoxină","hepatotoxinelor":"hepatotoxină","hepatotropa":["hepatotropă","hepatotrop","hepatotropa","hepatotrop"],"hepatotrope":"hepatotrop","hepatotropele":"hepatotrop","hepatotropi":"hepatotrop","hepatotropii":"hepatotrop","hepatotropul":"hepatotrop","heptacordul":"heptacord","heptacordule":"heptacord","heptacordului":"heptacord","heptacorduri":"heptacord","heptacordurile":"heptacord","heptacordurilor":"heptacord","heptaedre":"heptaedru","heptaedrele":"heptaedru","heptaedrelor":"heptaedru","heptaedrica":["heptaedrică","heptaedric","heptaedrica","heptaedric"],"heptaedrice":"heptaedric","heptaedricele":"heptaedric","heptaedrici":"heptaedric","heptaedricii":"heptaedric","heptaedricul":"heptaedric","heptaedrul":"heptaedru","heptaedrule":"heptaedru","heptaedrului":"heptaedru","heptagoane":"heptagon","heptagonala":["heptagonală","heptagonal","heptagonala","heptagonal"],"heptagonale":"heptagonal","heptagonalele":"heptagonal","heptagonali":"heptagonal","heptagonalii":"heptagonal","heptagonalul":"heptagonal","heptametre":"heptametru","heptametrele":"heptametru","heptametrelor":"heptametru","heptametrul":"heptametru","heptametrule":"heptametru","heptametrului":"heptametru","heptani":"heptan","heptanii":"heptan","heptanilor":"heptan","heptanul":"heptan","heptanule":"heptan","heptanului":"heptan","heptaoxidul":"heptaoxid","heptaoxidule":"heptaoxid","heptaoxidului":"heptaoxid","heptaoxizi":"heptaoxid","heptaoxizii":"heptaoxid","heptaoxizilor":"heptaoxid","heptarhia":"heptarhie","heptarhiei":"heptarhie","heptarhii":"heptarhie","heptatlonul":"heptatlon","heptatlonule":"heptatlon","heptatlonului":"heptatlon","heptavalenta":["heptavalentă","heptavalent","heptavalenta","heptavalent"],"heptavalente":"heptavalent","heptavalentele":"heptavalent","heptavalenti":"heptavalent","heptavalentii":"heptavalent","heptavalentul":"heptavalent","heptode":"heptodă","heptodei":"heptodă","heptodele":"heptodă","heptodelor":"heptodă","heraldica":["heraldică","heraldic","heraldica","heraldic"],"heraldice":"heraldic","heraldicele":"heraldic","heraldici":["heraldici","heraldic","heraldici","heraldică"],"heraldicii":["heraldicii","heraldic","heraldicii","heraldică"],"heraldicile":"heraldică","heraldicilor":"heraldică","heraldicul":"heraldic","heraldisti":"heraldist","heraldistii":"heraldist","heraldistilor":"heraldist","heraldistul":"heraldist","heraldistule":"heraldist","heraldistului":"heraldist","heraldul":"herald","heraldule":"herald","heraldului":"herald","heralzi":"herald","heralzii":"herald","heralzilor":"herald","herastraie":"herăstrău","herastraiele":"herăstrău","herastraielor":"herăstrău","herastrauul":"herăstrău","herastrauule":"herăstrău","herastrauului":"herăstrău","herbare":"herbar","herbarele":"herbar","herbarelor":"herbar","herbarul":"herbar","herbarule":"herbar","herbarului":"herbar","herbologe":"herbologă","herbologei":"herbologă","herbologele":"herbologă","herbologelor":"herbologă","herbul":"herb","herbule":"herb","herbului":"herb","herburi":"herb","herburile":"herb","herburilor":"herb","hercinica":["hercinică","hercinic","hercinica","hercinic"],"hercinice":"hercinic","hercinicele":"hercinic","hercinici":"hercinic","hercinicii":"hercinic","hercinicul":"hercinic","herculeana":["herculeană","herculean","herculeana","herculean"],"herculeanul":"herculean","herculeeana":["herculeeană","herculeean","herculeeana","herculeean"],"herculeeanul":"herculeean","herculeene":"herculeean","herculeenele":"herculeean","herculeeni":"herculeean","herculeenii":"herculeean","herculene":"herculean","herculenele":"herculean","herculeni":"herculean","herculenii":"herculean","herculeul":"hercule","herculeule":"hercule","herculeului":"hercule","herculi":"hercule","herculii":"hercule","herculilor":"hercule","heredeul":"herede","heredeule":"herede","heredeului":"herede","hereghia":"hereghie","hereghiei":"hereghie","hereghii":"hereghie","hereghiile":"hereghie","hereghiilor":"hereghie","herestrauul":"herestrău","herestrauule":"herestrău","herestrauului":"herestrău","heretisea":"heretisi","heretiseai":"heretisi","heretiseam":"heretisi","heretiseati":"heretisi","heretiseau":"heretisi","heretisele":"heretiseală","heretiselei":"heretiseală","heretiselele":"heretiseală","heretiselelor":"heretiseală","heretiseli":"heretiseală","heretisesc":"heretisi","heretiseste":"heretisi","heretisesti":"heretisi","heretisii":"heretisi","heretisim":"heretisi","heretisind":"heretisi","heretisira":"heretisi","heretisiram":"heretisi","heretisirati":"heretisi","heretisirea":"heretisire","heretisiri":"heretisire","heretisirii":"heretisire","heretisirile":"heretisire","heretisirilor":"heretisire","heretisise":"heretisi","heretisisem":"heretisi","heretisisera":"heretisi","heretisiseram":"heretisi","heretisiserati":"heretisi","heretisisesi":"heretisi","heretisisi":"heretisi","heretisit":"heretisi","heretisiti":"heretisi","heretismosul":"heretismos","heretismosule":"heretismos","heretismosului":"heretismos","herezi":"herede","herezii":"herede","herezilor":"herede","herghelegii":["herghelegii","herghelegiu","herghelegii","hergheligiu"],"herghelegiii":["herghelegiii","herghelegiu","herghelegiii","hergheligiu"],"herghelegiilor":["herghelegiilor","herghelegiu","herghelegiilor","hergheligiu"],"herghelegiul":"hergheligiu","herghelegiule":"hergheligiu","herghelegiului":"hergheligiu","herghelegiuul":"herghelegiu","herghelegiuule":"herghelegiu","herghelegiuului":"herghelegiu","herghelia":"herghelie","hergheliei":"herghelie","herghelii":"herghelie","hergheliile":"herghelie","hergheliilor":"herghelie","heringi":"hering","heringii":"hering","heringilor":"hering","heringul":"hering","heringule":"hering","heringului":"hering","hermafrodisme":"hermafrodism","hermafrodismele":"hermafrodism","hermafrodismelor":"hermafrodism","hermafrodismul":"hermafrodism","hermafrodismule":"hermafrodism","hermafrodismului":"hermafrodism","hermafrodita":["hermafrodită","hermafrodit","hermafrodita","hermafrodit"],"hermafrodite":"hermafrodit","hermafroditele":"hermafrodit","hermafroditi":"hermafrodit","hermafroditii":"hermafrodit","hermafroditisme":"hermafroditism","hermafroditismele":"hermafroditism","hermafroditismelor":"hermafroditism","hermafroditismul":"hermafroditism","hermafroditismule":"hermafroditism","hermafroditismului":"hermafroditism","hermafroditul":"hermafrodit","hermandade":"hermandad","hermandadele":"hermandad","hermandadelor":"hermandad","hermandadul":"hermandad","hermandadule":"hermandad","hermandadului":"hermandad","hermeline":"hermelină","hermelinei":"hermelină","hermelinele":"hermelină","hermelinelor":"hermelină","hermeneuti":"hermeneut","hermeneutica":["hermeneutică","hermeneutic","hermeneutica","hermeneutic"],"hermeneutice":"hermeneutic","hermeneuticele":"hermeneutic"};
@@ -0,0 +1 @@
+export default {"hermeneutici":["hermeneutici","hermeneutic","hermeneutici","hermeneutică"],"hermeneuticii":["hermeneuticii","hermeneutic","hermeneuticii","hermeneutică"],"hermeneuticul":"hermeneutic","hermentia":"hermenție","hermentiei":"hermenție","hermentii":"hermenție","hermetica":["hermetică","hermetic","hermetica","hermetic"],"hermetice":"hermetic","hermeticele":"hermetic","hermetici":"hermetic","hermeticii":"hermetic","hermeticul":"hermetic","hermine":"hermină","herminei":"hermină","herminele":"hermină","herminelor":"hermină","herniara":["herniară","herniar","herniara","herniar"],"herniare":"herniar","herniarele":"herniar","herniari":"herniar","herniarii":"herniar","herniarul":"herniar","hernii":"hernie","hernii de disc":"hernie de disc","hernii strangulate":"hernie strangulată","herniotomia":"herniotomie","herniotomiei":"herniotomie","herniotomii":"herniotomie","herniotomiile":"herniotomie","herniotomiilor":"herniotomie","heroine":"heroină","heroinei":"heroină","heroinele":"heroină","heroinelor":"heroină","heroinomane":"heroinomană","heroinomanei":"heroinomană","heroinomanele":"heroinomană","heroinomanelor":"heroinomană","heroinomani":"heroinoman","heroinomania":"heroinomanie","heroinomaniei":"heroinomanie","heroinomanii":["heroinomanii","heroinoman","heroinomanii","heroinomanie"],"heroinomaniile":"heroinomanie","heroinomaniilor":"heroinomanie","heroinomanilor":"heroinoman","heroinomanul":"heroinoman","heroinomanule":"heroinoman","heroinomanului":"heroinoman","herostratica":["herostratică","herostratic","herostratica","herostratic"],"herostratice":"herostratic","herostraticele":"herostratic","herostratici":"herostratic","herostraticii":"herostratic","herostraticul":"herostratic","herouul":"herou","herouule":"herou","herouului":"herou","herpesul":"herpes","herpesule":"herpes","herpesului":"herpes","herpesuri":"herpes","herpesurile":"herpes","herpesurilor":"herpes","herpetica":["herpetică","herpetic","herpetica","herpetic"],"herpetice":"herpetic","herpeticele":"herpetic","herpetici":"herpetic","herpeticii":"herpetic","herpeticul":"herpetic","herpetiforma":["herpetiformă","herpetiform","herpetiforma","herpetiform"],"herpetiforme":"herpetiform","herpetiformele":"herpetiform","herpetiformi":"herpetiform","herpetiformii":"herpetiform","herpetiformul":"herpetiform","herpetologia":"herpetologie","herpetologiei":"herpetologie","herpetologii":"herpetologie","herse":"hersă","hersei":"hersă","hersele":"hersă","herselor":"hersă","hertegi":"herțeg","hertegii":"herțeg","hertegilor":"herțeg","hertegul":"herțeg","hertegule":"herțeg","hertegului":"herțeg","hertogul":"herțog","hertogule":"herțog","hertogului":"herțog","hertzi":"hertz","hertziana":["hertziană","hertzian","hertziana","hertzian"],"hertzianul":"hertzian","hertziene":"hertzian","hertzienele":"hertzian","hertzieni":"hertzian","hertzienii":"hertzian","hertzii":"hertz","hertzilor":"hertz","hertzul":"hertz","hertzule":"hertz","hertzului":"hertz","herule":"herulă","herulei":"herulă","herulele":"herulă","herulelor":"herulă","heruvimi":"heruvim","heruvimii":"heruvim","heruvimilor":"heruvim","heruvimul":"heruvim","heruvimule":"heruvim","heruvimului":"heruvim","hessianul":"hessian","hessianule":"hessian","hessianului":"hessian","hetaire":"hetairă","hetairei":"hetairă","hetairele":"hetairă","hetairelor":"hetairă","hetairismul":"hetairism","hetairismule":"hetairism","hetairismului":"hetairism","heteroauxine":"heteroauxină","heteroauxinei":"heteroauxină","heteroauxinele":"heteroauxină","heteroauxinelor":"heteroauxină","heterocarpa":["heterocarpă","heterocarp","heterocarpa","heterocarp"],"heterocarpe":"heterocarp","heterocarpele":"heterocarp","heterocarpi":"heterocarp","heterocarpia":"heterocarpie","heterocarpiei":"heterocarpie","heterocarpii":["heterocarpii","heterocarp","heterocarpii","heterocarpie"],"heterocarpul":"heterocarp","heterocerca":["heterocercă","heterocerc","heterocerca","heterocerc"],"heterocerce":"heterocerc","heterocercele":"heterocerc","heterocerci":"heterocerc","heterocercii":"heterocerc","heterocercul":"heterocerc","heterociclica":["heterociclică","heterociclic","heterociclica","heterociclic"],"heterociclice":"heterociclic","heterociclicele":"heterociclic","heterociclici":"heterociclic","heterociclicii":"heterociclic","heterociclicul":"heterociclic","heterociclul":"heterociclu","heterociclule":"heterociclu","heterociclului":"heterociclu","heterocicluri":"heterociclu","heterociclurile":"heterociclu","heterociclurilor":"heterociclu","heteroclita":["heteroclită","heteroclit","heteroclita","heteroclit"],"heteroclite":"heteroclit","heteroclitele":"heteroclit","heterocliti":"heteroclit","heteroclitii":"heteroclit","heteroclitul":"heteroclit","heterocromia":"heterocromie","heterocromiei":"heterocromie","heterocromii":"heterocromie","heterocromiile":"heterocromie","heterocromiilor":"heterocromie","heterocromozomi":"heterocromozom","heterocromozomii":"heterocromozom","heterocromozomilor":"heterocromozom","heterocromozomul":"heterocromozom","heterocromozomule":"heterocromozom","heterocromozomului":"heterocromozom","heterodine":"heterodină","heterodinei":"heterodină","heterodinele":"heterodină","heterodinelor":"heterodină","heterodocsi":"heterodox","heterodocsii":"heterodox","heterodonta":["heterodontă","heterodont","heterodonta","heterodont"],"heterodonte":"heterodont","heterodontele":"heterodont","heterodonti":"heterodont","heterodontii":"heterodont","heterodontul":"heterodont","heterodoxa":["heterodoxă","heterodox","heterodoxa","heterodox"],"heterodoxe":"heterodox","heterodoxele":"heterodox","heterodoxia":"heterodoxie","heterodoxiei":"heterodoxie","heterodoxii":"heterodoxie","heterodoxiile":"heterodoxie","heterodoxiilor":"heterodoxie","heterodoxul":"heterodox","heterofilia":"heterofilie","heterofiliei":"heterofilie","heterofilii":"heterofilie","heterofiliile":"heterofilie","heterofiliilor":"heterofilie","heterofona":["heterofonă","heterofon","heterofona","heterofon"],"heterofone":"heterofon","heterofonele":"heterofon","heterofoni":"heterofon","heterofonia":"heterofonie","heterofoniei":"heterofonie","heterofonii":["heterofonii","heterofon","heterofonii","heterofonie"],"heterofoniile":"heterofonie","heterofoniilor":"heterofonie","heterofonul":"heterofon","heterogama":["heterogamă","heterogam","heterogama","heterogam"],"heterogame":"heterogam","heterogamele":"heterogam","heterogami":"heterogam","heterogamia":"heterogamie","heterogamiei":"heterogamie","heterogamii":["heterogamii","heterogam","heterogamii","heterogamie"],"heterogamiile":"heterogamie","heterogamiilor":"heterogamie","heterogamul":"heterogam","heterogena":["heterogenă","heterogen","heterogena","heterogen"],"heterogene":"heterogen","heterogenele":"heterogen","heterogeneze":"heterogeneză","heterogenezei":"heterogeneză","heterogenezele":"heterogeneză","heterogenezelor":"heterogeneză","heterogeni":"heterogen","heterogenii":"heterogen","heterogenul":"heterogen","heterogonia":"heterogonie","heterogoniei":"heterogonie","heterogonii":"heterogonie","heterogrefe":"heterogrefă","heterogrefei":"heterogrefă","heterogrefele":"heterogrefă","heterogrefelor":"heterogrefă","heteromera":["heteromeră","heteromer","heteromera","heteromer"],"heteromere":"heteromer","heteromerele":"heteromer","heteromeri":"heteromer","heteromerii":"heteromer","heteromerul":"heteromer","heterometabole":"heterometabolă","heterometabolele":"heterometabolă","heteromorfa":["heteromorfă","heteromorf","heteromorfa","heteromorf"],"heteromorfe":"heteromorf","heteromorfele":"heteromorf","heteromorfi":"heteromorf","heteromorfia":"heteromorfie","heteromorfiei":"heteromorfie","heteromorfii":["heteromorfii","heteromorf","heteromorfii","heteromorfie"],"heteromorfiile":"heteromorfie","heteromorfiilor":"heteromorfie","heteromorfisme":"heteromorfism","heteromorfismele":"heteromorfism","heteromorfismelor":"heteromorfism","heteromorfismul":"heteromorfism","heteromorfismule":"heteromorfism","heteromorfismului":"heteromorfism","heteromorfoze":"heteromorfoză","heteromorfozei":"heteromorfoză","heteromorfozele":"heteromorfoză","heteromorfozelor":"heteromorfoză","heteromorful":"heteromorf","heteronima":["heteronimă","heteronim","heteronima","heteronim"],"heteronime":"heteronim","heteronimele":"heteronim","heteronimi":"heteronim","heteronimia":"heteronimie","heteronimiei":"heteronimie","heteronimii":["heteronimii","heteronim","heteronimii","heteronimie"],"heteronimul":"heteronim","heteronoma":["heteronomă","heteronom","heteronoma","heteronom"],"heteronome":"heteronom","heteronomele":"heteronom","heteronomi":"heteronom","heteronomia":"heteronomie","heteronomiei":"heteronomie","heteronomii":["heteronomii","heteronom","heteronomii","heteronomie"],"heteronomiile":"heteronomie","heteronomiilor":"heteronomie","heteronomul":"heteronom","heteroplastia":"heteroplastie","heteroplastica":["heteroplastică","heteroplastic","heteroplastica","heteroplastic"],"heteroplastice":"heteroplastic","heteroplasticele":"heteroplastic","heteroplastici":"heteroplastic","heteroplasticii":"heteroplastic","heteroplasticul":"heteroplastic","heteroplastiei":"heteroplastie","heteroplastii":"heteroplastie","heteroplastiile":"heteroplastie","heteroplastiilor":"heteroplastie","heteroplazia":"heteroplazie","heteroplaziei":"heteroplazie","heteroplazii":"heteroplazie","heteroplaziile":"heteroplazie","heteroplaziilor":"heteroplazie","heteroproteide":"heteroproteidă","heteroproteidei":"heteroproteidă","heteroproteidele":"heteroproteidă","heteroproteidelor":"heteroproteidă","heteroptere":"heteropter","heteropterele":"heteropter","heteropterelor":"heteropter","heteropterul":"heteropter","heteropterule":"heteropter","heteropterului":"heteropter","heterosexuala":["heterosexuală","heterosexual","heterosexuala","heterosexual"],"heterosexuale":"heterosexual","heterosexualele":"heterosexual","heterosexuali":"heterosexual","heterosexualii":"heterosexual","heterosexualilor":"heterosexual","heterosexualitatea":"heterosexualitate","heterosexualitati":"heterosexualitate","heterosexualitatii":"heterosexualitate","heterosexualul":"heterosexual","heterosexualule":"heterosexual","heterosexualului":"heterosexual","heterosfere":"heterosferă","heterosferei":"heterosferă","heterosferele":"heterosferă","heterosferelor":"heterosferă","heterotaxia":"heterotaxie","heterotaxiei":"heterotaxie","heterotaxii":"heterotaxie","heterotaxiile":"heterotaxie","heterotaxiilor":"heterotaxie","heteroterapia":"heteroterapie","heteroterapiei":"heteroterapie","heteroterapii":"heteroterapie","heteroterapiile":"heteroterapie","heteroterapiilor":"heteroterapie","heteroterma":["heterotermă","heteroterm","heteroterma","heteroterm"],"heteroterme":"heteroterm","heterotermele":"heteroterm","heterotermi":"heteroterm","heterotermia":"heterotermie","heterotermiei":"heterotermie","heterotermii":["heterotermii","heteroterm","heterotermii","heterotermie"],"heterotermiile":"heterotermie","heterotermiilor":"heterotermie","heterotermul":"heteroterm","heterotopia":"heterotopie","heterotopica":["heterotopică","heterotopic","heterotopica","heterotopic"],"heterotopice":"heterotopic","heterotopicele":"heterotopic","heterotopici":"heterotopic","heterotopicii":"heterotopic","heterotopicul":"heterotopic","heterotopiei":"heterotopie","heterotopii":"heterotopie","heterotopiile":"heterotopie","heterotopiilor":"heterotopie","heterotransplantul":"heterotransplant","heterotransplantule":"heterotransplant","heterotransplantului":"heterotransplant","heterotransplanturi":"heterotransplant","heterotransplanturile":"heterotransplant","heterotransplanturilor":"heterotransplant","heterotrofa":["heterotrofă","heterotrof","heterotrofa","heterotrof"],"heterotrofe":"heterotrof","heterotrofele":"heterotrof","heterotrofi":"heterotrof","heterotrofia":"heterotrofie","heterotrofiei":"heterotrofie","heterotrofii":["heterotrofii","heterotrof","heterotrofii","heterotrofie"],"heterotroful":"heterotrof","heterozigota":["heterozigotă","heterozigot","heterozigota","heterozigot"],"heterozigote":"heterozigot","heterozigotele":"heterozigot","heterozigoti":"heterozigot","heterozigotii":"heterozigot","heterozigotul":"heterozigot","heterozisul":"heterozis","heterozisule":"heterozis","heterozisului":"heterozis","heterozisuri":"heterozis","heterozisurile":"heterozis","heterozisurilor":"heterozis","heterozomi":"heterozom","heterozomii":"heterozom","heterozomilor":"heterozom","heterozomul":"heterozom","heterozomule":"heterozom","heterozomului":"heterozom","hettangianul":"hettangian","hettangianule":"hettangian","hettangianului":"hettangian","hettangieni":"hettangian","hettangienile":"hettangian","hettangienilor":"hettangian","heveaua":"hevea","hexaclorbenzenul":"hexaclorbenzen","hexaclorbenzenule":"hexaclorbenzen","hexaclorbenzenului":"hexaclorbenzen","hexaclorciclohexanul":"hexaclorciclohexan","hexaclorciclohexanule":"hexaclorciclohexan","hexaclorciclohexanului":"hexaclorciclohexan","hexacoralieri":"hexacoralier","hexacoralierii":"hexacoralier","hexacoralierilor":"hexacoralier","hexacoralierul":"hexacoralier","hexacoralierule":"hexacoralier","hexacoralierului":"hexacoralier","hexacordul":"hexacord","hexacordule":"hexacord","hexacordului":"hexacord","hexacorduri":"hexacord","hexacordurile":"hexacord","hexacordurilor":"hexacord","hexadecimala":["hexadecimală","hexadecimal","hexadecimala","hexadecimal"],"hexadecimale":"hexadecimal","hexadecimalele":"hexadecimal","hexadecimali":"hexadecimal","hexadecimalii":"hexadecimal","hexadecimalul":"hexadecimal","hexaedre":"hexaedru","hexaedrele":"hexaedru","hexaedrelor":"hexaedru","hexaedrica":["hexaedrică","hexaedric","hexaedrica","hexaedric"],"hexaedrice":"hexaedric","hexaedricele":"hexaedric","hexaedrici":"hexaedric","hexaedricii":"hexaedric","hexaedricul":"hexaedric","hexaedrul":"hexaedru","hexaedrule":"hexaedru","hexaedrului":"hexaedru","hexagoane":"hexagon","hexagoanele":"hexagon","hexagoanelor":"hexagon","hexagonala":["hexagonală","hexagonal","hexagonala","hexagonal"],"hexagonale":"hexagonal","hexagonalele":"hexagonal","hexagonali":"hexagonal","hexagonalii":"hexagonal","hexagonalul":"hexagonal","hexagonul":"hexagon","hexagonule":"hexagon","hexagonului":"hexagon","hexametafosfati":"hexametafosfat","hexametafosfatii":"hexametafosfat","hexametafosfatilor":"hexametafosfat","hexametafosfatul":"hexametafosfat","hexametafosfatule":"hexametafosfat","hexametafosfatului":"hexametafosfat","hexametilentetramine":"hexametilentetramină","hexametilentetraminei":"hexametilentetramină","hexametilentetraminele":"hexametilentetramină","hexametilentetraminelor":"hexametilentetramină","hexametri":"hexametru","hexametrii":"hexametru","hexametrilor":"hexametru","hexametrul":"hexametru","hexametrule":"hexametru","hexametrului":"hexametru","hexani":"hexan","hexanii":"hexan","hexanilor":"hexan","hexanul":"hexan","hexanule":"hexan","hexanului":"hexan","hexapoda":["hexapodă","hexapod","hexapoda","hexapod"],"hexapode":"hexapod","hexapodele":"hexapod","hexapodul":"hexapod","hexapozi":"hexapod","hexapozii":"hexapod","hexastica":["hexastică","hexastic","hexastica","hexastic"],"hexastice":"hexastic","hexasticele":"hexastic","hexastici":"hexastic","hexasticii":"hexastic","hexasticul":"hexastic","hexastihul":"hexastih","hexastihule":"hexastih","hexastihului":"hexastih","hexastilul":"hexastil","hexastilule":"hexastil","hexastilului":"hexastil","hexastiluri":"hexastil","hexastilurile":"hexastil","hexastilurilor":"hexastil","hexavalenta":["hexavalentă","hexavalent","hexavalenta","hexavalent"],"hexavalente":"hexavalent","hexavalentele":"hexavalent","hexavalenti":"hexavalent","hexavalentii":"hexavalent","hexavalentul":"hexavalent","hexazecimala":["hexazecimală","hexazecimal","hexazecimala","hexazecimal"],"hexazecimale":"hexazecimal","hexazecimalele":"hexazecimal","hexazecimali":"hexazecimal","hexazecimalii":"hexazecimal","hexazecimalul":"hexazecimal","hexode":"hexodă","hexodei":"hexodă","hexodele":"hexodă","hexodelor":"hexodă","hexoze":"hexoză","hexozei":"hexoză","hexozele":"hexoză","hexozelor":"hexoză","hi":"fi","hiacinti":"hiacint","hialina":["hialină","hialin","hialina","hialin"],"hialine":"hialin","hialinele":"hialin","hialini":"hialin","hialinii":"hialin","hialinoze":"hialinoză","hialinozei":"hialinoză","hialinozele":"hialinoză","hialinozelor":"hialinoză","hialinul":"hialin","hialite":"hialită","hialitei":"hialită","hialitele":"hialită","hialitelor":"hialită","hialitul":"hialit","hialitule":"hialit","hialitului":"hialit","hialografe":"hialograf","hialografele":"hialograf","hialografelor":"hialograf","hialografia":"hialografie","hialografiei":"hialografie","hialografii":"hialografie","hialografiile":"hialografie","hialografiilor":"hialografie","hialograful":"hialograf","hialografule":"hialograf","hialografului":"hialograf","hialoida":["hialoidă","hialoid","hialoida","hialoid"],"hialoide":"hialoid","hialoidele":"hialoid","hialoidul":"hialoid","hialoizi":"hialoid","hialoizii":"hialoid","hialoplasme":"hialoplasmă","hialoplasmei":"hialoplasmă","hialoplasmele":"hialoplasmă","hialoplasmelor":"hialoplasmă","hiatul":"hiat","hiatule":"hiat","hiatului":"hiat","hiaturi":"hiat","hiaturile":"hiat","hiaturilor":"hiat","hiatusuri":"hiatus","hibasa":["hibașă","hibaș","hibașa","hibaș"],"hibase":"hibaș","hibasele":"hibaș","hibasi":"hibaș","hibasii":"hibaș","hibasul":"hibaș","hibe":"hibă","hibei":"hibă","hibele":"hibă","hibelor":"hibă","hibernaculi":"hibernacul","hibernaculii":"hibernacul","hibernaculilor":"hibernacul","hibernaculul":"hibernacul","hibernaculule":"hibernacul","hibernaculului":"hibernacul","hibernai":"hiberna","hibernala":["hibernală","hibernal","hibernala","hibernal"],"hibernale":"hibernal","hibernalele":"hibernal","hibernali":"hibernal","hibernalii":"hibernal","hibernalul":"hibernal","hibernam":["hibernăm","hiberna","hibernam","hiberna"],"hibernand":"hiberna","hibernanta":["hibernantă","hibernant","hibernanta","hibernant"],"hibernante":"hibernant","hibernantele":"hibernant","hibernanti":"hibernant","hibernantii":"hibernant","hibernantul":"hibernant","hibernara":"hiberna","hibernaram":"hiberna","hibernarati":"hiberna","hibernarea":"hibernare","hibernari":"hibernare","hibernarii":"hibernare","hibernarile":"hibernare","hibernarilor":"hibernare","hibernase":"hiberna","hibernasem":"hiberna","hibernasera":"hiberna","hibernaseram":"hiberna","hibernaserati":"hiberna","hibernasesi":"hiberna","hibernasi":"hiberna","hibernat":"hiberna","hibernati":"hiberna","hibernatia":"hibernație","hibernatiei":"hibernație","hibernatii":"hibernație","hibernatiile":"hibernație","hibernatiilor":"hibernație","hibernau":"hiberna","hiberneaza":"hiberna","hibernez":"hiberna","hibernezi":"hiberna","hibernoterapia":"hibernoterapie","hibernoterapiei":"hibernoterapie","hibernoterapii":"hibernoterapie","hibernoterapiile":"hibernoterapie","hibernoterapiilor":"hibernoterapie","hibiscusi":"hibiscus","hibiscusii":"hibiscus","hibiscusilor":"hibiscus","hibiscusul":"hibiscus","hibiscusule":"hibiscus","hibiscusului":"hibiscus","hibrida":["hibridă","hibrid","hibrida","hibrid"],"hibridai":"hibrida","hibridam":["hibridăm","hibrida","hibridam","hibrida"],"hibridand":"hibrida","hibridara":"hibrida","hibridaram":"hibrida","hibridarati":"hibrida","hibridarea":"hibridare","hibridari":"hibridare","hibridarii":"hibridare","hibridarile":"hibridare","hibridarilor":"hibridare","hibridase":"hibrida","hibridasem":"hibrida","hibridasera":"hibrida","hibridaseram":"hibrida","hibridaserati":"hibrida","hibridasesi":"hibrida","hibridasi":"hibrida","hibridat":"hibrida","hibridati":"hibrida","hibridatia":"hibridație","hibridatiei":"hibridație","hibridatii":"hibridație","hibridatiile":"hibridație","hibridatiilor":"hibridație","hibridau":"hibrida","hibride":"hibrid","hibrideaza":"hibrida","hibridele":"hibrid","hibridez":"hibrida","hibridezi":"hibrida","hibriditatea":"hibriditate","hibriditati":"hibriditate","hibriditatii":"hibriditate","hibriditatile":"hibriditate","hibriditatilor":"hibriditate","hibridizai":"hibridiza","hibridizam":["hibridizăm","hibridiza","hibridizam","hibridiza"],"hibridizand":"hibridiza","hibridizara":"hibridiza","hibridizaram":"hibridiza","hibridizarati":"hibridiza","hibridizarea":"hibridizare","hibridizari":"hibridizare","hibridizarii":"hibridizare","hibridizarile":"hibridizare","hibridizarilor":"hibridizare","hibridizase":"hibridiza","hibridizasem":"hibridiza","hibridizasera":"hibridiza","hibridizaseram":"hibridiza","hibridizaserati":"hibridiza","hibridizasesi":"hibridiza","hibridizasi":"hibridiza","hibridizat":"hibridiza","hibridizati":"hibridiza","hibridizau":"hibridiza","hibridizeaza":"hibridiza","hibridizez":"hibridiza","hibridizezi":"hibridiza","hibridul":"hibrid","hibrizi":"hibrid","hibrizii":"hibrid","hicleana":["hicleană","hiclean","hicleana","hiclean"],"hicleanul":"hiclean","hiclene":"hiclean","hiclenele":"hiclean","hicleni":"hiclean","hiclenia":"hiclenie","hicleniei":"hiclenie","hiclenii":["hiclenii","hiclean","hiclenii","hiclenie"],"hicleniile":"hiclenie","hicleniilor":"hiclenie","hicorii":"hicori","hicorilor":"hicori","hicoriul":"hicori","hicoriule":"hicori","hicoriului":"hicori","hicsosi":"hicsos","hicsosii":"hicsos","hicsosilor":"hicsos","hicsosul":"hicsos","hicsosule":"hicsos","hicsosului":"hicsos","hidalgia":"hidalgie","hidalgiei":"hidalgie","hidalgii":"hidalgie","hidalgiile":"hidalgie","hidalgiilor":"hidalgie","hidalgoul":"hidalgo","hidalgoule":"hidalgo","hidalgoului":"hidalgo","hidartroze":"hidartroză","hidartrozei":"hidartroză","hidartrozele":"hidartroză","hidartrozelor":"hidartroză","hidatica":["hidatică","hidatic","hidatica","hidatic"],"hidatice":"hidatic","hidaticele":"hidatic","hidatici":"hidatic","hidaticii":"hidatic","hidaticul":"hidatic","hidatide":"hidatidă","hidatidei":"hidatidă","hidatidele":"hidatidă","hidatidelor":"hidatidă","hidatidoze":"hidatidoză","hidatidozei":"hidatidoză","hidatidozele":"hidatidoză","hidatidozelor":"hidatidoză","hidatioze":"hidatioză","hidatiozei":"hidatioză","hidatiozele":"hidatioză","hidatiozelor":"hidatioză","hidatode":"hidatodă","hidatodei":"hidatodă","hidatodele":"hidatodă","hidatodelor":"hidatodă","hidoasa":["hidoasă","hidos","hidoasa","hidos"],"hidoase":"hidos","hidoasele":"hidos","hidosenia":"hidoșenie","hidoseniei":"hidoșenie","hidosenii":"hidoșenie","hidoseniile":"hidoșenie","hidoseniilor":"hidoșenie","hidosi":"hidos","hidosii":"hidos","hidosul":"hidos","hidracidul":"hidracid","hidracidule":"hidracid","hidracidului":"hidracid","hidracizi":"hidracid","hidracizii":"hidracid","hidracizilor":"hidracid","hidradenoame":"hidradenom","hidradenoamele":"hidradenom","hidradenoamelor":"hidradenom","hidradenomul":"hidradenom","hidradenomule":"hidradenom","hidradenomului":"hidradenom","hidragogi":"hidragog","hidragogile":"hidragog","hidragogilor":"hidragog","hidragogul":"hidragog","hidragogule":"hidragog","hidragogului":"hidragog","hidramniosul":"hidramnios","hidramniosule":"hidramnios","hidramniosului":"hidramnios","hidramniosuri":"hidramnios","hidramniosurile":"hidramnios","hidramniosurilor":"hidramnios","hidrante":"hidrant","hidrantele":"hidrant","hidrantelor":"hidrant","hidrantul":"hidrant","hidrantule":"hidrant","hidrantului":"hidrant","hidrargiliti":"hidrargilit","hidrargilitii":"hidrargilit","hidrargilitilor":"hidrargilit","hidrargilitul":"hidrargilit","hidrargilitule":"hidrargilit","hidrargilitului":"hidrargilit","hidrargirisme":"hidrargirism","hidrargirismele":"hidrargirism","hidrargirismelor":"hidrargirism","hidrargirismul":"hidrargirism","hidrargirismule":"hidrargirism","hidrargirismului":"hidrargirism","hidrargiroze":"hidrargiroză","hidrargirozei":"hidrargiroză","hidrargirozele":"hidrargiroză","hidrargirozelor":"hidrargiroză","hidrargirul":"hidrargir","hidrargirule":"hidrargir","hidrargirului":"hidrargir","hidratabila":["hidratabilă","hidratabil","hidratabila","hidratabil"],"hidratabile":"hidratabil","hidratabilele":"hidratabil","hidratabili":"hidratabil","hidratabilii":"hidratabil","hidratabilul":"hidratabil","hidratai":"hidrata","hidratam":["hidratăm","hidrata","hidratam","hidrata"],"hidratand":"hidrata","hidratanta":["hidratantă","hidratant","hidratanta","hidratant"],"hidratante":"hidratant","hidratantele":"hidratant","hidratanti":"hidratant","hidratantii":"hidratant","hidratantul":"hidratant","hidratara":"hidrata","hidrataram":"hidrata","hidratarati":"hidrata","hidratari":"hidratare","hidratase":"hidrata","hidratasem":"hidrata","hidratasera":"hidrata","hidrataseram":"hidrata","hidrataserati":"hidrata","hidratasesi":"hidrata","hidratasi":"hidrata","hidratat":"hidrata","hidratata":["hidratată","hidratat","hidratata","hidratat"],"hidratate":"hidratat","hidratatele":"hidratat","hidratati":["hidratați","hidrata","hidratați","hidratat"],"hidratatii":"hidratat","hidratatul":"hidratat","hidratau":"hidrata","hidrateaza":"hidrata","hidratez":"hidrata","hidratezi":"hidrata","hidrati":"hidrat","hidratii":"hidrat","hidratilor":"hidrat","hidratul":"hidrat","hidratule":"hidrat","hidratului":"hidrat","hidraulica":["hidraulică","hidraulic","hidraulica","hidraulic"],"hidraulice":"hidraulic","hidraulicele":"hidraulic","hidraulici":["hidraulici","hidraulic","hidraulici","hidraulică"],"hidraulicii":["hidraulicii","hidraulic","hidraulicii","hidraulică"],"hidraulicile":"hidraulică","hidraulicilor":"hidraulică","hidraulicul":"hidraulic","hidrazide":"hidrazidă","hidrazidei":"hidrazidă","hidrazidele":"hidrazidă","hidrazidelor":"hidrazidă","hidrazine":"hidrazină","hidrazinei":"hidrazină","hidrazinele":"hidrazină","hidrazinelor":"hidrazină","hidrazobenzenul":"hidrazobenzen","hidrazobenzenule":"hidrazobenzen","hidrazobenzenului":"hidrazobenzen","hidrazone":"hidrazonă","hidrazonei":"hidrazonă","hidrazonele":"hidrazonă","hidrazonelor":"hidrazonă","hidre":"hidră","hidrei":"hidră","hidrele":"hidră","hidrelor":"hidră","hidremia":"hidremie","hidremiei":"hidremie","hidremii":"hidremie","hidremiile":"hidremie","hidremiilor":"hidremie","hidria":"hidrie","hidriatria":"hidriatrie","hidriatriei":"hidriatrie","hidriatrii":"hidriatrie","hidrica":["hidrică","hidric","hidrica","hidric"],"hidrice":"hidric","hidricele":"hidric","hidrici":"hidric","hidricii":"hidric","hidricul":"hidric","hidriei":"hidrie","hidrii":"hidrie","hidroacustica":["hidroacustică","hidroacustic","hidroacustica","hidroacustic"],"hidroacustice":"hidroacustic","hidroacusticele":"hidroacustic","hidroacustici":["hidroacustici","hidroacustic","hidroacustici","hidroacustică"],"hidroacusticii":["hidroacusticii","hidroacustic","hidroacusticii","hidroacustică"],"hidroacusticile":"hidroacustică","hidroacusticilor":"hidroacustică","hidroacusticul":"hidroacustic","hidroamelioratoarea":"hidroamelioratoare","hidroamelioratoarei":"hidroamelioratoare","hidroamelioratoarele":"hidroamelioratoare","hidroamelioratoarelor":"hidroamelioratoare","hidroamelioratori":"hidroameliorator","hidroamelioratorii":"hidroameliorator","hidroamelioratorilor":"hidroameliorator","hidroamelioratorul":"hidroameliorator","hidroamelioratorule":"hidroameliorator","hidroamelioratorului":"hidroameliorator","hidroaviatia":"hidroaviație","hidroaviatiei":"hidroaviație","hidroaviatii":"hidroaviație","hidroaviatiile":"hidroaviație","hidroaviatiilor":"hidroaviație","hidroavioane":"hidroavion","hidroavioanele":"hidroavion","hidroavioanelor":"hidroavion","hidroavionul":"hidroavion","hidroavionule":"hidroavion","hidroavionului":"hidroavion","hidrobaze":"hidrobază","hidrobazei":"hidrobază","hidrobazele":"hidrobază","hidrobazelor":"hidrobază","hidrobiciclete":"hidrobicicletă","hidrobicicletei":"hidrobicicletă","hidrobicicletele":"hidrobicicletă","hidrobicicletelor":"hidrobicicletă","hidrobiologe":"hidrobiologă","hidrobiologei":"hidrobiologă","hidrobiologele":"hidrobiologă","hidrobiologelor":"hidrobiologă","hidrobiologi":"hidrobiolog","hidrobiologia":"hidrobiologie","hidrobiologica":["hidrobiologică","hidrobiologic","hidrobiologica","hidrobiologic"],"hidrobiologice":"hidrobiologic","hidrobiologicele":"hidrobiologic","hidrobiologici":"hidrobiologic","hidrobiologicii":"hidrobiologic","hidrobiologicul":"hidrobiologic","hidrobiologiei":"hidrobiologie","hidrobiologii":["hidrobiologii","hidrobiolog","hidrobiologii","hidrobiologie"],"hidrobiologiile":"hidrobiologie","hidrobiologiilor":"hidrobiologie","hidrobiologilor":"hidrobiolog","hidrobiologul":"hidrobiolog","hidrobiologule":"hidrobiolog","hidrobiologului":"hidrobiolog","hidrobuze":"hidrobuz","hidrobuzele":"hidrobuz","hidrobuzelor":"hidrobuz","hidrobuzul":"hidrobuz","hidrobuzule":"hidrobuz","hidrobuzului":"hidrobuz","hidrocarbonati":"hidrocarbonat","hidrocarbonatii":"hidrocarbonat","hidrocarbonatilor":"hidrocarbonat","hidrocarbonatul":"hidrocarbonat","hidrocarbonatule":"hidrocarbonat","hidrocarbonatului":"hidrocarbonat","hidrocarburi":"hidrocarbură","hidrocarburii":"hidrocarbură","hidrocarburile":"hidrocarbură","hidrocarburilor":"hidrocarbură","hidrocefale":"hidrocefală","hidrocefalei":"hidrocefală","hidrocefalele":"hidrocefală","hidrocefalelor":"hidrocefală","hidrocefali":"hidrocefal","hidrocefalia":"hidrocefalie","hidrocefaliei":"hidrocefalie","hidrocefalii":["hidrocefalii","hidrocefal","hidrocefalii","hidrocefalie"],"hidrocefaliile":"hidrocefalie","hidrocefaliilor":"hidrocefalie","hidrocefalilor":"hidrocefal","hidrocefalul":"hidrocefal","hidrocefalule":"hidrocefal","hidrocefalului":"hidrocefal","hidroceluloze":"hidroceluloză","hidrocelulozei":"hidroceluloză","hidrocelulozele":"hidroceluloză","hidrocelulozelor":"hidroceluloză","hidrocentrale":"hidrocentrală","hidrocentralei":"hidrocentrală","hidrocentralele":"hidrocentrală","hidrocentralelor":"hidrocentrală","hidrochimia":"hidrochimie","hidrochimica":["hidrochimică","hidrochimic","hidrochimica","hidrochimic"],"hidrochimice":"hidrochimic","hidrochimicele":"hidrochimic","hidrochimici":"hidrochimic","hidrochimicii":"hidrochimic","hidrochimicul":"hidrochimic","hidrochimiei":"hidrochimie","hidrochimii":"hidrochimie","hidrochimiile":"hidrochimie","hidrochimiilor":"hidrochimie","hidrochimiste":"hidrochimistă","hidrochimistei":"hidrochimistă","hidrochimistele":"hidrochimistă","hidrochimistelor":"hidrochimistă","hidrochimisti":"hidrochimist","hidrochimistii":"hidrochimist","hidrochimistilor":"hidrochimist","hidrochimistul":"hidrochimist","hidrochimistule":"hidrochimist","hidrochimistului":"hidrochimist","hidrochinone":"hidrochinonă","hidrochinonei":"hidrochinonă","hidrochinonele":"hidrochinonă","hidrochinonelor":"hidrochinonă","hidrocicloane":"hidrociclon","hidrocicloanele":"hidrociclon","hidrocicloanelor":"hidrociclon","hidrociclonul":"hidrociclon","hidrociclonule":"hidrociclon","hidrociclonului":"hidrociclon","hidrocore":"hidrocoră","hidrocorei":"hidrocoră","hidrocorele":"hidrocoră","hidrocorelor":"hidrocoră","hidrocoria":"hidrocorie","hidrocoriei":"hidrocorie","hidrocorii":"hidrocorie","hidrocoriile":"hidrocorie","hidrocoriilor":"hidrocorie","hidrocortizonul":"hidrocortizon","hidrocortizonule":"hidrocortizon","hidrocortizonului":"hidrocortizon","hidrocosmetice":"hidrocosmetică","hidrocosmeticei":"hidrocosmetică","hidrocosmeticele":"hidrocosmetică","hidrocosmeticelor":"hidrocosmetică","hidroculturi":"hidrocultură","hidroculturii":"hidrocultură","hidroculturile":"hidrocultură","hidroculturilor":"hidrocultură","hidrocutia":"hidrocuție","hidrocutiei":"hidrocuție","hidrocutii":"hidrocuție","hidrocutiile":"hidrocuție","hidrocutiilor":"hidrocuție","hidrodinamica":["hidrodinamică","hidrodinamic","hidrodinamica","hidrodinamic"],"hidrodinamice":"hidrodinamic","hidrodinamicele":"hidrodinamic","hidrodinamici":["hidrodinamici","hidrodinamic","hidrodinamici","hidrodinamică"],"hidrodinamicii":["hidrodinamicii","hidrodinamic","hidrodinamicii","hidrodinamică"],"hidrodinamicile":"hidrodinamică","hidrodinamicilor":"hidrodinamică","hidrodinamicul":"hidrodinamic","hidroelectrica":["hidroelectrică","hidroelectric","hidroelectrica","hidroelectric"],"hidroelectrice":"hidroelectric","hidroelectricele":"hidroelectric","hidroelectrici":"hidroelectric","hidroelectricii":"hidroelectric","hidroelectricul":"hidroelectric","hidroelevatoare":"hidroelevator","hidroelevatore":"hidroelevator","hidroelevatorele":"hidroelevator","hidroelevatorelor":"hidroelevator","hidroelevatorul":"hidroelevator","hidroelevatorule":"hidroelevator","hidroelevatorului":"hidroelevator","hidroenergetica":["hidroenergetică","hidroenergetic","hidroenergetica","hidroenergetic"],"hidroenergetice":"hidroenergetic","hidroenergeticele":"hidroenergetic","hidroenergetici":"hidroenergetic","hidroenergeticii":"hidroenergetic","hidroenergeticul":"hidroenergetic","hidroenergia":"hidroenergie","hidroenergiei":"hidroenergie","hidroenergii":"hidroenergie","hidroenergiile":"hidroenergie","hidroenergiilor":"hidroenergie","hidrofi":"hidrofil","hidrofile":"hidrofilă","hidrofili":"hidrofil","hidrofilia":"hidrofilie","hidrofiliei":"hidrofilie","hidrofilii":["hidrofilii","hidrofil","hidrofilii","hidrofilie"],"hidrofiliile":"hidrofilie","hidrofiliilor":"hidrofilie","hidrofilile":"hidrofil","hidrofililor":"hidrofil","hidrofilizai":"hidrofiliza","hidrofilizam":["hidrofilizăm","hidrofiliza","hidrofilizam","hidrofiliza"],"hidrofilizand":"hidrofiliza","hidrofilizara":"hidrofiliza","hidrofilizaram":"hidrofiliza","hidrofilizarati":"hidrofiliza","hidrofilizarea":"hidrofilizare","hidrofilizari":"hidrofilizare","hidrofilizarii":"hidrofilizare","hidrofilizarile":"hidrofilizare","hidrofilizarilor":"hidrofilizare","hidrofilizase":"hidrofiliza","hidrofilizasem":"hidrofiliza","hidrofilizasera":"hidrofiliza","hidrofilizaseram":"hidrofiliza","hidrofilizaserati":"hidrofiliza","hidrofilizasesi":"hidrofiliza","hidrofilizasi":"hidrofiliza","hidrofilizat":"hidrofiliza","hidrofilizata":["hidrofilizată","hidrofilizat","hidrofilizata","hidrofilizat"],"hidrofilizate":"hidrofilizat","hidrofilizatele":"hidrofilizat","hidrofilizati":["hidrofilizați","hidrofiliza","hidrofilizați","hidrofilizat"],"hidrofilizatii":"hidrofilizat","hidrofilizatul":"hidrofilizat","hidrofilizau":"hidrofiliza","hidrofilizeaza":"hidrofiliza","hidrofilizez":"hidrofiliza","hidrofilizezi":"hidrofiliza","hidrofita":"hidrofit","hidrofite":["hidrofite","hidrofit","hidrofite","hidrofită"],"hidrofitei":"hidrofită","hidrofitele":"hidrofită","hidrofitelor":"hidrofită","hidrofiti":"hidrofit","hidrofoane":"hidrofon","hidrofoanele":"hidrofon","hidrofoanelor":"hidrofon","hidrofoare":"hidrofor","hidrofoba":["hidrofobă","hidrofob","hidrofoba","hidrofob"],"hidrofobe":["hidrofobe","hidrofob","hidrofobe","hidrofobă"],"hidrofobei":"hidrofobă","hidrofobele":["hidrofobele","hidrofob","hidrofobele","hidrofobă"],"hidrofobelor":"hidrofobă","hidrofobi":"hidrofob","hidrofobia":"hidrofobie","hidrofobiei":"hidrofobie","hidrofobii":["hidrofobii","hidrofob","hidrofobii","hidrofobie"],"hidrofobiile":"hidrofobie","hidrofobiilor":"hidrofobie","hidrofobilor":"hidrofob","hidrofobizata":["hidrofobizată","hidrofobizat","hidrofobizata","hidrofobizat"],"hidrofobizate":"hidrofobizat","hidrofobizatele":"hidrofobizat","hidrofobizati":"hidrofobizat","hidrofobizatii":"hidrofobizat","hidrofobizatul":"hidrofobizat","hidrofobul":"hidrofob","hidrofobule":"hidrofob","hidrofobului":"hidrofob","hidrofonul":"hidrofon","hidrofonule":"hidrofon","hidrofonului":"hidrofon","hidrofore":"hidrofor","hidroforele":"hidrofor","hidroforelor":"hidrofor","hidroforul":"hidrofor","hidroforule":"hidrofor","hidroforului":"hidrofor","hidroftalmia":"hidroftalmie","hidroftalmica":["hidroftalmică","hidroftalmic","hidroftalmica","hidroftalmic"],"hidroftalmice":["hidroftalmice","hidroftalmic","hidroftalmice","hidroftalmică"],"hidroftalmicei":"hidroftalmică","hidroftalmicele":["hidroftalmicele","hidroftalmic","hidroftalmicele","hidroftalmică"],"hidroftalmicelor":"hidroftalmică","hidroftalmici":"hidroftalmic","hidroftalmicii":"hidroftalmic","hidroftalmicilor":"hidroftalmic","hidroftalmicul":"hidroftalmic","hidroftalmicule":"hidroftalmic","hidroftalmicului":"hidroftalmic","hidroftalmiei":"hidroftalmie","hidroftalmii":"hidroftalmie","hidroftalmiile":"hidroftalmie","hidroftalmiilor":"hidroftalmie","hidrofuga":["hidrofugă","hidrofug","hidrofuga","hidrofug"],"hidrofuge":"hidrofug","hidrofugele":"hidrofug","hidrofugi":"hidrofug","hidrofugii":"hidrofug","hidrofugul":"hidrofug","hidrogama":["hidrogamă","hidrogam","hidrogama","hidrogam"],"hidrogame":["hidrogame","hidrogam","hidrogame","hidrogamă"],"hidrogamei":"hidrogamă","hidrogamele":["hidrogamele","hidrogam","hidrogamele","hidrogamă"],"hidrogamelor":"hidrogamă","hidrogami":"hidrogam","hidrogamii":"hidrogam","hidrogamul":"hidrogam","hidrogelul":"hidrogel","hidrogelule":"hidrogel","hidrogelului":"hidrogel","hidrogeluri":"hidrogel","hidrogelurile":"hidrogel","hidrogelurilor":"hidrogel","hidrogenai":"hidrogena","hidrogenam":["hidrogenăm","hidrogena","hidrogenam","hidrogena"],"hidrogenand":"hidrogena","hidrogenara":"hidrogena","hidrogenaram":"hidrogena","hidrogenarati":"hidrogena","hidrogenarea":"hidrogenare","hidrogenari":"hidrogenare","hidrogenarii":"hidrogenare","hidrogenarile":"hidrogenare","hidrogenarilor":"hidrogenare","hidrogenase":"hidrogena","hidrogenasem":"hidrogena","hidrogenasera":"hidrogena","hidrogenaseram":"hidrogena","hidrogenaserati":"hidrogena","hidrogenasesi":"hidrogena","hidrogenasi":"hidrogena","hidrogenat":"hidrogena","hidrogenata":["hidrogenată","hidrogenat","hidrogenata","hidrogenat"],"hidrogenate":"hidrogenat","hidrogenatele":"hidrogenat","hidrogenati":["hidrogenați","hidrogena","hidrogenați","hidrogenat"],"hidrogenatii":"hidrogenat","hidrogenatul":"hidrogenat","hidrogenau":"hidrogena","hidrogeneaza":"hidrogena","hidrogeneratoare":"hidrogenerator","hidrogeneratoarele":"hidrogenerator","hidrogeneratoarelor":"hidrogenerator","hidrogeneratorul":"hidrogenerator","hidrogeneratorule":"hidrogenerator","hidrogeneratorului":"hidrogenerator","hidrogenez":"hidrogena","hidrogenezi":"hidrogena","hidrogenolize":"hidrogenoliză","hidrogenolizei":"hidrogenoliză","hidrogenolizele":"hidrogenoliză","hidrogenolizelor":"hidrogenoliză","hidrogenul":"hidrogen","hidrogenule":"hidrogen","hidrogenului":"hidrogen","hidrogeologe":"hidrogeologă","hidrogeologei":"hidrogeologă","hidrogeologele":"hidrogeologă","hidrogeologelor":"hidrogeologă","hidrogeologi":"hidrogeolog","hidrogeologia":"hidrogeologie","hidrogeologiei":"hidrogeologie","hidrogeologii":["hidrogeologii","hidrogeolog","hidrogeologii","hidrogeologie"],"hidrogeologiile":"hidrogeologie","hidrogeologiilor":"hidrogeologie","hidrogeologilor":"hidrogeolog","hidrogeologul":"hidrogeolog","hidrogeologule":"hidrogeolog","hidrogeologului":"hidrogeolog","hidroglisoare":"hidroglisor","hidroglisore":"hidroglisor","hidroglisorele":"hidroglisor","hidroglisorelor":"hidroglisor","hidroglisorul":"hidroglisor","hidroglisorule":"hidroglisor","hidroglisorului":"hidroglisor","hidrografe":"hidrografă","hidrografei":"hidrografă","hidrografele":"hidrografă","hidrografelor":"hidrografă","hidrografi":"hidrograf","hidrografia":"hidrografie","hidrografica":["hidrografică","hidrografic","hidrografica","hidrografic"],"hidrografice":"hidrografic","hidrograficele":"hidrografic","hidrografici":"hidrografic","hidrograficii":"hidrografic","hidrograficul":"hidrografic","hidrografiei":"hidrografie","hidrografii":["hidrografii","hidrograf","hidrografii","hidrografie"],"hidrografiile":"hidrografie","hidrografiilor":"hidrografie","hidrografilor":"hidrograf","hidrograful":"hidrograf","hidrografule":"hidrograf","hidrografului":"hidrograf","hidrograme":"hidrogramă","hidrogramei":"hidrogramă","hidrogramele":"hidrogramă","hidrogramelor":"hidrogramă","hidroizolai":"hidroizola","hidroizolam":["hidroizolăm","hidroizola","hidroizolam","hidroizola"],"hidroizoland":"hidroizola","hidroizolara":"hidroizola","hidroizolaram":"hidroizola","hidroizolarati":"hidroizola","hidroizolarea":"hidroizolare","hidroizolari":"hidroizolare","hidroizolarii":"hidroizolare","hidroizolarile":"hidroizolare","hidroizolarilor":"hidroizolare","hidroizolase":"hidroizola","hidroizolasem":"hidroizola","hidroizolasera":"hidroizola","hidroizolaseram":"hidroizola","hidroizolaserati":"hidroizola","hidroizolasesi":"hidroizola","hidroizolasi":"hidroizola","hidroizolat":"hidroizola","hidroizolata":["hidroizolată","hidroizolat","hidroizolata","hidroizolat"],"hidroizolate":"hidroizolat","hidroizolatele":"hidroizolat","hidroizolati":["hidroizolați","hidroizola","hidroizolați","hidroizolat"],"hidroizolatia":"hidroizolație","hidroizolatiei":"hidroizolație","hidroizolatii":["hidroizolații","hidroizolat","hidroizolații","hidroizolație"],"hidroizolatiile":"hidroizolație","hidroizolatiilor":"hidroizolație","hidroizolatul":"hidroizolat","hidroizolau":"hidroizola","hidroizoleaza":"hidroizola","hidroizolez":"hidroizola","hidroizolezi":"hidroizola","hidrolaze":"hidrolază","hidrolazei":"hidrolază","hidrolazele":"hidrolază","hidrolazelor":"hidrolază","hidrolitica":["hidrolitică","hidrolitic","hidrolitica","hidrolitic"],"hidrolitice":"hidrolitic","hidroliticele":"hidrolitic","hidrolitici":"hidrolitic","hidroliticii":"hidrolitic","hidroliticul":"hidrolitic","hidrolizabila":["hidrolizabilă","hidrolizabil","hidrolizabila","hidrolizabil"],"hidrolizabile":"hidrolizabil","hidrolizabilele":"hidrolizabil","hidrolizabili":"hidrolizabil","hidrolizabilii":"hidrolizabil","hidrolizabilul":"hidrolizabil","hidrolizai":"hidroliza","hidrolizam":["hidrolizăm","hidroliza","hidrolizam","hidroliza"],"hidrolizand":"hidroliza","hidrolizara":"hidroliza","hidrolizaram":"hidroliza","hidrolizarati":"hidroliza","hidrolizarea":"hidrolizare","hidrolizari":"hidrolizare","hidrolizarii":"hidrolizare","hidrolizase":"hidroliza","hidrolizasem":"hidroliza","hidrolizasera":"hidroliza","hidrolizaseram":"hidroliza","hidrolizaserati":"hidroliza","hidrolizasesi":"hidroliza","hidrolizasi":"hidroliza","hidrolizat":"hidroliza","hidrolizati":"hidroliza","hidrolizau":"hidroliza","hidrolize":"hidroliză","hidrolizeaza":"hidroliza","hidrolizei":"hidroliză","hidrolizele":"hidroliză","hidrolizelor":"hidroliză","hidrolizez":"hidroliza","hidrolizezi":"hidroliza","hidrologe":"hidrologă","hidrologei":"hidrologă","hidrologele":"hidrologă","hidrologelor":"hidrologă","hidrologi":"hidrolog","hidrologia":"hidrologie","hidrologica":["hidrologică","hidrologic","hidrologica","hidrologic"],"hidrologice":"hidrologic","hidrologicele":"hidrologic","hidrologici":"hidrologic","hidrologicii":"hidrologic","hidrologicul":"hidrologic","hidrologiei":"hidrologie","hidrologii":["hidrologii","hidrolog","hidrologii","hidrologie"],"hidrologiile":"hidrologie","hidrologiilor":"hidrologie","hidrologilor":"hidrolog","hidrologul":"hidrolog","hidrologule":"hidrolog","hidrologului":"hidrolog","hidromania":"hidromanie","hidromaniei":"hidromanie","hidromanii":"hidromanie","hidromaniile":"hidromanie","hidromaniilor":"hidromanie","hidromantia":"hidromanție","hidromantiei":"hidromanție","hidromantii":"hidromanție","hidromantiile":"hidromanție","hidromantiilor":"hidromanție","hidromasaje":"hidromasaj","hidromasajele":"hidromasaj","hidromasajelor":"hidromasaj","hidromasajul":"hidromasaj","hidromasajule":"hidromasaj","hidromasajului":"hidromasaj","hidromecanica":["hidromecanică","hidromecanic","hidromecanica","hidromecanic"],"hidromecanice":"hidromecanic","hidromecanicele":"hidromecanic","hidromecanici":["hidromecanici","hidromecanic","hidromecanici","hidromecanică"],"hidromecanicii":["hidromecanicii","hidromecanic","hidromecanicii","hidromecanică"],"hidromecanicile":"hidromecanică","hidromecanicilor":"hidromecanică","hidromecanicul":"hidromecanic","hidromelul":"hidromel","hidromelule":"hidromel","hidromelului":"hidromel","hidromeluri":"hidromel","hidromelurile":"hidromel","hidromelurilor":"hidromel","hidrometalurgia":"hidrometalurgie","hidrometalurgiei":"hidrometalurgie","hidrometalurgii":"hidrometalurgie","hidrometeori":"hidrometeor","hidrometeorii":"hidrometeor","hidrometeorilor":"hidrometeor","hidrometeorologia":"hidrometeorologie","hidrometeorologica":["hidrometeorologică","hidrometeorologic","hidrometeorologica","hidrometeorologic"],"hidrometeorologice":"hidrometeorologic","hidrometeorologicele":"hidrometeorologic","hidrometeorologici":"hidrometeorologic","hidrometeorologicii":"hidrometeorologic","hidrometeorologicul":"hidrometeorologic","hidrometeorologiei":"hidrometeorologie","hidrometeorologii":"hidrometeorologie","hidrometeorul":"hidrometeor","hidrometeorule":"hidrometeor","hidrometeorului":"hidrometeor","hidrometre":"hidrometru","hidrometrele":"hidrometru","hidrometrelor":"hidrometru","hidrometria":"hidrometrie","hidrometrica":["hidrometrică","hidrometric","hidrometrica","hidrometric"],"hidrometrice":"hidrometric","hidrometricele":"hidrometric","hidrometrici":"hidrometric","hidrometricii":"hidrometric","hidrometricul":"hidrometric","hidrometriei":"hidrometrie","hidrometrii":"hidrometrie","hidrometriile":"hidrometrie","hidrometriilor":"hidrometrie","hidrometrul":"hidrometru","hidrometrule":"hidrometru","hidrometrului":"hidrometru","hidrominerala":["hidrominerală","hidromineral","hidrominerala","hidromineral"],"hidrominerale":"hidromineral","hidromineralele":"hidromineral","hidrominerali":"hidromineral","hidromineralii":"hidromineral","hidromineralul":"hidromineral","hidromonitoare":"hidromonitor","hidromonitore":"hidromonitor","hidromonitorele":"hidromonitor","hidromonitorelor":"hidromonitor","hidromonitorul":"hidromonitor","hidromonitorule":"hidromonitor","hidromonitorului":"hidromonitor","hidronefrotica":["hidronefrotică","hidronefrotic","hidronefrotica","hidronefrotic"],"hidronefrotice":"hidronefrotic","hidronefroticele":"hidronefrotic","hidronefrotici":"hidronefrotic","hidronefroticii":"hidronefrotic","hidronefroticul":"hidronefrotic","hidronefroze":"hidronefroză","hidronefrozei":"hidronefroză","hidronefrozele":"hidronefroză","hidronefrozelor":"hidronefroză","hidronii":"hidroniu","hidroniii":"hidroniu","hidroniilor":"hidroniu","hidronime":"hidronim","hidronimele":"hidronim","hidronimelor":"hidronim","hidronimia":"hidronimie","hidronimiei":"hidronimie","hidronimii":"hidronimie","hidronimiile":"hidronimie","hidronimiilor":"hidronimie","hidronimul":"hidronim","hidronimule":"hidronim","hidronimului":"hidronim","hidroniul":"hidroniu","hidroniule":"hidroniu","hidroniului":"hidroniu","hidropata":["hidropată","hidropat","hidropata","hidropat"],"hidropate":"hidropat","hidropatele":"hidropat","hidropati":"hidropat","hidropatia":"hidropatie","hidropatica":["hidropatică","hidropatic","hidropatica","hidropatic"],"hidropatice":"hidropatic","hidropaticele":"hidropatic","hidropatici":"hidropatic","hidropaticii":"hidropatic","hidropaticul":"hidropatic","hidropatiei":"hidropatie","hidropatii":["hidropații","hidropat","hidropatii","hidropatie"],"hidropatiile":"hidropatie","hidropatiilor":"hidropatie","hidropatul":"hidropat","hidropedeze":"hidropedeză","hidropedezei":"hidropedeză","hidropedezele":"hidropedeză","hidropedezelor":"hidropedeză","hidropericarde":"hidropericard","hidropericardele":"hidropericard","hidropericardelor":"hidropericard","hidropericardul":"hidropericard","hidropericardule":"hidropericard","hidropericardului":"hidropericard","hidropica":["hidropică","hidropic","hidropica","hidropic"],"hidropice":["hidropice","hidropic","hidropice","hidropică"],"hidropicei":"hidropică","hidropicele":["hidropicele","hidropic","hidropicele","hidropică"],"hidropicelor":"hidropică","hidropici":"hidropic","hidropicii":"hidropic","hidropicoasa":["hidropicoasă","hidropicos","hidropicoasa","hidropicos"],"hidropicoase":["hidropicoase","hidropicoasă","hidropicoase","hidropicos"],"hidropicoasei":"hidropicoasă","hidropicoasele":["hidropicoasele","hidropicoasă","hidropicoasele","hidropicos"],"hidropicoaselor":"hidropicoasă","hidropicosi":"hidropicos","hidropicosii":"hidropicos","hidropicosilor":"hidropicos","hidropicosul":"hidropicos","hidropicosule":"hidropicos","hidropicosului":"hidropicos","hidropicul":"hidropic","hidropizia":"hidropizie","hidropiziei":"hidropizie","hidropizii":"hidropizie","hidroplanai":"hidroplana","hidroplanaje":"hidroplanaj","hidroplanajele":"hidroplanaj","hidroplanajelor":"hidroplanaj","hidroplanajul":"hidroplanaj","hidroplanajule":"hidroplanaj","hidroplanajului":"hidroplanaj","hidroplanam":["hidroplanăm","hidroplana","hidroplanam","hidroplana"],"hidroplanand":"hidroplana","hidroplanara":"hidroplana","hidroplanaram":"hidroplana","hidroplanarati":"hidroplana","hidroplanarea":"hidroplanare","hidroplanari":"hidroplanare","hidroplanarii":"hidroplanare","hidroplanarile":"hidroplanare","hidroplanarilor":"hidroplanare","hidroplanase":"hidroplana","hidroplanasem":"hidroplana","hidroplanasera":"hidroplana","hidroplanaseram":"hidroplana","hidroplanaserati":"hidroplana","hidroplanasesi":"hidroplana","hidroplanasi":"hidroplana","hidroplanat":"hidroplana","hidroplanati":"hidroplana","hidroplanau":"hidroplana","hidroplane":"hidroplan","hidroplaneaza":"hidroplana","hidroplanele":"hidroplan","hidroplanelor":"hidroplan","hidroplanez":"hidroplana","hidroplanezi":"hidroplana","hidroplanul":"hidroplan","hidroplanule":"hidroplan","hidroplanului":"hidroplan","hidroplasmae":"hidroplasmă","hidroplasmaei":"hidroplasmă","hidroplasmaele":"hidroplasmă","hidroplasmaelor":"hidroplasmă","hidropneumatica":["hidropneumatică","hidropneumatic","hidropneumatica","hidropneumatic"],"hidropneumatice":"hidropneumatic","hidropneumaticele":"hidropneumatic","hidropneumatici":"hidropneumatic","hidropneumaticii":"hidropneumatic","hidropneumaticul":"hidropneumatic","hidropneumotoraxul":"hidropneumotorax","hidropneumotoraxule":"hidropneumotorax","hidropneumotoraxului":"hidropneumotorax","hidroponica":["hidroponică","hidroponic","hidroponica","hidroponic"],"hidroponice":"hidroponic","hidroponicele":"hidroponic","hidroponici":["hidroponici","hidroponic","hidroponici","hidroponică"],"hidroponicii":["hidroponicii","hidroponic","hidroponicii","hidroponică"],"hidroponicile":"hidroponică","hidroponicilor":"hidroponică","hidroponicul":"hidroponic","hidrosadenite":"hidrosadenită","hidrosadenitei":"hidrosadenită","hidrosadenitele":"hidrosadenită","hidrosadenitelor":"hidrosadenită","hidrosalpinxul":"hidrosalpinx","hidrosalpinxule":"hidrosalpinx","hidrosalpinxului":"hidrosalpinx","hidrosalpinxuri":"hidrosalpinx","hidrosalpinxurile":"hidrosalpinx","hidrosalpinxurilor":"hidrosalpinx","hidrosfere":"hidrosferă","hidrosferei":"hidrosferă","hidrosferele":"hidrosferă","hidrosferelor":"hidrosferă","hidrosolubila":["hidrosolubilă","hidrosolubil","hidrosolubila","hidrosolubil"],"hidrosolubile":"hidrosolubil","hidrosolubilele":"hidrosolubil","hidrosolubili":"hidrosolubil","hidrosolubilii":"hidrosolubil","hidrosolubilul":"hidrosolubil","hidrosolul":"hidrosol","hidrosolule":"hidrosol","hidrosolului":"hidrosol","hidrosoluri":"hidrosol","hidrosolurile":"hidrosol","hidrosolurilor":"hidrosol","hidrostatica":["hidrostatică","hidrostatic","hidrostatica","hidrostatic"],"hidrostatice":"hidrostatic","hidrostaticele":"hidrostatic","hidrostatici":["hidrostatici","hidrostatic","hidrostatici","hidrostatică"],"hidrostaticianul":"hidrostatician","hidrostaticianule":"hidrostatician","hidrostaticianului":"hidrostatician","hidrostaticieni":"hidrostatician","hidrostaticienii":"hidrostatician","hidrostaticienilor":"hidrostatician","hidrostaticii":["hidrostaticii","hidrostatic","hidrostaticii","hidrostatică"],"hidrostaticile":"hidrostatică","hidrostaticilor":"hidrostatică","hidrostaticul":"hidrostatic","hidrotehnica":["hidrotehnică","hidrotehnic","hidrotehnica","hidrotehnic"],"hidrotehnice":"hidrotehnic","hidrotehnicele":"hidrotehnic","hidrotehnici":["hidrotehnici","hidrotehnic","hidrotehnici","hidrotehnică"],"hidrotehnicianul":"hidrotehnician","hidrotehnicianule":"hidrotehnician","hidrotehnicianului":"hidrotehnician","hidrotehniciene":"hidrotehniciană","hidrotehnicienei":"hidrotehniciană","hidrotehnicienele":"hidrotehniciană","hidrotehnicienelor":"hidrotehniciană","hidrotehnicieni":"hidrotehnician","hidrotehnicienii":"hidrotehnician","hidrotehnicienilor":"hidrotehnician","hidrotehnicii":["hidrotehnicii","hidrotehnic","hidrotehnicii","hidrotehnică"],"hidrotehnicile":"hidrotehnică","hidrotehnicilor":"hidrotehnică","hidrotehnicul":"hidrotehnic","hidroterapeuti":"hidroterapeut","hidroterapeutii":"hidroterapeut","hidroterapeutilor":"hidroterapeut","hidroterapeutul":"hidroterapeut","hidroterapeutule":"hidroterapeut","hidroterapeutului":"hidroterapeut","hidroterapia":"hidroterapie","hidroterapica":["hidroterapică","hidroterapic","hidroterapica","hidroterapic"],"hidroterapice":"hidroterapic","hidroterapicele":"hidroterapic","hidroterapici":"hidroterapic","hidroterapicii":"hidroterapic","hidroterapicul":"hidroterapic","hidroterapiei":"hidroterapie","hidroterapii":"hidroterapie","hidroterapiile":"hidroterapie","hidroterapiilor":"hidroterapie","hidrotermala":["hidrotermală","hidrotermal","hidrotermala","hidrotermal"],"hidrotermale":"hidrotermal","hidrotermalele":"hidrotermal","hidrotermali":"hidrotermal","hidrotermalii":"hidrotermal","hidrotermalul":"hidrotermal","hidrotimetria":"hidrotimetrie","hidrotimetriei":"hidrotimetrie","hidrotimetrii":"hidrotimetrie","hidrotimetriile":"hidrotimetrie","hidrotimetriilor":"hidrotimetrie","hidrotoraxul":"hidrotorax","hidrotoraxule":"hidrotorax","hidrotoraxului":"hidrotorax","hidrotoraxuri":"hidrotorax","hidrotoraxurile":"hidrotorax","hidrotoraxurilor":"hidrotorax","hidrotropisme":"hidrotropism","hidrotropismele":"hidrotropism","hidrotropismelor":"hidrotropism","hidrotropismul":"hidrotropism","hidrotropismule":"hidrotropism","hidrotropismului":"hidrotropism","hidroxidul":"hidroxid","hidroxidule":"hidroxid","hidroxidului":"hidroxid","hidroxilamine":"hidroxilamină","hidroxilaminei":"hidroxilamină","hidroxilaminele":"hidroxilamină","hidroxilaminelor":"hidroxilamină","hidroxili":"hidroxil","hidroxilii":"hidroxil","hidroxililor":"hidroxil","hidroxilul":"hidroxil","hidroxilule":"hidroxil","hidroxilului":"hidroxil","hidroxizi":"hidroxid","hidroxizii":"hidroxid","hidroxizilor":"hidroxid","hidroze":"hidroză","hidrozei":"hidroză","hidrozele":"hidroză","hidrozelor":"hidroză","hidrozoare":"hidrozoar","hidrozoarele":"hidrozoar","hidrozoarelor":"hidrozoar","hidrozoarul":"hidrozoar","hidrozoarule":"hidrozoar","hidrozoarului":"hidrozoar","hidruri":"hidrură","hidrurii":"hidrură","hidrurile":"hidrură","hidrurilor":"hidrură","hiene":"hienă","hienei":"hienă","hienele":"hienă","hienelor":"hienă","hienide":"hienidă","hienidei":"hienidă","hienidele":"hienidă","hienidelor":"hienidă","hieratica":["hieratică","hieratic","hieratica","hieratic"],"hieratice":"hieratic","hieraticele":"hieratic","hieratici":"hieratic","hieraticii":"hieratic","hieraticul":"hieratic","hieratisme":"hieratism","hieratismele":"hieratism","hieratismelor":"hieratism","hieratismul":"hieratism","hieratismule":"hieratism","hieratismului":"hieratism","hierburi":"hierb","hieri":"hier","hierii":"hier","hierilor":"hier","hierodiaconul":"hierodiacon","hierodiaconule":"hierodiacon","hierodiaconului":"hierodiacon","hierofanti":"hierofant","hierofantii":"hierofant","hierofantilor":"hierofant","hierofantul":"hierofant","hierofantule":"hierofant","hierofantului":"hierofant","hieroglife":"hieroglifă","hieroglifei":"hieroglifă","hieroglifele":"hieroglifă","hieroglifelor":"hieroglifă","hieroglifica":["hieroglifică","hieroglific","hieroglifica","hieroglific"],"hieroglifice":"hieroglific","hieroglificele":"hieroglific","hieroglifici":"hieroglific","hieroglificii":"hieroglific","hieroglificul":"hieroglific","hierul":"hier","hierule":"hier","hierului":"hier","hife":"hifă","hifei":"hifă","hifele":"hifă","hifelor":"hifă","high-lifeul":"high-life","high-lifeule":"high-life","high-lifeului":"high-life","higiene":"higienă","higienei":"higienă","higienele":"higienă","higienelor":"higienă","higienica":["higienică","higienic","higienica","higienic"],"higienice":"higienic","higienicele":"higienic","higienici":"higienic","higienicii":"higienic","higienicul":"higienic","higieniste":"higienistă","higienistei":"higienistă","higienistele":"higienistă","higienistelor":"higienistă","higienisti":"higienist","higrofila":["higrofilă","higrofil","higrofila","higrofil"],"higrofile":"higrofil","higrofilele":"higrofil","higrofili":"higrofil","higrofilii":"higrofil","higrofilul":"higrofil","higrofite":"higrofită","higrofitei":"higrofită","higrofitele":"higrofită","higrofitelor":"higrofită","higrografe":"higrograf","higrografele":"higrograf","higrografelor":"higrograf","higrograful":"higrograf","higrografule":"higrograf","higrografului":"higrograf","higrograme":"higrogramă","higrogramei":"higrogramă","higrogramele":"higrogramă","higrogramelor":"higrogramă","higrologia":"higrologie","higrologiei":"higrologie","higrologii":"higrologie","higrologiile":"higrologie","higrologiilor":"higrologie","higrome":"higromă","higromei":"higromă","higromele":"higromă","higromelor":"higromă","higrometre":"higrometru","higrometrele":"higrometru","higrometrelor":"higrometru","higrometria":"higrometrie","higrometrica":["higrometrică","higrometric","higrometrica","higrometric"],"higrometrice":"higrometric","higrometricele":"higrometric","higrometrici":"higrometric","higrometricii":"higrometric","higrometricul":"higrometric","higrometriei":"higrometrie","higrometrii":"higrometrie","higrometrul":"higrometru","higrometrule":"higrometru","higrometrului":"higrometru","higroscoape":"higroscop","higroscoapele":"higroscop","higroscoapelor":"higroscop","higroscopia":"higroscopie","higroscopica":["higroscopică","higroscopic","higroscopica","higroscopic"],"higroscopice":"higroscopic","higroscopicele":"higroscopic","higroscopici":"higroscopic","higroscopicii":"higroscopic","higroscopicitatea":"higroscopicitate","higroscopicitati":"higroscopicitate","higroscopicitatii":"higroscopicitate","higroscopicitatile":"higroscopicitate","higroscopicitatilor":"higroscopicitate","higroscopicul":"higroscopic","higroscopiei":"higroscopie","higroscopii":"higroscopie","higroscopiile":"higroscopie","higroscopiilor":"higroscopie","higroscopul":"higroscop","higroscopule":"higroscop","higroscopului":"higroscop","higrostate":"higrostat","higrostatele":"higrostat","higrostatelor":"higrostat","higrostatul":"higrostat","higrostatule":"higrostat","higrostatului":"higrostat","hihotea":"hihoti","hihoteai":"hihoti","hihoteam":"hihoti","hihoteati":"hihoti","hihoteau":"hihoti","hihotesc":"hihoti","hihoteste":"hihoti","hihotesti":"hihoti","hihotii":"hihoti","hihotim":"hihoti","hihotind":"hihoti","hihotira":"hihoti","hihotiram":"hihoti","hihotirati":"hihoti","hihotise":"hihoti","hihotisem":"hihoti","hihotisera":"hihoti","hihotiseram":"hihoti","hihotiserati":"hihoti","hihotisesi":"hihoti","hihotisi":"hihoti","hihotit":"hihoti","hihotiti":"hihoti","hilara":["hilară","hilar","hilara","hilar"],"hilare":"hilar","hilarele":"hilar","hilari":"hilar","hilarianta":["hilariantă","hilariant","hilarianta","hilariant"],"hilariante":"hilariant","hilariantele":"hilariant","hilarianti":"hilariant","hilariantii":"hilariant","hilariantul":"hilariant","hilarii":"hilar","hilarul":"hilar","hilotii":"hiloți","hilotilor":"hiloți","hilotiul":"hiloți","hilotiule":"hiloți","hilotiului":"hiloți","hilozoisme":"hilozoism","hilozoismele":"hilozoism","hilozoismelor":"hilozoism","hilozoismul":"hilozoism","hilozoismule":"hilozoism","hilozoismului":"hilozoism","hilozoiste":"hilozoistă","hilozoistei":"hilozoistă","hilozoistele":"hilozoistă","hilozoistelor":"hilozoistă","hilozoisti":"hilozoist","hilozoistii":"hilozoist","hilozoistilor":"hilozoist","hilozoistul":"hilozoist","hilozoistule":"hilozoist","hilozoistului":"hilozoist","hilte":"hiltă","hiltei":"hiltă","hilul":"hil","hilule":"hil","hilului":"hil","hiluri":"hil","hilurile":"hil","hilurilor":"hil","himalaiana":["himalaiană","himalaian","himalaiana","himalaian"],"himalaianul":"himalaian","himalaiene":["himalaiene","himalaian","himalaiene","himalaiană"],"himalaienei":"himalaiană","himalaienele":["himalaienele","himalaian","himalaienele","himalaiană"],"himalaienelor":"himalaiană","himalaieni":"himalaian","himalaienii":"himalaian","himalayane":"himalayană","himalayanei":"himalayană","himalayanele":"himalayană","himalayanelor":"himalayană","himenala":["himenală","himenal","himenala","himenal"],"himenale":"himenal","himenalele":"himenal","himenali":"himenal","himenalii":"himenal","himenalul":"himenal","himene":"himen","himenele":"himen","himenelor":"himen","himeniuul":"himeniu","himeniuule":"himeniu","himeniuului":"himeniu","himenoptere":"himenopter","himenopterele":"himenopter","himenopterelor":"himenopter","himenopterologia":"himenopterologie","himenopterologiei":"himenopterologie","himenopterologii":"himenopterologie","himenopterologiile":"himenopterologie","himenopterologiilor":"himenopterologie","himenopterul":"himenopter","himenopterule":"himenopter","himenopterului":"himenopter","himenul":"himen","himenule":"himen","himenului":"himen","himere":"himeră","himerei":"himeră","himerele":"himeră","himerelor":"himeră","himerica":["himerică","himeric","himerica","himeric"],"himerice":"himeric","himericele":"himeric","himerici":"himeric","himericii":"himeric","himericul":"himeric","hindichiul":"hindichi","hindichiule":"hindichi","hindichiului":"hindichi","hindichiuri":"hindichi","hindichiurile":"hindichi","hindichiurilor":"hindichi","hinduismul":"hinduism","hinduismule":"hinduism","hinduismului":"hinduism","hinduiste":"hinduistă","hinduistei":"hinduistă","hinduistele":"hinduistă","hinduistelor":"hinduistă","hinduisti":"hinduist","hinduistii":"hinduist","hinduistilor":"hinduist","hinduistul":"hinduist","hinduistule":"hinduist","hinduistului":"hinduist","hinduse":"hindusă","hindusei":"hindusă","hindusele":"hindusă","hinduselor":"hindusă","hindusi":"hindus","hindusii":"hindus","hindusilor":"hindus","hindustana":["hindustană","hindustan","hindustana","hindustan"],"hindustane":["hindustane","hindustan","hindustane","hindustană"],"hindustanei":"hindustană","hindustanele":"hindustan","hindustani":"hindustan","hindustanii":"hindustan","hindustaniul":"hindustani","hindustaniule":"hindustani","hindustaniului":"hindustani","hindustanul":"hindustan","hindusul":"hindus","hindusule":"hindus","hindusului":"hindus","hine":"hină","hinei":"hină","hinele":"hină","hinelor":"hină","hingherea":"hingheri","hinghereai":"hingheri","hingheream":"hingheri","hingherease":"hinghereasă","hinghereasei":"hinghereasă","hinghereati":"hingheri","hinghereau":"hingheri","hingherei":"hingherel","hinghereii":"hingherel","hinghereilor":"hingherel","hingherelul":"hingherel","hingherelule":"hingherel","hingherelului":"hingherel","hingheresc":"hingheri","hinghereste":"hingheri","hingheresti":"hingheri","hingheri":"hingher","hingherii":["hingherii","hingher","hingherii","hingheri"],"hingherilor":"hingher","hingherim":"hingheri","hingherind":"hingheri","hingherira":"hingheri","hingheriram":"hingheri","hingherirati":"hingheri","hingherise":"hingheri","hingherisem":"hingheri","hingherisera":"hingheri","hingheriseram":"hingheri","hingheriserati":"hingheri","hingherisesi":"hingheri","hingherisi":"hingheri","hingherit":"hingheri","hingheriti":"hingheri","hingheroaice":"hingheroaică","hingheroaicei":"hingheroaică","hingheroaicele":"hingheroaică","hingheroaicelor":"hingheroaică","hingherul":"hingher","hingherule":"hingher","hingherului":"hingher","hinte":"hintă","hinteie":"hinteu","hinteiele":"hinteu","hinteielor":"hinteu","hinterlandul":"hinterland","hinterlandule":"hinterland","hinterlandului":"hinterland","hinterlanduri":"hinterland","hinterlandurile":"hinterland","hinterlandurilor":"hinterland","hintete":"hinteț","hintetele":"hinteț","hintetelor":"hinteț","hintetul":"hinteț","hintetule":"hinteț","hintetului":"hinteț","hinteul":"hinteu","hinteule":"hinteu","hinteului":"hinteu","hinteuse":"hinteuș","hinteusele":"hinteuș","hinteuselor":"hinteuș","hinteusul":"hinteuș","hinteusule":"hinteuș","hinteusului":"hinteuș","hioida":["hioidă","hioid","hioida","hioid"],"hioide":"hioid","hioidele":"hioid","hioidul":"hioid","hioizi":"hioid","hioizii":"hioid","hip-hopul":"hip-hop","hip-hopule":"hip-hop","hip-hopului":"hip-hop","hipalage":"hipalagă","hipalagei":"hipalagă","hipalgezia":"hipalgezie","hipalgeziei":"hipalgezie","hipalgezii":"hipalgezie","hipalgeziile":"hipalgezie","hipalgeziilor":"hipalgezie","hipalgia":"hipalgie","hipalgiei":"hipalgie","hipalgii":"hipalgie","hipalgiile":"hipalgie","hipalgiilor":"hipalgie","hiparioni":"hiparion","hiparionii":"hiparion","hiparionilor":"hiparion","hiparionul":"hiparion","hiparionule":"hiparion","hiparionului":"hiparion","hiperaciditatea":"hiperaciditate","hiperaciditati":"hiperaciditate","hiperaciditatii":"hiperaciditate","hiperacuzia":"hiperacuzie","hiperacuziei":"hiperacuzie","hiperacuzii":"hiperacuzie","hiperacuziile":"hiperacuzie","hiperacuziilor":"hiperacuzie","hiperalcalina":["hiperalcalină","hiperalcalin","hiperalcalina","hiperalcalin"],"hiperalcaline":"hiperalcalin","hiperalcalinele":"hiperalcalin","hiperalcalini":"hiperalcalin","hiperalcalinii":"hiperalcalin","hiperalcalinul":"hiperalcalin","hiperalgezia":"hiperalgezie","hiperalgezica":["hiperalgezică","hiperalgezic","hiperalgezica","hiperalgezic"],"hiperalgezice":["hiperalgezice","hiperalgezic","hiperalgezice","hiperalgezică"],"hiperalgezicei":"hiperalgezică","hiperalgezicele":["hiperalgezicele","hiperalgezic","hiperalgezicele","hiperalgezică"],"hiperalgezicelor":"hiperalgezică","hiperalgezici":"hiperalgezic","hiperalgezicii":"hiperalgezic","hiperalgezicul":"hiperalgezic","hiperalgeziei":"hiperalgezie"};
@@ -0,0 +1 @@
+export default {"hiperalgezii":"hiperalgezie","hiperalgeziile":"hiperalgezie","hiperalgeziilor":"hiperalgezie","hiperalgia":"hiperalgie","hiperalgiei":"hiperalgie","hiperalgii":"hiperalgie","hiperalgiile":"hiperalgie","hiperalgiilor":"hiperalgie","hiperbate":"hiperbată","hiperbatei":"hiperbată","hiperbatele":"hiperbată","hiperbatelor":"hiperbată","hiperbole":"hiperbolă","hiperbolei":"hiperbolă","hiperbolele":"hiperbolă","hiperbolelor":"hiperbolă","hiperbolica":["hiperbolică","hiperbolic","hiperbolica","hiperbolic"],"hiperbolice":"hiperbolic","hiperbolicele":"hiperbolic","hiperbolici":"hiperbolic","hiperbolicii":"hiperbolic","hiperbolicul":"hiperbolic","hiperbolisme":"hiperbolism","hiperbolismele":"hiperbolism","hiperbolismelor":"hiperbolism","hiperbolismul":"hiperbolism","hiperbolismule":"hiperbolism","hiperbolismului":"hiperbolism","hiperbolizai":"hiperboliza","hiperbolizam":["hiperbolizăm","hiperboliza","hiperbolizam","hiperboliza"],"hiperbolizand":"hiperboliza","hiperbolizanta":["hiperbolizantă","hiperbolizant","hiperbolizanta","hiperbolizant"],"hiperbolizante":"hiperbolizant","hiperbolizantele":"hiperbolizant","hiperbolizanti":"hiperbolizant","hiperbolizantii":"hiperbolizant","hiperbolizantul":"hiperbolizant","hiperbolizara":"hiperboliza","hiperbolizaram":"hiperboliza","hiperbolizarati":"hiperboliza","hiperbolizarea":"hiperbolizare","hiperbolizari":"hiperbolizare","hiperbolizarii":"hiperbolizare","hiperbolizarile":"hiperbolizare","hiperbolizarilor":"hiperbolizare","hiperbolizase":"hiperboliza","hiperbolizasem":"hiperboliza","hiperbolizasera":"hiperboliza","hiperbolizaseram":"hiperboliza","hiperbolizaserati":"hiperboliza","hiperbolizasesi":"hiperboliza","hiperbolizasi":"hiperboliza","hiperbolizat":"hiperboliza","hiperbolizata":["hiperbolizată","hiperbolizat","hiperbolizata","hiperbolizat"],"hiperbolizate":"hiperbolizat","hiperbolizatele":"hiperbolizat","hiperbolizati":["hiperbolizați","hiperboliza","hiperbolizați","hiperbolizat"],"hiperbolizatii":"hiperbolizat","hiperbolizatul":"hiperbolizat","hiperbolizau":"hiperboliza","hiperbolizeaza":"hiperboliza","hiperbolizez":"hiperboliza","hiperbolizezi":"hiperboliza","hiperboloidul":"hiperboloid","hiperboloidule":"hiperboloid","hiperboloidului":"hiperboloid","hiperboloizi":"hiperboloid","hiperboloizii":"hiperboloid","hiperboloizilor":"hiperboloid","hiperboreana":["hiperboreană","hiperborean","hiperboreana","hiperborean"],"hiperboreanul":"hiperborean","hiperborei":"hiperboreu","hiperboreii":"hiperboreu","hiperboreilor":"hiperboreu","hiperborene":"hiperborean","hiperborenele":"hiperborean","hiperboreni":"hiperborean","hiperborenii":"hiperborean","hiperboreul":"hiperboreu","hiperboreule":"hiperboreu","hiperboreului":"hiperboreu","hipercalcemia":"hipercalcemie","hipercalcemiei":"hipercalcemie","hipercalcemii":"hipercalcemie","hipercalcemiile":"hipercalcemie","hipercalcemiilor":"hipercalcemie","hipercheratoze":"hipercheratoză","hipercheratozei":"hipercheratoză","hipercheratozele":"hipercheratoză","hipercheratozelor":"hipercheratoză","hiperchinezia":"hiperchinezie","hiperchineziei":"hiperchinezie","hiperchinezii":"hiperchinezie","hiperchineziile":"hiperchinezie","hiperchineziilor":"hiperchinezie","hiperclorhidria":"hiperclorhidrie","hiperclorhidriei":"hiperclorhidrie","hiperclorhidrii":"hiperclorhidrie","hiperclorhidriile":"hiperclorhidrie","hiperclorhidriilor":"hiperclorhidrie","hipercorecta":["hipercorectă","hipercorect","hipercorecta","hipercorect"],"hipercorecte":"hipercorect","hipercorectele":"hipercorect","hipercorecti":"hipercorect","hipercorectii":"hipercorect","hipercorectitudinea":"hipercorectitudine","hipercorectitudini":"hipercorectitudine","hipercorectitudinii":"hipercorectitudine","hipercorectitudinile":"hipercorectitudine","hipercorectitudinilor":"hipercorectitudine","hipercorectul":"hipercorect","hipercritica":["hipercritică","hipercritic","hipercritica","hipercritic"],"hipercritice":"hipercritic","hipercriticele":"hipercritic","hipercritici":"hipercritic","hipercriticii":"hipercritic","hipercriticul":"hipercritic","hipercromia":"hipercromie","hipercromiei":"hipercromie","hipercromii":"hipercromie","hipercubul":"hipercub","hipercubule":"hipercub","hipercubului":"hipercub","hipercuburi":"hipercub","hipercuburile":"hipercub","hipercuburilor":"hipercub","hiperemeze":"hiperemeză","hiperemezei":"hiperemeză","hiperemezele":"hiperemeză","hiperemezelor":"hiperemeză","hiperemia":"hiperemie","hiperemica":["hiperemică","hiperemic","hiperemica","hiperemic"],"hiperemice":"hiperemic","hiperemicele":"hiperemic","hiperemici":"hiperemic","hiperemicii":"hiperemic","hiperemicul":"hiperemic","hiperemiei":"hiperemie","hiperemii":"hiperemie","hiperemiile":"hiperemie","hiperemiilor":"hiperemie","hiperemotivitatea":"hiperemotivitate","hiperemotivitati":"hiperemotivitate","hiperemotivitatii":"hiperemotivitate","hiperemotivitatile":"hiperemotivitate","hiperemotivitatilor":"hiperemotivitate","hiperestezia":"hiperestezie","hiperesteziei":"hiperestezie","hiperestezii":"hiperestezie","hiperesteziile":"hiperestezie","hiperesteziilor":"hiperestezie","hiperexcitabilitatea":"hiperexcitabilitate","hiperexcitabilitati":"hiperexcitabilitate","hiperexcitabilitatii":"hiperexcitabilitate","hiperfocala":["hiperfocală","hiperfocal","hiperfocala","hiperfocal"],"hiperfocale":"hiperfocal","hiperfocalele":"hiperfocal","hiperfocali":"hiperfocal","hiperfocalii":"hiperfocal","hiperfocalul":"hiperfocal","hiperfoliculinia":"hiperfoliculinie","hiperfoliculiniei":"hiperfoliculinie","hiperfoliculinii":"hiperfoliculinie","hiperfoliculiniile":"hiperfoliculinie","hiperfoliculiniilor":"hiperfoliculinie","hiperfrecvente":"hiperfrecvență","hiperfrecventei":"hiperfrecvență","hiperfrecventele":"hiperfrecvență","hiperfrecventelor":"hiperfrecvență","hiperfunctia":"hiperfuncție","hiperfunctiei":"hiperfuncție","hiperfunctii":"hiperfuncție","hiperfunctiile":"hiperfuncție","hiperfunctiilor":"hiperfuncție","hiperfunctiuni":"hiperfuncțiune","hipergeometrica":["hipergeometrică","hipergeometric","hipergeometrica","hipergeometric"],"hipergeometrice":"hipergeometric","hipergeometricele":"hipergeometric","hipergeometrici":"hipergeometric","hipergeometricii":"hipergeometric","hipergeometricul":"hipergeometric","hipergeuzia":"hipergeuzie","hipergeuziei":"hipergeuzie","hipergeuzii":"hipergeuzie","hiperglicemia":"hiperglicemie","hiperglicemiei":"hiperglicemie","hiperglicemii":"hiperglicemie","hiperglicemiile":"hiperglicemie","hiperglicemiilor":"hiperglicemie","hiperhidroze":"hiperhidroză","hiperhidrozei":"hiperhidroză","hiperhidrozele":"hiperhidroză","hiperhidrozelor":"hiperhidroză","hiperinflatia":"hiperinflație","hiperinflatiei":"hiperinflație","hiperinflatii":"hiperinflație","hiperinflatiile":"hiperinflație","hiperinflatiilor":"hiperinflație","hiperinsulinisme":"hiperinsulinism","hiperinsulinismele":"hiperinsulinism","hiperinsulinismelor":"hiperinsulinism","hiperinsulinismul":"hiperinsulinism","hiperinsulinismule":"hiperinsulinism","hiperinsulinismului":"hiperinsulinism","hiperiritabila":["hiperiritabilă","hiperiritabil","hiperiritabila","hiperiritabil"],"hiperiritabile":"hiperiritabil","hiperiritabilele":"hiperiritabil","hiperiritabili":"hiperiritabil","hiperiritabilii":"hiperiritabil","hiperiritabilul":"hiperiritabil","hiperite":"hiperită","hiperitei":"hiperită","hiperitele":"hiperită","hiperitelor":"hiperită","hipermarketul":"hipermarket","hipermarketule":"hipermarket","hipermarketului":"hipermarket","hipermarketuri":"hipermarket","hipermarketurile":"hipermarket","hipermarketurilor":"hipermarket","hipermenoreea":"hipermenoree","hipermenoreei":"hipermenoree","hipermenoreele":"hipermenoree","hipermenoreelor":"hipermenoree","hipermetri":"hipermetru","hipermetrii":"hipermetru","hipermetrilor":"hipermetru","hipermetropa":["hipermetropă","hipermetrop","hipermetropa","hipermetrop"],"hipermetrope":["hipermetrope","hipermetrop","hipermetrope","hipermetropă"],"hipermetropei":"hipermetropă","hipermetropele":["hipermetropele","hipermetrop","hipermetropele","hipermetropă"],"hipermetropelor":"hipermetropă","hipermetropi":"hipermetrop","hipermetropia":"hipermetropie","hipermetropiei":"hipermetropie","hipermetropii":["hipermetropii","hipermetrop","hipermetropii","hipermetropie"],"hipermetropiile":"hipermetropie","hipermetropiilor":"hipermetropie","hipermetropisme":"hipermetropism","hipermetropismele":"hipermetropism","hipermetropismelor":"hipermetropism","hipermetropismul":"hipermetropism","hipermetropismule":"hipermetropism","hipermetropismului":"hipermetropism","hipermetropul":"hipermetrop","hipermetrul":"hipermetru","hipermetrule":"hipermetru","hipermetrului":"hipermetru","hipermnezia":"hipermnezie","hipermneziei":"hipermnezie","hipermnezii":"hipermnezie","hipermneziile":"hipermnezie","hipermneziilor":"hipermnezie","hipernefroame":"hipernefrom","hipernefroamele":"hipernefrom","hipernefroamelor":"hipernefrom","hipernefromul":"hipernefrom","hipernefromule":"hipernefrom","hipernefromului":"hipernefrom","hiperoni":"hiperon","hiperonica":["hiperonică","hiperonic","hiperonica","hiperonic"],"hiperonice":"hiperonic","hiperonicele":"hiperonic","hiperonici":"hiperonic","hiperonicii":"hiperonic","hiperonicul":"hiperonic","hiperonii":"hiperon","hiperonilor":"hiperon","hiperonul":"hiperon","hiperonule":"hiperon","hiperonului":"hiperon","hiperorexia":"hiperorexie","hiperorexiei":"hiperorexie","hiperorexii":"hiperorexie","hiperosmia":"hiperosmie","hiperosmiei":"hiperosmie","hiperosmii":"hiperosmie","hiperosmiile":"hiperosmie","hiperosmiilor":"hiperosmie","hiperostoze":"hiperostoză","hiperostozei":"hiperostoză","hiperostozele":"hiperostoză","hiperostozelor":"hiperostoză","hiperparatiroidisme":"hiperparatiroidism","hiperparatiroidismele":"hiperparatiroidism","hiperparatiroidismelor":"hiperparatiroidism","hiperparatiroidismul":"hiperparatiroidism","hiperparatiroidismule":"hiperparatiroidism","hiperparatiroidismului":"hiperparatiroidism","hiperparazite":"hiperparazită","hiperparazitei":"hiperparazită","hiperparazitele":"hiperparazită","hiperparazitelor":"hiperparazită","hiperparaziti":"hiperparazit","hiperparazitii":"hiperparazit","hiperparazitilor":"hiperparazit","hiperparazitul":"hiperparazit","hiperparazitule":"hiperparazit","hiperparazitului":"hiperparazit","hiperpirexia":"hiperpirexie","hiperpirexiei":"hiperpirexie","hiperpirexii":"hiperpirexie","hiperplazia":"hiperplazie","hiperplazica":["hiperplazică","hiperplazic","hiperplazica","hiperplazic"],"hiperplazice":"hiperplazic","hiperplazicele":"hiperplazic","hiperplazici":"hiperplazic","hiperplazicii":"hiperplazic","hiperplazicul":"hiperplazic","hiperplaziei":"hiperplazie","hiperplazii":"hiperplazie","hiperplaziile":"hiperplazie","hiperplaziilor":"hiperplazie","hiperprosexia":"hiperprosexie","hiperprosexiei":"hiperprosexie","hiperprosexii":"hiperprosexie","hiperproteinemia":"hiperproteinemie","hiperproteinemiei":"hiperproteinemie","hiperproteinemii":"hiperproteinemie","hiperproteinemiile":"hiperproteinemie","hiperproteinemiilor":"hiperproteinemie","hipersceptica":["hipersceptică","hipersceptic","hipersceptica","hipersceptic"],"hipersceptice":"hipersceptic","hiperscepticele":"hipersceptic","hipersceptici":"hipersceptic","hiperscepticii":"hipersceptic","hiperscepticul":"hipersceptic","hipersecretia":"hipersecreție","hipersecretiei":"hipersecreție","hipersecretii":"hipersecreție","hipersecretiile":"hipersecreție","hipersecretiilor":"hipersecreție","hipersensibila":["hipersensibilă","hipersensibil","hipersensibila","hipersensibil"],"hipersensibile":"hipersensibil","hipersensibilele":"hipersensibil","hipersensibili":"hipersensibil","hipersensibilii":"hipersensibil","hipersensibilitatea":"hipersensibilitate","hipersensibilitati":"hipersensibilitate","hipersensibilitatii":"hipersensibilitate","hipersensibilitatile":"hipersensibilitate","hipersensibilitatilor":"hipersensibilitate","hipersensibilizai":"hipersensibiliza","hipersensibilizam":["hipersensibilizăm","hipersensibiliza","hipersensibilizam","hipersensibiliza"],"hipersensibilizand":"hipersensibiliza","hipersensibilizara":"hipersensibiliza","hipersensibilizaram":"hipersensibiliza","hipersensibilizarati":"hipersensibiliza","hipersensibilizarea":"hipersensibilizare","hipersensibilizari":"hipersensibilizare","hipersensibilizarii":"hipersensibilizare","hipersensibilizarile":"hipersensibilizare","hipersensibilizarilor":"hipersensibilizare","hipersensibilizase":"hipersensibiliza","hipersensibilizasem":"hipersensibiliza","hipersensibilizasera":"hipersensibiliza","hipersensibilizaseram":"hipersensibiliza","hipersensibilizaserati":"hipersensibiliza","hipersensibilizasesi":"hipersensibiliza","hipersensibilizasi":"hipersensibiliza","hipersensibilizat":"hipersensibiliza","hipersensibilizata":["hipersensibilizată","hipersensibilizat","hipersensibilizata","hipersensibilizat"],"hipersensibilizate":"hipersensibilizat","hipersensibilizatele":"hipersensibilizat","hipersensibilizati":["hipersensibilizați","hipersensibiliza","hipersensibilizați","hipersensibilizat"],"hipersensibilizatii":"hipersensibilizat","hipersensibilizatul":"hipersensibilizat","hipersensibilizau":"hipersensibiliza","hipersensibilizeaza":"hipersensibiliza","hipersensibilizez":"hipersensibiliza","hipersensibilizezi":"hipersensibiliza","hipersensibilul":"hipersensibil","hipersomnia":"hipersomnie","hipersomniei":"hipersomnie","hipersomnii":"hipersomnie","hipersomniile":"hipersomnie","hipersomniilor":"hipersomnie","hipersonica":["hipersonică","hipersonic","hipersonica","hipersonic"],"hipersonice":"hipersonic","hipersonicele":"hipersonic","hipersonici":"hipersonic","hipersonicii":"hipersonic","hipersonicul":"hipersonic","hiperspatii":"hiperspațiu","hiperspatiile":"hiperspațiu","hiperspatiilor":"hiperspațiu","hiperspatiuul":"hiperspațiu","hiperspatiuule":"hiperspațiu","hiperspatiuului":"hiperspațiu","hipersplenisme":"hipersplenism","hipersplenismele":"hipersplenism","hipersplenismelor":"hipersplenism","hipersplenismul":"hipersplenism","hipersplenismule":"hipersplenism","hipersplenismului":"hipersplenism","hipersunete":"hipersunet","hipersunetele":"hipersunet","hipersunetelor":"hipersunet","hipersunetul":"hipersunet","hipersunetule":"hipersunet","hipersunetului":"hipersunet","hipersustentatia":"hipersustentație","hipersustentatiei":"hipersustentație","hipersustentatii":"hipersustentație","hipersustentatiile":"hipersustentație","hipersustentatiilor":"hipersustentație","hipertensiunea":"hipertensiune","hipertensiunei":"hipertensiune","hipertensiunele":"hipertensiune","hipertensiunelor":"hipertensiune","hipertensiuni":"hipertensiune","hipertensive":"hipertensivă","hipertensivei":"hipertensivă","hipertensivele":"hipertensivă","hipertensivelor":"hipertensivă","hipertensivi":"hipertensiv","hipertensivii":"hipertensiv","hipertensivilor":"hipertensiv","hipertensivul":"hipertensiv","hipertensivule":"hipertensiv","hipertensivului":"hipertensiv","hipertermala":["hipertermală","hipertermal","hipertermala","hipertermal"],"hipertermale":"hipertermal","hipertermalele":"hipertermal","hipertermali":"hipertermal","hipertermalii":"hipertermal","hipertermalul":"hipertermal","hipertermia":"hipertermie","hipertermiei":"hipertermie","hipertermii":"hipertermie","hipertermiile":"hipertermie","hipertermiilor":"hipertermie","hipertimia":"hipertimie","hipertimiei":"hipertimie","hipertimii":"hipertimie","hipertimiile":"hipertimie","hipertimiilor":"hipertimie","hipertiroidia":"hipertiroidie","hipertiroidianul":"hipertiroidian","hipertiroidianule":"hipertiroidian","hipertiroidianului":"hipertiroidian","hipertiroidiei":"hipertiroidie","hipertiroidiene":"hipertiroidiană","hipertiroidienei":"hipertiroidiană","hipertiroidienele":"hipertiroidiană","hipertiroidienelor":"hipertiroidiană","hipertiroidieni":"hipertiroidian","hipertiroidienii":"hipertiroidian","hipertiroidienilor":"hipertiroidian","hipertiroidii":"hipertiroidie","hipertiroidiile":"hipertiroidie","hipertiroidiilor":"hipertiroidie","hipertiroidisme":"hipertiroidism","hipertiroidismele":"hipertiroidism","hipertiroidismelor":"hipertiroidism","hipertiroidismul":"hipertiroidism","hipertiroidismule":"hipertiroidism","hipertiroidismului":"hipertiroidism","hipertonia":"hipertonie","hipertonica":["hipertonică","hipertonic","hipertonica","hipertonic"],"hipertonice":"hipertonic","hipertonicele":"hipertonic","hipertonici":"hipertonic","hipertonicii":"hipertonic","hipertonicitatea":"hipertonicitate","hipertonicitati":"hipertonicitate","hipertonicitatii":"hipertonicitate","hipertonicul":"hipertonic","hipertoniei":"hipertonie","hipertonii":"hipertonie","hipertoniile":"hipertonie","hipertoniilor":"hipertonie","hipertricoze":"hipertricoză","hipertricozei":"hipertricoză","hipertricozele":"hipertricoză","hipertricozelor":"hipertricoză","hipertrofia":"hipertrofie","hipertrofiai":"hipertrofia","hipertrofiam":"hipertrofia","hipertrofiara":"hipertrofia","hipertrofiaram":"hipertrofia","hipertrofiarati":"hipertrofia","hipertrofiase":"hipertrofia","hipertrofiasem":"hipertrofia","hipertrofiasera":"hipertrofia","hipertrofiaseram":"hipertrofia","hipertrofiaserati":"hipertrofia","hipertrofiasesi":"hipertrofia","hipertrofiasi":"hipertrofia","hipertrofiat":"hipertrofia","hipertrofiati":"hipertrofia","hipertrofiau":"hipertrofia","hipertrofiaza":"hipertrofia","hipertrofica":["hipertrofică","hipertrofic","hipertrofica","hipertrofic"],"hipertrofice":"hipertrofic","hipertroficele":"hipertrofic","hipertrofici":"hipertrofic","hipertroficii":"hipertrofic","hipertroficul":"hipertrofic","hipertrofie":"hipertrofia","hipertrofiei":"hipertrofie","hipertrofiem":"hipertrofia","hipertrofierea":"hipertrofiere","hipertrofierei":"hipertrofiere","hipertrofiez":"hipertrofia","hipertrofiezi":"hipertrofia","hipertrofii":"hipertrofie","hipertrofiile":"hipertrofie","hipertrofiilor":"hipertrofie","hipertrofiind":"hipertrofia","hiperurbanisme":"hiperurbanism","hiperurbanismele":"hiperurbanism","hiperurbanismelor":"hiperurbanism","hiperurbanismul":"hiperurbanism","hiperurbanismule":"hiperurbanism","hiperurbanismului":"hiperurbanism","hipervitaminoze":"hipervitaminoză","hipervitaminozei":"hipervitaminoză","hipervitaminozele":"hipervitaminoză","hipervitaminozelor":"hipervitaminoză","hipiatria":"hipiatrie","hipiatrica":["hipiatrică","hipiatric","hipiatrica","hipiatric"],"hipiatrice":"hipiatric","hipiatricele":"hipiatric","hipiatrici":"hipiatric","hipiatricii":"hipiatric","hipiatricul":"hipiatric","hipiatriei":"hipiatrie","hipiatrii":"hipiatrie","hipiatriile":"hipiatrie","hipiatriilor":"hipiatrie","hipica":["hipică","hipic","hipica","hipic"],"hipice":"hipic","hipicele":"hipic","hipici":"hipic","hipicii":"hipic","hipicul":"hipic","hipiote":"hipiotă","hipiotei":"hipiotă","hipiotele":"hipiotă","hipiotelor":"hipiotă","hipioti":"hipiot","hipiotii":"hipiot","hipiotilor":"hipiot","hipiotul":"hipiot","hipiotule":"hipiot","hipiotului":"hipiot","hipismul":"hipism","hipismule":"hipism","hipismului":"hipism","hipnagogica":["hipnagogică","hipnagogic","hipnagogica","hipnagogic"],"hipnagogice":"hipnagogic","hipnagogicele":"hipnagogic","hipnagogici":"hipnagogic","hipnagogicii":"hipnagogic","hipnagogicul":"hipnagogic","hipnalgia":"hipnalgie","hipnalgiei":"hipnalgie","hipnalgii":"hipnalgie","hipnalgiile":"hipnalgie","hipnalgiilor":"hipnalgie","hipnogena":["hipnogenă","hipnogen","hipnogena","hipnogen"],"hipnogene":"hipnogen","hipnogenele":"hipnogen","hipnogeni":"hipnogen","hipnogenii":"hipnogen","hipnogenul":"hipnogen","hipnopedia":"hipnopedie","hipnopediei":"hipnopedie","hipnopedii":"hipnopedie","hipnopediile":"hipnopedie","hipnopediilor":"hipnopedie","hipnoterapia":"hipnoterapie","hipnoterapiei":"hipnoterapie","hipnoterapii":"hipnoterapie","hipnotica":["hipnotică","hipnotic","hipnotica","hipnotic"],"hipnotice":"hipnotic","hipnoticele":"hipnotic","hipnoticelor":"hipnotic","hipnotici":"hipnotic","hipnoticii":"hipnotic","hipnoticul":"hipnotic","hipnoticule":"hipnotic","hipnoticului":"hipnotic","hipnotisme":"hipnotism","hipnotismele":"hipnotism","hipnotismelor":"hipnotism","hipnotismul":"hipnotism","hipnotismule":"hipnotism","hipnotismului":"hipnotism","hipnotizai":"hipnotiza","hipnotizam":["hipnotizăm","hipnotiza","hipnotizam","hipnotiza"],"hipnotizand":"hipnotiza","hipnotizanta":["hipnotizantă","hipnotizant","hipnotizanta","hipnotizant"],"hipnotizante":"hipnotizant","hipnotizantele":"hipnotizant","hipnotizanti":"hipnotizant","hipnotizantii":"hipnotizant","hipnotizantul":"hipnotizant","hipnotizara":"hipnotiza","hipnotizaram":"hipnotiza","hipnotizarati":"hipnotiza","hipnotizarea":"hipnotizare","hipnotizari":"hipnotizare","hipnotizarii":"hipnotizare","hipnotizarile":"hipnotizare","hipnotizarilor":"hipnotizare","hipnotizase":"hipnotiza","hipnotizasem":"hipnotiza","hipnotizasera":"hipnotiza","hipnotizaseram":"hipnotiza","hipnotizaserati":"hipnotiza","hipnotizasesi":"hipnotiza","hipnotizasi":"hipnotiza","hipnotizat":"hipnotiza","hipnotizata":["hipnotizată","hipnotizat","hipnotizata","hipnotizat"],"hipnotizate":"hipnotizat","hipnotizatele":"hipnotizat","hipnotizati":["hipnotizați","hipnotiza","hipnotizați","hipnotizat"],"hipnotizatii":"hipnotizat","hipnotizatoarea":"hipnotizatoare","hipnotizatoarei":"hipnotizatoare","hipnotizatoarele":"hipnotizatoare","hipnotizatoarelor":"hipnotizatoare","hipnotizatori":"hipnotizator","hipnotizatorii":"hipnotizator","hipnotizatorilor":"hipnotizator","hipnotizatorul":"hipnotizator","hipnotizatorule":"hipnotizator","hipnotizatorului":"hipnotizator","hipnotizatul":"hipnotizat","hipnotizau":"hipnotiza","hipnotizeaza":"hipnotiza","hipnotizez":"hipnotiza","hipnotizezi":"hipnotiza","hipnotizoarea":"hipnotizoare","hipnotizoarei":"hipnotizoare","hipnotizoarele":"hipnotizoare","hipnotizoarelor":"hipnotizoare","hipnotizori":"hipnotizor","hipnotizorii":"hipnotizor","hipnotizorilor":"hipnotizor","hipnotizorul":"hipnotizor","hipnotizorule":"hipnotizor","hipnotizorului":"hipnotizor","hipnoze":"hipnoză","hipnozei":"hipnoză","hipnozele":"hipnoză","hipnozelor":"hipnoză","hipoaciditatea":"hipoaciditate","hipoaciditati":"hipoaciditate","hipoaciditatii":"hipoaciditate","hipoaciditatile":"hipoaciditate","hipoaciditatilor":"hipoaciditate","hipoacuzia":"hipoacuzie","hipoacuzice":"hipoacuzică","hipoacuzicei":"hipoacuzică","hipoacuzicele":"hipoacuzică","hipoacuzicelor":"hipoacuzică","hipoacuziei":"hipoacuzie","hipoacuzii":"hipoacuzie","hipoacuziile":"hipoacuzie","hipoacuziilor":"hipoacuzie","hipoalgezia":"hipoalgezie","hipoalgeziei":"hipoalgezie","hipoalgezii":"hipoalgezie","hipoalgeziile":"hipoalgezie","hipoalgeziilor":"hipoalgezie","hipobarica":["hipobarică","hipobaric","hipobarica","hipobaric"],"hipobarice":"hipobaric","hipobaricele":"hipobaric","hipobarici":"hipobaric","hipobaricii":"hipobaric","hipobaricul":"hipobaric","hipobromiti":"hipobromit","hipobromitii":"hipobromit","hipobromitilor":"hipobromit","hipobromitul":"hipobromit","hipobromitule":"hipobromit","hipobromitului":"hipobromit","hipocalcemia":"hipocalcemie","hipocalcemiei":"hipocalcemie","hipocalcemii":"hipocalcemie","hipocalcemiile":"hipocalcemie","hipocalcemiilor":"hipocalcemie","hipocampi":"hipocamp","hipocampii":"hipocamp","hipocampilor":"hipocamp","hipocampul":"hipocamp","hipocampule":"hipocamp","hipocampului":"hipocamp","hipocapnia":"hipocapnie","hipocapniei":"hipocapnie","hipocapnii":"hipocapnie","hipocapniile":"hipocapnie","hipocapniilor":"hipocapnie","hipocauste":"hipocaust","hipocaustele":"hipocaust","hipocaustelor":"hipocaust","hipocaustul":"hipocaust","hipocaustule":"hipocaust","hipocaustului":"hipocaust","hipocentauri":"hipocentaur","hipocentaurii":"hipocentaur","hipocentaurilor":"hipocentaur","hipocentaurul":"hipocentaur","hipocentaurule":"hipocentaur","hipocentaurului":"hipocentaur","hipocentri":"hipocentru","hipocentrii":"hipocentru","hipocentrilor":"hipocentru","hipocentrul":"hipocentru","hipocentrule":"hipocentru","hipocentrului":"hipocentru","hipocicloide":"hipocicloidă","hipocicloidei":"hipocicloidă","hipocicloidele":"hipocicloidă","hipocicloidelor":"hipocicloidă","hipocicluri":"hipociclu","hipociclurile":"hipociclu","hipociclurilor":"hipociclu","hipocicluul":"hipociclu","hipocicluule":"hipociclu","hipocicluului":"hipociclu","hipocloremia":"hipocloremie","hipocloremiei":"hipocloremie","hipocloremii":"hipocloremie","hipocloremiile":"hipocloremie","hipocloremiilor":"hipocloremie","hipoclorhidria":"hipoclorhidrie","hipoclorhidriei":"hipoclorhidrie","hipoclorhidrii":"hipoclorhidrie","hipoclorhidriile":"hipoclorhidrie","hipoclorhidriilor":"hipoclorhidrie","hipocloriti":"hipoclorit","hipocloritii":"hipoclorit","hipocloritilor":"hipoclorit","hipocloritul":"hipoclorit","hipocloritule":"hipoclorit","hipocloritului":"hipoclorit","hipocloroasa":["hipocloroasă","hipocloros","hipocloroasa","hipocloros"],"hipocloroase":"hipocloros","hipocloroasele":"hipocloros","hipoclorosi":"hipocloros","hipoclorosii":"hipocloros","hipoclorosul":"hipocloros","hipocolia":"hipocolie","hipocoliei":"hipocolie","hipocolii":"hipocolie","hipocondre":"hipocondru","hipocondrele":"hipocondru","hipocondrelor":"hipocondru","hipocondria":"hipocondrie","hipocondriei":"hipocondrie","hipocondrii":"hipocondrie","hipocondrul":"hipocondru","hipocondrule":"hipocondru","hipocondrului":"hipocondru","hipocoristica":["hipocoristică","hipocoristic","hipocoristica","hipocoristic"],"hipocoristice":"hipocoristic","hipocoristicele":"hipocoristic","hipocoristici":"hipocoristic","hipocoristicii":"hipocoristic","hipocoristicul":"hipocoristic","hipocotile":"hipocotil","hipocotilele":"hipocotil","hipocotilelor":"hipocotil","hipocotilul":"hipocotil","hipocotilule":"hipocotil","hipocotilului":"hipocotil","hipocratica":["hipocratică","hipocratic","hipocratica","hipocratic"],"hipocratice":"hipocratic","hipocraticele":"hipocratic","hipocratici":"hipocratic","hipocraticii":"hipocratic","hipocraticul":"hipocratic","hipocratisme":"hipocratism","hipocratismele":"hipocratism","hipocratismelor":"hipocratism","hipocratismul":"hipocratism","hipocratismule":"hipocratism","hipocratismului":"hipocratism","hipocristalina":["hipocristalină","hipocristalin","hipocristalina","hipocristalin"],"hipocristaline":"hipocristalin","hipocristalinele":"hipocristalin","hipocristalini":"hipocristalin","hipocristalinii":"hipocristalin","hipocristalinul":"hipocristalin","hipocrizia":"hipocrizie","hipocriziei":"hipocrizie","hipocrizii":"hipocrizie","hipocriziile":"hipocrizie","hipocriziilor":"hipocrizie","hipocromia":"hipocromie","hipocromiei":"hipocromie","hipocromii":"hipocromie","hipocromiile":"hipocromie","hipocromiilor":"hipocromie","hipoderme":"hipodermă","hipodermei":"hipodermă","hipodermele":"hipodermă","hipodermelor":"hipodermă","hipodermica":["hipodermică","hipodermic","hipodermica","hipodermic"],"hipodermice":"hipodermic","hipodermicele":"hipodermic","hipodermici":"hipodermic","hipodermicii":"hipodermic","hipodermicul":"hipodermic","hipodermite":"hipodermită","hipodermitei":"hipodermită","hipodermitele":"hipodermită","hipodermitelor":"hipodermită","hipodermoze":"hipodermoză","hipodermozei":"hipodermoză","hipodermozele":"hipodermoză","hipodermozelor":"hipodermoză","hipodermul":"hipoderm","hipodermule":"hipoderm","hipodermului":"hipoderm","hipodromul":"hipodrom","hipodromule":"hipodrom","hipodromului":"hipodrom","hipodromuri":"hipodrom","hipodromurile":"hipodrom","hipodromurilor":"hipodrom","hipoergia":"hipoergie","hipoergiei":"hipoergie","hipoergii":"hipoergie","hipoergiile":"hipoergie","hipoergiilor":"hipoergie","hipoestezia":"hipoestezie","hipoesteziei":"hipoestezie","hipoestezii":"hipoestezie","hipoesteziile":"hipoestezie","hipoesteziilor":"hipoestezie","hipofaga":["hipofagă","hipofag","hipofaga","hipofag"],"hipofage":"hipofag","hipofagele":"hipofag","hipofagi":"hipofag","hipofagia":"hipofagie","hipofagiei":"hipofagie","hipofagii":["hipofagii","hipofag","hipofagii","hipofagie"],"hipofagiile":"hipofagie","hipofagiilor":"hipofagie","hipofagul":"hipofag","hipofizara":["hipofizară","hipofizar","hipofizara","hipofizar"],"hipofizare":"hipofizar","hipofizarele":"hipofizar","hipofizari":"hipofizar","hipofizarii":"hipofizar","hipofizarul":"hipofizar","hipofize":"hipofiză","hipofizectomia":"hipofizectomie","hipofizectomiei":"hipofizectomie","hipofizectomii":"hipofizectomie","hipofizectomiile":"hipofizectomie","hipofizectomiilor":"hipofizectomie","hipofizei":"hipofiză","hipofizele":"hipofiză","hipofizelor":"hipofiză","hipofoliculinisme":"hipofoliculinism","hipofoliculinismele":"hipofoliculinism","hipofoliculinismelor":"hipofoliculinism","hipofoliculinismul":"hipofoliculinism","hipofoliculinismule":"hipofoliculinism","hipofoliculinismului":"hipofoliculinism","hipofonia":"hipofonie","hipofoniei":"hipofonie","hipofonii":"hipofonie","hipofoniile":"hipofonie","hipofoniilor":"hipofonie","hipofosfati":"hipofosfat","hipofosfatii":"hipofosfat","hipofosfatilor":"hipofosfat","hipofosfatul":"hipofosfat","hipofosfatule":"hipofosfat","hipofosfatului":"hipofosfat","hipofosfiti":"hipofosfit","hipofosfitii":"hipofosfit","hipofosfitilor":"hipofosfit","hipofosfitul":"hipofosfit","hipofosfitule":"hipofosfit","hipofosfitului":"hipofosfit","hipofosforica":["hipofosforică","hipofosforic","hipofosforica","hipofosforic"],"hipofosforice":"hipofosforic","hipofosforicele":"hipofosforic","hipofosforici":"hipofosforic","hipofosforicii":"hipofosforic","hipofosforicul":"hipofosforic","hipofosforoasa":["hipofosforoasă","hipofosforos","hipofosforoasa","hipofosforos"],"hipofosforoase":"hipofosforos","hipofosforoasele":"hipofosforos","hipofosforosi":"hipofosforos","hipofosforosii":"hipofosforos","hipofosforosul":"hipofosforos","hipofunctia":"hipofuncție","hipofunctiei":"hipofuncție","hipofunctii":"hipofuncție","hipofunctiile":"hipofuncție","hipofunctiilor":"hipofuncție","hipofunctiuni":"hipofuncțiune","hipogastre":"hipogastru","hipogastrele":"hipogastru","hipogastrelor":"hipogastru","hipogastrica":["hipogastrică","hipogastric","hipogastrica","hipogastric"],"hipogastrice":"hipogastric","hipogastricele":"hipogastric","hipogastrici":"hipogastric","hipogastricii":"hipogastric","hipogastricul":"hipogastric","hipogastrul":"hipogastru","hipogastrule":"hipogastru","hipogastrului":"hipogastru","hipogei":"hipogeu","hipogeile":"hipogeu","hipogeilor":"hipogeu","hipogena":["hipogenă","hipogen","hipogena","hipogen"],"hipogene":"hipogen","hipogenele":"hipogen","hipogenezia":"hipogenezie","hipogeneziei":"hipogenezie","hipogenezii":"hipogenezie","hipogeneziile":"hipogenezie","hipogeneziilor":"hipogenezie","hipogeni":"hipogen","hipogenii":"hipogen","hipogenitalisme":"hipogenitalism","hipogenitalismele":"hipogenitalism","hipogenitalismelor":"hipogenitalism","hipogenitalismul":"hipogenitalism","hipogenitalismule":"hipogenitalism","hipogenitalismului":"hipogenitalism","hipogenul":"hipogen","hipogeul":"hipogeu","hipogeule":"hipogeu","hipogeului":"hipogeu","hipogeuzia":"hipogeuzie","hipogeuziei":"hipogeuzie","hipogeuzii":"hipogeuzie","hipogeuziile":"hipogeuzie","hipogeuziilor":"hipogeuzie","hipogina":["hipogină","hipogin","hipogina","hipogin"],"hipogine":"hipogin","hipoginele":"hipogin","hipogini":"hipogin","hipoginii":"hipogin","hipoginul":"hipogin","hipoglicemia":"hipoglicemie","hipoglicemianta":["hipoglicemiantă","hipoglicemiant","hipoglicemianta","hipoglicemiant"],"hipoglicemiante":"hipoglicemiant","hipoglicemiantele":"hipoglicemiant","hipoglicemianti":"hipoglicemiant","hipoglicemiantii":"hipoglicemiant","hipoglicemiantul":"hipoglicemiant","hipoglicemiei":"hipoglicemie","hipoglicemii":"hipoglicemie","hipoglicemiile":"hipoglicemie","hipoglicemiilor":"hipoglicemie","hipogloasa":["hipogloasă","hipoglos","hipogloasa","hipoglos"],"hipogloase":"hipoglos","hipogloasele":"hipoglos","hipoglosi":"hipoglos","hipoglosii":"hipoglos","hipoglosul":"hipoglos","hipogrifi":"hipogrif","hipogrifii":"hipogrif","hipogrifilor":"hipogrif","hipogriful":"hipogrif","hipogrifule":"hipogrif","hipogrifului":"hipogrif","hipohemia":"hipohemie","hipohemiei":"hipohemie","hipohemii":"hipohemie","hipohemiile":"hipohemie","hipohemiilor":"hipohemie","hipohidroze":"hipohidroză","hipohidrozei":"hipohidroză","hipohidrozele":"hipohidroză","hipohidrozelor":"hipohidroză","hipoida":["hipoidă","hipoid","hipoida","hipoid"],"hipoide":"hipoid","hipoidele":"hipoid","hipoidul":"hipoid","hipoinsulinisme":"hipoinsulinism","hipoinsulinismele":"hipoinsulinism","hipoinsulinismelor":"hipoinsulinism","hipoinsulinismul":"hipoinsulinism","hipoinsulinismule":"hipoinsulinism","hipoinsulinismului":"hipoinsulinism","hipoizi":"hipoid","hipoizii":"hipoid","hipologe":"hipologă","hipologei":"hipologă","hipologele":"hipologă","hipologelor":"hipologă","hipologi":"hipolog","hipologia":"hipologie","hipologica":["hipologică","hipologic","hipologica","hipologic"],"hipologice":"hipologic","hipologicele":"hipologic","hipologici":"hipologic","hipologicii":"hipologic","hipologicul":"hipologic","hipologiei":"hipologie","hipologii":["hipologii","hipolog","hipologii","hipologie"],"hipologiile":"hipologie","hipologiilor":"hipologie","hipologilor":"hipolog","hipologul":"hipolog","hipologule":"hipolog","hipologului":"hipolog","hipomantia":"hipomanție","hipomantiei":"hipomanție","hipomantii":"hipomanție","hipomantiile":"hipomanție","hipomantiilor":"hipomanție","hipomenoreea":"hipomenoree","hipomenoreei":"hipomenoree","hipomenoreele":"hipomenoree","hipomenoreelor":"hipomenoree","hipometre":"hipometru","hipometrele":"hipometru","hipometrelor":"hipometru","hipometria":"hipometrie","hipometriei":"hipometrie","hipometrii":"hipometrie","hipometriile":"hipometrie","hipometriilor":"hipometrie","hipometropa":["hipometropă","hipometrop","hipometropa","hipometrop"],"hipometrope":["hipometrope","hipometrop","hipometrope","hipometropă"],"hipometropei":"hipometropă","hipometropele":["hipometropele","hipometrop","hipometropele","hipometropă"],"hipometropelor":"hipometropă","hipometropi":"hipometrop","hipometropia":"hipometropie","hipometropiei":"hipometropie","hipometropii":["hipometropii","hipometrop","hipometropii","hipometropie"],"hipometropiile":"hipometropie","hipometropiilor":"hipometropie","hipometropilor":"hipometrop","hipometropul":"hipometrop","hipometropule":"hipometrop","hipometropului":"hipometrop","hipometruul":"hipometru","hipometruule":"hipometru","hipometruului":"hipometru","hipomnezia":"hipomnezie","hipomneziei":"hipomnezie","hipomnezii":"hipomnezie","hipomneziile":"hipomnezie","hipomneziilor":"hipomnezie","hipomobila":["hipomobilă","hipomobil","hipomobila","hipomobil"],"hipomobile":"hipomobil","hipomobilele":"hipomobil","hipomobili":"hipomobil","hipomobilii":"hipomobil","hipomobilul":"hipomobil","hiponastia":"hiponastie","hiponastiei":"hiponastie","hiponastii":"hiponastie","hiponastiile":"hiponastie","hiponastiilor":"hiponastie","hiponime":"hiponim","hiponimele":"hiponim","hiponimelor":"hiponim","hiponimul":"hiponim","hiponimule":"hiponim","hiponimului":"hiponim","hipoparatiroidisme":"hipoparatiroidism","hipoparatiroidismele":"hipoparatiroidism","hipoparatiroidismelor":"hipoparatiroidism","hipoparatiroidismul":"hipoparatiroidism","hipoparatiroidismule":"hipoparatiroidism","hipoparatiroidismului":"hipoparatiroidism","hipopatologia":"hipopatologie","hipopatologiei":"hipopatologie","hipopatologii":"hipopatologie","hipopatologiile":"hipopatologie","hipopatologiilor":"hipopatologie","hipopepsia":"hipopepsie","hipopepsiei":"hipopepsie","hipopepsii":"hipopepsie","hipopepsiile":"hipopepsie","hipopepsiilor":"hipopepsie","hipoplazia":"hipoplazie","hipoplaziei":"hipoplazie","hipoplazii":"hipoplazie","hipoplaziile":"hipoplazie","hipoplaziilor":"hipoplazie","hipopotami":"hipopotam","hipopotamii":"hipopotam","hipopotamilor":"hipopotam","hipopotamul":"hipopotam","hipopotamule":"hipopotam","hipopotamului":"hipopotam","hipoproteinemia":"hipoproteinemie","hipoproteinemiei":"hipoproteinemie","hipoproteinemii":"hipoproteinemie","hipoproteinemiile":"hipoproteinemie","hipoproteinemiilor":"hipoproteinemie","hiporcheme":"hiporchemă","hiporchemei":"hiporchemă","hiporchemele":"hiporchemă","hiporchemelor":"hiporchemă","hiporexia":"hiporexie","hiporexiei":"hiporexie","hiporexii":"hiporexie","hiporexiile":"hiporexie","hiporexiilor":"hiporexie","hiposcenii":"hiposceniu","hiposceniile":"hiposceniu","hiposceniilor":"hiposceniu","hiposceniul":"hiposceniu","hiposceniule":"hiposceniu","hiposceniului":"hiposceniu","hiposecretia":"hiposecreție","hiposecretiei":"hiposecreție","hiposecretii":"hiposecreție","hiposecretiile":"hiposecreție","hiposecretiilor":"hiposecreție","hiposensibilitatea":"hiposensibilitate","hiposensibilitati":"hiposensibilitate","hiposensibilitatii":"hiposensibilitate","hiposensibilitatile":"hiposensibilitate","hiposensibilitatilor":"hiposensibilitate","hiposmia":"hiposmie","hiposmiei":"hiposmie","hiposmii":"hiposmie","hiposmiile":"hiposmie","hiposmiilor":"hiposmie","hipostenia":"hipostenie","hiposteniei":"hipostenie","hipostenii":"hipostenie","hipostilul":"hipostil","hipostilule":"hipostil","hipostilului":"hipostil","hipostiluri":"hipostil","hipostilurile":"hipostil","hipostilurilor":"hipostil","hiposulfiti":"hiposulfit","hiposulfitii":"hiposulfit","hiposulfitilor":"hiposulfit","hiposulfitul":"hiposulfit","hiposulfitule":"hiposulfit","hiposulfitului":"hiposulfit","hipotactica":["hipotactică","hipotactic","hipotactica","hipotactic"],"hipotactice":"hipotactic","hipotacticele":"hipotactic","hipotactici":"hipotactic","hipotacticii":"hipotactic","hipotacticul":"hipotactic","hipotalamica":["hipotalamică","hipotalamic","hipotalamica","hipotalamic"],"hipotalamice":"hipotalamic","hipotalamicele":"hipotalamic","hipotalamici":"hipotalamic","hipotalamicii":"hipotalamic","hipotalamicul":"hipotalamic","hipotalamusul":"hipotalamus","hipotalamusule":"hipotalamus","hipotalamusului":"hipotalamus","hipotalamusuri":"hipotalamus","hipotalamusurile":"hipotalamus","hipotalamusurilor":"hipotalamus","hipotaxe":"hipotaxă","hipotaxei":"hipotaxă","hipotaxele":"hipotaxă","hipotaxelor":"hipotaxă","hipotecarea":"hipotecare","hipotecari":"hipotecare","hipotecarii":"hipotecare","hipotece":"hipotecă","hipotecei":"hipotecă","hipotenare":"hipotenar","hipotenarele":"hipotenar","hipotenarelor":"hipotenar","hipotenarul":"hipotenar","hipotenarule":"hipotenar","hipotenarului":"hipotenar","hipotensiunea":"hipotensiune","hipotensiunei":"hipotensiune","hipotensiunele":"hipotensiune","hipotensiunelor":"hipotensiune","hipotensiuni":"hipotensiune","hipotensive":"hipotensivă","hipotensivei":"hipotensivă","hipotensivele":"hipotensivă","hipotensivelor":"hipotensivă","hipotensivi":"hipotensiv","hipotensivii":"hipotensiv","hipotensivilor":"hipotensiv","hipotensivul":"hipotensiv","hipotensivule":"hipotensiv","hipotensivului":"hipotensiv","hipotenuze":"hipotenuză","hipotenuzei":"hipotenuză","hipotermala":["hipotermală","hipotermal","hipotermala","hipotermal"],"hipotermale":"hipotermal","hipotermalele":"hipotermal","hipotermali":"hipotermal","hipotermalii":"hipotermal","hipotermalul":"hipotermal","hipotermia":"hipotermie","hipotermica":["hipotermică","hipotermic","hipotermica","hipotermic"],"hipotermice":"hipotermic","hipotermicele":"hipotermic","hipotermici":"hipotermic","hipotermicii":"hipotermic","hipotermicul":"hipotermic","hipotermiei":"hipotermie","hipotermii":"hipotermie","hipotermiile":"hipotermie","hipotermiilor":"hipotermie","hipotetica":["hipotetică","hipotetic","hipotetica","hipotetic"],"hipotetice":"hipotetic","hipoteticele":"hipotetic","hipotetici":"hipotetic","hipoteticii":"hipotetic","hipoteticul":"hipotetic","hipoteze":"hipoteză","hipotezei":"hipoteză","hipotipoze":"hipotipoză","hipotipozei":"hipotipoză","hipotipozele":"hipotipoză","hipotipozelor":"hipotipoză","hipotiroidia":"hipotiroidie","hipotiroidiana":["hipotiroidiană","hipotiroidian","hipotiroidiana","hipotiroidian"],"hipotiroidianul":"hipotiroidian","hipotiroidiei":"hipotiroidie","hipotiroidiene":["hipotiroidiene","hipotiroidian","hipotiroidiene","hipotiroidiană"],"hipotiroidienei":"hipotiroidiană","hipotiroidienele":["hipotiroidienele","hipotiroidian","hipotiroidienele","hipotiroidiană"],"hipotiroidienelor":"hipotiroidiană","hipotiroidieni":"hipotiroidian","hipotiroidienii":"hipotiroidian","hipotiroidii":"hipotiroidie","hipotiroidiile":"hipotiroidie","hipotiroidiilor":"hipotiroidie","hipotiroidisme":"hipotiroidism","hipotiroidismele":"hipotiroidism","hipotiroidismelor":"hipotiroidism","hipotiroidismul":"hipotiroidism","hipotiroidismule":"hipotiroidism","hipotiroidismului":"hipotiroidism","hipotonia":"hipotonie","hipotonica":["hipotonică","hipotonic","hipotonica","hipotonic"],"hipotonice":"hipotonic","hipotonicele":"hipotonic","hipotonici":"hipotonic","hipotonicii":"hipotonic","hipotonicitatea":"hipotonicitate","hipotonicitati":"hipotonicitate","hipotonicitatii":"hipotonicitate","hipotonicul":"hipotonic","hipotoniei":"hipotonie","hipotonii":"hipotonie","hipotoniile":"hipotonie","hipotoniilor":"hipotonie","hipotricoze":"hipotricoză","hipotricozei":"hipotricoză","hipotricozele":"hipotricoză","hipotricozelor":"hipotricoză","hipotrofia":"hipotrofie","hipotrofiei":"hipotrofie","hipotrofii":"hipotrofie","hipotrofiile":"hipotrofie","hipotrofiilor":"hipotrofie","hipovitaminoze":"hipovitaminoză","hipovitaminozei":"hipovitaminoză","hipovitaminozele":"hipovitaminoză","hipovitaminozelor":"hipovitaminoză","hipoxemia":"hipoxemie","hipoxemiei":"hipoxemie","hipoxemii":"hipoxemie","hipoxemiile":"hipoxemie","hipoxemiilor":"hipoxemie","hipoxia":"hipoxie","hipoxiei":"hipoxie","hipoxii":"hipoxie","hipoxiile":"hipoxie","hipoxiilor":"hipoxie","hippyi":"hippy","hippylor":"hippy","hippyul":"hippy","hippyule":"hippy","hippyului":"hippy","hipsocroma":["hipsocromă","hipsocrom","hipsocroma","hipsocrom"],"hipsocrome":"hipsocrom","hipsocromele":"hipsocrom","hipsocromi":"hipsocrom","hipsocromia":"hipsocromie","hipsocromiei":"hipsocromie","hipsocromii":["hipsocromii","hipsocrom","hipsocromii","hipsocromie"],"hipsocromiile":"hipsocromie","hipsocromiilor":"hipsocromie","hipsocromul":"hipsocrom","hipsografe":"hipsograf","hipsografele":"hipsograf","hipsografelor":"hipsograf","hipsografia":"hipsografie","hipsografica":["hipsografică","hipsografic","hipsografica","hipsografic"],"hipsografice":"hipsografic","hipsograficele":"hipsografic","hipsografici":"hipsografic","hipsograficii":"hipsografic","hipsograficul":"hipsografic","hipsografiei":"hipsografie","hipsografii":"hipsografie","hipsograful":"hipsograf","hipsografule":"hipsograf","hipsografului":"hipsograf","hipsograme":"hipsogramă","hipsogramei":"hipsogramă","hipsogramele":"hipsogramă","hipsogramelor":"hipsogramă","hipsometre":"hipsometru","hipsometrele":"hipsometru","hipsometrelor":"hipsometru","hipsometria":"hipsometrie","hipsometrica":["hipsometrică","hipsometric","hipsometrica","hipsometric"],"hipsometrice":"hipsometric","hipsometricele":"hipsometric","hipsometrici":"hipsometric","hipsometricii":"hipsometric","hipsometricul":"hipsometric","hipsometriei":"hipsometrie","hipsometrii":"hipsometrie","hipsometrul":"hipsometru","hipsometrule":"hipsometru","hipsometrului":"hipsometru","hipuria":"hipurie","hipurica":["hipurică","hipuric","hipurica","hipuric"],"hipurice":"hipuric","hipuricele":"hipuric","hipurici":"hipuric","hipuricii":"hipuric","hipuricul":"hipuric","hipuriei":"hipurie","hipurii":"hipurie","hipuriile":"hipurie","hipuriilor":"hipurie","hipuriti":"hipurit","hipuritii":"hipurit","hipuritilor":"hipurit","hipuritul":"hipurit","hipuritule":"hipurit","hipuritului":"hipurit","hirigle":"hiriglă","hiriglei":"hiriglă","hiriglele":"hiriglă","hiriglelor":"hiriglă","hiritisea":"hiritisi","hiritiseai":"hiritisi","hiritiseam":"hiritisi","hiritiseati":"hiritisi","hiritiseau":"hiritisi","hiritisele":"hiritiseală","hiritiselei":"hiritiseală","hiritiselele":"hiritiseală","hiritiselelor":"hiritiseală","hiritiseli":"hiritiseală","hiritisesc":"hiritisi","hiritiseste":"hiritisi","hiritisesti":"hiritisi","hiritisii":"hiritisi","hiritisim":"hiritisi","hiritisind":"hiritisi","hiritisira":"hiritisi","hiritisiram":"hiritisi","hiritisirati":"hiritisi","hiritisirea":"hiritisire","hiritisiri":"hiritisire","hiritisirii":"hiritisire","hiritisirile":"hiritisire","hiritisirilor":"hiritisire","hiritisise":"hiritisi","hiritisisem":"hiritisi","hiritisisera":"hiritisi","hiritisiseram":"hiritisi","hiritisiserati":"hiritisi","hiritisisesi":"hiritisi","hiritisisi":"hiritisi","hiritisit":"hiritisi","hiritisiti":"hiritisi","hirotonea":"hirotoni","hirotoneai":"hirotoni","hirotoneam":"hirotoni","hirotoneati":"hirotoni","hirotoneau":"hirotoni","hirotonesc":"hirotoni","hirotoneste":"hirotoni","hirotonesti":"hirotoni","hirotonia":"hirotonie","hirotoniei":"hirotonie","hirotonii":["hirotonii","hirotoni","hirotonii","hirotonie"],"hirotoniile":"hirotonie","hirotoniilor":"hirotonie","hirotonim":"hirotoni","hirotonind":"hirotoni","hirotonira":"hirotoni","hirotoniram":"hirotoni","hirotonirati":"hirotoni","hirotonirea":"hirotonire","hirotoniri":"hirotonire","hirotonirii":"hirotonire","hirotonirile":"hirotonire","hirotonirilor":"hirotonire","hirotonise":"hirotoni","hirotonisea":"hirotonisi","hirotoniseai":"hirotonisi","hirotoniseam":"hirotonisi","hirotoniseati":"hirotonisi","hirotoniseau":"hirotonisi","hirotonisem":"hirotoni","hirotonisera":"hirotoni","hirotoniseram":"hirotoni","hirotoniserati":"hirotoni","hirotonisesc":"hirotonisi","hirotonisesi":"hirotoni","hirotoniseste":"hirotonisi","hirotonisesti":"hirotonisi","hirotonisi":"hirotoni","hirotonisii":"hirotonisi","hirotonisim":"hirotonisi","hirotonisind":"hirotonisi","hirotonisira":"hirotonisi","hirotonisiram":"hirotonisi","hirotonisirati":"hirotonisi","hirotonisirea":"hirotonisire","hirotonisiri":"hirotonisire","hirotonisirii":"hirotonisire","hirotonisirile":"hirotonisire","hirotonisirilor":"hirotonisire","hirotonisise":"hirotonisi","hirotonisisem":"hirotonisi","hirotonisisera":"hirotonisi","hirotonisiseram":"hirotonisi","hirotonisiserati":"hirotonisi","hirotonisisesi":"hirotonisi","hirotonisisi":"hirotonisi","hirotonisit":"hirotonisi","hirotonisita":["hirotonisită","hirotonisit","hirotonisita","hirotonisit"],"hirotonisite":"hirotonisit","hirotonisitele":"hirotonisit","hirotonisiti":["hirotonisiți","hirotonisi","hirotonisiți","hirotonisit"],"hirotonisitii":"hirotonisit","hirotonisitul":"hirotonisit","hirotonit":"hirotoni","hirotonita":["hirotonită","hirotonit","hirotonita","hirotonit"],"hirotonite":"hirotonit","hirotonitele":"hirotonit","hirotoniti":["hirotoniți","hirotoni","hirotoniți","hirotonit"],"hirotonitii":"hirotonit","hirotonitul":"hirotonit","hirotonosea":"hirotonosi","hirotonoseai":"hirotonosi","hirotonoseam":"hirotonosi","hirotonoseati":"hirotonosi","hirotonoseau":"hirotonosi","hirotonosesc":"hirotonosi","hirotonoseste":"hirotonosi","hirotonosesti":"hirotonosi","hirotonosii":"hirotonosi","hirotonosim":"hirotonosi","hirotonosind":"hirotonosi","hirotonosira":"hirotonosi","hirotonosiram":"hirotonosi","hirotonosirati":"hirotonosi","hirotonosise":"hirotonosi","hirotonosisem":"hirotonosi","hirotonosisera":"hirotonosi","hirotonosiseram":"hirotonosi","hirotonosiserati":"hirotonosi","hirotonosisesi":"hirotonosi","hirotonosisi":"hirotonosi","hirotonosit":"hirotonosi","hirotonositi":"hirotonosi","hirsuta":["hirsută","hirsut","hirsuta","hirsut"],"hirsute":"hirsut","hirsutele":"hirsut","hirsuti":"hirsut","hirsutii":"hirsut","hirsutismul":"hirsutism","hirsutismule":"hirsutism","hirsutismului":"hirsutism","hirsutul":"hirsut","hirte":"hirtă","hirtei":"hirtă","hirtele":"hirtă","hirtelor":"hirtă","hirtie":"hârtie","hirudinei":"hirudineu","hirudineii":"hirudineu","hirudineilor":"hirudineu","hirudineul":"hirudineu","hirudineule":"hirudineu","hirudineului":"hirudineu","hirudinine":"hirudinină","hirudininei":"hirudinină","hirudininele":"hirudinină","hirudininelor":"hirudinină","hirudinizarea":"hirudinizare","hirudinizari":"hirudinizare","hirudinizarii":"hirudinizare","hirudinizarile":"hirudinizare","hirudinizarilor":"hirudinizare","hirurgi":"hirurg","hirurgia":"hirurgie","hirurgicala":["hirurgicală","hirurgical","hirurgicala","hirurgical"],"hirurgicale":"hirurgical","hirurgicalele":"hirurgical","hirurgicali":"hirurgical","hirurgicalii":"hirurgical","hirurgicalul":"hirurgical","hirurgiei":"hirurgie","hirurgii":["hirurgii","hirurg","hirurgii","hirurgie"],"hirurgilor":"hirurg","hirurgul":"hirurg","hirurgule":"hirurg","hirurgului":"hirurg","hisopirei":"hisopirel","hisopireii":"hisopirel","hisopireilor":"hisopirel","hisopirelul":"hisopirel","hisopirelule":"hisopirel","hisopirelului":"hisopirel","hispanica":["hispanică","hispanic","hispanica","hispanic"],"hispanice":"hispanic","hispanicele":"hispanic","hispanici":"hispanic","hispanicii":"hispanic","hispanicul":"hispanic","hispanisme":"hispanism","hispanismele":"hispanism","hispanismelor":"hispanism","hispanismul":"hispanism","hispanismule":"hispanism","hispanismului":"hispanism","hispaniste":"hispanistă","hispanistei":"hispanistă","hispanistele":"hispanistă","hispanistelor":"hispanistă","hispanisti":"hispanist","hispanistici":"hispanistică","hispanisticii":"hispanistică","hispanistii":"hispanist","hispanistilor":"hispanist","hispanistul":"hispanist","hispanistule":"hispanist","hispanistului":"hispanist","hispanofile":"hispanofilă","hispanofilei":"hispanofilă","hispanofilele":"hispanofilă","hispanofilelor":"hispanofilă","hispanofili":"hispanofil","hispanofilii":"hispanofil","hispanofililor":"hispanofil","hispanofilul":"hispanofil","hispanofilule":"hispanofil","hispanofilului":"hispanofil","hispida":["hispidă","hispid","hispida","hispid"],"hispide":"hispid","hispidele":"hispid","hispidul":"hispid","hispizi":"hispid","hispizii":"hispid","histamine":"histamină","histaminei":"histamină","histaminele":"histamină","histaminelor":"histamină","histaminica":["histaminică","histaminic","histaminica","histaminic"],"histaminice":"histaminic","histaminicele":"histaminic","histaminici":"histaminic","histaminicii":"histaminic","histaminicul":"histaminic","histeralgia":"histeralgie","histeralgiei":"histeralgie","histeralgii":"histeralgie","histeralgiile":"histeralgie","histeralgiilor":"histeralgie","histerectomia":"histerectomie","histerectomiei":"histerectomie","histerectomii":"histerectomie","histerectomiile":"histerectomie","histerectomiilor":"histerectomie","histerezisul":"histerezis","histerezisule":"histerezis","histerezisului":"histerezis","histeria":"histerie","histerica":["histerică","histeric","histerica","histeric"],"histerice":"histeric","histericele":"histeric","histerici":"histeric","histericii":"histeric","histericul":"histeric","histeriei":"histerie","histerii":"histerie","histeriile":"histerie","histeriilor":"histerie","histerocele":"histerocel","histerocelele":"histerocel","histerocelelor":"histerocel","histerocelul":"histerocel","histerocelule":"histerocel","histerocelului":"histerocel","histerografia":"histerografie","histerografiei":"histerografie","histerografii":"histerografie","histerografiile":"histerografie","histerografiilor":"histerografie","histerologia":"histerologie","histerologiei":"histerologie","histerologii":"histerologie","histerologiile":"histerologie","histerologiilor":"histerologie","histerometre":"histerometru","histerometrele":"histerometru","histerometrelor":"histerometru","histerometrul":"histerometru","histerometrule":"histerometru","histerometrului":"histerometru","histeropexia":"histeropexie","histeropexiei":"histeropexie","histeropexii":"histeropexie","histeroptoze":"histeroptoză","histeroptozei":"histeroptoză","histeroptozele":"histeroptoză","histeroptozelor":"histeroptoză","histeroragia":"histeroragie","histeroragiei":"histeroragie","histeroragii":"histeroragie","histeroragiile":"histeroragie","histeroragiilor":"histeroragie","histerosalpingografia":"hîsterosalpingografie","histerosalpingografiei":"hîsterosalpingografie","histerosalpingografii":"hîsterosalpingografie","histeroscopia":"histeroscopie","histeroscopiei":"histeroscopie","histeroscopii":"histeroscopie","histeroscopiile":"histeroscopie","histeroscopiilor":"histeroscopie","histerotomia":"histerotomie","histerotomiei":"histerotomie","histerotomii":"histerotomie","histerotomiile":"histerotomie","histerotomiilor":"histerotomie","histidine":"histidină","histidinei":"histidină","histidinele":"histidină","histidinelor":"histidină","histiocite":"histiocit","histiocitele":"histiocit","histiocitelor":"histiocit","histiocitul":"histiocit","histiocitule":"histiocit","histiocitului":"histiocit","histochimia":"histochimie","histochimica":["histochimică","histochimic","histochimica","histochimic"],"histochimice":"histochimic","histochimicele":"histochimic","histochimici":"histochimic","histochimicii":"histochimic","histochimicul":"histochimic","histochimiei":"histochimie","histochimii":"histochimie","histodiagnostice":"histodiagnostic","histodiagnosticele":"histodiagnostic","histodiagnosticelor":"histodiagnostic","histodiagnosticul":"histodiagnostic","histodiagnosticule":"histodiagnostic","histodiagnosticului":"histodiagnostic","histofiziologia":"histofiziologie","histofiziologiei":"histofiziologie","histofiziologii":"histofiziologie","histofiziologiile":"histofiziologie","histofiziologiilor":"histofiziologie","histogena":["histogenă","histogen","histogena","histogen"],"histogene":"histogen","histogenele":"histogen","histogeneze":"histogeneză","histogenezei":"histogeneză","histogenezele":"histogeneză","histogenezelor":"histogeneză","histogeni":"histogen","histogenii":"histogen","histogenul":"histogen","histograme":"histogramă","histogramei":"histogramă","histogramele":"histogramă","histogramelor":"histogramă","histoida":["histoidă","histoid","histoida","histoid"],"histoide":"histoid","histoidele":"histoid","histoidul":"histoid","histoizi":"histoid","histoizii":"histoid","histolize":"histoliză","histolizei":"histoliză","histolizele":"histoliză","histolizelor":"histoliză","histologe":"histologă","histologei":"histologă","histologele":"histologă","histologelor":"histologă","histologi":"histolog","histologia":"histologie","histologica":["histologică","histologic","histologica","histologic"],"histologice":"histologic","histologicele":"histologic","histologici":"histologic","histologicii":"histologic","histologicul":"histologic","histologiei":"histologie","histologii":["histologii","histolog","histologii","histologie"],"histologilor":"histolog","histologul":"histolog","histologule":"histolog","histologului":"histolog","histomonoze":"histomonoză","histomonozei":"histomonoză","histomonozele":"histomonoză","histomonozelor":"histomonoză","histone":"histonă","histonei":"histonă","histonele":"histonă","histonelor":"histonă","histopatologia":"histopatologie","histopatologica":["histopatologică","histopatologic","histopatologica","histopatologic"],"histopatologice":"histopatologic","histopatologicele":"histopatologic","histopatologici":"histopatologic","histopatologicii":"histopatologic","histopatologicul":"histopatologic","histopatologiei":"histopatologie","histopatologii":"histopatologie","histopatologiile":"histopatologie","histopatologiilor":"histopatologie","histoplasmoze":"histoplasmoză","histoplasmozei":"histoplasmoză","historiograme":"historiogramă","historiogramei":"historiogramă","historiogramele":"historiogramă","historiogramelor":"historiogramă","histoterapia":"histoterapie","histoterapiei":"histoterapie","histoterapii":"histoterapie","histoterapiile":"histoterapie","histoterapiilor":"histoterapie","histotoxica":["histotoxică","histotoxic","histotoxica","histotoxic"],"histotoxice":"histotoxic","histotoxicele":"histotoxic","histotoxici":"histotoxic","histotoxicii":"histotoxic","histotoxicul":"histotoxic","histotropisme":"histotropism","histotropismele":"histotropism","histotropismelor":"histotropism","histotropismul":"histotropism","histotropismule":"histotropism","histotropismului":"histotropism","histrioni":"histrion","histrionica":["histrionică","histrionic","histrionica","histrionic"],"histrionice":"histrionic","histrionicele":"histrionic","histrionici":"histrionic","histrionicii":"histrionic","histrionicul":"histrionic","histrionii":"histrion","histrionilor":"histrion","histrionul":"histrion","histrionule":"histrion","histrionului":"histrion","hitite":"hitită","hititei":"hitită","hititele":"hitită","hititelor":"hitită","hititi":"hitit","hititii":"hitit","hititilor":"hitit","hititul":"hitit","hititule":"hitit","hititului":"hitit","hitlerisme":"hitlerism","hitlerismele":"hitlerism","hitlerismelor":"hitlerism","hitlerismul":"hitlerism","hitlerismule":"hitlerism","hitlerismului":"hitlerism","hitleriste":"hitleristă","hitleristei":"hitleristă","hitleristele":"hitleristă","hitleristelor":"hitleristă","hitleristi":"hitlerist","hitleristii":"hitlerist","hitleristilor":"hitlerist","hitleristul":"hitlerist","hitleristule":"hitlerist","hitleristului":"hitlerist","hitoane":"hiton","hitoanele":"hiton","hitoanelor":"hiton","hitonul":"hiton","hitonule":"hiton","hitonului":"hiton","hitul":"hit","hitule":"hit","hitului":"hit","hituri":"hit","hiturile":"hit","hiturilor":"hit","hleioasa":["hleioasă","hleios","hleioasa","hleios"],"hleioase":"hleios","hleioasele":"hleios","hleiosi":"hleios","hleiosii":"hleios","hleiosul":"hleios","hleiul":"hlei","hleiule":"hlei","hleiului":"hlei","hleiuri":"hlei","hleiurile":"hlei","hleiurilor":"hlei","hlipate":"hlipăt","hlipatele":"hlipăt","hlipatelor":"hlipăt","hlipatul":"hlipăt","hlipatule":"hlipăt","hlipatului":"hlipăt","hlize":"hliză","hlizei":"hliză","hlizele":"hliză","hlizelor":"hliză","hlizenia":"hlizenie","hlizeniei":"hlizenie","hlizenii":"hlizenie","hlizeniile":"hlizenie","hlizeniilor":"hlizenie","hlizisoare":"hlizișoară","hlizisoarei":"hlizișoară","hlizisoarele":"hlizișoară","hlizisoarelor":"hlizișoară","hoanghine":"hoanghină","hoanghinei":"hoanghină","hoanghinele":"hoanghină","hoanghinelor":"hoanghină","hoarde":"hoardă","hoardei":"hoardă","hoardele":"hoardă","hoardelor":"hoardă","hoaste":"hoașcă","hoastei":"hoașcă","hoastele":"hoașcă","hoastelor":"hoașcă","hoate":"hoață","hoatei":"hoață","hoatele":"hoață","hoatelor":"hoață","hobale":"hobăl","hobalele":"hobăl","hobalelor":"hobăl","hobalul":"hobăl","hobalule":"hobăl","hobalului":"hobăl","hobane":"hoban","hobanele":"hoban","hobanelor":"hoban","hobanul":"hoban","hobanule":"hoban","hobanului":"hoban","hobby-ul":"hobby","hobby-ule":"hobby","hobby-ului":"hobby","hobby-uri":"hobby","hobby-urile":"hobby","hobby-urilor":"hobby","hobbyisti":"hobbyist","hobbyistii":"hobbyist","hobbyistilor":"hobbyist","hobbyistul":"hobbyist","hobbyistule":"hobbyist","hobbyistului":"hobbyist","hobote":"hobot","hobotele":"hobot","hobotelor":"hobot","hobotul":"hobot","hobotule":"hobot","hobotului":"hobot","hocheisti":["hocheiști","hocheist","hocheisti","hocheist"],"hocheistii":"hocheist","hocheistilor":"hocheist","hocheistul":"hocheist","hocheistule":"hocheist","hocheistului":"hocheist","hocheiul":"hochei","hocheiule":"hochei","hocheiului":"hochei","hochetonul":"hocheton","hochetonule":"hocheton","hochetonului":"hocheton","hochetonuri":"hocheton","hochetonurile":"hocheton","hochetonurilor":"hocheton","hochimul":"hochim","hochimule":"hochim","hochimului":"hochim","hochimuri":"hochim","hochimurile":"hochim","hochimurilor":"hochim","hochiumatul":"hochiumat","hochiumatule":"hochiumat","hochiumatului":"hochiumat","hochpartere":"hochparter","hochparterele":"hochparter","hochparterelor":"hochparter","hochparterul":"hochparter","hochparterule":"hochparter","hochparterului":"hochparter","hodine":"hodină","hodinea":"hodini","hodineai":"hodini","hodineam":"hodini","hodineati":"hodini","hodineau":"hodini","hodinei":"hodină","hodinele":"hodină","hodinelor":"hodină","hodinesc":"hodini","hodineste":"hodini","hodinesti":"hodini","hodini":"odihni","hodinii":"hodini","hodinim":"hodini","hodinind":"hodini","hodinira":"hodini","hodiniram":"hodini","hodinirati":"hodini","hodinise":"hodini","hodinisem":"hodini","hodinisera":"hodini","hodiniseram":"hodini","hodiniserati":"hodini","hodinisesi":"hodini","hodinisi":"hodini","hodinit":"hodini","hodinita":["hodinită","hodinit","hodinita","hodinit"],"hodinite":"hodinit","hodinitele":"hodinit","hodiniti":["hodiniți","hodini","hodiniți","hodinit"],"hodinitii":"hodinit","hodinitul":"hodinit","hodografe":"hodograf","hodografele":"hodograf","hodografelor":"hodograf","hodograful":"hodograf","hodografule":"hodograf","hodografului":"hodograf","hodoleanul":"hodolean","hodoleanule":"hodolean","hodoleanului":"hodolean","hodoleni":"hodolean","hodolenii":"hodolean","hodolenilor":"hodolean","hodometre":"hodometru","hodometrele":"hodometru","hodometrelor":"hodometru","hodometria":"hodometrie","hodometrica":["hodometrică","hodometric","hodometrica","hodometric"],"hodometrice":"hodometric","hodometricele":"hodometric","hodometrici":"hodometric","hodometricii":"hodometric","hodometricul":"hodometric","hodometriei":"hodometrie","hodometrii":"hodometrie","hodometriile":"hodometrie","hodometriilor":"hodometrie","hodometrul":"hodometru","hodometrule":"hodometru","hodometrului":"hodometru","hodoroage":"hodoroagă","hodoroagei":"hodoroagă","hodoroagele":"hodoroagă","hodoroagelor":"hodoroagă","hodorogea":"hodorogi","hodorogeai":"hodorogi","hodorogeam":"hodorogi","hodorogeati":"hodorogi","hodorogeau":"hodorogi","hodorogesc":"hodorogi","hodorogeste":"hodorogi","hodorogesti":"hodorogi","hodorogi":"hodorog","hodorogii":["hodorogii","hodorog","hodorogii","hodorogi"],"hodorogilor":"hodorog","hodorogim":"hodorogi","hodorogind":"hodorogi","hodorogira":"hodorogi","hodorogiram":"hodorogi","hodorogirati":"hodorogi","hodorogirea":"hodorogire","hodorogiri":"hodorogire","hodorogirii":"hodorogire","hodorogirile":"hodorogire","hodorogirilor":"hodorogire","hodorogise":"hodorogi","hodorogisem":"hodorogi","hodorogisera":"hodorogi","hodorogiseram":"hodorogi","hodorogiserati":"hodorogi","hodorogisesi":"hodorogi","hodorogisi":"hodorogi","hodorogit":"hodorogi","hodorogita":["hodorogită","hodorogit","hodorogita","hodorogit"],"hodorogite":"hodorogit","hodorogitele":"hodorogit","hodorogiti":["hodorogiți","hodorogi","hodorogiți","hodorogit"],"hodorogitii":"hodorogit","hodorogitul":"hodorogit","hodorogul":"hodorog","hodorogule":"hodorog","hodorogului":"hodorog","hofale":"hofală","hofalei":"hofală","hofalele":"hofală","hofalelor":"hofală","hogase":"hogaș","hogasele":"hogaș","hogaselor":"hogaș","hogasul":"hogaș","hogasule":"hogaș","hogasului":"hogaș","hogeac":"ogeac","hogeacul":"hogeac","hogeacule":"hogeac","hogeacului":"hogeac","hogeacuri":"hogeac","hogeacurile":"hogeac","hogeacurilor":"hogeac","hogeagul":"hogeag","hogeagule":"hogeag","hogeagului":"hogeag","hogeaguri":"hogeag","hogeagurile":"hogeag","hogeagurilor":"hogeag","hogeaul":"hogea","hogeaule":"hogea","hogeaului":"hogea","hogegheani":"hogeghean","hogegheanii":"hogeghean","hogegheanilor":"hogeghean","hogegheanul":"hogeghean","hogegheanule":"hogeghean","hogegheanului":"hogeghean","hogetul":"hoget","hogetule":"hoget","hogetului":"hoget","hogeul":"hoge","hogeule":"hoge","hogeului":"hoge","hogi":"hoge","hogii":"hoge","hogilor":"hoge","hoherasul":"hoheraș","hoherasule":"hoheraș","hoherasului":"hoheraș","hoherea":"hoheri","hohereai":"hoheri","hoheream":"hoheri","hohereati":"hoheri","hohereau":"hoheri","hoheresc":"hoheri","hohereste":"hoheri","hoheresti":"hoheri","hoheri":"hoher","hoherii":["hoherii","hoher","hoherii","hoheri"],"hoherilor":"hoher","hoherim":"hoheri","hoherind":"hoheri","hoherira":"hoheri","hoheriram":"hoheri","hoherirati":"hoheri","hoherise":"hoheri","hoherisem":"hoheri","hoherisera":"hoheri","hoheriseram":"hoheri","hoheriserati":"hoheri","hoherisesi":"hoheri","hoherisi":"hoheri","hoherit":"hoheri","hoheriti":"hoheri","hoherul":"hoher","hoherule":"hoher","hoherului":"hoher","hohote":"hohot","hohotea":"hohoti","hohoteai":"hohoti","hohoteam":"hohoti","hohoteati":"hohoti","hohoteau":"hohoti","hohotele":"hohot","hohotelor":"hohot","hohotesc":"hohoti","hohoteste":"hohoti","hohotesti":"hohoti","hohotii":"hohoti","hohotim":"hohoti","hohotind":"hohoti","hohotira":"hohoti","hohotiram":"hohoti","hohotirati":"hohoti","hohotirea":"hohotire","hohotiri":"hohotire","hohotirii":"hohotire","hohotirile":"hohotire","hohotirilor":"hohotire","hohotise":"hohoti","hohotisem":"hohoti","hohotisera":"hohoti","hohotiseram":"hohoti","hohotiserati":"hohoti","hohotisesi":"hohoti","hohotisi":"hohoti","hohotit":"hohoti","hohotiti":"hohoti","hohotul":"hohot","hohotule":"hohot","hohotului":"hohot","hoinara":["hoinară","hoinar","hoinara","hoinar"],"hoinare":["hoinare","hoinar","hoinare","hoinară"],"hoinarea":"hoinări","hoinareai":"hoinări","hoinaream":"hoinări","hoinareati":"hoinări","hoinareau":"hoinări","hoinarei":"hoinară","hoinarele":["hoinarele","hoinar","hoinarele","hoinară"],"hoinareli":"hoinăreală","hoinarelii":"hoinăreală","hoinarelile":"hoinăreală","hoinarelilor":"hoinăreală","hoinarelor":"hoinară","hoinaresc":"hoinări","hoinareste":"hoinări","hoinaresti":"hoinări","hoinari":"hoinar","hoinarii":["hoinarii","hoinar","hoinării","hoinări"],"hoinarilor":"hoinar","hoinarim":"hoinări","hoinarind":"hoinări","hoinarira":"hoinări","hoinariram":"hoinări","hoinarirati":"hoinări","hoinarirea":"hoinărire","hoinariri":"hoinărire","hoinaririi":"hoinărire","hoinaririle":"hoinărire","hoinaririlor":"hoinărire","hoinarise":"hoinări","hoinarisem":"hoinări","hoinarisera":"hoinări","hoinariseram":"hoinări","hoinariserati":"hoinări","hoinarisesi":"hoinări","hoinarisi":"hoinări","hoinarit":"hoinări","hoinariti":"hoinări","hoinarul":"hoinar","hoinarule":"hoinar","hoinarului":"hoinar","hoitari":"hoitar","hoitarii":"hoitar"};
@@ -0,0 +1 @@
+export default {"hoitarilor":"hoitar","hoitarul":"hoitar","hoitarule":"hoitar","hoitarului":"hoitar","hoitul":"hoit","hoitule":"hoit","hoitului":"hoit","hoituri":"hoit","hoiturile":"hoit","hoiturilor":"hoit","hojmalai":"hojmălău","hojmalaii":"hojmălău","hojmalailor":"hojmălău","hojmalauul":"hojmălău","hojmalauule":"hojmălău","hojmalauului":"hojmălău","holbai":"holba","holbam":["holbăm","holba","holbam","holba"],"holband":"holba","holbara":"holba","holbaram":"holba","holbarati":"holba","holbarea":"holbare","holbari":"holbare","holbarii":"holbare","holbarile":"holbare","holbarilor":"holbare","holbase":"holba","holbasem":"holba","holbasera":"holba","holbaseram":"holba","holbaserati":"holba","holbasesi":"holba","holbasi":"holba","holbat":"holba","holbata":["holbată","holbat","holbata","holbat"],"holbate":"holbat","holbatele":"holbat","holbati":["holbați","holba","holbați","holbat"],"holbatii":"holbat","holbatul":"holbat","holbau":"holba","holbeaza":"holba","holbez":"holba","holbezi":"holba","holbi":"holba","holbura":"volbură","holburi":"holbură","holce":"holcă","holcei":"holcă","holdani":"holdan","holdanii":"holdan","holdanilor":"holdan","holdanul":"holdan","holdanule":"holdan","holdanului":"holdan","holde":"holdă","holdei":"holdă","holdele":"holdă","holdelor":"holdă","holdingul":"holding","holdingule":"holding","holdingului":"holding","holdinguri":"holding","holdingurile":"holding","holdingurilor":"holding","holdite":"holdiță","holditei":"holdiță","holditele":"holdiță","holditelor":"holdiță","holdupul":"holdup","holdupule":"holdup","holdupului":"holdup","holdupuri":"holdup","holdupurile":"holdup","holdupurilor":"holdup","holendre":"holendru","holendrele":"holendru","holendrelor":"holendru","holendruul":"holendru","holendruule":"holendru","holendruului":"holendru","holerci":"holercă","holercii":"holercă","holercile":"holercă","holercilor":"holercă","holercute":"holercuță","holercutei":"holercuță","holercutele":"holercuță","holercutelor":"holercuță","holere":"holeră","holerei":"holeră","holerele":"holeră","holerelor":"holeră","holerica":["holerică","holeric","holerica","holeric"],"holerice":["holerice","holeric","holerice","holerică"],"holericei":"holerică","holericele":["holericele","holeric","holericele","holerică"],"holericelor":"holerică","holerici":"holeric","holericii":"holeric","holericul":"holeric","holerine":"holerină","holerinei":"holerină","holerinele":"holerină","holerinelor":"holerină","holismul":"holism","holismule":"holism","holismului":"holism","holmiul":"holmiu","holmiule":"holmiu","holmiului":"holmiu","holmul":"holm","holmule":"holm","holmului":"holm","holmuri":"holm","holmurile":"holm","holmurilor":"holm","holocaustul":"holocaust","holocaustule":"holocaust","holocaustului":"holocaust","holocausturi":"holocaust","holocausturile":"holocaust","holocausturilor":"holocaust","holoceni":"holocen","holocenile":"holocen","holocenilor":"holocen","holocenul":"holocen","holocenule":"holocen","holocenului":"holocen","holocristalina":["holocristalină","holocristalin","holocristalina","holocristalin"],"holocristaline":"holocristalin","holocristalinele":"holocristalin","holocristalini":"holocristalin","holocristalinii":"holocristalin","holocristalinul":"holocristalin","holoedria":"holoedrie","holoedrica":["holoedrică","holoedric","holoedrica","holoedric"],"holoedrice":"holoedric","holoedricele":"holoedric","holoedrici":"holoedric","holoedricii":"holoedric","holoedricul":"holoedric","holoedriei":"holoedrie","holoedrii":"holoedrie","holofrastica":["holofrastică","holofrastic","holofrastica","holofrastic"],"holofrastice":"holofrastic","holofrasticele":"holofrastic","holofrastici":"holofrastic","holofrasticii":"holofrastic","holofrasticul":"holofrastic","hologamia":"hologamie","hologamiei":"hologamie","hologamii":"hologamie","hologamiile":"hologamie","hologamiilor":"hologamie","holografia":"holografie","holografica":["holografică","holografic","holografica","holografic"],"holografice":"holografic","holograficele":"holografic","holografici":"holografic","holograficii":"holografic","holograficul":"holografic","holografiei":"holografie","holografii":"holografie","holografiile":"holografie","holografiilor":"holografie","holograme":"hologramă","hologramei":"hologramă","hologramele":"hologramă","hologramelor":"hologramă","holometabola":["holometabolă","holometabol","holometabola","holometabol"],"holometabole":"holometabol","holometabolele":"holometabol","holometaboli":"holometabol","holometabolii":"holometabol","holometabolul":"holometabol","holomul":"holom","holomule":"holom","holomului":"holom","holomuri":"holom","holomurile":"holom","holomurilor":"holom","holoparazite":"holoparazită","holoparazitei":"holoparazită","holoparazitele":"holoparazită","holoparazitelor":"holoparazită","holoparaziti":"holoparazit","holoparazitii":"holoparazit","holoparazitilor":"holoparazit","holoparazitul":"holoparazit","holoparazitule":"holoparazit","holoparazitului":"holoparazit","holoturia":"holoturie","holoturide":"holoturid","holoturidele":"holoturid","holoturidelor":"holoturid","holoturidul":"holoturid","holoturidule":"holoturid","holoturidului":"holoturid","holoturiei":"holoturie","holoturii":"holoturie","holoturiile":"holoturie","holoturiilor":"holoturie","holteia":"holteie","holteiasca":["holteiască","holteiesc","holteiasca","holteiesc"],"holteiasi":"holteiaș","holteiasii":"holteiaș","holteiasilor":"holteiaș","holteiasul":"holteiaș","holteiasule":"holteiaș","holteiasului":"holteiaș","holteiei":"holteie","holteiescul":"holteiesc","holteiesti":"holteiesc","holteiestii":"holteiesc","holteiestile":"holteiesc","holteii":["holteii","holtei","holteii","holteie"],"holteilor":"holtei","holteiul":"holtei","holteiule":"holtei","holteiului":"holtei","holterasul":"holteraș","holterasule":"holteraș","holterasului":"holteraș","holul":"hol","holule":"hol","holului":"hol","holuri":"hol","holurile":"hol","holurilor":"hol","homari":"homar","homarii":"homar","homarilor":"homar","homarul":"homar","homarule":"homar","homarului":"homar","homelessi":"homeless","homelesslor":"homeless","homelessul":"homeless","homelessule":"homeless","homelessului":"homeless","homeomorfisme":"homeomorfism","homeomorfismele":"homeomorfism","homeomorfismelor":"homeomorfism","homeomorfismul":"homeomorfism","homeomorfismule":"homeomorfism","homeomorfismului":"homeomorfism","homeopate":"homeopată","homeopatei":"homeopată","homeopatele":"homeopată","homeopatelor":"homeopată","homeopati":"homeopat","homeopatia":"homeopatie","homeopatica":["homeopatică","homeopatic","homeopatica","homeopatic"],"homeopatice":"homeopatic","homeopaticele":"homeopatic","homeopatici":"homeopatic","homeopaticii":"homeopatic","homeopaticul":"homeopatic","homeopatiei":"homeopatie","homeopatii":["homeopații","homeopat","homeopatii","homeopatie"],"homeopatiile":"homeopatie","homeopatiilor":"homeopatie","homeopatilor":"homeopat","homeopatul":"homeopat","homeopatule":"homeopat","homeopatului":"homeopat","homeoplazia":"homeoplazie","homeoplaziei":"homeoplazie","homeoplazii":"homeoplazie","homeostate":"homeostat","homeostatele":"homeostat","homeostatelor":"homeostat","homeostatica":["homeostatică","homeostatic","homeostatica","homeostatic"],"homeostatice":"homeostatic","homeostaticele":"homeostatic","homeostatici":"homeostatic","homeostaticii":"homeostatic","homeostaticul":"homeostatic","homeostatul":"homeostat","homeostatule":"homeostat","homeostatului":"homeostat","homeostaze":"homeostază","homeostazei":"homeostază","homeostazele":"homeostază","homeostazelor":"homeostază","homeostazia":"homeostazie","homeostaziei":"homeostazie","homeostazii":"homeostazie","homeostaziile":"homeostazie","homeostaziilor":"homeostazie","homeotermi":"homeoterm","homeotermia":"homeotermie","homeotermiei":"homeotermie","homeotermii":["homeotermii","homeoterm","homeotermii","homeotermie"],"homeotermiile":"homeotermie","homeotermiilor":"homeotermie","homeotermilor":"homeoterm","homeotermul":"homeoterm","homeotermule":"homeoterm","homeotermului":"homeoterm","homerica":["homerică","homeric","homerica","homeric"],"homerice":"homeric","homericele":"homeric","homerici":"homeric","homericii":"homeric","homericul":"homeric","homeridul":"homerid","homeridule":"homerid","homeridului":"homerid","homerisme":"homerism","homerismele":"homerism","homerismelor":"homerism","homerismul":"homerism","homerismule":"homerism","homerismului":"homerism","homerizi":"homerid","homerizii":"homerid","homerizilor":"homerid","homicide":"homicidă","homicidei":"homicidă","homicidele":"homicidă","homicidelor":"homicidă","homicidul":"homicid","homicidule":"homicid","homicidului":"homicid","homicizi":"homicid","homicizii":"homicid","homicizilor":"homicid","hominidul":"hominid","hominidule":"hominid","hominidului":"hominid","hominizarea":"hominizare","hominizari":"hominizare","hominizarii":"hominizare","hominizarile":"hominizare","hominizarilor":"hominizare","hominizi":"hominid","hominizii":"hominid","hominizilor":"hominid","homocentrica":["homocentrică","homocentric","homocentrica","homocentric"],"homocentrice":"homocentric","homocentricele":"homocentric","homocentrici":"homocentric","homocentricii":"homocentric","homocentricul":"homocentric","homocerca":["homocercă","homocerc","homocerca","homocerc"],"homocerce":"homocerc","homocercele":"homocerc","homocerci":"homocerc","homocercii":"homocerc","homocercul":"homocerc","homocromia":"homocromie","homocromiei":"homocromie","homocromii":"homocromie","homocromiile":"homocromie","homocromiilor":"homocromie","homocrona":["homocronă","homocron","homocrona","homocron"],"homocrone":"homocron","homocronele":"homocron","homocroni":"homocron","homocronii":"homocron","homocronul":"homocron","homofobi":"homofob","homofobia":"homofobie","homofobica":["homofobică","homofobic","homofobica","homofobic"],"homofobice":"homofobic","homofobicele":"homofobic","homofobici":"homofobic","homofobicii":"homofobic","homofobicul":"homofobic","homofobiei":"homofobie","homofobii":["homofobii","homofob","homofobii","homofobie"],"homofobilor":"homofob","homofobul":"homofob","homofobule":"homofob","homofobului":"homofob","homogeneze":"homogeneză","homogenezei":"homogeneză","homogenezele":"homogeneză","homogenezelor":"homogeneză","homogrefe":"homogrefă","homogrefei":"homogrefă","homogrefele":"homogrefă","homogrefelor":"homogrefă","homoi":"homo","homolor":"homo","homomorfa":["homomorfă","homomorf","homomorfa","homomorf"],"homomorfe":"homomorf","homomorfele":"homomorf","homomorfi":"homomorf","homomorfia":"homomorfie","homomorfiei":"homomorfie","homomorfii":["homomorfii","homomorf","homomorfii","homomorfie"],"homomorfismul":"homomorfism","homomorfismule":"homomorfism","homomorfismului":"homomorfism","homomorful":"homomorf","homoplastia":"homoplastie","homoplastiei":"homoplastie","homoplastii":"homoplastie","homoplastiile":"homoplastie","homoplastiilor":"homoplastie","homopolimerizarea":"homopolimerizare","homopolimerizari":"homopolimerizare","homopolimerizarii":"homopolimerizare","homopolimerizarile":"homopolimerizare","homopolimerizarilor":"homopolimerizare","homoptere":"homopter","homopterele":"homopter","homopterelor":"homopter","homopterul":"homopter","homopterule":"homopter","homopterului":"homopter","homorodu de jos":"Homorodu de Mijloc","homosexuala":["homosexuală","homosexual","homosexuala","homosexual"],"homosexuale":["homosexuale","homosexual","homosexuale","homosexuală"],"homosexualei":"homosexuală","homosexualele":["homosexualele","homosexual","homosexualele","homosexuală"],"homosexualelor":"homosexuală","homosexuali":"homosexual","homosexualii":"homosexual","homosexualilor":"homosexual","homosexualitatea":"homosexualitate","homosexualitati":"homosexualitate","homosexualitatii":"homosexualitate","homosexualul":"homosexual","homosexualule":"homosexual","homosexualului":"homosexual","homosfere":"homosferă","homosferei":"homosferă","homosferele":"homosferă","homosferelor":"homosferă","homotransplantul":"homotransplant","homotransplantule":"homotransplant","homotransplantului":"homotransplant","homotransplanturi":"homotransplant","homotransplanturile":"homotransplant","homotransplanturilor":"homotransplant","homoul":"homo","homoule":"homo","homoului":"homo","homozigoti":"homozigot","homozigotii":"homozigot","homozigotilor":"homozigot","homozigotul":"homozigot","homozigotule":"homozigot","homozigotului":"homozigot","homunculusi":"homunculus","homunculusii":"homunculus","homunculusilor":"homunculus","homunculusul":"homunculus","homunculusule":"homunculus","homunculusului":"homunculus","hondranea":"hondrăni","hondraneai":"hondrăni","hondraneam":"hondrăni","hondraneati":"hondrăni","hondraneau":"hondrăni","hondranesc":"hondrăni","hondraneste":"hondrăni","hondranesti":"hondrăni","hondranii":"hondrăni","hondranim":"hondrăni","hondranind":"hondrăni","hondranira":"hondrăni","hondraniram":"hondrăni","hondranirati":"hondrăni","hondranise":"hondrăni","hondranisem":"hondrăni","hondranisera":"hondrăni","hondraniseram":"hondrăni","hondraniserati":"hondrăni","hondranisesi":"hondrăni","hondranisi":"hondrăni","hondranit":"hondrăni","hondraniti":"hondrăni","honduriene":"honduriană","hondurienei":"honduriană","hondurienele":"honduriană","hondurienelor":"honduriană","honvedul":"honved","honvedule":"honved","honvedului":"honved","honvezi":"honved","honvezii":"honved","honvezilor":"honved","hopa-miticai":"hopa-mitică","hopa-miticalor":"hopa-mitică","hopa-miticaul":"hopa-mitică","hopa-miticaule":"hopa-mitică","hopa-miticaului":"hopa-mitică","hopaia":"hopăi","hopaiai":"hopăi","hopaiam":"hopăi","hopaiati":"hopăi","hopaiau":"hopăi","hopaie":"hopăi","hopaii":"hopăi","hopaim":"hopăi","hopaind":"hopăi","hopaira":"hopăi","hopairam":"hopăi","hopairati":"hopăi","hopaise":"hopăi","hopaisem":"hopăi","hopaisera":"hopăi","hopaiseram":"hopăi","hopaiserati":"hopăi","hopaisesi":"hopăi","hopaisi":"hopăi","hopait":"hopăi","hopaiti":["hopăiți","hopăi","hopăiți","hopăiță"],"hopaiti e":"hopăiță","hopaiti ei":"hopăiță","hopaiti ele":"hopăiță","hopaiti elor":"hopăiță","hopcalite":"hopcalită","hopcalitei":"hopcalită","hopcalitele":"hopcalită","hopcalitelor":"hopcalită","hopliti":"hoplit","hoplitii":"hoplit","hoplitilor":"hoplit","hoplitul":"hoplit","hoplitule":"hoplit","hoplitului":"hoplit","hoplolatria":"hoplolatrie","hoplolatriei":"hoplolatrie","hoplolatrii":"hoplolatrie","hopurele":"hopurel","hopurelele":"hopurel","hopurelelor":"hopurel","hopurelul":"hopurel","hopurelule":"hopurel","hopurelului":"hopurel","hopuroasa":["hopuroasă","hopuros","hopuroasa","hopuros"],"hopuroase":"hopuros","hopuroasele":"hopuros","hopurosi":"hopuros","hopurosii":"hopuros","hopurosul":"hopuros","horaia":"horăi","horaiai":"horăi","horaiam":"horăi","horaiati":"horăi","horaiau":"horăi","horaie":"horăi","horaii":"horăi","horaim":"horăi","horaind":"horăi","horaira":"horăi","horairam":"horăi","horairati":"horăi","horairea":"horăire","horairi":"horăire","horairii":"horăire","horairile":"horăire","horairilor":"horăire","horaise":"horăi","horaisem":"horăi","horaisera":"horăi","horaiseram":"horăi","horaiserati":"horăi","horaisesi":"horăi","horaisi":"horăi","horait":"horăi","horaite":"horaiță","horaitei":"horaiță","horaitele":"horaiță","horaitelor":"horaiță","horaiti":"horăi","horaitul":"horăit","horaitule":"horăit","horaitului":"horăit","horaituri":"horăitură","horaiturii":"horăitură","horaiturile":"horăitură","horaiturilor":"horăitură","horbode":"horbodă","horbodei":"horbodă","horbodele":"horbodă","horbodelor":"horbodă","horbote":["horbote","horbot","horbote","horbotă"],"horbotei":"horbotă","horbotele":["horbotele","horbot","horbotele","horbotă","horboțele","horboțică"],"horbotelor":["horbotelor","horbot","horbotelor","horbotă"],"horbotice":"horboțică","horboticei":"horboțică","horboticele":"horboțică","horboticelor":"horboțică","horbotul":"horbot","horbotule":"horbot","horbotului":"horbot","horcaia":"horcăi","horcaiai":"horcăi","horcaiam":"horcăi","horcaiati":"horcăi","horcaiau":"horcăi","horcaie":"horcăi","horcaiele":"horcăială","horcaielei":"horcăială","horcaielele":"horcăială","horcaielelor":"horcăială","horcaieli":"horcăială","horcaii":"horcăi","horcaim":"horcăi","horcaind":"horcăi","horcaira":"horcăi","horcairam":"horcăi","horcairati":"horcăi","horcairea":"horcăire","horcairi":"horcăire","horcairii":"horcăire","horcairile":"horcăire","horcairilor":"horcăire","horcaise":"horcăi","horcaisem":"horcăi","horcaisera":"horcăi","horcaiseram":"horcăi","horcaiserati":"horcăi","horcaisesi":"horcăi","horcaisi":"horcăi","horcait":"horcăi","horcaiti":"horcăi","horcaitul":"horcăit","horcaitule":"horcăit","horcaitului":"horcăit","horcaituri":"horcăitură","horcaiturii":"horcăitură","horcaiturile":"horcăitură","horcaiturilor":"horcăitură","horcan":"horcăni","horcane":"horcăni","horcanea":"horcăni","horcaneai":"horcăni","horcaneam":"horcăni","horcaneati":"horcăni","horcaneau":"horcăni","horcanii":"horcăni","horcanim":"horcăni","horcanind":"horcăni","horcanira":"horcăni","horcaniram":"horcăni","horcanirati":"horcăni","horcanise":"horcăni","horcanisem":"horcăni","horcanisera":"horcăni","horcaniseram":"horcăni","horcaniserati":"horcăni","horcanisesi":"horcăni","horcanisi":"horcăni","horcanit":"horcăni","horcaniti":"horcăni","horde":"hordă","hordei":"hordă","hordele":"hordă","hordelor":"hordă","hore":"horă","horea":"hori","horeai":"hori","hoream":"hori","horeati":"hori","horeau":"hori","horei":"horă","horele":"horă","horelor":"horă","horesc":"hori","horeste":"hori","horesti":"hori","horezeana":["horezeană","horezean","horezeana","horezean"],"horezeanul":"horezean","horezeanule":"horezean","horezeanului":"horezean","horezence":"horezeancă","horezencei":"horezeancă","horezencele":"horezeancă","horezencelor":"horezeancă","horezene":"horezean","horezenele":"horezean","horezeni":"horezean","horezenii":"horezean","horezenilor":"horezean","horhaia":"horhăi","horhaiai":"horhăi","horhaiam":"horhăi","horhaiati":"horhăi","horhaiau":"horhăi","horhaie":"horhăi","horhaiele":"horhăială","horhaielei":"horhăială","horhaielele":"horhăială","horhaielelor":"horhăială","horhaieli":"horhăială","horhaii":"horhăi","horhaim":"horhăi","horhaind":"horhăi","horhaira":"horhăi","horhairam":"horhăi","horhairati":"horhăi","horhaise":"horhăi","horhaisem":"horhăi","horhaisera":"horhăi","horhaiseram":"horhăi","horhaiserati":"horhăi","horhaisesi":"horhăi","horhaisi":"horhăi","horhait":"horhăi","horhaiti":"horhăi","horholine":"horholină","horholinei":"horholină","horholinele":"horholină","horholinelor":"horholină","horiceaua":"horicea","horicele":"horicea","horicelei":"horicea","horicelele":"horicea","horicelelor":"horicea","horii":"hori","horilci":"horilcă","horilcii":"horilcă","horilcile":"horilcă","horilcilor":"horilcă","horim":"hori","horinci":"horincă","horincia":"horincie","horinciei":"horincie","horincii":["horincii","horincă","horincii","horincie"],"horincile":"horincă","horincilor":"horincă","horind":"hori","horipilai":"horipila","horipilam":["horipilăm","horipila","horipilam","horipila"],"horipiland":"horipila","horipilara":"horipila","horipilaram":"horipila","horipilarati":"horipila","horipilase":"horipila","horipilasem":"horipila","horipilasera":"horipila","horipilaseram":"horipila","horipilaserati":"horipila","horipilasesi":"horipila","horipilasi":"horipila","horipilat":"horipila","horipilati":"horipila","horipilau":"horipila","horipileaza":"horipila","horipilez":"horipila","horipilezi":"horipila","horira":"hori","horiram":"hori","horirati":"hori","horise":"hori","horisem":"hori","horisera":"hori","horiseram":"hori","horiserati":"hori","horisesi":"hori","horisi":"hori","horisoare":"horișoară","horisoarei":"horișoară","horisoarele":"horișoară","horisoarelor":"horișoară","horit":"hori","horiti":"hori","horitoarea":"horitoare","horitoarei":"horitoare","horitoarele":"horitoare","horitoarelor":"horitoare","horitori":"horitor","horitorii":"horitor","horitorilor":"horitor","horitorul":"horitor","horitorule":"horitor","horitorului":"horitor","hormonala":["hormonală","hormonal","hormonala","hormonal"],"hormonale":"hormonal","hormonalele":"hormonal","hormonali":"hormonal","hormonalii":"hormonal","hormonalul":"hormonal","hormoni":"hormon","hormoni de crestere":"hormon de creștere","hormonii":"hormon","hormonilor":"hormon","hormonogeneze":"hormonogeneză","hormonogenezei":"hormonogeneză","hormonogenezele":"hormonogeneză","hormonogenezelor":"hormonogeneză","hormonologia":"hormonologie","hormonologiei":"hormonologie","hormonologii":"hormonologie","hormonologiile":"hormonologie","hormonologiilor":"hormonologie","hormonopoieze":"hormonopoieză","hormonopoiezei":"hormonopoieză","hormonopoiezele":"hormonopoieză","hormonopoiezelor":"hormonopoieză","hormonoterapia":"hormonoterapie","hormonoterapiei":"hormonoterapie","hormonoterapii":"hormonoterapie","hormonoterapiile":"hormonoterapie","hormonoterapiilor":"hormonoterapie","hormonul":"hormon","hormonule":"hormon","hormonului":"hormon","hornari":"hornar","hornarii":"hornar","hornarilor":"hornar","hornarul":"hornar","hornarule":"hornar","hornarului":"hornar","hornblende":"hornblendă","hornblendei":"hornblendă","hornblendele":"hornblendă","hornblendelor":"hornblendă","hornblenditi":"hornblendit","hornblenditii":"hornblendit","hornblenditilor":"hornblendit","hornblenditul":"hornblendit","hornblenditule":"hornblendit","hornblenditului":"hornblendit","hornete":"horneț","hornetele":"horneț","hornetelor":"horneț","hornetul":"horneț","hornetule":"horneț","hornetului":"horneț","hornuri":"horn","hornutul":"hornuț","hornutule":"hornuț","hornutului":"hornuț","horoati crasnei":"Horoatu Crasnei","horopsea":"horopsi","horopseai":"horopsi","horopseam":"horopsi","horopseati":"horopsi","horopseau":"horopsi","horopsesc":"horopsi","horopseste":"horopsi","horopsesti":"horopsi","horopsii":"horopsi","horopsim":"horopsi","horopsind":"horopsi","horopsira":"horopsi","horopsiram":"horopsi","horopsirati":"horopsi","horopsise":"horopsi","horopsisem":"horopsi","horopsisera":"horopsi","horopsiseram":"horopsi","horopsiserati":"horopsi","horopsisesi":"horopsi","horopsisi":"horopsi","horopsit":"horopsi","horopsita":["horopsită","horopsit","horopsita","horopsit"],"horopsite":"horopsit","horopsitele":"horopsit","horopsiti":["horopsiți","horopsi","horopsiți","horopsit"],"horopsitii":"horopsit","horopsitul":"horopsit","horoptere":"horopter","horopterele":"horopter","horopterelor":"horopter","horopterul":"horopter","horopterule":"horopter","horopterului":"horopter","horoscoape":"horoscop","horoscoapele":"horoscop","horoscoapelor":"horoscop","horoscopul":"horoscop","horoscopule":"horoscop","horoscopului":"horoscop","horrorle":"horror","horrorlor":"horror","horrorul":"horror","horrorule":"horror","horrorului":"horror","horsaful":"horșaf","horsafule":"horșaf","horsafului":"horșaf","horsafuri":"horșaf","horsafurile":"horșaf","horsafurilor":"horșaf","hortativa":["hortativă","hortativ","hortativa","hortativ"],"hortative":"hortativ","hortativele":"hortativ","hortativi":"hortativ","hortativii":"hortativ","hortativul":"hortativ","hortensia":"hortensie","hortensiei":"hortensie","hortensii":"hortensie","hortensiile":"hortensie","hortensiilor":"hortensie","horticola":["horticolă","horticol","horticola","horticol"],"horticole":"horticol","horticolele":"horticol","horticoli":"horticol","horticolii":"horticol","horticolul":"horticol","horticultoarea":"horticultoare","horticultoarei":"horticultoare","horticultoarele":"horticultoare","horticultoarelor":"horticultoare","horticultori":"horticultor","horticultorii":"horticultor","horticultorilor":"horticultor","horticultorul":"horticultor","horticultorule":"horticultor","horticultorului":"horticultor","horticulture":"horticultură","horticulturei":"horticultură","horticulturele":"horticultură","horticulturelor":"horticultură","hortisa":["horțișă","horțiș","horțișa","horțiș"],"hortise":"horțiș","hortisele":"horțiș","hortisi":"horțiș","hortisii":"horțiș","hortisul":"horțiș","hortumul":"hortum","hortumule":"hortum","hortumului":"hortum","hortumuri":"hortum","hortumurile":"hortum","hortumurilor":"hortum","horul":"hor","horule":"hor","horului":"hor","horuri":"hor","horurile":"hor","horurilor":"hor","horvati":"horvat","horvatii":"horvat","horvatilor":"horvat","horvatul":"horvat","horvatule":"horvat","horvatului":"horvat","hosteze":"hoștează","hostezei":"hoștează","hostezele":"hoștează","hostezelor":"hoștează","hostia":"hostie","hostiei":"hostie","hostii":"hostie","hostiile":"hostie","hostiilor":"hostie","hostine":"hoștină","hostinei":"hoștină","hostinele":"hoștină","hostinelor":"hoștină","hot dogi":"hot dog","hotara":"hotărî","hotarai":["hotărai","hotărî","hotărâi","hotărî"],"hotaram":["hotărâm","hotărî","hotăram","hotărî"],"hotarand":"hotărî","hotarara":"hotărî","hotararam":"hotărî","hotararati":"hotărî","hotarari":"hotărâre","hotarasc":"hotărî","hotarase":"hotărî","hotarasem":"hotărî","hotarasera":"hotărî","hotaraseram":"hotărî","hotaraserati":"hotărî","hotarasesi":"hotărî","hotarasi":"hotărî","hotaraste":"hotărî","hotarasti":"hotărî","hotarat":"hotărî","hotarata":["hotărâtă","hotărât","hotărâta","hotărât"],"hotarate":"hotărât","hotaratele":"hotărât","hotarati":["hotărâți","hotărât","hotărâți","hotărî","hotărați","hotărî"],"hotaratii":"hotărât","hotaratoare":"hotărâtor","hotaratoarea":"hotărâtor","hotaratoarele":"hotărâtor","hotaratori":"hotărâtor","hotaratorii":"hotărâtor","hotaratorul":"hotărâtor","hotaratul":"hotărât","hotarau":"hotărî","hotare":"hotar","hotarele":"hotar","hotarelor":"hotar","hotarnica":["hotarnică","hotarnic","hotarnica","hotarnic"],"hotarnice":"hotarnic","hotarnicea":"hotărnici","hotarniceai":"hotărnici","hotarniceam":"hotărnici","hotarniceati":"hotărnici","hotarniceau":"hotărnici","hotarnicele":"hotarnic","hotarnicesc":"hotărnici","hotarniceste":"hotărnici","hotarnicesti":"hotărnici","hotarnici":"hotarnic","hotarnicia":"hotărnicie","hotarniciei":"hotărnicie","hotarnicii":["hotarnicii","hotarnic","hotărnicii","hotărnici","hotărnicii","hotărnicie"],"hotarniciile":"hotărnicie","hotarniciilor":"hotărnicie","hotarnicim":"hotărnici","hotarnicind":"hotărnici","hotarnicira":"hotărnici","hotarniciram":"hotărnici","hotarnicirati":"hotărnici","hotarnicirea":"hotărnicire","hotarniciri":"hotărnicire","hotarnicirii":"hotărnicire","hotarnicirile":"hotărnicire","hotarnicirilor":"hotărnicire","hotarnicise":"hotărnici","hotarnicisem":"hotărnici","hotarnicisera":"hotărnici","hotarniciseram":"hotărnici","hotarniciserati":"hotărnici","hotarnicisesi":"hotărnici","hotarnicisi":"hotărnici","hotarnicit":"hotărnici","hotarniciti":"hotărnici","hotarnicul":"hotarnic","hotarul":"hotar","hotarule":"hotar","hotarului":"hotar","hotdogi":"hotdog","hotdogii":"hotdog","hotdogilor":"hotdog","hotdogul":"hotdog","hotdogule":"hotdog","hotdogului":"hotdog","hote":"hotă","hotea":"hoți","hoteai":"hoți","hoteam":"hoți","hoteasca":["hoțească","hoțesc","hoțeasca","hoțesc"],"hoteati":"hoți","hoteau":"hoți","hotei":"hotă","hotele":["hotele","hotă","hotele","hotel"],"hotelele":"hotel","hotelelor":"hotel","hoteliere":"hotelieră","hotelierei":"hotelieră","hotelierele":"hotelieră","hotelierelor":"hotelieră","hotelieri":"hotelier","hotelierii":"hotelier","hotelierilor":"hotelier","hotelierul":"hotelier","hotelierule":"hotelier","hotelierului":"hotelier","hotelor":"hotă","hotelul":"hotel","hotelule":"hotel","hotelului":"hotel","hoteluri":"hotel","hotentote":"hotentotă","hotentotei":"hotentotă","hotentotele":"hotentotă","hotentotelor":"hotentotă","hotentoti":"hotentot","hotentotii":"hotentot","hotentotilor":"hotentot","hotentotul":"hotentot","hotentotule":"hotentot","hotentotului":"hotentot","hotesc":"hoți","hotescul":"hoțesc","hoteste":"hoți","hotesti":["hoțești","hoțesc","hoțești","hoți"],"hotestii":"hoțesc","hotestile":"hoțesc","hoti":"hoț","hoti de buzunare":"hoț de buzunare","hotia":"hoție","hotiei":"hoție","hotii":["hoții","hoț","hoții","hoți","hoții","hoție"],"hotii la drumul mare":"hoție la drumul mare","hotiile":"hoție","hotiilor":"hoție","hotilor":"hoț","hotim":"hoți","hotimea":"hoțime","hotimi":"hoțime","hotimii":"hoțime","hotind":"hoți","hotira":"hoți","hotiram":"hoți","hotirati":"hoți","hotise":"hoți","hotisem":"hoți","hotisera":"hoți","hotiseram":"hoți","hotiserati":"hoți","hotisesi":"hoți","hotisi":"hoți","hotit":"hoți","hotiti":"hoți","hotitul":"hoțit","hotitule":"hoțit","hotitului":"hoțit","hotnogi":"hotnog","hotnogii":["hotnogii","hotnog","hotnogii","hotnogi"],"hotnogilor":["hotnogilor","hotnog","hotnogilor","hotnogi"],"hotnogiul":"hotnogi","hotnogiule":"hotnogi","hotnogiului":"hotnogi","hotnogul":"hotnog","hotnogule":"hotnog","hotnogului":"hotnog","hotoaice":"hoțoaică","hotoaicei":"hoțoaică","hotoaicele":"hoțoaică","hotoaicelor":"hoțoaică","hotomance":"hoțomancă","hotomancei":"hoțomancă","hotomancele":"hoțomancă","hotomancelor":"hoțomancă","hotomane":"hoțomană","hotomanei":"hoțomană","hotomanele":"hoțomană","hotomanelor":"hoțomană","hotomani":"hoțoman","hotomania":"hoțomănie","hotomaniei":"hoțomănie","hotomanii":["hoțomanii","hoțoman","hoțomănii","hoțomănie"],"hotomaniile":"hoțomănie","hotomaniilor":"hoțomănie","hotomanilor":"hoțoman","hotomanul":"hoțoman","hotomanule":"hoțoman","hotomanului":"hoțoman","hotul":"hoț","hotul neprins este negustor cinstit":"hoțul neprins e negustor cinstit","hotule":"hoț","hotului":"hoț","houseul":"house","houseule":"house","houseului":"house","hovercraftul":"hovercraft","hovercraftule":"hovercraft","hovercraftului":"hovercraft","hovercrafturi":"hovercraft","hovercrafturile":"hovercraft","hovercrafturilor":"hovercraft","hraboria":"hrăborie","hraboriei":"hrăborie","hraborii":"hrăborie","hraconea":"hraconi","hraconeai":"hraconi","hraconeam":"hraconi","hraconeati":"hraconi","hraconeau":"hraconi","hraconesc":"hraconi","hraconeste":"hraconi","hraconesti":"hraconi","hraconii":"hraconi","hraconim":"hraconi","hraconind":"hraconi","hraconira":"hraconi","hraconiram":"hraconi","hraconirati":"hraconi","hraconise":"hraconi","hraconisem":"hraconi","hraconisera":"hraconi","hraconiseram":"hraconi","hraconiserati":"hraconi","hraconisesi":"hraconi","hraconisi":"hraconi","hraconit":"hraconi","hraconiti":"hraconi","hraconitul":"hraconit","hraconitule":"hraconit","hraconitului":"hraconit","hraconituri":"hraconit","hraconiturile":"hraconit","hraconiturilor":"hraconit","hramul":"hram","hramule":"hram","hramului":"hram","hramuri":"hram","hramurile":"hram","hramurilor":"hram","hrane":"hrană","hranea":"hrăni","hraneai":"hrăni","hraneam":"hrăni","hraneati":"hrăni","hraneau":"hrăni","hranei":"hrană","hranele":"hrană","hranelor":"hrană","hranesc":"hrăni","hraneste":"hrăni","hranesti":"hrăni","hranii":"hrăni","hranilnite":"hranilniță","hranilnitei":"hranilniță","hranilnitele":"hranilniță","hranilnitelor":"hranilniță","hranim":"hrăni","hranind":"hrăni","hranira":"hrăni","hraniram":"hrăni","hranirati":"hrăni","hranirea":"hrănire","hraniri":"hrănire","hranirii":"hrănire","hranirile":"hrănire","hranirilor":"hrănire","hranise":"hrăni","hranisem":"hrăni","hranisera":"hrăni","hraniseram":"hrăni","hraniserati":"hrăni","hranisesi":"hrăni","hranisi":"hrăni","hranit":"hrăni","hranita":["hrănită","hrănit","hrănita","hrănit"],"hranite":["hrănite","hrănit","hranițe","hraniță"],"hranitei":"hraniță","hranitele":["hrănitele","hrănit","hranițele","hraniță"],"hranitelor":"hraniță","hraniti":["hrăniți","hrăni","hrăniți","hrănit"],"hranitii":"hrănit","hranitoare":"hrănitor","hranitoarea":"hrănitor","hranitoarele":"hrănitor","hranitori":"hrănitor","hranitorii":"hrănitor","hranitorul":"hrănitor","hranitul":"hrănit","hranute":"hrănuță","hranutei":"hrănuță","hranutele":"hrănuță","hranutelor":"hrănuță","hrapareata":["hrăpăreață","hrăpăreț","hrăpăreața","hrăpăreț"],"hraparete":"hrăpăreț","hraparetele":"hrăpăreț","hrapareti":"hrăpăreț","hraparetia":"hrăpăreție","hraparetiei":"hrăpăreție","hraparetii":["hrăpăreții","hrăpăreț","hrăpăreții","hrăpăreție"],"hraparetiile":"hrăpăreție","hraparetiilor":"hrăpăreție","hraparetul":"hrăpăreț","hrapea":"hrăpi","hrapeai":"hrăpi","hrapeam":"hrăpi","hrapeati":"hrăpi","hrapeau":"hrăpi","hrapesc":"hrăpi","hrapeste":"hrăpi","hrapesti":"hrăpi","hrapii":"hrăpi","hrapim":"hrăpi","hrapind":"hrăpi","hrapira":"hrăpi","hrapiram":"hrăpi","hrapirati":"hrăpi","hrapirea":"hrăpire","hrapiri":"hrăpire","hrapirii":"hrăpire","hrapirile":"hrăpire","hrapirilor":"hrăpire","hrapise":"hrăpi","hrapisem":"hrăpi","hrapisera":"hrăpi","hrapiseram":"hrăpi","hrapiserati":"hrăpi","hrapisesi":"hrăpi","hrapisi":"hrăpi","hrapit":"hrăpi","hrapiti":"hrăpi","hreamate":"hreamăt","hreamatele":"hreamăt","hreamatelor":"hreamăt","hreamatul":"hreamăt","hreamatule":"hreamăt","hreamatului":"hreamăt","hreanite":"hreaniță","hreanitei":"hreaniță","hreanitele":"hreaniță","hreanitelor":"hreaniță","hreanul":"hrean","hreanule":"hrean","hreanului":"hrean","hrenite":"hreniță","hrenitei":"hreniță","hrenitele":"hreniță","hrenitelor":"hreniță","hrentuia":"hrentui","hrentuiai":"hrentui","hrentuiam":"hrentui","hrentuiati":"hrentui","hrentuiau":"hrentui","hrentuiesc":"hrentui","hrentuieste":"hrentui","hrentuiesti":"hrentui","hrentuii":"hrentui","hrentuim":"hrentui","hrentuind":"hrentui","hrentuira":"hrentui","hrentuiram":"hrentui","hrentuirati":"hrentui","hrentuise":"hrentui","hrentuisem":"hrentui","hrentuisera":"hrentui","hrentuiseram":"hrentui","hrentuiserati":"hrentui","hrentuisesi":"hrentui","hrentuisi":"hrentui","hrentuit":"hrentui","hrentuita":["hrentuită","hrentuit","hrentuita","hrentuit"],"hrentuite":"hrentuit","hrentuitele":"hrentuit","hrentuiti":["hrentuiți","hrentui","hrentuiți","hrentuit"],"hrentuitii":"hrentuit","hrentuitul":"hrentuit","hrentuituri":"hrentuitură","hrentuiturii":"hrentuitură","hrentuiturile":"hrentuitură","hrentuiturilor":"hrentuitură","hrepcuia":"hrepcui","hrepcuiai":"hrepcui","hrepcuiam":"hrepcui","hrepcuiati":"hrepcui","hrepcuiau":"hrepcui","hrepcuiesc":"hrepcui","hrepcuieste":"hrepcui","hrepcuiesti":"hrepcui","hrepcuii":"hrepcui","hrepcuim":"hrepcui","hrepcuind":"hrepcui","hrepcuira":"hrepcui","hrepcuiram":"hrepcui","hrepcuirati":"hrepcui","hrepcuise":"hrepcui","hrepcuisem":"hrepcui","hrepcuisera":"hrepcui","hrepcuiseram":"hrepcui","hrepcuiserati":"hrepcui","hrepcuisesi":"hrepcui","hrepcuisi":"hrepcui","hrepcuit":"hrepcui","hrepcuiti":"hrepcui","hribi":"hrib","hribii":"hrib","hribilor":"hrib","hribul":"hrib","hribule":"hrib","hribului":"hrib","hrincute":"hrincuță","hrincutei":"hrincuță","hrincutele":"hrincuță","hrincutelor":"hrincuță","hrinsi":"hrincă","hriscari":"hrișcar","hriscarii":"hrișcar","hriscarilor":"hrișcar","hriscarul":"hrișcar","hriscarule":"hrișcar","hriscarului":"hrișcar","hrismaul":"hrismă","hrismaule":"hrismă","hrismaului":"hrismă","hrismosul":"hrismos","hrismosule":"hrismos","hrismosului":"hrismos","hrismosuri":"hrismos","hrismosurile":"hrismos","hrismosurilor":"hrismos","hrisoave":"hrisov","hrisoavele":"hrisov","hrisoavelor":"hrisov","hrisovul":"hrisov","hrisovule":"hrisov","hrisovului":"hrisov","hristi":"hrișcă","hristiana":["hristiană","hristian","hristiana","hristian"],"hristianitatati":"hristianitate","hristianitatatii":"hristianitate","hristianitatatile":"hristianitate","hristianitatatilor":"hristianitate","hristianitatea":"hristianitate","hristianul":"hristian","hristiene":"hristian","hristienele":"hristian","hristieni":"hristian","hristienii":"hristian","hristii":"hrișcă","hristile":"hrișcă","hristilor":"hrișcă","hristoitia":"hristoitie","hristoitiei":"hristoitie","hristoitii":"hristoitie","hronicari":"hronicar","hronicarii":"hronicar","hronicarilor":"hronicar","hronicarul":"hronicar","hronicarule":"hronicar","hronicarului":"hronicar","hronice":"hronic","hronicele":"hronic","hronicelor":"hronic","hronici":"hronică","hronicii":"hronică","hronicile":"hronică","hronicilor":"hronică","hronicul":"hronic","hronicule":"hronic","hronicului":"hronic","hronografe":"hronograf","hrube":"hrubă","hrubei":"hrubă","hrubele":"hrubă","hrubelor":"hrubă","hrubulite":"hrubuliță","hrubulite e":"hrubuliță","hrubulite ei":"hrubuliță","hrubulite ele":"hrubuliță","hrubulite elor":"hrubuliță","htonianul":"htonian","htonianule":"htonian","htonianului":"htonian","htonica":["htonică","htonic","htonica","htonic"],"htonice":"htonic","htonicele":"htonic","htonici":"htonic","htonicii":"htonic","htonicul":"htonic","htoniene":"htoniană","htonienei":"htoniană","htonienele":"htoniană","htonienelor":"htoniană","htonieni":"htonian","htonienii":"htonian","htonienilor":"htonian","htonismul":"htonism","htonismule":"htonism","htonismului":"htonism","hubloul":"hublou","hubloule":"hublou","hubloului":"hublou","hublouri":"hublou","hublourile":"hublou","hublourilor":"hublou","huceagul":"huceag","huceagule":"huceag","huceagului":"huceag","huceaguri":"huceag","huceagurile":"huceag","huceagurilor":"huceag","huciul":"huci","huciule":"huci","huciului":"huci","huciuri":"huci","huciurile":"huci","huciurilor":"huci","hudicioare":"hudicioară","hudicioarei":"hudicioară","hudicioarele":"hudicioară","hudicioarelor":"hudicioară","hudite":"hudiță","huditei":"hudiță","huditele":"hudiță","huditelor":"hudiță","hudubai":"hudubaie","hudubaiea":"hudubaie","hudubaii":"hudubaie","hudubaile":"hudubaie","hudubailor":"hudubaie","hudubale":"hudubală","hudubalei":"hudubală","hududoaie":"hududoi","hududoaiele":"hududoi","hududoaielor":"hududoi","hududoiul":"hududoi","hududoiule":"hududoi","hududoiului":"hududoi","hudulete":"huduleț","huduletele":"huduleț","huduletelor":"huduleț","huduletul":"huduleț","huduletule":"huduleț","huduletului":"huduleț","hudute":"huduță","hudutei":"huduță","hudutele":"huduță","hudutelor":"huduță","hughenote":"hughenotă","hughenotei":"hughenotă","hughenotele":"hughenotă","hughenotelor":"hughenotă","hughenoti":"hughenot","hughenotii":"hughenot","hughenotilor":"hughenot","hughenotul":"hughenot","hughenotule":"hughenot","hughenotului":"hughenot","hugiumul":"hugium","hugiumule":"hugium","hugiumului":"hugium","hugiumuri":"hugium","hugiumurile":"hugium","hugiumurilor":"hugium","huhur":"huhura","huhurai":"huhura","huhuram":["huhurăm","huhura","huhuram","huhura"],"huhurand":"huhura","huhurara":"huhura","huhuraram":"huhura","huhurarati":"huhura","huhurase":"huhura","huhurasem":"huhura","huhurasera":"huhura","huhuraseram":"huhura","huhuraserati":"huhura","huhurasesi":"huhura","huhurasi":"huhura","huhurat":"huhura","huhurati":"huhura","huhuratul":"huhurat","huhuratule":"huhurat","huhuratului":"huhurat","huhuraturi":"huhurat","huhuraturile":"huhurat","huhuraturilor":"huhurat","huhurau":"huhura","huhurezai":"huhureza","huhurezam":["huhurezăm","huhureza","huhurezam","huhureza"],"huhurezand":"huhureza","huhurezara":"huhureza","huhurezaram":"huhureza","huhurezarati":"huhureza","huhurezase":"huhureza","huhurezasem":"huhureza","huhurezasera":"huhureza","huhurezaseram":"huhureza","huhurezaserati":"huhureza","huhurezasesi":"huhureza","huhurezasi":"huhureza","huhurezat":"huhureza","huhurezati":"huhureza","huhurezau":"huhureza","huhurezeaza":"huhureza","huhurezez":"huhureza","huhurezezi":"huhureza","huhurezi":"huhurez","huhurezi mari":"huhurez mare","huhurezi mici":"huhurez mic","huhurezii":"huhurez","huhurezilor":"huhurez","huhurezul":"huhurez","huhurezule":"huhurez","huhurezului":"huhurez","huhuri":"huhura","huiduia":"huidui","huiduiai":"huidui","huiduiam":"huidui","huiduiati":"huidui","huiduiau":"huidui","huiduieli":"huiduială","huiduielii":"huiduială","huiduielile":"huiduială","huiduielilor":"huiduială","huiduiesc":"huidui","huiduieste":"huidui","huiduiesti":"huidui","huiduii":"huidui","huiduim":"huidui","huiduind":"huidui","huiduira":"huidui","huiduiram":"huidui","huiduirati":"huidui","huiduirea":"huiduire","huiduiri":"huiduire","huiduirii":"huiduire","huiduirile":"huiduire","huiduirilor":"huiduire","huiduise":"huidui","huiduisem":"huidui","huiduisera":"huidui","huiduiseram":"huidui","huiduiserati":"huidui","huiduisesi":"huidui","huiduisi":"huidui","huiduit":"huidui","huiduita":["huiduită","huiduit","huiduita","huiduit"],"huiduite":"huiduit","huiduitele":"huiduit","huiduiti":["huiduiți","huidui","huiduiți","huiduit"],"huiduitii":"huiduit","huiduitul":"huiduit","huiduiture":"huiduitură","huiduiturei":"huiduitură","huiduiturele":"huiduitură","huiduiturelor":"huiduitură","huiduituri":"huiduitură","huidume":"huidumă","huidumei":"huidumă","huidumele":"huidumă","huidumelor":"huidumă","huiete":"huiet","huietele":"huiet","huietelor":"huiet","huietul":"huiet","huietule":"huiet","huietului":"huiet","huile":"huilă","huilei":"huilă","huilele":"huilă","huilelor":"huilă","huime":"huimă","huimei":"huimă","huimele":"huimă","huimelor":"huimă","hule":"hulă","hulea":"huli","huleai":"huli","huleam":"huli","huleati":"huli","huleau":"huli","hulei":"hulă","hulele":"hulă","hulelor":"hulă","hulenia":"hulenie","huleniei":"hulenie","hulenii":"hulenie","huleniile":"hulenie","huleniilor":"hulenie","hulesc":"huli","huleste":"huli","hulesti":"huli","huligani":"huligan","huliganica":["huliganică","huliganic","huliganica","huliganic"],"huliganice":"huliganic","huliganicele":"huliganic","huliganici":"huliganic","huliganicii":"huliganic","huliganicul":"huliganic","huliganii":"huligan","huliganilor":"huligan","huliganisme":"huliganism","huliganismele":"huliganism","huliganismelor":"huliganism","huliganismul":"huliganism","huliganismule":"huliganism","huliganismului":"huliganism","huliganul":"huligan","huliganule":"huligan","huliganului":"huligan","hulii":"huli","hulim":"huli","hulind":"huli","hulira":"huli","huliram":"huli","hulirati":"huli","hulirea":"hulire","huliri":"hulire","hulirii":"hulire","hulirile":"hulire","hulirilor":"hulire","hulise":"huli","hulisem":"huli","hulisera":"huli","huliseram":"huli","huliserati":"huli","hulisesi":"huli","hulisi":"huli","hulit":"huli","hulita":["hulită","hulit","hulita","hulit"],"hulite":"hulit","hulitele":"hulit","huliti":["huliți","huli","huliți","hulit"],"hulitii":"hulit","hulitoarea":"hulitoare","hulitoarei":"hulitoare","hulitoarele":"hulitoare","hulitoarelor":"hulitoare","hulitori":"hulitor","hulitorii":"hulitor","hulitorilor":"hulitor","hulitorul":"hulitor","hulitorule":"hulitor","hulitorului":"hulitor","hulitul":"hulit","hulnica":["hulnică","hulnic","hulnica","hulnic"],"hulnice":"hulnic","hulnicele":"hulnic","hulnici":"hulnic","hulnicii":"hulnic","hulnicul":"hulnic","hulpe":"vulpe","hulpea":"hulpe","hulpi":"hulpe","hulpii":"hulpe","hulpile":"hulpe","hulpilor":"hulpe","hultani":"hultan","hultanii":"hultan","hultanilor":"hultan","hultanul":"hultan","hultanule":"hultan","hultanului":"hultan","hultuia":"hultui","hultuiai":"hultui","hultuiam":"hultui","hultuiati":"hultui","hultuiau":"hultui","hultuiesc":"hultui","hultuieste":"hultui","hultuiesti":"hultui","hultuii":"hultui","hultuim":"hultui","hultuind":"hultui","hultuira":"hultui","hultuiram":"hultui","hultuirati":"hultui","hultuise":"hultui","hultuisem":"hultui","hultuisera":"hultui","hultuiseram":"hultui","hultuiserati":"hultui","hultuisesi":"hultui","hultuisi":"hultui","hultuit":"hultui","hultuita":["hultuită","hultuit","hultuita","hultuit"],"hultuite":"hultuit","hultuitele":"hultuit","hultuiti":["hultuiți","hultui","hultuiți","hultuit"],"hultuitii":"hultuit","hultuitul":"hultuit","hulubaria":"hulubărie","hulubariei":"hulubărie","hulubarii":"hulubărie","hulubariile":"hulubărie","hulubariilor":"hulubărie","hulubasi":"hulubaș","hulubasii":"hulubaș","hulubasilor":"hulubaș","hulubasul":"hulubaș","hulubasule":"hulubaș","hulubasului":"hulubaș","hulubei":"hulubel","hulubeli":"hulubel","hulubelii":"hulubel","hulubelilor":"hulubel","hulubelul":"hulubel","hulubelule":"hulubel","hulubelului":"hulubel","hulubernite":"huluberniță","hulubernitei":"huluberniță","hulubernitele":"huluberniță","hulubernitelor":"huluberniță","hulubi":"hulub","hulubii":"hulub","hulubilor":"hulub","hulubite":"hulubiță","hulubitei":"hulubiță","hulubitele":"hulubiță","hulubitelor":"hulubiță","hulubnice":"hulubnic","hulubnicele":"hulubnic","hulubnicelor":"hulubnic","hulubnicul":"hulubnic","hulubnicule":"hulubnic","hulubnicului":"hulubnic","hulubul":"hulub","hulubule":"hulub","hulubului":"hulub","huluia":"hului","huluiai":"hului","huluiam":"hului","huluiati":"hului","huluiau":"hului","huluiesc":"hului","huluieste":"hului","huluiesti":"hului","huluii":"hului","huluim":"hului","huluind":"hului","huluira":"hului","huluiram":"hului","huluirati":"hului","huluise":"hului","huluisem":"hului","huluisera":"hului","huluiseram":"hului","huluiserati":"hului","huluisesi":"hului","huluisi":"hului","huluit":"hului","huluita":["huluită","huluit","huluita","huluit"],"huluite":"huluit","huluitele":"huluit","huluiti":["huluiți","hului","huluiți","huluit"],"huluitii":"huluit","huluitul":"huluit","humaria":"humărie","humariei":"humărie","humarii":"humărie","humariile":"humărie","humariilor":"humărie","hume":"humă","humei":"humă","humeisme":"humeism","humeismele":"humeism","humeismelor":"humeism","humeismul":"humeism","humeismule":"humeism","humeismului":"humeism","humele":"humă","humelor":"humă","humerala":["humerală","humeral","humerala","humeral"],"humerale":"humeral","humeralele":"humeral","humerali":"humeral","humeralii":"humeral","humeralul":"humeral","humerusul":"humerus","humerusule":"humerus","humerusului":"humerus","humica":["humică","humic","humica","humic"],"humice":"humic","humicele":"humic","humici":"humic","humicii":"humic","humicul":"humic","humificarea":"humificare","humificari":"humificare","humificarii":"humificare","humoare":"humor","humoarele":"humor","humoarelor":"humor","humoasa":["humoasă","humos","humoasa","humos"],"humoase":"humos","humoasele":"humos","humor":"umor","humorala":["humorală","humoral","humorala","humoral"],"humorale":"humoral","humoralele":"humoral","humorali":"humoral","humoralii":"humoral","humoralul":"humoral","humoreana":["humoreană","humorean","humoreana","humorean"],"humoreanul":"humorean","humoreanule":"humorean","humoreanului":"humorean","humorence":"humoreancă","humorencei":"humoreancă","humorencele":"humoreancă","humorencelor":"humoreancă","humorene":"humorean","humorenele":"humorean","humoreni":"humorean","humorenii":"humorean","humorenilor":"humorean","humoresti":"humorescă","humorestii":"humorescă","humori":"humoare","humoriste":"humoristă","humoristei":"humoristă","humoristele":"humoristă","humoristelor":"humoristă","humoristi":"humorist","humoristica":["humoristică","humoristic","humoristica","humoristic"],"humoristice":"humoristic","humoristicele":"humoristic","humoristici":"humoristic","humoristicii":"humoristic","humoristicul":"humoristic","humorul":"humor","humorule":"humor","humorului":"humor","humosi":"humos","humosii":"humos","humosul":"humos","humusul":"humus","humusule":"humus","humusului":"humus","hunedoreanul":"hunedorean","hunedoreanule":"hunedorean","hunedoreanului":"hunedorean","hunedorence":"hunedoreancă","hunedorencei":"hunedoreancă","hunedorencele":"hunedoreancă","hunedorencelor":"hunedoreancă","hunedorene":"hunedoreană","hunedorenei":"hunedoreană","hunedorenele":"hunedoreană","hunedorenelor":"hunedoreană","hunedoreni":"hunedorean","hunedorenii":"hunedorean","hunedorenilor":"hunedorean","huni":"hun","hunia":"hunie","huniei":"hunie","hunii":["hunii","hun","hunii","hunie"],"huniile":"hunie","huniilor":"hunie","hunilor":"hun","hunul":"hun","hunule":"hun","hunului":"hun","hurale":"hural","huralele":"hural","huralelor":"hural","huralul":"hural","huralule":"hural","huralului":"hural","hurcasi":"hurcaș","hurcasii":"hurcaș","hurcasilor":"hurcaș","hurcasul":"hurcaș","hurcasule":"hurcaș","hurcasului":"hurcaș","hurcuiele":"hurcuială","hurcuielei":"hurcuială","hurcuielele":"hurcuială","hurcuielelor":"hurcuială","hurcuieli":"hurcuială","hurcuitoarea":"hurcuitoare","hurcuitori":"hurcuitoare","hurcuitorii":"hurcuitoare","hurcuitorile":"hurcuitoare","hurcuitorilor":"hurcuitoare","hurculasul":"hurculaș","hurculasule":"hurculaș","hurculasului":"hurculaș","hurdlerul":"hurdler","hurdlerule":"hurdler","hurdlerului":"hurdler","hurduc":"hurduca","hurducai":"hurduca","hurducaia":"hurducăi","hurducaiai":"hurducăi","hurducaiam":"hurducăi","hurducaiati":"hurducăi","hurducaiau":"hurducăi","hurducaie":"hurducăi","hurducaiele":"hurducăială","hurducaielei":"hurducăială","hurducaielele":"hurducăială","hurducaielelor":"hurducăială","hurducaieli":"hurducăială","hurducaii":"hurducăi","hurducaim":"hurducăi","hurducaind":"hurducăi","hurducaira":"hurducăi","hurducairam":"hurducăi","hurducairati":"hurducăi","hurducaise":"hurducăi","hurducaisem":"hurducăi","hurducaisera":"hurducăi","hurducaiseram":"hurducăi","hurducaiserati":"hurducăi","hurducaisesi":"hurducăi","hurducaisi":"hurducăi","hurducait":"hurducăi","hurducaiti":"hurducăi","hurducam":["hurducăm","hurduca","hurducam","hurduca"],"hurducand":"hurduca","hurducara":"hurduca","hurducaram":"hurduca","hurducarati":"hurduca","hurducase":"hurduca","hurducasem":"hurduca","hurducasera":"hurduca","hurducaseram":"hurduca","hurducaserati":"hurduca","hurducasesi":"hurduca","hurducasi":"hurduca","hurducat":"hurduca","hurducati":"hurduca","hurducaturi":"hurducătură","hurducaturii":"hurducătură","hurducaturile":"hurducătură","hurducaturilor":"hurducătură","hurducau":"hurduca","hurduci":"hurduca","hurduituri":"hurduitură","hurduiturii":"hurduitură","hurduiturile":"hurduitură","hurduiturilor":"hurduitură","hurduzaie":"hurduzău","hurduzaiele":"hurduzău","hurduzaielor":"hurduzău","hurduzauul":"hurduzău","hurduzauule":"hurduzău","hurduzauului":"hurduzău","hurezi":"hurez","hurezii":"hurez","hurezilor":"hurez","hurezul":"hurez","hurezule":"hurez","hurezului":"hurez","huria":"hurie","huricane":"hurican","huricanele":"hurican","huricanelor":"hurican","huricanul":"hurican","huricanule":"hurican","huricanului":"hurican","huriei":"hurie","hurii":"hurie","huriile":"hurie","huriilor":"hurie","hurmuzi":"hurmuz","hurmuzii":"hurmuz","hurmuzilor":"hurmuz","hurmuzul":"hurmuz","hurmuzule":"hurmuz","hurmuzului":"hurmuz","huroni":"huron","huronii":"huron","huronilor":"huron","huronul":"huron","huronule":"huron","huronului":"huron","hursuza":["hursuză","hursuz","hursuza","hursuz"],"hursuze":"hursuz","hursuzele":"hursuz","hursuzi":"hursuz","hursuzii":"hursuz","hursuzlacul":"hursuzlâc","hursuzlacule":"hursuzlâc","hursuzlacului":"hursuzlâc","hursuzul":"hursuz","hurte":"hurtă","hurtei":"hurtă","hurtele":"hurtă","hurtelor":"hurtă","hurubasi":"hurubaș","hurubasii":"hurubaș","hurubasilor":"hurubaș","hurubasul":"hurubaș","hurubasule":"hurubaș","hurubasului":"hurubaș","hurubistea":"hurubiște","hurubisti":"hurubiște","hurubistii":"hurubiște","hurubistile":"hurubiște","hurubistilor":"hurubiște","huruia":"hurui","huruiai":"hurui","huruiam":"hurui","huruiati":"hurui","huruiau":"hurui","huruie":"hurui","huruieli":"huruială","huruielii":"huruială","huruielile":"huruială","huruielilor":"huruială","huruii":"hurui","huruim":"hurui","huruind":"hurui","huruira":"hurui","huruiram":"hurui","huruirati":"hurui","huruirea":"huruire","huruiri":"huruire","huruirii":"huruire","huruirile":"huruire","huruirilor":"huruire","huruise":"hurui","huruisem":"hurui","huruisera":"hurui","huruiseram":"hurui","huruiserati":"hurui","huruisesi":"hurui","huruisi":"hurui","huruit":"hurui","huruita":["huruită","huruit","huruita","huruit"],"huruite":"huruit","huruitele":"huruit","huruiti":["huruiți","hurui","huruiți","huruit"],"huruitii":"huruit","huruitul":"huruit","huruiture":"huruitură","huruiturei":"huruitură","huruiturele":"huruitură","huruiturelor":"huruitură","huruituri":"huruitură","husarea":"husare","husareasca":["husărească","husăresc","husăreasca","husăresc"],"husarescul":"husăresc","husaresti":"husăresc","husarestii":"husăresc","husarestile":"husăresc","husari":["husari","husar","husări","husare"],"husarii":["husarii","husar","husării","husare"],"husarile":"husare","husarilor":["husarilor","husar","husărilor","husare"],"husarimea":"husărime","husarimi":"husărime","husarimii":"husărime","husarul":"husar","husarule":"husar","husarului":"husar","husasi":"husăș","husasii":"husăș","husasilor":"husăș","husasul":"husăș","husasule":"husăș","husasului":"husăș","huse":"husă","huseana":["hușeană","hușean","hușeana","hușean"],"huseanul":"hușean","huseanule":"hușean","huseanului":"hușean","husence":"hușeancă","husencei":"hușeancă","husencele":"hușeancă","husencelor":"hușeancă","husene":"hușean","husenele":"hușean","huseni":"hușean","husenii":"hușean","husenilor":"hușean","husite":"husită","husitei":"husită","husitele":"husită","husitelor":"husită","husiti":"husit","husitii":"husit","husitilor":"husit","husitisme":"husitism","husitismele":"husitism","husitismelor":"husitism","husitismul":"husitism","husitismule":"husitism","husitismului":"husitism","husitul":"husit","husitule":"husit","husitului":"husit","husky siberieni":"husky siberian","husosi":"husoș","husosii":"husoș","husosilor":"husoș","husosul":["husosul","husos","husoșul","husoș"],"husosule":["husosule","husos","husoșule","husoș"],"husosului":["husosului","husos","husoșului","husoș"],"huste":"huscă","hustei":"huscă","hustele":"huscă","hustelor":"huscă","husti":"huscă","hutanci":"huțancă","hutancii":"huțancă","hutancile":"huțancă","hutancilor":"huțancă","hutane":"huțană","hutanei":"huțană","hutanele":"huțană","hutanelor":"huțană","hutula":["huțulă","huțul","huțula","huțul"],"hutulci":"huțulcă","hutulcii":"huțulcă","hutule":["huțule","huțul","huțule","huțulă"],"hutulei":"huțulă","hutulele":["huțulele","huțul","huțulele","huțulă"],"hutulelor":"huțulă","hutuli":"huțul","hutulii":"huțul","hutulul":"huțul","hutupea":"hutupi","hutupeai":"hutupi","hutupeam":"hutupi","hutupeati":"hutupi","hutupeau":"hutupi","hutupesc":"hutupi","hutupeste":"hutupi","hutupesti":"hutupi","hutupii":"hutupi","hutupim":"hutupi","hutupind":"hutupi","hutupira":"hutupi","hutupiram":"hutupi","hutupirati":"hutupi","hutupise":"hutupi","hutupisem":"hutupi","hutupisera":"hutupi","hutupiseram":"hutupi","hutupiserati":"hutupi","hutupisesi":"hutupi","hutupisi":"hutupi","hutupit":"hutupi","hutupiti":"hutupi","hututuie":"huțuțui","hututuiele":"huțuțui","hututuielor":"huțuțui","hututuiul":"huțuțui","hututuiule":"huțuțui","hututuiului":"huțuțui","hututul":"huțuț","hututule":"huțuț","hututului":"huțuț","hututuri":"huțuț","hututurile":"huțuț","hututurilor":"huțuț","huzmetul":"huzmet","huzmetule":"huzmet","huzmetului":"huzmet","huzmeturi":"huzmet","huzmeturile":"huzmet","huzmeturilor":"huzmet","huzurea":"huzuri","huzureai":"huzuri","huzuream":"huzuri","huzureati":"huzuri","huzureau":"huzuri","huzuresc":"huzuri","huzureste":"huzuri","huzuresti":"huzuri","huzurii":"huzuri","huzurim":"huzuri","huzurind":"huzuri","huzurira":"huzuri","huzuriram":"huzuri","huzurirati":"huzuri","huzurise":"huzuri","huzurisem":"huzuri","huzurisera":"huzuri","huzuriseram":"huzuri","huzuriserati":"huzuri","huzurisesi":"huzuri","huzurisi":"huzuri","huzurit":"huzuri","huzuriti":"huzuri","huzurul":"huzur","huzurule":"huzur","huzurului":"huzur","hybrisul":"hybris","hybrisule":"hybris","hybrisului":"hybris"};
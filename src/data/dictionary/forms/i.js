@@ -0,0 +1 @@
+export default {"i":"vârtejire","ia":"lua","ia caimacul":"lua caimacul","ia de bun":"lua de bun","ia de-a gata":"lua de-a gata","ia in consideratie":"lua în considerație","ia in seama":"lua în seamă","ia la pula":"lua la pulă","ia painea de la gura":"lua pâinea de la gură","ia plasa":"lua plasă","ia viata":"lua viața","iac":"yak","iau":"lua","iau in seama":"lua în seamă","iau la pula":"lua la pulă","iconomie":"economie","iei":"lua","iei in seama":"lua în seamă","iei la pula":"lua la pulă","ieie":"lua","ieroglifa":"hieroglifă","ieroglific":"hieroglific","ii":["îi","ea","îi","ei","îi","el","ii","vârtejire"],"ii bate capul":"bate la cap","il":"el","iliac":"liliac","imbla":"umbla","imi":"eu","imi bag pula":"bag pula","imple":"umple","in all genders":"unor","incurcat-o":"o încurca","infasoara":"fășura","inferica":"fereca","infla":"umfla","inflaciune":"umflăciune","inghiu":"unghi","inrobi":"robi","intopseca":"topseca","intors-o ca la ploiesti":"o întoarce ca la Ploiești","io":"eu","iorgu":"Gheorghe","iperbola":"hiperbolă","isi":["își","ea","își","ei","își","el","își","ele"],"iti":"tu"};
@@ -0,0 +1,271 @@
+/**
+ * Romanian Inflected Form Index
+ * Generated from the dictionary shards by scripts/build_form_index.py
+ * Total forms: 237689
+ * Shards: 117 (largest: 64.0KB)
+ *
+ * Each table maps a folded form (lowercase, no diacritics) to its lemma,
+ * or to a flat [form, lemma, ...] list when the form is ambiguous. Forms
+ * that are frequent in the corpus are also in the bundled hot shard.
+ */
+
+import HOT from '../hot.js';
+import { foldKey } from '../index.js';
+
+const INDEX = {
+  "#": [
+    {"shard": "other", "from": "-", "to": "я", "count": 1200, "size": 43368},
+  ],
+  "a": [
+    {"shard": "a", "from": "a -a", "to": "a lua la pula", "count": 2112, "size": 65503},
+    {"shard": "a-lua-la-pula", "from": "a lua la pula [conj]", "to": "a taxa", "count": 1984, "size": 65513},
+    {"shard": "a-taxa", "from": "a taxa 1st conjugation", "to": "arpagon", "count": 1205, "size": 41806},
+  ],
+  "b": [
+    {"shard": "b", "from": "bababai", "to": "balneologicul", "count": 2385, "size": 65518},
+    {"shard": "balneologie", "from": "balneologiei", "to": "basnitorul", "count": 2434, "size": 65522},
+    {"shard": "basnitorule", "from": "basnitorule", "to": "beregatesti", "count": 2389, "size": 65531},
+    {"shard": "beregati", "from": "beregatii", "to": "biochimia", "count": 2400, "size": 65502},
+    {"shard": "biochimic", "from": "biochimica", "to": "bleascul", "count": 2250, "size": 65530},
+    {"shard": "bleascule", "from": "bleascule", "to": "bonificarii", "count": 2581, "size": 65525},
+    {"shard": "bonificaril", "from": "bonificarile", "to": "bricegele", "count": 2524, "size": 65527},
+    {"shard": "bricegelel", "from": "bricegelele", "to": "bulevardule", "count": 2606, "size": 65523},
+    {"shard": "bulevardulu", "from": "bulevardului", "to": "bytilor", "count": 2000, "size": 52174},
+  ],
+  "c": [
+    {"shard": "c", "from": "calbeaza", "to": "cristos", "count": 4, "size": 110},
+  ],
+  "d": [
+    {"shard": "d", "from": "dana", "to": "dzarna", "count": 9, "size": 171},
+  ],
+  "e": [
+    {"shard": "e", "from": "e", "to": "egalizau", "count": 2342, "size": 65521},
+    {"shard": "egalize", "from": "egalizeaza", "to": "eligibilul", "count": 1962, "size": 65530},
+    {"shard": "elim", "from": "elimin", "to": "endotermul", "count": 2262, "size": 65528},
+    {"shard": "endoto", "from": "endotoxine", "to": "epuratiunile", "count": 2296, "size": 65513},
+    {"shard": "epuratiunilo", "from": "epuratiunilor", "to": "esofagotomiei", "count": 2262, "size": 65531},
+    {"shard": "esofagotomii", "from": "esofagotomii", "to": "eutocice", "count": 2353, "size": 65530},
+    {"shard": "eutocicel", "from": "eutocicele", "to": "exfoliatiei", "count": 2297, "size": 65532},
+    {"shard": "exfoliatii", "from": "exfoliatii", "to": "exterminatiunii", "count": 2229, "size": 65506},
+    {"shard": "exterminatiunil", "from": "exterminatiunile", "to": "ezredurilor", "count": 821, "size": 25816},
+  ],
+  "f": [
+    {"shard": "f", "from": "f", "to": "farandolele", "count": 2196, "size": 65513},
+    {"shard": "farandolelo", "from": "farandolelor", "to": "feminizaserati", "count": 2301, "size": 65513},
+    {"shard": "feminizases", "from": "feminizasesi", "to": "filarmonicilor", "count": 2357, "size": 65513},
+    {"shard": "filarmonicu", "from": "filarmonicul", "to": "flasnete", "count": 2333, "size": 65529},
+    {"shard": "flasnetei", "from": "flasnetei", "to": "forcipresuri", "count": 2418, "size": 65523},
+    {"shard": "forcipresurii", "from": "forcipresurii", "to": "framantatorului", "count": 2184, "size": 65515},
+    {"shard": "framantatu", "from": "framantatul", "to": "fugaritul", "count": 2354, "size": 65532},
+    {"shard": "fugarn", "from": "fugarnica", "to": "fuziuni nucleare", "count": 1876, "size": 49563},
+  ],
+  "g": [
+    {"shard": "g", "from": "gaba", "to": "gargarismului", "count": 2425, "size": 65518},
+    {"shard": "gargarit", "from": "gargarite", "to": "geograficul", "count": 2367, "size": 65522},
+    {"shard": "geografie", "from": "geografiei", "to": "gimnosporului", "count": 2472, "size": 65517},
+    {"shard": "gimnot", "from": "gimnoti", "to": "gonituri", "count": 2533, "size": 65513},
+    {"shard": "goniturii", "from": "goniturii", "to": "grilajule", "count": 2377, "size": 65534},
+    {"shard": "grilajulu", "from": "grilajului", "to": "gvardiilor", "count": 1850, "size": 47429},
+  ],
+  "h": [
+    {"shard": "h", "from": "habacii", "to": "harstim", "count": 2536, "size": 65517},
+    {"shard": "harstin", "from": "harstind", "to": "hermeneuticele", "count": 2270, "size": 65460},
+    {"shard": "hermeneutici", "from": "hermeneutici", "to": "hiperalgeziei", "count": 2112, "size": 65535},
+    {"shard": "hiperalgezii", "from": "hiperalgezii", "to": "hoitarii", "count": 2171, "size": 65529},
+    {"shard": "hoitaril", "from": "hoitarilor", "to": "hybrisului", "count": 2242, "size": 55845},
+  ],
+  "i": [
+    {"shard": "i", "from": "i", "to": "iti", "count": 45, "size": 1134},
+  ],
+  "j": [
+    {"shard": "j", "from": "jabirul", "to": "jumarilor", "count": 2737, "size": 65526},
+    {"shard": "jumat", "from": "jumatatea", "to": "jvarturilor", "count": 831, "size": 22194},
+  ],
+  "k": [
+    {"shard": "k", "from": "kabile", "to": "kyatului", "count": 597, "size": 15794},
+  ],
+  "l": [
+    {"shard": "l", "from": "la multi ani !", "to": "lantagul", "count": 2385, "size": 65526},
+    {"shard": "lantagule", "from": "lantagule", "to": "legatoarea", "count": 2491, "size": 65519},
+    {"shard": "legatoarei", "from": "legatoarei", "to": "leziuni", "count": 2369, "size": 65513},
+    {"shard": "lezm", "from": "lezmaiestatea", "to": "linoleumului", "count": 2379, "size": 65519},
+    {"shard": "linoleumur", "from": "linoleumuri", "to": "lotcasule", "count": 2494, "size": 65529},
+    {"shard": "lotcasulu", "from": "lotcasului", "to": "lui giurgescu", "count": 2467, "size": 65510},
+    {"shard": "lui-giurgi", "from": "lui giurgica", "to": "lui zelter", "count": 2409, "size": 65528},
+    {"shard": "lui-zer", "from": "lui zeru", "to": "luzilor", "count": 1178, "size": 30646},
+  ],
+  "m": [
+    {"shard": "m", "from": "ma", "to": "modifice", "count": 9, "size": 140},
+  ],
+  "n": [
+    {"shard": "n", "from": "n-ai pentru ce", "to": "national-socialistei", "count": 2372, "size": 65436},
+    {"shard": "national-socialistel", "from": "national-socialistele", "to": "neconsolabili", "count": 2111, "size": 65516},
+    {"shard": "neconsolabilii", "from": "neconsolabilii", "to": "negutatoresti", "count": 2105, "size": 65532},
+    {"shard": "negutatori", "from": "negutatori", "to": "neomalthusianiste", "count": 2058, "size": 65511},
+    {"shard": "neomalthusianistei", "from": "neomalthusianistei", "to": "neuitabilii", "count": 2049, "size": 65531},
+    {"shard": "neuitabilu", "from": "neuitabilul", "to": "nomazi", "count": 2341, "size": 65519},
+    {"shard": "nomazii", "from": "nomazii", "to": "nu fute", "count": 2510, "size": 65528},
+    {"shard": "nu-futet", "from": "nu futeti", "to": "nu tacaniti", "count": 2602, "size": 65535},
+    {"shard": "nu-tace", "from": "nu tacea", "to": "nuzii", "count": 2162, "size": 54408},
+  ],
+  "o": [
+    {"shard": "o", "from": "o", "to": "ochelaristei", "count": 2419, "size": 65528},
+    {"shard": "ochelaristel", "from": "ochelaristele", "to": "ogamurilor", "count": 2620, "size": 65535},
+    {"shard": "ogar", "from": "ogaratica", "to": "opacifiasera", "count": 2569, "size": 65510},
+    {"shard": "opacifiaseram", "from": "opacifiaseram", "to": "orientatiuni", "count": 2412, "size": 65529},
+    {"shard": "orientatiunii", "from": "orientatiunii", "to": "otarim", "count": 2412, "size": 65515},
+    {"shard": "otarime", "from": "otarimea", "to": "ozonului", "count": 1348, "size": 35720},
+  ],
+  "p": [
+    {"shard": "p", "from": "patit-o", "to": "prostilor", "count": 5, "size": 121},
+  ],
+  "q": [
+    {"shard": "q", "from": "qatariene", "to": "quruchului", "count": 82, "size": 2010},
+  ],
+  "r": [
+    {"shard": "r", "from": "rabalasul", "to": "radourile", "count": 2121, "size": 65525},
+    {"shard": "radourilo", "from": "radourilor", "to": "raschirasera", "count": 2450, "size": 65528},
+    {"shard": "raschiraseram", "from": "raschiraseram", "to": "razatorii", "count": 2308, "size": 65501},
+    {"shard": "razatoru", "from": "razatorul", "to": "rebandajaserati", "count": 2322, "size": 65522},
+    {"shard": "rebandajases", "from": "rebandajasesi", "to": "recriminaram", "count": 2157, "size": 65532},
+    {"shard": "recriminarat", "from": "recriminarati", "to": "refruntati", "count": 2275, "size": 65513},
+    {"shard": "refruntau", "from": "refruntau", "to": "reintampinasem", "count": 2102, "size": 65533},
+    {"shard": "reintampinaser", "from": "reintampinasera", "to": "reorganizasi", "count": 2296, "size": 65511},
+    {"shard": "reorganizat", "from": "reorganizat", "to": "restantei", "count": 2249, "size": 65523},
+    {"shard": "restantel", "from": "restantele", "to": "revolutionarei", "count": 2302, "size": 65507},
+    {"shard": "revolutionarel", "from": "revolutionarele", "to": "rododafinule", "count": 2506, "size": 65521},
+    {"shard": "rododafinulu", "from": "rododafinului", "to": "rumpeam", "count": 2434, "size": 65524},
+    {"shard": "rumpeat", "from": "rumpeati", "to": "rutisorului", "count": 537, "size": 14146},
+  ],
+  "s": [
+    {"shard": "s", "from": "s", "to": "sa finantati", "count": 2565, "size": 65533},
+    {"shard": "sa-finante", "from": "sa finantez", "to": "sa napadesc", "count": 2645, "size": 65513},
+    {"shard": "sa-napadest", "from": "sa napadesti", "to": "sa reconsolidez", "count": 2514, "size": 65524},
+    {"shard": "sa-reconsolideze", "from": "sa reconsolideze", "to": "sa tiranizam", "count": 2469, "size": 65525},
+    {"shard": "sa-tiranizat", "from": "sa tiranizati", "to": "svanta", "count": 2391, "size": 59044},
+  ],
+  "t": [
+    {"shard": "t", "from": "ta", "to": "tampitii", "count": 2379, "size": 65528},
+    {"shard": "tampitil", "from": "tampitilor", "to": "tartorule", "count": 2309, "size": 65535},
+    {"shard": "tartorulu", "from": "tartorului", "to": "telestereografe", "count": 2271, "size": 65504},
+    {"shard": "telestereografel", "from": "telestereografele", "to": "termorezistentele", "count": 2260, "size": 65525},
+    {"shard": "termorezistentelo", "from": "termorezistentelor", "to": "tinalisera", "count": 2368, "size": 65534},
+    {"shard": "tinaliseram", "from": "tinaliseram", "to": "topenii", "count": 2608, "size": 65530},
+    {"shard": "topeniil", "from": "topeniile", "to": "transductivii", "count": 2273, "size": 65514},
+    {"shard": "transductivu", "from": "transductivul", "to": "trebuinte", "count": 2029, "size": 65519},
+    {"shard": "trebuintei", "from": "trebuintei", "to": "tritonului", "count": 2389, "size": 65529},
+    {"shard": "tritu", "from": "triturai", "to": "turbocompresorule", "count": 2527, "size": 65509},
+    {"shard": "turbocompresorulu", "from": "turbocompresorului", "to": "twisturilor", "count": 1204, "size": 30923},
+  ],
+  "u": [
+    {"shard": "u", "from": "ubertatea", "to": "unguroance", "count": 2530, "size": 65526},
+    {"shard": "unguroancei", "from": "unguroancei", "to": "uscatorii", "count": 2465, "size": 65510},
+    {"shard": "uscatoriil", "from": "uscatoriile", "to": "uzurpi", "count": 753, "size": 18280},
+  ],
+  "v": [
+    {"shard": "v", "from": "va", "to": "varfuletelor", "count": 2399, "size": 65521},
+    {"shard": "varfuletu", "from": "varfuletul", "to": "verbalitatii", "count": 2373, "size": 65519},
+    {"shard": "verbaliz", "from": "verbalizai", "to": "viersuia", "count": 2264, "size": 65532},
+    {"shard": "viersuiai", "from": "viersuiai", "to": "vivificatoarele", "count": 2402, "size": 65531},
+    {"shard": "vivificator", "from": "vivificatori", "to": "vulgari", "count": 2471, "size": 65482},
+    {"shard": "vulgaric", "from": "vulgariceasca", "to": "vzt", "count": 322, "size": 8549},
+  ],
+  "w": [
+    {"shard": "w", "from": "wagneriana", "to": "wurtzitului", "count": 166, "size": 4349},
+  ],
+  "x": [
+    {"shard": "x", "from": "xantelasme", "to": "xulescu", "count": 641, "size": 17673},
+  ],
+  "y": [
+    {"shard": "y", "from": "yaci", "to": "yuanului", "count": 93, "size": 2020},
+  ],
+  "z": [
+    {"shard": "z", "from": "zaanale", "to": "zburlitele", "count": 2470, "size": 65489},
+    {"shard": "zburliti", "from": "zburliti", "to": "zmacinati", "count": 2563, "size": 65530},
+    {"shard": "zmacinatii", "from": "zmacinatii", "to": "zvoracurilor", "count": 1668, "size": 41142},
+  ],
+};
+
+const TABLE_LOADERS = import.meta.glob(['./*.js', '!./index.js']);
+
+const loadedTables = {};
+
+function bucketOf(key) {
+  const first = key.charAt(0);
+  return first >= 'a' && first <= 'z' ? first : '#';
+}
+
+/**
+ * Find the table whose key range holds a folded form (null if none can)
+ */
+export function findFormShard(key) {
+  const shards = INDEX[bucketOf(key)];
+  if (!shards) return null;
+
+  let lo = 0;
+  let hi = shards.length - 1;
+  let found = null;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (shards[mid].from <= key) {
+      found = shards[mid];
+      lo = mid + 1;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return found && key <= found.to ? found.shard : null;
+}
+
+async function loadTable(shard) {
+  if (loadedTables[shard]) {
+    return loadedTables[shard];
+  }
+
+  const loader = TABLE_LOADERS[`./${shard}.js`];
+  if (!loader) {
+    return {};
+  }
+
+  try {
+    const module = await loader();
+    loadedTables[shard] = module.default;
+    return loadedTables[shard];
+  } catch (err) {
+    console.error(`Failed to load form table "${shard}"`, err);
+    return {};
+  }
+}
+
+/**
+ * Lemmas an inflected word belongs to, exact spellings first
+ * (e.g. "fețelor" → ["față", "fată"], "fetelor" → ["fată", "față"])
+ */
+export async function lookupLemmas(word) {
+  if (!word || word.trim().length === 0) return [];
+
+  const surface = word.trim().toLowerCase();
+  const key = foldKey(surface);
+
+  let table = HOT.forms;
+  if (!Object.prototype.hasOwnProperty.call(table, key)) {
+    const shard = findFormShard(key);
+    if (!shard) return [];
+    table = await loadTable(shard);
+  }
+  if (!Object.prototype.hasOwnProperty.call(table, key)) return [];
+  const pairs = table[key];
+  if (typeof pairs === 'string') return [pairs];
+
+  const exact = [];
+  const folded = [];
+  for (let i = 0; i < pairs.length; i += 2) {
+    (pairs[i] === surface ? exact : folded).push(pairs[i + 1]);
+  }
+  return [...new Set([...exact, ...folded])];
+}
+
+export default {
+  lookupLemmas,
+  findFormShard,
+};
@@ -0,0 +1 @@
+export default {"jabirul":"jabiru","jabirule":"jabiru","jabirului":"jabiru","jabiruri":"jabiru","jabirurile":"jabiru","jabirurilor":"jabiru","jabotiere":"jabotieră","jabotierei":"jabotieră","jabotierele":"jabotieră","jabotierelor":"jabotieră","jaboul":"jabou","jaboule":"jabou","jaboului":"jabou","jabouri":"jabou","jabourile":"jabou","jabourilor":"jabou","jabracia":"jăbrăcie","jabraciei":"jăbrăcie","jabracii":"jăbrăcie","jabraciile":"jăbrăcie","jabraciilor":"jăbrăcie","jabre":"jabră","jacarandai":"jacaranda","jacarandalor":"jacaranda","jacarandaul":"jacaranda","jacarandaule":"jacaranda","jacarandaului":"jacaranda","jacarde":"jacard","jacardele":"jacard","jacardelor":"jacard","jacardul":"jacard","jacardule":"jacard","jacardului":"jacard","jacasi":"jăcaș","jacasii":"jăcaș","jacasilor":"jăcaș","jacasul":"jăcaș","jacasule":"jăcaș","jacasului":"jăcaș","jachete":"jachetă","jachetei":"jachetă","jachetele":["jachetele","jachetă","jachețele","jachețică"],"jachetelor":"jachetă","jachetice":"jachețică","jacheticei":"jachețică","jacheticele":"jachețică","jacheticelor":"jachețică","jachetute":"jachetuță","jachetutei":"jachetuță","jachetutele":"jachetuță","jachetutelor":"jachetuță","jaci":"jacă","jacii":"jacă","jacile":"jacă","jacilor":"jacă","jackpotul":"jackpot","jackpotule":"jackpot","jackpotului":"jackpot","jackpoturi":"jackpot","jackpoturile":"jackpot","jackpoturilor":"jackpot","jackuri":"jack","jacmanea":"jăcmăni","jacmaneai":"jăcmăni","jacmaneam":"jăcmăni","jacmaneati":"jăcmăni","jacmaneau":"jăcmăni","jacmaneli":"jăcmăneală","jacmanelii":"jăcmăneală","jacmanelile":"jăcmăneală","jacmanelilor":"jăcmăneală","jacmanesc":"jăcmăni","jacmaneste":"jăcmăni","jacmanesti":"jăcmăni","jacmanii":"jăcmăni","jacmanim":"jăcmăni","jacmanind":"jăcmăni","jacmanira":"jăcmăni","jacmaniram":"jăcmăni","jacmanirati":"jăcmăni","jacmanise":"jăcmăni","jacmanisem":"jăcmăni","jacmanisera":"jăcmăni","jacmaniseram":"jăcmăni","jacmaniserati":"jăcmăni","jacmanisesi":"jăcmăni","jacmanisi":"jăcmăni","jacmanit":"jăcmăni","jacmaniti":"jăcmăni","jacmanul":"jăcman","jacmanule":"jăcman","jacmanului":"jăcman","jacmanuri":"jăcman","jacmanurile":"jăcman","jacmanurilor":"jăcman","jacmare":"jacmar","jacmarele":"jacmar","jacmarelor":"jacmar","jacmarul":"jacmar","jacmarule":"jacmar","jacmarului":"jacmar","jacobini":"jacobin","jacobinii":"jacobin","jacobinilor":"jacobin","jacobinul":"jacobin","jacobinule":"jacobin","jacobinului":"jacobin","jacqueria":"jacquerie","jacqueriei":"jacquerie","jacquerii":"jacquerie","jacuia":"jăcui","jacuiai":"jăcui","jacuiam":"jăcui","jacuiati":"jăcui","jacuiau":"jăcui","jacuiesc":"jăcui","jacuieste":"jăcui","jacuiesti":"jăcui","jacuii":"jăcui","jacuim":"jăcui","jacuind":"jăcui","jacuira":"jăcui","jacuiram":"jăcui","jacuirati":"jăcui","jacuirea":"jăcuire","jacuiri":"jăcuire","jacuirii":"jăcuire","jacuirile":"jăcuire","jacuirilor":"jăcuire","jacuise":"jăcui","jacuisem":"jăcui","jacuisera":"jăcui","jacuiseram":"jăcui","jacuiserati":"jăcui","jacuisesi":"jăcui","jacuisi":"jăcui","jacuit":"jăcui","jacuiti":"jăcui","jacuitori":"jăcuitor","jacuitorii":"jăcuitor","jacuitorilor":"jăcuitor","jacuitorul":"jăcuitor","jacuitorule":"jăcuitor","jacuitorului":"jăcuitor","jacuri":"jac","jacuzziul":"jacuzzi","jacuzziule":"jacuzzi","jacuzziului":"jacuzzi","jadeite":"jadeit","jadeitele":"jadeit","jadeitelor":"jadeit","jadeitul":"jadeit","jadeitule":"jadeit","jadeitului":"jadeit","jadul":"jad","jadule":"jad","jadului":"jad","jaduri":"jad","jadurile":"jad","jadurilor":"jad","jaeteti":"jăete","jaetetii":"jăete","jaetetilor":"jăete","jaeteul":"jăete","jaeteule":"jăete","jaeteului":"jăete","jafuirea":"jăfuire","jafuiri":"jăfuire","jafuirii":"jăfuire","jafuirile":"jăfuire","jafuirilor":"jăfuire","jaful":"jaf","jafule":"jaf","jafului":"jaf","jafuri":"jaf","jafurile":"jaf","jafurilor":"jaf","jagardeaua":"jagardea","jagardele":"jagardea","jagardelei":"jagardea","jagardelele":"jagardea","jagardelelor":"jagardea","jaghete":"jaghetă","jaghetei":"jaghetă","jaghetele":"jaghetă","jaghetelor":"jaghetă","jaguari":"jaguar","jaguarii":"jaguar","jaguarilor":"jaguar","jaguarul":"jaguar","jaguarule":"jaguar","jaguarului":"jaguar","jaguarundii":"jaguarundi","jaguarundilor":"jaguarundi","jaguarundiul":"jaguarundi","jaguarundiule":"jaguarundi","jaguarundiului":"jaguarundi","jainisme":"jainism","jainismele":"jainism","jainismelor":"jainism","jainismul":"jainism","jainismule":"jainism","jainismului":"jainism","jainiste":"jainistă","jainistei":"jainistă","jainistele":"jainistă","jainistelor":"jainistă","jainisti":"jainist","jainistii":"jainist","jainistilor":"jainist","jainistul":"jainist","jainistule":"jainist","jainistului":"jainist","jaisul":"jais","jaisule":"jais","jaisului":"jais","jalania":"jălanie","jalaniei":"jălanie","jalanii":"jălanie","jalaniile":"jălanie","jalaniilor":"jălanie","jalbe":"jalbă","jalbei":"jalbă","jalbele":"jalbă","jalbelor":"jalbă","jalea":"jale","jalei":"jale","jaleole":"jaleo","jaleolor":"jaleo","jaleoul":"jaleo","jaleoule":"jaleo","jaleoului":"jaleo","jalete":"jalet","jaletele":"jalet","jaletelor":"jalet","jaletul":"jalet","jaletule":"jalet","jaletului":"jalet","jalirea":"jălire","jaliri":"jălire","jalirii":"jălire","jalirile":"jălire","jalirilor":"jălire","jalnica":["jalnică","jalnic","jalnica","jalnic"],"jalnice":"jalnic","jalnicele":"jalnic","jalnici":"jalnic","jalnicii":"jalnic","jalnicul":"jalnic","jaloane":"jalon","jaloanele":"jalon","jaloanelor":"jalon","jalobe":"jalobă","jalobei":"jalobă","jalobele":"jalobă","jalobelor":"jalobă","jalonai":"jalona","jalonam":["jalonăm","jalona","jalonam","jalona"],"jalonand":"jalona","jalonara":"jalona","jalonaram":"jalona","jalonarati":"jalona","jalonase":"jalona","jalonasem":"jalona","jalonasera":"jalona","jalonaseram":"jalona","jalonaserati":"jalona","jalonasesi":"jalona","jalonasi":"jalona","jalonat":"jalona","jalonati":"jalona","jalonau":"jalona","jaloneaza":"jalona","jalonez":"jalona","jalonezi":"jalona","jalonul":"jalon","jalonule":"jalon","jalonului":"jalon","jalostea":"jaloste","jalosti":"jaloste","jalostii":"jaloste","jalostile":"jaloste","jalostilor":"jaloste","jalovania":"jalovanie","jalovaniei":"jalovanie","jalovanii":"jalovanie","jalovaniile":"jalovanie","jalovaniilor":"jalovanie","jaltuiase":"jălțuiaș","jaltuiasele":"jălțuiaș","jaltuiaselor":"jălțuiaș","jaltuiasul":"jălțuiaș","jaltuiasule":"jălțuiaș","jaltuiasului":"jălțuiaș","jaltul":"jâlț","jaltule":"jâlț","jaltului":"jâlț","jalturi":"jâlț","jalturile":"jâlț","jalturilor":"jâlț","jaluirea":"jăluire","jaluiri":"jăluire","jaluirii":"jăluire","jaluirile":"jăluire","jaluirilor":"jăluire","jaluitoare":"jăluitor","jaluitoarea":"jăluitor","jaluitoarele":"jăluitor","jaluitori":"jăluitor","jaluitorii":"jăluitor","jaluitorul":"jăluitor","jaluzeaua":"jaluzea","jaluzele":"jaluzea","jaluzelei":"jaluzea","jaluzelele":"jaluzea","jaluzelelor":"jaluzea","jaluzia":"jaluzie","jaluziei":"jaluzie","jaluzii":"jaluzie","jaluziile":"jaluzie","jaluziilor":"jaluzie","jamaicana":["jamaicană","jamaican","jamaicana","jamaican"],"jamaicane":["jamaicane","jamaican","jamaicane","jamaicană"],"jamaicanei":"jamaicană","jamaicanele":["jamaicanele","jamaican","jamaicanele","jamaicană"],"jamaicanelor":"jamaicană","jamaicani":"jamaican","jamaicanii":"jamaican","jamaicanul":"jamaican","jamaice":"jamaică","jamaicei":"jamaică","jamaicele":"jamaică","jamaicelor":"jamaică","jambiere":"jambieră","jambierei":"jambieră","jambierele":"jambieră","jambierelor":"jambieră","jamblacasul":"jâmblăcaș","jamblacasule":"jâmblăcaș","jamblacasului":"jâmblăcaș","jamblacasuri":"jâmblăcaș","jamblacasurile":"jâmblăcaș","jamblacasurilor":"jâmblăcaș","jamboane":"jambon","jamboanele":"jambon","jamboanelor":"jambon","jambonul":"jambon","jambonule":"jambon","jambonului":"jambon","jamboreea":"jamboree","jamboreei":"jamboree","jamboreele":"jamboree","jamboreelor":"jamboree","jamne":"jamnă","jamnei":"jamnă","jamnele":"jamnă","jamnelor":"jamnă","jancul":"janc","jancule":"janc","jancului":"janc","jancuri":"janc","jancurile":"janc","jancurilor":"janc","jandar":"jandarm","jandari":["jăndari","jandar","jăndari","jăndar"],"jandarii":["jăndarii","jandar","jăndarii","jăndar"],"jandarilor":["jăndarilor","jandar","jăndarilor","jăndar"],"jandarmereasca":["jandarmerească","jandarmeresc","jandarmereasca","jandarmeresc"],"jandarmerescul":"jandarmeresc","jandarmeresti":"jandarmeresc","jandarmerestii":"jandarmeresc","jandarmerestile":"jandarmeresc","jandarmeria":"jandarmerie","jandarmeriei":"jandarmerie","jandarmerii":"jandarmerie","jandarmeriile":"jandarmerie","jandarmeriilor":"jandarmerie","jandarmi":"jandarm","jandarmii":"jandarm","jandarmilor":"jandarm","jandarmul":"jandarm","jandarmule":"jandarm","jandarmului":"jandarm","jandarul":["jandarul","jandar","jăndarul","jăndar"],"jandarule":["jandarule","jandar","jăndarule","jăndar"],"jandarului":["jandarului","jandar","jăndarului","jăndar"],"janghine":"janghină","janghinei":"janghină","janghinele":"janghină","janghinelor":"janghină","janghinoasa":["janghinoasă","janghinos","janghinoasa","janghinos"],"janghinoase":"janghinos","janghinoasele":"janghinos","janghinosi":"janghinos","janghinosii":"janghinos","janghinosul":"janghinos","janilieul":"janilie","janilieule":"janilie","janilieului":"janilie","janilii":"janilie","janiliile":"janilie","janiliilor":"janilie","jansenisme":"jansenism","jansenismele":"jansenism","jansenismelor":"jansenism","jansenismul":"jansenism","jansenismule":"jansenism","jansenismului":"jansenism","janseniste":"jansenistă","jansenistei":"jansenistă","jansenistele":"jansenistă","jansenistelor":"jansenistă","jansenisti":"jansenist","jansenistii":"jansenist","jansenistilor":"jansenist","jansenistul":"jansenist","jansenistule":"jansenist","jansenistului":"jansenist","jante":"jantă","jantei":"jantă","jantele":"jantă","jantelor":"jantă","japaniceasca":["japanicească","japanicesc","japaniceasca","japanicesc"],"japanicescul":"japanicesc","japanicesti":"japanicesc","japanicestii":"japanicesc","japanicestile":"japanicesc","japanologe":"japanologă","japanologei":"japanologă","japanologele":"japanologă","japanologelor":"japanologă","japanologia":"japanologie","japanologiei":"japanologie","japanologii":"japanologie","japanologiile":"japanologie","japanologiilor":"japanologie","japcanele":"jăpcăneală","japcanelei":"jăpcăneală","japcanelele":"jăpcăneală","japcanelelor":"jăpcăneală","japcaneli":"jăpcăneală","japcani":"jăpcan","japcanii":"jăpcan","japcanilor":"jăpcan","japcanirea":"jăpcănire","japcaniri":"jăpcănire","japcanirii":"jăpcănire","japcanirile":"jăpcănire","japcanirilor":"jăpcănire","japcanita":["jăpcănită","jăpcănit","jăpcănita","jăpcănit"],"japcanite":"jăpcănit","japcanitele":"jăpcănit","japcaniti":"jăpcănit","japcanitii":"jăpcănit","japcanitul":"jăpcănit","japcanul":"jăpcan","japcanule":"jăpcan","japcanului":"jăpcan","japcasi":"jăpcaș","japcasii":"jăpcaș","japcasilor":"jăpcaș","japcasul":"jăpcaș","japcasule":"jăpcaș","japcasului":"jăpcaș","japce":"japcă","japcei":"japcă","jape":"japă","japei":"japă","japele":"japă","japelor":"japă","japoneza":["japoneză","japonez","japoneza","japonez"],"japoneze":["japoneze","japonez","japoneze","japoneză"],"japonezei":"japoneză","japonezele":["japonezele","japonez","japonezele","japoneză"],"japonezelor":"japoneză","japonezi":"japonez","japonezii":"japonez","japonezilor":"japonez","japonezul":"japonez","japonezule":"japonez","japonezului":"japonez","japonisme":"japonism","japonismele":"japonism","japonismelor":"japonism","japonismul":"japonism","japonismule":"japonism","japonismului":"japonism","japonologe":"japonologă","japonologei":"japonologă","japonologele":"japonologă","japonologelor":"japonologă","japonologi":"japonolog","japonologia":"japonologie","japonologiei":"japonologie","japonologii":["japonologii","japonolog","japonologii","japonologie"],"japonologiile":"japonologie","japonologiilor":"japonologie","japonologilor":"japonolog","japonologul":"japonolog","japonologule":"japonolog","japonologului":"japonolog","japonul":"japon","japonule":"japon","japonului":"japon","japse":"japsă","japsei":"japsă","japsele":"japsă","japselor":"japsă","jaragaiul":"jărăgai","jaragaiule":"jărăgai","jaragaiului":"jărăgai","jaragaiuri":"jărăgai","jaragaiurile":"jărăgai","jaragaiurilor":"jărăgai","jaratec":"jăratic","jaraticul":"jăratic","jaraticule":"jăratic","jaraticului":"jăratic","jarcalaie":"jarcalău","jarcalaiele":"jarcalău","jarcalaielor":"jarcalău","jarcalauul":"jarcalău","jarcalauule":"jarcalău","jarcalauului":"jarcalău","jarcaleteul":"jarcalete","jarcaleteule":"jarcalete","jarcaleteului":"jarcalete","jarcaleti":"jarcalete","jarcaletii":"jarcalete","jarcaletilor":"jarcalete","jarchine":"jarchină","jarchinei":"jarchină","jarchinele":"jarchină","jarchinelor":"jarchină","jardia":"jărdie","jardiei":"jărdie","jardii":"jărdie","jardiile":"jărdie","jardiilor":"jărdie","jardiniere":"jardinieră","jardinierei":"jardinieră","jardinierele":"jardinieră","jardinierelor":"jardinieră","jarea":"jări","jareai":"jări","jaream":"jări","jareati":"jări","jareau":"jări","jaresc":"jări","jareste":"jări","jaresti":"jări","jarete":"jaret","jaretele":"jaret","jaretelor":"jaret","jaretiere":"jaretieră","jaretierei":"jaretieră","jaretierele":"jaretieră","jaretierelor":"jaretieră","jaretul":"jaret","jaretule":"jaret","jaretului":"jaret","jargoane":"jargon","jargoanele":"jargon","jargoanelor":"jargon","jargonafazia":"jargonafazie","jargonafaziei":"jargonafazie","jargonafazii":"jargonafazie","jargonafaziile":"jargonafazie","jargonafaziilor":"jargonafazie","jargonul":"jargon","jargonule":"jargon","jargonului":"jargon","jarii":"jări","jarim":"jări","jarind":"jări","jarira":"jări","jariram":"jări","jarirati":"jări","jarise":"jări","jarisem":"jări","jarisera":"jări","jariseram":"jări","jariserati":"jări","jarisesi":"jări","jarisi":"jări","jaristea":["jariștea","jariște","jăriștea","jăriște"],"jaristi":["jariști","jariște","jăriști","jăriște"],"jaristii":["jariștii","jariște","jăriștii","jăriște"],"jaristile":["jariștile","jariște","jăriștile","jăriște"],"jaristilor":["jariștilor","jariște","jăriștilor","jăriște"],"jarit":"jări","jariti":"jări","jarteaua":"jartea","jartele":["jartele","jartea","jartele","jartelă"],"jartelei":["jartelei","jartea","jartelei","jartelă"],"jartelele":["jartelele","jartea","jartelele","jartelă"],"jartelelor":["jartelelor","jartea","jartelelor","jartelă"],"jartfirea":"jărtfire","jartfiri":"jărtfire","jartfirii":"jărtfire","jartfirile":"jărtfire","jartfirilor":"jărtfire","jartiere":"jartieră","jartve":["jârtve","jârtvă","jărtve","jărtvă"],"jartvei":["jârtvei","jârtvă","jărtvei","jărtvă"],"jartvele":["jârtvele","jârtvă","jărtvele","jărtvă"],"jartvelor":["jârtvelor","jârtvă","jărtvelor","jărtvă"],"jartvirea":"jărtvire","jartviri":"jărtvire","jartvirii":"jărtvire","jartvirile":"jărtvire","jartvirilor":"jărtvire","jaruia":"jărui","jaruiai":"jărui","jaruiam":"jărui","jaruiati":"jărui","jaruiau":"jărui","jaruiesc":"jărui","jaruieste":"jărui","jaruiesti":"jărui","jaruii":"jărui","jaruim":"jărui","jaruind":"jărui","jaruira":"jărui","jaruiram":"jărui","jaruirati":"jărui","jaruise":"jărui","jaruisem":"jărui","jaruisera":"jărui","jaruiseram":"jărui","jaruiserati":"jărui","jaruisesi":"jărui","jaruisi":"jărui","jaruit":"jărui","jaruiti":"jărui","jarul":"jar","jarule":"jar","jarului":"jar","jaruri":"jar","jarurile":"jar","jarurilor":"jar","jasmini":"jasmin","jasminii":"jasmin","jasminilor":"jasmin","jasminul":"jasmin","jasminule":"jasmin","jasminului":"jasmin","jaspul":"jasp","jaspule":"jasp","jaspului":"jasp","jatul":"jăț","jatule":"jăț","jatului":"jăț","jaturi":"jăț","jaturile":"jăț","jaturilor":"jăț","javaneze":"javaneză","javanezei":"javaneză","javanezele":"javaneză","javanezelor":"javaneză","javanezi":"javanez","javanezii":"javanez","javanezilor":"javanez","javanezul":"javanez","javanezule":"javanez","javanezului":"javanez","javartul":"javart","javartule":"javart","javartului":"javart","javeline":"javelină","javelinei":"javelină","javelinele":"javelină","javelinelor":"javelină","javelizai":"javeliza","javelizam":["javelizăm","javeliza","javelizam","javeliza"],"javelizand":"javeliza","javelizara":"javeliza","javelizaram":"javeliza","javelizarati":"javeliza","javelizarea":"javelizare","javelizari":"javelizare","javelizarii":"javelizare","javelizarile":"javelizare","javelizarilor":"javelizare","javelizase":"javeliza","javelizasem":"javeliza","javelizasera":"javeliza","javelizaseram":"javeliza","javelizaserati":"javeliza","javelizasesi":"javeliza","javelizasi":"javeliza","javelizat":"javeliza","javelizati":"javeliza","javelizau":"javeliza","javelizeaza":"javeliza","javelizez":"javeliza","javelizezi":"javeliza","javre":"javră","javrei":"javră","javrele":"javră","javrelor":"javră","jazmanul":"jazman","jazmanule":"jazman","jazmanului":"jazman","jazmeni":"jazman","jazmenii":"jazman","jazmenilor":"jazman","jazzistica":["jazzistică","jazzistic","jazzistica","jazzistic"],"jazzistice":"jazzistic","jazzisticele":"jazzistic","jazzistici":"jazzistic","jazzisticii":"jazzistic","jazzisticul":"jazzistic","jazzul":"jazz","jazzule":"jazz","jazzului":"jazz","jbrantul":"jbranț","jbrantule":"jbranț","jbrantului":"jbranț","jderi":"jder","jderii":"jder","jderilor":"jder","jderul":"jder","jderule":"jder","jderului":"jder","jdiori":"jdior","jdiorii":"jdior","jdiorilor":"jdior","jdiorul":"jdior","jdiorule":"jdior","jdiorului":"jdior","jeansii":"jeanși","jeansilor":"jeanși","jeansiul":"jeanși","jeansiule":"jeanși","jeansiului":"jeanși","jebul":"jeb","jebule":"jeb","jebului":"jeb","jeburi":"jeb","jeburile":"jeb","jeburilor":"jeb","jecmanea":"jecmăni","jecmaneai":"jecmăni","jecmaneam":"jecmăni","jecmaneati":"jecmăni","jecmaneau":"jecmăni","jecmaneli":"jecmăneală","jecmanelii":"jecmăneală","jecmanelile":"jecmăneală","jecmanelilor":"jecmăneală","jecmanesc":"jecmăni","jecmaneste":"jecmăni","jecmanesti":"jecmăni","jecmania":"jecmănie","jecmaniei":"jecmănie","jecmanii":["jecmănii","jecmăni","jecmănii","jecmănie"],"jecmaniile":"jecmănie","jecmaniilor":"jecmănie","jecmanim":"jecmăni","jecmanind":"jecmăni","jecmanira":"jecmăni","jecmaniram":"jecmăni","jecmanirati":"jecmăni","jecmanirea":"jecmănire","jecmaniri":"jecmănire","jecmanirii":"jecmănire","jecmanirile":"jecmănire","jecmanirilor":"jecmănire","jecmanise":"jecmăni","jecmanisem":"jecmăni","jecmanisera":"jecmăni","jecmaniseram":"jecmăni","jecmaniserati":"jecmăni","jecmanisesi":"jecmăni","jecmanisi":"jecmăni","jecmanit":"jecmăni","jecmaniti":"jecmăni","jecmanitori":"jecmănitor","jecmanitorii":"jecmănitor","jecmanitorilor":"jecmănitor","jecmanitorul":"jecmănitor","jecmanitorule":"jecmănitor","jecmanitorului":"jecmănitor","jecuia":"jecui","jecuiai":"jecui","jecuiam":"jecui","jecuiati":"jecui","jecuiau":"jecui","jecuiesc":"jecui","jecuieste":"jecui","jecuiesti":"jecui","jecuii":"jecui","jecuim":"jecui","jecuind":"jecui","jecuira":"jecui","jecuiram":"jecui","jecuirati":"jecui","jecuirea":"jecuire","jecuiri":"jecuire","jecuirii":"jecuire","jecuirile":"jecuire","jecuirilor":"jecuire","jecuise":"jecui","jecuisem":"jecui","jecuisera":"jecui","jecuiseram":"jecui","jecuiserati":"jecui","jecuisesi":"jecui","jecuisi":"jecui","jecuit":"jecui","jecuiti":"jecui","jeepul":"jeep","jeepule":"jeep","jeepului":"jeep","jeepuri":"jeep","jeepurile":"jeep","jeepurilor":"jeep","jefuia":"jefui","jefuiai":"jefui","jefuiam":"jefui","jefuiati":"jefui","jefuiau":"jefui","jefuiele":"jefuială","jefuielei":"jefuială","jefuielele":"jefuială","jefuielelor":"jefuială","jefuieli":"jefuială","jefuiesc":"jefui","jefuieste":"jefui","jefuiesti":"jefui","jefuii":"jefui","jefuim":"jefui","jefuind":"jefui","jefuira":"jefui","jefuiram":"jefui","jefuirati":"jefui","jefuirea":"jefuire","jefuiri":"jefuire","jefuirii":"jefuire","jefuirile":"jefuire","jefuirilor":"jefuire","jefuise":"jefui","jefuisem":"jefui","jefuisera":"jefui","jefuiseram":"jefui","jefuiserati":"jefui","jefuisesi":"jefui","jefuisi":"jefui","jefuit":"jefui","jefuiti":"jefui","jefuitoarea":"jefuitoare","jefuitoarei":"jefuitoare","jefuitoarele":"jefuitoare","jefuitoarelor":"jefuitoare","jefuitori":"jefuitor","jefuitorii":"jefuitor","jefuitorilor":"jefuitor","jefuitorul":"jefuitor","jefuitorule":"jefuitor","jefuitorului":"jefuitor","jefuitul":"jefuit","jefuitule":"jefuit","jefuitului":"jefuit","jegoasa":["jegoasă","jegos","jegoasa","jegos"],"jegoase":"jegos","jegoasele":"jegos","jegosi":"jegos","jegosii":"jegos","jegosul":"jegos","jeguiete":"jeguiață","jeguietei":"jeguiață","jeguietele":"jeguiață","jeguietelor":"jeguiață","jegul":"jeg","jegule":"jeg","jegului":"jeg","jeguri":"jeg","jegurile":"jeg","jegurilor":"jeg","jejunala":["jejunală","jejunal","jejunala","jejunal"],"jejunale":"jejunal","jejunalele":"jejunal","jejunali":"jejunal","jejunalii":"jejunal","jejunalul":"jejunal","jejunostomia":"jejunostomie","jejunostomiei":"jejunostomie","jejunostomii":"jejunostomie","jejunostomiile":"jejunostomie","jejunostomiilor":"jejunostomie","jejunul":"jejun","jejunule":"jejun","jejunului":"jejun","jejunuri":"jejun","jejunurile":"jejun","jejunurilor":"jejun","jel":"jeli","jelania":"jelanie","jelaniei":"jelanie","jelanii":"jelanie","jelbari":"jelbar","jelbarii":"jelbar","jelbarilor":"jelbar","jelbarul":"jelbar","jelbarule":"jelbar","jelbarului":"jelbar","jele":"jeli","jelea":"jeli","jeleai":"jeli","jeleam":"jeli","jeleati":"jeli","jeleau":"jeli","jeleria":"jelerie","jeleriei":"jelerie","jelerii":"jelerie","jeleriile":"jelerie","jeleriilor":"jelerie","jeleul":"jeleu","jeleule":"jeleu","jeleului":"jeleu","jeleuri":"jeleu","jeleurile":"jeleu","jeleurilor":"jeleu","jelii":"jeli","jelim":"jeli","jelind":"jeli","jelira":"jeli","jeliram":"jeli","jelirati":"jeli","jelirea":"jelire","jelirei":"jelire","jelise":"jeli","jelisem":"jeli","jelisera":"jeli","jeliseram":"jeli","jeliserati":"jeli","jelisesi":"jeli","jelisi":"jeli","jelit":"jeli","jelita":["jelită","jelit","jelita","jelit"],"jelite":"jelit","jelitele":"jelit","jeliti":["jeliți","jeli","jeliți","jelit"],"jelitii":"jelit","jelitoare":"jelitor","jelitoarea":"jelitor","jelitoarele":"jelitor","jelitori":"jelitor","jelitorii":"jelitor","jelitorul":"jelitor","jelitul":"jelit","jelnica":["jelnică","jelnic","jelnica","jelnic"],"jelnice":"jelnic","jelnicele":"jelnic","jelnici":"jelnic","jelnicii":"jelnic","jelnicul":"jelnic","jeltul":"jelț","jeltule":"jelț","jeltului":"jelț","jelturele":"jelțurel","jelturelele":"jelțurel","jelturelelor":"jelțurel","jelturelul":"jelțurel","jelturelule":"jelțurel","jelturelului":"jelțurel","jelturi":"jelț","jelturile":"jelț","jelturilor":"jelț","jeluia":"jelui","jeluiai":"jelui","jeluiam":"jelui","jeluiati":"jelui","jeluiau":"jelui","jeluie":"jelui","jeluiesc":"jelui","jeluii":"jelui","jeluim":"jelui","jeluind":"jelui","jeluira":"jelui","jeluiram":"jelui","jeluirati":"jelui","jeluirea":"jeluire","jeluiri":"jeluire","jeluirii":"jeluire","jeluirile":"jeluire","jeluirilor":"jeluire","jeluise":"jelui","jeluisem":"jelui","jeluisera":"jelui","jeluiseram":"jelui","jeluiserati":"jelui","jeluisesi":"jelui","jeluisi":"jelui","jeluit":"jelui","jeluita":["jeluită","jeluit","jeluita","jeluit"],"jeluite":"jeluit","jeluitele":"jeluit","jeluiti":["jeluiți","jelui","jeluiți","jeluit"],"jeluitii":"jeluit","jeluitoare":"jeluitor","jeluitoarea":["jeluitoarea","jeluitoare","jeluitoarea","jeluitor"],"jeluitoarei":"jeluitoare","jeluitoarele":["jeluitoarele","jeluitoare","jeluitoarele","jeluitor"],"jeluitoarelor":"jeluitoare","jeluitori":"jeluitor","jeluitorii":"jeluitor","jeluitorilor":"jeluitor","jeluitorul":"jeluitor","jeluitorule":"jeluitor","jeluitorului":"jeluitor","jeluitul":"jeluit","jemanfisismul":"jemanfișism","jemanfisismule":"jemanfișism","jemanfisismului":"jemanfișism","jemanfisismuri":"jemanfișism","jemanfisismurile":"jemanfișism","jemanfisismurilor":"jemanfișism","jenai":"jena","jenam":["jenăm","jena","jenam","jena"],"jenand":"jena","jenanta":["jenantă","jenant","jenanta","jenant"],"jenante":"jenant","jenantele":"jenant","jenanti":"jenant","jenantii":"jenant","jenantul":"jenant","jenara":"jena","jenaram":"jena","jenarati":"jena","jenarea":"jenare","jenari":"jenare","jenarii":"jenare","jenarile":"jenare","jenarilor":"jenare","jenase":"jena","jenasem":"jena","jenasera":"jena","jenaseram":"jena","jenaserati":"jena","jenasesi":"jena","jenasi":"jena","jenat":"jena","jenata":["jenată","jenat","jenata","jenat"],"jenate":"jenat","jenatele":"jenat","jenati":["jenați","jena","jenați","jenat"],"jenatii":"jenat","jenatul":"jenat","jenau":"jena","jendarmi":"jendarm","jendarmii":"jendarm","jendarmilor":"jendarm","jendarmul":"jendarm","jendarmule":"jendarm","jendarmului":"jendarm","jene":"jenă","jeneaza":"jena","jenei":"jenă","jenele":"jenă","jenelor":"jenă","jenez":"jena","jenezi":"jena","jenia":"jenie","jenibila":["jenibilă","jenibil","jenibila","jenibil"],"jenibile":"jenibil","jenibilele":"jenibil","jenibili":"jenibil","jenibilii":"jenibil","jenibilul":"jenibil","jeniei":"jenie","jenii":"jenie","jeniile":"jenie","jeniilor":"jenie","jepi":"jep","jepii":"jep","jepilor":"jep","jepul":"jep","jepule":"jep","jepului":"jep","jeratecul":"jeratec","jeratecule":"jeratec","jeratecului":"jeratec","jeraticul":"jeratic","jeraticule":"jeratic","jeraticului":"jeratic","jerbe":"jerbă","jerbei":"jerbă","jerbele":"jerbă","jerbelor":"jerbă","jeregaiul":"jeregai","jeregaiule":"jeregai","jeregaiului":"jeregai","jeregaiuri":"jeregai","jeregaiurile":"jeregai","jeregaiurilor":"jeregai","jerfe":"jerfă","jerfei":"jerfă","jerfele":"jerfă","jerfelor":"jerfă","jerpelea":"jerpeli","jerpeleai":"jerpeli","jerpeleam":"jerpeli","jerpeleati":"jerpeli","jerpeleau":"jerpeli","jerpelesc":"jerpeli","jerpeleste":"jerpeli","jerpelesti":"jerpeli","jerpelii":"jerpeli","jerpelim":"jerpeli","jerpelind":"jerpeli","jerpelira":"jerpeli","jerpeliram":"jerpeli","jerpelirati":"jerpeli","jerpelise":"jerpeli","jerpelisem":"jerpeli","jerpelisera":"jerpeli","jerpeliseram":"jerpeli","jerpeliserati":"jerpeli","jerpelisesi":"jerpeli","jerpelisi":"jerpeli","jerpelit":"jerpeli","jerpelita":["jerpelită","jerpelit","jerpelita","jerpelit"],"jerpelite":"jerpelit","jerpelitele":"jerpelit","jerpeliti":["jerpeliți","jerpeli","jerpeliți","jerpelit"],"jerpelitii":"jerpelit","jerpelitul":"jerpelit","jerpelituri":"jerpelitură","jerpeliturii":"jerpelitură","jerpeliturile":"jerpelitură","jerpeliturilor":"jerpelitură","jerseul":["jerseul","jerse","jerseul","jerseu"],"jerseule":["jerseule","jerse","jerseule","jerseu"],"jerseului":["jerseului","jerse","jerseului","jerseu"],"jerseuri":["jerseuri","jerse","jerseuri","jerseu"],"jerseurile":["jerseurile","jerse","jerseurile","jerseu"],"jerseurilor":["jerseurilor","jerse","jerseurilor","jerseu"],"jertfe":"jertfă","jertfea":"jertfi","jertfeai":"jertfi","jertfeam":"jertfi","jertfeati":"jertfi","jertfeau":"jertfi","jertfei":"jertfă","jertfele":"jertfă","jertfelnice":"jertfelnic","jertfelnicele":"jertfelnic","jertfelnicelor":"jertfelnic","jertfelnicul":"jertfelnic","jertfelnicule":"jertfelnic","jertfelnicului":"jertfelnic","jertfelor":"jertfă","jertfesc":"jertfi","jertfeste":"jertfi","jertfesti":"jertfi","jertfii":"jertfi","jertfim":"jertfi","jertfind":"jertfi","jertfira":"jertfi","jertfiram":"jertfi","jertfirati":"jertfi","jertfirea":"jertfire","jertfirei":"jertfire","jertfise":"jertfi","jertfisem":"jertfi","jertfisera":"jertfi","jertfiseram":"jertfi","jertfiserati":"jertfi","jertfisesi":"jertfi","jertfisi":"jertfi","jertfit":"jertfi","jertfiti":"jertfi","jertfuia":"jertfui","jertfuiai":"jertfui","jertfuiam":"jertfui","jertfuiati":"jertfui","jertfuiau":"jertfui","jertfuiesc":"jertfui","jertfuieste":"jertfui","jertfuiesti":"jertfui","jertfuii":"jertfui","jertfuim":"jertfui","jertfuind":"jertfui","jertfuira":"jertfui","jertfuiram":"jertfui","jertfuirati":"jertfui","jertfuirea":"jertfuire","jertfuiri":"jertfuire","jertfuirii":"jertfuire","jertfuirile":"jertfuire","jertfuirilor":"jertfuire","jertfuise":"jertfui","jertfuisem":"jertfui","jertfuisera":"jertfui","jertfuiseram":"jertfui","jertfuiserati":"jertfui","jertfuisesi":"jertfui","jertfuisi":"jertfui","jertfuit":"jertfui","jertfuiti":"jertfui","jertve":"jertvă","jertvei":"jertvă","jertvele":"jertvă","jertvelor":"jertvă","jeruia":"jerui","jeruiai":"jerui","jeruiam":"jerui","jeruiati":"jerui","jeruiau":"jerui","jeruiesc":"jerui","jeruieste":"jerui","jeruiesti":"jerui","jeruii":"jerui","jeruim":"jerui","jeruind":"jerui","jeruira":"jerui","jeruiram":"jerui","jeruirati":"jerui","jeruise":"jerui","jeruisem":"jerui","jeruisera":"jerui","jeruiseram":"jerui","jeruiserati":"jerui","jeruisesi":"jerui","jeruisi":"jerui","jeruit":"jerui","jeruiti":"jerui","jeteul":"jeteu","jeteule":"jeteu","jeteului":"jeteu","jeteuri":"jeteu","jeteurile":"jeteu","jeteurilor":"jeteu","jetoane":"jeton","jetoanele":"jeton","jetoanelor":"jeton","jetonul":"jeton","jetonule":"jeton","jetonului":"jeton","jetul":["jetul","jet","jețul","jeț"],"jetule":["jetule","jet","jețule","jeț"],"jetului":["jetului","jet","jețului","jeț"],"jeturele":"jețurel","jeturelele":"jețurel","jeturelelor":"jețurel","jeturelul":"jețurel","jeturelule":"jețurel","jeturelului":"jețurel","jeturi":["jeturi","jet","jețuri","jeț"],"jeturile":["jeturile","jet","jețurile","jeț"],"jeturilor":["jeturilor","jet","jețurilor","jeț"],"jevroaice":"jevroaică","jevroaicei":"jevroaică","jevroaicele":"jevroaică","jevroaicelor":"jevroaică","jezuiti":"jezuit","jezuitii":"jezuit","jezuitilor":"jezuit","jezuitul":"jezuit","jezuitule":"jezuit","jezuitului":"jezuit","jgheabul":"jgheab","jgheabule":"jgheab","jgheabului":"jgheab","jgheaburi":"jgheab","jgheaburile":"jgheab","jgheaburilor":"jgheab","jghebulete":"jghebuleț","jghebuletele":"jghebuleț","jghebuletelor":"jghebuleț","jghebuletul":"jghebuleț","jghebuletule":"jghebuleț","jghebuletului":"jghebuleț","jiane":"jiană","jianei":"jiană","jianele":"jiană","jianelor":"jiană","jianul":"jian","jianule":"jian","jianului":"jian","jiblea vechef":"Jiblea Veche","jicloare":"jiclor","jicloarele":"jiclor","jicloarelor":"jiclor","jiclorul":"jiclor","jiclorule":"jiclor","jiclorului":"jiclor","jicnea":"jicni","jicneai":"jicni","jicneam":"jicni","jicneati":"jicni","jicneau":"jicni","jicnesc":"jicni","jicneste":"jicni","jicnesti":"jicni","jicniceri":"jicnicer","jicnicerii":"jicnicer","jicnicerilor":"jicnicer","jicnicerul":"jicnicer","jicnicerule":"jicnicer","jicnicerului":"jicnicer","jicnii":"jicni","jicnim":"jicni","jicnind":"jicni","jicnira":"jicni","jicniram":"jicni","jicnirati":"jicni","jicnirea":"jicnire","jicniri":"jicnire","jicnirii":"jicnire","jicnirile":"jicnire","jicnirilor":"jicnire","jicnise":"jicni","jicnisem":"jicni","jicnisera":"jicni","jicniseram":"jicni","jicniserati":"jicni","jicnisesi":"jicni","jicnisi":"jicni","jicnit":"jicni","jicnita":["jicnită","jicnit","jicnita","jicnit"],"jicnite":["jicnite","jicnit","jicnițe","jicniță"],"jicnitei":"jicniță","jicnitele":["jicnitele","jicnit","jicnițele","jicniță"],"jicnitelor":"jicniță","jicniti":["jicniți","jicni","jicniți","jicnit"],"jicnitii":"jicnit","jicnitul":"jicnit","jidanasi":"jidănaș","jidanasul":"jidănaș","jidanasule":"jidănaș","jidanasului":"jidănaș","jidance":"jidancă","jidancei":"jidancă","jidancele":"jidancă","jidancelor":"jidancă","jidancute":"jidăncuță","jidancutei":"jidăncuță","jidancutele":"jidăncuță","jidancutelor":"jidăncuță","jidaneasca":["jidănească","jidănesc","jidăneasca","jidănesc"],"jidanescul":"jidănesc","jidanesti":"jidănesc","jidanestii":"jidănesc","jidanestile":"jidănesc","jidani":"jidan","jidanii":"jidan","jidanilor":"jidan","jidanimea":"jidănime","jidanimi":"jidănime","jidanimii":"jidănime","jidanul":"jidan","jidanule":"jidan","jidanului":"jidan","jidoafca":"jidoavcă","jidoaice":"jidoaică","jidoaicei":"jidoaică","jidoaicele":"jidoaică","jidoaicelor":"jidoaică","jidoavce":"jidoavcă","jidofcute":"jidofcuță","jidofcutei":"jidofcuță","jidofcutele":"jidofcuță","jidofcutelor":"jidofcuță","jidovce":"jidovcă","jidovcei":"jidovcă","jidovcele":"jidovcă","jidovcelor":"jidovcă","jidoveasca":["jidovească","jidovesc","jidoveasca","jidovesc"],"jidovescul":"jidovesc","jidovesti":"jidovesc","jidovestii":"jidovesc","jidovestile":"jidovesc","jidovi":"jidov","jidovia":"jidovie","jidoviei":"jidovie","jidovii":["jidovii","jidov","jidovii","jidovie"],"jidovilor":"jidov","jidovimea":"jidovime","jidovimi":"jidovime","jidovimii":"jidovime","jidovini":"jidovin","jidovinii":"jidovin","jidovinilor":"jidovin","jidovinul":"jidovin","jidovinule":"jidovin","jidovinului":"jidovin","jidovoaice":"jidovoaică","jidovoaicei":"jidovoaică","jidovoaicele":"jidovoaică","jidovoaicelor":"jidovoaică","jidovul":"jidov","jidovule":"jidov","jidovului":"jidov","jidul":"jid","jidule":"jid","jidului":"jid","jience":"jiancă","jiencei":"jiancă","jiencele":"jiancă","jiencelor":"jiancă","jienesti":"jieneasca","jienestii":"jieneasca","jieni":"jian","jienii":"jian","jienilor":"jian","jig":"jeg","jigania":"jiganie","jiganiei":"jiganie","jiganii":["jigănii","jiganie","jiganii","jiganie"],"jiganiile":"jiganie","jiganiilor":"jiganie","jiganiute":"jigăniuță","jiganiutei":"jigăniuță","jiganiutele":"jigăniuță","jiganiutelor":"jigăniuță","jigarainite":"jigărainiță","jigarainitei":"jigărainiță","jigarainitele":"jigărainiță","jigarainitelor":"jigărainiță","jigarea":"jigări","jigareai":"jigări","jigaream":"jigări","jigareati":"jigări","jigareau":"jigări","jigarele":"jigăreală","jigarelei":"jigăreală","jigarelele":"jigăreală","jigarelelor":"jigăreală","jigareli":"jigăreală","jigaresc":"jigări","jigareste":"jigări","jigaresti":"jigări","jigaricioare":"jigâricioară","jigaricioarei":"jigâricioară","jigarii":"jigări","jigarim":"jigări","jigarind":"jigări","jigarira":"jigări","jigariram":"jigări","jigarirati":"jigări","jigarise":"jigări","jigarisem":"jigări","jigarisera":"jigări","jigariseram":"jigări","jigariserati":"jigări","jigarisesi":"jigări","jigarisi":"jigări","jigarit":"jigări","jigarite":"jigăriță","jigaritei":"jigăriță","jigaritele":"jigăriță","jigaritelor":"jigăriță","jigariti":"jigări","jigluituri":"jigluitură","jigluiturii":"jigluitură","jigluiturile":"jigluitură","jigluiturilor":"jigluitură","jignea":"jigni","jigneai":"jigni","jigneam":"jigni","jigneati":"jigni","jigneau":"jigni","jignesc":"jigni","jigneste":"jigni","jignesti":"jigni","jigniceri":"jignicer","jignicerii":"jignicer","jignicerilor":"jignicer","jignicerul":"jignicer","jignicerule":"jignicer","jignicerului":"jignicer","jignii":"jigni","jignim":"jigni","jignind":"jigni","jignira":"jigni","jigniram":"jigni","jignirati":"jigni","jignirea":"jignire","jigniri":"jignire","jignirii":"jignire","jignirile":"jignire","jignirilor":"jignire","jignise":"jigni","jignisem":"jigni","jignisera":"jigni","jigniseram":"jigni","jigniserati":"jigni","jignisesi":"jigni","jignisi":"jigni","jignit":"jigni","jignita":["jignită","jignit","jignita","jignit"],"jignite":["jignite","jignit","jignițe","jigniță"],"jignitei":"jigniță","jignitele":["jignitele","jignit","jignițele","jigniță"],"jignitelor":"jigniță","jigniti":["jigniți","jigni","jigniți","jignit"],"jignitii":"jignit","jignitoare":"jignitor","jignitoarea":"jignitor","jignitoarele":"jignitor","jignitori":"jignitor","jignitorii":"jignitor","jignitorul":"jignitor","jignitul":"jignit","jigodii":"jigodie","jigodioasa":["jigodioasă","jigodios","jigodioasa","jigodios"],"jigodioase":"jigodios","jigodioasele":"jigodios","jigodiosi":"jigodios","jigodiosii":"jigodios","jigodiosul":"jigodios","jigoul":"jigou","jigoule":"jigou","jigoului":"jigou","jigouri":"jigou","jigourile":"jigou","jigourilor":"jigou","jigul":"jig","jigule":"jig","jigului":"jig","jiguri":"jig","jigurile":"jig","jigurilor":"jig","jihadul":"jihad","jihadule":"jihad","jihadului":"jihad","jihaduri":"jihad","jihadurile":"jihad","jihadurilor":"jihad","jijine":"jijină","jijinei":"jijină","jijinele":"jijină","jijinelor":"jijină","jilauul":"jilău","jilauule":"jilău","jilauului":"jilău","jilava":["jilavă","jilav","jilava","jilav"],"jilave":"jilav","jilavea":"jilăvi","jilaveai":"jilăvi","jilaveam":"jilăvi","jilaveati":"jilăvi","jilaveau":"jilăvi","jilavele":"jilav","jilaveli":"jilăveală","jilavelii":"jilăveală","jilavelile":"jilăveală","jilavelilor":"jilăveală","jilavesc":"jilăvi","jilaveste":"jilăvi","jilavesti":"jilăvi","jilavi":"jilav","jilavia":"jilăvie","jilaviei":"jilăvie","jilavii":["jilavii","jilav","jilăvii","jilăvi","jilăvii","jilăvie"],"jilaviile":"jilăvie","jilaviilor":"jilăvie","jilavim":"jilăvi","jilavind":"jilăvi","jilavira":"jilăvi","jilaviram":"jilăvi","jilavirati":"jilăvi","jilavirea":"jilăvire","jilaviri":"jilăvire","jilavirii":"jilăvire","jilavirile":"jilăvire","jilavirilor":"jilăvire","jilavise":"jilăvi","jilavisem":"jilăvi","jilavisera":"jilăvi","jilaviseram":"jilăvi","jilaviserati":"jilăvi","jilavisesi":"jilăvi","jilavisi":"jilăvi","jilavit":"jilăvi","jilavita":["jilăvită","jilăvit","jilăvita","jilăvit"],"jilavite":"jilăvit","jilavitele":"jilăvit","jilaviti":["jilăviți","jilăvi","jilăviți","jilăvit"],"jilavitii":"jilăvit","jilavitul":"jilăvit","jilavul":"jilav","jile":"jilă","jilei":"jilă","jilele":"jilă","jilelor":"jilă","jiletcele":"jiletcel","jiletcelele":"jiletcel","jiletcelelor":"jiletcel","jiletcelul":"jiletcel","jiletcelule":"jiletcel","jiletcelului":"jiletcel","jiletci":"jiletcă","jiletcii":"jiletcă","jiletcile":"jiletcă","jiletcilor":"jiletcă","jilt":"jeț","jiltul":"jilț","jiltule":"jilț","jiltului":"jilț","jilturi":"jilț","jilturile":"jilț","jilturilor":"jilț","jimblarese":"jimblăreasă","jimblaresei":"jimblăreasă","jimblaresele":"jimblăreasă","jimblareselor":"jimblăreasă","jimblari":"jimblar","jimblaria":"jimblărie","jimblariei":"jimblărie","jimblarii":["jimblarii","jimblar","jimblării","jimblărie"],"jimblariile":"jimblărie","jimblariilor":"jimblărie","jimblarilor":"jimblar","jimblarite":"jimblăriță","jimblaritei":"jimblăriță","jimblaritele":"jimblăriță","jimblaritelor":"jimblăriță","jimblarul":"jimblar","jimblarule":"jimblar","jimblarului":"jimblar","jimble":"jimblă","jimblei":"jimblă","jimblele":"jimblă","jimblelor":"jimblă","jimblute":"jimbluță","jimblutei":"jimbluță","jimblutele":"jimbluță","jimblutelor":"jimbluță","jimbulite":"jimbuliță","jimbulitei":"jimbuliță","jimbulitele":"jimbuliță","jimbulitelor":"jimbuliță","jinaie":"jinău","jinaiele":"jinău","jinaielor":"jinău","jinauul":"jinău","jinauule":"jinău","jinauului":"jinău","jinduia":"jindui","jinduiai":"jindui","jinduiam":"jindui","jinduiati":"jindui","jinduiau":"jindui","jinduiele":"jinduială","jinduielei":"jinduială","jinduielele":"jinduială","jinduielelor":"jinduială","jinduieli":"jinduială","jinduiesc":"jindui","jinduieste":"jindui","jinduiesti":"jindui","jinduii":"jindui","jinduim":"jindui","jinduind":"jindui","jinduira":"jindui","jinduiram":"jindui","jinduirati":"jindui","jinduirea":"jinduire","jinduiri":"jinduire","jinduirii":"jinduire","jinduirile":"jinduire","jinduirilor":"jinduire","jinduise":"jindui","jinduisem":"jindui","jinduisera":"jindui","jinduiseram":"jindui","jinduiserati":"jindui","jinduisesi":"jindui","jinduisi":"jindui","jinduit":"jindui","jinduita":["jinduită","jinduit","jinduita","jinduit"],"jinduite":"jinduit","jinduitele":"jinduit","jinduiti":["jinduiți","jindui","jinduiți","jinduit"],"jinduitii":"jinduit","jinduitoare":"jinduitor","jinduitoarea":"jinduitor","jinduitoarele":"jinduitor","jinduitori":"jinduitor","jinduitorii":"jinduitor","jinduitorul":"jinduitor","jinduitul":"jinduit","jindul":"jind","jindule":"jind","jindului":"jind","jintere":"jinteră","jinterei":"jinteră","jinterele":"jinteră","jinterelor":"jinteră","jintitita":["jintițită","jintițit","jintițita","jintițit"],"jintitite":"jintițit","jintititele":"jintițit","jintititi":"jintițit","jintititii":"jintițit","jintititul":"jintițit","jirbiute":"jirbiuță","jirbiutei":"jirbiuță","jirbiutele":"jirbiuță","jirbiutelor":"jirbiuță","jireage":"jireagă","jireagei":"jireagă","jireagele":"jireagă","jireagelor":"jireagă","jirisori":"jirișor","jirisorii":"jirișor","jirisorilor":"jirișor","jirisorul":"jirișor","jirisorule":"jirișor","jirisorului":"jirișor","jiristea":"jiriște","jiristi":"jiriște","jiristii":"jiriște","jiristile":"jiriște","jiristilor":"jiriște","jirtavnice":"jirtăvnic","jirtavnicele":"jirtăvnic","jirtavnicelor":"jirtăvnic","jirtavnicul":"jirtăvnic","jirtavnicule":"jirtăvnic","jirtavnicului":"jirtăvnic","jirtve":"jirtvă","jirtvei":"jirtvă","jirtvele":"jirtvă","jirtvelor":"jirtvă","jirul":"jir","jirule":"jir","jirului":"jir","jita":"vită","jitarese":"jităreasă","jitaresei":"jităreasă","jitaresele":"jităreasă","jitareselor":"jităreasă","jitci":"jitcă","jitcii":"jitcă","jitcile":"jitcă","jitcilor":"jitcă","jitia":"jitie","jitiei":"jitie","jitii":"jitie","jitiile":"jitie","jitiilor":"jitie","jitnite":"jitniță","jitnitei":"jitniță","jitnitele":"jitniță","jitnitelor":"jitniță","jiu-jitsul":"jiu-jitsu","jiu-jitsule":"jiu-jitsu","jiu-jitsului":"jiu-jitsu","jivani":"jivan","jivanii":"jivan","jivanilor":"jivan","jivanul":"jivan","jivanule":"jivan","jivanului":"jivan","jiveteul":"jivete","jiveteule":"jivete","jiveteului":"jivete","jiveti":"jivete","jivetii":"jivete","jivetilor":"jivete","jivine":"jivină","jivinei":"jivină","jivinele":"jivină","jivinelor":"jivină","jivinia":"jivinie","jiviniei":"jivinie","jivinii":"jivinie","jiviniile":"jivinie","jiviniilor":"jivinie","jivinute":"jivinuță","jivinutei":"jivinuță","jivinutele":"jivinuță","jivinutelor":"jivinuță","jivraje":"jivraj","jivrajele":"jivraj","jivrajelor":"jivraj","jivrajul":"jivraj","jivrajule":"jivraj","jivrajului":"jivraj","jivrata":["jivrată","jivrat","jivrata","jivrat"],"jivrate":"jivrat","jivratele":"jivrat","jivrati":"jivrat","jivratii":"jivrat","jivratul":"jivrat","jizi":"jid","jizii":"jid","jizilor":"jid","jlipe":"jlipă","jlipei":"jlipă","jlipele":"jlipă","jlipelor":"jlipă","jnapaia":"jnăpăi","jnapaiai":"jnăpăi","jnapaiam":"jnăpăi","jnapaiati":"jnăpăi","jnapaiau":"jnăpăi","jnapaie":"jnăpăi","jnapaii":"jnăpăi","jnapaim":"jnăpăi","jnapaind":"jnăpăi","jnapaira":"jnăpăi","jnapairam":"jnăpăi","jnapairati":"jnăpăi","jnapaise":"jnăpăi","jnapaisem":"jnăpăi","jnapaisera":"jnăpăi","jnapaiseram":"jnăpăi","jnapaiserati":"jnăpăi","jnapaisesi":"jnăpăi","jnapaisi":"jnăpăi","jnapait":"jnăpăi","jnapaiti":"jnăpăi","jneapanul":"jneapăn","jneapanule":"jneapăn","jneapanului":"jneapăn","jnepen":"jneapăn","jnepeni":["jnepeni","jneapăn","jnepeni","jnepen"],"jnepenii":["jnepenii","jneapăn","jnepenii","jnepen"],"jnepenilor":["jnepenilor","jneapăn","jnepenilor","jnepen"],"jnepenisul":"jnepeniș","jnepenisule":"jnepeniș","jnepenisului":"jnepeniș","jnepenisuri":"jnepeniș","jnepenisurile":"jnepeniș","jnepenisurilor":"jnepeniș","jnepenul":"jnepen","jnepenule":"jnepen","jnepenului":"jnepen","joaca":"juca","joaca de copil":"joacă de copii","joacai":"joacă","joace":["joace","joacă","joace","juca"],"joagare":"joagăr","joagarele":"joagăr","joagarelor":"joagăr","joagarul":"joagăr","joagarule":"joagăr","joagarului":"joagăr","joarde":"joardă","joardei":"joardă","joardele":"joardă","joardelor":"joardă","joasa":["joasă","jos","joasa","jos"],"joase":"jos","joasele":"jos","jobenata":["jobenată","jobenat","jobenata","jobenat"],"jobenate":"jobenat","jobenatele":"jobenat","jobenati":"jobenat","jobenatii":"jobenat","jobenatul":"jobenat","jobene":"joben","jobenele":"joben","jobenelor":"joben","jobenul":"joben","jobenule":"joben","jobenului":"joben","jobul":"job","jobule":"job","jobului":"job","joburi":"job","joburile":"job","joburilor":"job","joc":"juca","jochei":"jocheu","jocheii":["jocheii","jochei","jocheii","jocheu"],"jocheilor":["jocheilor","jochei","jocheilor","jocheu"],"jocheiul":"jochei","jocheiule":"jochei","jocheiului":"jochei","jocheul":"jocheu","jocheule":"jocheu","jocheului":"jocheu","joci":"juca","jocote":"jocot","jocotele":"jocot","jocotelor":"jocot","jocotul":"jocot","jocotule":"jocot","jocotului":"jocot","jocsoare":"jocșor","jocsoarele":"jocșor","jocsoarelor":"jocșor","jocsorul":"jocșor","jocsorule":"jocșor","jocsorului":"jocșor","jocul":"joc","jocule":"joc","joculete":"joculeț","joculetele":"joculeț","joculetelor":"joculeț","joculetul":"joculeț","joculetule":"joculeț","joculetului":"joculeț","jocului":"joc","jocuri":"joc","jocuri de carti":"joc de cărți","jocuri de cuvinte":"joc de cuvinte","jocuri de hazard":"joc de hazard","jocuri de rol":"joc de rol","jocuri de scena":"joc de scenă","jocuri de societate":"joc de societate","jocuri electronice":"joc electronic","jocuri video":"joc video","jocurile":"joc","jocurilor":"joc","jocusoare":"jocușor","jocusore":"jocușor","jocusorele":"jocușor","jocusorelor":"jocușor","jocusorul":"jocușor","jocusorule":"jocușor","jocusorului":"jocușor","jocute":"jocuț","jocutele":"jocuț","jocutelor":"jocuț","jocutul":"jocuț","jocutule":"jocuț","jocutului":"jocuț","jofre":"jofră","jofrei":"jofră","jofrele":"jofră","jofrelor":"jofră","joggingul":"jogging","joggingule":"jogging","joggingului":"jogging","joiane":"joiană","joianei":"joiană","joichite":"joichiță","joichitei":"joichiță","joichitele":"joichiță","joichitelor":"joichiță","joici":"joică","joicii":"joică","joicile":"joică","joicilor":"joică","joienei":"joienel","joieneii":"joienel","joieneilor":"joienel","joienelul":"joienel","joienelule":"joienel","joienelului":"joienel","joienici":"joienică","joienicii":"joienică","joienicile":"joienică","joienicilor":"joienică","joimiri":"joimir","joimirii":"joimir","joimirilor":"joimir","joimirul":"joimir","joimirule":"joimir","joimirului":"joimir","jointul":"joint","jointule":"joint","jointului":"joint","jointuri":"joint","jointurile":"joint","jointurilor":"joint","joje":"jojă","jojei":"jojă","jojele":"jojă","jojelor":"jojă","jokeri":"joker","jokerii":"joker","jokerilor":"joker","jokerul":"joker","jokerule":"joker","jokerului":"joker","joldunari":"joldunar","joldunarii":"joldunar","joldunarilor":"joldunar","joldunarul":"joldunar","joldunarule":"joldunar","joldunarului":"joldunar","joltarul":"joltar","joltarule":"joltar","joltarului":"joltar","jolubul":"jolub","jolubule":"jolub","jolubului":"jolub","joluburi":"jolub","joluburile":"jolub","joluburilor":"jolub","joncanele":"joncăneală","joncanelei":"joncăneală","joncanelele":"joncăneală","joncanelelor":"joncăneală","joncaneli":"joncăneală","jonci":"joncă","joncii":"joncă","joncile":"joncă","joncilor":"joncă","jonctiunea":"joncțiune","jonctiuni":"joncțiune","jonctiuni p-n":"joncțiune p-n","jonctiunii":"joncțiune","jonctiunile":"joncțiune","jonctiunilor":"joncțiune","jonglai":"jongla","jonglam":["jonglăm","jongla","jonglam","jongla"],"jongland":"jongla","jonglara":"jongla","jonglaram":"jongla","jonglarati":"jongla","jonglarea":"jonglare","jonglari":"jonglare","jonglarii":"jonglare","jonglarile":"jonglare","jonglarilor":"jonglare","jonglase":"jongla","jonglasem":"jongla","jonglasera":"jongla","jonglaseram":"jongla","jonglaserati":"jongla","jonglasesi":"jongla","jonglasi":"jongla","jonglat":"jongla","jonglati":"jongla","jonglau":"jongla","jongleaza":"jongla","jongleri":"jongler","jongleria":"jonglerie","jongleriei":"jonglerie","jonglerii":["jonglerii","jongler","jonglerii","jonglerie"],"jongleriile":"jonglerie","jongleriilor":"jonglerie","jonglerilor":"jongler","jonglerul":"jongler","jonglerule":"jongler","jonglerului":"jongler","jongleuri":"jongleur","jongleurii":"jongleur","jongleurilor":"jongleur","jongleurul":"jongleur","jongleurule":"jongleur","jongleurului":"jongleur","jonglez":"jongla","jonglezi":"jongla","jordeaua":"jordea","jordele":"jordea","jordelei":"jordea","jordelele":"jordea","jordelelor":"jordea","jordia":"jordie","jordiei":"jordie","jordii":"jordie","jordiile":"jordie","jordiilor":"jordie","jordite":"jordiță","jorditei":"jordiță","jorditele":"jordiță","jorditelor":"jordiță","joseane":"joseană","joseanei":"joseană","joseanele":"joseană","joseanelor":"joseană","joseanul":"josean","joseanule":"josean","joseanului":"josean","josence":"joseancă","josencei":"joseancă","josencele":"joseancă","josencelor":"joseancă","joseni":"josean","josenii":"josean","josenilor":"josean","josi":"jos","josii":"jos","jositoare":"jositor","jositoarea":"jositor","jositoarele":"jositor","jositori":"jositor","jositorii":"jositor","jositorul":"jositor","josnica":["josnică","josnic","josnica","josnic"],"josnice":"josnic","josnicele":"josnic","josnici":"josnic","josnicia":"josnicie","josniciei":"josnicie","josnicii":["josnicii","josnic","josnicii","josnicie"],"josniciile":"josnicie","josniciilor":"josnicie","josnicul":"josnic","josorarea":"josorare","josorari":"josorare","josorarii":"josorare","josorarile":"josorare","josorarilor":"josorare","josul":"jos","jouli":"joule","joulii":"joule","joulilor":"joule","joulul":"joule","joulule":"joule","joulului":"joule","joviala":["jovială","jovial","joviala","jovial"],"joviale":"jovial","jovialele":"jovial","joviali":"jovial","jovialii":"jovial","jovialitatea":"jovialitate","jovialitati":"jovialitate","jovialitatii":"jovialitate","jovialitatile":"jovialitate","jovialitatilor":"jovialitate","jovialul":"jovial","jubarte":"jubartă","jubartei":"jubartă","jubartele":"jubartă","jubartelor":"jubartă","jubilai":"jubila","jubilam":["jubilăm","jubila","jubilam","jubila"],"jubiland":"jubila","jubilara":"jubila","jubilaram":"jubila","jubilarati":"jubila","jubilarea":"jubilare","jubilari":"jubilare","jubilarii":"jubilare","jubilarile":"jubilare","jubilarilor":"jubilare","jubilase":"jubila","jubilasem":"jubila","jubilasera":"jubila","jubilaseram":"jubila","jubilaserati":"jubila","jubilasesi":"jubila","jubilasi":"jubila","jubilat":"jubila","jubilati":"jubila","jubilatia":"jubilație","jubilatiei":"jubilație","jubilatii":"jubilație","jubilatiile":"jubilație","jubilatiilor":"jubilație","jubilativa":["jubilativă","jubilativ","jubilativa","jubilativ"],"jubilative":"jubilativ","jubilativele":"jubilativ","jubilativi":"jubilativ","jubilativii":"jubilativ","jubilativul":"jubilativ","jubilau":"jubila","jubileaza":"jubila","jubilee":"jubileu","jubileele":"jubileu","jubileelor":"jubileu","jubileul":"jubileu","jubileule":"jubileu","jubileului":"jubileu","jubilez":"jubila","jubilezi":"jubila","jubiliara":["jubiliară","jubiliar","jubiliara","jubiliar"],"jubiliare":"jubiliar","jubiliarele":"jubiliar","jubiliari":"jubiliar","jubiliarii":"jubiliar","jubiliarul":"jubiliar","jucabila":["jucabilă","jucabil","jucabila","jucabil"],"jucabile":"jucabil","jucabilele":"jucabil","jucabili":"jucabil","jucabilii":"jucabil","jucabilul":"jucabil","jucai":"juca","jucam":["jucăm","juca","jucam","juca"],"jucand":"juca","jucara":"juca","jucaram":"juca","jucarati":"juca","jucarea":"jucare","jucareaua":"jucărea","jucarei":"jucăreie","jucareia":"jucăreie","jucareii":"jucăreie","jucareile":"jucăreie","jucareilor":"jucăreie","jucarele":["jucărele","jucărea","jucărele","jucărică"],"jucarelei":"jucărea","jucarelele":"jucărea","jucarelelor":"jucărea","jucari":"jucare","jucaria":"jucărie","jucarice":"jucărică","jucaricei":"jucărică","jucaricele":"jucărică","jucaricelor":"jucărică","jucariei":"jucărie","jucarieri":"jucărier","jucarierii":"jucărier","jucarierilor":"jucărier","jucarierul":"jucărier","jucarierule":"jucărier","jucarierului":"jucărier","jucarii":["jucării","jucare","jucării","jucărie"],"jucariile":"jucărie","jucariilor":"jucărie","jucarile":"jucare","jucarilor":"jucare","jucarioare":"jucărioară","jucarioarei":"jucărioară","jucarioarele":"jucărioară","jucarioarelor":"jucărioară","jucariute":"jucăriuță","jucariutei":"jucăriuță","jucariutele":"jucăriuță","jucariutelor":"jucăriuță","jucasa":["jucașă","jucaș","jucașa","jucaș"],"jucase":["jucase","juca","jucașe","jucaș"],"jucasele":"jucaș","jucasem":"juca","jucasera":"juca","jucaseram":"juca","jucaserati":"juca","jucasesi":"juca","jucasi":["jucași","juca","jucași","jucaș"],"jucasii":"jucaș","jucasul":"jucaș","jucat":"juca","jucata":["jucată","jucat","jucata","jucat"],"jucate":"jucat","jucatele":"jucat","jucati":["jucați","juca","jucați","jucat"],"jucatii":"jucat","jucatoarea":"jucătoare","jucatoarei":"jucătoare","jucatoarele":"jucătoare","jucatoarelor":"jucătoare","jucatori":"jucător","jucatori de golf":"jucător de golf","jucatori de sah":"jucător de șah","jucatoria":"jucătorie","jucatoriei":"jucătorie","jucatorii":["jucătorii","jucător","jucătorii","jucătorie"],"jucatoriile":"jucătorie","jucatoriilor":"jucătorie","jucatorilor":"jucător","jucatorul":"jucător","jucatorule":"jucător","jucatorului":"jucător","jucatul":"jucat","jucatule":"jucat","jucatului":"jucat","jucau":"juca","jucausa":["jucăușă","jucăuș","jucăușa","jucăuș"],"jucause":"jucăuș","jucausele":"jucăuș","jucausi":"jucăuș","jucausii":"jucăuș","jucausul":"jucăuș","jucuiele":"jucuială","jucuielei":"jucuială","jucuielele":"jucuială","jucuielelor":"jucuială","jucuieli":"jucuială","jucutai":"jucuțău","jucutaii":"jucuțău","jucutailor":"jucuțău","jucutauul":"jucuțău","jucutauule":"jucuțău","jucutauului":"jucuțău","jucutei":"jucuțel","jucuteii":"jucuțel","jucuteilor":"jucuțel","jucutelul":"jucuțel","jucutelule":"jucuțel","jucutelului":"jucuțel","judaisme":"judaism","judaismele":"judaism","judaismelor":"judaism","judaismul":"judaism","judaismule":"judaism","judaismului":"judaism","judani":"judan","judanii":"judan","judanilor":"judan","judanul":"judan","judanule":"judan","judanului":"judan","judec":["judec","jude","judec","judeca"],"judecai":"judeca","judecam":["judecăm","judeca","judecam","judeca"],"judecand":"judeca","judecara":"judeca","judecaram":"judeca","judecarati":"judeca","judecarea":"judecare","judecari":"judecare","judecarii":"judecare","judecarile":"judecare","judecarilor":"judecare","judecase":"judeca","judecasem":"judeca","judecasera":"judeca","judecaseram":"judeca","judecaserati":"judeca","judecasesi":"judeca","judecasi":"judeca","judecat":"judeca","judecata":["judecată","judecat","judecata","judecat"],"judecate":"judecat","judecatele":"judecat","judecati":["judecați","judeca","judecați","judecat","judecăți","judecată"],"judecatii":"judecat","judecatoarea":"judecătoare","judecatoarei":"judecătoare","judecatoarele":"judecătoare","judecatoarelor":"judecătoare","judecatorasi":"judecătoraș","judecatorasii":"judecătoraș","judecatorasilor":"judecătoraș","judecatorasul":"judecătoraș","judecatorasule":"judecătoraș","judecatorasului":"judecătoraș","judecatoreasca":["judecătorească","judecătoresc","judecătoreasca","judecătoresc"],"judecatorescul":"judecătoresc","judecatorese":"judecătoreasă","judecatoresei":"judecătoreasă","judecatoresele":"judecătoreasă","judecatoreselor":"judecătoreasă","judecatoresti":"judecătoresc","judecatorestii":"judecătoresc","judecatorestile":"judecătoresc","judecatori":["judecători","judecător","judecători","judecătoriu"],"judecatoria":"judecătorie","judecatoriei":"judecătorie","judecatorii":["judecătorii","judecător","judecătorii","judecătorie","judecătorii","judecătoriu"],"judecatoriile":"judecătorie","judecatoriilor":"judecătorie","judecatorilor":["judecătorilor","judecător","judecătorilor","judecătoriu"],"judecatorite":"judecătoriță","judecatoritei":"judecătoriță","judecatoritele":"judecătoriță","judecatoritelor":"judecătoriță","judecatoriuul":"judecătoriu","judecatoriuule":"judecătoriu","judecatoriuului":"judecătoriu","judecatorul":"judecător","judecatorule":"judecător","judecatorului":"judecător","judecatul":"judecat","judecau":"judeca","judece":"judeca","judecea":"judeci","judeceai":"judeci","judeceam":"judeci","judeceati":"judeci","judeceau":"judeci","judecesc":"judeci","judecese":"judeceasă","judecesei":"judeceasă","judecesele":"judeceasă","judeceselor":"judeceasă","judeceste":"judeci","judecesti":"judeci","judeci":["judeci","judec","judeci","judeca"],"judecia":"judecie","judeciei":"judecie","judecii":["judecii","judeci","judecii","judecie"],"judeciile":"judecie","judeciilor":"judecie","judecim":"judeci","judecind":"judeci","judecira":"judeci","judeciram":"judeci","judecirati":"judeci","judecirea":"judecire","judecirei":"judecire","judecise":"judeci","judecisem":"judeci","judecisera":"judeci","judeciseram":"judeci","judeciserati":"judeci","judecisesi":"judeci","judecisi":"judeci","judecit":"judeci","judeciti":"judeci","judele":"jude","judelui":"jude","judete":"județ","judeteana":["județeană","județean","județeana","județean"],"judeteanul":"județean","judetele":"județ","judetelor":"județ","judetene":"județean","judetenele":"județean","judeteni":"județean","judetenii":"județean","judetese":"județeasă","judetesei":"județeasă","judetesele":"județeasă","judeteselor":"județeasă","judetul":"județ","judetule":"județ","judetului":"județ","judiciara":["judiciară","judiciar","judiciara","judiciar"],"judiciare":"judiciar","judiciarele":"judiciar","judiciari":"judiciar","judiciarii":"judiciar","judiciarul":"judiciar","judicioasa":["judicioasă","judicios","judicioasa","judicios"],"judicioase":"judicios","judicioasele":"judicios","judiciosi":"judicios","judiciosii":"judicios","judiciosul":"judicios","judiciozitatea":"judiciozitate","judiciozitati":"judiciozitate","judiciozitatii":"judiciozitate","judiciozitatile":"judiciozitate","judiciozitatilor":"judiciozitate","judokai":"judoka","judokalor":"judoka","judokaul":"judoka","judokaule":"judoka","judokaului":"judoka","judoul":"judo","judoule":"judo","judoului":"judo","jufe":"jufă","jufei":"jufă","jufele":"jufă","jufelor":"jufă","jugalita":["jugălită","jugălit","jugălita","jugălit"],"jugalite":"jugălit","jugalitele":"jugălit","jugaliti":"jugălit","jugalitii":"jugălit","jugalitul":"jugălit","juganari":"jugănar","juganarii":"jugănar","juganarilor":"jugănar","juganarul":"jugănar","juganarule":"jugănar","juganarului":"jugănar","juganasi":"jugănaș","juganasii":"jugănaș","juganasilor":"jugănaș","juganasul":"jugănaș","juganasule":"jugănaș","juganasului":"jugănaș","juganea":"jugăni","juganeai":"jugăni","juganeam":"jugăni","juganeati":"jugăni","juganeau":"jugăni","juganei":"jugănel","juganeii":"jugănel","juganeilor":"jugănel","juganele":"jugăneală","juganelei":"jugăneală","juganelele":"jugăneală","juganelelor":"jugăneală","juganeli":"jugăneală","juganelul":"jugănel","juganelule":"jugănel","juganelului":"jugănel","juganesc":"jugăni","juganeste":"jugăni","juganesti":"jugăni","jugani":"jugan","juganii":["juganii","jugan","jugănii","jugăni"],"juganilor":"jugan","juganim":"jugăni","juganind":"jugăni","juganira":"jugăni","juganiram":"jugăni","juganirati":"jugăni","juganirea":"jugănire","juganiri":"jugănire","juganirii":"jugănire","juganise":"jugăni","juganisem":"jugăni","juganisera":"jugăni","juganiseram":"jugăni","juganiserati":"jugăni","juganisesi":"jugăni","juganisi":"jugăni","juganit":"jugăni","juganita":["jugănită","jugănit","jugănita","jugănit"],"juganite":"jugănit","juganitele":"jugănit","juganiti":["jugăniți","jugăni","jugăniți","jugănit"],"juganitii":"jugănit","juganitul":"jugănit","juganul":"jugan","juganule":"jugan","juganului":"jugan","jugara":["jugară","jugar","jugara","jugar"],"jugare":["jugare","jugar","jugăre","jugăr"],"jugarei":"jugărel","jugareii":"jugărel","jugareilor":"jugărel","jugarele":["jugarele","jugar","jugărele","jugăr"],"jugarelor":"jugăr","jugarelul":"jugărel","jugarelule":"jugărel","jugarelului":"jugărel","jugareti":"jugăreț","jugaretii":"jugăreț","jugaretilor":"jugăreț","jugaretul":"jugăreț","jugaretule":"jugăreț","jugaretului":"jugăreț","jugari":"jugar","jugarii":"jugar","jugarilor":"jugar","jugaritul":"jugărit","jugaritule":"jugărit","jugaritului":"jugărit","jugarul":["jugarul","jugar","jugărul","jugăr"],"jugarule":["jugarule","jugar","jugărule","jugăr"],"jugarului":["jugarului","jugar","jugărului","jugăr"],"jugasi":"jugaș","jugasii":"jugaș","jugasilor":"jugaș","jugastri":"jugastru","jugastrii":"jugastru","jugastrilor":"jugastru","jugastrul":"jugastru","jugastrule":"jugastru","jugastrului":"jugastru","jugasul":"jugaș","jugasule":"jugaș","jugasului":"jugaș","jugendstilul":"jugendstil","jugendstilule":"jugendstil","jugendstilului":"jugendstil","jughilani":"jughilan","jughilanii":"jughilan","jughilanilor":"jughilan","jughilanul":"jughilan","jughilanule":"jughilan","jughilanului":"jughilan","juglai":"juglău","juglaile":"juglău","juglailor":"juglău","juglauul":"juglău","juglauule":"juglău","juglauului":"juglău","jugul":"jug","jugulai":"jugula","jugulam":["jugulăm","jugula","jugulam","jugula"],"juguland":"jugula","jugulara":["jugulară","jugula","jugulară","jugular","jugulara","jugular"],"jugularam":"jugula","jugularati":"jugula","jugulare":["jugulare","jugular","jugulare","jugulară"],"jugularea":"jugulare","jugularei":"jugulară","jugularele":["jugularele","jugular","jugularele","jugulară"],"jugularelor":"jugulară","jugulari":["jugulari","jugular","jugulări","jugulare"],"jugularii":["jugularii","jugular","jugulării","jugulare"],"jugularile":"jugulare","jugularilor":"jugulare","jugularul":"jugular","jugulase":"jugula","jugulasem":"jugula","jugulasera":"jugula","jugulaseram":"jugula","jugulaserati":"jugula","jugulasesi":"jugula","jugulasi":"jugula","jugulat":"jugula","jugulati":"jugula","jugulau":"jugula","jugule":"jug","juguleaza":"jugula","juguleti":"juguleț","juguletile":"juguleț","juguletilor":"juguleț","juguletul":"juguleț","juguletule":"juguleț","juguletului":"juguleț","jugulez":"jugula","jugulezi":"jugula","jugului":"jug","juguluirea":"juguluire","juguluiri":"juguluire","juguluirii":"juguluire","juguluirile":"juguluire","juguluirilor":"juguluire","jugurei":"jugurel","jugureii":"jugurel","jugureilor":"jugurel","jugurelul":"jugurel","jugurelule":"jugurel","jugurelului":"jugurel","jugureti":"jugureț","juguretii":"jugureț","juguretilor":"jugureț","juguretul":"jugureț","juguretule":"jugureț","juguretului":"jugureț","juguri":"jug","jugurile":"jug","jugurilor":"jug","jugusoare":"jugușor","jugusoarele":"jugușor","jugusoarelor":"jugușor","jugusorul":"jugușor","jugusorule":"jugușor","jugusorului":"jugușor","jugute":"juguț","jugutele":"juguț","jugutelor":"juguț","jugutul":"juguț","jugutule":"juguț","jugutului":"juguț","juhate":"juhăt","juhatele":"juhăt","juhatelor":"juhăt","juhatul":"juhăt","juhatule":"juhăt","juhatului":"juhăt","juisai":"juisa","juisam":["juisăm","juisa","juisam","juisa"],"juisand":"juisa","juisara":"juisa","juisaram":"juisa","juisarati":"juisa","juisarea":"juisare","juisari":"juisare","juisarii":"juisare","juisarile":"juisare","juisarilor":"juisare","juisase":"juisa","juisasem":"juisa","juisasera":"juisa","juisaseram":"juisa","juisaserati":"juisa","juisasesi":"juisa","juisasi":"juisa","juisat":"juisa","juisati":"juisa","juisau":"juisa","juiseaza":"juisa","juisez":"juisa","juisezi":"juisa","juisoarea":"juisoare","juisoarei":"juisoare","juisoarele":"juisoare","juisoarelor":"juisoare","jujaie":"jujău","jujaiele":"jujău","jujaielor":"jujău","jujauul":"jujău","jujauule":"jujău","jujauului":"jujău","jujeie":"jujeu","jujeiele":"jujeu","jujeielor":"jujeu","jujeul":"jujeu","jujeule":"jujeu","jujeului":"jujeu","jujube":"jujubă","jujubei":"jujubă","jujubele":"jujubă","jujubelor":"jujubă","jujubi":"jujub","jujubieri":"jujubier","jujubierii":"jujubier","jujubierilor":"jujubier","jujubierul":"jujubier","jujubierule":"jujubier","jujubierului":"jujubier","jujubii":"jujub","jujubilor":"jujub","jujubul":"jujub","jujubule":"jujub","jujubului":"jujub","julea":"juli","juleai":"juli","juleam":"juli","juleati":"juli","juleau":"juli","julepul":"julep","julepule":"julep","julepului":"julep","julepuri":"julep","julepurile":"julep","julepurilor":"julep","julesc":"juli","juleste":"juli","julesti":"juli","julfe":"julfă","julfei":"julfă","julfele":"julfă","julfelor":"julfă","julii":"juli","julim":"juli","julind":"juli","julira":"juli","juliram":"juli","julirati":"juli","julirea":"julire","juliri":"julire","julirii":"julire","julirile":"julire","julirilor":"julire","julise":"juli","julisem":"juli","julisera":"juli","juliseram":"juli","juliserati":"juli","julisesi":"juli","julisi":"juli","julit":"juli","julita":["julită","julit","julita","julit"],"julite":"julit","julitele":"julit","juliti":["juliți","juli","juliți","julit"],"julitii":"julit","julitul":"julit","juliture":"julitură","juliturei":"julitură","juliturele":"julitură","juliturelor":"julitură","julituri":"julitură","jumaltul":"jumalț","jumaltule":"jumalț","jumaltului":"jumalț","jumalturi":"jumalț","jumalturile":"jumalț","jumalturilor":"jumalț","jumarca":"jumară","jumari":"jumară","jumarii":"jumară","jumarile":"jumară","jumarilor":"jumară"};
@@ -0,0 +1 @@
+export default {"jumatatea":["jumătatea","jumătate","jumătățea","jumătăți"],"jumatateai":"jumătăți","jumatateam":"jumătăți","jumatateati":"jumătăți","jumatateau":"jumătăți","jumatatesc":"jumătăți","jumatateste":"jumătăți","jumatatesti":"jumătăți","jumatati":"jumătate","jumatati de masura":"jumătate de măsură","jumatatii":["jumătății","jumătate","jumătății","jumătăți"],"jumatatile":"jumătate","jumatatilor":"jumătate","jumatatim":"jumătăți","jumatatind":"jumătăți","jumatatira":"jumătăți","jumatatiram":"jumătăți","jumatatirati":"jumătăți","jumatatirea":"jumătățire","jumatatiri":"jumătățire","jumatatirii":"jumătățire","jumatatirile":"jumătățire","jumatatirilor":"jumătățire","jumatatise":"jumătăți","jumatatisem":"jumătăți","jumatatisera":"jumătăți","jumatatiseram":"jumătăți","jumatatiserati":"jumătăți","jumatatisesi":"jumătăți","jumatatisi":"jumătăți","jumatatit":"jumătăți","jumatatiti":"jumătăți","jumatatitul":"jumătățit","jumatatitule":"jumătățit","jumatatitului":"jumătățit","jumate":"jumătate","jumatea":"jumate","jumati":"jumate","jumatii":"jumate","jumatile":"jumate","jumatilor":"jumate","jumele":"jumelă","jumelei":"jumelă","jumelele":"jumelă","jumelelor":"jumelă","jumulea":"jumuli","jumuleai":"jumuli","jumuleam":"jumuli","jumuleati":"jumuli","jumuleau":"jumuli","jumulele":"jumuleală","jumulelei":"jumuleală","jumulelele":"jumuleală","jumulelelor":"jumuleală","jumuleli":"jumuleală","jumulesc":"jumuli","jumuleste":"jumuli","jumulesti":"jumuli","jumulii":"jumuli","jumulim":"jumuli","jumulind":"jumuli","jumulira":"jumuli","jumuliram":"jumuli","jumulirati":"jumuli","jumulirea":"jumulire","jumuliri":"jumulire","jumulirii":"jumulire","jumulirile":"jumulire","jumulirilor":"jumulire","jumulise":"jumuli","jumulisem":"jumuli","jumulisera":"jumuli","jumuliseram":"jumuli","jumuliserati":"jumuli","jumulisesi":"jumuli","jumulisi":"jumuli","jumulit":"jumuli","jumulita":["jumulită","jumulit","jumulita","jumulit"],"jumulite":"jumulit","jumulitele":"jumulit","jumuliti":["jumuliți","jumuli","jumuliți","jumulit"],"jumulitii":"jumulit","jumulitul":"jumulit","juna":["jună","june","juna","june"],"juncalai":"juncălău","juncalaii":"juncălău","juncalailor":"juncălău","juncalauul":"juncălău","juncalauule":"juncălău","juncalauului":"juncălău","juncanasi":"juncănaș","juncanasii":"juncănaș","juncanasilor":"juncănaș","juncanasul":"juncănaș","juncanasule":"juncănaș","juncanasului":"juncănaș","juncance":"juncancă","juncancei":"juncancă","juncancele":"juncancă","juncancelor":"juncancă","juncane":"juncană","juncanei":["juncanei","juncană","juncănei","juncănel"],"juncaneii":"juncănel","juncaneilor":"juncănel","juncanele":"juncană","juncanelor":"juncană","juncanelul":"juncănel","juncanelule":"juncănel","juncanelului":"juncănel","juncani":"juncan","juncanii":"juncan","juncanilor":"juncan","juncanul":"juncan","juncanule":"juncan","juncanului":"juncan","junci":["junci","junc","junci","juncă"],"juncii":["juncii","junc","juncii","juncă"],"juncile":"juncă","juncilor":["juncilor","junc","juncilor","juncă"],"juncturi":"junctură","juncturii":"junctură","juncturile":"junctură","juncturilor":"junctură","juncul":"junc","juncule":"junc","junculeanul":"junculean","junculeanule":"junculean","junculeanului":"junculean","junculeni":"junculean","junculenii":"junculean","junculenilor":"junculean","juncului":"junc","juncusori":"juncușor","juncusorii":"juncușor","juncusorilor":"juncușor","juncusorul":"juncușor","juncusorule":"juncușor","juncusorului":"juncușor","juncute":"juncuță","juncutei":"juncuță","juncutele":"juncuță","juncutelor":"juncuță","juncuti":"juncuț","juncutii":"juncuț","juncutilor":"juncuț","juncutul":"juncuț","juncutule":"juncuț","juncutului":"juncuț","june":"jună","junecuti":"junecuț","junecutii":"junecuț","junecutilor":"junecuț","junecutul":"junecuț","junecutule":"junecuț","junecutului":"junecuț","junei":["junei","jună","junei","junel"],"juneii":"junel","juneilor":"junel","junelasi":"junelaș","junelasii":"junelaș","junelasilor":"junelaș","junelasul":"junelaș","junelasule":"junelaș","junelasului":"junelaș","junele":["junele","jună","junele","june"],"junelor":"jună","junelui":"june","junelul":"junel","junelule":"junel","junelului":"junel","junetea":"junețe","juneti":["juneți","juneță","juneți","junețe"],"junetii":["juneții","juneță","juneții","junețe"],"junetile":["junețile","juneță","junețile","junețe"],"junetilor":["juneților","juneță","juneților","junețe"],"junghere":"jungher","junghete":"junghet","junghetele":"junghet","junghetelor":"junghet","junghetul":"junghet","junghetule":"junghet","junghetului":"junghet","junghetura":"junghietură","jungheturi":"junghetură","jungheturii":"junghetură","jungheturile":"junghetură","jungheturilor":"junghetură","junghiai":"junghia","junghiam":"junghia","junghiara":"junghia","junghiaram":"junghia","junghiarati":"junghia","junghiase":"junghia","junghiasem":"junghia","junghiasera":"junghia","junghiaseram":"junghia","junghiaserati":"junghia","junghiasesi":"junghia","junghiasi":"junghia","junghiat":"junghia","junghiati":"junghia","junghiau":"junghia","junghie":"junghia","junghiem":"junghia","junghierea":"junghiere","junghieri":"junghiere","junghierii":"junghiere","junghierile":"junghiere","junghierilor":"junghiere","junghietoare":"junghietor","junghietoarea":"junghietor","junghietoarele":"junghietor","junghietori":"junghietor","junghietorii":"junghietor","junghietorul":"junghietor","junghieturi":"junghietură","junghieturii":"junghietură","junghieturile":"junghietură","junghieturilor":"junghietură","junghii":"junghia","junghiind":"junghia","junghiu":"junghi","junghiulete":"junghiuleț","junghiuletele":"junghiuleț","junghiuletelor":"junghiuleț","junghiuletul":"junghiuleț","junghiuletule":"junghiuleț","junghiuletului":"junghiuleț","junghiuri":"junghi","jungle":"junglă","junglei":"junglă","junglele":"junglă","junglelor":"junglă","juni":"june","juni primi":"june prim","junia":"junie","junice":"junincă","junicea":"junice","junici":["junici","junică","junici","junice"],"junicii":["junicii","junică","junicii","junice"],"junicile":["junicile","junică","junicile","junice"],"junicilor":["junicilor","junică","junicilor","junice"],"juniei":"junie","junigasi":"junigaș","junigasii":"junigaș","junigasilor":"junigaș","junigasul":"junigaș","junigasule":"junigaș","junigasului":"junigaș","junii":["junii","june","junii","junie"],"junilor":"june","junimea":"junime","junimi":"junime","junimii":"junime","junimile":"junime","junimilor":"junime","junimismul":"junimism","junimismule":"junimism","junimismului":"junimism","junimiste":"junimistă","junimistei":"junimistă","junimistele":"junimistă","junimistelor":"junimistă","juninceaua":"junincea","junincele":"junincea","junincelei":"junincea","junincelele":"junincea","junincelelor":"junincea","juninci":"junincă","junincii":"junincă","junincile":"junincă","junincilor":"junincă","junincute":"junincuță","junincutei":"junincuță","junincutele":"junincuță","junincutelor":"junincuță","junioare":"junioară","junioarei":"junioară","junioarele":"junioară","junioarelor":"junioară","juniora":["junioră","junior","juniora","junior"],"junioratul":"juniorat","junioratule":"juniorat","junioratului":"juniorat","juniore":"junior","juniorele":"junior","juniori":"junior","juniorii":"junior","juniorilor":"junior","juniorul":"junior","juniorule":"junior","juniorului":"junior","junisani":"junișan","junisanii":"junișan","junisanilor":"junișan","junisanul":"junișan","junisanule":"junișan","junisanului":"junișan","junisori":"junișor","junisorii":"junișor","junisorilor":"junișor","junisorul":"junișor","junisorule":"junișor","junisorului":"junișor","junte":"juntă","juntei":"juntă","juntele":"juntă","juntelor":"juntă","juntul":"junt","juntule":"junt","juntului":"junt","junturi":"junt","junturile":"junt","junturilor":"junt","jupaituri":"jupăitură","jupaiturii":"jupăitură","jupaiturile":"jupăitură","jupaiturilor":"jupăitură","jupane":"jupână","jupanei":"jupână","jupanele":"jupână","jupanelor":"jupână","jupanese":"jupâneasă","jupanesei":"jupâneasă","jupanesele":["jupânesele","jupâneasă","jupâneșele","jupâneșică"],"jupaneselor":"jupâneasă","jupanesice":"jupâneșică","jupanesicei":"jupâneșică","jupanesicele":"jupâneșică","jupanesicelor":"jupâneșică","jupani":["jupani","jupan","jupâni","jupân"],"jupanii":["jupanii","jupan","jupânii","jupân"],"jupanilor":["jupanilor","jupan","jupânilor","jupân"],"jupanite":["jupanițe","jupaniță","jupânițe","jupâniță"],"jupanitei":["jupaniței","jupaniță","jupâniței","jupâniță"],"jupanitele":["jupanițele","jupaniță","jupânițele","jupâniță"],"jupanitelor":["jupanițelor","jupaniță","jupânițelor","jupâniță"],"jupanul":["jupanul","jupan","jupânul","jupân"],"jupanule":["jupanule","jupan","jupânule","jupân"],"jupanului":["jupanului","jupan","jupânului","jupân"],"jupe":"jupă","jupea":"jupi","jupeai":"jupi","jupeam":"jupi","jupeati":"jupi","jupeau":"jupi","jupei":"jupă","jupele":"jupă","jupelor":"jupă","jupesc":"jupi","jupeste":"jupi","jupesti":"jupi","jupi":"jupui","jupii":"jupi","jupim":"jupi","jupind":"jupi","jupira":"jupi","jupiram":"jupi","jupirati":"jupi","jupirea":"jupire","jupiri":"jupire","jupirii":"jupire","jupirile":"jupire","jupirilor":"jupire","jupise":"jupi","jupisem":"jupi","jupisera":"jupi","jupiseram":"jupi","jupiserati":"jupi","jupisesi":"jupi","jupisi":"jupi","jupit":"jupi","jupita":["jupită","jupit","jupita","jupit"],"jupite":"jupit","jupitele":"jupit","jupiti":["jupiți","jupi","jupiți","jupit"],"jupitii":"jupit","jupitoarea":"jupitoare","jupitoarei":"jupitoare","jupitoarele":"jupitoare","jupitoarelor":"jupitoare","jupitori":"jupitor","jupitorii":"jupitor","jupitorilor":"jupitor","jupitorul":"jupitor","jupitorule":"jupitor","jupitorului":"jupitor","jupitul":"jupit","jupoaie":"jupui","jupoane":"jupon","jupoi":"jupui","jupuia":"jupui","jupuiai":"jupui","jupuiam":"jupui","jupuiati":"jupui","jupuiau":"jupui","jupuieli":"jupuială","jupuielii":"jupuială","jupuielile":"jupuială","jupuielilor":"jupuială","jupuii":"jupui","jupuim":"jupui","jupuind":"jupui","jupuira":"jupui","jupuiram":"jupui","jupuirati":"jupui","jupuirea":"jupuire","jupuiri":"jupuire","jupuirii":"jupuire","jupuirile":"jupuire","jupuirilor":"jupuire","jupuise":"jupui","jupuisem":"jupui","jupuisera":"jupui","jupuiseram":"jupui","jupuiserati":"jupui","jupuisesi":"jupui","jupuisi":"jupui","jupuit":"jupui","jupuita":["jupuită","jupuit","jupuita","jupuit"],"jupuite":"jupuit","jupuitele":"jupuit","jupuiti":["jupuiți","jupui","jupuiți","jupuit"],"jupuitii":"jupuit","jupuitoarea":"jupuitoare","jupuitoarei":"jupuitoare","jupuitoarele":"jupuitoare","jupuitoarelor":"jupuitoare","jupuitori":"jupuitor","jupuitorii":"jupuitor","jupuitorilor":"jupuitor","jupuitorul":"jupuitor","jupuitorule":"jupuitor","jupuitorului":"jupuitor","jupuitul":"jupuit","jupuiture":"jupuitură","jupuiturei":"jupuitură","jur":"jura","jurai":"jura","juram":["jurăm","jura","juram","jura"],"juramantul":"jurământ","juramantule":"jurământ","juramantului":"jurământ","juramint":"jurământ","juraminte":"jurământ","juramintele":"jurământ","juramintelor":"jurământ","jurand":"jura","jurara":"jura","juraram":"jura","jurarati":"jura","jurarea":"jurare","jurari":"jurare","jurarii":"jurare","jurarile":"jurare","jurarilor":"jurare","jurase":"jura","jurasem":"jura","jurasera":"jura","juraseram":"jura","juraserati":"jura","jurasesi":"jura","jurasi":"jura","jurasici":"jurasic","jurasicile":"jurasic","jurasicilor":"jurasic","jurasicul":"jurasic","jurasicule":"jurasic","jurasicului":"jurasic","jurat":"jura","jurata":["jurată","jurat","jurata","jurat"],"jurate":"jurat","juratei":"jurățel","jurateii":"jurățel","jurateilor":"jurățel","juratele":"jurat","juratelul":"jurățel","juratelule":"jurățel","juratelului":"jurățel","jurati":["jurați","jura","jurați","jurat"],"juratii":"jurat","juratoarea":"jurătoare","juratoarei":"jurătoare","juratoarele":"jurătoare","juratoarelor":"jurătoare","juratori":"jurător","juratul":"jurat","juraturi":"jurătură","juraturii":"jurătură","juraturile":"jurătură","juraturilor":"jurătură","jurau":"jura","jure":"jura","juri":"jura","juridica":["juridică","juridic","juridica","juridic"],"juridice":"juridic","juridicele":"juridic","juridici":"juridic","juridicii":"juridic","juridictiunea":"juridicțiune","juridictiuni":"juridicțiune","juridictiunii":"juridicțiune","juridictiunile":"juridicțiune","juridictiunilor":"juridicțiune","juridicul":"juridic","jurii":"juriu","jurisconsulte":"jurisconsultă","jurisconsultei":"jurisconsultă","jurisconsultele":"jurisconsultă","jurisconsultelor":"jurisconsultă","jurisconsulti":"jurisconsult","jurisconsultii":"jurisconsult","jurisconsultilor":"jurisconsult","jurisconsultul":"jurisconsult","jurisconsultule":"jurisconsult","jurisconsultului":"jurisconsult","jurisdictii":"jurisdicție","jurisdictionala":["jurisdicțională","jurisdicțional","jurisdicționala","jurisdicțional"],"jurisdictionale":"jurisdicțional","jurisdictionalele":"jurisdicțional","jurisdictionali":"jurisdicțional","jurisdictionalii":"jurisdicțional","jurisdictionalul":"jurisdicțional","jurisdictiune":"jurisdicție","jurisdictiunea":"jurisdicțiune","jurisdictiuni":"jurisdicțiune","jurisdictiunii":"jurisdicțiune","jurisdictiunile":"jurisdicțiune","jurisdictiunilor":"jurisdicțiune","jurisprudente":"jurisprudență","jurisprudentei":"jurisprudență","jurisprudentele":"jurisprudență","jurisprudentelor":"jurisprudență","jurisprudentiala":["jurisprudențială","jurisprudențial","jurisprudențiala","jurisprudențial"],"jurisprudentiale":"jurisprudențial","jurisprudentialele":"jurisprudențial","jurisprudentiali":"jurisprudențial","jurisprudentialii":"jurisprudențial","jurisprudentialul":"jurisprudențial","juriste":"juristă","juristei":"juristă","juristele":"juristă","juristelor":"juristă","juristi":"jurist","juristii":"jurist","juristilor":"jurist","juristul":"jurist","juristule":"jurist","juristului":"jurist","jurizai":"juriza","jurizam":["jurizăm","juriza","jurizam","juriza"],"jurizand":"juriza","jurizara":"juriza","jurizaram":"juriza","jurizarati":"juriza","jurizarea":"jurizare","jurizari":"jurizare","jurizarii":"jurizare","jurizarile":"jurizare","jurizarilor":"jurizare","jurizase":"juriza","jurizasem":"juriza","jurizasera":"juriza","jurizaseram":"juriza","jurizaserati":"juriza","jurizasesi":"juriza","jurizasi":"juriza","jurizat":"juriza","jurizati":"juriza","jurizau":"juriza","jurizeaza":"juriza","jurizez":"juriza","jurizezi":"juriza","jurnale":"jurnal","jurnale de bord":"jurnal de bord","jurnalele":"jurnal","jurnalelor":"jurnal","jurnaliera":["jurnalieră","jurnalier","jurnaliera","jurnalier"],"jurnaliere":"jurnalier","jurnalierele":"jurnalier","jurnalieri":"jurnalier","jurnalierii":"jurnalier","jurnalierul":"jurnalier","jurnalisme":"jurnalism","jurnalismele":"jurnalism","jurnalismelor":"jurnalism","jurnalismul":"jurnalism","jurnalismule":"jurnalism","jurnalismului":"jurnalism","jurnaliste":"jurnalistă","jurnalistei":"jurnalistă","jurnalistele":"jurnalistă","jurnalistelor":"jurnalistă","jurnalisti":"jurnalist","jurnalisti sportivi":"jurnalist sportiv","jurnalistica":["jurnalistică","jurnalistic","jurnalistica","jurnalistic"],"jurnalistice":"jurnalistic","jurnalisticele":"jurnalistic","jurnalistici":["jurnalistici","jurnalistic","jurnalistici","jurnalistică"],"jurnalisticii":["jurnalisticii","jurnalistic","jurnalisticii","jurnalistică"],"jurnalisticul":"jurnalistic","jurnalistii":"jurnalist","jurnalistilor":"jurnalist","jurnalistul":"jurnalist","jurnalistule":"jurnalist","jurnalistului":"jurnalist","jurnalul":"jurnal","jurnalule":"jurnal","jurnalului":"jurnal","juruia":"jurui","juruiai":"jurui","juruiam":"jurui","juruiati":"jurui","juruiau":"jurui","juruiesc":"jurui","juruieste":"jurui","juruiesti":"jurui","juruii":"jurui","juruim":"jurui","juruind":"jurui","juruinte":"juruință","juruintei":"juruință","juruira":"jurui","juruiram":"jurui","juruirati":"jurui","juruise":"jurui","juruisem":"jurui","juruisera":"jurui","juruiseram":"jurui","juruiserati":"jurui","juruisesi":"jurui","juruisi":"jurui","juruit":"jurui","juruite":"juruită","juruitei":"juruită","juruitele":"juruită","juruitelor":"juruită","juruiti":"jurui","jurul":"jur","jurule":"jur","jurului":"jur","jururi":"jur","jururile":"jur","jururilor":"jur","justa":["justă","just","justa","just"],"juste":"just","justele":"just","justete":"justeță","justetea":"justețe","justetei":"justeță","justetele":"justeță","justetelor":"justeță","justeti":"justețe","justetii":"justețe","justi":"just","justific":"justifica","justificabila":["justificabilă","justificabil","justificabila","justificabil"],"justificabile":"justificabil","justificabilele":"justificabil","justificabili":"justificabil","justificabilii":"justificabil","justificabilul":"justificabil","justificai":"justifica","justificam":["justificăm","justifica","justificam","justifica"],"justificand":"justifica","justificara":"justifica","justificaram":"justifica","justificarati":"justifica","justificari":"justificare","justificase":"justifica","justificasem":"justifica","justificasera":"justifica","justificaseram":"justifica","justificaserati":"justifica","justificasesi":"justifica","justificasi":"justifica","justificat":"justifica","justificata":["justificată","justificat","justificata","justificat"],"justificate":"justificat","justificatele":"justificat","justificati":["justificați","justifica","justificați","justificat"],"justificatia":"justificație","justificatiei":"justificație","justificatii":["justificații","justificat","justificații","justificație"],"justificatiile":"justificație","justificatiilor":"justificație","justificatiunea":"justificațiune","justificatiuni":"justificațiune","justificatiunii":"justificațiune","justificatiunile":"justificațiune","justificatiunilor":"justificațiune","justificativa":["justificativă","justificativ","justificativa","justificativ"],"justificative":"justificativ","justificativele":"justificativ","justificativi":"justificativ","justificativii":"justificativ","justificativul":"justificativ","justificatoare":"justificator","justificatoarea":"justificator","justificatoarele":"justificator","justificatori":"justificator","justificatorii":"justificator","justificatorul":"justificator","justificatul":"justificat","justificau":"justifica","justifice":"justifica","justifici":"justifica","justii":"just","justitia":"justiție","justitiabile":"justițiabilă","justitiabilei":"justițiabilă","justitiabilele":"justițiabilă","justitiabilelor":"justițiabilă","justitiabili":"justițiabil","justitiabilii":"justițiabil","justitiabililor":"justițiabil","justitiabilul":"justițiabil","justitiabilule":"justițiabil","justitiabilului":"justițiabil","justitiala":["justițială","justițial","justițiala","justițial"],"justitiale":"justițial","justitialele":"justițial","justitiali":"justițial","justitialii":"justițial","justitialul":"justițial","justitiara":["justițiară","justițiar","justițiara","justițiar"],"justitiare":"justițiar","justitiarele":"justițiar","justitiari":"justițiar","justitiarii":"justițiar","justitiarul":"justițiar","justitiei":"justiție","justitii":"justiție","justul":"just","juvaer":"giuvaier","juvaiere":"juvaier","juvaierele":"juvaier","juvaierelor":"juvaier","juvaierul":"juvaier","juvaierule":"juvaier","juvaierului":"juvaier","juvale":"juvală","juvalei":"juvală","juvalele":"juvală","juvalelor":"juvală","juvatul":"juvăț","juvatule":"juvăț","juvatului":"juvăț","juvenila":["juvenilă","juvenil","juvenila","juvenil"],"juvenile":"juvenil","juvenilele":"juvenil","juvenili":"juvenil","juvenilii":"juvenil","juvenilitatea":"juvenilitate","juvenilitati":"juvenilitate","juvenilitatii":"juvenilitate","juvenilitatile":"juvenilitate","juvenilitatilor":"juvenilitate","juvenilul":"juvenil","juvete":"juvăț","juvetele":["juvețele","juvăț","juvetele","juvete"],"juvetelor":"juvăț","juvetelui":"juvete","juveti":"juvete","juvetii":"juvete","juvetilor":"juvete","juvine":"juvină","juvinei":"juvină","juvinele":"juvină","juvinelor":"juvină","juxtalineara":["juxtalineară","juxtalinear","juxtalineara","juxtalinear"],"juxtalineare":"juxtalinear","juxtalinearele":"juxtalinear","juxtalineari":"juxtalinear","juxtalinearii":"juxtalinear","juxtalinearul":"juxtalinear","juxtaliniare":"juxtaliniară","juxtaliniarele":"juxtaliniară","juxtapozitia":"juxtapoziție","juxtapozitiei":"juxtapoziție","juxtapozitii":"juxtapoziție","juxtapozitiile":"juxtapoziție","juxtapozitiilor":"juxtapoziție","juxtapozitiunea":"juxtapozițiune","juxtapozitiuni":"juxtapozițiune","juxtapozitiunii":"juxtapozițiune","juxtapozitiunile":"juxtapozițiune","juxtapozitiunilor":"juxtapozițiune","juxtapui":"juxtapune","juxtapun":"juxtapune","juxtapuna":"juxtapune","juxtapunand":"juxtapune","juxtapunea":"juxtapune","juxtapuneai":"juxtapune","juxtapuneam":"juxtapune","juxtapuneati":"juxtapune","juxtapuneau":"juxtapune","juxtapunem":"juxtapune","juxtapunerea":"juxtapunere","juxtapuneri":"juxtapunere","juxtapunerii":"juxtapunere","juxtapunerile":"juxtapunere","juxtapunerilor":"juxtapunere","juxtapuneti":"juxtapune","juxtapus":"juxtapune","juxtapusa":["juxtapusă","juxtapus","juxtapusa","juxtapus"],"juxtapuse":["juxtapuse","juxtapune","juxtapuse","juxtapus"],"juxtapusei":"juxtapune","juxtapusele":"juxtapus","juxtapusera":"juxtapune","juxtapuseram":"juxtapune","juxtapuserati":"juxtapune","juxtapusese":"juxtapune","juxtapusesem":"juxtapune","juxtapusesera":"juxtapune","juxtapuseseram":"juxtapune","juxtapuseserati":"juxtapune","juxtapusesesi":"juxtapune","juxtapusesi":"juxtapune","juxtapusi":"juxtapus","juxtapusii":"juxtapus","juxtapusul":"juxtapus","juzi":"jude","juzii":"jude","juzilor":"jude","jvartul":"jvarț","jvartule":"jvarț","jvartului":"jvarț","jvarturi":"jvarț","jvarturile":"jvarț","jvarturilor":"jvarț"};
@@ -0,0 +1 @@
+export default {"kabile":"kabilă","kabilei":"kabilă","kabilele":"kabilă","kabilelor":"kabilă","kabili":"kabil","kabilii":"kabil","kabililor":"kabil","kabilul":"kabil","kabilule":"kabil","kabilului":"kabil","kabukiul":"kabuki","kabukiule":"kabuki","kabukiului":"kabuki","kainite":"kainit","kainitele":"kainit","kainitelor":"kainit","kainitul":"kainit","kainitule":"kainit","kainitului":"kainit","kaizeri":"kaizer","kaizerii":"kaizer","kaizerilor":"kaizer","kaizerul":"kaizer","kaizerule":"kaizer","kaizerului":"kaizer","kakemonoul":"kakemono","kakemonoule":"kakemono","kakemonoului":"kakemono","kakia":"kakiu","kakie":"kakiu","kakii":"kakiu","kakiii":"kakiu","kakiile":"kakiu","kakiul":["kakiul","kaki","kakiul","kakiu"],"kakiule":"kaki","kakiului":"kaki","kala-azarul":"kala-azar","kala-azarule":"kala-azar","kala-azarului":"kala-azar","kalasnikovul":"kalașnikov","kalasnikovule":"kalașnikov","kalasnikovului":"kalașnikov","kalasnikovuri":"kalașnikov","kalasnikovurile":"kalașnikov","kalasnikovurilor":"kalașnikov","kaliul":"kaliu","kaliule":"kaliu","kaliului":"kaliu","kalmace":"kalmâcă","kalmacei":"kalmâcă","kalmacele":"kalmâcă","kalmacelor":"kalmâcă","kalmaci":"kalmâc","kalmacii":"kalmâc","kalmacilor":"kalmâc","kalmacul":"kalmâc","kalmacule":"kalmâc","kalmacului":"kalmâc","kamalaua":"kamala","kamikazeul":"kamikaze","kamikazeule":"kamikaze","kamikazeului":"kamikaze","kampuchianul":"kampuchian","kampuchianule":"kampuchian","kampuchianului":"kampuchian","kampuchiene":"kampuchiană","kampuchienei":"kampuchiană","kampuchienele":"kampuchiană","kampuchienelor":"kampuchiană","kampuchieni":"kampuchian","kampuchienii":"kampuchian","kampuchienilor":"kampuchian","kantianisme":"kantianism","kantianismele":"kantianism","kantianismelor":"kantianism","kantianismul":"kantianism","kantianismule":"kantianism","kantianismului":"kantianism","kantianul":"kantian","kantianule":"kantian","kantianului":"kantian","kantiene":"kantiană","kantienei":"kantiană","kantienele":"kantiană","kantienelor":"kantiană","kantieni":"kantian","kantienii":"kantian","kantienilor":"kantian","kantisme":"kantism","kantismele":"kantism","kantismelor":"kantism","kantismul":"kantism","kantismule":"kantism","kantismului":"kantism","kappai":"kappa","kappalor":"kappa","kappaul":"kappa","kappaule":"kappa","kappaului":"kappa","karakalpakstanul":"Karakalpakstan","karakalpakstanule":"Karakalpakstan","karakalpakstanului":"Karakalpakstan","karateul":"karate","karateule":"karate","karateului":"karate","kargaz":"kirghiz","kargaza":["kârgâză","kârgâz","kârgâza","kârgâz"],"kargaze":"kârgâz","kargazele":"kârgâz","kargazi":"kârgâz","kargazii":"kârgâz","kargazul":"kârgâz","kaside":"kasidă","kasidei":"kasidă","kasidele":"kasidă","kasidelor":"kasidă","kasolite":"kasolit","kasolitele":"kasolit","kasolitelor":"kasolit","kasolitul":"kasolit","kasolitule":"kasolit","kasolitului":"kasolit","kazahe":"kazahă","kazahei":"kazahă","kazahele":"kazahă","kazahelor":"kazahă","kazahi":"kazah","kazahii":"kazah","kazahilor":"kazah","kazahstanul":"Kazahstan","kazahstanule":"Kazahstan","kazahstanului":"Kazahstan","kazahul":"kazah","kazahule":"kazah","kazahului":"kazah","kedivi":"kediv","kedivii":"kediv","kedivilor":"kediv","kedivul":"kediv","kedivule":"kediv","kedivului":"kediv","kelvinul":"kelvin","kelvinule":"kelvin","kelvinului":"kelvin","kemalismul":"kemalism","kemalismule":"kemalism","kemalismului":"kemalism","kenotroane":"kenotron","kenotroanele":"kenotron","kenotroanelor":"kenotron","kenotronul":"kenotron","kenotronule":"kenotron","kenotronului":"kenotron","kenyana":["kenyană","kenyan","kenyana","kenyan"],"kenyane":"kenyană","kenyanei":"kenyană","kenyanele":"kenyană","kenyanelor":"kenyană","kenyanul":"kenyan","kenyanule":"kenyan","kenyanului":"kenyan","kenyene":"kenyan","kenyenele":"kenyan","kenyeni":"kenyan","kenyenii":"kenyan","kenyenilor":"kenyan","keramite":"keramit","keramitele":"keramit","keramitelor":"keramit","keramitul":"keramit","keramitule":"keramit","keramitului":"keramit","kerosenul":"kerosen","kerosenule":"kerosen","kerosenului":"kerosen","kersantitul":"kersantit","kersantitule":"kersantit","kersantitului":"kersantit","ketaua":"keta","ketchupul":"ketchup","ketchupule":"ketchup","ketchupului":"ketchup","keynesianul":"keynesian","keynesianule":"keynesian","keynesianului":"keynesian","keynesieni":"keynesian","keynesienii":"keynesian","keynesienilor":"keynesian","keynesismul":"keynesism","keynesismule":"keynesism","keynesismului":"keynesism","khmere":"khmeră","khmerei":"khmeră","khmerele":"khmeră","khmerelor":"khmeră","khmeri":"khmer","khmerii":"khmer","khmerilor":"khmer","khmerul":"khmer","khmerule":"khmer","khmerului":"khmer","kibbutzul":"kibbutz","kibbutzule":"kibbutz","kibbutzului":"kibbutz","kibbutzuri":"kibbutz","kibbutzurile":"kibbutz","kibbutzurilor":"kibbutz","kidnapping-ul":"kidnapping","kidnapping-ule":"kidnapping","kidnapping-ului":"kidnapping","kieseritul":"kieserit","kieseritule":"kieserit","kieseritului":"kieserit","kile":"kil","kilele":"kil","kilelor":"kil","kiloamperi":"kiloamper","kiloamperii":"kiloamper","kiloamperilor":"kiloamper","kiloamperul":"kiloamper","kiloamperule":"kiloamper","kiloamperului":"kiloamper","kilocaloria":"kilocalorie","kilocaloriei":"kilocalorie","kilocalorii":"kilocalorie","kilocaloriile":"kilocalorie","kilocaloriilor":"kilocalorie","kilocicli":"kilociclu","kilociclii":"kilociclu","kilociclilor":"kilociclu","kilocicluul":"kilociclu","kilocicluule":"kilociclu","kilocicluului":"kilociclu","kilocuvantul":"kilocuvânt","kilocuvantule":"kilocuvânt","kilocuvantului":"kilocuvânt","kilocuvinte":"kilocuvânt","kilocuvintele":"kilocuvânt","kilocuvintelor":"kilocuvânt","kiloelectronvolti":"kiloelectronvolt","kiloelectronvoltii":"kiloelectronvolt","kiloelectronvoltilor":"kiloelectronvolt","kiloelectronvoltul":"kiloelectronvolt","kiloelectronvoltule":"kiloelectronvolt","kiloelectronvoltului":"kiloelectronvolt","kilogram-metri":"kilogram-metru","kilogram-metrii":"kilogram-metru","kilogram-metrilor":"kilogram-metru","kilogram-metruul":"kilogram-metru","kilogram-metruule":"kilogram-metru","kilogram-metruului":"kilogram-metru","kilograme-forta":"kilogram-forță","kilogrammetri":"kilogrammetru","kilogrammetrii":"kilogrammetru","kilogrammetrilor":"kilogrammetru","kilogrammetrul":"kilogrammetru","kilogrammetrule":"kilogrammetru","kilogrammetrului":"kilogrammetru","kilohertzi":"kilohertz","kilohertzii":"kilohertz","kilohertzilor":"kilohertz","kilohertzul":"kilohertz","kilohertzule":"kilohertz","kilohertzului":"kilohertz","kilojouleul":"kilojoule","kilojouleule":"kilojoule","kilojouleului":"kilojoule","kilojouli":"kilojoule","kilojoulii":"kilojoule","kilojoulilor":"kilojoule","kilole":"kilo","kilolitri":"kilolitru","kilolitrii":"kilolitru","kilolitrilor":"kilolitru","kilolitrul":"kilolitru","kilolitrule":"kilolitru","kilolitrului":"kilolitru","kilolor":"kilo","kilometrai":"kilometra","kilometraje":"kilometraj","kilometrajele":"kilometraj","kilometrajelor":"kilometraj","kilometrajul":"kilometraj","kilometrajule":"kilometraj","kilometrajului":"kilometraj","kilometram":["kilometrăm","kilometra","kilometram","kilometra"],"kilometrand":"kilometra","kilometrara":"kilometra","kilometraram":"kilometra","kilometrarati":"kilometra","kilometrase":"kilometra","kilometrasem":"kilometra","kilometrasera":"kilometra","kilometraseram":"kilometra","kilometraserati":"kilometra","kilometrasesi":"kilometra","kilometrasi":"kilometra","kilometrat":"kilometra","kilometrata":["kilometrată","kilometrat","kilometrata","kilometrat"],"kilometrate":"kilometrat","kilometratele":"kilometrat","kilometrati":["kilometrați","kilometra","kilometrați","kilometrat"],"kilometratii":"kilometrat","kilometratul":"kilometrat","kilometrau":"kilometra","kilometreaza":"kilometra","kilometrez":"kilometra","kilometrezi":"kilometra","kilometri":"kilometru","kilometri patrati":"kilometru pătrat","kilometrica":["kilometrică","kilometric","kilometrica","kilometric"],"kilometrice":"kilometric","kilometricele":"kilometric","kilometrici":"kilometric","kilometricii":"kilometric","kilometricul":"kilometric","kilometrii":"kilometru","kilometrilor":"kilometru","kilometrul":"kilometru","kilometrule":"kilometru","kilometrului":"kilometru","kilomoli":"kilomol","kilomolii":"kilomol","kilomolilor":"kilomol","kilomolul":"kilomol","kilomolule":"kilomol","kilomolului":"kilomol","kiloohmi":"kiloohm","kiloohmii":"kiloohm","kiloohmilor":"kiloohm","kiloohmul":"kiloohm","kiloohmule":"kiloohm","kiloohmului":"kiloohm","kilotone":"kilotonă","kilotonei":"kilotonă","kilotonele":"kilotonă","kilotonelor":"kilotonă","kiloul":"kilo","kiloule":"kilo","kiloului":"kilo","kilovari":"kilovar","kilovarii":"kilovar","kilovarilor":"kilovar","kilovarul":"kilovar","kilovarule":"kilovar","kilovarului":"kilovar","kilovolti":"kilovolt","kilovoltii":"kilovolt","kilovoltilor":"kilovolt","kilovoltul":"kilovolt","kilovoltule":"kilovolt","kilovoltului":"kilovolt","kilowati":"kilowatt","kilowati-ora":"kilowatt-oră","kilowatii":"kilowatt","kilowatilor":"kilowatt","kilowattul":"kilowatt","kilowattule":"kilowatt","kilowattului":"kilowatt","kiltul":"kilt","kiltule":"kilt","kiltului":"kilt","kilturi":"kilt","kilturii":"kilt","kilturilor":"kilt","kilul":"kil","kilule":"kil","kilului":"kil","kimberlite":"kimberlit","kimberlitele":"kimberlit","kimberlitelor":"kimberlit","kimberlitul":"kimberlit","kimberlitule":"kimberlit","kimberlitului":"kimberlit","kimonoul":"kimono","kimonoule":"kimono","kimonoului":"kimono","kimonouri":"kimono","kimonourile":"kimono","kimonourilor":"kimono","kinestezia":"kinestezie","kinestezica":["kinestezică","kinestezic","kinestezica","kinestezic"],"kinestezice":"kinestezic","kinestezicele":"kinestezic","kinestezici":"kinestezic","kinestezicii":"kinestezic","kinestezicul":"kinestezic","kinesteziei":"kinestezie","kinestezii":"kinestezie","kinesteziile":"kinestezie","kinesteziilor":"kinestezie","kinetoscoape":"kinetoscop","kinetoscoapele":"kinetoscop","kinetoscoapelor":"kinetoscop","kinetoscopul":"kinetoscop","kinetoscopule":"kinetoscop","kinetoscopului":"kinetoscop","kinetoterapeute":"kinetoterapeută","kinetoterapeutei":"kinetoterapeută","kinetoterapeutele":"kinetoterapeută","kinetoterapeutelor":"kinetoterapeută","kinetoterapeuti":"kinetoterapeut","kinetoterapeutii":"kinetoterapeut","kinetoterapeutilor":"kinetoterapeut","kinetoterapeutul":"kinetoterapeut","kinetoterapeutule":"kinetoterapeut","kinetoterapeutului":"kinetoterapeut","kinetoterapia":"kinetoterapie","kinetoterapiei":"kinetoterapie","kinetoterapii":"kinetoterapie","kinezica":["kinezică","kinezic","kinezica","kinezic"],"kinezice":"kinezic","kinezicele":"kinezic","kinezici":"kinezic","kinezicii":"kinezic","kinezicul":"kinezic","kineziologia":"kineziologie","kineziologiei":"kineziologie","kineziologii":"kineziologie","kineziologiile":"kineziologie","kineziologiilor":"kineziologie","kineziterapeuti":"kineziterapeut","kineziterapeutii":"kineziterapeut","kineziterapeutilor":"kineziterapeut","kineziterapeutul":"kineziterapeut","kineziterapeutule":"kineziterapeut","kineziterapeutului":"kineziterapeut","kineziterapia":"kineziterapie","kineziterapiei":"kineziterapie","kineziterapii":"kineziterapie","kineziterapiile":"kineziterapie","kineziterapiilor":"kineziterapie","kipi":"kip","kipii":"kip","kipilor":"kip","kipul":"kip","kipule":"kip","kipului":"kip","kirghiz":"kârgâz","kirghiza":["kirghiză","kirghiz","kirghiza","kirghiz"],"kirghize":["kirghize","kirghiz","kirghize","kirghiză"],"kirghizei":"kirghiză","kirghizele":["kirghizele","kirghiz","kirghizele","kirghiză"],"kirghizelor":"kirghiză","kirghizi":"kirghiz","kirghizii":"kirghiz","kirghizul":"kirghiz","kiribatiana":["kiribatiană","kiribatian","kiribatiana","kiribatian"],"kiribatiane":"kiribatiană","kiribatianul":"kiribatian","kiribatianule":"kiribatian","kiribatianului":"kiribatian","kiribatiene":["kiribatiene","kiribatian","kiribatiene","kiribatiană"],"kiribatienei":"kiribatiană","kiribatienele":["kiribatienele","kiribatian","kiribatienele","kiribatiană"],"kiribatienelor":"kiribatiană","kiribatieni":"kiribatian","kiribatienii":"kiribatian","kiribatienilor":"kiribatian","kitschul":"kitsch","kitschule":"kitsch","kitschului":"kitsch","kitschuri":"kitsch","kitschurile":"kitsch","kitschurilor":"kitsch","kittsiana":["kittsiană","kittsian","kittsiana","kittsian"],"kittsiane":"kittsiană","kittsianei":"kittsiană","kittsianele":"kittsiană","kittsianelor":"kittsiană","kittsianul":"kittsian","kittsianule":"kittsian","kittsianului":"kittsian","kittsiene":"kittsian","kittsienele":"kittsian","kittsieni":"kittsian","kittsienii":"kittsian","kittsienilor":"kittsian","kitul":"kit","kitule":"kit","kitului":"kit","kituri":"kit","kiturile":"kit","kiturilor":"kit","kiwii":"kiwi","kiwile":"kiwi","kiwilor":"kiwi","kiwiul":"kiwi","klingoniene":"klingoniană","klingonienei":"klingoniană","klingonienele":"klingoniană","klingonienelor":"klingoniană","knessete":"knesset","knessetele":"knesset","knessetelor":"knesset","knessetul":"knesset","knessetule":"knesset","knessetului":"knesset","knockoutai":"knockouta","knockoutam":["knockoutăm","knockouta","knockoutam","knockouta"],"knockoutand":"knockouta","knockoutara":"knockouta","knockoutaram":"knockouta","knockoutarati":"knockouta","knockoutase":"knockouta","knockoutasem":"knockouta","knockoutasera":"knockouta","knockoutaseram":"knockouta","knockoutaserati":"knockouta","knockoutasesi":"knockouta","knockoutasi":"knockouta","knockoutat":"knockouta","knockoutati":"knockouta","knockoutau":"knockouta","knockouteaza":"knockouta","knockoutez":"knockouta","knockoutezi":"knockouta","knockoutul":"knockout","knockoutule":"knockout","knockoutului":"knockout","knockouturi":"knockout","knockouturile":"knockout","knockouturilor":"knockout","know-howul":"know-how","know-howule":"know-how","know-howului":"know-how","koalaul":"koala","koalaului":"koala","koboldul":"kobold","koboldule":"kobold","koboldului":"kobold","kobolzi":"kobold","kobolzii":"kobold","kobolzilor":"kobold","kosovara":["kosovară","kosovar","kosovara","kosovar"],"kosovare":["kosovare","kosovar","kosovare","kosovară"],"kosovarei":"kosovară","kosovarele":["kosovarele","kosovar","kosovarele","kosovară"],"kosovarelor":"kosovară","kosovari":"kosovar","kosovarii":"kosovar","kosovarul":"kosovar","kremlinologisti":"kremlinologist","kremlinologistii":"kremlinologist","kremlinologistilor":"kremlinologist","kremlinologistul":"kremlinologist","kremlinologistule":"kremlinologist","kremlinologistului":"kremlinologist","krenneritul":"krennerit","krenneritule":"krennerit","krenneritului":"krennerit","kriptonul":"kripton","kriptonule":"kripton","kriptonului":"kripton","kronprinzul":"kronprinz","kronprinzule":"kronprinz","kronprinzului":"kronprinz","kurda":["kurdă","kurd","kurda","kurd"],"kurde":["kurde","kurd","kurde","kurdă"],"kurdei":"kurdă","kurdele":["kurdele","kurd","kurdele","kurdă"],"kurdelor":"kurdă","kurdul":"kurd","kurzi":"kurd","kurzii":"kurd","kuwaitiana":["kuwaitiană","kuwaitian","kuwaitiana","kuwaitian"],"kuwaitiane":"kuwaitiană","kuwaitianei":"kuwaitiană","kuwaitianele":"kuwaitiană","kuwaitianelor":"kuwaitiană","kuwaitianul":"kuwaitian","kuwaitianule":"kuwaitian","kuwaitianului":"kuwaitian","kuwaitiene":"kuwaitian","kuwaitienele":"kuwaitian","kuwaitieni":"kuwaitian","kuwaitienii":"kuwaitian","kuwaitienilor":"kuwaitian","kuweitianul":"kuweitian","kuweitianule":"kuweitian","kuweitianului":"kuweitian","kuweitiene":"kuweitiană","kuweitienei":"kuweitiană","kuweitienele":"kuweitiană","kuweitienelor":"kuweitiană","kuweitieni":"kuweitian","kuweitienii":"kuweitian","kuweitienilor":"kuweitian","kuweitul":"Kuweit","kuweitule":"Kuweit","kuweitului":"Kuweit","kyati":"kyat","kyatii":"kyat","kyatilor":"kyat","kyatul":"kyat","kyatule":"kyat","kyatului":"kyat"};
@@ -0,0 +1 @@
+export default {"la multi ani !":"la mulți ani","la oadie":"La Odaie","la sfantul asteapta":"la sfântu-așteaptă","la urma urmelor":"la urma urmei","labaduia":"lăbădui","labaduiai":"lăbădui","labaduiam":"lăbădui","labaduiati":"lăbădui","labaduiau":"lăbădui","labaduiesc":"lăbădui","labaduieste":"lăbădui","labaduiesti":"lăbădui","labaduii":"lăbădui","labaduim":"lăbădui","labaduind":"lăbădui","labaduira":"lăbădui","labaduiram":"lăbădui","labaduirati":"lăbădui","labaduise":"lăbădui","labaduisem":"lăbădui","labaduisera":"lăbădui","labaduiseram":"lăbădui","labaduiserati":"lăbădui","labaduisesi":"lăbădui","labaduisi":"lăbădui","labaduit":"lăbădui","labaduiti":"lăbădui","labagii":"labagiu","labagiii":"labagiu","labagiilor":"labagiu","labagiul":"labagiu","labagiule":"labagiu","labagiului":"labagiu","labanata":["lăbănată","lăbănat","lăbănata","lăbănat"],"labanate":"lăbănat","labanatele":"lăbănat","labanati":"lăbănat","labanatii":"lăbănat","labanatul":"lăbănat","labani":"laban","labanii":"laban","labanilor":"laban","labanul":"laban","labanule":"laban","labanului":"laban","labari":"lăbar","labarii":"lăbar","labarilor":"lăbar","labartai":"lăbărța","labartam":["lăbărțăm","lăbărța","lăbărțam","lăbărța"],"labartand":"lăbărța","labartara":"lăbărța","labartaram":"lăbărța","labartarati":"lăbărța","labartarea":"lăbărțare","labartari":"lăbărțare","labartarii":"lăbărțare","labartarile":"lăbărțare","labartarilor":"lăbărțare","labartase":"lăbărța","labartasem":"lăbărța","labartasera":"lăbărța","labartaseram":"lăbărța","labartaserati":"lăbărța","labartasesi":"lăbărța","labartasi":"lăbărța","labartat":"lăbărța","labartata":["lăbărțată","lăbărțat","lăbărțata","lăbărțat"],"labartate":"lăbărțat","labartatele":"lăbărțat","labartati":["lăbărțați","lăbărța","lăbărțați","lăbărțat"],"labartatii":"lăbărțat","labartatul":"lăbărțat","labartaturi":"lăbărțătură","labartaturii":"lăbărțătură","labartaturile":"lăbărțătură","labartaturilor":"lăbărțătură","labartau":"lăbărța","labarteaza":"lăbărța","labartez":"lăbărța","labartezi":"lăbărța","labarul":"lăbar","labarule":"lăbar","labarului":"lăbar","labarumul":"labarum","labarumule":"labarum","labarumului":"labarum","labasice":"lăbășică","labasicei":"lăbășică","labda":"lăuda","labde":"labdă","labdei":"labdă","labe":"labă","labei":"labă","labele":"labă","labelor":"labă","labfermenti":"labferment","labfermentii":"labferment","labfermentilor":"labferment","labfermentul":"labferment","labfermentule":"labferment","labfermentului":"labferment","labia":"labie","labiala":["labială","labial","labiala","labial"],"labiale":["labiale","labial","labiale","labială"],"labialei":"labială","labialele":["labialele","labial","labialele","labială"],"labialelor":"labială","labiali":"labial","labialii":"labial","labialitatea":"labialitate","labialitati":"labialitate","labialitatii":"labialitate","labialitatile":"labialitate","labialitatilor":"labialitate","labializai":"labializa","labializam":["labializăm","labializa","labializam","labializa"],"labializand":"labializa","labializara":"labializa","labializaram":"labializa","labializarati":"labializa","labializarea":"labializare","labializarei":"labializare","labializase":"labializa","labializasem":"labializa","labializasera":"labializa","labializaseram":"labializa","labializaserati":"labializa","labializasesi":"labializa","labializasi":"labializa","labializat":"labializa","labializati":"labializa","labializatoare":"labializator","labializatoarea":"labializator","labializatoarele":"labializator","labializatori":"labializator","labializatorii":"labializator","labializatorul":"labializator","labializau":"labializa","labializeaza":"labializa","labializez":"labializa","labializezi":"labializa","labialul":"labial","labiata":["labiată","labiat","labiata","labiat"],"labiate":["labiate","labiat","labiate","labiată"],"labiatei":"labiată","labiatele":["labiatele","labiat","labiatele","labiată"],"labiatelor":"labiată","labiati":"labiat","labiatii":"labiat","labiatul":"labiat","labiei":"labie","labii":"labie","labiile":"labie","labiilor":"labie","labila":["labilă","labil","labila","labil"],"labile":"labil","labilele":"labil","labili":"labil","labilii":"labil","labilitatea":"labilitate","labilitati":"labilitate","labilitatii":"labilitate","labilitatile":"labilitate","labilitatilor":"labilitate","labilul":"labil","labiodentala":["labiodentală","labiodental","labiodentala","labiodental"],"labiodentale":["labiodentale","labiodental","labiodentale","labiodentală"],"labiodentalei":"labiodentală","labiodentalele":["labiodentalele","labiodental","labiodentalele","labiodentală"],"labiodentalelor":"labiodentală","labiodentali":"labiodental","labiodentalii":"labiodental","labiodentalul":"labiodental","labiolecture":"labiolectură","labiolecturei":"labiolectură","labiovelara":["labiovelară","labiovelar","labiovelara","labiovelar"],"labiovelare":["labiovelare","labiovelar","labiovelare","labiovelară"],"labiovelarei":"labiovelară","labiovelarele":["labiovelarele","labiovelar","labiovelarele","labiovelară"],"labiovelarelor":"labiovelară","labiovelari":"labiovelar","labiovelarii":"labiovelar","labiovelarul":"labiovelar","labirintica":["labirintică","labirintic","labirintica","labirintic"],"labirintice":"labirintic","labirinticele":"labirintic","labirintici":"labirintic","labirinticii":"labirintic","labirinticul":"labirintic","labirintismul":"labirintism","labirintismule":"labirintism","labirintismului":"labirintism","labirintite":"labirintită","labirintitei":"labirintită","labirintitele":"labirintită","labirintitelor":"labirintită","labirintodonti":"labirintodont","labirintodontii":"labirintodont","labirintodontilor":"labirintodont","labirintodontul":"labirintodont","labirintodontule":"labirintodont","labirintodontului":"labirintodont","labirintul":"labirint","labirintule":"labirint","labirintului":"labirint","labirinturi":"labirint","labirinturile":"labirint","labirinturilor":"labirint","labite":"lăbiță","labitei":"lăbiță","labitele":"lăbiță","labitelor":"lăbiță","labiumul":"labium","labiumule":"labium","labiumului":"labium","labiuul":"labiu","labiuule":"labiu","labiuului":"labiu","laboaia":"lăboaie","laboaiei":"lăboaie","laboaiele":"lăboaie","laboaielor":"lăboaie","laboarea":"laboare","laboasa":["lăboasă","lăbos","lăboasa","lăbos"],"laboase":"lăbos","laboasele":"lăbos","laborai":"labora","laboram":["laborăm","labora","laboram","labora"],"laborand":"labora","laborante":"laborantă","laborantei":"laborantă","laborantele":"laborantă","laborantelor":"laborantă","laboranti":"laborant","laborantii":"laborant","laborantilor":"laborant","laborantul":"laborant","laborantule":"laborant","laborantului":"laborant","laborara":"labora","laboraram":"labora","laborarati":"labora","laborase":"labora","laborasem":"labora","laborasera":"labora","laboraseram":"labora","laboraserati":"labora","laborasesi":"labora","laborasi":"labora","laborat":"labora","laborati":"labora","laboratoare":"laborator","laboratoarele":"laborator","laboratoarelor":"laborator","laboratorii":"laboratoriu","laboratoriile":"laboratoriu","laboratoriilor":"laboratoriu","laboratoriuul":"laboratoriu","laboratoriuule":"laboratoriu","laboratoriuului":"laboratoriu","laboratorul":"laborator","laboratorule":"laborator","laboratorului":"laborator","laborau":"labora","laboreaza":"labora","laborez":"labora","laborezi":"labora","labori":"laboare","laborii":"laboare","laborile":"laboare","laborilor":"laboare","laborioasa":["laborioasă","laborios","laborioasa","laborios"],"laborioase":"laborios","laborioasele":"laborios","laboriosi":"laborios","laboriosii":"laborios","laboriosul":"laborios","laboriozitatea":"laboriozitate","laboriozitati":"laboriozitate","laboriozitatii":"laboriozitate","laboriozitatile":"laboriozitate","laboriozitatilor":"laboriozitate","laborori":"laboror","labororii":"laboror","labororilor":"laboror","labororul":"laboror","labororule":"laboror","labororului":"laboror","labosele":"laboșel","laboselele":"laboșel","laboselelor":"laboșel","laboselul":"laboșel","laboselule":"laboșel","laboselului":"laboșel","labosi":"lăbos","labosii":"lăbos","labosul":"lăbos","labradori":"labrador","labradorii":"labrador","labradorilor":"labrador","labradorite":"labradorit","labradoritele":"labradorit","labradoritelor":"labradorit","labradoritul":"labradorit","labradoritule":"labradorit","labradoritului":"labradorit","labradorul":"labrador","labradorule":"labrador","labradorului":"labrador","labreaua":"labreu","labreauale":"labreu","labreaualor":"labreu","labreuul":"labreu","labreuule":"labreu","labreuului":"labreu","labri":"labru","labrii":"labru","labrilor":"labru","labroide":"labroid","labroidele":"labroid","labroidelor":"labroid","labroidul":"labroid","labroidule":"labroid","labroidului":"labroid","labrul":"labru","labrule":"labru","labrului":"labru","laburista":["laburistă","laburist","laburista","laburist"],"laburiste":["laburiste","laburist","laburiste","laburistă"],"laburistei":"laburistă","laburistele":["laburistele","laburist","laburistele","laburistă"],"laburistelor":"laburistă","laburisti":"laburist","laburistii":"laburist","laburistilor":"laburist","laburistul":"laburist","laburistule":"laburist","laburistului":"laburist","labusoare":"lăbușoară","labusoarei":"lăbușoară","labusoarele":"lăbușoară","labusoarelor":"lăbușoară","labute":"lăbuță","labutei":"lăbuță","labutele":"lăbuță","labutelor":"lăbuță","lacai":"lacău","lacaii":"lacău","lacailor":"lacău","lacaraia":"lăcăraie","lacaraiei":"lăcăraie","lacaraii":"lăcăraie","lacari":"lăcar","lacari cafenii":"lăcar cafeniu","lacari de mlastina":"lăcar de mlaștină","lacari de pipirig":"lăcar de pipirig","lacari de stuf":"lăcar de stuf","lacari mari":"lăcar mare","lacari mici":"lăcar mic","lacari nordici":"lăcar nordic","lacaria":"lăcărie","lacariei":"lăcărie","lacarii":["lăcarii","lăcar","lăcării","lăcărie"],"lacarilor":"lăcar","lacarul":"lăcar","lacarule":"lăcar","lacarului":"lăcar","lacas":"locaș","lacasul":"lăcaș","lacasule":"lăcaș","lacasului":"lăcaș","lacasuri":"lăcaș","lacasurile":"lăcaș","lacasurilor":"lăcaș","lacate":["lacăte","lacăt","lăcate","lăcat","lăcate","lăcată"],"lacate cu cifru":"lacăt cu cifru","lacatei":"lăcată","lacatele":["lacătele","lacăt","lăcatele","lăcat","lăcatele","lăcată","lăcățele","lăcățel"],"lacatelele":"lăcățel","lacatelelor":"lăcățel","lacatelor":["lacătelor","lacăt","lăcatelor","lăcat","lăcatelor","lăcată"],"lacatelul":"lăcățel","lacatelule":"lăcățel","lacatelului":"lăcățel","lacatoaie":"lăcătoi","lacatoaiele":"lăcătoi","lacatoaielor":"lăcătoi","lacatoiul":"lăcătoi","lacatoiule":"lăcătoi","lacatoiului":"lăcătoi","lacatuia":"lăcătui","lacatuiai":"lăcătui","lacatuiam":"lăcătui","lacatuiati":"lăcătui","lacatuiau":"lăcătui","lacatuiesc":"lăcătui","lacatuieste":"lăcătui","lacatuiesti":"lăcătui","lacatuii":"lăcătui","lacatuim":"lăcătui","lacatuind":"lăcătui","lacatuira":"lăcătui","lacatuiram":"lăcătui","lacatuirati":"lăcătui","lacatuirea":"lăcătuire","lacatuiri":"lăcătuire","lacatuirii":"lăcătuire","lacatuirile":"lăcătuire","lacatuirilor":"lăcătuire","lacatuise":"lăcătui","lacatuisem":"lăcătui","lacatuisera":"lăcătui","lacatuiseram":"lăcătui","lacatuiserati":"lăcătui","lacatuisesi":"lăcătui","lacatuisi":"lăcătui","lacatuit":"lăcătui","lacatuita":["lăcătuită","lăcătuit","lăcătuita","lăcătuit"],"lacatuite":"lăcătuit","lacatuitele":"lăcătuit","lacatuiti":["lăcătuiți","lăcătui","lăcătuiți","lăcătuit"],"lacatuitii":"lăcătuit","lacatuitul":"lăcătuit","lacatul":["lacătul","lacăt","lăcatul","lăcat"],"lacatule":["lacătule","lacăt","lăcatule","lăcat"],"lacatului":["lacătului","lacăt","lăcatului","lăcat"],"lacatusaria":"lăcătușărie","lacatusariei":"lăcătușărie","lacatusarii":"lăcătușărie","lacatusariile":"lăcătușărie","lacatusariilor":"lăcătușărie","lacatuseria":"lăcătușerie","lacatuseriei":"lăcătușerie","lacatuserii":"lăcătușerie","lacatuseriile":"lăcătușerie","lacatuseriilor":"lăcătușerie","lacatusi":"lăcătuș","lacatusii":"lăcătuș","lacatusilor":"lăcătuș","lacatusul":"lăcătuș","lacatusule":"lăcătuș","lacatusului":"lăcătuș","lacauul":"lacău","lacauule":"lacău","lacauului":"lacău","lacaze":"lacază","lacazei":"lacază","lacazele":"lacază","lacazelor":"lacază","lacea":"lace","lacedemoniana":["lacedemoniană","lacedemonian","lacedemoniana","lacedemonian"],"lacedemonianul":"lacedemonian","lacedemoniene":"lacedemonian","lacedemonienele":"lacedemonian","lacedemonieni":"lacedemonian","lacedemonienii":"lacedemonian","lacele":"lace","lacerai":"lacera","laceram":["lacerăm","lacera","laceram","lacera"],"lacerand":"lacera","lacerara":"lacera","laceraram":"lacera","lacerarati":"lacera","lacerarea":"lacerare","lacerari":"lacerare","lacerarii":"lacerare","lacerarile":"lacerare","lacerarilor":"lacerare","lacerase":"lacera","lacerasem":"lacera","lacerasera":"lacera","laceraseram":"lacera","laceraserati":"lacera","lacerasesi":"lacera","lacerasi":"lacera","lacerat":"lacera","lacerati":"lacera","laceratia":"lacerație","laceratiei":"lacerație","laceratii":"lacerație","laceratiile":"lacerație","laceratiilor":"lacerație","lacerau":"lacera","lacereaza":"lacera","lacerez":"lacera","lacerezi":"lacera","lacertilianul":"lacertilian","lacertilianule":"lacertilian","lacertilianului":"lacertilian","lacertilieni":"lacertilian","lacertilienii":"lacertilian","lacertilienilor":"lacertilian","lachedemoni":"lachedemon","lachedemonii":"lachedemon","lachedemonilor":"lachedemon","lachedemonul":"lachedemon","lachedemonule":"lachedemon","lachedemonului":"lachedemon","lachei":"lacheu","lacheii":"lacheu","lacheilor":"lacheu","lacherde":"lacherdă","lacherdei":"lacherdă","lacherdele":"lacherdă","lacherdelor":"lacherdă","lacheul":"lacheu","lacheule":"lacheu","lacheului":"lacheu","laci":"lace","lacii":"lace","lacmusul":"lacmus","lacmusule":"lacmus","lacmusului":"lacmus","lacoasa":["lăcoasă","lăcos","lăcoasa","lăcos"],"lacoase":"lăcos","lacoasele":"lăcos","lacoma":["lacomă","lacom","lacoma","lacom"],"lacome":"lacom","lacomea":"lăcomi","lacomeai":"lăcomi","lacomeam":"lăcomi","lacomeasca":["lăcomească","lăcomesc","lăcomeasca","lăcomesc"],"lacomeati":"lăcomi","lacomeau":"lăcomi","lacomela":["lăcomelă","lăcomel","lăcomela","lăcomel"],"lacomele":["lacomele","lacom","lăcomele","lăcomel"],"lacomelele":"lăcomel","lacomeli":"lăcomel","lacomelii":"lăcomel","lacomelul":"lăcomel","lacomesc":"lăcomi","lacomescul":"lăcomesc","lacomeste":"lăcomi","lacomesti":["lăcomești","lăcomesc","lăcomești","lăcomi"],"lacomestii":"lăcomesc","lacomestile":"lăcomesc","lacomi":"lacom","lacomia":"lăcomie","lacomiei":"lăcomie","lacomii":["lacomii","lacom","lăcomii","lăcomi","lăcomii","lăcomie"],"lacomiile":"lăcomie","lacomiilor":"lăcomie","lacomim":"lăcomi","lacomind":"lăcomi","lacomira":"lăcomi","lacomiram":"lăcomi","lacomirati":"lăcomi","lacomirea":"lăcomire","lacomiri":"lăcomire","lacomirii":"lăcomire","lacomirile":"lăcomire","lacomirilor":"lăcomire","lacomise":"lăcomi","lacomisem":"lăcomi","lacomisera":"lăcomi","lacomiseram":"lăcomi","lacomiserati":"lăcomi","lacomisesi":"lăcomi","lacomisi":"lăcomi","lacomit":"lăcomi","lacomiti":"lăcomi","lacomoasa":["lăcomoasă","lăcomos","lăcomoasa","lăcomos"],"lacomoase":"lăcomos","lacomoasele":"lăcomos","lacomosi":"lăcomos","lacomosii":"lăcomos","lacomosul":"lăcomos","lacomul":"lacom","laconica":["laconică","laconic","laconica","laconic"],"laconice":"laconic","laconiceasca":["laconicească","laconicesc","laconiceasca","laconicesc"],"laconicele":"laconic","laconicescul":"laconicesc","laconicesti":"laconicesc","laconicestii":"laconicesc","laconicestile":"laconicesc","laconici":"laconic","laconicii":"laconic","laconicul":"laconic","laconismul":"laconism","laconismule":"laconism","laconismului":"laconism","lacosi":"lăcos","lacosii":"lăcos","lacosul":"lăcos","lacovistea":["lacoviștea","lacoviște","lăcoviștea","lăcoviște"],"lacovisti":["lacoviști","lacoviște","lăcoviști","lăcoviște"],"lacovistii":["lacoviștii","lacoviște","lăcoviștii","lăcoviște"],"lacovistile":["lacoviștile","lacoviște","lăcoviștile","lăcoviște"],"lacovistilor":["lacoviștilor","lacoviște","lăcoviștilor","lăcoviște"],"lacovistita":["lăcoviștită","lăcoviștit","lăcoviștita","lăcoviștit"],"lacovistite":"lăcoviștit","lacovistitele":"lăcoviștit","lacovistiti":"lăcoviștit","lacovistitii":"lăcoviștit","lacovistitul":"lăcoviștit","lacracioare":"lăcrăcioară","lacracioarei":"lăcrăcioară","lacrama":["lacrămă","lacrimă","lăcrăma","lăcrima"],"lacramai":"lăcrăma","lacramam":["lăcrămăm","lăcrăma","lăcrămam","lăcrăma"],"lacramand":"lăcrăma","lacramara":"lăcrăma","lacramaram":"lăcrăma","lacramarati":"lăcrăma","lacramarea":"lăcrămare","lacramari":"lăcrămare","lacramarii":"lăcrămare","lacramarile":"lăcrămare","lacramarilor":"lăcrămare","lacramase":"lăcrăma","lacramasem":"lăcrăma","lacramasera":"lăcrăma","lacramaseram":"lăcrăma","lacramaserati":"lăcrăma","lacramasesi":"lăcrăma","lacramasi":"lăcrăma","lacramat":"lăcrăma","lacramati":"lăcrăma","lacramatia":"lăcrămație","lacramatiei":"lăcrămație","lacramatii":"lăcrămație","lacramatiile":"lăcrămație","lacramatiilor":"lăcrămație","lacramatoare":"lăcrămător","lacramatoarea":"lăcrămător","lacramatoarele":"lăcrămător","lacramatori":"lăcrămător","lacramatorii":"lăcrămător","lacramatorul":"lăcrămător","lacramau":"lăcrăma","lacrame":"lăcramă","lacrameaza":"lăcrăma","lacramei":"lăcramă","lacramele":"lăcramă","lacramelor":"lăcramă","lacramez":"lăcrăma","lacramezi":"lăcrăma","lacrami":"lacrămă","lacramicioasa":["lăcrămicioasă","lăcrămicios","lăcrămicioasa","lăcrămicios"],"lacramicioase":"lăcrămicios","lacramicioasele":"lăcrămicios","lacramiciosi":"lăcrămicios","lacramiciosii":"lăcrămicios","lacramiciosul":"lăcrămicios","lacramii":"lacrămă","lacramile":"lacrămă","lacramilor":"lacrămă","lacramioara":"lăcrimioară","lacramioare":"lăcrămioară","lacramioarei":"lăcrămioară","lacramioarele":"lăcrămioară","lacramioarelor":"lăcrămioară","lacramoasa":["lăcrămoasă","lăcrămos","lăcrămoasa","lăcrămos"],"lacramoase":"lăcrămos","lacramoasele":"lăcrămos","lacramos":"lăcrimos","lacramosi":"lăcrămos","lacramosii":"lăcrămos","lacramosul":"lăcrămos","lacramute":"lăcrămuță","lacramutei":"lăcrămuță","lacramutele":"lăcrămuță","lacramutelor":"lăcrămuță","lacre":"lacră","lacrei":"lacră","lacrele":"lacră","lacrelor":"lacră","lacrimai":"lăcrima","lacrimala":["lacrimală","lacrimal","lacrimala","lacrimal"],"lacrimale":"lacrimal","lacrimalele":"lacrimal","lacrimali":"lacrimal","lacrimalii":"lacrimal","lacrimalul":"lacrimal","lacrimam":["lăcrimăm","lăcrima","lăcrimam","lăcrima"],"lacrimand":"lăcrima","lacrimanda":["lăcrimândă","lăcrimând","lăcrimânda","lăcrimând"],"lacrimande":"lăcrimând","lacrimandele":"lăcrimând","lacrimandul":"lăcrimând","lacrimanzi":"lăcrimând","lacrimanzii":"lăcrimând","lacrimara":"lăcrima","lacrimaram":"lăcrima","lacrimarati":"lăcrima","lacrimarea":"lăcrimare","lacrimari":"lăcrimare","lacrimarii":"lăcrimare","lacrimarile":"lăcrimare","lacrimarilor":"lăcrimare","lacrimase":"lăcrima","lacrimasem":"lăcrima","lacrimasera":"lăcrima","lacrimaseram":"lăcrima","lacrimaserati":"lăcrima","lacrimasesi":"lăcrima","lacrimasi":"lăcrima","lacrimat":"lăcrima","lacrimata":["lăcrimată","lăcrimat","lăcrimata","lăcrimat"],"lacrimate":"lăcrimat","lacrimatele":"lăcrimat","lacrimati":["lăcrimați","lăcrima","lăcrimați","lăcrimat"],"lacrimatii":"lăcrimat","lacrimatoare":"lăcrimător","lacrimatoarea":"lăcrimător","lacrimatoarele":"lăcrimător","lacrimatori":"lăcrimător","lacrimatorii":["lăcrimătorii","lăcrimător","lacrimatorii","lacrimatoriu"],"lacrimatoriile":"lacrimatoriu","lacrimatoriilor":"lacrimatoriu","lacrimatoriuul":"lacrimatoriu","lacrimatoriuule":"lacrimatoriu","lacrimatoriuului":"lacrimatoriu","lacrimatorul":"lăcrimător","lacrimatul":"lăcrimat","lacrimaturi":"lăcrimătură","lacrimaturii":"lăcrimătură","lacrimaturile":"lăcrimătură","lacrimaturilor":"lăcrimătură","lacrimau":"lăcrima","lacrimeaua":"lăcrimea","lacrimeaza":"lăcrima","lacrimele":"lăcrimea","lacrimelei":"lăcrimea","lacrimelele":"lăcrimea","lacrimelelor":"lăcrimea","lacrimez":"lăcrima","lacrimezi":"lăcrima","lacrimi":"lacrimă","lacrimii":"lacrimă","lacrimile":"lacrimă","lacrimilor":"lacrimă","lacrimioare":"lăcrimioară","lacrimioarei":"lăcrimioară","lacrimioarele":"lăcrimioară","lacrimioarelor":"lăcrimioară","lacrimite":"lăcrimiță","lacrimitei":"lăcrimiță","lacrimitele":"lăcrimiță","lacrimitelor":"lăcrimiță","lacrimoasa":["lăcrimoasă","lăcrimos","lăcrimoasa","lăcrimos"],"lacrimoase":"lăcrimos","lacrimoasele":"lăcrimos","lacrimogena":["lacrimogenă","lacrimogen","lacrimogena","lacrimogen"],"lacrimogene":"lacrimogen","lacrimogenele":"lacrimogen","lacrimogeni":"lacrimogen","lacrimogenii":"lacrimogen","lacrimogenul":"lacrimogen","lacrimosi":"lăcrimos","lacrimosii":"lăcrimos","lacrimosul":"lăcrimos","lacrimozitatea":"lacrimozitate","lacrimozitati":"lacrimozitate","lacrimozitatii":"lacrimozitate","lacrimute":"lăcrimuță","lacrimutei":"lăcrimuță","lacrimutele":"lăcrimuță","lacrimutelor":"lăcrimuță","lacrisoare e":"lăcrișoară","lacrisoare ei":"lăcrișoară","lacrisoare ele":"lăcrișoară","lacrisoare elor":"lăcrișoară","lacrisoare l":"lăcrișoară","lacrutia":"lăcruție","lacrutiei":"lăcruție","lacrutii":"lăcruție","lacrutiile":"lăcruție","lacrutiilor":"lăcruție","lacsagul":"lăcșag","lacsagule":"lăcșag","lacsagului":"lăcșag","lacsaguri":"lăcșag","lacsagurile":"lăcșag","lacsagurilor":"lăcșag","lacsi":"lax","lacsii":"lax","lacsoare":"lăcșor","lacsoarele":"lăcșor","lacsoarelor":"lăcșor","lacsorul":"lăcșor","lacsorule":"lăcșor","lacsorului":"lăcșor","lactacidemia":"lactacidemie","lactacidemiei":"lactacidemie","lactacidemii":"lactacidemie","lactacidemiile":"lactacidemie","lactacidemiilor":"lactacidemie","lactalbumine":"lactalbumină","lactalbuminei":"lactalbumină","lactalbuminele":"lactalbumină","lactalbuminelor":"lactalbumină","lactame":"lactamă","lactamei":"lactamă","lactati":"lactat","lactatia":"lactație","lactatiei":"lactație","lactatii":["lactații","lactat","lactații","lactație"],"lactatiile":"lactație","lactatiilor":"lactație","lactatilor":"lactat","lactatiunea":"lactațiune","lactatiuni":"lactațiune","lactatiunii":"lactațiune","lactatiunile":"lactațiune","lactatiunilor":"lactațiune","lactatul":"lactat","lactatule":"lactat","lactatului":"lactat","lactaze":"lactază","lactazei":"lactază","lactazele":"lactază","lactazelor":"lactază","lactenine":"lactenină","lacteninei":"lactenină","lactescenta":["lactescentă","lactescent","lactescenta","lactescent"],"lactescente":["lactescente","lactescent","lactescențe","lactescență"],"lactescentei":"lactescență","lactescentele":["lactescentele","lactescent","lactescențele","lactescență"],"lactescentelor":"lactescență","lactescenti":"lactescent","lactescentii":"lactescent","lactescentul":"lactescent","lactica":["lactică","lactic","lactica","lactic"],"lactice":"lactic","lacticele":"lactic","lacticemia":"lacticemie","lacticemiei":"lacticemie","lacticemii":"lacticemie","lacticemiile":"lacticemie","lacticemiilor":"lacticemie","lactici":"lactic","lacticii":"lactic","lacticul":"lactic","lactifera":["lactiferă","lactifer","lactifera","lactifer"],"lactifere":"lactifer","lactiferele":"lactifer","lactiferi":"lactifer","lactiferii":"lactifer","lactiferul":"lactifer","lacto-vegetariana":["lacto-vegetariană","lacto-vegetarian","lacto-vegetariana","lacto-vegetarian"],"lacto-vegetarianul":"lacto-vegetarian","lacto-vegetariene":"lacto-vegetarian","lacto-vegetarienele":"lacto-vegetarian","lacto-vegetarieni":"lacto-vegetarian","lacto-vegetarienii":"lacto-vegetarian","lactobacillusul":"lactobacillus","lactobacillusule":"lactobacillus","lactobacillusului":"lactobacillus","lactobarul":"lactobar","lactobarule":"lactobar","lactobarului":"lactobar","lactobioze":"lactobioză","lactobiozei":"lactobioză","lactobiozele":"lactobioză","lactobiozelor":"lactobioză","lactobutirometre":"lactobutirometru","lactobutirometrele":"lactobutirometru","lactobutirometrelor":"lactobutirometru","lactobutirometruul":"lactobutirometru","lactobutirometruule":"lactobutirometru","lactobutirometruului":"lactobutirometru","lactodensimetre":"lactodensimetru","lactodensimetrele":"lactodensimetru","lactodensimetrelor":"lactodensimetru","lactodensimetrul":"lactodensimetru","lactodensimetrule":"lactodensimetru","lactodensimetrului":"lactodensimetru","lactoducul":"lactoduc","lactoducule":"lactoduc","lactoducului":"lactoduc","lactoducuri":"lactoduc","lactoducurile":"lactoduc","lactoducurilor":"lactoduc","lactofermentatia":"lactofermentație","lactofermentatiei":"lactofermentație","lactofermentatii":"lactofermentație","lactofermentatiile":"lactofermentație","lactofermentatiilor":"lactofermentație","lactofermenti":"lactoferment","lactofermentii":"lactoferment","lactofermentilor":"lactoferment","lactofermentul":"lactoferment","lactofermentule":"lactoferment","lactofermentului":"lactoferment","lactoflavine":"lactoflavină","lactoflavinei":"lactoflavină","lactoflavinele":"lactoflavină","lactoflavinelor":"lactoflavină","lactogena":["lactogenă","lactogen","lactogena","lactogen"],"lactogene":"lactogen","lactogenele":"lactogen","lactogenetica":["lactogenetică","lactogenetic","lactogenetica","lactogenetic"],"lactogenetice":"lactogenetic","lactogeneticele":"lactogenetic","lactogenetici":"lactogenetic","lactogeneticii":"lactogenetic","lactogeneticul":"lactogenetic","lactogeneze":"lactogeneză","lactogenezei":"lactogeneză","lactogenezele":"lactogeneză","lactogenezelor":"lactogeneză","lactogeni":"lactogen","lactogenii":"lactogen","lactogenul":"lactogen","lactoglobuline":"lactoglobulină","lactoglobulinei":"lactoglobulină","lactometre":"lactometru","lactometrele":"lactometru","lactometrelor":"lactometru","lactometrul":"lactometru","lactometrule":"lactometru","lactometrului":"lactometru","lactone":"lactonă","lactonei":"lactonă","lactonele":"lactonă","lactonelor":"lactonă","lactoscoape":"lactoscop","lactoscoapele":"lactoscop","lactoscoapelor":"lactoscop","lactoscopul":"lactoscop","lactoscopule":"lactoscop","lactoscopului":"lactoscop","lactoserul":"lactoser","lactoserule":"lactoser","lactoserului":"lactoser","lactoseruri":"lactoser","lactoserurile":"lactoser","lactoserurilor":"lactoser","lactoze":"lactoză","lactozei":"lactoză","lactozele":"lactoză","lactozelor":"lactoză","lactozuria":"lactozurie","lactozuriei":"lactozurie","lactozurii":"lactozurie","lactozuriile":"lactozurie","lactozuriilor":"lactozurie","lacuia":"lăcui","lacuiai":"lăcui","lacuiam":"lăcui","lacuiati":"lăcui","lacuiau":"lăcui","lacuiesc":"lăcui","lacuieste":"lăcui","lacuiesti":"lăcui","lacuii":"lăcui","lacuim":"lăcui","lacuind":"lăcui","lacuinte":"lăcuință","lacuintei":"lăcuință","lacuintele":"lăcuință","lacuintelor":"lăcuință","lacuira":"lăcui","lacuiram":"lăcui","lacuirati":"lăcui","lacuirea":"lăcuire","lacuiri":"lăcuire","lacuirii":"lăcuire","lacuirile":"lăcuire","lacuirilor":"lăcuire","lacuise":"lăcui","lacuisem":"lăcui","lacuisera":"lăcui","lacuiseram":"lăcui","lacuiserati":"lăcui","lacuisesi":"lăcui","lacuisi":"lăcui","lacuit":"lăcui","lacuita":["lăcuită","lăcuit","lăcuita","lăcuit"],"lacuite":"lăcuit","lacuitele":"lăcuit","lacuiti":["lăcuiți","lăcui","lăcuiți","lăcuit"],"lacuitii":"lăcuit","lacuitoarea":"lăcuitoare","lacuitoarei":"lăcuitoare","lacuitoarele":"lăcuitoare","lacuitoarelor":"lăcuitoare","lacuitori":"lăcuitor","lacuitorii":"lăcuitor","lacuitorilor":"lăcuitor","lacuitorul":"lăcuitor","lacuitorule":"lăcuitor","lacuitorului":"lăcuitor","lacuitul":"lăcuit","lacuituri":"lăcuitură","lacuiturii":"lăcuitură","lacuiturile":"lăcuitură","lacuiturilor":"lăcuitură","lacul":"lac","lacule":"lac","laculete":"lăculeț","laculetele":"lăculeț","laculetelor":"lăculeț","laculetul":"lăculeț","laculetule":"lăculeț","laculetului":"lăculeț","lacului":"lac","lacunara":["lacunară","lacunar","lacunara","lacunar"],"lacunare":"lacunar","lacunarele":"lacunar","lacunari":"lacunar","lacunarii":"lacunar","lacunarul":"lacunar","lacune":"lacună","lacunei":"lacună","lacunele":"lacună","lacunelor":"lacună","lacunoasa":["lacunoasă","lacunos","lacunoasa","lacunos"],"lacunoase":"lacunos","lacunoasele":"lacunos","lacunosi":"lacunos","lacunosii":"lacunos","lacunosul":"lacunos","lacuri":"lac","lacuri de unghii":"lac de unghii","lacurile":"lac","lacurilor":"lac","lacusoare":"lăcușor","lacusore":"lăcușor","lacusorele":"lăcușor","lacusorelor":"lăcușor","lacusorul":"lăcușor","lacusorule":"lăcușor","lacusorului":"lăcușor","lacustari":"lăcustar","lacustarii":"lăcustar","lacustarilor":"lăcustar","lacustarul":"lăcustar","lacustarule":"lăcustar","lacustarului":"lăcustar","lacuste":"lăcustă","lacustei":"lăcustă","lacustele":"lăcustă","lacustelor":"lăcustă","lacustra":["lacustră","lacustru","lacustra","lacustru"],"lacustre":"lacustru","lacustrele":"lacustru","lacustri":"lacustru","lacustrii":"lacustru","lacustritatea":"lacustritate","lacustritati":"lacustritate","lacustritatii":"lacustritate","lacustritatile":"lacustritate","lacustritatilor":"lacustritate","lacustrul":"lacustru","lacute":"lăcuț","lacutele":"lăcuț","lacutelor":"lăcuț","lacutul":"lăcuț","lacutule":"lăcuț","lacutului":"lăcuț","ladari":"lădar","ladarii":"lădar","ladarilor":"lădar","ladarul":"lădar","ladarule":"lădar","ladarului":"lădar","ladatia":"lădăție","ladatiei":"lădăție","ladatii":"lădăție","ladatiile":"lădăție","ladatiilor":"lădăție","ladatui":"lădățuie","ladatuia":"lădățuie","ladatuici":"lădățuică","ladatuicii":"lădățuică","ladatuicile":"lădățuică","ladatuicilor":"lădățuică","ladatuiei":"lădățuie","ladatuii":"lădățuie","ladatuiile":"lădățuie","ladatuiilor":"lădățuie","ladicicele":"lădicică","ladicicelei":"lădicică","ladicicelele":"lădicică","ladicicelelor":"lădicică","ladicioare":"lădicioară","ladicioarei":"lădicioară","ladicioarele":"lădicioară","ladicioarelor":"lădicioară","ladine":"ladină","ladinei":"ladină","ladinele":"ladină","ladinelor":"ladină","ladinoul":"ladino","ladinoule":"ladino","ladinoului":"ladino","ladioare":"lădioară","ladioarei":"lădioară","ladioarele":"lădioară","ladioarelor":"lădioară","ladisoare":"lădișoară","ladisoarei":"lădișoară","ladisoarele":"lădișoară","ladisoarelor":"lădișoară","ladite":"lădiță","laditei":"lădiță","laditele":"lădiță","laditelor":"lădiță","ladoaie":"lădoi","ladoaiele":"lădoi","ladoaielor":"lădoi","ladoiul":"lădoi","ladoiule":"lădoi","ladoiului":"lădoi","laduci":"lăducă","laducii":"lăducă","laducile":"lăducă","laducilor":"lăducă","ladui":"lăduie","laduia":"lăduie","laduii":"lăduie","laduile":"lăduie","laduilor":"lăduie","ladunci":"lăduncă","laduncii":"lăduncă","laduncile":"lăduncă","laduncilor":"lăduncă","ladute":"lăduță","ladutei":"lăduță","ladutele":"lăduță","ladutelor":"lăduță","ladutia":"lăduție","ladutiei":"lăduție","ladutii":"lăduție","ladutiile":"lăduție","ladutiilor":"lăduție","lafaia":"lăfăi","lafaiai":"lăfăi","lafaiam":"lăfăi","lafaiati":"lăfăi","lafaiau":"lăfăi","lafaie":"lăfăi","lafaiele":"lăfăială","lafaielei":"lăfăială","lafaielele":"lăfăială","lafaielelor":"lăfăială","lafaieli":"lăfăială","lafaii":"lăfăi","lafaim":"lăfăi","lafaind":"lăfăi","lafaira":"lăfăi","lafairam":"lăfăi","lafairati":"lăfăi","lafaise":"lăfăi","lafaisem":"lăfăi","lafaisera":"lăfăi","lafaiseram":"lăfăi","lafaiserati":"lăfăi","lafaisesi":"lăfăi","lafaisi":"lăfăi","lafait":"lăfăi","lafaiti":"lăfăi","lafirele":"lafire","lafirelor":"lafire","laful":"laf","lafule":"laf","lafului":"laf","lafuri":"laf","lafurile":"laf","lafurilor":"laf","lagane":"lagană","laganei":"lagană","laganele":"lagană","laganelor":"lagană","lagare":"lagăr","lagare de concentrare":"lagăr de concentrare","lagare de exterminare":"lagăr de exterminare","lagarele":"lagăr","lagarelor":"lagăr","lagaria":"lăgărie","lagariei":"lăgărie","lagarii":"lăgărie","lagariile":"lăgărie","lagariilor":"lăgărie","lagarul":"lagăr","lagarule":"lagăr","lagarului":"lagăr","lagatori":"lagator","lagatorii":"lagator","lagatorilor":"lagator","lagatorul":"lagator","lagatorule":"lagator","lagatorului":"lagator","lagiverdeul":"lagiverde","lagiverdeule":"lagiverde","lagiverdeului":"lagiverde","lagiverzi":"lagiverde","lagiverzile":"lagiverde","lagiverzilor":"lagiverde","lagoftalmia":"lagoftalmie","lagoftalmiei":"lagoftalmie","lagoftalmii":"lagoftalmie","lagonite":"lagoniță","lagonitei":"lagoniță","lagonitele":"lagoniță","lagonitelor":"lagoniță","lagumgii":"lagumgiu","lagumgiii":"lagumgiu","lagumgiilor":"lagumgiu","lagumgioaice":"lagumgioaică","lagumgioaicei":"lagumgioaică","lagumgioaicele":"lagumgioaică","lagumgioaicelor":"lagumgioaică","lagumgiuul":"lagumgiu","lagumgiuule":"lagumgiu","lagumgiuului":"lagumgiu","lagumul":"lagum","lagumule":"lagum","lagumului":"lagum","lagumuri":"lagum","lagumurile":"lagum","lagumurilor":"lagum","lagunara":["lagunară","lagunar","lagunara","lagunar"],"lagunare":"lagunar","lagunarele":"lagunar","lagunari":"lagunar","lagunarii":"lagunar","lagunarul":"lagunar","lagune":"lagună","lagunei":"lagună","lagunele":"lagună","lagunelor":"lagună","lagunoasa":["lagunoasă","lagunos","lagunoasa","lagunos"],"lagunoase":"lagunos","lagunoasele":"lagunos","lagunosi":"lagunos","lagunosii":"lagunos","lagunosul":"lagunos","lahania":"lahaniu","lahanie":"lahaniu","lahanii":"lahaniu","lahaniii":"lahaniu","lahaniile":"lahaniu","lahaniul":"lahaniu","lahtare":"lahtară","lahtarei":"lahtară","lahtarele":"lahtară","lahtarelor":"lahtară","lahtaris":"lahtarisi","lahtarise":"lahtarisi","lahtarisea":"lahtarisi","lahtariseai":"lahtarisi","lahtariseam":"lahtarisi","lahtariseati":"lahtarisi","lahtariseau":"lahtarisi","lahtarisie":"lahtarisi","lahtarisii":"lahtarisi","lahtarisim":"lahtarisi","lahtarisind":"lahtarisi","lahtarisira":"lahtarisi","lahtarisiram":"lahtarisi","lahtarisirati":"lahtarisi","lahtarisise":"lahtarisi","lahtarisisem":"lahtarisi","lahtarisisera":"lahtarisi","lahtarisiseram":"lahtarisi","lahtarisiserati":"lahtarisi","lahtarisisesi":"lahtarisi","lahtarisisi":"lahtarisi","lahtarisit":"lahtarisi","lahtarisiti":"lahtarisi","lahuze":"lăhuză","lahuzei":"lăhuză","lahuzele":"lăhuză","lahuzelor":"lăhuză","lai":"la","laia":["lăia","la","laia","lai"],"laibarace":"lăibărac","laibaracele":"lăibărac","laibaracelor":"lăibărac","laibaracul":"lăibărac","laibaracule":"lăibărac","laibaracului":"lăibărac","laibarase":["laibărașe","laibăraș","lăibărașe","lăibăraș"],"laibarasele":["laibărașele","laibăraș","lăibărașele","lăibăraș"],"laibaraselor":["laibărașelor","laibăraș","lăibărașelor","lăibăraș"],"laibarasul":["laibărașul","laibăraș","lăibărașul","lăibăraș"],"laibarasule":["laibărașule","laibăraș","lăibărașule","lăibăraș"],"laibarasului":["laibărașului","laibăraș","lăibărașului","lăibăraș"],"laibarelul":"lăibărel","laibarelule":"lăibărel","laibarelului":"lăibărel","laibarici":"lăibărică","laibaricii":"lăibărică","laibaricile":"lăibărică","laibaricilor":"lăibărică","laibarite":"lăibăriță","laibaritei":"lăibăriță","laibaritele":"lăibăriță","laibaritelor":"lăibăriță","laibaruce":"lăibăruc","laibarucele":"lăibăruc","laibarucelor":"lăibăruc","laibaruci":"lăibărucă","laibarucii":"lăibărucă","laibarucile":"lăibărucă","laibarucilor":"lăibărucă","laibarucul":"lăibăruc","laibarucule":"lăibăruc","laibarucului":"lăibăruc","laibarute":"lăibăruț","laibarutele":"lăibăruț","laibarutelor":"lăibăruț","laibarutul":"lăibăruț","laibarutule":"lăibăruț","laibarutului":"lăibăruț","laica":["laică","laic","laica","laic"],"laicatul":"laicat","laicatule":"laicat","laicatului":"laicat","laice":"laic","laicele":"laic","laici":"laic","laicii":"laic","laicioare":"lăicioară","laicioarei":"lăicioară","laicioarele":"lăicioară","laicioarelor":"lăicioară","laicismul":"laicism","laicismule":"laicism","laicismului":"laicism","laicitatea":"laicitate","laicitati":"laicitate","laicitatii":"laicitate","laicizai":"laiciza","laicizam":["laicizăm","laiciza","laicizam","laiciza"],"laicizand":"laiciza","laicizanta":["laicizantă","laicizant","laicizanta","laicizant"],"laicizante":"laicizant","laicizantele":"laicizant","laicizanti":"laicizant","laicizantii":"laicizant","laicizantul":"laicizant","laicizara":"laiciza","laicizaram":"laiciza","laicizarati":"laiciza","laicizarea":"laicizare","laicizari":"laicizare","laicizarii":"laicizare","laicizarile":"laicizare","laicizarilor":"laicizare","laicizase":"laiciza","laicizasem":"laiciza","laicizasera":"laiciza","laicizaseram":"laiciza","laicizaserati":"laiciza","laicizasesi":"laiciza","laicizasi":"laiciza","laicizat":"laiciza","laicizata":["laicizată","laicizat","laicizata","laicizat"],"laicizate":"laicizat","laicizatele":"laicizat","laicizati":["laicizați","laiciza","laicizați","laicizat"],"laicizatii":"laicizat","laicizatul":"laicizat","laicizau":"laiciza","laicizeaza":"laiciza","laicizez":"laiciza","laicizezi":"laiciza","laicul":"laic","laidai":"laidău","laidaii":"laidău","laidailor":"laidău","laidauul":"laidău","laidauule":"laidău","laidauului":"laidău","laie":["laie","la","laie","lai"],"laieata":["lăieață","lăieț","lăieața","lăieț"],"laiesi":"lăieș","laiesii":"lăieș","laiesilor":"lăieș","laiesite":"lăieșiță","laiesitei":"lăieșiță","laiesitele":"lăieșiță","laiesitelor":"lăieșiță","laiesul":"lăieș","laiesule":"lăieș","laiesului":"lăieș","laiete":"lăieț","laietele":"lăieț","laieti":"lăieț","laietii":"lăieț","laietilor":"lăieț","laietul":"lăieț","laietule":"lăieț","laietului":"lăieț","laii":"lai","laile":"lai","lainice":"lainică","lainicea":"lăinici","lainiceai":"lăinici","lainiceam":"lăinici","lainiceati":"lăinici","lainiceau":"lăinici","lainicei":"lainică","lainicele":"lainică","lainicelor":"lainică","lainicesc":"lăinici","lainiceste":"lăinici","lainicesti":"lăinici","lainicii":"lăinici","lainicim":"lăinici","lainicind":"lăinici","lainicira":"lăinici","lainiciram":"lăinici","lainicirati":"lăinici","lainicise":"lăinici","lainicisem":"lăinici","lainicisera":"lăinici","lainiciseram":"lăinici","lainiciserati":"lăinici","lainicisesi":"lăinici","lainicisi":"lăinici","lainicit":"lăinici","lainiciti":"lăinici","lainti":"laint","laintii":"laint","laintilor":"laint","laintuhul":"laintuh","laintuhule":"laintuh","laintuhului":"laintuh","laintul":"laint","laintule":"laint","laintului":"laint","laiote":"laiotă","laiotei":"laiotă","laiotele":"laiotă","laiotelor":"laiotă","laiprime":"lăiprimă","laiprimei":"lăiprimă","laiprimele":"lăiprimă","laiprimelor":"lăiprimă","laitani":"laităn","laitanii":"laităn","laitanilor":"laităn","laitanul":"laităn","laitanule":"laităn","laitanului":"laităn","laite":["laițe","laiță","lăițe","lăiță"],"laitei":["laiței","laiță","lăiței","lăiță"],"laitele":["laițele","laiță","lăițele","lăiță"],"laitelor":["laițelor","laiță","lăițelor","lăiță"],"laitmotive":"laitmotiv","laitmotivele":"laitmotiv","laitmotivelor":"laitmotiv","laitmotivul":"laitmotiv","laitmotivule":"laitmotiv","laitmotivului":"laitmotiv","laiul":"lai","lalanghiti":"lalanghit","lalanghitii":"lalanghit","lalanghitilor":"lalanghit","lalanghitul":"lalanghit","lalanghitule":"lalanghit","lalanghitului":"lalanghit","lalaul":"lala","lalaule":"lala","lalaului":"lala","laleaua":"lalea","lalele":"lalea","lalelei":"lalea","lalelele":"lalea","lalelelor":"lalea","lalopatia":"lalopatie","lalopatiei":"lalopatie","lalopatii":"lalopatie","lam":["lăm","la","lam","la"],"lamai":"lămâie","lamai verzi":"lămâie verde","lamaia":"lămâie","lamaiasi":"lămâiaș","lamaiasii":"lămâiaș","lamaiasilor":"lămâiaș","lamaiasul":"lămâiaș","lamaiasule":"lămâiaș","lamaiasului":"lămâiaș","lamaica":["lamaică","lamaic","lamaica","lamaic"],"lamaice":"lamaic","lamaicele":"lamaic","lamaici":"lamaic","lamaicii":"lamaic","lamaicul":"lamaic","lamaieri":"lămâier","lamaierii":"lămâier","lamaierilor":"lămâier","lamaierul":"lămâier","lamaierule":"lămâier","lamaierului":"lămâier","lamaii":["lămâii","lămâi","lămâii","lămâie"],"lamaile":"lămâie","lamailor":["lămâilor","lămâi","lămâilor","lămâie"],"lamaioare":"lămâioară","lamaioarei":"lămâioară","lamaioarele":"lămâioară","lamaioarelor":"lămâioară","lamaioasa":["lămâioasă","lămâios","lămâioasa","lămâios"],"lamaioase":"lămâios","lamaioasele":"lămâios","lamaiosi":"lămâios","lamaiosii":"lămâios","lamaiosul":"lămâios","lamaismul":"lamaism","lamaismule":"lamaism","lamaismului":"lamaism","lamaista":["lamaistă","lamaist","lamaista","lamaist"],"lamaiste":["lamaiste","lamaist","lamaiste","lamaistă"],"lamaistei":"lamaistă","lamaistele":["lamaistele","lamaist","lamaistele","lamaistă"],"lamaistelor":"lamaistă","lamaisti":"lamaist","lamaistii":"lamaist","lamaistilor":"lamaist","lamaistul":"lamaist","lamaistule":"lamaist","lamaistului":"lamaist","lamaite":"lămâiță","lamaitei":"lămâiță","lamaitele":"lămâiță","lamaitelor":"lămâiță","lamaiul":"lămâi","lamaiule":"lămâi","lamaiului":"lămâi","lamantini":"lamantin","lamantinii":"lamantin","lamantinilor":"lamantin","lamantinul":"lamantin","lamantinule":"lamantin","lamantinului":"lamantin","lamarckisme":"lamarckism","lamarckismele":"lamarckism","lamarckismelor":"lamarckism","lamarckismul":"lamarckism","lamarckismule":"lamarckism","lamarckismului":"lamarckism","lamarckiste":"lamarckistă","lamarckistei":"lamarckistă","lamarckistele":"lamarckistă","lamarckistelor":"lamarckistă","lamarckisti":"lamarckist","lamarckistii":"lamarckist","lamarckistilor":"lamarckist","lamarckistul":"lamarckist","lamarckistule":"lamarckist","lamarckistului":"lamarckist","lamartiniana":["lamartiniană","lamartinian","lamartiniana","lamartinian"],"lamartinianul":"lamartinian","lamartiniene":"lamartinian","lamartinienele":"lamartinian","lamartinieni":"lamartinian","lamartinienii":"lamartinian","lamartinista":["lamartinistă","lamartinist","lamartinista","lamartinist"],"lamartiniste":["lamartiniste","lamartinist","lamartiniste","lamartinistă"],"lamartinistei":"lamartinistă","lamartinistele":["lamartinistele","lamartinist","lamartinistele","lamartinistă"],"lamartinistelor":"lamartinistă","lamartinisti":"lamartinist","lamartinistii":"lamartinist","lamartinistilor":"lamartinist","lamartinistul":"lamartinist","lamartinistule":"lamartinist","lamartinistului":"lamartinist","lamaseria":"lamaserie","lamaseriei":"lamaserie","lamaserii":"lamaserie","lamaseriile":"lamaserie","lamaseriilor":"lamaserie","lamatis":"lamatisi","lamatise":"lamatisi","lamatisea":"lamatisi","lamatiseai":"lamatisi","lamatiseam":"lamatisi","lamatiseati":"lamatisi","lamatiseau":"lamatisi","lamatisie":"lamatisi","lamatisii":"lamatisi","lamatisim":"lamatisi","lamatisind":"lamatisi","lamatisira":"lamatisi","lamatisiram":"lamatisi","lamatisirati":"lamatisi","lamatisise":"lamatisi","lamatisisem":"lamatisi","lamatisisera":"lamatisi","lamatisiseram":"lamatisi","lamatisiserati":"lamatisi","lamatisisesi":"lamatisi","lamatisisi":"lamatisi","lamatisit":"lamatisi","lamatisiti":"lamatisi","lamaul":"lama","lamaule":"lama","lamaului":"lama","lambade":"lambadă","lambadei":"lambadă","lambadele":"lambadă","lambadelor":"lambadă","lambdacismul":"lambdacism","lambdacismule":"lambdacism","lambdacismului":"lambdacism","lambdai":"lambda","lambdalor":"lambda","lambdaul":"lambda","lambdaule":"lambda","lambdaului":"lambda","lambe":"lambă","lambei":"lambă","lambele":"lambă","lambelor":"lambă","lamberti":"lambert","lambertii":"lambert","lambertilor":"lambert","lambertul":"lambert","lambertule":"lambert","lambertului":"lambert","lambicaris":"lambicarisi","lambicarise":"lambicarisi","lambicarisea":"lambicarisi","lambicariseai":"lambicarisi","lambicariseam":"lambicarisi","lambicariseati":"lambicarisi","lambicariseau":"lambicarisi","lambicarisie":"lambicarisi","lambicarisii":"lambicarisi","lambicarisim":"lambicarisi","lambicarisind":"lambicarisi","lambicarisira":"lambicarisi","lambicarisiram":"lambicarisi","lambicarisirati":"lambicarisi","lambicarisise":"lambicarisi","lambicarisisem":"lambicarisi","lambicarisisera":"lambicarisi","lambicarisiseram":"lambicarisi","lambicarisiserati":"lambicarisi","lambicarisisesi":"lambicarisi","lambicarisisi":"lambicarisi","lambicarisit":"lambicarisi","lambicarisiti":"lambicarisi","lambicata":["lambicată","lambicat","lambicata","lambicat"],"lambicate":"lambicat","lambicatele":"lambicat","lambicati":"lambicat","lambicatii":"lambicat","lambicatul":"lambicat","lambicul":"lambic","lambicule":"lambic","lambicului":"lambic","lambite":"lămbiță","lambitei":"lămbiță","lambitele":"lămbiță","lambitelor":"lămbiță","lamblia":"lamblie","lambliei":"lamblie","lamblieze":"lambliază","lambliezei":"lambliază","lambliezele":"lambliază","lambliezelor":"lambliază","lamblii":"lamblie","lambliile":"lamblie","lambliilor":"lamblie","lambrechine":"lambrechin","lambrechinele":"lambrechin","lambrechinelor":"lambrechin","lambrechinul":"lambrechin","lambrechinule":"lambrechin","lambrechinului":"lambrechin","lambrisai":"lambrisa","lambrisam":["lambrisăm","lambrisa","lambrisam","lambrisa"],"lambrisand":"lambrisa","lambrisara":"lambrisa","lambrisaram":"lambrisa","lambrisarati":"lambrisa","lambrisase":"lambrisa","lambrisasem":"lambrisa","lambrisasera":"lambrisa","lambrisaseram":"lambrisa","lambrisaserati":"lambrisa","lambrisasesi":"lambrisa","lambrisasi":"lambrisa","lambrisat":"lambrisa","lambrisata":["lambrisată","lambrisat","lambrisata","lambrisat"],"lambrisate":"lambrisat","lambrisatele":"lambrisat","lambrisati":["lambrisați","lambrisa","lambrisați","lambrisat"],"lambrisatii":"lambrisat","lambrisatul":"lambrisat","lambrisau":"lambrisa","lambriseaza":"lambrisa","lambriseria":"lambriserie","lambriseriei":"lambriserie","lambriserii":"lambriserie","lambriseriile":"lambriserie","lambriseriilor":"lambriserie","lambrisez":"lambrisa","lambrisezi":"lambrisa","lambriul":"lambriu","lambriule":"lambriu","lambriului":"lambriu","lambriuri":"lambriu","lambriurile":"lambriu","lambriurilor":"lambriu","lame":"lamă","lamei":"lamă","lamelara":["lamelară","lamelar","lamelara","lamelar"],"lamelare":"lamelar","lamelarea":"lamelare","lamelarele":"lamelar","lamelari":["lamelari","lamelar","lamelări","lamelare"],"lamelarii":["lamelarii","lamelar","lamelării","lamelare"],"lamelarile":"lamelare","lamelarilor":"lamelare","lamelarul":"lamelar","lamelata":["lamelată","lamelat","lamelata","lamelat"],"lamelate":"lamelat","lamelatele":"lamelat","lamelati":"lamelat","lamelatia":"lamelație","lamelatiei":"lamelație","lamelatii":["lamelații","lamelat","lamelații","lamelație"],"lamelatiile":"lamelație","lamelatiilor":"lamelație","lamelatul":"lamelat","lamele":["lamele","lamă","lamele","lamelă"],"lamelei":"lamelă","lamelele":"lamelă","lamelelor":"lamelă","lamelibranhiata":["lamelibranhiată","lamelibranhiat","lamelibranhiata","lamelibranhiat"],"lamelibranhiate":"lamelibranhiat","lamelibranhiatele":"lamelibranhiat","lamelibranhiati":"lamelibranhiat","lamelibranhiatii":"lamelibranhiat","lamelibranhiatilor":"lamelibranhiat","lamelibranhiatul":"lamelibranhiat","lamelibranhiatule":"lamelibranhiat","lamelibranhiatului":"lamelibranhiat","lamelicorna":["lamelicornă","lamelicorn","lamelicorna","lamelicorn"],"lamelicorne":"lamelicorn","lamelicornele":"lamelicorn","lamelicorni":"lamelicorn","lamelicornii":"lamelicorn","lamelicornile":"lamelicorn","lamelicornilor":"lamelicorn","lamelicornul":"lamelicorn","lamelicornule":"lamelicorn","lamelicornului":"lamelicorn","lameliforma":["lameliformă","lameliform","lameliforma","lameliform"],"lameliforme":"lameliform","lameliformele":"lameliform","lameliformi":"lameliform","lameliformii":"lameliform","lameliformul":"lameliform","lameloasa":["lameloasă","lamelos","lameloasa","lamelos"],"lameloase":"lamelos","lameloasele":"lamelos","lamelor":"lamă","lamelosi":"lamelos","lamelosii":"lamelos","lamelosul":"lamelos","lamentabila":["lamentabilă","lamentabil","lamentabila","lamentabil"],"lamentabile":"lamentabil","lamentabilele":"lamentabil","lamentabili":"lamentabil","lamentabilii":"lamentabil","lamentabilul":"lamentabil","lamentai":"lamenta","lamentam":["lamentăm","lamenta","lamentam","lamenta"],"lamentand":"lamenta","lamentara":"lamenta","lamentaram":"lamenta","lamentarati":"lamenta","lamentarea":"lamentare","lamentari":"lamentare","lamentarii":"lamentare","lamentarile":"lamentare","lamentarilor":"lamentare","lamentase":"lamenta","lamentasem":"lamenta","lamentasera":"lamenta","lamentaseram":"lamenta","lamentaserati":"lamenta","lamentasesi":"lamenta","lamentasi":"lamenta","lamentat":"lamenta","lamentati":"lamenta","lamentatia":"lamentație","lamentatiei":"lamentație","lamentatii":"lamentație","lamentatiile":"lamentație","lamentatiilor":"lamentație","lamentatiunea":"lamentațiune","lamentatiuni":"lamentațiune","lamentatiunii":"lamentațiune","lamentatiunile":"lamentațiune","lamentatiunilor":"lamentațiune","lamentau":"lamenta","lamente":"lament","lamenteaza":"lamenta","lamentele":"lament","lamentelor":"lament","lamentez":"lamenta","lamentezi":"lamenta","lamentul":"lament","lamentule":"lament","lamentului":"lament","lamia":"lamie","lamiei":"lamie","lamii":["lămîi","lămâi","lamii","lamie"],"lamiie":"lămâie","lamiile":"lamie","lamiilor":"lamie","laminai":"lamina","laminajul":"laminaj","laminajule":"laminaj","laminajului":"laminaj","laminam":["laminăm","lamina","laminam","lamina"],"laminand":"lamina","laminara":["laminară","lamina","laminară","laminar","laminara","laminar"],"laminaram":"lamina","laminarati":"lamina","laminare":"laminar","laminarea":"laminare","laminarele":"laminar","laminari":["laminari","laminar","laminări","laminare"],"laminarii":["laminarii","laminar","laminării","laminare"],"laminarile":"laminare","laminarilor":"laminare","laminarul":"laminar","laminase":"lamina","laminasem":"lamina","laminasera":"lamina","laminaseram":"lamina","laminaserati":"lamina","laminasesi":"lamina","laminasi":"lamina","laminat":"lamina","laminata":["laminată","laminat","laminata","laminat"],"laminate":"laminat","laminatele":"laminat","laminati":["laminați","lamina","laminați","laminat"],"laminatii":"laminat","laminatoarea":"laminatoare","laminatoarei":"laminatoare","laminatoarele":"laminatoare","laminatoarelor":"laminatoare","laminatul":"laminat","laminau":"lamina","lamine":"lamină","lamineaza":"lamina","laminectomia":"laminectomie","laminectomiei":"laminectomie","laminectomii":"laminectomie","laminectomiile":"laminectomie","laminectomiilor":"laminectomie","laminei":"lamină","laminele":"lamină","laminelor":"lamină","laminez":"lamina","laminezi":"lamina","laminoare":"laminor","laminoarele":"laminor","laminoarelor":"laminor","laminoriste":"laminoristă","laminoristei":"laminoristă","laminoristele":"laminoristă","laminoristelor":"laminoristă","laminoristi":"laminorist","laminoristii":"laminorist","laminoristilor":"laminorist","laminoristul":"laminorist","laminoristule":"laminorist","laminoristului":"laminorist","laminorul":"laminor","laminorule":"laminor","laminorului":"laminor","lamosteale":"lămosteală","lamostealei":"lămosteală","lampadare":"lampadar","lampadarele":"lampadar","lampadarelor":"lampadar","lampadarul":"lampadar","lampadarule":"lampadar","lampadarului":"lampadar","lampade":"lampadă","lampadedromia":"lampadedromie","lampadedromiei":"lampadedromie","lampadedromii":"lampadedromie","lampadedromiile":"lampadedromie","lampadedromiilor":"lampadedromie","lampadei":"lampadă","lampadele":"lampadă","lampadelor":"lampadă","lampagii":"lampagiu","lampagiii":"lampagiu","lampagiilor":"lampagiu","lampagiul":"lampagiu","lampagiule":"lampagiu","lampagiului":"lampagiu","lamparia":"lămpărie","lampariei":"lămpărie","lamparii":"lămpărie","lampariile":"lămpărie","lampariilor":"lămpărie","lampase":"lămpaș","lampasei":"lămpaș","lampasele":"lămpășel","lampaselele":"lămpășel","lampaselelor":"lămpășel","lampaselor":"lămpaș","lampaselul":"lămpășel","lampaselule":"lămpășel","lampaselului":"lămpășel","lampasul":"lămpaș","lampasule":"lămpaș","lampasului":"lămpaș","lampasutul":"lămpășuț","lampasutule":"lămpășuț","lampasutului":"lămpășuț","lampi":"lampă","lampi cu halogen":"lampă cu halogen","lampi cu incandescenta":"lampă cu incandescență","lampi cu plasma":"lampă cu plasmă","lampi de veghe":"lampă de veghe","lampii":"lampă","lampile":"lampă","lampilor":"lampă","lampioane":"lampion","lampioanele":"lampion","lampioanelor":"lampion","lampionul":"lampion","lampionule":"lampion","lampionului":"lampion","lampisoare":"lămpișoară","lampisoarei":"lămpișoară","lampisoarele":"lămpișoară","lampisoarelor":"lămpișoară","lampisteria":"lampisterie","lampisteriei":"lampisterie","lampisterii":"lampisterie","lampisteriile":"lampisterie","lampisteriilor":"lampisterie","lampisti":"lampist","lampistii":"lampist","lampistilor":"lampist","lampistul":"lampist","lampistule":"lampist","lampistului":"lampist","lampite":"lămpiță","lampitei":"lămpiță","lampitele":"lămpiță","lampitelor":"lămpiță","lampoaie":"lămpoi","lampoaiele":"lămpoi","lampoaielor":"lămpoi","lampoiul":"lămpoi","lampoiule":"lămpoi","lampoiului":"lămpoi","lamprete":"lampretă","lampretei":"lampretă","lampretele":"lampretă","lampretelor":"lampretă","lamprofire":"lamprofir","lamprofirele":"lamprofir","lamprofirelor":"lamprofir","lamprofirul":"lamprofir","lamprofirule":"lamprofir","lamprofirului":"lamprofir","lampusoare":"lămpușoară","lampusoarei":"lămpușoară","lampusoarele":"lămpușoară","lampusoarelor":"lămpușoară","lampusul":"lămpuș","lampusule":"lămpuș","lampusului":"lămpuș","lampute":"lămpuță","lamputei":"lămpuță","lamputele":"lămpuță","lamputelor":"lămpuță","lamurea":"lămuri","lamureai":"lămuri","lamuream":"lămuri","lamureati":"lămuri","lamureau":"lămuri","lamurele":"lămureală","lamurelei":"lămureală","lamurelele":"lămureală","lamurelelor":"lămureală","lamureli":"lămureală","lamuresc":"lămuri","lamureste":"lămuri","lamuresti":"lămuri","lamuri":"lamură","lamuria":"lămuriu","lamurie":"lămuriu","lamurii":["lamurii","lamură","lămurii","lămuri","lămurii","lămuriu"],"lamuriii":"lămuriu","lamuriile":"lămuriu","lamurile":"lamură","lamurilor":"lamură","lamurim":"lămuri","lamurind":"lămuri","lamurinte":"lămurință","lamurintei":"lămurință","lamurintele":"lămurință","lamurintelor":"lămurință","lamurira":"lămuri","lamuriram":"lămuri","lamurirati":"lămuri","lamurirea":"lămurire","lamuriri":"lămurire","lamuririi":"lămurire","lamuririle":"lămurire","lamuririlor":"lămurire","lamurise":"lămuri","lamurisem":"lămuri","lamurisera":"lămuri","lamuriseram":"lămuri","lamuriserati":"lămuri","lamurisesi":"lămuri","lamurisi":"lămuri","lamurit":"lămuri","lamurita":["lămurită","lămurit","lămurita","lămurit"],"lamurite":"lămurit","lamuritele":"lămurit","lamuriti":["lămuriți","lămuri","lămuriți","lămurit"],"lamuritii":"lămurit","lamuritoare":"lămuritor","lamuritoarea":"lămuritor","lamuritoarele":"lămuritor","lamuritori":"lămuritor","lamuritorii":"lămuritor","lamuritorul":"lămuritor","lamuritul":"lămurit","lamuriul":"lămuriu","lanametre":"lanametru","lanametrele":"lanametru","lanametrelor":"lanametru","lanametrul":"lanametru","lanametrule":"lanametru","lanametrului":"lanametru","lanari":"lânar","lanaria":"lânărie","lanariei":"lânărie","lanarii":["lânarii","lânar","lânării","lânărie"],"lanariile":"lânărie","lanariilor":"lânărie","lanarilor":"lânar","lanarite":"lânăriță","lanaritei":"lânăriță","lanarul":"lânar","lanarule":"lânar","lanarului":"lânar","lanata":["lanată","lanat","lanata","lanat"],"lanate":"lanat","lanatele":"lanat","lanati":"lanat","lanatii":"lanat","lanatul":"lanat","lancasteriana":["lancasteriană","lancasterian","lancasteriana","lancasterian"],"lancasterianul":"lancasterian","lancasterianule":"lancasterian","lancasterianului":"lancasterian","lancasteriene":["lancasteriene","lancasterian","lancasteriene","lancasteriană"],"lancasterienei":"lancasteriană","lancasterienele":["lancasterienele","lancasterian","lancasterienele","lancasteriană"],"lancasterienelor":"lancasteriană","lancasterieni":"lancasterian","lancasterienii":"lancasterian","lancasterienilor":"lancasterian","lancavia":"lancaviu","lancavie":"lancaviu","lancavii":"lancaviu","lancaviii":"lancaviu","lancaviile":"lancaviu","lancaviul":"lancaviu","lancea":"lance","lanceda":["lâncedă","lânced","lânceda","lânced"],"lancede":"lânced","lancedele":"lânced","lancedul":"lânced","lanceolata":["lanceolată","lanceolat","lanceolata","lanceolat"],"lanceolate":"lanceolat","lanceolatele":"lanceolat","lanceolati":"lanceolat","lanceolatii":"lanceolat","lanceolatul":"lanceolat","lanceri":"lăncer","lancerii":"lăncer","lancerilor":"lăncer","lancerul":"lăncer","lancerule":"lăncer","lancerului":"lăncer","lancezanda":["lâncezândă","lâncezând","lâncezânda","lâncezând"],"lancezande":"lâncezând","lancezandele":"lâncezând","lancezandul":"lâncezând","lancezanzi":"lâncezând","lancezanzii":"lâncezând","lancezea":"lâncezi","lancezeai":"lâncezi","lancezeam":"lâncezi","lancezeati":"lâncezi","lancezeau":"lâncezi","lancezesc":"lâncezi","lancezeste":"lâncezi","lancezesti":"lâncezi","lancezi":"lânced","lancezia":["lâncezia","lâncezie","lâncezia","lânceziu"],"lancezie":"lânceziu","lanceziei":"lâncezie","lancezii":["lâncezii","lânced","lâncezii","lâncezi","lâncezii","lâncezie","lâncezii","lânceziu"],"lanceziii":"lânceziu","lanceziile":["lânceziile","lâncezie","lânceziile","lânceziu"],"lanceziilor":"lâncezie","lancezim":"lâncezi","lancezimea":"lâncezime","lancezimi":"lâncezime","lancezimii":"lâncezime","lancezimile":"lâncezime","lancezimilor":"lâncezime","lancezind":"lâncezi","lancezira":"lâncezi","lanceziram":"lâncezi","lancezirati":"lâncezi","lancezirea":"lâncezire","lanceziri":"lâncezire","lancezirii":"lâncezire","lancezise":"lâncezi","lancezisem":"lâncezi","lancezisera":"lâncezi","lanceziseram":"lâncezi","lanceziserati":"lâncezi","lancezisesi":"lâncezi","lancezisi":"lâncezi","lancezit":"lâncezi","lanceziti":"lâncezi","lanceziul":"lânceziu","lanci":"lance","lanciata":["lănciată","lănciat","lănciata","lănciat"],"lanciate":"lănciat","lanciatele":"lănciat","lanciati":"lănciat","lanciatii":"lănciat","lanciatul":"lănciat","lancieri":"lăncier","lancierii":"lăncier","lancierilor":"lăncier","lancierul":"lăncier","lancierule":"lăncier","lancierului":"lăncier","lanciforma":["lanciformă","lanciform","lanciforma","lanciform"],"lanciforme":"lanciform","lanciformele":"lanciform","lanciformi":"lanciform","lanciformii":"lanciform","lanciformul":"lanciform","lancii":"lance","lancile":"lance","lancilor":"lance","lancinanta":["lancinantă","lancinant","lancinanta","lancinant"],"lancinante":"lancinant","lancinantele":"lancinant","lancinanti":"lancinant","lancinantii":"lancinant","lancinantul":"lancinant","lancioare":"lăncioară","lancioarei":"lăncioară","lancioarele":"lăncioară","lancioarelor":"lăncioară","lancisoare":"lăncișoară","lancisoarei":"lăncișoară","lancisoarele":"lăncișoară","lancisoarelor":"lăncișoară","lancote":"lâncotă","lancotei":"lâncotă","lancotele":"lâncotă","lancotelor":"lâncotă","land":"la","landcarte":"landcartă","landcartei":"landcartă","landcartele":"landcartă","landcartelor":"landcartă","lande":"landă","landei":"landă","landele":"landă","landelor":"landă","landgrafatul":"landgrafat","landgrafatule":"landgrafat","landgrafatului":"landgrafat","landgrafaturi":"landgrafat","landgrafaturile":"landgrafat","landgrafaturilor":"landgrafat","landgrafi":"landgraf","landgrafiate":"landgrafiat","landgrafiatele":"landgrafiat","landgrafiatelor":"landgrafiat","landgrafiatul":"landgrafiat","landgrafiatule":"landgrafiat","landgrafiatului":"landgrafiat","landgrafii":"landgraf","landgrafilor":"landgraf","landgraful":"landgraf","landgrafule":"landgraf","landgrafului":"landgraf","landoul":"landou","landoule":"landou","landoului":"landou","landouri":"landou","landourile":"landou","landourilor":"landou","landul":"land","landule":"land","landului":"land","landuri":"land","landurile":"land","landurilor":"land","laneate":"lâneață","laneatei":"lâneață","langaje":"langaj","langajele":"langaj","langajelor":"langaj","langajul":"langaj","langajule":"langaj","langajului":"langaj","lange":"langă","langed":"lânced","langeda":["lângedă","lânged","lângeda","lânged"],"langede":"lânged","langedele":"lânged","langedul":"lânged","langei":"langă","langele":"langă","langelor":"langă","langezi":"lânged","langezii":"lânged","langezirea":"lângezire","langeziri":"lângezire","langezirii":"lângezire","langezirile":"lângezire","langezirilor":"lângezire","langhida":["langhidă","langhid","langhida","langhid"],"langhide":"langhid","langhidele":"langhid","langhidul":"langhid","langhizi":"langhid","langhizii":"langhid","langi":"langă","langoare":"lingoare","langoarea":"lângoare","langoareul":"langoare","langoareule":"langoare","langoareului":"langoare","langoari":"lângoare","langoarii":"lângoare","langoarile":"lângoare","langoarilor":"lângoare","langori":"lângoare","langosi":"langoș","langosii":"langoș","langosilor":"langoș","langosul":"langoș","langosule":"langoș","langosului":"langoș","languia":"langui","languiai":"langui","languiam":"langui","languiati":"langui","languiau":"langui","languiesc":"langui","languieste":"langui","languiesti":"langui","languii":"langui","languim":"langui","languind":"langui","languira":"langui","languiram":"langui","languirati":"langui","languise":"langui","languisem":"langui","languisera":"langui","languiseram":"langui","languiserati":"langui","languisesi":"langui","languisi":"langui","languit":"langui","languiti":"langui","languroasa":["languroasă","languros","languroasa","languros","lănguroasă","lănguros","lănguroasa","lănguros"],"languroase":["languroase","languros","lănguroase","lănguros"],"languroasele":["languroasele","languros","lănguroasele","lănguros"],"langurosi":["languroși","languros","lănguroși","lănguros"],"langurosii":["languroșii","languros","lănguroșii","lănguros"],"langurosul":["langurosul","languros","lăngurosul","lănguros"],"langurozitatea":"langurozitate","langurozitati":"langurozitate","langurozitatii":"langurozitate","langurozitatile":"langurozitate","langurozitatilor":"langurozitate","languste":"langustă","langustei":"langustă","langustele":"langustă","langustelor":"langustă","lani":"lână","lanice":"lânică","lanicei":"lânică","lanicele":"lânică","lanicelor":"lânică","lanici":"lânică","lanifera":["laniferă","lanifer","lanifera","lanifer"],"lanifere":"lanifer","laniferele":"lanifer","laniferi":"lanifer","laniferii":"lanifer","laniferul":"lanifer","lanii":"lână","lanisoare":"lânișoară","lanisoarei":"lânișoară","lanisti":"lanist","lanistii":"lanist","lanistilor":"lanist","lanistul":"lanist","lanistule":"lanist","lanistului":"lanist","lanite":"lâniță","lanitei":"lâniță","lanitele":"lâniță","lanitelor":"lâniță","lanoasa":["lânoasă","lânos","lânoasa","lânos"],"lanoase":"lânos","lanoasele":"lânos","lanoline":"lanolină","lanolinei":"lanolină","lanolinele":"lanolină","lanolinelor":"lanolină","lanosi":"lânos","lanosii":"lânos","lanosul":"lânos","lansai":"lansa","lansaje":"lansaj","lansajele":"lansaj","lansajelor":"lansaj","lansajul":"lansaj","lansajule":"lansaj","lansajului":"lansaj","lansam":["lansăm","lansa","lansam","lansa"],"lansand":"lansa","lansara":"lansa","lansaram":"lansa","lansarati":"lansa","lansarea":"lansare","lansari":"lansare","lansarii":"lansare","lansarile":"lansare","lansarilor":"lansare","lansase":"lansa","lansasem":"lansa","lansasera":"lansa","lansaseram":"lansa","lansaserati":"lansa","lansasesi":"lansa","lansasi":"lansa","lansat":"lansa","lansata":["lansată","lansat","lansata","lansat"],"lansate":"lansat","lansatele":"lansat","lansati":["lansați","lansa","lansați","lansat"],"lansatii":"lansat","lansatoare":"lansator","lansatoare de grenade":"lansator de grenade","lansatoarele":"lansator","lansatoarelor":"lansator","lansatorul":"lansator","lansatorule":"lansator","lansatorului":"lansator","lansatul":"lansat","lansau":"lansa","lanseaza":"lansa","lansete":"lansetă","lansetei":"lansetă","lansetele":"lansetă","lansetelor":"lansetă","lansez":"lansa","lansezi":"lansa","lantagul":"lanțag"};
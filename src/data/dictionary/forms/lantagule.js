@@ -0,0 +1 @@
+export default {"lantagule":"lanțag","lantagului":"lanțag","lantaguri":"lanțag","lantagurile":"lanțag","lantagurilor":"lanțag","lantanide":["lantanide","lantanid","lantanide","lantanidă"],"lantanidei":"lantanidă","lantanidele":["lantanidele","lantanid","lantanidele","lantanidă"],"lantanidelor":["lantanidelor","lantanid","lantanidelor","lantanidă"],"lantanidul":"lantanid","lantanidule":"lantanid","lantanidului":"lantanid","lantanul":"lantan","lantanule":"lantan","lantanului":"lantan","lantata":["lănțată","lănțat","lănțata","lănțat"],"lantate":"lănțat","lantatele":"lănțat","lantati":"lănțat","lantatii":"lănțat","lantatul":"lănțat","lantegusul":"lănțeguș","lantegusule":"lănțeguș","lantegusului":"lănțeguș","lantegusuri":"lănțeguș","lantegusurile":"lănțeguș","lantegusurilor":"lănțeguș","lanterne":"lanternă","lanterne magice":"lanternă magică","lanternei":"lanternă","lanternele":"lanternă","lanternelor":"lanternă","lanternouri":"lanternou","lanternourile":"lanternou","lanternourilor":"lanternou","lanternouul":"lanternou","lanternouule":"lanternou","lanternouului":"lanternou","lantete":"lanțetă","lantetei":"lanțetă","lantetele":"lanțetă","lantetelor":"lanțetă","lanticul":"lănțic","lanticule":"lănțic","lanticului":"lănțic","lanticuri":"lănțic","lanticurile":"lănțic","lanticurilor":"lănțic","lantisoare":"lănțișor","lantisore":"lănțișor","lantisorele":"lănțișor","lantisorelor":"lănțișor","lantisorul":"lănțișor","lantisorule":"lănțișor","lantisorului":"lănțișor","lantucul":"lănțuc","lantucule":"lănțuc","lantucului":"lănțuc","lantucuri":"lănțuc","lantucurile":"lănțuc","lantucurilor":"lănțuc","lantugul":"lanțug","lantugule":"lanțug","lantugului":"lanțug","lantuguri":"lanțug","lantugurile":"lanțug","lantugurilor":"lanțug","lantuia":"lănțui","lantuiai":"lănțui","lantuiam":"lănțui","lantuiati":"lănțui","lantuiau":"lănțui","lantuiesc":"lănțui","lantuieste":"lănțui","lantuiesti":"lănțui","lantuii":"lănțui","lantuim":"lănțui","lantuind":"lănțui","lantuira":"lănțui","lantuiram":"lănțui","lantuirati":"lănțui","lantuirea":"lănțuire","lantuiri":"lănțuire","lantuirii":"lănțuire","lantuirile":"lănțuire","lantuirilor":"lănțuire","lantuise":"lănțui","lantuisem":"lănțui","lantuisera":"lănțui","lantuiseram":"lănțui","lantuiserati":"lănțui","lantuisesi":"lănțui","lantuisi":"lănțui","lantuit":"lănțui","lantuita":["lănțuită","lănțuit","lănțuita","lănțuit"],"lantuite":"lănțuit","lantuitele":"lănțuit","lantuiti":["lănțuiți","lănțui","lănțuiți","lănțuit"],"lantuitii":"lănțuit","lantuitul":"lănțuit","lantujele":"lănțujel","lantujelele":"lănțujel","lantujelelor":"lănțujel","lantujelul":"lănțujel","lantujelule":"lănțujel","lantujelului":"lănțujel","lantul":"lanț","lantule":"lanț","lantulete":"lănțuleț","lantuletele":"lănțuleț","lantuletelor":"lănțuleț","lantuletul":"lănțuleț","lantuletule":"lănțuleț","lantuletului":"lănțuleț","lantului":"lanț","lanturele":"lănțurel","lanturelei":"lănțurel","lanturelelor":"lănțurel","lanturelul":"lănțurel","lanturelule":"lănțurel","lanturelului":"lănțurel","lanturi":"lanț","lanturi de aprovizionare":"lanț de aprovizionare","lanturile":"lanț","lanturilor":"lanț","lanturoasa":["lănțuroasă","lănțuros","lănțuroasa","lănțuros"],"lanturoase":"lănțuros","lanturoasele":"lănțuros","lanturosi":"lănțuros","lanturosii":"lănțuros","lanturosul":"lănțuros","lantuse":"lănțuș","lantusele":"lănțuș","lantuselor":"lănțuș","lantusoare":"lănțușor","lantusore":"lănțușor","lantusorele":"lănțușor","lantusorelor":"lănțușor","lantusorul":"lănțușor","lantusorule":"lănțușor","lantusorului":"lănțușor","lantusul":"lănțuș","lantusule":"lănțuș","lantusului":"lănțuș","lantute":"lănțuț","lantutele":"lănțuț","lantutelor":"lănțuț","lantutul":"lănțuț","lantutule":"lănțuț","lantutului":"lănțuț","lanugoul":"lanugo","lanugoule":"lanugo","lanugoului":"lanugo","lanul":"lan","lanule":"lan","lanului":"lan","lanuri":["lanuri","lan","lânuri","lână"],"lanurile":["lanurile","lan","lânurile","lână"],"lanurilor":["lanurilor","lan","lânurilor","lână"],"lanute":"lânuță","lanutei":"lânuță","lanutele":"lânuță","lanutelor":"lânuță","laori":"lăor","laotianul":"laoțian","laotianule":"laoțian","laotianului":"laoțian","laotiene":"laoțiană","laotienei":"laoțiană","laotienele":"laoțiană","laotienelor":"laoțiană","laotieni":"laoțian","laotienii":"laoțian","laotienilor":"laoțian","lapad":"lăpăda","lapadai":"lăpăda","lapadam":["lăpădăm","lăpăda","lăpădam","lăpăda"],"lapadand":"lăpăda","lapadara":"lăpăda","lapadaram":"lăpăda","lapadarati":"lăpăda","lapadarea":"lăpădare","lapadari":"lăpădare","lapadarii":"lăpădare","lapadarile":"lăpădare","lapadarilor":"lăpădare","lapadase":"lăpăda","lapadasem":"lăpăda","lapadasera":"lăpăda","lapadaseram":"lăpăda","lapadaserati":"lăpăda","lapadasesi":"lăpăda","lapadasi":"lăpăda","lapadat":"lăpăda","lapadati":"lăpăda","lapadau":"lăpăda","lapaia":"lăpăi","lapaiai":"lăpăi","lapaiam":"lăpăi","lapaiati":"lăpăi","lapaiau":"lăpăi","lapaiesc":"lăpăi","lapaieste":"lăpăi","lapaiesti":"lăpăi","lapaii":"lăpăi","lapaim":"lăpăi","lapaind":"lăpăi","lapaira":"lăpăi","lapairam":"lăpăi","lapairati":"lăpăi","lapaise":"lăpăi","lapaisem":"lăpăi","lapaisera":"lăpăi","lapaiseram":"lăpăi","lapaiserati":"lăpăi","lapaisesi":"lăpăi","lapaisi":"lăpăi","lapait":"lăpăi","lapaiti":"lăpăi","lapalisade":"lapalisadă","lapalisadei":"lapalisadă","lapalisadele":"lapalisadă","lapalisadelor":"lapalisadă","lapanul":"lapăn","lapanule":"lapăn","lapanului":"lapăn","laparoscoape":"laparoscop","laparoscoapele":"laparoscop","laparoscoapelor":"laparoscop","laparoscopia":"laparoscopie","laparoscopiei":"laparoscopie","laparoscopii":"laparoscopie","laparoscopiile":"laparoscopie","laparoscopiilor":"laparoscopie","laparoscopul":"laparoscop","laparoscopule":"laparoscop","laparoscopului":"laparoscop","laparotomia":"laparotomie","laparotomiei":"laparotomie","laparotomii":"laparotomie","laparotomiile":"laparotomie","laparotomiilor":"laparotomie","lapazi":"lăpăda","lapeni":"lapăn","lapenii":"lapăn","lapenilor":"lapăn","lapiazul":"lapiaz","lapiazule":"lapiaz","lapiazului":"lapiaz","lapiazuri":"lapiaz","lapiazurile":"lapiaz","lapiazurilor":"lapiaz","lapicidul":"lapicid","lapicidule":"lapicid","lapicidului":"lapicid","lapicizi":"lapicid","lapicizii":"lapicid","lapicizilor":"lapicid","lapidai":"lapida","lapidam":["lapidăm","lapida","lapidam","lapida"],"lapidand":"lapida","lapidara":["lapidară","lapida","lapidară","lapidar","lapidara","lapidar"],"lapidaram":"lapida","lapidarati":"lapida","lapidare":"lapidar","lapidarea":"lapidare","lapidarele":"lapidar","lapidari":["lapidari","lapidar","lapidări","lapidare"],"lapidarii":["lapidarii","lapidar","lapidării","lapidare","lapidarii","lapidariu"],"lapidariile":"lapidariu","lapidariilor":"lapidariu","lapidarile":"lapidare","lapidarilor":"lapidare","lapidaritatea":"lapidaritate","lapidaritati":"lapidaritate","lapidaritatii":"lapidaritate","lapidariul":"lapidariu","lapidariule":"lapidariu","lapidariului":"lapidariu","lapidariumuri":"lapidarium","lapidarul":"lapidar","lapidase":"lapida","lapidasem":"lapida","lapidasera":"lapida","lapidaseram":"lapida","lapidaserati":"lapida","lapidasesi":"lapida","lapidasi":"lapida","lapidat":"lapida","lapidati":"lapida","lapidatia":"lapidație","lapidatiei":"lapidație","lapidatii":"lapidație","lapidatiile":"lapidație","lapidatiilor":"lapidație","lapidau":"lapida","lapide":"lapidă","lapideaza":"lapida","lapidei":"lapidă","lapidele":"lapidă","lapidelor":"lapidă","lapidez":"lapida","lapidezi":"lapida","lapislazuliul":"lapislazuli","lapislazuliule":"lapislazuli","lapislazuliului":"lapislazuli","lapisul":"lapis","lapisule":"lapis","lapisului":"lapis","lapiti":"lapit","lapitii":"lapit","lapitilor":"lapit","lapitul":"lapit","lapitule":"lapit","lapitului":"lapit","lapone":"laponă","laponei":"laponă","laponele":"laponă","laponelor":"laponă","laponezi":"laponez","laponezii":"laponez","laponezilor":"laponez","laponezul":"laponez","laponezule":"laponez","laponezului":"laponez","laponi":"lapon","laponii":"lapon","laponilor":"lapon","laponul":"lapon","laponule":"lapon","laponului":"lapon","lapovit":"lapovița","lapovitai":"lapovița","lapovitam":["lapovițăm","lapovița","lapovițam","lapovița"],"lapovitand":"lapovița","lapovitara":"lapovița","lapovitaram":"lapovița","lapovitarati":"lapovița","lapovitase":"lapovița","lapovitasem":"lapovița","lapovitasera":"lapovița","lapovitaseram":"lapovița","lapovitaserati":"lapovița","lapovitasesi":"lapovița","lapovitasi":"lapovița","lapovitat":"lapovița","lapovitati":"lapovița","lapovitau":"lapovița","lapovite":"lapoviță","lapoviteaza":"lapovița","lapovitei":"lapoviță","lapoviti":"lapovița","lapsusul":"lapsus","lapsusule":"lapsus","lapsusului":"lapsus","lapsusuri":"lapsus","lapsusurile":"lapsus","lapsusurilor":"lapsus","laptagii":"laptagiu","laptagiii":"laptagiu","laptagiilor":"laptagiu","laptagiuul":"laptagiu","laptagiuule":"laptagiu","laptagiuului":"laptagiu","laptai":"lăpta","laptam":["lăptăm","lăpta","lăptam","lăpta"],"laptand":"lăpta","laptara":"lăpta","laptaram":"lăpta","laptarati":"lăpta","laptarea":"lăptare","laptarese":"lăptăreasă","laptaresei":"lăptăreasă","laptaresele":"lăptăreasă","laptareselor":"lăptăreasă","laptari":["lăptari","lăptar","lăptări","lăptare"],"laptaria":"lăptărie","laptariei":"lăptărie","laptarii":["lăptarii","lăptar","lăptării","lăptare","lăptării","lăptărie"],"laptariile":"lăptărie","laptariilor":"lăptărie","laptarile":"lăptare","laptarilor":["lăptarilor","lăptar","lăptărilor","lăptare"],"laptarite":"lăptăriță","laptaritei":"lăptăriță","laptaritele":"lăptăriță","laptaritelor":"lăptăriță","laptarul":"lăptar","laptarule":"lăptar","laptarului":"lăptar","laptase":"lăpta","laptasem":"lăpta","laptasera":"lăpta","laptaseram":"lăpta","laptaserati":"lăpta","laptasesi":"lăpta","laptasi":"lăpta","laptat":"lăpta","laptati":"lăpta","laptau":"lăpta","lapteaza":"lăpta","laptele":"lapte","laptelui":"lapte","lapteri":"lăpțer","lapterii":"lăpțer","lapterilor":"lăpțer","lapterul":"lăpțer","lapterule":"lăpțer","lapterului":"lăpțer","laptez":"lăpta","laptezi":"lăpta","lapticele":"lăpticel","lapticelele":"lăpticel","lapticelelor":"lăpticel","lapticelul":"lăpticel","lapticelule":"lăpticel","lapticelului":"lăpticel","lapticul":"lăptic","lapticule":"lăptic","lapticului":"lăptic","laptii":"lapți","laptilor":"lapți","laptirea":"lăptire","laptiri":"lăptire","laptirii":"lăptire","laptirile":"lăptire","laptirilor":"lăptire","laptisore":"lăptișor","laptisorele":"lăptișor","laptisorelor":"lăptișor","laptisori":"lăptișor","laptisorii":"lăptișor","laptisorilor":"lăptișor","laptisorul":"lăptișor","laptisorule":"lăptișor","laptisorului":"lăptișor","laptiucul":"lăptiuc","laptiucule":"lăptiuc","laptiucului":"lăptiuc","laptoace":"lăptoc","laptoacei":"lăptoc","laptoacelor":"lăptoc","laptoasa":["lăptoasă","lăptos","lăptoasa","lăptos"],"laptoase":"lăptos","laptoasele":"lăptos","laptocul":"lăptoc","laptocule":"lăptoc","laptocului":"lăptoc","laptopul":"laptop","laptopule":"laptop","laptopului":"laptop","laptopuri":"laptop","laptopurile":"laptop","laptopurilor":"laptop","laptosi":"lăptos","laptosii":"lăptos","laptosita":["lăptoșită","lăptoșit","lăptoșita","lăptoșit"],"laptosite":"lăptoșit","laptositele":"lăptoșit","laptositi":"lăptoșit","laptositii":"lăptoșit","laptositul":"lăptoșit","laptosul":"lăptos","laptuc":"lăptuci","laptuce":"lăptuci","laptucea":"lăptuci","laptuceai":"lăptuci","laptuceam":"lăptuci","laptuceati":"lăptuci","laptuceau":"lăptuci","laptucele":"lăptuceală","laptucelei":"lăptuceală","laptucelele":"lăptuceală","laptucelelor":"lăptuceală","laptuceli":"lăptuceală","laptuci":"lăptucă","laptucie":"lăptuci","laptucii":["lăptucii","lăptucă","lăptucii","lăptuci"],"laptucile":"lăptucă","laptucilor":"lăptucă","laptucim":"lăptuci","laptucind":"lăptuci","laptucira":"lăptuci","laptuciram":"lăptuci","laptucirati":"lăptuci","laptucise":"lăptuci","laptucisem":"lăptuci","laptucisera":"lăptuci","laptuciseram":"lăptuci","laptuciserati":"lăptuci","laptucisesi":"lăptuci","laptucisi":"lăptuci","laptucit":"lăptuci","laptucita":["lăptucită","lăptucit","lăptucita","lăptucit"],"laptucite":"lăptucit","laptucitele":"lăptucit","laptuciti":["lăptuciți","lăptuci","lăptuciți","lăptucit"],"laptucitii":"lăptucit","laptucitul":"lăptucit","lapturi":"lapte","lapturia":"lăpturiu","lapturie":"lăpturiu","lapturii":"lăpturiu","lapturiii":"lăpturiu","lapturiile":"lăpturiu","lapturile":"lapte","lapturilor":"lapte","lapturiul":"lăpturiu","laptusi":"lăptuș","laptusii":"lăptuș","laptusilor":"lăptuș","laptusul":"lăptuș","laptusule":"lăptuș","laptusului":"lăptuș","laptutul":"lăptuț","laptutule":"lăptuț","laptutului":"lăptuț","lapusul":"lăpuș","lapusule":"lăpuș","lapusului":"lăpuș","lararii":"larariu","larariile":"larariu","larariilor":"larariu","larariuul":"larariu","larariuule":"larariu","larariuului":"larariu","lardoasa":["lărdoasă","lărdos","lărdoasa","lărdos"],"lardoase":"lărdos","lardoasele":"lărdos","lardosi":"lărdos","lardosii":"lărdos","lardosul":"lărdos","lardul":"lard","lardule":"lard","lardului":"lard","larduri":"lard","lardurile":"lard","lardurilor":"lard","larea":"lare","larga":["largă","larg","larga","larg"],"largea":"lărgi","largeai":"lărgi","largeam":"lărgi","largeati":"lărgi","largeau":"lărgi","largelnica":["lărgelnică","lărgelnic","lărgelnica","lărgelnic"],"largelnice":"lărgelnic","largelnicele":"lărgelnic","largelnici":"lărgelnic","largelnicii":"lărgelnic","largelnicul":"lărgelnic","largesc":"lărgi","largeste":"lărgi","largesti":"lărgi","larghetea":"larghețe","larghetei":"larghețe","largi":"larg","largia":"lărgie","largiei":"lărgie","largii":["largii","larg","lărgii","lărgi","lărgii","lărgie"],"largile":"larg","largim":"lărgi","largimea":"lărgime","largimi":"lărgime","largimii":"lărgime","largimile":"lărgime","largimilor":"lărgime","largind":"lărgi","largira":"lărgi","largiram":"lărgi","largirati":"lărgi","largirea":"lărgire","largiri":"lărgire","largirii":"lărgire","largirile":"lărgire","largirilor":"lărgire","largise":"lărgi","largisem":"lărgi","largisera":"lărgi","largiseram":"lărgi","largiserati":"lărgi","largisesi":"lărgi","largisi":"lărgi","largit":"lărgi","largita":["lărgită","lărgit","lărgita","lărgit"],"largite":"lărgit","largitele":"lărgit","largiti":["lărgiți","lărgi","lărgiți","lărgit"],"largitii":"lărgit","largitoare":"lărgitor","largitoarele":"lărgitor","largitoarelor":"lărgitor","largitorul":"lărgitor","largitorule":"lărgitor","largitorului":"lărgitor","largitudinea":"largitudine","largitudini":"largitudine","largitudinii":"largitudine","largitudinile":"largitudine","largitudinilor":"largitudine","largitul":"lărgit","largituri":"lărgitură","largiturii":"lărgitură","largiturile":"lărgitură","largiturilor":"lărgitură","largul":"larg","largulite":"lărguliță","largulitele":"lărguliță","largusora":["lărgușoră","lărgușor","lărgușora","lărgușor"],"largusore":"lărgușor","largusorele":"lărgușor","largusori":"lărgușor","largusorii":"lărgușor","largusorul":"lărgușor","larguta":["lărguță","lărguț","lărguța","lărguț"],"largute":"lărguț","largutele":"lărguț","larguti":"lărguț","largutii":"lărguț","largutul":"lărguț","lari":"lare","laricea":"larice","larici":"larice","laricii":"larice","laricile":"larice","laricilor":"larice","larii":"lare","laringala":["laringală","laringal","laringala","laringal"],"laringale":"laringal","laringalele":"laringal","laringali":"laringal","laringalii":"laringal","laringalul":"laringal","laringectomia":"laringectomie","laringectomiei":"laringectomie","laringectomii":"laringectomie","laringectomiile":"laringectomie","laringectomiilor":"laringectomie","laringele":"laringe","laringelor":"laringe","laringelui":"laringe","laringiana":["laringiană","laringian","laringiana","laringian"],"laringianul":"laringian","laringiene":"laringian","laringienele":"laringian","laringieni":"laringian","laringienii":"laringian","laringite":"laringită","laringitei":"laringită","laringitele":"laringită","laringitelor":"laringită","laringocelul":"laringocel","laringocelule":"laringocel","laringocelului":"laringocel","laringofoane":"laringofon","laringofoanele":"laringofon","laringofoanelor":"laringofon","laringofonul":"laringofon","laringofonule":"laringofon","laringofonului":"laringofon","laringologe":"laringologă","laringologei":"laringologă","laringologele":"laringologă","laringologelor":"laringologă","laringologi":"laringolog","laringologia":"laringologie","laringologica":["laringologică","laringologic","laringologica","laringologic"],"laringologice":"laringologic","laringologicele":"laringologic","laringologici":"laringologic","laringologicii":"laringologic","laringologicul":"laringologic","laringologiei":"laringologie","laringologii":["laringologii","laringolog","laringologii","laringologie"],"laringologilor":"laringolog","laringologul":"laringolog","laringologule":"laringolog","laringologului":"laringolog","laringopatia":"laringopatie","laringopatiei":"laringopatie","laringopatii":"laringopatie","laringopatiile":"laringopatie","laringopatiilor":"laringopatie","laringoplegia":"laringoplegie","laringoplegiei":"laringoplegie","laringoplegii":"laringoplegie","laringoplegiile":"laringoplegie","laringoplegiilor":"laringoplegie","laringoscoape":"laringoscop","laringoscoapele":"laringoscop","laringoscoapelor":"laringoscop","laringoscopia":"laringoscopie","laringoscopica":["laringoscopică","laringoscopic","laringoscopica","laringoscopic"],"laringoscopice":"laringoscopic","laringoscopicele":"laringoscopic","laringoscopici":"laringoscopic","laringoscopicii":"laringoscopic","laringoscopicul":"laringoscopic","laringoscopiei":"laringoscopie","laringoscopii":"laringoscopie","laringoscopiile":"laringoscopie","laringoscopiilor":"laringoscopie","laringoscopul":"laringoscop","laringoscopule":"laringoscop","laringoscopului":"laringoscop","laringospasme":"laringospasm","laringospasmele":"laringospasm","laringospasmelor":"laringospasm","laringospasmul":"laringospasm","laringospasmule":"laringospasm","laringospasmului":"laringospasm","laringostroboscoape":"laringostroboscop","laringostroboscoapele":"laringostroboscop","laringostroboscoapelor":"laringostroboscop","laringostroboscopia":"laringostroboscopie","laringostroboscopiei":"laringostroboscopie","laringostroboscopii":"laringostroboscopie","laringostroboscopiile":"laringostroboscopie","laringostroboscopiilor":"laringostroboscopie","laringostroboscopul":"laringostroboscop","laringostroboscopule":"laringostroboscop","laringostroboscopului":"laringostroboscop","laringotomia":"laringotomie","laringotomiei":"laringotomie","laringotomii":"laringotomie","laringotomiile":"laringotomie","laringotomiilor":"laringotomie","laringotomul":"laringotom","laringotomule":"laringotom","laringotomului":"laringotom","laringotomuri":"laringotom","laringotomurile":"laringotom","laringotomurilor":"laringotom","larinxul":"larinx","larinxule":"larinx","larinxului":"larinx","larinxuri":"larinx","larinxurile":"larinx","larinxurilor":"larinx","larite":"lariță","laritei":"lariță","laritele":"lariță","laritelor":"lariță","larmalaia":"lărmălaie","larmalaie":"lărmălău","larmalaiei":"lărmălaie","larmalaiele":"lărmălău","larmalaielor":"lărmălău","larmalaii":"lărmălaie","larmalauul":"lărmălău","larmalauule":"lărmălău","larmalauului":"lărmălău","larme":"larmă","larmei":"larmă","larmele":"larmă","larmelor":"larmă","larmoaianta":["larmoaiantă","larmoaiant","larmoaianta","larmoaiant"],"larmoaiante":"larmoaiant","larmoaiantele":"larmoaiant","larmoaianti":"larmoaiant","larmoaiantii":"larmoaiant","larmoaiantul":"larmoaiant","larmuia":"lărmui","larmuiai":"lărmui","larmuiam":"lărmui","larmuiati":"lărmui","larmuiau":"lărmui","larmuiesc":"lărmui","larmuieste":"lărmui","larmuiesti":"lărmui","larmuii":"lărmui","larmuim":"lărmui","larmuind":"lărmui","larmuira":"lărmui","larmuiram":"lărmui","larmuirati":"lărmui","larmuirea":"lărmuire","larmuiri":"lărmuire","larmuirii":"lărmuire","larmuirile":"lărmuire","larmuirilor":"lărmuire","larmuise":"lărmui","larmuisem":"lărmui","larmuisera":"lărmui","larmuiseram":"lărmui","larmuiserati":"lărmui","larmuisesi":"lărmui","larmuisi":"lărmui","larmuit":"lărmui","larmuiti":"lărmui","larmuitoare":"lărmuitor","larmuitoarea":"lărmuitor","larmuitoarele":"lărmuitor","larmuitori":"lărmuitor","larmuitorii":"lărmuitor","larmuitorul":"lărmuitor","larvara":["larvară","larvar","larvara","larvar"],"larvare":"larvar","larvarele":"larvar","larvari":"larvar","larvarii":"larvar","larvarul":"larvar","larve":"larvă","larvei":"larvă","larvele":"larvă","larvelor":"larvă","larvicide":"larvicid","larvicidele":"larvicid","larvicidelor":"larvicid","larvicidul":"larvicid","larvicidule":"larvicid","larvicidului":"larvicid","las":"lăsa","lasa":["lașă","laș","lașa","laș"],"lasaciuni":"lăsăciune","lasai":"lăsa","lasam":["lăsăm","lăsa","lăsam","lăsa"],"lasamantul":"lăsământ","lasamantule":"lăsământ","lasamantului":"lăsământ","lasaminte":"lăsământ","lasamintele":"lăsământ","lasamintelor":"lăsământ","lasand":"lăsa","lasara":"lăsa","lasaram":"lăsa","lasarati":"lăsa","lasarea":"lăsare","lasarei":"lăsare","lasase":"lăsa","lasasem":"lăsa","lasasera":"lăsa","lasaseram":"lăsa","lasaserati":"lăsa","lasasesi":"lăsa","lasasi":"lăsa","lasat":"lăsa","lasat in pace":"lăsa în pace","lasat in pom":"lăsa în pom","lasat loc de buna ziua":"lăsa loc de bună ziua","lasata":["lăsata","lăsat","lăsată","lăsat"],"lasate":"lăsat","lasatela":["lăsățelă","lăsățel","lăsățela","lăsățel"],"lasatele":["lăsatele","lăsat","lăsățele","lăsățel"],"lasatelele":"lăsățel","lasateli":"lăsățel","lasatelii":"lăsățel","lasatelul":"lăsățel","lasati":["lăsați","lăsa","lăsați","lăsat"],"lasatii":"lăsat","lasatoare":"lăsător","lasatoarea":"lăsător","lasatoarele":"lăsător","lasatori":"lăsător","lasatorii":"lăsător","lasatorilor":"lăsător","lasatorul":"lăsător","lasatorule":"lăsător","lasatorului":"lăsător","lasatul":"lăsat","lasatule":"lăsat","lasatului":"lăsat","lasaturi":"lăsătură","lasaturii":"lăsătură","lasaturile":"lăsătură","lasaturilor":"lăsătură","lasau":"lăsa","lascai":"lăscaie","lascaia":"lăscaie","lascaiei":"lăscaie","lascaiete":"lăscăiață","lascaietei":"lăscăiață","lascaietele":"lăscăiață","lascaietelor":"lăscăiață","lascaii":"lăscaie","lascaiile":"lăscaie","lascaiilor":"lăscaie","lascaioare":"lăscăioară","lascaioarei":"lăscăioară","lascaioarele":"lăscăioară","lascaioarelor":"lăscăioară","lascaite":"lăscăiță","lascaitei":"lăscăiță","lascaitele":"lăscăiță","lascaitelor":"lăscăiță","lascava":["lascavă","lascav","lascava","lascav"],"lascave":"lascav","lascavele":"lascav","lascavi":"lascav","lascavii":"lascav","lascavul":"lascav","lasciva":["lascivă","lasciv","lasciva","lasciv"],"lascive":"lasciv","lascivele":"lasciv","lascivi":"lasciv","lascivia":"lascivie","lasciviei":"lascivie","lascivii":["lascivii","lasciv","lascivii","lascivie"],"lasciviile":"lascivie","lasciviilor":"lascivie","lascivitatea":"lascivitate","lascivitati":"lascivitate","lascivitatii":"lascivitate","lascivul":"lasciv","lase":["lașe","laș","lașe","lașă","lase","lăsa"],"lasei":"lașă","lasele":["lașele","laș","lașele","lașă"],"laselor":"lașă","lasere":"laser","laserele":"laser","laserelor":"laser","laserul":"laser","laserule":"laser","laserului":"laser","lasete":"lasetă","lasetei":"lasetă","lasetele":"lasetă","lasetelor":"lasetă","lasi":["lași","laș","lași","lăsa"],"lasii":"laș","lasitatea":"lașitate","lasitati":"lașitate","lasitatii":"lașitate","lasitatile":"lașitate","lasitatilor":"lașitate","lasitudinea":"lasitudine","lasitudini":"lasitudine","lasitudinii":"lasitudine","lasoul":"lasou","lasoule":"lasou","lasoului":"lasou","lasouri":"lasou","lasourile":"lasou","lasourilor":"lasou","lassalleanismul":"lassalleanism","lassalleanismule":"lassalleanism","lassalleanismului":"lassalleanism","lastar":"vlăstar","lastarasi":"lăstăraș","lastarasii":"lăstăraș","lastarasilor":"lăstăraș","lastarasul":"lăstăraș","lastarasule":"lăstăraș","lastarasului":"lăstăraș","lastare":"lăstar","lastarea":"lăstări","lastareai":"lăstări","lastaream":"lăstări","lastareati":"lăstări","lastareau":"lăstări","lastarei":"lăstărel","lastareii":"lăstărel","lastareilor":"lăstărel","lastarele":"lăstar","lastarelor":"lăstar","lastarelul":"lăstărel","lastarelule":"lăstărel","lastarelului":"lăstărel","lastaresc":"lăstări","lastareste":"lăstări","lastaresti":"lăstări","lastaretul":"lăstăret","lastaretule":"lăstăret","lastaretului":"lăstăret","lastareturi":"lăstăret","lastareturile":"lăstăret","lastareturilor":"lăstăret","lastarii":"lăstări","lastarim":"lăstări","lastarind":"lăstări","lastarira":"lăstări","lastariram":"lăstări","lastarirati":"lăstări","lastarirea":"lăstărire","lastariri":"lăstărire","lastaririi":"lăstărire","lastaririle":"lăstărire","lastaririlor":"lăstărire","lastarise":"lăstări","lastarisem":"lăstări","lastarisera":"lăstări","lastariseram":"lăstări","lastariserati":"lăstări","lastarisesi":"lăstări","lastarisi":"lăstări","lastarisul":"lăstăriș","lastarisule":"lăstăriș","lastarisului":"lăstăriș","lastarisuri":"lăstăriș","lastarisurile":"lăstăriș","lastarisurilor":"lăstăriș","lastarit":"lăstări","lastariti":"lăstări","lastarul":"lăstar","lastarule":"lăstar","lastarului":"lăstar","lastarute":"lăstăruț","lastarutei":"lăstăruț","lastarutelor":"lăstăruț","lastarutul":"lăstăruț","lastarutule":"lăstăruț","lastarutului":"lăstăruț","lastea":"lăsti","lasteai":"lăsti","lasteam":"lăsti","lasteati":"lăsti","lasteau":"lăsti","lastesc":"lăsti","lasteste":"lăsti","lastesti":"lăsti","lastexul":"lastex","lastexule":"lastex","lastexului":"lastex","lastexuri":"lastex","lastexurile":"lastex","lastexurilor":"lastex","lasticul":"lastic","lasticule":"lastic","lasticului":"lastic","lastii":"lăsti","lastim":"lăsti","lastind":"lăsti","lastira":"lăsti","lastiram":"lăsti","lastirati":"lăsti","lastirea":"lăstire","lastiri":"lăstire","lastirii":"lăstire","lastirile":"lăstire","lastirilor":"lăstire","lastise":"lăsti","lastisem":"lăsti","lastisera":"lăsti","lastiseram":"lăsti","lastiserati":"lăsti","lastisesi":"lăsti","lastisi":"lăsti","lastit":"lăsti","lastiti":"lăsti","lastitoare":"lăstitor","lastitoarea":"lăstitor","lastitoarele":"lăstitor","lastitori":"lăstitor","lastitorii":"lăstitor","lastitorul":"lăstitor","lastituri":"lăstitură","lastiturii":"lăstitură","lastiturile":"lăstitură","lastiturilor":"lăstitură","lastiva":["lăstivă","lăstiv","lăstiva","lăstiv"],"lastive":"lăstiv","lastivele":"lăstiv","lastivi":"lăstiv","lastivii":"lăstiv","lastivul":"lăstiv","lastrici":"lăstrică","lastricii":"lăstrică","lastricile":"lăstrică","lastricilor":"lăstrică","lastunasi":"lăstunaș","lastunasii":"lăstunaș","lastunasilor":"lăstunaș","lastunasul":"lăstunaș","lastunasule":"lăstunaș","lastunasului":"lăstunaș","lastunei":"lăstunel","lastuneii":"lăstunel","lastuneilor":"lăstunel","lastunelul":"lăstunel","lastunelule":"lăstunel","lastunelului":"lăstunel","lastuni":"lăstun","lastuni de casa":"lăstun de casă","lastuni de mal":"lăstun de mal","lastuni de stanca":"lăstun de stâncă","lastunii":"lăstun","lastunilor":"lăstun","lastunul":"lăstun","lastunule":"lăstun","lastunului":"lăstun","lasul":"laș","lata":["lată","lat","lata","lat"],"latanieri":"latanier","latanierii":"latanier","latanierilor":"latanier","latanierul":"latanier","latanierule":"latanier","latanierului":"latanier","latareata":["lătăreață","lătăreț","lătăreața","lătăreț"],"latarete":"lătăreț","lataretele":"lătăreț","latareti":"lătăreț","lataretii":"lătăreț","lataretul":"lătăreț","latatimea":"lătățime","latatimi":"lătățime","latatimii":"lătățime","latatimile":"lătățime","latatimilor":"lătățime","latausi":"lătăuș","latausii":"lătăuș","latausilor":"lătăuș","latausul":"lătăuș","latausule":"lătăuș","latausului":"lătăuș","late":"lat","latea":"lăți","lateai":"lăți","lateam":"lăți","lateata":["lăteață","lăteț","lăteața","lăteț"],"lateati":"lăți","lateau":"lăți","latei":"lățel","lateii":"lățel","lateilor":"lățel","latele":["latele","lat","lațele","lațe"],"latelor":"lațe","latelul":"lățel","latelule":"lățel","latelului":"lățel","latenta":["latentă","latent","latenta","latent"],"latente":["latente","latent","latențe","latență"],"latentei":"latență","latentele":["latentele","latent","latențele","latență"],"latentelor":"latență","latenti":"latent","latentii":"latent","latentul":"latent","laterala":["laterală","lateral","laterala","lateral"],"laterale":["laterale","lateral","laterale","laterală"],"lateralei":"laterală","lateralele":["lateralele","lateral","lateralele","laterală"],"lateralelor":"laterală","laterali":"lateral","lateralii":"lateral","lateralul":"lateral","laterite":"laterit","lateritele":"laterit","lateritelor":"laterit","lateritica":["lateritică","lateritic","lateritica","lateritic"],"lateritice":"lateritic","lateriticele":"lateritic","lateritici":"lateritic","lateriticii":"lateritic","lateriticul":"lateritic","lateritizarea":"lateritizare","lateritizari":"lateritizare","lateritizarii":"lateritizare","lateritizarile":"lateritizare","lateritizarilor":"lateritizare","lateritul":"laterit","lateritule":"laterit","lateritului":"laterit","latesc":"lăți","lateste":"lăți","latesti":"lăți","latete":"lăteț","latetele":"lăteț","lateti":"lăteț","latetii":"lăteț","latetul":"lăteț","latexul":"latex","latexule":"latex","latexului":"latex","latexuri":"latex","latexurile":"latex","latexurilor":"latex","lati":["lați","la","lați","lat"],"latibuli":"latibul","latibulii":"latibul","latibulilor":"latibul","latibulul":"latibul","latibulule":"latibul","latibulului":"latibul","laticea":"latice","laticela":["lăticelă","lăticel","lăticela","lăticel"],"laticele":"lăticel","laticelele":"lăticel","laticeli":"lăticel","laticelii":"lăticel","laticelul":"lăticel","latici":"latice","laticifere":"laticifer","laticiferele":"laticifer","laticiferelor":"laticifer","laticiferul":"laticifer","laticiferule":"laticifer","laticiferului":"laticifer","laticii":"latice","laticile":"latice","laticilor":"latice","laticlave":"laticlavă","laticlavei":"laticlavă","laticlavele":"laticlavă","laticlavelor":"laticlavă","latifundia":"latifundie","latifundiare":"latifundiară","latifundiarei":"latifundiară","latifundiarele":"latifundiară","latifundiarelor":"latifundiară","latifundiari":"latifundiar","latifundiarii":"latifundiar","latifundiarilor":"latifundiar","latifundiarul":"latifundiar","latifundiarule":"latifundiar","latifundiarului":"latifundiar","latifundiei":"latifundie","latifundii":["latifundii","latifundie","latifundii","latifundiu"],"latifundiile":"latifundie","latifundiilor":"latifundie","latii":["lații","lat","lății","lăți"],"latim":"lăți","latimea":"lățime","latimi":"lățime","latimii":"lățime","latimile":"lățime","latimilor":"lățime","latina":["latină","latin","latina","latin"],"latinatatea":"latinătate","latinatati":"latinătate","latinatatii":"latinătate","latind":"lăți","latine":["latine","latin","latine","latină"],"latinea":"latini","latineai":"latini","latineam":"latini","latineasca":["latinească","latinesc","latineasca","latinesc","lătinească","lătinesc","lătineasca","lătinesc"],"latineati":"latini","latineau":"latini","latinei":"latină","latinele":"latin","latinesc":"latini","latinescul":["latinescul","latinesc","lătinescul","lătinesc"],"latineste":"latini","latinesti":["latinești","latinesc","lătinești","lătinesc","latinești","latini"],"latinestii":["latineștii","latinesc","lătineștii","lătinesc"],"latinestile":["latineștile","latinesc","lătineștile","lătinesc"],"latini":"latin","latinia":"latinie","latiniei":"latinie","latinii":["latinii","latin","latinii","latini","latinii","latinie"],"latinim":"latini","latinimea":"latinime","latinimi":"latinime","latinimii":"latinime","latinind":"latini","latinira":"latini","latiniram":"latini","latinirati":"latini","latinirea":"latinire","latiniri":"latinire","latinirii":"latinire","latinirile":"latinire","latinirilor":"latinire","latinise":"latini","latinisem":"latini","latinisera":"latini","latiniseram":"latini","latiniserati":"latini","latinisesi":"latini","latinisi":"latini","latinisme":"latinism","latinismele":"latinism","latinismelor":"latinism","latinismul":"latinism","latinismule":"latinism","latinismului":"latinism","latiniste":"latinistă","latinistei":"latinistă","latinistele":"latinistă","latinistelor":"latinistă","latinisti":"latinist","latinistii":"latinist","latinistilor":"latinist","latinistul":"latinist","latinistule":"latinist","latinistului":"latinist","latinit":"latini","latinitatea":"latinitate","latinitati":"latinitate","latinitatii":"latinitate","latiniti":"latini","latinizai":"latiniza","latinizam":["latinizăm","latiniza","latinizam","latiniza"],"latinizand":"latiniza","latinizanta":["latinizantă","latinizant","latinizanta","latinizant"],"latinizante":"latinizant","latinizantele":"latinizant","latinizanti":"latinizant","latinizantii":"latinizant","latinizantul":"latinizant","latinizara":"latiniza","latinizaram":"latiniza","latinizarati":"latiniza","latinizarea":"latinizare","latinizari":"latinizare","latinizarii":"latinizare","latinizarile":"latinizare","latinizarilor":"latinizare","latinizase":"latiniza","latinizasem":"latiniza","latinizasera":"latiniza","latinizaseram":"latiniza","latinizaserati":"latiniza","latinizasesi":"latiniza","latinizasi":"latiniza","latinizat":"latiniza","latinizata":["latinizată","latinizat","latinizata","latinizat"],"latinizate":"latinizat","latinizatele":"latinizat","latinizati":["latinizați","latiniza","latinizați","latinizat"],"latinizatia":"latinizație","latinizatiei":"latinizație","latinizatii":["latinizații","latinizat","latinizații","latinizație"],"latinizatoarea":"latinizatoare","latinizatoarei":"latinizatoare","latinizatoarele":"latinizatoare","latinizatoarelor":"latinizatoare","latinizatori":"latinizator","latinizatorii":"latinizator","latinizatorilor":"latinizator","latinizatorul":"latinizator","latinizatorule":"latinizator","latinizatorului":"latinizator","latinizatul":"latinizat","latinizau":"latiniza","latinizeaza":"latiniza","latinizez":"latiniza","latinizezi":"latiniza","latinoamericana":["latinoamericană","latinoamerican","latinoamericana","latinoamerican"],"latinoamericane":"latinoamerican","latinoamericanele":"latinoamerican","latinoamericani":"latinoamerican","latinoamericanii":"latinoamerican","latinoamericanul":"latinoamerican","latinoul":"latino","latinoule":"latino","latinoului":"latino","latinul":"latin","latira":"lăți","latiram":"lăți","latirati":"lăți","latirea":"lățire","latiri":"lățire","latirii":"lățire","latirile":"lățire","latirilor":"lățire","latirismul":"latirism","latirismule":"latirism","latirismului":"latirism","latise":"lăți","latisem":"lăți","latisera":"lăți","latiseram":"lăți","latiserati":"lăți","latisesi":"lăți","latisi":"lăți","latisoara":["lătișoară","lătișor","lătișoara","lătișor"],"latisoare":["lățișoare","lățișoară","lătișoare","lătișor","lățișoare","lățișor"],"latisoarei":"lățișoară","latisoarele":["lățișoarele","lățișoară","lătișoarele","lătișor"],"latisoarelor":"lățișoară","latisore":"lățișor","latisorele":"lățișor","latisorelor":"lățișor","latisori":"lătișor","latisorii":"lătișor","latisorul":["lătișorul","lătișor","lățișorul","lățișor"],"latisorule":"lățișor","latisorului":"lățișor","latit":"lăți","latita":["lățită","lățit","lățita","lățit"],"latite":"lățit","latitele":"lățit","latiti":["lățiți","lăți","lățiți","lățit"],"latitii":"lățit","latitudinala":["latitudinală","latitudinal","latitudinala","latitudinal"],"latitudinale":"latitudinal","latitudinalele":"latitudinal","latitudinali":"latitudinal","latitudinalii":"latitudinal","latitudinalul":"latitudinal","latitudinea":"latitudine","latitudini":"latitudine","latitudinii":"latitudine","latitudinile":"latitudine","latitudinilor":"latitudine","latitul":"lățit","latoace":"lătoc","latoacele":"lătoc","latoacelor":"lătoc","latoaie":"lățoi","latoaiele":"lățoi","latoaielor":"lățoi","latoasa":["lățoasă","lățos","lățoasa","lățos"],"latoase":"lățos","latoasele":"lățos","latocasul":"lătocaș","latocasule":"lătocaș","latocasului":"lătocaș","latocul":"lătoc","latocule":"lătoc","latocului":"lătoc","latoiul":"lățoi","latoiule":"lățoi","latoiului":"lățoi","latosi":"lățos","latosii":"lățos","latosul":"lățos","latrai":"lătra","latram":["lătrăm","lătra","lătram","lătra"],"latrand":"lătra","latrara":"lătra","latraram":"lătra","latrarati":"lătra","latrarea":"lătrare","latrari":"lătrare","latrarii":"lătrare","latrarile":"lătrare","latrarilor":"lătrare","latrase":"lătra","latrasem":"lătra","latrasera":"lătra","latraseram":"lătra","latraserati":"lătra","latrasesi":"lătra","latrasi":"lătra","latrat":"lătra","latrati":"lătra","latratoare":"lătrător","latratoarea":"lătrător","latratoarele":"lătrător","latratori":"lătrător","latratorii":"lătrător","latratorul":"lătrător","latratul":"lătrat","latratule":"lătrat","latratului":"lătrat","latraturi":["lătrături","lătrat","lătraturi","lătrat","lătrături","lătrătură"],"latraturii":"lătrătură","latraturile":["lătraturile","lătrat","lătrăturile","lătrătură"],"latraturilor":["lătraturilor","lătrat","lătrăturilor","lătrătură"],"latrau":"lătra","latre":"lătra","latri":"lătra","latria":"latrie","latriei":"latrie","latrii":"latrie","latrine":"latrină","latrinei":"latrină","latrinele":"latrină","latrinelor":"latrină","latrocinarea":"latrocinare","latrocinari":"latrocinare","latrocinarii":"latrocinare","latrocinarile":"latrocinare","latrocinarilor":"latrocinare","latrocinatiunea":"latrocinațiune","latrocinatiuni":"latrocinațiune","latrocinatiunii":"latrocinațiune","latrocinatiunile":"latrocinațiune","latrocinatiunilor":"latrocinațiune","latronele":"latrone","latronelui":"latrone","latroni":"latrone","latronii":"latrone","latronilor":"latrone","latru":"lătra","latuia":"lătui","latuie":"lătui","latuiele":"lătui","latuii":"lătui","latuiul":"lătui","latul":["latul","lat","lațul","laț"],"latule":["latule","lat","lațule","laț"],"latuleata":["lătuleață","lătuleț","lătuleața","lătuleț"],"latulete":"lătuleț","latuletele":"lătuleț","latuleti":"lătuleț","latuletii":"lătuleț","latuletul":"lătuleț","latului":["latului","lat","lațului","laț"],"latunoaie":"lătunoi","latunoaiele":"lătunoi","latunoaielor":"lătunoi","latunoiul":"lătunoi","latunoiule":"lătunoi","latunoiului":"lătunoi","latur":"lătura","latura":"lături","laturai":"lătura","laturalnica":["lăturalnică","lăturalnic","lăturalnica","lăturalnic"],"laturalnice":"lăturalnic","laturalnicele":"lăturalnic","laturalnici":"lăturalnic","laturalnicii":"lăturalnic","laturalnicul":"lăturalnic","laturam":["lăturăm","lătura","lăturam","lătura"],"laturand":"lătura","laturara":"lătura","laturaram":"lătura","laturarati":"lătura","laturase":"lătura","laturasem":"lătura","laturasera":"lătura","laturaseram":"lătura","laturaserati":"lătura","laturasesi":"lătura","laturasi":"lătura","laturat":"lătura","laturati":"lătura","laturau":"lătura","lature":"latură","laturea":"lature","latureaua":"lăturea","laturele":"lăturea","laturelei":"lăturea","laturelele":"lăturea","laturelelor":"lăturea","laturi":["laturi","lat","lațuri","laț","laturi","latură","lături","lătura","lățuri","lățură","lături","lature"],"laturici":"lăturică","laturicii":"lăturică","laturicile":"lăturică","laturicilor":"lăturică","laturii":["laturii","latură","lățurii","lățură","lăturii","lature"],"laturile":["laturile","lat","lațurile","laț","laturile","latură","lățurile","lățură","lăturile","lature","lăturile","lături"],"laturilor":["laturilor","lat","lațurilor","laț","laturilor","latură","lățurilor","lățură","lăturilor","lature","lăturilor","lături"],"laturite":"lăturiță","laturitei":"lăturiță","laturitele":"lăturiță","laturitelor":"lăturiță","laturoasa":["lățuroasă","lățuros","lățuroasa","lățuros"],"laturoase":"lățuros","laturoasele":"lățuros","laturosi":"lățuros","laturosii":"lățuros","laturosul":"lățuros","latusul":"lătuș","latusule":"lătuș","latusului":"lătuș","latuta":["lătuță","lătuț","lătuța","lătuț"],"latute":"lătuț","latutele":"lătuț","latuti":"lătuț","latutii":"lătuț","latutul":"lătuț","latutule":"lătuț","latutului":"lătuț","lau":["lau","la","lău","la","lău","lai"],"laud":"lăuda","laudabila":["lăudabilă","lăudabil","lăudabila","lăudabil"],"laudabile":"lăudabil","laudabilele":"lăudabil","laudabili":"lăudabil","laudabilii":"lăudabil","laudabilul":"lăudabil","laudacioasa":["lăudăcioasă","lăudăcios","lăudăcioasa","lăudăcios"],"laudacioase":"lăudăcios","laudacioasele":"lăudăcios","laudaciosi":"lăudăcios","laudaciosii":"lăudăcios","laudaciosul":"lăudăcios","laudai":"lăuda","laudam":["lăudăm","lăuda","lăudam","lăuda"],"laudand":"lăuda","laudanumul":"laudanum","laudanumule":"laudanum","laudanumului":"laudanum","laudara":"lăuda","laudaram":"lăuda","laudarati":"lăuda","laudarea":"lăudare","laudarei":"lăudare","laudaria":"lăudărie","laudariei":"lăudărie","laudarii":"lăudărie","laudariile":"lăudărie","laudariilor":"lăudărie","laudaroasa":["laudaroasă","laudaros","laudaroasa","laudaros","lăudăroasă","lăudăros","lăudăroasa","lăudăros"],"laudaroase":["laudaroase","laudaros","lăudăroase","lăudăros"],"laudaroasele":["laudaroasele","laudaros","lăudăroasele","lăudăros"],"laudarosenia":"lăudăroșenie","laudaroseniei":"lăudăroșenie","laudarosenii":"lăudăroșenie","laudaroseniile":"lăudăroșenie","laudaroseniilor":"lăudăroșenie","laudarosi":["laudaroși","laudaros","lăudăroși","lăudăros"],"laudarosia":"lăudăroșie","laudarosiei":"lăudăroșie","laudarosii":["laudaroșii","laudaros","lăudăroșii","lăudăros","lăudăroșii","lăudăroșie"],"laudarosul":["laudarosul","laudaros","lăudărosul","lăudăros"],"laudase":"lăuda","laudasem":"lăuda","laudasera":"lăuda","laudaseram":"lăuda","laudaserati":"lăuda","laudasesi":"lăuda","laudasi":"lăuda","laudat":"lăuda","laudata":["lăudată","lăudat","lăudata","lăudat"],"laudate":"lăudat","laudatele":"lăudat","laudati":["lăudați","lăuda","lăudați","lăudat"],"laudatii":"lăudat","laudativa":["laudativă","laudativ","laudativa","laudativ"],"laudative":"laudativ","laudativele":"laudativ","laudativi":"laudativ","laudativii":"laudativ","laudativul":"laudativ","laudatnica":["lăudatnică","lăudatnic","lăudatnica","lăudatnic"],"laudatnice":"lăudatnic","laudatnicele":"lăudatnic","laudatnici":"lăudatnic","laudatnicii":"lăudatnic","laudatnicul":"lăudatnic","laudatoare":"lăudător","laudatoarea":["lăudătoarea","lăudătoare","lăudătoarea","lăudător"],"laudatoarei":"lăudătoare","laudatoarele":["lăudătoarele","lăudătoare","lăudătoarele","lăudător"],"laudatoarelor":"lăudătoare","laudatori":"lăudător","laudatorii":"lăudător","laudatorilor":"lăudător","laudatorul":"lăudător","laudatorule":"lăudător","laudatorului":"lăudător","laudatul":"lăudat","laudaturi":"lăudătură","laudaturii":"lăudătură","laudaturile":"lăudătură","laudaturilor":"lăudătură","laudau":"lăuda","laude":["laude","laudă","laude","lăuda"],"laudoasa":["lăudoasă","lăudos","lăudoasa","lăudos"],"laudoase":"lăudos","laudoasele":"lăudos","laudosi":"lăudos","laudosii":"lăudos","laudosul":"lăudos","lauduroasa":["lăuduroasă","lăuduros","lăuduroasa","lăuduros"],"lauduroase":"lăuduros","lauduroasele":"lăuduros","laudurosi":"lăuduros","laudurosii":"lăuduros","laudurosul":"lăuduros","laui":"la","launi":"lăun","launii":"lăun","launilor":"lăun","launtrica":["lăuntrică","lăuntric","lăuntrica","lăuntric"],"launtrice":"lăuntric","launtricele":"lăuntric","launtrici":"lăuntric","launtricii":"lăuntric","launtricul":"lăuntric","launul":"lăun","launule":"lăun","launului":"lăun","laura":"la","lauraceea":"lauracee","lauraceei":"lauracee","lauraceele":"lauracee","lauraceelor":"lauracee","lauram":"la","laurati":"la","laureate":"laureată","laureatei":"laureată","laureatele":"laureată","laureatelor":"laureată","laureati":"laureat","laureatii":"laureat","laureatilor":"laureat","laureatul":"laureat","laureatule":"laureat","laureatului":"laureat","lauri":"laur","lauri englezesti":"laur englezesc","laurii":"laur","laurilor":"laur","laurul":"laur","laurule":"laur","laurului":"laur","lauruste":["lauruște","laurușcă","lăuruște","lăuruscă"],"laurustei":"laurușcă","laurustele":"laurușcă","laurustelor":"laurușcă","lause":"la","lausem":"la","lausera":"la","lauseram":"la","lauserati":"la","lausesi":"la","lausi":"la","laut":"la","lautarasi":"lăutăraș","lautarasii":"lăutăraș","lautarasilor":"lăutăraș","lautarasul":"lăutăraș","lautarasule":"lăutăraș","lautarasului":"lăutăraș","lautareasca":["lăutărească","lăutăresc","lăutăreasca","lăutăresc"],"lautarei":"lăutărel","lautareii":"lăutărel","lautareilor":"lăutărel","lautarelul":"lăutărel","lautarelule":"lăutărel","lautarelului":"lăutărel","lautarescul":"lăutăresc","lautarese":"lăutăreasă","lautaresei":"lăutăreasă","lautaresele":"lăutăreasă","lautareselor":"lăutăreasă","lautaresti":"lăutăresc","lautarestii":"lăutăresc","lautarestile":"lăutăresc","lautari":"lăutar","lautarii":"lăutar","lautarilor":"lăutar","lautarite":"lăutăriță","lautaritei":"lăutăriță","lautaritele":"lăutăriță","lautaritelor":"lăutăriță","lautarul":"lăutar","lautarule":"lăutar","lautarului":"lăutar","lautasi":"lăutaș","lautasii":"lăutaș","lautasilor":"lăutaș","lautasul":"lăutaș","lautasule":"lăutaș","lautasului":"lăutaș","laute":"lăută","lautei":"lăută","lautele":"lăută","lautelor":"lăută","lautoarea":"lăutoare","lautori":"lăutoare","lautorii":"lăutoare","lautorile":"lăutoare","lautorilor":"lăutoare","lautul":"lăut","lautule":"lăut","lautului":"lăut","lauturi":"lăutură","lauturii":"lăutură","lauturile":"lăutură","lauturilor":"lăutură","lauze":"lăuză","lauzea":"lăuzi","lauzeai":"lăuzi","lauzeam":"lăuzi","lauzeati":"lăuzi","lauzeau":"lăuzi","lauzei":"lăuză","lauzele":"lăuză","lauzelor":"lăuză","lauzesc":"lăuzi","lauzeste":"lăuzi","lauzesti":"lăuzi","lauzi":"lăuda","lauzia":"lăuzie","lauziei":"lăuzie","lauzii":["lăuzii","lăuzi","lăuzii","lăuzie"],"lauziile":"lăuzie","lauziilor":"lăuzie","lauzim":"lăuzi","lauzind":"lăuzi","lauzira":"lăuzi","lauziram":"lăuzi","lauzirati":"lăuzi","lauzise":"lăuzi","lauzisem":"lăuzi","lauzisera":"lăuzi","lauziseram":"lăuzi","lauziserati":"lăuzi","lauzisesi":"lăuzi","lauzisi":"lăuzi","lauzit":"lăuzi","lauzita":["lăuzită","lăuzit","lăuzita","lăuzit"],"lauzite":"lăuzit","lauzitele":"lăuzit","lauziti":["lăuziți","lăuzi","lăuziți","lăuzit"],"lauzitii":"lăuzit","lauzitul":"lăuzit","lavabila":["lavabilă","lavabil","lavabila","lavabil"],"lavabile":"lavabil","lavabilele":"lavabil","lavabili":"lavabil","lavabilii":"lavabil","lavabilitatea":"lavabilitate","lavabilitati":"lavabilitate","lavabilitatii":"lavabilitate","lavabilitatile":"lavabilitate","lavabilitatilor":"lavabilitate","lavabilul":"lavabil","lavaboul":"lavabou","lavaboule":"lavabou","lavaboului":"lavabou","lavabouri":"lavabou","lavabourile":"lavabou","lavabourilor":"lavabou","lavaje":"lavaj","lavajele":"lavaj","lavajelor":"lavaj","lavajul":"lavaj","lavajule":"lavaj","lavajului":"lavaj","lavajuri":"lavaj","lavaliere":"lavalieră","lavalierei":"lavalieră","lavalierele":"lavalieră","lavalierelor":"lavalieră","lavande":"lavandă","lavandei":"lavandă","lavandele":"lavandă","lavandelor":"lavandă","lavatorul":"lavator","lavatorule":"lavator","lavatorului":"lavator","lave":"lavă","lavei":"lavă","lavele":"lavă","lavelor":"lavă","lavementul":"lavement","lavementule":"lavement","lavementului":"lavement","lavete":"lavetă","lavetei":"lavetă","lavetele":"lavetă","lavetelor":"lavetă","lavicere":"lăvicer","lavicerele":"lăvicer","lavicerelor":"lăvicer","lavicerul":"lăvicer","lavicerule":"lăvicer","lavicerului":"lăvicer","lavicioare":"lăvicioară","lavicioarei":"lăvicioară","lavicioarele":"lăvicioară","lavicioarelor":"lăvicioară","lavine":"lavină","lavinei":"lavină","lavinele":"lavină","lavinelor":"lavină","lavite":"laviță","lavitei":"laviță","lavitele":"laviță","lavitelor":"laviță","lavoare":"lavoar","lavoarele":"lavoar","lavoarelor":"lavoar","lavoarul":"lavoar","lavoarule":"lavoar","lavoarului":"lavoar","lavraci":"lavrac","lavracii":"lavrac","lavracilor":"lavrac","lavracul":"lavrac","lavracule":"lavrac","lavracului":"lavrac","lavre":"lavră","lavrei":"lavră","lavrele":"lavră","lavrelor":"lavră","lavrentine":"lavrentină","lavrentinei":"lavrentină","lavrentinele":"lavrentină","lavrentinelor":"lavrentină","lavrioti":"lavriot","lavriotii":"lavriot","lavriotilor":"lavriot","lavriotul":"lavriot","lavriotule":"lavriot","lavriotului":"lavriot","lawrentiul":"lawrențiu","lawrentiule":"lawrențiu","lawrentiului":"lawrențiu","laxa":["laxă","lax","laxa","lax"],"laxativi":"laxativ","laxativile":"laxativ","laxativilor":"laxativ","laxativul":"laxativ","laxativule":"laxativ","laxativului":"laxativ","laxe":"lax","laxele":"lax","laxismul":"laxism","laxismule":"laxism","laxismului":"laxism","laxiste":"laxistă","laxistei":"laxistă","laxistele":"laxistă","laxistelor":"laxistă","laxisti":"laxist","laxistii":"laxist","laxistilor":"laxist","laxistul":"laxist","laxistule":"laxist","laxistului":"laxist","laxitatea":"laxitate","laxitati":"laxitate","laxitatii":"laxitate","laxul":"lax","layoutul":"layout","layoutule":"layout","layoutului":"layout","layouturi":"layout","layouturile":"layout","layouturilor":"layout","lazaresco":"Lăzărescu","lazarete":"lazaret","lazaretele":"lazaret","lazaretelor":"lazaret","lazaretul":["lazaretul","lazaret","lăzăretul","lăzăret"],"lazaretule":["lazaretule","lazaret","lăzăretule","lăzăret"],"lazaretului":["lazaretului","lazaret","lăzăretului","lăzăret"],"lazareturi":"lăzăret","lazareturile":"lăzăret","lazareturilor":"lăzăret","lazaristi":"lazarist","lazaristii":"lazarist","lazaristilor":"lazarist","lazaristul":"lazarist","lazaristule":"lazarist","lazaristului":"lazarist","lazaroni":"lazaron","lazaronii":"lazaron","lazaronilor":"lazaron","lazaronul":"lazaron","lazaronule":"lazaron","lazaronului":"lazaron","lazastine":"lăzaștină","lazastinei":"lăzaștină","lazastinele":"lăzaștină","lazastinelor":"lăzaștină","lazglausul":"lăzglăuș","lazglausule":"lăzglăuș","lazglausului":"lăzglăuș","lazi":"ladă","lazi de gunoi":"ladă de gunoi","lazii":"ladă","lazile":"ladă","lazilor":"ladă","lazioare":"lazioară","lazioarei":"lazioară","lazlaul":"lazlău","lazlaule":"lazlău","lazlaului":"lazlău","lazul":"laz","lazule":"laz","lazulite":"lazulit","lazulitele":"lazulit","lazulitelor":"lazulit","lazulitul":"lazulit","lazulitule":"lazulit","lazulitului":"lazulit","lazului":"laz","lazuri":"laz","lazurile":"laz","lazurilor":"laz","lazurite":"lazurit","lazuritele":"lazurit","lazuritelor":"lazurit","lazuritul":"lazurit","lazuritule":"lazurit","lazuritului":"lazurit","lazutul":"lăzuț","lazutule":"lăzuț","lazutului":"lăzuț","lazuturi":"lăzuț","lazuturile":"lăzuț","lazuturilor":"lăzuț","le":["le","ei","le","ele","le","entomostraceu"],"leacul":"leac","leacule":"leac","leacului":"leac","leacuri":"leac","leacuri babesti":"leac băbesc","leacurile":"leac","leacurilor":"leac","leaderi":"leader","leaderii":"leader","leaderilor":"leader","leaderul":"leader","leaderule":"leader","leaderului":"leader","leaga":"lega","leagana":"legăna","leagane":"leagăn","leaganele":"leagăn","leaganelor":"leagăn","leaganul":"leagăn","leaganule":"leagăn","leaganului":"leagăn","leahul":"leah","leahule":"leah","leahului":"leah","leala":["leală","leal","leala","leal"],"leale":"leal","lealele":"leal","leali":"leal","lealii":"leal","lealisme":"lealism","lealismele":"lealism","lealismelor":"lealism","lealismul":"lealism","lealismule":"lealism","lealismului":"lealism","lealitatea":"lealitate","lealitati":"lealitate","lealitatii":"lealitate","lealul":"leal","leandri":"leandru","leandrii":"leandru","leandrilor":"leandru","leandrul":"leandru","leandrule":"leandru","leandrului":"leandru","leapada":"lepăda","leasingul":"leasing","leasingule":"leasing","leasingului":"leasing","leatul":["leatul","leat","leațul","leaț"],"leatule":["leatule","leat","leațule","leaț"],"leatului":["leatului","leat","leațului","leaț"],"leaturi":["leaturi","leat","leațuri","leaț"],"leaturile":["leaturile","leat","leațurile","leaț"],"leaturilor":["leaturilor","leat","leațurilor","leaț"],"lebadeaua":"lebadea","lebadele":"lebadea","lebadelei":"lebadea","lebadelele":"lebadea","lebadelelor":"lebadea","lebadoii":"lebădoi","lebadoilor":"lebădoi","lebadoiul":"lebădoi","lebadoiule":"lebădoi","lebadoiului":"lebădoi","lebarul":"lebăr","lebarule":"lebăr","lebarului":"lebăr","lebarvursti":"lebărvurșt","lebarvurstii":"lebărvurșt","lebarvurstilor":"lebărvurșt","lebarvurstul":["lebărvurstul","lebărvurst","lebărvurștul","lebărvurșt"],"lebarvurstule":["lebărvurstule","lebărvurst","lebărvurștule","lebărvurșt"],"lebarvurstului":["lebărvurstului","lebărvurst","lebărvurștului","lebărvurșt"],"lebede":"lebădă","lebede de iarna":"lebădă de iarnă","lebede de vara":"lebădă de vară","lebede mici":"lebădă mică","lebede negre":"lebădă neagră","lebedei":"lebădă","lebedele":"lebădă","lebedelor":"lebădă","lebedite":"lebediță","lebeditei":"lebediță","lebeditele":"lebediță","lebeditelor":"lebediță","lebejoare":"lebejoară","lebejoarei":"lebejoară","lebejoarele":"lebejoară","lebejoarelor":"lebejoară","lebenita":"lubeniță","lebesul":"lebes","lebesule":"lebes","lebesului":"lebes","lebesuri":"lebes","lebesurile":"lebes","lebesurilor":"lebes","lecite":"lecit","lecitele":"lecit","lecitelor":"lecit","lecitine":"lecitină","lecitinei":"lecitină","lecitinele":"lecitină","lecitinelor":"lecitină","lecitul":"lecit","lecitule":"lecit","lecitului":"lecit","lecne":"lecnă","lecnei":"lecnă","lecta noua":"Letca Nouă","lecta veche":"Letca Veche","lectia":"lecție","lecticari":"lecticar","lecticarii":"lecticar","lecticarilor":"lecticar","lecticarul":"lecticar","lecticarule":"lecticar","lecticarului":"lecticar","lectici":"lectică","lecticii":"lectică","lecticile":"lectică","lecticilor":"lectică","lectiei":"lecție","lectii":"lecție","lectiile":"lecție","lectiilor":"lecție","lectionare":"lecționar","lectionarele":"lecționar","lectionarelor":"lecționar","lectionarul":"lecționar","lectionarule":"lecționar","lectionarului":"lecționar","lectiune":"lecție","lectiunea":"lecțiune","lectiuni":"lecțiune","lectiunii":"lecțiune","lectiunile":"lecțiune","lectiunilor":"lecțiune","lectorate":"lectorat","lectoratele":"lectorat","lectoratelor":"lectorat","lectoratul":"lectorat","lectoratule":"lectorat","lectoratului":"lectorat","lectore":"lectoră","lectorei":"lectoră","lectorele":"lectoră","lectorelor":"lectoră","lectori":"lector","lectorii":"lector","lectorilor":"lector","lectorite":"lectoriță","lectoritei":"lectoriță","lectoritele":"lectoriță","lectoritelor":"lectoriță","lectorul":"lector","lectorule":"lector","lectorului":"lector","lectrite":"lectriță","lectritei":"lectriță","lectritele":"lectriță","lectritelor":"lectriță","lecturai":"lectura","lecturam":["lecturăm","lectura","lecturam","lectura"],"lecturand":"lectura","lecturara":"lectura","lecturaram":"lectura","lecturarati":"lectura","lecturarea":"lecturare","lecturari":"lecturare","lecturarii":"lecturare","lecturarile":"lecturare","lecturarilor":"lecturare","lecturase":"lectura","lecturasem":"lectura","lecturasera":"lectura","lecturaseram":"lectura","lecturaserati":"lectura","lecturasesi":"lectura","lecturasi":"lectura","lecturat":"lectura","lecturati":"lectura","lecturau":"lectura","lectureaza":"lectura","lecturez":"lectura","lecturezi":"lectura","lecturi":"lectură","lecturii":"lectură","lecturile":"lectură","lecturilor":"lectură","lecuia":"lecui","lecuiai":"lecui","lecuiam":"lecui","lecuiati":"lecui","lecuiau":"lecui","lecuiele":"lecuială","lecuielei":"lecuială","lecuielele":"lecuială","lecuielelor":"lecuială","lecuieli":"lecuială","lecuiesc":"lecui","lecuieste":"lecui","lecuiesti":"lecui","lecuii":"lecui","lecuim":"lecui","lecuind":"lecui","lecuinte":"lecuință","lecuintei":"lecuință","lecuintele":"lecuință","lecuintelor":"lecuință","lecuira":"lecui","lecuiram":"lecui","lecuirati":"lecui","lecuirea":"lecuire","lecuiri":"lecuire","lecuirii":"lecuire","lecuirile":"lecuire","lecuirilor":"lecuire","lecuise":"lecui","lecuisem":"lecui","lecuisera":"lecui","lecuiseram":"lecui","lecuiserati":"lecui","lecuisesi":"lecui","lecuisi":"lecui","lecuit":"lecui","lecuita":["lecuită","lecuit","lecuita","lecuit"],"lecuite":"lecuit","lecuitele":"lecuit","lecuiti":["lecuiți","lecui","lecuiți","lecuit"],"lecuitii":"lecuit","lecuitoare":"lecuitor","lecuitoarea":"lecuitor","lecuitoarele":"lecuitor","lecuitori":"lecuitor","lecuitorii":"lecuitor","lecuitorul":"lecuitor","lecuitul":"lecuit","lecurelele":"lecurele","lecurelelor":"lecurele","lecusoare":"lecușor","lecusoarele":"lecușor","lecusoarelor":"lecușor","lecusorul":"lecușor","lecusorule":"lecușor","lecusorului":"lecușor","lecutul":"lecuț","lecutule":"lecuț","lecutului":"lecuț","lecuturi":"lecuț","lecuturile":"lecuț","lecuturilor":"lecuț","ledari":"ledăr","ledarii":"ledăr","ledarilor":"ledăr","ledarul":"ledăr","ledarule":"ledăr","ledarului":"ledăr","ledeburite":"ledeburită","ledeburitei":"ledeburită","ledul":"led","ledule":"led","ledului":"led","leduri":"led","ledurile":"led","ledurilor":"led","lefasi":"lefaș","lefasii":"lefaș","lefasilor":"lefaș","lefasul":"lefaș","lefasule":"lefaș","lefasului":"lefaș","lefegii":"lefegiu","lefegiii":"lefegiu","lefegiilor":"lefegiu","lefegiul":"lefegiu","lefegiule":"lefegiu","lefegiului":"lefegiu","lefi":"leafă","leficii":"leficiu","leficiii":"leficiu","leficiilor":"leficiu","leficiuul":"leficiu","leficiuule":"leficiu","leficiuului":"leficiu","lefii":"leafă","lefile":"leafă","lefilor":"leafă","lefisoare":"lefișoară","lefisoarei":"lefișoară","lefisoarele":"lefișoară","lefisoarelor":"lefișoară","lefsoare":"lefșoară","lefsoarei":"lefșoară","lefsoarele":"lefșoară","lefsoarelor":"lefșoară","leftera":["lefteră","lefter","leftera","lefter"],"leftere":"lefter","lefterea":"lefteri","leftereai":"lefteri","lefteream":"lefteri","leftereati":"lefteri","leftereau":"lefteri","lefterele":"lefter","lefteresc":"lefteri","leftereste":"lefteri","lefteresti":"lefteri","lefteri":"lefter","lefteria":"lefterie","lefteriei":"lefterie","lefterii":["lefterii","lefter","lefterii","lefteri","lefterii","lefterie"],"lefteriile":"lefterie","lefteriilor":"lefterie","lefterim":"lefteri","lefterind":"lefteri","lefterira":"lefteri","lefteriram":"lefteri","lefterirati":"lefteri","lefterise":"lefteri","lefterisem":"lefteri","lefterisera":"lefteri","lefteriseram":"lefteri","lefteriserati":"lefteri","lefterisesi":"lefteri","lefterisi":"lefteri","lefterit":"lefteri","lefteriti":"lefteri","lefterul":"lefter","leftisori":"leftișor","leftisorii":"leftișor","leftisorilor":"leftișor","leftisorul":"leftișor","leftisorule":"leftișor","leftisorului":"leftișor","lefusoare":"lefușoară","lefusoarei":"lefușoară","lefusoarele":"lefușoară","lefusoarelor":"lefușoară","leg":"lega","legai":"lega","legala":["legală","legal","legala","legal"],"legale":"legal","legalele":"legal","legali":"legal","legalii":"legal","legalismul":"legalism","legalismule":"legalism","legalismului":"legalism","legalista":["legalistă","legalist","legalista","legalist"],"legaliste":"legalist","legalistele":"legalist","legalisti":"legalist","legalistii":"legalist","legalistilor":"legalist","legalistul":"legalist","legalistule":"legalist","legalistului":"legalist","legalitatea":"legalitate","legalitati":"legalitate","legalitatii":"legalitate","legalitatile":"legalitate","legalitatilor":"legalitate","legalizai":"legaliza","legalizam":["legalizăm","legaliza","legalizam","legaliza"],"legalizand":"legaliza","legalizara":"legaliza","legalizaram":"legaliza","legalizarati":"legaliza","legalizarea":"legalizare","legalizari":"legalizare","legalizarii":"legalizare","legalizarile":"legalizare","legalizarilor":"legalizare","legalizase":"legaliza","legalizasem":"legaliza","legalizasera":"legaliza","legalizaseram":"legaliza","legalizaserati":"legaliza","legalizasesi":"legaliza","legalizasi":"legaliza","legalizat":"legaliza","legalizata":["legalizată","legalizat","legalizata","legalizat"],"legalizate":"legalizat","legalizatele":"legalizat","legalizati":["legalizați","legaliza","legalizați","legalizat"],"legalizatia":"legalizație","legalizatiei":"legalizație","legalizatii":["legalizații","legalizat","legalizații","legalizație"],"legalizatiile":"legalizație","legalizatiilor":"legalizație","legalizatul":"legalizat","legalizau":"legaliza","legalizeaza":"legaliza","legalizez":"legaliza","legalizezi":"legaliza","legalul":"legal","legam":["legăm","lega","legam","lega"],"legamantul":"legământ","legamantule":"legământ","legamantului":"legământ","legaminte":"legământ","legamintele":"legământ","legamintelor":"legământ","legan":"legăna","leganai":"legăna","leganam":["legănăm","legăna","legănam","legăna"],"leganand":"legăna","leganara":"legăna","leganaram":"legăna","leganarati":"legăna","leganarea":"legănare","leganari":"legănare","leganarii":"legănare","leganarile":"legănare","leganarilor":"legănare","leganase":["legănase","legăna","legănașe","legănaș"],"leganasele":"legănaș","leganaselor":"legănaș","leganasem":"legăna","leganasera":"legăna","leganaseram":"legăna","leganaserati":"legăna","leganasesi":"legăna","leganasi":"legăna","leganasul":"legănaș","leganasule":"legănaș","leganasului":"legănaș","leganat":"legăna","leganata":["legănată","legănat","legănata","legănat"],"leganate":"legănat","leganatele":"legănat","leganati":["legănați","legăna","legănați","legănat"],"leganatii":"legănat","leganatoare":"legănător","leganatoarea":"legănător","leganatoarele":"legănător","leganatori":"legănător","leganatorii":"legănător","leganatorul":"legănător","leganatul":"legănat","leganaturi":"legănătură","leganaturii":"legănătură","leganaturile":"legănătură","leganaturilor":"legănătură","leganau":"legăna","legand":"lega","leganele":"legănel","leganelele":"legănel","leganelelor":"legănel","leganelul":"legănel","leganelule":"legănel","leganelului":"legănel","leganioare":"legănior","leganioarei":"legănior","leganioarelor":"legănior","leganiorul":"legănior","leganiorule":"legănior","leganiorului":"legănior","leganuse":"legănuș","leganusele":"legănuș","leganuselor":"legănuș","leganusul":"legănuș","leganusule":"legănuș","leganusului":"legănuș","leganute":"legănuț","leganutele":"legănuț","leganutelor":"legănuț","leganutul":"legănuț","leganutule":"legănuț","leganutului":"legănuț","legara":"lega","legaram":"lega","legarati":"lega","legare":"legar","legarea":"legare","legarele":"legar","legarelor":"legar","legari":"legare","legarii":"legare","legarile":"legare","legarilor":"legare","legarul":"legar","legarule":"legar","legarului":"legar","legase":"lega","legasem":"lega","legasera":"lega","legaseram":"lega","legaserati":"lega","legasesi":"lega","legasi":"lega","legat":"lega","legata":["legată","legat","legata","legat"],"legatare":"legatară","legatarei":"legatară","legatarele":"legatară","legatarelor":"legatară","legatari":"legatar","legatarii":"legatar","legatarilor":"legatar","legatarul":"legatar","legatarule":"legatar","legatarului":"legatar","legate":"legat","legatele":"legat","legati":["legați","lega","legați","legat"],"legatia":"legație","legatiei":"legație","legatii":["legații","legat","legații","legație"],"legatiile":"legație","legatiilor":"legație","legatiunea":"legațiune","legatiuni":"legațiune","legatiunii":"legațiune","legatiunile":"legațiune","legatiunilor":"legațiune","legatoarea":"legătoare"};
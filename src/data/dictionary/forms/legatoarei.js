@@ -0,0 +1 @@
+export default {"legatoarei":"legătoare","legatoarele":"legătoare","legatoarelor":"legătoare","legatorese":"legătoreasă","legatoresei":"legătoreasă","legatoresele":"legătoreasă","legatoreselor":"legătoreasă","legatori":"legător","legatoria":"legătorie","legatoriei":"legătorie","legatorii":["legătorii","legător","legătorii","legătorie"],"legatoriile":"legătorie","legatoriilor":"legătorie","legatorilor":"legător","legatorul":"legător","legatorule":"legător","legatorului":"legător","legatuia":"legatui","legatuiai":"legatui","legatuiam":"legatui","legatuiati":"legatui","legatuiau":"legatui","legatuie":"legatui","legatuiele":"legătuială","legatuielei":"legătuială","legatuielele":"legătuială","legatuielelor":"legătuială","legatuieli":"legătuială","legatuii":"legatui","legatuim":"legatui","legatuind":"legatui","legatuira":"legatui","legatuiram":"legatui","legatuirati":"legatui","legatuirea":"legătuire","legatuiri":"legătuire","legatuirii":"legătuire","legatuirile":"legătuire","legatuirilor":"legătuire","legatuise":"legatui","legatuisem":"legatui","legatuisera":"legatui","legatuiseram":"legatui","legatuiserati":"legatui","legatuisesi":"legatui","legatuisi":"legatui","legatuit":"legatui","legatuita":["legatuită","legatuit","legatuita","legatuit"],"legatuite":"legatuit","legatuitele":"legatuit","legatuiti":["legatuiți","legatui","legatuiți","legatuit"],"legatuitii":"legatuit","legatuitul":"legatuit","legatul":"legat","legaturi":"legătură","legaturi chimice":"legătură chimică","legaturi covalente":"legătură covalentă","legaturi ionice":"legătură ionică","legaturi peptidice":"legătură peptidică","legaturice":"legăturică","legaturicei":"legăturică","legaturicele":"legăturică","legaturicelor":"legăturică","legaturici":"legăturică","legaturii":"legătură","legaturile":"legătură","legaturilor":"legătură","legaturite":"legăturiță","legaturitei":"legăturiță","legaturitele":"legăturiță","legaturitelor":"legăturiță","legau":"lega","lege":"lega","legea":"lege","legendara":["legendară","legendar","legendara","legendar"],"legendare":"legendar","legendarele":"legendar","legendari":"legendar","legendarii":"legendar","legendarul":"legendar","legende":"legendă","legendei":"legendă","legendele":"legendă","legendelor":"legendă","legene":"legăna","legeni":"legăna","legerea":"legere","legeri":"legere","legerii":"legere","leghea":"leghe","leghei":"leghe","leghele":"leghe","leghelor":"leghe","leghiane":"leghian","leghianele":"leghian","leghianelor":"leghian","leghianul":"leghian","leghianule":"leghian","leghianului":"leghian","leghioane":"leghion","leghioanele":"leghion","leghioanelor":"leghion","leghionul":"leghion","leghionule":"leghion","leghionului":"leghion","legi":["legi","lega","legi","lege"],"legi nescrise":"lege nescrisă","legibila":["legibilă","legibil","legibila","legibil"],"legibile":"legibil","legibilele":"legibil","legibili":"legibil","legibilii":"legibil","legibilitatea":"legibilitate","legibilitati":"legibilitate","legibilitatii":"legibilitate","legibilul":"legibil","legica":["legică","legic","legica","legic"],"legice":"legic","legicele":"legic","legici":"legic","legicii":"legic","legicul":"legic","legifera":["legiferă","legifer","legifera","legifer"],"legiferai":"legifera","legiferam":["legiferăm","legifera","legiferam","legifera"],"legiferand":"legifera","legiferara":"legifera","legiferaram":"legifera","legiferarati":"legifera","legiferarea":"legiferare","legiferari":"legiferare","legiferarii":"legiferare","legiferarile":"legiferare","legiferarilor":"legiferare","legiferase":"legifera","legiferasem":"legifera","legiferasera":"legifera","legiferaseram":"legifera","legiferaserati":"legifera","legiferasesi":"legifera","legiferasi":"legifera","legiferat":"legifera","legiferata":["legiferată","legiferat","legiferata","legiferat"],"legiferate":"legiferat","legiferatele":"legiferat","legiferati":["legiferați","legifera","legiferați","legiferat"],"legiferatii":"legiferat","legiferatoare":"legiferator","legiferatoarea":"legiferator","legiferatoarele":"legiferator","legiferatori":"legiferator","legiferatorii":"legiferator","legiferatorul":"legiferator","legiferatul":"legiferat","legiferau":"legifera","legifere":"legifer","legifereaza":"legifera","legiferele":"legifer","legiferez":"legifera","legiferezi":"legifera","legiferi":"legifer","legiferii":"legifer","legiferul":"legifer","legii":"lege","legile":"lege","legilor":"lege","legioane":"legioană","legioene":"legioană","legioenei":"legioană","legioenele":"legioană","legioenelor":"legioană","legionara":["legionară","legionar","legionara","legionar"],"legionare":["legionare","legionar","legionare","legionară"],"legionarei":"legionară","legionarele":["legionarele","legionar","legionarele","legionară"],"legionarelor":"legionară","legionari":"legionar","legionarii":"legionar","legionarismul":"legionarism","legionarismule":"legionarism","legionarismului":"legionarism","legionariz":"legionariza","legionarizai":"legionariza","legionarizam":["legionarizăm","legionariza","legionarizam","legionariza"],"legionarizand":"legionariza","legionarizara":"legionariza","legionarizaram":"legionariza","legionarizarati":"legionariza","legionarizase":"legionariza","legionarizasem":"legionariza","legionarizasera":"legionariza","legionarizaseram":"legionariza","legionarizaserati":"legionariza","legionarizasesi":"legionariza","legionarizasi":"legionariza","legionarizat":"legionariza","legionarizati":"legionariza","legionarizau":"legionariza","legionarizeaza":"legionariza","legionarizi":"legionariza","legionarul":"legionar","legislai":"legisla","legislam":["legislăm","legisla","legislam","legisla"],"legisland":"legisla","legislara":"legisla","legislaram":"legisla","legislarati":"legisla","legislarea":"legislare","legislari":"legislare","legislarii":"legislare","legislarile":"legislare","legislarilor":"legislare","legislase":"legisla","legislasem":"legisla","legislasera":"legisla","legislaseram":"legisla","legislaserati":"legisla","legislasesi":"legisla","legislasi":"legisla","legislat":"legisla","legislati":"legisla","legislatia":"legislație","legislatiei":"legislație","legislatii":"legislație","legislatiile":"legislație","legislatiilor":"legislație","legislatiunea":"legislațiune","legislatiuni":"legislațiune","legislatiunii":"legislațiune","legislatiunile":"legislațiune","legislatiunilor":"legislațiune","legislativa":["legislativă","legislativ","legislativa","legislativ"],"legislative":"legislativ","legislativele":"legislativ","legislativi":"legislativ","legislativii":"legislativ","legislativul":"legislativ","legislatori":"legislator","legislatorii":"legislator","legislatorilor":"legislator","legislatorul":"legislator","legislatorule":"legislator","legislatorului":"legislator","legislature":"legislatură","legislaturei":"legislatură","legislaturele":"legislatură","legislaturelor":"legislatură","legislaturi":"legislatură","legislau":"legisla","legisleaza":"legisla","legislez":"legisla","legislezi":"legisla","legista":["legistă","legist","legista","legist"],"legiste":["legiste","legist","legiste","legistă"],"legistei":"legistă","legistele":["legistele","legist","legistele","legistă"],"legistelor":"legistă","legisti":"legist","legistii":"legist","legistul":"legist","legitatea":"legitate","legitati":"legitate","legitatii":"legitate","legitatile":"legitate","legitatilor":"legitate","legitima":["legitimă","legitim","legitima","legitim"],"legitimai":"legitima","legitimam":["legitimăm","legitima","legitimam","legitima"],"legitimand":"legitima","legitimara":"legitima","legitimaram":"legitima","legitimarati":"legitima","legitimarea":"legitimare","legitimari":"legitimare","legitimarii":"legitimare","legitimarile":"legitimare","legitimarilor":"legitimare","legitimase":"legitima","legitimasem":"legitima","legitimasera":"legitima","legitimaseram":"legitima","legitimaserati":"legitima","legitimasesi":"legitima","legitimasi":"legitima","legitimat":"legitima","legitimata":["legitimată","legitimat","legitimata","legitimat"],"legitimate":"legitimat","legitimatele":"legitimat","legitimati":["legitimați","legitima","legitimați","legitimat"],"legitimatia":"legitimație","legitimatiei":"legitimație","legitimatii":["legitimații","legitimat","legitimații","legitimație"],"legitimatiile":"legitimație","legitimatiilor":"legitimație","legitimatiunea":"legitimațiune","legitimatiuni":"legitimațiune","legitimatiunii":"legitimațiune","legitimatiunile":"legitimațiune","legitimatiunilor":"legitimațiune","legitimatul":"legitimat","legitimau":"legitima","legitime":"legitim","legitimeaza":"legitima","legitimele":"legitim","legitimez":"legitima","legitimezi":"legitima","legitimi":"legitim","legitimii":"legitim","legitimismul":"legitimism","legitimismule":"legitimism","legitimismului":"legitimism","legitimiste":"legitimistă","legitimistei":"legitimistă","legitimistele":"legitimistă","legitimistelor":"legitimistă","legitimisti":"legitimist","legitimistii":"legitimist","legitimistilor":"legitimist","legitimistul":"legitimist","legitimistule":"legitimist","legitimistului":"legitimist","legitimitatea":"legitimitate","legitimitati":"legitimitate","legitimitatii":"legitimitate","legitimitatile":"legitimitate","legitimitatilor":"legitimitate","legitimizai":"legitimiza","legitimizam":["legitimizăm","legitimiza","legitimizam","legitimiza"],"legitimizand":"legitimiza","legitimizara":"legitimiza","legitimizaram":"legitimiza","legitimizarati":"legitimiza","legitimizarea":"legitimizare","legitimizari":"legitimizare","legitimizarii":"legitimizare","legitimizarile":"legitimizare","legitimizarilor":"legitimizare","legitimizase":"legitimiza","legitimizasem":"legitimiza","legitimizasera":"legitimiza","legitimizaseram":"legitimiza","legitimizaserati":"legitimiza","legitimizasesi":"legitimiza","legitimizasi":"legitimiza","legitimizat":"legitimiza","legitimizati":"legitimiza","legitimizau":"legitimiza","legitimizeaza":"legitimiza","legitimizez":"legitimiza","legitimizezi":"legitimiza","legitimul":"legitim","legiuia":"legiui","legiuiai":"legiui","legiuiam":"legiui","legiuiati":"legiui","legiuiau":"legiui","legiuiesc":"legiui","legiuieste":"legiui","legiuiesti":"legiui","legiuii":"legiui","legiuim":"legiui","legiuind":"legiui","legiuira":"legiui","legiuiram":"legiui","legiuirati":"legiui","legiuirea":"legiuire","legiuiri":"legiuire","legiuirii":"legiuire","legiuirile":"legiuire","legiuirilor":"legiuire","legiuise":"legiui","legiuisem":"legiui","legiuisera":"legiui","legiuiseram":"legiui","legiuiserati":"legiui","legiuisesi":"legiui","legiuisi":"legiui","legiuit":"legiui","legiuita":["legiuită","legiuit","legiuita","legiuit"],"legiuite":"legiuit","legiuitele":"legiuit","legiuiti":["legiuiți","legiui","legiuiți","legiuit"],"legiuitii":"legiuit","legiuitoarea":"legiuitoare","legiuitoarei":"legiuitoare","legiuitoarele":"legiuitoare","legiuitoarelor":"legiuitoare","legiuitori":"legiuitor","legiuitorii":"legiuitor","legiuitorilor":"legiuitor","legiuitorul":"legiuitor","legiuitorule":"legiuitor","legiuitorului":"legiuitor","legiuitul":"legiuit","legiunea":"legiune","legiuni":"legiune","legiunii":"legiune","legiunile":"legiune","legiunilor":"legiune","leguani":"leguan","leguanii":"leguan","leguanilor":"leguan","leguanul":"leguan","leguanule":"leguan","leguanului":"leguan","legumaria":"legumărie","legumariei":"legumărie","legumarii":"legumărie","legumariile":"legumărie","legumariilor":"legumărie","legumaritul":"legumărit","legumaritule":"legumărit","legumaritului":"legumărit","legume":"legumă","legumei":"legumă","legumele":"legumă","legumelor":"legumă","legumene":"legumen","legumenele":"legumen","legumenelor":"legumen","legumenul":"legumen","legumenule":"legumen","legumenului":"legumen","legumetul":"legumet","legumetule":"legumet","legumetului":"legumet","legumeturi":"legumet","legumeturile":"legumet","legumeturilor":"legumet","legumicultoarea":"legumicultoare","legumicultoarei":"legumicultoare","legumicultoarele":"legumicultoare","legumicultoarelor":"legumicultoare","legumiculture":"legumicultură","legumiculturei":"legumicultură","leguminaria":"leguminărie","leguminariei":"leguminărie","leguminarii":"leguminărie","leguminariile":"leguminărie","leguminariilor":"leguminărie","legumine":"legumină","leguminei":"legumină","leguminoasa":["leguminoasă","leguminos","leguminoasa","leguminos"],"leguminoase":["leguminoase","leguminoasă","leguminoase","leguminos"],"leguminoasei":"leguminoasă","leguminoasele":["leguminoasele","leguminoasă","leguminoasele","leguminos"],"leguminoaselor":"leguminoasă","leguminosi":"leguminos","leguminosii":"leguminos","leguminosul":"leguminos","legumoasa":["legumoasă","legumos","legumoasa","legumos"],"legumoase":"legumos","legumoasele":"legumos","legumosi":"legumos","legumosii":"legumos","legumosul":"legumos","lehaeste":"lehăi","lehai":"lehău","lehaia":"lehăi","lehaiai":"lehăi","lehaiam":"lehăi","lehaiati":"lehăi","lehaiau":"lehăi","lehaiesc":"lehăi","lehaieste":"lehăi","lehaiesti":"lehăi","lehaii":["lehăii","lehăi","lehăii","lehău"],"lehailor":"lehău","lehaim":"lehăi","lehaind":"lehăi","lehaira":"lehăi","lehairam":"lehăi","lehairati":"lehăi","lehaise":"lehăi","lehaisem":"lehăi","lehaisera":"lehăi","lehaiseram":"lehăi","lehaiserati":"lehăi","lehaisesi":"lehăi","lehaisi":"lehăi","lehait":"lehăi","lehaiti":"lehăi","lehametea":["lehămetea","lehămeti","lehămețea","lehămeți"],"lehameteai":["lehămeteai","lehămeti","lehămețeai","lehămeți"],"lehameteam":["lehămeteam","lehămeti","lehămețeam","lehămeți"],"lehameteati":["lehămeteați","lehămeti","lehămețeați","lehămeți"],"lehameteau":["lehămeteau","lehămeti","lehămețeau","lehămeți"],"lehametesc":["lehămetesc","lehămeti","lehămețesc","lehămeți"],"lehameteste":["lehămetește","lehămeti","lehămețește","lehămeți"],"lehametesti":["lehămetești","lehămeti","lehămețești","lehămeți"],"lehametii":["lehămetii","lehămeti","lehămeții","lehămeți"],"lehametim":["lehămetim","lehămeti","lehămețim","lehămeți"],"lehametind":["lehămetind","lehămeti","lehămețind","lehămeți"],"lehametira":["lehămetiră","lehămeti","lehămețiră","lehămeți"],"lehametiram":["lehămetirăm","lehămeti","lehămețirăm","lehămeți"],"lehametirati":["lehămetirăți","lehămeti","lehămețirăți","lehămeți"],"lehametise":["lehămetise","lehămeti","lehămețise","lehămeți"],"lehametisea":"lehămetisi","lehametiseai":"lehămetisi","lehametiseam":"lehămetisi","lehametiseati":"lehămetisi","lehametiseau":"lehămetisi","lehametisele":"lehămetiseală","lehametiselei":"lehămetiseală","lehametiselele":"lehămetiseală","lehametiselelor":"lehămetiseală","lehametiseli":"lehămetiseală","lehametisem":["lehămetisem","lehămeti","lehămețisem","lehămeți"],"lehametisera":["lehămetiseră","lehămeti","lehămețiseră","lehămeți"],"lehametiseram":["lehămetiserăm","lehămeti","lehămețiserăm","lehămeți"],"lehametiserati":["lehămetiserăți","lehămeti","lehămețiserăți","lehămeți"],"lehametisesc":"lehămetisi","lehametisesi":["lehămetiseși","lehămeti","lehămețiseși","lehămeți"],"lehametiseste":"lehămetisi","lehametisesti":"lehămetisi","lehametisi":["lehămetiși","lehămeti","lehămețiși","lehămeți"],"lehametisii":"lehămetisi","lehametisim":"lehămetisi","lehametisind":"lehămetisi","lehametisira":"lehămetisi","lehametisiram":"lehămetisi","lehametisirati":"lehămetisi","lehametisise":"lehămetisi","lehametisisem":"lehămetisi","lehametisisera":"lehămetisi","lehametisiseram":"lehămetisi","lehametisiserati":"lehămetisi","lehametisisesi":"lehămetisi","lehametisisi":"lehămetisi","lehametisit":"lehămetisi","lehametisiti":"lehămetisi","lehametit":["lehămetit","lehămeti","lehămețit","lehămeți"],"lehametita":["lehămetită","lehămetit","lehămetita","lehămetit"],"lehametite":"lehămetit","lehametitele":"lehămetit","lehametiti":["lehămetiți","lehămeti","lehămețiți","lehămeți","lehămetiți","lehămetit"],"lehametitii":"lehămetit","lehametitul":"lehămetit","lehametuia":"lehămetui","lehametuiai":"lehămetui","lehametuiam":"lehămetui","lehametuiati":"lehămetui","lehametuiau":"lehămetui","lehametuiesc":"lehămetui","lehametuieste":"lehămetui","lehametuiesti":"lehămetui","lehametuii":"lehămetui","lehametuim":"lehămetui","lehametuind":"lehămetui","lehametuira":"lehămetui","lehametuiram":"lehămetui","lehametuirati":"lehămetui","lehametuise":"lehămetui","lehametuisem":"lehămetui","lehametuisera":"lehămetui","lehametuiseram":"lehămetui","lehametuiserati":"lehămetui","lehametuisesi":"lehămetui","lehametuisi":"lehămetui","lehametuit":"lehămetui","lehametuita":["lehămetuită","lehămetuit","lehămetuita","lehămetuit"],"lehametuite":"lehămetuit","lehametuitele":"lehămetuit","lehametuiti":["lehămetuiți","lehămetui","lehămetuiți","lehămetuit"],"lehametuitii":"lehămetuit","lehametuitul":"lehămetuit","lehamitea":"lehamite","lehamitei":"lehamite","lehauul":"lehău","lehauule":"lehău","lehauului":"lehău","lehimea":"lehime","lehimi":"lehime","lehimii":"lehime","lehmul":"lehm","lehmule":"lehm","lehmului":"lehm","lehuze":"lehuză","lehuzea":"lehuzi","lehuzeai":"lehuzi","lehuzeam":"lehuzi","lehuzeati":"lehuzi","lehuzeau":"lehuzi","lehuzei":"lehuză","lehuzele":"lehuză","lehuzelor":"lehuză","lehuzesc":"lehuzi","lehuzeste":"lehuzi","lehuzesti":"lehuzi","lehuzia":"lehuzie","lehuziei":"lehuzie","lehuzii":["lehuzii","lehuzi","lehuzii","lehuzie"],"lehuziile":"lehuzie","lehuziilor":"lehuzie","lehuzim":"lehuzi","lehuzind":"lehuzi","lehuzira":"lehuzi","lehuziram":"lehuzi","lehuzirati":"lehuzi","lehuzise":"lehuzi","lehuzisem":"lehuzi","lehuzisera":"lehuzi","lehuziseram":"lehuzi","lehuziserati":"lehuzi","lehuzisesi":"lehuzi","lehuzisi":"lehuzi","lehuzit":"lehuzi","lehuziti":"lehuzi","lei":"leu","lei asiatici":"leu asiatic","lei berberi":"leu berber","leibniziana":["leibniziană","leibnizian","leibniziana","leibnizian"],"leibnizianul":"leibnizian","leibniziene":"leibnizian","leibnizienele":"leibnizian","leibnizieni":"leibnizian","leibnizienii":"leibnizian","leici":"leică","leicii":"leică","leicile":"leică","leicilor":"leică","leiculite":"leiculiță","leiculitei":"leiculiță","leiculitele":"leiculiță","leiculitelor":"leiculiță","leicusoare":"leicușoară","leicusoarei":"leicușoară","leicusoarele":"leicușoară","leicusoarelor":"leicușoară","leicute":"leicuță","leicutei":"leicuță","leicutele":"leicuță","leicutelor":"leicuță","leii":"leu","leilor":"leu","leiofila":["leiofilă","leiofil","leiofila","leiofil"],"leiofile":"leiofil","leiofilele":"leiofil","leiofili":"leiofil","leiofilii":"leiofil","leiofilul":"leiofil","leiomioane":"leiomion","leiomioanele":"leiomion","leiomioanelor":"leiomion","leiomionul":"leiomion","leiomionule":"leiomion","leiomionului":"leiomion","leiomiosarcomul":"leiomiosarcom","leiomiosarcomule":"leiomiosarcom","leiomiosarcomului":"leiomiosarcom","leishmania":"leishmanie","leishmaniei":"leishmanie","leishmanii":"leishmanie","leishmaniile":"leishmanie","leishmaniilor":"leishmanie","leishmanioze":"leishmanioză","leishmaniozei":"leishmanioză","leita":["leită","leit","leita","leit"],"leite":["leite","leit","leițe","leiță"],"leitei":"leiță","leitele":["leitele","leit","leițele","leiță"],"leitelor":"leiță","leitenanti":"leitenant","leitenantii":"leitenant","leitenantilor":"leitenant","leitenantul":"leitenant","leitenantule":"leitenant","leitenantului":"leitenant","leiteninte":"leitenință","leitenintei":"leitenință","leitenintele":"leitenință","leitenintelor":"leitenință","leiti":"leit","leitii":"leit","leitmotivul":"leitmotiv","leitmotivule":"leitmotiv","leitmotivului":"leitmotiv","leitmotivuri":"leitmotiv","leitmotivurile":"leitmotiv","leitmotivurilor":"leitmotiv","leitul":"leit","lejanci":"lejancă","lejancii":"lejancă","lejancile":"lejancă","lejancilor":"lejancă","lejera":"lejer","lejere":"lejer","lejeri":"lejer","lejeritatea":"lejeritate","lejeritati":"lejeritate","lejeritatii":"lejeritate","lejeritatile":"lejeritate","lejeritatilor":"lejeritate","leliac":"liliac","lelice":"lelică","lelicei":"lelică","lelicute":"lelicuță","lelicutei":"lelicuță","lelicutele":"lelicuță","lelicutelor":"lelicuță","lelioare":"lelioară","lelioarei":"lelioară","lelioarele":"lelioară","lelioarelor":"lelioară","lelisoare":"lelișoară","lelisoarei":"lelișoară","lelisoarele":"lelișoară","lelisoarelor":"lelișoară","lelitcane":"lelițcană","lelitcanei":"lelițcană","lelitcanele":"lelițcană","lelitcanelor":"lelițcană","lelite":"leliță","lelitei":"leliță","lelitele":"leliță","lelitelor":"leliță","lelitice":"lelițică","leliticei":"lelițică","leliuci":"leliucă","leliucii":"leliucă","leliucile":"leliucă","leliucilor":"leliucă","leltarozasul":"leltarozaș","leltarozasule":"leltarozaș","leltarozasului":"leltarozaș","lematica":["lematică","lematic","lematica","lematic"],"lematice":"lematic","lematicele":"lematic","lematici":"lematic","lematicii":"lematic","lematicul":"lematic","leme":"lemă","lemei":"lemă","lemele":"lemă","lemelor":"lemă","lemingi":"leming","lemingii":"leming","lemingilor":"leming","lemingul":"leming","lemingule":"leming","lemingului":"leming","lemn dulce":"lemn-dulce","lemname":"lemnamă","lemnamei":"lemnamă","lemnarasi":"lemnăraș","lemnarasii":"lemnăraș","lemnarasilor":"lemnăraș","lemnarasul":"lemnăraș","lemnarasule":"lemnăraș","lemnarasului":"lemnăraș","lemnareasca":["lemnărească","lemnăresc","lemnăreasca","lemnăresc"],"lemnarei":"lemnărel","lemnareii":"lemnărel","lemnareilor":"lemnărel","lemnarelul":"lemnărel","lemnarelule":"lemnărel","lemnarelului":"lemnărel","lemnarescul":"lemnăresc","lemnarese":"lemnăreasă","lemnaresei":"lemnăreasă","lemnaresele":"lemnăreasă","lemnareselor":"lemnăreasă","lemnaresti":"lemnăresc","lemnarestii":"lemnăresc","lemnarestile":"lemnăresc","lemnari":"lemnar","lemnarii":["lemnarii","lemnar","lemnării","lemnărie"],"lemnarilor":"lemnar","lemnaritul":"lemnărit","lemnaritule":"lemnărit","lemnaritului":"lemnărit","lemnarul":"lemnar","lemnarule":"lemnar","lemnarului":"lemnar","lemne":"lemn","lemnele":"lemn","lemnelor":"lemn","lemnete":"lemnet","lemnetele":"lemnet","lemnetelor":"lemnet","lemnetul":"lemnet","lemnetule":"lemnet","lemnetului":"lemnet","lemnia":"lemniu","lemnicele":"lemnicel","lemnicelele":"lemnicel","lemnicelelor":"lemnicel","lemnicelul":"lemnicel","lemnicelule":"lemnicel","lemnicelului":"lemnicel","lemnie":"lemniu","lemnificata":["lemnificată","lemnificat","lemnificata","lemnificat"],"lemnificate":"lemnificat","lemnificatele":"lemnificat","lemnificati":"lemnificat","lemnificatii":"lemnificat","lemnificatul":"lemnificat","lemnii":"lemniu","lemniii":"lemniu","lemniile":"lemniu","lemnisoare":"lemnișor","lemnisore":"lemnișor","lemnisorele":"lemnișor","lemnisorelor":"lemnișor","lemnisorul":"lemnișor","lemnisorule":"lemnișor","lemnisorului":"lemnișor","lemniul":"lemniu","lemnoaie":"lemnoi","lemnoaiele":"lemnoi","lemnoaielor":"lemnoi","lemnoasa":["lemnoasă","lemnos","lemnoasa","lemnos"],"lemnoase":"lemnos","lemnoasele":"lemnos","lemnoiul":"lemnoi","lemnoiule":"lemnoi","lemnoiului":"lemnoi","lemnosi":"lemnos","lemnosii":"lemnos","lemnosul":"lemnos","lemnul":"lemn","lemnule":"lemn","lemnulete":"lemnuleț","lemnuletele":"lemnuleț","lemnuletelor":"lemnuleț","lemnuletul":"lemnuleț","lemnuletule":"lemnuleț","lemnuletului":"lemnuleț","lemnului":"lemn","lemnuse":"lemnuș","lemnusele":"lemnuș","lemnuselor":"lemnuș","lemnuste":"lemnușcă","lemnustei":"lemnușcă","lemnustele":"lemnușcă","lemnustelor":"lemnușcă","lemnusti":"lemnușcă","lemnusul":"lemnuș","lemnusule":"lemnuș","lemnusului":"lemnuș","lemnusuri":"lemnuș","lemnutul":"lemnuț","lemnutule":"lemnuț","lemnutului":"lemnuț","lempire":"lempiră","lempirei":"lempiră","lempirele":"lempiră","lempirelor":"lempiră","lemuri":"lemur","lemurianul":"lemurian","lemurianule":"lemurian","lemurianului":"lemurian","lemurieni":"lemurian","lemurienii":"lemurian","lemurienilor":"lemurian","lemurii":"lemur","lemurilor":"lemur","lemurul":"lemur","lemurule":"lemur","lemurului":"lemur","lenajul":"lenaj","lenajule":"lenaj","lenajului":"lenaj","lenajuri":"lenaj","lenajurile":"lenaj","lenajurilor":"lenaj","lencute":"lencuță","lencutei":"lencuță","lencutele":"lencuță","lencutelor":"lencuță","lenea":"lene","lenei":"lene","leneoasa":["leneoasă","leneos","leneoasa","leneos"],"leneoase":"leneos","leneoasele":"leneos","leneosi":"leneos","leneosii":"leneos","leneosul":"leneos","lenesa":["leneșă","leneș","leneșa","leneș"],"lenese":["leneșe","leneș","leneșe","leneșă"],"lenesei":"leneșă","lenesele":["leneșele","leneș","leneșele","leneșă"],"leneselor":"leneșă","lenesi":"leneș","lenesia":"leneșie","lenesiei":"leneșie","lenesii":["leneșii","leneș","leneșii","leneșie"],"lenesilor":"leneș","lenesul":"leneș","lenesule":"leneș","lenesului":"leneș","lenevea":"lenevi","leneveai":"lenevi","leneveam":"lenevi","leneveati":"lenevi","leneveau":"lenevi","lenevele":"leneveală","lenevelei":"leneveală","lenevelele":"leneveală","lenevelelor":"leneveală","leneveli":"leneveală","lenevesc":"lenevi","leneveste":"lenevi","lenevesti":"lenevi","lenevia":"lenevie","leneviei":"lenevie","lenevii":["lenevii","lenevi","lenevii","lenevie"],"lenevim":"lenevi","lenevind":"lenevi","lenevioara":["lenevioară","lenevior","lenevioara","lenevior"],"lenevioare":"lenevior","lenevioarele":"lenevior","leneviori":"lenevior","leneviorii":"lenevior","leneviorul":"lenevior","lenevira":"lenevi","leneviram":"lenevi","lenevirati":"lenevi","lenevirea":"lenevire","leneviri":"lenevire","lenevirii":"lenevire","lenevise":"lenevi","lenevisem":"lenevi","lenevisera":"lenevi","leneviseram":"lenevi","leneviserati":"lenevi","lenevisesi":"lenevi","lenevisi":"lenevi","lenevit":"lenevi","leneviti":"lenevi","lenevitul":"lenevit","lenevitule":"lenevit","lenevitului":"lenevit","lenevoasa":["lenevoasă","lenevos","lenevoasa","lenevos"],"lenevoase":"lenevos","lenevoasele":"lenevos","lenevosi":"lenevos","lenevosia":"lenevoșie","lenevosiei":"lenevoșie","lenevosii":["lenevoșii","lenevos","lenevoșii","lenevoșie"],"lenevosiile":"lenevoșie","lenevosiilor":"lenevoșie","lenevosul":"lenevos","lengheri":"lengher","lengherii":"lengher","lengherilor":"lengher","lengherul":"lengher","lengherule":"lengher","lengherului":"lengher","lenghiul":"lenghi","lenghiule":"lenghi","lenghiului":"lenghi","lenghiuri":"lenghi","lenghiurile":"lenghi","lenghiurilor":"lenghi","lenia":"lenie","leniei":"lenie","lenifianta":["lenifiantă","lenifiant","lenifianta","lenifiant"],"lenifiante":"lenifiant","lenifiantele":"lenifiant","lenifianti":"lenifiant","lenifiantii":"lenifiant","lenifiantul":"lenifiant","lenii":"lenie","leniile":"lenie","leniilor":"lenie","leningradeana":["leningrădeană","leningrădean","leningrădeana","leningrădean"],"leningradeanul":"leningrădean","leningradeanule":"leningrădean","leningradeanului":"leningrădean","leningradene":"leningrădean","leningradenele":"leningrădean","leningradeni":"leningrădean","leningradenii":"leningrădean","leningradenilor":"leningrădean","leninismul":"leninism","leninismule":"leninism","leninismului":"leninism","leninista":["leninistă","leninist","leninista","leninist"],"leniniste":["leniniste","leninist","leniniste","leninistă"],"leninistei":"leninistă","leninistele":["leninistele","leninist","leninistele","leninistă"],"leninistelor":"leninistă","leninisti":"leninist","leninistii":"leninist","leninistilor":"leninist","leninistul":"leninist","leninistule":"leninist","leninistului":"leninist","lenioasa":["lenioasă","lenios","lenioasa","lenios"],"lenioase":"lenios","lenioasele":"lenios","leniosi":"lenios","leniosii":"lenios","leniosul":"lenios","lenirea":"lenire","leniri":"lenire","lenirii":"lenire","lenirile":"lenire","lenirilor":"lenire","lenitivi":"lenitiv","lenitivile":"lenitiv","lenitivilor":"lenitiv","lenitivul":"lenitiv","lenitivule":"lenitiv","lenitivului":"lenitiv","leniva":["lenivă","leniv","leniva","leniv"],"lenive":"leniv","lenivele":"leniv","lenivi":"leniv","lenivii":"leniv","lenivul":"leniv","lenjerese":"lenjereasă","lenjeresei":"lenjereasă","lenjeresele":"lenjereasă","lenjereselor":"lenjereasă","lenjeria":"lenjerie","lenjeriei":"lenjerie","lenjerii":"lenjerie","lenjeriile":"lenjerie","lenjeriilor":"lenjerie","lenjuriul":"lenjuri","lenjuriule":"lenjuri","lenjuriului":"lenjuri","lenoasa":["lenoasă","lenos","lenoasa","lenos"],"lenoase":"lenos","lenoasele":"lenos","lenocinii":"lenociniu","lenociniile":"lenociniu","lenociniilor":"lenociniu","lenociniuul":"lenociniu","lenociniuule":"lenociniu","lenociniuului":"lenociniu","lenosi":"lenos","lenosii":"lenos","lenosul":"lenos","lenta":["lentă","lent","lenta","lent"],"lente":["lente","lent","lente","lentă"],"lentei":"lentă","lentele":["lentele","lent","lentele","lentă"],"lentelor":"lentă","lentetea":"lentețe","lentetei":"lentețe","lenti":"lent","lenticelata":["lenticelată","lenticelat","lenticelata","lenticelat"],"lenticelate":"lenticelat","lenticelatele":"lenticelat","lenticelati":"lenticelat","lenticelatii":"lenticelat","lenticelatul":"lenticelat","lenticele":"lenticelă","lenticelei":"lenticelă","lenticelele":"lenticelă","lenticelelor":"lenticelă","lenticulara":["lenticulară","lenticular","lenticulara","lenticular"],"lenticulare":"lenticular","lenticularele":"lenticular","lenticulari":"lenticular","lenticularii":"lenticular","lenticularul":"lenticular","lentiforma":["lentiformă","lentiform","lentiforma","lentiform"],"lentiforme":"lentiform","lentiformele":"lentiform","lentiformi":"lentiform","lentiformii":"lentiform","lentiformul":"lentiform","lentiginoze":"lentiginoză","lentiginozei":"lentiginoză","lentiginozele":"lentiginoză","lentiginozelor":"lentiginoză","lentigoul":"lentigo","lentigoule":"lentigo","lentigoului":"lentigo","lentii":"lent","lentile":"lentilă","lentile de contact":"lentilă de contact","lentile gravitationale":"lentilă gravitațională","lentiscul":"lentisc","lentiscule":"lentisc","lentiscului":"lentisc","lentitudinea":"lentitudine","lentitudini":"lentitudine","lentitudinii":"lentitudine","lentitudinile":"lentitudine","lentitudinilor":"lentitudine","lentoarea":"lentoare","lentoari":"lentoare","lentoarii":"lentoare","lentoarile":"lentoare","lentoarilor":"lentoare","lentoasa":["lentoasă","lentos","lentoasa","lentos"],"lentoase":"lentos","lentoasele":"lentos","lentori":"lentoare","lentosi":"lentos","lentosii":"lentos","lentosul":"lentos","lentul":"lent","lentuleteti":"lențulete","lentuletetii":"lențulete","lentuletetilor":"lențulete","lentuleteul":"lențulete","lentuleteule":"lențulete","lentuleteului":"lențulete","leoaice":"leoaică","leoaicei":"leoaică","leoaicele":"leoaică","leoaicelor":"leoaică","leoarbe":"leoarbă","leoarbei":"leoarbă","leoarbele":"leoarbă","leoarbelor":"leoarbă","leoarpe":"leoarpă","leoarpei":"leoarpă","leoii":"leoi","leoilor":"leoi","leoiul":"leoi","leoiule":"leoi","leoiului":"leoi","leonina":["leonină","leonin","leonina","leonin"],"leonine":"leonin","leoninele":"leonin","leonini":"leonin","leoninii":"leonin","leoninul":"leonin","leontiazisul":"leontiazis","leontiazisule":"leontiazis","leontiazisului":"leontiazis","leonusce":"leonușcă","leonuscei":"leonușcă","leopaia":"leopăi","leopaiai":"leopăi","leopaiam":"leopăi","leopaiati":"leopăi","leopaiau":"leopăi","leopaie":"leopăi","leopaii":"leopăi","leopaim":"leopăi","leopaind":"leopăi","leopaira":"leopăi","leopairam":"leopăi","leopairati":"leopăi","leopaise":"leopăi","leopaisem":"leopăi","leopaisera":"leopăi","leopaiseram":"leopăi","leopaiserati":"leopăi","leopaisesi":"leopăi","leopaisi":"leopăi","leopait":"leopăi","leopaiti":"leopăi","leopardul":"leopard","leopardule":"leopard","leopardului":"leopard","leoparzi":"leopard","leoparzii":"leopard","leoparzilor":"leopard","leorbai":"leorbău","leorbaia":"leorbăi","leorbaiai":"leorbăi","leorbaiam":"leorbăi","leorbaiati":"leorbăi","leorbaiau":"leorbăi","leorbaie":"leorbăi","leorbaiele":"leorbăială","leorbaielei":"leorbăială","leorbaielele":"leorbăială","leorbaielelor":"leorbăială","leorbaieli":"leorbăială","leorbaii":["leorbăii","leorbăi","leorbăii","leorbău"],"leorbailor":"leorbău","leorbaim":"leorbăi","leorbaind":"leorbăi","leorbaira":"leorbăi","leorbairam":"leorbăi","leorbairati":"leorbăi","leorbaise":"leorbăi","leorbaisem":"leorbăi","leorbaisera":"leorbăi","leorbaiseram":"leorbăi","leorbaiserati":"leorbăi","leorbaisesi":"leorbăi","leorbaisi":"leorbăi","leorbait":"leorbăi","leorbaiti":"leorbăi","leorbaul":"leorbău","leorbaule":"leorbău","leorbaului":"leorbău","leordace":"leordacă","leordacei":"leordacă","leorde":"leordă","leordei":"leordă","leordele":"leordă","leordelor":"leordă","lepad":"lepăda","lepadai":"lepăda","lepadam":["lepădăm","lepăda","lepădam","lepăda"],"lepadand":"lepăda","lepadara":"lepăda","lepadaram":"lepăda","lepadarati":"lepăda","lepadarea":"lepădare","lepadari":"lepădare","lepadarii":"lepădare","lepadarile":"lepădare","lepadarilor":"lepădare","lepadase":"lepăda","lepadasem":"lepăda","lepadasera":"lepăda","lepadaseram":"lepăda","lepadaserati":"lepăda","lepadasesi":"lepăda","lepadasi":"lepăda","lepadat":"lepăda","lepadata":["lepădată","lepădat","lepădata","lepădat"],"lepadate":"lepădat","lepadatele":"lepădat","lepadati":["lepădați","lepăda","lepădați","lepădat"],"lepadatii":"lepădat","lepadatori":"lepădător","lepadatul":"lepădat","lepadaturi":"lepădătură","lepadaturii":"lepădătură","lepadaturile":"lepădătură","lepadaturilor":"lepădătură","lepadau":"lepăda","lepaia":"lepăi","lepaiai":"lepăi","lepaiam":"lepăi","lepaiati":"lepăi","lepaiau":"lepăi","lepaie":"lepăi","lepaii":"lepăi","lepaim":"lepăi","lepaind":"lepăi","lepaira":"lepăi","lepairam":"lepăi","lepairati":"lepăi","lepaise":"lepăi","lepaisem":"lepăi","lepaisera":"lepăi","lepaiseram":"lepăi","lepaiserati":"lepăi","lepaisesi":"lepăi","lepaisi":"lepăi","lepait":"lepăi","lepaiti":"lepăi","lepede":"lepăda","lepedeie":"lepedeu","lepedeiele":"lepedeu","lepedeielor":"lepedeu","lepedeuul":"lepedeu","lepedeuule":"lepedeu","lepedeuului":"lepedeu","lepezi":"lepăda","lepidodendroni":"lepidodendron","lepidodendronii":"lepidodendron","lepidodendronilor":"lepidodendron","lepidodendronul":"lepidodendron","lepidodendronule":"lepidodendron","lepidodendronului":"lepidodendron","lepidoliti":"lepidolit","lepidolitii":"lepidolit","lepidolitilor":"lepidolit","lepidolitul":"lepidolit","lepidolitule":"lepidolit","lepidolitului":"lepidolit","lepidoptere":["lepidoptere","lepidopter","lepidoptere","lepidopteră"],"lepidopterei":"lepidopteră","lepidopterele":["lepidopterele","lepidopter","lepidopterele","lepidopteră"],"lepidopterelor":["lepidopterelor","lepidopter","lepidopterelor","lepidopteră"],"lepidopterologe":"lepidopterologă","lepidopterologei":"lepidopterologă","lepidopterologele":"lepidopterologă","lepidopterologelor":"lepidopterologă","lepidopterologi":"lepidopterolog","lepidopterologia":"lepidopterologie","lepidopterologiei":"lepidopterologie","lepidopterologii":["lepidopterologii","lepidopterolog","lepidopterologii","lepidopterologie"],"lepidopterologilor":"lepidopterolog","lepidopterologul":"lepidopterolog","lepidopterologule":"lepidopterolog","lepidopterologului":"lepidopterolog","lepidopterul":"lepidopter","lepidopterule":"lepidopter","lepidopterului":"lepidopter","lepidosireni":"lepidosiren","lepidosirenii":"lepidosiren","lepidosirenilor":"lepidosiren","lepidosirenul":"lepidosiren","lepidosirenule":"lepidosiren","lepidosirenului":"lepidosiren","lepraria":"leprărie","leprariei":"leprărie","leprarii":"leprărie","leprariile":"leprărie","leprariilor":"leprărie","lepre":"lepră","leprei":"lepră","leprele":"lepră","leprelor":"lepră","leproase":"leproasă","leproasei":"leproasă","leproasele":"leproasă","leproaselor":"leproasă","leprosi":"lepros","leprosii":"lepros","leprosilor":"lepros","leprosul":"lepros","leprosule":"lepros","leprosului":"lepros","leprotica":["leprotică","leprotic","leprotica","leprotic"],"leprotice":"leprotic","leproticele":"leprotic","leprotici":"leprotic","leproticii":"leprotic","leproticul":"leprotic","leprozeria":"leprozerie","leprozeriei":"leprozerie","leprozerii":"leprozerie","leprozeriile":"leprozerie","leprozeriilor":"leprozerie","lepse":"leapșă","lepsei":"leapșă","lepsele":"leapșă","lepselor":"leapșă","lepsita":["lepșită","lepșit","lepșita","lepșit"],"lepsite":"lepșit","lepsitele":"lepșit","lepsiti":"lepșit","lepsitii":"lepșit","lepsitul":"lepșit","leptocefali":"leptocefal","leptocefalii":"leptocefal","leptocefalilor":"leptocefal","leptocefalul":"leptocefal","leptocefalule":"leptocefal","leptocefalului":"leptocefal","leptomeningele":"leptomeninge","leptomeningelor":"leptomeninge","leptomeningelui":"leptomeninge","leptomeningite":"leptomeningită","leptomeningitei":"leptomeningită","leptomeningitele":"leptomeningită","leptomeningitelor":"leptomeningită","leptoni":"lepton","leptonii":"lepton","leptonilor":"lepton","leptonul":"lepton","leptonule":"lepton","leptonului":"lepton","leptospire":"leptospiră","leptospirei":"leptospiră","leptospirele":"leptospiră","leptospirelor":"leptospiră","leptospiroze":"leptospiroză","leptospirozei":"leptospiroză","leptospirozele":"leptospiroză","leptospirozelor":"leptospiroză","lepturarii":"lepturariu","lepturariile":"lepturariu","lepturariilor":"lepturariu","lepturariuul":"lepturariu","lepturariuule":"lepturariu","lepturariuului":"lepturariu","lerpeneaua":"lerpenea","lerpenele":"lerpenea","lerpenelei":"lerpenea","lesbiana":["lesbiană","lesbian","lesbiana","lesbian"],"lesbianisme":"lesbianism","lesbianismele":"lesbianism","lesbianismelor":"lesbianism","lesbianismul":"lesbianism","lesbianismule":"lesbianism","lesbianismului":"lesbianism","lesbianul":"lesbian","lesbica":["lesbică","lesbic","lesbica","lesbic"],"lesbice":"lesbic","lesbicele":"lesbic","lesbici":"lesbic","lesbicii":"lesbic","lesbicul":"lesbic","lesbiene":["lesbiene","lesbian","lesbiene","lesbiană"],"lesbienei":"lesbiană","lesbienele":["lesbienele","lesbian","lesbienele","lesbiană"],"lesbienelor":"lesbiană","lesbieni":"lesbian","lesbienii":"lesbian","lescai":"lescaie","lescaia":"lescaie","lescaie":"lăscaie","lescaiei":"lescaie","lescaile":"lescaie","lescailor":"lescaie","lescioare":"leșcioară","lescioarei":"leșcioară","lescioarele":"leșcioară","lescioarelor":"leșcioară","lese":["leșe","leahă","lese","leasă","lese","lesă"],"leseasca":["leșească","leșesc","leșeasca","leșesc"],"lesei":["leșei","leahă","lesei","leasă","lesei","lesă"],"lesele":["leșele","leahă","lesele","leasă","lesele","lesă"],"leselor":["leșelor","leahă","leselor","leasă","leselor","lesă"],"lesescul":"leșesc","lesesti":"leșesc","lesestii":"leșesc","lesestile":"leșesc","lesi":"leah","lesia":"leșie","lesiatica":["leșiatică","leșiatic","leșiatica","leșiatic"],"lesiatice":"leșiatic","lesiaticele":"leșiatic","lesiatici":"leșiatic","lesiaticii":"leșiatic","lesiaticul":"leșiatic","lesiei":"leșie","lesietica":["leșietică","leșietic","leșietica","leșietic"],"lesietice":"leșietic","lesieticele":"leșietic","lesietici":"leșietic","lesieticii":"leșietic","lesieticul":"leșietic","lesii":["leșii","leah","leșii","leșie"],"lesilor":"leah","lesin":"leșina","lesinai":"leșina","lesinam":["leșinăm","leșina","leșinam","leșina"],"lesinand":"leșina","lesinara":"leșina","lesinaram":"leșina","lesinarati":"leșina","lesinase":"leșina","lesinasem":"leșina","lesinasera":"leșina","lesinaseram":"leșina","lesinaserati":"leșina","lesinasesi":"leșina","lesinasi":"leșina","lesinat":"leșina","lesinata":["leșinată","leșinat","leșinata","leșinat"],"lesinate":"leșinat","lesinatele":"leșinat","lesinati":["leșinați","leșina","leșinați","leșinat"],"lesinatii":"leșinat","lesinatul":"leșinat","lesinaturi":"leșinătură","lesinaturii":"leșinătură","lesinaturile":"leșinătură","lesinaturilor":"leșinătură","lesinau":"leșina","lesini":"leșina","lesinul":"leșin","lesinule":"leșin","lesinului":"leșin","lesinuri":"leșin","lesinurile":"leșin","lesinurilor":"leșin","lesioare":"leșioară","lesioarei":"leșioară","lesioarele":"leșioară","lesioarelor":"leșioară","lesioasa":["leșioasă","leșios","leșioasa","leșios"],"lesioase":"leșios","lesioasele":"leșios","lesiosi":"leșios","lesiosii":"leșios","lesiosul":"leșios","lesnele":"lesneală","lesnelei":"lesneală","lesnelele":"lesneală","lesnelelor":"lesneală","lesneli":"lesneală","lesnicioasa":["lesnicioasă","lesnicios","lesnicioasa","lesnicios"],"lesnicioase":"lesnicios","lesnicioasele":"lesnicios","lesniciosi":"lesnicios","lesniciosii":"lesnicios","lesniciosul":"lesnicios","lesniciunea":"lesniciune","lesniciuni":"lesniciune","lesniciunii":"lesniciune","lesniciunile":"lesniciune","lesniciunilor":"lesniciune","lesniece":"leșniec","lesniecele":"leșniec","lesniecelor":"leșniec","lesniecul":"leșniec","lesniecule":"leșniec","lesniecului":"leșniec","lesnimea":"lesnime","lesnimi":"lesnime","lesnimii":"lesnime","lesnimile":"lesnime","lesnimilor":"lesnime","lesnirea":"lesnire","lesniri":"lesnire","lesnirii":"lesnire","lesnirile":"lesnire","lesnirilor":"lesnire","lesnita":["leșnită","leșnit","leșnita","leșnit"],"lesnitatati":"lesnitate","lesnitatatii":"lesnitate","lesnitatatile":"lesnitate","lesnitatatilor":"lesnitate","lesnitatea":"lesnitate","lesnite":"leșnit","lesnitele":"leșnit","lesniti":"leșnit","lesnitii":"leșnit","lesnitul":"leșnit","lesoaie":"lesoi","lesoaiele":"lesoi","lesoaielor":"lesoi","lesoasa":["leșoasă","leșos","leșoasa","leșos"],"lesoase":"leșos","lesoasele":"leșos","lesoiul":"lesoi","lesoiule":"lesoi","lesoiului":"lesoi","lesosi":"leșos","lesosii":"leșos","lesosul":"leșos","lesothiana":["lesothiană","lesothian","lesothiana","lesothian"],"lesothiane":"lesothiană","lesothianul":"lesothian","lesothianule":"lesothian","lesothianului":"lesothian","lesothiene":["lesothiene","lesothian","lesothiene","lesothiană"],"lesothienei":"lesothiană","lesothienele":["lesothienele","lesothian","lesothienele","lesothiană"],"lesothienelor":"lesothiană","lesothieni":"lesothian","lesothienii":"lesothian","lesothienilor":"lesothian","lespedea":"lespede","lespedoasa":["lespedoasă","lespedos","lespedoasa","lespedos"],"lespedoase":"lespedos","lespedoasele":"lespedos","lespedosi":"lespedos","lespedosii":"lespedos","lespedosul":"lespedos","lespedute":"lespeduță","lespedutei":"lespeduță","lespedutele":"lespeduță","lespedutelor":"lespeduță","lespegioare":"lespegioară","lespegioarei":"lespegioară","lespegioarele":"lespegioară","lespegioarelor":"lespegioară","lespejoare":"lespejoară","lespejoarei":"lespejoară","lespejoarele":"lespejoară","lespejoarelor":"lespejoară","lespezi":"lespede","lespezii":"lespede","lespezile":"lespede","lespezilor":"lespede","lespezite":"lespeziță","lespezitei":"lespeziță","lespezitele":"lespeziță","lespezitelor":"lespeziță","lespezui":"lespezuie","lespezuia":"lespezuie","lespezuii":"lespezuie","lespezuile":"lespezuie","lespezuilor":"lespezuie","lest":"lesturi","lestai":"lesta","lestam":["lestăm","lesta","lestam","lesta"],"lestand":"lesta","lestara":"lesta","lestaram":"lesta","lestarati":"lesta","lestase":"lesta","lestasem":"lesta","lestasera":"lesta","lestaseram":"lesta","lestaserati":"lesta","lestasesi":"lesta","lestasi":"lesta","lestat":"lesta","lestati":"lesta","lestau":"lesta","lesteaza":"lesta","lestez":"lesta","lestezi":"lesta","lestul":"lest","lestule":"lest","lestului":"lest","lesturi":"lest","lesturile":"lest","lesturilor":"lest","lesuci":"lesucă","lesucii":"lesucă","lesucile":"lesucă","lesucilor":"lesucă","lesuia":"leșui","lesuiai":"leșui","lesuiam":"leșui","lesuiati":"leșui","lesuiau":"leșui","lesuiesc":"leșui","lesuieste":"leșui","lesuiesti":"leșui","lesuii":"leșui","lesuim":"leșui","lesuind":"leșui","lesuira":"leșui","lesuiram":"leșui","lesuirati":"leșui","lesuise":"leșui","lesuisem":"leșui","lesuisera":"leșui","lesuiseram":"leșui","lesuiserati":"leșui","lesuisesi":"leșui","lesuisi":"leșui","lesuit":"leșui","lesuita":["leșuită","leșuit","leșuita","leșuit"],"lesuite":"leșuit","lesuitele":"leșuit","lesuiti":["leșuiți","leșui","leșuiți","leșuit"],"lesuitii":"leșuit","lesuitul":"leșuit","lesuituri":"leșuitură","lesuiturii":"leșuitură","lesuiturile":"leșuitură","lesuiturilor":"leșuitură","lesul":["lesul","les","leșul","leș"],"lesule":["lesule","les","leșule","leș"],"lesului":["lesului","les","leșului","leș"],"lesuri":["lesuri","les","leșuri","leș"],"lesurile":["lesurile","les","leșurile","leș"],"lesurilor":["lesurilor","les","leșurilor","leș"],"lesute":"lesuță","lesutei":"lesuță","letala":["letală","letal","letala","letal"],"letale":"letal","letalele":"letal","letali":"letal","letalii":"letal","letalitatea":"letalitate","letalitati":"letalitate","letalitatii":"letalitate","letalitatile":"letalitate","letalitatilor":"letalitate","letalul":"letal","letarghiceasca":["letarghicească","letarghicesc","letarghiceasca","letarghicesc"],"letarghicescul":"letarghicesc","letarghicesti":"letarghicesc","letarghicestii":"letarghicesc","letarghicestile":"letarghicesc","letargia":"letargie","letargica":["letargică","letargic","letargica","letargic"],"letargice":"letargic","letargicele":"letargic","letargici":"letargic","letargicii":"letargic","letargicul":"letargic","letargiei":"letargie","letargii":"letargie","letargiile":"letargie","letargiilor":"letargie","letcai":"lețcaie","letcaiea":"lețcaie","letcaii":"lețcaie","letcaile":"lețcaie","letcailor":"lețcaie","letcoane":"letcon","letcoanele":"letcon","letcoanelor":"letcon","letconul":"letcon","letconule":"letcon","letconului":"letcon","letifera":["letiferă","letifer","letifera","letifer"],"letifere":"letifer","letiferele":"letifer","letiferi":"letifer","letiferii":"letifer","letiferul":"letifer","letitia":"letiție","letitiei":"letiție","letitii":"letiție","letitiile":"letiție","letitiilor":"letiție","letona":["letonă","leton","letona","leton"],"letone":["letone","leton","letone","letonă"],"letonei":"letonă","letonele":["letonele","leton","letonele","letonă"],"letonelor":"letonă","letoni":"leton","letonie":"Letonia","letoniei":"Letonia","letonii":["letonii","leton","letonii","Letonia"],"letonilor":"leton","letonul":"leton","letonule":"leton","letonului":"leton","letopisete":"letopiseț","letopisetele":"letopiseț","letopisetelor":"letopiseț","letopisetul":"letopiseț","letopisetule":"letopiseț","letopisetului":"letopiseț","letopisitari":"letopisițar","letopisitarii":"letopisițar","letopisitarilor":"letopisițar","letopisitarul":"letopisițar","letopisitarule":"letopisițar","letopisitarului":"letopisițar","letrine":"letrină","letrinei":"letrină","letrinele":"letrină","letrinelor":"letrină","letrisme":"letrism","letrismele":"letrism","letrismelor":"letrism","letrismul":"letrism","letrismule":"letrism","letrismului":"letrism","letrista":["letristă","letrist","letrista","letrist"],"letriste":"letrist","letristele":"letrist","letristi":"letrist","letristii":"letrist","letristul":"letrist","leturelul":"lețurel","leturelule":"lețurel","leturelului":"lețurel","leturghia":"leturghie","leturghiei":"leturghie","leturghii":"leturghie","leturghiile":"leturghie","leturghiilor":"leturghie","leuasi":"leuaș","leuasii":"leuaș","leuasilor":"leuaș","leuasul":"leuaș","leuasule":"leuaș","leuasului":"leuaș","leucemia":"leucemie","leucemica":["leucemică","leucemic","leucemica","leucemic"],"leucemice":"leucemic","leucemicele":"leucemic","leucemici":"leucemic","leucemicii":"leucemic","leucemicul":"leucemic","leucemiei":"leucemie","leucemii":"leucemie","leuci":"leucă","leucii":"leucă","leucile":"leucă","leucilor":"leucă","leucine":"leucină","leucinei":"leucină","leucioare":"leucioară","leucioarei":"leucioară","leucioarele":"leucioară","leucioarelor":"leucioară","leucisme":"leucism","leucismele":"leucism","leucismelor":"leucism","leucismul":"leucism","leucismule":"leucism","leucismului":"leucism","leucite":"leucit","leucitele":"leucit","leucitelor":"leucit","leucitica":["leucitică","leucitic","leucitica","leucitic"],"leucitice":"leucitic","leuciticele":"leucitic","leucitici":"leucitic","leuciticii":"leucitic","leuciticul":"leucitic","leucititul":"leucitit","leucititule":"leucitit","leucititului":"leucitit","leucitul":"leucit","leucitule":"leucit","leucitului":"leucit","leucoaglutinine":"leucoaglutinină","leucoaglutininei":"leucoaglutinină","leucoaglutininele":"leucoaglutinină","leucoaglutininelor":"leucoaglutinină","leucoame":"leucom","leucoamele":"leucom","leucoamelor":"leucom","leucobaze":"leucobază","leucobazei":"leucobază","leucobazele":"leucobază","leucobazelor":"leucobază","leucoblaste":"leucoblast","leucoblastele":"leucoblast","leucoblastelor":"leucoblast","leucoblastul":"leucoblast","leucoblastule":"leucoblast","leucoblastului":"leucoblast","leucocheratoze":"leucocheratoză","leucocheratozei":"leucocheratoză","leucocheratozele":"leucocheratoză","leucocheratozelor":"leucocheratoză","leucocitara":["leucocitară","leucocitar","leucocitara","leucocitar"],"leucocitare":"leucocitar","leucocitarele":"leucocitar","leucocitari":"leucocitar","leucocitarii":"leucocitar","leucocitarul":"leucocitar","leucocitaul":"leucocită","leucocitaule":"leucocită","leucocitaului":"leucocită","leucocite":["leucocite","leucocit","leucocite","leucocită"],"leucocitele":["leucocitele","leucocit","leucocitele","leucocită"],"leucocitelor":["leucocitelor","leucocit","leucocitelor","leucocită"],"leucocitemia":"leucocitemie","leucocitemiei":"leucocitemie","leucocitemii":"leucocitemie","leucocitemiile":"leucocitemie","leucocitemiilor":"leucocitemie","leucocitogeneze":"leucocitogeneză","leucocitogenezei":"leucocitogeneză","leucocitogenezele":"leucocitogeneză","leucocitogenezelor":"leucocitogeneză","leucocitolize":"leucocitoliză","leucocitolizei":"leucocitoliză","leucocitolizele":"leucocitoliză","leucocitolizelor":"leucocitoliză","leucocitopenia":"leucocitopenie","leucocitopeniei":"leucocitopenie","leucocitopenii":"leucocitopenie","leucocitopeniile":"leucocitopenie","leucocitopeniilor":"leucocitopenie","leucocitopoieze":"leucocitopoieză","leucocitopoiezei":"leucocitopoieză","leucocitopoiezele":"leucocitopoieză","leucocitopoiezelor":"leucocitopoieză","leucocitoze":"leucocitoză","leucocitozei":"leucocitoză","leucocitozele":"leucocitoză","leucocitozelor":"leucocitoză","leucocitul":"leucocit","leucocitule":"leucocit","leucocitului":"leucocit","leucocituria":"leucociturie","leucocituriei":"leucociturie","leucociturii":"leucociturie","leucocituriile":"leucociturie","leucocituriilor":"leucociturie","leucoderivati":"leucoderivat","leucoderivatii":"leucoderivat","leucoderivatilor":"leucoderivat","leucoderivatul":"leucoderivat","leucoderivatule":"leucoderivat","leucoderivatului":"leucoderivat","leucoderma":["leucodermă","leucoderm","leucoderma","leucoderm"],"leucoderme":"leucoderm","leucodermele":"leucoderm","leucodermi":"leucoderm","leucodermia":"leucodermie","leucodermiei":"leucodermie","leucodermii":["leucodermii","leucoderm","leucodermii","leucodermie"],"leucodermul":"leucoderm","leucoencefalite":"leucoencefalită","leucoencefalitei":"leucoencefalită","leucoencefalitele":"leucoencefalită","leucoencefalitelor":"leucoencefalită","leucofanul":"leucofan","leucofanule":"leucofan","leucofanului":"leucofan","leucogena":["leucogenă","leucogen","leucogena","leucogen"],"leucogene":"leucogen","leucogenele":"leucogen","leucogeneze":"leucogeneză","leucogenezei":"leucogeneză","leucogenezele":"leucogeneză","leucogenezelor":"leucogeneză","leucogeni":"leucogen","leucogenii":"leucogen","leucogenul":"leucogen","leucograme":"leucogramă","leucogramei":"leucogramă","leucogramele":"leucogramă","leucogramelor":"leucogramă","leucomaine":"leucomaină","leucomainei":"leucomaină","leucomainele":"leucomaină","leucomainelor":"leucomaină","leucomelanodermia":"leucomelanodermie","leucomelanodermiei":"leucomelanodermie","leucomelanodermii":"leucomelanodermie","leucomelanodermiile":"leucomelanodermie","leucomelanodermiilor":"leucomelanodermie","leucometre":"leucometru","leucometrele":"leucometru","leucometrelor":"leucometru","leucometruul":"leucometru","leucometruule":"leucometru","leucometruului":"leucometru","leucomielite":"leucomielită","leucomielitei":"leucomielită","leucomielitele":"leucomielită","leucomielitelor":"leucomielită","leucomul":"leucom","leucomule":"leucom","leucomului":"leucom","leuconichia":"leuconichie","leuconichiei":"leuconichie","leuconichii":"leuconichie","leuconichiile":"leuconichie","leuconichiilor":"leuconichie","leucopatia":"leucopatie","leucopatiei":"leucopatie","leucopatii":"leucopatie","leucopatiile":"leucopatie","leucopatiilor":"leucopatie","leucopedeze":"leucopedeză","leucopedezei":"leucopedeză","leucopedezele":"leucopedeză","leucopedezelor":"leucopedeză","leucopenia":"leucopenie","leucopeniei":"leucopenie","leucopenii":"leucopenie","leucoplachia":"leucoplachie","leucoplachiei":"leucoplachie","leucoplachii":"leucoplachie","leucoplachiile":"leucoplachie","leucoplachiilor":"leucoplachie","leucoplaste":"leucoplast","leucoplastele":"leucoplast","leucoplastelor":"leucoplast","leucoplastul":"leucoplast","leucoplastule":"leucoplast","leucoplastului":"leucoplast","leucoplazia":"leucoplazie","leucoplaziei":"leucoplazie","leucoplazii":"leucoplazie","leucoplaziile":"leucoplazie","leucoplaziilor":"leucoplazie","leucopoieze":"leucopoieză","leucopoiezei":"leucopoieză","leucopoiezele":"leucopoieză","leucopoiezelor":"leucopoieză","leucoreea":"leucoree","leucorei":"leucoree","leucoreica":["leucoreică","leucoreic","leucoreica","leucoreic"],"leucoreice":"leucoreic","leucoreicele":"leucoreic","leucoreici":"leucoreic","leucoreicii":"leucoreic","leucoreicul":"leucoreic","leucoreii":"leucoree","leucospermia":"leucospermie","leucospermiei":"leucospermie","leucospermii":"leucospermie","leucotomia":"leucotomie","leucotomiei":"leucotomie","leucotomii":"leucotomie","leucotomiile":"leucotomie","leucotomiilor":"leucotomie","leucotoxica":["leucotoxică","leucotoxic","leucotoxica","leucotoxic"],"leucotoxice":"leucotoxic","leucotoxicele":"leucotoxic","leucotoxici":"leucotoxic","leucotoxicii":"leucotoxic","leucotoxicul":"leucotoxic","leucotoxine":"leucotoxină","leucotoxinei":"leucotoxină","leucotoxinele":"leucotoxină","leucotoxinelor":"leucotoxină","leucoxenul":"leucoxen","leucoxenule":"leucoxen","leucoxenului":"leucoxen","leucoze":"leucoză","leucozei":"leucoză","leucozele":"leucoză","leucozelor":"leucoză","leucozica":["leucozică","leucozic","leucozica","leucozic"],"leucozice":"leucozic","leucozicele":"leucozic","leucozici":"leucozic","leucozicii":"leucozic","leucozicul":"leucozic","leucozine":"leucozină","leucozinei":"leucozină","leucozinele":"leucozină","leucozinelor":"leucozină","leucozomi":"leucozom","leucozomii":"leucozom","leucozomilor":"leucozom","leucozomul":"leucozom","leucozomule":"leucozom","leucozomului":"leucozom","leul":"leu","leule":"leu","leuleti":"leuleț","leuletii":"leuleț","leuletilor":"leuleț","leuletul":"leuleț","leuletule":"leuleț","leuletului":"leuleț","leului":"leu","leurdari":"leurdar","leurdarii":"leurdar","leurdarilor":"leurdar","leurdarul":"leurdar","leurdarule":"leurdar","leurdarului":"leurdar","leurde":"leurdă","leurdei":"leurdă","leurdele":"leurdă","leurdelor":"leurdă","leurdese":"leurdeasă","leurdesei":"leurdeasă","leurdesele":"leurdeasă","leurdeselor":"leurdeasă","leurdine":"leurdină","leurdinei":"leurdină","leurdinele":"leurdină","leurdinelor":"leurdină","leuscani":"leușcan","leuscanii":"leușcan","leuscanilor":"leușcan","leuscanul":"leușcan","leuscanule":"leușcan","leuscanului":"leușcan","leusori":"leușor","leusorii":"leușor","leusorilor":"leușor","leusorul":"leușor","leusorule":"leușor","leusorului":"leușor","leusteanul":"leuștean","leusteanule":"leuștean","leusteanului":"leuștean","leusteni":"leuștean","leustenii":"leuștean","leustenilor":"leuștean","leuti":"leuț","leutii":"leuț","leutilor":"leuț","leutul":"leuț","leutule":"leuț","leutului":"leuț","levantici":"levănțică","levanticii":"levănțică","levantine":"levantină","levantinei":"levantină","levantinele":"levantină","levantinelor":"levantină","levantini":"levantin","levantinii":"levantin","levantinilor":"levantin","levantinul":"levantin","levantinule":"levantin","levantinului":"levantin","leve":["leve","leva","leve","levă"],"levei":["levei","leva","levei","levă"],"levele":["levele","leva","levele","levă"],"levelor":["levelor","leva","levelor","levă"],"leventa":"levent","levente":"levent","leventi":["levenți","levent","leventi","levent"],"leventice":"levențică","leventicei":"levențică","leventii":"levent","leventilor":"levent","leventul":"levent","leventule":"levent","leventului":"levent","levesul":"leveș","levesule":"leveș","levesului":"leveș","leviatane":"leviatan","leviatanele":"leviatan","leviatanelor":"leviatan","leviatanul":"leviatan","leviatanule":"leviatan","leviatanului":"leviatan","leviere":"levier","levierele":"levier","levierelor":"levier","levierul":"levier","levierule":"levier","levierului":"levier","levigai":"leviga","levigam":["levigăm","leviga","levigam","leviga"],"levigand":"leviga","levigara":"leviga","levigaram":"leviga","levigarati":"leviga","levigase":"leviga","levigasem":"leviga","levigasera":"leviga","levigaseram":"leviga","levigaserati":"leviga","levigasesi":"leviga","levigasi":"leviga","levigat":"leviga","levigati":"leviga","levigatia":"levigație","levigatiei":"levigație","levigatii":"levigație","levigatiile":"levigație","levigatiilor":"levigație","levigau":"leviga","levigheaza":"leviga","levighez":"leviga","levighezi":"leviga","levinciora":["levincioră","levincior","levinciora","levincior"],"levinciore":"levincior","levinciorele":"levincior","levinciori":"levincior","levinciorii":"levincior","levinciorul":"levincior","levint":"levent","levinta":["levintă","levint","levinta","levint"],"levinte":"levint","levintela":["levințelă","levințel","levințela","levințel"],"levintele":["levintele","levint","levințele","levințel"],"levintelele":"levințel","levinteli":"levințel","levintelii":"levințel","levintelul":"levințel","levinti":"levint","levintii":"levint","levintul":"levint","leviratul":"levirat","leviratule":"levirat","leviratului":"levirat","levitatea":"levitate","levitati":"levitate","levitatia":"levitație","levitatiei":"levitație","levitatii":["levității","levitate","levitații","levitație"],"levitatiile":"levitație","levitatiilor":"levitație","levitatiunea":"levitațiune","levitatiuni":"levitațiune","levitatiunii":"levitațiune","levitatiunile":"levitațiune","levitatiunilor":"levitațiune","leviti":"levit","leviticeasca":["leviticească","leviticesc","leviticeasca","leviticesc"],"leviticescul":"leviticesc","leviticesti":"leviticesc","leviticestii":"leviticesc","leviticestile":"leviticesc","levitii":"levit","levitilor":"levit","levitul":"levit","levitule":"levit","levitului":"levit","levocardia":"levocardie","levocardiei":"levocardie","levocardii":"levocardie","levocardiile":"levocardie","levocardiilor":"levocardie","levocardiograme":"levocardiogramă","levocardiogramei":"levocardiogramă","levocardiogramele":"levocardiogramă","levocardiogramelor":"levocardiogramă","levogira":["levogiră","levogir","levogira","levogir"],"levogire":"levogir","levogirele":"levogir","levogiri":"levogir","levogirii":"levogir","levogirul":"levogir","levorotatia":"levorotație","levorotatiei":"levorotație","levorotatii":"levorotație","levorotatiile":"levorotație","levorotatiilor":"levorotație","levrete":"levretă","levretei":"levretă","levretele":"levretă","levretelor":"levretă","levrieri":"levrier","levrierii":"levrier","levrierilor":"levrier","levrierul":"levrier","levrierule":"levrier","levrierului":"levrier","levuloze":"levuloză","levulozei":"levuloză","levulozele":"levuloză","levulozelor":"levuloză","levuri":"levură","levurii":"levură","levurile":"levură","levurilor":"levură","lexematica":["lexematică","lexematic","lexematica","lexematic"],"lexematice":"lexematic","lexematicele":"lexematic","lexematici":"lexematic","lexematicii":"lexematic","lexematicul":"lexematic","lexeme":"lexem","lexemele":"lexem","lexemelor":"lexem","lexemul":"lexem","lexemule":"lexem","lexemului":"lexem","lexia":"lexie","lexicala":["lexicală","lexical","lexicala","lexical"],"lexicale":"lexical","lexicalele":"lexical","lexicali":"lexical","lexicalii":"lexical","lexicalizai":"lexicaliza","lexicalizam":["lexicalizăm","lexicaliza","lexicalizam","lexicaliza"],"lexicalizand":"lexicaliza","lexicalizara":"lexicaliza","lexicalizaram":"lexicaliza","lexicalizarati":"lexicaliza","lexicalizarea":"lexicalizare","lexicalizari":"lexicalizare","lexicalizarii":"lexicalizare","lexicalizarile":"lexicalizare","lexicalizarilor":"lexicalizare","lexicalizase":"lexicaliza","lexicalizasem":"lexicaliza","lexicalizasera":"lexicaliza","lexicalizaseram":"lexicaliza","lexicalizaserati":"lexicaliza","lexicalizasesi":"lexicaliza","lexicalizasi":"lexicaliza","lexicalizat":"lexicaliza","lexicalizata":["lexicalizată","lexicalizat","lexicalizata","lexicalizat"],"lexicalizate":"lexicalizat","lexicalizatele":"lexicalizat","lexicalizati":["lexicalizați","lexicaliza","lexicalizați","lexicalizat"],"lexicalizatii":"lexicalizat","lexicalizatul":"lexicalizat","lexicalizau":"lexicaliza","lexicalizeaza":"lexicaliza","lexicalizez":"lexicaliza","lexicalizezi":"lexicaliza","lexicalul":"lexical","lexicoane":"lexicon","lexicoanele":"lexicon","lexicoanelor":"lexicon","lexicografe":"lexicografă","lexicografei":"lexicografă","lexicografele":"lexicografă","lexicografelor":"lexicografă","lexicografi":"lexicograf","lexicografia":"lexicografie","lexicografica":["lexicografică","lexicografic","lexicografica","lexicografic"],"lexicografice":"lexicografic","lexicograficeasca":["lexicograficească","lexicograficesc","lexicograficeasca","lexicograficesc"],"lexicograficele":"lexicografic","lexicograficescul":"lexicograficesc","lexicograficesti":"lexicograficesc","lexicograficestii":"lexicograficesc","lexicograficestile":"lexicograficesc","lexicografici":"lexicografic","lexicograficii":"lexicografic","lexicograficul":"lexicografic","lexicografiei":"lexicografie","lexicografii":["lexicografii","lexicograf","lexicografii","lexicografie"],"lexicografilor":"lexicograf","lexicograful":"lexicograf","lexicografule":"lexicograf","lexicografului":"lexicograf","lexicologe":"lexicologă","lexicologei":"lexicologă","lexicologele":"lexicologă","lexicologelor":"lexicologă","lexicologi":"lexicolog","lexicologia":"lexicologie","lexicologica":["lexicologică","lexicologic","lexicologica","lexicologic"],"lexicologice":"lexicologic","lexicologiceasca":["lexicologicească","lexicologicesc","lexicologiceasca","lexicologicesc"],"lexicologicele":"lexicologic","lexicologicescul":"lexicologicesc","lexicologicesti":"lexicologicesc","lexicologicestii":"lexicologicesc","lexicologicestile":"lexicologicesc","lexicologici":"lexicologic","lexicologicii":"lexicologic","lexicologicul":"lexicologic","lexicologiei":"lexicologie","lexicologii":["lexicologii","lexicolog","lexicologii","lexicologie"],"lexicologilor":"lexicolog","lexicologul":"lexicolog","lexicologule":"lexicolog","lexicologului":"lexicolog","lexiconul":"lexicon","lexiconule":"lexicon","lexiconului":"lexicon","lexicoteci":"lexicotecă","lexicotecii":"lexicotecă","lexicotecile":"lexicotecă","lexicotecilor":"lexicotecă","lexicul":"lexic","lexicule":"lexic","lexicului":"lexic","lexiei":"lexie","lexigrafia":"lexigrafie","lexigrafica":["lexigrafică","lexigrafic","lexigrafica","lexigrafic"],"lexigrafice":"lexigrafic","lexigraficele":"lexigrafic","lexigrafici":"lexigrafic","lexigraficii":"lexigrafic","lexigraficul":"lexigrafic","lexigrafiei":"lexigrafie","lexigrafii":"lexigrafie","lexigrafiile":"lexigrafie","lexigrafiilor":"lexigrafie","lexii":"lexie","lexiile":"lexie","lexiilor":"lexie","lexiologia":"lexiologie","lexiologiei":"lexiologie","lexiologii":"lexiologie","lexiologiile":"lexiologie","lexiologiilor":"lexiologie","lexise":"lexis","lexisele":"lexis","lexiselor":"lexis","lexisul":"lexis","lexisule":"lexis","lexisului":"lexis","lezai":"leza","lezam":["lezăm","leza","lezam","leza"],"lezand":"leza","lezara":"leza","lezaram":"leza","lezarati":"leza","lezarde":"lezardă","lezardei":"lezardă","lezardele":"lezardă","lezardelor":"lezardă","lezardi":"lezard","lezardii":"lezard","lezardilor":"lezard","lezardul":"lezard","lezardule":"lezard","lezardului":"lezard","lezarea":"lezare","lezari":"lezare","lezarii":"lezare","lezarile":"lezare","lezarilor":"lezare","lezase":"leza","lezasem":"leza","lezasera":"leza","lezaseram":"leza","lezaserati":"leza","lezasesi":"leza","lezasi":"leza","lezat":"leza","lezati":"leza","lezau":"leza","lezeaza":"leza","lezez":"leza","lezezi":"leza","lezionala":["lezională","lezional","lezionala","lezional"],"lezionale":"lezional","lezionalele":"lezional","lezionali":"lezional","lezionalii":"lezional","lezionalul":"lezional","lezionara":["lezionară","lezionar","lezionara","lezionar"],"lezionare":"lezionar","lezionarele":"lezionar","lezionari":"lezionar","lezionarii":"lezionar","lezionarul":"lezionar","leziuni":"leziune"};
@@ -0,0 +1 @@
+export default {"lezmaiestatea":"lezmaiestate","lezmaiestati":"lezmaiestate","lezmaiestatii":"lezmaiestate","lezmajestatea":"lezmajestate","lezmajestati":"lezmajestate","lezmajestatii":"lezmajestate","lherzolitul":"lherzolit","lherzolitule":"lherzolit","lherzolitului":"lherzolit","liaje":"liaj","liajele":"liaj","liajelor":"liaj","liajul":"liaj","liajule":"liaj","liajului":"liaj","liane":"liană","lianei":"liană","lianele":"liană","lianelor":"liană","lianti":"liant","liantii":"liant","liantilor":"liant","liantul":"liant","liantule":"liant","liantului":"liant","liape":"liapă","liapei":"liapă","liasica":["liasică","liasic","liasica","liasic"],"liasice":"liasic","liasicele":"liasic","liasici":"liasic","liasicii":"liasic","liasicile":"liasic","liasicilor":"liasic","liasicul":"liasic","liasicule":"liasic","liasicului":"liasic","libadeaua":"libadea","libadele":"libadea","libadelei":"libadea","libadelele":"libadea","libadelelor":"libadea","libaneza":["libaneză","libanez","libaneza","libanez"],"libaneze":["libaneze","libanez","libaneze","libaneză"],"libanezei":"libaneză","libanezele":["libanezele","libanez","libanezele","libaneză"],"libanezelor":"libaneză","libanezi":"libanez","libanezii":"libanez","libanezul":"libanez","libara":["libără","libăr","libăra","libăr"],"libarci":"libarcă","libarcii":"libarcă","libarcile":"libarcă","libarcilor":"libarcă","libare":"libăr","libarea":"libare","libarele":"libăr","libari":["libări","libăr","libări","libare"],"libarii":["libării","libăr","libării","libare"],"libarite":"libăriță","libaritei":"libăriță","libarul":"libăr","libarusul":"libăruș","libarusule":"libăruș","libarusului":"libăruș","libatia":"libație","libatiei":"libație","libatii":"libație","libatiile":"libație","libatiilor":"libație","libatiunea":"libațiune","libatiuni":"libațiune","libatiunii":"libațiune","libatiunile":"libațiune","libatiunilor":"libațiune","libatorii":"libatoriu","libatoriile":"libatoriu","libatoriilor":"libatoriu","libatoriuul":"libatoriu","libatoriuule":"libatoriu","libatoriuului":"libatoriu","libelai":"libela","libelam":["libelăm","libela","libelam","libela"],"libeland":"libela","libelara":"libela","libelaram":"libela","libelarati":"libela","libelase":"libela","libelasem":"libela","libelasera":"libela","libelaseram":"libela","libelaserati":"libela","libelasesi":"libela","libelasi":"libela","libelat":"libela","libelati":"libela","libelau":"libela","libeleaza":"libela","libelez":"libela","libelezi":"libela","libelule":"libelulă","libelulei":"libelulă","libelulele":"libelulă","libelulelor":"libelulă","liber-cugetatorul":"liber-cugetător","liber-cugetatorule":"liber-cugetător","liber-cugetatorului":"liber-cugetător","liber-schimbismul":"liber-schimbism","liber-schimbismule":"liber-schimbism","liber-schimbismului":"liber-schimbism","liber-schimbisti":"liber-schimbist","liber-schimbistii":"liber-schimbist","liber-schimbistilor":"liber-schimbist","liber-schimbistul":"liber-schimbist","liber-schimbistule":"liber-schimbist","liber-schimbistului":"liber-schimbist","libera":["liberă","liber","libera","liber"],"liberabila":["liberabilă","liberabil","liberabila","liberabil"],"liberabile":"liberabil","liberabilele":"liberabil","liberabili":"liberabil","liberabilii":"liberabil","liberabilul":"liberabil","liberai":"libera","liberala":["liberală","liberal","liberala","liberal"],"liberale":"liberal","liberalele":"liberal","liberali":"liberal","liberaliciunea":"liberaliciune","liberaliciuni":"liberaliciune","liberaliciunii":"liberaliciune","liberaliciunile":"liberaliciune","liberaliciunilor":"liberaliciune","liberalii":"liberal","liberalimea":"liberălime","liberalimi":"liberălime","liberalimii":"liberălime","liberalimile":"liberălime","liberalimilor":"liberălime","liberalismul":"liberalism","liberalismule":"liberalism","liberalismului":"liberalism","liberalista":["liberalistă","liberalist","liberalista","liberalist"],"liberaliste":"liberalist","liberalistele":"liberalist","liberalisti":"liberalist","liberalistii":"liberalist","liberalistul":"liberalist","liberalitatea":"liberalitate","liberalitati":"liberalitate","liberalitatii":"liberalitate","liberalitatile":"liberalitate","liberalitatilor":"liberalitate","liberalizai":"liberaliza","liberalizam":["liberalizăm","liberaliza","liberalizam","liberaliza"],"liberalizand":"liberaliza","liberalizara":"liberaliza","liberalizaram":"liberaliza","liberalizarati":"liberaliza","liberalizarea":"liberalizare","liberalizari":"liberalizare","liberalizarii":"liberalizare","liberalizarile":"liberalizare","liberalizarilor":"liberalizare","liberalizase":"liberaliza","liberalizasem":"liberaliza","liberalizasera":"liberaliza","liberalizaseram":"liberaliza","liberalizaserati":"liberaliza","liberalizasesi":"liberaliza","liberalizasi":"liberaliza","liberalizat":"liberaliza","liberalizata":["liberalizată","liberalizat","liberalizata","liberalizat"],"liberalizate":"liberalizat","liberalizatele":"liberalizat","liberalizati":["liberalizați","liberaliza","liberalizați","liberalizat"],"liberalizatii":"liberalizat","liberalizatul":"liberalizat","liberalizau":"liberaliza","liberalizeaza":"liberaliza","liberalizez":"liberaliza","liberalizezi":"liberaliza","liberalul":"liberal","liberam":["liberăm","libera","liberam","libera"],"liberand":"libera","liberara":"libera","liberaram":"libera","liberarati":"libera","liberarea":"liberare","liberari":"liberare","liberarii":"liberare","liberarile":"liberare","liberarilor":"liberare","liberase":"libera","liberasem":"libera","liberasera":"libera","liberaseram":"libera","liberaserati":"libera","liberasesi":"libera","liberasi":"libera","liberat":"libera","liberata":["liberată","liberat","liberata","liberat"],"liberate":"liberat","liberatele":"liberat","liberati":["liberați","libera","liberați","liberat"],"liberatii":["liberații","liberat","liberații","liberație"],"liberatiunea":"liberațiune","liberatiuni":"liberațiune","liberatiunii":"liberațiune","liberatiunile":"liberațiune","liberatiunilor":"liberațiune","liberatoare":"liberator","liberatoarea":["liberatoarea","liberatoare","liberatoarea","liberator"],"liberatoarei":"liberatoare","liberatoarele":["liberatoarele","liberatoare","liberatoarele","liberator"],"liberatoarelor":"liberatoare","liberatori":"liberator","liberatorii":"liberator","liberatorul":"liberator","liberatul":"liberat","liberau":"libera","libere":"liber","libereaza":"libera","liberele":"liber","liberez":"libera","liberezi":"libera","liberi":"liber","liberi-cugetatori":"liber-cugetător","liberi-cugetatorii":"liber-cugetător","liberi-cugetatorilor":"liber-cugetător","liberiana":["liberiană","liberian","liberiana","liberian"],"liberiane":"liberiană","liberianul":"liberian","liberianule":"liberian","liberianului":"liberian","liberiene":["liberiene","liberian","liberiene","liberiană"],"liberienei":"liberiană","liberienele":["liberienele","liberian","liberienele","liberiană"],"liberienelor":"liberiană","liberieni":"liberian","liberienii":"liberian","liberienilor":"liberian","liberii":"liber","liberoi":"libero","liberolemnoasa":["liberolemnoasă","liberolemnos","liberolemnoasa","liberolemnos"],"liberolemnoase":"liberolemnos","liberolemnoasele":"liberolemnos","liberolemnosi":"liberolemnos","liberolemnosii":"liberolemnos","liberolemnosul":"liberolemnos","liberolor":"libero","liberoul":"libero","liberoule":"libero","liberoului":"libero","libertara":["libertară","libertar","libertara","libertar"],"libertare":"libertar","libertarele":"libertar","libertari":"libertar","libertarii":"libertar","libertarul":"libertar","libertatea":"libertate","libertati":"libertate","libertatii":"libertate","libertatile":"libertate","libertatilor":"libertate","liberte":"libertă","libertei":"libertă","libertele":"libertă","libertelor":"libertă","liberti":"libert","liberticida":["liberticidă","liberticid","liberticida","liberticid"],"liberticide":"liberticid","liberticidele":"liberticid","liberticidiuul":"liberticidiu","liberticidiuule":"liberticidiu","liberticidiuului":"liberticidiu","liberticidul":"liberticid","liberticizi":"liberticid","liberticizii":"liberticid","libertii":"libert","libertilor":"libert","libertina":["libertină","libertin","libertina","libertin"],"libertinagiuul":"libertinagiu","libertinagiuule":"libertinagiu","libertinagiuului":"libertinagiu","libertinaje":"libertinaj","libertinajele":"libertinaj","libertinajelor":"libertinaj","libertinajul":"libertinaj","libertinajule":"libertinaj","libertinajului":"libertinaj","libertine":"libertin","libertinele":"libertin","libertini":"libertin","libertinii":"libertin","libertinismul":"libertinism","libertinismule":"libertinism","libertinismului":"libertinism","libertinul":"libertin","libertul":"libert","libertule":"libert","libertului":"libert","liberul":"liber","libiana":["libiană","libian","libiana","libian"],"libianul":"libian","libianule":"libian","libianului":"libian","libica":["libică","libic","libica","libic"],"libice":"libic","libicele":"libic","libici":"libic","libicii":"libic","libicul":"libic","libidinea":"libidine","libidini":"libidine","libidinii":"libidine","libidinile":"libidine","libidinilor":"libidine","libidinisme":"libidinism","libidinismele":"libidinism","libidinismelor":"libidinism","libidinismul":"libidinism","libidinismule":"libidinism","libidinismului":"libidinism","libidinoasa":["libidinoasă","libidinos","libidinoasa","libidinos"],"libidinoase":"libidinos","libidinoasele":"libidinos","libidinosi":"libidinos","libidinosii":"libidinos","libidinosul":"libidinos","libidinozitatea":"libidinozitate","libidinozitati":"libidinozitate","libidinozitatii":"libidinozitate","libidinozitatile":"libidinozitate","libidinozitatilor":"libidinozitate","libidoul":"libido","libidoule":"libido","libidoului":"libido","libiene":["libiene","libian","libiene","libiană"],"libienei":"libiană","libienele":["libienele","libian","libienele","libiană"],"libienelor":"libiană","libieni":"libian","libienii":"libian","libienilor":"libian","libitinari":"libitinariu","libitinarii":"libitinariu","libitinarilor":"libitinariu","libitinariuul":"libitinariu","libitinariuule":"libitinariu","libitinariuului":"libitinariu","libovi":"libov","libovia":"libovie","liboviei":"libovie","libovii":["libovii","libov","libovii","libovie"],"liboviile":"libovie","liboviilor":"libovie","libovilor":"libov","libovirea":"libovire","liboviri":"libovire","libovirii":"libovire","libovirile":"libovire","libovirilor":"libovire","libovita":["libovită","libovit","libovita","libovit"],"libovite":"libovit","libovitele":"libovit","liboviti":"libovit","libovitii":"libovit","libovitul":"libovit","libovul":"libov","libovule":"libov","libovului":"libov","librari":"librar","libraria":"librărie","librariei":"librărie","librarii":["librarii","librar","librării","librărie"],"librariile":"librărie","librariilor":"librărie","librarilor":"librar","librarite":"librăriță","libraritei":"librăriță","libraritele":"librăriță","libraritelor":"librăriță","librarul":"librar","librarule":"librar","librarului":"librar","libratia":"librație","libratiei":"librație","libratii":"librație","libratiile":"librație","libratiilor":"librație","libratiunea":"librațiune","libratiuni":"librațiune","libratiunii":"librațiune","libratiunile":"librațiune","libratiunilor":"librațiune","libre":"libră","librei":"libră","librele":"libră","librelor":"libră","librete":"libret","libretele":"libret","libretelor":"libret","libretisti":"libretist","libretistii":"libretist","libretistilor":"libretist","libretistul":"libretist","libretistule":"libretist","libretistului":"libretist","libretul":"libret","libretule":"libret","libretului":"libret","licantropia":"licantropie","licantropica":["licantropică","licantropic","licantropica","licantropic"],"licantropice":"licantropic","licantropicele":"licantropic","licantropici":"licantropic","licantropicii":"licantropic","licantropicul":"licantropic","licantropiei":"licantropie","licantropii":"licantropie","licare":"licăr","licarea":"licări","licareai":"licări","licaream":"licări","licareati":"licări","licareau":"licări","licarele":"licăr","licarelor":"licăr","licaresc":"licări","licareste":"licări","licaresti":"licări","licaria":"licărie","licariei":"licărie","licarii":["licării","licări","licării","licărie"],"licariile":"licărie","licariilor":"licărie","licarim":"licări","licarind":"licări","licarira":"licări","licariram":"licări","licarirati":"licări","licarirea":"licărire","licariri":"licărire","licaririi":"licărire","licaririle":"licărire","licaririlor":"licărire","licarise":"licări","licarisem":"licări","licarisera":"licări","licariseram":"licări","licariserati":"licări","licarisesi":"licări","licarisi":"licări","licarisul":"licăriș","licarisule":"licăriș","licarisului":"licăriș","licarisuri":"licăriș","licarisurile":"licăriș","licarisurilor":"licăriș","licarit":"licări","licariti":"licări","licaritoare":"licăritor","licaritoarea":"licăritor","licaritoarele":"licăritor","licaritori":"licăritor","licaritorii":"licăritor","licaritorul":"licăritor","licaritul":"licărit","licaritule":"licărit","licaritului":"licărit","licarituri":"licărit","licariturile":"licărit","licariturilor":"licărit","licarul":"licăr","licarule":"licăr","licarului":"licăr","liceala":["liceală","liceal","liceala","liceal"],"liceale":"liceal","licealea":"liceale","licealele":["licealele","liceal","licealele","liceale"],"liceali":["liceali","liceal","liceali","liceale"],"licealii":["licealii","liceal","licealii","liceale"],"licealul":"liceal","liceanul":"licean","liceanule":"licean","liceanului":"licean","licee":"liceu","liceene":"liceană","liceenei":"liceană","liceenele":"liceană","liceenelor":"liceană","liceeni":"licean","liceenii":"licean","liceenilor":"licean","liceisti":"liceist","liceistii":"liceist","liceistilor":"liceist","liceistul":"liceist","liceistule":"liceist","liceistului":"liceist","licente":"licență","licente artistice":"licență artistică","licente poetice":"licență poetică","licentei":"licență","licentele":"licență","licentelor":"licență","licentiai":"licenția","licentiam":"licenția","licentiara":"licenția","licentiaram":"licenția","licentiarati":"licenția","licentiase":"licenția","licentiasem":"licenția","licentiasera":"licenția","licentiaseram":"licenția","licentiaserati":"licenția","licentiasesi":"licenția","licentiasi":"licenția","licentiat":"licenția","licentiate":"licențiată","licentiatei":"licențiată","licentiatele":"licențiată","licentiatelor":"licențiată","licentiati":["licențiați","licenția","licențiați","licențiat"],"licentiatii":"licențiat","licentiatilor":"licențiat","licentiatul":"licențiat","licentiatule":"licențiat","licentiatului":"licențiat","licentiau":"licenția","licentiaza":"licenția","licentie":"licenția","licentieaza":"licenția","licentiem":"licenția","licentierea":"licențiere","licentieri":"licențiere","licentierii":"licențiere","licentierile":"licențiere","licentierilor":"licențiere","licentiez":"licenția","licentiezi":"licenția","licentiind":"licenția","licentioasa":["licențioasă","licențios","licențioasa","licențios"],"licentioase":"licențios","licentioasele":"licențios","licentiosi":"licențios","licentiosii":"licențios","licentiosul":"licențios","licentiozitatea":"licențiozitate","licentiozitati":"licențiozitate","licentiozitatii":"licențiozitate","licentiozitatile":"licențiozitate","licentiozitatilor":"licențiozitate","licheaua":"lichea","lichefactia":"lichefacție","lichefactiei":"lichefacție","lichefactii":"lichefacție","lichefactiile":"lichefacție","lichefactiilor":"lichefacție","lichefiabila":["lichefiabilă","lichefiabil","lichefiabila","lichefiabil"],"lichefiabile":"lichefiabil","lichefiabilele":"lichefiabil","lichefiabili":"lichefiabil","lichefiabilii":"lichefiabil","lichefiabilul":"lichefiabil","lichefiai":"lichefia","lichefiam":"lichefia","lichefianta":["lichefiantă","lichefiant","lichefianta","lichefiant"],"lichefiante":"lichefiant","lichefiantele":"lichefiant","lichefianti":"lichefiant","lichefiantii":"lichefiant","lichefiantul":"lichefiant","lichefiara":"lichefia","lichefiaram":"lichefia","lichefiarati":"lichefia","lichefiase":"lichefia","lichefiasem":"lichefia","lichefiasera":"lichefia","lichefiaseram":"lichefia","lichefiaserati":"lichefia","lichefiasesi":"lichefia","lichefiasi":"lichefia","lichefiat":"lichefia","lichefiata":["lichefiată","lichefiat","lichefiata","lichefiat"],"lichefiate":"lichefiat","lichefiatele":"lichefiat","lichefiati":["lichefiați","lichefia","lichefiați","lichefiat"],"lichefiatii":"lichefiat","lichefiatul":"lichefiat","lichefiau":"lichefia","lichefiaza":"lichefia","lichefie":"lichefia","lichefieaza":"lichefia","lichefiem":"lichefia","lichefierea":"lichefiere","lichefieri":"lichefiere","lichefierii":"lichefiere","lichefierile":"lichefiere","lichefierilor":"lichefiere","lichefiez":"lichefia","lichefiezi":"lichefia","lichefiind":"lichefia","lichele":"lichea","lichelei":"lichea","lichelele":"lichea","lichelelor":"lichea","lichelia":"lichelie","licheliei":"lichelie","lichelii":"lichelie","licheliile":"lichelie","licheliilor":"lichelie","lichelisme":"lichelism","lichelismele":"lichelism","lichelismelor":"lichelism","lichelismul":"lichelism","lichelismule":"lichelism","lichelismului":"lichelism","lichelute":"licheluță","lichelutei":"licheluță","lichelutele":"licheluță","lichelutelor":"licheluță","licheni":"lichen","lichenica":["lichenică","lichenic","lichenica","lichenic"],"lichenice":"lichenic","lichenicele":"lichenic","lichenici":"lichenic","lichenicii":"lichenic","lichenicul":"lichenic","lichenificarea":"lichenificare","lichenificari":"lichenificare","lichenificarii":"lichenificare","lichenificarile":"lichenificare","lichenificarilor":"lichenificare","lichenii":"lichen","lichenilor":"lichen","lichenine":"lichenină","licheninei":"lichenină","licheninele":"lichenină","licheninelor":"lichenină","lichenologe":"lichenologă","lichenologei":"lichenologă","lichenologele":"lichenologă","lichenologelor":"lichenologă","lichenologi":"lichenolog","lichenologia":"lichenologie","lichenologiei":"lichenologie","lichenologii":["lichenologii","lichenolog","lichenologii","lichenologie"],"lichenologilor":"lichenolog","lichenologul":"lichenolog","lichenologule":"lichenolog","lichenologului":"lichenolog","lichenul":"lichen","lichenule":"lichen","lichenului":"lichen","lichida":["lichidă","lichid","lichida","lichid"],"lichidabila":["lichidabilă","lichidabil","lichidabila","lichidabil"],"lichidabile":"lichidabil","lichidabilele":"lichidabil","lichidabili":"lichidabil","lichidabilii":"lichidabil","lichidabilul":"lichidabil","lichidai":"lichida","lichidam":["lichidăm","lichida","lichidam","lichida"],"lichidand":"lichida","lichidara":"lichida","lichidaram":"lichida","lichidarati":"lichida","lichidarea":"lichidare","lichidari":"lichidare","lichidarii":"lichidare","lichidarile":"lichidare","lichidarilor":"lichidare","lichidase":"lichida","lichidasem":"lichida","lichidasera":"lichida","lichidaseram":"lichida","lichidaserati":"lichida","lichidasesi":"lichida","lichidasi":"lichida","lichidat":"lichida","lichidata":["lichidată","lichidat","lichidata","lichidat"],"lichidate":"lichidat","lichidatele":"lichidat","lichidati":["lichidați","lichida","lichidați","lichidat"],"lichidatia":"lichidație","lichidatiei":"lichidație","lichidatii":["lichidații","lichidat","lichidații","lichidație"],"lichidatiile":"lichidație","lichidatiilor":"lichidație","lichidatiunea":"lichidațiune","lichidatiuni":"lichidațiune","lichidatiunii":"lichidațiune","lichidatiunile":"lichidațiune","lichidatiunilor":"lichidațiune","lichidatoarea":"lichidatoare","lichidatoarei":"lichidatoare","lichidatoarele":"lichidatoare","lichidatoarelor":"lichidatoare","lichidatori":"lichidator","lichidatorii":"lichidator","lichidatorilor":"lichidator","lichidatorismul":"lichidatorism","lichidatorismule":"lichidatorism","lichidatorismului":"lichidatorism","lichidatorista":["lichidatoristă","lichidatorist","lichidatorista","lichidatorist"],"lichidatoriste":"lichidatorist","lichidatoristele":"lichidatorist","lichidatoristi":"lichidatorist","lichidatoristii":"lichidatorist","lichidatoristilor":"lichidatorist","lichidatoristul":"lichidatorist","lichidatoristule":"lichidatorist","lichidatoristului":"lichidatorist","lichidatorul":"lichidator","lichidatorule":"lichidator","lichidatorului":"lichidator","lichidatul":"lichidat","lichidau":"lichida","lichide":["lichide","lichid","lichide","lichidă"],"lichideaza":"lichida","lichidei":"lichidă","lichidele":["lichidele","lichid","lichidele","lichidă"],"lichidelor":["lichidelor","lichid","lichidelor","lichidă"],"lichidez":"lichida","lichidezi":"lichida","lichidiana":["lichidiană","lichidian","lichidiana","lichidian"],"lichidianul":"lichidian","lichidiene":"lichidian","lichidienele":"lichidian","lichidieni":"lichidian","lichidienii":"lichidian","lichiditatea":"lichiditate","lichiditati":"lichiditate","lichiditatii":"lichiditate","lichidul":"lichid","lichidul preejaculator":"lichid preejaculator","lichidule":"lichid","lichidului":"lichid","lichidului preejaculator":"lichid preejaculator","lichinele":"lichineală","lichinelei":"lichineală","lichinelele":"lichineală","lichinelelor":"lichineală","lichineli":"lichineală","lichiore":"lichior","lichiorele":"lichior","lichiorelor":"lichior","lichioristul":"lichiorist","lichioristule":"lichiorist","lichioristului":"lichiorist","lichiorul":"lichior","lichiorule":"lichior","lichiorului":"lichior","lichioruri":"lichior","lichizi":"lichid","lichizii":"lichid","licita":["licită","licit","licita","licit"],"licitai":"licita","licitam":["licităm","licita","licitam","licita"],"licitand":"licita","licitante":"licitantă","licitantei":"licitantă","licitantele":"licitantă","licitantelor":"licitantă","licitara":"licita","licitaram":"licita","licitarati":"licita","licitarea":"licitare","licitari":"licitare","licitarii":"licitare","licitarile":"licitare","licitarilor":"licitare","licitase":"licita","licitasem":"licita","licitasera":"licita","licitaseram":"licita","licitaserati":"licita","licitasesi":"licita","licitasi":"licita","licitat":"licita","licitati":"licita","licitatia":"licitație","licitatiei":"licitație","licitatii":"licitație","licitatiile":"licitație","licitatiilor":"licitație","licitatiunea":"licitațiune","licitatiuni":"licitațiune","licitatiunii":"licitațiune","licitatiunile":"licitațiune","licitatiunilor":"licitațiune","licitau":"licita","licite":"licit","liciteaza":"licita","licitele":"licit","licitez":"licita","licitezi":"licita","liciti":"licit","licitii":"licit","licitul":"licit","liciuitul":"liciuit","liciuitule":"liciuit","liciuitului":"liciuit","liciurirea":"linciurire","licoarea":"licoare","licopode":"licopod","licopodele":"licopod","licopodelor":"licopod","licopodiul":"licopodiu","licopodiule":"licopodiu","licopodiului":"licopodiu","licopodul":"licopod","licopodule":"licopod","licopodului":"licopod","licorexia":"licorexie","licorexiei":"licorexie","licorexii":"licorexie","licorexiile":"licorexie","licorexiilor":"licorexie","licori":"licoare","licorii":"licoare","licorile":"licoare","licorilor":"licoare","licorini":"licorin","licorinii":"licorin","licorinilor":"licorin","licorinul":"licorin","licorinule":"licorin","licorinului":"licorin","licorni":"licorn","licornii":"licorn","licornilor":"licorn","licornul":"licorn","licornule":"licorn","licornului":"licorn","licoroasa":["licoroasă","licoros","licoroasa","licoros"],"licoroase":"licoros","licoroasele":"licoros","licorosi":"licoros","licorosii":"licoros","licorosul":"licoros","licreante":"licreanță","licreantei":"licreanță","licreantele":"licreanță","licreantelor":"licreanță","lictarul":"lictar","lictarule":"lictar","lictarului":"lictar","lictori":"lictor","lictorii":"lictor","lictorilor":"lictor","lictorul":"lictor","lictorule":"lictor","lictorului":"lictor","licuatia":"licuație","licuatiei":"licuație","licuatii":"licuație","licuatiile":"licuație","licuatiilor":"licuație","licuida":["licuidă","licuid","licuida","licuid"],"licuide":"licuid","licuidele":"licuid","licuidul":"licuid","licuizi":"licuid","licuizii":"licuid","licur":"licura","licurai":"licura","licuram":["licurăm","licura","licuram","licura"],"licurand":"licura","licurara":"licura","licuraram":"licura","licurarati":"licura","licurase":"licura","licurasem":"licura","licurasera":"licura","licuraseram":"licura","licuraserati":"licura","licurasesi":"licura","licurasi":"licura","licurat":"licura","licurati":"licura","licurau":"licura","licure":"licur","licurea":"licuri","licureai":"licuri","licuream":"licuri","licureati":"licuri","licureau":"licuri","licurele":["licurele","licur","licurele","licureală"],"licurelei":"licureală","licurelele":"licureală","licurelelor":"licureală","licureli":"licureală","licurelor":"licur","licuresc":"licuri","licureste":"licuri","licuresti":"licuri","licuri":["licuri","licări","licuri","licura"],"licuricii":"licurici","licuricilor":"licurici","licuriciul":"licurici","licuriciule":"licurici","licuriciului":"licurici","licurii":"licuri","licurim":"licuri","licurind":"licuri","licurini":"licurin","licurinii":"licurin","licurinilor":"licurin","licurinul":"licurin","licurinule":"licurin","licurinului":"licurin","licurira":"licuri","licuriram":"licuri","licurirati":"licuri","licurirea":"licurire","licuriri":"licurire","licuririi":"licurire","licuririle":"licurire","licuririlor":"licurire","licurise":"licuri","licurisem":"licuri","licurisera":"licuri","licuriseram":"licuri","licuriserati":"licuri","licurisesi":"licuri","licurisi":"licuri","licurit":"licuri","licuriti":"licuri","licurul":"licur","licurule":"licur","licurului":"licur","licvida":["licvidă","licvid","licvida","licvid"],"licvide":"licvid","licvidele":"licvid","licvidul":"licvid","licvizi":"licvid","licvizii":"licvid","lideri":"lider","liderii":"lider","liderilor":"lider","liderul":"lider","liderule":"lider","liderului":"lider","lidianul":"lidian","lidianule":"lidian","lidianului":"lidian","lidiene":"lidiană","lidienei":"lidiană","lidienele":"lidiană","lidienelor":"lidiană","lidieni":"lidian","lidienii":"lidian","lidienilor":"lidian","lidii":"lidiu","lidiii":"lidiu","lidiilor":"lidiu","lidite":"lidită","liditei":"lidită","liditele":"lidită","liditelor":"lidită","lidiuul":"lidiu","lidiuule":"lidiu","lidiuului":"lidiu","lidocaine":"lidocaină","lidocainei":"lidocaină","lidocainele":"lidocaină","lidocainelor":"lidocaină","liec":"liliac","liechtensteiniana":["liechtensteiniană","liechtensteinian","liechtensteiniana","liechtensteinian"],"liechtensteiniane":"liechtensteiniană","liechtensteinianei":"liechtensteiniană","liechtensteinianele":"liechtensteiniană","liechtensteinianelor":"liechtensteiniană","liechtensteinianul":"liechtensteinian","liechtensteinianule":"liechtensteinian","liechtensteinianului":"liechtensteinian","liechtensteiniene":"liechtensteinian","liechtensteinienele":"liechtensteinian","liechtensteinieni":"liechtensteinian","liechtensteinienii":"liechtensteinian","liechtensteinienilor":"liechtensteinian","liechtensteinul":"Liechtenstein","liechtensteinule":"Liechtenstein","liechtensteinului":"Liechtenstein","liedul":"lied","liedule":"lied","liedului":"lied","lieduri":"lied","liedurile":"lied","liedurilor":"lied","lienala":["lienală","lienal","lienala","lienal"],"lienale":"lienal","lienalele":"lienal","lienali":"lienal","lienalii":"lienal","lienalul":"lienal","lienterica":["lienterică","lienteric","lienterica","lienteric"],"lienterice":"lienteric","lientericele":"lienteric","lienterici":"lienteric","lientericii":"lienteric","lientericul":"lienteric","lienul":"lien","lienule":"lien","lienului":"lien","lienuri":"lien","lienurile":"lien","lienurilor":"lien","lifer":"lifera","liferai":"lifera","liferam":["liferăm","lifera","liferam","lifera"],"liferand":"lifera","liferanti":"liferant","liferantii":"liferant","liferantilor":"liferant","liferantul":"liferant","liferantule":"liferant","liferantului":"liferant","liferara":"lifera","liferaram":"lifera","liferarari":"liferare","liferararii":"liferare","liferararile":"liferare","liferararilor":"liferare","liferarati":"lifera","liferarea":"liferare","liferase":"lifera","liferasem":"lifera","liferasera":"lifera","liferaseram":"lifera","liferaserati":"lifera","liferasesi":"lifera","liferasi":"lifera","liferat":"lifera","liferati":"lifera","liferatori":"liferător","liferatorii":"liferător","liferatorilor":"liferător","liferatorul":"liferător","liferatorule":"liferător","liferatorului":"liferător","liferau":"lifera","liferi":"lifera","lifte":"liftă","liftei":"liftă","liftele":"liftă","liftelor":"liftă","liftelute":"lifteluță","liftelutei":"lifteluță","liftelutele":"lifteluță","liftelutelor":"lifteluță","liftiere":"liftieră","liftierei":"liftieră","liftierele":"liftieră","liftierelor":"liftieră","liftieri":"liftier","liftierii":"liftier","liftierilor":"liftier","liftierul":"liftier","liftierule":"liftier","liftierului":"liftier","liftingul":"lifting","liftingule":"lifting","liftingului":"lifting","liftinguri":"lifting","liftingurile":"lifting","liftingurilor":"lifting","lifturi":"lift","ligamente":"ligament","ligamentele":"ligament","ligamentelor":"ligament","ligamentoasa":["ligamentoasă","ligamentos","ligamentoasa","ligamentos"],"ligamentoase":"ligamentos","ligamentoasele":"ligamentos","ligamentoplastia":"ligamentoplastie","ligamentoplastiei":"ligamentoplastie","ligamentoplastii":"ligamentoplastie","ligamentoplastiile":"ligamentoplastie","ligamentoplastiilor":"ligamentoplastie","ligamentosi":"ligamentos","ligamentosii":"ligamentos","ligamentosul":"ligamentos","ligamentul":"ligament","ligamentule":"ligament","ligamentului":"ligament","ligature":"ligatură","ligaturei":"ligatură","ligaturele":"ligatură","ligaturelor":"ligatură","ligaturi":"ligatură","ligava":["ligavă","ligav","ligava","ligav"],"ligave":"ligav","ligavele":"ligav","ligavi":"ligav","ligavii":"ligav","ligavul":"ligav","ligheanul":"lighean","ligheanule":"lighean","ligheanului":"lighean","lighenase":"lighenaș","lighenasele":"lighenaș","lighenaselor":"lighenaș","lighenasul":"lighenaș","lighenasule":"lighenaș","lighenasului":"lighenaș","lighene":"lighean","lighenele":"lighean","lighenelor":"lighean","lighioaiea":"lighioaie","lighioane":"lighioană","lighioanei":"lighioană","lighioanele":"lighioană","lighioanelor":"lighioană","lighioi":"lighioaie","lighioii":"lighioaie","lighioile":"lighioaie","lighioilor":"lighioaie","ligi":"ligă","ligii":"ligă","ligile":"ligă","ligilor":"ligă","lignicola":["lignicolă","lignicol","lignicola","lignicol"],"lignicole":"lignicol","lignicolele":"lignicol","lignicoli":"lignicol","lignicolii":"lignicol","lignicolul":"lignicol","ligniferi":"lignifer","ligniferii":"lignifer","ligniferilor":"lignifer","ligniferul":"lignifer","ligniferule":"lignifer","ligniferului":"lignifer","lignific":"lignifica","lignificai":"lignifica","lignificam":["lignificăm","lignifica","lignificam","lignifica"],"lignificand":"lignifica","lignificara":"lignifica","lignificaram":"lignifica","lignificarati":"lignifica","lignificarea":"lignificare","lignificari":"lignificare","lignificarii":"lignificare","lignificarile":"lignificare","lignificarilor":"lignificare","lignificase":"lignifica","lignificasem":"lignifica","lignificasera":"lignifica","lignificaseram":"lignifica","lignificaserati":"lignifica","lignificasesi":"lignifica","lignificasi":"lignifica","lignificat":"lignifica","lignificata":["lignificată","lignificat","lignificata","lignificat"],"lignificate":"lignificat","lignificatele":"lignificat","lignificati":["lignificați","lignifica","lignificați","lignificat"],"lignificatii":"lignificat","lignificatul":"lignificat","lignificau":"lignifica","lignifici":"lignifica","lignine":"lignină","ligninei":"lignină","ligninele":"lignină","ligninelor":"lignină","lignite":"lignit","lignitele":"lignit","lignitelor":"lignit","lignitul":"lignit","lignitule":"lignit","lignitului":"lignit","lignivora":["lignivoră","lignivor","lignivora","lignivor"],"lignivore":"lignivor","lignivorele":"lignivor","lignivori":"lignivor","lignivorii":"lignivor","lignivorul":"lignivor","lignoasa":["lignoasă","lignos","lignoasa","lignos"],"lignoase":"lignos","lignoasele":"lignos","lignoceluloze":"lignoceluloză","lignocelulozei":"lignoceluloză","lignocelulozele":"lignoceluloză","lignocelulozelor":"lignoceluloză","lignofoliuul":"lignofoliu","lignofoliuule":"lignofoliu","lignofoliuului":"lignofoliu","lignosi":"lignos","lignosii":"lignos","lignosul":"lignos","lignoze":"lignoză","lignozei":"lignoză","lignozele":"lignoză","lignozelor":"lignoză","ligote":"ligotă","ligotei":"ligotă","ligotele":"ligotă","ligotelor":"ligotă","ligroine":"ligroină","ligroinei":"ligroină","ligroinele":"ligroină","ligroinelor":"ligroină","ligulata":["ligulată","ligulat","ligulata","ligulat"],"ligulate":"ligulat","ligulatele":"ligulat","ligulati":"ligulat","ligulatii":"ligulat","ligulatul":"ligulat","ligule":"ligulă","ligulei":"ligulă","ligulele":"ligulă","ligulelor":"ligulă","ligure":"ligură","ligurei":"ligură","ligurele":"ligură","ligurelor":"ligură","liguri":"ligur","liguriana":["liguriană","ligurian","liguriana","ligurian"],"ligurianul":"ligurian","ligurica":["ligurică","liguric","ligurica","liguric"],"ligurice":"liguric","liguricele":"liguric","ligurici":"liguric","liguricii":"liguric","liguricul":"liguric","liguriene":"ligurian","ligurienele":"ligurian","ligurieni":"ligurian","ligurienii":"ligurian","ligurii":"ligur","ligurilor":"ligur","ligurul":"ligur","ligurule":"ligur","ligurului":"ligur","lihaia":"lihăi","lihaiai":"lihăi","lihaiam":"lihăi","lihaiati":"lihăi","lihaiau":"lihăi","lihaie":"lihăi","lihaii":"lihăi","lihaim":"lihăi","lihaind":"lihăi","lihaira":"lihăi","lihairam":"lihăi","lihairati":"lihăi","lihaise":"lihăi","lihaisem":"lihăi","lihaisera":"lihăi","lihaiseram":"lihăi","lihaiserati":"lihăi","lihaisesi":"lihăi","lihaisi":"lihăi","lihait":"lihăi","lihaiti":"lihăi","lihneli":"lihneală","lihnelii":"lihneală","lihnelile":"lihneală","lihnelilor":"lihneală","lihnita":["lihnită","lihnit","lihnita","lihnit"],"lihnite":"lihnit","lihnitele":"lihnit","lihniti":"lihnit","lihnitii":"lihnit","lihnitul":"lihnit","lihtdrucul":"lihtdruc","lihtdrucule":"lihtdruc","lihtdrucului":"lihtdruc","lihtdrucuri":"lihtdruc","lihtdrucurile":"lihtdruc","lihtdrucurilor":"lihtdruc","lilia":"lilie","liliaceea":"liliacee","liliaceei":"liliacee","liliaceele":"liliacee","liliaceelor":"liliacee","liliacei":"liliacel","liliaceii":"liliacel","liliaceilor":"liliacel","liliacelul":"liliacel","liliacelule":"liliacel","liliacelului":"liliacel","liliachia":"liliachiu","liliachie":"liliachiu","liliachii":"liliachiu","liliachiii":"liliachiu","liliachiile":"liliachiu","liliachiul":"liliachiu","liliacul":"liliac","liliacule":"liliac","liliacului":"liliac","lilialitatea":"lilialitate","lilialitati":"lilialitate","lilialitatii":"lilialitate","lilieci":"liliac","liliecii":"liliac","liliecilor":"liliac","liliecuti":"liliecuț","liliecutii":"liliecuț","liliecutilor":"liliecuț","liliecutul":"liliecuț","liliecutule":"liliecuț","liliecutului":"liliecuț","liliei":"lilie","lilii":["lilii","lilie","lilii","liliu"],"liliii":"liliu","liliile":"lilie","liliilor":["liliilor","lilie","liliilor","liliu"],"liliomi":"liliom","liliomii":"liliom","liliomilor":"liliom","liliomul":"liliom","liliomule":"liliom","liliomului":"liliom","liliputane":"liliputană","liliputanei":"liliputană","liliputanele":"liliputană","liliputanelor":"liliputană","liliputani":"liliputan","liliputanii":"liliputan","liliputanilor":"liliputan","liliputanul":"liliputan","liliputanule":"liliputan","liliputanului":"liliputan","liliputiana":["liliputiană","liliputian","liliputiana","liliputian"],"liliputianul":"liliputian","liliputiene":"liliputian","liliputienele":"liliputian","liliputieni":"liliputian","liliputienii":"liliputian","liliuul":"liliu","liliuule":"liliu","liliuului":"liliu","limacsi":"limax","limacsii":"limax","limacsilor":"limax","limanul":"liman","limanule":"liman","limanului":"liman","limanuri":"liman","limanurile":"liman","limanurilor":"liman","limaxul":"limax","limaxule":"limax","limaxului":"limax","limba mielului":"limba-mielului","limbagii":"limbagiu","limbagiile":"limbagiu","limbagiilor":"limbagiu","limbagiuul":"limbagiu","limbagiuule":"limbagiu","limbagiuului":"limbagiu","limbaje":"limbaj","limbaje de asamblare":"limbaj de asamblare","limbaje de calculator":"limbaj de calculator","limbaje de programare":"limbaj de programare","limbaje masina":"limbaj mașină","limbajele":"limbaj","limbajelor":"limbaj","limbajul":"limbaj","limbajule":"limbaj","limbajului":"limbaj","limbareata":["limbareață","limbareț","limbareața","limbareț"],"limbarete":"limbareț","limbaretele":"limbareț","limbareti":"limbareț","limbaretii":"limbareț","limbaretul":"limbareț","limbarite":"limbariță","limbaritei":"limbariță","limbaritele":"limbariță","limbaritelor":"limbariță","limbi":"limbă","limbi auxiliare":"limbă auxiliară","limbi de programare":"limbă de programare","limbi incarcate":"limbă încărcată","limbi literare":"limbă literară","limbi materne":"limbă maternă","limbi moarte":"limbă moartă","limbi moderne":"limbă modernă","limbi natale":"limbă natală","limbi native":"limbă nativă","limbi naturale":"limbă naturală","limbi standard":"limbă standard","limbi straine":"limbă străină","limbi sursa":"limbă sursă","limbi vii":"limbă vie","limbii":"limbă","limbile":"limbă","limbilor":"limbă","limbisti":"limbist","limbistice":"limbistică","limbisticei":"limbistică","limbite":"limbiță","limbitei":"limbiță","limbitele":"limbiță","limbitelor":"limbiță","limbotenia":"limbotenie","limboteniei":"limbotenie","limbotenii":"limbotenie","limboteniile":"limbotenie","limboteniilor":"limbotenie","limbricarite":"limbricariță","limbricaritei":"limbricariță","limbricaritele":"limbricariță","limbricaritelor":"limbricariță","limbricasi":"limbricaș","limbricasii":"limbricaș","limbricasilor":"limbricaș","limbricasul":"limbricaș","limbricasule":"limbricaș","limbricasului":"limbricaș","limbrici":"limbric","limbricii":"limbric","limbricilor":"limbric","limbricoasa":["limbricoasă","limbricos","limbricoasa","limbricos"],"limbricoase":"limbricos","limbricoasele":"limbricos","limbricosi":"limbricos","limbricosii":"limbricos","limbricosul":"limbricos","limbricul":"limbric","limbricule":"limbric","limbricului":"limbric","limbricuti":"limbricuț","limbricutii":"limbricuț","limbricutilor":"limbricuț","limbricutul":"limbricuț","limbricutule":"limbricuț","limbricutului":"limbricuț","limbulite":"limbuliță","limbulitei":"limbuliță","limbulitele":"limbuliță","limbulitelor":"limbuliță","limbusoare":"limbușoară","limbusoarei":"limbușoară","limbusoarele":"limbușoară","limbusoarelor":"limbușoară","limbuta":["limbută","limbut","limbuta","limbut"],"limbute":["limbute","limbut","limbute","limbută","limbuțe","limbuță"],"limbutea":"limbuți","limbuteai":"limbuți","limbuteam":"limbuți","limbuteati":"limbuți","limbuteau":"limbuți","limbutei":["limbutei","limbută","limbuței","limbuță"],"limbutele":["limbutele","limbut","limbutele","limbută","limbuțele","limbuță"],"limbutelor":["limbutelor","limbută","limbuțelor","limbuță"],"limbutesc":"limbuți","limbuteste":"limbuți","limbutesti":"limbuți","limbuti":"limbut","limbutia":"limbuție","limbutiei":"limbuție","limbutii":["limbuții","limbut","limbuții","limbuți","limbuții","limbuție"],"limbutiile":"limbuție","limbutiilor":"limbuție","limbutilor":"limbut","limbutim":"limbuți","limbutind":"limbuți","limbutira":"limbuți","limbutiram":"limbuți","limbutirati":"limbuți","limbutise":"limbuți","limbutisem":"limbuți","limbutisera":"limbuți","limbutiseram":"limbuți","limbutiserati":"limbuți","limbutisesi":"limbuți","limbutisi":"limbuți","limbutit":"limbuți","limbutiti":"limbuți","limbutul":"limbut","limbutule":"limbut","limbutului":"limbut","limesul":"limes","limesule":"limes","limesului":"limes","limete":"limetă","limetei":"limetă","limetele":"limetă","limetelor":"limetă","limfadenia":"limfadenie","limfadeniei":"limfadenie","limfadenii":"limfadenie","limfadeniile":"limfadenie","limfadeniilor":"limfadenie","limfadenite":"limfadenită","limfadenitei":"limfadenită","limfadenitele":"limfadenită","limfadenitelor":"limfadenită","limfadenoame":"limfadenom","limfadenoamele":"limfadenom","limfadenoamelor":"limfadenom","limfadenomul":"limfadenom","limfadenomule":"limfadenom","limfadenomului":"limfadenom","limfagogi":"limfagog","limfagogile":"limfagog","limfagogilor":"limfagog","limfagogul":"limfagog","limfagogule":"limfagog","limfagogului":"limfagog","limfangiectazia":"limfangiectazie","limfangiectaziei":"limfangiectazie","limfangiectazii":"limfangiectazie","limfangiectaziile":"limfangiectazie","limfangiectaziilor":"limfangiectazie","limfangioame":"limfangiom","limfangioamele":"limfangiom","limfangioamelor":"limfangiom","limfangiomul":"limfangiom","limfangiomule":"limfangiom","limfangiomului":"limfangiom","limfangioplastia":"limfangioplastie","limfangioplastiei":"limfangioplastie","limfangioplastii":"limfangioplastie","limfangioplastiile":"limfangioplastie","limfangioplastiilor":"limfangioplastie","limfangiosarcoame":"limfangiosarcom","limfangiosarcoamele":"limfangiosarcom","limfangiosarcoamelor":"limfangiosarcom","limfangiosarcomul":"limfangiosarcom","limfangiosarcomule":"limfangiosarcom","limfangiosarcomului":"limfangiosarcom","limfangite":"limfangită","limfangitei":"limfangită","limfangitele":"limfangită","limfangitelor":"limfangită","limfatica":["limfatică","limfatic","limfatica","limfatic"],"limfatice":"limfatic","limfaticele":"limfatic","limfatici":"limfatic","limfaticii":"limfatic","limfaticul":"limfatic","limfatisme":"limfatism","limfatismele":"limfatism","limfatismelor":"limfatism","limfatismul":"limfatism","limfatismule":"limfatism","limfatismului":"limfatism","limfe":"limfă","limfei":"limfă","limfele":"limfă","limfelor":"limfă","limfoame":"limfom","limfoamele":"limfom","limfoamelor":"limfom","limfoblaste":"limfoblast","limfoblastele":"limfoblast","limfoblastelor":"limfoblast","limfoblastoame":"limfoblastom","limfoblastoamele":"limfoblastom","limfoblastoamelor":"limfoblastom","limfoblastomul":"limfoblastom","limfoblastomule":"limfoblastom","limfoblastomului":"limfoblastom","limfoblastul":"limfoblast","limfoblastule":"limfoblast","limfoblastului":"limfoblast","limfocite":["limfocite","limfocit","limfocite","limfocită"],"limfocitei":"limfocită","limfocitele":["limfocitele","limfocit","limfocitele","limfocită"],"limfocitelor":["limfocitelor","limfocit","limfocitelor","limfocită"],"limfocitemia":"limfocitemie","limfocitemiei":"limfocitemie","limfocitemii":"limfocitemie","limfocitemiile":"limfocitemie","limfocitemiilor":"limfocitemie","limfocitoze":"limfocitoză","limfocitozei":"limfocitoză","limfocitozele":"limfocitoză","limfocitozelor":"limfocitoză","limfocitul":"limfocit","limfocitule":"limfocit","limfocitului":"limfocit","limfografia":"limfografie","limfografiei":"limfografie","limfografii":"limfografie","limfografiile":"limfografie","limfografiilor":"limfografie","limfogranulomatoze":"limfogranulomatoză","limfogranulomatozei":"limfogranulomatoză","limfogranulomatozele":"limfogranulomatoză","limfogranulomatozelor":"limfogranulomatoză","limfoida":["limfoidă","limfoid","limfoida","limfoid"],"limfoide":"limfoid","limfoidele":"limfoid","limfoidul":"limfoid","limfoizi":"limfoid","limfoizii":"limfoid","limfomatoze":"limfomatoză","limfomatozei":"limfomatoză","limfomatozele":"limfomatoză","limfomatozelor":"limfomatoză","limfomul":"limfom","limfomule":"limfom","limfomului":"limfom","limfopatia":"limfopatie","limfopatiei":"limfopatie","limfopatii":"limfopatie","limfopatiile":"limfopatie","limfopatiilor":"limfopatie","limfopenia":"limfopenie","limfopeniei":"limfopenie","limfopenii":"limfopenie","limfopeniile":"limfopenie","limfopeniilor":"limfopenie","limfopoieze":"limfopoieză","limfopoiezei":"limfopoieză","limfopoiezele":"limfopoieză","limfopoiezelor":"limfopoieză","limforagia":"limforagie","limforagiei":"limforagie","limforagii":"limforagie","limforagiile":"limforagie","limforagiilor":"limforagie","limforeea":"limforee","limforeei":"limforee","limfosarcoame":"limfosarcom","limfosarcoamele":"limfosarcom","limfosarcoamelor":"limfosarcom","limfosarcomul":"limfosarcom","limfosarcomule":"limfosarcom","limfosarcomului":"limfosarcom","limfotropa":["limfotropă","limfotrop","limfotropa","limfotrop"],"limfotrope":"limfotrop","limfotropele":"limfotrop","limfotropi":"limfotrop","limfotropii":"limfotrop","limfotropul":"limfotrop","limicola":["limicolă","limicol","limicola","limicol"],"limicole":"limicol","limicolele":"limicol","limicoli":"limicol","limicolii":"limicol","limicolul":"limicol","limieri":"limier","limierii":"limier","limierilor":"limier","limierul":"limier","limierule":"limier","limierului":"limier","liminala":["liminală","liminal","liminala","liminal"],"liminale":"liminal","liminalele":"liminal","liminali":"liminal","liminalii":"liminal","liminalul":"liminal","liminara":["liminară","liminar","liminara","liminar"],"liminare":"liminar","liminarele":"liminar","liminari":"liminar","liminarii":"liminar","liminarul":"liminar","limitabila":["limitabilă","limitabil","limitabila","limitabil"],"limitabile":"limitabil","limitabilele":"limitabil","limitabili":"limitabil","limitabilii":"limitabil","limitabilul":"limitabil","limitai":"limita","limitam":["limităm","limita","limitam","limita"],"limitand":"limita","limitara":"limita","limitaram":"limita","limitarati":"limita","limitarea":"limitare","limitari":"limitare","limitarii":"limitare","limitarile":"limitare","limitarilor":"limitare","limitase":"limita","limitasem":"limita","limitasera":"limita","limitaseram":"limita","limitaserati":"limita","limitasesi":"limita","limitasi":"limita","limitat":"limita","limitata":["limitată","limitat","limitata","limitat"],"limitate":"limitat","limitatele":"limitat","limitati":["limitați","limita","limitați","limitat"],"limitatii":"limitat","limitativa":["limitativă","limitativ","limitativa","limitativ"],"limitative":"limitativ","limitativele":"limitativ","limitativi":"limitativ","limitativii":"limitativ","limitativul":"limitativ","limitatoare":"limitator","limitatore":"limitator","limitatorele":"limitator","limitatorelor":"limitator","limitatorul":"limitator","limitatorule":"limitator","limitatorului":"limitator","limitatul":"limitat","limitau":"limita","limite":"limită","limite de timp":"limită de timp","limite de varsta":"limită de vârstă","limite de viteza":"limită de viteză","limiteaza":"limita","limitei":"limită","limitele":"limită","limitelor":"limită","limitez":"limita","limitezi":"limita","limitoare":"limitor","limitoarele":"limitor","limitoarelor":"limitor","limitorul":"limitor","limitorule":"limitor","limitorului":"limitor","limitrofa":["limitrofă","limitrof","limitrofa","limitrof"],"limitrofe":"limitrof","limitrofele":"limitrof","limitrofi":"limitrof","limitrofii":"limitrof","limitroful":"limitrof","limnigrafe":"limnigraf","limnigrafele":"limnigraf","limnigrafelor":"limnigraf","limnigraful":"limnigraf","limnigrafule":"limnigraf","limnigrafului":"limnigraf","limnimetre":"limnimetru","limnimetrele":"limnimetru","limnimetrelor":"limnimetru","limnimetria":"limnimetrie","limnimetrica":["limnimetrică","limnimetric","limnimetrica","limnimetric"],"limnimetrice":"limnimetric","limnimetricele":"limnimetric","limnimetrici":"limnimetric","limnimetricii":"limnimetric","limnimetricul":"limnimetric","limnimetriei":"limnimetrie","limnimetrii":"limnimetrie","limnimetrul":"limnimetru","limnimetrule":"limnimetru","limnimetrului":"limnimetru","limnobiologia":"limnobiologie","limnobiologiei":"limnobiologie","limnobiologii":"limnobiologie","limnologe":"limnologă","limnologei":"limnologă","limnologele":"limnologă","limnologelor":"limnologă","limnologi":"limnolog","limnologia":"limnologie","limnologiei":"limnologie","limnologii":["limnologii","limnolog","limnologii","limnologie"],"limnologilor":"limnolog","limnologul":"limnolog","limnologule":"limnolog","limnologului":"limnolog","limonade":"limonadă","limonadei":"limonadă","limonadele":"limonadă","limonadelor":"limonadă","limonagii":"limonagiu","limonagiii":"limonagiu","limonagiilor":"limonagiu","limonagiul":"limonagiu","limonagiule":"limonagiu","limonagiului":"limonagiu","limonate":"limonată","limonatei":"limonată","limonatele":"limonată","limonatelor":"limonată","limonia":"limoniu","limonie":"limoniu","limonii":"limoniu","limoniii":"limoniu","limoniile":"limoniu","limonite":"limonit","limonitele":"limonit","limonitelor":"limonit","limonitul":"limonit","limonitule":"limonit","limonitului":"limonit","limoniul":"limoniu","limoterapia":"limoterapie","limoterapiei":"limoterapie","limoterapii":"limoterapie","limoterapiile":"limoterapie","limoterapiilor":"limoterapie","limpedea":"limpede","limpedele":"limpede","limpejoara":["limpejoară","limpejor","limpejoara","limpejor"],"limpejoare":"limpejor","limpejoarele":"limpejor","limpejori":"limpejor","limpejorii":"limpejor","limpejorul":"limpejor","limpezea":"limpezi","limpezeai":"limpezi","limpezeam":"limpezi","limpezeati":"limpezi","limpezeau":"limpezi","limpezeli":"limpezeală","limpezelii":"limpezeală","limpezelile":"limpezeală","limpezelilor":"limpezeală","limpezesc":"limpezi","limpezeste":"limpezi","limpezesti":"limpezi","limpezi":"limpede","limpezia":"limpezie","limpeziciunea":"limpeziciune","limpeziciuni":"limpeziciune","limpeziciunii":"limpeziciune","limpeziei":"limpezie","limpezii":["limpezii","limpede","limpezii","limpezi","limpezii","limpezie"],"limpeziile":"limpezie","limpeziilor":"limpezie","limpezile":"limpede","limpezim":"limpezi","limpezimea":"limpezime","limpezimi":"limpezime","limpezimii":"limpezime","limpezimile":"limpezime","limpezimilor":"limpezime","limpezind":"limpezi","limpezira":"limpezi","limpeziram":"limpezi","limpezirati":"limpezi","limpezirea":"limpezire","limpeziri":"limpezire","limpezirii":"limpezire","limpezirile":"limpezire","limpezirilor":"limpezire","limpezise":"limpezi","limpezisem":"limpezi","limpezisera":"limpezi","limpeziseram":"limpezi","limpeziserati":"limpezi","limpezisesi":"limpezi","limpezisi":"limpezi","limpezisul":"limpeziș","limpezisule":"limpeziș","limpezisului":"limpeziș","limpezisuri":"limpeziș","limpezisurile":"limpeziș","limpezisurilor":"limpeziș","limpezit":"limpezi","limpezita":["limpezită","limpezit","limpezita","limpezit"],"limpezite":"limpezit","limpezitele":"limpezit","limpeziti":["limpeziți","limpezi","limpeziți","limpezit"],"limpezitii":"limpezit","limpezitoare":"limpezitor","limpezitoarea":"limpezitor","limpezitoarele":"limpezitor","limpezitori":"limpezitor","limpezitorii":"limpezitor","limpezitorul":"limpezitor","limpezitul":"limpezit","limpezituri":"limpezitură","limpeziturii":"limpezitură","limpeziturile":"limpezitură","limpeziturilor":"limpezitură","limpida":["limpidă","limpid","limpida","limpid"],"limpide":"limpid","limpidele":"limpid","limpiditatea":"limpiditate","limpiditati":"limpiditate","limpiditatii":"limpiditate","limpiditatile":"limpiditate","limpiditatilor":"limpiditate","limpidul":"limpid","limpizi":"limpid","limpizii":"limpid","limuli":"limul","limulii":"limul","limulilor":"limul","limulul":"limul","limulule":"limul","limulului":"limul","limuzine":"limuzină","limuzinei":"limuzină","limuzinele":"limuzină","limuzinelor":"limuzină","lina":["lină","lin","lina","lin"],"linarite":["linarițe","linariță","linărițe","linăriță"],"linaritei":["linariței","linariță","linăriței","linăriță"],"linaritele":["linarițele","linariță","linărițele","linăriță"],"linaritelor":["linarițelor","linariță","linărițelor","linăriță"],"linciurea":"linciuri","linciureai":"linciuri","linciuream":"linciuri","linciureati":"linciuri","linciureau":"linciuri","linciurele":"linciureală","linciurelei":"linciureală","linciurelele":"linciureală","linciurelelor":"linciureală","linciureli":"linciureală","linciuresc":"linciuri","linciureste":"linciuri","linciuresti":"linciuri","linciurii":"linciuri","linciurim":"linciuri","linciurind":"linciuri","linciurira":"linciuri","linciuriram":"linciuri","linciurirati":"linciuri","linciuriri":"linciurire","linciuririi":"linciurire","linciurise":"linciuri","linciurisem":"linciuri","linciurisera":"linciuri","linciuriseram":"linciuri","linciuriserati":"linciuri","linciurisesi":"linciuri","linciurisi":"linciuri","linciurit":"linciuri","linciuriti":"linciuri","lincsi":"linx","lincsii":"linx","lincsilor":"linx","lindena":"lindină","lindene":"lindenă","lindenei":"lindenă","lindenele":"lindenă","lindenelor":"lindenă","lindicul":"lindic","lindicule":"lindic","lindicului":"lindic","lindicuri":"lindic","lindicurile":"lindic","lindicurilor":"lindic","lindineaul":"lindinea","lindineaule":"lindinea","lindineaului":"lindinea","lindinele":"lindinea","lindinelele":"lindinea","lindinelelor":"lindinea","lindini":"lindină","lindinii":"lindină","lindinile":"lindină","lindinilor":"lindină","lindinoasa":["lindinoasă","lindinos","lindinoasa","lindinos"],"lindinoase":"lindinos","lindinoasele":"lindinos","lindinosi":"lindinos","lindinosii":"lindinos","lindinosul":"lindinos","lindinutaul":"lindinuță","lindinutaule":"lindinuță","lindinutaului":"lindinuță","lindinute":"lindinuță","lindinutele":"lindinuță","lindinutelor":"lindinuță","line":"lin","linear":"liniar","lineara":["lineară","linear","lineara","linear"],"lineare":"linear","linearele":"linear","lineari":"linear","linearii":"linear","linearul":"linear","linele":"lin","ling":"linge","linga":"linge","lingai":"lingău","lingaii":"lingău","lingailor":"lingău","lingand":"linge","lingarea":"lingări","lingareai":"lingări","lingaream":"lingări","lingareati":"lingări","lingareau":"lingări","lingareli":"lingăreală","lingarelii":"lingăreală","lingarelile":"lingăreală","lingarelilor":"lingăreală","lingaresc":"lingări","lingareste":"lingări","lingaresti":"lingări","lingarii":"lingări","lingarim":"lingări","lingarind":"lingări","lingarira":"lingări","lingariram":"lingări","lingarirati":"lingări","lingarirea":"lingărire","lingariri":"lingărire","lingaririi":"lingărire","lingaririle":"lingărire","lingaririlor":"lingărire","lingarise":"lingări","lingarisem":"lingări","lingarisera":"lingări","lingariseram":"lingări","lingariserati":"lingări","lingarisesi":"lingări","lingarisi":"lingări","lingarit":"lingări","lingarita":["lingărită","lingărit","lingărita","lingărit"],"lingarite":"lingărit","lingaritele":"lingărit","lingariti":["lingăriți","lingări","lingăriți","lingărit"],"lingaritii":"lingărit","lingaritul":"lingărit","lingarituri":"lingăritură","lingariturii":"lingăritură","lingariturile":"lingăritură","lingariturilor":"lingăritură","lingaroasa":["lingăroasă","lingăros","lingăroasa","lingăros"],"lingaroase":"lingăros","lingaroasele":"lingăros","lingarosi":"lingăros","lingarosii":"lingăros","lingarosul":"lingăros","lingaul":"lingău","lingaule":"lingău","lingaului":"lingău","lingea":"linge","lingeai":"linge","lingeam":"linge","lingeati":"linge","lingeau":"linge","lingem":"linge","lingeria":"lingerie","lingeriei":"lingerie","lingerii":"lingerie","lingeriile":"lingerie","lingeriilor":"lingerie","lingeti":"linge","lingi":"linge","lingori":"lingoare","lingotiere":"lingotieră","lingotierei":"lingotieră","lingotierele":"lingotieră","lingotierelor":"lingotieră","lingoul":"lingou","lingoului":"lingou","lingouri":"lingou","lingourile":"lingou","lingourilor":"lingou","linguala":["linguală","lingual","linguala","lingual"],"linguale":["linguale","lingual","linguale","linguală"],"lingualei":"linguală","lingualele":["lingualele","lingual","lingualele","linguală"],"lingualelor":"linguală","linguali":"lingual","lingualii":"lingual","lingualul":"lingual","linguist":"lingvist","linguista":"lingvistă","linguiste":"linguistă","linguisti":"linguist","linguistica":["linguistică","linguistic","linguistica","linguistic"],"linguistice":"linguistic","linguisticele":"linguistic","linguistici":"linguistic","linguisticii":"linguistic","linguisticul":"linguistic","linguistii":"linguist","linguistilor":"linguist","linguistul":"linguist","linguistule":"linguist","linguistului":"linguist","lingurarese":"lingurăreasă","linguraresei":"lingurăreasă","linguraresele":"lingurăreasă","lingurareselor":"lingurăreasă","lingurari":"lingurar","linguraria":"lingurărie","lingurariei":"lingurărie","lingurarii":"lingurărie","lingurariile":"lingurărie","lingurariilor":"lingurărie","lingurarile":"lingurar","lingurarilor":"lingurar","lingurarite":"lingurăriță","linguraritei":"lingurăriță","linguraritele":"lingurăriță","linguraritelor":"lingurăriță","lingurarul":"lingurar","lingurarule":"lingurar","lingurarului":"lingurar","lingureaua":"lingurea","lingurele":"lingurea","lingurelei":"lingurea","lingurelele":"lingurea","lingurelelor":"lingurea","linguri":"lingură","lingurici":"lingurică","linguricii":"lingurică","linguricile":"lingurică","linguricilor":"lingurică","lingurii":"lingură","lingurile":"lingură","lingurilor":"lingură","lingurite":"linguriță","linguritei":"linguriță","linguritele":"linguriță","linguritelor":"linguriță","linguroaie":"linguroi","linguroiul":"linguroi","linguroiule":"linguroi","linguroiului":"linguroi","lingurute":"linguruță","lingurutei":"linguruță","lingurutele":"linguruță","lingurutelor":"linguruță","lingusea":"linguși","linguseai":"linguși","linguseam":"linguși","linguseati":"linguși","linguseau":"linguși","linguseli":"lingușeală","linguselii":"lingușeală","linguselile":"lingușeală","linguselilor":"lingușeală","lingusesc":"linguși","linguseste":"linguși","lingusesti":"linguși","lingusia":"lingușie","lingusiei":"lingușie","lingusii":["lingușii","linguși","lingușii","lingușie"],"lingusiile":"lingușie","lingusiilor":"lingușie","lingusim":"linguși","lingusind":"linguși","lingusira":"linguși","lingusiram":"linguși","lingusirati":"linguși","lingusirea":"lingușire","lingusiri":"lingușire","lingusirii":"lingușire","lingusirile":"lingușire","lingusirilor":"lingușire","lingusise":"linguși","lingusisem":"linguși","lingusisera":"linguși","lingusiseram":"linguși","lingusiserati":"linguși","lingusisesi":"linguși","lingusisi":"linguși","lingusit":"linguși","lingusita":["lingușită","lingușit","lingușita","lingușit"],"lingusite":"lingușit","lingusitele":"lingușit","lingusiti":["lingușiți","linguși","lingușiți","lingușit"],"lingusitii":"lingușit","lingusitoare":"lingușitor","lingusitoarea":["lingușitoarea","lingușitoare","lingușitoarea","lingușitor"],"lingusitoarei":"lingușitoare","lingusitoarele":["lingușitoarele","lingușitoare","lingușitoarele","lingușitor"],"lingusitoarelor":"lingușitoare","lingusitori":"lingușitor","lingusitoria":"lingușitorie","lingusitoriei":"lingușitorie","lingusitorii":["lingușitorii","lingușitor","lingușitorii","lingușitorie"],"lingusitoriile":"lingușitorie","lingusitoriilor":"lingușitorie","lingusitorilor":"lingușitor","lingusitorul":"lingușitor","lingusitorule":"lingușitor","lingusitorului":"lingușitor","lingusitul":"lingușit","lingusiture":"lingușitură","lingusiturei":"lingușitură","lingusiturele":"lingușitură","lingusiturelor":"lingușitură","lingusituri":"lingușitură","lingviforma":["lingviformă","lingviform","lingviforma","lingviform"],"lingviforme":"lingviform","lingviformele":"lingviform","lingviformi":"lingviform","lingviformii":"lingviform","lingviformul":"lingviform","lingviste":"lingvistă","lingvistei":"lingvistă","lingvistele":"lingvistă","lingvistelor":"lingvistă","lingvisti":["lingviști","limbist","lingviști","lingvist"],"lingvistica":["lingvistică","lingvistic","lingvistica","lingvistic"],"lingvistice":"lingvistic","lingvisticele":"lingvistic","lingvistici":["lingvistici","lingvistic","lingvistici","lingvistică"],"lingvisticii":["lingvisticii","lingvistic","lingvisticii","lingvistică"],"lingvisticile":"lingvistică","lingvisticilor":"lingvistică","lingvisticul":"lingvistic","lingvistii":["lingviștii","limbist","lingviștii","lingvist"],"lingvistilor":["lingviștilor","limbist","lingviștilor","lingvist"],"lingvistul":["lingvistul","limbist","lingvistul","lingvist"],"lingvistule":["lingvistule","limbist","lingvistule","lingvist"],"lingvistului":["lingvistului","limbist","lingvistului","lingvist"],"lini":"lin","linia":"linie","liniai":"linia","liniam":"linia","liniamente":"liniament","liniamentele":"liniament","liniamentelor":"liniament","liniamentul":"liniament","liniamentule":"liniament","liniamentului":"liniament","liniara":["liniară","linia","liniară","liniar","liniara","liniar"],"liniaram":"linia","liniarati":"linia","liniare":"liniar","liniarele":"liniar","liniari":"liniar","liniarii":"liniar","liniaritatea":"liniaritate","liniaritati":"liniaritate","liniaritatii":"liniaritate","liniaritatile":"liniaritate","liniaritatilor":"liniaritate","liniarul":"liniar","liniase":"linia","liniasem":"linia","liniasera":"linia","liniaseram":"linia","liniaserati":"linia","liniasesi":"linia","liniasi":"linia","liniat":"linia","liniata":["liniată","liniat","liniata","liniat"],"liniate":"liniat","liniatele":"liniat","liniati":["liniați","linia","liniați","liniat"],"liniatii":"liniat","liniatul":"liniat","liniaturi":"liniatură","liniaturii":"liniatură","liniaturile":"liniatură","liniaturilor":"liniatură","liniau":"linia","liniaza":"linia","linicela":["linicelă","linicel","linicela","linicel"],"linicele":"linicel","linicelele":"linicel","liniceli":"linicel","linicelii":"linicel","linicelul":"linicel","linie":"linia","liniei":"linie","liniem":"linia","linierea":"liniere","linieri":"liniere","linierii":"liniere","linierile":"liniere","linierilor":"liniere","linierul":"linier","linierule":"linier","linierului":"linier","liniez":"linia","liniezi":"linia","linii":["linii","lin","linii","linie"],"linii aeriene":"linie aeriană","linii de asamblare":"linie de asamblare","linii de comanda":"linie de comandă","linii de credit":"linie de credit","linii de demarcatie":"linie de demarcație","linii de fractie":"linie de fracție","linii de poarta":"linie de poartă","linii de succesiune":"linie de succesiune","linii de telefon":"linie de telefon","linii directoare":"linie directoare","linii drepte":"linie dreaptă","linii electrice":"linie electrică","linii ferate":"linie ferată","linii oblice":"linie oblică","linii oblice inverse":"linie oblică inversă","linii telefonice":"linie telefonică","linii telegrafice":"linie telegrafică","liniile":"linie","liniilor":"linie","liniind":"linia","linilor":"lin","linimente":"liniment","linimentele":"liniment","linimentelor":"liniment","linimentul":"liniment","linimentule":"liniment","linimentului":"liniment","linioare":"linioară","linioarei":"linioară","linioarele":"linioară","linioarelor":"linioară","linisoara":["linișoară","linișor","linișoara","linișor"],"linisoare":"linișor","linisoarele":"linișor","linisori":"linișor","linisorii":"linișor","linisorul":"linișor","linistea":["liniștea","liniște","liniștea","liniști"],"linisteai":"liniști","linisteam":"liniști","linisteati":"liniști","linisteau":"liniști","linistesc":"liniști","linisteste":"liniști","linistesti":"liniști","linisti":"liniște","linistii":["liniștii","liniște","liniștii","liniști"],"linistim":"liniști","linistind":"liniști","linistira":"liniști","linistiram":"liniști","linistirati":"liniști","linistirea":"liniștire","linistiri":"liniștire","linistirii":"liniștire","linistirile":"liniștire","linistirilor":"liniștire","linistise":"liniști","linistisem":"liniști","linistisera":"liniști","linistiseram":"liniști","linistiserati":"liniști","linistisesi":"liniști","linistisi":"liniști","linistit":"liniști","linistita":["liniștită","liniștit","liniștita","liniștit"],"linistite":"liniștit","linistitele":"liniștit","linistiti":["liniștiți","liniști","liniștiți","liniștit"],"linistitii":"liniștit","linistitoare":"liniștitor","linistitoarea":"liniștitor","linistitoarele":"liniștitor","linistitori":"liniștitor","linistitorii":"liniștitor","linistitorul":"liniștitor","linistitul":"liniștit","linistoasa":["liniștoasă","liniștos","liniștoasa","liniștos"],"linistoase":"liniștos","linistoasele":"liniștos","linistosi":"liniștos","linistosii":"liniștos","linistosul":"liniștos","liniute":"liniuță","liniutei":"liniuță","liniutele":"liniuță","liniutelor":"liniuță","linjerite":"linjeriță","linjeritei":"linjeriță","linjeritele":"linjeriță","linjeritelor":"linjeriță","linkul":"link","linkule":"link","linkului":"link","linkuri":"link","linkurile":"link","linkurilor":"link","linografe":"linograf","linografele":"linograf","linografelor":"linograf","linograful":"linograf","linografule":"linograf","linografului":"linograf","linogravuri":"linogravură","linogravurii":"linogravură","linogravurile":"linogravură","linogravurilor":"linogravură","linoleati":"linoleat","linoleatile":"linoleat","linoleatilor":"linoleat","linoleatul":"linoleat","linoleatule":"linoleat","linoleatului":"linoleat","linoleumul":"linoleum","linoleumule":"linoleum","linoleumului":"linoleum"};
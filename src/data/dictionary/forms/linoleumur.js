@@ -0,0 +1 @@
+export default {"linoleumuri":"linoleum","linoleumurile":"linoleum","linoleumurilor":"linoleum","linonul":"linon","linonule":"linon","linonului":"linon","linonuri":"linon","linonurile":"linon","linonurilor":"linon","linotipia":"linotipie","linotipiei":"linotipie","linotipii":"linotipie","linotipiile":"linotipie","linotipiilor":"linotipie","linotipiste":"linotipistă","linotipistei":"linotipistă","linotipistele":"linotipistă","linotipistelor":"linotipistă","linotipisti":"linotipist","linotipistii":"linotipist","linotipistilor":"linotipist","linotipistul":"linotipist","linotipistule":"linotipist","linotipistului":"linotipist","linotipul":"linotip","linotipule":"linotip","linotipului":"linotip","linotipuri":"linotip","linotipurile":"linotip","linotipurilor":"linotip","linoul":["linoul","lino","linoul","linou"],"linoule":["linoule","lino","linoule","linou"],"linoului":["linoului","lino","linoului","linou"],"linouri":["linouri","lino","linouri","linou"],"linourile":["linourile","lino","linourile","linou"],"linourilor":["linourilor","lino","linourilor","linou"],"lins":"linge","linsa":["linsă","lins","linsa","lins"],"linsai":"linșa","linsaje":"linșaj","linsajele":"linșaj","linsajelor":"linșaj","linsajul":"linșaj","linsajule":"linșaj","linsajului":"linșaj","linsam":["linșăm","linșa","linșam","linșa"],"linsand":"linșa","linsara":"linșa","linsaram":"linșa","linsarati":"linșa","linsarea":"linșare","linsari":"linșare","linsarii":"linșare","linsarile":"linșare","linsarilor":"linșare","linsase":"linșa","linsasem":"linșa","linsasera":"linșa","linsaseram":"linșa","linsaserati":"linșa","linsasesi":"linșa","linsasi":"linșa","linsat":"linșa","linsati":"linșa","linsau":"linșa","linse":["linse","linge","linse","lins"],"linseaza":"linșa","linsei":"linge","linsele":"lins","linsera":"linge","linseram":"linge","linserati":"linge","linsese":"linge","linsesem":"linge","linsesera":"linge","linseseram":"linge","linseserati":"linge","linsesesi":"linge","linsesi":"linge","linsez":"linșa","linsezi":"linșa","linsi":"lins","linsii":"lins","linsul":"lins","linteciunea":"linteciune","linteciuni":"linteciune","linteciunii":"linteciune","linteciunile":"linteciune","linteciunilor":"linteciune","linti":"linte","lintisoarae":"lintișoară","lintisoaraei":"lintișoară","lintisoaraele":"lintișoară","lintisoaraelor":"lintișoară","lintite":"lintiță","lintitei":"lintiță","lintitele":"lintiță","lintitelor":"lintiță","lintolii":"lințoliu","lintoliile":"lințoliu","lintoliilor":"lințoliu","lintoliul":"lințoliu","lintoliule":"lințoliu","lintoliului":"lințoliu","lintoul":"lintou","lintoule":"lintou","lintoului":"lintou","lintouri":"lintou","lintourile":"lintou","lintourilor":"lintou","lintusce":"lințușcă","lintuscei":"lințușcă","linul":"lin","linule":"lin","linului":"lin","linxul":"linx","linxule":"linx","linxului":"linx","liofila":["liofilă","liofil","liofila","liofil"],"liofile":"liofil","liofilele":"liofil","liofili":"liofil","liofilia":"liofilie","liofiliei":"liofilie","liofilii":["liofilii","liofil","liofilii","liofilie"],"liofiliile":"liofilie","liofiliilor":"liofilie","liofilizai":"liofiliza","liofilizam":["liofilizăm","liofiliza","liofilizam","liofiliza"],"liofilizand":"liofiliza","liofilizara":"liofiliza","liofilizaram":"liofiliza","liofilizarati":"liofiliza","liofilizarea":"liofilizare","liofilizari":"liofilizare","liofilizarii":"liofilizare","liofilizarile":"liofilizare","liofilizarilor":"liofilizare","liofilizase":"liofiliza","liofilizasem":"liofiliza","liofilizasera":"liofiliza","liofilizaseram":"liofiliza","liofilizaserati":"liofiliza","liofilizasesi":"liofiliza","liofilizasi":"liofiliza","liofilizat":"liofiliza","liofilizati":"liofiliza","liofilizatoare":"liofilizator","liofilizatoarele":"liofilizator","liofilizatoarelor":"liofilizator","liofilizatorul":"liofilizator","liofilizatorule":"liofilizator","liofilizatorului":"liofilizator","liofilizau":"liofiliza","liofilizeaza":"liofiliza","liofilizez":"liofiliza","liofilizezi":"liofiliza","liofilul":"liofil","liofoba":["liofobă","liofob","liofoba","liofob"],"liofobe":"liofob","liofobele":"liofob","liofobi":"liofob","liofobii":"liofob","liofobul":"liofob","lione":"lionă","lionei":"lionă","lionele":"lionă","lionelor":"lionă","lior":"lăor","liorul":"lior","liorule":"lior","liorului":"lior","liorusce":"lioruscă","lioruscei":"lioruscă","liosce":"lioșcă","lioscei":"lioșcă","lioveana":["lioveană","liovean","lioveana","liovean"],"lioveanul":"liovean","liovene":"liovean","liovenele":"liovean","lioveni":"liovean","liovenii":"liovean","liovenilor":"liovean","lipanasi":"lipănaș","lipanasii":"lipănaș","lipanasilor":"lipănaș","lipanasul":"lipănaș","lipanasule":"lipănaș","lipanasului":"lipănaș","lipani":"lipan","lipanii":"lipan","lipanilor":"lipan","lipanul":"lipan","lipanule":"lipan","lipanului":"lipan","liparite":"liparit","liparitele":"liparit","liparitelor":"liparit","liparitul":"liparit","liparitule":"liparit","liparitului":"liparit","lipaze":"lipază","lipazei":"lipază","lipazele":"lipază","lipazelor":"lipază","lipcani":"lipcan","lipcanii":"lipcan","lipcanilor":"lipcan","lipcaniul":"Lipcani","lipcaniule":"Lipcani","lipcaniului":"Lipcani","lipcanul":"lipcan","lipcanule":"lipcan","lipcanului":"lipcan","lipea":"lipi","lipeai":"lipi","lipeam":"lipi","lipeati":"lipi","lipeau":"lipi","lipele":"lipeală","lipelei":"lipeală","lipelele":"lipeală","lipelelor":"lipeală","lipeli":"lipeală","lipemia":"lipemie","lipemiei":"lipemie","lipemii":"lipemie","lipemiile":"lipemie","lipemiilor":"lipemie","lipesc":"lipi","lipeste":"lipi","lipesti":"lipi","lipia":"lipie","lipicioasa":["lipicioasă","lipicios","lipicioasa","lipicios"],"lipicioase":"lipicios","lipicioasele":"lipicios","lipiciosi":"lipicios","lipiciosia":"lipicioșie","lipiciosiei":"lipicioșie","lipiciosii":["lipicioșii","lipicios","lipicioșii","lipicioșie"],"lipiciosiile":"lipicioșie","lipiciosiilor":"lipicioșie","lipiciosul":"lipicios","lipiciozitatea":"lipiciozitate","lipiciozitati":"lipiciozitate","lipiciozitatii":"lipiciozitate","lipiciozitatile":"lipiciozitate","lipiciozitatilor":"lipiciozitate","lipiciul":"lipici","lipiciule":"lipici","lipiciului":"lipici","lipiciunea":"lipiciune","lipiciuni":"lipiciune","lipiciunii":"lipiciune","lipiciunile":"lipiciune","lipiciunilor":"lipiciune","lipiciuri":"lipici","lipiciurile":"lipici","lipiciurilor":"lipici","lipide":"lipidă","lipidei":"lipidă","lipidele":"lipidă","lipidelor":"lipidă","lipidemia":"lipidemie","lipidemiei":"lipidemie","lipidemii":"lipidemie","lipidemiile":"lipidemie","lipidemiilor":"lipidemie","lipiei":"lipie","lipii":["lipii","lipi","lipii","lipie"],"lipiile":"lipie","lipiilor":"lipie","lipim":"lipi","lipind":"lipi","lipioare":"lipioară","lipioarei":"lipioară","lipioarele":"lipioară","lipioarelor":"lipioară","lipira":"lipi","lipiram":"lipi","lipirati":"lipi","lipirea":"lipire","lipiri":"lipire","lipirii":"lipire","lipirile":"lipire","lipirilor":"lipire","lipise":"lipi","lipisem":"lipi","lipisera":"lipi","lipiseram":"lipi","lipiserati":"lipi","lipisesi":"lipi","lipisi":"lipi","lipistoace":"lipiștoacă","lipistoacei":"lipiștoacă","lipistoacele":"lipiștoacă","lipistoacelor":"lipiștoacă","lipit":"lipi","lipita":["lipită","lipit","lipita","lipit"],"lipitani":"lipițan","lipitanii":"lipițan","lipitanilor":"lipițan","lipitanul":"lipițan","lipitanule":"lipițan","lipitanului":"lipițan","lipite":"lipit","lipitele":"lipit","lipiti":["lipiți","lipi","lipiți","lipit"],"lipitii":"lipit","lipitoarea":"lipitoare","lipitori":["lipitori","lipitoare","lipitori","lipitor"],"lipitorii":["lipitorii","lipitoare","lipitorii","lipitor"],"lipitorile":"lipitoare","lipitorilor":["lipitorilor","lipitoare","lipitorilor","lipitor"],"lipitorul":"lipitor","lipitorule":"lipitor","lipitorului":"lipitor","lipitul":"lipit","lipitule":"lipit","lipitului":"lipit","lipituri":"lipitură","lipiturii":"lipitură","lipiturile":"lipitură","lipiturilor":"lipitură","lipiute":"lipiuță","lipiutei":"lipiuță","lipiutele":"lipiuță","lipiutelor":"lipiuță","lipoblaste":"lipoblast","lipoblastele":"lipoblast","lipoblastelor":"lipoblast","lipoblastul":"lipoblast","lipoblastule":"lipoblast","lipoblastului":"lipoblast","lipocromi":"lipocrom","lipocromii":"lipocrom","lipocromilor":"lipocrom","lipocromul":"lipocrom","lipocromule":"lipocrom","lipocromului":"lipocrom","lipodistrofia":"lipodistrofie","lipodistrofiei":"lipodistrofie","lipodistrofii":"lipodistrofie","lipodistrofiile":"lipodistrofie","lipodistrofiilor":"lipodistrofie","lipofibroame":"lipofibrom","lipofibroamele":"lipofibrom","lipofibroamelor":"lipofibrom","lipofibromul":"lipofibrom","lipofibromule":"lipofibrom","lipofibromului":"lipofibrom","lipoida":["lipoidă","lipoid","lipoida","lipoid"],"lipoide":["lipoide","lipoid","lipoide","lipoidă"],"lipoidei":"lipoidă","lipoidele":["lipoidele","lipoid","lipoidele","lipoidă"],"lipoidelor":"lipoidă","lipoidoze":"lipoidoză","lipoidozei":"lipoidoză","lipoidozele":"lipoidoză","lipoidozelor":"lipoidoză","lipoidul":"lipoid","lipoizi":"lipoid","lipoizii":"lipoid","lipolize":"lipoliză","lipolizei":"lipoliză","lipolizele":"lipoliză","lipolizelor":"lipoliză","lipomatoze":"lipomatoză","lipomatozei":"lipomatoză","lipomatozele":"lipomatoză","lipomatozelor":"lipomatoză","lipomul":"lipom","lipomule":"lipom","lipomului":"lipom","lipomuri":"lipom","lipomurile":"lipom","lipomurilor":"lipom","lipoproteine":"lipoproteină","lipoproteinei":"lipoproteină","lipoproteinele":"lipoproteină","lipoproteinelor":"lipoproteină","liposarcomul":"liposarcom","liposarcomule":"liposarcom","liposarcomului":"liposarcom","liposarcomuri":"liposarcom","liposarcomurile":"liposarcom","liposarcomurilor":"liposarcom","liposcleroze":"liposcleroză","liposclerozei":"liposcleroză","liposclerozele":"liposcleroză","liposclerozelor":"liposcleroză","liposolubila":["liposolubilă","liposolubil","liposolubila","liposolubil"],"liposolubile":"liposolubil","liposolubilele":"liposolubil","liposolubili":"liposolubil","liposolubilii":"liposolubil","liposolubilul":"liposolubil","lipotimia":"lipotimie","lipotimiei":"lipotimie","lipotimii":"lipotimie","lipotimiile":"lipotimie","lipotimiilor":"lipotimie","lipotropa":["lipotropă","lipotrop","lipotropa","lipotrop"],"lipotrope":"lipotrop","lipotropele":"lipotrop","lipotropi":"lipotrop","lipotropia":"lipotropie","lipotropiei":"lipotropie","lipotropii":["lipotropii","lipotrop","lipotropii","lipotropie"],"lipotropiile":"lipotropie","lipotropiilor":"lipotropie","lipotropul":"lipotrop","lipoveanul":"lipovean","lipoveanule":"lipovean","lipoveanului":"lipovean","lipovence":"lipoveancă","lipovencei":"lipoveancă","lipovencele":"lipoveancă","lipovencelor":"lipoveancă","lipovencute":"lipovencuță","lipovencutei":"lipovencuță","lipovencutele":"lipovencuță","lipovencutelor":"lipovencuță","lipovene":"lipoveană","lipoveneasca":["lipovenească","lipovenesc","lipoveneasca","lipovenesc"],"lipovenei":"lipoveană","lipovenele":"lipoveană","lipovenelor":"lipoveană","lipovenescul":"lipovenesc","lipovenesti":"lipovenesc","lipovenestii":"lipovenesc","lipovenestile":"lipovenesc","lipoveni":"lipovean","lipovenii":"lipovean","lipovenilor":"lipovean","lipovenimea":"lipovenime","lipovenimi":"lipovenime","lipovenimii":"lipovenime","lipscani":"lipscan","lipscania":"lipscănie","lipscaniei":"lipscănie","lipscanii":["lipscanii","lipscan","lipscănii","lipscănie"],"lipscaniile":"lipscănie","lipscaniilor":"lipscănie","lipscanilor":"lipscan","lipscanul":"lipscan","lipscanule":"lipscan","lipscanului":"lipscan","lipsea":"lipsi","lipseai":"lipsi","lipseam":"lipsi","lipseati":"lipsi","lipseau":"lipsi","lipsesc":"lipsi","lipseste":"lipsi","lipsesti":"lipsi","lipsii":"lipsi","lipsim":"lipsi","lipsind":"lipsi","lipsira":"lipsi","lipsiram":"lipsi","lipsirati":"lipsi","lipsirea":"lipsire","lipsiri":"lipsire","lipsirii":"lipsire","lipsirile":"lipsire","lipsirilor":"lipsire","lipsise":"lipsi","lipsisem":"lipsi","lipsisera":"lipsi","lipsiseram":"lipsi","lipsiserati":"lipsi","lipsisesi":"lipsi","lipsisi":"lipsi","lipsit":"lipsi","lipsita":["lipsită","lipsit","lipsita","lipsit"],"lipsite":"lipsit","lipsitele":"lipsit","lipsiti":["lipsiți","lipsi","lipsiți","lipsit"],"lipsitii":"lipsit","lipsitul":"lipsit","lipsuri":"lipsă","lipsurii":"lipsă","lipsurile":"lipsă","lipsurilor":"lipsă","lipuria":"lipurie","lipuriei":"lipurie","lipurii":"lipurie","lipuriile":"lipurie","lipuriilor":"lipurie","liqueurul":"liqueur","liqueurule":"liqueur","liqueurului":"liqueur","liqueururi":"liqueur","liqueururile":"liqueur","liqueururilor":"liqueur","lire":"liră","lire sterline":"liră sterlină","lirei":"liră","lirele":"liră","lirelor":"liră","lirica":["lirică","liric","lirica","liric"],"lirice":["lirice","liric","lirice","lirică"],"liriceasca":["liricească","liricesc","liriceasca","liricesc"],"liricei":"lirică","liricele":["liricele","liric","liricele","lirică"],"liricelor":"lirică","liricescul":"liricesc","liricesti":"liricesc","liricestii":"liricesc","liricestile":"liricesc","lirici":"liric","liricii":"liric","liricizai":"liriciza","liricizam":["liricizăm","liriciza","liricizam","liriciza"],"liricizand":"liriciza","liricizara":"liriciza","liricizaram":"liriciza","liricizarati":"liriciza","liricizarea":"liricizare","liricizari":"liricizare","liricizarii":"liricizare","liricizarile":"liricizare","liricizarilor":"liricizare","liricizase":"liriciza","liricizasem":"liriciza","liricizasera":"liriciza","liricizaseram":"liriciza","liricizaserati":"liriciza","liricizasesi":"liriciza","liricizasi":"liriciza","liricizat":"liriciza","liricizata":["liricizată","liricizat","liricizata","liricizat"],"liricizate":"liricizat","liricizatele":"liricizat","liricizati":["liricizați","liriciza","liricizați","liricizat"],"liricizatii":"liricizat","liricizatul":"liricizat","liricizau":"liriciza","liricizeaza":"liriciza","liricizez":"liriciza","liricizezi":"liriciza","liricul":"liric","lirisme":"lirism","lirismele":"lirism","lirismelor":"lirism","lirismul":"lirism","lirismule":"lirism","lirismului":"lirism","lisa":["lisă","lis","lisa","lis"],"lise":["lise","lis","lise","lisă"],"lisei":"lisă","lisele":["lisele","lis","lisele","lisă"],"liselor":"lisă","lisete":"lișeță","lisetei":"lișeță","lisetele":"lișeță","lisetelor":"lișeță","lisi":"lis","lisii":"lis","lisite":"lișiță","lisitei":"lișiță","lisitele":"lișiță","lisitelor":"lișiță","lisofobia":"lisofobie","lisofobiei":"lisofobie","lisofobii":"lisofobie","lisofobiile":"lisofobie","lisofobiilor":"lisofobie","listai":"lista","listam":["listăm","lista","listam","lista"],"listand":"lista","listara":"lista","listaram":"lista","listarati":"lista","listarea":"listare","listari":"listare","listarii":"listare","listarile":"listare","listarilor":"listare","listase":"lista","listasem":"lista","listasera":"lista","listaseram":"lista","listaserati":"lista","listasesi":"lista","listasi":"lista","listat":"lista","listati":"lista","listau":"lista","liste":"listă","liste de asteptare":"listă de așteptare","liste de cumparaturi":"listă de cumpărături","listeaza":"lista","listei":"listă","listele":"listă","listelor":"listă","listerioze":"listerioză","listeriozei":"listerioză","listeriozele":"listerioză","listeriozelor":"listerioză","listez":"lista","listezi":"lista","listul":"list","listule":"list","listului":"list","listuri":"list","listurile":"list","listurilor":"list","lisul":"lis","litagoga":["litagogă","litagog","litagoga","litagog"],"litagoge":"litagog","litagogele":"litagog","litagogi":"litagog","litagogii":"litagog","litagogul":"litagog","litania":"litanie","litaniei":"litanie","litanii":"litanie","litaniile":"litanie","litaniilor":"litanie","litarge":"litargă","litargei":"litargă","litcai":"lițcaie","litcaiea":"lițcaie","litcaii":"lițcaie","litcaile":"lițcaie","litcailor":"lițcaie","lite":"liță","litei":"liță","litele":"liță","litelor":"liță","literai":"litera","literala":["literală","literal","literala","literal"],"literale":"literal","literalele":"literal","literali":"literal","literaliceasca":["literalicească","literalicesc","literaliceasca","literalicesc"],"literalicescul":"literalicesc","literalicesti":"literalicesc","literalicestii":"literalicesc","literalicestile":"literalicesc","literalii":"literal","literalitatea":"literalitate","literalitati":"literalitate","literalitatii":"literalitate","literalitatile":"literalitate","literalitatilor":"literalitate","literalniceasca":["literalnicească","literalnicesc","literalniceasca","literalnicesc"],"literalnicescul":"literalnicesc","literalnicesti":"literalnicesc","literalnicestii":"literalnicesc","literalnicestile":"literalnicesc","literalul":"literal","literam":["literăm","litera","literam","litera"],"literand":"litera","literara":["literară","litera","literară","literar","literara","literar"],"literaram":"litera","literarati":"litera","literare":"literar","literarele":"literar","literari":"literar","literarii":"literar","literarizai":"literariza","literarizam":["literarizăm","literariza","literarizam","literariza"],"literarizand":"literariza","literarizara":"literariza","literarizaram":"literariza","literarizarati":"literariza","literarizarea":"literarizare","literarizari":"literarizare","literarizarii":"literarizare","literarizarile":"literarizare","literarizarilor":"literarizare","literarizase":"literariza","literarizasem":"literariza","literarizasera":"literariza","literarizaseram":"literariza","literarizaserati":"literariza","literarizasesi":"literariza","literarizasi":"literariza","literarizat":"literariza","literarizata":["literarizată","literarizat","literarizata","literarizat"],"literarizate":"literarizat","literarizatele":"literarizat","literarizati":["literarizați","literariza","literarizați","literarizat"],"literarizatii":"literarizat","literarizatul":"literarizat","literarizau":"literariza","literarizeaza":"literariza","literarizez":"literariza","literarizezi":"literariza","literarul":"literar","literase":"litera","literasem":"litera","literasera":"litera","literaseram":"litera","literaserati":"litera","literasesi":"litera","literasi":"litera","literat":"litera","literate":"literată","literatei":"literată","literatele":"literată","literatelor":"literată","literati":["literați","litera","literați","literat"],"literatii":"literat","literatilor":"literat","literatoarea":"literatoare","literatoarei":"literatoare","literatoarele":"literatoare","literatoarelor":"literatoare","literatori":"literator","literatorii":"literator","literatorilor":"literator","literatorul":"literator","literatorule":"literator","literatorului":"literator","literatul":"literat","literatule":"literat","literatului":"literat","literaturi":"literatură","literaturii":"literatură","literaturile":"literatură","literaturilor":"literatură","literaturizai":"literaturiza","literaturizam":["literaturizăm","literaturiza","literaturizam","literaturiza"],"literaturizand":"literaturiza","literaturizara":"literaturiza","literaturizaram":"literaturiza","literaturizarati":"literaturiza","literaturizarea":"literaturizare","literaturizari":"literaturizare","literaturizarii":"literaturizare","literaturizarile":"literaturizare","literaturizarilor":"literaturizare","literaturizase":"literaturiza","literaturizasem":"literaturiza","literaturizasera":"literaturiza","literaturizaseram":"literaturiza","literaturizaserati":"literaturiza","literaturizasesi":"literaturiza","literaturizasi":"literaturiza","literaturizat":"literaturiza","literaturizati":"literaturiza","literaturizau":"literaturiza","literaturizeaza":"literaturiza","literaturizez":"literaturiza","literaturizezi":"literaturiza","literau":"litera","litere":"literă","litere mari":"literă mare","litere mici":"literă mică","litereaza":"litera","literei":"literă","literele":"literă","literelor":"literă","literez":"litera","literezi":"litera","litia":"litie","litiaze":"litiază","litiazei":"litiază","litiazele":"litiază","litiazelor":"litiază","litiazica":["litiazică","litiazic","litiazica","litiazic"],"litiazice":["litiazice","litiazic","litiazice","litiazică"],"litiazicei":"litiazică","litiazicele":["litiazicele","litiazic","litiazicele","litiazică"],"litiazicelor":"litiazică","litiazici":"litiazic","litiazicii":"litiazic","litiazicul":"litiazic","litica":["litică","litic","litica","litic"],"liticasi":"liticaș","liticasii":"liticaș","liticasilor":"liticaș","liticasul":"liticaș","liticasule":"liticaș","liticasului":"liticaș","litice":"litic","liticele":"litic","litici":"litic","liticii":"litic","liticul":"litic","litiei":"litie","litiere":"litieră","litierei":"litieră","litierele":"litieră","litierelor":"litieră","litiganta":["litigantă","litigant","litiganta","litigant"],"litigante":"litigant","litigantele":"litigant","litiganti":"litigant","litigantii":"litigant","litigantul":"litigant","litigii":"litigiu","litigiile":"litigiu","litigiilor":"litigiu","litigioasa":["litigioasă","litigios","litigioasa","litigios"],"litigioase":"litigios","litigioasele":"litigios","litigiosi":"litigios","litigiosii":"litigios","litigiosul":"litigios","litigiul":"litigiu","litigiule":"litigiu","litigiului":"litigiu","litii":"litie","litiile":"litie","litiilor":"litie","litine":"litină","litinei":"litină","litisoare":"lițișoară","litisoarei":"lițișoară","litiul":"litiu","litiule":"litiu","litiului":"litiu","litocarpul":"litocarp","litocarpule":"litocarp","litocarpului":"litocarp","litocromia":"litocromie","litocromiei":"litocromie","litocromii":"litocromie","litocromiile":"litocromie","litocromiilor":"litocromie","litofaga":["litofagă","litofag","litofaga","litofag"],"litofage":"litofag","litofagele":"litofag","litofagi":"litofag","litofagii":"litofag","litofagul":"litofag","litofita":["litofită","litofit","litofita","litofit"],"litofite":"litofit","litofitele":"litofit","litofiti":"litofit","litofitii":"litofit","litofitul":"litofit","litogeneze":"litogeneză","litogenezei":"litogeneză","litogenezele":"litogeneză","litogenezelor":"litogeneză","litografe":"litografă","litografei":"litografă","litografele":"litografă","litografelor":"litografă","litografi":"litograf","litografia":"litografie","litografiai":"litografia","litografiam":"litografia","litografiara":"litografia","litografiaram":"litografia","litografiarati":"litografia","litografiase":"litografia","litografiasem":"litografia","litografiasera":"litografia","litografiaseram":"litografia","litografiaserati":"litografia","litografiasesi":"litografia","litografiasi":"litografia","litografiat":"litografia","litografiata":["litografiată","litografiat","litografiata","litografiat"],"litografiate":"litografiat","litografiatele":"litografiat","litografiati":["litografiați","litografia","litografiați","litografiat"],"litografiatii":"litografiat","litografiatul":"litografiat","litografiau":"litografia","litografiaza":"litografia","litografica":["litografică","litografic","litografica","litografic"],"litografice":"litografic","litograficeasca":["litograficească","litograficesc","litograficeasca","litograficesc"],"litograficele":"litografic","litograficescul":"litograficesc","litograficesti":"litograficesc","litograficestii":"litograficesc","litograficestile":"litograficesc","litografici":"litografic","litograficii":"litografic","litograficul":"litografic","litografie":"litografia","litografieaza":"litografia","litografiei":"litografie","litografiem":"litografia","litografierea":"litografiere","litografierei":"litografiere","litografiez":"litografia","litografiezi":"litografia","litografii":["litografii","litograf","litografii","litografie"],"litografiile":"litografie","litografiilor":"litografie","litografiind":"litografia","litografilor":"litograf","litograful":"litograf","litografule":"litograf","litografului":"litograf","litologia":"litologie","litologica":["litologică","litologic","litologica","litologic"],"litologice":"litologic","litologicele":"litologic","litologici":"litologic","litologicii":"litologic","litologicul":"litologic","litologiei":"litologie","litologii":"litologie","litometeori":"litometeor","litometeorii":"litometeor","litometeorilor":"litometeor","litometeorul":"litometeor","litometeorule":"litometeor","litometeorului":"litometeor","litoponul":"litopon","litoponule":"litopon","litoponului":"litopon","litorala":["litorală","litoral","litorala","litoral"],"litorale":"litoral","litoralele":"litoral","litorali":"litoral","litoralii":"litoral","litoralul":"litoral","litori":"litor","litorii":"litor","litorilor":"litor","litorul":"litor","litorule":"litor","litorului":"litor","litosfere":"litosferă","litosferei":"litosferă","litosferele":"litosferă","litosferelor":"litosferă","litote":"litotă","litotei":"litotă","litotele":"litotă","litotelor":"litotă","litotipografia":"litotipografie","litotipografiei":"litotipografie","litotipografii":"litotipografie","litotoame":"litotom","litotoamele":"litotom","litotoamelor":"litotom","litotomia":"litotomie","litotomiei":"litotomie","litotomii":"litotomie","litotomiile":"litotomie","litotomiilor":"litotomie","litotomul":"litotom","litotomule":"litotom","litotomului":"litotom","litotritia":"litotritie","litotritiei":"litotritie","litotritii":"litotritie","litotritiile":"litotritie","litotritiilor":"litotritie","litotritoare":"litotritor","litotritoarele":"litotritor","litotritoarelor":"litotritor","litotritorul":"litotritor","litotritorule":"litotritor","litotritorului":"litotritor","litraje":"litraj","litrajele":"litraj","litrajelor":"litraj","litrajul":"litraj","litrajule":"litraj","litrajului":"litraj","litre":"litră","litrei":"litră","litrele":"litră","litrelor":"litră","litri":"litru","litrii":"litru","litrilor":"litru","litroseale":"litroseală","litrosealei":"litroseală","litrul":"litru","litrule":"litru","litrului":"litru","lituaniana":["lituaniană","lituanian","lituaniana","lituanian"],"lituanianul":"lituanian","lituanianule":"lituanian","lituanianului":"lituanian","lituanie":"Lituania","lituaniei":"Lituania","lituaniene":["lituaniene","lituanian","lituaniene","lituaniană"],"lituanienei":"lituaniană","lituanienele":["lituanienele","lituanian","lituanienele","lituaniană"],"lituanienelor":"lituaniană","lituanieni":"lituanian","lituanienii":"lituanian","lituanienilor":"lituanian","lituanii":"Lituania","lituce":"lițucă","litucei":"lițucă","litul":"liț","litule":"liț","litului":"liț","liturghia":"liturghie","liturghiei":"liturghie","liturghiere":"liturghier","liturghierele":"liturghier","liturghierelor":"liturghier","liturghierul":"liturghier","liturghierule":"liturghier","liturghierului":"liturghier","liturghii":"liturghie","liturghiile":"liturghie","liturghiilor":"liturghie","liturgica":["liturgică","liturgic","liturgica","liturgic"],"liturgice":["liturgice","liturgic","liturgice","liturgică"],"liturgicei":"liturgică","liturgicele":["liturgicele","liturgic","liturgicele","liturgică"],"liturgicelor":"liturgică","liturgici":"liturgic","liturgicii":"liturgic","liturgicul":"liturgic","liturgisti":"liturgist","liturgistii":"liturgist","liturgistilor":"liturgist","liturgistul":"liturgist","liturgistule":"liturgist","liturgistului":"liturgist","liturgul":"liturg","liturgule":"liturg","liturgului":"liturg","lituri":"liț","liturile":"liț","liturilor":"liț","lituusul":"lituus","lituusule":"lituus","lituusului":"lituus","lituusuri":"lituus","lituusurile":"lituus","lituusurilor":"lituus","liudeul":"liude","liudeule":"liude","liudeului":"liude","liuleaua":"liulea","liulele":"liulea","liulelei":"liulea","liulelele":"liulea","liulelelor":"liulea","liurul":"liur","liurule":"liur","liurului":"liur","liuzi":"liude","liuzii":"liude","liuzilor":"liude","livadari":"livădar","livadarii":"livădar","livadarilor":"livădar","livadarul":"livădar","livadarule":"livădar","livadarului":"livădar","livani":"livan","livanii":"livan","livanilor":"livan","livantice":"livănțică","livanticei":"livănțică","livanul":"livan","livanule":"livan","livanului":"livan","livazuice":"livăzuică","livazuicei":"livăzuică","live":"livă","livedea":"livede","livei":"livă","livejoare":"livejoară","livejoarei":"livejoară","livezi":["livezi","livadă","livezi","livede"],"livezii":["livezii","livadă","livezii","livede"],"livezile":["livezile","livadă","livezile","livede"],"livezilor":["livezilor","livadă","livezilor","livede"],"livezui":"livezuie","livezuia":"livezuie","livezuii":"livezuie","livezuile":"livezuie","livezuilor":"livezuie","livia":"Liviu","livida":["lividă","livid","livida","livid"],"livide":"livid","lividele":"livid","lividitatea":"lividitate","lividitati":"lividitate","lividitatii":"lividitate","lividitatile":"lividitate","lividitatilor":"lividitate","lividul":"livid","livingul":"living","livingule":"living","livingului":"living","livinguri":"living","livingurile":"living","livingurilor":"living","livizi":"livid","livizii":"livid","livrabila":["livrabilă","livrabil","livrabila","livrabil"],"livrabile":"livrabil","livrabilele":"livrabil","livrabili":"livrabil","livrabilii":"livrabil","livrabilul":"livrabil","livrai":"livra","livram":["livrăm","livra","livram","livra"],"livrand":"livra","livrara":"livra","livraram":"livra","livrarati":"livra","livrarea":"livrare","livrari":"livrare","livrarii":"livrare","livrarile":"livrare","livrarilor":"livrare","livrase":"livra","livrasem":"livra","livrasera":"livra","livraseram":"livra","livraserati":"livra","livrasesi":"livra","livrasi":"livra","livrat":"livra","livrati":"livra","livrau":"livra","livre":"livră","livreasca":["livrească","livresc","livreasca","livresc"],"livreaua":"livrea","livreaza":"livra","livrei":"livră","livrele":["livrele","livră","livrele","livrea"],"livrelei":"livrea","livrelele":"livrea","livrelelor":"livrea","livrelor":"livră","livrescul":"livresc","livresti":"livresc","livrestii":"livresc","livrestile":"livresc","livrete":"livret","livretele":"livret","livretelor":"livret","livretul":"livret","livretule":"livret","livretului":"livret","livrez":"livra","livrezi":"livra","lize":"liză","lizei":"liză","lizele":"liză","lizelor":"liză","lizeuze":"lizeuză","lizeuzei":"lizeuză","lizeuzele":"lizeuză","lizeuzelor":"lizeuză","lizibila":["lizibilă","lizibil","lizibila","lizibil"],"lizibile":"lizibil","lizibilele":"lizibil","lizibili":"lizibil","lizibilii":"lizibil","lizibilitatea":"lizibilitate","lizibilitati":"lizibilitate","lizibilitatii":"lizibilitate","lizibilitatile":"lizibilitate","lizibilitatilor":"lizibilitate","lizibilul":"lizibil","liziere":"lizieră","lizierei":"lizieră","lizierele":"lizieră","lizierelor":"lizieră","lizigena":["lizigenă","lizigen","lizigena","lizigen"],"lizigene":"lizigen","lizigenele":"lizigen","lizigeni":"lizigen","lizigenii":"lizigen","lizigenul":"lizigen","lizimetre":"lizimetru","lizimetrele":"lizimetru","lizimetrelor":"lizimetru","lizimetrul":"lizimetru","lizimetrule":"lizimetru","lizimetrului":"lizimetru","lizine":"lizină","lizinei":"lizină","lizinele":"lizină","lizinelor":"lizină","lizozime":"lizozimă","lizozimei":"lizozimă","lizozimele":"lizozimă","lizozimelor":"lizozimă","loaiala":["loaială","loaial","loaiala","loaial"],"loaiale":"loaial","loaialele":"loaial","loaiali":"loaial","loaialii":"loaial","loaialismul":"loaialism","loaialismule":"loaialism","loaialismului":"loaialism","loaialiste":"loaialistă","loaialistei":"loaialistă","loaialistele":"loaialistă","loaialistelor":"loaialistă","loaialisti":"loaialist","loaialistii":"loaialist","loaialistilor":"loaialist","loaialistul":"loaialist","loaialistule":"loaialist","loaialistului":"loaialist","loaialul":"loaial","loaje":"loajă","loajei":"loajă","loarea":"loare","loari":"loare","loarii":"loare","loarile":"loare","loarilor":"loare","loaze":"loază","loazei":"loază","loazele":"loază","loazelor":"loază","lobai":"loba","lobam":["lobăm","loba","lobam","loba"],"loband":"loba","lobara":["lobară","loba","lobară","lobar","lobara","lobar"],"lobaram":"loba","lobarati":"loba","lobare":"lobar","lobarele":"lobar","lobari":"lobar","lobarii":"lobar","lobarul":"lobar","lobase":"loba","lobasem":"loba","lobasera":"loba","lobaseram":"loba","lobaserati":"loba","lobasesi":"loba","lobasi":"loba","lobat":"loba","lobata":["lobată","lobat","lobata","lobat"],"lobate":"lobat","lobatele":"lobat","lobati":["lobați","loba","lobați","lobat"],"lobatii":"lobat","lobatul":"lobat","lobau":"loba","lobbyingul":"lobbying","lobbyingule":"lobbying","lobbyingului":"lobbying","lobbyinguri":"lobbying","lobbyingurile":"lobbying","lobbyingurilor":"lobbying","lobbyismul":"lobbyism","lobbyismule":"lobbyism","lobbyismului":"lobbyism","lobbyiste":"lobbyistă","lobbyistei":"lobbyistă","lobbyistele":"lobbyistă","lobbyistelor":"lobbyistă","lobbyisti":"lobbyist","lobbyistii":"lobbyist","lobbyistilor":"lobbyist","lobbyistul":"lobbyist","lobbyistule":"lobbyist","lobbyistului":"lobbyist","lobbyul":"lobby","lobbyule":"lobby","lobbyului":"lobby","lobde":"lobdă","lobdei":"lobdă","lobdele":"lobdă","lobdelor":"lobdă","lobeaza":"loba","lobectomia":"lobectomie","lobectomiei":"lobectomie","lobectomii":"lobectomie","lobectomiile":"lobectomie","lobectomiilor":"lobectomie","lobelia":"lobelie","lobeliei":"lobelie","lobelii":"lobelie","lobeliile":"lobelie","lobeliilor":"lobelie","lobeline":"lobelină","lobelinei":"lobelină","lobelinele":"lobelină","lobelinelor":"lobelină","lobez":"loba","lobezi":"loba","lobi":"lob","lobii":"lob","lobilor":"lob","lobite":"lobită","lobitei":"lobită","lobitele":"lobită","lobitelor":"lobită","lobode":"lobodă","lobodei":"lobodă","lobodele":"lobodă","lobodelor":"lobodă","lobodite":"lobodiță","loboditei":"lobodiță","loboditele":"lobodiță","loboditelor":"lobodiță","lobonti":"lobonț","lobontii":"lobonț","lobontilor":"lobonț","lobontul":"lobonț","lobontule":"lobonț","lobontului":"lobonț","lobotomia":"lobotomie","lobotomiei":"lobotomie","lobotomii":"lobotomie","lobotomiile":"lobotomie","lobotomiilor":"lobotomie","lobul":"lob","lobulara":["lobulară","lobular","lobulara","lobular"],"lobulare":"lobular","lobularele":"lobular","lobulari":"lobular","lobularii":"lobular","lobularul":"lobular","lobulata":["lobulată","lobulat","lobulata","lobulat"],"lobulate":"lobulat","lobulatele":"lobulat","lobulati":"lobulat","lobulatii":"lobulat","lobulatul":"lobulat","lobule":"lob","lobuli":"lobul","lobulii":"lobul","lobulilor":"lobul","lobului":"lob","lobulul":"lobul","lobulule":"lobul","lobulului":"lobul","loburi frontale":"lob frontal","loburi occipitale":"lob occipital","loburi parietale":"lob parietal","loburi temporale":"lob temporal","lobusori":"lobușor","lobusorii":"lobușor","lobusorilor":"lobușor","lobusorul":"lobușor","lobusorule":"lobușor","lobusorului":"lobușor","lobutul":"lobut","lobutule":"lobut","lobutului":"lobut","lobuturi":"lobut","lobuturile":"lobut","lobuturilor":"lobut","locala":["locală","local","locala","local"],"locale":"local","localele":"local","locali":"local","localii":"local","localismul":"localism","localismule":"localism","localismului":"localism","localista":["localistă","localist","localista","localist"],"localiste":"localist","localistele":"localist","localisti":"localist","localistii":"localist","localistilor":"localist","localistul":"localist","localistule":"localist","localistului":"localist","localitatea":"localitate","localitati":"localitate","localitatii":"localitate","localitatile":"localitate","localitatilor":"localitate","localizabila":["localizabilă","localizabil","localizabila","localizabil"],"localizabile":"localizabil","localizabilele":"localizabil","localizabili":"localizabil","localizabilii":"localizabil","localizabilul":"localizabil","localizai":"localiza","localizam":["localizăm","localiza","localizam","localiza"],"localizand":"localiza","localizara":"localiza","localizaram":"localiza","localizarati":"localiza","localizari":"localizare","localizase":"localiza","localizasem":"localiza","localizasera":"localiza","localizaseram":"localiza","localizaserati":"localiza","localizasesi":"localiza","localizasi":"localiza","localizat":"localiza","localizata":["localizată","localizat","localizata","localizat"],"localizate":"localizat","localizatele":"localizat","localizati":["localizați","localiza","localizați","localizat"],"localizatia":"localizație","localizatiei":"localizație","localizatii":["localizații","localizat","localizații","localizație"],"localizatiile":"localizație","localizatiilor":"localizație","localizatori":"localizator","localizatorii":"localizator","localizatorilor":"localizator","localizatorul":"localizator","localizatorule":"localizator","localizatorului":"localizator","localizatul":"localizat","localizau":"localiza","localizeaza":"localiza","localizez":"localiza","localizezi":"localiza","localnice":"localnică","localnicei":"localnică","localnicele":"localnică","localnicelor":"localnică","localnici":"localnic","localnicii":"localnic","localnicilor":"localnic","localnicul":"localnic","localnicule":"localnic","localnicului":"localnic","localul":"local","locande":"locandă","locandei":"locandă","locandele":"locandă","locandelor":"locandă","locandieri":"locandier","locandierii":"locandier","locandierilor":"locandier","locandierul":"locandier","locandierule":"locandier","locandierului":"locandier","locandioare":"locandioară","locandioarei":"locandioară","locandioarele":"locandioară","locandioarelor":"locandioară","locante":"locantă","locantei":"locantă","locantele":"locantă","locantelor":"locantă","locantiere":"locantieră","locantierei":"locantieră","locantierele":"locantieră","locantierelor":"locantieră","locantieri":"locantier","locantierii":"locantier","locantierilor":"locantier","locantierul":"locantier","locantierule":"locantier","locantierului":"locantier","locasul":"locaș","locasule":"locaș","locasului":"locaș","locasuri":"locaș","locasurile":"locaș","locasurilor":"locaș","locatare":"locatară","locatarei":"locatară","locatarele":"locatară","locatarelor":"locatară","locatari":"locatar","locatarii":"locatar","locatarilor":"locatar","locatarul":"locatar","locatarule":"locatar","locatarului":"locatar","locatia":"locație","locatiei":"locație","locatii":"locație","locatiile":"locație","locatiilor":"locație","locatiune":"locație","locatiunea":"locațiune","locatiuni":"locațiune","locatiunii":"locațiune","locatiunile":"locațiune","locatiunilor":"locațiune","locativi":"locativ","locativile":"locativ","locativilor":"locativ","locativul":"locativ","locativule":"locativ","locativului":"locativ","locatoarea":"locatoare","locatoarei":"locatoare","locatoarele":"locatoare","locatoarelor":"locatoare","locatori":"locator","locatorii":"locator","locatorilor":"locator","locatorul":"locator","locatorule":"locator","locatorului":"locator","locbaitale":"locbaităl","locbaitalele":"locbaităl","locbaitalelor":"locbaităl","locbaitalul":"locbaităl","locbaitalule":"locbaităl","locbaitalului":"locbaităl","lochul":"loch","lochule":"loch","lochului":"loch","lochuri":"loch","lochurile":"loch","lochurilor":"loch","lociolauul":"lociolău","lociolauule":"lociolău","lociolauului":"lociolău","lock-outul":"lock-out","lock-outule":"lock-out","lock-outului":"lock-out","locmale":"locma","locmalei":"locma","locmalele":"locma","locmalelor":"locma","locmalute":"locmăluță","locmalutei":"locmăluță","locmalutele":"locmăluță","locmalutelor":"locmăluță","locmaua":"locma","locomobi":"locomobil","locomobile":"locomobilă","locomobilei":"locomobilă","locomobilele":"locomobilă","locomobilelor":"locomobilă","locomobili":"locomobil","locomobilii":"locomobil","locomobilile":"locomobil","locomobililor":"locomobil","locomotia":"locomoție","locomotiei":"locomoție","locomotii":"locomoție","locomotiile":"locomoție","locomotiilor":"locomoție","locomotiunea":"locomoțiune","locomotiuni":"locomoțiune","locomotiunii":"locomoțiune","locomotiunile":"locomoțiune","locomotiunilor":"locomoțiune","locomotiva":["locomotivă","locomotiv","locomotiva","locomotiv"],"locomotive":["locomotive","locomotiv","locomotive","locomotivă"],"locomotive cu abur":"locomotivă cu abur","locomotivei":"locomotivă","locomotivele":["locomotivele","locomotiv","locomotivele","locomotivă"],"locomotivelor":"locomotivă","locomotivi":"locomotiv","locomotivii":"locomotiv","locomotivul":"locomotiv","locomotoare":"locomotor","locomotoarea":"locomotor","locomotoarele":"locomotor","locomotori":"locomotor","locomotorii":"locomotor","locomotorul":"locomotor","locopaznici":"locopaznic","locopaznicii":"locopaznic","locopaznicilor":"locopaznic","locopaznicul":"locopaznic","locopaznicule":"locopaznic","locopaznicului":"locopaznic","locotenent-colonei":"locotenent-colonel","locotenente":"locotenență","locotenentei":"locotenență","locotenentele":"locotenență","locotenentelor":"locotenență","locotenenti":"locotenent","locotractoare":"locotractor","locotractoarele":"locotractor","locotractoarelor":"locotractor","locotractorul":"locotractor","locotractorule":"locotractor","locotractorului":"locotractor","locsoare":"locșor","locsore":"locșor","locsorele":["locșorele","locșor","locșorele","locșorel"],"locsorelele":"locșorel","locsorelelor":"locșorel","locsorelor":"locșor","locsorelul":"locșorel","locsorelule":"locșorel","locsorelului":"locșorel","locsorul":"locșor","locsorule":"locșor","locsorului":"locșor","loctiitoarea":"locțiitoare","loctiitoarei":"locțiitoare","loctiitoarele":"locțiitoare","loctiitoarelor":"locțiitoare","loctiitori":"locțiitor","loctineri":"locținer","loctinerii":"locținer","loctinerilor":"locținer","loctinerul":"locținer","loctinerule":"locținer","loctinerului":"locținer","locuacea":"locuace","locuacele":"locuace","locuaci":"locuace","locuacii":"locuace","locuia":"locui","locuiai":"locui","locuiam":"locui","locuiati":"locui","locuiau":"locui","locuibila":["locuibilă","locuibil","locuibila","locuibil"],"locuibile":"locuibil","locuibilele":"locuibil","locuibili":"locuibil","locuibilii":"locuibil","locuibilitatea":"locuibilitate","locuibilitati":"locuibilitate","locuibilitatii":"locuibilitate","locuibilul":"locuibil","locuiesc":"locui","locuieste":"locui","locuiesti":"locui","locuii":"locui","locuim":"locui","locuincioasa":["locuincioasă","locuincios","locuincioasa","locuincios"],"locuincioase":"locuincios","locuincioasele":"locuincios","locuinciosi":"locuincios","locuinciosii":"locuincios","locuinciosul":"locuincios","locuind":"locui","locuinte":"locuință","locuinte lacustre":"locuință lacustră","locuintei":"locuință","locuintele":"locuință","locuintelor":"locuință","locuintisoare":"locuințișoară","locuintisoarei":"locuințișoară","locuintisoarele":"locuințișoară","locuintisoarelor":"locuințișoară","locuira":"locui","locuiram":"locui","locuirati":"locui","locuirea":"locuire","locuirei":"locuire","locuise":"locui","locuisem":"locui","locuisera":"locui","locuiseram":"locui","locuiserati":"locui","locuisesi":"locui","locuisi":"locui","locuit":"locui","locuita":["locuită","locuit","locuita","locuit"],"locuite":"locuit","locuitele":"locuit","locuiti":["locuiți","locui","locuiți","locuit"],"locuitii":"locuit","locuitoarea":"locuitoare","locuitoarei":"locuitoare","locuitoarele":"locuitoare","locuitoarelor":"locuitoare","locuitori":"locuitor","locuitorii":"locuitor","locuitorilor":"locuitor","locuitorimea":"locuitorime","locuitorimi":"locuitorime","locuitorimii":"locuitorime","locuitorimile":"locuitorime","locuitorimilor":"locuitorime","locuitorul":"locuitor","locuitorule":"locuitor","locuitorului":"locuitor","locuitul":"locuit","locul":"loc","loculara":["loculară","locular","loculara","locular"],"loculare":"locular","locularele":"locular","loculari":"locular","locularii":"locular","locularul":"locular","locule":["locule","loc","locule","loculă"],"loculei":"loculă","loculele":"loculă","loculelor":"loculă","loculete":"loculeț","loculetele":"loculeț","loculetelor":"loculeț","loculetul":"loculeț","loculetule":"loculeț","loculetului":"loculeț","loculi":"locul","loculii":"locul","loculilor":"locul","loculoasa":["loculoasă","loculos","loculoasa","loculos"],"loculoase":"loculos","loculoasele":"loculos","loculosi":"loculos","loculosii":"loculos","loculosul":"loculos","locului":"loc","loculul":"locul","loculule":"locul","loculului":"locul","locuri":"loc","locuri de joaca":"loc de joacă","locuri de munca":"loc de muncă","locuri de parcare":"loc de parcare","locuri de veci":"loc de veci","locurile":"loc","locurilor":"loc","locusoare":"locușor","locusoarele":"locușor","locusoarelor":"locușor","locusorul":"locușor","locusorule":"locușor","locusorului":"locușor","locuste":"locustă","locustei":"locustă","locustele":"locustă","locustelor":"locustă","locute":"locuț","locutele":"locuț","locutelor":"locuț","locutia":"locuție","locutie":"locuțiune","locutiei":"locuție","locutii":"locuție","locutiile":"locuție","locutiilor":"locuție","locutiunea":"locuțiune","locutiuni":"locuțiune","locutiuni adjectivale":"locuțiune adjectivală","locutiuni adverbiale":"locuțiune adverbială","locutiuni conjuctionale":"locuțiune conjuncțională","locutiuni interjectionale":"locuțiune interjecțională","locutiuni prepozitionale":"locuțiune prepozițională","locutiuni substantivale":"locuțiune substantivală","locutiuni verbale":"locuțiune verbală","locutiunii":"locuțiune","locutiunile":"locuțiune","locutiunilor":"locuțiune","locutori":"locutor","locutorii":"locutor","locutorilor":"locutor","locutorul":"locutor","locutorule":"locutor","locutorului":"locutor","locutul":"locuț","locutule":"locuț","locutului":"locuț","locuturi":"locuț","locvacea":"locvace","locvacele":"locvace","locvaci":"locvace","locvacii":"locvace","locvacitatea":"locvacitate","locvacitati":"locvacitate","locvacitatii":"locvacitate","locvacitatile":"locvacitate","locvacitatilor":"locvacitate","loessoida":["loessoidă","loessoid","loessoida","loessoid"],"loessoide":"loessoid","loessoidele":"loessoid","loessoidul":"loessoid","loessoizi":"loessoid","loessoizii":"loessoid","loessul":"loess","loessule":"loess","loessului":"loess","loessuri":"loess","loessurile":"loess","loessurilor":"loess","logaedica":["logaedică","logaedic","logaedica","logaedic"],"logaedice":"logaedic","logaedicele":"logaedic","logaedici":"logaedic","logaedicii":"logaedic","logaedicul":"logaedic","logai":"loga","logam":["logăm","loga","logam","loga"],"logand":"loga","logara":"loga","logaram":"loga","logarati":"loga","logaritmai":"logaritma","logaritmam":["logaritmăm","logaritma","logaritmam","logaritma"],"logaritmand":"logaritma","logaritmara":"logaritma","logaritmaram":"logaritma","logaritmarati":"logaritma","logaritmarea":"logaritmare","logaritmari":"logaritmare","logaritmarii":"logaritmare","logaritmarile":"logaritmare","logaritmarilor":"logaritmare","logaritmase":"logaritma","logaritmasem":"logaritma","logaritmasera":"logaritma","logaritmaseram":"logaritma","logaritmaserati":"logaritma","logaritmasesi":"logaritma","logaritmasi":"logaritma","logaritmat":"logaritma","logaritmati":"logaritma","logaritmau":"logaritma","logaritmeaza":"logaritma","logaritmez":"logaritma","logaritmezi":"logaritma","logaritmi":"logaritm","logaritmi naturali":"logaritm natural","logaritmica":["logaritmică","logaritmic","logaritmica","logaritmic"],"logaritmice":"logaritmic","logaritmiceasca":["logaritmicească","logaritmicesc","logaritmiceasca","logaritmicesc"],"logaritmicele":"logaritmic","logaritmicescul":"logaritmicesc","logaritmicesti":"logaritmicesc","logaritmicestii":"logaritmicesc","logaritmicestile":"logaritmicesc","logaritmici":"logaritmic","logaritmicii":"logaritmic","logaritmicul":"logaritmic","logaritmii":"logaritm","logaritmilor":"logaritm","logaritmul":"logaritm","logaritmule":"logaritm","logaritmului":"logaritm","logase":"loga","logasem":"loga","logasera":"loga","logaseram":"loga","logaserati":"loga","logasesi":"loga","logasi":"loga","logat":"loga","logati":"loga","logatomi":"logatom","logatomii":"logatom","logatomilor":"logatom","logatomul":"logatom","logatomule":"logatom","logatomului":"logatom","logau":"loga","loggii":"loggia","logheaza":"loga","loghez":"loga","loghezi":"loga","loghiosi":"loghios","loghiosii":"loghios","loghiosilor":"loghios","loghiosul":"loghios","loghiosule":"loghios","loghiosului":"loghios","loghiotati":"loghiotat","loghiotatii":"loghiotat","loghiotatilor":"loghiotat","loghiotatul":"loghiotat","loghiotatule":"loghiotat","loghiotatului":"loghiotat","logia":"logie","logica":["logică","logic","logica","logic"],"logice":"logic","logiceasca":["logicească","logicesc","logiceasca","logicesc"],"logicele":"logic","logicescul":"logicesc","logicesti":"logicesc","logicestii":"logicesc","logicestile":"logicesc","logici":["logici","logic","logici","logică"],"logicianul":"logician","logicianule":"logician","logicianului":"logician","logiciene":"logiciană","logicienei":"logiciană","logicienele":"logiciană","logicienelor":"logiciană","logicieni":"logician","logicienii":"logician","logicienilor":"logician","logicii":["logicii","logic","logicii","logică"],"logicile":"logică","logicilor":"logică","logicismul":"logicism","logicismule":"logicism","logicismului":"logicism","logiciste":"logicistă","logicistei":"logicistă","logicistele":"logicistă","logicistelor":"logicistă","logicisti":"logicist","logicistii":"logicist","logicistilor":"logicist","logicistul":"logicist","logicistule":"logicist","logicistului":"logicist","logicitatea":"logicitate","logicitati":"logicitate","logicitatii":"logicitate","logicul":"logic","logiei":"logie","logii":"logie","logiile":"logie","logiilor":"logie","logistica":["logistică","logistic","logistica","logistic"],"logistice":"logistic","logisticele":"logistic","logistici":["logistici","logistic","logistici","logistică"],"logisticianul":"logistician","logisticianule":"logistician","logisticianului":"logistician","logisticiene":"logisticiană","logisticienei":"logisticiană","logisticienele":"logisticiană","logisticienelor":"logisticiană","logisticieni":"logistician","logisticienii":"logistician","logisticienilor":"logistician","logisticii":["logisticii","logistic","logisticii","logistică"],"logisticile":"logistică","logisticilor":"logistică","logisticul":"logistic","logoclonia":"logoclonie","logocloniei":"logoclonie","logoclonii":"logoclonie","logocloniile":"logoclonie","logocloniilor":"logoclonie","logodani":"logodan","logodanii":"logodan","logodanilor":"logodan","logodanul":"logodan","logodanule":"logodan","logodanului":"logodan","logodea":"logodi","logodeai":"logodi","logodeam":"logodi","logodeati":"logodi","logodeau":"logodi","logodele":"logodeală","logodelei":"logodeală","logodelele":"logodeală","logodelelor":"logodeală","logodeli":"logodeală","logodesc":"logodi","logodese":"logodeasă","logodesei":"logodeasă","logodesele":"logodeasă","logodeselor":"logodeasă","logodeste":"logodi","logodesti":"logodi","logodii":"logodi","logodim":"logodi","logodind":"logodi","logodira":"logodi","logodiram":"logodi","logodirati":"logodi","logodise":"logodi","logodisem":"logodi","logodisera":"logodi","logodiseram":"logodi","logodiserati":"logodi","logodisesi":"logodi","logodisi":"logodi","logodit":"logodi","logodita":["logodită","logodit","logodita","logodit"],"logodite":"logodit","logoditele":"logodit","logoditi":["logodiți","logodi","logodiți","logodit"],"logoditii":"logodit","logoditul":"logodit","logodituri":"logoditură","logoditurii":"logoditură","logoditurile":"logoditură","logoditurilor":"logoditură","logodne":"logodnă","logodnei":"logodnă","logodnele":"logodnă","logodnelor":"logodnă","logodnice":"logodnică","logodnici":"logodnic","logofatul":"logofăt","logofatule":"logofăt","logofatului":"logofăt","logofetei":"logofețel","logofeteli":"logofețel","logofetelii":"logofețel","logofetelilor":"logofețel","logofetelul":"logofețel","logofetelule":"logofețel","logofetelului":"logofețel","logofetese":"logofeteasă","logofetesei":"logofeteasă","logofetesele":"logofeteasă","logofeteselor":"logofeteasă","logofeti":"logofăt","logofetia":"logofeție","logofetiei":"logofeție","logofetii":["logofeții","logofăt","logofeții","logofeție"],"logofetiile":"logofeție","logofetiilor":"logofeție","logofetilor":"logofăt","logografi":"logograf","logografia":"logografie","logografiei":"logografie","logografii":["logografii","logograf","logografii","logografie"],"logografiile":"logografie","logografiilor":"logografie","logografilor":"logograf","logograful":"logograf","logografule":"logograf","logografului":"logograf","logogrife":"logogrifă","logogrifei":"logogrifă","logogrifele":"logogrifă","logogrifelor":"logogrifă","logogrifica":["logogrifică","logogrific","logogrifica","logogrific"],"logogrifice":"logogrific","logogrificele":"logogrific","logogrifici":"logogrific","logogrificii":"logogrific","logogrificul":"logogrific","logogriful":"logogrif","logogrifule":"logogrif","logogrifului":"logogrif","logogrifuri":"logogrif","logogrifurile":"logogrif","logogrifurilor":"logogrif","logolatria":"logolatrie","logolatriei":"logolatrie","logolatrii":"logolatrie","logolatriile":"logolatrie","logolatriilor":"logolatrie","logomahia":"logomahie","logomahiei":"logomahie","logomahii":"logomahie","logomahiile":"logomahie","logomahiilor":"logomahie","logometre":"logometru","logometrele":"logometru","logometrelor":"logometru","logometrul":"logometru","logometrule":"logometru","logometrului":"logometru","logonevrotice":"logonevrotică","logonevroticei":"logonevrotică","logonevroticele":"logonevrotică","logonevroticelor":"logonevrotică","logonevroze":"logonevroză","logonevrozei":"logonevroză","logonevrozele":"logonevroză","logonevrozelor":"logonevroză","logopata":["logopată","logopat","logopata","logopat"],"logopate":["logopate","logopat","logopate","logopată"],"logopatei":"logopată","logopatele":["logopatele","logopat","logopatele","logopată"],"logopatelor":"logopată","logopati":"logopat","logopatia":"logopatie","logopatiei":"logopatie","logopatii":["logopații","logopat","logopatii","logopatie"],"logopatiile":"logopatie","logopatiilor":"logopatie","logopatul":"logopat","logopede":"logopedă","logopedei":"logopedă","logopedele":"logopedă","logopedelor":"logopedă","logopedia":"logopedie","logopedica":["logopedică","logopedic","logopedica","logopedic"],"logopedice":"logopedic","logopedicele":"logopedic","logopedici":"logopedic","logopedicii":"logopedic","logopedicul":"logopedic","logopediei":"logopedie","logopedii":"logopedie","logopedul":"logoped","logopedule":"logoped","logopedului":"logoped","logopezi":"logoped","logopezii":"logoped","logopezilor":"logoped","logoplegia":"logoplegie","logoplegiei":"logoplegie","logoplegii":"logoplegie","logoplegiile":"logoplegie","logoplegiilor":"logoplegie","logoreea":"logoree","logorei":"logoree","logoreica":["logoreică","logoreic","logoreica","logoreic"],"logoreice":"logoreic","logoreicele":"logoreic","logoreici":"logoreic","logoreicii":"logoreic","logoreicul":"logoreic","logoreii":"logoree","logoroseale":"logoroseală","logorosealei":"logoroseală","logosul":"logos","logosule":"logos","logosului":"logos","logosuri":"logos","logosurile":"logos","logosurilor":"logos","logotipul":"logotip","logotipule":"logotip","logotipului":"logotip","logotipuri":"logotip","logotipurile":"logotip","logotipurilor":"logotip","logoul":"logo","logoule":"logo","logoului":"logo","logouri":"logo","logourile":"logo","logourilor":"logo","lohance":"lohancă","lohancei":"lohancă","loiala":["loială","loial","loiala","loial"],"loiale":"loial","loialele":"loial","loiali":"loial","loialii":"loial","loialismul":"loialism","loialismule":"loialism","loialismului":"loialism","loialiste":"loialistă","loialistei":"loialistă","loialistele":"loialistă","loialistelor":"loialistă","loialisti":"loialist","loialistii":"loialist","loialistilor":"loialist","loialistul":"loialist","loialistule":"loialist","loialistului":"loialist","loialitatea":"loialitate","loialitati":"loialitate","loialitatii":"loialitate","loialitatile":"loialitate","loialitatilor":"loialitate","loialul":"loial","loisirul":"loisir","loisirule":"loisir","loisirului":"loisir","loitre":"loitră","loitrite":"loitriță","loitritei":"loitriță","loitritele":"loitriță","loitritelor":"loitriță","lojesne":"lojesnă","lojesnei":"lojesnă","lojesnele":"lojesnă","lojesnelor":"lojesnă","loji":"lojă","lojii":"lojă","lojile":"lojă","lojilor":"lojă","lombalgia":"lombalgie","lombalgiei":"lombalgie","lombalgii":"lombalgie","lombalgiile":"lombalgie","lombalgiilor":"lombalgie","lombalizarea":"lombalizare","lombalizari":"lombalizare","lombalizarii":"lombalizare","lombalizarile":"lombalizare","lombalizarilor":"lombalizare","lombara":["lombară","lombar","lombara","lombar"],"lombardai":"lombarda","lombardam":["lombardăm","lombarda","lombardam","lombarda"],"lombardand":"lombarda","lombardara":"lombarda","lombardaram":"lombarda","lombardarati":"lombarda","lombardarea":"lombardare","lombardari":"lombardare","lombardarii":"lombardare","lombardase":"lombarda","lombardasem":"lombarda","lombardasera":"lombarda","lombardaseram":"lombarda","lombardaserati":"lombarda","lombardasesi":"lombarda","lombardasi":"lombarda","lombardat":"lombarda","lombardati":"lombarda","lombardau":"lombarda","lombardeaza":"lombarda","lombardez":"lombarda","lombardezi":"lombarda","lombardica":["lombardică","lombardic","lombardica","lombardic"],"lombardice":"lombardic","lombardiceasca":["lombardicească","lombardicesc","lombardiceasca","lombardicesc"],"lombardicele":"lombardic","lombardicescul":"lombardicesc","lombardicesti":"lombardicesc","lombardicestii":"lombardicesc","lombardicestile":"lombardicesc","lombardici":"lombardic","lombardicii":"lombardic","lombardicul":"lombardic","lombardul":"lombard","lombardule":"lombard","lombardului":"lombard","lombare":"lombar","lombarele":"lombar","lombari":"lombar","lombarii":"lombar","lombartria":"lombartrie","lombartriei":"lombartrie","lombartrii":"lombartrie","lombartriile":"lombartrie","lombartriilor":"lombartrie","lombartroze":"lombartroză","lombartrozei":"lombartroză","lombartrozele":"lombartroză","lombartrozelor":"lombartroză","lombarul":"lombar","lombarzi":"lombard","lombarzii":"lombard","lombarzilor":"lombard","lombotomia":"lombotomie","lombotomiei":"lombotomie","lombotomii":"lombotomie","lombotomiile":"lombotomie","lombotomiilor":"lombotomie","lomul":"lom","lomule":"lom","lomului":"lom","lomuri":"lom","lomurile":"lom","lomurilor":"lom","londoneze":"londoneză","londonezei":"londoneză","londonezele":"londoneză","londonezelor":"londoneză","londonezi":"londonez","londonezii":"londonez","londonezilor":"londonez","londonezul":"londonez","londonezule":"londonez","londonezului":"londonez","londre":"Londra","londrei":"Londra","longeroane":"longeron","longeroanele":"longeron","longeroanelor":"longeron","longeronul":"longeron","longeronule":"longeron","longeronului":"longeron","longevitatea":"longevitate","longevitati":"longevitate","longevitatii":"longevitate","longevitatile":"longevitate","longevitatilor":"longevitate","longeviva":["longevivă","longeviv","longeviva","longeviv"],"longevive":["longevive","longeviv","longevive","longevivă"],"longevivei":"longevivă","longevivele":["longevivele","longeviv","longevivele","longevivă"],"longevivelor":"longevivă","longevivi":"longeviv","longevivii":"longeviv","longevivilor":"longeviv","longevivul":"longeviv","longevivule":"longeviv","longevivului":"longeviv","longilina":["longilină","longilin","longilina","longilin"],"longiline":"longilin","longilinele":"longilin","longilini":"longilin","longilinii":"longilin","longilinul":"longilin","longitudinala":["longitudinală","longitudinal","longitudinala","longitudinal"],"longitudinale":"longitudinal","longitudinalele":"longitudinal","longitudinali":"longitudinal","longitudinalii":"longitudinal","longitudinalul":"longitudinal","longitudinea":"longitudine","longitudini":"longitudine","longitudinii":"longitudine","longitudinile":"longitudine","longitudinilor":"longitudine","longobarde":"longobardă","longobardei":"longobardă","longobardele":"longobardă","longobardelor":"longobardă","longobardul":"longobard","longobardule":"longobard","longobardului":"longobard","longobarzi":"longobard","longobarzii":"longobard","longobarzilor":"longobard","lonjeroane":"lonjeron","lonjeroanele":"lonjeron","lonjeroanelor":"lonjeron","lonjeronul":"lonjeron","lonjeronule":"lonjeron","lonjeronului":"lonjeron","lookul":"look","lookule":"look","lookului":"look","lookuri":"look","lookurile":"look","lookurilor":"look","loopingul":"looping","loopingule":"looping","loopingului":"looping","loopinguri":"looping","loopingurile":"looping","loopingurilor":"looping","lopacioare":"lopăcioară","lopacioarei":"lopăcioară","lopacioarele":"lopăcioară","lopacioarelor":"lopăcioară","lopare":"lopar","loparele":"lopar","loparelor":"lopar","loparul":"lopar","loparule":"lopar","loparului":"lopar","loparzii zapezilor":"leopardul zăpezilor","lopatai":"lopăta","lopatam":["lopătăm","lopăta","lopătam","lopăta"],"lopatand":"lopăta","lopatara":"lopăta","lopataram":"lopăta","lopatarasi":"lopătăraș","lopatarasii":"lopătăraș","lopatarasilor":"lopătăraș","lopatarasul":"lopătăraș","lopatarasule":"lopătăraș","lopatarasului":"lopătăraș","lopatarati":"lopăta","lopatarea":"lopătare","lopatareasca":["lopătărească","lopătăresc","lopătăreasca","lopătăresc"],"lopatarei":"lopătărel","lopatareii":"lopătărel","lopatareilor":"lopătărel","lopatarelul":"lopătărel","lopatarelule":"lopătărel","lopatarelului":"lopătărel","lopatarescul":"lopătăresc","lopatarese":"lopătăreasă","lopataresei":"lopătăreasă","lopataresele":"lopătăreasă","lopatareselor":"lopătăreasă","lopataresti":"lopătăresc","lopatarestii":"lopătăresc","lopatarestile":"lopătăresc","lopatari":["lopătari","lopătar","lopătări","lopătare"],"lopatarii":["lopătarii","lopătar","lopătării","lopătare"],"lopatarile":"lopătare","lopatarilor":["lopătarilor","lopătar","lopătărilor","lopătare"],"lopatarite":"lopătăriță","lopataritei":"lopătăriță","lopataritele":"lopătăriță","lopataritelor":"lopătăriță","lopatarul":"lopătar","lopatarule":"lopătar","lopatarului":"lopătar","lopatase":"lopăta","lopatasem":"lopăta","lopatasera":"lopăta","lopataseram":"lopăta","lopataserati":"lopăta","lopatasesi":"lopăta","lopatasi":"lopăta","lopatat":"lopăta","lopatati":"lopăta","lopatau":"lopăta","lopateaza":"lopăta","lopatele":"lopățică","lopatez":"lopăta","lopatezi":"lopăta","lopatice":"lopățică","lopaticei":"lopățică","lopaticele":"lopățică","lopaticelor":"lopățică","lopatoaie":"lopățoi","lopatoaiele":"lopățoi","lopatoaielor":"lopățoi","lopatoiul":"lopățoi","lopatoiule":"lopățoi","lopatoiului":"lopățoi","lopatui":"lopățuie","lopatuia":"lopățuie","lopatuii":"lopățuie","lopatuile":"lopățuie","lopatuilor":"lopățuie","lopatute":"lopătuță","lopatutei":"lopătuță","lopatutele":"lopătuță","lopatutelor":"lopătuță","lopeti":"lopată","lopetii":"lopată","lopetile":"lopată","lopetilor":"lopată","lopiste":"lopiscă","lopistei":"lopiscă","lopistele":"lopiscă","lopistelor":"lopiscă","lopte":"loptă","loptei":"loptă","loptele":"loptă","loptelor":"loptă","lor":["lor","ei","lor","ele","lor","entomostraceu","lor","lui"],"lorbertul":"lorbert","lorbertule":"lorbert","lorbertului":"lorbert","lordoze":"lordoză","lordozei":"lordoză","lordozele":"lordoză","lordozelor":"lordoză","lordul":"lord","lordule":"lord","lordului":"lord","lorete":"loretă","loretei":"loretă","loretele":"loretă","loretelor":"loretă","lorice":"lorică","loricei":"lorică","loricele":"lorică","loricelor":"lorică","lorii":"lori","lorilor":"lori","loris":"lori","loriul":"lori","loriule":"lori","loriului":"lori","lornete":"lornetă","lornetei":"lornetă","lornetele":"lornetă","lornetelor":"lornetă","lorniete":"lornietă","lornietei":"lornietă","lornietele":"lornietă","lornietelor":"lornietă","lornioane":"lornion","lornioanele":"lornion","lornioanelor":"lornion","lornionul":"lornion","lornionule":"lornion","lornionului":"lornion","lorzi":"lord","lorzii":"lord","lorzilor":"lord","losanje":"losanj","losanjele":"losanj","losanjelor":"losanj","losanjul":"losanj","losanjule":"losanj","losanjului":"losanj","losnite":"loșniță","losnitei":"loșniță","losnitele":"loșniță","losnitelor":"loșniță","lostica":"lostriță","lostopane":["lostopane","lostopan","lostopane","lostopană"],"lostopanei":"lostopană","lostopanele":["lostopanele","lostopan","lostopanele","lostopană"],"lostopanelor":["lostopanelor","lostopan","lostopanelor","lostopană"],"lostopanul":"lostopan","lostopanule":"lostopan","lostopanului":"lostopan","lostricicele":"lostricică","lostricicelei":"lostricică","lostricicelele":"lostricică","lostricicelelor":"lostricică","lostrite":"lostriță","lostritei":"lostriță","lostritele":"lostriță","lostritelor":"lostriță","lostuni":"lostun","lostunii":"lostun","lostunilor":"lostun","lostunul":"lostun","lostunule":"lostun","lostunului":"lostun","lotasul":"lotaș","lotasule":"lotaș","lotasului":"lotaș","lotcagii":"lotcagiu","lotcagiii":"lotcagiu","lotcagiilor":"lotcagiu","lotcagiuul":"lotcagiu","lotcagiuule":"lotcagiu","lotcagiuului":"lotcagiu","lotcari":"lotcar","lotcarii":"lotcar","lotcarilor":"lotcar","lotcarul":"lotcar","lotcarule":"lotcar","lotcarului":"lotcar","lotcasi":"lotcaș","lotcasii":"lotcaș","lotcasilor":"lotcaș","lotcasul":"lotcaș","lotcasule":"lotcaș"};
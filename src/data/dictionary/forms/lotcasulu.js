@@ -0,0 +1 @@
+export default {"lotcasului":"lotcaș","lotci":"lotcă","lotcii":"lotcă","lotcile":"lotcă","lotcilor":"lotcă","loteria":"loterie","loteriei":"loterie","loterii":"loterie","loteriile":"loterie","loteriilor":"loterie","lotiforma":["lotiformă","lotiform","lotiforma","lotiform"],"lotiforme":"lotiform","lotiformele":"lotiform","lotiformi":"lotiform","lotiformii":"lotiform","lotiformul":"lotiform","lotionai":"loționa","lotionam":["loționăm","loționa","loționam","loționa"],"lotionand":"loționa","lotionara":"loționa","lotionaram":"loționa","lotionarati":"loționa","lotionarea":"loționare","lotionari":"loționare","lotionarii":"loționare","lotionarile":"loționare","lotionarilor":"loționare","lotionase":"loționa","lotionasem":"loționa","lotionasera":"loționa","lotionaseram":"loționa","lotionaserati":"loționa","lotionasesi":"loționa","lotionasi":"loționa","lotionat":"loționa","lotionata":["loționată","loționat","loționata","loționat"],"lotionate":"loționat","lotionatele":"loționat","lotionati":["loționați","loționa","loționați","loționat"],"lotionatii":"loționat","lotionatul":"loționat","lotionau":"loționa","lotioneaza":"loționa","lotionez":"loționa","lotionezi":"loționa","lotisoare":"lotișor","lotisoarele":"lotișor","lotisoarelor":"lotișor","lotisorul":"lotișor","lotisorule":"lotișor","lotisorului":"lotișor","lotiunea":"loțiune","lotiuni":"loțiune","lotiunii":"loțiune","lotiunile":"loțiune","lotiunilor":"loțiune","lotizai":"lotiza","lotizam":["lotizăm","lotiza","lotizam","lotiza"],"lotizand":"lotiza","lotizara":"lotiza","lotizaram":"lotiza","lotizarati":"lotiza","lotizarea":"lotizare","lotizari":"lotizare","lotizarii":"lotizare","lotizarile":"lotizare","lotizarilor":"lotizare","lotizase":"lotiza","lotizasem":"lotiza","lotizasera":"lotiza","lotizaseram":"lotiza","lotizaserati":"lotiza","lotizasesi":"lotiza","lotizasi":"lotiza","lotizat":"lotiza","lotizati":"lotiza","lotizau":"lotiza","lotizeaza":"lotiza","lotizez":"lotiza","lotizezi":"lotiza","lotoane":"loton","lotoanele":"loton","lotoanelor":"loton","lotofagi":"lotofag","lotofagii":"lotofag","lotofagilor":"lotofag","lotofagul":"lotofag","lotofagule":"lotofag","lotofagului":"lotofag","lotonul":"loton","lotonule":"loton","lotonului":"loton","lotoul":"loto","lotoule":"loto","lotoului":"loto","lotouri":"loto","lotourile":"loto","lotourilor":"loto","lotrea":"lotri","lotreai":"lotri","lotream":"lotri","lotreasca":["lotrească","lotresc","lotreasca","lotresc"],"lotreati":"lotri","lotreau":"lotri","lotresc":"lotri","lotrescul":"lotresc","lotreste":"lotri","lotresti":["lotrești","lotresc","lotrești","lotri"],"lotrestii":"lotresc","lotrestile":"lotresc","lotri":"lotru","lotria":"lotrie","lotriei":"lotrie","lotrii":["lotrii","lotri","lotrii","lotrie","lotrii","lotru"],"lotriile":"lotrie","lotriilor":"lotrie","lotrilor":"lotru","lotrim":"lotri","lotrind":"lotri","lotrira":"lotri","lotriram":"lotri","lotrirati":"lotri","lotrise":"lotri","lotrisem":"lotri","lotrisera":"lotri","lotriseram":"lotri","lotriserati":"lotri","lotrisesi":"lotri","lotrisi":"lotri","lotrisori":"lotrișor","lotrisorii":"lotrișor","lotrisorilor":"lotrișor","lotrisorul":"lotrișor","lotrisorule":"lotrișor","lotrisorului":"lotrișor","lotrit":"lotri","lotriti":"lotri","lotrul":"lotru","lotrule":"lotru","lotrului":"lotru","lotrusagul":"lotrușag","lotrusagule":"lotrușag","lotrusagului":"lotrușag","lotrusaguri":"lotrușag","lotrusagurile":"lotrușag","lotrusagurilor":"lotrușag","lotul":"lot","lotule":"lot","lotulete":"lotuleț","lotuletele":"lotuleț","lotuletelor":"lotuleț","lotuletul":"lotuleț","lotuletule":"lotuleț","lotuletului":"lotuleț","lotului":"lot","loturi":"lot","loturile":"lot","loturilor":"lot","lotusi":"lotus","lotusii":"lotus","lotusilor":"lotus","lotusul":"lotus","lotusule":"lotus","lotusului":"lotus","lovea":"lovi","loveai":"lovi","loveam":"lovi","loveati":"lovi","loveau":"lovi","lovele":["lovele","lovea","lovele","loveală"],"lovelei":"loveală","lovelele":"loveală","lovelelor":"loveală","loveli":"loveală","lovesc":"lovi","loveste":"lovi","lovesti":"lovi","lovii":"lovi","lovilutii":"loviluție","lovim":"lovi","lovind":"lovi","lovinesciana":["lovinesciană","lovinescian","lovinesciana","lovinescian"],"lovinescianul":"lovinescian","lovinesciene":"lovinescian","lovinescienele":"lovinescian","lovinescieni":"lovinescian","lovinescienii":"lovinescian","lovira":"lovi","loviram":"lovi","lovirati":"lovi","lovirea":"lovire","loviri":"lovire","lovirii":"lovire","lovirile":"lovire","lovirilor":"lovire","lovise":"lovi","lovisem":"lovi","lovisera":"lovi","loviseram":"lovi","loviserati":"lovi","lovisesi":"lovi","lovisi":"lovi","lovistea":"loviște","lovisti":"loviște","lovistii":"loviște","lovistile":"loviște","lovistilor":"loviște","lovit":"lovi","loviti":"lovi","lovitul":"lovit","lovitule":"lovit","lovitului":"lovit","lovituri":"lovitură","lovituri de colt":"lovitură de colț","lovituri de gratie":"lovitură de grație","lovituri de la 11 metri":"lovitură de la 11 metri","lovituri de pedeapsa":"lovitură de pedeapsă","lovituri de stat":"lovitură de stat","lovituri de teatru":"lovitură de teatru","lovituri de trasnet":"lovitură de trăsnet","lovituri libere":"lovitură liberă","loviturii":"lovitură","loviturile":"lovitură","loviturilor":"lovitură","loviturosi":"lovituros","loviturosii":"lovituros","loviturosilor":"lovituros","loviturosul":"lovituros","loviturosule":"lovituros","loviturosului":"lovituros","loxodrome":"loxodromă","loxodromei":"loxodromă","loxodromele":"loxodromă","loxodromelor":"loxodromă","loxodromia":"loxodromie","loxodromica":["loxodromică","loxodromic","loxodromica","loxodromic"],"loxodromice":"loxodromic","loxodromicele":"loxodromic","loxodromici":"loxodromic","loxodromicii":"loxodromic","loxodromicul":"loxodromic","loxodromiei":"loxodromie","loxodromii":"loxodromie","lozaria":"lozărie","lozariei":"lozărie","lozarii":"lozărie","lozariile":"lozărie","lozariilor":"lozărie","loze":"loză","lozei":"loză","lozele":["lozele","loză","lozele","lozeală"],"lozelei":"lozeală","lozelele":"lozeală","lozelelor":"lozeală","lozeli":"lozeală","lozelor":"loză","lozia":"lozie","loziei":"lozie","lozii":"lozie","loziile":"lozie","loziilor":"lozie","lozinci":"lozincă","lozincii":"lozincă","lozincile":"lozincă","lozincilor":"lozincă","lozioare":"lozioară","lozioarei":"lozioară","lozioarele":"lozioară","lozioarelor":"lozioară","lozisoare":"lozișoară","lozisoarei":"lozișoară","lozisoarele":"lozișoară","lozisoarelor":"lozișoară","lozite":"loziță","lozitei":"loziță","lozitele":"loziță","lozitelor":"loziță","loznite":"lozniță","loznitei":"lozniță","loznitele":"lozniță","loznitelor":"lozniță","lozul":"loz","lozule":"loz","lozului":"loz","lozuri":"loz","lozurile":"loz","lozurilor":"loz","lozute":"lozuță","lozutei":"lozuță","lozutele":"lozuță","lozutelor":"lozuță","lu'":"lui","luabila":["luabilă","luabil","luabila","luabil"],"luabile":"luabil","luabilele":"luabil","luabili":"luabil","luabilii":"luabil","luabilul":"luabil","luai":"lua","luai in seama":"lua în seamă","luai la pula":"lua la pulă","luam":["luăm","lua","luam","lua"],"luam in seama":["luăm în seamă","lua în seamă","luam în seamă","lua în seamă"],"luam la pula":["luăm la pulă","lua la pulă","luam la pulă","lua la pulă"],"luand":"lua","luand in seama":"lua în seamă","luand la pula":"lua la pulă","luara":"lua","luara in seama":"lua în seamă","luara la pula":"lua la pulă","luaram":"lua","luaram in seama":"lua în seamă","luaram la pula":"lua la pulă","luarati":"lua","luarati in seama":"lua în seamă","luarati la pula":"lua la pulă","luarea":"luare","luari":"luare","luarii":"luare","luarile":"luare","luarilor":"luare","luase":"lua","luase in seama":"lua în seamă","luase la pula":"lua la pulă","luasem":"lua","luasem in seama":"lua în seamă","luasem la pula":"lua la pulă","luasera":"lua","luasera in seama":"lua în seamă","luasera la pula":"lua la pulă","luaseram":"lua","luaseram in seama":"lua în seamă","luaseram la pula":"lua la pulă","luaserati":"lua","luaserati in seama":"lua în seamă","luaserati la pula":"lua la pulă","luasesi":"lua","luasesi in seama":"lua în seamă","luasesi la pula":"lua la pulă","luasi":"lua","luasi in seama":"lua în seamă","luasi la pula":"lua la pulă","luat":"lua","luat caimacul":"lua caimacul","luat de bun":"lua de bun","luat de-a gata":"lua de-a gata","luat in consideratie":"lua în considerație","luat in seama":"lua în seamă","luat la pula":"lua la pulă","luat painea de la gura":"lua pâinea de la gură","luat plasa":"lua plasă","luat viata":"lua viața","luat-o din loc":"o lua din loc","luata":["luată","luat","luata","luat"],"luate":"luat","luatele":"luat","luati":["luați","lua","luați","luat"],"luati in seama":"lua în seamă","luati la pula":"lua la pulă","luatii":"luat","luatoare":"luător","luatoarea":"luător","luatoarele":"luător","luatori":"luător","luatorii":"luător","luatorilor":"luător","luatorul":"luător","luatorule":"luător","luatorului":"luător","luatul":"luat","luatule":"luat","luatului":"luat","luaturi":"luat","luaturile":"luat","luaturilor":"luat","luau":"lua","luau in seama":"lua în seamă","luau la pula":"lua la pulă","lube":"lubă","lubei":"lubă","lubele":"lubă","lubelor":"lubă","lubenitaria":"lubenițărie","lubenitariei":"lubenițărie","lubenitarii":"lubenițărie","lubenitariile":"lubenițărie","lubenitariilor":"lubenițărie","lubenite":"lubeniță","lubenitei":"lubeniță","lubenitele":"lubeniță","lubenitelor":"lubeniță","lubiti":"lubiț","lubitii":"lubiț","lubitilor":"lubiț","lubitul":"lubiț","lubitule":"lubiț","lubitului":"lubiț","lubrica":["lubrică","lubric","lubrica","lubric"],"lubricatoare":"lubricator","lubricatoarele":"lubricator","lubricatoarelor":"lubricator","lubricatorul":"lubricator","lubricatorule":"lubricator","lubricatorului":"lubricator","lubrice":"lubric","lubricele":"lubric","lubrici":"lubric","lubricii":"lubric","lubricitatea":"lubricitate","lubricitati":"lubricitate","lubricitatii":"lubricitate","lubricul":"lubric","lubrifiai":"lubrifia","lubrifiam":"lubrifia","lubrifianti":"lubrifiant","lubrifiantii":"lubrifiant","lubrifiantilor":"lubrifiant","lubrifiantul":"lubrifiant","lubrifiantule":"lubrifiant","lubrifiantului":"lubrifiant","lubrifiara":"lubrifia","lubrifiaram":"lubrifia","lubrifiarati":"lubrifia","lubrifiase":"lubrifia","lubrifiasem":"lubrifia","lubrifiasera":"lubrifia","lubrifiaseram":"lubrifia","lubrifiaserati":"lubrifia","lubrifiasesi":"lubrifia","lubrifiasi":"lubrifia","lubrifiat":"lubrifia","lubrifiati":"lubrifia","lubrifiau":"lubrifia","lubrifiaza":"lubrifia","lubrificatia":"lubrificație","lubrificatiei":"lubrificație","lubrificatii":"lubrificație","lubrificatiile":"lubrificație","lubrificatiilor":"lubrificație","lubrificatoare":"lubrificator","lubrificatore":"lubrificator","lubrificatorele":"lubrificator","lubrificatorelor":"lubrificator","lubrificatorul":"lubrificator","lubrificatorule":"lubrificator","lubrificatorului":"lubrificator","lubrifie":"lubrifia","lubrifiem":"lubrifia","lubrifierea":"lubrifiere","lubrifieri":"lubrifiere","lubrifierii":"lubrifiere","lubrifierile":"lubrifiere","lubrifierilor":"lubrifiere","lubrifiez":"lubrifia","lubrifiezi":"lubrifia","lubrifiind":"lubrifia","lucanici":"lucanică","lucanicii":"lucanică","lucanicile":"lucanică","lucanicilor":"lucanică","lucarne":"lucarnă","lucarnei":"lucarnă","lucarnele":"lucarnă","lucarnelor":"lucarnă","lucea":["lucea","luce","lucea","luci"],"luceafarul":"luceafăr","luceafarule":"luceafăr","luceafarului":"luceafăr","luceai":"luci","luceale":"luceală","lucealei":"luceală","luceam":"luci","luceati":"luci","luceau":"luci","luceda":["lucedă","luced","luceda","luced"],"lucede":"luced","lucedele":"luced","lucedul":"luced","luceferei":"luceferel","lucefereii":"luceferel","lucefereilor":"luceferel","luceferelul":"luceferel","luceferelule":"luceferel","luceferelului":"luceferel","luceferi":"luceafăr","luceferii":"luceafăr","luceferilor":"luceafăr","lucernarii":"lucernariu","lucernariii":"lucernariu","lucernariilor":"lucernariu","lucernariuul":"lucernariu","lucernariuule":"lucernariu","lucernariuului":"lucernariu","lucerne":"lucernă","lucernei":"lucernă","lucerniere":"lucernieră","lucernierei":"lucernieră","lucesc":"luci","luceste":"luci","lucesti":"luci","lucezi":"luced","lucezii":"luced","luci":"luce","lucia":"Lucian","lucian":["lucian","Lucia","lucian","Luciana"],"lucianei":"Luciana","lucida":["lucidă","lucid","lucida","lucid"],"lucide":"lucid","lucidele":"lucid","luciditatea":"luciditate","luciditati":"luciditate","luciditatii":"luciditate","luciditatile":"luciditate","luciditatilor":"luciditate","lucidul":"lucid","luciei":"Lucia","lucieturi":"lucietură","lucieturii":"lucietură","lucieturile":"lucietură","lucieturilor":"lucietură","luciferiana":["luciferiană","luciferian","luciferiana","luciferian"],"luciferianul":"luciferian","luciferica":["luciferică","luciferic","luciferica","luciferic"],"luciferice":"luciferic","lucifericele":"luciferic","luciferici":"luciferic","lucifericii":"luciferic","lucifericul":"luciferic","luciferiene":"luciferian","luciferienele":"luciferian","luciferieni":"luciferian","luciferienii":"luciferian","luciferine":"luciferină","luciferinei":"luciferină","luciferinele":"luciferină","luciferinelor":"luciferină","luciferismul":"luciferism","luciferismule":"luciferism","luciferismului":"luciferism","lucifoba":["lucifobă","lucifob","lucifoba","lucifob"],"lucifobe":"lucifob","lucifobele":"lucifob","lucifobi":"lucifob","lucifobii":"lucifob","lucifobul":"lucifob","lucifuga":["lucifugă","lucifug","lucifuga","lucifug"],"lucifuge":"lucifug","lucifugele":"lucifug","lucifugi":"lucifug","lucifugii":"lucifug","lucifugul":"lucifug","lucii":["lucii","luce","lucii","luci"],"lucile":"luce","lucilor":"luce","lucim":"luci","lucimea":"lucime","lucimi":"lucime","lucimii":"lucime","lucimile":"lucime","lucimilor":"lucime","lucind":"luci","lucinda":["lucindă","lucind","lucinda","lucind"],"lucinde":"lucind","lucindele":"lucind","lucindul":"lucind","lucinzi":"lucind","lucinzii":"lucind","lucioasa":["lucioasă","lucios","lucioasa","lucios"],"lucioase":"lucios","lucioasele":"lucios","luciole":"luciolă","luciolei":"luciolă","luciolele":"luciolă","luciolelor":"luciolă","luciora":["lucioră","lucior","luciora","lucior"],"luciore":"lucior","luciorele":"lucior","luciori":"lucior","luciorii":"lucior","luciorul":"lucior","luciosi":"lucios","luciosia":"lucioșie","luciosiei":"lucioșie","luciosii":["lucioșii","lucios","lucioșii","lucioșie"],"luciosiile":"lucioșie","luciosiilor":"lucioșie","luciosul":"lucios","lucira":"luci","luciram":"luci","lucirati":"luci","lucirea":"lucire","luciri":"lucire","lucirii":"lucire","lucirile":"lucire","lucirilor":"lucire","lucise":"luci","lucisem":"luci","lucisera":"luci","luciseram":"luci","luciserati":"luci","lucisesi":"luci","lucisi":"luci","lucisora":["lucișoră","lucișor","lucișora","lucișor"],"lucisore":"lucișor","lucisorele":"lucișor","lucisori":"lucișor","lucisorii":"lucișor","lucisorul":"lucișor","lucit":"luci","luciti":"luci","lucitoare":"lucitor","lucitoarea":"lucitor","lucitoarele":"lucitor","lucitori":"lucitor","lucitorii":"lucitor","lucitorul":"lucitor","luciul":"luciu","luciule":"luciu","luciului":"luciu","luciuri":"luciu","luciurile":"luciu","luciurilor":"luciu","lucizi":"lucid","lucizii":"lucid","lucoarea":"lucoare","lucori":"lucoare","lucorii":"lucoare","lucorile":"lucoare","lucorilor":"lucoare","lucrabilitatea":"lucrabilitate","lucrabilitati":"lucrabilitate","lucrabilitatii":"lucrabilitate","lucrai":"lucra","lucram":["lucrăm","lucra","lucram","lucra"],"lucrand":"lucra","lucrara":"lucra","lucraram":"lucra","lucrarati":"lucra","lucrarea":"lucrare","lucrari":"lucrare","lucrari de referinta":"lucrare de referință","lucrarii":"lucrare","lucrarile":"lucrare","lucrarilor":"lucrare","lucrase":"lucra","lucrasem":"lucra","lucrasera":"lucra","lucraseram":"lucra","lucraserati":"lucra","lucrasesi":"lucra","lucrasi":["lucrași","lucra","lucrași","lucraș"],"lucrasii":"lucraș","lucrasilor":"lucraș","lucrasul":"lucraș","lucrasule":"lucraș","lucrasului":"lucraș","lucrat":"lucra","lucrata":["lucrată","lucrat","lucrata","lucrat"],"lucrate":"lucrat","lucratela":["lucrățelă","lucrățel","lucrățela","lucrățel"],"lucratele":["lucratele","lucrat","lucrățele","lucrățel"],"lucratelele":"lucrățel","lucrateli":"lucrățel","lucratelii":"lucrățel","lucratelul":"lucrățel","lucrati":["lucrați","lucra","lucrați","lucrat"],"lucratii":"lucrat","lucrativa":["lucrativă","lucrativ","lucrativa","lucrativ"],"lucrative":"lucrativ","lucrativele":"lucrativ","lucrativi":"lucrativ","lucrativii":"lucrativ","lucrativul":"lucrativ","lucratoare":"lucrător","lucratoarea":["lucrătoarea","lucrătoare","lucrătoarea","lucrător"],"lucratoarei":"lucrătoare","lucratoarele":["lucrătoarele","lucrătoare","lucrătoarele","lucrător"],"lucratoarelor":"lucrătoare","lucratori":"lucrător","lucratoria":"lucrătorie","lucratoriei":"lucrătorie","lucratorii":["lucrătorii","lucrător","lucrătorii","lucrătorie"],"lucratoriile":"lucrătorie","lucratoriilor":"lucrătorie","lucratorilor":"lucrător","lucratorul":"lucrător","lucratorule":"lucrător","lucratorului":"lucrător","lucratul":"lucrat","lucraturi":"lucrătură","lucraturii":"lucrătură","lucraturile":"lucrătură","lucraturilor":"lucrătură","lucrau":"lucra","lucreaza":"lucra","lucrez":"lucra","lucrezi":"lucra","lucrisoare":"lucrișor","lucrisoarele":"lucrișor","lucrisoarelor":"lucrișor","lucrisorul":"lucrișor","lucrisorule":"lucrișor","lucrisorului":"lucrișor","lucrul":"lucru","lucrule":"lucru","lucruletul":"lucruleț","lucruletule":"lucruleț","lucruletului":"lucruleț","lucrului":"lucru","lucruri":"lucru","lucrurile":"lucru","lucrurilor":"lucru","lucrusoare":"lucrușor","lucrusoarele":"lucrușor","lucrusoarelor":"lucrușor","lucrusorul":"lucrușor","lucrusorule":"lucrușor","lucrusorului":"lucrușor","lucrutul":"lucruț","lucrutule":"lucruț","lucrutului":"lucruț","lucsi":"lux","lucsii":"lux","lucsilor":"lux","luctuoasa":["luctuoasă","luctuos","luctuoasa","luctuos"],"luctuoase":"luctuos","luctuoasele":"luctuos","luctuosi":"luctuos","luctuosii":"luctuos","luctuosul":"luctuos","luddisme":"luddism","luddismele":"luddism","luddismelor":"luddism","luddismul":"luddism","luddismule":"luddism","luddismului":"luddism","luddite":"luddită","ludditei":"luddită","ludditele":"luddită","ludditelor":"luddită","ludditi":"luddit","ludditii":"luddit","ludditilor":"luddit","ludditul":"luddit","ludditule":"luddit","ludditului":"luddit","ludeul":"lude","ludeule":"lude","ludeului":"lude","ludica":["ludică","ludic","ludica","ludic"],"ludice":"ludic","ludicele":"ludic","ludici":"ludic","ludicii":"ludic","ludicul":"ludic","ludisora":["ludișoră","ludișor","ludișora","ludișor"],"ludisore":"ludișor","ludisorele":"ludișor","ludisori":"ludișor","ludisorii":"ludișor","ludisorul":"ludișor","ludoteci":"ludotecă","ludotecii":"ludotecă","ludotecile":"ludotecă","ludotecilor":"ludotecă","ludovici":"ludovic","ludovicii":"ludovic","ludovicilor":"ludovic","ludovicul":"ludovic","ludovicule":"ludovic","ludovicului":"ludovic","luesul":"lues","luesule":"lues","luesului":"lues","luete":"luetă","luetei":"luetă","luetele":"luetă","luetelor":"luetă","luetice":"luetică","lueticei":"luetică","lueticele":"luetică","lueticelor":"luetică","luetici":"luetic","lueticii":"luetic","lueticilor":"luetic","lueticul":"luetic","lueticule":"luetic","lueticului":"luetic","lufari":"lufar","lufarii":"lufar","lufarilor":"lufar","lufarul":"lufar","lufarule":"lufar","lufarului":"lufar","lufe":"lufă","lufei":"lufă","lufele":"lufă","lufelor":"lufă","lugojeanul":"lugojean","lugojeanule":"lugojean","lugojeanului":"lugojean","lugojence":"lugojeancă","lugojencei":"lugojeancă","lugojencele":"lugojeancă","lugojencelor":"lugojeancă","lugojene":"lugojeană","lugojenei":"lugojeană","lugojenele":"lugojeană","lugojenelor":"lugojeană","lugojeni":"lugojean","lugojenii":"lugojean","lugojenilor":"lugojean","lugojul":"Lugoj","lugojule":"Lugoj","lugojului":"Lugoj","lugolul":"lugol","lugolule":"lugol","lugolului":"lugol","lugubra":["lugubră","lugubru","lugubra","lugubru"],"lugubre":"lugubru","lugubrele":"lugubru","lugubri":"lugubru","lugubrii":"lugubru","lugubrul":"lugubru","luharul":"luhăr","luharule":"luhăr","luharului":"luhăr","luheristea":"luheriște","luheristi":"luheriște","luheristii":"luheriște","luheristile":"luheriște","luheristilor":"luheriște","lui":"el","lui baba":"Babă","lui babalac":"Babalâc","lui babalau":"Băbălău","lui babalic":"Babalîc","lui baban":["lui baban","Baban","lui băban","Băban"],"lui babatie":"Băbătie","lui babciuc":"Babciuc","lui babeanu":"Băbeanu","lui babencu":"Babencu","lui babescu":["lui babescu","Babescu","lui băbescu","Băbescu"],"lui babinciuc":"Babinciuc","lui babiuc":"Babiuc","lui babliuc":"Babliuc","lui baboiu":"Baboiu","lui babtan":["lui babțan","Babțan","lui băbțan","Băbțan"],"lui babus":"Băbuș","lui babusca":["lui babușcă","Babușcă","lui băbușcă","Băbușcă"],"lui babuta":"Băbuță","lui babutan":"Băbuțan","lui bacaintan":"Băcăințan","lui bacal":"Bacal","lui bacaloglu":"Bacaloglu","lui bacalu":"Bacalu","lui bacan":"Băcan","lui bacanita":"Băcăniță","lui bacanoiu":"Băcănoiu","lui bacanu":"Băcanu","lui bacanus":"Băcănuș","lui bacaoanu":"Băcăoanu","lui bacauanu":"Băcăuanu","lui baceanu":"Băceanu","lui bacila":"Băcilă","lui baciucu":"Băciucu","lui baciulescu":"Băciulescu","lui baconschi":"Baconschi","lui bacsis":"Bacșiș","lui badan":"Bădan","lui badanoiu":"Bădănoiu","lui badaran":"Bădăran","lui badescu":"Bădescu","lui badet":"Bădeț","lui badica":"Bădică","lui badican":"Bădican","lui badiceanu":"Bădiceanu","lui badicescu":"Bădicescu","lui badicioiu":"Bădicioiu","lui badicut":"Bădicuț","lui badilas":"Bădilaș","lui badilescu":"Bădilescu","lui badilica":"Bădilică","lui badilita":"Bădiliță","lui badinescu":"Bădinescu","lui badita":["lui badiță","Badiță","lui bădiță","Bădiță"],"lui baditeanu":"Bădițeanu","lui baditescu":"Bădițescu","lui baditoiu":"Bădițoiu","lui badiu":"Badiu","lui badoaia":"Bădoaia","lui badoi":"Bădoi","lui baducu":"Băducu","lui badulescu":"Bădulescu","lui baes":"Băeș","lui bagdasar":"Bagdasar","lui bagescu":"Băgescu","lui baghiut":"Băghiuț","lui bahacencu":"Bahacencu","lui bahneanu":"Băhneanu","lui bahrencu":"Bahrencu","lui baiaram":"Baiaram","lui baiatu":"Băiatu","lui baibarac":"Baibarac","lui baican":"Baican","lui baicanescu":"Băicănescu","lui baico":"Baico","lui baicoeanu":"Băicoeanu","lui baicoianu":"Băicoianu","lui baicu":"Baicu","lui baiculescu":"Băiculescu","lui baicus":"Băicuș","lui baies":"Băieș","lui baiescu":"Baiescu","lui baiesiu":"Băieșiu","lui baiesu":"Băieșu","lui baietan":"Băietan","lui baietica":"Băiețică","lui baietu":"Băietu","lui bailescu":"Băilescu","lui bailesteanu":"Băileșteanu","lui baintan":"Băințan","lui baisan":"Băisan","lui baisoiu":"Băișoiu","lui baita":"Băiță","lui baitan":"Băițan","lui baiulescu":["lui baiulescu","Baiulescu","lui băiulescu","Băiulescu"],"lui baiuta":"Băiuță","lui bajanica":"Băjănică","lui bajenariu":"Băjenariu","lui bajenaru":"Băjenaru","lui bajenescu":"Băjenescu","lui bajescu":"Băjescu","lui bajureanu":"Bajureanu","lui balabanciuc":"Balabanciuc","lui balabaneanu":"Bălăbăneanu","lui balabanescu":"Bălăbănescu","lui balacescu":"Bălăcescu","lui balai":"Bălai","lui balaj":["lui balaj","Balaj","lui bălaj","Bălaj"],"lui balalau":"Bălălău","lui balan":"Bălan","lui balanel":"Bălănel","lui balanescu":"Bălănescu","lui balanica":"Bălănică","lui balaniuc":"Bălăniuc","lui balanoiu":"Bălănoiu","lui balanuca":"Bălănucă","lui balanuta":"Bălănuță","lui balarie":"Bălărie","lui balaseanu":"Bălășeanu","lui balasescu":"Bălășescu","lui balasete":"Bălășete","lui balasoiu":"Bălășoiu","lui balauntescu":"Bălăunțescu","lui balaur":"Balaur","lui balauru":"Balauru","lui balcescu":"Bălcescu","lui baldovinescu":"Baldovinescu","lui baleanu":"Băleanu","lui balega":"Balegă","lui balescu":"Bălescu","lui balgradean":"Bălgrădean","lui baliga":"Baliga","lui balineanu":"Bălineanu","lui balinisteanu":"Bălinișteanu","lui balint":"Balint","lui balintescu":["lui balintescu","Balintescu","lui bălintescu","Bălintescu"],"lui balita":"Balița","lui balmos":"Balmoș","lui baloescu":"Băloescu","lui balomirean":"Balomirean","lui balomireanu":"Balomireanu","lui balos":"Bălos","lui balosu":"Bălosu","lui baloteanu":"Baloteanu","lui balotescu":"Balotescu","lui balsan":"Bălșan","lui balsanu":"Bălșanu","lui balseanu":"Bălșeanu","lui balta":"Baltă","lui baltac":"Baltac","lui baltag":"Baltag","lui baltat":"Bălțat","lui baltateanu":["lui bălțăteanu","Bălțăteanu","lui bălțățeanu","Bălțățeanu"],"lui baltatoiu":"Bălțătoiu","lui baltatu":["lui balțatu","Balțatu","lui bălțatu","Bălțatu"],"lui baltean":"Băltean","lui balteanu":"Bălteanu","lui baltescu":"Băltescu","lui baltita":"Băltiță","lui balu":"Bălu","lui balusescu":"Bălușescu","lui balut":"Băluț","lui balutescu":"Băluțescu","lui balutoiu":"Băluțoiu","lui bambache":"Bambache","lui ban":"Ban","lui banarescu":"Bănărescu","lui banatan":"Bănățan","lui banatean":"Bănățean","lui banateanu":"Bănățeanu","lui banceanu":"Bănceanu","lui bancescu":"Băncescu","lui bancila":"Băncilă","lui bancioiu":"Băncioiu","lui banciu":"Banciu","lui banciuca":"Bănciucă","lui banciulescu":"Bănciulescu","lui bancota":"Bancotă","lui bancuta":"Băncuță","lui bandean":"Băndean","lui bandica":"Băndică","lui bandoiu":"Bandoiu","lui bandrabur":"Bandrabur","lui banescu":"Bănescu","lui banica":"Bănică","lui baniceru":"Băniceru","lui banicescu":"Bănicescu","lui banicioiu":"Bănicioiu","lui banila":"Bănilă","lui banisteanu":"Bănișteanu","lui banita":"Baniță","lui banta":"Banta","lui banucu":"Bănucu","lui banulescu":"Bănulescu","lui banus":["lui banuș","Banuș","lui bănuș","Bănuș"],"lui banut":"Bănuț","lui banutoiu":"Bănuțoiu","lui barabas":["lui barabas","Barabas","lui barabaș","Barabaș"],"lui barabula":"Barabulă","lui baraca":"Baracă","lui baraganescu":"Bărăgănescu","lui baranescu":"Bărănescu","lui baranga":["lui baranga","Baranga","lui barangă","Barangă"],"lui barba":"Barbă","lui barbacaru":"Bărbăcaru","lui barbacioru":"Bărbăcioru","lui barbalata":"Barbălată","lui barbaneagra":"Barbăneagră","lui barbarasa":"Barbărasă","lui barbarie":"Bărbărie","lui barbarosa":"Barbăroșă","lui barbarosie":"Barbăroșie","lui barbascumpa":"Barbăscumpă","lui barbasura":"Barbăsură","lui barbatu":"Bărbatu","lui barbeli":"Barbeli","lui barberis":"Barberis","lui barbescu":["lui barbescu","Barbescu","lui bărbescu","Bărbescu"],"lui barbete":"Barbete","lui barbieriu":"Bărbieriu","lui barbieru":"Bărbieru","lui barbita":"Bărbiță","lui barboni":"Barboni","lui barborica":"Bârborică","lui barbos":"Bărbos","lui barbosanu":"Barboșanu","lui barbucenescu":"Bărbucenescu","lui barbulea":"Barbulea","lui barbuleanu":"Bărbuleanu","lui barbulescu":"Bărbulescu","lui barbulet":"Bărbuleț","lui barbulete":"Bărbulete","lui barbuneanu":"Bărbuneanu","lui barbura":"Barbură","lui barbus":"Bărbuș","lui barbusica":"Bărbușică","lui barbusoiu":"Bărbușoiu","lui barbut":["lui barbut","Barbut","lui barbuț","Barbuț","lui bărbuț","Bărbuț"],"lui barbuta":"Bărbuță","lui barbutoiu":"Bărbuțoiu","lui barcanescu":"Bărcănescu","lui barcaoanu":"Bărcăoanu","lui barcauan":"Bărcăuan","lui barcoanu":"Bărcoanu","lui barcuteanu":"Bărcuțeanu","lui barda":"Bardă","lui bardac":"Bardac","lui bardanica":"Bărdănică","lui bardeanu":"Bărdeanu","lui bardita":"Bărdiță","lui bareanu":"Băreanu","lui bargaoanu":["lui bârgăoanu","Bârgăoanu","lui bărgăoanu","Bărgăoanu"],"lui bargauan":"Bârgăuan","lui bargauanu":["lui bârgăuanu","Bârgăuanu","lui bărgăuanu","Bărgăuanu"],"lui barladeanu":"Bârlădeanu","lui barladianu":"Bârlădianu","lui barlescu":"Bârlescu","lui barlog":"Bârlog","lui barna":["lui barna","Barna","lui bârnă","Bârnă"],"lui barnoi":"Bărnoi","lui barnoiu":["lui bârnoiu","Bârnoiu","lui bărnoiu","Bărnoiu"],"lui barnut":"Bărnuț","lui baronescu":"Baronescu","lui barosan":"Barosan","lui barosu":"Barosu","lui barsanescu":"Bârsănescu","lui barsasteanu":"Bârsășteanu","lui barsescu":"Bârsescu","lui bartolomei":"Bartolomei","lui bartolomeu":"Bartolomeu","lui barza":"Barză","lui barzescu":"Bârzescu","lui barzila":"Bârzilă","lui barzoi":"Bărzoi","lui basamac":"Basamac","lui basarabeanu":"Basarabeanu","lui basarabescu":"Basarabescu","lui basasteanu":"Băsășteanu","lui basceanu":"Băsceanu","lui bascoveanu":"Bascoveanu","lui basgan":"Basgan","lui basica":"Bășică","lui basiliade":"Basiliade","lui basoiu":"Bășoiu","lui bastan":"Baștan","lui bastina":"Baștină","lui baston":"Baston","lui basturescu":"Bașturescu","lui bata":"Bâtă","lui batacui":"Bătăcui","lui bataiosu":"Bătăiosu","lui batalu":"Batalu","lui batanoiu":"Bătănoiu","lui batariuc":"Batariuc","lui bataus":"Bătăuș","lui batausu":"Bătăușu","lui batica":"Bătică","lui batineanu":"Bătineanu","lui batista":"Batistă","lui batlan":"Bâtlan","lui batoc":"Batoc","lui batran":"Bătrân","lui batranu":"Bătrânu","lui batranut":"Bătrânuț","lui batrin":"Bătrîn","lui batrina":"Bătrîna","lui batrineanu":"Bătrîneanu","lui batrinescu":"Bătrînescu","lui batrinica":"Bătrînică","lui batrinu":"Bătrînu","lui batrinut":"Bătrînuț","lui batutu":"Bătutu","lui bautoru":"Băutoru","lui bazdac":"Bâzdâc","lui bazgan":"Bazgan","lui bazilescu":"Bazilescu","lui baziliuc":"Baziliuc","lui bebeselea":"Bebeșelea","lui becerescu":"Becerescu","lui becescu":"Becescu","lui becheanu":"Becheanu","lui becher":"Becher","lui becherescu":"Becherescu","lui becheriu":"Becheriu","lui becheru":"Becheru","lui bechet":"Bechet","lui becsenescu":"Becșenescu","lui beculescu":"Beculescu","lui becut":"Becuț","lui bediteanu":"Bedițeanu","lui bedreag":"Bedreag","lui began":"Began","lui beiusan":"Beiușan","lui beiusanu":"Beiușanu","lui bejenescu":"Bejenescu","lui belacurencu":"Belacurencu","lui belcescu":"Belcescu","lui beldan":"Beldan","lui beldescu":"Beldescu","lui beldie":"Beldie","lui beldimanescu":"Beldimănescu","lui beleaga":"Beleagă","lui belecciu":"Belecciu","lui beleuzu":"Beleuzu","lui beliga":"Beliga","lui beligan":"Beligan","lui belindescu":"Belindescu","lui bellu":"Bellu","lui belodedici":"Belodedici","lui belulescu":"Belulescu","lui benchescu":"Benchescu","lui bender":"Bender","lui bendescu":"Bendescu","lui benedek":"Benedek","lui benescu":"Benescu","lui bengescu":"Bengescu","lui bengulescu":"Bengulescu","lui beniamin":"Beniamin","lui beniuc":"Beniuc","lui bentoiu":"Bentoiu","lui berar":"Berar","lui berariu":"Berariu","lui beraru":"Beraru","lui berbecar":"Berbecar","lui berbecariu":"Berbecariu","lui berbecaru":"Berbecaru","lui berbecas":"Berbecaș","lui berbece":"Berbece","lui berbecel":"Berbecel","lui berbecut":"Berbecuț","lui berbeniciuc":"Berbeniciuc","lui berbescu":"Berbescu","lui bercescu":"Bercescu","lui berchesan":"Berchesan","lui bercut":"Bercuț","lui berdila":"Berdilă","lui beregheanu":"Beregheanu","lui berescu":"Berescu","lui beresescu":"Bereșescu","lui beresteanu":"Bereșteanu","lui berestieanu":"Bereștieanu","lui berevoescu":"Berevoescu","lui berezovschi":"Berezovschi","lui berian":"Berian","lui berindei":"Berindei","lui beristeanu":"Berișteanu","lui berlescu":"Berlescu","lui berneanu":"Berneanu","lui bernescu":"Bernescu","lui bertalan":"Bertalan","lui bertescu":"Bertescu","lui bertesteanu":"Berteșteanu","lui berzan":"Berzan","lui berzescu":"Berzescu","lui berzuntanu":"Berzunțanu","lui berzunteanu":"Berzunțeanu","lui besica":"Beșică","lui besleaga":["lui beșleaga","Beșleaga","lui beșleagă","Beșleagă"],"lui besliu":"Beșliu","lui beteag":"Beteag","lui beteagu":"Beteagu","lui betivoiu":"Bețivoiu","lui betivu":"Bețivu","lui beutura":"Beutură","lui bezdedeanu":"Bezdedeanu","lui bezman":"Bezman","lui bezna":"Beznă","lui bibescu":"Bibescu","lui bibicescu":"Bibicescu","lui bibicu":"Bibicu","lui bibilica":"Bibilică","lui bican":"Bican","lui bicescu":"Bicescu","lui bichigean":"Bichigean","lui bichigeanu":"Bichigeanu","lui bicoiu":"Bicoiu","lui biculescu":"Biculescu","lui bicut":"Bicuț","lui bidiviu":"Bidiviu","lui bidulescu":"Bidulescu","lui bigan":"Bigan","lui bihoreanu":"Bihoreanu","lui bila":"Bilă","lui bildescu":"Bîldescu","lui bilegan":"Bilegan","lui bilencu":"Bilencu","lui bilt":"Bilț","lui biltanescu":"Bîltănescu","lui bilteanu":"Bîlteanu","lui bilvanescu":"Bîlvănescu","lui binisor":"Binișor","lui biolan":"Biolan","lui birau":"Birău","lui biraut":"Birăuț","lui birceanu":"Birceanu","lui birgaoanu":"Bîrgăoanu","lui birgauan":"Bîrgăuan","lui birgauanu":"Bîrgăuanu","lui birgoan":"Bîrgoan","lui birgoanu":"Bîrgoanu","lui birjaru":"Birjaru","lui birjoveanu":"Bîrjoveanu","lui birladeanu":"Bîrlădeanu","lui birleanu":"Bîrleanu","lui birlescu":"Bîrlescu","lui birlete":"Bîrlete","lui birlodeanu":"Bîrlodeanu","lui birlog":"Bîrlog","lui birlogeanu":"Bîrlogeanu","lui birloiu":"Bîrloiu","lui birnicu":"Birnicu","lui birnoveanu":"Bîrnoveanu","lui birsanescu":"Bîrsănescu","lui birsasteanu":"Bîrsășteanu","lui birt":"Birt","lui birtan":"Birtan","lui birtaru":"Birtaru","lui birtas":"Birtaș","lui birzescu":"Bîrzescu","lui birzila":"Bîrzilă","lui biscoveanu":"Bîscoveanu","lui bisoceanu":"Bisoceanu","lui bistreanu":"Bistreanu","lui bistriceanu":"Bistriceanu","lui bistritan":"Bistrițan","lui bistritean":"Bistrițean","lui bistriteanu":"Bistrițeanu","lui bita":"Bîtă","lui bitan":"Bițan","lui bitanescu":"Bitănescu","lui bitang":"Bitang","lui bitica":"Bițică","lui bitlan":"Bîtlan","lui bitoiu":"Bițoiu","lui bitoleanu":"Bitoleanu","lui bivol":"Bivol","lui bivolan":"Bivolan","lui bivolariu":"Bivolariu","lui bivolaru":"Bivolaru","lui bivolu":"Bivolu","lui bizdic":"Bîzdîc","lui bizdoaca":"Bîzdoacă","lui blagaila":"Blăgăilă","lui blagescu":"Blăgescu","lui blagut":"Blăguț","lui blajin":"Blajin","lui blana":"Blană","lui blanariu":"Blănariu","lui blanaru":"Blănaru","lui blandu":"Blându","lui blanita":"Blăniță","lui bleanda":"Bleandă","lui blegescu":"Blegescu","lui blid":"Blid","lui blidar":"Blidar","lui blidariu":"Blidariu","lui blindu":"Blîndu","lui blujdescu":"Blujdescu","lui boaba":"Boabă","lui boamba":"Boambă","lui boanca":"Boancă","lui boanghina":"Boanghină","lui boar":"Boar","lui boariu":"Boariu","lui boaru":"Boaru","lui boata":"Boată","lui bob":"Bob","lui bobar":"Bobar","lui bobariu":"Bobariu","lui bobarnac":"Bobârnac","lui bobaru":"Bobaru","lui bobe":"Bobe","lui bobeica":["lui bobeica","Bobeica","lui bobeică","Bobeică"],"lui bobescu":"Bobescu","lui bobicescu":"Bobicescu","lui bobina":"Bobină","lui bobirnac":"Bobîrnac","lui bobisteanu":"Bobișteanu","lui bobocel":"Bobocel","lui bobocescu":"Bobocescu","lui bobotan":"Bobotan","lui bobulescu":"Bobulescu","lui bobulisteanu":"Bobulișteanu","lui bocaneala":"Bocăneală","lui bocoiu":"Bocoiu","lui bodaproste":"Bodaproste","lui bodeanu":"Bodeanu","lui bodescu":"Bodescu","lui bodestean":"Bodeștean","lui bodesteanu":"Bodeșteanu","lui bodinescu":"Bodinescu","lui bodisteanu":"Bodișteanu","lui bodnar":"Bodnar","lui bodnaras":"Bodnăraș","lui bodnarescu":"Bodnărescu","lui bodnariu":"Bodnariu","lui bodnariuc":"Bodnariuc","lui bodnaru":"Bodnaru","lui bodocan":"Bodocan","lui bodoiu":"Bodoiu","lui bodolan":"Bodolan","lui boer":"Boer","lui boerescu":"Boerescu","lui boeriu":"Boeriu","lui boeru":"Boeru","lui boganescu":"Bogănescu","lui bogat":"Bogat","lui bogatan":"Bogătan","lui bogateanu":"Bogățeanu","lui bogatoiu":"Bogătoiu","lui bogatu":"Bogatu","lui bogdan":"Bogdan","lui bogdanas":"Bogdănaș","lui bogdanel":"Bogdănel","lui bogdanescu":"Bogdănescu","lui bogdanoiu":"Bogdănoiu","lui boghina":"Boghină","lui boguleanu":"Boguleanu","lui bogzeanu":"Bogzeanu","lui boholtan":"Boholțan","lui boholteanu":"Boholțeanu","lui bohotineanu":"Bohotineanu","lui boiangiu":"Boiangiu","lui boicescu":"Boicescu","lui boiciuc":"Boiciuc","lui boier":"Boier","lui boieras":"Boieraș","lui boieriu":"Boieriu","lui boieru":"Boieru","lui boingeanu":"Boingeanu","lui boisorean":"Boișorean","lui boisoreanu":"Boișoreanu","lui boisteanu":"Boișteanu","lui boitan":"Boițan","lui boiteanu":"Boițeanu","lui boitor":"Boitor","lui bojenescu":"Bojenescu","lui bojneag":"Bojneag","lui bolboceanu":"Bolboceanu","lui bolboros":"Bolboros","lui bolbosescu":"Bolboșescu","lui boldan":"Boldan","lui boldescu":"Boldescu","lui boldijar":"Boldijar","lui boldisor":"Boldișor","lui boldisteanu":"Boldișteanu","lui boldurescu":"Boldurescu","lui boleac":"Boleac","lui bolintineanu":"Bolintineanu","lui bolintinescu":"Bolintinescu","lui bolnavu":"Bolnavu","lui bolocan":"Bolocan","lui bologan":"Bologan","lui bologheanu":"Bologheanu","lui bolohan":"Bolohan","lui bolovan":"Bolovan","lui bolozan":"Bolozan","lui boltasu":"Boltașu","lui bolundut":"Bolunduț","lui boncescu":"Boncescu","lui boncota":"Boncotă","lui bondar":"Bondar","lui bondarencu":"Bondarencu","lui bondaret":"Bondăreț","lui bondariu":"Bondariu","lui bondoc":"Bondoc","lui bondreanu":"Bondreanu","lui bondrila":"Bondrilă","lui bone":"Bone","lui bontidean":"Bonțidean","lui bontideanu":"Bonțideanu","lui bontu":"Bontu","lui boranescu":"Borănescu","lui borangic":"Borangic","lui borascu":"Borăscu","lui boratu":"Borâtu","lui borbil":"Borbil","lui borcan":"Borcan","lui borcanas":"Borcănaș","lui borcanescu":"Borcănescu","lui borcescu":"Borcescu","lui borcila":"Borcilă","lui borcutean":"Borcuțean","lui bordean":"Bordean","lui bordei":"Bordei","lui bordeianu":"Bordeianu","lui bordeias":"Bordeiaș","lui bordeiasu":"Bordeiașu","lui bordeiu":"Bordeiu","lui bordescu":"Bordescu","lui bordica":"Bordică","lui bordoiu":"Bordoiu","lui borhidan":"Borhidan","lui borhot":"Borhot","lui boriceanu":"Boriceanu","lui borisov":"Borisov","lui borlovan":"Borlovan","lui borloveanu":"Borloveanu","lui boroghina":"Boroghină","lui boroianu":"Boroianu","lui boroleanu":"Boroleanu","lui boros":"Boroș","lui borosan":"Boroșan","lui borosianu":"Boroșianu","lui borosoiu":"Boroșoiu","lui borosteanu":"Boroșteanu","lui borsan":"Borșan","lui borsanu":"Borșanu","lui borta":["lui borta","Borta","lui bortă","Bortă"],"lui bortan":"Bortan","lui bortas":"Bortaș","lui bortica":"Bortică","lui bortosu":"Borțosu","lui boruga":["lui boruga","Boruga","lui borugă","Borugă"],"lui borzescu":"Borzescu","lui boscencu":"Boscencu","lui bosinceanu":"Bosînceanu","lui bosnegeanu":"Boșnegeanu","lui bosoiu":"Bosoiu","lui bostan":"Bostan","lui bostanaru":"Bostănaru","lui bostangiu":"Bostangiu","lui bostina":"Boștină","lui bostinaru":"Boștinaru","lui bosuioc":"Bosuioc","lui bot":"Bot","lui botar":"Botar","lui botaru":"Botaru","lui botescu":["lui botescu","Botescu","lui boțescu","Boțescu"],"lui botesteanu":"Boteșteanu","lui botezan":"Botezan","lui botezat":"Botezat","lui botezatu":"Botezatu","lui botgros":"Botgros","lui botila":"Boțilă","lui botinestean":["lui botineștean","Botineștean","lui botîneștean","Botîneștean"],"lui botinesteanu":"Botineșteanu","lui botorog":"Botorog","lui botosan":"Botoșan","lui botosaneanu":"Botoșăneanu","lui botosineanu":"Botoșineanu","lui botosneanu":"Botoșneanu","lui bou":"Bou","lui bouariu":"Bouariu","lui bouaru":"Bouaru","lui boulean":"Boulean","lui bouleanu":"Bouleanu","lui boulescu":"Boulescu","lui bounegru":"Bounegru","lui bour":"Bour","lui bourel":"Bourel","lui bourosu":"Bouroșu","lui bouru":"Bouru","lui bouruc":"Bouruc","lui boutu":"Bouțu","lui bozdogescu":"Bozdogescu","lui bozgan":"Bozgan","lui bracacescu":"Brăcăcescu","lui bracaciu":"Bracaciu","lui bradan":"Bradan","lui bradatan":"Brădățan","lui bradean":"Brădean","lui bradescu":"Brădescu","lui bradis":"Brădiș","lui bradisteanu":"Brădișteanu","lui braete":"Brăete","lui braga":["lui braga","Braga","lui bragă","Bragă"],"lui bragadireanu":"Bragadireanu","lui bragagiu":"Bragagiu","lui bragan":"Brăgan","lui braghina":"Braghină","lui braila":"Brăilă","lui brailean":"Brăilean","lui braileanu":"Brăileanu","lui brailescu":"Brăilescu","lui brailoiu":"Brăiloiu","lui braisteanu":"Brăișteanu","lui brandus":"Brânduș","lui brandusa":"Brândușă","lui brandusel":"Brândușel","lui brandusescu":"Brândușescu","lui brandusoiu":"Brândușoiu","lui braneanu":"Brăneanu","lui branescu":["lui branescu","Branescu","lui brănescu","Brănescu"],"lui braniscan":"Brănișcan","lui branisteanu":"Brănișteanu","lui branoaia":"Brănoaia","lui branoiu":"Brănoiu","lui branza":"Brânză","lui branzaru":"Brânzaru","lui branzas":"Brânzaș","lui branzila":"Brânzilă","lui branzoaica":"Brânzoaică","lui branzoi":"Brânzoi","lui brasla":"Braslă","lui brasoava":"Brașoavă","lui brasovan":"Brașovan","lui brasovean":"Brașovean","lui brasoveanu":"Brașoveanu","lui brasovianu":"Brașovianu","lui bratasanu":"Brătășanu","lui bratescu":"Brătescu","lui bratfalean":"Brătfălean","lui bratianu":"Brătianu","lui bratila":"Brătilă","lui bratiloveanu":"Bratiloveanu","lui bratoiu":"Brătoiu","lui bratucu":"Brătucu","lui bratuianu":"Brătuianu","lui bratulea":"Bratulea","lui bratuleanu":"Brătuleanu","lui bratulescu":"Brătulescu","lui braviceanu":"Braviceanu","lui bravu":"Bravu","lui brazda":"Brazdă","lui breban":"Breban","lui brebenel":"Brebenel","lui brebulescu":"Brebulescu","lui brejbeanu":"Brejbeanu","lui bresfelean":"Breșfelean","lui breslasu":"Breslașu","lui bresniceanu":"Bresniceanu","lui bresteanu":"Bresteanu","lui bretan":"Bretan","lui brezan":"Brezan","lui brezeanu":"Brezeanu","lui brezoianu":"Brezoianu","lui briceag":"Briceag","lui brici":"Brici","lui briciu":"Briciu","lui briglezan":"Brîglezan","lui briglezean":"Brîglezean","lui brindusa":["lui brîndușa","Brîndușa","lui brîndușă","Brîndușă"],"lui brindusel":"Brîndușel","lui brindusoiu":"Brîndușoiu","lui brinza":["lui brînza","Brînza","lui brînză","Brînză"],"lui brinzan":"Brînzan","lui brinzanescu":"Brînzănescu","lui brinzanu":"Brînzanu","lui brinzaru":"Brînzaru","lui brinzas":"Brînzaș","lui brinzea":"Brînzea","lui brinzescu":"Brînzescu","lui brinzila":"Brînzilă","lui brinzoi":"Brînzoi","lui brisca":"Brișcă","lui briscariu":"Brișcariu","lui briscaru":"Brișcaru","lui broasca":["lui broasca","Broasca","lui broască","Broască"],"lui broboana":"Broboană","lui brodeala":"Brodeală","lui broscaru":"Broscaru","lui broscoi":"Broscoi","lui broscuta":"Broscuță","lui brotac":"Brotac","lui brotacel":"Brotăcel","lui brotacelu":"Brotăcelu","lui brudiu":"Brudiu","lui bruma":["lui bruma","Bruma","lui brumă","Brumă"],"lui brumar":"Brumar","lui brumariu":"Brumariu","lui brumaru":"Brumaru","lui brustur":"Brustur","lui brusture":"Brusture","lui brustureanu":"Brustureanu","lui brutaru":"Brutaru","lui bruteanu":"Bruteanu","lui buba":"Bubă","lui buboi":"Buboi","lui buboiu":"Buboiu","lui bubosu":"Bubosu","lui bubuianu":"Bubuianu","lui bubuioc":"Bubuioc","lui buburuz":"Buburuz","lui buca":"Bucă","lui bucalau":"Bucălău","lui bucan":"Bucan","lui bucaru":"Bucaru","lui bucata":"Bucată","lui bucatariu":"Bucătariu","lui bucataru":"Bucătaru","lui bucatica":"Bucățică","lui bucatura":"Bucătură","lui buceanu":"Buceanu","lui buceloiu":"Buceloiu","lui buche":"Buche","lui bucheru":"Bucheru","lui buciuman":"Buciuman","lui buciumanu":"Buciumanu","lui buciumas":"Buciumaș","lui buciumean":"Buciumean","lui buciumeanu":"Buciumeanu","lui buciumeneanu":"Buciumeneanu","lui bucos":"Bucos","lui bucovanu":"Bucovanu","lui bucoveanu":"Bucoveanu","lui bucovineanu":"Bucovineanu","lui bucsa":"Bucșă","lui bucsinescu":"Bucșinescu","lui buculeanu":"Buculeanu","lui buculescu":"Buculescu","lui bucuras":"Bucuraș","lui bucurescu":"Bucurescu","lui bucurestean":"Bucureștean","lui bucuresteanu":"Bucureșteanu","lui bucurestianu":"Bucureștianu","lui bucurica":"Bucurică","lui bucurie":"Bucurie","lui bucuroiu":"Bucuroiu","lui buda":"Budă","lui budean":"Budean","lui budeanu":"Budeanu","lui budescu":"Budescu","lui budesteanu":"Budeșteanu","lui budileanu":"Budileanu","lui budilianu":"Budilianu","lui budisteanu":"Budișteanu","lui budulica":"Budulică","lui budunescu":"Budunescu","lui budurescu":"Budurescu","lui budurus":"Buduruș","lui buescu":"Buescu","lui buga":["lui buga","Buga","lui bugă","Bugă"],"lui bugeanu":"Bugeanu","lui bugescu":"Bugescu","lui bugheanu":"Bugheanu","lui bugnar":"Bugnar","lui bugnariu":"Bugnariu","lui bugnaru":"Bugnaru","lui buha":["lui buha","Buha","lui buhă","Buhă"],"lui buhaescu":"Buhăescu","lui buhai":"Buhai","lui buharu":"Buharu","lui buhna":"Buhnă","lui buhnila":"Buhnilă","lui buhosu":"Buhosu","lui buhuceanu":"Buhuceanu","lui buiac":"Buiac","lui buica":"Buica","lui buicanescu":"Buicănescu","lui buiculescu":"Buiculescu","lui buinoiu":"Buinoiu","lui bujan":"Bujan","lui bujdei":"Bujdei","lui bujenita":"Bujeniță","lui bujita":"Bujiță","lui bujoranu":"Bujoranu","lui bujorean":"Bujorean","lui bujoreanu":"Bujoreanu","lui bujorel":"Bujorel","lui bujorescu":"Bujorescu","lui bujorianu":"Bujorianu","lui bujorica":"Bujorică","lui bujoriu":"Bujoriu","lui bulat":"Bulat","lui bulboaca":"Bulboacă","lui bulbucan":"Bulbucan","lui bulca":"Bulcă","lui buldus":"Bulduș","lui buleandra":"Buleandră","lui buleteanu":"Buleteanu","lui bulgar":["lui bulgar","Bulgar","lui bulgăr","Bulgăr"],"lui bulgarasu":"Bulgărașu","lui bulgare":"Bulgăre","lui bulgarescu":"Bulgărescu","lui bulgariu":"Bulgariu","lui bulgaru":"Bulgaru","lui bulhac":"Bulhac","lui bulibasa":"Bulibașa","lui bulica":"Bulică","lui buligan":"Buligan","lui buligescu":"Buligescu","lui bulugheana":"Bulugheană","lui bulumac":"Bulumac","lui bulz":"Bulz","lui bulzan":"Bulzan","lui bulzu":"Bulzu","lui bumbac":"Bumbac","lui bumbacaru":"Bumbăcaru","lui bumbacila":"Bumbăcilă","lui bumbescu":"Bumbescu","lui bumboiu":"Bumboiu","lui bumbu":"Bumbu","lui bumbulut":"Bumbuluț","lui bunda":["lui bunda","Bunda","lui bundă","Bundă"],"lui bunescu":"Bunescu","lui bunget":"Bunget","lui bunica":["lui bunica","Bunica","lui bunică","Bunică"],"lui bunicelu":"Bunicelu","lui bunulescu":"Bunulescu","lui burcescu":"Burcescu","lui burciulescu":"Burciulescu","lui burdeanu":"Burdeanu","lui burdescu":"Burdescu","lui burduf":"Burduf","lui burduhos":"Burduhos","lui burduhosu":"Burduhosu","lui burdulus":"Burduluș","lui burete":"Burete","lui burghiu":"Burghiu","lui buric":"Buric","lui burileanu":"Burileanu","lui burlacel":"Burlăcel","lui burlan":"Burlan","lui burlanescu":"Burlănescu","lui burleac":"Burleac","lui burta":"Burtă","lui burtaverde":"Burtăverde","lui burtescu":"Burtescu","lui burtica":"Burtică","lui burticica":"Burticică","lui burtila":"Burțilă","lui burtoi":"Burtoi","lui buruiana":"Buruiană","lui busila":"Bușilă","lui bustean":"Buștean","lui busteanu":"Bușteanu","lui busui":"Bușui","lui busuioc":"Busuioc","lui busuioceanu":"Busuioceanu","lui busuiocescu":"Busuiocescu","lui busulete":"Bușulete","lui butanescu":"Butănescu","lui butaru":"Butaru","lui butca":["lui butca","Butca","lui butcă","Butcă"],"lui butculescu":"Butculescu","lui buteica":"Buteică","lui butelca":"Butelcă","lui butesteanu":"Buteșteanu","lui butnar":"Butnar","lui butnareanu":"Butnăreanu","lui butnarescu":"Butnărescu","lui butnariu":"Butnariu","lui butnaru":"Butnaru","lui butnarus":"Butnăruș","lui butoescu":"Butoescu","lui butoianu":"Butoianu","lui butoiescu":"Butoiescu","lui buton":"Buton","lui butuc":"Butuc","lui butuceanu":"Butuceanu","lui butucel":"Butucel","lui butucescu":"Butucescu","lui butureanu":"Buțureanu","lui buturuga":"Buturugă","lui butusan":"Butușan","lui butusina":"Butușină","lui buza":"Buză","lui buzarnescu":"Buzărnescu","lui buzatoaia":"Buzățoaia","lui buzatoiu":"Buzățoiu","lui buzatu":"Buzatu","lui buzduceanu":"Buzduceanu","lui buzdugeanu":"Buzdugeanu","lui buzeanu":"Buzeanu","lui buzoianu":"Buzoianu","lui eacobescu":"Eacobescu","lui ecaterinescu":"Ecaterinescu","lui echimescu":"Echimescu","lui ecobescu":"Ecobescu","lui eduard":"Eduard","lui eftimescu":"Eftimescu","lui eftimiu":"Eftimiu","lui eftimoiu":"Eftimoiu","lui elefterescu":"Elefterescu","lui elefterie":"Elefterie","lui elenescu":"Elenescu","lui eliade":"Eliade","lui eliescu":"Eliescu","lui emancipatu":"Emancipatu","lui emil":"Emil","lui eminescu":"Eminescu","lui enaceanu":"Enăceanu","lui enacescu":"Enăcescu","lui enachescu":"Enăchescu","lui enachioae":"Enăchioae","lui enachioaia":"Enăchioaia","lui enachioiu":"Enăchioiu","lui enachita":"Enăchiță","lui enasoiu":"Enășoiu","lui encescu":"Encescu","lui encica":"Encică","lui encioiu":"Encioiu","lui enciulescu":"Enciulescu","lui enculescu":"Enculescu","lui encutescu":"Encuțescu","lui encutoiu":"Encuțoiu","lui enechescu":"Enechescu","lui englezu":"Englezu","lui enica":"Enică","lui enita":"Eniță","lui enoae":"Enoae","lui enoaia":"Enoaia","lui enoescu":"Enoescu","lui enoiu":"Enoiu","lui enuca":"Enucă","lui enulescu":"Enulescu","lui enus":"Enuș","lui enuta":"Enuță","lui eparu":"Eparu","lui episcopescu":"Episcopescu","lui epuraru":"Epuraru","lui epuras":"Epuraș","lui epure":"Epure","lui epurescu":"Epurescu","lui erbarescu":"Erbărescu","lui erculescu":"Erculescu","lui eremencu":"Eremencu","lui eremias":"Eremiaș","lui erimescu":"Erimescu","lui etegan":"Etegan","lui eufrosin":"Eufrosin","lui evanghelescu":"Evanghelescu","lui evghenie":"Evghenie","lui ezereanu":"Ezereanu","lui fabricantu":"Fabricantu","lui facalet":"Făcăleț","lui facaletiu":"Făcălețiu","lui facaoanu":"Făcăoanu","lui facaoaru":"Făcăoaru","lui fadureanu":"Fădureanu","lui fagadaru":"Făgădaru","lui fagadau":"Făgădău","lui fagarasan":"Făgărășan","lui fagarasanu":"Făgărășanu","lui fagaraseanu":"Făgărășeanu","lui fagas":"Făgaș","lui fagateanu":"Făgăteanu","lui fageanu":"Făgeanu","lui faifer":"Faifer","lui faina":"Făină","lui fainariu":"Făinariu","lui fainaru":"Făinaru","lui fainoiu":"Făinoiu","lui fala":"Fală","lui falca":["lui falca","Falca","lui falcă","Falcă"],"lui falcescu":"Fălcescu","lui falculete":"Fălculete","lui falcuta":"Fălcuță","lui falcutescu":"Fălcuțescu","lui faleanu":"Făleanu","lui falfanescu":"Fâlfănescu","lui falnicu":"Falnicu","lui falticeanu":"Fălticeanu","lui falticineanu":"Fălticineanu","lui falutoiu":"Făluțoiu","lui fanaragiu":"Fanaragiu","lui fanescu":"Fănescu","lui fanica":"Fănică","lui fanita":"Făniță","lui fanoiu":"Fănoiu","lui fantana":"Fântână","lui fantanariu":"Fântânariu","lui fantaneanu":"Fântâneanu","lui fantaneru":"Fântâneru","lui fantanescu":"Fântânescu","lui fanut":"Fănuț","lui fanuta":"Fănuță","lui faraianu":"Fărăianu","lui farama":"Fărâmă","lui faramita":"Fărâmiță","lui faran":"Făran","lui faraon":"Faraon","lui faraoneanu":"Faraoneanu","lui fararu":"Făraru","lui farcasanu":"Farcașanu","lui farcasescu":"Fărcășescu","lui farima":"Fărîmă","lui fariseu":"Fariseu","lui farmazon":"Farmazon","lui fartat":"Fârtat","lui fasie":["lui fâșie","Fâșie","lui fășie","Fășie"],"lui fasole":"Fasole","lui fatulescu":"Fătulescu","lui faur":"Faur","lui faurescu":"Făurescu","lui fechete":"Fechete","lui fecioru":"Fecioru","lui fedeles":"Fedeleș","lui fediuc":"Fediuc","lui fedorciuc":"Fedorciuc","lui fedoreac":"Fedoreac","lui feldeorean":"Feldeorean","lui feldiorean":"Feldiorean","lui feldioreanu":"Feldioreanu","lui felecan":"Felecan","lui felegan":"Felegan","lui felesteanu":"Feleșteanu","lui felie":"Felie","lui feloiu":"Feloiu","lui ferariu":"Ferariu","lui feraru":"Feraru","lui ferastrau":"Ferăstrău","lui fercu":"Fercu","lui ferecatu":"Ferecatu","lui feregan":"Feregan","lui ferencu":"Ferencu","lui ferent":"Ferenț","lui ferestean":"Fereștean","lui feresteanu":"Fereșteanu","lui ferezan":"Ferezan","lui feroiu":"Feroiu","lui festila":"Feștilă","lui feteanu":"Feteanu","lui fetescu":"Fetescu","lui fetita":"Fetiță","lui fibisan":"Fibișan","lui ficior":"Ficior","lui ficioru":"Ficioru","lui fier":"Fier","lui fierariu":"Fierariu","lui fieraru":"Fieraru","lui fierascu":"Fierăscu","lui fierbinteanu":"Fierbințeanu","lui fierescu":"Fierescu","lui fieroiu":"Fieroiu","lui fiertu":"Fiertu","lui figan":"Figan","lui filcescu":"Filcescu","lui fildan":"Fildan","lui filep":"Filep","lui filer":"Filer","lui filimonescu":"Filimonescu","lui filionescu":"Filionescu","lui filioreanu":"Filioreanu","lui filipache":"Filipache","lui filipachi":"Filipachi","lui filipas":"Filipaș","lui filipciuc":"Filipciuc","lui filipeanu":"Filipeanu","lui filipenco":"Filipenco","lui filipescu":"Filipescu","lui filipiuc":"Filipiuc","lui filipoaia":"Filipoaia","lui filipoi":"Filipoi","lui filipoiu":"Filipoiu","lui filipovici":"Filipovici","lui filippi":"Filippi","lui filisan":"Filișan","lui filiu":"Filiu","lui filoteanu":"Filoteanu","lui finaru":"Fînaru","lui finescu":"Finescu","lui fintesteanu":"Finteșteanu","lui fintina":"Fîntînă","lui fintinariu":"Fîntînariu","lui fintinaru":"Fîntînaru","lui fintineru":"Fîntîneru","lui fintinoiu":"Fîntînoiu","lui fir":"Fir","lui firanescu":"Firănescu","lui firescu":"Firescu","lui firezar":"Firezar","lui firicel":"Firicel","lui firicioiu":"Firicioiu","lui firman":"Firman","lui firoiu":"Firoiu","lui firtat":"Fîrtat","lui firu":"Firu","lui firulescu":"Firulescu","lui firut":"Firuț","lui fiscaleanu":"Fișcăleanu","lui fiscencu":"Fiscencu","lui fiscutean":"Fiscutean","lui fiscuteanu":"Fiscuteanu","lui fisie":"Fîșie","lui fitoiu":"Fițoiu","lui fiu":"Fiu","lui fizesan":"Fizeșan","lui flamand":"Flămând","lui flamaropol":"Flamaropol","lui flamind":"Flămînd","lui flamindu":"Flămîndu","lui flaviu":"Flaviu","lui flegheru":"Flegheru","lui fleica":"Fleică","lui flinta":"Flintă","lui floare":"Floare","lui flocica":"Flocică","lui flocos":"Flocos","lui flocosu":"Flocosu","lui flocutescu":"Flocuțescu","lui florariu":"Florariu","lui florescu":"Florescu","lui floresteanu":"Floreșteanu","lui florica":"Florică","lui floricel":"Floricel","lui floricescu":"Floricescu","lui florichescu":"Florichescu","lui floricica":"Floricică","lui floricioiu":"Floricioiu","lui floricoiu":"Floricoiu","lui florin":"Florin","lui florinescu":"Florinescu","lui floristean":"Floriștean","lui floristeanu":"Florișteanu","lui florita":"Floriță","lui floroiu":"Floroiu","lui florut":"Floruț","lui floruta":["lui floruța","Floruța","lui floruță","Floruță"],"lui flueras":"Flueraș","lui fluieras":"Fluieraș","lui flutur":"Flutur","lui fluturas":"Fluturaș","lui fluture":"Fluture","lui fluturel":"Fluturel","lui fluturu":"Fluturu","lui foamete":"Foamete","lui foarfeca":"Foarfecă","lui focsaneanu":"Focșăneanu","lui focseneanu":"Focșeneanu","lui focsineanu":"Focșineanu","lui fodor":"Fodor","lui fodorica":"Fodorică","lui fodorut":"Fodoruț","lui fofirlica":"Fofîrlică","lui fogarasi":"Fogarași","lui foisoreanu":"Foișoreanu","lui foita":"Foiță","lui folcutescu":"Folcuțescu","lui foleanu":"Foleanu","lui fometescu":"Fometescu","lui forai":"Forai","lui foran":"Foran","lui forfota":"Forfotă","lui forgaci":"Forgaci","lui foris":"Foriș","lui formagiu":"Formagiu","lui forosigan":"Foroșigan","lui foroticean":"Foroticean","lui forotician":"Forotician","lui fortescu":"Forțescu","lui fortuna":"Fortuna","lui fortunescu":"Fortunescu","lui fotache":"Fotache","lui fotachi":"Fotachi","lui fotescu":"Fotescu","lui fotino":"Fotino","lui fotu":"Fotu","lui fraga":"Fragă","lui franc":"Frânc","lui franche":"Franche","lui francisc":"Francisc","lui franciuc":"Franciuc","lui francu":"Frâncu","lui franculea":"Frânculea","lui franculescu":"Frânculescu","lui franghieru":"Frânghieru","lui frangulescu":"Frângulescu","lui franguloiu":"Frânguloiu","lui frant":"Franț","lui frantescu":["lui franțescu","Franțescu","lui frânțescu","Frânțescu"],"lui frantu":"Frântu","lui frantuzu":"Franțuzu","lui frasineanu":"Frăsineanu","lui frasinel":"Frăsinel","lui frasinescu":"Frăsinescu","lui frate":"Frate","lui frateanu":"Frăteanu","lui fratian":"Frățian","lui fratica":"Frățică","lui fratila":"Frățilă","lui fratilescu":"Frățilescu","lui fratiloiu":"Frățiloiu","lui fratita":"Frătiță","lui fratostiteanu":"Fratoștițeanu","lui fratutescu":"Frătuțescu","lui frecateanu":"Frecățeanu","lui frecus":"Frecuș","lui frentescu":"Frențescu","lui frentiu":"Frențiu","lui fricosu":"Fricosu","lui frigescu":"Frigescu","lui frinc":"Frînc","lui frincu":"Frîncu","lui frinculescu":"Frînculescu","lui fringhie":"Frînghie","lui frintu":"Frîntu","lui friptu":"Friptu","lui fronescu":"Fronescu","lui fronoiu":"Fronoiu","lui frumos":"Frumos","lui fruntas":"Fruntaș","lui frunzar":"Frunzar","lui frunzareanu":"Frunzăreanu","lui frunzaverde":"Frunzăverde","lui frunzescu":"Frunzescu","lui frunzete":"Frunzete","lui frunzica":"Frunzică","lui frunzuca":"Frunzucă","lui frunzulica":"Frunzulică","lui frunzulita":"Frunzuliță","lui frusinoiu":"Frusinoiu","lui fudulache":"Fudulache","lui fudulu":"Fudulu","lui fufezan":"Fufezan","lui fugaru":"Fugaru","lui fulgeanu":"Fulgeanu","lui fulger":"Fulger","lui fulgescu":"Fulgescu","lui fulgulet":"Fulguleț","lui funar":"Funar","lui funariu":"Funariu","lui funaru":"Funaru","lui fundateanu":"Fundățeanu","lui fundatureanu":"Fundătureanu","lui funduc":"Funduc","lui funeriu":"Funeriu","lui funie":"Funie","lui funieru":"Funieru","lui furca":"Furcă","lui furculesteanu":"Furculeșteanu","lui furculita":"Furculiță","lui furnica":"Furnică","lui furtuna":"Furtună","lui furtunescu":"Furtunescu","lui fusariu":"Fusariu","lui fusaru":"Fusaru","lui gabor":"Gabor","lui gaboras":"Gaboraș","lui gaboreanu":"Găboreanu","lui gaborel":"Găborel","lui gabrielescu":"Gabrielescu","lui gabrilescu":"Gabrilescu","lui gabris":"Gabriș","lui gabroveanu":"Gabroveanu","lui gadescu":"Gâdescu","lui gadilas":"Gâdilaș","lui gadoiu":"Gâdoiu","lui gafitescu":"Gafițescu","lui gafitoi":"Gafițoi","lui gaftoneanu":"Gaftoneanu","lui gaftoniuc":"Gaftoniuc","lui gagauz":"Găgăuz","lui gageanu":"Găgeanu","lui gaidos":"Gaidoș","lui gaina":"Găină","lui gainar":"Găinar","lui gainariu":"Găinariu","lui gainaru":"Găinaru","lui gainat":"Găinaț","lui gainescu":"Găinescu","lui gainusa":"Găinușă","lui gaisteanu":"Găișteanu","lui gaita":"Gaiță","lui gaitanar":"Găitănar","lui gaitanariu":"Găitănariu","lui gaitanaru":"Găitănaru","lui galagie":"Gălăgie","lui galambos":"Galamboș","lui galanton":"Galanton","lui galasescu":"Gălășescu","lui galatan":"Gălățan","lui galatanu":["lui galațanu","Galațanu","lui gălățanu","Gălățanu"],"lui galatar":"Gălătar","lui galatean":"Gălățean","lui galateanu":"Gălățeanu","lui galbeaza":"Gălbează","lui galben":"Galben","lui galbenus":"Gălbenuș","lui galbinita":"Gălbiniță","lui galbioru":"Gălbioru","lui galceava":"Gâlceavă","lui galcescu":"Gâlcescu","lui galdean":"Găldean","lui galeata":"Găleată","lui galesanu":"Găleșanu","lui galescu":"Galescu","lui galetar":"Găletar","lui galetariu":"Găletariu","lui galiceanu":"Găliceanu","lui galos":"Galoș","lui galusca":"Gălușcă","lui gamalie":"Gămălie","lui gamanescu":"Gămănescu","lui gana":"Gană","lui ganciulescu":"Gănciulescu","lui gandac":"Gândac","lui gandescu":"Gândescu","lui gane":"Gane","lui ganescu":"Gănescu","lui gansac":"Gânsac","lui ganut":"Gănuț","lui garabet":"Garabet","lui garbovan":"Gârbovan","lui garbovean":"Gârbovean","lui gard":"Gard","lui gardescu":"Gărdescu","lui gargarita":"Gărgăriță","lui gargaun":"Gărgăun","lui gargaune":"Gărgăune","lui garla":"Gârlă","lui garlescu":"Gârlescu","lui garnita":"Gârniță","lui garoafa":"Garoafă","lui garofeanu":"Garofeanu","lui garoflid":"Garoflid","lui garzescu":"Gârzescu","lui gasca":"Gâscă","lui gasparel":"Gășpărel","lui gatej":"Gătej","lui gatlan":"Gâtlan","lui gatu":"Gațu","lui gaura":"Gaură","lui gavan":"Găvan","lui gavanescu":"Găvănescu","lui gavanesteanu":"Găvăneșteanu","lui gavojdian":"Găvojdian","lui gavril":"Gavril","lui gavrilas":"Gavrilaș","lui gavrilescu":"Gavrilescu","lui gavrilet":"Gavrileț","lui gavrilica":"Gavrilică","lui gavrilita":"Gavriliță","lui gavriliuc":"Gavriliuc","lui gavriloae":"Gavriloae","lui gavriloaia":"Gavriloaia","lui gavriloi":"Gavriloi","lui gavriloiu":"Gavriloiu","lui gavrilus":"Gavriluș","lui gavrilut":["lui gavriluț","Gavriluț","lui găvriluț","Găvriluț"],"lui gavriluta":"Gavriluță","lui gavris":"Gavriș","lui gavrisiu":"Gavrișiu","lui gaza":"Gâză","lui gazda":"Gazdă","lui gazdac":"Găzdac","lui gazdoi":"Găzdoi","lui gealatu":"Gealatu","lui geaman":"Geamăn","lui geamanu":"Geamănu","lui geambasu":"Geambașu","lui geanta":"Geantă","lui genoiu":"Genoiu","lui genunchi":"Genunchi","lui georgescu":"Georgescu","lui georgica":"Georgică","lui georoceanu":"Georoceanu","lui gheara":"Gheară","lui gheata":"Gheață","lui gheaus":"Gheauș","lui ghebosu":"Ghebosu","lui ghejan":"Ghejan","lui ghelasie":"Ghelasie","lui ghelmez":"Ghelmez","lui ghemulet":"Ghemuleț","lui ghenadie":"Ghenadie","lui ghencea":"Ghencea","lui ghenciulescu":"Ghenciulescu","lui ghenescu":"Ghenescu","lui ghenoiu":"Ghenoiu","lui ghentulescu":"Ghențulescu","lui gheordunescu":"Gheordunescu","lui gheorghe":"Gheorghe","lui gheorghel":"Gheorghel","lui gheorghelescu":"Gheorghelescu","lui gheorgheoiu":"Gheorgheoiu","lui gheorghescu":"Gheorghescu","lui gheorghesteanu":"Gheorgheșteanu","lui gheorghiade":"Gheorghiade","lui gheorghias":"Gheorghiaș","lui gheorghica":"Gheorghică","lui gheorghicescu":"Gheorghicescu","lui gheorghiciuc":"Gheorghiciuc","lui gheorghiescu":"Gheorghiescu","lui gheorghiev":"Gheorghiev","lui gheorghinoiu":"Gheorghinoiu","lui gheorghioiu":"Gheorghioiu","lui gheorghisor":"Gheorghișor","lui gheorghita":"Gheorghiță","lui gheorghitanu":"Gheorghițanu","lui gheorghiteanu":"Gheorghițeanu","lui gheorghitescu":"Gheorghițescu","lui gheorghitoaia":"Gheorghițoaia","lui gheorghitoi":"Gheorghițoi","lui gheorghitoiu":"Gheorghițoiu","lui gheorghiulescu":"Gheorghiulescu","lui gheorgita":"Gheorgiță","lui gheormescu":"Gheormescu","lui gheraescu":"Gherăescu","lui gherasescu":"Gherăsescu","lui gherasim":"Gherasim","lui gherasimescu":"Gherasimescu","lui gherasimoaia":"Gherasimoaia","lui ghercioiu":"Ghercioiu","lui gherescu":"Gherescu","lui gherganescu":"Ghergănescu","lui gherghelas":"Gherghelaș","lui gherghelescu":"Gherghelescu","lui gherghely":"Gherghely","lui gherghescu":"Gherghescu","lui gherghiceanu":"Gherghiceanu","lui gherghinescu":"Gherghinescu","lui gherghinoiu":"Gherghinoiu","lui ghergulescu":"Ghergulescu","lui gherlan":"Gherlan","lui ghermaneanu":"Ghermăneanu","lui ghermanescu":"Ghermănescu","lui ghertenisan":"Ghertenișan","lui ghetoiu":"Ghețoiu","lui ghiata":"Ghiață","lui ghiaur":"Ghiaur","lui ghiauru":"Ghiauru","lui ghibanescu":"Ghibănescu","lui ghibu":"Ghibu","lui ghiburosu":"Ghiburoșu","lui ghica":"Ghica","lui ghican":"Ghican","lui ghiciulescu":"Ghiciulescu","lui ghiculescu":"Ghiculescu","lui ghicuta":"Ghicuță","lui ghideanu":"Ghideanu","lui ghidescu":"Ghidescu","lui ghigeanu":"Ghigeanu","lui ghimpe":"Ghimpe","lui ghimpeteanu":"Ghimpețeanu","lui ghinda":"Ghindă","lui ghindar":"Ghindar","lui ghindaru":"Ghindaru","lui ghindescu":"Ghindescu","lui ghinea":"Ghinea","lui ghinescu":"Ghinescu","lui ghinita":"Ghiniță","lui ghinoaia":"Ghinoaia","lui ghinoiu":"Ghinoiu","lui ghiorghica":"Ghiorghică","lui ghiorghioiu":"Ghiorghioiu","lui ghiorghitas":"Ghiorghițaș","lui ghirasimescu":"Ghirasimescu","lui ghiroltean":"Ghiroltean","lui ghirolteanu":"Ghirolteanu","lui ghiteanu":"Ghițeanu","lui ghitescu":"Ghițescu","lui ghitica":"Ghițică","lui ghitoiu":"Ghițoiu","lui ghituica":"Ghițuică","lui ghitulescu":"Ghițulescu","lui ghitulica":"Ghițulică","lui ghiula":"Ghiula","lui ghiurca":"Ghiurcă","lui ghiurcanas":"Ghiurcănaș","lui ghiveci":"Ghiveci","lui ghiveciu":"Ghiveciu","lui ghizdav":"Ghizdav","lui ghizdavescu":"Ghizdăvescu","lui ghizdavu":"Ghizdavu","lui gica":"Gică","lui gidescu":"Gîdescu","lui gidoiu":"Gîdoiu","lui gigica":"Gigică","lui gilceava":"Gîlceavă","lui gilcescu":"Gîlcescu","lui gilescu":"Gilescu","lui gilorteanu":"Gilorteanu","lui gindac":"Gîndac","lui gindacel":"Gîndăcel","lui gindila":"Gîndilă","lui gindu":"Gîndu","lui ginerica":"ginerică","lui ginga":"Gîngă","lui gingasu":"Gingașu","lui ginsac":"Gînsac","lui giorocianu":"Giorocianu","lui girbov":"Gîrbov","lui girbovan":"Gîrbovan","lui girboveanu":"Gîrboveanu","lui girbu":"Gîrbu","lui girbulet":"Gîrbuleț","lui gireada":"Gireadă","lui girgiuveanu":"Girgiuveanu","lui girla":"Gîrlă","lui girleanu":"Gîrleanu","lui girlesteanu":"Gîrleșteanu","lui girlita":"Gîrliță","lui girloiu":"Gîrloiu","lui girneata":"Gîrneață","lui girnet":"Gîrneț","lui girnita":"Gîrniță","lui gisca":"Gîscă","lui giscan":"Gîscan","lui gistescu":"Gîștescu","lui gitlan":"Gîtlan","lui gitu":"Gîtu","lui giubegeanu":"Giubegeanu","lui giuchici":"Giuchici","lui giugioiu":"Giugioiu","lui giuglescu":"Giuglescu","lui giuleanu":"Giuleanu","lui giulescu":"Giulescu","lui giurcaneanu":"Giurcăneanu","lui giurchescu":"Giurchescu","lui giurcoiu":"Giurcoiu","lui giurculete":"Giurculete","lui giurescu":"Giurescu","lui giurgescu":"Giurgescu"};
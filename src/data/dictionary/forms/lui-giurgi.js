@@ -0,0 +1 @@
+export default {"lui giurgica":"Giurgică","lui giurgila":"Giurgilă","lui giurgioiu":"Giurgioiu","lui giurgiteanu":"Giurgițeanu","lui giurgiulescu":"Giurgiulescu","lui giurgiut":"Giurgiuț","lui giurgiuvanu":"Giurgiuvanu","lui giurgiuveanu":"Giurgiuveanu","lui giusca":"Giușcă","lui giza":["lui gîza","Gîza","lui gîză","Gîză"],"lui glava":["lui glava","Glava","lui glavă","Glavă"],"lui gligoras":"Gligoraș","lui gligorescu":"Gligorescu","lui gligorita":"Gligoriță","lui glimboceanu":"Glîmboceanu","lui glodan":"Glodan","lui glodariu":"Glodariu","lui glodean":"Glodean","lui glodeanu":"Glodeanu","lui glodian":"Glodian","lui glogovetan":"Glogovețan","lui glogovetean":"Glogovețean","lui glont":"Glonț","lui gluga":"Glugă","lui goanga":"Goangă","lui goarna":"Goarnă","lui gogalniceanu":"Gogălniceanu","lui gogescu":"Gogescu","lui gogioiu":"Gogioiu","lui gogoasa":"Gogoașă","lui gogoloi":"Gogoloi","lui gogonet":"Gogoneț","lui gogorita":"Gogoriță","lui gogosanu":"Gogoșanu","lui gogosoiu":"Gogoșoiu","lui gogu":"Gogu","lui gogulescu":"Gogulescu","lui gogulet":"Goguleț","lui gogut":"Goguț","lui goia":"Goia","lui goian":"Goian","lui goldan":"Goldan","lui golescu":"Golescu","lui golesteanu":"Goleșteanu","lui golianu":"Golianu","lui golisteanu":"Golișteanu","lui golosoiu":"Goloșoiu","lui golovatiuc":"Golovatiuc","lui golovcencu":"Golovcencu","lui gombos":"Gomboș","lui gombosiu":"Gomboșiu","lui gomoescu":"Gomoescu","lui gomoi":"Gomoi","lui gomoiu":"Gomoiu","lui goranescu":"Gorănescu","lui goras":"Goraș","lui gorbanescu":"Gorbănescu","lui gorencu":"Gorencu","lui gorgan":"Gorgan","lui gorganeanu":"Gorgăneanu","lui gorgoteanu":"Gorgoțeanu","lui gorgovan":"Gorgovan","lui gorgoveanu":"Gorgoveanu","lui gorila":"Gorilă","lui gorjan":"Gorjan","lui gorjanu":"Gorjanu","lui gornescu":"Gornescu","lui gornistu":"Gornistu","lui gorschi":"Gorschi","lui gorunescu":"Gorunescu","lui gospodariu":"Gospodariu","lui gospodaru":"Gospodaru","lui govojdean":"Govojdean","lui gradeanu":"Grădeanu","lui gradescu":"Grădescu","lui gradina":"Grădină","lui gradinar":"Grădinar","lui gradinariu":"Grădinariu","lui gradinaru":"Grădinaru","lui gradinescu":"Grădinescu","lui gradisteanu":"Grădișteanu","lui grajdan":"Grăjdan","lui grajdanescu":"Grăjdănescu","lui grajdaru":"Grăjdaru","lui gramada":"Grămadă","lui gramaticu":"Grămăticu","lui gramatopol":"Gramatopol","lui gramescu":"Grămescu","lui gramisteanu":"Grămișteanu","lui granescu":"Grănescu","lui grangure":"Grangure","lui granisteanu":"Grănișteanu","lui grapa":"Grapă","lui grapini":"Grapini","lui grapinoiu":"Grăpinoiu","lui grasu":"Grasu","lui grasun":"Grăsun","lui gratar":"Grătar","lui grateanu":"Grăteanu","lui grau":"Grâu","lui graunte":"Grăunte","lui graur":"Graur","lui graure":"Graure","lui grebenisan":"Grebenișan","lui grebles":"Grebleș","lui grec":"Grec","lui grecescu":"Grecescu","lui grecu":"Grecu","lui greculescu":"Greculescu","lui greerus":"Greeruș","lui grejdanescu":"Grejdănescu","lui gridan":"Gridan","lui grigoras":"Grigoraș","lui grigorasel":"Grigorășel","lui grigore":"Grigore","lui grigorescu":"Grigorescu","lui grigorica":"Grigorică","lui grigorita":"Grigoriță","lui grigoroaia":"Grigoroaia","lui grigoroiu":"Grigoroiu","lui grigoru":"Grigoru","lui grigorut":"Grigoruț","lui grigoruta":"Grigoruță","lui grindeanu":"Grindeanu","lui gripca":"Gripcă","lui griu":"Grîu","lui grivei":"Grivei","lui grivu":"Grivu","lui groapa":["lui groapa","Groapa","lui groapă","Groapă"],"lui groaznicu":"Groaznicu","lui groparu":"Groparu","lui gropineanu":"Gropineanu","lui gropsorean":"Gropșorean","lui grosanu":"Groșanu","lui groseanu":"Groseanu","lui grosescu":"Grosescu","lui grosoaia":"Grosoaia","lui grosulescu":"Grosulescu","lui grozav":"Grozav","lui grozavescu":"Grozăvescu","lui grozavu":"Grozavu","lui grozescu":"Grozescu","lui grozuta":"Grozuță","lui gruiescu":"Gruiescu","lui grumaz":"Grumaz","lui grumazescu":"Grumăzescu","lui grunzu":"Grunzu","lui gudanescu":"Gudănescu","lui gugiuman":"Gugiuman","lui gugoasa":"Gugoașă","lui gugulica":"Gugulică","lui guler":"Guler","lui gulie":"Gulie","lui gunoi":"Gunoi","lui guralivu":"Guralivu","lui gurau":"Gurău","lui gurbanesteanu":"Gurbăneșteanu","lui guresoaia":"Gureșoaia","lui gurita":"Guriță","lui guritanu":"Gurițanu","lui guruianu":"Guruianu","lui gusa":["lui gușa","Gușa","lui gușă","Gușă"],"lui gusat":"Gușat","lui gusatu":"Gușatu","lui gusoi":"Gușoi","lui gusteritan":"Gușterițan","lui gusti":"Gusti","lui guteanu":"Guteanu","lui gutescu":"Guțescu","lui gutica":"Guțică","lui gutoae":"Guțoae","lui gutoaia":"Guțoaia","lui gutoi":"Guțoi","lui gutoiu":"Guțoiu","lui gutulescu":"Guțulescu","lui guzgan":"Guzgan","lui guzganu":"Guzganu","lui habuc":"Hăbuc","lui hagi":"Hagi","lui hagianu":"Hagianu","lui hagiescu":"Hagiescu","lui hagiesteanu":"Hagieșteanu","lui hagiu":"Hagiu","lui haiduc":"Haiduc","lui haiducescu":"Haiducescu","lui haiducu":"Haiducu","lui haina":"Haină","lui haineala":"Hăineală","lui haios":"Haioș","lui haita":"Haită","lui halagian":"Halagian","lui halaicu":"Halaicu","lui halasanu":"Halașanu","lui halauca":"Hălăucă","lui halauceanu":"Hălăuceanu","lui halaucescu":"Hălăucescu","lui haliuc":"Haliuc","lui halmagean":"Hălmăgean","lui halmageanu":"Hălmăgeanu","lui halmaghi":"Halmaghi","lui halmagian":"Hălmăgian","lui halmajan":"Hălmăjan","lui halmajanu":"Hălmăjanu","lui halungescu":"Halungescu","lui halus":"Haluș","lui hambaras":"Hambaraș","lui hamza":"Hamza","lui hamzescu":"Hamzescu","lui handrachi":"Handrachi","lui hanes":"Haneș","lui hanescu":"Hănescu","lui hanganescu":"Hăngănescu","lui hangiu":"Hangiu","lui hanta":["lui hanța","Hanța","lui hanță","Hanță"],"lui hantescu":"Hănțescu","lui hantoiu":"Hănțoiu","lui hapciuc":"Hapciuc","lui harabagiu":"Harabagiu","lui harabor":"Hărăbor","lui haragus":"Hărăguș","lui haralambie":"Haralambie","lui harambasa":"Harambașa","lui harap":"Harap","lui harapu":"Harapu","lui harasemiuc":"Harasemiuc","lui harbuz":"Harbuz","lui harbuzariu":"Harbuzariu","lui harbuzaru":"Harbuzaru","lui harciog":"Hârciog","lui harlesteanu":"Hârleșteanu","lui harmanas":"Hărmănaș","lui harmanescu":"Hărmănescu","lui harnicu":"Harnicu","lui harsoveanu":"Hârșoveanu","lui harsovescu":"Hârșovescu","lui hartoaga":"Hârțoagă","lui hasdatan":"Hășdățan","lui hasmasan":["lui hăsmășan","Hăsmășan","lui hășmășan","Hășmășan"],"lui hasmatuchi":"Hasmațuchi","lui hatagan":["lui hațăgan","Hațăgan","lui hățăgan","Hățăgan"],"lui hategan":"Hațegan","lui hatiegan":"Hațiegan","lui hatieganu":"Hațieganu","lui hatigan":"Hațigan","lui hatman":"Hatman","lui hatmanu":"Hatmanu","lui hatru":"Hâtru","lui hauca":"Hăucă","lui havarneanu":["lui havârneanu","Havârneanu","lui hăvârneanu","Hăvârneanu","lui hăvărneanu","Hăvărneanu"],"lui havirneanu":"Hăvîrneanu","lui havriciuc":"Havriciuc","lui havriliuc":"Havriliuc","lui hazliu":"Hazliu","lui heghedus":"Hegheduș","lui heliade":"Heliade","lui herdeanu":"Herdeanu","lui herebenciuc":"Herebenciuc","lui herescu":"Herescu","lui herghelegiu":"Herghelegiu","lui hergheligiu":"Hergheligiu","lui herghiligiu":"Herghiligiu","lui hermeniuc":"Hermeniuc","lui heroiu":"Heroiu","lui hilmu":"Hîlmu","lui hinceanu":"Hînceanu","lui hincescu":"Hîncescu","lui hinoveanu":"Hinoveanu","lui hirb":"Hîrb","lui hirbu":"Hîrbu","lui hirca":"Hîrcă","lui hirceanu":"Hîrceanu","lui hirciog":"Hîrciog","lui hirdau":"Hîrdău","lui hirjan":"Hîrjan","lui hirlesteanu":"Hîrleșteanu","lui hirsoveanu":"Hîrșoveanu","lui hirsulescu":"Hîrșulescu","lui hirtie":"Hîrtie","lui hladiuc":"Hladiuc","lui hliboceanu":"Hliboceanu","lui hlibocianu":"Hlibocianu","lui hlihor":"Hlihor","lui hlusca":"Hlușcă","lui hobinca":"Hobincă","lui hodas":"Hodaș","lui hodisan":"Hodișan","lui hodoreanu":"Hodoreanu","lui hodoroaba":"Hodoroabă","lui hodorog":"Hodorog","lui hodosan":"Hodoșan","lui hogasoaia":"Hogășoaia","lui hoinarescu":"Hoinărescu","lui holboceanu":"Holboceanu","lui holbura":"Holbură","lui holeciuc":"Holeciuc","lui holeiciuc":"Holeiciuc","lui holera":"Holeră","lui holerca":"Holercă","lui holodniuc":"Holodniuc","lui holostencu":["lui holostencu","Holostencu","lui holoștencu","Holoștencu"],"lui holotiuc":"Holotiuc","lui homencu":"Homencu","lui homescu":"Homescu","lui homodorean":"Homodorean","lui homoriceanu":"Homoriceanu","lui homorodan":"Homorodan","lui homorodean":"Homorodean","lui homorodeanu":"Homorodeanu","lui homorozean":"Homorozean","lui honciuc":"Honciuc","lui hondrila":"Hondrilă","lui hondru":"Hondru","lui hontaru":"Honțaru","lui hora":"Hora","lui horatiu":"Horațiu","lui horbaniuc":"Horbaniuc","lui horbencu":"Horbencu","lui hordila":"Hordilă","lui hordoniceanu":"Hordoniceanu","lui hordovan":"Hordovan","lui horeanu":"Horeanu","lui horenciuc":"Horenciuc","lui horescu":"Horescu","lui horezeanu":"Horezeanu","lui horghidan":"Horghidan","lui horiceanu":"Horiceanu","lui hornar":"Hornar","lui hornariu":"Hornariu","lui hornaru":"Hornaru","lui hornet":"Horneț","lui hornu":"Hornu","lui horobet":"Horobeț","lui horodiceanu":"Horodiceanu","lui horodinca":"Horodincă","lui horodisteanu":"Horodișteanu","lui horodniceanu":"Horodniceanu","lui horopciuc":"Horopciuc","lui horotan":"Horotan","lui horvat":"Horvat","lui hosu":"Hosu","lui hotoiu":"Hoțoiu","lui hotu":"Hoțu","lui hrean":"Hrean","lui hrebenciuc":"Hrebenciuc","lui hrehorciuc":"Hrehorciuc","lui hrenciuc":"Hrenciuc","lui hrib":"Hrib","lui hrisca":["lui hrișca","Hrișca","lui hrișcă","Hrișcă"],"lui hrisoverghi":"Hrisoverghi","lui hrist":"Hrist","lui hristache":"Hristache","lui hristescu":"Hristescu","lui hristica":"Hristică","lui hristodorescu":"Hristodorescu","lui hristos":"Hristos","lui hristu":"Hristu","lui hritcu":"Hrițcu","lui hrituc":"Hrițuc","lui hroniade":"Hroniade","lui hrusca":"Hrușcă","lui huber":"Huber","lui hubert":"Hubert","lui hudesteanu":"Hudeșteanu","lui hudisteanu":"Hudișteanu","lui hudita":"Hudiță","lui hugeanu":"Hugeanu","lui huhurez":"Huhurez","lui hula":"Hulă","lui hulpus":"Hulpuș","lui hulubas":"Hulubaș","lui hulubescu":"Hulubescu","lui huma":"Humă","lui humoranu":"Humoranu","lui humorean":"Humorean","lui humoreanu":"Humoreanu","lui humulescu":"Humulescu","lui hurezan":"Hurezan","lui hurezanu":"Hurezanu","lui hurezean":"Hurezean","lui hurezeanu":"Hurezeanu","lui hurmuzache":"Hurmuzache","lui hurmuzescu":"Hurmuzescu","lui huruiala":"Huruială","lui husar":"Husar","lui husarciuc":"Husarciuc","lui husarencu":"Husarencu","lui husarescu":"Husărescu","lui husariu":"Husariu","lui husaru":"Husaru","lui hustiuc":"Huștiuc","lui hutul":"Huțul","lui hutuleac":"Huțuleac","lui hutupas":"Huțupaș","lui huzdup":"Huzdup","lui hypnos":"Hypnos","lui jabenitan":"Jabenițan","lui jalba":["lui jalba","Jalba","lui jalbă","Jalbă"],"lui jalobeanu":"Jalobeanu","lui jandarmu":"Jandarmu","lui jaratic":"Jăratic","lui jder":"Jder","lui jderiu":"Jderiu","lui jderoiu":"Jderoiu","lui jderu":"Jderu","lui jebeleanu":"Jebeleanu","lui jegu":"Jegu","lui jeleanu":"Jeleanu","lui jeledintan":"Jeledințan","lui jeledintean":"Jeledințean","lui jelescu":"Jelescu","lui jelev":"Jelev","lui jercalau":"Jercălău","lui jernoiu":"Jernoiu","lui jiboan":"Jiboan","lui jicmon":"Jicmon","lui jidoi":"Jidoi","lui jidov":"Jidov","lui jidoveanu":"Jidoveanu","lui jidovu":"Jidovu","lui jienaru":"Jienaru","lui jienescu":"Jienescu","lui jiganie":"Jiganie","lui jilaveanu":"Jilăveanu","lui jilavu":"Jilavu","lui jiloveanu":"Jiloveanu","lui jiltu":"Jilțu","lui jimblaru":"Jimblaru","lui jimboran":"Jimboran","lui jingoiu":"Jingoiu","lui jipescu":"Jipescu","lui jiquidi":"Jiquidi","lui jiru":"Jiru","lui jitar":"Jitar","lui jitarel":"Jitărel","lui jitariu":"Jitariu","lui jitariuc":["lui jitariuc","Jitariuc","lui jităriuc","Jităriuc"],"lui jiteanu":"Jiteanu","lui jivan":"Jivan","lui jivanov":"Jivanov","lui jneapan":"Jneapăn","lui joitaru":"Joițaru","lui joldescu":"Joldescu","lui joroveanu":"Joroveanu","lui jucan":"Jucan","lui jucatoru":"Jucătoru","lui jude":"Jude","lui judescu":"Judescu","lui judet":"Județ","lui juganariu":"Jugănariu","lui juganaru":"Jugănaru","lui jugastreanu":"Jugăstreanu","lui jugravu":"Jugravu","lui jugulete":"Jugulete","lui jumara":"Jumară","lui jumatate":"Jumătate","lui junca":["lui junca","Junca","lui juncă","Juncă"],"lui june":"June","lui jupanu":"Jupânu","lui jurascu":"Jurăscu","lui jurat":"Jurat","lui juratu":"Juratu","lui jurchescu":"Jurchescu","lui jurcut":"Jurcuț","lui jurjica":"Jurjică","lui jurubita":"Jurubiță","lui juvete":"Juvete","lui kelemen":"Kelemen","lui kiriac":"Kiriac","lui kirita":"Kiriță","lui kiritescu":"Kirițescu","lui kitescu":"Kițescu","lui kitu":"Kițu","lui kivu":"Kivu","lui kogalniceanu":"Kogălniceanu","lui kovaci":"Kovaci","lui kretulescu":"Krețulescu","lui kretzulescu":"Kretzulescu","lui laba":["lui laba","Laba","lui labă","Labă"],"lui labus":"Lăbuș","lui lacatus":"Lăcătuș","lui lacatusiu":"Lăcătușiu","lui lacatusu":"Lăcătușu","lui lacrama":"Lacrămă","lui lacramioara":"Lăcrămioara","lui lacureanu":"Lăcureanu","lui lacusteanu":"Lăcusteanu","lui lacustoiu":"Lăcustoiu","lui ladarescu":"Lădărescu","lui ladunca":["lui lădunca","Lădunca","lui lăduncă","Lăduncă"],"lui lae":"Lae","lui laescu":"Lăescu","lui lagojan":"Lăgojan","lui lakatos":"Lakatos","lui laliu":"Lălîu","lui lamaie":"Lămâie","lui lamasanu":"Lămășanu","lui lambrache":"Lambrache","lui lambrescu":"Lambrescu","lui lambrino":"Lambrino","lui lambru":"Lambru","lui lampa":"Lampă","lui lancranjan":"Lăncrănjan","lui lapadatescu":"Lăpădătescu","lui lapadeanu":"Lăpădeanu","lui lapovita":"Lapoviță","lui laptaru":"Lăptaru","lui lapte":"Lapte","lui laptuca":"Lăptucă","lui lapugeanu":"Lăpugeanu","lui lapusan":"Lăpușan","lui lapusanu":"Lăpușanu","lui lapusneanu":"Lăpușneanu","lui lapusnianu":"Lăpușnianu","lui lapusniceanu":"Lăpușniceanu","lui lapusteanu":"Lăpușteanu","lui largeanu":"Lărgeanu","lui larionescu":"Larionescu","lui lascar":"Lascăr","lui lascarache":"Lăscărache","lui lascaruta":"Lăscăruță","lui lascau":"Lascău","lui laschescu":"Laschescu","lui lasculescu":"Lăsculescu","lui lascus":"Lăscuș","lui lascut":"Lăscuț","lui lastun":"Lăstun","lui latchescu":"Lățchescu","lui latosu":"Lățosu","lui lauda":"Laudă","lui laudat":"Lăudat","lui laudatu":"Lăudatu","lui laurentiu":"Laurențiu","lui lautaru":"Lăutaru","lui lavrinencu":"Lavrinencu","lui lavrinescu":"Lavrinescu","lui lazarean":"Lăzărean","lui lazareanu":"Lăzăreanu","lui lazarel":"Lăzărel","lui lazarencu":["lui lazarencu","Lazarencu","lui lăzărencu","Lăzărencu"],"lui lazarica":"Lăzărică","lui lazariuc":["lui lazariuc","Lazariuc","lui lăzăriuc","Lăzăriuc"],"lui lazaroaia":"Lăzăroaia","lui lazaroi":"Lăzăroi","lui lazaroiu":"Lăzăroiu","lui lazarov":"Lazarov","lui lazarovici":"Lazarovici","lui lazaruca":"Lăzarucă","lui lazaruica":"Lăzăruică","lui lazarut":"Lăzăruț","lui lazescu":"Lăzescu","lui lazurean":"Lăzurean","lui lazureanu":"Lăzureanu","lui leah":"Leah","lui leahu":"Leahu","lui lebada":["lui lebăda","Lebăda","lui lebădă","Lebădă"],"lui lechenteanu":"Lechențeanu","lui lechintan":"Lechințan","lui lechintean":"Lechințean","lui lechiteanu":"Lechițeanu","lui lecu":"Lecu","lui lefegiu":"Lefegiu","lui lefter":"Lefter","lui lefterache":"Lefterache","lui lefterachi":"Lefterachi","lui lefterescu":"Lefterescu","lui leganus":"Legănuș","lui lehaceanu":"Lehăceanu","lui lehintan":"Lehințan","lui lehintanu":"Lehințanu","lui leica":"Leica","lui lelescu":"Lelescu","lui lelestean":"Leleștean","lui lelesteanu":"Leleșteanu","lui lemnariu":"Lemnariu","lui lemnaru":"Lemnaru","lui lenghel":"Lenghel","lui leon":"Leon","lui leonachescu":"Leonăchescu","lui leonard":"Leonard","lui leonescu":"Leonescu","lui leonte":"Leonte","lui leontescu":"Leontescu","lui leontica":"Leontică","lui leontinescu":"Leontinescu","lui leontiuc":"Leontiuc","lui lepadat":"Lepădat","lui lepadatescu":"Lepădătescu","lui lepadatu":"Lepădatu","lui lerca":"Lercă","lui lerescu":"Lerescu","lui leseanu":"Leșeanu","lui lespezeanu":"Lespezeanu","lui leuca":["lui leuca","Leuca","lui leucă","Leucă"],"lui leulescu":"Leulescu","lui leurda":"Leurdă","lui leustean":"Leuștean","lui leusteanu":"Leușteanu","lui levcencu":"Levcencu","lui liahu":"Liahu","lui libenciuc":"Libenciuc","lui lica":"Lică","lui liceanu":"Liceanu","lui licescu":"Licescu","lui lichiardopol":"Lichiardopol","lui licoiu":"Licoiu","lui licsandroiu":"Licsandroiu","lui liculescu":"Liculescu","lui licuriceanu":"Licuriceanu","lui ligotchi":"Ligoțchi","lui liiceanu":"Liiceanu","lui liman":"Liman","lui limba":"Limbă","lui limpede":"Limpede","lui linculescu":"Linculescu","lui lingurar":"Lingurar","lui lingurariu":"Lingurariu","lui linguraru":"Linguraru","lui lingurita":"Linguriță","lui linte":"Linte","lui lintescu":"Lintescu","lui lipan":"Lipan","lui lipanu":"Lipanu","lui lipatti":"Lipatti","lui lipici":"Lipici","lui lipovan":"Lipovan","lui lipovanu":"Lipovanu","lui lipoveanu":"Lipoveanu","lui lipoviceanu":"Lipoviceanu","lui liseanu":"Liseanu","lui lisencu":"Lisencu","lui lisita":"Lișiță","lui lisneanu":"Lișneanu","lui lisnic":"Lisnic","lui litcaneanu":"Lițcăneanu","lui litcanu":"Lițcanu","lui litescu":"Lițescu","lui litoi":"Lițoi","lui litra":"Litră","lui litvinenco":"Litvinenco","lui liubimirescu":"Liubimirescu","lui livada":"Livadă","lui livadariu":"Livădariu","lui livadaru":"Livădaru","lui livedeanu":"Livedeanu","lui livezeanu":"Livezeanu","lui liviu":"Liviu","lui lixandroaia":"Lixăndroaia","lui lixeanu":"Lixeanu","lui loaies":"Loaieș","lui loboda":"Lobodă","lui locusteanu":"Locusteanu","lui loghin":"Loghin","lui loghinas":"Loghinaș","lui logofatu":"Logofătu","lui logofetescu":"Logofetescu","lui logojan":"Logojan","lui lopata":"Lopată","lui lopataru":"Lopătaru","lui loteanu":"Loteanu","lui lotreanu":"Lotreanu","lui lovinescu":"Lovinescu","lui lovisteanu":"Lovișteanu","lui lozovan":"Lozovan","lui lubenita":"Lubeniță","lui luca":"Luca","lui lucacel":"Lucăcel","lui lucachi":"Lucachi","lui lucaci":"Lucaci","lui lucaciu":"Lucaciu","lui lucaciuc":"Lucaciuc","lui lucanescu":"Lucănescu","lui lucasievici":"Lucasievici","lui lucescu":"Lucescu","lui luchescu":"Luchescu","lui luchide":"Luchide","lui luchiniuc":"Luchiniuc","lui lucian":"Lucian","lui lucifer":"Lucifer","lui lucinschi":"Lucinschi","lui luculescu":"Luculescu","lui ludosan":"Ludoșan","lui ludosanu":"Ludoșanu","lui ludosean":"Ludoșean","lui ludusan":"Ludușan","lui lugojan":"Lugojan","lui lugojanu":"Lugojanu","lui lulescu":"Lulescu","lui lumanare":"Lumânare","lui luminararu":"Lumînăraru","lui luminare":"Lumînare","lui luminos":"Luminos","lui luminosu":"Luminosu","lui luna":"Lună","lui lunca":"Luncă","lui luncaru":"Luncaru","lui luncasu":"Luncașu","lui lung":"Lung","lui lunganoiu":"Lungănoiu","lui lungeanu":"Lungeanu","lui lungescu":"Lungescu","lui lungoaia":"Lungoaia","lui lungu":"Lungu","lui lungulescu":"Lungulescu","lui lungut":"Lunguț","lui lungutescu":"Lunguțescu","lui lup":"Lup","lui lupaceanu":"Lupăceanu","lui lupacescu":"Lupăcescu","lui lupaiescu":"Lupăiescu","lui lupanescu":"Lupănescu","lui lupastean":"Lupăștean","lui lupasteanu":"Lupășteanu","lui lupescu":"Lupescu","lui lupica":"Lupică","lui lupoae":"Lupoae","lui lupoi":"Lupoi","lui lupsan":"Lupșan","lui lupseneanu":"Lupșeneanu","lui lupsescu":"Lupșescu","lui lupsoiu":"Lupșoiu","lui lupulescu":"Lupulescu","lui lupulet":"Lupuleț","lui lupulete":"Lupulete","lui luput":"Lupuț","lui luscan":"Lușcan","lui lutai":"Luțai","lui lutas":"Luțaș","lui lutescu":"Luțescu","lui lutoiu":"Luțoiu","lui nada":["lui nada","Nada","lui nadă","Nadă"],"lui nadaban":"Nădăban","lui nadasan":"Nădășan","lui nadasanu":"Nădășanu","lui nadasean":"Nădășean","lui nadaseanu":"Nădășeanu","lui nadastean":"Nădăștean","lui nadejde":"Nădejde","lui nadisan":"Nădișan","lui nadlacan":"Nădlăcan","lui nadoleanu":"Nadoleanu","lui nadrag":"Nădrag","lui nae":"Nae","lui naescu":"Năescu","lui nagat":"Nagâț","lui naghi":"Naghi","lui naghiu":"Naghiu","lui nagit":"Nagîț","lui nalbariu":"Nălbariu","lui nalbaru":"Nălbaru","lui naltu":"Naltu","lui naluca":"Nălucă","lui namolosu":"Nămolosu","lui nan":"Nan","lui nanastean":"Nănăștean","lui nanescu":"Nănescu","lui nanestean":"Năneștean","lui nantoi":"Nantoi","lui nanulescu":"Nanulescu","lui nanut":"Nănuț","lui naparca":"Năpârcă","lui napirca":"Năpîrcă","lui napu":"Napu","lui nasalean":"Năsălean","lui nasaleanu":"Năsăleanu","lui nasaudean":"Năsăudean","lui nasaudeanu":"Năsăudeanu","lui nasoi":"Năsoi","lui nastasache":"Năstăsache","lui nastasachi":"Năstăsachi","lui nastasescu":"Năstăsescu","lui nastasoiu":"Năstăsoiu","lui nastrusnicu":"Năstrușnicu","lui nasturas":"Năsturaș","lui nasturel":"Năsturel","lui nasturescu":"Năsturescu","lui nasturica":"Năsturică","lui nasuescu":"Năsuescu","lui nataliuc":"Nataliuc","lui natarau":"Nătărău","lui naumencu":"Naumencu","lui naumescu":"Naumescu","lui naumovici":"Naumovici","lui navala":"Năvală","lui navodaru":"Năvodaru","lui navrescu":"Navrescu","lui nazdravan":"Năzdrăvan","lui nazdravanu":"Năzdrăvanu","lui neacsoiu":"Neacșoiu","lui neagoi":"Neagoi","lui neagomir":"Neagomir","lui neagu":"Neagu","lui neamtiu":"Neamțiu","lui neamtu":"Neamțu","lui neamu":"Neamu","lui nebunescu":"Nebunescu","lui nebunu":"Nebunu","lui nechiforel":"Nechiforel","lui nechiforescu":"Nechiforescu","lui nechiforoae":"Nechiforoae","lui nechitescu":"Nechitescu","lui nechitoae":"Nechitoae","lui nechitoaia":["lui nechitoaia","Nechitoaia","lui nechițoaia","Nechițoaia"],"lui nechitus":"Nechituș","lui necoara":"Necoară","lui necolaiciuc":"Necolaiciuc","lui necrelescu":"Necrelescu","lui necsescu":"Necșescu","lui necsoi":"Necșoi","lui necsoiu":"Necșoiu","lui necsulea":"Necșulea","lui necsulescu":"Necșulescu","lui necsuta":"Necșuță","lui neculaescu":"Neculăescu","lui neculaica":"Neculăică","lui neculaide":"Neculaide","lui neculaiescu":"Neculăiescu","lui neculaita":"Neculăiță","lui neculescu":"Neculescu","lui neculicioiu":"Neculicioiu","lui neculita":"Neculiță","lui neculoiu":"Neculoiu","lui necuratul":"Necuratul","lui nedeianu":"Nedeianu","lui nedelcioiu":"Nedelcioiu","lui nedelciuc":"Nedelciuc","lui nedelcu":"Nedelcu","lui nedelcut":"Nedelcuț","lui nedelcuta":"Nedelcuță","lui nedelescu":"Nedelescu","lui nedeloaia":"Nedeloaia","lui nedeloiu":"Nedeloiu","lui nedelut":"Nedeluț","lui nedescu":"Nedescu","lui nedita":"Nediță","lui neferoiu":"Neferoiu","lui neferu":"Neferu","lui negescu":"Negescu","lui neghina":"Neghină","lui negoescu":"Negoescu","lui negoesteanu":"Negoeșteanu","lui negoias":"Negoiaș","lui negoiescu":"Negoiescu","lui negoita":"Negoiță","lui negoitescu":"Negoițescu","lui negomireanu":"Negomireanu","lui negot":"Negoț","lui negran":"Negran","lui negreanu":"Negreanu","lui negrescu":"Negrescu","lui negresteanu":"Negreșteanu","lui negricioiu":"Negricioiu","lui negrila":"Negrilă","lui negriloiu":"Negriloiu","lui negroiu":"Negroiu","lui negru":"Negru","lui negrulescu":"Negrulescu","lui negrus":"Negruș","lui negrut":"Negruț","lui negruta":["lui negruța","Negruța","lui negruță","Negruță"],"lui negucioiu":"Negucioiu","lui negulescu":"Negulescu","lui negulet":"Neguleț","lui negura":["lui negura","Negura","lui negură","Negură"],"lui negurescu":"Negurescu","lui negustor":"Negustor","lui negustoru":"Negustoru","lui negut":"Neguț","lui neguta":"Neguță","lui negutescu":"Neguțescu","lui negutoiu":"Neguțoiu","lui neica":"Neică","lui neiculescu":"Neiculescu","lui neicutescu":"Neicuțescu","lui nejloveanu":"Nejloveanu","lui nelu":"Nelu","lui nelus":"Neluș","lui nelutescu":"Neluțescu","lui nemes":"Nemeș","lui nemescu":"Nemescu","lui nemesu":"Nemeșu","lui nemoianu":"Nemoianu","lui nemteanu":"Nemțeanu","lui nemtoi":"Nemțoi","lui nemtoiu":"Nemțoiu","lui nemtut":"Nemțuț","lui nenciulescu":"Nenciulescu","lui nenestean":"Neneștean","lui nenica":"Nenică","lui nenita":"Neniță","lui nenitescu":"Nenițescu","lui nenitoiu":"Nenițoiu","lui neofit":"Neofit","lui nepotu":"Nepotu","lui nespalatu":"Nespălatu","lui nesteriuc":"Nesteriuc","lui nestorescu":"Nestorescu","lui netedu":"Netedu","lui netoi":"Nețoi","lui netotu":"Netotu","lui nevazutu":"Nevăzutu","lui nevoie":"Nevoie","lui nica":"Nică","lui nichescu":"Nichescu","lui nichifor":"Nichifor","lui nichiforel":"Nichiforel","lui nichiforescu":"Nichiforescu","lui nichiforiuc":"Nichiforiuc","lui nichiforov":"Nichiforov","lui nichitoaia":"Nichitoaia","lui nichitoi":"Nichitoi","lui nichitoiu":["lui nichitoiu","Nichitoiu","lui nichițoiu","Nichițoiu"],"lui nichitus":"Nichituș","lui nichitut":"Nichituț","lui nicodinescu":"Nicodinescu","lui nicogosian":"Nicogosian","lui nicolae":"Nicolae","lui nicolaescu":["lui nicolaescu","Nicolaescu","lui nicolăescu","Nicolăescu"],"lui nicolaica":"Nicolaică","lui nicolaiciuc":"Nicolaiciuc","lui nicolaide":"Nicolaide","lui nicolaita":"Nicolăiță","lui nicolas":"Nicolaș","lui nicolau":"Nicolau","lui nicolcescu":"Nicolcescu","lui nicolcioiu":"Nicolcioiu","lui nicolescu":"Nicolescu","lui nicolica":"Nicolică","lui nicolicescu":"Nicolicescu","lui nicolicioiu":"Nicolicioiu","lui nicolita":"Nicoliță","lui nicolitoiu":"Nicolițoiu","lui nicolschi":"Nicolschi","lui nicopol":"Nicopol","lui nicoras":"Nicoraș","lui nicorescu":"Nicorescu","lui nicorut":"Nicoruț","lui nicovala":"Nicovală","lui nicu":"Nicu","lui niculaescu":["lui niculaescu","Niculaescu","lui niculăescu","Niculăescu"],"lui niculaiciuc":"Niculaiciuc","lui niculaide":"Niculaide","lui niculaita":"Niculăiță","lui niculas":"Niculaș","lui niculescu":"Niculescu","lui niculet":"Niculeț","lui niculete":"Niculete","lui niculica":"Niculică","lui niculicioiu":"Niculicioiu","lui niculita":"Niculiță","lui niculut":"Niculuț","lui niculuta":"Niculuță","lui nicurut":"Nicuruț","lui nicusor":"Nicușor","lui nicut":"Nicuț","lui nicuta":"Nicuță","lui nilescu":"Nilescu","lui nimara":"Nimară","lui nimereala":"Nimereală","lui nimigean":"Nimigean","lui nimigeanu":"Nimigeanu","lui nimingeanu":"Nimingeanu","lui ninoiu":"Ninoiu","lui niresteanu":"Nireșteanu","lui niscoveanu":"Nișcoveanu","lui nisip":"Nisip","lui nisiparu":"Nisiparu","lui nisipeanu":"Nisipeanu","lui nistoran":"Nistoran","lui nistoras":"Nistoraș","lui nistorel":"Nistorel","lui nistorescu":"Nistorescu","lui nistorica":"Nistorică","lui nistoroaia":"Nistoroaia","lui nistoroi":"Nistoroi","lui nistoroiu":"Nistoroiu","lui nistrean":"Nistrean","lui nistreanu":"Nistreanu","lui nistrian":"Nistrian","lui nisulescu":"Nișulescu","lui nita":"Niță","lui nitas":"Nițaș","lui nitel":"Nițel","lui nitescu":"Nițescu","lui nitica":"Nițică","lui nitoae":"Nițoae","lui nitoaia":"Nițoaia","lui nitoiu":"Nițoiu","lui nituca":"Nițucă","lui nituica":"Nițuică","lui nitulescu":"Nițulescu","lui nitulica":"Nițulică","lui noaghi":"Noaghi","lui noapte":"Noapte","lui nohai":"Nohai","lui nojogan":"Nojogan","lui nor":"Nor","lui norescu":"Norescu","lui norisor":"Norișor","lui noroc":"Noroc","lui norocel":"Norocel","lui noroi":"Noroi","lui noslacan":"Noșlăcan","lui notar":"Notar","lui nour":"Nour","lui nourescu":"Nourescu","lui novaceanu":"Novăceanu","lui novacescu":"Novăcescu","lui novacovschi":"Novacovschi","lui novitchi":"Novițchi","lui nuca":"Nucă","lui nucsoreanu":"Nucșoreanu","lui nunescu":"Nunescu","lui nusfelean":"Nușfelean","lui nutescu":"Nuțescu","lui nutica":"Nuțică","lui nutoiu":"Nuțoiu","lui nutulescu":"Nuțulescu","lui nutuloiu":"Nuțuloiu","lui oachesu":"Oacheșu","lui oaie":"Oaie","lui oala":["lui oala","Oala","lui oală","Oală"],"lui oaselate":"Oaselate","lui oasenegre":"Oasenegre","lui oaserele":"Oaserele","lui obedenaru":"Obedenaru","lui obiala":"Obială","lui obilisteanu":"Obilișteanu","lui obirsie":"Obîrșie","lui oblu":"Oblu","lui obogeanu":"Obogeanu","lui oboroc":"Oboroc","lui obradovici":"Obradovici","lui obrejan":"Obrejan","lui obrescu":"Obrescu","lui oceanu":"Oceanu","lui ochean":"Ochean","lui ocheanu":"Ocheanu","lui ochenatu":"Ochenatu","lui ochesel":"Ocheșel","lui ochialb":"Ochialb","lui ochialbi":"Ochialbi","lui ochiosu":"Ochiosu","lui ochirosi":"Ochiroși","lui ochirosii":"Ochiroșii","lui ochisor":"Ochișor","lui ochiu":"Ochiu","lui ochiulet":"Ochiuleț","lui ocnarescu":"Ocnărescu","lui ocnasu":"Ocnașu","lui ocoleanu":"Ocoleanu","lui odae":"Odae","lui odagescu":"Odăgescu","lui odagiu":"Odagiu","lui odaianu":"Odăianu","lui odnostalco":"Odnostalco","lui odobescu":"Odobescu","lui odobesteanu":"Odobeșteanu","lui odobestianu":"Odobeștianu","lui odobisteanu":"Odobișteanu","lui odor":"Odor","lui odorhean":"Odorhean","lui odorhelean":"Odorhelean","lui oejdean":"Oejdean","lui oeru":"Oeru","lui ofiterescu":"Ofițerescu","lui ofiteru":"Ofițeru","lui ogaru":"Ogaru","lui oglinda":"Oglindă","lui oglindaru":"Oglindaru","lui oglindoiu":"Oglindoiu","lui ogor":"Ogor","lui ograda":"Ogradă","lui ohanesian":"Ohanesian","lui oieru":"Oieru","lui oinacaru":"Oinăcaru","lui oiste":"Oiște","lui oisteanu":"Oișteanu","lui oita":"Oiță","lui olah":"Olah","lui olahut":"Olăhuț","lui olan":"Olan","lui olaneanu":"Olăneanu","lui olanescu":"Olănescu","lui olangiu":"Olangiu","lui olar":"Olar","lui olaras":"Olăraș","lui olarasu":["lui olarașu","Olarașu","lui olărașu","Olărașu"],"lui olarean":"Olărean","lui olareanu":"Olăreanu","lui olarescu":"Olărescu","lui olariu":"Olariu","lui olaroiu":"Olăroiu","lui olaru":"Olaru","lui olcean":"Olcean","lui oleniuc":"Oleniuc","lui olescu":"Olescu","lui olinescu":"Olinescu","lui oliniuc":"Oliniuc","lui olita":"Oliță","lui ologeanu":"Ologeanu","lui ologu":"Ologu","lui oltean":"Oltean","lui olteanu":"Olteanu","lui oltenas":"Oltenaș","lui oltenescu":"Oltenescu","lui olteniceanu":"Olteniceanu","lui olteteanu":"Oltețeanu","lui oltianu":"Oltianu","lui omescu":"Omescu","lui ometita":"Ometiță","lui omusoru":"Omușoru","lui onanie":"Onanie","lui oncel":"Oncel","lui oncescu":"Oncescu","lui oncica":"Oncică","lui oncioiu":"Oncioiu","lui onciulescu":"Onciulescu","lui onel":"Onel","lui onescu":"Onescu","lui onet":"Oneț","lui onete":"Onete","lui onica":"Onică","lui onicioiu":"Onicioiu","lui onita":"Oniță","lui onitescu":"Onițescu","lui onitoaia":"Onițoaia","lui onitoiu":"Onițoiu","lui onofras":"Onofraș","lui onofreciuc":"Onofreciuc","lui onofriciuc":"Onofriciuc","lui onoiu":"Onoiu","lui ontoiu":"Onțoiu","lui onufreiciuc":"Onufreiciuc","lui onufriciuc":"Onufriciuc","lui onufrie":"Onufrie","lui onulescu":"Onulescu","lui opait":"Opaiț","lui oparit":"Opărit","lui opinca":"Opincă","lui opincar":"Opincar","lui opincariu":"Opincariu","lui opincaru":"Opincaru","lui opranescu":"Oprănescu","lui oprescu":"Oprescu","lui oprica":"Oprică","lui oprinescu":"Oprinescu","lui oprinoiu":"Oprinoiu","lui oprisanescu":"Oprișănescu","lui oprisenescu":"Oprișenescu","lui oprisescu":"Oprișescu","lui oprisoi":"Oprișoi","lui oprisoiu":"Oprișoiu","lui oprisoreanu":"Oprișoreanu","lui opritescu":"Oprițescu","lui opritoiu":"Oprițoiu","lui oproiu":"Oproiu","lui oprut":"Opruț","lui orasean":"Orășean","lui oraseanu":"Orășeanu","lui orasel":"Orășel","lui orastean":"Orăștean","lui orasteanu":"Orășteanu","lui oraviceanu":"Orăviceanu","lui oravitan":"Orăvițan","lui orb":"Orb","lui orban":"Orban","lui orbisor":"Orbișor","lui orboiu":"Orboiu","lui orbu":"Orbu","lui orbulescu":"Orbulescu","lui orbulet":"Orbuleț","lui oreviceanu":"Oreviceanu","lui orfanu":"Orfanu","lui orghidan":"Orghidan","lui orhean":"Orhean","lui orheanu":"Orheanu","lui orheian":"Orheian","lui orhian":"Orhian","lui orleanu":"Orleanu","lui ormenisan":"Ormenișan","lui ormindean":"Ormindean","lui ormindeanu":"Ormindeanu","lui oroviceanu":"Oroviceanu","lui ortelecan":"Ortelecan","lui orz":"Orz","lui orzan":"Orzan","lui orzaru":"Orzaru","lui orzescu":"Orzescu","lui osiceanu":"Osiceanu","lui osoianu":"Osoianu","lui osorhean":"Oșorhean","lui osorheian":"Oșorheian","lui ostas":"Ostaș","lui ostriceanu":"Ostriceanu","lui ostrovanu":"Ostrovanu","lui ostroveanu":"Ostroveanu","lui otava":"Otavă","lui otel":"Oțel","lui otelariu":"Oțelariu","lui oteleanu":"Oțeleanu","lui otelescu":"Oțelescu","lui otescu":"Otescu","lui otesteanu":"Oteșteanu","lui otet":"Oțet","lui otrava":"Otravă","lui otrocol":"Otrocol","lui ou":"Ou","lui ovrei":"Ovrei","lui ovreiu":"Ovreiu","lui ovreuta":"Ovreuță","lui raboj":"Răboj","lui racanel":"Răcănel","lui racar":"Răcar","lui racareanu":"Răcăreanu","lui racariu":"Răcariu","lui racaru":"Răcaru","lui racataian":"Răcătăian","lui racatean":"Răcătean","lui racautanu":"Răcăuțanu","lui raceala":"Răceală","lui raceanu":"Răceanu","lui racescu":"Răcescu","lui rachita":"Răchită","lui rachitan":"Răchitan","lui rachiteanu":"Răchiteanu","lui racitu":"Răcitu","lui raclaru":"Răclaru","lui racoare":"Răcoare","lui racoceanu":"Racoceanu","lui racota":"Racotă","lui racovan":"Racovan","lui racovanu":"Racovanu","lui racoveanu":"Racoveanu","lui racoviceanu":"Racoviceanu","lui racovita":"Racoviță","lui racovitan":"Racovițan","lui racoviteanu":"Racovițeanu","lui radaceanu":"Rădăceanu","lui radacina":"Rădăcină","lui radauceanu":"Rădăuceanu","lui radautanu":"Rădăuțanu","lui radescu":"Rădescu","lui radita":"Rădiță","lui radmanestean":"Rădmăneștean","lui radoi":"Rădoi","lui radoias":"Rădoiaș","lui radoiescu":"Rădoiescu","lui radoslavescu":"Radoslăvescu","lui radoslovescu":"Radoslovescu","lui radovicescu":"Radovicescu","lui radu":"Radu","lui raduca":"Răducă","lui raducanescu":"Răducănescu","lui raducanoiu":"Răducănoiu","lui raducanu":"Răducanu","lui raducioiu":"Răducioiu","lui raducu":"Răducu","lui raduica":"Răduică","lui radulea":"Rădulea","lui raduleanu":"Răduleanu","lui radulescu":"Rădulescu","lui radulet":"Răduleț","lui radulica":"Rădulică","lui radus":"Răduș","lui radut":"Răduț","lui raduta":"Răduță","lui radutoi":"Răduțoi","lui radutoiu":"Răduțoiu","lui radvan":"Rădvan","lui raescu":"Răescu","lui rafiroiu":"Rafiroiu","lui raftopol":"Raftopol","lui ragalie":"Răgălie","lui ragusitu":"Răgușitu","lui rahaianu":"Răhăianu","lui rahovan":"Rahovan","lui rahovean":["lui rahovean","Rahovean","lui răhovean","Răhovean"],"lui rahoveanu":"Rahoveanu","lui raiciulescu":"Răiciulescu","lui raicoviceanu":"Raicoviceanu","lui rajnoveanu":"Râjnoveanu","lui ralescu":"Ralescu","lui ramniceanu":"Râmniceanu","lui ramnicianu":"Râmnicianu","lui ramura":"Ramură","lui randasu":"Rândașu","lui ranetescu":["lui ranetescu","Ranetescu","lui rănetescu","Rănetescu"],"lui ranga":["lui ranga","Ranga","lui rangă","Rangă"],"lui ranghet":"Rangheț","lui rapiteanu":"Răpițeanu","lui raru":"Raru","lui raschitor":"Rășchitor","lui rascol":"Răscol","lui rasina":"Rășină","lui rasinar":"Rășinar","lui rasinariu":"Rășinariu","lui rasinaru":"Rășinaru","lui rasnita":"Râșniță","lui rasoviceanu":"Rasoviceanu","lui raspopescu":"Răspopescu","lui rasteanu":"Răsteanu","lui rastoaca":"Răstoacă","lui rastoceanu":"Răstoceanu","lui rasvanescu":"Răsvănescu","lui rata":["lui rața","Rața","lui rață","Rață"],"lui ratescu":"Rățescu","lui raucescu":"Răucescu","lui raulescu":"Răulescu","lui rautescu":"Răuțescu","lui rautu":"Răutu","lui ravas":"Răvaș","lui razboiu":"Războiu","lui razmerita":"Răzmeriță","lui razor":"Răzor","lui razus":"Răzuș","lui razvan":"Răzvan","lui rebegila":"Rebegilă","lui rebenciuc":"Rebenciuc","lui rebengiuc":"Rebengiuc","lui rebrean":"Rebrean","lui rebreanu":"Rebreanu","lui rebrisorean":"Rebrișorean","lui rebrisoreanu":"Rebrișoreanu","lui referendaru":"Referendaru","lui remes":"Remeș","lui remetean":["lui remetean","Remetean","lui remețean","Remețean"],"lui remetian":"Remețian","lui renescu":"Renescu","lui repede":"Repede","lui repezis":"Repeziș","lui rescan":"Reșcan","lui resceanu":"Reșceanu","lui resteanu":"Resteanu","lui reteanu":"Reteanu","lui retesan":"Reteșan","lui retezan":"Retezan","lui revenco":"Revenco","lui rezeanu":"Rezeanu","lui reznicencu":"Reznicencu","lui rica":"Rică","lui ridiche":"Ridiche","lui rijnoveanu":"Rîjnoveanu","lui rimniceanu":"Rîmniceanu","lui rinculescu":"Rînculescu","lui rindasu":"Rîndașu","lui rindunica":"Rîndunică","lui rinza":"Rînză","lui ripa":"Rîpă","lui riscanu":"Rîșcanu","lui risipeanu":"Risipeanu","lui risnita":"Rîșniță","lui risnoveanu":"Rîșnoveanu","lui ristoiu":"Ristoiu","lui rizeanu":"Rizeanu","lui rizescu":"Rizescu","lui rizoiu":"Rizoiu","lui roata":"Roată","lui rob":"Rob","lui robe":"Robe","lui robescu":"Robescu","lui robete":"Robete","lui robitu":"Robitu","lui roboiu":"Roboiu","lui robota":"Robotă","lui robu":"Robu","lui robulet":"Robuleț","lui rodila":"Rodilă","lui rodinciuc":"Rodinciuc","lui roescu":"Roescu","lui rogalschi":"Rogalschi","lui rogojan":"Rogojan","lui rogojanu":"Rogojanu","lui rogojean":"Rogojean","lui rogojeanu":"Rogojeanu","lui rogojina":"Rogojină","lui rogojinaru":"Rogojinaru","lui rogojinoiu":"Rogojinoiu","lui rogosca":"Rogoșcă","lui rogoveanu":"Rogoveanu","lui rogozan":"Rogozan","lui rogozanu":"Rogozanu","lui rogozeanu":"Rogozeanu","lui roib":"Roib","lui roiban":"Roiban","lui roibescu":"Roibescu","lui roibu":"Roibu","lui roinita":"Roiniță","lui roiu":"Roiu","lui rojisteanu":"Rojișteanu","lui romanasu":"Românașu","lui romanenco":"Romanenco","lui romanescu":"Romanescu","lui romanica":"Romanică","lui romanita":"Romaniță","lui romanitoiu":"Romanițoiu","lui romaniuc":"Romaniuc","lui romanu":"Românu","lui romascan":"Romașcan","lui romascanu":"Romașcanu","lui romete":"Romete","lui rominu":"Romînu","lui romulescu":"Romulescu","lui ros":"Roș","lui rosca":["lui roșca","Roșca","lui roșcă","Roșcă"],"lui roscaneanu":"Roșcăneanu","lui roscoiu":"Roșcoiu","lui roscolescu":"Roscolescu","lui roscovan":"Roșcovan","lui roscovanu":"Roșcovanu","lui rosculescu":"Roșculescu","lui rosculet":"Roșculeț","lui rosculete":"Roșculete","lui rosescu":"Roșescu","lui roseti":"Roseti","lui rosioara":"Roșioară","lui rosioreanu":"Roșioreanu","lui rosoiu":"Roșoiu","lui rosulescu":"Roșulescu","lui rotar":"Rotar","lui rotareanu":"Rotăreanu","lui rotarescu":"Rotărescu","lui rotari":"Rotari","lui rotariu":"Rotariu","lui rotescu":"Rotescu","lui rotman":"Rotman","lui rotund":"Rotund","lui rotundu":"Rotundu","lui roua":"Rouă","lui rozescu":"Rozescu","lui rozmarin":"Rozmarin","lui rucarean":"Rucărean","lui rucareanu":"Rucăreanu","lui rucarescu":"Rucărescu","lui rucsandescu":"Rucsăndescu","lui rudareanu":"Rudăreanu","lui rudariu":"Rudariu","lui rudaru":"Rudaru","lui rudeanu":"Rudeanu","lui rudenco":"Rudenco","lui rudencu":"Rudencu","lui rudescu":"Rudescu","lui rudisteanu":"Rudișteanu","lui rudoi":"Rudoi","lui rug":"Rug","lui rugeanu":"Rugeanu","lui rugina":"Rugină","lui ruginescu":"Ruginescu","lui rugu":"Rugu","lui rugulet":"Ruguleț","lui ruican":"Ruican","lui rujan":"Rujan","lui runcan":"Runcan","lui runcanu":"Runcanu","lui runcean":"Runcean","lui runceanu":"Runceanu","lui runcianu":"Runcianu","lui ruptureanu":"Ruptureanu","lui rusanescu":"Rusănescu","lui ruscanu":"Ruscanu","lui rusescu":["lui rusescu","Rusescu","lui rușescu","Rușescu"],"lui ruset":"Rușeț","lui rusnac":"Rusnac","lui rusnaciuc":"Rusnaciuc","lui rusnacu":"Rusnacu","lui rusneac":"Rusneac","lui rusoaia":"Rusoaia","lui rusoiu":"Rusoiu","lui russo":"Russo","lui rustoiu":"Rustoiu","lui rusu":"Rusu","lui rusulescu":"Rusulescu","lui rusulet":"Rusuleț","lui tabacar":"Tăbăcar","lui tabacariu":"Tăbăcariu","lui tabacaru":"Tăbăcaru","lui tabacila":"Tăbăcilă","lui tabacioiu":"Tăbăcioiu","lui tabacitu":"Tăbăcitu","lui tabacu":"Tabacu","lui tabara":"Tabără","lui tabaroiu":"Tăbăroiu","lui tabirca":"Tăbîrcă","lui tabla":"Tablă","lui tache":"Tache","lui taciune":"Tăciune","lui taculescu":"Tăculescu","lui tacutu":"Tăcutu","lui tagsorean":"Tâgșorean","lui taiatu":"Tăiatu","lui taifas":"Taifas","lui taina":"Taină","lui talanga":"Talangă","lui talasman":"Talașman","lui talos":"Taloș","lui talpa":"Talpă","lui talpalaru":"Talpalaru","lui talpan":"Tălpan","lui talpanescu":"Tălpănescu","lui talpeanu":"Tălpeanu","lui talpescu":"Tălpescu","lui tamas":["lui tamas","Tamas","lui tămaș","Tămaș"],"lui tamasoiu":"Tămășoiu","lui tambalau":"Tămbălău","lui tampescu":"Tâmpescu","lui tamplarescu":"Tâmplărescu","lui tamplaru":"Tâmplaru","lui tanasachi":"Tanasachi","lui tanasciuc":"Tanasciuc","lui tanasescu":"Tănăsescu","lui tanasica":"Tănăsică","lui tanasoiu":"Tănăsoiu","lui tanasuca":"Tănăsucă","lui tandara":"Țandără","lui tandareanu":"Țăndăreanu","lui tandarescu":"Țăndărescu","lui tandarica":"Țăndărică","lui tanescu":"Tănescu","lui tanoviceanu":"Tanoviceanu","lui tantar":"Țânțar","lui tantaru":"Țânțaru","lui tantos":"Țanțoș","lui tap":"Țap","lui tapliuc":"Țapliuc","lui taposu":"Țăposu","lui taraboanta":"Tărăboanță","lui taraboi":"Tărăboi","lui taralunga":"Țarălungă","lui taran":"Țăran","lui tarana":"Țărână","lui taranu":"Țăranu","lui tararache":"Tararache","lui tarasenie":"Tărășenie","lui tarasescu":"Tărășescu","lui tarata":"Tărâță","lui tarbalescu":"Tarbalescu","lui tarcaoanu":"Tărcăoanu","lui tarcatu":"Tărcatu","lui tarcovnicu":"Țârcovnicu","lui tarcu":"Țarcu","lui tariceanu":"Tăriceanu","lui tarigradeanu":"Țărigrădeanu","lui tarina":"Țarină","lui tarita":"Tărîță","lui tarite":"Tărîțe","lui tariuc":"Țariuc","lui tarlungeanu":"Țărlungeanu","lui tarmure":"Țărmure","lui tarnacop":"Târnăcop","lui tarnauceanu":["lui târnăuceanu","Târnăuceanu","lui tărnăuceanu","Tărnăuceanu"],"lui tarnavean":"Târnăvean","lui tarniceanu":"Tărniceanu","lui tarnita":"Tarniță","lui taroiu":"Țăroiu","lui tartacuta":"Tărtăcuță","lui tartaleanu":"Țărțăleanu","lui tarus":"Țăruș","lui tarzioru":"Târzioru","lui tarziu":"Târziu","lui tata":"Țață","lui tatar":"Tătar","lui tataran":"Tătăran","lui tataras":"Tătăraș","lui tatarasanu":"Tătărășanu","lui tatarciuc":"Tatarciuc","lui tatarescu":"Tătărescu","lui tataroi":"Tătăroi","lui tatarus":"Tătăruș","lui tatarusanu":"Tătărușanu","lui tatoiu":"Tatoiu","lui tatomirescu":"Tatomirescu","lui tatucu":"Tătucu","lui tatulea":["lui tatulea","Tatulea","lui tătulea","Tătulea"],"lui tatulescu":["lui tatulescu","Tatulescu","lui tătulescu","Tătulescu"],"lui tatut":"Tătuț","lui taulescu":"Tăulescu","lui taune":"Tăune","lui taurescu":"Tăurescu","lui tautan":["lui tăutan","Tăutan","lui tăuțan","Tăuțan"],"lui tautu":"Tăutu","lui tavaluc":"Tăvăluc","lui tavan":"Tavan","lui tavitian":"Tavitian","lui tazlaoanu":"Tăzlăoanu","lui tazlauanu":"Tăzlăuanu","lui tcaciuc":"Tcaciuc","lui teaca":"Teacă","lui teava":"Țeavă","lui tecaciuc":"Tecaciuc","lui tecioiu":"Tecioiu","lui tecucean":"Tecucean","lui tecuceanu":"Tecuceanu","lui tecucianu":"Tecucianu","lui teculescu":"Teculescu","lui tecusan":"Tecușan","lui tecusanu":"Tecușanu","lui teica":"Teică","lui teisanu":"Teișanu","lui teleaga":"Teleagă","lui teleanu":"Teleanu","lui telegariu":"Telegariu","lui telegaru":"Telegaru","lui telegeanu":"Telegeanu","lui telegescu":"Telegescu","lui teleguta":"Teleguță","lui telescu":"Telescu","lui teligradeanu":"Țeligrădeanu","lui telina":"Țelină","lui tematoru":"Temătoru","lui temciuc":"Temciuc","lui temelie":"Temelie","lui temesan":"Temeșan","lui temisan":"Temișan","lui temisanu":"Temișanu","lui tenescu":"Țenescu","lui teoctist":"Teoctist","lui teodorascu":"Teodorașcu","lui teodoreanu":"Teodoreanu","lui teodorel":"Teodorel","lui teodorescu":"Teodorescu","lui teodorof":"Teodorof","lui teodoroiu":"Teodoroiu","lui teodoropol":"Teodoropol","lui teodorov":"Teodorov","lui teodorovici":"Teodorovici","lui teodoru":"Teodoru","lui teodosescu":"Teodosescu","lui teofanescu":"Teofănescu","lui teofilescu":"Teofilescu","lui tepelus":"Țepeluș","lui tepos":"Țepos","lui teposu":"Țeposu","lui tepusa":"Țepușă","lui terceanu":"Terceanu","lui terebesteanu":"Terebeșteanu","lui terfaloaga":"Terfăloagă","lui terhes":"Terheș","lui ternavean":"Ternăvean","lui terteleac":"Terteleac","lui tertereanu":"Tertereanu","lui tescovina":"Tescovină","lui tesila":"Teșilă","lui tesileanu":"Teșileanu","lui teslariu":"Teslariu","lui teslaru":"Teslaru","lui theodorescu":"Theodorescu","lui thomescu":"Thomescu","lui tibanescu":"Țibănescu","lui tichie":"Tichie","lui tichindelean":"Țichindelean","lui tichindeleanu":"Țichindeleanu","lui tichiuta":"Tichiuță","lui ticuleanu":"Ticuleanu","lui ticulescu":["lui ticulescu","Ticulescu","lui țiculescu","Țiculescu"],"lui ticus":"Țicuș","lui tidula":"Țidulă","lui tigan":"Țigan","lui tiganas":"Țigănaș","lui tiganasu":"Țigănașu","lui tiganescu":"Țigănescu","lui tiganesteanu":"Țigăneșteanu","lui tiganete":"Țigănete","lui tiganica":"Țigănică","lui tiganila":"Țigănilă","lui tiganita":"Țigăniță","lui tiganiuc":["lui țiganiuc","Țiganiuc","lui țigăniuc","Țigăniuc"],"lui tiganoiu":"Țigănoiu","lui tiganu":"Țiganu","lui tiganus":"Țigănuș","lui tigla":["lui țigla","Țigla","lui țiglă","Țiglă"],"lui tilica":"Țilică","lui tilinca":["lui tilinca","Tilinca","lui tilincă","Tilincă"],"lui tilita":"Tiliță","lui timar":"Timar","lui timariu":"Timariu","lui timaru":"Timaru","lui timburescu":"Țîmburescu","lui timeu":"Timeu","lui timisan":"Timișan","lui timisescu":"Timișescu","lui timoceanu":"Timoceanu","lui timofciuc":"Timofciuc","lui timoficiuc":"Timoficiuc","lui timoftel":"Timoftel","lui timoftescu":"Timoftescu","lui timofticiuc":"Timofticiuc","lui timotei":"Timotei","lui timotel":"Timotel","lui timpescu":"Tîmpescu","lui timplarescu":"Tîmplărescu","lui timplaru":"Tîmplaru","lui timpu":"Tîmpu","lui timpuriu":"Timpuriu","lui timulescu":"Timulescu","lui timus":"Timuș","lui tinaru":"Tînăru","lui tincau":"Tincău","lui tincu":"Țîncu","lui tinica":"Tinică","lui tinjala":"Tînjală","lui tinta":"Țintă","lui tintar":"Țînțar","lui tintaru":"Țînțaru","lui tintas":"Țintaș","lui tintila":"Țintilă","lui tiparu":"Țiparu","lui tiplica":"Țiplică","lui tipsie":"Tipsie","lui tircavu":"Tîrcavu","lui tircovnicu":"Țîrcovnicu","lui tirgovet":"Tîrgoveț","lui tirgovetu":"Tîrgovețu","lui tirla":["lui tîrla","Tîrla","lui tîrlă","Tîrlă"],"lui tirlescu":"Țîrlescu","lui tirna":["lui tîrna","Tîrna","lui tîrnă","Tîrnă"],"lui tirnacop":"Tîrnăcop","lui tirnavan":"Tîrnăvan","lui tirnavean":"Tîrnăvean","lui tirnaveanu":"Tîrnăveanu","lui tirnoveanu":"Tîrnoveanu","lui tiroiu":"Țiroiu","lui tironeac":"Tironeac","lui tirsu":"Tîrșu","lui tirulescu":"Țirulescu","lui tirzioru":"Tîrzioru","lui tirziu":"Tîrziu","lui tisan":"Tisan","lui tiseanu":"Tiseanu","lui tismaneanu":"Tismăneanu","lui titeica":["lui țițeica","Țițeica","lui țițeică","Țițeică"],"lui titescu":"Titescu","lui titica":"Titică","lui titulescu":"Titulescu","lui tiulescu":"Țiulescu","lui tivadar":"Tivadar","lui toaca":"Toacă","lui toarta":"Toartă","lui toba":"Tobă","lui tobescu":"Tobescu","lui tobos":"Toboș","lui tobosaru":"Toboșaru","lui tocan":"Tocan","lui tocana":"Tocană","lui tocanita":"Tocăniță","lui tocila":"Tocilă","lui tocileanu":"Tocileanu","lui tocilescu":"Tocilescu","lui tocitu":"Tocitu","lui toderas":"Toderaș","lui toderica":"Toderică","lui toderita":"Toderiță","lui toderoiu":"Toderoiu","lui toderut":"Toderuț","lui todescu":"Todescu","lui todica":"Todică","lui todicescu":"Todicescu","lui todiras":"Todiraș","lui todirescu":"Todirescu","lui todiresei":"Todiresei","lui todirita":"Todiriță","lui todirut":"Todiruț","lui todoreanu":"Todoreanu","lui todorenciuc":"Todorenciuc","lui todorica":"Todorică","lui todorov":"Todorov","lui todorut":"Todoruț","lui tofanel":"Tofănel","lui tofanescu":"Tofănescu","lui tofanica":"Tofănică","lui tohaneanu":"Tohăneanu","lui tohatan":"Tohătan","lui tolas":"Țolaș","lui tolescu":"Țolescu","lui toloaca":"Toloacă","lui tomaciuc":"Tomaciuc","lui tomas":"Tomaș","lui tomasciuc":["lui tomasciuc","Tomasciuc","lui tomașciuc","Tomașciuc"],"lui tomescu":"Tomescu","lui tomisteanu":"Tomișteanu","lui tomita":"Tomiță","lui tomitoiu":"Tomițoiu","lui tomiuc":"Tomiuc","lui tomniuc":"Tomniuc","lui tomoaia":"Tomoaia","lui tomoiu":"Tomoiu","lui tomosoiu":"Tomoșoiu","lui tomseneanu":"Tomșeneanu","lui tomsescu":"Tomșescu","lui tomulea":"Tomulea","lui tomulescu":"Tomulescu","lui tomulet":"Tomuleț","lui tomus":"Tomuș","lui tomut":"Tomuț","lui tomuta":"Tomuță","lui toncescu":"Toncescu","lui tone":"Țone","lui tonescu":["lui tonescu","Tonescu","lui țonescu","Țonescu"],"lui tonghioiu":"Tonghioiu","lui toni":"Țoni","lui toniuc":"Toniuc","lui tonoiu":"Tonoiu","lui tontu":"Tontu","lui toparcean":"Topârcean","lui toparceanu":"Topârceanu","lui toparlan":"Țopârlan","lui topciu":"Topciu","lui topescu":"Țopescu","lui topircean":"Topîrcean","lui topirceanu":"Topîrceanu","lui topliceanu":"Topliceanu","lui topoleanu":"Topoleanu","lui topoliceanu":"Topoliceanu","lui topolniceanu":"Topolniceanu","lui topologeanu":"Topologeanu","lui topoloveanu":"Topoloveanu","lui topor":"Topor","lui toporas":"Toporaș","lui torcatoru":"Torcătoru","lui torica":"Torică","lui torneanu":"Torneanu","lui toroc":"Toroc","lui toronciuc":"Toronciuc","lui toteanu":"Toteanu","lui totoianu":"Totoianu","lui totoiu":"Totoiu","lui trahanache":"Trahanache","lui trailescu":"Trăilescu","lui trailoiu":"Trăiloiu","lui traista":["lui traista","Traista","lui traistă","Traistă"],"lui trambitas":"Trâmbițaș","lui trambitasu":"Trâmbițașu","lui trandafir":"Trandafir","lui trandafirescu":"Trandafirescu","lui trandafoiu":"Trandafoiu","lui trascau":"Trăscău","lui trasnitu":"Trăsnitu","lui treaba":"Treabă","lui tremurici":"Tremurici","lui trepadus":"Trepăduș","lui trestian":"Trestian","lui trestioreanu":"Trestioreanu","lui triandafil":"Triandafil","lui triculescu":"Triculescu","lui trifanescu":"Trifănescu","lui trifescu":"Trifescu","lui trifoi":"Trifoi","lui trifonescu":"Trifonescu","lui trifut":"Trifuț","lui trimbita":"Trîmbiță","lui trimbitas":"Trîmbițaș","lui triponescu":"Triponescu","lui trisca":["lui trișca","Trișca","lui trișcă","Trișcă"],"lui triscaru":"Trișcaru","lui tristu":"Tristu","lui trita":"Triță","lui triteanu":"Triteanu","lui tritescu":"Trițescu","lui trocaru":"Trocaru","lui troceanu":"Troceanu","lui trofimescu":"Trofimescu","lui trombitas":"Trombițaș","lui troteanu":"Troteanu","lui trotusan":"Trotușan","lui trotuseanu":"Trotușeanu","lui truda":"Trudă","lui trufas":"Trufaș","lui trufasu":"Trufașu","lui trusculescu":"Trușculescu","lui trutescu":"Truțescu","lui trutoiu":"Truțoiu","lui tucarman":"Țucărman","lui tuchilus":"Țuchiluș","lui tuculescu":"Țuculescu","lui tudarachioiu":"Tudărăchioiu","lui tudorache":"Tudorache","lui tudorachescu":"Tudorăchescu","lui tudorachi":"Tudorachi","lui tudoran":"Tudoran","lui tudoras":"Tudoraș","lui tudorel":"Tudorel","lui tudorescu":"Tudorescu","lui tudorica":"Tudorică","lui tudoricescu":"Tudoricescu","lui tudorita":"Tudoriță","lui tudoroaia":"Tudoroaia","lui tudoroiu":"Tudoroiu","lui tudorut":"Tudoruț","lui tudurache":"Tudurache","lui tudurachi":"Tudurachi","lui tudurut":"Tuduruț","lui tufa":"Tufă","lui tufan":"Tufan","lui tufanescu":"Tufănescu","lui tufanoiu":"Tufănoiu","lui tufar":"Tufar","lui tufariu":"Tufariu","lui tufeanu":"Tufeanu","lui tufis":"Tufiș","lui tugulescu":"Țugulescu","lui tuica":"Țuică","lui tulbure":"Tulbure","lui tulceanu":"Tulceanu","lui tulica":"Tulică","lui tulumba":"Tulumbă","lui tumurug":"Tumurug","lui tunar":"Tunar","lui tunareanu":"Tunăreanu","lui tunaru":"Tunaru","lui tunescu":"Tunescu","lui tuns":"Tuns","lui tunsoiu":"Tunsoiu","lui tunsu":"Tunsu","lui turau":"Turău","lui turbaceanu":"Turbăceanu","lui turbatu":"Turbatu","lui turbinca":"Turbincă","lui turbureanu":"Turbureanu","lui turburica":"Turburică","lui turc":"Turc","lui turca":["lui țurca","Țurca","lui țurcă","Țurcă"],"lui turcan":"Turcan","lui turcanu":"Turcanu","lui turcas":"Țurcaș","lui turceac":"Turceac","lui turcescu":"Turcescu","lui turcitu":"Turcitu","lui turcoiu":"Turcoiu","lui turculeanu":"Turculeanu","lui turculescu":"Turculescu","lui turculet":"Turculeț","lui turculetu":"Turculețu","lui turcus":"Turcuș","lui turcut":"Turcuț","lui turdasan":"Turdășan","lui turdean":"Turdean","lui turdeanu":"Turdeanu","lui tureanu":"Tureanu","lui turiceanu":"Turiceanu","lui turleanu":"Turleanu","lui turlescu":"Țurlescu","lui turneanu":"Turneanu","lui turnescu":"Turnescu","lui turta":"Turtă","lui turtoiescu":"Turtoiescu","lui turtureanu":"Turtureanu","lui turturescu":"Turturescu","lui turturica":"Turturică","lui tutan":"Tutan","lui tuteanu":"Tuteanu","lui tutescu":["lui tuțescu","Tuțescu","lui țuțescu","Țuțescu"],"lui tutilescu":"Tutilescu","lui tutoveanu":"Tutoveanu","lui tutun":"Tutun","lui tutunaru":"Tutunaru","lui tutungiu":"Tutungiu","lui tvetcov":"Țvetcov","lui udatu":"Udatu","lui udescu":"Udescu","lui udisteanu":"Udișteanu","lui udma":"Udma","lui udrescu":"Udrescu","lui udrica":"Udrică","lui udristeanu":"Udrișteanu","lui udristeoiu":"Udrișteoiu","lui udristioiu":"Udriștioiu","lui udroiu":"Udroiu","lui uifalean":"Uifălean","lui uifaleanu":"Uifăleanu","lui uifelean":"Uifelean","lui uilacan":"Uilăcan","lui uiorean":"Uiorean","lui uivarasan":"Uivărășan","lui uivari":"Uivari","lui ulita":"Uliță","lui uliu":"Uliu","lui ulmeteanu":"Ulmețeanu","lui unchesu":"Uncheșu","lui unchiasu":"Unchiașu","lui unciuleanu":"Unciuleanu","lui ungur":"Ungur","lui ungurean":"Ungurean","lui ungureanu":"Ungureanu","lui unguroaica":"Unguroaica","lui unguroiu":"Unguroiu","lui unguru":"Unguru","lui ungurus":"Unguruș","lui unitaru":"Unitaru","lui untarescu":"Untărescu","lui untariu":"Untariu","lui untaru":"Untaru","lui unteanu":"Unteanu","lui uratescu":["lui urâtescu","Urâtescu","lui urâțescu","Urâțescu"],"lui uratu":"Urâtu","lui urban":"Urban","lui urbanovici":"Urbanovici","lui urda":["lui urda","Urda","lui urdă","Urdă"],"lui urdareanu":"Urdăreanu","lui urean":"Urean","lui ureche":"Ureche","lui urecheatu":"Urecheatu","lui urechescu":"Urechescu","lui urechiatu":"Urechiatu","lui uriasu":"Uriașu","lui uric":"Uric","lui uricariu":"Uricariu","lui uricaru":"Uricaru","lui uritescu":["lui uritescu","Uritescu","lui urițescu","Urițescu","lui urîtescu","Urîtescu","lui urîțescu","Urîțescu"],"lui uritu":"Urîtu","lui urlateanu":"Urlățeanu","lui urloiu":"Urloiu","lui urluceanu":"Urluceanu","lui urma":"Urmă","lui urmuzescu":"Urmuzescu","lui urs":"Urs","lui ursache":"Ursache","lui ursacheanu":"Ursăcheanu","lui ursachel":"Ursăchel","lui ursachescu":"Ursăchescu","lui ursadan":"Ursădan","lui ursan":"Ursan","lui ursarescu":"Ursărescu","lui ursariu":"Ursariu","lui ursaru":"Ursaru","lui ursateanu":"Ursățeanu","lui urseanu":"Urseanu","lui ursenescu":"Ursenescu","lui ursescu":"Ursescu","lui ursica":"Ursică","lui ursoi":"Ursoi","lui ursoianu":"Ursoianu","lui ursoiu":"Ursoiu","lui ursu":"Ursu","lui ursuleanu":"Ursuleanu","lui ursulescu":"Ursulescu","lui ursulet":"Ursuleț","lui ursuletu":"Ursulețu","lui ursulica":"Ursulică","lui ursut":"Ursuț","lui urzeala":"Urzeală","lui urzica":"Urzică","lui urziceanu":"Urziceanu","lui uscatescu":"Uscătescu","lui uscatu":"Uscatu","lui useriu":"Ușeriu","lui usieru":"Ușieru","lui usturoi":"Usturoi","lui usurel":"Ușurel","lui usurelu":"Ușurelu","lui utan":"Uțan","lui uzuru":"Uzuru","lui vacar":"Văcar","lui vacarescu":"Văcărescu","lui vacaresteanu":"Văcăreșteanu","lui vacarita":"Văcăriță","lui vacariu":"Văcariu","lui vacaroiu":"Văcăroiu","lui vacaru":"Văcaru","lui vacarus":"Văcăruș","lui vaculisteanu":"Văculișteanu","lui vacuta":"Văcuță","lui vadan":"Vădan","lui vadanescu":"Vădănescu","lui vadineanu":"Vădineanu","lui vadrariu":"Vădrariu","lui vaduva":"Văduva","lui vaduvescu":"Văduvescu","lui vagauna":"Văgăună","lui vagaunescu":"Văgăunescu","lui vaidahazan":"Vaidahăzan","lui vaideanu":["lui vaideanu","Vaideanu","lui văideanu","Văideanu"],"lui vaidianu":"Văidianu","lui vaileanu":"Văileanu","lui vajaiala":"Vâjâială","lui vajaitu":"Vâjâitu","lui valah":"Valah","lui valareanu":"Vălăreanu","lui valasciuc":"Valașciuc","lui valceanu":"Vâlceanu","lui valcov":"Vâlcov","lui valcu":"Vâlcu","lui valculescu":"Vâlculescu","lui valculet":"Vâlculeț","lui valean":"Vălean","lui valeanu":"Văleanu","lui valentin":"Valentin","lui valerian":"Valerian","lui valerica":"Valerică","lui valeriu":"Valeriu","lui valerus":"Valeruș","lui valvoi":"Vâlvoi","lui vana":"Vână","lui vanatoru":"Vânătoru","lui vanatu":"Vânatu","lui vanghelescu":"Vanghelescu","lui vara":"Vară","lui varadian":"Vărădian","lui varariu":"Vărariu","lui vararu":"Văraru","lui varasteanu":"Vărășteanu","lui varaticeanu":"Vărăticeanu","lui vardianu":"Vardianu","lui varga":"Vargă","lui vargatu":"Vărgatu","lui varlanuta":"Vârlănuță","lui vartan":"Vartan","lui vartic":"Vartic","lui vartopeanu":"Vârtopeanu","lui varujan":"Varujan","lui varvarescu":"Vărvărescu","lui varvaroi":"Varvaroi","lui varza":["lui varza","Varza","lui varză","Varză"],"lui varzar":"Vărzar","lui varzare":"Vărzare","lui varzariu":"Vărzariu","lui varzescu":"Vărzescu","lui vasar":"Văsar","lui vasarhelean":"Vașarhelean","lui vasescu":"Văsescu","lui vasil":"Vasil","lui vasilache":"Vasilache","lui vasilachi":"Vasilachi","lui vasilas":"Vasilaș","lui vasilenco":"Vasilenco","lui vasilencu":"Vasilencu","lui vasilescu":"Vasilescu","lui vasiliade":"Vasiliade","lui vasilica":"Vasilică","lui vasiliut":"Vasiliuț","lui vasiloaia":"Vasiloaia","lui vasiloiu":"Vasiloiu","lui vasilut":["lui vasiluț","Vasiluț","lui văsiluț","Văsiluț"],"lui vasiluta":"Vasiluță","lui vasluian":"Vasluian","lui vasluianu":"Vasluianu","lui vasoiu":"Văsoiu","lui vasut":"Văsuț","lui vatafu":"Vătafu","lui vatajelu":"Vătăjelu","lui vataman":"Vătăman","lui vatamanel":"Vătămănel","lui vatamanescu":"Vătămănescu","lui vatamanita":"Vătămăniță","lui vatamanu":"Vătămanu","lui vatamanuta":"Vătămănuță","lui vatasel":"Vătășel","lui vataselu":"Vătășelu","lui vatasoaia":"Vătășoaia","lui vatasoiu":"Vătășoiu","lui vatavoiu":"Vătăvoiu","lui vatmanu":"Vatmanu","lui vatra":"Vatră","lui vazdauteanu":"Văzdăuțeanu","lui vdovicencu":"Vdovicencu","lui vechiu":"Vechiu","lui vecinu":"Vecinu","lui velcescu":"Velcescu","lui velcovici":"Velcovici","lui velescu":"Velescu","lui velicescu":"Velicescu","lui velniceriu":"Velniceriu","lui velniceru":"Velniceru","lui velnita":"Velniță","lui veneteanu":"Venețeanu","lui verde":"Verde","lui vereanu":"Vereanu","lui veres":"Vereș","lui veresezan":"Vereșezan","lui veresteanu":"Vereșteanu","lui verestiuc":"Vereștiuc","lui vergulescu":"Vergulescu","lui vernescu":"Vernescu","lui verniceanu":"Verniceanu","lui vernichescu":"Vernichescu","lui verzeanu":"Verzeanu","lui verzescu":"Verzescu","lui vesel":"Vesel","lui veselu":"Veselu","lui vesparu":"Vesparu","lui vesteman":"Veșteman","lui vestemean":"Veștemean","lui vestemeanu":"Veștemeanu","lui veteanu":"Vețeanu","lui veteleanu":"Vețeleanu","lui vetrescu":"Vetrescu","lui veverita":"Veveriță","lui vexler":"Vexler","lui vezeanu":"Vezeanu","lui vicas":"Vicaș","lui vicleanu":"Vicleanu","lui vicoveanu":"Vicoveanu","lui victorescu":"Victorescu","lui vidican":"Vidican","lui vidrean":"Vidrean","lui vidrighinescu":"Vidrighinescu","lui vienescu":"Vienescu","lui viesparu":"Viesparu","lui viespe":"Viespe","lui viespescu":"Viespescu","lui viezure":"Viezure","lui vifor":"Vifor","lui viisoreanu":"Viișoreanu","lui vijelie":"Vijelie","lui vilceanu":"Vîlceanu","lui vilceleanu":"Vîlceleanu","lui vilcescu":"Vîlcescu","lui vilcianu":"Vîlcianu","lui vilcica":"Vîlcică","lui vilcioiu":"Vîlcioiu","lui vilculescu":"Vîlculescu","lui vilsanescu":"Vîlsănescu","lui vilvoi":"Vîlvoi","lui vina":"Vînă","lui vinaru":"Vinaru","lui vinatoiu":"Vînătoiu","lui vinatoru":"Vînătoru","lui vinosu":"Vînosu","lui vint":"Vînt","lui vinte":"Vințe","lui vintean":"Vințean","lui vinteanu":"Vințeanu","lui vintilescu":"Vintilescu","lui vintiloiu":"Vintiloiu","lui vintu":"Vîntu","lui vinturache":"Vînturache","lui vioara":"Vioară","lui vioiu":"Vioiu","lui vioreanu":"Vioreanu","lui virbanescu":"Vîrbănescu","lui vircolacu":"Vîrcolacu","lui virjan":"Vîrjan","lui virlanescu":"Vîrlănescu","lui virsa":"Vîrșă","lui virsescu":"Vîrșescu","lui virtej":"Vîrtej","lui virtopan":"Vîrtopan","lui virtopeanu":"Vîrtopeanu","lui virtosu":"Vîrtosu","lui virvescu":"Vîrvescu","lui visan":"Vișan","lui visanescu":"Vișănescu","lui visanoiu":"Vișănoiu","lui viscol":"Viscol","lui viscopoleanu":"Viscopoleanu","lui viscreanu":"Viscreanu","lui viscu":"Vîscu","lui visenoiu":"Vișenoiu","lui visescu":["lui visescu","Visescu","lui vișescu","Vișescu"],"lui visineanu":"Vișineanu","lui visinescu":"Vișinescu","lui visinoiu":"Vișinoiu","lui visoianu":"Vișoianu","lui visoiu":"Vișoiu","lui visoreanu":"Vișoreanu","lui vistiernicu":"Vistiernicu","lui vitanescu":"Vitănescu","lui viteazu":"Viteazu","lui vitel":"Vițel","lui vitelar":"Vițelar","lui vitelariu":"Vițelariu","lui vitelaru":"Vițelaru","lui vitriuc":"Vitriuc","lui vizireanu":"Vizireanu","lui vizirescu":"Vizirescu","lui vizuina":"Vizuină","lui vlad":"Vlad","lui vladareanu":"Vlădăreanu","lui vladescu":"Vlădescu","lui vladica":"Vlădică","lui vladila":"Vlădilă","lui vladoaia":"Vlădoaia","lui vladoianu":"Vlădoianu","lui vladoiu":"Vlădoiu","lui vladuca":"Vlăducă","lui vladucu":"Vlăducu","lui vladulescu":"Vlădulescu","lui vladut":"Vlăduț","lui vladuta":"Vlăduță","lui vladutescu":"Vlăduțescu","lui vladutoiu":"Vlăduțoiu","lui vlah":"Vlah","lui vlahu":"Vlahu","lui vlahuta":"Vlahuță","lui vlaiculescu":"Vlăiculescu","lui vlaicus":"Vlăicuș","lui vlasceanu":"Vlășceanu","lui vlasov":"Vlasov","lui vochitoaia":"Vochițoaia","lui voda":"Vodă","lui voiceanu":"Voiceanu","lui voicencu":"Voicencu","lui voicescu":"Voicescu","lui voichitoiu":"Voichițoiu","lui voicila":["lui voicila","Voicila","lui voicilă","Voicilă"],"lui voicilas":"Voicilaș","lui voiciloiu":"Voiciloiu","lui voiculescu":"Voiculescu","lui voiculet":"Voiculeț","lui voinic":"Voinic","lui voinicu":"Voinicu","lui voinila":"Voinilă","lui voinoiu":"Voinoiu","lui voinov":"Voinov","lui voios":"Voios","lui voitec":"Voitec","lui voivod":"Voivod","lui voivozeanu":"Voivozeanu","lui volanschi":"Volanschi","lui volintiru":"Volintiru","lui volosciuc":"Volosciuc","lui voloseniuc":["lui voloseniuc","Voloseniuc","lui voloșeniuc","Voloșeniuc"],"lui vornic":"Vornic","lui vorniceanu":"Vorniceanu","lui vornicel":"Vornicel","lui vornicelu":"Vornicelu","lui vornicescu":"Vornicescu","lui vornicu":"Vornicu","lui vosganian":"Vosganian","lui vrabie":"Vrabie","lui vrabiescu":"Vrăbiescu","lui vrabioiu":"Vrăbioiu","lui vrabioru":"Vrăbioru","lui vrabiuta":"Vrăbiuță","lui vraci":"Vraci","lui vraciu":"Vraciu","lui vraja":"Vrajă","lui vrajitor":"Vrăjitor","lui vrajitoriu":"Vrăjitoriu","lui vrajitoru":"Vrăjitoru","lui vrajmasu":"Vrăjmașu","lui vrancean":"Vrâncean","lui vranceanu":"Vrânceanu","lui vranescu":"Vrănescu","lui vrasmasu":"Vrășmașu","lui vrejiu":"Vrejiu","lui vrejoiu":"Vrejoiu","lui vreju":"Vreju","lui vreme":"Vreme","lui vrincean":"Vrîncean","lui vrinceanu":"Vrînceanu","lui vrincianu":"Vrîncianu","lui vucescu":"Vucescu","lui vuculescu":"Vuculescu","lui vulcanescu":"Vulcănescu","lui vulpe":"Vulpe","lui vulpescu":"Vulpescu","lui vulpoi":"Vulpoi","lui vulpoiu":"Vulpoiu","lui vultur":"Vultur","lui wald":"Wald","lui winkler":"Winkler","lui wolf":"Wolf","lui zabava":"Zăbavă","lui zabrautan":"Zăbrăuțan","lui zabrautanu":"Zăbrăuțanu","lui zabrauteanu":"Zăbrăuțeanu","lui zagan":"Zăgan","lui zaganescu":"Zăgănescu","lui zagorschi":"Zagorschi","lui zahanagiu":"Zahanagiu","lui zaharache":"Zaharache","lui zaharachescu":"Zăharăchescu","lui zaharas":"Zăhăraș","lui zahareanu":"Zăhăreanu","lui zaharencu":"Zaharencu","lui zaharescu":"Zaharescu","lui zaharia":"Zaharia","lui zahariade":"Zahariade","lui zaharias":"Zahariaș","lui zaharioaia":"Zaharioaia","lui zaharioiu":"Zaharioiu","lui zahariuc":"Zahariuc","lui zahorneanu":"Zahorneanu","lui zainescu":"Zăinescu","lui zalog":"Zălog","lui zama":"Zamă","lui zamaneagra":"Zamăneagră","lui zambaccian":"Zambaccian","lui zambila":"Zambilă","lui zamescu":"Zămescu","lui zamferoiu":"Zamferoiu","lui zamfirei":"Zamfirei","lui zamfirescu":"Zamfirescu","lui zamfiroaia":"Zamfiroaia","lui zamfiroiu":"Zamfiroiu","lui zamosteanu":["lui zamoșteanu","Zamoșteanu","lui zămoșteanu","Zămoșteanu"],"lui zanfir":"Zanfir","lui zanfirescu":"Zanfirescu","lui zanfiroiu":"Zanfiroiu","lui zanoaga":"Zănoagă","lui zapodeanu":"Zăpodeanu","lui zarafescu":"Zarafescu","lui zarafiu":"Zarafiu","lui zarafu":"Zarafu","lui zarzara":"Zarzără","lui zavaleanu":"Zăvăleanu","lui zavelca":["lui zavelca","Zavelca","lui zavelcă","Zavelcă","lui zăvelcă","Zăvelcă"],"lui zavelcuta":"Zăvelcuță","lui zavragiu":"Zavragiu","lui zbant":"Zbanț","lui zbarciog":"Zbârciog","lui zbarloiu":"Zbârloiu","lui zbirciog":"Zbîrciog","lui zbirloiu":"Zbîrloiu","lui zdreanta":"Zdreanță","lui zeama":"Zeamă","lui zegan":"Zegan","lui zeicescu":"Zeicescu","lui zeleneac":"Zeleneac","lui zelesteanu":"Zeleșteanu","lui zelter":"Zelțer"};
@@ -0,0 +1 @@
+export default {"lui zeru":"Zeru","lui zgaiba":"Zgaibă","lui zglobiu":"Zglobiu","lui zgura":"Zgură","lui zgureanu":"Zgureanu","lui zguroiu":"Zguroiu","lui zidarescu":"Zidărescu","lui zidarita":"Zidărița","lui zidariu":"Zidariu","lui zidaroiu":"Zidăroiu","lui zidaru":"Zidaru","lui zidu":"Zidu","lui zigulescu":"Zigulescu","lui zilieru":"Zilieru","lui zilistean":"Ziliștean","lui zilisteanu":"Zilișteanu","lui zinculescu":"Zinculescu","lui zirna":["lui zîrna","Zîrna","lui zîrnă","Zîrnă"],"lui zlagnean":"Zlăgnean","lui zlatan":"Zlătan","lui zlatar":"Zlătar","lui zlatariu":"Zlătariu","lui zlataru":"Zlătaru","lui zlateanu":"Zlăteanu","lui zlatescu":"Zlătescu","lui zmarandache":["lui zmarandache","Zmarandache","lui zmărândache","Zmărândache"],"lui zmau":"Zmău","lui zmeura":"Zmeură","lui zmochina":"Zmochină","lui zob":"Zob","lui zodieru":"Zodieru","lui zodila":"Zodilă","lui zoescu":"Zoescu","lui zogreanu":"Zogreanu","lui zoitoiu":"Zoițoiu","lui zorila":"Zorilă","lui zorlentan":"Zorlențan","lui zorlescu":"Zorlescu","lui zorzonel":"Zorzonel","lui zotescu":"Zotescu","lui zugrav":"Zugrav","lui zugravescu":"Zugrăvescu","lui zugravu":"Zugravu","lui zurbagiu":"Zurbagiu","lui zurgalau":"Zurgălău","lui zvac":"Zvâc","lui zvic":"Zvîc","lui zvonaru":"Zvonaru","lui zvoristeanu":"Zvorișteanu","luici":"luică","luicii":"luică","luicile":"luică","luicilor":"luică","lujerei":"lujerel","lujereii":"lujerel","lujereilor":"lujerel","lujerelul":"lujerel","lujerelule":"lujerel","lujerelului":"lujerel","lujeri":"lujer","lujerii":"lujer","lujerilor":"lujer","lujerul":"lujer","lujerule":"lujer","lujerului":"lujer","lule":"lulă","luleaua":"lulea","lulegii":"lulegiu","lulegiii":"lulegiu","lulegiilor":"lulegiu","lulegiuul":"lulegiu","lulegiuule":"lulegiu","lulegiuului":"lulegiu","lulei":"lulă","lulele":["lulele","lulă","lulele","lulea"],"lulelei":"lulea","lulelele":"lulea","lulelelor":"lulea","lulelor":"lulă","lulelusaul":"lulelușă","lulelusaule":"lulelușă","lulelusaului":"lulelușă","luleluse":"lulelușă","lulelusei":"lulelușă","luleluselor":"lulelușă","lulelute":"luleluță","lulelutei":"luleluță","lulelutele":"luleluță","lulelutelor":"luleluță","luleuse":"luleușă","luleusei":"luleușă","luleusele":"luleușă","luleuselor":"luleușă","luludia":"luludie","luludiei":"luludie","luludii":"luludie","lumanararese":"lumânărăreasă","lumanararesei":"lumânărăreasă","lumanararesele":"lumânărăreasă","lumanarareselor":"lumânărăreasă","lumanarari":"lumânărar","lumanararia":"lumânărărie","lumanarariei":"lumânărărie","lumanararii":["lumânărarii","lumânărar","lumânărării","lumânărărie"],"lumanarariile":"lumânărărie","lumanarariilor":"lumânărărie","lumanararilor":"lumânărar","lumanararul":"lumânărar","lumanararule":"lumânărar","lumanararului":"lumânărar","lumanarea":"lumânare","lumanareaua":"lumânărea","lumanarele":["lumânărele","lumânărea","lumânărele","lumânărică"],"lumanarelei":"lumânărea","lumanarelele":"lumânărea","lumanarelelor":"lumânărea","lumanari":"lumânare","lumanaria":"lumânărie","lumanarice":"lumânărică","lumanaricei":"lumânărică","lumanaricele":"lumânărică","lumanaricelor":"lumânărică","lumanariei":"lumânărie","lumanarii":["lumânării","lumânare","lumânării","lumânărie"],"lumanariile":"lumânărie","lumanariilor":"lumânărie","lumanarile":"lumânare","lumanarilor":"lumânare","lumanarioare":"lumânărioară","lumanarioarei":"lumânărioară","lumaselul":"lumașel","lumaselule":"lumașel","lumaselului":"lumașel","lumbagoul":"lumbago","lumbagoule":"lumbago","lumbagoului":"lumbago","lumbalgia":"lumbalgie","lumbalgiei":"lumbalgie","lumbalgii":"lumbalgie","lumbalgiile":"lumbalgie","lumbalgiilor":"lumbalgie","lumbii":"lumbi","lumbilor":"lumbi","lumea":"lume","lumeasca":["lumească","lumesc","lumeasca","lumesc"],"lumeata":["lumeață","lumeț","lumeața","lumeț"],"lumene":"lumen","lumeni":"lumen","lumenmetre":"lumenmetru","lumenmetrele":"lumenmetru","lumenmetrelor":"lumenmetru","lumenmetrul":"lumenmetru","lumenmetrule":"lumenmetru","lumenmetrului":"lumenmetru","lumescul":"lumesc","lumesti":"lumesc","lumestii":"lumesc","lumestile":"lumesc","lumete":"lumeț","lumetele":"lumeț","lumeti":"lumeț","lumetia":"lumeție","lumetiei":"lumeție","lumetii":["lumeții","lumeț","lumeții","lumeție"],"lumetiile":"lumeție","lumetiilor":"lumeție","lumetul":"lumeț","lumi":"lume","lumicice":"lumicică","lumicicei":"lumicică","lumicioasa":["lumicioasă","lumicios","lumicioasa","lumicios"],"lumicioase":"lumicios","lumicioasele":"lumicios","lumiciosi":"lumicios","lumiciosii":"lumicios","lumiciosul":"lumicios","lumii":"lume","lumile":"lume","lumilor":"lume","luminaciunea":"luminăciune","luminaciuni":"luminăciune","luminaciunii":"luminăciune","luminaciunile":"luminăciune","luminaciunilor":"luminăciune","luminai":"lumina","luminalul":"luminal","luminalule":"luminal","luminalului":"luminal","luminam":["luminăm","lumina","luminam","lumina"],"luminand":"lumina","luminante":"luminanță","luminantei":"luminanță","luminantele":"luminanță","luminantelor":"luminanță","luminara":"lumina","luminaram":"lumina","luminarati":"lumina","luminare":["lumînare","lumânare","luminare","luminar"],"luminarele":"luminar","luminarelor":"luminar","luminari":"luminare","luminarul":"luminar","luminarule":"luminar","luminarului":"luminar","luminase":"lumina","luminasem":"lumina","luminasera":"lumina","luminaseram":"lumina","luminaserati":"lumina","luminasesi":"lumina","luminasi":"lumina","luminat":"lumina","luminati":"lumina","luminatia":["luminația","luminație","luminăția","luminăție"],"luminatiei":["luminației","luminație","luminăției","luminăție"],"luminatii":["luminații","luminație","luminății","luminăție"],"luminatiile":["luminațiile","luminație","luminățiile","luminăție"],"luminatiilor":["luminațiilor","luminație","luminățiilor","luminăție"],"luminatoare":["luminatoare","luminator","luminătoare","luminător"],"luminatoarele":"luminător","luminatoarelor":"luminător","luminatore":"luminator","luminatorele":"luminator","luminatorelor":"luminator","luminatoria":"luminătoriu","luminatorie":"luminătoriu","luminatorii":"luminătoriu","luminatoriii":"luminătoriu","luminatoriile":"luminătoriu","luminatoriul":"luminătoriu","luminatorul":["luminatorul","luminator","luminătorul","luminător"],"luminatorule":["luminatorule","luminator","luminătorule","luminător"],"luminatorului":["luminatorului","luminator","luminătorului","luminător"],"luminatul":"luminat","luminatule":"luminat","luminatului":"luminat","luminau":"lumina","lumineaua":"luminea","lumineaza":"lumina","luminele":"luminea","luminelei":"luminea","luminelele":"luminea","luminelelor":"luminea","luminescenta":["luminescentă","luminescent","luminescenta","luminescent"],"luminescente":["luminescente","luminescent","luminescențe","luminescență"],"luminescentei":"luminescență","luminescentele":["luminescentele","luminescent","luminescențele","luminescență"],"luminescentelor":"luminescență","luminescenti":"luminescent","luminescentii":"luminescent","luminescentul":"luminescent","luminez":"lumina","luminezi":"lumina","lumini":"lumină","luminici":"luminică","luminicicele":"luminicică","luminicicelei":"luminicică","luminicicelele":"luminicică","luminicicelelor":"luminicică","luminicii":"luminică","luminicile":"luminică","luminicilor":"luminică","luminii":"lumină","luminile":"lumină","luminilor":"lumină","luminiscente":"luminiscență","luminiscentei":"luminiscență","luminiscentele":"luminiscență","luminiscentelor":"luminiscență","luminismul":"luminism","luminismule":"luminism","luminismului":"luminism","luministe":"luministă","luministei":"luministă","luministele":"luministă","luministelor":"luministă","luministi":"luminist","luministii":"luminist","luministilor":"luminist","luministul":"luminist","luministule":"luminist","luministului":"luminist","luminisul":"luminiș","luminisule":"luminiș","luminisului":"luminiș","luminisuri":"luminiș","luminisurile":"luminiș","luminisurilor":"luminiș","luminite":"luminiță","luminitei":"luminiță","luminitele":"luminiță","luminitelor":"luminiță","luminoasa":["luminoasă","luminos","luminoasa","luminos"],"luminoase":"luminos","luminoasele":"luminos","luminofora":["luminoforă","luminofor","luminofora","luminofor"],"luminofore":"luminofor","luminoforele":"luminofor","luminofori":"luminofor","luminoforii":"luminofor","luminoforul":"luminofor","luminosa":"luminoasă","luminoscoape":"luminoscop","luminoscoapele":"luminoscop","luminoscoapelor":"luminoscop","luminoscopul":"luminoscop","luminoscopule":"luminoscop","luminoscopului":"luminoscop","luminosi":"luminos","luminosii":"luminos","luminosul":"luminos","luminozitatea":"luminozitate","luminozitati":"luminozitate","luminozitatii":"luminozitate","luminozitatile":"luminozitate","luminozitatilor":"luminozitate","luminuse":"luminușă","luminusei":"luminușă","luminusele":"luminușă","luminuselor":"luminușă","luminute":"luminuță","luminutei":"luminuță","luminutele":"luminuță","luminutelor":"luminuță","lumpeni":"lumpen","lumpenii":"lumpen","lumpenilor":"lumpen","lumpenproletari":"lumpenproletar","lumpenproletariatul":"lumpenproletariat","lumpenproletariatule":"lumpenproletariat","lumpenproletariatului":"lumpenproletariat","lumpenproletarii":"lumpenproletar","lumpenproletarilor":"lumpenproletar","lumpenproletarul":"lumpenproletar","lumpenproletarule":"lumpenproletar","lumpenproletarului":"lumpenproletar","lumpenul":"lumpen","lumpenule":"lumpen","lumpenului":"lumpen","luna la tisa":"Lunca La Tisa","lunara":["lunară","lunar","lunara","lunar"],"lunare":"lunar","lunarele":"lunar","lunari":"lunar","lunarii":"lunar","lunarul":"lunar","lunasi":"lunaș","lunasii":"lunaș","lunasilor":"lunaș","lunasul":"lunaș","lunasule":"lunaș","lunasului":"lunaș","lunatec":"lunatic","lunateca":["lunatecă","lunatec","lunateca","lunatec"],"lunatece":"lunatec","lunatecele":"lunatec","lunateci":"lunatec","lunatecii":"lunatec","lunatecul":"lunatec","lunatia":"lunație","lunatica":["lunatică","lunatic","lunatica","lunatic"],"lunatice":"lunatic","lunaticele":"lunatic","lunatici":"lunatic","lunaticii":"lunatic","lunaticilor":"lunatic","lunaticul":"lunatic","lunaticule":"lunatic","lunaticului":"lunatic","lunatiei":"lunație","lunatii":"lunație","lunatiile":"lunație","lunatiilor":"lunație","lunatisme":"lunatism","lunatismele":"lunatism","lunatismelor":"lunatism","lunatismul":"lunatism","lunatismule":"lunatism","lunatismului":"lunatism","lunatiunea":"lunațiune","lunatiuni":"lunațiune","lunatiunii":"lunațiune","lunatiunile":"lunațiune","lunatiunilor":"lunațiune","lunca cerna de jos":"Lunca Cernii de Jos","lunceaua":"luncea","luncele":"luncea","luncelei":"luncea","luncetul":"luncet","luncetule":"luncet","luncetului":"luncet","lunceturi":"luncet","lunceturile":"luncet","lunceturilor":"luncet","lunchite":"lunchiță","lunchitei":"lunchiță","lunchitele":"lunchiță","lunchitelor":"lunchiță","lunci":"luncă","luncii":"luncă","luncile":"luncă","luncilor":"luncă","luncoasa":["luncoasă","luncos","luncoasa","luncos"],"luncoase":"luncos","luncoasele":"luncos","luncosi":"luncos","luncosii":"luncos","luncosul":"luncos","lunculite":"lunculiță","lunculitei":"lunculiță","lunculitele":"lunculiță","lunculitelor":"lunculiță","luncusoare":"luncușoară","luncusoarei":"luncușoară","luncute":"luncuță","luncutei":"luncuță","luncutele":"luncuță","luncutelor":"luncuță","lunec":"luneca","lunecai":"luneca","lunecam":["lunecăm","luneca","lunecam","luneca"],"lunecand":"luneca","lunecara":"luneca","lunecaram":"luneca","lunecarati":"luneca","lunecarea":"lunecare","lunecari":"lunecare","lunecarii":"lunecare","lunecarile":"lunecare","lunecarilor":"lunecare","lunecase":"luneca","lunecasem":"luneca","lunecasera":"luneca","lunecaseram":"luneca","lunecaserati":"luneca","lunecasesi":"luneca","lunecasi":"luneca","lunecat":"luneca","lunecati":"luneca","lunecatoare":"lunecător","lunecatoarea":"lunecător","lunecatoarele":"lunecător","lunecatori":"lunecător","lunecatorii":"lunecător","lunecatorul":"lunecător","lunecau":"luneca","luneci":"luneca","lunecoasa":["lunecoasă","lunecos","lunecoasa","lunecos"],"lunecoase":"lunecos","lunecoasele":"lunecos","lunecosi":"lunecos","lunecosii":"lunecos","lunecosul":"lunecos","lunecusul":"lunecuș","lunecusule":"lunecuș","lunecusului":"lunecuș","lunecusuri":"lunecuș","lunecusurile":"lunecuș","lunecusurilor":"lunecuș","lunete":"lunetă","lunetei":"lunetă","lunetele":"lunetă","lunetelor":"lunetă","lunetisti":["lunetiști","lunetist","lunetisti","lunetist"],"lunetistii":"lunetist","lunetistilor":"lunetist","lunetistul":"lunetist","lunetistule":"lunetist","lunetistului":"lunetist","lung":"lunga","lung metraje":"lung metraj","lunga":["lungă","lung","lunga","lung"],"lungai":"lunga","lungam":["lungăm","lunga","lungam","lunga"],"lungana":["lungană","lungan","lungana","lungan"],"lungand":"lunga","lungane":["lungane","lungan","lungane","lungană"],"lunganei":"lungană","lunganele":["lunganele","lungan","lunganele","lungană"],"lunganelor":"lungană","lungani":"lungan","lunganii":"lungan","lunganul":"lungan","lungara":"lunga","lungaram":"lunga","lungarati":"lunga","lungareata":["lungăreață","lungăreț","lungăreața","lungăreț"],"lungarete":"lungăreț","lungaretele":"lungăreț","lungareti":"lungăreț","lungaretii":"lungăreț","lungaretul":"lungăreț","lungase":"lunga","lungasem":"lunga","lungasera":"lunga","lungaseram":"lunga","lungaserati":"lunga","lungasesi":"lunga","lungasi":"lunga","lungat":"lunga","lungati":"lunga","lungau":"lunga","lunge":"lunga","lungea":"lungi","lungeai":"lungi","lungeam":"lungi","lungeati":"lungi","lungeau":"lungi","lungele":"lungeală","lungelei":"lungeală","lungelele":"lungeală","lungelelor":"lungeală","lungeli":"lungeală","lungesc":"lungi","lungeste":"lungi","lungesti":"lungi","lungi":["lungi","lung","lungi","lunga"],"lungii":["lungii","lung","lungii","lungi"],"lungile":"lung","lungim":"lungi","lungimea":"lungime","lungimi":"lungime","lungimi de unda":"lungime de undă","lungimii":"lungime","lungimile":"lungime","lungimilor":"lungime","lungind":"lungi","lungira":"lungi","lungiram":"lungi","lungirati":"lungi","lungirea":"lungire","lungiri":"lungire","lungirii":"lungire","lungirile":"lungire","lungirilor":"lungire","lungise":"lungi","lungisem":"lungi","lungisera":"lungi","lungiseram":"lungi","lungiserati":"lungi","lungisesi":"lungi","lungisi":"lungi","lungit":"lungi","lungita":["lungită","lungit","lungita","lungit"],"lungite":"lungit","lungitele":"lungit","lungiti":["lungiți","lungi","lungiți","lungit"],"lungitii":"lungit","lungitul":"lungit","lungituri":"lungitură","lungiturii":"lungitură","lungiturile":"lungitură","lungiturilor":"lungitură","lungmetraje":"lungmetraj","lungmetrajele":"lungmetraj","lungmetrajelor":"lungmetraj","lungmetrajul":"lungmetraj","lungmetrajule":"lungmetraj","lungmetrajului":"lungmetraj","lungoarea":"lungoare","lungoari":"lungoare","lungoarii":"lungoare","lungoarile":"lungoare","lungoarilor":"lungoare","lungori":"lungoare","lunguieata":["lunguieață","lunguieț","lunguieața","lunguieț"],"lunguiete":"lunguieț","lunguietele":"lunguieț","lunguieti":"lunguieț","lunguietii":"lunguieț","lunguietul":"lunguieț","lunguirea":"lunguire","lunguiri":"lunguire","lunguirii":"lunguire","lunguirile":"lunguire","lunguirilor":"lunguire","lungul":"lung","lunguleata":["lunguleață","lunguleț","lunguleața","lunguleț"],"lungulete":"lunguleț","lunguletele":"lunguleț","lunguleti":"lunguleț","lunguletii":"lunguleț","lunguletul":"lunguleț","lunguroaie":"linguroi","lunguroaiele":"linguroi","lunguroaielor":"linguroi","lunguta":["lunguță","lunguț","lunguța","lunguț"],"lungute":"lunguț","lungutele":"lunguț","lunguti":"lunguț","lungutii":"lunguț","lungutul":"lunguț","luni":"lună","luni calendaristice":"lună calendaristică","luni de miere":"lună de miere","luni noi":"lună nouă","luni pline":"lună plină","luni sinodice":"lună sinodică","lunia":"lunie","lunice":"lunică","lunicei":"lunică","luniei":"lunie","lunii":["lunii","lună","lunii","lunie"],"luniile":"lunie","luniilor":"lunie","lunile":"lună","lunilor":"lună","lunioare":"lunioară","lunioarei":"lunioară","lunioarele":"lunioară","lunioarelor":"lunioară","lunisoare":"lunișoară","lunisoarei":"lunișoară","lunisoarele":"lunișoară","lunisoarelor":"lunișoară","lunite":"luniță","lunitei":"luniță","lunoasa":["lunoasă","lunos","lunoasa","lunos"],"lunoase":"lunos","lunoasele":"lunos","lunosi":"lunos","lunosii":"lunos","lunosul":"lunos","luntrari":"luntrar","luntrarii":"luntrar","luntrarilor":"luntrar","luntrarul":"luntrar","luntrarule":"luntrar","luntrarului":"luntrar","luntrase":"luntrașă","luntrasei":"luntrașă","luntrasele":"luntrașă","luntraselor":"luntrașă","luntrasi":"luntraș","luntrasii":"luntraș","luntrasilor":"luntraș","luntrasite":"luntrășiță","luntrasitei":"luntrășiță","luntrasitele":"luntrășiță","luntrasitelor":"luntrășiță","luntrasul":"luntraș","luntrasule":"luntraș","luntrasului":"luntraș","luntrea":["luntrea","luntre","luntrea","luntri"],"luntreai":"luntri","luntream":"luntri","luntreati":"luntri","luntreau":"luntri","luntrei":"luntre","luntrele":"luntre","luntrelor":"luntre","luntresc":"luntri","luntreste":"luntri","luntresti":"luntri","luntricele":"luntricică","luntricice":"luntricică","luntricicei":"luntricică","luntricicele":"luntricică","luntricicelor":"luntricică","luntrii":"luntri","luntrim":"luntri","luntrind":"luntri","luntrioare":"luntrioară","luntrioarei":"luntrioară","luntrioarele":"luntrioară","luntrioarelor":"luntrioară","luntrira":"luntri","luntriram":"luntri","luntrirati":"luntri","luntrise":"luntri","luntrisem":"luntri","luntrisera":"luntri","luntriseram":"luntri","luntriserati":"luntri","luntrisesi":"luntri","luntrisi":"luntri","luntrisoare":"luntrișoară","luntrisoarei":"luntrișoară","luntrisoarele":"luntrișoară","luntrisoarelor":"luntrișoară","luntrit":"luntri","luntrite":["luntrite","luntriță","luntrițe","luntriță"],"luntritei":"luntriță","luntritele":"luntriță","luntritelor":"luntriță","luntriti":"luntri","lunule":"lunulă","lunulei":"lunulă","lunulele":"lunulă","lunulelor":"lunulă","lunulite":"lunuliță","lunulitei":"lunuliță","lunute":"lunuță","lunutei":"lunuță","lunutele":"lunuță","lunutelor":"lunuță","luotoarea":"luotoare","luotori":"luotoare","luotorii":"luotoare","luotorile":"luotoare","luotorilor":"luotoare","lupana":["lupană","lupan","lupana","lupan"],"lupanare":"lupanar","lupanarele":"lupanar","lupanarelor":"lupanar","lupanarul":"lupanar","lupanarule":"lupanar","lupanarului":"lupanar","lupanasi":"lupănaș","lupanasii":"lupănaș","lupanasilor":"lupănaș","lupanasul":"lupănaș","lupanasule":"lupănaș","lupanasului":"lupănaș","lupane":"lupan","lupanei":"lupănel","lupaneii":"lupănel","lupaneilor":"lupănel","lupanele":"lupan","lupanelul":"lupănel","lupanelule":"lupănel","lupanelului":"lupănel","lupani":"lupan","lupanici":"lupănică","lupanicii":"lupănică","lupanicile":"lupănică","lupanicilor":"lupănică","lupanii":"lupan","lupanilor":"lupan","lupanite":"lupăniță","lupanitei":"lupăniță","lupanitele":"lupăniță","lupanitelor":"lupăniță","lupanul":"lupan","lupanule":"lupan","lupanului":"lupan","luparia":"lupărie","lupariei":"lupărie","luparii":"lupărie","lupariile":"lupărie","lupariilor":"lupărie","lupe":"lupă","lupeasca":["lupească","lupesc","lupeasca","lupesc"],"lupei":"lupă","lupele":"lupă","lupelor":"lupă","lupercaliile":"lupercalii","lupercaliilor":"lupercalii","lupescul":"lupesc","lupesti":"lupesc","lupestii":"lupesc","lupestile":"lupesc","lupi":"lup","lupi de mare":"lup de mare","lupi de mare atlantici":"lup de mare atlantic","lupi de mare codati":"lup de mare codat","lupi de mare mici":"lup de mare mic","lupia":"lupiu","lupie":"lupiu","lupii":["lupii","lup","lupii","lupiu"],"lupiii":"lupiu","lupiile":"lupiu","lupilor":"lup","lupingul":"luping","lupingule":"luping","lupingului":"luping","lupinguri":"luping","lupingurile":"luping","lupingurilor":"luping","lupinoze":"lupinoză","lupinozei":"lupinoză","lupinozele":"lupinoză","lupinozelor":"lupinoză","lupite":"lupiță","lupitei":"lupiță","lupitele":"lupiță","lupitelor":"lupiță","lupiul":"lupiu","lupoaia":"lupoaie","lupoaice":"lupoaică","lupoaicei":"lupoaică","lupoaicele":"lupoaică","lupoaicelor":"lupoaică","lupoaiei":"lupoaie","lupoaiele":"lupoaie","lupoaielor":"lupoaie","lupoida":["lupoidă","lupoid","lupoida","lupoid"],"lupoide":"lupoid","lupoidele":"lupoid","lupoidul":"lupoid","lupoii":"lupoi","lupoilor":"lupoi","lupoiul":"lupoi","lupoiule":"lupoi","lupoiului":"lupoi","lupoizi":"lupoid","lupoizii":"lupoid","lupt":"lupta","luptai":"lupta","luptam":["luptăm","lupta","luptam","lupta"],"luptand":"lupta","luptara":"lupta","luptaram":"lupta","luptarati":"lupta","luptarea":"luptare","luptari":"luptare","luptarii":"luptare","luptarile":"luptare","luptarilor":"luptare","luptase":"lupta","luptasem":"lupta","luptasera":"lupta","luptaseram":"lupta","luptaserati":"lupta","luptasesi":"lupta","luptasi":["luptași","lupta","luptași","luptaș"],"luptasii":"luptaș","luptasilor":"luptaș","luptasul":"luptaș","luptasule":"luptaș","luptasului":"luptaș","luptat":"lupta","luptat cu morile de vant":"lupta cu morile de vânt","luptati":"lupta","luptatoarea":"luptătoare","luptatoarei":"luptătoare","luptatoarele":"luptătoare","luptatoarelor":"luptătoare","luptatori":"luptător","luptau":"lupta","lupte":["lupte","lupta","lupte","luptă"],"luptei":"luptă","luptele":"luptă","luptelor":"luptă","lupti":"lupta","lupul":"lup","lupule":"lup","lupuline":"lupulină","lupulinei":"lupulină","lupului":"lup","lupusul":"lupus","lupusule":"lupus","lupusului":"lupus","lurexul":"lurex","lurexule":"lurex","lurexului":"lurex","lusa":["lușă","luș","lușa","luș"],"lusai":"lușa","lusam":["lușăm","lușa","lușam","lușa"],"lusand":"lușa","lusara":"lușa","lusaram":"lușa","lusarati":"lușa","lusase":"lușa","lusasem":"lușa","lusasera":"lușa","lusaseram":"lușa","lusaserati":"lușa","lusasesi":"lușa","lusasi":"lușa","lusat":"lușa","lusati":"lușa","lusau":"lușa","luscute":["luscuțe","luscuță","lușcuțe","lușcuță"],"luscutei":["luscuței","luscuță","lușcuței","lușcuță"],"luscutele":["luscuțele","luscuță","lușcuțele","lușcuță"],"luscutelor":["luscuțelor","luscuță","lușcuțelor","lușcuță"],"luse":"luș","luseaza":"lușa","lusele":"luș","lusez":"lușa","lusezi":"lușa","lusi":"luș","lusii":"luș","lusitane":"lusitană","lusitanei":"lusitană","lusitanele":"lusitană","lusitanelor":"lusitană","lusitani":"lusitan","lusitaniana":["lusitaniană","lusitanian","lusitaniana","lusitanian"],"lusitanianul":"lusitanian","lusitanianule":"lusitanian","lusitanianului":"lusitanian","lusitaniene":"lusitanian","lusitanienele":"lusitanian","lusitanieni":"lusitanian","lusitanienii":"lusitanian","lusitanienile":"lusitanian","lusitanienilor":"lusitanian","lusitanii":"lusitan","lusitanilor":"lusitan","lusitanul":"lusitan","lusitanule":"lusitan","lusitanului":"lusitan","luste":"lușcă","lustei":"lușcă","lustele":"lușcă","lustelor":"lușcă","lusti":"lușcă","lustrageria":"lustragerie","lustrageriei":"lustragerie","lustragerii":"lustragerie","lustrageriile":"lustragerie","lustrageriilor":"lustragerie","lustragii":"lustragiu","lustragiii":"lustragiu","lustragiilor":"lustragiu","lustragioaice":"lustragioaică","lustragioaicei":"lustragioaică","lustragioaicele":"lustragioaică","lustragioaicelor":"lustragioaică","lustragiul":"lustragiu","lustragiule":"lustragiu","lustragiului":"lustragiu","lustrala":["lustrală","lustral","lustrala","lustral"],"lustrale":"lustral","lustralele":"lustral","lustrali":"lustral","lustralii":"lustral","lustralul":"lustral","lustratia":"lustrație","lustratiei":"lustrație","lustratii":"lustrație","lustratiile":"lustrație","lustratiilor":"lustrație","lustraul":"lustră","lustraule":"lustră","lustraului":"lustră","lustre":"lustră","lustrele":"lustră","lustrelor":"lustră","lustrine":"lustrină","lustrinei":"lustrină","lustrinul":"lustrin","lustrinule":"lustrin","lustrinului":"lustrin","lustruia":"lustrui","lustruiai":"lustrui","lustruiam":"lustrui","lustruiati":"lustrui","lustruiau":"lustrui","lustruieli":"lustruială","lustruielii":"lustruială","lustruielile":"lustruială","lustruielilor":"lustruială","lustruiesc":"lustrui","lustruieste":"lustrui","lustruiesti":"lustrui","lustruii":"lustrui","lustruim":"lustrui","lustruind":"lustrui","lustruira":"lustrui","lustruiram":"lustrui","lustruirati":"lustrui","lustruirea":"lustruire","lustruiri":"lustruire","lustruirii":"lustruire","lustruirile":"lustruire","lustruirilor":"lustruire","lustruise":"lustrui","lustruisem":"lustrui","lustruisera":"lustrui","lustruiseram":"lustrui","lustruiserati":"lustrui","lustruisesi":"lustrui","lustruisi":"lustrui","lustruit":"lustrui","lustruita":["lustruită","lustruit","lustruita","lustruit"],"lustruite":"lustruit","lustruitele":"lustruit","lustruiti":["lustruiți","lustrui","lustruiți","lustruit"],"lustruitii":"lustruit","lustruitoarea":"lustruitoare","lustruitoarei":"lustruitoare","lustruitoarele":"lustruitoare","lustruitoarelor":"lustruitoare","lustruitori":"lustruitor","lustruitorii":"lustruitor","lustruitorilor":"lustruitor","lustruitorul":"lustruitor","lustruitorule":"lustruitor","lustruitorului":"lustruitor","lustruitul":"lustruit","lustruul":"lustru","lustruule":"lustru","lustruului":"lustru","lusul":"luș","lutaranasi":"lutărănaș","lutaranasii":"lutărănaș","lutaranasilor":"lutărănaș","lutaranasul":"lutărănaș","lutaranasule":"lutărănaș","lutaranasului":"lutărănaș","lutaria":"lutărie","lutariei":"lutărie","lutarii":["lutării","lutărie","lutarii","lutariu"],"lutariile":["lutăriile","lutărie","lutariile","lutariu"],"lutariilor":["lutăriilor","lutărie","lutariilor","lutariu"],"lutariuul":"lutariu","lutariuule":"lutariu","lutariuului":"lutariu","lutarne":"luțarnă","lutarnei":"luțarnă","luteine":"luteină","luteinei":"luteină","luteinele":"luteină","luteinelor":"luteină","luterane":"luterană","luteraneasca":["luteranească","luteranesc","luteraneasca","luteranesc"],"luteranei":"luterană","luteranele":"luterană","luteranelor":"luterană","luteranescul":"luteranesc","luteranesti":"luteranesc","luteranestii":"luteranesc","luteranestile":"luteranesc","luterani":"luteran","luteranii":"luteran","luteranilor":"luteran","luteranisme":"luteranism","luteranismele":"luteranism","luteranismelor":"luteranism","luteranismul":"luteranism","luteranismule":"luteranism","luteranismului":"luteranism","luteranul":"luteran","luteranule":"luteran","luteranului":"luteran","luterne":"luțernă","luternei":"luțernă","lutetianul":"lutețian","lutetianule":"lutețian","lutetianului":"lutețian","lutetieni":"lutețian","lutetienile":"lutețian","lutetienilor":"lutețian","lutetiul":"lutețiu","lutetiule":"lutețiu","lutetiului":"lutețiu","luthul":"luth","luthule":"luth","luthului":"luth","luthuri":"luth","luthurile":"luth","luthurilor":"luth","lutieri":"lutier","lutierii":"lutier","lutierilor":"lutier","lutierul":"lutier","lutierule":"lutier","lutierului":"lutier","lutisoare":"lutișor","lutisore":"lutișor","lutisorele":"lutișor","lutisorelor":"lutișor","lutisorul":"lutișor","lutisorule":"lutișor","lutisorului":"lutișor","lutiste":"lutistă","lutistei":"lutistă","lutistele":"lutistă","lutistelor":"lutistă","lutisti":"lutist","lutistii":"lutist","lutistilor":"lutist","lutistul":"lutist","lutistule":"lutist","lutistului":"lutist","lutoasa":["lutoasă","lutos","lutoasa","lutos"],"lutoase":"lutos","lutoasele":"lutos","lutosi":"lutos","lutosii":"lutos","lutosul":"lutos","lutre":"lutră","lutrei":"lutră","lutrele":"lutră","lutrelor":"lutră","lutrul":"lutru","lutrule":"lutru","lutrului":"lutru","luturi":"lut","luxai":"luxa","luxam":["luxăm","luxa","luxam","luxa"],"luxand":"luxa","luxara":"luxa","luxaram":"luxa","luxarati":"luxa","luxarea":"luxare","luxarei":"luxare","luxase":"luxa","luxasem":"luxa","luxasera":"luxa","luxaseram":"luxa","luxaserati":"luxa","luxasesi":"luxa","luxasi":"luxa","luxat":"luxa","luxati":"luxa","luxatia":"luxație","luxatiei":"luxație","luxatii":"luxație","luxatiile":"luxație","luxatiilor":"luxație","luxatiunea":"luxațiune","luxatiuni":"luxațiune","luxatiunii":"luxațiune","luxatiunile":"luxațiune","luxatiunilor":"luxațiune","luxaturi":"luxatură","luxaturii":"luxatură","luxaturile":"luxatură","luxaturilor":"luxatură","luxau":"luxa","luxeaza":"luxa","luxemburgheza":["luxemburgheză","luxemburghez","luxemburgheza","luxemburghez"],"luxemburgheze":["luxemburgheze","luxemburghez","luxemburgheze","luxemburgheză"],"luxemburghezei":"luxemburgheză","luxemburghezele":["luxemburghezele","luxemburghez","luxemburghezele","luxemburgheză"],"luxemburghezelor":"luxemburgheză","luxemburghezi":"luxemburghez","luxemburghezii":"luxemburghez","luxemburghezilor":"luxemburghez","luxemburghezul":"luxemburghez","luxemburghezule":"luxemburghez","luxemburghezului":"luxemburghez","luxemburgul":"Luxemburg","luxemburgule":"Luxemburg","luxemburgului":"Luxemburg","luxez":"luxa","luxezi":"luxa","luxmetre":"luxmetru","luxmetrele":"luxmetru","luxmetrelor":"luxmetru","luxmetrul":"luxmetru","luxmetrule":"luxmetru","luxmetrului":"luxmetru","luxoasa":["luxoasă","luxos","luxoasa","luxos"],"luxoase":"luxos","luxoasele":"luxos","luxosi":"luxos","luxosii":"luxos","luxosul":"luxos","luxul":"lux","luxule":"lux","luxului":"lux","luxuri":"luxură","luxuria":"luxurie","luxurianta":["luxuriantă","luxuriant","luxurianta","luxuriant"],"luxuriante":["luxuriante","luxuriant","luxurianțe","luxurianță"],"luxuriantei":"luxurianță","luxuriantele":["luxuriantele","luxuriant","luxurianțele","luxurianță"],"luxuriantelor":"luxurianță","luxurianti":"luxuriant","luxuriantii":"luxuriant","luxuriantul":"luxuriant","luxuriei":"luxurie","luxurii":["luxurii","luxură","luxurii","luxurie"],"luxuriile":"luxurie","luxuriilor":"luxurie","luxurile":"luxură","luxurilor":"luxură","luxurioasa":["luxurioasă","luxurios","luxurioasa","luxurios"],"luxurioase":"luxurios","luxurioasele":"luxurios","luxuriosi":"luxurios","luxuriosii":"luxurios","luxuriosul":"luxurios","luxuriozitatea":"luxuriozitate","luxuriozitati":"luxuriozitate","luxuriozitatii":"luxuriozitate","luzi":"lude","luzia":"luzie","luziei":"luzie","luzii":["luzii","lude","luzii","luzie"],"luziile":"luzie","luziilor":"luzie","luzilor":"lude"};
@@ -0,0 +1 @@
+export default {"ma":"eu","masoara":"remăsura","mea":"eu","mei":"eu","mele":"eu","meu":"eu","mie":"eu","mine":"eu","modifice":"notifica"};
@@ -0,0 +1 @@
+export default {"n-ai pentru ce":"nu ai pentru ce","n-aveti pentru ce":"nu aveți pentru ce","n.s.d.a.p.":"NSDAP","nababi":"nabab","nababia":"nababie","nababiei":"nababie","nababii":["nababii","nabab","nababii","nababie"],"nababiile":"nababie","nababiilor":"nababie","nababilor":"nabab","nababul":"nabab","nababule":"nabab","nababului":"nabab","nabadai":"năbădaie","nabadaice":"năbădaică","nabadaicei":"năbădaică","nabadaicele":"năbădaică","nabadaicelor":"năbădaică","nabadaici":"năbădaică","nabadaiea":"năbădaie","nabadaioasa":["năbădăioasă","năbădăios","năbădăioasa","năbădăios"],"nabadaioase":"năbădăios","nabadaioasele":"năbădăios","nabadaiosi":"năbădăios","nabadaiosii":"năbădăios","nabadaiosul":"năbădăios","nabadi":"năbădaie","nabadii":"năbădaie","nabadile":"năbădaie","nabadilor":"năbădaie","nabasaditoare":"năbăsăditor","nabasaditoarea":"năbăsăditor","nabasaditoarele":"năbăsăditor","nabasaditori":"năbăsăditor","nabasaditorii":"năbăsăditor","nabasaditorul":"năbăsăditor","nabedernite":"nabederniță","nabedernitei":"nabederniță","nabedernitele":"nabederniță","nabedernitelor":"nabederniță","naboia":"năboi","naboiai":"năboi","naboiam":"năboi","naboiati":"năboi","naboiau":"năboi","naboiele":"năboială","naboielei":"năboială","naboielele":"năboială","naboielelor":"năboială","naboieli":"năboială","naboiesc":"năboi","naboieste":"năboi","naboiesti":"năboi","naboii":"năboi","naboim":"năboi","naboind":"năboi","naboira":"năboi","naboiram":"năboi","naboirati":"năboi","naboise":"năboi","naboisem":"năboi","naboisera":"năboi","naboiseram":"năboi","naboiserati":"năboi","naboisesi":"năboi","naboisi":"năboi","naboit":"năboi","naboiti":"năboi","nabucul":"năbuc","nabucule":"năbuc","nabucului":"năbuc","nabusea":"năbuși","nabuseai":"năbuși","nabuseam":"năbuși","nabuseati":"năbuși","nabuseau":"năbuși","nabusele":"năbușeală","nabuselei":"năbușeală","nabuselele":"năbușeală","nabuselelor":"năbușeală","nabuseli":"năbușeală","nabusesc":"năbuși","nabuseste":"năbuși","nabusesti":"năbuși","nabusii":"năbuși","nabusim":"năbuși","nabusind":"năbuși","nabusira":"năbuși","nabusiram":"năbuși","nabusirati":"năbuși","nabusirea":"năbușire","nabusiri":"năbușire","nabusirii":"năbușire","nabusirile":"năbușire","nabusirilor":"năbușire","nabusise":"năbuși","nabusisem":"năbuși","nabusisera":"năbuși","nabusiseram":"năbuși","nabusiserati":"năbuși","nabusisesi":"năbuși","nabusisi":"năbuși","nabusit":"năbuși","nabusiti":"năbuși","nabusituri":"năbușitură","nabusiturii":"năbușitură","nabusiturile":"năbușitură","nabusiturilor":"năbușitură","nacafale":["nacafale","nacafa","năcăfale","năcăfală"],"nacafalei":["nacafalei","nacafa","năcăfalei","năcăfală"],"nacafalele":["nacafalele","nacafa","năcăfalele","năcăfală"],"nacafalelor":["nacafalelor","nacafa","năcăfalelor","năcăfală"],"nacafaua":"nacafa","nacajea":"năcăji","nacajeai":"năcăji","nacajeam":"năcăji","nacajeati":"năcăji","nacajeau":"năcăji","nacajesc":"năcăji","nacajeste":"năcăji","nacajesti":"năcăji","nacajia":"năcăjie","nacajiei":"năcăjie","nacajii":["năcăjii","năcăji","năcăjii","năcăjie"],"nacajiile":"năcăjie","nacajiilor":"năcăjie","nacajim":"năcăji","nacajind":"năcăji","nacajira":"năcăji","nacajiram":"năcăji","nacajirati":"năcăji","nacajise":"năcăji","nacajisem":"năcăji","nacajisera":"năcăji","nacajiseram":"năcăji","nacajiserati":"năcăji","nacajisesi":"năcăji","nacajisi":"năcăji","nacajit":"năcăji","nacajita":["năcăjită","năcăjit","năcăjita","năcăjit"],"nacajite":"năcăjit","nacajitele":"năcăjit","nacajiti":["năcăjiți","năcăji","năcăjiți","năcăjit"],"nacajitii":"năcăjit","nacajitul":"năcăjit","nacasi":"nacaș","nacasii":"nacaș","nacasilor":"nacaș","nacasul":"nacaș","nacasule":"nacaș","nacasului":"nacaș","nacazlacul":"nacazlâc","nacazlacule":"nacazlâc","nacazlacului":"nacazlâc","nacazlacuri":"nacazlâc","nacazlacurii":"nacazlâc","nacazlacurilor":"nacazlâc","nacazul":"năcaz","nacazule":"năcaz","nacazului":"năcaz","nacazuri":"năcaz","nacazurile":"năcaz","nacazurilor":"năcaz","nacealnici":"nacealnic","nacealnicia":"nacealnicie","nacealniciei":"nacealnicie","nacealnicii":["nacealnicii","nacealnic","nacealnicii","nacealnicie"],"nacealniciile":"nacealnicie","nacealniciilor":"nacealnicie","nacealnicilor":"nacealnic","nacealnicul":"nacealnic","nacealnicule":"nacealnic","nacealnicului":"nacealnic","nacele":"nacelă","nacelei":"nacelă","naclaia":"năclăi","naclaiai":"năclăi","naclaiam":"năclăi","naclaiati":"năclăi","naclaiau":"năclăi","naclaiesc":"năclăi","naclaieste":"năclăi","naclaiesti":"năclăi","naclaii":"năclăi","naclaim":"năclăi","naclaind":"năclăi","naclaioasa":["năclăioasă","năclăios","năclăioasa","năclăios"],"naclaioase":"năclăios","naclaioasele":"năclăios","naclaiosi":"năclăios","naclaiosii":"năclăios","naclaiosul":"năclăios","naclaira":"năclăi","naclairam":"năclăi","naclairati":"năclăi","naclaise":"năclăi","naclaisem":"năclăi","naclaisera":"năclăi","naclaiseram":"năclăi","naclaiserati":"năclăi","naclaisesi":"năclăi","naclaisi":"năclăi","naclait":"năclăi","naclaita":["năclăită","năclăit","năclăita","năclăit"],"naclaite":"năclăit","naclaitele":"năclăit","naclaiti":["năclăiți","năclăi","năclăiți","năclăit"],"naclaitii":"năclăit","naclaitul":"năclăit","nacrite":"nacrit","nacritele":"nacrit","nacritelor":"nacrit","nacritul":"nacrit","nacritule":"nacrit","nacritului":"nacrit","nacrul":"nacru","nacrule":"nacru","nacrului":"nacru","nadaia":"nădăi","nadaiai":"nădăi","nadaiam":"nădăi","nadaiati":"nădăi","nadaiau":"nădăi","nadaiesc":"nădăi","nadaieste":"nădăi","nadaiesti":"nădăi","nadaii":"nădăi","nadaim":"nădăi","nadaind":"nădăi","nadaira":"nădăi","nadairam":"nădăi","nadairati":"nădăi","nadaise":"nădăi","nadaisem":"nădăi","nadaisera":"nădăi","nadaiseram":"nădăi","nadaiserati":"nădăi","nadaisesi":"nădăi","nadaisi":"nădăi","nadait":"nădăi","nadaiti":"nădăi","nadajduia":"nădăjdui","nadajduiai":"nădăjdui","nadajduiam":"nădăjdui","nadajduiati":"nădăjdui","nadajduiau":"nădăjdui","nadajduiesc":"nădăjdui","nadajduieste":"nădăjdui","nadajduiesti":"nădăjdui","nadajduii":"nădăjdui","nadajduim":"nădăjdui","nadajduind":"nădăjdui","nadajduinte":"nădăjduință","nadajduintei":"nădăjduință","nadajduintele":"nădăjduință","nadajduintelor":"nădăjduință","nadajduira":"nădăjdui","nadajduiram":"nădăjdui","nadajduirati":"nădăjdui","nadajduirea":"nădăjduire","nadajduiri":"nădăjduire","nadajduirii":"nădăjduire","nadajduirile":"nădăjduire","nadajduirilor":"nădăjduire","nadajduise":"nădăjdui","nadajduisem":"nădăjdui","nadajduisera":"nădăjdui","nadajduiseram":"nădăjdui","nadajduiserati":"nădăjdui","nadajduisesi":"nădăjdui","nadajduisi":"nădăjdui","nadajduit":"nădăjdui","nadajduiti":"nădăjdui","nadajduitori":"nădăjduitor","nadajduitorii":"nădăjduitor","nadajduitorilor":"nădăjduitor","nadajduitorul":"nădăjduitor","nadajduitorule":"nădăjduitor","nadajduitorului":"nădăjduitor","nade":"nadă","nadei":"nadă","nadejdea":"nădejde","nadejdi":"nădejde","nadejdii":"nădejde","nadejdile":"nădejde","nadejdilor":"nădejde","nadejduia":"nădejdui","nadejduiai":"nădejdui","nadejduiam":"nădejdui","nadejduiati":"nădejdui","nadejduiau":"nădejdui","nadejduiesc":"nădejdui","nadejduieste":"nădejdui","nadejduiesti":"nădejdui","nadejduii":"nădejdui","nadejduim":"nădejdui","nadejduind":"nădejdui","nadejduira":"nădejdui","nadejduiram":"nădejdui","nadejduirati":"nădejdui","nadejduise":"nădejdui","nadejduisem":"nădejdui","nadejduisera":"nădejdui","nadejduiseram":"nădejdui","nadejduiserati":"nădejdui","nadejduisesi":"nădejdui","nadejduisi":"nădejdui","nadejduit":"nădejdui","nadejduiti":"nădejdui","nadele":["nadele","nadă","nădele","nădeală"],"nadelei":"nădeală","nadelele":"nădeală","nadelelor":"nădeală","nadeli":"nădeală","nadelor":"nadă","nadicence":"nadiceancă","nadicencei":"nadiceancă","nadicencele":"nadiceancă","nadicencelor":"nadiceancă","nadirala":["nadirală","nadiral","nadirala","nadiral"],"nadirale":"nadiral","nadiralele":"nadiral","nadirali":"nadiral","nadiralii":"nadiral","nadiralul":"nadiral","nadirul":"nadir","nadirule":"nadir","nadirului":"nadir","nadis hododului":"Nadișu Hododului","nadisence":"nadișancă","nadisencei":"nadișancă","nadisencele":"nadișancă","nadisencelor":"nadișancă","nadituri":"năditură","naditurii":"năditură","naditurile":"năditură","naditurilor":"năditură","nadoleance":"nadoleancă","nadoleancele":"nadoleancă","nadragari":"nădrăgar","nadragarii":"nădrăgar","nadragarilor":"nădrăgar","nadragarul":"nădrăgar","nadragarule":"nădrăgar","nadragarului":"nădrăgar","nadragei":"nădrăgel","nadrageli":"nădrăgel","nadragelii":"nădrăgel","nadragelilor":"nădrăgel","nadragelul":"nădrăgel","nadragelule":"nădrăgel","nadragelului":"nădrăgel","nadragi":"nădrag","nadragii":"nădrag","nadragilor":"nădrag","nadragul":"nădrag","nadragule":["nădragule","nădrag","nădrăgule","nădrăgulă"],"nadragulei":"nădrăgulă","nadragulele":"nădrăgulă","nadragulelor":"nădrăgulă","nadragului":"nădrag","nadraguti":"nădrăguț","nadragutii":"nădrăguț","nadragutilor":"nădrăguț","nadragutul":"nădrăguț","nadragutule":"nădrăguț","nadragutului":"nădrăguț","nadufoasa":["nădufoasă","nădufos","nădufoasa","nădufos"],"nadufoase":"nădufos","nadufoasele":"nădufos","nadufosi":"nădufos","nadufosii":"nădufos","nadufosul":"nădufos","naduful":"năduf","nadufule":"năduf","nadufului":"năduf","nadufuri":"năduf","nadufurile":"năduf","nadufurilor":"năduf","naduhul":"năduh","naduhule":"năduh","naduhului":"năduh","naduhuri":"năduh","naduhurile":"năduh","naduhurilor":"năduh","nadulele":"năduleală","nadulelei":"năduleală","nadulelele":"năduleală","nadulelelor":"năduleală","naduleli":"năduleală","nadulirea":"nădulire","naduliri":"nădulire","nadulirii":"nădulire","nadulirile":"nădulire","nadulirilor":"nădulire","nadurea":"năduri","nadureai":"năduri","naduream":"năduri","nadureati":"năduri","nadureau":"năduri","naduresc":"năduri","nadureste":"năduri","naduresti":"năduri","nadurii":"năduri","nadurim":"năduri","nadurind":"năduri","nadurira":"năduri","naduriram":"năduri","nadurirati":"năduri","nadurise":"năduri","nadurisem":"năduri","nadurisera":"năduri","naduriseram":"năduri","naduriserati":"năduri","nadurisesi":"năduri","nadurisi":"năduri","nadurit":"năduri","naduriti":"năduri","nadusea":"năduși","naduseai":"năduși","naduseam":"năduși","naduseati":"năduși","naduseau":"năduși","naduseli":"nădușeală","naduselii":"nădușeală","naduselile":"nădușeală","naduselilor":"nădușeală","nadusesc":"năduși","naduseste":"năduși","nadusesti":"năduși","nadusii":"năduși","nadusim":"năduși","nadusind":"năduși","nadusira":"năduși","nadusiram":"năduși","nadusirati":"năduși","nadusirea":"nădușire","nadusiri":"nădușire","nadusirii":"nădușire","nadusirile":"nădușire","nadusirilor":"nădușire","nadusise":"năduși","nadusisem":"năduși","nadusisera":"năduși","nadusiseram":"năduși","nadusiserati":"năduși","nadusisesi":"năduși","nadusisi":"năduși","nadusit":"năduși","nadusita":["nădușită","nădușit","nădușita","nădușit"],"nadusite":"nădușit","nadusitele":"nădușit","nadusiti":["nădușiți","năduși","nădușiți","nădușit"],"nadusitii":"nădușit","nadusitoare":"nădușitor","nadusitoarea":"nădușitor","nadusitoarele":"nădușitor","nadusitori":"nădușitor","nadusitorii":"nădușitor","nadusitorul":"nădușitor","nadusitul":"nădușit","nafacale":"nafaca","nafacalei":"nafaca","nafacalele":"nafaca","nafacalelor":"nafaca","nafacaua":"nafaca","naframe":"năframă","naframeaua":"năfrămea","naframei":"năframă","naframele":["năframele","năframă","năfrămele","năfrămea"],"naframelei":"năfrămea","naframelele":"năfrămea","naframelelor":"năfrămea","naframelor":"năframă","naframioare":"năfrămioară","naframioarei":"năfrămioară","naframioarele":"năfrămioară","naframioarelor":"năfrămioară","naframite":"năfrămiță","naframitei":"năfrămiță","naframitele":"năfrămiță","naframitelor":"năfrămiță","naframuci":"năfrămucă","naframucii":"năfrămucă","naframucile":"năfrămucă","naframucilor":"năfrămucă","naframute":"năfrămuță","naframutei":"năfrămuță","naframutele":"năfrămuță","naframutelor":"năfrămuță","naftalenul":"naftalen","naftalenule":"naftalen","naftalenului":"naftalen","naftalin":"naftalină","naftaline":"naftalină","naftalinei":"naftalină","naftalinele":"naftalină","naftalinelor":"naftalină","naftalinoasa":["naftalinoasă","naftalinos","naftalinoasa","naftalinos"],"naftalinoase":"naftalinos","naftalinoasele":"naftalinos","naftalinosi":"naftalinos","naftalinosii":"naftalinos","naftalinosul":"naftalinos","naftenati":"naftenat","naftenatii":"naftenat","naftenatilor":"naftenat","naftenatul":"naftenat","naftenatule":"naftenat","naftenatului":"naftenat","naftene":"naftenă","naftenei":"naftenă","naftenele":"naftenă","naftenelor":"naftenă","naftenica":["naftenică","naftenic","naftenica","naftenic"],"naftenice":"naftenic","naftenicele":"naftenic","naftenici":"naftenic","naftenicii":"naftenic","naftenicul":"naftenic","naftolati":"naftolat","naftolatii":"naftolat","naftolatilor":"naftolat","naftolatul":"naftolat","naftolatule":"naftolat","naftolatului":"naftolat","naftoli":"naftol","naftolii":"naftol","naftolilor":"naftol","naftolul":"naftol","naftolule":"naftol","naftolului":"naftol","naftul":"naft","naftule":"naft","naftului":"naft","nafuri":"nafură","nafurii":"nafură","nafurile":"nafură","nafurilor":"nafură","nagaice":"nagaică","nagaicei":"nagaică","nagaicele":"nagaică","nagaicelor":"nagaică","nagare":"năgară","nagarei":"năgară","nagarusul":"năgăruș","nagarusule":"năgăruș","nagarusului":"năgăruș","nagati":"nagâț","nagati cu coada alba":"nagâț cu coadă albă","nagati de stepa":"nagâț de stepă","nagati sudici":"nagâț sudic","nagatii":"nagâț","nagatilor":"nagâț","nagatul":"nagâț","nagatule":"nagâț","nagatului":"nagâț","naglagul":"năglag","naglagule":"năglag","naglagului":"năglag","nahiele":"nahia","nahut":"năut","nahutul":"năhut","nahutule":"năhut","nahutului":"năhut","nai":"naie","naia":"naie","naiade":"naiadă","naiadei":"naiadă","naiadele":"naiadă","naiadelor":"naiadă","naiasi":"năiaș","naiasii":"năiaș","naiasilor":"năiaș","naiasul":"năiaș","naiasule":"năiaș","naiasului":"năiaș","naiemnici":"năiemnic","naiemnicii":"năiemnic","naiemnicilor":"năiemnic","naiemnicul":"năiemnic","naiemnicule":"năiemnic","naiemnicului":"năiemnic","naiemul":"năiem","naiemule":"năiem","naiemului":"năiem","naiemuri":"năiem","naiemurile":"năiem","naiemurilor":"năiem","naieri":"năier","naierii":"năier","naierilor":"năier","naierul":"năier","naierule":"năier","naierului":"năier","naii":"naie","naile":"naie","nailonul":"nailon","nailonule":"nailon","nailonului":"nailon","nailonuri":"nailon","nailonurile":"nailon","nailonurilor":"nailon","nailor":"naie","naimeli":"năimeală","naimelii":"năimeală","naimelile":"năimeală","naimelilor":"năimeală","naimite":"năimită","naimitei":"năimită","naimitele":"năimită","naimitelor":"năimită","naingii":"naingiu","naingiii":"naingiu","naingiilor":"naingiu","naingiul":"naingiu","naingiule":"naingiu","naingiului":"naingiu","naintasa":["naintașă","naintaș","naintașa","naintaș"],"naintase":"naintaș","naintasele":"naintaș","naintasi":"naintaș","naintasii":"naintaș","naintasul":"naintaș","naisani":"naisan","naisanii":"naisan","naisanilor":"naisan","naisanul":"naisan","naisanule":"naisan","naisanului":"naisan","naisoare":"năișoară","naisoarei":"năișoară","naisoarele":"năișoară","naisoarelor":"năișoară","naiste":"naistă","naistei":"naistă","naistele":"naistă","naistelor":"naistă","naisti":["naiști","naist","naisti","naist"],"naistii":"naist","naistilor":"naist","naistul":"naist","naistule":"naist","naistului":"naist","naiul":"nai","naiule":"nai","naiului":"nai","naiuri":"nai","naiurile":"nai","naiurilor":"nai","naiva":["naivă","naiv","naiva","naiv"],"naive":["naive","naiv","naive","naivă"],"naivei":"naivă","naivele":["naivele","naiv","naivele","naivă"],"naivelor":"naivă","naivi":"naiv","naivii":"naiv","naivitatea":"naivitate","naivitati":"naivitate","naivitatii":"naivitate","naivitatile":"naivitate","naivitatilor":"naivitate","naivul":"naiv","najite":"năjiță","najitei":"năjiță","najitele":"năjiță","najitelor":"năjiță","nalbani":"nălban","nalbanii":"nălban","nalbanilor":"nălban","nalbanti":"nalbant","nalbantii":"nalbant","nalbantilor":"nalbant","nalbantul":"nalbant","nalbantule":"nalbant","nalbantului":"nalbant","nalbanul":"nălban","nalbanule":"nălban","nalbanului":"nălban","nalbari":["nalbari","nalbar","nălbari","nălbar"],"nalbarii":["nalbarii","nalbar","nălbarii","nălbar"],"nalbarilor":["nalbarilor","nalbar","nălbarilor","nălbar"],"nalbarul":["nalbarul","nalbar","nălbarul","nălbar"],"nalbarule":["nalbarule","nalbar","nălbarule","nălbar"],"nalbarului":["nalbarului","nalbar","nălbarului","nălbar"],"nalbe":"nalbă","nalbea":"nălbi","nalbeai":"nălbi","nalbeam":"nălbi","nalbeati":"nălbi","nalbeau":"nălbi","nalbesc":"nălbi","nalbeste":"nălbi","nalbesti":"nălbi","nalbii":"nălbi","nalbim":"nălbi","nalbind":"nălbi","nalbira":"nălbi","nalbiram":"nălbi","nalbirati":"nălbi","nalbise":"nălbi","nalbisem":"nălbi","nalbisera":"nălbi","nalbiseram":"nălbi","nalbiserati":"nălbi","nalbisesi":"nălbi","nalbisi":"nălbi","nalbisoare":"nălbișoară","nalbisoarei":"nălbișoară","nalbisoarele":"nălbișoară","nalbisoarelor":"nălbișoară","nalbit":"nălbi","nalbita":["nălbită","nălbit","nălbita","nălbit"],"nalbite":"nălbit","nalbitele":"nălbit","nalbiti":["nălbiți","nălbi","nălbiți","nălbit"],"nalbitii":"nălbit","nalbitul":"nălbit","nalboasa":["nălboasă","nălbos","nălboasa","nălbos"],"nalboase":"nălbos","nalboasele":"nălbos","nalbosi":"nălbos","nalbosii":"nălbos","nalbosul":"nălbos","nalbusoare":"nălbușoară","nalbusoarei":"nălbușoară","nalbusoarele":"nălbușoară","nalbusoarelor":"nălbușoară","nalt":"nălța","nalta":["naltă","nalt","nalta","nalt"],"naltai":"nălța","naltam":["nălțăm","nălța","nălțam","nălța"],"naltand":"nălța","naltara":"nălța","naltaram":"nălța","naltarati":"nălța","naltase":"nălța","naltasem":"nălța","naltasera":"nălța","naltaseram":"nălța","naltaserati":"nălța","naltasesi":"nălța","naltasi":"nălța","naltat":"nălța","naltati":"nălța","naltau":"nălța","nalte":"nalt","naltele":"nalt","nalti":["nalți","nalt","nălți","nălța"],"nalticela":["nălticelă","nălticel","nălticela","nălticel"],"nalticele":"nălticel","nalticelele":"nălticel","nalticeli":"nălticel","nalticelii":"nălticel","nalticelul":"nălticel","naltii":"nalt","naltimea":"nălțime","naltimi":"nălțime","naltimii":"nălțime","naltimile":"nălțime","naltimilor":"nălțime","naltisora":["năltișoră","năltișor","năltișora","năltișor"],"naltisore":"năltișor","naltisorele":"năltișor","naltisori":"năltișor","naltisorii":"năltișor","naltisorul":"năltișor","naltul":"nalt","naltuta":["năltuță","năltuț","năltuța","năltuț"],"naltute":"năltuț","naltutele":"năltuț","naltuti":"năltuț","naltutii":"năltuț","naltutul":"năltuț","nalucea":"năluci","naluceai":"năluci","naluceam":"năluci","naluceati":"năluci","naluceau":"năluci","naluceli":"năluceală","nalucelii":"năluceală","nalucelile":"năluceală","nalucelilor":"năluceală","nalucesc":"năluci","naluceste":"năluci","nalucesti":"năluci","naluci":"nălucă","nalucii":["nălucii","nălucă","nălucii","năluci"],"nalucile":"nălucă","nalucilor":"nălucă","nalucim":"năluci","nalucind":"năluci","nalucira":"năluci","naluciram":"năluci","nalucirati":"năluci","nalucirea":"nălucire","naluciri":"nălucire","nalucirii":"nălucire","nalucirile":"nălucire","nalucirilor":"nălucire","nalucise":"năluci","nalucisem":"năluci","nalucisera":"năluci","naluciseram":"năluci","naluciserati":"năluci","nalucisesi":"năluci","nalucisi":"năluci","nalucit":"năluci","nalucita":["nălucită","nălucit","nălucita","nălucit"],"nalucite":"nălucit","nalucitele":"nălucit","naluciti":["năluciți","năluci","năluciți","nălucit"],"nalucitii":"nălucit","nalucitoare":"nălucitor","nalucitoarea":"nălucitor","nalucitoarele":"nălucitor","nalucitori":"nălucitor","nalucitorii":"nălucitor","nalucitorul":"nălucitor","nalucitul":"nălucit","nalucituri":"nălucitură","naluciturii":"nălucitură","naluciturile":"nălucitură","naluciturilor":"nălucitură","namai":"nămaie","namaia":"nămaie","namaii":"nămaie","namaile":"nămaie","namailor":"nămaie","namale":"nămală","namalei":"nămală","namalele":"nămală","namalelor":"nămală","namazul":"namaz","namazule":"namaz","namazului":"namaz","namazuri":"namaz","namazurii":"namaz","namazurilor":"namaz","namea":"nămi","nameai":"nămi","nameam":"nămi","nameati":"nămi","nameau":"nămi","namesc":"nămi","namesnici":"namesnic","namesnicii":"namesnic","namesnicilor":"namesnic","namesnicul":"namesnic","namesnicule":"namesnic","namesnicului":"namesnic","nameste":"nămi","namesti":"nămi","namestia":"namestie","namestiei":"namestie","namestii":"namestie","namestiile":"namestie","namestiilor":"namestie","namestnici":"namestnic","namestnicii":"namestnic","namestnicilor":"namestnic","namestnicul":"namestnic","namestnicule":"namestnic","namestnicului":"namestnic","namet":"nămeți","namete":"nămeți","nametea":"nămeți","nameteai":"nămeți","nameteam":"nămeți","nameteati":"nămeți","nameteau":"nămeți","nameteste":"nămeți","nameteul":"nămete","nameteule":"nămete","nameteului":"nămete","nameti":"nămete","nametii":["nămeții","nămete","nămeții","nămeți"],"nametilor":"nămete","nametim":"nămeți","nametind":"nămeți","nametira":"nămeți","nametiram":"nămeți","nametirati":"nămeți","nametirea":"nămețire","nametiri":"nămețire","nametirii":"nămețire","nametirile":"nămețire","nametirilor":"nămețire","nametise":"nămeți","nametisem":"nămeți","nametisera":"nămeți","nametiseram":"nămeți","nametiserati":"nămeți","nametisesi":"nămeți","nametisi":"nămeți","nametit":"nămeți","nametita":["nămețită","nămețit","nămețita","nămețit"],"nametite":"nămețit","nametitele":"nămețit","nametiti":["nămețiți","nămeți","nămețiți","nămețit"],"nametitii":"nămețit","nametitul":"nămețit","namiazaul":"namiază","namiazaule":"namiază","namiazaului":"namiază","namibiana":["namibiană","namibian","namibiana","namibian"],"namibianul":"namibian","namibianule":"namibian","namibianului":"namibian","namibiene":["namibiene","namibian","namibiene","namibiană"],"namibienei":"namibiană","namibienele":["namibienele","namibian","namibienele","namibiană"],"namibienelor":"namibiană","namibieni":"namibian","namibienii":"namibian","namibienilor":"namibian","namieze":["nămieze","nămiază","nămieze","nămiez","nămieze","nămiezi"],"namiezei":"nămiază","namiezele":["nămiezele","nămiază","nămiezele","nămiez","nămiezele","nămiezi"],"namiezelor":["nămiezelor","nămiază","nămiezelor","nămiez","nămiezelor","nămiezi"],"namiezi":["namiezi","namiază","nămiezi","nămiază"],"namiezile":"namiază","namiezilor":"namiază","namieziul":"nămiezi","namieziule":"nămiezi","namieziului":"nămiezi","namiezul":["namiezul","namiez","nămiezul","nămiez"],"namiezule":["namiezule","namiez","nămiezule","nămiez"],"namiezului":["namiezului","namiez","nămiezului","nămiez"],"namii":"nămi","namile":"namilă","namilei":"namilă","namilele":"namilă","namilelor":"namilă","namim":"nămi","namind":"nămi","namira":"nămi","namiram":"nămi","namirati":"nămi","namise":"nămi","namisem":"nămi","namisera":"nămi","namiseram":"nămi","namiserati":"nămi","namisesi":"nămi","namisi":"nămi","namit":"nămi","namiti":"nămi","namolea":"nămoli","namoleai":"nămoli","namoleam":"nămoli","namoleati":"nămoli","namoleau":"nămoli","namolesc":"nămoli","namoleste":"nămoli","namolesti":"nămoli","namolii":"nămoli","namolim":"nămoli","namolind":"nămoli","namolira":"nămoli","namoliram":"nămoli","namolirati":"nămoli","namolise":"nămoli","namolisem":"nămoli","namolisera":"nămoli","namoliseram":"nămoli","namoliserati":"nămoli","namolisesi":"nămoli","namolisi":"nămoli","namolit":"nămoli","namolita":["nămolită","nămolit","nămolita","nămolit"],"namolite":"nămolit","namolitele":"nămolit","namoliti":["nămoliți","nămoli","nămoliți","nămolit"],"namolitii":"nămolit","namolitul":"nămolit","namoloasa":["nămoloasă","nămolos","nămoloasa","nămolos"],"namoloase":"nămolos","namoloasele":"nămolos","namolosi":"nămolos","namolosii":"nămolos","namolosul":"nămolos","namoloterapia":"nămoloterapie","namoloterapiei":"nămoloterapie","namoloterapii":"nămoloterapie","namoloterapiile":"nămoloterapie","namoloterapiilor":"nămoloterapie","namoluri":"nămol","nanase":["nânașe","nânașă","nănașe","nănașă"],"nanasei":["nânașei","nânașă","nănașei","nănașă","nănășei","nănășel"],"nanaseii":"nănășel","nanaseilor":"nănășel","nanasele":["nânașele","nânașă","nănașele","nănașă"],"nanaselor":["nânașelor","nânașă","nănașelor","nănașă"],"nanaselul":"nănășel","nanaselule":"nănășel","nanaselului":"nănășel","nanasi":["nânași","nânaș","nănași","nănaș"],"nanasii":["nânașii","nânaș","nănașii","nănaș"],"nanasilor":["nânașilor","nânaș","nănașilor","nănaș"],"nanasul":["nânașul","nânaș","nănașul","nănaș"],"nanasule":["nânașule","nânaș","nănașule","nănaș"],"nanasului":["nânașului","nânaș","nănașului","nănaș"],"nanasute":"nănășuță","nanasutei":"nănășuță","nanasutele":"nănășuță","nanasutelor":"nănășuță","nanaul":"nănău","nanaule":"nănău","nanaului":"nănău","nanauri":"nănău","nanaurile":"nănău","nanaurilor":"nănău","nanchinul":"nanchin","nanchinule":"nanchin","nanchinului":"nanchin","nanchinuri":"nanchin","nanchinurile":"nanchin","nanchinurilor":"nanchin","nandul":"nandu","nandule":"nandu","nandului":"nandu","nanghinul":"nanghin","nanghinule":"nanghin","nanghinului":"nanghin","nani":"nan","nanii":"nan","nanilor":"nan","nanismul":"nanism","nanismule":"nanism","nanismului":"nanism","nanocefalia":"nanocefalie","nanocefaliei":"nanocefalie","nanocefalii":"nanocefalie","nanocefaliile":"nanocefalie","nanocefaliilor":"nanocefalie","nanofaradul":"nanofarad","nanofaradule":"nanofarad","nanofaradului":"nanofarad","nanofarazi":"nanofarad","nanofarazii":"nanofarad","nanofarazilor":"nanofarad","nanomelia":"nanomelie","nanomeliei":"nanomelie","nanomelii":"nanomelie","nanometri":"nanometru","nanometrica":["nanometrică","nanometric","nanometrica","nanometric"],"nanometrice":"nanometric","nanometricele":"nanometric","nanometrici":"nanometric","nanometricii":"nanometric","nanometricul":"nanometric","nanoparticule":"nanoparticulă","nanoparticulei":"nanoparticulă","nanoparticulele":"nanoparticulă","nanoparticulelor":"nanoparticulă","nanosomia":"nanosomie","nanosomiei":"nanosomie","nanosomii":"nanosomie","nanosomiile":"nanosomie","nanosomiilor":"nanosomie","nanostiinte":"nanoștiință","nanostiintei":"nanoștiință","nanostiintele":"nanoștiință","nanostiintelor":"nanoștiință","nanostiinto":"nanoștiință","nanotuburi de carbon":"nanotub de carbon","nansucul":"nansuc","nansucule":"nansuc","nansucului":"nansuc","nanul":"nan","nanule":"nan","nanului":"nan","nanute":"nănuță","nanutei":"nănuță","nanutele":"nănuță","nanutelor":"nănuță","naosul":"naos","naosule":"naos","naosului":"naos","naosuri":"naos","naosurile":"naos","naosurilor":"naos","napadea":"năpădi","napadeai":"năpădi","napadeam":"năpădi","napadeati":"năpădi","napadeau":"năpădi","napadele":"năpădeală","napadelei":"năpădeală","napadelele":"năpădeală","napadelelor":"năpădeală","napadeli":"năpădeală","napadesc":"năpădi","napadeste":"năpădi","napadesti":"năpădi","napadii":"năpădi","napadim":"năpădi","napadind":"năpădi","napadira":"năpădi","napadiram":"năpădi","napadirati":"năpădi","napadirea":"năpădire","napadiri":"năpădire","napadirii":"năpădire","napadirile":"năpădire","napadirilor":"năpădire","napadise":"năpădi","napadisem":"năpădi","napadisera":"năpădi","napadiseram":"năpădi","napadiserati":"năpădi","napadisesi":"năpădi","napadisi":"năpădi","napadit":"năpădi","napadita":["năpădită","năpădit","năpădita","năpădit"],"napadite":"năpădit","napaditele":"năpădit","napaditi":["năpădiți","năpădi","năpădiți","năpădit"],"napaditii":"năpădit","napaditori":"năpăditor","napaditorii":"năpăditor","napaditorilor":"năpăditor","napaditorul":"năpăditor","napaditorule":"năpăditor","napaditorului":"năpăditor","napaditul":"năpădit","napalmul":"napalm","napalmule":"napalm","napalmului":"napalm","naparci":"năpârcă","naparcii":"năpârcă","naparcile":"năpârcă","naparcilor":"năpârcă","naparcoasa":["năpârcoasă","năpârcos","năpârcoasa","năpârcos"],"naparcoase":"năpârcos","naparcoasele":"năpârcos","naparcosi":"năpârcos","naparcosii":"năpârcos","naparcosul":"năpârcos","naparcute":"năpârcuță","naparcutei":"năpârcuță","naparcutele":"năpârcuță","naparcutelor":"năpârcuță","naparlea":"năpârli","naparleai":"năpârli","naparleam":"năpârli","naparleati":"năpârli","naparleau":"năpârli","naparlele":"năpârleală","naparlelei":"năpârleală","naparlelele":"năpârleală","naparlelelor":"năpârleală","naparleli":"năpârleală","naparlesc":"năpârli","naparleste":"năpârli","naparlesti":"năpârli","naparlii":"năpârli","naparlim":"năpârli","naparlind":"năpârli","naparlira":"năpârli","naparliram":"năpârli","naparlirati":"năpârli","naparlirea":"năpârlire","naparliri":"năpârlire","naparlirii":"năpârlire","naparlirile":"năpârlire","naparlirilor":"năpârlire","naparlise":"năpârli","naparlisem":"năpârli","naparlisera":"năpârli","naparliseram":"năpârli","naparliserati":"năpârli","naparlisesi":"năpârli","naparlisi":"năpârli","naparlit":"năpârli","naparlita":["năpârlită","năpârlit","năpârlita","năpârlit"],"naparlite":"năpârlit","naparlitele":"năpârlit","naparliti":["năpârliți","năpârli","năpârliți","năpârlit"],"naparlitii":"năpârlit","naparlitul":"năpârlit","naparstoace":"năpârstoacă","naparstoacei":"năpârstoacă","naparstoacele":"năpârstoacă","naparstoacelor":"năpârstoacă","naparstoci":"năpârstoc","naparstocii":"năpârstoc","naparstocilor":"năpârstoc","naparstocul":"năpârstoc","naparstocule":"năpârstoc","naparstocului":"năpârstoc","napaste":"năpastă","napastea":"năpaste","napastei":"năpastă","napastele":"năpastă","napastelor":"năpastă","napasti":"năpaste","napastia":"năpastie","napastiei":"năpastie","napastii":["năpăștii","năpaste","năpastii","năpastie"],"napastiile":"năpastie","napastiilor":"năpastie","napastile":"năpaste","napastilor":"năpaste","napastuia":"năpăstui","napastuiai":"năpăstui","napastuiam":"năpăstui","napastuiati":"năpăstui","napastuiau":"năpăstui","napastuiesc":"năpăstui","napastuieste":"năpăstui","napastuiesti":"năpăstui","napastuii":"năpăstui","napastuim":"năpăstui","napastuind":"năpăstui","napastuira":"năpăstui","napastuiram":"năpăstui","napastuirati":"năpăstui","napastuirea":"năpăstuire","napastuiri":"năpăstuire","napastuirii":"năpăstuire","napastuirile":"năpăstuire","napastuirilor":"năpăstuire","napastuise":"năpăstui","napastuisem":"năpăstui","napastuisera":"năpăstui","napastuiseram":"năpăstui","napastuiserati":"năpăstui","napastuisesi":"năpăstui","napastuisi":"năpăstui","napastuit":"năpăstui","napastuita":["năpăstuită","năpăstuit","năpăstuita","năpăstuit"],"napastuite":"năpăstuit","napastuitele":"năpăstuit","napastuiti":["năpăstuiți","năpăstui","năpăstuiți","năpăstuit"],"napastuitii":"năpăstuit","napastuitoarea":"năpăstuitoare","napastuitoarei":"năpăstuitoare","napastuitoarele":"năpăstuitoare","napastuitoarelor":"năpăstuitoare","napastuitori":"năpăstuitor","napastuitorii":"năpăstuitor","napastuitorilor":"năpăstuitor","napastuitorul":"năpăstuitor","napastuitorule":"năpăstuitor","napastuitorului":"năpăstuitor","napastuitul":"năpăstuit","napaze":"năpadă","napazei":"năpadă","napazele":"năpadă","napazelor":"năpadă","napazi":"năpadă","napi":"nap","napii":"nap","napilor":"nap","napistea":"năpiște","napisti":"năpiște","napistii":"năpiște","napistile":"năpiște","napistilor":"năpiște","naplaiele":"năplăială","naplaielei":"năplăială","naplaielele":"năplăială","naplaielelor":"năplăială","naplaieli":"năplăială","naplairea":"năplăire","naplairi":"năplăire","naplairii":"năplăire","naplairile":"năplăire","naplairilor":"năplăire","naplati":"năplat","naplatii":"năplat","naplatilor":"năplat","naplatul":"năplat","naplatule":"năplat","naplatului":"năplat","napoiai":"napoia","napoiam":"napoia","napoiara":"napoia","napoiaram":"napoia","napoiarati":"napoia","napoiase":"napoia","napoiasem":"napoia","napoiasera":"napoia","napoiaseram":"napoia","napoiaserati":"napoia","napoiasesi":"napoia","napoiasi":"napoia","napoiat":"napoia","napoiati":"napoia","napoiau":"napoia","napoiaza":"napoia","napoie":"napoia","napoiem":"napoia","napoiez":"napoia","napoiezi":"napoia","napoind":"napoia","napoleoni":"napoleon","napoleoniana":["napoleoniană","napoleonian","napoleoniana","napoleonian"],"napoleonianul":"napoleonian","napoleoniene":"napoleonian","napoleonienele":"napoleonian","napoleonieni":"napoleonian","napoleonienii":"napoleonian","napoleonii":"napoleon","napoleonilor":"napoleon","napoleonul":"napoleon","napoleonule":"napoleon","napoleonului":"napoleon","napolitane":"napolitană","napolitanei":"napolitană","napolitanele":"napolitană","napolitanelor":"napolitană","napolitani":"napolitan","napolitanii":"napolitan","napolitanilor":"napolitan","napolitanul":"napolitan","napolitanule":"napolitan","napolitanului":"napolitan","naporojne":"naporojnă","naporojnei":"naporojnă","naporojnele":"naporojnă","naporojnelor":"naporojnă","naprasne":"năprasnă","naprasnei":"năprasnă","naprasnele":"năprasnă","naprasnelor":"năprasnă","naprasnica":["năprasnică","năprasnic","năprasnica","năprasnic"],"naprasnice":["năprasnice","năprasnic","năprasnice","năprasnică"],"naprasnicei":"năprasnică","naprasnicele":["năprasnicele","năprasnic","năprasnicele","năprasnică"],"naprasnicelor":"năprasnică","naprasnici":"năprasnic","naprasnicia":"năprăsnicie","naprasniciei":"năprăsnicie","naprasnicii":["năprasnicii","năprasnic","năprăsnicii","năprăsnicie"],"naprasniciile":"năprăsnicie","naprasniciilor":"năprăsnicie","naprasnicul":"năprasnic","napratituri":"năprătitură","napratiturii":"năprătitură","napratiturile":"năprătitură","napratiturilor":"năprătitură","napruia":"năprui","napruie":"năprui","napruiele":"năprui","napruii":"năprui","napruilor":"năprui","napruiul":"năprui","napruiule":"năprui","napruiului":"năprui","napul":"nap","napule":"nap","napului":"nap","napusori":"năpușor","napusorii":"năpușor","napusorilor":"năpușor","napusorul":"năpușor","napusorule":"năpușor","napusorului":"năpușor","napustea":"năpusti","napusteai":"năpusti","napusteam":"năpusti","napusteati":"năpusti","napusteau":"năpusti","napustesc":"năpusti","napusteste":"năpusti","napustesti":"năpusti","napustii":"năpusti","napustim":"năpusti","napustind":"năpusti","napustira":"năpusti","napustiram":"năpusti","napustirati":"năpusti","napustirea":"năpustire","napustiri":"năpustire","napustirii":"năpustire","napustirile":"năpustire","napustirilor":"năpustire","napustise":"năpusti","napustisem":"năpusti","napustisera":"năpusti","napustiseram":"năpusti","napustiserati":"năpusti","napustisesi":"năpusti","napustisi":"năpusti","napustit":"năpusti","napustita":["năpustită","năpustit","năpustita","năpustit"],"napustite":"năpustit","napustitele":"năpustit","napustiti":["năpustiți","năpusti","năpustiți","năpustit"],"napustitii":"năpustit","napustitul":"năpustit","naraclite":"naracliță","naraclitei":"naracliță","naraclitele":"naracliță","naraclitelor":"naracliță","narai":"nara","naram":["narăm","nara","naram","nara"],"naramzata":["naramzată","naramzat","naramzata","naramzat","narămzată","narămzat","narămzata","narămzat","nărâmzată","nărâmzat","nărâmzata","nărâmzat"],"naramzate":["naramzate","naramzat","narămzate","narămzat","nărâmzate","nărâmzat"],"naramzatele":["naramzatele","naramzat","narămzatele","narămzat","nărâmzatele","nărâmzat"],"naramzati":["naramzați","naramzat","narămzați","narămzat","nărâmzați","nărâmzat"],"naramzatii":["naramzații","naramzat","narămzații","narămzat","nărâmzații","nărâmzat"],"naramzatul":["naramzatul","naramzat","narămzatul","narămzat","nărâmzatul","nărâmzat"],"naramze":["naramze","naramză","năramze","năramză"],"naramzei":["naramzei","naramză","năramzei","năramză"],"naramzele":["naramzele","naramză","năramzele","năramză"],"naramzelor":["naramzelor","naramză","năramzelor","năramză"],"naramzi":"naramz","naramzia":["naramzia","naramziu","narâmzia","narâmziu","nărămzia","nărămziu"],"naramzie":["naramzie","naramziu","narâmzie","narâmziu","nărămzie","nărămziu"],"naramzii":["naramzii","naramz","naramzii","naramziu","narâmzii","narâmziu","nărămzii","nărămziu"],"naramziii":["naramziii","naramziu","narâmziii","narâmziu","nărămziii","nărămziu"],"naramziile":["naramziile","naramziu","narâmziile","narâmziu","nărămziile","nărămziu"],"naramzilor":"naramz","naramziul":["naramziul","naramziu","narâmziul","narâmziu","nărămziul","nărămziu"],"naramzul":"naramz","naramzule":"naramz","naramzului":"naramz","narand":"nara","narangia":"narangiu","narangie":"narangiu","narangii":"narangiu","narangiii":"narangiu","narangiile":"narangiu","narangiul":"narangiu","naranzata":["nărânzată","nărânzat","nărânzata","nărânzat"],"naranzate":"nărânzat","naranzatele":"nărânzat","naranzati":"nărânzat","naranzatii":"nărânzat","naranzatul":"nărânzat","naranzi":"naranz","naranzii":"naranz","naranzilor":"naranz","naranzul":"naranz","naranzule":"naranz","naranzului":"naranz","narara":"nara","nararam":"nara","nararati":"nara","nararea":"narare","narari":"narare","nararii":"narare","nararile":"narare","nararilor":"narare","narase":"nara","narasem":"nara","narasera":"nara","naraseram":"nara","naraserati":"nara","narasesi":"nara","narasi":"nara","narat":"nara","narata":["narată","narat","narata","narat"],"narate":"narat","naratele":"narat","narati":["narați","nara","narați","narat"],"naratia":"narație","naratiei":"narație","naratii":["narații","narat","narații","narație"],"naratiile":"narație","naratiilor":"narație","naratiunea":"narațiune","naratiuni":"narațiune","naratiunii":"narațiune","naratiunile":"narațiune","naratiunilor":"narațiune","narativa":["narativă","narativ","narativa","narativ"],"narative":"narativ","narativele":"narativ","narativi":"narativ","narativii":"narativ","narativitatea":"narativitate","narativitati":"narativitate","narativitatii":"narativitate","narativul":"narativ","naratoarea":"naratoare","naratoarei":"naratoare","naratoarele":"naratoare","naratoarelor":"naratoare","naratologia":"naratologie","naratologica":["naratologică","naratologic","naratologica","naratologic"],"naratologice":"naratologic","naratologicele":"naratologic","naratologici":"naratologic","naratologicii":"naratologic","naratologicul":"naratologic","naratologiei":"naratologie","naratologii":"naratologie","naratori":"narator","naratorii":"narator","naratorilor":"narator","naratorul":"narator","naratorule":"narator","naratorului":"narator","naratul":"narat","narau":"nara","naravasa":["nărăvașă","nărăvaș","nărăvașa","nărăvaș"],"naravase":"nărăvaș","naravasele":"nărăvaș","naravasi":"nărăvaș","naravasii":"nărăvaș","naravasul":"nărăvaș","naravea":"nărăvi","naraveai":"nărăvi","naraveam":"nărăvi","naraveati":"nărăvi","naraveau":"nărăvi","naravele":"nărăveală","naravelei":"nărăveală","naravelele":"nărăveală","naravelelor":"nărăveală","naraveli":"nărăveală","naravesc":"nărăvi","naraveste":"nărăvi","naravesti":"nărăvi","naravia":"nărăvie","naraviei":"nărăvie","naravii":["nărăvii","nărăvi","nărăvii","nărăvie"],"naraviile":"nărăvie","naraviilor":"nărăvie","naravim":"nărăvi","naravind":"nărăvi","naravira":"nărăvi","naraviram":"nărăvi","naravirati":"nărăvi","naravirea":"nărăvire","naraviri":"nărăvire","naravirii":"nărăvire","naravirile":"nărăvire","naravirilor":"nărăvire","naravise":"nărăvi","naravisem":"nărăvi","naravisera":"nărăvi","naraviseram":"nărăvi","naraviserati":"nărăvi","naravisesi":"nărăvi","naravisi":"nărăvi","naravit":"nărăvi","naravita":["nărăvită","nărăvit","nărăvita","nărăvit"],"naravite":"nărăvit","naravitele":"nărăvit","naraviti":["nărăviți","nărăvi","nărăviți","nărăvit"],"naravitii":"nărăvit","naravitul":"nărăvit","naravul":"nărav","naravule":"nărav","naravului":"nărav","naravuri":"nărav","naravurile":"nărav","naravurilor":"nărav","narcise":"narcisă","narcisei":"narcisă","narcisele":"narcisă","narciselor":"narcisă","narcisi":"narcis","narcisiaca":["narcisiacă","narcisiac","narcisiaca","narcisiac"],"narcisiace":"narcisiac","narcisiacele":"narcisiac","narcisiaci":"narcisiac","narcisiacii":"narcisiac","narcisiacul":"narcisiac","narcisica":["narcisică","narcisic","narcisica","narcisic"],"narcisice":"narcisic","narcisicele":"narcisic","narcisici":"narcisic","narcisicii":"narcisic","narcisicul":"narcisic","narcisii":"narcis","narcisilor":"narcis","narcisisme":"narcisism","narcisismele":"narcisism","narcisismelor":"narcisism","narcisismul":"narcisism","narcisismule":"narcisism","narcisismului":"narcisism","narcisista":["narcisistă","narcisist","narcisista","narcisist"],"narcisiste":"narcisist","narcisistele":"narcisist","narcisisti":"narcisist","narcisistii":"narcisist","narcisistul":"narcisist","narcisul":"narcis","narcisule":"narcis","narcisului":"narcis","narcoanalize":"narcoanaliză","narcoanalizei":"narcoanaliză","narcoanalizele":"narcoanaliză","narcoanalizelor":"narcoanaliză","narcohipnoze":"narcohipnoză","narcohipnozei":"narcohipnoză","narcohipnozele":"narcohipnoză","narcohipnozelor":"narcohipnoză","narcolepsia":"narcolepsie","narcolepsiei":"narcolepsie","narcolepsii":"narcolepsie","narcoleptice":"narcoleptică","narcolepticei":"narcoleptică","narcolepticele":"narcoleptică","narcolepticelor":"narcoleptică","narcoleptici":"narcoleptic","narcolepticii":"narcoleptic","narcolepticilor":"narcoleptic","narcolepticul":"narcoleptic","narcolepticule":"narcoleptic","narcolepticului":"narcoleptic","narcomane":"narcomană","narcomanei":"narcomană","narcomanele":"narcomană","narcomanelor":"narcomană","narcomani":"narcoman","narcomania":"narcomanie","narcomaniei":"narcomanie","narcomanii":["narcomanii","narcoman","narcomanii","narcomanie"],"narcomaniile":"narcomanie","narcomaniilor":"narcomanie","narcomanilor":"narcoman","narcomanul":"narcoman","narcomanule":"narcoman","narcomanului":"narcoman","narcoterapia":"narcoterapie","narcoterapiei":"narcoterapie","narcoterapii":"narcoterapie","narcoterapiile":"narcoterapie","narcoterapiilor":"narcoterapie","narcotica":["narcotică","narcotic","narcotica","narcotic"],"narcotice":"narcotic","narcoticele":"narcotic","narcoticelor":"narcotic","narcotici":"narcotic","narcoticii":"narcotic","narcoticul":"narcotic","narcoticule":"narcotic","narcoticului":"narcotic","narcotine":"narcotină","narcotinei":"narcotină","narcotinele":"narcotină","narcotinelor":"narcotină","narcotismul":"narcotism","narcotismule":"narcotism","narcotismului":"narcotism","narcotizai":"narcotiza","narcotizam":["narcotizăm","narcotiza","narcotizam","narcotiza"],"narcotizand":"narcotiza","narcotizara":"narcotiza","narcotizaram":"narcotiza","narcotizarati":"narcotiza","narcotizarea":"narcotizare","narcotizari":"narcotizare","narcotizarii":"narcotizare","narcotizarile":"narcotizare","narcotizarilor":"narcotizare","narcotizase":"narcotiza","narcotizasem":"narcotiza","narcotizasera":"narcotiza","narcotizaseram":"narcotiza","narcotizaserati":"narcotiza","narcotizasesi":"narcotiza","narcotizasi":"narcotiza","narcotizat":"narcotiza","narcotizati":"narcotiza","narcotizatia":"narcotizație","narcotizatiei":"narcotizație","narcotizatii":"narcotizație","narcotizatiile":"narcotizație","narcotizatiilor":"narcotizație","narcotizau":"narcotiza","narcotizeaza":"narcotiza","narcotizez":"narcotiza","narcotizezi":"narcotiza","narcoze":"narcoză","narcozei":"narcoză","narcozele":"narcoză","narcozelor":"narcoză","nardul":"nard","nardule":"nard","nardului":"nard","nare":"nară","narea":"nare","nareaza":"nara","narez":"nara","narezi":"nara","nargheleaua":"narghelea","narghelele":"narghelea","narghelelei":"narghelea","narghelelele":"narghelea","narghelelelor":"narghelea","narghileaua":"narghilea","narghilele":"narghilea","narghilelei":"narghilea","narghilelele":"narghilea","narghilelelor":"narghilea","nari":["nări","nară","nări","nare","nari","nare"],"narii":["nării","nară","narii","nare"],"narile":["nările","nară","narile","nare"],"narilor":["nărilor","nară","narilor","nare"],"narocita":["nărocită","nărocit","nărocita","nărocit"],"narocite":"nărocit","narocitele":"nărocit","narociti":"nărocit","narocitii":"nărocit","narocitul":"nărocit","naroda":["narodă","narod","naroda","narod","nărodă","nărod","năroda","nărod"],"narode":["narode","narod","nărode","nărod"],"narodele":["narodele","narod","nărodele","nărod"],"narodnice":"narodnică","narodnicei":"narodnică","narodnicele":"narodnică","narodnicelor":"narodnică","narodnici":"narodnic","narodnicii":"narodnic","narodnicilor":"narodnic","narodnicismul":"narodnicism","narodnicismule":"narodnicism","narodnicismului":"narodnicism","narodnicista":["narodnicistă","narodnicist","narodnicista","narodnicist"],"narodniciste":"narodnicist","narodnicistele":"narodnicist","narodnicisti":"narodnicist","narodnicistii":"narodnicist","narodnicistul":"narodnicist","narodnicul":"narodnic","narodnicule":"narodnic","narodnicului":"narodnic","narodul":["narodul","narod","nărodul","nărod"],"narozenia":"nărozenie","narozeniei":"nărozenie","narozenii":"nărozenie","narozeniile":"nărozenie","narozeniilor":"nărozenie","narozi":["narozi","narod","nărozi","nărod"],"narozii":["narozii","narod","nărozii","nărod"],"nartexul":"nartex","nartexule":"nartex","nartexului":"nartex","nartexuri":"nartex","nartexurile":"nartex","nartexurilor":"nartex","nartoasa":["nărtoasă","nărtos","nărtoasa","nărtos"],"nartoase":"nărtos","nartoasele":"nărtos","nartosi":"nărtos","nartosii":"nărtos","nartosul":"nărtos","nartul":"nart","nartule":"nart","nartului":"nart","narturi":"nart","narturile":"nart","narturilor":"nart","naruia":"nărui","naruiai":"nărui","naruiam":"nărui","naruiati":"nărui","naruiau":"nărui","naruie":"nărui","naruiele":"năruială","naruielei":"năruială","naruielele":"năruială","naruielelor":"năruială","naruieli":"năruială","naruii":"nărui","naruim":"nărui","naruind":"nărui","naruira":"nărui","naruiram":"nărui","naruirati":"nărui","naruirea":"năruire","naruiri":"năruire","naruirii":"năruire","naruirile":"năruire","naruirilor":"năruire","naruise":"nărui","naruisem":"nărui","naruisera":"nărui","naruiseram":"nărui","naruiserati":"nărui","naruisesi":"nărui","naruisi":"nărui","naruit":"nărui","naruita":["năruită","năruit","năruita","năruit"],"naruite":"năruit","naruitele":"năruit","naruiti":["năruiți","nărui","năruiți","năruit"],"naruitii":"năruit","naruitul":"năruit","naruiture":"năruitură","naruiturei":"năruitură","naruiturele":"năruitură","naruiturelor":"năruitură","naruituri":"năruitură","narvali":"narval","narvalii":"narval","narvalilor":"narval","narvalul":"narval","narvalule":"narval","narvalului":"narval","nasadituri":"năsăditură","nasaditurii":"năsăditură","nasaditurile":"năsăditură","nasaditurilor":"năsăditură","nasailaul":"năsăilă","nasailaule":"năsăilă","nasailaului":"năsăilă","nasalia":"năsălie","nasaliei":"năsălie","nasalii":"năsălie","nasaliile":"năsălie","nasaliilor":"năsălie","nasalnica":["năsâlnică","năsâlnic","năsâlnica","năsâlnic","năsălnică","năsălnic","năsălnica","năsălnic"],"nasalnice":["năsâlnice","năsâlnic","năsălnice","năsălnic"],"nasalnicele":["năsâlnicele","năsâlnic","năsălnicele","năsălnic"],"nasalnici":["năsâlnici","năsâlnic","năsălnici","năsălnic"],"nasalnicia":"năsâlnicie","nasalniciei":"năsâlnicie","nasalnicii":["năsâlnicii","năsâlnic","năsălnicii","năsălnic","năsâlnicii","năsâlnicie"],"nasalniciile":"năsâlnicie","nasalniciilor":"năsâlnicie","nasalnicul":["năsâlnicul","năsâlnic","năsălnicul","năsălnic"],"nasaudeanul":"năsăudean","nasaudeanule":"năsăudean","nasaudeanului":"năsăudean","nasaudence":"năsăudeancă","nasaudencei":"năsăudeancă","nasaudencele":"năsăudeancă","nasaudencelor":"năsăudeancă","nasaudene":"năsăudeană","nasaudenei":"năsăudeană","nasaudenele":"năsăudeană","nasaudenelor":"năsăudeană","nasaudeni":"năsăudean","nasaudenii":"năsăudean","nasaudenilor":"năsăudean","nasc":"naște","nasca":"naște","nascand":"naște","nascarea":"născare","nascari":["născări","născare","născari","născare"],"nascarii":"născare","nascarile":"născare","nascarilor":"născare","nascatoare":"născător","nascatoarea":["născătoarea","născătoare","născătoarea","născător"],"nascatoarei":"născătoare","nascatoarele":["născătoarele","născătoare","născătoarele","născător"],"nascatoarelor":"născătoare","nascatori":"născător","nascatorii":"născător","nascatorilor":"născător","nascatorul":"născător","nascatorule":"născător","nascatorului":"născător","nascaturi":"născătură","nascaturii":"născătură","nascaturile":"născătură","nascaturilor":"născătură","nascioare":"născior","nascioarele":"născior","nascioarelor":"născior","nasciorul":"născior","nasciorule":"născior","nasciorului":"născior","nascocea":"născoci","nascoceai":"născoci","nascoceam":"născoci","nascoceati":"născoci","nascoceau":"născoci","nascoceli":"născoceală","nascocelii":"născoceală","nascocelile":"născoceală","nascocelilor":"născoceală","nascocesc":"născoci","nascoceste":"născoci","nascocesti":"născoci","nascocii":"născoci","nascocim":"născoci","nascocind":"născoci","nascocira":"născoci","nascociram":"născoci","nascocirati":"născoci","nascocirea":"născocire","nascociri":"născocire","nascocirii":"născocire","nascocirile":"născocire","nascocirilor":"născocire","nascocise":"născoci","nascocisem":"născoci","nascocisera":"născoci","nascociseram":"născoci","nascociserati":"născoci","nascocisesi":"născoci","nascocisi":"născoci","nascocit":"născoci","nascociti":"născoci","nascocitoare":"născocitor","nascocitoarea":"născocitor","nascocitoarele":"născocitor","nascocitori":"născocitor","nascocitorii":"născocitor","nascocitorul":"născocitor","nascociture":"născocitură","nascociturei":"născocitură","nascociturele":"născocitură","nascociturelor":"născocitură","nascocituri":"născocitură","nascornite":"nascorniță","nascornitei":"nascorniță","nascornitele":"nascorniță","nascornitelor":"nascorniță","nascu":"naște","nascui":"naște","nascura":"naște","nascuram":"naște","nascurati":"naște","nascuse":"naște","nascusem":"naște","nascusera":"naște","nascuseram":"naște","nascuserati":"naște","nascusesi":"naște","nascusi":"naște","nascut":"naște","nascuta":["născută","născut","născuta","născut"],"nascute":["născute","născut","născute","născută"],"nascutei":"născută","nascutele":["născutele","născut","născutele","născută"],"nascutelor":"născută","nascuti":"născut","nascutii":"născut","nascutul":"născut","nase":"nașă","nasea":"năși","naseai":"năși","naseam":"năși","naseati":"năși","naseau":"năși","nasei":"nășel","naseli":"nășel","naselii":"nășel","naselilor":"nășel","naselnica":["năselnică","năselnic","năselnica","năselnic"],"naselnice":"năselnic","naselnicele":"năselnic","naselnici":"năselnic","naselnicii":"năselnic","naselnicul":"năselnic","naselul":"nășel","naselule":"nășel","naselului":"nășel","nasesc":"năși","naseste":"năși","nasesti":"năși","nasi":"naș","nasia":"nășie","nasici":["nășici","nășic","nășici","nășică"],"nasicii":["nășicii","nășic","nășicii","nășică"],"nasicile":"nășică","nasicilor":["nășicilor","nășic","nășicilor","nășică"],"nasicorni":"nasicorn","nasicornii":"nasicorn","nasicornilor":"nasicorn","nasicornul":"nasicorn","nasicornule":"nasicorn","nasicornului":"nasicorn","nasicul":"nășic","nasicule":"nășic","nasicului":"nășic","nasicute":"nășicuță","nasicutei":"nășicuță","nasicutele":"nășicuță","nasicutelor":"nășicuță","nasiei":"nășie","nasii":["nașii","naș","nășii","năși","nășii","nășie"],"nasilnica":["năsilnică","năsilnic","năsilnica","năsilnic"],"nasilnice":"năsilnic","nasilnicele":"năsilnic","nasilnici":"năsilnic","nasilniciea":"năsilnicie","nasilnicii":["năsilnicii","năsilnic","nasilnicii","năsilnicie"],"nasilniciii":"năsilnicie","nasilniciile":"năsilnicie","nasilniciilor":"năsilnicie","nasilnicul":"năsilnic","nasilor":"naș","nasim":"năși","nasind":"năși","nasipisul":"năsipiș","nasipisule":"năsipiș","nasipisului":"năsipiș","nasipisuri":"năsipiș","nasipisurile":"năsipiș","nasipisurilor":"năsipiș","nasipita":["năsipită","năsipit","năsipita","năsipit"],"nasipite":"năsipit","nasipitele":"năsipit","nasipiti":"năsipit","nasipitii":"năsipit","nasipitul":"năsipit","nasipoasa":["năsipoasă","năsipos","năsipoasa","năsipos"],"nasipoase":"năsipos","nasipoasele":"năsipos","nasiposi":"năsipos","nasiposii":"năsipos","nasiposul":"năsipos","nasipul":"năsip","nasipule":"năsip","nasipului":"năsip","nasipuri":"năsip","nasipurile":"năsip","nasipurilor":"năsip","nasira":"năși","nasiram":"năși","nasirati":"năși","nasirea":"nășire","nasiri":"nășire","nasirii":"nășire","nasirile":"nășire","nasirilor":"nășire","nasise":"năși","nasisem":"năși","nasisera":"năși","nasiseram":"năși","nasiserati":"năși","nasisesi":"năși","nasisi":"năși","nasit":"năși","nasite":"nășiță","nasitei":"nășiță","nasitele":"nășiță","nasitelor":"nășiță","nasiti":"năși","nasitul":"nășit","nasitule":"nășit","nasitului":"nășit","nasliciunea":"năsliciune","nasliciuni":"năsliciune","nasliciunii":"năsliciune","nasliciunile":"năsliciune","nasliciunilor":"năsliciune","naslirea":"năslire","nasliri":"năslire","naslirii":"năslire","naslirile":"năslire","naslirilor":"năslire","nasluia":"năslui","nasluiai":"năslui","nasluiam":"năslui","nasluiati":"năslui","nasluiau":"năslui","nasluiesc":"năslui","nasluieste":"năslui","nasluiesti":"năslui","nasluii":"năslui","nasluim":"năslui","nasluind":"năslui","nasluira":"năslui","nasluiram":"năslui","nasluirati":"năslui","nasluise":"năslui","nasluisem":"năslui","nasluisera":"năslui","nasluiseram":"năslui","nasluiserati":"năslui","nasluisesi":"năslui","nasluisi":"năslui","nasluit":"năslui","nasluiti":"năslui","nasoaie":"năsoi","nasoaiele":"năsoi","nasoaielor":"năsoi","nasoala":["nasoală","nasol","nasoala","nasol"],"nasoale":["nasoale","nasoală","nasoale","nasol"],"nasoalei":"nasoală","nasoalele":["nasoalele","nasoală","nasoalele","nasol"],"nasoalelor":"nasoală","nasoasa":["năsoasă","năsos","năsoasa","năsos"],"nasoase":"năsos","nasoasele":"năsos","nasoiul":"năsoi","nasoiule":"năsoi","nasoiului":"năsoi","nasolea":"nasoli","nasoleai":"nasoli","nasoleam":"nasoli","nasoleati":"nasoli","nasoleau":"nasoli","nasolesc":"nasoli","nasoleste":"nasoli","nasolesti":"nasoli","nasoli":"nasol","nasolii":["nasolii","nasol","nasolii","nasoli"],"nasolim":"nasoli","nasolind":"nasoli","nasolira":"nasoli","nasoliram":"nasoli","nasolirati":"nasoli","nasolise":"nasoli","nasolisem":"nasoli","nasolisera":"nasoli","nasoliseram":"nasoli","nasoliserati":"nasoli","nasolisesi":"nasoli","nasolisi":"nasoli","nasolit":"nasoli","nasoliti":"nasoli","nasolul":"nasol","nasosi":"năsos","nasosii":"năsos","nasosul":"năsos","nasparlii":"nașparliu","nasparliii":"nașparliu","nasparliilor":"nașparliu","nasparliul":"nașparliu","nasparliule":"nașparliu","nasparliului":"nașparliu","nastasnica":["năstașnică","năstașnic","năstașnica","năstașnic"],"nastasnice":"năstașnic","nastasnicele":"năstașnic","nastasnici":"năstașnic","nastasnicii":"năstașnic","nastasnicul":"năstașnic","nastavea":"năstăvi","nastaveai":"năstăvi","nastaveam":"năstăvi","nastaveati":"năstăvi","nastaveau":"năstăvi","nastavesc":"năstăvi","nastaveste":"năstăvi","nastavesti":"năstăvi","nastavii":"năstăvi","nastavim":"năstăvi","nastavind":"năstăvi","nastavira":"năstăvi","nastaviram":"năstăvi","nastavirati":"năstăvi","nastavise":"năstăvi","nastavisem":"năstăvi","nastavisera":"năstăvi","nastaviseram":"năstăvi","nastaviserati":"năstăvi","nastavisesi":"năstăvi","nastavisi":"năstăvi","nastavit":"năstăvi","nastaviti":"năstăvi","nastavnici":"năstavnic","nastavnicii":"năstavnic","nastavnicilor":"năstavnic","nastavnicul":"năstavnic","nastavnicule":"năstavnic","nastavnicului":"năstavnic","nastea":"naște","nasteai":"naște","nasteam":"naște","nasteati":"naște","nasteau":"naște","nastem":"naște","nasterea":"naștere","nasteri":"naștere","nasterii":"naștere","nasterile":"naștere","nasterilor":"naștere","nasteti":"naște","nasti":"naște","nastia":"nastie","nastiei":"nastie","nastii":"nastie","nastiile":"nastie","nastiilor":"nastie","nastimele":"năstimeală","nastimelei":"năstimeală","nastimelele":"năstimeală","nastimelelor":"năstimeală","nastimeli":"năstimeală","nastoateli":"nastoatel","nastoatelii":"nastoatel","nastoatelilor":"nastoatel","nastoatelul":"nastoatel","nastoatelule":"nastoatel","nastoatelului":"nastoatel","nastrapioare":"năstrăpioară","nastrapioarei":"năstrăpioară","nastrapioarele":"năstrăpioară","nastrapioarelor":"năstrăpioară","nastrasnic":"năstrușnic","nastrusnica":["năstrușnică","năstrușnic","năstrușnica","năstrușnic"],"nastrusnice":"năstrușnic","nastrusnicele":"năstrușnic","nastrusnici":"năstrușnic","nastrusnicia":"năstrușnicie","nastrusniciei":"năstrușnicie","nastrusnicii":["năstrușnicii","năstrușnic","năstrușnicii","năstrușnicie"],"nastrusniciile":"năstrușnicie","nastrusniciilor":"năstrușnicie","nastrusnicul":"năstrușnic","nasturarese":"năsturăreasă","nasturaresei":"năsturăreasă","nasturaresele":"năsturăreasă","nasturareselor":"năsturăreasă","nasturari":"năsturar","nasturaria":"năsturărie","nasturariei":"năsturărie","nasturarii":["năsturarii","năsturar","năsturării","năsturărie"],"nasturariile":"năsturărie","nasturariilor":"năsturărie","nasturarilor":"năsturar","nasturarul":"năsturar","nasturarule":"năsturar","nasturarului":"năsturar","nasturasi":"năsturaș","nasturasii":"năsturaș","nasturasilor":"năsturaș","nasturasul":"năsturaș","nasturasule":"năsturaș","nasturasului":"năsturaș","nasturei":"năsturel","nasturele":"nasture","nastureli":"năsturel","nasturelii":"năsturel","nasturelilor":"năsturel","nasturelui":"nasture","nasturelul":"năsturel","nasturelule":"năsturel","nasturelului":"năsturel","nasturi":"nasture","nasturii":"nasture","nasturilor":"nasture","nasucul":["năsucul","năsuc","nășucul","nășuc"],"nasucule":["năsucule","năsuc","nășucule","nășuc"],"nasucului":["năsucului","năsuc","nășucului","nășuc"],"nasucuri":"năsuc","nasucurile":"năsuc","nasucurilor":"năsuc","nasul":["nasul","nas","nașul","naș"],"nasula":["nasulă","nasul","nasula","nasul"],"nasule":["nasule","nas","nașule","naș","nasule","nasul"],"nasulele":"nasul","nasuli":"nasul","nasulii":"nasul","nasului":["nasului","nas","nașului","naș"],"nasulul":"nasul","nasuri":"nas","nasuri acviline":"nas acvilin","nasurile":"nas","nasurilor":"nas","nasusoare":"năsușor","nasusore":"năsușor","nasusorele":"năsușor","nasusorelor":"năsușor","nasusorul":"năsușor","nasusorule":"năsușor","nasusorului":"năsușor","nasuta":["năsută","năsut","năsuta","năsut"],"nasute":["năsute","năsut","năsuțe","năsuț"],"nasutele":["năsutele","năsut","năsuțele","năsuț"],"nasutelor":"năsuț","nasuti":"năsut","nasutii":"năsut","nasutul":["năsutul","năsut","năsuțul","năsuț"],"nasutule":"năsuț","nasutului":"năsuț","nasuturi":"năsuț","natafleata":["natafleață","natafleț","natafleața","natafleț","nătăfleață","nătăfleț","nătăfleața","nătăfleț"],"natafleate":"nătăfleață","natafleatei":"nătăfleață","natafleatele":"nătăfleață","natafleatelor":"nătăfleață","nataflete":["nataflețe","natafleț","nătăflețe","nătăfleț","nătăflete","nătăfleț"],"natafletea":"nătăflete","natafletele":["nataflețele","natafleț","nătăflețele","nătăfleț","nătăfletele","nătăflete"],"natafleti":["natafleți","natafleț","nătăfleți","nătăfleț","nătăfleți","nătăflete"],"natafletii":["natafleții","natafleț","nătăfleții","nătăfleț","nătăfleții","nătăflete"],"natafletilor":"nătăfleț","natafletul":["nataflețul","natafleț","nătăflețul","nătăfleț"],"natafletule":"nătăfleț","natafletului":"nătăfleț","natala":["natală","natal","natala","natal"],"natale":"natal","natalele":"natal","natali":"natal","natalii":"natal","natalitatea":"natalitate","natalitati":"natalitate","natalitatii":"natalitate","natalitatile":"natalitate","natalitatilor":"natalitate","natalul":"natal","natanga":["nătângă","nătâng","nătânga","nătâng"],"natange":["nătânge","nătâng","nătânge","nătângă"],"natangea":"nătângi","natangeai":"nătângi","natangeam":"nătângi","natangeati":"nătângi","natangeau":"nătângi","natangei":"nătângă","natangele":["nătângele","nătâng","nătângele","nătângă","nătângele","nătângeală"],"natangelei":"nătângeală","natangelele":"nătângeală","natangelelor":"nătângeală","natangeli":"nătângeală","natangelor":"nătângă","natangesc":"nătângi","natangeste":"nătângi","natangesti":"nătângi","natangi":"nătâng","natangia":"nătângie","natangiei":"nătângie","natangii":["nătângii","nătâng","nătângii","nătângi","nătângii","nătângie"],"natangiile":"nătângie","natangiilor":"nătângie","natangim":"nătângi","natangind":"nătângi","natangira":"nătângi","natangiram":"nătângi","natangirati":"nătângi","natangise":"nătângi","natangisem":"nătângi","natangisera":"nătângi","natangiseram":"nătângi","natangiserati":"nătângi","natangisesi":"nătângi","natangisi":"nătângi","natangit":"nătângi","natangiti":"nătângi","natangul":"nătâng","natantoace":"nătântoacă","natantoacei":"nătântoacă","natantoacele":"nătântoacă","natantoacelor":"nătântoacă","natantoca":["nătântocă","nătântoc","nătântoca","nătântoc"],"natantoce":"nătântoc","natantocele":"nătântoc","natantoci":"nătântoc","natantocii":"nătântoc","natantocul":"nătântoc","natantola":["natantolă","natantol","natantola","natantol","nătăntolă","nătăntol","nătăntola","nătăntol"],"natantole":["natantole","natantol","nătăntole","nătăntol"],"natantolele":["natantolele","natantol","nătăntolele","nătăntol"],"natantoli":["natantoli","natantol","nătăntoli","nătăntol"],"natantolii":["natantolii","natantol","nătăntolii","nătăntol"],"natantolul":["natantolul","natantol","nătăntolul","nătăntol"],"natarai":"nătărău","nataraia":"nătărăie","nataraiei":"nătărăie","nataraii":["nătărăii","nătărăie","nătărăii","nătărău"],"nataraiile":"nătărăie","nataraiilor":"nătărăie","natarailor":"nătărău","nataraul":"nătărău","nataraule":"nătărău","nataraului":"nătărău","nataroaice":"nătăroaică","natatia":"natație","natatiei":"natație","natatii":"natație","natatiile":"natație","natatiilor":"natație","natatiunea":"natațiune","natatiuni":"natațiune","natatiunii":"natațiune","nati":"nat","natie":"națiune","natii":["nații","nat","nații","nație"],"natilor":"nat","national-socialismul":"național-socialism","national-socialismule":"național-socialism","national-socialismului":"național-socialism","national-socialista":["național-socialistă","național-socialist","național-socialista","național-socialist"],"national-socialiste":["național-socialiste","național-socialist","național-socialiste","național-socialistă"],"national-socialistei":"național-socialistă"};
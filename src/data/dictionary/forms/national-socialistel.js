@@ -0,0 +1 @@
+export default {"national-socialistele":["național-socialistele","național-socialist","național-socialistele","național-socialistă"],"national-socialistelor":"național-socialistă","national-socialisti":"național-socialist","national-socialistii":"național-socialist","national-socialistul":"național-socialist","nationala":["națională","național","naționala","național"],"nationale":"național","nationalele":"național","nationali":"național","nationaliceasca":["naționalicească","naționalicesc","naționaliceasca","naționalicesc"],"nationalicescul":"naționalicesc","nationalicesti":"naționalicesc","nationalicestii":"naționalicesc","nationalicestile":"naționalicesc","nationalii":"național","nationalisme":"naționalism","nationalismele":"naționalism","nationalismelor":"naționalism","nationalismul":"naționalism","nationalismule":"naționalism","nationalismului":"naționalism","nationalista":["naționalistă","naționalist","naționalista","naționalist"],"nationaliste":["naționaliste","naționalist","naționaliste","naționalistă"],"nationalistei":"naționalistă","nationalistele":["naționalistele","naționalist","naționalistele","naționalistă"],"nationalistelor":"naționalistă","nationalisti":"naționalist","nationalistica":["naționalistică","naționalistic","naționalistica","naționalistic"],"nationalistice":"naționalistic","nationalisticele":"naționalistic","nationalistici":"naționalistic","nationalisticii":"naționalistic","nationalisticul":"naționalistic","nationalistii":"naționalist","nationalistilor":"naționalist","nationalistul":"naționalist","nationalistule":"naționalist","nationalistului":"naționalist","nationalitatea":"naționalitate","nationalitati":"naționalitate","nationalitatii":"naționalitate","nationalitatile":"naționalitate","nationalitatilor":"naționalitate","nationalizai":"naționaliza","nationalizam":["naționalizăm","naționaliza","naționalizam","naționaliza"],"nationalizand":"naționaliza","nationalizara":"naționaliza","nationalizaram":"naționaliza","nationalizarati":"naționaliza","nationalizarea":"naționalizare","nationalizari":"naționalizare","nationalizarii":"naționalizare","nationalizarile":"naționalizare","nationalizarilor":"naționalizare","nationalizase":"naționaliza","nationalizasem":"naționaliza","nationalizasera":"naționaliza","nationalizaseram":"naționaliza","nationalizaserati":"naționaliza","nationalizasesi":"naționaliza","nationalizasi":"naționaliza","nationalizat":"naționaliza","nationalizata":["naționalizată","naționalizat","naționalizata","naționalizat"],"nationalizate":"naționalizat","nationalizatele":"naționalizat","nationalizati":["naționalizați","naționaliza","naționalizați","naționalizat"],"nationalizatii":"naționalizat","nationalizatul":"naționalizat","nationalizau":"naționaliza","nationalizeaza":"naționaliza","nationalizez":"naționaliza","nationalizezi":"naționaliza","nationalnica":["naționalnică","naționalnic","naționalnica","naționalnic"],"nationalnice":"naționalnic","nationalnicele":"naționalnic","nationalnici":"naționalnic","nationalnicii":"naționalnic","nationalnicul":"naționalnic","nationalul":"național","natiunala":["națiunală","națiunal","națiunala","națiunal"],"natiunale":"națiunal","natiunalele":"națiunal","natiunali":"națiunal","natiunalii":"națiunal","natiunalul":"națiunal","natiunea":"națiune","natiuni":"națiune","natiunii":"națiune","natiunile":"națiune","natiunilor":"națiune","nativa":["nativă","nativ","nativa","nativ"],"native":"nativ","nativele":"nativ","nativi":"nativ","nativii":"nativ","nativismul":"nativism","nativismule":"nativism","nativismului":"nativism","nativista":["nativistă","nativist","nativista","nativist"],"nativiste":"nativist","nativistele":"nativist","nativisti":"nativist","nativistii":"nativist","nativistilor":"nativist","nativistul":"nativist","nativistule":"nativist","nativistului":"nativist","nativitatea":"nativitate","nativitati":"nativitate","nativitatii":"nativitate","nativul":"nativ","natota":["nătotă","nătot","nătota","nătot"],"natote":"nătot","natotele":"nătot","natoti":"nătot","natotii":"nătot","natotul":"nătot","natpisul":"natpis","natpisule":"natpis","natpisului":"natpis","natpisuri":"natpis","natpisurile":"natpis","natpisurilor":"natpis","natre":"natră","natremia":"natremie","natremiei":"natremie","natremii":"natremie","natremiile":"natremie","natremiilor":"natremie","natriul":"natriu","natriule":"natriu","natriului":"natriu","natul":"nat","natule":"nat","natului":"nat","naturala":["naturală","natural","naturala","natural"],"naturale":"natural","naturalele":"natural","naturaletea":"naturalețe","naturaletei":"naturalețe","naturali":"natural","naturalii":"natural","naturalismul":"naturalism","naturalismule":"naturalism","naturalismului":"naturalism","naturaliste":"naturalistă","naturalistei":"naturalistă","naturalistele":"naturalistă","naturalistelor":"naturalistă","naturalisti":"naturalist","naturalistii":"naturalist","naturalistilor":"naturalist","naturalistul":"naturalist","naturalistule":"naturalist","naturalistului":"naturalist","naturalitatea":"naturalitate","naturalitati":"naturalitate","naturalitatii":"naturalitate","naturalitatile":"naturalitate","naturalitatilor":"naturalitate","naturalizai":"naturaliza","naturalizam":["naturalizăm","naturaliza","naturalizam","naturaliza"],"naturalizand":"naturaliza","naturalizara":"naturaliza","naturalizaram":"naturaliza","naturalizarati":"naturaliza","naturalizarea":"naturalizare","naturalizari":"naturalizare","naturalizarii":"naturalizare","naturalizarile":"naturalizare","naturalizarilor":"naturalizare","naturalizase":"naturaliza","naturalizasem":"naturaliza","naturalizasera":"naturaliza","naturalizaseram":"naturaliza","naturalizaserati":"naturaliza","naturalizasesi":"naturaliza","naturalizasi":"naturaliza","naturalizat":"naturaliza","naturalizata":["naturalizată","naturalizat","naturalizata","naturalizat"],"naturalizate":"naturalizat","naturalizatele":"naturalizat","naturalizati":["naturalizați","naturaliza","naturalizați","naturalizat"],"naturalizatia":"naturalizație","naturalizatiei":"naturalizație","naturalizatii":["naturalizații","naturalizat","naturalizații","naturalizație"],"naturalizatiile":"naturalizație","naturalizatiilor":"naturalizație","naturalizatiunea":"naturalizațiune","naturalizatiuni":"naturalizațiune","naturalizatiunii":"naturalizațiune","naturalizatiunile":"naturalizațiune","naturalizatiunilor":"naturalizațiune","naturalizatul":"naturalizat","naturalizau":"naturaliza","naturalizeaza":"naturaliza","naturalizez":"naturaliza","naturalizezi":"naturaliza","naturalul":"natural","naturi":"natură","naturii":"natură","naturile":"natură","naturilor":"natură","naturismul":"naturism","naturismule":"naturism","naturismului":"naturism","naturista":["naturistă","naturist","naturista","naturist"],"naturiste":["naturiste","naturist","naturiste","naturistă"],"naturistei":"naturistă","naturistele":["naturistele","naturist","naturistele","naturistă"],"naturistelor":"naturistă","naturisti":"naturist","naturistii":"naturist","naturistul":"naturist","naturoterapia":"naturoterapie","naturoterapiei":"naturoterapie","naturoterapii":"naturoterapie","naturoterapiile":"naturoterapie","naturoterapiilor":"naturoterapie","nauca":["năucă","năuc","năuca","năuc"],"nauce":"năuc","naucea":"năuci","nauceai":"năuci","nauceam":"năuci","nauceati":"năuci","nauceau":"năuci","naucele":"năuc","nauceli":"năuceală","naucelii":"năuceală","naucelile":"năuceală","naucelilor":"năuceală","naucesc":"năuci","nauceste":"năuci","naucesti":"năuci","nauci":"năuc","naucia":"năucie","nauciei":"năucie","naucii":["năucii","năuc","năucii","năuci","năucii","năucie"],"naucim":"năuci","naucind":"năuci","naucira":"năuci","nauciram":"năuci","naucirati":"năuci","naucirea":"năucire","naucirei":"năucire","naucise":"năuci","naucisem":"năuci","naucisera":"năuci","nauciseram":"năuci","nauciserati":"năuci","naucisesi":"năuci","naucisi":"năuci","naucit":"năuci","naucita":["năucită","năucit","năucita","năucit"],"naucite":"năucit","naucitele":"năucit","nauciti":["năuciți","năuci","năuciți","năucit"],"naucitii":"năucit","naucitoare":"năucitor","naucitoarea":"năucitor","naucitoarele":"năucitor","naucitori":"năucitor","naucitorii":"năucitor","naucitorul":"năucitor","naucitul":"năucit","naucul":"năuc","naufragiai":"naufragia","naufragiam":"naufragia","naufragiara":"naufragia","naufragiaram":"naufragia","naufragiarati":"naufragia","naufragiase":"naufragia","naufragiasem":"naufragia","naufragiasera":"naufragia","naufragiaseram":"naufragia","naufragiaserati":"naufragia","naufragiasesi":"naufragia","naufragiasi":"naufragia","naufragiat":"naufragia","naufragiata":["naufragiată","naufragiat","naufragiata","naufragiat"],"naufragiate":"naufragiat","naufragiatele":"naufragiat","naufragiati":["naufragiați","naufragia","naufragiați","naufragiat"],"naufragiatii":"naufragiat","naufragiatul":"naufragiat","naufragiau":"naufragia","naufragiaza":"naufragia","naufragie":"naufragia","naufragiem":"naufragia","naufragierea":"naufragiere","naufragieri":"naufragiere","naufragierii":"naufragiere","naufragierile":"naufragiere","naufragierilor":"naufragiere","naufragiez":"naufragia","naufragiezi":"naufragia","naufragii":"naufragiu","naufragiile":"naufragiu","naufragiilor":"naufragiu","naufragiind":"naufragia","naufragioasa":["naufragioasă","naufragios","naufragioasa","naufragios"],"naufragioase":"naufragios","naufragioasele":"naufragios","naufragiosi":"naufragios","naufragiosii":"naufragios","naufragiosul":"naufragios","naufragiul":"naufragiu","naufragiule":"naufragiu","naufragiului":"naufragiu","naupatia":"naupatie","naupatiei":"naupatie","naupatii":"naupatie","naupatiile":"naupatie","naupatiilor":"naupatie","naupliusul":"nauplius","naupliusule":"nauplius","naupliusului":"nauplius","nauruana":["nauruană","nauruan","nauruana","nauruan"],"nauruane":["nauruane","nauruan","nauruane","nauruană"],"nauruanei":"nauruană","nauruanele":["nauruanele","nauruan","nauruanele","nauruană"],"nauruanelor":"nauruană","nauruani":"nauruan","nauruanii":"nauruan","nauruanilor":"nauruan","nauruanul":"nauruan","nauruanule":"nauruan","nauruanului":"nauruan","nauscopia":"nauscopie","nauscopiei":"nauscopie","nauscopii":"nauscopie","nauscopiile":"nauscopie","nauscopiilor":"nauscopie","nautia":"năutiu","nautica":["nautică","nautic","nautica","nautic"],"nautice":["nautice","nautic","nautice","nautică"],"nauticei":"nautică","nauticele":["nauticele","nautic","nauticele","nautică"],"nauticelor":"nautică","nautici":"nautic","nauticii":"nautic","nauticul":"nautic","nautie":"năutiu","nautii":"năutiu","nautiii":"năutiu","nautiile":"năutiu","nautili":"nautil","nautilii":"nautil","nautililor":"nautil","nautiloide":"nautiloid","nautiloidele":"nautiloid","nautiloidelor":"nautiloid","nautiloidul":"nautiloid","nautiloidule":"nautiloid","nautiloidului":"nautiloid","nautilul":"nautil","nautilule":"nautil","nautilului":"nautil","nautilusi":"nautilus","nautilusii":"nautilus","nautilusilor":"nautilus","nautilusul":"nautilus","nautilusule":"nautilus","nautilusului":"nautilus","nautiul":"năutiu","nautofoane":"nautofon","nautofoanele":"nautofon","nautofoanelor":"nautofon","nautofonul":"nautofon","nautofonule":"nautofon","nautofonului":"nautofon","nautul":"năut","nautule":"năut","nautului":"năut","navala":["navală","naval","navala","naval"],"navale":["navale","naval","năvale","năvală"],"navalea":"năvăli","navaleai":"năvăli","navaleam":"năvăli","navaleati":"năvăli","navaleau":"năvăli","navalele":"naval","navalesc":"năvăli","navaleste":"năvăli","navalesti":"năvăli","navali":"naval","navalii":["navalii","naval","năvălii","năvăli"],"navalim":"năvăli","navalind":"năvăli","navalira":"năvăli","navaliram":"năvăli","navalirati":"năvăli","navalirea":"năvălire","navaliri":"năvălire","navalirii":"năvălire","navalirile":"năvălire","navalirilor":"năvălire","navalise":"năvăli","navalisem":"năvăli","navalisera":"năvăli","navaliseram":"năvăli","navaliserati":"năvăli","navalisesi":"năvăli","navalisi":"năvăli","navalit":"năvăli","navaliti":"năvăli","navalitoarea":"năvălitoare","navalitoarei":"năvălitoare","navalitoarele":"năvălitoare","navalitoarelor":"năvălitoare","navalitori":"năvălitor","navalitorii":"năvălitor","navalitorilor":"năvălitor","navalitorul":"năvălitor","navalitorule":"năvălitor","navalitorului":"năvălitor","navalituri":"năvălitură","navaliturii":"năvălitură","navaliturile":"năvălitură","navaliturilor":"năvălitură","navalnica":["năvalnică","năvalnic","năvalnica","năvalnic"],"navalnice":["năvalnice","năvalnic","năvalnice","năvalnică"],"navalnicei":"năvalnică","navalnicele":["năvalnicele","năvalnic","năvalnicele","năvalnică"],"navalnicelor":"năvalnică","navalnici":"năvalnic","navalnicia":"năvălnicie","navalniciei":"năvălnicie","navalnicii":["năvalnicii","năvalnic","năvălnicii","năvălnicie"],"navalnicul":"năvalnic","navalul":"naval","navarhi":"navarh","navarhii":"navarh","navarhilor":"navarh","navarhul":"navarh","navarhule":"navarh","navarhului":"navarh","navarnele":"năvârneală","navarnelei":"năvârneală","navarnelele":"năvârneală","navarnelelor":"năvârneală","navarneli":"năvârneală","nave":"navă","nave cosmice":"navă cosmică","nave de croaziera":"navă de croazieră","nave de debarcare":"navă de debarcare","nave de razboi":"navă de război","nave militare":"navă militară","navectari":"navectăr","navectarii":"navectăr","navectarilor":"navectăr","navectarul":"navectăr","navectarule":"navectăr","navectarului":"navectăr","navei":"navă","navele":"navă","navelor":"navă","navete":"navetă","navete spatiale":"navetă spațială","navetei":"navetă","navetele":"navetă","navetelor":"navetă","navetiste":"navetistă","navetistei":"navetistă","navetistele":"navetistă","navetistelor":"navetistă","navetisti":"navetist","navetistii":"navetist","navetistilor":"navetist","navetistul":"navetist","navetistule":"navetist","navetistului":"navetist","naviculara":["naviculară","navicular","naviculara","navicular"],"naviculare":"navicular","navicularele":"navicular","naviculari":"navicular","navicularii":"navicular","navicularul":"navicular","navigabila":["navigabilă","navigabil","navigabila","navigabil"],"navigabile":"navigabil","navigabilele":"navigabil","navigabili":"navigabil","navigabilii":"navigabil","navigabilitatea":"navigabilitate","navigabilitati":"navigabilitate","navigabilitatii":"navigabilitate","navigabilitatile":"navigabilitate","navigabilitatilor":"navigabilitate","navigabilizai":"navigabiliza","navigabilizam":["navigabilizăm","navigabiliza","navigabilizam","navigabiliza"],"navigabilizand":"navigabiliza","navigabilizara":"navigabiliza","navigabilizaram":"navigabiliza","navigabilizarati":"navigabiliza","navigabilizarea":"navigabilizare","navigabilizari":"navigabilizare","navigabilizarii":"navigabilizare","navigabilizarile":"navigabilizare","navigabilizarilor":"navigabilizare","navigabilizase":"navigabiliza","navigabilizasem":"navigabiliza","navigabilizasera":"navigabiliza","navigabilizaseram":"navigabiliza","navigabilizaserati":"navigabiliza","navigabilizasesi":"navigabiliza","navigabilizasi":"navigabiliza","navigabilizat":"navigabiliza","navigabilizati":"navigabiliza","navigabilizau":"navigabiliza","navigabilizeaza":"navigabiliza","navigabilizez":"navigabiliza","navigabilizezi":"navigabiliza","navigabilul":"navigabil","navigai":"naviga","navigam":["navigăm","naviga","navigam","naviga"],"navigand":"naviga","naviganta":["navigantă","navigant","naviganta","navigant"],"navigante":"navigant","navigantele":"navigant","naviganti":"navigant","navigantii":"navigant","navigantul":"navigant","navigara":"naviga","navigaram":"naviga","navigarati":"naviga","navigari":"navigare","navigase":"naviga","navigasem":"naviga","navigasera":"naviga","navigaseram":"naviga","navigaserati":"naviga","navigasesi":"naviga","navigasi":"naviga","navigat":"naviga","navigati":"naviga","navigatii":"navigație","navigatiunea":"navigațiune","navigatiuni":"navigațiune","navigatiunii":"navigațiune","navigatiunile":"navigațiune","navigatiunilor":"navigațiune","navigatoare web":"navigator web","navigatoarea":"navigatoare","navigatoarei":"navigatoare","navigatoarele":"navigatoare","navigatoarelor":"navigatoare","navigatori":"navigator","navigatorii":"navigator","navigatorilor":"navigator","navigatorul":"navigator","navigatorule":"navigator","navigatorului":"navigator","navigatul":"navigat","navigatule":"navigat","navigatului":"navigat","navigau":"naviga","navigheaza":"naviga","navighez":"naviga","navighezi":"naviga","navigrafe":"navigraf","navigrafele":"navigraf","navigrafelor":"navigraf","navigraful":"navigraf","navigrafule":"navigraf","navigrafului":"navigraf","navlonul":"navlon","navlonule":"navlon","navlonului":"navlon","navlosea":"navlosi","navloseai":"navlosi","navloseam":"navlosi","navloseati":"navlosi","navloseau":"navlosi","navlosesc":"navlosi","navloseste":"navlosi","navlosesti":"navlosi","navlosii":"navlosi","navlosim":"navlosi","navlosind":"navlosi","navlosira":"navlosi","navlosiram":"navlosi","navlosirati":"navlosi","navlosirea":"navlosire","navlosiri":"navlosire","navlosirii":"navlosire","navlosirile":"navlosire","navlosirilor":"navlosire","navlosise":"navlosi","navlosisem":"navlosi","navlosisera":"navlosi","navlosiseram":"navlosi","navlosiserati":"navlosi","navlosisesi":"navlosi","navlosisi":"navlosi","navlosit":"navlosi","navlositi":"navlosi","navlositori":"navlositor","navlositorii":"navlositor","navlositorilor":"navlositor","navlositorul":"navlositor","navlositorule":"navlositor","navlositorului":"navlositor","navlul":"navlu","navlule":"navlu","navlului":"navlu","navluri":"navlu","navlurile":"navlu","navlurilor":"navlu","navoade":"năvod","navodari":"năvodar","navodarii":"năvodar","navodarilor":"năvodar","navodarul":"năvodar","navodarule":"năvodar","navodarului":"năvodar","navodasi":"năvodaș","navodasii":"năvodaș","navodasilor":"năvodaș","navodasul":"năvodaș","navodasule":"năvodaș","navodasului":"năvodaș","navodea":"năvodi","navodeai":"năvodi","navodeam":"năvodi","navodeati":"năvodi","navodeau":"năvodi","navodesc":"năvodi","navodeste":"năvodi","navodesti":"năvodi","navodii":"năvodi","navodim":"năvodi","navodind":"năvodi","navodira":"năvodi","navodiram":"năvodi","navodirati":"năvodi","navodirea":"năvodire","navodiri":"năvodire","navodirii":"năvodire","navodirile":"năvodire","navodirilor":"năvodire","navodise":"năvodi","navodisem":"năvodi","navodisera":"năvodi","navodiseram":"năvodi","navodiserati":"năvodi","navodisesi":"năvodi","navodisi":"năvodi","navodit":"năvodi","navoditi":"năvodi","navomodele":"navomodel","navomodelele":"navomodel","navomodelelor":"navomodel","navomodelismul":"navomodelism","navomodelismule":"navomodelism","navomodelismului":"navomodelism","navomodeliste":"navomodelistă","navomodelistei":"navomodelistă","navomodelistele":"navomodelistă","navomodelistelor":"navomodelistă","navomodelul":"navomodel","navomodelule":"navomodel","navomodelului":"navomodel","navtichia":"navtichie","navtichiei":"navtichie","navtichii":"navtichie","navtichiile":"navtichie","navtichiilor":"navtichie","nazala":["nazală","nazal","nazala","nazal"],"nazale":["nazale","nazal","nazale","nazală"],"nazalei":"nazală","nazalele":["nazalele","nazal","nazalele","nazală"],"nazalelor":"nazală","nazali":"nazal","nazalii":"nazal","nazalitatea":"nazalitate","nazalitati":"nazalitate","nazalitatii":"nazalitate","nazalitatile":"nazalitate","nazalitatilor":"nazalitate","nazalizai":"nazaliza","nazalizam":["nazalizăm","nazaliza","nazalizam","nazaliza"],"nazalizand":"nazaliza","nazalizara":"nazaliza","nazalizaram":"nazaliza","nazalizarati":"nazaliza","nazalizarea":"nazalizare","nazalizari":"nazalizare","nazalizarii":"nazalizare","nazalizarile":"nazalizare","nazalizarilor":"nazalizare","nazalizase":"nazaliza","nazalizasem":"nazaliza","nazalizasera":"nazaliza","nazalizaseram":"nazaliza","nazalizaserati":"nazaliza","nazalizasesi":"nazaliza","nazalizasi":"nazaliza","nazalizat":"nazaliza","nazalizata":["nazalizată","nazalizat","nazalizata","nazalizat"],"nazalizate":"nazalizat","nazalizatele":"nazalizat","nazalizati":["nazalizați","nazaliza","nazalizați","nazalizat"],"nazalizatii":"nazalizat","nazalizatul":"nazalizat","nazalizau":"nazaliza","nazalizeaza":"nazaliza","nazalizez":"nazaliza","nazalizezi":"nazaliza","nazalul":"nazal","nazarea":"năzări","nazareai":"năzări","nazaream":"năzări","nazareanina":["nazareanină","nazareanin","nazareanina","nazareanin"],"nazareanine":"nazareanin","nazareaninele":"nazareanin","nazareanini":"nazareanin","nazareaninii":"nazareanin","nazareaninul":"nazareanin","nazareati":"năzări","nazareau":"năzări","nazareeane":"nazareeană","nazareeanul":"nazareean","nazareeanule":"nazareean","nazareeanului":"nazareean","nazareene":"nazareeană","nazareenei":"nazareeană","nazareenele":"nazareeană","nazareenelor":"nazareeană","nazareeni":"nazareean","nazareenii":"nazareean","nazareenilor":"nazareean","nazarele":"năzăreală","nazarelei":"năzăreală","nazarelele":"năzăreală","nazarelelor":"năzăreală","nazareli":"năzăreală","nazaresc":"năzări","nazareste":"năzări","nazaresti":"năzări","nazari":"nazâr","nazarii":["nazârii","nazâr","năzării","năzări"],"nazarilor":"nazâr","nazarim":"năzări","nazarind":"năzări","nazarineana":["nazarineană","nazarinean","nazarineana","nazarinean"],"nazarineane":"nazarineană","nazarineanei":"nazarineană","nazarineanele":"nazarineană","nazarineanelor":"nazarineană","nazarineanul":"nazarinean","nazarineanule":"nazarinean","nazarineanului":"nazarinean","nazarinene":"nazarinean","nazarinenele":"nazarinean","nazarineni":"nazarinean","nazarinenii":"nazarinean","nazarinenilor":"nazarinean","nazarira":"năzări","nazariram":"năzări","nazarirati":"năzări","nazarirea":"năzărire","nazariri":"năzărire","nazaririi":"năzărire","nazaririle":"năzărire","nazaririlor":"năzărire","nazarise":"năzări","nazarisem":"năzări","nazarisera":"năzări","nazariseram":"năzări","nazariserati":"năzări","nazarisesi":"năzări","nazarisi":"năzări","nazarit":"năzări","nazariti":"năzări","nazarituri":"năzăritură","nazariturii":"năzăritură","nazariturile":"năzăritură","nazariturilor":"năzăritură","nazarlacul":"nazarlâc","nazarlacule":"nazarlâc","nazarlacului":"nazarlâc","nazarlacuri":"nazarlâc","nazarlacurile":"nazarlâc","nazarlacurilor":"nazarlâc","nazarul":["nazarul","nazar","nazârul","nazâr"],"nazarule":["nazarule","nazar","nazârule","nazâr"],"nazarului":["nazarului","nazar","nazârului","nazâr"],"nazaruri":"nazar","nazarurile":"nazar","nazarurilor":"nazar","nazbatia":"năzbâtie","nazbatiei":"năzbâtie","nazbatii":"năzbâtie","nazbatiile":"năzbâtie","nazbatiilor":"năzbâtie","nazbutia":"năzbutie","nazbutie":"năzbâtie","nazbutiei":"năzbutie","nazbutii":"năzbutie","nazbutiile":"năzbutie","nazbutiilor":"năzbutie","nazdravana":["năzdravană","năzdravan","năzdravana","năzdravan","năzdravănă","năzdravăn","năzdravăna","năzdravăn","năzdrăvană","năzdrăvan","năzdrăvana","năzdrăvan"],"nazdravane":["năzdravane","năzdravan","năzdravăne","năzdravăn","năzdrăvane","năzdrăvan"],"nazdravanele":["năzdravanele","năzdravan","năzdravănele","năzdravăn","năzdrăvanele","năzdrăvan"],"nazdravani":["năzdravani","năzdravan","năzdravăni","năzdravăn","năzdrăvani","năzdrăvan"],"nazdravania":"năzdrăvănie","nazdravaniei":"năzdrăvănie","nazdravanii":["năzdravanii","năzdravan","năzdravănii","năzdravăn","năzdrăvanii","năzdrăvan","năzdrăvănii","năzdrăvănie"],"nazdravaniile":"năzdrăvănie","nazdravaniilor":"năzdrăvănie","nazdravanul":["năzdravanul","năzdravan","năzdravănul","năzdravăn","năzdrăvanul","năzdrăvan"],"nazgodia":"năzgodie","nazgodiei":"năzgodie","nazgodii":"năzgodie","nazgodiile":"năzgodie","nazgodiilor":"năzgodie","nazificarea":"nazificare","nazificari":"nazificare","nazificarii":"nazificare","nazificarile":"nazificare","nazificarilor":"nazificare","naziri":"nazir","naziria":"nazirie","naziriei":"nazirie","nazirii":["nazirii","nazir","nazirii","nazirie"],"naziriile":"nazirie","naziriilor":"nazirie","nazirilor":"nazir","nazirul":"nazir","nazirule":"nazir","nazirului":"nazir","nazisme":"nazism","nazismele":"nazism","nazismelor":"nazism","nazismul":"nazism","nazismule":"nazism","nazismului":"nazism","naziste":"nazistă","nazistei":"nazistă","nazistele":"nazistă","nazistelor":"nazistă","nazisti":"nazist","nazistii":"nazist","nazistilor":"nazist","nazistul":"nazist","nazistule":"nazist","nazistului":"nazist","nazofaringiana":["nazofaringiană","nazofaringian","nazofaringiana","nazofaringian"],"nazofaringianul":"nazofaringian","nazofaringiene":"nazofaringian","nazofaringienele":"nazofaringian","nazofaringieni":"nazofaringian","nazofaringienii":"nazofaringian","nazuia":"năzui","nazuiai":"năzui","nazuiam":"năzui","nazuiati":"năzui","nazuiau":"năzui","nazuiele":"năzuială","nazuielei":"năzuială","nazuielele":"năzuială","nazuielelor":"năzuială","nazuieli":"năzuială","nazuiesc":"năzui","nazuieste":"năzui","nazuiesti":"năzui","nazuii":"năzui","nazuim":"năzui","nazuind":"năzui","nazuinte":"năzuință","nazuintei":"năzuință","nazuintele":"năzuință","nazuintelor":"năzuință","nazuira":"năzui","nazuiram":"năzui","nazuirati":"năzui","nazuirea":"năzuire","nazuiri":"năzuire","nazuirii":"năzuire","nazuirile":"năzuire","nazuirilor":"năzuire","nazuise":"năzui","nazuisem":"năzui","nazuisera":"năzui","nazuiseram":"năzui","nazuiserati":"năzui","nazuisesi":"năzui","nazuisi":"năzui","nazuit":"năzui","nazuiti":"năzui","nazul":"naz","nazule":"naz","nazului":"naz","nazuri":"naz","nazurile":["nazurile","naz","nazurile","nazuri"],"nazurilor":["nazurilor","naz","nazurilor","nazuri"],"nazuroasa":["năzuroasă","năzuros","năzuroasa","năzuros"],"nazuroase":"năzuros","nazuroasele":"năzuros","nazurosi":"năzuros","nazurosii":"năzuros","nazurosul":"năzuros","ne":"noi","nea":"nene","neabatuta":["neabătută","neabătut","neabătuta","neabătut"],"neabatute":"neabătut","neabatutele":"neabătut","neabatuti":"neabătut","neabatutii":"neabătut","neabatutul":"neabătut","neabila":["neabilă","neabil","neabila","neabil"],"neabile":"neabil","neabilele":"neabil","neabili":"neabil","neabilii":"neabil","neabilul":"neabil","neabonata":["neabonată","neabonat","neabonata","neabonat"],"neabonate":"neabonat","neabonatele":"neabonat","neabonati":"neabonat","neabonatii":"neabonat","neabonatul":"neabonat","neabordabila":["neabordabilă","neabordabil","neabordabila","neabordabil"],"neabordabile":"neabordabil","neabordabilele":"neabordabil","neabordabili":"neabordabil","neabordabilii":"neabordabil","neabordabilul":"neabordabil","neacademica":["neacademică","neacademic","neacademica","neacademic"],"neacademice":"neacademic","neacademicele":"neacademic","neacademici":"neacademic","neacademicii":"neacademic","neacademicul":"neacademic","neaccentuata":["neaccentuată","neaccentuat","neaccentuata","neaccentuat"],"neaccentuate":"neaccentuat","neaccentuatele":"neaccentuat","neaccentuati":"neaccentuat","neaccentuatii":"neaccentuat","neaccentuatul":"neaccentuat","neacceptabila":["neacceptabilă","neacceptabil","neacceptabila","neacceptabil"],"neacceptabile":"neacceptabil","neacceptabilele":"neacceptabil","neacceptabili":"neacceptabil","neacceptabilii":"neacceptabil","neacceptabilul":"neacceptabil","neacceptarea":"neacceptare","neacceptari":["neacceptări","neacceptare","neacceptari","neacceptare"],"neacceptarii":"neacceptare","neacceptarile":"neacceptare","neacceptarilor":"neacceptare","neaccidentata":["neaccidentată","neaccidentat","neaccidentata","neaccidentat"],"neaccidentate":"neaccidentat","neaccidentatele":"neaccidentat","neaccidentati":"neaccidentat","neaccidentatii":"neaccidentat","neaccidentatul":"neaccidentat","neacoperita":["neacoperită","neacoperit","neacoperita","neacoperit"],"neacoperite":"neacoperit","neacoperitele":"neacoperit","neacoperiti":"neacoperit","neacoperitii":"neacoperit","neacoperitul":"neacoperit","neacordata":["neacordată","neacordat","neacordata","neacordat"],"neacordate":"neacordat","neacordatele":"neacordat","neacordati":"neacordat","neacordatii":"neacordat","neacordatul":"neacordat","neactiunea":"neacțiune","neactiuni":"neacțiune","neactiunii":"neacțiune","neactuala":["neactuală","neactual","neactuala","neactual"],"neactuale":"neactual","neactualele":"neactual","neactuali":"neactual","neactualii":"neactual","neactualul":"neactual","neadaptarea":"neadaptare","neadaptari":["neadaptări","neadaptare","neadaptari","neadaptare"],"neadaptarii":"neadaptare","neadaptarile":"neadaptare","neadaptarilor":"neadaptare","neadaptata":["neadaptată","neadaptat","neadaptata","neadaptat"],"neadaptate":"neadaptat","neadaptatele":"neadaptat","neadaptati":"neadaptat","neadaptatii":"neadaptat","neadaptatul":"neadaptat","neadecvata":["neadecvată","neadecvat","neadecvata","neadecvat"],"neadecvate":"neadecvat","neadecvatele":"neadecvat","neadecvati":"neadecvat","neadecvatii":"neadecvat","neadecvatul":"neadecvat","neaderenta":["neaderentă","neaderent","neaderenta","neaderent"],"neaderente":["neaderente","neaderent","neaderențe","neaderență"],"neaderentei":"neaderență","neaderentele":["neaderentele","neaderent","neaderențele","neaderență"],"neaderentelor":"neaderență","neaderenti":"neaderent","neaderentii":"neaderent","neaderentul":"neaderent","neadevarata":["neadevărată","neadevărat","neadevărata","neadevărat"],"neadevarate":"neadevărat","neadevaratele":"neadevărat","neadevarati":"neadevărat","neadevaratii":"neadevărat","neadevaratul":"neadevărat","neadevarul":"neadevăr","neadevarule":"neadevăr","neadevarului":"neadevăr","neadevaruri":"neadevăr","neadevarurile":"neadevăr","neadevarurilor":"neadevăr","neadeverita":["neadeverită","neadeverit","neadeverita","neadeverit"],"neadeverite":"neadeverit","neadeveritele":"neadeverit","neadeveriti":"neadeverit","neadeveritii":"neadeverit","neadeveritul":"neadeverit","neadmisibila":["neadmisibilă","neadmisibil","neadmisibila","neadmisibil"],"neadmisibile":"neadmisibil","neadmisibilele":"neadmisibil","neadmisibili":"neadmisibil","neadmisibilii":"neadmisibil","neadmisibilul":"neadmisibil","neadormirea":"neadormire","neadormiri":"neadormire","neadormirii":"neadormire","neadormirile":"neadormire","neadormirilor":"neadormire","neadormita":["neadormită","neadormit","neadormita","neadormit"],"neadormite":"neadormit","neadormitele":"neadormit","neadormiti":"neadormit","neadormitii":"neadormit","neadormitul":"neadormit","neaducerea":"neaducere","neaduceri":"neaducere","neaducerii":"neaducere","neaducerile":"neaducere","neaducerilor":"neaducere","neaerata":["neaerată","neaerat","neaerata","neaerat"],"neaerate":"neaerat","neaeratele":"neaerat","neaerati":"neaerat","neaeratii":"neaerat","neaeratul":"neaerat","neafectata":["neafectată","neafectat","neafectata","neafectat"],"neafectate":"neafectat","neafectatele":"neafectat","neafectati":"neafectat","neafectatii":"neafectat","neafectatul":"neafectat","neafiliata":["neafiliată","neafiliat","neafiliata","neafiliat"],"neafiliate":"neafiliat","neafiliatele":"neafiliat","neafiliati":"neafiliat","neafiliatii":"neafiliat","neafiliatul":"neafiliat","neaga":"nega","neaglutinata":["neaglutinată","neaglutinat","neaglutinata","neaglutinat"],"neaglutinate":"neaglutinat","neaglutinatele":"neaglutinat","neaglutinati":"neaglutinat","neaglutinatii":"neaglutinat","neaglutinatul":"neaglutinat","neagra":["neagră","negru","neagra","negru"],"neagra ca taciunele":"negru ca tăciunele","neagresiunea":"neagresiune","neagresiuni":"neagresiune","neagresiunii":"neagresiune","neagresiunile":"neagresiune","neagresiunilor":"neagresiune","neagresiva":["neagresivă","neagresiv","neagresiva","neagresiv"],"neagresive":"neagresiv","neagresivele":"neagresiv","neagresivi":"neagresiv","neagresivii":"neagresiv","neagresivitatea":"neagresivitate","neagresivitati":"neagresivitate","neagresivitatii":"neagresivitate","neagresivitatile":"neagresivitate","neagresivitatilor":"neagresivitate","neagresivul":"neagresiv","neagricola":["neagricolă","neagricol","neagricola","neagricol"],"neagricole":"neagricol","neagricolele":"neagricol","neagricoli":"neagricol","neagricolii":"neagricol","neagricolul":"neagricol","neajungerea":"neajungere","neajungeri":"neajungere","neajungerii":"neajungere","neajungerile":"neajungere","neajungerilor":"neajungere","neajunsia":"neajunsie","neajunsiei":"neajunsie","neajunsii":"neajunsie","neajunsiile":"neajunsie","neajunsiilor":"neajunsie","neajunsul":"neajuns","neajunsule":"neajuns","neajunsului":"neajuns","neajunsuri":"neajuns","neajunsurile":"neajuns","neajunsurilor":"neajuns","neajutatoare":"neajutător","neajutatoarea":"neajutător","neajutatoarele":"neajutător","neajutatori":"neajutător","neajutatorii":"neajutător","neajutatorul":"neajutător","neajutorata":["neajutorată","neajutorat","neajutorata","neajutorat"],"neajutorate":"neajutorat","neajutoratele":"neajutorat","neajutorati":"neajutorat","neajutoratii":"neajutorat","neajutoratul":"neajutorat","nealcoolica":["nealcoolică","nealcoolic","nealcoolica","nealcoolic"],"nealcoolice":"nealcoolic","nealcoolicele":"nealcoolic","nealcoolici":"nealcoolic","nealcoolicii":"nealcoolic","nealcoolicul":"nealcoolic","nealiniata":["nealiniată","nealiniat","nealiniata","nealiniat"],"nealiniate":"nealiniat","nealiniatele":"nealiniat","nealiniati":"nealiniat","nealiniatii":"nealiniat","nealiniatul":"nealiniat","nealinierea":"nealiniere","nealinieri":"nealiniere","nealinierii":"nealiniere","nealinierile":"nealiniere","nealinierilor":"nealiniere","nealterabila":["nealterabilă","nealterabil","nealterabila","nealterabil"],"nealterabile":"nealterabil","nealterabilele":"nealterabil","nealterabili":"nealterabil","nealterabilii":"nealterabil","nealterabilul":"nealterabil","nealterarea":"nealterare","nealterari":"nealterare","nealterarii":"nealterare","nealterarile":"nealterare","nealterarilor":"nealterare","nealterata":["nealterată","nealterat","nealterata","nealterat"],"nealterate":"nealterat","nealteratele":"nealterat","nealterati":"nealterat","nealteratii":"nealterat","nealteratul":"nealterat","nealtoita":["nealtoită","nealtoit","nealtoita","nealtoit"],"nealtoite":"nealtoit","nealtoitele":"nealtoit","nealtoiti":"nealtoit","nealtoitii":"nealtoit","nealtoitul":"nealtoit","neamabila":["neamabilă","neamabil","neamabila","neamabil"],"neamabile":"neamabil","neamabilele":"neamabil","neamabili":"neamabil","neamabilii":"neamabil","neamabilul":"neamabil","neamestecul":"neamestec","neamestecule":"neamestec","neamestecului":"neamestec","neamici":"neamic","neamicii":"neamic","neamicilor":"neamic","neamicul":"neamic","neamicule":"neamic","neamicului":"neamic","neamtofila":["neamțofilă","neamțofil","neamțofila","neamțofil"],"neamtofile":["neamțofile","neamțofil","neamțofile","neamțofilă"],"neamtofilei":"neamțofilă","neamtofilele":["neamțofilele","neamțofil","neamțofilele","neamțofilă"],"neamtofilelor":"neamțofilă","neamtofili":"neamțofil","neamtofilii":"neamțofil","neamtofilul":"neamțofil","neamtul":"neamț","neamtule":"neamț","neamtului":"neamț","neamul":"neam","neamule":"neam","neamului":"neam","neamuri":"neam","neamurile":"neam","neamurilor":"neam","neanalizabila":["neanalizabilă","neanalizabil","neanalizabila","neanalizabil"],"neanalizabile":"neanalizabil","neanalizabilele":"neanalizabil","neanalizabili":"neanalizabil","neanalizabilii":"neanalizabil","neanalizabilul":"neanalizabil","neanexata":["neanexată","neanexat","neanexata","neanexat"],"neanexate":"neanexat","neanexatele":"neanexat","neanexati":"neanexat","neanexatii":"neanexat","neanexatul":"neanexat","neangajata":["neangajată","neangajat","neangajata","neangajat"],"neangajate":"neangajat","neangajatele":"neangajat","neangajati":"neangajat","neangajatii":"neangajat","neangajatul":"neangajat","neanimata":["neanimată","neanimat","neanimata","neanimat"],"neanimate":"neanimat","neanimatele":"neanimat","neanimati":"neanimat","neanimatii":"neanimat","neanimatul":"neanimat","neantagonica":["neantagonică","neantagonic","neantagonica","neantagonic"],"neantagonice":"neantagonic","neantagonicele":"neantagonic","neantagonici":"neantagonic","neantagonicii":"neantagonic","neantagonicul":"neantagonic","neantagonista":["neantagonistă","neantagonist","neantagonista","neantagonist"],"neantagoniste":"neantagonist","neantagonistele":"neantagonist","neantagonisti":"neantagonist","neantagonistii":"neantagonist","neantagonistul":"neantagonist","neanticipata":["neanticipată","neanticipat","neanticipata","neanticipat"],"neanticipate":"neanticipat","neanticipatele":"neanticipat","neanticipati":"neanticipat","neanticipatii":"neanticipat","neanticipatul":"neanticipat","neantizai":"neantiza","neantizam":["neantizăm","neantiza","neantizam","neantiza"],"neantizand":"neantiza","neantizara":"neantiza","neantizaram":"neantiza","neantizarati":"neantiza","neantizarea":"neantizare","neantizari":"neantizare","neantizarii":"neantizare","neantizarile":"neantizare","neantizarilor":"neantizare","neantizase":"neantiza","neantizasem":"neantiza","neantizasera":"neantiza","neantizaseram":"neantiza","neantizaserati":"neantiza","neantizasesi":"neantiza","neantizasi":"neantiza","neantizat":"neantiza","neantizati":"neantiza","neantizau":"neantiza","neantizeaza":"neantiza","neantizez":"neantiza","neantizezi":"neantiza","neantul":"neant","neantule":"neant","neantului":"neant","neaosa":["neaoșă","neaoș","neaoșa","neaoș"],"neaose":"neaoș","neaosele":"neaoș","neaosi":"neaoș","neaosii":"neaoș","neaosisme":"neaoșism","neaosismele":"neaoșism","neaosismelor":"neaoșism","neaosismul":"neaoșism","neaosismule":"neaoșism","neaosismului":"neaoșism","neaosiste":"neaoșistă","neaosistei":"neaoșistă","neaosistele":"neaoșistă","neaosistelor":"neaoșistă","neaosul":"neaoș","neaparata":["neapărată","neapărat","neapărata","neapărat"],"neaparate":"neapărat","neaparatele":"neapărat","neaparati":"neapărat","neaparatii":"neapărat","neaparatul":"neapărat","neaplicabila":["neaplicabilă","neaplicabil","neaplicabila","neaplicabil"],"neaplicabile":"neaplicabil","neaplicabilele":"neaplicabil","neaplicabili":"neaplicabil","neaplicabilii":"neaplicabil","neaplicabilitatea":"neaplicabilitate","neaplicabilitati":"neaplicabilitate","neaplicabilitatii":"neaplicabilitate","neaplicabilul":"neaplicabil","neapreciata":["neapreciată","neapreciat","neapreciata","neapreciat"],"neapreciate":"neapreciat","neapreciatele":"neapreciat","neapreciati":"neapreciat","neapreciatii":"neapreciat","neapreciatul":"neapreciat","nearanjata":["nearanjată","nearanjat","nearanjata","nearanjat"],"nearanjate":"nearanjat","nearanjatele":"nearanjat","nearanjati":"nearanjat","nearanjatii":"nearanjat","nearanjatul":"nearanjat","nearata":["nearată","nearat","nearata","nearat"],"nearate":"nearat","nearatele":"nearat","nearati":"nearat","nearatii":"nearat","nearatul":"nearat","nearmonioasa":["nearmonioasă","nearmonios","nearmonioasa","nearmonios"],"nearmonioase":"nearmonios","nearmonioasele":"nearmonios","nearmoniosi":"nearmonios","nearmoniosii":"nearmonios","nearmoniosul":"nearmonios","nearomata":["nearomată","nearomat","nearomata","nearomat"],"nearomate":"nearomat","nearomatele":"nearomat","nearomati":"nearomat","nearomatii":"nearomat","nearomatul":"nearomat","nearticulata":["nearticulată","nearticulat","nearticulata","nearticulat"],"nearticulate":"nearticulat","nearticulatele":"nearticulat","nearticulati":"nearticulat","nearticulatii":"nearticulat","nearticulatul":"nearticulat","neartificiala":["neartificială","neartificial","neartificiala","neartificial"],"neartificiale":"neartificial","neartificialele":"neartificial","neartificiali":"neartificial","neartificialii":"neartificial","neartificialul":"neartificial","neartistica":["neartistică","neartistic","neartistica","neartistic"],"neartistice":"neartistic","neartisticele":"neartistic","neartistici":"neartistic","neartisticii":"neartistic","neartisticul":"neartistic","neascultarea":"neascultare","neascultari":"neascultare","neascultarii":"neascultare","neascultatoare":"neascultător","neascultatoarea":"neascultător","neascultatoarele":"neascultător","neascultatori":"neascultător","neascultatorii":"neascultător","neascultatorul":"neascultător","neascutita":["neascuțită","neascuțit","neascuțita","neascuțit"],"neascutite":"neascuțit","neascutitele":"neascuțit","neascutiti":"neascuțit","neascutitii":"neascuțit","neascutitul":"neascuțit","neasemanata":["neasemănată","neasemănat","neasemănata","neasemănat"],"neasemanate":"neasemănat","neasemanatele":"neasemănat","neasemanati":"neasemănat","neasemanatii":"neasemănat","neasemanatul":"neasemănat","neasemuita":["neasemuită","neasemuit","neasemuita","neasemuit"],"neasemuite":"neasemuit","neasemuitele":"neasemuit","neasemuiti":"neasemuit","neasemuitii":"neasemuit","neasemuitul":"neasemuit","neasigurata":["neasigurată","neasigurat","neasigurata","neasigurat"],"neasigurate":"neasigurat","neasiguratele":"neasigurat","neasigurati":"neasigurat","neasiguratii":"neasigurat","neasiguratul":"neasigurat","neasimilata":["neasimilată","neasimilat","neasimilata","neasimilat"],"neasimilate":"neasimilat","neasimilatele":"neasimilat","neasimilati":"neasimilat","neasimilatii":"neasimilat","neasimilatul":"neasimilat","neastampararea":"neastâmpărare","neastamparari":"neastâmpărare","neastampararii":"neastâmpărare","neastamparata":["neastâmpărată","neastâmpărat","neastâmpărata","neastâmpărat"],"neastamparate":"neastâmpărat","neastamparatele":"neastâmpărat","neastamparati":"neastâmpărat","neastamparatii":"neastâmpărat","neastamparatul":"neastâmpărat","neastamparul":"neastâmpăr","neastamparule":"neastâmpăr","neastamparului":"neastâmpăr","neasteptarea":"neașteptare","neasteptari":"neașteptare","neasteptarii":"neașteptare","neasteptata":["neașteptată","neașteptat","neașteptata","neașteptat"],"neasteptate":"neașteptat","neasteptatele":"neașteptat","neasteptati":"neașteptat","neasteptatii":"neașteptat","neasteptatul":"neașteptat","neatacabila":["neatacabilă","neatacabil","neatacabila","neatacabil"],"neatacabile":"neatacabil","neatacabilele":"neatacabil","neatacabili":"neatacabil","neatacabilii":"neatacabil","neatacabilul":"neatacabil","neatarnarea":"neatârnare","neatarnari":"neatârnare","neatarnarii":"neatârnare","neatarnarile":"neatârnare","neatarnarilor":"neatârnare","neatarnata":["neatârnată","neatârnat","neatârnata","neatârnat"],"neatarnate":"neatârnat","neatarnatele":"neatârnat","neatarnati":"neatârnat","neatarnatii":"neatârnat","neatarnatul":"neatârnat","neatasabila":["neatașabilă","neatașabil","neatașabila","neatașabil"],"neatasabile":"neatașabil","neatasabilele":"neatașabil","neatasabili":"neatașabil","neatasabilii":"neatașabil","neatasabilul":"neatașabil","neatenta":["neatentă","neatent","neatenta","neatent"],"neatente":"neatent","neatentele":"neatent","neatenti":"neatent","neatentia":"neatenție","neatentiei":"neatenție","neatentii":["neatenții","neatent","neatenții","neatenție"],"neatentul":"neatent","neatestata":["neatestată","neatestat","neatestata","neatestat"],"neatestate":"neatestat","neatestatele":"neatestat","neatestati":"neatestat","neatestatii":"neatestat","neatestatul":"neatestat","neatinsa":["neatinsă","neatins","neatinsa","neatins"],"neatinse":"neatins","neatinsele":"neatins","neatinsi":"neatins","neatinsii":"neatins","neatinsul":"neatins","neatragatoare":"neatrăgător","neatragatori":"neatrăgător","neaua":["neaua","nea","neauă","nea"],"neaue":"neauă","neauei":"neauă","neautentica":["neautentică","neautentic","neautentica","neautentic"],"neautentice":"neautentic","neautenticele":"neautentic","neautentici":"neautentic","neautenticii":"neautentic","neautenticul":"neautentic","neautorizata":["neautorizată","neautorizat","neautorizata","neautorizat"],"neautorizate":"neautorizat","neautorizatele":"neautorizat","neautorizati":"neautorizat","neautorizatii":"neautorizat","neautorizatul":"neautorizat","neauzita":["neauzită","neauzit","neauzita","neauzit"],"neauzite":"neauzit","neauzitele":"neauzit","neauziti":"neauzit","neauzitii":"neauzit","neauzitul":"neauzit","neavenita":["neavenită","neavenit","neavenita","neavenit"],"neavenite":"neavenit","neavenitele":"neavenit","neaveniti":"neavenit","neavenitii":"neavenit","neavenitul":"neavenit","neavizata":["neavizată","neavizat","neavizata","neavizat"],"neavizate":"neavizat","neavizatele":"neavizat","neavizati":"neavizat","neavizatii":"neavizat","neavizatul":"neavizat","nebantuita":["nebântuită","nebântuit","nebântuita","nebântuit"],"nebantuite":"nebântuit","nebantuitele":"nebântuit","nebantuiti":"nebântuit","nebantuitii":"nebântuit","nebantuitul":"nebântuit","nebanuita":["nebănuită","nebănuit","nebănuita","nebănuit"],"nebanuite":"nebănuit","nebanuitele":"nebănuit","nebanuiti":"nebănuit","nebanuitii":"nebănuit","nebanuitul":"nebănuit","nebauta":["nebăută","nebăut","nebăuta","nebăut"],"nebaute":"nebăut","nebautele":"nebăut","nebauti":"nebăut","nebautii":"nebăut","nebautul":"nebăut","nebedernici":"nebedernică","nebedernicii":"nebedernică","nebedernicile":"nebedernică","nebedernicilor":"nebedernică","nebeligeranta":["nebeligerantă","nebeligerant","nebeligeranta","nebeligerant"],"nebeligerante":"nebeligerant","nebeligerantele":"nebeligerant","nebeligeranti":"nebeligerant","nebeligerantii":"nebeligerant","nebeligerantul":"nebeligerant","nebiruita":["nebiruită","nebiruit","nebiruita","nebiruit"],"nebiruite":"nebiruit","nebiruitele":"nebiruit","nebiruiti":"nebiruit","nebiruitii":"nebiruit","nebiruitul":"nebiruit","nebotezata":["nebotezată","nebotezat","nebotezata","nebotezat"],"nebotezate":"nebotezat","nebotezatele":"nebotezat","nebotezati":"nebotezat","nebotezatii":"nebotezat","nebotezatul":"nebotezat","nebuloasa":"nebulos","nebuloase":["nebuloase","nebuloasă","nebuloase","nebulos"],"nebuloase planetare":"nebuloasă planetară","nebuloasei":"nebuloasă","nebuloasele":"nebuloasă","nebuloaselor":"nebuloasă","nebulosi":"nebulos","nebulozitatea":"nebulozitate","nebulozitati":"nebulozitate","nebulozitatii":"nebulozitate","nebulozitatile":"nebulozitate","nebulozitatilor":"nebulozitate","nebuna":["nebună","nebun","nebuna","nebun"],"nebuna de legat":"nebun de legat","nebunarite":["nebunarițe","nebunariță","nebunărițe","nebunăriță"],"nebunaritei":["nebunariței","nebunariță","nebunăriței","nebunăriță"],"nebunaritele":["nebunarițele","nebunariță","nebunărițele","nebunăriță"],"nebunaritelor":["nebunarițelor","nebunariță","nebunărițelor","nebunăriță"],"nebunateca":["nebunatecă","nebunatec","nebunateca","nebunatec"],"nebunatece":"nebunatec","nebunatecele":"nebunatec","nebunateci":"nebunatec","nebunatecia":"nebunatecie","nebunateciei":"nebunatecie","nebunatecii":["nebunatecii","nebunatec","nebunatecii","nebunatecie"],"nebunatecul":"nebunatec","nebunatica":["nebunatică","nebunatic","nebunatica","nebunatic"],"nebunatice":"nebunatic","nebunaticele":"nebunatic","nebunatici":"nebunatic","nebunaticii":"nebunatic","nebunaticul":"nebunatic","nebune":["nebune","nebun","nebune","nebună"],"nebune de legat":"nebun de legat","nebunea":"nebuni","nebuneai":"nebuni","nebuneam":"nebuni","nebuneasca":["nebunească","nebunesc","nebuneasca","nebunesc"],"nebuneati":"nebuni","nebuneau":"nebuni","nebunei":"nebună","nebunele":["nebunele","nebun","nebunele","nebună"],"nebuneli":"nebuneală","nebunelii":"nebuneală","nebunelile":"nebuneală","nebunelilor":"nebuneală","nebunelor":"nebună","nebunesc":"nebuni","nebunescul":"nebunesc","nebuneste":"nebuni","nebunesti":["nebunești","nebunesc","nebunești","nebuni"],"nebunestii":"nebunesc","nebunestile":"nebunesc","nebuni":"nebun","nebuni de legat":"nebun de legat","nebunia":"nebunie","nebuniei":"nebunie","nebunii":["nebunii","nebun","nebunii","nebuni","nebunii","nebunie"],"nebuniile":"nebunie","nebuniilor":"nebunie","nebunilor":"nebun","nebunim":"nebuni","nebunind":"nebuni","nebunira":"nebuni","nebuniram":"nebuni","nebunirati":"nebuni","nebunirea":"nebunire","nebunirei":"nebunire","nebunise":"nebuni","nebunisem":"nebuni","nebunisera":"nebuni","nebuniseram":"nebuni","nebuniserati":"nebuni","nebunisesi":"nebuni","nebunisi":"nebuni","nebunit":"nebuni","nebunita":["nebunită","nebunit","nebunita","nebunit"],"nebunite":"nebunit","nebunitele":"nebunit","nebuniti":["nebuniți","nebuni","nebuniți","nebunit"],"nebunitii":"nebunit","nebunitul":"nebunit","nebunoase":"nebunoasă","nebunoasei":"nebunoasă","nebunoasele":"nebunoasă","nebunoaselor":"nebunoasă","nebunul":"nebun","nebunule":"nebun","nebunului":"nebun","necacioasa":["necăcioasă","necăcios","necăcioasa","necăcios"],"necacioase":"necăcios","necacioasele":"necăcios","necaciosi":"necăcios","necaciosii":"necăcios","necaciosul":"necăcios","necaciunea":"necăciune","necaciuni":"necăciune","necaciunii":"necăciune","necaciunile":"necăciune","necaciunilor":"necăciune","necajea":"necăji","necajeai":"necăji","necajeam":"necăji","necajeati":"necăji","necajeau":"necăji","necajele":"necăjeală","necajelei":"necăjeală","necajelele":"necăjeală","necajelelor":"necăjeală","necajeli":"necăjeală","necajesc":"necăji","necajeste":"necăji","necajesti":"necăji","necajicioasa":["necăjicioasă","necăjicios","necăjicioasa","necăjicios"],"necajicioase":"necăjicios","necajicioasele":"necăjicios","necajiciosi":"necăjicios","necajiciosii":"necăjicios","necajiciosul":"necăjicios","necajii":"necăji","necajim":"necăji","necajind":"necăji","necajira":"necăji","necajiram":"necăji","necajirati":"necăji","necajirea":"necăjire","necajiri":"necăjire","necajirii":"necăjire","necajirile":"necăjire","necajirilor":"necăjire","necajise":"necăji","necajisem":"necăji","necajisera":"necăji","necajiseram":"necăji","necajiserati":"necăji","necajisesi":"necăji","necajisi":"necăji","necajit":"necăji","necajita":["necăjită","necăjit","necăjita","necăjit"],"necajite":"necăjit","necajitele":"necăjit","necajiti":["necăjiți","necăji","necăjiți","necăjit"],"necajitii":"necăjit","necajitul":"necăjit","necalcata":["necălcată","necălcat","necălcata","necălcat"],"necalcate":"necălcat","necalcatele":"necălcat","necalcati":"necălcat","necalcatii":"necălcat","necalcatul":"necălcat","necalculabila":["necalculabilă","necalculabil","necalculabila","necalculabil"],"necalculabile":"necalculabil","necalculabilele":"necalculabil","necalculabili":"necalculabil","necalculabilii":"necalculabil","necalculabilul":"necalculabil","necalificata":["necalificată","necalificat","necalificata","necalificat"],"necalificate":"necalificat","necalificatele":"necalificat","necalificati":"necalificat","necalificatii":"necalificat","necalificatul":"necalificat","necarturareti":"necărturareț","necarturaretii":"necărturareț","necarturaretilor":"necărturareț","necarturaretul":"necărturareț","necarturaretule":"necărturareț","necarturaretului":"necărturareț","necarturari":"necărturar","necarturarii":"necărturar","necarturarilor":"necărturar","necarturarul":"necărturar","necarturarule":"necărturar","necarturarului":"necărturar","necasatoria":"necăsătorie","necasatoriei":"necăsătorie","necasatorii":"necăsătorie","necasatoriile":"necăsătorie","necasatoriilor":"necăsătorie","necasatorita":["necăsătorită","necăsătorit","necăsătorita","necăsătorit"],"necasatorite":"necăsătorit","necasatoritele":"necăsătorit","necasatoriti":"necăsătorit","necasatoritii":"necăsătorit","necasatoritul":"necăsătorit","necasnicia":"necăsnicie","necasniciei":"necăsnicie","necasnicii":"necăsnicie","necasniciile":"necăsnicie","necasniciilor":"necăsnicie","necaturi":"necătură","necaturii":"necătură","necaturile":"necătură","necaturilor":"necătură","necazul":"necaz","necazule":"necaz","necazului":"necaz","necazuri":"necaz","necazurile":"necaz","necazurilor":"necaz","necazuta":["necăzută","necăzut","necăzuta","necăzut"],"necazute":"necăzut","necazutele":"necăzut","necazuti":"necăzut","necazutii":"necăzut","necazutul":"necăzut","nece":"nici","necesara":["necesară","necesar","necesara","necesar"],"necesare":"necesar","necesarele":"necesar","necesari":"necesar","necesariane":"necesariană","necesarianei":"necesariană","necesarianele":"necesariană","necesarianelor":"necesariană","necesarianul":"necesarian","necesarianule":"necesarian","necesarianului":"necesarian","necesarieni":"necesarian","necesarienii":"necesarian","necesarienilor":"necesarian","necesarii":"necesar","necesarul":"necesar","necesit":"necesita","necesitai":"necesita","necesitam":["necesităm","necesita","necesitam","necesita"],"necesitand":"necesita","necesitara":"necesita","necesitaram":"necesita","necesitarati":"necesita","necesitase":"necesita","necesitasem":"necesita","necesitasera":"necesita","necesitaseram":"necesita","necesitaserati":"necesita","necesitasesi":"necesita","necesitasi":"necesita","necesitat":"necesita","necesitatea":"necesitate","necesitati":["necesitați","necesita","necesități","necesitate"],"necesitatii":"necesitate","necesitatile":"necesitate","necesitatilor":"necesitate","necesitau":"necesita","necesite":"necesita","necesiti":"necesita","necestivi":"necestiv","necestivii":"necestiv","necestivilor":"necestiv","necestivul":"necestiv","necestivule":"necestiv","necestivului":"necestiv","nechbzuinta":["nechbzuință","nechibzuință","nechbzuința","nechibzuință"],"nechbzuinte":"nechibzuință","nechbzuintei":"nechibzuință","nechbzuintele":"nechibzuință","nechbzuintelor":"nechibzuință","necheaza":"necheza","nechemate":"nechemată","nechematei":"nechemată","nechematele":"nechemată","nechematelor":"nechemată","nechemati":"nechemat","nechematii":"nechemat","nechematilor":"nechemat","nechematul":"nechemat","nechematule":"nechemat","nechematului":"nechemat","nechez":"necheza","nechezai":"necheza","nechezam":["nechezăm","necheza","nechezam","necheza"],"nechezand":"necheza","nechezara":"necheza","nechezaram":"necheza","nechezarati":"necheza","nechezarea":"nechezare","nechezari":"nechezare","nechezarii":"nechezare","nechezarile":"nechezare","nechezarilor":"nechezare","nechezase":"necheza","nechezasem":"necheza","nechezasera":"necheza","nechezaseram":"necheza","nechezaserati":"necheza","nechezasesi":"necheza","nechezasi":"necheza","nechezat":"necheza","nechezati":"necheza","nechezatoare":"nechezător","nechezatoarea":"nechezător","nechezatoarele":"nechezător","nechezatori":"nechezător","nechezatorii":"nechezător","nechezatorul":"nechezător","nechezatul":"nechezat","nechezatule":"nechezat","nechezatului":"nechezat","nechezaturi":["nechezaturi","nechezat","nechezături","nechezătură"],"nechezaturii":"nechezătură","nechezaturile":["nechezaturile","nechezat","nechezăturile","nechezătură"],"nechezaturilor":["nechezaturilor","nechezat","nechezăturilor","nechezătură"],"nechezau":"necheza","nechezete":"nechezet","nechezetele":"nechezet","nechezetelor":"nechezet","nechezetul":"nechezet","nechezetule":"nechezet","nechezetului":"nechezet","nechezi":"necheza","nechezolul":"nechezol","nechezolule":"nechezol","nechezolului":"nechezol","nechezul":"nechez","nechezule":"nechez","nechezului":"nechez","nechezuri":"nechez","nechezurile":"nechez","nechezurilor":"nechez","nechibzuinte":"nechibzuință","nechibzuita":["nechibzuită","nechibzuit","nechibzuita","nechibzuit"],"nechibzuite":"nechibzuit","nechibzuitele":"nechibzuit","nechibzuiti":"nechibzuit","nechibzuitii":"nechibzuit","nechibzuitul":"nechibzuit","nechitita":["nechitită","nechitit","nechitita","nechitit"],"nechitite":"nechitit","nechititele":"nechitit","nechititi":"nechitit","nechititii":"nechitit","nechititul":"nechitit","necicatrizata":["necicatrizată","necicatrizat","necicatrizata","necicatrizat"],"necicatrizate":"necicatrizat","necicatrizatele":"necicatrizat","necicatrizati":"necicatrizat","necicatrizatii":"necicatrizat","necicatrizatul":"necicatrizat","necinstea":["necinstea","necinste","necinstea","necinsti"],"necinsteai":"necinsti","necinsteam":"necinsti","necinsteati":"necinsti","necinsteau":"necinsti","necinstesc":"necinsti","necinsteste":"necinsti","necinstesti":"necinsti","necinsti":"necinste","necinstii":["necinstii","necinste","necinstii","necinsti"],"necinstim":"necinsti","necinstind":"necinsti","necinstira":"necinsti","necinstiram":"necinsti","necinstirati":"necinsti","necinstirea":"necinstire","necinstiri":"necinstire","necinstirii":"necinstire","necinstirile":"necinstire","necinstirilor":"necinstire","necinstise":"necinsti","necinstisem":"necinsti","necinstisera":"necinsti","necinstiseram":"necinsti","necinstiserati":"necinsti","necinstisesi":"necinsti","necinstisi":"necinsti","necinstit":"necinsti","necinstita":["necinstită","necinstit","necinstita","necinstit"],"necinstite":"necinstit","necinstitele":"necinstit","necinstiti":["necinstiți","necinsti","necinstiți","necinstit"],"necinstitii":"necinstit","necinstitoare":"necinstitor","necinstitoarea":"necinstitor","necinstitoarele":"necinstitor","necinstitori":"necinstitor","necinstitorii":"necinstitor","necinstitorul":"necinstitor","necinstitul":"necinstit","necioplirea":"necioplire","necioplirei":"necioplire","necioplita":["necioplită","necioplit","necioplita","necioplit"],"necioplite":"necioplit","necioplitele":"necioplit","neciopliti":"necioplit","necioplitii":"necioplit","necioplitul":"necioplit","neciteata":["neciteață","neciteț","neciteața","neciteț"],"necitete":"neciteț","necitetele":"neciteț","neciteti":"neciteț","necitetii":"neciteț","necitetul":"neciteț","necivilizata":["necivilizată","necivilizat","necivilizata","necivilizat"],"necivilizate":"necivilizat","necivilizatele":"necivilizat","necivilizati":"necivilizat","necivilizatii":"necivilizat","necivilizatul":"necivilizat","neclara":["neclară","neclar","neclara","neclar"],"neclare":"neclar","neclarele":"neclar","neclari":"neclar","neclarii":"neclar","neclaritatea":"neclaritate","neclaritati":"neclaritate","neclaritatii":"neclaritate","neclaritatile":"neclaritate","neclaritatilor":"neclaritate","neclarul":"neclar","neclatita":["neclătită","neclătit","neclătita","neclătit"],"neclatite":"neclătit","neclatitele":"neclătit","neclatiti":"neclătit","neclatitii":"neclătit","neclatitul":"neclătit","neclintirea":"neclintire","neclintiri":"neclintire","neclintirii":"neclintire","neclintirile":"neclintire","neclintirilor":"neclintire","neclintita":["neclintită","neclintit","neclintita","neclintit"],"neclintite":"neclintit","neclintitele":"neclintit","neclintiti":"neclintit","neclintitii":"neclintit","neclintitul":"neclintit","necoapta":["necoaptă","necopt","necoapta","necopt"],"necoapte":"necopt","necoaptele":"necopt","necombatanta":["necombatantă","necombatant","necombatanta","necombatant"],"necombatante":"necombatant","necombatantele":"necombatant","necombatanti":"necombatant","necombatantii":"necombatant","necombatantilor":"necombatant","necombatantul":"necombatant","necombatantule":"necombatant","necombatantului":"necombatant","necombustibila":["necombustibilă","necombustibil","necombustibila","necombustibil"],"necombustibile":"necombustibil","necombustibilele":"necombustibil","necombustibili":"necombustibil","necombustibilii":"necombustibil","necombustibilul":"necombustibil","necomerciala":["necomercială","necomercial","necomerciala","necomercial"],"necomerciale":"necomercial","necomercialele":"necomercial","necomerciali":"necomercial","necomercialii":"necomercial","necomercialul":"necomercial","necomestibila":["necomestibilă","necomestibil","necomestibila","necomestibil"],"necomestibile":"necomestibil","necomestibilele":"necomestibil","necomestibili":"necomestibil","necomestibilii":"necomestibil","necomestibilul":"necomestibil","necomparabila":["necomparabilă","necomparabil","necomparabila","necomparabil"],"necomparabile":"necomparabil","necomparabilele":"necomparabil","necomparabili":"necomparabil","necomparabilii":"necomparabil","necomparabilul":"necomparabil","necompatibila":["necompatibilă","necompatibil","necompatibila","necompatibil"],"necompatibile":"necompatibil","necompatibilele":"necompatibil","necompatibili":"necompatibil","necompatibilii":"necompatibil","necompatibilitatea":"necompatibilitate","necompatibilitati":"necompatibilitate","necompatibilitatii":"necompatibilitate","necompatibilul":"necompatibil","necompetenta":["necompetentă","necompetent","necompetenta","necompetent"],"necompetente":"necompetent","necompetentele":"necompetent","necompetenti":"necompetent","necompetentii":"necompetent","necompetentul":"necompetent","necomplecta":["necomplectă","necomplect","necomplecta","necomplect"],"necomplecte":"necomplect","necomplectele":"necomplect","necomplecti":"necomplect","necomplectii":"necomplect","necomplectul":"necomplect","necompleta":["necompletă","necomplet","necompleta","necomplet"],"necomplete":"necomplet","necompletele":"necomplet","necompleti":"necomplet","necompletii":"necomplet","necompletul":"necomplet","necomplicata":["necomplicată","necomplicat","necomplicata","necomplicat"],"necomplicate":"necomplicat","necomplicatele":"necomplicat","necomplicati":"necomplicat","necomplicatii":"necomplicat","necomplicatul":"necomplicat","necompresibila":["necompresibilă","necompresibil","necompresibila","necompresibil"],"necompresibile":"necompresibil","necompresibilele":"necompresibil","necompresibili":"necompresibil","necompresibilii":"necompresibil","necompresibilitatea":"necompresibilitate","necompresibilitati":"necompresibilitate","necompresibilitatii":"necompresibilitate","necompresibilul":"necompresibil","necomunicata":["necomunicată","necomunicat","necomunicata","necomunicat"],"necomunicate":"necomunicat","necomunicatele":"necomunicat","necomunicati":"necomunicat","necomunicatii":"necomunicat","necomunicativa":["necomunicativă","necomunicativ","necomunicativa","necomunicativ"],"necomunicative":"necomunicativ","necomunicativele":"necomunicativ","necomunicativi":"necomunicativ","necomunicativii":"necomunicativ","necomunicativul":"necomunicativ","necomunicatul":"necomunicat","necomutabila":["necomutabilă","necomutabil","necomutabila","necomutabil"],"necomutabile":"necomutabil","necomutabilele":"necomutabil","necomutabili":"necomutabil","necomutabilii":"necomutabil","necomutabilul":"necomutabil","neconciliabila":["neconciliabilă","neconciliabil","neconciliabila","neconciliabil"],"neconciliabile":"neconciliabil","neconciliabilele":"neconciliabil","neconciliabili":"neconciliabil","neconciliabilii":"neconciliabil","neconciliabilul":"neconciliabil","neconcludenta":["neconcludentă","neconcludent","neconcludenta","neconcludent"],"neconcludente":"neconcludent","neconcludentele":"neconcludent","neconcludenti":"neconcludent","neconcludentii":"neconcludent","neconcludentul":"neconcludent","neconcordanta":["neconcordantă","neconcordant","neconcordanta","neconcordant"],"neconcordante":"neconcordant","neconcordantele":"neconcordant","neconcordanti":"neconcordant","neconcordantii":"neconcordant","neconcordantul":"neconcordant","neconditionata":["necondiționată","necondiționat","necondiționata","necondiționat"],"neconditionate":"necondiționat","neconditionatele":"necondiționat","neconditionati":"necondiționat","neconditionatii":"necondiționat","neconditionatul":"necondiționat","neconformismul":"neconformism","neconformismule":"neconformism","neconformismului":"neconformism","neconformiste":"neconformistă","neconformistei":"neconformistă","neconformistele":"neconformistă","neconformistelor":"neconformistă","neconformisti":"neconformist","neconformistii":"neconformist","neconformistilor":"neconformist","neconformistul":"neconformist","neconformistule":"neconformist","neconformistului":"neconformist","neconfortabila":["neconfortabilă","neconfortabil","neconfortabila","neconfortabil"],"neconfortabile":"neconfortabil","neconfortabilele":"neconfortabil","neconfortabili":"neconfortabil","neconfortabilii":"neconfortabil","neconfortabilul":"neconfortabil","necongelata":["necongelată","necongelat","necongelata","necongelat"],"necongelate":"necongelat","necongelatele":"necongelat","necongelati":"necongelat","necongelatii":"necongelat","necongelatul":"necongelat","neconsecinte":"neconsecință","neconsecintei":"neconsecință","neconsecintele":"neconsecință","neconsecintelor":"neconsecință","neconsecventa":["neconsecventă","neconsecvent","neconsecventa","neconsecvent"],"neconsecvente":["neconsecvente","neconsecvent","neconsecvențe","neconsecvență"],"neconsecventei":"neconsecvență","neconsecventele":["neconsecventele","neconsecvent","neconsecvențele","neconsecvență"],"neconsecventelor":"neconsecvență","neconsecventi":"neconsecvent","neconsecventii":"neconsecvent","neconsecventul":"neconsecvent","neconsistenta":["neconsistentă","neconsistent","neconsistenta","neconsistent"],"neconsistente":"neconsistent","neconsistentele":"neconsistent","neconsistenti":"neconsistent","neconsistentii":"neconsistent","neconsistentul":"neconsistent","neconsolabila":["neconsolabilă","neconsolabil","neconsolabila","neconsolabil"],"neconsolabile":"neconsolabil","neconsolabilele":"neconsolabil","neconsolabili":"neconsolabil"};
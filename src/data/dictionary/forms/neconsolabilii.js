@@ -0,0 +1 @@
+export default {"neconsolabilii":"neconsolabil","neconsolabilul":"neconsolabil","neconstitutionala":["neconstituțională","neconstituțional","neconstituționala","neconstituțional"],"neconstitutionale":"neconstituțional","neconstitutionalele":"neconstituțional","neconstitutionali":"neconstituțional","neconstitutionalii":"neconstituțional","neconstitutionalul":"neconstituțional","necontenirea":"necontenire","neconteniri":"necontenire","necontenirii":"necontenire","necontenirile":"necontenire","necontenirilor":"necontenire","necontenita":["necontenită","necontenit","necontenita","necontenit"],"necontenite":"necontenit","necontenitele":"necontenit","neconteniti":"necontenit","necontenitii":"necontenit","necontenitul":"necontenit","necontestabila":["necontestabilă","necontestabil","necontestabila","necontestabil"],"necontestabile":"necontestabil","necontestabilele":"necontestabil","necontestabili":"necontestabil","necontestabilii":"necontestabil","necontestabilul":"necontestabil","necontestata":["necontestată","necontestat","necontestata","necontestat"],"necontestate":"necontestat","necontestatele":"necontestat","necontestati":"necontestat","necontestatii":"necontestat","necontestatul":"necontestat","necontrolata":["necontrolată","necontrolat","necontrolata","necontrolat"],"necontrolate":"necontrolat","necontrolatele":"necontrolat","necontrolati":"necontrolat","necontrolatii":"necontrolat","necontrolatul":"necontrolat","neconturata":["neconturată","neconturat","neconturata","neconturat"],"neconturate":"neconturat","neconturatele":"neconturat","neconturati":"neconturat","neconturatii":"neconturat","neconturatul":"neconturat","neconvenabila":["neconvenabilă","neconvenabil","neconvenabila","neconvenabil"],"neconvenabile":"neconvenabil","neconvenabilele":"neconvenabil","neconvenabili":"neconvenabil","neconvenabilii":"neconvenabil","neconvenabilul":"neconvenabil","neconventionala":["neconvențională","neconvențional","neconvenționala","neconvențional"],"neconventionale":"neconvențional","neconventionalele":"neconvențional","neconventionali":"neconvențional","neconventionalii":"neconvențional","neconventionalul":"neconvențional","neconvertibila":["neconvertibilă","neconvertibil","neconvertibila","neconvertibil"],"neconvertibile":"neconvertibil","neconvertibilele":"neconvertibil","neconvertibili":"neconvertibil","neconvertibilii":"neconvertibil","neconvertibilul":"neconvertibil","neconvingatoare":"neconvingător","neconvingatoarea":"neconvingător","neconvingatoarele":"neconvingător","neconvingatori":"neconvingător","neconvingatorii":"neconvingător","neconvingatorul":"neconvingător","necoordonarea":"necoordonare","necoordonari":["necoordonări","necoordonare","necoordonari","necoordonare"],"necoordonarii":"necoordonare","necoordonarile":"necoordonare","necoordonarilor":"necoordonare","necoordonata":["necoordonată","necoordonat","necoordonata","necoordonat"],"necoordonate":"necoordonat","necoordonatele":"necoordonat","necoordonati":"necoordonat","necoordonatii":"necoordonat","necoordonatul":"necoordonat","necopti":"necopt","necoptii":"necopt","necoptul":"necopt","necorectitudinea":"necorectitudine","necorectitudini":"necorectitudine","necorectitudinii":"necorectitudine","necorectitudinile":"necorectitudine","necorectitudinilor":"necorectitudine","necorespunzatoare":"necorespunzător","necorespunzatoarea":"necorespunzător","necorespunzatoarele":"necorespunzător","necorespunzatori":"necorespunzător","necorespunzatorii":"necorespunzător","necorespunzatorul":"necorespunzător","necrectomia":"necrectomie","necrectomiei":"necrectomie","necrectomii":"necrectomie","necrectomiile":"necrectomie","necrectomiilor":"necrectomie","necredincioase":"necredincioasă","necredincioasei":"necredincioasă","necredincioasele":"necredincioasă","necredincioaselor":"necredincioasă","necredinciosi":"necredincios","necredinciosii":"necredincios","necredinciosilor":"necredincios","necredinciosirea":"necredincioșire","necredinciosiri":"necredincioșire","necredinciosirii":"necredincioșire","necredinciosirile":"necredincioșire","necredinciosirilor":"necredincioșire","necredinciosul":"necredincios","necredinciosule":"necredincios","necredinciosului":"necredincios","necredinte":"necredință","necredintei":"necredință","necredintele":"necredință","necredintelor":"necredință","necrestina":["necreștină","necreștin","necreștina","necreștin"],"necrestine":"necreștin","necrestinele":"necreștin","necrestini":"necreștin","necrestinii":"necreștin","necrestinul":"necreștin","necrezarea":"necrezare","necrezari":"necrezare","necrezarii":"necrezare","necrezuta":["necrezută","necrezut","necrezuta","necrezut"],"necrezute":"necrezut","necrezutele":"necrezut","necrezuti":"necrezut","necrezutii":"necrezut","necrezutul":"necrezut","necristalizata":["necristalizată","necristalizat","necristalizata","necristalizat"],"necristalizate":"necristalizat","necristalizatele":"necristalizat","necristalizati":"necristalizat","necristalizatii":"necristalizat","necristalizatul":"necristalizat","necrobacili":"necrobacil","necrobacilile":"necrobacil","necrobacililor":"necrobacil","necrobaciloze":"necrobaciloză","necrobacilozei":"necrobaciloză","necrobacilozele":"necrobaciloză","necrobacilozelor":"necrobaciloză","necrobacilul":"necrobacil","necrobacilule":"necrobacil","necrobacilului":"necrobacil","necrobia":"necrobie","necrobiei":"necrobie","necrobii":"necrobie","necrobiile":"necrobie","necrobiilor":"necrobie","necrobiotica":["necrobiotică","necrobiotic","necrobiotica","necrobiotic"],"necrobiotice":"necrobiotic","necrobioticele":"necrobiotic","necrobiotici":"necrobiotic","necrobioticii":"necrobiotic","necrobioticul":"necrobiotic","necrobioze":"necrobioză","necrobiozei":"necrobioză","necrobiozele":"necrobioză","necrobiozelor":"necrobioză","necrofage":"necrofagă","necrofagei":"necrofagă","necrofagele":"necrofagă","necrofagelor":"necrofagă","necrofagi":"necrofag","necrofagia":"necrofagie","necrofagiei":"necrofagie","necrofagii":["necrofagii","necrofag","necrofagii","necrofagie"],"necrofagilor":"necrofag","necrofagul":"necrofag","necrofagule":"necrofag","necrofagului":"necrofag","necrofile":"necrofilă","necrofilei":"necrofilă","necrofilele":"necrofilă","necrofilelor":"necrofilă","necrofili":"necrofil","necrofilia":"necrofilie","necrofiliei":"necrofilie","necrofilii":["necrofilii","necrofil","necrofilii","necrofilie"],"necrofiliile":"necrofilie","necrofiliilor":"necrofilie","necrofililor":"necrofil","necrofilul":"necrofil","necrofilule":"necrofil","necrofilului":"necrofil","necrofobe":"necrofobă","necrofobei":"necrofobă","necrofobele":"necrofobă","necrofobelor":"necrofobă","necrofobi":"necrofob","necrofobia":"necrofobie","necrofobiei":"necrofobie","necrofobii":["necrofobii","necrofob","necrofobii","necrofobie"],"necrofobiile":"necrofobie","necrofobiilor":"necrofobie","necrofobilor":"necrofob","necrofobul":"necrofob","necrofobule":"necrofob","necrofobului":"necrofob","necrofori":"necrofor","necroforii":"necrofor","necroforilor":"necrofor","necroforul":"necrofor","necroforule":"necrofor","necroforului":"necrofor","necrolatri":"necrolatru","necrolatria":"necrolatrie","necrolatriei":"necrolatrie","necrolatrii":["necrolatrii","necrolatrie","necrolatrii","necrolatru"],"necrolatriile":"necrolatrie","necrolatriilor":"necrolatrie","necrolatrilor":"necrolatru","necrolatruul":"necrolatru","necrolatruule":"necrolatru","necrolatruului":"necrolatru","necrologe":"necrolog","necrologele":"necrolog","necrologelor":"necrolog","necrologia":"necrologie","necrologica":["necrologică","necrologic","necrologica","necrologic"],"necrologice":"necrologic","necrologicele":"necrologic","necrologici":"necrologic","necrologicii":"necrologic","necrologicul":"necrologic","necrologiei":"necrologie","necrologii":"necrologie","necrologiile":"necrologie","necrologiilor":"necrologie","necrologul":"necrolog","necrologule":"necrolog","necrologului":"necrolog","necrologuri":"necrolog","necroman":"necromant","necromancianul":"necromancian","necromancianule":"necromancian","necromancianului":"necromancian","necromancieni":"necromancian","necromancienii":"necromancian","necromancienilor":"necromancian","necromane":"necromană","necromanei":"necromană","necromanele":"necromană","necromanelor":"necromană","necromani":"necroman","necromania":"necromanie","necromaniei":"necromanie","necromanii":["necromanii","necroman","necromanii","necromanie"],"necromaniile":"necromanie","necromaniilor":"necromanie","necromanilor":"necroman","necromante":"necromantă","necromantei":"necromantă","necromantele":"necromantă","necromantelor":"necromantă","necromanti":"necromant","necromantia":"necromanție","necromantica":["necromantică","necromantic","necromantica","necromantic"],"necromantice":"necromantic","necromanticele":"necromantic","necromantici":"necromantic","necromanticii":"necromantic","necromanticul":"necromantic","necromantiei":"necromanție","necromantii":["necromanții","necromant","necromanții","necromanție"],"necromantiile":"necromanție","necromantiilor":"necromanție","necromantilor":"necromant","necromantul":"necromant","necromantule":"necromant","necromantului":"necromant","necromanul":"necroman","necromanule":"necroman","necromanului":"necroman","necropole":"necropolă","necropolei":"necropolă","necropolele":"necropolă","necropolelor":"necropolă","necropsia":"necropsie","necropsica":["necropsică","necropsic","necropsica","necropsic"],"necropsice":"necropsic","necropsicele":"necropsic","necropsici":"necropsic","necropsicii":"necropsic","necropsicul":"necropsic","necropsiei":"necropsie","necropsii":"necropsie","necropsiile":"necropsie","necropsiilor":"necropsie","necrosadismul":"necrosadism","necrosadismule":"necrosadism","necrosadismului":"necrosadism","necrospermia":"necrospermie","necrospermiei":"necrospermie","necrospermii":"necrospermie","necrospermiile":"necrospermie","necrospermiilor":"necrospermie","necrotica":["necrotică","necrotic","necrotica","necrotic"],"necrotice":"necrotic","necroticele":"necrotic","necrotici":"necrotic","necroticii":"necrotic","necroticul":"necrotic","necrotomia":"necrotomie","necrotomiei":"necrotomie","necrotomii":"necrotomie","necrotomiile":"necrotomie","necrotomiilor":"necrotomie","necroz":"necroza","necrozai":"necroza","necrozam":["necrozăm","necroza","necrozam","necroza"],"necrozand":"necroza","necrozara":"necroza","necrozaram":"necroza","necrozarati":"necroza","necrozarea":"necrozare","necrozari":"necrozare","necrozarii":"necrozare","necrozarile":"necrozare","necrozarilor":"necrozare","necrozase":"necroza","necrozasem":"necroza","necrozasera":"necroza","necrozaseram":"necroza","necrozaserati":"necroza","necrozasesi":"necroza","necrozasi":"necroza","necrozat":"necroza","necrozata":["necrozată","necrozat","necrozata","necrozat"],"necrozate":"necrozat","necrozatele":"necrozat","necrozati":["necrozați","necroza","necrozați","necrozat"],"necrozatii":"necrozat","necrozatul":"necrozat","necrozau":"necroza","necroze":"necroză","necrozeaza":"necroza","necrozei":"necroză","necrozele":"necroză","necrozelor":"necroză","necrozi":"necroza","necrutatoare":"necruțător","necrutatoarea":"necruțător","necrutatoarele":"necruțător","necrutatori":"necruțător","necrutatorii":"necruțător","necrutatorul":"necruțător","nectaria":"nectarie","nectariei":"nectarie","nectarifera":["nectariferă","nectarifer","nectarifera","nectarifer"],"nectarifere":"nectarifer","nectariferele":"nectarifer","nectariferi":"nectarifer","nectariferii":"nectarifer","nectariferul":"nectarifer","nectarii":"nectarie","nectariile":"nectarie","nectariilor":"nectarie","nectarine":"nectarină","nectarinei":"nectarină","nectarinele":"nectarină","nectarinelor":"nectarină","nectarul":"nectar","nectarule":"nectar","nectarului":"nectar","nectaruri":"nectar","nectarurile":"nectar","nectarurilor":"nectar","nectonul":"necton","nectonule":"necton","nectonului":"necton","necugetarea":"necugetare","necugetari":"necugetare","necugetarii":"necugetare","necugetata":["necugetată","necugetat","necugetata","necugetat"],"necugetate":"necugetat","necugetatele":"necugetat","necugetati":"necugetat","necugetatii":"necugetat","necugetatul":"necugetat","necultivata":["necultivată","necultivat","necultivata","necultivat"],"necultivate":"necultivat","necultivatele":"necultivat","necultivati":"necultivat","necultivatii":"necultivat","necultivatul":"necultivat","necumpanirea":"necumpănire","necumpaniri":"necumpănire","necumpanirii":"necumpănire","necumpanirile":"necumpănire","necumpanirilor":"necumpănire","necumpatata":["necumpătată","necumpătat","necumpătata","necumpătat"],"necumpatate":"necumpătat","necumpatatele":"necumpătat","necumpatati":"necumpătat","necumpatatii":"necumpătat","necumpatatul":"necumpătat","necunoasterea":"necunoaștere","necunoasteri":"necunoaștere","necunoasterii":"necunoaștere","necunoasterile":"necunoaștere","necunoasterilor":"necunoaștere","necunoscatoare":"necunoscător","necunoscatoarea":"necunoscător","necunoscatoarele":"necunoscător","necunoscatori":"necunoscător","necunoscatorii":"necunoscător","necunoscatorul":"necunoscător","necunoscuta":["necunoscută","necunoscut","necunoscuta","necunoscut"],"necunoscute":["necunoscute","necunoscut","necunoscute","necunoscută"],"necunoscutei":"necunoscută","necunoscutele":["necunoscutele","necunoscut","necunoscutele","necunoscută"],"necunoscutelor":"necunoscută","necunoscuti":"necunoscut","necunoscutii":"necunoscut","necunoscutul":"necunoscut","necuprinsi":"necuprins","necuprinsile":"necuprins","necuprinsilor":"necuprins","necuprinsul":"necuprins","necuprinsule":"necuprins","necuprinsului":"necuprins","necuraciunea":"necurăciune","necuraciuni":"necurăciune","necuraciunii":"necurăciune","necuraciunile":"necurăciune","necuraciunilor":"necurăciune","necurata":["necurată","necurat","necurata","necurat"],"necuratata":["necurățată","necurățat","necurățata","necurățat"],"necuratate":"necurățat","necuratatele":"necurățat","necuratati":"necurățat","necuratatii":"necurățat","necuratatul":"necurățat","necurate":"necurat","necuratea":"necurăți","necurateai":"necurăți","necurateam":"necurăți","necurateati":"necurăți","necurateau":"necurăți","necuratele":"necurat","necuratenia":"necurățenie","necurateniei":"necurățenie","necuratenii":"necurățenie","necurateniile":"necurățenie","necurateniilor":"necurățenie","necuratesc":"necurăți","necurateste":"necurăți","necuratesti":"necurăți","necurati":"necurat","necuratia":"necurăție","necuratiei":"necurăție","necuratii":["necurații","necurat","necurății","necurăți","necurății","necurăție"],"necuratiile":"necurăție","necuratiilor":"necurăție","necuratim":"necurăți","necuratimea":"necurățime","necuratimi":"necurățime","necuratimii":"necurățime","necuratimile":"necurățime","necuratimilor":"necurățime","necuratind":"necurăți","necuratira":"necurăți","necuratiram":"necurăți","necuratirati":"necurăți","necuratirea":"necurățire","necuratiri":"necurățire","necuratirii":"necurățire","necuratirile":"necurățire","necuratirilor":"necurățire","necuratise":"necurăți","necuratisem":"necurăți","necuratisera":"necurăți","necuratiseram":"necurăți","necuratiserati":"necurăți","necuratisesi":"necurăți","necuratisi":"necurăți","necuratit":"necurăți","necuratiti":"necurăți","necuratitori":"necurățitor","necuratitorii":"necurățitor","necuratitorilor":"necurățitor","necuratitorul":"necurățitor","necuratitorule":"necurățitor","necuratitorului":"necurățitor","necuratul":"necurat","necurmata":["necurmată","necurmat","necurmata","necurmat"],"necurmate":"necurmat","necurmatele":"necurmat","necurmati":"necurmat","necurmatii":"necurmat","necurmatul":"necurmat","necuvantatoare":"necuvântător","necuvantatoarea":"necuvântător","necuvantatoarele":"necuvântător","necuvantatori":"necuvântător","necuvantatorii":"necuvântător","necuvantatorul":"necuvântător","necuviincioasa":["necuviincioasă","necuviincios","necuviincioasa","necuviincios"],"necuviincioase":"necuviincios","necuviincioasele":"necuviincios","necuviinciosi":"necuviincios","necuviinciosii":"necuviincios","necuviinciosul":"necuviincios","necuviinte":"necuviință","necuviintei":"necuviință","necuviintele":"necuviință","necuviintelor":"necuviință","necuvioasa":["necuvioasă","necuvios","necuvioasa","necuvios"],"necuvioase":"necuvios","necuvioasele":"necuvios","necuviosi":"necuvios","necuviosii":"necuvios","necuviosul":"necuvios","nedecapotabila":["nedecapotabilă","nedecapotabil","nedecapotabila","nedecapotabil"],"nedecapotabile":"nedecapotabil","nedecapotabilele":"nedecapotabil","nedecapotabili":"nedecapotabil","nedecapotabilii":"nedecapotabil","nedecapotabilul":"nedecapotabil","nedeclinabila":["nedeclinabilă","nedeclinabil","nedeclinabila","nedeclinabil"],"nedeclinabile":"nedeclinabil","nedeclinabilele":"nedeclinabil","nedeclinabili":"nedeclinabil","nedeclinabilii":"nedeclinabil","nedeclinabilul":"nedeclinabil","nedecolorata":["nedecolorată","nedecolorat","nedecolorata","nedecolorat"],"nedecolorate":"nedecolorat","nedecoloratele":"nedecolorat","nedecolorati":"nedecolorat","nedecoloratii":"nedecolorat","nedecoloratul":"nedecolorat","nedefinibila":["nedefinibilă","nedefinibil","nedefinibila","nedefinibil"],"nedefinibile":"nedefinibil","nedefinibilele":"nedefinibil","nedefinibili":"nedefinibil","nedefinibilii":"nedefinibil","nedefinibilul":"nedefinibil","nedefinita":["nedefinită","nedefinit","nedefinita","nedefinit"],"nedefinite":"nedefinit","nedefinitele":"nedefinit","nedefiniti":"nedefinit","nedefinitii":"nedefinit","nedefinitul":"nedefinit","nedeformabila":["nedeformabilă","nedeformabil","nedeformabila","nedeformabil"],"nedeformabile":"nedeformabil","nedeformabilele":"nedeformabil","nedeformabili":"nedeformabil","nedeformabilii":"nedeformabil","nedeformabilul":"nedeformabil","nedefrisabila":["nedefrișabilă","nedefrișabil","nedefrișabila","nedefrișabil"],"nedefrisabile":"nedefrișabil","nedefrisabilele":"nedefrișabil","nedefrisabili":"nedefrișabil","nedefrisabilii":"nedefrișabil","nedefrisabilul":"nedefrișabil","nedeiea":"nedeie","nedeiei":"nedeie","nedeiele":"nedeie","nedeielor":"nedeie","nedelicata":["nedelicată","nedelicat","nedelicata","nedelicat"],"nedelicate":"nedelicat","nedelicatele":"nedelicat","nedelicatete":"nedelicateță","nedelicatetea":"nedelicatețe","nedelicatetei":"nedelicateță","nedelicatetele":"nedelicateță","nedelicatetelor":"nedelicateță","nedelicateti":"nedelicatețe","nedelicatetii":"nedelicatețe","nedelicatetile":"nedelicatețe","nedelicatetilor":"nedelicatețe","nedelicati":"nedelicat","nedelicatii":"nedelicat","nedelicatul":"nedelicat","nedemna":["nedemnă","nedemn","nedemna","nedemn"],"nedemne":"nedemn","nedemnele":"nedemn","nedemni":"nedemn","nedemnii":"nedemn","nedemnul":"nedemn","nedemonstrabila":["nedemonstrabilă","nedemonstrabil","nedemonstrabila","nedemonstrabil"],"nedemonstrabile":"nedemonstrabil","nedemonstrabilele":"nedemonstrabil","nedemonstrabili":"nedemonstrabil","nedemonstrabilii":"nedemonstrabil","nedemonstrabilul":"nedemonstrabil","nedependente":"nedependență","nedependentei":"nedependență","nedeprinsa":["nedeprinsă","nedeprins","nedeprinsa","nedeprins"],"nedeprinse":"nedeprins","nedeprinsele":"nedeprins","nedeprinsi":"nedeprins","nedeprinsii":"nedeprins","nedeprinsul":"nedeprins","nederi":"neder","nederii":"neder","nederilor":"neder","nederul":"neder","nederule":"neder","nederului":"neder","nedesavarsirea":"nedesăvârșire","nedesavarsiri":"nedesăvârșire","nedesavarsirii":"nedesăvârșire","nedesavarsirile":"nedesăvârșire","nedesavarsirilor":"nedesăvârșire","nedescifrabila":["nedescifrabilă","nedescifrabil","nedescifrabila","nedescifrabil"],"nedescifrabile":"nedescifrabil","nedescifrabilele":"nedescifrabil","nedescifrabili":"nedescifrabil","nedescifrabilii":"nedescifrabil","nedescifrabilul":"nedescifrabil","nedesirabila":["nedeșirabilă","nedeșirabil","nedeșirabila","nedeșirabil"],"nedesirabile":"nedeșirabil","nedesirabilele":"nedeșirabil","nedesirabili":"nedeșirabil","nedesirabilii":"nedeșirabil","nedesirabilul":"nedeșirabil","nedeslusirea":"nedeslușire","nedeslusiri":"nedeslușire","nedeslusirii":"nedeslușire","nedeslusirile":"nedeslușire","nedeslusirilor":"nedeslușire","nedeslusita":["nedeslușită","nedeslușit","nedeslușita","nedeslușit"],"nedeslusite":"nedeslușit","nedeslusitele":"nedeslușit","nedeslusiti":"nedeslușit","nedeslusitii":"nedeslușit","nedeslusitul":"nedeslușit","nedespartita":["nedespărțită","nedespărțit","nedespărțita","nedespărțit"],"nedespartite":"nedespărțit","nedespartitele":"nedespărțit","nedespartiti":"nedespărțit","nedespartitii":"nedespărțit","nedespartitul":"nedespărțit","nedeterminabila":["nedeterminabilă","nedeterminabil","nedeterminabila","nedeterminabil"],"nedeterminabile":"nedeterminabil","nedeterminabilele":"nedeterminabil","nedeterminabili":"nedeterminabil","nedeterminabilii":"nedeterminabil","nedeterminabilul":"nedeterminabil","nedeterminarea":"nedeterminare","nedeterminari":["nedeterminări","nedeterminare","nedeterminari","nedeterminare"],"nedeterminarii":"nedeterminare","nedeterminarile":"nedeterminare","nedeterminarilor":"nedeterminare","nedeterminata":["nedeterminată","nedeterminat","nedeterminata","nedeterminat"],"nedeterminate":"nedeterminat","nedeterminatele":"nedeterminat","nedeterminati":"nedeterminat","nedeterminatii":"nedeterminat","nedeterminatul":"nedeterminat","nedezinfectata":["nedezinfectată","nedezinfectat","nedezinfectata","nedezinfectat"],"nedezinfectate":"nedezinfectat","nedezinfectatele":"nedezinfectat","nedezinfectati":"nedezinfectat","nedezinfectatii":"nedezinfectat","nedezinfectatul":"nedezinfectat","nedezlegata":["nedezlegată","nedezlegat","nedezlegata","nedezlegat"],"nedezlegate":"nedezlegat","nedezlegatele":"nedezlegat","nedezlegati":"nedezlegat","nedezlegatii":"nedezlegat","nedezlegatul":"nedezlegat","nedezlipita":["nedezlipită","nedezlipit","nedezlipita","nedezlipit"],"nedezlipite":"nedezlipit","nedezlipitele":"nedezlipit","nedezlipiti":"nedezlipit","nedezlipitii":"nedezlipit","nedezlipitul":"nedezlipit","nedezmintita":["nedezmințită","nedezmințit","nedezmințita","nedezmințit"],"nedezmintite":"nedezmințit","nedezmintitele":"nedezmințit","nedezmintiti":"nedezmințit","nedezmintitii":"nedezmințit","nedezmintitul":"nedezmințit","nediferentiata":["nediferențiată","nediferențiat","nediferențiata","nediferențiat"],"nediferentiate":"nediferențiat","nediferentiatele":"nediferențiat","nediferentiati":"nediferențiat","nediferentiatii":"nediferențiat","nediferentiatul":"nediferențiat","nedigestia":"nedigestie","nedigestiei":"nedigestie","nedigestii":"nedigestie","nedigestiile":"nedigestie","nedigestiilor":"nedigestie","nedintirea":"nedințire","nedintiri":"nedințire","nedintirii":"nedințire","nedintirile":"nedințire","nedintirilor":"nedințire","nedisciplinata":["nedisciplinată","nedisciplinat","nedisciplinata","nedisciplinat"],"nedisciplinate":"nedisciplinat","nedisciplinatele":"nedisciplinat","nedisciplinati":"nedisciplinat","nedisciplinatii":"nedisciplinat","nedisciplinatul":"nedisciplinat","nediseminarea":"nediseminare","nediseminari":["nediseminări","nediseminare","nediseminari","nediseminare"],"nediseminarii":"nediseminare","nediseminarile":"nediseminare","nediseminarilor":"nediseminare","nedispusa":["nedispusă","nedispus","nedispusa","nedispus"],"nedispuse":"nedispus","nedispusele":"nedispus","nedispusi":"nedispus","nedispusii":"nedispus","nedispusul":"nedispus","nedistribuita":["nedistribuită","nedistribuit","nedistribuita","nedistribuit"],"nedistribuite":"nedistribuit","nedistribuitele":"nedistribuit","nedistribuiti":"nedistribuit","nedistribuitii":"nedistribuit","nedistribuitul":"nedistribuit","nedivizata":["nedivizată","nedivizat","nedivizata","nedivizat"],"nedivizate":"nedivizat","nedivizatele":"nedivizat","nedivizati":"nedivizat","nedivizatii":"nedivizat","nedivizatul":"nedivizat","nedivizibila":["nedivizibilă","nedivizibil","nedivizibila","nedivizibil"],"nedivizibile":"nedivizibil","nedivizibilele":"nedivizibil","nedivizibili":"nedivizibil","nedivizibilii":"nedivizibil","nedivizibilul":"nedivizibil","nedizolvata":["nedizolvată","nedizolvat","nedizolvata","nedizolvat"],"nedizolvate":"nedizolvat","nedizolvatele":"nedizolvat","nedizolvati":"nedizolvat","nedizolvatii":"nedizolvat","nedizolvatul":"nedizolvat","nedomolita":["nedomolită","nedomolit","nedomolita","nedomolit"],"nedomolite":"nedomolit","nedomolitele":"nedomolit","nedomoliti":"nedomolit","nedomolitii":"nedomolit","nedomolitul":"nedomolit","nedorita":["nedorită","nedorit","nedorita","nedorit"],"nedorite":"nedorit","nedoritele":"nedorit","nedoriti":"nedorit","nedoritii":"nedorit","nedoritul":"nedorit","nedormirea":"nedormire","nedormiri":"nedormire","nedormirii":"nedormire","nedormirile":"nedormire","nedormirilor":"nedormire","nedormita":["nedormită","nedormit","nedormita","nedormit"],"nedormite":"nedormit","nedormitele":"nedormit","nedormiti":"nedormit","nedormitii":"nedormit","nedormitul":"nedormit","nedospita":["nedospită","nedospit","nedospita","nedospit"],"nedospite":"nedospit","nedospitele":"nedospit","nedospiti":"nedospit","nedospitii":"nedospit","nedospitul":"nedospit","nedreapta":["nedreaptă","nedrept","nedreapta","nedrept"],"nedreptatea":"nedreptăți","nedreptateai":"nedreptăți","nedreptateam":"nedreptăți","nedreptateati":"nedreptăți","nedreptateau":"nedreptăți","nedreptatesc":"nedreptăți","nedreptateste":"nedreptăți","nedreptatesti":"nedreptăți","nedreptati":"nedreptate","nedreptatii":"nedreptăți","nedreptatim":"nedreptăți","nedreptatind":"nedreptăți","nedreptatira":"nedreptăți","nedreptatiram":"nedreptăți","nedreptatirati":"nedreptăți","nedreptatirea":"nedreptățire","nedreptatiri":"nedreptățire","nedreptatirii":"nedreptățire","nedreptatirile":"nedreptățire","nedreptatirilor":"nedreptățire","nedreptatise":"nedreptăți","nedreptatisem":"nedreptăți","nedreptatisera":"nedreptăți","nedreptatiseram":"nedreptăți","nedreptatiserati":"nedreptăți","nedreptatisesi":"nedreptăți","nedreptatisi":"nedreptăți","nedreptatit":"nedreptăți","nedreptatita":["nedreptățită","nedreptățit","nedreptățita","nedreptățit"],"nedreptatite":"nedreptățit","nedreptatitele":"nedreptățit","nedreptatiti":["nedreptățiți","nedreptăți","nedreptățiți","nedreptățit"],"nedreptatitii":"nedreptățit","nedreptatitul":"nedreptățit","nedrepte":"nedrept","nedreptele":"nedrept","nedrepti":"nedrept","nedreptii":"nedrept","nedreptul":"nedrept","nedumerea":"nedumeri","nedumereai":"nedumeri","nedumeream":"nedumeri","nedumereati":"nedumeri","nedumereau":"nedumeri","nedumeresc":"nedumeri","nedumereste":"nedumeri","nedumeresti":"nedumeri","nedumerii":"nedumeri","nedumerim":"nedumeri","nedumerind":"nedumeri","nedumerira":"nedumeri","nedumeriram":"nedumeri","nedumerirati":"nedumeri","nedumerirea":"nedumerire","nedumeriri":"nedumerire","nedumeririi":"nedumerire","nedumeririle":"nedumerire","nedumeririlor":"nedumerire","nedumerise":"nedumeri","nedumerisem":"nedumeri","nedumerisera":"nedumeri","nedumeriseram":"nedumeri","nedumeriserati":"nedumeri","nedumerisesi":"nedumeri","nedumerisi":"nedumeri","nedumerit":"nedumeri","nedumerita":["nedumerită","nedumerit","nedumerita","nedumerit"],"nedumerite":"nedumerit","nedumeritele":"nedumerit","nedumeriti":["nedumeriți","nedumeri","nedumeriți","nedumerit"],"nedumeritii":"nedumerit","nedumeritul":"nedumerit","nedumirea":"nedumiri","nedumireai":"nedumiri","nedumiream":"nedumiri","nedumireati":"nedumiri","nedumireau":"nedumiri","nedumiresc":"nedumiri","nedumireste":"nedumiri","nedumiresti":"nedumiri","nedumirii":"nedumiri","nedumirim":"nedumiri","nedumirind":"nedumiri","nedumirira":"nedumiri","nedumiriram":"nedumiri","nedumirirati":"nedumiri","nedumirise":"nedumiri","nedumirisem":"nedumiri","nedumirisera":"nedumiri","nedumiriseram":"nedumiri","nedumiriserati":"nedumiri","nedumirisesi":"nedumiri","nedumirisi":"nedumiri","nedumirit":"nedumiri","nedumirita":["nedumirită","nedumirit","nedumirita","nedumirit"],"nedumirite":"nedumirit","nedumiritele":"nedumirit","nedumiriti":["nedumiriți","nedumiri","nedumiriți","nedumirit"],"nedumiritii":"nedumirit","nedumiritul":"nedumirit","nedureroasa":["nedureroasă","nedureros","nedureroasa","nedureros"],"nedureroase":"nedureros","nedureroasele":"nedureros","nedurerosi":"nedureros","nedurerosii":"nedureros","nedurerosul":"nedureros","neechilibrata":["neechilibrată","neechilibrat","neechilibrata","neechilibrat"],"neechilibrate":"neechilibrat","neechilibratele":"neechilibrat","neechilibrati":"neechilibrat","neechilibratii":"neechilibrat","neechilibratul":"neechilibrat","neechitabila":["neechitabilă","neechitabil","neechitabila","neechitabil"],"neechitabile":"neechitabil","neechitabilele":"neechitabil","neechitabili":"neechitabil","neechitabilii":"neechitabil","neechitabilul":"neechitabil","neechitatea":"neechitate","neechitati":"neechitate","neechitatii":"neechitate","neechitatile":"neechitate","neechitatilor":"neechitate","neeconomica":["neeconomică","neeconomic","neeconomica","neeconomic"],"neeconomice":"neeconomic","neeconomicele":"neeconomic","neeconomici":"neeconomic","neeconomicii":"neeconomic","neeconomicoasa":["neeconomicoasă","neeconomicos","neeconomicoasa","neeconomicos"],"neeconomicoase":"neeconomicos","neeconomicoasele":"neeconomicos","neeconomicosi":"neeconomicos","neeconomicosii":"neeconomicos","neeconomicosul":"neeconomicos","neeconomicul":"neeconomic","needificatoare":"needificator","needificatoarea":"needificator","needificatoarele":"needificator","needificatori":"needificator","needificatorii":"needificator","needificatorul":"needificator","neefectuata":["neefectuată","neefectuat","neefectuata","neefectuat"],"neefectuate":"neefectuat","neefectuatele":"neefectuat","neefectuati":"neefectuat","neefectuatii":"neefectuat","neefectuatul":"neefectuat","neeficienta":["neeficientă","neeficient","neeficienta","neeficient"],"neeficiente":["neeficiente","neeficient","neeficiențe","neeficiență"],"neeficientei":"neeficiență","neeficientele":["neeficientele","neeficient","neeficiențele","neeficiență"],"neeficientelor":"neeficiență","neeficienti":"neeficient","neeficientii":"neeficient","neeficientul":"neeficient","neegalabila":["neegalabilă","neegalabil","neegalabila","neegalabil"],"neegalabile":"neegalabil","neegalabilele":"neegalabil","neegalabili":"neegalabil","neegalabilii":"neegalabil","neegalabilul":"neegalabil","neegalata":["neegalată","neegalat","neegalata","neegalat"],"neegalate":"neegalat","neegalatele":"neegalat","neegalati":"neegalat","neegalatii":"neegalat","neegalatul":"neegalat","neegalitatea":"neegalitate","neegalitati":"neegalitate","neegalitatii":"neegalitate","neegalitatile":"neegalitate","neegalitatilor":"neegalitate","neeleganta":["neelegantă","neelegant","neeleganta","neelegant"],"neelegante":["neelegante","neelegant","neeleganțe","neeleganță"],"neelegantei":"neeleganță","neelegantele":"neelegant","neeleganti":"neelegant","neelegantii":"neelegant","neelegantul":"neelegant","neeligibila":["neeligibilă","neeligibil","neeligibila","neeligibil"],"neeligibile":"neeligibil","neeligibilele":"neeligibil","neeligibili":"neeligibil","neeligibilii":"neeligibil","neeligibilitatea":"neeligibilitate","neeligibilitati":"neeligibilitate","neeligibilitatii":"neeligibilitate","neeligibilul":"neeligibil","neepuizabila":["neepuizabilă","neepuizabil","neepuizabila","neepuizabil"],"neepuizabile":"neepuizabil","neepuizabilele":"neepuizabil","neepuizabili":"neepuizabil","neepuizabilii":"neepuizabil","neepuizabilul":"neepuizabil","neerlandeza":["neerlandeză","neerlandez","neerlandeza","neerlandez"],"neerlandeze":["neerlandeze","neerlandez","neerlandeze","neerlandeză"],"neerlandezei":"neerlandeză","neerlandezele":["neerlandezele","neerlandez","neerlandezele","neerlandeză"],"neerlandezelor":"neerlandeză","neerlandezi":"neerlandez","neerlandezii":"neerlandez","neerlandezilor":"neerlandez","neerlandezul":"neerlandez","neerlandezule":"neerlandez","neerlandezului":"neerlandez","neesentiala":["neesențială","neesențial","neesențiala","neesențial"],"neesentiale":"neesențial","neesentialele":"neesențial","neesentiali":"neesențial","neesentialii":"neesențial","neesentialul":"neesențial","neestetica":["neestetică","neestetic","neestetica","neestetic"],"neestetice":"neestetic","neesteticele":"neestetic","neestetici":"neestetic","neesteticii":"neestetic","neesteticul":"neestetic","neetansa":["neetanșă","neetanș","neetanșa","neetanș"],"neetanse":"neetanș","neetanseitatea":"neetanșeitate","neetanseitati":"neetanșeitate","neetanseitatii":"neetanșeitate","neetanseitatile":"neetanșeitate","neetanseitatilor":"neetanșeitate","neetansele":"neetanș","neetansi":"neetanș","neetansii":"neetanș","neetansul":"neetanș","neeuclidiana":["neeuclidiană","neeuclidian","neeuclidiana","neeuclidian"],"neeuclidianul":"neeuclidian","neeuclidiene":"neeuclidian","neeuclidienele":"neeuclidian","neeuclidieni":"neeuclidian","neeuclidienii":"neeuclidian","neevaluata":["neevaluată","neevaluat","neevaluata","neevaluat"],"neevaluate":"neevaluat","neevaluatele":"neevaluat","neevaluati":"neevaluat","neevaluatii":"neevaluat","neevaluatul":"neevaluat","neevoluata":["neevoluată","neevoluat","neevoluata","neevoluat"],"neevoluate":"neevoluat","neevoluatele":"neevoluat","neevoluati":"neevoluat","neevoluatii":"neevoluat","neevoluatul":"neevoluat","neexacta":["neexactă","neexact","neexacta","neexact"],"neexacte":"neexact","neexactele":"neexact","neexacti":"neexact","neexactii":"neexact","neexactitatea":"neexactitate","neexactitati":"neexactitate","neexactitatii":"neexactitate","neexactul":"neexact","neexcitabila":["neexcitabilă","neexcitabil","neexcitabila","neexcitabil"],"neexcitabile":"neexcitabil","neexcitabilele":"neexcitabil","neexcitabili":"neexcitabil","neexcitabilii":"neexcitabil","neexcitabilitatea":"neexcitabilitate","neexcitabilitati":"neexcitabilitate","neexcitabilitatii":"neexcitabilitate","neexcitabilul":"neexcitabil","neexecutarea":"neexecutare","neexecutari":"neexecutare","neexecutarii":"neexecutare","neexperimentata":["neexperimentată","neexperimentat","neexperimentata","neexperimentat"],"neexperimentate":"neexperimentat","neexperimentatele":"neexperimentat","neexperimentati":"neexperimentat","neexperimentatii":"neexperimentat","neexperimentatul":"neexperimentat","neexploatata":["neexploatată","neexploatat","neexploatata","neexploatat"],"neexploatate":"neexploatat","neexploatatele":"neexploatat","neexploatati":"neexploatat","neexploatatii":"neexploatat","neexploatatul":"neexploatat","neexplorabila":["neexplorabilă","neexplorabil","neexplorabila","neexplorabil"],"neexplorabile":"neexplorabil","neexplorabilele":"neexplorabil","neexplorabili":"neexplorabil","neexplorabilii":"neexplorabil","neexplorabilul":"neexplorabil","neexplorata":["neexplorată","neexplorat","neexplorata","neexplorat"],"neexplorate":"neexplorat","neexploratele":"neexplorat","neexplorati":"neexplorat","neexploratii":"neexplorat","neexploratul":"neexplorat","neexprimabila":["neexprimabilă","neexprimabil","neexprimabila","neexprimabil"],"neexprimabile":"neexprimabil","neexprimabilele":"neexprimabil","neexprimabili":"neexprimabil","neexprimabilii":"neexprimabil","neexprimabilul":"neexprimabil","nefacuta":["nefăcută","nefăcut","nefăcuta","nefăcut"],"nefacute":"nefăcut","nefacutele":"nefăcut","nefacuti":"nefăcut","nefacutii":"nefăcut","nefacutul":"nefăcut","nefalisme":"nefalism","nefalismele":"nefalism","nefalismelor":"nefalism","nefalismul":"nefalism","nefalismule":"nefalism","nefalismului":"nefalism","nefaliste":"nefalistă","nefalistei":"nefalistă","nefalistele":"nefalistă","nefalistelor":"nefalistă","nefalisti":"nefalist","nefalistii":"nefalist","nefalistilor":"nefalist","nefalistul":"nefalist","nefalistule":"nefalist","nefalistului":"nefalist","nefalsificata":["nefalsificată","nefalsificat","nefalsificata","nefalsificat"],"nefalsificate":"nefalsificat","nefalsificatele":"nefalsificat","nefalsificati":"nefalsificat","nefalsificatii":"nefalsificat","nefalsificatul":"nefalsificat","nefamilista":["nefamilistă","nefamilist","nefamilista","nefamilist"],"nefamiliste":"nefamilist","nefamilistele":"nefamilist","nefamilisti":"nefamilist","nefamilistii":"nefamilist","nefamilistul":"nefamilist","nefaptul":"nefapt","nefaptule":"nefapt","nefaptului":"nefapt","nefartati":"nefârtat","nefartatii":"nefârtat","nefartatilor":"nefârtat","nefartatul":"nefârtat","nefartatule":"nefârtat","nefartatului":"nefârtat","nefasta":["nefastă","nefast","nefasta","nefast"],"nefaste":"nefast","nefastele":"nefast","nefasti":"nefast","nefastii":"nefast","nefastul":"nefast","nefatarita":["nefățărită","nefățărit","nefățărita","nefățărit"],"nefatarite":"nefățărit","nefataritele":"nefățărit","nefatariti":"nefățărit","nefataritii":"nefățărit","nefataritul":"nefățărit","nefavorabila":["nefavorabilă","nefavorabil","nefavorabila","nefavorabil"],"nefavorabile":"nefavorabil","nefavorabilele":"nefavorabil","nefavorabili":"nefavorabil","nefavorabilii":"nefavorabil","nefavorabilul":"nefavorabil","nefelomantia":"nefelomanție","nefelomantiei":"nefelomanție","nefelomantii":"nefelomanție","nefelomantiile":"nefelomanție","nefelomantiilor":"nefelomanție","nefelometre":"nefelometru","nefelometrele":"nefelometru","nefelometrelor":"nefelometru","nefelometria":"nefelometrie","nefelometriei":"nefelometrie","nefelometrii":"nefelometrie","nefelometrul":"nefelometru","nefelometrule":"nefelometru","nefelometrului":"nefelometru","neferi":"nefer","nefericea":"neferici","nefericeai":"neferici","nefericeam":"neferici","nefericeati":"neferici","nefericeau":"neferici","nefericesc":"neferici","nefericeste":"neferici","nefericesti":"neferici","nefericii":"neferici","nefericim":"neferici","nefericind":"neferici","nefericira":"neferici","nefericiram":"neferici","nefericirati":"neferici","nefericirea":"nefericire","nefericiri":"nefericire","nefericirii":"nefericire","nefericirile":"nefericire","nefericirilor":"nefericire","nefericise":"neferici","nefericisem":"neferici","nefericisera":"neferici","nefericiseram":"neferici","nefericiserati":"neferici","nefericisesi":"neferici","nefericisi":"neferici","nefericit":"neferici","nefericita":["nefericită","nefericit","nefericita","nefericit"],"nefericite":"nefericit","nefericitele":"nefericit","nefericiti":["nefericiți","neferici","nefericiți","nefericit"],"nefericitii":"nefericit","nefericitul":"nefericit","neferii":"nefer","neferilor":"nefer","neferoasa":["neferoasă","neferos","neferoasa","neferos"],"neferoase":"neferos","neferoasele":"neferos","neferosi":"neferos","neferosii":"neferos","neferosul":"neferos","nefertila":["nefertilă","nefertil","nefertila","nefertil"],"nefertile":"nefertil","nefertilele":"nefertil","nefertili":"nefertil","nefertilii":"nefertil","nefertilizata":["nefertilizată","nefertilizat","nefertilizata","nefertilizat"],"nefertilizate":"nefertilizat","nefertilizatele":"nefertilizat","nefertilizati":"nefertilizat","nefertilizatii":"nefertilizat","nefertilizatul":"nefertilizat","nefertilul":"nefertil","neferul":"nefer","neferule":"nefer","neferului":"nefer","nefidela":["nefidelă","nefidel","nefidela","nefidel"],"nefidele":"nefidel","nefidelele":"nefidel","nefideli":"nefidel","nefidelii":"nefidel","nefidelul":"nefidel","nefierta":["nefiertă","nefiert","nefierta","nefiert"],"nefierte":"nefiert","nefiertele":"nefiert","nefierti":"nefiert","nefiertii":"nefiert","nefiertul":"nefiert","nefiinte":"neființă","nefiintei":"neființă","nefinalizata":["nefinalizată","nefinalizat","nefinalizata","nefinalizat"],"nefinalizate":"nefinalizat","nefinalizatele":"nefinalizat","nefinalizati":"nefinalizat","nefinalizatii":"nefinalizat","nefinalizatul":"nefinalizat","nefireasca":["nefirească","nefiresc","nefireasca","nefiresc"],"nefirescul":"nefiresc","nefiresti":"nefiresc","nefirestii":"nefiresc","nefirestile":"nefiresc","nefite":"nefiță","nefitei":"nefiță","neflexibila":["neflexibilă","neflexibil","neflexibila","neflexibil"],"neflexibile":"neflexibil","neflexibilele":"neflexibil","neflexibili":"neflexibil","neflexibilii":"neflexibil","neflexibilitatea":"neflexibilitate","neflexibilitati":"neflexibilitate","neflexibilitatii":"neflexibilitate","neflexibilul":"neflexibil","nefolosinte":"nefolosință","nefolosintei":"nefolosință","nefolosintele":"nefolosință","nefolosintelor":"nefolosință","nefolosita":["nefolosită","nefolosit","nefolosita","nefolosit"],"nefolosite":"nefolosit","nefolositele":"nefolosit","nefolositi":"nefolosit","nefolositii":"nefolosit","nefolositoare":"nefolositor","nefolositoarea":"nefolositor","nefolositoarele":"nefolositor","nefolositori":"nefolositor","nefolositorii":"nefolositor","nefolositorul":"nefolositor","nefolositul":"nefolosit","nefondata":["nefondată","nefondat","nefondata","nefondat"],"nefondate":"nefondat","nefondatele":"nefondat","nefondati":"nefondat","nefondatii":"nefondat","nefondatul":"nefondat","nefoscoape":"nefoscop","nefoscoapele":"nefoscop","nefoscoapelor":"nefoscop","nefoscopul":"nefoscop","nefoscopule":"nefoscop","nefoscopului":"nefoscop","nefralgia":"nefralgie","nefralgiei":"nefralgie","nefralgii":"nefralgie","nefralgiile":"nefralgie","nefralgiilor":"nefralgie","nefrectomia":"nefrectomie","nefrectomiei":"nefrectomie","nefrectomii":"nefrectomie","nefrectomiile":"nefrectomie","nefrectomiilor":"nefrectomie","nefridia":"nefridie","nefridiei":"nefridie","nefridii":"nefridie","nefridiile":"nefridie","nefridiilor":"nefridie","nefripta":["nefriptă","nefript","nefripta","nefript"],"nefripte":"nefript","nefriptele":"nefript","nefripti":"nefript","nefriptii":"nefript","nefriptul":"nefript","nefrite":"nefrită","nefritei":"nefrită","nefritele":"nefrită","nefritelor":"nefrită","nefritica":["nefritică","nefritic","nefritica","nefritic"],"nefritice":["nefritice","nefritic","nefritice","nefritică"],"nefriticei":"nefritică","nefriticele":["nefriticele","nefritic","nefriticele","nefritică"],"nefriticelor":"nefritică","nefritici":"nefritic","nefriticii":"nefritic","nefriticul":"nefritic","nefritul":"nefrit","nefritule":"nefrit","nefritului":"nefrit","nefroane":"nefron","nefroanele":"nefron","nefroanelor":"nefron","nefrografia":"nefrografie","nefrografiei":"nefrografie","nefrografii":"nefrografie","nefrografiile":"nefrografie","nefrografiilor":"nefrografie","nefrolite":"nefrolit","nefrolitele":"nefrolit","nefrolitelor":"nefrolit","nefrolitotomia":"nefrolitotomie","nefrolitotomiei":"nefrolitotomie","nefrolitotomii":"nefrolitotomie","nefrolitotomiile":"nefrolitotomie","nefrolitotomiilor":"nefrolitotomie","nefrolitul":"nefrolit","nefrolitule":"nefrolit","nefrolitului":"nefrolit","nefrologe":"nefrologă","nefrologei":"nefrologă","nefrologele":"nefrologă","nefrologelor":"nefrologă","nefrologi":"nefrolog","nefrologia":"nefrologie","nefrologica":["nefrologică","nefrologic","nefrologica","nefrologic"],"nefrologice":"nefrologic","nefrologicele":"nefrologic","nefrologici":"nefrologic","nefrologicii":"nefrologic","nefrologicul":"nefrologic","nefrologiei":"nefrologie","nefrologii":["nefrologii","nefrolog","nefrologii","nefrologie"],"nefrologilor":"nefrolog","nefrologul":"nefrolog","nefrologule":"nefrolog","nefrologului":"nefrolog","nefronul":"nefron","nefronule":"nefron","nefronului":"nefron","nefropata":["nefropată","nefropat","nefropata","nefropat"],"nefropate":["nefropate","nefropat","nefropate","nefropată"],"nefropatei":"nefropată","nefropatele":["nefropatele","nefropat","nefropatele","nefropată"],"nefropatelor":"nefropată","nefropati":"nefropat","nefropatia":"nefropatie","nefropatiei":"nefropatie","nefropatii":["nefropații","nefropat","nefropatii","nefropatie"],"nefropatiile":"nefropatie","nefropatiilor":"nefropatie","nefropatul":"nefropat","nefropexia":"nefropexie","nefropexiei":"nefropexie","nefropexii":"nefropexie","nefropexiile":"nefropexie","nefropexiilor":"nefropexie","nefroplegia":"nefroplegie","nefroplegiei":"nefroplegie","nefroplegii":"nefroplegie","nefroplegiile":"nefroplegie","nefroplegiilor":"nefroplegie","nefroptoze":"nefroptoză","nefroptozei":"nefroptoză","nefroptozele":"nefroptoză","nefroptozelor":"nefroptoză","nefrorafia":"nefrorafie","nefrorafiei":"nefrorafie","nefrorafii":"nefrorafie","nefrorafiile":"nefrorafie","nefrorafiilor":"nefrorafie","nefrosclerotica":["nefrosclerotică","nefrosclerotic","nefrosclerotica","nefrosclerotic"],"nefrosclerotice":"nefrosclerotic","nefroscleroticele":"nefrosclerotic","nefrosclerotici":"nefrosclerotic","nefroscleroticii":"nefrosclerotic","nefroscleroticul":"nefrosclerotic","nefroscleroze":"nefroscleroză","nefrosclerozei":"nefroscleroză","nefrosclerozele":"nefroscleroză","nefrosclerozelor":"nefroscleroză","nefrostomia":"nefrostomie","nefrostomiei":"nefrostomie","nefrostomii":"nefrostomie","nefrostomiile":"nefrostomie","nefrostomiilor":"nefrostomie","nefrotica":["nefrotică","nefrotic","nefrotica","nefrotic"],"nefrotice":"nefrotic","nefroticele":"nefrotic","nefrotici":"nefrotic","nefroticii":"nefrotic","nefroticul":"nefrotic","nefrotomia":"nefrotomie","nefrotomiei":"nefrotomie","nefrotomii":"nefrotomie","nefrotomiile":"nefrotomie","nefrotomiilor":"nefrotomie","nefroze":"nefroză","nefrozei":"nefroză","nefrozele":"nefroză","nefrozelor":"nefroză","nefructuoasa":["nefructuoasă","nefructuos","nefructuoasa","nefructuos"],"nefructuoase":"nefructuos","nefructuoasele":"nefructuos","nefructuosi":"nefructuos","nefructuosii":"nefructuos","nefructuosul":"nefructuos","nefunctionala":["nefuncțională","nefuncțional","nefuncționala","nefuncțional"],"nefunctionale":"nefuncțional","nefunctionalele":"nefuncțional","nefunctionali":"nefuncțional","nefunctionalii":"nefuncțional","nefunctionalul":"nefuncțional","nefundat":"nefondat","nefundata":["nefundată","nefundat","nefundata","nefundat"],"nefundate":"nefundat","nefundatele":"nefundat","nefundati":"nefundat","nefundatii":"nefundat","nefundatul":"nefundat","nefututa":["nefutută","nefutut","nefututa","nefutut"],"nefutute":"nefutut","nefututele":"nefutut","nefututi":"nefutut","nefututii":"nefutut","nefututul":"nefutut","neg":"nega","negai":"nega","negam":["negăm","nega","negam","nega"],"negand":"nega","negandirea":"negândire","negandiri":"negândire","negandirii":"negândire","negandirile":"negândire","negandirilor":"negândire","neganditul":"negândit","neganditule":"negândit","neganditului":"negândit","negara":"nega","negaram":"nega","negarati":"nega","negare":"negară","negarei":"negară","negarele":"negară","negarelor":"negară","negari":"negare","negase":"nega","negasem":"nega","negasera":"nega","negaseram":"nega","negaserati":"nega","negasesi":"nega","negasi":"nega","negat":"nega","negati":"nega","negatia":"negație","negatiei":"negație","negatii":"negație","negatiile":"negație","negatiilor":"negație","negatiunea":"negațiune","negatiuni":"negațiune","negatiunii":"negațiune","negatiunile":"negațiune","negatiunilor":"negațiune","negativa":["negativă","negativ","negativa","negativ"],"negativai":"negativa","negativam":["negativăm","negativa","negativam","negativa"],"negativand":"negativa","negativara":"negativa","negativaram":"negativa","negativarati":"negativa","negativarea":"negativare","negativari":"negativare","negativarii":"negativare","negativarile":"negativare","negativarilor":"negativare","negativase":"negativa","negativasem":"negativa","negativasera":"negativa","negativaseram":"negativa","negativaserati":"negativa","negativasesi":"negativa","negativasi":"negativa","negativat":"negativa","negativata":["negativată","negativat","negativata","negativat"],"negativate":"negativat","negativatele":"negativat","negativati":["negativați","negativa","negativați","negativat"],"negativatii":"negativat","negativatul":"negativat","negativau":"negativa","negative":"negativ","negativeaza":"negativa","negativele":"negativ","negativelor":"negativ","negativez":"negativa","negativezi":"negativa","negativi":"negativ","negativii":"negativ","negativismul":"negativism","negativismule":"negativism","negativismului":"negativism","negativiste":"negativistă","negativistei":"negativistă","negativistele":"negativistă","negativistelor":"negativistă","negativisti":"negativist","negativistii":"negativist","negativistilor":"negativist","negativistul":"negativist","negativistule":"negativist","negativistului":"negativist","negativitatea":"negativitate","negativitati":"negativitate","negativitatii":"negativitate","negativitatile":"negativitate","negativitatilor":"negativitate","negativizai":"negativiza","negativizam":["negativizăm","negativiza","negativizam","negativiza"],"negativizand":"negativiza","negativizara":"negativiza","negativizaram":"negativiza","negativizarati":"negativiza","negativizarea":"negativizare","negativizari":"negativizare","negativizarii":"negativizare","negativizarile":"negativizare","negativizarilor":"negativizare","negativizase":"negativiza","negativizasem":"negativiza","negativizasera":"negativiza","negativizaseram":"negativiza","negativizaserati":"negativiza","negativizasesi":"negativiza","negativizasi":"negativiza","negativizat":"negativiza","negativizati":"negativiza","negativizau":"negativiza","negativizeaza":"negativiza","negativizez":"negativiza","negativizezi":"negativiza","negativul":"negativ","negativule":"negativ","negativului":"negativ","negatoarea":"negatoare","negatoarei":"negatoare","negatoarele":"negatoare","negatoarelor":"negatoare","negatoni":"negaton","negatonii":"negaton","negatonilor":"negaton","negatonul":"negaton","negatonule":"negaton","negatonului":"negaton","negatori":"negator","negatorii":"negator","negatorilor":"negator","negatorul":"negator","negatorule":"negator","negatorului":"negator","negatoscoape":"negatoscop","negatoscoapele":"negatoscop","negatoscoapelor":"negatoscop","negatoscopul":"negatoscop","negatoscopule":"negatoscop","negatoscopului":"negatoscop","negatroni":"negatron","negatronii":"negatron","negatronilor":"negatron","negatronul":"negatron","negatronule":"negatron","negatronului":"negatron","negau":"nega","nege":"nega","negei":"negel","negelarite":["negelarițe","negelariță","negelărițe","negelăriță"],"negelaritei":["negelariței","negelariță","negelăriței","negelăriță"],"negelaritele":["negelarițele","negelariță","negelărițele","negelăriță"],"negelaritelor":["negelarițelor","negelariță","negelărițelor","negelăriță"],"negeloasa":["negeloasă","negelos","negeloasa","negelos"],"negeloase":"negelos","negeloasele":"negelos","negelosi":"negelos","negelosii":"negelos","negelosul":"negelos","neghine":"neghină","neghinei":"neghină","neghinele":"neghină","neghinelor":"neghină","neghinite":"neghiniță","neghinitei":"neghiniță","neghinitele":"neghiniță","neghinitelor":"neghiniță","neghinoasa":["neghinoasă","neghinos","neghinoasa","neghinos"],"neghinoase":"neghinos","neghinoasele":"neghinos","neghinosi":"neghinos","neghinosii":"neghinos","neghinosul":"neghinos","neghinute":"neghinuță","neghinutei":"neghinuță","neghinutele":"neghinuță","neghinutelor":"neghinuță","neghioaba":["neghioabă","neghiob","neghioaba","neghiob"],"neghioabe":["neghioabe","neghioabă","neghioabe","neghiob"],"neghioabei":"neghioabă","neghioabele":["neghioabele","neghioabă","neghioabele","neghiob"],"neghioabelor":"neghioabă","neghiobeasca":["neghiobească","neghiobesc","neghiobeasca","neghiobesc"],"neghiobescul":"neghiobesc","neghiobesti":"neghiobesc","neghiobestii":"neghiobesc","neghiobestile":"neghiobesc","neghiobi":"neghiob","neghiobia":"neghiobie","neghiobiei":"neghiobie","neghiobii":["neghiobii","neghiob","neghiobii","neghiobie"],"neghiobiile":"neghiobie","neghiobiilor":"neghiobie","neghiobirea":"neghiobire","neghiobiri":"neghiobire","neghiobirii":"neghiobire","neghiobirile":"neghiobire","neghiobirilor":"neghiobire","neghiobul":"neghiob","negi":["negi","neg","negi","nega"],"negineaua":"neginea","neginele":"neginea","neginelei":"neginea","neginelele":"neginea","neginelelor":"neginea","neglasnice":"neglasnică","neglasnicei":"neglasnică","neglasnicele":"neglasnică","neglasnicelor":"neglasnică","neglesa":["neglesă","negles","neglesa","negles"],"neglese":"negles","neglesele":"negles","neglesi":"negles","neglesii":"negles","neglesul":"negles","negligenta":["negligentă","negligent","negligenta","negligent"],"negligente":"negligent","negligentele":"negligent","negligenti":"negligent","negligentii":"negligent","negligentul":"negligent","neglijabila":["neglijabilă","neglijabil","neglijabila","neglijabil"],"neglijabile":"neglijabil","neglijabilele":"neglijabil","neglijabili":"neglijabil","neglijabilii":"neglijabil","neglijabilul":"neglijabil","neglijai":"neglija","neglijam":["neglijăm","neglija","neglijam","neglija"],"neglijand":"neglija","neglijara":"neglija","neglijaram":"neglija","neglijarati":"neglija","neglijarea":"neglijare","neglijarei":"neglijare","neglijarisea":"neglijarisi","neglijariseai":"neglijarisi","neglijariseam":"neglijarisi","neglijariseati":"neglijarisi","neglijariseau":"neglijarisi","neglijarisesc":"neglijarisi","neglijariseste":"neglijarisi","neglijarisesti":"neglijarisi","neglijarisii":"neglijarisi","neglijarisim":"neglijarisi","neglijarisind":"neglijarisi","neglijarisira":"neglijarisi","neglijarisiram":"neglijarisi","neglijarisirati":"neglijarisi","neglijarisise":"neglijarisi","neglijarisisem":"neglijarisi","neglijarisisera":"neglijarisi","neglijarisiseram":"neglijarisi","neglijarisiserati":"neglijarisi","neglijarisisesi":"neglijarisi","neglijarisisi":"neglijarisi","neglijarisit":"neglijarisi","neglijarisiti":"neglijarisi","neglijase":"neglija","neglijasem":"neglija","neglijasera":"neglija","neglijaseram":"neglija","neglijaserati":"neglija","neglijasesi":"neglija","neglijasi":"neglija","neglijat":"neglija","neglijata":["neglijată","neglijat","neglijata","neglijat"],"neglijate":"neglijat","neglijatele":"neglijat","neglijati":["neglijați","neglija","neglijați","neglijat"],"neglijatii":"neglijat","neglijatul":"neglijat","neglijau":"neglija","neglijeaza":"neglija","neglijenta":["neglijentă","neglijent","neglijenta","neglijent"],"neglijente":"neglijent","neglijentele":"neglijent","neglijenti":"neglijent","neglijentii":"neglijent","neglijentul":"neglijent","neglijeul":["neglijeul","neglije","neglijeul","neglijeu"],"neglijeule":["neglijeule","neglije","neglijeule","neglijeu"],"neglijeului":["neglijeului","neglije","neglijeului","neglijeu"],"neglijeuri":["neglijeuri","neglije","neglijeuri","neglijeu"],"neglijeurile":["neglijeurile","neglije","neglijeurile","neglijeu"],"neglijeurilor":["neglijeurilor","neglije","neglijeurilor","neglijeu"],"neglijez":"neglija","neglijezi":"neglija","negoasa":["negoasă","negos","negoasa","negos"],"negoase":"negos","negoasele":"negos","negociabila":["negociabilă","negociabil","negociabila","negociabil"],"negociabile":"negociabil","negociabilele":"negociabil","negociabili":"negociabil","negociabilii":"negociabil","negociabilitatea":"negociabilitate","negociabilitati":"negociabilitate","negociabilitatii":"negociabilitate","negociabilitatile":"negociabilitate","negociabilitatilor":"negociabilitate","negociabilul":"negociabil","negociai":"negocia","negociam":"negocia","negocianti":"negociant","negociantii":"negociant","negociantilor":"negociant","negociantul":"negociant","negociantule":"negociant","negociantului":"negociant","negociara":"negocia","negociaram":"negocia","negociarati":"negocia","negociase":"negocia","negociasem":"negocia","negociasera":"negocia","negociaseram":"negocia","negociaserati":"negocia","negociasesi":"negocia","negociasi":"negocia","negociat":"negocia","negociati":"negocia","negociatia":"negociație","negociatiei":"negociație","negociatii":"negociație","negociatiile":"negociație","negociatiilor":"negociație","negociatiunea":"negociațiune","negociatiuni":"negociațiune","negociatiunii":"negociațiune","negociatiunile":"negociațiune","negociatiunilor":"negociațiune","negociatoarea":"negociatoare","negociatoarei":"negociatoare","negociatoarele":"negociatoare","negociatoarelor":"negociatoare","negociatori":"negociator","negociau":"negocia","negociaza":"negocia","negocie":"negocia","negociem":"negocia","negocierea":"negociere","negocieri":"negociere","negocierii":"negociere","negocierile":"negociere","negocierilor":"negociere","negociez":"negocia","negociezi":"negocia","negociind":"negocia","negociul":"negoci","negociule":"negoci","negociului":"negoci","negoria":"negorie","negoriei":"negorie","negorii":"negorie","negoriile":"negorie","negoriilor":"negorie","negosi":"negos","negosii":"negos","negosul":"negos","negotierea":"negoțiere","negotieri":"negoțiere","negotierii":"negoțiere","negotierile":"negoțiere","negotierilor":"negoțiere","negoturi":"negoț","negraita":["negrăită","negrăit","negrăita","negrăit"],"negraite":"negrăit","negraitele":"negrăit","negraiti":"negrăit","negraitii":"negrăit","negraitul":"negrăit","negre":"negru","negrea":"negri","negreai":"negri","negream":"negri","negreati":"negri","negreau":"negri","negrele":"negru","negreli":"negreală","negresc":"negri","negrese":"negresă","negreste":"negri","negresti":"negri","negrestiul":"Negrești","negrestiule":"Negrești","negrestiului":"Negrești","negreti":"negreață","negri":"negru","negria":"negriu","negricioasa":["negricioasă","negricios","negricioasa","negricios"],"negricioase":"negricios","negricioasele":"negricios","negriciosi":"negricios","negriciosii":"negricios","negriciosul":"negricios","negriciunea":"negriciune","negriciuni":"negriciune","negriciunii":"negriciune","negriciunile":"negriciune","negriciunilor":"negriciune","negridul":"negrid","negridule":"negrid","negridului":"negrid","negrie":"negriu","negrii":["negrii","negri","negrii","negriu","negrii","negru"],"negriii":"negriu","negriile":"negriu","negriji":"negrijă","negrijii":"negrijă","negrijile":"negrijă","negrijilor":"negrijă","negrijinte":"negrijință","negrijintei":"negrijință","negrijintele":"negrijință","negrijintelor":"negrijință","negrijirea":"negrijire","negrijiri":"negrijire","negrijirii":"negrijire","negrijirile":"negrijire","negrijirilor":"negrijire","negrijuirea":"negrijuire","negrijuiri":"negrijuire","negrijuirii":"negrijuire","negrijuirile":"negrijuire","negrijuirilor":"negrijuire","negrilici":"negrilică","negrilicii":"negrilică","negrilicile":"negrilică","negrilicilor":"negrilică","negrilor":"negru","negrim":"negri","negrimea":"negrime","negrimi":"negrime","negrimii":"negrime","negrimile":"negrime","negrimilor":"negrime","negrind":"negri","negriora":["negrioră","negrior","negriora","negrior"],"negriore":"negrior","negriorele":"negrior","negriori":"negrior","negriorii":"negrior","negriorul":"negrior","negrira":"negri","negriram":"negri","negrirati":"negri","negrise":"negri","negrisem":"negri","negrisera":"negri","negriseram":"negri","negriserati":"negri","negrisesi":"negri","negrisi":"negri","negrisora":["negrișoră","negrișor","negrișora","negrișor"],"negrisore":"negrișor","negrisorele":"negrișor","negrisori":"negrișor","negrisorii":"negrișor","negrisorul":"negrișor","negrit":"negri","negriti":"negri","negritudinea":"negritudine","negritudini":"negritudine","negritudinii":"negritudine","negriture":"negritură","negriturei":"negritură","negriul":"negriu","negrizi":"negrid","negrizii":"negrid","negrizilor":"negrid","negrizutoasa":["negrizutoasă","negrizutos","negrizutoasa","negrizutos"],"negrizutoase":"negrizutos","negrizutoasele":"negrizutos","negrizutosi":"negrizutos","negrizutosii":"negrizutos","negrizutosul":"negrizutos","negroaice":"negroaică","negroaicei":"negroaică","negroaicele":"negroaică","negroaicelor":"negroaică","negrofili":"negrofil","negrofilii":"negrofil","negrofililor":"negrofil","negrofilul":"negrofil","negrofilule":"negrofil","negrofilului":"negrofil","negroide":"negroidă","negroidei":"negroidă","negroidele":"negroidă","negroidelor":"negroidă","negroidul":"negroid","negroidule":"negroid","negroidului":"negroid","negroizi":"negroid","negroizii":"negroid","negroizilor":"negroid","negroteii":"negrotei","negroteilor":"negrotei","negroteiul":"negrotei","negroteiule":"negrotei","negroteiului":"negrotei","negru ca taciuneli":"negru ca tăciunele","negru-de-fum":"negru de fum","negrul":"negru","negrul de fum":"negru de fum","negrule":"negru","negrului":"negru","negrului de fum":"negru de fum","negrusa":["negrușă","negruș","negrușa","negruș"],"negruse":"negruș","negrusele":"negruș","negrusi":"negruș","negrusii":"negruș","negrusilor":"negruș","negruste":"negrușcă","negrustei":"negrușcă","negrustele":"negrușcă","negrustelor":"negrușcă","negrusul":"negruș","negrusule":"negruș","negrusului":"negruș","negruta":["negruță","negruț","negruța","negruț"],"negrute":"negruț","negrutele":"negruț","negruti":"negruț","negrutii":"negruț","negrutul":"negruț","negruvodeana":["negruvodeană","negruvodean","negruvodeana","negruvodean"],"negruvodeanul":"negruvodean","negruvodeanule":"negruvodean","negruvodeanului":"negruvodean","negruvodence":"negruvodeancă","negruvodencei":"negruvodeancă","negruvodencele":"negruvodeancă","negruvodencelor":"negruvodeancă","negruvodene":"negruvodean","negruvodenele":"negruvodean","negruvodeni":"negruvodean","negruvodenii":"negruvodean","negruvodenilor":"negruvodean","negurata":["negurată","negurat","negurata","negurat"],"negurate":"negurat","neguratele":"negurat","negurati":"negurat","neguratii":"negurat","neguratul":"negurat","negureli":"negureală","negurelii":"negureală","negurelile":"negureală","negurelilor":"negureală","neguri":"negură","neguria":"neguriu","negurici":"negurică","neguricii":"negurică","neguricile":"negurică","neguricilor":"negurică","negurie":"neguriu","negurii":["negurii","negură","negurii","neguriu"],"neguriii":"neguriu","neguriile":"neguriu","negurile":"negură","negurilor":"negură","negurite":"neguriță","neguritei":"neguriță","neguritele":"neguriță","neguritelor":"neguriță","neguriul":"neguriu","neguroasa":["neguroasă","neguros","neguroasa","neguros"],"neguroase":"neguros","neguroasele":"neguros","negurosi":"neguros","negurosii":"neguros","negurosul":"neguros","negusi":"negus","negusii":"negus","negusilor":"negus","negustorasi":"negustoraș","negustorasii":"negustoraș","negustorasilor":"negustoraș","negustorasul":"negustoraș","negustorasule":"negustoraș","negustorasului":"negustoraș","negustorea":"negustori","negustoreai":"negustori","negustoream":"negustori","negustoreasca":["negustorească","negustoresc","negustoreasca","negustoresc"],"negustoreati":"negustori","negustoreau":"negustori","negustoresc":"negustori","negustorescul":"negustoresc","negustorese":"negustoreasă","negustoresei":"negustoreasă","negustoresele":"negustoreasă","negustoreselor":"negustoreasă","negustoreste":"negustori","negustoresti":["negustorești","negustoresc","negustorești","negustori"],"negustorestii":"negustoresc","negustorestile":"negustoresc","negustori":"negustor","negustori ambulanti":"negustor ambulant","negustoria":"negustorie","negustoriei":"negustorie","negustorii":["negustorii","negustor","negustorii","negustori","negustorii","negustorie"],"negustoriile":"negustorie","negustoriilor":"negustorie","negustorilor":"negustor","negustorim":"negustori","negustorimea":"negustorime","negustorimei":"negustorime","negustorind":"negustori","negustorira":"negustori","negustoriram":"negustori","negustorirati":"negustori","negustorirea":"negustorire","negustoriri":"negustorire","negustoririi":"negustorire","negustoririle":"negustorire","negustoririlor":"negustorire","negustorise":"negustori","negustorisem":"negustori","negustorisera":"negustori","negustoriseram":"negustori","negustoriserati":"negustori","negustorisesi":"negustori","negustorisi":"negustori","negustorit":"negustori","negustorite":"negustoriță","negustoritei":"negustoriță","negustoritele":"negustoriță","negustoritelor":"negustoriță","negustoriti":"negustori","negustoroasa":["negustoroasă","negustoros","negustoroasa","negustoros"],"negustoroase":"negustoros","negustoroasele":"negustoros","negustorosi":"negustoros","negustorosii":"negustoros","negustorosul":"negustoros","negustorul":"negustor","negustorule":"negustor","negustorului":"negustor","negusul":"negus","negusule":"negus","negusului":"negus","negutai":"neguța","negutam":["neguțăm","neguța","neguțam","neguța"],"negutand":"neguța","negutara":"neguța","negutaram":"neguța","negutarati":"neguța","negutarea":"neguțare","negutari":"neguțare","negutarii":"neguțare","negutarile":"neguțare","negutarilor":"neguțare","negutase":"neguța","negutasem":"neguța","negutasera":"neguța","negutaseram":"neguța","negutaserati":"neguța","negutasesi":"neguța","negutasi":"neguța","negutat":"neguța","negutati":"neguța","negutator":"negustor","negutatorasi":"neguțătoraș","negutatorasii":"neguțătoraș","negutatorasilor":"neguțătoraș","negutatorasul":"neguțătoraș","negutatorasule":"neguțătoraș","negutatorasului":"neguțătoraș","negutatorea":"neguțători","negutatoreai":"neguțători","negutatoream":"neguțători","negutatoreati":"neguțători","negutatoreau":"neguțători","negutatoresc":"neguțători","negutatorese":"neguțătoreasă","negutatoresei":"neguțătoreasă","negutatoresele":"neguțătoreasă","negutatoreselor":"neguțătoreasă","negutatoreste":"neguțători","negutatoresti":"neguțători"};
@@ -0,0 +1 @@
+export default {"negutatori":"neguțător","negutatoria":"neguțătorie","negutatoriei":"neguțătorie","negutatorii":["neguțătorii","neguțător","neguțătorii","neguțători","neguțătorii","neguțătorie"],"negutatoriile":"neguțătorie","negutatoriilor":"neguțătorie","negutatorilor":"neguțător","negutatorim":"neguțători","negutatorind":"neguțători","negutatorira":"neguțători","negutatoriram":"neguțători","negutatorirati":"neguțători","negutatorise":"neguțători","negutatorisem":"neguțători","negutatorisera":"neguțători","negutatoriseram":"neguțători","negutatoriserati":"neguțători","negutatorisesi":"neguțători","negutatorisi":"neguțători","negutatorit":"neguțători","negutatorite":"neguțătoriță","negutatoritei":"neguțătoriță","negutatoritele":"neguțătoriță","negutatoritelor":"neguțătoriță","negutatoriti":"neguțători","negutatorul":"neguțător","negutatorule":"neguțător","negutatorului":"neguțător","negutau":"neguța","neguteaza":"neguța","negutetorioare":"neguțetorioară","negutetorioarei":"neguțetorioară","negutetorioarele":"neguțetorioară","negutetorioarelor":"neguțetorioară","negutez":"neguța","negutezi":"neguța","negutitoria":"neguțitorie","negutitoriei":"neguțitorie","negutitorii":"neguțitorie","negutitoriile":"neguțitorie","negutitoriilor":"neguțitorie","neguvernamentala":["neguvernamentală","neguvernamental","neguvernamentala","neguvernamental"],"neguvernamentale":"neguvernamental","neguvernamentalele":"neguvernamental","neguvernamentali":"neguvernamental","neguvernamentalii":"neguvernamental","neguvernamentalul":"neguvernamental","nehalita":["nehalită","nehalit","nehalita","nehalit"],"nehalite":"nehalit","nehalitele":"nehalit","nehaliti":"nehalit","nehalitii":"nehalit","nehalitul":"nehalit","neharnici":"neharnic","neharnicii":"neharnic","neharnicilor":"neharnic","neharnicul":"neharnic","neharnicule":"neharnic","neharnicului":"neharnic","nehotararea":"nehotărâre","nehotarari":"nehotărâre","nehotararii":"nehotărâre","nehotarata":["nehotărâtă","nehotărât","nehotărâta","nehotărât"],"nehotarate":"nehotărât","nehotaratele":"nehotărât","nehotarati":"nehotărât","nehotaratii":"nehotărât","nehotaratul":"nehotărât","nei":"nea","neiasite":"neiasită","neiasitei":"neiasită","neiasitele":"neiasită","neiasitelor":"neiasită","neiculeanul":"neiculean","neiculeanule":"neiculean","neiculeanului":"neiculean","neiculitei":"neiculiță","neicusori":"neicușor","neicusorii":"neicușor","neicusorilor":"neicușor","neicusorul":"neicușor","neicusorule":"neicușor","neicusorului":"neicușor","neicutei":"neicuță","neidentificata":["neidentificată","neidentificat","neidentificata","neidentificat"],"neidentificate":"neidentificat","neidentificatele":"neidentificat","neidentificati":"neidentificat","neidentificatii":"neidentificat","neidentificatul":"neidentificat","neiertata":["neiertată","neiertat","neiertata","neiertat"],"neiertate":"neiertat","neiertatele":"neiertat","neiertati":"neiertat","neiertatii":"neiertat","neiertatoara":"neiertător","neiertatoare":"neiertător","neiertatoarele":"neiertător","neiertatori":"neiertător","neiertatorii":"neiertător","neiertatorul":"neiertător","neiertatul":"neiertat","neii":"nea","neimaginabila":["neimaginabilă","neimaginabil","neimaginabila","neimaginabil"],"neimaginabile":"neimaginabil","neimaginabilele":"neimaginabil","neimaginabili":"neimaginabil","neimaginabilii":"neimaginabil","neimaginabilul":"neimaginabil","neimblanzita":["neîmblânzită","neîmblânzit","neîmblânzita","neîmblânzit"],"neimblanzite":"neîmblânzit","neimblanzitele":"neîmblânzit","neimblanziti":"neîmblânzit","neimblanzitii":"neîmblânzit","neimblanzitul":"neîmblânzit","neimbunatatita":["neîmbunătățită","neîmbunătățit","neîmbunătățita","neîmbunătățit"],"neimbunatatite":"neîmbunătățit","neimbunatatitele":"neîmbunătățit","neimbunatatiti":"neîmbunătățit","neimbunatatitii":"neîmbunătățit","neimbunatatitul":"neîmbunătățit","neimitabila":["neimitabilă","neimitabil","neimitabila","neimitabil"],"neimitabile":"neimitabil","neimitabilele":"neimitabil","neimitabili":"neimitabil","neimitabilii":"neimitabil","neimitabilul":"neimitabil","neimpacata":["neîmpăcată","neîmpăcat","neîmpăcata","neîmpăcat"],"neimpacate":"neîmpăcat","neimpacatele":"neîmpăcat","neimpacati":"neîmpăcat","neimpacatii":"neîmpăcat","neimpacatul":"neîmpăcat","neimpadurita":["neîmpădurită","neîmpădurit","neîmpădurita","neîmpădurit"],"neimpadurite":"neîmpădurit","neimpaduritele":"neîmpădurit","neimpaduriti":"neîmpădurit","neimpaduritii":"neîmpădurit","neimpaduritul":"neîmpădurit","neimpiedicata":["neîmpiedicată","neîmpiedicat","neîmpiedicata","neîmpiedicat"],"neimpiedicate":"neîmpiedicat","neimpiedicatele":"neîmpiedicat","neimpiedicati":"neîmpiedicat","neimpiedicatii":"neîmpiedicat","neimpiedicatul":"neîmpiedicat","neimplicata":["neimplicată","neimplicat","neimplicata","neimplicat"],"neimplicate":"neimplicat","neimplicatele":"neimplicat","neimplicati":"neimplicat","neimplicatii":"neimplicat","neimplicatul":"neimplicat","neimplinita":["neîmplinită","neîmplinit","neîmplinita","neîmplinit"],"neimplinite":"neîmplinit","neimplinitele":"neîmplinit","neimpliniti":"neîmplinit","neimplinitii":"neîmplinit","neimplinitul":"neîmplinit","neimportanta":["neimportantă","neimportant","neimportanta","neimportant"],"neimportante":"neimportant","neimportantele":"neimportant","neimportanti":"neimportant","neimportantii":"neimportant","neimportantul":"neimportant","neimpozabila":["neimpozabilă","neimpozabil","neimpozabila","neimpozabil"],"neimpozabile":"neimpozabil","neimpozabilele":"neimpozabil","neimpozabili":"neimpozabil","neimpozabilii":"neimpozabil","neimpozabilul":"neimpozabil","neimprejmuita":["neîmprejmuită","neîmprejmuit","neîmprejmuita","neîmprejmuit"],"neimprejmuite":"neîmprejmuit","neimprejmuitele":"neîmprejmuit","neimprejmuiti":"neîmprejmuit","neimprejmuitii":"neîmprejmuit","neimprejmuitul":"neîmprejmuit","neincapatoare":"neîncăpător","neincapatoarea":"neîncăpător","neincapatoarele":"neîncăpător","neincapatori":"neîncăpător","neincapatorii":"neîncăpător","neincapatorul":"neîncăpător","neinceputa":["neîncepută","neînceput","neînceputa","neînceput"],"neincepute":"neînceput","neinceputele":"neînceput","neinceputi":"neînceput","neinceputii":"neînceput","neinceputul":"neînceput","neincetarea":"neîncetare","neincetari":"neîncetare","neincetarii":"neîncetare","neincetata":["neîncetată","neîncetat","neîncetata","neîncetat"],"neincetate":"neîncetat","neincetatele":"neîncetat","neincetati":"neîncetat","neincetatii":"neîncetat","neincetatul":"neîncetat","neinchipuita":["neînchipuită","neînchipuit","neînchipuita","neînchipuit"],"neinchipuite":"neînchipuit","neinchipuitele":"neînchipuit","neinchipuiti":"neînchipuit","neinchipuitii":"neînchipuit","neinchipuitul":"neînchipuit","neincrederea":"neîncredere","neincrederi":"neîncredere","neincrederii":"neîncredere","neincrezatoare":"neîncrezător","neincrezatoarea":"neîncrezător","neincrezatoarele":"neîncrezător","neincrezatori":"neîncrezător","neincrezatorii":"neîncrezător","neincrezatorul":"neîncrezător","neindemanarea":"neîndemânare","neindemanari":"neîndemânare","neindemanarii":"neîndemânare","neindemanatica":["neîndemânatică","neîndemânatic","neîndemânatica","neîndemânatic"],"neindemanatice":"neîndemânatic","neindemanaticele":"neîndemânatic","neindemanatici":"neîndemânatic","neindemanaticii":"neîndemânatic","neindemanaticul":"neîndemânatic","neindeplinita":["neîndeplinită","neîndeplinit","neîndeplinita","neîndeplinit"],"neindeplinite":"neîndeplinit","neindeplinitele":"neîndeplinit","neindepliniti":"neîndeplinit","neindeplinitii":"neîndeplinit","neindeplinitul":"neîndeplinit","neindestulatoare":"neîndestulător","neindestulatoarea":"neîndestulător","neindestulatoarele":"neîndestulător","neindestulatori":"neîndestulător","neindestulatorii":"neîndestulător","neindestulatorul":"neîndestulător","neindoielnica":["neîndoielnică","neîndoielnic","neîndoielnica","neîndoielnic"],"neindoielnice":"neîndoielnic","neindoielnicele":"neîndoielnic","neindoielnici":"neîndoielnic","neindoielnicii":"neîndoielnic","neindoielnicul":"neîndoielnic","neindoioasa":["neîndoioasă","neîndoios","neîndoioasa","neîndoios"],"neindoioase":"neîndoios","neindoioasele":"neîndoios","neindoiosi":"neîndoios","neindoiosii":"neîndoios","neindoiosul":"neîndoios","neinduplecarea":"neînduplecare","neinduplecari":"neînduplecare","neinduplecarii":"neînduplecare","neinduplecata":["neînduplecată","neînduplecat","neînduplecata","neînduplecat"],"neinduplecate":"neînduplecat","neinduplecatele":"neînduplecat","neinduplecati":"neînduplecat","neinduplecatii":"neînduplecat","neinduplecatul":"neînduplecat","neindurarea":"neîndurare","neindurari":"neîndurare","neindurarii":"neîndurare","neindurata":["neîndurată","neîndurat","neîndurata","neîndurat"],"neindurate":"neîndurat","neinduratele":"neîndurat","neindurati":"neîndurat","neinduratii":"neîndurat","neinduratoare":"neîndurător","neinduratoarea":"neîndurător","neinduratoarele":"neîndurător","neinduratori":"neîndurător","neinduratorii":"neîndurător","neinduratorul":"neîndurător","neinduratul":"neîndurat","neinflamabila":["neinflamabilă","neinflamabil","neinflamabila","neinflamabil"],"neinflamabile":"neinflamabil","neinflamabilele":"neinflamabil","neinflamabili":"neinflamabil","neinflamabilii":"neinflamabil","neinflamabilul":"neinflamabil","neinformata":["neinformată","neinformat","neinformata","neinformat"],"neinformate":"neinformat","neinformatele":"neinformat","neinformati":"neinformat","neinformatii":"neinformat","neinformatul":"neinformat","neinfranata":["neînfrânată","neînfrânat","neînfrânata","neînfrânat"],"neinfranate":"neînfrânat","neinfranatele":"neînfrânat","neinfranati":"neînfrânat","neinfranatii":"neînfrânat","neinfranatul":"neînfrânat","neinfranta":["neînfrântă","neînfrânt","neînfrânta","neînfrânt"],"neinfrante":"neînfrânt","neinfrantele":"neînfrânt","neinfranti":"neînfrânt","neinfrantii":"neînfrânt","neinfrantul":"neînfrânt","neinfricarea":"neînfricare","neinfricari":"neînfricare","neinfricarii":"neînfricare","neinfricata":["neînfricată","neînfricat","neînfricata","neînfricat"],"neinfricate":"neînfricat","neinfricatele":"neînfricat","neinfricati":"neînfricat","neinfricatii":"neînfricat","neinfricatul":"neînfricat","neinfricosarea":"neînfricoșare","neinfricosari":"neînfricoșare","neinfricosarii":"neînfricoșare","neinfricosarile":"neînfricoșare","neinfricosarilor":"neînfricoșare","neinfricosata":["neînfricoșată","neînfricoșat","neînfricoșata","neînfricoșat"],"neinfricosate":"neînfricoșat","neinfricosatele":"neînfricoșat","neinfricosati":"neînfricoșat","neinfricosatii":"neînfricoșat","neinfricosatul":"neînfricoșat","neingaduinte":"neîngăduință","neingaduintei":"neîngăduință","neingaduintele":"neîngăduință","neingaduintelor":"neîngăduință","neingaduitoare":"neîngăduitor","neingaduitoarea":"neîngăduitor","neingaduitoarele":"neîngăduitor","neingaduitori":"neîngăduitor","neingaduitorii":"neîngăduitor","neingaduitorul":"neîngăduitor","neingradita":["neîngrădită","neîngrădit","neîngrădita","neîngrădit"],"neingradite":"neîngrădit","neingraditele":"neîngrădit","neingraditi":"neîngrădit","neingraditii":"neîngrădit","neingraditul":"neîngrădit","neingrijea":"neîngriji","neingrijeai":"neîngriji","neingrijeam":"neîngriji","neingrijeati":"neîngriji","neingrijeau":"neîngriji","neingrijesc":"neîngriji","neingrijeste":"neîngriji","neingrijesti":"neîngriji","neingrijii":"neîngriji","neingrijim":"neîngriji","neingrijind":"neîngriji","neingrijira":"neîngriji","neingrijiram":"neîngriji","neingrijirati":"neîngriji","neingrijirea":"neîngrijire","neingrijiri":"neîngrijire","neingrijirii":"neîngrijire","neingrijise":"neîngriji","neingrijisem":"neîngriji","neingrijisera":"neîngriji","neingrijiseram":"neîngriji","neingrijiserati":"neîngriji","neingrijisesi":"neîngriji","neingrijisi":"neîngriji","neingrijit":"neîngriji","neingrijita":["neîngrijită","neîngrijit","neîngrijita","neîngrijit"],"neingrijite":"neîngrijit","neingrijitele":"neîngrijit","neingrijiti":["neîngrijiți","neîngriji","neîngrijiți","neîngrijit"],"neingrijitii":"neîngrijit","neingrijitul":"neîngrijit","neinsemnata":["neînsemnată","neînsemnat","neînsemnata","neînsemnat"],"neinsemnate":"neînsemnat","neinsemnatele":"neînsemnat","neinsemnati":"neînsemnat","neinsemnatii":"neînsemnat","neinsemnatul":"neînsemnat","neinspirata":["neinspirată","neinspirat","neinspirata","neinspirat"],"neinspirate":"neinspirat","neinspiratele":"neinspirat","neinspirati":"neinspirat","neinspiratii":"neinspirat","neinspiratul":"neinspirat","neinstruita":["neinstruită","neinstruit","neinstruita","neinstruit"],"neinstruite":"neinstruit","neinstruitele":"neinstruit","neinstruiti":"neinstruit","neinstruitii":"neinstruit","neinstruitul":"neinstruit","neinsufletita":["neînsuflețită","neînsuflețit","neînsuflețita","neînsuflețit"],"neinsufletite":"neînsuflețit","neinsufletitele":"neînsuflețit","neinsufletiti":"neînsuflețit","neinsufletitii":"neînsuflețit","neinsufletitul":"neînsuflețit","neintarziata":["neîntârziată","neîntârziat","neîntârziata","neîntârziat"],"neintarziate":"neîntârziat","neintarziatele":"neîntârziat","neintarziati":"neîntârziat","neintarziatii":"neîntârziat","neintarziatul":"neîntârziat","neintegrabila":["neintegrabilă","neintegrabil","neintegrabila","neintegrabil"],"neintegrabile":"neintegrabil","neintegrabilele":"neintegrabil","neintegrabili":"neintegrabil","neintegrabilii":"neintegrabil","neintegrabilul":"neintegrabil","neintelegatoare":"neînțelegător","neintelegatoarea":"neînțelegător","neintelegatoarele":"neînțelegător","neintelegatori":"neînțelegător","neintelegatorii":"neînțelegător","neintelegatorul":"neînțelegător","neintelegerea":"neînțelegere","neintelegeri":"neînțelegere","neintelegerii":"neînțelegere","neintelegerile":"neînțelegere","neintelegerilor":"neînțelegere","neintelesa":["neînțelesă","neînțeles","neînțelesa","neînțeles"],"neintelese":"neînțeles","neintelesele":"neînțeles","neintelesi":"neînțeles","neintelesii":"neînțeles","neintelesul":"neînțeles","neinteligenta":["neinteligentă","neinteligent","neinteligenta","neinteligent"],"neinteligente":"neinteligent","neinteligentele":"neinteligent","neinteligenti":"neinteligent","neinteligentii":"neinteligent","neinteligentul":"neinteligent","neinteligibila":["neinteligibilă","neinteligibil","neinteligibila","neinteligibil"],"neinteligibile":"neinteligibil","neinteligibilele":"neinteligibil","neinteligibili":"neinteligibil","neinteligibilii":"neinteligibil","neinteligibilul":"neinteligibil","neintemeiata":["neîntemeiată","neîntemeiat","neîntemeiata","neîntemeiat"],"neintemeiate":"neîntemeiat","neintemeiatele":"neîntemeiat","neintemeiati":"neîntemeiat","neintemeiatii":"neîntemeiat","neintemeiatul":"neîntemeiat","neintentionata":["neintenționată","neintenționat","neintenționata","neintenționat"],"neintentionate":"neintenționat","neintentionatele":"neintenționat","neintentionati":"neintenționat","neintentionatii":"neintenționat","neintentionatul":"neintenționat","neinteresanta":["neinteresantă","neinteresant","neinteresanta","neinteresant"],"neinteresante":"neinteresant","neinteresantele":"neinteresant","neinteresanti":"neinteresant","neinteresantii":"neinteresant","neinteresantul":"neinteresant","neinterventia":"neintervenție","neinterventiei":"neintervenție","neinterventii":"neintervenție","neinterventiile":"neintervenție","neinterventiilor":"neintervenție","neinterventioniste":"neintervenționistă","neinterventionistei":"neintervenționistă","neinterventionistele":"neintervenționistă","neinterventionistelor":"neintervenționistă","neinterventionisti":"neintervenționist","neinterventionistii":"neintervenționist","neinterventionistilor":"neintervenționist","neinterventionistul":"neintervenționist","neinterventionistule":"neintervenționist","neinterventionistului":"neintervenționist","neintinata":["neîntinată","neîntinat","neîntinata","neîntinat"],"neintinate":"neîntinat","neintinatele":"neîntinat","neintinati":"neîntinat","neintinatii":"neîntinat","neintinatul":"neîntinat","neintorsa":["neîntorsă","neîntors","neîntorsa","neîntors"],"neintorse":"neîntors","neintorsele":"neîntors","neintorsi":"neîntors","neintorsii":"neîntors","neintorsul":"neîntors","neintrebuintata":["neîntrebuințată","neîntrebuințat","neîntrebuințata","neîntrebuințat"],"neintrebuintate":"neîntrebuințat","neintrebuintatele":"neîntrebuințat","neintrebuintati":"neîntrebuințat","neintrebuintatii":"neîntrebuințat","neintrebuintatul":"neîntrebuințat","neintrecuta":["neîntrecută","neîntrecut","neîntrecuta","neîntrecut"],"neintrecute":"neîntrecut","neintrecutele":"neîntrecut","neintrecuti":"neîntrecut","neintrecutii":"neîntrecut","neintrecutul":"neîntrecut","neinvinsa":["neînvinsă","neînvins","neînvinsa","neînvins"],"neinvinse":"neînvins","neinvinsele":"neînvins","neinvinsi":"neînvins","neinvinsii":"neînvins","neinvinsul":"neînvins","neioasa":["neioasă","neios","neioasa","neios"],"neioase":"neios","neioasele":"neios","neiosi":"neios","neiosii":"neios","neiosul":"neios","neirigata":["neirigată","neirigat","neirigata","neirigat"],"neirigate":"neirigat","neirigatele":"neirigat","neirigati":"neirigat","neirigatii":"neirigat","neirigatul":"neirigat","neisani":"neisan","neisanii":"neisan","neisanilor":"neisan","neisanul":"neisan","neisanule":"neisan","neisanului":"neisan","neispravite":"neisprăvită","neispravitei":"neisprăvită","neispravitele":"neisprăvită","neispravitelor":"neisprăvită","neispraviti":"neisprăvit","neispravitii":"neisprăvit","neispravitilor":"neisprăvit","neispravitul":"neisprăvit","neispravitule":"neisprăvit","neispravitului":"neisprăvit","neistovita":["neistovită","neistovit","neistovita","neistovit"],"neistovite":"neistovit","neistovitele":"neistovit","neistoviti":"neistovit","neistovitii":"neistovit","neistovitul":"neistovit","neistovul":"neistov","neistovule":"neistov","neistovului":"neistov","neiubituri":"neiubitură","neiubiturii":"neiubitură","neiubiturile":"neiubitură","neiubiturilor":"neiubitură","neizbande":"neizbândă","neizbandei":"neizbândă","neizbavita":["neizbăvită","neizbăvit","neizbăvita","neizbăvit"],"neizbavite":"neizbăvit","neizbavitele":"neizbăvit","neizbaviti":"neizbăvit","neizbavitii":"neizbăvit","neizbavitul":"neizbăvit","neizbutita":["neizbutită","neizbutit","neizbutita","neizbutit"],"neizbutite":"neizbutit","neizbutitele":"neizbutit","neizbutiti":"neizbutit","neizbutitii":"neizbutit","neizbutitul":"neizbutit","nejelnice":"nejelnică","nejelnicei":"nejelnică","nejelnicele":"nejelnică","nejelnicelor":"nejelnică","nejudecata":["nejudecată","nejudecat","nejudecata","nejudecat"],"nejudecate":"nejudecat","nejudecatele":"nejudecat","nejudecati":"nejudecat","nejudecatii":"nejudecat","nejudecatul":"nejudecat","nejusta":["nejustă","nejust","nejusta","nejust"],"nejuste":"nejust","nejustele":"nejust","nejusti":"nejust","nejustificabila":["nejustificabilă","nejustificabil","nejustificabila","nejustificabil"],"nejustificabile":"nejustificabil","nejustificabilele":"nejustificabil","nejustificabili":"nejustificabil","nejustificabilii":"nejustificabil","nejustificabilul":"nejustificabil","nejustificata":["nejustificată","nejustificat","nejustificata","nejustificat"],"nejustificate":"nejustificat","nejustificatele":"nejustificat","nejustificati":"nejustificat","nejustificatii":"nejustificat","nejustificatul":"nejustificat","nejustii":"nejust","nejustul":"nejust","nelacomia":"nelăcomie","nelacomiei":"nelăcomie","nelacomii":"nelăcomie","nelacomiile":"nelăcomie","nelacomiilor":"nelăcomie","nelalocula":["nelaloculă","nelalocul","nelalocula","nelalocul"],"nelalocule":"nelalocul","nelaloculele":"nelalocul","nelaloculi":"nelalocul","nelaloculii":"nelalocul","nelaloculul":"nelalocul","nelamurirea":"nelămurire","nelamuriri":"nelămurire","nelamuririi":"nelămurire","nelamuririle":"nelămurire","nelamuririlor":"nelămurire","nelamurita":["nelămurită","nelămurit","nelămurita","nelămurit"],"nelamurite":"nelămurit","nelamuritele":"nelămurit","nelamuriti":"nelămurit","nelamuritii":"nelămurit","nelamuritul":"nelămurit","nelegala":["nelegală","nelegal","nelegala","nelegal"],"nelegale":"nelegal","nelegalele":"nelegal","nelegali":"nelegal","nelegalii":"nelegal","nelegalul":"nelegal","nelegitima":["nelegitimă","nelegitim","nelegitima","nelegitim"],"nelegitime":"nelegitim","nelegitimele":"nelegitim","nelegitimi":"nelegitim","nelegitimii":"nelegitim","nelegitimul":"nelegitim","nelegiuirea":"nelegiuire","nelegiuiri":"nelegiuire","nelegiuirii":"nelegiuire","nelegiuirile":"nelegiuire","nelegiuirilor":"nelegiuire","nelegiuita":["nelegiuită","nelegiuit","nelegiuita","nelegiuit"],"nelegiuite":"nelegiuit","nelegiuitele":"nelegiuit","nelegiuiti":"nelegiuit","nelegiuitii":"nelegiuit","nelegiuitul":"nelegiuit","nelepcici":"nelepcică","nelepcicii":"nelepcică","nelepcicile":"nelepcică","nelepcicilor":"nelepcică","nelepcute":"nelepcuță","nelepcutei":"nelepcuță","nelepcutele":"nelepcuță","nelepcutelor":"nelepcuță","nelimitata":["nelimitată","nelimitat","nelimitata","nelimitat"],"nelimitate":"nelimitat","nelimitatele":"nelimitat","nelimitati":"nelimitat","nelimitatii":"nelimitat","nelimitatul":"nelimitat","neliniara":["neliniară","neliniar","neliniara","neliniar"],"neliniare":"neliniar","neliniarele":"neliniar","neliniari":"neliniar","neliniarii":"neliniar","neliniarul":"neliniar","nelinistea":["neliniștea","neliniște","neliniștea","neliniști"],"nelinisteai":"neliniști","nelinisteam":"neliniști","nelinisteati":"neliniști","nelinisteau":"neliniști","nelinistesc":"neliniști","nelinisteste":"neliniști","nelinistesti":"neliniști","nelinisti":"neliniște","nelinistii":["neliniștii","neliniște","neliniștii","neliniști"],"nelinistile":"neliniște","nelinistilor":"neliniște","nelinistim":"neliniști","nelinistind":"neliniști","nelinistira":"neliniști","nelinistiram":"neliniști","nelinistirati":"neliniști","nelinistirea":"neliniștire","nelinistiri":"neliniștire","nelinistirii":"neliniștire","nelinistirile":"neliniștire","nelinistirilor":"neliniștire","nelinistise":"neliniști","nelinistisem":"neliniști","nelinistisera":"neliniști","nelinistiseram":"neliniști","nelinistiserati":"neliniști","nelinistisesi":"neliniști","nelinistisi":"neliniști","nelinistit":"neliniști","nelinistita":["neliniștită","neliniștit","neliniștita","neliniștit"],"nelinistite":"neliniștit","nelinistitele":"neliniștit","nelinistiti":["neliniștiți","neliniști","neliniștiți","neliniștit"],"nelinistitii":"neliniștit","nelinistitoare":"neliniștitor","nelinistitoarea":"neliniștitor","nelinistitoarele":"neliniștitor","nelinistitori":"neliniștitor","nelinistitorii":"neliniștitor","nelinistitorul":"neliniștitor","nelinistitul":"neliniștit","nelipita":["nelipită","nelipit","nelipita","nelipit"],"nelipite":"nelipit","nelipitele":"nelipit","nelipiti":"nelipit","nelipitii":"nelipit","nelipitul":"nelipit","nelipsita":["nelipsită","nelipsit","nelipsita","nelipsit"],"nelipsite":"nelipsit","nelipsitele":"nelipsit","nelipsiti":"nelipsit","nelipsitii":"nelipsit","nelipsitul":"nelipsit","neloaiala":["neloaială","neloaial","neloaiala","neloaial"],"neloaiale":"neloaial","neloaialele":"neloaial","neloaiali":"neloaial","neloaialii":"neloaial","neloaialul":"neloaial","nelocuibila":["nelocuibilă","nelocuibil","nelocuibila","nelocuibil"],"nelocuibile":"nelocuibil","nelocuibilele":"nelocuibil","nelocuibili":"nelocuibil","nelocuibilii":"nelocuibil","nelocuibilitatea":"nelocuibilitate","nelocuibilitati":"nelocuibilitate","nelocuibilitatii":"nelocuibilitate","nelocuibilul":"nelocuibil","neloiala":["neloială","neloial","neloiala","neloial"],"neloiale":"neloial","neloialele":"neloial","neloiali":"neloial","neloialii":"neloial","neloialul":"neloial","nelucrarea":"nelucrare","nelucrari":"nelucrare","nelucrarii":"nelucrare","nelucrata":["nelucrată","nelucrat","nelucrata","nelucrat"],"nelucrate":"nelucrat","nelucratele":"nelucrat","nelucrati":"nelucrat","nelucratii":"nelucrat","nelucratul":"nelucrat","nelumea":"nelume","nelumi":"nelume","nelumii":"nelume","neluminata":["neluminată","neluminat","neluminata","neluminat"],"neluminate":"neluminat","neluminatele":"neluminat","neluminati":"neluminat","neluminatii":"neluminat","neluminatul":"neluminat","nemachiata":["nemachiată","nemachiat","nemachiata","nemachiat"],"nemachiate":"nemachiat","nemachiatele":"nemachiat","nemachiati":"nemachiat","nemachiatii":"nemachiat","nemachiatul":"nemachiat","nemaiauzita":["nemaiauzită","nemaiauzit","nemaiauzita","nemaiauzit"],"nemaiauzite":"nemaiauzit","nemaiauzitele":"nemaiauzit","nemaiauziti":"nemaiauzit","nemaiauzitii":"nemaiauzit","nemaiauzitul":"nemaiauzit","nemaicunoscuta":["nemaicunoscută","nemaicunoscut","nemaicunoscuta","nemaicunoscut"],"nemaicunoscute":"nemaicunoscut","nemaicunoscutele":"nemaicunoscut","nemaicunoscuti":"nemaicunoscut","nemaicunoscutii":"nemaicunoscut","nemaicunoscutul":"nemaicunoscut","nemaiintalnita":["nemaiîntâlnită","nemaiîntâlnit","nemaiîntâlnita","nemaiîntâlnit"],"nemaiintalnite":"nemaiîntâlnit","nemaiintalnitele":"nemaiîntâlnit","nemaiintalniti":"nemaiîntâlnit","nemaiintalnitii":"nemaiîntâlnit","nemaiintalnitul":"nemaiîntâlnit","nemaipomenita":["nemaipomenită","nemaipomenit","nemaipomenita","nemaipomenit"],"nemaipomenite":"nemaipomenit","nemaipomenitele":"nemaipomenit","nemaipomeniti":"nemaipomenit","nemaipomenitii":"nemaipomenit","nemaipomenitul":"nemaipomenit","nemaivazuta":["nemaivăzută","nemaivăzut","nemaivăzuta","nemaivăzut"],"nemaivazute":"nemaivăzut","nemaivazutele":"nemaivăzut","nemaivazuti":"nemaivăzut","nemaivazutii":"nemaivăzut","nemaivazutul":"nemaivăzut","nemancarea":"nemâncare","nemancari":"nemâncare","nemancarii":"nemâncare","nemancata":["nemâncată","nemâncat","nemâncata","nemâncat"],"nemancate":"nemâncat","nemancatele":"nemâncat","nemancati":"nemâncat","nemancatii":"nemâncat","nemancatul":"nemâncat","nemandra":["nemândră","nemândru","nemândra","nemândru"],"nemandre":"nemândru","nemandrele":"nemândru","nemandri":"nemândru","nemandrii":"nemândru","nemandrul":"nemândru","nemangaiata":["nemângâiată","nemângâiat","nemângâiata","nemângâiat"],"nemangaiate":"nemângâiat","nemangaiatele":"nemângâiat","nemangaiati":"nemângâiat","nemangaiatii":"nemângâiat","nemangaiatul":"nemângâiat","nemangaierea":"nemângâiere","nemangaieri":"nemângâiere","nemangaierii":"nemângâiere","nemangaierile":"nemângâiere","nemangaierilor":"nemângâiere","nemania":"nemânie","nemaniei":"nemânie","nemanii":"nemânie","nemaniile":"nemânie","nemaniilor":"nemânie","nemaniosi":"nemânios","nemaniosii":"nemânios","nemaniosilor":"nemânios","nemaniosul":"nemânios","nemaniosule":"nemânios","nemaniosului":"nemânios","nemarginea":"nemargine","nemargini":"nemargine","nemarginii":"nemargine","nemarginile":"nemargine","nemarginilor":"nemargine","nemarginirea":"nemărginire","nemarginiri":"nemărginire","nemarginirii":"nemărginire","nemarginirile":"nemărginire","nemarginirilor":"nemărginire","nemarginita":["nemărginită","nemărginit","nemărginita","nemărginit"],"nemarginite":"nemărginit","nemarginitele":"nemărginit","nemarginiti":"nemărginit","nemarginitii":"nemărginit","nemarginitul":"nemărginit","nemarirea":"nemărire","nemariri":"nemărire","nemaririi":"nemărire","nemaririle":"nemărire","nemaririlor":"nemărire","nemarturisita":["nemărturisită","nemărturisit","nemărturisita","nemărturisit"],"nemarturisite":"nemărturisit","nemarturisitele":"nemărturisit","nemarturisiti":"nemărturisit","nemarturisitii":"nemărturisit","nemarturisitul":"nemărturisit","nemascata":["nemascată","nemascat","nemascata","nemascat"],"nemascate":"nemascat","nemascatele":"nemascat","nemascati":"nemascat","nemascatii":"nemascat","nemascatul":"nemascat","nemasurarari":"nemăsurare","nemasurararii":"nemăsurare","nemasurararile":"nemăsurare","nemasurararilor":"nemăsurare","nemasurarea":"nemăsurare","nemasurata":["nemăsurată","nemăsurat","nemăsurata","nemăsurat"],"nemasurate":"nemăsurat","nemasuratele":"nemăsurat","nemasurati":"nemăsurat","nemasuratii":"nemăsurat","nemasuratul":"nemăsurat","nematelminti":"nematelmint","nematelmintii":"nematelmint","nematelmintilor":"nematelmint","nematelmintul":"nematelmint","nematelmintule":"nematelmint","nematelmintului":"nematelmint","nematociste":"nematocist","nematocistele":"nematocist","nematocistelor":"nematocist","nematocistul":"nematocist","nematocistule":"nematocist","nematocistului":"nematocist","nematodul":"nematod","nematodule":"nematod","nematodului":"nematod","nematozi":"nematod","nematozii":"nematod","nematozilor":"nematod","nemenia":"nemenie","nemeniei":"nemenie","nemenii":"nemenie","nemeniile":"nemenie","nemeniilor":"nemenie","nemerea":"nemeri","nemereai":"nemeri","nemeream":"nemeri","nemereati":"nemeri","nemereau":"nemeri","nemeresc":"nemeri","nemereste":"nemeri","nemeresti":"nemeri","nemerii":"nemeri","nemerim":"nemeri","nemerind":"nemeri","nemerira":"nemeri","nemeriram":"nemeri","nemerirati":"nemeri","nemerise":"nemeri","nemerisem":"nemeri","nemerisera":"nemeri","nemeriseram":"nemeri","nemeriserati":"nemeri","nemerisesi":"nemeri","nemerisi":"nemeri","nemerit":"nemeri","nemerita":["nemerită","nemerit","nemerita","nemerit"],"nemeritata":["nemeritată","nemeritat","nemeritata","nemeritat"],"nemeritate":"nemeritat","nemeritatele":"nemeritat","nemeritati":"nemeritat","nemeritatii":"nemeritat","nemeritatul":"nemeritat","nemerite":"nemerit","nemeritele":"nemerit","nemeriti":["nemeriți","nemeri","nemeriți","nemerit"],"nemeritii":"nemerit","nemeritul":"nemerit","nemernica":["nemernică","nemernic","nemernica","nemernic"],"nemernice":["nemernice","nemernic","nemernice","nemernică"],"nemernicea":"nemernici","nemerniceai":"nemernici","nemerniceam":"nemernici","nemerniceati":"nemernici","nemerniceau":"nemernici","nemernicei":"nemernică","nemernicele":["nemernicele","nemernic","nemernicele","nemernică"],"nemernicelor":"nemernică","nemernicesc":"nemernici","nemerniceste":"nemernici","nemernicesti":"nemernici","nemernici":"nemernic","nemernicia":"nemernicie","nemerniciei":"nemernicie","nemernicii":["nemernicii","nemernic","nemernicii","nemernici","nemernicii","nemernicie"],"nemerniciile":"nemernicie","nemerniciilor":"nemernicie","nemernicim":"nemernici","nemernicind":"nemernici","nemernicira":"nemernici","nemerniciram":"nemernici","nemernicirati":"nemernici","nemernicise":"nemernici","nemernicisem":"nemernici","nemernicisera":"nemernici","nemerniciseram":"nemernici","nemerniciserati":"nemernici","nemernicisesi":"nemernici","nemernicisi":"nemernici","nemernicit":"nemernici","nemerniciti":"nemernici","nemernicul":"nemernic","nemese":"nemeșă","nemesei":["nemeșei","nemeșă","nemeșei","nemeșel"],"nemeseii":"nemeșel","nemeseilor":"nemeșel","nemesela":["nemeșelă","nemeșel","nemeșela","nemeșel"],"nemesele":["nemeșele","nemeșă","nemeșele","nemeșel"],"nemeselele":"nemeșel","nemeseli":"nemeșel","nemeselii":"nemeșel","nemeselor":"nemeșă","nemeselul":"nemeșel","nemeselule":"nemeșel","nemeselului":"nemeșel","nemesi":"nemeș","nemesia":"nemeșie","nemesiei":"nemeșie","nemesii":["nemeșii","nemeș","nemeșii","nemeșie"],"nemesilor":"nemeș","nemesimea":"nemeșime","nemesimi":"nemeșime","nemesimii":"nemeșime","nemesimile":"nemeșime","nemesimilor":"nemeșime","nemesoaice":"nemeșoaică","nemesoaicei":"nemeșoaică","nemesoaicele":"nemeșoaică","nemesoaicelor":"nemeșoaică","nemestnicia":"nemestnicie","nemestniciei":"nemestnicie","nemestnicii":"nemestnicie","nemestniciile":"nemestnicie","nemestniciilor":"nemestnicie","nemesugul":"nemeșug","nemesugule":"nemeșug","nemesugului":"nemeșug","nemesuguri":"nemeșug","nemesugurile":"nemeșug","nemesugurilor":"nemeșug","nemesul":"nemeș","nemesule":"nemeș","nemesului":"nemeș","nemetale":"nemetal","nemetalele":"nemetal","nemetalelor":"nemetal","nemetalul":"nemetal","nemetalule":"nemetal","nemetalului":"nemetal","nemetea":"nemeți","nemeteai":"nemeți","nemeteam":"nemeți","nemeteati":"nemeți","nemeteau":"nemeți","nemetesc":"nemeți","nemeteste":"nemeți","nemetesti":"nemeți","nemeteul":"nemete","nemeteule":"nemete","nemeteului":"nemete","nemeti":"nemete","nemetii":["nemeții","nemete","nemeții","nemeți"],"nemetilor":"nemete","nemetim":"nemeți","nemetind":"nemeți","nemetira":"nemeți","nemetiram":"nemeți","nemetirati":"nemeți","nemetise":"nemeți","nemetisem":"nemeți","nemetisera":"nemeți","nemetiseram":"nemeți","nemetiserati":"nemeți","nemetisesi":"nemeți","nemetisi":"nemeți","nemetit":"nemeți","nemetiti":"nemeți","nemetul":"nemet","nemetule":"nemet","nemetului":"nemet","nemeturi":"nemet","nemeturile":"nemet","nemeturilor":"nemet","nemica":"nimic","nemijlocita":["nemijlocită","nemijlocit","nemijlocita","nemijlocit"],"nemijlocite":"nemijlocit","nemijlocitele":"nemijlocit","nemijlociti":"nemijlocit","nemijlocitii":"nemijlocit","nemijlocitul":"nemijlocit","nemile":"nemilă","nemilei":"nemilă","nemilele":"nemilă","nemilelor":"nemilă","nemiloasa":["nemiloasă","nemilos","nemiloasa","nemilos"],"nemiloase":"nemilos","nemiloasele":"nemilos","nemilosardia":"nemilosârdie","nemilosardiei":"nemilosârdie","nemilosardii":"nemilosârdie","nemilosardiile":"nemilosârdie","nemilosardiilor":"nemilosârdie","nemilosi":"nemilos","nemilosii":"nemilos","nemilostenia":"nemilostenie","nemilosteniei":"nemilostenie","nemilostenii":"nemilostenie","nemilosteniile":"nemilostenie","nemilosteniilor":"nemilostenie","nemilostiva":["nemilostivă","nemilostiv","nemilostiva","nemilostiv"],"nemilostive":"nemilostiv","nemilostivele":"nemilostiv","nemilostivi":"nemilostiv","nemilostivii":"nemilostiv","nemilostivirea":"nemilostivire","nemilostiviri":"nemilostivire","nemilostivirii":"nemilostivire","nemilostivirile":"nemilostivire","nemilostivirilor":"nemilostivire","nemilostivnicia":"nemilostivnicie","nemilostivniciei":"nemilostivnicie","nemilostivnicii":"nemilostivnicie","nemilostivniciile":"nemilostivnicie","nemilostivniciilor":"nemilostivnicie","nemilostivul":"nemilostiv","nemilosul":"nemilos","nemiluirea":"nemiluire","nemiluiri":"nemiluire","nemiluirii":"nemiluire","nemiluirile":"nemiluire","nemiluirilor":"nemiluire","nemiluita":["nemiluită","nemiluit","nemiluita","nemiluit"],"nemiluite":"nemiluit","nemiluitele":"nemiluit","nemiluiti":"nemiluit","nemiluitii":"nemiluit","nemiluitul":"nemiluit","nemintoasa":["nemintoasă","nemintos","nemintoasa","nemintos"],"nemintoase":"nemintos","nemintoasele":"nemintos","nemintosi":"nemintos","nemintosii":"nemintos","nemintosilor":"nemintos","nemintosul":"nemintos","nemintosule":"nemintos","nemintosului":"nemintos","nemiscarea":"nemișcare","nemiscari":"nemișcare","nemiscarii":"nemișcare","nemiscata":["nemișcată","nemișcat","nemișcata","nemișcat"],"nemiscate":"nemișcat","nemiscatele":"nemișcat","nemiscati":"nemișcat","nemiscatii":"nemișcat","nemiscatoare":"nemișcător","nemiscatoarea":"nemișcător","nemiscatoarele":"nemișcător","nemiscatori":"nemișcător","nemiscatorii":"nemișcător","nemiscatorul":"nemișcător","nemiscatul":"nemișcat","nemoarta":"nemort","nemoarte":"nemort","nemoralitatea":"nemoralitate","nemoralitati":"nemoralitate","nemoralitatii":"nemoralitate","nemoralitatile":"nemoralitate","nemoralitatilor":"nemoralitate","nemorta":["nemortă","nemort","nemorta","nemort"],"nemorte":"nemort","nemortea":"nemoarte","nemortele":"nemort","nemorti":["nemorți","nemoarte","nemorți","nemort"],"nemortii":["nemorții","nemoarte","nemorții","nemort"],"nemortul":"nemort","nemotivata":["nemotivată","nemotivat","nemotivata","nemotivat"],"nemotivate":"nemotivat","nemotivatele":"nemotivat","nemotivati":"nemotivat","nemotivatii":"nemotivat","nemotivatul":"nemotivat","nemtalai":"nemțălău","nemtalaii":"nemțălău","nemtalailor":"nemțălău","nemtalaul":"nemțălău","nemtalaule":"nemțălău","nemtalaului":"nemțălău","nemtea":"nemți","nemteai":"nemți","nemteam":"nemți","nemteanul":"nemțean","nemteanule":"nemțean","nemteanului":"nemțean","nemteasca":["nemțească","nemțesc","nemțeasca","nemțesc"],"nemteati":"nemți","nemteau":"nemți","nemtence":"nemțeancă","nemtencei":"nemțeancă","nemtencele":"nemțeancă","nemtencelor":"nemțeancă","nemtene":"nemțeană","nemtenei":"nemțeană","nemtenele":"nemțeană","nemtenelor":"nemțeană","nemteni":"nemțean","nemtenii":"nemțean","nemtenilor":"nemțean","nemtesc":"nemți","nemtescul":"nemțesc","nemteste":"nemți","nemtesti":["nemțești","nemțesc","nemțești","nemți"],"nemtestii":"nemțesc","nemtestile":"nemțesc","nemti":"neamț","nemtia":"nemție","nemtiei":"nemție","nemtii":["nemții","neamț","nemții","nemți","nemții","nemție"],"nemtilor":"neamț","nemtim":"nemți","nemtimea":"nemțime","nemtimei":"nemțime","nemtind":"nemți","nemtira":"nemți","nemtiram":"nemți","nemtirati":"nemți","nemtise":"nemți","nemtisem":"nemți","nemtisera":"nemți","nemtiseram":"nemți","nemtiserati":"nemți","nemtisesi":"nemți","nemtisi":"nemți","nemtisori":["nemțisori","nemțișor","nemțișori","nemțișor"],"nemtisorii":"nemțișor","nemtisorilor":"nemțișor","nemtisorul":"nemțișor","nemtisorule":"nemțișor","nemtisorului":"nemțișor","nemtit":"nemți","nemtiti":"nemți","nemtoaice":"nemțoaică","nemtoaicei":"nemțoaică","nemtoaicele":"nemțoaică","nemtoaicelor":"nemțoaică","nemtofila":["nemțofilă","nemțofil","nemțofila","nemțofil"],"nemtofile":["nemțofile","nemțofil","nemțofile","nemțofilă"],"nemtofilei":"nemțofilă","nemtofilele":["nemțofilele","nemțofil","nemțofilele","nemțofilă"],"nemtofilelor":"nemțofilă","nemtofili":"nemțofil","nemtofilii":"nemțofil","nemtofililor":"nemțofil","nemtofilul":"nemțofil","nemtofilule":"nemțofil","nemtofilului":"nemțofil","nemtoicute":"nemțoicuță","nemtoicutei":"nemțoicuță","nemtoicutele":"nemțoicuță","nemtoicutelor":"nemțoicuță","nemtoii":"nemțoi","nemtoilor":"nemțoi","nemtoiul":"nemțoi","nemtoiule":"nemțoi","nemtoiului":"nemțoi","nemultamea":"nemulțămi","nemultameai":"nemulțămi","nemultameam":"nemulțămi","nemultameati":"nemulțămi","nemultameau":"nemulțămi","nemultamesc":"nemulțămi","nemultameste":"nemulțămi","nemultamesti":"nemulțămi","nemultamii":"nemulțămi","nemultamim":"nemulțămi","nemultamind":"nemulțămi","nemultamira":"nemulțămi","nemultamiram":"nemulțămi","nemultamirati":"nemulțămi","nemultamirea":"nemulțămire","nemultamiri":"nemulțămire","nemultamirii":"nemulțămire","nemultamirile":"nemulțămire","nemultamirilor":"nemulțămire","nemultamise":"nemulțămi","nemultamisem":"nemulțămi","nemultamisera":"nemulțămi","nemultamiseram":"nemulțămi","nemultamiserati":"nemulțămi","nemultamisesi":"nemulțămi","nemultamisi":"nemulțămi","nemultamit":"nemulțămi","nemultamita":["nemulțămită","nemulțămit","nemulțămita","nemulțămit"],"nemultamite":"nemulțămit","nemultamitele":"nemulțămit","nemultamiti":["nemulțămiți","nemulțămi","nemulțămiți","nemulțămit"],"nemultamitii":"nemulțămit","nemultamitoare":"nemulțămitor","nemultamitoarea":"nemulțămitor","nemultamitoarele":"nemulțămitor","nemultamitori":"nemulțămitor","nemultamitorii":"nemulțămitor","nemultamitorul":"nemulțămitor","nemultamitul":"nemulțămit","nemultumea":"nemulțumi","nemultumeai":"nemulțumi","nemultumeam":"nemulțumi","nemultumeati":"nemulțumi","nemultumeau":"nemulțumi","nemultumesc":"nemulțumi","nemultumeste":"nemulțumi","nemultumesti":"nemulțumi","nemultumii":"nemulțumi","nemultumim":"nemulțumi","nemultumind":"nemulțumi","nemultumira":"nemulțumi","nemultumiram":"nemulțumi","nemultumirati":"nemulțumi","nemultumirea":"nemulțumire","nemultumiri":"nemulțumire","nemultumirii":"nemulțumire","nemultumirile":"nemulțumire","nemultumirilor":"nemulțumire","nemultumise":"nemulțumi","nemultumisem":"nemulțumi","nemultumisera":"nemulțumi","nemultumiseram":"nemulțumi","nemultumiserati":"nemulțumi","nemultumisesi":"nemulțumi","nemultumisi":"nemulțumi","nemultumit":"nemulțumi","nemultumita":["nemulțumită","nemulțumit","nemulțumita","nemulțumit"],"nemultumite":"nemulțumit","nemultumitele":"nemulțumit","nemultumiti":["nemulțumiți","nemulțumi","nemulțumiți","nemulțumit"],"nemultumitii":"nemulțumit","nemultumitoare":"nemulțumitor","nemultumitoarea":"nemulțumitor","nemultumitoarele":"nemulțumitor","nemultumitori":"nemulțumitor","nemultumitorii":"nemulțumitor","nemultumitorul":"nemulțumitor","nemultumitul":"nemulțumit","nemurea":"nemuri","nemureai":"nemuri","nemuream":"nemuri","nemureati":"nemuri","nemureau":"nemuri","nemuresc":"nemuri","nemureste":"nemuri","nemuresti":"nemuri","nemurii":"nemuri","nemurim":"nemuri","nemurind":"nemuri","nemurira":"nemuri","nemuriram":"nemuri","nemurirati":"nemuri","nemuriri":"nemurire","nemurise":"nemuri","nemurisem":"nemuri","nemurisera":"nemuri","nemuriseram":"nemuri","nemuriserati":"nemuri","nemurisesi":"nemuri","nemurisi":"nemuri","nemurit":"nemuri","nemuriti":"nemuri","nemuritoare":"nemuritor","nemuritoarea":["nemuritoarea","nemuritoare","nemuritoarea","nemuritor"],"nemuritoarei":"nemuritoare","nemuritoarele":["nemuritoarele","nemuritoare","nemuritoarele","nemuritor"],"nemuritoarelor":"nemuritoare","nemuritori":"nemuritor","nemuritoria":"nemuritorie","nemuritoriei":"nemuritorie","nemuritorii":["nemuritorii","nemuritor","nemuritorii","nemuritorie"],"nemuritoriile":"nemuritorie","nemuritoriilor":"nemuritorie","nemuritorul":"nemuritor","nemutatul":"nemutat","nemutatule":"nemutat","nemutatului":"nemutat","nemutul":"nemuț","nemutule":"nemuț","nemutului":"nemuț","nemuturi":"nemuț","nemuturile":"nemuț","nemuturilor":"nemuț","nemzetul":"nemzet","nemzetule":"nemzet","nemzetului":"nemzet","nemzeturi":"nemzet","nemzeturile":"nemzet","nemzeturilor":"nemzet","nenaravia":"nenărăvie","nenaraviei":"nenărăvie","nenaravii":"nenărăvie","nenaraviile":"nenărăvie","nenaraviilor":"nenărăvie","nenaturala":["nenaturală","nenatural","nenaturala","nenatural"],"nenaturale":"nenatural","nenaturalele":"nenatural","nenaturali":"nenatural","nenaturalii":"nenatural","nenaturalul":"nenatural","nenavigabila":["nenavigabilă","nenavigabil","nenavigabila","nenavigabil"],"nenavigabile":"nenavigabil","nenavigabilele":"nenavigabil","nenavigabili":"nenavigabil","nenavigabilii":"nenavigabil","nenavigabilul":"nenavigabil","nenavistia":"nenavistie","nenavistiei":"nenavistie","nenavistii":"nenavistie","nenavistiile":"nenavistie","nenavistiilor":"nenavistie","nencetata":["nencetată","nencetat","nencetata","nencetat"],"nencetate":"nencetat","nencetatele":"nencetat","nencetati":"nencetat","nencetatii":"nencetat","nencetatul":"nencetat","nenduplecata":["nenduplecată","nenduplecat","nenduplecata","nenduplecat"],"nenduplecate":"nenduplecat","nenduplecatele":"nenduplecat","nenduplecati":"nenduplecat","nenduplecatii":"nenduplecat","nenduplecatul":"nenduplecat","nendurata":["nendurată","nendurat","nendurata","nendurat"],"nendurate":"nendurat","nenduratele":"nendurat","nendurati":"nendurat","nenduratii":"nendurat","nenduratul":"nendurat","nenece":"neneacă","nenecei":"neneacă","nenecele":"neneacă","nenecelor":"neneacă","neneci":"neneacă","nenecute":"nenecuță","nenecutei":"nenecuță","nenecutele":"nenecuță","nenecutelor":"nenecuță","nenegativa":["nenegativă","nenegativ","nenegativa","nenegativ"],"nenegative":"nenegativ","nenegativele":"nenegativ","nenegativi":"nenegativ","nenegativii":"nenegativ","nenegativul":"nenegativ","nenemerirea":"nenemerire","nenemeriri":"nenemerire","nenemeririi":"nenemerire","nenemeririle":"nenemerire","nenemeririlor":"nenemerire","nengrijirea":"nengrijire","nengrijiri":"nengrijire","nengrijirii":"nengrijire","nengrijirile":"nengrijire","nengrijirilor":"nengrijire","nenicul":"nenic","nenicule":"nenic","nenicului":"nenic","nenimerele":"nenimereală","nenimerelei":"nenimereală","nenimerelele":"nenimereală","nenimerelelor":"nenimereală","nenimereli":"nenimereală","nenisori":"nenișor","nenisorii":"nenișor","nenisorilor":"nenișor","nenisorul":"nenișor","nenisorule":"nenișor","nenisorului":"nenișor","neniuluci":"neniuluc","neniulucii":"neniuluc","neniulucilor":"neniuluc","neniulucul":"neniuluc","neniulucule":"neniuluc","neniulucului":"neniuluc","neniuluti":"neniuluț","neniulutii":"neniuluț","neniulutilor":"neniuluț","neniulutul":"neniuluț","neniulutule":"neniuluț","neniulutului":"neniuluț","neniuti":"neniuț","neniutii":"neniuț","neniutilor":"neniuț","neniutul":"neniuț","neniutule":"neniuț","neniutului":"neniuț","nenormata":["nenormată","nenormat","nenormata","nenormat"],"nenormate":"nenormat","nenormatele":"nenormat","nenormati":"nenormat","nenormatii":"nenormat","nenormatul":"nenormat","nenorocea":"nenoroci","nenoroceai":"nenoroci","nenoroceam":"nenoroci","nenoroceati":"nenoroci","nenoroceau":"nenoroci","nenorocesc":"nenoroci","nenoroceste":"nenoroci","nenorocesti":"nenoroci","nenorocii":"nenoroci","nenorocim":"nenoroci","nenorocind":"nenoroci","nenorocira":"nenoroci","nenorociram":"nenoroci","nenorocirati":"nenoroci","nenorociri":"nenorocire","nenorocise":"nenoroci","nenorocisem":"nenoroci","nenorocisera":"nenoroci","nenorociseram":"nenoroci","nenorociserati":"nenoroci","nenorocisesi":"nenoroci","nenorocisi":"nenoroci","nenorocit":"nenoroci","nenorocita":["nenorocită","nenorocit","nenorocita","nenorocit"],"nenorocite":["nenorocite","nenorocit","nenorocite","nenorocită"],"nenorocitei":"nenorocită","nenorocitele":["nenorocitele","nenorocit","nenorocitele","nenorocită"],"nenorocitelor":"nenorocită","nenorociti":["nenorociți","nenoroci","nenorociți","nenorocit"],"nenorocitii":"nenorocit","nenorocitilor":"nenorocit","nenorocitul":"nenorocit","nenorocitule":"nenorocit","nenorocitului":"nenorocit","nenorocoasa":["nenorocoasă","nenorocos","nenorocoasa","nenorocos"],"nenorocoase":"nenorocos","nenorocoasele":"nenorocos","nenorocosi":"nenorocos","nenorocosii":"nenorocos","nenorocosul":"nenorocos","nentrecuta":["nentrecută","nentrecut","nentrecuta","nentrecut"],"nentrecute":"nentrecut","nentrecutele":"nentrecut","nentrecuti":"nentrecut","nentrecutii":"nentrecut","nentrecutul":"nentrecut","nentrerupta":["nentreruptă","nentrerupt","nentrerupta","nentrerupt"],"nentrerupte":"nentrerupt","nentreruptele":"nentrerupt","nentrerupti":"nentrerupt","nentreruptii":"nentrerupt","nentreruptul":"nentrerupt","nenufari":"nenufar","nenufarii":"nenufar","nenufarilor":"nenufar","nenufarul":"nenufar","nenufarule":"nenufar","nenufarului":"nenufar","nenula":["nenulă","nenul","nenula","nenul"],"nenule":"nenul","nenulele":"nenul","nenuli":"nenul","nenulii":"nenul","nenulul":"nenul","nenumarabila":["nenumărabilă","nenumărabil","nenumărabila","nenumărabil"],"nenumarabile":"nenumărabil","nenumarabilele":"nenumărabil","nenumarabili":"nenumărabil","nenumarabilii":"nenumărabil","nenumarabilul":"nenumărabil","nenumarata":["nenumărată","nenumărat","nenumărata","nenumărat"],"nenumarate":"nenumărat","nenumaratele":"nenumărat","nenumarati":"nenumărat","nenumaratii":"nenumărat","nenumaratul":"nenumărat","nenumerabil":"nenumărabil","nenvinsa":["nenvinsă","nenvins","nenvinsa","nenvins"],"nenvinse":"nenvins","nenvinsele":"nenvins","nenvinsi":"nenvins","nenvinsii":"nenvins","nenvinsul":"nenvins","neo-imperial":"neoimperial","neo-imperiala":["neo-imperială","neo-imperial","neo-imperiala","neo-imperial"],"neo-imperiale":"neo-imperial","neo-imperialele":"neo-imperial","neo-imperiali":"neo-imperial","neo-imperialii":"neo-imperial","neo-imperialul":"neo-imperial","neoameni":"neom","neoamenii":"neom","neoamenilor":"neom","neoantropi":"neoantrop","neoantropii":"neoantrop","neoantropilor":"neoantrop","neoantropul":"neoantrop","neoantropule":"neoantrop","neoantropului":"neoantrop","neoartroze":"neoartroză","neoartrozei":"neoartroză","neoartrozele":"neoartroză","neoartrozelor":"neoartroză","neoaspeteul":"neoaspete","neoaspeteule":"neoaspete","neoaspeteului":"neoaspete","neoaspeti":"neoaspete","neoaspetii":"neoaspete","neoaspetilor":"neoaspete","neobaroca":["neobarocă","neobaroc","neobaroca","neobaroc"],"neobaroce":"neobaroc","neobarocele":"neobaroc","neobaroci":"neobaroc","neobarocii":"neobaroc","neobarocile":"neobaroc","neobarocilor":"neobaroc","neobarocul":"neobaroc","neobarocule":"neobaroc","neobarocului":"neobaroc","neobedienta":["neobedientă","neobedient","neobedienta","neobedient"],"neobediente":"neobedient","neobedientele":"neobedient","neobedienti":"neobedient","neobedientii":"neobedient","neobedientul":"neobedient","neobisnuinte":"neobișnuință","neobisnuintei":"neobișnuință","neobisnuita":["neobișnuită","neobișnuit","neobișnuita","neobișnuit"],"neobisnuite":"neobișnuit","neobisnuitele":"neobișnuit","neobisnuiti":"neobișnuit","neobisnuitii":"neobișnuit","neobisnuitul":"neobișnuit","neobligatoria":"neobligatoriu","neobligatorie":"neobligatoriu","neobligatorii":"neobligatoriu","neobligatoriii":"neobligatoriu","neobligatoriile":"neobligatoriu","neobligatoriul":"neobligatoriu","neobliterata":["neobliterată","neobliterat","neobliterata","neobliterat"],"neobliterate":"neobliterat","neobliteratele":"neobliterat","neobliterati":"neobliterat","neobliteratii":"neobliterat","neobliteratul":"neobliterat","neobosele":"neoboseală","neoboselei":"neoboseală","neobosita":["neobosită","neobosit","neobosita","neobosit"],"neobosite":"neobosit","neobositele":"neobosit","neobositi":"neobosit","neobositii":"neobosit","neobositul":"neobosit","neobrazarea":"neobrăzare","neobrazari":"neobrăzare","neobrazarii":"neobrăzare","neobrazati":"neobrăzat","neobrazatii":"neobrăzat","neobrazatilor":"neobrăzat","neobrazatul":"neobrăzat","neobrazatule":"neobrăzat","neobrazatului":"neobrăzat","neobservata":["neobservată","neobservat","neobservata","neobservat"],"neobservate":"neobservat","neobservatele":"neobservat","neobservati":"neobservat","neobservatii":"neobservat","neobservatul":"neobservat","neocapitalisme":"neocapitalism","neocapitalismele":"neocapitalism","neocapitalismelor":"neocapitalism","neocapitalismul":"neocapitalism","neocapitalismule":"neocapitalism","neocapitalismului":"neocapitalism","neocapitaliste":"neocapitalistă","neocapitalistei":"neocapitalistă","neocapitalistele":"neocapitalistă","neocapitalistelor":"neocapitalistă","neocapitalisti":"neocapitalist","neocapitalistii":"neocapitalist","neocapitalistilor":"neocapitalist","neocapitalistul":"neocapitalist","neocapitalistule":"neocapitalist","neocapitalistului":"neocapitalist","neocatolica":["neocatolică","neocatolic","neocatolica","neocatolic"],"neocatolice":["neocatolice","neocatolic","neocatolice","neocatolică"],"neocatolicei":"neocatolică","neocatolicele":["neocatolicele","neocatolic","neocatolicele","neocatolică"],"neocatolicelor":"neocatolică","neocatolici":"neocatolic","neocatolicii":"neocatolic","neocatolicisme":"neocatolicism","neocatolicismele":"neocatolicism","neocatolicismelor":"neocatolicism","neocatolicismul":"neocatolicism","neocatolicismule":"neocatolicism","neocatolicismului":"neocatolicism","neocatolicul":"neocatolic","neocite":"neocit","neocitele":"neocit","neocitelor":"neocit","neocitul":"neocit","neocitule":"neocit","neocitului":"neocit","neoclasica":["neoclasică","neoclasic","neoclasica","neoclasic"],"neoclasice":"neoclasic","neoclasicele":"neoclasic","neoclasici":"neoclasic","neoclasicii":"neoclasic","neoclasicisme":"neoclasicism","neoclasicismele":"neoclasicism","neoclasicismelor":"neoclasicism","neoclasicismul":"neoclasicism","neoclasicismule":"neoclasicism","neoclasicismului":"neoclasicism","neoclasicul":"neoclasic","neocolonialismul":"neocolonialism","neocolonialismule":"neocolonialism","neocolonialismului":"neocolonialism","neocolonialista":["neocolonialistă","neocolonialist","neocolonialista","neocolonialist"],"neocolonialiste":["neocolonialiste","neocolonialist","neocolonialiste","neocolonialistă"],"neocolonialistei":"neocolonialistă","neocolonialistele":["neocolonialistele","neocolonialist","neocolonialistele","neocolonialistă"],"neocolonialistelor":"neocolonialistă","neocolonialisti":"neocolonialist","neocolonialistii":"neocolonialist","neocolonialistilor":"neocolonialist","neocolonialistul":"neocolonialist","neocolonialistule":"neocolonialist","neocolonialistului":"neocolonialist","neocomiana":["neocomiană","neocomian","neocomiana","neocomian"],"neocomiani":"neocomian","neocomianile":"neocomian","neocomianilor":"neocomian","neocomianul":"neocomian","neocomianule":"neocomian","neocomianului":"neocomian","neocomiene":"neocomian","neocomienele":"neocomian","neocomieni":"neocomian","neocomienii":"neocomian","neocomunismul":"neocomunism","neocomunismule":"neocomunism","neocomunismului":"neocomunism","neocomunista":["neocomunistă","neocomunist","neocomunista","neocomunist"],"neocomuniste":["neocomuniste","neocomunist","neocomuniste","neocomunistă"],"neocomunistei":"neocomunistă","neocomunistele":["neocomunistele","neocomunist","neocomunistele","neocomunistă"],"neocomunistelor":"neocomunistă","neocomunisti":"neocomunist","neocomunistii":"neocomunist","neocomunistilor":"neocomunist","neocomunistul":"neocomunist","neocomunistule":"neocomunist","neocomunistului":"neocomunist","neoconfucianismul":"neoconfucianism","neoconfucianismule":"neoconfucianism","neoconfucianismului":"neoconfucianism","neocortexul":"neocortex","neocortexule":"neocortex","neocortexului":"neocortex","neocortexuri":"neocortex","neocortexurile":"neocortex","neocortexurilor":"neocortex","neocritica":["neocritică","neocritic","neocritica","neocritic"],"neocritice":["neocritice","neocritic","neocritice","neocritică"],"neocriticei":"neocritică","neocriticele":"neocritic","neocritici":"neocritic","neocriticii":"neocritic","neocriticismul":"neocriticism","neocriticismule":"neocriticism","neocriticismului":"neocriticism","neocriticiste":"neocriticistă","neocriticistei":"neocriticistă","neocriticistele":"neocriticistă","neocriticistelor":"neocriticistă","neocriticisti":"neocriticist","neocriticistii":"neocriticist","neocriticistilor":"neocriticist","neocriticistul":"neocriticist","neocriticistule":"neocriticist","neocriticistului":"neocriticist","neocriticul":"neocritic","neocupata":["neocupată","neocupat","neocupata","neocupat"],"neocupate":"neocupat","neocupatele":"neocupat","neocupati":"neocupat","neocupatii":"neocupat","neocupatul":"neocupat","neodarwinisme":"neodarwinism","neodarwinismele":"neodarwinism","neodarwinismelor":"neodarwinism","neodarwinismul":"neodarwinism","neodarwinismule":"neodarwinism","neodarwinismului":"neodarwinism","neodarwiniste":"neodarwinistă","neodarwinistei":"neodarwinistă","neodarwinistele":"neodarwinistă","neodarwinistelor":"neodarwinistă","neodarwinisti":"neodarwinist","neodarwinistii":"neodarwinist","neodarwinistilor":"neodarwinist","neodarwinistul":"neodarwinist","neodarwinistule":"neodarwinist","neodarwinistului":"neodarwinist","neodihne":"neodihnă","neodihnea":"neodihni","neodihneai":"neodihni","neodihneam":"neodihni","neodihneati":"neodihni","neodihneau":"neodihni","neodihnei":"neodihnă","neodihnesc":"neodihni","neodihneste":"neodihni","neodihnesti":"neodihni","neodihnii":"neodihni","neodihnim":"neodihni","neodihnind":"neodihni","neodihnira":"neodihni","neodihniram":"neodihni","neodihnirati":"neodihni","neodihnirea":"neodihnire","neodihniri":"neodihnire","neodihnirii":"neodihnire","neodihnirile":"neodihnire","neodihnirilor":"neodihnire","neodihnise":"neodihni","neodihnisem":"neodihni","neodihnisera":"neodihni","neodihniseram":"neodihni","neodihniserati":"neodihni","neodihnisesi":"neodihni","neodihnisi":"neodihni","neodihnit":"neodihni","neodihnita":["neodihnită","neodihnit","neodihnita","neodihnit"],"neodihnite":"neodihnit","neodihnitele":"neodihnit","neodihniti":["neodihniți","neodihni","neodihniți","neodihnit"],"neodihnitii":"neodihnit","neodihnitul":"neodihnit","neodimul":"neodim","neodimule":"neodim","neodimului":"neodim","neoecologia":"neoecologie","neoecologiei":"neoecologie","neoecologii":"neoecologie","neofaline":"neofalină","neofalinei":"neofalină","neofalinele":"neofalină","neofalinelor":"neofalină","neofascismul":"neofascism","neofascismule":"neofascism","neofascismului":"neofascism","neofasciste":"neofascistă","neofascistei":"neofascistă","neofascistele":"neofascistă","neofascistelor":"neofascistă","neofascisti":"neofascist","neofascistii":"neofascist","neofascistilor":"neofascist","neofascistul":"neofascist","neofascistule":"neofascist","neofascistului":"neofascist","neoficiala":["neoficială","neoficial","neoficiala","neoficial"],"neoficiale":"neoficial","neoficialele":"neoficial","neoficiali":"neoficial","neoficialii":"neoficial","neoficialul":"neoficial","neofili":"neofil","neofilia":"neofilie","neofiliei":"neofilie","neofilii":["neofilii","neofil","neofilii","neofilie"],"neofiliile":"neofilie","neofiliilor":"neofilie","neofililor":"neofil","neofilul":"neofil","neofilule":"neofil","neofilului":"neofil","neofite":"neofită","neofitei":"neofită","neofitele":"neofită","neofitelor":"neofită","neofiti":"neofit","neofitii":"neofit","neofitilor":"neofit","neofitul":"neofit","neofitule":"neofit","neofitului":"neofit","neofobia":"neofobie","neofobiei":"neofobie","neofobii":"neofobie","neofobiile":"neofobie","neofobiilor":"neofobie","neoformatia":"neoformație","neoformatiei":"neoformație","neoformatii":"neoformație","neoformatiile":"neoformație","neoformatiilor":"neoformație","neoformatiunea":"neoformațiune","neoformatiuni":"neoformațiune","neoformatiunii":"neoformațiune","neoformatiunile":"neoformațiune","neoformatiunilor":"neoformațiune","neofreudisme":"neofreudism","neofreudismele":"neofreudism","neofreudismelor":"neofreudism","neofreudismul":"neofreudism","neofreudismule":"neofreudism","neofreudismului":"neofreudism","neogami":"neogam","neogamii":"neogam","neogamilor":"neogam","neogamul":"neogam","neogamule":"neogam","neogamului":"neogam","neogena":["neogenă","neogen","neogena","neogen"],"neogene":"neogen","neogenele":"neogen","neogeni":"neogen","neogenii":"neogen","neogenul":"neogen","neogotica":["neogotică","neogotic","neogotica","neogotic"],"neogotice":"neogotic","neogoticele":"neogotic","neogotici":"neogotic","neogoticii":"neogotic","neogoticul":"neogotic","neogramatica":["neogramatică","neogramatic","neogramatica","neogramatic"],"neogramatice":["neogramatice","neogramatic","neogramatice","neogramatică"],"neogramaticei":"neogramatică","neogramaticele":["neogramaticele","neogramatic","neogramaticele","neogramatică"],"neogramaticelor":"neogramatică","neogramatici":"neogramatic","neogramaticii":"neogramatic","neogramaticilor":"neogramatic","neogramaticul":"neogramatic","neogramaticule":"neogramatic","neogramaticului":"neogramatic","neogreaca":["neogreacă","neogrec","neogreaca","neogrec"],"neogrece":["neogrece","neogreacă","neogrece","neogrec"],"neogreceasca":["neogrecească","neogrecesc","neogreceasca","neogrecesc"],"neogrecei":"neogreacă","neogrecele":"neogrec","neogrecescul":"neogrecesc","neogrecesti":"neogrecesc","neogrecestii":"neogrecesc","neogrecestile":"neogrecesc","neogreci":"neogrec","neogrecii":"neogrec","neogrecul":"neogrec","neoguelfismul":"neoguelfism","neoguelfismule":"neoguelfism","neoguelfismului":"neoguelfism","neohegelianisme":"neohegelianism","neohegelianismele":"neohegelianism","neohegelianismelor":"neohegelianism","neohegelianismul":"neohegelianism","neohegelianismule":"neohegelianism","neohegelianismului":"neohegelianism","neohegelianul":"neohegelian","neohegelianule":"neohegelian","neohegelianului":"neohegelian","neohegeliene":"neohegeliană","neohegelienei":"neohegeliană","neohegelienele":"neohegeliană","neohegelienelor":"neohegeliană","neohegelieni":"neohegelian","neohegelienii":"neohegelian","neohegelienilor":"neohegelian","neoimperiala":["neoimperială","neoimperial","neoimperiala","neoimperial"],"neoimperiale":"neoimperial","neoimperialele":"neoimperial","neoimperiali":"neoimperial","neoimperialii":"neoimperial","neoimperialismul":"neoimperialism","neoimperialismule":"neoimperialism","neoimperialismului":"neoimperialism","neoimperialul":"neoimperial","neoimpresionisme":"neoimpresionism","neoimpresionismele":"neoimpresionism","neoimpresionismelor":"neoimpresionism","neoimpresionismul":"neoimpresionism","neoimpresionismule":"neoimpresionism","neoimpresionismului":"neoimpresionism","neoimpresioniste":"neoimpresionistă","neoimpresionistei":"neoimpresionistă","neoimpresionistele":"neoimpresionistă","neoimpresionistelor":"neoimpresionistă","neoimpresionisti":"neoimpresionist","neoimpresionistii":"neoimpresionist","neoimpresionistilor":"neoimpresionist","neoimpresionistul":"neoimpresionist","neoimpresionistule":"neoimpresionist","neoimpresionistului":"neoimpresionist","neojunimiste":"neojunimistă","neojunimistei":"neojunimistă","neojunimistele":"neojunimistă","neojunimistelor":"neojunimistă","neokantianismul":"neokantianism","neokantianismule":"neokantianism","neokantianismului":"neokantianism","neokantianul":"neokantian","neokantianule":"neokantian","neokantianului":"neokantian","neokantiene":"neokantiană","neokantienei":"neokantiană","neokantienele":"neokantiană","neokantienelor":"neokantiană","neokantieni":"neokantian","neokantienii":"neokantian","neokantienilor":"neokantian","neokeynesismul":"neokeynesism","neokeynesismule":"neokeynesism","neokeynesismului":"neokeynesism","neolamarckismul":"neolamarckism","neolamarckismule":"neolamarckism","neolamarckismului":"neolamarckism","neolatina":["neolatină","neolatin","neolatina","neolatin"],"neolatine":"neolatin","neolatinele":"neolatin","neolatini":"neolatin","neolatinii":"neolatin","neolatinul":"neolatin","neoliberala":["neoliberală","neoliberal","neoliberala","neoliberal"],"neoliberale":["neoliberale","neoliberal","neoliberale","neoliberală"],"neoliberalei":"neoliberală","neoliberalele":["neoliberalele","neoliberal","neoliberalele","neoliberală"],"neoliberalelor":"neoliberală","neoliberali":"neoliberal","neoliberalii":"neoliberal","neoliberalilor":"neoliberal","neoliberalisme":"neoliberalism","neoliberalismele":"neoliberalism","neoliberalismelor":"neoliberalism","neoliberalismul":"neoliberalism","neoliberalismule":"neoliberalism","neoliberalismului":"neoliberalism","neoliberalul":"neoliberal","neoliberalule":"neoliberal","neoliberalului":"neoliberal","neolimpica":["neolimpică","neolimpic","neolimpica","neolimpic"],"neolimpice":"neolimpic","neolimpicele":"neolimpic","neolimpici":"neolimpic","neolimpicii":"neolimpic","neolimpicul":"neolimpic","neolingviste":"neolingvistă","neolingvistei":"neolingvistă","neolingvistele":"neolingvistă","neolingvistelor":"neolingvistă","neolingvisti":"neolingvist","neolingvistice":"neolingvistică","neolingvisticei":"neolingvistică","neolingvisticele":"neolingvistică","neolingvisticelor":"neolingvistică","neolingvistii":"neolingvist","neolingvistilor":"neolingvist","neolingvistul":"neolingvist","neolingvistule":"neolingvist","neolingvistului":"neolingvist","neolitici":"neolitic","neoliticile":"neolitic","neoliticilor":"neolitic","neoliticul":"neolitic","neoliticule":"neolitic","neoliticului":"neolitic","neologi":"neolog","neologia":"neologie","neologica":["neologică","neologic","neologica","neologic"],"neologice":"neologic","neologicele":"neologic","neologici":"neologic","neologicii":"neologic","neologicul":"neologic","neologiei":"neologie","neologii":["neologii","neolog","neologii","neologie"],"neologiile":"neologie","neologiilor":"neologie","neologilor":"neolog","neologisme":"neologism","neologismele":"neologism","neologismelor":"neologism","neologismul":"neologism","neologismule":"neologism","neologismului":"neologism","neologisti":"neologist","neologistica":["neologistică","neologistic","neologistica","neologistic"],"neologistice":"neologistic","neologisticele":"neologistic","neologistici":"neologistic","neologisticii":"neologistic","neologisticul":"neologistic","neologistii":"neologist","neologistilor":"neologist","neologistul":"neologist","neologistule":"neologist","neologistului":"neologist","neologizai":"neologiza","neologizam":["neologizăm","neologiza","neologizam","neologiza"],"neologizand":"neologiza","neologizara":"neologiza","neologizaram":"neologiza","neologizarati":"neologiza","neologizase":"neologiza","neologizasem":"neologiza","neologizasera":"neologiza","neologizaseram":"neologiza","neologizaserati":"neologiza","neologizasesi":"neologiza","neologizasi":"neologiza","neologizat":"neologiza","neologizati":"neologiza","neologizau":"neologiza","neologizeaza":"neologiza","neologizez":"neologiza","neologizezi":"neologiza","neologul":"neolog","neologule":"neolog","neologului":"neolog","neomalthusianisme":"neomalthusianism","neomalthusianismele":"neomalthusianism","neomalthusianismelor":"neomalthusianism","neomalthusianismul":"neomalthusianism","neomalthusianismule":"neomalthusianism","neomalthusianismului":"neomalthusianism","neomalthusianiste":"neomalthusianistă"};
@@ -0,0 +1 @@
+export default {"neomalthusianistei":"neomalthusianistă","neomalthusianistele":"neomalthusianistă","neomalthusianistelor":"neomalthusianistă","neomalthusianisti":"neomalthusianist","neomalthusianistii":"neomalthusianist","neomalthusianistilor":"neomalthusianist","neomalthusianistul":"neomalthusianist","neomalthusianistule":"neomalthusianist","neomalthusianistului":"neomalthusianist","neomalthusianul":"neomalthusian","neomalthusianule":"neomalthusian","neomalthusianului":"neomalthusian","neomalthusiene":"neomalthusiană","neomalthusienei":"neomalthusiană","neomalthusienele":"neomalthusiană","neomalthusienelor":"neomalthusiană","neomalthusieni":"neomalthusian","neomalthusienii":"neomalthusian","neomalthusienilor":"neomalthusian","neomaltusianisti":"neomalthusianist","neomeneasca":["neomenească","neomenesc","neomeneasca","neomenesc"],"neomenescul":"neomenesc","neomenesti":"neomenesc","neomenestii":"neomenesc","neomenestile":"neomenesc","neomenia":"neomenie","neomeniei":"neomenie","neomenii":"neomenie","neomeniile":"neomenie","neomeniilor":"neomenie","neomenimea":"neomenime","neomenimi":"neomenime","neomenimii":"neomenime","neomenimile":"neomenime","neomenimilor":"neomenime","neomenirea":"neomenire","neomeniri":"neomenire","neomenirii":"neomenire","neomenirile":"neomenire","neomenirilor":"neomenire","neomenita":["neomenită","neomenit","neomenita","neomenit"],"neomenite":"neomenit","neomenitele":"neomenit","neomeniti":"neomenit","neomenitii":"neomenit","neomenitul":"neomenit","neomenoasa":["neomenoasă","neomenos","neomenoasa","neomenos"],"neomenoase":"neomenos","neomenoasele":"neomenos","neomenosi":"neomenos","neomenosii":"neomenos","neomenosul":"neomenos","neomicine":"neomicină","neomicinei":"neomicină","neomicinele":"neomicină","neomicinelor":"neomicină","neomul":"neom","neomule":"neom","neomului":"neom","neonatologe":"neonatologă","neonatologei":"neonatologă","neonatologele":"neonatologă","neonatologelor":"neonatologă","neonatologia":"neonatologie","neonatologiei":"neonatologie","neonatologii":"neonatologie","neonazismul":"neonazism","neonazismule":"neonazism","neonazismului":"neonazism","neonazista":["neonazistă","neonazist","neonazista","neonazist"],"neonaziste":["neonaziste","neonazist","neonaziste","neonazistă"],"neonazistei":"neonazistă","neonazistele":["neonazistele","neonazist","neonazistele","neonazistă"],"neonazistelor":"neonazistă","neonazisti":"neonazist","neonazistii":"neonazist","neonazistilor":"neonazist","neonazistul":"neonazist","neonazistule":"neonazist","neonazistului":"neonazist","neonul":"neon","neonule":"neon","neonului":"neon","neopaganismul":"neopăgânism","neopaganismule":"neopăgânism","neopaganismului":"neopăgânism","neoperabila":["neoperabilă","neoperabil","neoperabila","neoperabil"],"neoperabile":"neoperabil","neoperabilele":"neoperabil","neoperabili":"neoperabil","neoperabilii":"neoperabil","neoperabilul":"neoperabil","neopitagoriciana":["neopitagoriciană","neopitagorician","neopitagoriciana","neopitagorician"],"neopitagoricianul":"neopitagorician","neopitagoricianule":"neopitagorician","neopitagoricianului":"neopitagorician","neopitagoriciene":"neopitagorician","neopitagoricienele":"neopitagorician","neopitagoricieni":"neopitagorician","neopitagoricienii":"neopitagorician","neopitagoricienilor":"neopitagorician","neopitagorismul":"neopitagorism","neopitagorismule":"neopitagorism","neopitagorismului":"neopitagorism","neoplasme":"neoplasm","neoplasmele":"neoplasm","neoplasmelor":"neoplasm","neoplasmul":"neoplasm","neoplasmule":"neoplasm","neoplasmului":"neoplasm","neoplasticismul":"neoplasticism","neoplasticismule":"neoplasticism","neoplasticismului":"neoplasticism","neoplatonica":["neoplatonică","neoplatonic","neoplatonica","neoplatonic"],"neoplatonice":["neoplatonice","neoplatonic","neoplatonice","neoplatonică"],"neoplatonicei":"neoplatonică","neoplatonicele":["neoplatonicele","neoplatonic","neoplatonicele","neoplatonică"],"neoplatonicelor":"neoplatonică","neoplatonici":"neoplatonic","neoplatonicianul":"neoplatonician","neoplatonicianule":"neoplatonician","neoplatonicianului":"neoplatonician","neoplatoniciene":"neoplatoniciană","neoplatonicienei":"neoplatoniciană","neoplatonicienele":"neoplatoniciană","neoplatonicienelor":"neoplatoniciană","neoplatonicieni":"neoplatonician","neoplatonicienii":"neoplatonician","neoplatonicienilor":"neoplatonician","neoplatonicii":"neoplatonic","neoplatonicilor":"neoplatonic","neoplatonicul":"neoplatonic","neoplatonicule":"neoplatonic","neoplatonicului":"neoplatonic","neoplatonisme":"neoplatonism","neoplatonismele":"neoplatonism","neoplatonismelor":"neoplatonism","neoplatonismul":"neoplatonism","neoplatonismule":"neoplatonism","neoplatonismului":"neoplatonism","neoplazia":"neoplazie","neoplazica":["neoplazică","neoplazic","neoplazica","neoplazic"],"neoplazice":"neoplazic","neoplazicele":"neoplazic","neoplazici":"neoplazic","neoplazicii":"neoplazic","neoplazicul":"neoplazic","neoplaziei":"neoplazie","neoplazii":"neoplazie","neoplaziile":"neoplazie","neoplaziilor":"neoplazie","neoportuna":["neoportună","neoportun","neoportuna","neoportun"],"neoportune":"neoportun","neoportunele":"neoportun","neoportuni":"neoportun","neoportunii":"neoportun","neoportunul":"neoportun","neopozabila":["neopozabilă","neopozabil","neopozabila","neopozabil"],"neopozabile":"neopozabil","neopozabilele":"neopozabil","neopozabili":"neopozabil","neopozabilii":"neopozabil","neopozabilul":"neopozabil","neopozitivisme":"neopozitivism","neopozitivismele":"neopozitivism","neopozitivismelor":"neopozitivism","neopozitivismul":"neopozitivism","neopozitivismule":"neopozitivism","neopozitivismului":"neopozitivism","neopozitiviste":"neopozitivistă","neopozitivistei":"neopozitivistă","neopozitivistele":"neopozitivistă","neopozitivistelor":"neopozitivistă","neopozitivisti":"neopozitivist","neopozitivistii":"neopozitivist","neopozitivistilor":"neopozitivist","neopozitivistul":"neopozitivist","neopozitivistule":"neopozitivist","neopozitivistului":"neopozitivist","neopragmatismul":"neopragmatism","neopragmatismule":"neopragmatism","neopragmatismului":"neopragmatism","neoprenul":"neopren","neoprenule":"neopren","neoprenului":"neopren","neoprita":["neoprită","neoprit","neoprita","neoprit"],"neoprite":"neoprit","neopritele":"neoprit","neopriti":"neoprit","neopritii":"neoprit","neopritul":"neoprit","neopsihanalize":"neopsihanaliză","neopsihanalizei":"neopsihanaliză","neopsihanalizele":"neopsihanaliză","neopsihanalizelor":"neopsihanaliză","neoranduieli":"neorânduială","neoranduielii":"neorânduială","neoranduielile":"neorânduială","neoranduielilor":"neorânduială","neoranduita":["neorânduită","neorânduit","neorânduita","neorânduit"],"neoranduite":"neorânduit","neoranduitele":"neorânduit","neoranduiti":"neorânduit","neoranduitii":"neorânduit","neoranduitul":"neorânduit","neordinea":"neordine","neordini":"neordine","neordinii":"neordine","neorealismul":"neorealism","neorealismule":"neorealism","neorealismului":"neorealism","neorealiste":"neorealistă","neorealistei":"neorealistă","neorealistele":"neorealistă","neorealistelor":"neorealistă","neorealisti":"neorealist","neorealistii":"neorealist","neorealistilor":"neorealist","neorealistul":"neorealist","neorealistule":"neorealist","neorealistului":"neorealist","neorganica":["neorganică","neorganic","neorganica","neorganic"],"neorganice":"neorganic","neorganicele":"neorganic","neorganici":"neorganic","neorganicii":"neorganic","neorganicul":"neorganic","neorganizata":["neorganizată","neorganizat","neorganizata","neorganizat"],"neorganizate":"neorganizat","neorganizatele":"neorganizat","neorganizati":"neorganizat","neorganizatii":"neorganizat","neorganizatul":"neorganizat","neorientata":["neorientată","neorientat","neorientata","neorientat"],"neorientate":"neorientat","neorientatele":"neorientat","neorientati":"neorientat","neorientatii":"neorientat","neorientatul":"neorientat","neoromantica":["neoromantică","neoromantic","neoromantica","neoromantic"],"neoromantice":["neoromantice","neoromantic","neoromantice","neoromantică"],"neoromanticei":"neoromantică","neoromanticele":["neoromanticele","neoromantic","neoromanticele","neoromantică"],"neoromanticelor":"neoromantică","neoromantici":"neoromantic","neoromanticii":"neoromantic","neoromanticul":"neoromantic","neoromantisme":"neoromantism","neoromantismele":"neoromantism","neoromantismelor":"neoromantism","neoromantismul":"neoromantism","neoromantismule":"neoromantism","neoromantismului":"neoromantism","neosalvarsanul":"neosalvarsan","neosalvarsanule":"neosalvarsan","neosalvarsanului":"neosalvarsan","neosandita":["neosândită","neosândit","neosândita","neosândit"],"neosandite":"neosândit","neosanditele":"neosândit","neosanditi":"neosândit","neosanditii":"neosândit","neosanditul":"neosândit","neoscolastica":["neoscolastică","neoscolastic","neoscolastica","neoscolastic"],"neoscolastice":"neoscolastic","neoscolasticele":"neoscolastic","neoscolastici":"neoscolastic","neoscolasticii":"neoscolastic","neoscolasticilor":"neoscolastic","neoscolasticul":"neoscolastic","neoscolasticule":"neoscolastic","neoscolasticului":"neoscolastic","neosificata":["neosificată","neosificat","neosificata","neosificat"],"neosificate":"neosificat","neosificatele":"neosificat","neosificati":"neosificat","neosificatii":"neosificat","neosificatul":"neosificat","neostenita":["neostenită","neostenit","neostenita","neostenit"],"neostenite":"neostenit","neostenitele":"neostenit","neosteniti":"neostenit","neostenitii":"neostenit","neostenitul":"neostenit","neostoita":["neostoită","neostoit","neostoita","neostoit"],"neostoite":"neostoit","neostoitele":"neostoit","neostoiti":"neostoit","neostoitii":"neostoit","neostoitul":"neostoit","neotectoni":"neotectonic","neotectonice":"neotectonică","neotectonicei":"neotectonică","neotectonicele":"neotectonică","neotectonicelor":"neotectonică","neotectonici":"neotectonic","neotectonicii":"neotectonic","neotectonicile":"neotectonic","neotectonicilor":"neotectonic","neotenia":"neotenie","neoteniei":"neotenie","neotenii":"neotenie","neoterismosul":"neoterismos","neoterismosule":"neoterismos","neoterismosului":"neoterismos","neotetita":["neoțetită","neoțetit","neoțetita","neoțetit"],"neotetite":"neoțetit","neotetitele":"neoțetit","neotetiti":"neoțetit","neotetitii":"neoțetit","neotetitul":"neoțetit","neotia":"neotie","neotiei":"neotie","neotii":"neotie","neotiile":"neotie","neotiilor":"neotie","neotomisme":"neotomism","neotomismele":"neotomism","neotomismelor":"neotomism","neotomismul":"neotomism","neotomismule":"neotomism","neotomismului":"neotomism","neotomiste":"neotomistă","neotomistei":"neotomistă","neotomistele":"neotomistă","neotomistelor":"neotomistă","neotomisti":"neotomist","neotomistii":"neotomist","neotomistilor":"neotomist","neotomistul":"neotomist","neotomistule":"neotomist","neotomistului":"neotomist","neoumanismul":"neoumanism","neoumanismule":"neoumanism","neoumanismului":"neoumanism","neoumanista":["neoumanistă","neoumanist","neoumanista","neoumanist"],"neoumaniste":"neoumanist","neoumanistele":"neoumanist","neoumanisti":"neoumanist","neoumanistii":"neoumanist","neoumanistilor":"neoumanist","neoumanistul":"neoumanist","neoumanistule":"neoumanist","neoumanistului":"neoumanist","neovitalismul":"neovitalism","neovitalismule":"neovitalism","neovitalismului":"neovitalism","neovitalista":["neovitalistă","neovitalist","neovitalista","neovitalist"],"neovitaliste":"neovitalist","neovitalistele":"neovitalist","neovitalisti":"neovitalist","neovitalistii":"neovitalist","neovitalistilor":"neovitalist","neovitalistul":"neovitalist","neovitalistule":"neovitalist","neovitalistului":"neovitalist","neoxidabila":["neoxidabilă","neoxidabil","neoxidabila","neoxidabil"],"neoxidabile":"neoxidabil","neoxidabilele":"neoxidabil","neoxidabili":"neoxidabil","neoxidabilii":"neoxidabil","neoxidabilul":"neoxidabil","neoxidata":["neoxidată","neoxidat","neoxidata","neoxidat"],"neoxidate":"neoxidat","neoxidatele":"neoxidat","neoxidati":"neoxidat","neoxidatii":"neoxidat","neoxidatul":"neoxidat","neoxigenata":["neoxigenată","neoxigenat","neoxigenata","neoxigenat"],"neoxigenate":"neoxigenat","neoxigenatele":"neoxigenat","neoxigenati":"neoxigenat","neoxigenatii":"neoxigenat","neoxigenatul":"neoxigenat","neozeelandeze":"neozeelandeză","neozeelandezei":"neozeelandeză","neozeelandezele":"neozeelandeză","neozeelandezelor":"neozeelandeză","neozeelandezi":"neozeelandez","neozeelandezii":"neozeelandez","neozeelandezilor":"neozeelandez","neozeelandezul":"neozeelandez","neozeelandezule":"neozeelandez","neozeelandezului":"neozeelandez","neozoica":["neozoică","neozoic","neozoica","neozoic"],"neozoice":"neozoic","neozoicele":"neozoic","neozoici":"neozoic","neozoicii":"neozoic","neozoicul":"neozoic","neozonizata":["neozonizată","neozonizat","neozonizata","neozonizat"],"neozonizate":"neozonizat","neozonizatele":"neozonizat","neozonizati":"neozonizat","neozonizatii":"neozonizat","neozonizatul":"neozonizat","nepacea":"nepace","nepaci":"nepace","nepacii":"nepace","nepacile":"nepace","nepacilor":"nepace","nepaciuirea":"nepăciuire","nepaciuiri":"nepăciuire","nepaciuirii":"nepăciuire","nepaciuirile":"nepăciuire","nepaciuirilor":"nepăciuire","nepaleza":["nepaleză","nepalez","nepaleza","nepalez"],"nepaleze":["nepaleze","nepalez","nepaleze","nepaleză"],"nepalezei":"nepaleză","nepalezele":["nepalezele","nepalez","nepalezele","nepaleză"],"nepalezelor":"nepaleză","nepalezi":"nepalez","nepalezii":"nepalez","nepalezilor":"nepalez","nepalezul":"nepalez","nepalezule":"nepalez","nepalezului":"nepalez","nepamanteana":["nepământeană","nepământean","nepământeana","nepământean"],"nepamanteanul":"nepământean","nepamanteasca":["nepământească","nepământesc","nepământeasca","nepământesc"],"nepamantene":"nepământean","nepamantenele":"nepământean","nepamanteni":"nepământean","nepamantenii":"nepământean","nepamantescul":"nepământesc","nepamantesti":"nepământesc","nepamantestii":"nepământesc","nepamantestile":"nepământesc","nepartinirea":"nepărtinire","nepartiniri":"nepărtinire","nepartinirii":"nepărtinire","nepartinitoare":"nepărtinitor","nepartinitoarea":"nepărtinitor","nepartinitoarele":"nepărtinitor","nepartinitori":"nepărtinitor","nepartinitorii":"nepărtinitor","nepartinitorul":"nepărtinitor","nepasarea":"nepăsare","nepasari":"nepăsare","nepasarii":"nepăsare","nepasatoare":"nepăsător","nepasatoarea":"nepăsător","nepasatoarele":"nepăsător","nepasatori":"nepăsător","nepasatorii":"nepăsător","nepasatorul":"nepăsător","nepatata":["nepătată","nepătat","nepătata","nepătat"],"nepatate":"nepătat","nepatatele":"nepătat","nepatati":"nepătat","nepatatii":"nepătat","nepatatul":"nepătat","nepatrunzimea":"nepătrunzime","nepatrunzimi":"nepătrunzime","nepatrunzimii":"nepătrunzime","nepatrunzimile":"nepătrunzime","nepatrunzimilor":"nepătrunzime","nepaze":"nepază","nepazei":"nepază","nepedepsita":["nepedepsită","nepedepsit","nepedepsita","nepedepsit"],"nepedepsite":"nepedepsit","nepedepsitele":"nepedepsit","nepedepsiti":"nepedepsit","nepedepsitii":"nepedepsit","nepedepsitul":"nepedepsit","nepentensul":"nepentens","nepentensule":"nepentens","nepentensului":"nepentens","neperi":"neper","neperii":"neper","neperilor":"neper","neperisabila":["neperisabilă","neperisabil","neperisabila","neperisabil"],"neperisabile":"neperisabil","neperisabilele":"neperisabil","neperisabili":"neperisabil","neperisabilii":"neperisabil","neperisabilul":"neperisabil","nepermanenta":["nepermanentă","nepermanent","nepermanenta","nepermanent"],"nepermanente":"nepermanent","nepermanentele":"nepermanent","nepermanenti":"nepermanent","nepermanentii":"nepermanent","nepermanentul":"nepermanent","neperul":"neper","neperule":"neper","neperului":"neper","nepieptanata":["nepieptănată","nepieptănat","nepieptănata","nepieptănat"],"nepieptanate":"nepieptănat","nepieptanatele":"nepieptănat","nepieptanati":"nepieptănat","nepieptanatii":"nepieptănat","nepieptanatul":"nepieptănat","nepieritoare":"nepieritor","nepieritoarea":"nepieritor","nepieritoarele":"nepieritor","nepieritori":"nepieritor","nepieritorii":"nepieritor","nepieritorul":"nepieritor","nepipaita":["nepipăită","nepipăit","nepipăita","nepipăit"],"nepipaite":"nepipăit","nepipaitele":"nepipăit","nepipaiti":"nepipăit","nepipaitii":"nepipăit","nepipaitul":"nepipăit","neplacerea":"neplăcere","neplaceri":"neplăcere","neplacerii":"neplăcere","neplacerile":"neplăcere","neplacerilor":"neplăcere","neplacuta":["neplăcută","neplăcut","neplăcuta","neplăcut"],"neplacute":"neplăcut","neplacutele":"neplăcut","neplacuti":"neplăcut","neplacutii":"neplăcut","neplacutul":"neplăcut","neplate":"neplată","neplatei":"neplată","neplatnici":"neplatnic","neplatnicii":"neplatnic","neplatnicilor":"neplatnic","neplatnicul":"neplatnic","neplatnicule":"neplatnic","neplatnicului":"neplatnic","neplecarea":"neplecare","neplecari":"neplecare","neplecarii":"neplecare","neplecarile":"neplecare","neplecarilor":"neplecare","neplodirea":"neplodire","neplodiri":"neplodire","neplodirii":"neplodire","neplodirile":"neplodire","neplodirilor":"neplodire","neplouarea":"neplouare","neplouari":"neplouare","neplouarii":"neplouare","neplouarile":"neplouare","neplouarilor":"neplouare","nepoate":"nepoată","nepoatei":"nepoată","nepoatele":"nepoată","nepoatelor":"nepoată","nepoftita":["nepoftită","nepoftit","nepoftita","nepoftit"],"nepoftite":"nepoftit","nepoftitele":"nepoftit","nepoftiti":"nepoftit","nepoftitii":"nepoftit","nepoftitul":"nepoftit","nepolara":["nepolară","nepolar","nepolara","nepolar"],"nepolare":"nepolar","nepolarele":"nepolar","nepolari":"nepolar","nepolarii":"nepolar","nepolarul":"nepolar","nepolitica":["nepolitică","nepolitic","nepolitica","nepolitic"],"nepolitice":"nepolitic","nepoliticele":"nepolitic","nepolitici":"nepolitic","nepoliticii":"nepolitic","nepoliticoasa":["nepoliticoasă","nepoliticos","nepoliticoasa","nepoliticos"],"nepoliticoase":"nepoliticos","nepoliticoasele":"nepoliticos","nepoliticosi":"nepoliticos","nepoliticosii":"nepoliticos","nepoliticosul":"nepoliticos","nepoliticul":"nepolitic","nepoluanta":["nepoluantă","nepoluant","nepoluanta","nepoluant"],"nepoluante":"nepoluant","nepoluantele":"nepoluant","nepoluanti":"nepoluant","nepoluantii":"nepoluant","nepoluantul":"nepoluant","nepoluarea":"nepoluare","nepoluari":"nepoluare","nepoluarii":"nepoluare","nepoluarile":"nepoluare","nepoluarilor":"nepoluare","nepoluata":["nepoluată","nepoluat","nepoluata","nepoluat"],"nepoluate":"nepoluat","nepoluatele":"nepoluat","nepoluati":"nepoluat","nepoluatii":"nepoluat","nepoluatul":"nepoluat","nepomenita":["nepomenită","nepomenit","nepomenita","nepomenit"],"nepomenite":"nepomenit","nepomenitele":"nepomenit","nepomeniti":"nepomenit","nepomenitii":"nepomenit","nepomenitul":"nepomenit","neponderabilitatati":"neponderabilitate","neponderabilitatatii":"neponderabilitate","neponderabilitatatile":"neponderabilitate","neponderabilitatatilor":"neponderabilitate","neponderabilitatea":"neponderabilitate","nepopulara":["nepopulară","nepopular","nepopulara","nepopular"],"nepopulare":"nepopular","nepopularele":"nepopular","nepopulari":"nepopular","nepopularii":"nepopular","nepopularul":"nepopular","nepotei":"nepoțel","nepotele":"nepoțică","nepotelei":"nepoțică","nepotelele":"nepoțică","nepotelelor":"nepoțică","nepoteli":"nepoțel","nepotelii":"nepoțel","nepotelilor":"nepoțel","nepotelul":"nepoțel","nepotelule":"nepoțel","nepotelului":"nepoțel","nepoti":"nepot","nepotia":"nepoție","nepotiei":"nepoție","nepotii":["nepoții","nepot","nepoții","nepoție"],"nepotilor":"nepot","nepotrivirea":"nepotrivire","nepotriviri":"nepotrivire","nepotrivirii":"nepotrivire","nepotrivirile":"nepotrivire","nepotrivirilor":"nepotrivire","nepotrivita":["nepotrivită","nepotrivit","nepotrivita","nepotrivit"],"nepotrivite":"nepotrivit","nepotrivitele":"nepotrivit","nepotriviti":"nepotrivit","nepotrivitii":"nepotrivit","nepotrivitul":"nepotrivit","nepotuci":"nepotuc","nepotucii":"nepotuc","nepotucilor":"nepotuc","nepotucul":"nepotuc","nepotucule":"nepotuc","nepotucului":"nepotuc","nepotul":"nepot","nepotule":"nepot","nepotului":"nepot","nepotuti":"nepotuț","nepotutii":"nepotuț","nepotutilor":"nepotuț","nepotutul":"nepotuț","nepotutule":"nepotuț","nepotutului":"nepotuț","nepovestita":["nepovestită","nepovestit","nepovestita","nepovestit"],"nepovestite":"nepovestit","nepovestitele":"nepovestit","nepovestiti":"nepovestit","nepovestitii":"nepovestit","nepovestitul":"nepovestit","nepozitiva":["nepozitivă","nepozitiv","nepozitiva","nepozitiv"],"nepozitive":"nepozitiv","nepozitivele":"nepozitiv","nepozitivi":"nepozitiv","nepozitivii":"nepozitiv","nepozitivul":"nepozitiv","neprecizarea":"neprecizare","neprecizari":"neprecizare","neprecizarii":"neprecizare","neprecizarile":"neprecizare","neprecizarilor":"neprecizare","neprecurmata":["neprecurmată","neprecurmat","neprecurmata","neprecurmat"],"neprecurmate":"neprecurmat","neprecurmatele":"neprecurmat","neprecurmati":"neprecurmat","neprecurmatii":"neprecurmat","neprecurmatul":"neprecurmat","nepredicativa":["nepredicativă","nepredicativ","nepredicativa","nepredicativ"],"nepredicative":"nepredicativ","nepredicativele":"nepredicativ","nepredicativi":"nepredicativ","nepredicativii":"nepredicativ","nepredicativul":"nepredicativ","nepregandita":["nepregândită","nepregândit","nepregândita","nepregândit"],"nepregandite":"nepregândit","nepreganditele":"nepregândit","nepreganditi":"nepregândit","nepreganditii":"nepregândit","nepreganditul":"nepregândit","nepregatirea":"nepregătire","nepregatiri":"nepregătire","nepregatirii":"nepregătire","nepregatirile":"nepregătire","nepregatirilor":"nepregătire","nepregatita":["nepregătită","nepregătit","nepregătita","nepregătit"],"nepregatite":"nepregătit","nepregatitele":"nepregătit","nepregatiti":"nepregătit","nepregatitii":"nepregătit","nepregatitul":"nepregătit","nepregetarea":"nepregetare","nepregetari":"nepregetare","nepregetarii":"nepregetare","nepregetarile":"nepregetare","nepregetarilor":"nepregetare","nepregetata":["nepregetată","nepregetat","nepregetata","nepregetat"],"nepregetate":"nepregetat","nepregetatele":"nepregetat","nepregetati":"nepregetat","nepregetatii":"nepregetat","nepregetatul":"nepregetat","nepregetul":"nepreget","nepregetule":"nepreget","nepregetului":"nepreget","neprelucrata":["neprelucrată","neprelucrat","neprelucrata","neprelucrat"],"neprelucrate":"neprelucrat","neprelucratele":"neprelucrat","neprelucrati":"neprelucrat","neprelucratii":"neprelucrat","neprelucratul":"neprelucrat","nepretentioasa":["nepretențioasă","nepretențios","nepretențioasa","nepretențios"],"nepretentioase":"nepretențios","nepretentioasele":"nepretențios","nepretentiosi":"nepretențios","nepretentiosii":"nepretențios","nepretentiosul":"nepretențios","nepretuita":["neprețuită","neprețuit","neprețuita","neprețuit"],"nepretuite":"neprețuit","nepretuitele":"neprețuit","nepretuiti":"neprețuit","nepretuitii":"neprețuit","nepretuitul":"neprețuit","neprevazatoare":"neprevăzător","neprevazatoarea":"neprevăzător","neprevazatoarele":"neprevăzător","neprevazatori":"neprevăzător","neprevazatorii":"neprevăzător","neprevazatorul":"neprevăzător","neprevazuta":["neprevăzută","neprevăzut","neprevăzuta","neprevăzut"],"neprevazute":"neprevăzut","neprevazutele":"neprevăzut","neprevazuti":"neprevăzut","neprevazutii":"neprevăzut","neprevazutul":"neprevăzut","neprevizibila":["neprevizibilă","neprevizibil","neprevizibila","neprevizibil"],"neprevizibile":"neprevizibil","neprevizibilele":"neprevizibil","neprevizibili":"neprevizibil","neprevizibilii":"neprevizibil","neprevizibilul":"neprevizibil","nepriceperea":"nepricepere","nepriceperi":"nepricepere","nepriceperii":"nepricepere","nepriceperile":"nepricepere","nepriceperilor":"nepricepere","nepriceputa":["nepricepută","nepriceput","nepriceputa","nepriceput"],"nepricepute":"nepriceput","nepriceputele":"nepriceput","nepriceputi":"nepriceput","nepriceputii":"nepriceput","nepriceputul":"nepriceput","nepricopsita":["nepricopsită","nepricopsit","nepricopsita","nepricopsit"],"nepricopsite":"nepricopsit","nepricopsitele":"nepricopsit","nepricopsiti":"nepricopsit","nepricopsitii":"nepricopsit","nepricopsitul":"nepricopsit","neprielnica":["neprielnică","neprielnic","neprielnica","neprielnic"],"neprielnice":"neprielnic","neprielnicele":"neprielnic","neprielnici":"neprielnic","neprielnicii":"neprielnic","neprielnicul":"neprielnic","neprieteneasca":["neprietenească","neprietenesc","neprieteneasca","neprietenesc"],"neprietenescul":"neprietenesc","neprietenesti":"neprietenesc","neprietenestii":"neprietenesc","neprietenestile":"neprietenesc","neprieteni":"neprieten","neprietenii":"neprieten","neprietenilor":"neprieten","neprietenoasa":["neprietenoasă","neprietenos","neprietenoasa","neprietenos"],"neprietenoase":"neprietenos","neprietenoasele":"neprietenos","neprietenosi":"neprietenos","neprietenosii":"neprietenos","neprietenosul":"neprietenos","neprietenul":"neprieten","neprietenule":"neprieten","neprietenului":"neprieten","neprietesugul":"neprieteșug","neprietesugule":"neprieteșug","neprietesugului":"neprieteșug","neprietesuguri":"neprieteșug","neprietesugurile":"neprieteșug","neprietesugurilor":"neprieteșug","neprietnici":"neprietnic","neprietnicii":"neprietnic","neprietnicilor":"neprietnic","neprietnicul":"neprietnic","neprietnicule":"neprietnic","neprietnicului":"neprietnic","neprihanirea":"neprihănire","neprihaniri":"neprihănire","neprihanirii":"neprihănire","neprihanita":["neprihănită","neprihănit","neprihănita","neprihănit"],"neprihanite":"neprihănit","neprihanitele":"neprihănit","neprihaniti":"neprihănit","neprihanitii":"neprihănit","neprihanitul":"neprihănit","nepriincioasa":["nepriincioasă","nepriincios","nepriincioasa","nepriincios"],"nepriincioase":"nepriincios","nepriincioasele":"nepriincios","nepriinciosi":"nepriincios","nepriinciosii":"nepriincios","nepriinciosul":"nepriincios","nepriinte":"nepriință","nepriintei":"nepriință","nepriintele":"nepriință","nepriintelor":"nepriință","nepriitoare":"nepriitor","nepriitoarea":"nepriitor","nepriitoarele":"nepriitor","nepriitori":"nepriitor","nepriitorii":"nepriitor","nepriitorilor":"nepriitor","nepriitorul":"nepriitor","nepriitorule":"nepriitor","nepriitorului":"nepriitor","neprimitoare":"neprimitor","neprimitoarea":"neprimitor","neprimitoarele":"neprimitor","neprimitori":"neprimitor","neprimitorii":"neprimitor","neprimitorul":"neprimitor","neprincipiala":["neprincipială","neprincipial","neprincipiala","neprincipial"],"neprincipiale":"neprincipial","neprincipialele":"neprincipial","neprincipiali":"neprincipial","neprincipialii":"neprincipial","neprincipialul":"neprincipial","neprocopsita":["neprocopsită","neprocopsit","neprocopsita","neprocopsit"],"neprocopsite":"neprocopsit","neprocopsitele":"neprocopsit","neprocopsiti":"neprocopsit","neprocopsitii":"neprocopsit","neprocopsitul":"neprocopsit","neproducatoare":"neproducător","neproducatoarea":"neproducător","neproducatoarele":"neproducător","neproducatori":"neproducător","neproducatorii":"neproducător","neproducatorul":"neproducător","neproductiva":["neproductivă","neproductiv","neproductiva","neproductiv"],"neproductive":"neproductiv","neproductivele":"neproductiv","neproductivi":"neproductiv","neproductivii":"neproductiv","neproductivul":"neproductiv","neprofesionista":["neprofesionistă","neprofesionist","neprofesionista","neprofesionist"],"neprofesioniste":["neprofesioniste","neprofesionist","neprofesioniste","neprofesionistă"],"neprofesionistei":"neprofesionistă","neprofesionistele":["neprofesionistele","neprofesionist","neprofesionistele","neprofesionistă"],"neprofesionistelor":"neprofesionistă","neprofesionisti":"neprofesionist","neprofesionistii":"neprofesionist","neprofesionistul":"neprofesionist","neproliferarea":"neproliferare","neproliferari":"neproliferare","neproliferarii":"neproliferare","neprotejata":["neprotejată","neprotejat","neprotejata","neprotejat"],"neprotejate":"neprotejat","neprotejatele":"neprotejat","neprotejati":"neprotejat","neprotejatii":"neprotejat","neprotejatul":"neprotejat","neprudente":"neprudență","neprudentei":"neprudență","neprudentele":"neprudență","neprudentelor":"neprudență","neptuniana":["neptuniană","neptunian","neptuniana","neptunian"],"neptunianul":"neptunian","neptunica":["neptunică","neptunic","neptunica","neptunic"],"neptunice":"neptunic","neptunicele":"neptunic","neptunici":"neptunic","neptunicii":"neptunic","neptunicul":"neptunic","neptuniene":"neptunian","neptunienele":"neptunian","neptunieni":"neptunian","neptunienii":"neptunian","neptunisme":"neptunism","neptunismele":"neptunism","neptunismelor":"neptunism","neptunismul":"neptunism","neptunismule":"neptunism","neptunismului":"neptunism","neptuniul":"neptuniu","neptuniule":"neptuniu","neptuniului":"neptuniu","nepublicata":["nepublicată","nepublicat","nepublicata","nepublicat"],"nepublicate":"nepublicat","nepublicatele":"nepublicat","nepublicati":"nepublicat","nepublicatii":"nepublicat","nepublicatul":"nepublicat","nepunctuala":["nepunctuală","nepunctual","nepunctuala","nepunctual"],"nepunctuale":"nepunctual","nepunctualele":"nepunctual","nepunctuali":"nepunctual","nepunctualii":"nepunctual","nepunctualul":"nepunctual","nepurtarea":"nepurtare","nepurtari":"nepurtare","nepurtarii":"nepurtare","nepurtarile":"nepurtare","nepurtarilor":"nepurtare","neputerea":"neputere","neputeri":"neputere","neputerii":"neputere","neputernica":["neputernică","neputernic","neputernica","neputernic"],"neputernice":"neputernic","neputernicele":"neputernic","neputernici":"neputernic","neputernicii":"neputernic","neputernicul":"neputernic","neputincioasa":["neputincioasă","neputincios","neputincioasa","neputincios"],"neputincioase":"neputincios","neputincioasele":"neputincios","neputinciosi":"neputincios","neputinciosia":"neputincioșie","neputinciosiei":"neputincioșie","neputinciosii":["neputincioșii","neputincios","neputincioșii","neputincioșie"],"neputinciosiile":"neputincioșie","neputinciosiilor":"neputincioșie","neputinciosul":"neputincios","neputinte":"neputință","neputintei":"neputință","neputintele":"neputință","neputintelor":"neputință","neputrejunea":"neputrejune","neputrejuni":"neputrejune","neputrejunii":"neputrejune","neputrejunile":"neputrejune","neputrejunilor":"neputrejune","nerabdarea":"nerăbdare","nerabdari":"nerăbdare","nerabdarii":"nerăbdare","nerabdatoare":"nerăbdător","nerabdatoarea":"nerăbdător","nerabdatoarele":"nerăbdător","nerabdatori":"nerăbdător","nerabdatorii":"nerăbdător","nerabdatorul":"nerăbdător","nerambursabila":["nerambursabilă","nerambursabil","nerambursabila","nerambursabil"],"nerambursabile":"nerambursabil","nerambursabilele":"nerambursabil","nerambursabili":"nerambursabil","nerambursabilii":"nerambursabil","nerambursabilul":"nerambursabil","neramzata":["nerămzată","nerămzat","nerămzata","nerămzat"],"neramzate":"nerămzat","neramzatele":"nerămzat","neramzati":"nerămzat","neramzatii":"nerămzat","neramzatul":"nerămzat","neramzi":"neramz","neramzia":"nerămziu","neramzie":"nerămziu","neramzii":["neramzii","neramz","nerămzii","nerămziu"],"neramziii":"nerămziu","neramziile":"nerămziu","neramzilor":"neramz","neramziul":"nerămziu","neramzul":"neramz","neramzule":"neramz","neramzului":"neramz","nerapitoare":"nerăpitor","nerapitoarea":"nerăpitor","nerapitoarele":"nerăpitor","nerapitori":"nerăpitor","nerapitorii":"nerăpitor","nerapitorul":"nerăpitor","nerasa":["nerasă","neras","nerasa","neras"],"nerase":"neras","nerasele":"neras","nerasi":"neras","nerasii":"neras","nerasul":"neras","nerationala":["nerațională","nerațional","neraționala","nerațional"],"nerationale":"nerațional","nerationalele":"nerațional","nerationali":"nerațional","nerationalii":"nerațional","nerationalul":"nerațional","nerautatati":"nerăutate","nerautatatii":"nerăutate","nerautatatile":"nerăutate","nerautatatilor":"nerăutate","nerautatea":"nerăutate","nerazbita":["nerăzbită","nerăzbit","nerăzbita","nerăzbit"],"nerazbite":"nerăzbit","nerazbitele":"nerăzbit","nerazbiti":"nerăzbit","nerazbitii":"nerăzbit","nerazbitul":"nerăzbit","nereala":["nereală","nereal","nereala","nereal"],"nereale":"nereal","nerealele":"nereal","nereali":"nereal","nerealii":"nereal","nerealista":["nerealistă","nerealist","nerealista","nerealist"],"nerealiste":"nerealist","nerealistele":"nerealist","nerealisti":"nerealist","nerealistii":"nerealist","nerealistul":"nerealist","nerealizabila":["nerealizabilă","nerealizabil","nerealizabila","nerealizabil"],"nerealizabile":"nerealizabil","nerealizabilele":"nerealizabil","nerealizabili":"nerealizabil","nerealizabilii":"nerealizabil","nerealizabilul":"nerealizabil","nerealul":"nereal","nereceptionata":["nerecepționată","nerecepționat","nerecepționata","nerecepționat"],"nereceptionate":"nerecepționat","nereceptionatele":"nerecepționat","nereceptionati":"nerecepționat","nereceptionatii":"nerecepționat","nereceptionatul":"nerecepționat","nereceptiva":["nereceptivă","nereceptiv","nereceptiva","nereceptiv"],"nereceptive":"nereceptiv","nereceptivele":"nereceptiv","nereceptivi":"nereceptiv","nereceptivii":"nereceptiv","nereceptivul":"nereceptiv","nerecoltata":["nerecoltată","nerecoltat","nerecoltata","nerecoltat"],"nerecoltate":"nerecoltat","nerecoltatele":"nerecoltat","nerecoltati":"nerecoltat","nerecoltatii":"nerecoltat","nerecoltatul":"nerecoltat","nereconciliabila":["nereconciliabilă","nereconciliabil","nereconciliabila","nereconciliabil"],"nereconciliabile":"nereconciliabil","nereconciliabilele":"nereconciliabil","nereconciliabili":"nereconciliabil","nereconciliabilii":"nereconciliabil","nereconciliabilul":"nereconciliabil","nerecunoscatoarea":"nerecunoscătoare","nerecunoscatoarei":"nerecunoscătoare","nerecunoscatoarele":"nerecunoscătoare","nerecunoscatoarelor":"nerecunoscătoare","nerecunoscatori":"nerecunoscător","nerecunoscatorii":"nerecunoscător","nerecunoscatorilor":"nerecunoscător","nerecunoscatorul":"nerecunoscător","nerecunoscatorule":"nerecunoscător","nerecunoscatorului":"nerecunoscător","nerecunoscuta":["nerecunoscută","nerecunoscut","nerecunoscuta","nerecunoscut"],"nerecunoscute":"nerecunoscut","nerecunoscutele":"nerecunoscut","nerecunoscuti":"nerecunoscut","nerecunoscutii":"nerecunoscut","nerecunoscutul":"nerecunoscut","nerecunostinte":"nerecunoștință","nerecunostintei":"nerecunoștință","nerecuperabila":["nerecuperabilă","nerecuperabil","nerecuperabila","nerecuperabil"],"nerecuperabile":"nerecuperabil","nerecuperabilele":"nerecuperabil","nerecuperabili":"nerecuperabil","nerecuperabilii":"nerecuperabil","nerecuperabilul":"nerecuperabil","neregala":["neregală","neregal","neregala","neregal"],"neregale":"neregal","neregalele":"neregal","neregali":"neregal","neregalii":"neregal","neregalul":"neregal","neregularitatea":"neregularitate","neregularitati":"neregularitate","neregularitatii":"neregularitate","neregularitatile":"neregularitate","neregularitatilor":"neregularitate","neregulata":["neregulată","neregulat","neregulata","neregulat"],"neregulate":"neregulat","neregulatele":"neregulat","neregulati":"neregulat","neregulatii":"neregulat","neregulatul":"neregulat","nereguli":"neregulă","neregulii":"neregulă","neregulile":"neregulă","neregulilor":"neregulă","nereide":"nereidă","nereidei":"nereidă","nereidele":"nereidă","nereidelor":"nereidă","nereligioasa":["nereligioasă","nereligios","nereligioasa","nereligios"],"nereligioase":"nereligios","nereligioasele":"nereligios","nereligiosi":"nereligios","nereligiosii":"nereligios","nereligiosul":"nereligios","nereparabila":["nereparabilă","nereparabil","nereparabila","nereparabil"],"nereparabile":"nereparabil","nereparabilele":"nereparabil","nereparabili":"nereparabil","nereparabilii":"nereparabil","nereparabilul":"nereparabil","nereparata":["nereparată","nereparat","nereparata","nereparat"],"nereparate":"nereparat","nereparatele":"nereparat","nereparati":"nereparat","nereparatii":"nereparat","nereparatul":"nereparat","nerespectarea":"nerespectare","nerespectari":"nerespectare","nerespectarii":"nerespectare","nerespectarile":"nerespectare","nerespectarilor":"nerespectare","nerespectuoasa":["nerespectuoasă","nerespectuos","nerespectuoasa","nerespectuos"],"nerespectuoase":"nerespectuos","nerespectuoasele":"nerespectuos","nerespectuosi":"nerespectuos","nerespectuosii":"nerespectuos","nerespectuosul":"nerespectuos","nereusita":["nereușită","nereușit","nereușita","nereușit"],"nereusite":["nereușite","nereușit","nereușite","nereușită"],"nereusitei":"nereușită","nereusitele":["nereușitele","nereușit","nereușitele","nereușită"],"nereusitelor":"nereușită","nereusiti":"nereușit","nereusitii":"nereușit","nereusitul":"nereușit","nereverentioasa":["nereverențioasă","nereverențios","nereverențioasa","nereverențios"],"nereverentioase":"nereverențios","nereverentioasele":"nereverențios","nereverentiosi":"nereverențios","nereverentiosii":"nereverențios","nereverentiosul":"nereverențios","nerezervata":["nerezervată","nerezervat","nerezervata","nerezervat"],"nerezervate":"nerezervat","nerezervatele":"nerezervat","nerezervati":"nerezervat","nerezervatii":"nerezervat","nerezervatul":"nerezervat","nerezolvata":["nerezolvată","nerezolvat","nerezolvata","nerezolvat"],"nerezolvate":"nerezolvat","nerezolvatele":"nerezolvat","nerezolvati":"nerezolvat","nerezolvatii":"nerezolvat","nerezolvatul":"nerezolvat","neritica":["neritică","neritic","neritica","neritic"],"neritice":"neritic","neriticele":"neritic","neritici":"neritic","neriticii":"neritic","neriticul":"neritic","neroade":"neroadă","neroadei":"neroadă","neroadele":"neroadă","neroadelor":"neroadă","neroda":["nerodă","nerod","neroda","nerod"],"nerode":"nerod","nerodele":"nerod","neroditoare":"neroditor","neroditoarea":"neroditor","neroditoarele":"neroditor","neroditori":"neroditor","neroditorii":"neroditor","neroditorul":"neroditor","nerodul":"nerod","neromaneasca":["neromânească","neromânesc","neromâneasca","neromânesc"],"neromanescul":"neromânesc","neromanesti":"neromânesc","neromanestii":"neromânesc","neromanestile":"neromânesc","nerotunjita":["nerotunjită","nerotunjit","nerotunjita","nerotunjit"],"nerotunjite":"nerotunjit","nerotunjitele":"nerotunjit","nerotunjiti":"nerotunjit","nerotunjitii":"nerotunjit","nerotunjitul":"nerotunjit","nerozeasca":["nerozească","nerozesc","nerozeasca","nerozesc"],"nerozescul":"nerozesc","nerozesti":"nerozesc","nerozestii":"nerozesc","nerozestile":"nerozesc","nerozi":"nerod","nerozia":"nerozie","neroziei":"nerozie","nerozii":["nerozii","nerod","nerozii","nerozie"],"neroziile":"nerozie","neroziilor":"nerozie","nerusinarea":"nerușinare","nerusinari":"nerușinare","nerusinarii":"nerușinare","nerusinata":["nerușinată","nerușinat","nerușinata","nerușinat"],"nerusinate":"nerușinat","nerusinatele":"nerușinat","nerusinati":"nerușinat","nerusinatii":"nerușinat","nerusinatul":"nerușinat","nerusinoasa":["nerușinoasă","nerușinos","nerușinoasa","nerușinos"],"nerusinoase":"nerușinos","nerusinoasele":"nerușinos","nerusinosi":"nerușinos","nerusinosii":"nerușinos","nerusinosul":"nerușinos","nervatia":"nervație","nervatiei":"nervație","nervatii":"nervație","nervatiile":"nervație","nervatiilor":"nervație","nervatiunea":"nervațiune","nervatiuni":"nervațiune","nervatiunii":"nervațiune","nervatiunile":"nervațiune","nervatiunilor":"nervațiune","nervaturi":"nervatură","nervaturii":"nervatură","nervaturile":"nervatură","nervaturilor":"nervatură","nervi":"nerv","nervi frenici":"nerv frenic","nervi hipoglos":"nerv hipoglos","nervi optici":"nerv optic","nervi sciatici":"nerv sciatic","nervi trigemeni":"nerv trigemen","nervii":"nerv","nervilor":"nerv","nervini":"nervin","nervinile":"nervin","nervinilor":"nervin","nervinul":"nervin","nervinule":"nervin","nervinului":"nervin","nerviste":"nervistă","nervistei":"nervistă","nervistele":"nervistă","nervistelor":"nervistă","nervoasa":["nervoasă","nervos","nervoasa","nervos"],"nervoase":"nervos","nervoasele":"nervos","nervosi":"nervos","nervosii":"nervos","nervosul":"nervos","nervozismul":"nervozism","nervozismule":"nervozism","nervozismului":"nervozism","nervozitatea":"nervozitate","nervozitati":"nervozitate","nervozitatii":"nervozitate","nervozitatile":"nervozitate","nervozitatilor":"nervozitate","nervul":"nerv","nervule":"nerv","nervului":"nerv","nervuratia":"nervurație","nervuratiei":"nervurație","nervuratii":"nervurație","nervuratiile":"nervurație","nervuratiilor":"nervurație","nervuri":"nervură","nervurii":"nervură","nervurile":"nervură","nervurilor":"nervură","nesabuinte":"nesăbuință","nesabuintei":"nesăbuință","nesabuintele":"nesăbuință","nesabuintelor":"nesăbuință","nesabuirea":"nesăbuire","nesabuiri":"nesăbuire","nesabuirii":"nesăbuire","nesabuita":["nesăbuită","nesăbuit","nesăbuita","nesăbuit"],"nesabuite":"nesăbuit","nesabuitele":"nesăbuit","nesabuiti":"nesăbuit","nesabuitii":"nesăbuit","nesabuitul":"nesăbuit","nesanatatea":"nesănătate","nesanatati":"nesănătate","nesanatatii":"nesănătate","nesanatoasa":["nesănătoasă","nesănătos","nesănătoasa","nesănătos"],"nesanatoase":"nesănătos","nesanatoasele":"nesănătos","nesanatosi":"nesănătos","nesanatosii":"nesănătos","nesanatosul":"nesănătos","nesanse":"neșansă","nesansei":"neșansă","nesansele":"neșansă","nesanselor":"neșansă","nesarata":["nesărată","nesărat","nesărata","nesărat"],"nesarate":"nesărat","nesaratele":"nesărat","nesarati":"nesărat","nesaratii":"nesărat","nesaratul":"nesărat","nesaraturi":"nesărătură","nesaraturii":"nesărătură","nesaraturile":"nesărătură","nesaraturilor":"nesărătură","nesatietatea":"nesațietate","nesatietati":"nesațietate","nesatietatii":"nesațietate","nesatioasa":["nesățioasă","nesățios","nesățioasa","nesățios"],"nesatioase":"nesățios","nesatioasele":"nesățios","nesatiosi":"nesățios","nesatiosii":"nesățios","nesatiosul":"nesățios","nesatisfacatoare":"nesatisfăcător","nesatisfacatoarea":"nesatisfăcător","nesatisfacatoarele":"nesatisfăcător","nesatisfacatori":"nesatisfăcător","nesatisfacatorii":"nesatisfăcător","nesatisfacatorul":"nesatisfăcător","nesatisfacuta":["nesatisfăcută","nesatisfăcut","nesatisfăcuta","nesatisfăcut"],"nesatisfacute":"nesatisfăcut","nesatisfacutele":"nesatisfăcut","nesatisfacuti":"nesatisfăcut","nesatisfacutii":"nesatisfăcut","nesatisfacutul":"nesatisfăcut","nesatiuul":"nesațiu","nesatiuule":"nesațiu","nesatiuului":"nesațiu","nesatui":"nesătul","nesatuii":"nesătul","nesatul":"nesaț","nesatula":["nesătulă","nesătul","nesătula","nesătul"],"nesatule":["nesațule","nesaț","nesătule","nesătul"],"nesatulele":"nesătul","nesatului":"nesaț","nesatulul":"nesătul","nesaturarari":"nesăturare","nesaturararii":"nesăturare","nesaturararile":"nesăturare","nesaturararilor":"nesăturare","nesaturarea":"nesăturare","nesaturata":["nesaturată","nesaturat","nesaturata","nesaturat","nesăturată","nesăturat","nesăturata","nesăturat"],"nesaturate":["nesaturate","nesaturat","nesăturate","nesăturat"],"nesaturatele":["nesaturatele","nesaturat","nesăturatele","nesăturat"],"nesaturati":["nesaturați","nesaturat","nesăturați","nesăturat"],"nesaturatii":["nesaturații","nesaturat","nesăturații","nesăturat"],"nesaturatul":["nesaturatul","nesaturat","nesăturatul","nesăturat"],"nescaiva":"niscai","neschimbarea":"neschimbare","neschimbari":"neschimbare","neschimbarii":"neschimbare","neschimbarile":"neschimbare","neschimbarilor":"neschimbare","neschimbata":["neschimbată","neschimbat","neschimbata","neschimbat"],"neschimbate":"neschimbat","neschimbatele":"neschimbat","neschimbati":"neschimbat","neschimbatii":"neschimbat","neschimbatoare":"neschimbător","neschimbatoarea":"neschimbător","neschimbatoarele":"neschimbător","neschimbatori":"neschimbător","neschimbatorii":"neschimbător","neschimbatorul":"neschimbător","neschimbatul":"neschimbat","nescrisa":["nescrisă","nescris","nescrisa","nescris"],"nescrise":"nescris","nescrisele":"nescris","nescrisi":"nescris","nescrisii":"nescris","nescrisul":"nescris","nese":"nes","nesecata":["nesecată","nesecat","nesecata","nesecat"],"nesecate":"nesecat","nesecatele":"nesecat","nesecati":"nesecat","nesecatii":"nesecat","nesecatuita":["nesecătuită","nesecătuit","nesecătuita","nesecătuit"],"nesecatuite":"nesecătuit","nesecatuitele":"nesecătuit","nesecatuiti":"nesecătuit","nesecatuitii":"nesecătuit","nesecatuitul":"nesecătuit","nesecatul":"nesecat","nesele":"nes","neselor":"nes","nesemnificativa":["nesemnificativă","nesemnificativ","nesemnificativa","nesemnificativ"],"nesemnificative":"nesemnificativ","nesemnificativele":"nesemnificativ","nesemnificativi":"nesemnificativ","nesemnificativii":"nesemnificativ","nesemnificativul":"nesemnificativ","nesentimentala":["nesentimentală","nesentimental","nesentimentala","nesentimental"],"nesentimentale":"nesentimental","nesentimentalele":"nesentimental","nesentimentali":"nesentimental","nesentimentalii":"nesentimental","nesentimentalul":"nesentimental","neserioasa":["neserioasă","neserios","neserioasa","neserios"],"neserioase":"neserios","neserioasele":"neserios","neseriosi":"neserios","neseriosii":"neserios","neseriosul":"neserios","neseriozitatea":"neseriozitate","neseriozitati":"neseriozitate","neseriozitatii":"neseriozitate","neseserul":"neseser","neseserule":"neseser","neseserului":"neseser","neseseruri":"neseser","neseserurile":"neseser","neseserurilor":"neseser","nesfarsirea":"nesfârșire","nesfarsirei":"nesfârșire","nesfarsita":["nesfârșită","nesfârșit","nesfârșita","nesfârșit"],"nesfarsite":"nesfârșit","nesfarsitele":"nesfârșit","nesfarsiti":"nesfârșit","nesfarsitii":"nesfârșit","nesfarsitul":"nesfârșit","nesfia":"nesfie","nesfiei":"nesfie","nesfiele":"nesfială","nesfielei":"nesfială","nesfielele":"nesfială","nesfielelor":"nesfială","nesfieli":"nesfială","nesfii":"nesfie","nesfiile":"nesfie","nesfiilor":"nesfie","nesigura":["nesigură","nesigur","nesigura","nesigur"],"nesigurante":"nesiguranță","nesigurantei":"nesiguranță","nesigure":"nesigur","nesigurele":"nesigur","nesiguri":"nesigur","nesigurii":"nesigur","nesigurul":"nesigur","nesilinte":"nesilință","nesilintei":"nesilință","nesilintele":"nesilință","nesilintelor":"nesilință","nesilita":["nesilită","nesilit","nesilita","nesilit"],"nesilite":"nesilit","nesilitele":"nesilit","nesiliti":"nesilit","nesilitii":"nesilit","nesilitul":"nesilit","nesimtibilitatea":"nesimțibilitate","nesimtibilitati":"nesimțibilitate","nesimtibilitatii":"nesimțibilitate","nesimtibilitatile":"nesimțibilitate","nesimtibilitatilor":"nesimțibilitate","nesimtita":"nesimțit","nesimtite":"nesimțit","nesimtiti":"nesimțit","nesimtitoare":"nesimțitor","nesimtitoarea":"nesimțitor","nesimtitoarele":"nesimțitor","nesimtitori":"nesimțitor","nesimtitorii":"nesimțitor","nesimtitorul":"nesimțitor","nesipoasa":["nesipoasă","nesipos","nesipoasa","nesipos"],"nesipoase":"nesipos","nesipoasele":"nesipos","nesiposi":"nesipos","nesiposii":"nesipos","nesiposul":"nesipos","nesociabila":["nesociabilă","nesociabil","nesociabila","nesociabil"],"nesociabile":"nesociabil","nesociabilele":"nesociabil","nesociabili":"nesociabil","nesociabilii":"nesociabil","nesociabilul":"nesociabil","nesocotea":"nesocoti","nesocoteai":"nesocoti","nesocoteam":"nesocoti","nesocoteati":"nesocoti","nesocoteau":"nesocoti","nesocotele":"nesocoteală","nesocotelei":"nesocoteală","nesocotelele":"nesocoteală","nesocotelelor":"nesocoteală","nesocoteli":"nesocoteală","nesocotesc":"nesocoti","nesocoteste":"nesocoti","nesocotesti":"nesocoti","nesocotii":"nesocoti","nesocotim":"nesocoti","nesocotind":"nesocoti","nesocotinte":"nesocotință","nesocotintei":"nesocotință","nesocotintele":"nesocotință","nesocotintelor":"nesocotință","nesocotira":"nesocoti","nesocotiram":"nesocoti","nesocotirati":"nesocoti","nesocotirea":"nesocotire","nesocotirei":"nesocotire","nesocotise":"nesocoti","nesocotisem":"nesocoti","nesocotisera":"nesocoti","nesocotiseram":"nesocoti","nesocotiserati":"nesocoti","nesocotisesi":"nesocoti","nesocotisi":"nesocoti","nesocotit":"nesocoti","nesocotita":["nesocotită","nesocotit","nesocotita","nesocotit"],"nesocotite":"nesocotit","nesocotitele":"nesocotit","nesocotiti":["nesocotiți","nesocoti","nesocotiți","nesocotit"],"nesocotitii":"nesocotit","nesocotitul":"nesocotit","nesofisticata":["nesofisticată","nesofisticat","nesofisticata","nesofisticat"],"nesofisticate":"nesofisticat","nesofisticatele":"nesofisticat","nesofisticati":"nesofisticat","nesofisticatii":"nesofisticat","nesofisticatul":"nesofisticat","nesolutionata":["nesoluționată","nesoluționat","nesoluționata","nesoluționat"],"nesolutionate":"nesoluționat","nesolutionatele":"nesoluționat","nesolutionati":"nesoluționat","nesolutionatii":"nesoluționat","nesolutionatul":"nesoluționat","nesomnia":"nesomnie","nesomniei":"nesomnie","nesomnii":"nesomnie","nesomniile":"nesomnie","nesomniilor":"nesomnie","nesomnul":"nesomn","nesomnule":"nesomn","nesomnului":"nesomn","nespaimantarea":"nespăimântare","nespaimantari":"nespăimântare","nespaimantarii":"nespăimântare","nespaimantarile":"nespăimântare","nespaimantarilor":"nespăimântare","nespalata":["nespălată","nespălat","nespălata","nespălat"],"nespalate":"nespălat","nespalatele":"nespălat","nespalati":"nespălat","nespalatii":"nespălat","nespalatilor":"nespălat","nespalatul":"nespălat","nespalatule":"nespălat","nespalatului":"nespălat","nespectaculoasa":["nespectaculoasă","nespectaculos","nespectaculoasa","nespectaculos"],"nespectaculoase":"nespectaculos","nespectaculoasele":"nespectaculos","nespectaculosi":"nespectaculos","nespectaculosii":"nespectaculos","nespectaculosul":"nespectaculos","nesperata":["nesperată","nesperat","nesperata","nesperat"],"nesperate":"nesperat","nesperatele":"nesperat","nesperati":"nesperat","nesperatii":"nesperat","nesperatul":"nesperat","nespornicia":"nespornicie","nesporniciei":"nespornicie","nespornicii":"nespornicie","nesporniciile":"nespornicie","nesporniciilor":"nespornicie","nesportiva":["nesportivă","nesportiv","nesportiva","nesportiv"],"nesportive":"nesportiv","nesportivele":"nesportiv","nesportivi":"nesportiv","nesportivii":"nesportiv","nesportivul":"nesportiv","nespusa":["nespusă","nespus","nespusa","nespus"],"nespuse":"nespus","nespusele":"nespus","nespusi":"nespus","nespusii":"nespus","nespusul":"nespus","nest":"nești","nestabila":["nestabilă","nestabil","nestabila","nestabil"],"nestabile":"nestabil","nestabilele":"nestabil","nestabili":"nestabil","nestabilii":"nestabil","nestabilitatea":"nestabilitate","nestabilitati":"nestabilitate","nestabilitatii":"nestabilitate","nestabilul":"nestabil","nestampilata":["neștampilată","neștampilat","neștampilata","neștampilat"],"nestampilate":"neștampilat","nestampilatele":"neștampilat","nestampilati":"neștampilat","nestampilatii":"neștampilat","nestampilatul":"neștampilat","nestapanirea":"nestăpânire","nestapaniri":"nestăpânire","nestapanirii":"nestăpânire","nestapanirile":"nestăpânire","nestapanirilor":"nestăpânire","nestapanita":["nestăpânită","nestăpânit","nestăpânita","nestăpânit"],"nestapanite":"nestăpânit","nestapanitele":"nestăpânit","nestapaniti":"nestăpânit","nestapanitii":"nestăpânit","nestapanitul":"nestăpânit","nestarea":"nestare","nestari":"nestare","nestarii":"nestare","nestarile":"nestare","nestarilor":"nestare","nestatornica":["nestatornică","nestatornic","nestatornica","nestatornic"],"nestatornice":"nestatornic","nestatornicele":"nestatornic","nestatornici":"nestatornic","nestatornicia":"nestatornicie","nestatorniciei":"nestatornicie","nestatornicii":["nestatornicii","nestatornic","nestatornicii","nestatornicie"],"nestatornicul":"nestatornic","nestavilita":["nestăvilită","nestăvilit","nestăvilita","nestăvilit"],"nestavilite":"nestăvilit","nestavilitele":"nestăvilit","nestaviliti":"nestăvilit","nestavilitii":"nestăvilit","nestavilitul":"nestăvilit","neste":"nești","nestea":"nești","nesteai":"nești","nesteam":"nești","nesteati":"nești","nesteau":"nești","nestemat":"nestimat","nestemate":"nestemată","nesterilizata":["nesterilizată","nesterilizat","nesterilizata","nesterilizat"],"nesterilizate":"nesterilizat","nesterilizatele":"nesterilizat","nesterilizati":"nesterilizat","nesterilizatii":"nesterilizat","nesterilizatul":"nesterilizat","nestersa":["neștersă","neșters","neștersa","neșters"],"nesterse":"neșters","nestersele":"neșters","nestersi":"neșters","nestersii":"neșters","nestersul":"neșters","nestidinte":"nestidință","nestidintei":"nestidință","nestidintele":"nestidință","nestidintelor":"nestidință","nestie":"nești","nestii":"nești","nestiinte":"neștiință","nestiintei":"neștiință","nestiintifica":["neștiințifică","neștiințific","neștiințifica","neștiințific"],"nestiintifice":"neștiințific","nestiintificele":"neștiințific","nestiintifici":"neștiințific","nestiintificii":"neștiințific","nestiintificul":"neștiințific","nestim":"nești","nestimata":["nestimată","nestimat","nestimata","nestimat"],"nestimate":["nestimate","nestimat","nestimate","nestimată"],"nestimatele":["nestimatele","nestimat","nestimatele","nestimată"],"nestimati":"nestimat","nestimatii":"nestimat","nestimatul":"nestimat","nestind":"nești","nestingherita":["nestingherită","nestingherit","nestingherita","nestingherit"],"nestingherite":"nestingherit","nestingheritele":"nestingherit","nestingheriti":"nestingherit","nestingheritii":"nestingherit","nestingheritul":"nestingherit","nestingibila":["nestingibilă","nestingibil","nestingibila","nestingibil"],"nestingibile":"nestingibil","nestingibilele":"nestingibil","nestingibili":"nestingibil","nestingibilii":"nestingibil","nestingibilul":"nestingibil","nestinsa":["nestinsă","nestins","nestinsa","nestins"],"nestinse":"nestins","nestinsele":"nestins","nestinsi":"nestins","nestinsii":"nestins","nestinsul":"nestins","nestira":"nești","nestiram":"nești","nestirati":"nești","nestirbita":["neștirbită","neștirbit","neștirbita","neștirbit"],"nestirbite":"neștirbit","nestirbitele":"neștirbit","nestirbiti":"neștirbit","nestirbitii":"neștirbit","nestirbitul":"neștirbit","nestirea":"neștire","nestiri":"neștire","nestirii":"neștire","nestirile":"neștire","nestirilor":"neștire","nestise":"nești","nestisem":"nești","nestisera":"nești","nestiseram":"nești","nestiserati":"nești","nestisesi":"nești","nestisi":"nești","nestit":"nești","nestiti":"nești","nestiuta":["neștiută","neștiut","neștiuta","neștiut"],"nestiute":"neștiut","nestiutele":"neștiut","nestiuti":"neștiut","nestiutii":"neștiut","nestiutoare":"neștiutor","nestiutoarea":"neștiutor","nestiutoarele":"neștiutor","nestiutori":"neștiutor","nestiutori de carte":"neștiutor de carte","nestiutorii":"neștiutor","nestiutorul":"neștiutor","nestiutul":"neștiut","nestiuturi":"neștiutură","nestiuturii":"neștiutură","nestiuturile":"neștiutură","nestiuturilor":"neștiutură","nestoriana":["nestoriană","nestorian","nestoriana","nestorian"],"nestorianismul":"nestorianism","nestorianismule":"nestorianism","nestorianismului":"nestorianism","nestorianul":"nestorian","nestoriene":"nestorian","nestorienele":"nestorian","nestorieni":"nestorian","nestorienii":"nestorian","nestoterapia":"nestoterapie","nestoterapiei":"nestoterapie","nestoterapii":"nestoterapie","nestoterapiile":"nestoterapie","nestoterapiilor":"nestoterapie","nestrabatuta":["nestrăbătută","nestrăbătut","nestrăbătuta","nestrăbătut"],"nestrabatute":"nestrăbătut","nestrabatutele":"nestrăbătut","nestrabatuti":"nestrăbătut","nestrabatutii":"nestrăbătut","nestrabatutul":"nestrăbătut","nestramutarea":"nestrămutare","nestramutari":"nestrămutare","nestramutarii":"nestrămutare","nestramutarile":"nestrămutare","nestramutarilor":"nestrămutare","nestramutata":["nestrămutată","nestrămutat","nestrămutata","nestrămutat"],"nestramutate":"nestrămutat","nestramutatele":"nestrămutat","nestramutati":"nestrămutat","nestramutatii":"nestrămutat","nestramutatul":"nestrămutat","nestravederea":"nestrăvedere","nestravederi":"nestrăvedere","nestravederii":"nestrăvedere","nestravederile":"nestrăvedere","nestravederilor":"nestrăvedere","nestricata":["nestricată","nestricat","nestricata","nestricat"],"nestricate":"nestricat","nestricatele":"nestricat","nestricati":"nestricat","nestricatii":"nestricat","nestricatul":"nestricat","nestructurata":["nestructurată","nestructurat","nestructurata","nestructurat"],"nestructurate":"nestructurat","nestructuratele":"nestructurat","nestructurati":"nestructurat","nestructuratii":"nestructurat","nestructuratul":"nestructurat","nesuferinte":"nesuferință","nesuferintei":"nesuferință","nesuferintele":"nesuferință","nesuferintelor":"nesuferință","nesuferirea":"nesuferire","nesuferiri":"nesuferire","nesuferirii":"nesuferire","nesuferita":["nesuferită","nesuferit","nesuferita","nesuferit"],"nesuferite":"nesuferit","nesuferitele":"nesuferit","nesuferiti":"nesuferit","nesuferitii":"nesuferit","nesuferitul":"nesuferit","nesul":"nes","nesule":"nes","nesului":"nes","nesupravegheata":["nesupravegheată","nesupravegheat","nesupravegheata","nesupravegheat"],"nesupravegheate":"nesupravegheat","nesupravegheatele":"nesupravegheat","nesupravegheati":"nesupravegheat","nesupravegheatii":"nesupravegheat","nesupravegheatul":"nesupravegheat","nesupravegherea":"nesupraveghere","nesupravegheri":"nesupraveghere","nesupravegherii":"nesupraveghere","nesupravegherile":"nesupraveghere","nesupravegherilor":"nesupraveghere","nesupunerea":"nesupunere","nesupuneri":"nesupunere","nesupunerii":"nesupunere","nesupunerile":"nesupunere","nesupunerilor":"nesupunere","nesupusa":["nesupusă","nesupus","nesupusa","nesupus"],"nesupuse":"nesupus","nesupusele":"nesupus","nesupusi":"nesupus","nesupusii":"nesupus","nesupusul":"nesupus","nesuri":"nes","neta":["netă","net","neta","net"],"netagaduita":["netăgăduită","netăgăduit","netăgăduita","netăgăduit"],"netagaduite":"netăgăduit","netagaduitele":"netăgăduit","netagaduiti":"netăgăduit","netagaduitii":"netăgăduit","netagaduitul":"netăgăduit","netainica":["netainică","netainic","netainica","netainic"],"netainice":"netainic","netainicele":"netainic","netainici":"netainic","netainicii":"netainic","netainicul":"netainic","netalentata":["netalentată","netalentat","netalentata","netalentat"],"netalentate":"netalentat","netalentatele":"netalentat","netalentati":"netalentat","netalentatii":"netalentat","netalentatul":"netalentat","netamplarea":"netâmplare","netamplari":"netâmplare","netamplarii":"netâmplare","netamplarile":"netâmplare","netamplarilor":"netâmplare","netareul":"netare","netareule":"netare","netareului":"netare","netarmurita":["nețărmurită","nețărmurit","nețărmurita","nețărmurit"],"netarmurite":"nețărmurit","netarmuritele":"nețărmurit","netarmuriti":"nețărmurit","netarmuritii":"nețărmurit","netarmuritul":"nețărmurit","nete":"net","neteaza":"neteza","neteda":["netedă","neted","neteda","neted"],"netede":"neted","netedele":"neted","netedul":"neted","netele":"net","netematoare":"netemător","netematoarea":"netemător","netematoarele":"netemător","netematori":"netemător","netematorii":"netemător","netematorilor":"netemător","netematorul":"netemător","netematorule":"netemător","netematorului":"netemător","netemeinicia":"netemeinicie","netemeiniciei":"netemeinicie","netemeinicii":"netemeinicie","netemeiniciile":"netemeinicie","netemeiniciilor":"netemeinicie","netemerea":"netemere","netemeri":"netemere","netemerii":"netemere","netemerile":"netemere","netemerilor":"netemere","netemperata":["netemperată","netemperat","netemperata","netemperat"],"netemperate":"netemperat","netemperatele":"netemperat","netemperati":"netemperat","netemperatii":"netemperat","netemperatul":"netemperat","netemuta":["netemută","netemut","netemuta","netemut"],"netemute":"netemut","netemutele":"netemut","netemuti":"netemut","netemutii":"netemut","netemutul":"netemut","neterminata":["neterminată","neterminat","neterminata","neterminat"],"neterminate":"neterminat","neterminatele":"neterminat","neterminati":"neterminat","neterminatii":"neterminat","neterminatul":"neterminat","netezai":"neteza","netezam":["netezăm","neteza","netezam","neteza"],"netezand":"neteza","netezara":"neteza","netezaram":"neteza","netezarati":"neteza","netezase":"neteza","netezasem":"neteza","netezasera":"neteza","netezaseram":"neteza","netezaserati":"neteza","netezasesi":"neteza","netezasi":"neteza","netezat":"neteza","netezati":"neteza","netezau":"neteza","netezea":"netezi","netezeai":"netezi","netezeam":"netezi","netezeati":"netezi","netezeau":"netezi","netezeaza":"neteza","netezela":["netezelă","netezel","netezela","netezel"],"netezele":["netezele","netezeală","netezele","netezel"],"netezelei":"netezeală","netezelele":["netezelele","netezeală","netezelele","netezel"],"netezelelor":"netezeală","netezeli":["netezeli","netezeală","netezeli","netezel"],"netezelii":"netezel","netezelle":"netezel","netezellor":"netezel","netezelul":"netezel","netezesc":"netezi","netezeste":"netezi","netezesti":"netezi","netezez":"neteza","netezezi":"neteza","netezi":"neted","netezii":["netezii","neted","netezii","netezi"],"netezim":"netezi","netezimea":"netezime","netezimi":"netezime","netezimii":"netezime","netezimile":"netezime","netezimilor":"netezime","netezind":"netezi","netezira":"netezi","neteziram":"netezi","netezirati":"netezi","netezirea":"netezire","netezirei":"netezire","netezise":"netezi","netezisem":"netezi","netezisera":"netezi","neteziseram":"netezi","neteziserati":"netezi","netezisesi":"netezi","netezisi":"netezi","netezisul":"neteziș","netezisule":"neteziș","netezisului":"neteziș","netezisuri":"neteziș","netezisurile":"neteziș","netezisurilor":"neteziș","netezit":"netezi","netezita":["netezită","netezit","netezita","netezit"],"netezite":"netezit","netezitele":"netezit","neteziti":["neteziți","netezi","neteziți","netezit"],"netezitii":"netezit","netezitoare":"netezitor","netezitore":"netezitor","netezitorele":"netezitor","netezitorelor":"netezitor","netezitorul":"netezitor","netezitorule":"netezitor","netezitorului":"netezitor","netezitul":"netezit","netezituri":"netezitură","neteziturii":"netezitură","neteziturile":"netezitură","neteziturilor":"netezitură","neti":"net","netihni":"netihn","netihnii":"netihn","netihnilor":"netihn","netihnul":"netihn","netihnule":"netihn","netihnului":"netihn","netii":"net","netocmele":"netocmeală","netocmelei":"netocmeală","netocmelele":"netocmeală","netocmelelor":"netocmeală","netocmeli":"netocmeală","netocmirea":"netocmire","netocmiri":"netocmire","netocmirii":"netocmire","netocmirile":"netocmire","netocmirilor":"netocmire","netoti":"netot","netotia":"netoție","netotiei":"netoție","netotii":["netoții","netot","netoții","netoție"],"netotiile":"netoție","netotiilor":"netoție","netotilor":"netot","netotul":"netot","netotule":"netot","netotului":"netot","netransferabila":["netransferabilă","netransferabil","netransferabila","netransferabil"],"netransferabile":"netransferabil","netransferabilele":"netransferabil","netransferabili":"netransferabil","netransferabilii":"netransferabil","netransferabilul":"netransferabil","netreabe":"netreabă","netreabei":"netreabă","netrebnica":["netrebnică","netrebnic","netrebnica","netrebnic"],"netrebnice":"netrebnic","netrebnicele":"netrebnic","netrebnici":"netrebnic","netrebnicia":"netrebnicie","netrebniciei":"netrebnicie","netrebnicii":["netrebnicii","netrebnic","netrebnicii","netrebnicie"],"netrebniciile":"netrebnicie","netrebniciilor":"netrebnicie","netrebnicul":"netrebnic","netrebuincioasa":["netrebuincioasă","netrebuincios","netrebuincioasa","netrebuincios"],"netrebuincioase":"netrebuincios","netrebuincioasele":"netrebuincios","netrebuinciosi":"netrebuincios","netrebuinciosii":"netrebuincios","netrebuinciosul":"netrebuincios","netrebuita":["netrebuită","netrebuit","netrebuita","netrebuit"],"netrebuite":"netrebuit","netrebuitele":"netrebuit","netrebuiti":"netrebuit","netrebuitii":"netrebuit","netrebuitul":"netrebuit","netriviala":["netrivială","netrivial","netriviala","netrivial"],"netriviale":"netrivial","netrivialele":"netrivial","netriviali":"netrivial","netrivialii":"netrivial","netrivialul":"netrivial","netrucata":["netrucată","netrucat","netrucata","netrucat"],"netrucate":"netrucat","netrucatele":"netrucat","netrucati":"netrucat","netrucatii":"netrucat","netrucatul":"netrucat","netrufe":"netrufă","netrufei":"netrufă","netrufele":"netrufă","netrufelor":"netrufă","netrunchiata":["netrunchiată","netrunchiat","netrunchiata","netrunchiat"],"netrunchiate":"netrunchiat","netrunchiatele":"netrunchiat","netrunchiati":"netrunchiat","netrunchiatii":"netrunchiat","netrunchiatul":"netrunchiat","netul":"net","netulburata":["netulburată","netulburat","netulburata","netulburat"],"netulburate":"netulburat","netulburatele":"netulburat","netulburati":"netulburat","netulburatii":"netulburat","netulburatul":"netulburat","neuitabila":["neuitabilă","neuitabil","neuitabila","neuitabil"],"neuitabile":"neuitabil","neuitabilele":"neuitabil","neuitabili":"neuitabil","neuitabilii":"neuitabil"};
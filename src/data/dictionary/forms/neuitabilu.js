@@ -0,0 +1 @@
+export default {"neuitabilul":"neuitabil","neuitarea":"neuitare","neuitari":"neuitare","neuitarii":"neuitare","neuitarile":"neuitare","neuitarilor":"neuitare","neuitata":["neuitată","neuitat","neuitata","neuitat"],"neuitate":"neuitat","neuitatele":"neuitat","neuitati":"neuitat","neuitatii":"neuitat","neuitatul":"neuitat","neumana":["neumană","neuman","neumana","neuman"],"neumane":"neuman","neumanele":"neuman","neumani":"neuman","neumanii":"neuman","neumanul":"neuman","neumblata":["neumblată","neumblat","neumblata","neumblat"],"neumblate":"neumblat","neumblatele":"neumblat","neumblati":"neumblat","neumblatii":"neumblat","neumblatul":"neumblat","neume":"neumă","neumei":"neumă","neumele":"neumă","neumelor":"neumă","neunirea":"neunire","neuniri":"neunire","neunirii":"neunire","neunirile":"neunire","neunirilor":"neunire","neurala":["neurală","neural","neurala","neural"],"neurale":"neural","neuralele":"neural","neurali":"neural","neuralii":"neural","neuralul":"neural","neurastenia":"neurastenie","neurastenica":["neurastenică","neurastenic","neurastenica","neurastenic"],"neurastenice":["neurastenice","neurastenic","neurastenice","neurastenică"],"neurastenicei":"neurastenică","neurastenicele":["neurastenicele","neurastenic","neurastenicele","neurastenică"],"neurastenicelor":"neurastenică","neurastenici":"neurastenic","neurastenicii":"neurastenic","neurastenicul":"neurastenic","neurasteniei":"neurastenie","neurastenii":"neurastenie","neurasteniile":"neurastenie","neurasteniilor":"neurastenie","neurastenizai":"neurasteniza","neurastenizam":["neurastenizăm","neurasteniza","neurastenizam","neurasteniza"],"neurastenizand":"neurasteniza","neurastenizara":"neurasteniza","neurastenizaram":"neurasteniza","neurastenizarati":"neurasteniza","neurastenizase":"neurasteniza","neurastenizasem":"neurasteniza","neurastenizasera":"neurasteniza","neurastenizaseram":"neurasteniza","neurastenizaserati":"neurasteniza","neurastenizasesi":"neurasteniza","neurastenizasi":"neurasteniza","neurastenizat":"neurasteniza","neurastenizata":["neurastenizată","neurastenizat","neurastenizata","neurastenizat"],"neurastenizate":"neurastenizat","neurastenizatele":"neurastenizat","neurastenizati":["neurastenizați","neurasteniza","neurastenizați","neurastenizat"],"neurastenizatii":"neurastenizat","neurastenizatul":"neurastenizat","neurastenizau":"neurasteniza","neurastenizeaza":"neurasteniza","neurastenizez":"neurasteniza","neurastenizezi":"neurasteniza","neurine":"neurină","neurinei":"neurină","neurinele":"neurină","neurinelor":"neurină","neurisme":"neurism","neurismele":"neurism","neurismelor":"neurism","neurismul":"neurism","neurismule":"neurism","neurismului":"neurism","neurite":"neurit","neuritele":"neurit","neuritelor":"neurit","neuritul":"neurit","neuritule":"neurit","neuritului":"neurit","neuroame":"neurom","neuroamele":"neurom","neuroamelor":"neurom","neurobiologia":"neurobiologie","neurobiologiei":"neurobiologie","neurobiologii":"neurobiologie","neuroblastoame":"neuroblastom","neuroblastoamele":"neuroblastom","neuroblastoamelor":"neuroblastom","neuroblastomul":"neuroblastom","neuroblastomule":"neuroblastom","neuroblastomului":"neuroblastom","neuroblastul":"neuroblast","neuroblastule":"neuroblast","neuroblastului":"neuroblast","neurochimiste":"neurochimistă","neurochimistei":"neurochimistă","neurochimistele":"neurochimistă","neurochimistelor":"neurochimistă","neurochirurgi":"neurochirurg","neurochirurgia":"neurochirurgie","neurochirurgiei":"neurochirurgie","neurochirurgii":["neurochirurgii","neurochirurg","neurochirurgii","neurochirurgie"],"neurochirurgilor":"neurochirurg","neurochirurgul":"neurochirurg","neurochirurgule":"neurochirurg","neurochirurgului":"neurochirurg","neurocibernetica":["neurocibernetică","neurocibernetic","neurocibernetica","neurocibernetic"],"neurocibernetice":["neurocibernetice","neurocibernetic","neurocibernetice","neurocibernetică"],"neurociberneticei":"neurocibernetică","neurociberneticele":["neurociberneticele","neurocibernetic","neurociberneticele","neurocibernetică"],"neurociberneticelor":"neurocibernetică","neurocibernetici":"neurocibernetic","neurociberneticii":"neurocibernetic","neurociberneticul":"neurocibernetic","neurocitul":"neurocit","neurocitule":"neurocit","neurocitului":"neurocit","neurocranii":"neurocraniu","neurocraniile":"neurocraniu","neurocraniilor":"neurocraniu","neurocraniuul":"neurocraniu","neurocraniuule":"neurocraniu","neurocraniuului":"neurocraniu","neurodermatoze":"neurodermatoză","neurodermatozei":"neurodermatoză","neurodermatozele":"neurodermatoză","neurodermatozelor":"neurodermatoză","neurodermite":"neurodermită","neurodermitei":"neurodermită","neurodermitele":"neurodermită","neurodermitelor":"neurodermită","neuroendocrina":["neuroendocrină","neuroendocrin","neuroendocrina","neuroendocrin"],"neuroendocrine":"neuroendocrin","neuroendocrinele":"neuroendocrin","neuroendocrini":"neuroendocrin","neuroendocrinii":"neuroendocrin","neuroendocrinologia":"neuroendocrinologie","neuroendocrinologiei":"neuroendocrinologie","neuroendocrinologii":"neuroendocrinologie","neuroendocrinologiile":"neuroendocrinologie","neuroendocrinologiilor":"neuroendocrinologie","neuroendocrinul":"neuroendocrin","neurofibrile":"neurofibrilă","neurofibrilei":"neurofibrilă","neurofibrilele":"neurofibrilă","neurofibrilelor":"neurofibrilă","neurofibroame":"neurofibrom","neurofibroamele":"neurofibrom","neurofibroamelor":"neurofibrom","neurofibromatoze":"neurofibromatoză","neurofibromatozei":"neurofibromatoză","neurofibromatozele":"neurofibromatoză","neurofibromatozelor":"neurofibromatoză","neurofibromul":"neurofibrom","neurofibromule":"neurofibrom","neurofibromului":"neurofibrom","neurofiziologe":"neurofiziologă","neurofiziologei":"neurofiziologă","neurofiziologele":"neurofiziologă","neurofiziologelor":"neurofiziologă","neurofiziologi":"neurofiziolog","neurofiziologia":"neurofiziologie","neurofiziologiei":"neurofiziologie","neurofiziologii":["neurofiziologii","neurofiziolog","neurofiziologii","neurofiziologie"],"neurofiziologilor":"neurofiziolog","neurofiziologul":"neurofiziolog","neurofiziologule":"neurofiziolog","neurofiziologului":"neurofiziolog","neuroglioame":"neurogliom","neuroglioamele":"neurogliom","neuroglioamelor":"neurogliom","neurogliomul":"neurogliom","neurogliomule":"neurogliom","neurogliomului":"neurogliom","neuroinfectia":"neuroinfecție","neuroinfectiei":"neuroinfecție","neuroinfectii":"neuroinfecție","neuroinfectiile":"neuroinfecție","neuroinfectiilor":"neuroinfecție","neuroleptica":["neuroleptică","neuroleptic","neuroleptica","neuroleptic"],"neuroleptice":"neuroleptic","neurolepticele":"neuroleptic","neuroleptici":"neuroleptic","neurolepticii":"neuroleptic","neurolepticul":"neuroleptic","neurolimfe":"neurolimfă","neurolimfei":"neurolimfă","neurolimfele":"neurolimfă","neurolimfelor":"neurolimfă","neurolimfomatoze":"neurolimfomatoză","neurolimfomatozei":"neurolimfomatoză","neurolimfomatozele":"neurolimfomatoză","neurolimfomatozelor":"neurolimfomatoză","neurolingvistice":"neurolingvistică","neurolingvisticei":"neurolingvistică","neurolize":"neuroliză","neurolizei":"neuroliză","neurolizele":"neuroliză","neurolizelor":"neuroliză","neurologe":"neurologă","neurologei":"neurologă","neurologele":"neurologă","neurologelor":"neurologă","neurologi":"neurolog","neurologia":"neurologie","neurologica":["neurologică","neurologic","neurologica","neurologic"],"neurologice":"neurologic","neurologicele":"neurologic","neurologici":"neurologic","neurologicii":"neurologic","neurologicul":"neurologic","neurologiei":"neurologie","neurologii":["neurologii","neurolog","neurologii","neurologie"],"neurologilor":"neurolog","neurologul":"neurolog","neurologule":"neurolog","neurologului":"neurolog","neuromul":"neurom","neuromule":"neurom","neuromului":"neurom","neuromusculara":["neuromusculară","neuromuscular","neuromusculara","neuromuscular"],"neuromusculare":"neuromuscular","neuromuscularele":"neuromuscular","neuromusculari":"neuromuscular","neuromuscularii":"neuromuscular","neuromuscularul":"neuromuscular","neuroni":"neuron","neuroni piramidali":"neuron piramidal","neuronii":"neuron","neuronilor":"neuron","neuronofagia":"neuronofagie","neuronofagiei":"neuronofagie","neuronofagii":"neuronofagie","neuronofagiile":"neuronofagie","neuronofagiilor":"neuronofagie","neuronul":"neuron","neuronule":"neuron","neuronului":"neuron","neuropatologi":"neuropatolog","neuropatologia":"neuropatologie","neuropatologiei":"neuropatologie","neuropatologii":["neuropatologii","neuropatolog","neuropatologii","neuropatologie"],"neuropatologilor":"neuropatolog","neuropatologul":"neuropatolog","neuropatologule":"neuropatolog","neuropatologului":"neuropatolog","neuroplasme":"neuroplasmă","neuroplasmei":"neuroplasmă","neuroplasmele":"neuroplasmă","neuroplasmelor":"neuroplasmă","neuroplegia":"neuroplegie","neuroplegica":["neuroplegică","neuroplegic","neuroplegica","neuroplegic"],"neuroplegice":"neuroplegic","neuroplegicele":"neuroplegic","neuroplegici":"neuroplegic","neuroplegicii":"neuroplegic","neuroplegicul":"neuroplegic","neuroplegiei":"neuroplegie","neuroplegii":"neuroplegie","neuroplegiile":"neuroplegie","neuroplegiilor":"neuroplegie","neuropsihiatri":"neuropsihiatru","neuropsihiatria":"neuropsihiatrie","neuropsihiatriei":"neuropsihiatrie","neuropsihiatrii":["neuropsihiatrii","neuropsihiatrie","neuropsihiatrii","neuropsihiatru"],"neuropsihiatrilor":"neuropsihiatru","neuropsihiatruul":"neuropsihiatru","neuropsihiatruule":"neuropsihiatru","neuropsihiatruului":"neuropsihiatru","neuropsihica":["neuropsihică","neuropsihic","neuropsihica","neuropsihic"],"neuropsihice":"neuropsihic","neuropsihicele":"neuropsihic","neuropsihici":"neuropsihic","neuropsihicii":"neuropsihic","neuropsihicul":"neuropsihic","neuropsihologi":"neuropsiholog","neuropsihologia":"neuropsihologie","neuropsihologica":["neuropsihologică","neuropsihologic","neuropsihologica","neuropsihologic"],"neuropsihologice":"neuropsihologic","neuropsihologicele":"neuropsihologic","neuropsihologici":"neuropsihologic","neuropsihologicii":"neuropsihologic","neuropsihologicul":"neuropsihologic","neuropsihologiei":"neuropsihologie","neuropsihologii":["neuropsihologii","neuropsiholog","neuropsihologii","neuropsihologie"],"neuropsihologiile":"neuropsihologie","neuropsihologiilor":"neuropsihologie","neuropsihologilor":"neuropsiholog","neuropsihologul":"neuropsiholog","neuropsihologule":"neuropsiholog","neuropsihologului":"neuropsiholog","neuroradiologe":"neuroradiologă","neuroradiologei":"neuroradiologă","neuroradiologele":"neuroradiologă","neuroradiologelor":"neuroradiologă","neurosifilisul":"neurosifilis","neurosifilisule":"neurosifilis","neurosifilisului":"neurosifilis","neurosimpatica":["neurosimpatică","neurosimpatic","neurosimpatica","neurosimpatic"],"neurosimpatice":"neurosimpatic","neurosimpaticele":"neurosimpatic","neurosimpatici":"neurosimpatic","neurosimpaticii":"neurosimpatic","neurosimpaticul":"neurosimpatic","neurotoame":"neurotom","neurotoamele":"neurotom","neurotoamelor":"neurotom","neurotomia":"neurotomie","neurotomiei":"neurotomie","neurotomii":"neurotomie","neurotomiile":"neurotomie","neurotomiilor":"neurotomie","neurotomul":"neurotom","neurotomule":"neurotom","neurotomului":"neurotom","neurotonici":"neurotonic","neurotonicile":"neurotonic","neurotonicilor":"neurotonic","neurotonicul":"neurotonic","neurotonicule":"neurotonic","neurotonicului":"neurotonic","neurotoxine":"neurotoxină","neurotoxinei":"neurotoxină","neurotoxinele":"neurotoxină","neurotoxinelor":"neurotoxină","neurotropa":["neurotropă","neurotrop","neurotropa","neurotrop"],"neurotrope":"neurotrop","neurotropele":"neurotrop","neurotropi":"neurotrop","neurotropii":"neurotrop","neurotropisme":"neurotropism","neurotropismele":"neurotropism","neurotropismelor":"neurotropism","neurotropismul":"neurotropism","neurotropismule":"neurotropism","neurotropismului":"neurotropism","neurotropul":"neurotrop","neurovegetativa":["neurovegetativă","neurovegetativ","neurovegetativa","neurovegetativ"],"neurovegetative":"neurovegetativ","neurovegetativele":"neurovegetativ","neurovegetativi":"neurovegetativ","neurovegetativii":"neurovegetativ","neurovegetativul":"neurovegetativ","neurule":"neurulă","neurulei":"neurulă","neurulele":"neurulă","neurulelor":"neurulă","neustoane":"neuston","neustoanele":"neuston","neustoanelor":"neuston","neustonul":"neuston","neustonule":"neuston","neustonului":"neuston","neutra":["neutră","neutru","neutra","neutru"],"neutrala":["neutrală","neutral","neutrala","neutral"],"neutrale":"neutral","neutralele":"neutral","neutrali":"neutral","neutralii":"neutral","neutralismul":"neutralism","neutralismule":"neutralism","neutralismului":"neutralism","neutralista":["neutralistă","neutralist","neutralista","neutralist"],"neutraliste":"neutralist","neutralistele":"neutralist","neutralisti":"neutralist","neutralistii":"neutralist","neutralistilor":"neutralist","neutralistul":"neutralist","neutralistule":"neutralist","neutralistului":"neutralist","neutralitatea":"neutralitate","neutralitati":"neutralitate","neutralitatii":"neutralitate","neutralizai":"neutraliza","neutralizam":["neutralizăm","neutraliza","neutralizam","neutraliza"],"neutralizand":"neutraliza","neutralizanta":["neutralizantă","neutralizant","neutralizanta","neutralizant"],"neutralizante":"neutralizant","neutralizantele":"neutralizant","neutralizanti":"neutralizant","neutralizantii":"neutralizant","neutralizantul":"neutralizant","neutralizara":"neutraliza","neutralizaram":"neutraliza","neutralizarati":"neutraliza","neutralizarea":"neutralizare","neutralizari":"neutralizare","neutralizarii":"neutralizare","neutralizarile":"neutralizare","neutralizarilor":"neutralizare","neutralizase":"neutraliza","neutralizasem":"neutraliza","neutralizasera":"neutraliza","neutralizaseram":"neutraliza","neutralizaserati":"neutraliza","neutralizasesi":"neutraliza","neutralizasi":"neutraliza","neutralizat":"neutraliza","neutralizata":["neutralizată","neutralizat","neutralizata","neutralizat"],"neutralizate":"neutralizat","neutralizatele":"neutralizat","neutralizati":["neutralizați","neutraliza","neutralizați","neutralizat"],"neutralizatia":"neutralizație","neutralizatiei":"neutralizație","neutralizatii":["neutralizații","neutralizat","neutralizații","neutralizație"],"neutralizatiile":"neutralizație","neutralizatiilor":"neutralizație","neutralizatul":"neutralizat","neutralizau":"neutraliza","neutralizeaza":"neutraliza","neutralizez":"neutraliza","neutralizezi":"neutraliza","neutralul":"neutral","neutre":"neutru","neutrele":"neutru","neutri":"neutru","neutrii":"neutru","neutrinoul":"neutrino","neutrinoule":"neutrino","neutrinoului":"neutrino","neutrofila":["neutrofilă","neutrofil","neutrofila","neutrofil"],"neutrofile":"neutrofil","neutrofilele":"neutrofil","neutrofili":"neutrofil","neutrofilia":"neutrofilie","neutrofiliei":"neutrofilie","neutrofilii":["neutrofilii","neutrofil","neutrofilii","neutrofilie"],"neutrofiliile":"neutrofilie","neutrofiliilor":"neutrofilie","neutrofilul":"neutrofil","neutroni":"neutron","neutronica":["neutronică","neutronic","neutronica","neutronic"],"neutronice":"neutronic","neutronicele":"neutronic","neutronici":"neutronic","neutronicii":"neutronic","neutronicul":"neutronic","neutronii":"neutron","neutronilor":"neutron","neutronul":"neutron","neutronule":"neutron","neutronului":"neutron","neutrul":"neutru","neuzata":["neuzată","neuzat","neuzata","neuzat"],"neuzate":"neuzat","neuzatele":"neuzat","neuzati":"neuzat","neuzatii":"neuzat","neuzatul":"neuzat","neuzitata":["neuzitată","neuzitat","neuzitata","neuzitat"],"neuzitate":"neuzitat","neuzitatele":"neuzitat","neuzitati":"neuzitat","neuzitatii":"neuzitat","neuzitatul":"neuzitat","nevaccinata":["nevaccinată","nevaccinat","nevaccinata","nevaccinat"],"nevaccinate":"nevaccinat","nevaccinatele":"nevaccinat","nevaccinati":"nevaccinat","nevaccinatii":"nevaccinat","nevaccinatul":"nevaccinat","nevalorificata":["nevalorificată","nevalorificat","nevalorificata","nevalorificat"],"nevalorificate":"nevalorificat","nevalorificatele":"nevalorificat","nevalorificati":"nevalorificat","nevalorificatii":"nevalorificat","nevalorificatul":"nevalorificat","nevarstnica":["nevârstnică","nevârstnic","nevârstnica","nevârstnic"],"nevarstnice":"nevârstnic","nevarstnicele":"nevârstnic","nevarstnici":"nevârstnic","nevarstnicia":"nevârstnicie","nevarstniciei":"nevârstnicie","nevarstnicii":["nevârstnicii","nevârstnic","nevârstnicii","nevârstnicie"],"nevarstniciile":"nevârstnicie","nevarstniciilor":"nevârstnicie","nevarstnicul":"nevârstnic","nevastuci":"nevăstucă","nevastucii":"nevăstucă","nevastucile":"nevăstucă","nevastucilor":"nevăstucă","nevastui":"nevăstuie","nevastuia":"nevăstuie","nevastuici":"nevăstuică","nevastuicii":"nevăstuică","nevastuicile":"nevăstuică","nevastuicilor":"nevăstuică","nevastuii":"nevăstuie","nevastuile":"nevăstuie","nevastuilor":"nevăstuie","nevastute":"nevăstuță","nevastutei":"nevăstuță","nevastutele":"nevăstuță","nevastutelor":"nevăstuță","nevatamata":["nevătămată","nevătămat","nevătămata","nevătămat"],"nevatamate":"nevătămat","nevatamatele":"nevătămat","nevatamati":"nevătămat","nevatamatii":"nevătămat","nevatamatoare":"nevătămător","nevatamatoarea":"nevătămător","nevatamatoarele":"nevătămător","nevatamatori":"nevătămător","nevatamatorii":"nevătămător","nevatamatorul":"nevătămător","nevatamatul":"nevătămat","nevazatoare":"nevăzător","nevazatoarea":["nevăzătoarea","nevăzătoare","nevăzătoarea","nevăzător"],"nevazatoarei":"nevăzătoare","nevazatoarele":["nevăzătoarele","nevăzătoare","nevăzătoarele","nevăzător"],"nevazatoarelor":"nevăzătoare","nevazatori":"nevăzător","nevazatorii":"nevăzător","nevazatorilor":"nevăzător","nevazatorul":"nevăzător","nevazatorule":"nevăzător","nevazatorului":"nevăzător","nevazuta":["nevăzută","nevăzut","nevăzuta","nevăzut"],"nevazute":"nevăzut","nevazutele":"nevăzut","nevazuti":"nevăzut","nevazutii":"nevăzut","nevazutul":"nevăzut","nevedea":"nevedi","nevedeai":"nevedi","nevedeam":"nevedi","nevedeati":"nevedi","nevedeau":"nevedi","nevedenia":"nevedenie","nevedeniei":"nevedenie","nevedenii":"nevedenie","nevedeniile":"nevedenie","nevedeniilor":"nevedenie","nevederea":"nevedere","nevederi":"nevedere","nevederii":"nevedere","nevederile":"nevedere","nevederilor":"nevedere","nevedesc":"nevedi","nevedeste":"nevedi","nevedesti":"nevedi","nevedii":"nevedi","nevedim":"nevedi","nevedind":"nevedi","nevedira":"nevedi","nevediram":"nevedi","nevedirati":"nevedi","nevedise":"nevedi","nevedisem":"nevedi","nevedisera":"nevedi","nevediseram":"nevedi","nevediserati":"nevedi","nevedisesi":"nevedi","nevedisi":"nevedi","nevedit":"nevedi","nevediti":"nevedi","nevenovenia":"nevenovenie","nevenoveniei":"nevenovenie","nevenovenii":"nevenovenie","nevenoveniile":"nevenovenie","nevenoveniilor":"nevenovenie","neverdea":"neverde","neverdele":"neverde","neverosimila":["neverosimilă","neverosimil","neverosimila","neverosimil"],"neverosimile":"neverosimil","neverosimilele":"neverosimil","neverosimili":"neverosimil","neverosimilii":"neverosimil","neverosimilul":"neverosimil","nevertebrate":"nevertebrată","nevertebratei":"nevertebrată","nevertebratele":"nevertebrată","nevertebratelor":"nevertebrată","nevertebrati":"nevertebrat","nevertebratii":"nevertebrat","nevertebratilor":"nevertebrat","nevertebratul":"nevertebrat","nevertebratule":"nevertebrat","nevertebratului":"nevertebrat","neverzi":"neverde","neverzii":"neverde","neveste":"nevastă","nevestea":"nevesti","nevesteai":"nevesti","nevesteam":"nevesti","nevesteasca":["nevestească","nevestesc","nevesteasca","nevestesc"],"nevesteati":"nevesti","nevesteau":"nevesti","nevesteaua":"nevestea","nevestei":"nevastă","nevestejita":["neveștejită","neveștejit","neveștejita","neveștejit"],"nevestejite":"neveștejit","nevestejitele":"neveștejit","nevestejiti":"neveștejit","nevestejitii":"neveștejit","nevestejitul":"neveștejit","nevestele":["nevestele","nevastă","nevestele","nevestea"],"nevestelei":"nevestea","nevestelele":"nevestea","nevestelelor":"nevestea","nevestelor":"nevastă","nevestesc":"nevesti","nevestescul":"nevestesc","nevesteste":"nevesti","nevestesti":["nevestești","nevestesc","nevestești","nevesti"],"nevestestii":"nevestesc","nevestestile":"nevestesc","nevestia":"nevestie","nevestice":"nevestică","nevesticei":"nevestică","nevesticele":"nevestică","nevesticelor":"nevestică","nevestici":"nevestică","nevestiei":"nevestie","nevestii":["nevestii","nevesti","nevestii","nevestie"],"nevestiile":"nevestie","nevestiilor":"nevestie","nevestim":"nevesti","nevestind":"nevesti","nevestioare":"nevestioară","nevestioarei":"nevestioară","nevestioarele":"nevestioară","nevestioarelor":"nevestioară","nevestira":"nevesti","nevestiram":"nevesti","nevestirati":"nevesti","nevestirea":"nevestire","nevestiri":"nevestire","nevestirii":"nevestire","nevestirile":"nevestire","nevestirilor":"nevestire","nevestise":"nevesti","nevestisem":"nevesti","nevestisera":"nevesti","nevestiseram":"nevesti","nevestiserati":"nevesti","nevestisesi":"nevesti","nevestisi":"nevesti","nevestit":"nevesti","nevestiti":"nevesti","nevestitul":"nevestit","nevestitule":"nevestit","nevestitului":"nevestit","nevestituri":"nevestit","nevestiturile":"nevestit","nevestiturilor":"nevestit","neveul":"neveu","neveule":"neveu","neveului":"neveu","neveuri":"neveu","neveurile":"neveu","neveurilor":"neveu","nevezia":"nevezie","neveziei":"nevezie","nevezii":"nevezie","neveziile":"nevezie","neveziilor":"nevezie","nevi":"nev","neviabila":["neviabilă","neviabil","neviabila","neviabil"],"neviabile":"neviabil","neviabilele":"neviabil","neviabili":"neviabil","neviabilii":"neviabil","neviabilul":"neviabil","neviate":"neviață","neviatei":"neviață","neviciata":["neviciată","neviciat","neviciata","neviciat"],"neviciate":"neviciat","neviciatele":"neviciat","neviciati":"neviciat","neviciatii":"neviciat","neviciatul":"neviciat","nevii":"nev","nevilor":"nev","nevindecabila":["nevindecabilă","nevindecabil","nevindecabila","nevindecabil"],"nevindecabile":"nevindecabil","nevindecabilele":"nevindecabil","nevindecabili":"nevindecabil","nevindecabilii":"nevindecabil","nevindecabilul":"nevindecabil","nevindecata":["nevindecată","nevindecat","nevindecata","nevindecat"],"nevindecate":"nevindecat","nevindecatele":"nevindecat","nevindecati":"nevindecat","nevindecatii":"nevindecat","nevindecatul":"nevindecat","nevinovata":["nevinovată","nevinovat","nevinovata","nevinovat"],"nevinovate":["nevinovate","nevinovat","nevinovate","nevinovată"],"nevinovatei":"nevinovată","nevinovatele":["nevinovatele","nevinovat","nevinovatele","nevinovată"],"nevinovatelor":"nevinovată","nevinovati":"nevinovat","nevinovatia":"nevinovăție","nevinovatiei":"nevinovăție","nevinovatii":["nevinovații","nevinovat","nevinovății","nevinovăție"],"nevinovatiile":"nevinovăție","nevinovatiilor":"nevinovăție","nevinovatul":"nevinovat","neviolabila":["neviolabilă","neviolabil","neviolabila","neviolabil"],"neviolabile":"neviolabil","neviolabilele":"neviolabil","neviolabili":"neviolabil","neviolabilii":"neviolabil","neviolabilitatea":"neviolabilitate","neviolabilitati":"neviolabilitate","neviolabilitatii":"neviolabilitate","neviolabilul":"neviolabil","neviscute":"neviscuță","neviscutei":"neviscuță","neviscutele":"neviscuță","neviscutelor":"neviscuță","nevizibila":["nevizibilă","nevizibil","nevizibila","nevizibil"],"nevizibile":"nevizibil","nevizibilele":"nevizibil","nevizibili":"nevizibil","nevizibilii":"nevizibil","nevizibilitatea":"nevizibilitate","nevizibilitati":"nevizibilitate","nevizibilitatii":"nevizibilitate","nevizibilitatile":"nevizibilitate","nevizibilitatilor":"nevizibilitate","nevizibilul":"nevizibil","nevoade":"nevod","nevoadele":"nevod","nevoadelor":"nevod","nevodul":"nevod","nevodule":"nevod","nevodului":"nevod","nevoi":"nevoie","nevoia":["nevoia","nevoi","nevoia","nevoie"],"nevoiai":"nevoi","nevoiam":"nevoi","nevoiasa":["nevoiașă","nevoiaș","nevoiașa","nevoiaș"],"nevoiase":["nevoiașe","nevoiaș","nevoiașe","nevoiașă"],"nevoiasei":"nevoiașă","nevoiasele":["nevoiașele","nevoiaș","nevoiașele","nevoiașă"],"nevoiaselor":"nevoiașă","nevoiasi":"nevoiaș","nevoiasii":"nevoiaș","nevoiasul":"nevoiaș","nevoiati":"nevoi","nevoiau":"nevoi","nevoiesc":"nevoi","nevoieste":"nevoi","nevoiesti":"nevoi","nevoii":["nevoii","nevoi","nevoii","nevoie"],"nevoile":"nevoie","nevoilor":"nevoie","nevoim":"nevoi","nevoind":"nevoi","nevoinica":["nevoinică","nevoinic","nevoinica","nevoinic"],"nevoinice":"nevoinic","nevoinicele":"nevoinic","nevoinici":"nevoinic","nevoinicia":"nevoinicie","nevoiniciei":"nevoinicie","nevoinicii":["nevoinicii","nevoinic","nevoinicii","nevoinicie"],"nevoiniciile":"nevoinicie","nevoiniciilor":"nevoinicie","nevoinicul":"nevoinic","nevointasi":"nevointaș","nevointasii":"nevointaș","nevointasilor":"nevointaș","nevointasul":"nevointaș","nevointasule":"nevointaș","nevointasului":"nevointaș","nevointe":"nevoință","nevointei":"nevoință","nevointele":"nevoință","nevointelor":"nevoință","nevoioasa":["nevoioasă","nevoios","nevoioasa","nevoios"],"nevoioase":"nevoios","nevoioasele":"nevoios","nevoiosi":"nevoios","nevoiosii":"nevoios","nevoiosul":"nevoios","nevoira":"nevoi","nevoiram":"nevoi","nevoirati":"nevoi","nevoise":"nevoi","nevoisem":"nevoi","nevoisera":"nevoi","nevoiseram":"nevoi","nevoiserati":"nevoi","nevoisesi":"nevoi","nevoisi":"nevoi","nevoit":"nevoi","nevoita":["nevoită","nevoit","nevoita","nevoit"],"nevoite":"nevoit","nevoitele":"nevoit","nevoiti":["nevoiți","nevoi","nevoiți","nevoit"],"nevoitii":"nevoit","nevoitoare":"nevoitor","nevoitoarea":"nevoitor","nevoitoarele":"nevoitor","nevoitori":"nevoitor","nevoitorii":"nevoitor","nevoitorul":"nevoitor","nevoitul":"nevoit","nevolnica":["nevolnică","nevolnic","nevolnica","nevolnic"],"nevolnice":["nevolnice","nevolnic","nevolnice","nevolnică"],"nevolnicei":"nevolnică","nevolnicele":["nevolnicele","nevolnic","nevolnicele","nevolnică"],"nevolnicelor":"nevolnică","nevolnici":"nevolnic","nevolnicia":"nevolnicie","nevolniciei":"nevolnicie","nevolnicii":["nevolnicii","nevolnic","nevolnicii","nevolnicie"],"nevolnicul":"nevolnic","nevralgia":"nevralgie","nevralgica":["nevralgică","nevralgic","nevralgica","nevralgic"],"nevralgice":"nevralgic","nevralgicele":"nevralgic","nevralgici":"nevralgic","nevralgicii":"nevralgic","nevralgicul":"nevralgic","nevralgiei":"nevralgie","nevralgii":"nevralgie","nevralgiile":"nevralgie","nevralgiilor":"nevralgie","nevrastnica":["nevrâstnică","nevrâstnic","nevrâstnica","nevrâstnic"],"nevrastnice":"nevrâstnic","nevrastnicele":"nevrâstnic","nevrastnici":"nevrâstnic","nevrastnicii":"nevrâstnic","nevrastnicul":"nevrâstnic","nevraxul":"nevrax","nevraxule":"nevrax","nevraxului":"nevrax","nevrectomia":"nevrectomie","nevrectomiei":"nevrectomie","nevrectomii":"nevrectomie","nevrectomiile":"nevrectomie","nevrectomiilor":"nevrectomie","nevrednica":["nevrednică","nevrednic","nevrednica","nevrednic"],"nevrednice":"nevrednic","nevrednicele":"nevrednic","nevrednici":"nevrednic","nevrednicia":"nevrednicie","nevredniciei":"nevrednicie","nevrednicii":["nevrednicii","nevrednic","nevrednicii","nevrednicie"],"nevrednicul":"nevrednic","nevricale":"nevrica","nevricalei":"nevrica","nevricalele":"nevrica","nevricalelor":"nevrica","nevricaua":"nevrica","nevricoasa":["nevricoasă","nevricos","nevricoasa","nevricos"],"nevricoase":"nevricos","nevricoasele":"nevricos","nevricosi":"nevricos","nevricosii":"nevricos","nevricosul":"nevricos","nevrite":"nevrită","nevritei":"nevrită","nevritele":"nevrită","nevritelor":"nevrită","nevroame":"nevrom","nevroamele":"nevrom","nevroamelor":"nevrom","nevroglia":"nevroglie","nevrogliei":"nevroglie","nevroglii":"nevroglie","nevrografi":"nevrograf","nevrografia":"nevrografie","nevrografiei":"nevrografie","nevrografii":["nevrografii","nevrograf","nevrografii","nevrografie"],"nevrografiile":"nevrografie","nevrografiilor":"nevrografie","nevrografilor":"nevrograf","nevrograful":"nevrograf","nevrografule":"nevrograf","nevrografului":"nevrograf","nevromul":"nevrom","nevromule":"nevrom","nevromului":"nevrom","nevropate":"nevropată","nevropatei":"nevropată","nevropatele":"nevropată","nevropatelor":"nevropată","nevropati":"nevropat","nevropatia":"nevropatie","nevropatica":["nevropatică","nevropatic","nevropatica","nevropatic"],"nevropatice":"nevropatic","nevropaticele":"nevropatic","nevropatici":"nevropatic","nevropaticii":"nevropatic","nevropaticul":"nevropatic","nevropatiei":"nevropatie","nevropatii":["nevropații","nevropat","nevropatii","nevropatie"],"nevropatilor":"nevropat","nevropatul":"nevropat","nevropatule":"nevropat","nevropatului":"nevropat","nevroptere":"nevropter","nevropterele":"nevropter","nevropterelor":"nevropter","nevropterul":"nevropter","nevropterule":"nevropter","nevropterului":"nevropter","nevrotica":["nevrotică","nevrotic","nevrotica","nevrotic"],"nevrotice":["nevrotice","nevrotic","nevrotice","nevrotică"],"nevroticei":"nevrotică","nevroticele":["nevroticele","nevrotic","nevroticele","nevrotică"],"nevroticelor":"nevrotică","nevrotici":"nevrotic","nevroticii":"nevrotic","nevroticilor":"nevrotic","nevroticul":"nevrotic","nevroticule":"nevrotic","nevroticului":"nevrotic","nevrotomia":"nevrotomie","nevrotomiei":"nevrotomie","nevrotomii":"nevrotomie","nevrotomiile":"nevrotomie","nevrotomiilor":"nevrotomie","nevrozata":["nevrozată","nevrozat","nevrozata","nevrozat"],"nevrozate":"nevrozat","nevrozatele":"nevrozat","nevrozati":"nevrozat","nevrozatii":"nevrozat","nevrozatul":"nevrozat","nevroze":"nevroză","nevrozei":"nevroză","nevrozele":"nevroză","nevrozelor":"nevroză","nevruta":["nevrută","nevrut","nevruta","nevrut"],"nevrute":"nevrut","nevrutele":"nevrut","nevruti":"nevrut","nevrutii":"nevrut","nevrutul":"nevrut","nevul":"nev","nevule":"nev","nevului":"nev","new yorkul":"New York","new yorkule":"New York","new yorkului":"New York","newtoni":"newton","newtoniana":["newtoniană","newtonian","newtoniana","newtonian"],"newtonianismul":"newtonianism","newtonianismule":"newtonianism","newtonianismului":"newtonianism","newtonianul":"newtonian","newtoniene":["newtoniene","newtonian","newtoniene","newtoniană"],"newtonienei":"newtoniană","newtonienele":["newtonienele","newtonian","newtonienele","newtoniană"],"newtonienelor":"newtoniană","newtonieni":"newtonian","newtonienii":"newtonian","newtonii":"newton","newtonilor":"newton","newtonul":"newton","newtonule":"newton","newtonului":"newton","nexul":"nex","nexule":"nex","nexului":"nex","nexuri":"nex","nexurile":"nex","nexurilor":"nex","nezdravana":["nezdravănă","nezdravăn","nezdravăna","nezdravăn"],"nezdravane":"nezdravăn","nezdravanele":"nezdravăn","nezdravani":"nezdravăn","nezdravanii":"nezdravăn","nezdravanul":"nezdravăn","nezdruncinata":["nezdruncinată","nezdruncinat","nezdruncinata","nezdruncinat"],"nezdruncinate":"nezdruncinat","nezdruncinatele":"nezdruncinat","nezdruncinati":"nezdruncinat","nezdruncinatii":"nezdruncinat","nezdruncinatul":"nezdruncinat","nicaraguana":["nicaraguană","nicaraguan","nicaraguana","nicaraguan"],"nicaraguane":["nicaraguane","nicaraguan","nicaraguane","nicaraguană"],"nicaraguanei":"nicaraguană","nicaraguanele":["nicaraguanele","nicaraguan","nicaraguanele","nicaraguană"],"nicaraguanelor":"nicaraguană","nicaraguani":"nicaraguan","nicaraguanii":"nicaraguan","nicaraguanilor":"nicaraguan","nicaraguanul":"nicaraguan","nicaraguanule":"nicaraguan","nicaraguanului":"nicaraguan","nichelai":"nichela","nichelajul":"nichelaj","nichelajule":"nichelaj","nichelajului":"nichelaj","nichelajuri":"nichelaj","nichelajurile":"nichelaj","nichelajurilor":"nichelaj","nichelam":["nichelăm","nichela","nichelam","nichela"],"nicheland":"nichela","nichelara":"nichela","nichelaram":"nichela","nichelarati":"nichela","nichelarea":"nichelare","nichelari":["nichelari","nichelar","nichelări","nichelare"],"nichelarii":["nichelarii","nichelar","nichelării","nichelare"],"nichelarile":"nichelare","nichelarilor":["nichelarilor","nichelar","nichelărilor","nichelare"],"nichelarul":"nichelar","nichelarule":"nichelar","nichelarului":"nichelar","nichelase":"nichela","nichelasem":"nichela","nichelasera":"nichela","nichelaseram":"nichela","nichelaserati":"nichela","nichelasesi":"nichela","nichelasi":"nichela","nichelat":"nichela","nichelata":["nichelată","nichelat","nichelata","nichelat"],"nichelate":"nichelat","nichelatele":"nichelat","nichelati":["nichelați","nichela","nichelați","nichelat"],"nichelatii":"nichelat","nichelatori":"nichelator","nichelatorii":"nichelator","nichelatorilor":"nichelator","nichelatorul":"nichelator","nichelatorule":"nichelator","nichelatorului":"nichelator","nichelatul":"nichelat","nichelau":"nichela","nicheleaza":"nichela","nichelez":"nichela","nichelezi":"nichela","nicheline":"nichelină","nichelinei":"nichelină","nichelinele":"nichelină","nichelinelor":"nichelină","nichelul":"nichel","nichelule":"nichel","nichelului":"nichel","nichiperceaul":"nichipercea","nichiperceaule":"nichipercea","nichiperceaului":"nichipercea","nici un":"niciun","nici unul":"niciunul","nicio":"niciun","niciuna":"niciunul","niciunele":"niciunul","niciunii":"niciunul","nicocherale":"nicochera","nicocheralei":"nicochera","nicocheralele":"nicochera","nicocheralelor":"nicochera","nicocheraua":"nicochera","nicoreteul":"nicorete","nicoreteule":"nicorete","nicoreteului":"nicorete","nicoreti":"nicorete","nicoretii":"nicorete","nicoretilor":"nicorete","nicotine":"nicotină","nicotinei":"nicotină","nicotinele":"nicotină","nicotinelor":"nicotină","nicotinica":["nicotinică","nicotinic","nicotinica","nicotinic"],"nicotinice":["nicotinice","nicotinic","nicotinice","nicotinică"],"nicotinicei":"nicotinică","nicotinicele":["nicotinicele","nicotinic","nicotinicele","nicotinică"],"nicotinicelor":"nicotinică","nicotinici":"nicotinic","nicotinicii":"nicotinic","nicotinicul":"nicotinic","nicotinismul":"nicotinism","nicotinismule":"nicotinism","nicotinismului":"nicotinism","nicotinizai":"nicotiniza","nicotinizam":["nicotinizăm","nicotiniza","nicotinizam","nicotiniza"],"nicotinizand":"nicotiniza","nicotinizara":"nicotiniza","nicotinizaram":"nicotiniza","nicotinizarati":"nicotiniza","nicotinizase":"nicotiniza","nicotinizasem":"nicotiniza","nicotinizasera":"nicotiniza","nicotinizaseram":"nicotiniza","nicotinizaserati":"nicotiniza","nicotinizasesi":"nicotiniza","nicotinizasi":"nicotiniza","nicotinizat":"nicotiniza","nicotinizata":["nicotinizată","nicotinizat","nicotinizata","nicotinizat"],"nicotinizate":"nicotinizat","nicotinizatele":"nicotinizat","nicotinizati":["nicotinizați","nicotiniza","nicotinizați","nicotinizat"],"nicotinizatii":"nicotinizat","nicotinizatul":"nicotinizat","nicotinizau":"nicotiniza","nicotinizeaza":"nicotiniza","nicotinizez":"nicotiniza","nicotinizezi":"nicotiniza","nicovale":"nicovală","nicovalei":"nicovală","nicovalele":"nicovală","nicovalelor":"nicovală","nicromul":"nicrom","nicromule":"nicrom","nicromului":"nicrom","nicsi":"nix","nicsii":"nix","nicsilor":"nix","nictalfobia":"nictalfobie","nictalfobiei":"nictalfobie","nictalfobii":"nictalfobie","nictalfobiile":"nictalfobie","nictalfobiilor":"nictalfobie","nictalgia":"nictalgie","nictalgiei":"nictalgie","nictalgii":"nictalgie","nictalgiile":"nictalgie","nictalgiilor":"nictalgie","nictalope":"nictalopă","nictalopei":"nictalopă","nictalopele":"nictalopă","nictalopelor":"nictalopă","nictalopi":"nictalop","nictalopia":"nictalopie","nictalopiei":"nictalopie","nictalopii":["nictalopii","nictalop","nictalopii","nictalopie"],"nictalopilor":"nictalop","nictalopul":"nictalop","nictalopule":"nictalop","nictalopului":"nictalop","nictatia":"nictație","nictatiei":"nictație","nictatii":"nictație","nictatiile":"nictație","nictatiilor":"nictație","nictemerul":"nictemer","nictemerule":"nictemer","nictemerului":"nictemer","nictinastia":"nictinastie","nictinastiei":"nictinastie","nictinastii":"nictinastie","nictinastiile":"nictinastie","nictinastiilor":"nictinastie","nictitatia":"nictitație","nictitatiei":"nictitație","nictitatii":"nictitație","nictitatiile":"nictitație","nictitatiilor":"nictitație","nictitropisme":"nictitropism","nictitropismele":"nictitropism","nictitropismelor":"nictitropism","nictitropismul":"nictitropism","nictitropismule":"nictitropism","nictitropismului":"nictitropism","nictofobia":"nictofobie","nictofobiei":"nictofobie","nictofobii":"nictofobie","nictofobiile":"nictofobie","nictofobiilor":"nictofobie","nicturezisul":"nicturezis","nicturezisule":"nicturezis","nicturezisului":"nicturezis","nicturezisuri":"nicturezis","nicturezisurile":"nicturezis","nicturezisurilor":"nicturezis","nicturia":"nicturie","nicturiei":"nicturie","nicturii":"nicturie","nicturiile":"nicturie","nicturiilor":"nicturie","nidatia":"nidație","nidatiei":"nidație","nidatii":"nidație","nidatiile":"nidație","nidatiilor":"nidație","nietzscheana":["nietzscheană","nietzschean","nietzscheana","nietzschean"],"nietzscheanismul":"nietzscheanism","nietzscheanismule":"nietzscheanism","nietzscheanismului":"nietzscheanism","nietzscheanul":"nietzschean","nietzscheanule":"nietzschean","nietzscheanului":"nietzschean","nietzscheeni":"nietzschean","nietzscheenii":"nietzschean","nietzscheenilor":"nietzschean","nietzschene":"nietzschean","nietzschenele":"nietzschean","nietzscheni":"nietzschean","nietzschenii":"nietzschean","nifeul":"nife","nifeule":"nife","nifeului":"nife","nifoblepsia":"nifoblepsie","nifoblepsiei":"nifoblepsie","nifoblepsii":"nifoblepsie","nifoblepsiile":"nifoblepsie","nifoblepsiilor":"nifoblepsie","nigelute":"nigeluță","nigelutei":"nigeluță","nigelutele":"nigeluță","nigelutelor":"nigeluță","nigeriana":["nigeriană","nigerian","nigeriana","nigerian"],"nigerianul":"nigerian","nigerianule":"nigerian","nigerianului":"nigerian","nigeriene":["nigeriene","nigerian","nigeriene","nigeriană"],"nigerienei":"nigeriană","nigerienele":["nigerienele","nigerian","nigerienele","nigeriană"],"nigerienelor":"nigeriană","nigerieni":"nigerian","nigerienii":"nigerian","nigerienilor":"nigerian","nigrozine":"nigrozină","nigrozinei":"nigrozină","nigrozinele":"nigrozină","nigrozinelor":"nigrozină","nihilismul":"nihilism","nihilismule":"nihilism","nihilismului":"nihilism","nihiliste":"nihilistă","nihilistei":"nihilistă","nihilistele":"nihilistă","nihilistelor":"nihilistă","nihilisti":"nihilist","nihilistii":"nihilist","nihilistilor":"nihilist","nihilistul":"nihilist","nihilistule":"nihilist","nihilistului":"nihilist","nilgaul":"nilgau","nilgaule":"nilgau","nilgaului":"nilgau","nilul":"nil","nilule":"nil","nilului":"nil","nimanui":"nimeni","nimanuia":"nimănui","nimbostratusul":"nimbostratus","nimbostratusule":"nimbostratus","nimbostratusului":"nimbostratus","nimburi":"nimb","nimbusi":"nimbus","nimbusii":"nimbus","nimbusilor":"nimbus","nimbusul":"nimbus","nimbusule":"nimbus","nimbusului":"nimbus","nimenea":"nimeni","nimerea":"nimeri","nimereai":"nimeri","nimeream":"nimeri","nimereati":"nimeri","nimereau":"nimeri","nimereli":"nimereală","nimerelii":"nimereală","nimerelile":"nimereală","nimerelilor":"nimereală","nimeresc":"nimeri","nimereste":"nimeri","nimeresti":"nimeri","nimerii":"nimeri","nimerim":"nimeri","nimerind":"nimeri","nimerira":"nimeri","nimeriram":"nimeri","nimerirati":"nimeri","nimerirea":"nimerire","nimeriri":"nimerire","nimeririi":"nimerire","nimeririle":"nimerire","nimeririlor":"nimerire","nimerise":"nimeri","nimerisem":"nimeri","nimerisera":"nimeri","nimeriseram":"nimeri","nimeriserati":"nimeri","nimerisesi":"nimeri","nimerisi":"nimeri","nimerit":"nimeri","nimerita":["nimerită","nimerit","nimerita","nimerit"],"nimerite":"nimerit","nimeritele":"nimerit","nimeriti":["nimeriți","nimeri","nimeriți","nimerit"],"nimeritii":"nimerit","nimeritul":"nimerit","nimfe":"nimfă","nimfei":"nimfă","nimfele":"nimfă","nimfelor":"nimfă","nimfomane":"nimfomană","nimfomanei":"nimfomană","nimfomanele":"nimfomană","nimfomanelor":"nimfomană","nimfomania":"nimfomanie","nimfomaniei":"nimfomanie","nimfomanii":"nimfomanie","nimfomaniile":"nimfomanie","nimfomaniilor":"nimfomanie","nimfotomia":"nimfotomie","nimfotomiei":"nimfotomie","nimfotomii":"nimfotomie","nimfotomiile":"nimfotomie","nimfotomiilor":"nimfotomie","nimica":"nimic","nimicea":"nimici","nimiceai":"nimici","nimiceam":"nimici","nimiceati":"nimici","nimiceau":"nimici","nimicesc":"nimici","nimiceste":"nimici","nimicesti":"nimici","nimicia":"nimicie","nimiciei":"nimicie","nimicii":["nimicii","nimici","nimicii","nimicie"],"nimicim":"nimici","nimicind":"nimici","nimicira":"nimici","nimiciram":"nimici","nimicirati":"nimici","nimicirea":"nimicire","nimiciri":"nimicire","nimicirii":"nimicire","nimicirile":"nimicire","nimicirilor":"nimicire","nimicise":"nimici","nimicisem":"nimici","nimicisera":"nimici","nimiciseram":"nimici","nimiciserati":"nimici","nimicisesi":"nimici","nimicisi":"nimici","nimicit":"nimici","nimicita":["nimicită","nimicit","nimicita","nimicit"],"nimicite":"nimicit","nimicitele":"nimicit","nimiciti":["nimiciți","nimici","nimiciți","nimicit"],"nimicitii":"nimicit","nimicitoare":"nimicitor","nimicitoarea":"nimicitor","nimicitoarele":"nimicitor","nimicitori":"nimicitor","nimicitorii":"nimicitor","nimicitorul":"nimicitor","nimicitul":"nimicit","nimicnicea":"nimicnici","nimicniceai":"nimicnici","nimicniceam":"nimicnici","nimicniceati":"nimicnici","nimicniceau":"nimicnici","nimicnicesc":"nimicnici","nimicniceste":"nimicnici","nimicnicesti":"nimicnici","nimicnicia":"nimicnicie","nimicniciei":"nimicnicie","nimicnicii":["nimicnicii","nimicnici","nimicnicii","nimicnicie"],"nimicniciile":"nimicnicie","nimicniciilor":"nimicnicie","nimicnicim":"nimicnici","nimicnicind":"nimicnici","nimicnicira":"nimicnici","nimicniciram":"nimicnici","nimicnicirati":"nimicnici","nimicnicirea":"nimicnicire","nimicniciri":"nimicnicire","nimicnicirii":"nimicnicire","nimicnicirile":"nimicnicire","nimicnicirilor":"nimicnicire","nimicnicise":"nimicnici","nimicnicisem":"nimicnici","nimicnicisera":"nimicnici","nimicniciseram":"nimicnici","nimicniciserati":"nimicnici","nimicnicisesi":"nimicnici","nimicnicisi":"nimicnici","nimicnicit":"nimicnici","nimicniciti":"nimicnici","nimurici":"nimuric","nimuricii":"nimuric","nimuricilor":"nimuric","nimuricul":"nimuric","nimuricule":"nimuric","nimuricului":"nimuric","nincheza":"necheza","ninece":"nineacă","ninecei":"nineacă","ninecele":"nineacă","ninecelor":"nineacă","nineci":"nineacă","ninerarea":"ninerare","ninerari":"ninerare","ninerarii":"ninerare","ninerarile":"ninerare","ninerarilor":"ninerare","ninga":"ninge","ningand":"ninge","ningaul":"ningău","ningaule":"ningău","ningaului":"ningău","ningea":"ninge","ningerea":"ningere","ningeri":"ningere","ningerii":"ningere","ningerile":"ningere","ningerilor":"ningere","nins":"ninge","ninsa":["ninsă","nins","ninsa","nins"],"ninsaturi":"ninsătură","ninsaturii":"ninsătură","ninsaturile":"ninsătură","ninsaturilor":"ninsătură","ninse":["ninse","ninge","ninse","nins"],"ninsele":"nins","ninsese":"ninge","ninsi":"nins","ninsii":"nins","ninsoarea":"ninsoare","ninsori":"ninsoare","ninsoria":"ninsoriu","ninsorie":"ninsoriu","ninsorii":["ninsorii","ninsoare","ninsorii","ninsoriu"],"ninsoriii":"ninsoriu","ninsoriile":"ninsoriu","ninsorile":"ninsoare","ninsorilor":"ninsoare","ninsoriul":"ninsoriu","ninsul":"nins","ninsuria":"ninsuriu","ninsurie":"ninsuriu","ninsurii":"ninsuriu","ninsuriii":"ninsuriu","ninsuriile":"ninsuriu","ninsuriul":"ninsuriu","niobitul":"niobit","niobitule":"niobit","niobitului":"niobit","niobiul":"niobiu","niobiule":"niobiu","niobiului":"niobiu","niplul":"niplu","niplule":"niplu","niplului":"niplu","nipluri":"niplu","niplurile":"niplu","niplurilor":"niplu","nipone":"niponă","niponei":"niponă","niponele":"niponă","niponelor":"niponă","niponi":"nipon","niponii":"nipon","niponilor":"nipon","niponul":"nipon","niponule":"nipon","niponului":"nipon","niprale":"niprală","nipralei":"niprală","nipralele":"niprală","nipralelor":"niprală","nipul":"nip","nipule":"nip","nipului":"nip","niristea":"niriște","niristi":"niriște","niristii":"niriște","nirvanaua":"nirvana","nisadarul":"nișadâr","nisadarule":"nișadâr","nisadarului":"nișadâr","nisamul":"nișam","nisamule":"nișam","nisamului":"nișam","nisamuri":"nișam","nisamurile":"nișam","nisamurilor":"nișam","nisangii":"nișangiu","nisangiii":"nișangiu","nisangiilor":"nișangiu","nisangiul":"nișangiu","nisangiule":"nișangiu","nisangiului":"nișangiu","nisasteaua":"nișastea","nisastele":"nișastea","nisastelei":"nișastea","niscare":"niscai","nise":"nișă","nisei":"nișă","nisele":"nișă","niselor":"nișă","nisetri":"nisetru","nisetrii":"nisetru","nisetrilor":"nisetru","nisetrul":"nisetru","nisetrule":"nisetru","nisetrului":"nisetru","nisfeaua":"nisfea","nisfele":"nisfea","nisfelei":"nisfea","nisfelele":"nisfea","nisfelelor":"nisfea","nisipari":"nisipar","nisiparia":"nisipărie","nisipariei":"nisipărie","nisiparii":"nisipărie","nisipariile":"nisipărie","nisipariilor":"nisipărie","nisiparnite":"nisiparniță","nisiparnitei":"nisiparniță","nisiparnitele":"nisiparniță","nisiparnitelor":"nisiparniță","nisipele":"nisipeală","nisipelei":"nisipeală","nisipelele":"nisipeală","nisipelelor":"nisipeală","nisipeli":"nisipeală","nisipernite":"nisiperniță","nisipernitei":"nisiperniță","nisipernitele":"nisiperniță","nisipernitelor":"nisiperniță","nisipia":"nisipiu","nisipie":"nisipiu","nisipii":"nisipiu","nisipiii":"nisipiu","nisipiile":"nisipiu","nisipirea":"nisipire","nisipiri":"nisipire","nisipirii":"nisipire","nisipirile":"nisipire","nisipirilor":"nisipire","nisipistea":"nisipiște","nisipisti":"nisipiște","nisipistii":"nisipiște","nisipistile":"nisipiște","nisipistilor":"nisipiște","nisipisul":"nisipiș","nisipisule":"nisipiș","nisipisului":"nisipiș","nisipisuri":"nisipiș","nisipisurile":"nisipiș","nisipisurilor":"nisipiș","nisipita":["nisipită","nisipit","nisipita","nisipit"],"nisipite":"nisipit","nisipitele":"nisipit","nisipiti":"nisipit","nisipitii":"nisipit","nisipitul":"nisipit","nisipiul":"nisipiu","nisipoasa":["nisipoasă","nisipos","nisipoasa","nisipos"],"nisipoase":"nisipos","nisipoasele":"nisipos","nisiposi":"nisipos","nisiposii":"nisipos","nisiposul":"nisipos","nisipul":"nisip","nisipule":"nisip","nisipului":"nisip","nisipuri":"nisip","nisipurile":"nisip","nisipurilor":"nisip","nistagmusul":"nistagmus","nistagmusule":"nistagmus","nistagmusului":"nistagmus","niste":"un","nistere":"nișter","nisterele":"nișter","nisterelor":"nișter","nisterul":"nișter","nisterule":"nișter","nisterului":"nișter","nistote":"niștotă","nistotei":"niștotă","nistotele":"niștotă","nistotelor":"niștotă","nistrene":"nistreană","nistrenei":"nistreană","nistrenele":"nistreană","nistrenelor":"nistreană","nistrul":"Nistru","nistrule":"Nistru","nistrului":"Nistru","nitei":"nițel","nitele":"nițel","nitelusa":["nițelușă","nițeluș","nițelușa","nițeluș"],"niteluse":"nițeluș","nitelusele":"nițeluș","nitelusi":"nițeluș","nitelusii":"nițeluș","nitelusul":"nițeluș","nithamere":"nithamer","nithamerele":"nithamer","nithamerelor":"nithamer","nithamerul":"nithamer","nithamerule":"nithamer","nithamerului":"nithamer","nitica":"nițel","nitrai":"nitra","nitram":["nitrăm","nitra","nitram","nitra"],"nitrand":"nitra","nitrara":"nitra","nitraram":"nitra","nitrarati":"nitra","nitrarea":"nitrare","nitrari":"nitrare","nitraria":"nitrărie","nitrariei":"nitrărie","nitrarii":["nitrării","nitrare","nitrării","nitrărie"],"nitrariile":"nitrărie","nitrariilor":"nitrărie","nitrarile":"nitrare","nitrarilor":"nitrare","nitrase":"nitra","nitrasem":"nitra","nitrasera":"nitra","nitraseram":"nitra","nitraserati":"nitra","nitrasesi":"nitra","nitrasi":"nitra","nitrat":"nitra","nitrati":["nitrați","nitra","nitrați","nitrat"],"nitratia":"nitrație","nitratiei":"nitrație","nitratii":["nitrații","nitrat","nitrații","nitrație"],"nitratiile":"nitrație","nitratiilor":"nitrație","nitratilor":"nitrat","nitratul":"nitrat","nitratule":"nitrat","nitratului":"nitrat","nitrau":"nitra","nitreaza":"nitra","nitrez":"nitra","nitrezi":"nitra","nitrica":["nitrică","nitric","nitrica","nitric"],"nitrice":"nitric","nitricele":"nitric","nitrici":"nitric","nitricii":"nitric","nitricul":"nitric","nitriere":"nitrieră","nitrierei":"nitrieră","nitrierele":"nitrieră","nitrierelor":"nitrieră","nitrific":"nitrifica","nitrificai":"nitrifica","nitrificam":["nitrificăm","nitrifica","nitrificam","nitrifica"],"nitrificand":"nitrifica","nitrificara":"nitrifica","nitrificaram":"nitrifica","nitrificarati":"nitrifica","nitrificarea":"nitrificare","nitrificari":"nitrificare","nitrificarii":"nitrificare","nitrificarile":"nitrificare","nitrificarilor":"nitrificare","nitrificase":"nitrifica","nitrificasem":"nitrifica","nitrificasera":"nitrifica","nitrificaseram":"nitrifica","nitrificaserati":"nitrifica","nitrificasesi":"nitrifica","nitrificasi":"nitrifica","nitrificat":"nitrifica","nitrificati":"nitrifica","nitrificatia":"nitrificație","nitrificatiei":"nitrificație","nitrificatii":["nitrifîcații","nitrificație","nitrificații","nitrificație"],"nitrificatiile":"nitrificație","nitrificatiilor":"nitrificație","nitrificatoare":"nitrificator","nitrificatoarea":"nitrificator","nitrificatoarele":"nitrificator","nitrificatori":"nitrificator","nitrificatorii":"nitrificator","nitrificatorul":"nitrificator","nitrificau":"nitrifica","nitrifice":"nitrifica","nitrifici":"nitrifica","nitrili":"nitril","nitrilii":"nitril","nitrililor":"nitril","nitrilul":"nitril","nitrilule":"nitril","nitrilului":"nitril","nitriti":"nitrit","nitritii":"nitrit","nitritilor":"nitrit","nitritul":"nitrit","nitritule":"nitrit","nitritului":"nitrit","nitroasa":["nitroasă","nitros","nitroasa","nitros"],"nitroase":"nitros","nitroasele":"nitros","nitrobacteria":"nitrobacterie","nitrobacteriei":"nitrobacterie","nitrobacterii":"nitrobacterie","nitrobacteriile":"nitrobacterie","nitrobacteriilor":"nitrobacterie","nitrobenzenul":"nitrobenzen","nitrobenzenule":"nitrobenzen","nitrobenzenului":"nitrobenzen","nitroceluloze":"nitroceluloză","nitrocelulozei":"nitroceluloză","nitrocelulozele":"nitroceluloză","nitrocelulozelor":"nitroceluloză","nitroderivati":"nitroderivat","nitroderivatii":"nitroderivat","nitroderivatilor":"nitroderivat","nitroderivatul":"nitroderivat","nitroderivatule":"nitroderivat","nitroderivatului":"nitroderivat","nitrogenul":"nitrogen","nitrogenule":"nitrogen","nitrogenului":"nitrogen","nitroglicerine":"nitroglicerină","nitroglicerinei":"nitroglicerină","nitroglicerinele":"nitroglicerină","nitroglicerinelor":"nitroglicerină","nitrometanul":"nitrometan","nitrometanule":"nitrometan","nitrometanului":"nitrometan","nitrometri":"nitrometru","nitrometrii":"nitrometru","nitrometrilor":"nitrometru","nitrometruul":"nitrometru","nitrometruule":"nitrometru","nitrometruului":"nitrometru","nitronatriti":"nitronatrit","nitronatritii":"nitronatrit","nitronatritilor":"nitronatrit","nitronatritul":"nitronatrit","nitronatritule":"nitronatrit","nitronatritului":"nitronatrit","nitrosi":"nitros","nitrosii":"nitros","nitrosul":"nitros","nitrotoluene":"nitrotoluen","nitrotoluenele":"nitrotoluen","nitrotoluenelor":"nitrotoluen","nitrotoluenul":"nitrotoluen","nitrotoluenule":"nitrotoluen","nitrotoluenului":"nitrotoluen","nitrozarea":"nitrozare","nitrozari":"nitrozare","nitrozarii":"nitrozare","nitrozarile":"nitrozare","nitrozarilor":"nitrozare","nitrurai":"nitrura","nitruram":["nitrurăm","nitrura","nitruram","nitrura"],"nitrurand":"nitrura","nitrurara":"nitrura","nitruraram":"nitrura","nitrurarati":"nitrura","nitrurarea":"nitrurare","nitrurari":"nitrurare","nitrurarii":"nitrurare","nitrurarile":"nitrurare","nitrurarilor":"nitrurare","nitrurase":"nitrura","nitrurasem":"nitrura","nitrurasera":"nitrura","nitruraseram":"nitrura","nitruraserati":"nitrura","nitrurasesi":"nitrura","nitrurasi":"nitrura","nitrurat":"nitrura","nitrurati":"nitrura","nitrurau":"nitrura","nitrureaza":"nitrura","nitrurez":"nitrura","nitrurezi":"nitrura","nitruri":"nitrură","nitrurii":"nitrură","nitrurile":"nitrură","nitrurilor":"nitrură","nituia":"nitui","nituiai":"nitui","nituiam":"nitui","nituiati":"nitui","nituiau":"nitui","nituiesc":"nitui","nituieste":"nitui","nituiesti":"nitui","nituii":"nitui","nituim":"nitui","nituind":"nitui","nituira":"nitui","nituiram":"nitui","nituirati":"nitui","nituirea":"nituire","nituiri":"nituire","nituirii":"nituire","nituirile":"nituire","nituirilor":"nituire","nituise":"nitui","nituisem":"nitui","nituisera":"nitui","nituiseram":"nitui","nituiserati":"nitui","nituisesi":"nitui","nituisi":"nitui","nituit":"nitui","nituiti":"nitui","nituitoarea":"nituitoare","nituitoarei":"nituitoare","nituitoarele":"nituitoare","nituitoarelor":"nituitoare","nituitori":"nituitor","nituitorii":"nituitor","nituitorilor":"nituitor","nituitorul":"nituitor","nituitorule":"nituitor","nituitorului":"nituitor","nituitul":"nituit","nituitule":"nituit","nituitului":"nituit","nituiture":"nituitură","nituiturei":"nituitură","nituiturele":"nituitură","nituiturelor":"nituitură","nituituri":"nituitură","nitul":"nit","nitule":"nit","nitului":"nit","nituri":"nit","niturile":"nit","niturilor":"nit","nituvere":"nițuvară","nituverei":"nițuvară","nituverele":"nițuvară","nituverelor":"nițuvară","niueana":["niueană","niuean","niueana","niuean"],"niueane":"niueană","niueanei":"niueană","niueanele":"niueană","niueanelor":"niueană","niueanul":"niuean","niuene":"niuean","niuenele":"niuean","niueni":"niuean","niuenii":"niuean","niui":"niu","niulor":"niu","niuul":"niu","niuule":"niu","niuului":"niu","nivatia":"nivație","nivatiei":"nivație","nivatii":"nivație","nivatiile":"nivație","nivatiilor":"nivație","nivelai":"nivela","nivelam":["nivelăm","nivela","nivelam","nivela"],"niveland":"nivela","nivelara":"nivela","nivelaram":"nivela","nivelarati":"nivela","nivelarea":"nivelare","nivelari":"nivelare","nivelarii":"nivelare","nivelarile":"nivelare","nivelarilor":"nivelare","nivelase":"nivela","nivelasem":"nivela","nivelasera":"nivela","nivelaseram":"nivela","nivelaserati":"nivela","nivelasesi":"nivela","nivelasi":"nivela","nivelat":"nivela","nivelata":["nivelată","nivelat","nivelata","nivelat"],"nivelate":"nivelat","nivelatele":"nivelat","nivelati":["nivelați","nivela","nivelați","nivelat"],"nivelatia":"nivelație","nivelatiei":"nivelație","nivelatii":["nivelații","nivelat","nivelații","nivelație"],"nivelatiile":"nivelație","nivelatiilor":"nivelație","nivelatoare":"nivelator","nivelatoarea":"nivelator","nivelatoarele":"nivelator","nivelatori":"nivelator","nivelatorii":"nivelator","nivelatorile":"nivelator","nivelatorilor":"nivelator","nivelatorul":"nivelator","nivelatorule":"nivelator","nivelatorului":"nivelator","nivelatul":"nivelat","nivelau":"nivela","nivele":"nivelă","nivele cu bula de aer":"nivelă cu bulă de aer","nivele de semnificanta":"nivel de semnificanță","nivelea":"niveli","niveleai":"niveli","niveleam":"niveli","niveleati":"niveli","niveleau":"niveli","niveleaza":"nivela","nivelei":"nivelă","nivelele":"nivelă","nivelelor":"nivelă","nivelesc":"niveli","niveleste":"niveli","nivelesti":"niveli","nivelez":"nivela","nivelezi":"nivela","nivelii":"niveli","nivelim":"niveli","nivelind":"niveli","nivelira":"niveli","niveliram":"niveli","nivelirati":"niveli","nivelise":"niveli","nivelisem":"niveli","nivelisera":"niveli","niveliseram":"niveli","niveliserati":"niveli","nivelisesi":"niveli","nivelisi":"niveli","nivelit":"niveli","niveliti":"niveli","nivelmente":"nivelment","nivelmentele":"nivelment","nivelmentelor":"nivelment","nivelmentul":"nivelment","nivelmentule":"nivelment","nivelmentului":"nivelment","nivelul":"nivel","nivelule":"nivel","nivelului":"nivel","niveluri":"nivel","nivelurile":"nivel","nivelurilor":"nivel","nividea":"nividi","nivideai":"nividi","nivideam":"nividi","nivideati":"nividi","nivideau":"nividi","nividesc":"nividi","nivideste":"nividi","nividesti":"nividi","nividii":"nividi","nividim":"nividi","nividind":"nividi","nividira":"nividi","nividiram":"nividi","nividirati":"nividi","nividise":"nividi","nividisem":"nividi","nividisera":"nividi","nividiseram":"nividi","nividiserati":"nividi","nividisesi":"nividi","nividisi":"nividi","nividit":"nividi","nividiti":"nividi","nivometre":"nivometru","nivometrele":"nivometru","nivometrelor":"nivometru","nivometrica":["nivometrică","nivometric","nivometrica","nivometric"],"nivometrice":"nivometric","nivometricele":"nivometric","nivometrici":"nivometric","nivometricii":"nivometric","nivometricul":"nivometric","nivometrul":"nivometru","nivometrule":"nivometru","nivometrului":"nivometru","nivopluviala":["nivopluvială","nivopluvial","nivopluviala","nivopluvial"],"nivopluviale":"nivopluvial","nivopluvialele":"nivopluvial","nivopluviali":"nivopluvial","nivopluvialii":"nivopluvial","nivopluvialul":"nivopluvial","nivoze":"nivoză","nivozei":"nivoză","nixisul":"nixis","nixisule":"nixis","nixisului":"nixis","nixisuri":"nixis","nixisurile":"nixis","nixisurilor":"nixis","nixul":"nix","nixule":"nix","nixului":"nix","nizami":"nizam","nizamii":"nizam","nizamilor":"nizam","nizamul":"nizam","nizamule":"nizam","nizamului":"nizam","nizguiele":"nizguială","nizguielei":"nizguială","nizguielele":"nizguială","nizguielelor":"nizguială","nizguieli":"nizguială","nizuia":"nizui","nizuiai":"nizui","nizuiam":"nizui","nizuiati":"nizui","nizuiau":"nizui","nizuiesc":"nizui","nizuieste":"nizui","nizuiesti":"nizui","nizuii":"nizui","nizuim":"nizui","nizuind":"nizui","nizuira":"nizui","nizuiram":"nizui","nizuirati":"nizui","nizuise":"nizui","nizuisem":"nizui","nizuisera":"nizui","nizuiseram":"nizui","nizuiserati":"nizui","nizuisesi":"nizui","nizuisi":"nizui","nizuit":"nizui","nizuiti":"nizui","noade":"noadă","noadei":"noadă","noadele":"noadă","noadelor":"noadă","noaptea":"noapte","noastra":["noastră","noi","noastră","nostru"],"noastre":["noastre","noi","noastre","nostru"],"noata":"nota","noatenasi":"noatenaș","noatenasii":"noatenaș","noatenasilor":"noatenaș","noatenasul":"noatenaș","noatenasule":"noatenaș","noatenasului":"noatenaș","noateni":"noaten","noatenii":"noaten","noatenilor":"noaten","noatenul":"noaten","noatenule":"noaten","noatenului":"noaten","noatin":"noaten","noatini":"noatin","noatinii":"noatin","noatinilor":"noatin","noatinul":"noatin","noatinule":"noatin","noatinului":"noatin","noatiori":"noatior","noatiorii":"noatior","noatiorilor":"noatior","noatiorul":"noatior","noatiorule":"noatior","noatiorului":"noatior","nobeliul":"nobeliu","nobeliule":"nobeliu","nobeliului":"nobeliu","nobetul":"nobet","nobetule":"nobet","nobetului":"nobet","nobeturi":"nobet","nobeturile":"nobet","nobeturilor":"nobet","nobila":["nobilă","nobil","nobila","nobil"],"nobilai":"nobila","nobilam":["nobilăm","nobila","nobilam","nobila"],"nobiland":"nobila","nobilara":"nobila","nobilaram":"nobila","nobilarati":"nobila","nobilarea":"nobilare","nobilari":"nobilare","nobilarii":"nobilare","nobilase":"nobila","nobilasem":"nobila","nobilasera":"nobila","nobilaseram":"nobila","nobilaserati":"nobila","nobilasesi":"nobila","nobilasi":"nobila","nobilat":"nobila","nobilati":"nobila","nobilau":"nobila","nobile":["nobile","nobil","nobile","nobilă"],"nobileaza":"nobila","nobilei":"nobilă","nobilele":["nobilele","nobil","nobilele","nobilă"],"nobilelor":"nobilă","nobilez":"nobila","nobilezi":"nobila","nobili":"nobil","nobiliara":["nobiliară","nobiliar","nobiliara","nobiliar"],"nobiliare":"nobiliar","nobiliarele":"nobiliar","nobiliari":"nobiliar","nobiliarii":"nobiliar","nobiliarul":"nobiliar","nobilii":"nobil","nobilimea":"nobilime","nobilimi":"nobilime","nobilimii":"nobilime","nobilimile":"nobilime","nobilimilor":"nobilime","nobilissimi":"nobilissim","nobilissimii":"nobilissim","nobilissimilor":"nobilissim","nobilissimul":"nobilissim","nobilissimule":"nobilissim","nobilissimului":"nobilissim","nobilitai":"nobilita","nobilitam":["nobilităm","nobilita","nobilitam","nobilita"],"nobilitand":"nobilita","nobilitara":["nobilitară","nobilita","nobilitară","nobilitar","nobilitara","nobilitar"],"nobilitaram":"nobilita","nobilitarati":"nobilita","nobilitare":"nobilitar","nobilitarea":"nobilitare","nobilitarele":"nobilitar","nobilitari":["nobilitari","nobilitar","nobilitări","nobilitare"],"nobilitarii":["nobilitarii","nobilitar","nobilitării","nobilitare"],"nobilitarile":"nobilitare","nobilitarilor":"nobilitare","nobilitarul":"nobilitar","nobilitase":"nobilita","nobilitasem":"nobilita","nobilitasera":"nobilita","nobilitaseram":"nobilita","nobilitaserati":"nobilita","nobilitasesi":"nobilita","nobilitasi":"nobilita","nobilitat":"nobilita","nobilitatea":"nobilitate","nobilitati":["nobilitați","nobilita","nobilități","nobilitate"],"nobilitatii":"nobilitate","nobilitatile":"nobilitate","nobilitatilor":"nobilitate","nobilitau":"nobilita","nobiliteaza":"nobilita","nobilitez":"nobilita","nobilitezi":"nobilita","nobilul":"nobil","noblea":"noble","noblele":"noble","noblete":"nobleță","nobletea":"noblețe","nobletei":"nobleță","nobletele":"nobleță","nobletelor":"nobleță","nobleti":"noblețe","nobletii":"noblețe","nobli":"noble","noblii":"noble","nociva":["nocivă","nociv","nociva","nociv"],"nocive":"nociv","nocivele":"nociv","nocivi":"nociv","nocivii":"nociv","nocivitatea":"nocivitate","nocivitati":"nocivitate","nocivitatii":"nocivitate","nocivitatile":"nocivitate","nocivitatilor":"nocivitate","nocivul":"nociv","noctambulatiunea":"noctambulațiune","noctambulatiuni":"noctambulațiune","noctambulatiunii":"noctambulațiune","noctambulatiunile":"noctambulațiune","noctambulatiunilor":"noctambulațiune","noctambule":"noctambulă","noctambulei":"noctambulă","noctambulele":"noctambulă","noctambulelor":"noctambulă","noctambuli":"noctambul","noctambulii":"noctambul","noctambulilor":"noctambul","noctambulismul":"noctambulism","noctambulismule":"noctambulism","noctambulismului":"noctambulism","noctambulul":"noctambul","noctambulule":"noctambul","noctambulului":"noctambul","nocturna":["nocturnă","nocturn","nocturna","nocturn"],"nocturne":["nocturne","nocturn","nocturne","nocturnă"],"nocturnei":"nocturnă","nocturnele":["nocturnele","nocturn","nocturnele","nocturnă"],"nocturnelor":"nocturnă","nocturni":"nocturn","nocturnii":"nocturn","nocturnul":"nocturn","nodala":["nodală","nodal","nodala","nodal"],"nodale":"nodal","nodalele":"nodal","nodali":"nodal","nodalii":"nodal","nodalul":"nodal","nodaturi":"nodătură","nodaturii":"nodătură","nodaturile":"nodătură","nodaturilor":"nodătură","nodisoare":"nodișor","nodisoarele":"nodișor","nodisoarelor":"nodișor","nodisorul":"nodișor","nodisorule":"nodișor","nodisorului":"nodișor","nodoasa":["nodoasă","nodos","nodoasa","nodos"],"nodoase":"nodos","nodoasele":"nodos","nodoroasa":["nodoroasă","nodoros","nodoroasa","nodoros"],"nodoroase":"nodoros","nodoroasele":"nodoros","nodorosi":"nodoros","nodorosii":"nodoros","nodorosul":"nodoros","nodosi":"nodos","nodosii":"nodos","nodosul":"nodos","nodozitatea":"nodozitate","nodozitati":"nodozitate","nodozitatii":"nodozitate","nodozitatile":"nodozitate","nodozitatilor":"nodozitate","nodul":"nod","nodule":"nod","nodulete":"noduleț","noduletele":"noduleț","noduletelor":"noduleț","noduletul":"noduleț","noduletule":"noduleț","noduletului":"noduleț","noduli":"nodul","nodulii":"nodul","nodulilor":"nodul","nodulizarea":"nodulizare","nodulizari":"nodulizare","nodulizarii":"nodulizare","nodulizarile":"nodulizare","nodulizarilor":"nodulizare","nodului":"nod","nodulul":"nodul","nodulule":"nodul","nodulului":"nodul","noduri":"nod","nodurile":"nod","nodurilor":"nod","noduroasa":["noduroasă","noduros","noduroasa","noduros"],"noduroase":"noduros","noduroasele":"noduros","nodurosi":"noduros","nodurosii":"noduros","nodurosul":"noduros","nodute":"noduț","nodutei":"noduț","nodutelor":"noduț","nodutul":"noduț","nodutule":"noduț","nodutului":"noduț","noeme":"noemă","noemei":"noemă","noemele":"noemă","noemelor":"noemă","noetica":["noetică","noetic","noetica","noetic"],"noetice":"noetic","noeticele":"noetic","noetici":"noetic","noeticii":"noetic","noeticul":"noetic","nogaia":"nogai","nogaie":"nogai","nogaiele":"nogai","nogaii":"nogai","nogailor":"nogai","nogaiul":"nogai","nogaiule":"nogai","nogaiului":"nogai","nohutia":"nohutiu","nohutie":"nohutiu","nohutii":"nohutiu","nohutiii":"nohutiu","nohutiile":"nohutiu","nohutiul":"nohutiu","noi":"nou","noi veniti":"nou venit","noiane":"noian","noianele":"noian","noianelor":"noian","noianul":"noian","noianule":"noian","noianului":"noian","noiemvrieul":"noiemvrie","noiemvrieule":"noiemvrie","noiemvrieului":"noiemvrie","noiemvrii":"noiemvrie","noiemvriii":"noiemvrie","noiemvriilor":"noiemvrie","noii":"nou","noile":"nou","noime":"noimă","noimea":"noime","noimei":"noimă","noimele":"noimă","noimelor":"noimă","noimi":"noime","noimii":"noime","noimile":"noime","noimilor":"noime","nojele":"nojeală","nojelei":"nojeală","nojelele":"nojeală","nojelelor":"nojeală","nojeli":"nojeală","nojite":"nojiță","nojitei":"nojiță","nojitele":"nojiță","nojitelor":"nojiță","nomade":"nomadă","nomadei":"nomadă","nomadele":"nomadă","nomadelor":"nomadă","nomadismul":"nomadism","nomadismule":"nomadism","nomadismului":"nomadism","nomadul":"nomad","nomadule":"nomad","nomadului":"nomad","nomarhi":"nomarh","nomarhii":"nomarh","nomarhilor":"nomarh","nomarhul":"nomarh","nomarhule":"nomarh","nomarhului":"nomarh","nomazi":"nomad"};
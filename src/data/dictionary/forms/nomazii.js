@@ -0,0 +1 @@
+export default {"nomazii":"nomad","nomazilor":"nomad","nome":"nomă","nomei":"nomă","nomele":"nomă","nomelor":"nomă","nomenclatoare":"nomenclator","nomenclatoarele":"nomenclator","nomenclatoarelor":"nomenclator","nomenclatorul":"nomenclator","nomenclatorule":"nomenclator","nomenclatorului":"nomenclator","nomenclature":"nomenclatură","nomenclaturei":"nomenclatură","nomenclaturele":"nomenclatură","nomenclaturelor":"nomenclatură","nomenclaturi":"nomenclatură","nomenclaturiste":"nomenclaturistă","nomenclaturistei":"nomenclaturistă","nomenclaturistele":"nomenclaturistă","nomenclaturistelor":"nomenclaturistă","nomenclaturisti":"nomenclaturist","nomenclaturistii":"nomenclaturist","nomenclaturistilor":"nomenclaturist","nomenclaturistul":"nomenclaturist","nomenclaturistule":"nomenclaturist","nomenclaturistului":"nomenclaturist","nomicosi":"nomicos","nomicosii":"nomicos","nomicosilor":"nomicos","nomicosul":"nomicos","nomicosule":"nomicos","nomicosului":"nomicos","nominala":["nominală","nominal","nominala","nominal"],"nominale":"nominal","nominalele":"nominal","nominali":"nominal","nominalii":"nominal","nominalismul":"nominalism","nominalismule":"nominalism","nominalismului":"nominalism","nominaliste":"nominalistă","nominalistei":"nominalistă","nominalistele":"nominalistă","nominalistelor":"nominalistă","nominalisti":"nominalist","nominalistii":"nominalist","nominalistilor":"nominalist","nominalistul":"nominalist","nominalistule":"nominalist","nominalistului":"nominalist","nominalizai":"nominaliza","nominalizam":["nominalizăm","nominaliza","nominalizam","nominaliza"],"nominalizand":"nominaliza","nominalizara":"nominaliza","nominalizaram":"nominaliza","nominalizarati":"nominaliza","nominalizarea":"nominalizare","nominalizari":"nominalizare","nominalizarii":"nominalizare","nominalizarile":"nominalizare","nominalizarilor":"nominalizare","nominalizase":"nominaliza","nominalizasem":"nominaliza","nominalizasera":"nominaliza","nominalizaseram":"nominaliza","nominalizaserati":"nominaliza","nominalizasesi":"nominaliza","nominalizasi":"nominaliza","nominalizat":"nominaliza","nominalizati":"nominaliza","nominalizau":"nominaliza","nominalizeaza":"nominaliza","nominalizez":"nominaliza","nominalizezi":"nominaliza","nominalul":"nominal","nominatia":"nominație","nominatiei":"nominație","nominatii":"nominație","nominatiile":"nominație","nominatiilor":"nominație","nominatiunea":"nominațiune","nominatiuni":"nominațiune","nominatiunii":"nominațiune","nominatiunile":"nominațiune","nominatiunilor":"nominațiune","nominative":"nominativ","nominativele":"nominativ","nominativelor":"nominativ","nominativizai":"nominativiza","nominativizam":["nominativizăm","nominativiza","nominativizam","nominativiza"],"nominativizand":"nominativiza","nominativizara":"nominativiza","nominativizaram":"nominativiza","nominativizarati":"nominativiza","nominativizase":"nominativiza","nominativizasem":"nominativiza","nominativizasera":"nominativiza","nominativizaseram":"nominativiza","nominativizaserati":"nominativiza","nominativizasesi":"nominativiza","nominativizasi":"nominativiza","nominativizat":"nominativiza","nominativizati":"nominativiza","nominativizau":"nominativiza","nominativizeaza":"nominativiza","nominativizez":"nominativiza","nominativizezi":"nominativiza","nominativul":"nominativ","nominativule":"nominativ","nominativului":"nominativ","nomizme":"nomizmă","nomizmei":"nomizmă","nomizmele":"nomizmă","nomizmelor":"nomizmă","nomocanoane":"nomocanon","nomocanoanele":"nomocanon","nomocanoanelor":"nomocanon","nomocanonul":"nomocanon","nomocanonule":"nomocanon","nomocanonului":"nomocanon","nomofilacsi":"nomofilax","nomofilacsii":"nomofilax","nomofilacsilor":"nomofilax","nomofilaxul":"nomofilax","nomofilaxule":"nomofilax","nomofilaxului":"nomofilax","nomografe":"nomograf","nomografele":"nomograf","nomografelor":"nomograf","nomografi":"nomograf","nomografia":"nomografie","nomografica":["nomografică","nomografic","nomografica","nomografic"],"nomografice":"nomografic","nomograficele":"nomografic","nomografici":"nomografic","nomograficii":"nomografic","nomograficul":"nomografic","nomografiei":"nomografie","nomografii":"nomografie","nomograful":"nomograf","nomografule":"nomograf","nomografului":"nomograf","nomograme":"nomogramă","nomogramei":"nomogramă","nomogramele":"nomogramă","nomogramelor":"nomogramă","nomolea":"nomoli","nomoleai":"nomoli","nomoleam":"nomoli","nomoleati":"nomoli","nomoleau":"nomoli","nomolesc":"nomoli","nomoleste":"nomoli","nomolesti":"nomoli","nomolii":"nomoli","nomolim":"nomoli","nomolind":"nomoli","nomolira":"nomoli","nomoliram":"nomoli","nomolirati":"nomoli","nomolise":"nomoli","nomolisem":"nomoli","nomolisera":"nomoli","nomoliseram":"nomoli","nomoliserati":"nomoli","nomolisesi":"nomoli","nomolisi":"nomoli","nomolit":"nomoli","nomolita":["nomolită","nomolit","nomolita","nomolit"],"nomolite":"nomolit","nomolitele":"nomolit","nomoliti":["nomoliți","nomoli","nomoliți","nomolit"],"nomolitii":"nomolit","nomolitul":"nomolit","nomoloasa":["nomoloasă","nomolos","nomoloasa","nomolos"],"nomoloase":"nomolos","nomoloasele":"nomolos","nomolosi":"nomolos","nomolosii":"nomolos","nomolosul":"nomolos","nomolul":"nomol","nomolule":"nomol","nomolului":"nomol","nomoluri":"nomol","nomolurile":"nomol","nomolurilor":"nomol","nomotemisea":"nomotemisi","nomotemiseai":"nomotemisi","nomotemiseam":"nomotemisi","nomotemiseati":"nomotemisi","nomotemiseau":"nomotemisi","nomotemisesc":"nomotemisi","nomotemiseste":"nomotemisi","nomotemisesti":"nomotemisi","nomotemisii":"nomotemisi","nomotemisim":"nomotemisi","nomotemisind":"nomotemisi","nomotemisira":"nomotemisi","nomotemisiram":"nomotemisi","nomotemisirati":"nomotemisi","nomotemisise":"nomotemisi","nomotemisisem":"nomotemisi","nomotemisisera":"nomotemisi","nomotemisiseram":"nomotemisi","nomotemisiserati":"nomotemisi","nomotemisisesi":"nomotemisi","nomotemisisi":"nomotemisi","nomotemisit":"nomotemisi","nomotemisiti":"nomotemisi","nomotesia":"nomotesie","nomotesiei":"nomotesie","nomotesii":"nomotesie","nomotesiile":"nomotesie","nomotesiilor":"nomotesie","nomoteti":"nomotet","nomotetile":"nomotet","nomotetilor":"nomotet","nomotetisul":"nomotetis","nomotetisule":"nomotetis","nomotetisului":"nomotetis","nomotetul":"nomotet","nomotetule":"nomotet","nomotetului":"nomotet","nonagenare":"nonagenară","nonagenarei":"nonagenară","nonagenarele":"nonagenară","nonagenarelor":"nonagenară","nonagenari":"nonagenar","nonagenarii":"nonagenar","nonagenarilor":"nonagenar","nonagenarul":"nonagenar","nonagenarule":"nonagenar","nonagenarului":"nonagenar","nonbeligeranti":"nonbeligerant","nonbeligerantii":"nonbeligerant","nonbeligerantilor":"nonbeligerant","nonbeligerantul":"nonbeligerant","nonbeligerantule":"nonbeligerant","nonbeligerantului":"nonbeligerant","nonconformismul":"nonconformism","nonconformismule":"nonconformism","nonconformismului":"nonconformism","nonconformiste":"nonconformistă","nonconformistei":"nonconformistă","nonconformistele":"nonconformistă","nonconformistelor":"nonconformistă","nonconformisti":"nonconformist","nonconformistii":"nonconformist","nonconformistilor":"nonconformist","nonconformistul":"nonconformist","nonconformistule":"nonconformist","nonconformistului":"nonconformist","noncontradictia":"noncontradicție","noncontradictiei":"noncontradicție","noncontradictii":"noncontradicție","noncontradictiile":"noncontradicție","noncontradictiilor":"noncontradicție","none":"nonă","nonei":"nonă","nonele":"nonă","nonelor":"nonă","nonete":"nonet","nonetele":"nonet","nonetelor":"nonet","nonetul":"nonet","nonetule":"nonet","nonetului":"nonet","nonexistente":"nonexistență","nonexistentei":"nonexistență","nonfigurativa":["nonfigurativă","nonfigurativ","nonfigurativa","nonfigurativ"],"nonfigurative":"nonfigurativ","nonfigurativele":"nonfigurativ","nonfigurativi":"nonfigurativ","nonfigurativii":"nonfigurativ","nonfigurativul":"nonfigurativ","noninterventia":"nonintervenție","noninterventiei":"nonintervenție","noninterventii":"nonintervenție","noninterventiile":"nonintervenție","noninterventiilor":"nonintervenție","nonpareilul":"nonpareil","nonpareilule":"nonpareil","nonpareilului":"nonpareil","nonparele":"nonparel","nonparelele":"nonparel","nonparelelor":"nonparel","nonparelul":"nonparel","nonparelule":"nonparel","nonparelului":"nonparel","nonsalanta":["nonșalantă","nonșalant","nonșalanta","nonșalant"],"nonsalante":"nonșalant","nonsalantele":"nonșalant","nonsalanti":"nonșalant","nonsalantii":"nonșalant","nonsalantul":"nonșalant","nonsensul":"nonsens","nonsensule":"nonsens","nonsensului":"nonsens","nonsensuri":"nonsens","nonsensurile":"nonsens","nonsensurilor":"nonsens","nonstopul":"nonstop","nonstopule":"nonstop","nonstopului":"nonstop","nonstopuri":"nonstop","nonstopurile":"nonstop","nonstopurilor":"nonstop","nonvaloarea":"nonvaloare","nonvaloari":"nonvaloare","nonvaloarii":"nonvaloare","nonvaloarile":"nonvaloare","nonvaloarilor":"nonvaloare","nonvalori":"nonvaloare","nonviolenta":["nonviolentă","nonviolent","nonviolenta","nonviolent"],"nonviolente":["nonviolente","nonviolent","nonviolențe","nonviolență"],"nonviolentei":"nonviolență","nonviolentele":["nonviolentele","nonviolent","nonviolențele","nonviolență"],"nonviolentelor":"nonviolență","nonviolenti":"nonviolent","nonviolentii":"nonviolent","nonviolentul":"nonviolent","noocrati":"noocrat","noocratia":"noocrație","noocratiei":"noocrație","noocratii":["noocrații","noocrat","noocrații","noocrație"],"noocratilor":"noocrat","noocratul":"noocrat","noocratule":"noocrat","noocratului":"noocrat","noologia":"noologie","noologiei":"noologie","noologii":"noologie","noosfere":"noosferă","noosferei":"noosferă","noosferele":"noosferă","noosferelor":"noosferă","nopalul":"nopal","nopalule":"nopal","nopalului":"nopal","noptai":"nopta","noptam":["noptăm","nopta","noptam","nopta"],"noptand":"nopta","noptara":"nopta","noptaram":"nopta","noptarati":"nopta","noptarea":"noptare","noptari":"noptare","noptarii":"noptare","noptarile":"noptare","noptarilor":"noptare","noptase":"nopta","noptasem":"nopta","noptasera":"nopta","noptaseram":"nopta","noptaserati":"nopta","noptasesi":"nopta","noptasi":"nopta","noptat":"nopta","noptatec":"noptatic","noptateca":["noptatecă","noptatec","noptateca","noptatec"],"noptatece":"noptatec","noptatecele":"noptatec","noptateci":"noptatec","noptatecii":"noptatec","noptatecul":"noptatec","noptati":"nopta","noptatica":["noptatică","noptatic","noptatica","noptatic"],"noptatice":"noptatic","noptaticele":"noptatic","noptatici":"noptatic","noptaticii":"noptatic","noptaticul":"noptatic","noptau":"nopta","nopteaza":"nopta","noptez":"nopta","noptezi":"nopta","nopti":"noapte","nopti albe":"noapte albă","nopti polare":"noapte polară","noptice":"nopțică","nopticei":"nopțică","nopticele":"nopticică","nopticice":"nopticică","nopticicei":"nopticică","nopticicele":"nopticică","nopticicelor":"nopticică","nopticoase":"nopticoasă","nopticoasei":"nopticoasă","nopticoasele":"nopticoasă","nopticoaselor":"nopticoasă","noptiere":"noptieră","noptierei":"noptieră","noptierele":"noptieră","noptierelor":"noptieră","noptii":"noapte","noptile":"noapte","noptile de revelion":"noaptea de Revelion","noptilor":"noapte","noptite":"noptiță","noptitei":"noptiță","noptitele":"noptiță","noptitelor":"noptiță","noptoasa":["noptoasă","noptos","noptoasa","noptos"],"noptoase":"noptos","noptoasele":"noptos","noptosi":"noptos","noptosii":"noptos","noptosul":"noptos","nor":"noră","noradrenaline":"noradrenalină","noradrenalinei":"noradrenalină","noradrenalinele":"noradrenalină","noradrenalinelor":"noradrenalină","nord-americance":"nord-americancă","nord-americancei":"nord-americancă","nord-americancele":"nord-americancă","nord-americancelor":"nord-americancă","nord-americane":"nord-americană","nord-americanei":"nord-americană","nord-americanele":"nord-americană","nord-americanelor":"nord-americană","nord-americani":"nord-american","nord-americanii":"nord-american","nord-americanilor":"nord-american","nord-americanul":"nord-american","nord-americanule":"nord-american","nord-americanului":"nord-american","nord-coreeanul":"nord-coreean","nord-coreeanule":"nord-coreean","nord-coreeanului":"nord-coreean","nord-coreence":"nord-coreeancă","nord-coreencei":"nord-coreeancă","nord-coreencele":"nord-coreeancă","nord-coreencelor":"nord-coreeancă","nord-coreene":"nord-coreeană","nord-coreenei":"nord-coreeană","nord-coreenele":"nord-coreeană","nord-coreenelor":"nord-coreeană","nord-coreeni":"nord-coreean","nord-coreenii":"nord-coreean","nord-coreenilor":"nord-coreean","nord-dunareana":["nord-dunăreană","nord-dunărean","nord-dunăreana","nord-dunărean"],"nord-dunareanul":"nord-dunărean","nord-dunarene":"nord-dunărean","nord-dunarenele":"nord-dunărean","nord-dunareni":"nord-dunărean","nord-dunarenii":"nord-dunărean","nord-estica":["nord-estică","nord-estic","nord-estica","nord-estic"],"nord-estice":"nord-estic","nord-esticele":"nord-estic","nord-estici":"nord-estic","nord-esticii":"nord-estic","nord-esticul":"nord-estic","nord-estul":"nord-est","nord-estule":"nord-est","nord-estului":"nord-est","nord-europeana":["nord-europeană","nord-european","nord-europeana","nord-european"],"nord-europeane":"nord-europeană","nord-europeanei":"nord-europeană","nord-europeanele":"nord-europeană","nord-europeanelor":"nord-europeană","nord-europeanul":"nord-european","nord-europeanule":"nord-european","nord-europeanului":"nord-european","nord-europene":"nord-european","nord-europenele":"nord-european","nord-europeni":"nord-european","nord-europenii":"nord-european","nord-europenilor":"nord-european","nord-vestica":["nord-vestică","nord-vestic","nord-vestica","nord-vestic"],"nord-vestice":"nord-vestic","nord-vesticele":"nord-vestic","nord-vestici":"nord-vestic","nord-vesticii":"nord-vestic","nord-vesticul":"nord-vestic","nord-vestul":"nord-vest","nord-vestule":"nord-vest","nord-vestului":"nord-vest","nord-vietnameze":"nord-vietnameză","nord-vietnamezei":"nord-vietnameză","nord-vietnamezele":"nord-vietnameză","nord-vietnamezelor":"nord-vietnameză","nord-vietnamezi":"nord-vietnamez","nord-vietnamezii":"nord-vietnamez","nord-vietnamezilor":"nord-vietnamez","nord-vietnamezul":"nord-vietnamez","nord-vietnamezule":"nord-vietnamez","nord-vietnamezului":"nord-vietnamez","nordica":["nordică","nordic","nordica","nordic"],"nordice":"nordic","nordicele":"nordic","nordici":"nordic","nordicii":"nordic","nordicul":"nordic","nordista":["nordistă","nordist","nordista","nordist"],"nordiste":"nordist","nordistele":"nordist","nordisti":"nordist","nordistii":"nordist","nordistul":"nordist","nordul":"nord","nordule":"nord","nordului":"nord","noreale":"noreală","norealei":"noreală","noreaua":"norea","norele":"norea","norelei":"norea","norelele":"norea","norelelor":"norea","nori":"nor","nori de stele":"nor de stele","noriceanul":"noricean","noriceanule":"noricean","noriceanului":"noricean","noricei":"noricel","noriceii":"noricel","noriceilor":"noricel","noricelul":"noricel","noricelule":"noricel","noricelului":"noricel","noriceni":"noricean","noricenii":"noricean","noricenilor":"noricean","noricul":"noric","noricule":"noric","noricului":"noric","norii":"nor","norilor":"nor","norioare":"norioară","norioarei":"norioară","norioarele":"norioară","norioarelor":"norioară","norisori":"norișor","norisorii":"norișor","norisorilor":"norișor","norisorul":"norișor","norisorule":"norișor","norisorului":"norișor","norite":["norite","norit","norițe","noriță"],"noritei":"noriță","noritele":["noritele","norit","norițele","noriță"],"noritelor":["noritelor","norit","norițelor","noriță"],"noritul":"norit","noritule":"norit","noritului":"norit","normai":"norma","normala":"normal","normale":["normale","normal","normale","normală"],"normalei":"normală","normalele":"normală","normalelor":"normală","normali":"normal","normaliste":"normalistă","normalistei":"normalistă","normalistele":"normalistă","normalistelor":"normalistă","normalitatea":"normalitate","normalitati":"normalitate","normalitatii":"normalitate","normalizai":"normaliza","normalizam":["normalizăm","normaliza","normalizam","normaliza"],"normalizand":"normaliza","normalizara":"normaliza","normalizaram":"normaliza","normalizarati":"normaliza","normalizarea":"normalizare","normalizari":"normalizare","normalizarii":"normalizare","normalizarile":"normalizare","normalizarilor":"normalizare","normalizase":"normaliza","normalizasem":"normaliza","normalizasera":"normaliza","normalizaseram":"normaliza","normalizaserati":"normaliza","normalizasesi":"normaliza","normalizasi":"normaliza","normalizat":"normaliza","normalizati":"normaliza","normalizau":"normaliza","normalizeaza":"normaliza","normalizez":"normaliza","normalizezi":"normaliza","normam":["normăm","norma","normam","norma"],"normand":"norma","normande":"normandă","normandei":"normandă","normandele":"normandă","normandelor":"normandă","normandul":"normand","normandule":"normand","normandului":"normand","normanzi":"normand","normanzii":"normand","normanzilor":"normand","normara":"norma","normaram":"norma","normarati":"norma","normarea":"normare","normari":"normare","normarii":"normare","normarile":"normare","normarilor":"normare","normase":"norma","normasem":"norma","normasera":"norma","normaseram":"norma","normaserati":"norma","normasesi":"norma","normasi":"norma","normat":"norma","normata":["normată","normat","normata","normat"],"normate":"normat","normatele":"normat","normati":["normați","norma","normați","normat"],"normatii":"normat","normativa":["normativă","normativ","normativa","normativ"],"normative":"normativ","normativele":"normativ","normativi":"normativ","normativii":"normativ","normativile":"normativ","normativilor":"normativ","normativismul":"normativism","normativismule":"normativism","normativismului":"normativism","normativizeaza":"nominativiza","normativul":"normativ","normativule":"normativ","normativului":"normativ","normatoarea":"normatoare","normatoarei":"normatoare","normatoarele":"normatoare","normatoarelor":"normatoare","normatul":"normat","normau":"norma","norme":"normă","norme tehnice":"normă tehnică","normeaza":"norma","normei":"normă","normele":"normă","normelor":"normă","normez":"norma","normezi":"norma","normoblastoze":"normoblastoză","normoblastozei":"normoblastoză","normoblastozele":"normoblastoză","normoblastozelor":"normoblastoză","normoblastul":"normoblast","normoblastule":"normoblast","normoblastului":"normoblast","normocite":"normocit","normocitele":"normocit","normocitelor":"normocit","normocitoze":"normocitoză","normocitozei":"normocitoză","normocitozele":"normocitoză","normocitozelor":"normocitoză","normocitul":"normocit","normocitule":"normocit","normocitului":"normocit","noroace":"noroc","noroacele":"noroc","noroacelor":"noroc","noroade":"norod","noroadele":"norod","noroadelor":"norod","noroaie":"noroi","noroaiele":"noroi","noroaielor":"noroi","noroancaul":"noroancă","noroancaule":"noroancă","noroancaului":"noroancă","noroance":"noroancă","noroancele":"noroancă","noroancelor":"noroancă","noroasa":["noroasă","noros","noroasa","noros"],"noroase":"noros","noroasele":"noros","norocea":"noroci","noroceai":"noroci","noroceam":"noroci","noroceati":"noroci","noroceau":"noroci","norocele":["norocele","noroceală","norocele","norocel"],"norocelei":"noroceală","norocelele":["norocelele","noroceală","norocelele","norocel"],"norocelelor":["norocelelor","noroceală","norocelelor","norocel"],"noroceli":"noroceală","norocelul":"norocel","norocelule":"norocel","norocelului":"norocel","norocesc":"noroci","noroceste":"noroci","norocesti":"noroci","norocii":"noroci","norocim":"noroci","norocind":"noroci","norocira":"noroci","norociram":"noroci","norocirati":"noroci","norocirea":"norocire","norociri":"norocire","norocirii":"norocire","norocirile":"norocire","norocirilor":"norocire","norocise":"noroci","norocisem":"noroci","norocisera":"noroci","norociseram":"noroci","norociserati":"noroci","norocisesi":"noroci","norocisi":"noroci","norocit":"noroci","norocita":["norocită","norocit","norocita","norocit"],"norocite":"norocit","norocitele":"norocit","norociti":["norociți","noroci","norociți","norocit"],"norocitii":"norocit","norocitul":"norocit","norocoasa":["norocoasă","norocos","norocoasa","norocos"],"norocoase":"norocos","norocoasele":"norocos","norocosi":"norocos","norocosii":"norocos","norocosul":"norocos","norocul":"noroc","norocule":"noroc","norocului":"noroc","norodul":"norod","norodule":"norod","norodului":"norod","noroiele":"noroială","noroielei":"noroială","noroielele":"noroială","noroielelor":"noroială","noroieli":"noroială","noroioasa":["noroioasă","noroios","noroioasa","noroios"],"noroioase":"noroios","noroioasele":"noroios","noroiosi":"noroios","noroiosii":"noroios","noroiosul":"noroios","noroita":["noroită","noroit","noroita","noroit"],"noroite":"noroit","noroitele":"noroit","noroiti":"noroit","noroitii":"noroit","noroitul":"noroit","noroituri":"noroitură","noroiturii":"noroitură","noroiturile":"noroitură","noroiturilor":"noroitură","noroiul":"noroi","noroiule":"noroi","noroiului":"noroi","norosi":"noros","norosii":"noros","norosul":"noros","noruci":"norucă","norucii":"norucă","norucile":"norucă","norucilor":"norucă","norul":"nor","norule":"nor","noruleti":"noruleț","noruletii":"noruleț","noruletilor":"noruleț","noruletul":"noruleț","noruletule":"noruleț","noruletului":"noruleț","norulite":"noruliță","norulitei":"noruliță","norulitele":"noruliță","norulitelor":"noruliță","norului":"nor","norute":"noruță","norutei":"noruță","norutele":"noruță","norutelor":"noruță","noruti":"noruț","norutii":"noruț","norutilor":"noruț","norutul":"noruț","norutule":"noruț","norutului":"noruț","norvegi":"norveg","norvegiana":["norvegiană","norvegian","norvegiana","norvegian"],"norvegiani":"norvegian","norvegianii":"norvegian","norvegianilor":"norvegian","norvegianul":"norvegian","norvegianule":"norvegian","norvegianului":"norvegian","norvegie":"Norvegia","norvegiei":"Norvegia","norvegience":"norvegiancă","norvegiencei":"norvegiancă","norvegiencele":"norvegiancă","norvegiencelor":"norvegiancă","norvegiene":["norvegiene","norvegian","norvegiene","norvegiană"],"norvegienei":"norvegiană","norvegienele":["norvegienele","norvegian","norvegienele","norvegiană"],"norvegienelor":"norvegiană","norvegieni":"norvegian","norvegienii":"norvegian","norvegii":["norvegii","norveg","norvegii","Norvegia"],"norvegilor":"norveg","norvegul":"norveg","norvegule":"norveg","norvegului":"norveg","nosemoze":"nosemoză","nosemozei":"nosemoză","nosemozele":"nosemoză","nosemozelor":"nosemoză","nosfite":"nosfiță","nosfitei":"nosfiță","nosfitele":"nosfiță","nosfitelor":"nosfiță","nosoconioze":"nosoconioză","nosoconiozei":"nosoconioză","nosoconiozele":"nosoconioză","nosoconiozelor":"nosoconioză","nosofobia":"nosofobie","nosofobiei":"nosofobie","nosofobii":"nosofobie","nosografi":"nosograf","nosografia":"nosografie","nosografiei":"nosografie","nosografii":["nosografii","nosograf","nosografii","nosografie"],"nosografiile":"nosografie","nosografiilor":"nosografie","nosografilor":"nosograf","nosograful":"nosograf","nosografule":"nosograf","nosografului":"nosograf","nosologia":"nosologie","nosologiei":"nosologie","nosologii":"nosologie","nosologiile":"nosologie","nosologiilor":"nosologie","nosomania":"nosomanie","nosomaniei":"nosomanie","nosomanii":"nosomanie","nosomaniile":"nosomanie","nosomaniilor":"nosomanie","nostalgia":"nostalgie","nostalgica":["nostalgică","nostalgic","nostalgica","nostalgic"],"nostalgice":"nostalgic","nostalgicele":"nostalgic","nostalgici":"nostalgic","nostalgicii":"nostalgic","nostalgicul":"nostalgic","nostalgiei":"nostalgie","nostalgii":"nostalgie","nostalgiile":"nostalgie","nostalgiilor":"nostalgie","nostima":["nostimă","nostim","nostima","nostim"],"nostimade":"nostimadă","nostimadei":"nostimadă","nostimadele":"nostimadă","nostimadelor":"nostimadă","nostime":"nostim","nostimele":"nostim","nostimi":"nostim","nostimii":"nostim","nostimioara":["nostimioară","nostimior","nostimioara","nostimior"],"nostimioare":"nostimior","nostimioarele":"nostimior","nostimiori":"nostimior","nostimiorii":"nostimior","nostimiorul":"nostimior","nostimivis":"nostimivisi","nostimivise":"nostimivisi","nostimivisea":"nostimivisi","nostimiviseai":"nostimivisi","nostimiviseam":"nostimivisi","nostimiviseati":"nostimivisi","nostimiviseau":"nostimivisi","nostimivisie":"nostimivisi","nostimivisii":"nostimivisi","nostimivisim":"nostimivisi","nostimivisind":"nostimivisi","nostimivisira":"nostimivisi","nostimivisiram":"nostimivisi","nostimivisirati":"nostimivisi","nostimivisise":"nostimivisi","nostimivisisem":"nostimivisi","nostimivisisera":"nostimivisi","nostimivisiseram":"nostimivisi","nostimivisiserati":"nostimivisi","nostimivisisesi":"nostimivisi","nostimivisisi":"nostimivisi","nostimivisit":"nostimivisi","nostimivisiti":"nostimivisi","nostimul":"nostim","nostite":"nostiță","nostitei":"nostiță","nostitele":"nostiță","nostitelor":"nostiță","nostra":"noastră","nostri":["noștri","noi","noștri","nostru"],"nostrific":"nostrifica","nostrificai":"nostrifica","nostrificam":["nostrificăm","nostrifica","nostrificam","nostrifica"],"nostrificand":"nostrifica","nostrificara":"nostrifica","nostrificaram":"nostrifica","nostrificarati":"nostrifica","nostrificarea":"nostrificare","nostrificari":"nostrificare","nostrificarii":"nostrificare","nostrificarile":"nostrificare","nostrificarilor":"nostrificare","nostrificase":"nostrifica","nostrificasem":"nostrifica","nostrificasera":"nostrifica","nostrificaseram":"nostrifica","nostrificaserati":"nostrifica","nostrificasesi":"nostrifica","nostrificasi":"nostrifica","nostrificat":"nostrifica","nostrificati":"nostrifica","nostrificau":"nostrifica","nostrifici":"nostrifica","nostromi":"nostrom","nostromii":"nostrom","nostromilor":"nostrom","nostromul":"nostrom","nostromule":"nostrom","nostromului":"nostrom","nostru":"noi","not attested":["not attested","băuna","not attested","vince"],"not used":["not used","exige","not used","rage","not used","transcende","not used","transige"],"nota beneul":"nota bene","nota beneule":"nota bene","nota beneului":"nota bene","notabila":["notabilă","notabil","notabila","notabil"],"notabile":"notabil","notabilele":"notabil","notabili":"notabil","notabilii":"notabil","notabilitatea":"notabilitate","notabilitati":"notabilitate","notabilitatii":"notabilitate","notabilitatile":"notabilitate","notabilitatilor":"notabilitate","notabilul":"notabil","notai":"nota","notalgia":"notalgie","notalgiei":"notalgie","notalgii":"notalgie","notalgiile":"notalgie","notalgiilor":"notalgie","notam":["notăm","nota","notam","nota"],"notand":"nota","notara":"nota","notaram":"nota","notarasi":["notarăși","notarăș","notărași","notăraș"],"notarasia":"notărășie","notarasiei":"notărășie","notarasii":["notarășii","notarăș","notărașii","notăraș","notărășii","notărășie"],"notarasiile":"notărășie","notarasiilor":"notărășie","notarasilor":["notarășilor","notarăș","notărașilor","notăraș"],"notarasite":"notărășiță","notarasitei":"notărășiță","notarasitele":"notărășiță","notarasitelor":"notărășiță","notarasul":["notarășul","notarăș","notărașul","notăraș"],"notarasule":["notarășule","notarăș","notărașule","notăraș"],"notarasului":["notarășului","notarăș","notărașului","notăraș"],"notarati":"nota","notarea":"notare","notarese":"notăreasă","notaresei":"notăreasă","notaresele":"notăreasă","notareselor":"notăreasă","notari":["notari","notar","notări","notare"],"notariala":["notarială","notarial","notariala","notarial"],"notariale":"notarial","notarialele":"notarial","notariali":"notarial","notarialii":"notarial","notarialul":"notarial","notariate":"notariat","notariatele":"notariat","notariatelor":"notariat","notariatul":"notariat","notariatule":"notariat","notariatului":"notariat","notarii":["notarii","notar","notării","notare"],"notarile":"notare","notarilor":["notarilor","notar","notărilor","notare"],"notarite":"notăriță","notaritei":"notăriță","notaritele":"notăriță","notaritelor":"notăriță","notarul":"notar","notarule":"notar","notarului":"notar","notase":"nota","notasem":"nota","notasera":"nota","notaseram":"nota","notaserati":"nota","notasesi":"nota","notasi":"nota","notat":"nota","notati":"nota","notatii":"notație","notatii algebrice":"notație algebrică","notatite":["notatițe","notatiță","notătițe","notătiță"],"notatite americane":"notatiță americană","notatite cu cioc lat":"notatiță cu cioc lat","notatitei":"notătiță","notatitele":"notătiță","notatitelor":"notătiță","notatiunea":"notațiune","notatiuni":"notațiune","notatiunii":"notațiune","notatiunile":"notațiune","notatiunilor":"notațiune","notatoarea":"notătoare","notatoarei":"notătoare","notatoarele":"notătoare","notatoarelor":"notătoare","notau":"nota","note":"notă","note de plata":"notă de plată","noteaza":"nota","notei":"notă","notele":"notă","notelor":"notă","notez":"nota","notezi":"nota","notific":"notifica","notificai":"notifica","notificam":["notificăm","notifica","notificam","notifica"],"notificand":"notifica","notificara":"notifica","notificaram":"notifica","notificarati":"notifica","notificarea":"notificare","notificari":"notificare","notificarii":"notificare","notificarile":"notificare","notificarilor":"notificare","notificase":"notifica","notificasem":"notifica","notificasera":"notifica","notificaseram":"notifica","notificaserati":"notifica","notificasesi":"notifica","notificasi":"notifica","notificat":"notifica","notificati":"notifica","notificatia":"notificație","notificatiei":"notificație","notificatii":"notificație","notificatiile":"notificație","notificatiilor":"notificație","notificatiunea":"notificațiune","notificatiuni":"notificațiune","notificatiunii":"notificațiune","notificatiunile":"notificațiune","notificatiunilor":"notificațiune","notificau":"notifica","notifici":"notifica","notionala":["noțională","noțional","noționala","noțional"],"notionale":"noțional","notionalele":"noțional","notionali":"noțional","notionalii":"noțional","notionalul":"noțional","notiste":"notistă","notistei":"notistă","notistele":"notistă","notistelor":"notistă","notite":"notiță","notitei":"notiță","notitele":"notiță","notitelor":"notiță","notitia":"notiție","notitiei":"notiție","notitii":"notiție","notitiile":"notiție","notitiilor":"notiție","notiunea":"noțiune","notiuni":"noțiune","notiunii":"noțiune","notiunile":"noțiune","notiunilor":"noțiune","notocorde":["notocorde","notocord","notocorde","notocordă"],"notocordei":"notocordă","notocordele":"notocordă","notocordelor":"notocordă","notoria":"notoriu","notorie":"notoriu","notorietatea":"notorietate","notorietati":"notorietate","notorietatii":"notorietate","notorietatile":"notorietate","notorietatilor":"notorietate","notorii":"notoriu","notoriii":"notoriu","notoriile":"notoriu","notoriul":"notoriu","nou-nascuti":"nou-născut","noua":["nouă","noi","nouă","nou","noua","nou"],"nouari":"nouar","nouarii":"nouar","nouarilor":"nouar","nouarul":"nouar","nouarule":"nouar","nouarului":"nouar","nouaspe":"nouăsprezece","nouazeci si doua f &":"nouăzeci și două","nouazeci si una f &":"nouăzeci și una","noul":"nou","nour":"nor","nourasi":"nouraș","nourasii":"nouraș","nourasilor":"nouraș","nourasul":"nouraș","nourasule":"nouraș","nourasului":"nouraș","nourei":"nourel","noureii":"nourel","noureilor":"nourel","nourelul":"nourel","nourelule":"nourel","nourelului":"nourel","nouretul":"noureț","nouretule":"noureț","nouretului":"noureț","noureturi":"noureț","noureturile":"noureț","noureturilor":"noureț","nouri":"nour","nourii":"nour","nourilor":"nour","nouroasa":["nouroasă","nouros","nouroasa","nouros"],"nouroase":"nouros","nouroasele":"nouros","nouros":"noros","nourosi":"nouros","nourosii":"nouros","nourosul":"nouros","nourul":"nour","nourule":"nour","nourului":"nour","nouta":["nouță","nouț","nouța","nouț"],"noutati":"noutate","noute":"nouț","noutele":"nouț","nouti":"nouț","noutii":"nouț","noutul":"nouț","novai":"nova","novam":["novăm","nova","novam","nova"],"novand":"nova","novara":"nova","novaram":"nova","novarati":"nova","novase":"nova","novasem":"nova","novasera":"nova","novaseram":"nova","novaserati":"nova","novasesi":"nova","novasi":"nova","novat":"nova","novati":"nova","novatia":"novație","novatiei":"novație","novatii":"novație","novatiile":"novație","novatiilor":"novație","novatiunea":"novațiune","novatiuni":"novațiune","novatiunii":"novațiune","novatiunile":"novațiune","novatiunilor":"novațiune","novatoare":"novator","novatoarea":["novatoarea","novatoare","novatoarea","novator"],"novatoarei":"novatoare","novatoarele":["novatoarele","novatoare","novatoarele","novator"],"novatoarelor":"novatoare","novatori":"novator","novatorii":"novator","novatorul":"novator","novau":"nova","nove":"novă","noveaza":"nova","novei":"novă","novele":["novele","novă","novele","novelă"],"novelei":"novelă","novelele":"novelă","novelelor":"novelă","novelete":"noveletă","noveletei":"noveletă","noveletele":"noveletă","noveletelor":"noveletă","novelor":"novă","novembreul":"novembre","novembreule":"novembre","novembreului":"novembre","novez":"nova","novezi":"nova","noviceul":"novice","noviceule":"novice","noviceului":"novice","novici":"novice","noviciate":"noviciat","noviciatele":"noviciat","noviciatelor":"noviciat","noviciatul":"noviciat","noviciatule":"noviciat","noviciatului":"noviciat","novicii":"novice","novicilor":"novice","novicisme":"novicism","novicismele":"novicism","novicismelor":"novicism","novicismul":"novicism","novicismule":"novicism","novicismului":"novicism","novitale":"novita","novitalei":"novita","novitalele":"novita","novitalelor":"novita","novitaua":"novita","novocaine":"novocaină","novocainei":"novocaină","novocainele":"novocaină","novocainelor":"novocaină","novociline":"novocilină","novocilinei":"novocilină","novocilinele":"novocilină","novocilinelor":"novocilină","novolacul":"novolac","novolacule":"novolac","novolacului":"novolac","novolacuri":"novolac","novolacurile":"novolac","novolacurilor":"novolac","noxe":"noxă","noxei":"noxă","noxele":"noxă","noxelor":"noxă","nu -a":"-a","nu -ati":["nu -ați","-a","nu -âți","-î"],"nu -e":"-e","nu -ea":"-ea","nu -eti":["nu -eți","-e","nu -eți","-ea"],"nu -i":["nu -i","-i","nu -î","-î"],"nu -iti":"-i","nu babardi":"babardi","nu babarditi":"babardi","nu bacceli":"bacceli","nu bacceliti":"bacceli","nu baciui":"băciui","nu baciuiti":"băciui","nu bacsi":"bâcsi","nu bacsiti":"bâcsi","nu badadai":"bădădăi","nu badadaiti":"bădădăi","nu badadui":"bădădui","nu badaduiti":"bădădui","nu badijona":"badijona","nu badijonati":"badijona","nu badina":"badina","nu badinati":"badina","nu baga":"băga","nu bagateliza":"bagateliza","nu bagatelizati":"bagateliza","nu bagati":"băga","nu bagiocuri":"bagiocuri","nu bagiocuriti":"bagiocuri","nu baia":"băia","nu baiati":"băia","nu baigui":"bâigui","nu baiguiti":"bâigui","nu bajbai":"bâjbâi","nu bajbaiti":"bâjbâi","nu bajenari":"băjenări","nu bajenariti":"băjenări","nu balaci":"bălăci","nu balaciti":"bălăci","nu balai":"bălăi","nu balaiti":"bălăi","nu balansa":"balansa","nu balansati":"balansa","nu balanta":"balanța","nu balantati":"balanța","nu balasta":"balasta","nu balastati":"balasta","nu balbai":"bâlbâi","nu balbaiti":"bâlbâi","nu balega":"bălega","nu balegati":"bălega","nu baliga":"băliga","nu baligati":"băliga","nu baliza":"baliza","nu balizati":"baliza","nu balmaji":"bălmăji","nu balmajiti":"bălmăji","nu balmoji":"bălmoji","nu balmojiti":"bălmoji","nu balona":"balona","nu balonati":"balona","nu balsama":"bălsăma","nu balsamati":"bălsăma","nu balsami":"bălsămi","nu balsamiti":"bălsămi","nu balsamui":"balsamui","nu balsamuiti":"balsamui","nu banaliza":"banaliza","nu banalizati":"banaliza","nu bancheta":"bancheta","nu banchetati":"bancheta","nu bancruta":"bancruta","nu bancrutati":"bancruta","nu bandaja":"bandaja","nu bandajati":"bandaja","nu bani":"băni","nu baniti":"băni","nu bantui":"bântui","nu bantuiti":"bântui","nu banui":"bănui","nu banuiti":"bănui","nu bara":"bara","nu barai":"bârâi","nu baraiti":"bârâi","nu barani":"bărăni","nu baraniti":"bărăni","nu barati":"bara","nu barbariza":"barbariza","nu barbarizati":"barbariza","nu barbieri":"bărbieri","nu barbieriti":"bărbieri","nu bardui":"bărdui","nu barduiti":"bărdui","nu barfi":"bârfi","nu barfiti":"bârfi","nu baricada":"baricada","nu baricadati":"baricada","nu barliga":"bârliga","nu barligati":"bârliga","nu bascula":"bascula","nu basculati":"bascula","nu basi":"băși","nu basica":"bășica","nu basicati":"bășica","nu basiti":"băși","nu basmui":"băsmui","nu basmuiti":"băsmui","nu basni":"băsni","nu basniti":"băsni","nu batai":"bâțâi","nu bataiti":"bâțâi","nu batatori":"bătători","nu batatoriti":"bătători","nu bataturi":"bătături","nu bataturiti":"bătături","nu bate":"bate","nu bateti":"bate","nu batgiocura":"batgiocura","nu batgiocurati":"batgiocura","nu batjocori":"batjocori","nu batjocoriti":"batjocori","nu batjocura":"batjocura","nu batjocurati":"batjocura","nu batjocuri":"batjocuri","nu batjocuriti":"batjocuri","nu baza":"baza","nu bazai":["nu bâzâi","bâzâi","nu bâzăi","bâzăi"],"nu bazaiti":["nu bâzâiți","bâzâi","nu bâzăiți","bâzăi"],"nu bazati":"baza","nu bea":"bea","nu beatifica":"beatifica","nu beatificati":"beatifica","nu bedui":"bedui","nu beduiti":"bedui","nu bejanari":"bejănări","nu bejanariti":"bejănări","nu bejani":"bejăni","nu bejaniti":"bejăni","nu bejeni":"bejeni","nu bejeniti":"bejeni","nu beli":"beli","nu beli pula":"beli pula","nu beliti":"beli","nu beliti pula":"beli pula","nu bemoliza":"bemoliza","nu bemolizati":"bemoliza","nu benchetui":"benchetui","nu benchetuiti":"benchetui","nu beneficia":"beneficia","nu beneficiati":"beneficia","nu berbeci":"berbeci","nu berbeciti":"berbeci","nu beregati":"beregăți","nu beregatiti":"beregăți","nu beregatui":"beregătui","nu beregatuiti":"beregătui","nu besica":"beșica","nu besicati":"beșica","nu besteli":"beșteli","nu besteliti":"beșteli","nu bestializa":"bestializa","nu bestializati":"bestializa","nu beteji":"beteji","nu betejiti":"beteji","nu beti":"bea","nu betivi":"bețivi","nu betiviti":"bețivi","nu betona":"betona","nu betonati":"betona","nu bezaconui":"bezaconui","nu bezaconuiti":"bezaconui","nu bichiri":"bichiri","nu bichiriti":"bichiri","nu biciui":"biciui","nu biciuiti":"biciui","nu bifa":"bifa","nu bifati":"bifa","nu bifurca":"bifurca","nu bifurcati":"bifurca","nu bihindisi":"bihindisi","nu bihindisiti":"bihindisi","nu bindisi":"bindisi","nu bindisiti":"bindisi","nu binecuvanta":"binecuvânta","nu binecuvantati":"binecuvânta","nu bineface":"bineface","nu binefaceti":"bineface","nu binemerita":"binemerita","nu binemeritati":"binemerita","nu binevesti":"binevesti","nu binevestiti":"binevesti","nu binevoi":"binevoi","nu binevoiti":"binevoi","nu binocla":"binocla","nu binoclati":"binocla","nu bintatui":"bintătui","nu bintatuiti":"bintătui","nu biostimula":"biostimula","nu biostimulati":"biostimula","nu bipai":"bipăi","nu bipaiti":"bipăi","nu birocratiza":"birocratiza","nu birocratizati":"birocratiza","nu birsagalui":"birșăgălui","nu birsagaluiti":"birșăgălui","nu birui":"birui","nu biruiti":"birui","nu bisa":"bisa","nu bisati":"bisa","nu bituma":"bituma","nu bitumati":"bituma","nu bivuaca":"bivuaca","nu bivuacati":"bivuaca","nu bizui":"bizui","nu bizuiti":"bizui","nu blagodari":"blagodari","nu blagodariti":"blagodari","nu blagoslovi":"blagoslovi","nu blagosloviti":"blagoslovi","nu blama":"blama","nu blamati":"blama","nu blani":"blăni","nu blaniti":"blăni","nu blanui":"blănui","nu blanuiti":"blănui","nu blasfema":"blasfema","nu blasfemati":"blasfema","nu blastama":"blăstăma","nu blastamati":"blăstăma","nu blastema":"blăstema","nu blastemati":"blăstema","nu blaza":"blaza","nu blazati":"blaza","nu bleorcoti":"bleorcoti","nu bleorcotiti":"bleorcoti","nu blestema":"blestema","nu blestemati":"blestema","nu blinda":"blinda","nu blindati":"blinda","nu bloca":"bloca","nu blocati":"bloca","nu blodogori":"blodogori","nu blodogoriti":"blodogori","nu blonzi":"blonzi","nu blonziti":"blonzi","nu bobina":"bobina","nu bobinati":"bobina","nu boboti":"boboti","nu bobotiti":"boboti","nu bocani":"bocăni","nu bocaniti":"bocăni","nu boci":"boci","nu bociti":"boci","nu bodogani":"bodogăni","nu bodoganiti":"bodogăni","nu bodrogani":"bodrogăni","nu bodroganiti":"bodrogăni","nu bogdaprosti":"bogdaprosti","nu bogdaprostiti":"bogdaprosti","nu boi":"boi","nu boicota":"boicota","nu boicotati":"boicota","nu boieri":"boieri","nu boieriti":"boieri","nu boiti":"boi","nu bojogari":"bojogări","nu bojogariti":"bojogări","nu bolborosi":"bolborosi","nu bolborositi":"bolborosi","nu boldi":"boldi","nu bolditi":"boldi","nu boli":"boli","nu boliti":"boli","nu bolmoji":"bolmoji","nu bolmojiti":"bolmoji","nu bolnavi":"bolnăvi","nu bolnaviti":"bolnăvi","nu bolseviza":"bolșeviza","nu bolsevizati":"bolșeviza","nu bolti":"bolti","nu boltiti":"bolti","nu bomba":"bomba","nu bombani":"bombăni","nu bombaniti":"bombăni","nu bombarda":"bombarda","nu bombardati":"bombarda","nu bombati":"bomba","nu bonai":"bonăi","nu bonaiti":"bonăi","nu bonifica":"bonifica","nu bonificati":"bonifica","nu borati":"borî","nu bori":["nu bori","bori","nu borî","borî"],"nu boriti":"bori","nu borna":"borna","nu bornati":"borna","nu borsi":"borși","nu borsiti":"borși","nu bosorogi":"boșorogi","nu bosorogiti":"boșorogi","nu bosumfla":"bosumfla","nu bosumflati":"bosumfla","nu botaniza":"botaniza","nu botanizati":"botaniza","nu boteza":"boteza","nu botezati":"boteza","nu boti":"boți","nu botiti":"boți","nu boxa":"boxa","nu boxati":"boxa","nu bracona":"bracona","nu braconati":"bracona","nu bramburi":"bramburi","nu bramburiti":"bramburi","nu brani":"brăni","nu braniti":"brăni","nu bransa":"branșa","nu bransati":"branșa","nu branzi":"brânzi","nu branziti":"brânzi","nu brava":"brava","nu bravati":"brava","nu brazda":"brăzda","nu brazdati":"brăzda","nu brazdui":"brăzdui","nu brazduiti":"brăzdui","nu breveta":"breveta","nu brevetati":"breveta","nu bria":"bria","nu briati":"bria","nu bricola":"bricola","nu bricolati":"bricola","nu brobona":"brobona","nu brobonati":"brobona","nu broboni":"broboni","nu broboniti":"broboni","nu broda":"broda","nu brodati":"broda","nu bronza":"bronza","nu bronzati":"bronza","nu brosa":"broșa","nu brosati":"broșa","nu bruftului":"bruftului","nu bruftuluiti":"bruftului","nu bruia":"bruia","nu bruiati":"bruia","nu bruna":"bruna","nu brunati":"bruna","nu brusca":"brusca","nu bruscati":"brusca","nu brutaliza":"brutaliza","nu brutalizati":"brutaliza","nu bubui":"bubui","nu bubuiti":"bubui","nu bucatari":"bucătări","nu bucatariti":"bucătări","nu bucateli":"bucățeli","nu bucateliti":"bucățeli","nu bucati":"bucăți","nu bucatiti":"bucăți","nu buchisa":"buchisa","nu buchisati":"buchisa","nu buchisi":"buchisi","nu buchisiti":"buchisi","nu buciuma":"buciuma","nu buciumati":"buciuma","nu bucla":"bucla","nu buclati":"bucla","nu bucura":"bucura","nu bucurati":"bucura","nu buda":"buda","nu budati":"buda","nu budugari":"budugări","nu budugariti":"budugări","nu buduli":"buduli","nu buduliti":"buduli","nu bufni":"bufni","nu bufniti":"bufni","nu bufona":"bufona","nu bufonati":"bufona","nu buici":"buici","nu buiciti":"buici","nu buimaci":"buimăci","nu buimaciti":"buimăci","nu bujdi":"bujdi","nu bujditi":"bujdi","nu bulbuca":"bulbuca","nu bulbucati":"bulbuca","nu bulbuci":"bulbuci","nu bulbuciti":"bulbuci","nu bulgari":"bulgări","nu bulgariti":"bulgări","nu bulgariza":"bulgariza","nu bulgarizati":"bulgariza","nu buli":"buli","nu bulibasi":"bulibăși","nu bulibasiti":"bulibăși","nu buliti":"buli","nu bulona":"bulona","nu bulonati":"bulona","nu buluci":"buluci","nu buluciti":"buluci","nu bulversa":"bulversa","nu bulversati":"bulversa","nu bumbaci":"bumbăci","nu bumbaciti":"bumbăci","nu bura":"bura","nu burati":"bura","nu burdusi":"burduși","nu burdusiti":"burduși","nu burghezi":"burghezi","nu burgheziti":"burghezi","nu burlaci":"burlăci","nu burlaciti":"burlăci","nu burnita":"burnița","nu burnitati":"burnița","nu bursuca":"bursuca","nu bursucati":"bursuca","nu burzului":"burzului","nu burzuluiti":"burzului","nu buscula":"buscula","nu busculati":"buscula","nu busi":"buși","nu busiti":"buși","nu busumfla":"busumfla","nu busumflati":"busumfla","nu butnari":"butnări","nu butnariti":"butnări","nu butona":"butona","nu butonati":"butona","nu buzdugani":"buzdugăni","nu buzduganiti":"buzdugăni","nu buzoia":"buzoia","nu buzoiati":"buzoia","nu buzunari":"buzunări","nu buzunariti":"buzunări","nu echilibra":"echilibra","nu echilibrati":"echilibra","nu echipa":"echipa","nu echipati":"echipa","nu echivala":"echivala","nu echivalati":"echivala","nu eclipsa":"eclipsa","nu eclipsati":"eclipsa","nu ecloza":"ecloza","nu eclozati":"ecloza","nu ecluza":"ecluza","nu ecluzati":"ecluza","nu economisi":"economisi","nu economisiti":"economisi","nu economiza":"economiza","nu economizati":"economiza","nu ecrana":"ecrana","nu ecranati":"ecrana","nu ecraniza":"ecraniza","nu ecranizati":"ecraniza","nu edenta":"edenta","nu edentati":"edenta","nu edifica":"edifica","nu edificati":"edifica","nu edita":"edita","nu editati":"edita","nu educa":"educa","nu educati":"educa","nu edulcora":"edulcora","nu edulcorati":"edulcora","nu efectua":"efectua","nu efectuati":"efectua","nu efemeia":"efemeia","nu efemeiati":"efemeia","nu efemeriza":"efemeriza","nu efemerizati":"efemeriza","nu efemina":"efemina","nu efeminati":"efemina","nu eficientiza":"eficientiza","nu eficientizati":"eficientiza","nu efila":"efila","nu efilati":"efila","nu egala":"egala","nu egalati":"egala","nu egaliza":"egaliza","nu egalizati":"egaliza","nu egrena":"egrena","nu egrenati":"egrena","nu ejacula":"ejacula","nu ejaculati":"ejacula","nu ejecta":"ejecta","nu ejectati":"ejecta","nu elabora":"elabora","nu elaborati":"elabora","nu elansa":"elansa","nu elansati":"elansa","nu electrifica":"electrifica","nu electrificati":"electrifica","nu electriza":"electriza","nu electrizati":"electriza","nu electrocauteriza":"electrocauteriza","nu electrocauterizati":"electrocauteriza","nu electrocoagula":"electrocoagula","nu electrocoagulati":"electrocoagula","nu electrocuta":"electrocuta","nu electrocutati":"electrocuta","nu electroliza":"electroliza","nu electrolizati":"electroliza","nu electroniza":"electroniza","nu electronizati":"electroniza","nu elefterosi":"elefterosi","nu elefterositi":"elefterosi","nu elementariza":"elementariza","nu elementarizati":"elementariza","nu eleniza":"eleniza","nu elenizati":"eleniza","nu elibera":"elibera","nu eliberati":"elibera","nu elida":"elida","nu elidati":"elida","nu elimina":"elimina","nu eliminati":"elimina","nu elogia":"elogia","nu elogiati":"elogia","nu elucida":"elucida","nu elucidati":"elucida","nu elucubra":"elucubra","nu elucubrati":"elucubra","nu eluda":"eluda","nu eludati":"eluda","nu emacia":"emacia","nu emaciati":"emacia","nu emaila":"emaila","nu emailati":"emaila","nu emana":"emana","nu emanati":"emana","nu emancipa":"emancipa","nu emancipati":"emancipa","nu emascula":"emascula","nu emasculati":"emascula","nu embereclisi":"embereclisi","nu embereclisiti":"embereclisi","nu emenda":"emenda","nu emendati":"emenda","nu emerge":"emerge","nu emergeti":"emerge","nu emetiza":"emetiza","nu emetizati":"emetiza","nu emigra":"emigra","nu emigrati":"emigra","nu eminescianiza":"eminescianiza","nu eminescianizati":"eminescianiza","nu emite":"emite","nu emiteti":"emite","nu emotiona":"emoționa","nu emotionati":"emoționa","nu emula":"emula","nu emulati":"emula","nu emulsiona":"emulsiona","nu emulsionati":"emulsiona","nu enara":"enara","nu enarati":"enara","nu energhisi":"energhisi","nu energhisiti":"energhisi","nu enerva":"enerva","nu enervati":"enerva","nu englezi":"englezi","nu engleziti":"englezi","nu enigmatiza":"enigmatiza","nu enigmatizati":"enigmatiza","nu entuziasma":"entuziasma","nu entuziasmati":"entuziasma","nu enumera":"enumera","nu enumerati":"enumera","nu enunta":"enunța","nu enuntati":"enunța","nu epata":"epata","nu epatati":"epata","nu epila":"epila","nu epilati":"epila","nu epiloga":"epiloga","nu epilogati":"epiloga","nu epimelisi":"epimelisi","nu epimelisiti":"epimelisi","nu epiteorisi":"epiteorisi","nu epiteorisiti":"epiteorisi","nu epuiza":"epuiza","nu epuizati":"epuiza","nu epura":"epura","nu epurati":"epura","nu eradica":"eradica","nu eradicati":"eradica","nu erbicida":"erbicida","nu erbicidati":"erbicida","nu erboriza":"erboriza","nu erborizati":"erboriza","nu ereda":"ereda","nu eredati":"ereda","nu ermetiza":"ermetiza","nu ermetizati":"ermetiza","nu eroda":"eroda","nu erodati":"eroda","nu eroifica":"eroifica","nu eroificati":"eroifica","nu eroiza":"eroiza","nu eroizati":"eroiza","nu erotiza":"erotiza","nu erotizati":"erotiza","nu eructa":"eructa","nu eructati":"eructa","nu erupe":"erupe","nu erupeti":"erupe","nu esalona":"eșalona","nu esalonati":"eșalona","nu esantiona":"eșantiona","nu esantionati":"eșantiona","nu escalada":"escalada","nu escaladati":"escalada","nu escamota":"escamota","nu escamotati":"escamota","nu eschiva":"eschiva","nu eschivati":"eschiva","nu escorta":"escorta","nu escortati":"escorta","nu escroca":"escroca","nu escrocati":"escroca","nu esentializa":"esențializa","nu esentializati":"esențializa","nu esplica":"esplica","nu esplicati":"esplica","nu esterifica":"esterifica","nu esterificati":"esterifica","nu estetiza":"estetiza","nu estetizati":"estetiza","nu estima":"estima","nu estimati":"estima","nu estompa":"estompa","nu estompati":"estompa","nu estorca":"estorca","nu estorcati":"estorca","nu estropia":"estropia","nu estropiati":"estropia","nu esua":"eșua","nu esuati":"eșua","nu etaja":"etaja","nu etajati":"etaja","nu etala":"etala","nu etalati":"etala","nu etalona":"etalona","nu etalonati":"etalona","nu etansa":"etanșa","nu etansati":"etanșa","nu etanseiza":"etanșeiza","nu etanseizati":"etanșeiza","nu etapiza":"etapiza","nu etapizati":"etapiza","nu etatiza":"etatiza","nu etatizati":"etatiza","nu eterifica":"eterifica","nu eterificati":"eterifica","nu eteriza":"eteriza","nu eterizati":"eteriza","nu eterniza":"eterniza","nu eternizati":"eterniza","nu eticheta":"eticheta","nu etichetati":"eticheta","nu eticiza":"eticiza","nu eticizati":"eticiza","nu etila":"etila","nu etilati":"etila","nu etimologiza":"etimologiza","nu etimologizati":"etimologiza","nu etiola":"etiola","nu etiolati":"etiola","nu etira":"etira","nu etirati":"etira","nu etniciza":"etniciza","nu etnicizati":"etniciza","nu europeniza":"europeniza","nu europenizati":"europeniza","nu eutanasia":"eutanasia","nu eutanasiati":"eutanasia","nu evacua":"evacua","nu evacuati":"evacua","nu evada":"evada","nu evadati":"evada","nu evalua":"evalua","nu evaluati":"evalua","nu evangheliza":"evangheliza","nu evanghelizati":"evangheliza","nu evapora":"evapora","nu evaporati":"evapora","nu evaza":"evaza","nu evazati":"evaza","nu eveni":"eveni","nu eveniti":"eveni","nu evghenisi":"evghenisi","nu evghenisiti":"evghenisi","nu evidentia":"evidenția","nu evidentiati":"evidenția","nu evinge":"evinge","nu evingeti":"evinge","nu eviscera":"eviscera","nu eviscerati":"eviscera","nu evita":"evita","nu evitati":"evita","nu evoca":"evoca","nu evocati":"evoca","nu evolua":"evolua","nu evoluati":"evolua","nu exacerba":"exacerba","nu exacerbati":"exacerba","nu exagera":"exagera","nu exagerati":"exagera","nu exala":"exala","nu exalati":"exala","nu exalta":"exalta","nu exaltati":"exalta","nu examina":"examina","nu examinati":"examina","nu exaspera":"exaspera","nu exasperati":"exaspera","nu excava":"excava","nu excavati":"excava","nu exceda":"exceda","nu excedati":"exceda","nu excela":"excela","nu excelati":"excela","nu excepta":"excepta","nu exceptati":"excepta","nu excerpta":"excerpta","nu excerptati":"excerpta","nu excita":"excita","nu excitati":"excita","nu exciza":"exciza","nu excizati":"exciza","nu exclama":"exclama","nu exclamati":"exclama","nu exclude":"exclude","nu excludeti":"exclude","nu excogita":"excogita","nu excogitati":"excogita","nu excomunica":"excomunica","nu excomunicati":"excomunica","nu excoria":"excoria","nu excoriati":"excoria","nu excreta":"excreta","nu excretati":"excreta","nu execra":"execra","nu execrati":"execra","nu executa":"executa","nu executarisi":"executarisi","nu executarisiti":"executarisi","nu executati":"executa","nu exemplifica":"exemplifica","nu exemplificati":"exemplifica","nu exercita":"exercita","nu exercitati":"exercita","nu exeredita":"exeredita","nu exereditati":"exeredita","nu exersa":"exersa","nu exersati":"exersa","nu exfolia":"exfolia","nu exfoliati":"exfolia","nu exhiba":"exhiba","nu exhibati":"exhiba","nu exhuma":"exhuma","nu exhumati":"exhuma","nu exige":"exige","nu exigeti":"exige","nu exila":"exila","nu exilati":"exila","nu exista":"exista","nu existati":"exista","nu exmatricula":"exmatricula","nu exmatriculati":"exmatricula","nu exoflisi":"exoflisi","nu exoflisiti":"exoflisi","nu exonera":"exonera","nu exonerati":"exonera","nu exorciza":"exorciza","nu exorcizati":"exorciza","nu exorta":"exorta","nu exortati":"exorta","nu exotiza":"exotiza","nu exotizati":"exotiza","nu expanda":"expanda","nu expandati":"expanda","nu expatria":"expatria","nu expatriati":"expatria","nu expectora":"expectora","nu expectorati":"expectora","nu expedia":"expedia","nu expediati":"expedia","nu expedui":"expedui","nu expeduiti":"expedui","nu experimenta":"experimenta","nu experimentati":"experimenta","nu expertiza":"expertiza","nu expertizati":"expertiza","nu expia":"expia","nu expiati":"expia","nu expira":"expira","nu expirati":"expira","nu explica":"explica","nu explicati":"explica","nu explicita":"explicita","nu explicitati":"explicita","nu exploata":"exploata","nu exploatati":"exploata","nu exploda":"exploda","nu explodati":"exploda","nu explora":"explora","nu explorati":"explora","nu exporta":"exporta","nu exportati":"exporta","nu exportui":"exportui","nu exportuiti":"exportui","nu exprima":"exprima","nu exprimati":"exprima","nu expropria":"expropria","nu expropriati":"expropria","nu expulsa":"expulsa","nu expulsati":"expulsa","nu expulza":"expulza","nu expulzati":"expulza","nu expune":"expune","nu expuneti":"expune","nu expurga":"expurga","nu expurgati":"expurga","nu extazia":"extazia","nu extaziati":"extazia","nu extenua":"extenua","nu extenuati":"extenua","nu exterioriza":"exterioriza","nu exteriorizati":"exterioriza","nu extermina":"extermina","nu exterminati":"extermina","nu externa":"externa","nu externaliza":"externaliza","nu externalizati":"externaliza","nu externati":"externa","nu extinde":"extinde","nu extindeti":"extinde","nu extirpa":"extirpa","nu extirpati":"extirpa","nu extorca":"extorca","nu extorcati":"extorca","nu extrada":"extrăda","nu extradati":"extrăda","nu extrage":"extrage","nu extrageti":"extrage","nu extrapola":"extrapola","nu extrapolati":"extrapola","nu exulta":"exulta","nu exultati":"exulta","nu ezita":"ezita","nu ezitati":"ezita","nu fabrica":"fabrica","nu fabricati":"fabrica","nu fabula":"fabula","nu fabulati":"fabula","nu face":"face","nu face laba":"face labă","nu face sex":"face sex","nu faceti":"face","nu faceti laba":"face labă","nu faceti sex":"face sex","nu facilita":"facilita","nu facilitati":"facilita","nu facsimila":"facsimila","nu facsimilati":"facsimila","nu factoriza":"factoriza","nu factorizati":"factoriza","nu factura":"factura","nu facturati":"factura","nu fagadui":"făgădui","nu fagaduiti":"făgădui","nu faianta":"faianța","nu faiantati":"faianța","nu falfai":["nu fâlfâi","fâlfâi","nu fâlfăi","fâlfăi","nu fălfâi","fălfâi"],"nu falfaiti":["nu fâlfâiți","fâlfâi","nu fâlfăiți","fâlfăi","nu fălfâiți","fălfâi"],"nu fali":"făli","nu falimenta":"falimenta","nu falimentati":"falimenta","nu faliti":"făli","nu falosi":"făloși","nu falositi":"făloși","nu falsifica":["nu falsifica","falsifica","nu falșifica","falșifica"],"nu falsificati":["nu falsificați","falsifica","nu falșificați","falșifica"],"nu faltui":"fălțui","nu faltuiti":"fălțui","nu familiariza":"familiariza","nu familiarizati":"familiariza","nu fanariotiza":"fanariotiza","nu fanariotizati":"fanariotiza","nu fanatiza":"fanatiza","nu fanatizati":"fanatiza","nu faptui":"făptui","nu faptuiti":"făptui","nu faralegi":"fărălegi","nu faralegiti":"fărălegi","nu farama":"fărâma","nu faramati":"fărâma","nu faramaturi":"fărâmături","nu faramaturiti":"fărâmături","nu farami":"fărâmi","nu faramita":"fărâmița","nu faramitati":"fărâmița","nu faramiti":"fărâmi","nu farbui":"fărbui","nu farbuiti":"fărbui","nu farda":"farda","nu fardati":"farda","nu farma":"fărma","nu farmaca":"fărmăca","nu farmacati":"fărmăca","nu farmati":"fărma","nu farsi":"fârși","nu farsiti":"fârși","nu fasai":["nu fâsâi","fâsâi","nu fâsăi","fâsăi","nu fâșâi","fâșâi","nu fâșăi","fâșăi"],"nu fasaiti":["nu fâsâiți","fâsâi","nu fâsăiți","fâsăi","nu fâșâiți","fâșâi","nu fâșăiți","fâșăi"],"nu fascina":"fascina","nu fascinati":"fascina","nu fasciza":"fasciza","nu fascizati":"fasciza","nu fasii":"fâșii","nu fasiiti":"fâșii","nu fasona":"fasona","nu fasonati":"fasona","nu fastaci":"fâstâci","nu fastaciti":"fâstâci","nu fasura":"fășura","nu fasurati":"fășura","nu fata":"făta","nu fatai":"fâțâi","nu fataiti":"fâțâi","nu fatari":"fățări","nu fatariti":"fățări","nu fatarnici":"fățărnici","nu fatarniciti":"fățărnici","nu fatati":"făta","nu fateta":"fațeta","nu fatetati":"fațeta","nu fatui":"fățui","nu fatuiti":"fățui","nu faulta":"faulta","nu faultati":"faulta","nu fauri":"făuri","nu fauriti":"făuri","nu favoriza":"favoriza","nu favorizati":"favoriza","nu feciori":"feciori","nu fecioriti":"feciori","nu fecunda":"fecunda","nu fecundati":"fecunda","nu federa":"federa","nu federaliza":"federaliza","nu federalizati":"federaliza","nu federati":"federa","nu felesui":"feleșui","nu felesuiti":"feleșui","nu felia":"felia","nu feliati":"felia","nu felicita":"felicita","nu felicitati":"felicita","nu feliuri":"feliuri","nu feliuriti":"feliuri","nu feluri":"feluri","nu feluriti":"feluri","nu feminiza":"feminiza","nu feminizati":"feminiza","nu fenta":"fenta","nu fentati":"fenta","nu ferastrui":"ferăstrui","nu ferastruiti":"ferăstrui","nu ferchezui":"ferchezui","nu ferchezuiti":"ferchezui","nu fereca":"fereca","nu ferecati":"fereca","nu ferestrui":"ferestrui","nu ferestruiti":"ferestrui","nu ferestui":"ferestui","nu ferestuiti":"ferestui","nu ferfenita":"ferfenița","nu ferfenitati":"ferfenița","nu feri":"feri","nu ferica":"ferica","nu fericati":"ferica","nu ferici":"ferici","nu fericita":"fericita","nu fericitati":"fericita","nu fericiti":"ferici","nu feriti":"feri","nu fermeca":"fermeca","nu fermecati":"fermeca","nu fermenta":"fermenta","nu fermentati":"fermenta","nu fertiliza":"fertiliza","nu fertilizati":"fertiliza","nu festeli":"feșteli","nu festeliti":"feșteli","nu festi":"fești","nu festiti":"fești","nu festona":"festona","nu festonati":"festona","nu fetisiza":"fetișiza","nu fetisizati":"fetișiza","nu feudaliza":"feudaliza","nu feudalizati":"feudaliza","nu fezanda":"fezanda","nu fezandati":"fezanda","nu fi":"fi","nu fibrila":"fibrila","nu fibrilati":"fibrila","nu fierastrui":"fierăstrui","nu fierastruiti":"fierăstrui","nu fierbanta":"fierbânta","nu fierbantati":"fierbânta","nu fierbe":"fierbe","nu fierbeti":"fierbe","nu figura":"figura","nu figurati":"figura","nu fiinta":"ființa","nu fiintati":"ființa","nu fiinti":"ființi","nu fiintiti":"ființi","nu filigrana":"filigrana","nu filigranati":"filigrana","nu filma":"filma","nu filmati":"filma","nu filosofa":"filosofa","nu filosofati":"filosofa","nu filosofi":"filosofi","nu filosofiti":"filosofi","nu filozofa":"filozofa","nu filozofati":"filozofa","nu filtra":"filtra","nu filtrati":"filtra","nu finaliza":"finaliza","nu finalizati":"finaliza","nu finanta":"finanța","nu finantati":"finanța","nu fini":"fini","nu finisa":"finisa","nu finisati":"finisa","nu finiti":"fini","nu firitisi":"firitisi","nu firitisiti":"firitisi","nu fiscaliza":"fiscaliza","nu fiscalizati":"fiscaliza","nu fisiona":"fisiona","nu fisionati":"fisiona","nu fisura":"fisura","nu fisurati":"fisura","nu fiti":"fi","nu fixa":"fixa","nu fixati":"fixa","nu flagela":"flagela","nu flagelati":"flagela","nu flamanzi":"flămânzi","nu flamanziti":"flămânzi","nu flamba":"flamba","nu flambati":"flamba","nu flanca":"flanca","nu flancati":"flanca","nu flata":"flata","nu flatati":"flata","nu flecari":"flecări","nu flecariti":"flecări","nu flencani":"flencăni","nu flencaniti":"flencăni","nu flescai":"fleșcăi","nu flescaiti":"fleșcăi","nu flexibiliza":"flexibiliza","nu flexibilizati":"flexibiliza","nu flexiona":"flexiona","nu flexionati":"flexiona","nu flirta":"flirta","nu flirtati":"flirta","nu flota":"flota","nu flotati":"flota","nu fluctua":"fluctua","nu fluctuati":"fluctua","nu fluidifica":"fluidifica","nu fluidificati":"fluidifica","nu fluidiza":"fluidiza","nu fluidizati":"fluidiza","nu fluiera":"fluiera","nu fluierati":"fluiera","nu fluoriza":"fluoriza","nu fluorizati":"fluoriza","nu flustura":"fluștura","nu flusturati":"fluștura","nu flutura":"flutura","nu fluturati":"flutura","nu focaliza":"focaliza","nu focalizati":"focaliza","nu fofila":"fofila","nu fofilati":"fofila","nu foi":"foi","nu foileta":"foileta","nu foiletati":"foileta","nu foiti":"foi","nu folfai":"folfăi","nu folfaiti":"folfăi","nu folosi":"folosi","nu folositi":"folosi","nu fonda":"fonda","nu fondati":"fonda","nu fora":"fora","nu forati":"fora","nu forfai":"forfăi","nu forfaiti":"forfăi","nu forfeca":"forfeca","nu forfecati":"forfeca","nu forfoti":"forfoti","nu forfotiti":"forfoti","nu forja":"forja","nu forjati":"forja","nu forma":"forma","nu formaliza":"formaliza","nu formalizati":"formaliza","nu formata":"formata","nu formatati":"formata","nu formati":"forma","nu formula":"formula","nu formulati":"formula","nu fornica":"fornica","nu fornicati":"fornica","nu forostoi":"forostoi","nu forostoiti":"forostoi","nu forta":"forța","nu fortati":"forța","nu fortifica":"fortifica","nu fortificati":"fortifica","nu foscai":"foșcăi","nu foscaiti":"foșcăi","nu fosfata":"fosfata","nu fosfatati":"fosfata","nu fosiliza":"fosiliza","nu fosilizati":"fosiliza","nu fosnai":"foșnăi","nu fosnaiti":"foșnăi","nu fosni":"foșni","nu fosniti":"foșni","nu fotocopia":"fotocopia","nu fotocopiati":"fotocopia","nu fotografia":"fotografia","nu fotografiati":"fotografia","nu fractiona":"fracționa","nu fractionati":"fracționa","nu fractura":"fractura","nu fracturati":"fractura","nu fragezi":"frăgezi","nu frageziti":"frăgezi","nu fragmenta":"fragmenta","nu fragmentati":"fragmenta","nu fraieri":"fraieri","nu fraieriti":"fraieri","nu framanta":"frământa","nu framantati":"frământa","nu frana":"frâna","nu franati":"frâna","nu franca":"franca","nu francati":"franca","nu franciza":"franciza","nu francizati":"franciza","nu frange":"frânge","nu frangeti":"frânge","nu frangi":"frângi","nu frangiti":"frângi","nu franjura":"franjura","nu franjurati":"franjura","nu frantuzi":"franțuzi","nu frantuziti":"franțuzi","nu frapa":"frapa","nu frapati":"frapa","nu fraterniza":"fraterniza","nu fraternizati":"fraterniza","nu frauda":"frauda","nu fraudati":"frauda","nu fraza":"fraza","nu frazati":"fraza","nu freca":"freca","nu frecati":"freca","nu frectiona":"frecționa","nu frectionati":"frecționa","nu frecventa":"frecventa","nu frecventati":"frecventa","nu fredona":"fredona","nu fredonati":"fredona","nu fremata":"fremăta","nu frematati":"fremăta","nu freza":"freza","nu frezati":"freza","nu frichini":"frichini","nu frichiniti":"frichini","nu fricosa":"fricoșa","nu fricosati":"fricoșa","nu frictiona":"fricționa","nu frictionati":"fricționa","nu frige":"frige","nu frigeti":"frige","nu friza":"friza","nu frizati":"friza","nu fructifica":"fructifica","nu fructificati":"fructifica","nu frumuseta":"frumuseța","nu frumusetati":"frumuseța","nu frunzari":"frunzări","nu frunzariti":"frunzări","nu frunzi":"frunzi","nu frunziti":"frunzi","nu frustra":"frustra","nu frustrati":"frustra","nu fuduli":"fuduli","nu fuduliti":"fuduli","nu fuga":"fuga","nu fugari":"fugări","nu fugariti":"fugări","nu fugati":"fuga","nu fugi":"fugi","nu fugiti":"fugi","nu fulgera":"fulgera","nu fulgerati":"fulgera","nu fulgura":"fulgura","nu fulgurati":"fulgura","nu fuma":"fuma","nu fumati":"fuma","nu fumega":"fumega","nu fumegati":"fumega","nu fumiza":"fumiza","nu fumizati":"fumiza","nu functiona":"funcționa","nu functionati":"funcționa","nu funda":"funda","nu fundamenta":"fundamenta","nu fundamentati":"fundamenta","nu fundarisi":"fundarisi","nu fundarisiti":"fundarisi","nu fundati":"funda","nu fura":"fura","nu furaja":"furaja","nu furajati":"furaja","nu furati":"fura","nu furgasi":"furgăsi","nu furgasiti":"furgăsi","nu furisa":"furișa","nu furisati":"furișa","nu furlandisi":"furlandisi","nu furlandisiti":"furlandisi","nu furlua":"furlua","nu furluati":"furlua","nu furnica":"furnica","nu furnicati":"furnica","nu furnirui":"furnirui","nu furniruiti":"furnirui","nu furniza":"furniza","nu furnizati":"furniza","nu fute":"fute"};
@@ -0,0 +1 @@
+export default {"nu futeti":"fute","nu fuziona":"fuziona","nu fuzionati":"fuziona","nu gaci":"gâci","nu gaciti":"gâci","nu gadeli":"gâdeli","nu gadeliti":"gâdeli","nu gadila":"gâdila","nu gadilati":"gâdila","nu gadili":"gâdili","nu gadiliti":"gâdili","nu gafa":"gafa","nu gafati":"gafa","nu gafui":"gâfui","nu gafuiti":"gâfui","nu gagai":"gâgâi","nu gagaiti":"gâgâi","nu gaina":"găina","nu gainata":"găinăța","nu gainatati":"găinăța","nu gainati":"găina","nu gaini":"găini","nu gainita":"găinița","nu gainitati":"găinița","nu gainiti":"găini","nu gaitani":"găităni","nu gaitaniti":"găităni","nu galagi":"gălăgi","nu galagiti":"gălăgi","nu galbeji":"gălbeji","nu galbejiti":"gălbeji","nu galbeni":"gălbeni","nu galbeniti":"gălbeni","nu galbini":"gălbini","nu galbiniti":"gălbini","nu galcevi":"gâlcevi","nu galceviti":"gâlcevi","nu galgai":"gâlgâi","nu galgaiti":"gâlgâi","nu galopa":"galopa","nu galopati":"galopa","nu galvaniza":"galvaniza","nu galvanizati":"galvaniza","nu gamba":"gâmba","nu gambati":"gâmba","nu gamfa":"gâmfa","nu gamfati":"gâmfa","nu gandi":"gândi","nu ganditi":"gândi","nu gangrena":"gangrena","nu gangrenati":"gangrena","nu ganguri":"gânguri","nu ganguriti":"gânguri","nu gara":"gara","nu garanta":"garanta","nu garantati":"garanta","nu garati":"gara","nu gardui":"gărdui","nu garduiti":"gărdui","nu gargarisi":"gargarisi","nu gargarisiti":"gargarisi","nu gargariza":"gargariza","nu gargarizati":"gargariza","nu garnisi":"garnisi","nu garnisiti":"garnisi","nu gasi":"găsi","nu gasiti":"găsi","nu gata":"găta","nu gatati":"găta","nu gati":"găti","nu gatiti":"găti","nu gatui":"gâtui","nu gatuiti":"gâtui","nu gaunosi":"găunoși","nu gaunositi":"găunoși","nu gauri":"găuri","nu gauriti":"găuri","nu gavozdi":"găvozdi","nu gavozditi":"găvozdi","nu gaza":"gaza","nu gazati":"gaza","nu gazdui":"găzdui","nu gazduiti":"găzdui","nu gazeifica":"gazeifica","nu gazeificati":"gazeifica","nu gazifica":"gazifica","nu gazificati":"gazifica","nu gazona":"gazona","nu gazonati":"gazona","nu gelapi":"gelăpi","nu gelapiti":"gelăpi","nu gelatiniza":"gelatiniza","nu gelatinizati":"gelatiniza","nu gelifica":"gelifica","nu gelificati":"gelifica","nu geme":"geme","nu gemeti":"geme","nu genera":"genera","nu generaliza":"generaliza","nu generalizati":"generaliza","nu generati":"genera","nu geometriza":"geometriza","nu geometrizati":"geometriza","nu gera":"gera","nu gerati":"gera","nu germaniza":"germaniza","nu germanizati":"germaniza","nu germina":"germina","nu germinati":"germina","nu gerui":"gerui","nu geruiti":"gerui","nu gesticula":"gesticula","nu gesticulati":"gesticula","nu gestiona":"gestiona","nu gestionati":"gestiona","nu ghebosi":"gheboși","nu ghebositi":"gheboși","nu ghemui":"ghemui","nu ghemuiti":"ghemui","nu ghera":"ghera","nu gherati":"ghera","nu gheura":"gheura","nu gheurati":"gheura","nu ghici":"ghici","nu ghiciti":"ghici","nu ghida":"ghida","nu ghidati":"ghida","nu ghiemali":"ghiemăli","nu ghiemaliti":"ghiemăli","nu ghiftui":"ghiftui","nu ghiftuiti":"ghiftui","nu ghilosa":"ghiloșa","nu ghilosati":"ghiloșa","nu ghilotina":"ghilotina","nu ghilotinati":"ghilotina","nu ghionti":"ghionti","nu ghiontiti":"ghionti","nu ghiontui":"ghiontui","nu ghiontuiti":"ghiontui","nu ghiorai":"ghiorăi","nu ghioraiti":"ghiorăi","nu ghiortai":"ghiorțăi","nu ghiortaiti":"ghiorțăi","nu gigantiza":"gigantiza","nu gigantizati":"gigantiza","nu gilalui":"gilălui","nu gilaluiti":"gilălui","nu gini":"gini","nu giniti":"gini","nu gira":"gira","nu girati":"gira","nu giugiuli":"giugiuli","nu giugiuliti":"giugiuli","nu giulgiui":"giulgiui","nu giulgiuiti":"giulgiui","nu glantui":"glănțui","nu glantuiti":"glănțui","nu glasa":"glasa","nu glasati":"glasa","nu glasui":"glăsui","nu glasuiti":"glăsui","nu glazura":"glazura","nu glazurati":"glazura","nu glisa":"glisa","nu glisati":"glisa","nu globaliza":"globaliza","nu globalizati":"globaliza","nu glorifica":"glorifica","nu glorificati":"glorifica","nu glumi":"glumi","nu glumiti":"glumi","nu gofra":"gofra","nu gofrati":"gofra","nu gogoli":"gogoli","nu gogoliti":"gogoli","nu goli":"goli","nu goliti":"goli","nu gologani":"gologăni","nu gologaniti":"gologăni","nu gonfla":"gonfla","nu gonflati":"gonfla","nu gonguri":"gonguri","nu gonguriti":"gonguri","nu goni":"goni","nu goniti":"goni","nu gospodari":"gospodări","nu gospodariti":"gospodări","nu gotovi":"gotovi","nu gotoviti":"gotovi","nu grabi":"grăbi","nu grabiti":"grăbi","nu grada":"grada","nu gradati":"grada","nu gradinari":"grădinări","nu gradinariti":"grădinări","nu gradua":"gradua","nu graduati":"gradua","nu grafitiza":"grafitiza","nu grafitizati":"grafitiza","nu grai":"grăi","nu graiti":"grăi","nu gramaticaliza":"gramaticaliza","nu gramaticalizati":"gramaticaliza","nu granula":"granula","nu granulati":"granula","nu grapa":"grăpa","nu grapati":"grăpa","nu graseia":"graseia","nu graseiati":"graseia","nu gratia":"grația","nu gratiati":"grația","nu gratifica":"gratifica","nu gratificati":"gratifica","nu gratina":"gratina","nu gratinati":"gratina","nu gratula":"gratula","nu gratulati":"gratula","nu grava":"grava","nu gravati":"grava","nu gravita":"gravita","nu gravitati":"gravita","nu grea":"grea","nu greati":"grea","nu grebla":"grebla","nu greblati":"grebla","nu greciza":"greciza","nu grecizati":"greciza","nu grefa":"grefa","nu grefati":"grefa","nu gresa":"gresa","nu gresati":"gresa","nu gresi":"greși","nu gresiti":"greși","nu greva":"greva","nu grevati":"greva","nu griji":"griji","nu grijiti":"griji","nu grima":"grima","nu grimati":"grima","nu griza":"griza","nu grizati":"griza","nu grizona":"grizona","nu grizonati":"grizona","nu grohai":"grohăi","nu grohaiti":"grohăi","nu grozavi":"grozăvi","nu grozaviti":"grozăvi","nu grumura":"grumura","nu grumurati":"grumura","nu grupa":"grupa","nu grupati":"grupa","nu gudrona":"gudrona","nu gudronati":"gudrona","nu gudura":"gudura","nu gudurati":"gudura","nu gugiuli":"gugiuli","nu gugiuliti":"gugiuli","nu guita":"guița","nu guitati":"guița","nu guma":"guma","nu gumati":"guma","nu gunguni":"gunguni","nu gunguniti":"gunguni","nu gunguri":"gunguri","nu gunguriti":"gunguri","nu gunoia":"gunoia","nu gunoiati":"gunoia","nu gurai":"gurăi","nu guraiti":"gurăi","nu gusta":"gusta","nu gustati":"gusta","nu guverna":"guverna","nu guvernati":"guverna","nu habuci":"hăbuci","nu habuciti":"hăbuci","nu hacui":"hăcui","nu hacuiti":"hăcui","nu hai":"hâi","nu haiduci":"haiduci","nu haiduciti":"haiduci","nu haini":"hăini","nu hainiti":"hăini","nu haiti":"hâi","nu haitui":"hăitui","nu haituiti":"hăitui","nu halacai":"hălăcăi","nu halacaiti":"hălăcăi","nu halalai":"hălălăi","nu halalaiti":"hălălăi","nu hali":"hali","nu haliti":"hali","nu halogena":"halogena","nu halogenati":"halogena","nu halucina":"halucina","nu halucinati":"halucina","nu hamai":["nu hâmâi","hâmâi","nu hămăi","hămăi"],"nu hamaiti":["nu hâmâiți","hâmâi","nu hămăiți","hămăi"],"nu hamesi":"hămesi","nu hamesiti":"hămesi","nu hamisi":"hămisi","nu hamisiti":"hămisi","nu hamletiza":"hamletiza","nu hamletizati":"hamletiza","nu hamui":"hămui","nu hamuiti":"hămui","nu handicapa":"handicapa","nu handicapati":"handicapa","nu hapai":"hăpăi","nu hapaiti":"hăpăi","nu haraci":"hărăci","nu haraciti":"hărăci","nu haracsi":"hărăcsi","nu haracsiti":"hărăcsi","nu haragi":"hărăgi","nu haragiti":"hărăgi","nu harai":"hârâi","nu haraiti":"hârâi","nu harani":"hărăni","nu haraniti":"hărăni","nu harazi":"hărăzi","nu haraziti":"hărăzi","nu harbui":"hârbui","nu harbuiti":"hârbui","nu harcai":"hârcăi","nu harcaiti":"hârcăi","nu harcati":"hărcăti","nu harcatiti":"hărcăti","nu harjai":"hârjâi","nu harjaiti":"hârjâi","nu harjoni":"hârjoni","nu harjoniti":"hârjoni","nu harnasa":"harnașa","nu harnasati":"harnașa","nu harnici":"hărnici","nu harniciti":"hărnici","nu harsai":"hârșâi","nu harsaiti":"hârșâi","nu harscai":"hârșcâi","nu harscaiti":"hârșcâi","nu harsii":"hârșii","nu harsiiti":"hârșii","nu harsni":"hârșni","nu harsniti":"hârșni","nu harsti":"hărști","nu harstiti":"hărști","nu hartui":["nu hartui","hartui","nu hârțui","hârțui","nu hărțui","hărțui"],"nu hartuiti":["nu hartuiți","hartui","nu hârțuiți","hârțui","nu hărțuiți","hărțui"],"nu hasura":"hașura","nu hasurati":"hașura","nu hatai":"hâțâi","nu hataiti":"hâțâi","nu hatana":"hâțâna","nu hatanati":"hâțâna","nu hatcai":"hâtcâi","nu hatcaiti":"hâtcâi","nu hatui":"hățui","nu hatuiti":"hățui","nu haui":"hăui","nu hauiti":"hăui","nu hauli":"hăuli","nu hauliti":"hăuli","nu hazarda":"hazarda","nu hazardati":"hazarda","nu hazi":"hâzi","nu haziti":"hâzi","nu hecela":"hecela","nu hecelati":"hecela","nu heretisi":"heretisi","nu heretisiti":"heretisi","nu hiberna":"hiberna","nu hibernati":"hiberna","nu hibrida":"hibrida","nu hibridati":"hibrida","nu hibridiza":"hibridiza","nu hibridizati":"hibridiza","nu hidrata":"hidrata","nu hidratati":"hidrata","nu hidrofiliza":"hidrofiliza","nu hidrofilizati":"hidrofiliza","nu hidrogena":"hidrogena","nu hidrogenati":"hidrogena","nu hidroizola":"hidroizola","nu hidroizolati":"hidroizola","nu hidroliza":"hidroliza","nu hidrolizati":"hidroliza","nu hidroplana":"hidroplana","nu hidroplanati":"hidroplana","nu hihoti":"hihoti","nu hihotiti":"hihoti","nu hingheri":"hingheri","nu hingheriti":"hingheri","nu hiperboliza":"hiperboliza","nu hiperbolizati":"hiperboliza","nu hipersensibiliza":"hipersensibiliza","nu hipersensibilizati":"hipersensibiliza","nu hipertrofia":"hipertrofia","nu hipertrofiati":"hipertrofia","nu hipnotiza":"hipnotiza","nu hipnotizati":"hipnotiza","nu hiritisi":"hiritisi","nu hiritisiti":"hiritisi","nu hirotoni":"hirotoni","nu hirotonisi":"hirotonisi","nu hirotonisiti":"hirotonisi","nu hirotoniti":"hirotoni","nu hirotonosi":"hirotonosi","nu hirotonositi":"hirotonosi","nu hodini":"hodini","nu hodiniti":"hodini","nu hodorogi":"hodorogi","nu hodorogiti":"hodorogi","nu hoheri":"hoheri","nu hoheriti":"hoheri","nu hohoti":"hohoti","nu hohotiti":"hohoti","nu hoinari":"hoinări","nu hoinariti":"hoinări","nu holba":"holba","nu holbati":"holba","nu hondrani":"hondrăni","nu hondraniti":"hondrăni","nu hopai":"hopăi","nu hopaiti":"hopăi","nu horai":"horăi","nu horaiti":"horăi","nu horcai":"horcăi","nu horcaiti":"horcăi","nu horcani":"horcăni","nu horcaniti":"horcăni","nu horhai":"horhăi","nu horhaiti":"horhăi","nu hori":"hori","nu horipila":"horipila","nu horipilati":"horipila","nu horiti":"hori","nu horopsi":"horopsi","nu horopsiti":"horopsi","nu hotarati":"hotărî","nu hotari":"hotărî","nu hotarnici":"hotărnici","nu hotarniciti":"hotărnici","nu hoti":"hoți","nu hotiti":"hoți","nu hraconi":"hraconi","nu hraconiti":"hraconi","nu hrani":"hrăni","nu hraniti":"hrăni","nu hrapi":"hrăpi","nu hrapiti":"hrăpi","nu hrentui":"hrentui","nu hrentuiti":"hrentui","nu hrepcui":"hrepcui","nu hrepcuiti":"hrepcui","nu huhura":"huhura","nu huhurati":"huhura","nu huhureza":"huhureza","nu huhurezati":"huhureza","nu huidui":"huidui","nu huiduiti":"huidui","nu huli":"huli","nu huliti":"huli","nu hultui":"hultui","nu hultuiti":"hultui","nu hului":"hului","nu huluiti":"hului","nu hurduca":"hurduca","nu hurducai":"hurducăi","nu hurducaiti":"hurducăi","nu hurducati":"hurduca","nu hurui":"hurui","nu huruiti":"hurui","nu hutupi":"hutupi","nu hutupiti":"hutupi","nu huzuri":"huzuri","nu huzuriti":"huzuri","nu jacmani":"jăcmăni","nu jacmaniti":"jăcmăni","nu jacui":"jăcui","nu jacuiti":"jăcui","nu jalona":"jalona","nu jalonati":"jalona","nu jari":"jări","nu jariti":"jări","nu jarui":"jărui","nu jaruiti":"jărui","nu javeliza":"javeliza","nu javelizati":"javeliza","nu jecmani":"jecmăni","nu jecmaniti":"jecmăni","nu jecui":"jecui","nu jecuiti":"jecui","nu jefui":"jefui","nu jefuiti":"jefui","nu jeli":"jeli","nu jeliti":"jeli","nu jelui":"jelui","nu jeluiti":"jelui","nu jena":"jena","nu jenati":"jena","nu jerpeli":"jerpeli","nu jerpeliti":"jerpeli","nu jertfi":"jertfi","nu jertfiti":"jertfi","nu jertfui":"jertfui","nu jertfuiti":"jertfui","nu jerui":"jerui","nu jeruiti":"jerui","nu jicni":"jicni","nu jicniti":"jicni","nu jigari":"jigări","nu jigariti":"jigări","nu jigni":"jigni","nu jigniti":"jigni","nu jilavi":"jilăvi","nu jilaviti":"jilăvi","nu jindui":"jindui","nu jinduiti":"jindui","nu jnapai":"jnăpăi","nu jnapaiti":"jnăpăi","nu jongla":"jongla","nu jonglati":"jongla","nu jubila":"jubila","nu jubilati":"jubila","nu juca":"juca","nu jucati":"juca","nu judeca":"judeca","nu judecati":"judeca","nu judeci":"judeci","nu judeciti":"judeci","nu jugani":"jugăni","nu juganiti":"jugăni","nu jugula":"jugula","nu jugulati":"jugula","nu juisa":"juisa","nu juisati":"juisa","nu juli":"juli","nu juliti":"juli","nu jumatati":"jumătăți","nu jumatatiti":"jumătăți","nu jumuli":"jumuli","nu jumuliti":"jumuli","nu junghia":"junghia","nu junghiati":"junghia","nu jupi":"jupi","nu jupiti":"jupi","nu jupui":"jupui","nu jupuiti":"jupui","nu jura":"jura","nu jurati":"jura","nu juriza":"juriza","nu jurizati":"juriza","nu jurui":"jurui","nu juruiti":"jurui","nu justifica":"justifica","nu justificati":"justifica","nu juxtapune":"juxtapune","nu juxtapuneti":"juxtapune","nu kilometra":"kilometra","nu kilometrati":"kilometra","nu knockouta":"knockouta","nu knockoutati":"knockouta","nu la":"la","nu labadui":"lăbădui","nu labaduiti":"lăbădui","nu labarta":"lăbărța","nu labartati":"lăbărța","nu labializa":"labializa","nu labializati":"labializa","nu labora":"labora","nu laborati":"labora","nu lacatui":"lăcătui","nu lacatuiti":"lăcătui","nu lacera":"lacera","nu lacerati":"lacera","nu lacomi":"lăcomi","nu lacomiti":"lăcomi","nu lacrama":"lăcrăma","nu lacramati":"lăcrăma","nu lacrima":"lăcrima","nu lacrimati":"lăcrima","nu lacui":"lăcui","nu lacuiti":"lăcui","nu lafai":"lăfăi","nu lafaiti":"lăfăi","nu lahtarisi":"lahtarisi","nu lahtarisiti":"lahtarisi","nu laiciza":"laiciza","nu laicizati":"laiciza","nu lainici":"lăinici","nu lainiciti":"lăinici","nu lamatisi":"lamatisi","nu lamatisiti":"lamatisi","nu lambicarisi":"lambicarisi","nu lambicarisiti":"lambicarisi","nu lambrisa":"lambrisa","nu lambrisati":"lambrisa","nu lamenta":"lamenta","nu lamentati":"lamenta","nu lamina":"lamina","nu laminati":"lamina","nu lamuri":"lămuri","nu lamuriti":"lămuri","nu lancezi":"lâncezi","nu lanceziti":"lâncezi","nu langui":"langui","nu languiti":"langui","nu lansa":"lansa","nu lansati":"lansa","nu lantui":"lănțui","nu lantuiti":"lănțui","nu lapada":"lăpăda","nu lapadati":"lăpăda","nu lapai":"lăpăi","nu lapaiti":"lăpăi","nu lapida":"lapida","nu lapidati":"lapida","nu lapovita":"lapovița","nu lapovitati":"lapovița","nu lapta":"lăpta","nu laptati":"lăpta","nu laptuci":"lăptuci","nu laptuciti":"lăptuci","nu largi":"lărgi","nu largiti":"lărgi","nu larmui":"lărmui","nu larmuiti":"lărmui","nu lasa":"lăsa","nu lasati":"lăsa","nu lastari":"lăstări","nu lastariti":"lăstări","nu lasti":"lăsti","nu lastiti":"lăsti","nu lati":["nu lați","la","nu lăți","lăți"],"nu latini":"latini","nu latiniti":"latini","nu latiniza":"latiniza","nu latinizati":"latiniza","nu latiti":"lăți","nu latra":"lătra","nu latrati":"lătra","nu latura":"lătura","nu laturati":"lătura","nu lauda":"lăuda","nu laudati":"lăuda","nu lauzi":"lăuzi","nu lauziti":"lăuzi","nu lectura":"lectura","nu lecturati":"lectura","nu lecui":"lecui","nu lecuiti":"lecui","nu lefteri":"lefteri","nu lefteriti":"lefteri","nu lega":"lega","nu legaliza":"legaliza","nu legalizati":"legaliza","nu legana":"legăna","nu leganati":"legăna","nu legati":"lega","nu legatui":"legatui","nu legatuiti":"legatui","nu legifera":"legifera","nu legiferati":"legifera","nu legionariza":"legionariza","nu legionarizati":"legionariza","nu legisla":"legisla","nu legislati":"legisla","nu legitima":"legitima","nu legitimati":"legitima","nu legitimiza":"legitimiza","nu legitimizati":"legitimiza","nu legiui":"legiui","nu legiuiti":"legiui","nu lehai":"lehăi","nu lehaiti":"lehăi","nu lehameti":["nu lehămeti","lehămeti","nu lehămeți","lehămeți"],"nu lehametisi":"lehămetisi","nu lehametisiti":"lehămetisi","nu lehametiti":["nu lehămetiți","lehămeti","nu lehămețiți","lehămeți"],"nu lehametui":"lehămetui","nu lehametuiti":"lehămetui","nu lehuzi":"lehuzi","nu lehuziti":"lehuzi","nu lenevi":"lenevi","nu leneviti":"lenevi","nu leopai":"leopăi","nu leopaiti":"leopăi","nu leorbai":"leorbăi","nu leorbaiti":"leorbăi","nu lepada":"lepăda","nu lepadati":"lepăda","nu lepai":"lepăi","nu lepaiti":"lepăi","nu lesina":"leșina","nu lesinati":"leșina","nu lesta":"lesta","nu lestati":"lesta","nu lesui":"leșui","nu lesuiti":"leșui","nu leviga":"leviga","nu levigati":"leviga","nu lexicaliza":"lexicaliza","nu lexicalizati":"lexicaliza","nu leza":"leza","nu lezati":"leza","nu libela":"libela","nu libelati":"libela","nu libera":"libera","nu liberaliza":"liberaliza","nu liberalizati":"liberaliza","nu liberati":"libera","nu licari":"licări","nu licariti":"licări","nu licentia":"licenția","nu licentiati":"licenția","nu lichefia":"lichefia","nu lichefiati":"lichefia","nu lichida":"lichida","nu lichidati":"lichida","nu licita":"licita","nu licitati":"licita","nu licura":"licura","nu licurati":"licura","nu licuri":"licuri","nu licuriti":"licuri","nu lifera":"lifera","nu liferati":"lifera","nu lignifica":"lignifica","nu lignificati":"lignifica","nu lihai":"lihăi","nu lihaiti":"lihăi","nu limbuti":"limbuți","nu limbutiti":"limbuți","nu limita":"limita","nu limitati":"limita","nu limpezi":"limpezi","nu limpeziti":"limpezi","nu linciuri":"linciuri","nu linciuriti":"linciuri","nu lingari":"lingări","nu lingariti":"lingări","nu linge":"linge","nu lingeti":"linge","nu lingusi":"linguși","nu lingusiti":"linguși","nu linia":"linia","nu liniati":"linia","nu linisti":"liniști","nu linistiti":"liniști","nu linsa":"linșa","nu linsati":"linșa","nu liofiliza":"liofiliza","nu liofilizati":"liofiliza","nu lipi":"lipi","nu lipiti":"lipi","nu lipsi":"lipsi","nu lipsiti":"lipsi","nu liriciza":"liriciza","nu liricizati":"liriciza","nu lista":"lista","nu listati":"lista","nu litera":"litera","nu literariza":"literariza","nu literarizati":"literariza","nu literati":"litera","nu literaturiza":"literaturiza","nu literaturizati":"literaturiza","nu litografia":"litografia","nu litografiati":"litografia","nu livra":"livra","nu livrati":"livra","nu loba":"loba","nu lobati":"loba","nu localiza":"localiza","nu localizati":"localiza","nu locui":"locui","nu locuiti":"locui","nu loga":"loga","nu logaritma":"logaritma","nu logaritmati":"logaritma","nu logati":"loga","nu logodi":"logodi","nu logoditi":"logodi","nu lombarda":"lombarda","nu lombardati":"lombarda","nu lopata":"lopăta","nu lopatati":"lopăta","nu lotiona":"loționa","nu lotionati":"loționa","nu lotiza":"lotiza","nu lotizati":"lotiza","nu lotri":"lotri","nu lotriti":"lotri","nu lovi":"lovi","nu loviti":"lovi","nu lua":"lua","nu lua in seama":"lua în seamă","nu lua la pula":"lua la pulă","nu luati":"lua","nu luati in seama":"lua în seamă","nu luati la pula":"lua la pulă","nu lubrifia":"lubrifia","nu lubrifiati":"lubrifia","nu luci":"luci","nu luciti":"luci","nu lucra":"lucra","nu lucrati":"lucra","nu lumina":"lumina","nu luminati":"lumina","nu luneca":"luneca","nu lunecati":"luneca","nu lunga":"lunga","nu lungati":"lunga","nu lungi":"lungi","nu lungiti":"lungi","nu luntri":"luntri","nu luntriti":"luntri","nu lupta":"lupta","nu luptati":"lupta","nu lusa":"lușa","nu lusati":"lușa","nu lustrui":"lustrui","nu lustruiti":"lustrui","nu luxa":"luxa","nu luxati":"luxa","nu naboi":"năboi","nu naboiti":"năboi","nu nabusi":"năbuși","nu nabusiti":"năbuși","nu nacaji":"năcăji","nu nacajiti":"năcăji","nu naclai":"năclăi","nu naclaiti":"năclăi","nu nadai":"nădăi","nu nadaiti":"nădăi","nu nadajdui":"nădăjdui","nu nadajduiti":"nădăjdui","nu nadejdui":"nădejdui","nu nadejduiti":"nădejdui","nu naduri":"năduri","nu naduriti":"năduri","nu nadusi":"năduși","nu nadusiti":"năduși","nu nalbi":"nălbi","nu nalbiti":"nălbi","nu nalta":"nălța","nu naltati":"nălța","nu naluci":"năluci","nu naluciti":"năluci","nu nameti":"nămeți","nu nametiti":"nămeți","nu nami":"nămi","nu namiti":"nămi","nu namoli":"nămoli","nu namoliti":"nămoli","nu napadi":"năpădi","nu napaditi":"năpădi","nu naparli":"năpârli","nu naparliti":"năpârli","nu napastui":"năpăstui","nu napastuiti":"năpăstui","nu napoia":"napoia","nu napoiati":"napoia","nu napusti":"năpusti","nu napustiti":"năpusti","nu nara":"nara","nu narati":"nara","nu naravi":"nărăvi","nu naraviti":"nărăvi","nu narcotiza":"narcotiza","nu narcotizati":"narcotiza","nu narui":"nărui","nu naruiti":"nărui","nu nascoci":"născoci","nu nascociti":"născoci","nu nasi":"năși","nu nasiti":"năși","nu naslui":"năslui","nu nasluiti":"năslui","nu nasoli":"nasoli","nu nasoliti":"nasoli","nu nastavi":"năstăvi","nu nastaviti":"năstăvi","nu naste":"naște","nu nasteti":"naște","nu natangi":"nătângi","nu natangiti":"nătângi","nu nationaliza":"naționaliza","nu nationalizati":"naționaliza","nu naturaliza":"naturaliza","nu naturalizati":"naturaliza","nu nauci":"năuci","nu nauciti":"năuci","nu naufragia":"naufragia","nu naufragiati":"naufragia","nu navali":"năvăli","nu navaliti":"năvăli","nu naviga":"naviga","nu navigabiliza":"navigabiliza","nu navigabilizati":"navigabiliza","nu navigati":"naviga","nu navlosi":"navlosi","nu navlositi":"navlosi","nu navodi":"năvodi","nu navoditi":"năvodi","nu nazaliza":"nazaliza","nu nazalizati":"nazaliza","nu nazari":"năzări","nu nazariti":"năzări","nu nazui":"năzui","nu nazuiti":"năzui","nu neantiza":"neantiza","nu neantizati":"neantiza","nu nebuni":"nebuni","nu nebuniti":"nebuni","nu necaji":"necăji","nu necajiti":"necăji","nu necesita":"necesita","nu necesitati":"necesita","nu necheza":"necheza","nu nechezati":"necheza","nu necinsti":"necinsti","nu necinstiti":"necinsti","nu necroza":"necroza","nu necrozati":"necroza","nu necurati":"necurăți","nu necuratiti":"necurăți","nu nedreptati":"nedreptăți","nu nedreptatiti":"nedreptăți","nu nedumeri":"nedumeri","nu nedumeriti":"nedumeri","nu nedumiri":"nedumiri","nu nedumiriti":"nedumiri","nu neferici":"neferici","nu nefericiti":"neferici","nu nega":"nega","nu negati":"nega","nu negativa":"negativa","nu negativati":"negativa","nu negativiza":"negativiza","nu negativizati":"negativiza","nu neglija":"neglija","nu neglijarisi":"neglijarisi","nu neglijarisiti":"neglijarisi","nu neglijati":"neglija","nu negocia":"negocia","nu negociati":"negocia","nu negri":"negri","nu negriti":"negri","nu negustori":"negustori","nu negustoriti":"negustori","nu neguta":"neguța","nu negutati":"neguța","nu negutatori":"neguțători","nu negutatoriti":"neguțători","nu neingriji":"neîngriji","nu neingrijiti":"neîngriji","nu nelinisti":"neliniști","nu nelinistiti":"neliniști","nu nemeri":"nemeri","nu nemeriti":"nemeri","nu nemernici":"nemernici","nu nemerniciti":"nemernici","nu nemeti":"nemeți","nu nemetiti":"nemeți","nu nemti":"nemți","nu nemtiti":"nemți","nu nemultami":"nemulțămi","nu nemultamiti":"nemulțămi","nu nemultumi":"nemulțumi","nu nemultumiti":"nemulțumi","nu nemuri":"nemuri","nu nemuriti":"nemuri","nu nenoroci":"nenoroci","nu nenorociti":"nenoroci","nu neodihni":"neodihni","nu neodihniti":"neodihni","nu neologiza":"neologiza","nu neologizati":"neologiza","nu nesocoti":"nesocoti","nu nesocotiti":"nesocoti","nu nesti":"nești","nu nestiti":"nești","nu neteza":"neteza","nu netezati":"neteza","nu netezi":"netezi","nu neteziti":"netezi","nu neurasteniza":"neurasteniza","nu neurastenizati":"neurasteniza","nu neutraliza":"neutraliza","nu neutralizati":"neutraliza","nu nevedi":"nevedi","nu nevediti":"nevedi","nu nevesti":"nevesti","nu nevestiti":"nevesti","nu nevoi":"nevoi","nu nevoiti":"nevoi","nu nichela":"nichela","nu nichelati":"nichela","nu nicotiniza":"nicotiniza","nu nicotinizati":"nicotiniza","nu nimeri":"nimeri","nu nimeriti":"nimeri","nu nimici":"nimici","nu nimiciti":"nimici","nu nimicnici":"nimicnici","nu nimicniciti":"nimicnici","nu nitra":"nitra","nu nitrati":"nitra","nu nitrifica":"nitrifica","nu nitrificati":"nitrifica","nu nitrura":"nitrura","nu nitrurati":"nitrura","nu nitui":"nitui","nu nituiti":"nitui","nu nivela":"nivela","nu nivelati":"nivela","nu niveli":"niveli","nu niveliti":"niveli","nu nividi":"nividi","nu nividiti":"nividi","nu nizui":"nizui","nu nizuiti":"nizui","nu nobila":"nobila","nu nobilati":"nobila","nu nobilita":"nobilita","nu nobilitati":"nobilita","nu nominaliza":"nominaliza","nu nominalizati":"nominaliza","nu nominativiza":"nominativiza","nu nominativizati":"nominativiza","nu nomoli":"nomoli","nu nomoliti":"nomoli","nu nomotemisi":"nomotemisi","nu nomotemisiti":"nomotemisi","nu nopta":"nopta","nu noptati":"nopta","nu norma":"norma","nu normaliza":"normaliza","nu normalizati":"normaliza","nu normati":"norma","nu noroci":"noroci","nu norociti":"noroci","nu nostimivisi":"nostimivisi","nu nostimivisiti":"nostimivisi","nu nostrifica":"nostrifica","nu nostrificati":"nostrifica","nu nota":"nota","nu notati":"nota","nu notifica":"notifica","nu notificati":"notifica","nu nova":"nova","nu novati":"nova","nu nuanta":"nuanța","nu nuantati":"nuanța","nu nucleariza":"nucleariza","nu nuclearizati":"nucleariza","nu nulifica":"nulifica","nu nulificati":"nulifica","nu numara":"număra","nu numarati":"număra","nu numeriza":"numeriza","nu numerizati":"numeriza","nu numerota":"numerota","nu numerotati":"numerota","nu numi":"numi","nu numiti":"numi","nu nunti":"nunti","nu nuntiti":"nunti","nu nutri":"nutri","nu nutrica":"nutrica","nu nutricati":"nutrica","nu nutriti":"nutri","nu obarsi":"obârși","nu obarsiti":"obârși","nu obicinui":"obicinui","nu obicinuiti":"obicinui","nu obiciui":"obiciui","nu obiciuiti":"obiciui","nu obicni":"obicni","nu obicniti":"obicni","nu obidi":"obidi","nu obiditi":"obidi","nu obiecta":"obiecta","nu obiectati":"obiecta","nu obiectifica":"obiectifica","nu obiectificati":"obiectifica","nu obiectiva":"obiectiva","nu obiectivati":"obiectiva","nu obiectiviza":"obiectiviza","nu obiectivizati":"obiectiviza","nu obijdui":"obijdui","nu obijduiti":"obijdui","nu obisnui":"obișnui","nu obisnuiti":"obișnui","nu obladui":"oblădui","nu obladuiti":"oblădui","nu oblici":"oblici","nu obliciti":"oblici","nu obliga":"obliga","nu obligati":"obliga","nu oblitera":"oblitera","nu obliterati":"oblitera","nu obloji":"obloji","nu oblojiti":"obloji","nu obloni":"obloni","nu obloniti":"obloni","nu obnubila":"obnubila","nu obnubilati":"obnubila","nu oborati":"oborî","nu obori":"oborî","nu obosi":"obosi","nu obositi":"obosi","nu obraci":"obrăci","nu obraciti":"obrăci","nu obranti":"obrânti","nu obrantiti":"obrânti","nu obraznici":"obrăznici","nu obrazniciti":"obrăznici","nu obrazui":"obrăzui","nu obrazuiti":"obrăzui","nu obrezui":"obrezui","nu obrezuiti":"obrezui","nu obrinti":"obrinti","nu obrintiti":"obrinti","nu obroci":"obroci","nu obrociti":"obroci","nu obscura":"obscura","nu obscurati":"obscura","nu obscuriza":"obscuriza","nu obscurizati":"obscuriza","nu obseda":"obseda","nu obsedati":"obseda","nu observa":"observa","nu observarisi":"observarisi","nu observarisiti":"observarisi","nu observati":"observa","nu obsti":"obști","nu obstina":"obstina","nu obstinati":"obstina","nu obstiti":"obști","nu obstrua":"obstrua","nu obstruati":"obstrua","nu obstructiona":"obstrucționa","nu obstructionati":"obstrucționa","nu obtine":"obține","nu obtineti":"obține","nu obtura":"obtura","nu obturati":"obtura","nu ocacai":"ocăcăi","nu ocacaiti":"ocăcăi","nu ocarati":"ocărî","nu ocari":["nu ocări","ocări","nu ocărî","ocărî"],"nu ocariti":"ocări","nu ocarmi":"ocârmi","nu ocarmiti":"ocârmi","nu ocarmui":"ocârmui","nu ocarmuiti":"ocârmui","nu ocaziona":"ocaziona","nu ocazionati":"ocaziona","nu occidentaliza":"occidentaliza","nu occidentalizati":"occidentaliza","nu ochi":"ochi","nu ochiti":"ochi","nu ocina":"ocina","nu ocinati":"ocina","nu ocni":"ocni","nu ocniti":"ocni","nu ocoli":"ocoli","nu ocoliti":"ocoli","nu ocropi":"ocropi","nu ocropiti":"ocropi","nu ocroti":"ocroti","nu ocrotiti":"ocroti","nu octroia":"octroia","nu octroiati":"octroia","nu oculta":"oculta","nu ocultati":"oculta","nu ocupa":"ocupa","nu ocuparisi":"ocuparisi","nu ocuparisiti":"ocuparisi","nu ocupati":"ocupa","nu odgoni":"odgoni","nu odgoniti":"odgoni","nu odihni":"odihni","nu odihniti":"odihni","nu odini":"odini","nu odiniti":"odini","nu odora":"odora","nu odorati":"odora","nu odoriza":"odoriza","nu odorizati":"odoriza","nu odrasli":"odrăsli","nu odrasliti":"odrăsli","nu ofensa":"ofensa","nu ofensati":"ofensa","nu oferi":"oferi","nu oferiti":"oferi","nu oferta":"oferta","nu ofertati":"oferta","nu oficia":"oficia","nu oficializa":"oficializa","nu oficializati":"oficializa","nu oficiati":"oficia","nu ofili":"ofili","nu ofiliti":"ofili","nu ofta":"ofta","nu oftati":"ofta","nu oftica":"oftica","nu ofticati":"oftica","nu ofusca":"ofusca","nu ofuscati":"ofusca","nu oglinda":"oglinda","nu oglindati":"oglinda","nu oglindi":"oglindi","nu oglinditi":"oglindi","nu ogodi":"ogodi","nu ogoditi":"ogodi","nu ogoia":"ogoia","nu ogoiati":"ogoia","nu ogorati":"ogorî","nu ogori":"ogorî","nu ojivoi":"ojivoi","nu ojivoiti":"ojivoi","nu olacai":"olăcăi","nu olacaiti":"olăcăi","nu olecai":"olecăi","nu olecaiti":"olecăi","nu oleia":"oleia","nu oleiati":"oleia","nu olicai":"olicăi","nu olicaiti":"olicăi","nu ologi":"ologi","nu ologiti":"ologi","nu omagia":"omagia","nu omagiati":"omagia","nu omeni":"omeni","nu omeniti":"omeni","nu omesti":"omesti","nu omestiti":"omesti","nu omite":"omite","nu omiteti":"omite","nu omogeneiza":"omogeneiza","nu omogeneizati":"omogeneiza","nu omogeniza":"omogeniza","nu omogenizati":"omogeniza","nu omologa":"omologa","nu omologati":"omologa","nu omorati":"omorî","nu omori":"omorî","nu omrazi":"omrăzi","nu omraziti":"omrăzi","nu ondula":"ondula","nu ondulati":"ondula","nu onora":"onora","nu onorati":"onora","nu opaci":"opăci","nu opacifia":"opacifia","nu opacifiati":"opacifia","nu opaciti":"opăci","nu opaciza":"opaciza","nu opacizati":"opaciza","nu opaliza":"opaliza","nu opalizati":"opaliza","nu opari":"opări","nu opariti":"opări","nu opera":"opera","nu operati":"opera","nu opina":"opina","nu opinati":"opina","nu opinti":"opinti","nu opintiti":"opinti","nu oplosi":"oploși","nu oplositi":"oploși","nu opri":"opri","nu oprima":"oprima","nu oprimati":"oprima","nu opriti":"opri","nu opta":"opta","nu optati":"opta","nu optimiza":"optimiza","nu optimizati":"optimiza","nu oracai":"orăcăi","nu oracaiti":"orăcăi","nu orandui":"orândui","nu oranduiti":"orândui","nu oraseniza":"orășeniza","nu orasenizati":"orășeniza","nu orbacai":"orbăcăi","nu orbacaiti":"orbăcăi","nu orbeca":"orbeca","nu orbecai":"orbecăi","nu orbecaiti":"orbecăi","nu orbecati":"orbeca","nu orbi":"orbi","nu orbiti":"orbi","nu orchestra":"orchestra","nu orchestrati":"orchestra","nu ordina":"ordina","nu ordinati":"ordina","nu ordona":"ordona","nu ordonanta":"ordonanța","nu ordonantati":"ordonanța","nu ordonati":"ordona","nu organisi":"organisi","nu organisiti":"organisi","nu organiza":"organiza","nu organizati":"organiza","nu orienta":"orienta","nu orientaliza":"orientaliza","nu orientalizati":"orientaliza","nu orientati":"orienta","nu oripila":"oripila","nu oripilati":"oripila","nu orizontaliza":"orizontaliza","nu orizontalizati":"orizontaliza","nu orna":"orna","nu ornamenta":"ornamenta","nu ornamentati":"ornamenta","nu ornati":"orna","nu oropsi":"oropsi","nu oropsiti":"oropsi","nu ortaci":"ortăci","nu ortaciti":"ortăci","nu ortografia":"ortografia","nu ortografiati":"ortografia","nu osambri":"osâmbri","nu osambriti":"osâmbri","nu osandi":"osândi","nu osanditi":"osândi","nu osardnici":"osârdnici","nu osardniciti":"osârdnici","nu oscila":"oscila","nu oscilati":"oscila","nu osebi":"osebi","nu osebiti":"osebi","nu osfestui":"osfeștui","nu osfestuiti":"osfeștui","nu osfinti":"osfinti","nu osfintiti":"osfinti","nu osifica":"osifica","nu osificati":"osifica","nu ospata":"ospăta","nu ospatati":"ospăta","nu ospeta":"ospeta","nu ospetati":"ospeta","nu ospita":"ospita","nu ospitati":"ospita","nu ostampi":"ostâmpi","nu ostampiti":"ostâmpi","nu osteni":"osteni","nu osteniti":"osteni","nu osti":"oști","nu ostiti":"oști","nu ostoi":"ostoi","nu ostoia":"ostoia","nu ostoiati":"ostoia","nu ostoiti":"ostoi","nu ostraciza":"ostraciza","nu ostracizati":"ostraciza","nu osveti":"osveti","nu osvetiti":"osveti","nu otanji":"otânji","nu otanjiti":"otânji","nu otarati":"oțărî","nu otari":["nu oțări","oțări","nu oțărî","oțărî"],"nu otariti":"oțări","nu otcarmui":"otcârmui","nu otcarmuiti":"otcârmui","nu oteli":"oțeli","nu oteliti":"oțeli","nu oterati":"oțerî","nu oteri":["nu oțeri","oțeri","nu oțerî","oțerî"],"nu oteriti":"oțeri","nu oteti":["nu oțeti","oțeti","nu oțeți","oțeți"],"nu otetiti":["nu oțetiți","oțeti","nu oțețiți","oțeți"],"nu otravi":"otrăvi","nu otraviti":"otrăvi","nu ovaliza":"ovaliza","nu ovalizati":"ovaliza","nu ovationa":"ovaționa","nu ovationati":"ovaționa","nu ovili":"ovili","nu oviliti":"ovili","nu oxida":"oxida","nu oxidati":"oxida","nu oxigena":"oxigena","nu oxigenati":"oxigena","nu ozona":"ozona","nu ozonati":"ozona","nu ozonifica":"ozonifica","nu ozonificati":"ozonifica","nu ozoniza":"ozoniza","nu ozonizati":"ozoniza","nu rabata":"rabata","nu rabatati":"rabata","nu rabda":"răbda","nu rabdati":"răbda","nu rablagi":["nu rablagi","rablagi","nu răblăgi","răblăgi"],"nu rablagiti":["nu rablagiți","rablagi","nu răblăgiți","răblăgi"],"nu raboji":"răboji","nu rabojiti":"răboji","nu rabota":"rabota","nu rabotati":"rabota","nu rabufni":"răbufni","nu rabufniti":"răbufni","nu racadui":"răcădui","nu racaduiti":"răcădui","nu racai":"râcâi","nu racaiti":"râcâi","nu racani":"răcăni","nu racaniti":"răcăni","nu raci":"răci","nu raciti":"răci","nu racla":"racla","nu raclati":"racla","nu racni":"răcni","nu racniti":"răcni","nu racola":"racola","nu racolati":"racola","nu raconta":"raconta","nu racontati":"raconta","nu racorda":"racorda","nu racordati":"racorda","nu racori":"răcori","nu racoriti":"răcori","nu rade":["nu rade","rade","nu râde","râde"],"nu radeti":["nu radeți","rade","nu râdeți","râde"],"nu radica":"rădica","nu radicaliza":"radicaliza","nu radicalizati":"radicaliza","nu radicati":"rădica","nu radiobaliza":"radiobaliza","nu radiobalizati":"radiobaliza","nu radiodifuza":"radiodifuza","nu radiodifuzati":"radiodifuza","nu radioghida":"radioghida","nu radioghidati":"radioghida","nu radiografia":"radiografia","nu radiografiati":"radiografia","nu radiotelegrafia":"radiotelegrafia","nu radiotelegrafiati":"radiotelegrafia","nu rafina":"rafina","nu rafinati":"rafina","nu rafistola":"rafistola","nu rafistolati":"rafistola","nu rafui":"răfui","nu rafuiti":"răfui","nu rage":"rage","nu rageti":"rage","nu ragi":"răgi","nu ragiti":"răgi","nu ragni":"răgni","nu ragniti":"răgni","nu ragusi":"răguși","nu ragusiti":"răguși","nu raiona":"raiona","nu raionati":"raiona","nu ralia":"ralia","nu raliati":"ralia","nu rama":["nu rama","rama","nu râma","râma"],"nu ramane":"rămâne","nu ramanea":"rămânea","nu ramaneti":["nu rămâneți","rămâne","nu rămâneți","rămânea"],"nu ramasi":"rămăși","nu ramasiti":"rămăși","nu ramati":["nu ramați","rama","nu râmați","râma"],"nu rambleia":"rambleia","nu rambleiati":"rambleia","nu rambursa":"rambursa","nu rambursati":"rambursa","nu ramifica":"ramifica","nu ramificati":"ramifica","nu ramni":"râmni","nu ramniti":"râmni","nu ramoli":"ramoli","nu ramoliti":"ramoli","nu ramplasa":"ramplasa","nu ramplasati":"ramplasa","nu ramuri":"rămuri","nu ramuriti":"rămuri","nu rancezi":"râncezi","nu ranceziti":"râncezi","nu rancheza":"râncheza","nu ranchezati":"râncheza","nu randomiza":"randomiza","nu randomizati":"randomiza","nu randui":"rândui","nu randuiti":"rândui","nu ranforsa":"ranforsa","nu ranforsati":"ranforsa","nu rani":["nu râni","râni","nu răni","răni"],"nu raniti":["nu râniți","râni","nu răniți","răni"],"nu ranji":"rânji","nu ranjiti":"rânji","nu ranversa":"ranversa","nu ranversati":"ranversa","nu rapai":"răpăi","nu rapaiti":"răpăi","nu rapega":"răpega","nu rapegati":"răpega","nu rapi":"răpi","nu rapiti":"răpi","nu raporta":"raporta","nu raportati":"raporta","nu raportui":"raportui","nu raportuiti":"raportui","nu raposa":"răposa","nu raposati":"răposa","nu rapsti":"răpști","nu rapstiti":"răpști","nu rapune":"răpune","nu rapuneti":"răpune","nu rarefia":"rarefia","nu rarefiati":"rarefia","nu rari":"rări","nu rarifica":"rarifica","nu rarificati":"rarifica","nu rariti":"rări","nu rasadi":"răsădi","nu rasaditi":"răsădi","nu rasajdui":"răsăjdui","nu rasajduiti":"răsăjdui","nu rasari":"răsări","nu rasariti":"răsări","nu rascacara":"răscăcăra","nu rascacarati":"răscăcăra","nu rascheta":"rașcheta","nu raschetati":"rașcheta","nu raschi":"răschi","nu raschia":"rășchia","nu raschiati":"rășchia","nu raschira":"răschira","nu raschirati":"răschira","nu raschiti":"răschi","nu rasciti":"răsciti","nu rascititi":"răsciti","nu rascoace":"răscoace","nu rascoaceti":"răscoace","nu rascoli":"răscoli","nu rascoliti":"răscoli","nu rascracana":"răscrăcăna","nu rascracanati":"răscrăcăna","nu rascula":"răscula","nu rasculati":"răscula","nu rascumpara":"răscumpăra","nu rascumparati":"răscumpăra","nu rasfata":"răsfăța","nu rasfatati":"răsfăța","nu rasfierbe":"răsfierbe","nu rasfierbeti":"răsfierbe","nu rasfira":"răsfira","nu rasfirati":"răsfira","nu rasfoi":"răsfoi","nu rasfoiti":"răsfoi","nu rasfrange":"răsfrânge","nu rasfrangeti":"răsfrânge","nu rasni":"râșni","nu rasniti":"râșni","nu rasoli":"rasoli","nu rasoliti":"rasoli","nu raspandi":"răspândi","nu raspanditi":"răspândi","nu raspica":"răspica","nu raspicati":"răspica","nu rasplati":"răsplăti","nu rasplatiti":"răsplăti","nu raspopi":"răspopi","nu raspopiti":"răspopi","nu raspunde":"răspunde","nu raspundeti":"răspunde","nu rassti":"răsști","nu rasstiti":"răsști","nu rastalmaci":"răstălmăci","nu rastalmaciti":"răstălmăci","nu rasti":"răsti","nu rastigni":"răstigni","nu rastigniti":"răstigni","nu rastiti":"răsti","nu rastoci":"răstoci","nu rastociti":"răstoci","nu rasturna":"răsturna","nu rasturnati":"răsturna","nu rasuci":"răsuci","nu rasuciti":"răsuci","nu rasufla":"răsufla","nu rasuflati":"răsufla","nu rasui":"râsui","nu rasuiti":"râsui","nu rasuna":"răsuna","nu rasunati":"răsuna","nu rasvari":"răsvări","nu rasvariti":"răsvări","nu raszice":"răszice","nu rasziceti":"răszice","nu rata":"rata","nu rataci":"rătăci","nu rataciti":"rătăci","nu ratati":"rata","nu ratifica":"ratifica","nu ratificati":"ratifica","nu rationa":"raționa","nu rationaliza":"raționaliza","nu rationalizati":"raționaliza","nu rationati":"raționa","nu ratunji":"rătunji","nu ratunjiti":"rătunji","nu ratuti":"rătuti","nu ratutiti":"rătuti","nu raura":"râura","nu raurati":"râura","nu rauri":"râuri","nu rauriti":"râuri","nu rautati":"răutăți","nu rautatiti":"răutăți","nu ravasi":"răvăși","nu ravasiti":"răvăși","nu ravni":"râvni","nu ravniti":"râvni","nu razalui":"răzălui","nu razaluiti":"răzălui","nu razbi":"răzbi","nu razbiti":"răzbi","nu razboi":"război","nu razboiti":"război","nu razboli":"războli","nu razboliti":"războli","nu razboteza":"războteza","nu razbotezati":"războteza","nu razbuna":"răzbuna","nu razbunati":"răzbuna","nu razdrusi":"răzdruși","nu razdrusiti":"răzdruși","nu razgaia":["nu râzgâia","râzgâia","nu răzgâia","răzgâia"],"nu razgaiati":["nu râzgâiați","râzgâia","nu răzgâiați","răzgâia"],"nu razgandi":"răzgândi","nu razganditi":"răzgândi","nu razi":"răzi","nu razima":"răzima","nu razimati":"răzima","nu raziti":"răzi","nu razleti":"răzleți","nu razletiti":"răzleți","nu razni":"răzni","nu razniti":"răzni","nu razori":"răzori","nu razoriti":"răzori","nu razui":"răzui","nu razuiti":"răzui","nu razvesti":"răzvesti","nu razvestiti":"răzvesti","nu razvrati":"răzvrăti","nu razvratiti":"răzvrăti","nu reabilita":"reabilita","nu reabilitati":"reabilita","nu reabona":"reabona","nu reabonati":"reabona","nu reaborda":"reaborda","nu reabordati":"reaborda","nu reaclimatiza":"reaclimatiza","nu reaclimatizati":"reaclimatiza","nu reacoperi":"reacoperi","nu reacoperiti":"reacoperi","nu reacorda":"reacorda","nu reacordati":"reacorda","nu reactiona":"reacționa","nu reactionati":"reacționa","nu reactiva":"reactiva","nu reactivati":"reactiva","nu reactualiza":"reactualiza","nu reactualizati":"reactualiza","nu reacumula":"reacumula","nu reacumulati":"reacumula","nu readapta":"readapta","nu readaptati":"readapta","nu readmite":"readmite","nu readmiteti":"readmite","nu readmonesta":"readmonesta","nu readmonestati":"readmonesta","nu readormi":"readormi","nu readormiti":"readormi","nu readuce":"readuce","nu readuceti":"readuce","nu readuna":"readuna","nu readunati":"readuna","nu reaerisi":"reaerisi","nu reaerisiti":"reaerisi","nu reafirma":"reafirma","nu reafirmati":"reafirma","nu reafla":"reafla","nu reaflati":"reafla","nu reagrava":"reagrava","nu reagravati":"reagrava","nu reajunge":"reajunge","nu reajungeti":"reajunge","nu reajusta":"reajusta","nu reajustati":"reajusta","nu realege":"realege","nu realegeti":"realege","nu realimenta":"realimenta","nu realimentati":"realimenta","nu realinia":"realinia","nu realiniati":"realinia","nu realipi":"realipi","nu realipiti":"realipi","nu realiza":"realiza","nu realizati":"realiza","nu realta":"realța","nu realtati":"realța","nu realtoi":"realtoi","nu realtoiti":"realtoi","nu reambala":"reambala","nu reambalati":"reambala","nu reambarca":"reambarca","nu reambarcati":"reambarca","nu reamenaja":"reamenaja","nu reamenajati":"reamenaja","nu reaminti":"reaminti","nu reamintiti":"reaminti","nu reamplasa":"reamplasa","nu reamplasati":"reamplasa","nu reamputa":"reamputa","nu reamputati":"reamputa","nu reanaliza":"reanaliza","nu reanalizati":"reanaliza","nu reangaja":"reangaja","nu reangajati":"reangaja","nu reanima":"reanima","nu reanimati":"reanima","nu reaparea":"reapărea","nu reapareti":"reapărea","nu reaprinde":"reaprinde","nu reaprindeti":"reaprinde","nu reaproviziona":"reaproviziona","nu reaprovizionati":"reaproviziona","nu reapuca":"reapuca","nu reapucati":"reapuca","nu rearanja":"rearanja","nu rearanjati":"rearanja","nu rearbitra":"rearbitra","nu rearbitrati":"rearbitra","nu rearenda":"rearenda","nu rearendati":"rearenda","nu rearginta":"rearginta","nu reargintati":"rearginta","nu rearma":"rearma","nu rearmati":"rearma","nu reasculta":"reasculta","nu reascultati":"reasculta","nu reaseza":"reașeza","nu reasezati":"reașeza","nu reasigura":"reasigura","nu reasigurati":"reasigura","nu reasocia":"reasocia","nu reasociati":"reasocia","nu reatata":"reațâța","nu reatatati":"reațâța","nu reatribui":"reatribui","nu reatribuiti":"reatribui","nu reaudia":"reaudia","nu reaudiati":"reaudia","nu reauzi":"reauzi","nu reauziti":"reauzi","nu rebandaja":"rebandaja","nu rebandajati":"rebandaja","nu rebate":"rebate","nu rebateti":"rebate","nu reboteza":"reboteza","nu rebotezati":"reboteza","nu rebuta":"rebuta","nu rebutati":"rebuta","nu recadea":"recădea","nu recadeti":"recădea","nu recalcula":"recalcula","nu recalculati":"recalcula","nu recalibra":"recalibra","nu recalibrati":"recalibra","nu recalifica":"recalifica","nu recalificati":"recalifica","nu recalota":"recalota","nu recalotati":"recalota","nu recantari":"recântări","nu recantariti":"recântări","nu recapata":"recăpăta","nu recapatati":"recăpăta","nu recapitula":"recapitula","nu recapitulati":"recapitula","nu recarbura":"recarbura","nu recarburati":"recarbura","nu recasatori":"recăsători","nu recasatoriti":"recăsători","nu recastiga":"recâștiga","nu recastigati":"recâștiga","nu recategorisi":"recategorisi","nu recategorisiti":"recategorisi","nu receda":"receda","nu recedati":"receda","nu recela":"recela","nu recelati":"recela","nu recenza":"recenza","nu recenzati":"recenza","nu recepe":"recepe","nu recepeti":"recepe","nu receptiona":"recepționa","nu receptionati":"recepționa","nu recerceta":"recerceta","nu recercetati":"recerceta","nu rechema":"rechema","nu rechemati":"rechema","nu rechizitiona":"rechiziționa","nu rechizitionati":"rechiziționa","nu recicla":"recicla","nu reciclati":"recicla","nu recidiva":"recidiva","nu recidivati":"recidiva","nu recircula":"recircula","nu recirculati":"recircula","nu recita":"recita","nu recitati":"recita","nu reciti":"reciti","nu recititi":"reciti","nu recladi":"reclădi","nu recladiti":"reclădi","nu reclama":"reclama","nu reclamati":"reclama","nu reclasa":"reclasa","nu reclasati":"reclasa","nu reclasifica":"reclasifica","nu reclasificati":"reclasifica","nu recoace":"recoace","nu recoaceti":"recoace","nu recoborati":"recoborî","nu recobori":"recoborî","nu recoloniza":"recoloniza","nu recolonizati":"recoloniza","nu recolora":"recolora","nu recolorati":"recolora","nu recolta":"recolta","nu recoltati":"recolta","nu recomanda":"recomanda","nu recomandati":"recomanda","nu recombina":"recombina","nu recombinati":"recombina","nu recomenta":"recomenta","nu recomentati":"recomenta","nu recompartimenta":"recompartimenta","nu recompartimentati":"recompartimenta","nu recompensa":"recompensa","nu recompensati":"recompensa","nu recomprima":"recomprima","nu recomprimati":"recomprima","nu recompune":"recompune","nu recompuneti":"recompune","nu reconditiona":"recondiționa","nu reconditionati":"recondiționa","nu reconfigura":"reconfigura","nu reconfigurati":"reconfigura","nu reconfirma":"reconfirma","nu reconfirmati":"reconfirma","nu reconforta":"reconforta","nu reconfortati":"reconforta","nu reconsidera":"reconsidera","nu reconsiderati":"reconsidera","nu reconsolida":"reconsolida","nu reconsolidati":"reconsolida","nu reconstitui":"reconstitui","nu reconstituiti":"reconstitui","nu reconstrui":"reconstrui","nu reconstruiti":"reconstrui","nu reconverti":"reconverti","nu reconvertiti":"reconverti","nu reconvoca":"reconvoca","nu reconvocati":"reconvoca","nu recopia":"recopia","nu recopiati":"recopia","nu recrea":"recrea","nu recreati":"recrea","nu recrimina":"recrimina","nu recriminati":"recrimina","nu recroma":"recroma","nu recromati":"recroma","nu recruta":"recruta","nu recrutati":"recruta","nu rectalui":"rectălui","nu rectaluiti":"rectălui","nu rectifica":"rectifica","nu rectificati":"rectifica","nu recuceri":"recuceri","nu recuceriti":"recuceri","nu recula":"recula","nu reculati":"recula","nu reculege":"reculege","nu reculegeti":"reculege","nu recunoaste":"recunoaște","nu recunoasteti":"recunoaște","nu recupera":"recupera","nu recuperati":"recupera","nu recurba":"recurba","nu recurbati":"recurba","nu recurge":"recurge","nu recurgeti":"recurge","nu recuza":"recuza","nu recuzati":"recuza","nu reda":"reda","nu redacta":"redacta","nu redactati":"redacta","nu redarui":"redărui","nu redaruiti":"redărui","nu redata":"redata","nu redatati":"redata","nu redati":"reda","nu redefini":"redefini","nu redefiniti":"redefini","nu redeschide":"redeschide","nu redeschideti":"redeschide","nu redescoperi":"redescoperi","nu redescoperiti":"redescoperi","nu redestepta":"redeștepta","nu redesteptati":"redeștepta","nu redeveni":"redeveni","nu redeveniti":"redeveni","nu redija":"redija","nu redijati":"redija","nu redimensiona":"redimensiona","nu redimensionati":"redimensiona","nu rediscuta":"rediscuta","nu rediscutati":"rediscuta","nu redisparea":"redispărea","nu redispareti":"redispărea","nu redistila":"redistila","nu redistilati":"redistila","nu redistribui":"redistribui","nu redistribuiti":"redistribui","nu redizolva":"redizolva","nu redizolvati":"redizolva","nu redobandi":"redobândi","nu redobanditi":"redobândi","nu redresa":"redresa","nu redresati":"redresa","nu reduce":"reduce","nu reduceti":"reduce","nu reduplica":"reduplica","nu reduplicati":"reduplica","nu reechilibra":"reechilibra","nu reechilibrati":"reechilibra","nu reedifica":"reedifica","nu reedificati":"reedifica","nu reedita":"reedita","nu reeditati":"reedita","nu reeduca":"reeduca","nu reeducati":"reeduca","nu reesalona":"reeșalona","nu reesalonati":"reeșalona","nu reevalua":"reevalua","nu reevaluati":"reevalua","nu reexamina":"reexamina","nu reexaminati":"reexamina","nu reexpedia":"reexpedia","nu reexpediati":"reexpedia","nu reexporta":"reexporta","nu reexportati":"reexporta","nu reface":"reface","nu refaceti":"reface","nu refeca":"refeca","nu refecati":"refeca","nu refera":"refera","nu referati":"refera","nu referi":"referi","nu referiti":"referi","nu refierbe":"refierbe","nu refierbeti":"refierbe","nu reflecta":"reflecta","nu reflectati":"reflecta","nu refolosi":"refolosi","nu refolositi":"refolosi","nu reforja":"reforja","nu reforjati":"reforja","nu reforma":"reforma","nu reformati":"reforma","nu reformula":"reformula","nu reformulati":"reformula","nu refracta":"refracta","nu refractati":"refracta","nu refrigera":"refrigera","nu refrigerati":"refrigera","nu refrisa":"refrișa","nu refrisati":"refrișa","nu refrunta":"refrunta","nu refruntati":"refrunta","nu refugi":"refugi","nu refugia":"refugia","nu refugiati":"refugia","nu refugiti":"refugi","nu refula":"refula","nu refulati":"refula","nu refuta":"refuta","nu refutati":"refuta","nu refuza":"refuza","nu refuzati":"refuza","nu regala":"regala","nu regalati":"regala","nu regandi":"regândi","nu reganditi":"regândi","nu regasi":"regăsi","nu regasiti":"regăsi","nu regenera":"regenera","nu regenerati":"regenera","nu regiza":"regiza","nu regizati":"regiza","nu regla":"regla","nu reglati":"regla","nu reglementa":"reglementa","nu reglementati":"reglementa","nu regrada":"regrada","nu regradati":"regrada","nu regresa":"regresa","nu regresati":"regresa","nu regreta":"regreta","nu regretati":"regreta","nu regrupa":"regrupa","nu regrupati":"regrupa","nu regula":"regula","nu regulamenta":"regulamenta","nu regulamentati":"regulamenta","nu regularisi":"regularisi","nu regularisiti":"regularisi","nu regulariza":"regulariza","nu regularizati":"regulariza","nu regulati":"regula","nu regurgita":"regurgita","nu regurgitati":"regurgita","nu reiepta":"reiepta","nu reieptati":"reiepta","nu reiesi":"reieși","nu reiesiti":"reieși","nu reimbarbata":"reîmbărbăta","nu reimbarbatati":"reîmbărbăta","nu reimpaca":"reîmpăca","nu reimpacati":"reîmpăca","nu reimpaduri":"reîmpăduri","nu reimpaduriti":"reîmpăduri","nu reimparti":"reîmpărți","nu reimpartiti":"reîmpărți","nu reimporta":"reimporta","nu reimportati":"reimporta","nu reimpreuna":"reîmpreuna","nu reimpreunati":"reîmpreuna","nu reimprieteni":"reîmprieteni","nu reimprieteniti":"reîmprieteni","nu reimprima":"reimprima","nu reimprimati":"reimprima","nu reimprospata":"reîmprospăta","nu reimprospatati":"reîmprospăta","nu reimprumuta":"reîmprumuta","nu reimprumutati":"reîmprumuta","nu reinalta":"reînălța","nu reinaltati":"reînălța","nu reinarma":"reînarma","nu reinarmati":"reînarma","nu reincalzi":"reîncălzi","nu reincalziti":"reîncălzi","nu reincarca":"reîncărca","nu reincarcati":"reîncărca","nu reincarna":["nu reincarna","reincarna","nu reîncarna","reîncarna"],"nu reincarnati":["nu reincarnați","reincarna","nu reîncarnați","reîncarna"],"nu reincepe":"reîncepe","nu reincepeti":"reîncepe","nu reinchide":"reînchide","nu reinchideti":"reînchide","nu reinchiria":"reînchiria","nu reinchiriati":"reînchiria","nu reincolti":"reîncolți","nu reincoltiti":"reîncolți","nu reincorpora":"reîncorpora","nu reincorporati":"reîncorpora","nu reindoi":"reîndoi","nu reindoiti":"reîndoi","nu reindrepta":"reîndrepta","nu reindreptati":"reîndrepta","nu reindruma":"reîndruma","nu reindrumati":"reîndruma","nu reinfecta":"reinfecta","nu reinfectati":"reinfecta","nu reinfiinta":"reînființa","nu reinfiintati":"reînființa","nu reinflori":"reînflori","nu reinfloriti":"reînflori","nu reinmatricula":"reînmatricula","nu reinmatriculati":"reînmatricula","nu reinnoda":"reînnoda","nu reinnodati":"reînnoda","nu reinnoi":"reînnoi","nu reinnoiti":"reînnoi","nu reinsamanta":"reînsămânța","nu reinsamantati":"reînsămânța","nu reinsanatosi":"reînsănătoși","nu reinsanatositi":"reînsănătoși","nu reinscauna":"reînscăuna","nu reinscaunati":"reînscăuna","nu reinstala":"reinstala","nu reinstalati":"reinstala","nu reinstaura":"reinstaura","nu reinstaurati":"reinstaura","nu reinsufleti":"reînsufleți","nu reinsufletiti":"reînsufleți","nu reinsuruba":"reînșuruba","nu reinsurubati":"reînșuruba","nu reintalni":"reîntâlni","nu reintalniti":"reîntâlni","nu reintampina":"reîntâmpina","nu reintampinati":"reîntâmpina","nu reintari":"reîntări","nu reintariti":"reîntări","nu reintarzia":"reîntârzia","nu reintarziati":"reîntârzia","nu reintegra":"reintegra","nu reintegrati":"reintegra","nu reintemeia":"reîntemeia","nu reintemeiati":"reîntemeia","nu reinteroga":"reinteroga","nu reinterogati":"reinteroga","nu reinterpreta":"reinterpreta","nu reinterpretati":"reinterpreta","nu reintineri":"reîntineri","nu reintineriti":"reîntineri","nu reintoarce":"reîntoarce","nu reintoarceti":"reîntoarce","nu reintra":["nu reintra","reintra","nu reîntra","reîntra"],"nu reintrati":["nu reintrați","reintra","nu reîntrați","reîntra"],"nu reintregi":"reîntregi","nu reintregiti":"reîntregi","nu reintroduce":"reintroduce","nu reintroduceti":"reintroduce","nu reintrona":"reîntrona","nu reintronati":"reîntrona","nu reintrupa":"reîntrupa","nu reintrupati":"reîntrupa","nu reinturna":"reînturna","nu reinturnati":"reînturna","nu reinventaria":"reinventaria","nu reinventariati":"reinventaria","nu reinverzi":"reînverzi","nu reinverziti":"reînverzi","nu reinvesti":"reinvesti","nu reinvestiti":"reinvesti","nu reinvia":"reînvia","nu reinviati":"reînvia","nu reinvita":"reinvita","nu reinvitati":"reinvita","nu reitera":"reitera","nu reiterati":"reitera","nu reivi":"reivi","nu reiviti":"reivi","nu reizbi":"reizbi","nu reizbiti":"reizbi","nu reizbucni":"reizbucni","nu reizbucniti":"reizbucni","nu rejuca":"rejuca","nu rejucati":"rejuca","nu rejudeca":"rejudeca","nu rejudecati":"rejudeca","nu relansa":"relansa","nu relansati":"relansa","nu relata":"relata","nu relatati":"relata","nu relationa":"relaționa","nu relationati":"relaționa","nu relativiza":"relativiza","nu relativizati":"relativiza","nu relaxa":"relaxa","nu relaxati":"relaxa","nu relega":"relega","nu relegati":"relega","nu releva":"releva","nu relevati":"releva","nu reliefa":"reliefa","nu reliefati":"reliefa","nu relua":"relua","nu reluati":"relua","nu remaia":"remaia","nu remaiati":"remaia","nu remania":"remania","nu remaniati":"remania","nu remarca":"remarca","nu remarcati":"remarca","nu remarita":"remărita","nu remaritati":"remărita","nu remasura":"remăsura","nu remasurati":"remăsura","nu remedia":"remedia","nu remediati":"remedia","nu rememora":"rememora","nu rememorati":"rememora","nu remilitariza":"remilitariza","nu remilitarizati":"remilitariza","nu remineraliza":"remineraliza","nu remineralizati":"remineraliza","nu remite":"remite","nu remiteti":"remite","nu remiza":"remiza","nu remizati":"remiza","nu remobila":"remobila","nu remobilati":"remobila","nu remodela":"remodela","nu remodelati":"remodela","nu remorca":"remorca","nu remorcati":"remorca","nu remunera":"remunera","nu remunerati":"remunera","nu renaste":"renaște","nu renasteti":"renaște","nu renega":"renega","nu renegati":"renega","nu renegocia":"renegocia","nu renegociati":"renegocia","nu renivela":"renivela","nu renivelati":"renivela","nu renova":"renova","nu renovati":"renova","nu renta":"renta","nu rentabiliza":"rentabiliza","nu rentabilizati":"rentabiliza","nu rentati":"renta","nu renumara":"renumăra","nu renumarati":"renumăra","nu renunta":"renunța","nu renuntati":"renunța","nu reocupa":"reocupa","nu reocupati":"reocupa","nu reoglindi":"reoglindi","nu reoglinditi":"reoglindi","nu reorandui":"reorândui","nu reoranduiti":"reorândui","nu reorchestra":"reorchestra","nu reorchestrati":"reorchestra","nu reordona":"reordona","nu reordonati":"reordona","nu reorganiza":"reorganiza","nu reorganizati":"reorganiza","nu reorienta":"reorienta","nu reorientati":"reorienta","nu repagina":"repagina","nu repaginati":"repagina","nu repara":"repara","nu reparati":"repara","nu repartiza":"repartiza","nu repartizati":"repartiza","nu repatria":"repatria","nu repatriati":"repatria","nu repauza":"repauza","nu repauzati":"repauza","nu repera":"repera","nu reperati":"repera","nu repercuta":"repercuta","nu repercutati":"repercuta","nu repertoriza":"repertoriza","nu repertorizati":"repertoriza","nu repeta":"repeta","nu repetati":"repeta","nu repeti":"repeți","nu repetiti":"repeți","nu repezi":"repezi","nu repeziti":"repezi","nu replamadi":"replămădi","nu replamaditi":"replămădi","nu replanta":"replanta","nu replantati":"replanta","nu replica":"replica","nu replicati":"replica","nu repopora":"repopora","nu repoporati":"repopora","nu repopula":"repopula","nu repopulati":"repopula","nu reporta":"reporta","nu reportati":"reporta","nu repovesti":"repovesti","nu repovestiti":"repovesti","nu repoza":"repoza","nu repozati":"repoza","nu reprezenta":"reprezenta","nu reprezentati":"reprezenta","nu reprima":"reprima","nu reprimati":"reprima","nu reprimi":"reprimi","nu reprimiti":"reprimi","nu reprivatiza":"reprivatiza","nu reprivatizati":"reprivatiza","nu reproba":"reproba","nu reprobati":"reproba","nu reproduce":"reproduce","nu reproduceti":"reproduce","nu reprofila":"reprofila","nu reprofilati":"reprofila","nu reprograma":"reprograma","nu reprogramati":"reprograma","nu reprosa":"reproșa","nu reprosati":"reproșa","nu republica":"republica","nu republicati":"republica","nu repudia":"repudia","nu repudiati":"repudia","nu repugna":"repugna","nu repugnati":"repugna","nu repune":"repune","nu repuneti":"repune","nu repurta":"repurta","nu repurtati":"repurta","nu reputa":"reputa","nu reputati":"reputa","nu resapa":"reșapa","nu resapati":"reșapa","nu resarja":"reșarja","nu resarjati":"reșarja","nu rescrie":"rescrie","nu rescrieti":"rescrie","nu resedea":"reședea","nu resedeti":"reședea","nu resemna":"resemna","nu resemnati":"resemna","nu reseta":"reseta","nu resetati":"reseta","nu resfira":"resfira","nu resfirati":"resfira","nu resigna":"resigna","nu resignati":"resigna","nu resimti":"resimți","nu resimtiti":"resimți","nu resofta":"resofta","nu resoftati":"resofta","nu resorbi":"resorbi","nu resorbiti":"resorbi","nu respecta":"respecta","nu respectalui":"respectălui","nu respectaluiti":"respectălui","nu respectati":"respecta","nu respectui":"respectui","nu respectuiti":"respectui","nu respinge":"respinge","nu respingeti":"respinge","nu respira":"respira","nu respirati":"respira","nu responsabiliza":"responsabiliza","nu responsabilizati":"responsabiliza","nu restabili":"restabili","nu restabiliti":"restabili","nu restaura":"restaura","nu restaurati":"restaura","nu resti":"resti","nu restiti":"resti","nu restitui":"restitui","nu restituiti":"restitui","nu restrange":"restrânge","nu restrangeti":"restrânge","nu restructura":"restructura","nu restructurati":"restructura","nu resuscita":"resuscita","nu resuscitati":"resuscita","nu retaia":"retăia","nu retaiati":"retăia","nu retalmaci":"retălmăci","nu retalmaciti":"retălmăci","nu retarda":"retarda","nu retardati":"retarda","nu reteza":"reteza","nu retezati":"reteza","nu retine":"reține","nu retineti":"reține","nu retipari":"retipări","nu retipariti":"retipări","nu retopi":"retopi","nu retopiti":"retopi","nu retracta":"retracta","nu retractati":"retracta","nu retraduce":"retraduce","nu retraduceti":"retraduce","nu retrage":"retrage","nu retrageti":"retrage","nu retrai":"retrăi","nu retraiti":"retrăi","nu retranscrie":"retranscrie","nu retranscrieti":"retranscrie","nu retransmite":"retransmite","nu retransmiteti":"retransmite","nu retribui":"retribui","nu retribuiti":"retribui","nu retrimite":"retrimite","nu retrimiteti":"retrimite","nu retroceda":"retroceda","nu retrocedati":"retroceda","nu retrograda":"retrograda","nu retrogradati":"retrograda","nu returna":"returna","nu returnati":"returna","nu retusa":"retușa","nu retusati":"retușa","nu reumfla":"reumfla","nu reumflati":"reumfla","nu reumple":"reumple","nu reumpleti":"reumple","nu reuni":"reuni","nu reunifica":"reunifica","nu reunificati":"reunifica","nu reuniti":"reuni","nu reusi":"reuși","nu reusiti":"reuși","nu reutila":"reutila","nu reutilati":"reutila","nu revaccina":"revaccina","nu revaccinati":"revaccina","nu revalida":"revalida","nu revalidati":"revalida","nu revaloriza":"revaloriza","nu revalorizati":"revaloriza","nu revansa":"revanșa","nu revansati":"revanșa","nu revarsa":"revărsa","nu revarsati":"revărsa","nu revedea":"revedea","nu revedeti":"revedea","nu revela":"revela","nu revelati":"revela","nu revendica":"revendica","nu revendicati":"revendica","nu reveni":"reveni","nu reveniti":"reveni","nu reverbera":"reverbera","nu reverberati":"reverbera","nu revigora":"revigora","nu revigorati":"revigora","nu revinde":"revinde","nu revindeti":"revinde","nu revitaliza":"revitaliza","nu revitalizati":"revitaliza","nu revizui":"revizui","nu revizuiti":"revizui","nu revoca":"revoca","nu revocati":"revoca","nu revolta":"revolta","nu revoltati":"revolta","nu revolutiona":"revoluționa","nu revolutionariza":"revoluționariza","nu revolutionarizati":"revoluționariza","nu revolutionati":"revoluționa","nu revopsi":"revopsi","nu revopsiti":"revopsi","nu rezambi":"rezâmbi","nu rezambiti":"rezâmbi","nu rezeca":"rezeca","nu rezecati":"rezeca","nu rezema":"rezema","nu rezemati":"rezema","nu rezerva":"rezerva","nu rezervati":"rezerva","nu rezice":"rezice","nu reziceti":"rezice","nu rezida":"rezida","nu rezidati":"rezida","nu rezidi":"rezidi","nu reziditi":"rezidi","nu rezilia":"rezilia","nu reziliati":"rezilia","nu rezina":"rezina","nu rezinati":"rezina","nu rezinifica":"rezinifica","nu rezinificati":"rezinifica","nu rezista":"rezista","nu rezistati":"rezista","nu rezolva":"rezolva","nu rezolvati":"rezolva","nu rezolvirui":"rezolvirui","nu rezolviruiti":"rezolvirui","nu rezona":"rezona","nu rezonati":"rezona","nu rezuma":"rezuma","nu rezumati":"rezuma","nu ricana":"ricana","nu ricanati":"ricana","nu ricosa":"ricoșa","nu ricosati":"ricoșa","nu rida":"rida","nu ridati":"rida","nu ridica":"ridica","nu ridicati":"ridica","nu ridiculiza":"ridiculiza","nu ridiculizati":"ridiculiza","nu rigidiza":"rigidiza","nu rigidizati":"rigidiza","nu rima":"rima","nu rimati":"rima","nu rimbomba":"rimbomba","nu rimbombati":"rimbomba","nu rimela":"rimela","nu rimelati":"rimela","nu rindela":"rindela","nu rindelati":"rindela","nu rindelui":"rindelui","nu rindeluiti":"rindelui","nu rinoceriza":"rinoceriza","nu rinocerizati":"rinoceriza","nu riposta":"riposta","nu ripostati":"riposta","nu risca":"risca","nu riscati":"risca","nu risipi":"risipi","nu risipiti":"risipi","nu ritma":"ritma","nu ritmati":"ritma","nu ritorisi":"ritorisi","nu ritorisiti":"ritorisi","nu ritualiza":"ritualiza","nu ritualizati":"ritualiza","nu rivaliza":"rivaliza","nu rivalizati":"rivaliza","nu roade":"roade","nu roadeti":"roade","nu robi":"robi","nu robiti":"robi","nu roboti":"roboti","nu robotiti":"roboti","nu robotiza":"robotiza","nu robotizati":"robotiza","nu rodi":"rodi","nu roditi":"rodi","nu rodnici":"rodnici","nu rodniciti":"rodnici","nu romani":"români","nu romaniti":"români","nu romaniza":["nu romaniza","romaniza","nu româniza","româniza"],"nu romanizati":["nu romanizați","romaniza","nu românizați","româniza"],"nu romanta":"romanța","nu romantati":"romanța","nu ronja":"ronja","nu ronjati":"ronja","nu rontai":"ronțăi","nu rontaiti":"ronțăi","nu rosi":"roși","nu rositi":"roși","nu rosti":"rosti","nu rostiti":"rosti","nu rostogoli":"rostogoli","nu rostogoliti":"rostogoli","nu rostui":"rostui","nu rostuiti":"rostui","nu rota":"rota","nu rotaciza":"rotaciza","nu rotacizati":"rotaciza","nu rotati":"rota","nu roti":"roti","nu rotiti":"roti","nu rotocoli":"rotocoli","nu rotocoliti":"rotocoli","nu rotunji":"rotunji","nu rotunjiti":"rotunji","nu rotunzi":"rotunzi","nu rotunziti":"rotunzi","nu roua":"roua","nu rouati":"roua","nu rudi":"rudi","nu ruditi":"rudi","nu ruga":"ruga","nu rugati":"ruga","nu rugi":"rugi","nu rugini":"rugini","nu ruginiti":"rugini","nu rugiti":"rugi","nu ruina":"ruina","nu ruinati":"ruina","nu ruja":"ruja","nu rujati":"ruja","nu rula":"rula","nu rulati":"rula","nu rumega":"rumega","nu rumegati":"rumega","nu rumeni":"rumeni","nu rumeniti":"rumeni","nu rumpe":"rumpe","nu rumpeti":"rumpe","nu rupe":"rupe","nu rupeti":"rupe","nu ruraliza":"ruraliza","nu ruralizati":"ruraliza","nu rusifica":"rusifica","nu rusificati":"rusifica","nu rusina":"rușina","nu rusinati":"rușina","nu rusticiza":"rusticiza","nu rusticizati":"rusticiza","nu rutina":"rutina","nu rutinati":"rutina","nu tabaci":"tăbăci","nu tabaciti":"tăbăci","nu tabarati":"tăbărî","nu tabarci":"tăbârci","nu tabarciti":"tăbârci","nu tabari":"tăbărî","nu tabela":"tabela","nu tabelati":"tabela","nu tablui":"tăblui","nu tabluiti":"tăblui","nu tacai":["nu tâcâi","tâcâi","nu tăcăi","tăcăi"],"nu tacaiti":["nu tâcâiți","tâcâi","nu tăcăiți","tăcăi"],"nu tacani":"țăcăni","nu tacaniti":"țăcăni"};
@@ -0,0 +1 @@
+export default {"nu tacea":"tăcea","nu taceti":"tăcea","nu tachina":"tachina","nu tachinati":"tachina","nu taciuna":"tăciuna","nu taciunati":"tăciuna","nu tacta":"tacta","nu tactati":"tacta","nu tafni":"țâfni","nu tafniti":"țâfni","nu tagadui":"tăgădui","nu tagaduiti":"tăgădui","nu taia":"tăia","nu taiati":"tăia","nu taifasui":"tăifăsui","nu taifasuiti":"tăifăsui","nu tainui":"tăinui","nu tainuiti":"tăinui","nu talalai":"tălălăi","nu talalaiti":"tălălăi","nu talasmani":"tălășmăni","nu talasmaniti":"tălășmăni","nu talcui":"tâlcui","nu talcuiti":"tâlcui","nu talhari":"tâlhări","nu talhariti":"tâlhări","nu talhui":"tâlhui","nu talhuiti":"tâlhui","nu talmaci":"tălmăci","nu talmaciti":"tălmăci","nu tamadui":"tămădui","nu tamaduiti":"tămădui","nu tamaia":"tămâia","nu tamaiati":"tămâia","nu tamburina":"tamburina","nu tamburinati":"tamburina","nu tampi":"tâmpi","nu tampina":"tâmpina","nu tampinati":"tâmpina","nu tampiti":"tâmpi","nu tampona":"tampona","nu tamponati":"tampona","nu tandali":"tândăli","nu tandaliti":"tândăli","nu tandari":"țăndări","nu tandariti":"țăndări","nu tanga":"tanga","nu tangati":"tanga","nu tangui":"tângui","nu tanguiti":"tângui","nu taniza":"taniza","nu tanizati":"taniza","nu tanji":"tânji","nu tanjiti":"tânji","nu tapa":["nu tapa","tapa","nu țâpa","țâpa"],"nu tapati":["nu tapați","tapa","nu țâpați","țâpa"],"nu tapeta":"tapeta","nu tapetati":"tapeta","nu tapisa":"tapisa","nu tapisati":"tapisa","nu tapita":"tapița","nu tapitati":"tapița","nu tapota":"tapota","nu tapotati":"tapota","nu tapuri":"țâpuri","nu tapuriti":"țâpuri","nu taragai":"tărăgăi","nu taragaia":"tărăgăia","nu taragaiati":"tărăgăia","nu taragaiti":"tărăgăi","nu taragana":"tărăgăna","nu taraganati":"tărăgăna","nu taragani":"tărăgăni","nu taraganiti":"tărăgăni","nu tarai":["nu târâi","târâi","nu țârâi","țârâi"],"nu taraiti":["nu târâiți","târâi","nu țârâiți","țârâi"],"nu tarati":"târî","nu tarbaci":"tărbăci","nu tarbaciti":"tărbăci","nu tarcai":"țârcâi","nu tarcaiti":"țârcâi","nu tarcoli":"târcoli","nu tarcoliti":"târcoli","nu tarcui":"țărcui","nu tarcuiti":"țărcui","nu targui":"târgui","nu targuiti":"târgui","nu tari":"târî","nu tarifa":"tarifa","nu tarifati":"tarifa","nu tarlai":"țârlăi","nu tarlaiti":"țârlăi","nu tarlaliza":"tarlaliza","nu tarlalizati":"tarlaliza","nu tarnosi":"târnosi","nu tarnositi":"târnosi","nu tarnui":"târnui","nu tarnuiti":"târnui","nu tarsai":"târșâi","nu tarsaiti":"târșâi","nu tarsi":"târși","nu tarsii":"târșii","nu tarsiiti":"târșii","nu tarsiti":"târși","nu tasa":"tasa","nu tasati":"tasa","nu tasni":"țâșni","nu tasniti":"țâșni","nu tasta":"tasta","nu tastati":"tasta","nu tatarati":"tătărî","nu tatari":"tătărî","nu tatona":"tatona","nu tatonati":"tatona","nu tatua":"tatua","nu tatuati":"tatua","nu tavali":"tăvăli","nu tavaliti":"tăvăli","nu taxa":"taxa","nu taxati":"taxa","nu teatraliza":"teatraliza","nu teatralizati":"teatraliza","nu tecsui":"tecsui","nu tecsuiti":"tecsui","nu tehniciza":"tehniciza","nu tehnicizati":"tehniciza","nu tehnologiza":"tehnologiza","nu tehnologizati":"tehnologiza","nu tehnoredacta":"tehnoredacta","nu tehnoredactati":"tehnoredacta","nu tehui":"tehui","nu tehuiti":"tehui","nu telecomanda":"telecomanda","nu telecomandati":"telecomanda","nu teledifuza":"teledifuza","nu teledifuzati":"teledifuza","nu teledirija":"teledirija","nu teledirijati":"teledirija","nu telefona":"telefona","nu telefonati":"telefona","nu telefotografia":"telefotografia","nu telefotografiati":"telefotografia","nu teleghida":"teleghida","nu teleghidati":"teleghida","nu telegrafia":"telegrafia","nu telegrafiati":"telegrafia","nu teleimprima":"teleimprima","nu teleimprimati":"teleimprima","nu televiza":"televiza","nu televizati":"televiza","nu tembeliza":"tembeliza","nu tembelizati":"tembeliza","nu teme":"teme","nu temeni":"temeni","nu temeniti":"temeni","nu temeti":"teme","nu temnita":"temnița","nu temnitati":"temnița","nu tempera":"tempera","nu temperati":"tempera","nu temporiza":"temporiza","nu temporizati":"temporiza","nu tencui":"tencui","nu tencuiti":"tencui","nu tensiona":"tensiona","nu tensionati":"tensiona","nu tenta":"tenta","nu tentati":"tenta","nu teologiza":"teologiza","nu teologizati":"teologiza","nu teoretiza":"teoretiza","nu teoretizati":"teoretiza","nu teoriza":"teoriza","nu teorizati":"teoriza","nu terasa":"terasa","nu terasati":"terasa","nu terciui":"terciui","nu terciuiti":"terciui","nu terfeli":"terfeli","nu terfeliti":"terfeli","nu tergiversa":"tergiversa","nu tergiversati":"tergiversa","nu terifia":"terifia","nu terifiati":"terifia","nu termina":"termina","nu terminati":"termina","nu termoizola":"termoizola","nu termoizolati":"termoizola","nu termoregla":"termoregla","nu termoreglati":"termoregla","nu teroriza":"teroriza","nu terorizati":"teroriza","nu tesala":"țesăla","nu tesalati":"țesăla","nu tescui":"tescui","nu tescuiti":"tescui","nu tese":"țese","nu teseti":"țese","nu tesi":"teși","nu tesiti":"teși","nu testa":"testa","nu testati":"testa","nu tetaniza":"tetaniza","nu tetanizati":"tetaniza","nu textura":"textura","nu texturati":"textura","nu tezauriza":"tezauriza","nu tezaurizati":"tezauriza","nu ticai":"ticăi","nu ticaiti":"ticăi","nu ticalosi":"ticăloși","nu ticalositi":"ticăloși","nu ticlui":"ticlui","nu ticluiti":"ticlui","nu ticni":["nu ticni","ticni","nu țicni","țicni"],"nu ticniti":["nu ticniți","ticni","nu țicniți","țicni"],"nu ticsi":"ticsi","nu ticsiti":"ticsi","nu tigani":"țigăni","nu tiganiti":"țigăni","nu tigheli":"tigheli","nu tigheliti":"tigheli","nu tigni":"tigni","nu tigniti":"tigni","nu tihni":"tihni","nu tihniti":"tihni","nu timbra":"timbra","nu timbrati":"timbra","nu timora":"timora","nu timorati":"timora","nu tinali":"tinăli","nu tinaliti":"tinăli","nu tinctura":"tinctura","nu tincturati":"tinctura","nu tinde":"tinde","nu tindeti":"tinde","nu tine":"ține","nu tinea":"ținea","nu tineti":["nu țineți","ține","nu țineți","ținea"],"nu tinti":"ținti","nu tintiti":"ținti","nu tintui":"țintui","nu tintuiti":"țintui","nu tipa":"țipa","nu tipari":"tipări","nu tipariti":"tipări","nu tiparui":"tipărui","nu tiparuiti":"tipărui","nu tipati":"țipa","nu tipiza":"tipiza","nu tipizati":"tipiza","nu tipoti":"țipoti","nu tipotiti":"țipoti","nu tiranisi":"tiranisi","nu tiranisiti":"tiranisi","nu tiraniza":"tiraniza","nu tiranizati":"tiraniza","nu tisni":"țișni","nu tisniti":"țișni","nu titiri":"titiri","nu titirisi":"titirisi","nu titirisiti":"titirisi","nu titiriti":"titiri","nu titra":"titra","nu titrati":"titra","nu titulariza":"titulariza","nu titularizati":"titulariza","nu tiui":"țiui","nu tiuiti":"țiui","nu tivi":"tivi","nu tiviti":"tivi","nu toaleta":"toaleta","nu toaletati":"toaleta","nu toarce":"toarce","nu toarceti":"toarce","nu toasta":"toasta","nu toastati":"toasta","nu toca":"toca","nu tocai":"țocăi","nu tocaiti":"țocăi","nu tocani":"tocăni","nu tocaniti":"tocăni","nu tocati":"toca","nu toci":"toci","nu tociti":"toci","nu tocmi":"tocmi","nu tocmiti":"tocmi","nu tojera":"tojera","nu tojerati":"tojera","nu tolani":"tolăni","nu tolaniti":"tolăni","nu tolera":"tolera","nu tolerati":"tolera","nu tomna":"tomna","nu tomnati":"tomna","nu tonifica":"tonifica","nu tonificati":"tonifica","nu topai":"țopăi","nu topaiti":"țopăi","nu topi":"topi","nu topiti":"topi","nu topseca":"topseca","nu topsecati":"topseca","nu torai":"torăi","nu toraiti":"torăi","nu toropi":"toropi","nu toropiti":"toropi","nu torpila":"torpila","nu torpilati":"torpila","nu torsiona":"torsiona","nu torsionati":"torsiona","nu tortura":"tortura","nu torturati":"tortura","nu totaliza":"totaliza","nu totalizati":"totaliza","nu tracasa":"tracasa","nu tracasati":"tracasa","nu tracta":"tracta","nu tractati":"tracta","nu trada":"trăda","nu tradati":"trăda","nu traduce":"traduce","nu traduceti":"traduce","nu trafica":"trafica","nu traficati":"trafica","nu tragana":"trăgăna","nu traganati":"trăgăna","nu trage":"trage","nu trageti":"trage","nu trai":"trăi","nu traiti":"trăi","nu trambita":"trâmbița","nu trambitati":"trâmbița","nu trancani":"trăncăni","nu trancaniti":"trăncăni","nu tranchiliza":"tranchiliza","nu tranchilizati":"tranchiliza","nu trandavi":"trândăvi","nu trandaviti":"trândăvi","nu transa":"tranșa","nu transati":"tranșa","nu transborda":"transborda","nu transbordati":"transborda","nu transcende":"transcende","nu transcendentaliza":"transcendentaliza","nu transcendentalizati":"transcendentaliza","nu transcendeti":"transcende","nu transcrie":"transcrie","nu transcrieti":"transcrie","nu transfera":"transfera","nu transferati":"transfera","nu transfigura":"transfigura","nu transfigurati":"transfigura","nu transforma":"transforma","nu transformati":"transforma","nu transfuza":"transfuza","nu transfuzati":"transfuza","nu transgresa":"transgresa","nu transgresati":"transgresa","nu transhuma":"transhuma","nu transhumati":"transhuma","nu transige":"transige","nu transigeti":"transige","nu transla":"transla","nu translata":"translata","nu translatati":"translata","nu translati":"transla","nu translitera":"translitera","nu transliterati":"translitera","nu transloca":"transloca","nu translocati":"transloca","nu transmigra":"transmigra","nu transmigrati":"transmigra","nu transmite":"transmite","nu transmiteti":"transmite","nu transmuta":"transmuta","nu transmutati":"transmuta","nu transparea":"transpărea","nu transpareti":"transpărea","nu transpira":"transpira","nu transpirati":"transpira","nu transplanta":"transplanta","nu transplantati":"transplanta","nu transporta":"transporta","nu transportati":"transporta","nu transportui":"transportui","nu transportuiti":"transportui","nu transpune":"transpune","nu transpuneti":"transpune","nu transsubstantia":"transsubstanția","nu transsubstantiati":"transsubstanția","nu transvaza":"transvaza","nu transvazati":"transvaza","nu tranti":"trânti","nu trantiti":"trânti","nu trantori":"trântori","nu trantoriti":"trântori","nu tranzactiona":"tranzacționa","nu tranzactionati":"tranzacționa","nu tranzistoriza":"tranzistoriza","nu tranzistorizati":"tranzistoriza","nu tranzita":"tranzita","nu tranzitati":"tranzita","nu trasa":"trasa","nu trasati":"trasa","nu trasni":"trăsni","nu trasniti":"trăsni","nu trata":"trata","nu tratati":"trata","nu traula":"traula","nu traulati":"traula","nu traumatiza":"traumatiza","nu traumatizati":"traumatiza","nu traversa":"traversa","nu traversati":"traversa","nu travesti":"travesti","nu travestiti":"travesti","nu trebalui":"trebălui","nu trebaluiti":"trebălui","nu trebui":"trebui","nu trebuiti":"trebui","nu trece":"trece","nu treceti":"trece","nu treiera":"treiera","nu treierati":"treiera","nu tremura":"tremura","nu tremurati":"tremura","nu trena":"trena","nu trenati":"trena","nu trentui":"trențui","nu trentuiti":"trențui","nu trepada":"trepăda","nu trepadati":"trepăda","nu trepana":"trepana","nu trepanati":"trepana","nu trepida":"trepida","nu trepidati":"trepida","nu tresalta":"tresălta","nu tresaltati":"tresălta","nu tresari":"tresări","nu tresariti":"tresări","nu trezi":"trezi","nu treziti":"trezi","nu tria":"tria","nu triangula":"triangula","nu triangulati":"triangula","nu triati":"tria","nu tricota":"tricota","nu tricotati":"tricota","nu triera":"triera","nu trierati":"triera","nu trifurca":"trifurca","nu trifurcati":"trifurca","nu trilui":"trilui","nu triluiti":"trilui","nu trimete":"trimete","nu trimeteti":"trimete","nu trimite":"trimite","nu trimiteti":"trimite","nu tripla":"tripla","nu triplati":"tripla","nu tripota":"tripota","nu tripotati":"tripota","nu trisa":"trișa","nu trisati":"trișa","nu tritura":"tritura","nu triturati":"tritura","nu triumfa":"triumfa","nu triumfati":"triumfa","nu trivializa":"trivializa","nu trivializati":"trivializa","nu troieni":"troieni","nu troieniti":"troieni","nu tromboni":"tromboni","nu tromboniti":"tromboni","nu trona":"trona","nu tronati":"trona","nu troncani":"troncăni","nu troncaniti":"troncăni","nu tropai":"tropăi","nu tropaiti":"tropăi","nu tropicaliza":"tropicaliza","nu tropicalizati":"tropicaliza","nu tropota":"tropota","nu tropotati":"tropota","nu tropoti":"tropoti","nu tropotiti":"tropoti","nu trosni":"trosni","nu trosniti":"trosni","nu trota":"trota","nu trotati":"trota","nu trotina":"trotina","nu trotinati":"trotina","nu truca":"truca","nu trucati":"truca","nu trudi":"trudi","nu truditi":"trudi","nu trunchia":"trunchia","nu trunchiati":"trunchia","nu tuberculiza":"tuberculiza","nu tuberculizati":"tuberculiza","nu tuca":"țuca","nu tucati":"țuca","nu tudumani":"tudumăni","nu tudumaniti":"tudumăni","nu tufli":"tufli","nu tufliti":"tufli","nu tuicari":"țuicări","nu tuicariti":"țuicări","nu tuicui":"țuicui","nu tuicuiti":"țuicui","nu tulbura":"tulbura","nu tulburati":"tulbura","nu tuli":"tuli","nu tuliti":"tuli","nu tumani":"tumăni","nu tumaniti":"tumăni","nu tumefia":"tumefia","nu tumefiati":"tumefia","nu tuna":"tuna","nu tunati":"tuna","nu tunde":"tunde","nu tundeti":"tunde","nu tupai":"țupăi","nu tupaiti":"țupăi","nu tupila":"tupila","nu tupilati":"tupila","nu turba":"turba","nu turbati":"turba","nu turbura":"turbura","nu turburati":"turbura","nu turci":"turci","nu turciti":"turci","nu turlaci":"turlăci","nu turlaciti":"turlăci","nu turmenta":"turmenta","nu turmentati":"turmenta","nu turna":"turna","nu turnati":"turna","nu turti":"turti","nu turtiti":"turti","nu turui":"turui","nu turuiti":"turui","nu tusa":"tușa","nu tusati":"tușa","nu tusi":"tuși","nu tusina":"tușina","nu tusinati":"tușina","nu tusiti":"tuși","nu tutela":"tutela","nu tutelati":"tutela","nu tutora":"tutora","nu tutorati":"tutora","nu tutui":"tutui","nu tutuia":"țuțuia","nu tutuiati":"țuțuia","nu tutuiti":"tutui","nu ucenici":"ucenici","nu uceniciti":"ucenici","nu ucide":"ucide","nu ucideti":"ucide","nu uda":"uda","nu udati":"uda","nu ui":"ui","nu uimi":"uimi","nu uimiti":"uimi","nu uita":"uita","nu uitati":"uita","nu uiti":"ui","nu ulcera":"ulcera","nu ulcerati":"ulcera","nu uleia":"uleia","nu uleiati":"uleia","nu ultragia":"ultragia","nu ultragiati":"ultragia","nu ului":"ului","nu uluiti":"ului","nu umaniza":"umaniza","nu umanizati":"umaniza","nu umbla":"umbla","nu umblati":"umbla","nu umbri":"umbri","nu umbriti":"umbri","nu umecta":"umecta","nu umectati":"umecta","nu umezi":"umezi","nu umeziti":"umezi","nu umfla":"umfla","nu umflati":"umfla","nu umidifica":"umidifica","nu umidificati":"umidifica","nu umila":"umila","nu umilati":"umila","nu umili":"umili","nu umiliti":"umili","nu umple":"umple","nu umpleti":"umple","nu unda":"unda","nu undati":"unda","nu undi":"undi","nu unditi":"undi","nu undoi":"undoi","nu undoia":"undoia","nu undoiati":"undoia","nu undoiti":"undoi","nu undui":"undui","nu unduiti":"undui","nu undula":"undula","nu undulati":"undula","nu unelti":"unelti","nu uneltiti":"unelti","nu unge":"unge","nu ungeti":"unge","nu uni":"uni","nu uniciza":"uniciza","nu unicizati":"uniciza","nu unidimensiona":"unidimensiona","nu unidimensionati":"unidimensiona","nu unifica":"unifica","nu unificati":"unifica","nu uniformiza":"uniformiza","nu uniformizati":"uniformiza","nu uniti":"uni","nu universaliza":"universaliza","nu universalizati":"universaliza","nu upercuta":"upercuta","nu upercutati":"upercuta","nu upovai":"upovăi","nu upovaiti":"upovăi","nu ura":"ura","nu urati":["nu urați","ura","nu urâți","urâți","nu urâți","urî"],"nu uratiti":"urâți","nu urbaniza":"urbaniza","nu urbanizati":"urbaniza","nu urca":"urca","nu urcati":"urca","nu urdi":"urdi","nu urdina":"urdina","nu urdinati":"urdina","nu urditi":"urdi","nu urduca":"urduca","nu urducati":"urduca","nu urechea":"urechea","nu urecheati":"urechea","nu urgenta":"urgenta","nu urgentati":"urgenta","nu urgisi":"urgisi","nu urgisiti":"urgisi","nu uri":"urî","nu urina":"urina","nu urinati":"urina","nu urla":"urla","nu urlati":"urla","nu urlui":"urlui","nu urluiti":"urlui","nu urma":"urma","nu urmari":"urmări","nu urmariti":"urmări","nu urmati":"urma","nu urmui":"urmui","nu urmuiti":"urmui","nu urni":"urni","nu urniti":"urni","nu ursi":"ursi","nu ursiti":"ursi","nu urui":"urui","nu uruiti":"urui","nu urzi":"urzi","nu urzica":"urzica","nu urzicati":"urzica","nu urziti":"urzi","nu usca":"usca","nu uscati":"usca","nu uschi":"ușchi","nu uschiti":"ușchi","nu usturoia":"usturoia","nu usturoiati":"usturoia","nu usui":"ușui","nu usuiti":"ușui","nu usura":"ușura","nu usurati":"ușura","nu utila":"utila","nu utilati":"utila","nu utiliza":"utiliza","nu utilizati":"utiliza","nu uza":"uza","nu uzati":"uza","nu uzina":"uzina","nu uzinati":"uzina","nu uzita":"uzita","nu uzitati":"uzita","nu uzurpa":"uzurpa","nu uzurpati":"uzurpa","nu vaccina":"vaccina","nu vaccinati":"vaccina","nu vacsui":"văcsui","nu vacsuiti":"văcsui","nu vacui":"văcui","nu vacuiti":"văcui","nu vadi":"vădi","nu vaditi":"vădi","nu vaduvi":"văduvi","nu vaduviti":"văduvi","nu vagabonda":"vagabonda","nu vagabondati":"vagabonda","nu vaicara":"văicăra","nu vaicarati":"văicăra","nu vaicari":"văicări","nu vaicariti":"văicări","nu vaieta":"văieta","nu vaietati":"văieta","nu vaita":"văita","nu vaitati":"văita","nu vajai":"vâjâi","nu vajaiti":"vâjâi","nu vaji":["nu vâji","vâji","nu văji","văji"],"nu vajii":"vâjii","nu vajiiti":"vâjii","nu vajiti":["nu vâjiți","vâji","nu văjiți","văji"],"nu valida":"valida","nu validati":"valida","nu valora":"valora","nu valorati":"valora","nu valorifica":"valorifica","nu valorificati":"valorifica","nu valoriza":"valoriza","nu valorizati":"valoriza","nu valsa":"valsa","nu valsati":"valsa","nu valtui":"vălțui","nu valtuiti":"vălțui","nu vampiriza":"vampiriza","nu vampirizati":"vampiriza","nu vamui":"vămui","nu vamuiti":"vămui","nu vana":"vâna","nu vanati":"vâna","nu vandaliza":"vandaliza","nu vandalizati":"vandaliza","nu vansli":"vânsli","nu vansliti":"vânsli","nu vantui":"vântui","nu vantuiti":"vântui","nu vantura":"vântura","nu vanturati":"vântura","nu vanzoli":"vânzoli","nu vanzoliti":"vânzoli","nu vapa":"vapa","nu vapaia":"văpăia","nu vapaiati":"văpăia","nu vapati":"vapa","nu vaporiza":"vaporiza","nu vaporizati":"vaporiza","nu vapsi":"văpsi","nu vapsiti":"văpsi","nu vara":"văra","nu varati":["nu vărați","văra","nu vârâți","vârî"],"nu varfui":"vârfui","nu varfuiti":"vârfui","nu varga":"vărga","nu vargati":"vărga","nu vari":"vârî","nu varia":"varia","nu variati":"varia","nu varsa":"vărsa","nu varsati":"vărsa","nu varteji":"vârteji","nu vartejiti":"vârteji","nu vartejui":"vârtejui","nu vartejuiti":"vârtejui","nu varui":"vărui","nu varuiti":"vărui","nu varzui":"vărzui","nu varzuiti":"vărzui","nu vasari":"văsări","nu vasariti":"văsări","nu vasculariza":"vasculariza","nu vascularizati":"vasculariza","nu vasla":"vâsla","nu vaslati":"vâsla","nu vasli":"vâsli","nu vasliti":"vâsli","nu vataji":"vătăji","nu vatajiti":"vătăji","nu vatama":"vătăma","nu vatamati":"vătăma","nu vatui":"vătui","nu vatuiti":"vătui","nu vecinui":"vecinui","nu vecinuiti":"vecinui","nu vecui":"vecui","nu vecuiti":"vecui","nu vedea":"vedea","nu vedeti":"vedea","nu vegeta":"vegeta","nu vegetati":"vegeta","nu veghea":"veghea","nu vegheati":"veghea","nu vehicula":"vehicula","nu vehiculati":"vehicula","nu velariza":"velariza","nu velarizati":"velariza","nu venera":"venera","nu venerati":"venera","nu veni":"veni","nu venina":"venina","nu veninati":"venina","nu veniti":"veni","nu ventila":"ventila","nu ventilati":"ventila","nu verbaliza":"verbaliza","nu verbalizati":"verbaliza","nu verifica":"verifica","nu verificati":"verifica","nu vermutiza":"vermutiza","nu vermutizati":"vermutiza","nu vernaliza":"vernaliza","nu vernalizati":"vernaliza","nu vernisa":"vernisa","nu vernisati":"vernisa","nu versifica":"versifica","nu versificati":"versifica","nu versui":"versui","nu versuiti":"versui","nu veseli":"veseli","nu veseliti":"veseli","nu vesnici":"veșnici","nu vesniciti":"veșnici","nu vesteji":["nu vesteji","vesteji","nu veșteji","veșteji"],"nu vestejiti":["nu vestejiți","vesteji","nu veștejiți","veșteji"],"nu vestezi":["nu vestezi","vestezi","nu veștezi","veștezi"],"nu vesteziti":["nu vesteziți","vestezi","nu veșteziți","veștezi"],"nu vesti":["nu vesti","vesti","nu vești","vești"],"nu vestiti":["nu vestiți","vesti","nu veștiți","vești"],"nu vestui":"vestui","nu vestuiti":"vestui","nu vexa":"vexa","nu vexati":"vexa","nu via":"via","nu viati":"via","nu vibra":"vibra","nu vibrati":"vibra","nu vicia":"vicia","nu viciati":"vicia","nu vicleni":"vicleni","nu vicleniti":"vicleni","nu vicoli":"vicoli","nu vicoliti":"vicoli","nu victimiza":"victimiza","nu victimizati":"victimiza","nu vida":"vida","nu vidanja":"vidanja","nu vidanjati":"vidanja","nu vidati":"vida","nu vie":"vie","nu viermui":"viermui","nu viermuiti":"viermui","nu viersui":"viersui","nu viersuiti":"viersui","nu vieti":"vie","nu vietui":"viețui","nu vietuiti":"viețui","nu vilegiatura":"vilegiatura","nu vilegiaturati":"vilegiatura","nu vince":"vince","nu vinceti":"vince","nu vinde":"vinde","nu vindeca":"vindeca","nu vindecati":"vindeca","nu vindeti":"vinde","nu vinge":"vinge","nu vingeti":"vinge","nu vinifica":"vinifica","nu vinificati":"vinifica","nu vinovati":"vinovăți","nu vinovatiti":"vinovăți","nu vinui":"vinui","nu vinuiti":"vinui","nu viola":"viola","nu violati":"viola","nu violenta":"violenta","nu violentati":"violenta","nu vira":"vira","nu virati":"vira","nu viriliza":"viriliza","nu virilizati":"viriliza","nu virtualiza":"virtualiza","nu virtualizati":"virtualiza","nu visa":"visa","nu visati":"visa","nu viscoli":"viscoli","nu viscoliti":"viscoli","nu visti":"viști","nu vistiti":"viști","nu vitaliza":"vitaliza","nu vitalizati":"vitaliza","nu vitaminiza":"vitaminiza","nu vitaminizati":"vitaminiza","nu viteji":"viteji","nu vitejiti":"viteji","nu vitia":"viția","nu vitiati":"viția","nu vitrifica":"vitrifica","nu vitrificati":"vitrifica","nu vitriola":"vitriola","nu vitriolati":"vitriola","nu vitrioliza":"vitrioliza","nu vitriolizati":"vitrioliza","nu vitupera":"vitupera","nu vituperati":"vitupera","nu vivifica":"vivifica","nu vivificati":"vivifica","nu vivisectiona":"vivisecționa","nu vivisectionati":"vivisecționa","nu viza":"viza","nu vizati":"viza","nu viziona":"viziona","nu vizionati":"viziona","nu vizita":"vizita","nu vizitati":"vizita","nu vizualiza":"vizualiza","nu vizualizati":"vizualiza","nu vladui":"vlădui","nu vladuiti":"vlădui","nu vlagui":"vlăgui","nu vlaguiti":"vlăgui","nu voala":"voala","nu voalati":"voala","nu voame":"voame","nu voameti":"voame","nu vocaliza":"vocaliza","nu vocalizati":"vocaliza","nu vocifera":"vocifera","nu vociferati":"vocifera","nu vodi":"vodi","nu voditi":"vodi","nu voi":"voi","nu voiaja":"voiaja","nu voiajati":"voiaja","nu voiti":"voi","nu volatiliza":"volatiliza","nu volatilizati":"volatiliza","nu volnici":"volnici","nu volniciti":"volnici","nu voma":"voma","nu vomati":"voma","nu vomita":"vomita","nu vomitati":"vomita","nu vopsi":"vopsi","nu vopsiti":"vopsi","nu vorbi":"vorbi","nu vorbiti":"vorbi","nu vorovi":"vorovi","nu voroviti":"vorovi","nu vota":"vota","nu votati":"vota","nu vrafui":"vrăfui","nu vrafuiti":"vrăfui","nu vraji":"vrăji","nu vrajiti":"vrăji","nu vrajmasi":"vrăjmăși","nu vrajmasiti":"vrăjmăși","nu vravui":"vrăvui","nu vravuiti":"vrăvui","nu vrea":"vrea","nu vrednici":"vrednici","nu vredniciti":"vrednici","nu vreti":"vrea","nu vroi":"vroi","nu vroiti":"vroi","nu vui":"vui","nu vuieta":"vuieta","nu vuietati":"vuieta","nu vuiti":"vui","nu vulcaniza":"vulcaniza","nu vulcanizati":"vulcaniza","nu vulgariza":"vulgariza","nu vulgarizati":"vulgariza","nu vulnera":"vulnera","nu vulnerati":"vulnera","nu vuvui":"vuvui","nu vuvuiti":"vuvui","nu xerocopia":"xerocopia","nu xerocopiati":"xerocopia","nu xerografia":"xerografia","nu xerografiati":"xerografia","nu xeroxa":"xeroxa","nu xeroxati":"xeroxa","nu zabavi":"zăbăvi","nu zabaviti":"zăbăvi","nu zabovi":"zăbovi","nu zaboviti":"zăbovi","nu zacea":"zăcea","nu zaceti":"zăcea","nu zacusi":"zacusi","nu zacusiti":"zacusi","nu zadarati":"zădărî","nu zadari":["nu zădări","zădări","nu zădărî","zădărî"],"nu zadariti":"zădări","nu zadarnici":"zădărnici","nu zadarniciti":"zădărnici","nu zagazui":"zăgăzui","nu zagazuiti":"zăgăzui","nu zaharifica":"zaharifica","nu zaharificati":"zaharifica","nu zaharisi":"zaharisi","nu zaharisiti":"zaharisi","nu zahatui":"zăhătui","nu zahatuiti":"zăhătui","nu zambi":"zâmbi","nu zambiti":"zâmbi","nu zamisli":"zămisli","nu zamisliti":"zămisli","nu zamislui":"zamislui","nu zamisluiti":"zamislui","nu zangani":["nu zângăni","zângăni","nu zăngăni","zăngăni"],"nu zanganiti":["nu zângăniți","zângăni","nu zăngăniți","zăngăni"],"nu zapa":"zapa","nu zapaci":"zăpăci","nu zapaciti":"zăpăci","nu zapati":"zapa","nu zapcii":"zapcii","nu zapciiti":"zapcii","nu zapusi":"zăpuși","nu zapusiti":"zăpuși","nu zari":"zări","nu zariti":"zări","nu zatigni":"zătigni","nu zatigniti":"zătigni","nu zavergisi":"zavergisi","nu zavergisiti":"zavergisi","nu zavistii":"zavistii","nu zavistiiti":"zavistii","nu zavorati":"zăvorî","nu zavori":["nu zăvori","zăvori","nu zăvorî","zăvorî"],"nu zavoriti":"zăvori","nu zbantui":"zbănțui","nu zbantuiti":"zbănțui","nu zbarci":"zbârci","nu zbarciti":"zbârci","nu zbarli":"zbârli","nu zbarliti":"zbârli","nu zbarnai":"zbârnăi","nu zbarnaiti":"zbârnăi","nu zbate":"zbate","nu zbateti":"zbate","nu zbea":"zbea","nu zbengui":"zbengui","nu zbenguiti":"zbengui","nu zbeti":"zbea","nu zbici":"zbici","nu zbiciti":"zbici","nu zbiera":"zbiera","nu zbierati":"zbiera","nu zbihui":"zbihui","nu zbihuiti":"zbihui","nu zblendui":"zblendui","nu zblenduiti":"zblendui","nu zbuciuma":"zbuciuma","nu zbuciumati":"zbuciuma","nu zbucni":"zbucni","nu zbucniti":"zbucni","nu zbura":"zbura","nu zburati":"zbura","nu zburatori":"zburători","nu zburatoriti":"zburători","nu zburda":"zburda","nu zburdati":"zburda","nu zburli":"zburli","nu zburliti":"zburli","nu zdrancani":"zdrăncăni","nu zdrancaniti":"zdrăncăni","nu zdrangani":["nu zdrângăni","zdrângăni","nu zdrăngăni","zdrăngăni"],"nu zdranganiti":["nu zdrângăniți","zdrângăni","nu zdrăngăniți","zdrăngăni"],"nu zdreli":"zdreli","nu zdreliti":"zdreli","nu zdrobi":"zdrobi","nu zdrobiti":"zdrobi","nu zdrumeca":"zdrumeca","nu zdrumecati":"zdrumeca","nu zdrumica":"zdrumica","nu zdrumicati":"zdrumica","nu zdruncina":"zdruncina","nu zdruncinati":"zdruncina","nu zdrusi":"zdruși","nu zdrusiti":"zdruși","nu zdupai":"zdupăi","nu zdupaiti":"zdupăi","nu zeberi":"zeberi","nu zeberiti":"zeberi","nu zeciui":"zeciui","nu zeciuiti":"zeciui","nu zeflemisi":"zeflemisi","nu zeflemisiti":"zeflemisi","nu zeifica":"zeifica","nu zeificati":"zeifica","nu zemosi":"zemoși","nu zemositi":"zemoși","nu zemui":"zemui","nu zemuiti":"zemui","nu zetui":"zețui","nu zetuiti":"zețui","nu zgai":"zgâi","nu zgaiti":"zgâi","nu zgaltai":"zgâlțâi","nu zgaltaiti":"zgâlțâi","nu zgancili":"zgâncili","nu zganciliti":"zgâncili","nu zgandari":"zgândări","nu zgandariti":"zgândări","nu zgarci":"zgârci","nu zgarciti":"zgârci","nu zgaria":"zgâria","nu zgariati":"zgâria","nu zgaura":"zgăura","nu zgaurati":"zgăura","nu zgorni":"zgorni","nu zgorniti":"zgorni","nu zgrebuli":"zgrebuli","nu zgrebuliti":"zgrebuli","nu zgreptana":"zgrepțăna","nu zgreptanati":"zgrepțăna","nu zgribuli":"zgribuli","nu zgribuliti":"zgribuli","nu zgribura":"zgribura","nu zgriburati":"zgribura","nu zgriburi":"zgriburi","nu zgriburiti":"zgriburi","nu zgudui":"zgudui","nu zguduiti":"zgudui","nu zgurifica":"zgurifica","nu zgurificati":"zgurifica","nu zice":"zice","nu ziceti":"zice","nu zidi":"zidi","nu ziditi":"zidi","nu zidui":"zidui","nu ziduiti":"zidui","nu zigzaga":"zigzaga","nu zigzagati":"zigzaga","nu zimbi":"zimbi","nu zimbiti":"zimbi","nu zimta":"zimța","nu zimtati":"zimța","nu zimtui":"zimțui","nu zimtuiti":"zimțui","nu zinca":"zinca","nu zincati":"zinca","nu zincografia":"zincografia","nu zincografiati":"zincografia","nu zincui":"zincui","nu zincuiti":"zincui","nu zingani":"zingăni","nu zinganiti":"zingăni","nu zingheni":"zingheni","nu zingheniti":"zingheni","nu zmaci":"zmâci","nu zmaciti":"zmâci","nu zmangali":"zmângăli","nu zmangaliti":"zmângăli","nu zmeri":"zmeri","nu zmeriti":"zmeri","nu zminti":"zminti","nu zmintiti":"zminti","nu zmuci":"zmuci","nu zmuciti":"zmuci","nu zobi":"zobi","nu zobiti":"zobi","nu zonifica":"zonifica","nu zonificati":"zonifica","nu zopai":"zopăi","nu zopaiti":"zopăi","nu zornai":"zornăi","nu zornaiti":"zornăi","nu zorobi":"zorobi","nu zorobiti":"zorobi","nu zorzoi":"zorzoi","nu zorzoiti":"zorzoi","nu zugravi":"zugrăvi","nu zugraviti":"zugrăvi","nu zugruma":"zugruma","nu zugrumati":"zugruma","nu zulufa":"zulufa","nu zulufati":"zulufa","nu zumzai":"zumzăi","nu zumzaiti":"zumzăi","nu zupai":"zupăi","nu zupaiti":"zupăi","nu zupui":"zupui","nu zupuiti":"zupui","nu zurai":"zurăi","nu zuraiti":"zurăi","nu zuzai":"zuzăi","nu zuzaiti":"zuzăi","nu zvacni":"zvâcni","nu zvacniti":"zvâcni","nu zvanta":"zvânta","nu zvantati":"zvânta","nu zvantura":"zvântura","nu zvanturati":"zvântura","nu zvarli":"zvârli","nu zvarliti":"zvârli","nu zvoni":"zvoni","nu zvoniti":"zvoni","nu-nteleg":"nu înțeleg","nuantai":"nuanța","nuantam":["nuanțăm","nuanța","nuanțam","nuanța"],"nuantand":"nuanța","nuantara":"nuanța","nuantaram":"nuanța","nuantarati":"nuanța","nuantarea":"nuanțare","nuantari":"nuanțare","nuantarii":"nuanțare","nuantarile":"nuanțare","nuantarilor":"nuanțare","nuantase":"nuanța","nuantasem":"nuanța","nuantasera":"nuanța","nuantaseram":"nuanța","nuantaserati":"nuanța","nuantasesi":"nuanța","nuantasi":"nuanța","nuantat":"nuanța","nuantata":["nuanțată","nuanțat","nuanțata","nuanțat"],"nuantate":"nuanțat","nuantatele":"nuanțat","nuantati":["nuanțați","nuanța","nuanțați","nuanțat"],"nuantatii":"nuanțat","nuantatul":"nuanțat","nuantau":"nuanța","nuante":"nuanță","nuanteaza":"nuanța","nuantei":"nuanță","nuantele":"nuanță","nuantelor":"nuanță","nuantez":"nuanța","nuantezi":"nuanța","nuar":"nor","nubila":["nubilă","nubil","nubila","nubil"],"nubile":"nubil","nubilele":"nubil","nubili":"nubil","nubilii":"nubil","nubilitatea":"nubilitate","nubilitati":"nubilitate","nubilitatii":"nubilitate","nubilitatile":"nubilitate","nubilitatilor":"nubilitate","nubilul":"nubil","nubucul":"nubuc","nubucule":"nubuc","nubucului":"nubuc","nucaria":"nucărie","nucariei":"nucărie","nucarii":"nucărie","nucariile":"nucărie","nucariilor":"nucărie","nucaristea":"nucariște","nucaristi":"nucariște","nucaristii":"nucariște","nucaristile":"nucariște","nucaristilor":"nucariște","nucele":"nucelă","nucelei":"nucelă","nucelele":"nucelă","nucelelor":"nucelă","nuceturi":"nucet","nuchite":"nuchiță","nuchitei":"nuchiță","nuchitele":"nuchiță","nuchitelor":"nuchiță","nuci":["nuci","nuc","nuci","nucă"],"nuci braziliene":"nucă braziliană","nuci de cocos":"nucă de cocos","nuci pecan":["nuci pecan","nuc pecan","nuci pecan","nucă pecan"],"nucifera":["nuciferă","nucifer","nucifera","nucifer"],"nucifere":"nucifer","nuciferele":"nucifer","nuciferi":"nucifer","nuciferii":"nucifer","nuciferul":"nucifer","nuciforma":["nuciformă","nuciform","nuciforma","nuciform"],"nuciforme":"nuciform","nuciformele":"nuciform","nuciformi":"nuciform","nuciformii":"nuciform","nuciformul":"nuciform","nucii":["nucii","nuc","nucii","nucă"],"nucile":"nucă","nucilor":["nucilor","nuc","nucilor","nucă"],"nucimea":"nucime","nucimi":"nucime","nucimii":"nucime","nucimile":"nucime","nucimilor":"nucime","nucistea":"nuciște","nucisti":"nuciște","nucistii":"nuciște","nucistile":"nuciște","nucistilor":"nuciște","nucleara":["nucleară","nuclear","nucleara","nuclear"],"nucleare":"nuclear","nuclearele":"nuclear","nucleari":"nuclear","nuclearii":"nuclear","nuclearizai":"nucleariza","nuclearizam":["nuclearizăm","nucleariza","nuclearizam","nucleariza"],"nuclearizand":"nucleariza","nuclearizara":"nucleariza","nuclearizaram":"nucleariza","nuclearizarati":"nucleariza","nuclearizarea":"nuclearizare","nuclearizari":"nuclearizare","nuclearizarii":"nuclearizare","nuclearizarile":"nuclearizare","nuclearizarilor":"nuclearizare","nuclearizase":"nucleariza","nuclearizasem":"nucleariza","nuclearizasera":"nucleariza","nuclearizaseram":"nucleariza","nuclearizaserati":"nucleariza","nuclearizasesi":"nucleariza","nuclearizasi":"nucleariza","nuclearizat":"nucleariza","nuclearizati":"nucleariza","nuclearizau":"nucleariza","nuclearizeaza":"nucleariza","nuclearizez":"nucleariza","nuclearizezi":"nucleariza","nuclearul":"nuclear","nucleatia":"nucleație","nucleatiei":"nucleație","nucleatii":"nucleație","nucleaze":"nuclează","nucleazei":"nuclează","nuclee":"nucleu","nuclee atomice":"nucleu atomic","nucleele":"nucleu","nucleelor":"nucleu","nucleica":["nucleică","nucleic","nucleica","nucleic"],"nucleice":"nucleic","nucleicele":"nucleic","nucleici":"nucleic","nucleicii":"nucleic","nucleicul":"nucleic","nucleine":"nucleină","nucleinei":"nucleină","nucleinele":"nucleină","nucleinelor":"nucleină","nucleoidul":"nucleoid","nucleoidule":"nucleoid","nucleoidului":"nucleoid","nucleoizi":"nucleoid","nucleoizile":"nucleoid","nucleoizilor":"nucleoid","nucleoli":"nucleol","nucleolii":"nucleol","nucleolilor":"nucleol","nucleolul":"nucleol","nucleolule":"nucleol","nucleolului":"nucleol","nucleoni":"nucleon","nucleonica":["nucleonică","nucleonic","nucleonica","nucleonic"],"nucleonice":["nucleonice","nucleonic","nucleonice","nucleonică"],"nucleonicei":"nucleonică","nucleonicele":["nucleonicele","nucleonic","nucleonicele","nucleonică"],"nucleonicelor":"nucleonică","nucleonici":"nucleonic","nucleonicii":"nucleonic","nucleonicul":"nucleonic","nucleonii":"nucleon","nucleonilor":"nucleon","nucleonul":"nucleon","nucleonule":"nucleon","nucleonului":"nucleon","nucleoplasme":"nucleoplasmă","nucleoplasmei":"nucleoplasmă","nucleoplasmele":"nucleoplasmă","nucleoplasmelor":"nucleoplasmă","nucleoproteide":"nucleoproteidă","nucleoproteidei":"nucleoproteidă","nucleoproteidele":"nucleoproteidă","nucleoproteidelor":"nucleoproteidă","nucleoproteine":"nucleoproteină","nucleoproteinei":"nucleoproteină","nucleoproteinele":"nucleoproteină","nucleoproteinelor":"nucleoproteină","nucleosinteze":"nucleosinteză","nucleosintezei":"nucleosinteză","nucleosintezele":"nucleosinteză","nucleosintezelor":"nucleosinteză","nucleotide":"nucleotidă","nucleotidei":"nucleotidă","nucleotidele":"nucleotidă","nucleotidelor":"nucleotidă","nucleul":"nucleu","nucleule":"nucleu","nucleului":"nucleu","nuclidul":"nuclid","nuclidule":"nuclid","nuclidului":"nuclid","nuclizi":"nuclid","nuclizii":"nuclid","nuclizilor":"nuclid","nucsoare":"nucșoară","nucsoarei":"nucșoară","nucsoarele":"nucșoară","nucsoarelor":"nucșoară","nucsori":"nucșor","nucsorii":"nucșor","nucsorilor":"nucșor","nucsorul":"nucșor","nucsorule":"nucșor","nucsorului":"nucșor","nucul":"nuc","nucule":["nucule","nuc","nucule","nuculă"],"nuculei":"nuculă","nuculele":"nuculă","nuculelor":"nuculă","nuculeti":"nuculeț","nuculetii":"nuculeț","nuculetilor":"nuculeț","nuculetul":"nuculeț","nuculetule":"nuculeț","nuculetului":"nuculeț","nuculite":"nuculiță","nuculitei":"nuculiță","nuculitele":"nuculiță","nuculitelor":"nuculiță","nucului":"nuc","nucute":"nucuță","nucutei":"nucuță","nucutele":"nucuță","nucutelor":"nucuță","nucuti":"nucuț","nucutii":"nucuț","nucutilor":"nucuț","nucutul":"nucuț","nucutule":"nucuț","nucutului":"nucuț","nuda":["nudă","nud","nuda","nud"],"nude":"nud","nudele":"nud","nudismul":"nudism","nudismule":"nudism","nudismului":"nudism","nudista":["nudistă","nudist","nudista","nudist"],"nudiste":["nudiste","nudist","nudiste","nudistă"],"nudistei":"nudistă","nudistele":["nudistele","nudist","nudistele","nudistă"],"nudistelor":"nudistă","nudisti":"nudist","nudistii":"nudist","nudistilor":"nudist","nudistul":"nudist","nudistule":"nudist","nudistului":"nudist","nuditatea":"nuditate","nuditati":"nuditate","nuditatii":"nuditate","nuditatile":"nuditate","nuditatilor":"nuditate","nudul":"nud","nufarisul":"nufăriș","nufarisule":"nufăriș","nufarisului":"nufăriș","nufarisuri":"nufăriș","nufarisurile":"nufăriș","nufarisurilor":"nufăriș","nufarul":"nufăr","nufarule":"nufăr","nufarului":"nufăr","nuferi":"nufăr","nuferii":"nufăr","nuferilor":"nufăr","nugale":"nuga","nugalei":"nuga","nugalele":"nuga","nugalelor":"nuga","nugaua":"nuga","nuiaua":"nuia","nuielaria":"nuielărie","nuielariei":"nuielărie","nuielarii":"nuielărie","nuielariile":"nuielărie","nuielariilor":"nuielărie","nuiele":"nuia","nuielei":"nuia","nuielele":"nuia","nuielelor":"nuia","nuielisul":"nuieliș","nuielisule":"nuieliș","nuielisului":"nuieliș","nuielisuri":"nuieliș","nuielisurile":"nuieliș","nuielisurilor":"nuieliș","nuieluse":"nuielușă","nuielusei":"nuielușă","nuielusele":"nuielușă","nuieluselor":"nuielușă","nuieluste":"nuielușcă","nuielustei":"nuielușcă","nuielustele":"nuielușcă","nuielustelor":"nuielușcă","nuielute":"nuieluță","nuielutei":"nuieluță","nuielutele":"nuieluță","nuielutelor":"nuieluță","nula":["nulă","nul","nula","nul"],"nula si neavenita":"nul și neavenit","nule":"nul","nule si neavenite":"nul și neavenit","nulele":"nul","nuli":"nul","nuli si neaveniti":"nul și neavenit","nulific":"nulifica","nulificai":"nulifica","nulificam":["nulificăm","nulifica","nulificam","nulifica"],"nulificand":"nulifica","nulificara":"nulifica","nulificaram":"nulifica","nulificarati":"nulifica","nulificarea":"nulificare","nulificari":"nulificare","nulificarii":"nulificare","nulificarile":"nulificare","nulificarilor":"nulificare","nulificase":"nulifica","nulificasem":"nulifica","nulificasera":"nulifica","nulificaseram":"nulifica","nulificaserati":"nulifica","nulificasesi":"nulifica","nulificasi":"nulifica","nulificat":"nulifica","nulificati":"nulifica","nulificau":"nulifica","nulifici":"nulifica","nuligeste":"nuligestă","nuligestei":"nuligestă","nuligestele":"nuligestă","nuligestelor":"nuligestă","nulii":"nul","nulipare":"nulipară","nuliparei":"nulipară","nuliparele":"nulipară","nuliparelor":"nulipară","nulitatea":"nulitate","nulitati":"nulitate","nulitatii":"nulitate","nulitatile":"nulitate","nulitatilor":"nulitate","nulul":"nul","numa'":"numai","numar":"număra","numarabila":["numărabilă","numărabil","numărabila","numărabil"],"numarabile":"numărabil","numarabilele":"numărabil","numarabili":"numărabil","numarabilii":"numărabil","numarabilul":"numărabil","numarai":"număra","numaram":["numărăm","număra","număram","număra"],"numarand":"număra","numarara":"număra","numararam":"număra","numararati":"număra","numarari":"numărare","numarase":"număra","numarasem":"număra","numarasera":"număra","numaraseram":"număra","numaraserati":"număra","numarasesi":"număra","numarasi":"număra","numarat":"număra","numarata":["numărată","numărat","numărata","numărat"],"numarate":"numărat","numaratele":"numărat","numarati":["numărați","număra","numărați","numărat"],"numaratii":"numărat","numaratori":["numărători","numărătoare","numărători","numărător"],"numaratori inverse":"numărătoare inversă","numaratorii":"numărător","numaratorilor":"numărător","numaratorul":"numărător","numaratorule":"numărător","numaratorului":"numărător","numaratul":"numărat","numaraturi":"numărătură","numaraturii":"numărătură","numaraturile":"numărătură","numaraturilor":"numărătură","numarau":"număra","numarul":"număr","numarule":"număr","numarului":"număr","numaruse":"număruș","numarusele":"număruș","numaruselor":"număruș","numarusul":"număruș","numarusule":"număruș","numarusului":"număruș","nume mici":"nume mic","numea":"numi","numeai":"numi","numeam":"numi","numeati":"numi","numeau":"numi","numeita":["numeită","numeit","numeita","numeit"],"numeite":"numeit","numeitele":"numeit","numeiti":"numeit","numeitii":"numeit","numeitul":"numeit","numele":"nume","numelor":"nume","numelui":"nume","numenala":["numenală","numenal","numenala","numenal"],"numenale":"numenal","numenalele":"numenal","numenali":"numenal","numenalii":"numenal","numenalul":"numenal","numenul":"numen","numenule":"numen","numenului":"numen","numerabila":["numerabilă","numerabil","numerabila","numerabil"],"numerabile":"numerabil","numerabilele":"numerabil","numerabili":"numerabil","numerabilii":"numerabil","numerabilitatea":"numerabilitate","numerabilitati":"numerabilitate","numerabilitatii":"numerabilitate","numerabilul":"numerabil","numerala":["numerală","numeral","numerala","numeral"],"numerale":"numeral","numerale cardinale":"numeral cardinal","numerale multiplicative":"numeral multiplicativ","numerale ordinale":"numeral ordinal","numeralele":"numeral","numerali":"numeral","numeralii":"numeral","numeralul":"numeral","numerare":"numerar","numerarele":"numerar","numerarelor":"numerar","numerarul":"numerar","numerarule":"numerar","numerarului":"numerar","numeratia":"numerație","numeratiei":"numerație","numeratii":"numerație","numeratiile":"numerație","numeratiilor":"numerație","numeratiunea":"numerațiune","numeratiuni":"numerațiune","numeratiunii":"numerațiune","numeratiunile":"numerațiune","numeratiunilor":"numerațiune","numere":["numere","număr","numere","număra"],"numere algebrice":"număr algebric","numere atomice":"număr atomic","numere cardinale":"număr cardinal","numere complexe":"număr complex","numere cuantice":"număr cuantic","numere de serie":"număr de serie","numere de telefon":"număr de telefon","numere fractionare":"număr fracționar","numere intregi":"număr întreg","numere irationale":"număr irațional","numere mixte":"număr mixt","numere ordinale":"număr ordinal","numere perfecte":"număr perfect","numere prime":"număr prim","numere rationale":"număr rațional","numere reale":"număr real","numere telefonice":"număr telefonic","numere zecimale":"număr zecimal","numerele":"număr","numerelor":"număr","numeri":"număra","numerica":["numerică","numeric","numerica","numeric"],"numerice":"numeric","numericeasca":["numericească","numericesc","numericeasca","numericesc"],"numericele":"numeric","numericescul":"numericesc","numericesti":"numericesc","numericestii":"numericesc","numericestile":"numericesc","numerici":"numeric","numericii":"numeric","numericul":"numeric","numerizai":"numeriza","numerizam":["numerizăm","numeriza","numerizam","numeriza"],"numerizand":"numeriza","numerizara":"numeriza","numerizaram":"numeriza","numerizarati":"numeriza","numerizase":"numeriza","numerizasem":"numeriza","numerizasera":"numeriza","numerizaseram":"numeriza","numerizaserati":"numeriza","numerizasesi":"numeriza","numerizasi":"numeriza","numerizat":"numeriza","numerizati":"numeriza","numerizau":"numeriza","numerizeaza":"numeriza","numerizez":"numeriza","numerizezi":"numeriza","numeroasa":["numeroasă","numeros","numeroasa","numeros"],"numeroase":"numeros","numeroasele":"numeros","numerosi":"numeros","numerosii":"numeros","numerosul":"numeros","numerotai":"numerota","numerotam":["numerotăm","numerota","numerotam","numerota"],"numerotand":"numerota","numerotara":"numerota","numerotaram":"numerota","numerotarati":"numerota","numerotarea":"numerotare","numerotari":"numerotare","numerotarii":"numerotare","numerotarile":"numerotare","numerotarilor":"numerotare","numerotase":"numerota","numerotasem":"numerota","numerotasera":"numerota","numerotaseram":"numerota","numerotaserati":"numerota","numerotasesi":"numerota","numerotasi":"numerota","numerotat":"numerota","numerotata":["numerotată","numerotat","numerotata","numerotat"],"numerotate":"numerotat","numerotatele":"numerotat","numerotati":["numerotați","numerota","numerotați","numerotat"],"numerotatia":"numerotație","numerotatiei":"numerotație","numerotatii":["numerotații","numerotat","numerotații","numerotație"],"numerotatiile":"numerotație","numerotatiilor":"numerotație","numerotatul":"numerotat","numerotau":"numerota","numeroteaza":"numerota","numerotez":"numerota","numeroteze":"numerota","numerotezi":"numerota","numerozitatati":"numerozitate","numerozitatatii":"numerozitate","numerozitatatile":"numerozitate","numerozitatatilor":"numerozitate","numerozitatea":"numerozitate","numesc":"numi","numeste":"numi","numesti":"numi","numii":"numi","numim":"numi","numind":"numi","numira":"numi","numiram":"numi","numirati":"numi","numirea":"numire","numiri":"numire","numirii":"numire","numirile":"numire","numirilor":"numire","numise":"numi","numisem":"numi","numisera":"numi","numiseram":"numi","numiserati":"numi","numisesi":"numi","numisi":"numi","numismate":"numismată","numismatei":"numismată","numismatele":"numismată","numismatelor":"numismată","numismati":"numismat","numismatica":["numismatică","numismatic","numismatica","numismatic"],"numismatice":"numismatic","numismaticele":"numismatic","numismatici":["numismatici","numismatic","numismatici","numismatică"],"numismaticii":["numismaticii","numismatic","numismaticii","numismatică"],"numismaticile":"numismatică","numismaticilor":"numismatică","numismaticul":"numismatic","numismatii":"numismat","numismatilor":"numismat","numismatul":"numismat","numismatule":"numismat","numismatului":"numismat","numit":"numi","numita":["numită","numit","numita","numit"],"numite":"numit","numitele":"numit","numiti":["numiți","numi","numiți","numit"],"numitii":"numit","numitori":"numitor","numitul":"numit","numuliti":"numulit","numulitica":["numulitică","numulitic","numulitica","numulitic"],"numulitice":"numulitic","numuliticele":"numulitic","numulitici":"numulitic","numuliticii":"numulitic","numuliticul":"numulitic","numulitii":"numulit","numulitilor":"numulit","numulitul":"numulit","numulitule":"numulit","numulitului":"numulit","nunatakul":"nunatak","nunatakule":"nunatak","nunatakului":"nunatak","nunatakuri":"nunatak","nunatakurile":"nunatak","nunatakurilor":"nunatak","nunciaturi":"nunciatură","nunciaturii":"nunciatură","nunciaturile":"nunciatură","nunciaturilor":"nunciatură","nuncii":"nunciu","nunciii":"nunciu","nunciilor":"nunciu","nunciul":"nunciu","nunciule":"nunciu","nunciului":"nunciu","nuncupatia":"nuncupație","nuncupatiei":"nuncupație","nuncupatii":"nuncupație","nuncupatiile":"nuncupație","nuncupatiilor":"nuncupație","nune":"nună","nunei":"nună","nunele":"nună","nunelor":"nună","nunesti":"nuneasca","nunestii":"nuneasca","nuni":"nun","nunii":"nun","nunilor":"nun","nunisoare":"nunișoară","nunisoarei":"nunișoară","nunisoarele":"nunișoară","nunisoarelor":"nunișoară","nunite":"nuniță","nunitei":"nuniță","nunitele":"nuniță","nunitelor":"nuniță","nuntalasi":"nuntălaș","nuntalasii":"nuntălaș","nuntalasilor":"nuntălaș","nuntalasul":"nuntălaș","nuntalasule":"nuntălaș","nuntalasului":"nuntălaș","nuntaria":"nuntariu","nuntarie":"nuntariu","nuntarii":"nuntariu","nuntariii":"nuntariu","nuntariile":"nuntariu","nuntariilor":"nuntariu","nuntariul":"nuntariu","nuntariuul":"nuntariu","nuntariuule":"nuntariu","nuntariuului":"nuntariu","nuntase":"nuntașă","nuntasei":["nuntașei","nuntașă","nuntășei","nuntășel"],"nuntaseii":"nuntășel","nuntaseilor":"nuntășel","nuntasele":"nuntașă","nuntaselor":"nuntașă","nuntaselul":"nuntășel","nuntaselule":"nuntășel","nuntaselului":"nuntășel","nuntasi":"nuntaș","nuntasii":"nuntaș","nuntasilor":"nuntaș","nuntasul":"nuntaș","nuntasule":"nuntaș","nuntasului":"nuntaș","nuntea":"nunti","nunteai":"nunti","nunteam":"nunti","nunteati":"nunti","nunteau":"nunti","nuntesc":"nunti","nunteste":"nunti","nuntesti":"nunti","nunti":"nuntă","nunti de argint":"nuntă de argint","nuntia":"nuntie","nuntiala":["nunțială","nunțial","nunțiala","nunțial"],"nuntiale":"nunțial","nuntialele":"nunțial","nuntiali":"nunțial","nuntialii":"nunțial","nuntialul":"nunțial","nuntiaturi":"nunțiatură","nuntiaturii":"nunțiatură","nuntiaturile":"nunțiatură","nuntiaturilor":"nunțiatură","nuntiei":"nuntie","nuntii":["nunții","nuntă","nuntii","nunti","nuntii","nuntie","nunții","nunțiu"],"nuntiii":"nunțiu","nuntiile":"nuntie","nuntiilor":["nuntiilor","nuntie","nunțiilor","nunțiu"],"nuntile":"nuntă","nuntilor":"nuntă","nuntim":"nunti","nuntind":"nunti","nuntira":"nunti","nuntiram":"nunti","nuntirati":"nunti","nuntirea":"nuntire","nuntiri":"nuntire","nuntirii":"nuntire","nuntirile":"nuntire","nuntirilor":"nuntire","nuntise":"nunti","nuntisem":"nunti","nuntisera":"nunti","nuntiseram":"nunti","nuntiserati":"nunti","nuntisesi":"nunti","nuntisi":"nunti","nuntisoare":"nuntișoară","nuntisoarei":"nuntișoară","nuntisoarele":"nuntișoară","nuntisoarelor":"nuntișoară","nuntit":"nunti","nuntita":["nuntită","nuntit","nuntita","nuntit"],"nuntite":["nuntite","nuntit","nuntițe","nuntiță"],"nuntitei":"nuntiță","nuntitele":["nuntitele","nuntit","nuntițele","nuntiță"],"nuntitelor":"nuntiță","nuntiti":["nuntiți","nunti","nuntiți","nuntit"],"nuntitii":"nuntit","nuntitoare":"nuntitor","nuntitoarea":"nuntitor","nuntitoarele":"nuntitor","nuntitori":"nuntitor","nuntitorii":"nuntitor","nuntitorul":"nuntitor","nuntitul":"nuntit","nuntiuul":"nunțiu","nuntiuule":"nunțiu","nuntiuului":"nunțiu","nunul":"nun","nunule":"nun","nunului":"nun","nunuti":"nunuț","nunutii":"nunuț","nunutilor":"nunuț","nunutul":"nunuț","nunutule":"nunuț","nunutului":"nunuț","nuoa":["nuoă","nuou","nuoa","nuou"],"nuoe":"nuou","nuoele":"nuou","nuoi":"nuou","nuoii":"nuou","nuori":"nuor","nuorii":"nuor","nuorilor":"nuor","nuorul":"nuor","nuorule":"nuor","nuorului":"nuor","nuoul":"nuou","nuptiala":["nupțială","nupțial","nupțiala","nupțial"],"nuptiale":"nupțial","nuptialele":"nupțial","nuptiali":"nupțial","nuptialii":"nupțial","nuptialitatea":"nupțialitate","nuptialitati":"nupțialitate","nuptialitatii":"nupțialitate","nuptialitatile":"nupțialitate","nuptialitatilor":"nupțialitate","nuptialul":"nupțial","nurci":"nurcă","nurcii":"nurcă","nurcile":"nurcă","nurcilor":"nurcă","nuri":"nur","nurii":"nur","nurilor":"nur","nurite":"nuriță","nuritei":"nuriță","nuritele":"nuriță","nuritelor":"nuriță","nurlia":"nurliu","nurlie":"nurliu","nurlii":"nurliu","nurliii":"nurliu","nurliile":"nurliu","nurliul":"nurliu","nurori":["nurori","noră","nurori","nuroră"],"nurorii":["nurorii","noră","nurorii","nuroră"],"nurorile":["nurorile","noră","nurorile","nuroră"],"nurorilor":["nurorilor","noră","nurorilor","nuroră"],"nurse":"nursă","nursei":"nursă","nursele":"nursă","nurselor":"nursă","nursingul":"nursing","nursingule":"nursing","nursingului":"nursing","nurul":"nur","nurule":"nur","nurului":"nur","nush":"nu știu","nustul":"nust","nustule":"nust","nustului":"nust","nutatia":"nutație","nutatiei":"nutație","nutatii":"nutație","nutatiile":"nutație","nutatiilor":"nutație","nutatiunea":"nutațiune","nutatiuni":"nutațiune","nutatiunii":"nutațiune","nutatiunile":"nutațiune","nutatiunilor":"nutațiune","nutrea":"nutri","nutreai":"nutri","nutream":"nutri","nutreati":"nutri","nutreau":"nutri","nutreciorul":"nutrecior","nutreciorule":"nutrecior","nutreciorului":"nutrecior","nutresc":"nutri","nutreste":"nutri","nutresti":"nutri","nutretul":"nutreț","nutretule":"nutreț","nutretului":"nutreț","nutreturi":"nutreț","nutreturile":"nutreț","nutreturilor":"nutreț","nutria":"nutrie","nutric":"nutrica","nutricai":"nutrica","nutricam":["nutricăm","nutrica","nutricam","nutrica"],"nutricand":"nutrica","nutricara":"nutrica","nutricaram":"nutrica","nutricarati":"nutrica","nutricase":"nutrica","nutricasem":"nutrica","nutricasera":"nutrica","nutricaseram":"nutrica","nutricaserati":"nutrica","nutricasesi":"nutrica","nutricasi":"nutrica","nutricat":"nutrica","nutricati":"nutrica","nutricau":"nutrica","nutrice":"nutrica","nutrici":"nutrica","nutriei":"nutrie","nutrii":["nutrii","nutri","nutrii","nutrie"],"nutriile":"nutrie","nutriilor":"nutrie","nutrim":"nutri","nutrimente":"nutriment","nutrimentele":"nutriment","nutrimentelor":"nutriment","nutrimentul":"nutriment","nutrimentule":"nutriment","nutrimentului":"nutriment","nutrind":"nutri","nutrira":"nutri","nutriram":"nutri","nutrirati":"nutri","nutrirea":"nutrire","nutriri":"nutrire","nutririi":"nutrire","nutririle":"nutrire","nutririlor":"nutrire","nutrise":"nutri","nutrisem":"nutri","nutrisera":"nutri","nutriseram":"nutri","nutriserati":"nutri","nutrisesi":"nutri","nutrisi":"nutri","nutrit":"nutri","nutrita":["nutrită","nutrit","nutrita","nutrit"],"nutrite":"nutrit","nutritele":"nutrit","nutriti":["nutriți","nutri","nutriți","nutrit"],"nutritia":"nutriție","nutritiei":"nutriție","nutritii":["nutriții","nutrit","nutriții","nutriție"],"nutritiile":"nutriție","nutritiilor":"nutriție","nutritioniste":"nutriționistă","nutritionistei":"nutriționistă","nutritionistele":"nutriționistă","nutritionistelor":"nutriționistă","nutritionisti":"nutriționist","nutritionistii":"nutriționist","nutritionistilor":"nutriționist","nutritionistul":"nutriționist","nutritionistule":"nutriționist","nutritionistului":"nutriționist","nutritiunea":"nutrițiune","nutritiuni":"nutrițiune","nutritiunii":"nutrițiune","nutritiunile":"nutrițiune","nutritiunilor":"nutrițiune","nutritiva":["nutritivă","nutritiv","nutritiva","nutritiv"],"nutritive":"nutritiv","nutritivele":"nutritiv","nutritivi":"nutritiv","nutritivii":"nutritiv","nutritivul":"nutritiv","nutritul":"nutrit","nutrituri":"nutritură","nutriturii":"nutritură","nutriturile":"nutritură","nutriturilor":"nutritură","nuvele":"nuvelă","nuvelei":"nuvelă","nuvelele":"nuvelă","nuvelelor":"nuvelă","nuvelete":"nuveletă","nuveletei":"nuveletă","nuveletele":"nuveletă","nuveletelor":"nuveletă","nuvelice":"nuvelică","nuvelicei":"nuvelică","nuvelicele":"nuvelică","nuvelicelor":"nuvelică","nuvelici":"nuvelică","nuveliste":"nuvelistă","nuvelistei":"nuvelistă","nuvelistele":"nuvelistă","nuvelistelor":"nuvelistă","nuvelisti":"nuvelist","nuvelistica":["nuvelistică","nuvelistic","nuvelistica","nuvelistic"],"nuvelistice":"nuvelistic","nuvelisticele":"nuvelistic","nuvelistici":"nuvelistic","nuvelisticii":"nuvelistic","nuvelisticul":"nuvelistic","nuvelistii":"nuvelist","nuvelistilor":"nuvelist","nuvelistul":"nuvelist","nuvelistule":"nuvelist","nuvelistului":"nuvelist","nuzi":"nud","nuzii":"nud"};
@@ -0,0 +1 @@
+export default {"o":["o","ea","o","un"],"o faca de oaie":"o face de oaie","o ia din loc":"o lua din loc","o incurce":"o încurca","o intoarca ca la ploiesti":"o întoarce ca la Ploiești","o pateste":"o păți","o stearga":"o șterge","o traga":"o trage","o tuleasca":"o tuli","o tuleste":"o tuli","oabla":["oablă","oblu","oabla","oblu"],"oable":"oblu","oablele":"oblu","oachesa":["oacheșă","oacheș","oacheșa","oacheș"],"oachese":"oacheș","oachesele":"oacheș","oachesi":"oacheș","oachesii":"oacheș","oachesul":"oacheș","oaia":"oaie","oale":["oale","oală","oale","ol"],"oale de noapte":"oală de noapte","oalei":"oală","oalele":["oalele","oală","oalele","ol"],"oalelor":["oalelor","oală","oalelor","ol"],"oame":"oamă","oamei":"oamă","oamele":"oamă","oamelor":"oamă","oameni":"om","oameni de actiune":"om de acțiune","oameni de afaceri":"om de afaceri","oameni de finante":"om de finanțe","oameni de legatura":"om de legătură","oameni de lume":"om de lume","oameni de stat":"om de stat","oameni de stiinta":"om de știință","oameni de zapada":"om de zăpadă","oameni mari":"om mare","oameni politici":"om politic","oamenii":"om","oamenilor":"om","oarba":["oarbă","orb","oarba","orb"],"oarbe":["oarbe","oarbă","oarbe","orb"],"oarbele":"orb","oarde":"oardă","oardei":"oardă","oardele":"oardă","oardelor":"oardă","oare":"oară","oarecarei":"oarecare","oarecareia":"oarecare","oarecaror":"oarecare","oarecarora":"oarecare","oarecarui":"oarecare","oarecaruia":"oarecare","oarei":"oară","oarele":"oară","oarelor":"oară","oarfan":"orfan","oarfana":["oarfănă","oarfăn","oarfăna","oarfăn"],"oarfanul":"oarfăn","oarfene":"oarfăn","oarfenele":"oarfăn","oarfeni":"oarfăn","oarfenii":"oarfăn","oarte":"oarță","oartei":"oarță","oarze":"orz","oarzele":"orz","oarzelor":"orz","oase":"os","oase alveolare":"os alveolar","oase coxale":"os coxal","oase iliace":"os iliac","oasele":"os","oaselor":"os","oaspatul":"oaspăt","oaspatule":"oaspăt","oaspatului":"oaspăt","oaspe":"oaspete","oaspele":"oaspe","oaspelui":"oaspe","oaspetele":"oaspete","oaspetelui":"oaspete","oaspeti":["oaspeți","oaspăt","oaspeți","oaspe","oaspeți","oaspete"],"oaspetii":["oaspeții","oaspăt","oaspeții","oaspe","oaspeții","oaspete"],"oaspetilor":["oaspeților","oaspăt","oaspeților","oaspe","oaspeților","oaspete"],"oastea":"oaste","oaze":"oază","oazei":"oază","oazele":"oază","oazelor":"oază","obarchelneri":"obărchelner","obarchelnerii":"obărchelner","obarchelnerilor":"obărchelner","obarchelnerul":"obărchelner","obarchelnerule":"obărchelner","obarchelnerului":"obărchelner","obari":"obăr","obarii":"obăr","obarilor":"obăr","obarsea":"obârși","obarseai":"obârși","obarseam":"obârși","obarseati":"obârși","obarseau":"obârși","obarsenia":"obârșenie","obarseniei":"obârșenie","obarsenii":"obârșenie","obarseniile":"obârșenie","obarseniilor":"obârșenie","obarsesc":"obârși","obarseste":"obârși","obarsesti":"obârși","obarsia":"obârșie","obarsiei":"obârșie","obarsii":["obârșii","obârși","obârșii","obârșie"],"obarsiile":"obârșie","obarsiilor":"obârșie","obarsim":"obârși","obarsind":"obârși","obarsira":"obârși","obarsiram":"obârși","obarsirati":"obârși","obarsirea":"obârșire","obarsiri":"obârșire","obarsirii":"obârșire","obarsirile":"obârșire","obarsirilor":"obârșire","obarsise":"obârși","obarsisem":"obârși","obarsisera":"obârși","obarsiseram":"obârși","obarsiserati":"obârși","obarsisesi":"obârși","obarsisi":"obârși","obarsit":"obârși","obarsiti":"obârși","obarul":"obăr","obarule":"obăr","obarului":"obăr","obcini":"obcină","obcinii":"obcină","obcinile":"obcină","obcinilor":"obcină","obcioare":"obcioară","obcioarei":"obcioară","obcioarele":"obcioară","obcioarelor":"obcioară","obconica":["obconică","obconic","obconica","obconic"],"obconice":"obconic","obconicele":"obconic","obconici":"obconic","obconicii":"obconic","obconicul":"obconic","obeada":"obadă","obedienta":["obedientă","obedient","obedienta","obedient"],"obediente":["obediente","obedient","obediențe","obediență"],"obedientei":"obediență","obedientele":["obedientele","obedient","obediențele","obediență"],"obedientelor":"obediență","obedienti":"obedient","obedientii":"obedient","obedientul":"obedient","obele":"obelă","obelei":"obelă","obelele":"obelă","obelelor":"obelă","obeliscul":"obelisc","obeliscule":"obelisc","obeliscului":"obelisc","obeliscuri":"obelisc","obeliscurile":"obelisc","obeliscurilor":"obelisc","oberchelneri":"oberchelner","oberchelnerii":"oberchelner","oberchelnerilor":"oberchelner","oberchelnerul":"oberchelner","oberchelnerule":"oberchelner","oberchelnerului":"oberchelner","oberecul":"oberec","oberecule":"oberec","oberecului":"oberec","oberecuri":"oberec","oberecurile":"oberec","oberecurilor":"oberec","oberi":"ober","oberii":"ober","oberilor":"ober","oberlihtul":"oberliht","oberlihtule":"oberliht","oberlihtului":"oberliht","oberlihturi":"oberliht","oberlihturile":"oberliht","oberlihturilor":"oberliht","obertaile":"obertail","obertailele":"obertail","obertailelor":"obertail","obertailul":"obertail","obertailule":"obertail","obertailului":"obertail","obertali":"oberțal","obertalii":"oberțal","obertalilor":"oberțal","obertalul":"oberțal","obertalule":"oberțal","obertalului":"oberțal","oberul":"ober","oberule":"ober","oberului":"ober","obeza":["obeză","obez","obeza","obez"],"obeze":["obeze","obeadă","obeze","obez","obeze","obeză"],"obezei":["obezei","obeadă","obezei","obeză"],"obezele":["obezele","obeadă","obezele","obez","obezele","obeză"],"obezelor":["obezelor","obeadă","obezelor","obeză"],"obezi":["obezi","obadă","obezi","obeadă","obezi","obez"],"obezica":["obezică","obezic","obezica","obezic"],"obezice":"obezic","obezicele":"obezic","obezici":"obezic","obezicii":"obezic","obezicul":"obezic","obezii":"obez","obezitatea":"obezitate","obezitati":"obezitate","obezitatii":"obezitate","obezitatile":"obezitate","obezitatilor":"obezitate","obezul":"obez","obiceiul":"obicei","obiceiule":"obicei","obiceiului":"obicei","obiceiuri":"obicei","obiceiurile":"obicei","obiceiurilor":"obicei","obicine":"obicină","obicinei":"obicină","obicinele":"obicină","obicinelor":"obicină","obicinuia":"obicinui","obicinuiai":"obicinui","obicinuiam":"obicinui","obicinuiati":"obicinui","obicinuiau":"obicinui","obicinuiesc":"obicinui","obicinuieste":"obicinui","obicinuiesti":"obicinui","obicinuii":"obicinui","obicinuim":"obicinui","obicinuind":"obicinui","obicinuinte":"obicinuință","obicinuintei":"obicinuință","obicinuintele":"obicinuință","obicinuintelor":"obicinuință","obicinuira":"obicinui","obicinuiram":"obicinui","obicinuirati":"obicinui","obicinuise":"obicinui","obicinuisem":"obicinui","obicinuisera":"obicinui","obicinuiseram":"obicinui","obicinuiserati":"obicinui","obicinuisesi":"obicinui","obicinuisi":"obicinui","obicinuit":"obicinui","obicinuita":["obicinuită","obicinuit","obicinuita","obicinuit"],"obicinuite":"obicinuit","obicinuitele":"obicinuit","obicinuiti":["obicinuiți","obicinui","obicinuiți","obicinuit"],"obicinuitii":"obicinuit","obicinuitul":"obicinuit","obiciuia":"obiciui","obiciuiai":"obiciui","obiciuiam":"obiciui","obiciuiati":"obiciui","obiciuiau":"obiciui","obiciuiesc":"obiciui","obiciuieste":"obiciui","obiciuiesti":"obiciui","obiciuii":"obiciui","obiciuim":"obiciui","obiciuind":"obiciui","obiciuira":"obiciui","obiciuiram":"obiciui","obiciuirati":"obiciui","obiciuise":"obiciui","obiciuisem":"obiciui","obiciuisera":"obiciui","obiciuiseram":"obiciui","obiciuiserati":"obiciui","obiciuisesi":"obiciui","obiciuisi":"obiciui","obiciuit":"obiciui","obiciuita":["obiciuită","obiciuit","obiciuita","obiciuit"],"obiciuite":"obiciuit","obiciuitele":"obiciuit","obiciuiti":["obiciuiți","obiciui","obiciuiți","obiciuit"],"obiciuitii":"obiciuit","obiciuitul":"obiciuit","obicnea":"obicni","obicneai":"obicni","obicneam":"obicni","obicneati":"obicni","obicneau":"obicni","obicnele":"obicneală","obicnelei":"obicneală","obicnelele":"obicneală","obicnelelor":"obicneală","obicneli":"obicneală","obicnesc":"obicni","obicneste":"obicni","obicnesti":"obicni","obicnii":"obicni","obicnim":"obicni","obicnind":"obicni","obicnira":"obicni","obicniram":"obicni","obicnirati":"obicni","obicnise":"obicni","obicnisem":"obicni","obicnisera":"obicni","obicniseram":"obicni","obicniserati":"obicni","obicnisesi":"obicni","obicnisi":"obicni","obicnit":"obicni","obicniti":"obicni","obide":"obidă","obidea":"obidi","obideai":"obidi","obideam":"obidi","obideati":"obidi","obideau":"obidi","obidei":"obidă","obidele":"obidă","obidelor":"obidă","obidesc":"obidi","obideste":"obidi","obidesti":"obidi","obidii":"obidi","obidim":"obidi","obidind":"obidi","obidira":"obidi","obidiram":"obidi","obidirati":"obidi","obidirea":"obidire","obidiri":"obidire","obidirii":"obidire","obidirile":"obidire","obidirilor":"obidire","obidise":"obidi","obidisem":"obidi","obidisera":"obidi","obidiseram":"obidi","obidiserati":"obidi","obidisesi":"obidi","obidisi":"obidi","obidit":"obidi","obidita":["obidită","obidit","obidita","obidit"],"obidite":"obidit","obiditele":"obidit","obiditi":["obidiți","obidi","obidiți","obidit"],"obiditii":"obidit","obiditul":"obidit","obidoasa":["obidoasă","obidos","obidoasa","obidos"],"obidoase":"obidos","obidoasele":"obidos","obidosi":"obidos","obidosii":"obidos","obidosul":"obidos","obiectai":"obiecta","obiectam":["obiectăm","obiecta","obiectam","obiecta"],"obiectand":"obiecta","obiectara":"obiecta","obiectaram":"obiecta","obiectarati":"obiecta","obiectarea":"obiectare","obiectari":"obiectare","obiectarii":"obiectare","obiectarile":"obiectare","obiectarilor":"obiectare","obiectase":"obiecta","obiectasem":"obiecta","obiectasera":"obiecta","obiectaseram":"obiecta","obiectaserati":"obiecta","obiectasesi":"obiecta","obiectasi":"obiecta","obiectat":"obiecta","obiectati":"obiecta","obiectau":"obiecta","obiecte":"obiect","obiecte directe":"obiect direct","obiecte indirecte":"obiect indirect","obiecte transneptuniane":"obiect transneptunian","obiecte zburatoare neidentificate":"obiect zburător neidentificat","obiecteaza":"obiecta","obiectele":"obiect","obiectelor":"obiect","obiectez":"obiecta","obiectezi":"obiecta","obiectia":"obiecție","obiectiei":"obiecție","obiectific":"obiectifica","obiectificai":"obiectifica","obiectificam":["obiectificăm","obiectifica","obiectificam","obiectifica"],"obiectificand":"obiectifica","obiectificara":"obiectifica","obiectificaram":"obiectifica","obiectificarati":"obiectifica","obiectificase":"obiectifica","obiectificasem":"obiectifica","obiectificasera":"obiectifica","obiectificaseram":"obiectifica","obiectificaserati":"obiectifica","obiectificasesi":"obiectifica","obiectificasi":"obiectifica","obiectificat":"obiectifica","obiectificati":"obiectifica","obiectificau":"obiectifica","obiectifici":"obiectifica","obiectii":"obiecție","obiectiile":"obiecție","obiectiilor":"obiecție","obiectiunea":"obiecțiune","obiectiuni":"obiecțiune","obiectiunii":"obiecțiune","obiectiunile":"obiecțiune","obiectiunilor":"obiecțiune","obiectiva":["obiectivă","obiectiv","obiectiva","obiectiv"],"obiectivai":"obiectiva","obiectivam":["obiectivăm","obiectiva","obiectivam","obiectiva"],"obiectivand":"obiectiva","obiectivara":"obiectiva","obiectivaram":"obiectiva","obiectivarati":"obiectiva","obiectivarea":"obiectivare","obiectivari":"obiectivare","obiectivarii":"obiectivare","obiectivarile":"obiectivare","obiectivarilor":"obiectivare","obiectivase":"obiectiva","obiectivasem":"obiectiva","obiectivasera":"obiectiva","obiectivaseram":"obiectiva","obiectivaserati":"obiectiva","obiectivasesi":"obiectiva","obiectivasi":"obiectiva","obiectivat":"obiectiva","obiectivata":["obiectivată","obiectivat","obiectivata","obiectivat"],"obiectivate":"obiectivat","obiectivatele":"obiectivat","obiectivati":["obiectivați","obiectiva","obiectivați","obiectivat"],"obiectivatii":"obiectivat","obiectivatul":"obiectivat","obiectivau":"obiectiva","obiective":"obiectiv","obiectiveaza":"obiectiva","obiectivele":"obiectiv","obiectivelor":"obiectiv","obiectivez":"obiectiva","obiectivezi":"obiectiva","obiectivi":"obiectiv","obiectivii":"obiectiv","obiectivisme":"obiectivism","obiectivismele":"obiectivism","obiectivismelor":"obiectivism","obiectivismul":"obiectivism","obiectivismule":"obiectivism","obiectivismului":"obiectivism","obiectivista":["obiectivistă","obiectivist","obiectivista","obiectivist"],"obiectiviste":"obiectivist","obiectivistele":"obiectivist","obiectivisti":"obiectivist","obiectivistii":"obiectivist","obiectivistul":"obiectivist","obiectivitatea":"obiectivitate","obiectivitati":"obiectivitate","obiectivitatii":"obiectivitate","obiectivizai":"obiectiviza","obiectivizam":["obiectivizăm","obiectiviza","obiectivizam","obiectiviza"],"obiectivizand":"obiectiviza","obiectivizara":"obiectiviza","obiectivizaram":"obiectiviza","obiectivizarati":"obiectiviza","obiectivizarea":"obiectivizare","obiectivizari":"obiectivizare","obiectivizarii":"obiectivizare","obiectivizarile":"obiectivizare","obiectivizarilor":"obiectivizare","obiectivizase":"obiectiviza","obiectivizasem":"obiectiviza","obiectivizasera":"obiectiviza","obiectivizaseram":"obiectiviza","obiectivizaserati":"obiectiviza","obiectivizasesi":"obiectiviza","obiectivizasi":"obiectiviza","obiectivizat":"obiectiviza","obiectivizati":"obiectiviza","obiectivizau":"obiectiviza","obiectivizeaza":"obiectiviza","obiectivizez":"obiectiviza","obiectivizezi":"obiectiviza","obiectivul":"obiectiv","obiectivule":"obiectiv","obiectivului":"obiectiv","obiectuala":["obiectuală","obiectual","obiectuala","obiectual"],"obiectuale":"obiectual","obiectualele":"obiectual","obiectuali":"obiectual","obiectualii":"obiectual","obiectualitatea":"obiectualitate","obiectualitati":"obiectualitate","obiectualitatii":"obiectualitate","obiectualul":"obiectual","obiectul":"obiect","obiectule":"obiect","obiectului":"obiect","obiele":"obială","obielei":"obială","obielele":"obială","obielelor":"obială","obielute":"obieluță","obielutei":"obieluță","obielutele":"obieluță","obielutelor":"obieluță","obijduia":"obijdui","obijduiai":"obijdui","obijduiam":"obijdui","obijduiati":"obijdui","obijduiau":"obijdui","obijduiesc":"obijdui","obijduieste":"obijdui","obijduiesti":"obijdui","obijduii":"obijdui","obijduim":"obijdui","obijduind":"obijdui","obijduira":"obijdui","obijduiram":"obijdui","obijduirati":"obijdui","obijduirea":"obijduire","obijduiri":"obijduire","obijduirii":"obijduire","obijduirile":"obijduire","obijduirilor":"obijduire","obijduise":"obijdui","obijduisem":"obijdui","obijduisera":"obijdui","obijduiseram":"obijdui","obijduiserati":"obijdui","obijduisesi":"obijdui","obijduisi":"obijdui","obijduit":"obijdui","obijduita":["obijduită","obijduit","obijduita","obijduit"],"obijduite":"obijduit","obijduitele":"obijduit","obijduiti":["obijduiți","obijdui","obijduiți","obijduit"],"obijduitii":"obijduit","obijduitoarea":"obijduitoare","obijduitoarei":"obijduitoare","obijduitoarele":"obijduitoare","obijduitoarelor":"obijduitoare","obijduitori":"obijduitor","obijduitorii":"obijduitor","obijduitorilor":"obijduitor","obijduitorul":"obijduitor","obijduitorule":"obijduitor","obijduitorului":"obijduitor","obijduitul":"obijduit","obinzele":"obinzeală","obinzelei":"obinzeală","obinzelele":"obinzeală","obinzelelor":"obinzeală","obisnenia":"obișnenie","obisneniei":"obișnenie","obisnenii":"obișnenie","obisnuia":"obișnui","obisnuiai":"obișnui","obisnuiam":"obișnui","obisnuiati":"obișnui","obisnuiau":"obișnui","obisnuiesc":"obișnui","obisnuieste":"obișnui","obisnuiesti":"obișnui","obisnuii":"obișnui","obisnuim":"obișnui","obisnuind":"obișnui","obisnuinte":"obișnuință","obisnuintei":"obișnuință","obisnuintele":"obișnuință","obisnuintelor":"obișnuință","obisnuira":"obișnui","obisnuiram":"obișnui","obisnuirati":"obișnui","obisnuirea":"obișnuire","obisnuiri":"obișnuire","obisnuirii":"obișnuire","obisnuirile":"obișnuire","obisnuirilor":"obișnuire","obisnuise":"obișnui","obisnuisem":"obișnui","obisnuisera":"obișnui","obisnuiseram":"obișnui","obisnuiserati":"obișnui","obisnuisesi":"obișnui","obisnuisi":"obișnui","obisnuit":"obișnui","obisnuita":["obișnuită","obișnuit","obișnuita","obișnuit"],"obisnuite":"obișnuit","obisnuitele":"obișnuit","obisnuiti":["obișnuiți","obișnui","obișnuiți","obișnuit"],"obisnuitii":"obișnuit","obisnuitul":"obișnuit","objurgatia":"objurgație","objurgatiei":"objurgație","objurgatii":"objurgație","objurgatiile":"objurgație","objurgatiilor":"objurgație","obladuia":"oblădui","obladuiai":"oblădui","obladuiam":"oblădui","obladuiati":"oblădui","obladuiau":"oblădui","obladuiesc":"oblădui","obladuieste":"oblădui","obladuiesti":"oblădui","obladuii":"oblădui","obladuim":"oblădui","obladuind":"oblădui","obladuinte":"oblăduință","obladuintei":"oblăduință","obladuintele":"oblăduință","obladuintelor":"oblăduință","obladuira":"oblădui","obladuiram":"oblădui","obladuirati":"oblădui","obladuirea":"oblăduire","obladuiri":"oblăduire","obladuirii":"oblăduire","obladuirile":"oblăduire","obladuirilor":"oblăduire","obladuise":"oblădui","obladuisem":"oblădui","obladuisera":"oblădui","obladuiseram":"oblădui","obladuiserati":"oblădui","obladuisesi":"oblădui","obladuisi":"oblădui","obladuit":"oblădui","obladuiti":"oblădui","obladuitoare":"oblăduitor","obladuitoarea":"oblăduitor","obladuitoarele":"oblăduitor","obladuitori":"oblăduitor","obladuitorii":"oblăduitor","obladuitorul":"oblăduitor","oblancul":"oblânc","oblancule":"oblânc","oblancului":"oblânc","oblancuri":"oblânc","oblancurile":"oblânc","oblancurilor":"oblânc","oblastieul":"oblastie","oblastieule":"oblastie","oblastieului":"oblastie","oblastii":"oblastie","oblastiile":"oblastie","oblastiilor":"oblastie","oblatia":"oblație","oblatiei":"oblație","oblatii":"oblație","oblatiile":"oblație","oblatiilor":"oblație","obleagaul":"obleagă","obleagaule":"obleagă","obleagaului":"obleagă","oblegi":"obleagă","oblegile":"obleagă","oblegilor":"obleagă","oblete":"obleț","obletele":"oblete","obletelui":"oblete","obleti":["obleți","obleț","obleți","oblete"],"obletii":["obleții","obleț","obleții","oblete"],"obletilor":["obleților","obleț","obleților","oblete"],"obletul":"obleț","obletule":"obleț","obletului":"obleț","obli":"oblu","oblica":["oblică","oblic","oblica","oblic"],"oblice":"oblic","oblicea":"oblici","obliceai":"oblici","obliceam":"oblici","obliceati":"oblici","obliceau":"oblici","oblicele":"oblic","oblicesc":"oblici","obliceste":"oblici","oblicesti":"oblici","oblici":"oblic","oblicii":["oblicii","oblic","oblicii","oblici"],"oblicim":"oblici","oblicind":"oblici","oblicira":"oblici","obliciram":"oblici","oblicirati":"oblici","oblicirea":"oblicire","obliciri":"oblicire","oblicirii":"oblicire","oblicirile":"oblicire","oblicirilor":"oblicire","oblicise":"oblici","oblicisem":"oblici","oblicisera":"oblici","obliciseram":"oblici","obliciserati":"oblici","oblicisesi":"oblici","oblicisi":"oblici","oblicit":"oblici","oblicitatea":"oblicitate","oblicitati":"oblicitate","oblicitatii":"oblicitate","oblicitatile":"oblicitate","oblicitatilor":"oblicitate","obliciti":"oblici","oblicul":"oblic","oblig":"obliga","obligai":"obliga","obligam":["obligăm","obliga","obligam","obliga"],"obligamentul":"obligament","obligamentule":"obligament","obligamentului":"obligament","obligand":"obliga","obligara":"obliga","obligaram":"obliga","obligarati":"obliga","obligarea":"obligare","obligari":"obligare","obligarii":"obligare","obligarile":"obligare","obligarilor":"obligare","obligase":"obliga","obligasem":"obliga","obligasera":"obliga","obligaseram":"obliga","obligaserati":"obliga","obligasesi":"obliga","obligasi":"obliga","obligat":"obliga","obligata":["obligată","obligat","obligata","obligat"],"obligate":"obligat","obligatele":"obligat","obligati":["obligați","obliga","obligați","obligat"],"obligatii":["obligații","obligat","obligații","obligație"],"obligatiunea":"obligațiune","obligatiuni":"obligațiune","obligatiunii":"obligațiune","obligatiunile":"obligațiune","obligatiunilor":"obligațiune","obligativitatea":"obligativitate","obligativitati":"obligativitate","obligativitatii":"obligativitate","obligatoare":"obligator","obligatoarea":"obligator","obligatoarele":"obligator","obligatori":"obligator","obligatoria":["obligatoria","obligatoriu","obligătoria","obligătoriu"],"obligatorie":["obligatorie","obligatoriu","obligătorie","obligătoriu"],"obligatorii":["obligatorii","obligator","obligatorii","obligatoriu","obligătorii","obligătoriu"],"obligatoriii":["obligatoriii","obligatoriu","obligătoriii","obligătoriu"],"obligatoriile":["obligatoriile","obligatoriu","obligătoriile","obligătoriu"],"obligatoriul":["obligatoriul","obligatoriu","obligătoriul","obligătoriu"],"obligatorul":"obligator","obligatul":"obligat","obligau":"obliga","oblige":"obliga","obligene":"obligeană","obligenei":"obligeană","obligenele":"obligeană","obligenelor":"obligeană","obligi":"obliga","oblii":"oblu","obliterai":"oblitera","obliteram":["obliterăm","oblitera","obliteram","oblitera"],"obliterand":"oblitera","obliteranta":["obliterantă","obliterant","obliteranta","obliterant"],"obliterante":"obliterant","obliterantele":"obliterant","obliteranti":"obliterant","obliterantii":"obliterant","obliterantul":"obliterant","obliterara":"oblitera","obliteraram":"oblitera","obliterarati":"oblitera","obliterarea":"obliterare","obliterari":"obliterare","obliterarii":"obliterare","obliterarile":"obliterare","obliterarilor":"obliterare","obliterase":"oblitera","obliterasem":"oblitera","obliterasera":"oblitera","obliteraseram":"oblitera","obliteraserati":"oblitera","obliterasesi":"oblitera","obliterasi":"oblitera","obliterat":"oblitera","obliterata":["obliterată","obliterat","obliterata","obliterat"],"obliterate":"obliterat","obliteratele":"obliterat","obliterati":["obliterați","oblitera","obliterați","obliterat"],"obliteratia":"obliterație","obliteratiei":"obliterație","obliteratii":["obliterații","obliterat","obliterații","obliterație"],"obliteratiile":"obliterație","obliteratiilor":"obliterație","obliteratiunea":"obliterațiune","obliteratiuni":"obliterațiune","obliteratiunii":"obliterațiune","obliteratiunile":"obliterațiune","obliteratiunilor":"obliterațiune","obliteratul":"obliterat","obliterau":"oblitera","oblitereaza":"oblitera","obliterez":"oblitera","obliterezi":"oblitera","oblituri":"oblitură","obliturii":"oblitură","obliturile":"oblitură","obliturilor":"oblitură","obloane":"oblon","obloanele":"oblon","obloanelor":"oblon","oblocase":"oblocaș","oblocasele":"oblocaș","oblocaselor":"oblocaș","oblocasul":"oblocaș","oblocasule":"oblocaș","oblocasului":"oblocaș","oblocele":"oblocel","oblocelele":"oblocel","oblocelelor":"oblocel","oblocelul":"oblocel","oblocelule":"oblocel","oblocelului":"oblocel","oblocute":"oblocuț","oblocutele":"oblocuț","oblocutelor":"oblocuț","oblocutul":"oblocuț","oblocutule":"oblocuț","oblocutului":"oblocuț","oblojea":"obloji","oblojeai":"obloji","oblojeam":"obloji","oblojeati":"obloji","oblojeau":"obloji","oblojele":"oblojeală","oblojelei":"oblojeală","oblojelele":"oblojeală","oblojelelor":"oblojeală","oblojeli":"oblojeală","oblojesc":"obloji","oblojeste":"obloji","oblojesti":"obloji","oblojii":"obloji","oblojim":"obloji","oblojind":"obloji","oblojira":"obloji","oblojiram":"obloji","oblojirati":"obloji","oblojirea":"oblojire","oblojiri":"oblojire","oblojirii":"oblojire","oblojirile":"oblojire","oblojirilor":"oblojire","oblojise":"obloji","oblojisem":"obloji","oblojisera":"obloji","oblojiseram":"obloji","oblojiserati":"obloji","oblojisesi":"obloji","oblojisi":"obloji","oblojit":"obloji","oblojita":["oblojită","oblojit","oblojita","oblojit"],"oblojite":"oblojit","oblojitele":"oblojit","oblojiti":["oblojiți","obloji","oblojiți","oblojit"],"oblojitii":"oblojit","oblojitul":"oblojit","oblomovismul":"oblomovism","oblomovismule":"oblomovism","oblomovismului":"oblomovism","oblonase":"oblonaș","oblonasele":"oblonaș","oblonaselor":"oblonaș","oblonasul":"oblonaș","oblonasule":"oblonaș","oblonasului":"oblonaș","oblonea":"obloni","obloneai":"obloni","obloneam":"obloni","obloneati":"obloni","obloneau":"obloni","oblonesc":"obloni","obloneste":"obloni","oblonesti":"obloni","oblonga":["oblongă","oblong","oblonga","oblong"],"oblonge":"oblong","oblongele":"oblong","oblongi":"oblong","oblongii":"oblong","oblongul":"oblong","oblonii":"obloni","oblonim":"obloni","oblonind":"obloni","oblonira":"obloni","obloniram":"obloni","oblonirati":"obloni","oblonise":"obloni","oblonisem":"obloni","oblonisera":"obloni","obloniseram":"obloni","obloniserati":"obloni","oblonisesi":"obloni","oblonisi":"obloni","oblonit":"obloni","oblonita":["oblonită","oblonit","oblonita","oblonit"],"oblonite":"oblonit","oblonitele":"oblonit","obloniti":["obloniți","obloni","obloniți","oblonit"],"oblonitii":"oblonit","oblonitul":"oblonit","oblonul":"oblon","oblonule":"oblon","oblonului":"oblon","oblul":"oblu","obnovlenia":"obnovlenie","obnovleniei":"obnovlenie","obnovlenii":"obnovlenie","obnovleniile":"obnovlenie","obnovleniilor":"obnovlenie","obnubilai":"obnubila","obnubilam":["obnubilăm","obnubila","obnubilam","obnubila"],"obnubiland":"obnubila","obnubilara":"obnubila","obnubilaram":"obnubila","obnubilarati":"obnubila","obnubilarea":"obnubilare","obnubilari":"obnubilare","obnubilarii":"obnubilare","obnubilarile":"obnubilare","obnubilarilor":"obnubilare","obnubilase":"obnubila","obnubilasem":"obnubila","obnubilasera":"obnubila","obnubilaseram":"obnubila","obnubilaserati":"obnubila","obnubilasesi":"obnubila","obnubilasi":"obnubila","obnubilat":"obnubila","obnubilati":"obnubila","obnubilatia":"obnubilație","obnubilatiei":"obnubilație","obnubilatii":"obnubilație","obnubilatiile":"obnubilație","obnubilatiilor":"obnubilație","obnubilatiunea":"obnubilațiune","obnubilatiuni":"obnubilațiune","obnubilatiunii":"obnubilațiune","obnubilatiunile":"obnubilațiune","obnubilatiunilor":"obnubilațiune","obnubilau":"obnubila","obnubileaza":"obnubila","obnubilez":"obnubila","obnubilezi":"obnubila","oboaie":"oboi","oboaiele":"oboi","oboaielor":"oboi","oboara":"oborî","oboare":"obor","oboarele":"obor","oboarelor":"obor","oboiste":"oboistă","oboistei":"oboistă","oboistele":"oboistă","oboistelor":"oboistă","oboisti":"oboist","oboistii":"oboist","oboistilor":"oboist","oboistul":"oboist","oboistule":"oboist","oboistului":"oboist","oboiul":"oboi","oboiule":"oboi","oboiului":"oboi","obolul":"obol","obolule":"obol","obolului":"obol","oboluri":"obol","obolurile":"obol","obolurilor":"obol","obor":"oborî","obora":"oborî","oborai":["oborai","oborî","oborâi","oborî"],"oboram":["oborâm","oborî","oboram","oborî"],"oborand":"oborî","oborara":"oborî","oboraram":"oborî","oborarati":"oborî","oborase":["oborașe","oboraș","oborâse","oborî"],"oborasele":"oboraș","oboraselor":"oboraș","oborasem":"oborî","oborasera":"oborî","oboraseram":"oborî","oboraserati":"oborî","oborasesi":"oborî","oborasi":"oborî","oborasul":"oboraș","oborasule":"oboraș","oborasului":"oboraș","oborati":["oborâți","oborî","oborați","oborî"],"oborau":"oborî","oboreane":"oboreană","oboreanei":"oboreană","oboreanele":"oboreană","oboreanelor":"oboreană","oboreanul":"oborean","oboreanule":"oborean","oboreanului":"oborean","oborele":"oborel","oborelele":"oborel","oborelelor":"oborel","oborelul":"oborel","oborelule":"oborel","oborelului":"oborel","oboreni":"oborean","oborenii":"oborean","oborenilor":"oborean","oborit":"oborî","oboroace":["oboroace","oboroacă","oboroace","oboroc"],"oboroacei":"oboroacă","oboroacele":["oboroacele","oboroacă","oboroacele","oboroc"],"oboroacelor":["oboroacelor","oboroacă","oboroacelor","oboroc"],"oborocele":["oborocele","oboroceală","oborocele","oborocel"],"oborocelei":"oboroceală","oborocelele":["oborocelele","oboroceală","oborocelele","oborocel"],"oborocelelor":["oborocelelor","oboroceală","oborocelelor","oborocel"],"oboroceli":"oboroceală","oborocelul":"oborocel","oborocelule":"oborocel","oborocelului":"oborocel","oborocul":"oboroc","oborocule":"oboroc","oborocului":"oboroc","oborul":"obor","oborule":"obor","oborului":"obor","obosea":"obosi","oboseai":"obosi","oboseam":"obosi","oboseati":"obosi","oboseau":"obosi","oboseli":"oboseală","obosesc":"obosi","oboseste":"obosi","obosesti":"obosi","obosii":"obosi","obosim":"obosi","obosind":"obosi","obosira":"obosi","obosiram":"obosi","obosirati":"obosi","obosirea":"obosire","obosiri":"obosire","obosirii":"obosire","obosirile":"obosire","obosirilor":"obosire","obosise":"obosi","obosisem":"obosi","obosisera":"obosi","obosiseram":"obosi","obosiserati":"obosi","obosisesi":"obosi","obosisi":"obosi","obosit":"obosi","obosita":["obosită","obosit","obosita","obosit"],"obosite":"obosit","obositele":"obosit","obositi":["obosiți","obosi","obosiți","obosit"],"obositii":"obosit","obositoare":"obositor","obositoarea":"obositor","obositoarele":"obositor","obositori":"obositor","obositorii":"obositor","obositorul":"obositor","obositul":"obosit","obovala":["obovală","oboval","obovala","oboval"],"obovale":"oboval","obovalele":"oboval","obovali":"oboval","obovalii":"oboval","obovalul":"oboval","obovata":["obovată","obovat","obovata","obovat"],"obovate":"obovat","obovatele":"obovat","obovati":"obovat","obovatii":"obovat","obovatul":"obovat","obracea":"obrăci","obraceai":"obrăci","obraceam":"obrăci","obraceati":"obrăci","obraceau":"obrăci","obracesc":"obrăci","obraceste":"obrăci","obracesti":"obrăci","obracii":"obrăci","obracim":"obrăci","obracind":"obrăci","obracinici":"obrăcinic","obracinicii":"obrăcinic","obracinicilor":"obrăcinic","obracinicul":"obrăcinic","obracinicule":"obrăcinic","obracinicului":"obrăcinic","obracira":"obrăci","obraciram":"obrăci","obracirati":"obrăci","obracise":"obrăci","obracisem":"obrăci","obracisera":"obrăci","obraciseram":"obrăci","obraciserati":"obrăci","obracisesi":"obrăci","obracisi":"obrăci","obracit":"obrăci","obraciti":"obrăci","obrajei":"obrăjel","obrajeli":"obrăjel","obrajelii":"obrăjel","obrajelilor":"obrăjel","obrajelul":"obrăjel","obrajelule":"obrăjel","obrajelului":"obrăjel","obraji":"obraz","obrajii":"obraz","obrajilor":"obraz","obrajori":"obrăjor","obrajorii":"obrăjor","obrajorilor":"obrăjor","obrajorul":"obrăjor","obrajorule":"obrăjor","obrajorului":"obrăjor","obrancaul":"obrâncă","obrancaule":"obrâncă","obrancaului":"obrâncă","obranci":"obrâncă","obrancile":"obrâncă","obrancilor":"obrâncă","obranite":"obraniță","obranitei":"obraniță","obranitele":"obraniță","obranitelor":"obraniță","obrantea":"obrânti","obranteai":"obrânti","obranteam":"obrânti","obranteati":"obrânti","obranteau":"obrânti","obrantele":"obrânteală","obrantelei":"obrânteală","obrantelele":"obrânteală","obrantelelor":"obrânteală","obranteli":"obrânteală","obrantesc":"obrânti","obranteste":"obrânti","obrantesti":"obrânti","obrantii":"obrânti","obrantim":"obrânti","obrantind":"obrânti","obrantira":"obrânti","obrantiram":"obrânti","obrantirati":"obrânti","obrantise":"obrânti","obrantisem":"obrânti","obrantisera":"obrânti","obrantiseram":"obrânti","obrantiserati":"obrânti","obrantisesi":"obrânti","obrantisi":"obrânti","obrantit":"obrânti","obrantiti":"obrânti","obrazare":"obrăzar","obrazarele":"obrăzar","obrazarelor":"obrăzar","obrazarul":"obrăzar","obrazarule":"obrăzar","obrazarului":"obrăzar","obrazata":["obrăzată","obrăzat","obrăzata","obrăzat"],"obrazate":"obrăzat","obrazatele":"obrăzat","obrazati":"obrăzat","obrazatii":"obrăzat","obrazatul":"obrăzat","obraze":"obrază","obrazei":"obrază","obrazele":"obrază","obrazelor":"obrază","obrazirea":"obrazire","obraziri":"obrazire","obrazirii":"obrazire","obrazirile":"obrazire","obrazirilor":"obrazire","obrazitul":"obrăzit","obrazitule":"obrăzit","obrazitului":"obrăzit","obraznica":["obraznică","obraznic","obraznica","obraznic"],"obraznicaturi":"obrăznicătură","obraznicaturii":"obrăznicătură","obraznicaturile":"obrăznicătură","obraznicaturilor":"obrăznicătură","obraznice":"obraznic","obraznicea":"obrăznici","obrazniceai":"obrăznici","obrazniceam":"obrăznici","obrazniceati":"obrăznici","obrazniceau":"obrăznici","obraznicele":["obraznicele","obraznic","obrăznicele","obrăzniceală"],"obraznicelei":"obrăzniceală","obraznicelele":"obrăzniceală","obraznicelelor":"obrăzniceală","obrazniceli":"obrăzniceală","obraznicesc":"obrăznici","obrazniceste":"obrăznici","obraznicesti":"obrăznici","obraznici":"obraznic","obraznicia":"obrăznicie","obrazniciei":"obrăznicie","obraznicii":["obraznicii","obraznic","obrăznicii","obrăznici","obrăznicii","obrăznicie"],"obrazniciile":"obrăznicie","obrazniciilor":"obrăznicie","obraznicim":"obrăznici","obraznicind":"obrăznici","obraznicira":"obrăznici","obrazniciram":"obrăznici","obraznicirati":"obrăznici","obraznicirea":"obrăznicire","obrazniciri":"obrăznicire","obraznicirii":"obrăznicire","obraznicirile":"obrăznicire","obraznicirilor":"obrăznicire","obraznicise":"obrăznici","obraznicisem":"obrăznici","obraznicisera":"obrăznici","obrazniciseram":"obrăznici","obrazniciserati":"obrăznici","obraznicisesi":"obrăznici","obraznicisi":"obrăznici","obraznicit":"obrăznici","obrazniciti":"obrăznici","obraznicul":"obraznic","obraznicuta":["obrăznicuță","obrăznicuț","obrăznicuța","obrăznicuț"],"obraznicute":"obrăznicuț","obraznicutele":"obrăznicuț","obraznicuti":"obrăznicuț","obraznicutii":"obrăznicuț","obraznicutul":"obrăznicuț","obrazuia":"obrăzui","obrazuiai":"obrăzui","obrazuiam":"obrăzui","obrazuiati":"obrăzui","obrazuiau":"obrăzui","obrazuiesc":"obrăzui","obrazuieste":"obrăzui","obrazuiesti":"obrăzui","obrazuii":"obrăzui","obrazuim":"obrăzui","obrazuind":"obrăzui","obrazuira":"obrăzui","obrazuiram":"obrăzui","obrazuirati":"obrăzui","obrazuise":"obrăzui","obrazuisem":"obrăzui","obrazuisera":"obrăzui","obrazuiseram":"obrăzui","obrazuiserati":"obrăzui","obrazuisesi":"obrăzui","obrazuisi":"obrăzui","obrazuit":"obrăzui","obrazuiti":"obrăzui","obrazul":"obraz","obrazule":"obraz","obrazului":"obraz","obreje":"obrejă","obrejei":"obrejă","obrejele":"obrejă","obrejelor":"obrejă","obretenia":"obretenie","obreteniei":"obretenie","obretenii":"obretenie","obreteniile":"obretenie","obreteniilor":"obretenie","obrezania":"obrezanie","obrezaniei":"obrezanie","obrezanii":"obrezanie","obrezaniile":"obrezanie","obrezaniilor":"obrezanie","obrezuia":"obrezui","obrezuiai":"obrezui","obrezuiam":"obrezui","obrezuiati":"obrezui","obrezuiau":"obrezui","obrezuiesc":"obrezui","obrezuieste":"obrezui","obrezuiesti":"obrezui","obrezuii":"obrezui","obrezuim":"obrezui","obrezuind":"obrezui","obrezuira":"obrezui","obrezuiram":"obrezui","obrezuirati":"obrezui","obrezuirea":"obrezuire","obrezuiri":"obrezuire","obrezuirii":"obrezuire","obrezuirile":"obrezuire","obrezuirilor":"obrezuire","obrezuise":"obrezui","obrezuisem":"obrezui","obrezuisera":"obrezui","obrezuiseram":"obrezui","obrezuiserati":"obrezui","obrezuisesi":"obrezui","obrezuisi":"obrezui","obrezuit":"obrezui","obrezuiti":"obrezui","obrintea":"obrinti","obrinteai":"obrinti","obrinteam":"obrinti","obrinteati":"obrinti","obrinteau":"obrinti","obrintele":"obrinteală","obrintelei":"obrinteală","obrintelele":"obrinteală","obrintelelor":"obrinteală","obrinteli":"obrinteală","obrintesc":"obrinti","obrinteste":"obrinti","obrintesti":"obrinti","obrintii":"obrinti","obrintim":"obrinti","obrintind":"obrinti","obrintira":"obrinti","obrintiram":"obrinti","obrintirati":"obrinti","obrintise":"obrinti","obrintisem":"obrinti","obrintisera":"obrinti","obrintiseram":"obrinti","obrintiserati":"obrinti","obrintisesi":"obrinti","obrintisi":"obrinti","obrintit":"obrinti","obrintiti":"obrinti","obrintituri":"obrintitură","obrintiturii":"obrintitură","obrintiturile":"obrintitură","obrintiturilor":"obrintitură","obroace":"obroc","obroacele":"obroc","obroacelor":"obroc","obrocea":"obroci","obroceai":"obroci","obroceam":"obroci","obroceati":"obroci","obroceau":"obroci","obrocesc":"obroci","obroceste":"obroci","obrocesti":"obroci","obrocicele":"obrocică","obrocicelei":"obrocică","obrocicelele":"obrocică","obrocicelelor":"obrocică","obrocii":"obroci","obrocim":"obroci","obrocind":"obroci","obrocira":"obroci","obrociram":"obroci","obrocirati":"obroci","obrocise":"obroci","obrocisem":"obroci","obrocisera":"obroci","obrociseram":"obroci","obrociserati":"obroci","obrocisesi":"obroci","obrocisi":"obroci","obrocit":"obroci","obrociti":"obroci","obrocul":"obroc","obrocule":"obroc","obrocului":"obroc","obscena":["obscenă","obscen","obscena","obscen"],"obscene":"obscen","obscenele":"obscen","obsceni":"obscen","obscenii":"obscen","obscenitatea":"obscenitate","obscenitati":"obscenitate","obscenitatii":"obscenitate","obscenitatile":"obscenitate","obscenitatilor":"obscenitate","obscenul":"obscen","obscura":["obscură","obscur","obscura","obscur"],"obscurai":"obscura","obscuram":["obscurăm","obscura","obscuram","obscura"],"obscurand":"obscura","obscurantismul":"obscurantism","obscurantismule":"obscurantism","obscurantismului":"obscurantism","obscurantiste":"obscurantistă","obscurantistei":"obscurantistă","obscurantistele":"obscurantistă","obscurantistelor":"obscurantistă","obscurantistul":"obscurantist","obscurantistule":"obscurantist","obscurantistului":"obscurantist","obscurara":"obscura","obscuraram":"obscura","obscurarati":"obscura","obscurarea":"obscurare","obscurari":"obscurare","obscurarii":"obscurare","obscurarile":"obscurare","obscurarilor":"obscurare","obscurase":"obscura","obscurasem":"obscura","obscurasera":"obscura","obscuraseram":"obscura","obscuraserati":"obscura","obscurasesi":"obscura","obscurasi":"obscura","obscurat":"obscura","obscurata":["obscurată","obscurat","obscurata","obscurat"],"obscurate":"obscurat","obscuratele":"obscurat","obscurati":["obscurați","obscura","obscurați","obscurat"],"obscuratii":"obscurat","obscuratul":"obscurat","obscurau":"obscura","obscure":"obscur","obscureaza":"obscura","obscurele":"obscur","obscurez":"obscura","obscurezi":"obscura","obscuri":"obscur","obscurii":"obscur","obscuritatea":"obscuritate","obscuritati":"obscuritate","obscuritatii":"obscuritate","obscurizai":"obscuriza","obscurizam":["obscurizăm","obscuriza","obscurizam","obscuriza"],"obscurizand":"obscuriza","obscurizara":"obscuriza","obscurizaram":"obscuriza","obscurizarati":"obscuriza","obscurizarea":"obscurizare","obscurizari":"obscurizare","obscurizarii":"obscurizare","obscurizarile":"obscurizare","obscurizarilor":"obscurizare","obscurizase":"obscuriza","obscurizasem":"obscuriza","obscurizasera":"obscuriza","obscurizaseram":"obscuriza","obscurizaserati":"obscuriza","obscurizasesi":"obscuriza","obscurizasi":"obscuriza","obscurizat":"obscuriza","obscurizata":["obscurizată","obscurizat","obscurizata","obscurizat"],"obscurizate":"obscurizat","obscurizatele":"obscurizat","obscurizati":["obscurizați","obscuriza","obscurizați","obscurizat"],"obscurizatii":"obscurizat","obscurizatul":"obscurizat","obscurizau":"obscuriza","obscurizeaza":"obscuriza","obscurizez":"obscuriza","obscurizezi":"obscuriza","obscurul":"obscur","obscutantisti":"obscurantist","obscutantistii":"obscurantist","obscutantistilor":"obscurantist","obsecratia":"obsecrație","obsecratiei":"obsecrație","obsecratii":"obsecrație","obsecratiile":"obsecrație","obsecratiilor":"obsecrație","obsecratiunea":"obsecrațiune","obsecratiuni":"obsecrațiune","obsecratiunii":"obsecrațiune","obsecratiunile":"obsecrațiune","obsecratiunilor":"obsecrațiune","obsecventa":["obsecventă","obsecvent","obsecventa","obsecvent"],"obsecvente":"obsecvent","obsecventele":"obsecvent","obsecventi":"obsecvent","obsecventii":"obsecvent","obsecventul":"obsecvent","obsecvioasa":["obsecvioasă","obsecvios","obsecvioasa","obsecvios"],"obsecvioase":"obsecvios","obsecvioasele":"obsecvios","obsecviosi":"obsecvios","obsecviosii":"obsecvios","obsecviosul":"obsecvios","obsecviozitatea":"obsecviozitate","obsecviozitati":"obsecviozitate","obsecviozitatii":"obsecviozitate","obsecviozitatile":"obsecviozitate","obsecviozitatilor":"obsecviozitate","obsedai":"obseda","obsedam":["obsedăm","obseda","obsedam","obseda"],"obsedand":"obseda","obsedanta":["obsedantă","obsedant","obsedanta","obsedant"],"obsedante":"obsedant","obsedantele":"obsedant","obsedanti":"obsedant","obsedantii":"obsedant","obsedantul":"obsedant","obsedara":"obseda","obsedaram":"obseda","obsedarati":"obseda","obsedarea":"obsedare","obsedari":"obsedare","obsedarii":"obsedare","obsedarile":"obsedare","obsedarilor":"obsedare","obsedase":"obseda","obsedasem":"obseda","obsedasera":"obseda","obsedaseram":"obseda","obsedaserati":"obseda","obsedasesi":"obseda","obsedasi":"obseda","obsedat":"obseda","obsedata":["obsedată","obsedat","obsedata","obsedat"],"obsedate":["obsedate","obsedat","obsedate","obsedată"],"obsedatei":"obsedată","obsedatele":["obsedatele","obsedat","obsedatele","obsedată"],"obsedatelor":"obsedată","obsedati":["obsedați","obseda","obsedați","obsedat"],"obsedatii":"obsedat","obsedatul":"obsedat","obsedau":"obseda","obsedeaza":"obseda","obsedez":"obseda","obsedezi":"obseda","observ":"observa","observabila":["observabilă","observabil","observabila","observabil"],"observabile":"observabil","observabilele":"observabil","observabili":"observabil","observabilii":"observabil","observabilul":"observabil","observai":"observa","observam":["observăm","observa","observam","observa"],"observand":"observa","observanta":["observantă","observant","observanta","observant"],"observante":["observante","observant","observanțe","observanță"],"observantei":"observanță","observantele":["observantele","observant","observanțele","observanță"],"observantelor":"observanță","observanti":"observant","observantii":"observant","observantul":"observant","observara":"observa","observaram":"observa","observarati":"observa","observarea":"observare","observari":"observare","observarii":"observare","observarile":"observare","observarilor":"observare","observaris":"observarisi","observarise":"observarisi","observarisea":"observarisi","observariseai":"observarisi","observariseam":"observarisi","observariseati":"observarisi","observariseau":"observarisi","observarisie":"observarisi","observarisii":"observarisi","observarisim":"observarisi","observarisind":"observarisi","observarisira":"observarisi","observarisiram":"observarisi","observarisirati":"observarisi","observarisise":"observarisi","observarisisem":"observarisi","observarisisera":"observarisi","observarisiseram":"observarisi","observarisiserati":"observarisi","observarisisesi":"observarisi","observarisisi":"observarisi","observarisit":"observarisi","observarisiti":"observarisi","observase":"observa","observasem":"observa","observasera":"observa","observaseram":"observa","observaserati":"observa","observasesi":"observa","observasi":"observa","observat":"observa","observati":"observa","observatia":"observație","observatiei":"observație","observatii":"observație","observatiile":"observație","observatiilor":"observație","observationala":["observațională","observațional","observaționala","observațional"],"observationale":"observațional","observationalele":"observațional","observationali":"observațional","observationalii":"observațional","observationalul":"observațional","observatiunea":"observațiune","observatiuni":"observațiune","observatiunii":"observațiune","observatiunile":"observațiune","observatiunilor":"observațiune","observatoare":"observator","observatoare astronomice":"observator astronomic","observatoarele":"observator","observatoarelor":"observator","observatori":"observator","observatorii":"observator","observatorilor":"observator","observatorul":"observator","observatorule":"observator","observatorului":"observator","observau":"observa","observe":"observa","observi":"observa","obsesia":"obsesie","obsesiei":"obsesie","obsesii":"obsesie","obsesiile":"obsesie","obsesiilor":"obsesie","obsesionala":["obsesională","obsesional","obsesionala","obsesional"],"obsesionale":"obsesional","obsesionalele":"obsesional","obsesionali":"obsesional","obsesionalii":"obsesional","obsesionalul":"obsesional","obsesiunea":"obsesiune","obsesiuni":"obsesiune","obsesiunii":"obsesiune","obsesiunile":"obsesiune","obsesiunilor":"obsesiune","obsesiva":["obsesivă","obsesiv","obsesiva","obsesiv"],"obsesive":"obsesiv","obsesivele":"obsesiv","obsesivi":"obsesiv","obsesivii":"obsesiv","obsesivul":"obsesiv","obsidiane":"obsidian","obsidianele":"obsidian","obsidianelor":"obsidian","obsidianul":"obsidian","obsidianule":"obsidian","obsidianului":"obsidian","obsidiunea":"obsidiune","obsidiuni":"obsidiune","obsidiunii":"obsidiune","obsidiunile":"obsidiune","obsidiunilor":"obsidiune","obsige":"obsigă","obsigei":"obsigă","obsitari":"obșitar","obsitarii":"obșitar","obsitarilor":"obșitar","obsitarul":"obșitar","obsitarule":"obșitar","obsitarului":"obșitar","obstacole":"obstacol","obstacul":"obstacol","obstacule":"obstacul","obstaculele":"obstacul","obstaculelor":"obstacul","obstaculul":"obstacul","obstaculule":"obstacul","obstaculului":"obstacul","obstea":["obștea","obște","obștea","obști"],"obsteai":"obști","obsteam":"obști","obsteasca":["obștească","obștesc","obșteasca","obștesc"],"obsteati":"obști","obsteau":"obști","obstejiteli":"obștejitel","obstejitelii":"obștejitel","obstejitelilor":"obștejitel","obstejitelul":"obștejitel","obstejitelule":"obștejitel","obstejitelului":"obștejitel","obstejitia":"obștejitie","obstejitiei":"obștejitie","obstejitii":"obștejitie","obstejitiile":"obștejitie","obstejitiilor":"obștejitie","obstenia":"obștenie","obsteniei":"obștenie","obstenii":"obștenie","obstesc":"obști","obstescul":"obștesc","obsteste":"obști","obstesti":["obștești","obștesc","obștești","obști"],"obstestii":"obștesc","obstestile":"obștesc","obstetrica":["obstetrică","obstetric","obstetrica","obstetric"],"obstetricala":["obstetricală","obstetrical","obstetricala","obstetrical"],"obstetricale":"obstetrical","obstetricalele":"obstetrical","obstetricali":"obstetrical","obstetricalii":"obstetrical","obstetricalul":"obstetrical","obstetrice":"obstetric","obstetricele":"obstetric","obstetrici":["obstetrici","obstetric","obstetrici","obstetrică"],"obstetricianul":"obstetrician","obstetricianule":"obstetrician","obstetricianului":"obstetrician","obstetriciene":"obstetriciană","obstetricienei":"obstetriciană","obstetricienele":"obstetriciană","obstetricienelor":"obstetriciană","obstetricieni":"obstetrician","obstetricienii":"obstetrician","obstetricienilor":"obstetrician","obstetricii":["obstetricii","obstetric","obstetricii","obstetrică"],"obstetricile":"obstetrică","obstetricilor":"obstetrică","obstetricul":"obstetric","obsti":"obște","obstia":"obștie","obstiei":"obștie","obstii":["obștii","obște","obștii","obști","obștii","obștie"],"obstiile":"obștie","obstiilor":"obștie","obstile":"obște","obstilor":"obște","obstim":"obști","obstimea":"obștime","obstimi":"obștime","obstimii":"obștime","obstinai":"obstina","obstinam":["obstinăm","obstina","obstinam","obstina"],"obstinand":"obstina","obstinara":"obstina","obstinaram":"obstina","obstinarati":"obstina","obstinase":"obstina","obstinasem":"obstina","obstinasera":"obstina","obstinaseram":"obstina","obstinaserati":"obstina","obstinasesi":"obstina","obstinasi":"obstina","obstinat":"obstina","obstinata":["obstinată","obstinat","obstinata","obstinat"],"obstinate":"obstinat","obstinatele":"obstinat","obstinati":["obstinați","obstina","obstinați","obstinat"],"obstinatia":"obstinație","obstinatiei":"obstinație","obstinatii":["obstinații","obstinat","obstinații","obstinație"],"obstinatiile":"obstinație","obstinatiilor":"obstinație","obstinatiunea":"obstinațiune","obstinatiuni":"obstinațiune","obstinatiunii":"obstinațiune","obstinatiunile":"obstinațiune","obstinatiunilor":"obstinațiune","obstinatul":"obstinat","obstinau":"obstina","obstind":"obști","obstineaza":"obstina","obstinez":"obstina","obstinezi":"obstina","obstira":"obști","obstiram":"obști","obstirati":"obști","obstirea":"obștire","obstiri":"obștire","obstirii":"obștire","obstirile":"obștire","obstirilor":"obștire","obstise":"obști","obstisem":"obști","obstisera":"obști","obstiseram":"obști","obstiserati":"obști","obstisesi":"obști","obstisi":"obști","obstit":"obști","obstiti":"obști","obstruai":"obstrua","obstruam":["obstruăm","obstrua","obstruam","obstrua"],"obstruand":"obstrua","obstruanta":["obstruantă","obstruant","obstruanta","obstruant"],"obstruante":"obstruant","obstruantele":"obstruant","obstruanti":"obstruant","obstruantii":"obstruant","obstruantul":"obstruant","obstruara":"obstrua","obstruaram":"obstrua","obstruarati":"obstrua","obstruase":"obstrua","obstruasem":"obstrua","obstruasera":"obstrua","obstruaseram":"obstrua","obstruaserati":"obstrua","obstruasesi":"obstrua","obstruasi":"obstrua","obstruat":"obstrua","obstruata":["obstruată","obstruat","obstruata","obstruat"],"obstruate":"obstruat","obstruatele":"obstruat","obstruati":["obstruați","obstrua","obstruați","obstruat"],"obstruatii":"obstruat","obstruatul":"obstruat","obstruau":"obstrua","obstructia":"obstrucție","obstructiei":"obstrucție","obstructii":"obstrucție","obstructii intestinale":"obstrucție intestinală","obstructiile":"obstrucție","obstructiilor":"obstrucție","obstructionai":"obstrucționa","obstructionam":["obstrucționăm","obstrucționa","obstrucționam","obstrucționa"],"obstructionand":"obstrucționa","obstructionara":"obstrucționa","obstructionaram":"obstrucționa","obstructionarati":"obstrucționa","obstructionase":"obstrucționa","obstructionasem":"obstrucționa","obstructionasera":"obstrucționa","obstructionaseram":"obstrucționa","obstructionaserati":"obstrucționa","obstructionasesi":"obstrucționa","obstructionasi":"obstrucționa","obstructionat":"obstrucționa","obstructionati":"obstrucționa","obstructionau":"obstrucționa","obstructioneaza":"obstrucționa","obstructionez":"obstrucționa","obstructionezi":"obstrucționa","obstructionisme":"obstrucționism","obstructionismele":"obstrucționism","obstructionismelor":"obstrucționism","obstructionismul":"obstrucționism","obstructionismule":"obstrucționism","obstructionismului":"obstrucționism","obstructioniste":"obstrucționistă","obstructionistei":"obstrucționistă","obstructionistele":"obstrucționistă","obstructionistelor":"obstrucționistă","obstructionisti":"obstrucționist","obstructionistii":"obstrucționist","obstructionistilor":"obstrucționist","obstructionistul":"obstrucționist","obstructionistule":"obstrucționist","obstructionistului":"obstrucționist","obstructiunea":"obstrucțiune","obstructiuni":"obstrucțiune","obstructiunii":"obstrucțiune","obstructiunile":"obstrucțiune","obstructiunilor":"obstrucțiune","obstructiva":["obstructivă","obstructiv","obstructiva","obstructiv"],"obstructive":"obstructiv","obstructivele":"obstructiv","obstructivi":"obstructiv","obstructivii":"obstructiv","obstructivul":"obstructiv","obstructoare":"obstructor","obstructoarea":"obstructor","obstructoarele":"obstructor","obstructori":"obstructor","obstructorii":"obstructor","obstructorul":"obstructor","obstrueaza":"obstrua","obstruez":"obstrua","obstruezi":"obstrua","obtentiunea":"obtențiune","obtentiuni":"obtențiune","obtentiunii":"obtențiune","obtentiunile":"obtențiune","obtentiunilor":"obtențiune","obtii":"obține","obtin":"obține","obtina":"obține","obtinand":"obține","obtinea":"obține","obtineai":"obține","obtineam":"obține","obtineati":"obține","obtineau":"obține","obtinem":"obține","obtinerea":"obținere","obtineri":"obținere","obtinerii":"obținere","obtinerile":"obținere","obtinerilor":"obținere","obtineti":"obține","obtinu":"obține","obtinui":"obține","obtinura":"obține","obtinuram":"obține","obtinurati":"obține","obtinuse":"obține","obtinusem":"obține","obtinusera":"obține","obtinuseram":"obține","obtinuserati":"obține","obtinusesi":"obține","obtinusi":"obține","obtinut":"obține","obturai":"obtura","obturam":["obturăm","obtura","obturam","obtura"],"obturand":"obtura","obturanta":["obturantă","obturant","obturanta","obturant"],"obturante":"obturant","obturantele":"obturant","obturanti":"obturant","obturantii":"obturant","obturantul":"obturant","obturara":"obtura","obturaram":"obtura","obturarati":"obtura","obturarea":"obturare","obturari":"obturare","obturarii":"obturare","obturarile":"obturare","obturarilor":"obturare","obturase":"obtura","obturasem":"obtura","obturasera":"obtura","obturaseram":"obtura","obturaserati":"obtura","obturasesi":"obtura","obturasi":"obtura","obturat":"obtura","obturata":["obturată","obturat","obturata","obturat"],"obturate":"obturat","obturatele":"obturat","obturati":["obturați","obtura","obturați","obturat"],"obturatia":"obturație","obturatiei":"obturație","obturatii":["obturații","obturat","obturații","obturație"],"obturatiile":"obturație","obturatiilor":"obturație","obturatiunea":"obturațiune","obturatiuni":"obturațiune","obturatiunii":"obturațiune","obturatiunile":"obturațiune","obturatiunilor":"obturațiune","obturatoare":"obturator","obturatoarele":"obturator","obturatoarelor":"obturator","obturatorul":"obturator","obturatorule":"obturator","obturatorului":"obturator","obturatul":"obturat","obturau":"obtura","obtureaza":"obtura","obturez":"obtura","obturezi":"obtura","obtuza":["obtuză","obtuz","obtuza","obtuz"],"obtuze":"obtuz","obtuzele":"obtuz","obtuzi":"obtuz","obtuzii":"obtuz","obtuzitatea":"obtuzitate","obtuzitati":"obtuzitate","obtuzitatii":"obtuzitate","obtuzitatile":"obtuzitate","obtuzitatilor":"obtuzitate","obtuziunea":"obtuziune","obtuziunei":"obtuziune","obtuziunele":"obtuziune","obtuziunelor":"obtuziune","obtuziuni":"obtuziune","obtuzul":"obtuz","obtuzunghe":"obtuzunghi","obtuzunghea":"obtuzunghi","obtuzunghele":"obtuzunghi","obtuzunghica":["obtuzunghică","obtuzunghic","obtuzunghica","obtuzunghic"],"obtuzunghice":"obtuzunghic","obtuzunghicele":"obtuzunghic","obtuzunghici":"obtuzunghic","obtuzunghicii":"obtuzunghic","obtuzunghicul":"obtuzunghic","obtuzunghii":"obtuzunghi","obtuzunghiul":"obtuzunghi","obuduetul":"obuduet","obuduetule":"obuduet","obuduetului":"obuduet","obudueturi":"obuduet","obudueturile":"obuduet","obudueturilor":"obuduet","obuze":"obuz","obuzele":"obuz","obuzelor":"obuz","obuziere":"obuzier","obuzierele":"obuzier","obuzierelor":"obuzier","obuzierul":"obuzier","obuzierule":"obuzier","obuzierului":"obuzier","obuzul":"obuz","obuzule":"obuz","obuzului":"obuz","obversa":["obversă","obvers","obversa","obvers"],"obverse":"obvers","obversele":"obvers","obversi":"obvers","obversii":"obvers","obversiunea":"obversiune","obversiunei":"obversiune","obversiunele":"obversiune","obversiunelor":"obversiune","obversiuni":"obversiune","obversul":"obvers","ocacaia":"ocăcăi","ocacaiai":"ocăcăi","ocacaiam":"ocăcăi","ocacaiati":"ocăcăi","ocacaiau":"ocăcăi","ocacaie":"ocăcăi","ocacaiele":"ocăcăială","ocacaielei":"ocăcăială","ocacaielele":"ocăcăială","ocacaielelor":"ocăcăială","ocacaieli":"ocăcăială","ocacaii":"ocăcăi","ocacaim":"ocăcăi","ocacaind":"ocăcăi","ocacaira":"ocăcăi","ocacairam":"ocăcăi","ocacairati":"ocăcăi","ocacaise":"ocăcăi","ocacaisem":"ocăcăi","ocacaisera":"ocăcăi","ocacaiseram":"ocăcăi","ocacaiserati":"ocăcăi","ocacaisesi":"ocăcăi","ocacaisi":"ocăcăi","ocacait":"ocăcăi","ocacaiti":"ocăcăi","ocaianici":"ocaianic","ocaianicii":"ocaianic","ocaianicilor":"ocaianic","ocaianicul":"ocaianic","ocaianicule":"ocaianic","ocaianicului":"ocaianic","ocainicia":"ocăinicie","ocainiciei":"ocăinicie","ocainicii":"ocăinicie","ocainiciile":"ocăinicie","ocainiciilor":"ocăinicie","ocaitul":"ocăit","ocaitule":"ocăit","ocaitului":"ocăit","ocale":"oca","ocalele":"oca","ocalelor":"oca","ocalute":"ocăluță","ocalutei":"ocăluță","ocara":"ocărî","ocarai":["ocărai","ocărî","ocărâi","ocărî"],"ocaram":["ocărâm","ocărî","ocăram","ocărî"],"ocarand":"ocărî","ocarara":"ocărî","ocararam":"ocărî","ocararati":"ocărî","ocararea":"ocărâre","ocarari":"ocărâre","ocararii":"ocărâre","ocararile":"ocărâre","ocararilor":"ocărâre","ocarasc":"ocărî","ocarase":"ocărî","ocarasem":"ocărî","ocarasera":"ocărî","ocaraseram":"ocărî","ocaraserati":"ocărî","ocarasesi":"ocărî","ocarasi":"ocărî","ocaraste":"ocărî","ocarasti":"ocărî","ocarat":"ocărî","ocarati":["ocărâți","ocărî","ocărați","ocărî"],"ocaratoare":"ocărâtor","ocaratoarea":"ocărâtor","ocaratoarele":"ocărâtor","ocaratori":"ocărâtor","ocaratorii":"ocărâtor","ocaratorul":"ocărâtor","ocarau":"ocărî","ocarea":"ocări","ocareai":"ocări","ocaream":"ocări","ocareati":"ocări","ocareau":"ocări","ocaresc":"ocări","ocareste":"ocări","ocaresti":"ocări","ocari":"ocară","ocarii":["ocării","ocară","ocării","ocări"],"ocarile":"ocară","ocarilor":"ocară","ocarim":"ocări","ocarind":"ocări","ocarine":"ocarină","ocarinei":"ocarină","ocarinele":"ocarină","ocarinelor":"ocarină","ocarira":"ocări","ocariram":"ocări","ocarirati":"ocări","ocarise":"ocări","ocarisem":"ocări","ocarisera":"ocări","ocariseram":"ocări","ocariserati":"ocări","ocarisesi":"ocări","ocarisi":"ocări","ocarit":"ocări","ocariti":"ocări","ocarm":"ocârmi","ocarme":"ocârmi","ocarmea":"ocârmi","ocarmeai":"ocârmi","ocarmeam":"ocârmi","ocarmeati":"ocârmi","ocarmeau":"ocârmi","ocarmie":"ocârmi","ocarmii":"ocârmi","ocarmim":"ocârmi","ocarmind":"ocârmi","ocarmira":"ocârmi","ocarmiram":"ocârmi","ocarmirati":"ocârmi","ocarmise":"ocârmi","ocarmisem":"ocârmi","ocarmisera":"ocârmi","ocarmiseram":"ocârmi","ocarmiserati":"ocârmi","ocarmisesi":"ocârmi","ocarmisi":"ocârmi","ocarmit":"ocârmi","ocarmiti":"ocârmi","ocarmuia":"ocârmui","ocarmuiai":"ocârmui","ocarmuiam":"ocârmui","ocarmuiati":"ocârmui","ocarmuiau":"ocârmui","ocarmuiesc":"ocârmui","ocarmuieste":"ocârmui","ocarmuiesti":"ocârmui","ocarmuii":"ocârmui","ocarmuim":"ocârmui","ocarmuind":"ocârmui","ocarmuira":"ocârmui","ocarmuiram":"ocârmui","ocarmuirati":"ocârmui","ocarmuirea":"ocârmuire","ocarmuiri":"ocârmuire","ocarmuirii":"ocârmuire","ocarmuirile":"ocârmuire","ocarmuirilor":"ocârmuire","ocarmuise":"ocârmui","ocarmuisem":"ocârmui","ocarmuisera":"ocârmui","ocarmuiseram":"ocârmui","ocarmuiserati":"ocârmui","ocarmuisesi":"ocârmui","ocarmuisi":"ocârmui","ocarmuit":"ocârmui","ocarmuita":["ocârmuită","ocârmuit","ocârmuita","ocârmuit"],"ocarmuite":"ocârmuit","ocarmuitele":"ocârmuit","ocarmuiti":["ocârmuiți","ocârmui","ocârmuiți","ocârmuit"],"ocarmuitii":"ocârmuit","ocarmuitoare":"ocârmuitor","ocarmuitoarea":["ocârmuitoarea","ocârmuitoare","ocârmuitoarea","ocârmuitor"],"ocarmuitoarei":"ocârmuitoare","ocarmuitoarele":["ocârmuitoarele","ocârmuitoare","ocârmuitoarele","ocârmuitor"],"ocarmuitoarelor":"ocârmuitoare","ocarmuitori":"ocârmuitor","ocarmuitorii":"ocârmuitor","ocarmuitorilor":"ocârmuitor","ocarmuitorul":"ocârmuitor","ocarmuitorule":"ocârmuitor","ocarmuitorului":"ocârmuitor","ocarmuitul":"ocârmuit","ocarnica":["ocarnică","ocarnic","ocarnica","ocarnic"],"ocarnice":"ocarnic","ocarnicele":"ocarnic","ocarnici":"ocarnic","ocarnicii":"ocarnic","ocarnicul":"ocarnic","ocaua":"oca","ocauae":"oca","ocauaui":"oca","ocazii":"ocazie","ocazionai":"ocaziona","ocazionala":["ocazională","ocazional","ocazionala","ocazional"],"ocazionale":"ocazional","ocazionalele":"ocazional","ocazionali":"ocazional","ocazionalii":"ocazional","ocazionalisme":"ocazionalism","ocazionalismele":"ocazionalism","ocazionalismelor":"ocazionalism","ocazionalismul":"ocazionalism","ocazionalismule":"ocazionalism","ocazionalismului":"ocazionalism","ocazionalitatea":"ocazionalitate","ocazionalitati":"ocazionalitate","ocazionalitatii":"ocazionalitate","ocazionalul":"ocazional","ocazionam":["ocazionăm","ocaziona","ocazionam","ocaziona"],"ocazionand":"ocaziona","ocazionara":"ocaziona","ocazionaram":"ocaziona","ocazionarati":"ocaziona","ocazionase":"ocaziona","ocazionasem":"ocaziona","ocazionasera":"ocaziona","ocazionaseram":"ocaziona","ocazionaserati":"ocaziona","ocazionasesi":"ocaziona","ocazionasi":"ocaziona","ocazionat":"ocaziona","ocazionati":"ocaziona","ocazionau":"ocaziona","ocazioneaza":"ocaziona","ocazionez":"ocaziona","ocazionezi":"ocaziona","ocaziunea":"ocaziune","ocaziuni":"ocaziune","ocaziunii":"ocaziune","ocaziunile":"ocaziune","ocaziunilor":"ocaziune","occidentala":["occidentală","occidental","occidentala","occidental"],"occidentale":"occidental","occidentalele":"occidental","occidentali":"occidental","occidentalii":"occidental","occidentalizai":"occidentaliza","occidentalizam":["occidentalizăm","occidentaliza","occidentalizam","occidentaliza"],"occidentalizand":"occidentaliza","occidentalizara":"occidentaliza","occidentalizaram":"occidentaliza","occidentalizarati":"occidentaliza","occidentalizarea":"occidentalizare","occidentalizari":"occidentalizare","occidentalizarii":"occidentalizare","occidentalizarile":"occidentalizare","occidentalizarilor":"occidentalizare","occidentalizase":"occidentaliza","occidentalizasem":"occidentaliza","occidentalizasera":"occidentaliza","occidentalizaseram":"occidentaliza","occidentalizaserati":"occidentaliza","occidentalizasesi":"occidentaliza","occidentalizasi":"occidentaliza","occidentalizat":"occidentaliza","occidentalizata":["occidentalizată","occidentalizat","occidentalizata","occidentalizat"],"occidentalizate":"occidentalizat","occidentalizatele":"occidentalizat","occidentalizati":["occidentalizați","occidentaliza","occidentalizați","occidentalizat"],"occidentalizatii":"occidentalizat","occidentalizatul":"occidentalizat","occidentalizau":"occidentaliza","occidentalizeaza":"occidentaliza","occidentalizez":"occidentaliza","occidentalizezi":"occidentaliza","occidentalul":"occidental","occidentul":"occident","occidentule":"occident","occidentului":"occident","occipitala":["occipitală","occipital","occipitala","occipital"],"occipitale":"occipital","occipitalele":"occipital","occipitali":"occipital","occipitalii":"occipital","occipitalul":"occipital","occiputul":"occiput","occiputule":"occiput","occiputului":"occiput","occiputuri":"occiput","occiputurile":"occiput","occiputurilor":"occiput","occitana":["occitană","occitan","occitana","occitan"],"occitane":["occitane","occitan","occitane","occitană"],"occitanei":"occitană","occitanele":["occitanele","occitan","occitanele","occitană"],"occitanelor":"occitană","occitani":"occitan","occitanii":"occitan","occitanul":"occitan","oceaiania":"oceaianie","oceaianiei":"oceaianie","oceaianii":"oceaianie","oceaianiile":"oceaianie","oceaianiilor":"oceaianie","oceane":"ocean","oceanele":"ocean","oceanelor":"ocean","oceanica":["oceanică","oceanic","oceanica","oceanic"],"oceanice":"oceanic","oceanicele":"oceanic","oceanici":"oceanic","oceanicii":"oceanic","oceanicul":"oceanic","oceaniculturi":"oceanicultură","oceaniculturii":"oceanicultură","oceaniculturile":"oceanicultură","oceaniculturilor":"oceanicultură","oceanide":"oceanidă","oceanidei":"oceanidă","oceanidele":"oceanidă","oceanidelor":"oceanidă","oceaniei":"Oceania","oceanografe":"oceanografă","oceanografei":"oceanografă","oceanografele":"oceanografă","oceanografelor":"oceanografă","oceanografi":"oceanograf","oceanografia":"oceanografie","oceanografica":["oceanografică","oceanografic","oceanografica","oceanografic"],"oceanografice":"oceanografic","oceanograficele":"oceanografic","oceanografici":"oceanografic","oceanograficii":"oceanografic","oceanograficul":"oceanografic","oceanografiei":"oceanografie","oceanografii":["oceanografii","oceanograf","oceanografii","oceanografie"],"oceanografilor":"oceanograf","oceanograful":"oceanograf","oceanografule":"oceanograf","oceanografului":"oceanograf","oceanologe":"oceanologă","oceanologei":"oceanologă","oceanologele":"oceanologă","oceanologelor":"oceanologă","oceanologi":"oceanolog","oceanologia":"oceanologie","oceanologica":["oceanologică","oceanologic","oceanologica","oceanologic"],"oceanologice":"oceanologic","oceanologicele":"oceanologic","oceanologici":"oceanologic","oceanologicii":"oceanologic","oceanologicul":"oceanologic","oceanologiei":"oceanologie","oceanologii":["oceanologii","oceanolog","oceanologii","oceanologie"],"oceanologilor":"oceanolog","oceanologul":"oceanolog","oceanologule":"oceanolog","oceanologului":"oceanolog","oceanul":"ocean","oceanule":"ocean","oceanului":"ocean","oceinte":"oceință","oceintei":"oceință","oceli":"ocel","ocelii":"ocel","ocelilor":"ocel","oceloti":"ocelot","ocelotii":"ocelot","ocelotilor":"ocelot","ocelotul":"ocelot","ocelotule":"ocelot","ocelotului":"ocelot","ocelul":"ocel","ocelule":"ocel","ocelului":"ocel","ocenase":"ocenaș","ocenasele":"ocenaș","ocenaselor":"ocenaș","ocenasul":"ocenaș","ocenasule":"ocenaș","ocenasului":"ocenaș","ochea":"ochi","ocheade":"ocheadă","ocheadei":"ocheadă","ocheadele":"ocheadă","ocheadelor":"ocheadă","ocheai":"ochi","ocheam":"ochi","ocheanaul":"ocheană","ocheanaule":"ocheană","ocheanaului":"ocheană","ocheane":"ochean","ocheanele":"ochean","ocheanelor":"ochean","ocheanul":"ochean","ocheanule":"ochean","ocheanului":"ochean","ocheati":"ochi","ocheau":"ochi","ochelarii":"ochelari","ochelarilor":"ochelari","ochelariste":"ochelaristă","ochelaristei":"ochelaristă"};
@@ -0,0 +1 @@
+export default {"ochelaristele":"ochelaristă","ochelaristelor":"ochelaristă","ochelaristi":["ochelariști","ochelarist","ochelaristi","ochelarist"],"ochelaristii":"ochelarist","ochelaristilor":"ochelarist","ochelaristul":"ochelarist","ochelaristule":"ochelarist","ochelaristului":"ochelarist","ochelarite":"ochelariță","ochelaritei":"ochelariță","ochelaritele":"ochelariță","ochelaritelor":"ochelariță","ochele":"ocheală","ochelei":"ocheală","ochelele":"ocheală","ochelelor":"ocheală","ocheli":"ocheală","ochene":"ocheană","ochenei":"ocheană","ochenelor":"ocheană","ochenite":"ocheniță","ochenitei":"ocheniță","ochenitele":"ocheniță","ochenitelor":"ocheniță","ochenute":"ochenuță","ochenutei":"ochenuță","ochenutele":"ochenuță","ochenutelor":"ochenuță","ochesc":"ochi","ochesela":["ocheșelă","ocheșel","ocheșela","ocheșel"],"ochesele":"ocheșel","ocheselele":"ocheșel","ocheseli":"ocheșel","ocheselii":"ocheșel","ocheselul":"ocheșel","ocheste":"ochi","ochesti":"ochi","ocheteul":"ochete","ocheteule":"ochete","ocheteului":"ochete","ocheti":["ocheți","ocheț","ocheți","ochete"],"ochetii":["ocheții","ocheț","ocheții","ochete"],"ochetilor":["ocheților","ocheț","ocheților","ochete"],"ochetul":"ocheț","ochetule":"ocheț","ochetului":"ocheț","ochi vineti":"ochi vânăt","ochii":"ochi","ochii maro":"ochi maro","ochilor":"ochi","ochilor maro":"ochi maro","ochim":"ochi","ochind":"ochi","ochioasa":["ochioasă","ochios","ochioasa","ochios"],"ochioase":"ochios","ochioasele":"ochios","ochiosi":"ochios","ochiosii":"ochios","ochiosul":"ochios","ochira":"ochi","ochiram":"ochi","ochirati":"ochi","ochirea":"ochire","ochiri":"ochire","ochirii":"ochire","ochirile":"ochire","ochirilor":"ochire","ochise":"ochi","ochisela":["ochișelă","ochișel","ochișela","ochișel"],"ochisele":"ochișel","ochiselele":"ochișel","ochiseli":"ochișel","ochiselii":"ochișel","ochiselul":"ochișel","ochisem":"ochi","ochisera":"ochi","ochiseram":"ochi","ochiserati":"ochi","ochisesi":"ochi","ochisi":"ochi","ochisori":"ochișor","ochisorii":"ochișor","ochisorilor":"ochișor","ochisorul":"ochișor","ochisorule":"ochișor","ochisorului":"ochișor","ochit":"ochi","ochiti":"ochi","ochitii":"ochiți","ochitilor":"ochiți","ochitori":"ochitor","ochitorii":"ochitor","ochitorilor":"ochitor","ochitorul":"ochitor","ochitorule":"ochitor","ochitorului":"ochitor","ochitul":"ochit","ochitule":"ochit","ochitului":"ochit","ochituri":["ochituri","ochit","ochituri","ochitură"],"ochiturii":"ochitură","ochiturile":["ochiturile","ochit","ochiturile","ochitură"],"ochiturilor":["ochiturilor","ochit","ochiturilor","ochitură"],"ochiul":"ochi","ochiul maro":"ochi maro","ochiule":"ochi","ochiulete":"ochiuleț","ochiuletele":"ochiuleț","ochiuletelor":"ochiuleț","ochiuleti":"ochiuț","ochiuletul":"ochiuleț","ochiuletule":"ochiuleț","ochiuletului":"ochiuleț","ochiului":"ochi","ochiului maro":"ochi maro","ochiuti":"ochiuț","ochiutii":"ochiuț","ochiutilor":"ochiuț","ochiutul":"ochiuț","ochiutule":"ochiuț","ochiutului":"ochiuț","oci":"ocă","ocii":"ocă","ocile":"ocă","ocilor":"ocă","ocinai":"ocina","ocinam":["ocinăm","ocina","ocinam","ocina"],"ocinand":"ocina","ocinara":"ocina","ocinaram":"ocina","ocinarati":"ocina","ocinase":["ocinase","ocina","ocinașe","Ocinaș","ocinașe","ocinaș"],"ocinasele":["ocinașele","Ocinaș","ocinașele","ocinaș"],"ocinaselor":["ocinașelor","Ocinaș","ocinașelor","ocinaș"],"ocinasem":"ocina","ocinasera":"ocina","ocinaseram":"ocina","ocinaserati":"ocina","ocinasesi":"ocina","ocinasi":"ocina","ocinasul":["ocinașul","Ocinaș","ocinașul","ocinaș"],"ocinasule":["ocinașule","Ocinaș","ocinașule","ocinaș"],"ocinasului":["ocinașului","Ocinaș","ocinașului","ocinaș"],"ocinat":"ocina","ocinate":"ocinat","ocinatele":"ocinat","ocinatelor":"ocinat","ocinati":"ocina","ocinatorii":"ocinătoriu","ocinatoriii":"ocinătoriu","ocinatoriilor":"ocinătoriu","ocinatoriuul":"ocinătoriu","ocinatoriuule":"ocinătoriu","ocinatoriuului":"ocinătoriu","ocinatul":"ocinat","ocinatule":"ocinat","ocinatului":"ocinat","ocinau":"ocina","ocineaza":"ocina","ocinez":"ocina","ocinezi":"ocina","ocini":"ocină","ocinii":"ocină","ocinile":"ocină","ocinilor":"ocină","ocitocica":["ocitocică","ocitocic","ocitocica","ocitocic"],"ocitocice":"ocitocic","ocitocicele":"ocitocic","ocitocici":"ocitocic","ocitocicii":"ocitocic","ocitocicul":"ocitocic","ocitocine":"ocitocină","ocitocinei":"ocitocină","ocitocinele":"ocitocină","ocitocinelor":"ocitocină","oclocratiea":"oclocrație","oclocratii":"oclocrație","oclocratiii":"oclocrație","oclocratiile":"oclocrație","oclocratiilor":"oclocrație","oclusiva":["oclusivă","oclusiv","oclusiva","oclusiv"],"oclusive":["oclusive","oclusiv","oclusive","oclusivă"],"oclusivei":"oclusivă","oclusivele":"oclusiv","oclusivi":"oclusiv","oclusivii":"oclusiv","oclusivul":"oclusiv","ocluzia":"ocluzie","ocluziei":"ocluzie","ocluzii":"ocluzie","ocluzii intestinale":"ocluzie intestinală","ocluziile":"ocluzie","ocluziilor":"ocluzie","ocluziunea":"ocluziune","ocluziunei":"ocluziune","ocluziunele":"ocluziune","ocluziunelor":"ocluziune","ocluziuni":"ocluziune","ocluziuni glotale":"ocluziune glotală","ocluziva":["ocluzivă","ocluziv","ocluziva","ocluziv"],"ocluzive":["ocluzive","ocluziv","ocluzive","ocluzivă"],"ocluzivele":["ocluzivele","ocluziv","ocluzivele","ocluzivă"],"ocluzivi":"ocluziv","ocluzivii":"ocluziv","ocluzivul":"ocluziv","ocnari":"ocnar","ocnarii":"ocnar","ocnarilor":"ocnar","ocnarul":"ocnar","ocnarule":"ocnar","ocnarului":"ocnar","ocnasi":"ocnaș","ocnasii":"ocnaș","ocnasilor":"ocnaș","ocnasul":"ocnaș","ocnasule":"ocnaș","ocnasului":"ocnaș","ocne":"ocnă","ocnea":"ocni","ocneai":"ocni","ocneam":"ocni","ocneanul":"ocnean","ocneanule":"ocnean","ocneanului":"ocnean","ocneati":"ocni","ocneau":"ocni","ocnei":"ocnă","ocnele":"ocnă","ocnelor":"ocnă","ocneni":"ocnean","ocnenii":"ocnean","ocnenilor":"ocnean","ocnesc":"ocni","ocneste":"ocni","ocnesti":"ocni","ocnii":"ocni","ocnim":"ocni","ocnind":"ocni","ocnira":"ocni","ocniram":"ocni","ocnirati":"ocni","ocnise":"ocni","ocnisem":"ocni","ocnisera":"ocni","ocniseram":"ocni","ocniserati":"ocni","ocnisesi":"ocni","ocnisi":"ocni","ocnit":"ocni","ocnite":"ocniță","ocnitei":"ocniță","ocnitele":"ocniță","ocnitelor":"ocniță","ocniti":"ocni","ocolase":"ocolaș","ocolasele":"ocolaș","ocolaselor":"ocolaș","ocolasul":"ocolaș","ocolasule":"ocolaș","ocolasului":"ocolaș","ocolea":"ocoli","ocoleai":"ocoli","ocoleam":"ocoli","ocoleati":"ocoli","ocoleau":"ocoli","ocoleli":"ocoleală","ocolelii":"ocoleală","ocolelile":"ocoleală","ocolelilor":"ocoleală","ocolesc":"ocoli","ocoleste":"ocoli","ocolesti":"ocoli","ocolii":"ocoli","ocolim":"ocoli","ocolind":"ocoli","ocolira":"ocoli","ocoliram":"ocoli","ocolirati":"ocoli","ocolirea":"ocolire","ocoliri":"ocolire","ocolirii":"ocolire","ocolirile":"ocolire","ocolirilor":"ocolire","ocolise":"ocoli","ocolisem":"ocoli","ocolisera":"ocoli","ocoliseram":"ocoli","ocoliserati":"ocoli","ocolisesi":"ocoli","ocolisi":"ocoli","ocolisul":"ocoliș","ocolisule":"ocoliș","ocolisului":"ocoliș","ocolisuri":"ocoliș","ocolisurile":"ocoliș","ocolisurilor":"ocoliș","ocolit":"ocoli","ocolita":["ocolită","ocolit","ocolita","ocolit"],"ocolite":"ocolit","ocolitele":"ocolit","ocoliti":["ocoliți","ocoli","ocoliți","ocolit"],"ocolitii":"ocolit","ocolitoare":"ocolitor","ocolitoarea":"ocolitor","ocolitoarele":"ocolitor","ocolitori":"ocolitor","ocolitorii":"ocolitor","ocolitorul":"ocolitor","ocolitul":"ocolit","ocolituri":"ocolitură","ocoliturii":"ocolitură","ocoliturile":"ocolitură","ocoliturilor":"ocolitură","ocolul":"ocol","ocolule":"ocol","ocolului":"ocol","ocoluri":"ocol","ocolurile":"ocol","ocolurilor":"ocol","ocopul":"ocop","ocopule":"ocop","ocopului":"ocop","ocopuri":"ocop","ocopurile":"ocop","ocopurilor":"ocop","ocosagul":"ocoșag","ocosagule":"ocoșag","ocosagului":"ocoșag","ocosaguri":"ocoșag","ocosagurile":"ocoșag","ocosagurilor":"ocoșag","ocosele":"ocoșeală","ocoselei":"ocoșeală","ocoselele":"ocoșeală","ocoselelor":"ocoșeală","ocoseli":"ocoșeală","ocropea":"ocropi","ocropeai":"ocropi","ocropeam":"ocropi","ocropeati":"ocropi","ocropeau":"ocropi","ocropesc":"ocropi","ocropeste":"ocropi","ocropesti":"ocropi","ocropii":"ocropi","ocropim":"ocropi","ocropind":"ocropi","ocropira":"ocropi","ocropiram":"ocropi","ocropirati":"ocropi","ocropise":"ocropi","ocropisem":"ocropi","ocropisera":"ocropi","ocropiseram":"ocropi","ocropiserati":"ocropi","ocropisesi":"ocropi","ocropisi":"ocropi","ocropit":"ocropi","ocropiti":"ocropi","ocroplenia":"ocroplenie","ocropleniei":"ocroplenie","ocroplenii":"ocroplenie","ocropleniile":"ocroplenie","ocropleniilor":"ocroplenie","ocrotea":"ocroti","ocroteai":"ocroti","ocroteam":"ocroti","ocroteati":"ocroti","ocroteau":"ocroti","ocrotele":"ocroteală","ocrotelei":"ocroteală","ocrotelele":"ocroteală","ocrotelelor":"ocroteală","ocroteli":"ocroteală","ocrotesc":"ocroti","ocroteste":"ocroti","ocrotesti":"ocroti","ocrotii":"ocroti","ocrotim":"ocroti","ocrotind":"ocroti","ocrotira":"ocroti","ocrotiram":"ocroti","ocrotirati":"ocroti","ocrotirea":"ocrotire","ocrotiri":"ocrotire","ocrotirii":"ocrotire","ocrotirile":"ocrotire","ocrotirilor":"ocrotire","ocrotise":"ocroti","ocrotisem":"ocroti","ocrotisera":"ocroti","ocrotiseram":"ocroti","ocrotiserati":"ocroti","ocrotisesi":"ocroti","ocrotisi":"ocroti","ocrotit":"ocroti","ocrotiti":"ocroti","ocrotitoare":"ocrotitor","ocrotitoarea":"ocrotitor","ocrotitoarele":"ocrotitor","ocrotitori":"ocrotitor","ocrotitorii":"ocrotitor","ocrotitorul":"ocrotitor","ocrue":"ocru","ocruele":"ocru","ocruelor":"ocru","ocrugul":"ocrug","ocrugule":"ocrug","ocrugului":"ocrug","ocruguri":"ocrug","ocrugurile":"ocrug","ocrugurilor":"ocrug","ocrul":"ocru","ocrule":"ocru","ocrului":"ocru","octacorda":["octacordă","octacord","octacorda","octacord"],"octacorde":"octacord","octacordele":"octacord","octacordul":"octacord","octacordule":"octacord","octacordului":"octacord","octacorzi":"octacord","octacorzii":"octacord","octacorzile":"octacord","octacorzilor":"octacord","octaedre":"octaedru","octaedrele":"octaedru","octaedrelor":"octaedru","octaedrica":["octaedrică","octaedric","octaedrica","octaedric"],"octaedrice":"octaedric","octaedricele":"octaedric","octaedrici":"octaedric","octaedricii":"octaedric","octaedricul":"octaedric","octaedrul":"octaedru","octaedrule":"octaedru","octaedrului":"octaedru","octala":["octală","octal","octala","octal"],"octale":"octal","octalele":"octal","octali":"octal","octalii":"octal","octalul":"octal","octani":"octan","octanica":["octanică","octanic","octanica","octanic"],"octanice":"octanic","octanicele":"octanic","octanici":"octanic","octanicii":"octanic","octanicul":"octanic","octanii":"octan","octanilor":"octan","octante":"octant","octantele":"octant","octantelor":"octant","octantul":"octant","octantule":"octant","octantului":"octant","octanul":"octan","octanule":"octan","octanului":"octan","octatloane":"octatlon","octatloanele":"octatlon","octatloanelor":"octatlon","octatloniste":"octatlonistă","octatlonistei":"octatlonistă","octatlonistele":"octatlonistă","octatlonistelor":"octatlonistă","octatlonisti":"octatlonist","octatlonistii":"octatlonist","octatlonistilor":"octatlonist","octatlonistul":"octatlonist","octatlonistule":"octatlonist","octatlonistului":"octatlonist","octatlonul":"octatlon","octatlonule":"octatlon","octatlonului":"octatlon","octave":"octavă","octavei":"octavă","octavele":"octavă","octavelor":"octavă","octavine":"octavin","octavinele":"octavin","octavinelor":"octavin","octavinul":"octavin","octavinule":"octavin","octavinului":"octavin","octeti":"octet","octetii":"octet","octetilor":"octet","octetul":"octet","octetule":"octet","octetului":"octet","octocoralieri":"octocoralier","octocoralierii":"octocoralier","octocoralierilor":"octocoralier","octocoralierul":"octocoralier","octocoralierule":"octocoralier","octocoralierului":"octocoralier","octode":"octodă","octodei":"octodă","octodele":"octodă","octodelor":"octodă","octogenare":"octogenară","octogenarei":"octogenară","octogenarele":"octogenară","octogenarelor":"octogenară","octogenari":"octogenar","octogenarii":"octogenar","octogenarilor":"octogenar","octogenarul":"octogenar","octogenarule":"octogenar","octogenarului":"octogenar","octogonala":["octogonală","octogonal","octogonala","octogonal"],"octogonale":"octogonal","octogonalele":"octogonal","octogonali":"octogonal","octogonalii":"octogonal","octogonalul":"octogonal","octogoni":"octogon","octogonile":"octogon","octogonilor":"octogon","octogonul":"octogon","octogonule":"octogon","octogonului":"octogon","octoihul":"octoih","octoihule":"octoih","octoihului":"octoih","octoihuri":"octoih","octoihurile":"octoih","octoihurilor":"octoih","octometre":"octometru","octometrele":"octometru","octometrelor":"octometru","octometrul":"octometru","octometrule":"octometru","octometrului":"octometru","octomvreul":"octomvre","octomvreule":"octomvre","octomvreului":"octomvre","octomvrie":"octombrie","octomvrieul":"octomvrie","octomvrieule":"octomvrie","octomvrieului":"octomvrie","octomvrii":"octomvrie","octomvriii":"octomvrie","octomvriilor":"octomvrie","octopodul":"octopod","octopodule":"octopod","octopodului":"octopod","octopozi":"octopod","octopozile":"octopod","octopozilor":"octopod","octosilabe":"octosilab","octosilabele":"octosilab","octosilabelor":"octosilab","octosilabica":["octosilabică","octosilabic","octosilabica","octosilabic"],"octosilabice":"octosilabic","octosilabicele":"octosilabic","octosilabici":"octosilabic","octosilabicii":"octosilabic","octosilabicul":"octosilabic","octosilabul":"octosilab","octosilabule":"octosilab","octosilabului":"octosilab","octostilul":"octostil","octostilule":"octostil","octostilului":"octostil","octroi":"octroia","octroiai":"octroia","octroiam":"octroia","octroiara":"octroia","octroiaram":"octroia","octroiarati":"octroia","octroiase":"octroia","octroiasem":"octroia","octroiasera":"octroia","octroiaseram":"octroia","octroiaserati":"octroia","octroiasesi":"octroia","octroiasi":"octroia","octroiat":"octroia","octroiati":"octroia","octroiau":"octroia","octroiaza":"octroia","octroie":"octroia","octroiem":"octroia","octroind":"octroia","octupleti":"octuplet","octupletii":"octuplet","octupletilor":"octuplet","octupletul":"octuplet","octupletule":"octuplet","octupletului":"octuplet","octupli":"octuplu","octuplile":"octuplu","octuplilor":"octuplu","octuplul":"octuplu","octuplule":"octuplu","octuplului":"octuplu","oculara":["oculară","ocular","oculara","ocular"],"oculare":"ocular","ocularele":"ocular","oculari":"ocular","ocularii":"ocular","ocularul":"ocular","oculiste":"oculistă","oculistei":"oculistă","oculistele":"oculistă","oculistelor":"oculistă","oculisti":"oculist","oculistica":["oculistică","oculistic","oculistica","oculistic"],"oculistice":"oculistic","oculisticele":"oculistic","oculistici":["oculistici","oculistic","oculistici","oculistică"],"oculisticii":["oculisticii","oculistic","oculisticii","oculistică"],"oculisticile":"oculistică","oculisticilor":"oculistică","oculisticul":"oculistic","oculistii":"oculist","oculistilor":"oculist","oculistul":"oculist","oculistule":"oculist","oculistului":"oculist","oculometre":"oculometru","oculometrele":"oculometru","oculometrelor":"oculometru","oculometruul":"oculometru","oculometruule":"oculometru","oculometruului":"oculometru","oculomotoare":"oculomotor","oculomotoarea":"oculomotor","oculomotoarele":"oculomotor","oculomotori":"oculomotor","oculomotorii":"oculomotor","oculomotorul":"oculomotor","oculta":["ocultă","ocult","oculta","ocult"],"ocultai":"oculta","ocultam":["ocultăm","oculta","ocultam","oculta"],"ocultand":"oculta","ocultara":"oculta","ocultaram":"oculta","ocultarati":"oculta","ocultase":"oculta","ocultasem":"oculta","ocultasera":"oculta","ocultaseram":"oculta","ocultaserati":"oculta","ocultasesi":"oculta","ocultasi":"oculta","ocultat":"oculta","ocultati":"oculta","ocultatia":"ocultație","ocultatiei":"ocultație","ocultatii":"ocultație","ocultatiile":"ocultație","ocultatiilor":"ocultație","ocultatiunea":"ocultațiune","ocultatiuni":"ocultațiune","ocultatiunii":"ocultațiune","ocultatiunile":"ocultațiune","ocultatiunilor":"ocultațiune","ocultau":"oculta","oculte":"ocult","oculteaza":"oculta","ocultele":"ocult","ocultez":"oculta","ocultezi":"oculta","oculti":"ocult","ocultii":"ocult","ocultisme":"ocultism","ocultismele":"ocultism","ocultismelor":"ocultism","ocultismul":"ocultism","ocultismule":"ocultism","ocultismului":"ocultism","ocultiste":"ocultistă","ocultistei":"ocultistă","ocultistele":"ocultistă","ocultistelor":"ocultistă","ocultisti":"ocultist","ocultistica":["ocultistică","ocultistic","ocultistica","ocultistic"],"ocultistice":["ocultistice","ocultistic","ocultistice","ocultistică"],"ocultisticei":"ocultistică","ocultisticele":["ocultisticele","ocultistic","ocultisticele","ocultistică"],"ocultisticelor":"ocultistică","ocultistici":"ocultistic","ocultisticii":"ocultistic","ocultisticul":"ocultistic","ocultistii":"ocultist","ocultistilor":"ocultist","ocultistul":"ocultist","ocultistule":"ocultist","ocultistului":"ocultist","ocultul":"ocult","ocup":"ocupa","ocupai":"ocupa","ocupam":["ocupăm","ocupa","ocupam","ocupa"],"ocupand":"ocupa","ocupante":"ocupantă","ocupantei":"ocupantă","ocupantele":"ocupantă","ocupantelor":"ocupantă","ocupanti":"ocupant","ocupantii":"ocupant","ocupantilor":"ocupant","ocupantul":"ocupant","ocupantule":"ocupant","ocupantului":"ocupant","ocupara":"ocupa","ocuparam":"ocupa","ocuparati":"ocupa","ocuparea":"ocupare","ocupari":"ocupare","ocuparii":"ocupare","ocuparile":"ocupare","ocuparilor":"ocupare","ocuparisea":"ocuparisi","ocupariseai":"ocuparisi","ocupariseam":"ocuparisi","ocupariseati":"ocuparisi","ocupariseau":"ocuparisi","ocuparisesc":"ocuparisi","ocupariseste":"ocuparisi","ocuparisesti":"ocuparisi","ocuparisii":"ocuparisi","ocuparisim":"ocuparisi","ocuparisind":"ocuparisi","ocuparisira":"ocuparisi","ocuparisiram":"ocuparisi","ocuparisirati":"ocuparisi","ocuparisise":"ocuparisi","ocuparisisem":"ocuparisi","ocuparisisera":"ocuparisi","ocuparisiseram":"ocuparisi","ocuparisiserati":"ocuparisi","ocuparisisesi":"ocuparisi","ocuparisisi":"ocuparisi","ocuparisit":"ocuparisi","ocuparisiti":"ocuparisi","ocupase":"ocupa","ocupasem":"ocupa","ocupasera":"ocupa","ocupaseram":"ocupa","ocupaserati":"ocupa","ocupasesi":"ocupa","ocupasi":"ocupa","ocupat":"ocupa","ocupata":["ocupată","ocupat","ocupata","ocupat"],"ocupate":"ocupat","ocupatele":"ocupat","ocupati":["ocupați","ocupa","ocupați","ocupat"],"ocupatia":"ocupație","ocupatiei":"ocupație","ocupatii":["ocupații","ocupat","ocupații","ocupație"],"ocupatiile":"ocupație","ocupatiilor":"ocupație","ocupationala":["ocupațională","ocupațional","ocupaționala","ocupațional"],"ocupationale":"ocupațional","ocupationalele":"ocupațional","ocupationali":"ocupațional","ocupationalii":"ocupațional","ocupationalul":"ocupațional","ocupatiunea":"ocupațiune","ocupatiuni":"ocupațiune","ocupatiunii":"ocupațiune","ocupatiunile":"ocupațiune","ocupatiunilor":"ocupațiune","ocupatoarea":"ocupatoare","ocupatoarei":"ocupatoare","ocupatoarele":"ocupatoare","ocupatoarelor":"ocupatoare","ocupatori":"ocupator","ocupatorii":"ocupator","ocupatorilor":"ocupator","ocupatorul":"ocupator","ocupatorule":"ocupator","ocupatorului":"ocupator","ocupatul":"ocupat","ocupau":"ocupa","ocupe":"ocupa","ocupi":"ocupa","ocurenta":["ocurentă","ocurent","ocurenta","ocurent"],"ocurente":["ocurente","ocurent","ocurențe","ocurență"],"ocurentei":"ocurență","ocurentele":["ocurentele","ocurent","ocurențele","ocurență"],"ocurentelor":"ocurență","ocurenti":"ocurent","ocurentii":"ocurent","ocurentul":"ocurent","odabasi":"odabaș","odabasii":"odabaș","odabasilor":"odabaș","odabasul":"odabaș","odabasule":"odabaș","odabasului":"odabaș","odagacii":"odagaci","odagacilor":"odagaci","odagaciul":"odagaci","odagaciule":"odagaci","odagaciului":"odagaci","odagii":"odagiu","odagiii":"odagiu","odagiilor":"odagiu","odagiuul":"odagiu","odagiuule":"odagiu","odagiuului":"odagiu","odai":"odaie","odaia":"odaie","odaiasi":"odăiaș","odaiasii":"odăiaș","odaiasilor":"odăiaș","odaiasul":"odăiaș","odaiasule":"odăiaș","odaiasului":"odăiaș","odaii":"odaie","odaile":"odaie","odailor":"odaie","odaite":"odăiță","odaitei":"odăiță","odaitele":"odăiță","odaitelor":"odăiță","odajdiile":"odăjdii","odajdiilor":"odăjdii","odalisce":"odaliscă","odaliscei":"odaliscă","odaliscele":"odaliscă","odaliscelor":"odaliscă","odata si odata":"odată și-odată","ode":"odă","odei":"odă","odele":"odă","odelete":"odeletă","odeletei":"odeletă","odeletele":"odeletă","odeletelor":"odeletă","odelor":"odă","odeoane":"odeon","odeoanele":"odeon","odeoanelor":"odeon","odeonul":"odeon","odeonule":"odeon","odeonului":"odeon","odgoane":"odgon","odgoanele":"odgon","odgoanelor":"odgon","odgon":"odgoni","odgone":"odgoni","odgonea":"odgoni","odgoneai":"odgoni","odgoneam":"odgoni","odgoneati":"odgoni","odgoneau":"odgoni","odgonie":"odgoni","odgonii":"odgoni","odgonim":"odgoni","odgonind":"odgoni","odgonira":"odgoni","odgoniram":"odgoni","odgonirati":"odgoni","odgonise":"odgoni","odgonisem":"odgoni","odgonisera":"odgoni","odgoniseram":"odgoni","odgoniserati":"odgoni","odgonisesi":"odgoni","odgonisi":"odgoni","odgonit":"odgoni","odgoniti":"odgoni","odgonul":"odgon","odgonule":"odgon","odgonului":"odgon","odicolonul":"odicolon","odicolonule":"odicolon","odicolonului":"odicolon","odicolonuri":"odicolon","odicolonurile":"odicolon","odicolonurilor":"odicolon","odihne":"odihnă","odihnea":"odihni","odihneai":"odihni","odihneam":"odihni","odihneati":"odihni","odihneau":"odihni","odihnei":"odihnă","odihnele":["odihnele","odihnă","odihnele","odihneală"],"odihnelei":"odihneală","odihnelele":"odihneală","odihnelelor":"odihneală","odihneli":"odihneală","odihnelor":"odihnă","odihnesc":"odihni","odihneste":"odihni","odihnesti":"odihni","odihnii":"odihni","odihnim":"odihni","odihnind":"odihni","odihnira":"odihni","odihniram":"odihni","odihnirati":"odihni","odihnirea":"odihnire","odihniri":"odihnire","odihnirii":"odihnire","odihnirile":"odihnire","odihnirilor":"odihnire","odihnise":"odihni","odihnisem":"odihni","odihnisera":"odihni","odihniseram":"odihni","odihniserati":"odihni","odihnisesi":"odihni","odihnisi":"odihni","odihnit":"odihni","odihnita":["odihnită","odihnit","odihnita","odihnit"],"odihnite":"odihnit","odihnitele":"odihnit","odihniti":["odihniți","odihni","odihniți","odihnit"],"odihnitii":"odihnit","odihnitoare":"odihnitor","odihnitoarea":"odihnitor","odihnitoarele":"odihnitor","odihnitori":"odihnitor","odihnitorii":"odihnitor","odihnitorul":"odihnitor","odihnitul":"odihnit","odine":"odină","odinea":"odini","odineai":"odini","odineam":"odini","odineati":"odini","odineau":"odini","odinei":"odină","odinele":"odină","odinelor":"odină","odinesc":"odini","odineste":"odini","odinesti":"odini","odinii":"odini","odinim":"odini","odinind":"odini","odinira":"odini","odiniram":"odini","odinirati":"odini","odinise":"odini","odinisem":"odini","odinisera":"odini","odiniseram":"odini","odiniserati":"odini","odinisesi":"odini","odinisi":"odini","odinit":"odini","odiniti":"odini","odioasa":["odioasă","odios","odioasa","odios"],"odioase":"odios","odioasele":"odios","odiosi":"odios","odiosii":"odios","odiosul":"odios","odiozitatea":"odiozitate","odiozitati":"odiozitate","odiozitatii":"odiozitate","odiozitatile":"odiozitate","odiozitatilor":"odiozitate","odiseea":"odisee","odiseei":"odisee","odiseele":"odisee","odiseelor":"odisee","odiuul":"odiu","odiuule":"odiu","odiuului":"odiu","odivoii":"odivoi","odivoilor":"odivoi","odivoiul":"odivoi","odivoiule":"odivoi","odivoiului":"odivoi","odoare":"odor","odoarea":"odoare","odoarele":"odor","odoarelor":"odor","odoari":"odoare","odoarii":"odoare","odoarile":"odoare","odoarilor":"odoare","odobanci":"odobâncă","odobancii":"odobâncă","odobancile":"odobâncă","odobancilor":"odobâncă","odogacii":"odogaci","odogacilor":"odogaci","odogaciul":"odogaci","odogaciule":"odogaci","odogaciului":"odogaci","odografe":"odograf","odografele":"odograf","odografelor":"odograf","odografia":"odografie","odografiei":"odografie","odografii":"odografie","odografiile":"odografie","odografiilor":"odografie","odograful":"odograf","odografule":"odograf","odografului":"odograf","odoleanul":"odolean","odoleanule":"odolean","odoleanului":"odolean","odolene":"odoleană","odolenei":"odoleană","odolenele":"odoleană","odolenelor":"odoleană","odoleni":"odolean","odolenii":"odolean","odolenilor":"odolean","odometre":"odometru","odometrele":"odometru","odometrelor":"odometru","odometria":"odometrie","odometrica":["odometrică","odometric","odometrica","odometric"],"odometrice":"odometric","odometricele":"odometric","odometrici":"odometric","odometricii":"odometric","odometricul":"odometric","odometriei":"odometrie","odometrii":"odometrie","odometriile":"odometrie","odometriilor":"odometrie","odometrul":"odometru","odometrule":"odometru","odometrului":"odometru","odonate":"odonat","odonatele":"odonat","odonatelor":"odonat","odonatul":"odonat","odonatule":"odonat","odonatului":"odonat","odontalgia":"odontalgie","odontalgica":["odontalgică","odontalgic","odontalgica","odontalgic"],"odontalgice":"odontalgic","odontalgicele":"odontalgic","odontalgici":"odontalgic","odontalgicii":"odontalgic","odontalgicul":"odontalgic","odontalgiei":"odontalgie","odontalgii":"odontalgie","odontalgiile":"odontalgie","odontalgiilor":"odontalgie","odontoame":"odontom","odontoamei":"odontom","odontoamelor":"odontom","odontoblaste":"odontoblast","odontoblastele":"odontoblast","odontoblastelor":"odontoblast","odontoblastul":"odontoblast","odontoblastule":"odontoblast","odontoblastului":"odontoblast","odontocia":"odontocie","odontociei":"odontocie","odontocii":"odontocie","odontociile":"odontocie","odontociilor":"odontocie","odontogenia":"odontogenie","odontogeniei":"odontogenie","odontogenii":"odontogenie","odontogeniile":"odontogenie","odontogeniilor":"odontogenie","odontografia":"odontografie","odontografiei":"odontografie","odontografii":"odontografie","odontografiile":"odontografie","odontografiilor":"odontografie","odontoiatri":"odontoiatru","odontoiatria":"odontoiatrie","odontoiatriei":"odontoiatrie","odontoiatrii":["odontoiatrii","odontoiatrie","odontoiatrii","odontoiatru"],"odontoiatriile":"odontoiatrie","odontoiatriilor":"odontoiatrie","odontoiatrilor":"odontoiatru","odontoiatruul":"odontoiatru","odontoiatruule":"odontoiatru","odontoiatruului":"odontoiatru","odontolite":"odontolit","odontolitele":"odontolit","odontolitelor":"odontolit","odontolitul":"odontolit","odontolitule":"odontolit","odontolitului":"odontolit","odontologe":"odontologă","odontologei":"odontologă","odontologele":"odontologă","odontologelor":"odontologă","odontologi":"odontolog","odontologia":"odontologie","odontologica":["odontologică","odontologic","odontologica","odontologic"],"odontologice":"odontologic","odontologicele":"odontologic","odontologici":"odontologic","odontologicii":"odontologic","odontologicul":"odontologic","odontologiei":"odontologie","odontologii":["odontologii","odontolog","odontologii","odontologie"],"odontologilor":"odontolog","odontologul":"odontolog","odontologule":"odontolog","odontologului":"odontolog","odontometre":"odontometru","odontometrele":"odontometru","odontometrelor":"odontometru","odontometrul":"odontometru","odontometrule":"odontometru","odontometrului":"odontometru","odontomul":"odontom","odontomule":"odontom","odontomului":"odontom","odontoragia":"odontoragie","odontoragiei":"odontoragie","odontoragii":"odontoragie","odontoragiile":"odontoragie","odontoragiilor":"odontoragie","odorai":"odora","odoram":["odorăm","odora","odoram","odora"],"odorand":"odora","odoranta":["odorantă","odorant","odoranta","odorant"],"odorante":"odorant","odorantele":"odorant","odoranti":"odorant","odorantii":"odorant","odorantul":"odorant","odorara":"odora","odoraram":"odora","odorarati":"odora","odorase":["odorase","odora","odorașe","odoraș"],"odorasele":"odoraș","odoraselor":"odoraș","odorasem":"odora","odorasera":"odora","odoraseram":"odora","odoraserati":"odora","odorasesi":"odora","odorasi":"odora","odorasul":"odoraș","odorasule":"odoraș","odorasului":"odoraș","odorat":"odora","odorati":"odora","odoratul":"odorat","odoratule":"odorat","odoratului":"odorat","odoraturi":"odorat","odoraturile":"odorat","odoraturilor":"odorat","odorau":"odora","odoreaza":"odora","odorele":"odoreală","odorelei":"odoreală","odorelele":"odoreală","odorelelor":"odoreală","odorez":"odora","odorezi":"odora","odori":"odoare","odorifera":["odoriferă","odorifer","odorifera","odorifer"],"odoriferanta":["odoriferantă","odoriferant","odoriferanta","odoriferant"],"odoriferante":"odoriferant","odoriferantele":"odoriferant","odoriferanti":"odoriferant","odoriferantii":"odoriferant","odoriferantul":"odoriferant","odorifere":"odorifer","odoriferele":"odorifer","odoriferi":"odorifer","odoriferii":"odorifer","odoriferul":"odorifer","odorifica":["odorifică","odorific","odorifica","odorific"],"odorifice":"odorific","odorificele":"odorific","odorifici":"odorific","odorificii":"odorific","odorificul":"odorific","odorizai":"odoriza","odorizam":["odorizăm","odoriza","odorizam","odoriza"],"odorizand":"odoriza","odorizanti":"odorizant","odorizantii":"odorizant","odorizantilor":"odorizant","odorizantul":"odorizant","odorizantule":"odorizant","odorizantului":"odorizant","odorizara":"odoriza","odorizaram":"odoriza","odorizarati":"odoriza","odorizarea":"odorizare","odorizari":"odorizare","odorizarii":"odorizare","odorizarile":"odorizare","odorizarilor":"odorizare","odorizase":"odoriza","odorizasem":"odoriza","odorizasera":"odoriza","odorizaseram":"odoriza","odorizaserati":"odoriza","odorizasesi":"odoriza","odorizasi":"odoriza","odorizat":"odoriza","odorizati":"odoriza","odorizau":"odoriza","odorizeaza":"odoriza","odorizez":"odoriza","odorizezi":"odoriza","odorogita":["odorogită","odorogit","odorogita","odorogit"],"odorogite":"odorogit","odorogitele":"odorogit","odorogiti":"odorogit","odorogitii":"odorogit","odorogitul":"odorogit","odorologia":"odorologie","odorologiei":"odorologie","odorologii":"odorologie","odorologiile":"odorologie","odorologiilor":"odorologie","odorul":"odor","odorule":"odor","odorului":"odor","odoruri":"odor","odorurile":"odor","odorurilor":"odor","odosul":"odos","odosule":"odos","odosului":"odos","odovania":"odovanie","odovaniei":"odovanie","odovanii":"odovanie","odovaniile":"odovanie","odovaniilor":"odovanie","odovite":"odoviță","odovitei":"odoviță","odovitele":"odoviță","odovitelor":"odoviță","odrasle":"odraslă","odraslea":"odrăsli","odrasleai":"odrăsli","odrasleam":"odrăsli","odrasleati":"odrăsli","odrasleau":"odrăsli","odraslei":"odraslă","odraslele":"odraslă","odraslelor":"odraslă","odraslesc":"odrăsli","odrasleste":"odrăsli","odraslesti":"odrăsli","odraslii":"odrăsli","odraslim":"odrăsli","odraslind":"odrăsli","odraslira":"odrăsli","odrasliram":"odrăsli","odraslirati":"odrăsli","odraslirea":"odrăslire","odrasliri":"odrăslire","odraslirii":"odrăslire","odraslirile":"odrăslire","odraslirilor":"odrăslire","odraslise":"odrăsli","odraslisem":"odrăsli","odraslisera":"odrăsli","odrasliseram":"odrăsli","odrasliserati":"odrăsli","odraslisesi":"odrăsli","odraslisi":"odrăsli","odraslit":"odrăsli","odraslita":["odrăslită","odrăslit","odrăslita","odrăslit"],"odraslite":"odrăslit","odraslitele":"odrăslit","odrasliti":["odrăsliți","odrăsli","odrăsliți","odrăslit"],"odraslitii":"odrăslit","odraslitoare":"odrăslitor","odraslitoarea":"odrăslitor","odraslitoarele":"odrăslitor","odraslitori":"odrăslitor","odraslitorii":"odrăslitor","odraslitorul":"odrăslitor","odraslitul":"odrăslit","odraslute":"odrăsluță","odraslutei":"odrăsluță","odraslutele":"odrăsluță","odraslutelor":"odrăsluță","oecologia":"oecologie","oecologiei":"oecologie","oecologii":"oecologie","oecologiile":"oecologie","oecologiilor":"oecologie","oenofila":["oenofilă","oenofil","oenofila","oenofil"],"oenofile":"oenofil","oenofilele":"oenofil","oenofili":"oenofil","oenofilii":"oenofil","oenofilul":"oenofil","oenolog":"enolog","oenologia":"oenologie","oenologiei":"oenologie","oenologii":"oenologie","oerstedmetre":"oerstedmetru","oerstedmetrele":"oerstedmetru","oerstedmetrelor":"oerstedmetru","oerstedmetrul":"oerstedmetru","oerstedmetrule":"oerstedmetru","oerstedmetrului":"oerstedmetru","of bacceli":"baccelit","of baciui":"băciuit","of bagateliza":"bagatelizat","of balaci":"bălăcit","of balamuti":"balamuțit","of balasta":"balastat","of balbui":"bălbuit","of banaliza":"banalizat","of bandaja":"bandajat","of bantali":"băntălit","of barbariza":"barbarizat","of barbieri":"bărbierit","of bardui":"bărduit","of bargi":"bărgit","of baricada":"baricadat","of basmi":"băsmit","of basni":"băsnit","of batatura":"bătăturat","of bate":"bătut","of batjocori":"batjocorit","of baza":"bazat","of behai":"behăit","of beli":"belit","of betona":"betonat","of biciui":"biciuit","of bifa":"bifat","of binemerita":"binemeritat","of binevesti":"binevestit","of birui":"biruit","of blaza":"blazat","of blestema":"blestemat","of bloca":"blocat","of bocani":"bocănit","of boci":"bocit","of boi":"boit","of boicota":"boicotat","of boieri":"boierit","of bolborosi":"bolborosit","of bolseviza":"bolșevizat","of bombani":"bombănit","of bonai":"bonăit","of borandai":"borândăit","of bori":"borit","of borna":"bornat","of borsi":"borșit","of boscai":"boscăit","of boscodi":"boscodit","of bosoli":"bosolit","of botaniza":"botanizat","of brazdui":"brăzduit","of bricheta":"brichetat","of brosa":"broșat","of bruma":"brumat","of brutaliza":"brutalizat","of bubui":"bubuit","of bucura":"bucurat","of bugini":"buginit","of buhai":"buhăit","of buimaci":"buimăcit","of bulgariza":"bulgarizat","of bumbaci":"bumbăcit","of burdusi":"burdușit","of burzului":"burzuluit","of butasi":"butășit","of butnari":"butnărit","of buzoia":"buzoiat","of buzunari":"buzunărit","of economisi":"economisit","of ecrana":"ecranat","of ecraniza":"ecranizat","of edifica":"edificat","of edita":"editat","of educa":"educat","of educarisi":"educarisit","of efemeia":"efemeiat","of egaliza":"egalizat","of ejecta":"ejectat","of elansa":"elansat","of electrocauteriza":"electrocauterizat","of electrocoagula":"electrocoagulat","of electrocuta":"electrocutat","of electroniza":"electronizat","of eleva":"elevat","of elibera":"eliberat","of elimina":"eliminat","of elogia":"elogiat","of elucida":"elucidat","of eluda":"eludat","of emancipa":"emancipat","of emascula":"emasculat","of embereclisi":"embereclisit","of enerva":"enervat","of englezi":"englezit","of entusia":"entusiat","of enumera":"enumerat","of epiloga":"epilogat","of epimelisi":"epimelisit","of epitropi":"epitropit","of epura":"epurat","of eradica":"eradicat","of eredita":"ereditat","of eroiza":"eroizat","of esalona":"eșalonat","of eschiva":"eschivat","of escorta":"escortat","of escroca":"escrocat","of esentializa":"esențializat","of estima":"estimat","of esua":"eșuat","of esunda":"esundat","of etala":"etalat","of etansa":"etanșat","of etira":"etirat","of europeniza":"europenizat","of evacua":"evacuat","of evapora":"evaporat","of evghenisi":"evghenisit","of evidentia":"evidențiat","of eviscera":"eviscerat","of evoca":"evocat","of exacerba":"exacerbat","of exalta":"exaltat","of examenui":"examenuit","of examina":"examinat","of examinalui":"examinăluit","of exceda":"excedat","of excepta":"exceptat","of excita":"excitat","of exciza":"excizat","of excomunica":"excomunicat","of executa":"executat","of exemplifica":"exemplificat","of exercita":"exercitat","of exhiba":"exhibat","of exmatricula":"exmatriculat","of exorisi":"exorisit","of expedia":"expediat","of expedui":"expeduit","of expira":"expirat","of explica":"explicat","of explicita":"explicitat","of exploda":"explodat","of exporta":"exportat","of exprima":"exprimat","of expulza":"expulzat","of expurga":"expurgat","of extenua":"extenuat","of exterioriza":"exteriorizat","of extirpa":"extirpat","of extorca":"extorcat","of extrada":"extrădat","of face":"făcut","of facilita":"facilitat","of facsimila":"facsimilat","of factura":"facturat","of facut":["of făcut","fc","of făcut","fct"],"of fagadui":"făgăduit","of faianta":"faianțat","of falfai":"fâlfâit","of familiariza":"familiarizat","of fandosi":"fandosit","of farami":"fărâmit","of faramica":"fărâmicat","of fasa":"fășat","of fasai":["of fâsâi","fâsâit","of fâșâi","fâșâit"],"of fascina":"fascinat","of fasoli":"fasolit","of fastaci":"fâstâcit","of fata":"fătat","of fatai":"fâțâit","of fatui":"fățuit","of fauri":"făurit","of favoriza":"favorizat","of felicita":"felicitat","of ferchezui":"ferchezuit","of fereca":"ferecat","of ferfeniti":"ferfenițit","of feri":"ferit","of festeli":"feștelit","of fezanda":"fezandat","of fierastrui":"fierăstruit","of fierbanta":"fierbântat","of filigrana":"filigranat","of finanta":"finanțat","of fisa":"fișat","of fiscaliza":"fiscalizat","of fixa":"fixat","of flanca":"flancat","of flata":"flatat","of flescai":"fleșcăit","of flutura":"fluturat","of forja":"forjat","of fosfata":"fosfatat","of fosiliza":"fosilizat","of fosni":"foșnit","of fotografia":"fotografiat","of fractura":"fracturat","of fragezi":"frăgezit","of fragmenta":"fragmentat","of framanta":"frământat","of franciza":"francizat","of frapa":"frapat","of freca":"frecat","of frentusi":"frențușit","of frichini":"frichinit","of fricosa":"fricoșat","of fructifica":"fructificat","of frunzari":"frunzărit","of frustra":"frustrat","of fugari":"fugărit","of fugi":"fugit","of fulgui":"fulguit","of fumega":"fumegat","of fura":"furat","of furgasi":"furgăsit","of furnirui":"furniruit","of furniza":"furnizat","of fuziona":"fuzionat","of gadila":"gâdilat","of gafai":"gâfâit","of gainata":"găinățat","of galcevi":"gâlcevit","of galgai":"gâlgâit","of gandi":"gândit","of gangavi":"gângăvit","of ganguri":"gângurit","of gara":"garat","of gardui":"gărduit","of garnisi":"garnisit","of gasi":"găsit","of gatui":"gâtuit","of gavana":"găvănat","of gavanosi":"găvănoșit","of gavozdi":"găvozdit","of geme":"gemut","of genera":"generat","of gera":"gerat","of germaniza":"germanizat","of gerui":"geruit","of ghemui":"ghemuit","of ghici":"ghicit","of ghida":"ghidat","of ghiftui":"ghiftuit","of ghilotina":"ghilotinat","of ghionti":"ghiontit","of giugiuli":"giugiulit","of glasui":"glăsuit","of glazura":"glazurat","of goli":"golit","of gospodari":"gospodărit","of gradinari":"grădinărit","of gradua":"graduat","of grai":"grăit","of granita":"grănițat","of grapa":"grăpat","of gratia":"grațiat","of gratifica":"gratificat","of greci":"grecit","of greciza":"grecizat","of grefa":"grefat","of greva":"grevat","of griji":"grijit","of grima":"grimat","of grohai":"grohăit","of grohoti":"grohotit","of guma":"gumat","of gurguia":"gurguiat","of gurguta":"gurguțat","of gusta":"gustat","of gustari":"gustărit","of guverna":"guvernat","of hacui":"hăcuit","of hai":"hâit","of hamai":"hămăit","of harsai":"hârșâit","of harsi":"hârsit","of hauli":"hăulit","of hazi":"hâzit","of hodorogi":"hodorogit","of horai":"horăit","of horcai":"horcăit","of hoti":"hoțit","of hraconi":"hraconit","of hrentui":"hrentuit","of huidui":"huiduit","of japcani":"jăpcănit","of jefui":"jefuit","of jilavi":"jilăvit","of judeca":"judecat","of jugani":"jugănit","of jumatati":"jumătățit","of jura":"jurat","of kilometra":"kilometrat","of la":"lăut","of lacatui":"lăcătuit","of laiciza":"laicizat","of lambica":"lambicat","of lamuri":"lămurit","of lantui":"lănțuit","of laptosi":"lăptoșit","of laptuci":"lăptucit","of lauzi":"lăuzit","of lega":"legat","of legatui":"legatuit","of legifera":"legiferat","of lehameti":"lehămetit","of lehametui":"lehămetuit","of lemnifica":"lemnificat","of lenevi":"lenevit","of lepsi":"lepșit","of lesui":"leșuit","of libera":"liberat","of libovi":"libovit","of licari":"licărit","of lichida":"lichidat","of lignifica":"lignificat","of limita":"limitat","of lingari":"lingărit","of lingusi":"lingușit","of linisti":"liniștit","of lipsi":"lipsit","of literariza":"literarizat","of lovi":"lovit","of lua":"luat","of lucra":"lucrat","of lumina":"luminat","of naluci":"nălucit","of napadi":"năpădit","of napusti":"năpustit","of naravi":"nărăvit","of nasi":"nășit","of naste":"născut","of naviga":"navigat","of nedreptati":"nedreptățit","of negativa":"negativat","of neutraliza":"neutralizat","of nevesti":"nevestit","of nevoi":"nevoit","of nimeri":"nimerit","of nitui":"nituit","of norma":"normat","of numi":"numit","of nunti":"nuntit","of obidi":"obidit","of obiectiva":"obiectivat","of obijdui":"obijduit","of obliga":"obligat","of oblitera":"obliterat","of obloji":"oblojit","of obloni":"oblonit","of obosi":"obosit","of obrazi":"obrăzit","of obscura":"obscurat","of obstina":"obstinat","of obstrua":"obstruat","of obtura":"obturat","of ocai":"ocăit","of ocarmui":"ocârmuit","of ochi":"ochit","of ocina":"ocinat","of oficializa":"oficializat","of ofta":"oftat","of ogarji":"ogârjit","of ogoi":"ogoit","of olecai":"olecăit","of omlitui":"omlituit","of opaci":"opăcit","of opera":"operat","of opina":"opinat","of oplosi":"oploșit","of oracai":"orăcăit","of orandui":"orânduit","of orbeca":"orbecat","of orbi":"orbit","of orienta":"orientat","of osebi":"osebit","of ospata":"ospătat","of ospitaliza":"ospitalizat","of ostoi":"ostoit","of otari":"oțărât","of oteli":"oțelit","of oua":"ouat","of oxigena":"oxigenat","of ozona":"ozonat","of racani":"răcănit","of radacina":"rădăcinat","of rade":"ras","of rade in barba":"râs în barbă","of radia":"radiat","of radiodifuza":"radiodifuzat","of radioghida":"radioghidat","of radiotelegrafia":"radiotelegrafiat","of ramane":"rămas","of rancezi":"râncezit","of rancheza":"rânchezat","of ranji":"rânjit","of rapai":"răpăit","of rapi":"răpit","of raporta":"raportat","of rascheta":"rașchetat","of rascoace":"răscopt","of rascoli":"răscolit","of rasfata":"răsfățat","of rasfrange":"răsfrânt","of rasni":"râșnit","of raspunde":"răspuns","of rasti":"răstit","of rasturna":"răsturnat","of rasuci":"răsucit","of rationa":"raționat","of ratuti":"rătutit","of ravasi":"răvășit","of razalui":"răzăluit","of razbi":"răzbit","of razboli":"războlit","of razgaia":"răzgâiat","of razleti":"răzlețit","of reaclimatiza":"reaclimatizat","of reacoperi":"reacoperit","of reaerisi":"reaerisit","of realimenta":"realimentat","of realipi":"realipit","of realtoi":"realtoit","of reaminti":"reamintit","of reangaja":"reangajat","of rearginta":"reargintat","of reaseza":"reașezat","of reatribui":"reatribuit","of rebate":"rebătut","of rebegi":"rebegit","of reboteza":"rebotezat","of rebuta":"rebutat","of recalcula":"recalculat","of recalibra":"recalibrat","of recalifica":"recalificat","of receptiona":"recepționat","of recerceta":"recercetat","of rechema":"rechemat","of rechizitiona":"rechiziționat","of recita":"recitat","of recladi":"reclădit","of reclama":"reclamat","of recompartimenta":"recompartimentat","of reconfigura":"reconfigurat","of reconfirma":"reconfirmat","of reconsolida":"reconsolidat","of reconstrui":"reconstruit","of recopia":"recopiat","of recrea":"recreat","of recroma":"recromat","of rectifica":"rectificat","of recupera":"recuperat","of redata":"redatat","of redescoperi":"redescoperit","of redistribui":"redistribuit","of redresa":"redresat","of reedita":"reeditat","of reesalona":"reeșalonat","of reevalua":"reevaluat","of reexamina":"reexaminat","of refrigera":"refrigerat","of refuza":"refuzat","of reglementa":"reglementat","of regulamenta":"regulamentat","of regulariza":"regularizat","of reimpaduri":"reîmpădurit","of reimporta":"reimportat","of reimprima":"reimprimat","of reimprospata":"reîmprospătat","of reinarma":"reînarmat","of reincalzi":"reîncălzit","of reincarca":"reîncărcat","of reinchiria":"reînchiriat","of reinfiinta":"reînființat","of reinflori":"reînflorit","of reinfrumuseta":"reînfrumusețat","of reinscauna":"reînscăunat","of reinsuruba":"reînșurubat","of reintalni":"reîntâlnit","of reinteroga":"reinterogat","of reintocmi":"reîntocmit","of reintregi":"reîntregit","of reintrona":"reîntronat","of reinverzi":"reînverzit","of reinvesti":"reinvestit","of remaia":"remaiat","of remania":"remaniat","of remedia":"remediat","of rememora":"rememorat","of renova":"renovat","of rentabiliza":"rentabilizat","of reorganiza":"reorganizat","of repatria":"repatriat","of repauza":"repauzat","of repera":"reperat","of repercuta":"repercutat","of repezi":"repezit","of reprima":"reprimat","of reproba":"reprobat","of repudia":"repudiat","of resapa":"reșapat","of restabili":"restabilit","of resuscita":"resuscitat","of retarda":"retardat","of retine":"reținut","of revarsa":"revărsat","of revigora":"revigorat","of revolta":"revoltat","of rezema":"rezemat","of rezilia":"reziliat","of ricana":"ricanat","of rima":"rimat","of rimela":"rimelat","of rindelui":"rindeluit","of risca":"riscat","of roade":"ros","of roboti":"robotit","of romani":"românit","of romanta":"romanțat","of rontai":"ronțăit","of rosi":"roșit","of rosta":"rostat","of rostogoli":"rostogolit","of rotaciza":"rotacizat","of roti":"rotit","of rotocoli":"rotocolit","of roura":"rourat","of ruga":"rugat","of rumega":"rumegat","of rumeni":"rumenit","of tabaci":"tăbăcit","of tablui":"tăbluit","of tacani":"țăcănit","of tagadui":"tăgăduit","of taini":"tăinit","of talhari":"tâlhărit","of talmaci":"tălmăcit","of tamadui":"tămăduit","of tampi":"tâmpit","of tandali":"tândălit","of tangui":"tânguit","of taragana":"tărăgănat","of tarai":"țârâit","of tarbaci":"tărbăcit","of tari":"târât","of tarmuri":"țărmurit","of tatua":"tatuat","of tehnologiza":"tehnologizat","of telefona":"telefonat","of teme":"temut","of tempera":"temperat","of tencui":"tencuit","of terciui":"terciuit","of terfeli":"terfelit","of teroriza":"terorizat","of tesala":"țesălat","of tescui":"tescuit","of tese":"țesut","of tesmeni":"teșmenit","of ticalosi":"ticăloșit","of ticlui":"ticluit","of ticsi":"ticsit","of tigheli":"tighelit","of tihni":"tihnit","of tinctura":"tincturat","of tinti":"țintit","of tintui":"țintuit","of tipari":"tipărit","of tipiza":"tipizat","of tiui":"țiuit","of toca":"tocat","of tocai":"țocăit","of toci":"tocit","of tolani":"tolănit","of topai":"țopăit","of toropi":"toropit","of tortura":"torturat","of tracta":"tractat","of trada":"trădat","of trai":"trăit","of trandavi":"trândăvit","of transfera":"transferat","of transforma":"transformat","of transplanta":"transplantat","of trasa":"trasat","of trebui":"trebuit","of trece":"trecut","of tremola":"tremolat","of tricota":"tricotat","of trivializa":"trivializat","of troieni":"troienit","of troncani":"troncănit","of tropai":"tropăit","of truca":"trucat","of tuca":"țucat","of tuguia":"țuguiat","of turba":"turbat","of turna":"turnat","of turti":"turtit","of tusi":"tușit","of tutui":"tutuit","of uita":"uitat","of ujubi":"ujubit","of umecta":"umectat","of umfla":"umflat","of undui":"unduit","of unelti":"uneltit","of ungureni":"ungurenit","of uni":"unit","of unifica":"unificat","of ura":"urat","of urati":"urâțit","of urla":"urlat","of urlui":"urluit","of urma":"urmat","of urmari":"urmărit","of urzi":"urzit","of uzurpa":"uzurpat","of vaccina":"vaccinat","of vacsui":"văcsuit","of vaduvi":"văduvit","of vagabonda":"vagabondat","of vajai":"vâjâit","of valida":"validat","of valoriza":"valorizat","of vana":"vânat","of vaporiza":"vaporizat","of vara":"vărat","of varfui":"vârfuit","of varzui":"vărzuit","of vasli":"vâslit","of vechi":"vechit","of vedea":["of vedea","văzut","of vedea","vz","of vedea","vzt"],"of vehicula":"vehiculat","of velariza":"velarizat","of venera":"venerat","of veni":"venit","of ventila":"ventilat","of versui":"versuit","of veseli":"veselit","of vesteji":"veștejit","of vexa":"vexat","of via":"viat","of vicia":"viciat","of viermanosa":"viermănoșat","of viermui":"viermuit","of vineti":"vinețit","of vinui":"vinuit","of violenta":"violentat","of visa":"visat","of viscoli":"viscolit","of vitaliza":"vitalizat","of vitaminiza":"vitaminizat","of vitregi":"vitregit","of vitrifica":"vitrificat","of vizita":"vizitat","of vizualiza":"vizualizat","of vocaliza":"vocalizat","of voi":"voit","of voinici":"voinicit","of voma":"vomat","of vorbi":"vorbit","of vota":"votat","of vui":"vuit","of vulgariza":"vulgarizat","of vulnera":"vulnerat","of vuvui":"vuvuit","of xerocopia":"xerocopiat","of xerografia":"xerografiat","of xeroxa":"xeroxat","of zagazui":"zăgăzuit","of zamisli":"zămislit","of zangani":"zăngănit","of zazai":"zâzâit","of zbantui":"zbânțuit","of zbarci":"zbârcit","of zbarli":"zbârlit","of zbarnai":"zbârnâit","of zbihui":"zbihuit","of zborsi":"zborșit","of zbura":"zburat","of zdrangani":"zdrăngănit","of zdreli":"zdrelit","of zdrentui":"zdrențuit","of zdruncina":"zdruncinat","of zetui":"zețuit","of zgaltai":"zgâlțâit","of zgamboi":"zgâmboit","of zgribuli":"zgribulit","of zgudui":"zguduit","of zice":"zis","of zimtui":"zimțuit","of zincui":"zincuit","of zmacina":"zmăcinat","of zobi":"zobit","of zornai":"zornăit","of zupai":"zupăit","of zurgai":"zurgăit","of zvacni":"zvâcnit","of zvarcoli":"zvârcolit","of zvarli":"zvârlit","ofensai":"ofensa","ofensam":["ofensăm","ofensa","ofensam","ofensa"],"ofensand":"ofensa","ofensanta":["ofensantă","ofensant","ofensanta","ofensant"],"ofensante":"ofensant","ofensantele":"ofensant","ofensanti":"ofensant","ofensantii":"ofensant","ofensantul":"ofensant","ofensara":"ofensa","ofensaram":"ofensa","ofensarati":"ofensa","ofensarea":"ofensare","ofensari":"ofensare","ofensarii":"ofensare","ofensarile":"ofensare","ofensarilor":"ofensare","ofensase":"ofensa","ofensasem":"ofensa","ofensasera":"ofensa","ofensaseram":"ofensa","ofensaserati":"ofensa","ofensasesi":"ofensa","ofensasi":"ofensa","ofensat":"ofensa","ofensata":["ofensată","ofensat","ofensata","ofensat"],"ofensate":"ofensat","ofensatele":"ofensat","ofensati":["ofensați","ofensa","ofensați","ofensat"],"ofensatii":"ofensat","ofensatoare":"ofensator","ofensatoarea":"ofensator","ofensatoarele":"ofensator","ofensatori":"ofensator","ofensatorii":"ofensator","ofensatorul":"ofensator","ofensatul":"ofensat","ofensau":"ofensa","ofense":"ofensă","ofenseaza":"ofensa","ofensei":"ofensă","ofensele":"ofensă","ofenselor":"ofensă","ofensez":"ofensa","ofensezi":"ofensa","ofensiva":["ofensivă","ofensiv","ofensiva","ofensiv"],"ofensive":["ofensive","ofensiv","ofensive","ofensivă"],"ofensivei":"ofensivă","ofensivele":["ofensivele","ofensiv","ofensivele","ofensivă"],"ofensivelor":"ofensivă","ofensivi":"ofensiv","ofensivii":"ofensiv","ofensivul":"ofensiv","ofer":"oferi","ofera":"oferi","ofere":"oferi","oferea":"oferi","ofereai":"oferi","ofeream":"oferi","ofereati":"oferi","ofereau":"oferi","oferii":"oferi","oferim":"oferi","oferind":"oferi","oferira":"oferi","oferiram":"oferi","oferirati":"oferi","oferirea":"oferire","oferiri":"oferire","oferirii":"oferire","oferirile":"oferire","oferirilor":"oferire","oferise":"oferi","oferisem":"oferi","oferisera":"oferi","oferiseram":"oferi","oferiserati":"oferi","oferisesi":"oferi","oferisi":"oferi","oferit":"oferi","oferiti":"oferi","ofertai":"oferta","ofertam":["ofertăm","oferta","ofertam","oferta"],"ofertand":"oferta","ofertante":"ofertantă","ofertantei":"ofertantă","ofertantele":"ofertantă","ofertantelor":"ofertantă","ofertanti":"ofertant","ofertantii":"ofertant","ofertantilor":"ofertant","ofertantul":"ofertant","ofertantule":"ofertant","ofertantului":"ofertant","ofertara":"oferta","ofertaram":"oferta","ofertarati":"oferta","ofertase":"oferta","ofertasem":"oferta","ofertasera":"oferta","ofertaseram":"oferta","ofertaserati":"oferta","ofertasesi":"oferta","ofertasi":"oferta","ofertat":"oferta","ofertati":"oferta","ofertau":"oferta","oferte":"ofertă","oferteaza":"oferta","ofertei":"ofertă","ofertele":"ofertă","ofertelor":"ofertă","ofertez":"oferta","ofertezi":"oferta","oficia":"oficie","oficiai":"oficia","oficiala":["oficială","oficial","oficiala","oficial"],"oficiale":"oficial","oficialele":"oficial","oficiali":"oficial","oficialii":"oficial","oficialitatea":"oficialitate","oficialitati":"oficialitate","oficialitatii":"oficialitate","oficialitatile":"oficialitate","oficialitatilor":"oficialitate","oficializai":"oficializa","oficializam":["oficializăm","oficializa","oficializam","oficializa"],"oficializand":"oficializa","oficializara":"oficializa","oficializaram":"oficializa","oficializarati":"oficializa","oficializarea":"oficializare","oficializari":"oficializare","oficializarii":"oficializare","oficializarile":"oficializare","oficializarilor":"oficializare","oficializase":"oficializa","oficializasem":"oficializa","oficializasera":"oficializa","oficializaseram":"oficializa","oficializaserati":"oficializa","oficializasesi":"oficializa","oficializasi":"oficializa","oficializat":"oficializa","oficializati":"oficializa","oficializatul":"oficializat","oficializatule":"oficializat","oficializatului":"oficializat","oficializaturi":"oficializat","oficializaturile":"oficializat","oficializaturilor":"oficializat","oficializau":"oficializa","oficializeaza":"oficializa","oficializez":"oficializa","oficializezi":"oficializa","oficialul":"oficial","oficiam":"oficia","oficiante":"oficiantă","oficiantei":"oficiantă","oficiantele":"oficiantă","oficiantelor":"oficiantă","oficianti":"oficiant","oficiantii":"oficiant","oficiantilor":"oficiant","oficiantul":"oficiant","oficiantule":"oficiant","oficiantului":"oficiant","oficiara":"oficia","oficiaram":"oficia","oficiarati":"oficia","oficiase":"oficia","oficiasem":"oficia","oficiasera":"oficia","oficiaseram":"oficia","oficiaserati":"oficia","oficiasesi":"oficia","oficiasi":"oficia","oficiat":"oficia","oficiati":"oficia","oficiau":"oficia","oficiaza":"oficia","oficie":"oficia","oficieaza":"oficia","oficiei":"oficie","oficiem":"oficia","oficierea":"oficiere","oficieri":"oficiere","oficierii":"oficiere","oficierile":"oficiere","oficierilor":"oficiere","oficiez":"oficia","oficiezi":"oficia","oficii":["oficii","oficie","oficii","oficiu"],"oficii de turism":"oficiu de turism","oficii postale":"oficiu poștal","oficii turistice":"oficiu turistic","oficiile":["oficiile","oficie","oficiile","oficiu"],"oficiilor":["oficiilor","oficie","oficiilor","oficiu"],"oficiind":"oficia","oficinala":["oficinală","oficinal","oficinala","oficinal"],"oficinale":"oficinal","oficinalele":"oficinal","oficinali":"oficinal","oficinalii":"oficinal","oficinalul":"oficinal","oficine":"oficină","oficinei":"oficină","oficinele":"oficină","oficinelor":"oficină","oficioasa":["oficioasă","oficios","oficioasa","oficios"],"oficioase":"oficios","oficioasele":"oficios","oficiolate":"oficiolat","oficiolatele":"oficiolat","oficiolatelor":"oficiolat","oficiolatul":"oficiolat","oficiolatule":"oficiolat","oficiolatului":"oficiolat","oficiosi":"oficios","oficiosii":"oficios","oficiosile":"oficios","oficiosilor":"oficios","oficiosul":"oficios","oficiosule":"oficios","oficiosului":"oficios","oficiul":"oficiu","oficiule":"oficiu","oficiului":"oficiu","oficleide":"oficleid","oficleidele":"oficleid","oficleidelor":"oficleid","oficleidul":"oficleid","oficleidule":"oficleid","oficleidului":"oficleid","ofidianul":"ofidian","ofidianule":"ofidian","ofidianului":"ofidian","ofidieni":"ofidian","ofidienii":"ofidian","ofidienilor":"ofidian","ofidisme":"ofidism","ofidismele":"ofidism","ofidismelor":"ofidism","ofidismul":"ofidism","ofidismule":"ofidism","ofidismului":"ofidism","ofilea":"ofili","ofileai":"ofili","ofileam":"ofili","ofileati":"ofili","ofileau":"ofili","ofilesc":"ofili","ofileste":"ofili","ofilesti":"ofili","ofilii":"ofili","ofilim":"ofili","ofilind":"ofili","ofilira":"ofili","ofiliram":"ofili","ofilirati":"ofili","ofilirea":"ofilire","ofiliri":"ofilire","ofilirii":"ofilire","ofilirile":"ofilire","ofilirilor":"ofilire","ofilise":"ofili","ofilisem":"ofili","ofilisera":"ofili","ofiliseram":"ofili","ofiliserati":"ofili","ofilisesi":"ofili","ofilisi":"ofili","ofilit":"ofili","ofilita":["ofilită","ofilit","ofilita","ofilit"],"ofilite":"ofilit","ofilitele":"ofilit","ofiliti":["ofiliți","ofili","ofiliți","ofilit"],"ofilitii":"ofilit","ofilitul":"ofilit","ofiofaga":["ofiofagă","ofiofag","ofiofaga","ofiofag"],"ofiofage":"ofiofag","ofiofagele":"ofiofag","ofiofagi":"ofiofag","ofiofagia":"ofiofagie","ofiofagiei":"ofiofagie","ofiofagii":["ofiofagii","ofiofag","ofiofagii","ofiofagie"],"ofiofagiile":"ofiofagie","ofiofagiilor":"ofiofagie","ofiofagul":"ofiofag","ofiografia":"ofiografie","ofiografiei":"ofiografie","ofiografii":"ofiografie","ofiografiile":"ofiografie","ofiografiilor":"ofiografie","ofiolatre":"ofiolatră","ofiolatrei":"ofiolatră","ofiolatrele":"ofiolatră","ofiolatrelor":"ofiolatră","ofiolatri":"ofiolatru","ofiolatria":"ofiolatrie","ofiolatriei":"ofiolatrie","ofiolatrii":["ofiolatrii","ofiolatrie","ofiolatrii","ofiolatru"],"ofiolatrilor":"ofiolatru","ofiolatruul":"ofiolatru","ofiolatruule":"ofiolatru","ofiolatruului":"ofiolatru","ofiolite":"ofiolit","ofiolitele":"ofiolit","ofiolitelor":"ofiolit","ofiolitul":"ofiolit","ofiolitule":"ofiolit","ofiolitului":"ofiolit","ofiologia":"ofiologie","ofiologica":["ofiologică","ofiologic","ofiologica","ofiologic"],"ofiologice":"ofiologic","ofiologicele":"ofiologic","ofiologici":"ofiologic","ofiologicii":"ofiologic","ofiologicul":"ofiologic","ofiologiei":"ofiologie","ofiologii":"ofiologie","ofisul":"ofis","ofisule":"ofis","ofisului":"ofis","ofisuri":"ofis","ofisurile":"ofis","ofisurilor":"ofis","ofite":"ofit","ofitele":"ofit","ofitelor":"ofit","ofiterasi":"ofițeraș","ofiterasii":"ofițeraș","ofiterasilor":"ofițeraș","ofiterasul":"ofițeraș","ofiterasule":"ofițeraș","ofiterasului":"ofițeraș","ofitereasca":["ofițerească","ofițeresc","ofițereasca","ofițeresc"],"ofiterescul":"ofițeresc","ofiterese":"ofițereasă","ofiteresei":"ofițereasă","ofiteresele":"ofițereasă","ofitereselor":"ofițereasă","ofiteresti":"ofițeresc","ofiterestii":"ofițeresc","ofiterestile":"ofițeresc","ofiteri":"ofițer","ofiteri secunzi":"ofițer secund","ofiterii":"ofițer","ofiterilor":"ofițer","ofiterimea":"ofițerime","ofiterimei":"ofițerime","ofiteroii":"ofițeroi","ofiteroilor":"ofițeroi","ofiteroiul":"ofițeroi","ofiteroiule":"ofițeroi","ofiteroiului":"ofițeroi","ofiterul":"ofițer","ofiterule":"ofițer","ofiterului":"ofițer","ofitiala":["ofițială","ofițial","ofițiala","ofițial"],"ofitiale":"ofițial","ofitialele":"ofițial","ofitiali":"ofițial","ofitialii":"ofițial","ofitialul":"ofițial","ofitica":["ofitică","ofitic","ofitica","ofitic"],"ofitice":"ofitic","ofiticele":"ofitic","ofitici":"ofitic","ofiticii":"ofitic","ofiticul":"ofitic","ofitul":"ofit","ofitule":"ofit","ofitului":"ofit","ofiuri":"ofiur","ofiuridul":"ofiurid","ofiuridule":"ofiurid","ofiuridului":"ofiurid","ofiurii":"ofiur","ofiurilor":"ofiur","ofiurizi":"ofiurid","ofiurizii":"ofiurid","ofiurizilor":"ofiurid","ofiurul":"ofiur","ofiurule":"ofiur","ofiurului":"ofiur","ofrande":"ofrandă","ofrandei":"ofrandă","ofrandele":"ofrandă","ofrandelor":"ofrandă","ofsaidul":"ofsaid","ofsaidule":"ofsaid","ofsaidului":"ofsaid","ofsaiduri":"ofsaid","ofsaidurile":"ofsaid","ofsaidurilor":"ofsaid","ofsetul":"ofset","ofsetule":"ofset","ofsetului":"ofset","ofseturi":"ofset","ofseturile":"ofset","ofseturilor":"ofset","oftai":"ofta","oftalmia":"oftalmie","oftalmica":["oftalmică","oftalmic","oftalmica","oftalmic"],"oftalmice":"oftalmic","oftalmicele":"oftalmic","oftalmici":"oftalmic","oftalmicii":"oftalmic","oftalmicul":"oftalmic","oftalmiei":"oftalmie","oftalmii":"oftalmie","oftalmiile":"oftalmie","oftalmiilor":"oftalmie","oftalmodinia":"oftalmodinie","oftalmodiniei":"oftalmodinie","oftalmodinii":"oftalmodinie","oftalmodiniile":"oftalmodinie","oftalmodiniilor":"oftalmodinie","oftalmografia":"oftalmografie","oftalmografiei":"oftalmografie","oftalmografii":"oftalmografie","oftalmografiile":"oftalmografie","oftalmografiilor":"oftalmografie","oftalmologe":"oftalmologă","oftalmologei":"oftalmologă","oftalmologele":"oftalmologă","oftalmologelor":"oftalmologă","oftalmologi":"oftalmolog","oftalmologia":"oftalmologie","oftalmologica":["oftalmologică","oftalmologic","oftalmologica","oftalmologic"],"oftalmologice":"oftalmologic","oftalmologicele":"oftalmologic","oftalmologici":"oftalmologic","oftalmologicii":"oftalmologic","oftalmologicul":"oftalmologic","oftalmologiei":"oftalmologie","oftalmologii":["oftalmologii","oftalmolog","oftalmologii","oftalmologie"],"oftalmologilor":"oftalmolog","oftalmologul":"oftalmolog","oftalmologule":"oftalmolog","oftalmologului":"oftalmolog","oftalmometre":"oftalmometru","oftalmometrele":"oftalmometru","oftalmometrelor":"oftalmometru","oftalmometria":"oftalmometrie","oftalmometrica":["oftalmometrică","oftalmometric","oftalmometrica","oftalmometric"],"oftalmometrice":"oftalmometric","oftalmometricele":"oftalmometric","oftalmometrici":"oftalmometric","oftalmometricii":"oftalmometric","oftalmometricul":"oftalmometric","oftalmometriei":"oftalmometrie","oftalmometrii":"oftalmometrie","oftalmometriile":"oftalmometrie","oftalmometriilor":"oftalmometrie","oftalmometrul":"oftalmometru","oftalmometrule":"oftalmometru","oftalmometrului":"oftalmometru","oftalmopatia":"oftalmopatie","oftalmopatiei":"oftalmopatie","oftalmopatii":"oftalmopatie","oftalmopatiile":"oftalmopatie","oftalmopatiilor":"oftalmopatie","oftalmoplegia":"oftalmoplegie","oftalmoplegiei":"oftalmoplegie","oftalmoplegii":"oftalmoplegie","oftalmoplegiile":"oftalmoplegie","oftalmoplegiilor":"oftalmoplegie","oftalmoragia":"oftalmoragie","oftalmoragiei":"oftalmoragie","oftalmoragii":"oftalmoragie","oftalmoragiile":"oftalmoragie","oftalmoragiilor":"oftalmoragie","oftalmoscoape":"oftalmoscop","oftalmoscoapele":"oftalmoscop","oftalmoscoapelor":"oftalmoscop","oftalmoscopia":"oftalmoscopie","oftalmoscopica":["oftalmoscopică","oftalmoscopic","oftalmoscopica","oftalmoscopic"],"oftalmoscopice":"oftalmoscopic","oftalmoscopicele":"oftalmoscopic","oftalmoscopici":"oftalmoscopic","oftalmoscopicii":"oftalmoscopic","oftalmoscopicul":"oftalmoscopic","oftalmoscopiei":"oftalmoscopie","oftalmoscopii":"oftalmoscopie","oftalmoscopiile":"oftalmoscopie","oftalmoscopiilor":"oftalmoscopie","oftalmoscopul":"oftalmoscop","oftalmoscopule":"oftalmoscop","oftalmoscopului":"oftalmoscop","oftalmotomia":"oftalmotomie","oftalmotomiei":"oftalmotomie","oftalmotomii":"oftalmotomie","oftalmotomiile":"oftalmotomie","oftalmotomiilor":"oftalmotomie","oftam":["oftăm","ofta","oftam","ofta"],"oftand":"ofta","oftara":"ofta","oftaram":"ofta","oftarati":"ofta","oftarea":"oftare","oftari":"oftare","oftarii":"oftare","oftarile":"oftare","oftarilor":"oftare","oftase":"ofta","oftasem":"ofta","oftasera":"ofta","oftaseram":"ofta","oftaserati":"ofta","oftasesi":"ofta","oftasi":"ofta","oftat":"ofta","oftata":["oftată","oftat","oftata","oftat"],"oftate":"oftat","oftatele":"oftat","oftati":["oftați","ofta","oftați","oftat"],"oftatii":"oftat","oftatul":"oftat","oftatule":"oftat","oftatului":"oftat","oftaturi":["oftaturi","oftat","oftături","oftătură"],"oftaturii":"oftătură","oftaturile":["oftaturile","oftat","oftăturile","oftătură"],"oftaturilor":["oftaturilor","oftat","oftăturilor","oftătură"],"oftau":"ofta","ofteaza":"ofta","oftez":"ofta","oftezi":"ofta","oftic":"oftica","ofticai":"oftica","ofticam":["ofticăm","oftica","ofticam","oftica"],"ofticand":"oftica","ofticara":"oftica","ofticaram":"oftica","ofticarati":"oftica","ofticarea":"ofticare","ofticari":"ofticare","ofticarii":"ofticare","ofticarile":"ofticare","ofticarilor":"ofticare","ofticase":"oftica","ofticasem":"oftica","ofticasera":"oftica","ofticaseram":"oftica","ofticaserati":"oftica","ofticasesi":"oftica","ofticasi":"oftica","ofticat":"oftica","ofticata":["ofticată","ofticat","ofticata","ofticat"],"ofticate":"ofticat","ofticatele":"ofticat","ofticati":["ofticați","oftica","ofticați","ofticat"],"ofticatii":"ofticat","ofticatul":"ofticat","ofticau":"oftica","oftici":["oftici","oftica","oftici","oftică"],"ofticii":"oftică","ofticile":"oftică","ofticilor":"oftică","ofticoasa":["ofticoasă","ofticos","ofticoasa","ofticos"],"ofticoase":"ofticos","ofticoasele":"ofticos","ofticosi":"ofticos","ofticosii":"ofticos","ofticosul":"ofticos","oftigi":"oftigă","oftigii":"oftigă","oftigile":"oftigă","oftigilor":"oftigă","oftigoasa":["oftigoasă","oftigos","oftigoasa","oftigos"],"oftigoase":"oftigos","oftigoasele":"oftigos","oftigosi":"oftigos","oftigosii":"oftigos","oftigosul":"oftigos","oftul":"oft","oftule":"oft","oftului":"oft","ofturi":"oft","ofturile":"oft","ofturilor":"oft","ofuscai":"ofusca","ofuscam":["ofuscăm","ofusca","ofuscam","ofusca"],"ofuscand":"ofusca","ofuscara":"ofusca","ofuscaram":"ofusca","ofuscarati":"ofusca","ofuscase":"ofusca","ofuscasem":"ofusca","ofuscasera":"ofusca","ofuscaseram":"ofusca","ofuscaserati":"ofusca","ofuscasesi":"ofusca","ofuscasi":"ofusca","ofuscat":"ofusca","ofuscata":["ofuscată","ofuscat","ofuscata","ofuscat"],"ofuscate":"ofuscat","ofuscatele":"ofuscat","ofuscati":["ofuscați","ofusca","ofuscați","ofuscat"],"ofuscatii":"ofuscat","ofuscatul":"ofuscat","ofuscau":"ofusca","ofuscheaza":"ofusca","ofuschez":"ofusca","ofuschezi":"ofusca","ogamul":"ogam","ogamule":"ogam","ogamului":"ogam","ogamuri":"ogam","ogamurile":"ogam","ogamurilor":"ogam"};
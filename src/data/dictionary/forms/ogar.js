@@ -0,0 +1 @@
+export default {"ogaratica":["ogăratică","ogăratic","ogăratica","ogăratic"],"ogaratice":"ogăratic","ogaraticele":"ogăratic","ogaratici":"ogăratic","ogaraticii":"ogăratic","ogaraticul":"ogăratic","ogaratoarea":"ogărătoare","ogaratori":"ogărătoare","ogaratorii":"ogărătoare","ogaratorile":"ogărătoare","ogaratorilor":"ogărătoare","ogarcai":"ogârcău","ogarcaii":"ogârcău","ogarcailor":"ogârcău","ogarcauul":"ogârcău","ogarcauule":"ogârcău","ogarcauului":"ogârcău","ogarce":"ogarcă","ogarcei":"ogarcă","ogarcele":"ogarcă","ogarcelor":"ogarcă","ogarcute":"ogărcuță","ogarcutei":"ogărcuță","ogarcutele":"ogărcuță","ogarcutelor":"ogărcuță","ogarei":"ogărel","ogareii":"ogărel","ogareilor":"ogărel","ogarelul":"ogărel","ogarelule":"ogărel","ogarelului":"ogărel","ogari":"ogar","ogari afgani":"ogar afgan","ogari de ibiza":"ogar de Ibiza","ogarii":"ogar","ogarilor":"ogar","ogarimea":"ogărime","ogarimei":"ogărime","ogarjita":["ogârjită","ogârjit","ogârjita","ogârjit"],"ogarjite":"ogârjit","ogarjitele":"ogârjit","ogarjiti":"ogârjit","ogarjitii":"ogârjit","ogarjitul":"ogârjit","ogarnica":["ogarnică","ogarnic","ogarnica","ogarnic"],"ogarnice":"ogarnic","ogarnicele":"ogarnic","ogarnici":"ogarnic","ogarnicii":"ogarnic","ogarnicul":"ogarnic","ogarul":"ogar","ogarule":"ogar","ogarului":"ogar","ogarusi":"ogăruș","ogarusii":"ogăruș","ogarusilor":"ogăruș","ogarusul":"ogăruș","ogarusule":"ogăruș","ogarusului":"ogăruș","ogaruti":"ogăruț","ogarutii":"ogăruț","ogarutilor":"ogăruț","ogarutul":"ogăruț","ogarutule":"ogăruț","ogarutului":"ogăruț","ogeaclii":"ogeacliu","ogeacliii":"ogeacliu","ogeacliilor":"ogeacliu","ogeacliuul":"ogeacliu","ogeacliuule":"ogeacliu","ogeacliuului":"ogeacliu","ogeacul":"ogeac","ogeacule":"ogeac","ogeacului":"ogeac","ogeacuri":"ogeac","ogeacurile":"ogeac","ogeacurilor":"ogeac","oghealul":"ogheal","oghealule":"ogheal","oghealului":"ogheal","oghealuri":"ogheal","oghealurile":"ogheal","oghealurilor":"ogheal","oghelase":"oghelaș","oghelasele":"oghelaș","oghelaselor":"oghelaș","oghelasul":"oghelaș","oghelasule":"oghelaș","oghelasului":"oghelaș","ogivala":["ogivală","ogival","ogivala","ogival"],"ogivale":"ogival","ogivalele":"ogival","ogivali":"ogival","ogivalii":"ogival","ogivalul":"ogival","ogive":"ogivă","ogivei":"ogivă","ogivele":"ogivă","ogivelor":"ogivă","oglasenia":"oglașenie","oglasenici":"oglașenic","oglasenicii":"oglașenic","oglasenicilor":"oglașenic","oglasenicul":"oglașenic","oglasenicule":"oglașenic","oglasenicului":"oglașenic","oglaseniei":"oglașenie","oglasenii":"oglașenie","oglaseniile":"oglașenie","oglaseniilor":"oglașenie","oglindai":"oglinda","oglindam":["oglindăm","oglinda","oglindam","oglinda"],"oglindand":"oglinda","oglindara":"oglinda","oglindaram":"oglinda","oglindarati":"oglinda","oglindari":"oglindar","oglindaria":"oglindărie","oglindariei":"oglindărie","oglindarii":["oglindarii","oglindar","oglindării","oglindărie"],"oglindariile":"oglindărie","oglindariilor":"oglindărie","oglindarilor":"oglindar","oglindarul":"oglindar","oglindarule":"oglindar","oglindarului":"oglindar","oglindase":"oglinda","oglindasem":"oglinda","oglindasera":"oglinda","oglindaseram":"oglinda","oglindaserati":"oglinda","oglindasesi":"oglinda","oglindasi":"oglinda","oglindat":"oglinda","oglindati":"oglinda","oglindau":"oglinda","oglindea":"oglindi","oglindeai":"oglindi","oglindeam":"oglindi","oglindeati":"oglindi","oglindeau":"oglindi","oglindeaza":"oglinda","oglindele":"oglindeală","oglindelei":"oglindeală","oglindelele":"oglindeală","oglindelelor":"oglindeală","oglindeli":"oglindeală","oglindesc":"oglindi","oglindeste":"oglindi","oglindesti":"oglindi","oglindez":"oglinda","oglindezi":"oglinda","oglindii":"oglindi","oglindim":"oglindi","oglindind":"oglindi","oglindioare":"oglindioară","oglindioarei":"oglindioară","oglindioarele":"oglindioară","oglindioarelor":"oglindioară","oglindira":"oglindi","oglindiram":"oglindi","oglindirati":"oglindi","oglindiri":"oglindire","oglindise":"oglindi","oglindisem":"oglindi","oglindisera":"oglindi","oglindiseram":"oglindi","oglindiserati":"oglindi","oglindisesi":"oglindi","oglindisi":"oglindi","oglindit":"oglindi","oglinditi":"oglindi","oglinditoare":"oglinditor","oglinditoarea":"oglinditor","oglinditoarele":"oglinditor","oglinditori":"oglinditor","oglinditorii":"oglinditor","oglinditorul":"oglinditor","oglindoasa":["oglindoasă","oglindos","oglindoasa","oglindos"],"oglindoase":"oglindos","oglindoasele":"oglindos","oglindosi":"oglindos","oglindosii":"oglindos","oglindosul":"oglindos","oglindute":"oglinduță","oglindutei":"oglinduță","oglindutele":"oglinduță","oglindutelor":"oglinduță","oglingioare":"oglingioară","oglingioarei":"oglingioară","oglingioarele":"oglingioară","oglingioarelor":"oglingioară","oglinjoare":"oglinjoară","oglinjoarei":"oglinjoară","oglinjoarele":"oglinjoară","oglinjoarelor":"oglinjoară","oglinzi":"oglindă","oglinzii":"oglindă","oglinzile":"oglindă","oglinzilor":"oglindă","ognite":"ogniță","ognitei":"ogniță","ognitele":"ogniță","ognitelor":"ogniță","ogoaie":"ogoia","ogoare":"ogor","ogoarele":"ogor","ogoarelor":"ogor","ogodea":"ogodi","ogodeai":"ogodi","ogodeam":"ogodi","ogodeati":"ogodi","ogodeau":"ogodi","ogodesc":"ogodi","ogodeste":"ogodi","ogodesti":"ogodi","ogodii":"ogodi","ogodim":"ogodi","ogodind":"ogodi","ogodinte":"ogodință","ogodintei":"ogodință","ogodintele":"ogodință","ogodintelor":"ogodință","ogodira":"ogodi","ogodiram":"ogodi","ogodirati":"ogodi","ogodise":"ogodi","ogodisem":"ogodi","ogodisera":"ogodi","ogodiseram":"ogodi","ogodiserati":"ogodi","ogodisesi":"ogodi","ogodisi":"ogodi","ogodit":"ogodi","ogoditi":"ogodi","ogodne":"ogodnă","ogodnei":"ogodnă","ogodnele":"ogodnă","ogodnelor":"ogodnă","ogodnite":"ogodniță","ogodnitei":"ogodniță","ogoi":"ogoia","ogoiai":"ogoia","ogoiam":"ogoia","ogoiara":"ogoia","ogoiaram":"ogoia","ogoiarati":"ogoia","ogoiase":"ogoia","ogoiasem":"ogoia","ogoiasera":"ogoia","ogoiaseram":"ogoia","ogoiaserati":"ogoia","ogoiasesi":"ogoia","ogoiasi":"ogoia","ogoiat":"ogoia","ogoiata":["ogoiată","ogoiat","ogoiata","ogoiat"],"ogoiate":"ogoiat","ogoiatele":"ogoiat","ogoiati":["ogoiați","ogoia","ogoiați","ogoiat"],"ogoiatii":"ogoiat","ogoiatul":"ogoiat","ogoiau":"ogoia","ogoie":"ogoia","ogoiem":"ogoia","ogoind":"ogoia","ogoirea":"ogoire","ogoiri":"ogoire","ogoirii":"ogoire","ogoirile":"ogoire","ogoirilor":"ogoire","ogoita":["ogoită","ogoit","ogoita","ogoit"],"ogoite":"ogoit","ogoitele":"ogoit","ogoiti":"ogoit","ogoitii":"ogoit","ogoitul":"ogoit","ogora":"ogorî","ogorai":["ogorai","ogorî","ogorâi","ogorî"],"ogoram":["ogorâm","ogorî","ogoram","ogorî"],"ogorand":"ogorî","ogorara":"ogorî","ogoraram":"ogorî","ogorarati":"ogorî","ogorasc":"ogorî","ogorase":["ogorașe","ogoraș","ogorâse","ogorî"],"ogorasele":"ogoraș","ogoraselor":"ogoraș","ogorasem":"ogorî","ogorasera":"ogorî","ogoraseram":"ogorî","ogoraserati":"ogorî","ogorasesi":"ogorî","ogorasi":"ogorî","ogoraste":"ogorî","ogorastea":"ogorâște","ogorasti":["ogorâști","ogorâște","ogorăști","ogorî"],"ogorastii":"ogorâște","ogorastile":"ogorâște","ogorastilor":"ogorâște","ogorasul":"ogoraș","ogorasule":"ogoraș","ogorasului":"ogoraș","ogorati":["ogorâți","ogorî","ogorați","ogorî"],"ogorau":"ogorî","ogorit":"ogorî","ogoritul":"ogorit","ogoritule":"ogorit","ogoritului":"ogorit","ogorituri":"ogorit","ogoriturile":"ogorit","ogoriturilor":"ogorit","ogorul":"ogor","ogorule":"ogor","ogorului":"ogor","ogradasi":"ogrădaș","ogradasii":"ogrădaș","ogradasilor":"ogrădaș","ogradasul":"ogrădaș","ogradasule":"ogrădaș","ogradasului":"ogrădaș","ogradeanul":"ogrădean","ogradeanule":"ogrădean","ogradeanului":"ogrădean","ogradeni":"ogrădean","ogradenii":"ogrădean","ogradenilor":"ogrădean","ograjoare":"ogrăjoară","ograjoarei":"ogrăjoară","ograjoarele":"ogrăjoară","ograjoarelor":"ogrăjoară","ograzi":"ogradă","ograzii":"ogradă","ograzile":"ogradă","ograzilor":"ogradă","ogurlia":"ogurliu","ogurlie":"ogurliu","ogurlii":"ogurliu","ogurliii":"ogurliu","ogurliile":"ogurliu","ogurliul":"ogurliu","ogurul":"ogur","ogurule":"ogur","ogurului":"ogur","ogururi":"ogur","ogururile":"ogur","ogururilor":"ogur","ohaba lunga romana":"Valea Lungă Română","ohabe":"ohabă","ohabei":"ohabă","ohabele":"ohabă","ohabelor":"ohabă","ohabnica":["ohabnică","ohabnic","ohabnica","ohabnic"],"ohabnice":"ohabnic","ohabnicele":"ohabnic","ohabnici":"ohabnic","ohabnicii":"ohabnic","ohabnicul":"ohabnic","ohavnica":["ohavnică","ohavnic","ohavnica","ohavnic"],"ohavnice":"ohavnic","ohavnicele":"ohavnic","ohavnici":"ohavnic","ohavnicii":"ohavnic","ohavnicul":"ohavnic","ohlocratie":"oclocrație","ohlocratiea":"ohlocrație","ohlocratii":"ohlocrație","ohlocratiii":"ohlocrație","ohlocratiile":"ohlocrație","ohlocratiilor":"ohlocrație","ohmi":"ohm","ohmica":["ohmică","ohmic","ohmica","ohmic"],"ohmice":"ohmic","ohmicele":"ohmic","ohmici":"ohmic","ohmicii":"ohmic","ohmicul":"ohmic","ohmii":"ohm","ohmilor":"ohm","ohmmetre":"ohmmetru","ohmmetrele":"ohmmetru","ohmmetrelor":"ohmmetru","ohmmetrul":"ohmmetru","ohmmetrule":"ohmmetru","ohmmetrului":"ohmmetru","ohmul":"ohm","ohmule":"ohm","ohmului":"ohm","ohrane":"ohrană","ohranei":"ohrană","ohtoicul":"ohtoic","ohtoicule":"ohtoic","ohtoicului":"ohtoic","ohtoicuri":"ohtoic","ohtoicurile":"ohtoic","ohtoicurilor":"ohtoic","oi":"oaie","oiasca":["oiască","oiesc","oiasca","oiesc"],"oici":"oică","oicii":"oică","oicile":"oică","oicilor":"oică","oiconime":"oiconim","oiconimele":"oiconim","oiconimelor":"oiconim","oiconimul":"oiconim","oiconimule":"oiconim","oiconimului":"oiconim","oidiumul":"oidium","oidiumule":"oidium","oidiumului":"oidium","oie":"oaie","oieri":"oier","oieria":"oierie","oieriei":"oierie","oierii":["oierii","oier","oierii","oierie"],"oieriile":"oierie","oieriilor":"oierie","oierilor":"oier","oieritul":"oierit","oieritule":"oierit","oieritului":"oierit","oierul":"oier","oierule":"oier","oierului":"oier","oiescul":"oiesc","oiesti":"oiesc","oiestii":"oiesc","oiestile":"oiesc","oii":"oaie","oile":"oaie","oilor":"oaie","oimea":"oime","oimi":"oime","oimii":"oime","oine":"oină","oinei":"oină","oinele":"oină","oinelor":"oină","oinisti":["oiniști","oinist","oinisti","oinist"],"oinistii":"oinist","oinistilor":"oinist","oinistul":"oinist","oinistule":"oinist","oinistului":"oinist","oinolog":"enolog","oisoare":"oișoară","oisoarei":"oișoară","oisoarele":"oișoară","oisoarelor":"oișoară","oistea":"oiște","oisti":"oiște","oistii":"oiște","oistile":"oiște","oistilor":"oiște","oite":"oiță","oitei":"oiță","oitele":"oiță","oitelor":"oiță","oitice":"oițică","oiticei":"oițică","oiticele":"oițică","oiticelor":"oițică","oitici":"oițică","oje":"ojă","ojei":"ojă","ojele":"ojă","ojelor":"ojă","ojivoia":"ojivoi","ojivoiai":"ojivoi","ojivoiam":"ojivoi","ojivoiati":"ojivoi","ojivoiau":"ojivoi","ojivoie":"ojivoi","ojivoii":"ojivoi","ojivoim":"ojivoi","ojivoind":"ojivoi","ojivoira":"ojivoi","ojivoiram":"ojivoi","ojivoirati":"ojivoi","ojivoise":"ojivoi","ojivoisem":"ojivoi","ojivoisera":"ojivoi","ojivoiseram":"ojivoi","ojivoiserati":"ojivoi","ojivoisesi":"ojivoi","ojivoisi":"ojivoi","ojivoit":"ojivoi","ojivoiti":"ojivoi","ojoace":"ojoc","ojoacele":"ojoc","ojoacelor":"ojoc","ojocul":"ojoc","ojocule":"ojoc","ojocului":"ojoc","ola":"oală","olacaia":"olăcăi","olacaiai":"olăcăi","olacaiam":"olăcăi","olacaiati":"olăcăi","olacaiau":"olăcăi","olacaie":"olăcăi","olacaii":"olăcăi","olacaim":"olăcăi","olacaind":"olăcăi","olacaira":"olăcăi","olacairam":"olăcăi","olacairati":"olăcăi","olacaise":"olăcăi","olacaisem":"olăcăi","olacaisera":"olăcăi","olacaiseram":"olăcăi","olacaiserati":"olăcăi","olacaisesi":"olăcăi","olacaisi":"olăcăi","olacait":"olăcăi","olacaiti":"olăcăi","olacari":"olăcar","olacarii":"olăcar","olacarilor":"olăcar","olacarul":"olăcar","olacarule":"olăcar","olacarului":"olăcar","olacasi":"olăcaș","olacasii":"olăcaș","olacasilor":"olăcaș","olacasul":"olăcaș","olacasule":"olăcaș","olacasului":"olăcaș","olaci":"olac","olacii":"olac","olacilor":"olac","olacul":"olac","olacule":"olac","olacului":"olac","olaha":["olahă","olah","olaha","olah"],"olahe":"olah","olahele":"olah","olahi":"olah","olahii":"olah","olahilor":"olah","olahul":"olah","olahule":"olah","olahului":"olah","olandeza":["olandeză","olandez","olandeza","olandez"],"olandeze":["olandeze","olandez","olandeze","olandeză"],"olandezei":"olandeză","olandezele":["olandezele","olandez","olandezele","olandeză"],"olandezelor":"olandeză","olandezi":"olandez","olandezii":"olandez","olandezilor":"olandez","olandezul":"olandez","olandezule":"olandez","olandezului":"olandez","olane":["olane","olan","olane","olană"],"olanele":"olan","olanelor":"olan","olangii":"olangiu","olangiii":"olangiu","olangiilor":"olangiu","olangiuul":"olangiu","olangiuule":"olangiu","olangiuului":"olangiu","olanul":"olan","olanule":"olan","olanului":"olan","olarese":"olăreasă","olaresei":"olăreasă","olaresele":"olăreasă","olareselor":"olăreasă","olari":"olar","olari vechi":"Olarii Vechi","olaria":"olărie","olariei":"olărie","olarii":["olarii","olar","olării","olărie"],"olariile":"olărie","olariilor":"olărie","olarilor":"olar","olarite":"olăriță","olaritei":"olăriță","olaritele":"olăriță","olaritelor":"olăriță","olaritul":"olărit","olaritule":"olărit","olaritului":"olărit","olarul":"olar","olarule":"olar","olarului":"olar","olastisele":"olastiseală","olastiselei":"olastiseală","olastiselele":"olastiseală","olastiselelor":"olastiseală","olastiseli":"olastiseală","olatasi":"olătaș","olatasii":"olătaș","olatasilor":"olătaș","olatasul":"olătaș","olatasule":"olătaș","olatasului":"olătaș","olatul":"olat","olatule":"olat","olatului":"olat","olaturi":"olat","olaturile":"olat","olaturilor":"olat","olcute":"olcuță","olcutei":"olcuță","olcutele":"olcuță","olcutelor":"olcuță","oleacul":"oleac","oleacule":"oleac","oleacului":"oleac","oleaginoasa":["oleaginoasă","oleaginos","oleaginoasa","oleaginos"],"oleaginoase":"oleaginos","oleaginoasele":"oleaginos","oleaginosi":"oleaginos","oleaginosii":"oleaginos","oleaginosul":"oleaginos","oleandri":"oleandru","oleandrii":"oleandru","oleandrilor":"oleandru","oleandruul":"oleandru","oleandruule":"oleandru","oleandruului":"oleandru","oleastri":"oleastru","oleastrii":"oleastru","oleastrilor":"oleastru","oleastruul":"oleastru","oleastruule":"oleastru","oleastruului":"oleastru","oleati":"oleat","oleatii":"oleat","oleatilor":"oleat","oleatul":"oleat","oleatule":"oleat","oleatului":"oleat","olecaia":"olecăi","olecaiai":"olecăi","olecaiam":"olecăi","olecaiati":"olecăi","olecaiau":"olecăi","olecaie":"olecăi","olecaii":"olecăi","olecaim":"olecăi","olecaind":"olecăi","olecaira":"olecăi","olecairam":"olecăi","olecairati":"olecăi","olecairea":"olecăire","olecairi":"olecăire","olecairii":"olecăire","olecairile":"olecăire","olecairilor":"olecăire","olecaise":"olecăi","olecaisem":"olecăi","olecaisera":"olecăi","olecaiseram":"olecăi","olecaiserati":"olecăi","olecaisesi":"olecăi","olecaisi":"olecăi","olecait":"olecăi","olecaiti":"olecăi","olecaitul":"olecăit","olecaitule":"olecăit","olecaitului":"olecăit","olecaituri":["olecăituri","olecăit","olecăituri","olecăitură"],"olecaiturii":"olecăitură","olecaiturile":["olecăiturile","olecăit","olecăiturile","olecăitură"],"olecaiturilor":["olecăiturilor","olecăit","olecăiturilor","olecăitură"],"olecranul":"olecran","olecranule":"olecran","olecranului":"olecran","olecranuri":"olecran","olecranurile":"olecran","olecranurilor":"olecran","olefine":"olefină","olefinei":"olefină","olefinele":"olefină","olefinelor":"olefină","olefinica":["olefinică","olefinic","olefinica","olefinic"],"olefinice":"olefinic","olefinicele":"olefinic","olefinici":"olefinic","olefinicii":"olefinic","olefinicul":"olefinic","oleiai":"oleia","oleiam":"oleia","oleiara":"oleia","oleiaram":"oleia","oleiarati":"oleia","oleiase":"oleia","oleiasem":"oleia","oleiasera":"oleia","oleiaseram":"oleia","oleiaserati":"oleia","oleiasesi":"oleia","oleiasi":"oleia","oleiat":"oleia","oleiata":["oleiată","oleiat","oleiata","oleiat"],"oleiate":"oleiat","oleiatele":"oleiat","oleiati":["oleiați","oleia","oleiați","oleiat"],"oleiatii":"oleiat","oleiatul":"oleiat","oleiau":"oleia","oleiaza":"oleia","oleica":["oleică","oleic","oleica","oleic"],"oleice":"oleic","oleicele":"oleic","oleici":"oleic","oleicii":"oleic","oleicul":"oleic","oleie":"oleia","oleiem":"oleia","oleiez":"oleia","oleiezi":"oleia","oleifera":["oleiferă","oleifer","oleifera","oleifer"],"oleifere":"oleifer","oleiferele":"oleifer","oleiferi":"oleifer","oleiferii":"oleifer","oleiferul":"oleifer","oleiforma":["oleiformă","oleiform","oleiforma","oleiform"],"oleiforme":"oleiform","oleiformele":"oleiform","oleiformi":"oleiform","oleiformii":"oleiform","oleiformul":"oleiform","oleind":"oleia","oleine":"oleină","oleinei":"oleină","oleinele":"oleină","oleinelor":"oleină","oleioasa":["oleioasă","oleios","oleioasa","oleios"],"oleioase":"oleios","oleioasele":"oleios","oleiosi":"oleios","oleiosii":"oleios","oleiosul":"oleios","olene":"olană","olenei":"olană","olenele":"olană","olenelor":"olană","oleoducte":"oleoduct","oleoductele":"oleoduct","oleoductelor":"oleoduct","oleoductul":"oleoduct","oleoductule":"oleoduct","oleoductului":"oleoduct","oleoducul":"oleoduc","oleoducule":"oleoduc","oleoducului":"oleoduc","oleoducuri":"oleoduc","oleoducurile":"oleoduc","oleoducurilor":"oleoduc","oleofila":["oleofilă","oleofil","oleofila","oleofil"],"oleofile":"oleofil","oleofilele":"oleofil","oleofili":"oleofil","oleofilii":"oleofil","oleofilul":"oleofil","oleografia":"oleografie","oleografiei":"oleografie","oleografii":"oleografie","oleografiile":"oleografie","oleografiilor":"oleografie","oleomargarine":"oleomargarină","oleomargarinei":"oleomargarină","oleomargarinele":"oleomargarină","oleomargarinelor":"oleomargarină","oleometre":"oleometru","oleometrele":"oleometru","oleometrelor":"oleometru","oleometrul":"oleometru","oleometrule":"oleometru","oleometrului":"oleometru","oleul":"oleu","oleule":"oleu","oleului":"oleu","oleumul":"oleum","oleumule":"oleum","oleumului":"oleum","oleuri":"oleu","oleurile":"oleu","oleurilor":"oleu","olfactia":"olfacție","olfactiei":"olfacție","olfactii":"olfacție","olfactiile":"olfacție","olfactiilor":"olfacție","olfactiunea":"olfacțiune","olfactiuni":"olfacțiune","olfactiunii":"olfacțiune","olfactiunile":"olfacțiune","olfactiunilor":"olfacțiune","olfactiva":["olfactivă","olfactiv","olfactiva","olfactiv"],"olfactive":"olfactiv","olfactivele":"olfactiv","olfactivi":"olfactiv","olfactivii":"olfactiv","olfactivul":"olfactiv","olfactometre":"olfactometru","olfactometrele":"olfactometru","olfactometrelor":"olfactometru","olfactometria":"olfactometrie","olfactometriei":"olfactometrie","olfactometrii":"olfactometrie","olfactometriile":"olfactometrie","olfactometriilor":"olfactometrie","olfactometrul":"olfactometru","olfactometrule":"olfactometru","olfactometrului":"olfactometru","olfactronici":"olfactronică","olfactronicii":"olfactronică","olfactronicile":"olfactronică","olfactronicilor":"olfactronică","olgai":"Olga","olicaia":"olicăi","olicaiai":"olicăi","olicaiam":"olicăi","olicaiati":"olicăi","olicaiau":"olicăi","olicaie":"olicăi","olicaii":"olicăi","olicaim":"olicăi","olicaind":"olicăi","olicaira":"olicăi","olicairam":"olicăi","olicairati":"olicăi","olicaise":"olicăi","olicaisem":"olicăi","olicaisera":"olicăi","olicaiseram":"olicăi","olicaiserati":"olicăi","olicaisesi":"olicăi","olicaisi":"olicăi","olicait":"olicăi","olicaiti":"olicăi","olicele":"olicică","olicelei":"olicică","olicelele":"olicică","olicelelor":"olicică","oliganta":["oligantă","oligant","oliganta","oligant"],"oligante":"oligant","oligantele":"oligant","oliganti":"oligant","oligantii":"oligant","oligantul":"oligant","oligarhi":"oligarh","oligarhia":"oligarhie","oligarhica":["oligarhică","oligarhic","oligarhica","oligarhic"],"oligarhice":"oligarhic","oligarhicele":"oligarhic","oligarhici":"oligarhic","oligarhicii":"oligarhic","oligarhicul":"oligarhic","oligarhiei":"oligarhie","oligarhii":["oligarhii","oligarh","oligarhii","oligarhie"],"oligarhiile":"oligarhie","oligarhiilor":"oligarhie","oligarhilor":"oligarh","oligarhul":"oligarh","oligarhule":"oligarh","oligarhului":"oligarh","oligistul":"oligist","oligistule":"oligist","oligistului":"oligist","oligisturi":"oligist","oligisturile":"oligist","oligisturilor":"oligist","olignele":"oligneală","olignelei":"oligneală","olignelele":"oligneală","olignelelor":"oligneală","oligneli":"oligneală","oligoceni":"oligocen","oligocenile":"oligocen","oligocenilor":"oligocen","oligocenul":"oligocen","oligocenule":"oligocen","oligocenului":"oligocen","oligochete":"oligochet","oligochetele":"oligochet","oligochetelor":"oligochet","oligochetul":"oligochet","oligochetule":"oligochet","oligochetului":"oligochet","oligocitemia":"oligocitemie","oligocitemiei":"oligocitemie","oligocitemii":"oligocitemie","oligocitemiile":"oligocitemie","oligocitemiilor":"oligocitemie","oligocratia":"oligocrație","oligocratiei":"oligocrație","oligocratii":"oligocrație","oligocratiile":"oligocrație","oligocratiilor":"oligocrație","oligodipsia":"oligodipsie","oligodipsiei":"oligodipsie","oligodipsii":"oligodipsie","oligodipsiile":"oligodipsie","oligodipsiilor":"oligodipsie","oligoelemente":"oligoelement","oligoelementele":"oligoelement","oligoelementelor":"oligoelement","oligoelementul":"oligoelement","oligoelementule":"oligoelement","oligoelementului":"oligoelement","oligofagia":"oligofagie","oligofagiei":"oligofagie","oligofagii":"oligofagie","oligofagiile":"oligofagie","oligofagiilor":"oligofagie","oligofrene":"oligofrenă","oligofrenei":"oligofrenă","oligofrenele":"oligofrenă","oligofrenelor":"oligofrenă","oligofreni":"oligofren","oligofrenia":"oligofrenie","oligofreniei":"oligofrenie","oligofrenii":["oligofrenii","oligofren","oligofrenii","oligofrenie"],"oligofrenilor":"oligofren","oligofrenul":"oligofren","oligofrenule":"oligofren","oligofrenului":"oligofren","oligomenoreea":"oligomenoree","oligomenoreei":"oligomenoree","oligomenoreele":"oligomenoree","oligomenoreelor":"oligomenoree","oligomera":["oligomeră","oligomer","oligomera","oligomer"],"oligomere":"oligomer","oligomerele":"oligomer","oligomeri":"oligomer","oligomerii":"oligomer","oligomerul":"oligomer","oligopolul":"oligopol","oligopolule":"oligopol","oligopolului":"oligopol","oligopoluri":"oligopol","oligopolurile":"oligopol","oligopolurilor":"oligopol","oligopote":"oligopotă","oligopotei":"oligopotă","oligopotele":"oligopotă","oligopotelor":"oligopotă","oligosperme":"oligosperm","oligospermele":"oligosperm","oligospermelor":"oligosperm","oligospermia":"oligospermie","oligospermiei":"oligospermie","oligospermii":"oligospermie","oligospermiile":"oligospermie","oligospermiilor":"oligospermie","oligospermul":"oligosperm","oligospermule":"oligosperm","oligospermului":"oligosperm","oligoterapia":"oligoterapie","oligoterapiei":"oligoterapie","oligoterapii":"oligoterapie","oligotrofa":["oligotrofă","oligotrof","oligotrofa","oligotrof"],"oligotrofe":"oligotrof","oligotrofele":"oligotrof","oligotrofi":"oligotrof","oligotrofia":"oligotrofie","oligotrofiei":"oligotrofie","oligotrofii":["oligotrofii","oligotrof","oligotrofii","oligotrofie"],"oligotrofiile":"oligotrofie","oligotrofiilor":"oligotrofie","oligotroful":"oligotrof","oligozaharide":"oligozaharidă","oligozaharidei":"oligozaharidă","oligozaharidele":"oligozaharidă","oligozaharidelor":"oligozaharidă","oliguria":"oligurie","oliguriei":"oligurie","oligurii":"oligurie","oliguriile":"oligurie","oliguriilor":"oligurie","olimpiade":"olimpiadă","olimpiadei":"olimpiadă","olimpiadele":"olimpiadă","olimpiadelor":"olimpiadă","olimpiana":["olimpiană","olimpian","olimpiana","olimpian"],"olimpianismul":"olimpianism","olimpianismule":"olimpianism","olimpianismului":"olimpianism","olimpianul":"olimpian","olimpica":["olimpică","olimpic","olimpica","olimpic"],"olimpice":["olimpice","olimpic","olimpice","olimpică"],"olimpicei":"olimpică","olimpicele":["olimpicele","olimpic","olimpicele","olimpică"],"olimpicelor":"olimpică","olimpici":"olimpic","olimpicii":"olimpic","olimpicul":"olimpic","olimpiene":["olimpiene","olimpian","olimpiene","olimpiană"],"olimpienei":"olimpiană","olimpienele":["olimpienele","olimpian","olimpienele","olimpiană"],"olimpienelor":"olimpiană","olimpieni":"olimpian","olimpienii":"olimpian","olisoare":"olișoară","olisoarei":"olișoară","olisoarele":"olișoară","olisoarelor":"olișoară","olite":"oliță","olitei":"oliță","olitele":"oliță","olitelor":"oliță","olive":"olivă","olivei":"olivă","olivele":"olivă","olivelor":"olivă","olivi":"oliv","oliviere":"olivieră","olivierei":"olivieră","olivierele":"olivieră","olivierelor":"olivieră","olivii":"oliv","olivilor":"oliv","olivine":"olivină","olivinei":"olivină","olivinele":"olivină","olivinelor":"olivină","olivul":"oliv","olivule":"oliv","olivului":"oliv","olmuri":"olm","oloaga":["oloagă","olog","oloaga","olog"],"oloage":"olog","oloagele":"olog","oloaie":"oloi","oloaiele":"oloi","oloaielor":"oloi","olocausturi":"olocaust","ologea":"ologi","ologeai":"ologi","ologeam":"ologi","ologeati":"ologi","ologeau":"ologi","ologela":["ologelă","ologel","ologela","ologel"],"ologele":"ologel","ologelele":"ologel","ologeli":["ologeli","ologeală","ologeli","ologel"],"ologelii":["ologelii","ologeală","ologelii","ologel"],"ologelile":"ologeală","ologelilor":"ologeală","ologelul":"ologel","ologesc":"ologi","ologeste":"ologi","ologesti":"ologi","ologi":"olog","ologia":"ologie","ologiei":"ologie","ologii":["ologii","olog","ologii","ologi","ologii","ologie"],"ologiile":"ologie","ologiilor":"ologie","ologim":"ologi","ologind":"ologi","ologira":"ologi","ologiram":"ologi","ologirati":"ologi","ologirea":"ologire","ologiri":"ologire","ologirii":"ologire","ologirile":"ologire","ologirilor":"ologire","ologise":"ologi","ologisem":"ologi","ologisera":"ologi","ologiseram":"ologi","ologiserati":"ologi","ologisesi":"ologi","ologisi":"ologi","ologit":"ologi","ologita":["ologită","ologit","ologita","ologit"],"ologite":"ologit","ologitele":"ologit","ologiti":["ologiți","ologi","ologiți","ologit"],"ologitii":"ologit","ologitul":"ologit","olografa":["olografă","olograf","olografa","olograf"],"olografe":"olograf","olografele":"olograf","olografi":"olograf","olografia":"olografie","olografiei":"olografie","olografii":["olografii","olograf","olografii","olografie"],"olografiile":"olografie","olografiilor":"olografie","olograful":"olograf","ologul":"olog","oloiernite":"oloierniță","oloiernitei":"oloierniță","oloiernitele":"oloierniță","oloiernitelor":"oloierniță","oloinite":"oloiniță","oloinitei":"oloiniță","oloinitele":"oloiniță","oloinitelor":"oloiniță","oloioasa":["oloioasă","oloios","oloioasa","oloios"],"oloioase":"oloios","oloioasele":"oloios","oloiosi":"oloios","oloiosii":"oloios","oloiosul":"oloios","oloise":"oloisă","oloisei":"oloisă","oloisele":"oloisă","oloiselor":"oloisă","oloistea":"oloiște","oloisti":"oloiște","oloistii":"oloiște","oloistile":"oloiște","oloistilor":"oloiște","oloiul":"oloi","oloiule":"oloi","oloiului":"oloi","olonomia":"olonomie","olonomiei":"olonomie","olonomii":"olonomie","olonomiile":"olonomie","olonomiilor":"olonomie","olorele":"oloreală","olorelei":"oloreală","olorelele":"oloreală","olorelelor":"oloreală","oloreli":"oloreală","olosi":"oloș","olosii":"oloș","olosilor":"oloș","olosul":"oloș","olosule":"oloș","olosului":"oloș","olovine":"olovină","olovinei":"olovină","olovinele":"olovină","olovinelor":"olovină","olpe":"olpă","olpei":"olpă","olpele":"olpă","olpelor":"olpă","oltare":"oltar","oltarele":"oltar","oltarelor":"oltar","oltarnici":"oltarnic","oltarnicii":"oltarnic","oltarnicilor":"oltarnic","oltarnicul":"oltarnic","oltarnicule":"oltarnic","oltarnicului":"oltarnic","oltarul":"oltar","oltarule":"oltar","oltarului":"oltar","olteanul":"oltean","olteanule":"oltean","olteanului":"oltean","oltenasi":"oltenaș","oltenasii":"oltenaș","oltenasilor":"oltenaș","oltenasul":"oltenaș","oltenasule":"oltenaș","oltenasului":"oltenaș","oltence":"olteancă","oltencei":"olteancă","oltencele":"olteancă","oltencelor":"olteancă","oltene":"olteană","olteneasca":["oltenească","oltenesc","olteneasca","oltenesc"],"oltenei":"olteană","oltenele":"olteană","oltenelor":"olteană","oltenescul":"oltenesc","oltenesti":"oltenesc","oltenestii":"oltenesc","oltenestile":"oltenesc","olteni":"oltean","oltenie":"Oltenia","olteniei":"Oltenia","oltenii":["oltenii","oltean","oltenii","Oltenia"],"oltenilor":"oltean","oltul":"Olt","oltule":"Olt","oltului":"Olt","olul":"ol","olule":"ol","olului":"ol","olute":["oluțe","oluț","oluțe","oluță"],"olutei":"oluță","olutele":["oluțele","oluț","oluțele","oluță"],"olutelor":["oluțelor","oluț","oluțelor","oluță"],"olutul":"oluț","olutule":"oluț","olutului":"oluț","omagi":"omag","omagiai":"omagia","omagiala":["omagială","omagial","omagiala","omagial"],"omagiale":"omagial","omagialele":"omagial","omagiali":"omagial","omagialii":"omagial","omagialul":"omagial","omagiam":"omagia","omagiara":"omagia","omagiaram":"omagia","omagiarati":"omagia","omagiase":"omagia","omagiasem":"omagia","omagiasera":"omagia","omagiaseram":"omagia","omagiaserati":"omagia","omagiasesi":"omagia","omagiasi":"omagia","omagiat":"omagia","omagiati":"omagia","omagiau":"omagia","omagiaza":"omagia","omagie":"omagia","omagieaza":"omagia","omagiem":"omagia","omagierea":"omagiere","omagieri":"omagiere","omagierii":"omagiere","omagierile":"omagiere","omagierilor":"omagiere","omagiez":"omagia","omagiezi":"omagia","omagii":["omagii","omag","omagii","omagiu"],"omagiile":"omagiu","omagiilor":"omagiu","omagiind":"omagia","omagilor":"omag","omagiul":"omagiu","omagiule":"omagiu","omagiului":"omagiu","omagul":"omag","omagule":"omag","omagului":"omag","omajii":"omaj","omajiile":"omaj","omajiilor":"omaj","omajul":"omaj","omajule":"omaj","omajului":"omaj","omalgia":"omalgie","omalgiei":"omalgie","omalgii":"omalgie","omalgiile":"omalgie","omalgiilor":"omalgie","omaneza":["omaneză","omanez","omaneza","omanez"],"omaneze":["omaneze","omanez","omaneze","omaneză"],"omanezei":"omaneză","omanezele":["omanezele","omanez","omanezele","omaneză"],"omanezelor":"omaneză","omanezi":"omanez","omanezii":"omanez","omanezilor":"omanez","omanezul":"omanez","omanezule":"omanez","omanezului":"omanez","omani":"oman","omanii":"oman","omanilor":"oman","omanul":"oman","omanule":"oman","omanului":"oman","omari":"omorî","omatidia":"omatidie","omatidiei":"omatidie","omatidii":"omatidie","omatidiile":"omatidie","omatidiilor":"omatidie","omatul":"omăt","omatule":"omăt","omatului":"omăt","ombilicala":["ombilicală","ombilical","ombilicala","ombilical"],"ombilicale":"ombilical","ombilicalele":"ombilical","ombilicali":"ombilical","ombilicalii":"ombilical","ombilicalul":"ombilical","ombilicul":"ombilic","ombilicule":"ombilic","ombilicului":"ombilic","ombilicuri":"ombilic","ombilicurile":"ombilic","ombilicurilor":"ombilic","omble":"omblă","omblei":"omblă","omblele":"omblă","omblelor":"omblă","ombrometre":"ombrometru","ombrometrele":"ombrometru","ombrometrelor":"ombrometru","ombrometruul":"ombrometru","ombrometruule":"ombrometru","ombrometruului":"ombrometru","ombudsmani":"ombudsman","ombudsmanii":"ombudsman","ombudsmanilor":"ombudsman","ombudsmanul":"ombudsman","ombudsmanule":"ombudsman","ombudsmanului":"ombudsman","omdragostea":"omdragoste","omdragostei":"omdragoste","omegatroane":"omegatron","omegatroanele":"omegatron","omegatroanelor":"omegatron","omegatronul":"omegatron","omegatronule":"omegatron","omegatronului":"omegatron","omegaul":"omega","omegaule":"omega","omegaului":"omega","omenea":"omeni","omeneai":"omeni","omeneam":"omeni","omeneasca":["omenească","omenesc","omeneasca","omenesc"],"omeneati":"omeni","omeneau":"omeni","omenesc":"omeni","omenescul":"omenesc","omeneste":"omeni","omenesti":["omenești","omenesc","omenești","omeni"],"omenestii":"omenesc","omenestile":"omenesc","omenetul":"omenet","omenetule":"omenet","omenetului":"omenet","omeni":"oameni","omenia":"omenie","omeniei":"omenie","omenii":["omenii","omeni","omenii","omenie"],"omenim":"omeni","omenimea":"omenime","omenimei":"omenime","omenind":"omeni","omenira":"omeni","omeniram":"omeni","omenirati":"omeni","omenirea":"omenire","omeniri":"omenire","omenirii":"omenire","omenirile":"omenire","omenirilor":"omenire","omenise":"omeni","omenisem":"omeni","omenisera":"omeni","omeniseram":"omeni","omeniserati":"omeni","omenisesi":"omeni","omenisi":"omeni","omenit":"omeni","omenita":["omenită","omenit","omenita","omenit"],"omenite":"omenit","omenitele":"omenit","omeniti":["omeniți","omeni","omeniți","omenit"],"omenitii":"omenit","omenitul":"omenit","omenoasa":["omenoasă","omenos","omenoasa","omenos"],"omenoase":"omenos","omenoasele":"omenos","omenosi":"omenos","omenosii":"omenos","omenosul":"omenos","omentectomia":"omentectomie","omentectomiei":"omentectomie","omentectomii":"omentectomie","omentectomiile":"omentectomie","omentectomiilor":"omentectomie","omentopexia":"omentopexie","omentopexiei":"omentopexie","omentopexii":"omentopexie","omentopexiile":"omentopexie","omentopexiilor":"omentopexie","omentumul":"omentum","omentumule":"omentum","omentumului":"omentum","omentumuri":"omentum","omentumurile":"omentum","omentumurilor":"omentum","omeomorfismul":"omeomorfism","omeomorfismule":"omeomorfism","omeomorfismului":"omeomorfism","omeopata":["omeopată","omeopat","omeopata","omeopat"],"omeopate":"omeopat","omeopatele":"omeopat","omeopati":"omeopat","omeopatica":["omeopatică","omeopatic","omeopatica","omeopatic"],"omeopatice":"omeopatic","omeopaticele":"omeopatic","omeopatici":"omeopatic","omeopaticii":"omeopatic","omeopaticul":"omeopatic","omeopatii":"omeopat","omeopatul":"omeopat","omeoze":"omeoză","omeozei":"omeoză","omeozele":"omeoză","omeozelor":"omeoză","omerica":["omerică","omeric","omerica","omeric"],"omerice":"omeric","omericele":"omeric","omerici":"omeric","omericii":"omeric","omericul":"omeric","omestea":"omesti","omesteai":"omesti","omesteam":"omesti","omesteati":"omesti","omesteau":"omesti","omestesc":"omesti","omesteste":"omesti","omestesti":"omesti","omestii":"omesti","omestim":"omesti","omestind":"omesti","omestira":"omesti","omestiram":"omesti","omestirati":"omesti","omestise":"omesti","omestisem":"omesti","omestisera":"omesti","omestiseram":"omesti","omestiserati":"omesti","omestisesi":"omesti","omestisi":"omesti","omestit":"omesti","omestiti":"omesti","omestituri":"omestitură","omestiturii":"omestitură","omestiturile":"omestitură","omestiturilor":"omestitură","ometei":"ometeu","ometeii":"ometeu","ometeilor":"ometeu","ometeuul":"ometeu","ometeuule":"ometeu","ometeuului":"ometeu","ometi":"omăt","ometii":"omăt","ometilor":"omăt","ometul":"omet","ometule":"omet","ometului":"omet","omfalectomia":"omfalectomie","omfalectomiei":"omfalectomie","omfalectomii":"omfalectomie","omfalectomiile":"omfalectomie","omfalectomiilor":"omfalectomie","omfalite":"omfalită","omfalitei":"omfalită","omfalitele":"omfalită","omfalitelor":"omfalită","omfalocele":"omfalocel","omfalocelele":"omfalocel","omfalocelelor":"omfalocel","omfalocelul":"omfalocel","omfalocelule":"omfalocel","omfalocelului":"omfalocel","omfalotomia":"omfalotomie","omfalotomiei":"omfalotomie","omfalotomii":"omfalotomie","omfalotomiile":"omfalotomie","omfalotomiilor":"omfalotomie","omicroni":"omicron","omicronlor":"omicron","omicronul":"omicron","omicronule":"omicron","omicronului":"omicron","omidaria":"omidărie","omidariei":"omidărie","omidarii":"omidărie","omidariile":"omidărie","omidariilor":"omidărie","omidute":"omiduță","omidutei":"omiduță","omidutele":"omiduță","omidutelor":"omiduță","omiletica":["omiletică","omiletic","omiletica","omiletic"],"omiletice":["omiletice","omiletic","omiletice","omiletică"],"omileticei":"omiletică","omileticele":["omileticele","omiletic","omileticele","omiletică"],"omileticelor":"omiletică","omiletici":"omiletic","omileticii":"omiletic","omileticul":"omiletic","omilia":"omilie","omiliare":"omiliar","omiliarele":"omiliar","omiliarelor":"omiliar","omiliarul":"omiliar","omiliarule":"omiliar","omiliarului":"omiliar","omiliei":"omilie","omilii":"omilie","omiliile":"omilie","omiliilor":"omilie","omineasca":["ominească","ominesc","omineasca","ominesc"],"ominescul":"ominesc","ominesti":"ominesc","ominestii":"ominesc","ominestile":"ominesc","omis":"omite","omisa":["omisă","omis","omisa","omis"],"omise":["omise","omis","omise","omite"],"omisei":"omite","omisele":"omis","omisera":"omite","omiseram":"omite","omiserati":"omite","omisese":"omite","omisesem":"omite","omisesera":"omite","omiseseram":"omite","omiseserati":"omite","omisesesi":"omite","omisesi":"omite","omisi":"omis","omisii":"omis","omisiunea":"omisiune","omisiunei":"omisiune","omisiunele":"omisiune","omisiunelor":"omisiune","omisiuni":"omisiune","omisiva":["omisivă","omisiv","omisiva","omisiv"],"omisive":"omisiv","omisivele":"omisiv","omisivi":"omisiv","omisivii":"omisiv","omisivul":"omisiv","omisul":"omis","omit":"omite","omita":"omite","omitand":"omite","omitea":"omite","omiteai":"omite","omiteam":"omite","omiteati":"omite","omiteau":"omite","omitem":"omite","omiterea":"omitere","omiteri":"omitere","omiterii":"omitere","omiterile":"omitere","omiterilor":"omitere","omiteti":"omite","omiti":"omite","omiubirea":"omiubire","omiubiri":"omiubire","omiubirii":"omiubire","omizi":"omidă","omizii":"omidă","omizile":"omidă","omizilor":"omidă","omlete":"omletă","omletei":"omletă","omletele":"omletă","omletelor":"omletă","omlituitul":"omlituit","omlituitule":"omlituit","omlituitului":"omlituit","omlituituri":"omlituit","omlituiturile":"omlituit","omlituiturilor":"omlituit","omneputinta":"omnipotență","omneputinte":"omneputință","omneputintei":"omneputință","omneputintele":"omneputință","omneputintelor":"omneputință","omnibuze":"omnibuz","omnibuzele":"omnibuz","omnibuzelor":"omnibuz","omnibuzul":"omnibuz","omnibuzule":"omnibuz","omnibuzului":"omnibuz","omnidirectionala":["omnidirecțională","omnidirecțional","omnidirecționala","omnidirecțional"],"omnidirectionale":"omnidirecțional","omnidirectionalele":"omnidirecțional","omnidirectionali":"omnidirecțional","omnidirectionalii":"omnidirecțional","omnidirectionalul":"omnidirecțional","omnilaterala":["omnilaterală","omnilateral","omnilaterala","omnilateral"],"omnilaterale":"omnilateral","omnilateralele":"omnilateral","omnilaterali":"omnilateral","omnilateralii":"omnilateral","omnilateralitatea":"omnilateralitate","omnilateralitati":"omnilateralitate","omnilateralitatii":"omnilateralitate","omnilateralitatile":"omnilateralitate","omnilateralitatilor":"omnilateralitate","omnilateralul":"omnilateral","omnipotenta":["omnipotentă","omnipotent","omnipotenta","omnipotent"],"omnipotente":["omnipotente","omnipotent","omnipotențe","omnipotență"],"omnipotentei":"omnipotență","omnipotentele":"omnipotent","omnipotenti":"omnipotent","omnipotentii":"omnipotent","omnipotentul":"omnipotent","omniprezenta":["omniprezentă","omniprezent","omniprezenta","omniprezent"],"omniprezente":["omniprezente","omniprezent","omniprezențe","omniprezență"],"omniprezentei":"omniprezență","omniprezentele":["omniprezentele","omniprezent","omniprezențele","omniprezență"],"omniprezentelor":"omniprezență","omniprezenti":"omniprezent","omniprezentii":"omniprezent","omniprezentul":"omniprezent","omniscienta":["omniscientă","omniscient","omniscienta","omniscient"],"omnisciente":["omnisciente","omniscient","omnisciențe","omnisciență"],"omniscientei":"omnisciență","omniscientele":"omniscient","omniscienti":"omniscient","omniscientii":"omniscient","omniscientul":"omniscient","omnistienta":["omniștientă","omniștient","omniștienta","omniștient"],"omnistiente":"omniștient","omnistientele":"omniștient","omnistienti":"omniștient","omnistientii":"omniștient","omnistientul":"omniștient","omnistiinte":"omniștiință","omnistiintei":"omniștiință","omnivore":"omnivoră","omnivorei":"omnivoră","omnivorele":"omnivoră","omnivorelor":"omnivoră","omnivori":"omnivor","omnivorii":"omnivor","omnivorilor":"omnivor","omnivorul":"omnivor","omnivorule":"omnivor","omnivorului":"omnivor","omoaia":["omoaiă","omoaie","omoaia","omoaie"],"omoaiei":"omoaie","omoaiele":"omoaie","omoaielor":"omoaie","omoara":"omorî","omoare":"omorî","omocentrica":["omocentrică","omocentric","omocentrica","omocentric"],"omocentrice":"omocentric","omocentricele":"omocentric","omocentrici":"omocentric","omocentricii":"omocentric","omocentricul":"omocentric","omocentruul":"omocentru","omocentruule":"omocentru","omocentruului":"omocentru","omofaga":["omofagă","omofag","omofaga","omofag"],"omofage":"omofag","omofagele":"omofag","omofagi":"omofag","omofagia":"omofagie","omofagiei":"omofagie","omofagii":["omofagii","omofag","omofagii","omofagie"],"omofagiile":"omofagie","omofagiilor":"omofagie","omofagul":"omofag","omofilia":"omofilie","omofiliei":"omofilie","omofilii":"omofilie","omofiliile":"omofilie","omofiliilor":"omofilie","omofoare":"omofor","omofoarele":"omofor","omofoarelor":"omofor","omofona":["omofonă","omofon","omofona","omofon"],"omofone":"omofon","omofonele":"omofon","omofoni":"omofon","omofonia":"omofonie","omofonica":["omofonică","omofonic","omofonica","omofonic"],"omofonice":"omofonic","omofonicele":"omofonic","omofonici":"omofonic","omofonicii":"omofonic","omofonicul":"omofonic","omofoniei":"omofonie","omofonii":["omofonii","omofon","omofonii","omofonie"],"omofoniile":"omofonie","omofoniilor":"omofonie","omofonul":"omofon","omoforma":["omoformă","omoform","omoforma","omoform"],"omoforme":"omoform","omoformele":"omoform","omoformi":"omoform","omoformii":"omoform","omoformul":"omoform","omoforul":"omofor","omoforule":"omofor","omoforului":"omofor","omogena":["omogenă","omogen","omogena","omogen"],"omogene":"omogen","omogeneizai":"omogeneiza","omogeneizam":["omogeneizăm","omogeneiza","omogeneizam","omogeneiza"],"omogeneizand":"omogeneiza","omogeneizara":"omogeneiza","omogeneizaram":"omogeneiza","omogeneizarati":"omogeneiza","omogeneizarea":"omogeneizare","omogeneizari":"omogeneizare","omogeneizarii":"omogeneizare","omogeneizarile":"omogeneizare","omogeneizarilor":"omogeneizare","omogeneizase":"omogeneiza","omogeneizasem":"omogeneiza","omogeneizasera":"omogeneiza","omogeneizaseram":"omogeneiza","omogeneizaserati":"omogeneiza","omogeneizasesi":"omogeneiza","omogeneizasi":"omogeneiza","omogeneizat":"omogeneiza","omogeneizati":"omogeneiza","omogeneizatoare":"omogeneizator","omogeneizatoarele":"omogeneizator","omogeneizatoarelor":"omogeneizator","omogeneizatorul":"omogeneizator","omogeneizatorule":"omogeneizator","omogeneizatorului":"omogeneizator","omogeneizau":"omogeneiza","omogeneizeaza":"omogeneiza","omogeneizez":"omogeneiza","omogeneizezi":"omogeneiza","omogenele":"omogen","omogeni":"omogen","omogenii":"omogen","omogenitatea":"omogenitate","omogenitati":"omogenitate","omogenitatii":"omogenitate","omogenitatile":"omogenitate","omogenitatilor":"omogenitate","omogenizai":"omogeniza","omogenizam":["omogenizăm","omogeniza","omogenizam","omogeniza"],"omogenizand":"omogeniza","omogenizara":"omogeniza","omogenizaram":"omogeniza","omogenizarati":"omogeniza","omogenizarea":"omogenizare","omogenizari":"omogenizare","omogenizarii":"omogenizare","omogenizarile":"omogenizare","omogenizarilor":"omogenizare","omogenizase":"omogeniza","omogenizasem":"omogeniza","omogenizasera":"omogeniza","omogenizaseram":"omogeniza","omogenizaserati":"omogeniza","omogenizasesi":"omogeniza","omogenizasi":"omogeniza","omogenizat":"omogeniza","omogenizati":"omogeniza","omogenizatoare":"omogenizator","omogenizatore":"omogenizator","omogenizatorele":"omogenizator","omogenizatorelor":"omogenizator","omogenizatorul":"omogenizator","omogenizatorule":"omogenizator","omogenizatorului":"omogenizator","omogenizau":"omogeniza","omogenizeaza":"omogeniza","omogenizez":"omogeniza","omogenizezi":"omogeniza","omogenul":"omogen","omoghenia":"omoghenie","omogheniei":"omoghenie","omoghenii":"omoghenie","omogheniile":"omoghenie","omogheniilor":"omoghenie","omografi":"omograf","omografia":"omografie","omografica":["omografică","omografic","omografica","omografic"],"omografice":"omografic","omograficele":"omografic","omografici":"omografic","omograficii":"omografic","omograficul":"omografic","omografiei":"omografie","omografii":"omografie","omografile":"omograf","omografilor":"omograf","omograful":"omograf","omografule":"omograf","omografului":"omograf","omograme":"omogramă","omogramei":"omogramă","omogramele":"omogramă","omogramelor":"omogramă","omoii":"omoi","omoilor":"omoi","omoiul":"omoi","omoiule":"omoi","omoiului":"omoi","omoloage":"omoloagă","omoloagei":"omoloagă","omoloagele":"omoloagă","omoloagelor":"omoloagă","omologai":"omologa","omologam":["omologăm","omologa","omologam","omologa"],"omologand":"omologa","omologara":"omologa","omologaram":"omologa","omologarati":"omologa","omologarea":"omologare","omologari":"omologare","omologarii":"omologare","omologarile":"omologare","omologarilor":"omologare","omologase":"omologa","omologasem":"omologa","omologasera":"omologa","omologaseram":"omologa","omologaserati":"omologa","omologasesi":"omologa","omologasi":"omologa","omologat":"omologa","omologati":"omologa","omologatia":"omologație","omologatiei":"omologație","omologatii":"omologație","omologatiile":"omologație","omologatiilor":"omologație","omologau":"omologa","omologe":"omologă","omologei":"omologă","omologele":"omologă","omologelor":"omologă","omologheaza":"omologa","omologhez":"omologa","omologhezi":"omologa","omologi":"omolog","omologia":"omologie","omologiei":"omologie","omologii":["omologii","omolog","omologii","omologie"],"omologiile":"omologie","omologiilor":"omologie","omologilor":"omolog","omologul":"omolog","omologule":"omolog","omologului":"omolog","omomorfismul":"omomorfism","omomorfismule":"omomorfism","omomorfismului":"omomorfism","omonia":"omonie","omoniei":"omonie","omonii":"omonie","omoniile":"omonie","omoniilor":"omonie","omonime":"omonim","omonimele":"omonim","omonimelor":"omonim","omonimia":"omonimie","omonimica":["omonimică","omonimic","omonimica","omonimic"],"omonimice":"omonimic","omonimicele":"omonimic","omonimici":"omonimic","omonimicii":"omonimic","omonimicul":"omonimic","omonimiei":"omonimie","omonimii":"omonimie","omonimiile":"omonimie","omonimiilor":"omonimie","omonimitatea":"omonimitate","omonimitati":"omonimitate","omonimitatii":"omonimitate","omonimul":"omonim","omonimule":"omonim","omonimului":"omonim","omoplati":"omoplat","omor":"omorî","omora":"omorî","omoraciunea":"omorâciune","omoraciuni":"omorâciune","omoraciunii":"omorâciune","omoraciunile":"omorâciune","omoraciunilor":"omorâciune","omorai":["omorai","omorî","omorâi","omorî"],"omoram":["omorâm","omorî","omoram","omorî"],"omorand":"omorî","omorara":"omorî","omoraram":"omorî","omorarati":"omorî","omorarea":"omorâre","omorari":"omorâre","omorarii":"omorâre","omorarile":"omorâre","omorarilor":"omorâre","omorase":"omorî","omorasem":"omorî","omorasera":"omorî","omoraseram":"omorî","omoraserati":"omorî","omorasesi":"omorî","omorasi":"omorî","omorat":"omorî","omorata":["omorâtă","omorât","omorâta","omorât"],"omorate":"omorât","omoratele":"omorât","omorati":["omorâți","omorât","omorâți","omorî","omorați","omorî"],"omoratii":"omorât","omoratoare":"omorâtor","omoratoarea":["omorâtoarea","omorâtoare","omorâtoarea","omorâtor"],"omoratoarei":"omorâtoare","omoratoarele":["omorâtoarele","omorâtoare","omorâtoarele","omorâtor"],"omoratoarelor":"omorâtoare","omoratori":"omorâtor","omoratorii":"omorâtor","omoratorul":"omorâtor","omoratul":"omorât","omoraturi":"omorâtură","omoraturii":"omorâtură","omoraturile":"omorâtură","omoraturilor":"omorâtură","omorau":"omorî","omorganica":["omorganică","omorganic","omorganica","omorganic"],"omorganice":"omorganic","omorganicele":"omorganic","omorganici":"omorganic","omorganicii":"omorganic","omorganicul":"omorganic","omorita":["omorită","omorit","omorita","omorit"],"omorite":"omorit","omoritele":"omorit","omoriti":"omorit","omoritii":"omorit","omoritul":"omorit","omoritura":"omorâtură","omorul":"omor","omorule":"omor","omorului":"omor","omoruri":"omor","omorurile":"omor","omorurilor":"omor","omosfere":"omosferă","omosferei":"omosferă","omosferele":"omosferă","omosferelor":"omosferă","omotetia":"omotetie","omotetica":["omotetică","omotetic","omotetica","omotetic"],"omotetice":"omotetic","omoteticele":"omotetic","omotetici":"omotetic","omoteticii":"omotetic","omoteticul":"omotetic","omotetiei":"omotetie","omotetii":"omotetie","omotetiile":"omotetie","omotetiilor":"omotetie","omotopia":"omotopie","omotopiei":"omotopie","omotopii":"omotopie","omotopiile":"omotopie","omotopiilor":"omotopie","omrazea":"omrăzi","omrazeai":"omrăzi","omrazeam":"omrăzi","omrazeati":"omrăzi","omrazeau":"omrăzi","omrazesc":"omrăzi","omrazeste":"omrăzi","omrazesti":"omrăzi","omrazii":"omrăzi","omrazim":"omrăzi","omrazind":"omrăzi","omrazira":"omrăzi","omraziram":"omrăzi","omrazirati":"omrăzi","omrazise":"omrăzi","omrazisem":"omrăzi","omrazisera":"omrăzi","omraziseram":"omrăzi","omraziserati":"omrăzi","omrazisesi":"omrăzi","omrazisi":"omrăzi","omrazit":"omrăzi","omraziti":"omrăzi","omu":"om","omucideri":"omucidere","omucidul":"omucid","omucidule":"omucid","omucidului":"omucid","omucigase":"omucigașă","omucigasei":"omucigașă","omucigasele":"omucigașă","omucigaselor":"omucigașă","omucigasi":"omucigaș","omucigasii":"omucigaș","omucigasilor":"omucigaș","omucigasul":"omucigaș","omucigasule":"omucigaș","omucigasului":"omucigaș","omucizi":"omucid","omucizii":"omucid","omucizilor":"omucid","omul":"om","omule":"om","omuleti":"omuleț","omuletii":"omuleț","omuletilor":"omuleț","omuletul":"omuleț","omuletule":"omuleț","omuletului":"omuleț","omului":"om","omusori":"omușor","omusorile":"omușor","omusorilor":"omușor","omusorul":"omușor","omusorule":"omușor","omusorului":"omușor","omuti":"omuț","omutii":"omuț","omutilor":"omuț","omutul":"omuț","omutule":"omuț","omutului":"omuț","onagri":"onagru","onagrii":"onagru","onagrilor":"onagru","onagruul":"onagru","onagruule":"onagru","onagruului":"onagru","onania":"onanie","onaniei":"onanie","onanii":"onanie","onanismul":"onanism","onanismule":"onanism","onanismului":"onanism","onaniste":"onanistă","onanistei":"onanistă","onanistele":"onanistă","onanistelor":"onanistă","onanisti":"onanist","onanistii":"onanist","onanistilor":"onanist","onanistul":"onanist","onanistule":"onanist","onanistului":"onanist","oncoge":"oncogen","oncogene":"oncogenă","oncogenei":"oncogenă","oncogenele":"oncogenă","oncogenelor":"oncogenă","oncogeni":"oncogen","oncogenii":"oncogen","oncogenile":"oncogen","oncogenilor":"oncogen","oncografe":"oncograf","oncografele":"oncograf","oncografelor":"oncograf","oncograful":"oncograf","oncografule":"oncograf","oncografului":"oncograf","oncologe":"oncologă","oncologei":"oncologă","oncologele":"oncologă","oncologelor":"oncologă","oncologi":"oncolog","oncologia":"oncologie","oncologica":["oncologică","oncologic","oncologica","oncologic"],"oncologice":"oncologic","oncologicele":"oncologic","oncologici":"oncologic","oncologicii":"oncologic","oncologicul":"oncologic","oncologiei":"oncologie","oncologii":["oncologii","oncolog","oncologii","oncologie"],"oncologilor":"oncolog","oncologul":"oncolog","oncologule":"oncolog","oncologului":"oncolog","oncometre":"oncometru","oncometrele":"oncometru","oncometrelor":"oncometru","oncometruul":"oncometru","oncometruule":"oncometru","oncometruului":"oncometru","oncotomia":"oncotomie","oncotomiei":"oncotomie","oncotomii":"oncotomie","oncotomiile":"oncotomie","oncotomiilor":"oncotomie","onctiunea":"oncțiune","onctiuni":"oncțiune","onctiunii":"oncțiune","onctiunile":"oncțiune","onctiunilor":"oncțiune","onctuoasa":["onctuoasă","onctuos","onctuoasa","onctuos"],"onctuoase":"onctuos","onctuoasele":"onctuos","onctuosi":"onctuos","onctuosii":"onctuos","onctuosul":"onctuos","onctuozitatea":"onctuozitate","onctuozitati":"onctuozitate","onctuozitatii":"onctuozitate","onctuozitatile":"onctuozitate","onctuozitatilor":"onctuozitate","ondine":"ondină","ondinei":"ondină","ondinele":"ondină","ondinelor":"ondină","ondografe":"ondograf","ondografele":"ondograf","ondografelor":"ondograf","ondograful":"ondograf","ondografule":"ondograf","ondografului":"ondograf","ondometre":"ondometru","ondometrele":"ondometru","ondometrelor":"ondometru","ondometruul":"ondometru","ondometruule":"ondometru","ondometruului":"ondometru","ondulai":"ondula","ondulam":["ondulăm","ondula","ondulam","ondula"],"onduland":"ondula","ondulara":"ondula","ondularam":"ondula","ondularati":"ondula","ondularea":"ondulare","ondulari":"ondulare","ondularii":"ondulare","ondularile":"ondulare","ondularilor":"ondulare","ondulase":"ondula","ondulasem":"ondula","ondulasera":"ondula","ondulaseram":"ondula","ondulaserati":"ondula","ondulasesi":"ondula","ondulasi":"ondula","ondulat":"ondula","ondulata":["ondulată","ondulat","ondulata","ondulat"],"ondulate":"ondulat","ondulatele":"ondulat","ondulati":["ondulați","ondula","ondulați","ondulat"],"ondulatia":"ondulație","ondulatiei":"ondulație","ondulatii":["ondulații","ondulat","ondulații","ondulație"],"ondulatiile":"ondulație","ondulatiilor":"ondulație","ondulatiunea":"ondulațiune","ondulatiuni":"ondulațiune","ondulatiunii":"ondulațiune","ondulatiunile":"ondulațiune","ondulatiunilor":"ondulațiune","ondulatoare":["ondulatoare","ondulator","ondulătoare","ondulător"],"ondulatoarea":"ondulător","ondulatoarele":["ondulatoarele","ondulator","ondulătoarele","ondulător"],"ondulatoarelor":"ondulator","ondulatori":"ondulător","ondulatoria":"ondulatoriu","ondulatorie":"ondulatoriu","ondulatorii":["ondulătorii","ondulător","ondulatorii","ondulatoriu"],"ondulatoriii":"ondulatoriu","ondulatoriile":"ondulatoriu","ondulatoriul":"ondulatoriu","ondulatorul":["ondulatorul","ondulator","ondulătorul","ondulător"],"ondulatorule":"ondulator","ondulatorului":"ondulator","ondulatul":"ondulat","ondulau":"ondula","onduleaza":"ondula","onduleuri":"onduleu","onduleurile":"onduleu","onduleurilor":"onduleu","onduleuul":"onduleu","onduleuule":"onduleu","onduleuului":"onduleu","ondulez":"ondula","ondulezi":"ondula","onduloare":"ondulor","onduloarele":"ondulor","onduloarelor":"ondulor","onduloasa":["onduloasă","ondulos","onduloasa","ondulos"],"onduloase":"ondulos","onduloasele":"ondulos","ondulorul":"ondulor","ondulorule":"ondulor","ondulorului":"ondulor","ondulosi":"ondulos","ondulosii":"ondulos","ondulosul":"ondulos","ondulozitatea":"ondulozitate","ondulozitati":"ondulozitate","ondulozitatii":"ondulozitate","ondulozitatile":"ondulozitate","ondulozitatilor":"ondulozitate","oneroasa":["oneroasă","oneros","oneroasa","oneros"],"oneroase":"oneros","oneroasele":"oneros","onerosi":"oneros","onerosii":"oneros","onerosul":"oneros","onerozitatea":"onerozitate","onerozitati":"onerozitate","onerozitatii":"onerozitate","onerozitatile":"onerozitate","onerozitatilor":"onerozitate","onesta":["onestă","onest","onesta","onest"],"onestatea":"onestate","onestati":"onestate","onestatii":"onestate","oneste":"onest","onestele":"onest","onesti":"onest","onestia":"onestie","onestiei":"onestie","onestii":["oneștii","onest","onestii","onestie"],"onestiile":"onestie","onestiilor":"onestie","onestitatea":"onestitate","onestitati":"onestitate","onestitatii":"onestitate","onestul":"onest","ong-ul":"ONG","ong-ule":"ONG","ong-ului":"ONG","ong-uri":"ONG","ong-urile":"ONG","ong-urilor":"ONG","onicalgia":"onicalgie","onicalgiei":"onicalgie","onicalgii":"onicalgie","onicalgiile":"onicalgie","onicalgiilor":"onicalgie","onichia":"onichie","onichiei":"onichie","onichii":"onichie","onichiile":"onichie","onichiilor":"onichie","onicofagia":"onicofagie","onicofagiei":"onicofagie","onicofagii":"onicofagie","onicomicoze":"onicomicoză","onicomicozei":"onicomicoză","onicomicozele":"onicomicoză","onicomicozelor":"onicomicoză","onicoze":"onicoză","onicozei":"onicoză","onicozele":"onicoză","onicozelor":"onicoză","oniomania":"oniomanie","oniomaniei":"oniomanie","oniomanii":"oniomanie","oniomaniile":"oniomanie","oniomaniilor":"oniomanie","onirica":["onirică","oniric","onirica","oniric"],"onirice":"oniric","oniricele":"oniric","onirici":"oniric","oniricii":"oniric","oniricul":"oniric","onirismul":"onirism","onirismule":"onirism","onirismului":"onirism","oniriste":"oniristă","oniristei":"oniristă","oniristele":"oniristă","oniristelor":"oniristă","onirocriti":"onirocrit","onirocritii":"onirocrit","onirocritilor":"onirocrit","onirocritul":"onirocrit","onirocritule":"onirocrit","onirocritului":"onirocrit","oniromantia":"oniromanție","oniromantiei":"oniromanție","oniromantii":"oniromanție","oniromantiile":"oniromanție","oniromantiilor":"oniromanție","onixisul":"onixis","onixisule":"onixis","onixisului":"onixis","onixul":"onix","onixule":"onix","onixului":"onix","onoarea":"onoare","onoarei":"onoare","onofreiciuc":"Onofreciuc","onomantia":"onomanție","onomantiei":"onomanție","onomantii":"onomanție","onomantiile":"onomanție","onomantiilor":"onomanție","onomasiologia":"onomasiologie","onomasiologica":["onomasiologică","onomasiologic","onomasiologica","onomasiologic"],"onomasiologice":"onomasiologic","onomasiologicele":"onomasiologic","onomasiologici":"onomasiologic","onomasiologicii":"onomasiologic","onomasiologicul":"onomasiologic","onomasiologiei":"onomasiologie","onomasiologii":"onomasiologie","onomastica":["onomastică","onomastic","onomastica","onomastic"],"onomastice":["onomastice","onomastic","onomastice","onomastică"],"onomasticei":"onomastică","onomasticele":"onomastic","onomastici":"onomastic","onomasticii":"onomastic","onomasticoane":"onomasticon","onomasticoanele":"onomasticon","onomasticoanelor":"onomasticon","onomasticonul":"onomasticon","onomasticonule":"onomasticon","onomasticonului":"onomasticon","onomasticul":"onomastic","onomatologia":"onomatologie","onomatologiei":"onomatologie","onomatologii":"onomatologie","onomatomania":"onomatomanie","onomatomaniei":"onomatomanie","onomatomanii":"onomatomanie","onomatomaniile":"onomatomanie","onomatomaniilor":"onomatomanie","onomatopeea":"onomatopee","onomatopeei":"onomatopee","onomatopeele":"onomatopee","onomatopeelor":"onomatopee","onomatopeica":["onomatopeică","onomatopeic","onomatopeica","onomatopeic"],"onomatopeice":"onomatopeic","onomatopeicele":"onomatopeic","onomatopeici":"onomatopeic","onomatopeicii":"onomatopeic","onomatopeicul":"onomatopeic","onomatopoetica":["onomatopoetică","onomatopoetic","onomatopoetica","onomatopoetic"],"onomatopoetice":"onomatopoetic","onomatopoeticele":"onomatopoetic","onomatopoetici":"onomatopoetic","onomatopoeticii":"onomatopoetic","onomatopoeticul":"onomatopoetic","onor":"onoare","onorabila":["onorabilă","onorabil","onorabila","onorabil"],"onorabile":"onorabil","onorabilele":"onorabil","onorabili":"onorabil","onorabilii":"onorabil","onorabilitatea":"onorabilitate","onorabilitati":"onorabilitate","onorabilitatii":"onorabilitate","onorabilitatile":"onorabilitate","onorabilitatilor":"onorabilitate","onorabilul":"onorabil","onorai":"onora","onoram":["onorăm","onora","onoram","onora"],"onorand":"onora","onoranta":["onorantă","onorant","onoranta","onorant"],"onorante":"onorant","onorantele":"onorant","onoranti":"onorant","onorantii":"onorant","onorantul":"onorant","onorara":["onorară","onora","onorară","onorar","onorara","onorar"],"onoraram":"onora","onorarati":"onora","onorare":"onorar","onorarea":"onorare","onorarele":"onorar","onorari":["onorari","onorar","onorări","onorare"],"onorarii":["onorarii","onorar","onorării","onorare","onorarii","onorariu"],"onorariile":"onorariu","onorariilor":"onorariu","onorarile":"onorare","onorarilor":"onorare","onorariul":"onorariu","onorariule":"onorariu","onorariului":"onorariu","onorarul":"onorar","onorase":"onora","onorasem":"onora","onorasera":"onora","onoraseram":"onora","onoraserati":"onora","onorasesi":"onora","onorasi":"onora","onorat":"onora","onorata":["onorată","onorat","onorata","onorat"],"onorate":"onorat","onoratele":"onorat","onorati":["onorați","onora","onorați","onorat"],"onoratii":"onorat","onoratul":"onorat","onorau":"onora","onoreaza":"onora","onorez":"onora","onorezi":"onora","onori":"onoare","onorifica":["onorifică","onorific","onorifica","onorific"],"onorifice":"onorific","onorificele":"onorific","onorifici":"onorific","onorificii":"onorific","onorificul":"onorific","onorul":"onor","onorule":"onor","onorului":"onor","onoruri":["onoruri","onoare","onoruri","onor"],"onorurile":["onorurile","onoare","onorurile","onor"],"onorurilor":["onorurilor","onoare","onorurilor","onor"],"ontica":["ontică","ontic","ontica","ontic"],"ontice":"ontic","onticele":"ontic","ontici":"ontic","onticii":"ontic","onticul":"ontic","ontogenetica":["ontogenetică","ontogenetic","ontogenetica","ontogenetic"],"ontogenetice":"ontogenetic","ontogeneticele":"ontogenetic","ontogenetici":"ontogenetic","ontogeneticii":"ontogenetic","ontogeneticul":"ontogenetic","ontogeneze":"ontogeneză","ontogenezei":"ontogeneză","ontogenezele":"ontogeneză","ontogenezelor":"ontogeneză","ontogenia":"ontogenie","ontogenica":["ontogenică","ontogenic","ontogenica","ontogenic"],"ontogenice":"ontogenic","ontogenicele":"ontogenic","ontogenici":"ontogenic","ontogenicii":"ontogenic","ontogenicul":"ontogenic","ontogeniei":"ontogenie","ontogenii":"ontogenie","ontogeniile":"ontogenie","ontogeniilor":"ontogenie","ontogeniste":"ontogenistă","ontogenistei":"ontogenistă","ontogenistele":"ontogenistă","ontogenistelor":"ontogenistă","ontogenisti":"ontogenist","ontogenistii":"ontogenist","ontogenistilor":"ontogenist","ontogenistul":"ontogenist","ontogenistule":"ontogenist","ontogenistului":"ontogenist","ontogonia":"ontogonie","ontogoniei":"ontogonie","ontogonii":"ontogonie","ontogoniile":"ontogonie","ontogoniilor":"ontogonie","ontologe":"ontologă","ontologei":"ontologă","ontologele":"ontologă","ontologelor":"ontologă","ontologi":"ontolog","ontologia":"ontologie","ontologica":["ontologică","ontologic","ontologica","ontologic"],"ontologice":"ontologic","ontologicele":"ontologic","ontologici":"ontologic","ontologicii":"ontologic","ontologicul":"ontologic","ontologiei":"ontologie","ontologii":["ontologii","ontolog","ontologii","ontologie"],"ontologilor":"ontolog","ontologiste":"ontologistă","ontologistei":"ontologistă","ontologistele":"ontologistă","ontologistelor":"ontologistă","ontologisti":"ontologist","ontologistii":"ontologist","ontologistilor":"ontologist","ontologistul":"ontologist","ontologistule":"ontologist","ontologistului":"ontologist","ontologul":"ontolog","ontologule":"ontolog","ontologului":"ontolog","onucul":"onuc","onucule":"onuc","onucului":"onuc","oocite":"oocit","oocitele":"oocit","oocitelor":"oocit","oocitul":"oocit","oocitule":"oocit","oocitului":"oocit","oofitul":"oofit","oofitule":"oofit","oofitului":"oofit","ooforectomia":"ooforectomie","ooforectomiei":"ooforectomie","ooforectomii":"ooforectomie","ooforectomiile":"ooforectomie","ooforectomiilor":"ooforectomie","ooforite":"ooforită","ooforitei":"ooforită","ooforitele":"ooforită","ooforitelor":"ooforită","ooforul":"oofor","ooforule":"oofor","ooforului":"oofor","oogamia":"oogamie","oogamiei":"oogamie","oogamii":"oogamie","oogeneze":"oogeneză","oogenezei":"oogeneză","oogenezele":"oogeneză","oogenezelor":"oogeneză","oogoane":"oogon","oogoanele":"oogon","oogoanelor":"oogon","oogonul":"oogon","oogonule":"oogon","oogonului":"oogon","oolite":"oolit","oolitele":"oolit","oolitelor":"oolit","oolitica":["oolitică","oolitic","oolitica","oolitic"],"oolitice":"oolitic","ooliticele":"oolitic","oolitici":"oolitic","ooliticii":"oolitic","ooliticul":"oolitic","oolitul":"oolit","oolitule":"oolit","oolitului":"oolit","oologia":"oologie","oologica":["oologică","oologic","oologica","oologic"],"oologice":"oologic","oologicele":"oologic","oologici":"oologic","oologicii":"oologic","oologicul":"oologic","oologiei":"oologie","oologii":"oologie","ooplasme":"ooplasmă","ooplasmei":"ooplasmă","ooplasmele":"ooplasmă","ooplasmelor":"ooplasmă","oosfere":"oosferă","oosferei":"oosferă","oosferele":"oosferă","oosferelor":"oosferă","oospori":"oospor","oosporii":"oospor","oosporilor":"oospor","oosporul":"oospor","oosporule":"oospor","oosporului":"oospor","ooteci":"ootecă","ootecii":"ootecă","ootecile":"ootecă","ootecilor":"ootecă","opaca":["opacă","opac","opaca","opac"],"opace":"opac","opacea":"opăci","opaceai":"opăci","opaceam":"opăci","opaceati":"opăci","opaceau":"opăci","opaceaua":"opăcea","opacele":["opacele","opac","opăcele","opăcea","opăcele","opăceală"],"opacelei":["opăcelei","opăcea","opăcelei","opăceală"],"opacelele":["opăcelele","opăcea","opăcelele","opăceală"],"opacelelor":["opăcelelor","opăcea","opăcelelor","opăceală"],"opaceli":"opăceală","opacesc":"opăci","opaceste":"opăci","opacesti":"opăci","opaci":"opac","opacifiai":"opacifia","opacifiam":"opacifia","opacifiara":"opacifia","opacifiaram":"opacifia","opacifiarati":"opacifia","opacifiase":"opacifia","opacifiasem":"opacifia","opacifiasera":"opacifia"};
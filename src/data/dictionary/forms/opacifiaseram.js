@@ -0,0 +1 @@
+export default {"opacifiaseram":"opacifia","opacifiaserati":"opacifia","opacifiasesi":"opacifia","opacifiasi":"opacifia","opacifiat":"opacifia","opacifiata":["opacifiată","opacifiat","opacifiata","opacifiat"],"opacifiate":"opacifiat","opacifiatele":"opacifiat","opacifiati":["opacifiați","opacifia","opacifiați","opacifiat"],"opacifiatii":"opacifiat","opacifiatul":"opacifiat","opacifiau":"opacifia","opacifiaza":"opacifia","opacifie":"opacifia","opacifieaza":"opacifia","opacifiem":"opacifia","opacifierea":"opacifiere","opacifieri":"opacifiere","opacifierii":"opacifiere","opacifierile":"opacifiere","opacifierilor":"opacifiere","opacifiez":"opacifia","opacifiezi":"opacifia","opacifiind":"opacifia","opacii":["opacii","opac","opăcii","opăci"],"opacim":"opăci","opacimetre":"opacimetru","opacimetrele":"opacimetru","opacimetrelor":"opacimetru","opacimetria":"opacimetrie","opacimetriei":"opacimetrie","opacimetrii":"opacimetrie","opacimetriile":"opacimetrie","opacimetriilor":"opacimetrie","opacimetrul":"opacimetru","opacimetrule":"opacimetru","opacimetrului":"opacimetru","opacinari":"opăcinariu","opacinarii":"opăcinariu","opacinarilor":"opăcinariu","opacinariuul":"opăcinariu","opacinariuule":"opăcinariu","opacinariuului":"opăcinariu","opacinasi":"opăcinaș","opacinasii":"opăcinaș","opacinasilor":"opăcinaș","opacinasul":"opăcinaș","opacinasule":"opăcinaș","opacinasului":"opăcinaș","opacind":"opăci","opacira":"opăci","opaciram":"opăci","opacirati":"opăci","opacirea":"opăcire","opaciri":"opăcire","opacirii":"opăcire","opacirile":"opăcire","opacirilor":"opăcire","opacise":"opăci","opacisem":"opăci","opacisera":"opăci","opaciseram":"opăci","opaciserati":"opăci","opacisesi":"opăci","opacisi":"opăci","opacit":"opăci","opacita":["opăcită","opăcit","opăcita","opăcit"],"opacitatea":"opacitate","opacitati":"opacitate","opacitatii":"opacitate","opacitatile":"opacitate","opacitatilor":"opacitate","opacite":"opăcit","opacitele":"opăcit","opaciti":["opăciți","opăci","opăciți","opăcit"],"opacitii":"opăcit","opacitul":"opăcit","opacizai":"opaciza","opacizam":["opacizăm","opaciza","opacizam","opaciza"],"opacizand":"opaciza","opacizanta":["opacizantă","opacizant","opacizanta","opacizant"],"opacizante":"opacizant","opacizantele":"opacizant","opacizanti":"opacizant","opacizantii":"opacizant","opacizantul":"opacizant","opacizara":"opaciza","opacizaram":"opaciza","opacizarati":"opaciza","opacizarea":"opacizare","opacizari":"opacizare","opacizarii":"opacizare","opacizarile":"opacizare","opacizarilor":"opacizare","opacizase":"opaciza","opacizasem":"opaciza","opacizasera":"opaciza","opacizaseram":"opaciza","opacizaserati":"opaciza","opacizasesi":"opaciza","opacizasi":"opaciza","opacizat":"opaciza","opacizati":"opaciza","opacizau":"opaciza","opacizeaza":"opaciza","opacizez":"opaciza","opacizezi":"opaciza","opacul":"opac","opaicioare":"opăicior","opaicioarele":"opăicior","opaicioarelor":"opăicior","opaiciorul":"opăicior","opaiciorule":"opăicior","opaiciorului":"opăicior","opaiete":"opaieț","opaietele":"opaieț","opaietelor":"opaieț","opaietul":"opaieț","opaietule":"opaieț","opaietului":"opaieț","opaite":["opaițe","opaiț","opaițe","opaiță"],"opaitei":["opaiței","opaiță","opăiței","opăițel"],"opaiteii":"opăițel","opaiteilor":"opăițel","opaitele":["opaițele","opaiț","opaițele","opaiță"],"opaitelor":["opaițelor","opaiț","opaițelor","opaiță"],"opaitelul":"opăițel","opaitelule":"opăițel","opaitelului":"opăițel","opaitul":"opaiț","opaitule":"opaiț","opaitului":"opaiț","opale":"opal","opalele":"opal","opalelor":"opal","opalescenta":["opalescentă","opalescent","opalescenta","opalescent"],"opalescente":["opalescente","opalescent","opalescențe","opalescență"],"opalescentei":"opalescență","opalescentele":["opalescentele","opalescent","opalescențele","opalescență"],"opalescentelor":"opalescență","opalescenti":"opalescent","opalescentii":"opalescent","opalescentul":"opalescent","opalina":["opalină","opalin","opalina","opalin"],"opaline":"opalin","opalinele":"opalin","opalini":"opalin","opalinii":"opalin","opalinul":"opalin","opalizai":"opaliza","opalizam":["opalizăm","opaliza","opalizam","opaliza"],"opalizand":"opaliza","opalizara":"opaliza","opalizaram":"opaliza","opalizarati":"opaliza","opalizarea":"opalizare","opalizari":"opalizare","opalizarii":"opalizare","opalizarile":"opalizare","opalizarilor":"opalizare","opalizase":"opaliza","opalizasem":"opaliza","opalizasera":"opaliza","opalizaseram":"opaliza","opalizaserati":"opaliza","opalizasesi":"opaliza","opalizasi":"opaliza","opalizat":"opaliza","opalizata":["opalizată","opalizat","opalizata","opalizat"],"opalizate":"opalizat","opalizatele":"opalizat","opalizati":["opalizați","opaliza","opalizați","opalizat"],"opalizatii":"opalizat","opalizatul":"opalizat","opalizau":"opaliza","opalizeaza":"opaliza","opalizez":"opaliza","opalizezi":"opaliza","opalul":"opal","opalule":"opal","opalului":"opal","oparea":"opări","opareai":"opări","opaream":"opări","opareati":"opări","opareau":"opări","opareli":"opăreală","oparelii":"opăreală","oparelile":"opăreală","oparelilor":"opăreală","oparesc":"opări","opareste":"opări","oparesti":"opări","oparii":"opări","oparim":"opări","oparind":"opări","oparira":"opări","opariram":"opări","oparirati":"opări","oparirea":"opărire","opariri":"opărire","oparirii":"opărire","oparirile":"opărire","oparirilor":"opărire","oparise":"opări","oparisem":"opări","oparisera":"opări","opariseram":"opări","opariserati":"opări","oparisesi":"opări","oparisi":"opări","oparit":"opări","oparita":["opărită","opărit","opărita","opărit"],"oparite":"opărit","oparitele":"opărit","opariti":["opăriți","opări","opăriți","opărit"],"oparitii":"opărit","oparitoare":"opăritor","oparitoarea":"opăritor","oparitoarele":"opăritor","oparitori":"opăritor","oparitorii":"opăritor","oparitorul":"opăritor","oparitul":"opărit","opariture":"opăritură","opariturei":"opăritură","opariturele":"opăritură","opariturelor":"opăritură","oparituri":"opăritură","opaxite":"opaxită","opaxitei":"opaxită","opaxitele":"opaxită","opaxitelor":"opaxită","openul":"open","openule":"open","openului":"open","openuri":"open","openurile":"open","openurilor":"open","operabila":["operabilă","operabil","operabila","operabil"],"operabile":"operabil","operabilele":"operabil","operabili":"operabil","operabilii":"operabil","operabilitatea":"operabilitate","operabilitati":"operabilitate","operabilitatii":"operabilitate","operabilul":"operabil","operai":"opera","operam":["operăm","opera","operam","opera"],"operand":"opera","operanta":["operantă","operant","operanta","operant"],"operante":"operant","operantele":"operant","operanti":"operant","operantii":"operant","operantul":"operant","operara":"opera","operaram":"opera","operarati":"opera","operarea":"operare","operari":"operare","operarii":"operare","operarile":"operare","operarilor":"operare","operase":"opera","operasem":"opera","operasera":"opera","operaseram":"opera","operaserati":"opera","operasesi":"opera","operasi":"opera","operat":"opera","operata":["operată","operat","operata","operat"],"operate":["operate","operat","operate","operată"],"operatei":"operată","operatele":["operatele","operat","operatele","operată"],"operatelor":"operată","operati":["operați","opera","operați","operat"],"operatia":"operație","operatiei":"operație","operatii":["operații","operat","operații","operație"],"operatii aritmetice":"operație aritmetică","operatii binare":"operație binară","operatii de schimbare a sexului":"operație de schimbare a sexului","operatii de schimbare de sex":"operație de schimbare de sex","operatiile":"operație","operatiilor":"operație","operationala":["operațională","operațional","operaționala","operațional"],"operationale":"operațional","operationalele":"operațional","operationali":"operațional","operationalii":"operațional","operationalitatea":"operaționalitate","operationalitati":"operaționalitate","operationalitatii":"operaționalitate","operationalul":"operațional","operationisme":"operaționism","operationismele":"operaționism","operationismelor":"operaționism","operationismul":"operaționism","operationismule":"operaționism","operationismului":"operaționism","operatiune":"operație","operatiunea":"operațiune","operatiuni":"operațiune","operatiunii":"operațiune","operatiunile":"operațiune","operatiunilor":"operațiune","operativa":["operativă","operativ","operativa","operativ"],"operative":"operativ","operativele":"operativ","operativi":"operativ","operativii":"operativ","operativitatea":"operativitate","operativitati":"operativitate","operativitatii":"operativitate","operativitatile":"operativitate","operativitatilor":"operativitate","operativul":"operativ","operatoare":"operator","operatoarea":["operatoarea","operatoare","operatoarea","operator"],"operatoarei":"operatoare","operatoarele":["operatoarele","operatoare","operatoarele","operator"],"operatoarelor":"operatoare","operatori":"operator","operatori aritmetici":"operator aritmetic","operatori binari":"operator binar","operatoria":"operatoriu","operatorie":"operatoriu","operatorii":["operatorii","operator","operatorii","operatoriu"],"operatoriii":"operatoriu","operatoriile":"operatoriu","operatorilor":"operator","operatoriul":"operatoriu","operatorul":"operator","operatorule":"operator","operatorului":"operator","operatul":"operat","operau":"opera","opercule":"opercul","operculele":"opercul","operculelor":"opercul","operculul":"opercul","operculule":"opercul","operculului":"opercul","opere":"operă","opere de arta":"operă de artă","opereaza":"opera","operei":"operă","operele":"operă","operelor":"operă","operete":"operetă","operetei":"operetă","operetele":"operetă","operetelor":"operetă","operetistica":["operetistică","operetistic","operetistica","operetistic"],"operetistice":"operetistic","operetisticele":"operetistic","operetistici":"operetistic","operetisticii":"operetistic","operetisticul":"operetistic","operez":"opera","operezi":"opera","operonul":"operon","operonule":"operon","operonului":"operon","opiacee":"opiaceu","opiaceea":"opiaceu","opiaceele":"opiaceu","opiacei":"opiaceu","opiaceii":"opiaceu","opiaceul":"opiaceu","opiate":"opiat","opiatele":"opiat","opiatelor":"opiat","opiatul":"opiat","opiatule":"opiat","opiatului":"opiat","opide":"opid","opidele":"opid","opidelor":"opid","opidul":"opid","opidule":"opid","opidului":"opid","opilatia":"opilație","opilatiei":"opilație","opilatii":"opilație","opilatiile":"opilație","opilatiilor":"opilație","opinai":"opina","opinam":["opinăm","opina","opinam","opina"],"opinand":"opina","opinara":"opina","opinaram":"opina","opinarati":"opina","opinase":"opina","opinasem":"opina","opinasera":"opina","opinaseram":"opina","opinaserati":"opina","opinasesi":"opina","opinasi":"opina","opinat":"opina","opinati":"opina","opinau":"opina","opincarasi":["opincarăși","opincăraș","opincărași","opincăraș"],"opincarasii":"opincăraș","opincarasilor":"opincăraș","opincarasul":"opincăraș","opincarasule":"opincăraș","opincarasului":"opincăraș","opincarese":"opincăreasă","opincaresei":"opincăreasă","opincaresele":"opincăreasă","opincareselor":"opincăreasă","opincari":"opincar","opincaria":"opincărie","opincariei":"opincărie","opincarii":["opincarii","opincar","opincării","opincărie"],"opincariile":"opincărie","opincariilor":"opincărie","opincarilor":"opincar","opincarimea":"opincărime","opincarimi":"opincărime","opincarimii":"opincărime","opincarimile":"opincărime","opincarimilor":"opincărime","opincarul":"opincar","opincarule":"opincar","opincarului":"opincar","opinci":"opincă","opincii":"opincă","opincile":"opincă","opincilor":"opincă","opincute":"opincuță","opincutei":"opincuță","opincutele":"opincuță","opincutelor":"opincuță","opineaza":"opina","opinez":"opina","opinezi":"opina","opinia":"opinie","opiniei":"opinie","opinii":"opinie","opiniile":"opinie","opiniilor":"opinie","opiniunea":"opiniune","opiniuni":"opiniune","opiniunii":"opiniune","opiniunile":"opiniune","opiniunilor":"opiniune","opintea":"opinti","opinteai":"opinti","opinteam":"opinti","opinteati":"opinti","opinteau":"opinti","opintele":"opinteală","opintelei":"opinteală","opintelele":"opinteală","opintelelor":"opinteală","opinteli":"opinteală","opintesc":"opinti","opinteste":"opinti","opintesti":"opinti","opintici":"opintic","opinticii":"opintic","opinticilor":"opintic","opinticul":"opintic","opinticule":"opintic","opinticului":"opintic","opintii":"opinti","opintim":"opinti","opintind":"opinti","opintira":"opinti","opintiram":"opinti","opintirati":"opinti","opintirea":"opintire","opintiri":"opintire","opintirii":"opintire","opintirile":"opintire","opintirilor":"opintire","opintise":"opinti","opintisem":"opinti","opintisera":"opinti","opintiseram":"opinti","opintiserati":"opinti","opintisesi":"opinti","opintisi":"opinti","opintit":"opinti","opintiti":"opinti","opintituri":"opintitură","opintiturii":"opintitură","opintiturile":"opintitură","opintiturilor":"opintitură","opiofagia":"opiofagie","opiofagiei":"opiofagie","opiofagii":"opiofagie","opiofagiile":"opiofagie","opiofagiilor":"opiofagie","opiomane":"opiomană","opiomanei":"opiomană","opiomanele":"opiomană","opiomanelor":"opiomană","opiomani":"opioman","opiomania":"opiomanie","opiomaniei":"opiomanie","opiomanii":["opiomanii","opioman","opiomanii","opiomanie"],"opiomaniile":"opiomanie","opiomaniilor":"opiomanie","opiomanilor":"opioman","opiomanul":"opioman","opiomanule":"opioman","opiomanului":"opioman","opise":"opis","opisele":"opis","opiselor":"opis","opistodomul":"opistodom","opistodomule":"opistodom","opistodomului":"opistodom","opistodomuri":"opistodom","opistodomurile":"opistodom","opistodomurilor":"opistodom","opistotonusul":"opistotonus","opistotonusule":"opistotonus","opistotonusului":"opistotonus","opisul":"opis","opisule":"opis","opisului":"opis","opiul":"opiu","opiule":"opiu","opiului":"opiu","oplosea":"oploși","oploseai":"oploși","oploseam":"oploși","oploseati":"oploși","oploseau":"oploși","oplosele":"oploșeală","oploselei":"oploșeală","oploselele":"oploșeală","oploselelor":"oploșeală","oploseli":"oploșeală","oplosesc":"oploși","oploseste":"oploși","oplosesti":"oploși","oplosii":"oploși","oplosim":"oploși","oplosind":"oploși","oplosira":"oploși","oplosiram":"oploși","oplosirati":"oploși","oplosirea":"oploșire","oplosiri":"oploșire","oplosirii":"oploșire","oplosirile":"oploșire","oplosirilor":"oploșire","oplosise":"oploși","oplosisem":"oploși","oplosisera":"oploși","oplosiseram":"oploși","oplosiserati":"oploși","oplosisesi":"oploși","oplosisi":"oploși","oplosit":"oploși","oplosita":["oploșită","oploșit","oploșita","oploșit"],"oplosite":"oploșit","oplositele":"oploșit","oplositi":["oploșiți","oploși","oploșiți","oploșit"],"oplositii":"oploșit","oplositul":"oploșit","oponente":["oponente","oponentă","oponențe","oponență"],"oponentei":["oponentei","oponentă","oponenței","oponență"],"oponentele":["oponentele","oponentă","oponențele","oponență"],"oponentelor":["oponentelor","oponentă","oponențelor","oponență"],"oponenti":"oponent","oponentii":"oponent","oponentilor":"oponent","oponentul":"oponent","oponentule":"oponent","oponentului":"oponent","opoponacsi":"opoponax","opoponacsii":"opoponax","opoponacsilor":"opoponax","opoponaxul":"opoponax","opoponaxule":"opoponax","opoponaxului":"opoponax","oportuna":["oportună","oportun","oportuna","oportun"],"oportune":"oportun","oportunele":"oportun","oportuni":"oportun","oportunii":"oportun","oportunismul":"oportunism","oportunismule":"oportunism","oportunismului":"oportunism","oportuniste":"oportunistă","oportunistei":"oportunistă","oportunistele":"oportunistă","oportunistelor":"oportunistă","oportunisti":"oportunist","oportunistii":"oportunist","oportunistilor":"oportunist","oportunistul":"oportunist","oportunistule":"oportunist","oportunistului":"oportunist","oportunitatea":"oportunitate","oportunitati":"oportunitate","oportunitatii":"oportunitate","oportunul":"oportun","oposumi":"oposum","oposumii":"oposum","oposumilor":"oposum","oposumul":"oposum","oposumule":"oposum","oposumului":"oposum","opoterapia":"opoterapie","opoterapica":["opoterapică","opoterapic","opoterapica","opoterapic"],"opoterapice":"opoterapic","opoterapicele":"opoterapic","opoterapici":"opoterapic","opoterapicii":"opoterapic","opoterapicul":"opoterapic","opoterapiei":"opoterapie","opoterapii":"opoterapie","opotreblenia":"opotreblenie","opotrebleniei":"opotreblenie","opotreblenii":"opotreblenie","opotrebleniile":"opotreblenie","opotrebleniilor":"opotreblenie","opozabila":["opozabilă","opozabil","opozabila","opozabil"],"opozabile":"opozabil","opozabilele":"opozabil","opozabili":"opozabil","opozabilii":"opozabil","opozabilitatea":"opozabilitate","opozabilitati":"opozabilitate","opozabilitatii":"opozabilitate","opozabilitatile":"opozabilitate","opozabilitatilor":"opozabilitate","opozabilul":"opozabil","opozante":"opozantă","opozantei":"opozantă","opozantele":"opozantă","opozantelor":"opozantă","opozanti":"opozant","opozantii":"opozant","opozantilor":"opozant","opozantul":"opozant","opozantule":"opozant","opozantului":"opozant","opozita":["opozită","opozit","opozita","opozit"],"opozite":"opozit","opozitele":"opozit","opoziti":"opozit","opozitii":["opoziții","opozit","opoziții","opoziție"],"opozitii politice":"opoziție politică","opozitionala":["opozițională","opozițional","opoziționala","opozițional"],"opozitionale":"opozițional","opozitionalele":"opozițional","opozitionali":"opozițional","opozitionalii":"opozițional","opozitionalul":"opozițional","opozitionista":["opoziționistă","opoziționist","opoziționista","opoziționist"],"opozitioniste":"opoziționist","opozitionistele":"opoziționist","opozitionisti":"opoziționist","opozitionistii":"opoziționist","opozitionistul":"opoziționist","opozitiunea":"opozițiune","opozitiuni":"opozițiune","opozitiunii":"opozițiune","opozitiunile":"opozițiune","opozitiunilor":"opozițiune","opozitul":"opozit","opracul":"oprac","opracule":"oprac","opracului":"oprac","opracuri":"oprac","opracurile":"oprac","opracurilor":"oprac","opravuirea":"oprăvuire","opravuiri":"oprăvuire","opravuirii":"oprăvuire","opravuirile":"oprăvuire","opravuirilor":"oprăvuire","oprea":"opri","opreai":"opri","opream":"opri","opreati":"opri","opreau":"opri","opreaua":"oprea","opredelenia":"opredelenie","opredeleniei":"opredelenie","opredelenii":"opredelenie","opredeleniile":"opredelenie","opredeleniilor":"opredelenie","oprele":["oprele","oprea","oprele","opreală"],"oprelei":["oprelei","oprea","oprelei","opreală"],"oprelele":["oprelele","oprea","oprelele","opreală"],"oprelelor":["oprelelor","oprea","oprelelor","opreală"],"opreli":"opreală","oprelistea":"opreliște","oprelisti":"opreliște","oprelistii":"opreliște","oprelistile":"opreliște","oprelistilor":"opreliște","opresc":"opri","opresia":"opresie","opresiei":"opresie","opresii":"opresie","opresiile":"opresie","opresiilor":"opresie","opresiunea":"opresiune","opresiunei":"opresiune","opresiunele":"opresiune","opresiunelor":"opresiune","opresiuni":"opresiune","opresiva":["opresivă","opresiv","opresiva","opresiv"],"opresive":"opresiv","opresivele":"opresiv","opresivi":"opresiv","opresivii":"opresiv","opresivul":"opresiv","opresoarea":"opresoare","opresoarei":"opresoare","opresoarele":"opresoare","opresoarelor":"opresoare","opresori":"opresor","opresorii":"opresor","opresorilor":"opresor","opresorul":"opresor","opresorule":"opresor","opresorului":"opresor","opreste":"opri","opresti":"opri","oprii":"opri","oprim":["oprim","opri","oprim","oprima"],"oprimai":"oprima","oprimam":["oprimăm","oprima","oprimam","oprima"],"oprimand":"oprima","oprimanta":["oprimantă","oprimant","oprimanta","oprimant"],"oprimante":"oprimant","oprimantele":"oprimant","oprimanti":"oprimant","oprimantii":"oprimant","oprimantul":"oprimant","oprimara":"oprima","oprimaram":"oprima","oprimarati":"oprima","oprimarea":"oprimare","oprimari":"oprimare","oprimarii":"oprimare","oprimarile":"oprimare","oprimarilor":"oprimare","oprimase":"oprima","oprimasem":"oprima","oprimasera":"oprima","oprimaseram":"oprima","oprimaserati":"oprima","oprimasesi":"oprima","oprimasi":"oprima","oprimat":"oprima","oprimata":["oprimată","oprimat","oprimata","oprimat"],"oprimate":"oprimat","oprimatele":"oprimat","oprimati":["oprimați","oprima","oprimați","oprimat"],"oprimatii":"oprimat","oprimatul":"oprimat","oprimau":"oprima","oprime":"oprima","oprimi":"oprima","oprind":"opri","oprira":"opri","opriram":"opri","oprirati":"opri","oprirea":"oprire","opriri":"oprire","opririi":"oprire","opririle":"oprire","opririlor":"oprire","oprise":"opri","oprisem":"opri","oprisera":"opri","opriseram":"opri","opriserati":"opri","oprisesi":"opri","oprisi":"opri","oprit":"opri","oprita":["oprită","oprit","oprita","oprit"],"oprite":"oprit","opritele":"oprit","opriti":["opriți","opri","opriți","oprit"],"opritii":"oprit","opritoare":"opritor","opritul":"oprit","oprituri":"opritură","opriturii":"opritură","opriturile":"opritură","opriturilor":"opritură","oprobriul":"oprobriu","oprobriule":"oprobriu","oprobriului":"oprobriu","opsasul":"opsas","opsasule":"opsas","opsasului":"opsas","opsasuri":"opsas","opsasurile":"opsas","opsasurilor":"opsas","opsomani":"opsoman","opsomania":"opsomanie","opsomaniei":"opsomanie","opsomanii":["opsomanii","opsoman","opsomanii","opsomanie"],"opsomaniile":"opsomanie","opsomaniilor":"opsomanie","opsomanilor":"opsoman","opsomanul":"opsoman","opsomanule":"opsoman","opsomanului":"opsoman","opsonine":"opsonină","opsoninei":"opsonină","opsoninele":"opsonină","opsoninelor":"opsonină","optai":"opta","optam":["optăm","opta","optam","opta"],"optand":"opta","optara":"opta","optaram":"opta","optarati":"opta","optarea":"optare","optari":"optare","optarii":"optare","optarile":"optare","optarilor":"optare","optase":"opta","optasem":"opta","optasera":"opta","optaseram":"opta","optaserati":"opta","optasesi":"opta","optasi":"opta","optat":"opta","optati":"opta","optatia":"optație","optatiei":"optație","optatii":"optație","optatiile":"optație","optatiilor":"optație","optativa":["optativă","optativ","optativa","optativ"],"optative":"optativ","optativele":"optativ","optativi":"optativ","optativii":"optativ","optativul":"optativ","optau":"opta","opteaza":"opta","optez":"opta","optezi":"opta","optica":["optică","optic","optica","optic"],"optice":"optic","opticele":"optic","optici":["optici","optic","optici","optică"],"opticianul":"optician","opticianule":"optician","opticianului":"optician","opticiene":"opticiană","opticienei":"opticiană","opticienele":"opticiană","opticienelor":"opticiană","opticieni":"optician","opticienii":"optician","opticienilor":"optician","opticii":["opticii","optic","opticii","optică"],"opticitatati":"opticitate","opticitatatii":"opticitate","opticitatatile":"opticitate","opticitatatilor":"opticitate","opticitatea":"opticitate","opticul":"optic","optima":["optimă","optim","optima","optim"],"optimala":["optimală","optimal","optimala","optimal"],"optimale":"optimal","optimalele":"optimal","optimali":"optimal","optimalii":"optimal","optimalul":"optimal","optimati":"optimat","optimatii":"optimat","optimatilor":"optimat","optimatul":"optimat","optimatule":"optimat","optimatului":"optimat","optime":"optim","optimea":"optime","optimele":"optim","optimetre":"optimetru","optimetrele":"optimetru","optimetrelor":"optimetru","optimetrul":"optimetru","optimetrule":"optimetru","optimetrului":"optimetru","optimi":["optimi","optim","optimi","optime"],"optimii":["optimii","optim","optimii","optime"],"optimile":"optime","optimilor":"optime","optimismul":"optimism","optimismule":"optimism","optimismului":"optimism","optimista":["optimistă","optimist","optimista","optimist"],"optimiste":["optimiste","optimist","optimiste","optimistă"],"optimistei":"optimistă","optimistele":["optimistele","optimist","optimistele","optimistă"],"optimistelor":"optimistă","optimisti":"optimist","optimistii":"optimist","optimistilor":"optimist","optimistul":"optimist","optimistule":"optimist","optimistului":"optimist","optimizai":"optimiza","optimizam":["optimizăm","optimiza","optimizam","optimiza"],"optimizand":"optimiza","optimizara":"optimiza","optimizaram":"optimiza","optimizarati":"optimiza","optimizarea":"optimizare","optimizari":"optimizare","optimizarii":"optimizare","optimizarile":"optimizare","optimizarilor":"optimizare","optimizase":"optimiza","optimizasem":"optimiza","optimizasera":"optimiza","optimizaseram":"optimiza","optimizaserati":"optimiza","optimizasesi":"optimiza","optimizasi":"optimiza","optimizat":"optimiza","optimizata":["optimizată","optimizat","optimizata","optimizat"],"optimizate":"optimizat","optimizatele":"optimizat","optimizati":["optimizați","optimiza","optimizați","optimizat"],"optimizatii":"optimizat","optimizatul":"optimizat","optimizau":"optimiza","optimizeaza":"optimiza","optimizez":"optimiza","optimizezi":"optimiza","optimul":"optim","optionala":["opțională","opțional","opționala","opțional"],"optionale":"opțional","optionalele":"opțional","optionali":"opțional","optionalii":"opțional","optionalul":"opțional","optiunea":"opțiune","optiuni":"opțiune","optiunii":"opțiune","optiunile":"opțiune","optiunilor":"opțiune","optocuploare":"optocuplor","optocuplore":"optocuplor","optocuplorele":"optocuplor","optocuplorelor":"optocuplor","optocuplorul":"optocuplor","optocuplorule":"optocuplor","optocuplorului":"optocuplor","optoelectronice":"optoelectronică","optoelectronicei":"optoelectronică","optoelectronicele":"optoelectronică","optoelectronicelor":"optoelectronică","optoizolatoare":"optoizolator","optoizolatoarele":"optoizolator","optoizolatoarelor":"optoizolator","optoizolatorul":"optoizolator","optoizolatorule":"optoizolator","optoizolatorului":"optoizolator","optometre":"optometru","optometrele":"optometru","optometrelor":"optometru","optometria":"optometrie","optometrica":["optometrică","optometric","optometrica","optometric"],"optometrice":"optometric","optometricele":"optometric","optometrici":"optometric","optometricii":"optometric","optometricul":"optometric","optometriei":"optometrie","optometrii":"optometrie","optometrul":"optometru","optometrule":"optometru","optometrului":"optometru","optspe":"optsprezece","optzeci si doua f &":"optzeci și două","optzeci si una f &":"optzeci și una","optzecista":["optzecistă","optzecist","optzecista","optzecist"],"optzeciste":["optzeciste","optzecist","optzeciste","optzecistă"],"optzecistei":"optzecistă","optzecistele":["optzecistele","optzecist","optzecistele","optzecistă"],"optzecistelor":"optzecistă","optzecisti":"optzecist","optzecistii":"optzecist","optzecistilor":"optzecist","optzecistul":"optzecist","optzecistule":"optzecist","optzecistului":"optzecist","opul":"op","opule":"op","opulenta":["opulentă","opulent","opulenta","opulent"],"opulente":["opulente","opulent","opulențe","opulență"],"opulentei":"opulență","opulentele":["opulentele","opulent","opulențele","opulență"],"opulentelor":"opulență","opulenti":"opulent","opulentii":"opulent","opulentul":"opulent","opului":"op","opuna":"opune","opunerea":"opunere","opuneri":"opunere","opunerii":"opunere","opunerile":"opunere","opunerilor":"opunere","opuri":"op","opurile":"op","opurilor":"op","opus":"opune","opusa":["opusă","opus","opusa","opus"],"opuscule":"opuscul","opusculele":"opuscul","opusculelor":"opuscul","opusculul":"opuscul","opusculule":"opuscul","opusculului":"opuscul","opuse":"opus","opusele":"opus","opusi":"opus","opusii":"opus","opustul":"opust","opustule":"opust","opustului":"opust","opusturi":"opust","opusturile":"opust","opusturilor":"opust","opusul":"opus","opusuri":"opus","ora":"oară","oracaia":"orăcăi","oracaiai":"orăcăi","oracaiam":"orăcăi","oracaiati":"orăcăi","oracaiau":"orăcăi","oracaie":"orăcăi","oracaiele":"orăcăială","oracaielei":"orăcăială","oracaielele":"orăcăială","oracaielelor":"orăcăială","oracaieli":"orăcăială","oracaii":"orăcăi","oracaim":"orăcăi","oracaind":"orăcăi","oracaira":"orăcăi","oracairam":"orăcăi","oracairati":"orăcăi","oracairea":"orăcăire","oracairi":"orăcăire","oracairii":"orăcăire","oracairile":"orăcăire","oracairilor":"orăcăire","oracaise":"orăcăi","oracaisem":"orăcăi","oracaisera":"orăcăi","oracaiseram":"orăcăi","oracaiserati":"orăcăi","oracaisesi":"orăcăi","oracaisi":"orăcăi","oracait":"orăcăi","oracaiti":"orăcăi","oracaitul":"orăcăit","oracaitule":"orăcăit","oracaitului":"orăcăit","oracaituri":"orăcăit","oracaiturile":"orăcăit","oracaiturilor":"orăcăit","oraccii":"oracciu","oracciii":"oracciu","oracciilor":"oracciu","oracciuul":"oracciu","oracciuule":"oracciu","oracciuului":"oracciu","oracole":"oracol","oracolele":"oracol","oracolelor":"oracol","oracolul":"oracol","oracolule":"oracol","oracolului":"oracol","oraculara":["oraculară","oracular","oraculara","oracular"],"oraculare":"oracular","oracularele":"oracular","oraculari":"oracular","oracularii":"oracular","oracularul":"oracular","oracule":"oracul","oraculele":"oracul","oraculelor":"oracul","oraculul":"oracul","oraculule":"oracul","oraculului":"oracul","oradeanul":"orădean","oradeanule":"orădean","oradeanului":"orădean","oradence":"orădeancă","oradencei":"orădeancă","oradencele":"orădeancă","oradencelor":"orădeancă","oradene":"orădeană","oradenei":"orădeană","oradenele":"orădeană","oradenelor":"orădeană","oradeni":"orădean","oradenii":"orădean","oradenilor":"orădean","oraje":"oraj","orajele":"oraj","orajelor":"oraj","orajoasa":["orajoasă","orajos","orajoasa","orajos"],"orajoase":"orajos","orajoasele":"orajos","orajosi":"orajos","orajosii":"orajos","orajosul":"orajos","orajul":"oraj","orajule":"oraj","orajului":"oraj","orala":["orală","oral","orala","oral"],"orale":"oral","oralele":"oral","orali":"oral","oralii":"oral","oralitatea":"oralitate","oralitati":"oralitate","oralitatii":"oralitate","oralul":"oral","orandaluirea":"orândăluire","orandaluiri":"orândăluire","orandaluirii":"orândăluire","orandaluirile":"orândăluire","orandaluirilor":"orândăluire","orandari":"orândar","orandarii":"orândar","orandarilor":"orândar","orandarul":"orândar","orandarule":"orândar","orandarului":"orândar","orandasi":"orândaș","orandasii":"orândaș","orandasilor":"orândaș","orandasul":"orândaș","orandasule":"orândaș","orandasului":"orândaș","oranduia":"orândui","oranduiai":"orândui","oranduiam":"orândui","oranduiati":"orândui","oranduiau":"orândui","oranduiele":"orânduială","oranduielei":"orânduială","oranduielele":"orânduială","oranduielelor":"orânduială","oranduieli":"orânduială","oranduiesc":"orândui","oranduieste":"orândui","oranduiesti":"orândui","oranduii":"orândui","oranduim":"orândui","oranduind":"orândui","oranduira":"orândui","oranduiram":"orândui","oranduirati":"orândui","oranduirea":"orânduire","oranduiri":"orânduire","oranduirii":"orânduire","oranduirile":"orânduire","oranduirilor":"orânduire","oranduise":"orândui","oranduisem":"orândui","oranduisera":"orândui","oranduiseram":"orândui","oranduiserati":"orândui","oranduisesi":"orândui","oranduisi":"orândui","oranduit":"orândui","oranduita":["orânduită","orânduit","orânduita","orânduit"],"oranduite":"orânduit","oranduitele":"orânduit","oranduiti":["orânduiți","orândui","orânduiți","orânduit"],"oranduitii":"orânduit","oranduitoarea":"orânduitoare","oranduitoarei":"orânduitoare","oranduitoarele":"orânduitoare","oranduitoarelor":"orânduitoare","oranduitori":"orânduitor","oranduitorii":"orânduitor","oranduitorilor":"orânduitor","oranduitorul":"orânduitor","oranduitorule":"orânduitor","oranduitorului":"orânduitor","oranduitul":"orânduit","orandul":"orând","orandule":"orând","orandului":"orând","orangeria":"orangerie","orangeriei":"orangerie","orangerii":"orangerie","orangeriile":"orangerie","orangeriilor":"orangerie","orangutan":"urangutan","orangutani":"orangutan","orangutanii":"orangutan","orangutanilor":"orangutan","orangutanul":"orangutan","orangutanule":"orangutan","orangutanului":"orangutan","oranistul":"oranist","oranistule":"oranist","oranistului":"oranist","oranisturi":"oranist","oranisturile":"oranist","oranisturilor":"oranist","oranjade":"oranjadă","oranjadei":"oranjadă","oranjadele":"oranjadă","oranjadelor":"oranjadă","oranjeria":"oranjerie","oranjeriei":"oranjerie","oranjerii":"oranjerie","oranjeriile":"oranjerie","oranjeriilor":"oranjerie","oranze":"orândă","oranzei":"orândă","oranzele":"orândă","oranzelor":"orândă","oranzi":["orânzi","orând","orânzi","orândă","oranzi","oranz"],"oranzii":["orânzii","orând","oranzii","oranz"],"oranzilor":["orânzilor","orând","oranzilor","oranz"],"oranzul":"oranz","oranzule":"oranz","oranzului":"oranz","orara":["orară","orar","orara","orar"],"orare":"orar","orarele":"orar","orari":"orar","orarii":"orar","orarul":"orar","orase":"oraș","orase deschise":"oraș deschis","orase universitare":"oraș universitar","oraseance":"orășeancă","oraseancei":"orășeancă","oraseancele":"orășeancă","oraseancelor":"orășeancă","oraseanul":"orășean","oraseanule":"orășean","oraseanului":"orășean","orasele":["orașele","oraș","orășele","orășel"],"oraselele":"orășel","oraselelor":"orășel","oraselor":"oraș","oraselul":"orășel","oraselule":"orășel","oraselului":"orășel","orasence":"orășeancă","orasene":"orășeană","oraseneasca":["orășenească","orășenesc","orășeneasca","orășenesc"],"orasenei":"orășeană","orasenele":"orășeană","orasenelor":"orășeană","orasenescul":"orășenesc","orasenesti":"orășenesc","orasenestii":"orășenesc","orasenestile":"orășenesc","oraseni":"orășean","orasenia":"orășenie","oraseniei":"orășenie","orasenii":["orășenii","orășean","orășenii","orășenie"],"oraseniile":"orășenie","oraseniilor":"orășenie","orasenilor":"orășean","orasenimea":"orășenime","orasenimi":"orășenime","orasenimii":"orășenime","orasenisme":"orășenism","orasenismele":"orășenism","orasenismelor":"orășenism","orasenismul":"orășenism","orasenismule":"orășenism","orasenismului":"orășenism","orasenizai":"orășeniza","orasenizam":["orășenizăm","orășeniza","orășenizam","orășeniza"],"orasenizand":"orășeniza","orasenizara":"orășeniza","orasenizaram":"orășeniza","orasenizarati":"orășeniza","orasenizase":"orășeniza","orasenizasem":"orășeniza","orasenizasera":"orășeniza","orasenizaseram":"orășeniza","orasenizaserati":"orășeniza","orasenizasesi":"orășeniza","orasenizasi":"orășeniza","orasenizat":"orășeniza","orasenizati":"orășeniza","orasenizau":"orășeniza","orasenizeaza":"orășeniza","orasenizez":"orășeniza","orasenizezi":"orășeniza","orasioare":"orășior","orasioarele":"orășior","orasioarelor":"orășior","orasiorul":"orășior","orasiorule":"orășior","orasiorului":"orășior","orastici":["orăstici","orăstică","orăștici","orăștică"],"orasticii":["orăsticii","orăstică","orășticii","orăștică"],"orasticile":["orăsticile","orăstică","orășticile","orăștică"],"orasticilor":["orăsticilor","orăstică","orășticilor","orăștică"],"orasul":"oraș","orasule":"oraș","orasului":"oraș","orasute":"orășuț","orasutele":"orășuț","orasutelor":"orășuț","orasutul":"orășuț","orasutule":"orășuț","orasutului":"orășuț","oratania":"orătănie","orataniei":"orătănie","oratanii":["orătanii","orătanie","orătănii","orătănie"],"orataniile":"orătănie","orataniilor":"orătănie","oratenia":"orătenie","orateniei":"orătenie","oratenii":"orătenie","orateniile":"orătenie","orateniilor":"orătenie","oratia":"orație","oratiei":"orație","oratii":"orație","oratiile":"orație","oratiilor":"orație","oratiune":"orație","oratiunea":"orațiune","oratiuni":"orațiune","oratiunii":"orațiune","oratiunile":"orațiune","oratiunilor":"orațiune","oratoarea":"oratoare","oratoarei":"oratoare","oratoarele":"oratoare","oratoarelor":"oratoare","oratori":"orator","oratoria":["oratoria","oratorie","oratoria","oratoriu"],"oratorica":["oratorică","oratoric","oratorica","oratoric"],"oratorice":"oratoric","oratoricele":"oratoric","oratorici":"oratoric","oratoricii":"oratoric","oratoricul":"oratoric","oratorie":"oratoriu","oratoriei":"oratorie","oratorii":["oratorii","orator","oratorii","oratorie","oratorii","oratoriu"],"oratoriii":"oratoriu","oratoriile":"oratoriu","oratorilor":"orator","oratorisme":"oratorism","oratorismele":"oratorism","oratorismelor":"oratorism","oratorismul":"oratorism","oratorismule":"oratorism","oratorismului":"oratorism","oratoriul":"oratoriu","oratorul":"orator","oratorule":"orator","oratorului":"orator","orbacaciunea":"orbăcăciune","orbacaciuni":"orbăcăciune","orbacaciunii":"orbăcăciune","orbacaciunile":"orbăcăciune","orbacaciunilor":"orbăcăciune","orbacai":"orbecăi","orbacaia":"orbăcăi","orbacaiai":"orbăcăi","orbacaiam":"orbăcăi","orbacaiati":"orbăcăi","orbacaiau":"orbăcăi","orbacaie":"orbăcăi","orbacaii":"orbăcăi","orbacaim":"orbăcăi","orbacaind":"orbăcăi","orbacaira":"orbăcăi","orbacairam":"orbăcăi","orbacairati":"orbăcăi","orbacaise":"orbăcăi","orbacaisem":"orbăcăi","orbacaisera":"orbăcăi","orbacaiseram":"orbăcăi","orbacaiserati":"orbăcăi","orbacaisesi":"orbăcăi","orbacaisi":"orbăcăi","orbacait":"orbăcăi","orbacaiti":"orbăcăi","orbaltaturi":"orbălțătură","orbaltaturii":"orbălțătură","orbaltaturile":"orbălțătură","orbaltaturilor":"orbălțătură","orbea":"orbi","orbeai":"orbi","orbeam":"orbi","orbeasca":["orbească","orbesc","orbeasca","orbesc"],"orbeata":["orbeață","orbeț","orbeața","orbeț"],"orbeati":"orbi","orbeau":"orbi","orbec":"orbeca","orbeca":"orbecăi","orbecai":"orbeca","orbecaia":"orbecăi","orbecaiai":"orbecăi","orbecaiam":"orbecăi","orbecaiati":"orbecăi","orbecaiau":"orbecăi","orbecaiele":"orbecăială","orbecaielei":"orbecăială","orbecaielele":"orbecăială","orbecaielelor":"orbecăială","orbecaieli":"orbecăială","orbecaiesc":"orbecăi","orbecaieste":"orbecăi","orbecaiesti":"orbecăi","orbecaii":"orbecăi","orbecaim":"orbecăi","orbecaind":"orbecăi","orbecaira":"orbecăi","orbecairam":"orbecăi","orbecairati":"orbecăi","orbecairea":"orbecăire","orbecairi":"orbecăire","orbecairii":"orbecăire","orbecairile":"orbecăire","orbecairilor":"orbecăire","orbecaise":"orbecăi","orbecaisem":"orbecăi","orbecaisera":"orbecăi","orbecaiseram":"orbecăi","orbecaiserati":"orbecăi","orbecaisesi":"orbecăi","orbecaisi":"orbecăi","orbecait":"orbecăi","orbecaiti":"orbecăi","orbecam":["orbecăm","orbeca","orbecam","orbeca"],"orbecand":"orbeca","orbecara":"orbeca","orbecaram":"orbeca","orbecarati":"orbeca","orbecarea":"orbecare","orbecari":"orbecare","orbecarii":"orbecare","orbecarile":"orbecare","orbecarilor":"orbecare","orbecase":"orbeca","orbecasem":"orbeca","orbecasera":"orbeca","orbecaseram":"orbeca","orbecaserati":"orbeca","orbecasesi":"orbeca","orbecasi":"orbeca","orbecat":"orbeca","orbecata":["orbecată","orbecat","orbecata","orbecat"],"orbecate":"orbecat","orbecatele":"orbecat","orbecati":["orbecați","orbeca","orbecați","orbecat"],"orbecatii":"orbecat","orbecatul":"orbecat","orbecau":"orbeca","orbeci":"orbeca","orbeli":"orbeală","orbelii":"orbeală","orbelile":"orbeală","orbelilor":"orbeală","orbesc":"orbi","orbescul":"orbesc","orbeste":"orbi","orbesti":["orbești","orbesc","orbești","orbi"],"orbestii":"orbesc","orbestile":"orbesc","orbete":"orbeț","orbetele":"orbeț","orbeteul":"orbete","orbeteule":"orbete","orbeteului":"orbete","orbeti":["orbeți","orbeț","orbeți","orbete"],"orbetii":["orbeții","orbeț","orbeții","orbete"],"orbetilor":["orbeților","orbeț","orbeților","orbete"],"orbetul":"orbeț","orbetule":"orbeț","orbetului":"orbeț","orbi":"orb","orbia":"orbie","orbiciunea":"orbiciune","orbiciuni":"orbiciune","orbiciunii":"orbiciune","orbiciunile":"orbiciune","orbiciunilor":"orbiciune","orbiculara":["orbiculară","orbicular","orbiculara","orbicular"],"orbiculare":"orbicular","orbicularele":"orbicular","orbiculari":"orbicular","orbicularii":"orbicular","orbicularul":"orbicular","orbiculata":["orbiculată","orbiculat","orbiculata","orbiculat"],"orbiculate":"orbiculat","orbiculatele":"orbiculat","orbiculati":"orbiculat","orbiculatii":"orbiculat","orbiculatul":"orbiculat","orbiei":"orbie","orbii":["orbii","orb","orbii","orbi","orbii","orbie"],"orbilaul":"orbilă","orbilaule":"orbilă","orbilaului":"orbilă","orbilor":"orb","orbim":"orbi","orbimea":"orbime","orbimi":"orbime","orbimii":"orbime","orbimile":"orbime","orbimilor":"orbime","orbind":"orbi","orbira":"orbi","orbiram":"orbi","orbirati":"orbi","orbise":"orbi","orbisem":"orbi","orbisera":"orbi","orbiseram":"orbi","orbiserati":"orbi","orbisesi":"orbi","orbisi":"orbi","orbit":"orbi","orbita":["orbită","orbit","orbita","orbit"],"orbitala":["orbitală","orbital","orbitala","orbital"],"orbitale":"orbital","orbitalele":"orbital","orbitali":"orbital","orbitalii":"orbital","orbitalul":"orbital","orbite":["orbite","orbit","orbite","orbită"],"orbitei":"orbită","orbitele":["orbitele","orbit","orbitele","orbită"],"orbitelor":"orbită","orbiti":["orbiți","orbi","orbiți","orbit"],"orbitii":"orbit","orbitoare":"orbitor","orbitoarea":"orbitor","orbitoarele":"orbitor","orbitografia":"orbitografie","orbitografiei":"orbitografie","orbitografii":"orbitografie","orbitori":"orbitor","orbitorii":"orbitor","orbitorul":"orbitor","orbitul":"orbit","orbituri":"orbitură","orbiturii":"orbitură","orbiturile":"orbitură","orbiturilor":"orbitură","orbote":"orbotă","orbotei":"orbotă","orbotele":"orbotă","orbotelor":"orbotă","orbul":"orb","orbule":"orb","orbului":"orb","orc":"oricum","orcane":"orcan","orcanele":"orcan","orcanelor":"orcan","orcanul":"orcan","orcanule":"orcan","orcanului":"orcan","orchestrai":"orchestra","orchestrala":["orchestrală","orchestral","orchestrala","orchestral"],"orchestrale":"orchestral","orchestralele":"orchestral","orchestrali":"orchestral","orchestralii":"orchestral","orchestralul":"orchestral","orchestram":["orchestrăm","orchestra","orchestram","orchestra"],"orchestrand":"orchestra","orchestrante":"orchestrantă","orchestrantei":"orchestrantă","orchestrantele":"orchestrantă","orchestrantelor":"orchestrantă","orchestranti":"orchestrant","orchestrantii":"orchestrant","orchestrantilor":"orchestrant","orchestrantul":"orchestrant","orchestrantule":"orchestrant","orchestrantului":"orchestrant","orchestrara":"orchestra","orchestraram":"orchestra","orchestrarati":"orchestra","orchestrarea":"orchestrare","orchestrari":"orchestrare","orchestrarii":"orchestrare","orchestrarile":"orchestrare","orchestrarilor":"orchestrare","orchestrase":"orchestra","orchestrasem":"orchestra","orchestrasera":"orchestra","orchestraseram":"orchestra","orchestraserati":"orchestra","orchestrasesi":"orchestra","orchestrasi":"orchestra","orchestrat":"orchestra","orchestrati":"orchestra","orchestratia":"orchestrație","orchestratiei":"orchestrație","orchestratii":"orchestrație","orchestratiile":"orchestrație","orchestratiilor":"orchestrație","orchestratiunea":"orchestrațiune","orchestratiuni":"orchestrațiune","orchestratiunii":"orchestrațiune","orchestratiunile":"orchestrațiune","orchestratiunilor":"orchestrațiune","orchestratori":"orchestrator","orchestratorii":"orchestrator","orchestratorilor":"orchestrator","orchestratorul":"orchestrator","orchestratorule":"orchestrator","orchestratorului":"orchestrator","orchestrau":"orchestra","orchestre":["orchestre","orchestră","orchestre","orchestru"],"orchestre de alamuri":"orchestră de alămuri","orchestre simfonice":"orchestră simfonică","orchestreaza":"orchestra","orchestrei":"orchestră","orchestrele":["orchestrele","orchestră","orchestrele","orchestru"],"orchestrelor":["orchestrelor","orchestră","orchestrelor","orchestru"],"orchestrez":"orchestra","orchestrezi":"orchestra","orchestrioane":"orchestrion","orchestrioanele":"orchestrion","orchestrioanelor":"orchestrion","orchestrionul":"orchestrion","orchestrionule":"orchestrion","orchestrionului":"orchestrion","orchestruul":"orchestru","orchestruule":"orchestru","orchestruului":"orchestru","ordalia":"ordalie","ordaliei":"ordalie","ordalii":"ordalie","ordaliile":"ordalie","ordaliilor":"ordalie","ordeolumul":"ordeolum","ordeolumule":"ordeolum","ordeolumului":"ordeolum","orderul":"order","orderule":"order","orderului":"order","ordia":"ordie","ordiei":"ordie","ordii":"ordie","ordiile":"ordie","ordiilor":"ordie","ordina":"ordona","ordinai":"ordina","ordinala":["ordinală","ordinal","ordinala","ordinal"],"ordinale":"ordinal","ordinalele":"ordinal","ordinali":"ordinal","ordinalii":"ordinal","ordinalul":"ordinal","ordinam":["ordinăm","ordina","ordinam","ordina"],"ordinand":"ordina","ordinara":["ordinară","ordina","ordinară","ordinar","ordinara","ordinar"],"ordinaram":"ordina","ordinarati":"ordina","ordinare":"ordinar","ordinarea":"ordinare","ordinarele":"ordinar","ordinari":["ordinari","ordinar","ordinări","ordinare"],"ordinariate":"ordinariat","ordinariatele":"ordinariat","ordinariatelor":"ordinariat","ordinariatul":"ordinariat","ordinariatule":"ordinariat","ordinariatului":"ordinariat","ordinarii":["ordinarii","ordinar","ordinării","ordinare"],"ordinarile":"ordinare","ordinarilor":"ordinare","ordinarul":"ordinar","ordinase":"ordina","ordinasem":"ordina","ordinasera":"ordina","ordinaseram":"ordina","ordinaserati":"ordina","ordinasesi":"ordina","ordinasi":"ordina","ordinat":"ordina","ordinati":"ordina","ordinatia":"ordinație","ordinatiei":"ordinație","ordinatii":"ordinație","ordinatiile":"ordinație","ordinatiilor":"ordinație","ordinatoare":"ordinator","ordinatore":"ordinator","ordinatorele":"ordinator","ordinatorelor":"ordinator","ordinatorul":"ordinator","ordinatorule":"ordinator","ordinatorului":"ordinator","ordinau":"ordina","ordine":"ordin","ordine de plata":"ordin de plată","ordinea":"ordine","ordineaza":"ordina","ordinele":"ordin","ordinelor":"ordin","ordinez":"ordina","ordinezi":"ordina","ordini":"ordine","ordinii":"ordine","ordinile":"ordine","ordinilor":"ordine","ordinul":"ordin","ordinule":"ordin","ordinului":"ordin","ordon":"ordona","ordonai":"ordona","ordonam":["ordonăm","ordona","ordonam","ordona"],"ordonand":"ordona","ordonantai":"ordonanța","ordonantam":["ordonanțăm","ordonanța","ordonanțam","ordonanța"],"ordonantand":"ordonanța","ordonantara":"ordonanța","ordonantaram":"ordonanța","ordonantarati":"ordonanța","ordonantase":"ordonanța","ordonantasem":"ordonanța","ordonantasera":"ordonanța","ordonantaseram":"ordonanța","ordonantaserati":"ordonanța","ordonantasesi":"ordonanța","ordonantasi":"ordonanța","ordonantat":"ordonanța","ordonantati":"ordonanța","ordonantau":"ordonanța","ordonante":"ordonanță","ordonante de plata":"ordonanță de plată","ordonanteaza":"ordonanța","ordonantei":"ordonanță","ordonantele":"ordonanță","ordonantelor":"ordonanță","ordonantez":"ordonanța","ordonantezi":"ordonanța","ordonara":"ordona","ordonaram":"ordona","ordonarati":"ordona","ordonarea":"ordonare","ordonari":"ordonare","ordonari alfabetice":"ordonare alfabetică","ordonarii":"ordonare","ordonarile":"ordonare","ordonarilor":"ordonare","ordonase":"ordona","ordonasem":"ordona","ordonasera":"ordona","ordonaseram":"ordona","ordonaserati":"ordona","ordonasesi":"ordona","ordonasi":"ordona","ordonat":"ordona","ordonata":["ordonată","ordonat","ordonata","ordonat"],"ordonate":["ordonate","ordonat","ordonate","ordonată"],"ordonatei":"ordonată","ordonatele":["ordonatele","ordonat","ordonatele","ordonată"],"ordonatelor":"ordonată","ordonati":["ordonați","ordona","ordonați","ordonat"],"ordonatii":"ordonat","ordonatoarea":"ordonatoare","ordonatoarei":"ordonatoare","ordonatoarele":"ordonatoare","ordonatoarelor":"ordonatoare","ordonatori":"ordonator","ordonatorii":"ordonator","ordonatorilor":"ordonator","ordonatorul":"ordonator","ordonatorule":"ordonator","ordonatorului":"ordonator","ordonatul":"ordonat","ordonau":"ordona","ordoneaza":"ordona","ordonez":"ordona","ordonezi":"ordona","ordoni":"ordona","ordovicianul":"ordovician","ordovicianule":"ordovician","ordovicianului":"ordovician","ordovicieni":"ordovician","ordovicienile":"ordovician","ordovicienilor":"ordovician","orduri":"ordură","orduriera":["ordurieră","ordurier","orduriera","ordurier"],"orduriere":"ordurier","ordurierele":"ordurier","ordurieri":"ordurier","ordurierii":"ordurier","ordurierul":"ordurier","ordurii":"ordură","ordurile":"ordură","ordurilor":"ordură","ore":"oră","ore de varf":"oră de vârf","oreade":"oreadă","oreadei":"oreadă","oreadele":"oreadă","oreadelor":"oreadă","oreave":"oreav","oreavele":"oreav","oreavelor":"oreav","oreavul":"oreav","oreavule":"oreav","oreavului":"oreav","orednici":"orednic","orednicii":"orednic","orednicilor":"orednic","orednicul":"orednic","orednicule":"orednic","orednicului":"orednic","orei":"oră","oreioane":"oreion","oreioanele":"oreion","oreioanelor":"oreion","oreionul":"oreion","oreionule":"oreion","oreionului":"oreion","orele":"oră","orelista":["orelistă","orelist","orelista","orelist"],"oreliste":"orelist","orelistele":"orelist","orelisti":"orelist","orelistii":"orelist","orelistul":"orelist","orelor":"oră","oresnite":"oreșniță","oresnitei":"oreșniță","oresnitele":"oreșniță","oresnitelor":"oreșniță","orezari":"orezar","orezaria":"orezărie","orezariei":"orezărie","orezarii":["orezarii","orezar","orezării","orezărie"],"orezariile":"orezărie","orezariilor":"orezărie","orezarilor":"orezar","orezarul":"orezar","orezarule":"orezar","orezarului":"orezar","orezul":"orez","orezule":"orez","orezului":"orez","orfana":["orfană","orfan","orfana","orfan"],"orfane":["orfane","orfan","orfane","orfană"],"orfanei":"orfană","orfanele":["orfanele","orfan","orfanele","orfană"],"orfanelor":"orfană","orfani":"orfan","orfanii":"orfan","orfanilor":"orfan","orfanotrofia":"orfanotrofie","orfanotrofiei":"orfanotrofie","orfanotrofii":"orfanotrofie","orfanotrofiile":"orfanotrofie","orfanotrofiilor":"orfanotrofie","orfanul":"orfan","orfanule":"orfan","orfanului":"orfan","orfaurari":"orfăurar","orfauraria":"orfăurărie","orfaurariei":"orfăurărie","orfaurarii":["orfăurarii","orfăurar","orfăurării","orfăurărie"],"orfaurariile":"orfăurărie","orfaurariilor":"orfăurărie","orfaurarilor":"orfăurar","orfaurarul":"orfăurar","orfaurarule":"orfăurar","orfaurarului":"orfăurar","orfelinate":"orfelinat","orfelinatele":"orfelinat","orfelinatelor":"orfelinat","orfelinatul":"orfelinat","orfelinatule":"orfelinat","orfelinatului":"orfelinat","orfeline":"orfelină","orfelinei":"orfelină","orfelinele":"orfelină","orfelinelor":"orfelină","orfelini":"orfelin","orfelinii":"orfelin","orfelinilor":"orfelin","orfelinul":"orfelin","orfelinule":"orfelin","orfelinului":"orfelin","orfeonisti":"orfeonist","orfeonistii":"orfeonist","orfeonistilor":"orfeonist","orfeonistul":"orfeonist","orfeonistule":"orfeonist","orfeonistului":"orfeonist","orfevraria":"orfevrărie","orfevrariei":"orfevrărie","orfevrarii":"orfevrărie","orfevrariile":"orfevrărie","orfevrariilor":"orfevrărie","orfevreria":"orfevrerie","orfevreriei":"orfevrerie","orfevrerii":"orfevrerie","orfevreriile":"orfevrerie","orfevreriilor":"orfevrerie","orfevri":"orfevru","orfevriera":["orfevrieră","orfevrier","orfevriera","orfevrier"],"orfevriere":"orfevrier","orfevrierele":"orfevrier","orfevrieri":"orfevrier","orfevrierii":"orfevrier","orfevrierul":"orfevrier","orfevrii":"orfevru","orfevrilor":"orfevru","orfevruul":"orfevru","orfevruule":"orfevru","orfevruului":"orfevru","orfica":["orfică","orfic","orfica","orfic"],"orfice":"orfic","orficele":"orfic","orfici":"orfic","orficii":"orfic","orficul":"orfic","orfisme":"orfism","orfismele":"orfism","orfismelor":"orfism","orfismul":"orfism","orfismule":"orfism","orfismului":"orfism","organasi":"orgănaș","organasii":"orgănaș","organasilor":"orgănaș","organasul":"orgănaș","organasule":"orgănaș","organasului":"orgănaș","organdinul":"organdin","organdinule":"organdin","organdinului":"organdin","organdinuri":"organdin","organdinurile":"organdin","organdinurilor":"organdin","organdiul":"organdi","organdiule":"organdi","organdiului":"organdi","organdiuri":"organdi","organdiurile":"organdi","organdiurilor":"organdi","organe":"organ","organe legislative":"organ legislativ","organe sexuale":"organ sexual","organele":"organ","organelor":"organ","organica":["organică","organic","organica","organic"],"organice":"organic","organicele":"organic","organici":"organic","organicii":"organic","organicismul":"organicism","organicismule":"organicism","organicismului":"organicism","organiciste":"organicistă","organicistei":"organicistă","organicistele":"organicistă","organicistelor":"organicistă","organicisti":"organicist","organicistii":"organicist","organicistilor":"organicist","organicistul":"organicist","organicistule":"organicist","organicistului":"organicist","organicitatea":"organicitate","organicitati":"organicitate","organicitatii":"organicitate","organicul":"organic","organigrame":"organigramă","organigramei":"organigramă","organigramele":"organigramă","organigramelor":"organigramă","organisea":"organisi","organiseai":"organisi","organiseam":"organisi","organiseati":"organisi","organiseau":"organisi","organisesc":"organisi","organiseste":"organisi","organisesti":"organisi","organisii":"organisi","organisim":"organisi","organisind":"organisi","organisira":"organisi","organisiram":"organisi","organisirati":"organisi","organisirea":"organisire","organisiri":"organisire","organisirii":"organisire","organisirile":"organisire","organisirilor":"organisire","organisise":"organisi","organisisem":"organisi","organisisera":"organisi","organisiseram":"organisi","organisiserati":"organisi","organisisesi":"organisi","organisisi":"organisi","organisit":"organisi","organisiti":"organisi","organisme":"organism","organismele":"organism","organismelor":"organism","organismul":"organism","organismule":"organism","organismului":"organism","organiste":"organistă","organisti":"organist","organistii":"organist","organistilor":"organist","organistul":"organist","organistule":"organist","organistului":"organist","organite":"organit","organitele":"organit","organitelor":"organit","organitul":"organit","organitule":"organit","organitului":"organit","organizai":"organiza","organizam":["organizăm","organiza","organizam","organiza"],"organizand":"organiza","organizara":"organiza","organizaram":"organiza","organizarati":"organiza","organizarea":"organizare","organizari":"organizare","organizarii":"organizare","organizarile":"organizare","organizarilor":"organizare","organizase":"organiza","organizasem":"organiza","organizasera":"organiza","organizaseram":"organiza","organizaserati":"organiza","organizasesi":"organiza","organizasi":"organiza","organizat":"organiza","organizata":["organizată","organizat","organizata","organizat"],"organizate":"organizat","organizatele":"organizat","organizati":["organizați","organiza","organizați","organizat"],"organizatia":"organizație","organizatiei":"organizație","organizatii":["organizații","organizat","organizații","organizație"],"organizatii neguvernamentale":"organizație neguvernamentală","organizatii non-guvernamentale":"organizație non-guvernamentală","organizatii secrete":"organizație secretă","organizatiile":"organizație","organizatiilor":"organizație","organizationala":["organizațională","organizațional","organizaționala","organizațional"],"organizationale":"organizațional","organizationalele":"organizațional","organizationali":"organizațional","organizationalii":"organizațional","organizationalul":"organizațional","organizatiunea":"organizațiune","organizatiuni":"organizațiune","organizatiunii":"organizațiune","organizatiunile":"organizațiune","organizatiunilor":"organizațiune","organizatoare":"organizator","organizatoarea":"organizator","organizatoarele":"organizator","organizatori":"organizator","organizatorica":["organizatorică","organizatoric","organizatorica","organizatoric"],"organizatorice":"organizatoric","organizatoricele":"organizatoric","organizatorici":"organizatoric","organizatoricii":"organizatoric","organizatoricul":"organizatoric","organizatorii":"organizator","organizatorilor":"organizator","organizatorul":"organizator","organizatorule":"organizator","organizatorului":"organizator","organizatul":"organizat","organizau":"organiza","organizeaza":"organiza","organizez":"organiza","organizezi":"organiza","organogena":["organogenă","organogen","organogena","organogen"],"organogene":"organogen","organogenele":"organogen","organogeneze":"organogeneză","organogenezei":"organogeneză","organogenezele":"organogeneză","organogenezelor":"organogeneză","organogeni":"organogen","organogenia":"organogenie","organogeniei":"organogenie","organogenii":["organogenii","organogen","organogenii","organogenie"],"organogenul":"organogen","organografia":"organografie","organografica":["organografică","organografic","organografica","organografic"],"organografice":"organografic","organograficele":"organografic","organografici":"organografic","organograficii":"organografic","organograficul":"organografic","organografiei":"organografie","organografii":"organografie","organoleptica":["organoleptică","organoleptic","organoleptica","organoleptic"],"organoleptice":"organoleptic","organolepticele":"organoleptic","organoleptici":"organoleptic","organolepticii":"organoleptic","organolepticul":"organoleptic","organonul":"organon","organonule":"organon","organonului":"organon","organosoli":"organosol","organosolii":"organosol","organosolilor":"organosol","organosolul":"organosol","organosolule":"organosol","organosolului":"organosol","organoterapia":"organoterapie","organoterapiei":"organoterapie","organoterapii":"organoterapie","organoterapiile":"organoterapie","organoterapiilor":"organoterapie","organotropa":["organotropă","organotrop","organotropa","organotrop"],"organotrope":"organotrop","organotropele":"organotrop","organotropi":"organotrop","organotropii":"organotrop","organotropismul":"organotropism","organotropismule":"organotropism","organotropismului":"organotropism","organotropul":"organotrop","organtinul":"organtin","organtinule":"organtin","organtinului":"organtin","organtinuri":"organtin","organtinurile":"organtin","organtinurilor":"organtin","organul":"organ","organule":"organ","organului":"organ","organumul":"organum","organumule":"organum","organumului":"organum","organzine":"organzin","organzinele":"organzin","organzinelor":"organzin","organzinul":"organzin","organzinule":"organzin","organzinului":"organzin","orgari":"orgar","orgarii":"orgar","orgarilor":"orgar","orgarul":"orgar","orgarule":"orgar","orgarului":"orgar","orgasme":"orgasm","orgasmele":"orgasm","orgasmelor":"orgasm","orgasmica":["orgasmică","orgasmic","orgasmica","orgasmic"],"orgasmice":"orgasmic","orgasmicele":"orgasmic","orgasmici":"orgasmic","orgasmicii":"orgasmic","orgasmicul":"orgasmic","orgasmul":"orgasm","orgasmule":"orgasm","orgasmului":"orgasm","orgastica":["orgastică","orgastic","orgastica","orgastic"],"orgastice":"orgastic","orgasticele":"orgastic","orgastici":"orgastic","orgasticii":"orgastic","orgasticul":"orgastic","orge":"orgă","orgei":"orgă","orgele":"orgă","orgelete":"orgelet","orgeletele":"orgelet","orgeletelor":"orgelet","orgeletul":"orgelet","orgeletule":"orgelet","orgeletului":"orgelet","orgelor":"orgă","orgi":"orgă","orgia":"orgie","orgiaca":["orgiacă","orgiac","orgiaca","orgiac"],"orgiace":"orgiac","orgiacele":"orgiac","orgiaci":"orgiac","orgiacii":"orgiac","orgiacul":"orgiac","orgiastica":["orgiastică","orgiastic","orgiastica","orgiastic"],"orgiastice":"orgiastic","orgiasticele":"orgiastic","orgiastici":"orgiastic","orgiasticii":"orgiastic","orgiasticul":"orgiastic","orgiei":"orgie","orgii":"orgie","orgiile":"orgie","orgiilor":"orgie","orgolii":"orgoliu","orgolioasa":["orgolioasă","orgolios","orgolioasa","orgolios"],"orgolioase":"orgolios","orgolioasele":"orgolios","orgoliosi":"orgolios","orgoliosii":"orgolios","orgoliosul":"orgolios","orgulia":"orguliu","orgulie":"orguliu","orgulii":"orguliu","orguliii":"orguliu","orguliile":"orguliu","orguliul":"orguliu","orhestratia":"orhestrație","orhestratiei":"orhestrație","orhestratii":"orhestrație","orhestratiile":"orhestrație","orhestratiilor":"orhestrație","orhestratiunea":"orhestrațiune","orhestratiuni":"orhestrațiune","orhestratiunii":"orhestrațiune","orhestratiunile":"orhestrațiune","orhestratiunilor":"orhestrațiune","orhestre":"orhestră","orhestrei":"orhestră","orhestrele":"orhestră","orhestrelor":"orhestră","orhestrine":"orhestrină","orhestrinei":"orhestrină","orhestrinele":"orhestrină","orhestrinelor":"orhestrină","orhialgia":"orhialgie","orhialgiei":"orhialgie","orhialgii":"orhialgie","orhialgiile":"orhialgie","orhialgiilor":"orhialgie","orhidectomia":"orhidectomie","orhidectomiei":"orhidectomie","orhidectomii":"orhidectomie","orhidectomiile":"orhidectomie","orhidectomiilor":"orhidectomie","orhideea":"orhidee","orhideei":"orhidee","orhideele":"orhidee","orhideelor":"orhidee","orhidopexia":"orhidopexie","orhidopexiei":"orhidopexie","orhidopexii":"orhidopexie","orhidotomia":"orhidotomie","orhidotomiei":"orhidotomie","orhidotomii":"orhidotomie","orhidotomiile":"orhidotomie","orhidotomiilor":"orhidotomie","orhiectomia":"orhiectomie","orhiectomiei":"orhiectomie","orhiectomii":"orhiectomie","orhiectomiile":"orhiectomie","orhiectomiilor":"orhiectomie","orhiotomia":"orhiotomie","orhiotomiei":"orhiotomie","orhiotomii":"orhiotomie","orhiotomiile":"orhiotomie","orhiotomiilor":"orhiotomie","orhite":"orhită","orhitei":"orhită","orhitele":"orhită","orhitelor":"orhită","orhitica":["orhitică","orhitic","orhitica","orhitic"],"orhitice":"orhitic","orhiticele":"orhitic","orhitici":"orhitic","orhiticii":"orhitic","orhiticul":"orhitic","ori":"oară","oribila":["oribilă","oribil","oribila","oribil"],"oribile":"oribil","oribilele":"oribil","oribili":"oribil","oribilii":"oribil","oribilul":"oribil","oricalcul":"oricalc","oricalcule":"oricalc","oricalcului":"oricalc","oricarei":"oricare","oricareia":"oricare","oricaror":"oricare","oricarora":"oricare","oricarui":"oricare","oricaruia":"oricare","oricind":"oricând","oricui":"oricine","orientabila":["orientabilă","orientabil","orientabila","orientabil"],"orientabile":"orientabil","orientabilele":"orientabil","orientabili":"orientabil","orientabilii":"orientabil","orientabilitatea":"orientabilitate","orientabilitati":"orientabilitate","orientabilitatii":"orientabilitate","orientabilul":"orientabil","orientai":"orienta","orientala":["orientală","oriental","orientala","oriental"],"orientale":["orientale","oriental","orientale","orientală"],"orientalei":"orientală","orientalele":["orientalele","oriental","orientalele","orientală"],"orientalelor":"orientală","orientali":"oriental","orientalii":"oriental","orientalismul":"orientalism","orientalismule":"orientalism","orientalismului":"orientalism","orientaliste":"orientalistă","orientalistei":"orientalistă","orientalistele":"orientalistă","orientalistelor":"orientalistă","orientalisti":"orientalist","orientalistici":"orientalistică","orientalisticii":"orientalistică","orientalistii":"orientalist","orientalistilor":"orientalist","orientalistul":"orientalist","orientalistule":"orientalist","orientalistului":"orientalist","orientalizai":"orientaliza","orientalizam":["orientalizăm","orientaliza","orientalizam","orientaliza"],"orientalizand":"orientaliza","orientalizara":"orientaliza","orientalizaram":"orientaliza","orientalizarati":"orientaliza","orientalizase":"orientaliza","orientalizasem":"orientaliza","orientalizasera":"orientaliza","orientalizaseram":"orientaliza","orientalizaserati":"orientaliza","orientalizasesi":"orientaliza","orientalizasi":"orientaliza","orientalizat":"orientaliza","orientalizati":"orientaliza","orientalizau":"orientaliza","orientalizeaza":"orientaliza","orientalizez":"orientaliza","orientalizezi":"orientaliza","orientalul":"oriental","orientam":["orientăm","orienta","orientam","orienta"],"orientand":"orienta","orientara":"orienta","orientaram":"orienta","orientarati":"orienta","orientarea":"orientare","orientarea sexuala":"orientare sexuală","orientari":"orientare","orientari sexuale":"orientare sexuală","orientarii":"orientare","orientarii sexuale":"orientare sexuală","orientarile":"orientare","orientarile sexuale":"orientare sexuală","orientarilor":"orientare","orientarilor sexuale":"orientare sexuală","orientase":"orienta","orientasem":"orienta","orientasera":"orienta","orientaseram":"orienta","orientaserati":"orienta","orientasesi":"orienta","orientasi":"orienta","orientat":"orienta","orientata":["orientată","orientat","orientata","orientat"],"orientata pe obiecte":"orientat pe obiecte","orientate":"orientat","orientate pe obiecte":"orientat pe obiecte","orientatele":"orientat","orientati":["orientați","orienta","orientați","orientat"],"orientati pe obiecte":"orientat pe obiecte","orientatia":"orientație","orientatiei":"orientație","orientatii":["orientații","orientat","orientații","orientație"],"orientatiile":"orientație","orientatiilor":"orientație","orientatiunea":"orientațiune","orientatiuni":"orientațiune"};
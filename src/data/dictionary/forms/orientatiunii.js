@@ -0,0 +1 @@
+export default {"orientatiunii":"orientațiune","orientatiunile":"orientațiune","orientatiunilor":"orientațiune","orientativa":["orientativă","orientativ","orientativa","orientativ"],"orientative":"orientativ","orientativele":"orientativ","orientativi":"orientativ","orientativii":"orientativ","orientativul":"orientativ","orientatoare":"orientator","orientatoarea":"orientator","orientatoarele":"orientator","orientatori":"orientator","orientatorii":"orientator","orientatorul":"orientator","orientatul":"orientat","orientau":"orienta","orienteaza":"orienta","orientez":"orienta","orientezi":"orienta","orientul":"orient","orientule":"orient","orientului":"orient","orificii":"orificiu","orificiile":"orificiu","orificiilor":"orificiu","orificiul":"orificiu","orificiule":"orificiu","orificiului":"orificiu","oriflame":"oriflamă","oriflamei":"oriflamă","oriflamele":"oriflamă","oriflamelor":"oriflamă","origina":"origine","originala":["originală","original","originala","original"],"originale":"original","originalele":"original","originali":"original","originalii":"original","originalitatea":"originalitate","originalitati":"originalitate","originalitatii":"originalitate","originalitatile":"originalitate","originalitatilor":"originalitate","originalul":"original","originara":["originară","originar","originara","originar"],"originare":"originar","originarele":"originar","originari":"originar","originarii":"originar","originarul":"originar","origine":"origină","originea":"origine","originei":"origină","originele":"origină","originelor":"origină","origini":"origine","originii":"origine","originile":"origine","originilor":"origine","orii":"oară","orile":"oară","orilor":"oară","orinitofili":"ornitofil","orinitofilii":"ornitofil","orinitofililor":"ornitofil","oripilai":"oripila","oripilam":["oripilăm","oripila","oripilam","oripila"],"oripiland":"oripila","oripilanta":["oripilantă","oripilant","oripilanta","oripilant"],"oripilante":"oripilant","oripilantele":"oripilant","oripilanti":"oripilant","oripilantii":"oripilant","oripilantul":"oripilant","oripilara":"oripila","oripilaram":"oripila","oripilarati":"oripila","oripilarea":"oripilare","oripilarei":"oripilare","oripilase":"oripila","oripilasem":"oripila","oripilasera":"oripila","oripilaseram":"oripila","oripilaserati":"oripila","oripilasesi":"oripila","oripilasi":"oripila","oripilat":"oripila","oripilati":"oripila","oripilatia":"oripilație","oripilatiei":"oripilație","oripilatii":"oripilație","oripilatiile":"oripilație","oripilatiilor":"oripilație","oripilatiunea":"oripilațiune","oripilatiuni":"oripilațiune","oripilatiunii":"oripilațiune","oripilatiunile":"oripilațiune","oripilatiunilor":"oripilațiune","oripilau":"oripila","oripileaza":"oripila","oripilez":"oripila","oripilezi":"oripila","orisicui":"orișicine","orizoane":"orizon","orizoanele":"orizon","orizoanelor":"orizon","orizon":"orizont","orizontala":["orizontală","orizontal","orizontala","orizontal"],"orizontale":["orizontale","orizontal","orizontale","orizontală"],"orizontalei":"orizontală","orizontalele":["orizontalele","orizontal","orizontalele","orizontală"],"orizontalelor":"orizontală","orizontali":"orizontal","orizontalii":"orizontal","orizontalitatea":"orizontalitate","orizontalitati":"orizontalitate","orizontalitatii":"orizontalitate","orizontalitatile":"orizontalitate","orizontalitatilor":"orizontalitate","orizontalizai":"orizontaliza","orizontalizam":["orizontalizăm","orizontaliza","orizontalizam","orizontaliza"],"orizontalizand":"orizontaliza","orizontalizara":"orizontaliza","orizontalizaram":"orizontaliza","orizontalizarati":"orizontaliza","orizontalizarea":"orizontalizare","orizontalizari":"orizontalizare","orizontalizarii":"orizontalizare","orizontalizarile":"orizontalizare","orizontalizarilor":"orizontalizare","orizontalizase":"orizontaliza","orizontalizasem":"orizontaliza","orizontalizasera":"orizontaliza","orizontalizaseram":"orizontaliza","orizontalizaserati":"orizontaliza","orizontalizasesi":"orizontaliza","orizontalizasi":"orizontaliza","orizontalizat":"orizontaliza","orizontalizati":"orizontaliza","orizontalizau":"orizontaliza","orizontalizeaza":"orizontaliza","orizontalizez":"orizontaliza","orizontalizezi":"orizontaliza","orizontalul":"orizontal","orizonteul":"orizonte","orizonteule":"orizonte","orizonteului":"orizonte","orizontul":"orizont","orizontule":"orizont","orizontului":"orizont","orizonturi":"orizont","orizonturile":"orizont","orizonturilor":"orizont","orizonul":"orizon","orizonule":"orizon","orizonului":"orizon","orjadul":"orjad","orjadule":"orjad","orjadului":"orjad","orlonul":"orlon","orlonule":"orlon","orlonului":"orlon","ornai":"orna","ornam":["ornăm","orna","ornam","orna"],"ornamentai":"ornamenta","ornamentala":["ornamentală","ornamental","ornamentala","ornamental"],"ornamentale":"ornamental","ornamentalele":"ornamental","ornamentali":"ornamental","ornamentalii":"ornamental","ornamentalul":"ornamental","ornamentam":["ornamentăm","ornamenta","ornamentam","ornamenta"],"ornamentand":"ornamenta","ornamentara":"ornamenta","ornamentaram":"ornamenta","ornamentarati":"ornamenta","ornamentarea":"ornamentare","ornamentari":"ornamentare","ornamentarii":"ornamentare","ornamentarile":"ornamentare","ornamentarilor":"ornamentare","ornamentase":"ornamenta","ornamentasem":"ornamenta","ornamentasera":"ornamenta","ornamentaseram":"ornamenta","ornamentaserati":"ornamenta","ornamentasesi":"ornamenta","ornamentasi":"ornamenta","ornamentat":"ornamenta","ornamentati":"ornamenta","ornamentatia":"ornamentație","ornamentatiei":"ornamentație","ornamentatii":"ornamentație","ornamentatiile":"ornamentație","ornamentatiilor":"ornamentație","ornamentatiunea":"ornamentațiune","ornamentatiuni":"ornamentațiune","ornamentatiunii":"ornamentațiune","ornamentatiunile":"ornamentațiune","ornamentatiunilor":"ornamentațiune","ornamentau":"ornamenta","ornamente":"ornament","ornamenteaza":"ornamenta","ornamentele":"ornament","ornamentelor":"ornament","ornamentez":"ornamenta","ornamentezi":"ornamenta","ornamentice":"ornamentică","ornamenticei":"ornamentică","ornamentiste":"ornamentistă","ornamentistei":"ornamentistă","ornamentistele":"ornamentistă","ornamentistelor":"ornamentistă","ornamentisti":"ornamentist","ornamentistii":"ornamentist","ornamentistilor":"ornamentist","ornamentistul":"ornamentist","ornamentistule":"ornamentist","ornamentistului":"ornamentist","ornamentul":"ornament","ornamentule":"ornament","ornamentului":"ornament","ornand":"orna","ornara":"orna","ornaram":"orna","ornarati":"orna","ornarea":"ornare","ornarei":"ornare","ornase":"orna","ornasem":"orna","ornasera":"orna","ornaseram":"orna","ornaserati":"orna","ornasesi":"orna","ornasi":"orna","ornat":"orna","ornata":["ornată","ornat","ornata","ornat"],"ornate":"ornat","ornatele":"ornat","ornati":["ornați","orna","ornați","ornat"],"ornatii":"ornat","ornatul":"ornat","ornau":"orna","orneaza":"orna","ornez":"orna","ornezi":"orna","ornicaria":"ornicărie","ornicariei":"ornicărie","ornicarii":"ornicărie","ornice":"ornic","ornicele":"ornic","ornicelor":"ornic","ornicul":"ornic","ornicule":"ornic","ornicului":"ornic","ornitofaune":"ornitofaună","ornitofaunei":"ornitofaună","ornitofaunele":"ornitofaună","ornitofaunelor":"ornitofaună","ornitofile":"ornitofilă","ornitofilei":"ornitofilă","ornitofilele":"ornitofilă","ornitofilelor":"ornitofilă","ornitofilia":"ornitofilie","ornitofiliei":"ornitofilie","ornitofilii":"ornitofilie","ornitofiliile":"ornitofilie","ornitofiliilor":"ornitofilie","ornitofilul":"ornitofil","ornitofilule":"ornitofil","ornitofilului":"ornitofil","ornitogeografia":"ornitogeografie","ornitogeografiei":"ornitogeografie","ornitogeografii":"ornitogeografie","ornitogeografiile":"ornitogeografie","ornitogeografiilor":"ornitogeografie","ornitologe":"ornitologă","ornitologei":"ornitologă","ornitologele":"ornitologă","ornitologelor":"ornitologă","ornitologi":"ornitolog","ornitologia":"ornitologie","ornitologica":["ornitologică","ornitologic","ornitologica","ornitologic"],"ornitologice":"ornitologic","ornitologicele":"ornitologic","ornitologici":"ornitologic","ornitologicii":"ornitologic","ornitologicul":"ornitologic","ornitologiei":"ornitologie","ornitologii":["ornitologii","ornitolog","ornitologii","ornitologie"],"ornitologilor":"ornitolog","ornitologiste":"ornitologistă","ornitologistei":"ornitologistă","ornitologistele":"ornitologistă","ornitologistelor":"ornitologistă","ornitologisti":"ornitologist","ornitologistii":"ornitologist","ornitologistilor":"ornitologist","ornitologistul":"ornitologist","ornitologistule":"ornitologist","ornitologistului":"ornitologist","ornitologul":"ornitolog","ornitologule":"ornitolog","ornitologului":"ornitolog","ornitomantia":"ornitomanție","ornitomantiei":"ornitomanție","ornitomantii":"ornitomanție","ornitomantiile":"ornitomanție","ornitomantiilor":"ornitomanție","ornitoptere":"ornitopter","ornitopterele":"ornitopter","ornitopterelor":"ornitopter","ornitopterul":"ornitopter","ornitopterule":"ornitopter","ornitopterului":"ornitopter","ornitorinci":"ornitorinc","ornitorincii":"ornitorinc","ornitorincilor":"ornitorinc","ornitorincul":"ornitorinc","ornitorincule":"ornitorinc","ornitorincului":"ornitorinc","ornitoze":"ornitoză","ornitozei":"ornitoză","ornitozele":"ornitoză","ornitozelor":"ornitoză","orofita":["orofită","orofit","orofita","orofit"],"orofite":"orofit","orofitele":"orofit","orofiti":"orofit","orofitii":"orofit","orofitul":"orofit","orogene":"orogen","orogenele":"orogen","orogenelor":"orogen","orogenetica":["orogenetică","orogenetic","orogenetica","orogenetic"],"orogenetice":"orogenetic","orogeneticele":"orogenetic","orogenetici":"orogenetic","orogeneticii":"orogenetic","orogeneticul":"orogenetic","orogeneze":"orogeneză","orogenezei":"orogeneză","orogenezele":"orogeneză","orogenezelor":"orogeneză","orogenia":"orogenie","orogenica":["orogenică","orogenic","orogenica","orogenic"],"orogenice":"orogenic","orogenicele":"orogenic","orogenici":"orogenic","orogenicii":"orogenic","orogenicul":"orogenic","orogeniei":"orogenie","orogenii":"orogenie","orogenul":"orogen","orogenule":"orogen","orogenului":"orogen","orografe":"orografă","orografei":"orografă","orografele":"orografă","orografelor":"orografă","orografi":"orograf","orografia":"orografie","orografica":["orografică","orografic","orografica","orografic"],"orografice":"orografic","orograficele":"orografic","orografici":"orografic","orograficii":"orografic","orograficul":"orografic","orografiei":"orografie","orografii":["orografii","orograf","orografii","orografie"],"orografilor":"orograf","orograful":"orograf","orografule":"orograf","orografului":"orograf","orologeria":"orologerie","orologeriei":"orologerie","orologerii":"orologerie","orologeriile":"orologerie","orologeriilor":"orologerie","orologhioane":"orologhion","orologhioanele":"orologhion","orologhioanelor":"orologhion","orologhionul":"orologhion","orologhionule":"orologhion","orologhionului":"orologhion","orologieri":"orologier","orologierii":"orologier","orologierilor":"orologier","orologierul":"orologier","orologierule":"orologier","orologierului":"orologier","orologii":"orologiu","orologiile":"orologiu","orologiilor":"orologiu","orologiul":"orologiu","orologiule":"orologiu","orologiului":"orologiu","orometria":"orometrie","orometriei":"orometrie","orometrii":"orometrie","oronimia":"oronimie","oronimiei":"oronimie","oronimii":"oronimie","oropsea":"oropsi","oropseai":"oropsi","oropseam":"oropsi","oropseati":"oropsi","oropseau":"oropsi","oropsele":"oropseală","oropselei":"oropseală","oropselele":"oropseală","oropselelor":"oropseală","oropseli":"oropseală","oropsesc":"oropsi","oropseste":"oropsi","oropsesti":"oropsi","oropsii":"oropsi","oropsim":"oropsi","oropsind":"oropsi","oropsira":"oropsi","oropsiram":"oropsi","oropsirati":"oropsi","oropsirea":"oropsire","oropsiri":"oropsire","oropsirii":"oropsire","oropsirile":"oropsire","oropsirilor":"oropsire","oropsise":"oropsi","oropsisem":"oropsi","oropsisera":"oropsi","oropsiseram":"oropsi","oropsiserati":"oropsi","oropsisesi":"oropsi","oropsisi":"oropsi","oropsit":"oropsi","oropsita":["oropsită","oropsit","oropsita","oropsit"],"oropsite":"oropsit","oropsitele":"oropsit","oropsiti":["oropsiți","oropsi","oropsiți","oropsit"],"oropsitii":"oropsit","oropsitul":"oropsit","orori":"oroare","orpimentul":"orpiment","orpimentule":"orpiment","orpimentului":"orpiment","orsoveana":["orșoveană","orșovean","orșoveana","orșovean"],"orsoveanul":"orșovean","orsoveanule":"orșovean","orsoveanului":"orșovean","orsovence":"orșoveancă","orsovencei":"orșoveancă","orsovencele":"orșoveancă","orsovencelor":"orșoveancă","orsovene":"orșovean","orsovenele":"orșovean","orsoveni":"orșovean","orsovenii":"orșovean","orsovenilor":"orșovean","ortacea":"ortăci","ortaceai":"ortăci","ortaceam":"ortăci","ortaceati":"ortăci","ortaceau":"ortăci","ortacesc":"ortăci","ortaceste":"ortăci","ortacesti":"ortăci","ortaci":"ortac","ortacia":"ortăcie","ortaciei":"ortăcie","ortacii":["ortacii","ortac","ortăcii","ortăci","ortăcii","ortăcie"],"ortaciile":"ortăcie","ortaciilor":"ortăcie","ortacilor":"ortac","ortacim":"ortăci","ortacind":"ortăci","ortacira":"ortăci","ortaciram":"ortăci","ortacirati":"ortăci","ortacise":"ortăci","ortacisem":"ortăci","ortacisera":"ortăci","ortaciseram":"ortăci","ortaciserati":"ortăci","ortacisesi":"ortăci","ortacisi":"ortăci","ortacit":"ortăci","ortaciti":"ortăci","ortacul":"ortac","ortacule":"ortac","ortacului":"ortac","ortasi":"ortaș","ortasii":"ortaș","ortasilor":"ortaș","ortasul":"ortaș","ortasule":"ortaș","ortasului":"ortaș","orti":"ort","ortica":["ortică","ortic","ortica","ortic"],"ortice":"ortic","orticele":"ortic","ortici":"ortic","orticii":"ortic","orticonoscoape":"orticonoscop","orticonoscoapele":"orticonoscop","orticonoscoapelor":"orticonoscop","orticonoscopul":"orticonoscop","orticonoscopule":"orticonoscop","orticonoscopului":"orticonoscop","orticul":"ortic","ortii":"ort","ortilor":"ort","ortocentre":"ortocentru","ortocentrele":"ortocentru","ortocentrelor":"ortocentru","ortocentrica":["ortocentrică","ortocentric","ortocentrica","ortocentric"],"ortocentrice":"ortocentric","ortocentricele":"ortocentric","ortocentrici":"ortocentric","ortocentricii":"ortocentric","ortocentricul":"ortocentric","ortocentrul":"ortocentru","ortocentrule":"ortocentru","ortocentrului":"ortocentru","ortocerasi":"ortoceras","ortocerasii":"ortoceras","ortocerasilor":"ortoceras","ortocerasul":"ortoceras","ortocerasule":"ortoceras","ortocerasului":"ortoceras","ortoclazul":"ortoclaz","ortoclazule":"ortoclaz","ortoclazului":"ortoclaz","ortocromatica":["ortocromatică","ortocromatic","ortocromatica","ortocromatic"],"ortocromatice":"ortocromatic","ortocromaticele":"ortocromatic","ortocromatici":"ortocromatic","ortocromaticii":"ortocromatic","ortocromaticul":"ortocromatic","ortocromatisme":"ortocromatism","ortocromatismele":"ortocromatism","ortocromatismelor":"ortocromatism","ortocromatismul":"ortocromatism","ortocromatismule":"ortocromatism","ortocromatismului":"ortocromatism","ortodiagonala":["ortodiagonală","ortodiagonal","ortodiagonala","ortodiagonal"],"ortodiagonale":"ortodiagonal","ortodiagonalele":"ortodiagonal","ortodiagonali":"ortodiagonal","ortodiagonalii":"ortodiagonal","ortodiagonalul":"ortodiagonal","ortodiagrafia":"ortodiagrafie","ortodiagrafiei":"ortodiagrafie","ortodiagrafii":"ortodiagrafie","ortodiagrafiile":"ortodiagrafie","ortodiagrafiilor":"ortodiagrafie","ortodiagrame":"ortodiagramă","ortodiagramei":"ortodiagramă","ortodiagramele":"ortodiagramă","ortodiagramelor":"ortodiagramă","ortodocsi":"ortodox","ortodocsii":"ortodox","ortodocsilor":"ortodox","ortodontia":"ortodonție","ortodontica":["ortodontică","ortodontic","ortodontica","ortodontic"],"ortodontice":"ortodontic","ortodonticele":"ortodontic","ortodontici":"ortodontic","ortodonticii":"ortodontic","ortodonticul":"ortodontic","ortodontiei":"ortodonție","ortodontii":"ortodonție","ortodontiile":"ortodonție","ortodontiilor":"ortodonție","ortodontologia":"ortodontologie","ortodontologiei":"ortodontologie","ortodontologii":"ortodontologie","ortodontologiile":"ortodontologie","ortodontologiilor":"ortodontologie","ortodoxa":["ortodoxă","ortodox","ortodoxa","ortodox"],"ortodoxe":"ortodox","ortodoxele":"ortodox","ortodoxia":"ortodoxie","ortodoxiei":"ortodoxie","ortodoxii":"ortodoxie","ortodoxisme":"ortodoxism","ortodoxismele":"ortodoxism","ortodoxismelor":"ortodoxism","ortodoxismul":"ortodoxism","ortodoxismule":"ortodoxism","ortodoxismului":"ortodoxism","ortodoxista":["ortodoxistă","ortodoxist","ortodoxista","ortodoxist"],"ortodoxiste":["ortodoxiste","ortodoxist","ortodoxiste","ortodoxistă"],"ortodoxistei":"ortodoxistă","ortodoxistele":["ortodoxistele","ortodoxist","ortodoxistele","ortodoxistă"],"ortodoxistelor":"ortodoxistă","ortodoxisti":"ortodoxist","ortodoxistii":"ortodoxist","ortodoxistilor":"ortodoxist","ortodoxistul":"ortodoxist","ortodoxistule":"ortodoxist","ortodoxistului":"ortodoxist","ortodoxul":"ortodox","ortodoxule":"ortodox","ortodoxului":"ortodox","ortodromica":["ortodromică","ortodromic","ortodromica","ortodromic"],"ortodromice":"ortodromic","ortodromicele":"ortodromic","ortodromici":"ortodromic","ortodromicii":"ortodromic","ortodromicul":"ortodromic","ortoedrica":["ortoedrică","ortoedric","ortoedrica","ortoedric"],"ortoedrice":"ortoedric","ortoedricele":"ortoedric","ortoedrici":"ortoedric","ortoedricii":"ortoedric","ortoedricul":"ortoedric","ortoepica":["ortoepică","ortoepic","ortoepica","ortoepic"],"ortoepice":"ortoepic","ortoepicele":"ortoepic","ortoepici":"ortoepic","ortoepicii":"ortoepic","ortoepicul":"ortoepic","ortofonia":"ortofonie","ortofoniei":"ortofonie","ortofonii":"ortofonie","ortofoniile":"ortofonie","ortofoniilor":"ortofonie","ortoforia":"ortoforie","ortoforiei":"ortoforie","ortoforii":"ortoforie","ortoforiile":"ortoforie","ortoforiilor":"ortoforie","ortofosforica":["ortofosforică","ortofosforic","ortofosforica","ortofosforic"],"ortofosforice":"ortofosforic","ortofosforicele":"ortofosforic","ortofosforici":"ortofosforic","ortofosforicii":"ortofosforic","ortofosforicul":"ortofosforic","ortogeneze":"ortogeneză","ortogenezei":"ortogeneză","ortogenezele":"ortogeneză","ortogenezelor":"ortogeneză","ortogenia":"ortogenie","ortogeniei":"ortogenie","ortogenii":"ortogenie","ortogeniile":"ortogenie","ortogeniilor":"ortogenie","ortogonala":["ortogonală","ortogonal","ortogonala","ortogonal"],"ortogonale":"ortogonal","ortogonalele":"ortogonal","ortogonali":"ortogonal","ortogonalii":"ortogonal","ortogonalitatea":"ortogonalitate","ortogonalitati":"ortogonalitate","ortogonalitatii":"ortogonalitate","ortogonalitatile":"ortogonalitate","ortogonalitatilor":"ortogonalitate","ortogonalizarea":"ortogonalizare","ortogonalizari":"ortogonalizare","ortogonalizarii":"ortogonalizare","ortogonalul":"ortogonal","ortografi":"ortograf","ortografia":"ortografie","ortografiai":"ortografia","ortografiam":"ortografia","ortografiara":"ortografia","ortografiaram":"ortografia","ortografiarati":"ortografia","ortografiase":"ortografia","ortografiasem":"ortografia","ortografiasera":"ortografia","ortografiaseram":"ortografia","ortografiaserati":"ortografia","ortografiasesi":"ortografia","ortografiasi":"ortografia","ortografiat":"ortografia","ortografiati":"ortografia","ortografiau":"ortografia","ortografiaza":"ortografia","ortografica":["ortografică","ortografic","ortografica","ortografic"],"ortografice":"ortografic","ortograficele":"ortografic","ortografici":"ortografic","ortograficii":"ortografic","ortograficul":"ortografic","ortografie":"ortografia","ortografieaza":"ortografia","ortografiei":"ortografie","ortografiem":"ortografia","ortografierea":"ortografiere","ortografieri":"ortografiere","ortografierii":"ortografiere","ortografierile":"ortografiere","ortografierilor":"ortografiere","ortografiez":"ortografia","ortografiezi":"ortografia","ortografii":["ortografii","ortograf","ortografii","ortografie"],"ortografiile":"ortografie","ortografiilor":"ortografie","ortografiind":"ortografia","ortografilor":"ortograf","ortograful":"ortograf","ortografule":"ortograf","ortografului":"ortograf","ortohidrogenul":"ortohidrogen","ortohidrogenule":"ortohidrogen","ortohidrogenului":"ortohidrogen","ortolani":"ortolan","ortolanii":"ortolan","ortolanilor":"ortolan","ortolanul":"ortolan","ortolanule":"ortolan","ortolanului":"ortolan","ortologia":"ortologie","ortologiei":"ortologie","ortologii":"ortologie","ortologiile":"ortologie","ortologiilor":"ortologie","ortomana":["ortomană","ortoman","ortomana","ortoman"],"ortomane":"ortoman","ortomanele":"ortoman","ortomani":"ortoman","ortomanii":"ortoman","ortomanul":"ortoman","ortopedagogia":"ortopedagogie","ortopedagogiei":"ortopedagogie","ortopedagogii":"ortopedagogie","ortopedagogiile":"ortopedagogie","ortopedagogiilor":"ortopedagogie","ortopede":"ortopedă","ortopedei":"ortopedă","ortopedele":"ortopedă","ortopedelor":"ortopedă","ortopedia":"ortopedie","ortopedica":["ortopedică","ortopedic","ortopedica","ortopedic"],"ortopedice":"ortopedic","ortopedicele":"ortopedic","ortopedici":"ortopedic","ortopedicii":"ortopedic","ortopedicul":"ortopedic","ortopediei":"ortopedie","ortopedii":"ortopedie","ortopediste":"ortopedistă","ortopedistei":"ortopedistă","ortopedistele":"ortopedistă","ortopedistelor":"ortopedistă","ortopedisti":"ortopedist","ortopedistii":"ortopedist","ortopedistilor":"ortopedist","ortopedistul":"ortopedist","ortopedistule":"ortopedist","ortopedistului":"ortopedist","ortopedul":"ortoped","ortopedule":"ortoped","ortopedului":"ortoped","ortopezi":"ortoped","ortopezii":"ortoped","ortopezilor":"ortoped","ortopneea":"ortopnee","ortopneei":"ortopnee","ortoptere":"ortopter","ortopterele":"ortopter","ortopterelor":"ortopter","ortopterul":"ortopter","ortopterule":"ortopter","ortopterului":"ortopter","ortoptica":["ortoptică","ortoptic","ortoptica","ortoptic"],"ortoptice":["ortoptice","ortoptic","ortoptice","ortoptică"],"ortopticei":"ortoptică","ortopticele":["ortopticele","ortoptic","ortopticele","ortoptică"],"ortopticelor":"ortoptică","ortoptici":"ortoptic","ortopticii":"ortoptic","ortopticul":"ortoptic","ortorombica":["ortorombică","ortorombic","ortorombica","ortorombic"],"ortorombice":"ortorombic","ortorombicele":"ortorombic","ortorombici":"ortorombic","ortorombicii":"ortorombic","ortorombicul":"ortorombic","ortoscopia":"ortoscopie","ortoscopica":["ortoscopică","ortoscopic","ortoscopica","ortoscopic"],"ortoscopice":"ortoscopic","ortoscopicele":"ortoscopic","ortoscopici":"ortoscopic","ortoscopicii":"ortoscopic","ortoscopicul":"ortoscopic","ortoscopiei":"ortoscopie","ortoscopii":"ortoscopie","ortosimpatica":["ortosimpatică","ortosimpatic","ortosimpatica","ortosimpatic"],"ortosimpatice":"ortosimpatic","ortosimpaticele":"ortosimpatic","ortosimpatici":"ortosimpatic","ortosimpaticii":"ortosimpatic","ortosimpaticul":"ortosimpatic","ortostatica":["ortostatică","ortostatic","ortostatica","ortostatic"],"ortostatice":"ortostatic","ortostaticele":"ortostatic","ortostatici":"ortostatic","ortostaticii":"ortostatic","ortostaticul":"ortostatic","ortostatisme":"ortostatism","ortostatismele":"ortostatism","ortostatismelor":"ortostatism","ortostatismul":"ortostatism","ortostatismule":"ortostatism","ortostatismului":"ortostatism","ortotonusul":"ortotonus","ortotonusule":"ortotonus","ortotonusului":"ortotonus","ortotonusuri":"ortotonus","ortotonusurile":"ortotonus","ortotonusurilor":"ortotonus","ortotropia":"ortotropie","ortotropica":["ortotropică","ortotropic","ortotropica","ortotropic"],"ortotropice":"ortotropic","ortotropicele":"ortotropic","ortotropici":"ortotropic","ortotropicii":"ortotropic","ortotropicul":"ortotropic","ortotropiei":"ortotropie","ortotropii":"ortotropie","ortoze":"ortoză","ortozei":"ortoză","ortozele":"ortoză","ortozelor":"ortoză","ortul":"ort","ortule":"ort","ortului":"ort","orvosagul":"orvosag","orvosagule":"orvosag","orvosagului":"orvosag","orvosaguri":"orvosag","orvosagurile":"orvosag","orvosagurilor":"orvosag","orzare":"orzar","orzarei":"orzar","orzarelor":"orzar","orzarii":"orzărie","orzarul":"orzar","orzarule":"orzar","orzarului":"orzar","orzisore":"orzișor","orzisorele":"orzișor","orzisorelor":"orzișor","orzisorul":"orzișor","orzisorule":"orzișor","orzisorului":"orzișor","orzistea":"orziște","orzisti":"orziște","orzistii":"orziște","orzistile":"orziște","orzistilor":"orziște","orzoaia":"orzoaie","orzoaice":"orzoaică","orzoaicei":"orzoaică","orzoaiei":"orzoaie","orzoaii":"orzoaie","orzul":"orz","orzule":"orz","orzulete":"orzișor","orzuletul":"orzuleț","orzuletule":"orzuleț","orzuletului":"orzuleț","orzului":"orz","orzuri":"orz","orzurile":"orz","orzurilor":"orz","osambre":"osâmbri","osambrea":"osâmbri","osambreai":"osâmbri","osambream":"osâmbri","osambreati":"osâmbri","osambreau":"osâmbri","osambrie":"osâmbri","osambrii":"osâmbri","osambrim":"osâmbri","osambrind":"osâmbri","osambrira":"osâmbri","osambriram":"osâmbri","osambrirati":"osâmbri","osambrise":"osâmbri","osambrisem":"osâmbri","osambrisera":"osâmbri","osambriseram":"osâmbri","osambriserati":"osâmbri","osambrisesi":"osâmbri","osambrisi":"osâmbri","osambrit":"osâmbri","osambriti":"osâmbri","osambru":"osâmbri","osame":"osamă","osamei":"osamă","osanale":"osana","osanalei":"osana","osanalele":"osana","osanalelor":"osana","osanaua":"osana","osande":"osândă","osandea":"osândi","osandeai":"osândi","osandeam":"osândi","osandeati":"osândi","osandeau":"osândi","osandei":"osândă","osandele":"osândă","osandelor":"osândă","osandesc":"osândi","osandeste":"osândi","osandesti":"osândi","osandii":"osândi","osandim":"osândi","osandind":"osândi","osandira":"osândi","osandiram":"osândi","osandirati":"osândi","osandirea":"osândire","osandiri":"osândire","osandirii":"osândire","osandirile":"osândire","osandirilor":"osândire","osandise":"osândi","osandisem":"osândi","osandisera":"osândi","osandiseram":"osândi","osandiserati":"osândi","osandisesi":"osândi","osandisi":"osândi","osandit":"osândi","osandita":["osândită","osândit","osândita","osândit"],"osandite":"osândit","osanditele":"osândit","osanditi":["osândiți","osândi","osândiți","osândit"],"osanditii":"osândit","osanditoare":"osânditor","osanditoarea":"osânditor","osanditoarele":"osânditor","osanditori":"osânditor","osanditorii":"osânditor","osanditorul":"osânditor","osanditul":"osândit","osanze":"osânză","osanzei":"osânză","osanzele":"osânză","osanzelor":"osânză","osardii":"osârdie","osardnica":["osârdnică","osârdnic","osârdnica","osârdnic"],"osardnice":"osârdnic","osardnicea":"osârdnici","osardniceai":"osârdnici","osardniceam":"osârdnici","osardniceati":"osârdnici","osardniceau":"osârdnici","osardnicele":"osârdnic","osardnicesc":"osârdnici","osardniceste":"osârdnici","osardnicesti":"osârdnici","osardnici":"osârdnic","osardnicia":"osârdnicie","osardniciei":"osârdnicie","osardnicii":["osârdnicii","osârdnic","osârdnicii","osârdnici","osârdnicii","osârdnicie"],"osardniciile":"osârdnicie","osardniciilor":"osârdnicie","osardnicim":"osârdnici","osardnicind":"osârdnici","osardnicira":"osârdnici","osardniciram":"osârdnici","osardnicirati":"osârdnici","osardnicise":"osârdnici","osardnicisem":"osârdnici","osardnicisera":"osârdnici","osardniciseram":"osârdnici","osardniciserati":"osârdnici","osardnicisesi":"osârdnici","osardnicisi":"osârdnici","osardnicit":"osârdnici","osardniciti":"osârdnici","osardnicul":"osârdnic","osarduinte":"osârduință","osarduintei":"osârduință","osarduintele":"osârduință","osarduintelor":"osârduință","osarduirea":"osârduire","osarduiri":"osârduire","osarduirii":"osârduire","osarduirile":"osârduire","osarduirilor":"osârduire","osaria":"osărie","osariei":"osărie","osarii":"osărie","osariile":"osărie","osariilor":"osărie","osature":"osatură","osaturei":"osatură","osaturele":"osatură","osaturelor":"osatură","osaturi":"osatură","osce":"oscă","oscei":"oscă","oscele":"oscă","oscelor":"oscă","osci":"osc","oscii":"osc","oscilai":"oscila","oscilam":["oscilăm","oscila","oscilam","oscila"],"osciland":"oscila","oscilanta":["oscilantă","oscilant","oscilanta","oscilant"],"oscilante":"oscilant","oscilantele":"oscilant","oscilanti":"oscilant","oscilantii":"oscilant","oscilantul":"oscilant","oscilara":"oscila","oscilaram":"oscila","oscilarati":"oscila","oscilarea":"oscilare","oscilari":"oscilare","oscilarii":"oscilare","oscilarile":"oscilare","oscilarilor":"oscilare","oscilase":"oscila","oscilasem":"oscila","oscilasera":"oscila","oscilaseram":"oscila","oscilaserati":"oscila","oscilasesi":"oscila","oscilasi":"oscila","oscilat":"oscila","oscilati":"oscila","oscilatia":"oscilație","oscilatiei":"oscilație","oscilatii":"oscilație","oscilatiile":"oscilație","oscilatiilor":"oscilație","oscilatiunea":"oscilațiune","oscilatiuni":"oscilațiune","oscilatiunii":"oscilațiune","oscilatiunile":"oscilațiune","oscilatiunilor":"oscilațiune","oscilatoare":"oscilator","oscilatoare armonice":"oscilator armonic","oscilatoarele":"oscilator","oscilatoarelor":"oscilator","oscilatoria":"oscilatoriu","oscilatorie":"oscilatoriu","oscilatorii":"oscilatoriu","oscilatoriii":"oscilatoriu","oscilatoriile":"oscilatoriu","oscilatoriul":"oscilatoriu","oscilatorul":"oscilator","oscilatorule":"oscilator","oscilatorului":"oscilator","oscilau":"oscila","oscileaza":"oscila","oscilez":"oscila","oscilezi":"oscila","oscilografe":"oscilograf","oscilografele":"oscilograf","oscilografelor":"oscilograf","oscilografia":"oscilografie","oscilografiei":"oscilografie","oscilografii":"oscilografie","oscilografiile":"oscilografie","oscilografiilor":"oscilografie","oscilograful":"oscilograf","oscilografule":"oscilograf","oscilografului":"oscilograf","oscilograme":"oscilogramă","oscilogramei":"oscilogramă","oscilogramele":"oscilogramă","oscilogramelor":"oscilogramă","oscilometre":"oscilometru","oscilometrele":"oscilometru","oscilometrelor":"oscilometru","oscilometria":"oscilometrie","oscilometriei":"oscilometrie","oscilometrii":"oscilometrie","oscilometriile":"oscilometrie","oscilometriilor":"oscilometrie","oscilometrul":"oscilometru","oscilometrule":"oscilometru","oscilometrului":"oscilometru","oscilor":"osc","osciloscoape":"osciloscop","osciloscoapele":"osciloscop","osciloscoapelor":"osciloscop","osciloscopul":"osciloscop","osciloscopule":"osciloscop","osciloscopului":"osciloscop","oscioare":"oscior","oscioarele":"oscior","oscioarelor":"oscior","osciorul":"oscior","osciorule":"oscior","osciorului":"oscior","oscitante":"oscitanță","oscitantei":"oscitanță","oscitantele":"oscitanță","oscitantelor":"oscitanță","oscul":"osc","osculatia":"osculație","osculatiei":"osculație","osculatii":"osculație","osculatiile":"osculație","osculatiilor":"osculație","osculatiunea":"osculațiune","osculatiuni":"osculațiune","osculatiunii":"osculațiune","osculatiunile":"osculațiune","osculatiunilor":"osculațiune","osculatoare":"osculator","osculatoarea":"osculator","osculatoarele":"osculator","osculatori":"osculator","osculatorii":"osculator","osculatorul":"osculator","oscule":"osc","osculi":"oscul","osculii":"oscul","osculilor":"oscul","oscului":"osc","osculul":"oscul","osculule":"oscul","osculului":"oscul","oseanul":"oșean","oseanule":"oșean","oseanului":"oșean","osebea":"osebi","osebeai":"osebi","osebeam":"osebi","osebeati":"osebi","osebeau":"osebi","osebesc":"osebi","osebeste":"osebi","osebesti":"osebi","osebiciunea":"osebiciune","osebiciuni":"osebiciune","osebiciunii":"osebiciune","osebiciunile":"osebiciune","osebiciunilor":"osebiciune","osebii":"osebi","osebim":"osebi","osebind":"osebi","osebira":"osebi","osebiram":"osebi","osebirati":"osebi","osebirea":"osebire","osebiri":"osebire","osebirii":"osebire","osebirile":"osebire","osebirilor":"osebire","osebise":"osebi","osebisem":"osebi","osebisera":"osebi","osebiseram":"osebi","osebiserati":"osebi","osebisesi":"osebi","osebisi":"osebi","osebit":"osebi","osebita":["osebită","osebit","osebita","osebit"],"osebite":"osebit","osebitele":"osebit","osebiti":["osebiți","osebi","osebiți","osebit"],"osebitii":"osebit","osebitoare":"osebitor","osebitoarea":"osebitor","osebitoarele":"osebitor","osebitori":"osebitor","osebitorii":"osebitor","osebitorul":"osebitor","osebitul":"osebit","osebituri":"osebitură","osebiturii":"osebitură","osebiturile":"osebitură","osebiturilor":"osebitură","oseine":"oseină","oseinei":"oseină","oseinele":"oseină","oseinelor":"oseină","oselnici":"oșelnic","oselnicii":"oșelnic","oselnicilor":"oșelnic","oselnicul":"oșelnic","oselnicule":"oșelnic","oselnicului":"oșelnic","osence":"oșeancă","osencei":"oșeancă","osencele":"oșeancă","osencelor":"oșeancă","osene":"oșeană","oseneasca":["oșenească","oșenesc","oșeneasca","oșenesc"],"osenei":"oșeană","osenele":"oșeană","osenelor":"oșeană","osenescul":"oșenesc","osenesti":"oșenesc","osenestii":"oșenesc","osenestile":"oșenesc","oseni":"oșean","osenii":"oșean","osenilor":"oșean","osfestania":"osfeștanie","osfestaniei":"osfeștanie","osfestanii":"osfeștanie","osfestaniile":"osfeștanie","osfestaniilor":"osfeștanie","osfestuia":"osfeștui","osfestuiai":"osfeștui","osfestuiam":"osfeștui","osfestuiati":"osfeștui","osfestuiau":"osfeștui","osfestuiesc":"osfeștui","osfestuieste":"osfeștui","osfestuiesti":"osfeștui","osfestuii":"osfeștui","osfestuim":"osfeștui","osfestuind":"osfeștui","osfestuira":"osfeștui","osfestuiram":"osfeștui","osfestuirati":"osfeștui","osfestuise":"osfeștui","osfestuisem":"osfeștui","osfestuisera":"osfeștui","osfestuiseram":"osfeștui","osfestuiserati":"osfeștui","osfestuisesi":"osfeștui","osfestuisi":"osfeștui","osfestuit":"osfeștui","osfestuiti":"osfeștui","osfintea":"osfinti","osfinteai":"osfinti","osfinteam":"osfinti","osfinteati":"osfinti","osfinteau":"osfinti","osfintele":"osfinteală","osfintelei":"osfinteală","osfintelele":"osfinteală","osfintelelor":"osfinteală","osfinteli":"osfinteală","osfintesc":"osfinti","osfinteste":"osfinti","osfintesti":"osfinti","osfintii":"osfinti","osfintim":"osfinti","osfintind":"osfinti","osfintira":"osfinti","osfintiram":"osfinti","osfintirati":"osfinti","osfintise":"osfinti","osfintisem":"osfinti","osfintisera":"osfinti","osfintiseram":"osfinti","osfintiserati":"osfinti","osfintisesi":"osfinti","osfintisi":"osfinti","osfintit":"osfinti","osfintiti":"osfinti","osia":"osie","osianeasca":["osianească","osianesc","osianeasca","osianesc"],"osianescul":"osianesc","osianesti":"osianesc","osianestii":"osianesc","osianestile":"osianesc","osianica":["osianică","osianic","osianica","osianic"],"osianice":"osianic","osianicele":"osianic","osianici":"osianic","osianicii":"osianic","osianicul":"osianic","osianisme":"osianism","osianismele":"osianism","osianismelor":"osianism","osianismul":"osianism","osianismule":"osianism","osianismului":"osianism","osiei":"osie","osific":"osifica","osificai":"osifica","osificam":["osificăm","osifica","osificam","osifica"],"osificand":"osifica","osificara":"osifica","osificaram":"osifica","osificarati":"osifica","osificarea":"osificare","osificari":"osificare","osificarii":"osificare","osificarile":"osificare","osificarilor":"osificare","osificase":"osifica","osificasem":"osifica","osificasera":"osifica","osificaseram":"osifica","osificaserati":"osifica","osificasesi":"osifica","osificasi":"osifica","osificat":"osifica","osificata":["osificată","osificat","osificata","osificat"],"osificate":"osificat","osificatele":"osificat","osificati":["osificați","osifica","osificați","osificat"],"osificatia":"osificație","osificatiei":"osificație","osificatii":["osificații","osificat","osificații","osificație"],"osificatiile":"osificație","osificatiilor":"osificație","osificatiunea":"osificațiune","osificatiuni":"osificațiune","osificatiunii":"osificațiune","osificatiunile":"osificațiune","osificatiunilor":"osificațiune","osificatul":"osificat","osificau":"osifica","osifici":"osifica","osii":"osie","osiile":"osie","osiilor":"osie","osisoare":"osișor","osisoarele":"osișor","osisoarelor":"osișor","osisorul":"osișor","osisorule":"osișor","osisorului":"osișor","osmane":"osmană","osmaneasca":["osmănească","osmănesc","osmăneasca","osmănesc"],"osmanei":"osmană","osmanele":"osmană","osmanelor":"osmană","osmanescul":"osmănesc","osmanesti":"osmănesc","osmanestii":"osmănesc","osmanestile":"osmănesc","osmani":"osman","osmanica":["osmanică","osmanic","osmanica","osmanic"],"osmanice":"osmanic","osmanicele":"osmanic","osmanici":"osmanic","osmanicii":"osmanic","osmanicul":"osmanic","osmanii":"osman","osmanilor":"osman","osmanlae":"osmanlâu","osmanlaea":"osmanlâu","osmanlaele":"osmanlâu","osmanlai":"osmanlâu","osmanlaii":"osmanlâu","osmanlaul":"osmanlâu","osmanlia":"osmanliu","osmanlie":"osmanliu","osmanlii":"osmanliu","osmanliii":"osmanliu","osmanliile":"osmanliu","osmanliilor":"osmanliu","osmanliul":"osmanliu","osmanliuul":"osmanliu","osmanliuule":"osmanliu","osmanliuului":"osmanliu","osmanul":"osman","osmanule":"osman","osmanului":"osman","osmhidroze":"osmhidroză","osmhidrozei":"osmhidroză","osmhidrozele":"osmhidroză","osmhidrozelor":"osmhidroză","osmiridiul":"osmiridiu","osmiridiule":"osmiridiu","osmiridiului":"osmiridiu","osmiul":"osmiu","osmiule":"osmiu","osmiului":"osmiu","osmoglasnice":"osmoglasnic","osmoglasnicele":"osmoglasnic","osmoglasnicelor":"osmoglasnic","osmoglasnicul":"osmoglasnic","osmoglasnicule":"osmoglasnic","osmoglasnicului":"osmoglasnic","osmologia":"osmologie","osmologiei":"osmologie","osmologii":"osmologie","osmologiile":"osmologie","osmologiilor":"osmologie","osmometre":"osmometru","osmometrele":"osmometru","osmometrelor":"osmometru","osmometria":"osmometrie","osmometrica":["osmometrică","osmometric","osmometrica","osmometric"],"osmometrice":"osmometric","osmometricele":"osmometric","osmometrici":"osmometric","osmometricii":"osmometric","osmometricul":"osmometric","osmometriei":"osmometrie","osmometrii":"osmometrie","osmometriile":"osmometrie","osmometriilor":"osmometrie","osmometrul":"osmometru","osmometrule":"osmometru","osmometrului":"osmometru","osmoreceptori":"osmoreceptor","osmoreceptorii":"osmoreceptor","osmoreceptorilor":"osmoreceptor","osmoreceptorul":"osmoreceptor","osmoreceptorule":"osmoreceptor","osmoreceptorului":"osmoreceptor","osmoreglarea":"osmoreglare","osmoreglari":"osmoreglare","osmoreglarii":"osmoreglare","osmoreglarile":"osmoreglare","osmoreglarilor":"osmoreglare","osmotica":["osmotică","osmotic","osmotica","osmotic"],"osmotice":"osmotic","osmoticele":"osmotic","osmotici":"osmotic","osmoticii":"osmotic","osmoticul":"osmotic","osmoze":"osmoză","osmozei":"osmoză","osmozele":"osmoză","osmozelor":"osmoză","osoasa":["osoasă","osos","osoasa","osos"],"osoase":"osos","osoasele":"osos","ososi":"osos","ososii":"osos","ososul":"osos","ospatai":"ospăta","ospatam":["ospătăm","ospăta","ospătam","ospăta"],"ospatand":"ospăta","ospatara":"ospăta","ospataram":"ospăta","ospatarati":"ospăta","ospatare":"ospătară","ospatarea":"ospătare","ospatareata":["ospătăreață","ospătăreț","ospătăreața","ospătăreț"],"ospatarei":"ospătară","ospatarele":"ospătară","ospatarelor":"ospătară","ospatarese":"ospătăreasă","ospataresei":"ospătăreasă","ospataresele":"ospătăreasă","ospatareselor":"ospătăreasă","ospatarete":"ospătăreț","ospataretele":"ospătăreț","ospatareti":"ospătăreț","ospataretii":"ospătăreț","ospataretul":"ospătăreț","ospatari":["ospătari","ospătar","ospătări","ospătare"],"ospataria":"ospătărie","ospatariei":"ospătărie","ospatarii":["ospătarii","ospătar","ospătării","ospătare","ospătării","ospătărie"],"ospatariile":"ospătărie","ospatariilor":"ospătărie","ospatarile":"ospătare","ospatarilor":["ospătarilor","ospătar","ospătărilor","ospătare"],"ospatarite":"ospătăriță","ospataritei":"ospătăriță","ospataritele":"ospătăriță","ospataritelor":"ospătăriță","ospatarnica":["ospătarnică","ospătarnic","ospătarnica","ospătarnic"],"ospatarnice":"ospătarnic","ospatarnicele":"ospătarnic","ospatarnici":"ospătarnic","ospatarnicii":"ospătarnic","ospatarnicul":"ospătarnic","ospatarul":"ospătar","ospatarule":"ospătar","ospatarului":"ospătar","ospatase":"ospăta","ospatasem":"ospăta","ospatasera":"ospăta","ospataseram":"ospăta","ospataserati":"ospăta","ospatasesi":"ospăta","ospatasi":"ospăta","ospatat":"ospăta","ospatati":"ospăta","ospatatoare":"ospătător","ospatatoarea":["ospătătoarea","ospătătoare","ospătătoarea","ospătător"],"ospatatoarei":"ospătătoare","ospatatoarele":["ospătătoarele","ospătătoare","ospătătoarele","ospătător"],"ospatatoarelor":"ospătătoare","ospatatori":"ospătător","ospatatorii":"ospătător","ospatatorul":"ospătător","ospatatul":"ospătat","ospatatule":"ospătat","ospatatului":"ospătat","ospataturi":"ospătătură","ospataturii":"ospătătură","ospataturile":"ospătătură","ospataturilor":"ospătătură","ospatau":"ospăta","ospateaza":"ospăta","ospatez":"ospăta","ospatezi":"ospăta","ospatoasa":["ospătoasă","ospătos","ospătoasa","ospătos"],"ospatoase":"ospătos","ospatoasele":"ospătos","ospatosi":"ospătos","ospatosii":"ospătos","ospatosul":"ospătos","ospatul":"ospăț","ospatule":"ospăț","ospatului":"ospăț","ospecioii":"ospecioi","ospecioilor":"ospecioi","ospecioiul":"ospecioi","ospecioiule":"ospecioi","ospecioiului":"ospecioi","ospeciori":"ospecior","ospeciorii":"ospecior","ospeciorilor":"ospecior","ospeciorul":"ospecior","ospeciorule":"ospecior","ospeciorului":"ospecior","ospelaria":"ospelărie","ospelariei":"ospelărie","ospelarii":"ospelărie","ospelariile":"ospelărie","ospelariilor":"ospelărie","ospele":"ospel","ospelele":"ospel","ospelelor":"ospel","ospelul":"ospel","ospelule":"ospel","ospelului":"ospel","ospetai":"ospeta","ospetam":["ospetăm","ospeta","ospetam","ospeta"],"ospetand":"ospeta","ospetara":"ospeta","ospetaram":"ospeta","ospetarati":"ospeta","ospetaria":"ospețărie","ospetariei":"ospețărie","ospetarii":"ospețărie","ospetariile":"ospețărie","ospetariilor":"ospețărie","ospetase":"ospeta","ospetasem":"ospeta","ospetasera":"ospeta","ospetaseram":"ospeta","ospetaserati":"ospeta","ospetasesi":"ospeta","ospetasi":"ospeta","ospetat":"ospeta","ospetati":"ospeta","ospetau":"ospeta","ospete":"ospăț","ospeteanul":"ospețean","ospeteanule":"ospețean","ospeteanului":"ospețean","ospeteaza":"ospeta","ospetele":"ospăț","ospetelor":"ospăț","ospeteni":"ospețean","ospetenii":"ospețean","ospetenilor":"ospețean","ospetez":"ospeta","ospetezi":"ospeta","ospetia":"ospeție","ospetiei":"ospeție","ospetii":"ospeție","ospetiile":"ospeție","ospetiilor":"ospeție","ospetimea":"ospețime","ospetimi":"ospețime","ospetimii":"ospețime","ospetirea":"ospețire","ospetiri":"ospețire","ospetirii":"ospețire","ospetirile":"ospețire","ospetirilor":"ospețire","ospicii":"ospiciu","ospiciile":"ospiciu","ospiciilor":"ospiciu","ospiciul":"ospiciu","ospiciule":"ospiciu","ospiciului":"ospiciu","ospitai":"ospita","ospitala":["ospitală","ospital","ospitala","ospital"],"ospitale":"ospital","ospitalele":"ospital","ospitali":"ospital","ospitaliera":["ospitalieră","ospitalier","ospitaliera","ospitalier"],"ospitaliere":"ospitalier","ospitalierele":"ospitalier","ospitalieri":"ospitalier","ospitalierii":"ospitalier","ospitalierul":"ospitalier","ospitalii":"ospital","ospitalitatea":"ospitalitate","ospitalitati":"ospitalitate","ospitalitatii":"ospitalitate","ospitalitatile":"ospitalitate","ospitalitatilor":"ospitalitate","ospitalizata":["ospitalizată","ospitalizat","ospitalizata","ospitalizat"],"ospitalizate":"ospitalizat","ospitalizatele":"ospitalizat","ospitalizati":"ospitalizat","ospitalizatii":"ospitalizat","ospitalizatul":"ospitalizat","ospitalul":"ospital","ospitam":["ospităm","ospita","ospitam","ospita"],"ospitand":"ospita","ospitara":"ospita","ospitaram":"ospita","ospitarati":"ospita","ospitase":"ospita","ospitasem":"ospita","ospitasera":"ospita","ospitaseram":"ospita","ospitaserati":"ospita","ospitasesi":"ospita","ospitasi":"ospita","ospitat":"ospita","ospitati":"ospita","ospitau":"ospita","ospiteaza":"ospita","ospitez":"ospita","ospitezi":"ospita","ostafce":"ostafcă","ostafcei":"ostafcă","ostafcele":"ostafcă","ostafcelor":"ostafcă","ostampea":"ostâmpi","ostampeai":"ostâmpi","ostampeam":"ostâmpi","ostampeati":"ostâmpi","ostampeau":"ostâmpi","ostampesc":"ostâmpi","ostampeste":"ostâmpi","ostampesti":"ostâmpi","ostampii":"ostâmpi","ostampim":"ostâmpi","ostampind":"ostâmpi","ostampira":"ostâmpi","ostampiram":"ostâmpi","ostampirati":"ostâmpi","ostampise":"ostâmpi","ostampisem":"ostâmpi","ostampisera":"ostâmpi","ostampiseram":"ostâmpi","ostampiserati":"ostâmpi","ostampisesi":"ostâmpi","ostampisi":"ostâmpi","ostampit":"ostâmpi","ostampiti":"ostâmpi","ostaseasca":["ostășească","ostășesc","ostășeasca","ostășesc"],"ostasescul":"ostășesc","ostasesti":"ostășesc","ostasestii":"ostășesc","ostasestile":"ostășesc","ostasi":"ostaș","ostasia":"ostășie","ostasiei":"ostășie","ostasii":["ostașii","ostaș","ostășii","ostășie"],"ostasilor":"ostaș","ostasimea":"ostășime","ostasimei":"ostășime","ostasul":"ostaș","ostasule":"ostaș","ostasului":"ostaș","ostateci":"ostatec","ostatecii":"ostatec","ostatecilor":"ostatec","ostatecul":"ostatec","ostatecule":"ostatec","ostatecului":"ostatec","ostatice":"ostatică","ostaticei":"ostatică","ostaticele":"ostatică","ostaticelor":"ostatică","ostatici":"ostatic","ostea":"oști","osteai":"oști","ostealgia":"ostealgie","ostealgiei":"ostealgie","ostealgii":"ostealgie","ostealgiile":"ostealgie","ostealgiilor":"ostealgie","osteam":"oști","osteanul":"oștean","osteanule":"oștean","osteanului":"oștean","osteasca":["oștească","oștesc","oșteasca","oștesc"],"osteati":"oști","osteau":"oști","osteite":"osteită","osteitei":"osteită","osteitele":"osteită","osteitelor":"osteită","ostenea":"osteni","osteneai":"osteni","osteneam":"osteni","osteneasca":["oștenească","oștenesc","oșteneasca","oștenesc"],"osteneati":"osteni","osteneau":"osteni","ostenesc":"osteni","ostenescul":"oștenesc","osteneste":"osteni","ostenesti":["oștenești","oștenesc","ostenești","osteni"],"ostenestii":"oștenesc","ostenestile":"oștenesc","osteni":"oștean","ostenia":"oștenie","ostenicioasa":["ostenicioasă","ostenicios","ostenicioasa","ostenicios"],"ostenicioase":"ostenicios","ostenicioasele":"ostenicios","osteniciosi":"ostenicios","osteniciosii":"ostenicios","osteniciosul":"ostenicios","osteniei":"oștenie","ostenii":["oștenii","oștean","ostenii","osteni","oștenii","oștenie"],"osteniile":"oștenie","osteniilor":"oștenie","ostenilor":"oștean","ostenim":"osteni","ostenind":"osteni","osteninte":"ostenință","ostenintei":"ostenință","ostenintele":"ostenință","ostenintelor":"ostenință","ostenira":"osteni","osteniram":"osteni","ostenirati":"osteni","ostenirea":["ostenirea","ostenire","oștenirea","oștenire"],"osteniri":["osteniri","ostenire","oșteniri","oștenire"],"ostenirii":["ostenirii","ostenire","oștenirii","oștenire"],"ostenirile":"oștenire","ostenirilor":"oștenire","ostenise":"osteni","ostenisem":"osteni","ostenisera":"osteni","osteniseram":"osteni","osteniserati":"osteni","ostenisesi":"osteni","ostenisi":"osteni","ostenit":"osteni","ostenita":["ostenită","ostenit","ostenita","ostenit"],"ostenite":"ostenit","ostenitele":"ostenit","osteniti":["osteniți","osteni","osteniți","ostenit"],"ostenitii":"ostenit","ostenitoare":"ostenitor","ostenitoarea":"ostenitor","ostenitoarele":"ostenitor","ostenitori":"ostenitor","ostenitorii":"ostenitor","ostenitorul":"ostenitor","ostenitul":"ostenit","ostenituri":"ostenitură","osteniturii":"ostenitură","osteniturile":"ostenitură","osteniturilor":"ostenitură","ostensibila":["ostensibilă","ostensibil","ostensibila","ostensibil"],"ostensibile":"ostensibil","ostensibilele":"ostensibil","ostensibili":"ostensibil","ostensibilii":"ostensibil","ostensibilul":"ostensibil","ostensoriuul":"ostensoriu","ostensoriuule":"ostensoriu","ostensoriuului":"ostensoriu","ostentatia":"ostentație","ostentatiei":"ostentație","ostentatii":"ostentație","ostentatiile":"ostentație","ostentatiilor":"ostentație","ostentatiunea":"ostentațiune","ostentatiuni":"ostentațiune","ostentatiunii":"ostentațiune","ostentatiunile":"ostentațiune","ostentatiunilor":"ostentațiune","ostentativa":["ostentativă","ostentativ","ostentativa","ostentativ"],"ostentative":"ostentativ","ostentativele":"ostentativ","ostentativi":"ostentativ","ostentativii":"ostentativ","ostentativul":"ostentativ","ostentatoria":"ostentatoriu","ostentatorie":"ostentatoriu","ostentatorii":"ostentatoriu","ostentatoriii":"ostentatoriu","ostentatoriile":"ostentatoriu","ostentatoriul":"ostentatoriu","osteoame":"osteom","osteoamele":"osteom","osteoamelor":"osteom","osteoartrite":"osteoartrită","osteoartritei":"osteoartrită","osteoartritele":"osteoartrită","osteoartritelor":"osteoartrită","osteoblaste":"osteoblast","osteoblastele":"osteoblast","osteoblastelor":"osteoblast","osteoblastul":"osteoblast","osteoblastule":"osteoblast","osteoblastului":"osteoblast","osteocite":"osteocit","osteocitele":"osteocit","osteocitelor":"osteocit","osteocitul":"osteocit","osteocitule":"osteocit","osteocitului":"osteocit","osteoclaste":"osteoclast","osteoclastele":"osteoclast","osteoclastelor":"osteoclast","osteoclastul":"osteoclast","osteoclastule":"osteoclast","osteoclastului":"osteoclast","osteoclazia":"osteoclazie","osteoclaziei":"osteoclazie","osteoclazii":"osteoclazie","osteoclaziile":"osteoclazie","osteoclaziilor":"osteoclazie","osteocondrite":"osteocondrită","osteocondritei":"osteocondrită","osteocondritele":"osteocondrită","osteocondritelor":"osteocondrită","osteocondroame":"osteocondrom","osteocondroamele":"osteocondrom","osteocondroamelor":"osteocondrom","osteocondromul":"osteocondrom","osteocondromule":"osteocondrom","osteocondromului":"osteocondrom","osteodinia":"osteodinie","osteodiniei":"osteodinie","osteodinii":"osteodinie","osteodiniile":"osteodinie","osteodiniilor":"osteodinie","osteofibroame":"osteofibrom","osteofibroamele":"osteofibrom","osteofibroamelor":"osteofibrom","osteofibromul":"osteofibrom","osteofibromule":"osteofibrom","osteofibromului":"osteofibrom","osteofibroze":"osteofibroză","osteofibrozei":"osteofibroză","osteofibrozele":"osteofibroză","osteofibrozelor":"osteofibroză","osteofite":"osteofit","osteofitele":"osteofit","osteofitelor":"osteofit","osteofitul":"osteofit","osteofitule":"osteofit","osteofitului":"osteofit","osteoflebite":"osteoflebită","osteoflebitei":"osteoflebită","osteoflebitele":"osteoflebită","osteoflebitelor":"osteoflebită","osteofoane":"osteofon","osteofoanele":"osteofon","osteofoanelor":"osteofon","osteofonul":"osteofon","osteofonule":"osteofon","osteofonului":"osteofon","osteogena":["osteogenă","osteogen","osteogena","osteogen"],"osteogene":"osteogen","osteogenele":"osteogen","osteogeneze":"osteogeneză","osteogenezei":"osteogeneză","osteogenezele":"osteogeneză","osteogenezelor":"osteogeneză","osteogeni":"osteogen","osteogenia":"osteogenie","osteogenica":["osteogenică","osteogenic","osteogenica","osteogenic"],"osteogenice":"osteogenic","osteogenicele":"osteogenic","osteogenici":"osteogenic","osteogenicii":"osteogenic","osteogenicul":"osteogenic","osteogeniei":"osteogenie","osteogenii":["osteogenii","osteogen","osteogenii","osteogenie"],"osteogeniile":"osteogenie","osteogeniilor":"osteogenie","osteogenul":"osteogen","osteoida":["osteoidă","osteoid","osteoida","osteoid"],"osteoide":"osteoid","osteoidele":"osteoid","osteoidul":"osteoid","osteoizi":"osteoid","osteoizii":"osteoid","osteoliti":"osteolit","osteolitii":"osteolit","osteolitilor":"osteolit","osteolitul":"osteolit","osteolitule":"osteolit","osteolitului":"osteolit","osteologe":"osteologă","osteologei":"osteologă","osteologele":"osteologă","osteologelor":"osteologă","osteologi":"osteolog","osteologia":"osteologie","osteologica":["osteologică","osteologic","osteologica","osteologic"],"osteologice":"osteologic","osteologicele":"osteologic","osteologici":"osteologic","osteologicii":"osteologic","osteologicul":"osteologic","osteologiei":"osteologie","osteologii":["osteologii","osteolog","osteologii","osteologie"],"osteologilor":"osteolog","osteologul":"osteolog","osteologule":"osteolog","osteologului":"osteolog","osteomalacia":"osteomalacie","osteomalaciei":"osteomalacie","osteomalacii":"osteomalacie","osteomalaciile":"osteomalacie","osteomalaciilor":"osteomalacie","osteomielite":"osteomielită","osteomielitei":"osteomielită","osteomielitele":"osteomielită","osteomielitelor":"osteomielită","osteomul":"osteom","osteomule":"osteom","osteomului":"osteom","osteonecroze":"osteonecroză","osteonecrozei":"osteonecroză","osteonecrozele":"osteonecroză","osteonecrozelor":"osteonecroză","osteopatia":"osteopatie","osteopatiei":"osteopatie","osteopatii":"osteopatie","osteopatiile":"osteopatie","osteopatiilor":"osteopatie","osteoperiostite":"osteoperiostită","osteoperiostitei":"osteoperiostită","osteoperiostitele":"osteoperiostită","osteoperiostitelor":"osteoperiostită","osteoplastia":"osteoplastie","osteoplastiei":"osteoplastie","osteoplastii":"osteoplastie","osteoplastiile":"osteoplastie","osteoplastiilor":"osteoplastie","osteoporoze":"osteoporoză","osteoporozei":"osteoporoză","osteoporozele":"osteoporoză","osteoporozelor":"osteoporoză","osteosarcoame":"osteosarcom","osteosarcoamele":"osteosarcom","osteosarcoamelor":"osteosarcom","osteosarcomul":"osteosarcom","osteosarcomule":"osteosarcom","osteosarcomului":"osteosarcom","osteoscleroze":"osteoscleroză","osteosclerozei":"osteoscleroză","osteosclerozele":"osteoscleroză","osteosclerozelor":"osteoscleroză","osteosinteze":"osteosinteză","osteosintezei":"osteosinteză","osteosintezele":"osteosinteză","osteosintezelor":"osteosinteză","osteotomia":"osteotomie","osteotomiei":"osteotomie","osteotomii":"osteotomie","osteotomiile":"osteotomie","osteotomiilor":"osteotomie","osteotomul":"osteotom","osteotomule":"osteotom","osteotomului":"osteotom","osteotomuri":"osteotom","osteotomurile":"osteotom","osteotomurilor":"osteotom","osteoze":"osteoză","osteozei":"osteoză","osteozele":"osteoză","osteozelor":"osteoză","osteria":"osterie","osteriei":"osterie","osterii":"osterie","osteriile":"osterie","osteriilor":"osterie","ostesc":"oști","ostescul":"oștesc","osteste":"oști","ostesti":["oștești","oștesc","oștești","oști"],"ostestii":"oștesc","ostestile":"oștesc","osti":"oaste","ostia":"ostie","ostica":["ostică","ostic","ostica","ostic"],"ostice":"ostic","osticele":"ostic","ostici":"ostic","osticii":"ostic","osticul":"ostic","ostiei":"ostie","ostii":["oștii","oaste","oștii","oști","ostii","ostie"],"ostiile":"ostie","ostiilor":"ostie","ostila":["ostilă","ostil","ostila","ostil"],"ostile":["oștile","oaste","ostile","ostil"],"ostilele":"ostil","ostili":"ostil","ostilii":"ostil","ostilitatea":"ostilitate","ostilitati":"ostilitate","ostilitatii":"ostilitate","ostilitatile":"ostilitate","ostilitatilor":"ostilitate","ostilor":"oaste","ostilul":"ostil","ostim":"oști","ostimea":"oștime","ostimi":"oștime","ostimii":"oștime","ostinatoul":"ostinato","ostinatoule":"ostinato","ostinatoului":"ostinato","ostind":"oști","ostineasca":["oștinească","oștinesc","oștineasca","oștinesc"],"ostinescul":"oștinesc","ostinesti":"oștinesc","ostinestii":"oștinesc","ostinestile":"oștinesc","ostiole":"ostiolă","ostiolei":"ostiolă","ostiolele":"ostiolă","ostiolelor":"ostiolă","ostira":"oști","ostiram":"oști","ostirati":"oști","ostirea":"oștire","ostiri":"oștire","ostirii":"oștire","ostirile":"oștire","ostirilor":"oștire","ostise":"oști","ostisem":"oști","ostisera":"oști","ostiseram":"oști","ostiserati":"oști","ostisesi":"oști","ostisi":"oști","ostisoare":"oștișoară","ostisoarei":"oștișoară","ostisoarele":"oștișoară","ostisoarelor":"oștișoară","ostit":"oști","ostiti":"oști","ostituri":"oștitură","ostiturii":"oștitură","ostiturile":"oștitură","ostiturilor":"oștitură","ostoeste":"ostoi","ostoia":"ostoi","ostoiai":["ostoiai","ostoi","ostoiai","ostoia"],"ostoiam":["ostoiam","ostoi","ostoiam","ostoia"],"ostoiara":"ostoia","ostoiaram":"ostoia","ostoiarati":"ostoia","ostoiase":"ostoia","ostoiasem":"ostoia","ostoiasera":"ostoia","ostoiaseram":"ostoia","ostoiaserati":"ostoia","ostoiasesi":"ostoia","ostoiasi":"ostoia","ostoiat":"ostoia","ostoiati":["ostoiați","ostoi","ostoiați","ostoia"],"ostoiau":["ostoiau","ostoi","ostoiau","ostoia"],"ostoiaza":"ostoia","ostoie":"ostoia","ostoiem":"ostoia","ostoiesc":"ostoi","ostoieste":"ostoi","ostoiesti":"ostoi","ostoiez":"ostoia","ostoiezi":"ostoia","ostoii":"ostoi","ostoim":"ostoi","ostoind":["ostoind","ostoi","ostoind","ostoia"],"ostoira":"ostoi","ostoiram":"ostoi","ostoirati":"ostoi","ostoirea":"ostoire","ostoiri":"ostoire","ostoirii":"ostoire","ostoirile":"ostoire","ostoirilor":"ostoire","ostoise":"ostoi","ostoisem":"ostoi","ostoisera":"ostoi","ostoiseram":"ostoi","ostoiserati":"ostoi","ostoisesi":"ostoi","ostoisi":"ostoi","ostoit":"ostoi","ostoita":["ostoită","ostoit","ostoita","ostoit"],"ostoite":"ostoit","ostoitele":"ostoit","ostoiti":["ostoiți","ostoi","ostoiți","ostoit"],"ostoitii":"ostoit","ostoitoare":"ostoitor","ostoitoarea":"ostoitor","ostoitoarele":"ostoitor","ostoitori":"ostoitor","ostoitorii":"ostoitor","ostoitorul":"ostoitor","ostoitul":"ostoit","ostrace":["ostrace","ostrac","ostrace","ostracă"],"ostracei":"ostracă","ostracele":["ostracele","ostrac","ostracele","ostracă"],"ostracelor":["ostracelor","ostrac","ostracelor","ostracă"],"ostracismul":"ostracism","ostracismule":"ostracism","ostracismului":"ostracism","ostracite":"ostracită","ostracitei":"ostracită","ostracitele":"ostracită","ostracitelor":"ostracită","ostracizai":"ostraciza","ostracizam":["ostracizăm","ostraciza","ostracizam","ostraciza"],"ostracizand":"ostraciza","ostracizara":"ostraciza","ostracizaram":"ostraciza","ostracizarati":"ostraciza","ostracizarea":"ostracizare","ostracizari":"ostracizare","ostracizarii":"ostracizare","ostracizarile":"ostracizare","ostracizarilor":"ostracizare","ostracizase":"ostraciza","ostracizasem":"ostraciza","ostracizasera":"ostraciza","ostracizaseram":"ostraciza","ostracizaserati":"ostraciza","ostracizasesi":"ostraciza","ostracizasi":"ostraciza","ostracizat":"ostraciza","ostracizati":"ostraciza","ostracizau":"ostraciza","ostracizeaza":"ostraciza","ostracizez":"ostraciza","ostracizezi":"ostraciza","ostracode":"ostracod","ostracodele":"ostracod","ostracodelor":"ostracod","ostracodermi":"ostracoderm","ostracodermii":"ostracoderm","ostracodermilor":"ostracoderm","ostracodermul":"ostracoderm","ostracodermule":"ostracoderm","ostracodermului":"ostracoderm","ostracodul":"ostracod","ostracodule":"ostracod","ostracodului":"ostracod","ostraconul":"ostracon","ostraconule":"ostracon","ostraconului":"ostracon","ostracul":"ostrac","ostracule":"ostrac","ostracului":"ostrac","ostreicola":["ostreicolă","ostreicol","ostreicola","ostreicol"],"ostreicole":"ostreicol","ostreicolele":"ostreicol","ostreicoli":"ostreicol","ostreicolii":"ostreicol","ostreicolul":"ostreicol","ostreicultori":"ostreicultor","ostreicultorii":"ostreicultor","ostreicultorilor":"ostreicultor","ostreicultorul":"ostreicultor","ostreicultorule":"ostreicultor","ostreicultorului":"ostreicultor","ostreiculturi":"ostreicultură","ostreiculturii":"ostreicultură","ostreiculturile":"ostreicultură","ostreiculturilor":"ostreicultură","ostrice":"ostrică","ostricei":"ostrică","ostroave":"ostrov","ostroavele":"ostrov","ostroavelor":"ostrov","ostrogota":["ostrogotă","ostrogot","ostrogota","ostrogot"],"ostrogote":["ostrogote","ostrogot","ostrogote","ostrogotă"],"ostrogotei":"ostrogotă","ostrogotele":["ostrogotele","ostrogot","ostrogotele","ostrogotă"],"ostrogotelor":"ostrogotă","ostrogoti":"ostrogot","ostrogotica":["ostrogotică","ostrogotic","ostrogotica","ostrogotic"],"ostrogotice":"ostrogotic","ostrogoticele":"ostrogotic","ostrogotici":"ostrogotic","ostrogoticii":"ostrogotic","ostrogoticilor":"ostrogotic","ostrogoticul":"ostrogotic","ostrogoticule":"ostrogotic","ostrogoticului":"ostrogotic","ostrogotii":"ostrogot","ostrogotilor":"ostrogot","ostrogotul":"ostrogot","ostrogotule":"ostrogot","ostrogotului":"ostrogot","ostropatul":"ostropăț","ostropatule":"ostropăț","ostropatului":"ostropăț","ostropaturi":"ostropăț","ostropaturile":"ostropăț","ostropaturilor":"ostropăț","ostropelul":"ostropel","ostropelule":"ostropel","ostropelului":"ostropel","ostropeluri":"ostropel","ostropelurile":"ostropel","ostropelurilor":"ostropel","ostrovasul":"ostrovaș","ostrovasule":"ostrovaș","ostrovasului":"ostrovaș","ostroveana":["ostroveană","ostrovean","ostroveana","ostrovean"],"ostroveanul":"ostrovean","ostroveanule":"ostrovean","ostroveanului":"ostrovean","ostrovele":"ostrovel","ostrovelele":"ostrovel","ostrovelelor":"ostrovel","ostrovelul":"ostrovel","ostrovelule":"ostrovel","ostrovelului":"ostrovel","ostrovence":"ostroveancă","ostrovencei":"ostroveancă","ostrovene":["ostrovene","ostrovean","ostrovene","ostroveană"],"ostrovenei":"ostroveană","ostrovenele":["ostrovenele","ostrovean","ostrovenele","ostroveană"],"ostrovenelor":"ostroveană","ostroveni":"ostrovean","ostrovenii":"ostrovean","ostrovenilor":"ostrovean","ostrovul":"ostrov","ostrovule":"ostrov","ostrovulete":"ostrovuleț","ostrovuletele":"ostrovuleț","ostrovuletelor":"ostrovuleț","ostrovuletul":"ostrovuleț","ostrovuletule":"ostrovuleț","ostrovuletului":"ostrovuleț","ostrovului":"ostrov","ostrovute":"ostrovuț","ostrovutele":"ostrovuț","ostrovutelor":"ostrovuț","ostrovutul":"ostrovuț","ostrovutule":"ostrovuț","ostrovutului":"ostrovuț","ostul":"ost","ostule":"ost","ostului":"ost","osturi":"ost","osturile":"ost","osturilor":"ost","osuare":"osuar","osuarele":"osuar","osuarelor":"osuar","osuarii":"osuariu","osuariile":"osuariu","osuariilor":"osuariu","osuariu":"osuar","osuariuul":"osuariu","osuariuule":"osuariu","osuariuului":"osuariu","osuarul":"osuar","osuarule":"osuar","osuarului":"osuar","osucul":"osuc","osucule":"osuc","osucului":"osuc","osul":"os","osule":"os","osului":"os","osusoare":"osușor","osusoarele":"osușor","osusoarelor":"osușor","osusorul":"osușor","osusorule":"osușor","osusorului":"osușor","osute":"osuț","osutele":"osuț","osutelor":"osuț","osutul":"osuț","osutule":"osuț","osutului":"osuț","osvetea":"osveti","osveteai":"osveti","osveteam":"osveti","osveteati":"osveti","osveteau":"osveti","osvetesc":"osveti","osveteste":"osveti","osvetesti":"osveti","osvetii":"osveti","osvetim":"osveti","osvetind":"osveti","osvetira":"osveti","osvetiram":"osveti","osvetirati":"osveti","osvetise":"osveti","osvetisem":"osveti","osvetisera":"osveti","osvetiseram":"osveti","osvetiserati":"osveti","osvetisesi":"osveti","osvetisi":"osveti","osvetit":"osveti","osvetiti":"osveti","otace":"otac","otacele":"otac","otacelor":"otac","otacul":"otac","otacule":"otac","otacului":"otac","otagiul":"otagiu","otagiule":"otagiu","otagiului":"otagiu","otagiuri":"otagiu","otagiurile":"otagiu","otagiurilor":"otagiu","otaje":"otaj","otajele":"otaj","otajelor":"otaj","otajul":"otaj","otajule":"otaj","otajului":"otaj","otalgia":"otalgie","otalgica":["otalgică","otalgic","otalgica","otalgic"],"otalgice":"otalgic","otalgicele":"otalgic","otalgici":"otalgic","otalgicii":"otalgic","otalgicul":"otalgic","otalgiei":"otalgie","otalgii":"otalgie","otalmul":"otalm","otalmule":"otalm","otalmului":"otalm","otanjea":"otânji","otanjeai":"otânji","otanjeale":"otânjeală","otanjealei":"otânjeală","otanjeam":"otânji","otanjeati":"otânji","otanjeau":"otânji","otanjesc":"otânji","otanjeste":"otânji","otanjesti":"otânji","otanjii":"otânji","otanjim":"otânji","otanjind":"otânji","otanjira":"otânji","otanjiram":"otânji","otanjirati":"otânji","otanjise":"otânji","otanjisem":"otânji","otanjisera":"otânji","otanjiseram":"otânji","otanjiserati":"otânji","otanjisesi":"otânji","otanjisi":"otânji","otanjit":"otânji","otanjiti":"otânji","otara":"oțărî","otarai":["oțărai","oțărî","oțărâi","oțărî"],"otaram":["oțărâm","oțărî","oțăram","oțărî"],"otarand":"oțărî","otarara":"oțărî","otararam":"oțărî","otararati":"oțărî","otararea":"oțărâre","otarari":"oțărâre","otararii":"oțărâre","otararile":"oțărâre","otararilor":"oțărâre","otarasc":"oțărî","otarase":"oțărî","otarasem":"oțărî","otarasera":"oțărî","otaraseram":"oțărî","otaraserati":"oțărî","otarasesi":"oțărî","otarasi":"oțărî","otaraste":"oțărî","otarasti":"oțărî","otarata":["oțărâtă","oțărât","oțărâta","oțărât"],"otarate":"oțărât","otaratele":"oțărât","otarati":["oțărâți","oțărât","oțărâți","oțărî","oțărați","oțărî"],"otaratii":"oțărât","otaratul":"oțărât","otaraturi":"oțărâtură","otaraturii":"oțărâtură","otaraturile":"oțărâtură","otaraturilor":"oțărâtură","otarau":"oțărî","otarea":"oțări","otareai":"oțări","otaream":"oțări","otareati":"oțări","otareau":"oțări","otarele":"oțăreală","otarelei":"oțăreală","otarelele":"oțăreală","otarelelor":"oțăreală","otareli":"oțăreală","otaresc":"oțări","otareste":"oțări","otaresti":"oțări","otaria":"otarie","otariei":"otarie","otarii":["oțării","oțări","otarii","otarie"],"otariile":"otarie","otariilor":"otarie","otarim":"oțări"};
@@ -0,0 +1 @@
+export default {"otarimea":"oțărime","otarimi":"oțărime","otarimii":"oțărime","otarind":"oțări","otarira":"oțări","otariram":"oțări","otarirati":"oțări","otarirea":"oțărire","otariri":"oțărire","otaririi":"oțărire","otaririle":"oțărire","otaririlor":"oțărire","otarise":"oțări","otarisem":"oțări","otarisera":"oțări","otariseram":"oțări","otariserati":"oțări","otarisesi":"oțări","otarisi":"oțări","otarit":["oțărit","oțări","oțărît","oțărî"],"otarita":["oțărită","oțărit","oțărita","oțărit"],"otarite":"oțărit","otaritele":"oțărit","otariti":["oțăriți","oțări","oțăriți","oțărit"],"otaritii":"oțărit","otaritul":"oțărit","otarnia":"otârnie","otarniei":"otârnie","otarnii":"otârnie","otarniile":"otârnie","otarniilor":"otârnie","otave":"otavă","otavei":"otavă","otcarmuia":"otcârmui","otcarmuiai":"otcârmui","otcarmuiam":"otcârmui","otcarmuiati":"otcârmui","otcarmuiau":"otcârmui","otcarmuiesc":"otcârmui","otcarmuieste":"otcârmui","otcarmuiesti":"otcârmui","otcarmuii":"otcârmui","otcarmuim":"otcârmui","otcarmuind":"otcârmui","otcarmuira":"otcârmui","otcarmuiram":"otcârmui","otcarmuirati":"otcârmui","otcarmuise":"otcârmui","otcarmuisem":"otcârmui","otcarmuisera":"otcârmui","otcarmuiseram":"otcârmui","otcarmuiserati":"otcârmui","otcarmuisesi":"otcârmui","otcarmuisi":"otcârmui","otcarmuit":"otcârmui","otcarmuiti":"otcârmui","otcarvenia":"otcârvenie","otcarveniei":"otcârvenie","otcarvenii":"otcârvenie","otcupcici":"otcupcic","otcupcicii":"otcupcic","otcupcicilor":"otcupcic","otcupcicul":"otcupcic","otcupcicule":"otcupcic","otcupcicului":"otcupcic","otcupcii":"otcupciu","otcupciii":"otcupciu","otcupciilor":"otcupciu","otcupciuul":"otcupciu","otcupciuule":"otcupciu","otcupciuului":"otcupciu","otecinice":"otecinic","otecinicele":"otecinic","otecinicelor":"otecinic","otecinicul":"otecinic","otecinicule":"otecinic","otecinicului":"otecinic","otelari":"oțelar","otelaria":"oțelărie","otelariei":"oțelărie","otelarii":["oțelarii","oțelar","oțelării","oțelărie"],"otelariile":"oțelărie","otelariilor":"oțelărie","otelarilor":"oțelar","otelarul":"oțelar","otelarule":"oțelar","otelarului":"oțelar","otelea":"oțeli","oteleai":"oțeli","oteleam":"oțeli","oteleati":"oțeli","oteleau":"oțeli","otelesc":"oțeli","oteleste":"oțeli","otelesti":"oțeli","otelia":"oțeliu","otelie":"oțeliu","otelieri":"otelier","otelierii":"otelier","otelierilor":"otelier","otelierul":"otelier","otelierule":"otelier","otelierului":"otelier","otelii":["oțelii","oțeli","oțelii","oțeliu"],"oteliii":"oțeliu","oteliile":"oțeliu","otelim":"oțeli","otelind":"oțeli","otelira":"oțeli","oteliram":"oțeli","otelirati":"oțeli","otelirea":"oțelire","oteliri":"oțelire","otelirii":"oțelire","otelirile":"oțelire","otelirilor":"oțelire","otelise":"oțeli","otelisem":"oțeli","otelisera":"oțeli","oteliseram":"oțeli","oteliserati":"oțeli","otelisesi":"oțeli","otelisi":"oțeli","otelit":"oțeli","otelita":["oțelită","oțelit","oțelita","oțelit"],"otelite":"oțelit","otelitele":"oțelit","oteliti":["oțeliți","oțeli","oțeliți","oțelit"],"otelitii":"oțelit","otelitul":"oțelit","oteliul":"oțeliu","otelul":"oțel","otelule":"oțel","otelului":"oțel","oteluri":["oteluri","otel","oțeluri","oțel"],"otelurile":"oțel","otelurilor":"oțel","otera":"oțerî","oterai":["oțerai","oțerî","oțerâi","oțerî"],"oteram":["oțerâm","oțerî","oțeram","oțerî"],"oterand":"oțerî","oterara":"oțerî","oteraram":"oțerî","oterarati":"oțerî","oterasc":"oțerî","oterase":"oțerî","oterasem":"oțerî","oterasera":"oțerî","oteraseram":"oțerî","oteraserati":"oțerî","oterasesi":"oțerî","oterasi":"oțerî","oteraste":"oțerî","oterasti":"oțerî","oterati":["oțerâți","oțerî","oțerați","oțerî"],"oterau":"oțerî","oterea":"oțeri","otereai":"oțeri","oteream":"oțeri","otereati":"oțeri","otereau":"oțeri","oteresc":"oțeri","otereste":"oțeri","oteresti":"oțeri","oterii":"oțeri","oterim":"oțeri","oterind":"oțeri","oterira":"oțeri","oteriram":"oțeri","oterirati":"oțeri","oterirea":"oțerire","oteriri":"oțerire","oteririi":"oțerire","oteririle":"oțerire","oteririlor":"oțerire","oterise":"oțeri","oterisem":"oțeri","oterisera":"oțeri","oteriseram":"oțeri","oteriserati":"oțeri","oterisesi":"oțeri","oterisi":"oțeri","oterit":["oțerit","oțeri","oțerît","oțerî"],"oterita":["oțerită","oțerit","oțerita","oțerit"],"oterite":"oțerit","oteritele":"oțerit","oteriti":["oțeriți","oțeri","oțeriți","oțerit"],"oteritii":"oțerit","oteritul":"oțerit","oteroasa":["oțeroasă","oțeros","oțeroasa","oțeros"],"oteroase":"oțeros","oteroasele":"oțeros","oterosi":"oțeros","oterosii":"oțeros","oterosul":"oțeros","otesirea":"oteșire","otesiri":"oteșire","otesirii":"oteșire","otetari":"oțetar","otetaria":"oțetărie","otetariei":"oțetărie","otetarii":["oțetarii","oțetar","oțetării","oțetărie"],"otetariile":"oțetărie","otetariilor":"oțetărie","otetarilor":"oțetar","otetarnite":"oțetarniță","otetarnitei":"oțetarniță","otetarnitele":"oțetarniță","otetarnitelor":"oțetarniță","otetarul":"oțetar","otetarule":"oțetar","otetarului":"oțetar","otetea":["oțetea","oțeti","oțețea","oțeți"],"oteteai":["oțeteai","oțeti","oțețeai","oțeți"],"oteteam":["oțeteam","oțeti","oțețeam","oțeți"],"oteteati":["oțeteați","oțeti","oțețeați","oțeți"],"oteteau":["oțeteau","oțeti","oțețeau","oțeți"],"otetesc":["oțetesc","oțeti","oțețesc","oțeți"],"oteteste":["oțetește","oțeti","oțețește","oțeți"],"otetesti":["oțetești","oțeti","oțețești","oțeți"],"otetii":["oțetii","oțeti","oțeții","oțeți"],"otetim":["oțetim","oțeti","oțețim","oțeți"],"otetind":["oțetind","oțeti","oțețind","oțeți"],"otetira":["oțetiră","oțeti","oțețiră","oțeți"],"otetiram":["oțetirăm","oțeti","oțețirăm","oțeți"],"otetirati":["oțetirăți","oțeti","oțețirăți","oțeți"],"otetirea":"oțetire","otetiri":"oțetire","otetirii":"oțetire","otetirile":"oțetire","otetirilor":"oțetire","otetise":["oțetise","oțeti","oțețise","oțeți"],"otetisem":["oțetisem","oțeti","oțețisem","oțeți"],"otetisera":["oțetiseră","oțeti","oțețiseră","oțeți"],"otetiseram":["oțetiserăm","oțeti","oțețiserăm","oțeți"],"otetiserati":["oțetiserăți","oțeti","oțețiserăți","oțeți"],"otetisesi":["oțetiseși","oțeti","oțețiseși","oțeți"],"otetisi":["oțetiși","oțeti","oțețiși","oțeți"],"otetit":["oțetit","oțeti","oțețit","oțeți"],"otetita":["oțetită","oțetit","oțetita","oțetit","oțețită","oțețit","oțețita","oțețit"],"otetite":["oțetite","oțetit","oțețite","oțețit"],"otetitele":["oțetitele","oțetit","oțețitele","oțețit"],"otetiti":["oțetiți","oțeti","oțețiți","oțeți","oțetiți","oțetit","oțețiți","oțețit"],"otetitii":["oțetiții","oțetit","oțețiții","oțețit"],"otetitul":["oțetitul","oțetit","oțețitul","oțețit"],"otetoasa":["oțetoasă","oțetos","oțetoasa","oțetos"],"otetoase":"oțetos","otetoasele":"oțetos","otetosi":"oțetos","otetosii":"oțetos","otetosul":"oțetos","otetul":["otețul","oteț","oțetul","oțet"],"otetule":["otețule","oteț","oțetule","oțet"],"otetului":["otețului","oteț","oțetului","oțet"],"oteturi":"oțet","oteturile":"oțet","oteturilor":"oțet","otgoane":"otgon","otgoanele":"otgon","otgoanelor":"otgon","otgonul":"otgon","otgonule":"otgon","otgonului":"otgon","othematoame":"othematom","othematoamele":"othematom","othematoamelor":"othematom","othematomul":"othematom","othematomule":"othematom","othematomului":"othematom","otiatria":"otiatrie","otiatriei":"otiatrie","otiatrii":"otiatrie","otiatriile":"otiatrie","otiatriilor":"otiatrie","otingasul":"otingaș","otingasule":"otingaș","otingasului":"otingaș","otioasa":["oțioasă","oțios","oțioasa","oțios"],"otioase":"oțios","otioasele":"oțios","otiosi":"oțios","otiosii":"oțios","otiosul":"oțios","otite":"otită","otitei":"otită","otitele":"otită","otitelor":"otită","otnosenia":"otnoșenie","otnoseniei":"otnoșenie","otnosenii":"otnoșenie","otnoseniile":"otnoșenie","otnoseniilor":"otnoșenie","otociste":"otocist","otocistele":"otocist","otocistelor":"otocist","otocistul":"otocist","otocistule":"otocist","otocistului":"otocist","otolite":"otolit","otolitele":"otolit","otolitelor":"otolit","otolitul":"otolit","otolitule":"otolit","otolitului":"otolit","otologe":"otologă","otologei":"otologă","otologele":"otologă","otologelor":"otologă","otologi":"otolog","otologia":"otologie","otologica":["otologică","otologic","otologica","otologic"],"otologice":"otologic","otologicele":"otologic","otologici":"otologic","otologicii":"otologic","otologicul":"otologic","otologiei":"otologie","otologii":["otologii","otolog","otologii","otologie"],"otologilor":"otolog","otologul":"otolog","otologule":"otolog","otologului":"otolog","otomana":["otomană","otoman","otomana","otoman"],"otomane":["otomane","otoman","otomane","otomană"],"otomaneasca":["otomănească","otomănesc","otomăneasca","otomănesc"],"otomanei":"otomană","otomanele":["otomanele","otoman","otomanele","otomană"],"otomanelor":"otomană","otomanescul":"otomănesc","otomanesti":"otomănesc","otomanestii":"otomănesc","otomanestile":"otomănesc","otomani":"otoman","otomanii":"otoman","otomanilor":"otoman","otomanul":"otoman","otomanule":"otoman","otomanului":"otoman","otomicoze":"otomicoză","otomicozei":"otomicoză","otomicozele":"otomicoză","otomicozelor":"otomicoză","otopatia":"otopatie","otopatiei":"otopatie","otopatii":"otopatie","otoplastia":"otoplastie","otoplastiei":"otoplastie","otoplastii":"otoplastie","otoplastiile":"otoplastie","otoplastiilor":"otoplastie","otoragia":"otoragie","otoragiei":"otoragie","otoragii":"otoragie","otoragiile":"otoragie","otoragiilor":"otoragie","otoreea":"otoree","otoreei":"otoree","otoreele":"otoree","otoreelor":"otoree","otorinolaringologe":"otorinolaringologă","otorinolaringologei":"otorinolaringologă","otorinolaringologele":"otorinolaringologă","otorinolaringologelor":"otorinolaringologă","otorinolaringologi":"otorinolaringolog","otorinolaringologia":"otorinolaringologie","otorinolaringologica":["otorinolaringologică","otorinolaringologic","otorinolaringologica","otorinolaringologic"],"otorinolaringologice":"otorinolaringologic","otorinolaringologicele":"otorinolaringologic","otorinolaringologici":"otorinolaringologic","otorinolaringologicii":"otorinolaringologic","otorinolaringologicul":"otorinolaringologic","otorinolaringologiei":"otorinolaringologie","otorinolaringologii":["otorinolaringologii","otorinolaringolog","otorinolaringologii","otorinolaringologie"],"otorinolaringologilor":"otorinolaringolog","otorinolaringologul":"otorinolaringolog","otorinolaringologule":"otorinolaringolog","otorinolaringologului":"otorinolaringolog","otosclerotici":"otosclerotic","otoscleroticii":"otosclerotic","otoscleroticilor":"otosclerotic","otoscleroticul":"otosclerotic","otoscleroticule":"otosclerotic","otoscleroticului":"otosclerotic","otoscleroze":"otoscleroză","otosclerozei":"otoscleroză","otosclerozele":"otoscleroză","otosclerozelor":"otoscleroză","otoscoape":"otoscop","otoscoapele":"otoscop","otoscoapelor":"otoscop","otoscopia":"otoscopie","otoscopiei":"otoscopie","otoscopii":"otoscopie","otoscopiile":"otoscopie","otoscopiilor":"otoscopie","otoscopul":"otoscop","otoscopule":"otoscop","otoscopului":"otoscop","otospongioze":"otospongioză","otospongiozei":"otospongioză","otospongiozele":"otospongioză","otospongiozelor":"otospongioză","otpravuirea":"otprăvuire","otpravuiri":"otprăvuire","otpravuirii":"otprăvuire","otpustul":"otpust","otpustule":"otpust","otpustului":"otpust","otpusturi":"otpust","otpusturile":"otpust","otpusturilor":"otpust","otratei":"otrățel","otrateii":"otrățel","otrateilor":"otrățel","otratelul":"otrățel","otratelule":"otrățel","otratelului":"otrățel","otravea":"otrăvi","otraveai":"otrăvi","otraveam":"otrăvi","otraveati":"otrăvi","otraveau":"otrăvi","otravesc":"otrăvi","otraveste":"otrăvi","otravesti":"otrăvi","otravi":"otravă","otravicioasa":["otrăvicioasă","otrăvicios","otrăvicioasa","otrăvicios"],"otravicioase":"otrăvicios","otravicioasele":"otrăvicios","otraviciosi":"otrăvicios","otraviciosii":"otrăvicios","otraviciosul":"otrăvicios","otravii":["otrăvii","otravă","otrăvii","otrăvi"],"otravim":"otrăvi","otravind":"otrăvi","otravira":"otrăvi","otraviram":"otrăvi","otravirati":"otrăvi","otravirea":"otrăvire","otraviri":"otrăvire","otravirii":"otrăvire","otravirile":"otrăvire","otravirilor":"otrăvire","otravise":"otrăvi","otravisem":"otrăvi","otravisera":"otrăvi","otraviseram":"otrăvi","otraviserati":"otrăvi","otravisesi":"otrăvi","otravisi":"otrăvi","otravit":"otrăvi","otravita":["otrăvită","otrăvit","otrăvita","otrăvit"],"otravite":"otrăvit","otravitele":"otrăvit","otraviti":["otrăviți","otrăvi","otrăviți","otrăvit"],"otravitii":"otrăvit","otravitoare":"otrăvitor","otravitoarea":"otrăvitor","otravitoarele":"otrăvitor","otravitori":"otrăvitor","otravitorii":"otrăvitor","otravitorul":"otrăvitor","otravitul":"otrăvit","otravnici":"otravnic","otravnicii":"otravnic","otravnicilor":"otravnic","otravnicul":"otravnic","otravnicule":"otravnic","otravnicului":"otravnic","otravuri":"otravă","otravurile":"otravă","otravurilor":"otravă","otrepe":"otreapă","otrepei":"otreapă","otrepele":"otreapă","otrepelor":"otreapă","otrepioare":"otrepioară","otrepioarei":"otrepioară","otrepioarele":"otrepioară","otrepioarelor":"otrepioară","otritania":"otrițanie","otritaniei":"otrițanie","otritanii":"otrițanie","otritaniile":"otrițanie","otritaniilor":"otrițanie","otroci":"otroc","otrocii":"otroc","otrocilor":"otroc","otrocul":"otroc","otrocule":"otroc","otrocului":"otroc","otstapnici":"otstâpnic","otstapnicii":"otstâpnic","otstapnicilor":"otstâpnic","otstapnicul":"otstâpnic","otstapnicule":"otstâpnic","otstapnicului":"otstâpnic","oturace":"oturac","oturacele":"oturac","oturacelor":"oturac","oturaclia":"oturacliu","oturaclie":"oturacliu","oturaclii":"oturacliu","oturacliii":"oturacliu","oturacliile":"oturacliu","oturacliul":"oturacliu","oturacul":"oturac","oturacule":"oturac","oturacului":"oturac","otuzbirul":"otuzbir","otuzbirule":"otuzbir","otuzbirului":"otuzbir","otveatul":"otveat","otveatule":"otveat","otveatului":"otveat","otzovista":["otzovistă","otzovist","otzovista","otzovist"],"otzoviste":"otzovist","otzovistele":"otzovist","otzovisti":"otzovist","otzovistii":"otzovist","otzovistilor":"otzovist","otzovistul":"otzovist","otzovistule":"otzovist","otzovistului":"otzovist","oua":"ou","oua de pasti":"ou de Paști","oua fierte":"ou fiert","oua ochi":"ou ochi","ouabaine":"ouabaină","ouabainei":"ouabaină","ouale":"ou","oualor":"ou","ouand":"oua","ouara":"oua","ouase":"oua","ouasera":"oua","ouat":"oua","ouatoarea":"ouătoare","ouatoarei":"ouătoare","ouatoarele":"ouătoare","ouatoarelor":"ouătoare","ouatul":"ouat","ouatule":"ouat","ouatului":"ouat","ouau":"oua","oul":"ou","oule":"ou","oulete":"ouleț","ouletele":"ouleț","ouletelor":"ouleț","ouletul":"ouleț","ouletule":"ouleț","ouletului":"ouleț","oului":"ou","ousoare":"oușor","ousore":"oușor","ousorele":"oușor","ousorelor":"oușor","ousorul":"oușor","ousorule":"oușor","ousorului":"oușor","oute":"ouț","outele":"ouț","outelor":"ouț","outputul":"output","outputule":"output","outputului":"output","outputuri":"output","outputurile":"output","outputurilor":"output","outsideri":"outsider","outul":"ouț","outule":"ouț","outului":"ouț","ovajenia":"ovajenie","ovajeniei":"ovajenie","ovajenii":"ovajenie","ovajeniile":"ovajenie","ovajeniilor":"ovajenie","ovala":["ovală","oval","ovala","oval"],"ovalbumine":"ovalbumină","ovalbuminei":"ovalbumină","ovalbuminele":"ovalbumină","ovalbuminelor":"ovalbumină","ovale":["ovale","oval","ovale","ovală"],"ovalei":"ovală","ovalele":["ovalele","oval","ovalele","ovală"],"ovalelor":"ovală","ovali":"oval","ovalii":"oval","ovalitatea":"ovalitate","ovalitati":"ovalitate","ovalitatii":"ovalitate","ovaliz":"ovaliza","ovalizai":"ovaliza","ovalizam":["ovalizăm","ovaliza","ovalizam","ovaliza"],"ovalizand":"ovaliza","ovalizara":"ovaliza","ovalizaram":"ovaliza","ovalizarati":"ovaliza","ovalizarea":"ovalizare","ovalizari":"ovalizare","ovalizarii":"ovalizare","ovalizarile":"ovalizare","ovalizarilor":"ovalizare","ovalizase":"ovaliza","ovalizasem":"ovaliza","ovalizasera":"ovaliza","ovalizaseram":"ovaliza","ovalizaserati":"ovaliza","ovalizasesi":"ovaliza","ovalizasi":"ovaliza","ovalizat":"ovaliza","ovalizati":"ovaliza","ovalizatia":"ovalizație","ovalizatiei":"ovalizație","ovalizatii":"ovalizație","ovalizatiile":"ovalizație","ovalizatiilor":"ovalizație","ovalizau":"ovaliza","ovalizeaza":"ovaliza","ovalizi":"ovaliza","ovalul":"oval","ovare":"ovar","ovarele":"ovar","ovarelor":"ovar","ovariana":["ovariană","ovarian","ovariana","ovarian"],"ovarianul":"ovarian","ovariectomia":"ovariectomie","ovariectomiei":"ovariectomie","ovariectomii":"ovariectomie","ovariectomiile":"ovariectomie","ovariectomiilor":"ovariectomie","ovariene":"ovarian","ovarienele":"ovarian","ovarieni":"ovarian","ovarienii":"ovarian","ovariocele":"ovariocel","ovariocelele":"ovariocel","ovariocelelor":"ovariocel","ovariocelul":"ovariocel","ovariocelule":"ovariocel","ovariocelului":"ovariocel","ovariopatia":"ovariopatie","ovariopatiei":"ovariopatie","ovariopatii":"ovariopatie","ovariopatiile":"ovariopatie","ovariopatiilor":"ovariopatie","ovariotomia":"ovariotomie","ovariotomiei":"ovariotomie","ovariotomii":"ovariotomie","ovariotomiile":"ovariotomie","ovariotomiilor":"ovariotomie","ovarite":"ovarită","ovaritei":"ovarită","ovaritele":"ovarită","ovaritelor":"ovarită","ovarul":"ovar","ovarule":"ovar","ovarului":"ovar","ovas":"ovăz","ovasul":"ovăs","ovasule":"ovăs","ovasului":"ovăs","ovata":["ovată","ovat","ovata","ovat"],"ovate":"ovat","ovatele":"ovat","ovati":"ovat","ovatia":"ovație","ovatiei":"ovație","ovatii":["ovații","ovat","ovații","ovație"],"ovatiile":"ovație","ovatiilor":"ovație","ovationai":"ovaționa","ovationam":["ovaționăm","ovaționa","ovaționam","ovaționa"],"ovationand":"ovaționa","ovationara":"ovaționa","ovationaram":"ovaționa","ovationarati":"ovaționa","ovationarea":"ovaționare","ovationari":"ovaționare","ovationarii":"ovaționare","ovationarile":"ovaționare","ovationarilor":"ovaționare","ovationase":"ovaționa","ovationasem":"ovaționa","ovationasera":"ovaționa","ovationaseram":"ovaționa","ovationaserati":"ovaționa","ovationasesi":"ovaționa","ovationasi":"ovaționa","ovationat":"ovaționa","ovationati":"ovaționa","ovationau":"ovaționa","ovationeaza":"ovaționa","ovationez":"ovaționa","ovationezi":"ovaționa","ovatiunea":"ovațiune","ovatiuni":"ovațiune","ovatiunii":"ovațiune","ovatiunile":"ovațiune","ovatiunilor":"ovațiune","ovatul":"ovat","ovazciorul":"ovăzcior","ovazciorule":"ovăzcior","ovazciorului":"ovăzcior","ovazistea":"ovăziște","ovazisti":"ovăziște","ovazistii":"ovăziște","ovazistile":"ovăziște","ovazistilor":"ovăziște","ovazul":"ovăz","ovazule":"ovăz","ovazului":"ovăz","ove":"ovă","ovei":"ovă","ovele":"ovă","ovelita":["ovelită","ovelit","ovelita","ovelit"],"ovelite":"ovelit","ovelitele":"ovelit","oveliti":"ovelit","ovelitii":"ovelit","ovelitoria":"ovelitoriu","ovelitorie":"ovelitoriu","ovelitorii":"ovelitoriu","ovelitoriii":"ovelitoriu","ovelitoriile":"ovelitoriu","ovelitoriul":"ovelitoriu","ovelitul":"ovelit","ovelor":"ovă","oveseri":"oveșer","oveserii":"oveșer","oveserilor":"oveșer","oveserul":"oveșer","oveserule":"oveșer","oveserului":"oveșer","ovibosi":"ovibos","ovibosii":"ovibos","ovibosilor":"ovibos","ovibosul":"ovibos","ovibosule":"ovibos","ovibosului":"ovibos","ovicide":"ovicid","ovicidele":"ovicid","ovicidelor":"ovicid","ovicidul":"ovicid","ovicidule":"ovicid","ovicidului":"ovicid","oviducte":"oviduct","oviductele":"oviduct","oviductelor":"oviduct","oviductul":"oviduct","oviductule":"oviduct","oviductului":"oviduct","oviforma":["oviformă","oviform","oviforma","oviform"],"oviforme":"oviform","oviformele":"oviform","oviformi":"oviform","oviformii":"oviform","oviformul":"oviform","ovilea":"ovili","ovileai":"ovili","ovileam":"ovili","ovileati":"ovili","ovileau":"ovili","ovilesc":"ovili","ovileste":"ovili","ovilesti":"ovili","oviliciunea":"oviliciune","oviliciuni":"oviliciune","oviliciunii":"oviliciune","ovilii":"ovili","ovilim":"ovili","ovilind":"ovili","ovilira":"ovili","oviliram":"ovili","ovilirati":"ovili","ovilise":"ovili","ovilisem":"ovili","ovilisera":"ovili","oviliseram":"ovili","oviliserati":"ovili","ovilisesi":"ovili","ovilisi":"ovili","ovilit":"ovili","ovilita":["ovilită","ovilit","ovilita","ovilit"],"ovilite":"ovilit","ovilitele":"ovilit","oviliti":["oviliți","ovili","oviliți","ovilit"],"ovilitii":"ovilit","ovilitul":"ovilit","ovina":["ovină","ovin","ovina","ovin"],"ovine":["ovine","ovin","ovine","ovină"],"ovinei":"ovină","ovinele":["ovinele","ovin","ovinele","ovină"],"ovinelor":"ovină","ovini":"ovin","ovinii":"ovin","ovinul":"ovin","ovipara":["ovipară","ovipar","ovipara","ovipar"],"ovipare":"ovipar","oviparele":"ovipar","ovipari":"ovipar","oviparii":"ovipar","oviparitatea":"oviparitate","oviparitati":"oviparitate","oviparitatii":"oviparitate","oviparitatile":"oviparitate","oviparitatilor":"oviparitate","oviparul":"ovipar","ovipozitoare":"ovipozitor","ovipozitore":"ovipozitor","ovipozitorele":"ovipozitor","ovipozitorelor":"ovipozitor","ovipozitorul":"ovipozitor","ovipozitorule":"ovipozitor","ovipozitorului":"ovipozitor","oviscapte":"oviscapt","oviscaptele":"oviscapt","oviscaptelor":"oviscapt","oviscaptul":"oviscapt","oviscaptule":"oviscapt","oviscaptului":"oviscapt","ovismul":"ovism","ovismule":"ovism","ovismului":"ovism","ovocite":"ovocit","ovocitele":"ovocit","ovocitelor":"ovocit","ovocitul":"ovocit","ovocitule":"ovocit","ovocitului":"ovocit","ovode":"ovodă","ovodei":"ovodă","ovodele":"ovodă","ovodelor":"ovodă","ovogeneze":"ovogeneză","ovogenezei":"ovogeneză","ovogenezele":"ovogeneză","ovogenezelor":"ovogeneză","ovoglobuline":"ovoglobulină","ovoglobulinei":"ovoglobulină","ovoglobulinele":"ovoglobulină","ovoglobulinelor":"ovoglobulină","ovogoane":"ovogon","ovogoanele":"ovogon","ovogoanelor":"ovogon","ovogonul":"ovogon","ovogonule":"ovogon","ovogonului":"ovogon","ovoida":["ovoidă","ovoid","ovoida","ovoid"],"ovoidala":["ovoidală","ovoidal","ovoidala","ovoidal"],"ovoidale":"ovoidal","ovoidalele":"ovoidal","ovoidali":"ovoidal","ovoidalii":"ovoidal","ovoidalul":"ovoidal","ovoide":"ovoid","ovoidele":"ovoid","ovoidul":"ovoid","ovoizi":"ovoid","ovoizii":"ovoid","ovoplasme":"ovoplasmă","ovoplasmei":"ovoplasmă","ovoplasmele":"ovoplasmă","ovoplasmelor":"ovoplasmă","ovovivipara":["ovovivipară","ovovivipar","ovovivipara","ovovivipar"],"ovovivipare":["ovovivipare","ovovivipar","ovovivipare","ovovivipară"],"ovoviviparei":"ovovivipară","ovoviviparele":["ovoviviparele","ovovivipar","ovoviviparele","ovovivipară"],"ovoviviparelor":"ovovivipară","ovovivipari":"ovovivipar","ovoviviparii":"ovovivipar","ovoviviparitatea":"ovoviviparitate","ovoviviparitati":"ovoviviparitate","ovoviviparitatii":"ovoviviparitate","ovoviviparul":"ovovivipar","ovrei":"ovreu","ovreiasca":["ovreiască","ovreiesc","ovreiasca","ovreiesc"],"ovreice":"ovreică","ovreicei":"ovreică","ovreicele":"ovreică","ovreicelor":"ovreică","ovreicute":"ovreicuță","ovreicutei":"ovreicuță","ovreicutele":"ovreicuță","ovreicutelor":"ovreicuță","ovreiescul":"ovreiesc","ovreiesti":"ovreiesc","ovreiestii":"ovreiesc","ovreiestile":"ovreiesc","ovreii":["ovreii","ovrei","ovreii","ovreu"],"ovreilor":["ovreilor","ovrei","ovreilor","ovreu"],"ovreiul":"ovrei","ovreiule":"ovrei","ovreiului":"ovrei","ovreul":"ovreu","ovreule":"ovreu","ovreului":"ovreu","ovulara":["ovulară","ovular","ovulara","ovular"],"ovulare":"ovular","ovularele":"ovular","ovulari":"ovular","ovularii":"ovular","ovularul":"ovular","ovulatia":"ovulație","ovulatiei":"ovulație","ovulatii":"ovulație","ovulatiile":"ovulație","ovulatiilor":"ovulație","ovulatiunea":"ovulațiune","ovulatiuni":"ovulațiune","ovulatiunii":"ovulațiune","ovulatiunile":"ovulațiune","ovulatiunilor":"ovulațiune","ovule":"ovul","ovulele":"ovul","ovulelor":"ovul","ovulisti":"ovulist","ovulistii":"ovulist","ovulistilor":"ovulist","ovulistul":"ovulist","ovulistule":"ovulist","ovulistului":"ovulist","ovulul":"ovul","ovulule":"ovul","ovulului":"ovul","owenismul":"owenism","owenismule":"owenism","owenismului":"owenism","owenisti":"owenist","owenistii":"owenist","owenistilor":"owenist","owenistul":"owenist","owenistule":"owenist","owenistului":"owenist","oxalati":"oxalat","oxalatii":"oxalat","oxalatilor":"oxalat","oxalatul":"oxalat","oxalatule":"oxalat","oxalatului":"oxalat","oxalemia":"oxalemie","oxalemiei":"oxalemie","oxalemii":"oxalemie","oxalemiile":"oxalemie","oxalemiilor":"oxalemie","oxalica":["oxalică","oxalic","oxalica","oxalic"],"oxalice":"oxalic","oxalicele":"oxalic","oxalici":"oxalic","oxalicii":"oxalic","oxalicul":"oxalic","oxaluria":"oxalurie","oxaluriei":"oxalurie","oxalurii":"oxalurie","oxaluriile":"oxalurie","oxaluriilor":"oxalurie","oxfordianul":"oxfordian","oxfordianule":"oxfordian","oxfordianului":"oxfordian","oxhidrica":["oxhidrică","oxhidric","oxhidrica","oxhidric"],"oxhidrice":"oxhidric","oxhidricele":"oxhidric","oxhidrici":"oxhidric","oxhidricii":"oxhidric","oxhidricul":"oxhidric","oxia":"oxie","oxiacetilene":"oxiacetilenă","oxiacetilenei":"oxiacetilenă","oxiacetilenele":"oxiacetilenă","oxiacetilenelor":"oxiacetilenă","oxiacetilenica":["oxiacetilenică","oxiacetilenic","oxiacetilenica","oxiacetilenic"],"oxiacetilenice":"oxiacetilenic","oxiacetilenicele":"oxiacetilenic","oxiacetilenici":"oxiacetilenic","oxiacetilenicii":"oxiacetilenic","oxiacetilenicul":"oxiacetilenic","oxiacidul":"oxiacid","oxiacidule":"oxiacid","oxiacidului":"oxiacid","oxiacizi":"oxiacid","oxiacizii":"oxiacid","oxiacizilor":"oxiacid","oxibiotica":["oxibiotică","oxibiotic","oxibiotica","oxibiotic"],"oxibiotice":"oxibiotic","oxibioticele":"oxibiotic","oxibiotici":"oxibiotic","oxibioticii":"oxibiotic","oxibioticul":"oxibiotic","oxicefale":"oxicefală","oxicefalei":"oxicefală","oxicefalele":"oxicefală","oxicefalelor":"oxicefală","oxicefali":"oxicefal","oxicefalia":"oxicefalie","oxicefaliei":"oxicefalie","oxicefalii":["oxicefalii","oxicefal","oxicefalii","oxicefalie"],"oxicefaliile":"oxicefalie","oxicefaliilor":"oxicefalie","oxicefalilor":"oxicefal","oxicefalul":"oxicefal","oxicefalule":"oxicefal","oxicefalului":"oxicefal","oxicloruri":"oxiclorură","oxiclorurii":"oxiclorură","oxiclorurile":"oxiclorură","oxiclorurilor":"oxiclorură","oxidabila":["oxidabilă","oxidabil","oxidabila","oxidabil"],"oxidabile":"oxidabil","oxidabilele":"oxidabil","oxidabili":"oxidabil","oxidabilii":"oxidabil","oxidabilul":"oxidabil","oxidai":"oxida","oxidam":["oxidăm","oxida","oxidam","oxida"],"oxidand":"oxida","oxidanta":["oxidantă","oxidant","oxidanta","oxidant"],"oxidante":"oxidant","oxidantele":"oxidant","oxidanti":"oxidant","oxidantii":"oxidant","oxidantul":"oxidant","oxidara":"oxida","oxidaram":"oxida","oxidarati":"oxida","oxidarea":"oxidare","oxidari":"oxidare","oxidarii":"oxidare","oxidarile":"oxidare","oxidarilor":"oxidare","oxidase":"oxida","oxidasem":"oxida","oxidasera":"oxida","oxidaseram":"oxida","oxidaserati":"oxida","oxidasesi":"oxida","oxidasi":"oxida","oxidat":"oxida","oxidata":["oxidată","oxidat","oxidata","oxidat"],"oxidate":"oxidat","oxidatele":"oxidat","oxidati":["oxidați","oxida","oxidați","oxidat"],"oxidatia":"oxidație","oxidatiei":"oxidație","oxidatii":["oxidații","oxidat","oxidații","oxidație"],"oxidatiile":"oxidație","oxidatiilor":"oxidație","oxidatiunea":"oxidațiune","oxidatiuni":"oxidațiune","oxidatiunii":"oxidațiune","oxidatiunile":"oxidațiune","oxidatiunilor":"oxidațiune","oxidativa":["oxidativă","oxidativ","oxidativa","oxidativ"],"oxidative":"oxidativ","oxidativele":"oxidativ","oxidativi":"oxidativ","oxidativii":"oxidativ","oxidativul":"oxidativ","oxidatul":"oxidat","oxidau":"oxida","oxidaze":"oxidază","oxidazei":"oxidază","oxidazele":"oxidază","oxidazelor":"oxidază","oxideaza":"oxida","oxidez":"oxida","oxidezi":"oxida","oxidimetre":"oxidimetru","oxidimetrele":"oxidimetru","oxidimetrelor":"oxidimetru","oxidimetria":"oxidimetrie","oxidimetrica":["oxidimetrică","oxidimetric","oxidimetrica","oxidimetric"],"oxidimetrice":"oxidimetric","oxidimetricele":"oxidimetric","oxidimetrici":"oxidimetric","oxidimetricii":"oxidimetric","oxidimetricul":"oxidimetric","oxidimetriei":"oxidimetrie","oxidimetrii":"oxidimetrie","oxidimetrul":"oxidimetru","oxidimetrule":"oxidimetru","oxidimetrului":"oxidimetru","oxidoreducerea":"oxidoreducere","oxidoreduceri":"oxidoreducere","oxidoreducerii":"oxidoreducere","oxidoreducerile":"oxidoreducere","oxidoreducerilor":"oxidoreducere","oxidrili":"oxidril","oxidrilii":"oxidril","oxidrililor":"oxidril","oxidrilul":"oxidril","oxidrilule":"oxidril","oxidrilului":"oxidril","oxidul":"oxid","oxidule":"oxid","oxidului":"oxid","oxiei":"oxie","oxifila":["oxifilă","oxifil","oxifila","oxifil"],"oxifile":"oxifil","oxifilele":"oxifil","oxifili":"oxifil","oxifilia":"oxifilie","oxifiliei":"oxifilie","oxifilii":["oxifilii","oxifil","oxifilii","oxifilie"],"oxifiliile":"oxifilie","oxifiliilor":"oxifilie","oxifilul":"oxifil","oxigenai":"oxigena","oxigenam":["oxigenăm","oxigena","oxigenam","oxigena"],"oxigenand":"oxigena","oxigenara":"oxigena","oxigenaram":"oxigena","oxigenarati":"oxigena","oxigenarea":"oxigenare","oxigenari":"oxigenare","oxigenarii":"oxigenare","oxigenarile":"oxigenare","oxigenarilor":"oxigenare","oxigenase":"oxigena","oxigenasem":"oxigena","oxigenasera":"oxigena","oxigenaseram":"oxigena","oxigenaserati":"oxigena","oxigenasesi":"oxigena","oxigenasi":"oxigena","oxigenat":"oxigena","oxigenata":["oxigenată","oxigenat","oxigenata","oxigenat"],"oxigenate":"oxigenat","oxigenatele":"oxigenat","oxigenati":["oxigenați","oxigena","oxigenați","oxigenat"],"oxigenatii":"oxigenat","oxigenatul":"oxigenat","oxigenau":"oxigena","oxigeneaza":"oxigena","oxigenez":"oxigena","oxigenezi":"oxigena","oxigenoterapia":"oxigenoterapie","oxigenoterapiei":"oxigenoterapie","oxigenoterapii":"oxigenoterapie","oxigenoterapiile":"oxigenoterapie","oxigenoterapiilor":"oxigenoterapie","oxigenul":"oxigen","oxigenule":"oxigen","oxigenului":"oxigen","oxihemoglobine":"oxihemoglobină","oxihemoglobinei":"oxihemoglobină","oxihemoglobinele":"oxihemoglobină","oxihemoglobinelor":"oxihemoglobină","oxii":"oxie","oxiile":"oxie","oxiilor":"oxie","oxiliti":"oxilit","oxilitii":"oxilit","oxilitilor":"oxilit","oxilitul":"oxilit","oxilitule":"oxilit","oxilitului":"oxilit","oximetre":"oximetru","oximetrele":"oximetru","oximetrelor":"oximetru","oximetria":"oximetrie","oximetriei":"oximetrie","oximetrii":"oximetrie","oximetrul":"oximetru","oximetrule":"oximetru","oximetrului":"oximetru","oximorone":"oximoron","oximoronele":"oximoron","oximoronelor":"oximoron","oximoronul":"oximoron","oximoronule":"oximoron","oximoronului":"oximoron","oxitona":["oxitonă","oxiton","oxitona","oxiton"],"oxitone":"oxiton","oxitonele":"oxiton","oxitoni":"oxiton","oxitonia":"oxitonie","oxitoniei":"oxitonie","oxitonii":["oxitonii","oxiton","oxitonii","oxitonie"],"oxitoniile":"oxitonie","oxitoniilor":"oxitonie","oxitonile":"oxiton","oxitonilor":"oxiton","oxitonul":"oxiton","oxitonule":"oxiton","oxitonului":"oxiton","oxiuri":"oxiur","oxiuriaze":"oxiuriază","oxiuriazei":"oxiuriază","oxiuriazele":"oxiuriază","oxiuriazelor":"oxiuriază","oxiurii":"oxiur","oxiurilor":"oxiur","oxiurul":"oxiur","oxiurule":"oxiur","oxiurului":"oxiur","oxizi":"oxid","oxizii":"oxid","oxizilor":"oxid","oxosinteze":"oxosinteză","oxosintezei":"oxosinteză","oxosintezele":"oxosinteză","oxosintezelor":"oxosinteză","ozalidul":"ozalid","ozalidule":"ozalid","ozalidului":"ozalid","ozaliduri":"ozalid","ozalidurile":"ozalid","ozalidurilor":"ozalid","ozene":"ozenă","ozenei":"ozenă","ozenele":"ozenă","ozenelor":"ozenă","ozeneuri":"ozeneu","ozeneurile":"ozeneu","ozeneurilor":"ozeneu","ozeneuul":"ozeneu","ozeneuule":"ozeneu","ozeneuului":"ozeneu","ozocherite":"ozocherită","ozocheritei":"ozocherită","ozocheritele":"ozocherită","ozocheritelor":"ozocherită","ozonai":"ozona","ozonam":["ozonăm","ozona","ozonam","ozona"],"ozonand":"ozona","ozonara":"ozona","ozonaram":"ozona","ozonarati":"ozona","ozonase":"ozona","ozonasem":"ozona","ozonasera":"ozona","ozonaseram":"ozona","ozonaserati":"ozona","ozonasesi":"ozona","ozonasi":"ozona","ozonat":"ozona","ozonata":["ozonată","ozonat","ozonata","ozonat"],"ozonate":"ozonat","ozonatele":"ozonat","ozonati":["ozonați","ozona","ozonați","ozonat"],"ozonatii":"ozonat","ozonatul":"ozonat","ozonau":"ozona","ozoneaza":"ozona","ozonez":"ozona","ozonezi":"ozona","ozonide":"ozonidă","ozonidei":"ozonidă","ozonidele":"ozonidă","ozonidelor":"ozonidă","ozonific":"ozonifica","ozonificai":"ozonifica","ozonificam":["ozonificăm","ozonifica","ozonificam","ozonifica"],"ozonificand":"ozonifica","ozonificara":"ozonifica","ozonificaram":"ozonifica","ozonificarati":"ozonifica","ozonificase":"ozonifica","ozonificasem":"ozonifica","ozonificasera":"ozonifica","ozonificaseram":"ozonifica","ozonificaserati":"ozonifica","ozonificasesi":"ozonifica","ozonificasi":"ozonifica","ozonificat":"ozonifica","ozonificati":"ozonifica","ozonificau":"ozonifica","ozonifici":"ozonifica","ozonizai":"ozoniza","ozonizam":["ozonizăm","ozoniza","ozonizam","ozoniza"],"ozonizand":"ozoniza","ozonizara":"ozoniza","ozonizaram":"ozoniza","ozonizarati":"ozoniza","ozonizarea":"ozonizare","ozonizari":"ozonizare","ozonizarii":"ozonizare","ozonizarile":"ozonizare","ozonizarilor":"ozonizare","ozonizase":"ozoniza","ozonizasem":"ozoniza","ozonizasera":"ozoniza","ozonizaseram":"ozoniza","ozonizaserati":"ozoniza","ozonizasesi":"ozoniza","ozonizasi":"ozoniza","ozonizat":"ozoniza","ozonizata":["ozonizată","ozonizat","ozonizata","ozonizat"],"ozonizate":"ozonizat","ozonizatele":"ozonizat","ozonizati":["ozonizați","ozoniza","ozonizați","ozonizat"],"ozonizatii":"ozonizat","ozonizatoare":"ozonizator","ozonizatore":"ozonizator","ozonizatorele":"ozonizator","ozonizatorelor":"ozonizator","ozonizatorul":"ozonizator","ozonizatorule":"ozonizator","ozonizatorului":"ozonizator","ozonizatul":"ozonizat","ozonizau":"ozoniza","ozonizeaza":"ozoniza","ozonizez":"ozoniza","ozonizezi":"ozoniza","ozonizoare":"ozonizor","ozonizore":"ozonizor","ozonizorele":"ozonizor","ozonizorelor":"ozonizor","ozonizorul":"ozonizor","ozonizorule":"ozonizor","ozonizorului":"ozonizor","ozonometre":"ozonometru","ozonometrele":"ozonometru","ozonometrelor":"ozonometru","ozonometria":"ozonometrie","ozonometrica":["ozonometrică","ozonometric","ozonometrica","ozonometric"],"ozonometrice":"ozonometric","ozonometricele":"ozonometric","ozonometrici":"ozonometric","ozonometricii":"ozonometric","ozonometricul":"ozonometric","ozonometriei":"ozonometrie","ozonometrii":"ozonometrie","ozonometriile":"ozonometrie","ozonometriilor":"ozonometrie","ozonometrul":"ozonometru","ozonometrule":"ozonometru","ozonometrului":"ozonometru","ozonoscoape":"ozonoscop","ozonoscoapele":"ozonoscop","ozonoscoapelor":"ozonoscop","ozonoscopul":"ozonoscop","ozonoscopule":"ozonoscop","ozonoscopului":"ozonoscop","ozonosfere":"ozonosferă","ozonosferei":"ozonosferă","ozonosferele":"ozonosferă","ozonosferelor":"ozonosferă","ozonoterapia":"ozonoterapie","ozonoterapiei":"ozonoterapie","ozonoterapii":"ozonoterapie","ozonoterapiile":"ozonoterapie","ozonoterapiilor":"ozonoterapie","ozonul":"ozon","ozonule":"ozon","ozonului":"ozon"};
@@ -0,0 +1 @@
+export default {"-":["-","babysitter","-","bacara","-","bade","-","bădițică","-","bălănică","-","bale","-","balerină","-","baletistă","-","barmaniță","-","băsma","-","bază","-","bazicitate","-","beizadea","-","bej","-","bele-arte","-","bengali","-","beton","-","bezea","-","bibilică","-","bideu","-","bidinea","-","bienal","-","bimanitate","-","bina","-","binaritate","-","bine","-","biochimistă","-","biocibernetic","-","biocinetic","-","biodiversitate","-","bioelectricitate","-","biologă","-","biosime","-","biotehniciană","-","bisericuță","-","biv","-","blană","-","blănăreasă","-","bleu","-","boccea","-","bogățică","-","bomboană","-","bordo","-","bortă","-","boscoroade","-","botanistă","-","brândușea","-","brânză","-","brevitate","-","brînză","-","britani","-","broborigme","-","bruma","-","bucățea","-","burghezime","-","burlac","-","burlesc","-","buzățică","-","ebriozitate","-","echivocitate","-","ecologă","-","economistă","-","ectoparazit","-","eficace","-","elecțiune","-","electriciană","-","electrotehnic","-","elfă","-","entomologă","-","entomostraceu","-","epurare etnică","-","erpetologă","-","esteticiană","-","etnicism","-","etnologă","-","evghenichi","-","excepționalitate","-","explicitate","-","expre","-","făgețel","-","falbala","-","fărădelege","-","farfara","-","farin","-","farmacistă","-","farmacologă","-","fâsă","-","februarie","-","fecioară","-","ferice","-","feroelectricitate","-","fesfesele","-","fiară","-","fiecare","-","filabilitate","-","fitologă","-","fiziciană","-","fiziologă","-","flaciditate","-","floristă","-","flotă","-","foacăle","-","foaltine","-","forsiția","-","forte","-","fotbalistă","-","fotomecanică","-","frențe","-","frizeriță","-","fucking","-","fucsia","-","fugace","-","fulgui","-","full-time","-","fustă","-","gaga","-","gaiță","-","gălbenea","-","gata","-","gatii","-","găurea","-","gay","-","geamparale","-","genealogistă","-","geneticiană","-","geofiziciană","-","geografă","-","geologă","-","geriatră","-","get-beget","-","ghionoaie","-","ghiulea","-","ghizdea","-","gigea","-","gigică","-","gimnastă","-","ginecologă","-","giugiuc","-","giuvaiericale","-","glaciologă","-","gogeamite","-","gogoșea","-","golătate","-","gonghicioare","-","gracilitate","-","grădinăreasă","-","gramaticalitate","-","gratis","-","grâușor","-","grecitate","-","grena","-","gri","-","grindina","-","grizzly","-","gruie","-","guarana","-","gustativitate","-","guvernantă","-","haimana","-","haită","-","hâlbușoare","-","halca","-","haraba","-","hata","-","hataia","-","hate","-","hemimetabolă","-","heterometabolă","-","hevea","-","hi-fi","-","hidrocoră","-","hidrofil","-","hidrologă","-","high","-","hindustani","-","hiperaciditate","-","hiperbolă","-","hiperexcitabilitate","-","hipertonicitate","-","hipotonicitate","-","hippy","-","horror","-","horticultoare","-","hrișcă","-","jartea","-","jieneasca","-","joacă","-","jucărea","-","jujubă","-","jumară","-","juristă","-","juxtaliniară","-","kaki","-","kamala","-","keta","-","kiwi","-","koala","-","lăboaie","-","lacrimozitate","-","lafire","-","laiv","-","lamină","-","lapidaritate","-","lărguliță","-","larvă","-","lațe","-","latinătate","-","leoarcă","-","lepidopterologă","-","lestie","-","leva","-","levitate","-","lexicografă","-","lezmaiestate","-","lezmajestate","-","liber-schimbism","-","lichid preejaculator","-","lichidatorism","-","lila","-","lilialitate","-","liliput","-","limnologă","-","linciurire","-","lingou","-","lingvistă","-","lipsă","-","litografă","-","live","-","livrea","-","lobbyistă","-","locomobil","-","locuibilitate","-","logicitate","-","lulea","-","lupercalii","-","luxuriozitate","-","nadoleancă","-","narativitate","-","nașpa","-","nativitate","-","navă","-","nea","-","necompatibilitate","-","negata","-","negritudine","-","negru de fum","-","nelocuibilitate","-","nemoarte","-","neotectonic","-","nepereche","-","nesațietate","-","nestimată","-","netezel","-","neurologă","-","neviolabilitate","-","niciun","-","ninge","-","nirvana","-","nișastea","-","niscai","-","niscaiva","-","non-stop","-","nonprofit","-","noră","-","nostru","-","nuga","-","nuneasca","-","nutriționistă","-","oareșicare","-","obiectualitate","-","obținere","-","ocazionalitate","-","oceanografă","-","ochi maro","-","ocluzivă","-","odor","-","oliv","-","omonimitate","-","oncogen","-","oncologă","-","onestate","-","onoare","-","oprobriu","-","oranj","-","organicitate","-","oricine","-","orientabilitate","-","orientare sexuală","-","orișicine","-","ornitologă","-","ortopedă","-","ortopedistă","-","osana","-","otova","-","oua","-","ovalitate","-","oviliciune","-","-a","-","-e","-","-ea","-","-i","-","-î","-","аменинца","-","букура","-","зи","-","зиче","-","машинэ","-","републикэ","-","рублэ","-","собэ","-","советикэ","-","фи","-","хомосексуалитате","-","хухура","-","quechua","-","quidditate","-","radiostea","-","rămurea","-","rămurel","-","râncaci","-","rândunică","-","răpăcioage","-","răpițiște","-","răsâpiciune","-","răscogea","-","ratite","-","Rățoiul Daffy","-","Rățoiul Donald","-","răza","-","recesivitate","-","recidivitate","-","reflexibilitate","-","reglabilitate","-","reprezentativitate","-","retard","-","rețe","-","rețetă","-","retivitate","-","retro","-","rezulta","-","robiciune","-","roiște","-","romanticitate","-","romanțiozitate","-","rostime","-","rotativ","-","rouă","-","roura","-","roz","-","rudimentaritate","-","rundă","-","tactilitate","-","taiga","-","tălmăzoaice","-","tâmpla","-","tanagra","-","tangibilitate","-","țărancă","-","tarantulă","-","tarapangele","-","Târgu Secuiesc","-","tarla","-","tătărcele","-","tatu","-","tău","-","țeară","-","tejghea","-","temenea","-","temporalitate","-","tenismană","-","tenuitate","-","terestritate","-","tergimea","-","teribile","-","termalitate","-","tesla","-","tifoidă","-","țiglă","-","tindere","-","țipător","-","tipicitate","-","tiramisu","-","tobă","-","tocmăgei","-","topless","-","torero","-","torță","-","tortuozitate","-","tot","-","tot-teren","-","traducere automată","-","traductibilitate","-","tranchilitate","-","transbordare","-","transcendentalitate","-","transmutabilitate","-","trăsnaie","-","tremurător","-","tretii","-","triatlonistă","-","tridimensionalitate","-","trifidă","-","trufanda","-","turbure","-","turnant","-","turturică","-","țuțăneasca","-","ubertate","-","ufologie","-","ultra","-","ultraacustic","-","umanioare","-","umilitate","-","underground","-","unidimensionalitate","-","unisex","-","universale","-","urologă","-","urzitor","-","uscăturea","-","ustura","-","ușurătate","-","ușurică","-","vacsinuire","-","vagabondaj","-","vâjâitor","-","vâlvoi","-","văpsea","-","varvarime","-","vascularitate","-","vasomotricitate","-","vâzdogea","-","vechietate","-","vegetală","-","vegetativitate","-","vel","-","venerabilitate","-","verbalitate","-","verguritate","-","verighetă","-","vernil","-","viceamiralitate","-","viciozitate","-","video","-","viețuitate","-","viforî","-","vigurozitate","-","vinețea","-","vinozitate","-","vioară","-","vioitate","-","violaceu","-","virologă","-","viscoelasticitate","-","vișinea","-","vitelin","-","vivace","-","vizualitate","-","voie","-","voluminitate","-","voluminozitate","-","voluptuozitate","-","vostru","-","vreun","-","vulcanologă","-","zăbrea","-","zaharicale","-","zalhana","-","zarzavagioaică","-","zeflemea","-","zelozitate","-","zenana","-","zglăvoc","-","zglobietate","-","zoologă","-","zurna"],"-a":["-ă","-î","-a","-ua"],"-abilitatea":"-abilitate","-abilitati":"-abilitate","-abilitatii":"-abilitate","-abilitatile":"-abilitate","-abilitatilor":"-abilitate","-aciune":"-ciune","-aciunea":"-ăciune","-aciuni":"-ăciune","-ai":["-ai","-a","-ăi","-aie","-ai","-î","-âi","-î"],"-aia":"-aie","-aii":"-aie","-aile":"-aie","-ailor":"-aie","-aje":"-aj","-ala":["-ală","-al","-ala","-al"],"-ale":"-al","-alele":"-al","-ali":"-al","-alii":"-al","-alul":"-al","-am":["-ăm","-a","-am","-a","-âm","-î","-am","-î"],"-amant":"-mânt","-ana":["-ană","-an","-ana","-an"],"-and":["-ând","-a","-ând","-e","-ând","-ea","-ând","-î"],"-ane":"-an","-anele":"-an","-ani":"-an","-anii":"-an","-ante":"-anță","-antei":"-anță","-antele":"-anță","-antelor":"-anță","-anul":"-an","-ara":["-ară","-a","-âră","-î"],"-aram":["-arăm","-a","-ârăm","-î"],"-arati":["-arăți","-a","-ârăți","-î"],"-areata":["-ăreață","-ăreț","-ăreața","-ăreț"],"-arete":"-ăreț","-aretele":"-ăreț","-areti":"-ăreț","-aretii":"-ăreț","-aretul":"-ăreț","-ari":"-ar","-arii":"-ar","-arilor":"-ar","-ariu":"-ar","-arul":"-ar","-arule":"-ar","-arului":"-ar","-asc":"-esc","-asem":["-asem","-a","-âsem","-î"],"-asera":["-aseră","-a","-âseră","-î"],"-aseram":["-aserăm","-a","-âserăm","-î"],"-aserati":["-aserăți","-a","-âserăți","-î"],"-asesi":["-aseși","-a","-âseși","-î"],"-asi":["-ași","-a","-ași","-aș","-âși","-î"],"-asii":"-aș","-asilor":"-aș","-aste":"-ește","-asti":"-ești","-asul":"-aș","-asule":"-aș","-asului":"-aș","-at":["-at","-a","-at","-ată","-at","-ate","-at","-ați","-ăt","-et","-ât","-î"],"-ata":["-ată","-at","-ata","-at","-ată","-ate","-ată","-ați"],"-atate":"-tate","-atatea":"-ătate","-atati":"-ătate","-atatii":"-ătate","-atatile":"-ătate","-atatilor":"-ătate","-ate":["-ate","-at","-ate","-ată","-ate","-ați"],"-atec":"-atic","-atele":"-at","-ati":["-ați","-a","-ați","-at","-ați","-ată","-ați","-ate","-âți","-î","-ați","-î"],"-atica":["-atică","-atic","-atica","-atic"],"-atice":"-atic","-aticele":"-atic","-atici":"-atic","-aticii":"-atic","-aticul":"-atic","-atii":"-at","-atoare":"-ător","-atoarea":"-ător","-atoarele":"-ător","-ator":"-tor","-atori":"-ător","-atorii":"-ător","-atorul":"-ător","-atul":["-atul","-at","-ătul","-ăt"],"-atule":"-ăt","-atului":"-ăt","-aturi":"-ătură","-aturii":"-ătură","-aturile":"-ătură","-aturilor":"-ătură","-au":["-au","-a","-au","-î"],"-bila":["-bilă","-bil","-bila","-bil"],"-bile":"-bil","-bilele":"-bil","-bili":"-bil","-bilii":"-bil","-bilul":"-bil","-ce":"-că","-cei":"-că","-cele":"-că","-celor":"-că","-cios":"-icios","-ciunea":"-ciune","-ciuni":"-ciune","-ciunii":"-ciune","-ciunile":"-ciune","-ciunilor":"-ciune","-cratia":"-crație","-cratiei":"-crație","-cratii":"-crație","-cratiile":"-crație","-cratiilor":"-crație","-e":["-e","-ă","-e","-ea","-e","-i","-e","-le"],"-ea":"-el","-eai":["-eai","-e","-eai","-ea","-eai","-i"],"-eam":["-eam","-e","-eam","-ea","-eam","-i"],"-eana":["-eană","-ean","-eana","-ean"],"-eanul":"-ean","-easca":["-ească","-esc","-easca","-esc"],"-eata":["-eață","-eț","-eața","-eț"],"-eati":["-eați","-e","-eați","-ea","-eați","-i"],"-eau":["-eau","-e","-eau","-ea","-eau","-i"],"-eaua":"-ea","-ei":["-ei","-ă","-ei","-ea","-ei","-el","-ei","-lei"],"-eii":"-el","-eilor":"-el","-el":"-ea","-ele":["-ele","-ă","-ele","-ea","-ele","-el"],"-elei":"-ea","-elele":"-ea","-elelor":"-ea","-eli":"-eală","-elii":"-eală","-elile":"-eală","-elilor":"-eală","-elor":"-ă","-elul":"-el","-elule":"-el","-elului":"-el","-em":["-em","-e","-em","-ea"],"-ence":"-eancă","-encei":"-eancă","-encele":"-eancă","-encelor":"-eancă","-ene":["-ene","-ean","-ene","-eană"],"-enei":"-eană","-enele":["-enele","-ean","-enele","-eană"],"-enelor":"-eană","-eni":"-ean","-enii":"-ean","-enta":"-ință","-ente":"-ență","-entei":"-ență","-entele":"-ență","-entelor":"-ență","-erie":"-ărie","-escul":"-esc","-ese":["-ese","-easa","-ese","-easă"],"-esei":["-esei","-easa","-esei","-easă"],"-esele":["-esele","-easa","-esele","-easă"],"-eselor":["-eselor","-easa","-eselor","-easă"],"-este":"-esc","-esti":"-esc","-estii":"-esc","-estile":"-esc","-ete":["-ete","-ăt","-ețe","-eață","-ete","-et","-ețe","-eț"],"-etea":"-ețe","-etei":["-eței","-eață","-eței","-ețe"],"-etele":["-etele","-ăt","-ețele","-eață","-etele","-et","-ețele","-eț","-ețele","-ețe"],"-etelor":["-etelor","-ăt","-ețelor","-eață","-etelor","-et","-ețelor","-ețe"],"-eti":["-eți","-e","-eți","-ea","-eți","-eț"],"-etii":"-eț","-etul":["-etul","-et","-ețul","-eț"],"-etule":"-et","-etului":"-et","-eturi":"-et","-eturile":"-et","-eturilor":"-et","-eza":["-eză","-ez","-eza","-ez"],"-eze":"-ez","-ezele":"-ez","-ezi":"-ez","-ezii":"-ez","-ezul":"-ez","-i":["-i","bacara","-i","britani","-i","grâușor","-i","guarana","-i","hevea","-i","keta","-i","nirvana","-i","-a","-i","-e","-i","-ea","-i","tesla","-i","tocmăgei","-i","ultraacustic"],"-ia":["-ia","-ie","-ia","-iu"],"-ibilitate":"-abilitate","-ica":["-ică","-ic","-ica","-ic"],"-ice":"-ic","-iceasca":["-icească","-icesc","-iceasca","-icesc"],"-icele":"-ic","-icescul":"-icesc","-iceste":"-icesc","-icesti":"-icesc","-icestii":"-icesc","-icestile":"-icesc","-ici":["-ici","-ic","-ici","-ică"],"-icii":"-ic","-icioasa":["-icioasă","-icios","-icioasa","-icios"],"-icioase":"-icios","-icioasele":"-icios","-iciosi":"-icios","-iciosii":"-icios","-iciosul":"-icios","-icul":"-ic","-ie":"-iu","-iei":"-ie","-ii":["-ii","-i","-ii","-ie","-ii","-iu"],"-iii":"-iu","-iile":["-iile","-ie","-iile","-iu"],"-iilor":"-ie","-im":"-i","-imea":"-ime","-imi":"-ime","-imii":"-ime","-imile":"-ime","-imilor":"-ime","-ind":["-înd","-ând","-ind","-i"],"-inta":["-ință","-anță","-ință","-ență"],"-inte":"-ință","-intei":"-ință","-intele":"-ință","-intelor":"-ință","-ioara":"-ior","-ioare":["-ioare","-ioară","-ioare","-ior"],"-ior":"-ioară","-iori":["-iori","-ioară","-iori","-ior"],"-ira":"-i","-iram":"-i","-irati":"-i","-isem":"-i","-isera":"-i","-iseram":"-i","-iserati":"-i","-isesi":"-i","-isi":"-i","-isme":"-ism","-ismele":"-ism","-ismelor":"-ism","-ismul":"-ism","-ismule":"-ism","-ismului":"-ism","-isoara":["-ișoară","-ișor","-ișoara","-ișor"],"-isoare":"-ișor","-isoarele":"-ișor","-isor":"-șor","-isori":"-ișor","-isorii":"-ișor","-isorul":"-ișor","-ista":["-istă","-ist","-ista","-ist"],"-iste":"-ist","-istea":"-iște","-istele":"-ist","-isti":["-iști","-ist","-iști","-iște"],"-istii":["-iștii","-ist","-iștii","-iște"],"-istile":"-iște","-istilor":"-iște","-istul":"-ist","-it":"-i","-itatea":"-itate","-itati":"-itate","-itatii":"-itate","-itatile":"-itate","-itatilor":"-itate","-ite":"-iță","-itei":"-iță","-itele":"-iță","-itelor":"-iță","-iti":"-i","-iul":"-iu","-iunea":"-iune","-iuni":"-iune","-iunii":"-iune","-iunile":"-iune","-iunilor":"-iune","-iva":["-ivă","-iv","-iva","-iv"],"-ive":"-iv","-ivele":"-iv","-ivi":"-iv","-ivii":"-iv","-ivul":"-iv","-l":"-ul","-le":["-le","etnicism","-le","făgețel","-le","liber-schimbism","-le","lichidatorism","-le","oprobriu","-le","-e","-le","vagabondaj"],"-lei":"-ei","-logia":"-logie","-logica":["-logică","-logic","-logica","-logic"],"-logice":"-logic","-logicele":"-logic","-logici":"-logic","-logicii":"-logic","-logicul":"-logic","-logiei":"-logie","-logii":"-logie","-lor":["-lor","britani","-lor","etnicism","-lor","făgețel","-lor","grâușor","-lor","liber-schimbism","-lor","lichidatorism","-lor","oprobriu","-lor","tocmăgei","-lor","vagabondaj"],"-lui":"-ului","-mantul":"-mânt","-mantule":"-mânt","-mantului":"-mânt","-mint":"-mânt","-minte":"-mânt","-mintele":"-mânt","-mintelor":"-mânt","-oaia":"-oaie","-oaice":"-oaică","-oaicei":"-oaică","-oaicele":"-oaică","-oaicelor":"-oaică","-oaie":["-oaie","-oaia","-oaie","-oi"],"-oaiei":["-oaiei","-oaia","-oaiei","-oaie"],"-oaiele":["-oaiele","-oaia","-oaiele","-oaie","-oaiele","-oi"],"-oaielor":["-oaielor","-oaia","-oaielor","-oaie","-oaielor","-oi"],"-oarea":"-oare","-oasa":["-oasă","-os","-oasa","-os"],"-oase":"-os","-oasele":"-os","-oi":"-oiu","-oii":"-oi","-oilor":"-oi","-oiul":["-oiul","-oi","-oiul","-oiu"],"-oiule":["-oiule","-oi","-oiule","-oiu"],"-oiului":["-oiului","-oi","-oiului","-oiu"],"-ori":"-oare","-orii":"-oare","-orile":"-oare","-orilor":"-oare","-osi":"-os","-osii":"-os","-osul":"-os","-rea":"-re","-ri":"-re","-rii":"-re","-rile":"-re","-rilor":"-re","-soara":["-șoară","-șor","-șoara","-șor"],"-soare":"-șor","-soarele":"-șor","-sori":["-șori","-șor","-șori","-ușor"],"-sorii":"-șor","-sorul":"-șor","-sprece":"-sprezece","-tate":["-tate","-ătate","-tate","-itate"],"-tatea":"-tate","-tati":"-tate","-tatii":"-tate","-tatile":"-tate","-tatilor":"-tate","-tia":"-ție","-tie":"-țiune","-tiei":"-ție","-tii":"-ție","-tiile":"-ție","-tiilor":"-ție","-tiune":"-ție","-tiunea":"-țiune","-tiuni":"-țiune","-tiunii":"-țiune","-tiunile":"-țiune","-tiunilor":"-țiune","-toare":"-tor","-toarea":["-toarea","-toare","-toarea","-tor"],"-toarei":"-toare","-toarele":["-toarele","-toare","-toarele","-tor"],"-toarelor":"-toare","-tori":"-tor","-torii":"-tor","-torul":"-tor","-turi":"-tură","-turii":"-tură","-turile":"-tură","-turilor":"-tură","-ua":"-a","-ui":"-ea","-uia":"-ui","-uie":"-ui","-uii":"-ui","-uile":"-ui","-uiul":"-ui","-ul":"-l","-ulite":"-uliță","-ulitei":"-uliță","-ulitele":"-uliță","-ulitelor":"-uliță","-ului":"-lui","-ura":["-ură","-ea","-ură","-tură"],"-uram":"-ea","-urati":"-ea","-ure":"-ură","-urei":"-ură","-urele":"-ură","-urelor":"-ură","-uri":"-ură","-urile":"-uri","-urilor":"-uri","-usem":"-ea","-usera":"-ea","-useram":"-ea","-userati":"-ea","-usesi":"-ea","-usi":["-uși","-ea","-uși","-uș"],"-usii":"-uș","-usilor":"-uș","-usori":"-ușor","-usorii":"-ușor","-usorilor":"-ușor","-usorul":"-ușor","-usorule":"-ușor","-usorului":"-ușor","-uste":"-ușcă","-usul":"-uș","-usule":"-uș","-usului":"-uș","-ut":"-ea","-uta":["-uță","-uț","-uța","-uț"],"-ute":["-uțe","-uț","-uțe","-uță"],"-utei":"-uță","-utele":["-uțele","-uț","-uțele","-uță"],"-utelor":"-uță","-uti":"-uț","-utii":"-uț","-utul":"-uț","-исм":"-ism","-крацие":"-crație","{{{def}}}":["{{{def}}}","hata","{{{def}}}","tergimea","{{{def}}}","vacsinuire"],"{{{pl}}}":["{{{pl}}}","kamala","{{{pl}}}","tanagra"],"{{{pl}}}i":["{{{pl}}}i","kamala","{{{pl}}}i","tanagra"],"а (a)":"А","а аменинца":"аменинца","а аменинца 1st conjugation":"аменинца","а букура":"букура","а букура 1st conjugation":"букура","а зиче":"зиче","а зиче 3rd conjugation":"зиче","а фи":"фи","а фи [conj]":"фи","а фи фост":"фи","а хухура":"хухура","а хухура 1st conjugation":"хухура","а юби":"юби","а юби 4th conjugation":"юби","алга":"алгэ","алго":"алгэ","алжe":"алгэ","алжeи":"алгэ","алжeле":"алгэ","алжeлор":"алгэ","аменинц":"аменинца","аменинцаи":"аменинца","аменинцам":"аменинца","аменинцарам":"аменинца","аменинцасе":"аменинца","аменинцасем":"аменинца","аменинцасерэм":"аменинца","аменинцасешь":"аменинца","аменинцат":"аменинца","аменинцаць":"аменинца","аменинцашь":"аменинца","аменинцынд":"аменинца","аменинць":"аменинца","аменинцэ":"аменинца","аменинцэм":"аменинца","анархистул":"анархист","анархистулуи":"анархист","анархиштии":"анархист","анархиштилор":"анархист","анархишть":"анархист","археологул":"археолог","археологулуи":"археолог","археоложии":"археолог","археоложилор":"археолог","археоложь":"археолог","бабэ":"babă","багаж":"bagaj","база":"baza","базэ":"bază","бак":"bac","бакалауреат":"bacalaureat","бан":"ban","банда":"banda","бандаж":"bandaj","бараж":"baraj","батат":"batat","бате":"bate","бебелуш":"bebeluș","бецив":"bețiv","бинефэкэтор":"binefăcător","биографика":"biografica","биографикэ":"biografică","биоложие":"biologie","биоложик":"biologic","биоложия":"biologia","бисексуалитате":"bisexualitate","бисерикэ":"biserică","богат":"bogat","бои":"boi","боикот":"boicot","бомбардиер":"bombardier","бомбонел":"bombonel","боркан":"borcan","бот":"bot","боу":"bou","брасаж":"brasaj","будэ":"budă","буженицэ":"bujeniță","букур":"букура","букураи":"букура","букурам":"букура","букурарам":"букура","букурасе":"букура","букурасем":"букура","букурасерэм":"букура","букурасешь":"букура","букурат":"букура","букураць":"букура","букурашь":"букура","букурешть":"București","букурештюл":"Букурешть","букурештюле":"Букурешть","букурештюлуи":"Букурешть","букурос":"bucuros","букурынд":"букура","букурь":"букура","букурэ":"букура","букурэм":"букура","букэ":"bucă","булон":"bulon","бура":"bura","бурлан":"burlan","бэеции":"бэят","бэецилор":"бэят","бэлан":"bălan","бэрбат":"bărbat","бэрбатул":"бэрбат","бэрбатулуи":"бэрбат","бэрбации":"бэрбат","бэрбацилор":"бэрбат","бэятул":"бэят","бэятулуи":"бэят","варэ":"vară","василе":"Vasile","вени":"veni","верде":"verde","веришоарэ":"verișoară","вертебрэ":"vertebră","вертикал":"vertical","винэ":"vină","виселе":"вис","виселор":"вис","висул":"вис","висулуи":"вис","виу":"viu","вынт":"vânt","вьеспе":"viespe","вэр":"văr","г (g)":"Г","газос":"gazos","гидон":"ghidon","господэрие":"gospodărie","гратис":"gratis","гратуит":"gratuit","греутате":"greutate","гречия":"Grecia","григореску":"Grigorescu","грузия":"Gruzia","група":"grupa","групэ":"grupă","грэмадэ":"grămadă","гэинь":"găini","гэинэ":"găină","гэозар":"găozar","гэси":"găsi","гэсит":"găsit","делирул":"делир","делирулуи":"делир","делируриле":"делир","делирурилор":"делир","доктории":"доктор","докторилор":"доктор","докторул":"доктор","докторулуи":"доктор","е":"e","егалитате":"egalitate","едиториал":"editorial","едифичиу":"edificiu","еклипсэ":"eclipsă","екскожита":"excogita","експериенцэ":"experiență","ел":"el","елеват":"elevat","елефант":"elefant","елипсэ":"elipsă","емир":"emir","енержетик":"energetic","енчиклопедие":"enciclopedie","енчиклопедия":"enciclopedia","епископ":"episcop","ера":"фи","ераи":"фи","ерам":"фи","есте":["есте","este","есте","фи"],"етаж":"etaj","етнографика":"etnografica","етнографикэ":"etnografică","еуропа":"Europa","ешть":["ешть","ești","ешть","фи"],"жеографие":"geografie","жеографика":"geografica","жеографикэ":"geografică","жеография":"geografia","жеоложия":"geologia","жеометрие":"geometrie","жермания":"Germania","жоакэ":"joacă","жука":"juca","жумате":"jumate","жумэтате":"jumătate","жустицие":"justiție","закуси":"zacusi","збате":"zbate","збура":"zbura","звэпэят":"zvăpăiat","зебрэ":"zebră","зече":"zece","зечимал":"zecimal","зи":"зиче","зик":"зиче","зикынд":"зиче","зикэ":"зиче","зиле":"зи","зилеи":"зи","зилеле":"зи","зилелор":"зи","зис":"зиче","зисе":"зиче","зисеи":"зиче","зисерэм":"зиче","зисесе":"зиче","зисесем":"зиче","зисесерэм":"зиче","зисесешь":"зиче","зисешь":"зиче","зиуа":"зи","зича":"зиче","зичаи":"зиче","зичам":"зиче","зичем":"зиче","зичець":"зиче","зичь":"зиче","злоташ":"zlotaș","зонэ демилитаризатэ":"zonă demilitarizată","империалистул":"империалист","империалистулуи":"империалист","империалиштии":"империалист","империалиштилор":"империалист","империалишть":"империалист","италиеи":"Италия","к (c)":"К","капиталистул":"капиталист","капиталистулуи":"капиталист","капиталиштии":"капиталист","капиталиштилор":"капиталист","капиталишть":"капиталист","кишинэул":"Кишинэу","кишинэулуи":"Кишинэу","комунистул":"комунист","комунистулуи":"комунист","комуништии":"комунист","комуништилор":"комунист","комуништь":"комунист","копеичи":"копейкэ","космонаутул":"космонаут","космонаутулуи":"космонаут","космонауции":"космонаут","космонауцилор":"космонаут","космонауць":"космонаут","кынтэреции":"кынтэрец","кынтэрецилор":"кынтэрец","кынтэрецул":"кынтэрец","кынтэрецулуи":"кынтэрец","ла":"la","ланц":"lanț","левретэ":"levretă","левриер":"levrier","лега":"lega","легаре":"legare","лесбиян":"lesbian","лесбиянэ":"lesbiană","леу":"leu","леукэ":"leucă","либерал":"liberal","либертате":"libertate","ликид":"lichid","лимба":"limba","лимбаж":"limbaj","лимбэ":"limbă","липси":"lipsi","липсэ":"lipsă","лишицэ":"lișiță","лоитрэ":"loitră","лондра":"Londra","луа":"lua","луи":"lui","лунэ":"lună","луп":"lup","лупашку":"Lupașcu","машина":"машинэ","машине":"машинэ","машинеи":"машинэ","машинеле":"машинэ","машинелор":"машинэ","молдовеи":"Молдова","молдовенескул":"молдовенеск","молдовенештии":"молдовенеск","молдовенештиле":"молдовенеск","молдовенешть":"молдовенеск","молдовеняска":"молдовенеск","молдовеняскэ":"молдовенеск","морковии":"морков","морковилор":"морков","морковул":"морков","морковулуи":"морков","морковь":"морков","московеи":"Москова","н (n)":"н","навигатор":"navigator","навигатории":"навигатор","навигаторилор":"навигатор","навигаторул":"навигатор","навигаторулуи":"навигатор","навигаторь":"навигатор","нап":"nap","националистул":"националист","националистулуи":"националист","националиштии":"националист","националиштилор":"националист","националишть":"националист","нациуниле уните":"Națiunile Unite","наште":"naște","наштере":"naștere","негру":"negru","нервос":"nervos","нечесита":"necesita","нечеситате":"necesitate","нистру":"Nistru","нистрян":"Nistrian","ниште":"niște","ниште анархишть":"анархист","ниште археоложь":"археолог","ниште бэець":"бэят","ниште бэрбаць":"бэрбат","ниште висе":"вис","ниште делирурь":"делир","ниште докторь":"доктор","ниште империалишть":"империалист","ниште капиталишть":"капиталист","ниште комуништь":"комунист","ниште космонауць":"космонаут","ниште кынтэрець":"кынтэрец","ниште морковь":"морков","ниште навигаторь":"навигатор","ниште националишть":"националист","ниште ображь":"образ","ниште партиде":"партид","ниште пенисурь":"пенис","ниште психоложь":"психолог","ниште сепаратишть":"сепаратист","ниште совете":"совет","ниште советичь":"советик","ниште солдаць":"солдат","ниште тероришть":"терорист","ниште фоноложь":"фонолог","ноапте":"noapte","ноаптя":"ноапте","ноастрэ":"noastră","нопции":"ноапте","нопциле":"ноапте","нопцилор":"ноапте","нопць":"ноапте","нотацие":"notație","ноу":"nou","ну":"nu","ну аменинца":"аменинца","ну аменинцаць":"аменинца","ну букура":"букура","ну букураць":"букура","ну зиче":"зиче","ну зичець":"зиче","ну хухура":"хухура","ну хухураць":"хухура","ну юби":"юби","ну юбиць":"юби","нумаи":"numai","нэрав":"nărav","нэскаре":"născare","нэскут":"născut","нэсос":"năsos","нє":"ne","о":["о","П","о","п"],"оае":"oaie","оарекаре":"oarecare","обез":"obez","ображии":"образ","ображилор":"образ","ображь":"образ","образул":"образ","образулуи":"образ","ои":"oi","олга":"Olga","операт":"operat","операта":"operata","ораш":"oraș","организа":"organiza","организаре":"organizare","организат":"organizat","организацие":"organizație","организация":"organizația","организация нациунилор уните":"Organizația Națiunilor Unite","ордин":"ordin","ордине":"ordine","ордона":"ordona","орь":"ori","орькаре":"oricare","оу":"ou","оуа":"oua","офта":"ofta","оцел":"oțel","партиде":"партид","партиделе":"партид","партиделор":"партид","партидул":"партид","партидулуи":"партид","пенисул":"пенис","пенисулуи":"пенис","пенисуриле":"пенис","пенисурилор":"пенис","психологул":"психолог","психологулуи":"психолог","психоложии":"психолог","психоложилор":"психолог","психоложь":"психолог","радикал":"radical","раион":"raion","регулар":"regular","режиуне":"regiune","резема":"rezema","резерва":"rezerva","резолва":"rezolva","ректангулар":"rectangular","рекурже":"recurge","релевмент":"relevment","ренунца":"renunța","репета":"repeta","репетент":"repetent","репродуче":"reproduce","репродучере":"reproducere","република":["република","републикэ","република","republica"],"република федералэ жермания":"Republica Federală Germania","републикэ":"republică","републичи":"републикэ","републичии":"републикэ","републичиле":"републикэ","републичилор":"републикэ","речикларе":"reciclare","речита":"recita","рмн":"RMN","ромын":"român","ромыне":"române","ромыниеи":"Ромыния","ромыния":"România","ромынь":"români","ромынэ":"română","рсс молдовеняскэ":"RSS Moldovenească","рубла":"рублэ","рубле":"рублэ","рублеи":"рублэ","рублеле":"рублэ","рублелор":"рублэ","рублэ":"rublă","рус":"rus","русиеи":"Русия","русия":"Rusia","русэ":"rusă","рыу":"râu","рэбда":"răbda","рэзбои":["рэзбой","război","рэзбои","război"],"рэуфэкэтор":"răufăcător","с (s)":"с","сепаратистул":"сепаратист","сепаратистулуи":"сепаратист","сепаратиштии":"сепаратист","сепаратиштилор":"сепаратист","сепаратишть":"сепаратист","соба":"собэ","собе":"собэ","собеи":"собэ","собеле":"собэ","собелор":"собэ","совете":"совет","советеле":"совет","советелор":"совет","советика":"советикэ","советикул":"советик","советикулуи":"советик","советиче":"советикэ","советичеи":"советикэ","советичеле":"советикэ","советичелор":"советикэ","советичи":"советик","советичии":"советик","советичилор":"советик","советул":"совет","советулуи":"совет","солдатул":"солдат","солдатулуи":"солдат","солдации":"солдат","солдацилор":"солдат","солдаць":"солдат","сынт":"фи","сынтем":"фи","сэ аменинц":"аменинца","сэ аменинце":"аменинца","сэ аменинць":"аменинца","сэ аменинцэм":"аменинца","сэ букур":"букура","сэ букуре":"букура","сэ букурь":"букура","сэ букурэм":"букура","сэ зик":"зиче","сэ зикэ":"зиче","сэ зичем":"зиче","сэ зичь":"зиче","сэ фи фост":"фи","сэ фие":"фи","сэ фии":"фи","сэ фим":"фи","сэ фиу":"фи","сэ хухур":"хухура","сэ хухуре":"хухура","сэ хухурь":"хухура","сэ хухурэм":"хухура","сэ юбеск":"юби","сэ юбешть":"юби","сэ юбим":"юби","сэ юбяскэ":"юби","табле":"table","те юбеск":"te iubesc","теме":"teme","температурэ":"temperatură","темплу":"templu","тенебрэ":"tenebră","теорие":"teorie","термина":"termina","терминат":"terminat","терорист":"terorist","терориста":"terorista","терористул":"терорист","терористулуи":"терорист","терориштии":"терорист","терориштилор":"терорист","тероришть":"терорист","тестамент":"testament","техноложие":"tehnologie","тимп":"timp","тираспол":"Tiraspol","тифик":"tific","тифоид":"tifoid","тифос":"tifos","тоате":"toate","томатэ":"tomată","тот":"tot","трансверсал":"transversal","трансверсалэ":"transversală","трансгресиуне":"transgresiune","транснистриа":"Transnistria","трансформа":"transforma","тратат":"tratat","треи":"trei","тригонометрие":"trigonometrie","тринитате":"trinitate","тристеце":"tristețe","трудэ":"trudă","труп":"trup","трябэ":"treabă","тубулар":"tubular","тули":"tuli","тэт":"tăt","тэчя":"tăcea","тэя":"tăia","у (u)":"У","украина":"Ucraina","украинянэ":"ucraineană","улеи":"ulei","умилинцэ":"umilință","умилитате":"umilitate","ун":"un","ун анархист":"анархист","ун археолог":"археолог","ун бэрбат":"бэрбат","ун бэят":"бэят","ун вис":"вис","ун делир":"делир","ун доктор":"доктор","ун империалист":"империалист","ун капиталист":"капиталист","ун комунист":"комунист","ун космонаут":"космонаут","ун кынтэрец":"кынтэрец","ун морков":"морков","ун навигатор":"навигатор","ун националист":"националист","ун образ":"образ","ун партид":"партид","ун пенис":"пенис","ун психолог":"психолог","ун сепаратист":"сепаратист","ун совет":"совет","ун советик":"советик","ун солдат":"солдат","ун терорист":"терорист","ун фонолог":"фонолог","уна":"una","унгь":"unghi","униуне":"uniune","униуния еуропянэ":"Униуня Еуропянэ","униуня еуропянэ":"Uniunea Europeană","униуня републичилор советиче сочиалисте":"Uniunea Republicilor Sovietice Socialiste","униуня советикэ":"Uniunea Sovietică","унифика":"unifica","унификат":"unificat","унор анархишть":"анархист","унор археоложь":"археолог","унор бэець":"бэят","унор бэрбаць":"бэрбат","унор висе":"вис","унор делирурь":"делир","унор докторь":"доктор","унор империалишть":"империалист","унор капиталишть":"капиталист","унор комуништь":"комунист","унор космонауць":"космонаут","унор кынтэрець":"кынтэрец","унор морковь":"морков","унор навигаторь":"навигатор","унор националишть":"националист","унор ображь":"образ","унор партиде":"партид","унор пенисурь":"пенис","унор психоложь":"психолог","унор сепаратишть":"сепаратист","унор совете":"совет","унор советичь":"советик","унор солдаць":"солдат","унор тероришть":"терорист","унор фоноложь":"фонолог","уну":"unu","унуи анархист":"анархист","унуи археолог":"археолог","унуи бэрбат":"бэрбат","унуи бэят":"бэят","унуи вис":"вис","унуи делир":"делир","унуи доктор":"доктор","унуи империалист":"империалист","унуи капиталист":"капиталист","унуи комунист":"комунист","унуи космонаут":"космонаут","унуи кынтэрец":"кынтэрец","унуи морков":"морков","унуи навигатор":"навигатор","унуи националист":"националист","унуи образ":"образ","унуи партид":"партид","унуи пенис":"пенис","унуи психолог":"психолог","унуи сепаратист":"сепаратист","унуи совет":"совет","унуи советик":"советик","унуи солдат":"солдат","унуи терорист":"терорист","унуи фонолог":"фонолог","урсс":"URSS","урэште":"urăște","фаза":"faza","фазэ":"fază","фатал":"fatal","фацэ":"față","фачере":"facere","фебрэ":"febră","федератив":"federativ","федерация":"federația","федерация русэ":"Federația Rusă","фи":"fi","фиделитате":"fidelitate","фие":"фи","фии":"фи","фиинд":"фи","фииндкэ":"fiindcă","фикат":"ficat","филм":"film","филозофие":"filozofie","филозофик":"filozofic","философие":"filosofie","философик":"filosofic","фистулэ":"fistulă","флексибил":"flexibil","фоае":"foaie","фоаме":"foame","фоамете":"foamete","фолоси":"folosi","фонолог":"fonolog","фонологул":"фонолог","фонологулуи":"фонолог","фоноложие":"fonologie","фоноложии":"фонолог","фоноложика":"fonologica","фоноложикэ":"fonologică","фоноложилор":"фонолог","фоноложия":"fonologia","фоноложь":"фонолог","фост":"фи","фотографие":"fotografie","фотографика":"fotografica","фотографикэ":"fotografică","фотография":"fotografia","франца":"Franța","фратернитате":"fraternitate","фраць":"frați","фругал":"frugal","фрунзэ":["фрунзэ","Frunză","фрунзэ","frunză"],"фуи":"fui","фунчиар":"funciar","фурника":"furnica","фурникэ":"furnică","фуртун":"furtun","фуртунэ":["фуртунэ","Furtună","фуртунэ","furtună"],"фус":"fus","фусе":"фи","фусеи":"фи","фусерэм":"фи","фусесе":"фи","фусесем":"фи","фусесерэм":"фи","фусесешь":"фи","фусешь":"фи","фыцэ":"fâță","харем":"harem","хипнозэ":"hipnoză","хипнотик":"hipnotic","хомосексуал":"homosexual","хомосексуалитате":"homosexualitate","хомосексуалитатя":"хомосексуалитате","хомосексуалитэци":"хомосексуалитате","хомосексуалитэции":"хомосексуалитате","хотэры":"hotărî","хухур":"хухура","хухура":"huhura","хухураи":"хухура","хухурам":"хухура","хухурасе":"хухура","хухурасем":"хухура","хухурасерэм":"хухура","хухурасешь":"хухура","хухурат":"хухура","хухураць":"хухура","хухурашь":"хухура","хухурынд":"хухура","хухурь":"хухура","хухурэ":"хухура","хухурэм":"хухура","цигарэ":"țigară","цине":"ține","ципа":"țipa","цяпэ":"țeapă","ынвэцэминте":"ынвэцэмынт","юбеск":"юби","юбеште":"юби","юбешть":"юби","юбии":"юби","юбим":"юби","юбинд":"юби","юбирэм":"юби","юбисе":"юби","юбисем":"юби","юбисерэм":"юби","юбисешь":"юби","юбит":"юби","юбиць":"юби","юбишь":"юби","юбя":"юби","юбяи":"юби","юбям":"юби","юбяскэ":"юби","я":"ea"};
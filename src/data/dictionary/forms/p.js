@@ -0,0 +1 @@
+export default {"patit-o":"o păți","pronouns preceded by a":"ta","prosti":"tont","prostii":"tont","prostilor":"tont"};
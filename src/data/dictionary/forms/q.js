@@ -0,0 +1 @@
+export default {"qatariene":"qatariană","qatarienei":"qatariană","qatarienele":"qatariană","qatarienelor":"qatariană","quadriviumul":"quadrivium","quadriviumule":"quadrivium","quadriviumului":"quadrivium","quakere":"quakeră","quakerei":"quakeră","quakerele":"quakeră","quakerelor":"quakeră","quakeri":"quaker","quakerii":"quaker","quakerilor":"quaker","quakerismul":"quakerism","quakerismule":"quakerism","quakerismului":"quakerism","quakerul":"quaker","quakerule":"quaker","quakerului":"quaker","quarcul":"quarc","quarcule":"quarc","quarcului":"quarc","quarcuri":"quarc","quarcurile":"quarc","quarcurilor":"quarc","quartete":"quartet","quartetele":"quartet","quartetelor":"quartet","quartetul":"quartet","quartetule":"quartet","quartetului":"quartet","quasari":"quasar","quasarii":"quasar","quasarilor":"quasar","quasarul":"quasar","quasarule":"quasar","quasarului":"quasar","quattrocentiste":"quattrocentistă","quattrocentistei":"quattrocentistă","quattrocentistele":"quattrocentistă","quattrocentistelor":"quattrocentistă","quebrachoi":"quebracho","quebracholor":"quebracho","quebrachoul":"quebracho","quebrachoule":"quebracho","quebrachoului":"quebracho","quechuai":"quechua","quechualor":"quechua","quechuaul":"quechua","quechuaule":"quechua","quechuaului":"quechua","quetzalul":"quetzal","quetzalule":"quetzal","quetzalului":"quetzal","quidditatea":"quidditate","quidditati":"quidditate","quidditatii":"quidditate","quiproquo-uri":"quiproquo","quiproquoul":"quiproquo","quiproquoule":"quiproquo","quiproquoului":"quiproquo","quiproquouri":"quiproquo","quiproquourile":"quiproquo","quiproquourilor":"quiproquo","quipule":"quipu","quipulor":"quipu","quipuul":"quipu","quipuule":"quipu","quipuului":"quipu","quislingi":"quisling","quislingii":"quisling","quislingilor":"quisling","quislingul":"quisling","quislingule":"quisling","quislingului":"quisling","quolibetul":"quolibet","quolibetule":"quolibet","quolibetului":"quolibet","quruchul":"quruch","quruchule":"quruch","quruchului":"quruch"};
@@ -0,0 +1 @@
+export default {"rabalasul":"răbălaș","rabalasule":"răbălaș","rabalasului":"răbălaș","rabane":"rabană","rabanei":"rabană","rabarbure":"rabarbură","rabarburei":"rabarbură","rabarburele":"rabarbură","rabarburelor":"rabarbură","rabari":"râbar","rabarii":"râbar","rabarilor":"râbar","rabarul":"râbar","rabarule":"râbar","rabarului":"râbar","rabatabila":["rabatabilă","rabatabil","rabatabila","rabatabil"],"rabatabile":"rabatabil","rabatabilele":"rabatabil","rabatabili":"rabatabil","rabatabilii":"rabatabil","rabatabilul":"rabatabil","rabatai":"rabata","rabatam":["rabatăm","rabata","rabatam","rabata"],"rabatand":"rabata","rabatara":"rabata","rabataram":"rabata","rabatarati":"rabata","rabatarea":"rabatare","rabatari":"rabatare","rabatarii":"rabatare","rabatarile":"rabatare","rabatarilor":"rabatare","rabatase":"rabata","rabatasem":"rabata","rabatasera":"rabata","rabataseram":"rabata","rabataserati":"rabata","rabatasesi":"rabata","rabatasi":"rabata","rabatat":"rabata","rabatata":["rabatată","rabatat","rabatata","rabatat"],"rabatate":"rabatat","rabatatele":"rabatat","rabatati":["rabatați","rabata","rabatați","rabatat"],"rabatatii":"rabatat","rabatatul":"rabatat","rabatau":"rabata","rabateaza":"rabata","rabaterea":"rabatere","rabateri":"rabatere","rabaterii":"rabatere","rabaterile":"rabatere","rabaterilor":"rabatere","rabatez":"rabata","rabatezi":"rabata","rabatul":"rabat","rabatule":"rabat","rabatului":"rabat","rabaturi":"rabat","rabaturile":"rabat","rabaturilor":"rabat","rabd":"răbda","rabdai":"răbda","rabdam":["răbdăm","răbda","răbdam","răbda"],"rabdand":"răbda","rabdara":"răbda","rabdaram":"răbda","rabdarati":"răbda","rabdarea":"răbdare","rabdari":"răbdare","rabdarii":"răbdare","rabdarile":"răbdare","rabdarilor":"răbdare","rabdase":"răbda","rabdasem":"răbda","rabdasera":"răbda","rabdaseram":"răbda","rabdaserati":"răbda","rabdasesi":"răbda","rabdasi":"răbda","rabdat":"răbda","rabdati":"răbda","rabdatoare":"răbdător","rabdatoarea":"răbdător","rabdatoarele":"răbdător","rabdatori":"răbdător","rabdatorii":"răbdător","rabdatorul":"răbdător","rabdau":"răbda","rabde":"răbda","rabdomantia":"rabdomanție","rabdomantiei":"rabdomanție","rabdomantii":"rabdomanție","rabdomantiile":"rabdomanție","rabdomantiilor":"rabdomanție","rabdomiomul":"rabdomiom","rabdomiomule":"rabdomiom","rabdomiomului":"rabdomiom","rabdomiomuri":"rabdomiom","rabdomiomurile":"rabdomiom","rabdomiomurilor":"rabdomiom","rabduria":"răbduriu","rabdurie":"răbduriu","rabdurii":"răbduriu","rabduriii":"răbduriu","rabduriile":"răbduriu","rabduriul":"răbduriu","rabegita":["răbegită","răbegit","răbegita","răbegit"],"rabegite":"răbegit","rabegitele":"răbegit","rabegiti":"răbegit","rabegitii":"răbegit","rabegitul":"răbegit","rabia":"rabie","rabica":["rabică","rabic","rabica","rabic"],"rabice":"rabic","rabicele":"rabic","rabici":"rabic","rabicii":"rabic","rabicul":"rabic","rabiei":"rabie","rabii":"rabie","rabiile":"rabie","rabiilor":"rabie","rabinate":"rabinat","rabinatele":"rabinat","rabinatelor":"rabinat","rabinatul":"rabinat","rabinatule":"rabinat","rabinatului":"rabinat","rabini":"rabin","rabinica":["rabinică","rabinic","rabinica","rabinic"],"rabinice":"rabinic","rabinicele":"rabinic","rabinici":"rabinic","rabinicii":"rabinic","rabinicul":"rabinic","rabinii":"rabin","rabinilor":"rabin","rabinisme":"rabinism","rabinismele":"rabinism","rabinismelor":"rabinism","rabinismul":"rabinism","rabinismule":"rabinism","rabinismului":"rabinism","rabinisti":"rabinist","rabinistile":"rabinist","rabinistilor":"rabinist","rabinistul":"rabinist","rabinistule":"rabinist","rabinistului":"rabinist","rabinul":"rabin","rabinule":"rabin","rabinului":"rabin","rablagea":["rablagea","rablagi","răblăgea","răblăgi"],"rablageai":["rablageai","rablagi","răblăgeai","răblăgi"],"rablageam":["rablageam","rablagi","răblăgeam","răblăgi"],"rablageati":["rablageați","rablagi","răblăgeați","răblăgi"],"rablageau":["rablageau","rablagi","răblăgeau","răblăgi"],"rablagesc":["rablagesc","rablagi","răblăgesc","răblăgi"],"rablageste":["rablagește","rablagi","răblăgește","răblăgi"],"rablagesti":["rablagești","rablagi","răblăgești","răblăgi"],"rablagia":"rablagiu","rablagie":"rablagiu","rablagii":["rablagii","rablagi","răblăgii","răblăgi","rablagii","rablagiu"],"rablagiii":"rablagiu","rablagiile":"rablagiu","rablagiilor":"rablagiu","rablagim":["rablagim","rablagi","răblăgim","răblăgi"],"rablagind":["rablagind","rablagi","răblăgind","răblăgi"],"rablagira":["rablagiră","rablagi","răblăgiră","răblăgi"],"rablagiram":["rablagirăm","rablagi","răblăgirăm","răblăgi"],"rablagirati":["rablagirăți","rablagi","răblăgirăți","răblăgi"],"rablagirea":"rablagire","rablagiri":"rablagire","rablagirii":"rablagire","rablagirile":"rablagire","rablagirilor":"rablagire","rablagise":["rablagise","rablagi","răblăgise","răblăgi"],"rablagisem":["rablagisem","rablagi","răblăgisem","răblăgi"],"rablagisera":["rablagiseră","rablagi","răblăgiseră","răblăgi"],"rablagiseram":["rablagiserăm","rablagi","răblăgiserăm","răblăgi"],"rablagiserati":["rablagiserăți","rablagi","răblăgiserăți","răblăgi"],"rablagisesi":["rablagiseși","rablagi","răblăgiseși","răblăgi"],"rablagisi":["rablagiși","rablagi","răblăgiși","răblăgi"],"rablagit":["rablagit","rablagi","răblăgit","răblăgi"],"rablagita":["rablagită","rablagit","rablagita","rablagit","răblăgită","răblăgit","răblăgita","răblăgit"],"rablagite":["rablagite","rablagit","răblăgite","răblăgit"],"rablagitele":["rablagitele","rablagit","răblăgitele","răblăgit"],"rablagiti":["rablagiți","rablagi","răblăgiți","răblăgi","rablagiți","rablagit","răblăgiți","răblăgit"],"rablagitii":["rablagiții","rablagit","răblăgiții","răblăgit"],"rablagitul":["rablagitul","rablagit","răblăgitul","răblăgit"],"rablagiul":"rablagiu","rablagiuul":"rablagiu","rablagiuule":"rablagiu","rablagiuului":"rablagiu","rablarita":["răblărită","răblărit","răblărita","răblărit"],"rablarite":"răblărit","rablaritele":"răblărit","rablariti":"răblărit","rablaritii":"răblărit","rablaritul":"răblărit","rable":"rablă","rablei":"rablă","rablele":"rablă","rablelor":"rablă","rabojea":"răboji","rabojeai":"răboji","rabojeam":"răboji","rabojeati":"răboji","rabojeau":"răboji","rabojesc":"răboji","rabojeste":"răboji","rabojesti":"răboji","rabojii":"răboji","rabojim":"răboji","rabojind":"răboji","rabojira":"răboji","rabojiram":"răboji","rabojirati":"răboji","rabojise":"răboji","rabojisem":"răboji","rabojisera":"răboji","rabojiseram":"răboji","rabojiserati":"răboji","rabojisesi":"răboji","rabojisi":"răboji","rabojit":"răboji","rabojiti":"răboji","rabojuri":"răboj","rabolele":"răboleală","rabolelei":"răboleală","rabolelele":"răboleală","rabolelelor":"răboleală","raboleli":"răboleală","raborele":"răboreală","raborelei":"răboreală","raborelele":"răboreală","raborelelor":"răboreală","raboreli":"răboreală","rabotai":"rabota","rabotaje":"rabotaj","rabotajele":"rabotaj","rabotajelor":"rabotaj","rabotajul":"rabotaj","rabotajule":"rabotaj","rabotajului":"rabotaj","rabotam":["rabotăm","rabota","rabotam","rabota"],"rabotand":"rabota","rabotara":"rabota","rabotaram":"rabota","rabotarati":"rabota","rabotase":"rabota","rabotasem":"rabota","rabotasera":"rabota","rabotaseram":"rabota","rabotaserati":"rabota","rabotasesi":"rabota","rabotasi":"rabota","rabotat":"rabota","rabotati":"rabota","rabotau":"rabota","raboteaza":"rabota","rabotez":"rabota","raboteze":"raboteză","rabotezei":"raboteză","rabotezele":"raboteză","rabotezelor":"raboteză","rabotezi":"rabota","rabotori":"rabotor","rabotorii":"rabotor","rabotorilor":"rabotor","rabotorul":"rabotor","rabotorule":"rabotor","rabotorului":"rabotor","rabufnea":"răbufni","rabufneai":"răbufni","rabufneam":"răbufni","rabufneati":"răbufni","rabufneau":"răbufni","rabufnele":"răbufneală","rabufnelei":"răbufneală","rabufnelele":"răbufneală","rabufnelelor":"răbufneală","rabufneli":"răbufneală","rabufnesc":"răbufni","rabufneste":"răbufni","rabufnesti":"răbufni","rabufnii":"răbufni","rabufnim":"răbufni","rabufnind":"răbufni","rabufnira":"răbufni","rabufniram":"răbufni","rabufnirati":"răbufni","rabufnirea":"răbufnire","rabufniri":"răbufnire","rabufnirii":"răbufnire","rabufnirile":"răbufnire","rabufnirilor":"răbufnire","rabufnise":"răbufni","rabufnisem":"răbufni","rabufnisera":"răbufni","rabufniseram":"răbufni","rabufniserati":"răbufni","rabufnisesi":"răbufni","rabufnisi":"răbufni","rabufnit":"răbufni","rabufniti":"răbufni","rabufniture":"răbufnitură","rabufniturei":"răbufnitură","rabufniturele":"răbufnitură","rabufniturelor":"răbufnitură","rabufnituri":"răbufnitură","rabusul":"răbuș","rabusule":"răbuș","rabusului":"răbuș","rabusuri":"răbuș","rabusurile":"răbuș","rabusurilor":"răbuș","rabzi":"răbda","racabusi":"răcăbuș","racabusii":"răcăbuș","racabusilor":"răcăbuș","racabusul":"răcăbuș","racabusule":"răcăbuș","racabusului":"răcăbuș","racaduia":"răcădui","racaduiai":"răcădui","racaduiam":"răcădui","racaduiati":"răcădui","racaduiau":"răcădui","racaduiesc":"răcădui","racaduieste":"răcădui","racaduiesti":"răcădui","racaduii":"răcădui","racaduim":"răcădui","racaduind":"răcădui","racaduira":"răcădui","racaduiram":"răcădui","racaduirati":"răcădui","racaduise":"răcădui","racaduisem":"răcădui","racaduisera":"răcădui","racaduiseram":"răcădui","racaduiserati":"răcădui","racaduisesi":"răcădui","racaduisi":"răcădui","racaduit":"răcădui","racaduiti":"răcădui","racaia":"râcâi","racaiai":"râcâi","racaiam":"râcâi","racaiati":"râcâi","racaiau":"râcâi","racaie":"râcâi","racaii":"râcâi","racaim":"râcâi","racaind":"râcâi","racaira":"râcâi","racairam":"râcâi","racairati":"râcâi","racaise":"râcâi","racaisem":"râcâi","racaisera":"râcâi","racaiseram":"râcâi","racaiserati":"râcâi","racaisesi":"râcâi","racaisi":"râcâi","racait":"râcâi","racaita":["râcâită","râcâit","râcâita","râcâit"],"racaite":"râcâit","racaitele":"râcâit","racaiti":["râcâiți","râcâi","râcâiți","râcâit"],"racaitii":"râcâit","racaitul":"râcâit","racaituri":"râcâitură","racaiturii":"râcâitură","racaiturile":"râcâitură","racaiturilor":"râcâitură","racan":"răcăni","racane":"răcăni","racanea":"răcăni","racaneai":"răcăni","racaneam":"răcăni","racaneati":"răcăni","racaneau":"răcăni","racanei":"răcănel","racaneii":"răcănel","racaneilor":"răcănel","racanelul":"răcănel","racanelule":"răcănel","racanelului":"răcănel","racanie":"răcăni","racanii":"răcăni","racanim":"răcăni","racanind":"răcăni","racanira":"răcăni","racaniram":"răcăni","racanirati":"răcăni","racanise":"răcăni","racanisem":"răcăni","racanisera":"răcăni","racaniseram":"răcăni","racaniserati":"răcăni","racanisesi":"răcăni","racanisi":"răcăni","racanit":"răcăni","racaniti":"răcăni","racanitul":"răcănit","racanitule":"răcănit","racanitului":"răcănit","racari":"răcar","racarii":"răcar","racarilor":"răcar","racarul":"răcar","racarule":"răcar","racarului":"răcar","race":"rece","racea":["răcea","răce","răcea","răci"],"raceai":"răci","raceam":"răci","raceasca":["răcească","răcesc","răceasca","răcesc"],"raceati":"răci","raceau":"răci","racele":"răce","raceli":"răceală","racelii":"răceală","racelile":"răceală","racelilor":"răceală","raceme":"racem","racemele":"racem","racemelor":"racem","racemica":["racemică","racemic","racemica","racemic"],"racemice":"racemic","racemicele":"racemic","racemici":"racemic","racemicii":"racemic","racemicul":"racemic","racemiforma":["racemiformă","racemiform","racemiforma","racemiform"],"racemiforme":"racemiform","racemiformele":"racemiform","racemiformi":"racemiform","racemiformii":"racemiform","racemiformul":"racemiform","racemizarea":"racemizare","racemizari":"racemizare","racemizarii":"racemizare","racemizarile":"racemizare","racemizarilor":"racemizare","racemoasa":["racemoasă","racemos","racemoasa","racemos"],"racemoase":"racemos","racemoasele":"racemos","racemosi":"racemos","racemosii":"racemos","racemosul":"racemos","racemul":"racem","racemule":"racem","racemului":"racem","racesc":"răci","racescul":"răcesc","raceste":"răci","racesti":["răcești","răcesc","răcești","răci"],"racestii":"răcesc","racestile":"răcesc","rachete":"rachetă","rachete aer-aer":"rachetă aer-aer","rachete aer-pamant":"rachetă aer-pământ","rachete balistice":"rachetă balistică","rachete cosmice":"rachetă cosmică","rachete de croaziera":"rachetă de croazieră","rachete de tenis":"rachetă de tenis","rachete pamant-aer":"rachetă pământ-aer","rachete pamant-pamant":"rachetă pământ-pământ","rachetei":"rachetă","rachetele":"rachetă","rachetelor":"rachetă","rachetistul":"rachetist","rachetistule":"rachetist","rachetistului":"rachetist","rachetomodele":"rachetomodel","rachetomodelele":"rachetomodel","rachetomodelelor":"rachetomodel","rachetomodeliste":"rachetomodelistă","rachetomodelistei":"rachetomodelistă","rachetomodelistele":"rachetomodelistă","rachetomodelistelor":"rachetomodelistă","rachetomodelul":"rachetomodel","rachetomodelule":"rachetomodel","rachetomodelului":"rachetomodel","rachia":["rachia","rachie","răchia","răchie"],"rachiase":"rachiaș","rachiasele":"rachiaș","rachiaselor":"rachiaș","rachiasul":"rachiaș","rachiasule":"rachiaș","rachiasului":"rachiaș","rachie":"rachiu","rachiei":["rachiei","rachie","răchiei","răchie"],"rachierese":"rachiereasă","rachieresei":"rachiereasă","rachieresele":"rachiereasă","rachiereselor":"rachiereasă","rachieri":"rachier","rachieria":"rachierie","rachieriei":"rachierie","rachierii":["rachierii","rachier","rachierii","rachierie"],"rachierilor":"rachier","rachierite":"rachieriță","rachieritei":"rachieriță","rachieritele":"rachieriță","rachieritelor":"rachieriță","rachierul":"rachier","rachierule":"rachier","rachierului":"rachier","rachigii":"rachigiu","rachigiii":"rachigiu","rachigiilor":"rachigiu","rachigiuul":"rachigiu","rachigiuule":"rachigiu","rachigiuului":"rachigiu","rachii":["rachii","rachie","răchii","răchie"],"rachiile":["rachiile","rachie","răchiile","răchie"],"rachiilor":["rachiilor","rachie","răchiilor","răchie"],"rachisoare":"răchișoară","rachisoarei":"răchișoară","rachisoarele":"răchișoară","rachisoarelor":"răchișoară","rachitani":"răchitan","rachitanii":"răchitan","rachitanilor":"răchitan","rachitanul":"răchitan","rachitanule":"răchitan","rachitanului":"răchitan","rachite":"răchită","rachiteaua":"răchițea","rachitei":"răchită","rachitele":["răchitele","răchită","răchițele","răchițea","răchițele","răchițică"],"rachitelei":"răchițea","rachitelele":"răchițea","rachitelelor":"răchițea","rachitelor":"răchită","rachitice":"răchițică","rachiticei":"răchițică","rachiticele":"răchițică","rachiticelor":"răchițică","rachitisul":"răchitiș","rachitisule":"răchitiș","rachitisului":"răchitiș","rachitisuri":"răchitiș","rachitisurile":"răchitiș","rachitisurilor":"răchitiș","rachitoasa":["răchitoasă","răchitos","răchitoasa","răchitos"],"rachitoase":"răchitos","rachitoasele":"răchitos","rachitosi":"răchitos","rachitosii":"răchitos","rachitosul":"răchitos","rachiul":"rachiu","rachiule":"rachiu","rachiului":"rachiu","rachiuri":"rachiu","rachiurile":"rachiu","rachiurilor":"rachiu","raci":["raci","rac","răci","răce"],"racii":["racii","rac","răcii","răce","răcii","răci"],"racile":"racilă","racilei":"racilă","racilele":"racilă","racilelor":"racilă","racilor":"rac","racim":"răci","racind":"răci","racira":"răci","raciram":"răci","racirati":"răci","racirea":"răcire","raciri":"răcire","racirii":"răcire","racirile":"răcire","racirilor":"răcire","racise":"răci","racisem":"răci","racisera":"răci","raciseram":"răci","raciserati":"răci","racisesi":"răci","racisi":"răci","racit":"răci","racita":["răcită","răcit","răcita","răcit"],"racite":"răcit","racitele":"răcit","raciti":["răciți","răci","răciți","răcit"],"racitii":"răcit","racitori":"răcitor","racitorile":"răcitor","racitorilor":"răcitor","racitorul":"răcitor","racitorule":"răcitor","racitorului":"răcitor","racitul":"răcit","raciture":"răcitură","raciturei":"răcitură","raciturele":"răcitură","raciturelor":"răcitură","racituri":"răcitură","racketi":"racket","racketii":"racket","racketilor":"racket","racketul":"racket","racketule":"racket","racketului":"racket","rackul":"rack","rackule":"rack","rackului":"rack","rackuri":"rack","rackurile":"rack","rackurilor":"rack","raclai":"racla","raclaje":"raclaj","raclajele":"raclaj","raclajelor":"raclaj","raclajul":"raclaj","raclajule":"raclaj","raclajului":"raclaj","raclam":["raclăm","racla","raclam","racla"],"racland":"racla","raclara":"racla","raclaram":"racla","raclarati":"racla","raclarea":"raclare","raclari":["răclari","răclar","raclări","raclare"],"raclarii":["răclarii","răclar","raclării","raclare"],"raclarile":"raclare","raclarilor":["răclarilor","răclar","raclărilor","raclare"],"raclarul":"răclar","raclarule":"răclar","raclarului":"răclar","raclase":"racla","raclasem":"racla","raclasera":"racla","raclaseram":"racla","raclaserati":"racla","raclasesi":"racla","raclasi":"racla","raclat":"racla","raclati":"racla","raclau":"racla","racle":"raclă","racleaza":"racla","raclei":"raclă","raclele":"raclă","raclelor":"raclă","raclete":"racletă","racletei":"racletă","racletele":"racletă","racletelor":"racletă","raclez":"racla","raclezi":"racla","raclute":"răcluță","raclutei":"răcluță","raclutele":"răcluță","raclutelor":"răcluță","racnea":"răcni","racneai":"răcni","racneam":"răcni","racneati":"răcni","racneau":"răcni","racnesc":"răcni","racneste":"răcni","racnesti":"răcni","racnete":"răcnet","racnii":"răcni","racnim":"răcni","racnind":"răcni","racnira":"răcni","racniram":"răcni","racnirati":"răcni","racnirea":"răcnire","racniri":"răcnire","racnirii":"răcnire","racnirile":"răcnire","racnirilor":"răcnire","racnise":"răcni","racnisem":"răcni","racnisera":"răcni","racniseram":"răcni","racniserati":"răcni","racnisesi":"răcni","racnisi":"răcni","racnit":"răcni","racniti":"răcni","racnitoare":"răcnitor","racnitoarea":"răcnitor","racnitoarele":"răcnitor","racnitori":"răcnitor","racnitorii":"răcnitor","racnitorul":"răcnitor","racnituri":"răcnitură","racniturii":"răcnitură","racniturile":"răcnitură","racniturilor":"răcnitură","racoaice":"răcoaică","racoaicei":"răcoaică","racoaicele":"răcoaică","racoaicelor":"răcoaică","racoarea":"răcoare","racobi":"racob","racobii":"racob","racobilor":"racob","racobul":"racob","racobule":"racob","racobului":"racob","racodelia":"răcodelie","racodeliei":"răcodelie","racodelii":"răcodelie","racodeliile":"răcodelie","racodeliilor":"răcodelie","racoine":"răcoină","racoinei":"răcoină","racoinele":"răcoină","racoinelor":"răcoină","racolai":"racola","racolaje":"racolaj","racolajele":"racolaj","racolajelor":"racolaj","racolajul":"racolaj","racolajule":"racolaj","racolajului":"racolaj","racolam":["racolăm","racola","racolam","racola"],"racoland":"racola","racolara":"racola","racolaram":"racola","racolarati":"racola","racolarea":"racolare","racolari":"racolare","racolarii":"racolare","racolarile":"racolare","racolarilor":"racolare","racolase":"racola","racolasem":"racola","racolasera":"racola","racolaseram":"racola","racolaserati":"racola","racolasesi":"racola","racolasi":"racola","racolat":"racola","racolata":["racolată","racolat","racolata","racolat"],"racolate":"racolat","racolatele":"racolat","racolati":["racolați","racola","racolați","racolat"],"racolatii":"racolat","racolatul":"racolat","racolau":"racola","racoleaza":"racola","racoleri":"racoler","racolerii":"racoler","racolerilor":"racoler","racolerul":"racoler","racolerule":"racoler","racolerului":"racoler","racolez":"racola","racolezi":"racola","racont":"raconta","racontai":"raconta","racontam":["racontăm","raconta","racontam","raconta"],"racontand":"raconta","racontara":"raconta","racontaram":"raconta","racontarati":"raconta","racontarea":"racontare","racontari":"racontare","racontarii":"racontare","racontarile":"racontare","racontarilor":"racontare","racontase":"raconta","racontasem":"raconta","racontasera":"raconta","racontaseram":"raconta","racontaserati":"raconta","racontasesi":"raconta","racontasi":"raconta","racontat":"raconta","racontati":"raconta","racontau":"raconta","raconte":"raconta","raconti":"raconta","racordai":"racorda","racordam":["racordăm","racorda","racordam","racorda"],"racordand":"racorda","racordara":"racorda","racordaram":"racorda","racordarati":"racorda","racordarea":"racordare","racordari":"racordare","racordarii":"racordare","racordarile":"racordare","racordarilor":"racordare","racordase":"racorda","racordasem":"racorda","racordasera":"racorda","racordaseram":"racorda","racordaserati":"racorda","racordasesi":"racorda","racordasi":"racorda","racordat":"racorda","racordati":"racorda","racordau":"racorda","racordeaza":"racorda","racordez":"racorda","racordezi":"racorda","racordul":"racord","racordule":"racord","racordului":"racord","racorduri":"racord","racordurile":"racord","racordurilor":"racord","racorea":"răcori","racoreai":"răcori","racoream":"răcori","racoreati":"răcori","racoreau":"răcori","racoreli":"răcoreală","racorelii":"răcoreală","racorelile":"răcoreală","racorelilor":"răcoreală","racoresc":"răcori","racoreste":"răcori","racoresti":"răcori","racori":"răcoare","racorii":["răcorii","răcoare","răcorii","răcori"],"racorile":"răcoare","racorilor":"răcoare","racorim":"răcori","racorind":"răcori","racorira":"răcori","racoriram":"răcori","racorirati":"răcori","racorirea":"răcorire","racoriri":"răcorire","racoririi":"răcorire","racoririle":"răcorire","racoririlor":"răcorire","racorise":"răcori","racorisem":"răcori","racorisera":"răcori","racoriseram":"răcori","racoriserati":"răcori","racorisesi":"răcori","racorisi":"răcori","racorit":"răcori","racorita":["răcorită","răcorit","răcorita","răcorit"],"racorite":"răcorit","racoritele":"răcorit","racoriti":["răcoriți","răcori","răcoriți","răcorit"],"racoritii":"răcorit","racoritoare":"răcoritor","racoritoarea":["răcoritoarea","răcoritoare","răcoritoarea","răcoritor"],"racoritoarei":"răcoritoare","racoritoarele":["răcoritoarele","răcoritoare","răcoritoarele","răcoritor"],"racoritoarelor":"răcoritoare","racoritori":"răcoritor","racoritorii":"răcoritor","racoritorul":"răcoritor","racoritul":"răcorit","racoroasa":["răcoroasă","răcoros","răcoroasa","răcoros"],"racoroase":"răcoros","racoroasele":"răcoros","racorosi":"răcoros","racorosii":"răcoros","racorosul":"răcoros","racovine":"răcovină","racovinei":"răcovină","racovinele":"răcovină","racovinelor":"răcovină","racuine":"răcuină","racuinei":"răcuină","racuinele":"răcuină","racuinelor":"răcuină","racul":"rac","racule":"rac","raculeti":"răculeț","raculetii":"răculeț","raculetilor":"răculeț","raculetul":"răculeț","raculetule":"răculeț","raculetului":"răculeț","racului":"rac","racusori":"răcușor","racusorii":"răcușor","racusorilor":"răcușor","racusorul":"răcușor","racusorule":"răcușor","racusorului":"răcușor","racuti":"răcuț","racutii":"răcuț","racutilor":"răcuț","racutul":"răcuț","racutule":"răcuț","racutului":"răcuț","rad":["rad","rade","râd","râde"],"rada":["radă","rade","râdă","râde","rad̦ă","rază"],"rada in barba":"râde în barbă","rada pe sub mustata":"râde pe sub mustață","radacinata":["rădăcinată","rădăcinat","rădăcinata","rădăcinat"],"radacinate":"rădăcinat","radacinatele":"rădăcinat","radacinati":"rădăcinat","radacinatii":"rădăcinat","radacinatul":"rădăcinat","radacini":"rădăcină","radacini cubice":["rădăcini cubice","rădăcina cubică","rădăcini cubice","rădăcină cubică"],"radacini patrate":["rădăcini pătrate","rădăcina pătrată","rădăcini pătrate","rădăcină pătrată"],"radacinia":"rădăciniu","radacinie":"rădăciniu","radacinii":["rădăcinii","rădăcină","rădăcinii","rădăciniu"],"radaciniii":"rădăciniu","radaciniile":"rădăciniu","radacinile":"rădăcină","radacinilor":"rădăcină","radacinite":"rădăciniță","radacinitei":"rădăciniță","radacinitele":"rădăciniță","radacinitelor":"rădăciniță","radaciniul":"rădăciniu","radacinoasa":["rădăcinoasă","rădăcinos","rădăcinoasa","rădăcinos"],"radacinoase":["rădăcinoase","rădăcinoasă","rădăcinoase","rădăcinos"],"radacinoasei":"rădăcinoasă","radacinoasele":["rădăcinoasele","rădăcinoasă","rădăcinoasele","rădăcinos"],"radacinoaselor":"rădăcinoasă","radacinosi":"rădăcinos","radacinosii":"rădăcinos","radacinosul":"rădăcinos","radacinute":"rădăcinuță","radacinutei":"rădăcinuță","radacinutele":"rădăcinuță","radacinutelor":"rădăcinuță","radacioare":"rădăcioară","radacioarei":"rădăcioară","radacioarele":"rădăcioară","radacioarelor":"rădăcioară","radane":"rădan","radanele":"rădan","radanelor":"rădan","radanul":"rădan","radanule":"rădan","radanului":"rădan","radare":"radar","radarele":"radar","radarelor":"radar","radaristi":"radarist","radaristii":"radarist","radaristilor":"radarist","radaristul":"radarist","radaristule":"radarist","radaristului":"radarist","radarul":"radar","radarule":"radar","radarului":"radar","radaste":"rădașcă","radastei":"rădașcă","radastele":"rădașcă","radastelor":"rădașcă","radauteana":["rădăuțeană","rădăuțean","rădăuțeana","rădăuțean"],"radauteanul":"rădăuțean","radauteanule":"rădăuțean","radauteanului":"rădăuțean","radautence":"rădăuțeancă","radautencei":"rădăuțeancă","radautencele":"rădăuțeancă","radautencelor":"rădăuțeancă","radautene":"rădăuțean","radautenele":"rădăuțean","radauteni":"rădăuțean","radautenii":"rădăuțean","radautenilor":"rădăuțean","radavoii":"radavoi","radavoilor":"radavoi","radavoiul":"radavoi","radavoiule":"radavoi","radavoiului":"radavoi","rade":"radă","radea":["rădea","rade","râdea","râde"],"radeai":["rădeai","rade","râdeai","râde"],"radeam":["rădeam","rade","râdeam","râde"],"radeati":["rădeați","rade","râdeați","râde"],"radeau":["rădeau","rade","râdeau","râde"],"radei":"radă","radele":"radă","radelor":"radă","radem":["radem","rade","râdem","râde"],"raderea":["raderea","radere","râderea","râdere"],"raderi":["raderi","radere","râderi","râdere"],"raderii":["raderii","radere","râderii","râdere"],"raderile":["raderile","radere","râderile","râdere"],"raderilor":["raderilor","radere","râderilor","râdere"],"radeti":["radeți","rade","râdeți","râde"],"radiace":"rădiac","radiacele":"rădiac","radiacelor":"rădiac","radiacul":"rădiac","radiacule":"rădiac","radiacului":"rădiac","radiala":["radială","radial","radiala","radial"],"radiale":"radial","radialele":"radial","radiali":"radial","radialii":"radial","radialul":"radial","radiani":"radian","radianii":"radian","radianilor":"radian","radianta":["radiantă","radiant","radianta","radiant"],"radiante":["radiante","radiant","radianțe","radianță"],"radiantei":"radianță","radiantele":["radiantele","radiant","radianțele","radianță"],"radiantelor":"radianță","radianti":"radiant","radiantii":"radiant","radiantul":"radiant","radianul":"radian","radianule":"radian","radianului":"radian","radiara":["radiară","radiar","radiara","radiar"],"radiare":"radiar","radiarele":"radiar","radiari":"radiar","radiarii":"radiar","radiarul":"radiar","radiat":"radia","radiata":["radiată","radiat","radiata","radiat"],"radiate":"radiat","radiatele":"radiat","radiati":"radiat","radiatia":"radiație","radiatiei":"radiație","radiatii":["radiații","radiat","radiații","radiație"],"radiatii alfa":"radiație alfa","radiatii beta":"radiație beta","radiatii gama":"radiație gama","radiatii infrarosii":"radiație infraroșie","radiatii ionizante":"radiație ionizantă","radiatiile":"radiație","radiatiilor":"radiație","radiatiunea":"radiațiune","radiatiuni":"radiațiune","radiatiunii":"radiațiune","radiatiunile":"radiațiune","radiatiunilor":"radiațiune","radiativa":["radiativă","radiativ","radiativa","radiativ"],"radiative":"radiativ","radiativele":"radiativ","radiativi":"radiativ","radiativii":"radiativ","radiativul":"radiativ","radiatoare":"radiator","radiatoarele":"radiator","radiatoarelor":"radiator","radiatorul":"radiator","radiatorule":"radiator","radiatorului":"radiator","radiatul":"radiat","radiaza":"radia","radic":"rădica","radica":["rădica","ridica","râdica","ridica"],"radicai":"rădica","radicala":["radicală","radical","radicala","radical"],"radicale":["radicale","radical","radicale","radicală"],"radicalei":"radicală","radicalele":["radicalele","radical","radicalele","radicală"],"radicalelor":"radicală","radicali":"radical","radicalii":"radical","radicalismul":"radicalism","radicalismule":"radicalism","radicalismului":"radicalism","radicalista":["radicalistă","radicalist","radicalista","radicalist"],"radicaliste":["radicaliste","radicalist","radicaliste","radicalistă"],"radicalistei":"radicalistă","radicalistele":["radicalistele","radicalist","radicalistele","radicalistă"],"radicalistelor":"radicalistă","radicalisti":"radicalist","radicalistii":"radicalist","radicalistilor":"radicalist","radicalistul":"radicalist","radicalistule":"radicalist","radicalistului":"radicalist","radicalizai":"radicaliza","radicalizam":["radicalizăm","radicaliza","radicalizam","radicaliza"],"radicalizand":"radicaliza","radicalizara":"radicaliza","radicalizaram":"radicaliza","radicalizarati":"radicaliza","radicalizarea":"radicalizare","radicalizari":"radicalizare","radicalizarii":"radicalizare","radicalizarile":"radicalizare","radicalizarilor":"radicalizare","radicalizase":"radicaliza","radicalizasem":"radicaliza","radicalizasera":"radicaliza","radicalizaseram":"radicaliza","radicalizaserati":"radicaliza","radicalizasesi":"radicaliza","radicalizasi":"radicaliza","radicalizat":"radicaliza","radicalizati":"radicaliza","radicalizau":"radicaliza","radicalizeaza":"radicaliza","radicalizez":"radicaliza","radicalizezi":"radicaliza","radicalul":"radical","radicam":["rădicăm","rădica","rădicam","rădica"],"radicand":"rădica","radicanta":["radicantă","radicant","radicanta","radicant"],"radicante":"radicant","radicantele":"radicant","radicanti":"radicant","radicantii":"radicant","radicantul":"radicant","radicara":"rădica","radicaram":"rădica","radicarati":"rădica","radicarea":"rădicare","radicari":"rădicare","radicarii":"rădicare","radicarile":"rădicare","radicarilor":"rădicare","radicase":"rădica","radicasem":"rădica","radicasera":"rădica","radicaseram":"rădica","radicaserati":"rădica","radicasesi":"rădica","radicasi":"rădica","radicat":"rădica","radicata":["rădicată","rădicat","rădicata","rădicat"],"radicate":"rădicat","radicatele":"rădicat","radicati":["rădicați","rădica","rădicați","rădicat"],"radicatia":"radicație","radicatiei":"radicație","radicatii":["rădicații","rădicat","radicații","radicație"],"radicatiile":"radicație","radicatiilor":"radicație","radicatul":"rădicat","radicau":"rădica","radicele":"radicelă","radicelei":"radicelă","radicelele":"radicelă","radicelelor":"radicelă","radiche":"ridiche","radici":"rădica","radiciforma":["radiciformă","radiciform","radiciforma","radiciform"],"radiciforme":"radiciform","radiciformele":"radiciform","radiciformi":"radiciform","radiciformii":"radiciform","radiciformul":"radiciform","radicivora":["radicivoră","radicivor","radicivora","radicivor"],"radicivore":"radicivor","radicivorele":"radicivor","radicivori":"radicivor","radicivorii":"radicivor","radicivorul":"radicivor","radiculara":["radiculară","radicular","radiculara","radicular"],"radiculare":"radicular","radicularele":"radicular","radiculari":"radicular","radicularii":"radicular","radicularul":"radicular","radicule":"radiculă","radiculei":"radiculă","radiculele":"radiculă","radiculelor":"radiculă","radiculitae":"radiculită","radiculitaei":"radiculită","radiculitaele":"radiculită","radiculitaelor":"radiculită","radiculografia":"radiculografie","radiculografiei":"radiculografie","radiculografii":"radiculografie","radiculografiile":"radiculografie","radiculografiilor":"radiculografie","radiere":"radieră","radierea":"radiere","radierei":"radieră","radierele":"radieră","radierelor":"radieră","radieri":"radiere","radierii":"radiere","radierile":"radiere","radierilor":"radiere","radifera":["radiferă","radifer","radifera","radifer"],"radifere":"radifer","radiferele":"radifer","radiferi":"radifer","radiferii":"radifer","radiferul":"radifer","radioactiva":["radioactivă","radioactiv","radioactiva","radioactiv"],"radioactive":"radioactiv","radioactivele":"radioactiv","radioactivi":"radioactiv","radioactivii":"radioactiv","radioactivitatea":"radioactivitate","radioactivitati":"radioactivitate","radioactivitatii":"radioactivitate","radioactivitatile":"radioactivitate","radioactivitatilor":"radioactivitate","radioactivul":"radioactiv","radioactualitatea":"radioactualitate","radioactualitati":"radioactualitate","radioactualitatii":"radioactualitate","radioactualitatile":"radioactualitate","radioactualitatilor":"radioactualitate","radioaltimetre":"radioaltimetru","radioaltimetrele":"radioaltimetru","radioaltimetrelor":"radioaltimetru","radioaltimetrul":"radioaltimetru","radioaltimetrule":"radioaltimetru","radioaltimetrului":"radioaltimetru","radioamatori":"radioamator","radioamatorii":"radioamator","radioamatorilor":"radioamator","radioamatorismul":"radioamatorism","radioamatorismule":"radioamatorism","radioamatorismului":"radioamatorism","radioamatorul":"radioamator","radioamatorule":"radioamator","radioamatorului":"radioamator","radioamplificarea":"radioamplificare","radioamplificari":["radioamplificări","radioamplificare","radioamplificari","radioamplificare"],"radioamplificarii":"radioamplificare","radioamplificarile":"radioamplificare","radioamplificarilor":"radioamplificare","radioasa":["radioasă","radios","radioasa","radios"],"radioascultarea":"radioascultare","radioascultari":"radioascultare","radioascultarii":"radioascultare","radioascultatoarea":"radioascultătoare","radioascultatoarei":"radioascultătoare","radioascultatoarele":"radioascultătoare","radioascultatoarelor":"radioascultătoare","radioascultatori":"radioascultător","radioascultatorii":"radioascultător","radioascultatorilor":"radioascultător","radioascultatorul":"radioascultător","radioascultatorule":"radioascultător","radioascultatorului":"radioascultător","radioase":"radios","radioasele":"radios","radioastronomi":"radioastronom","radioastronomia":"radioastronomie","radioastronomica":["radioastronomică","radioastronomic","radioastronomica","radioastronomic"],"radioastronomice":"radioastronomic","radioastronomicele":"radioastronomic","radioastronomici":"radioastronomic","radioastronomicii":"radioastronomic","radioastronomicul":"radioastronomic","radioastronomiei":"radioastronomie","radioastronomii":["radioastronomii","radioastronom","radioastronomii","radioastronomie"],"radioastronomilor":"radioastronom","radioastronomul":"radioastronom","radioastronomule":"radioastronom","radioastronomului":"radioastronom","radioaterizarea":"radioaterizare","radioaterizari":["radioaterizări","radioaterizare","radioaterizari","radioaterizare"],"radioaterizarii":"radioaterizare","radioaterizarile":"radioaterizare","radioaterizarilor":"radioaterizare","radiobalizai":"radiobaliza","radiobalizaje":"radiobalizaj","radiobalizajele":"radiobalizaj","radiobalizajelor":"radiobalizaj","radiobalizajul":"radiobalizaj","radiobalizajule":"radiobalizaj","radiobalizajului":"radiobalizaj","radiobalizam":["radiobalizăm","radiobaliza","radiobalizam","radiobaliza"],"radiobalizand":"radiobaliza","radiobalizara":"radiobaliza","radiobalizaram":"radiobaliza","radiobalizarati":"radiobaliza","radiobalizarea":"radiobalizare","radiobalizari":"radiobalizare","radiobalizarii":"radiobalizare","radiobalizarile":"radiobalizare","radiobalizarilor":"radiobalizare","radiobalizase":"radiobaliza","radiobalizasem":"radiobaliza","radiobalizasera":"radiobaliza","radiobalizaseram":"radiobaliza","radiobalizaserati":"radiobaliza","radiobalizasesi":"radiobaliza","radiobalizasi":"radiobaliza","radiobalizat":"radiobaliza","radiobalizati":"radiobaliza","radiobalizau":"radiobaliza","radiobalize":"radiobaliză","radiobalizeaza":"radiobaliza","radiobalizei":"radiobaliză","radiobalizele":"radiobaliză","radiobalizelor":"radiobaliză","radiobalizez":"radiobaliza","radiobalizezi":"radiobaliza","radiobiologe":"radiobiologă","radiobiologei":"radiobiologă","radiobiologele":"radiobiologă","radiobiologelor":"radiobiologă","radiobiologi":"radiobiolog","radiobiologia":"radiobiologie","radiobiologica":["radiobiologică","radiobiologic","radiobiologica","radiobiologic"],"radiobiologice":"radiobiologic","radiobiologicele":"radiobiologic","radiobiologici":"radiobiologic","radiobiologicii":"radiobiologic","radiobiologicul":"radiobiologic","radiobiologiei":"radiobiologie","radiobiologii":["radiobiologii","radiobiolog","radiobiologii","radiobiologie"],"radiobiologilor":"radiobiolog","radiobiologul":"radiobiolog","radiobiologule":"radiobiolog","radiobiologului":"radiobiolog","radiobiotica":["radiobiotică","radiobiotic","radiobiotica","radiobiotic"],"radiobiotice":"radiobiotic","radiobioticele":"radiobiotic","radiobiotici":"radiobiotic","radiobioticii":"radiobiotic","radiobioticul":"radiobiotic","radiocalciuul":"radiocalciu","radiocalciuule":"radiocalciu","radiocalciuului":"radiocalciu","radiocarbonul":"radiocarbon","radiocarbonule":"radiocarbon","radiocarbonului":"radiocarbon","radiocasetofoane":"radiocasetofon","radiocasetofoanele":"radiocasetofon","radiocasetofoanelor":"radiocasetofon","radiocasetofonul":"radiocasetofon","radiocasetofonule":"radiocasetofon","radiocasetofonului":"radiocasetofon","radiochimia":"radiochimie","radiochimiei":"radiochimie","radiochimii":"radiochimie","radiocinematografia":"radiocinematografie","radiocinematografiei":"radiocinematografie","radiocinematografii":"radiocinematografie","radioclubul":"radioclub","radioclubule":"radioclub","radioclubului":"radioclub","radiocluburi":"radioclub","radiocluburile":"radioclub","radiocluburilor":"radioclub","radiocobaltul":"radiocobalt","radiocobaltule":"radiocobalt","radiocobaltului":"radiocobalt","radiocomenze":"radiocomandă","radiocomenzei":"radiocomandă","radiocomenzele":"radiocomandă","radiocomenzelor":"radiocomandă","radiocomenzi":"radiocomandă","radiocompasul":"radiocompas","radiocompasule":"radiocompas","radiocompasului":"radiocompas","radiocompasuri":"radiocompas","radiocompasurile":"radiocompas","radiocompasurilor":"radiocompas","radiocomunicatia":"radiocomunicație","radiocomunicatiei":"radiocomunicație","radiocomunicatii":"radiocomunicație","radiocomunicatiile":"radiocomunicație","radiocomunicatiilor":"radiocomunicație","radioconductoare":"radioconductor","radioconductoarele":"radioconductor","radioconductoarelor":"radioconductor","radioconductorul":"radioconductor","radioconductorule":"radioconductor","radioconductorului":"radioconductor","radiodermite":"radiodermită","radiodermitei":"radiodermită","radiodermitele":"radiodermită","radiodermitelor":"radiodermită","radiodetectia":"radiodetecție","radiodetectiei":"radiodetecție","radiodetectii":"radiodetecție","radiodetectiile":"radiodetecție","radiodetectiilor":"radiodetecție","radiodiagnostice":"radiodiagnostic","radiodiagnosticele":"radiodiagnostic","radiodiagnosticelor":"radiodiagnostic","radiodiagnosticul":"radiodiagnostic","radiodiagnosticule":"radiodiagnostic","radiodiagnosticului":"radiodiagnostic","radiodifuzai":"radiodifuza","radiodifuzam":["radiodifuzăm","radiodifuza","radiodifuzam","radiodifuza"],"radiodifuzand":"radiodifuza","radiodifuzara":"radiodifuza","radiodifuzaram":"radiodifuza","radiodifuzarati":"radiodifuza","radiodifuzarea":"radiodifuzare","radiodifuzari":"radiodifuzare","radiodifuzarii":"radiodifuzare","radiodifuzarile":"radiodifuzare","radiodifuzarilor":"radiodifuzare","radiodifuzase":"radiodifuza","radiodifuzasem":"radiodifuza","radiodifuzasera":"radiodifuza","radiodifuzaseram":"radiodifuza","radiodifuzaserati":"radiodifuza","radiodifuzasesi":"radiodifuza","radiodifuzasi":"radiodifuza","radiodifuzat":"radiodifuza","radiodifuzata":["radiodifuzată","radiodifuzat","radiodifuzata","radiodifuzat"],"radiodifuzate":"radiodifuzat","radiodifuzatele":"radiodifuzat","radiodifuzati":["radiodifuzați","radiodifuza","radiodifuzați","radiodifuzat"],"radiodifuzatii":"radiodifuzat","radiodifuzatul":"radiodifuzat","radiodifuzau":"radiodifuza","radiodifuzeaza":"radiodifuza","radiodifuzez":"radiodifuza","radiodifuzezi":"radiodifuza","radiodifuziunea":"radiodifuziune","radiodifuziunei":"radiodifuziune","radiodifuziunele":"radiodifuziune","radiodifuziunelor":"radiodifuziune","radiodifuziuni":"radiodifuziune","radiodistributia":"radiodistribuție","radiodistributiei":"radiodistribuție","radiodistributii":"radiodistribuție","radiodistributiile":"radiodistribuție","radiodistributiilor":"radiodistribuție","radioecologia":"radioecologie","radioecologiei":"radioecologie","radioecologii":"radioecologie","radioecoul":"radioecou","radioecoule":"radioecou","radioecoului":"radioecou","radioecouri":"radioecou","radioecourile":"radioecou","radioecourilor":"radioecou","radioelectrica":["radioelectrică","radioelectric","radioelectrica","radioelectric"],"radioelectrice":"radioelectric","radioelectricele":"radioelectric","radioelectrici":"radioelectric","radioelectricianul":"radioelectrician","radioelectricianule":"radioelectrician","radioelectricianului":"radioelectrician","radioelectriciene":"radioelectriciană","radioelectricienei":"radioelectriciană","radioelectricienele":"radioelectriciană","radioelectricienelor":"radioelectriciană","radioelectricieni":"radioelectrician","radioelectricienii":"radioelectrician","radioelectricienilor":"radioelectrician","radioelectricii":"radioelectric","radioelectricitatea":"radioelectricitate","radioelectricitati":"radioelectricitate","radioelectricitatii":"radioelectricitate","radioelectricitatile":"radioelectricitate","radioelectricitatilor":"radioelectricitate","radioelectricul":"radioelectric","radioelemente":"radioelement","radioelementele":"radioelement","radioelementelor":"radioelement","radioelementul":"radioelement","radioelementule":"radioelement","radioelementului":"radioelement","radioemisia":"radioemisie","radioemisiei":"radioemisie","radioemisii":"radioemisie","radioemisiile":"radioemisie","radioemisiilor":"radioemisie","radioemisiunea":"radioemisiune","radioemisiuni":"radioemisiune","radioemisiunii":"radioemisiune","radioemisiunile":"radioemisiune","radioemisiunilor":"radioemisiune","radioemitatoare":"radioemițător","radioemitatoarele":"radioemițător","radioemitatoarelor":"radioemițător","radioemitatorul":"radioemițător","radioemitatorule":"radioemițător","radioemitatorului":"radioemițător","radiofarul":"radiofar","radiofarule":"radiofar","radiofarului":"radiofar","radiofaruri":"radiofar","radiofarurile":"radiofar","radiofarurilor":"radiofar","radioficarea":"radioficare","radioficari":"radioficare","radioficarii":"radioficare","radioficarile":"radioficare","radioficarilor":"radioficare","radioficatia":"radioficație","radioficatiei":"radioficație","radioficatii":"radioficație","radioficatiile":"radioficație","radioficatiilor":"radioficație","radiofizice":"radiofizică","radiofizicei":"radiofizică","radiofizicele":"radiofizică","radiofizicelor":"radiofizică","radiofoane":"radiofon","radiofoanele":"radiofon","radiofoanelor":"radiofon","radiofonia":"radiofonie","radiofonica":["radiofonică","radiofonic","radiofonica","radiofonic"],"radiofonice":"radiofonic","radiofonicele":"radiofonic","radiofonici":"radiofonic","radiofonicii":"radiofonic","radiofonicul":"radiofonic","radiofoniei":"radiofonie","radiofonii":"radiofonie","radiofoniste":"radiofonistă","radiofonistei":"radiofonistă","radiofonistele":"radiofonistă","radiofonistelor":"radiofonistă","radiofonisti":["radiofoniști","radiofonist","radiofonisti","radiofonist"],"radiofonistii":"radiofonist","radiofonistilor":"radiofonist","radiofonistul":"radiofonist","radiofonistule":"radiofonist","radiofonistului":"radiofonist","radiofonul":"radiofon","radiofonule":"radiofon","radiofonului":"radiofon","radiofosforul":"radiofosfor","radiofosforule":"radiofosfor","radiofosforului":"radiofosfor","radiofotografia":"radiofotografie","radiofotografiei":"radiofotografie","radiofotografii":"radiofotografie","radiofotografiile":"radiofotografie","radiofotografiilor":"radiofotografie","radiofrecvente":"radiofrecvență","radiofrecventei":"radiofrecvență","radiofrecventele":"radiofrecvență","radiofrecventelor":"radiofrecvență","radiogalaxia":"radiogalaxie","radiogalaxiei":"radiogalaxie","radiogalaxii":"radiogalaxie","radiogalaxiile":"radiogalaxie","radiogalaxiilor":"radiogalaxie","radiogazete":"radiogazetă","radiogazetei":"radiogazetă","radiogazetele":"radiogazetă","radiogazetelor":"radiogazetă","radiogenetice":"radiogenetică","radiogeneticei":"radiogenetică","radiogeneticele":"radiogenetică","radiogeneticelor":"radiogenetică","radiogeodezia":"radiogeodezie","radiogeodeziei":"radiogeodezie","radiogeodezii":"radiogeodezie","radiogeologia":"radiogeologie","radiogeologica":["radiogeologică","radiogeologic","radiogeologica","radiogeologic"],"radiogeologice":"radiogeologic","radiogeologicele":"radiogeologic","radiogeologici":"radiogeologic","radiogeologicii":"radiogeologic","radiogeologicul":"radiogeologic","radiogeologiei":"radiogeologie","radiogeologii":"radiogeologie","radioghidai":"radioghida","radioghidaje":"radioghidaj","radioghidajele":"radioghidaj","radioghidajelor":"radioghidaj","radioghidajul":"radioghidaj","radioghidajule":"radioghidaj","radioghidajului":"radioghidaj","radioghidam":["radioghidăm","radioghida","radioghidam","radioghida"],"radioghidand":"radioghida","radioghidara":"radioghida","radioghidaram":"radioghida","radioghidarati":"radioghida","radioghidarea":"radioghidare","radioghidari":"radioghidare","radioghidarii":"radioghidare","radioghidarile":"radioghidare","radioghidarilor":"radioghidare","radioghidase":"radioghida","radioghidasem":"radioghida","radioghidasera":"radioghida","radioghidaseram":"radioghida","radioghidaserati":"radioghida","radioghidasesi":"radioghida","radioghidasi":"radioghida","radioghidat":"radioghida","radioghidata":["radioghidată","radioghidat","radioghidata","radioghidat"],"radioghidate":"radioghidat","radioghidatele":"radioghidat","radioghidati":["radioghidați","radioghida","radioghidați","radioghidat"],"radioghidatii":"radioghidat","radioghidatul":"radioghidat","radioghidau":"radioghida","radioghideaza":"radioghida","radioghidez":"radioghida","radioghidezi":"radioghida","radiogoniometre":"radiogoniometru","radiogoniometrele":"radiogoniometru","radiogoniometrelor":"radiogoniometru","radiogoniometria":"radiogoniometrie","radiogoniometrica":["radiogoniometrică","radiogoniometric","radiogoniometrica","radiogoniometric"],"radiogoniometrice":"radiogoniometric","radiogoniometricele":"radiogoniometric","radiogoniometrici":"radiogoniometric","radiogoniometricii":"radiogoniometric","radiogoniometricul":"radiogoniometric","radiogoniometriei":"radiogoniometrie","radiogoniometrii":"radiogoniometrie","radiogoniometrul":"radiogoniometru","radiogoniometrule":"radiogoniometru","radiogoniometrului":"radiogoniometru","radiografia":"radiografie","radiografiai":"radiografia","radiografiam":"radiografia","radiografiara":"radiografia","radiografiaram":"radiografia","radiografiarati":"radiografia","radiografiase":"radiografia","radiografiasem":"radiografia","radiografiasera":"radiografia","radiografiaseram":"radiografia","radiografiaserati":"radiografia","radiografiasesi":"radiografia","radiografiasi":"radiografia","radiografiat":"radiografia","radiografiati":"radiografia","radiografiau":"radiografia","radiografiaza":"radiografia","radiografica":["radiografică","radiografic","radiografica","radiografic"],"radiografice":"radiografic","radiograficele":"radiografic","radiografici":"radiografic","radiograficii":"radiografic","radiograficul":"radiografic","radiografie":"radiografia","radiografieaza":"radiografia","radiografiei":"radiografie","radiografiem":"radiografia","radiografiez":"radiografia","radiografiezi":"radiografia","radiografii":"radiografie","radiografiile":"radiografie","radiografiilor":"radiografie","radiografiind":"radiografia","radiograme":"radiogramă","radiogramei":"radiogramă","radiogramele":"radiogramă","radiogramelor":"radiogramă","radiointerferometre":"radiointerferometru","radiointerferometrele":"radiointerferometru","radiointerferometrelor":"radiointerferometru","radiointerferometrul":"radiointerferometru","radiointerferometrule":"radiointerferometru","radiointerferometrului":"radiointerferometru","radioizotopi":"radioizotop","radioizotopica":["radioizotopică","radioizotopic","radioizotopica","radioizotopic"],"radioizotopice":"radioizotopic","radioizotopicele":"radioizotopic","radioizotopici":"radioizotopic","radioizotopicii":"radioizotopic","radioizotopicul":"radioizotopic","radioizotopii":"radioizotop","radioizotopilor":"radioizotop","radioizotopul":"radioizotop","radioizotopule":"radioizotop","radioizotopului":"radioizotop","radiojurnale":"radiojurnal","radiojurnalele":"radiojurnal","radiojurnalelor":"radiojurnal","radiojurnalul":"radiojurnal","radiojurnalule":"radiojurnal","radiojurnalului":"radiojurnal","radiolari":"radiolar","radiolarii":"radiolar","radiolarilor":"radiolar","radiolaritul":"radiolarit","radiolaritule":"radiolarit","radiolaritului":"radiolarit","radiolarul":"radiolar","radiolarule":"radiolar","radiolarului":"radiolar","radiolocatia":"radiolocație","radiolocatiei":"radiolocație","radiolocatii":"radiolocație","radiolocatiile":"radiolocație","radiolocatiilor":"radiolocație","radiolocatoare":"radiolocator","radiolocatoarele":"radiolocator","radiolocatoarelor":"radiolocator","radiolocatorul":"radiolocator","radiolocatorule":"radiolocator","radiolocatorului":"radiolocator","radiologe":"radiologă","radiologei":"radiologă","radiologele":"radiologă","radiologelor":"radiologă","radiologi":"radiolog","radiologia":"radiologie","radiologica":["radiologică","radiologic","radiologica","radiologic"],"radiologice":"radiologic","radiologicele":"radiologic","radiologici":"radiologic","radiologicii":"radiologic","radiologicul":"radiologic","radiologiei":"radiologie","radiologii":["radiologii","radiolog","radiologii","radiologie"],"radiologilor":"radiolog","radiologul":"radiolog","radiologule":"radiolog","radiologului":"radiolog","radioluminescente":"radioluminescență","radioluminescentei":"radioluminescență","radioluminescentele":"radioluminescență","radioluminescentelor":"radioluminescență","radiometalografia":"radiometalografie","radiometalografiei":"radiometalografie","radiometalografii":"radiometalografie","radiometre":"radiometru","radiometrele":"radiometru","radiometrelor":"radiometru","radiometria":"radiometrie","radiometrica":["radiometrică","radiometric","radiometrica","radiometric"],"radiometrice":"radiometric","radiometricele":"radiometric","radiometrici":"radiometric","radiometricii":"radiometric","radiometricul":"radiometric","radiometriei":"radiometrie","radiometrii":"radiometrie","radiometriile":"radiometrie","radiometriilor":"radiometrie","radiometrul":"radiometru","radiometrule":"radiometru","radiometrului":"radiometru","radiomicrofoane":"radiomicrofon","radiomicrofoanele":"radiomicrofon","radiomicrofoanelor":"radiomicrofon","radiomicrofonul":"radiomicrofon","radiomicrofonule":"radiomicrofon","radiomicrofonului":"radiomicrofon","radiomicrometre":"radiomicrometru","radiomicrometrele":"radiomicrometru","radiomicrometrelor":"radiomicrometru","radiomicrometrul":"radiomicrometru","radiomicrometrule":"radiomicrometru","radiomicrometrului":"radiomicrometru","radiomimetica":["radiomimetică","radiomimetic","radiomimetica","radiomimetic"],"radiomimetice":"radiomimetic","radiomimeticele":"radiomimetic","radiomimetici":"radiomimetic","radiomimeticii":"radiomimetic","radiomimeticul":"radiomimetic","radionavigatia":"radionavigație","radionavigatiei":"radionavigație","radionavigatii":"radionavigație","radionavigatiile":"radionavigație","radionavigatiilor":"radionavigație","radionecroze":"radionecroză","radionecrozei":"radionecroză","radionecrozele":"radionecroză","radionecrozelor":"radionecroză","radionevrite":"radionevrită","radionevritei":"radionevrită","radionevritele":"radionevrită","radionevritelor":"radionevrită","radionuclee":"radionucleu","radionucleele":"radionucleu","radionucleelor":"radionucleu","radionucleul":"radionucleu","radionucleule":"radionucleu","radionucleului":"radionucleu","radioopaca":["radioopacă","radioopac","radioopaca","radioopac"],"radioopace":"radioopac","radioopacele":"radioopac","radioopaci":"radioopac","radioopacii":"radioopac","radioopacul":"radioopac","radiooperatoarea":"radiooperatoare","radiooperatoarei":"radiooperatoare","radiooperatoarele":"radiooperatoare","radiooperatoarelor":"radiooperatoare","radiooperatori":"radiooperator","radiooperatorii":"radiooperator","radiooperatorilor":"radiooperator","radiooperatorul":"radiooperator","radiooperatorule":"radiooperator","radiooperatorului":"radiooperator","radiopatologia":"radiopatologie","radiopatologiei":"radiopatologie","radiopatologii":"radiopatologie","radiopatologiile":"radiopatologie","radiopatologiilor":"radiopatologie","radiopirate":"radiopirat","radiopiratele":"radiopirat","radiopiratelor":"radiopirat","radiopiratul":"radiopirat","radiopiratule":"radiopirat","radiopiratului":"radiopirat","radioprograme":"radioprogram","radioprogramele":"radioprogram","radioprogramelor":"radioprogram","radioprogramul":"radioprogram","radioprogramule":"radioprogram","radioprogramului":"radioprogram","radioprotectia":"radioprotecție","radioprotectiei":"radioprotecție","radioprotectii":"radioprotecție","radioprotectiile":"radioprotecție","radioprotectiilor":"radioprotecție","radioprotectoare":"radioprotector","radioprotectoarea":"radioprotector","radioprotectoarele":"radioprotector","radioprotectori":"radioprotector","radioprotectorii":"radioprotector","radioprotectorul":"radioprotector","radioreceptia":"radiorecepție","radioreceptiei":"radiorecepție","radioreceptii":"radiorecepție","radioreceptiile":"radiorecepție","radioreceptiilor":"radiorecepție","radioreceptoare":"radioreceptor","radioreceptoarele":"radioreceptor","radioreceptoarelor":"radioreceptor","radioreceptorul":"radioreceptor","radioreceptorule":"radioreceptor","radioreceptorului":"radioreceptor","radiorelee":"radioreleu","radioreleele":"radioreleu","radioreleelor":"radioreleu","radioreleul":"radioreleu","radioreleule":"radioreleu","radioreleului":"radioreleu","radioreportaje":"radioreportaj","radioreportajele":"radioreportaj","radioreportajelor":"radioreportaj","radioreportajul":"radioreportaj","radioreportajule":"radioreportaj","radioreportajului":"radioreportaj","radioreporteri":"radioreporter","radioreporterii":"radioreporter","radioreporterilor":"radioreporter","radioreporterul":"radioreporter","radioreporterule":"radioreporter","radioreporterului":"radioreporter","radiorezistenta":["radiorezistentă","radiorezistent","radiorezistenta","radiorezistent"],"radiorezistente":["radiorezistente","radiorezistent","radiorezistențe","radiorezistență"],"radiorezistentei":"radiorezistență","radiorezistentele":["radiorezistentele","radiorezistent","radiorezistențele","radiorezistență"],"radiorezistentelor":"radiorezistență","radiorezistenti":"radiorezistent","radiorezistentii":"radiorezistent","radiorezistentul":"radiorezistent","radioscoale":"radioșcoală","radioscoalei":"radioșcoală","radioscopia":"radioscopie","radioscopica":["radioscopică","radioscopic","radioscopica","radioscopic"],"radioscopice":"radioscopic","radioscopicele":"radioscopic","radioscopici":"radioscopic","radioscopicii":"radioscopic","radioscopicul":"radioscopic","radioscopiei":"radioscopie","radioscopii":"radioscopie","radioscopiile":"radioscopie","radioscopiilor":"radioscopie","radiosensibilitatea":"radiosensibilitate","radiosensibilitati":"radiosensibilitate","radiosensibilitatii":"radiosensibilitate","radiosensibilitatile":"radiosensibilitate","radiosensibilitatilor":"radiosensibilitate","radiosextante":"radiosextant","radiosextantele":"radiosextant","radiosextantelor":"radiosextant","radiosextantul":"radiosextant","radiosextantule":"radiosextant","radiosextantului":"radiosextant","radiosi":"radios","radiosii":"radios","radiosimpozioane":"radiosimpozion","radiosimpozioanele":"radiosimpozion","radiosimpozioanelor":"radiosimpozion","radiosimpozionul":"radiosimpozion","radiosimpozionule":"radiosimpozion","radiosimpozionului":"radiosimpozion","radiosondaje":"radiosondaj","radiosondajele":"radiosondaj","radiosondajelor":"radiosondaj","radiosondajul":"radiosondaj","radiosondajule":"radiosondaj","radiosondajului":"radiosondaj","radiosonde":"radiosondă","radiosondei":"radiosondă","radiosondele":"radiosondă","radiosondelor":"radiosondă","radiosteaua":"radiostea","radiostele":"radiostea","radiostelei":"radiostea","radiostelele":"radiostea","radiostelelor":"radiostea","radiosul":"radios","radiosurse":"radiosursă","radiosursei":"radiosursă","radiosursele":"radiosursă","radiosurselor":"radiosursă","radiotehnica":["radiotehnică","radiotehnic","radiotehnica","radiotehnic"],"radiotehnice":"radiotehnic","radiotehnicele":"radiotehnic","radiotehnici":["radiotehnici","radiotehnic","radiotehnici","radiotehnică"],"radiotehnicii":["radiotehnicii","radiotehnic","radiotehnicii","radiotehnică"],"radiotehnicile":"radiotehnică","radiotehnicilor":"radiotehnică","radiotehnicul":"radiotehnic","radiotelefoane":"radiotelefon","radiotelefoanele":"radiotelefon","radiotelefoanelor":"radiotelefon","radiotelefonia":"radiotelefonie","radiotelefonica":["radiotelefonică","radiotelefonic","radiotelefonica","radiotelefonic"],"radiotelefonice":"radiotelefonic","radiotelefonicele":"radiotelefonic","radiotelefonici":"radiotelefonic","radiotelefonicii":"radiotelefonic","radiotelefonicul":"radiotelefonic","radiotelefoniei":"radiotelefonie","radiotelefonii":"radiotelefonie","radiotelefonul":"radiotelefon","radiotelefonule":"radiotelefon","radiotelefonului":"radiotelefon","radioteleghidata":["radioteleghidată","radioteleghidat","radioteleghidata","radioteleghidat"],"radioteleghidate":"radioteleghidat","radioteleghidatele":"radioteleghidat","radioteleghidati":"radioteleghidat","radioteleghidatii":"radioteleghidat","radioteleghidatul":"radioteleghidat","radiotelegrafia":"radiotelegrafie","radiotelegrafiai":"radiotelegrafia","radiotelegrafiam":"radiotelegrafia","radiotelegrafiara":"radiotelegrafia","radiotelegrafiaram":"radiotelegrafia","radiotelegrafiarati":"radiotelegrafia","radiotelegrafiase":"radiotelegrafia","radiotelegrafiasem":"radiotelegrafia","radiotelegrafiasera":"radiotelegrafia","radiotelegrafiaseram":"radiotelegrafia","radiotelegrafiaserati":"radiotelegrafia","radiotelegrafiasesi":"radiotelegrafia","radiotelegrafiasi":"radiotelegrafia","radiotelegrafiat":"radiotelegrafia","radiotelegrafiata":["radiotelegrafiată","radiotelegrafiat","radiotelegrafiata","radiotelegrafiat"],"radiotelegrafiate":"radiotelegrafiat","radiotelegrafiatele":"radiotelegrafiat","radiotelegrafiati":["radiotelegrafiați","radiotelegrafia","radiotelegrafiați","radiotelegrafiat"],"radiotelegrafiatii":"radiotelegrafiat","radiotelegrafiatul":"radiotelegrafiat","radiotelegrafiau":"radiotelegrafia","radiotelegrafiaza":"radiotelegrafia","radiotelegrafica":["radiotelegrafică","radiotelegrafic","radiotelegrafica","radiotelegrafic"],"radiotelegrafice":"radiotelegrafic","radiotelegraficele":"radiotelegrafic","radiotelegrafici":"radiotelegrafic","radiotelegraficii":"radiotelegrafic","radiotelegraficul":"radiotelegrafic","radiotelegrafie":"radiotelegrafia","radiotelegrafieaza":"radiotelegrafia","radiotelegrafiei":"radiotelegrafie","radiotelegrafiem":"radiotelegrafia","radiotelegrafierea":"radiotelegrafiere","radiotelegrafieri":"radiotelegrafiere","radiotelegrafierii":"radiotelegrafiere","radiotelegrafierile":"radiotelegrafiere","radiotelegrafierilor":"radiotelegrafiere","radiotelegrafiez":"radiotelegrafia","radiotelegrafiezi":"radiotelegrafia","radiotelegrafii":"radiotelegrafie","radiotelegrafiind":"radiotelegrafia","radiotelegrafiste":"radiotelegrafistă","radiotelegrafistei":"radiotelegrafistă","radiotelegrafistele":"radiotelegrafistă","radiotelegrafistelor":"radiotelegrafistă","radiotelegrafisti":"radiotelegrafist","radiotelegrafistii":"radiotelegrafist","radiotelegrafistilor":"radiotelegrafist","radiotelegrafistul":"radiotelegrafist","radiotelegrafistule":"radiotelegrafist","radiotelegrafistului":"radiotelegrafist","radiotelegrame":"radiotelegramă","radiotelegramei":"radiotelegramă","radiotelegramele":"radiotelegramă","radiotelegramelor":"radiotelegramă","radiotelemetre":"radiotelemetru","radiotelemetrele":"radiotelemetru","radiotelemetrelor":"radiotelemetru","radiotelemetria":"radiotelemetrie","radiotelemetrica":["radiotelemetrică","radiotelemetric","radiotelemetrica","radiotelemetric"],"radiotelemetrice":"radiotelemetric","radiotelemetricele":"radiotelemetric","radiotelemetrici":"radiotelemetric","radiotelemetricii":"radiotelemetric","radiotelemetricul":"radiotelemetric","radiotelemetriei":"radiotelemetrie","radiotelemetrii":"radiotelemetrie","radiotelemetrul":"radiotelemetru","radiotelemetrule":"radiotelemetru","radiotelemetrului":"radiotelemetru","radiotelescoape":"radiotelescop","radiotelescoapele":"radiotelescop","radiotelescoapelor":"radiotelescop","radiotelescopul":"radiotelescop","radiotelescopule":"radiotelescop","radiotelescopului":"radiotelescop","radiotelevizata":["radiotelevizată","radiotelevizat","radiotelevizata","radiotelevizat"],"radiotelevizate":"radiotelevizat","radiotelevizatele":"radiotelevizat","radiotelevizati":"radiotelevizat","radiotelevizatii":"radiotelevizat","radiotelevizatul":"radiotelevizat","radioteleviziunea":"radioteleviziune","radioteleviziuni":"radioteleviziune","radioteleviziunii":"radioteleviziune","radioteleviziunile":"radioteleviziune","radioteleviziunilor":"radioteleviziune","radioterapeute":"radioterapeută","radioterapeutei":"radioterapeută","radioterapeutele":"radioterapeută","radioterapeutelor":"radioterapeută","radioterapeuti":"radioterapeut","radioterapeutii":"radioterapeut","radioterapeutilor":"radioterapeut","radioterapeutul":"radioterapeut","radioterapeutule":"radioterapeut","radioterapeutului":"radioterapeut","radioterapia":"radioterapie","radioterapica":["radioterapică","radioterapic","radioterapica","radioterapic"],"radioterapice":"radioterapic","radioterapicele":"radioterapic","radioterapici":"radioterapic","radioterapicii":"radioterapic","radioterapicul":"radioterapic","radioterapiei":"radioterapie","radioterapii":"radioterapie","radiotransmisia":"radiotransmisie","radiotransmisiei":"radiotransmisie","radiotransmisii":"radiotransmisie","radiotransmisiile":"radiotransmisie","radiotransmisiilor":"radiotransmisie","radiotransmisioniste":"radiotransmisionistă","radiotransmisionistei":"radiotransmisionistă","radiotransmisionistele":"radiotransmisionistă","radiotransmisionistelor":"radiotransmisionistă","radiotransmisionisti":"radiotransmisionist","radiotransmisionistii":"radiotransmisionist","radiotransmisionistilor":"radiotransmisionist","radiotransmisionistul":"radiotransmisionist","radiotransmisionistule":"radiotransmisionist","radiotransmisionistului":"radiotransmisionist","radiotransmisiunea":"radiotransmisiune","radiotransmisiunei":"radiotransmisiune","radiotransmisiunele":"radiotransmisiune","radiotransmisiunelor":"radiotransmisiune","radiotransmisiuni":"radiotransmisiune","radiotratamente":"radiotratament","radiotratamentele":"radiotratament","radiotratamentelor":"radiotratament","radiotratamentul":"radiotratament","radiotratamentule":"radiotratament","radiotratamentului":"radiotratament","radioul":"radio","radioule":"radio","radioului":"radio","radiounde":"radioundă","radioundei":"radioundă","radioundele":"radioundă","radioundelor":"radioundă","radiouri":"radio","radiourile":"radio","radiourilor":"radio","radiste":"rădiscă","radistei":"rădiscă","radistele":"rădiscă","radistelor":"rădiscă","radisti":"radist","radistii":"radist","radistilor":"radist","radistul":"radist","radistule":"radist","radistului":"radist","radiul":"radiu","radiule":"radiu","radiului":"radiu","radiumterapia":"radiumterapie","radiumterapiei":"radiumterapie","radiumterapii":"radiumterapie","radiuri":"rădiu","radiurile":"rădiu","radiurilor":"rădiu","radiusuri":"radius","radiuul":"rădiu","radiuule":"rădiu","radiuului":"rădiu","radixul":"radix","radixule":"radix","radixului":"radix","radixuri":"radix","radixurile":"radix","radixurilor":"radix","radomul":"radom","radomule":"radom","radomului":"radom","radomuri":"radom","radomurile":"radom","radomurilor":"radom","radonul":"radon","radonule":"radon","radonului":"radon","radoul":"radou","radoule":"radou","radoului":"radou","radouri":"radou","radourile":"radou"};
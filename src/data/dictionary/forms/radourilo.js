@@ -0,0 +1 @@
+export default {"radourilor":"radou","raducerea":"răducere","raduceri":"răducere","raducerii":"răducere","raducerile":"răducere","raducerilor":"răducere","radule":"radulă","radulei":"radulă","radulele":"radulă","radulelor":"radulă","raduse":"rădușă","radusei":"rădușă","radvanase":"rădvănaș","radvanasele":"rădvănaș","radvanaselor":"rădvănaș","radvanasul":"rădvănaș","radvanasule":"rădvănaș","radvanasului":"rădvănaș","rafaelica":["rafaelică","rafaelic","rafaelica","rafaelic"],"rafaelice":"rafaelic","rafaelicele":"rafaelic","rafaelici":"rafaelic","rafaelicii":"rafaelic","rafaelicul":"rafaelic","rafaelismul":"rafaelism","rafaelismule":"rafaelism","rafaelismului":"rafaelism","rafaelite":"rafaelită","rafaelitei":"rafaelită","rafaelitele":"rafaelită","rafaelitelor":"rafaelită","rafale":"rafală","rafalei":"rafală","rafalele":"rafală","rafalelor":"rafală","rafeuri":"rafeu","rafeurile":"rafeu","rafeurilor":"rafeu","rafeuul":"rafeu","rafeuule":"rafeu","rafeuului":"rafeu","rafia":"rafie","rafiei":"rafie","rafii":"rafie","rafiile":"rafie","rafiilor":"rafie","rafinai":"rafina","rafinaje":"rafinaj","rafinajele":"rafinaj","rafinajelor":"rafinaj","rafinajul":"rafinaj","rafinajule":"rafinaj","rafinajului":"rafinaj","rafinam":["rafinăm","rafina","rafinam","rafina"],"rafinamente":"rafinament","rafinamentele":"rafinament","rafinamentelor":"rafinament","rafinamentul":"rafinament","rafinamentule":"rafinament","rafinamentului":"rafinament","rafinand":"rafina","rafinara":"rafina","rafinaram":"rafina","rafinarati":"rafina","rafinarea":"rafinare","rafinari":"rafinare","rafinaria":"rafinărie","rafinariei":"rafinărie","rafinarii":["rafinării","rafinare","rafinării","rafinărie"],"rafinariile":"rafinărie","rafinariilor":"rafinărie","rafinarile":"rafinare","rafinarilor":"rafinare","rafinase":"rafina","rafinasem":"rafina","rafinasera":"rafina","rafinaseram":"rafina","rafinaserati":"rafina","rafinasesi":"rafina","rafinasi":"rafina","rafinat":"rafina","rafinata":["rafinată","rafinat","rafinata","rafinat"],"rafinate":"rafinat","rafinatele":"rafinat","rafinati":["rafinați","rafina","rafinați","rafinat"],"rafinatia":"rafinație","rafinatiei":"rafinație","rafinatii":["rafinații","rafinat","rafinații","rafinație"],"rafinatiile":"rafinație","rafinatiilor":"rafinație","rafinatori":"rafinator","rafinatorii":"rafinator","rafinatorilor":"rafinator","rafinatorul":"rafinator","rafinatorule":"rafinator","rafinatorului":"rafinator","rafinatul":"rafinat","rafinau":"rafina","rafineaza":"rafina","rafinez":"rafina","rafinezi":"rafina","rafinori":"rafinor","rafinorii":"rafinor","rafinorilor":"rafinor","rafinorul":"rafinor","rafinorule":"rafinor","rafinorului":"rafinor","rafinoze":"rafinoză","rafinozei":"rafinoză","rafinozele":"rafinoză","rafinozelor":"rafinoză","rafistolai":"rafistola","rafistolam":["rafistolăm","rafistola","rafistolam","rafistola"],"rafistoland":"rafistola","rafistolara":"rafistola","rafistolaram":"rafistola","rafistolarati":"rafistola","rafistolase":"rafistola","rafistolasem":"rafistola","rafistolasera":"rafistola","rafistolaseram":"rafistola","rafistolaserati":"rafistola","rafistolasesi":"rafistola","rafistolasi":"rafistola","rafistolat":"rafistola","rafistolati":"rafistola","rafistolau":"rafistola","rafistoleaza":"rafistola","rafistolez":"rafistola","rafistolezi":"rafistola","raftul":"raft","raftule":"raft","raftulete":"răftuleț","raftuletele":"răftuleț","raftuletelor":"răftuleț","raftuletul":"răftuleț","raftuletule":"răftuleț","raftuletului":"răftuleț","raftului":"raft","rafturi":"raft","rafturile":"raft","rafturilor":"raft","rafuia":"răfui","rafuiai":"răfui","rafuiam":"răfui","rafuiati":"răfui","rafuiau":"răfui","rafuieli":"răfuială","rafuielii":"răfuială","rafuielile":"răfuială","rafuielilor":"răfuială","rafuiesc":"răfui","rafuieste":"răfui","rafuiesti":"răfui","rafuii":"răfui","rafuim":"răfui","rafuind":"răfui","rafuira":"răfui","rafuiram":"răfui","rafuirati":"răfui","rafuirea":"răfuire","rafuiri":"răfuire","rafuirii":"răfuire","rafuirile":"răfuire","rafuirilor":"răfuire","rafuise":"răfui","rafuisem":"răfui","rafuisera":"răfui","rafuiseram":"răfui","rafuiserati":"răfui","rafuisesi":"răfui","rafuisi":"răfui","rafuit":"răfui","rafuiti":"răfui","rag":["rag","rage","răg","răgi"],"raga":"rage","ragacea":"răgace","ragacei":"răgace","ragacele":"răgace","ragacelor":"răgace","ragacite":"răgăciță","ragacitei":"răgăciță","ragacitele":"răgăciță","ragacitelor":"răgăciță","ragade":"ragadă","ragadei":"ragadă","ragadele":"ragadă","ragadelor":"ragadă","ragaduiele":"răgăduială","ragaduielei":"răgăduială","ragaduielele":"răgăduială","ragaduielelor":"răgăduială","ragaduieli":"răgăduială","ragaie":"râgâi","ragaieli":"râgâială","ragaielii":"râgâială","ragaielile":"râgâială","ragaielilor":"râgâială","ragairea":"râgâire","ragairi":"râgâire","ragairii":"râgâire","ragairile":"râgâire","ragairilor":"râgâire","ragait":"râgâi","ragaiture":"râgâitură","ragaiturei":"râgâitură","ragaiturele":"râgâitură","ragaiturelor":"râgâitură","ragaituri":"râgâitură","ragalia":"răgălie","ragaliei":"răgălie","ragalii":"răgălie","ragaliile":"răgălie","ragaliilor":"răgălie","ragand":"rage","raganele":"raganelă","raganelei":"raganelă","raganelele":"raganelă","raganelelor":"raganelă","ragazul":"răgaz","ragazule":"răgaz","ragazului":"răgaz","ragazuri":"răgaz","ragazurile":"răgaz","ragazurilor":"răgaz","rage":"răgi","ragea":["răgea","rage","răgea","răgi"],"rageai":["răgeai","rage","răgeai","răgi"],"rageam":["răgeam","rage","răgeam","răgi"],"rageati":["răgeați","rage","răgeați","răgi"],"rageau":["răgeau","rage","răgeau","răgi"],"rageaua":["rageaua","ragea","răgeaua","răgea"],"ragele":["ragele","ragea","răgele","răgea"],"ragelei":["ragelei","ragea","răgelei","răgea"],"ragelele":["ragelele","ragea","răgelele","răgea"],"ragelelor":["ragelelor","ragea","răgelelor","răgea"],"ragem":"rage","ragete":"răget","rageti":"rage","raghile":"raghilă","raghilei":"raghilă","raghilele":"raghilă","raghilelor":"raghilă","ragi":"rage","ragie":"răgi","ragii":"răgi","ragilaul":"ragilă","ragilaule":"ragilă","ragilaului":"ragilă","ragile":"ragilă","ragilele":"ragilă","ragilelor":"ragilă","ragiluice":"răgiluică","ragiluicei":"răgiluică","ragim":"răgi","ragind":"răgi","ragionamente":"ragionament","ragionamentele":"ragionament","ragionamentelor":"ragionament","ragionamentul":"ragionament","ragionamentule":"ragionament","ragionamentului":"ragionament","ragira":"răgi","ragiram":"răgi","ragirati":"răgi","ragise":"răgi","ragisem":"răgi","ragisera":"răgi","ragiseram":"răgi","ragiserati":"răgi","ragisesi":"răgi","ragisi":"răgi","ragit":"răgi","ragiti":"răgi","raglane":"raglan","raglanele":"raglan","raglanelor":"raglan","raglanul":"raglan","raglanule":"raglan","raglanului":"raglan","ragnea":"răgni","ragneai":"răgni","ragneam":"răgni","ragneati":"răgni","ragneau":"răgni","ragnesc":"răgni","ragneste":"răgni","ragnesti":"răgni","ragnii":"răgni","ragnim":"răgni","ragnind":"răgni","ragnira":"răgni","ragniram":"răgni","ragnirati":"răgni","ragnise":"răgni","ragnisem":"răgni","ragnisera":"răgni","ragniseram":"răgni","ragniserati":"răgni","ragnisesi":"răgni","ragnisi":"răgni","ragnit":"răgni","ragniti":"răgni","ragorituri":"răgoritură","ragoriturii":"răgoritură","ragoriturile":"răgoritură","ragoriturilor":"răgoritură","ragoz":"rogoz","ragozul":"răgoz","ragozule":"răgoz","ragozului":"răgoz","ragozuri":"răgoz","ragozurile":"răgoz","ragozurilor":"răgoz","ragtime-uri":"ragtime","ragtime-urile":"ragtime","ragtime-urilor":"ragtime","ragtimeul":"ragtime","ragtimeule":"ragtime","ragtimeului":"ragtime","ragule":"răgulă","ragulei":"răgulă","ragulele":"răgulă","ragulelor":"răgulă","ragusata":["răgușată","răgușat","răgușata","răgușat"],"ragusate":"răgușat","ragusatele":"răgușat","ragusati":"răgușat","ragusatii":"răgușat","ragusatul":"răgușat","ragusea":"răguși","raguseai":"răguși","raguseam":"răguși","raguseati":"răguși","raguseau":"răguși","raguseli":"răgușeală","raguselii":"răgușeală","raguselile":"răgușeală","raguselilor":"răgușeală","ragusesc":"răguși","raguseste":"răguși","ragusesti":"răguși","ragusii":"răguși","ragusim":"răguși","ragusind":"răguși","ragusira":"răguși","ragusiram":"răguși","ragusirati":"răguși","ragusise":"răguși","ragusisem":"răguși","ragusisera":"răguși","ragusiseram":"răguși","ragusiserati":"răguși","ragusisesi":"răguși","ragusisi":"răguși","ragusit":"răguși","ragusita":["răgușită","răgușit","răgușita","răgușit"],"ragusite":"răgușit","ragusitele":"răgușit","ragusiti":["răgușiți","răguși","răgușiți","răgușit"],"ragusitii":"răgușit","ragusitul":"răgușit","raguzana":["raguzană","raguzan","raguzana","raguzan"],"raguzane":"raguzan","raguzanele":"raguzan","raguzani":"raguzan","raguzanii":"raguzan","raguzanilor":"raguzan","raguzanul":"raguzan","raguzanule":"raguzan","raguzanului":"raguzan","rahageria":"rahagerie","rahageriei":"rahagerie","rahagerii":"rahagerie","rahageriile":"rahagerie","rahageriilor":"rahagerie","rahagii":"rahagiu","rahagiii":"rahagiu","rahagiilor":"rahagiu","rahagiul":"rahagiu","rahagiule":"rahagiu","rahagiului":"rahagiu","rahatgii":"rahatgiu","rahatgiii":"rahatgiu","rahatgiilor":"rahatgiu","rahatgiuul":"rahatgiu","rahatgiuule":"rahatgiu","rahatgiuului":"rahatgiu","rahatisul":"răhățiș","rahatisule":"răhățiș","rahatisului":"răhățiș","rahatisuri":"răhățiș","rahatisurile":"răhățiș","rahatisurilor":"răhățiș","rahatlocumul":"rahatlocum","rahatlocumule":"rahatlocum","rahatlocumului":"rahatlocum","rahatlocumuri":"rahatlocum","rahatlocumurile":"rahatlocum","rahatlocumurilor":"rahatlocum","rahatul":"rahat","rahatule":"rahat","rahatului":"rahat","rahaturi":"rahat","rahaturile":"rahat","rahaturilor":"rahat","rahialgia":"rahialgie","rahialgiei":"rahialgie","rahialgii":"rahialgie","rahialgiile":"rahialgie","rahialgiilor":"rahialgie","rahianestezia":"rahianestezie","rahianesteziei":"rahianestezie","rahianestezii":"rahianestezie","rahicenteze":"rahicenteză","rahicentezei":"rahicenteză","rahicentezele":"rahicenteză","rahicentezelor":"rahicenteză","rahidiana":["rahidiană","rahidian","rahidiana","rahidian"],"rahidianul":"rahidian","rahidiene":"rahidian","rahidienele":"rahidian","rahidieni":"rahidian","rahidienii":"rahidian","rahisul":"rahis","rahisule":"rahis","rahisului":"rahis","rahitica":["rahitică","rahitic","rahitica","rahitic"],"rahitice":"rahitic","rahiticele":"rahitic","rahitici":"rahitic","rahiticii":"rahitic","rahiticul":"rahitic","rahitismul":"rahitism","rahitismule":"rahitism","rahitismului":"rahitism","rahne":"râhnă","rahnei":"râhnă","rahnele":"râhnă","rahnelor":"râhnă","rahtivani":"rahtivan","rahtivanii":"rahtivan","rahtivanilor":"rahtivan","rahtivanul":"rahtivan","rahtivanule":"rahtivan","rahtivanului":"rahtivan","rai":["râi","râie","răi","rău"],"raia":"râie","raiale":"raia","raialei":"raia","raialelor":"raia","raiaul":"raia","raiaule":"raia","raiaului":"raia","raidul":"raid","raidule":"raid","raidului":"raid","raiduri":"raid","raidurile":"raid","raidurilor":"raid","raiesei":"răieșel","raieseii":"răieșel","raieseilor":"răieșel","raieselul":"răieșel","raieselule":"răieșel","raieselului":"răieșel","raigrasul":"raigras","raigrasule":"raigras","raigrasului":"raigras","raii":["râii","râie","răii","rău"],"raimea":"răime","raimi":"răime","raimii":"răime","raimile":"răime","raimilor":"răime","raine":"raină","rainei":"raină","rainele":"raină","rainelor":"raină","raioane":"raion","raioanele":"raion","raioanelor":"raion","raioasa":["râioasă","râios","râioasa","râios"],"raioase":"râios","raioasele":"râios","raionai":"raiona","raionala":["raională","raional","raionala","raional"],"raionale":"raional","raionalele":"raional","raionali":"raional","raionalii":"raional","raionalul":"raional","raionam":["raionăm","raiona","raionam","raiona"],"raionand":"raiona","raionara":"raiona","raionaram":"raiona","raionarati":"raiona","raionarea":"raionare","raionari":"raionare","raionarii":"raionare","raionarile":"raionare","raionarilor":"raionare","raionase":"raiona","raionasem":"raiona","raionasera":"raiona","raionaseram":"raiona","raionaserati":"raiona","raionasesi":"raiona","raionasi":"raiona","raionat":"raiona","raionati":"raiona","raionau":"raiona","raioneaza":"raiona","raionez":"raiona","raionezi":"raiona","raionul":"raion","raionule":"raion","raionului":"raion","raiosi":"râios","raiosii":"râios","raiosul":"râios","raitugi":"răitug","raitugul":"răitug","raitugule":"răitug","raitugului":"răitug","raiul":"rai","raiule":"rai","raiului":"rai","raiuri":"rai","raiurile":"rai","raiurilor":"rai","rajahi":"rajah","rajahii":"rajah","rajahilor":"rajah","rajahul":"rajah","rajahule":"rajah","rajahului":"rajah","rajnite":"râjniță","rajnitei":"râjniță","rajnitele":"râjniță","rajnitelor":"râjniță","ralantiul":"ralanti","ralantiule":"ralanti","ralantiului":"ralanti","ralantiuri":"ralanti","ralantiurile":"ralanti","ralantiurilor":"ralanti","ralantizarea":"ralantizare","ralantizari":"ralantizare","ralantizarii":"ralantizare","ralantizarile":"ralantizare","ralantizarilor":"ralantizare","rale":"râlă","ralei":"râlă","raliai":"ralia","raliam":"ralia","raliara":"ralia","raliaram":"ralia","raliarati":"ralia","raliarea":"raliare","raliari":"raliare","raliarii":"raliare","raliarile":"raliare","raliarilor":"raliare","raliase":"ralia","raliasem":"ralia","raliasera":"ralia","raliaseram":"ralia","raliaserati":"ralia","raliasesi":"ralia","raliasi":"ralia","raliat":"ralia","raliati":"ralia","raliau":"ralia","raliaza":"ralia","ralide":"ralid","ralidele":"ralid","ralidelor":"ralid","ralidul":"ralid","ralidule":"ralid","ralidului":"ralid","ralie":"ralia","ralieaza":"ralia","raliem":"ralia","ralierea":"raliere","ralieri":"raliere","ralierii":"raliere","ralierile":"raliere","ralierilor":"raliere","raliez":"ralia","raliezi":"ralia","raliind":"ralia","ralite":"raliță","ralitei":"raliță","ralitele":"raliță","ralitelor":"raliță","raliul":"raliu","raliule":"raliu","raliului":"raliu","raliuri":"raliu","raliurile":"raliu","raliurilor":"raliu","ram":"râma","ramai":["ramai","rama","râmai","râma","rămâi","rămâne","rămâi","rămânea"],"ramaitoare":"rămâitor","ramaitoarea":"rămâitor","ramaitoarele":"rămâitor","ramaitori":"rămâitor","ramaitorii":"rămâitor","ramaitorul":"rămâitor","ramam":["ramăm","rama","ramam","rama","râmăm","râma","râmam","râma"],"raman":["rămân","rămâne","rămân","rămânea"],"ramana":["rămână","rămâne","rămână","rămânea"],"ramana cu buzele umflate":"rămâne cu buzele umflate","ramanand":["rămânând","rămâne","rămânând","rămânea"],"ramand":["ramând","rama","râmând","râma"],"ramane":"rămânea","ramanea":"rămâne","ramaneai":["rămâneai","rămâne","rămâneai","rămânea"],"ramaneam":["rămâneam","rămâne","rămâneam","rămânea"],"ramaneati":["rămâneați","rămâne","rămâneați","rămânea"],"ramaneau":["rămâneau","rămâne","rămâneau","rămânea"],"ramanem":["rămânem","rămâne","rămânem","rămânea"],"ramanerea":"rămânere","ramaneri":"rămânere","ramanerii":"rămânere","ramanerile":"rămânere","ramanerilor":"rămânere","ramaneti":["rămâneți","rămâne","rămâneți","rămânea"],"ramani":"râmân","ramanii":"râmân","ramanilor":"râmân","ramanul":"râmân","ramanule":"râmân","ramanului":"râmân","ramara":["ramară","rama","râmară","râma"],"ramaram":["ramarăm","rama","râmarăm","râma"],"ramarati":["ramarăți","rama","râmarăți","râma"],"ramas":["rămas","rămâne","rămas","rămânea"],"ramas cu buzele umflate":"rămâne cu buzele umflate","ramasa":"rămas","ramasagul":"rămășag","ramasagule":"rămășag","ramasagului":"rămășag","ramasaguri":"rămășag","ramasagurile":"rămășag","ramasagurilor":"rămășag","ramasature":"rămăsătură","ramasaturei":"rămăsătură","ramasaturi":"rămăsătură","ramase":["ramase","rama","râmase","râma","rămase","rămâne","rămase","rămânea","rămase","rămas"],"ramasea":"rămăși","ramaseai":"rămăși","ramaseam":"rămăși","ramaseati":"rămăși","ramaseau":"rămăși","ramasei":["rămăsei","rămâne","rămăsei","rămânea"],"ramasele":"rămășeală","ramaselei":"rămășeală","ramaselele":"rămășeală","ramaselelor":"rămășeală","ramaseli":"rămășeală","ramaselnici":"rămășelnic","ramaselnicii":"rămășelnic","ramaselnicilor":"rămășelnic","ramaselnicul":"rămășelnic","ramaselnicule":"rămășelnic","ramaselnicului":"rămășelnic","ramasem":["ramasem","rama","râmasem","râma"],"ramasera":["ramaseră","rama","râmaseră","râma","rămaseră","rămâne","rămaseră","rămânea"],"ramaseram":["ramaserăm","rama","râmaserăm","râma","rămaserăm","rămâne","rămaserăm","rămânea"],"ramaserati":["ramaserăți","rama","râmaserăți","râma","rămaserăți","rămâne","rămaserăți","rămânea"],"ramasesc":"rămăși","ramasese":["rămăsese","rămâne","rămăsese","rămânea"],"ramasesem":["rămăsesem","rămâne","rămăsesem","rămânea"],"ramasesera":["rămăseseră","rămâne","rămăseseră","rămânea"],"ramaseseram":["rămăseserăm","rămâne","rămăseserăm","rămânea"],"ramaseserati":["rămăseserăți","rămâne","rămăseserăți","rămânea"],"ramasesesi":["rămăseseși","rămâne","rămăseseși","rămânea"],"ramasesi":["ramaseși","rama","râmaseși","râma","rămăseși","rămâne","rămăseși","rămânea"],"ramaseste":"rămăși","ramasesti":"rămăși","ramasi":["ramași","rama","râmași","râma","rămași","rămas"],"ramasii":"rămăși","ramasim":"rămăși","ramasind":"rămăși","ramasira":"rămăși","ramasiram":"rămăși","ramasirati":"rămăși","ramasise":"rămăși","ramasisem":"rămăși","ramasisera":"rămăși","ramasiseram":"rămăși","ramasiserati":"rămăși","ramasisesi":"rămăși","ramasisi":"rămăși","ramasit":"rămăși","ramasite":"rămășiță","ramasiti":"rămăși","ramasituri":"rămășitură","ramasiturii":"rămășitură","ramasiturile":"rămășitură","ramasiturilor":"rămășitură","ramasoiul":"rămăsoi","ramasoiule":"rămăsoi","ramasoiului":"rămăsoi","ramasul":["rămasul","rămas","rămașul","rămaș"],"ramasule":["rămasule","rămas","rămașule","rămaș"],"ramasului":["rămasului","rămas","rămașului","rămaș"],"ramasuri":["rămasuri","rămas","rămașuri","rămaș"],"ramasurile":["rămasurile","rămas","rămașurile","rămaș"],"ramasurilor":["rămasurilor","rămas","rămașurilor","rămaș"],"ramat":["ramat","rama","râmat","râma"],"ramati":["ramați","rama","râmați","râma"],"ramatori":"râmător","ramatorii":"râmător","ramatorilor":"râmător","ramatorul":"râmător","ramatorule":"râmător","ramatorului":"râmător","ramau":["ramau","rama","râmau","râma"],"ramazane":"ramazan","ramazanele":"ramazan","ramazanelor":"ramazan","ramazanul":"ramazan","ramazanule":"ramazan","ramazanului":"ramazan","rambleiai":"rambleia","rambleiaje":"rambleiaj","rambleiajele":"rambleiaj","rambleiajelor":"rambleiaj","rambleiajul":"rambleiaj","rambleiajule":"rambleiaj","rambleiajului":"rambleiaj","rambleiam":"rambleia","rambleiara":"rambleia","rambleiaram":"rambleia","rambleiarati":"rambleia","rambleiase":"rambleia","rambleiasem":"rambleia","rambleiasera":"rambleia","rambleiaseram":"rambleia","rambleiaserati":"rambleia","rambleiasesi":"rambleia","rambleiasi":"rambleia","rambleiat":"rambleia","rambleiati":"rambleia","rambleiau":"rambleia","rambleiaza":"rambleia","rambleie":"rambleia","rambleiem":"rambleia","rambleiez":"rambleia","rambleiezi":"rambleia","rambleind":"rambleia","rambleul":"rambleu","rambleule":"rambleu","rambleului":"rambleu","rambleuri":"rambleu","rambleurile":"rambleu","rambleurilor":"rambleu","rambursabila":["rambursabilă","rambursabil","rambursabila","rambursabil"],"rambursabile":"rambursabil","rambursabilele":"rambursabil","rambursabili":"rambursabil","rambursabilii":"rambursabil","rambursabilul":"rambursabil","rambursai":"rambursa","rambursam":["rambursăm","rambursa","rambursam","rambursa"],"rambursand":"rambursa","rambursara":"rambursa","rambursaram":"rambursa","rambursarati":"rambursa","rambursarea":"rambursare","rambursari":"rambursare","rambursarii":"rambursare","rambursarile":"rambursare","rambursarilor":"rambursare","rambursase":"rambursa","rambursasem":"rambursa","rambursasera":"rambursa","rambursaseram":"rambursa","rambursaserati":"rambursa","rambursasesi":"rambursa","rambursasi":"rambursa","rambursat":"rambursa","rambursati":"rambursa","rambursau":"rambursa","ramburseaza":"rambursa","rambursez":"rambursa","rambursezi":"rambursa","rambursul":"ramburs","rambursule":"ramburs","rambursului":"ramburs","rambursuri":"ramburs","rambursurile":"ramburs","rambursurilor":"ramburs","ramce":"ramcă","ramcei":"ramcă","ramcele":"ramcă","ramcelor":"ramcă","rame":["rame","ramă","râme","râma","râme","râmă"],"rameaza":"rama","ramei":["ramei","ramă","râmei","râmă"],"ramele":["ramele","ramă","râmele","râmă"],"ramelor":["ramelor","ramă","râmelor","râmă"],"ramere":"rameră","ramerei":"rameră","ramerele":"rameră","ramerelor":"rameră","rameri":"ramer","ramerii":"ramer","ramerilor":"ramer","ramerul":"ramer","ramerule":"ramer","ramerului":"ramer","ramez":"rama","ramezi":"rama","rami":"râma","ramia":"ramie","ramiei":"ramie","ramific":"ramifica","ramificai":"ramifica","ramificam":["ramificăm","ramifica","ramificam","ramifica"],"ramificand":"ramifica","ramificara":"ramifica","ramificaram":"ramifica","ramificarati":"ramifica","ramificarea":"ramificare","ramificari":"ramificare","ramificarii":"ramificare","ramificarile":"ramificare","ramificarilor":"ramificare","ramificase":"ramifica","ramificasem":"ramifica","ramificasera":"ramifica","ramificaseram":"ramifica","ramificaserati":"ramifica","ramificasesi":"ramifica","ramificasi":"ramifica","ramificat":"ramifica","ramificata":["ramificată","ramificat","ramificata","ramificat"],"ramificate":"ramificat","ramificatele":"ramificat","ramificati":["ramificați","ramifica","ramificați","ramificat"],"ramificatia":"ramificație","ramificatiei":"ramificație","ramificatii":["ramificații","ramificat","ramificații","ramificație"],"ramificatiile":"ramificație","ramificatiilor":"ramificație","ramificatul":"ramificat","ramificau":"ramifica","ramifice":"ramifica","ramifici":"ramifica","ramii":"ramie","ramleanul":"râmlean","ramleanule":"râmlean","ramleanului":"râmlean","ramleneasca":["râmlenească","râmlenesc","râmleneasca","râmlenesc"],"ramlenescul":"râmlenesc","ramlenesti":"râmlenesc","ramlenestii":"râmlenesc","ramlenestile":"râmlenesc","ramleni":"râmlean","ramlenii":"râmlean","ramlenilor":"râmlean","ramnea":"râmni","ramneai":"râmni","ramneam":"râmni","ramneati":"râmni","ramneau":"râmni","ramnele":"râmneală","ramnelei":"râmneală","ramnelele":"râmneală","ramnelelor":"râmneală","ramneli":"râmneală","ramnesc":"râmni","ramneste":"râmni","ramnesti":"râmni","ramni":"ramn","ramnice":"râmnic","ramnicele":["râmnicele","râmnic","râmnicele","râmnicel"],"ramnicelele":"râmnicel","ramnicelelor":"râmnicel","ramnicelor":"râmnic","ramnicelul":"râmnicel","ramnicelule":"râmnicel","ramnicelului":"râmnicel","ramnicul":"râmnic","ramnicule":"râmnic","ramnicului":"râmnic","ramnii":["ramnii","ramn","râmnii","râmni"],"ramnilor":"ramn","ramnim":"râmni","ramnind":"râmni","ramnira":"râmni","ramniram":"râmni","ramnirati":"râmni","ramnise":"râmni","ramnisem":"râmni","ramnisera":"râmni","ramniseram":"râmni","ramniserati":"râmni","ramnisesi":"râmni","ramnisi":"râmni","ramnit":"râmni","ramnita":["râmnită","râmnit","râmnita","râmnit"],"ramnite":"râmnit","ramnitele":"râmnit","ramniti":["râmniți","râmni","râmniți","râmnit"],"ramnitii":"râmnit","ramnitoare":"râmnitor","ramnitoarea":"râmnitor","ramnitoarele":"râmnitor","ramnitori":"râmnitor","ramnitorii":"râmnitor","ramnitorul":"râmnitor","ramnitul":"râmnit","ramnul":"ramn","ramnule":"ramn","ramnului":"ramn","ramoasa":["ramoasă","ramos","ramoasa","ramos","rămoasă","rămos","rămoasa","rămos"],"ramoase":["ramoase","ramos","rămoase","rămos"],"ramoasele":["ramoasele","ramos","rămoasele","rămos"],"ramolea":"ramoli","ramoleai":"ramoli","ramoleam":"ramoli","ramoleati":"ramoli","ramoleau":"ramoli","ramolele":"ramoleală","ramolelei":"ramoleală","ramolelele":"ramoleală","ramolelelor":"ramoleală","ramoleli":"ramoleală","ramolesc":"ramoli","ramoleste":"ramoli","ramolesti":"ramoli","ramolii":"ramoli","ramolim":"ramoli","ramolind":"ramoli","ramolira":"ramoli","ramoliram":"ramoli","ramolirati":"ramoli","ramolise":"ramoli","ramolisem":"ramoli","ramolisera":"ramoli","ramoliseram":"ramoli","ramoliserati":"ramoli","ramolisesi":"ramoli","ramolisi":"ramoli","ramolisirea":"ramolisire","ramolisiri":"ramolisire","ramolisirii":"ramolisire","ramolisirile":"ramolisire","ramolisirilor":"ramolisire","ramolismente":"ramolisment","ramolismentele":"ramolisment","ramolismentelor":"ramolisment","ramolismentul":"ramolisment","ramolismentule":"ramolisment","ramolismentului":"ramolisment","ramolit":"ramoli","ramolita":["ramolită","ramolit","ramolita","ramolit"],"ramolite":["ramolite","ramolit","ramolite","ramolită"],"ramolitei":"ramolită","ramolitele":["ramolitele","ramolit","ramolitele","ramolită"],"ramolitelor":"ramolită","ramoliti":["ramoliți","ramoli","ramoliți","ramolit"],"ramolitii":"ramolit","ramolitul":"ramolit","ramosi":["ramoși","ramos","rămoși","rămos"],"ramosii":["ramoșii","ramos","rămoșii","rămos"],"ramosul":["ramosul","ramos","rămosul","rămos"],"rampanta":["rampantă","rampant","rampanta","rampant"],"rampante":"rampant","rampantele":"rampant","rampanti":"rampant","rampantii":"rampant","rampantul":"rampant","rampe":"rampă","rampe de lansare":"rampă de lansare","rampei":"rampă","rampele":"rampă","rampelor":"rampă","ramplasai":"ramplasa","ramplasam":["ramplasăm","ramplasa","ramplasam","ramplasa"],"ramplasand":"ramplasa","ramplasara":"ramplasa","ramplasaram":"ramplasa","ramplasarati":"ramplasa","ramplasarea":"ramplasare","ramplasari":"ramplasare","ramplasarii":"ramplasare","ramplasarile":"ramplasare","ramplasarilor":"ramplasare","ramplasase":"ramplasa","ramplasasem":"ramplasa","ramplasasera":"ramplasa","ramplasaseram":"ramplasa","ramplasaserati":"ramplasa","ramplasasesi":"ramplasa","ramplasasi":"ramplasa","ramplasat":"ramplasa","ramplasati":"ramplasa","ramplasau":"ramplasa","ramplaseaza":"ramplasa","ramplasez":"ramplasa","ramplasezi":"ramplasa","ramturoasa":["rămțuroasă","rămțuros","rămțuroasa","rămțuros"],"ramturoase":"rămțuros","ramturoasele":"rămțuros","ramturosi":"rămțuros","ramturosii":"rămțuros","ramturosul":"rămțuros","ramur":"rămuri","ramurata":["rămurată","rămurat","rămurata","rămurat"],"ramurate":"rămurat","ramuratele":"rămurat","ramurati":"rămurat","ramuratii":"rămurat","ramuratul":"rămurat","ramure":"rămuri","ramurea":"rămuri","ramureai":"rămuri","ramuream":"rămuri","ramureati":"rămuri","ramureau":"rămuri","ramureaua":"rămurea","ramurele":["rămurele","rămurea","rămurele","rămurică"],"ramurelei":["rămurelei","rămurea","rămurelei","rămurică"],"ramurelele":["rămurelele","rămurea","rămurelele","rămurică"],"ramurelelor":["rămurelelor","rămurea","rămurelelor","rămurică"],"ramurelle":"rămurel","ramurellor":"rămurel","ramuri":["ramuri","ram","ramuri","ramură"],"ramurie":"rămuri","ramurii":["ramurii","ramură","rămurii","rămuri"],"ramurile":"ramură","ramurilor":"ramură","ramurim":"rămuri","ramurind":"rămuri","ramurira":"rămuri","ramuriram":"rămuri","ramurirati":"rămuri","ramurise":"rămuri","ramurisem":"rămuri","ramurisera":"rămuri","ramuriseram":"rămuri","ramuriserati":"rămuri","ramurisesi":"rămuri","ramurisi":"rămuri","ramuristea":"rămuriște","ramuristi":"rămuriște","ramuristii":"rămuriște","ramuristile":"rămuriște","ramuristilor":"rămuriște","ramurisul":"rămuriș","ramurisule":"rămuriș","ramurisului":"rămuriș","ramurisuri":"rămuriș","ramurisurile":"rămuriș","ramurisurilor":"rămuriș","ramurit":"rămuri","ramurite":"rămuriță","ramuritei":"rămuriță","ramuritele":"rămuriță","ramuritelor":"rămuriță","ramuriti":"rămuri","ramuroasa":["rămuroasă","rămuros","rămuroasa","rămuros"],"ramuroase":"rămuros","ramuroasele":"rămuros","ramurosi":"rămuros","ramurosii":"rămuros","ramurosul":"rămuros","ramusoare":"rămușor","ramusoarele":"rămușor","ramusoarelor":"rămușor","ramusorul":"rămușor","ramusorule":"rămușor","ramusorului":"rămușor","rancacii":"râncaci","rancaciul":"râncaci","rancauri":"răncău","rancaurile":"răncău","rancaurilor":"răncău","rancauul":"răncău","rancauule":"răncău","rancauului":"răncău","ranceda":["râncedă","rânced","rânceda","rânced"],"rancede":"rânced","rancedele":"rânced","rancedul":"rânced","ranceduta":["rânceduță","rânceduț","rânceduța","rânceduț"],"rancedute":"rânceduț","rancedutele":"rânceduț","ranceduti":"rânceduț","rancedutii":"rânceduț","rancedutul":"rânceduț","rancez":"râncezi","ranceze":"râncezi","rancezea":"râncezi","rancezeai":"râncezi","rancezeam":"râncezi","rancezeati":"râncezi","rancezeau":"râncezi","rancezeli":"râncezeală","rancezelii":"râncezeală","rancezelile":"râncezeală","rancezelilor":"râncezeală","rancezi":"rânced","rancezie":"râncezi","rancezii":["râncezii","rânced","râncezii","râncezi"],"rancezim":"râncezi","rancezind":"râncezi","rancezira":"râncezi","ranceziram":"râncezi","rancezirati":"râncezi","rancezirea":"râncezire","ranceziri":"râncezire","rancezirii":"râncezire","rancezirile":"râncezire","rancezirilor":"râncezire","rancezise":"râncezi","rancezisem":"râncezi","rancezisera":"râncezi","ranceziseram":"râncezi","ranceziserati":"râncezi","rancezisesi":"râncezi","rancezisi":"râncezi","rancezit":"râncezi","rancezita":["râncezită","râncezit","râncezita","râncezit"],"rancezite":"râncezit","rancezitele":"râncezit","ranceziti":["rânceziți","râncezi","rânceziți","râncezit"],"rancezitii":"râncezit","rancezitul":"râncezit","ranch-ul":"ranch","ranch-ule":"ranch","ranch-ului":"ranch","ranch-uri":"ranch","ranch-urile":"ranch","ranch-urilor":"ranch","rancheaza":"râncheza","ranchez":"râncheza","ranchezai":"râncheza","ranchezam":["rânchezăm","râncheza","rânchezam","râncheza"],"ranchezand":"râncheza","ranchezara":"râncheza","ranchezaram":"râncheza","ranchezarati":"râncheza","ranchezarea":"rânchezare","ranchezari":"rânchezare","ranchezarii":"rânchezare","ranchezarile":"rânchezare","ranchezarilor":"rânchezare","ranchezase":"râncheza","ranchezasem":"râncheza","ranchezasera":"râncheza","ranchezaseram":"râncheza","ranchezaserati":"râncheza","ranchezasesi":"râncheza","ranchezasi":"râncheza","ranchezat":"râncheza","ranchezati":"râncheza","ranchezatul":"rânchezat","ranchezatule":"rânchezat","ranchezatului":"rânchezat","ranchezau":"râncheza","rancheze":"râncheza","ranchezi":"râncheza","ranchezul":"rânchez","ranchezule":"rânchez","ranchezului":"rânchez","ranchezuri":"rânchez","ranchezurile":"rânchez","ranchezurilor":"rânchez","ranchiune":"ranchiună","ranchiunoasa":["ranchiunoasă","ranchiunos","ranchiunoasa","ranchiunos"],"ranchiunoase":"ranchiunos","ranchiunoasele":"ranchiunos","ranchiunosi":"ranchiunos","ranchiunosii":"ranchiunos","ranchiunosul":"ranchiunos","rancita":["râncită","râncit","râncita","râncit"],"rancite":"râncit","rancitele":"râncit","ranciti":"râncit","rancitii":"râncit","rancitul":"râncit","randamente":"randament","randamentele":"randament","randamentelor":"randament","randamentul":"randament","randamentule":"randament","randamentului":"randament","randarea":"randare","randari":["randări","randare","randari","randare"],"randarii":"randare","randarile":"randare","randarilor":"randare","randasi":"rândaș","randasii":"rândaș","randasilor":"rândaș","randasul":"rândaș","randasule":"rândaș","randasului":"rândaș","randeaua":"rândea","randele":"rândea","randelei":"rândea","randelele":"rândea","randelelor":"rândea","randevuri":"randevu","randevuul":"randevu","randevuule":"randevu","randevuului":"randevu","randevuuri":"randevu","randevuurile":"randevu","randevuurilor":"randevu","randomizai":"randomiza","randomizam":["randomizăm","randomiza","randomizam","randomiza"],"randomizand":"randomiza","randomizara":"randomiza","randomizaram":"randomiza","randomizarati":"randomiza","randomizarea":"randomizare","randomizari":"randomizare","randomizarii":"randomizare","randomizarile":"randomizare","randomizarilor":"randomizare","randomizase":"randomiza","randomizasem":"randomiza","randomizasera":"randomiza","randomizaseram":"randomiza","randomizaserati":"randomiza","randomizasesi":"randomiza","randomizasi":"randomiza","randomizat":"randomiza","randomizati":"randomiza","randomizau":"randomiza","randomizeaza":"randomiza","randomizez":"randomiza","randomizezi":"randomiza","randuia":"rândui","randuiai":"rândui","randuiam":"rândui","randuiati":"rândui","randuiau":"rândui","randuieli":"rânduială","randuielii":"rânduială","randuielile":"rânduială","randuielilor":"rânduială","randuiesc":"rândui","randuieste":"rândui","randuiesti":"rândui","randuii":"rândui","randuim":"rândui","randuind":"rândui","randuira":"rândui","randuiram":"rândui","randuirati":"rândui","randuirea":"rânduire","randuiri":"rânduire","randuirii":"rânduire","randuirile":"rânduire","randuirilor":"rânduire","randuise":"rândui","randuisem":"rândui","randuisera":"rândui","randuiseram":"rândui","randuiserati":"rândui","randuisesi":"rândui","randuisi":"rândui","randuit":"rândui","randuiti":"rândui","randul":"rând","randule":"rând","randulete":"rânduleț","randuletele":"rânduleț","randuletelor":"rânduleț","randuletul":"rânduleț","randuletule":"rânduleț","randuletului":"rânduleț","randului":"rând","randuneasca":["rândunească","rândunesc","rânduneasca","rândunesc"],"randuneaua":"rândunea","randunei":"rândunel","randuneii":"rândunel","randuneilor":"rândunel","randunele":["rândunele","rândunea","rândunele","rândunelă"],"randunelei":["rândunelei","rândunea","rândunelei","rândunelă"],"randunelele":["rândunelele","rândunea","rândunelele","rândunelă"],"randunelelor":["rândunelelor","rândunea","rândunelelor","rândunelă"],"randunelul":"rândunel","randunelule":"rândunel","randunelului":"rândunel","randunescul":"rândunesc","randunesti":"rândunesc","randunestii":"rândunesc","randunestile":"rândunesc","randunici":["rândunici","rândunic","rândunici","rândunică"],"randunici de mare":"rândunică de mare","randunici roscate":"rândunică roșcată","randunicii":["rândunicii","rândunic","rândunicii","rândunică"],"randunicile":"rândunică","randunicilor":["rândunicilor","rândunic","rândunicilor","rândunică"],"randunicoii":"rândunicoi","randunicoilor":"rândunicoi","randunicoiul":"rândunicoi","randunicoiule":"rândunicoi","randunicoiului":"rândunicoi","randunicul":"rândunic","randunicule":"rândunic","randunicului":"rândunic","randunioci":"rândunioc","randuniocii":"rândunioc","randuniocilor":"rândunioc","randuniocul":"rândunioc","randuniocule":"rândunioc","randuniocului":"rândunioc","randunite":"rânduniță","randunitei":"rânduniță","randunitele":"rânduniță","randunitelor":"rânduniță","randunoii":"rândunoi","randunoilor":"rândunoi","randunoiul":"rândunoi","randunoiule":"rândunoi","randunoiului":"rândunoi","randuri":"rând","randurile":"rând","randurilor":"rând","rane":"rână","ranea":["rânea","râni","rănea","răni"],"raneai":["râneai","râni","răneai","răni"],"raneam":["râneam","râni","răneam","răni"],"raneati":["râneați","râni","răneați","răni"],"raneau":["râneau","râni","răneau","răni"],"ranei":"rână","ranele":"rână","ranelor":"rână","ranesc":["rânesc","râni","rănesc","răni"],"raneste":["rânește","râni","rănește","răni"],"ranesti":["rânești","râni","rănești","răni"],"ranforsai":"ranforsa","ranforsaje":"ranforsaj","ranforsajele":"ranforsaj","ranforsajelor":"ranforsaj","ranforsajul":"ranforsaj","ranforsajule":"ranforsaj","ranforsajului":"ranforsaj","ranforsam":["ranforsăm","ranforsa","ranforsam","ranforsa"],"ranforsand":"ranforsa","ranforsara":"ranforsa","ranforsaram":"ranforsa","ranforsarati":"ranforsa","ranforsarea":"ranforsare","ranforsari":"ranforsare","ranforsarii":"ranforsare","ranforsarile":"ranforsare","ranforsarilor":"ranforsare","ranforsase":"ranforsa","ranforsasem":"ranforsa","ranforsasera":"ranforsa","ranforsaseram":"ranforsa","ranforsaserati":"ranforsa","ranforsasesi":"ranforsa","ranforsasi":"ranforsa","ranforsat":"ranforsa","ranforsata":["ranforsată","ranforsat","ranforsata","ranforsat"],"ranforsate":"ranforsat","ranforsatele":"ranforsat","ranforsati":["ranforsați","ranforsa","ranforsați","ranforsat"],"ranforsatii":"ranforsat","ranforsatul":"ranforsat","ranforsau":"ranforsa","ranforseaza":"ranforsa","ranforsez":"ranforsa","ranforsezi":"ranforsa","ranfortul":"ranfort","ranfortule":"ranfort","ranfortului":"ranfort","ranforturi":"ranfort","ranforturile":"ranfort","ranforturilor":"ranfort","rangatul":"rangăt","rangatule":"rangăt","rangatului":"rangăt","rangeri":"ranger","rangerii":"ranger","rangerilor":"ranger","rangerul":"ranger","rangerule":"ranger","rangerului":"ranger","rangi":["răngi","rangă","rangi","rangă"],"rangii":"rangă","rangile":"rangă","rangilor":"rangă","rangul":"rang","rangule":"rang","rangului":"rang","rani":"rană","raniculturi":"ranicultură","raniculturii":"ranicultură","raniculturile":"ranicultură","raniculturilor":"ranicultură","ranii":["rănii","rană","rânii","râni","rănii","răni"],"ranile":"rană","ranilor":"rană","ranim":["rânim","râni","rănim","răni"],"ranind":["rânind","râni","rănind","răni"],"ranira":["râniră","râni","răniră","răni"],"raniram":["rânirăm","râni","rănirăm","răni"],"ranirati":["rânirăți","râni","rănirăți","răni"],"ranirea":"rănire","raniri":"rănire","ranirii":"rănire","ranirile":"rănire","ranirilor":"rănire","ranise":["rânise","râni","rănise","răni"],"ranisem":["rânisem","râni","rănisem","răni"],"ranisera":["râniseră","râni","răniseră","răni"],"raniseram":["râniserăm","râni","răniserăm","răni"],"raniserati":["râniserăți","râni","răniserăți","răni"],"ranisesi":["râniseși","râni","răniseși","răni"],"ranisi":["râniși","râni","răniși","răni"],"ranisoare":"rănișoară","ranisoarei":"rănișoară","ranisoarele":"rănișoară","ranisoarelor":"rănișoară","ranit":["rânit","râni","rănit","răni"],"ranita":["rânită","rânit","rânita","rânit","rănită","rănit","rănita","rănit"],"ranite":["rânite","rânit","rănite","rănit","ranițe","raniță"],"ranitei":"raniță","ranitele":["rânitele","rânit","rănitele","rănit","ranițele","raniță"],"ranitelor":"raniță","raniti":["râniți","râni","răniți","răni","râniți","rânit","răniți","rănit"],"ranitii":["râniții","rânit","răniții","rănit"],"ranitul":["rânitul","rânit","rănitul","rănit"],"ranjea":"rânji","ranjeai":"rânji","ranjeam":"rânji","ranjeati":"rânji","ranjeau":"rânji","ranjeli":"rânjeală","ranjelii":"rânjeală","ranjelile":"rânjeală","ranjelilor":"rânjeală","ranjesc":"rânji","ranjeste":"rânji","ranjesti":"rânji","ranjete":"rânjet","ranjetele":"rânjet","ranjetelor":"rânjet","ranjetul":"rânjet","ranjetule":"rânjet","ranjetului":"rânjet","ranjii":"rânji","ranjim":"rânji","ranjind":"rânji","ranjira":"rânji","ranjiram":"rânji","ranjirati":"rânji","ranjirea":"rânjire","ranjiri":"rânjire","ranjirii":"rânjire","ranjirile":"rânjire","ranjirilor":"rânjire","ranjise":"rânji","ranjisem":"rânji","ranjisera":"rânji","ranjiseram":"rânji","ranjiserati":"rânji","ranjisesi":"rânji","ranjisi":"rânji","ranjit":"rânji","ranjita":["rânjită","rânjit","rânjita","rânjit"],"ranjite":"rânjit","ranjitele":"rânjit","ranjiti":["rânjiți","rânji","rânjiți","rânjit"],"ranjitii":"rânjit","ranjitoare":"rânjitor","ranjitoarea":"rânjitor","ranjitoarele":"rânjitor","ranjitori":"rânjitor","ranjitorii":"rânjitor","ranjitorul":"rânjitor","ranjitul":"rânjit","ranjiture":"rânjitură","ranjiturei":"rânjitură","ranjiturele":"rânjitură","ranjiturelor":"rânjitură","ranjituri":"rânjitură","rantasul":"rântaș","rantasule":"rântaș","rantasului":"rântaș","rantasuri":"rântaș","rantasurile":"rântaș","rantasurilor":"rântaș","rantul":"ranț","rantule":"ranț","rantului":"ranț","ranturi":"ranț","ranturile":"ranț","ranturilor":"ranț","ranunchi":"rărunchi","ranunculaceea":"ranunculacee","ranunculaceei":"ranunculacee","ranunculaceele":"ranunculacee","ranunculaceelor":"ranunculacee","ranversai":"ranversa","ranversam":["ranversăm","ranversa","ranversam","ranversa"],"ranversand":"ranversa","ranversara":"ranversa","ranversaram":"ranversa","ranversarati":"ranversa","ranversarea":"ranversare","ranversari":"ranversare","ranversarii":"ranversare","ranversarile":"ranversare","ranversarilor":"ranversare","ranversase":"ranversa","ranversasem":"ranversa","ranversasera":"ranversa","ranversaseram":"ranversa","ranversaserati":"ranversa","ranversasesi":"ranversa","ranversasi":"ranversa","ranversat":"ranversa","ranversati":"ranversa","ranversau":"ranversa","ranverseaza":"ranversa","ranversez":"ranversa","ranversezi":"ranversa","ranze":"rânză","ranzei":"rânză","ranzele":"rânză","ranzelor":"rânză","ranzisoare":"rănzișoară","ranzisoarei":"rănzișoară","ranzisoarele":"rănzișoară","ranzisoarelor":"rănzișoară","ranzoasa":["rânzoasă","rânzos","rânzoasa","rânzos"],"ranzoase":"rânzos","ranzoasele":"rânzos","ranzosi":"rânzos","ranzosii":"rânzos","ranzosul":"rânzos","raotatea":"răotate","raotati":"răotate","raotatii":"răotate","raotatile":"răotate","raotatilor":"răotate","rapacea":"rapace","rapacele":"rapace","rapaci":"rapace","rapacii":"rapace","rapacioagele":"răpăcioage","rapacioagelor":"răpăcioage","rapacitatea":"rapacitate","rapacitati":"rapacitate","rapacitatii":"rapacitate","rapaia":"răpăi","rapaiai":"răpăi","rapaiam":"răpăi","rapaiati":"răpăi","rapaiau":"răpăi","rapaie":"răpăi","rapaiele":"răpăială","rapaielei":"răpăială","rapaielele":"răpăială","rapaielelor":"răpăială","rapaieli":"răpăială","rapaii":"răpăi","rapaim":"răpăi","rapaind":"răpăi","rapaira":"răpăi","rapairam":"răpăi","rapairati":"răpăi","rapaise":"răpăi","rapaisem":"răpăi","rapaisera":"răpăi","rapaiseram":"răpăi","rapaiserati":"răpăi","rapaisesi":"răpăi","rapaisi":"răpăi","rapait":"răpăi","rapaiti":"răpăi","rapaitoare":"răpăitor","rapaitoarea":"răpăitor","rapaitoarele":"răpăitor","rapaitori":"răpăitor","rapaitorii":"răpăitor","rapaitorul":"răpăitor","rapaituri":"răpăitură","rapaiturii":"răpăitură","rapaiturile":"răpăitură","rapaiturilor":"răpăitură","rapakiwiul":"rapakiwi","rapakiwiule":"rapakiwi","rapakiwiului":"rapakiwi","rapaluirea":"răpăluire","rapaluiri":"răpăluire","rapaluirii":"răpăluire","rapaluirile":"răpăluire","rapaluirilor":"răpăluire","rapandule":"rapandulă","rapandulei":"rapandulă","rapandulele":"rapandulă","rapandulelor":"rapandulă","rapane":"rapăn","rapanele":"rapăn","rapanelor":"rapăn","rapanoasa":["răpănoasă","răpănos","răpănoasa","răpănos"],"rapanoase":"răpănos","rapanoasele":"răpănos","rapanosi":"răpănos","rapanosii":"răpănos","rapanosul":"răpănos","rapanul":"rapăn","rapanule":"rapăn","rapanului":"rapăn","rapaosata":["răpăosată","răpăosat","răpăosata","răpăosat"],"rapaosate":"răpăosat","rapaosatele":"răpăosat","rapaosati":"răpăosat","rapaosatii":"răpăosat","rapaosatul":"răpăosat","rapaosul":"răpaos","rapaosule":"răpaos","rapaosului":"răpaos","rapaosuri":"răpaos","rapaosurile":"răpaos","rapaosurilor":"răpaos","raparetia":"răpăreție","raparetiei":"răpăreție","raparetii":"răpăreție","rapaus":"repaus","rapausa":"răposa","rapausul":"răpaus","rapausule":"răpaus","rapausului":"răpaus","rapausuri":"răpaus","rapausurile":"răpaus","rapausurilor":"răpaus","rapciuge":"răpciugă","rapciugei":"răpciugă","rapciugoasa":["răpciugoasă","răpciugos","răpciugoasa","răpciugos"],"rapciugoase":"răpciugos","rapciugoasele":"răpciugos","rapciugosi":"răpciugos","rapciugosii":"răpciugos","rapciugosul":"răpciugos","rape":"râpă","rapea":"răpi","rapeai":"răpi","rapeam":"răpi","rapeati":"răpi","rapeau":"răpi","rapede":"repede","rapeg":"răpega","rapegai":"răpega","rapegam":["răpegăm","răpega","răpegam","răpega"],"rapegand":"răpega","rapegara":"răpega","rapegaram":"răpega","rapegarati":"răpega","rapegase":"răpega","rapegasem":"răpega","rapegasera":"răpega","rapegaseram":"răpega","rapegaserati":"răpega","rapegasesi":"răpega","rapegasi":"răpega","rapegat":"răpega","rapegati":"răpega","rapegau":"răpega","rapegi":"răpega","rapei":"râpă","rapele":"râpă","rapelor":"râpă","rapelul":"rapel","rapelule":"rapel","rapelului":"rapel","rapeluri":"rapel","rapelurile":"rapel","rapelurilor":"rapel","rapesc":"răpi","rapeste":"răpi","rapesti":"răpi","rapezia":"răpezie","rapeziei":"răpezie","rapezii":"răpezie","rapicioasa":["răpicioasă","răpicios","răpicioasa","răpicios"],"rapicioase":"răpicios","rapicioasele":"răpicios","rapiciosi":"răpicios","rapiciosii":"răpicios","rapiciosul":"răpicios","rapiciunea":"răpiciune","rapiciuni":"răpiciune","rapiciunii":"răpiciune","rapiciunile":"răpiciune","rapiciunilor":"răpiciune","rapida":["rapidă","rapid","rapida","rapid"],"rapide":"rapid","rapidea":"răpide","rapidele":["rapidele","rapid","răpidele","răpide"],"rapidisti":"rapidist","rapidistii":"rapidist","rapidistilor":"rapidist","rapidistul":"rapidist","rapidistule":"rapidist","rapidistului":"rapidist","rapiditatea":"rapiditate","rapiditati":"rapiditate","rapiditatii":"rapiditate","rapidul":"rapid","rapiere":"rapieră","rapierei":"rapieră","rapierele":"rapieră","rapierelor":"rapieră","rapii":"răpi","rapim":"răpi","rapind":"răpi","rapira":"răpi","rapiram":"răpi","rapirati":"răpi","rapirea":"răpire","rapiri":"răpire","rapirii":"răpire","rapirile":"răpire","rapirilor":"răpire","rapise":"răpi","rapisem":"răpi","rapisera":"răpi","rapiseram":"răpi","rapiserati":"răpi","rapisesi":"răpi","rapisi":"răpi","rapit":"răpi","rapita":["răpită","răpit","răpita","răpit"],"rapite":["răpite","răpit","rapițe","rapiță"],"rapitei":"rapiță","rapitele":"răpit","rapiti":["răpiți","răpi","răpiți","răpit"],"rapitii":"răpit","rapitistea":"răpițiște","rapitisti":"răpițiște","rapitistii":"răpițiște","rapitoare":"răpitor","rapitoarea":"răpitor","rapitoarele":"răpitor","rapitori":"răpitor","rapitoria":"răpitoriu","rapitorie":"răpitoriu","rapitorii":["răpitorii","răpitor","răpitorii","răpitoriu"],"rapitoriii":"răpitoriu","rapitoriile":"răpitoriu","rapitoriul":"răpitoriu","rapitorul":"răpitor","rapitul":"răpit","rapiture":"răpitură","rapiturei":"răpitură","rapiturele":"răpitură","rapiturelor":"răpitură","rapituri":"răpitură","rapizi":["rapizi","rapid","răpizi","răpide"],"rapizii":["rapizii","rapid","răpizii","răpide"],"rapoasa":["râpoasă","râpos","râpoasa","râpos"],"rapoase":"râpos","rapoasele":"râpos","raportai":"raporta","raportam":["raportăm","raporta","raportam","raporta"],"raportand":"raporta","raportara":"raporta","raportaram":"raporta","raportarati":"raporta","raportarea":"raportare","raportari":"raportare","raportarii":"raportare","raportarile":"raportare","raportarilor":"raportare","raportase":"raporta","raportasem":"raporta","raportasera":"raporta","raportaseram":"raporta","raportaserati":"raporta","raportasesi":"raporta","raportasi":"raporta","raportat":"raporta","raportata":["raportată","raportat","raportata","raportat"],"raportate":"raportat","raportatele":"raportat","raportati":["raportați","raporta","raportați","raportat"],"raportatii":"raportat","raportatori":"raportator","raportatorii":"raportator","raportatorilor":"raportator","raportatorul":"raportator","raportatorule":"raportator","raportatorului":"raportator","raportatul":"raportat","raportau":"raporta","raporteaza":"raporta","raportez":"raporta","raportezi":"raporta","raportoare":"raportor","raportoarea":"raportoare","raportoarei":"raportoare","raportoarele":["raportoarele","raportoare","raportoarele","raportor"],"raportoarelor":["raportoarelor","raportoare","raportoarelor","raportor"],"raportori":"raportor","raportorii":"raportor","raportorilor":"raportor","raportorul":"raportor","raportorule":"raportor","raportorului":"raportor","raportuia":"raportui","raportuiai":"raportui","raportuiam":"raportui","raportuiati":"raportui","raportuiau":"raportui","raportuie":"raportui","raportuii":"raportui","raportuim":"raportui","raportuind":"raportui","raportuira":"raportui","raportuiram":"raportui","raportuirati":"raportui","raportuise":"raportui","raportuisem":"raportui","raportuisera":"raportui","raportuiseram":"raportui","raportuiserati":"raportui","raportuisesi":"raportui","raportuisi":"raportui","raportuit":"raportui","raportuiti":"raportui","raportul":"raport","raportule":"raport","raportului":"raport","raporturi":"raport","raporturi curs-profit":"raport curs-profit","raporturile":"raport","raporturilor":"raport","raposai":"răposa","raposam":["răposăm","răposa","răposam","răposa"],"raposand":"răposa","raposara":"răposa","raposaram":"răposa","raposarati":"răposa","raposarea":"răposare","raposari":"răposare","raposarii":"răposare","raposase":"răposa","raposasem":"răposa","raposasera":"răposa","raposaseram":"răposa","raposaserati":"răposa","raposasesi":"răposa","raposasi":"răposa","raposat":"răposa","raposata":["răposată","răposat","răposata","răposat"],"raposate":"răposat","raposatele":"răposat","raposati":["răposați","răposa","răposați","răposat"],"raposatii":"răposat","raposatul":"răposat","raposau":"răposa","raposeaza":"răposa","raposez":"răposa","raposezi":"răposa","raposi":"râpos","raposii":"râpos","raposul":"râpos","rapperi":"rapper","rapperii":"rapper","rapperilor":"rapper","rapperul":"rapper","rapperule":"rapper","rapperului":"rapper","rapsoare":"râpșoară","rapsoarei":"râpșoară","rapsoarele":"râpșoară","rapsoarelor":"râpșoară","rapsodia":"rapsodie","rapsodica":["rapsodică","rapsodic","rapsodica","rapsodic"],"rapsodice":"rapsodic","rapsodicele":"rapsodic","rapsodici":"rapsodic","rapsodicii":"rapsodic","rapsodicul":"rapsodic","rapsodiei":"rapsodie","rapsodierea":"rapsodiere","rapsodieri":"rapsodiere","rapsodierii":"rapsodiere","rapsodierile":"rapsodiere","rapsodierilor":"rapsodiere","rapsodii":"rapsodie","rapsodiile":"rapsodie","rapsodiilor":"rapsodie","rapsodul":"rapsod","rapsodule":"rapsod","rapsodului":"rapsod","rapsozi":"rapsod","rapsozii":"rapsod","rapsozilor":"rapsod","rapstea":"răpști","rapsteai":"răpști","rapsteam":"răpști","rapsteati":"răpști","rapsteau":"răpști","rapstesc":"răpști","rapsteste":"răpști","rapstesti":"răpști","rapstii":"răpști","rapstim":"răpști","rapstind":"răpști","rapstira":"răpști","rapstiram":"răpști","rapstirati":"răpști","rapstise":"răpști","rapstisem":"răpști","rapstisera":"răpști","rapstiseram":"răpști","rapstiserati":"răpști","rapstisesi":"răpști","rapstisi":"răpști","rapstit":"răpști","rapstiti":"răpști","raptul":"rapt","raptule":"rapt","raptului":"rapt","rapturi":"rapt","rapturile":"rapt","rapturilor":"rapt","raptusul":"raptus","raptusule":"raptus","raptusului":"raptus","rapui":"răpune","rapuitoarea":"răpuitoare","rapuitoarei":"răpuitoare","rapuitoarele":"răpuitoare","rapuitoarelor":"răpuitoare","rapuitori":"răpuitor","rapuitorii":"răpuitor","rapuitorilor":"răpuitor","rapuitorul":"răpuitor","rapuitorule":"răpuitor","rapuitorului":"răpuitor","rapul":"rap","rapule":"rap","rapului":"rap","rapun":"răpune","rapuna":"răpune","rapunand":"răpune","rapunea":"răpune","rapuneai":"răpune","rapuneam":"răpune","rapuneati":"răpune","rapuneau":"răpune","rapunem":"răpune","rapunerea":"răpunere","rapuneri":"răpunere","rapunerii":"răpunere","rapuneti":"răpune","rapus":"răpune","rapusa":["răpusă","răpus","răpusa","răpus"],"rapuse":["răpuse","răpune","răpuse","răpus"],"rapusei":"răpune","rapusele":"răpus","rapusera":"răpune","rapuseram":"răpune","rapuserati":"răpune","rapusese":"răpune","rapusesem":"răpune","rapusesera":"răpune","rapuseseram":"răpune","rapuseserati":"răpune","rapusesesi":"răpune","rapusesi":"răpune","rapusi":"răpus","rapusii":"răpus","rapusul":"răpus","rara":["rară","rar","rara","rar"],"rare":"rar","rarea":"rări","rareai":"rări","raream":"rări","rareati":"rări","rareau":"rări","rarefactia":"rarefacție","rarefactiei":"rarefacție","rarefactii":"rarefacție","rarefactiile":"rarefacție","rarefactiilor":"rarefacție","rarefiai":"rarefia","rarefiam":"rarefia","rarefianta":["rarefiantă","rarefiant","rarefianta","rarefiant"],"rarefiante":"rarefiant","rarefiantele":"rarefiant","rarefianti":"rarefiant","rarefiantii":"rarefiant","rarefiantul":"rarefiant","rarefiara":"rarefia","rarefiaram":"rarefia","rarefiarati":"rarefia","rarefiase":"rarefia","rarefiasem":"rarefia","rarefiasera":"rarefia","rarefiaseram":"rarefia","rarefiaserati":"rarefia","rarefiasesi":"rarefia","rarefiasi":"rarefia","rarefiat":"rarefia","rarefiata":["rarefiată","rarefiat","rarefiata","rarefiat"],"rarefiate":"rarefiat","rarefiatele":"rarefiat","rarefiati":["rarefiați","rarefia","rarefiați","rarefiat"],"rarefiatii":"rarefiat","rarefiatul":"rarefiat","rarefiau":"rarefia","rarefiaza":"rarefia","rarefie":"rarefia","rarefieaza":"rarefia","rarefiem":"rarefia","rarefierea":"rarefiere","rarefieri":"rarefiere","rarefierii":"rarefiere","rarefierile":"rarefiere","rarefierilor":"rarefiere","rarefiez":"rarefia","rarefiezi":"rarefia","rarefiind":"rarefia","rarele":"rar","raresc":"rări","rarescenta":["rarescentă","rarescent","rarescenta","rarescent"],"rarescente":"rarescent","rarescentele":"rarescent","rarescenti":"rarescent","rarescentii":"rarescent","rarescentul":"rarescent","rareste":"rări","raresti":"rări","rari":"rar","raria":"răriu","raricela":["răricelă","răricel","răricela","răricel"],"raricele":"răricel","raricelele":"răricel","rariceli":"răricel","raricelii":"răricel","raricelul":"răricel","rarie":"răriu","rarific":"rarifica","rarificai":"rarifica","rarificam":["rarificăm","rarifica","rarificam","rarifica"],"rarificand":"rarifica","rarificara":"rarifica","rarificaram":"rarifica","rarificarati":"rarifica","rarificarea":"rarificare","rarificari":"rarificare","rarificarii":"rarificare","rarificarile":"rarificare","rarificarilor":"rarificare","rarificase":"rarifica","rarificasem":"rarifica","rarificasera":"rarifica","rarificaseram":"rarifica","rarificaserati":"rarifica","rarificasesi":"rarifica","rarificasi":"rarifica","rarificat":"rarifica","rarificata":["rarificată","rarificat","rarificata","rarificat"],"rarificate":"rarificat","rarificatele":"rarificat","rarificati":["rarificați","rarifica","rarificați","rarificat"],"rarificatii":"rarificat","rarificatul":"rarificat","rarificau":"rarifica","rarifici":"rarifica","rarii":["rarii","rar","rării","rări","rării","răriu"],"rariii":"răriu","rariile":"răriu","rarim":"rări","rarimea":"rărime","rarimi":"rărime","rarimii":"rărime","rarind":"rări","rarira":"rări","rariram":"rări","rarirati":"rări","rarirea":"rărire","rariri":"rărire","raririi":"rărire","raririle":"rărire","raririlor":"rărire","rarise":"rări","rarisem":"rări","rarisera":"rări","rariseram":"rări","rariserati":"rări","rarisesi":"rări","rarisi":"rări","rarisima":["rarisimă","rarisim","rarisima","rarisim"],"rarisime":"rarisim","rarisimele":"rarisim","rarisimi":"rarisim","rarisimii":"rarisim","rarisimul":"rarisim","rarisora":["rărișoră","rărișor","rărișora","rărișor"],"rarisore":"rărișor","rarisorele":"rărișor","rarisori":"rărișor","rarisorii":"rărișor","rarisorul":"rărișor","raristea":"rariște","raristi":"rariște","raristii":"rariște","raristile":"rariște","raristilor":"rariște","raristisul":"răriștiș","raristisule":"răriștiș","raristisului":"răriștiș","rarisul":"răriș","rarisule":"răriș","rarisului":"răriș","rarisuri":"răriș","rarisurile":"răriș","rarisurilor":"răriș","rarit":"rări","rarita":["rărită","rărit","rărita","rărit"],"raritarea":"rărițare","raritari":"rărițare","raritarii":"rărițare","raritarile":"rărițare","raritarilor":"rărițare","raritatea":"raritate","raritati":"raritate","raritatii":"raritate","raritatile":"raritate","raritatilor":"raritate","rarite":["rărite","rărit","rarițe","rariță"],"raritei":"rariță","raritele":["răritele","rărit","rarițele","rariță"],"raritelor":"rariță","rariti":["răriți","rări","răriți","rărit"],"raritii":"rărit","raritul":"rărit","rariture":"răritură","rariturei":"răritură","rariturele":"răritură","rariturelor":"răritură","rarituri":"răritură","rariul":"răriu","raruia":"rărui","raruie":"rărui","raruiele":"rărui","raruii":"rărui","raruiul":"rărui","rarul":"rar","rarunchii":"rărunchi","rarunchilor":"rărunchi","rarunchiul":"rărunchi","rarunchiule":"rărunchi","rarunchiului":"rărunchi","rarunchiuti":"rărunchiuț","rarunchiutii":"rărunchiuț","rarunchiutilor":"rărunchiuț","rarunchiutul":"rărunchiuț","rarunchiutule":"rărunchiuț","rarunchiutului":"rărunchiuț","raruta":["răruță","răruț","răruța","răruț"],"rarute":"răruț","rarutele":"răruț","raruti":"răruț","rarutii":"răruț","rarutul":"răruț","ras":["ras","rade","râs","râde"],"ras in barba":"râde în barbă","ras pe sub mustata":"râde pe sub mustață","rasa":["rasă","ras","rasa","ras"],"rasadea":"răsădi","rasadeai":"răsădi","rasadeam":"răsădi","rasadeati":"răsădi","rasadeau":"răsădi","rasadele":"răsădeală","rasadelei":"răsădeală","rasadelele":"răsădeală","rasadelelor":"răsădeală","rasadeli":"răsădeală","rasadesc":"răsădi","rasadeste":"răsădi","rasadesti":"răsădi","rasadii":"răsădi","rasadim":"răsădi","rasadind":"răsădi","rasadira":"răsădi","rasadiram":"răsădi","rasadirati":"răsădi","rasadirea":"răsădire","rasadiri":"răsădire","rasadirii":"răsădire","rasadirile":"răsădire","rasadirilor":"răsădire","rasadise":"răsădi","rasadisem":"răsădi","rasadisera":"răsădi","rasadiseram":"răsădi","rasadiserati":"răsădi","rasadisesi":"răsădi","rasadisi":"răsădi","rasadit":"răsădi","rasaditi":"răsădi","rasadnite":"răsadniță","rasadnitei":"răsadniță","rasadnitele":"răsadniță","rasadnitelor":"răsadniță","rasadul":"răsad","rasadule":"răsad","rasadului":"răsad","rasaduri":"răsad","rasadurile":"răsad","rasadurilor":"răsad","rasajduia":"răsăjdui","rasajduiai":"răsăjdui","rasajduiam":"răsăjdui","rasajduiati":"răsăjdui","rasajduiau":"răsăjdui","rasajduiesc":"răsăjdui","rasajduieste":"răsăjdui","rasajduiesti":"răsăjdui","rasajduii":"răsăjdui","rasajduim":"răsăjdui","rasajduind":"răsăjdui","rasajduira":"răsăjdui","rasajduiram":"răsăjdui","rasajduirati":"răsăjdui","rasajduise":"răsăjdui","rasajduisem":"răsăjdui","rasajduisera":"răsăjdui","rasajduiseram":"răsăjdui","rasajduiserati":"răsăjdui","rasajduisesi":"răsăjdui","rasajduisi":"răsăjdui","rasajduit":"răsăjdui","rasajduiti":"răsăjdui","rasapiciunea":"răsâpiciune","rasapiciuni":"răsâpiciune","rasapiciunii":"răsâpiciune","rasar":"răsări","rasara":"răsări","rasare":"răsări","rasarea":"răsări","rasareai":"răsări","rasaream":"răsări","rasareati":"răsări","rasareau":"răsări","rasarii":"răsări","rasarim":"răsări","rasarind":"răsări","rasarira":"răsări","rasariram":"răsări","rasarirati":"răsări","rasarirea":"răsărire","rasariri":"răsărire","rasaririi":"răsărire","rasaririle":"răsărire","rasaririlor":"răsărire","rasarise":"răsări","rasarisem":"răsări","rasarisera":"răsări","rasariseram":"răsări","rasariserati":"răsări","rasarisesi":"răsări","rasarisi":"răsări","rasarit":"răsări","rasarite":"răsărită","rasariteana":["răsăriteană","răsăritean","răsăriteana","răsăritean"],"rasariteanul":"răsăritean","rasariteanule":"răsăritean","rasariteanului":"răsăritean","rasaritei":"răsărită","rasaritele":"răsărită","rasaritelor":"răsărită","rasaritence":"răsăriteancă","rasaritencei":"răsăriteancă","rasaritencele":"răsăriteancă","rasaritencelor":"răsăriteancă","rasaritene":"răsăritean","rasariteneasca":["răsăritenească","răsăritenesc","răsăriteneasca","răsăritenesc"],"rasaritenele":"răsăritean","rasaritenescul":"răsăritenesc","rasaritenesti":"răsăritenesc","rasaritenestii":"răsăritenesc","rasaritenestile":"răsăritenesc","rasariteni":"răsăritean","rasaritenii":"răsăritean","rasaritenilor":"răsăritean","rasariti":"răsări","rasaritul":"răsărit","rasaritule":"răsărit","rasaritului":"răsărit","rasarituri":"răsărit","rasariturile":"răsărit","rasariturilor":"răsărit","rasata":["rasată","rasat","rasata","rasat"],"rasate":"rasat","rasatele":"rasat","rasati":"rasat","rasatii":"rasat","rasatul":"rasat","rasatura":"răzătură","rasaturi":"răsătură","rasaturii":"răsătură","rasaturile":"răsătură","rasaturilor":"răsătură","rascacar":"răscăcăra","rascacarai":"răscăcăra","rascacaram":["răscăcărăm","răscăcăra","răscăcăram","răscăcăra"],"rascacarand":"răscăcăra","rascacarara":"răscăcăra","rascacararam":"răscăcăra","rascacararati":"răscăcăra","rascacarase":"răscăcăra","rascacarasem":"răscăcăra","rascacarasera":"răscăcăra","rascacaraseram":"răscăcăra","rascacaraserati":"răscăcăra","rascacarasesi":"răscăcăra","rascacarasi":"răscăcăra","rascacarat":"răscăcăra","rascacarata":["răscăcărată","răscăcărat","răscăcărata","răscăcărat"],"rascacarate":"răscăcărat","rascacaratele":"răscăcărat","rascacarati":["răscăcărați","răscăcăra","răscăcărați","răscăcărat"],"rascacaratii":"răscăcărat","rascacaratul":"răscăcărat","rascacarau":"răscăcăra","rascacari":"răscăcăra","rascasi":"râșcaș","rascasii":"râșcaș","rascasilor":"râșcaș","rascasul":"râșcaș","rascasule":"râșcaș","rascasului":"râșcaș","raschea":"răschi","rascheai":"răschi","rascheam":"răschi","rascheati":"răschi","rascheau":"răschi","rascheiea":"răscheie","rascheiei":"răscheie","rascheieii":"răscheie","rascheieile":"răscheie","rascheieilor":"răscheie","raschesc":"răschi","rascheste":"răschi","raschesti":"răschi","raschetai":"rașcheta","raschetam":["rașchetăm","rașcheta","rașchetam","rașcheta"],"raschetand":"rașcheta","raschetara":"rașcheta","raschetaram":"rașcheta","raschetarati":"rașcheta","raschetarea":"rașchetare","raschetari":"rașchetare","raschetarii":"rașchetare","raschetarile":"rașchetare","raschetarilor":"rașchetare","raschetase":"rașcheta","raschetasem":"rașcheta","raschetasera":"rașcheta","raschetaseram":"rașcheta","raschetaserati":"rașcheta","raschetasesi":"rașcheta","raschetasi":"rașcheta","raschetat":"rașcheta","raschetata":["rașchetată","rașchetat","rașchetata","rașchetat"],"raschetate":"rașchetat","raschetatele":"rașchetat","raschetati":["rașchetați","rașcheta","rașchetați","rașchetat"],"raschetatii":"rașchetat","raschetatoarea":"rașchetatoare","raschetatoarei":"rașchetatoare","raschetatoarele":"rașchetatoare","raschetatoarelor":"rașchetatoare","raschetatori":"rașchetator","raschetatorii":"rașchetator","raschetatorilor":"rașchetator","raschetatorul":"rașchetator","raschetatorule":"rașchetator","raschetatorului":"rașchetator","raschetatul":"rașchetat","raschetau":"rașcheta","raschete":"rașchetă","rascheteaza":"rașcheta","raschetei":"rașchetă","raschetele":"rașchetă","raschetelor":"rașchetă","raschetez":"rașcheta","raschetezi":"rașcheta","raschiai":"rășchia","raschiam":"rășchia","raschiara":"rășchia","raschiaram":"rășchia","raschiarati":"rășchia","raschiase":"rășchia","raschiasem":"rășchia","raschiasera":"rășchia","raschiaseram":"rășchia","raschiaserati":"rășchia","raschiasesi":"rășchia","raschiasi":"rășchia","raschiat":"rășchia","raschiata":["răschiată","răschiat","răschiata","răschiat"],"raschiate":"răschiat","raschiatele":"răschiat","raschiati":["rășchiați","rășchia","răschiați","răschiat"],"raschiatii":"răschiat","raschiatul":"răschiat","raschiau":"rășchia","raschiaza":"rășchia","raschide":"răschidă","raschidei":"răschidă","raschidele":"răschidă","raschidelor":"răschidă","raschie":"rășchia","raschiem":"rășchia","raschiez":"rășchia","raschiezi":"rășchia","raschii":"răschi","raschiind":"rășchia","raschim":"răschi","raschind":"răschi","raschira":"răschi","raschirai":"răschira","raschiram":["răschirăm","răschi","răschirăm","răschira","răschiram","răschira"],"raschirand":"răschira","raschirara":"răschira","raschiraram":"răschira","raschirarati":"răschira","raschirarea":"rășchirare","raschirari":"rășchirare","raschirarii":"rășchirare","raschirarile":"rășchirare","raschirarilor":"rășchirare","raschirase":"răschira","raschirasem":"răschira","raschirasera":"răschira"};
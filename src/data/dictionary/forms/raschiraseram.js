@@ -0,0 +1 @@
+export default {"raschiraseram":"răschira","raschiraserati":"răschira","raschirasesi":"răschira","raschirasi":"răschira","raschirat":"răschira","raschirata":["răschirată","răschirat","răschirata","răschirat"],"raschirate":"răschirat","raschiratele":"răschirat","raschirati":["răschirăți","răschi","răschirați","răschira","răschirați","răschirat"],"raschiratii":"răschirat","raschiratul":"răschirat","raschirau":"răschira","raschireaza":"răschira","raschirez":"răschira","raschirezi":"răschira","raschise":"răschi","raschisem":"răschi","raschisera":"răschi","raschiseram":"răschi","raschiserati":"răschi","raschisesi":"răschi","raschisi":"răschi","raschit":"răschi","raschiti":"răschi","raschitoare":["râșchitoare","râșchitor","răschitoare","răschitor","rășchitoare","rășchitor"],"raschitoarele":["râșchitoarele","râșchitor","răschitoarele","răschitor"],"raschitoarelor":["râșchitoarelor","râșchitor","răschitoarelor","răschitor"],"raschitorase":"rășchitoraș","raschitorasele":"rășchitoraș","raschitoraselor":"rășchitoraș","raschitorasul":"rășchitoraș","raschitorasule":"rășchitoraș","raschitorasului":"rășchitoraș","raschitorul":["râșchitorul","râșchitor","răschitorul","răschitor"],"raschitorule":["râșchitorule","râșchitor","răschitorule","răschitor"],"raschitorului":["râșchitorului","râșchitor","răschitorului","răschitor"],"rascitea":"răsciti","rasciteai":"răsciti","rasciteam":"răsciti","rasciteati":"răsciti","rasciteau":"răsciti","rascitesc":"răsciti","rasciteste":"răsciti","rascitesti":"răsciti","rascitii":"răsciti","rascitim":"răsciti","rascitind":"răsciti","rascitira":"răsciti","rascitiram":"răsciti","rascitirati":"răsciti","rascitise":"răsciti","rascitisem":"răsciti","rascitisera":"răsciti","rascitiseram":"răsciti","rascitiserati":"răsciti","rascitisesi":"răsciti","rascitisi":"răsciti","rascitit":"răsciti","rascititi":"răsciti","rascoaca":"răscoace","rascoacem":"răscoace","rascoacerea":"răscoacere","rascoaceri":"răscoacere","rascoacerii":"răscoacere","rascoacerile":"răscoacere","rascoacerilor":"răscoacere","rascoaceti":"răscoace","rascoagea":"răscoage","rascoala":"răscula","rascoale":["răscoale","răscoală","răscoale","răscula"],"rascoalei":"răscoală","rascoalele":"răscoală","rascoalelor":"răscoală","rascoapse":"răscoace","rascoapsera":"răscoace","rascoapseram":"răscoace","rascoapserati":"răscoace","rascoc":"răscoace","rascocand":"răscoace","rascocea":"răscoace","rascoceai":"răscoace","rascoceam":"răscoace","rascoceati":"răscoace","rascoceau":"răscoace","rascoci":"răscoace","rascogeaua":"răscogea","rascogele":"răscogea","rascogelei":"răscogea","rascogi":"răscoage","rascogii":"răscoage","rascoiul":"răscoi","rascoiule":"răscoi","rascoiului":"răscoi","rascol":"răscula","rascolea":"răscoli","rascoleai":"răscoli","rascoleam":"răscoli","rascoleati":"răscoli","rascoleau":"răscoli","rascolele":"răscoleală","rascolelei":"răscoleală","rascolelele":"răscoleală","rascolelelor":"răscoleală","rascoleli":"răscoleală","rascolesc":"răscoli","rascoleste":"răscoli","rascolesti":"răscoli","rascoli":"răscula","rascolii":"răscoli","rascolim":"răscoli","rascolind":"răscoli","rascolira":"răscoli","rascoliram":"răscoli","rascolirati":"răscoli","rascolirea":"răscolire","rascoliri":"răscolire","rascolirii":"răscolire","rascolirile":"răscolire","rascolirilor":"răscolire","rascolise":"răscoli","rascolisem":"răscoli","rascolisera":"răscoli","rascoliseram":"răscoli","rascoliserati":"răscoli","rascolisesi":"răscoli","rascolisi":"răscoli","rascolit":"răscoli","rascoliti":"răscoli","rascolitoare":"răscolitor","rascolitoarea":"răscolitor","rascolitoarele":"răscolitor","rascolitori":"răscolitor","rascolitorii":"răscolitor","rascolitorul":"răscolitor","rascolitul":"răscolit","rascolitule":"răscolit","rascolitului":"răscolit","rascolituri":"răscolit","rascoliturile":"răscolit","rascoliturilor":"răscolit","rascolnica":["răscolnică","răscolnic","răscolnica","răscolnic"],"rascolnice":"răscolnic","rascolnicele":"răscolnic","rascolnici":["rascolnici","rascolnic","răscolnici","răscolnic","rascolnici","rascolnică"],"rascolnicii":["rascolnicii","rascolnic","răscolnicii","răscolnic","rascolnicii","rascolnică"],"rascolnicile":"rascolnică","rascolnicilor":["rascolnicilor","rascolnic","rascolnicilor","rascolnică"],"rascolnicul":["rascolnicul","rascolnic","răscolnicul","răscolnic"],"rascolnicule":"rascolnic","rascolnicului":"rascolnic","rascopsei":"răscoace","rascopsese":"răscoace","rascopsesem":"răscoace","rascopsesera":"răscoace","rascopseseram":"răscoace","rascopseserati":"răscoace","rascopsesesi":"răscoace","rascopsesi":"răscoace","rascopt":"răscoace","rascopta":["răscoptă","răscopt","răscopta","răscopt"],"rascopte":"răscopt","rascoptele":"răscopt","rascopti":"răscopt","rascoptii":"răscopt","rascoptul":"răscopt","rascote":"rascotă","rascotei":"rascotă","rascotele":"rascotă","rascotelor":"rascotă","rascovi":"râșcov","rascovii":"râșcov","rascovilor":"râșcov","rascovul":"râșcov","rascovule":"râșcov","rascovului":"râșcov","rascracan":"răscrăcăna","rascracanai":"răscrăcăna","rascracanam":["răscrăcănăm","răscrăcăna","răscrăcănam","răscrăcăna"],"rascracanand":"răscrăcăna","rascracanara":"răscrăcăna","rascracanaram":"răscrăcăna","rascracanarati":"răscrăcăna","rascracanase":"răscrăcăna","rascracanasem":"răscrăcăna","rascracanasera":"răscrăcăna","rascracanaseram":"răscrăcăna","rascracanaserati":"răscrăcăna","rascracanasesi":"răscrăcăna","rascracanasi":"răscrăcăna","rascracanat":"răscrăcăna","rascracanata":["răscrăcănată","răscrăcănat","răscrăcănata","răscrăcănat"],"rascracanate":"răscrăcănat","rascracanatele":"răscrăcănat","rascracanati":["răscrăcănați","răscrăcăna","răscrăcănați","răscrăcănat"],"rascracanatii":"răscrăcănat","rascracanatul":"răscrăcănat","rascracanau":"răscrăcăna","rascracani":"răscrăcăna","rascracarata":["răscrăcărată","răscrăcărat","răscrăcărata","răscrăcărat"],"rascracarate":"răscrăcărat","rascracaratele":"răscrăcărat","rascracarati":"răscrăcărat","rascracaratii":"răscrăcărat","rascracaratul":"răscrăcărat","rascroieli":"răscroială","rascroielii":"răscroială","rascroielile":"răscroială","rascroielilor":"răscroială","rascroituri":"răscroitură","rascroiturii":"răscroitură","rascroiturile":"răscroitură","rascroiturilor":"răscroitură","rascrucea":"răscruce","rascruci":"răscruce","rascrucii":"răscruce","rascrucile":"răscruce","rascrucilor":"răscruce","rascruciul":"răscruci","rascruciule":"răscruci","rascruciului":"răscruci","rascruciuri":"răscruci","rascruciurile":"răscruci","rascruciurilor":"răscruci","rasculai":"răscula","rasculam":["răsculăm","răscula","răsculam","răscula"],"rasculand":"răscula","rasculara":"răscula","rascularam":"răscula","rascularati":"răscula","rascularea":"răsculare","rasculari":"răsculare","rascularii":"răsculare","rascularile":"răsculare","rascularilor":"răsculare","rasculase":"răscula","rasculasem":"răscula","rasculasera":"răscula","rasculaseram":"răscula","rasculaserati":"răscula","rasculasesi":"răscula","rasculasi":"răscula","rasculat":"răscula","rasculata":["răsculată","răsculat","răsculata","răsculat"],"rasculate":"răsculat","rasculatele":"răsculat","rasculati":["răsculați","răscula","răsculați","răsculat"],"rasculatii":"răsculat","rasculatori":"răsculător","rasculatorii":"răsculător","rasculatorilor":"răsculător","rasculatorul":"răsculător","rasculatorule":"răsculător","rasculatorului":"răsculător","rasculatul":"răsculat","rasculau":"răscula","rascumpar":"răscumpăra","rascumparabila":["răscumpărabilă","răscumpărabil","răscumpărabila","răscumpărabil"],"rascumparabile":"răscumpărabil","rascumparabilele":"răscumpărabil","rascumparabili":"răscumpărabil","rascumparabilii":"răscumpărabil","rascumparabilul":"răscumpărabil","rascumparai":"răscumpăra","rascumparam":["răscumpărăm","răscumpăra","răscumpăram","răscumpăra"],"rascumparand":"răscumpăra","rascumparara":"răscumpăra","rascumpararam":"răscumpăra","rascumpararati":"răscumpăra","rascumpararea":"răscumpărare","rascumparari":"răscumpărare","rascumpararii":"răscumpărare","rascumpararile":"răscumpărare","rascumpararilor":"răscumpărare","rascumparase":"răscumpăra","rascumparasem":"răscumpăra","rascumparasera":"răscumpăra","rascumparaseram":"răscumpăra","rascumparaserati":"răscumpăra","rascumparasesi":"răscumpăra","rascumparasi":"răscumpăra","rascumparat":"răscumpăra","rascumparata":["răscumpărată","răscumpărat","răscumpărata","răscumpărat"],"rascumparate":"răscumpărat","rascumparatele":"răscumpărat","rascumparati":["răscumpărați","răscumpăra","răscumpărați","răscumpărat"],"rascumparatii":"răscumpărat","rascumparatoare":"răscumpărător","rascumparatoarea":"răscumpărător","rascumparatoarele":"răscumpărător","rascumparatori":"răscumpărător","rascumparatorii":"răscumpărător","rascumparatorul":"răscumpărător","rascumparatul":"răscumpărat","rascumparaturi":"răscumpărătură","rascumparaturii":"răscumpărătură","rascumparaturile":"răscumpărătură","rascumparaturilor":"răscumpărătură","rascumparau":"răscumpăra","rascumpari":"răscumpăra","rascunoscuta":["răscunoscută","răscunoscut","răscunoscuta","răscunoscut"],"rascunoscute":"răscunoscut","rascunoscutele":"răscunoscut","rascunoscuti":"răscunoscut","rascunoscutii":"răscunoscut","rascunoscutul":"răscunoscut","rase":["rase","rade","râse","râde","rase","rage","rase","ras","rase","rasă"],"rasei":["răsei","rade","râsei","râde","răsei","rage"],"rasele":"ras","raseologia":"raseologie","raseologiei":"raseologie","raseologii":"raseologie","rasera":["raseră","rade","râseră","râde","raseră","rage"],"raseram":["raserăm","rade","râserăm","râde","raserăm","rage"],"raserati":["raserăți","rade","râserăți","râde","raserăți","rage"],"rasese":["răsese","rade","râsese","râde","răsese","rage"],"rasesem":["răsesem","rade","râsesem","râde","răsesem","rage"],"rasesera":["răseseră","rade","râseseră","râde","răseseră","rage"],"raseseram":["răseserăm","rade","râseserăm","râde","răseserăm","rage"],"raseserati":["răseserăți","rade","râseserăți","râde","răseserăți","rage"],"rasesesi":["răseseși","rade","râseseși","râde","răseseși","rage"],"rasesi":["răseși","rade","râseși","râde","răseși","rage"],"rasete":["râsete","râs","râsete","râset"],"rasetele":"râs","rasetelor":"râs","rasfaciunea":"răsfăciune","rasfaciuni":"răsfăciune","rasfaciunii":"răsfăciune","rasfaciunile":"răsfăciune","rasfaciunilor":"răsfăciune","rasfarele":"rășfărel","rasfarelele":"rășfărel","rasfarelelor":"rășfărel","rasfarelul":"rășfărel","rasfarelule":"rășfărel","rasfarelului":"rășfărel","rasfat":"răsfăța","rasfataciunea":"răsfățăciune","rasfataciuni":"răsfățăciune","rasfataciunii":"răsfățăciune","rasfataciunile":"răsfățăciune","rasfataciunilor":"răsfățăciune","rasfatai":"răsfăța","rasfatam":["răsfățăm","răsfăța","răsfățam","răsfăța"],"rasfatand":"răsfăța","rasfatara":"răsfăța","rasfataram":"răsfăța","rasfatarati":"răsfăța","rasfatarea":"răsfățare","rasfatari":"răsfățare","rasfatarii":"răsfățare","rasfatarile":"răsfățare","rasfatarilor":"răsfățare","rasfatase":"răsfăța","rasfatasem":"răsfăța","rasfatasera":"răsfăța","rasfataseram":"răsfăța","rasfataserati":"răsfăța","rasfatasesi":"răsfăța","rasfatasi":"răsfăța","rasfatat":"răsfăța","rasfatata":["răsfățată","răsfățat","răsfățata","răsfățat"],"rasfatate":"răsfățat","rasfatatele":"răsfățat","rasfatati":["răsfățați","răsfăța","răsfățați","răsfățat"],"rasfatatii":"răsfățat","rasfatatul":"răsfățat","rasfataturi":"răsfățătură","rasfataturii":"răsfățătură","rasfataturile":"răsfățătură","rasfataturilor":"răsfățătură","rasfatau":"răsfăța","rasfatia":"răsfăție","rasfatiei":"răsfăție","rasfatii":"răsfăție","rasfatul":"răsfăț","rasfatule":"răsfăț","rasfatului":"răsfăț","rasfaturi":"răsfăț","rasfaturile":"răsfăț","rasfaturilor":"răsfăț","rasfeti":"răsfăța","rasfetul":"rășfet","rasfetule":"rășfet","rasfetului":"rășfet","rasfeturi":"rășfet","rasfeturile":"rășfet","rasfeturilor":"rășfet","rasfiarba":"răsfierbe","rasfierb":"răsfierbe","rasfierband":"răsfierbe","rasfierbea":"răsfierbe","rasfierbeai":"răsfierbe","rasfierbeam":"răsfierbe","rasfierbeati":"răsfierbe","rasfierbeau":"răsfierbe","rasfierbem":"răsfierbe","rasfierbeti":"răsfierbe","rasfierbi":"răsfierbe","rasfierse":"răsfierbe","rasfiersei":"răsfierbe","rasfiersera":"răsfierbe","rasfierseram":"răsfierbe","rasfierserati":"răsfierbe","rasfiersese":"răsfierbe","rasfiersesem":"răsfierbe","rasfiersesera":"răsfierbe","rasfierseseram":"răsfierbe","rasfierseserati":"răsfierbe","rasfiersesesi":"răsfierbe","rasfiersesi":"răsfierbe","rasfiert":"răsfierbe","rasfir":"răsfira","rasfirai":"răsfira","rasfiram":["răsfirăm","răsfira","răsfiram","răsfira"],"rasfirand":"răsfira","rasfirara":"răsfira","rasfiraram":"răsfira","rasfirarati":"răsfira","rasfirarea":"răsfirare","rasfirari":"răsfirare","rasfirarii":"răsfirare","rasfirarile":"răsfirare","rasfirarilor":"răsfirare","rasfirase":"răsfira","rasfirasem":"răsfira","rasfirasera":"răsfira","rasfiraseram":"răsfira","rasfiraserati":"răsfira","rasfirasesi":"răsfira","rasfirasi":"răsfira","rasfirat":"răsfira","rasfirata":["răsfirată","răsfirat","răsfirata","răsfirat"],"rasfirate":"răsfirat","rasfiratele":"răsfirat","rasfirati":["răsfirați","răsfira","răsfirați","răsfirat"],"rasfiratii":"răsfirat","rasfiratul":"răsfirat","rasfirau":"răsfira","rasfiri":"răsfira","rasfoia":"răsfoi","rasfoiai":"răsfoi","rasfoiam":"răsfoi","rasfoiati":"răsfoi","rasfoiau":"răsfoi","rasfoieli":"răsfoială","rasfoielii":"răsfoială","rasfoielile":"răsfoială","rasfoielilor":"răsfoială","rasfoiesc":"răsfoi","rasfoieste":"răsfoi","rasfoiesti":"răsfoi","rasfoii":"răsfoi","rasfoim":"răsfoi","rasfoind":"răsfoi","rasfoira":"răsfoi","rasfoiram":"răsfoi","rasfoirati":"răsfoi","rasfoirea":"răsfoire","rasfoiri":"răsfoire","rasfoirii":"răsfoire","rasfoirile":"răsfoire","rasfoirilor":"răsfoire","rasfoise":"răsfoi","rasfoisem":"răsfoi","rasfoisera":"răsfoi","rasfoiseram":"răsfoi","rasfoiserati":"răsfoi","rasfoisesi":"răsfoi","rasfoisi":"răsfoi","rasfoit":"răsfoi","rasfoiti":"răsfoi","rasfranarea":"răsfrânare","rasfranari":"răsfrânare","rasfranarii":"răsfrânare","rasfrang":"răsfrânge","rasfranga":"răsfrânge","rasfrangand":"răsfrânge","rasfrangea":"răsfrânge","rasfrangeai":"răsfrânge","rasfrangeam":"răsfrânge","rasfrangeati":"răsfrânge","rasfrangeau":"răsfrânge","rasfrangem":"răsfrânge","rasfrangeti":"răsfrânge","rasfrangi":"răsfrânge","rasfranse":"răsfrânge","rasfransei":"răsfrânge","rasfransera":"răsfrânge","rasfranseram":"răsfrânge","rasfranserati":"răsfrânge","rasfransese":"răsfrânge","rasfransesem":"răsfrânge","rasfransesera":"răsfrânge","rasfranseseram":"răsfrânge","rasfranseserati":"răsfrânge","rasfransesesi":"răsfrânge","rasfransesi":"răsfrânge","rasfrant":"răsfrânge","rasfranta":["răsfrântă","răsfrânt","răsfrânta","răsfrânt"],"rasfrante":"răsfrânt","rasfrantele":"răsfrânt","rasfranti":"răsfrânt","rasfrantii":"răsfrânt","rasfrantul":"răsfrânt","rasi":["rași","ras","râși","râs"],"rasiala":["rasială","rasial","rasiala","rasial"],"rasiale":"rasial","rasialele":"rasial","rasiali":"rasial","rasialii":"rasial","rasialul":"rasial","rasii":["rașii","ras","râșii","râs"],"rasilor":"râs","rasinari":"rășinar","rasinarii":"rășinar","rasinarilor":"rășinar","rasinarul":"rășinar","rasinarule":"rășinar","rasinarului":"rășinar","rasini":"rășină","rasinii":"rășină","rasinile":"rășină","rasinilor":"rășină","rasinoasa":["rășinoasă","rășinos","rășinoasa","rășinos"],"rasinoase":["rășinoase","rășinoasă","rășinoase","rășinos"],"rasinoasei":"rășinoasă","rasinoasele":["rășinoasele","rășinoasă","rășinoasele","rășinos"],"rasinoaselor":"rășinoasă","rasinosi":"rășinos","rasinosii":"rășinos","rasinosul":"rășinos","rasipita":["răsipită","răsipit","răsipita","răsipit"],"rasipite":"răsipit","rasipitele":"răsipit","rasipiti":"răsipit","rasipitii":"răsipit","rasipitul":"răsipit","rasismul":"rasism","rasismule":"rasism","rasismului":"rasism","rasiste":"rasistă","rasistei":"rasistă","rasistele":"rasistă","rasistelor":"rasistă","rasisti":"rasist","rasistii":"rasist","rasistilor":"rasist","rasistul":"rasist","rasistule":"rasist","rasistului":"rasist","rasluirea":"rășluire","rasluiri":"rășluire","rasluirii":"rășluire","rasluirile":"rășluire","rasluirilor":"rășluire","rasnea":"râșni","rasneai":"râșni","rasneam":"râșni","rasneati":"râșni","rasneau":"râșni","rasnele":"râșneală","rasnelei":"râșneală","rasnelele":"râșneală","rasnelelor":"râșneală","rasneli":"râșneală","rasnesc":"râșni","rasneste":"râșni","rasnesti":"râșni","rasnicioare":"râșnicioară","rasnicioarei":"râșnicioară","rasnicioarele":"râșnicioară","rasnicioarelor":"râșnicioară","rasnii":"râșni","rasnim":"râșni","rasnind":"râșni","rasnira":"râșni","rasniram":"râșni","rasnirati":"râșni","rasnirea":"râșnire","rasniri":"râșnire","rasnirii":"râșnire","rasnirile":"râșnire","rasnirilor":"râșnire","rasnise":"râșni","rasnisem":"râșni","rasnisera":"râșni","rasniseram":"râșni","rasniserati":"râșni","rasnisesi":"râșni","rasnisi":"râșni","rasnit":"râșni","rasnitari":"râșnițar","rasnitarii":"râșnițar","rasnitarilor":"râșnițar","rasnitarul":"râșnițar","rasnitarule":"râșnițar","rasnitarului":"râșnițar","rasnite":"râșniță","rasnitei":"râșniță","rasnitele":"râșniță","rasnitelor":"râșniță","rasniti":"râșni","rasnitul":"râșnit","rasnitule":"râșnit","rasnitului":"râșnit","rasnoveana":["râșnoveană","râșnovean","râșnoveana","râșnovean"],"rasnoveanul":"râșnovean","rasnoveanule":"râșnovean","rasnoveanului":"râșnovean","rasnovence":"râșnoveancă","rasnovencei":"râșnoveancă","rasnovencele":"râșnoveancă","rasnovencelor":"râșnoveancă","rasnovene":"râșnovean","rasnovenele":"râșnovean","rasnoveni":"râșnovean","rasnovenii":"râșnovean","rasnovenilor":"râșnovean","rasoaice":"râsoaică","rasoaicei":"râsoaică","rasoaicele":"râsoaică","rasoaicelor":"râsoaică","rasoale":"răsol","rasoalele":"răsol","rasoalelor":"răsol","rasolea":"rasoli","rasoleai":"rasoli","rasoleam":"rasoli","rasoleati":"rasoli","rasoleau":"rasoli","rasolele":"rasoleală","rasolelei":"rasoleală","rasolelele":"rasoleală","rasolelelor":"rasoleală","rasoleli":"rasoleală","rasolesc":"rasoli","rasoleste":"rasoli","rasolesti":"rasoli","rasolii":"rasoli","rasolim":"rasoli","rasolind":"rasoli","rasolira":"rasoli","rasoliram":"rasoli","rasolirati":"rasoli","rasolise":"rasoli","rasolisem":"rasoli","rasolisera":"rasoli","rasoliseram":"rasoli","rasoliserati":"rasoli","rasolisesi":"rasoli","rasolisi":"rasoli","rasolit":"rasoli","rasolita":["rasolită","rasolit","rasolita","rasolit"],"rasolite":"rasolit","rasolitele":"rasolit","rasoliti":["rasoliți","rasoli","rasoliți","rasolit"],"rasolitii":"rasolit","rasolitul":"rasolit","rasolul":"răsol","rasolule":"răsol","rasolului":"răsol","rasoluri":"rasol","raspalauri":"rașpalău","raspalaurile":"rașpalău","raspalaurilor":"rașpalău","raspalauul":"rașpalău","raspalauule":"rașpalău","raspalauului":"rașpalău","raspale":"rașpăl","raspalele":"rașpăl","raspalelor":"rașpăl","raspalul":"rașpăl","raspalule":"rașpăl","raspalului":"rașpăl","raspandaci":"răspândac","raspandacii":"răspândac","raspandacilor":"răspândac","raspandacul":"răspândac","raspandacule":"răspândac","raspandacului":"răspândac","raspandea":"răspândi","raspandeai":"răspândi","raspandeam":"răspândi","raspandeati":"răspândi","raspandeau":"răspândi","raspandesc":"răspândi","raspandeste":"răspândi","raspandesti":"răspândi","raspandii":"răspândi","raspandim":"răspândi","raspandind":"răspândi","raspandira":"răspândi","raspandiram":"răspândi","raspandirati":"răspândi","raspandirea":"răspândire","raspandiri":"răspândire","raspandirii":"răspândire","raspandirile":"răspândire","raspandirilor":"răspândire","raspandise":"răspândi","raspandisem":"răspândi","raspandisera":"răspândi","raspandiseram":"răspândi","raspandiserati":"răspândi","raspandisesi":"răspândi","raspandisi":"răspândi","raspandit":"răspândi","raspandita":["răspândită","răspândit","răspândita","răspândit"],"raspandite":"răspândit","raspanditele":"răspândit","raspanditi":["răspândiți","răspândi","răspândiți","răspândit"],"raspanditii":"răspândit","raspanditoarea":"răspânditoare","raspanditoarei":"răspânditoare","raspanditoarele":"răspânditoare","raspanditoarelor":"răspânditoare","raspanditori":"răspânditor","raspanditorii":"răspânditor","raspanditorilor":"răspânditor","raspanditorul":"răspânditor","raspanditorule":"răspânditor","raspanditorului":"răspânditor","raspanditul":"răspândit","raspantea":"răspânte","raspantenea":"răspântene","raspanteni":"răspântene","raspantenii":"răspântene","raspantenile":"răspântene","raspantenilor":"răspântene","raspanti":"răspânte","raspantia":"răspântie","raspantiei":"răspântie","raspantii":["răspânții","răspânte","răspântii","răspântie"],"raspantiile":"răspântie","raspantiilor":"răspântie","raspantile":"răspânte","raspantilor":"răspânte","raspasul":"răspas","raspasule":"răspas","raspasului":"răspas","raspasuri":"răspas","raspasurile":"răspas","raspasurilor":"răspas","raspe":"rașpă","raspei":"rașpă","raspele":["rașpele","rașpă","rașpele","rașpel"],"raspelele":"rașpel","raspelelor":"rașpel","raspelor":"rașpă","raspelul":"rașpel","raspelule":"rașpel","raspelului":"rașpel","raspetieul":"răspetie","raspetieule":"răspetie","raspetieului":"răspetie","raspetii":"răspetie","raspetiile":"răspetie","raspetiilor":"răspetie","raspic":"răspica","raspicai":"răspica","raspicam":["răspicăm","răspica","răspicam","răspica"],"raspicand":"răspica","raspicara":"răspica","raspicaram":"răspica","raspicarati":"răspica","raspicarea":"răspicare","raspicari":"răspicare","raspicarii":"răspicare","raspicarile":"răspicare","raspicarilor":"răspicare","raspicase":"răspica","raspicasem":"răspica","raspicasera":"răspica","raspicaseram":"răspica","raspicaserati":"răspica","raspicasesi":"răspica","raspicasi":"răspica","raspicat":"răspica","raspicata":["răspicată","răspicat","răspicata","răspicat"],"raspicate":"răspicat","raspicatele":"răspicat","raspicati":["răspicați","răspica","răspicați","răspicat"],"raspicatii":"răspicat","raspicatul":"răspicat","raspicau":"răspica","raspici":"răspica","raspierzarea":"răspierzare","raspierzari":"răspierzare","raspierzarii":"răspierzare","raspile":["rașpile","rașpil","rașpile","rașpilă"],"raspilei":"rașpilă","raspilele":["rașpilele","rașpil","rașpilele","rașpilă"],"raspilelor":["rașpilelor","rașpil","rașpilelor","rașpilă"],"raspilul":"rașpil","raspilule":"rașpil","raspilului":"rașpil","raspintenea":"răspintene","raspinteni":"răspintene","raspintenii":"răspintene","raspintenile":"răspintene","raspintenilor":"răspintene","rasplaiul":"răsplai","rasplaiule":"răsplai","rasplaiului":"răsplai","rasplatea":"răsplăti","rasplateai":"răsplăti","rasplateam":"răsplăti","rasplateati":"răsplăti","rasplateau":"răsplăti","rasplatesc":"răsplăti","rasplateste":"răsplăti","rasplatesti":"răsplăti","rasplati":"răsplată","rasplatii":["răsplății","răsplată","răsplătii","răsplăti"],"rasplatile":"răsplată","rasplatilor":"răsplată","rasplatim":"răsplăti","rasplatind":"răsplăti","rasplatira":"răsplăti","rasplatiram":"răsplăti","rasplatirati":"răsplăti","rasplatirea":"răsplătire","rasplatiri":"răsplătire","rasplatirii":"răsplătire","rasplatirile":"răsplătire","rasplatirilor":"răsplătire","rasplatise":"răsplăti","rasplatisem":"răsplăti","rasplatisera":"răsplăti","rasplatiseram":"răsplăti","rasplatiserati":"răsplăti","rasplatisesi":"răsplăti","rasplatisi":"răsplăti","rasplatit":"răsplăti","rasplatiti":"răsplăti","rasplatitori":"răsplătitor","rasplatitorii":"răsplătitor","rasplatitorilor":"răsplătitor","rasplatitorul":"răsplătitor","rasplatitorule":"răsplătitor","rasplatitorului":"răsplătitor","raspopaul":"răspopă","raspopaule":"răspopă","raspopaului":"răspopă","raspopea":"răspopi","raspopeai":"răspopi","raspopeam":"răspopi","raspopeati":"răspopi","raspopeau":"răspopi","raspopesc":"răspopi","raspopeste":"răspopi","raspopesti":"răspopi","raspopi":"răspopă","raspopii":["răspopii","răspopă","răspopii","răspopi"],"raspopilor":"răspopă","raspopim":"răspopi","raspopind":"răspopi","raspopira":"răspopi","raspopiram":"răspopi","raspopirati":"răspopi","raspopise":"răspopi","raspopisem":"răspopi","raspopisera":"răspopi","raspopiseram":"răspopi","raspopiserati":"răspopi","raspopisesi":"răspopi","raspopisi":"răspopi","raspopit":"răspopi","raspopita":["răspopită","răspopit","răspopita","răspopit"],"raspopite":"răspopit","raspopitele":"răspopit","raspopiti":["răspopiți","răspopi","răspopiți","răspopit"],"raspopitii":"răspopit","raspopitul":"răspopit","raspublici":"răspublică","raspublicii":"răspublică","raspublicile":"răspublică","raspublicilor":"răspublică","raspund":"răspunde","raspunda":"răspunde","raspundea":"răspunde","raspundeai":"răspunde","raspundeam":"răspunde","raspundeati":"răspunde","raspundeau":"răspunde","raspundem":"răspunde","raspunderea":"răspundere","raspunderi":"răspundere","raspunderii":"răspundere","raspunderile":"răspundere","raspunderilor":"răspundere","raspundeti":"răspunde","raspuns":"răspunde","raspunsa":["răspunsă","răspuns","răspunsa","răspuns"],"raspunse":["răspunse","răspunde","răspunse","răspuns"],"raspunsei":"răspunde","raspunsele":"răspuns","raspunsera":"răspunde","raspunseram":"răspunde","raspunserati":"răspunde","raspunsese":"răspunde","raspunsesem":"răspunde","raspunsesera":"răspunde","raspunseseram":"răspunde","raspunseserati":"răspunde","raspunsesesi":"răspunde","raspunsesi":"răspunde","raspunsi":"răspuns","raspunsii":"răspuns","raspunsul":"răspuns","raspunsule":"răspuns","raspunsului":"răspuns","raspunsuri":"răspuns","raspunsurile":"răspuns","raspunsurilor":"răspuns","raspunzand":"răspunde","raspunzatatea":"răspunzătate","raspunzatati":"răspunzătate","raspunzatatii":"răspunzătate","raspunzatatile":"răspunzătate","raspunzatatilor":"răspunzătate","raspunzatoare":"răspunzător","raspunzatoarea":"răspunzător","raspunzatoarele":"răspunzător","raspunzatori":"răspunzător","raspunzatorii":"răspunzător","raspunzatorul":"răspunzător","raspunzi":"răspunde","rasputerea":"răsputere","rasputeri":"răsputere","rasputerii":"răsputere","rasputerile":"răsputere","rasputerilor":"răsputere","rasputite":"rasputiță","rasputitei":"rasputiță","rasputitele":"rasputiță","rasputitelor":"rasputiță","rasst":"răsști","rasste":"răsști","rasstea":"răsști","rassteai":"răsști","rassteam":"răsști","rassteati":"răsști","rassteau":"răsști","rasstie":"răsști","rasstii":"răsști","rasstim":"răsști","rasstind":"răsști","rasstira":"răsști","rasstiram":"răsști","rasstirati":"răsști","rasstise":"răsști","rasstisem":"răsști","rasstisera":"răsști","rasstiseram":"răsști","rasstiserati":"răsști","rasstisesi":"răsști","rasstisi":"răsști","rasstit":"răsști","rasstiti":"răsști","rastalmacea":"răstălmăci","rastalmaceai":"răstălmăci","rastalmaceam":"răstălmăci","rastalmaceati":"răstălmăci","rastalmaceau":"răstălmăci","rastalmacesc":"răstălmăci","rastalmaceste":"răstălmăci","rastalmacesti":"răstălmăci","rastalmacii":"răstălmăci","rastalmacim":"răstălmăci","rastalmacind":"răstălmăci","rastalmacira":"răstălmăci","rastalmaciram":"răstălmăci","rastalmacirati":"răstălmăci","rastalmacirea":"răstălmăcire","rastalmaciri":"răstălmăcire","rastalmacirii":"răstălmăcire","rastalmacirile":"răstălmăcire","rastalmacirilor":"răstălmăcire","rastalmacise":"răstălmăci","rastalmacisem":"răstălmăci","rastalmacisera":"răstălmăci","rastalmaciseram":"răstălmăci","rastalmaciserati":"răstălmăci","rastalmacisesi":"răstălmăci","rastalmacisi":"răstălmăci","rastalmacit":"răstălmăci","rastalmacita":["răstălmăcită","răstălmăcit","răstălmăcita","răstălmăcit"],"rastalmacite":"răstălmăcit","rastalmacitele":"răstălmăcit","rastalmaciti":["răstălmăciți","răstălmăci","răstălmăciți","răstălmăcit"],"rastalmacitii":"răstălmăcit","rastalmacitul":"răstălmăcit","rastaute":"răstăuță","rastautei":"răstăuță","rastautele":"răstăuță","rastautelor":"răstăuță","rastea":"răsti","rasteai":"răsti","rasteam":"răsti","rasteati":"răsti","rasteau":"răsti","rasteie":"răsteu","rasteiele":"răsteu","rasteielor":"răsteu","rastele":["răstele","răsteală","rastele","rastel"],"rastelei":"răsteală","rastelele":["răstelele","răsteală","rastelele","rastel"],"rastelelor":["răstelelor","răsteală","rastelelor","rastel"],"rasteli":"răsteală","rastelul":"rastel","rastelule":"rastel","rastelului":"rastel","rastesc":"răsti","rasteste":"răsti","rastesti":"răsti","rasteuul":"răsteu","rasteuule":"răsteu","rasteuului":"răsteu","rastignea":"răstigni","rastigneai":"răstigni","rastigneam":"răstigni","rastigneati":"răstigni","rastigneau":"răstigni","rastignesc":"răstigni","rastigneste":"răstigni","rastignesti":"răstigni","rastignii":"răstigni","rastignim":"răstigni","rastignind":"răstigni","rastignira":"răstigni","rastigniram":"răstigni","rastignirati":"răstigni","rastignirea":"răstignire","rastigniri":"răstignire","rastignirii":"răstignire","rastignirile":"răstignire","rastignirilor":"răstignire","rastignise":"răstigni","rastignisem":"răstigni","rastignisera":"răstigni","rastigniseram":"răstigni","rastigniserati":"răstigni","rastignisesi":"răstigni","rastignisi":"răstigni","rastignit":"răstigni","rastignita":["răstignită","răstignit","răstignita","răstignit"],"rastignite":"răstignit","rastignitele":"răstignit","rastigniti":["răstigniți","răstigni","răstigniți","răstignit"],"rastignitii":"răstignit","rastignitul":"răstignit","rastigniture":"răstignitură","rastigniturei":"răstignitură","rastii":"răsti","rastim":"răsti","rastimpul":"răstimp","rastimpule":"răstimp","rastimpului":"răstimp","rastimpuri":"răstimp","rastimpurile":"răstimp","rastimpurilor":"răstimp","rastind":"răsti","rastira":"răsti","rastiram":"răsti","rastirati":"răsti","rastirea":"răstire","rastiri":"răstire","rastirii":"răstire","rastirile":"răstire","rastirilor":"răstire","rastise":"răsti","rastisem":"răsti","rastisera":"răsti","rastiseram":"răsti","rastiserati":"răsti","rastisesi":"răsti","rastisi":"răsti","rastit":"răsti","rastita":["răstită","răstit","răstita","răstit"],"rastite":"răstit","rastitele":"răstit","rastiti":["răstiți","răsti","răstiți","răstit"],"rastitii":"răstit","rastitul":"răstit","rastituri":"răstitură","rastiturii":"răstitură","rastiturile":"răstitură","rastiturilor":"răstitură","rastoacaul":"răstoacă","rastoacaule":"răstoacă","rastoacaului":"răstoacă","rastoace":"răstoacă","rastoacei":"răstoacă","rastoacelor":"răstoacă","rastoarna":"răsturna","rastocea":"răstoci","rastoceai":"răstoci","rastoceam":"răstoci","rastoceati":"răstoci","rastoceau":"răstoci","rastocesc":"răstoci","rastoceste":"răstoci","rastocesti":"răstoci","rastocii":"răstoci","rastocim":"răstoci","rastocind":"răstoci","rastocira":"răstoci","rastociram":"răstoci","rastocirati":"răstoci","rastocise":"răstoci","rastocisem":"răstoci","rastocisera":"răstoci","rastociseram":"răstoci","rastociserati":"răstoci","rastocisesi":"răstoci","rastocisi":"răstoci","rastocit":"răstoci","rastociti":"răstoci","rastocul":"raștoc","rastocule":"raștoc","rastocului":"raștoc","rastorn":"răsturna","rastorni":"răsturna","rastransa":["răstrânsă","răstrâns","răstrânsa","răstrâns"],"rastranse":"răstrâns","rastransele":"răstrâns","rastransi":"răstrâns","rastransii":"răstrâns","rastransul":"răstrâns","rastristea":"răstriște","rastristi":"răstriște","rastristii":"răstriște","rastristile":"răstriște","rastristilor":"răstriște","rastul":"rast","rastule":"rast","rastului":"rast","rasturnai":"răsturna","rasturnam":["răsturnăm","răsturna","răsturnam","răsturna"],"rasturnand":"răsturna","rasturnara":"răsturna","rasturnaram":"răsturna","rasturnarati":"răsturna","rasturnarea":"răsturnare","rasturnari":"răsturnare","rasturnarii":"răsturnare","rasturnarile":"răsturnare","rasturnarilor":"răsturnare","rasturnase":"răsturna","rasturnasem":"răsturna","rasturnasera":"răsturna","rasturnaseram":"răsturna","rasturnaserati":"răsturna","rasturnasesi":"răsturna","rasturnasi":"răsturna","rasturnat":"răsturna","rasturnata":["răsturnată","răsturnat","răsturnata","răsturnat"],"rasturnate":"răsturnat","rasturnatele":"răsturnat","rasturnati":["răsturnați","răsturna","răsturnați","răsturnat"],"rasturnatii":"răsturnat","rasturnatoarea":"răsturnătoare","rasturnatoarei":"răsturnătoare","rasturnatoarele":"răsturnătoare","rasturnatoarelor":"răsturnătoare","rasturnatul":"răsturnat","rasturnaturi":"răsturnătură","rasturnaturii":"răsturnătură","rasturnaturile":"răsturnătură","rasturnaturilor":"răsturnătură","rasturnau":"răsturna","rasturnisul":"răsturniș","rasturnisule":"răsturniș","rasturnisului":"răsturniș","rasturnisuri":"răsturniș","rasturnisurile":"răsturniș","rasturnisurilor":"răsturniș","rasucea":"răsuci","rasuceai":"răsuci","rasuceam":"răsuci","rasuceati":"răsuci","rasuceau":"răsuci","rasuceli":"răsuceală","rasucelii":"răsuceală","rasucelile":"răsuceală","rasucelilor":"răsuceală","rasucesc":"răsuci","rasuceste":"răsuci","rasucesti":"răsuci","rasucii":"răsuci","rasucim":"răsuci","rasucind":"răsuci","rasucira":"răsuci","rasuciram":"răsuci","rasucirati":"răsuci","rasucirea":"răsucire","rasuciri":"răsucire","rasucirii":"răsucire","rasucirile":"răsucire","rasucirilor":"răsucire","rasucise":"răsuci","rasucisem":"răsuci","rasucisera":"răsuci","rasuciseram":"răsuci","rasuciserati":"răsuci","rasucisesi":"răsuci","rasucisi":"răsuci","rasucit":"răsuci","rasucita":["răsucită","răsucit","răsucita","răsucit"],"rasucite":"răsucit","rasucitele":"răsucit","rasuciti":["răsuciți","răsuci","răsuciți","răsucit"],"rasucitii":"răsucit","rasucitoarea":"răsucitoare","rasucitoarei":"răsucitoare","rasucitoarele":"răsucitoare","rasucitoarelor":"răsucitoare","rasucitori":"răsucitor","rasucitorii":"răsucitor","rasucitorilor":"răsucitor","rasucitorul":"răsucitor","rasucitorule":"răsucitor","rasucitorului":"răsucitor","rasucitul":"răsucit","rasuflai":"răsufla","rasuflam":["răsuflăm","răsufla","răsuflam","răsufla"],"rasufland":"răsufla","rasuflara":"răsufla","rasuflaram":"răsufla","rasuflarati":"răsufla","rasuflarea":"răsuflare","rasuflari":"răsuflare","rasuflarii":"răsuflare","rasuflarile":"răsuflare","rasuflarilor":"răsuflare","rasuflase":"răsufla","rasuflasem":"răsufla","rasuflasera":"răsufla","rasuflaseram":"răsufla","rasuflaserati":"răsufla","rasuflasesi":"răsufla","rasuflasi":"răsufla","rasuflat":"răsufla","rasuflata":["răsuflată","răsuflat","răsuflata","răsuflat"],"rasuflate":"răsuflat","rasuflatele":"răsuflat","rasuflati":["răsuflați","răsufla","răsuflați","răsuflat"],"rasuflatii":"răsuflat","rasuflatul":"răsuflat","rasuflaturi":"răsuflătură","rasuflaturii":"răsuflătură","rasuflaturile":"răsuflătură","rasuflaturilor":"răsuflătură","rasuflau":"răsufla","rasuflete":"răsuflet","rasufletele":"răsuflet","rasufletelor":"răsuflet","rasufletul":"răsuflet","rasufletule":"răsuflet","rasufletului":"răsuflet","rasufli":"răsufla","rasuflu":"răsufla","rasuflul":"răsuflu","rasuflule":"răsuflu","rasuflului":"răsuflu","rasufluri":"răsuflu","rasuflurile":"răsuflu","rasuflurilor":"răsuflu","rasuflusul":"răsufluș","rasuflusule":"răsufluș","rasuflusului":"răsufluș","rasuia":"râsui","rasuiai":"râsui","rasuiam":"râsui","rasuiati":"râsui","rasuiau":"râsui","rasuie":"râsui","rasuii":"râsui","rasuim":"râsui","rasuind":"râsui","rasuira":"râsui","rasuiram":"râsui","rasuirati":"râsui","rasuirea":"râsuire","rasuiri":"râsuire","rasuirii":"râsuire","rasuirile":"râsuire","rasuirilor":"râsuire","rasuise":"râsui","rasuisem":"râsui","rasuisera":"râsui","rasuiseram":"râsui","rasuiserati":"râsui","rasuisesi":"râsui","rasuisi":"râsui","rasuit":"râsui","rasuiti":"râsui","rasul":["rasul","ras","râsul","râs"],"rasule":"râs","rasului":"râs","rasun":"răsuna","rasunai":"răsuna","rasunam":["răsunăm","răsuna","răsunam","răsuna"],"rasunand":"răsuna","rasunara":"răsuna","rasunaram":"răsuna","rasunarati":"răsuna","rasunarea":"răsunare","rasunari":"răsunare","rasunarii":"răsunare","rasunarile":"răsunare","rasunarilor":"răsunare","rasunase":"răsuna","rasunasem":"răsuna","rasunasera":"răsuna","rasunaseram":"răsuna","rasunaserati":"răsuna","rasunasesi":"răsuna","rasunasi":"răsuna","rasunat":"răsuna","rasunati":"răsuna","rasunatoare":"răsunător","rasunatoarea":"răsunător","rasunatoarele":"răsunător","rasunatori":"răsunător","rasunatorii":"răsunător","rasunatorul":"răsunător","rasunaturi":"răsunătură","rasunaturii":"răsunătură","rasunaturile":"răsunătură","rasunaturilor":"răsunătură","rasunau":"răsuna","rasune":"răsuna","rasunete":"răsunet","rasunetele":"răsunet","rasunetelor":"răsunet","rasunetoasa":["răsunetoasă","răsunetos","răsunetoasa","răsunetos"],"rasunetoase":"răsunetos","rasunetoasele":"răsunetos","rasunetosi":"răsunetos","rasunetosii":"răsunetos","rasunetosul":"răsunetos","rasunetul":"răsunet","rasunetule":"răsunet","rasunetului":"răsunet","rasuni":"răsuna","rasunul":"răsun","rasunule":"răsun","rasunului":"răsun","rasuri":"răsură","rasurii":"răsură","rasurile":"răsură","rasurilor":"răsură","rasvarea":"răsvări","rasvareai":"răsvări","rasvaream":"răsvări","rasvareati":"răsvări","rasvareau":"răsvări","rasvaresc":"răsvări","rasvareste":"răsvări","rasvaresti":"răsvări","rasvarii":"răsvări","rasvarim":"răsvări","rasvarind":"răsvări","rasvarira":"răsvări","rasvariram":"răsvări","rasvarirati":"răsvări","rasvarise":"răsvări","rasvarisem":"răsvări","rasvarisera":"răsvări","rasvariseram":"răsvări","rasvariserati":"răsvări","rasvarisesi":"răsvări","rasvarisi":"răsvări","rasvarit":"răsvări","rasvariti":"răsvări","raszi":"răszice","raszic":"răszice","raszica":"răszice","raszicand":"răszice","raszicea":"răszice","rasziceai":"răszice","rasziceam":"răszice","rasziceati":"răszice","rasziceau":"răszice","raszicem":"răszice","rasziceti":"răszice","raszici":"răszice","raszis":"răszice","raszise":"răszice","raszisei":"răszice","raszisera":"răszice","rasziseram":"răszice","rasziserati":"răszice","raszisese":"răszice","raszisesem":"răszice","raszisesera":"răszice","rasziseseram":"răszice","rasziseserati":"răszice","raszisesesi":"răszice","raszisesi":"răszice","ratacane":"rătăcană","ratacanei":"rătăcană","ratacanele":"rătăcană","ratacanelor":"rătăcană","ratacani":"rătăcană","ratacaniea":"rătăcanie","ratacanii":"rătăcanie","ratacaniii":"rătăcanie","ratacaniile":"rătăcanie","ratacaniilor":"rătăcanie","ratacea":"rătăci","rataceai":"rătăci","rataceam":"rătăci","rataceati":"rătăci","rataceau":"rătăci","ratacele":"rătăceală","ratacelei":"rătăceală","ratacelele":"rătăceală","ratacelelor":"rătăceală","rataceli":"rătăceală","ratacesc":"rătăci","rataceste":"rătăci","ratacesti":"rătăci","ratacii":"rătăci","ratacim":"rătăci","ratacind":"rătăci","ratacira":"rătăci","rataciram":"rătăci","ratacirati":"rătăci","ratacirea":"rătăcire","rataciri":"rătăcire","ratacirii":"rătăcire","ratacirile":"rătăcire","ratacirilor":"rătăcire","ratacise":"rătăci","ratacisem":"rătăci","ratacisera":"rătăci","rataciseram":"rătăci","rataciserati":"rătăci","ratacisesi":"rătăci","ratacisi":"rătăci","ratacit":"rătăci","ratacita":["rătăcită","rătăcit","rătăcita","rătăcit"],"ratacite":"rătăcit","ratacitele":"rătăcit","rataciti":["rătăciți","rătăci","rătăciți","rătăcit"],"ratacitii":"rătăcit","ratacitoare":"rătăcitor","ratacitoarea":"rătăcitor","ratacitoarele":"rătăcitor","ratacitori":"rătăcitor","ratacitorii":"rătăcitor","ratacitorul":"rătăcitor","ratacitul":"rătăcit","ratai":"rata","ratam":["ratăm","rata","ratam","rata"],"ratand":"rata","rataneasca":["râtănească","râtănesc","râtăneasca","râtănesc"],"ratanescul":"râtănesc","ratanesti":"râtănesc","ratanestii":"râtănesc","ratanestile":"râtănesc","ratani":"râtan","ratanii":"râtan","ratanilor":"râtan","ratanul":"râtan","ratanule":"râtan","ratanului":"râtan","ratara":"rata","rataram":"rata","ratarati":"rata","ratarea":"ratare","ratari":["rățari","rățar","ratări","ratare"],"ratarii":["rățarii","rățar","ratării","ratare"],"ratarile":"ratare","ratarilor":["rățarilor","rățar","ratărilor","ratare"],"ratarul":"rățar","ratarule":"rățar","ratarului":"rățar","ratase":"rata","ratasem":"rata","ratasera":"rata","rataseram":"rata","rataserati":"rata","ratasesi":"rata","ratasi":"rata","ratat":"rata","ratata":["ratată","ratat","ratata","ratat"],"ratate":"ratat","ratatele":"ratat","ratati":["ratați","rata","ratați","ratat"],"ratatii":"ratat","ratatul":"ratat","ratau":"rata","rate":["rate","rată","rațe","rață"],"rate caraitoare":"rață cârâitoare","rate catifelate":"rață catifelată","rate cu cap alb":"rață cu cap alb","rate cu cap castaniu":"rață cu cap castaniu","rate cu cap negru":"rață cu cap negru","rate cu ciuf":"rață cu ciuf","rate cu ochi de soim":"rață cu ochi de șoim","rate cucuiate":"rață cucuiată","rate de gheturi":"rață de ghețuri","rate domestice":"rață domestică","rate fluieratoare":"rață fluierătoare","rate lingurar":"rață lingurar","rate mandarin":"rață mandarin","rate mari":"rață mare","rate mici":"rață mică","rate motate":"rață moțată","rate negre":"rață neagră","rate pestrite":"rață pestriță","rate rosii":"rață roșie","rate sulitar":"rață sulițar","rate sunatoare":"rață sunătoare","rate sunatoare americane":"rață sunătoare americană","rateasca":["rățească","rățesc","rățeasca","rățesc"],"rateaza":"rata","ratei":["ratei","rată","raței","rață"],"ratele":["ratele","rată","rațele","rață"],"ratelor":["ratelor","rată","rațelor","rață"],"ratescul":"rățesc","ratese":"rateș","ratesele":"rateș","rateselor":"rateș","ratesti":"rățesc","ratestii":"rățesc","ratestile":"rățesc","ratesul":"rateș","ratesule":"rateș","ratesului":"rateș","rateul":"rateu","rateule":"rateu","rateului":"rateu","rateuri":"rateu","rateurile":"rateu","rateurilor":"rateu","ratez":"rata","rateza":"reteza","ratezata":["rătezată","rătezat","rătezata","rătezat"],"ratezate":"rătezat","ratezatele":"rătezat","ratezati":"rătezat","ratezatii":"rătezat","ratezatul":"rătezat","rateze":"rătează","ratezei":"rătează","ratezele":"rătează","ratezelor":"rătează","ratezi":"rata","ratia":"rație","raticele":"râticel","raticelele":"râticel","raticelelor":"râticel","raticelul":"râticel","raticelule":"râticel","raticelului":"râticel","raticidul":"raticid","raticidule":"raticid","raticidului":"raticid","raticizi":"raticid","raticizile":"raticid","raticizilor":"raticid","ratiei":"rație","ratific":"ratifica","ratificai":"ratifica","ratificam":["ratificăm","ratifica","ratificam","ratifica"],"ratificand":"ratifica","ratificara":"ratifica","ratificaram":"ratifica","ratificarati":"ratifica","ratificarea":"ratificare","ratificari":"ratificare","ratificarii":"ratificare","ratificarile":"ratificare","ratificarilor":"ratificare","ratificase":"ratifica","ratificasem":"ratifica","ratificasera":"ratifica","ratificaseram":"ratifica","ratificaserati":"ratifica","ratificasesi":"ratifica","ratificasi":"ratifica","ratificat":"ratifica","ratificata":["ratificată","ratificat","ratificata","ratificat"],"ratificate":"ratificat","ratificatele":"ratificat","ratificati":["ratificați","ratifica","ratificați","ratificat"],"ratificatia":"ratificație","ratificatiei":"ratificație","ratificatii":["ratificații","ratificat","ratificații","ratificație"],"ratificatiile":"ratificație","ratificatiilor":"ratificație","ratificatiunea":"ratificațiune","ratificatiuni":"ratificațiune","ratificatiunii":"ratificațiune","ratificatiunile":"ratificațiune","ratificatiunilor":"ratificațiune","ratificatul":"ratificat","ratificau":"ratifica","ratifice":"ratifica","ratifici":"ratifica","ratii":"rație","ratiile":"rație","ratiilor":"rație","ratingul":"rating","ratingule":"rating","ratingului":"rating","ratinguri":"rating","ratingurile":"rating","ratingurilor":"rating","ratinoasa":["rătinoasă","rătinos","rătinoasa","rătinos"],"ratinoase":"rătinos","ratinoasele":"rătinos","ratinosi":"rătinos","ratinosii":"rătinos","ratinosul":"rătinos","ratioare":"rătioară","ratioarei":"rătioară","ratioarele":"rătioară","ratioarelor":"rătioară","ratiocinarea":"rațiocinare","ratiocinari":"rațiocinare","ratiocinarii":"rațiocinare","ratiocinarile":"rațiocinare","ratiocinarilor":"rațiocinare","ratiocinii":"rațiociniu","ratiociniii":"rațiociniu","ratiociniilor":"rațiociniu","ratiociniuul":"rațiociniu","ratiociniuule":"rațiociniu","ratiociniuului":"rațiociniu","rationabila":["raționabilă","raționabil","raționabila","raționabil"],"rationabile":"raționabil","rationabilele":"raționabil","rationabili":"raționabil","rationabilii":"raționabil","rationabilul":"raționabil","rationai":"raționa","rationala":["rațională","rațional","raționala","rațional"],"rationale":"rațional","rationalele":"rațional","rationali":"rațional","rationalii":"rațional","rationalisme":"raționalism","rationalismele":"raționalism","rationalismelor":"raționalism","rationalismul":"raționalism","rationalismule":"raționalism","rationalismului":"raționalism","rationaliste":"raționalistă","rationalistei":"raționalistă","rationalistele":"raționalistă","rationalistelor":"raționalistă","rationalisti":"raționalist","rationalistii":"raționalist","rationalistilor":"raționalist","rationalistul":"raționalist","rationalistule":"raționalist","rationalistului":"raționalist","rationalitatea":"raționalitate","rationalitati":"raționalitate","rationalitatii":"raționalitate","rationalitatile":"raționalitate","rationalitatilor":"raționalitate","rationalizabila":["raționalizabilă","raționalizabil","raționalizabila","raționalizabil"],"rationalizabile":"raționalizabil","rationalizabilele":"raționalizabil","rationalizabili":"raționalizabil","rationalizabilii":"raționalizabil","rationalizabilul":"raționalizabil","rationalizai":"raționaliza","rationalizam":["raționalizăm","raționaliza","raționalizam","raționaliza"],"rationalizand":"raționaliza","rationalizara":"raționaliza","rationalizaram":"raționaliza","rationalizarati":"raționaliza","rationalizarea":"raționalizare","rationalizari":"raționalizare","rationalizarii":"raționalizare","rationalizarile":"raționalizare","rationalizarilor":"raționalizare","rationalizase":"raționaliza","rationalizasem":"raționaliza","rationalizasera":"raționaliza","rationalizaseram":"raționaliza","rationalizaserati":"raționaliza","rationalizasesi":"raționaliza","rationalizasi":"raționaliza","rationalizat":"raționaliza","rationalizata":["raționalizată","raționalizat","raționalizata","raționalizat"],"rationalizate":"raționalizat","rationalizatele":"raționalizat","rationalizati":["raționalizați","raționaliza","raționalizați","raționalizat"],"rationalizatii":"raționalizat","rationalizatul":"raționalizat","rationalizau":"raționaliza","rationalizeaza":"raționaliza","rationalizez":"raționaliza","rationalizezi":"raționaliza","rationalul":"rațional","rationam":["raționăm","raționa","raționam","raționa"],"rationamente":"raționament","rationamentele":"raționament","rationamentelor":"raționament","rationamentul":"raționament","rationamentule":"raționament","rationamentului":"raționament","rationand":"raționa","rationara":"raționa","rationaram":"raționa","rationarati":"raționa","rationarea":"raționare","rationari":"raționare","rationarii":"raționare","rationarile":"raționare","rationarilor":"raționare","rationase":"raționa","rationasem":"raționa","rationasera":"raționa","rationaseram":"raționa","rationaserati":"raționa","rationasesi":"raționa","rationasi":"raționa","rationat":"raționa","rationata":["raționată","raționat","raționata","raționat"],"rationate":"raționat","rationatele":"raționat","rationati":["raționați","raționa","raționați","raționat"],"rationatii":"raționat","rationatul":"raționat","rationau":"raționa","rationeaza":"raționa","rationez":"raționa","rationezi":"raționa","ratisaul":"rătișă","ratisaule":"rătișă","ratisaului":"rătișă","ratise":"rătișă","ratisele":"rătișă","ratiselor":"rătișă","ratisoare":"rățișoară","ratisoarei":"rățișoară","ratisoarele":"rățișoară","ratisoarelor":"rățișoară","ratitele":"ratite","ratitelor":"ratite","ratiunea":"rațiune","ratiuni":"rațiune","ratiunii":"rațiune","ratiunile":"rațiune","ratiunilor":"rațiune","ratoaice":"rățoaică","ratoaicei":"rățoaică","ratoaicele":"rățoaică","ratoaicelor":"rățoaică","ratoasa":["râtoasă","râtos","râtoasa","râtos"],"ratoase":"râtos","ratoasele":"râtos","ratoiasi":"rățoiaș","ratoiasii":"rățoiaș","ratoiasilor":"rățoiaș","ratoiasul":"rățoiaș","ratoiasule":"rățoiaș","ratoiasului":"rățoiaș","ratoiele":"rățoială","ratoielei":"rățoială","ratoielele":"rățoială","ratoielelor":"rățoială","ratoieli":"rățoială","ratoii":"rățoi","ratoilor":"rățoi","ratoituri":"rățoitură","ratoiturii":"rățoitură","ratoiturile":"rățoitură","ratoiturilor":"rățoitură","ratoiul":"rățoi","ratoiule":"rățoi","ratoiule daffy":"Rățoiul Daffy","ratoiule donald":"Rățoiul Donald","ratoiului":"rățoi","ratoiului daffy":"Rățoiul Daffy","ratoiului donald":"Rățoiul Donald","ratonci":"râtoncă","ratoncii":"râtoncă","ratoncile":"râtoncă","ratoncilor":"râtoncă","ratoni":"raton","ratonii":"raton","ratonilor":"raton","ratonul":"raton","ratonule":"raton","ratonului":"raton","ratose":"ratoș","ratosele":"ratoș","ratoselor":"ratoș","ratosi":"râtos","ratosii":"râtos","ratosul":["ratoșul","ratoș","râtosul","râtos"],"ratosule":"ratoș","ratosului":"ratoș","ratuci":"rățucă","ratucii":"rățucă","ratucile":"rățucă","ratucilor":"rățucă","ratuici":"rățuică","ratuicii":"rățuică","ratuicile":"rățuică","ratuicilor":"rățuică","ratuirea":"rătuire","ratuiri":"rătuire","ratuirii":"rătuire","ratuirile":"rătuire","ratuirilor":"rătuire","ratul":"rât","ratule":"rât","ratului":"rât","ratund":"rotund","ratunda":["rătundă","rătund","rătunda","rătund"],"ratunde":"rătund","ratundele":"rătund","ratundul":"rătund","ratunjea":"rătunji","ratunjeai":"rătunji","ratunjeam":"rătunji","ratunjeati":"rătunji","ratunjeau":"rătunji","ratunjesc":"rătunji","ratunjeste":"rătunji","ratunjesti":"rătunji","ratunjii":"rătunji","ratunjim":"rătunji","ratunjind":"rătunji","ratunjira":"rătunji","ratunjiram":"rătunji","ratunjirati":"rătunji","ratunjise":"rătunji","ratunjisem":"rătunji","ratunjisera":"rătunji","ratunjiseram":"rătunji","ratunjiserati":"rătunji","ratunjisesi":"rătunji","ratunjisi":"rătunji","ratunjit":"rătunji","ratunjiti":"rătunji","ratunzi":"rătund","ratunzii":"rătund","ratunzirea":"rătunzire","ratunziri":"rătunzire","ratunzirii":"rătunzire","ratunzirile":"rătunzire","ratunzirilor":"rătunzire","ratunzit":"rotunjit","ratunzita":["rătunzită","rătunzit","rătunzita","rătunzit"],"ratunzite":"rătunzit","ratunzitele":"rătunzit","ratunziti":"rătunzit","ratunzitii":"rătunzit","ratunzitul":"rătunzit","raturi":"rât","raturile":"rât","raturilor":"rât","ratuse":"ratuș","ratusele":"ratuș","ratuselor":"ratuș","ratusoare":"rățușoară","ratusoarei":"rățușoară","ratusoarele":"rățușoară","ratusoarelor":"rățușoară","ratuste":"rățușcă","ratustei":"rățușcă","ratustele":"rățușcă","ratustelor":"rățușcă","ratusul":"ratuș","ratusule":"ratuș","ratusului":"ratuș","ratutea":"rătuti","ratuteai":"rătuti","ratuteam":"rătuti","ratuteati":"rătuti","ratuteau":"rătuti","ratutesc":"rătuti","ratuteste":"rătuti","ratutesti":"rătuti","ratutii":"rătuti","ratutim":"rătuti","ratutind":"rătuti","ratutira":"rătuti","ratutiram":"rătuti","ratutirati":"rătuti","ratutise":"rătuti","ratutisem":"rătuti","ratutisera":"rătuti","ratutiseram":"rătuti","ratutiserati":"rătuti","ratutisesi":"rătuti","ratutisi":"rătuti","ratutit":"rătuti","ratutita":["rătutită","rătutit","rătutita","rătutit"],"ratutite":"rătutit","ratutitele":"rătutit","ratutiti":["rătutiți","rătuti","rătutiți","rătutit"],"ratutitii":"rătutit","ratutitul":"rătutit","ratutul":"rătuț","ratutule":"rătuț","ratutului":"rătuț","ratuturi":"rătuț","ratuturile":"rătuț","ratuturilor":"rătuț","rau intentionata":"rău intenționat","rau intentionate":"rău intenționat","rau intentionati":"rău intenționat","rau-platnica":["rău-platnică","rău-platnic","rău-platnica","rău-platnic"],"rau-platnice":["rău-platnice","rău-platnic","rău-platnice","rău-platnică"],"rau-platnicei":"rău-platnică","rau-platnicele":["rău-platnicele","rău-platnic","rău-platnicele","rău-platnică"],"rau-platnicelor":"rău-platnică","rau-platnici":"rău-platnic","rau-platnicii":"rău-platnic","rau-platnicilor":"rău-platnic","rau-platnicul":"rău-platnic","rau-platnicule":"rău-platnic","rau-platnicului":"rău-platnic","raufacatoare":"răufăcător","raufacatoarea":["răufăcătoarea","răufăcătoare","răufăcătoarea","răufăcător"],"raufacatoarei":"răufăcătoare","raufacatoarele":["răufăcătoarele","răufăcătoare","răufăcătoarele","răufăcător"],"raufacatoarelor":"răufăcătoare","raufacatori":"răufăcător","raufacatorii":"răufăcător","raufacatorilor":"răufăcător","raufacatorul":"răufăcător","raufacatorule":"răufăcător","raufacatorului":"răufăcător","raul":["râul","râu","răul","rău"],"raule":"râu","raulete":"râuleț","rauletele":"râuleț","rauletelor":"râuleț","rauletul":"râuleț","rauletule":"râuleț","rauletului":"râuleț","raului":"râu","raurai":"râura","rauram":["râurăm","râura","râuram","râura"],"raurand":"râura","raurara":"râura","rauraram":"râura","raurarati":"râura","raurase":"râura","raurasem":"râura","raurasera":"râura","rauraseram":"râura","rauraserati":"râura","raurasesi":"râura","raurasi":"râura","raurat":"râura","raurata":["râurată","râurat","râurata","râurat"],"raurate":"râurat","rauratele":"râurat","raurati":["râurați","râura","râurați","râurat"],"rauratii":"râurat","rauratul":"râurat","raurau":"râura","raurea":"râuri","raureai":"râuri","rauream":"râuri","raureana":"râurean","raureati":"râuri","raureau":"râuri","raureaza":"râura","raurele":"râurel","raurelei":"râurel","raurelelor":"râurel","raurelul":"râurel","raurelule":"râurel","raurelului":"râurel","raurene":"râurean","raureni":"râurean","rauresc":"râuri","raureste":"râuri","rauresti":"râuri","raurez":"râura","raurezi":"râura","rauri":"râu","raurii":"râuri","raurile":"râu","raurilor":"râu","raurim":"râuri","raurind":"râuri","raurira":"râuri","rauriram":"râuri","raurirati":"râuri","raurirea":"râurire","rauriri":"râurire","rauririi":"râurire","rauririle":"râurire","rauririlor":"râurire","raurise":"râuri","raurisem":"râuri","raurisera":"râuri","rauriseram":"râuri","rauriserati":"râuri","raurisesi":"râuri","raurisi":"râuri","raurit":"râuri","rauriti":"râuri","rauruste":"răuruscă","raurustei":"răuruscă","raurustele":"răuruscă","raurustelor":"răuruscă","rausoare":"râușor","rausoarele":"râușor","rausoarelor":"râușor","rausorul":"râușor","rausorule":"râușor","rausorului":"râușor","rauta":["răuță","răuț","răuța","răuț"],"rautacioasa":["răutăcioasă","răutăcios","răutăcioasa","răutăcios"],"rautacioase":"răutăcios","rautacioasele":"răutăcios","rautaciosi":"răutăcios","rautaciosii":"răutăcios","rautaciosul":"răutăcios","rautat":"răutăți","rautate":"răutăți","rautatea":["răutatea","răutate","răutățea","răutăți"],"rautateai":"răutăți","rautateam":"răutăți","rautateati":"răutăți","rautateau":"răutăți","rautati":"răutate","rautatia":"răutăție","rautatie":"răutăți","rautatiei":"răutăție","rautatii":["răutății","răutate","răutății","răutăți","răutății","răutăție"],"rautatile":"răutate","rautatilor":"răutate","rautatim":"răutăți","rautatind":"răutăți","rautatira":"răutăți","rautatiram":"răutăți","rautatirati":"răutăți","rautatise":"răutăți","rautatisem":"răutăți","rautatisera":"răutăți","rautatiseram":"răutăți","rautatiserati":"răutăți","rautatisesi":"răutăți","rautatisi":"răutăți","rautatit":"răutăți","rautatiti":"răutăți","raute":["râuțe","râuț","răuțe","răuț"],"rautele":["râuțele","râuț","răuțele","răuț"],"rautelor":"râuț","rauti":"răuț","rautii":"răuț","rautile":"răuț","rautilor":"răuț","rautul":["râuțul","râuț","răuțul","răuț"],"rautule":["râuțule","râuț","răuțule","răuț"],"rautului":["râuțului","râuț","răuțului","răuț"],"rauul":"rău","rauule":"rău","rauului":"rău","rauvoitoare":"răuvoitor","rauvoitoarea":"răuvoitor","rauvoitoarele":"răuvoitor","rauvoitori":"răuvoitor","rauvoitorii":"răuvoitor","rauvoitorul":"răuvoitor","ravacul":"ravac","ravacule":"ravac","ravacului":"ravac","ravacuri":"ravac","ravacurile":"ravac","ravacurilor":"ravac","ravagii":"ravagiu","ravagiile":"ravagiu","ravagiilor":"ravagiu","ravagiul":"ravagiu","ravagiule":"ravagiu","ravagiului":"ravagiu","ravaje":"ravaj","ravajele":"ravaj","ravajelor":"ravaj","ravajul":"ravaj","ravajule":"ravaj","ravajului":"ravaj","ravarele":"răvărel","ravarelele":"răvărel","ravarelelor":"răvărel","ravarelul":"răvărel","ravarelule":"răvărel","ravarelului":"răvărel","ravarsata":["răvărsată","răvărsat","răvărsata","răvărsat"],"ravarsate":"răvărsat","ravarsatele":"răvărsat","ravarsati":"răvărsat","ravarsatii":"răvărsat","ravarsatul":"răvărsat","ravase":"răvaș","ravasea":"răvăși","ravaseai":"răvăși","ravaseam":"răvăși","ravaseati":"răvăși","ravaseau":"răvăși","ravasele":["răvașele","răvaș","răvășele","răvășeală","răvășele","răvășel"],"ravaselei":"răvășeală","ravaselele":["răvășelele","răvășeală","răvășelele","răvășel"],"ravaselelor":["răvășelelor","răvășeală","răvășelelor","răvășel"],"ravaseli":"răvășeală","ravaselor":"răvaș","ravaselul":"răvășel","ravaselule":"răvășel","ravaselului":"răvășel","ravasesc":"răvăși","ravaseste":"răvăși","ravasesti":"răvăși","ravasii":"răvăși","ravasim":"răvăși","ravasind":"răvăși","ravasira":"răvăși","ravasiram":"răvăși","ravasirati":"răvăși","ravasise":"răvăși","ravasisem":"răvăși","ravasisera":"răvăși","ravasiseram":"răvăși","ravasiserati":"răvăși","ravasisesi":"răvăși","ravasisi":"răvăși","ravasit":"răvăși","ravasita":["răvășită","răvășit","răvășita","răvășit"],"ravasite":"răvășit","ravasitele":"răvășit","ravasiti":["răvășiți","răvăși","răvășiți","răvășit"],"ravasitii":"răvășit","ravasitul":"răvășit","ravasul":"răvaș","ravasule":"răvaș","ravasului":"răvaș","ravene":"ravenă","ravenei":"ravenă","ravenele":"ravenă","ravenelor":"ravenă","ravinele":"răvineală","ravinelei":"răvineală","ravinelele":"răvineală","ravinelelor":"răvineală","ravineli":"răvineală","ravioliul":"ravioli","ravioliule":"ravioli","ravioliului":"ravioli","ravne":"râvnă","ravnea":"râvni","ravneai":"râvni","ravneam":"râvni","ravneati":"râvni","ravneau":"râvni","ravnei":"râvnă","ravnele":"râvnă","ravnelor":"râvnă","ravnesc":"râvni","ravneste":"râvni","ravnesti":"râvni","ravnii":"râvni","ravnim":"râvni","ravnind":"râvni","ravnira":"râvni","ravniram":"râvni","ravnirati":"râvni","ravnirea":"râvnire","ravniri":"râvnire","ravnirii":"râvnire","ravnirile":"râvnire","ravnirilor":"râvnire","ravnise":"râvni","ravnisem":"râvni","ravnisera":"râvni","ravniseram":"râvni","ravniserati":"râvni","ravnisesi":"râvni","ravnisi":"râvni","ravnit":"râvni","ravnita":["râvnită","râvnit","râvnita","râvnit"],"ravnite":"râvnit","ravnitele":"râvnit","ravniti":["râvniți","râvni","râvniți","râvnit"],"ravnitii":"râvnit","ravnitoare":"râvnitor","ravnitoarea":"râvnitor","ravnitoarele":"râvnitor","ravnitori":"râvnitor","ravnitorii":"râvnitor","ravnitorul":"râvnitor","ravnitul":"râvnit","ravnoasa":["râvnoasă","râvnos","râvnoasa","râvnos"],"ravnoase":"râvnos","ravnoasele":"râvnos","ravnosi":"râvnos","ravnosii":"râvnos","ravnosul":"râvnos","raz-":"răs-","razalaie":"răzălău","razalaiele":"răzălău","razalaielor":"răzălău","razalauul":"răzălău","razalauule":"răzălău","razalauului":"răzălău","razaluia":"răzălui","razaluiai":"răzălui","razaluiam":"răzălui","razaluiati":"răzălui","razaluiau":"răzălui","razaluiele":"răzăluială","razaluielei":"răzăluială","razaluielele":"răzăluială","razaluielelor":"răzăluială","razaluieli":"răzăluială","razaluiesc":"răzălui","razaluieste":"răzălui","razaluiesti":"răzălui","razaluii":"răzălui","razaluim":"răzălui","razaluind":"răzălui","razaluira":"răzălui","razaluiram":"răzălui","razaluirati":"răzălui","razaluirea":"răzăluire","razaluiri":"răzăluire","razaluirii":"răzăluire","razaluirile":"răzăluire","razaluirilor":"răzăluire","razaluise":"răzălui","razaluisem":"răzălui","razaluisera":"răzălui","razaluiseram":"răzălui","razaluiserati":"răzălui","razaluisesi":"răzălui","razaluisi":"răzălui","razaluit":"răzălui","razaluita":["răzăluită","răzăluit","răzăluita","răzăluit"],"razaluite":"răzăluit","razaluitele":"răzăluit","razaluiti":["răzăluiți","răzălui","răzăluiți","răzăluit"],"razaluitii":"răzăluit","razaluitul":"răzăluit","razamata":["răzămată","răzămat","răzămata","răzămat"],"razamate":"răzămat","razamatele":"răzămat","razamati":"răzămat","razamatii":"răzămat","razamatul":"răzămat","razame":"razăm","razamele":"razăm","razamelor":"razăm","razamul":"razăm","razamule":"razăm","razamului":"razăm","razand":["răzând","rade","râzând","râde","răzând","răza"],"razanda":["râzândă","râzând","râzânda","râzând"],"razande":"râzând","razandele":"râzând","razandul":"râzând","razanta":["razantă","razant","razanta","razant"],"razante":["razante","razant","razanțe","razanță"],"razantei":"razanță","razantele":["razantele","razant","razanțele","razanță"],"razantelor":"razanță","razanti":"razant","razantii":"razant","razantul":"razant","razanzi":"râzând","razanzii":"râzând","razase":"răza","razaseasca":["răzășească","răzășesc","răzășeasca","răzășesc"],"razasescul":"răzășesc","razasesti":"răzășesc","razasestii":"răzășesc","razasestile":"răzășesc","razasi":["răzași","răzaș","răzăși","răzăș"],"razasia":"răzășie","razasiei":"răzășie","razasii":["răzașii","răzaș","răzășii","răzăș","răzășii","răzășie"],"razasiile":"răzășie","razasiilor":"răzășie","razasilor":["răzașilor","răzaș","răzășilor","răzăș"],"razasul":["răzașul","răzaș","răzășul","răzăș"],"razasule":["răzașule","răzaș","răzășule","răzăș"],"razasului":["răzașului","răzaș","răzășului","răzăș"],"razat":"răza","razatalul":"răzățăl","razatalule":"răzățăl","razatalului":"răzățăl","razatoare":["râzătoare","râzător","răzătoare","răzător"],"razatoarea":["răzătoarea","răzătoare","râzătoarea","râzător","răzătoarea","răzător"],"razatoarele":["râzătoarele","râzător","răzătoarele","răzător"],"razatoari":"răzătoare","razatoarii":"răzătoare","razatoarile":"răzătoare","razatoarilor":"răzătoare","razatori":["răzători","răzătoare","râzători","râzător","răzători","răzător"],"razatorii":["râzătorii","râzător","răzătorii","răzător"]};
@@ -0,0 +1 @@
+export default {"razatorul":["râzătorul","râzător","răzătorul","răzător"],"razaturi":"răzătură","razaturii":"răzătură","razaturile":"răzătură","razaturilor":"răzătură","razbaterea":"răzbatere","razbateri":"răzbatere","razbaterii":"răzbatere","razbaterile":"răzbatere","razbaterilor":"răzbatere","razbatut":"răzbate","razbea":"răzbi","razbeai":"răzbi","razbeam":"răzbi","razbeati":"răzbi","razbeau":"răzbi","razbele":"răzbel","razbelele":"răzbel","razbelelor":"răzbel","razbelul":"răzbel","razbelule":"răzbel","razbelului":"răzbel","razbesc":"răzbi","razbeste":"răzbi","razbesti":"răzbi","razbii":"răzbi","razbim":"răzbi","razbind":"răzbi","razbira":"răzbi","razbiram":"răzbi","razbirati":"răzbi","razbirea":"răzbire","razbiri":"răzbire","razbirii":"răzbire","razbise":"răzbi","razbisem":"răzbi","razbisera":"răzbi","razbiseram":"răzbi","razbiserati":"răzbi","razbisesi":"răzbi","razbisi":"răzbi","razbit":"răzbi","razbita":["răzbită","răzbit","răzbita","răzbit"],"razbite":"răzbit","razbitele":"răzbit","razbiti":["răzbiți","răzbi","răzbiți","răzbit"],"razbitii":"răzbit","razbitoare":"răzbitor","razbitoarea":"răzbitor","razbitoarele":"răzbitor","razbitori":"răzbitor","razbitorii":"răzbitor","razbitorul":"răzbitor","razbitul":"răzbit","razboaie":"război","razboaie ale nervilor":"război al nervilor","razboaie asimetrice":"război asimetric","razboaie civile":"război civil","razboaie conventionale":"război convențional","razboaie de independenta":"război de independență","razboaie de tesut":"război de țesut","razboaie de uzura":"război de uzură","razboaie mondiale":"război mondial","razboaie nucleare":"război nuclear","razboaie psihologice":"război psihologic","razboaie totale":"război total","razboaiele":"război","razboaielor":"război","razboia":"război","razboiai":"război","razboiale":"războială","razboialei":"războială","razboiam":"război","razboiasca":["războiască","războiesc","războiasca","războiesc"],"razboiase":"războiaș","razboiasele":"războiaș","razboiaselor":"războiaș","razboiasul":"războiaș","razboiasule":"războiaș","razboiasului":"războiaș","razboiati":"război","razboiau":"război","razboieli":"războială","razboiesc":"război","razboiescul":"războiesc","razboieste":"război","razboiesti":["războiești","război","războiești","războiesc"],"razboiestii":"războiesc","razboiestile":"războiesc","razboii":"război","razboim":"război","razboind":"război","razboinice":"războinică","razboiniceasca":["războinicească","războinicesc","războiniceasca","războinicesc"],"razboinicei":"războinică","razboinicele":"războinică","razboinicelor":"războinică","razboinicescul":"războinicesc","razboinicesti":"războinicesc","razboinicestii":"războinicesc","razboinicestile":"războinicesc","razboinici":"războinic","razboinicia":"războinicie","razboiniciei":"războinicie","razboinicii":["războinicii","războinic","războinicii","războinicie"],"razboiniciile":"războinicie","razboiniciilor":"războinicie","razboinicilor":"războinic","razboinicul":"războinic","razboinicule":"războinic","razboinicului":"războinic","razboira":"război","razboiram":"război","razboirati":"război","razboirea":"războire","razboiri":"războire","razboirii":"războire","razboirile":"războire","razboirilor":"războire","razboise":"război","razboisem":"război","razboisera":"război","razboiseram":"război","razboiserati":"război","razboisesi":"război","razboisi":"război","razboit":"război","razboiti":"război","razboitoare":"războitor","razboitoarea":"războitor","razboitoarele":"războitor","razboitori":"războitor","razboitorii":"războitor","razboitorul":"războitor","razboiul":"război","razboiule":"război","razboiului":"război","razbolea":"războli","razboleai":"războli","razboleam":"războli","razboleati":"războli","razboleau":"războli","razbolesc":"războli","razboleste":"războli","razbolesti":"războli","razbolii":"războli","razbolim":"războli","razbolind":"războli","razbolira":"războli","razboliram":"războli","razbolirati":"războli","razbolise":"războli","razbolisem":"războli","razbolisera":"războli","razboliseram":"războli","razboliserati":"războli","razbolisesi":"războli","razbolisi":"războli","razbolit":"războli","razbolita":["războlită","războlit","războlita","războlit"],"razbolite":"războlit","razbolitele":"războlit","razboliti":["războliți","războli","războliți","războlit"],"razbolitii":"războlit","razbolitul":"războlit","razboteaza":"războteza","razbotezai":"războteza","razbotezam":["războtezăm","războteza","războtezam","războteza"],"razbotezand":"războteza","razbotezara":"războteza","razbotezaram":"războteza","razbotezarati":"războteza","razbotezase":"războteza","razbotezasem":"războteza","razbotezasera":"războteza","razbotezaseram":"războteza","razbotezaserati":"războteza","razbotezasesi":"războteza","razbotezasi":"războteza","razbotezat":"războteza","razbotezati":"războteza","razbotezau":"războteza","razbotezeaza":"războteza","razbotezez":"războteza","razbotezezi":"războteza","razbucuroasa":["răzbucuroasă","răzbucuros","răzbucuroasa","răzbucuros"],"razbucuroase":"răzbucuros","razbucuroasele":"răzbucuros","razbucurosi":"răzbucuros","razbucurosii":"răzbucuros","razbucurosul":"răzbucuros","razbun":"răzbuna","razbunai":"răzbuna","razbunam":["răzbunăm","răzbuna","răzbunam","răzbuna"],"razbunand":"răzbuna","razbunara":"răzbuna","razbunaram":"răzbuna","razbunarati":"răzbuna","razbunarea":"răzbunare","razbunari":"răzbunare","razbunarii":"răzbunare","razbunarile":"răzbunare","razbunarilor":"răzbunare","razbunase":"răzbuna","razbunasem":"răzbuna","razbunasera":"răzbuna","razbunaseram":"răzbuna","razbunaserati":"răzbuna","razbunasesi":"răzbuna","razbunasi":"răzbuna","razbunat":"răzbuna","razbunata":["răzbunată","răzbunat","răzbunata","răzbunat"],"razbunate":"răzbunat","razbunatele":"răzbunat","razbunati":["răzbunați","răzbuna","răzbunați","răzbunat"],"razbunatii":"răzbunat","razbunatoare":"răzbunător","razbunatoarea":"răzbunător","razbunatoarele":"răzbunător","razbunatori":"răzbunător","razbunatorii":"răzbunător","razbunatorul":"răzbunător","razbunatul":"răzbunat","razbunau":"răzbuna","razbuni":"răzbuna","razbunici":["răzbunici","răzbunic","răzbunici","răzbunică"],"razbunicii":["răzbunicii","răzbunic","răzbunicii","răzbunică"],"razbunicile":"răzbunică","razbunicilor":["răzbunicilor","răzbunic","răzbunicilor","răzbunică"],"razbunicul":"răzbunic","razbunicule":"răzbunic","razbunicului":"răzbunic","razbunul":"răzbun","razbunule":"răzbun","razbunului":"răzbun","razdania":"răzdanie","razdaniei":"răzdanie","razdanii":"răzdanie","razdaniile":"răzdanie","razdaniilor":"răzdanie","razdrusea":"răzdruși","razdruseai":"răzdruși","razdruseam":"răzdruși","razdruseati":"răzdruși","razdruseau":"răzdruși","razdrusesc":"răzdruși","razdruseste":"răzdruși","razdrusesti":"răzdruși","razdrusii":"răzdruși","razdrusim":"răzdruși","razdrusind":"răzdruși","razdrusira":"răzdruși","razdrusiram":"răzdruși","razdrusirati":"răzdruși","razdrusise":"răzdruși","razdrusisem":"răzdruși","razdrusisera":"răzdruși","razdrusiseram":"răzdruși","razdrusiserati":"răzdruși","razdrusisesi":"răzdruși","razdrusisi":"răzdruși","razdrusit":"răzdruși","razdrusiti":"răzdruși","raze":"rază","razea":"răzi","razeai":"răzi","razeam":"răzi","razeati":"răzi","razeau":"răzi","razei":"rază","razele":"rază","razelor":"rază","razeme":"razem","razemele":"razem","razemelor":"razem","razemul":"razem","razemule":"razem","razemului":"razem","razesc":"răzi","razeseasca":["răzeșească","răzeșesc","răzeșeasca","răzeșesc"],"razesescul":"răzeșesc","razesesti":"răzeșesc","razesestii":"răzeșesc","razesestile":"răzeșesc","razesi":"răzeș","razesia":"răzeșie","razesiei":"răzeșie","razesii":["răzeșii","răzeș","răzeșii","răzeșie"],"razesiile":"răzeșie","razesiilor":"răzeșie","razesilor":"răzeș","razesimea":"răzeșime","razesimi":"răzeșime","razesimii":"răzeșime","razesite":"răzeșiță","razesitei":"răzeșiță","razesitele":"răzeșiță","razesitelor":"răzeșiță","razeste":"răzi","razesti":"răzi","razesul":"răzeș","razesule":"răzeș","razesului":"răzeș","razgai":["râzgâi","râzgâia","răzgâi","răzgâia"],"razgaiai":["râzgâiai","râzgâia","răzgâiai","răzgâia"],"razgaiam":["râzgâiam","râzgâia","răzgâiam","răzgâia"],"razgaiara":["râzgâiară","râzgâia","răzgâiară","răzgâia"],"razgaiaram":["râzgâiarăm","râzgâia","răzgâiarăm","răzgâia"],"razgaiarati":["râzgâiarăți","râzgâia","răzgâiarăți","răzgâia"],"razgaiase":["râzgâiase","râzgâia","răzgâiase","răzgâia"],"razgaiasem":["râzgâiasem","râzgâia","răzgâiasem","răzgâia"],"razgaiasera":["râzgâiaseră","râzgâia","răzgâiaseră","răzgâia"],"razgaiaseram":["râzgâiaserăm","râzgâia","răzgâiaserăm","răzgâia"],"razgaiaserati":["râzgâiaserăți","râzgâia","răzgâiaserăți","răzgâia"],"razgaiasesi":["râzgâiaseși","râzgâia","răzgâiaseși","răzgâia"],"razgaiasi":["râzgâiași","râzgâia","răzgâiași","răzgâia"],"razgaiat":["râzgâiat","râzgâia","răzgâiat","răzgâia"],"razgaiata":["râzgâiată","râzgâiat","râzgâiata","râzgâiat","răzgâiată","răzgâiat","răzgâiata","răzgâiat"],"razgaiate":["râzgâiate","râzgâiat","răzgâiate","răzgâiat"],"razgaiatele":["râzgâiatele","râzgâiat","răzgâiatele","răzgâiat"],"razgaiati":["râzgâiați","râzgâia","răzgâiați","răzgâia","râzgâiați","râzgâiat","răzgâiați","răzgâiat"],"razgaiatii":["râzgâiații","râzgâiat","răzgâiații","răzgâiat"],"razgaiatul":["râzgâiatul","râzgâiat","răzgâiatul","răzgâiat"],"razgaiau":["râzgâiau","râzgâia","răzgâiau","răzgâia"],"razgaie":["râzgâie","râzgâia","răzgâie","răzgâia"],"razgaiele":["râzgâiele","râzgâială","răzgâiele","răzgâială"],"razgaielei":["râzgâielei","râzgâială","răzgâielei","răzgâială"],"razgaielele":["râzgâielele","râzgâială","răzgâielele","răzgâială"],"razgaielelor":["râzgâielelor","râzgâială","răzgâielelor","răzgâială"],"razgaieli":["râzgâieli","râzgâială","răzgâieli","răzgâială"],"razgaiem":["râzgâiem","râzgâia","răzgâiem","răzgâia"],"razgaierea":"râzgâiere","razgaieri":"râzgâiere","razgaierii":"râzgâiere","razgaierile":"râzgâiere","razgaierilor":"râzgâiere","razgaind":["râzgâind","râzgâia","răzgâind","răzgâia"],"razgandaci":"răzgândac","razgandacii":"răzgândac","razgandacilor":"răzgândac","razgandacul":"răzgândac","razgandacule":"răzgândac","razgandacului":"răzgândac","razgandea":"răzgândi","razgandeai":"răzgândi","razgandeam":"răzgândi","razgandeati":"răzgândi","razgandeau":"răzgândi","razgandesc":"răzgândi","razgandeste":"răzgândi","razgandesti":"răzgândi","razgandii":"răzgândi","razgandim":"răzgândi","razgandind":"răzgândi","razgandira":"răzgândi","razgandiram":"răzgândi","razgandirati":"răzgândi","razgandirea":"răzgândire","razgandiri":"răzgândire","razgandirii":"răzgândire","razgandirile":"răzgândire","razgandirilor":"răzgândire","razgandise":"răzgândi","razgandisem":"răzgândi","razgandisera":"răzgândi","razgandiseram":"răzgândi","razgandiserati":"răzgândi","razgandisesi":"răzgândi","razgandisi":"răzgândi","razgandit":"răzgândi","razganditi":"răzgândi","razi":["razi","rade","râzi","râde"],"razia":"razie","raziei":"razie","razii":["răzii","răzi","razii","razie"],"raziile":"razie","raziilor":"razie","raziletul":"răzilet","raziletule":"răzilet","raziletului":"răzilet","razileturi":"răzilet","razileturile":"răzilet","razileturilor":"răzilet","razim":["răzim","răzi","răzim","răzima"],"razimai":"răzima","razimam":["răzimăm","răzima","răzimam","răzima"],"razimand":"răzima","razimara":"răzima","razimaram":"răzima","razimarati":"răzima","razimare":"răzimar","razimarei":"răzimar","razimarelor":"răzimar","razimarul":"răzimar","razimarule":"răzimar","razimarului":"răzimar","razimase":"răzima","razimasem":"răzima","razimasera":"răzima","razimaseram":"răzima","razimaserati":"răzima","razimasesi":"răzima","razimasi":"răzima","razimat":"răzima","razimata":["răzimată","răzimat","răzimata","răzimat"],"razimate":"răzimat","razimatele":"răzimat","razimati":["răzimați","răzima","răzimați","răzimat"],"razimatii":"răzimat","razimatoarea":"răzimătoare","razimatori":"răzimătoare","razimatorii":"răzimătoare","razimatorile":"răzimătoare","razimatorilor":"răzimătoare","razimatul":"răzimat","razimau":"răzima","razimi":"răzima","razind":"răzi","razira":"răzi","raziram":"răzi","razirati":"răzi","razise":"răzi","razisem":"răzi","razisera":"răzi","raziseram":"răzi","raziserati":"răzi","razisesi":"răzi","razisi":"răzi","razisoare":"răzișoară","razisoarei":"răzișoară","razisoarele":"răzișoară","razisoarelor":"răzișoară","razit":"răzi","raziti":"răzi","razleata":["răzleață","răzleț","răzleața","răzleț"],"razlete":"răzleț","razletea":"răzleți","razleteai":"răzleți","razleteam":"răzleți","razleteati":"răzleți","razleteau":"răzleți","razletele":"răzleț","razletesc":"răzleți","razleteste":"răzleți","razletesti":"răzleți","razleti":"răzleț","razletii":["răzleții","răzleț","răzleții","răzleți"],"razletim":"răzleți","razletind":"răzleți","razletira":"răzleți","razletiram":"răzleți","razletirati":"răzleți","razletirea":"răzlețire","razletiri":"răzlețire","razletirii":"răzlețire","razletirile":"răzlețire","razletirilor":"răzlețire","razletise":"răzleți","razletisem":"răzleți","razletisera":"răzleți","razletiseram":"răzleți","razletiserati":"răzleți","razletisesi":"răzleți","razletisi":"răzleți","razletit":"răzleți","razletita":["răzlețită","răzlețit","răzlețita","răzlețit"],"razletite":"răzlețit","razletitele":"răzlețit","razletiti":["răzlețiți","răzleți","răzlețiți","răzlețit"],"razletitii":"răzlețit","razletitul":"răzlețit","razletul":"răzleț","razmame":"răzmamă","razmamei":"răzmamă","razmamele":"răzmamă","razmamelor":"răzmamă","razmata":["răzmată","răzmat","răzmata","răzmat"],"razmate":"răzmat","razmatele":"răzmat","razmati":"răzmat","razmatii":"răzmat","razmatul":"răzmat","razmerite":"răzmeriță","razmeritei":"răzmeriță","razmeritele":"răzmeriță","razmeritelor":"răzmeriță","razmirite":"răzmiriță","razmiritei":"răzmiriță","razmiritele":"răzmiriță","razmiritelor":"răzmiriță","razmotul":"razmot","razmotule":"razmot","razmotului":"razmot","raznari":"râznar","raznarii":"râznar","raznarilor":"râznar","raznarul":"râznar","raznarule":"râznar","raznarului":"râznar","raznea":"răzni","razneai":"răzni","razneam":"răzni","razneati":"răzni","razneau":"răzni","raznepoti":"răznepot","raznepotii":"răznepot","raznepotilor":"răznepot","raznepotul":"răznepot","raznepotule":"răznepot","raznepotului":"răznepot","raznesc":"răzni","razneste":"răzni","raznesti":"răzni","raznii":"răzni","raznim":"răzni","raznind":"răzni","raznira":"răzni","razniram":"răzni","raznirati":"răzni","raznise":"răzni","raznisem":"răzni","raznisera":"răzni","razniseram":"răzni","razniserati":"răzni","raznisesi":"răzni","raznisi":"răzni","raznit":"răzni","razniti":"răzni","raznocintiul":"raznocinți","raznocintiule":"raznocinți","raznocintiului":"raznocinți","raznute":"râznuță","raznutei":"râznuță","raznutele":"râznuță","raznutelor":"râznuță","razoare":"răzor","razoarele":"răzor","razoarelor":"răzor","razorasi":"răzoraș","razorasii":"răzoraș","razorasilor":"răzoraș","razorasul":"răzoraș","razorasule":"răzoraș","razorasului":"răzoraș","razorea":"răzori","razoreai":"răzori","razoream":"răzori","razoreati":"răzori","razoreau":"răzori","razorele":"răzorel","razorelele":"răzorel","razorelelor":"răzorel","razorelul":"răzorel","razorelule":"răzorel","razorelului":"răzorel","razoresc":"răzori","razoreste":"răzori","razoresti":"răzori","razorii":"răzori","razorim":"răzori","razorind":"răzori","razorira":"răzori","razoriram":"răzori","razorirati":"răzori","razorise":"răzori","razorisem":"răzori","razorisera":"răzori","razoriseram":"răzori","razoriserati":"răzori","razorisesi":"răzori","razorisi":"răzori","razorit":"răzori","razoriti":"răzori","razorul":"răzor","razorule":"răzor","razorului":"răzor","razuia":"răzui","razuiai":"răzui","razuiam":"răzui","razuiati":"răzui","razuiau":"răzui","razuieli":"răzuială","razuielii":"răzuială","razuielile":"răzuială","razuielilor":"răzuială","razuiesc":"răzui","razuieste":"răzui","razuiesti":"răzui","razuii":"răzui","razuim":"răzui","razuind":"răzui","razuira":"răzui","razuiram":"răzui","razuirati":"răzui","razuirea":"răzuire","razuiri":"răzuire","razuirii":"răzuire","razuirile":"răzuire","razuirilor":"răzuire","razuise":"răzui","razuisem":"răzui","razuisera":"răzui","razuiseram":"răzui","razuiserati":"răzui","razuisesi":"răzui","razuisi":"răzui","razuit":"răzui","razuita":["răzuită","răzuit","răzuita","răzuit"],"razuite":"răzuit","razuitele":"răzuit","razuiti":["răzuiți","răzui","răzuiți","răzuit"],"razuitii":"răzuit","razuitoare":"răzuitor","razuitoarea":"răzuitoare","razuitoarele":"răzuitor","razuitoarelor":"răzuitor","razuitori":"răzuitoare","razuitorii":"răzuitoare","razuitorile":"răzuitoare","razuitorilor":"răzuitoare","razuitorul":"răzuitor","razuitorule":"răzuitor","razuitorului":"răzuitor","razuitul":"răzuit","razuituri":"răzuitură","razuiturii":"răzuitură","razuiturile":"răzuitură","razuiturilor":"răzuitură","razvale":"răzvală","razveche":"răzvechi","razvechea":"răzvechi","razvechele":"răzvechi","razvechii":"răzvechi","razvechiul":"răzvechi","razvestea":"răzvesti","razvesteai":"răzvesti","razvesteam":"răzvesti","razvesteati":"răzvesti","razvesteau":"răzvesti","razvestesc":"răzvesti","razvesteste":"răzvesti","razvestesti":"răzvesti","razvestii":"răzvesti","razvestim":"răzvesti","razvestind":"răzvesti","razvestira":"răzvesti","razvestiram":"răzvesti","razvestirati":"răzvesti","razvestise":"răzvesti","razvestisem":"răzvesti","razvestisera":"răzvesti","razvestiseram":"răzvesti","razvestiserati":"răzvesti","razvestisesi":"răzvesti","razvestisi":"răzvesti","razvestit":"răzvesti","razvestiti":"răzvesti","razvratea":"răzvrăti","razvrateai":"răzvrăti","razvrateam":"răzvrăti","razvrateati":"răzvrăti","razvrateau":"răzvrăti","razvratesc":"răzvrăti","razvrateste":"răzvrăti","razvratesti":"răzvrăti","razvratii":"răzvrăti","razvratim":"răzvrăti","razvratind":"răzvrăti","razvratira":"răzvrăti","razvratiram":"răzvrăti","razvratirati":"răzvrăti","razvratirea":"răzvrătire","razvratiri":"răzvrătire","razvratirii":"răzvrătire","razvratirile":"răzvrătire","razvratirilor":"răzvrătire","razvratise":"răzvrăti","razvratisem":"răzvrăti","razvratisera":"răzvrăti","razvratiseram":"răzvrăti","razvratiserati":"răzvrăti","razvratisesi":"răzvrăti","razvratisi":"răzvrăti","razvratit":"răzvrăti","razvratita":["răzvrătită","răzvrătit","răzvrătita","răzvrătit"],"razvratite":"răzvrătit","razvratitele":"răzvrătit","razvratiti":["răzvrătiți","răzvrăti","răzvrătiți","răzvrătit"],"razvratitii":"răzvrătit","razvratitoarea":"răzvrătitoare","razvratitoarei":"răzvrătitoare","razvratitoarele":"răzvrătitoare","razvratitoarelor":"răzvrătitoare","razvratitori":"răzvrătitor","razvratitorii":"răzvrătitor","razvratitorilor":"răzvrătitor","razvratitorul":"răzvrătitor","razvratitorule":"răzvrătitor","razvratitorului":"răzvrătitor","razvratitul":"răzvrătit","rea":"rău","rea-credinte":"rea-credință","rea-credintei":"rea-credință","reabilitai":"reabilita","reabilitam":["reabilităm","reabilita","reabilitam","reabilita"],"reabilitand":"reabilita","reabilitara":"reabilita","reabilitaram":"reabilita","reabilitarati":"reabilita","reabilitarea":"reabilitare","reabilitari":"reabilitare","reabilitarii":"reabilitare","reabilitarile":"reabilitare","reabilitarilor":"reabilitare","reabilitase":"reabilita","reabilitasem":"reabilita","reabilitasera":"reabilita","reabilitaseram":"reabilita","reabilitaserati":"reabilita","reabilitasesi":"reabilita","reabilitasi":"reabilita","reabilitat":"reabilita","reabilitata":["reabilitată","reabilitat","reabilitata","reabilitat"],"reabilitate":"reabilitat","reabilitatele":"reabilitat","reabilitati":["reabilitați","reabilita","reabilitați","reabilitat"],"reabilitatia":"reabilitație","reabilitatiei":"reabilitație","reabilitatii":["reabilitații","reabilitat","reabilitații","reabilitație"],"reabilitatiile":"reabilitație","reabilitatiilor":"reabilitație","reabilitatul":"reabilitat","reabilitau":"reabilita","reabiliteaza":"reabilita","reabilitez":"reabilita","reabilitezi":"reabilita","reabonai":"reabona","reabonam":["reabonăm","reabona","reabonam","reabona"],"reabonand":"reabona","reabonara":"reabona","reabonaram":"reabona","reabonarati":"reabona","reabonarea":"reabonare","reabonari":"reabonare","reabonarii":"reabonare","reabonarile":"reabonare","reabonarilor":"reabonare","reabonase":"reabona","reabonasem":"reabona","reabonasera":"reabona","reabonaseram":"reabona","reabonaserati":"reabona","reabonasesi":"reabona","reabonasi":"reabona","reabonat":"reabona","reabonata":["reabonată","reabonat","reabonata","reabonat"],"reabonate":"reabonat","reabonatele":"reabonat","reabonati":["reabonați","reabona","reabonați","reabonat"],"reabonatii":"reabonat","reabonatul":"reabonat","reabonau":"reabona","reaboneaza":"reabona","reabonez":"reabona","reabonezi":"reabona","reabordai":"reaborda","reabordam":["reabordăm","reaborda","reabordam","reaborda"],"reabordand":"reaborda","reabordara":"reaborda","reabordaram":"reaborda","reabordarati":"reaborda","reabordarea":"reabordare","reabordari":"reabordare","reabordarii":"reabordare","reabordarile":"reabordare","reabordarilor":"reabordare","reabordase":"reaborda","reabordasem":"reaborda","reabordasera":"reaborda","reabordaseram":"reaborda","reabordaserati":"reaborda","reabordasesi":"reaborda","reabordasi":"reaborda","reabordat":"reaborda","reabordata":["reabordată","reabordat","reabordata","reabordat"],"reabordate":"reabordat","reabordatele":"reabordat","reabordati":["reabordați","reaborda","reabordați","reabordat"],"reabordatii":"reabordat","reabordatul":"reabordat","reabordau":"reaborda","reabordeaza":"reaborda","reabordez":"reaborda","reabordezi":"reaborda","reaclimatizai":"reaclimatiza","reaclimatizam":["reaclimatizăm","reaclimatiza","reaclimatizam","reaclimatiza"],"reaclimatizand":"reaclimatiza","reaclimatizara":"reaclimatiza","reaclimatizaram":"reaclimatiza","reaclimatizarati":"reaclimatiza","reaclimatizarea":"reaclimatizare","reaclimatizari":"reaclimatizare","reaclimatizarii":"reaclimatizare","reaclimatizarile":"reaclimatizare","reaclimatizarilor":"reaclimatizare","reaclimatizase":"reaclimatiza","reaclimatizasem":"reaclimatiza","reaclimatizasera":"reaclimatiza","reaclimatizaseram":"reaclimatiza","reaclimatizaserati":"reaclimatiza","reaclimatizasesi":"reaclimatiza","reaclimatizasi":"reaclimatiza","reaclimatizat":"reaclimatiza","reaclimatizata":["reaclimatizată","reaclimatizat","reaclimatizata","reaclimatizat"],"reaclimatizate":"reaclimatizat","reaclimatizatele":"reaclimatizat","reaclimatizati":["reaclimatizați","reaclimatiza","reaclimatizați","reaclimatizat"],"reaclimatizatii":"reaclimatizat","reaclimatizatul":"reaclimatizat","reaclimatizau":"reaclimatiza","reaclimatizeaza":"reaclimatiza","reaclimatizez":"reaclimatiza","reaclimatizezi":"reaclimatiza","reacopare":"reacoperi","reacoper":"reacoperi","reacopere":"reacoperi","reacoperea":"reacoperi","reacopereai":"reacoperi","reacopeream":"reacoperi","reacopereati":"reacoperi","reacopereau":"reacoperi","reacoperii":"reacoperi","reacoperim":"reacoperi","reacoperind":"reacoperi","reacoperira":"reacoperi","reacoperiram":"reacoperi","reacoperirati":"reacoperi","reacoperirea":"reacoperire","reacoperiri":"reacoperire","reacoperirii":"reacoperire","reacoperirile":"reacoperire","reacoperirilor":"reacoperire","reacoperise":"reacoperi","reacoperisem":"reacoperi","reacoperisera":"reacoperi","reacoperiseram":"reacoperi","reacoperiserati":"reacoperi","reacoperisesi":"reacoperi","reacoperisi":"reacoperi","reacoperit":"reacoperi","reacoperita":["reacoperită","reacoperit","reacoperita","reacoperit"],"reacoperite":"reacoperit","reacoperitele":"reacoperit","reacoperiti":["reacoperiți","reacoperi","reacoperiți","reacoperit"],"reacoperitii":"reacoperit","reacoperitul":"reacoperit","reacord":"reacorda","reacordai":"reacorda","reacordam":["reacordăm","reacorda","reacordam","reacorda"],"reacordand":"reacorda","reacordara":"reacorda","reacordaram":"reacorda","reacordarati":"reacorda","reacordase":"reacorda","reacordasem":"reacorda","reacordasera":"reacorda","reacordaseram":"reacorda","reacordaserati":"reacorda","reacordasesi":"reacorda","reacordasi":"reacorda","reacordat":"reacorda","reacordata":["reacordată","reacordat","reacordata","reacordat"],"reacordate":"reacordat","reacordatele":"reacordat","reacordati":["reacordați","reacorda","reacordați","reacordat"],"reacordatii":"reacordat","reacordatul":"reacordat","reacordau":"reacorda","reacorzi":"reacorda","reactante":"reactanță","reactantei":"reactanță","reactantele":"reactanță","reactantelor":"reactanță","reactanti":"reactant","reactantii":"reactant","reactantilor":"reactant","reactantul":"reactant","reactantule":"reactant","reactantului":"reactant","reactia":"reacție","reactiei":"reacție","reactii":"reacție","reactii chimice":"reacție chimică","reactii de aditie":"reacție de adiție","reactii de condensare":"reacție de condensare","reactii fotochimice":"reacție fotochimică","reactii in lant":"reacție în lanț","reactii nucleare":"reacție nucleară","reactiile":"reacție","reactiilor":"reacție","reactionai":"reacționa","reactionala":["reacțională","reacțional","reacționala","reacțional"],"reactionale":"reacțional","reactionalele":"reacțional","reactionali":"reacțional","reactionalii":"reacțional","reactionalul":"reacțional","reactionam":["reacționăm","reacționa","reacționam","reacționa"],"reactionand":"reacționa","reactionara":["reacționară","reacționa","reacționară","reacționar","reacționara","reacționar"],"reactionaram":"reacționa","reactionarati":"reacționa","reactionare":"reacționar","reactionarea":"reacționare","reactionarele":"reacționar","reactionari":["reacționari","reacționar","reacționări","reacționare"],"reactionarii":["reacționarii","reacționar","reacționării","reacționare"],"reactionarile":"reacționare","reactionarilor":"reacționare","reactionarisme":"reacționarism","reactionarismele":"reacționarism","reactionarismelor":"reacționarism","reactionarismul":"reacționarism","reactionarismule":"reacționarism","reactionarismului":"reacționarism","reactionarul":"reacționar","reactionase":"reacționa","reactionasem":"reacționa","reactionasera":"reacționa","reactionaseram":"reacționa","reactionaserati":"reacționa","reactionasesi":"reacționa","reactionasi":"reacționa","reactionat":"reacționa","reactionati":"reacționa","reactionau":"reacționa","reactioneaza":"reacționa","reactionez":"reacționa","reactionezi":"reacționa","reactiunea":"reacțiune","reactiuni":"reacțiune","reactiunii":"reacțiune","reactiunile":"reacțiune","reactiunilor":"reacțiune","reactivai":"reactiva","reactivam":["reactivăm","reactiva","reactivam","reactiva"],"reactivand":"reactiva","reactivara":"reactiva","reactivaram":"reactiva","reactivarati":"reactiva","reactivarea":"reactivare","reactivari":"reactivare","reactivarii":"reactivare","reactivarile":"reactivare","reactivarilor":"reactivare","reactivase":"reactiva","reactivasem":"reactiva","reactivasera":"reactiva","reactivaseram":"reactiva","reactivaserati":"reactiva","reactivasesi":"reactiva","reactivasi":"reactiva","reactivat":"reactiva","reactivati":"reactiva","reactivau":"reactiva","reactiveaza":"reactiva","reactivez":"reactiva","reactivezi":"reactiva","reactivi":"reactiv","reactivii":"reactiv","reactivilor":"reactiv","reactivitatea":"reactivitate","reactivitati":"reactivitate","reactivitatii":"reactivitate","reactivitatile":"reactivitate","reactivitatilor":"reactivitate","reactivul":"reactiv","reactivule":"reactiv","reactivului":"reactiv","reactoare":"reactor","reactoare de fuziune":"reactor de fuziune","reactoare nucleare":"reactor nuclear","reactoarele":"reactor","reactoarelor":"reactor","reactorul":"reactor","reactorule":"reactor","reactorului":"reactor","reactualizai":"reactualiza","reactualizam":["reactualizăm","reactualiza","reactualizam","reactualiza"],"reactualizand":"reactualiza","reactualizara":"reactualiza","reactualizaram":"reactualiza","reactualizarati":"reactualiza","reactualizarea":"reactualizare","reactualizari":"reactualizare","reactualizarii":"reactualizare","reactualizarile":"reactualizare","reactualizarilor":"reactualizare","reactualizase":"reactualiza","reactualizasem":"reactualiza","reactualizasera":"reactualiza","reactualizaseram":"reactualiza","reactualizaserati":"reactualiza","reactualizasesi":"reactualiza","reactualizasi":"reactualiza","reactualizat":"reactualiza","reactualizati":"reactualiza","reactualizau":"reactualiza","reactualizeaza":"reactualiza","reactualizez":"reactualiza","reactualizezi":"reactualiza","reacumulai":"reacumula","reacumulam":["reacumulăm","reacumula","reacumulam","reacumula"],"reacumuland":"reacumula","reacumulara":"reacumula","reacumularam":"reacumula","reacumularati":"reacumula","reacumularea":"reacumulare","reacumulari":"reacumulare","reacumularii":"reacumulare","reacumularile":"reacumulare","reacumularilor":"reacumulare","reacumulase":"reacumula","reacumulasem":"reacumula","reacumulasera":"reacumula","reacumulaseram":"reacumula","reacumulaserati":"reacumula","reacumulasesi":"reacumula","reacumulasi":"reacumula","reacumulat":"reacumula","reacumulati":"reacumula","reacumulau":"reacumula","reacumuleaza":"reacumula","reacumulez":"reacumula","reacumulezi":"reacumula","readaptai":"readapta","readaptam":["readaptăm","readapta","readaptam","readapta"],"readaptand":"readapta","readaptara":"readapta","readaptaram":"readapta","readaptarati":"readapta","readaptarea":"readaptare","readaptari":"readaptare","readaptarii":"readaptare","readaptarile":"readaptare","readaptarilor":"readaptare","readaptase":"readapta","readaptasem":"readapta","readaptasera":"readapta","readaptaseram":"readapta","readaptaserati":"readapta","readaptasesi":"readapta","readaptasi":"readapta","readaptat":"readapta","readaptati":"readapta","readaptau":"readapta","readapteaza":"readapta","readaptez":"readapta","readaptezi":"readapta","readmis":"readmite","readmise":"readmite","readmisei":"readmite","readmisera":"readmite","readmiseram":"readmite","readmiserati":"readmite","readmisese":"readmite","readmisesem":"readmite","readmisesera":"readmite","readmiseseram":"readmite","readmiseserati":"readmite","readmisesesi":"readmite","readmisesi":"readmite","readmisia":"readmisie","readmisiei":"readmisie","readmisii":"readmisie","readmisiile":"readmisie","readmisiilor":"readmisie","readmit":"readmite","readmita":"readmite","readmitand":"readmite","readmitea":"readmite","readmiteai":"readmite","readmiteam":"readmite","readmiteati":"readmite","readmiteau":"readmite","readmitem":"readmite","readmiterea":"readmitere","readmiteri":"readmitere","readmiterii":"readmitere","readmiterile":"readmitere","readmiterilor":"readmitere","readmiteti":"readmite","readmiti":"readmite","readmonestai":"readmonesta","readmonestam":["readmonestăm","readmonesta","readmonestam","readmonesta"],"readmonestand":"readmonesta","readmonestara":"readmonesta","readmonestaram":"readmonesta","readmonestarati":"readmonesta","readmonestarea":"readmonestare","readmonestari":"readmonestare","readmonestarii":"readmonestare","readmonestarile":"readmonestare","readmonestarilor":"readmonestare","readmonestase":"readmonesta","readmonestasem":"readmonesta","readmonestasera":"readmonesta","readmonestaseram":"readmonesta","readmonestaserati":"readmonesta","readmonestasesi":"readmonesta","readmonestasi":"readmonesta","readmonestat":"readmonesta","readmonestati":"readmonesta","readmonestau":"readmonesta","readmonesteaza":"readmonesta","readmonestez":"readmonesta","readmonestezi":"readmonesta","readorm":"readormi","readorme":"readormi","readormea":"readormi","readormeai":"readormi","readormeam":"readormi","readormeati":"readormi","readormeau":"readormi","readormii":"readormi","readormim":"readormi","readormind":"readormi","readormira":"readormi","readormiram":"readormi","readormirati":"readormi","readormise":"readormi","readormisem":"readormi","readormisera":"readormi","readormiseram":"readormi","readormiserati":"readormi","readormisesi":"readormi","readormisi":"readormi","readormit":"readormi","readormiti":"readormi","readuc":"readuce","readuca":"readuce","readucand":"readuce","readucea":"readuce","readuceai":"readuce","readuceam":"readuce","readuceati":"readuce","readuceau":"readuce","readucem":"readuce","readucerea":"readucere","readuceri":"readucere","readucerii":"readucere","readucerile":"readucere","readucerilor":"readucere","readuceti":"readuce","readuci":"readuce","readun":"readuna","readunai":"readuna","readunam":["readunăm","readuna","readunam","readuna"],"readunand":"readuna","readunara":"readuna","readunaram":"readuna","readunarati":"readuna","readunarea":"readunare","readunari":"readunare","readunarii":"readunare","readunarile":"readunare","readunarilor":"readunare","readunase":"readuna","readunasem":"readuna","readunasera":"readuna","readunaseram":"readuna","readunaserati":"readuna","readunasesi":"readuna","readunasi":"readuna","readunat":"readuna","readunati":"readuna","readunau":"readuna","readuni":"readuna","readus":"readuce","readuse":"readuce","readusei":"readuce","readusera":"readuce","readuseram":"readuce","readuserati":"readuce","readusese":"readuce","readusesem":"readuce","readusesera":"readuce","readuseseram":"readuce","readuseserati":"readuce","readusesesi":"readuce","readusesi":"readuce","reaerisea":"reaerisi","reaeriseai":"reaerisi","reaeriseam":"reaerisi","reaeriseati":"reaerisi","reaeriseau":"reaerisi","reaerisesc":"reaerisi","reaeriseste":"reaerisi","reaerisesti":"reaerisi","reaerisii":"reaerisi","reaerisim":"reaerisi","reaerisind":"reaerisi","reaerisira":"reaerisi","reaerisiram":"reaerisi","reaerisirati":"reaerisi","reaerisirea":"reaerisire","reaerisiri":"reaerisire","reaerisirii":"reaerisire","reaerisirile":"reaerisire","reaerisirilor":"reaerisire","reaerisise":"reaerisi","reaerisisem":"reaerisi","reaerisisera":"reaerisi","reaerisiseram":"reaerisi","reaerisiserati":"reaerisi","reaerisisesi":"reaerisi","reaerisisi":"reaerisi","reaerisit":"reaerisi","reaerisita":["reaerisită","reaerisit","reaerisita","reaerisit"],"reaerisite":"reaerisit","reaerisitele":"reaerisit","reaerisiti":["reaerisiți","reaerisi","reaerisiți","reaerisit"],"reaerisitii":"reaerisit","reaerisitul":"reaerisit","reafirm":"reafirma","reafirmai":"reafirma","reafirmam":["reafirmăm","reafirma","reafirmam","reafirma"],"reafirmand":"reafirma","reafirmara":"reafirma","reafirmaram":"reafirma","reafirmarati":"reafirma","reafirmarea":"reafirmare","reafirmari":"reafirmare","reafirmarii":"reafirmare","reafirmarile":"reafirmare","reafirmarilor":"reafirmare","reafirmase":"reafirma","reafirmasem":"reafirma","reafirmasera":"reafirma","reafirmaseram":"reafirma","reafirmaserati":"reafirma","reafirmasesi":"reafirma","reafirmasi":"reafirma","reafirmat":"reafirma","reafirmati":"reafirma","reafirmau":"reafirma","reafirme":"reafirma","reafirmi":"reafirma","reaflai":"reafla","reaflam":["reaflăm","reafla","reaflam","reafla"],"reafland":"reafla","reaflara":"reafla","reaflaram":"reafla","reaflarati":"reafla","reaflase":"reafla","reaflasem":"reafla","reaflasera":"reafla","reaflaseram":"reafla","reaflaserati":"reafla","reaflasesi":"reafla","reaflasi":"reafla","reaflat":"reafla","reaflati":"reafla","reaflau":"reafla","reafli":"reafla","reaflu":"reafla","reaflua":"reafla","reagenti":"reagent","reagentii":"reagent","reagentilor":"reagent","reagentul":"reagent","reagentule":"reagent","reagentului":"reagent","reagrav":"reagrava","reagravai":"reagrava","reagravam":["reagravăm","reagrava","reagravam","reagrava"],"reagravand":"reagrava","reagravara":"reagrava","reagravaram":"reagrava","reagravarati":"reagrava","reagravarea":"reagravare","reagravari":"reagravare","reagravarii":"reagravare","reagravarile":"reagravare","reagravarilor":"reagravare","reagravase":"reagrava","reagravasem":"reagrava","reagravasera":"reagrava","reagravaseram":"reagrava","reagravaserati":"reagrava","reagravasesi":"reagrava","reagravasi":"reagrava","reagravat":"reagrava","reagravati":"reagrava","reagravau":"reagrava","reagraveaza":"reagrava","reagravi":"reagrava","reajung":"reajunge","reajunga":"reajunge","reajungand":"reajunge","reajungea":"reajunge","reajungeai":"reajunge","reajungeam":"reajunge","reajungeati":"reajunge","reajungeau":"reajunge","reajungem":"reajunge","reajungeti":"reajunge","reajungi":"reajunge","reajuns":"reajunge","reajunse":"reajunge","reajunsei":"reajunge","reajunsera":"reajunge","reajunseram":"reajunge","reajunserati":"reajunge","reajunsese":"reajunge","reajunsesem":"reajunge","reajunsesera":"reajunge","reajunseseram":"reajunge","reajunseserati":"reajunge","reajunsesesi":"reajunge","reajunsesi":"reajunge","reajustai":"reajusta","reajustam":["reajustăm","reajusta","reajustam","reajusta"],"reajustand":"reajusta","reajustara":"reajusta","reajustaram":"reajusta","reajustarati":"reajusta","reajustarea":"reajustare","reajustari":"reajustare","reajustarii":"reajustare","reajustarile":"reajustare","reajustarilor":"reajustare","reajustase":"reajusta","reajustasem":"reajusta","reajustasera":"reajusta","reajustaseram":"reajusta","reajustaserati":"reajusta","reajustasesi":"reajusta","reajustasi":"reajusta","reajustat":"reajusta","reajustati":"reajusta","reajustau":"reajusta","reajusteaza":"reajusta","reajustez":"reajusta","reajustezi":"reajusta","reala":["reală","real","reala","real"],"reale":"real","realeaga":"realege","realeg":"realege","realegand":"realege","realegea":"realege","realegeai":"realege","realegeam":"realege","realegeati":"realege","realegeau":"realege","realegem":"realege","realegeri":"realegere","realegeti":"realege","realegi":"realege","realele":"real","reales":"realege","realese":"realege","realesei":"realege","realesera":"realege","realeseram":"realege","realeserati":"realege","realesese":"realege","realesesem":"realege","realesesera":"realege","realeseseram":"realege","realeseserati":"realege","realesesesi":"realege","realesesi":"realege","realgarul":"realgar","realgarule":"realgar","realgarului":"realgar","reali":"real","realii":"real","realimentai":"realimenta","realimentam":["realimentăm","realimenta","realimentam","realimenta"],"realimentand":"realimenta","realimentara":"realimenta","realimentaram":"realimenta","realimentarati":"realimenta","realimentarea":"realimentare","realimentari":"realimentare","realimentarii":"realimentare","realimentarile":"realimentare","realimentarilor":"realimentare","realimentase":"realimenta","realimentasem":"realimenta","realimentasera":"realimenta","realimentaseram":"realimenta","realimentaserati":"realimenta","realimentasesi":"realimenta","realimentasi":"realimenta","realimentat":"realimenta","realimentata":["realimentată","realimentat","realimentata","realimentat"],"realimentate":"realimentat","realimentatele":"realimentat","realimentati":["realimentați","realimenta","realimentați","realimentat"],"realimentatii":"realimentat","realimentatul":"realimentat","realimentau":"realimenta","realimenteaza":"realimenta","realimentez":"realimenta","realimentezi":"realimenta","realiniai":"realinia","realiniam":"realinia","realiniara":"realinia","realiniaram":"realinia","realiniarati":"realinia","realiniase":"realinia","realiniasem":"realinia","realiniasera":"realinia","realiniaseram":"realinia","realiniaserati":"realinia","realiniasesi":"realinia","realiniasi":"realinia","realiniat":"realinia","realiniati":"realinia","realiniau":"realinia","realiniaza":"realinia","realinie":"realinia","realinieaza":"realinia","realiniem":"realinia","realinierea":"realiniere","realinieri":"realiniere","realinierii":"realiniere","realinierile":"realiniere","realinierilor":"realiniere","realiniez":"realinia","realiniezi":"realinia","realiniind":"realinia","realipea":"realipi","realipeai":"realipi","realipeam":"realipi","realipeati":"realipi","realipeau":"realipi","realipesc":"realipi","realipeste":"realipi","realipesti":"realipi","realipii":"realipi","realipim":"realipi","realipind":"realipi","realipira":"realipi","realipiram":"realipi","realipirati":"realipi","realipirea":"realipire","realipiri":"realipire","realipirii":"realipire","realipirile":"realipire","realipirilor":"realipire","realipise":"realipi","realipisem":"realipi","realipisera":"realipi","realipiseram":"realipi","realipiserati":"realipi","realipisesi":"realipi","realipisi":"realipi","realipit":"realipi","realipita":["realipită","realipit","realipita","realipit"],"realipite":"realipit","realipitele":"realipit","realipiti":["realipiți","realipi","realipiți","realipit"],"realipitii":"realipit","realipitul":"realipit","realismul":"realism","realismule":"realism","realismului":"realism","realista":["realistă","realist","realista","realist"],"realiste":["realiste","realist","realiste","realistă"],"realistei":"realistă","realistele":["realistele","realist","realistele","realistă"],"realistelor":"realistă","realisti":"realist","realistica":["realistică","realistic","realistica","realistic"],"realistice":"realistic","realisticele":"realistic","realistici":"realistic","realisticii":"realistic","realisticul":"realistic","realistii":"realist","realistul":"realist","realitatea":"realitate","realitati":"realitate","realitati virtuale":"realitate virtuală","realitatii":"realitate","realitatile":"realitate","realitatilor":"realitate","realizabila":["realizabilă","realizabil","realizabila","realizabil"],"realizabile":"realizabil","realizabilele":"realizabil","realizabili":"realizabil","realizabilii":"realizabil","realizabilul":"realizabil","realizai":"realiza","realizam":["realizăm","realiza","realizam","realiza"],"realizand":"realiza","realizara":"realiza","realizaram":"realiza","realizarati":"realiza","realizarea":"realizare","realizari":"realizare","realizarii":"realizare","realizarile":"realizare","realizarilor":"realizare","realizase":"realiza","realizasem":"realiza","realizasera":"realiza","realizaseram":"realiza","realizaserati":"realiza","realizasesi":"realiza","realizasi":"realiza","realizat":"realiza","realizata":["realizată","realizat","realizata","realizat"],"realizate":"realizat","realizatele":"realizat","realizati":["realizați","realiza","realizați","realizat"],"realizatia":"realizație","realizatiei":"realizație","realizatii":["realizații","realizat","realizații","realizație"],"realizatiile":"realizație","realizatiilor":"realizație","realizatoare":"realizator","realizatoarea":"realizator","realizatoarele":"realizator","realizatori":"realizator","realizatorii":"realizator","realizatorul":"realizator","realizatul":"realizat","realizau":"realiza","realizeaza":"realiza","realizez":"realiza","realizezi":"realiza","realnica":["realnică","realnic","realnica","realnic"],"realnice":"realnic","realnicele":"realnic","realnici":"realnic","realnicii":"realnic","realnicul":"realnic","realt":"realța","realtai":"realța","realtam":["realțăm","realța","realțam","realța"],"realtand":"realța","realtara":"realța","realtaram":"realța","realtarati":"realța","realtase":"realța","realtasem":"realța","realtasera":"realța","realtaseram":"realța","realtaserati":"realța","realtasesi":"realța","realtasi":"realța","realtat":"realța","realtati":"realța","realtau":"realța","realti":"realța","realtoia":"realtoi","realtoiai":"realtoi","realtoiam":"realtoi","realtoiati":"realtoi","realtoiau":"realtoi","realtoiesc":"realtoi","realtoieste":"realtoi","realtoiesti":"realtoi","realtoii":"realtoi","realtoim":"realtoi","realtoind":"realtoi","realtoira":"realtoi","realtoiram":"realtoi","realtoirati":"realtoi","realtoirea":"realtoire","realtoiri":"realtoire","realtoirii":"realtoire","realtoirile":"realtoire","realtoirilor":"realtoire","realtoise":"realtoi","realtoisem":"realtoi","realtoisera":"realtoi","realtoiseram":"realtoi","realtoiserati":"realtoi","realtoisesi":"realtoi","realtoisi":"realtoi","realtoit":"realtoi","realtoita":["realtoită","realtoit","realtoita","realtoit"],"realtoite":"realtoit","realtoitele":"realtoit","realtoiti":["realtoiți","realtoi","realtoiți","realtoit"],"realtoitii":"realtoit","realtoitul":"realtoit","realul":"real","reambalai":"reambala","reambalam":["reambalăm","reambala","reambalam","reambala"],"reambaland":"reambala","reambalara":"reambala","reambalaram":"reambala","reambalarati":"reambala","reambalarea":"reambalare","reambalari":"reambalare","reambalarii":"reambalare","reambalase":"reambala","reambalasem":"reambala","reambalasera":"reambala","reambalaseram":"reambala","reambalaserati":"reambala","reambalasesi":"reambala","reambalasi":"reambala","reambalat":"reambala","reambalati":"reambala","reambalau":"reambala","reambaleaza":"reambala","reambalez":"reambala","reambalezi":"reambala","reambarc":"reambarca","reambarcai":"reambarca","reambarcam":["reambarcăm","reambarca","reambarcam","reambarca"],"reambarcand":"reambarca","reambarcara":"reambarca","reambarcaram":"reambarca","reambarcarati":"reambarca","reambarcarea":"reambarcare","reambarcari":"reambarcare","reambarcarii":"reambarcare","reambarcarile":"reambarcare","reambarcarilor":"reambarcare","reambarcase":"reambarca","reambarcasem":"reambarca","reambarcasera":"reambarca","reambarcaseram":"reambarca","reambarcaserati":"reambarca","reambarcasesi":"reambarca","reambarcasi":"reambarca","reambarcat":"reambarca","reambarcati":"reambarca","reambarcau":"reambarca","reambarci":"reambarca","reamenajai":"reamenaja","reamenajam":["reamenajăm","reamenaja","reamenajam","reamenaja"],"reamenajand":"reamenaja","reamenajara":"reamenaja","reamenajaram":"reamenaja","reamenajarati":"reamenaja","reamenajarea":"reamenajare","reamenajari":"reamenajare","reamenajarii":"reamenajare","reamenajarile":"reamenajare","reamenajarilor":"reamenajare","reamenajase":"reamenaja","reamenajasem":"reamenaja","reamenajasera":"reamenaja","reamenajaseram":"reamenaja","reamenajaserati":"reamenaja","reamenajasesi":"reamenaja","reamenajasi":"reamenaja","reamenajat":"reamenaja","reamenajata":["reamenajată","reamenajat","reamenajata","reamenajat"],"reamenajate":"reamenajat","reamenajatele":"reamenajat","reamenajati":["reamenajați","reamenaja","reamenajați","reamenajat"],"reamenajatii":"reamenajat","reamenajatul":"reamenajat","reamenajau":"reamenaja","reamenajeaza":"reamenaja","reamenajez":"reamenaja","reamenajezi":"reamenaja","reamintea":"reaminti","reaminteai":"reaminti","reaminteam":"reaminti","reaminteati":"reaminti","reaminteau":"reaminti","reamintesc":"reaminti","reaminteste":"reaminti","reamintesti":"reaminti","reamintii":"reaminti","reamintim":"reaminti","reamintind":"reaminti","reamintira":"reaminti","reamintiram":"reaminti","reamintirati":"reaminti","reamintirea":"reamintire","reamintiri":"reamintire","reamintirii":"reamintire","reamintirile":"reamintire","reamintirilor":"reamintire","reamintise":"reaminti","reamintisem":"reaminti","reamintisera":"reaminti","reamintiseram":"reaminti","reamintiserati":"reaminti","reamintisesi":"reaminti","reamintisi":"reaminti","reamintit":"reaminti","reamintita":["reamintită","reamintit","reamintita","reamintit"],"reamintite":"reamintit","reamintitele":"reamintit","reamintiti":["reamintiți","reaminti","reamintiți","reamintit"],"reamintitii":"reamintit","reamintitul":"reamintit","reamplasai":"reamplasa","reamplasam":["reamplasăm","reamplasa","reamplasam","reamplasa"],"reamplasand":"reamplasa","reamplasara":"reamplasa","reamplasaram":"reamplasa","reamplasarati":"reamplasa","reamplasarea":"reamplasare","reamplasari":"reamplasare","reamplasarii":"reamplasare","reamplasarile":"reamplasare","reamplasarilor":"reamplasare","reamplasase":"reamplasa","reamplasasem":"reamplasa","reamplasasera":"reamplasa","reamplasaseram":"reamplasa","reamplasaserati":"reamplasa","reamplasasesi":"reamplasa","reamplasasi":"reamplasa","reamplasat":"reamplasa","reamplasata":["reamplasată","reamplasat","reamplasata","reamplasat"],"reamplasate":"reamplasat","reamplasatele":"reamplasat","reamplasati":["reamplasați","reamplasa","reamplasați","reamplasat"],"reamplasatii":"reamplasat","reamplasatul":"reamplasat","reamplasau":"reamplasa","reamplaseaza":"reamplasa","reamplasez":"reamplasa","reamplasezi":"reamplasa","reamputai":"reamputa","reamputam":["reamputăm","reamputa","reamputam","reamputa"],"reamputand":"reamputa","reamputara":"reamputa","reamputaram":"reamputa","reamputarati":"reamputa","reamputarea":"reamputare","reamputari":"reamputare","reamputarii":"reamputare","reamputarile":"reamputare","reamputarilor":"reamputare","reamputase":"reamputa","reamputasem":"reamputa","reamputasera":"reamputa","reamputaseram":"reamputa","reamputaserati":"reamputa","reamputasesi":"reamputa","reamputasi":"reamputa","reamputat":"reamputa","reamputati":"reamputa","reamputau":"reamputa","reamputeaza":"reamputa","reamputez":"reamputa","reamputezi":"reamputa","reanalizai":"reanaliza","reanalizam":["reanalizăm","reanaliza","reanalizam","reanaliza"],"reanalizand":"reanaliza","reanalizara":"reanaliza","reanalizaram":"reanaliza","reanalizarati":"reanaliza","reanalizarea":"reanalizare","reanalizari":"reanalizare","reanalizarii":"reanalizare","reanalizarile":"reanalizare","reanalizarilor":"reanalizare","reanalizase":"reanaliza","reanalizasem":"reanaliza","reanalizasera":"reanaliza","reanalizaseram":"reanaliza","reanalizaserati":"reanaliza","reanalizasesi":"reanaliza","reanalizasi":"reanaliza","reanalizat":"reanaliza","reanalizata":["reanalizată","reanalizat","reanalizata","reanalizat"],"reanalizate":"reanalizat","reanalizatele":"reanalizat","reanalizati":["reanalizați","reanaliza","reanalizați","reanalizat"],"reanalizatii":"reanalizat","reanalizatul":"reanalizat","reanalizau":"reanaliza","reanalizeaza":"reanaliza","reanalizez":"reanaliza","reanalizezi":"reanaliza","reangajai":"reangaja","reangajam":["reangajăm","reangaja","reangajam","reangaja"],"reangajand":"reangaja","reangajara":"reangaja","reangajaram":"reangaja","reangajarati":"reangaja","reangajarea":"reangajare","reangajari":"reangajare","reangajarii":"reangajare","reangajarile":"reangajare","reangajarilor":"reangajare","reangajase":"reangaja","reangajasem":"reangaja","reangajasera":"reangaja","reangajaseram":"reangaja","reangajaserati":"reangaja","reangajasesi":"reangaja","reangajasi":"reangaja","reangajat":"reangaja","reangajata":["reangajată","reangajat","reangajata","reangajat"],"reangajate":"reangajat","reangajatele":"reangajat","reangajati":["reangajați","reangaja","reangajați","reangajat"],"reangajatii":"reangajat","reangajatul":"reangajat","reangajau":"reangaja","reangajeaza":"reangaja","reangajez":"reangaja","reangajezi":"reangaja","reanim":"reanima","reanimai":"reanima","reanimam":["reanimăm","reanima","reanimam","reanima"],"reanimand":"reanima","reanimara":"reanima","reanimaram":"reanima","reanimarati":"reanima","reanimari":"reanimare","reanimari gura-la-gura":"reanimare gură la gură","reanimase":"reanima","reanimasem":"reanima","reanimasera":"reanima","reanimaseram":"reanima","reanimaserati":"reanima","reanimasesi":"reanima","reanimasi":"reanima","reanimat":"reanima","reanimati":"reanima","reanimatoarea":"reanimatoare","reanimatoarei":"reanimatoare","reanimatoarele":"reanimatoare","reanimatoarelor":"reanimatoare","reanimatori":"reanimator","reanimatorii":"reanimator","reanimatorilor":"reanimator","reanimatorul":"reanimator","reanimatorule":"reanimator","reanimatorului":"reanimator","reanimau":"reanima","reanime":"reanima","reanimi":"reanima","reapar":"reapărea","reapara":"reapărea","reaparand":"reapărea","reapare":["reapare","reapărea","reapăre","reapărea"],"reapareai":"reapărea","reapaream":"reapărea","reapareati":"reapărea","reapareau":"reapărea","reaparem":"reapărea","reapareti":"reapărea","reapari":"reapărea","reaparitia":"reapariție","reaparitiei":"reapariție","reaparitii":"reapariție","reaparitiile":"reapariție","reaparitiilor":"reapariție","reaparitiunea":"reaparițiune","reaparitiuni":"reaparițiune","reaparitiunii":"reaparițiune","reaparitiunile":"reaparițiune","reaparitiunilor":"reaparițiune","reaparu":"reapărea","reaparui":"reapărea","reaparura":"reapărea","reaparuram":"reapărea","reaparurati":"reapărea","reaparuse":"reapărea","reaparusem":"reapărea","reaparusera":"reapărea","reaparuseram":"reapărea","reaparuserati":"reapărea","reaparusesi":"reapărea","reaparusi":"reapărea","reaparut":"reapărea","reaprind":"reaprinde","reaprinda":"reaprinde","reaprindea":"reaprinde","reaprindeai":"reaprinde","reaprindeam":"reaprinde","reaprindeati":"reaprinde","reaprindeau":"reaprinde","reaprindem":"reaprinde","reaprinderea":"reaprindere","reaprinderi":"reaprindere","reaprinderii":"reaprindere","reaprinderile":"reaprindere","reaprinderilor":"reaprindere","reaprindeti":"reaprinde","reaprins":"reaprinde","reaprinse":"reaprinde","reaprinsei":"reaprinde","reaprinsera":"reaprinde","reaprinseram":"reaprinde","reaprinserati":"reaprinde","reaprinsese":"reaprinde","reaprinsesem":"reaprinde","reaprinsesera":"reaprinde","reaprinseseram":"reaprinde","reaprinseserati":"reaprinde","reaprinsesesi":"reaprinde","reaprinsesi":"reaprinde","reaprinzand":"reaprinde","reaprinzi":"reaprinde","reaprovizionai":"reaproviziona","reaprovizionam":["reaprovizionăm","reaproviziona","reaprovizionam","reaproviziona"],"reaprovizionand":"reaproviziona","reaprovizionara":"reaproviziona","reaprovizionaram":"reaproviziona","reaprovizionarati":"reaproviziona","reaprovizionarea":"reaprovizionare","reaprovizionari":"reaprovizionare","reaprovizionarii":"reaprovizionare","reaprovizionarile":"reaprovizionare","reaprovizionarilor":"reaprovizionare","reaprovizionase":"reaproviziona","reaprovizionasem":"reaproviziona","reaprovizionasera":"reaproviziona","reaprovizionaseram":"reaproviziona","reaprovizionaserati":"reaproviziona","reaprovizionasesi":"reaproviziona","reaprovizionasi":"reaproviziona","reaprovizionat":"reaproviziona","reaprovizionati":"reaproviziona","reaprovizionau":"reaproviziona","reaprovizioneaza":"reaproviziona","reaprovizionez":"reaproviziona","reaprovizionezi":"reaproviziona","reapuc":"reapuca","reapucai":"reapuca","reapucam":["reapucăm","reapuca","reapucam","reapuca"],"reapucand":"reapuca","reapucara":"reapuca","reapucaram":"reapuca","reapucarati":"reapuca","reapucase":"reapuca","reapucasem":"reapuca","reapucasera":"reapuca","reapucaseram":"reapuca","reapucaserati":"reapuca","reapucasesi":"reapuca","reapucasi":"reapuca","reapucat":"reapuca","reapucati":"reapuca","reapucau":"reapuca","reapuci":"reapuca","rearanjai":"rearanja","rearanjam":["rearanjăm","rearanja","rearanjam","rearanja"],"rearanjand":"rearanja","rearanjara":"rearanja","rearanjaram":"rearanja","rearanjarati":"rearanja","rearanjarea":"rearanjare","rearanjari":"rearanjare","rearanjarii":"rearanjare","rearanjarile":"rearanjare","rearanjarilor":"rearanjare","rearanjase":"rearanja","rearanjasem":"rearanja","rearanjasera":"rearanja","rearanjaseram":"rearanja","rearanjaserati":"rearanja","rearanjasesi":"rearanja","rearanjasi":"rearanja","rearanjat":"rearanja","rearanjata":["rearanjată","rearanjat","rearanjata","rearanjat"],"rearanjate":"rearanjat","rearanjatele":"rearanjat","rearanjati":["rearanjați","rearanja","rearanjați","rearanjat"],"rearanjatii":"rearanjat","rearanjatul":"rearanjat","rearanjau":"rearanja","rearanjeaza":"rearanja","rearanjez":"rearanja","rearanjezi":"rearanja","rearbitrai":"rearbitra","rearbitram":["rearbitrăm","rearbitra","rearbitram","rearbitra"],"rearbitrand":"rearbitra","rearbitrara":"rearbitra","rearbitraram":"rearbitra","rearbitrarati":"rearbitra","rearbitrarea":"rearbitrare","rearbitrari":"rearbitrare","rearbitrarii":"rearbitrare","rearbitrarile":"rearbitrare","rearbitrarilor":"rearbitrare","rearbitrase":"rearbitra","rearbitrasem":"rearbitra","rearbitrasera":"rearbitra","rearbitraseram":"rearbitra","rearbitraserati":"rearbitra","rearbitrasesi":"rearbitra","rearbitrasi":"rearbitra","rearbitrat":"rearbitra","rearbitrati":"rearbitra","rearbitrau":"rearbitra","rearbitreaza":"rearbitra","rearbitrez":"rearbitra","rearbitrezi":"rearbitra","rearendai":"rearenda","rearendam":["rearendăm","rearenda","rearendam","rearenda"],"rearendand":"rearenda","rearendara":"rearenda","rearendaram":"rearenda","rearendarati":"rearenda","rearendase":"rearenda","rearendasem":"rearenda","rearendasera":"rearenda","rearendaseram":"rearenda","rearendaserati":"rearenda","rearendasesi":"rearenda","rearendasi":"rearenda","rearendat":"rearenda","rearendati":"rearenda","rearendau":"rearenda","rearendeaza":"rearenda","rearendez":"rearenda","rearendezi":"rearenda","reargintai":"rearginta","reargintam":["reargintăm","rearginta","reargintam","rearginta"],"reargintand":"rearginta","reargintara":"rearginta","reargintaram":"rearginta","reargintarati":"rearginta","reargintarea":"reargintare","reargintari":"reargintare","reargintarii":"reargintare","reargintarile":"reargintare","reargintarilor":"reargintare","reargintase":"rearginta","reargintasem":"rearginta","reargintasera":"rearginta","reargintaseram":"rearginta","reargintaserati":"rearginta","reargintasesi":"rearginta","reargintasi":"rearginta","reargintat":"rearginta","reargintata":["reargintată","reargintat","reargintata","reargintat"],"reargintate":"reargintat","reargintatele":"reargintat","reargintati":["reargintați","rearginta","reargintați","reargintat"],"reargintatii":"reargintat","reargintatul":"reargintat","reargintau":"rearginta","rearginteaza":"rearginta","reargintez":"rearginta","reargintezi":"rearginta","rearmai":"rearma","rearmam":["rearmăm","rearma","rearmam","rearma"],"rearmand":"rearma","rearmara":"rearma","rearmaram":"rearma","rearmarati":"rearma","rearmarea":"rearmare","rearmari":"rearmare","rearmarii":"rearmare","rearmarile":"rearmare","rearmarilor":"rearmare","rearmase":"rearma","rearmasem":"rearma","rearmasera":"rearma","rearmaseram":"rearma","rearmaserati":"rearma","rearmasesi":"rearma","rearmasi":"rearma","rearmat":"rearma","rearmati":"rearma","rearmau":"rearma","rearmeaza":"rearma","rearmez":"rearma","rearmezi":"rearma","reascult":"reasculta","reascultai":"reasculta","reascultam":["reascultăm","reasculta","reascultam","reasculta"],"reascultand":"reasculta","reascultara":"reasculta","reascultaram":"reasculta","reascultarati":"reasculta","reascultarea":"reascultare","reascultari":"reascultare","reascultarii":"reascultare","reascultarile":"reascultare","reascultarilor":"reascultare","reascultase":"reasculta","reascultasem":"reasculta","reascultasera":"reasculta","reascultaseram":"reasculta","reascultaserati":"reasculta","reascultasesi":"reasculta","reascultasi":"reasculta","reascultat":"reasculta","reascultati":"reasculta","reascultau":"reasculta","reasculti":"reasculta","reascutirea":"reascuțire","reascutiri":"reascuțire","reascutirii":"reascuțire","reascutirile":"reascuțire","reascutirilor":"reascuțire","reaseaza":"reașeza","reasezai":"reașeza","reasezam":["reașezăm","reașeza","reașezam","reașeza"],"reasezand":"reașeza","reasezara":"reașeza","reasezaram":"reașeza","reasezarati":"reașeza","reasezarea":"reașezare","reasezari":"reașezare","reasezarii":"reașezare","reasezarile":"reașezare","reasezarilor":"reașezare","reasezase":"reașeza","reasezasem":"reașeza","reasezasera":"reașeza","reasezaseram":"reașeza","reasezaserati":"reașeza","reasezasesi":"reașeza","reasezasi":"reașeza","reasezat":"reașeza","reasezata":["reașezată","reașezat","reașezata","reașezat"],"reasezate":"reașezat","reasezatele":"reașezat","reasezati":["reașezați","reașeza","reașezați","reașezat"],"reasezatii":"reașezat","reasezatul":"reașezat","reasezau":"reașeza","reasezeaza":"reașeza","reasezez":"reașeza","reasezezi":"reașeza","reasigur":"reasigura","reasigurai":"reasigura","reasiguram":["reasigurăm","reasigura","reasiguram","reasigura"],"reasigurand":"reasigura","reasigurara":"reasigura","reasiguraram":"reasigura","reasigurarati":"reasigura","reasigurarea":"reasigurare","reasigurari":"reasigurare","reasigurarii":"reasigurare","reasigurarile":"reasigurare","reasigurarilor":"reasigurare","reasigurase":"reasigura","reasigurasem":"reasigura","reasigurasera":"reasigura","reasiguraseram":"reasigura","reasiguraserati":"reasigura","reasigurasesi":"reasigura","reasigurasi":"reasigura","reasigurat":"reasigura","reasigurati":"reasigura","reasigurau":"reasigura","reasiguri":"reasigura","reasociai":"reasocia","reasociam":"reasocia","reasociara":"reasocia","reasociaram":"reasocia","reasociarati":"reasocia","reasociase":"reasocia","reasociasem":"reasocia","reasociasera":"reasocia","reasociaseram":"reasocia","reasociaserati":"reasocia","reasociasesi":"reasocia","reasociasi":"reasocia","reasociat":"reasocia","reasociati":"reasocia","reasociau":"reasocia","reasociaza":"reasocia","reasocie":"reasocia","reasocieaza":"reasocia","reasociem":"reasocia","reasocierea":"reasociere","reasocieri":"reasociere","reasocierii":"reasociere","reasocierile":"reasociere","reasocierilor":"reasociere","reasociez":"reasocia","reasociezi":"reasocia","reasociind":"reasocia","reatat":"reațâța","reatatai":"reațâța","reatatam":["reațâțăm","reațâța","reațâțam","reațâța"],"reatatand":"reațâța","reatatara":"reațâța","reatataram":"reațâța","reatatarati":"reațâța","reatatarea":"reațâțare","reatatari":"reațâțare","reatatarii":"reațâțare","reatatarile":"reațâțare","reatatarilor":"reațâțare","reatatase":"reațâța","reatatasem":"reațâța","reatatasera":"reațâța","reatataseram":"reațâța","reatataserati":"reațâța","reatatasesi":"reațâța","reatatasi":"reațâța","reatatat":"reațâța","reatatati":"reațâța","reatatau":"reațâța","reatati":"reațâța","reatribuia":"reatribui","reatribuiai":"reatribui","reatribuiam":"reatribui","reatribuiati":"reatribui","reatribuiau":"reatribui","reatribuie":"reatribui","reatribuii":"reatribui","reatribuim":"reatribui","reatribuind":"reatribui","reatribuira":"reatribui","reatribuiram":"reatribui","reatribuirati":"reatribui","reatribuirea":"reatribuire","reatribuiri":"reatribuire","reatribuirii":"reatribuire","reatribuirile":"reatribuire","reatribuirilor":"reatribuire","reatribuise":"reatribui","reatribuisem":"reatribui","reatribuisera":"reatribui","reatribuiseram":"reatribui","reatribuiserati":"reatribui","reatribuisesi":"reatribui","reatribuisi":"reatribui","reatribuit":"reatribui","reatribuita":["reatribuită","reatribuit","reatribuita","reatribuit"],"reatribuite":"reatribuit","reatribuitele":"reatribuit","reatribuiti":["reatribuiți","reatribui","reatribuiți","reatribuit"],"reatribuitii":"reatribuit","reatribuitul":"reatribuit","reaua":"rău","reaudiai":"reaudia","reaudiam":"reaudia","reaudiara":"reaudia","reaudiaram":"reaudia","reaudiarati":"reaudia","reaudiase":"reaudia","reaudiasem":"reaudia","reaudiasera":"reaudia","reaudiaseram":"reaudia","reaudiaserati":"reaudia","reaudiasesi":"reaudia","reaudiasi":"reaudia","reaudiat":"reaudia","reaudiati":"reaudia","reaudiau":"reaudia","reaudiaza":"reaudia","reaudie":"reaudia","reaudiem":"reaudia","reaudierea":"reaudiere","reaudieri":"reaudiere","reaudierii":"reaudiere","reaudierile":"reaudiere","reaudierilor":"reaudiere","reaudii":"reaudia","reaudiind":"reaudia","reauz":"reauzi","reauze":"reauzi","reauzea":"reauzi","reauzeai":"reauzi","reauzeam":"reauzi","reauzeati":"reauzi","reauzeau":"reauzi","reauzie":"reauzi","reauzii":"reauzi","reauzim":"reauzi","reauzind":"reauzi","reauzira":"reauzi","reauziram":"reauzi","reauzirati":"reauzi","reauzise":"reauzi","reauzisem":"reauzi","reauzisera":"reauzi","reauziseram":"reauzi","reauziserati":"reauzi","reauzisesi":"reauzi","reauzisi":"reauzi","reauzit":"reauzi","reauziti":"reauzi","reavana":["reavănă","reavăn","reavăna","reavăn"],"reavanul":"reavăn","reazame":"reazăm","reazamele":"reazăm","reazamelor":"reazăm","reazamul":"reazăm","reazamule":"reazăm","reazamului":"reazăm","reazem":"rezema","reazema":"rezema","reazeme":"reazem","reazime":"reazim","reazimele":"reazim","reazimelor":"reazim","reazimul":"reazim","reazimule":"reazim","reazimului":"reazim","rebabul":"rebab","rebabule":"rebab","rebabului":"rebab","rebaburi":"rebab","rebaburile":"rebab","rebaburilor":"rebab","rebandajai":"rebandaja","rebandajam":["rebandajăm","rebandaja","rebandajam","rebandaja"],"rebandajand":"rebandaja","rebandajara":"rebandaja","rebandajaram":"rebandaja","rebandajarati":"rebandaja","rebandajarea":"rebandajare","rebandajari":"rebandajare","rebandajarii":"rebandajare","rebandajarile":"rebandajare","rebandajarilor":"rebandajare","rebandajase":"rebandaja","rebandajasem":"rebandaja","rebandajasera":"rebandaja","rebandajaseram":"rebandaja","rebandajaserati":"rebandaja"};
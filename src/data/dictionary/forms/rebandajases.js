@@ -0,0 +1 @@
+export default {"rebandajasesi":"rebandaja","rebandajasi":"rebandaja","rebandajat":"rebandaja","rebandajati":"rebandaja","rebandajau":"rebandaja","rebandajeaza":"rebandaja","rebandajez":"rebandaja","rebandajezi":"rebandaja","rebarbativa":["rebarbativă","rebarbativ","rebarbativa","rebarbativ"],"rebarbative":"rebarbativ","rebarbativele":"rebarbativ","rebarbativi":"rebarbativ","rebarbativii":"rebarbativ","rebarbativul":"rebarbativ","rebat":"rebate","rebata":"rebate","rebatand":"rebate","rebatea":"rebate","rebateai":"rebate","rebateam":"rebate","rebateati":"rebate","rebateau":"rebate","rebatem":"rebate","rebaterea":"rebatere","rebateri":"rebatere","rebaterii":"rebatere","rebaterile":"rebatere","rebaterilor":"rebatere","rebateti":"rebate","rebati":"rebate","rebatu":"rebate","rebatui":"rebate","rebatura":"rebate","rebaturam":"rebate","rebaturati":"rebate","rebatuse":"rebate","rebatusem":"rebate","rebatusera":"rebate","rebatuseram":"rebate","rebatuserati":"rebate","rebatusesi":"rebate","rebatusi":"rebate","rebatut":"rebate","rebatuta":["rebătută","rebătut","rebătuta","rebătut"],"rebatute":"rebătut","rebatutele":"rebătut","rebatuti":"rebătut","rebatutii":"rebătut","rebatutul":"rebătut","rebecul":"rebec","rebecule":"rebec","rebecului":"rebec","rebecuri":"rebec","rebecurile":"rebec","rebecurilor":"rebec","rebegita":["rebegită","rebegit","rebegita","rebegit"],"rebegite":"rebegit","rebegitele":"rebegit","rebegiti":"rebegit","rebegitii":"rebegit","rebegitul":"rebegit","rebela":["rebelă","rebel","rebela","rebel"],"rebele":"rebel","rebelele":"rebel","rebeli":"rebel","rebelia":"rebelie","rebeliei":"rebelie","rebelii":["rebelii","rebel","rebelii","rebelie"],"rebeliile":"rebelie","rebeliilor":"rebelie","rebelionisti":"rebelionist","rebelionistii":"rebelionist","rebelionistilor":"rebelionist","rebelionistul":"rebelionist","rebelionistule":"rebelionist","rebelionistului":"rebelionist","rebelistea":"rebeliște","rebelisti":"rebeliște","rebelistii":"rebeliște","rebelistile":"rebeliște","rebelistilor":"rebeliște","rebeliunea":"rebeliune","rebeliuni":"rebeliune","rebeliunii":"rebeliune","rebeliunile":"rebeliune","rebeliunilor":"rebeliune","rebelul":"rebel","rebobinarea":"rebobinare","rebobinari":"rebobinare","rebobinarii":"rebobinare","rebobinarile":"rebobinare","rebobinarilor":"rebobinare","rebomba":"rimbomba","rebordul":"rebord","rebordule":"rebord","rebordului":"rebord","reborduri":"rebord","rebordurile":"rebord","rebordurilor":"rebord","reboteaza":"reboteza","rebotez":"reboteza","rebotezai":"reboteza","rebotezam":["rebotezăm","reboteza","rebotezam","reboteza"],"rebotezand":"reboteza","rebotezara":"reboteza","rebotezaram":"reboteza","rebotezarati":"reboteza","rebotezarea":"rebotezare","rebotezari":"rebotezare","rebotezarii":"rebotezare","rebotezarile":"rebotezare","rebotezarilor":"rebotezare","rebotezase":"reboteza","rebotezasem":"reboteza","rebotezasera":"reboteza","rebotezaseram":"reboteza","rebotezaserati":"reboteza","rebotezasesi":"reboteza","rebotezasi":"reboteza","rebotezat":"reboteza","rebotezata":["rebotezată","rebotezat","rebotezata","rebotezat"],"rebotezate":"rebotezat","rebotezatele":"rebotezat","rebotezati":["rebotezați","reboteza","rebotezați","rebotezat"],"rebotezatii":"rebotezat","rebotezatul":"rebotezat","rebotezau":"reboteza","rebotezi":"reboteza","rebusista":["rebusistă","rebusist","rebusista","rebusist"],"rebusiste":["rebusiste","rebusist","rebusiste","rebusistă"],"rebusistei":"rebusistă","rebusistele":["rebusistele","rebusist","rebusistele","rebusistă"],"rebusistelor":"rebusistă","rebusisti":"rebusist","rebusistii":"rebusist","rebusistilor":"rebusist","rebusistul":"rebusist","rebusistule":"rebusist","rebusistului":"rebusist","rebusul":"rebus","rebusule":"rebus","rebusului":"rebus","rebusuri":"rebus","rebusurile":"rebus","rebusurilor":"rebus","rebutai":"rebuta","rebutam":["rebutăm","rebuta","rebutam","rebuta"],"rebutand":"rebuta","rebutara":"rebuta","rebutaram":"rebuta","rebutarati":"rebuta","rebutarea":"rebutare","rebutari":"rebutare","rebutarii":"rebutare","rebutarile":"rebutare","rebutarilor":"rebutare","rebutase":"rebuta","rebutasem":"rebuta","rebutasera":"rebuta","rebutaseram":"rebuta","rebutaserati":"rebuta","rebutasesi":"rebuta","rebutasi":"rebuta","rebutat":"rebuta","rebutata":["rebutată","rebutat","rebutata","rebutat"],"rebutate":"rebutat","rebutatele":"rebutat","rebutati":["rebutați","rebuta","rebutați","rebutat"],"rebutatii":"rebutat","rebutatul":"rebutat","rebutau":"rebuta","rebuteaza":"rebuta","rebutez":"rebuta","rebutezi":"rebuta","rebutul":"rebut","rebutule":"rebut","rebutului":"rebut","rebuturi":"rebut","rebuturile":"rebut","rebuturilor":"rebut","recad":"recădea","recada":"recădea","recade":["recade","recădea","recăde","recădea"],"recadeai":"recădea","recadeam":"recădea","recadeati":"recădea","recadeau":"recădea","recadem":"recădea","recaderea":"recădere","recaderi":"recădere","recaderii":"recădere","recaderile":"recădere","recaderilor":"recădere","recadeti":"recădea","recalcitranta":["recalcitrantă","recalcitrant","recalcitranta","recalcitrant"],"recalcitrante":["recalcitrante","recalcitrant","recalcitranțe","recalcitranță"],"recalcitrantei":"recalcitranță","recalcitrantele":["recalcitrantele","recalcitrant","recalcitranțele","recalcitranță"],"recalcitrantelor":"recalcitranță","recalcitranti":"recalcitrant","recalcitrantii":"recalcitrant","recalcitrantul":"recalcitrant","recalculai":"recalcula","recalculam":["recalculăm","recalcula","recalculam","recalcula"],"recalculand":"recalcula","recalculara":"recalcula","recalcularam":"recalcula","recalcularati":"recalcula","recalcularea":"recalculare","recalculari":"recalculare","recalcularii":"recalculare","recalcularile":"recalculare","recalcularilor":"recalculare","recalculase":"recalcula","recalculasem":"recalcula","recalculasera":"recalcula","recalculaseram":"recalcula","recalculaserati":"recalcula","recalculasesi":"recalcula","recalculasi":"recalcula","recalculat":"recalcula","recalculata":["recalculată","recalculat","recalculata","recalculat"],"recalculate":"recalculat","recalculatele":"recalculat","recalculati":["recalculați","recalcula","recalculați","recalculat"],"recalculatii":"recalculat","recalculatul":"recalculat","recalculau":"recalcula","recalculeaza":"recalcula","recalculez":"recalcula","recalculezi":"recalcula","recalescente":"recalescență","recalescentei":"recalescență","recalescentele":"recalescență","recalescentelor":"recalescență","recalibrai":"recalibra","recalibram":["recalibrăm","recalibra","recalibram","recalibra"],"recalibrand":"recalibra","recalibrara":"recalibra","recalibraram":"recalibra","recalibrarati":"recalibra","recalibrarea":"recalibrare","recalibrari":"recalibrare","recalibrarii":"recalibrare","recalibrarile":"recalibrare","recalibrarilor":"recalibrare","recalibrase":"recalibra","recalibrasem":"recalibra","recalibrasera":"recalibra","recalibraseram":"recalibra","recalibraserati":"recalibra","recalibrasesi":"recalibra","recalibrasi":"recalibra","recalibrat":"recalibra","recalibrata":["recalibrată","recalibrat","recalibrata","recalibrat"],"recalibrate":"recalibrat","recalibratele":"recalibrat","recalibrati":["recalibrați","recalibra","recalibrați","recalibrat"],"recalibratii":"recalibrat","recalibratul":"recalibrat","recalibrau":"recalibra","recalibreaza":"recalibra","recalibrez":"recalibra","recalibrezi":"recalibra","recalific":"recalifica","recalificai":"recalifica","recalificam":["recalificăm","recalifica","recalificam","recalifica"],"recalificand":"recalifica","recalificara":"recalifica","recalificaram":"recalifica","recalificarati":"recalifica","recalificarea":"recalificare","recalificari":"recalificare","recalificarii":"recalificare","recalificarile":"recalificare","recalificarilor":"recalificare","recalificase":"recalifica","recalificasem":"recalifica","recalificasera":"recalifica","recalificaseram":"recalifica","recalificaserati":"recalifica","recalificasesi":"recalifica","recalificasi":"recalifica","recalificat":"recalifica","recalificata":["recalificată","recalificat","recalificata","recalificat"],"recalificate":"recalificat","recalificatele":"recalificat","recalificati":["recalificați","recalifica","recalificați","recalificat"],"recalificatii":"recalificat","recalificatul":"recalificat","recalificau":"recalifica","recalifici":"recalifica","recalot":"recalota","recalotai":"recalota","recalotam":["recalotăm","recalota","recalotam","recalota"],"recalotand":"recalota","recalotara":"recalota","recalotaram":"recalota","recalotarati":"recalota","recalotase":"recalota","recalotasem":"recalota","recalotasera":"recalota","recalotaseram":"recalota","recalotaserati":"recalota","recalotasesi":"recalota","recalotasi":"recalota","recalotat":"recalota","recalotati":"recalota","recalotau":"recalota","recaloti":"recalota","recalute":"recăluț","recalutele":"recăluț","recalutelor":"recăluț","recalutul":"recăluț","recalutule":"recăluț","recalutului":"recăluț","recantarea":"recântări","recantareai":"recântări","recantaream":"recântări","recantareati":"recântări","recantareau":"recântări","recantaresc":"recântări","recantareste":"recântări","recantaresti":"recântări","recantarii":"recântări","recantarim":"recântări","recantarind":"recântări","recantarira":"recântări","recantariram":"recântări","recantarirati":"recântări","recantarirea":"recântărire","recantariri":"recântărire","recantaririi":"recântărire","recantaririle":"recântărire","recantaririlor":"recântărire","recantarise":"recântări","recantarisem":"recântări","recantarisera":"recântări","recantariseram":"recântări","recantariserati":"recântări","recantarisesi":"recântări","recantarisi":"recântări","recantarit":"recântări","recantariti":"recântări","recapat":"recăpăta","recapatai":"recăpăta","recapatam":["recăpătăm","recăpăta","recăpătam","recăpăta"],"recapatand":"recăpăta","recapatara":"recăpăta","recapataram":"recăpăta","recapatarati":"recăpăta","recapatarea":"recăpătare","recapatari":"recăpătare","recapatarii":"recăpătare","recapatarile":"recăpătare","recapatarilor":"recăpătare","recapatase":"recăpăta","recapatasem":"recăpăta","recapatasera":"recăpăta","recapataseram":"recăpăta","recapataserati":"recăpăta","recapatasesi":"recăpăta","recapatasi":"recăpăta","recapatat":"recăpăta","recapatati":"recăpăta","recapatau":"recăpăta","recapati":"recăpăta","recapitulai":"recapitula","recapitulam":["recapitulăm","recapitula","recapitulam","recapitula"],"recapituland":"recapitula","recapitulara":"recapitula","recapitularam":"recapitula","recapitularati":"recapitula","recapitularea":"recapitulare","recapitulari":"recapitulare","recapitularii":"recapitulare","recapitularile":"recapitulare","recapitularilor":"recapitulare","recapitulase":"recapitula","recapitulasem":"recapitula","recapitulasera":"recapitula","recapitulaseram":"recapitula","recapitulaserati":"recapitula","recapitulasesi":"recapitula","recapitulasi":"recapitula","recapitulat":"recapitula","recapitulati":"recapitula","recapitulatia":"recapitulație","recapitulatiei":"recapitulație","recapitulatii":"recapitulație","recapitulatiile":"recapitulație","recapitulatiilor":"recapitulație","recapitulativa":["recapitulativă","recapitulativ","recapitulativa","recapitulativ"],"recapitulative":"recapitulativ","recapitulativele":"recapitulativ","recapitulativi":"recapitulativ","recapitulativii":"recapitulativ","recapitulativul":"recapitulativ","recapitulau":"recapitula","recapituleaza":"recapitula","recapitulez":"recapitula","recapitulezi":"recapitula","recarburai":"recarbura","recarburam":["recarburăm","recarbura","recarburam","recarbura"],"recarburand":"recarbura","recarburara":"recarbura","recarburaram":"recarbura","recarburarati":"recarbura","recarburarea":"recarburare","recarburari":"recarburare","recarburarii":"recarburare","recarburarile":"recarburare","recarburarilor":"recarburare","recarburase":"recarbura","recarburasem":"recarbura","recarburasera":"recarbura","recarburaseram":"recarbura","recarburaserati":"recarbura","recarburasesi":"recarbura","recarburasi":"recarbura","recarburat":"recarbura","recarburati":"recarbura","recarburau":"recarbura","recarbureaza":"recarbura","recarburez":"recarbura","recarburezi":"recarbura","recasatorea":"recăsători","recasatoreai":"recăsători","recasatoream":"recăsători","recasatoreati":"recăsători","recasatoreau":"recăsători","recasatoresc":"recăsători","recasatoreste":"recăsători","recasatoresti":"recăsători","recasatorii":"recăsători","recasatorim":"recăsători","recasatorind":"recăsători","recasatorira":"recăsători","recasatoriram":"recăsători","recasatorirati":"recăsători","recasatorirea":"recăsătorire","recasatoriri":"recăsătorire","recasatoririi":"recăsătorire","recasatoririle":"recăsătorire","recasatoririlor":"recăsătorire","recasatorise":"recăsători","recasatorisem":"recăsători","recasatorisera":"recăsători","recasatoriseram":"recăsători","recasatoriserati":"recăsători","recasatorisesi":"recăsători","recasatorisi":"recăsători","recasatorit":"recăsători","recasatorita":["recăsătorită","recăsătorit","recăsătorita","recăsătorit"],"recasatorite":"recăsătorit","recasatoritele":"recăsătorit","recasatoriti":["recăsătoriți","recăsători","recăsătoriți","recăsătorit"],"recasatoritii":"recăsătorit","recasatoritul":"recăsătorit","recastig":"recâștiga","recastigai":"recâștiga","recastigam":["recâștigăm","recâștiga","recâștigam","recâștiga"],"recastigand":"recâștiga","recastigara":"recâștiga","recastigaram":"recâștiga","recastigarati":"recâștiga","recastigarea":"recâștigare","recastigari":"recâștigare","recastigarii":"recâștigare","recastigase":"recâștiga","recastigasem":"recâștiga","recastigasera":"recâștiga","recastigaseram":"recâștiga","recastigaserati":"recâștiga","recastigasesi":"recâștiga","recastigasi":"recâștiga","recastigat":"recâștiga","recastigati":"recâștiga","recastigau":"recâștiga","recastigi":"recâștiga","recategoris":"recategorisi","recategorise":"recategorisi","recategorisea":"recategorisi","recategoriseai":"recategorisi","recategoriseam":"recategorisi","recategoriseati":"recategorisi","recategoriseau":"recategorisi","recategorisie":"recategorisi","recategorisii":"recategorisi","recategorisim":"recategorisi","recategorisind":"recategorisi","recategorisira":"recategorisi","recategorisiram":"recategorisi","recategorisirati":"recategorisi","recategorisise":"recategorisi","recategorisisem":"recategorisi","recategorisisera":"recategorisi","recategorisiseram":"recategorisi","recategorisiserati":"recategorisi","recategorisisesi":"recategorisi","recategorisisi":"recategorisi","recategorisit":"recategorisi","recategorisiti":"recategorisi","recazand":"recădea","recazi":"recădea","recazu":"recădea","recazui":"recădea","recazura":"recădea","recazuram":"recădea","recazurati":"recădea","recazuse":"recădea","recazusem":"recădea","recazusera":"recădea","recazuseram":"recădea","recazuserati":"recădea","recazusesi":"recădea","recazusi":"recădea","recazut":"recădea","recea":"rece","receapa":"recepe","recedai":"receda","recedam":["recedăm","receda","recedam","receda"],"recedand":"receda","recedara":"receda","recedaram":"receda","recedarati":"receda","recedase":"receda","recedasem":"receda","recedasera":"receda","recedaseram":"receda","recedaserati":"receda","recedasesi":"receda","recedasi":"receda","recedat":"receda","recedati":"receda","recedau":"receda","recedeaza":"receda","recedez":"receda","recedezi":"receda","recelai":"recela","recelam":["recelăm","recela","recelam","recela"],"receland":"recela","recelara":"recela","recelaram":"recela","recelarati":"recela","recelase":"recela","recelasem":"recela","recelasera":"recela","recelaseram":"recela","recelaserati":"recela","recelasesi":"recela","recelasi":"recela","recelat":"recela","recelati":"recela","recelau":"recela","recele":"rece","receleaza":"recela","recelez":"recela","recelezi":"recela","recensamantul":"recensământ","recensamantule":"recensământ","recensamantului":"recensământ","recensamanturi":"recensământ","recensamanturile":"recensământ","recensamanturilor":"recensământ","recenta":["recentă","recent","recenta","recent"],"recente":"recent","recentele":"recent","recenti":"recent","recentii":"recent","recentul":"recent","recenzai":"recenza","recenzam":["recenzăm","recenza","recenzam","recenza"],"recenzand":"recenza","recenzara":"recenza","recenzaram":"recenza","recenzarati":"recenza","recenzarea":"recenzare","recenzari":"recenzare","recenzarii":"recenzare","recenzarile":"recenzare","recenzarilor":"recenzare","recenzase":"recenza","recenzasem":"recenza","recenzasera":"recenza","recenzaseram":"recenza","recenzaserati":"recenza","recenzasesi":"recenza","recenzasi":"recenza","recenzat":"recenza","recenzata":["recenzată","recenzat","recenzata","recenzat"],"recenzate":"recenzat","recenzatele":"recenzat","recenzati":["recenzați","recenza","recenzați","recenzat"],"recenzatii":"recenzat","recenzatul":"recenzat","recenzau":"recenza","recenzeaza":"recenza","recenzente":"recenzentă","recenzentei":"recenzentă","recenzentele":"recenzentă","recenzentelor":"recenzentă","recenzenti":"recenzent","recenzentii":"recenzent","recenzentilor":"recenzent","recenzentul":"recenzent","recenzentule":"recenzent","recenzentului":"recenzent","recenzez":"recenza","recenzezi":"recenza","recenzia":"recenzie","recenziei":"recenzie","recenzii":"recenzie","recenziile":"recenzie","recenziilor":"recenzie","recenziunea":"recenziune","recenziuni":"recenziune","recenziunii":"recenziune","recenziunile":"recenziune","recenziunilor":"recenziune","recenzoarea":"recenzoare","recenzoarei":"recenzoare","recenzoarele":"recenzoare","recenzoarelor":"recenzoare","recenzori":"recenzor","recenzorii":"recenzor","recenzorilor":"recenzor","recenzorul":"recenzor","recenzorule":"recenzor","recenzorului":"recenzor","recep":"recepe","recepand":"recepe","recepea":"recepe","recepeai":"recepe","recepeam":"recepe","recepeati":"recepe","recepeau":"recepe","recepem":"recepe","recepeti":"recepe","recepi":"recepe","receptacle":"receptaclu","receptaclele":"receptaclu","receptaclelor":"receptaclu","receptacluul":"receptaclu","receptacluule":"receptaclu","receptacluului":"receptaclu","receptacole":"receptacol","receptacule":"receptacul","receptaculele":"receptacul","receptaculelor":"receptacul","receptaculul":"receptacul","receptaculule":"receptacul","receptaculului":"receptacul","receptarea":"receptare","receptari":"receptare","receptarii":"receptare","receptarile":"receptare","receptarilor":"receptare","receptia":"recepție","receptiei":"recepție","receptii":"recepție","receptiile":"recepție","receptiilor":"recepție","receptionai":"recepționa","receptionam":["recepționăm","recepționa","recepționam","recepționa"],"receptionand":"recepționa","receptionara":"recepționa","receptionaram":"recepționa","receptionarati":"recepționa","receptionarea":"recepționare","receptionari":"recepționare","receptionarii":"recepționare","receptionarile":"recepționare","receptionarilor":"recepționare","receptionase":"recepționa","receptionasem":"recepționa","receptionasera":"recepționa","receptionaseram":"recepționa","receptionaserati":"recepționa","receptionasesi":"recepționa","receptionasi":"recepționa","receptionat":"recepționa","receptionata":["recepționată","recepționat","recepționata","recepționat"],"receptionate":"recepționat","receptionatele":"recepționat","receptionati":["recepționați","recepționa","recepționați","recepționat"],"receptionatii":"recepționat","receptionatul":"recepționat","receptionau":"recepționa","receptioneaza":"recepționa","receptionere":"recepționeră","receptionerei":"recepționeră","receptionerele":"recepționeră","receptionerelor":"recepționeră","receptioneri":"recepționer","receptionerii":"recepționer","receptionerilor":"recepționer","receptionerul":"recepționer","receptionerule":"recepționer","receptionerului":"recepționer","receptionez":"recepționa","receptionezi":"recepționa","receptiunea":"recepțiune","receptiuni":"recepțiune","receptiunii":"recepțiune","receptiunile":"recepțiune","receptiunilor":"recepțiune","receptiva":["receptivă","receptiv","receptiva","receptiv"],"receptive":"receptiv","receptivele":"receptiv","receptivi":"receptiv","receptivii":"receptiv","receptivitatea":"receptivitate","receptivitati":"receptivitate","receptivitatii":"receptivitate","receptivitatile":"receptivitate","receptivitatilor":"receptivitate","receptivul":"receptiv","receptoare":"receptor","receptoarea":"receptor","receptoarele":"receptor","receptoarelor":"receptor","receptori":"receptor","receptorii":"receptor","receptorilor":"receptor","receptorul":"receptor","receptorule":"receptor","receptorului":"receptor","recepu":"recepe","recepui":"recepe","recepura":"recepe","recepuram":"recepe","recepurati":"recepe","recepuse":"recepe","recepusem":"recepe","recepusera":"recepe","recepuseram":"recepe","recepuserati":"recepe","recepusesi":"recepe","recepusi":"recepe","receput":"recepe","recercetai":"recerceta","recercetam":["recercetăm","recerceta","recercetam","recerceta"],"recercetand":"recerceta","recercetara":"recerceta","recercetaram":"recerceta","recercetarati":"recerceta","recercetarea":"recercetare","recercetari":"recercetare","recercetarii":"recercetare","recercetarile":"recercetare","recercetarilor":"recercetare","recercetase":"recerceta","recercetasem":"recerceta","recercetasera":"recerceta","recercetaseram":"recerceta","recercetaserati":"recerceta","recercetasesi":"recerceta","recercetasi":"recerceta","recercetat":"recerceta","recercetata":["recercetată","recercetat","recercetata","recercetat"],"recercetate":"recercetat","recercetatele":"recercetat","recercetati":["recercetați","recerceta","recercetați","recercetat"],"recercetatii":"recercetat","recercetatul":"recercetat","recercetau":"recerceta","recerceteaza":"recerceta","recercetez":"recerceta","recercetezi":"recerceta","recesii":"recesie","recesionista":["recesionistă","recesionist","recesionista","recesionist"],"recesioniste":"recesionist","recesionistele":"recesionist","recesionisti":"recesionist","recesionistii":"recesionist","recesionistul":"recesionist","recesiunea":"recesiune","recesiuni":"recesiune","recesiunii":"recesiune","recesiunile":"recesiune","recesiunilor":"recesiune","recesiva":["recesivă","recesiv","recesiva","recesiv"],"recesive":"recesiv","recesivele":"recesiv","recesivi":"recesiv","recesivii":"recesiv","recesivitatea":"recesivitate","recesivitati":"recesivitate","recesivitatii":"recesivitate","recesivul":"recesiv","rechem":"rechema","rechemai":"rechema","rechemam":["rechemăm","rechema","rechemam","rechema"],"rechemand":"rechema","rechemara":"rechema","rechemaram":"rechema","rechemarati":"rechema","rechemarea":"rechemare","rechemari":"rechemare","rechemarii":"rechemare","rechemarile":"rechemare","rechemarilor":"rechemare","rechemase":"rechema","rechemasem":"rechema","rechemasera":"rechema","rechemaseram":"rechema","rechemaserati":"rechema","rechemasesi":"rechema","rechemasi":"rechema","rechemat":"rechema","rechemata":["rechemată","rechemat","rechemata","rechemat"],"rechemate":"rechemat","rechematele":"rechemat","rechemati":["rechemați","rechema","rechemați","rechemat"],"rechematii":"rechemat","rechematul":"rechemat","rechemau":"rechema","rechemi":"rechema","rechia":"rechie","rechiei":"rechie","rechii":"rechie","rechiile":"rechie","rechiilor":"rechie","rechini":"rechin","rechini albastri":"rechin albastru","rechinii":"rechin","rechinilor":"rechin","rechinul":"rechin","rechinule":"rechin","rechinului":"rechin","rechizitele":"rechizite","rechizitelor":"rechizite","rechizitia":"rechiziție","rechizitiei":"rechiziție","rechizitii":"rechiziție","rechizitiile":"rechiziție","rechizitiilor":"rechiziție","rechizitionai":"rechiziționa","rechizitionam":["rechiziționăm","rechiziționa","rechiziționam","rechiziționa"],"rechizitionand":"rechiziționa","rechizitionara":"rechiziționa","rechizitionaram":"rechiziționa","rechizitionarati":"rechiziționa","rechizitionarea":"rechiziționare","rechizitionari":"rechiziționare","rechizitionarii":"rechiziționare","rechizitionarile":"rechiziționare","rechizitionarilor":"rechiziționare","rechizitionase":"rechiziționa","rechizitionasem":"rechiziționa","rechizitionasera":"rechiziționa","rechizitionaseram":"rechiziționa","rechizitionaserati":"rechiziționa","rechizitionasesi":"rechiziționa","rechizitionasi":"rechiziționa","rechizitionat":"rechiziționa","rechizitionata":["rechiziționată","rechiziționat","rechiziționata","rechiziționat"],"rechizitionate":"rechiziționat","rechizitionatele":"rechiziționat","rechizitionati":["rechiziționați","rechiziționa","rechiziționați","rechiziționat"],"rechizitionatii":"rechiziționat","rechizitionatul":"rechiziționat","rechizitionau":"rechiziționa","rechizitioneaza":"rechiziționa","rechizitionez":"rechiziționa","rechizitionezi":"rechiziționa","rechizitiunea":"rechizițiune","rechizitiuni":"rechizițiune","rechizitiunii":"rechizițiune","rechizitiunile":"rechizițiune","rechizitiunilor":"rechizițiune","rechizitoriala":["rechizitorială","rechizitorial","rechizitoriala","rechizitorial"],"rechizitoriale":"rechizitorial","rechizitorialele":"rechizitorial","rechizitoriali":"rechizitorial","rechizitorialii":"rechizitorial","rechizitorialul":"rechizitorial","rechizitorii":["rechizitorii","rechizitor","rechizitorii","rechizitoriu"],"rechizitoriile":["rechizitoriile","rechizitor","rechizitoriile","rechizitoriu"],"rechizitoriilor":["rechizitoriilor","rechizitor","rechizitoriilor","rechizitoriu"],"rechizitoriul":"rechizitoriu","rechizitoriule":"rechizitoriu","rechizitoriului":"rechizitoriu","rechizitorul":"rechizitor","rechizitorule":"rechizitor","rechizitorului":"rechizitor","reci":"rece","reciclabila":["reciclabilă","reciclabil","reciclabila","reciclabil"],"reciclabile":"reciclabil","reciclabilele":"reciclabil","reciclabili":"reciclabil","reciclabilii":"reciclabil","reciclabilul":"reciclabil","reciclai":"recicla","reciclam":["reciclăm","recicla","reciclam","recicla"],"recicland":"recicla","reciclara":"recicla","reciclaram":"recicla","reciclarati":"recicla","reciclarea":"reciclare","reciclari":"reciclare","reciclarii":"reciclare","reciclarile":"reciclare","reciclarilor":"reciclare","reciclase":"recicla","reciclasem":"recicla","reciclasera":"recicla","reciclaseram":"recicla","reciclaserati":"recicla","reciclasesi":"recicla","reciclasi":"recicla","reciclat":"recicla","reciclata":["reciclată","reciclat","reciclata","reciclat"],"reciclate":"reciclat","reciclatele":"reciclat","reciclati":["reciclați","recicla","reciclați","reciclat"],"reciclatii":"reciclat","reciclatul":"reciclat","reciclau":"recicla","recicleaza":"recicla","reciclez":"recicla","reciclezi":"recicla","recidivai":"recidiva","recidivam":["recidivăm","recidiva","recidivam","recidiva"],"recidivand":"recidiva","recidivanta":["recidivantă","recidivant","recidivanta","recidivant"],"recidivante":"recidivant","recidivantele":"recidivant","recidivanti":"recidivant","recidivantii":"recidivant","recidivantul":"recidivant","recidivara":"recidiva","recidivaram":"recidiva","recidivarati":"recidiva","recidivarea":"recidivare","recidivari":"recidivare","recidivarii":"recidivare","recidivarile":"recidivare","recidivarilor":"recidivare","recidivase":"recidiva","recidivasem":"recidiva","recidivasera":"recidiva","recidivaseram":"recidiva","recidivaserati":"recidiva","recidivasesi":"recidiva","recidivasi":"recidiva","recidivat":"recidiva","recidivati":"recidiva","recidivau":"recidiva","recidive":"recidivă","recidiveaza":"recidiva","recidivei":"recidivă","recidivele":"recidivă","recidivelor":"recidivă","recidivez":"recidiva","recidivezi":"recidiva","recidiviste":"recidivistă","recidivistei":"recidivistă","recidivistele":"recidivistă","recidivistelor":"recidivistă","recidivisti":"recidivist","recidivistii":"recidivist","recidivistilor":"recidivist","recidivistul":"recidivist","recidivistule":"recidivist","recidivistului":"recidivist","recidivitatea":"recidivitate","recidivitati":"recidivitate","recidivitatii":"recidivitate","recife":"recif","recifele":"recif","recifelor":"recif","reciful":"recif","recifule":"recif","recifului":"recif","recii":"rece","recile":"rece","recipiendare":"recipiendară","recipiendarei":"recipiendară","recipiendarele":"recipiendară","recipiendarelor":"recipiendară","recipiendari":"recipiendar","recipiendarii":"recipiendar","recipiendarilor":"recipiendar","recipiendarul":"recipiendar","recipiendarule":"recipiendar","recipiendarului":"recipiendar","recipiente":"recipient","recipientele":"recipient","recipientelor":"recipient","recipientul":"recipient","recipientule":"recipient","recipientului":"recipient","recipisaul":"recipisă","recipisaule":"recipisă","recipisaului":"recipisă","recipise":"recipisă","recipisele":"recipisă","recipiselor":"recipisă","recipospolite":"recipospolită","recipospolitei":"recipospolită","reciproca":["reciprocă","reciproc","reciproca","reciproc"],"reciproce":["reciproce","reciproc","reciproce","reciprocă"],"reciprocei":"reciprocă","reciprocele":["reciprocele","reciproc","reciprocele","reciprocă"],"reciprocelor":"reciprocă","reciproci":"reciproc","reciprocii":"reciproc","reciprocitatea":"reciprocitate","reciprocitati":"reciprocitate","reciprocitatii":"reciprocitate","reciprocul":"reciproc","recircul":"recircula","recirculai":"recircula","recirculam":["recirculăm","recircula","recirculam","recircula"],"recirculand":"recircula","recirculara":"recircula","recircularam":"recircula","recircularati":"recircula","recircularea":"recirculare","recirculari":"recirculare","recircularii":"recirculare","recircularile":"recirculare","recircularilor":"recirculare","recirculase":"recircula","recirculasem":"recircula","recirculasera":"recircula","recirculaseram":"recircula","recirculaserati":"recircula","recirculasesi":"recircula","recirculasi":"recircula","recirculat":"recircula","recirculati":"recircula","recirculatia":"recirculație","recirculatiei":"recirculație","recirculatii":"recirculație","recirculatiile":"recirculație","recirculatiilor":"recirculație","recirculau":"recircula","recirculi":"recircula","recisoara":["recișoară","recișor","recișoara","recișor"],"recisoare":"recișor","recisoarele":"recișor","recisori":"recișor","recisorii":"recișor","recisorul":"recișor","recit":"recita","recitai":"recita","recitalul":"recital","recitalule":"recital","recitalului":"recital","recitaluri":"recital","recitalurile":"recital","recitalurilor":"recital","recitam":["recităm","recita","recitam","recita"],"recitand":"recita","recitanta":["recitantă","recitant","recitanta","recitant"],"recitante":"recitant","recitantele":"recitant","recitanti":"recitant","recitantii":"recitant","recitantul":"recitant","recitara":"recita","recitaram":"recita","recitarati":"recita","recitarea":"recitare","recitari":"recitare","recitarii":"recitare","recitarile":"recitare","recitarilor":"recitare","recitase":"recita","recitasem":"recita","recitasera":"recita","recitaseram":"recita","recitaserati":"recita","recitasesi":"recita","recitasi":"recita","recitat":"recita","recitata":["recitată","recitat","recitata","recitat"],"recitate":"recitat","recitatele":"recitat","recitati":["recitați","recita","recitați","recitat"],"recitatia":"recitație","recitatiei":"recitație","recitatii":["recitații","recitat","recitații","recitație"],"recitatiile":"recitație","recitatiilor":"recitație","recitative":"recitativ","recitativele":"recitativ","recitativelor":"recitativ","recitativul":"recitativ","recitativule":"recitativ","recitativului":"recitativ","recitatoarea":"recitatoare","recitatoarei":"recitatoare","recitatoarele":"recitatoare","recitatoarelor":"recitatoare","recitatori":"recitator","recitatorii":"recitator","recitatorilor":"recitator","recitatorul":"recitator","recitatorule":"recitator","recitatorului":"recitator","recitatul":"recitat","recitau":"recita","recite":"recita","recitea":"reciti","reciteai":"reciti","reciteam":"reciti","reciteati":"reciti","reciteau":"reciti","recitesc":"reciti","reciteste":"reciti","recitesti":"reciti","reciti":"recita","recitii":"reciti","recitim":"reciti","recitind":"reciti","recitira":"reciti","recitiram":"reciti","recitirati":"reciti","recitirea":"recitire","recitiri":"recitire","recitirii":"recitire","recitirile":"recitire","recitirilor":"recitire","recitise":"reciti","recitisem":"reciti","recitisera":"reciti","recitiseram":"reciti","recitiserati":"reciti","recitisesi":"reciti","recitisi":"reciti","recitit":"reciti","recititi":"reciti","recladea":"reclădi","recladeai":"reclădi","recladeam":"reclădi","recladeati":"reclădi","recladeau":"reclădi","recladesc":"reclădi","recladeste":"reclădi","recladesti":"reclădi","recladii":"reclădi","recladim":"reclădi","recladind":"reclădi","recladira":"reclădi","recladiram":"reclădi","recladirati":"reclădi","recladirea":"reclădire","recladiri":"reclădire","recladirii":"reclădire","recladirile":"reclădire","recladirilor":"reclădire","recladise":"reclădi","recladisem":"reclădi","recladisera":"reclădi","recladiseram":"reclădi","recladiserati":"reclădi","recladisesi":"reclădi","recladisi":"reclădi","recladit":"reclădi","recladita":["reclădită","reclădit","reclădita","reclădit"],"recladite":"reclădit","recladitele":"reclădit","recladiti":["reclădiți","reclădi","reclădiți","reclădit"],"recladitii":"reclădit","recladitul":"reclădit","reclam":"reclama","reclamagii":"reclamagiu","reclamagiii":"reclamagiu","reclamagiilor":"reclamagiu","reclamagiuul":"reclamagiu","reclamagiuule":"reclamagiu","reclamagiuului":"reclamagiu","reclamai":"reclama","reclamam":["reclamăm","reclama","reclamam","reclama"],"reclamand":"reclama","reclamante":"reclamantă","reclamantei":"reclamantă","reclamantele":"reclamantă","reclamantelor":"reclamantă","reclamanti":"reclamant","reclamantii":"reclamant","reclamantilor":"reclamant","reclamantul":"reclamant","reclamantule":"reclamant","reclamantului":"reclamant","reclamara":"reclama","reclamaram":"reclama","reclamarati":"reclama","reclamarea":"reclamare","reclamari":"reclamare","reclamarii":"reclamare","reclamase":"reclama","reclamasem":"reclama","reclamasera":"reclama","reclamaseram":"reclama","reclamaserati":"reclama","reclamasesi":"reclama","reclamasi":"reclama","reclamat":"reclama","reclamata":["reclamată","reclamat","reclamata","reclamat"],"reclamate":"reclamat","reclamatele":"reclamat","reclamati":["reclamați","reclama","reclamați","reclamat"],"reclamatia":"reclamație","reclamatiei":"reclamație","reclamatii":["reclamații","reclamat","reclamații","reclamație"],"reclamatiile":"reclamație","reclamatiilor":"reclamație","reclamatiuni":"reclamațiune","reclamatori":"reclamator","reclamatorii":"reclamator","reclamatorilor":"reclamator","reclamatorul":"reclamator","reclamatorule":"reclamator","reclamatorului":"reclamator","reclamatul":"reclamat","reclamau":"reclama","reclame":["reclame","reclama","reclame","reclamă"],"reclameaza":"reclama","reclamei":"reclamă","reclamele":"reclamă","reclamelor":"reclamă","reclameze":"reclama","reclami":"reclama","reclasai":"reclasa","reclasam":["reclasăm","reclasa","reclasam","reclasa"],"reclasand":"reclasa","reclasara":"reclasa","reclasaram":"reclasa","reclasarati":"reclasa","reclasarea":"reclasare","reclasari":"reclasare","reclasarii":"reclasare","reclasarile":"reclasare","reclasarilor":"reclasare","reclasase":"reclasa","reclasasem":"reclasa","reclasasera":"reclasa","reclasaseram":"reclasa","reclasaserati":"reclasa","reclasasesi":"reclasa","reclasasi":"reclasa","reclasat":"reclasa","reclasati":"reclasa","reclasau":"reclasa","reclaseaza":"reclasa","reclasez":"reclasa","reclasezi":"reclasa","reclasific":"reclasifica","reclasificai":"reclasifica","reclasificam":["reclasificăm","reclasifica","reclasificam","reclasifica"],"reclasificand":"reclasifica","reclasificara":"reclasifica","reclasificaram":"reclasifica","reclasificarati":"reclasifica","reclasificarea":"reclasificare","reclasificari":"reclasificare","reclasificarii":"reclasificare","reclasificarile":"reclasificare","reclasificarilor":"reclasificare","reclasificase":"reclasifica","reclasificasem":"reclasifica","reclasificasera":"reclasifica","reclasificaseram":"reclasifica","reclasificaserati":"reclasifica","reclasificasesi":"reclasifica","reclasificasi":"reclasifica","reclasificat":"reclasifica","reclasificata":["reclasificată","reclasificat","reclasificata","reclasificat"],"reclasificate":"reclasificat","reclasificatele":"reclasificat","reclasificati":["reclasificați","reclasifica","reclasificați","reclasificat"],"reclasificatii":"reclasificat","reclasificatul":"reclasificat","reclasificau":"reclasifica","reclasifici":"reclasifica","recluziunea":"recluziune","recluziuni":"recluziune","recluziunii":"recluziune","recluziunile":"recluziune","recluziunilor":"recluziune","recoaca":"recoace","recoacem":"recoace","recoaceti":"recoace","recoapse":"recoace","recoapsera":"recoace","recoapseram":"recoace","recoapserati":"recoace","recoboara":"recoborî","recobor":"recoborî","recobora":["recoboră","recoborî","recobora","recoborî"],"recoborai":["recoborai","recoborî","recoborâi","recoborî"],"recoboram":["recoborâm","recoborî","recoboram","recoborî"],"recoborand":"recoborî","recoborara":"recoborî","recoboraram":"recoborî","recoborarati":"recoborî","recoborase":"recoborî","recoborasem":"recoborî","recoborasera":"recoborî","recoboraseram":"recoborî","recoboraserati":"recoborî","recoborasesi":"recoborî","recoborasi":"recoborî","recoborati":["recoborâți","recoborî","recoborați","recoborî"],"recoborau":"recoborî","recoborit":"recoborî","recoc":"recoace","recocand":"recoace","recocea":"recoace","recoceai":"recoace","recoceam":"recoace","recoceati":"recoace","recoceau":"recoace","recoci":"recoace","recognitia":"recogniție","recognitiei":"recogniție","recognitii":"recogniție","recognitiile":"recogniție","recognitiilor":"recogniție","recognitiunea":"recognițiune","recognitiuni":"recognițiune","recognitiunii":"recognițiune","recognitiunile":"recognițiune","recognitiunilor":"recognițiune","recognitiva":["recognitivă","recognitiv","recognitiva","recognitiv"],"recognitive":"recognitiv","recognitivele":"recognitiv","recognitivi":"recognitiv","recognitivii":"recognitiv","recognitivul":"recognitiv","recognoscibila":["recognoscibilă","recognoscibil","recognoscibila","recognoscibil"],"recognoscibile":"recognoscibil","recognoscibilele":"recognoscibil","recognoscibili":"recognoscibil","recognoscibilii":"recognoscibil","recognoscibilul":"recognoscibil","recolonizai":"recoloniza","recolonizam":["recolonizăm","recoloniza","recolonizam","recoloniza"],"recolonizand":"recoloniza","recolonizara":"recoloniza","recolonizaram":"recoloniza","recolonizarati":"recoloniza","recolonizarea":"recolonizare","recolonizari":"recolonizare","recolonizarii":"recolonizare","recolonizarile":"recolonizare","recolonizarilor":"recolonizare","recolonizase":"recoloniza","recolonizasem":"recoloniza","recolonizasera":"recoloniza","recolonizaseram":"recoloniza","recolonizaserati":"recoloniza","recolonizasesi":"recoloniza","recolonizasi":"recoloniza","recolonizat":"recoloniza","recolonizata":["recolonizată","recolonizat","recolonizata","recolonizat"],"recolonizate":"recolonizat","recolonizatele":"recolonizat","recolonizati":["recolonizați","recoloniza","recolonizați","recolonizat"],"recolonizatii":"recolonizat","recolonizatul":"recolonizat","recolonizau":"recoloniza","recolonizeaza":"recoloniza","recolonizez":"recoloniza","recolonizezi":"recoloniza","recolorai":"recolora","recoloram":["recolorăm","recolora","recoloram","recolora"],"recolorand":"recolora","recolorara":"recolora","recoloraram":"recolora","recolorarati":"recolora","recolorarea":"recolorare","recolorari":"recolorare","recolorarii":"recolorare","recolorarile":"recolorare","recolorarilor":"recolorare","recolorase":"recolora","recolorasem":"recolora","recolorasera":"recolora","recoloraseram":"recolora","recoloraserati":"recolora","recolorasesi":"recolora","recolorasi":"recolora","recolorat":"recolora","recolorata":["recolorată","recolorat","recolorata","recolorat"],"recolorate":"recolorat","recoloratele":"recolorat","recolorati":["recolorați","recolora","recolorați","recolorat"],"recoloratii":"recolorat","recoloratul":"recolorat","recolorau":"recolora","recoloreaza":"recolora","recolorez":"recolora","recolorezi":"recolora","recoltabila":["recoltabilă","recoltabil","recoltabila","recoltabil"],"recoltabile":"recoltabil","recoltabilele":"recoltabil","recoltabili":"recoltabil","recoltabilii":"recoltabil","recoltabilul":"recoltabil","recoltai":"recolta","recoltam":["recoltăm","recolta","recoltam","recolta"],"recoltand":"recolta","recoltara":"recolta","recoltaram":"recolta","recoltarati":"recolta","recoltarea":"recoltare","recoltari":"recoltare","recoltarii":"recoltare","recoltarile":"recoltare","recoltarilor":"recoltare","recoltase":"recolta","recoltasem":"recolta","recoltasera":"recolta","recoltaseram":"recolta","recoltaserati":"recolta","recoltasesi":"recolta","recoltasi":"recolta","recoltat":"recolta","recoltata":["recoltată","recoltat","recoltata","recoltat"],"recoltate":"recoltat","recoltatele":"recoltat","recoltati":["recoltați","recolta","recoltați","recoltat"],"recoltatii":"recoltat","recoltatul":"recoltat","recoltau":"recolta","recolte":"recoltă","recolteaza":"recolta","recoltez":"recolta","recoltezi":"recolta","recomand":"recomanda","recomandabila":["recomandabilă","recomandabil","recomandabila","recomandabil"],"recomandabile":"recomandabil","recomandabilele":"recomandabil","recomandabili":"recomandabil","recomandabilii":"recomandabil","recomandabilul":"recomandabil","recomandai":"recomanda","recomandam":["recomandăm","recomanda","recomandam","recomanda"],"recomandand":"recomanda","recomandara":"recomanda","recomandaram":"recomanda","recomandarati":"recomanda","recomandari":"recomandare","recomandase":"recomanda","recomandasem":"recomanda","recomandasera":"recomanda","recomandaseram":"recomanda","recomandaserati":"recomanda","recomandasesi":"recomanda","recomandasi":"recomanda","recomandat":"recomanda","recomandata":["recomandată","recomandat","recomandata","recomandat"],"recomandate":["recomandate","recomandat","recomandate","recomandată"],"recomandatei":"recomandată","recomandatele":["recomandatele","recomandat","recomandatele","recomandată"],"recomandatelor":"recomandată","recomandati":["recomandați","recomanda","recomandați","recomandat"],"recomandatia":"recomandație","recomandatiei":"recomandație","recomandatii":["recomandații","recomandat","recomandații","recomandație"],"recomandatiile":"recomandație","recomandatiilor":"recomandație","recomandatiunea":"recomandațiune","recomandatiuni":"recomandațiune","recomandatiunii":"recomandațiune","recomandatiunile":"recomandațiune","recomandatiunilor":"recomandațiune","recomandatul":"recomandat","recomandau":"recomanda","recomanzi":"recomanda","recombin":"recombina","recombinai":"recombina","recombinam":["recombinăm","recombina","recombinam","recombina"],"recombinand":"recombina","recombinara":"recombina","recombinaram":"recombina","recombinarati":"recombina","recombinarea":"recombinare","recombinari":"recombinare","recombinarii":"recombinare","recombinarile":"recombinare","recombinarilor":"recombinare","recombinase":"recombina","recombinasem":"recombina","recombinasera":"recombina","recombinaseram":"recombina","recombinaserati":"recombina","recombinasesi":"recombina","recombinasi":"recombina","recombinat":"recombina","recombinati":"recombina","recombinau":"recombina","recombini":"recombina","recomentai":"recomenta","recomentam":["recomentăm","recomenta","recomentam","recomenta"],"recomentand":"recomenta","recomentara":"recomenta","recomentaram":"recomenta","recomentarati":"recomenta","recomentarea":"recomentare","recomentari":"recomentare","recomentarii":"recomentare","recomentarile":"recomentare","recomentarilor":"recomentare","recomentase":"recomenta","recomentasem":"recomenta","recomentasera":"recomenta","recomentaseram":"recomenta","recomentaserati":"recomenta","recomentasesi":"recomenta","recomentasi":"recomenta","recomentat":"recomenta","recomentati":"recomenta","recomentau":"recomenta","recomenteaza":"recomenta","recomentez":"recomenta","recomentezi":"recomenta","recompartimentai":"recompartimenta","recompartimentam":["recompartimentăm","recompartimenta","recompartimentam","recompartimenta"],"recompartimentand":"recompartimenta","recompartimentara":"recompartimenta","recompartimentaram":"recompartimenta","recompartimentarati":"recompartimenta","recompartimentarea":"recompartimentare","recompartimentari":"recompartimentare","recompartimentarii":"recompartimentare","recompartimentarile":"recompartimentare","recompartimentarilor":"recompartimentare","recompartimentase":"recompartimenta","recompartimentasem":"recompartimenta","recompartimentasera":"recompartimenta","recompartimentaseram":"recompartimenta","recompartimentaserati":"recompartimenta","recompartimentasesi":"recompartimenta","recompartimentasi":"recompartimenta","recompartimentat":"recompartimenta","recompartimentata":["recompartimentată","recompartimentat","recompartimentata","recompartimentat"],"recompartimentate":"recompartimentat","recompartimentatele":"recompartimentat","recompartimentati":["recompartimentați","recompartimenta","recompartimentați","recompartimentat"],"recompartimentatii":"recompartimentat","recompartimentatul":"recompartimentat","recompartimentau":"recompartimenta","recompartimenteaza":"recompartimenta","recompartimentez":"recompartimenta","recompartimentezi":"recompartimenta","recompensai":"recompensa","recompensam":["recompensăm","recompensa","recompensam","recompensa"],"recompensand":"recompensa","recompensara":"recompensa","recompensaram":"recompensa","recompensarati":"recompensa","recompensarea":"recompensare","recompensari":"recompensare","recompensarii":"recompensare","recompensarile":"recompensare","recompensarilor":"recompensare","recompensase":"recompensa","recompensasem":"recompensa","recompensasera":"recompensa","recompensaseram":"recompensa","recompensaserati":"recompensa","recompensasesi":"recompensa","recompensasi":"recompensa","recompensat":"recompensa","recompensati":"recompensa","recompensatia":"recompensație","recompensatiei":"recompensație","recompensatii":"recompensație","recompensatiile":"recompensație","recompensatiilor":"recompensație","recompensau":"recompensa","recompense":"recompensă","recompenseaza":"recompensa","recompensei":"recompensă","recompensele":"recompensă","recompenselor":"recompensă","recompensez":"recompensa","recompensezi":"recompensa","recompozitia":"recompoziție","recompozitiei":"recompoziție","recompozitii":"recompoziție","recompozitiile":"recompoziție","recompozitiilor":"recompoziție","recompozitiunea":"recompozițiune","recompozitiuni":"recompozițiune","recompozitiunii":"recompozițiune","recompozitiunile":"recompozițiune","recompozitiunilor":"recompozițiune","recomprim":"recomprima","recomprimai":"recomprima","recomprimam":["recomprimăm","recomprima","recomprimam","recomprima"],"recomprimand":"recomprima","recomprimara":"recomprima","recomprimaram":"recomprima","recomprimarati":"recomprima","recomprimarea":"recomprimare","recomprimari":["recomprimări","recomprimare","recomprimari","recomprimare"],"recomprimarii":"recomprimare","recomprimarile":"recomprimare","recomprimarilor":"recomprimare","recomprimase":"recomprima","recomprimasem":"recomprima","recomprimasera":"recomprima","recomprimaseram":"recomprima","recomprimaserati":"recomprima","recomprimasesi":"recomprima","recomprimasi":"recomprima","recomprimat":"recomprima","recomprimati":"recomprima","recomprimau":"recomprima","recomprimi":"recomprima","recompui":"recompune","recompun":"recompune","recompuna":"recompune","recompunand":"recompune","recompunea":"recompune","recompuneai":"recompune","recompuneam":"recompune","recompuneati":"recompune","recompuneau":"recompune","recompunem":"recompune","recompunerea":"recompunere","recompuneri":"recompunere","recompunerii":"recompunere","recompunerile":"recompunere","recompunerilor":"recompunere","recompuneti":"recompune","recompus":"recompune","recompuse":"recompune","recompusei":"recompune","recompusera":"recompune","recompuseram":"recompune","recompuserati":"recompune","recompusese":"recompune","recompusesem":"recompune","recompusesera":"recompune","recompuseseram":"recompune","recompuseserati":"recompune","recompusesesi":"recompune","recompusesi":"recompune","reconciliabila":["reconciliabilă","reconciliabil","reconciliabila","reconciliabil"],"reconciliabile":"reconciliabil","reconciliabilele":"reconciliabil","reconciliabili":"reconciliabil","reconciliabilii":"reconciliabil","reconciliabilul":"reconciliabil","reconciliarea":"reconciliare","reconciliat":"reconcilia","reconciliatia":"reconciliație","reconciliatiei":"reconciliație","reconciliatii":"reconciliație","reconciliatiile":"reconciliație","reconciliatiilor":"reconciliație","reconciliaza":"reconcilia","reconcilieri":["reconcilieri","reconciliare","reconcilieri","reconciliere"],"reconcilierii":"reconciliare","reconcilierile":"reconciliare","reconcilierilor":"reconciliare","reconditionai":"recondiționa","reconditionam":["recondiționăm","recondiționa","recondiționam","recondiționa"],"reconditionand":"recondiționa","reconditionara":"recondiționa","reconditionaram":"recondiționa","reconditionarati":"recondiționa","reconditionarea":"recondiționare","reconditionari":"recondiționare","reconditionarii":"recondiționare","reconditionarile":"recondiționare","reconditionarilor":"recondiționare","reconditionase":"recondiționa","reconditionasem":"recondiționa","reconditionasera":"recondiționa","reconditionaseram":"recondiționa","reconditionaserati":"recondiționa","reconditionasesi":"recondiționa","reconditionasi":"recondiționa","reconditionat":"recondiționa","reconditionata":["recondiționată","recondiționat","recondiționata","recondiționat"],"reconditionate":"recondiționat","reconditionatele":"recondiționat","reconditionati":["recondiționați","recondiționa","recondiționați","recondiționat"],"reconditionatii":"recondiționat","reconditionatul":"recondiționat","reconditionau":"recondiționa","reconditioneaza":"recondiționa","reconditionez":"recondiționa","reconditionezi":"recondiționa","reconductia":"reconducție","reconductiei":"reconducție","reconductii":"reconducție","reconductiile":"reconducție","reconductiilor":"reconducție","reconfigur":"reconfigura","reconfigurai":"reconfigura","reconfiguram":["reconfigurăm","reconfigura","reconfiguram","reconfigura"],"reconfigurand":"reconfigura","reconfigurara":"reconfigura","reconfiguraram":"reconfigura","reconfigurarati":"reconfigura","reconfigurarea":"reconfigurare","reconfigurari":"reconfigurare","reconfigurarii":"reconfigurare","reconfigurarile":"reconfigurare","reconfigurarilor":"reconfigurare","reconfigurase":"reconfigura","reconfigurasem":"reconfigura","reconfigurasera":"reconfigura","reconfiguraseram":"reconfigura","reconfiguraserati":"reconfigura","reconfigurasesi":"reconfigura","reconfigurasi":"reconfigura","reconfigurat":"reconfigura","reconfigurata":["reconfigurată","reconfigurat","reconfigurata","reconfigurat"],"reconfigurate":"reconfigurat","reconfiguratele":"reconfigurat","reconfigurati":["reconfigurați","reconfigura","reconfigurați","reconfigurat"],"reconfiguratii":"reconfigurat","reconfiguratul":"reconfigurat","reconfigurau":"reconfigura","reconfigureaza":"reconfigura","reconfiguri":"reconfigura","reconfirm":"reconfirma","reconfirmai":"reconfirma","reconfirmam":["reconfirmăm","reconfirma","reconfirmam","reconfirma"],"reconfirmand":"reconfirma","reconfirmara":"reconfirma","reconfirmaram":"reconfirma","reconfirmarati":"reconfirma","reconfirmarea":"reconfirmare","reconfirmari":"reconfirmare","reconfirmarii":"reconfirmare","reconfirmarile":"reconfirmare","reconfirmarilor":"reconfirmare","reconfirmase":"reconfirma","reconfirmasem":"reconfirma","reconfirmasera":"reconfirma","reconfirmaseram":"reconfirma","reconfirmaserati":"reconfirma","reconfirmasesi":"reconfirma","reconfirmasi":"reconfirma","reconfirmat":"reconfirma","reconfirmata":["reconfirmată","reconfirmat","reconfirmata","reconfirmat"],"reconfirmate":"reconfirmat","reconfirmatele":"reconfirmat","reconfirmati":["reconfirmați","reconfirma","reconfirmați","reconfirmat"],"reconfirmatii":"reconfirmat","reconfirmatul":"reconfirmat","reconfirmau":"reconfirma","reconfirmi":"reconfirma","reconfortai":"reconforta","reconfortam":["reconfortăm","reconforta","reconfortam","reconforta"],"reconfortand":"reconforta","reconfortanta":["reconfortantă","reconfortant","reconfortanta","reconfortant"],"reconfortante":"reconfortant","reconfortantele":"reconfortant","reconfortanti":"reconfortant","reconfortantii":"reconfortant","reconfortantul":"reconfortant","reconfortara":"reconforta","reconfortaram":"reconforta","reconfortarati":"reconforta","reconfortarea":"reconfortare","reconfortari":"reconfortare","reconfortarii":"reconfortare","reconfortarile":"reconfortare","reconfortarilor":"reconfortare","reconfortase":"reconforta","reconfortasem":"reconforta","reconfortasera":"reconforta","reconfortaseram":"reconforta","reconfortaserati":"reconforta","reconfortasesi":"reconforta","reconfortasi":"reconforta","reconfortat":"reconforta","reconfortati":"reconforta","reconfortau":"reconforta","reconforteaza":"reconforta","reconfortez":"reconforta","reconfortezi":"reconforta","reconfortul":"reconfort","reconfortule":"reconfort","reconfortului":"reconfort","reconsider":"reconsidera","reconsiderai":"reconsidera","reconsideram":["reconsiderăm","reconsidera","reconsideram","reconsidera"],"reconsiderand":"reconsidera","reconsiderara":"reconsidera","reconsideraram":"reconsidera","reconsiderarati":"reconsidera","reconsiderarea":"reconsiderare","reconsiderari":"reconsiderare","reconsiderarii":"reconsiderare","reconsiderarile":"reconsiderare","reconsiderarilor":"reconsiderare","reconsiderase":"reconsidera","reconsiderasem":"reconsidera","reconsiderasera":"reconsidera","reconsideraseram":"reconsidera","reconsideraserati":"reconsidera","reconsiderasesi":"reconsidera","reconsiderasi":"reconsidera","reconsiderat":"reconsidera","reconsiderati":"reconsidera","reconsiderau":"reconsidera","reconsidere":"reconsidera","reconsideri":"reconsidera","reconsolidai":"reconsolida","reconsolidam":["reconsolidăm","reconsolida","reconsolidam","reconsolida"],"reconsolidand":"reconsolida","reconsolidara":"reconsolida","reconsolidaram":"reconsolida","reconsolidarati":"reconsolida","reconsolidarea":"reconsolidare","reconsolidari":"reconsolidare","reconsolidarii":"reconsolidare","reconsolidarile":"reconsolidare","reconsolidarilor":"reconsolidare","reconsolidase":"reconsolida","reconsolidasem":"reconsolida","reconsolidasera":"reconsolida","reconsolidaseram":"reconsolida","reconsolidaserati":"reconsolida","reconsolidasesi":"reconsolida","reconsolidasi":"reconsolida","reconsolidat":"reconsolida","reconsolidata":["reconsolidată","reconsolidat","reconsolidata","reconsolidat"],"reconsolidate":"reconsolidat","reconsolidatele":"reconsolidat","reconsolidati":["reconsolidați","reconsolida","reconsolidați","reconsolidat"],"reconsolidatii":"reconsolidat","reconsolidatul":"reconsolidat","reconsolidau":"reconsolida","reconsolideaza":"reconsolida","reconsolidez":"reconsolida","reconsolidezi":"reconsolida","reconstatarea":"reconstatare","reconstatari":"reconstatare","reconstatarii":"reconstatare","reconstatarile":"reconstatare","reconstatarilor":"reconstatare","reconstituia":"reconstitui","reconstituiai":"reconstitui","reconstituiam":"reconstitui","reconstituiati":"reconstitui","reconstituiau":"reconstitui","reconstituie":"reconstitui","reconstituii":"reconstitui","reconstituim":"reconstitui","reconstituind":"reconstitui","reconstituira":"reconstitui","reconstituiram":"reconstitui","reconstituirati":"reconstitui","reconstituirea":"reconstituire","reconstituiri":"reconstituire","reconstituirii":"reconstituire","reconstituirile":"reconstituire","reconstituirilor":"reconstituire","reconstituise":"reconstitui","reconstituisem":"reconstitui","reconstituisera":"reconstitui","reconstituiseram":"reconstitui","reconstituiserati":"reconstitui","reconstituisesi":"reconstitui","reconstituisi":"reconstitui","reconstituit":"reconstitui","reconstituita":["reconstituită","reconstituit","reconstituita","reconstituit"],"reconstituite":"reconstituit","reconstituitele":"reconstituit","reconstituiti":["reconstituiți","reconstitui","reconstituiți","reconstituit"],"reconstituitii":"reconstituit","reconstituitul":"reconstituit","reconstitutia":"reconstituție","reconstitutiei":"reconstituție","reconstitutii":"reconstituție","reconstitutiile":"reconstituție","reconstitutiilor":"reconstituție","reconstitutiunea":"reconstituțiune","reconstitutiuni":"reconstituțiune","reconstitutiunii":"reconstituțiune","reconstitutiunile":"reconstituțiune","reconstitutiunilor":"reconstituțiune","reconstructia":"reconstrucție","reconstructiei":"reconstrucție","reconstructii":"reconstrucție","reconstructiile":"reconstrucție","reconstructiilor":"reconstrucție","reconstructiunea":"reconstrucțiune","reconstructiuni":"reconstrucțiune","reconstructiunii":"reconstrucțiune","reconstructiunile":"reconstrucțiune","reconstructiunilor":"reconstrucțiune","reconstructiva":["reconstructivă","reconstructiv","reconstructiva","reconstructiv"],"reconstructive":"reconstructiv","reconstructivele":"reconstructiv","reconstructivi":"reconstructiv","reconstructivii":"reconstructiv","reconstructivul":"reconstructiv","reconstruia":"reconstrui","reconstruiai":"reconstrui","reconstruiam":"reconstrui","reconstruiati":"reconstrui","reconstruiau":"reconstrui","reconstruiesc":"reconstrui","reconstruieste":"reconstrui","reconstruiesti":"reconstrui","reconstruii":"reconstrui","reconstruim":"reconstrui","reconstruind":"reconstrui","reconstruira":"reconstrui","reconstruiram":"reconstrui","reconstruirati":"reconstrui","reconstruirea":"reconstruire","reconstruiri":"reconstruire","reconstruirii":"reconstruire","reconstruirile":"reconstruire","reconstruirilor":"reconstruire","reconstruise":"reconstrui","reconstruisem":"reconstrui","reconstruisera":"reconstrui","reconstruiseram":"reconstrui","reconstruiserati":"reconstrui","reconstruisesi":"reconstrui","reconstruisi":"reconstrui","reconstruit":"reconstrui","reconstruita":["reconstruită","reconstruit","reconstruita","reconstruit"],"reconstruite":"reconstruit","reconstruitele":"reconstruit","reconstruiti":["reconstruiți","reconstrui","reconstruiți","reconstruit"],"reconstruitii":"reconstruit","reconstruitul":"reconstruit","reconvalescente":"reconvalescență","reconvalescentei":"reconvalescență","reconvalescentele":"reconvalescență","reconvalescentelor":"reconvalescență","reconvalescenti":"reconvalescent","reconvalescentii":"reconvalescent","reconvalescentilor":"reconvalescent","reconvalescentul":"reconvalescent","reconvalescentule":"reconvalescent","reconvalescentului":"reconvalescent","reconventiunea":"reconvențiune","reconventiuni":"reconvențiune","reconventiunii":"reconvențiune","reconventiunile":"reconvențiune","reconventiunilor":"reconvențiune","reconversia":"reconversie","reconversiei":"reconversie","reconversii":"reconversie","reconversiile":"reconversie","reconversiilor":"reconversie","reconversiunea":"reconversiune","reconversiuni":"reconversiune","reconversiunii":"reconversiune","reconversiunile":"reconversiune","reconversiunilor":"reconversiune","reconvertea":"reconverti","reconverteai":"reconverti","reconverteam":"reconverti","reconverteati":"reconverti","reconverteau":"reconverti","reconvertesc":"reconverti","reconverteste":"reconverti","reconvertesti":"reconverti","reconvertii":"reconverti","reconvertim":"reconverti","reconvertind":"reconverti","reconvertira":"reconverti","reconvertiram":"reconverti","reconvertirati":"reconverti","reconvertirea":"reconvertire","reconvertiri":"reconvertire","reconvertirii":"reconvertire","reconvertirile":"reconvertire","reconvertirilor":"reconvertire","reconvertise":"reconverti","reconvertisem":"reconverti","reconvertisera":"reconverti","reconvertiseram":"reconverti","reconvertiserati":"reconverti","reconvertisesi":"reconverti","reconvertisi":"reconverti","reconvertit":"reconverti","reconvertita":["reconvertită","reconvertit","reconvertita","reconvertit"],"reconvertite":"reconvertit","reconvertitele":"reconvertit","reconvertiti":["reconvertiți","reconverti","reconvertiți","reconvertit"],"reconvertitii":"reconvertit","reconvertitul":"reconvertit","reconvoc":"reconvoca","reconvocai":"reconvoca","reconvocam":["reconvocăm","reconvoca","reconvocam","reconvoca"],"reconvocand":"reconvoca","reconvocara":"reconvoca","reconvocaram":"reconvoca","reconvocarati":"reconvoca","reconvocarea":"reconvocare","reconvocari":"reconvocare","reconvocarii":"reconvocare","reconvocarile":"reconvocare","reconvocarilor":"reconvocare","reconvocase":"reconvoca","reconvocasem":"reconvoca","reconvocasera":"reconvoca","reconvocaseram":"reconvoca","reconvocaserati":"reconvoca","reconvocasesi":"reconvoca","reconvocasi":"reconvoca","reconvocat":"reconvoca","reconvocata":["reconvocată","reconvocat","reconvocata","reconvocat"],"reconvocate":"reconvocat","reconvocatele":"reconvocat","reconvocati":["reconvocați","reconvoca","reconvocați","reconvocat"],"reconvocatii":"reconvocat","reconvocatul":"reconvocat","reconvocau":"reconvoca","reconvoci":"reconvoca","recopiai":"recopia","recopiam":"recopia","recopiara":"recopia","recopiaram":"recopia","recopiarati":"recopia","recopiase":"recopia","recopiasem":"recopia","recopiasera":"recopia","recopiaseram":"recopia","recopiaserati":"recopia","recopiasesi":"recopia","recopiasi":"recopia","recopiat":"recopia","recopiata":["recopiată","recopiat","recopiata","recopiat"],"recopiate":"recopiat","recopiatele":"recopiat","recopiati":["recopiați","recopia","recopiați","recopiat"],"recopiatii":"recopiat","recopiatul":"recopiat","recopiau":"recopia","recopiaza":"recopia","recopie":"recopia","recopieaza":"recopia","recopiem":"recopia","recopierea":"recopiere","recopieri":"recopiere","recopierii":"recopiere","recopierile":"recopiere","recopierilor":"recopiere","recopiez":"recopia","recopiezi":"recopia","recopiind":"recopia","recopsei":"recoace","recopsese":"recoace","recopsesem":"recoace","recopsesera":"recoace","recopseseram":"recoace","recopseserati":"recoace","recopsesesi":"recoace","recopsesi":"recoace","recopt":"recoace","recordiste":"recordistă","recordistei":"recordistă","recordistele":"recordistă","recordistelor":"recordistă","recordmane":"recordmană","recordmanei":"recordmană","recordmanele":"recordmană","recordmanelor":"recordmană","recordmanul":"recordman","recordmanule":"recordman","recordmanului":"recordman","recordmene":"recordmenă","recordmenei":"recordmenă","recordmenele":"recordmenă","recordmenelor":"recordmenă","recordmeni":["recordmeni","recordman","recordmeni","recordmen"],"recordmenii":["recordmenii","recordman","recordmenii","recordmen"],"recordmenilor":["recordmenilor","recordman","recordmenilor","recordmen"],"recordmenul":"recordmen","recordmenule":"recordmen","recordmenului":"recordmen","recordul":"record","recordule":"record","recordului":"record","recorduri":"record","recordurile":"record","recordurilor":"record","recreai":"recrea","recream":["recreăm","recrea","recream","recrea"],"recreand":"recrea","recreara":"recrea","recrearam":"recrea","recrearati":"recrea","recrearea":"recreare","recreari":"recreare","recrearii":"recreare","recrearile":"recreare","recrearilor":"recreare","recrease":"recrea","recreasem":"recrea","recreasera":"recrea","recreaseram":"recrea","recreaserati":"recrea","recreasesi":"recrea","recreasi":"recrea","recreat":"recrea","recreata":["recreată","recreat","recreata","recreat"],"recreate":"recreat","recreatele":"recreat","recreati":["recreați","recrea","recreați","recreat"],"recreatia":"recreație","recreatiei":"recreație","recreatii":["recreații","recreat","recreații","recreație"],"recreatiile":"recreație","recreatiilor":"recreație","recreationala":["recreațională","recreațional","recreaționala","recreațional"],"recreationale":"recreațional","recreationalele":"recreațional","recreationali":"recreațional","recreationalii":"recreațional","recreationalul":"recreațional","recreatiune":"recreație","recreatiuni":"recreațiune","recreativa":["recreativă","recreativ","recreativa","recreativ"],"recreative":"recreativ","recreativele":"recreativ","recreativi":"recreativ","recreativii":"recreativ","recreativul":"recreativ","recreatoare":"recreator","recreatoarea":"recreator","recreatoarele":"recreator","recreatori":"recreator","recreatorii":"recreator","recreatorul":"recreator","recreatul":"recreat","recreau":"recrea","recreeaza":"recrea","recreerea":"recreere","recreeri":"recreere","recreerii":"recreere","recreerile":"recreere","recreerilor":"recreere","recreez":"recrea","recreezi":"recrea","recremantul":"recremânt","recremantule":"recremânt","recremantului":"recremânt","recriminai":"recrimina","recriminam":["recriminăm","recrimina","recriminam","recrimina"],"recriminand":"recrimina","recriminara":"recrimina","recriminaram":"recrimina"};
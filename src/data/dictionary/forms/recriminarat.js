@@ -0,0 +1 @@
+export default {"recriminarati":"recrimina","recriminarea":"recriminare","recriminari":"recriminare","recriminarii":"recriminare","recriminarile":"recriminare","recriminarilor":"recriminare","recriminase":"recrimina","recriminasem":"recrimina","recriminasera":"recrimina","recriminaseram":"recrimina","recriminaserati":"recrimina","recriminasesi":"recrimina","recriminasi":"recrimina","recriminat":"recrimina","recriminati":"recrimina","recriminatia":"recriminație","recriminatiei":"recriminație","recriminatii":"recriminație","recriminatiile":"recriminație","recriminatiilor":"recriminație","recriminatiunea":"recriminațiune","recriminatiuni":"recriminațiune","recriminatiunii":"recriminațiune","recriminatiunile":"recriminațiune","recriminatiunilor":"recriminațiune","recriminau":"recrimina","recrimineaza":"recrimina","recriminez":"recrimina","recriminezi":"recrimina","recristalizarea":"recristalizare","recristalizari":"recristalizare","recristalizarii":"recristalizare","recristalizarile":"recristalizare","recristalizarilor":"recristalizare","recromai":"recroma","recromam":["recromăm","recroma","recromam","recroma"],"recromand":"recroma","recromara":"recroma","recromaram":"recroma","recromarati":"recroma","recromarea":"recromare","recromari":["recromări","recromare","recromari","recromare"],"recromarii":"recromare","recromarile":"recromare","recromarilor":"recromare","recromase":"recroma","recromasem":"recroma","recromasera":"recroma","recromaseram":"recroma","recromaserati":"recroma","recromasesi":"recroma","recromasi":"recroma","recromat":"recroma","recromata":["recromată","recromat","recromata","recromat"],"recromate":"recromat","recromatele":"recromat","recromati":["recromați","recroma","recromați","recromat"],"recromatii":"recromat","recromatul":"recromat","recromau":"recroma","recromeaza":"recroma","recromez":"recroma","recromezi":"recroma","recrudescenta":["recrudescentă","recrudescent","recrudescenta","recrudescent"],"recrudescente":["recrudescente","recrudescent","recrudescențe","recrudescență"],"recrudescentei":"recrudescență","recrudescentele":["recrudescentele","recrudescent","recrudescențele","recrudescență"],"recrudescentelor":"recrudescență","recrudescenti":"recrudescent","recrudescentii":"recrudescent","recrudescentul":"recrudescent","recrutai":"recruta","recrutam":["recrutăm","recruta","recrutam","recruta"],"recrutamente":"recrutament","recrutamentele":"recrutament","recrutamentelor":"recrutament","recrutamentul":"recrutament","recrutamentule":"recrutament","recrutamentului":"recrutament","recrutand":"recruta","recrutara":"recruta","recrutaram":"recruta","recrutarati":"recruta","recrutarea":"recrutare","recrutari":"recrutare","recrutarii":"recrutare","recrutarile":"recrutare","recrutarilor":"recrutare","recrutase":"recruta","recrutasem":"recruta","recrutasera":"recruta","recrutaseram":"recruta","recrutaserati":"recruta","recrutasesi":"recruta","recrutasi":"recruta","recrutat":"recruta","recrutati":"recruta","recrutatia":"recrutație","recrutatiei":"recrutație","recrutatii":"recrutație","recrutatiile":"recrutație","recrutatiilor":"recrutație","recrutatori":"recrutător","recrutatorii":"recrutător","recrutatorilor":"recrutător","recrutatorul":"recrutător","recrutatorule":"recrutător","recrutatorului":"recrutător","recrutau":"recruta","recrute":"recrută","recruteaza":"recruta","recrutei":"recrută","recrutele":"recrută","recrutelor":"recrută","recrutez":"recruta","recrutezi":"recruta","recruti":"recrut","recrutii":"recrut","recrutilor":"recrut","recrutori":"recrutor","recrutorii":"recrutor","recrutorilor":"recrutor","recrutorul":"recrutor","recrutorule":"recrutor","recrutorului":"recrutor","recrutul":"recrut","recrutule":"recrut","recrutului":"recrut","rectala":["rectală","rectal","rectala","rectal"],"rectale":"rectal","rectalele":"rectal","rectalgia":"rectalgie","rectalgiei":"rectalgie","rectalgii":"rectalgie","rectalgiile":"rectalgie","rectalgiilor":"rectalgie","rectali":"rectal","rectalii":"rectal","rectaluia":"rectălui","rectaluiai":"rectălui","rectaluiam":"rectălui","rectaluiati":"rectălui","rectaluiau":"rectălui","rectaluie":"rectălui","rectaluii":"rectălui","rectaluim":"rectălui","rectaluind":"rectălui","rectaluira":"rectălui","rectaluiram":"rectălui","rectaluirati":"rectălui","rectaluise":"rectălui","rectaluisem":"rectălui","rectaluisera":"rectălui","rectaluiseram":"rectălui","rectaluiserati":"rectălui","rectaluisesi":"rectălui","rectaluisi":"rectălui","rectaluit":"rectălui","rectaluiti":"rectălui","rectalul":"rectal","rectangulara":["rectangulară","rectangular","rectangulara","rectangular"],"rectangulare":"rectangular","rectangularele":"rectangular","rectangulari":"rectangular","rectangularii":"rectangular","rectangularul":"rectangular","rectangule":"rectangul","rectangulele":"rectangul","rectangulelor":"rectangul","rectangulul":"rectangul","rectangulule":"rectangul","rectangulului":"rectangul","rectific":"rectifica","rectificabila":["rectificabilă","rectificabil","rectificabila","rectificabil"],"rectificabile":"rectificabil","rectificabilele":"rectificabil","rectificabili":"rectificabil","rectificabilii":"rectificabil","rectificabilul":"rectificabil","rectificai":"rectifica","rectificam":["rectificăm","rectifica","rectificam","rectifica"],"rectificand":"rectifica","rectificara":"rectifica","rectificaram":"rectifica","rectificarati":"rectifica","rectificarea":"rectificare","rectificari":"rectificare","rectificarii":"rectificare","rectificarile":"rectificare","rectificarilor":"rectificare","rectificase":"rectifica","rectificasem":"rectifica","rectificasera":"rectifica","rectificaseram":"rectifica","rectificaserati":"rectifica","rectificasesi":"rectifica","rectificasi":"rectifica","rectificat":"rectifica","rectificati":"rectifica","rectificatia":"rectificație","rectificatiei":"rectificație","rectificatii":"rectificație","rectificatiile":"rectificație","rectificatiilor":"rectificație","rectificativa":["rectificativă","rectificativ","rectificativa","rectificativ"],"rectificative":"rectificativ","rectificativele":"rectificativ","rectificativi":"rectificativ","rectificativii":"rectificativ","rectificativul":"rectificativ","rectificatoare":"rectificator","rectificatoarea":["rectificatoarea","rectificatoare","rectificatoarea","rectificator"],"rectificatoarei":"rectificatoare","rectificatoarele":["rectificatoarele","rectificatoare","rectificatoarele","rectificator"],"rectificatoarelor":"rectificatoare","rectificatori":"rectificator","rectificatorii":"rectificator","rectificatorilor":"rectificator","rectificatorul":"rectificator","rectificatorule":"rectificator","rectificatorului":"rectificator","rectificatul":"rectificat","rectificatule":"rectificat","rectificatului":"rectificat","rectificau":"rectifica","rectifice":"rectifica","rectifici":"rectifica","rectilina":["rectilină","rectilin","rectilina","rectilin"],"rectiline":"rectilin","rectilinele":"rectilin","rectilini":"rectilin","rectilinia":"rectiliniu","rectiliniara":["rectiliniară","rectiliniar","rectiliniara","rectiliniar"],"rectiliniare":"rectiliniar","rectiliniarele":"rectiliniar","rectiliniari":"rectiliniar","rectiliniarii":"rectiliniar","rectiliniaritatea":"rectiliniaritate","rectiliniaritati":"rectiliniaritate","rectiliniaritatii":"rectiliniaritate","rectiliniaritatile":"rectiliniaritate","rectiliniaritatilor":"rectiliniaritate","rectiliniarul":"rectiliniar","rectilinie":"rectiliniu","rectilinii":["rectilinii","rectilin","rectilinii","rectiliniu"],"rectiliniii":"rectiliniu","rectiliniile":"rectiliniu","rectiliniul":"rectiliniu","rectilinul":"rectilin","rectitudinea":"rectitudine","rectitudini":"rectitudine","rectitudinii":"rectitudine","rectiunea":"recțiune","rectiuni":"recțiune","rectiunii":"recțiune","rectiunile":"recțiune","rectiunilor":"recțiune","rectorala":["rectorală","rectoral","rectorala","rectoral"],"rectorale":"rectoral","rectoralele":"rectoral","rectorali":"rectoral","rectoralii":"rectoral","rectoralul":"rectoral","rectorate":"rectorat","rectoratele":"rectorat","rectoratelor":"rectorat","rectoratul":"rectorat","rectoratule":"rectorat","rectoratului":"rectorat","rectori":"rector","rectorii":"rector","rectorilor":"rector","rectorul":"rector","rectorule":"rector","rectorului":"rector","rectoscoape":"rectoscop","rectoscoapele":"rectoscop","rectoscoapelor":"rectoscop","rectoscopia":"rectoscopie","rectoscopiei":"rectoscopie","rectoscopii":"rectoscopie","rectoscopiile":"rectoscopie","rectoscopiilor":"rectoscopie","rectoscopul":"rectoscop","rectoscopule":"rectoscop","rectoscopului":"rectoscop","rectoul":"recto","rectoule":"recto","rectoului":"recto","rectricea":"rectrice","rectricei":"rectrice","rectricele":"rectrice","rectricelor":"rectrice","rectul":"rect","rectule":"rect","rectului":"rect","recturi":"rect","recturile":"rect","recturilor":"rect","recucerea":"recuceri","recucereai":"recuceri","recuceream":"recuceri","recucereati":"recuceri","recucereau":"recuceri","recuceresc":"recuceri","recucereste":"recuceri","recuceresti":"recuceri","recucerii":"recuceri","recucerim":"recuceri","recucerind":"recuceri","recucerira":"recuceri","recuceriram":"recuceri","recucerirati":"recuceri","recucerirea":"recucerire","recuceriri":"recucerire","recuceririi":"recucerire","recuceririle":"recucerire","recuceririlor":"recucerire","recucerise":"recuceri","recucerisem":"recuceri","recucerisera":"recuceri","recuceriseram":"recuceri","recuceriserati":"recuceri","recucerisesi":"recuceri","recucerisi":"recuceri","recucerit":"recuceri","recucerita":["recucerită","recucerit","recucerita","recucerit"],"recucerite":"recucerit","recuceritele":"recucerit","recuceriti":["recuceriți","recuceri","recuceriți","recucerit"],"recuceritii":"recucerit","recuceritul":"recucerit","recul":"rec","reculai":"recula","reculam":["reculăm","recula","reculam","recula"],"reculand":"recula","reculara":"recula","recularam":"recula","recularati":"recula","reculase":"recula","reculasem":"recula","reculasera":"recula","reculaseram":"recula","reculaserati":"recula","reculasesi":"recula","reculasi":"recula","reculat":"recula","reculati":"recula","reculau":"recula","recule":"rec","reculeaga":"reculege","reculeaza":"recula","reculeg":"reculege","reculegand":"reculege","reculegea":"reculege","reculegeai":"reculege","reculegeam":"reculege","reculegeati":"reculege","reculegeau":"reculege","reculegem":"reculege","reculegerea":"reculegere","reculegeri":"reculegere","reculegerii":"reculegere","reculegerile":"reculegere","reculegerilor":"reculegere","reculegeti":"reculege","reculegi":"reculege","recules":"reculege","reculesa":["reculesă","recules","reculesa","recules"],"reculese":["reculese","reculege","reculese","recules"],"reculesei":"reculege","reculesele":"recules","reculesera":"reculege","reculeseram":"reculege","reculeserati":"reculege","reculesese":"reculege","reculesesem":"reculege","reculesesera":"reculege","reculeseseram":"reculege","reculeseserati":"reculege","reculesesesi":"reculege","reculesesi":"reculege","reculesi":"recules","reculesii":"recules","reculesul":"recules","reculez":"recula","reculezi":"recula","recului":"rec","reculul":"recul","reculule":"recul","reculului":"recul","reculuri":"recul","reculurile":"recul","reculurilor":"recul","recunoasca":"recunoaște","recunoastem":"recunoaște","recunoasterea":"recunoaștere","recunoasteri":"recunoaștere","recunoasterii":"recunoaștere","recunoasterile":"recunoaștere","recunoasterilor":"recunoaștere","recunoasteti":"recunoaște","recunosc":"recunoaște","recunoscand":"recunoaște","recunoscatoare":"recunoscător","recunoscatoarea":"recunoscător","recunoscatoarele":"recunoscător","recunoscatori":"recunoscător","recunoscatorii":"recunoscător","recunoscatorul":"recunoscător","recunoscu":"recunoaște","recunoscui":"recunoaște","recunoscura":"recunoaște","recunoscuram":"recunoaște","recunoscurati":"recunoaște","recunoscuse":"recunoaște","recunoscusem":"recunoaște","recunoscusera":"recunoaște","recunoscuseram":"recunoaște","recunoscuserati":"recunoaște","recunoscusesi":"recunoaște","recunoscusi":"recunoaște","recunoscut":"recunoaște","recunoscuta":["recunoscută","recunoscut","recunoscuta","recunoscut"],"recunoscute":"recunoscut","recunoscutele":"recunoscut","recunoscuti":"recunoscut","recunoscutii":"recunoscut","recunoscutul":"recunoscut","recunoste":"recunoaște","recunostea":"recunoaște","recunosteai":"recunoaște","recunosteam":"recunoaște","recunosteati":"recunoaște","recunosteau":"recunoaște","recunosti":"recunoaște","recunostinte":"recunoștință","recunostintei":"recunoștință","recunostintele":"recunoștință","recunostintelor":"recunoștință","recuperabila":["recuperabilă","recuperabil","recuperabila","recuperabil"],"recuperabile":"recuperabil","recuperabilele":"recuperabil","recuperabili":"recuperabil","recuperabilii":"recuperabil","recuperabilitatea":"recuperabilitate","recuperabilitati":"recuperabilitate","recuperabilitatii":"recuperabilitate","recuperabilitatile":"recuperabilitate","recuperabilitatilor":"recuperabilitate","recuperabilul":"recuperabil","recuperai":"recupera","recuperam":["recuperăm","recupera","recuperam","recupera"],"recuperand":"recupera","recuperara":"recupera","recuperaram":"recupera","recuperarati":"recupera","recuperarea":"recuperare","recuperari":"recuperare","recuperarii":"recuperare","recuperarile":"recuperare","recuperarilor":"recuperare","recuperase":"recupera","recuperasem":"recupera","recuperasera":"recupera","recuperaseram":"recupera","recuperaserati":"recupera","recuperasesi":"recupera","recuperasi":"recupera","recuperat":"recupera","recuperata":["recuperată","recuperat","recuperata","recuperat"],"recuperate":"recuperat","recuperatele":"recuperat","recuperati":["recuperați","recupera","recuperați","recuperat"],"recuperatii":"recuperat","recuperatoare":"recuperator","recuperatoarele":"recuperator","recuperatoarelor":"recuperator","recuperatorul":"recuperator","recuperatorule":"recuperator","recuperatorului":"recuperator","recuperatul":"recuperat","recuperau":"recupera","recupereaza":"recupera","recuperez":"recupera","recuperezi":"recupera","recurbai":"recurba","recurbam":["recurbăm","recurba","recurbam","recurba"],"recurband":"recurba","recurbara":"recurba","recurbaram":"recurba","recurbarati":"recurba","recurbase":"recurba","recurbasem":"recurba","recurbasera":"recurba","recurbaseram":"recurba","recurbaserati":"recurba","recurbasesi":"recurba","recurbasi":"recurba","recurbat":"recurba","recurbati":"recurba","recurbau":"recurba","recurbeaza":"recurba","recurbez":"recurba","recurbezi":"recurba","recurenta":["recurentă","recurent","recurenta","recurent"],"recurente":["recurente","recurent","recurențe","recurență"],"recurentei":"recurență","recurentele":["recurentele","recurent","recurențele","recurență"],"recurentelor":"recurență","recurenti":"recurent","recurentii":"recurent","recurentul":"recurent","recurg":"recurge","recurga":"recurge","recurgand":"recurge","recurgea":"recurge","recurgeai":"recurge","recurgeam":"recurge","recurgeati":"recurge","recurgeau":"recurge","recurgem":"recurge","recurgerea":"recurgere","recurgerei":"recurgere","recurgeti":"recurge","recurgi":"recurge","recuri":"rec","recurile":"rec","recurilor":"rec","recurs":"recurge","recurse":"recurge","recursei":"recurge","recursera":"recurge","recurseram":"recurge","recurserati":"recurge","recursese":"recurge","recursesem":"recurge","recursesera":"recurge","recurseseram":"recurge","recurseserati":"recurge","recursesesi":"recurge","recursesi":"recurge","recursiunea":"recursiune","recursiuni":"recursiune","recursiunii":"recursiune","recursiunile":"recursiune","recursiunilor":"recursiune","recursiva":["recursivă","recursiv","recursiva","recursiv"],"recursive":"recursiv","recursivele":"recursiv","recursivi":"recursiv","recursivii":"recursiv","recursivitatea":"recursivitate","recursivitati":"recursivitate","recursivitatii":"recursivitate","recursivul":"recursiv","recursoria":"recursoriu","recursorie":"recursoriu","recursorii":"recursoriu","recursoriii":"recursoriu","recursoriile":"recursoriu","recursoriul":"recursoriu","recursul":"recurs","recursule":"recurs","recursului":"recurs","recursuri":"recurs","recursurile":"recurs","recursurilor":"recurs","recuz":"recuza","recuzabila":["recuzabilă","recuzabil","recuzabila","recuzabil"],"recuzabile":"recuzabil","recuzabilele":"recuzabil","recuzabili":"recuzabil","recuzabilii":"recuzabil","recuzabilul":"recuzabil","recuzai":"recuza","recuzam":["recuzăm","recuza","recuzam","recuza"],"recuzand":"recuza","recuzara":"recuza","recuzaram":"recuza","recuzarati":"recuza","recuzarea":"recuzare","recuzari":"recuzare","recuzarii":"recuzare","recuzarile":"recuzare","recuzarilor":"recuzare","recuzase":"recuza","recuzasem":"recuza","recuzasera":"recuza","recuzaseram":"recuza","recuzaserati":"recuza","recuzasesi":"recuza","recuzasi":"recuza","recuzat":"recuza","recuzata":["recuzată","recuzat","recuzata","recuzat"],"recuzate":["recuzate","recuzat","recuzate","recuzată"],"recuzatei":"recuzată","recuzatele":["recuzatele","recuzat","recuzatele","recuzată"],"recuzatelor":"recuzată","recuzati":["recuzați","recuza","recuzați","recuzat"],"recuzatia":"recuzație","recuzatiei":"recuzație","recuzatii":["recuzații","recuzat","recuzații","recuzație"],"recuzatiile":"recuzație","recuzatiilor":"recuzație","recuzatiunea":"recuzațiune","recuzatiuni":"recuzațiune","recuzatiunii":"recuzațiune","recuzatiunile":"recuzațiune","recuzatiunilor":"recuzațiune","recuzatul":"recuzat","recuzau":"recuza","recuzi":"recuza","recuzite":"recuzită","recuzitei":"recuzită","recuzitele":"recuzită","recuzitelor":"recuzită","recuzitoarea":"recuzitoare","recuzitoarei":"recuzitoare","recuzitoarele":"recuzitoare","recuzitoarelor":"recuzitoare","recviemul":"recviem","recviemule":"recviem","recviemului":"recviem","recviemuri":"recviem","recviemurile":"recviem","recviemurilor":"recviem","recvizitori":"recvizitor","recvizitorii":"recvizitor","recvizitorilor":"recvizitor","recvizitorul":"recvizitor","recvizitorule":"recvizitor","recvizitorului":"recvizitor","redactai":"redacta","redactam":["redactăm","redacta","redactam","redacta"],"redactand":"redacta","redactara":"redacta","redactaram":"redacta","redactarati":"redacta","redactarea":"redactare","redactari":"redactare","redactarii":"redactare","redactarile":"redactare","redactarilor":"redactare","redactase":"redacta","redactasem":"redacta","redactasera":"redacta","redactaseram":"redacta","redactaserati":"redacta","redactasesi":"redacta","redactasi":"redacta","redactat":"redacta","redactata":["redactată","redactat","redactata","redactat"],"redactate":"redactat","redactatele":"redactat","redactati":["redactați","redacta","redactați","redactat"],"redactatii":"redactat","redactatul":"redactat","redactau":"redacta","redacteaza":"redacta","redactez":"redacta","redactezi":"redacta","redactia":"redacție","redactiei":"redacție","redactii":"redacție","redactiile":"redacție","redactiilor":"redacție","redactionala":["redacțională","redacțional","redacționala","redacțional"],"redactionale":"redacțional","redactionalele":"redacțional","redactionali":"redacțional","redactionalii":"redacțional","redactionalul":"redacțional","redactiunea":"redacțiune","redactiuni":"redacțiune","redactiunii":"redacțiune","redactiunile":"redacțiune","redactiunilor":"redacțiune","redactoarea":"redactoare","redactoarei":"redactoare","redactoarele":"redactoare","redactoarelor":"redactoare","redactori":"redactor","redactorii":"redactor","redactorilor":"redactor","redactorul":"redactor","redactorule":"redactor","redactorului":"redactor","redai":"reda","redam":["redăm","reda","redam","reda"],"redand":"reda","redane":"redan","redanele":"redan","redanelor":"redan","redanul":"redan","redanule":"redan","redanului":"redan","redara":"reda","redaram":"reda","redarati":"reda","redarea":"redare","redari":"redare","redarii":"redare","redarile":"redare","redarilor":"redare","redaruia":"redărui","redaruiai":"redărui","redaruiam":"redărui","redaruiati":"redărui","redaruiau":"redărui","redaruie":"redărui","redaruii":"redărui","redaruim":"redărui","redaruind":"redărui","redaruira":"redărui","redaruiram":"redărui","redaruirati":"redărui","redaruise":"redărui","redaruisem":"redărui","redaruisera":"redărui","redaruiseram":"redărui","redaruiserati":"redărui","redaruisesi":"redărui","redaruisi":"redărui","redaruit":"redărui","redaruiti":"redărui","redase":"reda","redasem":"reda","redasera":"reda","redaseram":"reda","redaserati":"reda","redasesi":"reda","redasi":"reda","redat":"reda","redatai":"redata","redatam":["redatăm","redata","redatam","redata"],"redatand":"redata","redatara":"redata","redataram":"redata","redatarati":"redata","redatarea":"redatare","redatari":"redatare","redatarii":"redatare","redatarile":"redatare","redatarilor":"redatare","redatase":"redata","redatasem":"redata","redatasera":"redata","redataseram":"redata","redataserati":"redata","redatasesi":"redata","redatasi":"redata","redatat":"redata","redatata":["redatată","redatat","redatata","redatat"],"redatate":"redatat","redatatele":"redatat","redatati":["redatați","redata","redatați","redatat"],"redatatii":"redatat","redatatul":"redatat","redatau":"redata","redateaza":"redata","redatez":"redata","redatezi":"redata","redati":"reda","redau":"reda","redea":"reda","redefinea":"redefini","redefineai":"redefini","redefineam":"redefini","redefineati":"redefini","redefineau":"redefini","redefinesc":"redefini","redefineste":"redefini","redefinesti":"redefini","redefinii":"redefini","redefinim":"redefini","redefinind":"redefini","redefinira":"redefini","redefiniram":"redefini","redefinirati":"redefini","redefinirea":"redefinire","redefiniri":"redefinire","redefinirii":"redefinire","redefinirile":"redefinire","redefinirilor":"redefinire","redefinise":"redefini","redefinisem":"redefini","redefinisera":"redefini","redefiniseram":"redefini","redefiniserati":"redefini","redefinisesi":"redefini","redefinisi":"redefini","redefinit":"redefini","redefinita":["redefinită","redefinit","redefinita","redefinit"],"redefinite":"redefinit","redefinitele":"redefinit","redefiniti":["redefiniți","redefini","redefiniți","redefinit"],"redefinitii":"redefinit","redefinitul":"redefinit","redemptiunea":"redempțiune","redemptiuni":"redempțiune","redemptiunii":"redempțiune","redemptiunile":"redempțiune","redemptiunilor":"redempțiune","redeschid":"redeschide","redeschida":"redeschide","redeschidea":"redeschide","redeschideai":"redeschide","redeschideam":"redeschide","redeschideati":"redeschide","redeschideau":"redeschide","redeschidem":"redeschide","redeschiderea":"redeschidere","redeschideri":"redeschidere","redeschiderii":"redeschidere","redeschiderile":"redeschidere","redeschiderilor":"redeschidere","redeschideti":"redeschide","redeschis":"redeschide","redeschisa":["redeschisă","redeschis","redeschisa","redeschis"],"redeschise":["redeschise","redeschide","redeschise","redeschis"],"redeschisei":"redeschide","redeschisele":"redeschis","redeschisera":"redeschide","redeschiseram":"redeschide","redeschiserati":"redeschide","redeschisese":"redeschide","redeschisesem":"redeschide","redeschisesera":"redeschide","redeschiseseram":"redeschide","redeschiseserati":"redeschide","redeschisesesi":"redeschide","redeschisesi":"redeschide","redeschisi":"redeschis","redeschisii":"redeschis","redeschisul":"redeschis","redeschizand":"redeschide","redeschizi":"redeschide","redescopare":"redescoperi","redescoper":"redescoperi","redescopere":"redescoperi","redescoperea":"redescoperi","redescopereai":"redescoperi","redescopeream":"redescoperi","redescopereati":"redescoperi","redescopereau":"redescoperi","redescoperii":"redescoperi","redescoperim":"redescoperi","redescoperind":"redescoperi","redescoperira":"redescoperi","redescoperiram":"redescoperi","redescoperirati":"redescoperi","redescoperiri":"redescoperire","redescoperise":"redescoperi","redescoperisem":"redescoperi","redescoperisera":"redescoperi","redescoperiseram":"redescoperi","redescoperiserati":"redescoperi","redescoperisesi":"redescoperi","redescoperisi":"redescoperi","redescoperit":"redescoperi","redescoperita":["redescoperită","redescoperit","redescoperita","redescoperit"],"redescoperite":"redescoperit","redescoperitele":"redescoperit","redescoperiti":["redescoperiți","redescoperi","redescoperiți","redescoperit"],"redescoperitii":"redescoperit","redescoperitul":"redescoperit","redesteapta":"redeștepta","redestept":"redeștepta","redesteptai":"redeștepta","redesteptam":["redeșteptăm","redeștepta","redeșteptam","redeștepta"],"redesteptand":"redeștepta","redesteptara":"redeștepta","redesteptaram":"redeștepta","redesteptarati":"redeștepta","redesteptarea":"redeșteptare","redesteptari":"redeșteptare","redesteptarii":"redeșteptare","redesteptarile":"redeșteptare","redesteptarilor":"redeșteptare","redesteptase":"redeștepta","redesteptasem":"redeștepta","redesteptasera":"redeștepta","redesteptaseram":"redeștepta","redesteptaserati":"redeștepta","redesteptasesi":"redeștepta","redesteptasi":"redeștepta","redesteptat":"redeștepta","redesteptati":"redeștepta","redesteptau":"redeștepta","redestepti":"redeștepta","redeven":"redeveni","redevene":"redeveni","redevenea":"redeveni","redeveneai":"redeveni","redeveneam":"redeveni","redeveneati":"redeveni","redeveneau":"redeveni","redevenii":"redeveni","redevenim":"redeveni","redevenind":"redeveni","redevenira":"redeveni","redeveniram":"redeveni","redevenirati":"redeveni","redevenirea":"redevenire","redeveniri":"redevenire","redevenirii":"redevenire","redevenirile":"redevenire","redevenirilor":"redevenire","redevenise":"redeveni","redevenisem":"redeveni","redevenisera":"redeveni","redeveniseram":"redeveni","redeveniserati":"redeveni","redevenisesi":"redeveni","redevenisi":"redeveni","redevenit":"redeveni","redeveniti":"redeveni","redevente":"redevență","redeventei":"redevență","redeventele":"redevență","redeventelor":"redevență","redevine":"redeveni","redhibitiunea":"redhibițiune","redhibitiuni":"redhibițiune","redhibitiunii":"redhibițiune","redhibitiunile":"redhibițiune","redhibitiunilor":"redhibițiune","redia":"redie","rediei":"redie","rediful":"redif","redifule":"redif","redifului":"redif","redii":"redie","rediile":"redie","rediilor":"redie","redijai":"redija","redijam":["redijăm","redija","redijam","redija"],"redijand":"redija","redijara":"redija","redijaram":"redija","redijarati":"redija","redijarea":"redijare","redijari":"redijare","redijarii":"redijare","redijarile":"redijare","redijarilor":"redijare","redijase":"redija","redijasem":"redija","redijasera":"redija","redijaseram":"redija","redijaserati":"redija","redijasesi":"redija","redijasi":"redija","redijat":"redija","redijati":"redija","redijau":"redija","redijeaza":"redija","redijez":"redija","redijezi":"redija","redimensionai":"redimensiona","redimensionam":["redimensionăm","redimensiona","redimensionam","redimensiona"],"redimensionand":"redimensiona","redimensionara":"redimensiona","redimensionaram":"redimensiona","redimensionarati":"redimensiona","redimensionarea":"redimensionare","redimensionari":"redimensionare","redimensionarii":"redimensionare","redimensionarile":"redimensionare","redimensionarilor":"redimensionare","redimensionase":"redimensiona","redimensionasem":"redimensiona","redimensionasera":"redimensiona","redimensionaseram":"redimensiona","redimensionaserati":"redimensiona","redimensionasesi":"redimensiona","redimensionasi":"redimensiona","redimensionat":"redimensiona","redimensionata":["redimensionată","redimensionat","redimensionata","redimensionat"],"redimensionate":"redimensionat","redimensionatele":"redimensionat","redimensionati":["redimensionați","redimensiona","redimensionați","redimensionat"],"redimensionatii":"redimensionat","redimensionatul":"redimensionat","redimensionau":"redimensiona","redimensioneaza":"redimensiona","redimensionez":"redimensiona","redimensionezi":"redimensiona","redingote":"redingotă","redingotei":"redingotă","redingotele":"redingotă","redingotelor":"redingotă","rediscut":"rediscuta","rediscutai":"rediscuta","rediscutam":["rediscutăm","rediscuta","rediscutam","rediscuta"],"rediscutand":"rediscuta","rediscutara":"rediscuta","rediscutaram":"rediscuta","rediscutarati":"rediscuta","rediscutarea":"rediscutare","rediscutari":"rediscutare","rediscutarii":"rediscutare","rediscutarile":"rediscutare","rediscutarilor":"rediscutare","rediscutase":"rediscuta","rediscutasem":"rediscuta","rediscutasera":"rediscuta","rediscutaseram":"rediscuta","rediscutaserati":"rediscuta","rediscutasesi":"rediscuta","rediscutasi":"rediscuta","rediscutat":"rediscuta","rediscutati":"rediscuta","rediscutau":"rediscuta","rediscute":"rediscuta","rediscuti":"rediscuta","redispar":"redispărea","redispara":"redispărea","redisparand":"redispărea","redispare":["redispare","redispărea","redispăre","redispărea"],"redispareai":"redispărea","redispaream":"redispărea","redispareati":"redispărea","redispareau":"redispărea","redisparem":"redispărea","redispareti":"redispărea","redispari":"redispărea","redisparu":"redispărea","redisparui":"redispărea","redisparura":"redispărea","redisparuram":"redispărea","redisparurati":"redispărea","redisparuse":"redispărea","redisparusem":"redispărea","redisparusera":"redispărea","redisparuseram":"redispărea","redisparuserati":"redispărea","redisparusesi":"redispărea","redisparusi":"redispărea","redisparut":"redispărea","redistilai":"redistila","redistilam":["redistilăm","redistila","redistilam","redistila"],"redistiland":"redistila","redistilara":"redistila","redistilaram":"redistila","redistilarati":"redistila","redistilarea":"redistilare","redistilari":"redistilare","redistilarii":"redistilare","redistilarile":"redistilare","redistilarilor":"redistilare","redistilase":"redistila","redistilasem":"redistila","redistilasera":"redistila","redistilaseram":"redistila","redistilaserati":"redistila","redistilasesi":"redistila","redistilasi":"redistila","redistilat":"redistila","redistilati":"redistila","redistilau":"redistila","redistileaza":"redistila","redistilez":"redistila","redistilezi":"redistila","redistribuia":"redistribui","redistribuiai":"redistribui","redistribuiam":"redistribui","redistribuiati":"redistribui","redistribuiau":"redistribui","redistribuie":"redistribui","redistribuii":"redistribui","redistribuim":"redistribui","redistribuind":"redistribui","redistribuira":"redistribui","redistribuiram":"redistribui","redistribuirati":"redistribui","redistribuirea":"redistribuire","redistribuiri":"redistribuire","redistribuirii":"redistribuire","redistribuirile":"redistribuire","redistribuirilor":"redistribuire","redistribuise":"redistribui","redistribuisem":"redistribui","redistribuisera":"redistribui","redistribuiseram":"redistribui","redistribuiserati":"redistribui","redistribuisesi":"redistribui","redistribuisi":"redistribui","redistribuit":"redistribui","redistribuita":["redistribuită","redistribuit","redistribuita","redistribuit"],"redistribuite":"redistribuit","redistribuitele":"redistribuit","redistribuiti":["redistribuiți","redistribui","redistribuiți","redistribuit"],"redistribuitii":"redistribuit","redistribuitul":"redistribuit","rediuri":"rediu","rediurile":"rediu","rediurilor":"rediu","rediusul":"rediuș","rediusule":"rediuș","rediusului":"rediuș","rediusuri":"rediuș","rediusurile":"rediuș","rediusurilor":"rediuș","rediuul":"rediu","rediuule":"rediu","rediuului":"rediu","redizolv":"redizolva","redizolvai":"redizolva","redizolvam":["redizolvăm","redizolva","redizolvam","redizolva"],"redizolvand":"redizolva","redizolvara":"redizolva","redizolvaram":"redizolva","redizolvarati":"redizolva","redizolvase":"redizolva","redizolvasem":"redizolva","redizolvasera":"redizolva","redizolvaseram":"redizolva","redizolvaserati":"redizolva","redizolvasesi":"redizolva","redizolvasi":"redizolva","redizolvat":"redizolva","redizolvati":"redizolva","redizolvau":"redizolva","redizolvi":"redizolva","redoarea":"redoare","redoari":"redoare","redoarii":"redoare","redoarile":"redoare","redoarilor":"redoare","redobandea":"redobândi","redobandeai":"redobândi","redobandeam":"redobândi","redobandeati":"redobândi","redobandeau":"redobândi","redobandesc":"redobândi","redobandeste":"redobândi","redobandesti":"redobândi","redobandii":"redobândi","redobandim":"redobândi","redobandind":"redobândi","redobandira":"redobândi","redobandiram":"redobândi","redobandirati":"redobândi","redobandirea":"redobândire","redobandiri":"redobândire","redobandirii":"redobândire","redobandirile":"redobândire","redobandirilor":"redobândire","redobandise":"redobândi","redobandisem":"redobândi","redobandisera":"redobândi","redobandiseram":"redobândi","redobandiserati":"redobândi","redobandisesi":"redobândi","redobandisi":"redobândi","redobandit":"redobândi","redobanditi":"redobândi","redondant":"redundant","redondanta":["redondantă","redondant","redondanta","redondant"],"redondante":["redondante","redondant","redondanțe","redondanță"],"redondantei":"redondanță","redondantele":["redondantele","redondant","redondanțele","redondanță"],"redondantelor":"redondanță","redondanti":"redondant","redondantii":"redondant","redondantul":"redondant","redori":"redoare","redresai":"redresa","redresam":["redresăm","redresa","redresam","redresa"],"redresamente":"redresament","redresamentele":"redresament","redresamentelor":"redresament","redresamentul":"redresament","redresamentule":"redresament","redresamentului":"redresament","redresand":"redresa","redresara":"redresa","redresaram":"redresa","redresarati":"redresa","redresarea":"redresare","redresari":"redresare","redresarii":"redresare","redresarile":"redresare","redresarilor":"redresare","redresase":"redresa","redresasem":"redresa","redresasera":"redresa","redresaseram":"redresa","redresaserati":"redresa","redresasesi":"redresa","redresasi":"redresa","redresat":"redresa","redresata":["redresată","redresat","redresata","redresat"],"redresate":"redresat","redresatele":"redresat","redresati":["redresați","redresa","redresați","redresat"],"redresatii":"redresat","redresatul":"redresat","redresau":"redresa","redreseaza":"redresa","redresez":"redresa","redresezi":"redresa","redresori":"redresor","redresorile":"redresor","redresorilor":"redresor","redresorul":"redresor","redresorule":"redresor","redresorului":"redresor","redu":"reduce","reduc":"reduce","reduca":"reduce","reducand":"reduce","reducatori":"reducător","reducatorii":"reducător","reducatorilor":"reducător","reducatorul":"reducător","reducatorule":"reducător","reducatorului":"reducător","reducea":"reduce","reduceai":"reduce","reduceam":"reduce","reduceati":"reduce","reduceau":"reduce","reducem":"reduce","reducerea":"reducere","reduceri":"reducere","reducerii":"reducere","reducerile":"reducere","reducerilor":"reducere","reduceti":"reduce","reduci":"reduce","reductia":"reducție","reductibila":["reductibilă","reductibil","reductibila","reductibil"],"reductibile":"reductibil","reductibilele":"reductibil","reductibili":"reductibil","reductibilii":"reductibil","reductibilitatea":"reductibilitate","reductibilitati":"reductibilitate","reductibilitatii":"reductibilitate","reductibilitatile":"reductibilitate","reductibilitatilor":"reductibilitate","reductibilul":"reductibil","reductiei":"reducție","reductii":"reducție","reductiile":"reducție","reductiilor":"reducție","reductionala":["reducțională","reducțional","reducționala","reducțional"],"reductionale":"reducțional","reductionalele":"reducțional","reductionali":"reducțional","reductionalii":"reducțional","reductionalul":"reducțional","reductionismul":"reducționism","reductionismule":"reducționism","reductionismului":"reducționism","reductiunea":"reducțiune","reductiuni":"reducțiune","reductiunii":"reducțiune","reductiunile":"reducțiune","reductiunilor":"reducțiune","reductoare":"reductor","reductoarea":"reductor","reductoarele":"reductor","reductori":"reductor","reductorii":"reductor","reductorilor":"reductor","reductorul":"reductor","reductorule":"reductor","reductorului":"reductor","redundanta":["redundantă","redundant","redundanta","redundant"],"redundante":["redundante","redundant","redundanțe","redundanță"],"redundantei":"redundanță","redundantele":["redundantele","redundant","redundanțele","redundanță"],"redundantelor":"redundanță","redundanti":"redundant","redundantii":"redundant","redundantul":"redundant","reduplic":"reduplica","reduplicai":"reduplica","reduplicam":["reduplicăm","reduplica","reduplicam","reduplica"],"reduplicand":"reduplica","reduplicara":"reduplica","reduplicaram":"reduplica","reduplicarati":"reduplica","reduplicarea":"reduplicare","reduplicari":"reduplicare","reduplicarii":"reduplicare","reduplicarile":"reduplicare","reduplicarilor":"reduplicare","reduplicase":"reduplica","reduplicasem":"reduplica","reduplicasera":"reduplica","reduplicaseram":"reduplica","reduplicaserati":"reduplica","reduplicasesi":"reduplica","reduplicasi":"reduplica","reduplicat":"reduplica","reduplicati":"reduplica","reduplicatia":"reduplicație","reduplicatiei":"reduplicație","reduplicatii":"reduplicație","reduplicatiile":"reduplicație","reduplicatiilor":"reduplicație","reduplicatiunea":"reduplicațiune","reduplicatiuni":"reduplicațiune","reduplicatiunii":"reduplicațiune","reduplicatiunile":"reduplicațiune","reduplicatiunilor":"reduplicațiune","reduplicativa":["reduplicativă","reduplicativ","reduplicativa","reduplicativ"],"reduplicative":"reduplicativ","reduplicativele":"reduplicativ","reduplicativi":"reduplicativ","reduplicativii":"reduplicativ","reduplicativul":"reduplicativ","reduplicau":"reduplica","reduplici":"reduplica","redus":"reduce","redusa":["redusă","redus","redusa","redus"],"reduse":["reduse","reduce","reduse","redus"],"redusei":"reduce","redusele":"redus","redusera":"reduce","reduseram":"reduce","reduserati":"reduce","redusese":"reduce","redusesem":"reduce","redusesera":"reduce","reduseseram":"reduce","reduseserati":"reduce","redusesesi":"reduce","redusesi":"reduce","redusi":"redus","redusii":"redus","redusul":"redus","redutabila":["redutabilă","redutabil","redutabila","redutabil"],"redutabile":"redutabil","redutabilele":"redutabil","redutabili":"redutabil","redutabilii":"redutabil","redutabilul":"redutabil","redute":"redută","redutei":"redută","redutele":"redută","redutelor":"redută","reechilibrai":"reechilibra","reechilibram":["reechilibrăm","reechilibra","reechilibram","reechilibra"],"reechilibrand":"reechilibra","reechilibrara":"reechilibra","reechilibraram":"reechilibra","reechilibrarati":"reechilibra","reechilibrarea":"reechilibrare","reechilibrari":"reechilibrare","reechilibrarii":"reechilibrare","reechilibrarile":"reechilibrare","reechilibrarilor":"reechilibrare","reechilibrase":"reechilibra","reechilibrasem":"reechilibra","reechilibrasera":"reechilibra","reechilibraseram":"reechilibra","reechilibraserati":"reechilibra","reechilibrasesi":"reechilibra","reechilibrasi":"reechilibra","reechilibrat":"reechilibra","reechilibrati":"reechilibra","reechilibrau":"reechilibra","reechilibreaza":"reechilibra","reechilibrez":"reechilibra","reechilibrezi":"reechilibra","reedific":"reedifica","reedificai":"reedifica","reedificam":["reedificăm","reedifica","reedificam","reedifica"],"reedificand":"reedifica","reedificara":"reedifica","reedificaram":"reedifica","reedificarati":"reedifica","reedificarea":"reedifîcare","reedificari":"reedifîcare","reedificarii":"reedifîcare","reedificarile":"reedifîcare","reedificarilor":"reedifîcare","reedificase":"reedifica","reedificasem":"reedifica","reedificasera":"reedifica","reedificaseram":"reedifica","reedificaserati":"reedifica","reedificasesi":"reedifica","reedificasi":"reedifica","reedificat":"reedifica","reedificati":"reedifica","reedificau":"reedifica","reedifici":"reedifica","reeditai":"reedita","reeditam":["reedităm","reedita","reeditam","reedita"],"reeditand":"reedita","reeditara":"reedita","reeditaram":"reedita","reeditarati":"reedita","reeditarea":"reeditare","reeditari":"reeditare","reeditarii":"reeditare","reeditarile":"reeditare","reeditarilor":"reeditare","reeditase":"reedita","reeditasem":"reedita","reeditasera":"reedita","reeditaseram":"reedita","reeditaserati":"reedita","reeditasesi":"reedita","reeditasi":"reedita","reeditat":"reedita","reeditata":["reeditată","reeditat","reeditata","reeditat"],"reeditate":"reeditat","reeditatele":"reeditat","reeditati":["reeditați","reedita","reeditați","reeditat"],"reeditatii":"reeditat","reeditatul":"reeditat","reeditau":"reedita","reediteaza":"reedita","reeditez":"reedita","reeditezi":"reedita","reeduc":"reeduca","reeducai":"reeduca","reeducam":["reeducăm","reeduca","reeducam","reeduca"],"reeducand":"reeduca","reeducara":"reeduca","reeducaram":"reeduca","reeducarati":"reeduca","reeducarea":"reeducare","reeducari":"reeducare","reeducarii":"reeducare","reeducarile":"reeducare","reeducarilor":"reeducare","reeducase":"reeduca","reeducasem":"reeduca","reeducasera":"reeduca","reeducaseram":"reeduca","reeducaserati":"reeduca","reeducasesi":"reeduca","reeducasi":"reeduca","reeducat":"reeduca","reeducata":["reeducată","reeducat","reeducata","reeducat"],"reeducate":"reeducat","reeducatele":"reeducat","reeducati":["reeducați","reeduca","reeducați","reeducat"],"reeducatii":"reeducat","reeducatul":"reeducat","reeducau":"reeduca","reeduci":"reeduca","reela":["reelă","reel","reela","reel"],"reele":"reel","reelele":"reel","reeli":"reel","reeligibila":["reeligibilă","reeligibil","reeligibila","reeligibil"],"reeligibile":"reeligibil","reeligibilele":"reeligibil","reeligibili":"reeligibil","reeligibilii":"reeligibil","reeligibilitatea":"reeligibilitate","reeligibilitati":"reeligibilitate","reeligibilitatii":"reeligibilitate","reeligibilitatile":"reeligibilitate","reeligibilitatilor":"reeligibilitate","reeligibilul":"reeligibil","reelii":"reel","reelul":"reel","reemigratiunea":"reemigrațiune","reemigratiuni":"reemigrațiune","reemigratiunii":"reemigrațiune","reemigratiunile":"reemigrațiune","reemigratiunilor":"reemigrațiune","reesalonai":"reeșalona","reesalonam":["reeșalonăm","reeșalona","reeșalonam","reeșalona"],"reesalonand":"reeșalona","reesalonara":"reeșalona","reesalonaram":"reeșalona","reesalonarati":"reeșalona","reesalonarea":"reeșalonare","reesalonari":"reeșalonare","reesalonarii":"reeșalonare","reesalonarile":"reeșalonare","reesalonarilor":"reeșalonare","reesalonase":"reeșalona","reesalonasem":"reeșalona","reesalonasera":"reeșalona","reesalonaseram":"reeșalona","reesalonaserati":"reeșalona","reesalonasesi":"reeșalona","reesalonasi":"reeșalona","reesalonat":"reeșalona","reesalonata":["reeșalonată","reeșalonat","reeșalonata","reeșalonat"],"reesalonate":"reeșalonat","reesalonatele":"reeșalonat","reesalonati":["reeșalonați","reeșalona","reeșalonați","reeșalonat"],"reesalonatii":"reeșalonat","reesalonatul":"reeșalonat","reesalonau":"reeșalona","reesaloneaza":"reeșalona","reesalonez":"reeșalona","reesalonezi":"reeșalona","reescontul":"reescont","reescontule":"reescont","reescontului":"reescont","reesconturi":"reescont","reesconturile":"reescont","reesconturilor":"reescont","reevaluai":"reevalua","reevaluam":["reevaluăm","reevalua","reevaluam","reevalua"],"reevaluand":"reevalua","reevaluara":"reevalua","reevaluaram":"reevalua","reevaluarati":"reevalua","reevaluarea":"reevaluare","reevaluari":"reevaluare","reevaluarii":"reevaluare","reevaluarile":"reevaluare","reevaluarilor":"reevaluare","reevaluase":"reevalua","reevaluasem":"reevalua","reevaluasera":"reevalua","reevaluaseram":"reevalua","reevaluaserati":"reevalua","reevaluasesi":"reevalua","reevaluasi":"reevalua","reevaluat":"reevalua","reevaluata":["reevaluată","reevaluat","reevaluata","reevaluat"],"reevaluate":"reevaluat","reevaluatele":"reevaluat","reevaluati":["reevaluați","reevalua","reevaluați","reevaluat"],"reevaluatii":"reevaluat","reevaluatul":"reevaluat","reevaluau":"reevalua","reevalueaza":"reevalua","reevaluez":"reevalua","reevaluezi":"reevalua","reexaminai":"reexamina","reexaminam":["reexaminăm","reexamina","reexaminam","reexamina"],"reexaminand":"reexamina","reexaminara":"reexamina","reexaminaram":"reexamina","reexaminarati":"reexamina","reexaminarea":"reexaminare","reexaminari":"reexaminare","reexaminarii":"reexaminare","reexaminarile":"reexaminare","reexaminarilor":"reexaminare","reexaminase":"reexamina","reexaminasem":"reexamina","reexaminasera":"reexamina","reexaminaseram":"reexamina","reexaminaserati":"reexamina","reexaminasesi":"reexamina","reexaminasi":"reexamina","reexaminat":"reexamina","reexaminata":["reexaminată","reexaminat","reexaminata","reexaminat"],"reexaminate":"reexaminat","reexaminatele":"reexaminat","reexaminati":["reexaminați","reexamina","reexaminați","reexaminat"],"reexaminatii":"reexaminat","reexaminatul":"reexaminat","reexaminau":"reexamina","reexamineaza":"reexamina","reexaminez":"reexamina","reexaminezi":"reexamina","reexpediai":"reexpedia","reexpediam":"reexpedia","reexpediara":"reexpedia","reexpediaram":"reexpedia","reexpediarati":"reexpedia","reexpediase":"reexpedia","reexpediasem":"reexpedia","reexpediasera":"reexpedia","reexpediaseram":"reexpedia","reexpediaserati":"reexpedia","reexpediasesi":"reexpedia","reexpediasi":"reexpedia","reexpediat":"reexpedia","reexpediati":"reexpedia","reexpediau":"reexpedia","reexpediaza":"reexpedia","reexpedie":"reexpedia","reexpedieaza":"reexpedia","reexpediem":"reexpedia","reexpedierea":"reexpediere","reexpedieri":"reexpediere","reexpedierii":"reexpediere","reexpedierile":"reexpediere","reexpedierilor":"reexpediere","reexpediez":"reexpedia","reexpediezi":"reexpedia","reexpediind":"reexpedia","reexport":"reexporta","reexportai":"reexporta","reexportam":["reexportăm","reexporta","reexportam","reexporta"],"reexportand":"reexporta","reexportara":"reexporta","reexportaram":"reexporta","reexportarati":"reexporta","reexportase":"reexporta","reexportasem":"reexporta","reexportasera":"reexporta","reexportaseram":"reexporta","reexportaserati":"reexporta","reexportasesi":"reexporta","reexportasi":"reexporta","reexportat":"reexporta","reexportati":"reexporta","reexportau":"reexporta","reexporti":"reexporta","reexportul":"reexport","reexportule":"reexport","reexportului":"reexport","reexporturi":"reexport","reexporturile":"reexport","reexporturilor":"reexport","reexpozitia":"reexpoziție","reexpozitiei":"reexpoziție","reexpozitii":"reexpoziție","refac":"reface","refaca":"reface","refacand":"reface","refacea":"reface","refaceai":"reface","refaceam":"reface","refaceati":"reface","refaceau":"reface","refacem":"reface","refacerea":"refacere","refaceri":"refacere","refacerii":"refacere","refacerile":"refacere","refacerilor":"refacere","refaceti":"reface","refaci":"reface","refactia":"refacție","refactiei":"refacție","refactii":"refacție","refactiile":"refacție","refactiilor":"refacție","refacu":"reface","refacui":"reface","refacura":"reface","refacuram":"reface","refacurati":"reface","refacuse":"reface","refacusem":"reface","refacusera":"reface","refacuseram":"reface","refacuserati":"reface","refacusesi":"reface","refacusi":"reface","refacut":"reface","refacuta":["refăcută","refăcut","refăcuta","refăcut"],"refacute":"refăcut","refacutele":"refăcut","refacuti":"refăcut","refacutii":"refăcut","refacutul":"refăcut","refec":"refeca","refecai":"refeca","refecam":["refecăm","refeca","refecam","refeca"],"refecand":"refeca","refecara":"refeca","refecaram":"refeca","refecarati":"refeca","refecarea":"refecare","refecari":"refecare","refecarii":"refecare","refecarile":"refecare","refecarilor":"refecare","refecase":"refeca","refecasem":"refeca","refecasera":"refeca","refecaseram":"refeca","refecaserati":"refeca","refecasesi":"refeca","refecasi":"refeca","refecat":"refeca","refecata":["refecată","refecat","refecata","refecat"],"refecate":"refecat","refecatele":"refecat","refecati":["refecați","refeca","refecați","refecat"],"refecatii":"refecat","refecatul":"refecat","refecau":"refeca","refeci":"refeca","refectoare":"refector","refectoarele":"refector","refectoarelor":"refector","refectorii":"refectoriu","refectoriile":"refectoriu","refectoriilor":"refectoriu","refectoriul":"refectoriu","refectoriule":"refectoriu","refectoriului":"refectoriu","refectorul":"refector","refectorule":"refector","refectorului":"refector","refer":"referi","refera":"referi","referai":"refera","referam":["referăm","refera","referam","refera"],"referand":"refera","referara":"refera","referaram":"refera","referarati":"refera","referase":"refera","referasem":"refera","referasera":"refera","referaseram":"refera","referaserati":"refera","referasesi":"refera","referasi":"refera","referat":"refera","referate":"referat","referatele":"referat","referatelor":"referat","referati":"refera","referatul":"referat","referatule":"referat","referatului":"referat","referau":"refera","refere":"referi","referea":"referi","refereai":"referi","refeream":"referi","refereati":"referi","refereau":"referi","refereaza":"refera","referendari":"referendar","referendarii":"referendar","referendarilor":"referendar","referendarul":"referendar","referendarule":"referendar","referendarului":"referendar","referendumul":"referendum","referendumule":"referendum","referendumului":"referendum","referendumuri":"referendum","referendumurile":"referendum","referendumurilor":"referendum","referente":["referente","referentă","referențe","referență"],"referentei":["referentei","referentă","referenței","referență"],"referentele":["referentele","referentă","referențele","referență"],"referentelor":["referentelor","referentă","referențelor","referență"],"referenti":"referent","referentiale":"referențial","referentialele":"referențial","referentialelor":"referențial","referentialul":"referențial","referentialule":"referențial","referentialului":"referențial","referentii":"referent","referentilor":"referent","referentul":"referent","referentule":"referent","referentului":"referent","referez":"refera","referezi":"refera","referii":"referi","referim":"referi","referind":"referi","referinte":"referință","referintei":"referință","referintele":"referință","referintelor":"referință","referira":"referi","referiram":"referi","referirati":"referi","referirea":"referire","referiri":"referire","referirii":"referire","referirile":"referire","referirilor":"referire","referise":"referi","referisem":"referi","referisera":"referi","referiseram":"referi","referiserati":"referi","referisesi":"referi","referisi":"referi","referit":"referi","referiti":"referi","referitoare":"referitor","referitoarea":"referitor","referitoarele":"referitor","referitori":"referitor","referitorii":"referitor","referitorul":"referitor","refiarba":"refierbe","refierb":"refierbe","refierband":"refierbe","refierbea":"refierbe","refierbeai":"refierbe","refierbeam":"refierbe","refierbeati":"refierbe","refierbeau":"refierbe","refierbem":"refierbe","refierbeti":"refierbe","refierbi":"refierbe","refierse":"refierbe","refiersei":"refierbe","refiersera":"refierbe","refierseram":"refierbe","refierserati":"refierbe","refiersese":"refierbe","refiersesem":"refierbe","refiersesera":"refierbe","refierseseram":"refierbe","refierseserati":"refierbe","refiersesesi":"refierbe","refiersesi":"refierbe","refiert":"refierbe","reflecsi":"reflex","reflecsii":"reflex","reflectai":"reflecta","reflectam":["reflectăm","reflecta","reflectam","reflecta"],"reflectand":"reflecta","reflectara":"reflecta","reflectaram":"reflecta","reflectarati":"reflecta","reflectarea":"reflectare","reflectari":"reflectare","reflectarii":"reflectare","reflectarile":"reflectare","reflectarilor":"reflectare","reflectase":"reflecta","reflectasem":"reflecta","reflectasera":"reflecta","reflectaseram":"reflecta","reflectaserati":"reflecta","reflectasesi":"reflecta","reflectasi":"reflecta","reflectat":"reflecta","reflectata":["reflectată","reflectat","reflectata","reflectat"],"reflectate":"reflectat","reflectatele":"reflectat","reflectati":["reflectați","reflecta","reflectați","reflectat"],"reflectatii":"reflectat","reflectatul":"reflectat","reflectau":"reflecta","reflecteaza":"reflecta","reflectez":"reflecta","reflectezi":"reflecta","reflectii":"reflecție","reflectiunea":"reflecțiune","reflectiuni":"reflecțiune","reflectiunii":"reflecțiune","reflectiunile":"reflecțiune","reflectiunilor":"reflecțiune","reflectiva":["reflectivă","reflectiv","reflectiva","reflectiv"],"reflective":"reflectiv","reflectivele":"reflectiv","reflectivi":"reflectiv","reflectivii":"reflectiv","reflectivitatea":"reflectivitate","reflectivitati":"reflectivitate","reflectivitatii":"reflectivitate","reflectivitatile":"reflectivitate","reflectivitatilor":"reflectivitate","reflectivul":"reflectiv","reflectoare":"reflector","reflectoarele":"reflector","reflectoarelor":"reflector","reflectometre":"reflectometru","reflectometrele":"reflectometru","reflectometrelor":"reflectometru","reflectometrul":"reflectometru","reflectometrule":"reflectometru","reflectometrului":"reflectometru","reflectorizanta":["reflectorizantă","reflectorizant","reflectorizanta","reflectorizant"],"reflectorizante":"reflectorizant","reflectorizantele":"reflectorizant","reflectorizanti":"reflectorizant","reflectorizantii":"reflectorizant","reflectorizantul":"reflectorizant","reflectorul":"reflector","reflectorule":"reflector","reflectorului":"reflector","reflexa":["reflexă","reflex","reflexa","reflex"],"reflexe":"reflex","reflexe conditionate":"reflex condiționat","reflexele":"reflex","reflexia":"reflexie","reflexibila":["reflexibilă","reflexibil","reflexibila","reflexibil"],"reflexibile":"reflexibil","reflexibilele":"reflexibil","reflexibili":"reflexibil","reflexibilii":"reflexibil","reflexibilitatea":"reflexibilitate","reflexibilitati":"reflexibilitate","reflexibilitatii":"reflexibilitate","reflexibilul":"reflexibil","reflexiei":"reflexie","reflexii":"reflexie","reflexiile":"reflexie","reflexiilor":"reflexie","reflexiunea":"reflexiune","reflexiuni":"reflexiune","reflexiunii":"reflexiune","reflexiunile":"reflexiune","reflexiunilor":"reflexiune","reflexiva":["reflexivă","reflexiv","reflexiva","reflexiv"],"reflexive":"reflexiv","reflexivele":"reflexiv","reflexivi":"reflexiv","reflexivii":"reflexiv","reflexivismul":"reflexivism","reflexivismule":"reflexivism","reflexivismului":"reflexivism","reflexivitatea":"reflexivitate","reflexivitati":"reflexivitate","reflexivitatii":"reflexivitate","reflexivitatile":"reflexivitate","reflexivitatilor":"reflexivitate","reflexivul":"reflexiv","reflexogena":["reflexogenă","reflexogen","reflexogena","reflexogen"],"reflexogene":"reflexogen","reflexogenele":"reflexogen","reflexogeni":"reflexogen","reflexogenii":"reflexogen","reflexogenul":"reflexogen","reflexologe":"reflexologă","reflexologei":"reflexologă","reflexologele":"reflexologă","reflexologelor":"reflexologă","reflexologi":"reflexolog","reflexologia":"reflexologie","reflexologiei":"reflexologie","reflexologii":["reflexologii","reflexolog","reflexologii","reflexologie"],"reflexologiile":"reflexologie","reflexologiilor":"reflexologie","reflexologilor":"reflexolog","reflexologul":"reflexolog","reflexologule":"reflexolog","reflexologului":"reflexolog","reflexoterapia":"reflexoterapie","reflexoterapiei":"reflexoterapie","reflexoterapii":"reflexoterapie","reflexoterapiile":"reflexoterapie","reflexoterapiilor":"reflexoterapie","reflexul":"reflex","refluxul":"reflux","refluxule":"reflux","refluxului":"reflux","refluxuri":"reflux","refluxurile":"reflux","refluxurilor":"reflux","refolosea":"refolosi","refoloseai":"refolosi","refoloseam":"refolosi","refoloseati":"refolosi","refoloseau":"refolosi","refolosesc":"refolosi","refoloseste":"refolosi","refolosesti":"refolosi","refolosibila":["refolosibilă","refolosibil","refolosibila","refolosibil"],"refolosibile":"refolosibil","refolosibilele":"refolosibil","refolosibili":"refolosibil","refolosibilii":"refolosibil","refolosibilul":"refolosibil","refolosii":"refolosi","refolosim":"refolosi","refolosind":"refolosi","refolosira":"refolosi","refolosiram":"refolosi","refolosirati":"refolosi","refolosirea":"refolosire","refolosiri":"refolosire","refolosirii":"refolosire","refolosirile":"refolosire","refolosirilor":"refolosire","refolosise":"refolosi","refolosisem":"refolosi","refolosisera":"refolosi","refolosiseram":"refolosi","refolosiserati":"refolosi","refolosisesi":"refolosi","refolosisi":"refolosi","refolosit":"refolosi","refolosita":["refolosită","refolosit","refolosita","refolosit"],"refolosite":"refolosit","refolositele":"refolosit","refolositi":["refolosiți","refolosi","refolosiți","refolosit"],"refolositii":"refolosit","refolositul":"refolosit","reforjai":"reforja","reforjam":["reforjăm","reforja","reforjam","reforja"],"reforjand":"reforja","reforjara":"reforja","reforjaram":"reforja","reforjarati":"reforja","reforjase":"reforja","reforjasem":"reforja","reforjasera":"reforja","reforjaseram":"reforja","reforjaserati":"reforja","reforjasesi":"reforja","reforjasi":"reforja","reforjat":"reforja","reforjati":"reforja","reforjau":"reforja","reforjeaza":"reforja","reforjez":"reforja","reforjezi":"reforja","reformai":"reforma","reformam":["reformăm","reforma","reformam","reforma"],"reformand":"reforma","reformara":"reforma","reformaram":"reforma","reformarati":"reforma","reformarea":"reformare","reformari":"reformare","reformarii":"reformare","reformarile":"reformare","reformarilor":"reformare","reformase":"reforma","reformasem":"reforma","reformasera":"reforma","reformaseram":"reforma","reformaserati":"reforma","reformasesi":"reforma","reformasi":"reforma","reformat":"reforma","reformata":["reformată","reformat","reformata","reformat"],"reformate":"reformat","reformatele":"reformat","reformati":["reformați","reforma","reformați","reformat"],"reformatia":"reformație","reformatiei":"reformație","reformatii":["reformații","reformat","reformații","reformație"],"reformatiile":"reformație","reformatiilor":"reformație","reformatiunea":"reformațiune","reformatiuni":"reformațiune","reformatiunii":"reformațiune","reformatiunile":"reformațiune","reformatiunilor":"reformațiune","reformatoarea":"reformatoare","reformatoarei":"reformatoare","reformatoarele":"reformatoare","reformatoarelor":"reformatoare","reformatori":"reformator","reformatorii":"reformator","reformatorilor":"reformator","reformatorul":"reformator","reformatorule":"reformator","reformatorului":"reformator","reformatul":"reformat","reformau":"reforma","reforme":"reformă","reformeaza":"reforma","reformei":"reformă","reformele":"reformă","reformelor":"reformă","reformez":"reforma","reformezi":"reforma","reformismul":"reformism","reformismule":"reformism","reformismului":"reformism","reformiste":"reformistă","reformistei":"reformistă","reformistele":"reformistă","reformistelor":"reformistă","reformisti":"reformist","reformistii":"reformist","reformistilor":"reformist","reformistul":"reformist","reformistule":"reformist","reformistului":"reformist","reformulai":"reformula","reformulam":["reformulăm","reformula","reformulam","reformula"],"reformuland":"reformula","reformulara":"reformula","reformularam":"reformula","reformularati":"reformula","reformularea":"reformulare","reformulari":"reformulare","reformularii":"reformulare","reformularile":"reformulare","reformularilor":"reformulare","reformulase":"reformula","reformulasem":"reformula","reformulasera":"reformula","reformulaseram":"reformula","reformulaserati":"reformula","reformulasesi":"reformula","reformulasi":"reformula","reformulat":"reformula","reformulata":["reformulată","reformulat","reformulata","reformulat"],"reformulate":"reformulat","reformulatele":"reformulat","reformulati":["reformulați","reformula","reformulați","reformulat"],"reformulatii":"reformulat","reformulatul":"reformulat","reformulau":"reformula","reformuleaza":"reformula","reformulez":"reformula","reformulezi":"reformula","refract":"refracta","refractai":"refracta","refractam":["refractăm","refracta","refractam","refracta"],"refractand":"refracta","refractara":["refractară","refracta","refractară","refractar","refractara","refractar"],"refractaram":"refracta","refractarati":"refracta","refractare":"refractar","refractarele":"refractar","refractari":"refractar","refractarii":"refractar","refractaritatea":"refractaritate","refractaritati":"refractaritate","refractaritatii":"refractaritate","refractaritatile":"refractaritate","refractaritatilor":"refractaritate","refractarul":"refractar","refractase":"refracta","refractasem":"refracta","refractasera":"refracta","refractaseram":"refracta","refractaserati":"refracta","refractasesi":"refracta","refractasi":"refracta","refractat":"refracta","refractata":["refractată","refractat","refractata","refractat"],"refractate":"refractat","refractatele":"refractat","refractati":["refractați","refracta","refractați","refractat"],"refractatii":"refractat","refractatul":"refractat","refractau":"refracta","refracte":"refracta","refracti":"refracta","refractia":"refracție","refractiei":"refracție","refractii":"refracție","refractiile":"refracție","refractiilor":"refracție","refractiunea":"refracțiune","refractiuni":"refracțiune","refractiunii":"refracțiune","refractiunile":"refracțiune","refractiunilor":"refracțiune","refractoare":"refractor","refractoarele":"refractor","refractoarelor":"refractor","refractometre":"refractometru","refractometrele":"refractometru","refractometrelor":"refractometru","refractometria":"refractometrie","refractometriei":"refractometrie","refractometrii":"refractometrie","refractometrul":"refractometru","refractometrule":"refractometru","refractometrului":"refractometru","refractorul":"refractor","refractorule":"refractor","refractorului":"refractor","refrangibila":["refrangibilă","refrangibil","refrangibila","refrangibil"],"refrangibile":"refrangibil","refrangibilele":"refrangibil","refrangibili":"refrangibil","refrangibilii":"refrangibil","refrangibilitatea":"refrangibilitate","refrangibilitati":"refrangibilitate","refrangibilitatii":"refrangibilitate","refrangibilitatile":"refrangibilitate","refrangibilitatilor":"refrangibilitate","refrangibilul":"refrangibil","refrene":"refren","refrenele":"refren","refrenelor":"refren","refrenul":"refren","refrenule":"refren","refrenului":"refren","refrigente":"refrigență","refrigentei":"refrigență","refrigentele":"refrigență","refrigentelor":"refrigență","refrigerai":"refrigera","refrigeram":["refrigerăm","refrigera","refrigeram","refrigera"],"refrigerand":"refrigera","refrigerara":"refrigera","refrigeraram":"refrigera","refrigerarati":"refrigera","refrigerarea":"refrigerare","refrigerari":"refrigerare","refrigerarii":"refrigerare","refrigerarile":"refrigerare","refrigerarilor":"refrigerare","refrigerase":"refrigera","refrigerasem":"refrigera","refrigerasera":"refrigera","refrigeraseram":"refrigera","refrigeraserati":"refrigera","refrigerasesi":"refrigera","refrigerasi":"refrigera","refrigerat":"refrigera","refrigerata":["refrigerată","refrigerat","refrigerata","refrigerat"],"refrigerate":"refrigerat","refrigeratele":"refrigerat","refrigerati":["refrigerați","refrigera","refrigerați","refrigerat"],"refrigeratia":"refrigerație","refrigeratiei":"refrigerație","refrigeratii":["refrigerații","refrigerat","refrigerații","refrigerație"],"refrigeratiile":"refrigerație","refrigeratiilor":"refrigerație","refrigeratiunea":"refrigerațiune","refrigeratiuni":"refrigerațiune","refrigeratiunii":"refrigerațiune","refrigeratiunile":"refrigerațiune","refrigeratiunilor":"refrigerațiune","refrigeratoare":"refrigerator","refrigeratoarele":"refrigerator","refrigeratoarelor":"refrigerator","refrigeratorul":"refrigerator","refrigeratorule":"refrigerator","refrigeratorului":"refrigerator","refrigeratul":"refrigerat","refrigerau":"refrigera","refrigereaza":"refrigera","refrigerenta":["refrigerentă","refrigerent","refrigerenta","refrigerent"],"refrigerente":"refrigerent","refrigerentele":"refrigerent","refrigerenti":"refrigerent","refrigerentii":"refrigerent","refrigerentul":"refrigerent","refrigerez":"refrigera","refrigerezi":"refrigera","refringenta":["refringentă","refringent","refringenta","refringent"],"refringente":["refringente","refringent","refringențe","refringență"],"refringentei":"refringență","refringentele":["refringentele","refringent","refringențele","refringență"],"refringentelor":"refringență","refringenti":"refringent","refringentii":"refringent","refringentul":"refringent","refrisai":"refrișa","refrisam":["refrișăm","refrișa","refrișam","refrișa"],"refrisand":"refrișa","refrisara":"refrișa","refrisaram":"refrișa","refrisarati":"refrișa","refrisase":"refrișa","refrisasem":"refrișa","refrisasera":"refrișa","refrisaseram":"refrișa","refrisaserati":"refrișa","refrisasesi":"refrișa","refrisasi":"refrișa","refrisat":"refrișa","refrisati":"refrișa","refrisau":"refrișa","refriseaza":"refrișa","refrisez":"refrișa","refrisezi":"refrișa","refrunt":"refrunta","refruntai":"refrunta","refruntam":["refruntăm","refrunta","refruntam","refrunta"],"refruntand":"refrunta","refruntara":"refrunta","refruntaram":"refrunta","refruntarati":"refrunta","refruntase":"refrunta","refruntasem":"refrunta","refruntasera":"refrunta","refruntaseram":"refrunta","refruntaserati":"refrunta","refruntasesi":"refrunta","refruntasi":"refrunta","refruntat":"refrunta","refruntati":"refrunta"};
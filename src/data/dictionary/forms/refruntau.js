@@ -0,0 +1 @@
+export default {"refruntau":"refrunta","refrunti":"refrunta","refug":"refugi","refuge":"refugi","refugea":"refugi","refugeai":"refugi","refugeam":"refugi","refugeati":"refugi","refugeau":"refugi","refugiai":"refugia","refugiam":"refugia","refugiara":"refugia","refugiaram":"refugia","refugiarati":"refugia","refugiase":"refugia","refugiasem":"refugia","refugiasera":"refugia","refugiaseram":"refugia","refugiaserati":"refugia","refugiasesi":"refugia","refugiasi":"refugia","refugiat":"refugia","refugiate":"refugiată","refugiatei":"refugiată","refugiatele":"refugiată","refugiatelor":"refugiată","refugiati":["refugiați","refugia","refugiați","refugiat"],"refugiatii":"refugiat","refugiatilor":"refugiat","refugiatul":"refugiat","refugiatule":"refugiat","refugiatului":"refugiat","refugiau":"refugia","refugiaza":"refugia","refugie":"refugia","refugieaza":"refugia","refugiem":"refugia","refugierea":"refugiere","refugieri":"refugiere","refugierii":"refugiere","refugierile":"refugiere","refugierilor":"refugiere","refugiez":"refugia","refugiezi":"refugia","refugii":["refugii","refugi","refugii","refugiu"],"refugiile":"refugiu","refugiilor":"refugiu","refugiind":"refugia","refugim":"refugi","refugind":"refugi","refugira":"refugi","refugiram":"refugi","refugirati":"refugi","refugise":"refugi","refugisem":"refugi","refugisera":"refugi","refugiseram":"refugi","refugiserati":"refugi","refugisesi":"refugi","refugisi":"refugi","refugit":"refugi","refugiti":"refugi","refugiul":"refugiu","refugiule":"refugiu","refugiului":"refugiu","refulai":"refula","refulam":["refulăm","refula","refulam","refula"],"refuland":"refula","refulara":"refula","refularam":"refula","refularati":"refula","refularea":"refulare","refulari":"refulare","refularii":"refulare","refularile":"refulare","refularilor":"refulare","refulase":"refula","refulasem":"refula","refulasera":"refula","refulaseram":"refula","refulaserati":"refula","refulasesi":"refula","refulasi":"refula","refulat":"refula","refulata":["refulată","refulat","refulata","refulat"],"refulate":["refulate","refulat","refulate","refulată"],"refulatei":"refulată","refulatele":["refulatele","refulat","refulatele","refulată"],"refulatelor":"refulată","refulati":["refulați","refula","refulați","refulat"],"refulatii":"refulat","refulatul":"refulat","refulau":"refula","refuleaza":"refula","refulez":"refula","refulezi":"refula","refundarea":"refundare","refundari":"refundare","refundarii":"refundare","refundarile":"refundare","refundarilor":"refundare","refutabila":["refutabilă","refutabil","refutabila","refutabil"],"refutabile":"refutabil","refutabilele":"refutabil","refutabili":"refutabil","refutabilii":"refutabil","refutabilul":"refutabil","refutai":"refuta","refutam":["refutăm","refuta","refutam","refuta"],"refutand":"refuta","refutara":"refuta","refutaram":"refuta","refutarati":"refuta","refutarea":"refutare","refutari":"refutare","refutarii":"refutare","refutarile":"refutare","refutarilor":"refutare","refutase":"refuta","refutasem":"refuta","refutasera":"refuta","refutaseram":"refuta","refutaserati":"refuta","refutasesi":"refuta","refutasi":"refuta","refutat":"refuta","refutati":"refuta","refutatia":"refutație","refutatiei":"refutație","refutatii":"refutație","refutatiile":"refutație","refutatiilor":"refutație","refutatiunea":"refutațiune","refutatiuni":"refutațiune","refutatiunii":"refutațiune","refutatiunile":"refutațiune","refutatiunilor":"refutațiune","refutau":"refuta","refuteaza":"refuta","refutez":"refuta","refutezi":"refuta","refuz":"refuza","refuzabila":["refuzabilă","refuzabil","refuzabila","refuzabil"],"refuzabile":"refuzabil","refuzabilele":"refuzabil","refuzabili":"refuzabil","refuzabilii":"refuzabil","refuzabilul":"refuzabil","refuzai":"refuza","refuzam":["refuzăm","refuza","refuzam","refuza"],"refuzand":"refuza","refuzara":"refuza","refuzaram":"refuza","refuzarati":"refuza","refuzarea":"refuzare","refuzari":"refuzare","refuzarii":"refuzare","refuzase":"refuza","refuzasem":"refuza","refuzasera":"refuza","refuzaseram":"refuza","refuzaserati":"refuza","refuzasesi":"refuza","refuzasi":"refuza","refuzat":"refuza","refuzata":["refuzată","refuzat","refuzata","refuzat"],"refuzate":"refuzat","refuzatele":"refuzat","refuzati":["refuzați","refuza","refuzați","refuzat"],"refuzatii":"refuzat","refuzatul":"refuzat","refuzau":"refuza","refuzi":"refuza","refuzul":"refuz","refuzule":"refuz","refuzului":"refuz","refuzuri":"refuz","refuzurile":"refuz","refuzurilor":"refuz","regala":["regală","regal","regala","regal"],"regalai":"regala","regalam":["regalăm","regala","regalam","regala"],"regaland":"regala","regalara":"regala","regalaram":"regala","regalarati":"regala","regalarea":"regalare","regalari":"regalare","regalarii":"regalare","regalarile":"regalare","regalarilor":"regalare","regalase":"regala","regalasem":"regala","regalasera":"regala","regalaseram":"regala","regalaserati":"regala","regalasesi":"regala","regalasi":"regala","regalat":"regala","regalati":"regala","regalau":"regala","regale":["regale","regal","regale","regală"],"regaleaza":"regala","regalei":"regală","regalele":["regalele","regal","regalele","regală"],"regalelor":"regală","regalez":"regala","regalezi":"regala","regali":"regal","regalii":"regal","regalismul":"regalism","regalismule":"regalism","regalismului":"regalism","regalista":["regalistă","regalist","regalista","regalist"],"regaliste":["regaliste","regalist","regaliste","regalistă"],"regalistei":"regalistă","regalistele":["regalistele","regalist","regalistele","regalistă"],"regalistelor":"regalistă","regalisti":"regalist","regalistii":"regalist","regalistul":"regalist","regalitatea":"regalitate","regalitati":"regalitate","regalitatii":"regalitate","regalitatile":"regalitate","regalitatilor":"regalitate","regalul":"regal","regandea":"regândi","regandeai":"regândi","regandeam":"regândi","regandeati":"regândi","regandeau":"regândi","regandesc":"regândi","regandeste":"regândi","regandesti":"regândi","regandii":"regândi","regandim":"regândi","regandind":"regândi","regandira":"regândi","regandiram":"regândi","regandirati":"regândi","regandirea":"regândire","regandiri":"regândire","regandirii":"regândire","regandirile":"regândire","regandirilor":"regândire","regandise":"regândi","regandisem":"regândi","regandisera":"regândi","regandiseram":"regândi","regandiserati":"regândi","regandisesi":"regândi","regandisi":"regândi","regandit":"regândi","regandita":["regândită","regândit","regândita","regândit"],"regandite":"regândit","reganditele":"regândit","reganditi":["regândiți","regândi","regândiți","regândit"],"reganditii":"regândit","reganditul":"regândit","regasea":"regăsi","regaseai":"regăsi","regaseam":"regăsi","regaseati":"regăsi","regaseau":"regăsi","regasesc":"regăsi","regaseste":"regăsi","regasesti":"regăsi","regasii":"regăsi","regasim":"regăsi","regasind":"regăsi","regasira":"regăsi","regasiram":"regăsi","regasirati":"regăsi","regasirea":"regăsire","regasiri":"regăsire","regasirii":"regăsire","regasirile":"regăsire","regasirilor":"regăsire","regasise":"regăsi","regasisem":"regăsi","regasisera":"regăsi","regasiseram":"regăsi","regasiserati":"regăsi","regasisesi":"regăsi","regasisi":"regăsi","regasit":"regăsi","regasiti":"regăsi","regate":["regate","regat","regate","regată"],"regateanul":"regățean","regateanule":"regățean","regateanului":"regățean","regatei":"regată","regatele":["regatele","regat","regatele","regată"],"regatelor":["regatelor","regat","regatelor","regată"],"regatence":"regățeancă","regatencei":"regățeancă","regatencele":"regățeancă","regatencelor":"regățeancă","regatene":"regățeană","regateneasca":["regățenească","regățenesc","regățeneasca","regățenesc"],"regatenei":"regățeană","regatenele":"regățeană","regatenelor":"regățeană","regatenescul":"regățenesc","regatenesti":"regățenesc","regatenestii":"regățenesc","regatenestile":"regățenesc","regateni":"regățean","regatenii":"regățean","regatenilor":"regățean","regatul":"regat","regatule":"regat","regatului":"regat","regealacul":"regealâc","regealacule":"regealâc","regealacului":"regealâc","regealacuri":"regealâc","regealacurile":"regealâc","regealacurilor":"regealâc","regeasca":["regească","regesc","regeasca","regesc"],"regele":"rege","regelui":"rege","regenerabila":["regenerabilă","regenerabil","regenerabila","regenerabil"],"regenerabile":"regenerabil","regenerabilele":"regenerabil","regenerabili":"regenerabil","regenerabilii":"regenerabil","regenerabilul":"regenerabil","regenerai":"regenera","regeneram":["regenerăm","regenera","regeneram","regenera"],"regenerand":"regenera","regenerara":"regenera","regeneraram":"regenera","regenerarati":"regenera","regenerarea":"regenerare","regenerari":"regenerare","regenerarii":"regenerare","regenerarile":"regenerare","regenerarilor":"regenerare","regenerase":"regenera","regenerasem":"regenera","regenerasera":"regenera","regeneraseram":"regenera","regeneraserati":"regenera","regenerasesi":"regenera","regenerasi":"regenera","regenerat":"regenera","regenerata":["regenerată","regenerat","regenerata","regenerat"],"regenerate":"regenerat","regeneratele":"regenerat","regenerati":["regenerați","regenera","regenerați","regenerat"],"regeneratia":"regenerație","regeneratiei":"regenerație","regeneratii":["regenerații","regenerat","regenerații","regenerație"],"regeneratiile":"regenerație","regeneratiilor":"regenerație","regenerativa":["regenerativă","regenerativ","regenerativa","regenerativ"],"regenerative":"regenerativ","regenerativele":"regenerativ","regenerativi":"regenerativ","regenerativii":"regenerativ","regenerativul":"regenerativ","regeneratori":"regenerator","regeneratorile":"regenerator","regeneratorilor":"regenerator","regeneratorul":"regenerator","regeneratorule":"regenerator","regeneratorului":"regenerator","regeneratul":"regenerat","regenerau":"regenera","regenereaza":"regenera","regenerescente":"regenerescență","regenerescentei":"regenerescență","regenerescentele":"regenerescență","regenerescentelor":"regenerescență","regenerez":"regenera","regenerezi":"regenera","regente":["regente","regentă","regențe","regență"],"regentei":["regentei","regentă","regenței","regență"],"regentele":["regentele","regentă","regențele","regență"],"regentelor":["regentelor","regentă","regențelor","regență"],"regenti":"regent","regentii":"regent","regentilor":"regent","regentul":"regent","regentule":"regent","regentului":"regent","regescul":"regesc","regesti":"regesc","regestii":"regesc","regestile":"regesc","reggaeul":"reggae","reggaeule":"reggae","reggaeului":"reggae","reghimente":"reghiment","reghimentele":"reghiment","reghimentelor":"reghiment","reghimentul":"reghiment","reghimentule":"reghiment","reghimentului":"reghiment","reghinul":"Reghin","reghinule":"Reghin","reghinului":"Reghin","regi":"rege","regia":["regia","regie","regia","regiu"],"regicida":["regicidă","regicid","regicida","regicid"],"regicide":["regicide","regicid","regicide","regicidă"],"regicidei":"regicidă","regicidele":["regicidele","regicid","regicidele","regicidă"],"regicidelor":["regicidelor","regicid","regicidelor","regicidă"],"regicidul":"regicid","regicidule":"regicid","regicidului":"regicid","regicizi":"regicid","regicizii":"regicid","regicizilor":"regicid","regie":"regiu","regiei":"regie","regifugii":"regifugiu","regifugiile":"regifugiu","regifugiilor":"regifugiu","regifugiuul":"regifugiu","regifugiuule":"regifugiu","regifugiuului":"regifugiu","regii":["regii","rege","regii","regie","regii","regiu"],"regiii":"regiu","regiile":["regiile","regie","regiile","regiu"],"regiilor":"regie","regilor":"rege","regimentara":["regimentară","regimentar","regimentara","regimentar"],"regimentare":"regimentar","regimentarele":"regimentar","regimentari":"regimentar","regimentarii":"regimentar","regimentarul":"regimentar","regimente":"regiment","regimentele":"regiment","regimentelor":"regiment","regimentul":"regiment","regimentule":"regiment","regimentului":"regiment","regimul":"regim","regimule":"regim","regimului":"regim","regimuri":"regim","regimuri alimentare":"regim alimentar","regimurile":"regim","regimurilor":"regim","regine":"regină","reginei":"regină","reginele":"regină","reginelor":"regină","regionala":["regională","regional","regionala","regional"],"regionale":["regionale","regional","regionale","regională"],"regionalei":"regională","regionalele":["regionalele","regional","regionalele","regională"],"regionalelor":"regională","regionali":"regional","regionalii":"regional","regionalisme":"regionalism","regionalismele":"regionalism","regionalismelor":"regionalism","regionalismul":"regionalism","regionalismule":"regionalism","regionalismului":"regionalism","regionaliste":"regionalistă","regionalistei":"regionalistă","regionalistele":"regionalistă","regionalistelor":"regionalistă","regionalisti":"regionalist","regionalistii":"regionalist","regionalistilor":"regionalist","regionalistul":"regionalist","regionalistule":"regionalist","regionalistului":"regionalist","regionalizarea":"regionalizare","regionalizari":"regionalizare","regionalizarii":"regionalizare","regionalul":"regional","regisori":["regisori","regisor","regișori","regișor"],"regisorii":["regisorii","regisor","regișorii","regișor"],"regisorilor":["regisorilor","regisor","regișorilor","regișor"],"regisorul":["regisorul","regisor","regișorul","regișor"],"regisorule":["regisorule","regisor","regișorule","regișor"],"regisorului":["regisorului","regisor","regișorului","regișor"],"registratia":"registrație","registratiei":"registrație","registratii":"registrație","registratiile":"registrație","registratiilor":"registrație","registratoarea":"registratoare","registratoarei":"registratoare","registratoarele":"registratoare","registratoarelor":"registratoare","registratori":"registrator","registratorii":"registrator","registratorilor":"registrator","registratorul":"registrator","registratorule":"registrator","registratorului":"registrator","registraturi":"registratură","registraturii":"registratură","registraturile":"registratură","registraturilor":"registratură","registre":"registru","registre de bord":"registru de bord","registre de cadastru":"registru de cadastru","registre de casa":"registru de casă","registrele":"registru","registrelor":"registru","registrul":"registru","registrule":"registru","registrului":"registru","regiul":"regiu","regiunea":"regiune","regiuni":"regiune","regiuni geografice":"regiune geografică","regiunii":"regiune","regiunile":"regiune","regiunilor":"regiune","regizai":"regiza","regizam":["regizăm","regiza","regizam","regiza"],"regizand":"regiza","regizara":"regiza","regizaram":"regiza","regizarati":"regiza","regizarea":"regizare","regizari":"regizare","regizarii":"regizare","regizarile":"regizare","regizarilor":"regizare","regizase":"regiza","regizasem":"regiza","regizasera":"regiza","regizaseram":"regiza","regizaserati":"regiza","regizasesi":"regiza","regizasi":"regiza","regizat":"regiza","regizati":"regiza","regizau":"regiza","regizeaza":"regiza","regizez":"regiza","regizezi":"regiza","regizoarea":"regizoare","regizoarei":"regizoare","regizoarele":"regizoare","regizoarelor":"regizoare","regizorala":["regizorală","regizoral","regizorala","regizoral"],"regizorale":"regizoral","regizoralele":"regizoral","regizorali":"regizoral","regizoralii":"regizoral","regizoralul":"regizoral","regizori":"regizor","regizori de film":"regizor de film","regizorii":"regizor","regizorilor":"regizor","regizorite":"regizoriță","regizoritei":"regizoriță","regizoritele":"regizoriță","regizoritelor":"regizoriță","regizorul":"regizor","regizorule":"regizor","regizorului":"regizor","reglabila":["reglabilă","reglabil","reglabila","reglabil"],"reglabile":"reglabil","reglabilele":"reglabil","reglabili":"reglabil","reglabilii":"reglabil","reglabilitatea":"reglabilitate","reglabilitati":"reglabilitate","reglabilitatii":"reglabilitate","reglabilul":"reglabil","reglai":"regla","reglaje":"reglaj","reglajele":"reglaj","reglajelor":"reglaj","reglajul":"reglaj","reglajule":"reglaj","reglajului":"reglaj","reglam":["reglăm","regla","reglam","regla"],"regland":"regla","reglara":"regla","reglaram":"regla","reglarati":"regla","reglarea":"reglare","reglari":"reglare","reglarii":"reglare","reglarile":"reglare","reglarilor":"reglare","reglase":"regla","reglasem":"regla","reglasera":"regla","reglaseram":"regla","reglaserati":"regla","reglasesi":"regla","reglasi":"regla","reglat":"regla","reglati":"regla","reglau":"regla","regleaza":"regla","reglementai":"reglementa","reglementam":["reglementăm","reglementa","reglementam","reglementa"],"reglementand":"reglementa","reglementara":["reglementară","reglementa","reglementară","reglementar","reglementara","reglementar"],"reglementaram":"reglementa","reglementarati":"reglementa","reglementare":"reglementar","reglementarea":"reglementare","reglementarele":"reglementar","reglementari":["reglementari","reglementar","reglementări","reglementare"],"reglementarii":["reglementarii","reglementar","reglementării","reglementare"],"reglementarile":"reglementare","reglementarilor":"reglementare","reglementarul":"reglementar","reglementase":"reglementa","reglementasem":"reglementa","reglementasera":"reglementa","reglementaseram":"reglementa","reglementaserati":"reglementa","reglementasesi":"reglementa","reglementasi":"reglementa","reglementat":"reglementa","reglementata":["reglementată","reglementat","reglementata","reglementat"],"reglementate":"reglementat","reglementatele":"reglementat","reglementati":["reglementați","reglementa","reglementați","reglementat"],"reglementatii":"reglementat","reglementatul":"reglementat","reglementau":"reglementa","reglemente":"reglement","reglementeaza":"reglementa","reglementele":"reglement","reglementelor":"reglement","reglementez":"reglementa","reglementezi":"reglementa","reglementul":"reglement","reglementule":"reglement","reglementului":"reglement","reglete":"reglet","regletele":"reglet","regletelor":"reglet","regleteul":"reglete","regleteule":"reglete","regleteului":"reglete","regleti":"reglete","regletii":"reglete","regletilor":"reglete","regletul":"reglet","regletule":"reglet","regletului":"reglet","reglez":"regla","reglezi":"regla","reglise":"reglisă","reglisei":"reglisă","reglori":"reglor","reglorii":"reglor","reglorilor":"reglor","reglorul":"reglor","reglorule":"reglor","reglorului":"reglor","regnul":"regn","regnule":"regn","regnului":"regn","regnuri":"regn","regnurile":"regn","regnurilor":"regn","regosolul":"regosol","regosolule":"regosol","regosolului":"regosol","regosoluri":"regosol","regosolurile":"regosol","regosolurilor":"regosol","regradai":"regrada","regradam":["regradăm","regrada","regradam","regrada"],"regradand":"regrada","regradara":"regrada","regradaram":"regrada","regradarati":"regrada","regradarea":"regradare","regradari":"regradare","regradarii":"regradare","regradarile":"regradare","regradarilor":"regradare","regradase":"regrada","regradasem":"regrada","regradasera":"regrada","regradaseram":"regrada","regradaserati":"regrada","regradasesi":"regrada","regradasi":"regrada","regradat":"regrada","regradata":["regradată","regradat","regradata","regradat"],"regradate":"regradat","regradatele":"regradat","regradati":["regradați","regrada","regradați","regradat"],"regradatii":"regradat","regradatul":"regradat","regradau":"regrada","regradeaza":"regrada","regradez":"regrada","regradezi":"regrada","regresai":"regresa","regresam":["regresăm","regresa","regresam","regresa"],"regresand":"regresa","regresara":"regresa","regresaram":"regresa","regresarati":"regresa","regresase":"regresa","regresasem":"regresa","regresasera":"regresa","regresaseram":"regresa","regresaserati":"regresa","regresasesi":"regresa","regresasi":"regresa","regresat":"regresa","regresati":"regresa","regresau":"regresa","regrese":"regres","regreseaza":"regresa","regresele":"regres","regreselor":"regres","regresez":"regresa","regresezi":"regresa","regresiunea":"regresiune","regresiuni":"regresiune","regresiunii":"regresiune","regresiunile":"regresiune","regresiunilor":"regresiune","regresiva":["regresivă","regresiv","regresiva","regresiv"],"regresive":"regresiv","regresivele":"regresiv","regresivi":"regresiv","regresivii":"regresiv","regresivul":"regresiv","regresul":"regres","regresule":"regres","regresului":"regres","regret":"regreta","regretabila":["regretabilă","regretabil","regretabila","regretabil"],"regretabile":"regretabil","regretabilele":"regretabil","regretabili":"regretabil","regretabilii":"regretabil","regretabilul":"regretabil","regretai":"regreta","regretam":["regretăm","regreta","regretam","regreta"],"regretand":"regreta","regretara":"regreta","regretaram":"regreta","regretarati":"regreta","regretarea":"regretare","regretari":"regretare","regretarii":"regretare","regretarile":"regretare","regretarilor":"regretare","regretase":"regreta","regretasem":"regreta","regretasera":"regreta","regretaseram":"regreta","regretaserati":"regreta","regretasesi":"regreta","regretasi":"regreta","regretat":"regreta","regretata":["regretată","regretat","regretata","regretat"],"regretate":"regretat","regretatele":"regretat","regretati":["regretați","regreta","regretați","regretat"],"regretatii":"regretat","regretatul":"regretat","regretau":"regreta","regrete":"regret","regretele":"regret","regretelor":"regret","regreti":"regreta","regretul":"regret","regretule":"regret","regretului":"regret","regrupai":"regrupa","regrupam":["regrupăm","regrupa","regrupam","regrupa"],"regrupand":"regrupa","regrupara":"regrupa","regruparam":"regrupa","regruparati":"regrupa","regruparea":"regrupare","regrupari":"regrupare","regruparii":"regrupare","regruparile":"regrupare","regruparilor":"regrupare","regrupase":"regrupa","regrupasem":"regrupa","regrupasera":"regrupa","regrupaseram":"regrupa","regrupaserati":"regrupa","regrupasesi":"regrupa","regrupasi":"regrupa","regrupat":"regrupa","regrupati":"regrupa","regrupau":"regrupa","regrupeaza":"regrupa","regrupez":"regrupa","regrupezi":"regrupa","regulai":"regula","regulam":["regulăm","regula","regulam","regula"],"regulamentai":"regulamenta","regulamentam":["regulamentăm","regulamenta","regulamentam","regulamenta"],"regulamentand":"regulamenta","regulamentara":["regulamentară","regulamenta","regulamentară","regulamentar","regulamentara","regulamentar"],"regulamentaram":"regulamenta","regulamentarati":"regulamenta","regulamentare":"regulamentar","regulamentarea":"regulamentare","regulamentarele":"regulamentar","regulamentari":["regulamentari","regulamentar","regulamentări","regulamentare"],"regulamentarii":["regulamentarii","regulamentar","regulamentării","regulamentare"],"regulamentarile":"regulamentare","regulamentarilor":"regulamentare","regulamentarul":"regulamentar","regulamentase":"regulamenta","regulamentasem":"regulamenta","regulamentasera":"regulamenta","regulamentaseram":"regulamenta","regulamentaserati":"regulamenta","regulamentasesi":"regulamenta","regulamentasi":"regulamenta","regulamentat":"regulamenta","regulamentata":["regulamentată","regulamentat","regulamentata","regulamentat"],"regulamentate":"regulamentat","regulamentatele":"regulamentat","regulamentati":["regulamentați","regulamenta","regulamentați","regulamentat"],"regulamentatii":"regulamentat","regulamentatul":"regulamentat","regulamentau":"regulamenta","regulamente":"regulament","regulamenteaza":"regulamenta","regulamentez":"regulamenta","regulamentezi":"regulamenta","reguland":"regula","regulara":["regulară","regula","regulară","regular","regulara","regular"],"regularam":"regula","regularati":"regula","regulare":"regular","regularea":"regulare","regularele":"regular","regulari":["regulari","regular","regulări","regulare"],"regularii":["regularii","regular","regulării","regulare"],"regularile":"regulare","regularilor":"regulare","regularisea":"regularisi","regulariseai":"regularisi","regulariseam":"regularisi","regulariseati":"regularisi","regulariseau":"regularisi","regularisesc":"regularisi","regulariseste":"regularisi","regularisesti":"regularisi","regularisii":"regularisi","regularisim":"regularisi","regularisind":"regularisi","regularisira":"regularisi","regularisiram":"regularisi","regularisirati":"regularisi","regularisirea":"regularisire","regularisiri":"regularisire","regularisirii":"regularisire","regularisirile":"regularisire","regularisirilor":"regularisire","regularisise":"regularisi","regularisisem":"regularisi","regularisisera":"regularisi","regularisiseram":"regularisi","regularisiserati":"regularisi","regularisisesi":"regularisi","regularisisi":"regularisi","regularisit":"regularisi","regularisiti":"regularisi","regularitatea":"regularitate","regularitati":"regularitate","regularitatii":"regularitate","regularitatile":"regularitate","regularitatilor":"regularitate","regularizai":"regulariza","regularizam":["regularizăm","regulariza","regularizam","regulariza"],"regularizand":"regulariza","regularizara":"regulariza","regularizaram":"regulariza","regularizarati":"regulariza","regularizarea":"regularizare","regularizari":"regularizare","regularizarii":"regularizare","regularizarile":"regularizare","regularizarilor":"regularizare","regularizase":"regulariza","regularizasem":"regulariza","regularizasera":"regulariza","regularizaseram":"regulariza","regularizaserati":"regulariza","regularizasesi":"regulariza","regularizasi":"regulariza","regularizat":"regulariza","regularizata":["regularizată","regularizat","regularizata","regularizat"],"regularizate":"regularizat","regularizatele":"regularizat","regularizati":["regularizați","regulariza","regularizați","regularizat"],"regularizatii":"regularizat","regularizatul":"regularizat","regularizau":"regulariza","regularizeaza":"regulariza","regularizez":"regulariza","regularizezi":"regulariza","regularul":"regular","regulase":"regula","regulasem":"regula","regulasera":"regula","regulaseram":"regula","regulaserati":"regula","regulasesi":"regula","regulasi":"regula","regulat":"regula","regulata":["regulată","regulat","regulata","regulat"],"regulate":"regulat","regulatele":"regulat","regulati":["regulați","regula","regulați","regulat"],"regulatia":"regulație","regulatiei":"regulație","regulatii":["regulații","regulat","regulații","regulație"],"regulatiile":"regulație","regulatiilor":"regulație","regulatoare":"regulator","regulatoarea":["regulatoarea","regulatoare","regulatoarea","regulator"],"regulatoarei":"regulatoare","regulatoarele":["regulatoarele","regulatoare","regulatoarele","regulator"],"regulatoarelor":["regulatoarelor","regulatoare","regulatoarelor","regulator"],"regulatori":"regulator","regulatorii":"regulator","regulatorilor":"regulator","regulatorul":"regulator","regulatorule":"regulator","regulatorului":"regulator","regulatul":"regulat","regulau":"regula","reguleaza":"regula","regulez":"regula","regulezi":"regula","reguli":"regulă","regulii":"regulă","regulile":"regulă","regulilor":"regulă","regurgitai":"regurgita","regurgitam":["regurgităm","regurgita","regurgitam","regurgita"],"regurgitand":"regurgita","regurgitara":"regurgita","regurgitaram":"regurgita","regurgitarati":"regurgita","regurgitase":"regurgita","regurgitasem":"regurgita","regurgitasera":"regurgita","regurgitaseram":"regurgita","regurgitaserati":"regurgita","regurgitasesi":"regurgita","regurgitasi":"regurgita","regurgitat":"regurgita","regurgitati":"regurgita","regurgitatia":"regurgitație","regurgitatiei":"regurgitație","regurgitatii":"regurgitație","regurgitatiile":"regurgitație","regurgitatiilor":"regurgitație","regurgitau":"regurgita","regurgiteaza":"regurgita","regurgitez":"regurgita","regurgitezi":"regurgita","rei":"re","reia":"relua","reiapta":"reiepta","reiata":["reiată","reiat","reiata","reiat"],"reiate":"reiat","reiatele":"reiat","reiati":"reiat","reiatii":"reiat","reiatul":"reiat","reiau":"relua","reiei":"relua","reiept":"reiepta","reieptai":"reiepta","reieptam":["reieptăm","reiepta","reieptam","reiepta"],"reieptand":"reiepta","reieptara":"reiepta","reieptaram":"reiepta","reieptarati":"reiepta","reieptarea":"reieptare","reieptari":"reieptare","reieptarii":"reieptare","reieptarile":"reieptare","reieptarilor":"reieptare","reieptase":"reiepta","reieptasem":"reiepta","reieptasera":"reiepta","reieptaseram":"reiepta","reieptaserati":"reiepta","reieptasesi":"reiepta","reieptasi":"reiepta","reieptat":"reiepta","reieptati":"reiepta","reieptau":"reiepta","reiepti":"reiepta","reies":"reieși","reiese":"reieși","reiesea":"reieși","reieseai":"reieși","reieseam":"reieși","reieseati":"reieși","reieseau":"reieși","reiesii":"reieși","reiesim":"reieși","reiesind":"reieși","reiesira":"reieși","reiesiram":"reieși","reiesirati":"reieși","reiesirea":"reieșire","reiesiri":"reieșire","reiesirii":"reieșire","reiesirile":"reieșire","reiesirilor":"reieșire","reiesise":"reieși","reiesisem":"reieși","reiesisera":"reieși","reiesiseram":"reieși","reiesiserati":"reieși","reiesisesi":"reieși","reiesisi":"reieși","reiesit":"reieși","reiesiti":"reieși","reificarea":"reificare","reificari":"reificare","reificarii":"reificare","reificarile":"reificare","reificarilor":"reificare","reimbarbatai":"reîmbărbăta","reimbarbatam":["reîmbărbătăm","reîmbărbăta","reîmbărbătam","reîmbărbăta"],"reimbarbatand":"reîmbărbăta","reimbarbatara":"reîmbărbăta","reimbarbataram":"reîmbărbăta","reimbarbatarati":"reîmbărbăta","reimbarbatase":"reîmbărbăta","reimbarbatasem":"reîmbărbăta","reimbarbatasera":"reîmbărbăta","reimbarbataseram":"reîmbărbăta","reimbarbataserati":"reîmbărbăta","reimbarbatasesi":"reîmbărbăta","reimbarbatasi":"reîmbărbăta","reimbarbatat":"reîmbărbăta","reimbarbatati":"reîmbărbăta","reimbarbatau":"reîmbărbăta","reimbarbateaza":"reîmbărbăta","reimbarbatez":"reîmbărbăta","reimbarbatezi":"reîmbărbăta","reimpac":"reîmpăca","reimpacai":"reîmpăca","reimpacam":["reîmpăcăm","reîmpăca","reîmpăcam","reîmpăca"],"reimpacand":"reîmpăca","reimpacara":"reîmpăca","reimpacaram":"reîmpăca","reimpacarati":"reîmpăca","reimpacase":"reîmpăca","reimpacasem":"reîmpăca","reimpacasera":"reîmpăca","reimpacaseram":"reîmpăca","reimpacaserati":"reîmpăca","reimpacasesi":"reîmpăca","reimpacasi":"reîmpăca","reimpacat":"reîmpăca","reimpacati":"reîmpăca","reimpacau":"reîmpăca","reimpaci":"reîmpăca","reimpadurea":"reîmpăduri","reimpadureai":"reîmpăduri","reimpaduream":"reîmpăduri","reimpadureati":"reîmpăduri","reimpadureau":"reîmpăduri","reimpaduresc":"reîmpăduri","reimpadureste":"reîmpăduri","reimpaduresti":"reîmpăduri","reimpadurii":"reîmpăduri","reimpadurim":"reîmpăduri","reimpadurind":"reîmpăduri","reimpadurira":"reîmpăduri","reimpaduriram":"reîmpăduri","reimpadurirati":"reîmpăduri","reimpadurirea":"reîmpădurire","reimpaduriri":"reîmpădurire","reimpaduririi":"reîmpădurire","reimpaduririle":"reîmpădurire","reimpaduririlor":"reîmpădurire","reimpadurise":"reîmpăduri","reimpadurisem":"reîmpăduri","reimpadurisera":"reîmpăduri","reimpaduriseram":"reîmpăduri","reimpaduriserati":"reîmpăduri","reimpadurisesi":"reîmpăduri","reimpadurisi":"reîmpăduri","reimpadurit":"reîmpăduri","reimpadurita":["reîmpădurită","reîmpădurit","reîmpădurita","reîmpădurit"],"reimpadurite":"reîmpădurit","reimpaduritele":"reîmpădurit","reimpaduriti":["reîmpăduriți","reîmpăduri","reîmpăduriți","reîmpădurit"],"reimpaduritii":"reîmpădurit","reimpaduritul":"reîmpădurit","reimpart":"reîmpărți","reimparte":["reîmparte","reîmpărți","reîmpărțe","reîmpărți"],"reimpartea":"reîmpărți","reimparteai":"reîmpărți","reimparteam":"reîmpărți","reimparteati":"reîmpărți","reimparteau":"reîmpărți","reimpartii":"reîmpărți","reimpartim":"reîmpărți","reimpartind":"reîmpărți","reimpartira":"reîmpărți","reimpartiram":"reîmpărți","reimpartirati":"reîmpărți","reimpartirea":"reîmpărțire","reimpartiri":"reîmpărțire","reimpartirii":"reîmpărțire","reimpartirile":"reîmpărțire","reimpartirilor":"reîmpărțire","reimpartise":"reîmpărți","reimpartisem":"reîmpărți","reimpartisera":"reîmpărți","reimpartiseram":"reîmpărți","reimpartiserati":"reîmpărți","reimpartisesi":"reîmpărți","reimpartisi":"reîmpărți","reimpartit":"reîmpărți","reimpartita":["reîmpărțită","reîmpărțit","reîmpărțita","reîmpărțit"],"reimpartite":"reîmpărțit","reimpartitele":"reîmpărțit","reimpartiti":["reîmpărțiți","reîmpărți","reîmpărțiți","reîmpărțit"],"reimpartitii":"reîmpărțit","reimpartitul":"reîmpărțit","reimport":"reimporta","reimportai":"reimporta","reimportam":["reimportăm","reimporta","reimportam","reimporta"],"reimportand":"reimporta","reimportara":"reimporta","reimportaram":"reimporta","reimportarati":"reimporta","reimportarea":"reimportare","reimportari":"reimportare","reimportarii":"reimportare","reimportarile":"reimportare","reimportarilor":"reimportare","reimportase":"reimporta","reimportasem":"reimporta","reimportasera":"reimporta","reimportaseram":"reimporta","reimportaserati":"reimporta","reimportasesi":"reimporta","reimportasi":"reimporta","reimportat":"reimporta","reimportata":["reimportată","reimportat","reimportata","reimportat"],"reimportate":"reimportat","reimportatele":"reimportat","reimportati":["reimportați","reimporta","reimportați","reimportat"],"reimportatii":"reimportat","reimportatul":"reimportat","reimportau":"reimporta","reimporte":"reimporta","reimporti":"reimporta","reimpreunai":"reîmpreuna","reimpreunam":["reîmpreunăm","reîmpreuna","reîmpreunam","reîmpreuna"],"reimpreunand":"reîmpreuna","reimpreunara":"reîmpreuna","reimpreunaram":"reîmpreuna","reimpreunarati":"reîmpreuna","reimpreunarea":"reîmpreunare","reimpreunari":"reîmpreunare","reimpreunarii":"reîmpreunare","reimpreunase":"reîmpreuna","reimpreunasem":"reîmpreuna","reimpreunasera":"reîmpreuna","reimpreunaseram":"reîmpreuna","reimpreunaserati":"reîmpreuna","reimpreunasesi":"reîmpreuna","reimpreunasi":"reîmpreuna","reimpreunat":"reîmpreuna","reimpreunati":"reîmpreuna","reimpreunau":"reîmpreuna","reimpreuneaza":"reîmpreuna","reimpreunez":"reîmpreuna","reimpreunezi":"reîmpreuna","reimprieten":"reîmprieteni","reimprietene":"reîmprieteni","reimprietenea":"reîmprieteni","reimprieteneai":"reîmprieteni","reimprieteneam":"reîmprieteni","reimprieteneati":"reîmprieteni","reimprieteneau":"reîmprieteni","reimprietenie":"reîmprieteni","reimprietenii":"reîmprieteni","reimprietenim":"reîmprieteni","reimprietenind":"reîmprieteni","reimprietenira":"reîmprieteni","reimprieteniram":"reîmprieteni","reimprietenirati":"reîmprieteni","reimprietenise":"reîmprieteni","reimprietenisem":"reîmprieteni","reimprietenisera":"reîmprieteni","reimprieteniseram":"reîmprieteni","reimprieteniserati":"reîmprieteni","reimprietenisesi":"reîmprieteni","reimprietenisi":"reîmprieteni","reimprietenit":"reîmprieteni","reimprieteniti":"reîmprieteni","reimprim":"reimprima","reimprimai":"reimprima","reimprimam":["reimprimăm","reimprima","reimprimam","reimprima"],"reimprimand":"reimprima","reimprimara":"reimprima","reimprimaram":"reimprima","reimprimarati":"reimprima","reimprimarea":"reimprimare","reimprimari":"reimprimare","reimprimarii":"reimprimare","reimprimarile":"reimprimare","reimprimarilor":"reimprimare","reimprimase":"reimprima","reimprimasem":"reimprima","reimprimasera":"reimprima","reimprimaseram":"reimprima","reimprimaserati":"reimprima","reimprimasesi":"reimprima","reimprimasi":"reimprima","reimprimat":"reimprima","reimprimata":["reimprimată","reimprimat","reimprimata","reimprimat"],"reimprimate":"reimprimat","reimprimatele":"reimprimat","reimprimati":["reimprimați","reimprima","reimprimați","reimprimat"],"reimprimatii":"reimprimat","reimprimatul":"reimprimat","reimprimau":"reimprima","reimprimi":"reimprima","reimprospatai":"reîmprospăta","reimprospatam":["reîmprospătăm","reîmprospăta","reîmprospătam","reîmprospăta"],"reimprospatand":"reîmprospăta","reimprospatara":"reîmprospăta","reimprospataram":"reîmprospăta","reimprospatarati":"reîmprospăta","reimprospatarea":"reîmprospătare","reimprospatari":"reîmprospătare","reimprospatarii":"reîmprospătare","reimprospatarile":"reîmprospătare","reimprospatarilor":"reîmprospătare","reimprospatase":"reîmprospăta","reimprospatasem":"reîmprospăta","reimprospatasera":"reîmprospăta","reimprospataseram":"reîmprospăta","reimprospataserati":"reîmprospăta","reimprospatasesi":"reîmprospăta","reimprospatasi":"reîmprospăta","reimprospatat":"reîmprospăta","reimprospatata":["reîmprospătată","reîmprospătat","reîmprospătata","reîmprospătat"],"reimprospatate":"reîmprospătat","reimprospatatele":"reîmprospătat","reimprospatati":["reîmprospătați","reîmprospăta","reîmprospătați","reîmprospătat"],"reimprospatatii":"reîmprospătat","reimprospatatul":"reîmprospătat","reimprospatau":"reîmprospăta","reimprospateaza":"reîmprospăta","reimprospatez":"reîmprospăta","reimprospatezi":"reîmprospăta","reimprumut":"reîmprumuta","reimprumutai":"reîmprumuta","reimprumutam":["reîmprumutăm","reîmprumuta","reîmprumutam","reîmprumuta"],"reimprumutand":"reîmprumuta","reimprumutara":"reîmprumuta","reimprumutaram":"reîmprumuta","reimprumutarati":"reîmprumuta","reimprumutase":"reîmprumuta","reimprumutasem":"reîmprumuta","reimprumutasera":"reîmprumuta","reimprumutaseram":"reîmprumuta","reimprumutaserati":"reîmprumuta","reimprumutasesi":"reîmprumuta","reimprumutasi":"reîmprumuta","reimprumutat":"reîmprumuta","reimprumutati":"reîmprumuta","reimprumutau":"reîmprumuta","reimprumuti":"reîmprumuta","reinalt":"reînălța","reinaltai":"reînălța","reinaltam":["reînălțăm","reînălța","reînălțam","reînălța"],"reinaltand":"reînălța","reinaltara":"reînălța","reinaltaram":"reînălța","reinaltarati":"reînălța","reinaltarea":"reînălțare","reinaltari":"reînălțare","reinaltarii":"reînălțare","reinaltarile":"reînălțare","reinaltarilor":"reînălțare","reinaltase":"reînălța","reinaltasem":"reînălța","reinaltasera":"reînălța","reinaltaseram":"reînălța","reinaltaserati":"reînălța","reinaltasesi":"reînălța","reinaltasi":"reînălța","reinaltat":"reînălța","reinaltati":"reînălța","reinaltau":"reînălța","reinalti":"reînălța","reinarmai":"reînarma","reinarmam":["reînarmăm","reînarma","reînarmam","reînarma"],"reinarmand":"reînarma","reinarmara":"reînarma","reinarmaram":"reînarma","reinarmarati":"reînarma","reinarmarea":"reînarmare","reinarmari":"reînarmare","reinarmarii":"reînarmare","reinarmarile":"reînarmare","reinarmarilor":"reînarmare","reinarmase":"reînarma","reinarmasem":"reînarma","reinarmasera":"reînarma","reinarmaseram":"reînarma","reinarmaserati":"reînarma","reinarmasesi":"reînarma","reinarmasi":"reînarma","reinarmat":"reînarma","reinarmata":["reînarmată","reînarmat","reînarmata","reînarmat"],"reinarmate":"reînarmat","reinarmatele":"reînarmat","reinarmati":["reînarmați","reînarma","reînarmați","reînarmat"],"reinarmatii":"reînarmat","reinarmatul":"reînarmat","reinarmau":"reînarma","reinarmeaza":"reînarma","reinarmez":"reînarma","reinarmezi":"reînarma","reincadrarea":"reîncadrare","reincadrari":"reîncadrare","reincadrarii":"reîncadrare","reincadrarile":"reîncadrare","reincadrarilor":"reîncadrare","reincalzea":"reîncălzi","reincalzeai":"reîncălzi","reincalzeam":"reîncălzi","reincalzeati":"reîncălzi","reincalzeau":"reîncălzi","reincalzesc":"reîncălzi","reincalzeste":"reîncălzi","reincalzesti":"reîncălzi","reincalzii":"reîncălzi","reincalzim":"reîncălzi","reincalzind":"reîncălzi","reincalzira":"reîncălzi","reincalziram":"reîncălzi","reincalzirati":"reîncălzi","reincalzirea":"reîncălzire","reincalziri":"reîncălzire","reincalzirii":"reîncălzire","reincalzirile":"reîncălzire","reincalzirilor":"reîncălzire","reincalzise":"reîncălzi","reincalzisem":"reîncălzi","reincalzisera":"reîncălzi","reincalziseram":"reîncălzi","reincalziserati":"reîncălzi","reincalzisesi":"reîncălzi","reincalzisi":"reîncălzi","reincalzit":"reîncălzi","reincalzita":["reîncălzită","reîncălzit","reîncălzita","reîncălzit"],"reincalzite":"reîncălzit","reincalzitele":"reîncălzit","reincalziti":["reîncălziți","reîncălzi","reîncălziți","reîncălzit"],"reincalzitii":"reîncălzit","reincalzitul":"reîncălzit","reincarc":"reîncărca","reincarcai":"reîncărca","reincarcam":["reîncărcăm","reîncărca","reîncărcam","reîncărca"],"reincarcand":"reîncărca","reincarcara":"reîncărca","reincarcaram":"reîncărca","reincarcarati":"reîncărca","reincarcarea":"reîncărcare","reincarcari":"reîncărcare","reincarcarii":"reîncărcare","reincarcarile":"reîncărcare","reincarcarilor":"reîncărcare","reincarcase":"reîncărca","reincarcasem":"reîncărca","reincarcasera":"reîncărca","reincarcaseram":"reîncărca","reincarcaserati":"reîncărca","reincarcasesi":"reîncărca","reincarcasi":"reîncărca","reincarcat":"reîncărca","reincarcata":["reîncărcată","reîncărcat","reîncărcata","reîncărcat"],"reincarcate":"reîncărcat","reincarcatele":"reîncărcat","reincarcati":["reîncărcați","reîncărca","reîncărcați","reîncărcat"],"reincarcatii":"reîncărcat","reincarcatul":"reîncărcat","reincarcau":"reîncărca","reincarci":"reîncărca","reincarnai":["reincarnai","reincarna","reîncarnai","reîncarna"],"reincarnam":["reincarnăm","reincarna","reincarnam","reincarna","reîncarnăm","reîncarna","reîncarnam","reîncarna"],"reincarnand":["reincarnând","reincarna","reîncarnând","reîncarna"],"reincarnara":["reincarnară","reincarna","reîncarnară","reîncarna"],"reincarnaram":["reincarnarăm","reincarna","reîncarnarăm","reîncarna"],"reincarnarati":["reincarnarăți","reincarna","reîncarnarăți","reîncarna"],"reincarnarea":["reincarnarea","reincarnare","reîncarnarea","reîncarnare"],"reincarnari":["reincarnări","reincarnare","reîncarnări","reîncarnare","reîncarnari","reîncarnare"],"reincarnarii":["reincarnării","reincarnare","reîncarnarii","reîncarnare"],"reincarnarile":["reincarnările","reincarnare","reîncarnarile","reîncarnare"],"reincarnarilor":["reincarnărilor","reincarnare","reîncarnarilor","reîncarnare"],"reincarnase":["reincarnase","reincarna","reîncarnase","reîncarna"],"reincarnasem":["reincarnasem","reincarna","reîncarnasem","reîncarna"],"reincarnasera":["reincarnaseră","reincarna","reîncarnaseră","reîncarna"],"reincarnaseram":["reincarnaserăm","reincarna","reîncarnaserăm","reîncarna"],"reincarnaserati":["reincarnaserăți","reincarna","reîncarnaserăți","reîncarna"],"reincarnasesi":["reincarnaseși","reincarna","reîncarnaseși","reîncarna"],"reincarnasi":["reincarnași","reincarna","reîncarnași","reîncarna"],"reincarnat":["reincarnat","reincarna","reîncarnat","reîncarna"],"reincarnati":["reincarnați","reincarna","reîncarnați","reîncarna"],"reincarnatia":"reincarnație","reincarnatiei":"reincarnație","reincarnatii":"reincarnație","reincarnatiile":"reincarnație","reincarnatiilor":"reincarnație","reincarnau":["reincarnau","reincarna","reîncarnau","reîncarna"],"reincarneaza":["reincarnează","reincarna","reîncarnează","reîncarna"],"reincarnez":["reincarnez","reincarna","reîncarnez","reîncarna"],"reincarnezi":["reincarnezi","reincarna","reîncarnezi","reîncarna"],"reinceapa":"reîncepe","reincep":"reîncepe","reincepand":"reîncepe","reincepea":"reîncepe","reincepeai":"reîncepe","reincepeam":"reîncepe","reincepeati":"reîncepe","reincepeau":"reîncepe","reincepem":"reîncepe","reinceperea":"reîncepere","reinceperi":"reîncepere","reinceperii":"reîncepere","reinceperile":"reîncepere","reinceperilor":"reîncepere","reincepeti":"reîncepe","reincepi":"reîncepe","reinceput":"reîncepe","reinceputa":["reîncepută","reînceput","reînceputa","reînceput"],"reincepute":"reînceput","reinceputele":"reînceput","reinceputi":"reînceput","reinceputii":"reînceput","reinceputul":"reînceput","reincese":"reîncepe","reincesei":"reîncepe","reincesera":"reîncepe","reinceseram":"reîncepe","reinceserati":"reîncepe","reincesese":"reîncepe","reincesesem":"reîncepe","reincesesera":"reîncepe","reinceseseram":"reîncepe","reinceseserati":"reîncepe","reincesesesi":"reîncepe","reincesesi":"reîncepe","reinchid":"reînchide","reinchida":"reînchide","reinchidea":"reînchide","reinchideai":"reînchide","reinchideam":"reînchide","reinchideati":"reînchide","reinchideau":"reînchide","reinchidem":"reînchide","reinchiderea":"reînchidere","reinchideri":"reînchidere","reinchiderii":"reînchidere","reinchiderile":"reînchidere","reinchiderilor":"reînchidere","reinchideti":"reînchide","reinchiriai":"reînchiria","reinchiriam":"reînchiria","reinchiriara":"reînchiria","reinchiriaram":"reînchiria","reinchiriarati":"reînchiria","reinchiriase":"reînchiria","reinchiriasem":"reînchiria","reinchiriasera":"reînchiria","reinchiriaseram":"reînchiria","reinchiriaserati":"reînchiria","reinchiriasesi":"reînchiria","reinchiriasi":"reînchiria","reinchiriat":"reînchiria","reinchiriata":["reînchiriată","reînchiriat","reînchiriata","reînchiriat"],"reinchiriate":"reînchiriat","reinchiriatele":"reînchiriat","reinchiriati":["reînchiriați","reînchiria","reînchiriați","reînchiriat"],"reinchiriatii":"reînchiriat","reinchiriatul":"reînchiriat","reinchiriau":"reînchiria","reinchiriaza":"reînchiria","reinchirie":"reînchiria","reinchirieaza":"reînchiria","reinchiriem":"reînchiria","reinchirierea":"reînchiriere","reinchirieri":"reînchiriere","reinchirierii":"reînchiriere","reinchirierile":"reînchiriere","reinchirierilor":"reînchiriere","reinchiriez":"reînchiria","reinchiriezi":"reînchiria","reinchiriind":"reînchiria","reinchis":"reînchide","reinchisa":["reînchisă","reînchis","reînchisa","reînchis"],"reinchise":["reînchise","reînchide","reînchise","reînchis"],"reinchisei":"reînchide","reinchisele":"reînchis","reinchisera":"reînchide","reinchiseram":"reînchide","reinchiserati":"reînchide","reinchisese":"reînchide","reinchisesem":"reînchide","reinchisesera":"reînchide","reinchiseseram":"reînchide","reinchiseserati":"reînchide","reinchisesesi":"reînchide","reinchisesi":"reînchide","reinchisi":"reînchis","reinchisii":"reînchis","reinchisul":"reînchis","reinchizand":"reînchide","reinchizi":"reînchide","reincolt":"reîncolți","reincolte":"reîncolți","reincoltea":"reîncolți","reincolteai":"reîncolți","reincolteam":"reîncolți","reincolteati":"reîncolți","reincolteau":"reîncolți","reincolteste":"reîncolți","reincoltii":"reîncolți","reincoltim":"reîncolți","reincoltind":"reîncolți","reincoltira":"reîncolți","reincoltiram":"reîncolți","reincoltirati":"reîncolți","reincoltirea":"reîncolțire","reincoltiri":"reîncolțire","reincoltirii":"reîncolțire","reincoltirile":"reîncolțire","reincoltirilor":"reîncolțire","reincoltise":"reîncolți","reincoltisem":"reîncolți","reincoltisera":"reîncolți","reincoltiseram":"reîncolți","reincoltiserati":"reîncolți","reincoltisesi":"reîncolți","reincoltisi":"reîncolți","reincoltit":"reîncolți","reincoltiti":"reîncolți","reincorporai":"reîncorpora","reincorporam":["reîncorporăm","reîncorpora","reîncorporam","reîncorpora"],"reincorporand":"reîncorpora","reincorporara":"reîncorpora","reincorporaram":"reîncorpora","reincorporarati":"reîncorpora","reincorporarea":"reîncorporare","reincorporari":"reîncorporare","reincorporarii":"reîncorporare","reincorporarile":"reîncorporare","reincorporarilor":"reîncorporare","reincorporase":"reîncorpora","reincorporasem":"reîncorpora","reincorporasera":"reîncorpora","reincorporaseram":"reîncorpora","reincorporaserati":"reîncorpora","reincorporasesi":"reîncorpora","reincorporasi":"reîncorpora","reincorporat":"reîncorpora","reincorporati":"reîncorpora","reincorporau":"reîncorpora","reincorporeaza":"reîncorpora","reincorporez":"reîncorpora","reincorporezi":"reîncorpora","reindoia":"reîndoi","reindoiai":"reîndoi","reindoiam":"reîndoi","reindoiati":"reîndoi","reindoiau":"reîndoi","reindoie":"reîndoi","reindoii":"reîndoi","reindoim":"reîndoi","reindoind":"reîndoi","reindoira":"reîndoi","reindoiram":"reîndoi","reindoirati":"reîndoi","reindoise":"reîndoi","reindoisem":"reîndoi","reindoisera":"reîndoi","reindoiseram":"reîndoi","reindoiserati":"reîndoi","reindoisesi":"reîndoi","reindoisi":"reîndoi","reindoit":"reîndoi","reindoiti":"reîndoi","reindreapta":"reîndrepta","reindrept":"reîndrepta","reindreptai":"reîndrepta","reindreptam":["reîndreptăm","reîndrepta","reîndreptam","reîndrepta"],"reindreptand":"reîndrepta","reindreptara":"reîndrepta","reindreptaram":"reîndrepta","reindreptarati":"reîndrepta","reindreptarea":"reîndreptare","reindreptari":"reîndreptare","reindreptarii":"reîndreptare","reindreptarile":"reîndreptare","reindreptarilor":"reîndreptare","reindreptase":"reîndrepta","reindreptasem":"reîndrepta","reindreptasera":"reîndrepta","reindreptaseram":"reîndrepta","reindreptaserati":"reîndrepta","reindreptasesi":"reîndrepta","reindreptasi":"reîndrepta","reindreptat":"reîndrepta","reindreptata":["reîndreptată","reîndreptat","reîndreptata","reîndreptat"],"reindreptate":"reîndreptat","reindreptatele":"reîndreptat","reindreptati":["reîndreptați","reîndrepta","reîndreptați","reîndreptat"],"reindreptatii":"reîndreptat","reindreptatul":"reîndreptat","reindreptau":"reîndrepta","reindrepti":"reîndrepta","reindrum":"reîndruma","reindrumai":"reîndruma","reindrumam":["reîndrumăm","reîndruma","reîndrumam","reîndruma"],"reindrumand":"reîndruma","reindrumara":"reîndruma","reindrumaram":"reîndruma","reindrumarati":"reîndruma","reindrumase":"reîndruma","reindrumasem":"reîndruma","reindrumasera":"reîndruma","reindrumaseram":"reîndruma","reindrumaserati":"reîndruma","reindrumasesi":"reîndruma","reindrumasi":"reîndruma","reindrumat":"reîndruma","reindrumati":"reîndruma","reindrumau":"reîndruma","reindrumi":"reîndruma","reinfectai":"reinfecta","reinfectam":["reinfectăm","reinfecta","reinfectam","reinfecta"],"reinfectand":"reinfecta","reinfectara":"reinfecta","reinfectaram":"reinfecta","reinfectarati":"reinfecta","reinfectarea":"reinfectare","reinfectari":"reinfectare","reinfectarii":"reinfectare","reinfectarile":"reinfectare","reinfectarilor":"reinfectare","reinfectase":"reinfecta","reinfectasem":"reinfecta","reinfectasera":"reinfecta","reinfectaseram":"reinfecta","reinfectaserati":"reinfecta","reinfectasesi":"reinfecta","reinfectasi":"reinfecta","reinfectat":"reinfecta","reinfectata":["reinfectată","reinfectat","reinfectata","reinfectat"],"reinfectate":"reinfectat","reinfectatele":"reinfectat","reinfectati":["reinfectați","reinfecta","reinfectați","reinfectat"],"reinfectatii":"reinfectat","reinfectatul":"reinfectat","reinfectau":"reinfecta","reinfecteaza":"reinfecta","reinfectez":"reinfecta","reinfectezi":"reinfecta","reinfiintai":"reînființa","reinfiintam":["reînființăm","reînființa","reînființam","reînființa"],"reinfiintand":"reînființa","reinfiintara":"reînființa","reinfiintaram":"reînființa","reinfiintarati":"reînființa","reinfiintarea":"reînființare","reinfiintari":"reînființare","reinfiintarii":"reînființare","reinfiintarile":"reînființare","reinfiintarilor":"reînființare","reinfiintase":"reînființa","reinfiintasem":"reînființa","reinfiintasera":"reînființa","reinfiintaseram":"reînființa","reinfiintaserati":"reînființa","reinfiintasesi":"reînființa","reinfiintasi":"reînființa","reinfiintat":"reînființa","reinfiintata":["reînființată","reînființat","reînființata","reînființat"],"reinfiintate":"reînființat","reinfiintatele":"reînființat","reinfiintati":["reînființați","reînființa","reînființați","reînființat"],"reinfiintatii":"reînființat","reinfiintatul":"reînființat","reinfiintau":"reînființa","reinfiinteaza":"reînființa","reinfiintez":"reînființa","reinfiintezi":"reînființa","reinflorea":"reînflori","reinfloreai":"reînflori","reinfloream":"reînflori","reinfloreati":"reînflori","reinfloreau":"reînflori","reinfloresc":"reînflori","reinfloreste":"reînflori","reinfloresti":"reînflori","reinflorii":"reînflori","reinflorim":"reînflori","reinflorind":"reînflori","reinflorira":"reînflori","reinfloriram":"reînflori","reinflorirati":"reînflori","reinflorirea":"reînflorire","reinfloriri":"reînflorire","reinfloririi":"reînflorire","reinfloririle":"reînflorire","reinfloririlor":"reînflorire","reinflorise":"reînflori","reinflorisem":"reînflori","reinflorisera":"reînflori","reinfloriseram":"reînflori","reinfloriserati":"reînflori","reinflorisesi":"reînflori","reinflorisi":"reînflori","reinflorit":"reînflori","reinflorita":["reînflorită","reînflorit","reînflorita","reînflorit"],"reinflorite":"reînflorit","reinfloritele":"reînflorit","reinfloriti":["reînfloriți","reînflori","reînfloriți","reînflorit"],"reinfloritii":"reînflorit","reinfloritul":"reînflorit","reinfrumusetarea":"reînfrumusețare","reinfrumusetari":"reînfrumusețare","reinfrumusetarii":"reînfrumusețare","reinfrumusetarile":"reînfrumusețare","reinfrumusetarilor":"reînfrumusețare","reinfrumusetata":["reînfrumusețată","reînfrumusețat","reînfrumusețata","reînfrumusețat"],"reinfrumusetate":"reînfrumusețat","reinfrumusetatele":"reînfrumusețat","reinfrumusetati":"reînfrumusețat","reinfrumusetatii":"reînfrumusețat","reinfrumusetatul":"reînfrumusețat","reinmatriculai":"reînmatricula","reinmatriculam":["reînmatriculăm","reînmatricula","reînmatriculam","reînmatricula"],"reinmatriculand":"reînmatricula","reinmatriculara":"reînmatricula","reinmatricularam":"reînmatricula","reinmatricularati":"reînmatricula","reinmatricularea":"reînmatriculare","reinmatriculari":"reînmatriculare","reinmatricularii":"reînmatriculare","reinmatricularile":"reînmatriculare","reinmatricularilor":"reînmatriculare","reinmatriculase":"reînmatricula","reinmatriculasem":"reînmatricula","reinmatriculasera":"reînmatricula","reinmatriculaseram":"reînmatricula","reinmatriculaserati":"reînmatricula","reinmatriculasesi":"reînmatricula","reinmatriculasi":"reînmatricula","reinmatriculat":"reînmatricula","reinmatriculata":["reînmatriculată","reînmatriculat","reînmatriculata","reînmatriculat"],"reinmatriculate":"reînmatriculat","reinmatriculatele":"reînmatriculat","reinmatriculati":["reînmatriculați","reînmatricula","reînmatriculați","reînmatriculat"],"reinmatriculatii":"reînmatriculat","reinmatriculatul":"reînmatriculat","reinmatriculau":"reînmatricula","reinmatriculeaza":"reînmatricula","reinmatriculez":"reînmatricula","reinmatriculezi":"reînmatricula","reinnoada":"reînnoda","reinnod":"reînnoda","reinnodai":"reînnoda","reinnodam":["reînnodăm","reînnoda","reînnodam","reînnoda"],"reinnodand":"reînnoda","reinnodara":"reînnoda","reinnodaram":"reînnoda","reinnodarati":"reînnoda","reinnodase":"reînnoda","reinnodasem":"reînnoda","reinnodasera":"reînnoda","reinnodaseram":"reînnoda","reinnodaserati":"reînnoda","reinnodasesi":"reînnoda","reinnodasi":"reînnoda","reinnodat":"reînnoda","reinnodata":["reînnodată","reînnodat","reînnodata","reînnodat"],"reinnodate":"reînnodat","reinnodatele":"reînnodat","reinnodati":["reînnodați","reînnoda","reînnodați","reînnodat"],"reinnodatii":"reînnodat","reinnodatul":"reînnodat","reinnodau":"reînnoda","reinnoia":"reînnoi","reinnoiai":"reînnoi","reinnoiam":"reînnoi","reinnoiati":"reînnoi","reinnoiau":"reînnoi","reinnoiesc":"reînnoi","reinnoieste":"reînnoi","reinnoiesti":"reînnoi","reinnoii":"reînnoi","reinnoim":"reînnoi","reinnoind":"reînnoi","reinnoira":"reînnoi","reinnoiram":"reînnoi","reinnoirati":"reînnoi","reinnoirea":"reînnoire","reinnoiri":"reînnoire","reinnoirii":"reînnoire","reinnoirile":"reînnoire","reinnoirilor":"reînnoire","reinnoise":"reînnoi","reinnoisem":"reînnoi","reinnoisera":"reînnoi","reinnoiseram":"reînnoi","reinnoiserati":"reînnoi","reinnoisesi":"reînnoi","reinnoisi":"reînnoi","reinnoit":"reînnoi","reinnoita":["reînnoită","reînnoit","reînnoita","reînnoit"],"reinnoite":"reînnoit","reinnoitele":"reînnoit","reinnoiti":["reînnoiți","reînnoi","reînnoiți","reînnoit"],"reinnoitii":"reînnoit","reinnoitoare":"reînnoitor","reinnoitoarea":"reînnoitor","reinnoitoarele":"reînnoitor","reinnoitori":"reînnoitor","reinnoitorii":"reînnoitor","reinnoitorilor":"reînnoitor","reinnoitorul":"reînnoitor","reinnoitorule":"reînnoitor","reinnoitorului":"reînnoitor","reinnoitul":"reînnoit","reinnozi":"reînnoda","reinsamantai":"reînsămânța","reinsamantam":["reînsămânțăm","reînsămânța","reînsămânțam","reînsămânța"],"reinsamantand":"reînsămânța","reinsamantara":"reînsămânța","reinsamantaram":"reînsămânța","reinsamantarati":"reînsămânța","reinsamantarea":"reînsămânțare","reinsamantari":"reînsămânțare","reinsamantarii":"reînsămânțare","reinsamantarile":"reînsămânțare","reinsamantarilor":"reînsămânțare","reinsamantase":"reînsămânța","reinsamantasem":"reînsămânța","reinsamantasera":"reînsămânța","reinsamantaseram":"reînsămânța","reinsamantaserati":"reînsămânța","reinsamantasesi":"reînsămânța","reinsamantasi":"reînsămânța","reinsamantat":"reînsămânța","reinsamantati":"reînsămânța","reinsamantau":"reînsămânța","reinsamanteaza":"reînsămânța","reinsamantez":"reînsămânța","reinsamantezi":"reînsămânța","reinsanatosea":"reînsănătoși","reinsanatoseai":"reînsănătoși","reinsanatoseam":"reînsănătoși","reinsanatoseati":"reînsănătoși","reinsanatoseau":"reînsănătoși","reinsanatosesc":"reînsănătoși","reinsanatoseste":"reînsănătoși","reinsanatosesti":"reînsănătoși","reinsanatosii":"reînsănătoși","reinsanatosim":"reînsănătoși","reinsanatosind":"reînsănătoși","reinsanatosira":"reînsănătoși","reinsanatosiram":"reînsănătoși","reinsanatosirati":"reînsănătoși","reinsanatosirea":"reînsănătoșire","reinsanatosiri":"reînsănătoșire","reinsanatosirii":"reînsănătoșire","reinsanatosirile":"reînsănătoșire","reinsanatosirilor":"reînsănătoșire","reinsanatosise":"reînsănătoși","reinsanatosisem":"reînsănătoși","reinsanatosisera":"reînsănătoși","reinsanatosiseram":"reînsănătoși","reinsanatosiserati":"reînsănătoși","reinsanatosisesi":"reînsănătoși","reinsanatosisi":"reînsănătoși","reinsanatosit":"reînsănătoși","reinsanatosita":["reînsănătoșită","reînsănătoșit","reînsănătoșita","reînsănătoșit"],"reinsanatosite":"reînsănătoșit","reinsanatositele":"reînsănătoșit","reinsanatositi":["reînsănătoșiți","reînsănătoși","reînsănătoșiți","reînsănătoșit"],"reinsanatositii":"reînsănătoșit","reinsanatositul":"reînsănătoșit","reinscaunai":"reînscăuna","reinscaunam":["reînscăunăm","reînscăuna","reînscăunam","reînscăuna"],"reinscaunand":"reînscăuna","reinscaunara":"reînscăuna","reinscaunaram":"reînscăuna","reinscaunarati":"reînscăuna","reinscaunarea":"reînscăunare","reinscaunari":"reînscăunare","reinscaunarii":"reînscăunare","reinscaunarile":"reînscăunare","reinscaunarilor":"reînscăunare","reinscaunase":"reînscăuna","reinscaunasem":"reînscăuna","reinscaunasera":"reînscăuna","reinscaunaseram":"reînscăuna","reinscaunaserati":"reînscăuna","reinscaunasesi":"reînscăuna","reinscaunasi":"reînscăuna","reinscaunat":"reînscăuna","reinscaunata":["reînscăunată","reînscăunat","reînscăunata","reînscăunat"],"reinscaunate":"reînscăunat","reinscaunatele":"reînscăunat","reinscaunati":["reînscăunați","reînscăuna","reînscăunați","reînscăunat"],"reinscaunatii":"reînscăunat","reinscaunatul":"reînscăunat","reinscaunau":"reînscăuna","reinscauneaza":"reînscăuna","reinscaunez":"reînscăuna","reinscaunezi":"reînscăuna","reinscrierea":"reînscriere","reinscrieri":"reînscriere","reinscrierii":"reînscriere","reinscrierile":"reînscriere","reinscrierilor":"reînscriere","reinsertia":"reinserție","reinsertiei":"reinserție","reinsertii":"reinserție","reinstalai":"reinstala","reinstalam":["reinstalăm","reinstala","reinstalam","reinstala"],"reinstaland":"reinstala","reinstalara":"reinstala","reinstalaram":"reinstala","reinstalarati":"reinstala","reinstalarea":"reinstalare","reinstalari":"reinstalare","reinstalarii":"reinstalare","reinstalarile":"reinstalare","reinstalarilor":"reinstalare","reinstalase":"reinstala","reinstalasem":"reinstala","reinstalasera":"reinstala","reinstalaseram":"reinstala","reinstalaserati":"reinstala","reinstalasesi":"reinstala","reinstalasi":"reinstala","reinstalat":"reinstala","reinstalati":"reinstala","reinstalau":"reinstala","reinstaleaza":"reinstala","reinstalez":"reinstala","reinstalezi":"reinstala","reinstaurai":"reinstaura","reinstauram":["reinstaurăm","reinstaura","reinstauram","reinstaura"],"reinstaurand":"reinstaura","reinstaurara":"reinstaura","reinstauraram":"reinstaura","reinstaurarati":"reinstaura","reinstaurarea":"reinstaurare","reinstaurari":"reinstaurare","reinstaurarii":"reinstaurare","reinstaurarile":"reinstaurare","reinstaurarilor":"reinstaurare","reinstaurase":"reinstaura","reinstaurasem":"reinstaura","reinstaurasera":"reinstaura","reinstauraseram":"reinstaura","reinstauraserati":"reinstaura","reinstaurasesi":"reinstaura","reinstaurasi":"reinstaura","reinstaurat":"reinstaura","reinstaurata":["reinstaurată","reinstaurat","reinstaurata","reinstaurat"],"reinstaurate":"reinstaurat","reinstauratele":"reinstaurat","reinstaurati":["reinstaurați","reinstaura","reinstaurați","reinstaurat"],"reinstauratii":"reinstaurat","reinstauratul":"reinstaurat","reinstaurau":"reinstaura","reinstaureaza":"reinstaura","reinstaurez":"reinstaura","reinstaurezi":"reinstaura","reinsufletea":"reînsufleți","reinsufleteai":"reînsufleți","reinsufleteam":"reînsufleți","reinsufleteati":"reînsufleți","reinsufleteau":"reînsufleți","reinsufletesc":"reînsufleți","reinsufleteste":"reînsufleți","reinsufletesti":"reînsufleți","reinsufletii":"reînsufleți","reinsufletim":"reînsufleți","reinsufletind":"reînsufleți","reinsufletira":"reînsufleți","reinsufletiram":"reînsufleți","reinsufletirati":"reînsufleți","reinsufletirea":"reînsuflețire","reinsufletiri":"reînsuflețire","reinsufletirii":"reînsuflețire","reinsufletirile":"reînsuflețire","reinsufletirilor":"reînsuflețire","reinsufletise":"reînsufleți","reinsufletisem":"reînsufleți","reinsufletisera":"reînsufleți","reinsufletiseram":"reînsufleți","reinsufletiserati":"reînsufleți","reinsufletisesi":"reînsufleți","reinsufletisi":"reînsufleți","reinsufletit":"reînsufleți","reinsufletiti":"reînsufleți","reinsurubai":"reînșuruba","reinsurubam":["reînșurubăm","reînșuruba","reînșurubam","reînșuruba"],"reinsuruband":"reînșuruba","reinsurubara":"reînșuruba","reinsurubaram":"reînșuruba","reinsurubarati":"reînșuruba","reinsurubarea":"reînșurubare","reinsurubari":"reînșurubare","reinsurubarii":"reînșurubare","reinsurubarile":"reînșurubare","reinsurubarilor":"reînșurubare","reinsurubase":"reînșuruba","reinsurubasem":"reînșuruba","reinsurubasera":"reînșuruba","reinsurubaseram":"reînșuruba","reinsurubaserati":"reînșuruba","reinsurubasesi":"reînșuruba","reinsurubasi":"reînșuruba","reinsurubat":"reînșuruba","reinsurubata":["reînșurubată","reînșurubat","reînșurubata","reînșurubat"],"reinsurubate":"reînșurubat","reinsurubatele":"reînșurubat","reinsurubati":["reînșurubați","reînșuruba","reînșurubați","reînșurubat"],"reinsurubatii":"reînșurubat","reinsurubatul":"reînșurubat","reinsurubau":"reînșuruba","reinsurubeaza":"reînșuruba","reinsurubez":"reînșuruba","reinsurubezi":"reînșuruba","reintalnea":"reîntâlni","reintalneai":"reîntâlni","reintalneam":"reîntâlni","reintalneati":"reîntâlni","reintalneau":"reîntâlni","reintalnesc":"reîntâlni","reintalneste":"reîntâlni","reintalnesti":"reîntâlni","reintalnii":"reîntâlni","reintalnim":"reîntâlni","reintalnind":"reîntâlni","reintalnira":"reîntâlni","reintalniram":"reîntâlni","reintalnirati":"reîntâlni","reintalnirea":"reîntâlnire","reintalniri":"reîntâlnire","reintalnirii":"reîntâlnire","reintalnirile":"reîntâlnire","reintalnirilor":"reîntâlnire","reintalnise":"reîntâlni","reintalnisem":"reîntâlni","reintalnisera":"reîntâlni","reintalniseram":"reîntâlni","reintalniserati":"reîntâlni","reintalnisesi":"reîntâlni","reintalnisi":"reîntâlni","reintalnit":"reîntâlni","reintalnita":["reîntâlnită","reîntâlnit","reîntâlnita","reîntâlnit"],"reintalnite":"reîntâlnit","reintalnitele":"reîntâlnit","reintalniti":["reîntâlniți","reîntâlni","reîntâlniți","reîntâlnit"],"reintalnitii":"reîntâlnit","reintalnitul":"reîntâlnit","reintampin":"reîntâmpina","reintampinai":"reîntâmpina","reintampinam":["reîntâmpinăm","reîntâmpina","reîntâmpinam","reîntâmpina"],"reintampinand":"reîntâmpina","reintampinara":"reîntâmpina","reintampinaram":"reîntâmpina","reintampinarati":"reîntâmpina","reintampinase":"reîntâmpina","reintampinasem":"reîntâmpina"};
@@ -0,0 +1 @@
+export default {"reintampinasera":"reîntâmpina","reintampinaseram":"reîntâmpina","reintampinaserati":"reîntâmpina","reintampinasesi":"reîntâmpina","reintampinasi":"reîntâmpina","reintampinat":"reîntâmpina","reintampinati":"reîntâmpina","reintampinau":"reîntâmpina","reintampini":"reîntâmpina","reintarea":"reîntări","reintareai":"reîntări","reintaream":"reîntări","reintareati":"reîntări","reintareau":"reîntări","reintaresc":"reîntări","reintareste":"reîntări","reintaresti":"reîntări","reintarii":"reîntări","reintarim":"reîntări","reintarind":"reîntări","reintarira":"reîntări","reintariram":"reîntări","reintarirati":"reîntări","reintarirea":"reîntărire","reintariri":"reîntărire","reintaririi":"reîntărire","reintaririle":"reîntărire","reintaririlor":"reîntărire","reintarise":"reîntări","reintarisem":"reîntări","reintarisera":"reîntări","reintariseram":"reîntări","reintariserati":"reîntări","reintarisesi":"reîntări","reintarisi":"reîntări","reintarit":"reîntări","reintariti":"reîntări","reintarziai":"reîntârzia","reintarziam":"reîntârzia","reintarziara":"reîntârzia","reintarziaram":"reîntârzia","reintarziarati":"reîntârzia","reintarziase":"reîntârzia","reintarziasem":"reîntârzia","reintarziasera":"reîntârzia","reintarziaseram":"reîntârzia","reintarziaserati":"reîntârzia","reintarziasesi":"reîntârzia","reintarziasi":"reîntârzia","reintarziat":"reîntârzia","reintarziati":"reîntârzia","reintarziau":"reîntârzia","reintarzie":"reîntârzia","reintarziem":"reîntârzia","reintarzii":"reîntârzia","reintarziind":"reîntârzia","reintegrabila":["reintegrabilă","reintegrabil","reintegrabila","reintegrabil"],"reintegrabile":"reintegrabil","reintegrabilele":"reintegrabil","reintegrabili":"reintegrabil","reintegrabilii":"reintegrabil","reintegrabilul":"reintegrabil","reintegrai":"reintegra","reintegram":["reintegrăm","reintegra","reintegram","reintegra"],"reintegrand":"reintegra","reintegrara":"reintegra","reintegraram":"reintegra","reintegrarati":"reintegra","reintegrarea":"reintegrare","reintegrari":"reintegrare","reintegrarii":"reintegrare","reintegrarile":"reintegrare","reintegrarilor":"reintegrare","reintegrase":"reintegra","reintegrasem":"reintegra","reintegrasera":"reintegra","reintegraseram":"reintegra","reintegraserati":"reintegra","reintegrasesi":"reintegra","reintegrasi":"reintegra","reintegrat":"reintegra","reintegrata":["reintegrată","reintegrat","reintegrata","reintegrat"],"reintegrate":"reintegrat","reintegratele":"reintegrat","reintegrati":["reintegrați","reintegra","reintegrați","reintegrat"],"reintegratia":"reintegrație","reintegratiei":"reintegrație","reintegratii":["reintegrații","reintegrat","reintegrații","reintegrație"],"reintegratiile":"reintegrație","reintegratiilor":"reintegrație","reintegratiunea":"reintegrațiune","reintegratiuni":"reintegrațiune","reintegratiunii":"reintegrațiune","reintegratiunile":"reintegrațiune","reintegratiunilor":"reintegrațiune","reintegratul":"reintegrat","reintegrau":"reintegra","reintegreaza":"reintegra","reintegrez":"reintegra","reintegrezi":"reintegra","reintemeiai":"reîntemeia","reintemeiam":"reîntemeia","reintemeiara":"reîntemeia","reintemeiaram":"reîntemeia","reintemeiarati":"reîntemeia","reintemeiase":"reîntemeia","reintemeiasem":"reîntemeia","reintemeiasera":"reîntemeia","reintemeiaseram":"reîntemeia","reintemeiaserati":"reîntemeia","reintemeiasesi":"reîntemeia","reintemeiasi":"reîntemeia","reintemeiat":"reîntemeia","reintemeiati":"reîntemeia","reintemeiau":"reîntemeia","reintemeiaza":"reîntemeia","reintemeie":"reîntemeia","reintemeiem":"reîntemeia","reintemeiez":"reîntemeia","reintemeiezi":"reîntemeia","reintemeind":"reîntemeia","reinterogai":"reinteroga","reinterogam":["reinterogăm","reinteroga","reinterogam","reinteroga"],"reinterogand":"reinteroga","reinterogara":"reinteroga","reinterogaram":"reinteroga","reinterogarati":"reinteroga","reinterogarea":"reinterogare","reinterogari":"reinterogare","reinterogarii":"reinterogare","reinterogarile":"reinterogare","reinterogarilor":"reinterogare","reinterogase":"reinteroga","reinterogasem":"reinteroga","reinterogasera":"reinteroga","reinterogaseram":"reinteroga","reinterogaserati":"reinteroga","reinterogasesi":"reinteroga","reinterogasi":"reinteroga","reinterogat":"reinteroga","reinterogata":["reinterogată","reinterogat","reinterogata","reinterogat"],"reinterogate":"reinterogat","reinterogatele":"reinterogat","reinterogati":["reinterogați","reinteroga","reinterogați","reinterogat"],"reinterogatia":"reinterogație","reinterogatiei":"reinterogație","reinterogatii":["reinterogații","reinterogat","reinterogații","reinterogație"],"reinterogatiile":"reinterogație","reinterogatiilor":"reinterogație","reinterogatul":"reinterogat","reinterogau":"reinteroga","reinterogheaza":"reinteroga","reinteroghez":"reinteroga","reinteroghezi":"reinteroga","reinterpretai":"reinterpreta","reinterpretam":["reinterpretăm","reinterpreta","reinterpretam","reinterpreta"],"reinterpretand":"reinterpreta","reinterpretara":"reinterpreta","reinterpretaram":"reinterpreta","reinterpretarati":"reinterpreta","reinterpretarea":"reinterpretare","reinterpretari":"reinterpretare","reinterpretarii":"reinterpretare","reinterpretarile":"reinterpretare","reinterpretarilor":"reinterpretare","reinterpretase":"reinterpreta","reinterpretasem":"reinterpreta","reinterpretasera":"reinterpreta","reinterpretaseram":"reinterpreta","reinterpretaserati":"reinterpreta","reinterpretasesi":"reinterpreta","reinterpretasi":"reinterpreta","reinterpretat":"reinterpreta","reinterpretata":["reinterpretată","reinterpretat","reinterpretata","reinterpretat"],"reinterpretate":"reinterpretat","reinterpretatele":"reinterpretat","reinterpretati":["reinterpretați","reinterpreta","reinterpretați","reinterpretat"],"reinterpretatii":"reinterpretat","reinterpretatul":"reinterpretat","reinterpretau":"reinterpreta","reinterpreteaza":"reinterpreta","reinterpretez":"reinterpreta","reinterpretezi":"reinterpreta","reintinerea":"reîntineri","reintinereai":"reîntineri","reintineream":"reîntineri","reintinereati":"reîntineri","reintinereau":"reîntineri","reintineresc":"reîntineri","reintinereste":"reîntineri","reintineresti":"reîntineri","reintinerii":"reîntineri","reintinerim":"reîntineri","reintinerind":"reîntineri","reintinerira":"reîntineri","reintineriram":"reîntineri","reintinerirati":"reîntineri","reintinerirea":"reîntinerire","reintineriri":"reîntinerire","reintineririi":"reîntinerire","reintineririle":"reîntinerire","reintineririlor":"reîntinerire","reintinerise":"reîntineri","reintinerisem":"reîntineri","reintinerisera":"reîntineri","reintineriseram":"reîntineri","reintineriserati":"reîntineri","reintinerisesi":"reîntineri","reintinerisi":"reîntineri","reintinerit":"reîntineri","reintinerita":["reîntinerită","reîntinerit","reîntinerita","reîntinerit"],"reintinerite":"reîntinerit","reintineritele":"reîntinerit","reintineriti":["reîntineriți","reîntineri","reîntineriți","reîntinerit"],"reintineritii":"reîntinerit","reintineritoare":"reîntineritor","reintineritoarea":"reîntineritor","reintineritoarele":"reîntineritor","reintineritori":"reîntineritor","reintineritorii":"reîntineritor","reintineritorul":"reîntineritor","reintineritul":"reîntinerit","reintoarca":"reîntoarce","reintoarcem":"reîntoarce","reintoarcerea":"reîntoarcere","reintoarceri":"reîntoarcere","reintoarcerii":"reîntoarcere","reintoarcerile":"reîntoarcere","reintoarcerilor":"reîntoarcere","reintoarceti":"reîntoarce","reintoarna":"reînturna","reintoarse":"reîntoarce","reintoarsera":"reîntoarce","reintoarseram":"reîntoarce","reintoarserati":"reîntoarce","reintocmirea":"reîntocmire","reintocmiri":"reîntocmire","reintocmirii":"reîntocmire","reintocmirile":"reîntocmire","reintocmirilor":"reîntocmire","reintocmita":["reîntocmită","reîntocmit","reîntocmita","reîntocmit"],"reintocmite":"reîntocmit","reintocmitele":"reîntocmit","reintocmiti":"reîntocmit","reintocmitii":"reîntocmit","reintocmitul":"reîntocmit","reintorc":"reîntoarce","reintorcand":"reîntoarce","reintorcea":"reîntoarce","reintorceai":"reîntoarce","reintorceam":"reîntoarce","reintorceati":"reîntoarce","reintorceau":"reîntoarce","reintorci":"reîntoarce","reintors":"reîntoarce","reintorsei":"reîntoarce","reintorsese":"reîntoarce","reintorsesem":"reîntoarce","reintorsesera":"reîntoarce","reintorseseram":"reîntoarce","reintorseserati":"reîntoarce","reintorsesesi":"reîntoarce","reintorsesi":"reîntoarce","reintrai":["reintrai","reintra","reîntrai","reîntra"],"reintram":["reintrăm","reintra","reintram","reintra","reîntrăm","reîntra","reîntram","reîntra"],"reintrand":["reintrând","reintra","reîntrând","reîntra"],"reintrara":["reintrară","reintra","reîntrară","reîntra"],"reintraram":["reintrarăm","reintra","reîntrarăm","reîntra"],"reintrarati":["reintrarăți","reintra","reîntrarăți","reîntra"],"reintrarea":"reintrare","reintrari":"reintrare","reintrarii":"reintrare","reintrarile":"reintrare","reintrarilor":"reintrare","reintrase":["reintrase","reintra","reîntrase","reîntra"],"reintrasem":["reintrasem","reintra","reîntrasem","reîntra"],"reintrasera":["reintraseră","reintra","reîntraseră","reîntra"],"reintraseram":["reintraserăm","reintra","reîntraserăm","reîntra"],"reintraserati":["reintraserăți","reintra","reîntraserăți","reîntra"],"reintrasesi":["reintraseși","reintra","reîntraseși","reîntra"],"reintrasi":["reintrași","reintra","reîntrași","reîntra"],"reintrat":["reintrat","reintra","reîntrat","reîntra"],"reintrati":["reintrați","reintra","reîntrați","reîntra"],"reintrau":["reintrau","reintra","reîntrau","reîntra"],"reintregea":"reîntregi","reintregeai":"reîntregi","reintregeam":"reîntregi","reintregeati":"reîntregi","reintregeau":"reîntregi","reintregesc":"reîntregi","reintregeste":"reîntregi","reintregesti":"reîntregi","reintregii":"reîntregi","reintregim":"reîntregi","reintregimea":"reîntregime","reintregimi":"reîntregime","reintregimii":"reîntregime","reintregind":"reîntregi","reintregira":"reîntregi","reintregiram":"reîntregi","reintregirati":"reîntregi","reintregirea":"reîntregire","reintregiri":"reîntregire","reintregirii":"reîntregire","reintregirile":"reîntregire","reintregirilor":"reîntregire","reintregise":"reîntregi","reintregisem":"reîntregi","reintregisera":"reîntregi","reintregiseram":"reîntregi","reintregiserati":"reîntregi","reintregisesi":"reîntregi","reintregisi":"reîntregi","reintregit":"reîntregi","reintregita":["reîntregită","reîntregit","reîntregita","reîntregit"],"reintregite":"reîntregit","reintregitele":"reîntregit","reintregiti":["reîntregiți","reîntregi","reîntregiți","reîntregit"],"reintregitii":"reîntregit","reintregitul":"reîntregit","reintremarea":"reîntremare","reintremari":"reîntremare","reintremarii":"reîntremare","reintremarile":"reîntremare","reintremarilor":"reîntremare","reintri":["reintri","reintra","reîntri","reîntra"],"reintrodu":"reintroduce","reintroduc":"reintroduce","reintroduca":"reintroduce","reintroducand":"reintroduce","reintroducea":"reintroduce","reintroduceai":"reintroduce","reintroduceam":"reintroduce","reintroduceati":"reintroduce","reintroduceau":"reintroduce","reintroducem":"reintroduce","reintroducerea":"reintroducere","reintroduceri":"reintroducere","reintroducerii":"reintroducere","reintroducerile":"reintroducere","reintroducerilor":"reintroducere","reintroduceti":"reintroduce","reintroduci":"reintroduce","reintrodus":"reintroduce","reintrodusa":["reintrodusă","reintrodus","reintrodusa","reintrodus"],"reintroduse":["reintroduse","reintroduce","reintroduse","reintrodus"],"reintrodusei":"reintroduce","reintrodusele":"reintrodus","reintrodusera":"reintroduce","reintroduseram":"reintroduce","reintroduserati":"reintroduce","reintrodusese":"reintroduce","reintrodusesem":"reintroduce","reintrodusesera":"reintroduce","reintroduseseram":"reintroduce","reintroduseserati":"reintroduce","reintrodusesesi":"reintroduce","reintrodusesi":"reintroduce","reintrodusi":"reintrodus","reintrodusii":"reintrodus","reintrodusul":"reintrodus","reintronai":"reîntrona","reintronam":["reîntronăm","reîntrona","reîntronam","reîntrona"],"reintronand":"reîntrona","reintronara":"reîntrona","reintronaram":"reîntrona","reintronarati":"reîntrona","reintronase":"reîntrona","reintronasem":"reîntrona","reintronasera":"reîntrona","reintronaseram":"reîntrona","reintronaserati":"reîntrona","reintronasesi":"reîntrona","reintronasi":"reîntrona","reintronat":"reîntrona","reintronata":["reîntronată","reîntronat","reîntronata","reîntronat"],"reintronate":"reîntronat","reintronatele":"reîntronat","reintronati":["reîntronați","reîntrona","reîntronați","reîntronat"],"reintronatii":"reîntronat","reintronatul":"reîntronat","reintronau":"reîntrona","reintroneaza":"reîntrona","reintronez":"reîntrona","reintronezi":"reîntrona","reintru":["reintru","reintra","reîntru","reîntra"],"reintrupai":"reîntrupa","reintrupam":["reîntrupăm","reîntrupa","reîntrupam","reîntrupa"],"reintrupand":"reîntrupa","reintrupara":"reîntrupa","reintruparam":"reîntrupa","reintruparati":"reîntrupa","reintrupase":"reîntrupa","reintrupasem":"reîntrupa","reintrupasera":"reîntrupa","reintrupaseram":"reîntrupa","reintrupaserati":"reîntrupa","reintrupasesi":"reîntrupa","reintrupasi":"reîntrupa","reintrupat":"reîntrupa","reintrupati":"reîntrupa","reintrupau":"reîntrupa","reintrupeaza":"reîntrupa","reintrupez":"reîntrupa","reintrupezi":"reîntrupa","reinturn":"reînturna","reinturnai":"reînturna","reinturnam":["reînturnăm","reînturna","reînturnam","reînturna"],"reinturnand":"reînturna","reinturnara":"reînturna","reinturnaram":"reînturna","reinturnarati":"reînturna","reinturnase":"reînturna","reinturnasem":"reînturna","reinturnasera":"reînturna","reinturnaseram":"reînturna","reinturnaserati":"reînturna","reinturnasesi":"reînturna","reinturnasi":"reînturna","reinturnat":"reînturna","reinturnati":"reînturna","reinturnau":"reînturna","reinturni":"reînturna","reinventariai":"reinventaria","reinventariam":"reinventaria","reinventariara":"reinventaria","reinventariaram":"reinventaria","reinventariarati":"reinventaria","reinventariase":"reinventaria","reinventariasem":"reinventaria","reinventariasera":"reinventaria","reinventariaseram":"reinventaria","reinventariaserati":"reinventaria","reinventariasesi":"reinventaria","reinventariasi":"reinventaria","reinventariat":"reinventaria","reinventariati":"reinventaria","reinventariau":"reinventaria","reinventariaza":"reinventaria","reinventarie":"reinventaria","reinventariem":"reinventaria","reinventariez":"reinventaria","reinventarieze":"reinventaria","reinventariezi":"reinventaria","reinventariind":"reinventaria","reinverz":"reînverzi","reinverze":"reînverzi","reinverzea":"reînverzi","reinverzeai":"reînverzi","reinverzeam":"reînverzi","reinverzeati":"reînverzi","reinverzeau":"reînverzi","reinverzie":"reînverzi","reinverzii":"reînverzi","reinverzim":"reînverzi","reinverzind":"reînverzi","reinverzira":"reînverzi","reinverziram":"reînverzi","reinverzirati":"reînverzi","reinverzirea":"reînverzire","reinverziri":"reînverzire","reinverzirii":"reînverzire","reinverzirile":"reînverzire","reinverzirilor":"reînverzire","reinverzise":"reînverzi","reinverzisem":"reînverzi","reinverzisera":"reînverzi","reinverziseram":"reînverzi","reinverziserati":"reînverzi","reinverzisesi":"reînverzi","reinverzisi":"reînverzi","reinverzit":"reînverzi","reinverzita":["reînverzită","reînverzit","reînverzita","reînverzit"],"reinverzite":"reînverzit","reinverzitele":"reînverzit","reinverziti":["reînverziți","reînverzi","reînverziți","reînverzit"],"reinverzitii":"reînverzit","reinverzitul":"reînverzit","reinvestea":"reinvesti","reinvesteai":"reinvesti","reinvesteam":"reinvesti","reinvesteati":"reinvesti","reinvesteau":"reinvesti","reinvestesc":"reinvesti","reinvesteste":"reinvesti","reinvestesti":"reinvesti","reinvestii":"reinvesti","reinvestim":"reinvesti","reinvestind":"reinvesti","reinvestira":"reinvesti","reinvestiram":"reinvesti","reinvestirati":"reinvesti","reinvestirea":"reinvestire","reinvestiri":"reinvestire","reinvestirii":"reinvestire","reinvestirile":"reinvestire","reinvestirilor":"reinvestire","reinvestise":"reinvesti","reinvestisem":"reinvesti","reinvestisera":"reinvesti","reinvestiseram":"reinvesti","reinvestiserati":"reinvesti","reinvestisesi":"reinvesti","reinvestisi":"reinvesti","reinvestit":"reinvesti","reinvestita":["reinvestită","reinvestit","reinvestita","reinvestit"],"reinvestite":"reinvestit","reinvestitele":"reinvestit","reinvestiti":["reinvestiți","reinvesti","reinvestiți","reinvestit"],"reinvestitii":"reinvestit","reinvestitul":"reinvestit","reinviai":"reînvia","reinviam":"reînvia","reinviara":"reînvia","reinviaram":"reînvia","reinviarati":"reînvia","reinviase":"reînvia","reinviasem":"reînvia","reinviasera":"reînvia","reinviaseram":"reînvia","reinviaserati":"reînvia","reinviasesi":"reînvia","reinviasi":"reînvia","reinviat":"reînvia","reinviata":["reînviată","reînviat","reînviata","reînviat"],"reinviate":"reînviat","reinviatele":"reînviat","reinviati":["reînviați","reînvia","reînviați","reînviat"],"reinviatii":"reînviat","reinviatul":"reînviat","reinviau":"reînvia","reinvie":"reînvia","reinviem":"reînvia","reinvierea":"reînviere","reinvieri":"reînviere","reinvierii":"reînviere","reinvierile":"reînviere","reinvierilor":"reînviere","reinvietoare":"reînvietor","reinvietoarea":"reînvietor","reinvietoarele":"reînvietor","reinvietori":"reînvietor","reinvietorii":"reînvietor","reinvietorul":"reînvietor","reinvii":"reînvia","reinviia":"reînvia","reinviind":"reînvia","reinvit":"reinvita","reinvitai":"reinvita","reinvitam":["reinvităm","reinvita","reinvitam","reinvita"],"reinvitand":"reinvita","reinvitara":"reinvita","reinvitaram":"reinvita","reinvitarati":"reinvita","reinvitase":"reinvita","reinvitasem":"reinvita","reinvitasera":"reinvita","reinvitaseram":"reinvita","reinvitaserati":"reinvita","reinvitasesi":"reinvita","reinvitasi":"reinvita","reinvitat":"reinvita","reinvitati":"reinvita","reinvitau":"reinvita","reinviti":"reinvita","reionisme":"reionism","reionismele":"reionism","reionismelor":"reionism","reionismul":"reionism","reionismule":"reionism","reionismului":"reionism","reislacul":"reislâc","reislacule":"reislâc","reislacului":"reislâc","reiterai":"reitera","reiteram":["reiterăm","reitera","reiteram","reitera"],"reiterand":"reitera","reiterara":"reitera","reiteraram":"reitera","reiterarati":"reitera","reiterarea":"reiterare","reiterari":"reiterare","reiterarii":"reiterare","reiterarile":"reiterare","reiterarilor":"reiterare","reiterase":"reitera","reiterasem":"reitera","reiterasera":"reitera","reiteraseram":"reitera","reiteraserati":"reitera","reiterasesi":"reitera","reiterasi":"reitera","reiterat":"reitera","reiterata":["reiterată","reiterat","reiterata","reiterat"],"reiterate":"reiterat","reiteratele":"reiterat","reiterati":["reiterați","reitera","reiterați","reiterat"],"reiteratia":"reiterație","reiteratiei":"reiterație","reiteratii":["reiterații","reiterat","reiterații","reiterație"],"reiteratiile":"reiterație","reiteratiilor":"reiterație","reiterativa":["reiterativă","reiterativ","reiterativa","reiterativ"],"reiterative":"reiterativ","reiterativele":"reiterativ","reiterativi":"reiterativ","reiterativii":"reiterativ","reiterativul":"reiterativ","reiteratul":"reiterat","reiterau":"reitera","reitereaza":"reitera","reiterez":"reitera","reiterezi":"reitera","reivea":"reivi","reiveai":"reivi","reiveam":"reivi","reiveati":"reivi","reiveau":"reivi","reivesc":"reivi","reiveste":"reivi","reivesti":"reivi","reivii":"reivi","reivim":"reivi","reivind":"reivi","reivira":"reivi","reiviram":"reivi","reivirati":"reivi","reivirea":"reivire","reiviri":"reivire","reivirii":"reivire","reivirile":"reivire","reivirilor":"reivire","reivise":"reivi","reivisem":"reivi","reivisera":"reivi","reiviseram":"reivi","reiviserati":"reivi","reivisesi":"reivi","reivisi":"reivi","reivit":"reivi","reiviti":"reivi","reizb":"reizbi","reizbe":"reizbi","reizbea":"reizbi","reizbeai":"reizbi","reizbeam":"reizbi","reizbeati":"reizbi","reizbeau":"reizbi","reizbie":"reizbi","reizbii":"reizbi","reizbim":"reizbi","reizbind":"reizbi","reizbira":"reizbi","reizbiram":"reizbi","reizbirati":"reizbi","reizbise":"reizbi","reizbisem":"reizbi","reizbisera":"reizbi","reizbiseram":"reizbi","reizbiserati":"reizbi","reizbisesi":"reizbi","reizbisi":"reizbi","reizbit":"reizbi","reizbiti":"reizbi","reizbucn":"reizbucni","reizbucne":"reizbucni","reizbucnea":"reizbucni","reizbucneai":"reizbucni","reizbucneam":"reizbucni","reizbucneati":"reizbucni","reizbucneau":"reizbucni","reizbucnie":"reizbucni","reizbucnii":"reizbucni","reizbucnim":"reizbucni","reizbucnind":"reizbucni","reizbucnira":"reizbucni","reizbucniram":"reizbucni","reizbucnirati":"reizbucni","reizbucnirea":"reizbucnire","reizbucniri":"reizbucnire","reizbucnirii":"reizbucnire","reizbucnirile":"reizbucnire","reizbucnirilor":"reizbucnire","reizbucnise":"reizbucni","reizbucnisem":"reizbucni","reizbucnisera":"reizbucni","reizbucniseram":"reizbucni","reizbucniserati":"reizbucni","reizbucnisesi":"reizbucni","reizbucnisi":"reizbucni","reizbucnit":"reizbucni","reizbucniti":"reizbucni","rejoaca":"rejuca","rejoc":"rejuca","rejoci":"rejuca","rejucai":"rejuca","rejucam":["rejucăm","rejuca","rejucam","rejuca"],"rejucand":"rejuca","rejucara":"rejuca","rejucaram":"rejuca","rejucarati":"rejuca","rejucarea":"rejucare","rejucari":"rejucare","rejucarii":"rejucare","rejucarile":"rejucare","rejucarilor":"rejucare","rejucase":"rejuca","rejucasem":"rejuca","rejucasera":"rejuca","rejucaseram":"rejuca","rejucaserati":"rejuca","rejucasesi":"rejuca","rejucasi":"rejuca","rejucat":"rejuca","rejucati":"rejuca","rejucau":"rejuca","rejudec":"rejudeca","rejudecai":"rejudeca","rejudecam":["rejudecăm","rejudeca","rejudecam","rejudeca"],"rejudecand":"rejudeca","rejudecara":"rejudeca","rejudecaram":"rejudeca","rejudecarati":"rejudeca","rejudecarea":"rejudecare","rejudecari":"rejudecare","rejudecarii":"rejudecare","rejudecarile":"rejudecare","rejudecarilor":"rejudecare","rejudecase":"rejudeca","rejudecasem":"rejudeca","rejudecasera":"rejudeca","rejudecaseram":"rejudeca","rejudecaserati":"rejudeca","rejudecasesi":"rejudeca","rejudecasi":"rejudeca","rejudecat":"rejudeca","rejudecata":["rejudecată","rejudecat","rejudecata","rejudecat"],"rejudecate":"rejudecat","rejudecatele":"rejudecat","rejudecati":["rejudecați","rejudeca","rejudecați","rejudecat"],"rejudecatii":"rejudecat","rejudecatul":"rejudecat","rejudecau":"rejudeca","rejudeci":"rejudeca","relaciunea":"relăciune","relaciuni":"relăciune","relaciunii":"relăciune","relaciunile":"relăciune","relaciunilor":"relăciune","relaioarea":"relaioare","relaioarei":"relaioare","relaioarele":"relaioare","relaioarelor":"relaioare","relansai":"relansa","relansam":["relansăm","relansa","relansam","relansa"],"relansand":"relansa","relansara":"relansa","relansaram":"relansa","relansarati":"relansa","relansarea":"relansare","relansari":"relansare","relansarii":"relansare","relansarile":"relansare","relansarilor":"relansare","relansase":"relansa","relansasem":"relansa","relansasera":"relansa","relansaseram":"relansa","relansaserati":"relansa","relansasesi":"relansa","relansasi":"relansa","relansat":"relansa","relansati":"relansa","relansau":"relansa","relanseaza":"relansa","relansez":"relansa","relansezi":"relansa","relasul":"relaș","relasule":"relaș","relasului":"relaș","relasuri":"relaș","relasurile":"relaș","relasurilor":"relaș","relatai":"relata","relatam":["relatăm","relata","relatam","relata"],"relatand":"relata","relatara":"relata","relataram":"relata","relatarati":"relata","relatarea":"relatare","relatari":"relatare","relatarii":"relatare","relatarile":"relatare","relatarilor":"relatare","relatase":"relata","relatasem":"relata","relatasera":"relata","relataseram":"relata","relataserati":"relata","relatasesi":"relata","relatasi":"relata","relatat":"relata","relatati":"relata","relatau":"relata","relateaza":"relata","relatez":"relata","relatezi":"relata","relatia":"relație","relatiei":"relație","relatii":"relație","relatii binare":"relație binară","relatii de echivalenta":"relație de echivalență","relatii sexuale":"relație sexuală","relatiile":"relație","relatiilor":"relație","relationai":"relaționa","relationala":["relațională","relațional","relaționala","relațional"],"relationale":"relațional","relationalele":"relațional","relationali":"relațional","relationalii":"relațional","relationalul":"relațional","relationam":["relaționăm","relaționa","relaționam","relaționa"],"relationand":"relaționa","relationara":"relaționa","relationaram":"relaționa","relationarati":"relaționa","relationase":"relaționa","relationasem":"relaționa","relationasera":"relaționa","relationaseram":"relaționa","relationaserati":"relaționa","relationasesi":"relaționa","relationasi":"relaționa","relationat":"relaționa","relationata":["relaționată","relaționat","relaționata","relaționat"],"relationate":"relaționat","relationatele":"relaționat","relationati":["relaționați","relaționa","relaționați","relaționat"],"relationatii":"relaționat","relationatul":"relaționat","relationau":"relaționa","relationeaza":"relaționa","relationez":"relaționa","relationezi":"relaționa","relationismul":"relaționism","relationismule":"relaționism","relationismului":"relaționism","relatiune":"relație","relatiunea":"relațiune","relatiuni":"relațiune","relatiunii":"relațiune","relatiunile":"relațiune","relatiunilor":"relațiune","relativa":["relativă","relativ","relativa","relativ"],"relative":"relativ","relativele":"relativ","relativi":"relativ","relativii":"relativ","relativismul":"relativism","relativismule":"relativism","relativismului":"relativism","relativista":["relativistă","relativist","relativista","relativist"],"relativiste":["relativiste","relativist","relativiste","relativistă"],"relativistei":"relativistă","relativistele":["relativistele","relativist","relativistele","relativistă"],"relativistelor":"relativistă","relativisti":"relativist","relativistii":"relativist","relativistul":"relativist","relativitatea":"relativitate","relativitati":"relativitate","relativitatii":"relativitate","relativitatile":"relativitate","relativitatilor":"relativitate","relativizai":"relativiza","relativizam":["relativizăm","relativiza","relativizam","relativiza"],"relativizand":"relativiza","relativizara":"relativiza","relativizaram":"relativiza","relativizarati":"relativiza","relativizarea":"relativizare","relativizari":"relativizare","relativizarii":"relativizare","relativizarile":"relativizare","relativizarilor":"relativizare","relativizase":"relativiza","relativizasem":"relativiza","relativizasera":"relativiza","relativizaseram":"relativiza","relativizaserati":"relativiza","relativizasesi":"relativiza","relativizasi":"relativiza","relativizat":"relativiza","relativizati":"relativiza","relativizau":"relativiza","relativizeaza":"relativiza","relativizez":"relativiza","relativizezi":"relativiza","relativul":"relativ","relaxai":"relaxa","relaxam":["relaxăm","relaxa","relaxam","relaxa"],"relaxand":"relaxa","relaxanta":["relaxantă","relaxant","relaxanta","relaxant"],"relaxante":"relaxant","relaxantele":"relaxant","relaxanti":"relaxant","relaxantii":"relaxant","relaxantile":"relaxant","relaxantilor":"relaxant","relaxantul":"relaxant","relaxantule":"relaxant","relaxantului":"relaxant","relaxara":"relaxa","relaxaram":"relaxa","relaxarati":"relaxa","relaxarea":"relaxare","relaxari":"relaxare","relaxarii":"relaxare","relaxarile":"relaxare","relaxarilor":"relaxare","relaxase":"relaxa","relaxasem":"relaxa","relaxasera":"relaxa","relaxaseram":"relaxa","relaxaserati":"relaxa","relaxasesi":"relaxa","relaxasi":"relaxa","relaxat":"relaxa","relaxata":["relaxată","relaxat","relaxata","relaxat"],"relaxate":"relaxat","relaxatele":"relaxat","relaxati":["relaxați","relaxa","relaxați","relaxat"],"relaxatia":"relaxație","relaxatiei":"relaxație","relaxatii":["relaxații","relaxat","relaxații","relaxație"],"relaxatiile":"relaxație","relaxatiilor":"relaxație","relaxatul":"relaxat","relaxau":"relaxa","relaxeaza":"relaxa","relaxez":"relaxa","relaxezi":"relaxa","rele":"rău","relecturi":"relectură","relecturii":"relectură","relecturile":"relectură","relecturilor":"relectură","relee":"releu","releele":"releu","releelor":"releu","releg":"relega","relegai":"relega","relegalizarea":"relegalizare","relegalizari":"relegalizare","relegalizarii":"relegalizare","relegam":["relegăm","relega","relegam","relega"],"relegand":"relega","relegara":"relega","relegaram":"relega","relegarati":"relega","relegase":"relega","relegasem":"relega","relegasera":"relega","relegaseram":"relega","relegaserati":"relega","relegasesi":"relega","relegasi":"relega","relegat":"relega","relegati":"relega","relegatia":"relegație","relegatiei":"relegație","relegatii":"relegație","relegatiile":"relegație","relegatiilor":"relegație","relegatiunea":"relegațiune","relegatiuni":"relegațiune","relegatiunii":"relegațiune","relegatiunile":"relegațiune","relegatiunilor":"relegațiune","relegau":"relega","relege":"relega","relegea":"relege","relegi":["relegi","relega","relegi","relege"],"relegii":"relege","relegile":"relege","relegilor":"relege","relele":"rău","relelor":"rău","releul":"releu","releule":"releu","releului":"releu","relev":"releva","relevai":"releva","relevam":["relevăm","releva","relevam","releva"],"relevand":"releva","relevanta":["relevantă","relevant","relevanta","relevant"],"relevante":["relevante","relevant","relevanțe","relevanță"],"relevantei":"relevanță","relevantele":["relevantele","relevant","relevanțele","relevanță"],"relevantelor":"relevanță","relevanti":"relevant","relevantii":"relevant","relevantul":"relevant","relevara":"releva","relevaram":"releva","relevarati":"releva","relevarea":"relevare","relevari":"relevare","relevarii":"relevare","relevarile":"relevare","relevarilor":"relevare","relevase":"releva","relevasem":"releva","relevasera":"releva","relevaseram":"releva","relevaserati":"releva","relevasesi":"releva","relevasi":"releva","relevat":"releva","relevati":"releva","relevau":"releva","releve":"releva","relevee":"releveu","releveele":"releveu","releveelor":"releveu","releveul":"releveu","releveule":"releveu","releveului":"releveu","relevi":"releva","relevmente":"relevment","relevmentele":"relevment","relevmentelor":"relevment","relevmentul":"relevment","relevmentule":"relevment","relevmentului":"relevment","relicta":["relictă","relict","relicta","relict"],"relicte":["relicte","relict","relicte","relictă"],"relictei":"relictă","relictele":["relictele","relict","relictele","relictă"],"relictelor":"relictă","relicti":"relict","relictii":"relict","relictul":"relict","relicvarii":"relicvariu","relicvariile":"relicvariu","relicvariilor":"relicvariu","relicvariul":"relicvariu","relicvariule":"relicvariu","relicvariului":"relicvariu","relicve":"relicvă","relicvia":"relicvie","relicviei":"relicvie","relicvii":"relicvie","relicviile":"relicvie","relicviilor":"relicvie","reliefai":"reliefa","reliefam":["reliefăm","reliefa","reliefam","reliefa"],"reliefand":"reliefa","reliefara":"reliefa","reliefaram":"reliefa","reliefarati":"reliefa","reliefarea":"reliefare","reliefari":"reliefare","reliefarii":"reliefare","reliefarile":"reliefare","reliefarilor":"reliefare","reliefase":"reliefa","reliefasem":"reliefa","reliefasera":"reliefa","reliefaseram":"reliefa","reliefaserati":"reliefa","reliefasesi":"reliefa","reliefasi":"reliefa","reliefat":"reliefa","reliefati":"reliefa","reliefau":"reliefa","reliefeaza":"reliefa","reliefez":"reliefa","reliefezi":"reliefa","reliefuri":"relief","relievul":"reliev","relievule":"reliev","relievului":"reliev","relievuri":"reliev","relievurile":"reliev","relievurilor":"reliev","religia":"religie","religiei":"religie","religii":"religie","religiile":"religie","religiilor":"religie","religioasa":["religioasă","religios","religioasa","religios"],"religioase":"religios","religioasele":"religios","religionara":["religionară","religionar","religionara","religionar"],"religionare":"religionar","religionarele":"religionar","religionari":"religionar","religionarii":"religionar","religionarul":"religionar","religiosi":"religios","religiosii":"religios","religiosul":"religios","religiozitatea":"religiozitate","religiozitati":"religiozitate","religiozitatii":"religiozitate","religiozitatile":"religiozitate","religiozitatilor":"religiozitate","religiune":"religie","religiunea":"religiune","religiuni":"religiune","religiunii":"religiune","religiunile":"religiune","religiunilor":"religiune","relocatiunea":"relocațiune","relocatiuni":"relocațiune","relocatiunii":"relocațiune","relocatiunile":"relocațiune","relocatiunilor":"relocațiune","relor":"re","reluai":"relua","reluam":["reluăm","relua","reluam","relua"],"reluand":"relua","reluara":"relua","reluaram":"relua","reluarati":"relua","reluarea":"reluare","reluari":"reluare","reluarii":"reluare","reluarile":"reluare","reluarilor":"reluare","reluase":"relua","reluasem":"relua","reluasera":"relua","reluaseram":"relua","reluaserati":"relua","reluasesi":"relua","reluasi":"relua","reluat":"relua","reluati":"relua","reluau":"relua","reluctante":"reluctanță","reluctantei":"reluctanță","reluctantele":"reluctanță","reluctantelor":"reluctanță","reluctivitatea":"reluctivitate","reluctivitati":"reluctivitate","reluctivitatii":"reluctivitate","reluctivitatile":"reluctivitate","reluctivitatilor":"reluctivitate","remaiai":"remaia","remaiam":"remaia","remaiara":"remaia","remaiaram":"remaia","remaiarati":"remaia","remaiase":"remaia","remaiasem":"remaia","remaiasera":"remaia","remaiaseram":"remaia","remaiaserati":"remaia","remaiasesi":"remaia","remaiasi":"remaia","remaiat":"remaia","remaiata":["remaiată","remaiat","remaiata","remaiat"],"remaiate":"remaiat","remaiatele":"remaiat","remaiati":["remaiați","remaia","remaiați","remaiat"],"remaiatii":"remaiat","remaiatul":"remaiat","remaiau":"remaia","remaiaza":"remaia","remaie":"remaia","remaiem":"remaia","remaiez":"remaia","remaiezi":"remaia","remaind":"remaia","remake-uri":"remake","remake-urile":"remake","remake-urilor":"remake","remakeul":"remake","remakeule":"remake","remakeului":"remake","remanenta":["remanentă","remanent","remanenta","remanent"],"remanente":["remanente","remanent","remanențe","remanență"],"remanentei":"remanență","remanentele":["remanentele","remanent","remanențele","remanență"],"remanentelor":"remanență","remanenti":"remanent","remanentii":"remanent","remanentul":"remanent","remaniabila":["remaniabilă","remaniabil","remaniabila","remaniabil"],"remaniabile":"remaniabil","remaniabilele":"remaniabil","remaniabili":"remaniabil","remaniabilii":"remaniabil","remaniabilul":"remaniabil","remaniai":"remania","remaniam":"remania","remaniara":"remania","remaniaram":"remania","remaniarati":"remania","remaniarea":"remaniare","remaniase":"remania","remaniasem":"remania","remaniasera":"remania","remaniaseram":"remania","remaniaserati":"remania","remaniasesi":"remania","remaniasi":"remania","remaniat":"remania","remaniata":["remaniată","remaniat","remaniata","remaniat"],"remaniate":"remaniat","remaniatele":"remaniat","remaniati":["remaniați","remania","remaniați","remaniat"],"remaniatii":"remaniat","remaniatul":"remaniat","remaniau":"remania","remaniaza":"remania","remanie":"remania","remanieaza":"remania","remaniem":"remania","remanierea":"remaniere","remanieri":["remanieri","remaniare","remanieri","remaniere"],"remanierii":["remanierii","remaniare","remanierii","remaniere"],"remanierile":["remanierile","remaniare","remanierile","remaniere"],"remanierilor":["remanierilor","remaniare","remanierilor","remaniere"],"remaniez":"remania","remaniezi":"remania","remaniind":"remania","remarc":"remarca","remarcabila":["remarcabilă","remarcabil","remarcabila","remarcabil"],"remarcabile":"remarcabil","remarcabilele":"remarcabil","remarcabili":"remarcabil","remarcabilii":"remarcabil","remarcabilul":"remarcabil","remarcai":"remarca","remarcam":["remarcăm","remarca","remarcam","remarca"],"remarcand":"remarca","remarcara":"remarca","remarcaram":"remarca","remarcarati":"remarca","remarcase":"remarca","remarcasem":"remarca","remarcasera":"remarca","remarcaseram":"remarca","remarcaserati":"remarca","remarcasesi":"remarca","remarcasi":"remarca","remarcat":"remarca","remarcati":"remarca","remarcau":"remarca","remarce":"remarcă","remarci":"remarca","remarit":"remărita","remaritai":"remărita","remaritam":["remărităm","remărita","remăritam","remărita"],"remaritand":"remărita","remaritara":"remărita","remaritaram":"remărita","remaritarati":"remărita","remaritase":"remărita","remaritasem":"remărita","remaritasera":"remărita","remaritaseram":"remărita","remaritaserati":"remărita","remaritasesi":"remărita","remaritasi":"remărita","remaritat":"remărita","remaritati":"remărita","remaritau":"remărita","remariti":"remărita","remasur":"remăsura","remasurai":"remăsura","remasuram":["remăsurăm","remăsura","remăsuram","remăsura"],"remasurand":"remăsura","remasurara":"remăsura","remasuraram":"remăsura","remasurarati":"remăsura","remasurase":"remăsura","remasurasem":"remăsura","remasurasera":"remăsura","remasuraseram":"remăsura","remasuraserati":"remăsura","remasurasesi":"remăsura","remasurasi":"remăsura","remasurat":"remăsura","remasurati":"remăsura","remasurau":"remăsura","remasuri":"remăsura","remediabila":["remediabilă","remediabil","remediabila","remediabil"],"remediabile":"remediabil","remediabilele":"remediabil","remediabili":"remediabil","remediabilii":"remediabil","remediabilul":"remediabil","remediai":"remedia","remediam":"remedia","remediara":"remedia","remediaram":"remedia","remediarati":"remedia","remediase":"remedia","remediasem":"remedia","remediasera":"remedia","remediaseram":"remedia","remediaserati":"remedia","remediasesi":"remedia","remediasi":"remedia","remediat":"remedia","remediata":["remediată","remediat","remediata","remediat"],"remediate":"remediat","remediatele":"remediat","remediati":["remediați","remedia","remediați","remediat"],"remediatii":"remediat","remediatul":"remediat","remediau":"remedia","remediaza":"remedia","remedie":"remedia","remedieaza":"remedia","remediem":"remedia","remedierea":"remediere","remedieri":"remediere","remedierii":"remediere","remedierile":"remediere","remedierilor":"remediere","remediez":"remedia","remediezi":"remedia","remedii":"remediu","remediile":"remediu","remediilor":"remediu","remediind":"remedia","remediul":"remediu","remediule":"remediu","remediului":"remediu","rememorai":"rememora","rememoram":["rememorăm","rememora","rememoram","rememora"],"rememorand":"rememora","rememorara":"rememora","rememoraram":"rememora","rememorarati":"rememora","rememorarea":"rememorare","rememorari":"rememorare","rememorarii":"rememorare","rememorarile":"rememorare","rememorarilor":"rememorare","rememorase":"rememora","rememorasem":"rememora","rememorasera":"rememora","rememoraseram":"rememora","rememoraserati":"rememora","rememorasesi":"rememora","rememorasi":"rememora","rememorat":"rememora","rememorata":["rememorată","rememorat","rememorata","rememorat"],"rememorate":"rememorat","rememoratele":"rememorat","rememorati":["rememorați","rememora","rememorați","rememorat"],"rememoratii":"rememorat","rememorativa":["rememorativă","rememorativ","rememorativa","rememorativ"],"rememorative":"rememorativ","rememorativele":"rememorativ","rememorativi":"rememorativ","rememorativii":"rememorativ","rememorativul":"rememorativ","rememoratul":"rememorat","rememorau":"rememora","rememoreaza":"rememora","rememorez":"rememora","rememorezi":"rememora","remetia":"remetie","remetiei":"remetie","remetii":"remetie","remetiile":"remetie","remetiilor":"remetie","remigea":"remige","remigei":"remige","remigele":"remige","remigelor":"remige","remilitarizai":"remilitariza","remilitarizam":["remilitarizăm","remilitariza","remilitarizam","remilitariza"],"remilitarizand":"remilitariza","remilitarizara":"remilitariza","remilitarizaram":"remilitariza","remilitarizarati":"remilitariza","remilitarizarea":"remilitarizare","remilitarizari":"remilitarizare","remilitarizarii":"remilitarizare","remilitarizarile":"remilitarizare","remilitarizarilor":"remilitarizare","remilitarizase":"remilitariza","remilitarizasem":"remilitariza","remilitarizasera":"remilitariza","remilitarizaseram":"remilitariza","remilitarizaserati":"remilitariza","remilitarizasesi":"remilitariza","remilitarizasi":"remilitariza","remilitarizat":"remilitariza","remilitarizati":"remilitariza","remilitarizau":"remilitariza","remilitarizeaza":"remilitariza","remilitarizez":"remilitariza","remilitarizezi":"remilitariza","remineralizai":"remineraliza","remineralizam":["remineralizăm","remineraliza","remineralizam","remineraliza"],"remineralizand":"remineraliza","remineralizara":"remineraliza","remineralizaram":"remineraliza","remineralizarati":"remineraliza","remineralizarea":"remineralizare","remineralizari":"remineralizare","remineralizarii":"remineralizare","remineralizarile":"remineralizare","remineralizarilor":"remineralizare","remineralizase":"remineraliza","remineralizasem":"remineraliza","remineralizasera":"remineraliza","remineralizaseram":"remineraliza","remineralizaserati":"remineraliza","remineralizasesi":"remineraliza","remineralizasi":"remineraliza","remineralizat":"remineraliza","remineralizati":"remineraliza","remineralizatia":"remineralizație","remineralizatiei":"remineralizație","remineralizatii":"remineralizație","remineralizatiile":"remineralizație","remineralizatiilor":"remineralizație","remineralizau":"remineraliza","remineralizeaza":"remineraliza","remineralizez":"remineraliza","remineralizezi":"remineraliza","reminiscente":"reminiscență","reminiscentei":"reminiscență","reminiscentele":"reminiscență","reminiscentelor":"reminiscență","remis":"remite","remise":"remite","remisei":"remite","remisera":"remite","remiseram":"remite","remiserati":"remite","remisese":"remite","remisesem":"remite","remisesera":"remite","remiseseram":"remite","remiseserati":"remite","remisesesi":"remite","remisesi":"remite","remisibila":["remisibilă","remisibil","remisibila","remisibil"],"remisibile":"remisibil","remisibilele":"remisibil","remisibili":"remisibil","remisibilii":"remisibil","remisibilitatea":"remisibilitate","remisibilitati":"remisibilitate","remisibilitatii":"remisibilitate","remisibilul":"remisibil","remisiunea":"remisiune","remisiunei":"remisiune","remisiunele":"remisiune","remisiunelor":"remisiune","remisiuni":"remisiune","remit":"remite","remita":"remite","remitand":"remite","remitea":"remite","remiteai":"remite","remiteam":"remite","remiteati":"remite","remiteau":"remite","remitem":"remite","remitente":"remitență","remitentei":"remitență","remitentele":"remitență","remitentelor":"remitență","remitenti":"remitent","remitentii":"remitent","remitentilor":"remitent","remitentul":"remitent","remitentule":"remitent","remitentului":"remitent","remiterea":"remitere","remiteri":"remitere","remiterii":"remitere","remiterile":"remitere","remiterilor":"remitere","remiteti":"remite","remiti":"remite","remix-uri":"remix","remix-urile":"remix","remix-urilor":"remix","remixarea":"remixare","remixari":"remixare","remixarii":"remixare","remixarile":"remixare","remixarilor":"remixare","remixul":"remix","remixule":"remix","remixului":"remix","remizai":"remiza","remizam":["remizăm","remiza","remizam","remiza"],"remizand":"remiza","remizara":"remiza","remizaram":"remiza","remizarati":"remiza","remizarea":"remizare","remizari":"remizare","remizarii":"remizare","remizarile":"remizare","remizarilor":"remizare","remizase":"remiza","remizasem":"remiza","remizasera":"remiza","remizaseram":"remiza","remizaserati":"remiza","remizasesi":"remiza","remizasi":"remiza","remizat":"remiza","remizati":"remiza","remizau":"remiza","remize":"remiză","remizeaza":"remiza","remizei":"remiză","remizele":"remiză","remizelor":"remiză","remizez":"remiza","remizezi":"remiza","remiziere":"remizieră","remizierei":"remizieră","remizierele":"remizieră","remizierelor":"remizieră","remobilai":"remobila","remobilam":["remobilăm","remobila","remobilam","remobila"],"remobiland":"remobila","remobilara":"remobila","remobilaram":"remobila","remobilarati":"remobila","remobilarea":"remobilare","remobilari":"remobilare","remobilarii":"remobilare","remobilarile":"remobilare","remobilarilor":"remobilare","remobilase":"remobila","remobilasem":"remobila","remobilasera":"remobila","remobilaseram":"remobila","remobilaserati":"remobila","remobilasesi":"remobila","remobilasi":"remobila","remobilat":"remobila","remobilati":"remobila","remobilau":"remobila","remobileaza":"remobila","remobilez":"remobila","remobilezi":"remobila","remodelai":"remodela","remodelam":["remodelăm","remodela","remodelam","remodela"],"remodeland":"remodela","remodelara":"remodela","remodelaram":"remodela","remodelarati":"remodela","remodelase":"remodela","remodelasem":"remodela","remodelasera":"remodela","remodelaseram":"remodela","remodelaserati":"remodela","remodelasesi":"remodela","remodelasi":"remodela","remodelat":"remodela","remodelati":"remodela","remodelau":"remodela","remodeleaza":"remodela","remodelez":"remodela","remodelezi":"remodela","remonstrarea":"remonstrare","remonstrari":"remonstrare","remonstrarii":"remonstrare","remonstrarile":"remonstrare","remonstrarilor":"remonstrare","remontanta":["remontantă","remontant","remontanta","remontant"],"remontante":"remontant","remontantele":"remontant","remontanti":"remontant","remontantii":"remontant","remontantul":"remontant","remontarea":"remontare","remontari":"remontare","remontarii":"remontare","remontarile":"remontare","remontarilor":"remontare","remorcai":"remorca","remorcaje":"remorcaj","remorcajele":"remorcaj","remorcajelor":"remorcaj","remorcajul":"remorcaj","remorcajule":"remorcaj","remorcajului":"remorcaj","remorcam":["remorcăm","remorca","remorcam","remorca"],"remorcand":"remorca","remorcara":"remorca","remorcaram":"remorca","remorcarati":"remorca","remorcarea":"remorcare","remorcari":"remorcare","remorcarii":"remorcare","remorcarile":"remorcare","remorcarilor":"remorcare","remorcase":"remorca","remorcasem":"remorca","remorcasera":"remorca","remorcaseram":"remorca","remorcaserati":"remorca","remorcasesi":"remorca","remorcasi":"remorca","remorcat":"remorca","remorcati":"remorca","remorcatia":"remorcație","remorcatiei":"remorcație","remorcatii":"remorcație","remorcatiile":"remorcație","remorcatiilor":"remorcație","remorcau":"remorca","remorcheaza":"remorca","remorchere":"remorcher","remorcherele":"remorcher","remorcherelor":"remorcher","remorcherul":"remorcher","remorcherule":"remorcher","remorcherului":"remorcher","remorchez":"remorca","remorchezi":"remorca","remorci":"remorcă","remorcii":"remorcă","remorcile":"remorcă","remorcilor":"remorcă","remore":"remoră","remorei":"remoră","remorele":"remoră","remorelor":"remoră","removarea":"removare","removari":"removare","removarii":"removare","removarile":"removare","removarilor":"removare","remulade":"remuladă","remuladei":"remuladă","remuladele":"remuladă","remuladelor":"remuladă","remunerai":"remunera","remuneram":["remunerăm","remunera","remuneram","remunera"],"remunerand":"remunera","remunerara":"remunera","remuneraram":"remunera","remunerarati":"remunera","remunerarea":"remunerare","remunerari":"remunerare","remunerarii":["remunerării","remunerare","remunerarii","remunerariu"],"remunerariile":"remunerariu","remunerariilor":"remunerariu","remunerarile":"remunerare","remunerarilor":"remunerare","remunerariuul":"remunerariu","remunerariuule":"remunerariu","remunerariuului":"remunerariu","remunerase":"remunera","remunerasem":"remunera","remunerasera":"remunera","remuneraseram":"remunera","remuneraserati":"remunera","remunerasesi":"remunera","remunerasi":"remunera","remunerat":"remunera","remunerati":"remunera","remuneratia":"remunerație","remuneratiei":"remunerație","remuneratii":"remunerație","remuneratiile":"remunerație","remuneratiilor":"remunerație","remuneratiunea":"remunerațiune","remuneratiuni":"remunerațiune","remuneratiunii":"remunerațiune","remuneratiunile":"remunerațiune","remuneratiunilor":"remunerațiune","remunerativa":["remunerativă","remunerativ","remunerativa","remunerativ"],"remunerative":"remunerativ","remunerativele":"remunerativ","remunerativi":"remunerativ","remunerativii":"remunerativ","remunerativul":"remunerativ","remuneratoria":"remuneratoriu","remuneratorie":"remuneratoriu","remuneratorii":"remuneratoriu","remuneratoriii":"remuneratoriu","remuneratoriile":"remuneratoriu","remuneratoriul":"remuneratoriu","remunerau":"remunera","remunereaza":"remunera","remunerez":"remunera","remunerezi":"remunera","remuscarea":"remușcare","remuscari":"remușcare","remuscarii":"remușcare","remuscarile":"remușcare","remuscarilor":"remușcare","remuuri":"remuu","remuurile":"remuu","remuurilor":"remuu","remuuul":"remuu","remuuule":"remuu","remuuului":"remuu","renala":["renală","renal","renala","renal"],"renale":"renal","renalele":"renal","renali":"renal","renalii":"renal","renalul":"renal","renana":["renană","renan","renana","renan"],"renane":"renan","renanele":"renan","renani":"renan","renanii":"renan","renanul":"renan","renasc":"renaște","renasca":"renaște","renascand":"renaște","renascatoare":"renăscător","renascatoarea":"renăscător","renascatoarele":"renăscător","renascatori":"renăscător","renascatorii":"renăscător","renascatorul":"renăscător","renascentista":["renascentistă","renascentist","renascentista","renascentist"],"renascentiste":"renascentist","renascentistele":"renascentist","renascentisti":"renascentist","renascentistii":"renascentist","renascentistul":"renascentist","renascu":"renaște","renascui":"renaște","renascura":"renaște","renascuram":"renaște","renascurati":"renaște","renascuse":"renaște","renascusem":"renaște","renascusera":"renaște","renascuseram":"renaște","renascuserati":"renaște","renascusesi":"renaște","renascusi":"renaște","renascut":"renaște","renascuta":["renăscută","renăscut","renăscuta","renăscut"],"renascute":"renăscut","renascutele":"renăscut","renascuti":"renăscut","renascutii":"renăscut","renascutul":"renăscut","renastea":"renaște","renasteai":"renaște","renasteam":"renaște","renasteati":"renaște","renasteau":"renaște","renastem":"renaște","renasterea":["renașterea","Renaștere","renașterea","renaștere"],"renasteri":["renașteri","Renaștere","renașteri","renaștere"],"renasterii":["renașterii","Renaștere","renașterii","renaștere"],"renasterile":"renaștere","renasterilor":"renaștere","renasteti":"renaște","renasti":"renaște","renclode":"renclodă","renclodei":"renclodă","renclodele":"renclodă","renclodelor":"renclodă","rendea":"rindea","rendez-vous-uri":"rendez-vous","rendez-vousul":"rendez-vous","rendez-vousule":"rendez-vous","rendez-vousului":"rendez-vous","rendez-vousuri":"rendez-vous","rendez-vousurile":"rendez-vous","rendez-vousurilor":"rendez-vous","rendimentul":"rendiment","rendimentule":"rendiment","rendimentului":"rendiment","rendzine":"rendzină","rendzinei":"rendzină","rendzinele":"rendzină","rendzinelor":"rendzină","reneaga":"renega","reneg":"renega","renegai":"renega","renegam":["renegăm","renega","renegam","renega"],"renegand":"renega","renegara":"renega","renegaram":"renega","renegarati":"renega","renegarea":"renegare","renegari":"renegare","renegarii":"renegare","renegarile":"renegare","renegarilor":"renegare","renegase":"renega","renegasem":"renega","renegasera":"renega","renegaseram":"renega","renegaserati":"renega","renegasesi":"renega","renegasi":"renega","renegat":"renega","renegata":["renegată","renegat","renegata","renegat"],"renegate":["renegate","renegat","renegate","renegată"],"renegatei":"renegată","renegatele":["renegatele","renegat","renegatele","renegată"],"renegatelor":"renegată","renegati":["renegați","renega","renegați","renegat"],"renegatii":"renegat","renegatilor":"renegat","renegatul":"renegat","renegatule":"renegat","renegatului":"renegat","renegau":"renega","renegi":"renega","renegociai":"renegocia","renegociam":"renegocia","renegociara":"renegocia","renegociaram":"renegocia","renegociarati":"renegocia","renegociase":"renegocia","renegociasem":"renegocia","renegociasera":"renegocia","renegociaseram":"renegocia","renegociaserati":"renegocia","renegociasesi":"renegocia","renegociasi":"renegocia","renegociat":"renegocia","renegociati":"renegocia","renegociau":"renegocia","renegociaza":"renegocia","renegocie":"renegocia","renegociem":"renegocia","renegocierea":"renegociere","renegocieri":"renegociere","renegocierii":"renegociere","renegocierile":"renegociere","renegocierilor":"renegociere","renegociez":"renegocia","renegociezi":"renegocia","renegociind":"renegocia","renete":"renet","renetele":"renet","renetelor":"renet","renetul":"renet","renetule":"renet","renetului":"renet","renglote":"renglotă","renglotei":"renglotă","renglotele":"renglotă","renglotelor":"renglotă","reni":"ren","reniforma":["reniformă","reniform","reniforma","reniform"],"reniforme":"reniform","reniformele":"reniform","reniformi":"reniform","reniformii":"reniform","reniformul":"reniform","renii":"ren","renilor":"ren","renine":"renină","reninei":"renină","reninele":"renină","reninelor":"renină","renitenta":["renitentă","renitent","renitenta","renitent"],"renitente":["renitente","renitent","renitențe","renitență"],"renitentei":"renitență","renitentele":["renitentele","renitent","renitențele","renitență"],"renitentelor":"renitență","renitenti":"renitent","renitentii":"renitent","renitentul":"renitent","reniul":"reniu","reniule":"reniu","reniului":"reniu","renivelai":"renivela","renivelam":["renivelăm","renivela","renivelam","renivela"],"reniveland":"renivela","renivelara":"renivela","renivelaram":"renivela","renivelarati":"renivela","renivelarea":"renivelare","renivelari":"renivelare","renivelarii":"renivelare","renivelarile":"renivelare","renivelarilor":"renivelare","renivelase":"renivela","renivelasem":"renivela","renivelasera":"renivela","renivelaseram":"renivela","renivelaserati":"renivela","renivelasesi":"renivela","renivelasi":"renivela","renivelat":"renivela","renivelati":"renivela","renivelau":"renivela","reniveleaza":"renivela","renivelez":"renivela","renivelezi":"renivela","renoaice":"renoaică","renoaicei":"renoaică","renoaicele":"renoaică","renoaicelor":"renoaică","renovai":"renova","renovam":["renovăm","renova","renovam","renova"],"renovand":"renova","renovara":"renova","renovaram":"renova","renovarati":"renova","renovarea":"renovare","renovari":"renovare","renovarii":"renovare","renovarile":"renovare","renovarilor":"renovare","renovase":"renova","renovasem":"renova","renovasera":"renova","renovaseram":"renova","renovaserati":"renova","renovasesi":"renova","renovasi":"renova","renovat":"renova","renovata":["renovată","renovat","renovata","renovat"],"renovate":"renovat","renovatele":"renovat","renovati":["renovați","renova","renovați","renovat"],"renovatia":"renovație","renovatiei":"renovație","renovatii":["renovații","renovat","renovații","renovație"],"renovatiile":"renovație","renovatiilor":"renovație","renovatiunea":"renovațiune","renovatiuni":"renovațiune","renovatiunii":"renovațiune","renovatiunile":"renovațiune","renovatiunilor":"renovațiune","renovatoare":"renovator","renovatoarea":"renovator","renovatoarele":"renovator","renovatori":"renovator","renovatorii":"renovator","renovatorul":"renovator","renovatul":"renovat","renovau":"renova","renoveaza":"renova","renovez":"renova","renovezi":"renova","rentabila":["rentabilă","rentabil","rentabila","rentabil"],"rentabile":"rentabil","rentabilele":"rentabil","rentabili":"rentabil","rentabilii":"rentabil","rentabilitatea":"rentabilitate","rentabilitati":"rentabilitate","rentabilitatii":"rentabilitate","rentabilitatile":"rentabilitate","rentabilitatilor":"rentabilitate","rentabilizai":"rentabiliza","rentabilizam":["rentabilizăm","rentabiliza","rentabilizam","rentabiliza"],"rentabilizand":"rentabiliza","rentabilizara":"rentabiliza","rentabilizaram":"rentabiliza","rentabilizarati":"rentabiliza","rentabilizarea":"rentabilizare","rentabilizari":"rentabilizare","rentabilizarii":"rentabilizare","rentabilizarile":"rentabilizare","rentabilizarilor":"rentabilizare","rentabilizase":"rentabiliza","rentabilizasem":"rentabiliza","rentabilizasera":"rentabiliza","rentabilizaseram":"rentabiliza","rentabilizaserati":"rentabiliza","rentabilizasesi":"rentabiliza","rentabilizasi":"rentabiliza","rentabilizat":"rentabiliza","rentabilizata":["rentabilizată","rentabilizat","rentabilizata","rentabilizat"],"rentabilizate":"rentabilizat","rentabilizatele":"rentabilizat","rentabilizati":["rentabilizați","rentabiliza","rentabilizați","rentabilizat"],"rentabilizatii":"rentabilizat","rentabilizatul":"rentabilizat","rentabilizau":"rentabiliza","rentabilizeaza":"rentabiliza","rentabilizez":"rentabiliza","rentabilizezi":"rentabiliza","rentabilul":"rentabil","rentai":"renta","rentam":["rentăm","renta","rentam","renta"],"rentand":"renta","rentara":"renta","rentaram":"renta","rentarati":"renta","rentase":"renta","rentasem":"renta","rentasera":"renta","rentaseram":"renta","rentaserati":"renta","rentasesi":"renta","rentasi":"renta","rentat":"renta","rentati":"renta","rentau":"renta","rente":"rentă","renteaza":"renta","rentei":"rentă","rentele":"rentă","rentelor":"rentă","rentez":"renta","rentezi":"renta","rentiere":"rentieră","rentierei":"rentieră","rentierele":"rentieră","rentierelor":"rentieră","rentieri":"rentier","rentierii":"rentier","rentierilor":"rentier","rentierul":"rentier","rentierule":"rentier","rentierului":"rentier","rentinerita":["rentinerită","rentinerit","rentinerita","rentinerit"],"rentinerite":"rentinerit","rentineritele":"rentinerit","rentineriti":"rentinerit","rentineritii":"rentinerit","rentineritul":"rentinerit","renul":"ren","renule":"ren","renului":"ren","renumar":"renumăra","renumarai":"renumăra","renumaram":["renumărăm","renumăra","renumăram","renumăra"],"renumarand":"renumăra","renumarara":"renumăra","renumararam":"renumăra","renumararati":"renumăra","renumarase":"renumăra","renumarasem":"renumăra","renumarasera":"renumăra","renumaraseram":"renumăra","renumaraserati":"renumăra","renumarasesi":"renumăra","renumarasi":"renumăra","renumarat":"renumăra","renumarati":"renumăra","renumarau":"renumăra","renumari":"renumăra","renumele":"renume","renumelui":"renume","renumita":["renumită","renumit","renumita","renumit"],"renumite":"renumit","renumitele":"renumit","renumiti":"renumit","renumitii":"renumit","renumitul":"renumit","renunt":"renunța","renuntai":"renunța","renuntam":["renunțăm","renunța","renunțam","renunța"],"renuntand":"renunța","renuntara":"renunța","renuntaram":"renunța","renuntarati":"renunța","renuntarea":"renunțare","renuntari":"renunțare","renuntarii":"renunțare","renuntarile":"renunțare","renuntarilor":"renunțare","renuntase":"renunța","renuntasem":"renunța","renuntasera":"renunța","renuntaseram":"renunța","renuntaserati":"renunța","renuntasesi":"renunța","renuntasi":"renunța","renuntat":"renunța","renuntati":"renunța","renuntau":"renunța","renunte":"renunța","renunti":"renunța","renuri":"renură","renurii":"renură","renurile":"renură","renurilor":"renură","reobaze":"reobază","reobazei":"reobază","reobazele":"reobază","reobazelor":"reobază","reocup":"reocupa","reocupai":"reocupa","reocupam":["reocupăm","reocupa","reocupam","reocupa"],"reocupand":"reocupa","reocupara":"reocupa","reocuparam":"reocupa","reocuparati":"reocupa","reocuparea":"reocupare","reocupari":"reocupare","reocuparii":"reocupare","reocuparile":"reocupare","reocuparilor":"reocupare","reocupase":"reocupa","reocupasem":"reocupa","reocupasera":"reocupa","reocupaseram":"reocupa","reocupaserati":"reocupa","reocupasesi":"reocupa","reocupasi":"reocupa","reocupat":"reocupa","reocupati":"reocupa","reocupatia":"reocupație","reocupatiei":"reocupație","reocupatii":"reocupație","reocupatiile":"reocupație","reocupatiilor":"reocupație","reocupau":"reocupa","reocupi":"reocupa","reofila":["reofilă","reofil","reofila","reofil"],"reofile":"reofil","reofilele":"reofil","reofili":"reofil","reofilii":"reofil","reofilul":"reofil","reofori":"reofor","reoforii":"reofor","reoforilor":"reofor","reoforul":"reofor","reoforule":"reofor","reoforului":"reofor","reoglind":"reoglindi","reoglinde":"reoglindi","reoglindea":"reoglindi","reoglindeai":"reoglindi","reoglindeam":"reoglindi","reoglindeati":"reoglindi","reoglindeau":"reoglindi","reoglindie":"reoglindi","reoglindii":"reoglindi","reoglindim":"reoglindi","reoglindind":"reoglindi","reoglindira":"reoglindi","reoglindiram":"reoglindi","reoglindirati":"reoglindi","reoglindirea":"reoglindire","reoglindiri":"reoglindire","reoglindirii":"reoglindire","reoglindirile":"reoglindire","reoglindirilor":"reoglindire","reoglindise":"reoglindi","reoglindisem":"reoglindi","reoglindisera":"reoglindi","reoglindiseram":"reoglindi","reoglindiserati":"reoglindi","reoglindisesi":"reoglindi","reoglindisi":"reoglindi","reoglindit":"reoglindi","reoglinditi":"reoglindi","reoglinzi":"reoglindi","reografia":"reografie","reografiei":"reografie","reografii":"reografie","reografiile":"reografie","reografiilor":"reografie","reograme":"reogramă","reogramei":"reogramă","reogramele":"reogramă","reogramelor":"reogramă","reologia":"reologie","reologica":["reologică","reologic","reologica","reologic"],"reologice":"reologic","reologicele":"reologic","reologici":"reologic","reologicii":"reologic","reologicul":"reologic","reologiei":"reologie","reologii":"reologie","reometre":"reometru","reometrele":"reometru","reometrelor":"reometru","reometria":"reometrie","reometriei":"reometrie","reometrii":"reometrie","reometrul":"reometru","reometrule":"reometru","reometrului":"reometru","reomorfisme":"reomorfism","reomorfismele":"reomorfism","reomorfismelor":"reomorfism","reomorfismul":"reomorfism","reomorfismule":"reomorfism","reomorfismului":"reomorfism","reoranduia":"reorândui","reoranduiai":"reorândui","reoranduiam":"reorândui","reoranduiati":"reorândui","reoranduiau":"reorândui","reoranduiesc":"reorândui","reoranduieste":"reorândui","reoranduiesti":"reorândui","reoranduii":"reorândui","reoranduim":"reorândui","reoranduind":"reorândui","reoranduira":"reorândui","reoranduiram":"reorândui","reoranduirati":"reorândui","reoranduirea":"reorânduire","reoranduiri":"reorânduire","reoranduirii":"reorânduire","reoranduirile":"reorânduire","reoranduirilor":"reorânduire","reoranduise":"reorândui","reoranduisem":"reorândui","reoranduisera":"reorândui","reoranduiseram":"reorândui","reoranduiserati":"reorândui","reoranduisesi":"reorândui","reoranduisi":"reorândui","reoranduit":"reorândui","reoranduiti":"reorândui","reorchestrai":"reorchestra","reorchestram":["reorchestrăm","reorchestra","reorchestram","reorchestra"],"reorchestrand":"reorchestra","reorchestrara":"reorchestra","reorchestraram":"reorchestra","reorchestrarati":"reorchestra","reorchestrarea":"reorchestrare","reorchestrari":"reorchestrare","reorchestrarii":"reorchestrare","reorchestrarile":"reorchestrare","reorchestrarilor":"reorchestrare","reorchestrase":"reorchestra","reorchestrasem":"reorchestra","reorchestrasera":"reorchestra","reorchestraseram":"reorchestra","reorchestraserati":"reorchestra","reorchestrasesi":"reorchestra","reorchestrasi":"reorchestra","reorchestrat":"reorchestra","reorchestrati":"reorchestra","reorchestrau":"reorchestra","reorchestreaza":"reorchestra","reorchestrez":"reorchestra","reorchestrezi":"reorchestra","reordonai":"reordona","reordonam":["reordonăm","reordona","reordonam","reordona"],"reordonand":"reordona","reordonara":"reordona","reordonaram":"reordona","reordonarati":"reordona","reordonarea":"reordonare","reordonari":"reordonare","reordonarii":"reordonare","reordonarile":"reordonare","reordonarilor":"reordonare","reordonase":"reordona","reordonasem":"reordona","reordonasera":"reordona","reordonaseram":"reordona","reordonaserati":"reordona","reordonasesi":"reordona","reordonasi":"reordona","reordonat":"reordona","reordonata":["reordonată","reordonat","reordonata","reordonat"],"reordonate":"reordonat","reordonatele":"reordonat","reordonati":["reordonați","reordona","reordonați","reordonat"],"reordonatii":"reordonat","reordonatul":"reordonat","reordonau":"reordona","reordoneaza":"reordona","reordonez":"reordona","reordonezi":"reordona","reorganizai":"reorganiza","reorganizam":["reorganizăm","reorganiza","reorganizam","reorganiza"],"reorganizand":"reorganiza","reorganizara":"reorganiza","reorganizaram":"reorganiza","reorganizarati":"reorganiza","reorganizarea":"reorganizare","reorganizari":"reorganizare","reorganizarii":"reorganizare","reorganizarile":"reorganizare","reorganizarilor":"reorganizare","reorganizase":"reorganiza","reorganizasem":"reorganiza","reorganizasera":"reorganiza","reorganizaseram":"reorganiza","reorganizaserati":"reorganiza","reorganizasesi":"reorganiza","reorganizasi":"reorganiza"};
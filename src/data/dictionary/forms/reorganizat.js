@@ -0,0 +1 @@
+export default {"reorganizat":"reorganiza","reorganizata":["reorganizată","reorganizat","reorganizata","reorganizat"],"reorganizate":"reorganizat","reorganizatele":"reorganizat","reorganizati":["reorganizați","reorganiza","reorganizați","reorganizat"],"reorganizatia":"reorganizație","reorganizatiei":"reorganizație","reorganizatii":["reorganizații","reorganizat","reorganizații","reorganizație"],"reorganizatiile":"reorganizație","reorganizatiilor":"reorganizație","reorganizatoarea":"reorganizatoare","reorganizatoarei":"reorganizatoare","reorganizatoarele":"reorganizatoare","reorganizatoarelor":"reorganizatoare","reorganizatori":"reorganizator","reorganizatorii":"reorganizator","reorganizatorilor":"reorganizator","reorganizatorul":"reorganizator","reorganizatorule":"reorganizator","reorganizatorului":"reorganizator","reorganizatul":"reorganizat","reorganizau":"reorganiza","reorganizeaza":"reorganiza","reorganizez":"reorganiza","reorganizezi":"reorganiza","reorientai":"reorienta","reorientam":["reorientăm","reorienta","reorientam","reorienta"],"reorientand":"reorienta","reorientara":"reorienta","reorientaram":"reorienta","reorientarati":"reorienta","reorientarea":"reorientare","reorientari":"reorientare","reorientarii":"reorientare","reorientarile":"reorientare","reorientarilor":"reorientare","reorientase":"reorienta","reorientasem":"reorienta","reorientasera":"reorienta","reorientaseram":"reorienta","reorientaserati":"reorienta","reorientasesi":"reorienta","reorientasi":"reorienta","reorientat":"reorienta","reorientata":["reorientată","reorientat","reorientata","reorientat"],"reorientate":"reorientat","reorientatele":"reorientat","reorientati":["reorientați","reorienta","reorientați","reorientat"],"reorientatii":"reorientat","reorientatul":"reorientat","reorientau":"reorienta","reorienteaza":"reorienta","reorientez":"reorienta","reorientezi":"reorienta","reortodoxizarea":"reortodoxizare","reortodoxizari":"reortodoxizare","reortodoxizarii":"reortodoxizare","reoscoape":"reoscop","reoscoapele":"reoscop","reoscoapelor":"reoscop","reoscopica":["reoscopică","reoscopic","reoscopica","reoscopic"],"reoscopice":"reoscopic","reoscopicele":"reoscopic","reoscopici":"reoscopic","reoscopicii":"reoscopic","reoscopicul":"reoscopic","reoscopul":"reoscop","reoscopule":"reoscop","reoscopului":"reoscop","reostate":"reostat","reostatele":"reostat","reostatelor":"reostat","reostatica":["reostatică","reostatic","reostatica","reostatic"],"reostatice":"reostatic","reostaticele":"reostatic","reostatici":"reostatic","reostaticii":"reostatic","reostaticul":"reostatic","reostatul":"reostat","reostatule":"reostat","reostatului":"reostat","reostrictiunea":"reostricțiune","reostrictiuni":"reostricțiune","reostrictiunii":"reostricțiune","reostrictiunile":"reostricțiune","reostrictiunilor":"reostricțiune","reotaxia":"reotaxie","reotaxica":["reotaxică","reotaxic","reotaxica","reotaxic"],"reotaxice":"reotaxic","reotaxicele":"reotaxic","reotaxici":"reotaxic","reotaxicii":"reotaxic","reotaxicul":"reotaxic","reotaxiei":"reotaxie","reotaxii":"reotaxie","reotaxiile":"reotaxie","reotaxiilor":"reotaxie","reotropisme":"reotropism","reotropismele":"reotropism","reotropismelor":"reotropism","reotropismul":"reotropism","reotropismule":"reotropism","reotropismului":"reotropism","repaginai":"repagina","repaginam":["repaginăm","repagina","repaginam","repagina"],"repaginand":"repagina","repaginara":"repagina","repaginaram":"repagina","repaginarati":"repagina","repaginarea":"repaginare","repaginari":"repaginare","repaginarii":"repaginare","repaginarile":"repaginare","repaginarilor":"repaginare","repaginase":"repagina","repaginasem":"repagina","repaginasera":"repagina","repaginaseram":"repagina","repaginaserati":"repagina","repaginasesi":"repagina","repaginasi":"repagina","repaginat":"repagina","repaginata":["repaginată","repaginat","repaginata","repaginat"],"repaginate":"repaginat","repaginatele":"repaginat","repaginati":["repaginați","repagina","repaginați","repaginat"],"repaginatii":"repaginat","repaginatul":"repaginat","repaginau":"repagina","repagineaza":"repagina","repaginez":"repagina","repaginezi":"repagina","repaos":"repaus","repaosuri":"repaos","repar":"repara","reparabila":["reparabilă","reparabil","reparabila","reparabil"],"reparabile":"reparabil","reparabilele":"reparabil","reparabili":"reparabil","reparabilii":"reparabil","reparabilul":"reparabil","reparai":"repara","reparam":["reparăm","repara","reparam","repara"],"reparand":"repara","reparara":"repara","repararam":"repara","repararati":"repara","repararea":"reparare","reparari":"reparare","repararii":"reparare","repararile":"reparare","repararilor":"reparare","reparase":"repara","reparasem":"repara","reparasera":"repara","reparaseram":"repara","reparaserati":"repara","reparasesi":"repara","reparasi":"repara","reparat":"repara","reparata":["reparată","reparat","reparata","reparat"],"reparate":"reparat","reparatele":"reparat","reparati":["reparați","repara","reparați","reparat"],"reparatia":"reparație","reparatiei":"reparație","reparatii":["reparații","reparat","reparații","reparație"],"reparatiile":"reparație","reparatiilor":"reparație","reparatiunea":"reparațiune","reparatiuni":"reparațiune","reparatiunii":"reparațiune","reparatiunile":"reparațiune","reparatiunilor":"reparațiune","reparatoare":"reparator","reparatoarea":"reparator","reparatoarele":"reparator","reparatori":"reparator","reparatoria":"reparatoriu","reparatorie":"reparatoriu","reparatorii":["reparatorii","reparator","reparatorii","reparatoriu"],"reparatoriii":"reparatoriu","reparatoriile":"reparatoriu","reparatoriul":"reparatoriu","reparatorul":"reparator","reparatul":"reparat","reparaturi":"reparatură","reparaturii":"reparatură","reparaturile":"reparatură","reparaturilor":"reparatură","reparau":"repara","repare":"repara","repari":"repara","repartirea":"repărțire","repartiri":"repărțire","repartirii":"repărțire","repartirile":"repărțire","repartirilor":"repărțire","repartitia":"repartiție","repartitiei":"repartiție","repartitii":"repartiție","repartitiile":"repartiție","repartitiilor":"repartiție","repartitiunea":"repartițiune","repartitiuni":"repartițiune","repartitiunii":"repartițiune","repartitiunile":"repartițiune","repartitiunilor":"repartițiune","repartitoare":"repartitor","repartitoarele":"repartitor","repartitoarelor":"repartitor","repartitorul":"repartitor","repartitorule":"repartitor","repartitorului":"repartitor","repartizai":"repartiza","repartizam":["repartizăm","repartiza","repartizam","repartiza"],"repartizand":"repartiza","repartizara":"repartiza","repartizaram":"repartiza","repartizarati":"repartiza","repartizari":"repartizare","repartizase":"repartiza","repartizasem":"repartiza","repartizasera":"repartiza","repartizaseram":"repartiza","repartizaserati":"repartiza","repartizasesi":"repartiza","repartizasi":"repartiza","repartizat":"repartiza","repartizata":["repartizată","repartizat","repartizata","repartizat"],"repartizate":"repartizat","repartizatele":"repartizat","repartizati":["repartizați","repartiza","repartizați","repartizat"],"repartizatii":"repartizat","repartizatoare":"repartizator","repartizatoarele":"repartizator","repartizatoarelor":"repartizator","repartizatorul":"repartizator","repartizatorule":"repartizator","repartizatorului":"repartizator","repartizatul":"repartizat","repartizau":"repartiza","repartizeaza":"repartiza","repartizez":"repartiza","repartizezi":"repartiza","repartizoare":"repartizor","repartizoarele":"repartizor","repartizoarelor":"repartizor","repartizorul":"repartizor","repartizorule":"repartizor","repartizorului":"repartizor","repasirea":"repășire","repasiri":"repășire","repasirii":"repășire","repasirile":"repășire","repasirilor":"repășire","repatriai":"repatria","repatriam":"repatria","repatriara":"repatria","repatriaram":"repatria","repatriarati":"repatria","repatriase":"repatria","repatriasem":"repatria","repatriasera":"repatria","repatriaseram":"repatria","repatriaserati":"repatria","repatriasesi":"repatria","repatriasi":"repatria","repatriat":"repatria","repatriati":["repatriați","repatria","repatriați","repatriat"],"repatriatii":"repatriat","repatriatilor":"repatriat","repatriatul":"repatriat","repatriatule":"repatriat","repatriatului":"repatriat","repatriau":"repatria","repatriaza":"repatria","repatrie":"repatria","repatriem":"repatria","repatrierea":"repatriere","repatrieri":"repatriere","repatrierii":"repatriere","repatrierile":"repatriere","repatrierilor":"repatriere","repatriez":"repatria","repatriezi":"repatria","repatriind":"repatria","repausul":"repaus","repausule":"repaus","repausului":"repaus","repausuri":"repaus","repausurile":"repaus","repausurilor":"repaus","repauzai":"repauza","repauzam":["repauzăm","repauza","repauzam","repauza"],"repauzand":"repauza","repauzara":"repauza","repauzaram":"repauza","repauzarati":"repauza","repauzarea":"repauzare","repauzari":"repauzare","repauzarii":"repauzare","repauzarile":"repauzare","repauzarilor":"repauzare","repauzase":"repauza","repauzasem":"repauza","repauzasera":"repauza","repauzaseram":"repauza","repauzaserati":"repauza","repauzasesi":"repauza","repauzasi":"repauza","repauzat":"repauza","repauzata":["repauzată","repauzat","repauzata","repauzat"],"repauzate":["repauzate","repauzat","repauzate","repauzată"],"repauzatei":"repauzată","repauzatele":["repauzatele","repauzat","repauzatele","repauzată"],"repauzatelor":"repauzată","repauzati":["repauzați","repauza","repauzați","repauzat"],"repauzatii":"repauzat","repauzatilor":"repauzat","repauzatul":"repauzat","repauzatule":"repauzat","repauzatului":"repauzat","repauzau":"repauza","repauzeaza":"repauza","repauzez":"repauza","repauzezi":"repauza","repedea":"repede","repedele":"repede","repega":"răpega","repejunea":"repejune","repejuni":"repejune","repejunii":"repejune","repejunile":"repejune","repejunilor":"repejune","repenta":["repentă","repent","repenta","repent"],"repente":"repent","repentele":"repent","repenti":"repent","repentii":"repent","repentul":"repent","reperai":"repera","reperaje":"reperaj","reperajele":"reperaj","reperajelor":"reperaj","reperajul":"reperaj","reperajule":"reperaj","reperajului":"reperaj","reperam":["reperăm","repera","reperam","repera"],"reperand":"repera","reperara":"repera","reperaram":"repera","reperarati":"repera","reperarea":"reperare","reperari":"reperare","reperarii":"reperare","reperarile":"reperare","reperarilor":"reperare","reperase":"repera","reperasem":"repera","reperasera":"repera","reperaseram":"repera","reperaserati":"repera","reperasesi":"repera","reperasi":"repera","reperat":"repera","reperata":["reperată","reperat","reperata","reperat"],"reperate":"reperat","reperatele":"reperat","reperati":["reperați","repera","reperați","reperat"],"reperatii":"reperat","reperatul":"reperat","reperau":"repera","repercursiune":"repercusiune","repercursiuni":"repercursiune","repercusiunea":"repercusiune","repercusiuni":"repercusiune","repercusiunii":"repercusiune","repercusiunile":"repercusiune","repercusiunilor":"repercusiune","repercutai":"repercuta","repercutam":["repercutăm","repercuta","repercutam","repercuta"],"repercutand":"repercuta","repercutara":"repercuta","repercutaram":"repercuta","repercutarati":"repercuta","repercutarea":"repercutare","repercutari":"repercutare","repercutarii":"repercutare","repercutarile":"repercutare","repercutarilor":"repercutare","repercutase":"repercuta","repercutasem":"repercuta","repercutasera":"repercuta","repercutaseram":"repercuta","repercutaserati":"repercuta","repercutasesi":"repercuta","repercutasi":"repercuta","repercutat":"repercuta","repercutata":["repercutată","repercutat","repercutata","repercutat"],"repercutate":"repercutat","repercutatele":"repercutat","repercutati":["repercutați","repercuta","repercutați","repercutat"],"repercutatii":"repercutat","repercutatul":"repercutat","repercutau":"repercuta","repercuteaza":"repercuta","repercutez":"repercuta","repercutezi":"repercuta","repere":"reper","repereaza":"repera","reperele":"reper","reperelor":"reper","reperez":"repera","reperezi":"repera","repertoar":"repertoriu","repertoare":"repertoar","repertoarele":"repertoar","repertoarelor":"repertoar","repertoarul":"repertoar","repertoarule":"repertoar","repertoarului":"repertoar","repertoriala":["repertorială","repertorial","repertoriala","repertorial"],"repertoriale":"repertorial","repertorialele":"repertorial","repertoriali":"repertorial","repertorialii":"repertorial","repertorialul":"repertorial","repertorii":["repertorii","repertor","repertorii","repertoriu"],"repertoriile":["repertoriile","repertor","repertoriile","repertoriu"],"repertoriilor":["repertoriilor","repertor","repertoriilor","repertoriu"],"repertoriul":"repertoriu","repertoriule":"repertoriu","repertoriului":"repertoriu","repertorizai":"repertoriza","repertorizam":["repertorizăm","repertoriza","repertorizam","repertoriza"],"repertorizand":"repertoriza","repertorizara":"repertoriza","repertorizaram":"repertoriza","repertorizarati":"repertoriza","repertorizase":"repertoriza","repertorizasem":"repertoriza","repertorizasera":"repertoriza","repertorizaseram":"repertoriza","repertorizaserati":"repertoriza","repertorizasesi":"repertoriza","repertorizasi":"repertoriza","repertorizat":"repertoriza","repertorizati":"repertoriza","repertorizau":"repertoriza","repertorizeaza":"repertoriza","repertorizez":"repertoriza","repertorizezi":"repertoriza","repertorul":"repertor","repertorule":"repertor","repertorului":"repertor","reperul":"reper","reperule":"reper","reperului":"reper","repet":"repeta","repetabila":["repetabilă","repetabil","repetabila","repetabil"],"repetabile":"repetabil","repetabilele":"repetabil","repetabili":"repetabil","repetabilii":"repetabil","repetabilitatea":"repetabilitate","repetabilitati":"repetabilitate","repetabilitatii":"repetabilitate","repetabilitatile":"repetabilitate","repetabilitatilor":"repetabilitate","repetabilul":"repetabil","repetai":"repeta","repetam":["repetăm","repeta","repetam","repeta"],"repetand":"repeta","repetara":"repeta","repetaram":"repeta","repetarati":"repeta","repetarea":"repetare","repetari":"repetare","repetarii":"repetare","repetarile":"repetare","repetarilor":"repetare","repetase":"repeta","repetasem":"repeta","repetasera":"repeta","repetaseram":"repeta","repetaserati":"repeta","repetasesi":"repeta","repetasi":"repeta","repetat":"repeta","repetata":["repetată","repetat","repetata","repetat"],"repetate":"repetat","repetatele":"repetat","repetati":["repetați","repeta","repetați","repetat"],"repetatii":"repetat","repetativa":["repetativă","repetativ","repetativa","repetativ"],"repetative":"repetativ","repetativele":"repetativ","repetativi":"repetativ","repetativii":"repetativ","repetativul":"repetativ","repetatul":"repetat","repetau":"repeta","repete":"repeta","repetea":"repeți","repeteai":"repeți","repeteam":"repeți","repeteasca":"repeți","repeteati":"repeți","repeteau":"repeți","repeteaza":"repeta","repetenta":["repetentă","repetent","repetenta","repetent"],"repetente":["repetente","repetent","repetente","repetentă"],"repetentei":"repetentă","repetentele":["repetentele","repetent","repetentele","repetentă"],"repetentelor":"repetentă","repetenti":"repetent","repetentia":"repetenție","repetentiei":"repetenție","repetentii":["repetenții","repetent","repetenții","repetenție"],"repetentiile":"repetenție","repetentiilor":"repetenție","repetentilor":"repetent","repetentul":"repetent","repetentule":"repetent","repetentului":"repetent","repetesc":"repeți","repeteste":"repeți","repetesti":"repeți","repeteze":"repeta","repeti":["repeți","repeta","repeti","repeta"],"repetii":"repeți","repetim":"repeți","repetind":"repeți","repetira":"repeți","repetiram":"repeți","repetirati":"repeți","repetirea":"repețire","repetiri":"repețire","repetirii":"repețire","repetirile":"repețire","repetirilor":"repețire","repetirui":"repeta","repetiruieste":"repetirui","repetiruirea":"repetiruire","repetiruiri":"repetiruire","repetiruirii":"repetiruire","repetiruirile":"repetiruire","repetiruirilor":"repetiruire","repetiruit":"repetirui","repetise":"repeți","repetisem":"repeți","repetisera":"repeți","repetiseram":"repeți","repetiserati":"repeți","repetisesi":"repeți","repetisi":"repeți","repetit":"repeți","repetita":["repetită","repetit","repetita","repetit","repețită","repețit","repețita","repețit"],"repetite":["repetite","repetit","repețite","repețit"],"repetitele":["repetitele","repetit","repețitele","repețit"],"repetiti":["repețiți","repeți","repetiți","repetit","repețiți","repețit"],"repetitia":"repetiție","repetitiei":"repetiție","repetitii":["repetiții","repetit","repețiții","repețit","repetiții","repetiție"],"repetitiile":"repetiție","repetitiilor":"repetiție","repetitiunea":"repetițiune","repetitiuni":"repetițiune","repetitiunii":"repetițiune","repetitiunile":"repetițiune","repetitiunilor":"repetițiune","repetitoarea":"repetitoare","repetitoarei":"repetitoare","repetitoarele":"repetitoare","repetitoarelor":"repetitoare","repetitori":"repetitor","repetitorii":"repetitor","repetitorilor":"repetitor","repetitorul":"repetitor","repetitorule":"repetitor","repetitorului":"repetitor","repetitul":["repetitul","repetit","repețitul","repețit"],"repetoare":"repetor","repetoarele":"repetor","repetoarelor":"repetor","repetorul":"repetor","repetorule":"repetor","repetorului":"repetor","repetuirea":"repetuire","repetuiri":"repetuire","repetuirii":"repetuire","repetuirile":"repetuire","repetuirilor":"repetuire","repezea":"repezi","repezeai":"repezi","repezeam":"repezi","repezeati":"repezi","repezeau":"repezi","repezeli":"repezeală","repezelii":"repezeală","repezelile":"repezeală","repezelilor":"repezeală","repezesc":"repezi","repezeste":"repezi","repezesti":"repezi","repezi":"repede","repezicioasa":["repezicioasă","repezicios","repezicioasa","repezicios"],"repezicioase":"repezicios","repezicioasele":"repezicios","repeziciosi":"repezicios","repeziciosii":"repezicios","repeziciosul":"repezicios","repeziciunea":"repeziciune","repeziciuni":"repeziciune","repeziciunii":"repeziciune","repeziciunile":"repeziciune","repeziciunilor":"repeziciune","repezii":["repezii","repede","repezii","repezi"],"repezile":"repede","repezim":"repezi","repezimea":"repezime","repezimi":"repezime","repezimii":"repezime","repezimile":"repezime","repezimilor":"repezime","repezind":"repezi","repezira":"repezi","repeziram":"repezi","repezirati":"repezi","repezirea":"repezire","repeziri":"repezire","repezirii":"repezire","repezirile":"repezire","repezirilor":"repezire","repezise":"repezi","repezisem":"repezi","repezisera":"repezi","repeziseram":"repezi","repeziserati":"repezi","repezisesi":"repezi","repezisi":"repezi","repezisul":"repeziș","repezisule":"repeziș","repezisului":"repeziș","repezisuri":"repeziș","repezisurile":"repeziș","repezisurilor":"repeziș","repezit":"repezi","repezita":["repezită","repezit","repezita","repezit"],"repezite":"repezit","repezitele":"repezit","repeziti":["repeziți","repezi","repeziți","repezit"],"repezitii":"repezit","repezitul":"repezit","repezituri":"repezitură","repeziturii":"repezitură","repeziturile":"repezitură","repeziturilor":"repezitură","repicaje":"repicaj","repicajele":"repicaj","repicajelor":"repicaj","repicajul":"repicaj","repicajule":"repicaj","repicajului":"repicaj","replamad":"replămădi","replamade":"replămădi","replamadea":"replămădi","replamadeai":"replămădi","replamadeam":"replămădi","replamadeati":"replămădi","replamadeau":"replămădi","replamadie":"replămădi","replamadii":"replămădi","replamadim":"replămădi","replamadind":"replămădi","replamadira":"replămădi","replamadiram":"replămădi","replamadirati":"replămădi","replamadise":"replămădi","replamadisem":"replămădi","replamadisera":"replămădi","replamadiseram":"replămădi","replamadiserati":"replămădi","replamadisesi":"replămădi","replamadisi":"replămădi","replamadit":"replămădi","replamaditi":"replămădi","replamazi":"replămădi","replantai":"replanta","replantam":["replantăm","replanta","replantam","replanta"],"replantand":"replanta","replantara":"replanta","replantaram":"replanta","replantarati":"replanta","replantarea":"replantare","replantari":"replantare","replantarii":"replantare","replantarile":"replantare","replantarilor":"replantare","replantase":"replanta","replantasem":"replanta","replantasera":"replanta","replantaseram":"replanta","replantaserati":"replanta","replantasesi":"replanta","replantasi":"replanta","replantat":"replanta","replantati":"replanta","replantau":"replanta","replanteaza":"replanta","replantez":"replanta","replantezi":"replanta","replayul":"replay","replayule":"replay","replayului":"replay","replic":"replica","replicai":"replica","replicam":["replicăm","replica","replicam","replica"],"replicand":"replica","replicara":"replica","replicaram":"replica","replicarati":"replica","replicarea":"replicare","replicari":"replicare","replicarii":"replicare","replicase":"replica","replicasem":"replica","replicasera":"replica","replicaseram":"replica","replicaserati":"replica","replicasesi":"replica","replicasi":"replica","replicat":"replica","replicati":"replica","replicatii":"replicație","replicau":"replica","replice":"replica","replici":["replici","replica","replici","replică"],"replicii":"replică","replicile":"replică","replicilor":"replică","repolizarea":"repolizare","repolizari":"repolizare","repolizarii":"repolizare","repoporai":"repopora","repoporam":["repoporăm","repopora","repoporam","repopora"],"repoporand":"repopora","repoporara":"repopora","repoporaram":"repopora","repoporarati":"repopora","repoporase":"repopora","repoporasem":"repopora","repoporasera":"repopora","repoporaseram":"repopora","repoporaserati":"repopora","repoporasesi":"repopora","repoporasi":"repopora","repoporat":"repopora","repoporati":"repopora","repoporau":"repopora","repoporeaza":"repopora","repoporez":"repopora","repoporezi":"repopora","repopulai":"repopula","repopulam":["repopulăm","repopula","repopulam","repopula"],"repopuland":"repopula","repopulara":"repopula","repopularam":"repopula","repopularati":"repopula","repopularea":"repopulare","repopulari":"repopulare","repopularii":"repopulare","repopularile":"repopulare","repopularilor":"repopulare","repopulase":"repopula","repopulasem":"repopula","repopulasera":"repopula","repopulaseram":"repopula","repopulaserati":"repopula","repopulasesi":"repopula","repopulasi":"repopula","repopulat":"repopula","repopulata":["repopulată","repopulat","repopulata","repopulat"],"repopulate":"repopulat","repopulatele":"repopulat","repopulati":["repopulați","repopula","repopulați","repopulat"],"repopulatii":"repopulat","repopulatul":"repopulat","repopulau":"repopula","repopuleaza":"repopula","repopulez":"repopula","repopulezi":"repopula","reportai":"reporta","reportaje":"reportaj","reportajele":"reportaj","reportajelor":"reportaj","reportajul":"reportaj","reportajule":"reportaj","reportajului":"reportaj","reportam":["reportăm","reporta","reportam","reporta"],"reportand":"reporta","reportara":"reporta","reportaram":"reporta","reportarati":"reporta","reportarea":"reportare","reportari":"reportare","reportarii":"reportare","reportarile":"reportare","reportarilor":"reportare","reportase":"reporta","reportasem":"reporta","reportasera":"reporta","reportaseram":"reporta","reportaserati":"reporta","reportasesi":"reporta","reportasi":"reporta","reportat":"reporta","reportati":"reporta","reportau":"reporta","reporteaza":"reporta","reporterasi":"reporteraș","reporterasii":"reporteraș","reporterasilor":"reporteraș","reporterasul":"reporteraș","reporterasule":"reporteraș","reporterasului":"reporteraș","reportere":"reporteră","reporterei":"reporteră","reporterele":"reporteră","reporterelor":"reporteră","reporteri":"reporter","reportericeasca":["reportericească","reportericesc","reportericeasca","reportericesc"],"reportericescul":"reportericesc","reportericesti":"reportericesc","reportericestii":"reportericesc","reportericestile":"reportericesc","reporterii":"reporter","reporterilor":"reporter","reporterul":"reporter","reporterule":"reporter","reporterului":"reporter","reportez":"reporta","reportezi":"reporta","reportofoane":"reportofon","reportofoanele":"reportofon","reportofoanelor":"reportofon","reportofonul":"reportofon","reportofonule":"reportofon","reportofonului":"reportofon","reposata":["reposată","reposat","reposata","reposat"],"reposate":"reposat","reposatele":"reposat","reposati":"reposat","reposatii":"reposat","reposatul":"reposat","repovestea":"repovesti","repovesteai":"repovesti","repovesteam":"repovesti","repovesteati":"repovesti","repovesteau":"repovesti","repovestesc":"repovesti","repovesteste":"repovesti","repovestesti":"repovesti","repovestii":"repovesti","repovestim":"repovesti","repovestind":"repovesti","repovestira":"repovesti","repovestiram":"repovesti","repovestirati":"repovesti","repovestirea":"repovestire","repovestiri":"repovestire","repovestirii":"repovestire","repovestirile":"repovestire","repovestirilor":"repovestire","repovestise":"repovesti","repovestisem":"repovesti","repovestisera":"repovesti","repovestiseram":"repovesti","repovestiserati":"repovesti","repovestisesi":"repovesti","repovestisi":"repovesti","repovestit":"repovesti","repovestita":["repovestită","repovestit","repovestita","repovestit"],"repovestite":"repovestit","repovestitele":"repovestit","repovestiti":["repovestiți","repovesti","repovestiți","repovestit"],"repovestitii":"repovestit","repovestitori":"repovestitor","repovestitorii":"repovestitor","repovestitorilor":"repovestitor","repovestitorul":"repovestitor","repovestitorule":"repovestitor","repovestitorului":"repovestitor","repovestitul":"repovestit","repozai":"repoza","repozam":["repozăm","repoza","repozam","repoza"],"repozand":"repoza","repozara":"repoza","repozaram":"repoza","repozarati":"repoza","repozase":"repoza","repozasem":"repoza","repozasera":"repoza","repozaseram":"repoza","repozaserati":"repoza","repozasesi":"repoza","repozasi":"repoza","repozat":"repoza","repozati":"repoza","repozau":"repoza","repozeaza":"repoza","repozez":"repoza","repozezi":"repoza","repozitia":"repoziție","repozitiei":"repoziție","repozitii":"repoziție","repozitiile":"repoziție","repozitiilor":"repoziție","reprehensibila":["reprehensibilă","reprehensibil","reprehensibila","reprehensibil"],"reprehensibile":"reprehensibil","reprehensibilele":"reprehensibil","reprehensibili":"reprehensibil","reprehensibilii":"reprehensibil","reprehensibilul":"reprehensibil","reprehensiunea":"reprehensiune","reprehensiuni":"reprehensiune","reprehensiunii":"reprehensiune","reprehensiunile":"reprehensiune","reprehensiunilor":"reprehensiune","represibila":["represibilă","represibil","represibila","represibil"],"represibile":"represibil","represibilele":"represibil","represibili":"represibil","represibilii":"represibil","represibilul":"represibil","represiunea":"represiune","represiunei":"represiune","represiunele":"represiune","represiunelor":"represiune","represiuni":"represiune","represiva":["represivă","represiv","represiva","represiv"],"represive":"represiv","represivele":"represiv","represivi":"represiv","represivii":"represiv","represivul":"represiv","represori":"represor","represorii":"represor","represorilor":"represor","represorul":"represor","represorule":"represor","represorului":"represor","reprezentabila":["reprezentabilă","reprezentabil","reprezentabila","reprezentabil"],"reprezentabile":"reprezentabil","reprezentabilele":"reprezentabil","reprezentabili":"reprezentabil","reprezentabilii":"reprezentabil","reprezentabilul":"reprezentabil","reprezentai":"reprezenta","reprezentam":["reprezentăm","reprezenta","reprezentam","reprezenta"],"reprezentand":"reprezenta","reprezentante":["reprezentante","reprezentantă","reprezentanțe","reprezentanță"],"reprezentantei":["reprezentantei","reprezentantă","reprezentanței","reprezentanță"],"reprezentantele":["reprezentantele","reprezentantă","reprezentanțele","reprezentanță"],"reprezentantelor":["reprezentantelor","reprezentantă","reprezentanțelor","reprezentanță"],"reprezentanti":"reprezentant","reprezentantii":"reprezentant","reprezentantilor":"reprezentant","reprezentantul":"reprezentant","reprezentantule":"reprezentant","reprezentantului":"reprezentant","reprezentara":"reprezenta","reprezentaram":"reprezenta","reprezentarati":"reprezenta","reprezentari":"reprezentare","reprezentari proportionale":"reprezentare proporțională","reprezentase":"reprezenta","reprezentasem":"reprezenta","reprezentasera":"reprezenta","reprezentaseram":"reprezenta","reprezentaserati":"reprezenta","reprezentasesi":"reprezenta","reprezentasi":"reprezenta","reprezentat":"reprezenta","reprezentati":"reprezenta","reprezentatia":"reprezentație","reprezentatiei":"reprezentație","reprezentatii":"reprezentație","reprezentatiile":"reprezentație","reprezentatiilor":"reprezentație","reprezentatiunea":"reprezentațiune","reprezentatiuni":"reprezentațiune","reprezentatiunii":"reprezentațiune","reprezentatiunile":"reprezentațiune","reprezentatiunilor":"reprezentațiune","reprezentativa":["reprezentativă","reprezentativ","reprezentativa","reprezentativ"],"reprezentative":["reprezentative","reprezentativ","reprezentative","reprezentativă"],"reprezentativei":"reprezentativă","reprezentativele":["reprezentativele","reprezentativ","reprezentativele","reprezentativă"],"reprezentativelor":"reprezentativă","reprezentativi":"reprezentativ","reprezentativii":"reprezentativ","reprezentativitatea":"reprezentativitate","reprezentativitati":"reprezentativitate","reprezentativitatii":"reprezentativitate","reprezentativul":"reprezentativ","reprezentau":"reprezenta","reprezint":"reprezenta","reprezinta":"reprezenta","reprezinti":"reprezenta","reprim":"reprima","reprimai":"reprima","reprimam":["reprimăm","reprima","reprimam","reprima"],"reprimand":"reprima","reprimande":"reprimandă","reprimandei":"reprimandă","reprimandele":"reprimandă","reprimandelor":"reprimandă","reprimara":"reprima","reprimaram":"reprima","reprimarati":"reprima","reprimarea":"reprimare","reprimari":"reprimare","reprimarii":"reprimare","reprimarile":"reprimare","reprimarilor":"reprimare","reprimase":"reprima","reprimasem":"reprima","reprimasera":"reprima","reprimaseram":"reprima","reprimaserati":"reprima","reprimasesi":"reprima","reprimasi":"reprima","reprimat":"reprima","reprimata":["reprimată","reprimat","reprimata","reprimat"],"reprimate":"reprimat","reprimatele":"reprimat","reprimati":["reprimați","reprima","reprimați","reprimat"],"reprimatii":"reprimat","reprimatoare":"reprimator","reprimatoarea":["reprimatoarea","reprimatoare","reprimatoarea","reprimator"],"reprimatoarei":"reprimatoare","reprimatoarele":["reprimatoarele","reprimatoare","reprimatoarele","reprimator"],"reprimatoarelor":"reprimatoare","reprimatori":"reprimator","reprimatorii":"reprimator","reprimatorilor":"reprimator","reprimatorul":"reprimator","reprimatorule":"reprimator","reprimatorului":"reprimator","reprimatul":"reprimat","reprimau":"reprima","reprime":"reprima","reprimea":"reprimi","reprimeai":"reprimi","reprimeam":"reprimi","reprimeati":"reprimi","reprimeau":"reprimi","reprimesc":"reprimi","reprimeste":"reprimi","reprimesti":"reprimi","reprimi":"reprima","reprimii":"reprimi","reprimim":"reprimi","reprimind":"reprimi","reprimira":"reprimi","reprimiram":"reprimi","reprimirati":"reprimi","reprimirea":"reprimire","reprimiri":"reprimire","reprimirii":"reprimire","reprimirile":"reprimire","reprimirilor":"reprimire","reprimise":"reprimi","reprimisem":"reprimi","reprimisera":"reprimi","reprimiseram":"reprimi","reprimiserati":"reprimi","reprimisesi":"reprimi","reprimisi":"reprimi","reprimit":"reprimi","reprimiti":"reprimi","reprintul":"reprint","reprintule":"reprint","reprintului":"reprint","reprinturi":"reprint","reprinturile":"reprint","reprinturilor":"reprint","reprivatizai":"reprivatiza","reprivatizam":["reprivatizăm","reprivatiza","reprivatizam","reprivatiza"],"reprivatizand":"reprivatiza","reprivatizara":"reprivatiza","reprivatizaram":"reprivatiza","reprivatizarati":"reprivatiza","reprivatizarea":"reprivatizare","reprivatizari":"reprivatizare","reprivatizarii":"reprivatizare","reprivatizarile":"reprivatizare","reprivatizarilor":"reprivatizare","reprivatizase":"reprivatiza","reprivatizasem":"reprivatiza","reprivatizasera":"reprivatiza","reprivatizaseram":"reprivatiza","reprivatizaserati":"reprivatiza","reprivatizasesi":"reprivatiza","reprivatizasi":"reprivatiza","reprivatizat":"reprivatiza","reprivatizati":"reprivatiza","reprivatizau":"reprivatiza","reprivatizeaza":"reprivatiza","reprivatizez":"reprivatiza","reprivatizezi":"reprivatiza","reprivirea":"reprivire","repriviri":"reprivire","reprivirii":"reprivire","reprivirile":"reprivire","reprivirilor":"reprivire","reprize":"repriză","reprizei":"repriză","reprizele":"repriză","reprizelor":"repriză","reprob":"reproba","reprobabila":["reprobabilă","reprobabil","reprobabila","reprobabil"],"reprobabile":"reprobabil","reprobabilele":"reprobabil","reprobabili":"reprobabil","reprobabilii":"reprobabil","reprobabilul":"reprobabil","reprobai":"reproba","reprobam":["reprobăm","reproba","reprobam","reproba"],"reproband":"reproba","reprobara":"reproba","reprobaram":"reproba","reprobarati":"reproba","reprobarea":"reprobare","reprobari":"reprobare","reprobarii":"reprobare","reprobarile":"reprobare","reprobarilor":"reprobare","reprobase":"reproba","reprobasem":"reproba","reprobasera":"reproba","reprobaseram":"reproba","reprobaserati":"reproba","reprobasesi":"reproba","reprobasi":"reproba","reprobat":"reproba","reprobata":["reprobată","reprobat","reprobata","reprobat"],"reprobate":"reprobat","reprobatele":"reprobat","reprobati":["reprobați","reproba","reprobați","reprobat"],"reprobatii":"reprobat","reprobatiunea":"reprobațiune","reprobatiuni":"reprobațiune","reprobatiunii":"reprobațiune","reprobatiunile":"reprobațiune","reprobatiunilor":"reprobațiune","reprobativa":["reprobativă","reprobativ","reprobativa","reprobativ"],"reprobative":"reprobativ","reprobativele":"reprobativ","reprobativi":"reprobativ","reprobativii":"reprobativ","reprobativul":"reprobativ","reprobatoare":"reprobator","reprobatoarea":"reprobator","reprobatoarele":"reprobator","reprobatori":"reprobator","reprobatorii":"reprobator","reprobatorul":"reprobator","reprobatul":"reprobat","reprobau":"reproba","reprobe":"reproba","reprobi":"reproba","reproduc":"reproduce","reproduca":"reproduce","reproducand":"reproduce","reproducatoare":"reproducător","reproducatoarea":"reproducător","reproducatoarele":"reproducător","reproducatori":"reproducător","reproducatorii":"reproducător","reproducatorul":"reproducător","reproducea":"reproduce","reproduceai":"reproduce","reproduceam":"reproduce","reproduceati":"reproduce","reproduceau":"reproduce","reproducem":"reproduce","reproducerea":"reproducere","reproduceri":"reproducere","reproducerii":"reproducere","reproducerile":"reproducere","reproducerilor":"reproducere","reproduceti":"reproduce","reproduci":"reproduce","reproductia":"reproducție","reproductibila":["reproductibilă","reproductibil","reproductibila","reproductibil"],"reproductibile":"reproductibil","reproductibilele":"reproductibil","reproductibili":"reproductibil","reproductibilii":"reproductibil","reproductibilul":"reproductibil","reproductiei":"reproducție","reproductii":"reproducție","reproductiile":"reproducție","reproductiilor":"reproducție","reproductiunea":"reproducțiune","reproductiuni":"reproducțiune","reproductiunii":"reproducțiune","reproductiunile":"reproducțiune","reproductiunilor":"reproducțiune","reproductiva":["reproductivă","reproductiv","reproductiva","reproductiv"],"reproductive":"reproductiv","reproductivele":"reproductiv","reproductivi":"reproductiv","reproductivii":"reproductiv","reproductivitatea":"reproductivitate","reproductivitati":"reproductivitate","reproductivitatii":"reproductivitate","reproductivitatile":"reproductivitate","reproductivitatilor":"reproductivitate","reproductivul":"reproductiv","reprodus":"reproduce","reprodusa":["reprodusă","reprodus","reprodusa","reprodus"],"reproduse":["reproduse","reproduce","reproduse","reprodus"],"reprodusei":"reproduce","reprodusele":"reprodus","reprodusera":"reproduce","reproduseram":"reproduce","reproduserati":"reproduce","reprodusese":"reproduce","reprodusesem":"reproduce","reprodusesera":"reproduce","reproduseseram":"reproduce","reproduseserati":"reproduce","reprodusesesi":"reproduce","reprodusesi":"reproduce","reprodusi":"reprodus","reprodusii":"reprodus","reprodusul":"reprodus","reprofilai":"reprofila","reprofilam":["reprofilăm","reprofila","reprofilam","reprofila"],"reprofiland":"reprofila","reprofilara":"reprofila","reprofilaram":"reprofila","reprofilarati":"reprofila","reprofilarea":"reprofilare","reprofilari":"reprofilare","reprofilarii":"reprofilare","reprofilarile":"reprofilare","reprofilarilor":"reprofilare","reprofilase":"reprofila","reprofilasem":"reprofila","reprofilasera":"reprofila","reprofilaseram":"reprofila","reprofilaserati":"reprofila","reprofilasesi":"reprofila","reprofilasi":"reprofila","reprofilat":"reprofila","reprofilati":"reprofila","reprofilau":"reprofila","reprofileaza":"reprofila","reprofilez":"reprofila","reprofilezi":"reprofila","reprografia":"reprografie","reprografiei":"reprografie","reprografii":"reprografie","reprogramabila":["reprogramabilă","reprogramabil","reprogramabila","reprogramabil"],"reprogramabile":"reprogramabil","reprogramabilele":"reprogramabil","reprogramabili":"reprogramabil","reprogramabilii":"reprogramabil","reprogramabilul":"reprogramabil","reprogramai":"reprograma","reprogramam":["reprogramăm","reprograma","reprogramam","reprograma"],"reprogramand":"reprograma","reprogramara":"reprograma","reprogramaram":"reprograma","reprogramarati":"reprograma","reprogramarea":"reprogramare","reprogramari":"reprogramare","reprogramarii":"reprogramare","reprogramarile":"reprogramare","reprogramarilor":"reprogramare","reprogramase":"reprograma","reprogramasem":"reprograma","reprogramasera":"reprograma","reprogramaseram":"reprograma","reprogramaserati":"reprograma","reprogramasesi":"reprograma","reprogramasi":"reprograma","reprogramat":"reprograma","reprogramata":["reprogramată","reprogramat","reprogramata","reprogramat"],"reprogramate":"reprogramat","reprogramatele":"reprogramat","reprogramati":["reprogramați","reprograma","reprogramați","reprogramat"],"reprogramatii":"reprogramat","reprogramatul":"reprogramat","reprogramau":"reprograma","reprogrameaza":"reprograma","reprogramez":"reprograma","reprogramezi":"reprograma","reprosabila":["reproșabilă","reproșabil","reproșabila","reproșabil"],"reprosabile":"reproșabil","reprosabilele":"reproșabil","reprosabili":"reproșabil","reprosabilii":"reproșabil","reprosabilul":"reproșabil","reprosai":"reproșa","reprosam":["reproșăm","reproșa","reproșam","reproșa"],"reprosand":"reproșa","reprosara":"reproșa","reprosaram":"reproșa","reprosarati":"reproșa","reprosarea":"reproșare","reprosari":"reproșare","reprosarii":"reproșare","reprosarile":"reproșare","reprosarilor":"reproșare","reprosase":"reproșa","reprosasem":"reproșa","reprosasera":"reproșa","reprosaseram":"reproșa","reprosaserati":"reproșa","reprosasesi":"reproșa","reprosasi":"reproșa","reprosat":"reproșa","reprosati":"reproșa","reprosau":"reproșa","reproseaza":"reproșa","reprosez":"reproșa","reprosezi":"reproșa","reprosuri":"reproș","reptile":"reptilă","reptilei":"reptilă","reptilele":"reptilă","reptilelor":"reptilă","reptiliana":["reptiliană","reptilian","reptiliana","reptilian"],"reptilianul":"reptilian","reptiliene":"reptilian","reptilienele":"reptilian","reptilieni":"reptilian","reptilienii":"reptilian","republic":"republica","republica federala democrata nepal":"Republica Federativă a Braziliei","republicabila":["republicabilă","republicabil","republicabila","republicabil"],"republicabile":"republicabil","republicabilele":"republicabil","republicabili":"republicabil","republicabilii":"republicabil","republicabilul":"republicabil","republicai":"republica","republicam":["republicăm","republica","republicam","republica"],"republicana":["republicană","republican","republicana","republican"],"republicand":"republica","republicane":["republicane","republican","republicane","republicană"],"republicaneasca":["republicănească","republicănesc","republicăneasca","republicănesc"],"republicanei":"republicană","republicanele":["republicanele","republican","republicanele","republicană"],"republicanelor":"republicană","republicanescul":"republicănesc","republicanesti":"republicănesc","republicanestii":"republicănesc","republicanestile":"republicănesc","republicani":"republican","republicanii":"republican","republicanilor":"republican","republicanismul":"republicanism","republicanismule":"republicanism","republicanismului":"republicanism","republicanul":"republican","republicanule":"republican","republicanului":"republican","republicara":"republica","republicaram":"republica","republicarati":"republica","republicarea":"republicare","republicari":"republicare","republicarii":"republicare","republicarile":"republicare","republicarilor":"republicare","republicase":"republica","republicasem":"republica","republicasera":"republica","republicaseram":"republica","republicaserati":"republica","republicasesi":"republica","republicasi":"republica","republicat":"republica","republicata":["republicată","republicat","republicata","republicat"],"republicate":"republicat","republicatele":"republicat","republicati":["republicați","republica","republicați","republicat"],"republicatii":"republicat","republicatul":"republicat","republicau":"republica","republice":"republica","republiceasca":["republicească","republicesc","republiceasca","republicesc"],"republicescul":"republicesc","republicesti":"republicesc","republicestii":"republicesc","republicestile":"republicesc","republici":["republici","republica","republici","republică"],"republici bananiere":"republică bananieră","republicii":"republică","republicii cehe":"Republica Cehă","republicii moldova":"Republica Moldova","republicii populare democratice ale coreei":"Republica Populară Democratică a Coreei","republicile":"republică","republicilor":"republică","repudiai":"repudia","repudiam":"repudia","repudiara":"repudia","repudiaram":"repudia","repudiarati":"repudia","repudiase":"repudia","repudiasem":"repudia","repudiasera":"repudia","repudiaseram":"repudia","repudiaserati":"repudia","repudiasesi":"repudia","repudiasi":"repudia","repudiat":"repudia","repudiata":["repudiată","repudiat","repudiata","repudiat"],"repudiate":"repudiat","repudiatele":"repudiat","repudiati":["repudiați","repudia","repudiați","repudiat"],"repudiatii":"repudiat","repudiatul":"repudiat","repudiau":"repudia","repudiaza":"repudia","repudie":"repudia","repudieaza":"repudia","repudiem":"repudia","repudierea":"repudiere","repudieri":"repudiere","repudierii":"repudiere","repudierile":"repudiere","repudierilor":"repudiere","repudiez":"repudia","repudiezi":"repudia","repudii":"repudiu","repudiile":"repudiu","repudiilor":"repudiu","repudiind":"repudia","repudiuul":"repudiu","repudiuule":"repudiu","repudiuului":"repudiu","repugn":"repugna","repugnai":"repugna","repugnam":["repugnăm","repugna","repugnam","repugna"],"repugnand":"repugna","repugnanta":["repugnantă","repugnant","repugnanta","repugnant"],"repugnante":["repugnante","repugnant","repugnanțe","repugnanță"],"repugnantei":"repugnanță","repugnantele":["repugnantele","repugnant","repugnanțele","repugnanță"],"repugnantelor":"repugnanță","repugnanti":"repugnant","repugnantii":"repugnant","repugnantul":"repugnant","repugnara":"repugna","repugnaram":"repugna","repugnarati":"repugna","repugnase":"repugna","repugnasem":"repugna","repugnasera":"repugna","repugnaseram":"repugna","repugnaserati":"repugna","repugnasesi":"repugna","repugnasi":"repugna","repugnat":"repugna","repugnati":"repugna","repugnau":"repugna","repugne":"repugna","repugni":"repugna","repui":"repune","repulsia":"repulsie","repulsiei":"repulsie","repulsii":"repulsie","repulsiile":"repulsie","repulsiilor":"repulsie","repulsiunea":"repulsiune","repulsiuni":"repulsiune","repulsiunii":"repulsiune","repulsiunile":"repulsiune","repulsiunilor":"repulsiune","repulsiva":["repulsivă","repulsiv","repulsiva","repulsiv"],"repulsive":"repulsiv","repulsivele":"repulsiv","repulsivi":"repulsiv","repulsivii":"repulsiv","repulsivul":"repulsiv","repun":"repune","repuna":"repune","repunand":"repune","repunea":"repune","repuneai":"repune","repuneam":"repune","repuneati":"repune","repuneau":"repune","repunem":"repune","repunerea":"repunere","repuneri":"repunere","repunerii":"repunere","repunerile":"repunere","repunerilor":"repunere","repuneti":"repune","repurt":"repurta","repurtai":"repurta","repurtam":["repurtăm","repurta","repurtam","repurta"],"repurtand":"repurta","repurtara":"repurta","repurtaram":"repurta","repurtarati":"repurta","repurtase":"repurta","repurtasem":"repurta","repurtasera":"repurta","repurtaseram":"repurta","repurtaserati":"repurta","repurtasesi":"repurta","repurtasi":"repurta","repurtat":"repurta","repurtati":"repurta","repurtau":"repurta","repurti":"repurta","repus":"repune","repuse":"repune","repusei":"repune","repusera":"repune","repuseram":"repune","repuserati":"repune","repusese":"repune","repusesem":"repune","repusesera":"repune","repuseseram":"repune","repuseserati":"repune","repusesesi":"repune","repusesi":"repune","reputaciunea":"reputăciune","reputaciuni":"reputăciune","reputaciunii":"reputăciune","reputaciunile":"reputăciune","reputaciunilor":"reputăciune","reputai":"reputa","reputam":["reputăm","reputa","reputam","reputa"],"reputand":"reputa","reputara":"reputa","reputaram":"reputa","reputarati":"reputa","reputase":"reputa","reputasem":"reputa","reputasera":"reputa","reputaseram":"reputa","reputaserati":"reputa","reputasesi":"reputa","reputasi":"reputa","reputat":"reputa","reputata":["reputată","reputat","reputata","reputat"],"reputate":"reputat","reputatele":"reputat","reputati":["reputați","reputa","reputați","reputat"],"reputatii":["reputații","reputat","reputații","reputație"],"reputatiune":"reputație","reputatiunea":"reputațiune","reputatiuni":"reputațiune","reputatiunii":"reputațiune","reputatiunile":"reputațiune","reputatiunilor":"reputațiune","reputatul":"reputat","reputau":"reputa","reputeaza":"reputa","reputez":"reputa","reputezi":"reputa","reromanizarea":"reromanizare","reromanizari":"reromanizare","reromanizarii":"reromanizare","reromanizarile":"reromanizare","reromanizarilor":"reromanizare","resada":"reședea","resade":"reședea","resapai":"reșapa","resapam":["reșapăm","reșapa","reșapam","reșapa"],"resapand":"reșapa","resapara":"reșapa","resaparam":"reșapa","resaparati":"reșapa","resaparea":"reșapare","resapari":"reșapare","resaparii":"reșapare","resaparile":"reșapare","resaparilor":"reșapare","resapase":"reșapa","resapasem":"reșapa","resapasera":"reșapa","resapaseram":"reșapa","resapaserati":"reșapa","resapasesi":"reșapa","resapasi":"reșapa","resapat":"reșapa","resapata":["reșapată","reșapat","reșapata","reșapat"],"resapate":"reșapat","resapatele":"reșapat","resapati":["reșapați","reșapa","reșapați","reșapat"],"resapatii":"reșapat","resapatul":"reșapat","resapau":"reșapa","resapeaza":"reșapa","resapez":"reșapa","resapezi":"reșapa","resarjai":"reșarja","resarjam":["reșarjăm","reșarja","reșarjam","reșarja"],"resarjand":"reșarja","resarjara":"reșarja","resarjaram":"reșarja","resarjarati":"reșarja","resarjarea":"reșarjare","resarjari":"reșarjare","resarjarii":"reșarjare","resarjarile":"reșarjare","resarjarilor":"reșarjare","resarjase":"reșarja","resarjasem":"reșarja","resarjasera":"reșarja","resarjaseram":"reșarja","resarjaserati":"reșarja","resarjasesi":"reșarja","resarjasi":"reșarja","resarjat":"reșarja","resarjati":"reșarja","resarjau":"reșarja","resarjeaza":"reșarja","resarjez":"reșarja","resarjezi":"reșarja","reschimbarea":"reschimbare","reschimbari":"reschimbare","reschimbarii":"reschimbare","rescinderea":"rescindere","rescinderi":"rescindere","rescinderii":"rescindere","resciziunea":"resciziune","resciziuni":"resciziune","resciziunii":"resciziune","resciziunile":"resciziune","resciziunilor":"resciziune","rescizoria":"rescizoriu","rescizorie":"rescizoriu","rescizorii":"rescizoriu","rescizoriii":"rescizoriu","rescizoriile":"rescizoriu","rescizoriul":"rescizoriu","rescria":"rescrie","rescriai":"rescrie","rescriam":"rescrie","rescriati":"rescrie","rescriau":"rescrie","rescriem":"rescrie","rescrierea":"rescriere","rescrieri":"rescriere","rescrierii":"rescriere","rescrierile":"rescriere","rescrierilor":"rescriere","rescrieti":"rescrie","rescrii":"rescrie","rescriind":"rescrie","rescris":"rescrie","rescrisa":["rescrisă","rescris","rescrisa","rescris"],"rescrise":["rescrise","rescrie","rescrise","rescris"],"rescrisei":"rescrie","rescrisele":"rescris","rescrisera":"rescrie","rescriseram":"rescrie","rescriserati":"rescrie","rescrisese":"rescrie","rescrisesem":"rescrie","rescrisesera":"rescrie","rescriseseram":"rescrie","rescriseserati":"rescrie","rescrisesesi":"rescrie","rescrisesi":"rescrie","rescrisi":"rescris","rescrisii":"rescris","rescrisul":"rescris","rescriu":"rescrie","resed":"reședea","resede":"reședea","resedeai":"reședea","resedeam":"reședea","resedeati":"reședea","resedeau":"reședea","resedem":"reședea","resedeti":"reședea","resedinte":"reședință","resedintei":"reședință","resedintele":"reședință","resedintelor":"reședință","resemnai":"resemna","resemnam":["resemnăm","resemna","resemnam","resemna"],"resemnand":"resemna","resemnara":"resemna","resemnaram":"resemna","resemnarati":"resemna","resemnarea":"resemnare","resemnari":"resemnare","resemnarii":"resemnare","resemnarile":"resemnare","resemnarilor":"resemnare","resemnase":"resemna","resemnasem":"resemna","resemnasera":"resemna","resemnaseram":"resemna","resemnaserati":"resemna","resemnasesi":"resemna","resemnasi":"resemna","resemnat":"resemna","resemnata":["resemnată","resemnat","resemnata","resemnat"],"resemnate":"resemnat","resemnatele":"resemnat","resemnati":["resemnați","resemna","resemnați","resemnat"],"resemnatia":"resemnație","resemnatiei":"resemnație","resemnatii":["resemnații","resemnat","resemnații","resemnație"],"resemnatiile":"resemnație","resemnatiilor":"resemnație","resemnatul":"resemnat","resemnau":"resemna","resemneaza":"resemna","resemnez":"resemna","resemnezi":"resemna","resentimentara":["resentimentară","resentimentar","resentimentara","resentimentar"],"resentimentare":"resentimentar","resentimentarele":"resentimentar","resentimentari":"resentimentar","resentimentarii":"resentimentar","resentimentarul":"resentimentar","resentimente":"resentiment","resentimentele":"resentiment","resentimentelor":"resentiment","resentimentul":"resentiment","resentimentule":"resentiment","resentimentului":"resentiment","resetai":"reseta","resetam":["resetăm","reseta","resetam","reseta"],"resetand":"reseta","resetara":"reseta","resetaram":"reseta","resetarati":"reseta","resetarea":"resetare","resetari":"resetare","resetarii":"resetare","resetarile":"resetare","resetarilor":"resetare","resetase":"reseta","resetasem":"reseta","resetasera":"reseta","resetaseram":"reseta","resetaserati":"reseta","resetasesi":"reseta","resetasi":"reseta","resetat":"reseta","resetati":"reseta","resetau":"reseta","reseteaza":"reseta","resetez":"reseta","resetezi":"reseta","resezand":"reședea","resezi":"reședea","resezu":"reședea","resezui":"reședea","resezura":"reședea","resezuram":"reședea","resezurati":"reședea","resezuse":"reședea","resezusem":"reședea","resezusera":"reședea","resezuseram":"reședea","resezuserati":"reședea","resezusesi":"reședea","resezusi":"reședea","resezut":"reședea","resfir":"resfira","resfirai":"resfira","resfiram":["resfirăm","resfira","resfiram","resfira"],"resfirand":"resfira","resfirara":"resfira","resfiraram":"resfira","resfirarati":"resfira","resfirarea":"resfirare","resfirari":"resfirare","resfirarii":"resfirare","resfirarile":"resfirare","resfirarilor":"resfirare","resfirase":"resfira","resfirasem":"resfira","resfirasera":"resfira","resfiraseram":"resfira","resfiraserati":"resfira","resfirasesi":"resfira","resfirasi":"resfira","resfirat":"resfira","resfirata":["resfirată","resfirat","resfirata","resfirat"],"resfirate":"resfirat","resfiratele":"resfirat","resfirati":["resfirați","resfira","resfirați","resfirat"],"resfiratii":"resfirat","resfiratul":"resfirat","resfirau":"resfira","resfiri":"resfira","resfranta":["resfrântă","resfrânt","resfrânta","resfrânt"],"resfrante":"resfrânt","resfrantele":"resfrânt","resfranti":"resfrânt","resfrantii":"resfrânt","resfrantul":"resfrânt","residea":"reședea","resignai":"resigna","resignam":["resignăm","resigna","resignam","resigna"],"resignand":"resigna","resignara":"resigna","resignaram":"resigna","resignarati":"resigna","resignarea":"resignare","resignari":"resignare","resignarii":"resignare","resignarile":"resignare","resignarilor":"resignare","resignase":"resigna","resignasem":"resigna","resignasera":"resigna","resignaseram":"resigna","resignaserati":"resigna","resignasesi":"resigna","resignasi":"resigna","resignat":"resigna","resignata":["resignată","resignat","resignata","resignat"],"resignate":"resignat","resignatele":"resignat","resignati":["resignați","resigna","resignați","resignat"],"resignatia":"resignație","resignatiei":"resignație","resignatii":["resignații","resignat","resignații","resignație"],"resignatiile":"resignație","resignatiilor":"resignație","resignatul":"resignat","resignau":"resigna","resigneaza":"resigna","resignez":"resigna","resignezi":"resigna","resimt":"resimți","resimtamantul":"resimțământ","resimtamantule":"resimțământ","resimtamantului":"resimțământ","resimtaminte":"resimțământ","resimtamintele":"resimțământ","resimtamintelor":"resimțământ","resimte":["resimte","resimți","resimțe","resimți"],"resimtea":"resimți","resimteai":"resimți","resimteam":"resimți","resimteati":"resimți","resimteau":"resimți","resimtii":"resimți","resimtim":"resimți","resimtind":"resimți","resimtira":"resimți","resimtiram":"resimți","resimtirati":"resimți","resimtirea":"resimțire","resimtiri":"resimțire","resimtirii":"resimțire","resimtirile":"resimțire","resimtirilor":"resimțire","resimtise":"resimți","resimtisem":"resimți","resimtisera":"resimți","resimtiseram":"resimți","resimtiserati":"resimți","resimtisesi":"resimți","resimtisi":"resimți","resimtit":"resimți","resimtiti":"resimți","resiteanul":"reșițean","resiteanule":"reșițean","resiteanului":"reșițean","resitence":"reșițeancă","resitencei":"reșițeancă","resitencele":"reșițeancă","resitencelor":"reșițeancă","resitene":"reșițeană","resitenei":"reșițeană","resitenele":"reșițeană","resitenelor":"reșițeană","resiteni":"reșițean","resitenii":"reșițean","resitenilor":"reșițean","resmeaua":"reșmea","resmele":"reșmea","resmelei":"reșmea","resmelele":"reșmea","resmelelor":"reșmea","resoarbe":"resorbi","resoftai":"resofta","resoftam":["resoftăm","resofta","resoftam","resofta"],"resoftand":"resofta","resoftara":"resofta","resoftaram":"resofta","resoftarati":"resofta","resoftase":"resofta","resoftasem":"resofta","resoftasera":"resofta","resoftaseram":"resofta","resoftaserati":"resofta","resoftasesi":"resofta","resoftasi":"resofta","resoftat":"resofta","resoftati":"resofta","resoftau":"resofta","resofteaza":"resofta","resoftez":"resofta","resoftezi":"resofta","resolubila":["resolubilă","resolubil","resolubila","resolubil"],"resolubile":"resolubil","resolubilele":"resolubil","resolubili":"resolubil","resolubilii":"resolubil","resolubilul":"resolubil","resorb":"resorbi","resorbe":"resorbi","resorbea":"resorbi","resorbeai":"resorbi","resorbeam":"resorbi","resorbeati":"resorbi","resorbeau":"resorbi","resorbii":"resorbi","resorbim":"resorbi","resorbind":"resorbi","resorbira":"resorbi","resorbiram":"resorbi","resorbirati":"resorbi","resorbise":"resorbi","resorbisem":"resorbi","resorbisera":"resorbi","resorbiseram":"resorbi","resorbiserati":"resorbi","resorbisesi":"resorbi","resorbisi":"resorbi","resorbit":"resorbi","resorbiti":"resorbi","resorbtia":"resorbție","resorbtiei":"resorbție","resorbtii":"resorbție","resorbtiile":"resorbție","resorbtiilor":"resorbție","resorbtiunea":"resorbțiune","resorbtiuni":"resorbțiune","resorbtiunii":"resorbțiune","resorbtiunile":"resorbțiune","resorbtiunilor":"resorbțiune","resorcine":"resorcină","resorcinei":"resorcină","resortisanti":"resortisant","resortisantii":"resortisant","resortisantilor":"resortisant","resortisantul":"resortisant","resortisantule":"resortisant","resortisantului":"resortisant","resoul":"reșou","resoule":"reșou","resoului":"reșou","resouri":"reșou","resourile":"reșou","resourilor":"reșou","respect":"respecta","respectabila":["respectabilă","respectabil","respectabila","respectabil"],"respectabile":"respectabil","respectabilele":"respectabil","respectabili":"respectabil","respectabilii":"respectabil","respectabilitatea":"respectabilitate","respectabilitati":"respectabilitate","respectabilitatii":"respectabilitate","respectabilitatile":"respectabilitate","respectabilitatilor":"respectabilitate","respectabilul":"respectabil","respectai":"respecta","respectaluia":"respectălui","respectaluiai":"respectălui","respectaluiam":"respectălui","respectaluiati":"respectălui","respectaluiau":"respectălui","respectaluiesc":"respectălui","respectaluieste":"respectălui","respectaluiesti":"respectălui","respectaluii":"respectălui","respectaluim":"respectălui","respectaluind":"respectălui","respectaluira":"respectălui","respectaluiram":"respectălui","respectaluirati":"respectălui","respectaluise":"respectălui","respectaluisem":"respectălui","respectaluisera":"respectălui","respectaluiseram":"respectălui","respectaluiserati":"respectălui","respectaluisesi":"respectălui","respectaluisi":"respectălui","respectaluit":"respectălui","respectaluiti":"respectălui","respectam":["respectăm","respecta","respectam","respecta"],"respectand":"respecta","respectara":"respecta","respectaram":"respecta","respectarati":"respecta","respectarea":"respectare","respectari":"respectare","respectarii":"respectare","respectarile":"respectare","respectarilor":"respectare","respectase":"respecta","respectasem":"respecta","respectasera":"respecta","respectaseram":"respecta","respectaserati":"respecta","respectasesi":"respecta","respectasi":"respecta","respectat":"respecta","respectata":["respectată","respectat","respectata","respectat"],"respectate":"respectat","respectatele":"respectat","respectati":["respectați","respecta","respectați","respectat"],"respectatii":"respectat","respectatul":"respectat","respectau":"respecta","respecte":"respecta","respecti":"respecta","respectiva":["respectivă","respectiv","respectiva","respectiv"],"respective":"respectiv","respectivele":"respectiv","respectivi":"respectiv","respectivii":"respectiv","respectivul":"respectiv","respectoasa":["respectoasă","respectos","respectoasa","respectos"],"respectoase":"respectos","respectoasele":"respectos","respectosi":"respectos","respectosii":"respectos","respectosul":"respectos","respectuia":"respectui","respectuiai":"respectui","respectuiam":"respectui","respectuiati":"respectui","respectuiau":"respectui","respectuiesc":"respectui","respectuieste":"respectui","respectuiesti":"respectui","respectuii":"respectui","respectuim":"respectui","respectuind":"respectui","respectuira":"respectui","respectuiram":"respectui","respectuirati":"respectui","respectuise":"respectui","respectuisem":"respectui","respectuisera":"respectui","respectuiseram":"respectui","respectuiserati":"respectui","respectuisesi":"respectui","respectuisi":"respectui","respectuit":"respectui","respectuiti":"respectui","respectul":"respect","respectule":"respect","respectului":"respect","respectuoasa":["respectuoasă","respectuos","respectuoasa","respectuos"],"respectuoase":"respectuos","respectuoasele":"respectuos","respectuosi":"respectuos","respectuosii":"respectuos","respectuosul":"respectuos","respicienti":"respicient","respicientii":"respicient","respicientilor":"respicient","respicientul":"respicient","respicientule":"respicient","respicientului":"respicient","resping":"respinge","respinga":"respinge","respingand":"respinge","respingatoare":"respingător","respingatoarea":"respingător","respingatoarele":"respingător","respingatori":"respingător","respingatorii":"respingător","respingatorul":"respingător","respingea":"respinge","respingeai":"respinge","respingeam":"respinge","respingeati":"respinge","respingeau":"respinge","respingem":"respinge","respingerea":"respingere","respingeri":"respingere","respingerii":"respingere","respingerile":"respingere","respingerilor":"respingere","respingeti":"respinge","respingi":"respinge","respins":"respinge","respinse":"respinge","respinsei":"respinge","respinsera":"respinge","respinseram":"respinge","respinserati":"respinge","respinsese":"respinge","respinsesem":"respinge","respinsesera":"respinge","respinseseram":"respinge","respinseserati":"respinge","respinsesesi":"respinge","respinsesi":"respinge","respir":"respira","respirabila":["respirabilă","respirabil","respirabila","respirabil"],"respirabile":"respirabil","respirabilele":"respirabil","respirabili":"respirabil","respirabilii":"respirabil","respirabilul":"respirabil","respirai":"respira","respiram":["respirăm","respira","respiram","respira"],"respirand":"respira","respirara":"respira","respiraram":"respira","respirarati":"respira","respirarea":"respirare","respirari":"respirare","respirarii":"respirare","respirarile":"respirare","respirarilor":"respirare","respirase":"respira","respirasem":"respira","respirasera":"respira","respiraseram":"respira","respiraserati":"respira","respirasesi":"respira","respirasi":"respira","respirat":"respira","respirati":"respira","respiratii":"respirație","respiratiunea":"respirațiune","respiratiuni":"respirațiune","respiratiunii":"respirațiune","respiratiunile":"respirațiune","respiratiunilor":"respirațiune","respiratoare":"respirator","respiratoarea":"respirator","respiratoarele":"respirator","respiratori":"respirator","respiratoria":"respiratoriu","respiratorie":"respiratoriu","respiratorii":["respiratorii","respirator","respiratorii","respiratoriu"],"respiratoriii":"respiratoriu","respiratoriile":"respiratoriu","respiratoriul":"respiratoriu","respiratorul":"respirator","respirau":"respira","respire":"respira","respiri":"respira","respiriuul":"respiriu","respiriuule":"respiriu","respiriuului":"respiriu","respiroul":"respiro","respiroule":"respiro","respiroului":"respiro","responsabile":"responsabilă","responsabilei":"responsabilă","responsabilele":"responsabilă","responsabilelor":"responsabilă","responsabili":"responsabil","responsabilii":"responsabil","responsabililor":"responsabil","responsabilitatea":"responsabilitate","responsabilitati":"responsabilitate","responsabilitatii":"responsabilitate","responsabilitatile":"responsabilitate","responsabilitatilor":"responsabilitate","responsabilizai":"responsabiliza","responsabilizam":["responsabilizăm","responsabiliza","responsabilizam","responsabiliza"],"responsabilizand":"responsabiliza","responsabilizara":"responsabiliza","responsabilizaram":"responsabiliza","responsabilizarati":"responsabiliza","responsabilizase":"responsabiliza","responsabilizasem":"responsabiliza","responsabilizasera":"responsabiliza","responsabilizaseram":"responsabiliza","responsabilizaserati":"responsabiliza","responsabilizasesi":"responsabiliza","responsabilizasi":"responsabiliza","responsabilizat":"responsabiliza","responsabilizati":"responsabiliza","responsabilizau":"responsabiliza","responsabilizeaza":"responsabiliza","responsabilizez":"responsabiliza","responsabilizezi":"responsabiliza","responsabilul":"responsabil","responsabilule":"responsabil","responsabilului":"responsabil","restabilea":"restabili","restabileai":"restabili","restabileam":"restabili","restabileati":"restabili","restabileau":"restabili","restabilesc":"restabili","restabileste":"restabili","restabilesti":"restabili","restabilii":"restabili","restabilim":"restabili","restabilind":"restabili","restabilira":"restabili","restabiliram":"restabili","restabilirati":"restabili","restabilirea":"restabilire","restabiliri":"restabilire","restabilirii":"restabilire","restabilirile":"restabilire","restabilirilor":"restabilire","restabilise":"restabili","restabilisem":"restabili","restabilisera":"restabili","restabiliseram":"restabili","restabiliserati":"restabili","restabilisesi":"restabili","restabilisi":"restabili","restabilit":"restabili","restabilita":["restabilită","restabilit","restabilita","restabilit"],"restabilite":"restabilit","restabilitele":"restabilit","restabiliti":["restabiliți","restabili","restabiliți","restabilit"],"restabilitii":"restabilit","restabilitul":"restabilit","restafele":"reștafel","restafelele":"reștafel","restafelelor":"reștafel","restafelul":"reștafel","restafelule":"reștafel","restafelului":"reștafel","restanta":["restantă","restant","restanta","restant"],"restante":["restante","restant","restanțe","restanță"],"restantei":"restanță"};
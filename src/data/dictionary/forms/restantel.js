@@ -0,0 +1 @@
+export default {"restantele":["restantele","restant","restanțele","restanță"],"restantelor":"restanță","restanti":"restant","restantiera":["restanțieră","restanțier","restanțiera","restanțier"],"restantiere":"restanțier","restantierele":"restanțier","restantieri":"restanțier","restantierii":"restanțier","restantierul":"restanțier","restantii":"restant","restantul":"restant","restatornicirea":"restatornicire","restatorniciri":"restatornicire","restatornicirii":"restatornicire","restatornicirile":"restatornicire","restatornicirilor":"restatornicire","restaurai":"restaura","restauram":["restaurăm","restaura","restauram","restaura"],"restaurand":"restaura","restaurante":"restaurant","restaurantele":"restaurant","restaurantelor":"restaurant","restaurantul":"restaurant","restaurantule":"restaurant","restaurantului":"restaurant","restaurara":"restaura","restauraram":"restaura","restaurarati":"restaura","restaurarea":"restaurare","restaurari":"restaurare","restaurarii":"restaurare","restaurarile":"restaurare","restaurarilor":"restaurare","restaurase":"restaura","restaurasem":"restaura","restaurasera":"restaura","restauraseram":"restaura","restauraserati":"restaura","restaurasesi":"restaura","restaurasi":"restaura","restaurat":"restaura","restaurata":["restaurată","restaurat","restaurata","restaurat"],"restaurate":"restaurat","restauratele":"restaurat","restaurati":["restaurați","restaura","restaurați","restaurat"],"restauratia":"restaurație","restauratiei":"restaurație","restauratii":["restaurații","restaurat","restaurații","restaurație"],"restauratiile":"restaurație","restauratiilor":"restaurație","restauratiunea":"restaurațiune","restauratiuni":"restaurațiune","restauratiunii":"restaurațiune","restauratiunile":"restaurațiune","restauratiunilor":"restaurațiune","restauratoarea":"restauratoare","restauratoarei":"restauratoare","restauratoarele":"restauratoare","restauratoarelor":"restauratoare","restauratori":"restaurator","restauratorii":"restaurator","restauratorilor":"restaurator","restauratorul":"restaurator","restauratorule":"restaurator","restauratorului":"restaurator","restauratul":"restaurat","restaurau":"restaura","restaureaza":"restaura","restaurez":"restaura","restaurezi":"restaura","restea":"resti","resteai":"resti","resteam":"resti","resteati":"resti","resteau":"resti","restesc":"resti","resteste":"resti","restesti":"resti","restii":"resti","restim":"resti","restind":"resti","restira":"resti","restiram":"resti","restirati":"resti","restise":"resti","restisem":"resti","restisera":"resti","restiseram":"resti","restiserati":"resti","restisesi":"resti","restisi":"resti","restit":"resti","restita":["restită","restit","restita","restit"],"restite":"restit","restitele":"restit","restiti":["restiți","resti","restiți","restit"],"restitii":"restit","restituia":"restitui","restituiai":"restitui","restituiam":"restitui","restituiati":"restitui","restituiau":"restitui","restituibila":["restituibilă","restituibil","restituibila","restituibil"],"restituibile":"restituibil","restituibilele":"restituibil","restituibili":"restituibil","restituibilii":"restituibil","restituibilul":"restituibil","restituie":"restitui","restituii":"restitui","restituim":"restitui","restituind":"restitui","restituira":"restitui","restituiram":"restitui","restituirati":"restitui","restituirea":"restituire","restituiri":"restituire","restituirii":"restituire","restituirile":"restituire","restituirilor":"restituire","restituise":"restitui","restituisem":"restitui","restituisera":"restitui","restituiseram":"restitui","restituiserati":"restitui","restituisesi":"restitui","restituisi":"restitui","restituit":"restitui","restituiti":"restitui","restitul":"restit","restitutia":"restituție","restitutiei":"restituție","restitutii":"restituție","restitutiile":"restituție","restitutiilor":"restituție","restitutiunea":"restituțiune","restitutiuni":"restituțiune","restitutiunii":"restituțiune","restitutiunile":"restituțiune","restitutiunilor":"restituțiune","restitutoarea":"restitutoare","restitutoarei":"restitutoare","restitutoarele":"restitutoare","restitutoarelor":"restitutoare","restitutori":"restitutor","restitutoria":"restitutoriu","restitutorie":"restitutoriu","restitutorii":["restitutorii","restitutor","restitutorii","restitutoriu"],"restitutoriii":"restitutoriu","restitutoriile":"restitutoriu","restitutorilor":"restitutor","restitutoriul":"restitutoriu","restitutorul":"restitutor","restitutorule":"restitutor","restitutorului":"restitutor","restrang":"restrânge","restranga":"restrânge","restrangand":"restrânge","restrangea":"restrânge","restrangeai":"restrânge","restrangeam":"restrânge","restrangeati":"restrânge","restrangeau":"restrânge","restrangem":"restrânge","restrangerea":"restrângere","restrangeri":"restrângere","restrangerii":"restrângere","restrangerile":"restrângere","restrangerilor":"restrângere","restrangeti":"restrânge","restrangi":"restrânge","restrans":"restrânge","restransa":["restrânsă","restrâns","restrânsa","restrâns"],"restranse":["restrânse","restrânge","restrânse","restrâns"],"restransei":"restrânge","restransele":"restrâns","restransera":"restrânge","restranseram":"restrânge","restranserati":"restrânge","restransese":"restrânge","restransesem":"restrânge","restransesera":"restrânge","restranseseram":"restrânge","restranseserati":"restrânge","restransesesi":"restrânge","restransesi":"restrânge","restransi":"restrâns","restransii":"restrâns","restransul":"restrâns","restrictia":"restricție","restrictiei":"restricție","restrictii":"restricție","restrictiile":"restricție","restrictiilor":"restricție","restrictiunea":"restricțiune","restrictiuni":"restricțiune","restrictiunii":"restricțiune","restrictiunile":"restricțiune","restrictiunilor":"restricțiune","restrictiva":["restrictivă","restrictiv","restrictiva","restrictiv"],"restrictive":"restrictiv","restrictivele":"restrictiv","restrictivi":"restrictiv","restrictivii":"restrictiv","restrictivul":"restrictiv","restringenta":["restringentă","restringent","restringenta","restringent"],"restringente":"restringent","restringentele":"restringent","restringenti":"restringent","restringentii":"restringent","restringentul":"restringent","restristea":"restriște","restristi":"restriște","restristii":"restriște","restristile":"restriște","restristilor":"restriște","restructurai":"restructura","restructuram":["restructurăm","restructura","restructuram","restructura"],"restructurand":"restructura","restructurara":"restructura","restructuraram":"restructura","restructurarati":"restructura","restructurarea":"restructurare","restructurari":"restructurare","restructurarii":"restructurare","restructurarile":"restructurare","restructurarilor":"restructurare","restructurase":"restructura","restructurasem":"restructura","restructurasera":"restructura","restructuraseram":"restructura","restructuraserati":"restructura","restructurasesi":"restructura","restructurasi":"restructura","restructurat":"restructura","restructurati":"restructura","restructurau":"restructura","restructureaza":"restructura","restructurez":"restructura","restructurezi":"restructura","restul":"rest","restule":"rest","restuletul":"restuleț","restuletule":"restuleț","restuletului":"restuleț","restuleturi":"restuleț","restuleturile":"restuleț","restuleturilor":"restuleț","restului":"rest","resturi":"rest","resturile":"rest","resturilor":"rest","resuchea":"resuche","resuchi":"resuche","resuchii":"resuche","resuchile":"resuche","resuchilor":"resuche","resume":"resumă","resumei":"resumă","resumele":"resumă","resumelor":"resumă","resurectia":"resurecție","resurectiei":"resurecție","resurectii":"resurecție","resurectiile":"resurecție","resurectiilor":"resurecție","resurectiunea":"resurecțiune","resurectiuni":"resurecțiune","resurectiunii":"resurecțiune","resurectiunile":"resurecțiune","resurectiunilor":"resurecțiune","resurgente":"resurgență","resurgentei":"resurgență","resurgentele":"resurgență","resurgentelor":"resurgență","resurse":"resursă","resurse naturale":"resursă naturală","resursei":"resursă","resursele":"resursă","resurselor":"resursă","resuscitai":"resuscita","resuscitam":["resuscităm","resuscita","resuscitam","resuscita"],"resuscitand":"resuscita","resuscitara":"resuscita","resuscitaram":"resuscita","resuscitarati":"resuscita","resuscitarea":"resuscitare","resuscitari":"resuscitare","resuscitarii":"resuscitare","resuscitarile":"resuscitare","resuscitarilor":"resuscitare","resuscitase":"resuscita","resuscitasem":"resuscita","resuscitasera":"resuscita","resuscitaseram":"resuscita","resuscitaserati":"resuscita","resuscitasesi":"resuscita","resuscitasi":"resuscita","resuscitat":"resuscita","resuscitata":["resuscitată","resuscitat","resuscitata","resuscitat"],"resuscitate":"resuscitat","resuscitatele":"resuscitat","resuscitati":["resuscitați","resuscita","resuscitați","resuscitat"],"resuscitatii":"resuscitat","resuscitatul":"resuscitat","resuscitau":"resuscita","resusciteaza":"resuscita","resuscitez":"resuscita","resuscitezi":"resuscita","resute":"reșută","resutei":"reșută","resutele":"reșută","resutelor":"reșută","resuvenirea":"resuvenire","resuveniri":"resuvenire","resuvenirii":"resuvenire","resuvenirile":"resuvenire","resuvenirilor":"resuvenire","retabacirea":"retăbăcire","retabaciri":"retăbăcire","retabacirii":"retăbăcire","retabacirile":"retăbăcire","retabacirilor":"retăbăcire","retai":"retăia","retaiai":"retăia","retaiam":"retăia","retaiara":"retăia","retaiaram":"retăia","retaiarati":"retăia","retaiase":"retăia","retaiasem":"retăia","retaiasera":"retăia","retaiaseram":"retăia","retaiaserati":"retăia","retaiasesi":"retăia","retaiasi":"retăia","retaiat":"retăia","retaiati":"retăia","retaiau":"retăia","retaie":["retaie","retăia","retăie","retăia"],"retaiem":"retăia","retaind":"retăia","retalmacea":"retălmăci","retalmaceai":"retălmăci","retalmaceam":"retălmăci","retalmaceati":"retălmăci","retalmaceau":"retălmăci","retalmacesc":"retălmăci","retalmaceste":"retălmăci","retalmacesti":"retălmăci","retalmacii":"retălmăci","retalmacim":"retălmăci","retalmacind":"retălmăci","retalmacira":"retălmăci","retalmaciram":"retălmăci","retalmacirati":"retălmăci","retalmacirea":"retălmăcire","retalmaciri":"retălmăcire","retalmacirii":"retălmăcire","retalmacirile":"retălmăcire","retalmacirilor":"retălmăcire","retalmacise":"retălmăci","retalmacisem":"retălmăci","retalmacisera":"retălmăci","retalmaciseram":"retălmăci","retalmaciserati":"retălmăci","retalmacisesi":"retălmăci","retalmacisi":"retălmăci","retalmacit":"retălmăci","retalmacita":["retălmăcită","retălmăcit","retălmăcita","retălmăcit"],"retalmacite":"retălmăcit","retalmacitele":"retălmăcit","retalmaciti":["retălmăciți","retălmăci","retălmăciți","retălmăcit"],"retalmacitii":"retălmăcit","retalmacitul":"retălmăcit","retardai":"retarda","retardam":["retardăm","retarda","retardam","retarda"],"retardand":"retarda","retardara":"retarda","retardaram":"retarda","retardarati":"retarda","retardarea":"retardare","retardari":"retardare","retardarii":"retardare","retardarile":"retardare","retardarilor":"retardare","retardase":"retarda","retardasem":"retarda","retardasera":"retarda","retardaseram":"retarda","retardaserati":"retarda","retardasesi":"retarda","retardasi":"retarda","retardat":"retarda","retardata":["retardată","retardat","retardata","retardat"],"retardatara":["retardatară","retardatar","retardatara","retardatar"],"retardatare":"retardatar","retardatarele":"retardatar","retardatari":"retardatar","retardatarii":"retardatar","retardatarul":"retardatar","retardate":["retardate","retardat","retardate","retardată"],"retardatei":"retardată","retardatele":["retardatele","retardat","retardatele","retardată"],"retardatelor":"retardată","retardati":["retardați","retarda","retardați","retardat"],"retardatia":"retardație","retardatiei":"retardație","retardatii":["retardații","retardat","retardații","retardație"],"retardatiile":"retardație","retardatiilor":"retardație","retardatilor":"retardat","retardatul":"retardat","retardatule":"retardat","retardatului":"retardat","retardau":"retarda","retardeaza":"retarda","retardez":"retarda","retardezi":"retarda","retardul":"retard","retardule":"retard","retardului":"retard","reteaua":"rețea","reteaza":"reteza","retele":["rețele","rețe","rețele","rețea"],"retele neurale":"rețea neurală","retelei":"rețea","retelele":"rețea","retelelor":"rețea","retelor":"rețe","retentia":"retenție","retentiei":"retenție","retentii":"retenție","retentiile":"retenție","retentiilor":"retenție","retentiunea":"retențiune","retentiuni":"retențiune","retentiunii":"retențiune","retentiunile":"retențiune","retentiunilor":"retențiune","retentiva":["retentivă","retentiv","retentiva","retentiv"],"retentive":"retentiv","retentivele":"retentiv","retentivi":"retentiv","retentivii":"retentiv","retentivul":"retentiv","retetare":"rețetar","retetarele":"rețetar","retetarelor":"rețetar","retetarul":"rețetar","retetarule":"rețetar","retetarului":"rețetar","retete":"rețetă","retetei":"rețetă","retetele":"rețetă","retetelor":"rețetă","reteveiase":"reteveiaș","reteveiasele":"reteveiaș","reteveiaselor":"reteveiaș","reteveiasul":"reteveiaș","reteveiasule":"reteveiaș","reteveiasului":"reteveiaș","reteveie":"retevei","reteveiele":"retevei","reteveielor":"retevei","reteveisti":"reteveist","reteveistile":"reteveist","reteveistilor":"reteveist","reteveistul":"reteveist","reteveistule":"reteveist","reteveistului":"reteveist","reteveiul":"retevei","reteveiule":"retevei","reteveiului":"retevei","retez":"reteza","retezai":"reteza","retezam":["retezăm","reteza","retezam","reteza"],"retezand":"reteza","retezara":"reteza","retezaram":"reteza","retezarati":"reteza","retezarea":"retezare","retezari":"retezare","retezarii":"retezare","retezarile":"retezare","retezarilor":"retezare","retezase":"reteza","retezasem":"reteza","retezasera":"reteza","retezaseram":"reteza","retezaserati":"reteza","retezasesi":"reteza","retezasi":"reteza","retezat":"reteza","retezati":"reteza","retezatul":"retezat","retezatule":"retezat","retezatului":"retezat","retezaturi":"retezătură","retezaturii":"retezătură","retezaturile":"retezătură","retezaturilor":"retezătură","retezau":"reteza","reteze":"retez","retezele":"retez","retezelor":"retez","retezi":"reteza","retezul":"retez","retezule":"retez","retezului":"retez","reticenta":["reticentă","reticent","reticenta","reticent"],"reticente":["reticente","reticent","reticențe","reticență"],"reticentei":"reticență","reticentele":["reticentele","reticent","reticențele","reticență"],"reticentelor":"reticență","reticenti":"reticent","reticentii":"reticent","reticentul":"reticent","reticulara":["reticulară","reticular","reticulara","reticular"],"reticulare":"reticular","reticularele":"reticular","reticulari":"reticular","reticularii":"reticular","reticularul":"reticular","reticulata":["reticulată","reticulat","reticulata","reticulat"],"reticulate":"reticulat","reticulatele":"reticulat","reticulati":"reticulat","reticulatii":"reticulat","reticulatul":"reticulat","reticule":"reticul","reticulele":"reticul","reticulelor":"reticul","reticuline":"reticulină","reticulinei":"reticulină","reticulinele":"reticulină","reticulinelor":"reticulină","reticulite":"reticulită","reticulitei":"reticulită","reticulitele":"reticulită","reticulitelor":"reticulită","reticulocite":"reticulocit","reticulocitele":"reticulocit","reticulocitelor":"reticulocit","reticulocitoze":"reticulocitoză","reticulocitozei":"reticulocitoză","reticulocitozele":"reticulocitoză","reticulocitozelor":"reticulocitoză","reticulocitul":"reticulocit","reticulocitule":"reticulocit","reticulocitului":"reticulocit","reticulopatia":"reticulopatie","reticulopatiei":"reticulopatie","reticulopatii":"reticulopatie","reticulopatiile":"reticulopatie","reticulopatiilor":"reticulopatie","reticuloze":"reticuloză","reticulozei":"reticuloză","reticulozele":"reticuloză","reticulozelor":"reticuloză","reticulul":"reticul","reticulule":"reticul","reticulului":"reticul","retii":"reține","retin":"reține","retina":["rețină","reține","rețină","ricină"],"retinand":"reține","retine":["retine","retină","reține","rețină"],"retinea":"reține","retineai":"reține","retineam":"reține","retineati":"reține","retineau":"reține","retinei":"retină","retinele":"retină","retinelor":"retină","retinem":"reține","retinerea":"reținere","retineri":"reținere","retinerii":"reținere","retinerile":"reținere","retinerilor":"reținere","retineti":"reține","retiniana":["retiniană","retinian","retiniana","retinian"],"retinianul":"retinian","retiniene":"retinian","retinienele":"retinian","retinieni":"retinian","retinienii":"retinian","retinite":"retinită","retinitei":"retinită","retinitele":"retinită","retinitelor":"retinită","retinopatia":"retinopatie","retinopatiei":"retinopatie","retinopatii":"retinopatie","retinopatiile":"retinopatie","retinopatiilor":"retinopatie","retinu":"reține","retinui":"reține","retinura":"reține","retinuram":"reține","retinurati":"reține","retinuse":"reține","retinusem":"reține","retinusera":"reține","retinuseram":"reține","retinuserati":"reține","retinusesi":"reține","retinusi":"reține","retinut":"reține","retinuta":["reținută","reținut","reținuta","reținut"],"retinute":"reținut","retinutele":"reținut","retinuti":"reținut","retinutii":"reținut","retinutul":"reținut","retiparea":"retipări","retipareai":"retipări","retipaream":"retipări","retipareati":"retipări","retipareau":"retipări","retiparesc":"retipări","retipareste":"retipări","retiparesti":"retipări","retiparii":"retipări","retiparim":"retipări","retiparind":"retipări","retiparira":"retipări","retipariram":"retipări","retiparirati":"retipări","retiparirea":"retipărire","retipariri":"retipărire","retiparirii":"retipărire","retiparirile":"retipărire","retiparirilor":"retipărire","retiparise":"retipări","retiparisem":"retipări","retiparisera":"retipări","retipariseram":"retipări","retipariserati":"retipări","retiparisesi":"retipări","retiparisi":"retipări","retiparit":"retipări","retiparita":["retipărită","retipărit","retipărita","retipărit"],"retiparite":"retipărit","retiparitele":"retipărit","retipariti":["retipăriți","retipări","retipăriți","retipărit"],"retiparitii":"retipărit","retiparitul":"retipărit","retirade":"retiradă","retiradei":"retiradă","retiradele":"retiradă","retiradelor":"retiradă","retiva":["retivă","retiv","retiva","retiv"],"retive":"retiv","retivele":"retiv","retivi":"retiv","retivii":"retiv","retivitatea":"retivitate","retivitati":"retivitate","retivitatii":"retivitate","retivul":"retiv","retopea":"retopi","retopeai":"retopi","retopeam":"retopi","retopeati":"retopi","retopeau":"retopi","retopesc":"retopi","retopeste":"retopi","retopesti":"retopi","retopii":"retopi","retopim":"retopi","retopind":"retopi","retopira":"retopi","retopiram":"retopi","retopirati":"retopi","retopirea":"retopire","retopiri":"retopire","retopirii":"retopire","retopirile":"retopire","retopirilor":"retopire","retopise":"retopi","retopisem":"retopi","retopisera":"retopi","retopiseram":"retopi","retopiserati":"retopi","retopisesi":"retopi","retopisi":"retopi","retopit":"retopi","retopita":["retopită","retopit","retopita","retopit"],"retopite":"retopit","retopitele":"retopit","retopiti":["retopiți","retopi","retopiți","retopit"],"retopitii":"retopit","retopitul":"retopit","retori":"retor","retorica":["retorică","retoric","retorica","retoric"],"retorice":["retorice","retoric","retorice","retorică"],"retoriceasca":["retoricească","retoricesc","retoriceasca","retoricesc"],"retoricei":"retorică","retoricele":"retoric","retoricescul":"retoricesc","retoricesti":"retoricesc","retoricestii":"retoricesc","retoricestile":"retoricesc","retorici":"retoric","retoricii":"retoric","retoricul":"retoric","retorii":"retor","retorilor":"retor","retorismul":"retorism","retorismule":"retorism","retorismului":"retorism","retoromane":"retoromană","retoromanei":"retoromană","retoromanele":"retoromană","retoromanelor":"retoromană","retoromani":"retoroman","retoromanii":"retoroman","retoromanilor":"retoroman","retoromanul":"retoroman","retoromanule":"retoroman","retoromanului":"retoroman","retorsiunea":"retorsiune","retorsiuni":"retorsiune","retorsiunii":"retorsiune","retorsiunile":"retorsiune","retorsiunilor":"retorsiune","retorte":"retortă","retortei":"retortă","retortele":"retortă","retortelor":"retortă","retorul":"retor","retorule":"retor","retorului":"retor","retractabila":["retractabilă","retractabil","retractabila","retractabil"],"retractabile":"retractabil","retractabilele":"retractabil","retractabili":"retractabil","retractabilii":"retractabil","retractabilul":"retractabil","retractai":"retracta","retractam":["retractăm","retracta","retractam","retracta"],"retractand":"retracta","retractara":"retracta","retractaram":"retracta","retractarati":"retracta","retractarea":"retractare","retractari":"retractare","retractarii":"retractare","retractarile":"retractare","retractarilor":"retractare","retractase":"retracta","retractasem":"retracta","retractasera":"retracta","retractaseram":"retracta","retractaserati":"retracta","retractasesi":"retracta","retractasi":"retracta","retractat":"retracta","retractati":"retracta","retractau":"retracta","retracteaza":"retracta","retractez":"retracta","retractezi":"retracta","retractia":"retracție","retractiei":"retracție","retractii":"retracție","retractiile":"retracție","retractiilor":"retracție","retractila":["retractilă","retractil","retractila","retractil"],"retractile":"retractil","retractilele":"retractil","retractili":"retractil","retractilii":"retractil","retractilitatea":"retractilitate","retractilitati":"retractilitate","retractilitatii":"retractilitate","retractilitatile":"retractilitate","retractilitatilor":"retractilitate","retractilul":"retractil","retractiunea":"retracțiune","retractiuni":"retracțiune","retractiunii":"retracțiune","retractiunile":"retracțiune","retractiunilor":"retracțiune","retraduc":"retraduce","retraduca":"retraduce","retraducand":"retraduce","retraducea":"retraduce","retraduceai":"retraduce","retraduceam":"retraduce","retraduceati":"retraduce","retraduceau":"retraduce","retraducem":"retraduce","retraducerea":"retraducere","retraduceri":"retraducere","retraducerii":"retraducere","retraducerile":"retraducere","retraducerilor":"retraducere","retraduceti":"retraduce","retraduci":"retraduce","retradus":"retraduce","retradusa":["retradusă","retradus","retradusa","retradus"],"retraduse":["retraduse","retraduce","retraduse","retradus"],"retradusei":"retraduce","retradusele":"retradus","retradusera":"retraduce","retraduseram":"retraduce","retraduserati":"retraduce","retradusese":"retraduce","retradusesem":"retraduce","retradusesera":"retraduce","retraduseseram":"retraduce","retraduseserati":"retraduce","retradusesesi":"retraduce","retradusesi":"retraduce","retradusi":"retradus","retradusii":"retradus","retradusul":"retradus","retrag":"retrage","retraga":"retrage","retragand":"retrage","retragea":"retrage","retrageai":"retrage","retrageam":"retrage","retrageati":"retrage","retrageau":"retrage","retragem":"retrage","retragerea":"retragere","retrageri":"retragere","retragerii":"retragere","retragerile":"retragere","retragerilor":"retragere","retrageti":"retrage","retragi":"retrage","retraia":"retrăi","retraiai":"retrăi","retraiam":"retrăi","retraiati":"retrăi","retraiau":"retrăi","retraiesc":"retrăi","retraieste":"retrăi","retraiesti":"retrăi","retraii":"retrăi","retraim":"retrăi","retraind":"retrăi","retraira":"retrăi","retrairam":"retrăi","retrairati":"retrăi","retrairea":"retrăire","retrairi":"retrăire","retrairii":"retrăire","retrairile":"retrăire","retrairilor":"retrăire","retraise":"retrăi","retraisem":"retrăi","retraisera":"retrăi","retraiseram":"retrăi","retraiserati":"retrăi","retraisesi":"retrăi","retraisi":"retrăi","retrait":"retrăi","retraiti":"retrăi","retransamente":"retranșament","retransamentele":"retranșament","retransamentelor":"retranșament","retransamentul":"retranșament","retransamentule":"retranșament","retransamentului":"retranșament","retranscria":"retranscrie","retranscriai":"retranscrie","retranscriam":"retranscrie","retranscriati":"retranscrie","retranscriau":"retranscrie","retranscriem":"retranscrie","retranscrierea":"retranscriere","retranscrieri":"retranscriere","retranscrierii":"retranscriere","retranscrierile":"retranscriere","retranscrierilor":"retranscriere","retranscrieti":"retranscrie","retranscrii":"retranscrie","retranscriind":"retranscrie","retranscris":"retranscrie","retranscrisa":["retranscrisă","retranscris","retranscrisa","retranscris"],"retranscrise":"retranscris","retranscrisele":"retranscris","retranscrisi":"retranscris","retranscrisii":"retranscris","retranscrisul":"retranscris","retranscrse":"retranscrie","retranscrsei":"retranscrie","retranscrsera":"retranscrie","retranscrseram":"retranscrie","retranscrserati":"retranscrie","retranscrsese":"retranscrie","retranscrsesem":"retranscrie","retranscrsesera":"retranscrie","retranscrseseram":"retranscrie","retranscrseserati":"retranscrie","retranscrsesesi":"retranscrie","retranscrsesi":"retranscrie","retransmis":"retransmite","retransmise":"retransmite","retransmisei":"retransmite","retransmisera":"retransmite","retransmiseram":"retransmite","retransmiserati":"retransmite","retransmisese":"retransmite","retransmisesem":"retransmite","retransmisesera":"retransmite","retransmiseseram":"retransmite","retransmiseserati":"retransmite","retransmisesesi":"retransmite","retransmisesi":"retransmite","retransmisia":"retransmisie","retransmisiei":"retransmisie","retransmisii":"retransmisie","retransmisiile":"retransmisie","retransmisiilor":"retransmisie","retransmisiunea":"retransmisiune","retransmisiuni":"retransmisiune","retransmisiunii":"retransmisiune","retransmisiunile":"retransmisiune","retransmisiunilor":"retransmisiune","retransmit":"retransmite","retransmita":"retransmite","retransmitand":"retransmite","retransmitea":"retransmite","retransmiteai":"retransmite","retransmiteam":"retransmite","retransmiteati":"retransmite","retransmiteau":"retransmite","retransmitem":"retransmite","retransmiterea":"retransmitere","retransmiteri":"retransmitere","retransmiterii":"retransmitere","retransmiterile":"retransmitere","retransmiterilor":"retransmitere","retransmiteti":"retransmite","retransmiti":"retransmite","retras":"retrage","retrasa":["retrasă","retras","retrasa","retras"],"retrase":["retrase","retrage","retrase","retras"],"retrasei":"retrage","retrasele":"retras","retrasera":"retrage","retraseram":"retrage","retraserati":"retrage","retrasese":"retrage","retrasesem":"retrage","retrasesera":"retrage","retraseseram":"retrage","retraseserati":"retrage","retrasesesi":"retrage","retrasesi":"retrage","retrasi":"retras","retrasii":"retras","retrasul":"retras","retratarea":"retratare","retratari":"retratare","retratarii":"retratare","retratarile":"retratare","retratarilor":"retratare","retrete":"retretă","retretei":"retretă","retretele":"retretă","retretelor":"retretă","retribuia":"retribui","retribuiai":"retribui","retribuiam":"retribui","retribuiati":"retribui","retribuiau":"retribui","retribuie":"retribui","retribuii":"retribui","retribuim":"retribui","retribuind":"retribui","retribuira":"retribui","retribuiram":"retribui","retribuirati":"retribui","retribuirea":"retribuire","retribuiri":"retribuire","retribuirii":"retribuire","retribuirile":"retribuire","retribuirilor":"retribuire","retribuise":"retribui","retribuisem":"retribui","retribuisera":"retribui","retribuiseram":"retribui","retribuiserati":"retribui","retribuisesi":"retribui","retribuisi":"retribui","retribuit":"retribui","retribuita":["retribuită","retribuit","retribuita","retribuit"],"retribuite":"retribuit","retribuitele":"retribuit","retribuiti":["retribuiți","retribui","retribuiți","retribuit"],"retribuitii":"retribuit","retribuitul":"retribuit","retributia":"retribuție","retributiei":"retribuție","retributii":"retribuție","retributiile":"retribuție","retributiilor":"retribuție","retributiunea":"retribuțiune","retributiuni":"retribuțiune","retributiunii":"retribuțiune","retributiunile":"retribuțiune","retributiunilor":"retribuțiune","retrimis":"retrimite","retrimise":"retrimite","retrimisei":"retrimite","retrimisera":"retrimite","retrimiseram":"retrimite","retrimiserati":"retrimite","retrimisese":"retrimite","retrimisesem":"retrimite","retrimisesera":"retrimite","retrimiseseram":"retrimite","retrimiseserati":"retrimite","retrimisesesi":"retrimite","retrimisesi":"retrimite","retrimit":"retrimite","retrimita":"retrimite","retrimitand":"retrimite","retrimitea":"retrimite","retrimiteai":"retrimite","retrimiteam":"retrimite","retrimiteati":"retrimite","retrimiteau":"retrimite","retrimitem":"retrimite","retrimiterea":"retrimitere","retrimiteri":"retrimitere","retrimiterii":"retrimitere","retrimiterile":"retrimitere","retrimiterilor":"retrimitere","retrimiteti":"retrimite","retrimiti":"retrimite","retroactia":"retroacție","retroactiei":"retroacție","retroactii":"retroacție","retroactiile":"retroacție","retroactiilor":"retroacție","retroactiunea":"retroacțiune","retroactiuni":"retroacțiune","retroactiunii":"retroacțiune","retroactiva":["retroactivă","retroactiv","retroactiva","retroactiv"],"retroactive":"retroactiv","retroactivele":"retroactiv","retroactivi":"retroactiv","retroactivii":"retroactiv","retroactivitatea":"retroactivitate","retroactivitati":"retroactivitate","retroactivitatii":"retroactivitate","retroactivitatile":"retroactivitate","retroactivitatilor":"retroactivitate","retroactivul":"retroactiv","retrocedai":"retroceda","retrocedam":["retrocedăm","retroceda","retrocedam","retroceda"],"retrocedand":"retroceda","retrocedante":"retrocedantă","retrocedantei":"retrocedantă","retrocedantele":"retrocedantă","retrocedantelor":"retrocedantă","retrocedara":"retroceda","retrocedaram":"retroceda","retrocedarati":"retroceda","retrocedarea":"retrocedare","retrocedari":"retrocedare","retrocedarii":"retrocedare","retrocedarile":"retrocedare","retrocedarilor":"retrocedare","retrocedase":"retroceda","retrocedasem":"retroceda","retrocedasera":"retroceda","retrocedaseram":"retroceda","retrocedaserati":"retroceda","retrocedasesi":"retroceda","retrocedasi":"retroceda","retrocedat":"retroceda","retrocedata":["retrocedată","retrocedat","retrocedata","retrocedat"],"retrocedate":"retrocedat","retrocedatele":"retrocedat","retrocedati":["retrocedați","retroceda","retrocedați","retrocedat"],"retrocedatii":"retrocedat","retrocedatul":"retrocedat","retrocedau":"retroceda","retrocedeaza":"retroceda","retrocedez":"retroceda","retrocedezi":"retroceda","retrocesiunea":"retrocesiune","retrocesiuni":"retrocesiune","retrocesiunii":"retrocesiune","retrocesiunile":"retrocesiune","retrocesiunilor":"retrocesiune","retrocesiva":["retrocesivă","retrocesiv","retrocesiva","retrocesiv"],"retrocesive":"retrocesiv","retrocesivele":"retrocesiv","retrocesivi":"retrocesiv","retrocesivii":"retrocesiv","retrocesivul":"retrocesiv","retrocompatibilitatea":"retrocompatibilitate","retrocompatibilitati":"retrocompatibilitate","retrocompatibilitatii":"retrocompatibilitate","retrocompatibilitatile":"retrocompatibilitate","retrocompatibilitatilor":"retrocompatibilitate","retroflexia":"retroflexie","retroflexiei":"retroflexie","retroflexii":"retroflexie","retroflexiile":"retroflexie","retroflexiilor":"retroflexie","retrofuzeea":"retrofuzee","retrofuzeei":"retrofuzee","retrofuzeele":"retrofuzee","retrofuzeelor":"retrofuzee","retrognatismul":"retrognatism","retrognatismule":"retrognatism","retrognatismului":"retrognatism","retrograda":["retrogradă","retrograd","retrograda","retrograd"],"retrogradai":"retrograda","retrogradam":["retrogradăm","retrograda","retrogradam","retrograda"],"retrogradand":"retrograda","retrogradara":"retrograda","retrogradaram":"retrograda","retrogradarati":"retrograda","retrogradarea":"retrogradare","retrogradari":"retrogradare","retrogradarii":"retrogradare","retrogradarile":"retrogradare","retrogradarilor":"retrogradare","retrogradase":"retrograda","retrogradasem":"retrograda","retrogradasera":"retrograda","retrogradaseram":"retrograda","retrogradaserati":"retrograda","retrogradasesi":"retrograda","retrogradasi":"retrograda","retrogradat":"retrograda","retrogradati":"retrograda","retrogradatia":"retrogradație","retrogradatiei":"retrogradație","retrogradatii":"retrogradație","retrogradatiile":"retrogradație","retrogradatiilor":"retrogradație","retrogradatiunea":"retrogradațiune","retrogradatiuni":"retrogradațiune","retrogradatiunii":"retrogradațiune","retrogradatiunile":"retrogradațiune","retrogradatiunilor":"retrogradațiune","retrogradau":"retrograda","retrograde":"retrograd","retrogradeaza":"retrograda","retrogradele":"retrograd","retrogradez":"retrograda","retrogradezi":"retrograda","retrogradul":"retrograd","retrograzi":"retrograd","retrograzii":"retrograd","retrogresiunea":"retrogresiune","retrogresiuni":"retrogresiune","retrogresiunii":"retrogresiune","retrogresiunile":"retrogresiune","retrogresiunilor":"retrogresiune","retrogresiva":["retrogresivă","retrogresiv","retrogresiva","retrogresiv"],"retrogresive":"retrogresiv","retrogresivele":"retrogresiv","retrogresivi":"retrogresiv","retrogresivii":"retrogresiv","retrogresivul":"retrogresiv","retroguardia":"retroguardie","retroguardiei":"retroguardie","retroguardii":"retroguardie","retroguardiile":"retroguardie","retroguardiilor":"retroguardie","retropozitia":"retropoziție","retropozitiei":"retropoziție","retropozitii":"retropoziție","retropozitiile":"retropoziție","retropozitiilor":"retropoziție","retroproiectia":"retroproiecție","retroproiectiei":"retroproiecție","retroproiectii":"retroproiecție","retroproiectiile":"retroproiecție","retroproiectiilor":"retroproiecție","retroproiectoare":"retroproiector","retroproiectoarele":"retroproiector","retroproiectoarelor":"retroproiector","retroproiectorul":"retroproiector","retroproiectorule":"retroproiector","retroproiectorului":"retroproiector","retropropulsia":"retropropulsie","retropropulsiei":"retropropulsie","retropropulsii":"retropropulsie","retropropulsiile":"retropropulsie","retropropulsiilor":"retropropulsie","retropulsia":"retropulsie","retropulsiei":"retropulsie","retropulsii":"retropulsie","retropulsiile":"retropulsie","retropulsiilor":"retropulsie","retrospectia":"retrospecție","retrospectiei":"retrospecție","retrospectii":"retrospecție","retrospectiile":"retrospecție","retrospectiilor":"retrospecție","retrospectiunea":"retrospecțiune","retrospectiuni":"retrospecțiune","retrospectiunii":"retrospecțiune","retrospectiunile":"retrospecțiune","retrospectiunilor":"retrospecțiune","retrospectiva":["retrospectivă","retrospectiv","retrospectiva","retrospectiv"],"retrospective":["retrospective","retrospectiv","retrospective","retrospectivă"],"retrospectivei":"retrospectivă","retrospectivele":["retrospectivele","retrospectiv","retrospectivele","retrospectivă"],"retrospectivelor":"retrospectivă","retrospectivi":"retrospectiv","retrospectivii":"retrospectiv","retrospectivul":"retrospectiv","retrosternala":["retrosternală","retrosternal","retrosternala","retrosternal"],"retrosternale":"retrosternal","retrosternalele":"retrosternal","retrosternali":"retrosternal","retrosternalii":"retrosternal","retrosternalul":"retrosternal","retroversa":["retroversă","retrovers","retroversa","retrovers"],"retroverse":"retrovers","retroversele":"retrovers","retroversi":"retrovers","retroversia":"retroversie","retroversiei":"retroversie","retroversii":["retroverșii","retrovers","retroversii","retroversie"],"retroversiile":"retroversie","retroversiilor":"retroversie","retroversiunea":"retroversiune","retroversiuni":"retroversiune","retroversiunii":"retroversiune","retroversiunile":"retroversiune","retroversiunilor":"retroversiune","retroversul":"retrovers","retrovirusul":"retrovirus","retrovirusule":"retrovirus","retrovirusului":"retrovirus","retrovirusuri":"retrovirus","retrovirusurile":"retrovirus","retrovirusurilor":"retrovirus","retrovizoare":"retrovizor","retrovizoarele":"retrovizor","retrovizoarelor":"retrovizor","retrovizorul":"retrovizor","retrovizorule":"retrovizor","retrovizorului":"retrovizor","returnai":"returna","returnam":["returnăm","returna","returnam","returna"],"returnand":"returna","returnara":"returna","returnaram":"returna","returnarati":"returna","returnarea":"returnare","returnari":"returnare","returnarii":"returnare","returnarile":"returnare","returnarilor":"returnare","returnase":"returna","returnasem":"returna","returnasera":"returna","returnaseram":"returna","returnaserati":"returna","returnasesi":"returna","returnasi":"returna","returnat":"returna","returnata":["returnată","returnat","returnata","returnat"],"returnate":"returnat","returnatele":"returnat","returnati":["returnați","returna","returnați","returnat"],"returnatii":"returnat","returnatul":"returnat","returnau":"returna","returneaza":"returna","returnez":"returna","returnezi":"returna","returul":"retur","returule":"retur","returului":"retur","retururi":"retur","retururile":"retur","retururilor":"retur","retusai":"retușa","retusam":["retușăm","retușa","retușam","retușa"],"retusand":"retușa","retusara":"retușa","retusaram":"retușa","retusarati":"retușa","retusarea":"retușare","retusari":"retușare","retusarii":"retușare","retusarile":"retușare","retusarilor":"retușare","retusase":"retușa","retusasem":"retușa","retusasera":"retușa","retusaseram":"retușa","retusaserati":"retușa","retusasesi":"retușa","retusasi":"retușa","retusat":"retușa","retusati":"retușa","retusau":"retușa","retuseaza":"retușa","retusez":"retușa","retusezi":"retușa","retusoarea":"retușoare","retusoarei":"retușoare","retusoarele":"retușoare","retusoarelor":"retușoare","retusori":"retușor","retusorii":"retușor","retusorilor":"retușor","retusorul":"retușor","retusorule":"retușor","retusorului":"retușor","retusul":"retuș","retusule":"retuș","retusului":"retuș","retusuri":"retuș","retusurile":"retuș","retusurilor":"retuș","reul":"re","reule":"re","reului":"re","reumatica":["reumatică","reumatic","reumatica","reumatic"],"reumatice":"reumatic","reumaticeasca":["reumaticească","reumaticesc","reumaticeasca","reumaticesc"],"reumaticele":"reumatic","reumaticescul":"reumaticesc","reumaticesti":"reumaticesc","reumaticestii":"reumaticesc","reumaticestile":"reumaticesc","reumatici":"reumatic","reumaticii":"reumatic","reumaticul":"reumatic","reumatismala":["reumatismală","reumatismal","reumatismala","reumatismal"],"reumatismale":"reumatismal","reumatismalele":"reumatismal","reumatismali":"reumatismal","reumatismalii":"reumatismal","reumatismalul":"reumatismal","reumatismatica":["reumatismatică","reumatismatic","reumatismatica","reumatismatic"],"reumatismatice":"reumatismatic","reumatismaticele":"reumatismatic","reumatismatici":"reumatismatic","reumatismaticii":"reumatismatic","reumatismaticul":"reumatismatic","reumatisme":"reumatism","reumatismele":"reumatism","reumatismelor":"reumatism","reumatismul":"reumatism","reumatismule":"reumatism","reumatismului":"reumatism","reumatologe":"reumatologă","reumatologei":"reumatologă","reumatologele":"reumatologă","reumatologelor":"reumatologă","reumatologi":"reumatolog","reumatologia":"reumatologie","reumatologica":["reumatologică","reumatologic","reumatologica","reumatologic"],"reumatologice":"reumatologic","reumatologicele":"reumatologic","reumatologici":"reumatologic","reumatologicii":"reumatologic","reumatologicul":"reumatologic","reumatologiei":"reumatologie","reumatologii":["reumatologii","reumatolog","reumatologii","reumatologie"],"reumatologilor":"reumatolog","reumatologul":"reumatolog","reumatologule":"reumatolog","reumatologului":"reumatolog","reume":"reumă","reumei":"reumă","reumele":"reumă","reumelor":"reumă","reumflai":"reumfla","reumflam":["reumflăm","reumfla","reumflam","reumfla"],"reumfland":"reumfla","reumflara":"reumfla","reumflaram":"reumfla","reumflarati":"reumfla","reumflase":"reumfla","reumflasem":"reumfla","reumflasera":"reumfla","reumflaseram":"reumfla","reumflaserati":"reumfla","reumflasesi":"reumfla","reumflasi":"reumfla","reumflat":"reumfla","reumflati":"reumfla","reumflau":"reumfla","reumfli":"reumfla","reumflu":"reumfla","reumpland":"reumple","reumplea":"reumple","reumpleai":"reumple","reumpleam":"reumple","reumpleati":"reumple","reumpleau":"reumple","reumplem":"reumple","reumpleti":"reumple","reumpli":"reumple","reumplu":"reumple","reumplui":"reumple","reumplura":"reumple","reumpluram":"reumple","reumplurati":"reumple","reumpluse":"reumple","reumplusem":"reumple","reumplusera":"reumple","reumpluseram":"reumple","reumpluserati":"reumple","reumplusesi":"reumple","reumplusi":"reumple","reumplut":"reumple","reunea":"reuni","reuneai":"reuni","reuneam":"reuni","reuneati":"reuni","reuneau":"reuni","reunesc":"reuni","reuneste":"reuni","reunesti":"reuni","reunific":"reunifica","reunificai":"reunifica","reunificam":["reunificăm","reunifica","reunificam","reunifica"],"reunificand":"reunifica","reunificara":"reunifica","reunificaram":"reunifica","reunificarati":"reunifica","reunificarea":"reunificare","reunificari":"reunificare","reunificarii":"reunificare","reunificarile":"reunificare","reunificarilor":"reunificare","reunificase":"reunifica","reunificasem":"reunifica","reunificasera":"reunifica","reunificaseram":"reunifica","reunificaserati":"reunifica","reunificasesi":"reunifica","reunificasi":"reunifica","reunificat":"reunifica","reunificata":["reunificată","reunificat","reunificata","reunificat"],"reunificate":"reunificat","reunificatele":"reunificat","reunificati":["reunificați","reunifica","reunificați","reunificat"],"reunificatii":"reunificat","reunificatul":"reunificat","reunificau":"reunifica","reunifici":"reunifica","reunii":"reuni","reunim":"reuni","reunind":"reuni","reunira":"reuni","reuniram":"reuni","reunirati":"reuni","reunirea":"reunire","reuniri":"reunire","reunirii":"reunire","reunirile":"reunire","reunirilor":"reunire","reunise":"reuni","reunisem":"reuni","reunisera":"reuni","reuniseram":"reuni","reuniserati":"reuni","reunisesi":"reuni","reunisi":"reuni","reunit":"reuni","reuniti":"reuni","reuniunea":"reuniune","reuniunei":"reuniune","reuniunele":"reuniune","reuniunelor":"reuniune","reuniuni":"reuniune","reuniuni de familie":"reuniune de familie","reusa":"reuși","reusea":"reuși","reuseai":"reuși","reuseam":"reuși","reuseati":"reuși","reuseau":"reuși","reusesc":"reuși","reuseste":"reuși","reusesti":"reuși","reusii":"reuși","reusim":"reuși","reusind":"reuși","reusira":"reuși","reusiram":"reuși","reusirati":"reuși","reusirea":"reușire","reusiri":"reușire","reusirii":"reușire","reusirile":"reușire","reusirilor":"reușire","reusise":"reuși","reusisem":"reuși","reusisera":"reuși","reusiseram":"reuși","reusiserati":"reuși","reusisesi":"reuși","reusisi":"reuși","reusit":"reuși","reusita":["reușită","reușit","reușita","reușit"],"reusite":["reușite","reușit","reușite","reușită"],"reusitei":"reușită","reusitele":["reușitele","reușit","reușitele","reușită"],"reusitelor":"reușită","reusiti":["reușiți","reuși","reușiți","reușit"],"reusitii":"reușit","reusitul":"reușit","reutatea":"reutate","reutati":"reutate","reutatii":"reutate","reutatile":"reutate","reutatilor":"reutate","reutilai":"reutila","reutilam":["reutilăm","reutila","reutilam","reutila"],"reutiland":"reutila","reutilara":"reutila","reutilaram":"reutila","reutilarati":"reutila","reutilarea":"reutilare","reutilari":"reutilare","reutilarii":"reutilare","reutilarile":"reutilare","reutilarilor":"reutilare","reutilase":"reutila","reutilasem":"reutila","reutilasera":"reutila","reutilaseram":"reutila","reutilaserati":"reutila","reutilasesi":"reutila","reutilasi":"reutila","reutilat":"reutila","reutilati":"reutila","reutilau":"reutila","reutileaza":"reutila","reutilez":"reutila","reutilezi":"reutila","revaccinai":"revaccina","revaccinam":["revaccinăm","revaccina","revaccinam","revaccina"],"revaccinand":"revaccina","revaccinara":"revaccina","revaccinaram":"revaccina","revaccinarati":"revaccina","revaccinarea":"revaccinare","revaccinari":"revaccinare","revaccinarii":"revaccinare","revaccinarile":"revaccinare","revaccinarilor":"revaccinare","revaccinase":"revaccina","revaccinasem":"revaccina","revaccinasera":"revaccina","revaccinaseram":"revaccina","revaccinaserati":"revaccina","revaccinasesi":"revaccina","revaccinasi":"revaccina","revaccinat":"revaccina","revaccinati":"revaccina","revaccinau":"revaccina","revaccineaza":"revaccina","revaccinez":"revaccina","revaccinezi":"revaccina","revad":"revedea","revada":"revedea","revalidai":"revalida","revalidam":["revalidăm","revalida","revalidam","revalida"],"revalidand":"revalida","revalidara":"revalida","revalidaram":"revalida","revalidarati":"revalida","revalidarea":"revalidare","revalidari":"revalidare","revalidarii":"revalidare","revalidarile":"revalidare","revalidarilor":"revalidare","revalidase":"revalida","revalidasem":"revalida","revalidasera":"revalida","revalidaseram":"revalida","revalidaserati":"revalida","revalidasesi":"revalida","revalidasi":"revalida","revalidat":"revalida","revalidati":"revalida","revalidau":"revalida","revalideaza":"revalida","revalidez":"revalida","revalidezi":"revalida","revalorificarea":"revalorificare","revalorificari":"revalorificare","revalorificarii":"revalorificare","revalorificarile":"revalorificare","revalorificarilor":"revalorificare","revalorizai":"revaloriza","revalorizam":["revalorizăm","revaloriza","revalorizam","revaloriza"],"revalorizand":"revaloriza","revalorizara":"revaloriza","revalorizaram":"revaloriza","revalorizarati":"revaloriza","revalorizarea":"revalorizare","revalorizari":"revalorizare","revalorizarii":"revalorizare","revalorizarile":"revalorizare","revalorizarilor":"revalorizare","revalorizase":"revaloriza","revalorizasem":"revaloriza","revalorizasera":"revaloriza","revalorizaseram":"revaloriza","revalorizaserati":"revaloriza","revalorizasesi":"revaloriza","revalorizasi":"revaloriza","revalorizat":"revaloriza","revalorizati":"revaloriza","revalorizau":"revaloriza","revalorizeaza":"revaloriza","revalorizez":"revaloriza","revalorizezi":"revaloriza","revanda":"revinde","revandut":"revinde","revansai":"revanșa","revansam":["revanșăm","revanșa","revanșam","revanșa"],"revansand":"revanșa","revansara":"revanșa","revansaram":"revanșa","revansarati":"revanșa","revansarde":"revanșardă","revansardei":"revanșardă","revansardele":"revanșardă","revansardelor":"revanșardă","revansardul":"revanșard","revansardule":"revanșard","revansardului":"revanșard","revansarzi":"revanșard","revansarzii":"revanșard","revansarzilor":"revanșard","revansase":"revanșa","revansasem":"revanșa","revansasera":"revanșa","revansaseram":"revanșa","revansaserati":"revanșa","revansasesi":"revanșa","revansasi":"revanșa","revansat":"revanșa","revansati":"revanșa","revansau":"revanșa","revanse":"revanșă","revanseaza":"revanșa","revansez":"revanșa","revansezi":"revanșa","revansisme":"revanșism","revansismele":"revanșism","revansismelor":"revanșism","revansismul":"revanșism","revansismule":"revanșism","revansismului":"revanșism","revansiste":"revanșistă","revansistei":"revanșistă","revansistele":"revanșistă","revansistelor":"revanșistă","revanul":"revan","revanule":"revan","revanului":"revan","revanuri":"revan","revanurile":"revan","revanurilor":"revan","revars":"revărsa","revarsai":"revărsa","revarsam":["revărsăm","revărsa","revărsam","revărsa"],"revarsand":"revărsa","revarsara":"revărsa","revarsaram":"revărsa","revarsarati":"revărsa","revarsarea":"revărsare","revarsari":"revărsare","revarsarii":"revărsare","revarsarile":"revărsare","revarsarilor":"revărsare","revarsase":"revărsa","revarsasem":"revărsa","revarsasera":"revărsa","revarsaseram":"revărsa","revarsaserati":"revărsa","revarsasesi":"revărsa","revarsasi":"revărsa","revarsat":"revărsa","revarsata":["revărsată","revărsat","revărsata","revărsat"],"revarsate":"revărsat","revarsatele":"revărsat","revarsati":["revărsați","revărsa","revărsați","revărsat"],"revarsatii":"revărsat","revarsatul":"revărsat","revarsaturi":"revărsătură","revarsaturii":"revărsătură","revarsaturile":"revărsătură","revarsaturilor":"revărsătură","revarsau":"revărsa","revazand":"revedea","revazu":"revedea","revazui":"revedea","revazura":"revedea","revazuram":"revedea","revazurati":"revedea","revazuse":"revedea","revazusem":"revedea","revazusera":"revedea","revazuseram":"revedea","revazuserati":"revedea","revazusesi":"revedea","revazusi":"revedea","revazut":"revedea","revazuta":["revăzută","revăzut","revăzuta","revăzut"],"revazute":"revăzut","revazutele":"revăzut","revazuti":"revăzut","revazutii":"revăzut","revazutul":"revăzut","revede":"revedea","revedeai":"revedea","revedeam":"revedea","revedeati":"revedea","revedeau":"revedea","revedem":"revedea","revederea":"revedere","revederi":"revedere","revederii":"revedere","revederile":"revedere","revederilor":"revedere","revedeti":"revedea","reveioane":"reveion","reveioanele":"reveion","reveioanelor":"reveion","reveion":"revelion","reveionul":"reveion","reveionule":"reveion","reveionului":"reveion","revelai":"revela","revelam":["revelăm","revela","revelam","revela"],"reveland":"revela","revelara":"revela","revelaram":"revela","revelarati":"revela","revelarea":"revelare","revelari":"revelare","revelarii":"revelare","revelarile":"revelare","revelarilor":"revelare","revelase":"revela","revelasem":"revela","revelasera":"revela","revelaseram":"revela","revelaserati":"revela","revelasesi":"revela","revelasi":"revela","revelat":"revela","revelati":"revela","revelatia":"revelație","revelatiei":"revelație","revelatii":"revelație","revelatiile":"revelație","revelatiilor":"revelație","revelatiunea":"revelațiune","revelatiuni":"revelațiune","revelatiunii":"revelațiune","revelatiunile":"revelațiune","revelatiunilor":"revelațiune","revelatori":"revelator","revelatoria":"revelatoriu","revelatorie":"revelatoriu","revelatorii":"revelatoriu","revelatoriii":"revelatoriu","revelatoriile":"revelatoriu","revelatorile":"revelator","revelatorilor":"revelator","revelatoriul":"revelatoriu","revelatorul":"revelator","revelatorule":"revelator","revelatorului":"revelator","revelau":"revela","reveleaza":"revela","revelez":"revela","revelezi":"revela","revelioane":"revelion","revendic":"revendica","revendicai":"revendica","revendicam":["revendicăm","revendica","revendicam","revendica"],"revendicand":"revendica","revendicante":"revendicantă","revendicantei":"revendicantă","revendicantele":"revendicantă","revendicantelor":"revendicantă","revendicara":"revendica","revendicaram":"revendica","revendicarati":"revendica","revendicarea":"revendicare","revendicari":"revendicare","revendicarii":"revendicare","revendicarile":"revendicare","revendicarilor":"revendicare","revendicase":"revendica","revendicasem":"revendica","revendicasera":"revendica","revendicaseram":"revendica","revendicaserati":"revendica","revendicasesi":"revendica","revendicasi":"revendica","revendicat":"revendica","revendicati":"revendica","revendicatia":"revendicație","revendicatiei":"revendicație","revendicatii":"revendicație","revendicatiile":"revendicație","revendicatiilor":"revendicație","revendicatiunea":"revendicațiune","revendicatiuni":"revendicațiune","revendicatiunii":"revendicațiune","revendicatiunile":"revendicațiune","revendicatiunilor":"revendicațiune","revendicativa":["revendicativă","revendicativ","revendicativa","revendicativ"],"revendicative":"revendicativ","revendicativele":"revendicativ","revendicativi":"revendicativ","revendicativii":"revendicativ","revendicativul":"revendicativ","revendicau":"revendica","revendici":"revendica","revene":"reavăn","revenea":"reveni","reveneai":"reveni","reveneam":"reveni","reveneati":"reveni","reveneau":"reveni","revenele":["revenele","reavăn","revenele","reveneală"],"revenelei":"reveneală","revenelele":"reveneală","revenelelor":"reveneală","reveneli":"reveneală","revenesc":"reveni","reveneste":"reveni","revenesti":"reveni","reveni":"reavăn","revenii":["revenii","reavăn","revenii","reveni"],"revenim":"reveni","revenind":"reveni","revenira":"reveni","reveniram":"reveni","revenirati":"reveni","revenirea":"revenire","reveniri":"revenire","revenirii":"revenire","revenirile":"revenire","revenirilor":"revenire","revenise":"reveni","revenisem":"reveni","revenisera":"reveni","reveniseram":"reveni","reveniserati":"reveni","revenisesi":"reveni","revenisi":"reveni","revenit":"reveni","reveniti":"reveni","revenoasa":["revenoasă","revenos","revenoasa","revenos"],"revenoase":"revenos","revenoasele":"revenos","revenosi":"revenos","revenosii":"revenos","revenosul":"revenos","reventul":"revent","reventule":"revent","reventului":"revent","reverberai":"reverbera","reverberam":["reverberăm","reverbera","reverberam","reverbera"],"reverberand":"reverbera","reverberara":"reverbera","reverberaram":"reverbera","reverberarati":"reverbera","reverberarea":"reverberare","reverberari":"reverberare","reverberarii":"reverberare","reverberarile":"reverberare","reverberarilor":"reverberare","reverberase":"reverbera","reverberasem":"reverbera","reverberasera":"reverbera","reverberaseram":"reverbera","reverberaserati":"reverbera","reverberasesi":"reverbera","reverberasi":"reverbera","reverberat":"reverbera","reverberati":"reverbera","reverberatia":"reverberație","reverberatiei":"reverberație","reverberatii":"reverberație","reverberatiile":"reverberație","reverberatiilor":"reverberație","reverberatiunea":"reverberațiune","reverberatiuni":"reverberațiune","reverberatiunii":"reverberațiune","reverberatiunile":"reverberațiune","reverberatiunilor":"reverberațiune","reverberau":"reverbera","reverbereaza":"reverbera","reverberez":"reverbera","reverberezi":"reverbera","revere":"rever","reverele":"rever","reverelor":"rever","reverende":"reverendă","reverendei":"reverendă","reverendele":"reverendă","reverendelor":"reverendă","reverendisima":["reverendisimă","reverendisim","reverendisima","reverendisim"],"reverendisime":"reverendisim","reverendisimele":"reverendisim","reverendisimi":"reverendisim","reverendisimii":"reverendisim","reverendisimul":"reverendisim","reverendul":"reverend","reverendule":"reverend","reverendului":"reverend","reverente":"reverență","reverentei":"reverență","reverentele":"reverență","reverentelor":"reverență","reverentiala":["reverențială","reverențial","reverențiala","reverențial"],"reverentiale":"reverențial","reverentialele":"reverențial","reverentiali":"reverențial","reverentialii":"reverențial","reverentialul":"reverențial","reverentioasa":["reverențioasă","reverențios","reverențioasa","reverențios"],"reverentioase":"reverențios","reverentioasele":"reverențios","reverentiosi":"reverențios","reverentiosii":"reverențios","reverentiosul":"reverențios","reverenzi":"reverend","reverenzii":"reverend","reverenzilor":"reverend","reveria":"reverie","reveriei":"reverie","reverificarea":"reverificare","reverificari":"reverificare","reverificarii":"reverificare","reverificarile":"reverificare","reverificarilor":"reverificare","reverii":"reverie","reveriile":"reverie","reveriilor":"reverie","reverinte":"reverință","reverintei":"reverință","reverintele":"reverință","reverintelor":"reverință","reverse":"revărsa","reversi":"revărsa","reversia":"reversie","reversibila":["reversibilă","reversibil","reversibila","reversibil"],"reversibile":"reversibil","reversibilele":"reversibil","reversibili":"reversibil","reversibilii":"reversibil","reversibilitatea":"reversibilitate","reversibilitati":"reversibilitate","reversibilitatii":"reversibilitate","reversibilitatile":"reversibilitate","reversibilitatilor":"reversibilitate","reversibilul":"reversibil","reversiei":"reversie","reversii":"reversie","reversiile":"reversie","reversiilor":"reversie","reversiunea":"reversiune","reversiuni":"reversiune","reversiunii":"reversiune","reversiunile":"reversiune","reversiunilor":"reversiune","reversiva":["reversivă","reversiv","reversiva","reversiv"],"reversive":"reversiv","reversivele":"reversiv","reversivi":"reversiv","reversivii":"reversiv","reversivul":"reversiv","reversul":"revers","reversule":"revers","reversului":"revers","reversuri":"revers","reversurile":"revers","reversurilor":"revers","reverul":"rever","reverule":"rever","reverului":"rever","revestirea":"revestire","revestiri":"revestire","revestirii":"revestire","revestirile":"revestire","revestirilor":"revestire","revestita":["revestită","revestit","revestita","revestit"],"revestite":"revestit","revestitele":"revestit","revestiti":"revestit","revestitii":"revestit","revestitul":"revestit","revezi":"revedea","revigorai":"revigora","revigoram":["revigorăm","revigora","revigoram","revigora"],"revigorand":"revigora","revigorara":"revigora","revigoraram":"revigora","revigorarati":"revigora","revigorarea":"revigorare","revigorari":"revigorare","revigorarii":"revigorare","revigorarile":"revigorare","revigorarilor":"revigorare","revigorase":"revigora","revigorasem":"revigora","revigorasera":"revigora","revigoraseram":"revigora","revigoraserati":"revigora","revigorasesi":"revigora","revigorasi":"revigora","revigorat":"revigora","revigorata":["revigorată","revigorat","revigorata","revigorat"],"revigorate":"revigorat","revigoratele":"revigorat","revigorati":["revigorați","revigora","revigorați","revigorat"],"revigoratii":"revigorat","revigoratul":"revigorat","revigorau":"revigora","revigoreaza":"revigora","revigorez":"revigora","revigorezi":"revigora","revii":"reveni","revin":"reveni","revind":"revinde","revindea":"revinde","revindeai":"revinde","revindeam":"revinde","revindeati":"revinde","revindeau":"revinde","revindem":"revinde","revinderea":"revindere","revinderi":"revindere","revinderii":"revindere","revinderile":"revindere","revinderilor":"revindere","revindeti":"revinde","revindicatiunea":"revindicațiune","revindicatiuni":"revindicațiune","revindicatiunii":"revindicațiune","revindicatiunile":"revindicațiune","revindicatiunilor":"revindicațiune","revine":"reveni","revino":"reveni","revinse":"revinde","revinsei":"revinde","revinsera":"revinde","revinseram":"revinde","revinserati":"revinde","revinsese":"revinde","revinsesem":"revinde","revinsesera":"revinde","revinseseram":"revinde","revinseserati":"revinde","revinsesesi":"revinde","revinsesi":"revinde","revinzand":"revinde","revinzi":"revinde","revirimente":"reviriment","revirimentele":"reviriment","revirimentelor":"reviriment","revirimentul":"reviriment","revirimentule":"reviriment","revirimentului":"reviriment","reviste":"revistă","revistei":"revistă","revistele":"revistă","revistelor":"revistă","revistute":"revistuță","revistutei":"revistuță","revistutele":"revistuță","revistutelor":"revistuță","revitalizai":"revitaliza","revitalizam":["revitalizăm","revitaliza","revitalizam","revitaliza"],"revitalizand":"revitaliza","revitalizara":"revitaliza","revitalizaram":"revitaliza","revitalizarati":"revitaliza","revitalizarea":"revitalizare","revitalizari":"revitalizare","revitalizarii":"revitalizare","revitalizarile":"revitalizare","revitalizarilor":"revitalizare","revitalizase":"revitaliza","revitalizasem":"revitaliza","revitalizasera":"revitaliza","revitalizaseram":"revitaliza","revitalizaserati":"revitaliza","revitalizasesi":"revitaliza","revitalizasi":"revitaliza","revitalizat":"revitaliza","revitalizata":["revitalizată","revitalizat","revitalizata","revitalizat"],"revitalizate":"revitalizat","revitalizatele":"revitalizat","revitalizati":["revitalizați","revitaliza","revitalizați","revitalizat"],"revitalizatii":"revitalizat","revitalizatul":"revitalizat","revitalizau":"revitaliza","revitalizeaza":"revitaliza","revitalizez":"revitaliza","revitalizezi":"revitaliza","reviviscenta":["reviviscentă","reviviscent","reviviscenta","reviviscent"],"reviviscente":["reviviscente","reviviscent","reviviscențe","reviviscență"],"reviviscentei":"reviviscență","reviviscentele":["reviviscentele","reviviscent","reviviscențele","reviviscență"],"reviviscentelor":"reviviscență","reviviscenti":"reviviscent","reviviscentii":"reviviscent","reviviscentul":"reviviscent","revizia":"revizie","reviziei":"revizie","revizii":"revizie","reviziile":"revizie","reviziilor":"revizie","revizionismul":"revizionism","revizionismule":"revizionism","revizionismului":"revizionism","revizioniste":"revizionistă","revizionistei":"revizionistă","revizionistele":"revizionistă","revizionistelor":"revizionistă","revizionisti":"revizionist","revizionistii":"revizionist","revizionistilor":"revizionist","revizionistul":"revizionist","revizionistule":"revizionist","revizionistului":"revizionist","reviziunea":"reviziune","reviziuni":"reviziune","reviziunii":"reviziune","reviziunile":"reviziune","reviziunilor":"reviziune","revizoarea":"revizoare","revizoarei":"revizoare","revizoarele":"revizoare","revizoarelor":"revizoare","revizori":"revizor","revizorii":"revizor","revizorilor":"revizor","revizorul":"revizor","revizorule":"revizor","revizorului":"revizor","revizuia":"revizui","revizuiai":"revizui","revizuiam":"revizui","revizuiati":"revizui","revizuiau":"revizui","revizuiesc":"revizui","revizuieste":"revizui","revizuiesti":"revizui","revizuii":"revizui","revizuim":"revizui","revizuind":"revizui","revizuira":"revizui","revizuiram":"revizui","revizuirati":"revizui","revizuirea":"revizuire","revizuiri":"revizuire","revizuirii":"revizuire","revizuirile":"revizuire","revizuirilor":"revizuire","revizuise":"revizui","revizuisem":"revizui","revizuisera":"revizui","revizuiseram":"revizui","revizuiserati":"revizui","revizuisesi":"revizui","revizuisi":"revizui","revizuit":"revizui","revizuita":["revizuită","revizuit","revizuita","revizuit"],"revizuite":"revizuit","revizuitele":"revizuit","revizuiti":["revizuiți","revizui","revizuiți","revizuit"],"revizuitii":"revizuit","revizuitul":"revizuit","revoc":"revoca","revocabila":["revocabilă","revocabil","revocabila","revocabil"],"revocabile":"revocabil","revocabilele":"revocabil","revocabili":"revocabil","revocabilii":"revocabil","revocabilitatea":"revocabilitate","revocabilitati":"revocabilitate","revocabilitatii":"revocabilitate","revocabilitatile":"revocabilitate","revocabilitatilor":"revocabilitate","revocabilul":"revocabil","revocai":"revoca","revocam":["revocăm","revoca","revocam","revoca"],"revocand":"revoca","revocara":"revoca","revocaram":"revoca","revocarati":"revoca","revocarea":"revocare","revocari":"revocare","revocarii":"revocare","revocarile":"revocare","revocarilor":"revocare","revocase":"revoca","revocasem":"revoca","revocasera":"revoca","revocaseram":"revoca","revocaserati":"revoca","revocasesi":"revoca","revocasi":"revoca","revocat":"revoca","revocata":["revocată","revocat","revocata","revocat"],"revocate":"revocat","revocatele":"revocat","revocati":["revocați","revoca","revocați","revocat"],"revocatia":"revocație","revocatiei":"revocație","revocatii":["revocații","revocat","revocații","revocație"],"revocatiile":"revocație","revocatiilor":"revocație","revocatiunea":"revocațiune","revocatiuni":"revocațiune","revocatiunii":"revocațiune","revocatiunile":"revocațiune","revocatiunilor":"revocațiune","revocatul":"revocat","revocau":"revoca","revoce":"revoca","revoci":"revoca","revolt":"revolta","revoltai":"revolta","revoltam":["revoltăm","revolta","revoltam","revolta"],"revoltand":"revolta","revoltanta":["revoltantă","revoltant","revoltanta","revoltant"],"revoltante":"revoltant","revoltantele":"revoltant","revoltanti":"revoltant","revoltantii":"revoltant","revoltantul":"revoltant","revoltara":"revolta","revoltaram":"revolta","revoltarati":"revolta","revoltarea":"revoltare","revoltari":"revoltare","revoltarii":"revoltare","revoltarile":"revoltare","revoltarilor":"revoltare","revoltase":"revolta","revoltasem":"revolta","revoltasera":"revolta","revoltaseram":"revolta","revoltaserati":"revolta","revoltasesi":"revolta","revoltasi":"revolta","revoltat":"revolta","revoltata":["revoltată","revoltat","revoltata","revoltat"],"revoltate":"revoltat","revoltatele":"revoltat","revoltati":["revoltați","revolta","revoltați","revoltat"],"revoltatii":"revoltat","revoltatoare":"revoltător","revoltatoarea":"revoltător","revoltatoarele":"revoltător","revoltatori":"revoltător","revoltatorii":"revoltător","revoltatorul":"revoltător","revoltatul":"revoltat","revoltau":"revolta","revolte":["revolte","revolta","revolte","revoltă"],"revoltei":"revoltă","revoltele":"revoltă","revoltelor":"revoltă","revolti":"revolta","revolutia":"revoluție","revolutiei":"revoluție","revolutii":"revoluție","revolutiile":"revoluție","revolutiilor":"revoluție","revolutionai":"revoluționa","revolutionam":["revoluționăm","revoluționa","revoluționam","revoluționa"],"revolutionand":"revoluționa","revolutionara":"revoluționa","revolutionaram":"revoluționa","revolutionarati":"revoluționa","revolutionare":"revoluționară","revolutionarea":"revoluționare","revolutionarei":"revoluționară"};
@@ -0,0 +1 @@
+export default {"revolutionarele":"revoluționară","revolutionarelor":"revoluționară","revolutionari":["revoluționari","revoluționar","revoluționări","revoluționare"],"revolutionarii":["revoluționarii","revoluționar","revoluționării","revoluționare"],"revolutionarile":"revoluționare","revolutionarilor":["revoluționarilor","revoluționar","revoluționărilor","revoluționare"],"revolutionarisme":"revoluționarism","revolutionarismele":"revoluționarism","revolutionarismelor":"revoluționarism","revolutionarismul":"revoluționarism","revolutionarismule":"revoluționarism","revolutionarismului":"revoluționarism","revolutionarizai":"revoluționariza","revolutionarizam":["revoluționarizăm","revoluționariza","revoluționarizam","revoluționariza"],"revolutionarizand":"revoluționariza","revolutionarizara":"revoluționariza","revolutionarizaram":"revoluționariza","revolutionarizarati":"revoluționariza","revolutionarizase":"revoluționariza","revolutionarizasem":"revoluționariza","revolutionarizasera":"revoluționariza","revolutionarizaseram":"revoluționariza","revolutionarizaserati":"revoluționariza","revolutionarizasesi":"revoluționariza","revolutionarizasi":"revoluționariza","revolutionarizat":"revoluționariza","revolutionarizati":"revoluționariza","revolutionarizau":"revoluționariza","revolutionarizeaza":"revoluționariza","revolutionarizez":"revoluționariza","revolutionarizezi":"revoluționariza","revolutionarul":"revoluționar","revolutionarule":"revoluționar","revolutionarului":"revoluționar","revolutionase":"revoluționa","revolutionasem":"revoluționa","revolutionasera":"revoluționa","revolutionaseram":"revoluționa","revolutionaserati":"revoluționa","revolutionasesi":"revoluționa","revolutionasi":"revoluționa","revolutionat":"revoluționa","revolutionati":"revoluționa","revolutionau":"revoluționa","revolutioneaza":"revoluționa","revolutionez":"revoluționa","revolutionezi":"revoluționa","revolutiune":"revoluție","revolutiunea":"revoluțiune","revolutiuni":"revoluțiune","revolutiunii":"revoluțiune","revolutiunile":"revoluțiune","revolutiunilor":"revoluțiune","revolutiva":["revolutivă","revolutiv","revolutiva","revolutiv"],"revolutive":"revolutiv","revolutivele":"revolutiv","revolutivi":"revolutiv","revolutivii":"revolutiv","revolutivul":"revolutiv","revolvere":"revolver","revolverele":"revolver","revolverelor":"revolver","revolverul":"revolver","revolverule":"revolver","revolverului":"revolver","revopsea":"revopsi","revopseai":"revopsi","revopseam":"revopsi","revopseati":"revopsi","revopseau":"revopsi","revopsesc":"revopsi","revopseste":"revopsi","revopsesti":"revopsi","revopsii":"revopsi","revopsim":"revopsi","revopsind":"revopsi","revopsira":"revopsi","revopsiram":"revopsi","revopsirati":"revopsi","revopsirea":"revopsire","revopsirei":"revopsire","revopsise":"revopsi","revopsisem":"revopsi","revopsisera":"revopsi","revopsiseram":"revopsi","revopsiserati":"revopsi","revopsisesi":"revopsi","revopsisi":"revopsi","revopsit":"revopsi","revopsita":["revopsită","revopsit","revopsita","revopsit"],"revopsite":"revopsit","revopsitele":"revopsit","revopsiti":["revopsiți","revopsi","revopsiți","revopsit"],"revopsitii":"revopsit","revopsitul":"revopsit","revuisti":"revuist","revuistii":"revuist","revuistilor":"revuist","revuistul":"revuist","revuistule":"revuist","revuistului":"revuist","revulsia":"revulsie","revulsiei":"revulsie","revulsii":"revulsie","revulsiile":"revulsie","revulsiilor":"revulsie","revulsivi":"revulsiv","revulsivile":"revulsiv","revulsivilor":"revulsiv","revulsivul":"revulsiv","revulsivule":"revulsiv","revulsivului":"revulsiv","revulziva":["revulzivă","revulziv","revulziva","revulziv"],"revulzive":"revulziv","revulzivele":"revulziv","revulzivi":"revulziv","revulzivii":"revulziv","revulzivul":"revulziv","rezaletul":"rezalet","rezaletule":"rezalet","rezaletului":"rezalet","rezaleturi":"rezalet","rezaleturile":"rezalet","rezaleturilor":"rezalet","rezamata":["rezămată","rezămat","rezămata","rezămat"],"rezamate":"rezămat","rezamatele":"rezămat","rezamati":"rezămat","rezamatii":"rezămat","rezamatul":"rezămat","rezamb":"rezâmbi","rezambe":"rezâmbi","rezambea":"rezâmbi","rezambeai":"rezâmbi","rezambeam":"rezâmbi","rezambeati":"rezâmbi","rezambeau":"rezâmbi","rezambie":"rezâmbi","rezambii":"rezâmbi","rezambim":"rezâmbi","rezambind":"rezâmbi","rezambira":"rezâmbi","rezambiram":"rezâmbi","rezambirati":"rezâmbi","rezambise":"rezâmbi","rezambisem":"rezâmbi","rezambisera":"rezâmbi","rezambiseram":"rezâmbi","rezambiserati":"rezâmbi","rezambisesi":"rezâmbi","rezambisi":"rezâmbi","rezambit":"rezâmbi","rezambiti":"rezâmbi","rezasi":"rezaș","rezasii":"rezaș","rezasilor":"rezaș","rezasul":"rezaș","rezasule":"rezaș","rezasului":"rezaș","rezbel":"răzbel","rezbele":"rezbel","rezbelele":"rezbel","rezbelelor":"rezbel","rezbelica":["rezbelică","rezbelic","rezbelica","rezbelic"],"rezbelice":"rezbelic","rezbelicele":"rezbelic","rezbelici":"rezbelic","rezbelicii":"rezbelic","rezbelicul":"rezbelic","rezbelnica":["rezbelnică","rezbelnic","rezbelnica","rezbelnic"],"rezbelnice":"rezbelnic","rezbelnicele":"rezbelnic","rezbelnici":"rezbelnic","rezbelnicii":"rezbelnic","rezbelnicul":"rezbelnic","rezbelul":"rezbel","rezbelule":"rezbel","rezbelului":"rezbel","rezec":"rezeca","rezecai":"rezeca","rezecam":["rezecăm","rezeca","rezecam","rezeca"],"rezecand":"rezeca","rezecara":"rezeca","rezecaram":"rezeca","rezecarati":"rezeca","rezecase":"rezeca","rezecasem":"rezeca","rezecasera":"rezeca","rezecaseram":"rezeca","rezecaserati":"rezeca","rezecasesi":"rezeca","rezecasi":"rezeca","rezecat":"rezeca","rezecati":"rezeca","rezecau":"rezeca","rezeci":"rezeca","rezectia":"rezecție","rezectiei":"rezecție","rezectii":"rezecție","rezectiile":"rezecție","rezectiilor":"rezecție","rezectiunea":"rezecțiune","rezectiuni":"rezecțiune","rezectiunii":"rezecțiune","rezectiunile":"rezecțiune","rezectiunilor":"rezecțiune","rezede":"rezedă","rezedei":"rezedă","rezedele":"rezedă","rezedelor":"rezedă","rezedute":"rezeduță","rezedutei":"rezeduță","rezedutele":"rezeduță","rezedutelor":"rezeduță","rezemai":"rezema","rezemam":["rezemăm","rezema","rezemam","rezema"],"rezemand":"rezema","rezemantul":"rezemânt","rezemantule":"rezemânt","rezemantului":"rezemânt","rezemara":"rezema","rezemaram":"rezema","rezemarati":"rezema","rezemarea":"rezemare","rezemari":"rezemare","rezemarii":"rezemare","rezemase":"rezema","rezemasem":"rezema","rezemasera":"rezema","rezemaseram":"rezema","rezemaserati":"rezema","rezemasesi":"rezema","rezemasi":"rezema","rezemat":"rezema","rezemata":["rezemată","rezemat","rezemata","rezemat"],"rezemate":"rezemat","rezematele":"rezemat","rezemati":["rezemați","rezema","rezemați","rezemat"],"rezematii":"rezemat","rezematoarea":"rezemătoare","rezematori":"rezemătoare","rezematorii":"rezemătoare","rezematorile":"rezemătoare","rezematorilor":"rezemătoare","rezematul":"rezemat","rezemau":"rezema","rezeme":"rezema","rezemi":"rezema","rezerpine":"rezerpină","rezerpinei":"rezerpină","rezerv":"rezerva","rezervai":"rezerva","rezervam":["rezervăm","rezerva","rezervam","rezerva"],"rezervand":"rezerva","rezervara":"rezerva","rezervaram":"rezerva","rezervarati":"rezerva","rezervarea":"rezervare","rezervari":"rezervare","rezervarii":"rezervare","rezervarile":"rezervare","rezervarilor":"rezervare","rezervase":"rezerva","rezervasem":"rezerva","rezervasera":"rezerva","rezervaseram":"rezerva","rezervaserati":"rezerva","rezervasesi":"rezerva","rezervasi":"rezerva","rezervat":"rezerva","rezervata":["rezervată","rezervat","rezervata","rezervat"],"rezervatara":["rezervatară","rezervatar","rezervatara","rezervatar"],"rezervatare":["rezervatare","rezervatar","rezervatare","rezervatară"],"rezervatarei":"rezervatară","rezervatarele":["rezervatarele","rezervatar","rezervatarele","rezervatară"],"rezervatarelor":"rezervatară","rezervatari":"rezervatar","rezervatarii":"rezervatar","rezervatarul":"rezervatar","rezervate":"rezervat","rezervatele":"rezervat","rezervati":["rezervați","rezerva","rezervați","rezervat"],"rezervatia":"rezervație","rezervatiei":"rezervație","rezervatii":["rezervații","rezervat","rezervații","rezervație"],"rezervatiile":"rezervație","rezervatiilor":"rezervație","rezervatul":"rezervat","rezervau":"rezerva","rezerve":["rezerve","rezerva","rezerve","rezervă"],"rezervei":"rezervă","rezervele":"rezervă","rezervelor":"rezervă","rezervi":"rezerva","rezervisti":"rezervist","rezervistii":"rezervist","rezervistilor":"rezervist","rezervistul":"rezervist","rezervistule":"rezervist","rezervistului":"rezervist","rezervoare":"rezervor","rezervoarele":"rezervor","rezervoarelor":"rezervor","rezervorii":"rezervoriu","rezervoriile":"rezervoriu","rezervoriilor":"rezervoriu","rezervoriuul":"rezervoriu","rezervoriuule":"rezervoriu","rezervoriuului":"rezervoriu","rezervorul":"rezervor","rezervorule":"rezervor","rezervorului":"rezervor","rezi":"rezice","rezic":"rezice","rezica":"rezice","rezicand":"rezice","rezicea":"rezice","reziceai":"rezice","reziceam":"rezice","reziceati":"rezice","reziceau":"rezice","rezicem":"rezice","reziceti":"rezice","rezici":"rezice","rezid":"rezida","rezidai":"rezida","rezidam":["rezidăm","rezida","rezidam","rezida"],"rezidand":"rezida","rezidara":"rezida","rezidaram":"rezida","rezidarati":"rezida","rezidarea":"rezidare","rezidari":"rezidare","rezidarii":"rezidare","rezidarile":"rezidare","rezidarilor":"rezidare","rezidase":"rezida","rezidasem":"rezida","rezidasera":"rezida","rezidaseram":"rezida","rezidaserati":"rezida","rezidasesi":"rezida","rezidasi":"rezida","rezidat":"rezida","rezidati":"rezida","rezidau":"rezida","rezidea":"rezidi","rezideai":"rezidi","rezideam":"rezidi","rezideati":"rezidi","rezideau":"rezidi","rezidenta":["rezidentă","rezident","rezidenta","rezident"],"rezidente":["rezidente","rezident","rezidente","rezidentă","rezidențe","rezidență"],"rezidentei":["rezidentei","rezidentă","rezidenței","rezidență"],"rezidentele":["rezidentele","rezident","rezidentele","rezidentă","rezidențele","rezidență"],"rezidentelor":["rezidentelor","rezidentă","rezidențelor","rezidență"],"rezidenti":"rezident","rezidentiala":["rezidențială","rezidențial","rezidențiala","rezidențial"],"rezidentiale":"rezidențial","rezidentialele":"rezidențial","rezidentiali":"rezidențial","rezidentialii":"rezidențial","rezidentialul":"rezidențial","rezidentiatul":"rezidențiat","rezidentiatule":"rezidențiat","rezidentiatului":"rezidențiat","rezidentii":"rezident","rezidentilor":"rezident","rezidentul":"rezident","rezidentule":"rezident","rezidentului":"rezident","rezidesc":"rezidi","rezideste":"rezidi","rezidesti":"rezidi","rezidii":["rezidii","rezidi","rezidii","rezidiu"],"rezidiile":"rezidiu","rezidiilor":"rezidiu","rezidim":"rezidi","rezidind":"rezidi","rezidira":"rezidi","rezidiram":"rezidi","rezidirati":"rezidi","rezidirea":"rezidire","rezidiri":"rezidire","rezidirii":"rezidire","rezidirile":"rezidire","rezidirilor":"rezidire","rezidise":"rezidi","rezidisem":"rezidi","rezidisera":"rezidi","rezidiseram":"rezidi","rezidiserati":"rezidi","rezidisesi":"rezidi","rezidisi":"rezidi","rezidit":"rezidi","reziditi":"rezidi","rezidiuul":"rezidiu","rezidiuule":"rezidiu","rezidiuului":"rezidiu","reziduala":["reziduală","rezidual","reziduala","rezidual"],"reziduale":"rezidual","rezidualele":"rezidual","reziduali":"rezidual","rezidualii":"rezidual","rezidualul":"rezidual","reziduara":["reziduară","reziduar","reziduara","reziduar"],"reziduare":"reziduar","reziduarele":"reziduar","reziduari":"reziduar","reziduarii":"reziduar","reziduarul":"reziduar","reziduata":["reziduată","reziduat","reziduata","reziduat"],"reziduate":"reziduat","reziduatele":"reziduat","reziduati":"reziduat","reziduatii":"reziduat","reziduatul":"reziduat","reziduul":"reziduu","reziduule":"reziduu","reziduului":"reziduu","reziduuri":"reziduu","reziduurile":"reziduu","reziduurilor":"reziduu","rezile":"rezil","rezilele":"rezil","rezilelor":"rezil","reziliabila":["reziliabilă","reziliabil","reziliabila","reziliabil"],"reziliabile":"reziliabil","reziliabilele":"reziliabil","reziliabili":"reziliabil","reziliabilii":"reziliabil","reziliabilul":"reziliabil","reziliai":"rezilia","reziliam":"rezilia","reziliara":"rezilia","reziliaram":"rezilia","reziliarati":"rezilia","reziliarea":"reziliare","reziliari":"reziliare","reziliarii":"reziliare","reziliarile":"reziliare","reziliarilor":"reziliare","reziliase":"rezilia","reziliasem":"rezilia","reziliasera":"rezilia","reziliaseram":"rezilia","reziliaserati":"rezilia","reziliasesi":"rezilia","reziliasi":"rezilia","reziliat":"rezilia","reziliata":["reziliată","reziliat","reziliata","reziliat"],"reziliate":"reziliat","reziliatele":"reziliat","reziliati":["reziliați","rezilia","reziliați","reziliat"],"reziliatii":"reziliat","reziliatul":"reziliat","reziliau":"rezilia","reziliaza":"rezilia","rezilie":"rezilia","rezilieaza":"rezilia","reziliem":"rezilia","reziliente":"reziliență","rezilientei":"reziliență","rezilientele":"reziliență","rezilientelor":"reziliență","rezilierea":"reziliere","rezilieri":"reziliere","rezilierii":"reziliere","rezilierile":"reziliere","rezilierilor":"reziliere","reziliez":"rezilia","reziliezi":"rezilia","reziliind":"rezilia","rezilul":"rezil","rezilule":"rezil","rezilului":"rezil","rezimata":["rezimată","rezimat","rezimata","rezimat"],"rezimate":"rezimat","rezimatele":"rezimat","rezimati":"rezimat","rezimatii":"rezimat","rezimatul":"rezimat","rezinai":"rezina","rezinaje":"rezinaj","rezinajele":"rezinaj","rezinajelor":"rezinaj","rezinajul":"rezinaj","rezinajule":"rezinaj","rezinajului":"rezinaj","rezinam":["rezinăm","rezina","rezinam","rezina"],"rezinand":"rezina","rezinara":"rezina","rezinaram":"rezina","rezinarati":"rezina","rezinarea":"rezinare","rezinari":"rezinare","rezinarii":"rezinare","rezinarile":"rezinare","rezinarilor":"rezinare","rezinase":"rezina","rezinasem":"rezina","rezinasera":"rezina","rezinaseram":"rezina","rezinaserati":"rezina","rezinasesi":"rezina","rezinasi":"rezina","rezinat":"rezina","rezinati":["rezinați","rezina","rezinați","rezinat"],"rezinatii":"rezinat","rezinatilor":"rezinat","rezinatul":"rezinat","rezinatule":"rezinat","rezinatului":"rezinat","rezinau":"rezina","rezine":"rezină","rezineaza":"rezina","rezinei":"rezină","rezinele":"rezină","rezinelor":"rezină","rezinez":"rezina","rezinezi":"rezina","rezinific":"rezinifica","rezinificai":"rezinifica","rezinificam":["rezinificăm","rezinifica","rezinificam","rezinifica"],"rezinificand":"rezinifica","rezinificara":"rezinifica","rezinificaram":"rezinifica","rezinificarati":"rezinifica","rezinificarea":"rezinificare","rezinificari":"rezinificare","rezinificarii":"rezinificare","rezinificarile":"rezinificare","rezinificarilor":"rezinificare","rezinificase":"rezinifica","rezinificasem":"rezinifica","rezinificasera":"rezinifica","rezinificaseram":"rezinifica","rezinificaserati":"rezinifica","rezinificasesi":"rezinifica","rezinificasi":"rezinifica","rezinificat":"rezinifica","rezinificati":"rezinifica","rezinificau":"rezinifica","rezinifici":"rezinifica","rezis":"rezice","rezise":"rezice","rezisei":"rezice","rezisera":"rezice","reziseram":"rezice","reziserati":"rezice","rezisese":"rezice","rezisesem":"rezice","rezisesera":"rezice","reziseseram":"rezice","reziseserati":"rezice","rezisesesi":"rezice","rezisesi":"rezice","rezist":"rezista","rezistai":"rezista","rezistam":["rezistăm","rezista","rezistam","rezista"],"rezistand":"rezista","rezistara":"rezista","rezistaram":"rezista","rezistarati":"rezista","rezistari":"rezistare","rezistase":"rezista","rezistasem":"rezista","rezistasera":"rezista","rezistaseram":"rezista","rezistaserati":"rezista","rezistasesi":"rezista","rezistasi":"rezista","rezistat":"rezista","rezistati":"rezista","rezistau":"rezista","reziste":"rezista","rezistenta":["rezistentă","rezistent","rezistenta","rezistent"],"rezistente":["rezistente","rezistent","rezistențe","rezistență"],"rezistente electrice":"rezistență electrică","rezistentei":"rezistență","rezistentele":["rezistentele","rezistent","rezistențele","rezistență"],"rezistentelor":"rezistență","rezistenti":"rezistent","rezistentii":"rezistent","rezistentul":"rezistent","rezisti":"rezista","rezistibila":["rezistibilă","rezistibil","rezistibila","rezistibil"],"rezistibile":"rezistibil","rezistibilele":"rezistibil","rezistibili":"rezistibil","rezistibilii":"rezistibil","rezistibilitatea":"rezistibilitate","rezistibilitati":"rezistibilitate","rezistibilitatii":"rezistibilitate","rezistibilitatile":"rezistibilitate","rezistibilitatilor":"rezistibilitate","rezistibilul":"rezistibil","rezistivimetre":"rezistivimetru","rezistivimetrele":"rezistivimetru","rezistivimetrelor":"rezistivimetru","rezistivimetrul":"rezistivimetru","rezistivimetrule":"rezistivimetru","rezistivimetrului":"rezistivimetru","rezistivitatea":"rezistivitate","rezistivitati":"rezistivitate","rezistivitatii":"rezistivitate","rezistivitatile":"rezistivitate","rezistivitatilor":"rezistivitate","rezistoare":"rezistor","rezistoarele":"rezistor","rezistoarelor":"rezistor","rezistorul":"rezistor","rezistorule":"rezistor","rezistorului":"rezistor","rezite":"rezită","rezitei":"rezită","rezitele":"rezită","rezitelor":"rezită","rezizi":"rezida","rezmerite":"rezmeriță","rezmeritei":"rezmeriță","rezmeritele":"rezmeriță","rezmeritelor":"rezmeriță","rezoane":"rezon","rezoanele":"rezon","rezoanelor":"rezon","rezoluta":["rezolută","rezolut","rezoluta","rezolut"],"rezolute":"rezolut","rezolutele":"rezolut","rezoluti":"rezolut","rezolutia":"rezoluție","rezolutiei":"rezoluție","rezolutii":["rezoluții","rezolut","rezoluții","rezoluție"],"rezolutiile":"rezoluție","rezolutiilor":"rezoluție","rezolutiunea":"rezoluțiune","rezolutiuni":"rezoluțiune","rezolutiunii":"rezoluțiune","rezolutiunile":"rezoluțiune","rezolutiunilor":"rezoluțiune","rezolutiva":["rezolutivă","rezolutiv","rezolutiva","rezolutiv"],"rezolutive":"rezolutiv","rezolutivele":"rezolutiv","rezolutivi":"rezolutiv","rezolutivii":"rezolutiv","rezolutivul":"rezolutiv","rezolutoria":"rezolutoriu","rezolutorie":"rezolutoriu","rezolutorii":"rezolutoriu","rezolutoriii":"rezolutoriu","rezolutoriile":"rezolutoriu","rezolutoriul":"rezolutoriu","rezolutul":"rezolut","rezolv":"rezolva","rezolvabila":["rezolvabilă","rezolvabil","rezolvabila","rezolvabil"],"rezolvabile":"rezolvabil","rezolvabilele":"rezolvabil","rezolvabili":"rezolvabil","rezolvabilii":"rezolvabil","rezolvabilul":"rezolvabil","rezolvai":"rezolva","rezolvam":["rezolvăm","rezolva","rezolvam","rezolva"],"rezolvand":"rezolva","rezolvanta":["rezolvantă","rezolvant","rezolvanta","rezolvant"],"rezolvante":"rezolvant","rezolvantele":"rezolvant","rezolvanti":"rezolvant","rezolvantii":"rezolvant","rezolvantul":"rezolvant","rezolvara":"rezolva","rezolvaram":"rezolva","rezolvarati":"rezolva","rezolvarea":"rezolvare","rezolvari":"rezolvare","rezolvarii":"rezolvare","rezolvarile":"rezolvare","rezolvarilor":"rezolvare","rezolvase":"rezolva","rezolvasem":"rezolva","rezolvasera":"rezolva","rezolvaseram":"rezolva","rezolvaserati":"rezolva","rezolvasesi":"rezolva","rezolvasi":"rezolva","rezolvat":"rezolva","rezolvata":["rezolvată","rezolvat","rezolvata","rezolvat"],"rezolvate":"rezolvat","rezolvatele":"rezolvat","rezolvati":["rezolvați","rezolva","rezolvați","rezolvat"],"rezolvatii":"rezolvat","rezolvatul":"rezolvat","rezolvau":"rezolva","rezolvi":"rezolva","rezolviruia":"rezolvirui","rezolviruiai":"rezolvirui","rezolviruiam":"rezolvirui","rezolviruiati":"rezolvirui","rezolviruiau":"rezolvirui","rezolviruie":"rezolvirui","rezolviruii":"rezolvirui","rezolviruim":"rezolvirui","rezolviruind":"rezolvirui","rezolviruira":"rezolvirui","rezolviruiram":"rezolvirui","rezolviruirati":"rezolvirui","rezolviruise":"rezolvirui","rezolviruisem":"rezolvirui","rezolviruisera":"rezolvirui","rezolviruiseram":"rezolvirui","rezolviruiserati":"rezolvirui","rezolviruisesi":"rezolvirui","rezolviruisi":"rezolvirui","rezolviruit":"rezolvirui","rezolviruiti":"rezolvirui","rezonabila":["rezonabilă","rezonabil","rezonabila","rezonabil"],"rezonabile":"rezonabil","rezonabilele":"rezonabil","rezonabili":"rezonabil","rezonabilii":"rezonabil","rezonabilul":"rezonabil","rezonai":"rezona","rezonam":["rezonăm","rezona","rezonam","rezona"],"rezonamente":"rezonament","rezonamentele":"rezonament","rezonamentelor":"rezonament","rezonamentul":"rezonament","rezonamentule":"rezonament","rezonamentului":"rezonament","rezonand":"rezona","rezonanta":["rezonantă","rezonant","rezonanta","rezonant"],"rezonante":["rezonante","rezonant","rezonanțe","rezonanță"],"rezonantei":"rezonanță","rezonantele":["rezonantele","rezonant","rezonanțele","rezonanță"],"rezonantelor":"rezonanță","rezonanti":"rezonant","rezonantii":"rezonant","rezonantul":"rezonant","rezonara":"rezona","rezonaram":"rezona","rezonarati":"rezona","rezonase":"rezona","rezonasem":"rezona","rezonasera":"rezona","rezonaseram":"rezona","rezonaserati":"rezona","rezonasesi":"rezona","rezonasi":"rezona","rezonat":"rezona","rezonati":"rezona","rezonatoare":"rezonator","rezonatoarele":"rezonator","rezonatoarelor":"rezonator","rezonatorul":"rezonator","rezonatorule":"rezonator","rezonatorului":"rezonator","rezonau":"rezona","rezoneaza":"rezona","rezonez":"rezona","rezonezi":"rezona","rezonul":"rezon","rezonule":"rezon","rezonului":"rezon","rezorcine":"rezorcină","rezorcinei":"rezorcină","rezultand":"rezulta","rezultanta":["rezultantă","rezultant","rezultanta","rezultant"],"rezultante":["rezultante","rezultant","rezultante","rezultantă"],"rezultantei":"rezultantă","rezultantele":["rezultantele","rezultant","rezultantele","rezultantă"],"rezultantelor":"rezultantă","rezultanti":"rezultant","rezultantii":"rezultant","rezultantul":"rezultant","rezultara":"rezulta","rezultase":"rezulta","rezultasera":"rezulta","rezultat":"rezulta","rezultata":["rezultată","rezultat","rezultata","rezultat"],"rezultate":"rezultat","rezultatele":"rezultat","rezultatelor":"rezultat","rezultati":"rezultat","rezultatii":"rezultat","rezultativa":["rezultativă","rezultativ","rezultativa","rezultativ"],"rezultative":"rezultativ","rezultativele":"rezultativ","rezultativi":"rezultativ","rezultativii":"rezultativ","rezultativul":"rezultativ","rezultatul":"rezultat","rezultatule":"rezultat","rezultatului":"rezultat","rezultau":"rezulta","rezum":"rezuma","rezumai":"rezuma","rezumam":["rezumăm","rezuma","rezumam","rezuma"],"rezumand":"rezuma","rezumara":"rezuma","rezumaram":"rezuma","rezumarati":"rezuma","rezumarea":"rezumare","rezumari":"rezumare","rezumarii":"rezumare","rezumarile":"rezumare","rezumarilor":"rezumare","rezumase":"rezuma","rezumasem":"rezuma","rezumasera":"rezuma","rezumaseram":"rezuma","rezumaserati":"rezuma","rezumasesi":"rezuma","rezumasi":"rezuma","rezumat":"rezuma","rezumate":"rezumat","rezumatele":"rezumat","rezumatelor":"rezumat","rezumati":"rezuma","rezumativa":["rezumativă","rezumativ","rezumativa","rezumativ"],"rezumative":"rezumativ","rezumativele":"rezumativ","rezumativi":"rezumativ","rezumativii":"rezumativ","rezumativul":"rezumativ","rezumatoare":["rezumatoare","rezumator","rezumătoare","rezumător"],"rezumatoarea":["rezumatoarea","rezumator","rezumătoarea","rezumător"],"rezumatoarele":["rezumatoarele","rezumator","rezumătoarele","rezumător"],"rezumatori":["rezumatori","rezumator","rezumători","rezumător"],"rezumatorii":["rezumatorii","rezumator","rezumătorii","rezumător"],"rezumatorul":["rezumatorul","rezumator","rezumătorul","rezumător"],"rezumatul":"rezumat","rezumatule":"rezumat","rezumatului":"rezumat","rezumau":"rezuma","rezumi":"rezuma","riali":"rial","rialii":"rial","rialilor":"rial","rialul":"rial","rialule":"rial","rialului":"rial","ribigita":["ribigită","ribigit","ribigita","ribigit"],"ribigite":"ribigit","ribigitele":"ribigit","ribigiti":"ribigit","ribigitii":"ribigit","ribigitul":"ribigit","riboflavine":"riboflavină","riboflavinei":"riboflavină","riboflavinele":"riboflavină","riboflavinelor":"riboflavină","ribonucleaze":"ribonuclează","ribonucleazei":"ribonuclează","ribonucleazele":"ribonuclează","ribonucleazelor":"ribonuclează","ribonucleica":["ribonucleică","ribonucleic","ribonucleica","ribonucleic"],"ribonucleice":"ribonucleic","ribonucleicele":"ribonucleic","ribonucleici":"ribonucleic","ribonucleicii":"ribonucleic","ribonucleicul":"ribonucleic","ribonucleoproteine":"ribonucleoproteină","ribonucleoproteinei":"ribonucleoproteină","ribonucleoproteinele":"ribonucleoproteină","ribonucleoproteinelor":"ribonucleoproteină","ribovirusul":"ribovirus","ribovirusule":"ribovirus","ribovirusului":"ribovirus","ribovirusuri":"ribovirus","ribovirusurile":"ribovirus","ribovirusurilor":"ribovirus","riboze":"riboză","ribozei":"riboză","ribozele":"riboză","ribozelor":"riboză","ribozomi":"ribozom","ribozomii":"ribozom","ribozomilor":"ribozom","ribozomul":"ribozom","ribozomule":"ribozom","ribozomului":"ribozom","ricanai":"ricana","ricanam":["ricanăm","ricana","ricanam","ricana"],"ricanand":"ricana","ricanara":"ricana","ricanaram":"ricana","ricanarati":"ricana","ricanarea":"ricanare","ricanari":"ricanare","ricanarii":"ricanare","ricanarile":"ricanare","ricanarilor":"ricanare","ricanase":"ricana","ricanasem":"ricana","ricanasera":"ricana","ricanaseram":"ricana","ricanaserati":"ricana","ricanasesi":"ricana","ricanasi":"ricana","ricanat":"ricana","ricanate":"ricanat","ricanatele":"ricanat","ricanatelor":"ricanat","ricanati":"ricana","ricanatul":"ricanat","ricanatule":"ricanat","ricanatului":"ricanat","ricanau":"ricana","ricaneaza":"ricana","ricanez":"ricana","ricanezi":"ricana","ricercare":"ricercar","ricercarele":"ricercar","ricercarelor":"ricercar","ricercarul":"ricercar","ricercarule":"ricercar","ricercarului":"ricercar","richite":"richită","richitei":"richită","richitele":"richită","richitelor":"richită","richiti":"richită","ricine":"ricină","ricinei":"ricină","ricinele":"ricină","ricinelor":"ricină","ricini":"ricin","ricinii":"ricin","ricinilor":"ricin","ricinul":"ricin","ricinule":"ricin","ricinului":"ricin","rickettsii":"rickettsia","rickettsioze":"rickettsioză","rickettsiozei":"rickettsioză","rickettsiozele":"rickettsioză","rickettsiozelor":"rickettsioză","ricosai":"ricoșa","ricosam":["ricoșăm","ricoșa","ricoșam","ricoșa"],"ricosand":"ricoșa","ricosara":"ricoșa","ricosaram":"ricoșa","ricosarati":"ricoșa","ricosase":"ricoșa","ricosasem":"ricoșa","ricosasera":"ricoșa","ricosaseram":"ricoșa","ricosaserati":"ricoșa","ricosasesi":"ricoșa","ricosasi":"ricoșa","ricosat":"ricoșa","ricosati":"ricoșa","ricosau":"ricoșa","ricoseaza":"ricoșa","ricosetul":"ricoșet","ricosetule":"ricoșet","ricosetului":"ricoșet","ricoseturi":"ricoșet","ricoseturile":"ricoșet","ricoseturilor":"ricoșet","ricoseul":"ricoșeu","ricoseule":"ricoșeu","ricoseului":"ricoșeu","ricoseuri":"ricoșeu","ricoseurile":"ricoșeu","ricoseurilor":"ricoșeu","ricosez":"ricoșa","ricosezi":"ricoșa","ricse":"ricșă","ricsei":"ricșă","ricsele":"ricșă","ricselor":"ricșă","rictusul":"rictus","rictusule":"rictus","rictusului":"rictus","rictusuri":"rictus","rictusurile":"rictus","rictusurilor":"rictus","ridai":"rida","ridam":["ridăm","rida","ridam","rida"],"ridand":"rida","ridara":"rida","ridaram":"rida","ridarati":"rida","ridarea":"ridare","ridari":"ridare","ridarii":"ridare","ridarile":"ridare","ridarilor":"ridare","ridase":"rida","ridasem":"rida","ridasera":"rida","ridaseram":"rida","ridaserati":"rida","ridasesi":"rida","ridasi":"rida","ridat":"rida","ridata":["ridată","ridat","ridata","ridat"],"ridate":"ridat","ridatele":"ridat","ridati":["ridați","rida","ridați","ridat"],"ridatii":"ridat","ridatul":"ridat","ridau":"rida","ride":"râde","rideaza":"rida","ridenta":["ridentă","rident","ridenta","rident"],"ridente":"rident","ridentele":"rident","ridenti":"rident","ridentii":"rident","ridentul":"rident","ridez":"rida","ridezi":"rida","ridic":"ridica","ridicai":"ridica","ridicam":["ridicăm","ridica","ridicam","ridica"],"ridicand":"ridica","ridicara":"ridica","ridicaram":"ridica","ridicarati":"ridica","ridicarea":"ridicare","ridicari":"ridicare","ridicarii":"ridicare","ridicarile":"ridicare","ridicarilor":"ridicare","ridicase":"ridica","ridicasem":"ridica","ridicasera":"ridica","ridicaseram":"ridica","ridicaserati":"ridica","ridicasesi":"ridica","ridicasi":"ridica","ridicat":"ridica","ridicat din umeri":"ridica din umeri","ridicata":["ridicată","ridicat","ridicata","ridicat"],"ridicate":"ridicat","ridicatele":"ridicat","ridicati":["ridicați","ridica","ridicați","ridicat"],"ridicatii":"ridicat","ridicatoare":"ridicător","ridicatoarele":"ridicător","ridicatoarelor":"ridicător","ridicatorul":"ridicător","ridicatorule":"ridicător","ridicatorului":"ridicător","ridicatul":"ridicat","ridicatule":"ridicat","ridicatului":"ridicat","ridicaturi":"ridicătură","ridicaturii":"ridicătură","ridicaturile":"ridicătură","ridicaturilor":"ridicătură","ridicau":"ridica","ridice":"ridica","ridice din umeri":"ridica din umeri","ridichea":"ridiche","ridichi":"ridiche","ridichia":"ridichie","ridichiei":"ridichie","ridichii":["ridichii","ridiche","ridichii","ridichie"],"ridichii salbatice":"ridiche sălbatică","ridichiile":"ridichie","ridichiilor":"ridichie","ridichile":"ridiche","ridichilor":"ridiche","ridichioare":"ridichioară","ridichioarei":"ridichioară","ridichioarele":"ridichioară","ridichioarelor":"ridichioară","ridici":"ridica","ridicola":["ridicolă","ridicol","ridicola","ridicol"],"ridicole":"ridicol","ridicolele":"ridicol","ridicoli":"ridicol","ridicolii":"ridicol","ridicolul":"ridicol","ridicula":["ridiculă","ridicul","ridicula","ridicul"],"ridicule":"ridicul","ridiculele":"ridicul","ridiculi":"ridicul","ridiculii":"ridicul","ridiculitatati":"ridiculitate","ridiculitatatii":"ridiculitate","ridiculitatatile":"ridiculitate","ridiculitatatilor":"ridiculitate","ridiculitatea":"ridiculitate","ridiculizai":"ridiculiza","ridiculizam":["ridiculizăm","ridiculiza","ridiculizam","ridiculiza"],"ridiculizand":"ridiculiza","ridiculizara":"ridiculiza","ridiculizaram":"ridiculiza","ridiculizarati":"ridiculiza","ridiculizarea":"ridiculizare","ridiculizari":"ridiculizare","ridiculizarii":"ridiculizare","ridiculizarile":"ridiculizare","ridiculizarilor":"ridiculizare","ridiculizase":"ridiculiza","ridiculizasem":"ridiculiza","ridiculizasera":"ridiculiza","ridiculizaseram":"ridiculiza","ridiculizaserati":"ridiculiza","ridiculizasesi":"ridiculiza","ridiculizasi":"ridiculiza","ridiculizat":"ridiculiza","ridiculizati":"ridiculiza","ridiculizau":"ridiculiza","ridiculizeaza":"ridiculiza","ridiculizez":"ridiculiza","ridiculizezi":"ridiculiza","ridiculoasa":["ridiculoasă","ridiculos","ridiculoasa","ridiculos"],"ridiculoase":"ridiculos","ridiculoasele":"ridiculos","ridiculosi":"ridiculos","ridiculosii":"ridiculos","ridiculosul":"ridiculos","ridiculozitatati":"ridiculozitate","ridiculozitatatii":"ridiculozitate","ridiculozitatatile":"ridiculozitate","ridiculozitatatilor":"ridiculozitate","ridiculozitatea":"ridiculozitate","ridiculul":"ridicul","ridul":"rid","ridule":"rid","ridului":"rid","riduri":"rid","ridurile":"rid","ridurilor":"rid","rieslingul":"riesling","rieslingule":"riesling","rieslingului":"riesling","rieslinguri":"riesling","rieslingurile":"riesling","rieslingurilor":"riesling","rifluri":"riflură","riflurii":"riflură","riflurile":"riflură","riflurilor":"riflură","riftul":"rift","riftule":"rift","riftului":"rift","rifturi":"rift","rifturile":"rift","rifturilor":"rift","rigai":"rigă","rigala":["rigală","rigal","rigala","rigal"],"rigale":"rigal","rigalele":"rigal","rigali":"rigal","rigalii":"rigal","rigalul":"rigal","rigani":"rigan","riganii":"rigan","riganilor":"rigan","riganul":"rigan","riganule":"rigan","riganului":"rigan","rigi":"rigă","rigida":["rigidă","rigid","rigida","rigid"],"rigide":"rigid","rigidele":"rigid","rigiditatea":"rigiditate","rigiditati":"rigiditate","rigiditatii":"rigiditate","rigiditatile":"rigiditate","rigiditatilor":"rigiditate","rigidizai":"rigidiza","rigidizam":["rigidizăm","rigidiza","rigidizam","rigidiza"],"rigidizand":"rigidiza","rigidizara":"rigidiza","rigidizaram":"rigidiza","rigidizarati":"rigidiza","rigidizarea":"rigidizare","rigidizari":"rigidizare","rigidizarii":"rigidizare","rigidizarile":"rigidizare","rigidizarilor":"rigidizare","rigidizase":"rigidiza","rigidizasem":"rigidiza","rigidizasera":"rigidiza","rigidizaseram":"rigidiza","rigidizaserati":"rigidiza","rigidizasesi":"rigidiza","rigidizasi":"rigidiza","rigidizat":"rigidiza","rigidizati":"rigidiza","rigidizau":"rigidiza","rigidizeaza":"rigidiza","rigidizez":"rigidiza","rigidizezi":"rigidiza","rigidul":"rigid","rigii":"rigă","rigilor":"rigă","rigipsul":"rigips","rigipsule":"rigips","rigipsului":"rigips","rigizi":"rigid","rigizii":"rigid","rigle":"riglă","rigle de calcul":"riglă de calcul","riglei":"riglă","riglele":"riglă","riglelor":"riglă","rigole":"rigolă","rigolei":"rigolă","rigolele":"rigolă","rigolelor":"rigolă","rigori":"rigoare","rigorismul":"rigorism","rigorismule":"rigorism","rigorismului":"rigorism","rigoriste":"rigoristă","rigoristei":"rigoristă","rigoristele":"rigoristă","rigoristelor":"rigoristă","rigoristi":"rigorist","rigoristii":"rigorist","rigoristilor":"rigorist","rigoristul":"rigorist","rigoristule":"rigorist","rigoristului":"rigorist","riguroasa":["riguroasă","riguros","riguroasa","riguros"],"riguroase":"riguros","riguroasele":"riguros","rigurosi":"riguros","rigurosii":"riguros","rigurosul":"riguros","rigurozitatea":"rigurozitate","rigurozitati":"rigurozitate","rigurozitatii":"rigurozitate","rigurozitatile":"rigurozitate","rigurozitatilor":"rigurozitate","rihtuitoarea":"rihtuitoare","rihtuitoarei":"rihtuitoare","rihtuitoarele":"rihtuitoare","rihtuitoarelor":"rihtuitoare","rije":"rijă","rijei":"rijă","rijele":"rijă","rijelor":"rijă","rile":"rilă","rilei":"rilă","rilele":"rilă","rilelor":"rilă","rim":["rîm","Râm","rim","Râm"],"rima":"râma","rimai":"rima","rimam":["rimăm","rima","rimam","rima"],"rimand":"rima","rimara":"rima","rimaram":"rima","rimarati":"rima","rimase":"rima","rimasem":"rima","rimasera":"rima","rimaseram":"rima","rimaserati":"rima","rimasesi":"rima","rimasi":"rima","rimat":"rima","rimata":["rimată","rimat","rimata","rimat"],"rimate":"rimat","rimatele":"rimat","rimati":["rimați","rima","rimați","rimat"],"rimatii":"rimat","rimatul":"rimat","rimau":"rima","rimbomb":"rimbomba","rimbombai":"rimbomba","rimbombam":["rimbombăm","rimbomba","rimbombam","rimbomba"],"rimbomband":"rimbomba","rimbombara":"rimbomba","rimbombaram":"rimbomba","rimbombarati":"rimbomba","rimbombase":"rimbomba","rimbombasem":"rimbomba","rimbombasera":"rimbomba","rimbombaseram":"rimbomba","rimbombaserati":"rimbomba","rimbombasesi":"rimbomba","rimbombasi":"rimbomba","rimbombat":"rimbomba","rimbombati":"rimbomba","rimbombau":"rimbomba","rimbombe":"rimbomba","rimbombi":"rimbomba","rime":"rimă","rimeaza":"rima","rimei":"rimă","rimelai":"rimela","rimelam":["rimelăm","rimela","rimelam","rimela"],"rimeland":"rimela","rimelara":"rimela","rimelaram":"rimela","rimelarati":"rimela","rimelarea":"rimelare","rimelari":"rimelare","rimelarii":"rimelare","rimelarile":"rimelare","rimelarilor":"rimelare","rimelase":"rimela","rimelasem":"rimela","rimelasera":"rimela","rimelaseram":"rimela","rimelaserati":"rimela","rimelasesi":"rimela","rimelasi":"rimela","rimelat":"rimela","rimelati":"rimela","rimelatul":"rimelat","rimelatule":"rimelat","rimelatului":"rimelat","rimelau":"rimela","rimele":"rimă","rimeleaza":"rimela","rimelez":"rimela","rimelezi":"rimela","rimelor":"rimă","rimelul":"rimel","rimelule":"rimel","rimelului":"rimel","rimeluri":"rimel","rimelurile":"rimel","rimelurilor":"rimel","rimez":"rima","rimezi":"rima","rimlean":"râmlean","rimlenesc":"râmlenesc","rinalgia":"rinalgie","rinalgiei":"rinalgie","rinalgii":"rinalgie","rinalgiile":"rinalgie","rinalgiilor":"rinalgie","rinascimentoul":"rinascimento","rinascimentoule":"rinascimento","rinascimentoului":"rinascimento","rincocefali":"rincocefal","rincocefalii":"rincocefal","rincocefalilor":"rincocefal","rincocefalul":"rincocefal","rincocefalule":"rincocefal","rincocefalului":"rincocefal","rindeaua":"rindea","rindelai":"rindela","rindelam":["rindelăm","rindela","rindelam","rindela"],"rindeland":"rindela","rindelara":"rindela","rindelaram":"rindela","rindelarati":"rindela","rindelarea":"rindelare","rindelari":["rindelari","rindelar","rindelări","rindelare"],"rindelarii":["rindelarii","rindelar","rindelării","rindelare"],"rindelarile":"rindelare","rindelarilor":["rindelarilor","rindelar","rindelărilor","rindelare"],"rindelarul":"rindelar","rindelarule":"rindelar","rindelarului":"rindelar","rindelase":"rindela","rindelasem":"rindela","rindelasera":"rindela","rindelaseram":"rindela","rindelaserati":"rindela","rindelasesi":"rindela","rindelasi":"rindela","rindelat":"rindela","rindelati":"rindela","rindelau":"rindela","rindele":"rindea","rindeleaza":"rindela","rindelei":"rindea","rindelele":"rindea","rindelelor":"rindea","rindelez":"rindela","rindelezi":"rindela","rindeluia":"rindelui","rindeluiai":"rindelui","rindeluiam":"rindelui","rindeluiati":"rindelui","rindeluiau":"rindelui","rindeluiesc":"rindelui","rindeluieste":"rindelui","rindeluiesti":"rindelui","rindeluii":"rindelui","rindeluim":"rindelui","rindeluind":"rindelui","rindeluira":"rindelui","rindeluiram":"rindelui","rindeluirati":"rindelui","rindeluirea":"rindeluire","rindeluiri":"rindeluire","rindeluirii":"rindeluire","rindeluirile":"rindeluire","rindeluirilor":"rindeluire","rindeluise":"rindelui","rindeluisem":"rindelui","rindeluisera":"rindelui","rindeluiseram":"rindelui","rindeluiserati":"rindelui","rindeluisesi":"rindelui","rindeluisi":"rindelui","rindeluit":"rindelui","rindeluiti":"rindelui","rindeluitul":"rindeluit","rindeluitule":"rindeluit","rindeluitului":"rindeluit","rindirea":"rindire","rindiri":"rindire","rindirii":"rindire","rindirile":"rindire","rindirilor":"rindire","rine":"rină","rinei":"rină","rinele":"rină","rinelor":"rină","rinencefale":"rinencefal","rinencefalele":"rinencefal","rinencefalelor":"rinencefal","rinencefalul":"rinencefal","rinencefalule":"rinencefal","rinencefalului":"rinencefal","rinfortul":"rinfort","rinfortule":"rinfort","rinfortului":"rinfort","rinforturi":"rinfort","rinforturile":"rinfort","rinforturilor":"rinfort","ringhispilul":"ringhișpil","ringhispilule":"ringhișpil","ringhispilului":"ringhișpil","ringhispiluri":"ringhișpil","ringhispilurile":"ringhișpil","ringhispilurilor":"ringhișpil","ringlote":"ringlotă","ringlotei":"ringlotă","ringlotele":"ringlotă","ringlotelor":"ringlotă","ringuri de dans":"ring de dans","rinichii":"rinichi","rinichilor":"rinichi","rinichiul":"rinichi","rinichiule":"rinichi","rinichiului":"rinichi","rinite":"rinită","rinitei":"rinită","rinitele":"rinită","rinitelor":"rinită","rinoceri":"rinocer","rinocerii":"rinocer","rinocerilor":"rinocer","rinocerizai":"rinoceriza","rinocerizam":["rinocerizăm","rinoceriza","rinocerizam","rinoceriza"],"rinocerizand":"rinoceriza","rinocerizara":"rinoceriza","rinocerizaram":"rinoceriza","rinocerizarati":"rinoceriza","rinocerizarea":"rinocerizare","rinocerizari":"rinocerizare","rinocerizarii":"rinocerizare","rinocerizase":"rinoceriza","rinocerizasem":"rinoceriza","rinocerizasera":"rinoceriza","rinocerizaseram":"rinoceriza","rinocerizaserati":"rinoceriza","rinocerizasesi":"rinoceriza","rinocerizasi":"rinoceriza","rinocerizat":"rinoceriza","rinocerizati":"rinoceriza","rinocerizau":"rinoceriza","rinocerizeaza":"rinoceriza","rinocerizez":"rinoceriza","rinocerizezi":"rinoceriza","rinocerul":"rinocer","rinocerule":"rinocer","rinocerului":"rinocer","rinofaringele":"rinofaringe","rinofaringelor":"rinofaringe","rinofaringelui":"rinofaringe","rinofaringite":"rinofaringită","rinofaringitei":"rinofaringită","rinofaringitele":"rinofaringită","rinofaringitelor":"rinofaringită","rinofonia":"rinofonie","rinofoniei":"rinofonie","rinofonii":"rinofonie","rinofoniile":"rinofonie","rinofoniilor":"rinofonie","rinolalia":"rinolalie","rinolaliei":"rinolalie","rinolalii":"rinolalie","rinolite":"rinolit","rinolitele":"rinolit","rinolitelor":"rinolit","rinolitul":"rinolit","rinolitule":"rinolit","rinolitului":"rinolit","rinologe":"rinologă","rinologei":"rinologă","rinologele":"rinologă","rinologelor":"rinologă","rinologi":"rinolog","rinologia":"rinologie","rinologica":["rinologică","rinologic","rinologica","rinologic"],"rinologice":"rinologic","rinologicele":"rinologic","rinologici":"rinologic","rinologicii":"rinologic","rinologicul":"rinologic","rinologiei":"rinologie","rinologii":["rinologii","rinolog","rinologii","rinologie"],"rinologilor":"rinolog","rinologul":"rinolog","rinologule":"rinolog","rinologului":"rinolog","rinoplastia":"rinoplastie","rinoplastica":["rinoplastică","rinoplastic","rinoplastica","rinoplastic"],"rinoplastice":"rinoplastic","rinoplasticele":"rinoplastic","rinoplastici":"rinoplastic","rinoplasticii":"rinoplastic","rinoplasticul":"rinoplastic","rinoplastiei":"rinoplastie","rinoplastii":"rinoplastie","rinoplastiile":"rinoplastie","rinoplastiilor":"rinoplastie","rinoragia":"rinoragie","rinoragiei":"rinoragie","rinoragii":"rinoragie","rinoragiile":"rinoragie","rinoragiilor":"rinoragie","rinoreea":"rinoree","rinoreei":"rinoree","rinoscoape":"rinoscop","rinoscoapele":"rinoscop","rinoscoapelor":"rinoscop","rinoscopia":"rinoscopie","rinoscopiei":"rinoscopie","rinoscopii":"rinoscopie","rinoscopiile":"rinoscopie","rinoscopiilor":"rinoscopie","rinoscopul":"rinoscop","rinoscopule":"rinoscop","rinoscopului":"rinoscop","riolite":"riolit","riolitele":"riolit","riolitelor":"riolit","riolitul":"riolit","riolitule":"riolit","riolitului":"riolit","ripa":"râpă","ripe":"ripă","ripei":"ripă","ripele":"ripă","ripelor":"ripă","ripostai":"riposta","ripostam":["ripostăm","riposta","ripostam","riposta"],"ripostand":"riposta","ripostara":"riposta","ripostaram":"riposta","ripostarati":"riposta","ripostase":"riposta","ripostasem":"riposta","ripostasera":"riposta","ripostaseram":"riposta","ripostaserati":"riposta","ripostasesi":"riposta","ripostasi":"riposta","ripostat":"riposta","ripostati":"riposta","ripostau":"riposta","riposte":"ripostă","riposteaza":"riposta","ripostei":"ripostă","ripostele":"ripostă","ripostelor":"ripostă","ripostez":"riposta","ripostezi":"riposta","ris":"râs","risari":"risar","risarii":"risar","risarilor":"risar","risarul":"risar","risarule":"risar","risarului":"risar","risc":"risca","risca":"Râșca","riscai":"risca","riscam":["riscăm","risca","riscam","risca"],"riscand":"risca","riscanii":"Rîșcani","riscanilor":"Rîșcani","riscanta":["riscantă","riscant","riscanta","riscant"],"riscante":"riscant","riscantele":"riscant","riscanti":"riscant","riscantii":"riscant","riscantul":"riscant","riscara":"risca","riscaram":"risca","riscarati":"risca","riscasaul":"rișcașă","riscasaule":"rișcașă","riscasaului":"rișcașă","riscase":"risca","riscasem":"risca","riscasera":"risca","riscaseram":"risca","riscaserati":"risca","riscasesi":"risca","riscasi":"risca","riscat":"risca","riscata":["riscată","riscat","riscata","riscat"],"riscate":"riscat","riscatele":"riscat","riscati":["riscați","risca","riscați","riscat"],"riscatii":"riscat","riscatul":"riscat","riscau":"risca","riscul":"risc","riscule":"risc","riscului":"risc","riscuri":"risc","riscuri valutare":"risc valutar","riscurile":"risc","riscurilor":"risc","risipe":"risipă","risipea":"risipi","risipeai":"risipi","risipeam":"risipi","risipeati":"risipi","risipeau":"risipi","risipei":"risipă","risipele":"risipă","risipelnica":["risipelnică","risipelnic","risipelnica","risipelnic"],"risipelnice":"risipelnic","risipelnicele":"risipelnic","risipelnici":"risipelnic","risipelnicii":"risipelnic","risipelnicul":"risipelnic","risipelor":"risipă","risipesc":"risipi","risipeste":"risipi","risipesti":"risipi","risipiciunea":"risipiciune","risipiciuni":"risipiciune","risipiciunii":"risipiciune","risipiciunile":"risipiciune","risipiciunilor":"risipiciune","risipii":"risipi","risipim":"risipi","risipind":"risipi","risipira":"risipi","risipiram":"risipi","risipirati":"risipi","risipirea":"risipire","risipiri":"risipire","risipirii":"risipire","risipirile":"risipire","risipirilor":"risipire","risipise":"risipi","risipisem":"risipi","risipisera":"risipi","risipiseram":"risipi","risipiserati":"risipi","risipisesi":"risipi","risipisi":"risipi","risipit":"risipi","risipita":["risipită","risipit","risipita","risipit"],"risipite":"risipit","risipitele":"risipit","risipiti":["risipiți","risipi","risipiți","risipit"],"risipitii":"risipit","risipitoare":"risipitor","risipitoarea":"risipitor","risipitoarele":"risipitor","risipitori":"risipitor","risipitorii":"risipitor","risipitorul":"risipitor","risipitul":"risipit","risipituri":"risipitură","risipiturii":"risipitură","risipiturile":"risipitură","risipiturilor":"risipitură","risipoasa":["risipoasă","risipos","risipoasa","risipos"],"risipoase":"risipos","risipoasele":"risipos","risiposi":"risipos","risiposii":"risipos","risiposul":"risipos","ristavul":"ristav","ristavule":"ristav","ristavului":"ristav","ristavuri":"ristav","ristavurile":"ristav","ristavurilor":"ristav","riste":["riște","risca","riște","rișcă"],"ristei":"rișcă","ristele":"rișcă","ristelor":"rișcă","risti":"risca","ritidomul":"ritidom","ritidomule":"ritidom","ritidomului":"ritidom","ritidomuri":"ritidom","ritidomurile":"ritidom","ritidomurilor":"ritidom","ritilestii mici":"Rotileștii Mici","ritmai":"ritma","ritmam":["ritmăm","ritma","ritmam","ritma"],"ritmand":"ritma","ritmara":"ritma","ritmaram":"ritma","ritmarati":"ritma","ritmase":"ritma","ritmasem":"ritma","ritmasera":"ritma","ritmaseram":"ritma","ritmaserati":"ritma","ritmasesi":"ritma","ritmasi":"ritma","ritmat":"ritma","ritmata":["ritmată","ritmat","ritmata","ritmat"],"ritmate":"ritmat","ritmatele":"ritmat","ritmati":["ritmați","ritma","ritmați","ritmat"],"ritmatii":"ritmat","ritmatul":"ritmat","ritmau":"ritma","ritmeaza":"ritma","ritmez":"ritma","ritmezi":"ritma","ritmica":["ritmică","ritmic","ritmica","ritmic"],"ritmice":"ritmic","ritmicele":"ritmic","ritmici":["ritmici","ritmic","ritmici","ritmică"],"ritmicii":["ritmicii","ritmic","ritmicii","ritmică"],"ritmicile":"ritmică","ritmicilor":"ritmică","ritmicitatea":"ritmicitate","ritmicitati":"ritmicitate","ritmicitatii":"ritmicitate","ritmicitatile":"ritmicitate","ritmicitatilor":"ritmicitate","ritmicul":"ritmic","ritmografia":"ritmografie","ritmografiei":"ritmografie","ritmografii":"ritmografie","ritmografiile":"ritmografie","ritmografiilor":"ritmografie","ritmoterapia":"ritmoterapie","ritmoterapiei":"ritmoterapie","ritmoterapii":"ritmoterapie","ritmul":"ritm","ritmule":"ritm","ritmului":"ritm","ritmuri":"ritm","ritmurile":"ritm","ritmurilor":"ritm","ritologia":"ritologie","ritologiei":"ritologie","ritologii":"ritologie","ritologiile":"ritologie","ritologiilor":"ritologie","ritori":"ritor","ritoria":"ritorie","ritorice":"ritorică","ritoricei":"ritorică","ritoriei":"ritorie","ritorii":["ritorii","ritor","ritorii","ritorie"],"ritoriile":"ritorie","ritoriilor":"ritorie","ritorilor":"ritor","ritoris":"ritorisi","ritorise":"ritorisi","ritorisea":"ritorisi","ritoriseai":"ritorisi","ritoriseam":"ritorisi","ritoriseati":"ritorisi","ritoriseau":"ritorisi","ritorisie":"ritorisi","ritorisii":"ritorisi","ritorisim":"ritorisi","ritorisind":"ritorisi","ritorisira":"ritorisi","ritorisiram":"ritorisi","ritorisirati":"ritorisi","ritorisise":"ritorisi","ritorisisem":"ritorisi","ritorisisera":"ritorisi","ritorisiseram":"ritorisi","ritorisiserati":"ritorisi","ritorisisesi":"ritorisi","ritorisisi":"ritorisi","ritorisit":"ritorisi","ritorisiti":"ritorisi","ritornele":"ritornelă","ritornelei":"ritornelă","ritornelele":"ritornelă","ritornelelor":"ritornelă","ritorul":"ritor","ritorule":"ritor","ritorului":"ritor","rituali":"ritual","ritualica":["ritualică","ritualic","ritualica","ritualic"],"ritualice":"ritualic","ritualicele":"ritualic","ritualici":"ritualic","ritualicii":"ritualic","ritualicul":"ritualic","ritualile":"ritual","ritualilor":"ritual","ritualismul":"ritualism","ritualismule":"ritualism","ritualismului":"ritualism","ritualista":["ritualistă","ritualist","ritualista","ritualist"],"ritualiste":["ritualiste","ritualist","ritualiste","ritualistă"],"ritualistei":"ritualistă","ritualistele":["ritualistele","ritualist","ritualistele","ritualistă"],"ritualistelor":"ritualistă","ritualisti":"ritualist","ritualistii":"ritualist","ritualistul":"ritualist","ritualizai":"ritualiza","ritualizam":["ritualizăm","ritualiza","ritualizam","ritualiza"],"ritualizand":"ritualiza","ritualizara":"ritualiza","ritualizaram":"ritualiza","ritualizarati":"ritualiza","ritualizase":"ritualiza","ritualizasem":"ritualiza","ritualizasera":"ritualiza","ritualizaseram":"ritualiza","ritualizaserati":"ritualiza","ritualizasesi":"ritualiza","ritualizasi":"ritualiza","ritualizat":"ritualiza","ritualizati":"ritualiza","ritualizau":"ritualiza","ritualizeaza":"ritualiza","ritualizez":"ritualiza","ritualizezi":"ritualiza","ritualul":"ritual","ritualule":"ritual","ritualului":"ritual","ritul":"rit","ritule":"rit","ritului":"rit","rituri":"rit","riturile":"rit","riturilor":"rit","riturnele":"riturnelă","riturnelei":"riturnelă","riturnelele":"riturnelă","riturnelelor":"riturnelă","riu":"râu","rivale":"rivală","rivalei":"rivală","rivalele":"rivală","rivalelor":"rivală","rivali":"rival","rivaliceasca":["rivalicească","rivalicesc","rivaliceasca","rivalicesc"],"rivalicescul":"rivalicesc","rivalicesti":"rivalicesc","rivalicestii":"rivalicesc","rivalicestile":"rivalicesc","rivalii":"rival","rivalilor":"rival","rivalitatea":"rivalitate","rivalitati":"rivalitate","rivalitatii":"rivalitate","rivalitatile":"rivalitate","rivalitatilor":"rivalitate","rivalizai":"rivaliza","rivalizam":["rivalizăm","rivaliza","rivalizam","rivaliza"],"rivalizand":"rivaliza","rivalizara":"rivaliza","rivalizaram":"rivaliza","rivalizarati":"rivaliza","rivalizarea":"rivalizare","rivalizari":"rivalizare","rivalizarii":"rivalizare","rivalizarile":"rivalizare","rivalizarilor":"rivalizare","rivalizase":"rivaliza","rivalizasem":"rivaliza","rivalizasera":"rivaliza","rivalizaseram":"rivaliza","rivalizaserati":"rivaliza","rivalizasesi":"rivaliza","rivalizasi":"rivaliza","rivalizat":"rivaliza","rivalizati":"rivaliza","rivalizau":"rivaliza","rivalizeaza":"rivaliza","rivalizez":"rivaliza","rivalizezi":"rivaliza","rivalul":"rival","rivalule":"rival","rivalului":"rival","rivanolul":"rivanol","rivanolule":"rivanol","rivanolului":"rivanol","riverana":["riverană","riveran","riverana","riveran"],"riverane":"riveran","riveranele":"riveran","riverani":"riveran","riveranii":"riveran","riveranilor":"riveran","riveranul":"riveran","riveranule":"riveran","riveranului":"riveran","riviere":"rivieră","rivierei":"rivieră","rivierele":"rivieră","rivierelor":"rivieră","rizafce":"rizafcă","rizafcei":"rizafcă","rizafcele":"rizafcă","rizafcelor":"rizafcă","rizeria":"rizerie","rizeriei":"rizerie","rizerii":"rizerie","rizeriile":"rizerie","rizeriilor":"rizerie","rizibila":["rizibilă","rizibil","rizibila","rizibil"],"rizibile":"rizibil","rizibilele":"rizibil","rizibili":"rizibil","rizibilii":"rizibil","rizibilitatati":"rizibilitate","rizibilitatatii":"rizibilitate","rizibilitatatile":"rizibilitate","rizibilitatatilor":"rizibilitate","rizibilitatea":"rizibilitate","rizibilul":"rizibil","rizicul":"rizic","rizicule":"rizic","rizicultori":"rizicultor","rizicultorii":"rizicultor","rizicultorilor":"rizicultor","rizicultorul":"rizicultor","rizicultorule":"rizicultor","rizicultorului":"rizicultor","riziculture":"rizicultură","riziculturei":"rizicultură","rizicului":"rizic","rizicuri":"rizic","rizicurile":"rizic","rizicurilor":"rizic","riziforma":["riziformă","riziform","riziforma","riziform"],"riziforme":"riziform","riziformele":"riziform","riziformi":"riziform","riziformii":"riziform","riziformul":"riziform","rizile":"rizil","rizilele":"rizil","rizilelor":"rizil","rizilul":"rizil","rizilule":"rizil","rizilului":"rizil","rizoatona":["rizoatonă","rizoaton","rizoatona","rizoaton"],"rizoatone":"rizoaton","rizoatonele":"rizoaton","rizoatoni":"rizoaton","rizoatonii":"rizoaton","rizoatonul":"rizoaton","rizobi":"rizobiu","rizobii":"rizobiu","rizobilor":"rizobiu","rizobiuul":"rizobiu","rizobiuule":"rizobiu","rizobiuului":"rizobiu","rizoctonioze":"rizoctonioză","rizoctoniozei":"rizoctonioză","rizoctoniozele":"rizoctonioză","rizoctoniozelor":"rizoctonioză","rizoderme":"rizodermă","rizodermei":"rizodermă","rizodermele":"rizodermă","rizodermelor":"rizodermă","rizofaga":["rizofagă","rizofag","rizofaga","rizofag"],"rizofage":"rizofag","rizofagele":"rizofag","rizofagi":"rizofag","rizofagii":"rizofag","rizofagul":"rizofag","rizofora":["rizoforă","rizofor","rizofora","rizofor"],"rizofore":"rizofor","rizoforele":"rizofor","rizofori":"rizofor","rizoforii":"rizofor","rizoforul":"rizofor","rizoidul":"rizoid","rizoidule":"rizoid","rizoidului":"rizoid","rizoizi":"rizoid","rizoizii":"rizoid","rizoizilor":"rizoid","rizomi":"rizom","rizomii":"rizom","rizomilor":"rizom","rizomolica":["rizomolică","rizomolic","rizomolica","rizomolic"],"rizomolice":"rizomolic","rizomolicele":"rizomolic","rizomolici":"rizomolic","rizomolicii":"rizomolic","rizomolicul":"rizomolic","rizomul":"rizom","rizomule":"rizom","rizomului":"rizom","rizopode":"rizopod","rizopodele":"rizopod","rizopodelor":"rizopod","rizopodul":"rizopod","rizopodule":"rizopod","rizopodului":"rizopod","rizosfere":"rizosferă","rizosferei":"rizosferă","rizosferele":"rizosferă","rizosferelor":"rizosferă","rizotoul":"rizoto","rizotoule":"rizoto","rizotoului":"rizoto","roabe":"roabă","roabei":"roabă","roabele":"roabă","roabelor":"roabă","roada":"roade","roade":["roade","roadă","roade","rod"],"roadei":"roadă","roadele":["roadele","roadă","roadele","rod"],"roadelor":["roadelor","roadă","roadelor","rod"],"roadem":"roade","roaderea":"roadere","roaderi":"roadere","roaderii":"roadere","roaderile":"roadere","roaderilor":"roadere","roadeti":"roade","roadstere":"roadster","roadsterele":"roadster","roadsterelor":"roadster","roadsterul":"roadster","roadsterule":"roadster","roadsterului":"roadster","roaga":"ruga","roage":"ruga","roaiba":["roaibă","roib","roaiba","roib"],"roaibe":"roib","roaibele":"roib","roamingul":"roaming","roamingule":"roaming","roamingului":"roaming","roasa":["roasă","ros","roasa","ros"],"roase":["roase","roade","roase","ros"],"roasele":"ros","roasera":"roade","roaseram":"roade","roaserati":"roade","roast beeful":"roast beef","roast beefule":"roast beef","roast beefului":"roast beef","roast beefuri":"roast beef","roast beefurile":"roast beef","roast beefurilor":"roast beef","robacea":"robace","robacele":"robace","robaci":"robace","robacii":"robace","robalia":"robălie","robaliei":"robălie","robalii":"robălie","robaliile":"robălie","robaliilor":"robălie","robasi":"robaș","robasii":"robaș","robasilor":"robaș","robasul":"robaș","robasule":"robaș","robasului":"robaș","robe":"robă","robea":"robi","robeai":"robi","robeam":"robi","robeasca":["robească","robesc","robeasca","robesc"],"robeati":"robi","robeau":"robi","robei":"robă","robele":"robă","robelor":"robă","robesc":"robi","robescul":"robesc","robeste":"robi","robesti":["robești","robesc","robești","robi"],"robestii":"robesc","robestile":"robesc","robi":"rob","robiciunea":"robiciune","robiciuni":"robiciune","robiciunii":"robiciune","robii":["robii","rob","robii","robi"],"robilor":"rob","robim":"robi","robind":"robi","robinete":"robinet","robinsonade":"robinsonadă","robinsonadei":"robinsonadă","robinsonadele":"robinsonadă","robinsonadelor":"robinsonadă","robira":"robi","robiram":"robi","robirati":"robi","robirea":"robire","robiri":"robire","robirii":"robire","robirile":"robire","robirilor":"robire","robise":"robi","robisem":"robi","robisera":"robi","robiseram":"robi","robiserati":"robi","robisesi":"robi","robisi":"robi","robit":"robi","robita":["robită","robit","robita","robit"],"robite":"robit","robitele":"robit","robiti":["robiți","robi","robiți","robit"],"robitii":"robit","robitoare":"robitor","robitoarea":"robitor","robitoarele":"robitor","robitori":"robitor","robitorii":"robitor","robitorul":"robitor","robitul":"robit","robituri":"robitură","robiturii":"robitură","robiturile":"robitură","robiturilor":"robitură","robotaul":"robotă","robotaule":"robotă","robotaului":"robotă","robotea":"roboti","roboteai":"roboti","roboteam":"roboti","roboteati":"roboti","roboteau":"roboti","robotehnice":"robotehnică","robotehnicei":"robotehnică","robotei":"roboțel","roboteii":"roboțel","roboteilor":"roboțel","roboteli":"roboteală","robotelii":"roboteală","robotelile":"roboteală","robotelilor":"roboteală","robotelul":"roboțel","robotelule":"roboțel","robotelului":"roboțel","robotesc":"roboti","roboteste":"roboti","robotesti":"roboti","roboti":"robot","robotica":["robotică","robotic","robotica","robotic"],"robotice":["robotice","robotic","robotice","robotică"],"roboticei":"robotică","roboticele":["roboticele","robotic","roboticele","robotică"],"roboticelor":"robotică","robotici":"robotic","roboticii":"robotic","roboticul":"robotic","robotii":["roboții","robot","robotii","roboti"],"robotilor":"robot","robotim":"roboti","robotind":"roboti","robotira":"roboti","robotiram":"roboti","robotirati":"roboti","robotise":"roboti","robotisem":"roboti","robotisera":"roboti","robotiseram":"roboti","robotiserati":"roboti","robotisesi":"roboti","robotisi":"roboti","robotit":"roboti","robotiti":"roboti","robotitul":"robotit","robotitule":"robotit","robotitului":"robotit","robotizai":"robotiza","robotizam":["robotizăm","robotiza","robotizam","robotiza"],"robotizand":"robotiza","robotizara":"robotiza","robotizaram":"robotiza","robotizarati":"robotiza","robotizarea":"robotizare","robotizari":"robotizare","robotizarii":"robotizare","robotizarile":"robotizare","robotizarilor":"robotizare","robotizase":"robotiza","robotizasem":"robotiza","robotizasera":"robotiza","robotizaseram":"robotiza","robotizaserati":"robotiza","robotizasesi":"robotiza","robotizasi":"robotiza","robotizat":"robotiza","robotizata":["robotizată","robotizat","robotizata","robotizat"],"robotizate":"robotizat","robotizatele":"robotizat","robotizati":["robotizați","robotiza","robotizați","robotizat"],"robotizatii":"robotizat","robotizatul":"robotizat","robotizau":"robotiza","robotizeaza":"robotiza","robotizez":"robotiza","robotizezi":"robotiza","robotnici":"robotnic","robotnicii":"robotnic","robotnicilor":"robotnic","robotnicul":"robotnic","robotnicule":"robotnic","robotnicului":"robotnic","robotologia":"robotologie","robotologiei":"robotologie","robotologii":"robotologie","robotul":"robot","robotule":"robot","robotului":"robot","robsagul":"robșag","robsagule":"robșag","robsagului":"robșag","robsaguri":"robșag","robsagurile":"robșag","robsagurilor":"robșag","robsoare":"robșoară","robsoarei":"robșoară","robsoarele":"robșoară","robsoarelor":"robșoară","robul":"rob","robule":"rob","robuleti":"robuleț","robuletii":"robuleț","robuletilor":"robuleț","robuletul":"robuleț","robuletule":"robuleț","robuletului":"robuleț","robulite":"robuliță","robulitei":"robuliță","robulitele":"robuliță","robulitelor":"robuliță","robului":"rob","roburite":"roburit","roburitele":"roburit","roburitelor":"roburit","roburitul":"roburit","roburitule":"roburit","roburitului":"roburit","robusta":["robustă","robust","robusta","robust"],"robuste":"robust","robustele":"robust","robustetea":"robustețe","robusteti":"robustețe","robustetii":"robustețe","robusti":"robust","robusticela":["robusticelă","robusticel","robusticela","robusticel"],"robusticele":"robusticel","robusticelele":"robusticel","robusticeli":"robusticel","robusticelii":"robusticel","robusticelul":"robusticel","robustii":"robust","robustul":"robust","robuti":"robuț","robutii":"robuț","robutilor":"robuț","robutul":"robuț","robutule":"robuț","robutului":"robuț","rocade":"rocadă","rocadei":"rocadă","rocadele":"rocadă","rocadelor":"rocadă","rocamboleasca":["rocambolească","rocambolesc","rocamboleasca","rocambolesc"],"rocambolescul":"rocambolesc","rocambolesti":"rocambolesc","rocambolestii":"rocambolesc","rocambolestile":"rocambolesc","rocaria":"rocărie","rocariei":"rocărie","rocarii":"rocărie","rocariile":"rocărie","rocariilor":"rocărie","rochea":"roche","rochi":"roche","rochii":["rochii","roche","rochii","rochie"],"rochile":"roche","rochilor":"roche","rochioare":"rochioară","rochioarei":"rochioară","rochioarele":"rochioară","rochioarelor":"rochioară","rochite":"rochiță","rochitei":"rochiță","rochitele":"rochiță","rochitelor":"rochiță","roci":"rocă","roci magmatice":"rocă magmatică","roci metamorfice":"rocă metamorfică","roci sedimentare":"rocă sedimentară","rocii":"rocă","rocile":"rocă","rocilor":"rocă","rockeri":"rocker","rockerii":"rocker","rockerilor":"rocker","rockerul":"rocker","rockerule":"rocker","rockerului":"rocker","rockul":"rock","rockule":"rock","rockului":"rock","rockuri":"rock","rockurile":"rock","rockurilor":"rock","rocoine":"rocoină","rocoinei":"rocoină","rocoinele":"rocoină","rocoinelor":"rocoină","rocosani":"rocoșan","rocosanii":"rocoșan","rocosanilor":"rocoșan","rocosanul":"rocoșan","rocosanule":"rocoșan","rocosanului":"rocoșan","rocosele":"rocoșeală","rocoselei":"rocoșeală","rocoselele":"rocoșeală","rocoselelor":"rocoșeală","rocoseli":"rocoșeală","rocoselnici":"rocoșelnic","rocoselnicii":"rocoșelnic","rocoselnicilor":"rocoșelnic","rocoselnicul":"rocoșelnic","rocoselnicule":"rocoșelnic","rocoselnicului":"rocoșelnic","rocosenia":"rocoșenie","rocoseniei":"rocoșenie","rocosenii":"rocoșenie","rocoseniile":"rocoșenie","rocoseniilor":"rocoșenie","rocosirea":"rocoșire","rocosiri":"rocoșire","rocosirii":"rocoșire","rocosirile":"rocoșire","rocosirilor":"rocoșire","rocosituri":"rocoșitură","rocositurii":"rocoșitură","rocositurile":"rocoșitură","rocositurilor":"rocoșitură","rocosul":"rocoș","rocosule":"rocoș","rocosului":"rocoș","rocosuri":"rocoș","rocosurile":"rocoș","rocosurilor":"rocoș","rod":"roade","rodaje":"rodaj","rodajele":"rodaj","rodajelor":"rodaj","rodajul":"rodaj","rodajule":"rodaj","rodajului":"rodaj","rodamine":"rodamină","rodaminei":"rodamină","rodaminele":"rodamină","rodaminelor":"rodamină","rodante":"rodanță","rodantei":"rodanță","rodantele":"rodanță","rodantelor":"rodanță","rodea":["rodea","roade","rodea","rodi"],"rodeai":["rodeai","roade","rodeai","rodi"],"rodeam":["rodeam","roade","rodeam","rodi"],"rodeati":["rodeați","roade","rodeați","rodi"],"rodeau":["rodeau","roade","rodeau","rodi"],"rodeiul":"rodei","rodeiule":"rodei","rodeiului":"rodei","rodenticidul":"rodenticid","rodenticidule":"rodenticid","rodenticidului":"rodenticid","rodenticizi":"rodenticid","rodenticizii":"rodenticid","rodenticizilor":"rodenticid","rodeoul":"rodeo","rodeoule":"rodeo","rodeoului":"rodeo","rodesc":"rodi","rodeste":"rodi","rodesti":"rodi","rodia":"rodie","rodiei":"rodie","rodieri":"rodier","rodierii":"rodier","rodierilor":"rodier","rodierul":"rodier","rodierule":"rodier","rodierului":"rodier","rodii":["rodii","rodi","rodii","rodie","rodii","rodiu"],"rodiii":"rodiu","rodiile":"rodie","rodiilor":["rodiilor","rodie","rodiilor","rodiu"],"rodim":"rodi","rodind":"rodi","rodine":"rodin","rodinele":"rodin","rodinelor":"rodin","rodinul":"rodin","rodinule":"rodin","rodinului":"rodin","rodioare":"rodioară","rodioarei":"rodioară","rodioarele":"rodioară","rodioarelor":"rodioară","rodira":"rodi","rodiram":"rodi","rodirati":"rodi","rodirea":"rodire","rodiri":"rodire","rodirii":"rodire","rodirile":"rodire","rodirilor":"rodire","rodise":"rodi","rodisem":"rodi","rodisera":"rodi","rodiseram":"rodi","rodiserati":"rodi","rodisesi":"rodi","rodisi":"rodi","rodit":"rodi","roditi":"rodi","roditoare":"roditor","roditoarea":"roditor","roditoarele":"roditor","roditori":"roditor","roditoria":"roditoriu","roditorie":"roditoriu","roditorii":["roditorii","roditor","roditorii","roditoriu"],"roditoriii":"roditoriu","roditoriile":"roditoriu","roditoriul":"roditoriu","roditorul":"roditor","rodiul":"rodiu","rodiule":"rodiu","rodiului":"rodiu","rodnica":["rodnică","rodnic","rodnica","rodnic"],"rodnice":"rodnic","rodnicea":"rodnici","rodniceai":"rodnici","rodniceam":"rodnici","rodniceati":"rodnici","rodniceau":"rodnici","rodnicele":"rodnic","rodnicesc":"rodnici","rodniceste":"rodnici","rodnicesti":"rodnici","rodnici":"rodnic","rodnicia":"rodnicie","rodniciei":"rodnicie","rodnicii":["rodnicii","rodnic","rodnicii","rodnici","rodnicii","rodnicie"],"rodniciile":"rodnicie","rodniciilor":"rodnicie","rodnicim":"rodnici","rodnicind":"rodnici","rodnicira":"rodnici","rodniciram":"rodnici","rodnicirati":"rodnici","rodnicise":"rodnici","rodnicisem":"rodnici","rodnicisera":"rodnici","rodniciseram":"rodnici","rodniciserati":"rodnici","rodnicisesi":"rodnici","rodnicisi":"rodnici","rodnicit":"rodnici","rodniciti":"rodnici","rodnicul":"rodnic","rodoasa":["rodoasă","rodos","rodoasa","rodos"],"rodoase":"rodos","rodoasele":"rodos","rodocrozite":"rodocrozit","rodocrozitele":"rodocrozit","rodocrozitelor":"rodocrozit","rodocrozitul":"rodocrozit","rodocrozitule":"rodocrozit","rodocrozitului":"rodocrozit","rododafini":"rododafin","rododafinii":"rododafin","rododafinilor":"rododafin","rododafinul":"rododafin","rododafinule":"rododafin"};
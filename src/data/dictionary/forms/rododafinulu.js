@@ -0,0 +1 @@
+export default {"rododafinului":"rododafin","rododendri":"rododendru","rododendroni":"rododendron","rododendronii":"rododendron","rododendronilor":"rododendron","rododendronul":"rododendron","rododendronule":"rododendron","rododendronului":"rododendron","rododendru":"rododendron","rododendrui":"rododendru","rododendruii":"rododendru","rododendruilor":"rododendru","rododendrul":"rododendru","rododendrule":"rododendru","rododendrului":"rododendru","rodoidul":"rodoid","rodoidule":"rodoid","rodoidului":"rodoid","rodomontade":"rodomontadă","rodomontadei":"rodomontadă","rodomontadele":"rodomontadă","rodomontadelor":"rodomontadă","rodonite":"rodonit","rodonitele":"rodonit","rodonitelor":"rodonit","rodonitul":"rodonit","rodonitule":"rodonit","rodonitului":"rodonit","rodopsine":["rodopsine","rodopsin","rodopsine","rodopsină"],"rodopsinei":"rodopsină","rodopsinele":["rodopsinele","rodopsin","rodopsinele","rodopsină"],"rodopsinelor":["rodopsinelor","rodopsin","rodopsinelor","rodopsină"],"rodopsinul":"rodopsin","rodopsinule":"rodopsin","rodopsinului":"rodopsin","rodosi":"rodos","rodosii":"rodos","rodosul":"rodos","rodozaharul":"rodozahar","rodozaharule":"rodozahar","rodozaharului":"rodozahar","rodul":"rod","rodule":"rod","rodului":"rod","roentgenterapia":"roentgenterapie","roentgenterapiei":"roentgenterapie","roentgenterapii":"roentgenterapie","roentgenterapiile":"roentgenterapie","roentgenterapiilor":"roentgenterapie","roentgenul":"roentgen","roentgenule":"roentgen","roentgenului":"roentgen","rog":"ruga","rogatiunea":"rogațiune","rogatiuni":"rogațiune","rogatiunii":"rogațiune","rogatiunile":"rogațiune","rogatiunilor":"rogațiune","rogatoria":["rogatoria","rogatorie","rogatoria","rogatoriu"],"rogatorie":"rogatoriu","rogatoriele":"rogatorie","rogatorii":["rogatorii","rogatorie","rogatorii","rogatoriu"],"rogatoriii":["rogatoriii","rogatorie","rogatoriii","rogatoriu"],"rogatoriile":"rogatoriu","rogatoriul":"rogatoriu","roghine":"roghină","roghinei":"roghină","rogi":"ruga","rogodeul":"rogode","rogodeule":"rogode","rogodeului":"rogode","rogojeaua":"rogojea","rogojele":"rogojea","rogojelei":"rogojea","rogojelele":"rogojea","rogojelelor":"rogojea","rogojelul":"rogojel","rogojelule":"rogojel","rogojelului":"rogojel","rogojinari":"rogojinar","rogojinarii":"rogojinar","rogojinarilor":"rogojinar","rogojinarul":"rogojinar","rogojinarule":"rogojinar","rogojinarului":"rogojinar","rogojini":"rogojină","rogojinii":"rogojină","rogojinile":"rogojină","rogojinilor":"rogojină","rogojioare":"rogojioară","rogojioarei":"rogojioară","rogojioarele":"rogojioară","rogojioarelor":"rogojioară","rogozistea":"rogoziște","rogozisti":"rogoziște","rogozistii":"rogoziște","rogozistile":"rogoziște","rogozistilor":"rogoziște","rogozoasa":["rogozoasă","rogozos","rogozoasa","rogozos"],"rogozoase":"rogozos","rogozoasele":"rogozos","rogozosi":"rogozos","rogozosii":"rogozos","rogozosul":"rogozos","rogozul":"rogoz","rogozule":"rogoz","rogozului":"rogoz","rogozuri":"rogoz","rogozurile":"rogoz","rogozurilor":"rogoz","rohatce":"rohatcă","rohatcei":"rohatcă","rohatcele":"rohatcă","rohatcelor":"rohatcă","rohatci":"rohatcă","rohotul":"rohot","rohotule":"rohot","rohotului":"rohot","roibana":["roibană","roiban","roibana","roiban"],"roibane":"roiban","roibanele":"roiban","roibani":"roiban","roibanii":"roiban","roibanul":"roiban","roibe":"roibă","roibi":"roib","roibii":"roib","roibilor":"roib","roibul":"roib","roibule":"roib","roibuleata":["roibuleață","roibuleț","roibuleața","roibuleț"],"roibulete":"roibuleț","roibuletele":"roibuleț","roibuleti":"roibuleț","roibuletii":"roibuleț","roibuletul":"roibuleț","roibului":"roib","roine":"roină","roinei":"roină","roinele":"roină","roinelor":"roină","roinite":"roiniță","roinitei":"roiniță","roinitele":"roiniță","roinitelor":"roiniță","roirea":"roire","roiri":"roire","roirii":"roire","roirile":"roire","roirilor":"roire","roistea":"roiște","roisti":"roiște","roistii":"roiște","roitul":"roit","roitule":"roit","roitului":"roit","roituri":["roituri","roit","roituri","roitură"],"roiturii":"roitură","roiturile":["roiturile","roit","roiturile","roitură"],"roiturilor":["roiturilor","roit","roiturilor","roitură"],"roiul":"roi","roiule":"roi","roiului":"roi","roiuri":"roi","roiuri de stele":"roi de stele","roiurile":"roi","roiurilor":"roi","rojdanice":"rojdanic","rojdanicei":"rojdanic","rojdanicelor":"rojdanic","rojdanicul":"rojdanic","rojdanicule":"rojdanic","rojdanicului":"rojdanic","role":"rolă","rolei":"rolă","rolele":"rolă","rolelor":"rolă","rolisoare":"rolișor","rolisore":"rolișor","rolisorele":"rolișor","rolisorelor":"rolișor","rolisorul":"rolișor","rolisorule":"rolișor","rolisorului":"rolișor","rolul":"rol","rolule":"rol","rolului":"rol","roluri":"rol","rolurile":"rol","rolurilor":"rol","romaica":["romaică","romaic","romaica","romaic"],"romaice":"romaic","romaicele":"romaic","romaici":"romaic","romaicii":"romaic","romaicul":"romaic","romana":["romană","roman","romana","roman","română","român","româna","român"],"romanasi":"românaș","romanasii":"românaș","romanasilor":"românaș","romanasul":"românaș","romanasule":"românaș","romanasului":"românaș","romance":"româncă","romancei":"româncă","romancele":"româncă","romancelor":"româncă","romanciere":"romancieră","romancierei":"romancieră","romancierele":"romancieră","romancierelor":"romancieră","romancieri":"romancier","romancierii":"romancier","romancierilor":"romancier","romancierul":"romancier","romancierule":"romancier","romancierului":"romancier","romancute":"româncuță","romancutei":"româncuță","romancutele":"româncuță","romancutelor":"româncuță","romane":["romane","roman","române","român","romane","romană","române","română"],"romane politiste":"roman polițist","romanea":"români","romaneai":"români","romaneam":"români","romaneasca":["romanească","romanesc","romaneasca","romanesc","românească","românesc","româneasca","românesc","romănească","romănesc","romăneasca","romănesc"],"romaneati":"români","romaneau":"români","romanei":["romanei","romană","românei","română","românei","românel"],"romaneii":"românel","romaneilor":"românel","romanele":["romanele","roman","românele","român","romanele","romană"],"romanelor":["romanelor","roman","romanelor","romană"],"romanelul":"românel","romanelule":"românel","romanelului":"românel","romanesc":"români","romanescul":["romanescul","romanesc","românescul","românesc","romănescul","romănesc"],"romaneste":"români","romanesti":["romanești","romanesc","românești","românesc","romănești","romănesc","românești","români"],"romanestii":["romaneștii","romanesc","româneștii","românesc","romăneștii","romănesc"],"romanestile":["romaneștile","romanesc","româneștile","românesc","romăneștile","romănesc"],"romani":["romani","roman","români","român"],"romania":"românie","romanica":["romanică","romanic","romanica","romanic"],"romanice":"romanic","romaniceasca":["romanicească","romanicesc","romaniceasca","romanicesc"],"romanicele":"romanic","romanicescul":"romanicesc","romanicesti":"romanicesc","romanicestii":"romanicesc","romanicestile":"romanicesc","romanici":"romanic","romanicii":"romanic","romanicul":"romanic","romanie":["românie","România","românie","rumânie"],"romaniei":["româniei","România","româniei","românie"],"romanii":["romanii","roman","românii","român","românii","români","românii","România","românii","românie"],"romanilor":["romanilor","roman","românilor","român"],"romanim":"români","romanimea":"românime","romanimei":"românime","romanind":"români","romanira":"români","romaniram":"români","romanirati":"români","romanise":"români","romanisem":"români","romanisera":"români","romaniseram":"români","romaniserati":"români","romanisesi":"români","romanisi":"români","romanisme":"românism","romanismele":"românism","romanismelor":"românism","romanismul":["romanismul","romanism","românismul","românism"],"romanismule":["romanismule","romanism","românismule","românism"],"romanismului":["romanismului","romanism","românismului","românism"],"romaniste":["romaniste","romanistă","româniste","românistă"],"romanistei":["romanistei","romanistă","românistei","românistă"],"romanistele":["romanistele","romanistă","românistele","românistă"],"romanistelor":["romanistelor","romanistă","românistelor","românistă"],"romanisti":["romaniști","romanist","româniști","românist"],"romanistice":"românistică","romanisticei":"românistică","romanistici":"romanistică","romanisticii":"romanistică","romanistii":["romaniștii","romanist","româniștii","românist"],"romanistilor":["romaniștilor","romanist","româniștilor","românist"],"romanistul":["romanistul","romanist","românistul","românist"],"romanistule":["romanistule","romanist","românistule","românist"],"romanistului":["romanistului","romanist","românistului","românist"],"romanit":"români","romanita":["românită","românit","românita","românit"],"romanitatea":["romanitatea","romanitate","românitatea","românitate"],"romanitati":["romanități","romanitate","românități","românitate"],"romanitatii":["romanității","romanitate","românității","românitate"],"romanitatile":["romanitățile","romanitate","românitățile","românitate"],"romanitatilor":["romanităților","romanitate","românităților","românitate"],"romanite":["românite","românit","romanițe","romaniță","romănițe","romăniță"],"romanitei":["romaniței","romaniță","romăniței","romăniță"],"romanitele":["românitele","românit","romanițele","romaniță","romănițele","romăniță"],"romanitelor":["romanițelor","romaniță","romănițelor","romăniță"],"romaniti":["româniți","români","româniți","românit"],"romanitii":"românit","romanitul":"românit","romanizai":["romanizai","romaniza","românizai","româniza"],"romanizam":["romanizăm","romaniza","romanizam","romaniza","românizăm","româniza","românizam","româniza"],"romanizand":["romanizând","romaniza","românizând","româniza"],"romanizara":["romanizară","romaniza","românizară","româniza"],"romanizaram":["romanizarăm","romaniza","românizarăm","româniza"],"romanizarati":["romanizarăți","romaniza","românizarăți","româniza"],"romanizarea":["romanizarea","romanizare","românizarea","românizare"],"romanizari":["romanizări","romanizare","românizări","românizare"],"romanizarii":["romanizării","romanizare","românizării","românizare"],"romanizarile":["romanizările","romanizare","românizările","românizare"],"romanizarilor":["romanizărilor","romanizare","românizărilor","românizare"],"romanizase":["romanizase","romaniza","românizase","româniza"],"romanizasem":["romanizasem","romaniza","românizasem","româniza"],"romanizasera":["romanizaseră","romaniza","românizaseră","româniza"],"romanizaseram":["romanizaserăm","romaniza","românizaserăm","româniza"],"romanizaserati":["romanizaserăți","romaniza","românizaserăți","româniza"],"romanizasesi":["romanizaseși","romaniza","românizaseși","româniza"],"romanizasi":["romanizași","romaniza","românizași","româniza"],"romanizat":["romanizat","romaniza","românizat","româniza"],"romanizata":["romanizată","romanizat","romanizata","romanizat","românizată","românizat","românizata","românizat"],"romanizate":["romanizate","romanizat","românizate","românizat"],"romanizatele":["romanizatele","romanizat","românizatele","românizat"],"romanizati":["romanizați","romaniza","românizați","româniza","romanizați","romanizat","românizați","românizat"],"romanizatii":["romanizații","romanizat","românizații","românizat"],"romanizatoare":"romanizator","romanizatoarea":"romanizator","romanizatoarele":"romanizator","romanizatori":"romanizator","romanizatorii":"romanizator","romanizatorul":"romanizator","romanizatul":["romanizatul","romanizat","românizatul","românizat"],"romanizau":["romanizau","romaniza","românizau","româniza"],"romanizeaza":["romanizează","romaniza","românizează","româniza"],"romanizez":["romanizez","romaniza","românizez","româniza"],"romanizezi":["romanizezi","romaniza","românizezi","româniza"],"romano-catolica":["romano-catolică","romano-catolic","romano-catolica","romano-catolic"],"romano-catolice":["romano-catolice","romano-catolic","romano-catolice","romano-catolică"],"romano-catolicei":"romano-catolică","romano-catolicele":["romano-catolicele","romano-catolic","romano-catolicele","romano-catolică"],"romano-catolicelor":"romano-catolică","romano-catolici":"romano-catolic","romano-catolicii":"romano-catolic","romano-catolicilor":"romano-catolic","romano-catolicul":"romano-catolic","romano-catolicule":"romano-catolic","romano-catolicului":"romano-catolic","romanofila":["românofilă","românofil","românofila","românofil"],"romanofile":["românofile","românofil","românofile","românofilă"],"romanofilei":"românofilă","romanofilele":["românofilele","românofil","românofilele","românofilă"],"romanofilelor":"românofilă","romanofili":"românofil","romanofilia":"românofilie","romanofiliei":"românofilie","romanofilii":["românofilii","românofil","românofilii","românofilie"],"romanofililor":"românofil","romanofilul":"românofil","romanofilule":"românofil","romanofilului":"românofil","romanofobe":"românofobă","romanofobei":"românofobă","romanofobele":"românofobă","romanofobelor":"românofobă","romanofobi":"românofob","romanofobia":"românofobie","romanofobiei":"românofobie","romanofobii":["românofobii","românofob","românofobii","românofobie"],"romanofobiile":"românofobie","romanofobiilor":"românofobie","romanofobilor":"românofob","romanofobul":"românofob","romanofobule":"românofob","romanofobului":"românofob","romanoiul":"romanoi","romanoiule":"romanoi","romanoiului":"romanoi","romanomania":"romanomanie","romanomaniei":"romanomanie","romanomanii":"romanomanie","romansa":["romanșă","romanș","romanșa","romanș"],"romanse":["romanșe","romanș","romanșe","romanșă"],"romansei":"romanșă","romansele":"romanș","romansi":"romanș","romansii":"romanș","romansul":"romanș","romantai":"romanța","romantam":["romanțăm","romanța","romanțam","romanța"],"romantand":"romanța","romantara":"romanța","romantaram":"romanța","romantarati":"romanța","romantarea":"romanțare","romantari":"romanțare","romantarii":"romanțare","romantarile":"romanțare","romantarilor":"romanțare","romantase":"romanța","romantasem":"romanța","romantasera":"romanța","romantaseram":"romanța","romantaserati":"romanța","romantasesi":"romanța","romantasi":"romanța","romantat":"romanța","romantata":["romanțată","romanțat","romanțata","romanțat"],"romantate":"romanțat","romantatele":"romanțat","romantati":["romanțați","romanța","romanțați","romanțat"],"romantatii":"romanțat","romantatul":"romanțat","romantau":"romanța","romante":["romanțe","romanț","romanțe","romanță"],"romanteaza":"romanța","romantei":"romanță","romantele":["romanțele","romanț","romanțele","romanță"],"romantelor":["romanțelor","romanț","romanțelor","romanță"],"romantez":"romanța","romantezi":"romanța","romantica":["romantică","romantic","romantica","romantic"],"romantice":["romantice","romantic","romantice","romantică"],"romanticeasca":["romanticească","romanticesc","romanticeasca","romanticesc"],"romanticei":"romantică","romanticele":["romanticele","romantic","romanticele","romantică"],"romanticelor":"romantică","romanticescul":"romanticesc","romanticesti":"romanticesc","romanticestii":"romanticesc","romanticestile":"romanticesc","romantici":"romantic","romanticii":"romantic","romanticismul":"romanticism","romanticismule":"romanticism","romanticismului":"romanticism","romanticitatea":"romanticitate","romanticitati":"romanticitate","romanticitatii":"romanticitate","romanticul":"romantic","romantier":"romancier","romantiere":"romanțieră","romantierei":"romanțieră","romantierele":"romanțieră","romantierelor":"romanțieră","romantieri":"romanțier","romantierii":"romanțier","romantierilor":"romanțier","romantierul":"romanțier","romantierule":"romanțier","romantierului":"romanțier","romantioasa":["romanțioasă","romanțios","romanțioasa","romanțios"],"romantioase":"romanțios","romantioasele":"romanțios","romantiosi":"romanțios","romantiosii":"romanțios","romantiosul":"romanțios","romantiozitatea":"romanțiozitate","romantiozitati":"romanțiozitate","romantiozitatii":"romanțiozitate","romantisme":"romantism","romantismele":"romantism","romantismelor":"romantism","romantismul":"romantism","romantismule":"romantism","romantismului":"romantism","romantizarea":"romantizare","romantizari":"romantizare","romantizarii":"romantizare","romantul":"romanț","romantule":"romanț","romantului":"romanț","romanul":["romanul","Roman","romanul","roman","românul","român"],"romanule":["romanule","Roman","romanule","roman"],"romanului":["romanului","Roman","romanului","roman","românului","român"],"romascana":["romașcană","romașcan","romașcana","romașcan"],"romascance":"romașcancă","romascancei":"romașcancă","romascancele":"romașcancă","romascancelor":"romașcancă","romascane":"romașcan","romascanele":"romașcan","romascani":"romașcan","romascanii":"romașcan","romascanilor":"romașcan","romascanul":"romașcan","romascanule":"romașcan","romascanului":"romașcan","romasce":"romașcă","romascei":"romașcă","rombica":["rombică","rombic","rombica","rombic"],"rombice":"rombic","rombicele":"rombic","rombici":"rombic","rombicii":"rombic","rombicul":"rombic","romboedre":"romboedru","romboedrele":"romboedru","romboedrelor":"romboedru","romboedrica":["romboedrică","romboedric","romboedrica","romboedric"],"romboedrice":"romboedric","romboedricele":"romboedric","romboedrici":"romboedric","romboedricii":"romboedric","romboedricul":"romboedric","romboedrul":"romboedru","romboedrule":"romboedru","romboedrului":"romboedru","romboida":["romboidă","romboid","romboida","romboid"],"romboidala":["romboidală","romboidal","romboidala","romboidal"],"romboidale":"romboidal","romboidalele":"romboidal","romboidali":"romboidal","romboidalii":"romboidal","romboidalul":"romboidal","romboide":"romboid","romboidele":"romboid","romboidul":"romboid","romboizi":"romboid","romboizii":"romboid","rombul":"romb","rombule":"romb","rombului":"romb","romburi":"romb","romburile":"romb","romburilor":"romb","rome":"romă","romei":"romă","romele":"romă","romelor":"romă","romgleze":"romgleză","romglezei":"romgleză","romi":"rom","romii":"rom","romilor":"rom","romina":["romînă","romîn","romîna","romîn"],"romine":"romîn","rominele":"romîn","romineste":"românește","romini":"romîn","rominii":"romîn","rominilor":"romîn","rominul":"romîn","rominule":"romîn","rominului":"romîn","romonei":"romonel","romoneii":"romonel","romoneilor":"romonel","romonelul":"romonel","romonelule":"romonel","romonelului":"romonel","romul":"rom","romule":"rom","romului":"rom","romuri":"rom","romurile":"rom","romurilor":"rom","ronda":["rondă","rond","ronda","rond"],"ronde":["ronde","rond","ronde","rondă"],"rondeaua":"rondea","rondei":"rondă","rondele":["rondele","rond","rondele","rondă","rondele","rondea","rondele","rondelă"],"rondelei":["rondelei","rondea","rondelei","rondelă"],"rondelele":["rondelele","rondea","rondelele","rondelă"],"rondelelor":["rondelelor","rondea","rondelelor","rondelă"],"rondelor":"rondă","rondelul":"rondel","rondelule":"rondel","rondelului":"rondel","rondeluri":"rondel","rondelurile":"rondel","rondelurilor":"rondel","rondinoul":"rondino","rondinoule":"rondino","rondinoului":"rondino","rondouri":"rondou","rondourile":"rondou","rondourilor":"rondou","rondouul":"rondou","rondouule":"rondou","rondouului":"rondou","rondul":"rond","rondule":"rond","rondului":"rond","ronduri":"rond","rondurile":"rond","rondurilor":"rond","ronflanta":["ronflantă","ronflant","ronflanta","ronflant"],"ronflante":"ronflant","ronflantele":"ronflant","ronflanti":"ronflant","ronflantii":"ronflant","ronflantul":"ronflant","rongalite":"rongalită","rongalitei":"rongalită","ronjai":"ronja","ronjam":["ronjăm","ronja","ronjam","ronja"],"ronjand":"ronja","ronjara":"ronja","ronjaram":"ronja","ronjarati":"ronja","ronjase":"ronja","ronjasem":"ronja","ronjasera":"ronja","ronjaseram":"ronja","ronjaserati":"ronja","ronjasesi":"ronja","ronjasi":"ronja","ronjat":"ronja","ronjati":"ronja","ronjau":"ronja","ronjeaza":"ronja","ronjez":"ronja","ronjezi":"ronja","ronronul":"ronron","ronronule":"ronron","ronronului":"ronron","ronronuri":"ronron","ronronurile":"ronron","ronronurilor":"ronron","rontaia":"ronțăi","rontaiai":"ronțăi","rontaiam":"ronțăi","rontaiati":"ronțăi","rontaiau":"ronțăi","rontaie":"ronțăi","rontaieli":"ronțăială","rontaielii":"ronțăială","rontaielile":"ronțăială","rontaielilor":"ronțăială","rontaii":"ronțăi","rontaim":"ronțăi","rontaind":"ronțăi","rontaira":"ronțăi","rontairam":"ronțăi","rontairati":"ronțăi","rontairea":"ronțăire","rontairi":"ronțăire","rontairii":"ronțăire","rontairile":"ronțăire","rontairilor":"ronțăire","rontaise":"ronțăi","rontaisem":"ronțăi","rontaisera":"ronțăi","rontaiseram":"ronțăi","rontaiserati":"ronțăi","rontaisesi":"ronțăi","rontaisi":"ronțăi","rontait":"ronțăi","rontaiti":"ronțăi","rontaitul":"ronțăit","rontaitule":"ronțăit","rontaitului":"ronțăit","rontgenterapia":"röntgenterapie","rontgenterapiei":"röntgenterapie","rontgenterapii":"röntgenterapie","rontgenul":"röntgen","rontgenule":"röntgen","rontgenului":"röntgen","ronzi":"rond","ronzii":"rond","room-serviceul":"room-service","room-serviceule":"room-service","room-serviceului":"room-service","ropote":"ropot","ropotele":"ropot","ropotelor":"ropot","ropotul":"ropot","ropotule":"ropot","ropotului":"ropot","roquefortul":"roquefort","roquefortule":"roquefort","roquefortului":"roquefort","ros":["ros","roade","roș","roșu"],"rosa":["roșă","roș","roșa","roș"],"rosalii":"Rusalii","rosateca":["roșatecă","roșatec","roșateca","roșatec"],"rosatece":"roșatec","rosatecele":"roșatec","rosateci":"roșatec","rosatecii":"roșatec","rosatecul":"roșatec","rosatica":["roșatică","roșatic","roșatica","roșatic"],"rosatice":"roșatic","rosaticele":"roșatic","rosatici":"roșatic","rosaticii":"roșatic","rosaticul":"roșatic","rosaturi":"rosătură","rosaturii":"rosătură","rosaturile":"rosătură","rosaturilor":"rosătură","rosbiful":"rosbif","rosbifule":"rosbif","rosbifului":"rosbif","rosbifuri":"rosbif","rosbifurile":"rosbif","rosbifurilor":"rosbif","roscata":["roșcată","roșcat","roșcata","roșcat"],"roscate":"roșcat","roscatele":"roșcat","roscati":"roșcat","roscatii":"roșcat","roscatul":"roșcat","roschite":"roșchiță","roschitei":"roșchiță","roscodana":["roșcodană","roșcodan","roșcodana","roșcodan"],"roscodane":"roșcodan","roscodanele":"roșcodan","roscodani":"roșcodan","roscodanii":"roșcodan","roscodanul":"roșcodan","roscovana":["roșcovană","roșcovan","roșcovana","roșcovan"],"roscovane":"roșcovan","roscovanele":"roșcovan","roscovani":"roșcovan","roscovanii":"roșcovan","roscovanul":"roșcovan","roscovari":"roșcovar","roscovarii":"roșcovar","roscovarilor":"roșcovar","roscovarul":"roșcovar","roscovarule":"roșcovar","roscovarului":"roșcovar","roscove":"roșcovă","roscovi":"roșcov","rose":"roș","rosea":"roși","roseai":"roși","roseam":"roși","roseati":"roși","roseau":"roși","rosei":"roade","rosele":["roșele","roș","roșele","roșeală"],"roseli":"roșeală","roselii":"roșeală","roselile":"roșeală","roselilor":"roșeală","rosesc":"roși","rosese":"roade","rosesem":"roade","rosesera":"roade","roseseram":"roade","roseserati":"roade","rosesesi":"roade","rosesi":"roade","roseste":"roși","rosesti":"roși","rosi":["roși","ros","roși","roș"],"rosia":["roșia","roșie","roșia","roșiu","roșia","roșu"],"rosianul":"rosian","rosianule":"rosian","rosianului":"rosian","rosiateca":["roșiatecă","roșiatec","roșiateca","roșiatec"],"rosiatece":"roșiatec","rosiatecele":"roșiatec","rosiateci":"roșiatec","rosiatecii":"roșiatec","rosiatecul":"roșiatec","rosiatica":["roșiatică","roșiatic","roșiatica","roșiatic"],"rosiatice":"roșiatic","rosiaticele":"roșiatic","rosiatici":"roșiatic","rosiaticii":"roșiatic","rosiaticul":"roșiatic","rosie":["roșie","roșiu","roșie","roșu"],"rosie ca racul":"roșu ca racul","rosiei":"roșie","rosieneasca":["rosienească","rosienesc","rosieneasca","rosienesc"],"rosienescul":"rosienesc","rosienesti":"rosienesc","rosienestii":"rosienesc","rosienestile":"rosienesc","rosieni":"rosian","rosienii":"rosian","rosienilor":"rosian","rosietica":["roșietică","roșietic","roșietica","roșietic"],"rosietice":"roșietic","rosieticele":"roșietic","rosietici":"roșietic","rosieticii":"roșietic","rosieticul":"roșietic","rosii":["roșii","ros","roșii","roș","roșii","roși","roșii","roșie","roșii","roșiu","roșii","roșu"],"rosii ca racul":"roșu ca racul","rosiii":["roșiii","roșiu","roșiii","roșu"],"rosiile":["roșiile","roșie","roșiile","roșiu","roșiile","roșu"],"rosiilor":"roșie","rosim":"roși","rosind":"roși","rosioare":"roșioară","rosioarei":"roșioară","rosioarele":"roșioară","rosioarelor":"roșioară","rosiora":["roșioră","roșior","roșiora","roșior"],"rosiore":"roșior","rosioreana":["roșioreană","roșiorean","roșioreana","roșiorean"],"rosioreanul":"roșiorean","rosioreanule":"roșiorean","rosioreanului":"roșiorean","rosiorele":"roșior","rosiorence":"roșioreancă","rosiorencei":"roșioreancă","rosiorencele":"roșioreancă","rosiorencelor":"roșioreancă","rosiorene":"roșiorean","rosiorenele":"roșiorean","rosioreni":"roșiorean","rosiorenii":"roșiorean","rosiorenilor":"roșiorean","rosiori":"roșior","rosiorii":"roșior","rosiorul":"roșior","rosira":"roși","rosiram":"roși","rosirati":"roși","rosirea":"roșire","rosiri":"roșire","rosirii":"roșire","rosirile":"roșire","rosirilor":"roșire","rosise":"roși","rosisem":"roși","rosisera":"roși","rosiseram":"roși","rosiserati":"roși","rosisesi":"roși","rosisi":"roși","rosit":"roși","rosita":["roșită","roșit","roșita","roșit"],"rosite":"roșit","rositele":"roșit","rositi":["roșiți","roși","roșiți","roșit"],"rositii":"roșit","rositori":"roșitor","rositorii":"roșitor","rositorilor":"roșitor","rositorul":"roșitor","rositorule":"roșitor","rositorului":"roșitor","rositul":"roșit","rosiul":"roșiu","rosiuta":["roșiuță","roșiuț","roșiuța","roșiuț"],"rosiute":"roșiuț","rosiutele":"roșiuț","rosiuti":"roșiuț","rosiutii":"roșiuț","rosiutul":"roșiuț","rosmarini":"rosmarin","rosmarinii":"rosmarin","rosmarinilor":"rosmarin","rosmarinul":"rosmarin","rosmarinule":"rosmarin","rosmarinului":"rosmarin","rospisce":"rospiscă","rospiscei":"rospiscă","rostatul":"rostat","rostatule":"rostat","rostatului":"rostat","rostea":"rosti","rosteai":"rosti","rosteam":"rosti","rosteati":"rosti","rosteau":"rosti","rostesc":"rosti","rosteste":"rosti","rostesti":"rosti","rostii":"rosti","rostim":"rosti","rostimea":"rostime","rostimi":"rostime","rostimii":"rostime","rostind":"rosti","rostira":"rosti","rostiram":"rosti","rostirati":"rosti","rostirea":"rostire","rostiri":"rostire","rostirii":"rostire","rostirile":"rostire","rostirilor":"rostire","rostise":"rosti","rostisem":"rosti","rostisera":"rosti","rostiseram":"rosti","rostiserati":"rosti","rostisesi":"rosti","rostisi":"rosti","rostit":"rosti","rostiti":"rosti","rostogolea":"rostogoli","rostogoleai":"rostogoli","rostogoleam":"rostogoli","rostogoleati":"rostogoli","rostogoleau":"rostogoli","rostogolesc":"rostogoli","rostogoleste":"rostogoli","rostogolesti":"rostogoli","rostogolii":"rostogoli","rostogolim":"rostogoli","rostogolind":"rostogoli","rostogolira":"rostogoli","rostogoliram":"rostogoli","rostogolirati":"rostogoli","rostogolirea":"rostogolire","rostogoliri":"rostogolire","rostogolirii":"rostogolire","rostogolirile":"rostogolire","rostogolirilor":"rostogolire","rostogolise":"rostogoli","rostogolisem":"rostogoli","rostogolisera":"rostogoli","rostogoliseram":"rostogoli","rostogoliserati":"rostogoli","rostogolisesi":"rostogoli","rostogolisi":"rostogoli","rostogolit":"rostogoli","rostogoliti":"rostogoli","rostogolitori":"rostogolitor","rostogolitorii":"rostogolitor","rostogolitorilor":"rostogolitor","rostogolitorul":"rostogolitor","rostogolitorule":"rostogolitor","rostogolitorului":"rostogolitor","rostogolitul":"rostogolit","rostogolitule":"rostogolit","rostogolitului":"rostogolit","rostogolul":"rostogol","rostogolule":"rostogol","rostogolului":"rostogol","rostogoluri":"rostogol","rostogolurii":"rostogol","rostogolurilor":"rostogol","rostopalnite":"rostopalniță","rostopalnitei":"rostopalniță","rostopasce":"rostopască","rostopascei":"rostopască","rostopastice":"rostopastică","rostopasticei":"rostopastică","rostopasticele":"rostopastică","rostopasticelor":"rostopastică","rostopatite":"rostopatiță","rostopatitei":"rostopatiță","rostopatitele":"rostopatiță","rostopatitelor":"rostopatiță","rostoponii":"rostoponi","rostoponilor":"rostoponi","rostrala":["rostrală","rostral","rostrala","rostral"],"rostrale":"rostral","rostralele":"rostral","rostrali":"rostral","rostralii":"rostral","rostralul":"rostral","rostuia":"rostui","rostuiai":"rostui","rostuiam":"rostui","rostuiati":"rostui","rostuiau":"rostui","rostuiesc":"rostui","rostuieste":"rostui","rostuiesti":"rostui","rostuii":"rostui","rostuim":"rostui","rostuind":"rostui","rostuira":"rostui","rostuiram":"rostui","rostuirati":"rostui","rostuirea":"rostuire","rostuiri":"rostuire","rostuirii":"rostuire","rostuirile":"rostuire","rostuirilor":"rostuire","rostuise":"rostui","rostuisem":"rostui","rostuisera":"rostui","rostuiseram":"rostui","rostuiserati":"rostui","rostuisesi":"rostui","rostuisi":"rostui","rostuit":"rostui","rostuiti":"rostui","rostul":"rost","rostule":"rost","rostulete":"rostuleț","rostuletele":"rostuleț","rostuletelor":"rostuleț","rostuletul":"rostuleț","rostuletule":"rostuleț","rostuletului":"rostuleț","rostului":"rost","rostungul":"roștung","rostungule":"roștung","rostungului":"roștung","rostunguri":"roștung","rostungurile":"roștung","rostungurilor":"roștung","rosturi":"rost","rosturile":"rost","rosturilor":"rost","rosul":["rosul","ros","roșul","roș","roșul","roșu"],"rosuta":["roșuță","roșuț","roșuța","roșuț"],"rosute":"roșuț","rosutele":"roșuț","rosuti":"roșuț","rosutii":"roșuț","rosutul":"roșuț","rota":"roată","rotacisme":"rotacism","rotacismele":"rotacism","rotacismelor":"rotacism","rotacismul":"rotacism","rotacismule":"rotacism","rotacismului":"rotacism","rotacizai":"rotaciza","rotacizam":["rotacizăm","rotaciza","rotacizam","rotaciza"],"rotacizand":"rotaciza","rotacizanta":["rotacizantă","rotacizant","rotacizanta","rotacizant"],"rotacizante":"rotacizant","rotacizantele":"rotacizant","rotacizanti":"rotacizant","rotacizantii":"rotacizant","rotacizantul":"rotacizant","rotacizara":"rotaciza","rotacizaram":"rotaciza","rotacizarati":"rotaciza","rotacizarea":"rotacizare","rotacizari":"rotacizare","rotacizarii":"rotacizare","rotacizarile":"rotacizare","rotacizarilor":"rotacizare","rotacizase":"rotaciza","rotacizasem":"rotaciza","rotacizasera":"rotaciza","rotacizaseram":"rotaciza","rotacizaserati":"rotaciza","rotacizasesi":"rotaciza","rotacizasi":"rotaciza","rotacizat":"rotaciza","rotacizata":["rotacizată","rotacizat","rotacizata","rotacizat"],"rotacizate":"rotacizat","rotacizatele":"rotacizat","rotacizati":["rotacizați","rotaciza","rotacizați","rotacizat"],"rotacizatii":"rotacizat","rotacizatul":"rotacizat","rotacizau":"rotaciza","rotacizeaza":"rotaciza","rotacizez":"rotaciza","rotacizezi":"rotaciza","rotai":"rota","rotam":["rotăm","rota","rotam","rota"],"rotametre":"rotametru","rotametrele":"rotametru","rotametrelor":"rotametru","rotametrul":"rotametru","rotametrule":"rotametru","rotametrului":"rotametru","rotand":"rota","rotara":"rota","rotaram":"rota","rotarati":"rota","rotarese":"rotăreasă","rotaresei":"rotăreasă","rotaresele":"rotăreasă","rotareselor":"rotăreasă","rotari":"rotar","rotaria":"rotărie","rotariei":"rotărie","rotarii":"rotărie","rotariile":"rotărie","rotariilor":"rotărie","rotarite":"rotăriță","rotaritei":"rotăriță","rotaritele":"rotăriță","rotaritelor":"rotăriță","rotaritul":"rotărit","rotaritule":"rotărit","rotaritului":"rotărit","rotase":["rotase","rota","rotașe","rotașă"],"rotasei":"rotașă","rotasele":"rotașă","rotaselor":"rotașă","rotasem":"rota","rotasera":"rota","rotaseram":"rota","rotaserati":"rota","rotasesi":"rota","rotasi":"rota","rotat":"rota","rotata":["rotată","rotat","rotata","rotat"],"rotate":"rotat","rotatele":"rotat","rotati":["rotați","rota","rotați","rotat","rotati","rotativ"],"rotatii":["rotații","rotat","rotații","rotație"],"rotatiunea":"rotațiune","rotatiuni":"rotațiune","rotatiunii":"rotațiune","rotatiunile":"rotațiune","rotatiunilor":"rotațiune","rotativi":"rotativ","rotativii":"rotativ","rotativile":"rotativ","rotativilor":"rotativ","rotatoare":"rotator","rotatoarea":"rotator","rotatoarele":"rotator","rotatori":"rotator","rotatoria":"rotatoriu","rotatorie":"rotatoriu","rotatorii":["rotatorii","rotator","rotatorii","rotatoriu"],"rotatoriii":"rotatoriu","rotatoriile":"rotatoriu","rotatoriul":"rotatoriu","rotatorul":"rotator","rotatul":"rotat","rotau":"rota","rotci":"rotcă","rotcii":"rotcă","rotcile":"rotcă","rotcilor":"rotcă","rotea":"roti","roteai":"roti","roteam":"roti","roteati":"roti","roteau":"roti","roteaza":"rota","rotenone":"rotenonă","rotenonei":"rotenonă","rotesc":"roti","roteste":"roti","rotesti":"roti","rotez":"rota","rotezi":"rota","roti":"roată","roti dintate":"roată dințată","roticeaua":"roticea","roticele":["roticele","roticea","roticele","roticică"],"roticelei":["roticelei","roticea","roticelei","roticică"],"roticelele":["roticelele","roticea","roticelele","roticică"],"roticelelor":["roticelelor","roticea","roticelelor","roticică"],"rotici":"rotică","roticii":"rotică","roticile":"rotică","roticilor":"rotică","rotifere":"rotifer","rotiferele":"rotifer","rotiferelor":"rotifer","rotiferul":"rotifer","rotiferule":"rotifer","rotiferului":"rotifer","rotii":["roții","roată","rotii","roti"],"rotile":["roțile","roată","rotile","rotilă"],"rotilei":"rotilă","rotilele":"rotilă","rotilelor":"rotilă","rotilite":"rotiliță","rotilitei":"rotiliță","rotilitele":"rotiliță","rotilitelor":"rotiliță","rotilor":"roată","rotim":"roti","rotind":"roti","rotira":"roti","rotiram":"roti","rotirati":"roti","rotirea":"rotire","rotiri":"rotire","rotirii":"rotire","rotirile":"rotire","rotirilor":"rotire","rotise":"roti","rotisem":"roti","rotisera":"roti","rotiseram":"roti","rotiserati":"roti","rotiseria":"rotiserie","rotiseriei":"rotiserie","rotiserii":"rotiserie","rotiseriile":"rotiserie","rotiseriilor":"rotiserie","rotisesi":"roti","rotisi":"roti","rotisoare":"rotisor","rotisoarele":"rotisor","rotisoarelor":"rotisor","rotisorul":"rotisor","rotisorule":"rotisor","rotisorului":"rotisor","rotit":"roti","rotite":"rotiță","rotitei":"rotiță","rotitele":"rotiță","rotitelor":"rotiță","rotiti":"roti","rotitoare":"rotitor","rotitoarea":"rotitor","rotitoarele":"rotitor","rotitori":"rotitor","rotitorii":"rotitor","rotitorul":"rotitor","rotitul":"rotit","rotitule":"rotit","rotitului":"rotit","rotiture":"rotitură","rotiturei":"rotitură","rotiturele":"rotitură","rotiturelor":"rotitură","rotituri":"rotitură","rotmistri":"rotmistru","rotmistrii":"rotmistru","rotmistrilor":"rotmistru","rotmistruul":"rotmistru","rotmistruule":"rotmistru","rotmistruului":"rotmistru","rotoare":"rotor","rotoarele":"rotor","rotoarelor":"rotor","rotocoala":["rotocoală","rotocol","rotocoala","rotocol"],"rotocoale":"rotocol","rotocoalele":"rotocol","rotocoalelor":"rotocol","rotocolata":["rotocolată","rotocolat","rotocolata","rotocolat"],"rotocolate":"rotocolat","rotocolatele":"rotocolat","rotocolati":"rotocolat","rotocolatii":"rotocolat","rotocolatul":"rotocolat","rotocolea":"rotocoli","rotocoleai":"rotocoli","rotocoleam":"rotocoli","rotocoleati":"rotocoli","rotocoleau":"rotocoli","rotocolesc":"rotocoli","rotocoleste":"rotocoli","rotocolesti":"rotocoli","rotocoli":"rotocol","rotocolii":["rotocolii","rotocol","rotocolii","rotocoli"],"rotocolim":"rotocoli","rotocolimea":"rotocolime","rotocolimi":"rotocolime","rotocolimii":"rotocolime","rotocolind":"rotocoli","rotocolira":"rotocoli","rotocoliram":"rotocoli","rotocolirati":"rotocoli","rotocolise":"rotocoli","rotocolisem":"rotocoli","rotocolisera":"rotocoli","rotocoliseram":"rotocoli","rotocoliserati":"rotocoli","rotocolisesi":"rotocoli","rotocolisi":"rotocoli","rotocolit":"rotocoli","rotocolita":["rotocolită","rotocolit","rotocolita","rotocolit"],"rotocolite":"rotocolit","rotocolitele":"rotocolit","rotocoliti":["rotocoliți","rotocoli","rotocoliți","rotocolit"],"rotocolitii":"rotocolit","rotocolitul":"rotocolit","rotocolul":"rotocol","rotocolule":"rotocol","rotocolului":"rotocol","rotofee":"rotofeu","rotofeea":"rotofeu","rotofeele":"rotofeu","rotofei":"rotofeu","rotofeia":"rotofei","rotofeie":"rotofei","rotofeiele":"rotofei","rotofeii":["rotofeii","rotofei","rotofeii","rotofeu"],"rotofeiul":"rotofei","rotofeul":"rotofeu","rotogoale":"rotogol","rotogoalele":"rotogol","rotogoalelor":"rotogol","rotogolata":["rotogolată","rotogolat","rotogolata","rotogolat"],"rotogolate":"rotogolat","rotogolatele":"rotogolat","rotogolati":"rotogolat","rotogolatii":"rotogolat","rotogolatul":"rotogolat","rotogolul":"rotogol","rotogolule":"rotogol","rotogolului":"rotogol","rotogravuri":"rotogravură","rotogravurii":"rotogravură","rotogravurile":"rotogravură","rotogravurilor":"rotogravură","rotonde":"rotondă","rotondei":"rotondă","rotondele":"rotondă","rotondelor":"rotondă","rotorul":"rotor","rotorule":"rotor","rotorului":"rotor","rototranslatia":"rototranslație","rototranslatiei":"rototranslație","rototranslatii":"rototranslație","rototranslatiile":"rototranslație","rototranslatiilor":"rototranslație","rotringul":"rotring","rotringule":"rotring","rotringului":"rotring","rotringuri":"rotring","rotringurile":"rotring","rotringurilor":"rotring","rotule":"rotulă","rotulei":"rotulă","rotulele":"rotulă","rotulelor":"rotulă","rotuliana":["rotuliană","rotulian","rotuliana","rotulian"],"rotulianul":"rotulian","rotuliene":"rotulian","rotulienele":"rotulian","rotulieni":"rotulian","rotulienii":"rotulian","rotunda":["rotundă","rotund","rotunda","rotund"],"rotunde":["rotunde","rotund","rotunde","rotundă"],"rotundei":"rotundă","rotundele":["rotundele","rotund","rotundele","rotundă"],"rotundelor":"rotundă","rotunditatea":"rotunditate","rotunditati":"rotunditate","rotunditatii":"rotunditate","rotunditatile":"rotunditate","rotunditatilor":"rotunditate","rotundul":"rotund","rotunduta":["rotunduță","rotunduț","rotunduța","rotunduț"],"rotundute":"rotunduț","rotundutele":"rotunduț","rotunduti":"rotunduț","rotundutii":"rotunduț","rotundutul":"rotunduț","rotungiora":["rotungioră","rotungior","rotungiora","rotungior"],"rotungiore":"rotungior","rotungiorele":"rotungior","rotungiori":"rotungior","rotungiorii":"rotungior","rotungiorul":"rotungior","rotunjea":"rotunji","rotunjeai":"rotunji","rotunjeam":"rotunji","rotunjeati":"rotunji","rotunjeau":"rotunji","rotunjela":["rotunjelă","rotunjel","rotunjela","rotunjel"],"rotunjele":["rotunjele","rotunjeală","rotunjele","rotunjel"],"rotunjelei":"rotunjeală","rotunjelele":["rotunjelele","rotunjeală","rotunjelele","rotunjel"],"rotunjelelor":"rotunjeală","rotunjeli":["rotunjeli","rotunjeală","rotunjeli","rotunjel"],"rotunjelii":"rotunjel","rotunjelul":"rotunjel","rotunjesc":"rotunji","rotunjeste":"rotunji","rotunjesti":"rotunji","rotunjii":"rotunji","rotunjim":"rotunji","rotunjimea":"rotunjime","rotunjimi":"rotunjime","rotunjimii":"rotunjime","rotunjimile":"rotunjime","rotunjimilor":"rotunjime","rotunjind":"rotunji","rotunjira":"rotunji","rotunjiram":"rotunji","rotunjirati":"rotunji","rotunjirea":"rotunjire","rotunjiri":"rotunjire","rotunjirii":"rotunjire","rotunjirile":"rotunjire","rotunjirilor":"rotunjire","rotunjise":"rotunji","rotunjisem":"rotunji","rotunjisera":"rotunji","rotunjiseram":"rotunji","rotunjiserati":"rotunji","rotunjisesi":"rotunji","rotunjisi":"rotunji","rotunjit":"rotunji","rotunjita":["rotunjită","rotunjit","rotunjita","rotunjit"],"rotunjite":"rotunjit","rotunjitele":"rotunjit","rotunjiti":["rotunjiți","rotunji","rotunjiți","rotunjit"],"rotunjitii":"rotunjit","rotunjitoare":"rotunjitor","rotunjitore":"rotunjitor","rotunjitorele":"rotunjitor","rotunjitorelor":"rotunjitor","rotunjitorul":"rotunjitor","rotunjitorule":"rotunjitor","rotunjitorului":"rotunjitor","rotunjitul":"rotunjit","rotunjiunea":"rotunjiune","rotunjiuni":"rotunjiune","rotunjiunii":"rotunjiune","rotunjiunile":"rotunjiune","rotunjiunilor":"rotunjiune","rotunjori":"rotunjor","rotunjorii":"rotunjor","rotunjorilor":"rotunjor","rotunjorul":"rotunjor","rotunjorule":"rotunjor","rotunjorului":"rotunjor","rotunzea":"rotunzi","rotunzeai":"rotunzi","rotunzeam":"rotunzi","rotunzeati":"rotunzi","rotunzeau":"rotunzi","rotunzela":["rotunzelă","rotunzel","rotunzela","rotunzel"],"rotunzele":"rotunzel","rotunzelele":"rotunzel","rotunzeli":"rotunzel","rotunzelii":"rotunzel","rotunzelul":"rotunzel","rotunzesc":"rotunzi","rotunzeste":"rotunzi","rotunzesti":"rotunzi","rotunzi":"rotund","rotunzii":["rotunzii","rotund","rotunzii","rotunzi"],"rotunzim":"rotunzi","rotunzimea":"rotunzime","rotunzimi":"rotunzime","rotunzimii":"rotunzime","rotunzimile":"rotunzime","rotunzimilor":"rotunzime","rotunzind":"rotunzi","rotunzira":"rotunzi","rotunziram":"rotunzi","rotunzirati":"rotunzi","rotunzirea":"rotunzire","rotunziri":"rotunzire","rotunzirii":"rotunzire","rotunzirile":"rotunzire","rotunzirilor":"rotunzire","rotunzise":"rotunzi","rotunzisem":"rotunzi","rotunzisera":"rotunzi","rotunziseram":"rotunzi","rotunziserati":"rotunzi","rotunzisesi":"rotunzi","rotunzisi":"rotunzi","rotunzit":"rotunzi","rotunzita":["rotunzită","rotunzit","rotunzita","rotunzit"],"rotunzite":"rotunzit","rotunzitele":"rotunzit","rotunziti":["rotunziți","rotunzi","rotunziți","rotunzit"],"rotunzitii":"rotunzit","rotunzitul":"rotunzit","rotute":"rotuță","rotutei":"rotuță","rotutele":"rotuță","rotutelor":"rotuță","rouai":["rouai","roua","rouăi","rouă"],"rouam":["rouăm","roua","rouam","roua"],"rouand":"roua","rouara":"roua","rouaram":"roua","rouarati":"roua","rouase":"roua","rouasem":"roua","rouasera":"roua","rouaseram":"roua","rouaserati":"roua","rouasesi":"roua","rouasi":"roua","rouat":"roua","rouati":"roua","rouau":"roua","roueaza":"roua","rouez":"roua","rouezi":"roua","rouoasa":["rouoasă","rouos","rouoasa","rouos"],"rouoase":"rouos","rouoasele":"rouos","rouosi":"rouos","rouosii":"rouos","rouosul":"rouos","rourand":"roura","rourara":"roura","rourarea":"rourare","rourari":"rourare","rourarii":"rourare","rourarile":"rourare","rourarilor":"rourare","rourase":"roura","rourasera":"roura","rourat":"roura","rourata":["rourată","rourat","rourata","rourat"],"rourate":"rourat","rouratele":"rourat","rourati":"rourat","rouratii":"rourat","rouratul":"rourat","rourau":"roura","roureaza":"roura","rourele":"rourică","rourice":"rourică","rouricei":"rourică","rouricele":"rourică","rouricelor":"rourică","rouroasa":["rouroasă","rouros","rouroasa","rouros"],"rouroase":"rouros","rouroasele":"rouros","rourosi":"rouros","rourosii":"rouros","rourosul":"rouros","rouruste":"rouruscă","rourustei":"rouruscă","rourustele":"rouruscă","rourustelor":"rouruscă","rousoare":"roușoară","rousoarei":"roușoară","rousoarele":"roușoară","rousoarelor":"roușoară","route":"rouță","routei":"rouță","rovine":"rovină","rovinei":"rovină","rovinele":"rovină","rovinelor":"rovină","roviniete":"rovinietă","rovinietei":"rovinietă","rovinietele":"rovinietă","rovinietelor":"rovinietă","rovinoasa":["rovinoasă","rovinos","rovinoasa","rovinos"],"rovinoase":"rovinos","rovinoasele":"rovinos","rovinosi":"rovinos","rovinosii":"rovinos","rovinosul":"rovinos","roxolane":"roxolană","roxolanei":"roxolană","roxolanele":"roxolană","roxolanelor":"roxolană","rozacee":"rozaceu","rozaceea":["rozaceea","rozacee","rozaceea","rozaceu"],"rozaceei":"rozacee","rozaceele":["rozaceele","rozacee","rozaceele","rozaceu"],"rozaceelor":"rozacee","rozacei":"rozaceu","rozaceii":"rozaceu","rozaceul":"rozaceu","rozalba":["rozalbă","rozalb","rozalba","rozalb"],"rozalbe":"rozalb","rozalbele":"rozalb","rozalbi":"rozalb","rozalbii":"rozalb","rozalbul":"rozalb","rozaline":"rozalină","rozalinei":"rozalină","rozand":"roade","rozarii":"rozariu","rozariile":"rozariu","rozariilor":"rozariu","rozariul":"rozariu","rozariule":"rozariu","rozariului":"rozariu","rozase":"rozasă","rozasei":"rozasă","rozasele":"rozasă","rozaselor":"rozasă","rozatica":["rozatică","rozatic","rozatica","rozatic"],"rozatice":"rozatic","rozaticele":"rozatic","rozatici":"rozatic","rozaticii":"rozatic","rozaticul":"rozatic","rozatoare":"rozător","rozatoarele":"rozător","rozatoarelor":"rozător","rozatorul":"rozător","rozatorule":"rozător","rozatorului":"rozător","rozaturi":"rozătură","rozaturii":"rozătură","rozaturile":"rozătură","rozaturilor":"rozătură","roze":"roză","rozea":"roze","rozei":"roză","rozele":["rozele","roză","rozele","roze"],"rozelor":"roză","rozeole":"rozeolă","rozeolei":"rozeolă","rozeolele":"rozeolă","rozeolelor":"rozeolă","rozete":"rozetă","rozetei":"rozetă","rozetele":"rozetă","rozetelor":"rozetă","rozi":["rozi","roade","rozi","roze"],"rozia":"roziu","rozie":"roziu","rozii":["rozii","roze","rozii","roziu"],"roziii":"roziu","roziile":"roziu","rozinchini":"rozinchin","rozinchinii":"rozinchin","rozinchinilor":"rozinchin","rozinchinul":"rozinchin","rozinchinule":"rozinchin","rozinchinului":"rozinchin","rozisoara":["rozișoară","rozișor","rozișoara","rozișor"],"rozisoare":"rozișor","rozisoarele":"rozișor","rozisori":"rozișor","rozisorii":"rozișor","rozisorul":"rozișor","roziul":"roziu","rozmarini":"rozmarin","rozmarinii":"rozmarin","rozmarinilor":"rozmarin","rozmarinul":"rozmarin","rozmarinule":"rozmarin","rozmarinului":"rozmarin","roznoveana":["roznoveană","roznovean","roznoveana","roznovean"],"roznoveanul":"roznovean","roznoveanule":"roznovean","roznoveanului":"roznovean","roznovence":"roznoveancă","roznovencei":"roznoveancă","roznovencele":"roznoveancă","roznovencelor":"roznoveancă","roznovene":"roznovean","roznovenele":"roznovean","roznoveni":"roznovean","roznovenii":"roznovean","roznovenilor":"roznovean","ruandeze":"ruandeză","ruandezei":"ruandeză","ruandezele":"ruandeză","ruandezelor":"ruandeză","ruandezi":"ruandez","ruandezii":"ruandez","ruandezilor":"ruandez","ruandezul":"ruandez","ruandezule":"ruandez","ruandezului":"ruandez","rubaie":"rubai","rubaiele":"rubai","rubaielor":"rubai","rubaiul":"rubai","rubaiule":"rubai","rubaiului":"rubai","rubarbe":"rubarbă","rubarbei":"rubarbă","rubarbele":"rubarbă","rubarbelor":"rubarbă","rubasti":"rubașcă","rubastii":"rubașcă","rubastile":"rubașcă","rubastilor":"rubașcă","rubate":"rubăț","rubatele":"rubăț","rubatelor":"rubăț","rubatoul":"rubato","rubatoule":"rubato","rubatoului":"rubato","rubatul":"rubăț","rubatule":"rubăț","rubatului":"rubăț","rube":"rubă","rubedenia":"rubedenie","rubedeniei":"rubedenie","rubedenii":"rubedenie","rubedeniile":"rubedenie","rubedeniilor":"rubedenie","rubefactia":"rubefacție","rubefactiei":"rubefacție","rubefactii":"rubefacție","rubefactiile":"rubefacție","rubefactiilor":"rubefacție","rubefianti":"rubefiant","rubefiantii":"rubefiant","rubefiantilor":"rubefiant","rubefiantul":"rubefiant","rubefiantule":"rubefiant","rubefiantului":"rubefiant","rubei":"rubă","rubele":"rubă","rubelite":"rubelit","rubelitele":"rubelit","rubelitelor":"rubelit","rubelitul":"rubelit","rubelitule":"rubelit","rubelitului":"rubelit","rubelor":"rubă","rubeole":"rubeolă","rubeolei":"rubeolă","rubeolele":"rubeolă","rubeolelor":"rubeolă","rubeolica":["rubeolică","rubeolic","rubeolica","rubeolic"],"rubeolice":"rubeolic","rubeolicele":"rubeolic","rubeolici":"rubeolic","rubeolicii":"rubeolic","rubeolicul":"rubeolic","rubia":"rubie","rubiconda":["rubicondă","rubicond","rubiconda","rubicond"],"rubiconde":"rubicond","rubicondele":"rubicond","rubicondul":"rubicond","rubiconzi":"rubicond","rubiconzii":"rubicond","rubidiul":"rubidiu","rubidiule":"rubidiu","rubidiului":"rubidiu","rubiei":"rubie","rubii":"rubie","rubiile":"rubie","rubiilor":"rubie","rubine":"rubin","rubinele":"rubin","rubinelor":"rubin","rubinia":"rubiniu","rubinie":"rubiniu","rubinii":"rubiniu","rubiniii":"rubiniu","rubiniile":"rubiniu","rubiniul":"rubiniu","rubinoasa":["rubinoasă","rubinos","rubinoasa","rubinos"],"rubinoase":"rubinos","rubinoasele":"rubinos","rubinosi":"rubinos","rubinosii":"rubinos","rubinosul":"rubinos","rubinul":"rubin","rubinule":"rubin","rubinului":"rubin","ruble":"rublă","rublei":"rublă","rublele":"rublă","rublelor":"rublă","rublisoare":"rublișoară","rublisoarei":"rublișoară","rublisoarele":"rublișoară","rublisoarelor":"rublișoară","rubricarea":"rubricare","rubricari":"rubricare","rubricarii":"rubricare","rubricarile":"rubricare","rubricarilor":"rubricare","rubrici":"rubrică","rubricii":"rubrică","rubricile":"rubrică","rubricilor":"rubrică","rucavite":"rucaviță","rucavitei":"rucaviță","rucavitele":"rucaviță","rucavitelor":"rucaviță","rucsacul":"rucsac","rucsacule":"rucsac","rucsacului":"rucsac","rucsacuri":"rucsac","rucsacurile":"rucsac","rucsacurilor":"rucsac","rudarese":"rudăreasă","rudaresei":"rudăreasă","rudaresele":"rudăreasă","rudareselor":"rudăreasă","rudari":"rudar","rudaria":"rudărie","rudariei":"rudărie","rudarii":["rudarii","rudar","rudării","rudărie"],"rudarilor":"rudar","rudarite":"rudăriță","rudaritei":"rudăriță","rudaritele":"rudăriță","rudaritelor":"rudăriță","rudarul":"rudar","rudarule":"rudar","rudarului":"rudar","rudasutul":"rudășuț","rudasutule":"rudășuț","rudasutului":"rudășuț","rude":"rudă","rudea":"rudi","rudeai":"rudi","rudeam":"rudi","rudeati":"rudi","rudeau":"rudi","rudei":"rudă","rudele":"rudă","rudelor":"rudă","rudenia":"rudenie","rudeniei":"rudenie","rudenii":"rudenie","rudeniile":"rudenie","rudeniilor":"rudenie","ruderala":["ruderală","ruderal","ruderala","ruderal"],"ruderale":"ruderal","ruderalele":"ruderal","ruderali":"ruderal","ruderalii":"ruderal","ruderalul":"ruderal","rudesc":"rudi","rudeste":"rudi","rudesti":"rudi","rudii":"rudi","rudim":"rudi","rudimentara":["rudimentară","rudimentar","rudimentara","rudimentar"],"rudimentare":"rudimentar","rudimentarele":"rudimentar","rudimentari":"rudimentar","rudimentarii":"rudimentar","rudimentaritatea":"rudimentaritate","rudimentaritati":"rudimentaritate","rudimentaritatii":"rudimentaritate","rudimentarul":"rudimentar","rudimente":"rudiment","rudimentele":"rudiment","rudimentelor":"rudiment","rudimentul":"rudiment","rudimentule":"rudiment","rudimentului":"rudiment","rudind":"rudi","rudioare":"rudioară","rudioarei":"rudioară","rudioarele":"rudioară","rudioarelor":"rudioară","rudira":"rudi","rudiram":"rudi","rudirati":"rudi","rudirea":"rudire","rudiri":"rudire","rudirii":"rudire","rudirile":"rudire","rudirilor":"rudire","rudise":"rudi","rudisem":"rudi","rudisera":"rudi","rudiseram":"rudi","rudiserati":"rudi","rudisesi":"rudi","rudisi":"rudi","rudisoare":"rudișoară","rudisoarei":"rudișoară","rudisoarele":"rudișoară","rudisoarelor":"rudișoară","rudisti":"rudist","rudistii":"rudist","rudistilor":"rudist","rudistul":"rudist","rudistule":"rudist","rudistului":"rudist","rudit":"rudi","ruditi":"rudi","rufaria":"rufărie","rufariei":"rufărie","rufarii":"rufărie","rufe":"rufă","rufei":"rufă","rufele":"rufă","rufelor":"rufă","rufetasi":"rufetaș","rufetasii":"rufetaș","rufetasilor":"rufetaș","rufetasul":"rufetaș","rufetasule":"rufetaș","rufetasului":"rufetaș","rufetul":"rufet","rufetule":"rufet","rufetului":"rufet","rufeturi":"rufet","rufeturile":"rufet","rufeturilor":"rufet","rufianismul":"rufianism","rufianismule":"rufianism","rufianismului":"rufianism","rufoasa":["rufoasă","rufos","rufoasa","rufos"],"rufoase":"rufos","rufoasele":"rufos","rufosi":"rufos","rufosii":"rufos","rufosul":"rufos","rufsoare":"rufșoară","rufsoarei":"rufșoară","rufsoarele":"rufșoară","rufsoarelor":"rufșoară","ruful":"ruf","rufule":"ruf","rufului":"ruf","rufuri":"ruf","rufurile":"ruf","rufurilor":"ruf","rufusoare":"rufușoară","rufusoarei":"rufușoară","rufusoarele":"rufușoară","rufusoarelor":"rufușoară","rugaciuni":"rugăciune","rugai":"ruga","rugam":["rugăm","ruga","rugam","ruga"],"rugaminti":"rugăminte","rugand":"ruga","rugara":"ruga","rugaram":"ruga","rugarati":"ruga","rugarea":"rugare","rugari":"rugare","rugaria":"rugărie","rugariei":"rugărie","rugarii":["rugării","rugare","rugării","rugărie"],"rugarile":"rugare","rugarilor":"rugare","rugase":"ruga","rugasem":"ruga","rugasera":"ruga","rugaseram":"ruga","rugaserati":"ruga","rugasesi":"ruga","rugasi":"ruga","rugat":"ruga","rugati":"ruga","rugatoare":"rugător","rugatoarea":"rugător","rugatoarele":"rugător","rugatori":"rugător","rugatoria":"rugătoriu","rugatorie":"rugătoriu","rugatorii":["rugătorii","rugător","rugătorii","rugătoriu"],"rugatoriii":"rugătoriu","rugatoriile":"rugătoriu","rugatoriul":"rugătoriu","rugatoriuul":"rugătoriu","rugatoriuule":"rugătoriu","rugatoriuului":"rugătoriu","rugatorul":"rugător","rugau":"ruga","rugbiste":"rugbistă","rugbistei":"rugbistă","rugbistele":"rugbistă","rugbistelor":"rugbistă","rugbisti":["rugbiști","rugbist","rugbisti","rugbist"],"rugbistica":["rugbistică","rugbistic","rugbistica","rugbistic"],"rugbistice":"rugbistic","rugbisticele":"rugbistic","rugbistici":"rugbistic","rugbisticii":"rugbistic","rugbisticul":"rugbistic","rugbistii":"rugbist","rugbistilor":"rugbist","rugbistul":"rugbist","rugbistule":"rugbist","rugbistului":"rugbist","rugea":"rugi","rugeai":"rugi","rugeam":"rugi","rugeati":"rugi","rugeau":"rugi","rugesc":"rugi","rugeste":"rugi","rugesti":"rugi","rugete":"ruget","rugetele":"ruget","rugetelor":"ruget","rugetul":"ruget","rugetule":"ruget","rugetului":"ruget","rugi":["rugi","rug","rugi","rugă"],"rugii":["rugii","rug","rugii","rugă","rugii","rugi"],"rugile":"rugă","rugilor":["rugilor","rug","rugilor","rugă"],"rugim":"rugi","ruginarea":"ruginare","ruginari":"ruginare","ruginarii":"ruginare","ruginarile":"ruginare","ruginarilor":"ruginare","rugind":"rugi","ruginea":"rugini","rugineai":"rugini","rugineam":"rugini","rugineati":"rugini","rugineau":"rugini","ruginesc":"rugini","rugineste":"rugini","ruginesti":"rugini","rugini":"rugină","ruginia":"ruginiu","ruginie":"ruginiu","ruginii":["ruginii","rugină","ruginii","rugini","ruginii","ruginiu"],"ruginiii":"ruginiu","ruginiile":"ruginiu","ruginile":"rugină","ruginilor":"rugină","ruginim":"rugini","ruginind":"rugini","ruginira":"rugini","ruginiram":"rugini","ruginirati":"rugini","ruginirea":"ruginire","ruginiri":"ruginire","ruginirii":"ruginire","ruginirile":"ruginire","ruginirilor":"ruginire","ruginise":"rugini","ruginisem":"rugini","ruginisera":"rugini","ruginiseram":"rugini","ruginiserati":"rugini","ruginisesi":"rugini","ruginisi":"rugini","ruginit":"rugini","ruginita":["ruginită","ruginit","ruginita","ruginit"],"ruginite":["ruginite","ruginit","ruginițe","ruginiță"],"ruginitei":"ruginiță","ruginitele":["ruginitele","ruginit","ruginițele","ruginiță"],"ruginitelor":"ruginiță","ruginiti":["ruginiți","rugini","ruginiți","ruginit"],"ruginitii":"ruginit","ruginitul":"ruginit","ruginiture":"ruginitură","ruginiturei":"ruginitură","ruginiturele":"ruginitură","ruginiturelor":"ruginitură","ruginituri":"ruginitură","ruginiul":"ruginiu","ruginoasa":["ruginoasă","ruginos","ruginoasa","ruginos"],"ruginoase":"ruginos","ruginoasele":"ruginos","ruginosi":"ruginos","ruginosii":"ruginos","ruginosul":"ruginos","rugioare":"rugioară","rugioarei":"rugioară","rugioarele":"rugioară","rugioarelor":"rugioară","rugira":"rugi","rugiram":"rugi","rugirati":"rugi","rugise":"rugi","rugisem":"rugi","rugisera":"rugi","rugiseram":"rugi","rugiserati":"rugi","rugisesi":"rugi","rugisi":"rugi","rugit":"rugi","rugiti":"rugi","rugoasa":["rugoasă","rugos","rugoasa","rugos"],"rugoase":"rugos","rugoasele":"rugos","rugosi":"rugos","rugosii":"rugos","rugosul":"rugos","rugozimetre":"rugozimetru","rugozimetrele":"rugozimetru","rugozimetrelor":"rugozimetru","rugozimetrul":"rugozimetru","rugozimetrule":"rugozimetru","rugozimetrului":"rugozimetru","rugozitatea":"rugozitate","rugozitati":"rugozitate","rugozitatii":"rugozitate","rugozitatile":"rugozitate","rugozitatilor":"rugozitate","rugul":"rug","rugule":"rug","ruguleti":"ruguleț","ruguletii":"ruguleț","ruguletilor":"ruguleț","ruguletul":"ruguleț","ruguletule":"ruguleț","ruguletului":"ruguleț","rugului":"rug","ruguri":"rug","rugurile":"rug","rugurilor":"rug","rugusei":"rugușel","ruguseii":"rugușel","ruguseilor":"rugușel","ruguselul":"rugușel","ruguselule":"rugușel","ruguselului":"rugușel","rugusorul":"rugușor","rugusorule":"rugușor","rugusorului":"rugușor","rugute":"ruguță","rugutei":"ruguță","rugutele":"ruguță","rugutelor":"ruguță","rugutelul":"ruguțel","rugutelule":"ruguțel","rugutelului":"ruguțel","rugutul":"ruguț","rugutule":"ruguț","rugutului":"ruguț","ruinai":"ruina","ruinam":["ruinăm","ruina","ruinam","ruina"],"ruinand":"ruina","ruinara":"ruina","ruinaram":"ruina","ruinarati":"ruina","ruinarea":"ruinare","ruinari":"ruinare","ruinarii":"ruinare","ruinarile":"ruinare","ruinarilor":"ruinare","ruinase":"ruina","ruinasem":"ruina","ruinasera":"ruina","ruinaseram":"ruina","ruinaserati":"ruina","ruinasesi":"ruina","ruinasi":"ruina","ruinat":"ruina","ruinata":["ruinată","ruinat","ruinata","ruinat"],"ruinate":"ruinat","ruinatele":"ruinat","ruinati":["ruinați","ruina","ruinați","ruinat"],"ruinatii":"ruinat","ruinatoare":"ruinător","ruinatoarea":"ruinător","ruinatoarele":"ruinător","ruinatori":"ruinător","ruinatorii":"ruinător","ruinatorul":"ruinător","ruinatul":"ruinat","ruinaturi":"ruinătură","ruinaturii":"ruinătură","ruinaturile":"ruinătură","ruinaturilor":"ruinătură","ruinau":"ruina","ruine":"ruină","ruineaza":"ruina","ruinez":"ruina","ruinezi":"ruina","ruinoasa":["ruinoasă","ruinos","ruinoasa","ruinos"],"ruinoase":"ruinos","ruinoasele":"ruinos","ruinosi":"ruinos","ruinosii":"ruinos","ruinosul":"ruinos","rujai":"ruja","rujaline":"rujalină","rujalinei":"rujalină","rujalinele":"rujalină","rujalinelor":"rujalină","rujam":["rujăm","ruja","rujam","ruja"],"rujand":"ruja","rujara":"ruja","rujaram":"ruja","rujarati":"ruja","rujase":"ruja","rujasem":"ruja","rujasera":"ruja","rujaseram":"ruja","rujaserati":"ruja","rujasesi":"ruja","rujasi":"ruja","rujat":"ruja","rujati":"ruja","rujau":"ruja","ruje":"rujă","rujeaza":"ruja","rujei":"rujă","rujele":"rujă","rujelor":"rujă","rujeole":"rujeolă","rujeolei":"rujeolă","rujeolele":"rujeolă","rujeolelor":"rujeolă","rujetul":"rujet","rujetule":"rujet","rujetului":"rujet","rujez":"ruja","rujezi":"ruja","rujnicute":"rujnicuță","rujnicutei":"rujnicuță","rujnicutele":"rujnicuță","rujnicutelor":"rujnicuță","rujoance":"rujoancă","rujoancei":"rujoancă","rujoancele":"rujoancă","rujoancelor":"rujoancă","rujul":"ruj","rujule":"ruj","rujului":"ruj","rujuri":"ruj","rujurile":"ruj","rujurilor":"ruj","rulade":"ruladă","ruladei":"ruladă","ruladele":"ruladă","ruladelor":"ruladă","rulai":"rula","rulam":["rulăm","rula","rulam","rula"],"ruland":"rula","rulanta":["rulantă","rulant","rulanta","rulant"],"rulante":"rulant","rulantele":"rulant","rulanti":"rulant","rulantii":"rulant","rulantul":"rulant","rulara":"rula","rularam":"rula","rularati":"rula","rularea":"rulare","rulari":"rulare","rularii":"rulare","rularile":"rulare","rularilor":"rulare","rulase":"rula","rulasem":"rula","rulasera":"rula","rulaseram":"rula","rulaserati":"rula","rulasesi":"rula","rulasi":"rula","rulat":"rula","rulati":"rula","rulau":"rula","rule":"rulă","ruleaza":"rula","rulei":"rulă","rulele":"rulă","rulelor":"rulă","rulete":"ruletă","ruletei":"ruletă","ruletele":"ruletă","ruletelor":"ruletă","rulez":"rula","rulezi":"rula","ruliul":"ruliu","ruliule":"ruliu","ruliului":"ruliu","ruliuri":"ruliu","ruliurile":"ruliu","ruliurilor":"ruliu","rulmenti":"rulment","rulmentii":"rulment","rulmentilor":"rulment","rulmentiste":"rulmentistă","rulmentistei":"rulmentistă","rulmentistele":"rulmentistă","rulmentistelor":"rulmentistă","rulmentisti":"rulmentist","rulmentistii":"rulmentist","rulmentistilor":"rulmentist","rulmentistul":"rulmentist","rulmentistule":"rulmentist","rulmentistului":"rulmentist","rulmentul":"rulment","rulmentule":"rulment","rulmentului":"rulment","rulote":"rulotă","rulotei":"rulotă","rulotele":"rulotă","rulotelor":"rulotă","ruloul":"rulou","ruloule":"rulou","ruloului":"rulou","rulouri":"rulou","rulourile":"rulou","rulourilor":"rulou","ruluri":"rulură","rulurii":"rulură","rulurile":"rulură","rulurilor":"rulură","ruman":"român","rumana":"română","rumanasi":"rumânaș","rumanasii":"rumânaș","rumanasilor":"rumânaș","rumanasul":"rumânaș","rumanasule":"rumânaș","rumanasului":"rumânaș","rumane":"române","rumaneasca":["rumânească","rumânesc","rumâneasca","rumânesc"],"rumanesc":"românesc","rumanescul":"rumânesc","rumanesti":"rumânesc","rumanestii":"rumânesc","rumanestile":"rumânesc","rumani":["rumâni","români","rumâni","rumân"],"rumanimea":"rumânime","rumanimi":"rumânime","rumanimii":"rumânime","rumbe":"rumbă","rumbei":"rumbă","rumbele":"rumbă","rumbelor":"rumbă","rumeg":"rumega","rumegai":"rumega","rumegam":["rumegăm","rumega","rumegam","rumega"],"rumegand":"rumega","rumegara":"rumega","rumegaram":"rumega","rumegarati":"rumega","rumegarea":"rumegare","rumegari":"rumegare","rumegarii":"rumegare","rumegarile":"rumegare","rumegarilor":"rumegare","rumegase":"rumega","rumegasem":"rumega","rumegasera":"rumega","rumegaseram":"rumega","rumegaserati":"rumega","rumegasesi":"rumega","rumegasi":"rumega","rumegat":"rumega","rumegata":["rumegată","rumegat","rumegata","rumegat"],"rumegate":"rumegat","rumegatele":"rumegat","rumegati":["rumegați","rumega","rumegați","rumegat"],"rumegatii":"rumegat","rumegatoare":"rumegător","rumegatoarea":"rumegător","rumegatoarele":"rumegător","rumegatori":"rumegător","rumegatorii":"rumegător","rumegatorilor":"rumegător","rumegatorul":"rumegător","rumegatorule":"rumegător","rumegatorului":"rumegător","rumegatul":"rumegat","rumegaturi":"rumegătură","rumegaturii":"rumegătură","rumegaturile":"rumegătură","rumegaturilor":"rumegătură","rumegau":"rumega","rumegi":"rumega","rumegusul":"rumeguș","rumegusule":"rumeguș","rumegusului":"rumeguș","rumeioara":["rumeioară","rumeior","rumeioara","rumeior"],"rumeioare":"rumeior","rumeioarele":"rumeior","rumeiori":"rumeior","rumeiorii":"rumeior","rumeiorul":"rumeior","rumeliota":["rumeliotă","rumeliot","rumeliota","rumeliot"],"rumeliote":"rumeliot","rumeliotele":"rumeliot","rumelioti":"rumeliot","rumeliotii":"rumeliot","rumeliotul":"rumeliot","rumena":["rumenă","rumen","rumena","rumen"],"rumene":"rumen","rumenea":"rumeni","rumeneai":"rumeni","rumeneam":"rumeni","rumeneati":"rumeni","rumeneau":"rumeni","rumenela":["rumenelă","rumenel","rumenela","rumenel"],"rumenele":["rumenele","rumen","rumenele","rumeneală","rumenele","rumenel"],"rumenelei":"rumeneală","rumenelele":["rumenelele","rumeneală","rumenelele","rumenel"],"rumenelelor":"rumeneală","rumeneli":["rumeneli","rumeneală","rumeneli","rumenel"],"rumenelii":"rumenel","rumenelor":"rumen","rumenelul":"rumenel","rumenesc":"rumeni","rumeneste":"rumeni","rumenesti":"rumeni","rumeni":"rumen","rumenia":"rumeniu","rumenie":"rumeniu","rumenii":["rumenii","rumen","rumenii","rumeni","rumenii","rumeniu"],"rumeniii":"rumeniu","rumeniile":"rumeniu","rumenim":"rumeni","rumenind":"rumeni","rumenira":"rumeni","rumeniram":"rumeni","rumenirati":"rumeni","rumenirea":"rumenire","rumeniri":"rumenire","rumenirii":"rumenire","rumenirile":"rumenire","rumenirilor":"rumenire","rumenise":"rumeni","rumenisem":"rumeni","rumenisera":"rumeni","rumeniseram":"rumeni","rumeniserati":"rumeni","rumenisesi":"rumeni","rumenisi":"rumeni","rumenit":"rumeni","rumenita":["rumenită","rumenit","rumenita","rumenit"],"rumenite":"rumenit","rumenitele":"rumenit","rumeniti":["rumeniți","rumeni","rumeniți","rumenit"],"rumenitii":"rumenit","rumenitul":"rumenit","rumeniul":"rumeniu","rumenul":"rumen","rumenule":"rumen","rumenului":"rumen","rumenuta":["rumenuță","rumenuț","rumenuța","rumenuț"],"rumenute":"rumenuț","rumenutele":"rumenuț","rumenuti":"rumenuț","rumenutii":"rumenuț","rumenutul":"rumenuț","rumeoara":["rumeoară","rumeor","rumeoara","rumeor"],"rumeoare":"rumeor","rumeoarele":"rumeor","rumeor":"rumeior","rumeori":"rumeor","rumeorii":"rumeor","rumeorul":"rumeor","rumin":"rumân","ruminatia":"ruminație","ruminatiei":"ruminație","ruminatii":"ruminație","ruminatiile":"ruminație","ruminatiilor":"ruminație","ruminite":"ruminită","ruminitei":"ruminită","ruminitele":"ruminită","ruminitelor":"ruminită","rummyul":"rummy","rummyule":"rummy","rummyului":"rummy","rumoarea":"rumoare","rumoari":"rumoare","rumoarii":"rumoare","rumoarile":"rumoare","rumoarilor":"rumoare","rumori":"rumoare","rump":"rumpe","rumpa":"rumpe","rumpand":"rumpe","rumpe":"rupe","rumpea":"rumpe","rumpeai":"rumpe","rumpeam":"rumpe"};
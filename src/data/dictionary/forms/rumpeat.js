@@ -0,0 +1 @@
+export default {"rumpeati":"rumpe","rumpeau":"rumpe","rumpem":"rumpe","rumperea":"rumpere","rumperi":"rumpere","rumperii":"rumpere","rumperile":"rumpere","rumperilor":"rumpere","rumpeti":"rumpe","rumpi":"rumpe","rumpse":"rumpe","rumpsei":"rumpe","rumpsera":"rumpe","rumpseram":"rumpe","rumpserati":"rumpe","rumpsese":"rumpe","rumpsesem":"rumpe","rumpsesera":"rumpe","rumpseseram":"rumpe","rumpseserati":"rumpe","rumpsesesi":"rumpe","rumpsesi":"rumpe","rumpt":"rumpe","rumuri":"rum","runcinata":["runcinată","runcinat","runcinata","runcinat"],"runcinate":"runcinat","runcinatele":"runcinat","runcinati":"runcinat","runcinatii":"runcinat","runcinatul":"runcinat","runcul":"runc","runcule":"runc","runculete":"runculeț","runculetele":"runculeț","runculetelor":"runculeț","runculetul":"runculeț","runculetule":"runculeț","runculetului":"runculeț","runcului":"runc","runcuri":"runc","runcurile":"runc","runcurilor":"runc","runde":["runde","rund","runde","rundă"],"rundei":"rundă","rundele":["rundele","rund","rundele","rundă"],"rundelor":["rundelor","rund","rundelor","rundă"],"rundul":"rund","rundule":"rund","rundului":"rund","rune":"rună","runei":"rună","runele":"rună","runelor":"rună","runica":["runică","runic","runica","runic"],"runice":"runic","runicele":"runic","runici":"runic","runicii":"runic","runicul":"runic","runologe":"runologă","runologei":"runologă","runologele":"runologă","runologelor":"runologă","runologi":"runolog","runologia":"runologie","runologiei":"runologie","runologii":["runologii","runolog","runologii","runologie"],"runologilor":"runolog","runologul":"runolog","runologule":"runolog","runologului":"runolog","rup":"rupe","rupa":"rupe","rupa in bataie":"rupe în bătaie","rupand":"rupe","rupatoare":"rupător","rupatoarea":"rupător","rupatoarele":"rupător","rupatori":"rupător","rupatorii":"rupător","rupatorilor":"rupător","rupatorul":"rupător","rupatorule":"rupător","rupatorului":"rupător","rupea":"rupe","rupeai":"rupe","rupeam":"rupe","rupeati":"rupe","rupeau":"rupe","rupem":"rupe","ruperea":"rupere","ruperi":"rupere","ruperi de nori":"rupere de nori","ruperii":"rupere","ruperile":"rupere","ruperilor":"rupere","rupestra":["rupestră","rupestru","rupestra","rupestru"],"rupestre":"rupestru","rupestrele":"rupestru","rupestri":"rupestru","rupestrii":"rupestru","rupestrul":"rupestru","rupeti":"rupe","rupetitoasa":["rupetițoasă","rupetițos","rupetițoasa","rupetițos"],"rupetitoase":"rupetițos","rupetitoasele":"rupetițos","rupetitosi":"rupetițos","rupetitosii":"rupetițos","rupetitosul":"rupetițos","rupi":"rupe","rupia":"rupie","rupicola":["rupicolă","rupicol","rupicola","rupicol"],"rupicole":"rupicol","rupicolele":"rupicol","rupicoli":"rupicol","rupicolii":"rupicol","rupicolul":"rupicol","rupiei":"rupie","rupii":"rupie","rupiile":"rupie","rupiilor":"rupie","rupofobia":"rupofobie","rupofobiei":"rupofobie","rupofobii":"rupofobie","rupofobiile":"rupofobie","rupofobiilor":"rupofobie","rupse":"rupe","rupsei":"rupe","rupsera":"rupe","rupseram":"rupe","rupserati":"rupe","rupsese":"rupe","rupsesem":"rupe","rupsesera":"rupe","rupseseram":"rupe","rupseserati":"rupe","rupsesesi":"rupe","rupsesi":"rupe","rupt":"rupe","rupt in bataie":"rupe în bătaie","rupta":["ruptă","rupt","rupta","rupt"],"rupte":["rupte","rupt","rupte","ruptă"],"ruptei":"ruptă","ruptele":["ruptele","rupt","ruptele","ruptă"],"ruptelor":"ruptă","rupti":"rupt","ruptii":"rupt","ruptoarea":"ruptoare","ruptoari":"ruptoare","ruptoarii":"ruptoare","ruptoasa":["ruptoasă","ruptos","ruptoasa","ruptos"],"ruptoase":"ruptos","ruptoasele":"ruptos","ruptosi":"ruptos","ruptosii":"ruptos","ruptosul":"ruptos","ruptul":"rupt","rupturi":"ruptură","rupturii":"ruptură","rupturile":"ruptură","rupturilor":"ruptură","rurala":["rurală","rural","rurala","rural"],"rurale":"rural","ruralele":"rural","rurali":"rural","ruralii":"rural","ruralisme":"ruralism","ruralismele":"ruralism","ruralismelor":"ruralism","ruralismul":"ruralism","ruralismule":"ruralism","ruralismului":"ruralism","ruralizai":"ruraliza","ruralizam":["ruralizăm","ruraliza","ruralizam","ruraliza"],"ruralizand":"ruraliza","ruralizara":"ruraliza","ruralizaram":"ruraliza","ruralizarati":"ruraliza","ruralizase":"ruraliza","ruralizasem":"ruraliza","ruralizasera":"ruraliza","ruralizaseram":"ruraliza","ruralizaserati":"ruraliza","ruralizasesi":"ruraliza","ruralizasi":"ruraliza","ruralizat":"ruraliza","ruralizata":["ruralizată","ruralizat","ruralizata","ruralizat"],"ruralizate":"ruralizat","ruralizatele":"ruralizat","ruralizati":["ruralizați","ruraliza","ruralizați","ruralizat"],"ruralizatii":"ruralizat","ruralizatul":"ruralizat","ruralizau":"ruraliza","ruralizeaza":"ruraliza","ruralizez":"ruraliza","ruralizezi":"ruraliza","ruralul":"rural","rure":"rură","rurei":"rură","rurele":"rură","rurelor":"rură","rusa":["rusă","rus","rusa","rus"],"rusalce":"rusalcă","rusalcei":"rusalcă","rusalcele":"rusalcă","rusalcelor":"rusalcă","rusalie":["rusalie","Rusalii","rusalie","rusalii"],"rusaliile":["rusaliile","Rusalii","rusaliile","rusalii"],"rusaliilor":["rusaliilor","Rusalii","rusaliilor","rusalii"],"rusava":["rusavă","rusav","rusava","rusav"],"rusave":"rusav","rusavele":"rusav","rusavi":"rusav","rusavii":"rusav","rusavul":"rusav","rusce":"ruscă","ruscei":"ruscă","ruscele":"ruscă","ruscelor":"ruscă","ruscismul":"ruscism","ruscismule":"ruscism","ruscismului":"ruscism","rusculite":["rusculițe","rusculiță","rușculițe","rușculiță"],"rusculitei":["rusculiței","rusculiță","rușculiței","rușculiță"],"rusculitele":["rusculițele","rusculiță","rușculițele","rușculiță"],"rusculitelor":["rusculițelor","rusculiță","rușculițelor","rușculiță"],"ruse":["ruse","rus","ruse","rusă"],"ruseasca":["rusească","rusesc","ruseasca","rusesc"],"rusei":"rusă","rusele":"rus","rusescul":"rusesc","rusesti":"rusesc","rusestii":"rusesc","rusestile":"rusesc","rusfertul":"rușfert","rusfertule":"rușfert","rusfertului":"rușfert","rusferturi":"rușfert","rusferturile":"rușfert","rusferturilor":"rușfert","rusfetaria":"rușfetărie","rusfetariei":"rușfetărie","rusfetarii":"rușfetărie","rusfetariile":"rușfetărie","rusfetariilor":"rușfetărie","rusfetul":"rușfet","rusfetule":"rușfet","rusfetului":"rușfet","rusfeturi":"rușfet","rusfeturile":"rușfet","rusfeturilor":"rușfet","rusi":"rus","rusie":"Rusia","rusiei":"Rusia","rusieneasca":["rusienească","rusienesc","rusieneasca","rusienesc"],"rusienescul":"rusienesc","rusienesti":"rusienesc","rusienestii":"rusienesc","rusienestile":"rusienesc","rusific":"rusifica","rusificai":"rusifica","rusificam":["rusificăm","rusifica","rusificam","rusifica"],"rusificand":"rusifica","rusificara":"rusifica","rusificaram":"rusifica","rusificarati":"rusifica","rusificarea":"rusificare","rusificari":"rusificare","rusificarii":"rusificare","rusificarile":"rusificare","rusificarilor":"rusificare","rusificase":"rusifica","rusificasem":"rusifica","rusificasera":"rusifica","rusificaseram":"rusifica","rusificaserati":"rusifica","rusificasesi":"rusifica","rusificasi":"rusifica","rusificat":"rusifica","rusificata":["rusificată","rusificat","rusificata","rusificat"],"rusificate":"rusificat","rusificatele":"rusificat","rusificati":["rusificați","rusifica","rusificați","rusificat"],"rusificatii":"rusificat","rusificatul":"rusificat","rusificau":"rusifica","rusifici":"rusifica","rusii":["rușii","rus","rusii","Rusia"],"rusilor":"rus","rusinaciunea":"rușinăciune","rusinaciuni":"rușinăciune","rusinaciunii":"rușinăciune","rusinaciunile":"rușinăciune","rusinaciunilor":"rușinăciune","rusinai":"rușina","rusinam":["rușinăm","rușina","rușinam","rușina"],"rusinand":"rușina","rusinara":"rușina","rusinaram":"rușina","rusinarati":"rușina","rusinarea":"rușinare","rusinari":"rușinare","rusinarii":"rușinare","rusinarile":"rușinare","rusinarilor":"rușinare","rusinase":"rușina","rusinasem":"rușina","rusinasera":"rușina","rusinaseram":"rușina","rusinaserati":"rușina","rusinasesi":"rușina","rusinasi":"rușina","rusinat":"rușina","rusinata":["rușinată","rușinat","rușinata","rușinat"],"rusinate":"rușinat","rusinatele":"rușinat","rusinati":["rușinați","rușina","rușinați","rușinat"],"rusinatii":"rușinat","rusinatul":"rușinat","rusinau":"rușina","rusinea":"rușine","rusineaza":"rușina","rusinez":"rușina","rusinezi":"rușina","rusini":"rușine","rusinii":"rușine","rusinile":"rușine","rusinilor":"rușine","rusinoasa":["rușinoasă","rușinos","rușinoasa","rușinos"],"rusinoase":"rușinos","rusinoasele":"rușinos","rusinosi":"rușinos","rusinosii":"rușinos","rusinosul":"rușinos","rusisme":"rusism","rusismele":"rusism","rusismelor":"rusism","rusismul":"rusism","rusismule":"rusism","rusismului":"rusism","rusita":["rușită","rușit","rușita","rușit"],"rusite":"rușit","rusitele":"rușit","rusiti":"rușit","rusitii":"rușit","rusitul":"rușit","rusnaci":"rusnac","rusneceasca":["rusnecească","rusnecesc","rusneceasca","rusnecesc"],"rusnecescul":"rusnecesc","rusnecesti":"rusnecesc","rusnecestii":"rusnecesc","rusnecestile":"rusnecesc","rusoaice":"rusoaică","rusofile":"rusofilă","rusofilei":"rusofilă","rusofilele":"rusofilă","rusofilelor":"rusofilă","rusofili":"rusofil","rusofilia":"rusofilie","rusofiliei":"rusofilie","rusofilii":["rusofilii","rusofil","rusofilii","rusofilie"],"rusofililor":"rusofil","rusofilul":"rusofil","rusofilule":"rusofil","rusofilului":"rusofil","rusofobi":"rusofob","rusofobia":"rusofobie","rusofobiei":"rusofobie","rusofobii":["rusofobii","rusofob","rusofobii","rusofobie"],"rusofobilor":"rusofob","rusofobul":"rusofob","rusofobule":"rusofob","rusofobului":"rusofob","rusofona":["rusofonă","rusofon","rusofona","rusofon"],"rusofone":"rusofon","rusofonele":"rusofon","rusofoni":"rusofon","rusofonii":"rusofon","rusofonilor":"rusofon","rusofonul":"rusofon","rusofonule":"rusofon","rusofonului":"rusofon","ruste":["ruște","ruscă","ruște","rușcă"],"rustei":["ruștei","ruscă","ruștei","rușcă"],"rustele":["ruștele","ruscă","ruștele","rușcă"],"rustelor":["ruștelor","ruscă","ruștelor","rușcă"],"rusti":"rușcă","rustica":["rustică","rustic","rustica","rustic"],"rusticana":["rusticană","rustican","rusticana","rustican"],"rusticane":"rustican","rusticanele":"rustican","rusticani":"rustican","rusticanii":"rustican","rusticanul":"rustican","rustice":"rustic","rusticeasca":["rusticească","rusticesc","rusticeasca","rusticesc"],"rusticele":"rustic","rusticescul":"rusticesc","rusticesti":"rusticesc","rusticestii":"rusticesc","rusticestile":"rusticesc","rustici":"rustic","rusticii":"rustic","rusticismul":"rusticism","rusticismule":"rusticism","rusticismului":"rusticism","rusticitatea":"rusticitate","rusticitati":"rusticitate","rusticitatii":"rusticitate","rusticizai":"rusticiza","rusticizam":["rusticizăm","rusticiza","rusticizam","rusticiza"],"rusticizand":"rusticiza","rusticizara":"rusticiza","rusticizaram":"rusticiza","rusticizarati":"rusticiza","rusticizarea":"rusticizare","rusticizari":"rusticizare","rusticizarii":"rusticizare","rusticizarile":"rusticizare","rusticizarilor":"rusticizare","rusticizase":"rusticiza","rusticizasem":"rusticiza","rusticizasera":"rusticiza","rusticizaseram":"rusticiza","rusticizaserati":"rusticiza","rusticizasesi":"rusticiza","rusticizasi":"rusticiza","rusticizat":"rusticiza","rusticizata":["rusticizată","rusticizat","rusticizata","rusticizat"],"rusticizate":"rusticizat","rusticizatele":"rusticizat","rusticizati":["rusticizați","rusticiza","rusticizați","rusticizat"],"rusticizatii":"rusticizat","rusticizatul":"rusticizat","rusticizau":"rusticiza","rusticizeaza":"rusticiza","rusticizez":"rusticiza","rusticizezi":"rusticiza","rusticul":"rustic","rusul":"rus","rusule":"rus","rusulite":"rușuliță","rusulitei":"rușuliță","rusulitele":"rușuliță","rusulitelor":"rușuliță","rusului":"rus","rute":"rută","ruteana":["ruteană","rutean","ruteana","rutean"],"ruteanul":"rutean","ruteanule":"rutean","ruteanului":"rutean","rutei":"rută","rutele":"rută","rutelor":"rută","rutence":"ruteancă","rutencei":"ruteancă","rutencele":"ruteancă","rutencelor":"ruteancă","rutene":["rutene","rutean","rutene","ruteană"],"rutenei":"ruteană","rutenele":["rutenele","rutean","rutenele","ruteană"],"rutenelor":"ruteană","ruteni":"rutean","rutenii":"rutean","rutenilor":"rutean","rutenisme":"rutenism","rutenismele":"rutenism","rutenismelor":"rutenism","rutenismul":"rutenism","rutenismule":"rutenism","rutenismului":"rutenism","ruteniul":"ruteniu","ruteniule":"ruteniu","ruteniului":"ruteniu","rutherfordiul":"rutherfordiu","rutherfordiule":"rutherfordiu","rutherfordiului":"rutherfordiu","rutherfordul":"rutherford","rutherfordule":"rutherford","rutherfordului":"rutherford","rutherforzi":"rutherford","rutherforzii":"rutherford","rutherforzilor":"rutherford","rutiera":["rutieră","rutier","rutiera","rutier"],"rutiere":["rutiere","rutier","rutiere","rutieră"],"rutierei":"rutieră","rutierele":["rutierele","rutier","rutierele","rutieră"],"rutierelor":"rutieră","rutieri":"rutier","rutierii":"rutier","rutierul":"rutier","rutilul":"rutil","rutilule":"rutil","rutilului":"rutil","rutinai":"rutina","rutinam":["rutinăm","rutina","rutinam","rutina"],"rutinand":"rutina","rutinara":"rutina","rutinaram":"rutina","rutinarati":"rutina","rutinare":"rutinară","rutinarei":"rutinară","rutinarele":"rutinară","rutinarelor":"rutinară","rutinase":"rutina","rutinasem":"rutina","rutinasera":"rutina","rutinaseram":"rutina","rutinaserati":"rutina","rutinasesi":"rutina","rutinasi":"rutina","rutinat":"rutina","rutinati":"rutina","rutinau":"rutina","rutine":"rutină","rutineaza":"rutina","rutinei":"rutină","rutinele":"rutină","rutinelor":"rutină","rutinez":"rutina","rutinezi":"rutina","rutiniere":"rutinieră","rutinierei":"rutinieră","rutinierele":"rutinieră","rutinierelor":"rutinieră","rutinieri":"rutinier","rutinierii":"rutinier","rutinierilor":"rutinier","rutinierul":"rutinier","rutinierule":"rutinier","rutinierului":"rutinier","rutisori":"rutișor","rutisorii":"rutișor","rutisorilor":"rutișor","rutisorul":"rutișor","rutisorule":"rutișor","rutisorului":"rutișor"};
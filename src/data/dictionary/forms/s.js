@@ -0,0 +1 @@
+export default {"s":"-e","sa":["sa","ea","sa","el"],"sa -":["să -","-a","să -","-e","să -","-ea","să -","-i","să -","-î"],"sa -a":["să -ă","-e","să -ă","-ea","să -ă","-i"],"sa -am":["să -ăm","-a","să -âm","-î"],"sa -ati":["să -ați","-a","să -âți","-î"],"sa -e":["să -e","-a","să -e","-î"],"sa -em":["să -em","-e","să -em","-ea"],"sa -eti":["să -eți","-e","să -eți","-ea"],"sa -i":["să -i","-a","să -i","-e","să -i","-ea","să -i","-i","să -i","-î"],"sa -im":"-i","sa -iti":"-i","sa babardeasca":"babardi","sa babardesc":"babardi","sa babardesti":"babardi","sa babardim":"babardi","sa babarditi":"babardi","sa bacceleasca":"bacceli","sa baccelesc":"bacceli","sa baccelesti":"bacceli","sa baccelim":"bacceli","sa bacceliti":"bacceli","sa baciuiasca":"băciui","sa baciuiesc":"băciui","sa baciuiesti":"băciui","sa baciuim":"băciui","sa baciuiti":"băciui","sa bacseasca":"bâcsi","sa bacsesc":"bâcsi","sa bacsesti":"bâcsi","sa bacsim":"bâcsi","sa bacsiti":"bâcsi","sa badadaiasca":"bădădăi","sa badadaiesc":"bădădăi","sa badadaiesti":"bădădăi","sa badadaim":"bădădăi","sa badadaiti":"bădădăi","sa badaduiasca":"bădădui","sa badaduiesc":"bădădui","sa badaduiesti":"bădădui","sa badaduim":"bădădui","sa badaduiti":"bădădui","sa badijonam":"badijona","sa badijonati":"badijona","sa badijonez":"badijona","sa badijoneze":"badijona","sa badijonezi":"badijona","sa badinam":"badina","sa badinati":"badina","sa badinez":"badina","sa badineze":"badina","sa badinezi":"badina","sa bag":"băga","sa bagam":"băga","sa bagatelizam":"bagateliza","sa bagatelizati":"bagateliza","sa bagatelizez":"bagateliza","sa bagatelizeze":"bagateliza","sa bagatelizezi":"bagateliza","sa bagati":"băga","sa bage":"băga","sa bagi":"băga","sa bagiocur":"bagiocuri","sa bagiocura":"bagiocuri","sa bagiocuri":"bagiocuri","sa bagiocurim":"bagiocuri","sa bagiocuriti":"bagiocuri","sa bai":"băia","sa baiati":"băia","sa baie":"băia","sa baiem":"băia","sa baigui":"bâigui","sa baiguie":"bâigui","sa baiguim":"bâigui","sa baiguiti":"bâigui","sa bajbai":"bâjbâi","sa bajbaie":"bâjbâi","sa bajbaim":"bâjbâi","sa bajbaiti":"bâjbâi","sa bajenareasca":"băjenări","sa bajenaresc":"băjenări","sa bajenaresti":"băjenări","sa bajenarim":"băjenări","sa bajenariti":"băjenări","sa balaceasca":"bălăci","sa balacesc":"bălăci","sa balacesti":"bălăci","sa balacim":"bălăci","sa balaciti":"bălăci","sa balaiasca":"bălăi","sa balaiesc":"bălăi","sa balaiesti":"bălăi","sa balaim":"bălăi","sa balaiti":"bălăi","sa balansam":"balansa","sa balansati":"balansa","sa balansez":"balansa","sa balanseze":"balansa","sa balansezi":"balansa","sa balantam":"balanța","sa balantati":"balanța","sa balantez":"balanța","sa balanteze":"balanța","sa balantezi":"balanța","sa balastam":"balasta","sa balastati":"balasta","sa balastez":"balasta","sa balasteze":"balasta","sa balastezi":"balasta","sa balbai":"bâlbâi","sa balbaie":"bâlbâi","sa balbaim":"bâlbâi","sa balbaiti":"bâlbâi","sa baleg":"bălega","sa balegam":"bălega","sa balegati":"bălega","sa balege":"bălega","sa balegi":"bălega","sa balig":"băliga","sa baligam":"băliga","sa baligati":"băliga","sa balige":"băliga","sa baligi":"băliga","sa balizam":"baliza","sa balizati":"baliza","sa balizez":"baliza","sa balizeze":"baliza","sa balizezi":"baliza","sa balmajeasca":"bălmăji","sa balmajesc":"bălmăji","sa balmajesti":"bălmăji","sa balmajim":"bălmăji","sa balmajiti":"bălmăji","sa balmojeasca":"bălmoji","sa balmojesc":"bălmoji","sa balmojesti":"bălmoji","sa balmojim":"bălmoji","sa balmojiti":"bălmoji","sa balonam":"balona","sa balonati":"balona","sa balonez":"balona","sa baloneze":"balona","sa balonezi":"balona","sa balsamam":"bălsăma","sa balsamati":"bălsăma","sa balsameasca":"bălsămi","sa balsamesc":"bălsămi","sa balsamesti":"bălsămi","sa balsamez":"bălsăma","sa balsameze":"bălsăma","sa balsamezi":"bălsăma","sa balsamim":"bălsămi","sa balsamiti":"bălsămi","sa balsamui":"balsamui","sa balsamuie":"balsamui","sa balsamuim":"balsamui","sa balsamuiti":"balsamui","sa banalizam":"banaliza","sa banalizati":"banaliza","sa banalizez":"banaliza","sa banalizeze":"banaliza","sa banalizezi":"banaliza","sa banchetam":"bancheta","sa banchetati":"bancheta","sa banchetez":"bancheta","sa bancheteze":"bancheta","sa banchetezi":"bancheta","sa bancrutam":"bancruta","sa bancrutati":"bancruta","sa bancrutez":"bancruta","sa bancruteze":"bancruta","sa bancrutezi":"bancruta","sa bandajam":"bandaja","sa bandajati":"bandaja","sa bandajez":"bandaja","sa bandajeze":"bandaja","sa bandajezi":"bandaja","sa baneasca":"băni","sa banesc":"băni","sa banesti":"băni","sa banim":"băni","sa baniti":"băni","sa bantui":"bântui","sa bantuie":"bântui","sa bantuim":"bântui","sa bantuiti":"bântui","sa banuiasca":"bănui","sa banuiesc":"bănui","sa banuiesti":"bănui","sa banuim":"bănui","sa banuiti":"bănui","sa barai":"bârâi","sa baraie":"bârâi","sa baraim":"bârâi","sa baraiti":"bârâi","sa baram":"bara","sa baraneasca":"bărăni","sa baranesc":"bărăni","sa baranesti":"bărăni","sa baranim":"bărăni","sa baraniti":"bărăni","sa barati":"bara","sa barbarizam":"barbariza","sa barbarizati":"barbariza","sa barbarizez":"barbariza","sa barbarizeze":"barbariza","sa barbarizezi":"barbariza","sa barbiereasca":"bărbieri","sa barbieresc":"bărbieri","sa barbieresti":"bărbieri","sa barbierim":"bărbieri","sa barbieriti":"bărbieri","sa barduiasca":"bărdui","sa barduiesc":"bărdui","sa barduiesti":"bărdui","sa barduim":"bărdui","sa barduiti":"bărdui","sa barez":"bara","sa bareze":"bara","sa barezi":"bara","sa barfeasca":"bârfi","sa barfesc":"bârfi","sa barfesti":"bârfi","sa barfim":"bârfi","sa barfiti":"bârfi","sa baricadam":"baricada","sa baricadati":"baricada","sa baricadez":"baricada","sa baricadeze":"baricada","sa baricadezi":"baricada","sa barlig":"bârliga","sa barligam":"bârliga","sa barligati":"bârliga","sa barlige":"bârliga","sa barligi":"bârliga","sa bas":"băși","sa basculam":"bascula","sa basculati":"bascula","sa basculez":"bascula","sa basculeze":"bascula","sa basculezi":"bascula","sa basic":"bășica","sa basicam":"bășica","sa basicati":"bășica","sa basice":"bășica","sa basici":"bășica","sa basim":"băși","sa basiti":"băși","sa basmui":"băsmui","sa basmuie":"băsmui","sa basmuim":"băsmui","sa basmuiti":"băsmui","sa basneasca":"băsni","sa basnesc":"băsni","sa basnesti":"băsni","sa basnim":"băsni","sa basniti":"băsni","sa bat":"bate","sa bata":"bate","sa batai":"bâțâi","sa bataie":"bâțâi","sa bataim":"bâțâi","sa bataiti":"bâțâi","sa batatoreasca":"bătători","sa batatoresc":"bătători","sa batatoresti":"bătători","sa batatorim":"bătători","sa batatoriti":"bătători","sa batatureasca":"bătături","sa bataturesc":"bătături","sa bataturesti":"bătături","sa bataturim":"bătături","sa bataturiti":"bătături","sa batem":"bate","sa bateti":"bate","sa batgiocuram":"batgiocura","sa batgiocurati":"batgiocura","sa batgiocurez":"batgiocura","sa batgiocureze":"batgiocura","sa batgiocurezi":"batgiocura","sa bati":"bate","sa batjocoreasca":"batjocori","sa batjocoresc":"batjocori","sa batjocoresti":"batjocori","sa batjocorim":"batjocori","sa batjocoriti":"batjocori","sa batjocuram":"batjocura","sa batjocurati":"batjocura","sa batjocureasca":"batjocuri","sa batjocuresc":"batjocuri","sa batjocuresti":"batjocuri","sa batjocurez":"batjocura","sa batjocureze":"batjocura","sa batjocurezi":"batjocura","sa batjocurim":"batjocuri","sa batjocuriti":"batjocuri","sa bazai":["să bâzâi","bâzâi","să bâzăi","bâzăi"],"sa bazaie":["să bâzâie","bâzâi","să bâzăie","bâzăi"],"sa bazaim":["să bâzâim","bâzâi","să bâzăim","bâzăi"],"sa bazaiti":["să bâzâiți","bâzâi","să bâzăiți","bâzăi"],"sa bazam":"baza","sa bazati":"baza","sa bazez":"baza","sa bazeze":"baza","sa bazezi":"baza","sa bea":"bea","sa beatific":"beatifica","sa beatificam":"beatifica","sa beatificati":"beatifica","sa beatifice":"beatifica","sa beatifici":"beatifica","sa beau":"bea","sa bedui":"bedui","sa beduie":"bedui","sa beduim":"bedui","sa beduiti":"bedui","sa bei":"bea","sa bejanareasca":"bejănări","sa bejanaresc":"bejănări","sa bejanaresti":"bejănări","sa bejanarim":"bejănări","sa bejanariti":"bejănări","sa bejaneasca":"bejăni","sa bejanesc":"bejăni","sa bejanesti":"bejăni","sa bejanim":"bejăni","sa bejaniti":"bejăni","sa bejeneasca":"bejeni","sa bejenesc":"bejeni","sa bejenesti":"bejeni","sa bejenim":"bejeni","sa bejeniti":"bejeni","sa beleasca":"beli","sa beleasca pula":"beli pula","sa belesc":"beli","sa belesc pula":"beli pula","sa belesti":"beli","sa belesti pula":"beli pula","sa belim":"beli","sa belim pula":"beli pula","sa beliti":"beli","sa beliti pula":"beli pula","sa bem":"bea","sa bemolizam":"bemoliza","sa bemolizati":"bemoliza","sa bemolizez":"bemoliza","sa bemolizeze":"bemoliza","sa bemolizezi":"bemoliza","sa benchetuiasca":"benchetui","sa benchetuiesc":"benchetui","sa benchetuiesti":"benchetui","sa benchetuim":"benchetui","sa benchetuiti":"benchetui","sa beneficiati":"beneficia","sa beneficiem":"beneficia","sa beneficiez":"beneficia","sa beneficieze":"beneficia","sa beneficiezi":"beneficia","sa berbeceasca":"berbeci","sa berbecesc":"berbeci","sa berbecesti":"berbeci","sa berbecim":"berbeci","sa berbeciti":"berbeci","sa beregateasca":"beregăți","sa beregatesc":"beregăți","sa beregatesti":"beregăți","sa beregatim":"beregăți","sa beregatiti":"beregăți","sa beregatuiasca":"beregătui","sa beregatuiesc":"beregătui","sa beregatuiesti":"beregătui","sa beregatuim":"beregătui","sa beregatuiti":"beregătui","sa bese":"băși","sa besi":"băși","sa besic":"beșica","sa besicam":"beșica","sa besicati":"beșica","sa besice":"beșica","sa besici":"beșica","sa besteleasca":"beșteli","sa bestelesc":"beșteli","sa bestelesti":"beșteli","sa bestelim":"beșteli","sa besteliti":"beșteli","sa bestializam":"bestializa","sa bestializati":"bestializa","sa bestializez":"bestializa","sa bestializeze":"bestializa","sa bestializezi":"bestializa","sa betejeasca":"beteji","sa betejesc":"beteji","sa betejesti":"beteji","sa betejim":"beteji","sa betejiti":"beteji","sa beti":"bea","sa betiveasca":"bețivi","sa betivesc":"bețivi","sa betivesti":"bețivi","sa betivim":"bețivi","sa betiviti":"bețivi","sa betonam":"betona","sa betonati":"betona","sa betonez":"betona","sa betoneze":"betona","sa betonezi":"betona","sa bezaconuiasca":"bezaconui","sa bezaconuiesc":"bezaconui","sa bezaconuiesti":"bezaconui","sa bezaconuim":"bezaconui","sa bezaconuiti":"bezaconui","sa bichireasca":"bichiri","sa bichiresc":"bichiri","sa bichiresti":"bichiri","sa bichirim":"bichiri","sa bichiriti":"bichiri","sa biciuiasca":"biciui","sa biciuiesc":"biciui","sa biciuiesti":"biciui","sa biciuim":"biciui","sa biciuiti":"biciui","sa bifam":"bifa","sa bifati":"bifa","sa bifez":"bifa","sa bifeze":"bifa","sa bifezi":"bifa","sa bifurc":"bifurca","sa bifurcam":"bifurca","sa bifurcati":"bifurca","sa bifurce":"bifurca","sa bifurci":"bifurca","sa bihindiseasca":"bihindisi","sa bihindisesc":"bihindisi","sa bihindisesti":"bihindisi","sa bihindisim":"bihindisi","sa bihindisiti":"bihindisi","sa bindiseasca":"bindisi","sa bindisesc":"bindisi","sa bindisesti":"bindisi","sa bindisim":"bindisi","sa bindisiti":"bindisi","sa binecuvantam":"binecuvânta","sa binecuvantati":"binecuvânta","sa binecuvantez":"binecuvânta","sa binecuvanteze":"binecuvânta","sa binecuvantezi":"binecuvânta","sa binefac":"bineface","sa binefaca":"bineface","sa binefacem":"bineface","sa binefaceti":"bineface","sa binefaci":"bineface","sa binemerit":"binemerita","sa binemeritam":"binemerita","sa binemeritati":"binemerita","sa binemerite":"binemerita","sa binemeriti":"binemerita","sa binevesteasca":"binevesti","sa binevestesc":"binevesti","sa binevestesti":"binevesti","sa binevestim":"binevesti","sa binevestiti":"binevesti","sa binevoiasca":"binevoi","sa binevoiesc":"binevoi","sa binevoiesti":"binevoi","sa binevoim":"binevoi","sa binevoiti":"binevoi","sa binoclam":"binocla","sa binoclati":"binocla","sa binoclez":"binocla","sa binocleze":"binocla","sa binoclezi":"binocla","sa bintatuiasca":"bintătui","sa bintatuiesc":"bintătui","sa bintatuiesti":"bintătui","sa bintatuim":"bintătui","sa bintatuiti":"bintătui","sa biostimulam":"biostimula","sa biostimulati":"biostimula","sa biostimulez":"biostimula","sa biostimuleze":"biostimula","sa biostimulezi":"biostimula","sa bipai":"bipăi","sa bipaie":"bipăi","sa bipaim":"bipăi","sa bipaiti":"bipăi","sa birocratizam":"birocratiza","sa birocratizati":"birocratiza","sa birocratizez":"birocratiza","sa birocratizeze":"birocratiza","sa birocratizezi":"birocratiza","sa birsagalui":"birșăgălui","sa birsagaluie":"birșăgălui","sa birsagaluim":"birșăgălui","sa birsagaluiti":"birșăgălui","sa biruiasca":"birui","sa biruiesc":"birui","sa biruiesti":"birui","sa biruim":"birui","sa biruiti":"birui","sa bisam":"bisa","sa bisati":"bisa","sa bisez":"bisa","sa biseze":"bisa","sa bisezi":"bisa","sa bitumam":"bituma","sa bitumati":"bituma","sa bitumez":"bituma","sa bitumeze":"bituma","sa bitumezi":"bituma","sa bivuacam":"bivuaca","sa bivuacati":"bivuaca","sa bivuachez":"bivuaca","sa bivuacheze":"bivuaca","sa bivuachezi":"bivuaca","sa bizui":"bizui","sa bizuie":"bizui","sa bizuim":"bizui","sa bizuiti":"bizui","sa blagodareasca":"blagodari","sa blagodaresc":"blagodari","sa blagodaresti":"blagodari","sa blagodarim":"blagodari","sa blagodariti":"blagodari","sa blagosloveasca":"blagoslovi","sa blagoslovesc":"blagoslovi","sa blagoslovesti":"blagoslovi","sa blagoslovim":"blagoslovi","sa blagosloviti":"blagoslovi","sa blamam":"blama","sa blamati":"blama","sa blamez":"blama","sa blameze":"blama","sa blamezi":"blama","sa blaneasca":"blăni","sa blanesc":"blăni","sa blanesti":"blăni","sa blanim":"blăni","sa blaniti":"blăni","sa blanuiasca":"blănui","sa blanuiesc":"blănui","sa blanuiesti":"blănui","sa blanuim":"blănui","sa blanuiti":"blănui","sa blasfem":"blasfema","sa blasfemam":"blasfema","sa blasfemati":"blasfema","sa blasfeme":"blasfema","sa blasfemi":"blasfema","sa blastam":"blăstăma","sa blastamam":"blăstăma","sa blastamati":"blăstăma","sa blastame":"blăstăma","sa blastami":"blăstăma","sa blastem":"blăstema","sa blastemam":"blăstema","sa blastemati":"blăstema","sa blasteme":"blăstema","sa blastemi":"blăstema","sa blazam":"blaza","sa blazati":"blaza","sa blazez":"blaza","sa blazeze":"blaza","sa blazezi":"blaza","sa bleorcot":"bleorcoti","sa bleorcota":"bleorcoti","sa bleorcoti":"bleorcoti","sa bleorcotim":"bleorcoti","sa bleorcotiti":"bleorcoti","sa blestem":"blestema","sa blestemam":"blestema","sa blestemati":"blestema","sa blesteme":"blestema","sa blestemi":"blestema","sa blindam":"blinda","sa blindati":"blinda","sa blindez":"blinda","sa blindeze":"blinda","sa blindezi":"blinda","sa blocam":"bloca","sa blocati":"bloca","sa blochez":"bloca","sa blocheze":"bloca","sa blochezi":"bloca","sa blodogoreasca":"blodogori","sa blodogoresc":"blodogori","sa blodogoresti":"blodogori","sa blodogorim":"blodogori","sa blodogoriti":"blodogori","sa blonzeasca":"blonzi","sa blonzesc":"blonzi","sa blonzesti":"blonzi","sa blonzim":"blonzi","sa blonziti":"blonzi","sa bobinam":"bobina","sa bobinati":"bobina","sa bobinez":"bobina","sa bobineze":"bobina","sa bobinezi":"bobina","sa boboteasca":"boboti","sa bobotesc":"boboti","sa bobotesti":"boboti","sa bobotim":"boboti","sa bobotiti":"boboti","sa bocaneasca":"bocăni","sa bocanesc":"bocăni","sa bocanesti":"bocăni","sa bocanim":"bocăni","sa bocaniti":"bocăni","sa boceasca":"boci","sa bocesc":"boci","sa bocesti":"boci","sa bocim":"boci","sa bociti":"boci","sa bodoganeasca":"bodogăni","sa bodoganesc":"bodogăni","sa bodoganesti":"bodogăni","sa bodoganim":"bodogăni","sa bodoganiti":"bodogăni","sa bodroganeasca":"bodrogăni","sa bodroganesc":"bodrogăni","sa bodroganesti":"bodrogăni","sa bodroganim":"bodrogăni","sa bodroganiti":"bodrogăni","sa bogdaprost":"bogdaprosti","sa bogdaprosta":"bogdaprosti","sa bogdaprosti":"bogdaprosti","sa bogdaprostim":"bogdaprosti","sa bogdaprostiti":"bogdaprosti","sa boiasca":"boi","sa boicotam":"boicota","sa boicotati":"boicota","sa boicotez":"boicota","sa boicoteze":"boicota","sa boicotezi":"boicota","sa boiereasca":"boieri","sa boieresc":"boieri","sa boieresti":"boieri","sa boierim":"boieri","sa boieriti":"boieri","sa boiesc":"boi","sa boiesti":"boi","sa boim":"boi","sa boiti":"boi","sa bojogar":"bojogări","sa bojogara":"bojogări","sa bojogari":"bojogări","sa bojogarim":"bojogări","sa bojogariti":"bojogări","sa bolboroseasca":"bolborosi","sa bolborosesc":"bolborosi","sa bolborosesti":"bolborosi","sa bolborosim":"bolborosi","sa bolborositi":"bolborosi","sa boldeasca":"boldi","sa boldesc":"boldi","sa boldesti":"boldi","sa boldim":"boldi","sa bolditi":"boldi","sa boleasca":"boli","sa bolesc":"boli","sa bolesti":"boli","sa bolim":"boli","sa boliti":"boli","sa bolmojeasca":"bolmoji","sa bolmojesc":"bolmoji","sa bolmojesti":"bolmoji","sa bolmojim":"bolmoji","sa bolmojiti":"bolmoji","sa bolnaveasca":"bolnăvi","sa bolnavesc":"bolnăvi","sa bolnavesti":"bolnăvi","sa bolnavim":"bolnăvi","sa bolnaviti":"bolnăvi","sa bolsevizam":"bolșeviza","sa bolsevizati":"bolșeviza","sa bolsevizez":"bolșeviza","sa bolsevizeze":"bolșeviza","sa bolsevizezi":"bolșeviza","sa bolteasca":"bolti","sa boltesc":"bolti","sa boltesti":"bolti","sa boltim":"bolti","sa boltiti":"bolti","sa bombam":"bomba","sa bombaneasca":"bombăni","sa bombanesc":"bombăni","sa bombanesti":"bombăni","sa bombanim":"bombăni","sa bombaniti":"bombăni","sa bombardam":"bombarda","sa bombardati":"bombarda","sa bombardez":"bombarda","sa bombardeze":"bombarda","sa bombardezi":"bombarda","sa bombati":"bomba","sa bombez":"bomba","sa bombeze":"bomba","sa bombezi":"bomba","sa bonaiasca":"bonăi","sa bonaiesc":"bonăi","sa bonaiesti":"bonăi","sa bonaim":"bonăi","sa bonaiti":"bonăi","sa bonific":"bonifica","sa bonificam":"bonifica","sa bonificati":"bonifica","sa bonifice":"bonifica","sa bonifici":"bonifica","sa bor":"bori","sa bora":"bori","sa boram":"borî","sa borasc":"borî","sa borasca":"borî","sa borasti":"borî","sa borati":"borî","sa bori":"bori","sa borim":"bori","sa boriti":"bori","sa bornam":"borna","sa bornati":"borna","sa bornez":"borna","sa borneze":"borna","sa bornezi":"borna","sa bors":"borși","sa borsa":"borși","sa borsi":"borși","sa borsim":"borși","sa borsiti":"borși","sa bosorogeasca":"boșorogi","sa bosorogesc":"boșorogi","sa bosorogesti":"boșorogi","sa bosorogim":"boșorogi","sa bosorogiti":"boșorogi","sa bosumflam":"bosumfla","sa bosumflati":"bosumfla","sa bosumfle":"bosumfla","sa bosumfli":"bosumfla","sa bosumflu":"bosumfla","sa botanizam":"botaniza","sa botanizati":"botaniza","sa botanizez":"botaniza","sa botanizeze":"botaniza","sa botanizezi":"botaniza","sa boteasca":"boți","sa botesc":"boți","sa botesti":"boți","sa botez":"boteza","sa botezam":"boteza","sa botezati":"boteza","sa boteze":"boteza","sa botezi":"boteza","sa botim":"boți","sa botiti":"boți","sa boxam":"boxa","sa boxati":"boxa","sa boxez":"boxa","sa boxeze":"boxa","sa boxezi":"boxa","sa braconam":"bracona","sa braconati":"bracona","sa braconez":"bracona","sa braconeze":"bracona","sa braconezi":"bracona","sa brambureasca":"bramburi","sa bramburesc":"bramburi","sa bramburesti":"bramburi","sa bramburim":"bramburi","sa bramburiti":"bramburi","sa bran":"brăni","sa brana":"brăni","sa brani":"brăni","sa branim":"brăni","sa braniti":"brăni","sa bransam":"branșa","sa bransati":"branșa","sa bransez":"branșa","sa branseze":"branșa","sa bransezi":"branșa","sa branz":"brânzi","sa branza":"brânzi","sa branzi":"brânzi","sa branzim":"brânzi","sa branziti":"brânzi","sa bravam":"brava","sa bravati":"brava","sa bravez":"brava","sa braveze":"brava","sa bravezi":"brava","sa brazdam":"brăzda","sa brazdati":"brăzda","sa brazdez":"brăzda","sa brazdeze":"brăzda","sa brazdezi":"brăzda","sa brazduiasca":"brăzdui","sa brazduiesc":"brăzdui","sa brazduiesti":"brăzdui","sa brazduim":"brăzdui","sa brazduiti":"brăzdui","sa brevetam":"breveta","sa brevetati":"breveta","sa brevetez":"breveta","sa breveteze":"breveta","sa brevetezi":"breveta","sa briati":"bria","sa bricolam":"bricola","sa bricolati":"bricola","sa bricolez":"bricola","sa bricoleze":"bricola","sa bricolezi":"bricola","sa briem":"bria","sa briez":"bria","sa brieze":"bria","sa briezi":"bria","sa brobonam":"brobona","sa brobonati":"brobona","sa broboneasca":"broboni","sa brobonesc":"broboni","sa brobonesti":"broboni","sa brobonez":"brobona","sa broboneze":"brobona","sa brobonezi":"brobona","sa brobonim":"broboni","sa broboniti":"broboni","sa brodam":"broda","sa brodati":"broda","sa brodez":"broda","sa brodeze":"broda","sa brodezi":"broda","sa bronzam":"bronza","sa bronzati":"bronza","sa bronzez":"bronza","sa bronzeze":"bronza","sa bronzezi":"bronza","sa brosam":"broșa","sa brosati":"broșa","sa brosez":"broșa","sa broseze":"broșa","sa brosezi":"broșa","sa bruftuluiasca":"bruftului","sa bruftuluiesc":"bruftului","sa bruftuluiesti":"bruftului","sa bruftuluim":"bruftului","sa bruftuluiti":"bruftului","sa bruiati":"bruia","sa bruiem":"bruia","sa bruiez":"bruia","sa bruieze":"bruia","sa bruiezi":"bruia","sa brumeze":"bruma","sa brunam":"bruna","sa brunati":"bruna","sa brunez":"bruna","sa bruneze":"bruna","sa brunezi":"bruna","sa bruscam":"brusca","sa bruscati":"brusca","sa bruschez":"brusca","sa bruscheze":"brusca","sa bruschezi":"brusca","sa brutalizam":"brutaliza","sa brutalizati":"brutaliza","sa brutalizez":"brutaliza","sa brutalizeze":"brutaliza","sa brutalizezi":"brutaliza","sa bubui":"bubui","sa bubuie":"bubui","sa bubuim":"bubui","sa bubuiti":"bubui","sa bucatareasca":"bucătări","sa bucataresc":"bucătări","sa bucataresti":"bucătări","sa bucatarim":"bucătări","sa bucatariti":"bucătări","sa bucateasca":"bucăți","sa bucateleasca":"bucățeli","sa bucatelesc":"bucățeli","sa bucatelesti":"bucățeli","sa bucatelim":"bucățeli","sa bucateliti":"bucățeli","sa bucatesc":"bucăți","sa bucatesti":"bucăți","sa bucatim":"bucăți","sa bucatiti":"bucăți","sa buchisam":"buchisa","sa buchisati":"buchisa","sa buchiseasca":"buchisi","sa buchisesc":"buchisi","sa buchisesti":"buchisi","sa buchisez":"buchisa","sa buchiseze":"buchisa","sa buchisezi":"buchisa","sa buchisim":"buchisi","sa buchisiti":"buchisi","sa bucium":"buciuma","sa buciumam":"buciuma","sa buciumati":"buciuma","sa buciume":"buciuma","sa buciumi":"buciuma","sa buclam":"bucla","sa buclati":"bucla","sa buclez":"bucla","sa bucleze":"bucla","sa buclezi":"bucla","sa bucur":"bucura","sa bucuram":"bucura","sa bucurati":"bucura","sa bucure":"bucura","sa bucuri":"bucura","sa budam":"buda","sa budati":"buda","sa budez":"buda","sa budeze":"buda","sa budezi":"buda","sa budugar":"budugări","sa budugara":"budugări","sa budugari":"budugări","sa budugarim":"budugări","sa budugariti":"budugări","sa buduleasca":"buduli","sa budulesc":"buduli","sa budulesti":"buduli","sa budulim":"buduli","sa buduliti":"buduli","sa bufneasca":"bufni","sa bufnesc":"bufni","sa bufnesti":"bufni","sa bufnim":"bufni","sa bufniti":"bufni","sa bufonam":"bufona","sa bufonati":"bufona","sa bufonez":"bufona","sa bufoneze":"bufona","sa bufonezi":"bufona","sa buiceasca":"buici","sa buicesc":"buici","sa buicesti":"buici","sa buicim":"buici","sa buiciti":"buici","sa buimaceasca":"buimăci","sa buimacesc":"buimăci","sa buimacesti":"buimăci","sa buimacim":"buimăci","sa buimaciti":"buimăci","sa bujdeasca":"bujdi","sa bujdesc":"bujdi","sa bujdesti":"bujdi","sa bujdim":"bujdi","sa bujditi":"bujdi","sa bulbuc":["să bulbuc","bulbuca","să bulbuc","bulbuci"],"sa bulbuca":"bulbuci","sa bulbucam":"bulbuca","sa bulbucati":"bulbuca","sa bulbuce":"bulbuca","sa bulbuci":["să bulbuci","bulbuca","să bulbuci","bulbuci"],"sa bulbucim":"bulbuci","sa bulbuciti":"bulbuci","sa buleasca":"buli","sa bulesc":"buli","sa bulesti":"buli","sa bulgareasca":"bulgări","sa bulgaresc":"bulgări","sa bulgaresti":"bulgări","sa bulgarim":"bulgări","sa bulgariti":"bulgări","sa bulgarizam":"bulgariza","sa bulgarizati":"bulgariza","sa bulgarizez":"bulgariza","sa bulgarizeze":"bulgariza","sa bulgarizezi":"bulgariza","sa bulibaseasca":"bulibăși","sa bulibasesc":"bulibăși","sa bulibasesti":"bulibăși","sa bulibasim":"bulibăși","sa bulibasiti":"bulibăși","sa bulim":"buli","sa buliti":"buli","sa bulonam":"bulona","sa bulonati":"bulona","sa bulonez":"bulona","sa buloneze":"bulona","sa bulonezi":"bulona","sa buluceasca":"buluci","sa bulucesc":"buluci","sa bulucesti":"buluci","sa bulucim":"buluci","sa buluciti":"buluci","sa bulversam":"bulversa","sa bulversati":"bulversa","sa bulversez":"bulversa","sa bulverseze":"bulversa","sa bulversezi":"bulversa","sa bumbaceasca":"bumbăci","sa bumbacesc":"bumbăci","sa bumbacesti":"bumbăci","sa bumbacim":"bumbăci","sa bumbaciti":"bumbăci","sa buram":"bura","sa burati":"bura","sa burduseasca":"burduși","sa burdusesc":"burduși","sa burdusesti":"burduși","sa burdusim":"burduși","sa burdusiti":"burduși","sa burez":"bura","sa bureze":"bura","sa burezi":"bura","sa burghezeasca":"burghezi","sa burghezesc":"burghezi","sa burghezesti":"burghezi","sa burghezim":"burghezi","sa burgheziti":"burghezi","sa burlaceasca":"burlăci","sa burlacesc":"burlăci","sa burlacesti":"burlăci","sa burlacim":"burlăci","sa burlaciti":"burlăci","sa burnit":"burnița","sa burnitam":"burnița","sa burnitati":"burnița","sa burnite":"burnița","sa burniti":"burnița","sa bursuc":"bursuca","sa bursucam":"bursuca","sa bursucati":"bursuca","sa bursuce":"bursuca","sa bursuci":"bursuca","sa burzuluiasca":"burzului","sa burzuluiesc":"burzului","sa burzuluiesti":"burzului","sa burzuluim":"burzului","sa burzuluiti":"burzului","sa busculam":"buscula","sa busculati":"buscula","sa busculez":"buscula","sa busculeze":"buscula","sa busculezi":"buscula","sa buseasca":"buși","sa busesc":"buși","sa busesti":"buși","sa busim":"buși","sa busiti":"buși","sa busumflam":"busumfla","sa busumflati":"busumfla","sa busumfle":"busumfla","sa busumfli":"busumfla","sa busumflu":"busumfla","sa butnar":"butnări","sa butnara":"butnări","sa butnari":"butnări","sa butnarim":"butnări","sa butnariti":"butnări","sa butonam":"butona","sa butonati":"butona","sa butonez":"butona","sa butoneze":"butona","sa butonezi":"butona","sa buzduganeasca":"buzdugăni","sa buzduganesc":"buzdugăni","sa buzduganesti":"buzdugăni","sa buzduganim":"buzdugăni","sa buzduganiti":"buzdugăni","sa buzoi":"buzoia","sa buzoiati":"buzoia","sa buzoie":"buzoia","sa buzoiem":"buzoia","sa buzunareasca":"buzunări","sa buzunaresc":"buzunări","sa buzunaresti":"buzunări","sa buzunarim":"buzunări","sa buzunariti":"buzunări","sa echilibram":"echilibra","sa echilibrati":"echilibra","sa echilibrez":"echilibra","sa echilibreze":"echilibra","sa echilibrezi":"echilibra","sa echipam":"echipa","sa echipati":"echipa","sa echipez":"echipa","sa echipeze":"echipa","sa echipezi":"echipa","sa echivalam":"echivala","sa echivalati":"echivala","sa echivalez":"echivala","sa echivaleze":"echivala","sa echivalezi":"echivala","sa eclipsam":"eclipsa","sa eclipsati":"eclipsa","sa eclipsez":"eclipsa","sa eclipseze":"eclipsa","sa eclipsezi":"eclipsa","sa eclozam":"ecloza","sa eclozati":"ecloza","sa eclozez":"ecloza","sa eclozeze":"ecloza","sa eclozezi":"ecloza","sa ecluzam":"ecluza","sa ecluzati":"ecluza","sa ecluzez":"ecluza","sa ecluzeze":"ecluza","sa ecluzezi":"ecluza","sa economiseasca":"economisi","sa economisesc":"economisi","sa economisesti":"economisi","sa economisim":"economisi","sa economisiti":"economisi","sa economizam":"economiza","sa economizati":"economiza","sa economizez":"economiza","sa economizeze":"economiza","sa economizezi":"economiza","sa ecranam":"ecrana","sa ecranati":"ecrana","sa ecranez":"ecrana","sa ecraneze":"ecrana","sa ecranezi":"ecrana","sa ecranizam":"ecraniza","sa ecranizati":"ecraniza","sa ecranizez":"ecraniza","sa ecranizeze":"ecraniza","sa ecranizezi":"ecraniza","sa edentam":"edenta","sa edentati":"edenta","sa edentez":"edenta","sa edenteze":"edenta","sa edentezi":"edenta","sa edific":"edifica","sa edificam":"edifica","sa edificati":"edifica","sa edifice":"edifica","sa edifici":"edifica","sa editam":"edita","sa editati":"edita","sa editez":"edita","sa editeze":"edita","sa editezi":"edita","sa educ":"educa","sa educam":"educa","sa educati":"educa","sa educe":"educa","sa educi":"educa","sa edulcoram":"edulcora","sa edulcorati":"edulcora","sa edulcorez":"edulcora","sa edulcoreze":"edulcora","sa edulcorezi":"edulcora","sa efectuam":"efectua","sa efectuati":"efectua","sa efectuez":"efectua","sa efectueze":"efectua","sa efectuezi":"efectua","sa efemeiati":"efemeia","sa efemeiem":"efemeia","sa efemeiez":"efemeia","sa efemeieze":"efemeia","sa efemeiezi":"efemeia","sa efemerizam":"efemeriza","sa efemerizati":"efemeriza","sa efemerizez":"efemeriza","sa efemerizeze":"efemeriza","sa efemerizezi":"efemeriza","sa efeminam":"efemina","sa efeminati":"efemina","sa efeminez":"efemina","sa efemineze":"efemina","sa efeminezi":"efemina","sa eficientizam":"eficientiza","sa eficientizati":"eficientiza","sa eficientizez":"eficientiza","sa eficientizeze":"eficientiza","sa eficientizezi":"eficientiza","sa efilam":"efila","sa efilati":"efila","sa efilez":"efila","sa efileze":"efila","sa efilezi":"efila","sa egalam":"egala","sa egalati":"egala","sa egalez":"egala","sa egaleze":"egala","sa egalezi":"egala","sa egalizam":"egaliza","sa egalizati":"egaliza","sa egalizez":"egaliza","sa egalizeze":"egaliza","sa egalizezi":"egaliza","sa egrenam":"egrena","sa egrenati":"egrena","sa egrenez":"egrena","sa egreneze":"egrena","sa egrenezi":"egrena","sa ejaculam":"ejacula","sa ejaculati":"ejacula","sa ejaculez":"ejacula","sa ejaculeze":"ejacula","sa ejaculezi":"ejacula","sa ejectam":"ejecta","sa ejectati":"ejecta","sa ejectez":"ejecta","sa ejecteze":"ejecta","sa ejectezi":"ejecta","sa elaboram":"elabora","sa elaborati":"elabora","sa elaborez":"elabora","sa elaboreze":"elabora","sa elaborezi":"elabora","sa elansam":"elansa","sa elansati":"elansa","sa elansez":"elansa","sa elanseze":"elansa","sa elansezi":"elansa","sa electrific":"electrifica","sa electrificam":"electrifica","sa electrificati":"electrifica","sa electrifice":"electrifica","sa electrifici":"electrifica","sa electrizam":"electriza","sa electrizati":"electriza","sa electrizez":"electriza","sa electrizeze":"electriza","sa electrizezi":"electriza","sa electrocauterizam":"electrocauteriza","sa electrocauterizati":"electrocauteriza","sa electrocauterizez":"electrocauteriza","sa electrocauterizeze":"electrocauteriza","sa electrocauterizezi":"electrocauteriza","sa electrocoagulam":"electrocoagula","sa electrocoagulati":"electrocoagula","sa electrocoagulez":"electrocoagula","sa electrocoaguleze":"electrocoagula","sa electrocoagulezi":"electrocoagula","sa electrocutam":"electrocuta","sa electrocutati":"electrocuta","sa electrocutez":"electrocuta","sa electrocuteze":"electrocuta","sa electrocutezi":"electrocuta","sa electrolizam":"electroliza","sa electrolizati":"electroliza","sa electrolizez":"electroliza","sa electrolizeze":"electroliza","sa electrolizezi":"electroliza","sa electronizam":"electroniza","sa electronizati":"electroniza","sa electronizez":"electroniza","sa electronizeze":"electroniza","sa electronizezi":"electroniza","sa elefteros":"elefterosi","sa elefterosa":"elefterosi","sa elefterosi":"elefterosi","sa elefterosim":"elefterosi","sa elefterositi":"elefterosi","sa elementarizam":"elementariza","sa elementarizati":"elementariza","sa elementarizez":"elementariza","sa elementarizeze":"elementariza","sa elementarizezi":"elementariza","sa elenizam":"eleniza","sa elenizati":"eleniza","sa elenizez":"eleniza","sa elenizeze":"eleniza","sa elenizezi":"eleniza","sa eliberam":"elibera","sa eliberati":"elibera","sa eliberez":"elibera","sa elibereze":"elibera","sa eliberezi":"elibera","sa elidam":"elida","sa elidati":"elida","sa elidez":"elida","sa elideze":"elida","sa elidezi":"elida","sa elimin":"elimina","sa eliminam":"elimina","sa eliminati":"elimina","sa elimine":"elimina","sa elimini":"elimina","sa elogiati":"elogia","sa elogiem":"elogia","sa elogiez":"elogia","sa elogieze":"elogia","sa elogiezi":"elogia","sa elucidam":"elucida","sa elucidati":"elucida","sa elucidez":"elucida","sa elucideze":"elucida","sa elucidezi":"elucida","sa elucubram":"elucubra","sa elucubrati":"elucubra","sa elucubrez":"elucubra","sa elucubreze":"elucubra","sa elucubrezi":"elucubra","sa eludam":"eluda","sa eludati":"eluda","sa eludez":"eluda","sa eludeze":"eluda","sa eludezi":"eluda","sa emaciati":"emacia","sa emaciem":"emacia","sa emaciez":"emacia","sa emacieze":"emacia","sa emaciezi":"emacia","sa emailam":"emaila","sa emailati":"emaila","sa emailez":"emaila","sa emaileze":"emaila","sa emailezi":"emaila","sa eman":"emana","sa emanam":"emana","sa emanati":"emana","sa emancipam":"emancipa","sa emancipati":"emancipa","sa emancipez":"emancipa","sa emancipeze":"emancipa","sa emancipezi":"emancipa","sa emane":"emana","sa emani":"emana","sa emasculam":"emascula","sa emasculati":"emascula","sa emasculez":"emascula","sa emasculeze":"emascula","sa emasculezi":"emascula","sa embereclis":"embereclisi","sa embereclisa":"embereclisi","sa embereclisi":"embereclisi","sa embereclisim":"embereclisi","sa embereclisiti":"embereclisi","sa emendam":"emenda","sa emendati":"emenda","sa emendez":"emenda","sa emendeze":"emenda","sa emendezi":"emenda","sa emerg":"emerge","sa emerga":"emerge","sa emergem":"emerge","sa emergeti":"emerge","sa emergi":"emerge","sa emetizam":"emetiza","sa emetizati":"emetiza","sa emetizez":"emetiza","sa emetizeze":"emetiza","sa emetizezi":"emetiza","sa emigram":"emigra","sa emigrati":"emigra","sa emigrez":"emigra","sa emigreze":"emigra","sa emigrezi":"emigra","sa eminescianizam":"eminescianiza","sa eminescianizati":"eminescianiza","sa eminescianizez":"eminescianiza","sa eminescianizeze":"eminescianiza","sa eminescianizezi":"eminescianiza","sa emit":"emite","sa emita":"emite","sa emitem":"emite","sa emiteti":"emite","sa emiti":"emite","sa emotionam":"emoționa","sa emotionati":"emoționa","sa emotionez":"emoționa","sa emotioneze":"emoționa","sa emotionezi":"emoționa","sa emulam":"emula","sa emulati":"emula","sa emulez":"emula","sa emuleze":"emula","sa emulezi":"emula","sa emulsionam":"emulsiona","sa emulsionati":"emulsiona","sa emulsionez":"emulsiona","sa emulsioneze":"emulsiona","sa emulsionezi":"emulsiona","sa enaram":"enara","sa enarati":"enara","sa enarez":"enara","sa enareze":"enara","sa enarezi":"enara","sa energhis":"energhisi","sa energhisa":"energhisi","sa energhisi":"energhisi","sa energhisim":"energhisi","sa energhisiti":"energhisi","sa enervam":"enerva","sa enervati":"enerva","sa enervez":"enerva","sa enerveze":"enerva","sa enervezi":"enerva","sa englezeasca":"englezi","sa englezesc":"englezi","sa englezesti":"englezi","sa englezim":"englezi","sa engleziti":"englezi","sa enigmatizam":"enigmatiza","sa enigmatizati":"enigmatiza","sa enigmatizez":"enigmatiza","sa enigmatizeze":"enigmatiza","sa enigmatizezi":"enigmatiza","sa entuziasmam":"entuziasma","sa entuziasmati":"entuziasma","sa entuziasmez":"entuziasma","sa entuziasmeze":"entuziasma","sa entuziasmezi":"entuziasma","sa enumer":"enumera","sa enumeram":"enumera","sa enumerati":"enumera","sa enumere":"enumera","sa enumeri":"enumera","sa enunt":"enunța","sa enuntam":"enunța","sa enuntati":"enunța","sa enunte":"enunța","sa enunti":"enunța","sa epatam":"epata","sa epatati":"epata","sa epatez":"epata","sa epateze":"epata","sa epatezi":"epata","sa epilam":"epila","sa epilati":"epila","sa epilez":"epila","sa epileze":"epila","sa epilezi":"epila","sa epilogam":"epiloga","sa epilogati":"epiloga","sa epiloghez":"epiloga","sa epilogheze":"epiloga","sa epiloghezi":"epiloga","sa epimelis":"epimelisi","sa epimelisa":"epimelisi","sa epimelisi":"epimelisi","sa epimelisim":"epimelisi","sa epimelisiti":"epimelisi","sa epiteoris":"epiteorisi","sa epiteorisa":"epiteorisi","sa epiteorisi":"epiteorisi","sa epiteorisim":"epiteorisi","sa epiteorisiti":"epiteorisi","sa epuizam":"epuiza","sa epuizati":"epuiza","sa epuizez":"epuiza","sa epuizeze":"epuiza","sa epuizezi":"epuiza","sa epuram":"epura","sa epurati":"epura","sa epurez":"epura","sa epureze":"epura","sa epurezi":"epura","sa eradicam":"eradica","sa eradicati":"eradica","sa eradichez":"eradica","sa eradicheze":"eradica","sa eradichezi":"eradica","sa erbicidam":"erbicida","sa erbicidati":"erbicida","sa erbicidez":"erbicida","sa erbicideze":"erbicida","sa erbicidezi":"erbicida","sa erborizam":"erboriza","sa erborizati":"erboriza","sa erborizez":"erboriza","sa erborizeze":"erboriza","sa erborizezi":"erboriza","sa eredam":"ereda","sa eredati":"ereda","sa eredez":"ereda","sa eredeze":"ereda","sa eredezi":"ereda","sa ermetizam":"ermetiza","sa ermetizati":"ermetiza","sa ermetizez":"ermetiza","sa ermetizeze":"ermetiza","sa ermetizezi":"ermetiza","sa erodam":"eroda","sa erodati":"eroda","sa erodez":"eroda","sa erodeze":"eroda","sa erodezi":"eroda","sa eroific":"eroifica","sa eroificam":"eroifica","sa eroificati":"eroifica","sa eroifice":"eroifica","sa eroifici":"eroifica","sa eroizam":"eroiza","sa eroizati":"eroiza","sa eroizez":"eroiza","sa eroizeze":"eroiza","sa eroizezi":"eroiza","sa erotizam":"erotiza","sa erotizati":"erotiza","sa erotizez":"erotiza","sa erotizeze":"erotiza","sa erotizezi":"erotiza","sa eructam":"eructa","sa eructati":"eructa","sa eructez":"eructa","sa eructeze":"eructa","sa eructezi":"eructa","sa erup":"erupe","sa erupa":"erupe","sa erupem":"erupe","sa erupeti":"erupe","sa erupi":"erupe","sa esalonam":"eșalona","sa esalonati":"eșalona","sa esalonez":"eșalona","sa esaloneze":"eșalona","sa esalonezi":"eșalona","sa esantionam":"eșantiona","sa esantionati":"eșantiona","sa esantionez":"eșantiona","sa esantioneze":"eșantiona","sa esantionezi":"eșantiona","sa escaladam":"escalada","sa escaladati":"escalada","sa escaladez":"escalada","sa escaladeze":"escalada","sa escaladezi":"escalada","sa escamotam":"escamota","sa escamotati":"escamota","sa escamotez":"escamota","sa escamoteze":"escamota","sa escamotezi":"escamota","sa eschivam":"eschiva","sa eschivati":"eschiva","sa eschivez":"eschiva","sa eschiveze":"eschiva","sa eschivezi":"eschiva","sa escortam":"escorta","sa escortati":"escorta","sa escortez":"escorta","sa escorteze":"escorta","sa escortezi":"escorta","sa escrocam":"escroca","sa escrocati":"escroca","sa escrochez":"escroca","sa escrocheze":"escroca","sa escrochezi":"escroca","sa esentializam":"esențializa","sa esentializati":"esențializa","sa esentializez":"esențializa","sa esentializeze":"esențializa","sa esentializezi":"esențializa","sa esplic":"esplica","sa esplicam":"esplica","sa esplicati":"esplica","sa esplice":"esplica","sa esplici":"esplica","sa esterific":"esterifica","sa esterificam":"esterifica","sa esterificati":"esterifica","sa esterifice":"esterifica","sa esterifici":"esterifica","sa estetizam":"estetiza","sa estetizati":"estetiza","sa estetizez":"estetiza","sa estetizeze":"estetiza","sa estetizezi":"estetiza","sa estimam":"estima","sa estimati":"estima","sa estimez":"estima","sa estimeze":"estima","sa estimezi":"estima","sa estompam":"estompa","sa estompati":"estompa","sa estompez":"estompa","sa estompeze":"estompa","sa estompezi":"estompa","sa estorcam":"estorca","sa estorcati":"estorca","sa estorchez":"estorca","sa estorcheze":"estorca","sa estorchezi":"estorca","sa estropiati":"estropia","sa estropiem":"estropia","sa estropiez":"estropia","sa estropieze":"estropia","sa estropiezi":"estropia","sa esuam":"eșua","sa esuati":"eșua","sa esuez":"eșua","sa esueze":"eșua","sa esuezi":"eșua","sa etajam":"etaja","sa etajati":"etaja","sa etajez":"etaja","sa etajeze":"etaja","sa etajezi":"etaja","sa etalam":"etala","sa etalati":"etala","sa etalez":"etala","sa etaleze":"etala","sa etalezi":"etala","sa etalonam":"etalona","sa etalonati":"etalona","sa etalonez":"etalona","sa etaloneze":"etalona","sa etalonezi":"etalona","sa etansam":"etanșa","sa etansati":"etanșa","sa etanseizam":"etanșeiza","sa etanseizati":"etanșeiza","sa etanseizez":"etanșeiza","sa etanseizeze":"etanșeiza","sa etanseizezi":"etanșeiza","sa etansez":"etanșa","sa etanseze":"etanșa","sa etansezi":"etanșa","sa etapizam":"etapiza","sa etapizati":"etapiza","sa etapizez":"etapiza","sa etapizeze":"etapiza","sa etapizezi":"etapiza","sa etatizam":"etatiza","sa etatizati":"etatiza","sa etatizez":"etatiza","sa etatizeze":"etatiza","sa etatizezi":"etatiza","sa eterific":"eterifica","sa eterificam":"eterifica","sa eterificati":"eterifica","sa eterifice":"eterifica","sa eterifici":"eterifica","sa eterizam":"eteriza","sa eterizati":"eteriza","sa eterizez":"eteriza","sa eterizeze":"eteriza","sa eterizezi":"eteriza","sa eternizam":"eterniza","sa eternizati":"eterniza","sa eternizez":"eterniza","sa eternizeze":"eterniza","sa eternizezi":"eterniza","sa etichetam":"eticheta","sa etichetati":"eticheta","sa etichetez":"eticheta","sa eticheteze":"eticheta","sa etichetezi":"eticheta","sa eticizam":"eticiza","sa eticizati":"eticiza","sa eticizez":"eticiza","sa eticizeze":"eticiza","sa eticizezi":"eticiza","sa etilam":"etila","sa etilati":"etila","sa etilez":"etila","sa etileze":"etila","sa etilezi":"etila","sa etimologizam":"etimologiza","sa etimologizati":"etimologiza","sa etimologizez":"etimologiza","sa etimologizeze":"etimologiza","sa etimologizezi":"etimologiza","sa etiolam":"etiola","sa etiolati":"etiola","sa etiolez":"etiola","sa etioleze":"etiola","sa etiolezi":"etiola","sa etiram":"etira","sa etirati":"etira","sa etirez":"etira","sa etireze":"etira","sa etirezi":"etira","sa etnicizam":"etniciza","sa etnicizati":"etniciza","sa etnicizez":"etniciza","sa etnicizeze":"etniciza","sa etnicizezi":"etniciza","sa europenizam":"europeniza","sa europenizati":"europeniza","sa europenizez":"europeniza","sa europenizeze":"europeniza","sa europenizezi":"europeniza","sa eutanasiati":"eutanasia","sa eutanasiem":"eutanasia","sa eutanasiez":"eutanasia","sa eutanasieze":"eutanasia","sa eutanasiezi":"eutanasia","sa evacuam":"evacua","sa evacuati":"evacua","sa evacuez":"evacua","sa evacueze":"evacua","sa evacuezi":"evacua","sa evadam":"evada","sa evadati":"evada","sa evadez":"evada","sa evadeze":"evada","sa evadezi":"evada","sa evaluam":"evalua","sa evaluati":"evalua","sa evaluez":"evalua","sa evalueze":"evalua","sa evaluezi":"evalua","sa evanghelizam":"evangheliza","sa evanghelizati":"evangheliza","sa evanghelizez":"evangheliza","sa evanghelizeze":"evangheliza","sa evanghelizezi":"evangheliza","sa evapor":"evapora","sa evaporam":"evapora","sa evaporati":"evapora","sa evapore":"evapora","sa evapori":"evapora","sa evazam":"evaza","sa evazati":"evaza","sa evazez":"evaza","sa evazeze":"evaza","sa evazezi":"evaza","sa eveneasca":"eveni","sa evenesc":"eveni","sa evenesti":"eveni","sa evenim":"eveni","sa eveniti":"eveni","sa evgheniseasca":"evghenisi","sa evghenisesc":"evghenisi","sa evghenisesti":"evghenisi","sa evghenisim":"evghenisi","sa evghenisiti":"evghenisi","sa evidentiati":"evidenția","sa evidentiem":"evidenția","sa evidentiez":"evidenția","sa evidentieze":"evidenția","sa evidentiezi":"evidenția","sa eving":"evinge","sa evinga":"evinge","sa evingem":"evinge","sa evingeti":"evinge","sa evingi":"evinge","sa evisceram":"eviscera","sa eviscerati":"eviscera","sa eviscerez":"eviscera","sa eviscereze":"eviscera","sa eviscerezi":"eviscera","sa evit":"evita","sa evitam":"evita","sa evitati":"evita","sa evite":"evita","sa eviti":"evita","sa evoc":"evoca","sa evocam":"evoca","sa evocati":"evoca","sa evoce":"evoca","sa evoci":"evoca","sa evoluam":"evolua","sa evoluati":"evolua","sa evoluez":"evolua","sa evolueze":"evolua","sa evoluezi":"evolua","sa exacerbam":"exacerba","sa exacerbati":"exacerba","sa exacerbez":"exacerba","sa exacerbeze":"exacerba","sa exacerbezi":"exacerba","sa exageram":"exagera","sa exagerati":"exagera","sa exagerez":"exagera","sa exagereze":"exagera","sa exagerezi":"exagera","sa exal":"exala","sa exalam":"exala","sa exalati":"exala","sa exale":"exala","sa exali":"exala","sa exalt":"exalta","sa exaltam":"exalta","sa exaltati":"exalta","sa exalte":"exalta","sa exalti":"exalta","sa examinam":"examina","sa examinati":"examina","sa examinez":"examina","sa examineze":"examina","sa examinezi":"examina","sa exasperam":"exaspera","sa exasperati":"exaspera","sa exasperez":"exaspera","sa exaspereze":"exaspera","sa exasperezi":"exaspera","sa excavam":"excava","sa excavati":"excava","sa excavez":"excava","sa excaveze":"excava","sa excavezi":"excava","sa excedam":"exceda","sa excedati":"exceda","sa excedez":"exceda","sa excedeze":"exceda","sa excedezi":"exceda","sa excelam":"excela","sa excelati":"excela","sa excelez":"excela","sa exceleze":"excela","sa excelezi":"excela","sa exceptam":"excepta","sa exceptati":"excepta","sa exceptez":"excepta","sa excepteze":"excepta","sa exceptezi":"excepta","sa excerptam":"excerpta","sa excerptati":"excerpta","sa excerptez":"excerpta","sa excerpteze":"excerpta","sa excerptezi":"excerpta","sa excit":"excita","sa excitam":"excita","sa excitati":"excita","sa excite":"excita","sa exciti":"excita","sa excizam":"exciza","sa excizati":"exciza","sa excizez":"exciza","sa excizeze":"exciza","sa excizezi":"exciza","sa exclam":"exclama","sa exclamam":"exclama","sa exclamati":"exclama","sa exclame":"exclama","sa exclami":"exclama","sa exclud":"exclude","sa excluda":"exclude","sa excludem":"exclude","sa excludeti":"exclude","sa excluzi":"exclude","sa excogitam":"excogita","sa excogitati":"excogita","sa excogitez":"excogita","sa excogiteze":"excogita","sa excogitezi":"excogita","sa excomunic":"excomunica","sa excomunicam":"excomunica","sa excomunicati":"excomunica","sa excomunice":"excomunica","sa excomunici":"excomunica","sa excoriati":"excoria","sa excorie":"excoria","sa excoriem":"excoria","sa excorii":"excoria","sa excretam":"excreta","sa excretati":"excreta","sa excretez":"excreta","sa excreteze":"excreta","sa excretezi":"excreta","sa execram":"execra","sa execrati":"execra","sa execrez":"execra","sa execreze":"execra","sa execrezi":"execra","sa execut":"executa","sa executam":"executa","sa executaris":"executarisi","sa executarisa":"executarisi","sa executarisi":"executarisi","sa executarisim":"executarisi","sa executarisiti":"executarisi","sa executati":"executa","sa execute":"executa","sa executi":"executa","sa exemplific":"exemplifica","sa exemplificam":"exemplifica","sa exemplificati":"exemplifica","sa exemplifice":"exemplifica","sa exemplifici":"exemplifica","sa exercit":"exercita","sa exercitam":"exercita","sa exercitati":"exercita","sa exercite":"exercita","sa exerciti":"exercita","sa exeredit":"exeredita","sa exereditam":"exeredita","sa exereditati":"exeredita","sa exeredite":"exeredita","sa exerediti":"exeredita","sa exersam":"exersa","sa exersati":"exersa","sa exersez":"exersa","sa exerseze":"exersa","sa exersezi":"exersa","sa exfoliati":"exfolia","sa exfoliem":"exfolia","sa exfoliez":"exfolia","sa exfolieze":"exfolia","sa exfoliezi":"exfolia","sa exhibam":"exhiba","sa exhibati":"exhiba","sa exhibez":"exhiba","sa exhibeze":"exhiba","sa exhibezi":"exhiba","sa exhumam":"exhuma","sa exhumati":"exhuma","sa exhumez":"exhuma","sa exhumeze":"exhuma","sa exhumezi":"exhuma","sa exig":"exige","sa exiga":"exige","sa exigem":"exige","sa exigeti":"exige","sa exigi":"exige","sa exilam":"exila","sa exilati":"exila","sa exilez":"exila","sa exileze":"exila","sa exilezi":"exila","sa exist":"exista","sa existam":"exista","sa existati":"exista","sa existe":"exista","sa existi":"exista","sa exmatriculam":"exmatricula","sa exmatriculati":"exmatricula","sa exmatriculez":"exmatricula","sa exmatriculeze":"exmatricula","sa exmatriculezi":"exmatricula","sa exofliseasca":"exoflisi","sa exoflisesc":"exoflisi","sa exoflisesti":"exoflisi","sa exoflisim":"exoflisi","sa exoflisiti":"exoflisi","sa exoneram":"exonera","sa exonerati":"exonera","sa exonerez":"exonera","sa exonereze":"exonera","sa exonerezi":"exonera","sa exorcizam":"exorciza","sa exorcizati":"exorciza","sa exorcizez":"exorciza","sa exorcizeze":"exorciza","sa exorcizezi":"exorciza","sa exortam":"exorta","sa exortati":"exorta","sa exortez":"exorta","sa exorteze":"exorta","sa exortezi":"exorta","sa exotizam":"exotiza","sa exotizati":"exotiza","sa exotizez":"exotiza","sa exotizeze":"exotiza","sa exotizezi":"exotiza","sa expandam":"expanda","sa expandati":"expanda","sa expandez":"expanda","sa expandeze":"expanda","sa expandezi":"expanda","sa expatriati":"expatria","sa expatriem":"expatria","sa expatriez":"expatria","sa expatrieze":"expatria","sa expatriezi":"expatria","sa expectoram":"expectora","sa expectorati":"expectora","sa expectorez":"expectora","sa expectoreze":"expectora","sa expectorezi":"expectora","sa expediati":"expedia","sa expediem":"expedia","sa expediez":"expedia","sa expedieze":"expedia","sa expediezi":"expedia","sa expeduiasca":"expedui","sa expeduiesc":"expedui","sa expeduiesti":"expedui","sa expeduim":"expedui","sa expeduiti":"expedui","sa experimentam":"experimenta","sa experimentati":"experimenta","sa experimentez":"experimenta","sa experimenteze":"experimenta","sa experimentezi":"experimenta","sa expertizam":"expertiza","sa expertizati":"expertiza","sa expertizez":"expertiza","sa expertizeze":"expertiza","sa expertizezi":"expertiza","sa expiati":"expia","sa expiem":"expia","sa expiez":"expia","sa expieze":"expia","sa expiezi":"expia","sa expir":"expira","sa expiram":"expira","sa expirati":"expira","sa expire":"expira","sa expiri":"expira","sa explic":"explica","sa explicam":"explica","sa explicati":"explica","sa explice":"explica","sa explici":"explica","sa explicitam":"explicita","sa explicitati":"explicita","sa explicitez":"explicita","sa expliciteze":"explicita","sa explicitezi":"explicita","sa exploatam":"exploata","sa exploatati":"exploata","sa exploatez":"exploata","sa exploateze":"exploata","sa exploatezi":"exploata","sa explodam":"exploda","sa explodati":"exploda","sa explodez":"exploda","sa explodeze":"exploda","sa explodezi":"exploda","sa exploram":"explora","sa explorati":"explora","sa explorez":"explora","sa exploreze":"explora","sa explorezi":"explora","sa export":"exporta","sa exportam":"exporta","sa exportati":"exporta","sa exporte":"exporta","sa exporti":"exporta","sa exportui":"exportui","sa exportuie":"exportui","sa exportuim":"exportui","sa exportuiti":"exportui","sa exprim":"exprima","sa exprimam":"exprima","sa exprimati":"exprima","sa exprime":"exprima","sa exprimi":"exprima","sa expropriati":"expropria","sa expropriem":"expropria","sa expropriez":"expropria","sa exproprieze":"expropria","sa expropriezi":"expropria","sa expui":"expune","sa expulsam":"expulsa","sa expulsati":"expulsa","sa expulsez":"expulsa","sa expulseze":"expulsa","sa expulsezi":"expulsa","sa expulzam":"expulza","sa expulzati":"expulza","sa expulzez":"expulza","sa expulzeze":"expulza","sa expulzezi":"expulza","sa expun":"expune","sa expuna":"expune","sa expunem":"expune","sa expuneti":"expune","sa expurg":"expurga","sa expurgam":"expurga","sa expurgati":"expurga","sa expurge":"expurga","sa expurgi":"expurga","sa extaziati":"extazia","sa extaziem":"extazia","sa extaziez":"extazia","sa extazieze":"extazia","sa extaziezi":"extazia","sa extenuam":"extenua","sa extenuati":"extenua","sa extenuez":"extenua","sa extenueze":"extenua","sa extenuezi":"extenua","sa exteriorizam":"exterioriza","sa exteriorizati":"exterioriza","sa exteriorizez":"exterioriza","sa exteriorizeze":"exterioriza","sa exteriorizezi":"exterioriza","sa extermin":"extermina","sa exterminam":"extermina","sa exterminati":"extermina","sa extermine":"extermina","sa extermini":"extermina","sa externalizam":"externaliza","sa externalizati":"externaliza","sa externalizez":"externaliza","sa externalizeze":"externaliza","sa externalizezi":"externaliza","sa externam":"externa","sa externati":"externa","sa externez":"externa","sa externeze":"externa","sa externezi":"externa","sa extind":"extinde","sa extinda":"extinde","sa extindem":"extinde","sa extindeti":"extinde","sa extinzi":"extinde","sa extirp":"extirpa","sa extirpam":"extirpa","sa extirpati":"extirpa","sa extirpe":"extirpa","sa extirpi":"extirpa","sa extorcam":"extorca","sa extorcati":"extorca","sa extorchez":"extorca","sa extorcheze":"extorca","sa extorchezi":"extorca","sa extradam":"extrăda","sa extradati":"extrăda","sa extradez":"extrăda","sa extradeze":"extrăda","sa extradezi":"extrăda","sa extrag":"extrage","sa extraga":"extrage","sa extragem":"extrage","sa extrageti":"extrage","sa extragi":"extrage","sa extrapolam":"extrapola","sa extrapolati":"extrapola","sa extrapolez":"extrapola","sa extrapoleze":"extrapola","sa extrapolezi":"extrapola","sa exult":"exulta","sa exultam":"exulta","sa exultati":"exulta","sa exulte":"exulta","sa exulti":"exulta","sa ezit":"ezita","sa ezitam":"ezita","sa ezitati":"ezita","sa ezite":"ezita","sa eziti":"ezita","sa fabric":"fabrica","sa fabricam":"fabrica","sa fabricati":"fabrica","sa fabrice":"fabrica","sa fabrici":"fabrica","sa fabulam":"fabula","sa fabulati":"fabula","sa fabulez":"fabula","sa fabuleze":"fabula","sa fabulezi":"fabula","sa fac":"face","sa fac laba":"face labă","sa fac sex":"face sex","sa faca":"face","sa faca laba":"face labă","sa faca sex":"face sex","sa facem":"face","sa facem laba":"face labă","sa facem sex":"face sex","sa faceti":"face","sa faceti laba":"face labă","sa faceti sex":"face sex","sa faci":"face","sa faci laba":"face labă","sa faci sex":"face sex","sa facilitam":"facilita","sa facilitati":"facilita","sa facilitez":"facilita","sa faciliteze":"facilita","sa facilitezi":"facilita","sa facsimilam":"facsimila","sa facsimilati":"facsimila","sa facsimilez":"facsimila","sa facsimileze":"facsimila","sa facsimilezi":"facsimila","sa factorizam":"factoriza","sa factorizati":"factoriza","sa factorizez":"factoriza","sa factorizeze":"factoriza","sa factorizezi":"factoriza","sa facturam":"factura","sa facturati":"factura","sa facturez":"factura","sa factureze":"factura","sa facturezi":"factura","sa fagaduiasca":"făgădui","sa fagaduiesc":"făgădui","sa fagaduiesti":"făgădui","sa fagaduim":"făgădui","sa fagaduiti":"făgădui","sa faiantam":"faianța","sa faiantati":"faianța","sa faiantez":"faianța","sa faianteze":"faianța","sa faiantezi":"faianța","sa faleasca":"făli","sa falesc":"făli","sa falesti":"făli","sa falfai":["să fâlfâi","fâlfâi","să fâlfăi","fâlfăi","să fălfâi","fălfâi"],"sa falfaie":["să fâlfâie","fâlfâi","să fâlfăie","fâlfăi","să fălfâie","fălfâi"],"sa falfaim":["să fâlfâim","fâlfâi","să fâlfăim","fâlfăi","să fălfâim","fălfâi"],"sa falfaiti":["să fâlfâiți","fâlfâi","să fâlfăiți","fâlfăi","să fălfâiți","fălfâi"],"sa falim":"făli","sa falimentam":"falimenta","sa falimentati":"falimenta","sa falimentez":"falimenta","sa falimenteze":"falimenta","sa falimentezi":"falimenta","sa faliti":"făli","sa faloseasca":"făloși","sa falosesc":"făloși","sa falosesti":"făloși","sa falosim":"făloși","sa falositi":"făloși","sa falsific":["să falsific","falsifica","să falșific","falșifica"],"sa falsificam":["să falsificăm","falsifica","să falșificăm","falșifica"],"sa falsificati":["să falsificați","falsifica","să falșificați","falșifica"],"sa falsifice":["să falsifice","falsifica","să falșifice","falșifica"],"sa falsifici":["să falsifici","falsifica","să falșifici","falșifica"],"sa faltuiasca":"fălțui","sa faltuiesc":"fălțui","sa faltuiesti":"fălțui","sa faltuim":"fălțui","sa faltuiti":"fălțui","sa familiarizam":"familiariza","sa familiarizati":"familiariza","sa familiarizez":"familiariza","sa familiarizeze":"familiariza","sa familiarizezi":"familiariza","sa fanariotizam":"fanariotiza","sa fanariotizati":"fanariotiza","sa fanariotizez":"fanariotiza","sa fanariotizeze":"fanariotiza","sa fanariotizezi":"fanariotiza","sa fanatizam":"fanatiza","sa fanatizati":"fanatiza","sa fanatizez":"fanatiza","sa fanatizeze":"fanatiza","sa fanatizezi":"fanatiza","sa faptuiasca":"făptui","sa faptuiesc":"făptui","sa faptuiesti":"făptui","sa faptuim":"făptui","sa faptuiti":"făptui","sa faralegeasca":"fărălegi","sa faralegesc":"fărălegi","sa faralegesti":"fărălegi","sa faralegim":"fărălegi","sa faralegiti":"fărălegi","sa faram":["să fărâm","fărâma","să fărâm","fărâmi"],"sa farama":"fărâmi","sa faramam":"fărâma","sa faramati":"fărâma","sa faramatur":"fărâmături","sa faramatura":"fărâmături","sa faramaturi":"fărâmături","sa faramaturim":"fărâmături","sa faramaturiti":"fărâmături","sa farame":"fărâma","sa farami":["să fărâmi","fărâma","să fărâmi","fărâmi"],"sa faramim":"fărâmi","sa faramitam":"fărâmița","sa faramitati":"fărâmița","sa faramitez":"fărâmița","sa faramiteze":"fărâmița","sa faramitezi":"fărâmița","sa faramiti":"fărâmi","sa farbuiasca":"fărbui","sa farbuiesc":"fărbui","sa farbuiesti":"fărbui","sa farbuim":"fărbui","sa farbuiti":"fărbui","sa fardam":"farda","sa fardati":"farda","sa fardez":"farda","sa fardeze":"farda","sa fardezi":"farda","sa farm":"fărma","sa farmac":"fărmăca","sa farmacam":"fărmăca","sa farmacati":"fărmăca","sa farmace":"fărmăca","sa farmaci":"fărmăca","sa farmam":"fărma","sa farmati":"fărma","sa farme":"fărma","sa farmec":"fermeca","sa farmece":"fermeca","sa farmeci":"fermeca","sa farmi":"fărma","sa farseasca":"fârși","sa farsesc":"fârși","sa farsesti":"fârși","sa farsim":"fârși","sa farsiti":"fârși","sa fasai":["să fâsâi","fâsâi","să fâsăi","fâsăi","să fâșâi","fâșâi","să fâșăi","fâșăi"],"sa fasaie":["să fâsâie","fâsâi","să fâsăie","fâsăi","să fâșâie","fâșâi","să fâșăie","fâșăi"],"sa fasaim":["să fâsâim","fâsâi","să fâsăim","fâsăi","să fâșâim","fâșâi","să fâșăim","fâșăi"],"sa fasaiti":["să fâsâiți","fâsâi","să fâsăiți","fâsăi","să fâșâiți","fâșâi","să fâșăiți","fâșăi"],"sa fascinam":"fascina","sa fascinati":"fascina","sa fascinez":"fascina","sa fascineze":"fascina","sa fascinezi":"fascina","sa fascizam":"fasciza","sa fascizati":"fasciza","sa fascizez":"fasciza","sa fascizeze":"fasciza","sa fascizezi":"fasciza","sa fasii":"fâșii","sa fasiie":"fâșii","sa fasiim":"fâșii","sa fasiiti":"fâșii","sa fasonam":"fasona","sa fasonati":"fasona","sa fasonez":"fasona","sa fasoneze":"fasona","sa fasonezi":"fasona","sa fastaceasca":"fâstâci","sa fastacesc":"fâstâci","sa fastacesti":"fâstâci","sa fastacim":"fâstâci","sa fastaciti":"fâstâci","sa fasur":"fășura","sa fasuram":"fășura","sa fasurati":"fășura","sa fasure":"fășura","sa fasuri":"fășura","sa fat":"făta","sa fatai":"fâțâi","sa fataie":"fâțâi","sa fataim":"fâțâi","sa fataiti":"fâțâi","sa fatam":"făta","sa fatareasca":"fățări","sa fataresc":"fățări","sa fataresti":"fățări","sa fatarim":"fățări","sa fatariti":"fățări","sa fatarniceasca":"fățărnici","sa fatarnicesc":"fățărnici","sa fatarnicesti":"fățărnici","sa fatarnicim":"fățărnici","sa fatarniciti":"fățărnici","sa fatati":"făta","sa fatetam":"fațeta","sa fatetati":"fațeta","sa fatetez":"fațeta","sa fateteze":"fațeta","sa fatetezi":"fațeta","sa fatuiasca":"fățui","sa fatuiesc":"fățui","sa fatuiesti":"fățui","sa fatuim":"fățui","sa fatuiti":"fățui","sa faultam":"faulta","sa faultati":"faulta","sa faultez":"faulta","sa faulteze":"faulta","sa faultezi":"faulta","sa faureasca":"făuri","sa fauresc":"făuri","sa fauresti":"făuri","sa faurim":"făuri","sa fauriti":"făuri","sa favorizam":"favoriza","sa favorizati":"favoriza","sa favorizez":"favoriza","sa favorizeze":"favoriza","sa favorizezi":"favoriza","sa fecioreasca":"feciori","sa fecioresc":"feciori","sa fecioresti":"feciori","sa feciorim":"feciori","sa fecioriti":"feciori","sa fecundam":"fecunda","sa fecundati":"fecunda","sa fecundez":"fecunda","sa fecundeze":"fecunda","sa fecundezi":"fecunda","sa federaliz":"federaliza","sa federalizam":"federaliza","sa federalizati":"federaliza","sa federalize":"federaliza","sa federalizi":"federaliza","sa federam":"federa","sa federati":"federa","sa federez":"federa","sa federeze":"federa","sa federezi":"federa","sa felesui":"feleșui","sa felesuie":"feleșui","sa felesuim":"feleșui","sa felesuiti":"feleșui","sa feliati":"felia","sa felicit":"felicita","sa felicitam":"felicita","sa felicitati":"felicita","sa felicite":"felicita","sa feliciti":"felicita","sa feliem":"felia","sa feliez":"felia","sa felieze":"felia","sa feliezi":"felia","sa feliur":"feliuri","sa feliura":"feliuri","sa feliuri":"feliuri","sa feliurim":"feliuri","sa feliuriti":"feliuri","sa felureasca":"feluri","sa feluresc":"feluri","sa feluresti":"feluri","sa felurim":"feluri","sa feluriti":"feluri","sa feminizam":"feminiza","sa feminizati":"feminiza","sa feminizez":"feminiza","sa feminizeze":"feminiza","sa feminizezi":"feminiza","sa fentam":"fenta","sa fentati":"fenta","sa fentez":"fenta","sa fenteze":"fenta","sa fentezi":"fenta","sa ferastruiasca":"ferăstrui","sa ferastruiesc":"ferăstrui","sa ferastruiesti":"ferăstrui","sa ferastruim":"ferăstrui","sa ferastruiti":"ferăstrui","sa ferchezuiasca":"ferchezui","sa ferchezuiesc":"ferchezui","sa ferchezuiesti":"ferchezui","sa ferchezuim":"ferchezui","sa ferchezuiti":"ferchezui","sa fereasca":"feri","sa ferec":"fereca","sa ferecam":"fereca","sa ferecati":"fereca","sa ferece":"fereca","sa fereci":"fereca","sa feresc":"feri","sa feresti":"feri","sa ferestruiasca":"ferestrui","sa ferestruiesc":"ferestrui","sa ferestruiesti":"ferestrui","sa ferestruim":"ferestrui","sa ferestruiti":"ferestrui","sa ferestuiasca":"ferestui","sa ferestuiesc":"ferestui","sa ferestuiesti":"ferestui","sa ferestuim":"ferestui","sa ferestuiti":"ferestui","sa ferfenitam":"ferfenița","sa ferfenitati":"ferfenița","sa ferfenitez":"ferfenița","sa ferfeniteze":"ferfenița","sa ferfenitezi":"ferfenița","sa feric":"ferica","sa fericam":"ferica","sa fericati":"ferica","sa ferice":"ferica","sa fericeasca":"ferici","sa fericesc":"ferici","sa fericesti":"ferici","sa ferici":"ferica","sa fericim":"ferici","sa fericit":"fericita","sa fericitam":"fericita","sa fericitati":"fericita","sa fericite":"fericita","sa fericiti":["să fericiți","ferici","să fericiți","fericita"],"sa ferim":"feri","sa feriti":"feri","sa fermecam":"fermeca","sa fermecati":"fermeca","sa fermentam":"fermenta","sa fermentati":"fermenta","sa fermentez":"fermenta","sa fermenteze":"fermenta","sa fermentezi":"fermenta","sa fertilizam":"fertiliza","sa fertilizati":"fertiliza","sa fertilizez":"fertiliza","sa fertilizeze":"fertiliza","sa fertilizezi":"fertiliza","sa festeasca":"fești","sa festeleasca":"feșteli","sa festelesc":"feșteli","sa festelesti":"feșteli","sa festelim":"feșteli","sa festeliti":"feșteli","sa festesc":"fești","sa festesti":"fești","sa festim":"fești","sa festiti":"fești","sa festonam":"festona","sa festonati":"festona","sa festonez":"festona","sa festoneze":"festona","sa festonezi":"festona","sa fete":"făta","sa feti":"făta","sa fetisizam":"fetișiza","sa fetisizati":"fetișiza","sa fetisizez":"fetișiza","sa fetisizeze":"fetișiza","sa fetisizezi":"fetișiza","sa feudalizam":"feudaliza","sa feudalizati":"feudaliza","sa feudalizez":"feudaliza","sa feudalizeze":"feudaliza","sa feudalizezi":"feudaliza","sa fezandam":"fezanda","sa fezandati":"fezanda","sa fezandez":"fezanda","sa fezandeze":"fezanda","sa fezandezi":"fezanda","sa fiarba":"fierbe","sa fibrilam":"fibrila","sa fibrilati":"fibrila","sa fibrilez":"fibrila","sa fibrileze":"fibrila","sa fibrilezi":"fibrila","sa fie":"fi","sa fierastruiasca":"fierăstrui","sa fierastruiesc":"fierăstrui","sa fierastruiesti":"fierăstrui","sa fierastruim":"fierăstrui","sa fierastruiti":"fierăstrui","sa fierb":"fierbe","sa fierbant":"fierbânta","sa fierbantam":"fierbânta","sa fierbantati":"fierbânta","sa fierbante":"fierbânta","sa fierbanti":"fierbânta","sa fierbem":"fierbe","sa fierbeti":"fierbe","sa fierbi":"fierbe","sa figuram":"figura","sa figurati":"figura","sa figurez":"figura","sa figureze":"figura","sa figurezi":"figura","sa fii":"fi","sa fiint":"ființi","sa fiinta":"ființi","sa fiintam":"ființa","sa fiintati":"ființa","sa fiintez":"ființa","sa fiinteze":"ființa","sa fiintezi":"ființa","sa fiinti":"ființi","sa fiintim":"ființi","sa fiintiti":"ființi","sa filigranam":"filigrana","sa filigranati":"filigrana","sa filigranez":"filigrana","sa filigraneze":"filigrana","sa filigranezi":"filigrana","sa filmam":"filma","sa filmati":"filma","sa filmez":"filma","sa filmeze":"filma","sa filmezi":"filma","sa filosofam":"filosofa","sa filosofati":"filosofa","sa filosofeasca":"filosofi","sa filosofesc":"filosofi","sa filosofesti":"filosofi","sa filosofez":"filosofa","sa filosofeze":"filosofa","sa filosofezi":"filosofa","sa filosofim":"filosofi","sa filosofiti":"filosofi","sa filozofam":"filozofa","sa filozofati":"filozofa","sa filozofez":"filozofa","sa filozofeze":"filozofa","sa filozofezi":"filozofa","sa filtram":"filtra","sa filtrati":"filtra","sa filtrez":"filtra","sa filtreze":"filtra","sa filtrezi":"filtra","sa fim":"fi","sa finalizam":"finaliza","sa finalizati":"finaliza","sa finalizez":"finaliza","sa finalizeze":"finaliza","sa finalizezi":"finaliza","sa finantam":"finanța","sa finantati":"finanța"};
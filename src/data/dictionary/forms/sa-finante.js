@@ -0,0 +1 @@
+export default {"sa finantez":"finanța","sa finanteze":"finanța","sa finantezi":"finanța","sa fineasca":"fini","sa finesc":"fini","sa finesti":"fini","sa finim":"fini","sa finisam":"finisa","sa finisati":"finisa","sa finisez":"finisa","sa finiseze":"finisa","sa finisezi":"finisa","sa finiti":"fini","sa firitiseasca":"firitisi","sa firitisesc":"firitisi","sa firitisesti":"firitisi","sa firitisim":"firitisi","sa firitisiti":"firitisi","sa fiscalizam":"fiscaliza","sa fiscalizati":"fiscaliza","sa fiscalizez":"fiscaliza","sa fiscalizeze":"fiscaliza","sa fiscalizezi":"fiscaliza","sa fisionam":"fisiona","sa fisionati":"fisiona","sa fisionez":"fisiona","sa fisioneze":"fisiona","sa fisionezi":"fisiona","sa fisuram":"fisura","sa fisurati":"fisura","sa fisurez":"fisura","sa fisureze":"fisura","sa fisurezi":"fisura","sa fiti":"fi","sa fiu":"fi","sa fixam":"fixa","sa fixati":"fixa","sa fixez":"fixa","sa fixeze":"fixa","sa fixezi":"fixa","sa flagelam":"flagela","sa flagelati":"flagela","sa flagelez":"flagela","sa flageleze":"flagela","sa flagelezi":"flagela","sa flamanzeasca":"flămânzi","sa flamanzesc":"flămânzi","sa flamanzesti":"flămânzi","sa flamanzim":"flămânzi","sa flamanziti":"flămânzi","sa flambam":"flamba","sa flambati":"flamba","sa flambez":"flamba","sa flambeze":"flamba","sa flambezi":"flamba","sa flancam":"flanca","sa flancati":"flanca","sa flanchez":"flanca","sa flancheze":"flanca","sa flanchezi":"flanca","sa flatam":"flata","sa flatati":"flata","sa flatez":"flata","sa flateze":"flata","sa flatezi":"flata","sa flecareasca":"flecări","sa flecaresc":"flecări","sa flecaresti":"flecări","sa flecarim":"flecări","sa flecariti":"flecări","sa flencaneasca":"flencăni","sa flencanesc":"flencăni","sa flencanesti":"flencăni","sa flencanim":"flencăni","sa flencaniti":"flencăni","sa flescaiasca":"fleșcăi","sa flescaiesc":"fleșcăi","sa flescaiesti":"fleșcăi","sa flescaim":"fleșcăi","sa flescaiti":"fleșcăi","sa flexibilizam":"flexibiliza","sa flexibilizati":"flexibiliza","sa flexibilizez":"flexibiliza","sa flexibilizeze":"flexibiliza","sa flexibilizezi":"flexibiliza","sa flexionam":"flexiona","sa flexionati":"flexiona","sa flexionez":"flexiona","sa flexioneze":"flexiona","sa flexionezi":"flexiona","sa flirtam":"flirta","sa flirtati":"flirta","sa flirtez":"flirta","sa flirteze":"flirta","sa flirtezi":"flirta","sa flotam":"flota","sa flotati":"flota","sa flotez":"flota","sa floteze":"flota","sa flotezi":"flota","sa fluctuam":"fluctua","sa fluctuati":"fluctua","sa fluctuez":"fluctua","sa fluctueze":"fluctua","sa fluctuezi":"fluctua","sa fluidific":"fluidifica","sa fluidificam":"fluidifica","sa fluidificati":"fluidifica","sa fluidifice":"fluidifica","sa fluidifici":"fluidifica","sa fluidizam":"fluidiza","sa fluidizati":"fluidiza","sa fluidizez":"fluidiza","sa fluidizeze":"fluidiza","sa fluidizezi":"fluidiza","sa fluier":"fluiera","sa fluieram":"fluiera","sa fluierati":"fluiera","sa fluiere":"fluiera","sa fluieri":"fluiera","sa fluorizam":"fluoriza","sa fluorizati":"fluoriza","sa fluorizez":"fluoriza","sa fluorizeze":"fluoriza","sa fluorizezi":"fluoriza","sa flustur":"fluștura","sa flusturam":"fluștura","sa flusturati":"fluștura","sa flusture":"fluștura","sa flusturi":"fluștura","sa flutur":"flutura","sa fluturam":"flutura","sa fluturati":"flutura","sa fluture":"flutura","sa fluturi":"flutura","sa foarfec":"forfeca","sa foarfece":"forfeca","sa foarfeci":"forfeca","sa focalizam":"focaliza","sa focalizati":"focaliza","sa focalizez":"focaliza","sa focalizeze":"focaliza","sa focalizezi":"focaliza","sa fofilam":"fofila","sa fofilati":"fofila","sa fofilez":"fofila","sa fofileze":"fofila","sa fofilezi":"fofila","sa foiasca":"foi","sa foiesc":"foi","sa foiesti":"foi","sa foiletam":"foileta","sa foiletati":"foileta","sa foiletez":"foileta","sa foileteze":"foileta","sa foiletezi":"foileta","sa foim":"foi","sa foiti":"foi","sa folfaiasca":"folfăi","sa folfaiesc":"folfăi","sa folfaiesti":"folfăi","sa folfaim":"folfăi","sa folfaiti":"folfăi","sa foloseasca":"folosi","sa folosesc":"folosi","sa folosesti":"folosi","sa folosim":"folosi","sa folositi":"folosi","sa fondam":"fonda","sa fondati":"fonda","sa fondez":"fonda","sa fondeze":"fonda","sa fondezi":"fonda","sa foram":"fora","sa forati":"fora","sa forez":"fora","sa foreze":"fora","sa forezi":"fora","sa forfaiasca":"forfăi","sa forfaiesc":"forfăi","sa forfaiesti":"forfăi","sa forfaim":"forfăi","sa forfaiti":"forfăi","sa forfecam":"forfeca","sa forfecati":"forfeca","sa forfoteasca":"forfoti","sa forfotesc":"forfoti","sa forfotesti":"forfoti","sa forfotim":"forfoti","sa forfotiti":"forfoti","sa forjam":"forja","sa forjati":"forja","sa forjez":"forja","sa forjeze":"forja","sa forjezi":"forja","sa formalizam":"formaliza","sa formalizati":"formaliza","sa formalizez":"formaliza","sa formalizeze":"formaliza","sa formalizezi":"formaliza","sa formam":"forma","sa formatam":"formata","sa formatati":"formata","sa formatez":"formata","sa formateze":"formata","sa formatezi":"formata","sa formati":"forma","sa formez":"forma","sa formeze":"forma","sa formezi":"forma","sa formulam":"formula","sa formulati":"formula","sa formulez":"formula","sa formuleze":"formula","sa formulezi":"formula","sa fornic":"fornica","sa fornicam":"fornica","sa fornicati":"fornica","sa fornice":"fornica","sa fornici":"fornica","sa forostoiasca":"forostoi","sa forostoiesc":"forostoi","sa forostoiesti":"forostoi","sa forostoim":"forostoi","sa forostoiti":"forostoi","sa fortam":"forța","sa fortati":"forța","sa fortez":"forța","sa forteze":"forța","sa fortezi":"forța","sa fortific":"fortifica","sa fortificam":"fortifica","sa fortificati":"fortifica","sa fortifice":"fortifica","sa fortifici":"fortifica","sa foscaiasca":"foșcăi","sa foscaiesc":"foșcăi","sa foscaiesti":"foșcăi","sa foscaim":"foșcăi","sa foscaiti":"foșcăi","sa fosfatam":"fosfata","sa fosfatati":"fosfata","sa fosfatez":"fosfata","sa fosfateze":"fosfata","sa fosfatezi":"fosfata","sa fosilizam":"fosiliza","sa fosilizati":"fosiliza","sa fosilizez":"fosiliza","sa fosilizeze":"fosiliza","sa fosilizezi":"fosiliza","sa fosnaiasca":"foșnăi","sa fosnaiesc":"foșnăi","sa fosnaiesti":"foșnăi","sa fosnaim":"foșnăi","sa fosnaiti":"foșnăi","sa fosneasca":"foșni","sa fosnesc":"foșni","sa fosnesti":"foșni","sa fosnim":"foșni","sa fosniti":"foșni","sa fotocopiati":"fotocopia","sa fotocopiem":"fotocopia","sa fotocopiez":"fotocopia","sa fotocopieze":"fotocopia","sa fotocopiezi":"fotocopia","sa fotografiati":"fotografia","sa fotografiem":"fotografia","sa fotografiez":"fotografia","sa fotografieze":"fotografia","sa fotografiezi":"fotografia","sa fractionam":"fracționa","sa fractionati":"fracționa","sa fractionez":"fracționa","sa fractioneze":"fracționa","sa fractionezi":"fracționa","sa fracturam":"fractura","sa fracturati":"fractura","sa fracturez":"fractura","sa fractureze":"fractura","sa fracturezi":"fractura","sa fragezeasca":"frăgezi","sa fragezesc":"frăgezi","sa fragezesti":"frăgezi","sa fragezim":"frăgezi","sa frageziti":"frăgezi","sa fragmentam":"fragmenta","sa fragmentati":"fragmenta","sa fragmentez":"fragmenta","sa fragmenteze":"fragmenta","sa fragmentezi":"fragmenta","sa fraiereasca":"fraieri","sa fraieresc":"fraieri","sa fraieresti":"fraieri","sa fraierim":"fraieri","sa fraieriti":"fraieri","sa framant":"frământa","sa framantam":"frământa","sa framantati":"frământa","sa framante":"frământa","sa framanti":"frământa","sa franam":"frâna","sa franati":"frâna","sa francam":"franca","sa francati":"franca","sa franchez":"franca","sa francheze":"franca","sa franchezi":"franca","sa francizam":"franciza","sa francizati":"franciza","sa francizez":"franciza","sa francizeze":"franciza","sa francizezi":"franciza","sa franez":"frâna","sa franeze":"frâna","sa franezi":"frâna","sa frang":["să frâng","frânge","să frâng","frângi"],"sa franga":["să frângă","frânge","să frângă","frângi"],"sa frangem":"frânge","sa frangeti":"frânge","sa frangi":["să frângi","frânge","să frângi","frângi"],"sa frangim":"frângi","sa frangiti":"frângi","sa franjuram":"franjura","sa franjurati":"franjura","sa franjurez":"franjura","sa franjureze":"franjura","sa franjurezi":"franjura","sa frantuzeasca":"franțuzi","sa frantuzesc":"franțuzi","sa frantuzesti":"franțuzi","sa frantuzim":"franțuzi","sa frantuziti":"franțuzi","sa frapam":"frapa","sa frapati":"frapa","sa frapez":"frapa","sa frapeze":"frapa","sa frapezi":"frapa","sa fraternizam":"fraterniza","sa fraternizati":"fraterniza","sa fraternizez":"fraterniza","sa fraternizeze":"fraterniza","sa fraternizezi":"fraterniza","sa fraudam":"frauda","sa fraudati":"frauda","sa fraudez":"frauda","sa fraudeze":"frauda","sa fraudezi":"frauda","sa frazam":"fraza","sa frazati":"fraza","sa frazez":"fraza","sa frazeze":"fraza","sa frazezi":"fraza","sa frec":"freca","sa frecam":"freca","sa frecati":"freca","sa frece":"freca","sa freci":"freca","sa frectionam":"frecționa","sa frectionati":"frecționa","sa frectionez":"frecționa","sa frectioneze":"frecționa","sa frectionezi":"frecționa","sa frecventam":"frecventa","sa frecventati":"frecventa","sa frecventez":"frecventa","sa frecventeze":"frecventa","sa frecventezi":"frecventa","sa fredonam":"fredona","sa fredonati":"fredona","sa fredonez":"fredona","sa fredoneze":"fredona","sa fredonezi":"fredona","sa fremat":"fremăta","sa frematam":"fremăta","sa frematati":"fremăta","sa fremete":"fremăta","sa fremeti":"fremăta","sa frezam":"freza","sa frezati":"freza","sa frezez":"freza","sa frezeze":"freza","sa frezezi":"freza","sa frichineasca":"frichini","sa frichinesc":"frichini","sa frichinesti":"frichini","sa frichinim":"frichini","sa frichiniti":"frichini","sa fricosam":"fricoșa","sa fricosati":"fricoșa","sa fricosez":"fricoșa","sa fricoseze":"fricoșa","sa fricosezi":"fricoșa","sa frictionam":"fricționa","sa frictionati":"fricționa","sa frictionez":"fricționa","sa frictioneze":"fricționa","sa frictionezi":"fricționa","sa frig":"frige","sa friga":"frige","sa frigem":"frige","sa frigeti":"frige","sa frigi":"frige","sa frizam":"friza","sa frizati":"friza","sa frizez":"friza","sa frizeze":"friza","sa frizezi":"friza","sa fructific":"fructifica","sa fructificam":"fructifica","sa fructificati":"fructifica","sa fructifice":"fructifica","sa fructifici":"fructifica","sa frumusetam":"frumuseța","sa frumusetati":"frumuseța","sa frumusetez":"frumuseța","sa frumuseteze":"frumuseța","sa frumusetezi":"frumuseța","sa frunzareasca":"frunzări","sa frunzaresc":"frunzări","sa frunzaresti":"frunzări","sa frunzarim":"frunzări","sa frunzariti":"frunzări","sa frunzeasca":"frunzi","sa frunzesc":"frunzi","sa frunzesti":"frunzi","sa frunzim":"frunzi","sa frunziti":"frunzi","sa frustram":"frustra","sa frustrati":"frustra","sa frustrez":"frustra","sa frustreze":"frustra","sa frustrezi":"frustra","sa fuduleasca":"fuduli","sa fudulesc":"fuduli","sa fudulesti":"fuduli","sa fudulim":"fuduli","sa fuduliti":"fuduli","sa fug":["să fug","fuga","să fug","fugi"],"sa fuga":"fugi","sa fugam":"fuga","sa fugareasca":"fugări","sa fugaresc":"fugări","sa fugaresti":"fugări","sa fugarim":"fugări","sa fugariti":"fugări","sa fugati":"fuga","sa fuge":"fuga","sa fugi":["să fugi","fuga","să fugi","fugi"],"sa fugim":"fugi","sa fugiti":"fugi","sa fulger":"fulgera","sa fulgeram":"fulgera","sa fulgerati":"fulgera","sa fulgere":"fulgera","sa fulgeri":"fulgera","sa fulguiasca":"fulgui","sa fulguram":"fulgura","sa fulgurati":"fulgura","sa fulgurez":"fulgura","sa fulgureze":"fulgura","sa fulgurezi":"fulgura","sa fumam":"fuma","sa fumati":"fuma","sa fumeg":"fumega","sa fumegam":"fumega","sa fumegati":"fumega","sa fumege":"fumega","sa fumegi":"fumega","sa fumez":"fuma","sa fumeze":"fuma","sa fumezi":"fuma","sa fumizam":"fumiza","sa fumizati":"fumiza","sa fumizez":"fumiza","sa fumizeze":"fumiza","sa fumizezi":"fumiza","sa functionam":"funcționa","sa functionati":"funcționa","sa functionez":"funcționa","sa functioneze":"funcționa","sa functionezi":"funcționa","sa fundam":"funda","sa fundamentam":"fundamenta","sa fundamentati":"fundamenta","sa fundamentez":"fundamenta","sa fundamenteze":"fundamenta","sa fundamentezi":"fundamenta","sa fundariseasca":"fundarisi","sa fundarisesc":"fundarisi","sa fundarisesti":"fundarisi","sa fundarisim":"fundarisi","sa fundarisiti":"fundarisi","sa fundati":"funda","sa fundez":"funda","sa fundeze":"funda","sa fundezi":"funda","sa fur":"fura","sa furajam":"furaja","sa furajati":"furaja","sa furajez":"furaja","sa furajeze":"furaja","sa furajezi":"furaja","sa furam":"fura","sa furati":"fura","sa fure":"fura","sa furgaseasca":"furgăsi","sa furgasesc":"furgăsi","sa furgasesti":"furgăsi","sa furgasim":"furgăsi","sa furgasiti":"furgăsi","sa furi":"fura","sa furisam":"furișa","sa furisati":"furișa","sa furisez":"furișa","sa furiseze":"furișa","sa furisezi":"furișa","sa furlandiseasca":"furlandisi","sa furlandisesc":"furlandisi","sa furlandisesti":"furlandisi","sa furlandisim":"furlandisi","sa furlandisiti":"furlandisi","sa furlu":"furlua","sa furluam":"furlua","sa furluati":"furlua","sa furlue":"furlua","sa furlui":"furlua","sa furnic":"furnica","sa furnicam":"furnica","sa furnicati":"furnica","sa furnice":"furnica","sa furnici":"furnica","sa furniruiasca":"furnirui","sa furniruiesc":"furnirui","sa furniruiesti":"furnirui","sa furniruim":"furnirui","sa furniruiti":"furnirui","sa furnizam":"furniza","sa furnizati":"furniza","sa furnizez":"furniza","sa furnizeze":"furniza","sa furnizezi":"furniza","sa fut":"fute","sa futa":"fute","sa futem":"fute","sa futeti":"fute","sa futi":"fute","sa fuzionam":"fuziona","sa fuzionati":"fuziona","sa fuzionez":"fuziona","sa fuzioneze":"fuziona","sa fuzionezi":"fuziona","sa gaceasca":"gâci","sa gacesc":"gâci","sa gacesti":"gâci","sa gacim":"gâci","sa gaciti":"gâci","sa gadel":"gâdeli","sa gadela":"gâdeli","sa gadeli":"gâdeli","sa gadelim":"gâdeli","sa gadeliti":"gâdeli","sa gadil":["să gâdil","gâdila","să gâdil","gâdili"],"sa gadila":"gâdili","sa gadilam":"gâdila","sa gadilati":"gâdila","sa gadile":"gâdila","sa gadili":["să gâdili","gâdila","să gâdili","gâdili"],"sa gadilim":"gâdili","sa gadiliti":"gâdili","sa gafam":"gafa","sa gafati":"gafa","sa gafez":"gafa","sa gafeze":"gafa","sa gafezi":"gafa","sa gafuiasca":"gâfui","sa gafuiesc":"gâfui","sa gafuiesti":"gâfui","sa gafuim":"gâfui","sa gafuiti":"gâfui","sa gagai":"gâgâi","sa gagaie":"gâgâi","sa gagaim":"gâgâi","sa gagaiti":"gâgâi","sa gain":"găina","sa gainam":"găina","sa gainat":"găinăța","sa gainatam":"găinăța","sa gainatati":"găinăța","sa gainate":"găinăța","sa gainati":["să găinați","găina","să găinăți","găinăța"],"sa gaine":"găina","sa gaineasca":"găini","sa gainesc":"găini","sa gainesti":"găini","sa gaini":"găina","sa gainim":"găini","sa gainit":"găinița","sa gainitam":"găinița","sa gainitati":"găinița","sa gainite":"găinița","sa gainiti":["să găiniți","găini","să găiniți","găinița"],"sa gaitaneasca":"găităni","sa gaitanesc":"găităni","sa gaitanesti":"găităni","sa gaitanim":"găităni","sa gaitaniti":"găităni","sa galageasca":"gălăgi","sa galagesc":"gălăgi","sa galagesti":"gălăgi","sa galagim":"gălăgi","sa galagiti":"gălăgi","sa galbejeasca":"gălbeji","sa galbejesc":"gălbeji","sa galbejesti":"gălbeji","sa galbejim":"gălbeji","sa galbejiti":"gălbeji","sa galbeneasca":"gălbeni","sa galbenesc":"gălbeni","sa galbenesti":"gălbeni","sa galbenim":"gălbeni","sa galbeniti":"gălbeni","sa galbineasca":"gălbini","sa galbinesc":"gălbini","sa galbinesti":"gălbini","sa galbinim":"gălbini","sa galbiniti":"gălbini","sa galceveasca":"gâlcevi","sa galcevesc":"gâlcevi","sa galcevesti":"gâlcevi","sa galcevim":"gâlcevi","sa galceviti":"gâlcevi","sa galgai":"gâlgâi","sa galgaie":"gâlgâi","sa galgaim":"gâlgâi","sa galgaiti":"gâlgâi","sa galopam":"galopa","sa galopati":"galopa","sa galopez":"galopa","sa galopeze":"galopa","sa galopezi":"galopa","sa galvanizam":"galvaniza","sa galvanizati":"galvaniza","sa galvanizez":"galvaniza","sa galvanizeze":"galvaniza","sa galvanizezi":"galvaniza","sa gamb":"gâmba","sa gambam":"gâmba","sa gambati":"gâmba","sa gambe":"gâmba","sa gambi":"gâmba","sa gamf":"gâmfa","sa gamfam":"gâmfa","sa gamfati":"gâmfa","sa gamfe":"gâmfa","sa gamfi":"gâmfa","sa gandeasca":"gândi","sa gandesc":"gândi","sa gandesti":"gândi","sa gandim":"gândi","sa ganditi":"gândi","sa gangrenam":"gangrena","sa gangrenati":"gangrena","sa gangrenez":"gangrena","sa gangreneze":"gangrena","sa gangrenezi":"gangrena","sa gangureasca":"gânguri","sa ganguresc":"gânguri","sa ganguresti":"gânguri","sa gangurim":"gânguri","sa ganguriti":"gânguri","sa garam":"gara","sa garantam":"garanta","sa garantati":"garanta","sa garantez":"garanta","sa garanteze":"garanta","sa garantezi":"garanta","sa garati":"gara","sa garduiasca":"gărdui","sa garduiesc":"gărdui","sa garduiesti":"gărdui","sa garduim":"gărdui","sa garduiti":"gărdui","sa garez":"gara","sa gareze":"gara","sa garezi":"gara","sa gargariseasca":"gargarisi","sa gargarisesc":"gargarisi","sa gargarisesti":"gargarisi","sa gargarisim":"gargarisi","sa gargarisiti":"gargarisi","sa gargarizam":"gargariza","sa gargarizati":"gargariza","sa gargarizez":"gargariza","sa gargarizeze":"gargariza","sa gargarizezi":"gargariza","sa garniseasca":"garnisi","sa garnisesc":"garnisi","sa garnisesti":"garnisi","sa garnisim":"garnisi","sa garnisiti":"garnisi","sa gaseasca":"găsi","sa gasesc":"găsi","sa gasesti":"găsi","sa gasim":"găsi","sa gasiti":"găsi","sa gat":"găta","sa gatam":"găta","sa gatati":"găta","sa gate":"găta","sa gateasca":"găti","sa gatesc":"găti","sa gatesti":"găti","sa gati":"găta","sa gatim":"găti","sa gatiti":"găti","sa gatui":"gâtui","sa gatuie":"gâtui","sa gatuim":"gâtui","sa gatuiti":"gâtui","sa gaunoseasca":"găunoși","sa gaunosesc":"găunoși","sa gaunosesti":"găunoși","sa gaunosim":"găunoși","sa gaunositi":"găunoși","sa gaureasca":"găuri","sa gauresc":"găuri","sa gauresti":"găuri","sa gaurim":"găuri","sa gauriti":"găuri","sa gavozdeasca":"găvozdi","sa gavozdesc":"găvozdi","sa gavozdesti":"găvozdi","sa gavozdim":"găvozdi","sa gavozditi":"găvozdi","sa gazam":"gaza","sa gazati":"gaza","sa gazduiasca":"găzdui","sa gazduiesc":"găzdui","sa gazduiesti":"găzdui","sa gazduim":"găzdui","sa gazduiti":"găzdui","sa gazeific":"gazeifica","sa gazeificam":"gazeifica","sa gazeificati":"gazeifica","sa gazeifice":"gazeifica","sa gazeifici":"gazeifica","sa gazez":"gaza","sa gazeze":"gaza","sa gazezi":"gaza","sa gazific":"gazifica","sa gazificam":"gazifica","sa gazificati":"gazifica","sa gazifice":"gazifica","sa gazifici":"gazifica","sa gazonam":"gazona","sa gazonati":"gazona","sa gazonez":"gazona","sa gazoneze":"gazona","sa gazonezi":"gazona","sa geama":"geme","sa gelap":"gelăpi","sa gelapa":"gelăpi","sa gelapi":"gelăpi","sa gelapim":"gelăpi","sa gelapiti":"gelăpi","sa gelatinizam":"gelatiniza","sa gelatinizati":"gelatiniza","sa gelatinizez":"gelatiniza","sa gelatinizeze":"gelatiniza","sa gelatinizezi":"gelatiniza","sa gelific":"gelifica","sa gelificam":"gelifica","sa gelificati":"gelifica","sa gelifice":"gelifica","sa gelifici":"gelifica","sa gem":"geme","sa gemem":"geme","sa gemeti":"geme","sa gemi":"geme","sa generalizam":"generaliza","sa generalizati":"generaliza","sa generalizez":"generaliza","sa generalizeze":"generaliza","sa generalizezi":"generaliza","sa generam":"genera","sa generati":"genera","sa generez":"genera","sa genereze":"genera","sa generezi":"genera","sa geometrizam":"geometriza","sa geometrizati":"geometriza","sa geometrizez":"geometriza","sa geometrizeze":"geometriza","sa geometrizezi":"geometriza","sa geram":"gera","sa gerati":"gera","sa gerez":"gera","sa gereze":"gera","sa gerezi":"gera","sa germanizam":"germaniza","sa germanizati":"germaniza","sa germanizez":"germaniza","sa germanizeze":"germaniza","sa germanizezi":"germaniza","sa germinam":"germina","sa germinati":"germina","sa germinez":"germina","sa germineze":"germina","sa germinezi":"germina","sa gerui":"gerui","sa geruie":"gerui","sa geruim":"gerui","sa geruiti":"gerui","sa gesticulam":"gesticula","sa gesticulati":"gesticula","sa gesticulez":"gesticula","sa gesticuleze":"gesticula","sa gesticulezi":"gesticula","sa gestionam":"gestiona","sa gestionati":"gestiona","sa gestionez":"gestiona","sa gestioneze":"gestiona","sa gestionezi":"gestiona","sa gheboseasca":"gheboși","sa ghebosesc":"gheboși","sa ghebosesti":"gheboși","sa ghebosim":"gheboși","sa ghebositi":"gheboși","sa ghemuiasca":"ghemui","sa ghemuiesc":"ghemui","sa ghemuiesti":"ghemui","sa ghemuim":"ghemui","sa ghemuiti":"ghemui","sa gheram":"ghera","sa gherati":"ghera","sa gherez":"ghera","sa ghereze":"ghera","sa gherezi":"ghera","sa gheuram":"gheura","sa gheurati":"gheura","sa gheurez":"gheura","sa gheureze":"gheura","sa gheurezi":"gheura","sa ghiceasca":"ghici","sa ghicesc":"ghici","sa ghicesti":"ghici","sa ghicim":"ghici","sa ghiciti":"ghici","sa ghidam":"ghida","sa ghidati":"ghida","sa ghidez":"ghida","sa ghideze":"ghida","sa ghidezi":"ghida","sa ghiemal":"ghiemăli","sa ghiemala":"ghiemăli","sa ghiemali":"ghiemăli","sa ghiemalim":"ghiemăli","sa ghiemaliti":"ghiemăli","sa ghiftuiasca":"ghiftui","sa ghiftuiesc":"ghiftui","sa ghiftuiesti":"ghiftui","sa ghiftuim":"ghiftui","sa ghiftuiti":"ghiftui","sa ghilosam":"ghiloșa","sa ghilosati":"ghiloșa","sa ghilosez":"ghiloșa","sa ghiloseze":"ghiloșa","sa ghilosezi":"ghiloșa","sa ghilotinam":"ghilotina","sa ghilotinati":"ghilotina","sa ghilotinez":"ghilotina","sa ghilotineze":"ghilotina","sa ghilotinezi":"ghilotina","sa ghionteasca":"ghionti","sa ghiontesc":"ghionti","sa ghiontesti":"ghionti","sa ghiontim":"ghionti","sa ghiontiti":"ghionti","sa ghiontuiasca":"ghiontui","sa ghiontuiesc":"ghiontui","sa ghiontuiesti":"ghiontui","sa ghiontuim":"ghiontui","sa ghiontuiti":"ghiontui","sa ghiorai":"ghiorăi","sa ghioraie":"ghiorăi","sa ghioraim":"ghiorăi","sa ghioraiti":"ghiorăi","sa ghiortai":"ghiorțăi","sa ghiortaie":"ghiorțăi","sa ghiortaim":"ghiorțăi","sa ghiortaiti":"ghiorțăi","sa gigantizam":"gigantiza","sa gigantizati":"gigantiza","sa gigantizez":"gigantiza","sa gigantizeze":"gigantiza","sa gigantizezi":"gigantiza","sa gilaluiasca":"gilălui","sa gilaluiesc":"gilălui","sa gilaluiesti":"gilălui","sa gilaluim":"gilălui","sa gilaluiti":"gilălui","sa gineasca":"gini","sa ginesc":"gini","sa ginesti":"gini","sa ginim":"gini","sa giniti":"gini","sa giram":"gira","sa girati":"gira","sa girez":"gira","sa gireze":"gira","sa girezi":"gira","sa giugiuleasca":"giugiuli","sa giugiulesc":"giugiuli","sa giugiulesti":"giugiuli","sa giugiulim":"giugiuli","sa giugiuliti":"giugiuli","sa giulgiui":"giulgiui","sa giulgiuie":"giulgiui","sa giulgiuim":"giulgiui","sa giulgiuiti":"giulgiui","sa glantuiasca":"glănțui","sa glantuiesc":"glănțui","sa glantuiesti":"glănțui","sa glantuim":"glănțui","sa glantuiti":"glănțui","sa glasam":"glasa","sa glasati":"glasa","sa glasez":"glasa","sa glaseze":"glasa","sa glasezi":"glasa","sa glasuiasca":"glăsui","sa glasuiesc":"glăsui","sa glasuiesti":"glăsui","sa glasuim":"glăsui","sa glasuiti":"glăsui","sa glazuram":"glazura","sa glazurati":"glazura","sa glazurez":"glazura","sa glazureze":"glazura","sa glazurezi":"glazura","sa glisam":"glisa","sa glisati":"glisa","sa glisez":"glisa","sa gliseze":"glisa","sa glisezi":"glisa","sa globalizam":"globaliza","sa globalizati":"globaliza","sa globalizez":"globaliza","sa globalizeze":"globaliza","sa globalizezi":"globaliza","sa glorific":"glorifica","sa glorificam":"glorifica","sa glorificati":"glorifica","sa glorifice":"glorifica","sa glorifici":"glorifica","sa glumeasca":"glumi","sa glumesc":"glumi","sa glumesti":"glumi","sa glumim":"glumi","sa glumiti":"glumi","sa gofram":"gofra","sa gofrati":"gofra","sa gofrez":"gofra","sa gofreze":"gofra","sa gofrezi":"gofra","sa gogoleasca":"gogoli","sa gogolesc":"gogoli","sa gogolesti":"gogoli","sa gogolim":"gogoli","sa gogoliti":"gogoli","sa goleasca":"goli","sa golesc":"goli","sa golesti":"goli","sa golim":"goli","sa goliti":"goli","sa gologaneasca":"gologăni","sa gologanesc":"gologăni","sa gologanesti":"gologăni","sa gologanim":"gologăni","sa gologaniti":"gologăni","sa goneasca":"goni","sa gonesc":"goni","sa gonesti":"goni","sa gonflam":"gonfla","sa gonflati":"gonfla","sa gonflez":"gonfla","sa gonfleze":"gonfla","sa gonflezi":"gonfla","sa gongureasca":"gonguri","sa gonguresc":"gonguri","sa gonguresti":"gonguri","sa gongurim":"gonguri","sa gonguriti":"gonguri","sa gonim":"goni","sa goniti":"goni","sa gospodareasca":"gospodări","sa gospodaresc":"gospodări","sa gospodaresti":"gospodări","sa gospodarim":"gospodări","sa gospodariti":"gospodări","sa gotoveasca":"gotovi","sa gotovesc":"gotovi","sa gotovesti":"gotovi","sa gotovim":"gotovi","sa gotoviti":"gotovi","sa grabeasca":"grăbi","sa grabesc":"grăbi","sa grabesti":"grăbi","sa grabim":"grăbi","sa grabiti":"grăbi","sa gradam":"grada","sa gradati":"grada","sa gradez":"grada","sa gradeze":"grada","sa gradezi":"grada","sa gradinareasca":"grădinări","sa gradinaresc":"grădinări","sa gradinaresti":"grădinări","sa gradinarim":"grădinări","sa gradinariti":"grădinări","sa graduam":"gradua","sa graduati":"gradua","sa graduez":"gradua","sa gradueze":"gradua","sa graduezi":"gradua","sa grafitizam":"grafitiza","sa grafitizati":"grafitiza","sa grafitizez":"grafitiza","sa grafitizeze":"grafitiza","sa grafitizezi":"grafitiza","sa graiasca":"grăi","sa graiesc":"grăi","sa graiesti":"grăi","sa graim":"grăi","sa graiti":"grăi","sa gramaticalizam":"gramaticaliza","sa gramaticalizati":"gramaticaliza","sa gramaticalizez":"gramaticaliza","sa gramaticalizeze":"gramaticaliza","sa gramaticalizezi":"gramaticaliza","sa granulam":"granula","sa granulati":"granula","sa granulez":"granula","sa granuleze":"granula","sa granulezi":"granula","sa grapam":"grăpa","sa grapati":"grăpa","sa grapez":"grăpa","sa grapeze":"grăpa","sa grapezi":"grăpa","sa graseiati":"graseia","sa graseiem":"graseia","sa graseiez":"graseia","sa graseieze":"graseia","sa graseiezi":"graseia","sa gratiati":"grația","sa gratiem":"grația","sa gratiez":"grația","sa gratieze":"grația","sa gratiezi":"grația","sa gratific":"gratifica","sa gratificam":"gratifica","sa gratificati":"gratifica","sa gratifice":"gratifica","sa gratifici":"gratifica","sa gratinam":"gratina","sa gratinati":"gratina","sa gratinez":"gratina","sa gratineze":"gratina","sa gratinezi":"gratina","sa gratulam":"gratula","sa gratulati":"gratula","sa gratulez":"gratula","sa gratuleze":"gratula","sa gratulezi":"gratula","sa gravam":"grava","sa gravati":"grava","sa gravez":"grava","sa graveze":"grava","sa gravezi":"grava","sa gravitam":"gravita","sa gravitati":"gravita","sa gravitez":"gravita","sa graviteze":"gravita","sa gravitezi":"gravita","sa gream":"grea","sa greati":"grea","sa greblam":"grebla","sa greblati":"grebla","sa greblez":"grebla","sa grebleze":"grebla","sa greblezi":"grebla","sa grecizam":"greciza","sa grecizati":"greciza","sa grecizez":"greciza","sa grecizeze":"greciza","sa grecizezi":"greciza","sa greez":"grea","sa greeze":"grea","sa greezi":"grea","sa grefam":"grefa","sa grefati":"grefa","sa grefez":"grefa","sa grefeze":"grefa","sa grefezi":"grefa","sa gresam":"gresa","sa gresati":"gresa","sa greseasca":"greși","sa gresesc":"greși","sa gresesti":"greși","sa gresez":"gresa","sa greseze":"gresa","sa gresezi":"gresa","sa gresim":"greși","sa gresiti":"greși","sa grevam":"greva","sa grevati":"greva","sa grevez":"greva","sa greveze":"greva","sa grevezi":"greva","sa grijeasca":"griji","sa grijesc":"griji","sa grijesti":"griji","sa grijim":"griji","sa grijiti":"griji","sa grimam":"grima","sa grimati":"grima","sa grimez":"grima","sa grimeze":"grima","sa grimezi":"grima","sa grindine":"grindina","sa grizam":"griza","sa grizati":"griza","sa grizez":"griza","sa grizeze":"griza","sa grizezi":"griza","sa grizonam":"grizona","sa grizonati":"grizona","sa grizonez":"grizona","sa grizoneze":"grizona","sa grizonezi":"grizona","sa grohai":"grohăi","sa grohaie":"grohăi","sa grohaim":"grohăi","sa grohaiti":"grohăi","sa grozaveasca":"grozăvi","sa grozavesc":"grozăvi","sa grozavesti":"grozăvi","sa grozavim":"grozăvi","sa grozaviti":"grozăvi","sa grumur":"grumura","sa grumuram":"grumura","sa grumurati":"grumura","sa grumure":"grumura","sa grumuri":"grumura","sa grupam":"grupa","sa grupati":"grupa","sa grupez":"grupa","sa grupeze":"grupa","sa grupezi":"grupa","sa gudronam":"gudrona","sa gudronati":"gudrona","sa gudronez":"gudrona","sa gudroneze":"gudrona","sa gudronezi":"gudrona","sa gudur":"gudura","sa guduram":"gudura","sa gudurati":"gudura","sa gudure":"gudura","sa guduri":"gudura","sa gugiuleasca":"gugiuli","sa gugiulesc":"gugiuli","sa gugiulesti":"gugiuli","sa gugiulim":"gugiuli","sa gugiuliti":"gugiuli","sa guit":"guița","sa guitam":"guița","sa guitati":"guița","sa guite":"guița","sa guiti":"guița","sa gumam":"guma","sa gumati":"guma","sa gumez":"guma","sa gumeze":"guma","sa gumezi":"guma","sa gungun":"gunguni","sa gunguna":"gunguni","sa gunguni":"gunguni","sa gungunim":"gunguni","sa gunguniti":"gunguni","sa gungur":"gunguri","sa gungura":"gunguri","sa gunguri":"gunguri","sa gungurim":"gunguri","sa gunguriti":"gunguri","sa gunoi":"gunoia","sa gunoiati":"gunoia","sa gunoie":"gunoia","sa gunoiem":"gunoia","sa gurai":"gurăi","sa guraie":"gurăi","sa guraim":"gurăi","sa guraiti":"gurăi","sa gust":"gusta","sa gustam":"gusta","sa gustati":"gusta","sa guste":"gusta","sa gusti":"gusta","sa guvernam":"guverna","sa guvernati":"guverna","sa guvernez":"guverna","sa guverneze":"guverna","sa guvernezi":"guverna","sa habuceasca":"hăbuci","sa habucesc":"hăbuci","sa habucesti":"hăbuci","sa habucim":"hăbuci","sa habuciti":"hăbuci","sa hacuiasca":"hăcui","sa hacuiesc":"hăcui","sa hacuiesti":"hăcui","sa hacuim":"hăcui","sa hacuiti":"hăcui","sa haiasca":"hâi","sa haiduceasca":"haiduci","sa haiducesc":"haiduci","sa haiducesti":"haiduci","sa haiducim":"haiduci","sa haiduciti":"haiduci","sa haiesc":"hâi","sa haiesti":"hâi","sa haim":"hâi","sa haineasca":"hăini","sa hainesc":"hăini","sa hainesti":"hăini","sa hainim":"hăini","sa hainiti":"hăini","sa haiti":"hâi","sa haituiasca":"hăitui","sa haituiesc":"hăitui","sa haituiesti":"hăitui","sa haituim":"hăitui","sa haituiti":"hăitui","sa halacai":"hălăcăi","sa halacaie":"hălăcăi","sa halacaim":"hălăcăi","sa halacaiti":"hălăcăi","sa halalaiasca":"hălălăi","sa halalaiesc":"hălălăi","sa halalaiesti":"hălălăi","sa halalaim":"hălălăi","sa halalaiti":"hălălăi","sa haleasca":"hali","sa halesc":"hali","sa halesti":"hali","sa halim":"hali","sa haliti":"hali","sa halogenam":"halogena","sa halogenati":"halogena","sa halogenez":"halogena","sa halogeneze":"halogena","sa halogenezi":"halogena","sa halucinam":"halucina","sa halucinati":"halucina","sa halucinez":"halucina","sa halucineze":"halucina","sa halucinezi":"halucina","sa hamai":["să hâmâi","hâmâi","să hămăi","hămăi"],"sa hamaie":["să hâmâie","hâmâi","să hămăie","hămăi"],"sa hamaim":["să hâmâim","hâmâi","să hămăim","hămăi"],"sa hamaiti":["să hâmâiți","hâmâi","să hămăiți","hămăi"],"sa hameseasca":"hămesi","sa hamesesc":"hămesi","sa hamesesti":"hămesi","sa hamesim":"hămesi","sa hamesiti":"hămesi","sa hamis":"hămisi","sa hamisa":"hămisi","sa hamisi":"hămisi","sa hamisim":"hămisi","sa hamisiti":"hămisi","sa hamletizam":"hamletiza","sa hamletizati":"hamletiza","sa hamletizez":"hamletiza","sa hamletizeze":"hamletiza","sa hamletizezi":"hamletiza","sa hamuiasca":"hămui","sa hamuiesc":"hămui","sa hamuiesti":"hămui","sa hamuim":"hămui","sa hamuiti":"hămui","sa handicapam":"handicapa","sa handicapati":"handicapa","sa handicapez":"handicapa","sa handicapeze":"handicapa","sa handicapezi":"handicapa","sa hapaiasca":"hăpăi","sa hapaiesc":"hăpăi","sa hapaiesti":"hăpăi","sa hapaim":"hăpăi","sa hapaiti":"hăpăi","sa haraceasca":"hărăci","sa haracesc":"hărăci","sa haracesti":"hărăci","sa haracim":"hărăci","sa haraciti":"hărăci","sa haracseasca":"hărăcsi","sa haracsesc":"hărăcsi","sa haracsesti":"hărăcsi","sa haracsim":"hărăcsi","sa haracsiti":"hărăcsi","sa harageasca":"hărăgi","sa haragesc":"hărăgi","sa haragesti":"hărăgi","sa haragim":"hărăgi","sa haragiti":"hărăgi","sa harai":"hârâi","sa haraie":"hârâi","sa haraim":"hârâi","sa haraiti":"hârâi","sa haraneasca":"hărăni","sa haranesc":"hărăni","sa haranesti":"hărăni","sa haranim":"hărăni","sa haraniti":"hărăni","sa harazeasca":"hărăzi","sa harazesc":"hărăzi","sa harazesti":"hărăzi","sa harazim":"hărăzi","sa haraziti":"hărăzi","sa harbuiasca":"hârbui","sa harbuiesc":"hârbui","sa harbuiesti":"hârbui","sa harbuim":"hârbui","sa harbuiti":"hârbui","sa harcai":"hârcăi","sa harcaie":"hârcăi","sa harcaim":"hârcăi","sa harcaiti":"hârcăi","sa harcateasca":"hărcăti","sa harcatesc":"hărcăti","sa harcatesti":"hărcăti","sa harcatim":"hărcăti","sa harcatiti":"hărcăti","sa harjai":"hârjâi","sa harjaie":"hârjâi","sa harjaim":"hârjâi","sa harjaiti":"hârjâi","sa harjoneasca":"hârjoni","sa harjonesc":"hârjoni","sa harjonesti":"hârjoni","sa harjonim":"hârjoni","sa harjoniti":"hârjoni","sa harnasam":"harnașa","sa harnasati":"harnașa","sa harnasez":"harnașa","sa harnaseze":"harnașa","sa harnasezi":"harnașa","sa harniceasca":"hărnici","sa harnicesc":"hărnici","sa harnicesti":"hărnici","sa harnicim":"hărnici","sa harniciti":"hărnici","sa harsai":"hârșâi","sa harsaie":"hârșâi","sa harsaim":"hârșâi","sa harsaiti":"hârșâi","sa harscai":"hârșcâi","sa harscaie":"hârșcâi","sa harscaim":"hârșcâi","sa harscaiti":"hârșcâi","sa harsiasca":"hârșii","sa harsiesc":"hârșii","sa harsiesti":"hârșii","sa harsiim":"hârșii","sa harsiiti":"hârșii","sa harsneasca":"hârșni","sa harsnesc":"hârșni","sa harsnesti":"hârșni","sa harsnim":"hârșni","sa harsniti":"hârșni","sa harsteasca":"hărști","sa harstesc":"hărști","sa harstesti":"hărști","sa harstim":"hărști","sa harstiti":"hărști","sa hartuiasca":["să hartuiască","hartui","să hârțuiască","hârțui","să hărțuiască","hărțui"],"sa hartuiesc":["să hartuiesc","hartui","să hârțuiesc","hârțui","să hărțuiesc","hărțui"],"sa hartuiesti":["să hartuiești","hartui","să hârțuiești","hârțui","să hărțuiești","hărțui"],"sa hartuim":["să hartuim","hartui","să hârțuim","hârțui","să hărțuim","hărțui"],"sa hartuiti":["să hartuiți","hartui","să hârțuiți","hârțui","să hărțuiți","hărțui"],"sa hasuram":"hașura","sa hasurati":"hașura","sa hasurez":"hașura","sa hasureze":"hașura","sa hasurezi":"hașura","sa hatai":"hâțâi","sa hataie":"hâțâi","sa hataim":"hâțâi","sa hataiti":"hâțâi","sa hatan":"hâțâna","sa hatanam":"hâțâna","sa hatanati":"hâțâna","sa hatane":"hâțâna","sa hatani":"hâțâna","sa hatcaiasca":"hâtcâi","sa hatcaiesc":"hâtcâi","sa hatcaiesti":"hâtcâi","sa hatcaim":"hâtcâi","sa hatcaiti":"hâtcâi","sa hatuiasca":"hățui","sa hatuiesc":"hățui","sa hatuiesti":"hățui","sa hatuim":"hățui","sa hatuiti":"hățui","sa haui":"hăui","sa hauie":"hăui","sa hauim":"hăui","sa hauiti":"hăui","sa hauleasca":"hăuli","sa haulesc":"hăuli","sa haulesti":"hăuli","sa haulim":"hăuli","sa hauliti":"hăuli","sa hazardam":"hazarda","sa hazardati":"hazarda","sa hazardez":"hazarda","sa hazardeze":"hazarda","sa hazardezi":"hazarda","sa hazeasca":"hâzi","sa hazesc":"hâzi","sa hazesti":"hâzi","sa hazim":"hâzi","sa haziti":"hâzi","sa hecelam":"hecela","sa hecelati":"hecela","sa hecelez":"hecela","sa heceleze":"hecela","sa hecelezi":"hecela","sa heretiseasca":"heretisi","sa heretisesc":"heretisi","sa heretisesti":"heretisi","sa heretisim":"heretisi","sa heretisiti":"heretisi","sa hibernam":"hiberna","sa hibernati":"hiberna","sa hibernez":"hiberna","sa hiberneze":"hiberna","sa hibernezi":"hiberna","sa hibridam":"hibrida","sa hibridati":"hibrida","sa hibridez":"hibrida","sa hibrideze":"hibrida","sa hibridezi":"hibrida","sa hibridizam":"hibridiza","sa hibridizati":"hibridiza","sa hibridizez":"hibridiza","sa hibridizeze":"hibridiza","sa hibridizezi":"hibridiza","sa hidratam":"hidrata","sa hidratati":"hidrata","sa hidratez":"hidrata","sa hidrateze":"hidrata","sa hidratezi":"hidrata","sa hidrofilizam":"hidrofiliza","sa hidrofilizati":"hidrofiliza","sa hidrofilizez":"hidrofiliza","sa hidrofilizeze":"hidrofiliza","sa hidrofilizezi":"hidrofiliza","sa hidrogenam":"hidrogena","sa hidrogenati":"hidrogena","sa hidrogenez":"hidrogena","sa hidrogeneze":"hidrogena","sa hidrogenezi":"hidrogena","sa hidroizolam":"hidroizola","sa hidroizolati":"hidroizola","sa hidroizolez":"hidroizola","sa hidroizoleze":"hidroizola","sa hidroizolezi":"hidroizola","sa hidrolizam":"hidroliza","sa hidrolizati":"hidroliza","sa hidrolizez":"hidroliza","sa hidrolizeze":"hidroliza","sa hidrolizezi":"hidroliza","sa hidroplanam":"hidroplana","sa hidroplanati":"hidroplana","sa hidroplanez":"hidroplana","sa hidroplaneze":"hidroplana","sa hidroplanezi":"hidroplana","sa hihoteasca":"hihoti","sa hihotesc":"hihoti","sa hihotesti":"hihoti","sa hihotim":"hihoti","sa hihotiti":"hihoti","sa hinghereasca":"hingheri","sa hingheresc":"hingheri","sa hingheresti":"hingheri","sa hingherim":"hingheri","sa hingheriti":"hingheri","sa hiperbolizam":"hiperboliza","sa hiperbolizati":"hiperboliza","sa hiperbolizez":"hiperboliza","sa hiperbolizeze":"hiperboliza","sa hiperbolizezi":"hiperboliza","sa hipersensibilizam":"hipersensibiliza","sa hipersensibilizati":"hipersensibiliza","sa hipersensibilizez":"hipersensibiliza","sa hipersensibilizeze":"hipersensibiliza","sa hipersensibilizezi":"hipersensibiliza","sa hipertrofiati":"hipertrofia","sa hipertrofiem":"hipertrofia","sa hipertrofiez":"hipertrofia","sa hipertrofieze":"hipertrofia","sa hipertrofiezi":"hipertrofia","sa hipnotizam":"hipnotiza","sa hipnotizati":"hipnotiza","sa hipnotizez":"hipnotiza","sa hipnotizeze":"hipnotiza","sa hipnotizezi":"hipnotiza","sa hiritiseasca":"hiritisi","sa hiritisesc":"hiritisi","sa hiritisesti":"hiritisi","sa hiritisim":"hiritisi","sa hiritisiti":"hiritisi","sa hirotoneasca":"hirotoni","sa hirotonesc":"hirotoni","sa hirotonesti":"hirotoni","sa hirotonim":"hirotoni","sa hirotoniseasca":"hirotonisi","sa hirotonisesc":"hirotonisi","sa hirotonisesti":"hirotonisi","sa hirotonisim":"hirotonisi","sa hirotonisiti":"hirotonisi","sa hirotoniti":"hirotoni","sa hirotonoseasca":"hirotonosi","sa hirotonosesc":"hirotonosi","sa hirotonosesti":"hirotonosi","sa hirotonosim":"hirotonosi","sa hirotonositi":"hirotonosi","sa hodineasca":"hodini","sa hodinesc":"hodini","sa hodinesti":"hodini","sa hodinim":"hodini","sa hodiniti":"hodini","sa hodorogeasca":"hodorogi","sa hodorogesc":"hodorogi","sa hodorogesti":"hodorogi","sa hodorogim":"hodorogi","sa hodorogiti":"hodorogi","sa hohereasca":"hoheri","sa hoheresc":"hoheri","sa hoheresti":"hoheri","sa hoherim":"hoheri","sa hoheriti":"hoheri","sa hohoteasca":"hohoti","sa hohotesc":"hohoti","sa hohotesti":"hohoti","sa hohotim":"hohoti","sa hohotiti":"hohoti","sa hoinareasca":"hoinări","sa hoinaresc":"hoinări","sa hoinaresti":"hoinări","sa hoinarim":"hoinări","sa hoinariti":"hoinări","sa holbam":"holba","sa holbati":"holba","sa holbez":"holba","sa holbeze":"holba","sa holbezi":"holba","sa hondraneasca":"hondrăni","sa hondranesc":"hondrăni","sa hondranesti":"hondrăni","sa hondranim":"hondrăni","sa hondraniti":"hondrăni","sa hopai":"hopăi","sa hopaie":"hopăi","sa hopaim":"hopăi","sa hopaiti":"hopăi","sa horai":"horăi","sa horaie":"horăi","sa horaim":"horăi","sa horaiti":"horăi","sa horcai":"horcăi","sa horcaie":"horcăi","sa horcaim":"horcăi","sa horcaiti":"horcăi","sa horcan":"horcăni","sa horcana":"horcăni","sa horcani":"horcăni","sa horcanim":"horcăni","sa horcaniti":"horcăni","sa horeasca":"hori","sa horesc":"hori","sa horesti":"hori","sa horhai":"horhăi","sa horhaie":"horhăi","sa horhaim":"horhăi","sa horhaiti":"horhăi","sa horim":"hori","sa horipilam":"horipila","sa horipilati":"horipila","sa horipilez":"horipila","sa horipileze":"horipila","sa horipilezi":"horipila","sa horiti":"hori","sa horopseasca":"horopsi","sa horopsesc":"horopsi","sa horopsesti":"horopsi","sa horopsim":"horopsi","sa horopsiti":"horopsi","sa hotaram":"hotărî","sa hotarasc":"hotărî","sa hotarasca":"hotărî","sa hotarasti":"hotărî","sa hotarati":"hotărî","sa hotarniceasca":"hotărnici","sa hotarnicesc":"hotărnici","sa hotarnicesti":"hotărnici","sa hotarnicim":"hotărnici","sa hotarniciti":"hotărnici","sa hoteasca":"hoți","sa hotesc":"hoți","sa hotesti":"hoți","sa hotim":"hoți","sa hotiti":"hoți","sa hraconeasca":"hraconi","sa hraconesc":"hraconi","sa hraconesti":"hraconi","sa hraconim":"hraconi","sa hraconiti":"hraconi","sa hraneasca":"hrăni","sa hranesc":"hrăni","sa hranesti":"hrăni","sa hranim":"hrăni","sa hraniti":"hrăni","sa hrapeasca":"hrăpi","sa hrapesc":"hrăpi","sa hrapesti":"hrăpi","sa hrapim":"hrăpi","sa hrapiti":"hrăpi","sa hrentuiasca":"hrentui","sa hrentuiesc":"hrentui","sa hrentuiesti":"hrentui","sa hrentuim":"hrentui","sa hrentuiti":"hrentui","sa hrepcuiasca":"hrepcui","sa hrepcuiesc":"hrepcui","sa hrepcuiesti":"hrepcui","sa hrepcuim":"hrepcui","sa hrepcuiti":"hrepcui","sa huhur":"huhura","sa huhuram":"huhura","sa huhurati":"huhura","sa huhure":"huhura","sa huhurezam":"huhureza","sa huhurezati":"huhureza","sa huhurezez":"huhureza","sa huhurezeze":"huhureza","sa huhurezezi":"huhureza","sa huhuri":"huhura","sa huiduiasca":"huidui","sa huiduiesc":"huidui","sa huiduiesti":"huidui","sa huiduim":"huidui","sa huiduiti":"huidui","sa huleasca":"huli","sa hulesc":"huli","sa hulesti":"huli","sa hulim":"huli","sa huliti":"huli","sa hultuiasca":"hultui","sa hultuiesc":"hultui","sa hultuiesti":"hultui","sa hultuim":"hultui","sa hultuiti":"hultui","sa huluiasca":"hului","sa huluiesc":"hului","sa huluiesti":"hului","sa huluim":"hului","sa huluiti":"hului","sa hurduc":"hurduca","sa hurducai":"hurducăi","sa hurducaie":"hurducăi","sa hurducaim":"hurducăi","sa hurducaiti":"hurducăi","sa hurducam":"hurduca","sa hurducati":"hurduca","sa hurduce":"hurduca","sa hurduci":"hurduca","sa hurui":"hurui","sa huruie":"hurui","sa huruim":"hurui","sa huruiti":"hurui","sa hutupeasca":"hutupi","sa hutupesc":"hutupi","sa hutupesti":"hutupi","sa hutupim":"hutupi","sa hutupiti":"hutupi","sa huzureasca":"huzuri","sa huzuresc":"huzuri","sa huzuresti":"huzuri","sa huzurim":"huzuri","sa huzuriti":"huzuri","sa ia":"lua","sa ia in seama":"lua în seamă","sa ia la pula":"lua la pulă","sa iau":"lua","sa iau in seama":"lua în seamă","sa iau la pula":"lua la pulă","sa iei":"lua","sa iei in seama":"lua în seamă","sa iei la pula":"lua la pulă","sa jacmaneasca":"jăcmăni","sa jacmanesc":"jăcmăni","sa jacmanesti":"jăcmăni","sa jacmanim":"jăcmăni","sa jacmaniti":"jăcmăni","sa jacuiasca":"jăcui","sa jacuiesc":"jăcui","sa jacuiesti":"jăcui","sa jacuim":"jăcui","sa jacuiti":"jăcui","sa jalonam":"jalona","sa jalonati":"jalona","sa jalonez":"jalona","sa jaloneze":"jalona","sa jalonezi":"jalona","sa jareasca":"jări","sa jaresc":"jări","sa jaresti":"jări","sa jarim":"jări","sa jariti":"jări","sa jaruiasca":"jărui","sa jaruiesc":"jărui","sa jaruiesti":"jărui","sa jaruim":"jărui","sa jaruiti":"jărui","sa javelizam":"javeliza","sa javelizati":"javeliza","sa javelizez":"javeliza","sa javelizeze":"javeliza","sa javelizezi":"javeliza","sa jecmaneasca":"jecmăni","sa jecmanesc":"jecmăni","sa jecmanesti":"jecmăni","sa jecmanim":"jecmăni","sa jecmaniti":"jecmăni","sa jecuiasca":"jecui","sa jecuiesc":"jecui","sa jecuiesti":"jecui","sa jecuim":"jecui","sa jecuiti":"jecui","sa jefuiasca":"jefui","sa jefuiesc":"jefui","sa jefuiesti":"jefui","sa jefuim":"jefui","sa jefuiti":"jefui","sa jel":"jeli","sa jela":"jeli","sa jeli":"jeli","sa jelim":"jeli","sa jeliti":"jeli","sa jelui":"jelui","sa jeluie":"jelui","sa jeluim":"jelui","sa jeluiti":"jelui","sa jenam":"jena","sa jenati":"jena","sa jenez":"jena","sa jeneze":"jena","sa jenezi":"jena","sa jerpeleasca":"jerpeli","sa jerpelesc":"jerpeli","sa jerpelesti":"jerpeli","sa jerpelim":"jerpeli","sa jerpeliti":"jerpeli","sa jertfeasca":"jertfi","sa jertfesc":"jertfi","sa jertfesti":"jertfi","sa jertfim":"jertfi","sa jertfiti":"jertfi","sa jertfuiasca":"jertfui","sa jertfuiesc":"jertfui","sa jertfuiesti":"jertfui","sa jertfuim":"jertfui","sa jertfuiti":"jertfui","sa jeruiasca":"jerui","sa jeruiesc":"jerui","sa jeruiesti":"jerui","sa jeruim":"jerui","sa jeruiti":"jerui","sa jicneasca":"jicni","sa jicnesc":"jicni","sa jicnesti":"jicni","sa jicnim":"jicni","sa jicniti":"jicni","sa jigareasca":"jigări","sa jigaresc":"jigări","sa jigaresti":"jigări","sa jigarim":"jigări","sa jigariti":"jigări","sa jigneasca":"jigni","sa jignesc":"jigni","sa jignesti":"jigni","sa jignim":"jigni","sa jigniti":"jigni","sa jilaveasca":"jilăvi","sa jilavesc":"jilăvi","sa jilavesti":"jilăvi","sa jilavim":"jilăvi","sa jilaviti":"jilăvi","sa jinduiasca":"jindui","sa jinduiesc":"jindui","sa jinduiesti":"jindui","sa jinduim":"jindui","sa jinduiti":"jindui","sa jnapai":"jnăpăi","sa jnapaie":"jnăpăi","sa jnapaim":"jnăpăi","sa jnapaiti":"jnăpăi","sa joace":"juca","sa joc":"juca","sa joci":"juca","sa jonglam":"jongla","sa jonglati":"jongla","sa jonglez":"jongla","sa jongleze":"jongla","sa jonglezi":"jongla","sa jubilam":"jubila","sa jubilati":"jubila","sa jubilez":"jubila","sa jubileze":"jubila","sa jubilezi":"jubila","sa jucam":"juca","sa jucati":"juca","sa judec":"judeca","sa judecam":"judeca","sa judecati":"judeca","sa judece":"judeca","sa judeceasca":"judeci","sa judecesc":"judeci","sa judecesti":"judeci","sa judeci":"judeca","sa judecim":"judeci","sa judeciti":"judeci","sa juganeasca":"jugăni","sa juganesc":"jugăni","sa juganesti":"jugăni","sa juganim":"jugăni","sa juganiti":"jugăni","sa jugulam":"jugula","sa jugulati":"jugula","sa jugulez":"jugula","sa juguleze":"jugula","sa jugulezi":"jugula","sa juisam":"juisa","sa juisati":"juisa","sa juisez":"juisa","sa juiseze":"juisa","sa juisezi":"juisa","sa juleasca":"juli","sa julesc":"juli","sa julesti":"juli","sa julim":"juli","sa juliti":"juli","sa jumatateasca":"jumătăți","sa jumatatesc":"jumătăți","sa jumatatesti":"jumătăți","sa jumatatim":"jumătăți","sa jumatatiti":"jumătăți","sa jumuleasca":"jumuli","sa jumulesc":"jumuli","sa jumulesti":"jumuli","sa jumulim":"jumuli","sa jumuliti":"jumuli","sa junghiati":"junghia","sa junghie":"junghia","sa junghiem":"junghia","sa junghii":"junghia","sa jupeasca":"jupi","sa jupesc":"jupi","sa jupesti":"jupi","sa jupim":"jupi","sa jupiti":"jupi","sa jupoaie":"jupui","sa jupoi":"jupui","sa jupuim":"jupui","sa jupuiti":"jupui","sa jur":"jura","sa juram":"jura","sa jurati":"jura","sa jure":"jura","sa juri":"jura","sa jurizam":"juriza","sa jurizati":"juriza","sa jurizez":"juriza","sa jurizeze":"juriza","sa jurizezi":"juriza","sa juruiasca":"jurui","sa juruiesc":"jurui","sa juruiesti":"jurui","sa juruim":"jurui","sa juruiti":"jurui","sa justific":"justifica","sa justificam":"justifica","sa justificati":"justifica","sa justifice":"justifica","sa justifici":"justifica","sa juxtapui":"juxtapune","sa juxtapun":"juxtapune","sa juxtapuna":"juxtapune","sa juxtapunem":"juxtapune","sa juxtapuneti":"juxtapune","sa kilometram":"kilometra","sa kilometrati":"kilometra","sa kilometrez":"kilometra","sa kilometreze":"kilometra","sa kilometrezi":"kilometra","sa knockoutam":"knockouta","sa knockoutati":"knockouta","sa knockoutez":"knockouta","sa knockouteze":"knockouta","sa knockoutezi":"knockouta","sa labaduiasca":"lăbădui","sa labaduiesc":"lăbădui","sa labaduiesti":"lăbădui","sa labaduim":"lăbădui","sa labaduiti":"lăbădui","sa labartam":"lăbărța","sa labartati":"lăbărța","sa labartez":"lăbărța","sa labarteze":"lăbărța","sa labartezi":"lăbărța","sa labializam":"labializa","sa labializati":"labializa","sa labializez":"labializa","sa labializeze":"labializa","sa labializezi":"labializa","sa laboram":"labora","sa laborati":"labora","sa laborez":"labora","sa laboreze":"labora","sa laborezi":"labora","sa lacatuiasca":"lăcătui","sa lacatuiesc":"lăcătui","sa lacatuiesti":"lăcătui","sa lacatuim":"lăcătui","sa lacatuiti":"lăcătui","sa laceram":"lacera","sa lacerati":"lacera","sa lacerez":"lacera","sa lacereze":"lacera","sa lacerezi":"lacera","sa lacomeasca":"lăcomi","sa lacomesc":"lăcomi","sa lacomesti":"lăcomi","sa lacomim":"lăcomi","sa lacomiti":"lăcomi","sa lacramam":"lăcrăma","sa lacramati":"lăcrăma","sa lacramez":"lăcrăma","sa lacrameze":"lăcrăma","sa lacramezi":"lăcrăma","sa lacrimam":"lăcrima","sa lacrimati":"lăcrima","sa lacrimez":"lăcrima","sa lacrimeze":"lăcrima","sa lacrimezi":"lăcrima","sa lacuiasca":"lăcui","sa lacuiesc":"lăcui","sa lacuiesti":"lăcui","sa lacuim":"lăcui","sa lacuiti":"lăcui","sa lafai":"lăfăi","sa lafaie":"lăfăi","sa lafaim":"lăfăi","sa lafaiti":"lăfăi","sa lahtaris":"lahtarisi","sa lahtarisa":"lahtarisi","sa lahtarisi":"lahtarisi","sa lahtarisim":"lahtarisi","sa lahtarisiti":"lahtarisi","sa lai":"la","sa laicizam":"laiciza","sa laicizati":"laiciza","sa laicizez":"laiciza","sa laicizeze":"laiciza","sa laicizezi":"laiciza","sa lainiceasca":"lăinici","sa lainicesc":"lăinici","sa lainicesti":"lăinici","sa lainicim":"lăinici","sa lainiciti":"lăinici","sa lam":"la","sa lamatis":"lamatisi","sa lamatisa":"lamatisi","sa lamatisi":"lamatisi","sa lamatisim":"lamatisi","sa lamatisiti":"lamatisi","sa lambicaris":"lambicarisi","sa lambicarisa":"lambicarisi","sa lambicarisi":"lambicarisi","sa lambicarisim":"lambicarisi","sa lambicarisiti":"lambicarisi","sa lambrisam":"lambrisa","sa lambrisati":"lambrisa","sa lambrisez":"lambrisa","sa lambriseze":"lambrisa","sa lambrisezi":"lambrisa","sa lamentam":"lamenta","sa lamentati":"lamenta","sa lamentez":"lamenta","sa lamenteze":"lamenta","sa lamentezi":"lamenta","sa laminam":"lamina","sa laminati":"lamina","sa laminez":"lamina","sa lamineze":"lamina","sa laminezi":"lamina","sa lamureasca":"lămuri","sa lamuresc":"lămuri","sa lamuresti":"lămuri","sa lamurim":"lămuri","sa lamuriti":"lămuri","sa lancezeasca":"lâncezi","sa lancezesc":"lâncezi","sa lancezesti":"lâncezi","sa lancezim":"lâncezi","sa lanceziti":"lâncezi","sa languiasca":"langui","sa languiesc":"langui","sa languiesti":"langui","sa languim":"langui","sa languiti":"langui","sa lansam":"lansa","sa lansati":"lansa","sa lansez":"lansa","sa lanseze":"lansa","sa lansezi":"lansa","sa lantuiasca":"lănțui","sa lantuiesc":"lănțui","sa lantuiesti":"lănțui","sa lantuim":"lănțui","sa lantuiti":"lănțui","sa lapad":"lăpăda","sa lapadam":"lăpăda","sa lapadati":"lăpăda","sa lapade":"lăpăda","sa lapaiasca":"lăpăi","sa lapaiesc":"lăpăi","sa lapaiesti":"lăpăi","sa lapaim":"lăpăi","sa lapaiti":"lăpăi","sa lapazi":"lăpăda","sa lapidam":"lapida","sa lapidati":"lapida","sa lapidez":"lapida","sa lapideze":"lapida","sa lapidezi":"lapida","sa lapovit":"lapovița","sa lapovitam":"lapovița","sa lapovitati":"lapovița","sa lapovite":"lapovița","sa lapoviti":"lapovița","sa laptam":"lăpta","sa laptati":"lăpta","sa laptez":"lăpta","sa lapteze":"lăpta","sa laptezi":"lăpta","sa laptuc":"lăptuci","sa laptuca":"lăptuci","sa laptuci":"lăptuci","sa laptucim":"lăptuci","sa laptuciti":"lăptuci","sa largeasca":"lărgi","sa largesc":"lărgi","sa largesti":"lărgi","sa largim":"lărgi","sa largiti":"lărgi","sa larmuiasca":"lărmui","sa larmuiesc":"lărmui","sa larmuiesti":"lărmui","sa larmuim":"lărmui","sa larmuiti":"lărmui","sa las":"lăsa","sa lasam":"lăsa","sa lasati":"lăsa","sa lase":"lăsa","sa lasi":"lăsa","sa lastareasca":"lăstări","sa lastaresc":"lăstări","sa lastaresti":"lăstări","sa lastarim":"lăstări","sa lastariti":"lăstări","sa lasteasca":"lăsti","sa lastesc":"lăsti","sa lastesti":"lăsti","sa lastim":"lăsti","sa lastiti":"lăsti","sa lateasca":"lăți","sa latesc":"lăți","sa latesti":"lăți","sa lati":"la","sa latim":"lăți","sa latineasca":"latini","sa latinesc":"latini","sa latinesti":"latini","sa latinim":"latini","sa latiniti":"latini","sa latinizam":"latiniza","sa latinizati":"latiniza","sa latinizez":"latiniza","sa latinizeze":"latiniza","sa latinizezi":"latiniza","sa latiti":"lăți","sa latram":"lătra","sa latrati":"lătra","sa latre":"lătra","sa latri":"lătra","sa latru":"lătra","sa latur":"lătura","sa laturam":"lătura","sa laturati":"lătura","sa lature":"lătura","sa laturi":"lătura","sa lau":"la","sa laud":"lăuda","sa laudam":"lăuda","sa laudati":"lăuda","sa laude":"lăuda","sa lauzeasca":"lăuzi","sa lauzesc":"lăuzi","sa lauzesti":"lăuzi","sa lauzi":"lăuda","sa lauzim":"lăuzi","sa lauziti":"lăuzi","sa lea":"la","sa lecturam":"lectura","sa lecturati":"lectura","sa lecturez":"lectura","sa lectureze":"lectura","sa lecturezi":"lectura","sa lecuiasca":"lecui","sa lecuiesc":"lecui","sa lecuiesti":"lecui","sa lecuim":"lecui","sa lecuiti":"lecui","sa leftereasca":"lefteri","sa lefteresc":"lefteri","sa lefteresti":"lefteri","sa lefterim":"lefteri","sa lefteriti":"lefteri","sa leg":"lega","sa legalizam":"legaliza","sa legalizati":"legaliza","sa legalizez":"legaliza","sa legalizeze":"legaliza","sa legalizezi":"legaliza","sa legam":"lega","sa legan":"legăna","sa leganam":"legăna","sa leganati":"legăna","sa legati":"lega","sa legatui":"legatui","sa legatuie":"legatui","sa legatuim":"legatui","sa legatuiti":"legatui","sa lege":"lega","sa legene":"legăna","sa legeni":"legăna","sa legi":"lega","sa legiferam":"legifera","sa legiferati":"legifera","sa legiferez":"legifera","sa legifereze":"legifera","sa legiferezi":"legifera","sa legionariz":"legionariza","sa legionarizam":"legionariza","sa legionarizati":"legionariza","sa legionarize":"legionariza","sa legionarizi":"legionariza","sa legislam":"legisla","sa legislati":"legisla","sa legislez":"legisla","sa legisleze":"legisla","sa legislezi":"legisla","sa legitimam":"legitima","sa legitimati":"legitima","sa legitimez":"legitima","sa legitimeze":"legitima","sa legitimezi":"legitima","sa legitimizam":"legitimiza","sa legitimizati":"legitimiza","sa legitimizez":"legitimiza","sa legitimizeze":"legitimiza","sa legitimizezi":"legitimiza","sa legiuiasca":"legiui","sa legiuiesc":"legiui","sa legiuiesti":"legiui","sa legiuim":"legiui","sa legiuiti":"legiui","sa lehaiasca":"lehăi","sa lehaiesc":"lehăi","sa lehaiesti":"lehăi","sa lehaim":"lehăi","sa lehaiti":"lehăi","sa lehameteasca":["să lehămetească","lehămeti","să lehămețească","lehămeți"],"sa lehametesc":["să lehămetesc","lehămeti","să lehămețesc","lehămeți"],"sa lehametesti":["să lehămetești","lehămeti","să lehămețești","lehămeți"],"sa lehametim":["să lehămetim","lehămeti","să lehămețim","lehămeți"],"sa lehametiseasca":"lehămetisi","sa lehametisesc":"lehămetisi","sa lehametisesti":"lehămetisi","sa lehametisim":"lehămetisi","sa lehametisiti":"lehămetisi","sa lehametiti":["să lehămetiți","lehămeti","să lehămețiți","lehămeți"],"sa lehametuiasca":"lehămetui","sa lehametuiesc":"lehămetui","sa lehametuiesti":"lehămetui","sa lehametuim":"lehămetui","sa lehametuiti":"lehămetui","sa lehuzeasca":"lehuzi","sa lehuzesc":"lehuzi","sa lehuzesti":"lehuzi","sa lehuzim":"lehuzi","sa lehuziti":"lehuzi","sa leneveasca":"lenevi","sa lenevesc":"lenevi","sa lenevesti":"lenevi","sa lenevim":"lenevi","sa leneviti":"lenevi","sa leopai":"leopăi","sa leopaie":"leopăi","sa leopaim":"leopăi","sa leopaiti":"leopăi","sa leorbai":"leorbăi","sa leorbaie":"leorbăi","sa leorbaim":"leorbăi","sa leorbaiti":"leorbăi","sa lepad":"lepăda","sa lepadam":"lepăda","sa lepadati":"lepăda","sa lepai":"lepăi","sa lepaie":"lepăi","sa lepaim":"lepăi","sa lepaiti":"lepăi","sa lepede":"lepăda","sa lepezi":"lepăda","sa lesin":"leșina","sa lesinam":"leșina","sa lesinati":"leșina","sa lesine":"leșina","sa lesini":"leșina","sa lestam":"lesta","sa lestati":"lesta","sa lestez":"lesta","sa lesteze":"lesta","sa lestezi":"lesta","sa lesuiasca":"leșui","sa lesuiesc":"leșui","sa lesuiesti":"leșui","sa lesuim":"leșui","sa lesuiti":"leșui","sa levigam":"leviga","sa levigati":"leviga","sa levighez":"leviga","sa levigheze":"leviga","sa levighezi":"leviga","sa lexicalizam":"lexicaliza","sa lexicalizati":"lexicaliza","sa lexicalizez":"lexicaliza","sa lexicalizeze":"lexicaliza","sa lexicalizezi":"lexicaliza","sa lezam":"leza","sa lezati":"leza","sa lezez":"leza","sa lezeze":"leza","sa lezezi":"leza","sa libelam":"libela","sa libelati":"libela","sa libelez":"libela","sa libeleze":"libela","sa libelezi":"libela","sa liberalizam":"liberaliza","sa liberalizati":"liberaliza","sa liberalizez":"liberaliza","sa liberalizeze":"liberaliza","sa liberalizezi":"liberaliza","sa liberam":"libera","sa liberati":"libera","sa liberez":"libera","sa libereze":"libera","sa liberezi":"libera","sa licareasca":"licări","sa licaresc":"licări","sa licaresti":"licări","sa licarim":"licări","sa licariti":"licări","sa licentiati":"licenția","sa licentiem":"licenția","sa licentiez":"licenția","sa licentieze":"licenția","sa licentiezi":"licenția","sa lichefiati":"lichefia","sa lichefiem":"lichefia","sa lichefiez":"lichefia","sa lichefieze":"lichefia","sa lichefiezi":"lichefia","sa lichidam":"lichida","sa lichidati":"lichida","sa lichidez":"lichida","sa lichideze":"lichida","sa lichidezi":"lichida","sa licitam":"licita","sa licitati":"licita","sa licitez":"licita","sa liciteze":"licita","sa licitezi":"licita","sa licur":"licura","sa licuram":"licura","sa licurati":"licura","sa licure":"licura","sa licureasca":"licuri","sa licuresc":"licuri","sa licuresti":"licuri","sa licuri":"licura","sa licurim":"licuri","sa licuriti":"licuri","sa lifer":"lifera","sa liferam":"lifera","sa liferati":"lifera","sa lifere":"lifera","sa liferi":"lifera","sa lignific":"lignifica","sa lignificam":"lignifica","sa lignificati":"lignifica","sa lignifice":"lignifica","sa lignifici":"lignifica","sa lihai":"lihăi","sa lihaie":"lihăi","sa lihaim":"lihăi","sa lihaiti":"lihăi","sa limbuteasca":"limbuți","sa limbutesc":"limbuți","sa limbutesti":"limbuți","sa limbutim":"limbuți","sa limbutiti":"limbuți","sa limitam":"limita","sa limitati":"limita","sa limitez":"limita","sa limiteze":"limita","sa limitezi":"limita","sa limpezeasca":"limpezi","sa limpezesc":"limpezi","sa limpezesti":"limpezi","sa limpezim":"limpezi","sa limpeziti":"limpezi","sa linciureasca":"linciuri","sa linciuresc":"linciuri","sa linciuresti":"linciuri","sa linciurim":"linciuri","sa linciuriti":"linciuri","sa ling":"linge","sa linga":"linge","sa lingareasca":"lingări","sa lingaresc":"lingări","sa lingaresti":"lingări","sa lingarim":"lingări","sa lingariti":"lingări","sa lingem":"linge","sa lingeti":"linge","sa lingi":"linge","sa linguseasca":"linguși","sa lingusesc":"linguși","sa lingusesti":"linguși","sa lingusim":"linguși","sa lingusiti":"linguși","sa liniati":"linia","sa liniem":"linia","sa liniez":"linia","sa linieze":"linia","sa liniezi":"linia","sa linisteasca":"liniști","sa linistesc":"liniști","sa linistesti":"liniști","sa linistim":"liniști","sa linistiti":"liniști","sa linsam":"linșa","sa linsati":"linșa","sa linsez":"linșa","sa linseze":"linșa","sa linsezi":"linșa","sa liofilizam":"liofiliza","sa liofilizati":"liofiliza","sa liofilizez":"liofiliza","sa liofilizeze":"liofiliza","sa liofilizezi":"liofiliza","sa lipeasca":"lipi","sa lipesc":"lipi","sa lipesti":"lipi","sa lipim":"lipi","sa lipiti":"lipi","sa lipseasca":"lipsi","sa lipsesc":"lipsi","sa lipsesti":"lipsi","sa lipsim":"lipsi","sa lipsiti":"lipsi","sa liricizam":"liriciza","sa liricizati":"liriciza","sa liricizez":"liriciza","sa liricizeze":"liriciza","sa liricizezi":"liriciza","sa listam":"lista","sa listati":"lista","sa listez":"lista","sa listeze":"lista","sa listezi":"lista","sa literam":"litera","sa literarizam":"literariza","sa literarizati":"literariza","sa literarizez":"literariza","sa literarizeze":"literariza","sa literarizezi":"literariza","sa literati":"litera","sa literaturizam":"literaturiza","sa literaturizati":"literaturiza","sa literaturizez":"literaturiza","sa literaturizeze":"literaturiza","sa literaturizezi":"literaturiza","sa literez":"litera","sa litereze":"litera","sa literezi":"litera","sa litografiati":"litografia","sa litografiem":"litografia","sa litografiez":"litografia","sa litografieze":"litografia","sa litografiezi":"litografia","sa livram":"livra","sa livrati":"livra","sa livrez":"livra","sa livreze":"livra","sa livrezi":"livra","sa lobam":"loba","sa lobati":"loba","sa lobez":"loba","sa lobeze":"loba","sa lobezi":"loba","sa localizam":"localiza","sa localizati":"localiza","sa localizez":"localiza","sa localizeze":"localiza","sa localizezi":"localiza","sa locuiasca":"locui","sa locuiesc":"locui","sa locuiesti":"locui","sa locuim":"locui","sa locuiti":"locui","sa logam":"loga","sa logaritmam":"logaritma","sa logaritmati":"logaritma","sa logaritmez":"logaritma","sa logaritmeze":"logaritma","sa logaritmezi":"logaritma","sa logati":"loga","sa loghez":"loga","sa logheze":"loga","sa loghezi":"loga","sa logodeasca":"logodi","sa logodesc":"logodi","sa logodesti":"logodi","sa logodim":"logodi","sa logoditi":"logodi","sa lombardam":"lombarda","sa lombardati":"lombarda","sa lombardez":"lombarda","sa lombardeze":"lombarda","sa lombardezi":"lombarda","sa lopatam":"lopăta","sa lopatati":"lopăta","sa lopatez":"lopăta","sa lopateze":"lopăta","sa lopatezi":"lopăta","sa lotionam":"loționa","sa lotionati":"loționa","sa lotionez":"loționa","sa lotioneze":"loționa","sa lotionezi":"loționa","sa lotizam":"lotiza","sa lotizati":"lotiza","sa lotizez":"lotiza","sa lotizeze":"lotiza","sa lotizezi":"lotiza","sa lotreasca":"lotri","sa lotresc":"lotri","sa lotresti":"lotri","sa lotrim":"lotri","sa lotriti":"lotri","sa loveasca":"lovi","sa lovesc":"lovi","sa lovesti":"lovi","sa lovim":"lovi","sa loviti":"lovi","sa luam":"lua","sa luam in seama":"lua în seamă","sa luam la pula":"lua la pulă","sa luati":"lua","sa luati in seama":"lua în seamă","sa luati la pula":"lua la pulă","sa lubrifiati":"lubrifia","sa lubrifiem":"lubrifia","sa lubrifiez":"lubrifia","sa lubrifieze":"lubrifia","sa lubrifiezi":"lubrifia","sa luceasca":"luci","sa lucesc":"luci","sa lucesti":"luci","sa lucim":"luci","sa luciti":"luci","sa lucram":"lucra","sa lucrati":"lucra","sa lucrez":"lucra","sa lucreze":"lucra","sa lucrezi":"lucra","sa luminam":"lumina","sa luminati":"lumina","sa luminez":"lumina","sa lumineze":"lumina","sa luminezi":"lumina","sa lunec":"luneca","sa lunecam":"luneca","sa lunecati":"luneca","sa lunece":"luneca","sa luneci":"luneca","sa lung":"lunga","sa lungam":"lunga","sa lungati":"lunga","sa lunge":"lunga","sa lungeasca":"lungi","sa lungesc":"lungi","sa lungesti":"lungi","sa lungi":"lunga","sa lungim":"lungi","sa lungiti":"lungi","sa luntreasca":"luntri","sa luntresc":"luntri","sa luntresti":"luntri","sa luntrim":"luntri","sa luntriti":"luntri","sa lupt":"lupta","sa luptam":"lupta","sa luptati":"lupta","sa lupte":"lupta","sa lupti":"lupta","sa lusam":"lușa","sa lusati":"lușa","sa lusez":"lușa","sa luseze":"lușa","sa lusezi":"lușa","sa lustruiasca":"lustrui","sa lustruiesc":"lustrui","sa lustruiesti":"lustrui","sa lustruim":"lustrui","sa lustruiti":"lustrui","sa luxam":"luxa","sa luxati":"luxa","sa luxez":"luxa","sa luxeze":"luxa","sa luxezi":"luxa","sa naboiasca":"năboi","sa naboiesc":"năboi","sa naboiesti":"năboi","sa naboim":"năboi","sa naboiti":"năboi","sa nabuseasca":"năbuși","sa nabusesc":"năbuși","sa nabusesti":"năbuși","sa nabusim":"năbuși","sa nabusiti":"năbuși","sa nacajeasca":"năcăji","sa nacajesc":"năcăji","sa nacajesti":"năcăji","sa nacajim":"năcăji","sa nacajiti":"năcăji","sa naclaiasca":"năclăi","sa naclaiesc":"năclăi","sa naclaiesti":"năclăi","sa naclaim":"năclăi","sa naclaiti":"năclăi","sa nadaiasca":"nădăi","sa nadaiesc":"nădăi","sa nadaiesti":"nădăi","sa nadaim":"nădăi","sa nadaiti":"nădăi","sa nadajduiasca":"nădăjdui","sa nadajduiesc":"nădăjdui","sa nadajduiesti":"nădăjdui","sa nadajduim":"nădăjdui","sa nadajduiti":"nădăjdui","sa nadejduiasca":"nădejdui","sa nadejduiesc":"nădejdui","sa nadejduiesti":"nădejdui","sa nadejduim":"nădejdui","sa nadejduiti":"nădejdui","sa nadureasca":"năduri","sa naduresc":"năduri","sa naduresti":"năduri","sa nadurim":"năduri","sa naduriti":"năduri","sa naduseasca":"năduși","sa nadusesc":"năduși","sa nadusesti":"năduși","sa nadusim":"năduși","sa nadusiti":"năduși","sa nalbeasca":"nălbi","sa nalbesc":"nălbi","sa nalbesti":"nălbi","sa nalbim":"nălbi","sa nalbiti":"nălbi","sa nalt":"nălța","sa naltam":"nălța","sa naltati":"nălța","sa nalte":"nălța","sa nalti":"nălța","sa naluceasca":"năluci","sa nalucesc":"năluci","sa nalucesti":"năluci","sa nalucim":"năluci","sa naluciti":"năluci","sa nameasca":"nămi","sa namesc":"nămi","sa namesti":"nămi","sa namet":"nămeți","sa nameta":"nămeți","sa nameti":"nămeți","sa nametim":"nămeți","sa nametiti":"nămeți","sa namim":"nămi","sa namiti":"nămi","sa namoleasca":"nămoli","sa namolesc":"nămoli","sa namolesti":"nămoli","sa namolim":"nămoli","sa namoliti":"nămoli","sa napadeasca":"năpădi","sa napadesc":"năpădi"};
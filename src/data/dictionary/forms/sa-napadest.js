@@ -0,0 +1 @@
+export default {"sa napadesti":"năpădi","sa napadim":"năpădi","sa napaditi":"năpădi","sa naparleasca":"năpârli","sa naparlesc":"năpârli","sa naparlesti":"năpârli","sa naparlim":"năpârli","sa naparliti":"năpârli","sa napastuiasca":"năpăstui","sa napastuiesc":"năpăstui","sa napastuiesti":"năpăstui","sa napastuim":"năpăstui","sa napastuiti":"năpăstui","sa napoiati":"napoia","sa napoiem":"napoia","sa napoiez":"napoia","sa napoieze":"napoia","sa napoiezi":"napoia","sa napusteasca":"năpusti","sa napustesc":"năpusti","sa napustesti":"năpusti","sa napustim":"năpusti","sa napustiti":"năpusti","sa naram":"nara","sa narati":"nara","sa naraveasca":"nărăvi","sa naravesc":"nărăvi","sa naravesti":"nărăvi","sa naravim":"nărăvi","sa naraviti":"nărăvi","sa narcotizam":"narcotiza","sa narcotizati":"narcotiza","sa narcotizez":"narcotiza","sa narcotizeze":"narcotiza","sa narcotizezi":"narcotiza","sa narez":"nara","sa nareze":"nara","sa narezi":"nara","sa narui":"nărui","sa naruie":"nărui","sa naruim":"nărui","sa naruiti":"nărui","sa nasc":"naște","sa nasca":"naște","sa nascoceasca":"născoci","sa nascocesc":"născoci","sa nascocesti":"născoci","sa nascocim":"născoci","sa nascociti":"născoci","sa naseasca":"năși","sa nasesc":"năși","sa nasesti":"năși","sa nasim":"năși","sa nasiti":"năși","sa nasluiasca":"năslui","sa nasluiesc":"năslui","sa nasluiesti":"năslui","sa nasluim":"năslui","sa nasluiti":"năslui","sa nasoleasca":"nasoli","sa nasolesc":"nasoli","sa nasolesti":"nasoli","sa nasolim":"nasoli","sa nasoliti":"nasoli","sa nastaveasca":"năstăvi","sa nastavesc":"năstăvi","sa nastavesti":"năstăvi","sa nastavim":"năstăvi","sa nastaviti":"năstăvi","sa nastem":"naște","sa nasteti":"naște","sa nasti":"naște","sa natangeasca":"nătângi","sa natangesc":"nătângi","sa natangesti":"nătângi","sa natangim":"nătângi","sa natangiti":"nătângi","sa nationalizam":"naționaliza","sa nationalizati":"naționaliza","sa nationalizez":"naționaliza","sa nationalizeze":"naționaliza","sa nationalizezi":"naționaliza","sa naturalizam":"naturaliza","sa naturalizati":"naturaliza","sa naturalizez":"naturaliza","sa naturalizeze":"naturaliza","sa naturalizezi":"naturaliza","sa nauceasca":"năuci","sa naucesc":"năuci","sa naucesti":"năuci","sa naucim":"năuci","sa nauciti":"năuci","sa naufragiati":"naufragia","sa naufragiem":"naufragia","sa naufragiez":"naufragia","sa naufragieze":"naufragia","sa naufragiezi":"naufragia","sa navaleasca":"năvăli","sa navalesc":"năvăli","sa navalesti":"năvăli","sa navalim":"năvăli","sa navaliti":"năvăli","sa navigabilizam":"navigabiliza","sa navigabilizati":"navigabiliza","sa navigabilizez":"navigabiliza","sa navigabilizeze":"navigabiliza","sa navigabilizezi":"navigabiliza","sa navigam":"naviga","sa navigati":"naviga","sa navighez":"naviga","sa navigheze":"naviga","sa navighezi":"naviga","sa navloseasca":"navlosi","sa navlosesc":"navlosi","sa navlosesti":"navlosi","sa navlosim":"navlosi","sa navlositi":"navlosi","sa navodeasca":"năvodi","sa navodesc":"năvodi","sa navodesti":"năvodi","sa navodim":"năvodi","sa navoditi":"năvodi","sa nazalizam":"nazaliza","sa nazalizati":"nazaliza","sa nazalizez":"nazaliza","sa nazalizeze":"nazaliza","sa nazalizezi":"nazaliza","sa nazareasca":"năzări","sa nazaresc":"năzări","sa nazaresti":"năzări","sa nazarim":"năzări","sa nazariti":"năzări","sa nazuiasca":"năzui","sa nazuiesc":"năzui","sa nazuiesti":"năzui","sa nazuim":"năzui","sa nazuiti":"năzui","sa neantizam":"neantiza","sa neantizati":"neantiza","sa neantizez":"neantiza","sa neantizeze":"neantiza","sa neantizezi":"neantiza","sa nebuneasca":"nebuni","sa nebunesc":"nebuni","sa nebunesti":"nebuni","sa nebunim":"nebuni","sa nebuniti":"nebuni","sa necajeasca":"necăji","sa necajesc":"necăji","sa necajesti":"necăji","sa necajim":"necăji","sa necajiti":"necăji","sa necesit":"necesita","sa necesitam":"necesita","sa necesitati":"necesita","sa necesite":"necesita","sa necesiti":"necesita","sa nechez":"necheza","sa nechezam":"necheza","sa nechezati":"necheza","sa necheze":"necheza","sa nechezi":"necheza","sa necinsteasca":"necinsti","sa necinstesc":"necinsti","sa necinstesti":"necinsti","sa necinstim":"necinsti","sa necinstiti":"necinsti","sa necroz":"necroza","sa necrozam":"necroza","sa necrozati":"necroza","sa necroze":"necroza","sa necrozi":"necroza","sa necurateasca":"necurăți","sa necuratesc":"necurăți","sa necuratesti":"necurăți","sa necuratim":"necurăți","sa necuratiti":"necurăți","sa nedreptateasca":"nedreptăți","sa nedreptatesc":"nedreptăți","sa nedreptatesti":"nedreptăți","sa nedreptatim":"nedreptăți","sa nedreptatiti":"nedreptăți","sa nedumereasca":"nedumeri","sa nedumeresc":"nedumeri","sa nedumeresti":"nedumeri","sa nedumerim":"nedumeri","sa nedumeriti":"nedumeri","sa nedumireasca":"nedumiri","sa nedumiresc":"nedumiri","sa nedumiresti":"nedumiri","sa nedumirim":"nedumiri","sa nedumiriti":"nedumiri","sa nefericeasca":"neferici","sa nefericesc":"neferici","sa nefericesti":"neferici","sa nefericim":"neferici","sa nefericiti":"neferici","sa neg":"nega","sa negam":"nega","sa negati":"nega","sa negativam":"negativa","sa negativati":"negativa","sa negativez":"negativa","sa negativeze":"negativa","sa negativezi":"negativa","sa negativizam":"negativiza","sa negativizati":"negativiza","sa negativizez":"negativiza","sa negativizeze":"negativiza","sa negativizezi":"negativiza","sa nege":"nega","sa negi":"nega","sa neglijam":"neglija","sa neglijariseasca":"neglijarisi","sa neglijarisesc":"neglijarisi","sa neglijarisesti":"neglijarisi","sa neglijarisim":"neglijarisi","sa neglijarisiti":"neglijarisi","sa neglijati":"neglija","sa neglijez":"neglija","sa neglijeze":"neglija","sa neglijezi":"neglija","sa negociati":"negocia","sa negociem":"negocia","sa negociez":"negocia","sa negocieze":"negocia","sa negociezi":"negocia","sa negreasca":"negri","sa negresc":"negri","sa negresti":"negri","sa negrim":"negri","sa negriti":"negri","sa negustoreasca":"negustori","sa negustoresc":"negustori","sa negustoresti":"negustori","sa negustorim":"negustori","sa negustoriti":"negustori","sa negutam":"neguța","sa negutati":"neguța","sa negutatoreasca":"neguțători","sa negutatoresc":"neguțători","sa negutatoresti":"neguțători","sa negutatorim":"neguțători","sa negutatoriti":"neguțători","sa negutez":"neguța","sa neguteze":"neguța","sa negutezi":"neguța","sa neingrijeasca":"neîngriji","sa neingrijesc":"neîngriji","sa neingrijesti":"neîngriji","sa neingrijim":"neîngriji","sa neingrijiti":"neîngriji","sa nelinisteasca":"neliniști","sa nelinistesc":"neliniști","sa nelinistesti":"neliniști","sa nelinistim":"neliniști","sa nelinistiti":"neliniști","sa nemereasca":"nemeri","sa nemeresc":"nemeri","sa nemeresti":"nemeri","sa nemerim":"nemeri","sa nemeriti":"nemeri","sa nemerniceasca":"nemernici","sa nemernicesc":"nemernici","sa nemernicesti":"nemernici","sa nemernicim":"nemernici","sa nemerniciti":"nemernici","sa nemeteasca":"nemeți","sa nemetesc":"nemeți","sa nemetesti":"nemeți","sa nemetim":"nemeți","sa nemetiti":"nemeți","sa nemteasca":"nemți","sa nemtesc":"nemți","sa nemtesti":"nemți","sa nemtim":"nemți","sa nemtiti":"nemți","sa nemultameasca":"nemulțămi","sa nemultamesc":"nemulțămi","sa nemultamesti":"nemulțămi","sa nemultamim":"nemulțămi","sa nemultamiti":"nemulțămi","sa nemultumeasca":"nemulțumi","sa nemultumesc":"nemulțumi","sa nemultumesti":"nemulțumi","sa nemultumim":"nemulțumi","sa nemultumiti":"nemulțumi","sa nemureasca":"nemuri","sa nemuresc":"nemuri","sa nemuresti":"nemuri","sa nemurim":"nemuri","sa nemuriti":"nemuri","sa nenoroceasca":"nenoroci","sa nenorocesc":"nenoroci","sa nenorocesti":"nenoroci","sa nenorocim":"nenoroci","sa nenorociti":"nenoroci","sa neodihneasca":"neodihni","sa neodihnesc":"neodihni","sa neodihnesti":"neodihni","sa neodihnim":"neodihni","sa neodihniti":"neodihni","sa neologizam":"neologiza","sa neologizati":"neologiza","sa neologizez":"neologiza","sa neologizeze":"neologiza","sa neologizezi":"neologiza","sa nesocoteasca":"nesocoti","sa nesocotesc":"nesocoti","sa nesocotesti":"nesocoti","sa nesocotim":"nesocoti","sa nesocotiti":"nesocoti","sa nest":"nești","sa nesta":"nești","sa nesti":"nești","sa nestim":"nești","sa nestiti":"nești","sa netezam":"neteza","sa netezati":"neteza","sa netezeasca":"netezi","sa netezesc":"netezi","sa netezesti":"netezi","sa netezez":"neteza","sa netezeze":"neteza","sa netezezi":"neteza","sa netezim":"netezi","sa neteziti":"netezi","sa neurastenizam":"neurasteniza","sa neurastenizati":"neurasteniza","sa neurastenizez":"neurasteniza","sa neurastenizeze":"neurasteniza","sa neurastenizezi":"neurasteniza","sa neutralizam":"neutraliza","sa neutralizati":"neutraliza","sa neutralizez":"neutraliza","sa neutralizeze":"neutraliza","sa neutralizezi":"neutraliza","sa nevedeasca":"nevedi","sa nevedesc":"nevedi","sa nevedesti":"nevedi","sa nevedim":"nevedi","sa nevediti":"nevedi","sa nevesteasca":"nevesti","sa nevestesc":"nevesti","sa nevestesti":"nevesti","sa nevestim":"nevesti","sa nevestiti":"nevesti","sa nevoiasca":"nevoi","sa nevoiesc":"nevoi","sa nevoiesti":"nevoi","sa nevoim":"nevoi","sa nevoiti":"nevoi","sa nichelam":"nichela","sa nichelati":"nichela","sa nichelez":"nichela","sa nicheleze":"nichela","sa nichelezi":"nichela","sa nicotinizam":"nicotiniza","sa nicotinizati":"nicotiniza","sa nicotinizez":"nicotiniza","sa nicotinizeze":"nicotiniza","sa nicotinizezi":"nicotiniza","sa nimereasca":"nimeri","sa nimeresc":"nimeri","sa nimeresti":"nimeri","sa nimerim":"nimeri","sa nimeriti":"nimeri","sa nimiceasca":"nimici","sa nimicesc":"nimici","sa nimicesti":"nimici","sa nimicim":"nimici","sa nimiciti":"nimici","sa nimicniceasca":"nimicnici","sa nimicnicesc":"nimicnici","sa nimicnicesti":"nimicnici","sa nimicnicim":"nimicnici","sa nimicniciti":"nimicnici","sa ninga":"ninge","sa nitram":"nitra","sa nitrati":"nitra","sa nitrez":"nitra","sa nitreze":"nitra","sa nitrezi":"nitra","sa nitrific":"nitrifica","sa nitrificam":"nitrifica","sa nitrificati":"nitrifica","sa nitrifice":"nitrifica","sa nitrifici":"nitrifica","sa nitruram":"nitrura","sa nitrurati":"nitrura","sa nitrurez":"nitrura","sa nitrureze":"nitrura","sa nitrurezi":"nitrura","sa nituiasca":"nitui","sa nituiesc":"nitui","sa nituiesti":"nitui","sa nituim":"nitui","sa nituiti":"nitui","sa nivelam":"nivela","sa nivelati":"nivela","sa niveleasca":"niveli","sa nivelesc":"niveli","sa nivelesti":"niveli","sa nivelez":"nivela","sa niveleze":"nivela","sa nivelezi":"nivela","sa nivelim":"niveli","sa niveliti":"niveli","sa nivideasca":"nividi","sa nividesc":"nividi","sa nividesti":"nividi","sa nividim":"nividi","sa nividiti":"nividi","sa nizuiasca":"nizui","sa nizuiesc":"nizui","sa nizuiesti":"nizui","sa nizuim":"nizui","sa nizuiti":"nizui","sa nobilam":"nobila","sa nobilati":"nobila","sa nobilez":"nobila","sa nobileze":"nobila","sa nobilezi":"nobila","sa nobilitam":"nobilita","sa nobilitati":"nobilita","sa nobilitez":"nobilita","sa nobiliteze":"nobilita","sa nobilitezi":"nobilita","sa nominalizam":"nominaliza","sa nominalizati":"nominaliza","sa nominalizez":"nominaliza","sa nominalizeze":"nominaliza","sa nominalizezi":"nominaliza","sa nominativizam":"nominativiza","sa nominativizati":"nominativiza","sa nominativizez":"nominativiza","sa nominativizeze":"nominativiza","sa nominativizezi":"nominativiza","sa nomoleasca":"nomoli","sa nomolesc":"nomoli","sa nomolesti":"nomoli","sa nomolim":"nomoli","sa nomoliti":"nomoli","sa nomotemiseasca":"nomotemisi","sa nomotemisesc":"nomotemisi","sa nomotemisesti":"nomotemisi","sa nomotemisim":"nomotemisi","sa nomotemisiti":"nomotemisi","sa noptam":"nopta","sa noptati":"nopta","sa noptez":"nopta","sa nopteze":"nopta","sa noptezi":"nopta","sa normalizam":"normaliza","sa normalizati":"normaliza","sa normalizez":"normaliza","sa normalizeze":"normaliza","sa normalizezi":"normaliza","sa normam":"norma","sa normati":"norma","sa normez":"norma","sa normeze":"norma","sa normezi":"norma","sa noroceasca":"noroci","sa norocesc":"noroci","sa norocesti":"noroci","sa norocim":"noroci","sa norociti":"noroci","sa nostimivis":"nostimivisi","sa nostimivisa":"nostimivisi","sa nostimivisi":"nostimivisi","sa nostimivisim":"nostimivisi","sa nostimivisiti":"nostimivisi","sa nostrific":"nostrifica","sa nostrificam":"nostrifica","sa nostrificati":"nostrifica","sa nostrifice":"nostrifica","sa nostrifici":"nostrifica","sa notam":"nota","sa notati":"nota","sa notez":"nota","sa noteze":"nota","sa notezi":"nota","sa notific":"notifica","sa notificam":"notifica","sa notificati":"notifica","sa notifice":"notifica","sa notifici":"notifica","sa novam":"nova","sa novati":"nova","sa novez":"nova","sa noveze":"nova","sa novezi":"nova","sa nuantam":"nuanța","sa nuantati":"nuanța","sa nuantez":"nuanța","sa nuanteze":"nuanța","sa nuantezi":"nuanța","sa nuclearizam":"nucleariza","sa nuclearizati":"nucleariza","sa nuclearizez":"nucleariza","sa nuclearizeze":"nucleariza","sa nuclearizezi":"nucleariza","sa nulific":"nulifica","sa nulificam":"nulifica","sa nulificati":"nulifica","sa nulifice":"nulifica","sa nulifici":"nulifica","sa numar":"număra","sa numaram":"număra","sa numarati":"număra","sa numeasca":"numi","sa numere":"număra","sa numeri":"număra","sa numerizam":"numeriza","sa numerizati":"numeriza","sa numerizez":"numeriza","sa numerizeze":"numeriza","sa numerizezi":"numeriza","sa numerotam":"numerota","sa numerotati":"numerota","sa numerotez":"numerota","sa numeroteze":"numerota","sa numerotezi":"numerota","sa numesc":"numi","sa numesti":"numi","sa numim":"numi","sa numiti":"numi","sa nunteasca":"nunti","sa nuntesc":"nunti","sa nuntesti":"nunti","sa nuntim":"nunti","sa nuntiti":"nunti","sa nutreasca":"nutri","sa nutresc":"nutri","sa nutresti":"nutri","sa nutric":"nutrica","sa nutricam":"nutrica","sa nutricati":"nutrica","sa nutrice":"nutrica","sa nutrici":"nutrica","sa nutrim":"nutri","sa nutriti":"nutri","sa obarseasca":"obârși","sa obarsesc":"obârși","sa obarsesti":"obârși","sa obarsim":"obârși","sa obarsiti":"obârși","sa obicinuiasca":"obicinui","sa obicinuiesc":"obicinui","sa obicinuiesti":"obicinui","sa obicinuim":"obicinui","sa obicinuiti":"obicinui","sa obiciuiasca":"obiciui","sa obiciuiesc":"obiciui","sa obiciuiesti":"obiciui","sa obiciuim":"obiciui","sa obiciuiti":"obiciui","sa obicneasca":"obicni","sa obicnesc":"obicni","sa obicnesti":"obicni","sa obicnim":"obicni","sa obicniti":"obicni","sa obideasca":"obidi","sa obidesc":"obidi","sa obidesti":"obidi","sa obidim":"obidi","sa obiditi":"obidi","sa obiectam":"obiecta","sa obiectati":"obiecta","sa obiectez":"obiecta","sa obiecteze":"obiecta","sa obiectezi":"obiecta","sa obiectific":"obiectifica","sa obiectificam":"obiectifica","sa obiectificati":"obiectifica","sa obiectifice":"obiectifica","sa obiectifici":"obiectifica","sa obiectivam":"obiectiva","sa obiectivati":"obiectiva","sa obiectivez":"obiectiva","sa obiectiveze":"obiectiva","sa obiectivezi":"obiectiva","sa obiectivizam":"obiectiviza","sa obiectivizati":"obiectiviza","sa obiectivizez":"obiectiviza","sa obiectivizeze":"obiectiviza","sa obiectivizezi":"obiectiviza","sa obijduiasca":"obijdui","sa obijduiesc":"obijdui","sa obijduiesti":"obijdui","sa obijduim":"obijdui","sa obijduiti":"obijdui","sa obisnuiasca":"obișnui","sa obisnuiesc":"obișnui","sa obisnuiesti":"obișnui","sa obisnuim":"obișnui","sa obisnuiti":"obișnui","sa obladuiasca":"oblădui","sa obladuiesc":"oblădui","sa obladuiesti":"oblădui","sa obladuim":"oblădui","sa obladuiti":"oblădui","sa obliceasca":"oblici","sa oblicesc":"oblici","sa oblicesti":"oblici","sa oblicim":"oblici","sa obliciti":"oblici","sa oblig":"obliga","sa obligam":"obliga","sa obligati":"obliga","sa oblige":"obliga","sa obligi":"obliga","sa obliteram":"oblitera","sa obliterati":"oblitera","sa obliterez":"oblitera","sa oblitereze":"oblitera","sa obliterezi":"oblitera","sa oblojeasca":"obloji","sa oblojesc":"obloji","sa oblojesti":"obloji","sa oblojim":"obloji","sa oblojiti":"obloji","sa obloneasca":"obloni","sa oblonesc":"obloni","sa oblonesti":"obloni","sa oblonim":"obloni","sa obloniti":"obloni","sa obnubilam":"obnubila","sa obnubilati":"obnubila","sa obnubilez":"obnubila","sa obnubileze":"obnubila","sa obnubilezi":"obnubila","sa oboare":"oborî","sa obor":"oborî","sa oboram":"oborî","sa oborati":"oborî","sa obori":"oborî","sa oboseasca":"obosi","sa obosesc":"obosi","sa obosesti":"obosi","sa obosim":"obosi","sa obositi":"obosi","sa obraceasca":"obrăci","sa obracesc":"obrăci","sa obracesti":"obrăci","sa obracim":"obrăci","sa obraciti":"obrăci","sa obranteasca":"obrânti","sa obrantesc":"obrânti","sa obrantesti":"obrânti","sa obrantim":"obrânti","sa obrantiti":"obrânti","sa obrazniceasca":"obrăznici","sa obraznicesc":"obrăznici","sa obraznicesti":"obrăznici","sa obraznicim":"obrăznici","sa obrazniciti":"obrăznici","sa obrazuiasca":"obrăzui","sa obrazuiesc":"obrăzui","sa obrazuiesti":"obrăzui","sa obrazuim":"obrăzui","sa obrazuiti":"obrăzui","sa obrezuiasca":"obrezui","sa obrezuiesc":"obrezui","sa obrezuiesti":"obrezui","sa obrezuim":"obrezui","sa obrezuiti":"obrezui","sa obrinteasca":"obrinti","sa obrintesc":"obrinti","sa obrintesti":"obrinti","sa obrintim":"obrinti","sa obrintiti":"obrinti","sa obroceasca":"obroci","sa obrocesc":"obroci","sa obrocesti":"obroci","sa obrocim":"obroci","sa obrociti":"obroci","sa obscuram":"obscura","sa obscurati":"obscura","sa obscurez":"obscura","sa obscureze":"obscura","sa obscurezi":"obscura","sa obscurizam":"obscuriza","sa obscurizati":"obscuriza","sa obscurizez":"obscuriza","sa obscurizeze":"obscuriza","sa obscurizezi":"obscuriza","sa obsedam":"obseda","sa obsedati":"obseda","sa obsedez":"obseda","sa obsedeze":"obseda","sa obsedezi":"obseda","sa observ":"observa","sa observam":"observa","sa observaris":"observarisi","sa observarisa":"observarisi","sa observarisi":"observarisi","sa observarisim":"observarisi","sa observarisiti":"observarisi","sa observati":"observa","sa observe":"observa","sa observi":"observa","sa obsteasca":"obști","sa obstesc":"obști","sa obstesti":"obști","sa obstim":"obști","sa obstinam":"obstina","sa obstinati":"obstina","sa obstinez":"obstina","sa obstineze":"obstina","sa obstinezi":"obstina","sa obstiti":"obști","sa obstruam":"obstrua","sa obstruati":"obstrua","sa obstructionam":"obstrucționa","sa obstructionati":"obstrucționa","sa obstructionez":"obstrucționa","sa obstructioneze":"obstrucționa","sa obstructionezi":"obstrucționa","sa obstruez":"obstrua","sa obstrueze":"obstrua","sa obstruezi":"obstrua","sa obtii":"obține","sa obtin":"obține","sa obtina":"obține","sa obtinem":"obține","sa obtineti":"obține","sa obturam":"obtura","sa obturati":"obtura","sa obturez":"obtura","sa obtureze":"obtura","sa obturezi":"obtura","sa ocacai":"ocăcăi","sa ocacaie":"ocăcăi","sa ocacaim":"ocăcăi","sa ocacaiti":"ocăcăi","sa ocaram":"ocărî","sa ocarasc":"ocărî","sa ocarasca":"ocărî","sa ocarasti":"ocărî","sa ocarati":"ocărî","sa ocareasca":"ocări","sa ocaresc":"ocări","sa ocaresti":"ocări","sa ocarim":"ocări","sa ocariti":"ocări","sa ocarm":"ocârmi","sa ocarma":"ocârmi","sa ocarmi":"ocârmi","sa ocarmim":"ocârmi","sa ocarmiti":"ocârmi","sa ocarmuiasca":"ocârmui","sa ocarmuiesc":"ocârmui","sa ocarmuiesti":"ocârmui","sa ocarmuim":"ocârmui","sa ocarmuiti":"ocârmui","sa ocazionam":"ocaziona","sa ocazionati":"ocaziona","sa ocazionez":"ocaziona","sa ocazioneze":"ocaziona","sa ocazionezi":"ocaziona","sa occidentalizam":"occidentaliza","sa occidentalizati":"occidentaliza","sa occidentalizez":"occidentaliza","sa occidentalizeze":"occidentaliza","sa occidentalizezi":"occidentaliza","sa ocheasca":"ochi","sa ochesc":"ochi","sa ochesti":"ochi","sa ochim":"ochi","sa ochiti":"ochi","sa ocinam":"ocina","sa ocinati":"ocina","sa ocinez":"ocina","sa ocineze":"ocina","sa ocinezi":"ocina","sa ocneasca":"ocni","sa ocnesc":"ocni","sa ocnesti":"ocni","sa ocnim":"ocni","sa ocniti":"ocni","sa ocoleasca":"ocoli","sa ocolesc":"ocoli","sa ocolesti":"ocoli","sa ocolim":"ocoli","sa ocoliti":"ocoli","sa ocropeasca":"ocropi","sa ocropesc":"ocropi","sa ocropesti":"ocropi","sa ocropim":"ocropi","sa ocropiti":"ocropi","sa ocroteasca":"ocroti","sa ocrotesc":"ocroti","sa ocrotesti":"ocroti","sa ocrotim":"ocroti","sa ocrotiti":"ocroti","sa octroi":"octroia","sa octroiati":"octroia","sa octroie":"octroia","sa octroiem":"octroia","sa ocultam":"oculta","sa ocultati":"oculta","sa ocultez":"oculta","sa oculteze":"oculta","sa ocultezi":"oculta","sa ocup":"ocupa","sa ocupam":"ocupa","sa ocupariseasca":"ocuparisi","sa ocuparisesc":"ocuparisi","sa ocuparisesti":"ocuparisi","sa ocuparisim":"ocuparisi","sa ocuparisiti":"ocuparisi","sa ocupati":"ocupa","sa ocupe":"ocupa","sa ocupi":"ocupa","sa odgon":"odgoni","sa odgona":"odgoni","sa odgoni":"odgoni","sa odgonim":"odgoni","sa odgoniti":"odgoni","sa odihneasca":"odihni","sa odihnesc":"odihni","sa odihnesti":"odihni","sa odihnim":"odihni","sa odihniti":"odihni","sa odineasca":"odini","sa odinesc":"odini","sa odinesti":"odini","sa odinim":"odini","sa odiniti":"odini","sa odoram":"odora","sa odorati":"odora","sa odorez":"odora","sa odoreze":"odora","sa odorezi":"odora","sa odorizam":"odoriza","sa odorizati":"odoriza","sa odorizez":"odoriza","sa odorizeze":"odoriza","sa odorizezi":"odoriza","sa odrasleasca":"odrăsli","sa odraslesc":"odrăsli","sa odraslesti":"odrăsli","sa odraslim":"odrăsli","sa odrasliti":"odrăsli","sa ofensam":"ofensa","sa ofensati":"ofensa","sa ofensez":"ofensa","sa ofenseze":"ofensa","sa ofensezi":"ofensa","sa ofer":"oferi","sa ofera":"oferi","sa oferi":"oferi","sa oferim":"oferi","sa oferiti":"oferi","sa ofertam":"oferta","sa ofertati":"oferta","sa ofertez":"oferta","sa oferteze":"oferta","sa ofertezi":"oferta","sa oficializam":"oficializa","sa oficializati":"oficializa","sa oficializez":"oficializa","sa oficializeze":"oficializa","sa oficializezi":"oficializa","sa oficiati":"oficia","sa oficiem":"oficia","sa oficiez":"oficia","sa oficieze":"oficia","sa oficiezi":"oficia","sa ofileasca":"ofili","sa ofilesc":"ofili","sa ofilesti":"ofili","sa ofilim":"ofili","sa ofiliti":"ofili","sa oftam":"ofta","sa oftati":"ofta","sa oftez":"ofta","sa ofteze":"ofta","sa oftezi":"ofta","sa oftic":"oftica","sa ofticam":"oftica","sa ofticati":"oftica","sa oftice":"oftica","sa oftici":"oftica","sa ofuscam":"ofusca","sa ofuscati":"ofusca","sa ofuschez":"ofusca","sa ofuscheze":"ofusca","sa ofuschezi":"ofusca","sa oglindam":"oglinda","sa oglindati":"oglinda","sa oglindeasca":"oglindi","sa oglindesc":"oglindi","sa oglindesti":"oglindi","sa oglindez":"oglinda","sa oglindeze":"oglinda","sa oglindezi":"oglinda","sa oglindim":"oglindi","sa oglinditi":"oglindi","sa ogoaie":"ogoia","sa ogodeasca":"ogodi","sa ogodesc":"ogodi","sa ogodesti":"ogodi","sa ogodim":"ogodi","sa ogoditi":"ogodi","sa ogoi":"ogoia","sa ogoiati":"ogoia","sa ogoiem":"ogoia","sa ogoram":"ogorî","sa ogorasc":"ogorî","sa ogorasca":"ogorî","sa ogorasti":"ogorî","sa ogorati":"ogorî","sa ojivoi":"ojivoi","sa ojivoie":"ojivoi","sa ojivoim":"ojivoi","sa ojivoiti":"ojivoi","sa olacai":"olăcăi","sa olacaie":"olăcăi","sa olacaim":"olăcăi","sa olacaiti":"olăcăi","sa olecai":"olecăi","sa olecaie":"olecăi","sa olecaim":"olecăi","sa olecaiti":"olecăi","sa oleiati":"oleia","sa oleiem":"oleia","sa oleiez":"oleia","sa oleieze":"oleia","sa oleiezi":"oleia","sa olicai":"olicăi","sa olicaie":"olicăi","sa olicaim":"olicăi","sa olicaiti":"olicăi","sa ologeasca":"ologi","sa ologesc":"ologi","sa ologesti":"ologi","sa ologim":"ologi","sa ologiti":"ologi","sa omagiati":"omagia","sa omagiem":"omagia","sa omagiez":"omagia","sa omagieze":"omagia","sa omagiezi":"omagia","sa omeneasca":"omeni","sa omenesc":"omeni","sa omenesti":"omeni","sa omenim":"omeni","sa omeniti":"omeni","sa omesteasca":"omesti","sa omestesc":"omesti","sa omestesti":"omesti","sa omestim":"omesti","sa omestiti":"omesti","sa omit":"omite","sa omita":"omite","sa omitem":"omite","sa omiteti":"omite","sa omiti":"omite","sa omoare":"omorî","sa omogeneizam":"omogeneiza","sa omogeneizati":"omogeneiza","sa omogeneizez":"omogeneiza","sa omogeneizeze":"omogeneiza","sa omogeneizezi":"omogeneiza","sa omogenizam":"omogeniza","sa omogenizati":"omogeniza","sa omogenizez":"omogeniza","sa omogenizeze":"omogeniza","sa omogenizezi":"omogeniza","sa omologam":"omologa","sa omologati":"omologa","sa omologhez":"omologa","sa omologheze":"omologa","sa omologhezi":"omologa","sa omor":"omorî","sa omoram":"omorî","sa omorati":"omorî","sa omori":"omorî","sa omrazeasca":"omrăzi","sa omrazesc":"omrăzi","sa omrazesti":"omrăzi","sa omrazim":"omrăzi","sa omraziti":"omrăzi","sa ondulam":"ondula","sa ondulati":"ondula","sa ondulez":"ondula","sa onduleze":"ondula","sa ondulezi":"ondula","sa onoram":"onora","sa onorati":"onora","sa onorez":"onora","sa onoreze":"onora","sa onorezi":"onora","sa opaceasca":"opăci","sa opacesc":"opăci","sa opacesti":"opăci","sa opacifiati":"opacifia","sa opacifiem":"opacifia","sa opacifiez":"opacifia","sa opacifieze":"opacifia","sa opacifiezi":"opacifia","sa opacim":"opăci","sa opaciti":"opăci","sa opacizam":"opaciza","sa opacizati":"opaciza","sa opacizez":"opaciza","sa opacizeze":"opaciza","sa opacizezi":"opaciza","sa opalizam":"opaliza","sa opalizati":"opaliza","sa opalizez":"opaliza","sa opalizeze":"opaliza","sa opalizezi":"opaliza","sa opareasca":"opări","sa oparesc":"opări","sa oparesti":"opări","sa oparim":"opări","sa opariti":"opări","sa operam":"opera","sa operati":"opera","sa operez":"opera","sa opereze":"opera","sa operezi":"opera","sa opinam":"opina","sa opinati":"opina","sa opinez":"opina","sa opineze":"opina","sa opinezi":"opina","sa opinteasca":"opinti","sa opintesc":"opinti","sa opintesti":"opinti","sa opintim":"opinti","sa opintiti":"opinti","sa oploseasca":"oploși","sa oplosesc":"oploși","sa oplosesti":"oploși","sa oplosim":"oploși","sa oplositi":"oploși","sa opreasca":"opri","sa opresc":"opri","sa opresti":"opri","sa oprim":["să oprim","opri","să oprim","oprima"],"sa oprimam":"oprima","sa oprimati":"oprima","sa oprime":"oprima","sa oprimi":"oprima","sa opriti":"opri","sa optam":"opta","sa optati":"opta","sa optez":"opta","sa opteze":"opta","sa optezi":"opta","sa optimizam":"optimiza","sa optimizati":"optimiza","sa optimizez":"optimiza","sa optimizeze":"optimiza","sa optimizezi":"optimiza","sa oracai":"orăcăi","sa oracaie":"orăcăi","sa oracaim":"orăcăi","sa oracaiti":"orăcăi","sa oranduiasca":"orândui","sa oranduiesc":"orândui","sa oranduiesti":"orândui","sa oranduim":"orândui","sa oranduiti":"orândui","sa orasenizam":"orășeniza","sa orasenizati":"orășeniza","sa orasenizez":"orășeniza","sa orasenizeze":"orășeniza","sa orasenizezi":"orășeniza","sa orbacai":"orbăcăi","sa orbacaie":"orbăcăi","sa orbacaim":"orbăcăi","sa orbacaiti":"orbăcăi","sa orbeasca":"orbi","sa orbec":"orbeca","sa orbecaiasca":"orbecăi","sa orbecaiesc":"orbecăi","sa orbecaiesti":"orbecăi","sa orbecaim":"orbecăi","sa orbecaiti":"orbecăi","sa orbecam":"orbeca","sa orbecati":"orbeca","sa orbece":"orbeca","sa orbeci":"orbeca","sa orbesc":"orbi","sa orbesti":"orbi","sa orbim":"orbi","sa orbiti":"orbi","sa orchestram":"orchestra","sa orchestrati":"orchestra","sa orchestrez":"orchestra","sa orchestreze":"orchestra","sa orchestrezi":"orchestra","sa ordinam":"ordina","sa ordinati":"ordina","sa ordinez":"ordina","sa ordineze":"ordina","sa ordinezi":"ordina","sa ordon":"ordona","sa ordonam":"ordona","sa ordonantam":"ordonanța","sa ordonantati":"ordonanța","sa ordonantez":"ordonanța","sa ordonanteze":"ordonanța","sa ordonantezi":"ordonanța","sa ordonati":"ordona","sa ordone":"ordona","sa ordonez":"ordona","sa ordoneze":"ordona","sa ordonezi":"ordona","sa ordoni":"ordona","sa organiseasca":"organisi","sa organisesc":"organisi","sa organisesti":"organisi","sa organisim":"organisi","sa organisiti":"organisi","sa organizam":"organiza","sa organizati":"organiza","sa organizez":"organiza","sa organizeze":"organiza","sa organizezi":"organiza","sa orientalizam":"orientaliza","sa orientalizati":"orientaliza","sa orientalizez":"orientaliza","sa orientalizeze":"orientaliza","sa orientalizezi":"orientaliza","sa orientam":"orienta","sa orientati":"orienta","sa orientez":"orienta","sa orienteze":"orienta","sa orientezi":"orienta","sa oripilam":"oripila","sa oripilati":"oripila","sa oripilez":"oripila","sa oripileze":"oripila","sa oripilezi":"oripila","sa orizontalizam":"orizontaliza","sa orizontalizati":"orizontaliza","sa orizontalizez":"orizontaliza","sa orizontalizeze":"orizontaliza","sa orizontalizezi":"orizontaliza","sa ornam":"orna","sa ornamentam":"ornamenta","sa ornamentati":"ornamenta","sa ornamentez":"ornamenta","sa ornamenteze":"ornamenta","sa ornamentezi":"ornamenta","sa ornati":"orna","sa ornez":"orna","sa orneze":"orna","sa ornezi":"orna","sa oropseasca":"oropsi","sa oropsesc":"oropsi","sa oropsesti":"oropsi","sa oropsim":"oropsi","sa oropsiti":"oropsi","sa ortaceasca":"ortăci","sa ortacesc":"ortăci","sa ortacesti":"ortăci","sa ortacim":"ortăci","sa ortaciti":"ortăci","sa ortografiati":"ortografia","sa ortografiem":"ortografia","sa ortografiez":"ortografia","sa ortografieze":"ortografia","sa ortografiezi":"ortografia","sa osambra":"osâmbri","sa osambri":"osâmbri","sa osambrim":"osâmbri","sa osambriti":"osâmbri","sa osambru":"osâmbri","sa osandeasca":"osândi","sa osandesc":"osândi","sa osandesti":"osândi","sa osandim":"osândi","sa osanditi":"osândi","sa osardniceasca":"osârdnici","sa osardnicesc":"osârdnici","sa osardnicesti":"osârdnici","sa osardnicim":"osârdnici","sa osardniciti":"osârdnici","sa oscilam":"oscila","sa oscilati":"oscila","sa oscilez":"oscila","sa oscileze":"oscila","sa oscilezi":"oscila","sa osebeasca":"osebi","sa osebesc":"osebi","sa osebesti":"osebi","sa osebim":"osebi","sa osebiti":"osebi","sa osfestuiasca":"osfeștui","sa osfestuiesc":"osfeștui","sa osfestuiesti":"osfeștui","sa osfestuim":"osfeștui","sa osfestuiti":"osfeștui","sa osfinteasca":"osfinti","sa osfintesc":"osfinti","sa osfintesti":"osfinti","sa osfintim":"osfinti","sa osfintiti":"osfinti","sa osific":"osifica","sa osificam":"osifica","sa osificati":"osifica","sa osifice":"osifica","sa osifici":"osifica","sa ospatam":"ospăta","sa ospatati":"ospăta","sa ospatez":"ospăta","sa ospateze":"ospăta","sa ospatezi":"ospăta","sa ospetam":"ospeta","sa ospetati":"ospeta","sa ospetez":"ospeta","sa ospeteze":"ospeta","sa ospetezi":"ospeta","sa ospitam":"ospita","sa ospitati":"ospita","sa ospitez":"ospita","sa ospiteze":"ospita","sa ospitezi":"ospita","sa ostampeasca":"ostâmpi","sa ostampesc":"ostâmpi","sa ostampesti":"ostâmpi","sa ostampim":"ostâmpi","sa ostampiti":"ostâmpi","sa osteasca":"oști","sa osteneasca":"osteni","sa ostenesc":"osteni","sa ostenesti":"osteni","sa ostenim":"osteni","sa osteniti":"osteni","sa ostesc":"oști","sa ostesti":"oști","sa ostim":"oști","sa ostiti":"oști","sa ostoiasca":"ostoi","sa ostoiati":"ostoia","sa ostoiem":"ostoia","sa ostoiesc":"ostoi","sa ostoiesti":"ostoi","sa ostoiez":"ostoia","sa ostoieze":"ostoia","sa ostoiezi":"ostoia","sa ostoim":"ostoi","sa ostoiti":"ostoi","sa ostracizam":"ostraciza","sa ostracizati":"ostraciza","sa ostracizez":"ostraciza","sa ostracizeze":"ostraciza","sa ostracizezi":"ostraciza","sa osveteasca":"osveti","sa osvetesc":"osveti","sa osvetesti":"osveti","sa osvetim":"osveti","sa osvetiti":"osveti","sa otanjeasca":"otânji","sa otanjesc":"otânji","sa otanjesti":"otânji","sa otanjim":"otânji","sa otanjiti":"otânji","sa otaram":"oțărî","sa otarasc":"oțărî","sa otarasca":"oțărî","sa otarasti":"oțărî","sa otarati":"oțărî","sa otareasca":"oțări","sa otaresc":"oțări","sa otaresti":"oțări","sa otarim":"oțări","sa otariti":"oțări","sa otcarmuiasca":"otcârmui","sa otcarmuiesc":"otcârmui","sa otcarmuiesti":"otcârmui","sa otcarmuim":"otcârmui","sa otcarmuiti":"otcârmui","sa oteleasca":"oțeli","sa otelesc":"oțeli","sa otelesti":"oțeli","sa otelim":"oțeli","sa oteliti":"oțeli","sa oteram":"oțerî","sa oterasc":"oțerî","sa oterasca":"oțerî","sa oterasti":"oțerî","sa oterati":"oțerî","sa otereasca":"oțeri","sa oteresc":"oțeri","sa oteresti":"oțeri","sa oterim":"oțeri","sa oteriti":"oțeri","sa oteteasca":["să oțetească","oțeti","să oțețească","oțeți"],"sa otetesc":["să oțetesc","oțeti","să oțețesc","oțeți"],"sa otetesti":["să oțetești","oțeti","să oțețești","oțeți"],"sa otetim":["să oțetim","oțeti","să oțețim","oțeți"],"sa otetiti":["să oțetiți","oțeti","să oțețiți","oțeți"],"sa otraveasca":"otrăvi","sa otravesc":"otrăvi","sa otravesti":"otrăvi","sa otravim":"otrăvi","sa otraviti":"otrăvi","sa oua":"oua","sa ovaliz":"ovaliza","sa ovalizam":"ovaliza","sa ovalizati":"ovaliza","sa ovalize":"ovaliza","sa ovalizi":"ovaliza","sa ovationam":"ovaționa","sa ovationati":"ovaționa","sa ovationez":"ovaționa","sa ovationeze":"ovaționa","sa ovationezi":"ovaționa","sa ovileasca":"ovili","sa ovilesc":"ovili","sa ovilesti":"ovili","sa ovilim":"ovili","sa oviliti":"ovili","sa oxidam":"oxida","sa oxidati":"oxida","sa oxidez":"oxida","sa oxideze":"oxida","sa oxidezi":"oxida","sa oxigenam":"oxigena","sa oxigenati":"oxigena","sa oxigenez":"oxigena","sa oxigeneze":"oxigena","sa oxigenezi":"oxigena","sa ozonam":"ozona","sa ozonati":"ozona","sa ozonez":"ozona","sa ozoneze":"ozona","sa ozonezi":"ozona","sa ozonific":"ozonifica","sa ozonificam":"ozonifica","sa ozonificati":"ozonifica","sa ozonifice":"ozonifica","sa ozonifici":"ozonifica","sa ozonizam":"ozoniza","sa ozonizati":"ozoniza","sa ozonizez":"ozoniza","sa ozonizeze":"ozoniza","sa ozonizezi":"ozoniza","sa rabatam":"rabata","sa rabatati":"rabata","sa rabatez":"rabata","sa rabateze":"rabata","sa rabatezi":"rabata","sa rabd":"răbda","sa rabdam":"răbda","sa rabdati":"răbda","sa rabde":"răbda","sa rablageasca":["să rablagească","rablagi","să răblăgească","răblăgi"],"sa rablagesc":["să rablagesc","rablagi","să răblăgesc","răblăgi"],"sa rablagesti":["să rablagești","rablagi","să răblăgești","răblăgi"],"sa rablagim":["să rablagim","rablagi","să răblăgim","răblăgi"],"sa rablagiti":["să rablagiți","rablagi","să răblăgiți","răblăgi"],"sa rabojeasca":"răboji","sa rabojesc":"răboji","sa rabojesti":"răboji","sa rabojim":"răboji","sa rabojiti":"răboji","sa rabotam":"rabota","sa rabotati":"rabota","sa rabotez":"rabota","sa raboteze":"rabota","sa rabotezi":"rabota","sa rabufneasca":"răbufni","sa rabufnesc":"răbufni","sa rabufnesti":"răbufni","sa rabufnim":"răbufni","sa rabufniti":"răbufni","sa rabzi":"răbda","sa racaduiasca":"răcădui","sa racaduiesc":"răcădui","sa racaduiesti":"răcădui","sa racaduim":"răcădui","sa racaduiti":"răcădui","sa racai":"râcâi","sa racaie":"râcâi","sa racaim":"râcâi","sa racaiti":"râcâi","sa racan":"răcăni","sa racana":"răcăni","sa racani":"răcăni","sa racanim":"răcăni","sa racaniti":"răcăni","sa raceasca":"răci","sa racesc":"răci","sa racesti":"răci","sa racim":"răci","sa raciti":"răci","sa raclam":"racla","sa raclati":"racla","sa raclez":"racla","sa racleze":"racla","sa raclezi":"racla","sa racneasca":"răcni","sa racnesc":"răcni","sa racnesti":"răcni","sa racnim":"răcni","sa racniti":"răcni","sa racolam":"racola","sa racolati":"racola","sa racolez":"racola","sa racoleze":"racola","sa racolezi":"racola","sa racont":"raconta","sa racontam":"raconta","sa racontati":"raconta","sa raconte":"raconta","sa raconti":"raconta","sa racordam":"racorda","sa racordati":"racorda","sa racordez":"racorda","sa racordeze":"racorda","sa racordezi":"racorda","sa racoreasca":"răcori","sa racoresc":"răcori","sa racoresti":"răcori","sa racorim":"răcori","sa racoriti":"răcori","sa rad":["să rad","rade","să râd","râde"],"sa rada":["să radă","rade","să râdă","râde"],"sa radem":["să radem","rade","să râdem","râde"],"sa radeti":["să radeți","rade","să râdeți","râde"],"sa radic":"rădica","sa radicalizam":"radicaliza","sa radicalizati":"radicaliza","sa radicalizez":"radicaliza","sa radicalizeze":"radicaliza","sa radicalizezi":"radicaliza","sa radicam":"rădica","sa radicati":"rădica","sa radice":"rădica","sa radici":"rădica","sa radiobalizam":"radiobaliza","sa radiobalizati":"radiobaliza","sa radiobalizez":"radiobaliza","sa radiobalizeze":"radiobaliza","sa radiobalizezi":"radiobaliza","sa radiodifuzam":"radiodifuza","sa radiodifuzati":"radiodifuza","sa radiodifuzez":"radiodifuza","sa radiodifuzeze":"radiodifuza","sa radiodifuzezi":"radiodifuza","sa radioghidam":"radioghida","sa radioghidati":"radioghida","sa radioghidez":"radioghida","sa radioghideze":"radioghida","sa radioghidezi":"radioghida","sa radiografiati":"radiografia","sa radiografiem":"radiografia","sa radiografiez":"radiografia","sa radiografieze":"radiografia","sa radiografiezi":"radiografia","sa radiotelegrafiati":"radiotelegrafia","sa radiotelegrafiem":"radiotelegrafia","sa radiotelegrafiez":"radiotelegrafia","sa radiotelegrafieze":"radiotelegrafia","sa radiotelegrafiezi":"radiotelegrafia","sa rafinam":"rafina","sa rafinati":"rafina","sa rafinez":"rafina","sa rafineze":"rafina","sa rafinezi":"rafina","sa rafistolam":"rafistola","sa rafistolati":"rafistola","sa rafistolez":"rafistola","sa rafistoleze":"rafistola","sa rafistolezi":"rafistola","sa rafuiasca":"răfui","sa rafuiesc":"răfui","sa rafuiesti":"răfui","sa rafuim":"răfui","sa rafuiti":"răfui","sa rag":["să rag","rage","să răg","răgi"],"sa raga":["să ragă","rage","să răgă","răgi"],"sa ragem":"rage","sa rageti":"rage","sa ragi":["să ragi","rage","să răgi","răgi"],"sa ragim":"răgi","sa ragiti":"răgi","sa ragneasca":"răgni","sa ragnesc":"răgni","sa ragnesti":"răgni","sa ragnim":"răgni","sa ragniti":"răgni","sa raguseasca":"răguși","sa ragusesc":"răguși","sa ragusesti":"răguși","sa ragusim":"răguși","sa ragusiti":"răguși","sa raionam":"raiona","sa raionati":"raiona","sa raionez":"raiona","sa raioneze":"raiona","sa raionezi":"raiona","sa raliati":"ralia","sa raliem":"ralia","sa raliez":"ralia","sa ralieze":"ralia","sa raliezi":"ralia","sa ram":"râma","sa ramai":["să rămâi","rămâne","să rămâi","rămânea"],"sa ramam":["să ramăm","rama","să râmăm","râma"],"sa raman":["să rămân","rămâne","să rămân","rămânea"],"sa ramana":["să rămână","rămâne","să rămână","rămânea"],"sa ramanem":["să rămânem","rămâne","să rămânem","rămânea"],"sa ramaneti":["să rămâneți","rămâne","să rămâneți","rămânea"],"sa ramaseasca":"rămăși","sa ramasesc":"rămăși","sa ramasesti":"rămăși","sa ramasim":"rămăși","sa ramasiti":"rămăși","sa ramati":["să ramați","rama","să râmați","râma"],"sa rambleiati":"rambleia","sa rambleiem":"rambleia","sa rambleiez":"rambleia","sa rambleieze":"rambleia","sa rambleiezi":"rambleia","sa rambursam":"rambursa","sa rambursati":"rambursa","sa rambursez":"rambursa","sa ramburseze":"rambursa","sa rambursezi":"rambursa","sa rame":"râma","sa ramez":"rama","sa rameze":"rama","sa ramezi":"rama","sa rami":"râma","sa ramific":"ramifica","sa ramificam":"ramifica","sa ramificati":"ramifica","sa ramifice":"ramifica","sa ramifici":"ramifica","sa ramneasca":"râmni","sa ramnesc":"râmni","sa ramnesti":"râmni","sa ramnim":"râmni","sa ramniti":"râmni","sa ramoleasca":"ramoli","sa ramolesc":"ramoli","sa ramolesti":"ramoli","sa ramolim":"ramoli","sa ramoliti":"ramoli","sa ramplasam":"ramplasa","sa ramplasati":"ramplasa","sa ramplasez":"ramplasa","sa ramplaseze":"ramplasa","sa ramplasezi":"ramplasa","sa ramur":"rămuri","sa ramura":"rămuri","sa ramuri":"rămuri","sa ramurim":"rămuri","sa ramuriti":"rămuri","sa rancez":"râncezi","sa ranceza":"râncezi","sa rancezi":"râncezi","sa rancezim":"râncezi","sa ranceziti":"râncezi","sa ranchez":"râncheza","sa ranchezam":"râncheza","sa ranchezati":"râncheza","sa rancheze":"râncheza","sa ranchezi":"râncheza","sa randomizam":"randomiza","sa randomizati":"randomiza","sa randomizez":"randomiza","sa randomizeze":"randomiza","sa randomizezi":"randomiza","sa randuiasca":"rândui","sa randuiesc":"rândui","sa randuiesti":"rândui","sa randuim":"rândui","sa randuiti":"rândui","sa raneasca":["să rânească","râni","să rănească","răni"],"sa ranesc":["să rânesc","râni","să rănesc","răni"],"sa ranesti":["să rânești","râni","să rănești","răni"],"sa ranforsam":"ranforsa","sa ranforsati":"ranforsa","sa ranforsez":"ranforsa","sa ranforseze":"ranforsa","sa ranforsezi":"ranforsa","sa ranim":["să rânim","râni","să rănim","răni"],"sa raniti":["să râniți","râni","să răniți","răni"],"sa ranjeasca":"rânji","sa ranjesc":"rânji","sa ranjesti":"rânji","sa ranjim":"rânji","sa ranjiti":"rânji","sa ranversam":"ranversa","sa ranversati":"ranversa","sa ranversez":"ranversa","sa ranverseze":"ranversa","sa ranversezi":"ranversa","sa rapai":"răpăi","sa rapaie":"răpăi","sa rapaim":"răpăi","sa rapaiti":"răpăi","sa rapeasca":"răpi","sa rapeg":"răpega","sa rapegam":"răpega","sa rapegati":"răpega","sa rapege":"răpega","sa rapegi":"răpega","sa rapesc":"răpi","sa rapesti":"răpi","sa rapim":"răpi","sa rapiti":"răpi","sa raportam":"raporta","sa raportati":"raporta","sa raportez":"raporta","sa raporteze":"raporta","sa raportezi":"raporta","sa raportui":"raportui","sa raportuie":"raportui","sa raportuim":"raportui","sa raportuiti":"raportui","sa raposam":"răposa","sa raposati":"răposa","sa raposez":"răposa","sa raposeze":"răposa","sa raposezi":"răposa","sa rapsteasca":"răpști","sa rapstesc":"răpști","sa rapstesti":"răpști","sa rapstim":"răpști","sa rapstiti":"răpști","sa rapui":"răpune","sa rapun":"răpune","sa rapuna":"răpune","sa rapunem":"răpune","sa rapuneti":"răpune","sa rareasca":"rări","sa rarefiati":"rarefia","sa rarefiem":"rarefia","sa rarefiez":"rarefia","sa rarefieze":"rarefia","sa rarefiezi":"rarefia","sa raresc":"rări","sa raresti":"rări","sa rarific":"rarifica","sa rarificam":"rarifica","sa rarificati":"rarifica","sa rarifice":"rarifica","sa rarifici":"rarifica","sa rarim":"rări","sa rariti":"rări","sa rasadeasca":"răsădi","sa rasadesc":"răsădi","sa rasadesti":"răsădi","sa rasadim":"răsădi","sa rasaditi":"răsădi","sa rasajduiasca":"răsăjdui","sa rasajduiesc":"răsăjdui","sa rasajduiesti":"răsăjdui","sa rasajduim":"răsăjdui","sa rasajduiti":"răsăjdui","sa rasar":"răsări","sa rasara":"răsări","sa rasari":"răsări","sa rasarim":"răsări","sa rasariti":"răsări","sa rascacar":"răscăcăra","sa rascacaram":"răscăcăra","sa rascacarati":"răscăcăra","sa rascacare":"răscăcăra","sa rascacari":"răscăcăra","sa rascheasca":"răschi","sa raschesc":"răschi","sa raschesti":"răschi","sa raschetam":"rașcheta","sa raschetati":"rașcheta","sa raschetez":"rașcheta","sa rascheteze":"rașcheta","sa raschetezi":"rașcheta","sa raschiati":"rășchia","sa raschiem":"rășchia","sa raschiez":"rășchia","sa raschieze":"rășchia","sa raschiezi":"rășchia","sa raschim":"răschi","sa raschiram":"răschira","sa raschirati":"răschira","sa raschirez":"răschira","sa raschireze":"răschira","sa raschirezi":"răschira","sa raschiti":"răschi","sa rasciteasca":"răsciti","sa rascitesc":"răsciti","sa rascitesti":"răsciti","sa rascitim":"răsciti","sa rascititi":"răsciti","sa rascoaca":"răscoace","sa rascoacem":"răscoace","sa rascoaceti":"răscoace","sa rascoale":"răscula","sa rascoc":"răscoace","sa rascoci":"răscoace","sa rascol":"răscula","sa rascoleasca":"răscoli","sa rascolesc":"răscoli","sa rascolesti":"răscoli","sa rascoli":"răscula","sa rascolim":"răscoli","sa rascoliti":"răscoli","sa rascracan":"răscrăcăna","sa rascracanam":"răscrăcăna","sa rascracanati":"răscrăcăna","sa rascracane":"răscrăcăna","sa rascracani":"răscrăcăna","sa rasculam":"răscula","sa rasculati":"răscula","sa rascumpar":"răscumpăra","sa rascumparam":"răscumpăra","sa rascumparati":"răscumpăra","sa rascumpare":"răscumpăra","sa rascumpari":"răscumpăra","sa rasfat":"răsfăța","sa rasfatam":"răsfăța","sa rasfatati":"răsfăța","sa rasfete":"răsfăța","sa rasfeti":"răsfăța","sa rasfiarba":"răsfierbe","sa rasfierb":"răsfierbe","sa rasfierbem":"răsfierbe","sa rasfierbeti":"răsfierbe","sa rasfierbi":"răsfierbe","sa rasfir":"răsfira","sa rasfiram":"răsfira","sa rasfirati":"răsfira","sa rasfire":"răsfira","sa rasfiri":"răsfira","sa rasfoiasca":"răsfoi","sa rasfoiesc":"răsfoi","sa rasfoiesti":"răsfoi","sa rasfoim":"răsfoi","sa rasfoiti":"răsfoi","sa rasfrang":"răsfrânge","sa rasfranga":"răsfrânge","sa rasfrangem":"răsfrânge","sa rasfrangeti":"răsfrânge","sa rasfrangi":"răsfrânge","sa rasneasca":"râșni","sa rasnesc":"râșni","sa rasnesti":"râșni","sa rasnim":"râșni","sa rasniti":"râșni","sa rasoleasca":"rasoli","sa rasolesc":"rasoli","sa rasolesti":"rasoli","sa rasolim":"rasoli","sa rasoliti":"rasoli","sa raspandeasca":"răspândi","sa raspandesc":"răspândi","sa raspandesti":"răspândi","sa raspandim":"răspândi","sa raspanditi":"răspândi","sa raspic":"răspica","sa raspicam":"răspica","sa raspicati":"răspica","sa raspice":"răspica","sa raspici":"răspica","sa rasplateasca":"răsplăti","sa rasplatesc":"răsplăti","sa rasplatesti":"răsplăti","sa rasplatim":"răsplăti","sa rasplatiti":"răsplăti","sa raspopeasca":"răspopi","sa raspopesc":"răspopi","sa raspopesti":"răspopi","sa raspopim":"răspopi","sa raspopiti":"răspopi","sa raspund":"răspunde","sa raspunda":"răspunde","sa raspundem":"răspunde","sa raspundeti":"răspunde","sa raspunzi":"răspunde","sa rasst":"răsști","sa rassta":"răsști","sa rassti":"răsști","sa rasstim":"răsști","sa rasstiti":"răsști","sa rastalmaceasca":"răstălmăci","sa rastalmacesc":"răstălmăci","sa rastalmacesti":"răstălmăci","sa rastalmacim":"răstălmăci","sa rastalmaciti":"răstălmăci","sa rasteasca":"răsti","sa rastesc":"răsti","sa rastesti":"răsti","sa rastigneasca":"răstigni","sa rastignesc":"răstigni","sa rastignesti":"răstigni","sa rastignim":"răstigni","sa rastigniti":"răstigni","sa rastim":"răsti","sa rastiti":"răsti","sa rastoarne":"răsturna","sa rastoceasca":"răstoci","sa rastocesc":"răstoci","sa rastocesti":"răstoci","sa rastocim":"răstoci","sa rastociti":"răstoci","sa rastorn":"răsturna","sa rastorni":"răsturna","sa rasturnam":"răsturna","sa rasturnati":"răsturna","sa rasuceasca":"răsuci","sa rasucesc":"răsuci","sa rasucesti":"răsuci","sa rasucim":"răsuci","sa rasuciti":"răsuci","sa rasuflam":"răsufla","sa rasuflati":"răsufla","sa rasufle":"răsufla","sa rasufli":"răsufla","sa rasuflu":"răsufla","sa rasui":"râsui","sa rasuie":"râsui","sa rasuim":"râsui","sa rasuiti":"râsui","sa rasun":"răsuna","sa rasunam":"răsuna","sa rasunati":"răsuna","sa rasune":"răsuna","sa rasuni":"răsuna","sa rasvareasca":"răsvări","sa rasvaresc":"răsvări","sa rasvaresti":"răsvări","sa rasvarim":"răsvări","sa rasvariti":"răsvări","sa raszic":"răszice","sa raszica":"răszice","sa raszicem":"răszice","sa rasziceti":"răszice","sa raszici":"răszice","sa rataceasca":"rătăci","sa ratacesc":"rătăci","sa ratacesti":"rătăci","sa ratacim":"rătăci","sa rataciti":"rătăci","sa ratam":"rata","sa ratati":"rata","sa ratez":"rata","sa rateze":"rata","sa ratezi":"rata","sa ratific":"ratifica","sa ratificam":"ratifica","sa ratificati":"ratifica","sa ratifice":"ratifica","sa ratifici":"ratifica","sa rationalizam":"raționaliza","sa rationalizati":"raționaliza","sa rationalizez":"raționaliza","sa rationalizeze":"raționaliza","sa rationalizezi":"raționaliza","sa rationam":"raționa","sa rationati":"raționa","sa rationez":"raționa","sa rationeze":"raționa","sa rationezi":"raționa","sa ratunjeasca":"rătunji","sa ratunjesc":"rătunji","sa ratunjesti":"rătunji","sa ratunjim":"rătunji","sa ratunjiti":"rătunji","sa ratuteasca":"rătuti","sa ratutesc":"rătuti","sa ratutesti":"rătuti","sa ratutim":"rătuti","sa ratutiti":"rătuti","sa rauram":"râura","sa raurati":"râura","sa raureasca":"râuri","sa rauresc":"râuri","sa rauresti":"râuri","sa raurez":"râura","sa raureze":"râura","sa raurezi":"râura","sa raurim":"râuri","sa rauriti":"râuri","sa rautat":"răutăți","sa rautata":"răutăți","sa rautati":"răutăți","sa rautatim":"răutăți","sa rautatiti":"răutăți","sa ravaseasca":"răvăși","sa ravasesc":"răvăși","sa ravasesti":"răvăși","sa ravasim":"răvăși","sa ravasiti":"răvăși","sa ravneasca":"râvni","sa ravnesc":"râvni","sa ravnesti":"râvni","sa ravnim":"râvni","sa ravniti":"râvni","sa razaluiasca":"răzălui","sa razaluiesc":"răzălui","sa razaluiesti":"răzălui","sa razaluim":"răzălui","sa razaluiti":"răzălui","sa razbeasca":"răzbi","sa razbesc":"răzbi","sa razbesti":"răzbi","sa razbim":"răzbi","sa razbiti":"răzbi","sa razboiasca":"război","sa razboiesc":"război","sa razboiesti":"război","sa razboim":"război","sa razboiti":"război","sa razboleasca":"războli","sa razbolesc":"războli","sa razbolesti":"războli","sa razbolim":"războli","sa razboliti":"războli","sa razbotezam":"războteza","sa razbotezati":"războteza","sa razbotezez":"războteza","sa razbotezeze":"războteza","sa razbotezezi":"războteza","sa razbun":"răzbuna","sa razbunam":"răzbuna","sa razbunati":"răzbuna","sa razbune":"răzbuna","sa razbuni":"răzbuna","sa razdruseasca":"răzdruși","sa razdrusesc":"răzdruși","sa razdrusesti":"răzdruși","sa razdrusim":"răzdruși","sa razdrusiti":"răzdruși","sa raze":"răza","sa razeasca":"răzi","sa razesc":"răzi","sa razesti":"răzi","sa razgai":["să râzgâi","râzgâia","să răzgâi","răzgâia"],"sa razgaiati":["să râzgâiați","râzgâia","să răzgâiați","răzgâia"],"sa razgaie":["să râzgâie","râzgâia","să răzgâie","răzgâia"],"sa razgaiem":["să râzgâiem","râzgâia","să răzgâiem","răzgâia"],"sa razgandeasca":"răzgândi","sa razgandesc":"răzgândi","sa razgandesti":"răzgândi","sa razgandim":"răzgândi","sa razganditi":"răzgândi","sa razi":["să razi","rade","să râzi","râde"],"sa razim":["să răzim","răzi","să răzim","răzima"],"sa razimam":"răzima","sa razimati":"răzima","sa razime":"răzima","sa razimi":"răzima","sa raziti":"răzi","sa razleteasca":"răzleți","sa razletesc":"răzleți","sa razletesti":"răzleți","sa razletim":"răzleți","sa razletiti":"răzleți","sa razneasca":"răzni","sa raznesc":"răzni","sa raznesti":"răzni","sa raznim":"răzni","sa razniti":"răzni","sa razoreasca":"răzori","sa razoresc":"răzori","sa razoresti":"răzori","sa razorim":"răzori","sa razoriti":"răzori","sa razuiasca":"răzui","sa razuiesc":"răzui","sa razuiesti":"răzui","sa razuim":"răzui","sa razuiti":"răzui","sa razvesteasca":"răzvesti","sa razvestesc":"răzvesti","sa razvestesti":"răzvesti","sa razvestim":"răzvesti","sa razvestiti":"răzvesti","sa razvrateasca":"răzvrăti","sa razvratesc":"răzvrăti","sa razvratesti":"răzvrăti","sa razvratim":"răzvrăti","sa razvratiti":"răzvrăti","sa reabilitam":"reabilita","sa reabilitati":"reabilita","sa reabilitez":"reabilita","sa reabiliteze":"reabilita","sa reabilitezi":"reabilita","sa reabonam":"reabona","sa reabonati":"reabona","sa reabonez":"reabona","sa reaboneze":"reabona","sa reabonezi":"reabona","sa reabordam":"reaborda","sa reabordati":"reaborda","sa reabordez":"reaborda","sa reabordeze":"reaborda","sa reabordezi":"reaborda","sa reaclimatizam":"reaclimatiza","sa reaclimatizati":"reaclimatiza","sa reaclimatizez":"reaclimatiza","sa reaclimatizeze":"reaclimatiza","sa reaclimatizezi":"reaclimatiza","sa reacoper":"reacoperi","sa reacopera":"reacoperi","sa reacoperi":"reacoperi","sa reacoperim":"reacoperi","sa reacoperiti":"reacoperi","sa reacord":"reacorda","sa reacordam":"reacorda","sa reacordati":"reacorda","sa reacorde":"reacorda","sa reacorzi":"reacorda","sa reactionam":"reacționa","sa reactionati":"reacționa","sa reactionez":"reacționa","sa reactioneze":"reacționa","sa reactionezi":"reacționa","sa reactivam":"reactiva","sa reactivati":"reactiva","sa reactivez":"reactiva","sa reactiveze":"reactiva","sa reactivezi":"reactiva","sa reactualizam":"reactualiza","sa reactualizati":"reactualiza","sa reactualizez":"reactualiza","sa reactualizeze":"reactualiza","sa reactualizezi":"reactualiza","sa reacumulam":"reacumula","sa reacumulati":"reacumula","sa reacumulez":"reacumula","sa reacumuleze":"reacumula","sa reacumulezi":"reacumula","sa readaptam":"readapta","sa readaptati":"readapta","sa readaptez":"readapta","sa readapteze":"readapta","sa readaptezi":"readapta","sa readmit":"readmite","sa readmita":"readmite","sa readmitem":"readmite","sa readmiteti":"readmite","sa readmiti":"readmite","sa readmonestam":"readmonesta","sa readmonestati":"readmonesta","sa readmonestez":"readmonesta","sa readmonesteze":"readmonesta","sa readmonestezi":"readmonesta","sa readorm":"readormi","sa readorma":"readormi","sa readormi":"readormi","sa readormim":"readormi","sa readormiti":"readormi","sa readuc":"readuce","sa readuca":"readuce","sa readucem":"readuce","sa readuceti":"readuce","sa readuci":"readuce","sa readun":"readuna","sa readunam":"readuna","sa readunati":"readuna","sa readune":"readuna","sa readuni":"readuna","sa reaeriseasca":"reaerisi","sa reaerisesc":"reaerisi","sa reaerisesti":"reaerisi","sa reaerisim":"reaerisi","sa reaerisiti":"reaerisi","sa reafirm":"reafirma","sa reafirmam":"reafirma","sa reafirmati":"reafirma","sa reafirme":"reafirma","sa reafirmi":"reafirma","sa reaflam":"reafla","sa reaflati":"reafla","sa reafle":"reafla","sa reafli":"reafla","sa reaflu":"reafla","sa reagrav":"reagrava","sa reagravam":"reagrava","sa reagravati":"reagrava","sa reagrave":"reagrava","sa reagravi":"reagrava","sa reajung":"reajunge","sa reajunga":"reajunge","sa reajungem":"reajunge","sa reajungeti":"reajunge","sa reajungi":"reajunge","sa reajustam":"reajusta","sa reajustati":"reajusta","sa reajustez":"reajusta","sa reajusteze":"reajusta","sa reajustezi":"reajusta","sa realeg":"realege","sa realega":"realege","sa realegem":"realege","sa realegeti":"realege","sa realegi":"realege","sa realimentam":"realimenta","sa realimentati":"realimenta","sa realimentez":"realimenta","sa realimenteze":"realimenta","sa realimentezi":"realimenta","sa realiniati":"realinia","sa realiniem":"realinia","sa realiniez":"realinia","sa realinieze":"realinia","sa realiniezi":"realinia","sa realipeasca":"realipi","sa realipesc":"realipi","sa realipesti":"realipi","sa realipim":"realipi","sa realipiti":"realipi","sa realizam":"realiza","sa realizati":"realiza","sa realizez":"realiza","sa realizeze":"realiza","sa realizezi":"realiza","sa realt":"realța","sa realtam":"realța","sa realtati":"realța","sa realte":"realța","sa realti":"realța","sa realtoiasca":"realtoi","sa realtoiesc":"realtoi","sa realtoiesti":"realtoi","sa realtoim":"realtoi","sa realtoiti":"realtoi","sa reambalam":"reambala","sa reambalati":"reambala","sa reambalez":"reambala","sa reambaleze":"reambala","sa reambalezi":"reambala","sa reambarc":"reambarca","sa reambarcam":"reambarca","sa reambarcati":"reambarca","sa reambarce":"reambarca","sa reambarci":"reambarca","sa reamenajam":"reamenaja","sa reamenajati":"reamenaja","sa reamenajez":"reamenaja","sa reamenajeze":"reamenaja","sa reamenajezi":"reamenaja","sa reaminteasca":"reaminti","sa reamintesc":"reaminti","sa reamintesti":"reaminti","sa reamintim":"reaminti","sa reamintiti":"reaminti","sa reamplasam":"reamplasa","sa reamplasati":"reamplasa","sa reamplasez":"reamplasa","sa reamplaseze":"reamplasa","sa reamplasezi":"reamplasa","sa reamputam":"reamputa","sa reamputati":"reamputa","sa reamputez":"reamputa","sa reamputeze":"reamputa","sa reamputezi":"reamputa","sa reanalizam":"reanaliza","sa reanalizati":"reanaliza","sa reanalizez":"reanaliza","sa reanalizeze":"reanaliza","sa reanalizezi":"reanaliza","sa reangajam":"reangaja","sa reangajati":"reangaja","sa reangajez":"reangaja","sa reangajeze":"reangaja","sa reangajezi":"reangaja","sa reanim":"reanima","sa reanimam":"reanima","sa reanimati":"reanima","sa reanime":"reanima","sa reanimi":"reanima","sa reapar":"reapărea","sa reapara":"reapărea","sa reaparem":"reapărea","sa reapareti":"reapărea","sa reapari":"reapărea","sa reaprind":"reaprinde","sa reaprinda":"reaprinde","sa reaprindem":"reaprinde","sa reaprindeti":"reaprinde","sa reaprinzi":"reaprinde","sa reaprovizionam":"reaproviziona","sa reaprovizionati":"reaproviziona","sa reaprovizionez":"reaproviziona","sa reaprovizioneze":"reaproviziona","sa reaprovizionezi":"reaproviziona","sa reapuc":"reapuca","sa reapucam":"reapuca","sa reapucati":"reapuca","sa reapuce":"reapuca","sa reapuci":"reapuca","sa rearanjam":"rearanja","sa rearanjati":"rearanja","sa rearanjez":"rearanja","sa rearanjeze":"rearanja","sa rearanjezi":"rearanja","sa rearbitram":"rearbitra","sa rearbitrati":"rearbitra","sa rearbitrez":"rearbitra","sa rearbitreze":"rearbitra","sa rearbitrezi":"rearbitra","sa rearendam":"rearenda","sa rearendati":"rearenda","sa rearendez":"rearenda","sa rearendeze":"rearenda","sa rearendezi":"rearenda","sa reargintam":"rearginta","sa reargintati":"rearginta","sa reargintez":"rearginta","sa rearginteze":"rearginta","sa reargintezi":"rearginta","sa rearmam":"rearma","sa rearmati":"rearma","sa rearmez":"rearma","sa rearmeze":"rearma","sa rearmezi":"rearma","sa reascult":"reasculta","sa reascultam":"reasculta","sa reascultati":"reasculta","sa reasculte":"reasculta","sa reasculti":"reasculta","sa reasezam":"reașeza","sa reasezati":"reașeza","sa reasezez":"reașeza","sa reasezeze":"reașeza","sa reasezezi":"reașeza","sa reasigur":"reasigura","sa reasiguram":"reasigura","sa reasigurati":"reasigura","sa reasigure":"reasigura","sa reasiguri":"reasigura","sa reasociati":"reasocia","sa reasociem":"reasocia","sa reasociez":"reasocia","sa reasocieze":"reasocia","sa reasociezi":"reasocia","sa reatat":"reațâța","sa reatatam":"reațâța","sa reatatati":"reațâța","sa reatate":"reațâța","sa reatati":"reațâța","sa reatribui":"reatribui","sa reatribuie":"reatribui","sa reatribuim":"reatribui","sa reatribuiti":"reatribui","sa reaudiati":"reaudia","sa reaudie":"reaudia","sa reaudiem":"reaudia","sa reaudii":"reaudia","sa reauz":"reauzi","sa reauza":"reauzi","sa reauzi":"reauzi","sa reauzim":"reauzi","sa reauziti":"reauzi","sa reazem":"rezema","sa rebandajam":"rebandaja","sa rebandajati":"rebandaja","sa rebandajez":"rebandaja","sa rebandajeze":"rebandaja","sa rebandajezi":"rebandaja","sa rebat":"rebate","sa rebata":"rebate","sa rebatem":"rebate","sa rebateti":"rebate","sa rebati":"rebate","sa rebotez":"reboteza","sa rebotezam":"reboteza","sa rebotezati":"reboteza","sa reboteze":"reboteza","sa rebotezi":"reboteza","sa rebutam":"rebuta","sa rebutati":"rebuta","sa rebutez":"rebuta","sa rebuteze":"rebuta","sa rebutezi":"rebuta","sa recad":"recădea","sa recada":"recădea","sa recadem":"recădea","sa recadeti":"recădea","sa recalculam":"recalcula","sa recalculati":"recalcula","sa recalculez":"recalcula","sa recalculeze":"recalcula","sa recalculezi":"recalcula","sa recalibram":"recalibra","sa recalibrati":"recalibra","sa recalibrez":"recalibra","sa recalibreze":"recalibra","sa recalibrezi":"recalibra","sa recalific":"recalifica","sa recalificam":"recalifica","sa recalificati":"recalifica","sa recalifice":"recalifica","sa recalifici":"recalifica","sa recalot":"recalota","sa recalotam":"recalota","sa recalotati":"recalota","sa recalote":"recalota","sa recaloti":"recalota","sa recantareasca":"recântări","sa recantaresc":"recântări","sa recantaresti":"recântări","sa recantarim":"recântări","sa recantariti":"recântări","sa recapat":"recăpăta","sa recapatam":"recăpăta","sa recapatati":"recăpăta","sa recapate":"recăpăta","sa recapati":"recăpăta","sa recapitulam":"recapitula","sa recapitulati":"recapitula","sa recapitulez":"recapitula","sa recapituleze":"recapitula","sa recapitulezi":"recapitula","sa recarburam":"recarbura","sa recarburati":"recarbura","sa recarburez":"recarbura","sa recarbureze":"recarbura","sa recarburezi":"recarbura","sa recasatoreasca":"recăsători","sa recasatoresc":"recăsători","sa recasatoresti":"recăsători","sa recasatorim":"recăsători","sa recasatoriti":"recăsători","sa recastig":"recâștiga","sa recastigam":"recâștiga","sa recastigati":"recâștiga","sa recastige":"recâștiga","sa recastigi":"recâștiga","sa recategoris":"recategorisi","sa recategorisa":"recategorisi","sa recategorisi":"recategorisi","sa recategorisim":"recategorisi","sa recategorisiti":"recategorisi","sa recazi":"recădea","sa receapa":"recepe","sa recedam":"receda","sa recedati":"receda","sa recedez":"receda","sa recedeze":"receda","sa recedezi":"receda","sa recelam":"recela","sa recelati":"recela","sa recelez":"recela","sa receleze":"recela","sa recelezi":"recela","sa recenzam":"recenza","sa recenzati":"recenza","sa recenzez":"recenza","sa recenzeze":"recenza","sa recenzezi":"recenza","sa recep":"recepe","sa recepem":"recepe","sa recepeti":"recepe","sa recepi":"recepe","sa receptionam":"recepționa","sa receptionati":"recepționa","sa receptionez":"recepționa","sa receptioneze":"recepționa","sa receptionezi":"recepționa","sa recercetam":"recerceta","sa recercetati":"recerceta","sa recercetez":"recerceta","sa recerceteze":"recerceta","sa recercetezi":"recerceta","sa rechem":"rechema","sa rechemam":"rechema","sa rechemati":"rechema","sa recheme":"rechema","sa rechemi":"rechema","sa rechizitionam":"rechiziționa","sa rechizitionati":"rechiziționa","sa rechizitionez":"rechiziționa","sa rechizitioneze":"rechiziționa","sa rechizitionezi":"rechiziționa","sa reciclam":"recicla","sa reciclati":"recicla","sa reciclez":"recicla","sa recicleze":"recicla","sa reciclezi":"recicla","sa recidivam":"recidiva","sa recidivati":"recidiva","sa recidivez":"recidiva","sa recidiveze":"recidiva","sa recidivezi":"recidiva","sa recircul":"recircula","sa recirculam":"recircula","sa recirculati":"recircula","sa recircule":"recircula","sa recirculi":"recircula","sa recit":"recita","sa recitam":"recita","sa recitati":"recita","sa recite":"recita","sa reciteasca":"reciti","sa recitesc":"reciti","sa recitesti":"reciti","sa reciti":"recita","sa recitim":"reciti","sa recititi":"reciti","sa recladeasca":"reclădi","sa recladesc":"reclădi","sa recladesti":"reclădi","sa recladim":"reclădi","sa recladiti":"reclădi","sa reclam":"reclama","sa reclamam":"reclama","sa reclamati":"reclama","sa reclame":"reclama","sa reclami":"reclama","sa reclasam":"reclasa","sa reclasati":"reclasa","sa reclasez":"reclasa","sa reclaseze":"reclasa","sa reclasezi":"reclasa","sa reclasific":"reclasifica","sa reclasificam":"reclasifica","sa reclasificati":"reclasifica","sa reclasifice":"reclasifica","sa reclasifici":"reclasifica","sa recoaca":"recoace","sa recoacem":"recoace","sa recoaceti":"recoace","sa recobor":"recoborî","sa recoboram":"recoborî","sa recoborati":"recoborî","sa recobore":"recoborî","sa recobori":"recoborî","sa recoc":"recoace","sa recoci":"recoace","sa recolonizam":"recoloniza","sa recolonizati":"recoloniza","sa recolonizez":"recoloniza","sa recolonizeze":"recoloniza","sa recolonizezi":"recoloniza","sa recoloram":"recolora","sa recolorati":"recolora","sa recolorez":"recolora","sa recoloreze":"recolora","sa recolorezi":"recolora","sa recoltam":"recolta","sa recoltati":"recolta","sa recoltez":"recolta","sa recolteze":"recolta","sa recoltezi":"recolta","sa recomand":"recomanda","sa recomandam":"recomanda","sa recomandati":"recomanda","sa recomande":"recomanda","sa recomanzi":"recomanda","sa recombin":"recombina","sa recombinam":"recombina","sa recombinati":"recombina","sa recombine":"recombina","sa recombini":"recombina","sa recomentam":"recomenta","sa recomentati":"recomenta","sa recomentez":"recomenta","sa recomenteze":"recomenta","sa recomentezi":"recomenta","sa recompartimentam":"recompartimenta","sa recompartimentati":"recompartimenta","sa recompartimentez":"recompartimenta","sa recompartimenteze":"recompartimenta","sa recompartimentezi":"recompartimenta","sa recompensam":"recompensa","sa recompensati":"recompensa","sa recompensez":"recompensa","sa recompenseze":"recompensa","sa recompensezi":"recompensa","sa recomprim":"recomprima","sa recomprimam":"recomprima","sa recomprimati":"recomprima","sa recomprime":"recomprima","sa recomprimi":"recomprima","sa recompui":"recompune","sa recompun":"recompune","sa recompuna":"recompune","sa recompunem":"recompune","sa recompuneti":"recompune","sa reconditionam":"recondiționa","sa reconditionati":"recondiționa","sa reconditionez":"recondiționa","sa reconditioneze":"recondiționa","sa reconditionezi":"recondiționa","sa reconfigur":"reconfigura","sa reconfiguram":"reconfigura","sa reconfigurati":"reconfigura","sa reconfigure":"reconfigura","sa reconfiguri":"reconfigura","sa reconfirm":"reconfirma","sa reconfirmam":"reconfirma","sa reconfirmati":"reconfirma","sa reconfirme":"reconfirma","sa reconfirmi":"reconfirma","sa reconfortam":"reconforta","sa reconfortati":"reconforta","sa reconfortez":"reconforta","sa reconforteze":"reconforta","sa reconfortezi":"reconforta","sa reconsider":"reconsidera","sa reconsideram":"reconsidera","sa reconsiderati":"reconsidera","sa reconsidere":"reconsidera","sa reconsideri":"reconsidera","sa reconsolidam":"reconsolida","sa reconsolidati":"reconsolida","sa reconsolidez":"reconsolida"};
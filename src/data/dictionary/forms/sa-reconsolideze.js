@@ -0,0 +1 @@
+export default {"sa reconsolideze":"reconsolida","sa reconsolidezi":"reconsolida","sa reconstitui":"reconstitui","sa reconstituie":"reconstitui","sa reconstituim":"reconstitui","sa reconstituiti":"reconstitui","sa reconstruiasca":"reconstrui","sa reconstruiesc":"reconstrui","sa reconstruiesti":"reconstrui","sa reconstruim":"reconstrui","sa reconstruiti":"reconstrui","sa reconverteasca":"reconverti","sa reconvertesc":"reconverti","sa reconvertesti":"reconverti","sa reconvertim":"reconverti","sa reconvertiti":"reconverti","sa reconvoc":"reconvoca","sa reconvocam":"reconvoca","sa reconvocati":"reconvoca","sa reconvoce":"reconvoca","sa reconvoci":"reconvoca","sa recopiati":"recopia","sa recopiem":"recopia","sa recopiez":"recopia","sa recopieze":"recopia","sa recopiezi":"recopia","sa recream":"recrea","sa recreati":"recrea","sa recreez":"recrea","sa recreeze":"recrea","sa recreezi":"recrea","sa recriminam":"recrimina","sa recriminati":"recrimina","sa recriminez":"recrimina","sa recrimineze":"recrimina","sa recriminezi":"recrimina","sa recromam":"recroma","sa recromati":"recroma","sa recromez":"recroma","sa recromeze":"recroma","sa recromezi":"recroma","sa recrutam":"recruta","sa recrutati":"recruta","sa recrutez":"recruta","sa recruteze":"recruta","sa recrutezi":"recruta","sa rectalui":"rectălui","sa rectaluie":"rectălui","sa rectaluim":"rectălui","sa rectaluiti":"rectălui","sa rectific":"rectifica","sa rectificam":"rectifica","sa rectificati":"rectifica","sa rectifice":"rectifica","sa rectifici":"rectifica","sa recucereasca":"recuceri","sa recuceresc":"recuceri","sa recuceresti":"recuceri","sa recucerim":"recuceri","sa recuceriti":"recuceri","sa reculam":"recula","sa reculati":"recula","sa reculeaga":"reculege","sa reculeg":"reculege","sa reculegem":"reculege","sa reculegeti":"reculege","sa reculegi":"reculege","sa reculez":"recula","sa reculeze":"recula","sa reculezi":"recula","sa recunoasca":"recunoaște","sa recunoastem":"recunoaște","sa recunoasteti":"recunoaște","sa recunosc":"recunoaște","sa recunosti":"recunoaște","sa recuperam":"recupera","sa recuperati":"recupera","sa recuperez":"recupera","sa recupereze":"recupera","sa recuperezi":"recupera","sa recurbam":"recurba","sa recurbati":"recurba","sa recurbez":"recurba","sa recurbeze":"recurba","sa recurbezi":"recurba","sa recurg":"recurge","sa recurga":"recurge","sa recurgem":"recurge","sa recurgeti":"recurge","sa recurgi":"recurge","sa recuz":"recuza","sa recuzam":"recuza","sa recuzati":"recuza","sa recuze":"recuza","sa recuzi":"recuza","sa redactam":"redacta","sa redactati":"redacta","sa redactez":"redacta","sa redacteze":"redacta","sa redactezi":"redacta","sa redai":"reda","sa redam":"reda","sa redarui":"redărui","sa redaruie":"redărui","sa redaruim":"redărui","sa redaruiti":"redărui","sa redatam":"redata","sa redatati":"redata","sa redatez":"redata","sa redateze":"redata","sa redatezi":"redata","sa redati":"reda","sa redau":"reda","sa redea":"reda","sa redefineasca":"redefini","sa redefinesc":"redefini","sa redefinesti":"redefini","sa redefinim":"redefini","sa redefiniti":"redefini","sa redeschid":"redeschide","sa redeschida":"redeschide","sa redeschidem":"redeschide","sa redeschideti":"redeschide","sa redeschizi":"redeschide","sa redescoper":"redescoperi","sa redescopera":"redescoperi","sa redescoperi":"redescoperi","sa redescoperim":"redescoperi","sa redescoperiti":"redescoperi","sa redestept":"redeștepta","sa redesteptam":"redeștepta","sa redesteptati":"redeștepta","sa redestepte":"redeștepta","sa redestepti":"redeștepta","sa redeven":"redeveni","sa redevena":"redeveni","sa redeveni":"redeveni","sa redevenim":"redeveni","sa redeveniti":"redeveni","sa redijam":"redija","sa redijati":"redija","sa redijez":"redija","sa redijeze":"redija","sa redijezi":"redija","sa redimensionam":"redimensiona","sa redimensionati":"redimensiona","sa redimensionez":"redimensiona","sa redimensioneze":"redimensiona","sa redimensionezi":"redimensiona","sa rediscut":"rediscuta","sa rediscutam":"rediscuta","sa rediscutati":"rediscuta","sa rediscute":"rediscuta","sa rediscuti":"rediscuta","sa redispar":"redispărea","sa redispara":"redispărea","sa redisparem":"redispărea","sa redispareti":"redispărea","sa redispari":"redispărea","sa redistilam":"redistila","sa redistilati":"redistila","sa redistilez":"redistila","sa redistileze":"redistila","sa redistilezi":"redistila","sa redistribui":"redistribui","sa redistribuie":"redistribui","sa redistribuim":"redistribui","sa redistribuiti":"redistribui","sa redizolv":"redizolva","sa redizolvam":"redizolva","sa redizolvati":"redizolva","sa redizolve":"redizolva","sa redizolvi":"redizolva","sa redobandeasca":"redobândi","sa redobandesc":"redobândi","sa redobandesti":"redobândi","sa redobandim":"redobândi","sa redobanditi":"redobândi","sa redresam":"redresa","sa redresati":"redresa","sa redresez":"redresa","sa redreseze":"redresa","sa redresezi":"redresa","sa reduc":"reduce","sa reduca":"reduce","sa reducem":"reduce","sa reduceti":"reduce","sa reduci":"reduce","sa reduplic":"reduplica","sa reduplicam":"reduplica","sa reduplicati":"reduplica","sa reduplice":"reduplica","sa reduplici":"reduplica","sa reechilibram":"reechilibra","sa reechilibrati":"reechilibra","sa reechilibrez":"reechilibra","sa reechilibreze":"reechilibra","sa reechilibrezi":"reechilibra","sa reedific":"reedifica","sa reedificam":"reedifica","sa reedificati":"reedifica","sa reedifice":"reedifica","sa reedifici":"reedifica","sa reeditam":"reedita","sa reeditati":"reedita","sa reeditez":"reedita","sa reediteze":"reedita","sa reeditezi":"reedita","sa reeduc":"reeduca","sa reeducam":"reeduca","sa reeducati":"reeduca","sa reeduce":"reeduca","sa reeduci":"reeduca","sa reesalonam":"reeșalona","sa reesalonati":"reeșalona","sa reesalonez":"reeșalona","sa reesaloneze":"reeșalona","sa reesalonezi":"reeșalona","sa reevaluam":"reevalua","sa reevaluati":"reevalua","sa reevaluez":"reevalua","sa reevalueze":"reevalua","sa reevaluezi":"reevalua","sa reexaminam":"reexamina","sa reexaminati":"reexamina","sa reexaminez":"reexamina","sa reexamineze":"reexamina","sa reexaminezi":"reexamina","sa reexpediati":"reexpedia","sa reexpediem":"reexpedia","sa reexpediez":"reexpedia","sa reexpedieze":"reexpedia","sa reexpediezi":"reexpedia","sa reexport":"reexporta","sa reexportam":"reexporta","sa reexportati":"reexporta","sa reexporte":"reexporta","sa reexporti":"reexporta","sa refac":"reface","sa refaca":"reface","sa refacem":"reface","sa refaceti":"reface","sa refaci":"reface","sa refec":"refeca","sa refecam":"refeca","sa refecati":"refeca","sa refece":"refeca","sa refeci":"refeca","sa refer":"referi","sa refera":"referi","sa referam":"refera","sa referati":"refera","sa referez":"refera","sa refereze":"refera","sa referezi":"refera","sa referi":"referi","sa referim":"referi","sa referiti":"referi","sa refierb":"refierbe","sa refierba":"refierbe","sa refierbem":"refierbe","sa refierbeti":"refierbe","sa refierbi":"refierbe","sa reflectam":"reflecta","sa reflectati":"reflecta","sa reflectez":"reflecta","sa reflecteze":"reflecta","sa reflectezi":"reflecta","sa refoloseasca":"refolosi","sa refolosesc":"refolosi","sa refolosesti":"refolosi","sa refolosim":"refolosi","sa refolositi":"refolosi","sa reforjam":"reforja","sa reforjati":"reforja","sa reforjez":"reforja","sa reforjeze":"reforja","sa reforjezi":"reforja","sa reformam":"reforma","sa reformati":"reforma","sa reformez":"reforma","sa reformeze":"reforma","sa reformezi":"reforma","sa reformulam":"reformula","sa reformulati":"reformula","sa reformulez":"reformula","sa reformuleze":"reformula","sa reformulezi":"reformula","sa refract":"refracta","sa refractam":"refracta","sa refractati":"refracta","sa refracte":"refracta","sa refracti":"refracta","sa refrigeram":"refrigera","sa refrigerati":"refrigera","sa refrigerez":"refrigera","sa refrigereze":"refrigera","sa refrigerezi":"refrigera","sa refrisam":"refrișa","sa refrisati":"refrișa","sa refrisez":"refrișa","sa refriseze":"refrișa","sa refrisezi":"refrișa","sa refrunt":"refrunta","sa refruntam":"refrunta","sa refruntati":"refrunta","sa refrunte":"refrunta","sa refrunti":"refrunta","sa refug":"refugi","sa refuga":"refugi","sa refugi":"refugi","sa refugiati":"refugia","sa refugiem":"refugia","sa refugiez":"refugia","sa refugieze":"refugia","sa refugiezi":"refugia","sa refugim":"refugi","sa refugiti":"refugi","sa refulam":"refula","sa refulati":"refula","sa refulez":"refula","sa refuleze":"refula","sa refulezi":"refula","sa refutam":"refuta","sa refutati":"refuta","sa refutez":"refuta","sa refuteze":"refuta","sa refutezi":"refuta","sa refuz":"refuza","sa refuzam":"refuza","sa refuzati":"refuza","sa refuze":"refuza","sa refuzi":"refuza","sa regalam":"regala","sa regalati":"regala","sa regalez":"regala","sa regaleze":"regala","sa regalezi":"regala","sa regandeasca":"regândi","sa regandesc":"regândi","sa regandesti":"regândi","sa regandim":"regândi","sa reganditi":"regândi","sa regaseasca":"regăsi","sa regasesc":"regăsi","sa regasesti":"regăsi","sa regasim":"regăsi","sa regasiti":"regăsi","sa regeneram":"regenera","sa regenerati":"regenera","sa regenerez":"regenera","sa regenereze":"regenera","sa regenerezi":"regenera","sa regizam":"regiza","sa regizati":"regiza","sa regizez":"regiza","sa regizeze":"regiza","sa regizezi":"regiza","sa reglam":"regla","sa reglati":"regla","sa reglementam":"reglementa","sa reglementati":"reglementa","sa reglementez":"reglementa","sa reglementeze":"reglementa","sa reglementezi":"reglementa","sa reglez":"regla","sa regleze":"regla","sa reglezi":"regla","sa regradam":"regrada","sa regradati":"regrada","sa regradez":"regrada","sa regradeze":"regrada","sa regradezi":"regrada","sa regresam":"regresa","sa regresati":"regresa","sa regresez":"regresa","sa regreseze":"regresa","sa regresezi":"regresa","sa regret":"regreta","sa regretam":"regreta","sa regretati":"regreta","sa regrete":"regreta","sa regreti":"regreta","sa regrupam":"regrupa","sa regrupati":"regrupa","sa regrupez":"regrupa","sa regrupeze":"regrupa","sa regrupezi":"regrupa","sa regulam":"regula","sa regulamentam":"regulamenta","sa regulamentati":"regulamenta","sa regulamentez":"regulamenta","sa regulamenteze":"regulamenta","sa regulamentezi":"regulamenta","sa regulariseasca":"regularisi","sa regularisesc":"regularisi","sa regularisesti":"regularisi","sa regularisim":"regularisi","sa regularisiti":"regularisi","sa regularizam":"regulariza","sa regularizati":"regulariza","sa regularizez":"regulariza","sa regularizeze":"regulariza","sa regularizezi":"regulariza","sa regulati":"regula","sa regulez":"regula","sa reguleze":"regula","sa regulezi":"regula","sa regurgitam":"regurgita","sa regurgitati":"regurgita","sa regurgitez":"regurgita","sa regurgiteze":"regurgita","sa regurgitezi":"regurgita","sa reia":"relua","sa reiasa":"reieși","sa reiau":"relua","sa reiei":"relua","sa reiept":"reiepta","sa reieptam":"reiepta","sa reieptati":"reiepta","sa reiepte":"reiepta","sa reiepti":"reiepta","sa reies":"reieși","sa reiesi":"reieși","sa reiesim":"reieși","sa reiesiti":"reieși","sa reimbarbatam":"reîmbărbăta","sa reimbarbatati":"reîmbărbăta","sa reimbarbatez":"reîmbărbăta","sa reimbarbateze":"reîmbărbăta","sa reimbarbatezi":"reîmbărbăta","sa reimpac":"reîmpăca","sa reimpacam":"reîmpăca","sa reimpacati":"reîmpăca","sa reimpace":"reîmpăca","sa reimpaci":"reîmpăca","sa reimpadureasca":"reîmpăduri","sa reimpaduresc":"reîmpăduri","sa reimpaduresti":"reîmpăduri","sa reimpadurim":"reîmpăduri","sa reimpaduriti":"reîmpăduri","sa reimpart":"reîmpărți","sa reimparta":"reîmpărți","sa reimparti":"reîmpărți","sa reimpartim":"reîmpărți","sa reimpartiti":"reîmpărți","sa reimport":"reimporta","sa reimportam":"reimporta","sa reimportati":"reimporta","sa reimporte":"reimporta","sa reimporti":"reimporta","sa reimpreunam":"reîmpreuna","sa reimpreunati":"reîmpreuna","sa reimpreunez":"reîmpreuna","sa reimpreuneze":"reîmpreuna","sa reimpreunezi":"reîmpreuna","sa reimprieten":"reîmprieteni","sa reimprietena":"reîmprieteni","sa reimprieteni":"reîmprieteni","sa reimprietenim":"reîmprieteni","sa reimprieteniti":"reîmprieteni","sa reimprim":"reimprima","sa reimprimam":"reimprima","sa reimprimati":"reimprima","sa reimprime":"reimprima","sa reimprimi":"reimprima","sa reimprospatam":"reîmprospăta","sa reimprospatati":"reîmprospăta","sa reimprospatez":"reîmprospăta","sa reimprospateze":"reîmprospăta","sa reimprospatezi":"reîmprospăta","sa reimprumut":"reîmprumuta","sa reimprumutam":"reîmprumuta","sa reimprumutati":"reîmprumuta","sa reimprumute":"reîmprumuta","sa reimprumuti":"reîmprumuta","sa reinalt":"reînălța","sa reinaltam":"reînălța","sa reinaltati":"reînălța","sa reinalte":"reînălța","sa reinalti":"reînălța","sa reinarmam":"reînarma","sa reinarmati":"reînarma","sa reinarmez":"reînarma","sa reinarmeze":"reînarma","sa reinarmezi":"reînarma","sa reincalzeasca":"reîncălzi","sa reincalzesc":"reîncălzi","sa reincalzesti":"reîncălzi","sa reincalzim":"reîncălzi","sa reincalziti":"reîncălzi","sa reincarc":"reîncărca","sa reincarcam":"reîncărca","sa reincarcati":"reîncărca","sa reincarce":"reîncărca","sa reincarci":"reîncărca","sa reincarnam":["să reincarnăm","reincarna","să reîncarnăm","reîncarna"],"sa reincarnati":["să reincarnați","reincarna","să reîncarnați","reîncarna"],"sa reincarnez":["să reincarnez","reincarna","să reîncarnez","reîncarna"],"sa reincarneze":["să reincarneze","reincarna","să reîncarneze","reîncarna"],"sa reincarnezi":["să reincarnezi","reincarna","să reîncarnezi","reîncarna"],"sa reincep":"reîncepe","sa reincepa":"reîncepe","sa reincepem":"reîncepe","sa reincepeti":"reîncepe","sa reincepi":"reîncepe","sa reinchid":"reînchide","sa reinchida":"reînchide","sa reinchidem":"reînchide","sa reinchideti":"reînchide","sa reinchiriati":"reînchiria","sa reinchiriem":"reînchiria","sa reinchiriez":"reînchiria","sa reinchirieze":"reînchiria","sa reinchiriezi":"reînchiria","sa reinchizi":"reînchide","sa reincolt":"reîncolți","sa reincolta":"reîncolți","sa reincolti":"reîncolți","sa reincoltim":"reîncolți","sa reincoltiti":"reîncolți","sa reincorporam":"reîncorpora","sa reincorporati":"reîncorpora","sa reincorporez":"reîncorpora","sa reincorporeze":"reîncorpora","sa reincorporezi":"reîncorpora","sa reindoi":"reîndoi","sa reindoie":"reîndoi","sa reindoim":"reîndoi","sa reindoiti":"reîndoi","sa reindrept":"reîndrepta","sa reindreptam":"reîndrepta","sa reindreptati":"reîndrepta","sa reindrepte":"reîndrepta","sa reindrepti":"reîndrepta","sa reindrum":"reîndruma","sa reindrumam":"reîndruma","sa reindrumati":"reîndruma","sa reindrume":"reîndruma","sa reindrumi":"reîndruma","sa reinfectam":"reinfecta","sa reinfectati":"reinfecta","sa reinfectez":"reinfecta","sa reinfecteze":"reinfecta","sa reinfectezi":"reinfecta","sa reinfiintam":"reînființa","sa reinfiintati":"reînființa","sa reinfiintez":"reînființa","sa reinfiinteze":"reînființa","sa reinfiintezi":"reînființa","sa reinfloreasca":"reînflori","sa reinfloresc":"reînflori","sa reinfloresti":"reînflori","sa reinflorim":"reînflori","sa reinfloriti":"reînflori","sa reinmatriculam":"reînmatricula","sa reinmatriculati":"reînmatricula","sa reinmatriculez":"reînmatricula","sa reinmatriculeze":"reînmatricula","sa reinmatriculezi":"reînmatricula","sa reinnod":"reînnoda","sa reinnodam":"reînnoda","sa reinnodati":"reînnoda","sa reinnode":"reînnoda","sa reinnoiasca":"reînnoi","sa reinnoiesc":"reînnoi","sa reinnoiesti":"reînnoi","sa reinnoim":"reînnoi","sa reinnoiti":"reînnoi","sa reinnozi":"reînnoda","sa reinsamantam":"reînsămânța","sa reinsamantati":"reînsămânța","sa reinsamantez":"reînsămânța","sa reinsamanteze":"reînsămânța","sa reinsamantezi":"reînsămânța","sa reinsanatoseasca":"reînsănătoși","sa reinsanatosesc":"reînsănătoși","sa reinsanatosesti":"reînsănătoși","sa reinsanatosim":"reînsănătoși","sa reinsanatositi":"reînsănătoși","sa reinscaunam":"reînscăuna","sa reinscaunati":"reînscăuna","sa reinscaunez":"reînscăuna","sa reinscauneze":"reînscăuna","sa reinscaunezi":"reînscăuna","sa reinstalam":"reinstala","sa reinstalati":"reinstala","sa reinstalez":"reinstala","sa reinstaleze":"reinstala","sa reinstalezi":"reinstala","sa reinstauram":"reinstaura","sa reinstaurati":"reinstaura","sa reinstaurez":"reinstaura","sa reinstaureze":"reinstaura","sa reinstaurezi":"reinstaura","sa reinsufleteasca":"reînsufleți","sa reinsufletesc":"reînsufleți","sa reinsufletesti":"reînsufleți","sa reinsufletim":"reînsufleți","sa reinsufletiti":"reînsufleți","sa reinsurubam":"reînșuruba","sa reinsurubati":"reînșuruba","sa reinsurubez":"reînșuruba","sa reinsurubeze":"reînșuruba","sa reinsurubezi":"reînșuruba","sa reintalneasca":"reîntâlni","sa reintalnesc":"reîntâlni","sa reintalnesti":"reîntâlni","sa reintalnim":"reîntâlni","sa reintalniti":"reîntâlni","sa reintampin":"reîntâmpina","sa reintampinam":"reîntâmpina","sa reintampinati":"reîntâmpina","sa reintampine":"reîntâmpina","sa reintampini":"reîntâmpina","sa reintareasca":"reîntări","sa reintaresc":"reîntări","sa reintaresti":"reîntări","sa reintarim":"reîntări","sa reintariti":"reîntări","sa reintarziati":"reîntârzia","sa reintarzie":"reîntârzia","sa reintarziem":"reîntârzia","sa reintarzii":"reîntârzia","sa reintegram":"reintegra","sa reintegrati":"reintegra","sa reintegrez":"reintegra","sa reintegreze":"reintegra","sa reintegrezi":"reintegra","sa reintemeiati":"reîntemeia","sa reintemeiem":"reîntemeia","sa reintemeiez":"reîntemeia","sa reintemeieze":"reîntemeia","sa reintemeiezi":"reîntemeia","sa reinterogam":"reinteroga","sa reinterogati":"reinteroga","sa reinteroghez":"reinteroga","sa reinterogheze":"reinteroga","sa reinteroghezi":"reinteroga","sa reinterpretam":"reinterpreta","sa reinterpretati":"reinterpreta","sa reinterpretez":"reinterpreta","sa reinterpreteze":"reinterpreta","sa reinterpretezi":"reinterpreta","sa reintinereasca":"reîntineri","sa reintineresc":"reîntineri","sa reintineresti":"reîntineri","sa reintinerim":"reîntineri","sa reintineriti":"reîntineri","sa reintoarca":"reîntoarce","sa reintoarcem":"reîntoarce","sa reintoarceti":"reîntoarce","sa reintorc":"reîntoarce","sa reintorci":"reîntoarce","sa reintram":["să reintrăm","reintra","să reîntrăm","reîntra"],"sa reintrati":["să reintrați","reintra","să reîntrați","reîntra"],"sa reintre":["să reintre","reintra","să reîntre","reîntra"],"sa reintregeasca":"reîntregi","sa reintregesc":"reîntregi","sa reintregesti":"reîntregi","sa reintregim":"reîntregi","sa reintregiti":"reîntregi","sa reintri":["să reintri","reintra","să reîntri","reîntra"],"sa reintroduc":"reintroduce","sa reintroduca":"reintroduce","sa reintroducem":"reintroduce","sa reintroduceti":"reintroduce","sa reintroduci":"reintroduce","sa reintronam":"reîntrona","sa reintronati":"reîntrona","sa reintronez":"reîntrona","sa reintroneze":"reîntrona","sa reintronezi":"reîntrona","sa reintru":["să reintru","reintra","să reîntru","reîntra"],"sa reintrupam":"reîntrupa","sa reintrupati":"reîntrupa","sa reintrupez":"reîntrupa","sa reintrupeze":"reîntrupa","sa reintrupezi":"reîntrupa","sa reinturn":"reînturna","sa reinturnam":"reînturna","sa reinturnati":"reînturna","sa reinturne":"reînturna","sa reinturni":"reînturna","sa reinventariati":"reinventaria","sa reinventariem":"reinventaria","sa reinventariez":"reinventaria","sa reinventarieze":"reinventaria","sa reinventariezi":"reinventaria","sa reinverz":"reînverzi","sa reinverza":"reînverzi","sa reinverzi":"reînverzi","sa reinverzim":"reînverzi","sa reinverziti":"reînverzi","sa reinvesteasca":"reinvesti","sa reinvestesc":"reinvesti","sa reinvestesti":"reinvesti","sa reinvestim":"reinvesti","sa reinvestiti":"reinvesti","sa reinviati":"reînvia","sa reinvie":"reînvia","sa reinviem":"reînvia","sa reinvii":"reînvia","sa reinvit":"reinvita","sa reinvitam":"reinvita","sa reinvitati":"reinvita","sa reinvite":"reinvita","sa reinviti":"reinvita","sa reiteram":"reitera","sa reiterati":"reitera","sa reiterez":"reitera","sa reitereze":"reitera","sa reiterezi":"reitera","sa reiveasca":"reivi","sa reivesc":"reivi","sa reivesti":"reivi","sa reivim":"reivi","sa reiviti":"reivi","sa reizb":"reizbi","sa reizba":"reizbi","sa reizbi":"reizbi","sa reizbim":"reizbi","sa reizbiti":"reizbi","sa reizbucn":"reizbucni","sa reizbucna":"reizbucni","sa reizbucni":"reizbucni","sa reizbucnim":"reizbucni","sa reizbucniti":"reizbucni","sa rejoace":"rejuca","sa rejoc":"rejuca","sa rejoci":"rejuca","sa rejucam":"rejuca","sa rejucati":"rejuca","sa rejudec":"rejudeca","sa rejudecam":"rejudeca","sa rejudecati":"rejudeca","sa rejudece":"rejudeca","sa rejudeci":"rejudeca","sa relansam":"relansa","sa relansati":"relansa","sa relansez":"relansa","sa relanseze":"relansa","sa relansezi":"relansa","sa relatam":"relata","sa relatati":"relata","sa relatez":"relata","sa relateze":"relata","sa relatezi":"relata","sa relationam":"relaționa","sa relationati":"relaționa","sa relationez":"relaționa","sa relationeze":"relaționa","sa relationezi":"relaționa","sa relativizam":"relativiza","sa relativizati":"relativiza","sa relativizez":"relativiza","sa relativizeze":"relativiza","sa relativizezi":"relativiza","sa relaxam":"relaxa","sa relaxati":"relaxa","sa relaxez":"relaxa","sa relaxeze":"relaxa","sa relaxezi":"relaxa","sa releg":"relega","sa relegam":"relega","sa relegati":"relega","sa relege":"relega","sa relegi":"relega","sa relev":"releva","sa relevam":"releva","sa relevati":"releva","sa releve":"releva","sa relevi":"releva","sa reliefam":"reliefa","sa reliefati":"reliefa","sa reliefez":"reliefa","sa reliefeze":"reliefa","sa reliefezi":"reliefa","sa reluam":"relua","sa reluati":"relua","sa remaiati":"remaia","sa remaiem":"remaia","sa remaiez":"remaia","sa remaieze":"remaia","sa remaiezi":"remaia","sa remaniati":"remania","sa remaniem":"remania","sa remaniez":"remania","sa remanieze":"remania","sa remaniezi":"remania","sa remarc":"remarca","sa remarcam":"remarca","sa remarcati":"remarca","sa remarce":"remarca","sa remarci":"remarca","sa remarit":"remărita","sa remaritam":"remărita","sa remaritati":"remărita","sa remarite":"remărita","sa remariti":"remărita","sa remasur":"remăsura","sa remasuram":"remăsura","sa remasurati":"remăsura","sa remasure":"remăsura","sa remasuri":"remăsura","sa remediati":"remedia","sa remediem":"remedia","sa remediez":"remedia","sa remedieze":"remedia","sa remediezi":"remedia","sa rememoram":"rememora","sa rememorati":"rememora","sa rememorez":"rememora","sa rememoreze":"rememora","sa rememorezi":"rememora","sa remilitarizam":"remilitariza","sa remilitarizati":"remilitariza","sa remilitarizez":"remilitariza","sa remilitarizeze":"remilitariza","sa remilitarizezi":"remilitariza","sa remineralizam":"remineraliza","sa remineralizati":"remineraliza","sa remineralizez":"remineraliza","sa remineralizeze":"remineraliza","sa remineralizezi":"remineraliza","sa remit":"remite","sa remita":"remite","sa remitem":"remite","sa remiteti":"remite","sa remiti":"remite","sa remizam":"remiza","sa remizati":"remiza","sa remizez":"remiza","sa remizeze":"remiza","sa remizezi":"remiza","sa remobilam":"remobila","sa remobilati":"remobila","sa remobilez":"remobila","sa remobileze":"remobila","sa remobilezi":"remobila","sa remodelam":"remodela","sa remodelati":"remodela","sa remodelez":"remodela","sa remodeleze":"remodela","sa remodelezi":"remodela","sa remorcam":"remorca","sa remorcati":"remorca","sa remorchez":"remorca","sa remorcheze":"remorca","sa remorchezi":"remorca","sa remuneram":"remunera","sa remunerati":"remunera","sa remunerez":"remunera","sa remunereze":"remunera","sa remunerezi":"remunera","sa renasc":"renaște","sa renasca":"renaște","sa renastem":"renaște","sa renasteti":"renaște","sa renasti":"renaște","sa reneg":"renega","sa renegam":"renega","sa renegati":"renega","sa renege":"renega","sa renegi":"renega","sa renegociati":"renegocia","sa renegociem":"renegocia","sa renegociez":"renegocia","sa renegocieze":"renegocia","sa renegociezi":"renegocia","sa renivelam":"renivela","sa renivelati":"renivela","sa renivelez":"renivela","sa reniveleze":"renivela","sa renivelezi":"renivela","sa renovam":"renova","sa renovati":"renova","sa renovez":"renova","sa renoveze":"renova","sa renovezi":"renova","sa rentabilizam":"rentabiliza","sa rentabilizati":"rentabiliza","sa rentabilizez":"rentabiliza","sa rentabilizeze":"rentabiliza","sa rentabilizezi":"rentabiliza","sa rentam":"renta","sa rentati":"renta","sa rentez":"renta","sa renteze":"renta","sa rentezi":"renta","sa renumar":"renumăra","sa renumaram":"renumăra","sa renumarati":"renumăra","sa renumare":"renumăra","sa renumari":"renumăra","sa renunt":"renunța","sa renuntam":"renunța","sa renuntati":"renunța","sa renunte":"renunța","sa renunti":"renunța","sa reocup":"reocupa","sa reocupam":"reocupa","sa reocupati":"reocupa","sa reocupe":"reocupa","sa reocupi":"reocupa","sa reoglind":"reoglindi","sa reoglinda":"reoglindi","sa reoglindim":"reoglindi","sa reoglinditi":"reoglindi","sa reoglinzi":"reoglindi","sa reoranduiasca":"reorândui","sa reoranduiesc":"reorândui","sa reoranduiesti":"reorândui","sa reoranduim":"reorândui","sa reoranduiti":"reorândui","sa reorchestram":"reorchestra","sa reorchestrati":"reorchestra","sa reorchestrez":"reorchestra","sa reorchestreze":"reorchestra","sa reorchestrezi":"reorchestra","sa reordonam":"reordona","sa reordonati":"reordona","sa reordonez":"reordona","sa reordoneze":"reordona","sa reordonezi":"reordona","sa reorganizam":"reorganiza","sa reorganizati":"reorganiza","sa reorganizez":"reorganiza","sa reorganizeze":"reorganiza","sa reorganizezi":"reorganiza","sa reorientam":"reorienta","sa reorientati":"reorienta","sa reorientez":"reorienta","sa reorienteze":"reorienta","sa reorientezi":"reorienta","sa repaginam":"repagina","sa repaginati":"repagina","sa repaginez":"repagina","sa repagineze":"repagina","sa repaginezi":"repagina","sa repar":"repara","sa reparam":"repara","sa reparati":"repara","sa repare":"repara","sa repari":"repara","sa repartizam":"repartiza","sa repartizati":"repartiza","sa repartizez":"repartiza","sa repartizeze":"repartiza","sa repartizezi":"repartiza","sa repatriati":"repatria","sa repatriem":"repatria","sa repatriez":"repatria","sa repatrieze":"repatria","sa repatriezi":"repatria","sa repauzam":"repauza","sa repauzati":"repauza","sa repauzez":"repauza","sa repauzeze":"repauza","sa repauzezi":"repauza","sa reperam":"repera","sa reperati":"repera","sa repercutam":"repercuta","sa repercutati":"repercuta","sa repercutez":"repercuta","sa repercuteze":"repercuta","sa repercutezi":"repercuta","sa reperez":"repera","sa repereze":"repera","sa reperezi":"repera","sa repertorizam":"repertoriza","sa repertorizati":"repertoriza","sa repertorizez":"repertoriza","sa repertorizeze":"repertoriza","sa repertorizezi":"repertoriza","sa repet":"repeta","sa repetam":"repeta","sa repetati":"repeta","sa repete":"repeta","sa repeteasca":"repeți","sa repetesc":"repeți","sa repetesti":"repeți","sa repeti":"repeta","sa repetim":"repeți","sa repetiti":"repeți","sa repezeasca":"repezi","sa repezesc":"repezi","sa repezesti":"repezi","sa repezim":"repezi","sa repeziti":"repezi","sa replamad":"replămădi","sa replamada":"replămădi","sa replamadim":"replămădi","sa replamaditi":"replămădi","sa replamazi":"replămădi","sa replantam":"replanta","sa replantati":"replanta","sa replantez":"replanta","sa replanteze":"replanta","sa replantezi":"replanta","sa replic":"replica","sa replicam":"replica","sa replicati":"replica","sa replice":"replica","sa replici":"replica","sa repoporam":"repopora","sa repoporati":"repopora","sa repoporez":"repopora","sa repoporeze":"repopora","sa repoporezi":"repopora","sa repopulam":"repopula","sa repopulati":"repopula","sa repopulez":"repopula","sa repopuleze":"repopula","sa repopulezi":"repopula","sa reportam":"reporta","sa reportati":"reporta","sa reportez":"reporta","sa reporteze":"reporta","sa reportezi":"reporta","sa repovesteasca":"repovesti","sa repovestesc":"repovesti","sa repovestesti":"repovesti","sa repovestim":"repovesti","sa repovestiti":"repovesti","sa repozam":"repoza","sa repozati":"repoza","sa repozez":"repoza","sa repozeze":"repoza","sa repozezi":"repoza","sa reprezentam":"reprezenta","sa reprezentati":"reprezenta","sa reprezint":"reprezenta","sa reprezinte":"reprezenta","sa reprezinti":"reprezenta","sa reprim":"reprima","sa reprimam":"reprima","sa reprimati":"reprima","sa reprime":"reprima","sa reprimeasca":"reprimi","sa reprimesc":"reprimi","sa reprimesti":"reprimi","sa reprimi":"reprima","sa reprimim":"reprimi","sa reprimiti":"reprimi","sa reprivatizam":"reprivatiza","sa reprivatizati":"reprivatiza","sa reprivatizez":"reprivatiza","sa reprivatizeze":"reprivatiza","sa reprivatizezi":"reprivatiza","sa reprob":"reproba","sa reprobam":"reproba","sa reprobati":"reproba","sa reprobe":"reproba","sa reprobi":"reproba","sa reproduc":"reproduce","sa reproduca":"reproduce","sa reproducem":"reproduce","sa reproduceti":"reproduce","sa reproduci":"reproduce","sa reprofilam":"reprofila","sa reprofilati":"reprofila","sa reprofilez":"reprofila","sa reprofileze":"reprofila","sa reprofilezi":"reprofila","sa reprogramam":"reprograma","sa reprogramati":"reprograma","sa reprogramez":"reprograma","sa reprogrameze":"reprograma","sa reprogramezi":"reprograma","sa reprosam":"reproșa","sa reprosati":"reproșa","sa reprosez":"reproșa","sa reproseze":"reproșa","sa reprosezi":"reproșa","sa republic":"republica","sa republicam":"republica","sa republicati":"republica","sa republice":"republica","sa republici":"republica","sa repudiati":"repudia","sa repudiem":"repudia","sa repudiez":"repudia","sa repudieze":"repudia","sa repudiezi":"repudia","sa repugn":"repugna","sa repugnam":"repugna","sa repugnati":"repugna","sa repugne":"repugna","sa repugni":"repugna","sa repui":"repune","sa repun":"repune","sa repuna":"repune","sa repunem":"repune","sa repuneti":"repune","sa repurt":"repurta","sa repurtam":"repurta","sa repurtati":"repurta","sa repurte":"repurta","sa repurti":"repurta","sa reputam":"reputa","sa reputati":"reputa","sa reputez":"reputa","sa reputeze":"reputa","sa reputezi":"reputa","sa resapam":"reșapa","sa resapati":"reșapa","sa resapez":"reșapa","sa resapeze":"reșapa","sa resapezi":"reșapa","sa resarjam":"reșarja","sa resarjati":"reșarja","sa resarjez":"reșarja","sa resarjeze":"reșarja","sa resarjezi":"reșarja","sa rescrie":"rescrie","sa rescriem":"rescrie","sa rescrieti":"rescrie","sa rescrii":"rescrie","sa rescriu":"rescrie","sa resed":"reședea","sa reseda":"reședea","sa resedem":"reședea","sa resedeti":"reședea","sa resemnam":"resemna","sa resemnati":"resemna","sa resemnez":"resemna","sa resemneze":"resemna","sa resemnezi":"resemna","sa resetam":"reseta","sa resetati":"reseta","sa resetez":"reseta","sa reseteze":"reseta","sa resetezi":"reseta","sa resezi":"reședea","sa resfir":"resfira","sa resfiram":"resfira","sa resfirati":"resfira","sa resfire":"resfira","sa resfiri":"resfira","sa resignam":"resigna","sa resignati":"resigna","sa resignez":"resigna","sa resigneze":"resigna","sa resignezi":"resigna","sa resimt":"resimți","sa resimta":"resimți","sa resimti":"resimți","sa resimtim":"resimți","sa resimtiti":"resimți","sa resoftam":"resofta","sa resoftati":"resofta","sa resoftez":"resofta","sa resofteze":"resofta","sa resoftezi":"resofta","sa resorb":"resorbi","sa resorba":"resorbi","sa resorbi":"resorbi","sa resorbim":"resorbi","sa resorbiti":"resorbi","sa respect":"respecta","sa respectaluiasca":"respectălui","sa respectaluiesc":"respectălui","sa respectaluiesti":"respectălui","sa respectaluim":"respectălui","sa respectaluiti":"respectălui","sa respectam":"respecta","sa respectati":"respecta","sa respecte":"respecta","sa respecti":"respecta","sa respectuiasca":"respectui","sa respectuiesc":"respectui","sa respectuiesti":"respectui","sa respectuim":"respectui","sa respectuiti":"respectui","sa resping":"respinge","sa respinga":"respinge","sa respingem":"respinge","sa respingeti":"respinge","sa respingi":"respinge","sa respir":"respira","sa respiram":"respira","sa respirati":"respira","sa respire":"respira","sa respiri":"respira","sa responsabilizam":"responsabiliza","sa responsabilizati":"responsabiliza","sa responsabilizez":"responsabiliza","sa responsabilizeze":"responsabiliza","sa responsabilizezi":"responsabiliza","sa restabileasca":"restabili","sa restabilesc":"restabili","sa restabilesti":"restabili","sa restabilim":"restabili","sa restabiliti":"restabili","sa restauram":"restaura","sa restaurati":"restaura","sa restaurez":"restaura","sa restaureze":"restaura","sa restaurezi":"restaura","sa resteasca":"resti","sa restesc":"resti","sa restesti":"resti","sa restim":"resti","sa restiti":"resti","sa restitui":"restitui","sa restituie":"restitui","sa restituim":"restitui","sa restituiti":"restitui","sa restrang":"restrânge","sa restranga":"restrânge","sa restrangem":"restrânge","sa restrangeti":"restrânge","sa restrangi":"restrânge","sa restructuram":"restructura","sa restructurati":"restructura","sa restructurez":"restructura","sa restructureze":"restructura","sa restructurezi":"restructura","sa resuscitam":"resuscita","sa resuscitati":"resuscita","sa resuscitez":"resuscita","sa resusciteze":"resuscita","sa resuscitezi":"resuscita","sa retai":"retăia","sa retaiati":"retăia","sa retaie":"retăia","sa retaiem":"retăia","sa retalmaceasca":"retălmăci","sa retalmacesc":"retălmăci","sa retalmacesti":"retălmăci","sa retalmacim":"retălmăci","sa retalmaciti":"retălmăci","sa retardam":"retarda","sa retardati":"retarda","sa retardez":"retarda","sa retardeze":"retarda","sa retardezi":"retarda","sa retez":"reteza","sa retezam":"reteza","sa retezati":"reteza","sa reteze":"reteza","sa retezi":"reteza","sa retii":"reține","sa retin":"reține","sa retina":"reține","sa retinem":"reține","sa retineti":"reține","sa retipareasca":"retipări","sa retiparesc":"retipări","sa retiparesti":"retipări","sa retiparim":"retipări","sa retipariti":"retipări","sa retopeasca":"retopi","sa retopesc":"retopi","sa retopesti":"retopi","sa retopim":"retopi","sa retopiti":"retopi","sa retractam":"retracta","sa retractati":"retracta","sa retractez":"retracta","sa retracteze":"retracta","sa retractezi":"retracta","sa retraduc":"retraduce","sa retraduca":"retraduce","sa retraducem":"retraduce","sa retraduceti":"retraduce","sa retraduci":"retraduce","sa retrag":"retrage","sa retraga":"retrage","sa retragem":"retrage","sa retrageti":"retrage","sa retragi":"retrage","sa retraiasca":"retrăi","sa retraiesc":"retrăi","sa retraiesti":"retrăi","sa retraim":"retrăi","sa retraiti":"retrăi","sa retranscrie":"retranscrie","sa retranscriem":"retranscrie","sa retranscrieti":"retranscrie","sa retranscrii":"retranscrie","sa retransmit":"retransmite","sa retransmita":"retransmite","sa retransmitem":"retransmite","sa retransmiteti":"retransmite","sa retransmiti":"retransmite","sa retribui":"retribui","sa retribuie":"retribui","sa retribuim":"retribui","sa retribuiti":"retribui","sa retrimit":"retrimite","sa retrimita":"retrimite","sa retrimitem":"retrimite","sa retrimiteti":"retrimite","sa retrimiti":"retrimite","sa retrocedam":"retroceda","sa retrocedati":"retroceda","sa retrocedez":"retroceda","sa retrocedeze":"retroceda","sa retrocedezi":"retroceda","sa retrogradam":"retrograda","sa retrogradati":"retrograda","sa retrogradez":"retrograda","sa retrogradeze":"retrograda","sa retrogradezi":"retrograda","sa returnam":"returna","sa returnati":"returna","sa returnez":"returna","sa returneze":"returna","sa returnezi":"returna","sa retusam":"retușa","sa retusati":"retușa","sa retusez":"retușa","sa retuseze":"retușa","sa retusezi":"retușa","sa reumflam":"reumfla","sa reumflati":"reumfla","sa reumfle":"reumfla","sa reumfli":"reumfla","sa reumflu":"reumfla","sa reumpla":"reumple","sa reumplem":"reumple","sa reumpleti":"reumple","sa reumpli":"reumple","sa reumplu":"reumple","sa reuneasca":"reuni","sa reunesc":"reuni","sa reunesti":"reuni","sa reunific":"reunifica","sa reunificam":"reunifica","sa reunificati":"reunifica","sa reunifice":"reunifica","sa reunifici":"reunifica","sa reunim":"reuni","sa reuniti":"reuni","sa reuseasca":"reuși","sa reusesc":"reuși","sa reusesti":"reuși","sa reusim":"reuși","sa reusiti":"reuși","sa reutilam":"reutila","sa reutilati":"reutila","sa reutilez":"reutila","sa reutileze":"reutila","sa reutilezi":"reutila","sa revaccinam":"revaccina","sa revaccinati":"revaccina","sa revaccinez":"revaccina","sa revaccineze":"revaccina","sa revaccinezi":"revaccina","sa revad":"revedea","sa revada":"revedea","sa revalidam":"revalida","sa revalidati":"revalida","sa revalidez":"revalida","sa revalideze":"revalida","sa revalidezi":"revalida","sa revalorizam":"revaloriza","sa revalorizati":"revaloriza","sa revalorizez":"revaloriza","sa revalorizeze":"revaloriza","sa revalorizezi":"revaloriza","sa revansam":"revanșa","sa revansati":"revanșa","sa revansez":"revanșa","sa revanseze":"revanșa","sa revansezi":"revanșa","sa revars":"revărsa","sa revarsam":"revărsa","sa revarsati":"revărsa","sa revedem":"revedea","sa revedeti":"revedea","sa revelam":"revela","sa revelati":"revela","sa revelez":"revela","sa reveleze":"revela","sa revelezi":"revela","sa revendic":"revendica","sa revendicam":"revendica","sa revendicati":"revendica","sa revendice":"revendica","sa revendici":"revendica","sa reveneasca":"reveni","sa revenesc":"reveni","sa revenesti":"reveni","sa revenim":"reveni","sa reveniti":"reveni","sa reverberam":"reverbera","sa reverberati":"reverbera","sa reverberez":"reverbera","sa reverbereze":"reverbera","sa reverberezi":"reverbera","sa reverse":"revărsa","sa reversi":"revărsa","sa revezi":"revedea","sa revigoram":"revigora","sa revigorati":"revigora","sa revigorez":"revigora","sa revigoreze":"revigora","sa revigorezi":"revigora","sa revii":"reveni","sa revin":"reveni","sa revina":"reveni","sa revind":"revinde","sa revinda":"revinde","sa revindem":"revinde","sa revindeti":"revinde","sa revinzi":"revinde","sa revitalizam":"revitaliza","sa revitalizati":"revitaliza","sa revitalizez":"revitaliza","sa revitalizeze":"revitaliza","sa revitalizezi":"revitaliza","sa revizuiasca":"revizui","sa revizuiesc":"revizui","sa revizuiesti":"revizui","sa revizuim":"revizui","sa revizuiti":"revizui","sa revoc":"revoca","sa revocam":"revoca","sa revocati":"revoca","sa revoce":"revoca","sa revoci":"revoca","sa revolt":"revolta","sa revoltam":"revolta","sa revoltati":"revolta","sa revolte":"revolta","sa revolti":"revolta","sa revolutionam":"revoluționa","sa revolutionarizam":"revoluționariza","sa revolutionarizati":"revoluționariza","sa revolutionarizez":"revoluționariza","sa revolutionarizeze":"revoluționariza","sa revolutionarizezi":"revoluționariza","sa revolutionati":"revoluționa","sa revolutionez":"revoluționa","sa revolutioneze":"revoluționa","sa revolutionezi":"revoluționa","sa revopseasca":"revopsi","sa revopsesc":"revopsi","sa revopsesti":"revopsi","sa revopsim":"revopsi","sa revopsiti":"revopsi","sa rezamb":"rezâmbi","sa rezamba":"rezâmbi","sa rezambi":"rezâmbi","sa rezambim":"rezâmbi","sa rezambiti":"rezâmbi","sa rezec":"rezeca","sa rezecam":"rezeca","sa rezecati":"rezeca","sa rezece":"rezeca","sa rezeci":"rezeca","sa rezemam":"rezema","sa rezemati":"rezema","sa rezeme":"rezema","sa rezemi":"rezema","sa rezerv":"rezerva","sa rezervam":"rezerva","sa rezervati":"rezerva","sa rezerve":"rezerva","sa rezervi":"rezerva","sa rezic":"rezice","sa rezica":"rezice","sa rezicem":"rezice","sa reziceti":"rezice","sa rezici":"rezice","sa rezid":"rezida","sa rezidam":"rezida","sa rezidati":"rezida","sa rezide":"rezida","sa rezideasca":"rezidi","sa rezidesc":"rezidi","sa rezidesti":"rezidi","sa rezidim":"rezidi","sa reziditi":"rezidi","sa reziliati":"rezilia","sa reziliem":"rezilia","sa reziliez":"rezilia","sa rezilieze":"rezilia","sa reziliezi":"rezilia","sa rezinam":"rezina","sa rezinati":"rezina","sa rezinez":"rezina","sa rezineze":"rezina","sa rezinezi":"rezina","sa rezinific":"rezinifica","sa rezinificam":"rezinifica","sa rezinificati":"rezinifica","sa rezinifice":"rezinifica","sa rezinifici":"rezinifica","sa rezist":"rezista","sa rezistam":"rezista","sa rezistati":"rezista","sa reziste":"rezista","sa rezisti":"rezista","sa rezizi":"rezida","sa rezolv":"rezolva","sa rezolvam":"rezolva","sa rezolvati":"rezolva","sa rezolve":"rezolva","sa rezolvi":"rezolva","sa rezolvirui":"rezolvirui","sa rezolviruie":"rezolvirui","sa rezolviruim":"rezolvirui","sa rezolviruiti":"rezolvirui","sa rezonam":"rezona","sa rezonati":"rezona","sa rezonez":"rezona","sa rezoneze":"rezona","sa rezonezi":"rezona","sa rezulte":"rezulta","sa rezum":"rezuma","sa rezumam":"rezuma","sa rezumati":"rezuma","sa rezume":"rezuma","sa rezumi":"rezuma","sa ricanam":"ricana","sa ricanati":"ricana","sa ricanez":"ricana","sa ricaneze":"ricana","sa ricanezi":"ricana","sa ricosam":"ricoșa","sa ricosati":"ricoșa","sa ricosez":"ricoșa","sa ricoseze":"ricoșa","sa ricosezi":"ricoșa","sa ridam":"rida","sa ridati":"rida","sa ridez":"rida","sa rideze":"rida","sa ridezi":"rida","sa ridic":"ridica","sa ridicam":"ridica","sa ridicati":"ridica","sa ridice":"ridica","sa ridici":"ridica","sa ridiculizam":"ridiculiza","sa ridiculizati":"ridiculiza","sa ridiculizez":"ridiculiza","sa ridiculizeze":"ridiculiza","sa ridiculizezi":"ridiculiza","sa rigidizam":"rigidiza","sa rigidizati":"rigidiza","sa rigidizez":"rigidiza","sa rigidizeze":"rigidiza","sa rigidizezi":"rigidiza","sa rimam":"rima","sa rimati":"rima","sa rimbomb":"rimbomba","sa rimbombam":"rimbomba","sa rimbombati":"rimbomba","sa rimbombe":"rimbomba","sa rimbombi":"rimbomba","sa rimelam":"rimela","sa rimelati":"rimela","sa rimelez":"rimela","sa rimeleze":"rimela","sa rimelezi":"rimela","sa rimez":"rima","sa rimeze":"rima","sa rimezi":"rima","sa rindelam":"rindela","sa rindelati":"rindela","sa rindelez":"rindela","sa rindeleze":"rindela","sa rindelezi":"rindela","sa rindeluiasca":"rindelui","sa rindeluiesc":"rindelui","sa rindeluiesti":"rindelui","sa rindeluim":"rindelui","sa rindeluiti":"rindelui","sa rinocerizam":"rinoceriza","sa rinocerizati":"rinoceriza","sa rinocerizez":"rinoceriza","sa rinocerizeze":"rinoceriza","sa rinocerizezi":"rinoceriza","sa ripostam":"riposta","sa ripostati":"riposta","sa ripostez":"riposta","sa riposteze":"riposta","sa ripostezi":"riposta","sa risc":"risca","sa riscam":"risca","sa riscati":"risca","sa risipeasca":"risipi","sa risipesc":"risipi","sa risipesti":"risipi","sa risipim":"risipi","sa risipiti":"risipi","sa riste":"risca","sa risti":"risca","sa ritmam":"ritma","sa ritmati":"ritma","sa ritmez":"ritma","sa ritmeze":"ritma","sa ritmezi":"ritma","sa ritoris":"ritorisi","sa ritorisa":"ritorisi","sa ritorisi":"ritorisi","sa ritorisim":"ritorisi","sa ritorisiti":"ritorisi","sa ritualizam":"ritualiza","sa ritualizati":"ritualiza","sa ritualizez":"ritualiza","sa ritualizeze":"ritualiza","sa ritualizezi":"ritualiza","sa rivalizam":"rivaliza","sa rivalizati":"rivaliza","sa rivalizez":"rivaliza","sa rivalizeze":"rivaliza","sa rivalizezi":"rivaliza","sa roada":"roade","sa roadem":"roade","sa roadeti":"roade","sa roage":"ruga","sa robeasca":"robi","sa robesc":"robi","sa robesti":"robi","sa robim":"robi","sa robiti":"robi","sa roboteasca":"roboti","sa robotesc":"roboti","sa robotesti":"roboti","sa robotim":"roboti","sa robotiti":"roboti","sa robotizam":"robotiza","sa robotizati":"robotiza","sa robotizez":"robotiza","sa robotizeze":"robotiza","sa robotizezi":"robotiza","sa rod":"roade","sa rodeasca":"rodi","sa rodesc":"rodi","sa rodesti":"rodi","sa rodim":"rodi","sa roditi":"rodi","sa rodniceasca":"rodnici","sa rodnicesc":"rodnici","sa rodnicesti":"rodnici","sa rodnicim":"rodnici","sa rodniciti":"rodnici","sa rog":"ruga","sa rogi":"ruga","sa romaneasca":"români","sa romanesc":"români","sa romanesti":"români","sa romanim":"români","sa romaniti":"români","sa romanizam":["să romanizăm","romaniza","să românizăm","româniza"],"sa romanizati":["să romanizați","romaniza","să românizați","româniza"],"sa romanizez":["să romanizez","romaniza","să românizez","româniza"],"sa romanizeze":["să romanizeze","romaniza","să românizeze","româniza"],"sa romanizezi":["să romanizezi","romaniza","să românizezi","româniza"],"sa romantam":"romanța","sa romantati":"romanța","sa romantez":"romanța","sa romanteze":"romanța","sa romantezi":"romanța","sa ronjam":"ronja","sa ronjati":"ronja","sa ronjez":"ronja","sa ronjeze":"ronja","sa ronjezi":"ronja","sa rontai":"ronțăi","sa rontaie":"ronțăi","sa rontaim":"ronțăi","sa rontaiti":"ronțăi","sa roseasca":"roși","sa rosesc":"roși","sa rosesti":"roși","sa rosim":"roși","sa rositi":"roși","sa rosteasca":"rosti","sa rostesc":"rosti","sa rostesti":"rosti","sa rostim":"rosti","sa rostiti":"rosti","sa rostogoleasca":"rostogoli","sa rostogolesc":"rostogoli","sa rostogolesti":"rostogoli","sa rostogolim":"rostogoli","sa rostogoliti":"rostogoli","sa rostuiasca":"rostui","sa rostuiesc":"rostui","sa rostuiesti":"rostui","sa rostuim":"rostui","sa rostuiti":"rostui","sa rotacizam":"rotaciza","sa rotacizati":"rotaciza","sa rotacizez":"rotaciza","sa rotacizeze":"rotaciza","sa rotacizezi":"rotaciza","sa rotam":"rota","sa rotati":"rota","sa roteasca":"roti","sa rotesc":"roti","sa rotesti":"roti","sa rotez":"rota","sa roteze":"rota","sa rotezi":"rota","sa rotim":"roti","sa rotiti":"roti","sa rotocoleasca":"rotocoli","sa rotocolesc":"rotocoli","sa rotocolesti":"rotocoli","sa rotocolim":"rotocoli","sa rotocoliti":"rotocoli","sa rotunjeasca":"rotunji","sa rotunjesc":"rotunji","sa rotunjesti":"rotunji","sa rotunjim":"rotunji","sa rotunjiti":"rotunji","sa rotunzeasca":"rotunzi","sa rotunzesc":"rotunzi","sa rotunzesti":"rotunzi","sa rotunzim":"rotunzi","sa rotunziti":"rotunzi","sa rouam":"roua","sa rouati":"roua","sa rouez":"roua","sa roueze":"roua","sa rouezi":"roua","sa roureze":"roura","sa rozi":"roade","sa rudeasca":"rudi","sa rudesc":"rudi","sa rudesti":"rudi","sa rudim":"rudi","sa ruditi":"rudi","sa rugam":"ruga","sa rugati":"ruga","sa rugeasca":"rugi","sa rugesc":"rugi","sa rugesti":"rugi","sa rugim":"rugi","sa rugineasca":"rugini","sa ruginesc":"rugini","sa ruginesti":"rugini","sa ruginim":"rugini","sa ruginiti":"rugini","sa rugiti":"rugi","sa ruinam":"ruina","sa ruinati":"ruina","sa ruinez":"ruina","sa ruineze":"ruina","sa ruinezi":"ruina","sa rujam":"ruja","sa rujati":"ruja","sa rujez":"ruja","sa rujeze":"ruja","sa rujezi":"ruja","sa rulam":"rula","sa rulati":"rula","sa rulez":"rula","sa ruleze":"rula","sa rulezi":"rula","sa rumeg":"rumega","sa rumegam":"rumega","sa rumegati":"rumega","sa rumege":"rumega","sa rumegi":"rumega","sa rumeneasca":"rumeni","sa rumenesc":"rumeni","sa rumenesti":"rumeni","sa rumenim":"rumeni","sa rumeniti":"rumeni","sa rump":"rumpe","sa rumpa":"rumpe","sa rumpem":"rumpe","sa rumpeti":"rumpe","sa rumpi":"rumpe","sa rup":"rupe","sa rupa":"rupe","sa rupem":"rupe","sa rupeti":"rupe","sa rupi":"rupe","sa ruralizam":"ruraliza","sa ruralizati":"ruraliza","sa ruralizez":"ruraliza","sa ruralizeze":"ruraliza","sa ruralizezi":"ruraliza","sa rusific":"rusifica","sa rusificam":"rusifica","sa rusificati":"rusifica","sa rusifice":"rusifica","sa rusifici":"rusifica","sa rusinam":"rușina","sa rusinati":"rușina","sa rusinez":"rușina","sa rusineze":"rușina","sa rusinezi":"rușina","sa rusticizam":"rusticiza","sa rusticizati":"rusticiza","sa rusticizez":"rusticiza","sa rusticizeze":"rusticiza","sa rusticizezi":"rusticiza","sa rutinam":"rutina","sa rutinati":"rutina","sa rutinez":"rutina","sa rutineze":"rutina","sa rutinezi":"rutina","sa tabaceasca":"tăbăci","sa tabacesc":"tăbăci","sa tabacesti":"tăbăci","sa tabacim":"tăbăci","sa tabaciti":"tăbăci","sa tabar":"tăbărî","sa tabaram":"tăbărî","sa tabarati":"tăbărî","sa tabarceasca":"tăbârci","sa tabarcesc":"tăbârci","sa tabarcesti":"tăbârci","sa tabarcim":"tăbârci","sa tabarciti":"tăbârci","sa tabelam":"tabela","sa tabelati":"tabela","sa tabelez":"tabela","sa tabeleze":"tabela","sa tabelezi":"tabela","sa tabere":"tăbărî","sa taberi":"tăbărî","sa tabluiasca":"tăblui","sa tabluiesc":"tăblui","sa tabluiesti":"tăblui","sa tabluim":"tăblui","sa tabluiti":"tăblui","sa tac":"tăcea","sa taca":"tăcea","sa tacaiasca":["să tâcâiască","tâcâi","să tăcăiască","tăcăi"],"sa tacaiesc":["să tâcâiesc","tâcâi","să tăcăiesc","tăcăi"],"sa tacaiesti":["să tâcâiești","tâcâi","să tăcăiești","tăcăi"],"sa tacaim":["să tâcâim","tâcâi","să tăcăim","tăcăi"],"sa tacaiti":["să tâcâiți","tâcâi","să tăcăiți","tăcăi"],"sa tacaneasca":"țăcăni","sa tacanesc":"țăcăni","sa tacanesti":"țăcăni","sa tacanim":"țăcăni","sa tacaniti":"țăcăni","sa tacem":"tăcea","sa taceti":"tăcea","sa tachinam":"tachina","sa tachinati":"tachina","sa tachinez":"tachina","sa tachineze":"tachina","sa tachinezi":"tachina","sa taci":"tăcea","sa taciunam":"tăciuna","sa taciunati":"tăciuna","sa taciunez":"tăciuna","sa taciuneze":"tăciuna","sa taciunezi":"tăciuna","sa tactam":"tacta","sa tactati":"tacta","sa tactez":"tacta","sa tacteze":"tacta","sa tactezi":"tacta","sa tafneasca":"țâfni","sa tafnesc":"țâfni","sa tafnesti":"țâfni","sa tafnim":"țâfni","sa tafniti":"țâfni","sa tagaduiasca":"tăgădui","sa tagaduiesc":"tăgădui","sa tagaduiesti":"tăgădui","sa tagaduim":"tăgădui","sa tagaduiti":"tăgădui","sa tai":"tăia","sa taiati":"tăia","sa taie":"tăia","sa taiem":"tăia","sa taifasuiasca":"tăifăsui","sa taifasuiesc":"tăifăsui","sa taifasuiesti":"tăifăsui","sa taifasuim":"tăifăsui","sa taifasuiti":"tăifăsui","sa tainuiasca":"tăinui","sa tainuiesc":"tăinui","sa tainuiesti":"tăinui","sa tainuim":"tăinui","sa tainuiti":"tăinui","sa talalaiasca":"tălălăi","sa talalaiesc":"tălălăi","sa talalaiesti":"tălălăi","sa talalaim":"tălălăi","sa talalaiti":"tălălăi","sa talasmaneasca":"tălășmăni","sa talasmanesc":"tălășmăni","sa talasmanesti":"tălășmăni","sa talasmanim":"tălășmăni","sa talasmaniti":"tălășmăni","sa talcuiasca":"tâlcui","sa talcuiesc":"tâlcui","sa talcuiesti":"tâlcui","sa talcuim":"tâlcui","sa talcuiti":"tâlcui","sa talhareasca":"tâlhări","sa talharesc":"tâlhări","sa talharesti":"tâlhări","sa talharim":"tâlhări","sa talhariti":"tâlhări","sa talhuiasca":"tâlhui","sa talhuiesc":"tâlhui","sa talhuiesti":"tâlhui","sa talhuim":"tâlhui","sa talhuiti":"tâlhui","sa talmaceasca":"tălmăci","sa talmacesc":"tălmăci","sa talmacesti":"tălmăci","sa talmacim":"tălmăci","sa talmaciti":"tălmăci","sa tamaduiasca":"tămădui","sa tamaduiesc":"tămădui","sa tamaduiesti":"tămădui","sa tamaduim":"tămădui","sa tamaduiti":"tămădui","sa tamaiati":"tămâia","sa tamaiem":"tămâia","sa tamaiez":"tămâia","sa tamaieze":"tămâia","sa tamaiezi":"tămâia","sa tamburinam":"tamburina","sa tamburinati":"tamburina","sa tamburinez":"tamburina","sa tamburineze":"tamburina","sa tamburinezi":"tamburina","sa tampeasca":"tâmpi","sa tampesc":"tâmpi","sa tampesti":"tâmpi","sa tampim":"tâmpi","sa tampin":"tâmpina","sa tampinam":"tâmpina","sa tampinati":"tâmpina","sa tampine":"tâmpina","sa tampini":"tâmpina","sa tampiti":"tâmpi","sa tample":"tâmpla","sa tamponam":"tampona","sa tamponati":"tampona","sa tamponez":"tampona","sa tamponeze":"tampona","sa tamponezi":"tampona","sa tandaleasca":"tândăli","sa tandalesc":"tândăli","sa tandalesti":"tândăli","sa tandalim":"tândăli","sa tandaliti":"tândăli","sa tandareasca":"țăndări","sa tandaresc":"țăndări","sa tandaresti":"țăndări","sa tandarim":"țăndări","sa tandariti":"țăndări","sa tangam":"tanga","sa tangati":"tanga","sa tanghez":"tanga","sa tangheze":"tanga","sa tanghezi":"tanga","sa tanguiasca":"tângui","sa tanguiesc":"tângui","sa tanguiesti":"tângui","sa tanguim":"tângui","sa tanguiti":"tângui","sa tanizam":"taniza","sa tanizati":"taniza","sa tanizez":"taniza","sa tanizeze":"taniza","sa tanizezi":"taniza","sa tanjeasca":"tânji","sa tanjesc":"tânji","sa tanjesti":"tânji","sa tanjim":"tânji","sa tanjiti":"tânji","sa tap":"țâpa","sa tapam":["să tapăm","tapa","să țâpăm","țâpa"],"sa tapati":["să tapați","tapa","să țâpați","țâpa"],"sa tape":"țâpa","sa tapetam":"tapeta","sa tapetati":"tapeta","sa tapetez":"tapeta","sa tapeteze":"tapeta","sa tapetezi":"tapeta","sa tapez":"tapa","sa tapeze":"tapa","sa tapezi":"tapa","sa tapi":"țâpa","sa tapisam":"tapisa","sa tapisati":"tapisa","sa tapisez":"tapisa","sa tapiseze":"tapisa","sa tapisezi":"tapisa","sa tapitam":"tapița","sa tapitati":"tapița","sa tapitez":"tapița","sa tapiteze":"tapița","sa tapitezi":"tapița","sa tapotam":"tapota","sa tapotati":"tapota","sa tapotez":"tapota","sa tapoteze":"tapota","sa tapotezi":"tapota","sa tapureasca":"țâpuri","sa tapuresc":"țâpuri","sa tapuresti":"țâpuri","sa tapurim":"țâpuri","sa tapuriti":"țâpuri","sa taragaiasca":"tărăgăi","sa taragaiati":"tărăgăia","sa taragaiem":"tărăgăia","sa taragaiesc":"tărăgăi","sa taragaiesti":"tărăgăi","sa taragaiez":"tărăgăia","sa taragaieze":"tărăgăia","sa taragaiezi":"tărăgăia","sa taragaim":"tărăgăi","sa taragaiti":"tărăgăi","sa taraganam":"tărăgăna","sa taraganati":"tărăgăna","sa taraganeasca":"tărăgăni","sa taraganesc":"tărăgăni","sa taraganesti":"tărăgăni","sa taraganez":"tărăgăna","sa taraganeze":"tărăgăna","sa taraganezi":"tărăgăna","sa taraganim":"tărăgăni","sa taraganiti":"tărăgăni","sa tarai":["să târâi","târâi","să țârâi","țârâi"],"sa taraie":["să târâie","târâi","să țârâie","țârâi"],"sa taraim":["să târâim","târâi","să țârâim","țârâi"],"sa taraiti":["să târâiți","târâi","să țârâiți","țârâi"],"sa taram":"târî","sa tarasc":"târî","sa tarasca":"târî","sa tarasti":"târî","sa tarati":"târî","sa tarbaceasca":"tărbăci","sa tarbacesc":"tărbăci","sa tarbacesti":"tărbăci","sa tarbacim":"tărbăci","sa tarbaciti":"tărbăci","sa tarcai":"țârcâi","sa tarcaie":"țârcâi","sa tarcaim":"țârcâi","sa tarcaiti":"țârcâi","sa tarcoleasca":"târcoli","sa tarcolesc":"târcoli","sa tarcolesti":"târcoli","sa tarcolim":"târcoli","sa tarcoliti":"târcoli","sa tarcuiasca":"țărcui","sa tarcuiesc":"țărcui","sa tarcuiesti":"țărcui","sa tarcuim":"țărcui","sa tarcuiti":"țărcui","sa targuiasca":"târgui","sa targuiesc":"târgui","sa targuiesti":"târgui","sa targuim":"târgui","sa targuiti":"târgui","sa tarifam":"tarifa","sa tarifati":"tarifa","sa tarifez":"tarifa","sa tarifeze":"tarifa","sa tarifezi":"tarifa","sa tarlai":"țârlăi","sa tarlaie":"țârlăi","sa tarlaim":"țârlăi","sa tarlaiti":"țârlăi","sa tarlalizam":"tarlaliza","sa tarlalizati":"tarlaliza","sa tarlalizez":"tarlaliza","sa tarlalizeze":"tarlaliza","sa tarlalizezi":"tarlaliza","sa tarnoseasca":"târnosi","sa tarnosesc":"târnosi","sa tarnosesti":"târnosi","sa tarnosim":"târnosi","sa tarnositi":"târnosi","sa tarnuiasca":"târnui","sa tarnuiesc":"târnui","sa tarnuiesti":"târnui","sa tarnuim":"târnui","sa tarnuiti":"târnui","sa tarsai":"târșâi","sa tarsaie":"târșâi","sa tarsaim":"târșâi","sa tarsaiti":"târșâi","sa tarseasca":"târși","sa tarsesc":"târși","sa tarsesti":"târși","sa tarsii":"târșii","sa tarsiie":"târșii","sa tarsiim":"târșii","sa tarsiiti":"târșii","sa tarsim":"târși","sa tarsiti":"târși","sa tasam":"tasa","sa tasati":"tasa","sa tasez":"tasa","sa taseze":"tasa","sa tasezi":"tasa","sa tasneasca":"țâșni","sa tasnesc":"țâșni","sa tasnesti":"țâșni","sa tasnim":"țâșni","sa tasniti":"țâșni","sa tastam":"tasta","sa tastati":"tasta","sa tastez":"tasta","sa tasteze":"tasta","sa tastezi":"tasta","sa tataram":"tătărî","sa tatarasc":"tătărî","sa tatarasca":"tătărî","sa tatarasti":"tătărî","sa tatarati":"tătărî","sa tatonam":"tatona","sa tatonati":"tatona","sa tatonez":"tatona","sa tatoneze":"tatona","sa tatonezi":"tatona","sa tatuam":"tatua","sa tatuati":"tatua","sa tatuez":"tatua","sa tatueze":"tatua","sa tatuezi":"tatua","sa tavaleasca":"tăvăli","sa tavalesc":"tăvăli","sa tavalesti":"tăvăli","sa tavalim":"tăvăli","sa tavaliti":"tăvăli","sa taxam":"taxa","sa taxati":"taxa","sa taxez":"taxa","sa taxeze":"taxa","sa taxezi":"taxa","sa teama":"teme","sa teasa":"țese","sa teatralizam":"teatraliza","sa teatralizati":"teatraliza","sa teatralizez":"teatraliza","sa teatralizeze":"teatraliza","sa teatralizezi":"teatraliza","sa tecsuiasca":"tecsui","sa tecsuiesc":"tecsui","sa tecsuiesti":"tecsui","sa tecsuim":"tecsui","sa tecsuiti":"tecsui","sa tehnicizam":"tehniciza","sa tehnicizati":"tehniciza","sa tehnicizez":"tehniciza","sa tehnicizeze":"tehniciza","sa tehnicizezi":"tehniciza","sa tehnologizam":"tehnologiza","sa tehnologizati":"tehnologiza","sa tehnologizez":"tehnologiza","sa tehnologizeze":"tehnologiza","sa tehnologizezi":"tehnologiza","sa tehnoredactam":"tehnoredacta","sa tehnoredactati":"tehnoredacta","sa tehnoredactez":"tehnoredacta","sa tehnoredacteze":"tehnoredacta","sa tehnoredactezi":"tehnoredacta","sa tehuiasca":"tehui","sa tehuiesc":"tehui","sa tehuiesti":"tehui","sa tehuim":"tehui","sa tehuiti":"tehui","sa telecomand":"telecomanda","sa telecomandam":"telecomanda","sa telecomandati":"telecomanda","sa telecomande":"telecomanda","sa telecomanzi":"telecomanda","sa teledifuzam":"teledifuza","sa teledifuzati":"teledifuza","sa teledifuzez":"teledifuza","sa teledifuzeze":"teledifuza","sa teledifuzezi":"teledifuza","sa teledirijam":"teledirija","sa teledirijati":"teledirija","sa teledirijez":"teledirija","sa teledirijeze":"teledirija","sa teledirijezi":"teledirija","sa telefonam":"telefona","sa telefonati":"telefona","sa telefonez":"telefona","sa telefoneze":"telefona","sa telefonezi":"telefona","sa telefotografiati":"telefotografia","sa telefotografiem":"telefotografia","sa telefotografiez":"telefotografia","sa telefotografieze":"telefotografia","sa telefotografiezi":"telefotografia","sa teleghidam":"teleghida","sa teleghidati":"teleghida","sa teleghidez":"teleghida","sa teleghideze":"teleghida","sa teleghidezi":"teleghida","sa telegrafiati":"telegrafia","sa telegrafiem":"telegrafia","sa telegrafiez":"telegrafia","sa telegrafieze":"telegrafia","sa telegrafiezi":"telegrafia","sa teleimprim":"teleimprima","sa teleimprimam":"teleimprima","sa teleimprimati":"teleimprima","sa teleimprime":"teleimprima","sa teleimprimi":"teleimprima","sa televizam":"televiza","sa televizati":"televiza","sa televizez":"televiza","sa televizeze":"televiza","sa televizezi":"televiza","sa tem":"teme","sa tembelizam":"tembeliza","sa tembelizati":"tembeliza","sa tembelizez":"tembeliza","sa tembelizeze":"tembeliza","sa tembelizezi":"tembeliza","sa temem":"teme","sa temeneasca":"temeni","sa temenesc":"temeni","sa temenesti":"temeni","sa temenim":"temeni","sa temeniti":"temeni","sa temeti":"teme","sa temi":"teme","sa temnitam":"temnița","sa temnitati":"temnița","sa temnitez":"temnița","sa temniteze":"temnița","sa temnitezi":"temnița","sa temperam":"tempera","sa temperati":"tempera","sa temperez":"tempera","sa tempereze":"tempera","sa temperezi":"tempera","sa temporizam":"temporiza","sa temporizati":"temporiza","sa temporizez":"temporiza","sa temporizeze":"temporiza","sa temporizezi":"temporiza","sa tencuiasca":"tencui","sa tencuiesc":"tencui","sa tencuiesti":"tencui","sa tencuim":"tencui","sa tencuiti":"tencui","sa tensionam":"tensiona","sa tensionati":"tensiona","sa tensionez":"tensiona","sa tensioneze":"tensiona","sa tensionezi":"tensiona","sa tentam":"tenta","sa tentati":"tenta","sa tentez":"tenta","sa tenteze":"tenta","sa tentezi":"tenta","sa teologizam":"teologiza","sa teologizati":"teologiza","sa teologizez":"teologiza","sa teologizeze":"teologiza","sa teologizezi":"teologiza","sa teoretizam":"teoretiza","sa teoretizati":"teoretiza","sa teoretizez":"teoretiza","sa teoretizeze":"teoretiza","sa teoretizezi":"teoretiza","sa teorizam":"teoriza","sa teorizati":"teoriza","sa teorizez":"teoriza","sa teorizeze":"teoriza","sa teorizezi":"teoriza","sa terasam":"terasa","sa terasati":"terasa","sa terasez":"terasa","sa teraseze":"terasa","sa terasezi":"terasa","sa terciuiasca":"terciui","sa terciuiesc":"terciui","sa terciuiesti":"terciui","sa terciuim":"terciui","sa terciuiti":"terciui","sa terfeleasca":"terfeli","sa terfelesc":"terfeli","sa terfelesti":"terfeli","sa terfelim":"terfeli","sa terfeliti":"terfeli","sa tergiversam":"tergiversa","sa tergiversati":"tergiversa","sa tergiversez":"tergiversa","sa tergiverseze":"tergiversa","sa tergiversezi":"tergiversa","sa terifiati":"terifia","sa terifie":"terifia","sa terifiem":"terifia","sa terifii":"terifia","sa termin":"termina","sa terminam":"termina","sa terminati":"termina","sa termine":"termina","sa termini":"termina","sa termoizolam":"termoizola","sa termoizolati":"termoizola","sa termoizolez":"termoizola","sa termoizoleze":"termoizola","sa termoizolezi":"termoizola","sa termoreglam":"termoregla","sa termoreglati":"termoregla","sa termoreglez":"termoregla","sa termoregleze":"termoregla","sa termoreglezi":"termoregla","sa terorizam":"teroriza","sa terorizati":"teroriza","sa terorizez":"teroriza","sa terorizeze":"teroriza","sa terorizezi":"teroriza","sa tes":"țese","sa tesal":"țesăla","sa tesalam":"țesăla","sa tesalati":"țesăla","sa tesale":"țesăla","sa tesali":"țesăla","sa tescuiasca":"tescui","sa tescuiesc":"tescui","sa tescuiesti":"tescui","sa tescuim":"tescui","sa tescuiti":"tescui","sa teseasca":"teși","sa tesem":"țese","sa tesesc":"teși","sa tesesti":"teși","sa teseti":"țese","sa tesi":"țese","sa tesim":"teși","sa tesiti":"teși","sa testam":"testa","sa testati":"testa","sa testez":"testa","sa testeze":"testa","sa testezi":"testa","sa tetanizam":"tetaniza","sa tetanizati":"tetaniza","sa tetanizez":"tetaniza","sa tetanizeze":"tetaniza","sa tetanizezi":"tetaniza","sa texturam":"textura","sa texturati":"textura","sa texturez":"textura","sa textureze":"textura","sa texturezi":"textura","sa tezaurizam":"tezauriza","sa tezaurizati":"tezauriza","sa tezaurizez":"tezauriza","sa tezaurizeze":"tezauriza","sa tezaurizezi":"tezauriza","sa ticai":"ticăi","sa ticaie":"ticăi","sa ticaim":"ticăi","sa ticaiti":"ticăi","sa ticaloseasca":"ticăloși","sa ticalosesc":"ticăloși","sa ticalosesti":"ticăloși","sa ticalosim":"ticăloși","sa ticalositi":"ticăloși","sa ticluiasca":"ticlui","sa ticluiesc":"ticlui","sa ticluiesti":"ticlui","sa ticluim":"ticlui","sa ticluiti":"ticlui","sa ticneasca":["să ticnească","ticni","să țicnească","țicni"],"sa ticnesc":["să ticnesc","ticni","să țicnesc","țicni"],"sa ticnesti":["să ticnești","ticni","să țicnești","țicni"],"sa ticnim":["să ticnim","ticni","să țicnim","țicni"],"sa ticniti":["să ticniți","ticni","să țicniți","țicni"],"sa ticseasca":"ticsi","sa ticsesc":"ticsi","sa ticsesti":"ticsi","sa ticsim":"ticsi","sa ticsiti":"ticsi","sa tiganeasca":"țigăni","sa tiganesc":"țigăni","sa tiganesti":"țigăni","sa tiganim":"țigăni","sa tiganiti":"țigăni","sa tigheleasca":"tigheli","sa tighelesc":"tigheli","sa tighelesti":"tigheli","sa tighelim":"tigheli","sa tigheliti":"tigheli","sa tigneasca":"tigni","sa tignesc":"tigni","sa tignesti":"tigni","sa tignim":"tigni","sa tigniti":"tigni","sa tihn":"tihni","sa tihna":"tihni","sa tihni":"tihni","sa tihnim":"tihni","sa tihniti":"tihni","sa tii":["să ții","ține","să ții","ținea"],"sa timbram":"timbra","sa timbrati":"timbra","sa timbrez":"timbra","sa timbreze":"timbra","sa timbrezi":"timbra","sa timoram":"timora","sa timorati":"timora","sa timorez":"timora","sa timoreze":"timora","sa timorezi":"timora","sa tin":["să țin","ține","să țin","ținea"],"sa tina":["să țină","ține","să țină","ținea"],"sa tinal":"tinăli","sa tinala":"tinăli","sa tinali":"tinăli","sa tinalim":"tinăli","sa tinaliti":"tinăli","sa tincturam":"tinctura","sa tincturati":"tinctura","sa tincturez":"tinctura","sa tinctureze":"tinctura","sa tincturezi":"tinctura","sa tind":"tinde","sa tinda":"tinde","sa tindem":"tinde","sa tindeti":"tinde","sa tinem":["să ținem","ține","să ținem","ținea"],"sa tineti":["să țineți","ține","să țineți","ținea"],"sa tinteasca":"ținti","sa tintesc":"ținti","sa tintesti":"ținti","sa tintim":"ținti","sa tintiti":"ținti","sa tintuiasca":"țintui","sa tintuiesc":"țintui","sa tintuiesti":"țintui","sa tintuim":"țintui","sa tintuiti":"țintui","sa tinzi":"tinde","sa tip":"țipa","sa tipam":"țipa","sa tipareasca":"tipări","sa tiparesc":"tipări","sa tiparesti":"tipări","sa tiparim":"tipări","sa tipariti":"tipări","sa tiparui":"tipărui","sa tiparuie":"tipărui","sa tiparuim":"tipărui","sa tiparuiti":"tipărui","sa tipati":"țipa","sa tipe":"țipa","sa tipi":"țipa","sa tipizam":"tipiza","sa tipizati":"tipiza","sa tipizez":"tipiza","sa tipizeze":"tipiza","sa tipizezi":"tipiza","sa tipoteasca":"țipoti","sa tipotesc":"țipoti","sa tipotesti":"țipoti","sa tipotim":"țipoti","sa tipotiti":"țipoti","sa tiraniseasca":"tiranisi","sa tiranisesc":"tiranisi","sa tiranisesti":"tiranisi","sa tiranisim":"tiranisi","sa tiranisiti":"tiranisi","sa tiranizam":"tiraniza"};
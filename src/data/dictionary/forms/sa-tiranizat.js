@@ -0,0 +1 @@
+export default {"sa tiranizati":"tiraniza","sa tiranizez":"tiraniza","sa tiranizeze":"tiraniza","sa tiranizezi":"tiraniza","sa tisneasca":"țișni","sa tisnesc":"țișni","sa tisnesti":"țișni","sa tisnim":"țișni","sa tisniti":"țișni","sa titireasca":"titiri","sa titiresc":"titiri","sa titiresti":"titiri","sa titirim":"titiri","sa titiriseasca":"titirisi","sa titirisesc":"titirisi","sa titirisesti":"titirisi","sa titirisim":"titirisi","sa titirisiti":"titirisi","sa titiriti":"titiri","sa titram":"titra","sa titrati":"titra","sa titrez":"titra","sa titreze":"titra","sa titrezi":"titra","sa titularizam":"titulariza","sa titularizati":"titulariza","sa titularizez":"titulariza","sa titularizeze":"titulariza","sa titularizezi":"titulariza","sa tiui":"țiui","sa tiuie":"țiui","sa tiuim":"țiui","sa tiuiti":"țiui","sa tiveasca":"tivi","sa tivesc":"tivi","sa tivesti":"tivi","sa tivim":"tivi","sa tiviti":"tivi","sa toace":"toca","sa toaletam":"toaleta","sa toaletati":"toaleta","sa toaletez":"toaleta","sa toaleteze":"toaleta","sa toaletezi":"toaleta","sa toapsec":"topseca","sa toapsece":"topseca","sa toapseci":"topseca","sa toarca":"toarce","sa toarcem":"toarce","sa toarceti":"toarce","sa toarne":"turna","sa toastam":"toasta","sa toastati":"toasta","sa toastez":"toasta","sa toasteze":"toasta","sa toastezi":"toasta","sa toc":"toca","sa tocai":"țocăi","sa tocaie":"țocăi","sa tocaim":"țocăi","sa tocaiti":"țocăi","sa tocam":"toca","sa tocaneasca":"tocăni","sa tocanesc":"tocăni","sa tocanesti":"tocăni","sa tocanim":"tocăni","sa tocaniti":"tocăni","sa tocati":"toca","sa toceasca":"toci","sa tocesc":"toci","sa tocesti":"toci","sa toci":"toca","sa tocim":"toci","sa tociti":"toci","sa tocmeasca":"tocmi","sa tocmesc":"tocmi","sa tocmesti":"tocmi","sa tocmim":"tocmi","sa tocmiti":"tocmi","sa tojeram":"tojera","sa tojerati":"tojera","sa tojerez":"tojera","sa tojereze":"tojera","sa tojerezi":"tojera","sa tolaneasca":"tolăni","sa tolanesc":"tolăni","sa tolanesti":"tolăni","sa tolanim":"tolăni","sa tolaniti":"tolăni","sa toleram":"tolera","sa tolerati":"tolera","sa tolerez":"tolera","sa tolereze":"tolera","sa tolerezi":"tolera","sa tomnam":"tomna","sa tomnati":"tomna","sa tomnez":"tomna","sa tomneze":"tomna","sa tomnezi":"tomna","sa tonific":"tonifica","sa tonificam":"tonifica","sa tonificati":"tonifica","sa tonifice":"tonifica","sa tonifici":"tonifica","sa topai":"țopăi","sa topaie":"țopăi","sa topaim":"țopăi","sa topaiti":"țopăi","sa topeasca":"topi","sa topesc":"topi","sa topesti":"topi","sa topim":"topi","sa topiti":"topi","sa topsecam":"topseca","sa topsecati":"topseca","sa toraiasca":"torăi","sa toraiesc":"torăi","sa toraiesti":"torăi","sa toraim":"torăi","sa toraiti":"torăi","sa torc":"toarce","sa torci":"toarce","sa torn":"turna","sa torni":"turna","sa toropeasca":"toropi","sa toropesc":"toropi","sa toropesti":"toropi","sa toropim":"toropi","sa toropiti":"toropi","sa torpilam":"torpila","sa torpilati":"torpila","sa torpilez":"torpila","sa torpileze":"torpila","sa torpilezi":"torpila","sa torsionam":"torsiona","sa torsionati":"torsiona","sa torsionez":"torsiona","sa torsioneze":"torsiona","sa torsionezi":"torsiona","sa torturam":"tortura","sa torturati":"tortura","sa torturez":"tortura","sa tortureze":"tortura","sa torturezi":"tortura","sa totalizam":"totaliza","sa totalizati":"totaliza","sa totalizez":"totaliza","sa totalizeze":"totaliza","sa totalizezi":"totaliza","sa tracasam":"tracasa","sa tracasati":"tracasa","sa tracasez":"tracasa","sa tracaseze":"tracasa","sa tracasezi":"tracasa","sa tractam":"tracta","sa tractati":"tracta","sa tractez":"tracta","sa tracteze":"tracta","sa tractezi":"tracta","sa tradam":"trăda","sa tradati":"trăda","sa tradez":"trăda","sa tradeze":"trăda","sa tradezi":"trăda","sa traduc":"traduce","sa traduca":"traduce","sa traducem":"traduce","sa traduceti":"traduce","sa traduci":"traduce","sa traficam":"trafica","sa traficati":"trafica","sa trafichez":"trafica","sa traficheze":"trafica","sa trafichezi":"trafica","sa trag":"trage","sa traga":"trage","sa traganam":"trăgăna","sa traganati":"trăgăna","sa traganez":"trăgăna","sa traganeze":"trăgăna","sa traganezi":"trăgăna","sa tragem":"trage","sa trageti":"trage","sa tragi":"trage","sa traiasca":"trăi","sa traiesc":"trăi","sa traiesti":"trăi","sa traim":"trăi","sa traiti":"trăi","sa trambitam":"trâmbița","sa trambitati":"trâmbița","sa trambitez":"trâmbița","sa trambiteze":"trâmbița","sa trambitezi":"trâmbița","sa trancaneasca":"trăncăni","sa trancanesc":"trăncăni","sa trancanesti":"trăncăni","sa trancanim":"trăncăni","sa trancaniti":"trăncăni","sa tranchilizam":"tranchiliza","sa tranchilizati":"tranchiliza","sa tranchilizez":"tranchiliza","sa tranchilizeze":"tranchiliza","sa tranchilizezi":"tranchiliza","sa trandaveasca":"trândăvi","sa trandavesc":"trândăvi","sa trandavesti":"trândăvi","sa trandavim":"trândăvi","sa trandaviti":"trândăvi","sa transam":"tranșa","sa transati":"tranșa","sa transbordam":"transborda","sa transbordati":"transborda","sa transbordez":"transborda","sa transbordeze":"transborda","sa transbordezi":"transborda","sa transceanda":"transcende","sa transcend":"transcende","sa transcendem":"transcende","sa transcendentalizam":"transcendentaliza","sa transcendentalizati":"transcendentaliza","sa transcendentalizez":"transcendentaliza","sa transcendentalizeze":"transcendentaliza","sa transcendentalizezi":"transcendentaliza","sa transcendeti":"transcende","sa transcenzi":"transcende","sa transcrie":"transcrie","sa transcriem":"transcrie","sa transcrieti":"transcrie","sa transcrii":"transcrie","sa transcriu":"transcrie","sa transez":"tranșa","sa transeze":"tranșa","sa transezi":"tranșa","sa transfer":"transfera","sa transferam":"transfera","sa transferati":"transfera","sa transfere":"transfera","sa transferi":"transfera","sa transfiguram":"transfigura","sa transfigurati":"transfigura","sa transfigurez":"transfigura","sa transfigureze":"transfigura","sa transfigurezi":"transfigura","sa transform":"transforma","sa transformam":"transforma","sa transformati":"transforma","sa transforme":"transforma","sa transformi":"transforma","sa transfuzam":"transfuza","sa transfuzati":"transfuza","sa transfuzez":"transfuza","sa transfuzeze":"transfuza","sa transfuzezi":"transfuza","sa transgresam":"transgresa","sa transgresati":"transgresa","sa transgresez":"transgresa","sa transgreseze":"transgresa","sa transgresezi":"transgresa","sa transhum":"transhuma","sa transhumam":"transhuma","sa transhumati":"transhuma","sa transhume":"transhuma","sa transhumi":"transhuma","sa transig":"transige","sa transiga":"transige","sa transigem":"transige","sa transigeti":"transige","sa transigi":"transige","sa translam":"transla","sa translatam":"translata","sa translatati":"translata","sa translatez":"translata","sa translateze":"translata","sa translatezi":"translata","sa translati":"transla","sa translez":"transla","sa transleze":"transla","sa translezi":"transla","sa transliteram":"translitera","sa transliterati":"translitera","sa transliterez":"translitera","sa translitereze":"translitera","sa transliterezi":"translitera","sa transloc":"transloca","sa translocam":"transloca","sa translocati":"transloca","sa transloce":"transloca","sa transloci":"transloca","sa transmigram":"transmigra","sa transmigrati":"transmigra","sa transmigrez":"transmigra","sa transmigreze":"transmigra","sa transmigrezi":"transmigra","sa transmit":"transmite","sa transmita":"transmite","sa transmitem":"transmite","sa transmiteti":"transmite","sa transmiti":"transmite","sa transmut":"transmuta","sa transmutam":"transmuta","sa transmutati":"transmuta","sa transmute":"transmuta","sa transmuti":"transmuta","sa transpar":"transpărea","sa transpara":"transpărea","sa transparem":"transpărea","sa transpareti":"transpărea","sa transpari":"transpărea","sa transpir":"transpira","sa transpiram":"transpira","sa transpirati":"transpira","sa transpire":"transpira","sa transpiri":"transpira","sa transplantam":"transplanta","sa transplantati":"transplanta","sa transplantez":"transplanta","sa transplanteze":"transplanta","sa transplantezi":"transplanta","sa transport":"transporta","sa transportam":"transporta","sa transportati":"transporta","sa transporte":"transporta","sa transporti":"transporta","sa transportui":"transportui","sa transportuie":"transportui","sa transportuim":"transportui","sa transportuiti":"transportui","sa transpui":"transpune","sa transpun":"transpune","sa transpuna":"transpune","sa transpunem":"transpune","sa transpuneti":"transpune","sa transsubstantiati":"transsubstanția","sa transsubstantiem":"transsubstanția","sa transsubstantiez":"transsubstanția","sa transsubstantieze":"transsubstanția","sa transsubstantiezi":"transsubstanția","sa transvazam":"transvaza","sa transvazati":"transvaza","sa transvazez":"transvaza","sa transvazeze":"transvaza","sa transvazezi":"transvaza","sa tranteasca":"trânti","sa trantesc":"trânti","sa trantesti":"trânti","sa trantim":"trânti","sa trantiti":"trânti","sa trantoreasca":"trântori","sa trantoresc":"trântori","sa trantoresti":"trântori","sa trantorim":"trântori","sa trantoriti":"trântori","sa tranzactionam":"tranzacționa","sa tranzactionati":"tranzacționa","sa tranzactionez":"tranzacționa","sa tranzactioneze":"tranzacționa","sa tranzactionezi":"tranzacționa","sa tranzistorizam":"tranzistoriza","sa tranzistorizati":"tranzistoriza","sa tranzistorizez":"tranzistoriza","sa tranzistorizeze":"tranzistoriza","sa tranzistorizezi":"tranzistoriza","sa tranzitam":"tranzita","sa tranzitati":"tranzita","sa tranzitez":"tranzita","sa tranziteze":"tranzita","sa tranzitezi":"tranzita","sa trasam":"trasa","sa trasati":"trasa","sa trasez":"trasa","sa traseze":"trasa","sa trasezi":"trasa","sa trasneasca":"trăsni","sa trasnesc":"trăsni","sa trasnesti":"trăsni","sa trasnim":"trăsni","sa trasniti":"trăsni","sa tratam":"trata","sa tratati":"trata","sa tratez":"trata","sa trateze":"trata","sa tratezi":"trata","sa traulam":"traula","sa traulati":"traula","sa traulez":"traula","sa trauleze":"traula","sa traulezi":"traula","sa traumatizam":"traumatiza","sa traumatizati":"traumatiza","sa traumatizez":"traumatiza","sa traumatizeze":"traumatiza","sa traumatizezi":"traumatiza","sa traversam":"traversa","sa traversati":"traversa","sa traversez":"traversa","sa traverseze":"traversa","sa traversezi":"traversa","sa travesteasca":"travesti","sa travestesc":"travesti","sa travestesti":"travesti","sa travestim":"travesti","sa travestiti":"travesti","sa treaca":"trece","sa trebaluiasca":"trebălui","sa trebaluiesc":"trebălui","sa trebaluiesti":"trebălui","sa trebaluim":"trebălui","sa trebaluiti":"trebălui","sa trebuiasca":"trebui","sa trebuiesc":"trebui","sa trebuiesti":"trebui","sa trebuim":"trebui","sa trebuiti":"trebui","sa trec":"trece","sa trecem":"trece","sa treceti":"trece","sa treci":"trece","sa treier":"treiera","sa treieram":"treiera","sa treierati":"treiera","sa treiere":"treiera","sa treieri":"treiera","sa tremur":"tremura","sa tremuram":"tremura","sa tremurati":"tremura","sa tremure":"tremura","sa tremuri":"tremura","sa trenam":"trena","sa trenati":"trena","sa trenez":"trena","sa treneze":"trena","sa trenezi":"trena","sa trentuiasca":"trențui","sa trentuiesc":"trențui","sa trentuiesti":"trențui","sa trentuim":"trențui","sa trentuiti":"trențui","sa trepad":"trepăda","sa trepadam":"trepăda","sa trepadati":"trepăda","sa trepanam":"trepana","sa trepanati":"trepana","sa trepanez":"trepana","sa trepaneze":"trepana","sa trepanezi":"trepana","sa trepede":"trepăda","sa trepezi":"trepăda","sa trepidam":"trepida","sa trepidati":"trepida","sa trepidez":"trepida","sa trepideze":"trepida","sa trepidezi":"trepida","sa tresalt":"tresălta","sa tresaltam":"tresălta","sa tresaltati":"tresălta","sa tresalte":"tresălta","sa tresalti":"tresălta","sa tresar":"tresări","sa tresara":"tresări","sa tresari":"tresări","sa tresarim":"tresări","sa tresariti":"tresări","sa trezeasca":"trezi","sa trezesc":"trezi","sa trezesti":"trezi","sa trezim":"trezi","sa treziti":"trezi","sa triangulam":"triangula","sa triangulati":"triangula","sa triangulez":"triangula","sa trianguleze":"triangula","sa triangulezi":"triangula","sa triati":"tria","sa tricotam":"tricota","sa tricotati":"tricota","sa tricotez":"tricota","sa tricoteze":"tricota","sa tricotezi":"tricota","sa triem":"tria","sa trier":"triera","sa trieram":"triera","sa trierati":"triera","sa triere":"triera","sa trieri":"triera","sa triez":"tria","sa trieze":"tria","sa triezi":"tria","sa trifurc":"trifurca","sa trifurcam":"trifurca","sa trifurcati":"trifurca","sa trifurce":"trifurca","sa trifurci":"trifurca","sa triluiasca":"trilui","sa triluiesc":"trilui","sa triluiesti":"trilui","sa triluim":"trilui","sa triluiti":"trilui","sa trimet":"trimete","sa trimeta":"trimete","sa trimetem":"trimete","sa trimeteti":"trimete","sa trimeti":"trimete","sa trimit":"trimite","sa trimita":"trimite","sa trimitem":"trimite","sa trimiteti":"trimite","sa trimiti":"trimite","sa triplam":"tripla","sa triplati":"tripla","sa triplez":"tripla","sa tripleze":"tripla","sa triplezi":"tripla","sa tripotam":"tripota","sa tripotati":"tripota","sa tripotez":"tripota","sa tripoteze":"tripota","sa tripotezi":"tripota","sa trisam":"trișa","sa trisati":"trișa","sa trisez":"trișa","sa triseze":"trișa","sa trisezi":"trișa","sa trituram":"tritura","sa triturati":"tritura","sa triturez":"tritura","sa tritureze":"tritura","sa triturezi":"tritura","sa triumfam":"triumfa","sa triumfati":"triumfa","sa triumfez":"triumfa","sa triumfeze":"triumfa","sa triumfezi":"triumfa","sa trivializam":"trivializa","sa trivializati":"trivializa","sa trivializez":"trivializa","sa trivializeze":"trivializa","sa trivializezi":"trivializa","sa troieneasca":"troieni","sa troienesc":"troieni","sa troienesti":"troieni","sa troienim":"troieni","sa troieniti":"troieni","sa tromboneasca":"tromboni","sa trombonesc":"tromboni","sa trombonesti":"tromboni","sa trombonim":"tromboni","sa tromboniti":"tromboni","sa tronam":"trona","sa tronati":"trona","sa troncaneasca":"troncăni","sa troncanesc":"troncăni","sa troncanesti":"troncăni","sa troncanim":"troncăni","sa troncaniti":"troncăni","sa tronez":"trona","sa troneze":"trona","sa tronezi":"trona","sa tropai":"tropăi","sa tropaie":"tropăi","sa tropaim":"tropăi","sa tropaiti":"tropăi","sa tropicalizam":"tropicaliza","sa tropicalizati":"tropicaliza","sa tropicalizez":"tropicaliza","sa tropicalizeze":"tropicaliza","sa tropicalizezi":"tropicaliza","sa tropotam":"tropota","sa tropotati":"tropota","sa tropoteasca":"tropoti","sa tropotesc":"tropoti","sa tropotesti":"tropoti","sa tropotez":"tropota","sa tropoteze":"tropota","sa tropotezi":"tropota","sa tropotim":"tropoti","sa tropotiti":"tropoti","sa trosneasca":"trosni","sa trosnesc":"trosni","sa trosnesti":"trosni","sa trosnim":"trosni","sa trosniti":"trosni","sa trotam":"trota","sa trotati":"trota","sa trotez":"trota","sa troteze":"trota","sa trotezi":"trota","sa trotinam":"trotina","sa trotinati":"trotina","sa trotinez":"trotina","sa trotineze":"trotina","sa trotinezi":"trotina","sa trucam":"truca","sa trucati":"truca","sa truchez":"truca","sa trucheze":"truca","sa truchezi":"truca","sa trudeasca":"trudi","sa trudesc":"trudi","sa trudesti":"trudi","sa trudim":"trudi","sa truditi":"trudi","sa trunchiati":"trunchia","sa trunchiem":"trunchia","sa trunchiez":"trunchia","sa trunchieze":"trunchia","sa trunchiezi":"trunchia","sa tuberculizam":"tuberculiza","sa tuberculizati":"tuberculiza","sa tuberculizez":"tuberculiza","sa tuberculizeze":"tuberculiza","sa tuberculizezi":"tuberculiza","sa tuc":"țuca","sa tucam":"țuca","sa tucati":"țuca","sa tuce":"țuca","sa tuci":"țuca","sa tudumaneasca":"tudumăni","sa tudumanesc":"tudumăni","sa tudumanesti":"tudumăni","sa tudumanim":"tudumăni","sa tudumaniti":"tudumăni","sa tufleasca":"tufli","sa tuflesc":"tufli","sa tuflesti":"tufli","sa tuflim":"tufli","sa tufliti":"tufli","sa tuicareasca":"țuicări","sa tuicaresc":"țuicări","sa tuicaresti":"țuicări","sa tuicarim":"țuicări","sa tuicariti":"țuicări","sa tuicuiasca":"țuicui","sa tuicuiesc":"țuicui","sa tuicuiesti":"țuicui","sa tuicuim":"țuicui","sa tuicuiti":"țuicui","sa tulbur":"tulbura","sa tulburam":"tulbura","sa tulburati":"tulbura","sa tulbure":"tulbura","sa tulburi":"tulbura","sa tuleasca":"tuli","sa tulesc":"tuli","sa tulesti":"tuli","sa tulim":"tuli","sa tuliti":"tuli","sa tumaneasca":"tumăni","sa tumanesc":"tumăni","sa tumanesti":"tumăni","sa tumanim":"tumăni","sa tumaniti":"tumăni","sa tumefiati":"tumefia","sa tumefie":"tumefia","sa tumefiem":"tumefia","sa tumefii":"tumefia","sa tun":"tuna","sa tunam":"tuna","sa tunati":"tuna","sa tund":"tunde","sa tunda":"tunde","sa tundem":"tunde","sa tundeti":"tunde","sa tune":"tuna","sa tuni":"tuna","sa tunzi":"tunde","sa tupai":"țupăi","sa tupaie":"țupăi","sa tupaim":"țupăi","sa tupaiti":"țupăi","sa tupilam":"tupila","sa tupilati":"tupila","sa tupilez":"tupila","sa tupileze":"tupila","sa tupilezi":"tupila","sa turbam":"turba","sa turbati":"turba","sa turbez":"turba","sa turbeze":"turba","sa turbezi":"turba","sa turbur":"turbura","sa turburam":"turbura","sa turburati":"turbura","sa turbure":"turbura","sa turburi":"turbura","sa turceasca":"turci","sa turcesc":"turci","sa turcesti":"turci","sa turcim":"turci","sa turciti":"turci","sa turlaceasca":"turlăci","sa turlacesc":"turlăci","sa turlacesti":"turlăci","sa turlacim":"turlăci","sa turlaciti":"turlăci","sa turmentam":"turmenta","sa turmentati":"turmenta","sa turmentez":"turmenta","sa turmenteze":"turmenta","sa turmentezi":"turmenta","sa turnam":"turna","sa turnati":"turna","sa turnez":"turna","sa turneze":"turna","sa turnezi":"turna","sa turteasca":"turti","sa turtesc":"turti","sa turtesti":"turti","sa turtim":"turti","sa turtiti":"turti","sa turui":"turui","sa turuie":"turui","sa turuim":"turui","sa turuiti":"turui","sa tusam":"tușa","sa tusati":"tușa","sa tuseasca":"tuși","sa tusesc":"tuși","sa tusesti":"tuși","sa tusez":"tușa","sa tuseze":"tușa","sa tusezi":"tușa","sa tusim":"tuși","sa tusinam":"tușina","sa tusinati":"tușina","sa tusinez":"tușina","sa tusineze":"tușina","sa tusinezi":"tușina","sa tusiti":"tuși","sa tutelam":"tutela","sa tutelati":"tutela","sa tutelez":"tutela","sa tuteleze":"tutela","sa tutelezi":"tutela","sa tutoram":"tutora","sa tutorati":"tutora","sa tutorez":"tutora","sa tutoreze":"tutora","sa tutorezi":"tutora","sa tutui":"țuțuia","sa tutuiasca":"tutui","sa tutuiati":"țuțuia","sa tutuie":"țuțuia","sa tutuiem":"țuțuia","sa tutuiesc":"tutui","sa tutuiesti":"tutui","sa tutuim":"tutui","sa tutuiti":"tutui","sa uceniceasca":"ucenici","sa ucenicesc":"ucenici","sa ucenicesti":"ucenici","sa ucenicim":"ucenici","sa uceniciti":"ucenici","sa ucid":"ucide","sa ucida":"ucide","sa ucidem":"ucide","sa ucideti":"ucide","sa ucizi":"ucide","sa ud":"uda","sa udam":"uda","sa udati":"uda","sa ude":"uda","sa uiasca":"ui","sa uiesc":"ui","sa uiesti":"ui","sa uim":"ui","sa uimeasca":"uimi","sa uimesc":"uimi","sa uimesti":"uimi","sa uimim":"uimi","sa uimiti":"uimi","sa uit":"uita","sa uitam":"uita","sa uitati":"uita","sa uite":"uita","sa uiti":["să uiți","ui","să uiți","uita"],"sa ulceram":"ulcera","sa ulcerati":"ulcera","sa ulcerez":"ulcera","sa ulcereze":"ulcera","sa ulcerezi":"ulcera","sa uleiati":"uleia","sa uleiem":"uleia","sa uleiez":"uleia","sa uleieze":"uleia","sa uleiezi":"uleia","sa ultragiati":"ultragia","sa ultragiem":"ultragia","sa ultragiez":"ultragia","sa ultragieze":"ultragia","sa ultragiezi":"ultragia","sa uluiasca":"ului","sa uluiesc":"ului","sa uluiesti":"ului","sa uluim":"ului","sa uluiti":"ului","sa umanizam":"umaniza","sa umanizati":"umaniza","sa umanizez":"umaniza","sa umanizeze":"umaniza","sa umanizezi":"umaniza","sa umblam":"umbla","sa umblati":"umbla","sa umble":"umbla","sa umbli":"umbla","sa umblu":"umbla","sa umbreasca":"umbri","sa umbresc":"umbri","sa umbresti":"umbri","sa umbrim":"umbri","sa umbriti":"umbri","sa umectam":"umecta","sa umectati":"umecta","sa umectez":"umecta","sa umecteze":"umecta","sa umectezi":"umecta","sa umezeasca":"umezi","sa umezesc":"umezi","sa umezesti":"umezi","sa umezim":"umezi","sa umeziti":"umezi","sa umflam":"umfla","sa umflati":"umfla","sa umfle":"umfla","sa umfli":"umfla","sa umflu":"umfla","sa umidific":"umidifica","sa umidificam":"umidifica","sa umidificati":"umidifica","sa umidifice":"umidifica","sa umidifici":"umidifica","sa umilam":"umila","sa umilati":"umila","sa umileasca":"umili","sa umilesc":"umili","sa umilesti":"umili","sa umilez":"umila","sa umileze":"umila","sa umilezi":"umila","sa umilim":"umili","sa umiliti":"umili","sa umple":"umple","sa umplem":"umple","sa umpleti":"umple","sa umpli":"umple","sa umplu":"umple","sa undam":"unda","sa undati":"unda","sa undeasca":"undi","sa undesc":"undi","sa undesti":"undi","sa undez":"unda","sa undeze":"unda","sa undezi":"unda","sa undim":"undi","sa unditi":"undi","sa undoiasca":"undoi","sa undoiati":"undoia","sa undoiem":"undoia","sa undoiesc":"undoi","sa undoiesti":"undoi","sa undoiez":"undoia","sa undoieze":"undoia","sa undoiezi":"undoia","sa undoim":"undoi","sa undoiti":"undoi","sa unduiasca":"undui","sa unduiesc":"undui","sa unduiesti":"undui","sa unduim":"undui","sa unduiti":"undui","sa undulam":"undula","sa undulati":"undula","sa undulez":"undula","sa unduleze":"undula","sa undulezi":"undula","sa uneasca":"uni","sa unelteasca":"unelti","sa uneltesc":"unelti","sa uneltesti":"unelti","sa uneltim":"unelti","sa uneltiti":"unelti","sa unesc":"uni","sa unesti":"uni","sa ung":"unge","sa unga":"unge","sa ungem":"unge","sa ungeti":"unge","sa ungi":"unge","sa unicizam":"uniciza","sa unicizati":"uniciza","sa unicizez":"uniciza","sa unicizeze":"uniciza","sa unicizezi":"uniciza","sa unidimensionam":"unidimensiona","sa unidimensionati":"unidimensiona","sa unidimensionez":"unidimensiona","sa unidimensioneze":"unidimensiona","sa unidimensionezi":"unidimensiona","sa unific":"unifica","sa unificam":"unifica","sa unificati":"unifica","sa unifice":"unifica","sa unifici":"unifica","sa uniformizam":"uniformiza","sa uniformizati":"uniformiza","sa uniformizez":"uniformiza","sa uniformizeze":"uniformiza","sa uniformizezi":"uniformiza","sa unim":"uni","sa uniti":"uni","sa universalizam":"universaliza","sa universalizati":"universaliza","sa universalizez":"universaliza","sa universalizeze":"universaliza","sa universalizezi":"universaliza","sa upercutam":"upercuta","sa upercutati":"upercuta","sa upercutez":"upercuta","sa upercuteze":"upercuta","sa upercutezi":"upercuta","sa upovaiasca":"upovăi","sa upovaiesc":"upovăi","sa upovaiesti":"upovăi","sa upovaim":"upovăi","sa upovaiti":"upovăi","sa uram":["să urăm","ura","să urâm","urî"],"sa urasc":"urî","sa urasca":"urî","sa urasti":"urî","sa urateasca":"urâți","sa uratesc":"urâți","sa uratesti":"urâți","sa urati":["să urați","ura","să urâți","urî"],"sa uratim":"urâți","sa uratiti":"urâți","sa urbanizam":"urbaniza","sa urbanizati":"urbaniza","sa urbanizez":"urbaniza","sa urbanizeze":"urbaniza","sa urbanizezi":"urbaniza","sa urc":"urca","sa urcam":"urca","sa urcati":"urca","sa urce":"urca","sa urci":"urca","sa urdeasca":"urdi","sa urdesc":"urdi","sa urdesti":"urdi","sa urdim":"urdi","sa urdin":"urdina","sa urdinam":"urdina","sa urdinati":"urdina","sa urdine":"urdina","sa urdini":"urdina","sa urditi":"urdi","sa urduc":"urduca","sa urducam":"urduca","sa urducati":"urduca","sa urduce":"urduca","sa urduci":"urduca","sa urecheati":"urechea","sa urechem":"urechea","sa urechez":"urechea","sa urecheze":"urechea","sa urechezi":"urechea","sa urez":"ura","sa ureze":"ura","sa urezi":"ura","sa urgentam":"urgenta","sa urgentati":"urgenta","sa urgentez":"urgenta","sa urgenteze":"urgenta","sa urgentezi":"urgenta","sa urgiseasca":"urgisi","sa urgisesc":"urgisi","sa urgisesti":"urgisi","sa urgisim":"urgisi","sa urgisiti":"urgisi","sa urinam":"urina","sa urinati":"urina","sa urinez":"urina","sa urineze":"urina","sa urinezi":"urina","sa urlam":"urla","sa urlati":"urla","sa urle":"urla","sa urli":"urla","sa urlu":"urla","sa urluiasca":"urlui","sa urluiesc":"urlui","sa urluiesti":"urlui","sa urluim":"urlui","sa urluiti":"urlui","sa urmam":"urma","sa urmareasca":"urmări","sa urmaresc":"urmări","sa urmaresti":"urmări","sa urmarim":"urmări","sa urmariti":"urmări","sa urmati":"urma","sa urmez":"urma","sa urmeze":"urma","sa urmezi":"urma","sa urmui":"urmui","sa urmuie":"urmui","sa urmuim":"urmui","sa urmuiti":"urmui","sa urneasca":"urni","sa urnesc":"urni","sa urnesti":"urni","sa urnim":"urni","sa urniti":"urni","sa urseasca":"ursi","sa ursesc":"ursi","sa ursesti":"ursi","sa ursim":"ursi","sa ursiti":"ursi","sa uruiasca":"urui","sa uruiesc":"urui","sa uruiesti":"urui","sa uruim":"urui","sa uruiti":"urui","sa urzeasca":"urzi","sa urzesc":"urzi","sa urzesti":"urzi","sa urzic":"urzica","sa urzicam":"urzica","sa urzicati":"urzica","sa urzice":"urzica","sa urzici":"urzica","sa urzim":"urzi","sa urziti":"urzi","sa uscam":"usca","sa uscati":"usca","sa uscheasca":"ușchi","sa uschesc":"ușchi","sa uschesti":"ușchi","sa uschim":"ușchi","sa uschiti":"ușchi","sa usture":"ustura","sa usturoiati":"usturoia","sa usturoiem":"usturoia","sa usturoiez":"usturoia","sa usturoieze":"usturoia","sa usturoiezi":"usturoia","sa usuc":"usca","sa usuce":"usca","sa usuci":"usca","sa usuiasca":"ușui","sa usuiesc":"ușui","sa usuiesti":"ușui","sa usuim":"ușui","sa usuiti":"ușui","sa usuram":"ușura","sa usurati":"ușura","sa usurez":"ușura","sa usureze":"ușura","sa usurezi":"ușura","sa utilam":"utila","sa utilati":"utila","sa utilez":"utila","sa utileze":"utila","sa utilezi":"utila","sa utilizam":"utiliza","sa utilizati":"utiliza","sa utilizez":"utiliza","sa utilizeze":"utiliza","sa utilizezi":"utiliza","sa uzam":"uza","sa uzati":"uza","sa uzez":"uza","sa uzeze":"uza","sa uzezi":"uza","sa uzi":"uda","sa uzinam":"uzina","sa uzinati":"uzina","sa uzinez":"uzina","sa uzineze":"uzina","sa uzinezi":"uzina","sa uzitam":"uzita","sa uzitati":"uzita","sa uzitez":"uzita","sa uziteze":"uzita","sa uzitezi":"uzita","sa uzurp":"uzurpa","sa uzurpam":"uzurpa","sa uzurpati":"uzurpa","sa uzurpe":"uzurpa","sa uzurpi":"uzurpa","sa vaccinam":"vaccina","sa vaccinati":"vaccina","sa vaccinez":"vaccina","sa vaccineze":"vaccina","sa vaccinezi":"vaccina","sa vacsuiasca":"văcsui","sa vacsuiesc":"văcsui","sa vacsuiesti":"văcsui","sa vacsuim":"văcsui","sa vacsuiti":"văcsui","sa vacuiasca":"văcui","sa vacuiesc":"văcui","sa vacuiesti":"văcui","sa vacuim":"văcui","sa vacuiti":"văcui","sa vad":"vedea","sa vada":"vedea","sa vadeasca":"vădi","sa vadesc":"vădi","sa vadesti":"vădi","sa vadim":"vădi","sa vaditi":"vădi","sa vaduveasca":"văduvi","sa vaduvesc":"văduvi","sa vaduvesti":"văduvi","sa vaduvim":"văduvi","sa vaduviti":"văduvi","sa vagabondam":"vagabonda","sa vagabondati":"vagabonda","sa vagabondez":"vagabonda","sa vagabondeze":"vagabonda","sa vagabondezi":"vagabonda","sa vaicaram":"văicăra","sa vaicarati":"văicăra","sa vaicareasca":"văicări","sa vaicaresc":"văicări","sa vaicaresti":"văicări","sa vaicarez":"văicăra","sa vaicareze":"văicăra","sa vaicarezi":"văicăra","sa vaicarim":"văicări","sa vaicariti":"văicări","sa vaiet":"văieta","sa vaietam":"văieta","sa vaietati":"văieta","sa vaiete":"văieta","sa vaieti":"văieta","sa vait":"văita","sa vaitam":"văita","sa vaitati":"văita","sa vaite":"văita","sa vaiti":"văita","sa vajai":"vâjâi","sa vajaie":"vâjâi","sa vajaim":"vâjâi","sa vajaiti":"vâjâi","sa vajeasca":["să vâjească","vâji","să văjească","văji"],"sa vajesc":["să vâjesc","vâji","să văjesc","văji"],"sa vajesti":["să vâjești","vâji","să văjești","văji"],"sa vajii":"vâjii","sa vajiie":"vâjii","sa vajiim":"vâjii","sa vajiiti":"vâjii","sa vajim":["să vâjim","vâji","să văjim","văji"],"sa vajiti":["să vâjiți","vâji","să văjiți","văji"],"sa validam":"valida","sa validati":"valida","sa validez":"valida","sa valideze":"valida","sa validezi":"valida","sa valoram":"valora","sa valorati":"valora","sa valorez":"valora","sa valoreze":"valora","sa valorezi":"valora","sa valorific":"valorifica","sa valorificam":"valorifica","sa valorificati":"valorifica","sa valorifice":"valorifica","sa valorifici":"valorifica","sa valorizam":"valoriza","sa valorizati":"valoriza","sa valorizez":"valoriza","sa valorizeze":"valoriza","sa valorizezi":"valoriza","sa valsam":"valsa","sa valsati":"valsa","sa valsez":"valsa","sa valseze":"valsa","sa valsezi":"valsa","sa valtuiasca":"vălțui","sa valtuiesc":"vălțui","sa valtuiesti":"vălțui","sa valtuim":"vălțui","sa valtuiti":"vălțui","sa vampirizam":"vampiriza","sa vampirizati":"vampiriza","sa vampirizez":"vampiriza","sa vampirizeze":"vampiriza","sa vampirizezi":"vampiriza","sa vamuiasca":"vămui","sa vamuiesc":"vămui","sa vamuiesti":"vămui","sa vamuim":"vămui","sa vamuiti":"vămui","sa vanam":"vâna","sa vanati":"vâna","sa vand":"vinde","sa vanda":"vinde","sa vandalizam":"vandaliza","sa vandalizati":"vandaliza","sa vandalizez":"vandaliza","sa vandalizeze":"vandaliza","sa vandalizezi":"vandaliza","sa vanez":"vâna","sa vaneze":"vâna","sa vanezi":"vâna","sa vansleasca":"vânsli","sa vanslesc":"vânsli","sa vanslesti":"vânsli","sa vanslim":"vânsli","sa vansliti":"vânsli","sa vantui":"vântui","sa vantuie":"vântui","sa vantuim":"vântui","sa vantuiti":"vântui","sa vantur":"vântura","sa vanturam":"vântura","sa vanturati":"vântura","sa vanture":"vântura","sa vanturi":"vântura","sa vanzoleasca":"vânzoli","sa vanzolesc":"vânzoli","sa vanzolesti":"vânzoli","sa vanzolim":"vânzoli","sa vanzoliti":"vânzoli","sa vapaiati":"văpăia","sa vapaiem":"văpăia","sa vapaiez":"văpăia","sa vapaieze":"văpăia","sa vapaiezi":"văpăia","sa vapam":"vapa","sa vapati":"vapa","sa vapez":"vapa","sa vapeze":"vapa","sa vapezi":"vapa","sa vaporizam":"vaporiza","sa vaporizati":"vaporiza","sa vaporizez":"vaporiza","sa vaporizeze":"vaporiza","sa vaporizezi":"vaporiza","sa vapseasca":"văpsi","sa vapsesc":"văpsi","sa vapsesti":"văpsi","sa vapsim":"văpsi","sa vapsiti":"văpsi","sa var":"vârî","sa varam":["să vărăm","văra","să vârâm","vârî"],"sa varati":["să vărați","văra","să vârâți","vârî"],"sa vare":"vârî","sa varez":"văra","sa vareze":"văra","sa varezi":"văra","sa varfuiasca":"vârfui","sa varfuiesc":"vârfui","sa varfuiesti":"vârfui","sa varfuim":"vârfui","sa varfuiti":"vârfui","sa vargam":"vărga","sa vargati":"vărga","sa varghez":"vărga","sa vargheze":"vărga","sa varghezi":"vărga","sa vari":"vârî","sa variati":"varia","sa variem":"varia","sa variez":"varia","sa varieze":"varia","sa variezi":"varia","sa vars":"vărsa","sa varsam":"vărsa","sa varsati":"vărsa","sa vartejeasca":"vârteji","sa vartejesc":"vârteji","sa vartejesti":"vârteji","sa vartejim":"vârteji","sa vartejiti":"vârteji","sa vartejuiasca":"vârtejui","sa vartejuiesc":"vârtejui","sa vartejuiesti":"vârtejui","sa vartejuim":"vârtejui","sa vartejuiti":"vârtejui","sa varuiasca":"vărui","sa varuiesc":"vărui","sa varuiesti":"vărui","sa varuim":"vărui","sa varuiti":"vărui","sa varzuiasca":"vărzui","sa varzuiesc":"vărzui","sa varzuiesti":"vărzui","sa varzuim":"vărzui","sa varzuiti":"vărzui","sa vasareasca":"văsări","sa vasaresc":"văsări","sa vasaresti":"văsări","sa vasarim":"văsări","sa vasariti":"văsări","sa vasculariz":"vasculariza","sa vascularizam":"vasculariza","sa vascularizati":"vasculariza","sa vascularize":"vasculariza","sa vascularizi":"vasculariza","sa vaslam":"vâsla","sa vaslati":"vâsla","sa vasleasca":"vâsli","sa vaslesc":"vâsli","sa vaslesti":"vâsli","sa vaslez":"vâsla","sa vasleze":"vâsla","sa vaslezi":"vâsla","sa vaslim":"vâsli","sa vasliti":"vâsli","sa vatajeasca":"vătăji","sa vatajesc":"vătăji","sa vatajesti":"vătăji","sa vatajim":"vătăji","sa vatajiti":"vătăji","sa vatam":"vătăma","sa vatamam":"vătăma","sa vatamati":"vătăma","sa vatame":"vătăma","sa vatami":"vătăma","sa vatuiasca":"vătui","sa vatuiesc":"vătui","sa vatuiesti":"vătui","sa vatuim":"vătui","sa vatuiti":"vătui","sa vecinui":"vecinui","sa vecinuie":"vecinui","sa vecinuim":"vecinui","sa vecinuiti":"vecinui","sa vecuiasca":"vecui","sa vecuiesc":"vecui","sa vecuiesti":"vecui","sa vecuim":"vecui","sa vecuiti":"vecui","sa vedem":"vedea","sa vedeti":"vedea","sa vegetam":"vegeta","sa vegetati":"vegeta","sa vegetez":"vegeta","sa vegeteze":"vegeta","sa vegetezi":"vegeta","sa vegheati":"veghea","sa veghem":"veghea","sa veghez":"veghea","sa vegheze":"veghea","sa veghezi":"veghea","sa vehiculam":"vehicula","sa vehiculati":"vehicula","sa vehiculez":"vehicula","sa vehiculeze":"vehicula","sa vehiculezi":"vehicula","sa velarizam":"velariza","sa velarizati":"velariza","sa velarizez":"velariza","sa velarizeze":"velariza","sa velarizezi":"velariza","sa veneram":"venera","sa venerati":"venera","sa venerez":"venera","sa venereze":"venera","sa venerezi":"venera","sa venim":"veni","sa veninam":"venina","sa veninati":"venina","sa veninez":"venina","sa venineze":"venina","sa veninezi":"venina","sa veniti":"veni","sa ventilam":"ventila","sa ventilati":"ventila","sa ventilez":"ventila","sa ventileze":"ventila","sa ventilezi":"ventila","sa verbalizam":"verbaliza","sa verbalizati":"verbaliza","sa verbalizez":"verbaliza","sa verbalizeze":"verbaliza","sa verbalizezi":"verbaliza","sa verific":"verifica","sa verificam":"verifica","sa verificati":"verifica","sa verifice":"verifica","sa verifici":"verifica","sa vermutizam":"vermutiza","sa vermutizati":"vermutiza","sa vermutizez":"vermutiza","sa vermutizeze":"vermutiza","sa vermutizezi":"vermutiza","sa vernalizam":"vernaliza","sa vernalizati":"vernaliza","sa vernalizez":"vernaliza","sa vernalizeze":"vernaliza","sa vernalizezi":"vernaliza","sa vernisam":"vernisa","sa vernisati":"vernisa","sa vernisez":"vernisa","sa verniseze":"vernisa","sa vernisezi":"vernisa","sa verse":"vărsa","sa versi":"vărsa","sa versific":"versifica","sa versificam":"versifica","sa versificati":"versifica","sa versifice":"versifica","sa versifici":"versifica","sa versuiasca":"versui","sa versuiesc":"versui","sa versuiesti":"versui","sa versuim":"versui","sa versuiti":"versui","sa veseleasca":"veseli","sa veselesc":"veseli","sa veselesti":"veseli","sa veselim":"veseli","sa veseliti":"veseli","sa vesniceasca":"veșnici","sa vesnicesc":"veșnici","sa vesnicesti":"veșnici","sa vesnicim":"veșnici","sa vesniciti":"veșnici","sa vesteasca":["să vestească","vesti","să veștească","vești"],"sa vestejeasca":["să vestejească","vesteji","să veștejească","veșteji"],"sa vestejesc":["să vestejesc","vesteji","să veștejesc","veșteji"],"sa vestejesti":["să vestejești","vesteji","să veștejești","veșteji"],"sa vestejim":["să vestejim","vesteji","să veștejim","veșteji"],"sa vestejiti":["să vestejiți","vesteji","să veștejiți","veșteji"],"sa vestesc":["să vestesc","vesti","să veștesc","vești"],"sa vestesti":["să vestești","vesti","să veștești","vești"],"sa vestez":"vestezi","sa vesteza":"vestezi","sa vestezeasca":"veștezi","sa vestezesc":"veștezi","sa vestezesti":"veștezi","sa vestezi":"vestezi","sa vestezim":["să vestezim","vestezi","să veștezim","veștezi"],"sa vesteziti":["să vesteziți","vestezi","să veșteziți","veștezi"],"sa vestim":["să vestim","vesti","să veștim","vești"],"sa vestiti":["să vestiți","vesti","să veștiți","vești"],"sa vestui":"vestui","sa vestuie":"vestui","sa vestuim":"vestui","sa vestuiti":"vestui","sa vexam":"vexa","sa vexati":"vexa","sa vexez":"vexa","sa vexeze":"vexa","sa vexezi":"vexa","sa vezi":"vedea","sa viati":"via","sa vibram":"vibra","sa vibrati":"vibra","sa vibrez":"vibra","sa vibreze":"vibra","sa vibrezi":"vibra","sa viciati":"vicia","sa viciem":"vicia","sa viciez":"vicia","sa vicieze":"vicia","sa viciezi":"vicia","sa vicleneasca":"vicleni","sa viclenesc":"vicleni","sa viclenesti":"vicleni","sa viclenim":"vicleni","sa vicleniti":"vicleni","sa vicoleasca":"vicoli","sa vicolesc":"vicoli","sa vicolesti":"vicoli","sa vicolim":"vicoli","sa vicoliti":"vicoli","sa victimizam":"victimiza","sa victimizati":"victimiza","sa victimizez":"victimiza","sa victimizeze":"victimiza","sa victimizezi":"victimiza","sa vidam":"vida","sa vidanjam":"vidanja","sa vidanjati":"vidanja","sa vidanjez":"vidanja","sa vidanjeze":"vidanja","sa vidanjezi":"vidanja","sa vidati":"vida","sa videz":"vida","sa videze":"vida","sa videzi":"vida","sa vie":"vie","sa viem":["să viem","via","să viem","vie"],"sa viermuiasca":"viermui","sa viermuiesc":"viermui","sa viermuiesti":"viermui","sa viermuim":"viermui","sa viermuiti":"viermui","sa viersuiasca":"viersui","sa viersuiesc":"viersui","sa viersuiesti":"viersui","sa viersuim":"viersui","sa viersuiti":"viersui","sa vieti":"vie","sa vietuiasca":"viețui","sa vietuiesc":"viețui","sa vietuiesti":"viețui","sa vietuim":"viețui","sa vietuiti":"viețui","sa viez":"via","sa vieze":"via","sa viezi":"via","sa viforasca":"viforî","sa vii":["să vii","veni","să vii","vie"],"sa vilegiaturam":"vilegiatura","sa vilegiaturati":"vilegiatura","sa vilegiaturez":"vilegiatura","sa vilegiatureze":"vilegiatura","sa vilegiaturezi":"vilegiatura","sa vin":"veni","sa vina":"veni","sa vinc":"vince","sa vinca":"vince","sa vincem":"vince","sa vinceti":"vince","sa vinci":"vince","sa vindec":"vindeca","sa vindecam":"vindeca","sa vindecati":"vindeca","sa vindece":"vindeca","sa vindeci":"vindeca","sa vindem":"vinde","sa vindeti":"vinde","sa ving":"vinge","sa vinga":"vinge","sa vingem":"vinge","sa vingeti":"vinge","sa vingi":"vinge","sa vinific":"vinifica","sa vinificam":"vinifica","sa vinificati":"vinifica","sa vinifice":"vinifica","sa vinifici":"vinifica","sa vinovateasca":"vinovăți","sa vinovatesc":"vinovăți","sa vinovatesti":"vinovăți","sa vinovatim":"vinovăți","sa vinovatiti":"vinovăți","sa vinuiasca":"vinui","sa vinuiesc":"vinui","sa vinuiesti":"vinui","sa vinuim":"vinui","sa vinuiti":"vinui","sa vinzi":"vinde","sa violam":"viola","sa violati":"viola","sa violentam":"violenta","sa violentati":"violenta","sa violentez":"violenta","sa violenteze":"violenta","sa violentezi":"violenta","sa violez":"viola","sa violeze":"viola","sa violezi":"viola","sa viram":"vira","sa virati":"vira","sa virez":"vira","sa vireze":"vira","sa virezi":"vira","sa virilizam":"viriliza","sa virilizati":"viriliza","sa virilizez":"viriliza","sa virilizeze":"viriliza","sa virilizezi":"viriliza","sa virtualizam":"virtualiza","sa virtualizati":"virtualiza","sa virtualizez":"virtualiza","sa virtualizeze":"virtualiza","sa virtualizezi":"virtualiza","sa visam":"visa","sa visati":"visa","sa viscol":"viscoli","sa viscola":"viscoli","sa viscoli":"viscoli","sa viscolim":"viscoli","sa viscoliti":"viscoli","sa visez":"visa","sa viseze":"visa","sa visezi":"visa","sa visteasca":"viști","sa vistesc":"viști","sa vistesti":"viști","sa vistim":"viști","sa vistiti":"viști","sa vitalizam":"vitaliza","sa vitalizati":"vitaliza","sa vitalizez":"vitaliza","sa vitalizeze":"vitaliza","sa vitalizezi":"vitaliza","sa vitaminizam":"vitaminiza","sa vitaminizati":"vitaminiza","sa vitaminizez":"vitaminiza","sa vitaminizeze":"vitaminiza","sa vitaminizezi":"vitaminiza","sa vitejeasca":"viteji","sa vitejesc":"viteji","sa vitejesti":"viteji","sa vitejim":"viteji","sa vitejiti":"viteji","sa vitiati":"viția","sa vitie":"viția","sa vitiem":"viția","sa vitii":"viția","sa vitrific":"vitrifica","sa vitrificam":"vitrifica","sa vitrificati":"vitrifica","sa vitrifice":"vitrifica","sa vitrifici":"vitrifica","sa vitriolam":"vitriola","sa vitriolati":"vitriola","sa vitriolez":"vitriola","sa vitrioleze":"vitriola","sa vitriolezi":"vitriola","sa vitriolizam":"vitrioliza","sa vitriolizati":"vitrioliza","sa vitriolizez":"vitrioliza","sa vitriolizeze":"vitrioliza","sa vitriolizezi":"vitrioliza","sa vituperam":"vitupera","sa vituperati":"vitupera","sa vituperez":"vitupera","sa vitupereze":"vitupera","sa vituperezi":"vitupera","sa viu":"vie","sa vivific":"vivifica","sa vivificam":"vivifica","sa vivificati":"vivifica","sa vivifice":"vivifica","sa vivifici":"vivifica","sa vivisectionam":"vivisecționa","sa vivisectionati":"vivisecționa","sa vivisectionez":"vivisecționa","sa vivisectioneze":"vivisecționa","sa vivisectionezi":"vivisecționa","sa vizam":"viza","sa vizati":"viza","sa vizez":"viza","sa vizeze":"viza","sa vizezi":"viza","sa vizionam":"viziona","sa vizionati":"viziona","sa vizionez":"viziona","sa vizioneze":"viziona","sa vizionezi":"viziona","sa vizitam":"vizita","sa vizitati":"vizita","sa vizitez":"vizita","sa viziteze":"vizita","sa vizitezi":"vizita","sa vizualizam":"vizualiza","sa vizualizati":"vizualiza","sa vizualizez":"vizualiza","sa vizualizeze":"vizualiza","sa vizualizezi":"vizualiza","sa vladuiasca":"vlădui","sa vladuiesc":"vlădui","sa vladuiesti":"vlădui","sa vladuim":"vlădui","sa vladuiti":"vlădui","sa vlaguiasca":"vlăgui","sa vlaguiesc":"vlăgui","sa vlaguiesti":"vlăgui","sa vlaguim":"vlăgui","sa vlaguiti":"vlăgui","sa voalam":"voala","sa voalati":"voala","sa voalez":"voala","sa voaleze":"voala","sa voalezi":"voala","sa voama":"voame","sa voamem":"voame","sa voameti":"voame","sa vocalizam":"vocaliza","sa vocalizati":"vocaliza","sa vocalizez":"vocaliza","sa vocalizeze":"vocaliza","sa vocalizezi":"vocaliza","sa vociferam":"vocifera","sa vociferati":"vocifera","sa vociferez":"vocifera","sa vocifereze":"vocifera","sa vociferezi":"vocifera","sa vodeasca":"vodi","sa vodesc":"vodi","sa vodesti":"vodi","sa vodim":"vodi","sa voditi":"vodi","sa voiajam":"voiaja","sa voiajati":"voiaja","sa voiajez":"voiaja","sa voiajeze":"voiaja","sa voiajezi":"voiaja","sa voiasca":"voi","sa voiesc":"voi","sa voiesti":"voi","sa voim":"voi","sa voiti":"voi","sa volatilizam":"volatiliza","sa volatilizati":"volatiliza","sa volatilizez":"volatiliza","sa volatilizeze":"volatiliza","sa volatilizezi":"volatiliza","sa volniceasca":"volnici","sa volnicesc":"volnici","sa volnicesti":"volnici","sa volnicim":"volnici","sa volniciti":"volnici","sa vom":"voame","sa vomam":"voma","sa vomati":"voma","sa vomez":"voma","sa vomeze":"voma","sa vomezi":"voma","sa vomi":"voame","sa vomit":"vomita","sa vomitam":"vomita","sa vomitati":"vomita","sa vomite":"vomita","sa vomiti":"vomita","sa vopseasca":"vopsi","sa vopsesc":"vopsi","sa vopsesti":"vopsi","sa vopsim":"vopsi","sa vopsiti":"vopsi","sa vorbeasca":"vorbi","sa vorbesc":"vorbi","sa vorbesti":"vorbi","sa vorbim":"vorbi","sa vorbiti":"vorbi","sa voroveasca":"vorovi","sa vorovesc":"vorovi","sa vorovesti":"vorovi","sa vorovim":"vorovi","sa voroviti":"vorovi","sa votam":"vota","sa votati":"vota","sa votez":"vota","sa voteze":"vota","sa votezi":"vota","sa vrafuiasca":"vrăfui","sa vrafuiesc":"vrăfui","sa vrafuiesti":"vrăfui","sa vrafuim":"vrăfui","sa vrafuiti":"vrăfui","sa vrajeasca":"vrăji","sa vrajesc":"vrăji","sa vrajesti":"vrăji","sa vrajim":"vrăji","sa vrajiti":"vrăji","sa vrajmaseasca":"vrăjmăși","sa vrajmasesc":"vrăjmăși","sa vrajmasesti":"vrăjmăși","sa vrajmasim":"vrăjmăși","sa vrajmasiti":"vrăjmăși","sa vravuiasca":"vrăvui","sa vravuiesc":"vrăvui","sa vravuiesti":"vrăvui","sa vravuim":"vrăvui","sa vravuiti":"vrăvui","sa vrea":"vrea","sa vreau":"vrea","sa vredniceasca":"vrednici","sa vrednicesc":"vrednici","sa vrednicesti":"vrednici","sa vrednicim":"vrednici","sa vredniciti":"vrednici","sa vrei":"vrea","sa vrem":"vrea","sa vreti":"vrea","sa vroiasca":"vroi","sa vroiesc":"vroi","sa vroiesti":"vroi","sa vroim":"vroi","sa vroiti":"vroi","sa vuiasca":"vui","sa vuiesc":"vui","sa vuiesti":"vui","sa vuiet":"vuieta","sa vuietam":"vuieta","sa vuietati":"vuieta","sa vuiete":"vuieta","sa vuieti":"vuieta","sa vuim":"vui","sa vuiti":"vui","sa vulcanizam":"vulcaniza","sa vulcanizati":"vulcaniza","sa vulcanizez":"vulcaniza","sa vulcanizeze":"vulcaniza","sa vulcanizezi":"vulcaniza","sa vulgarizam":"vulgariza","sa vulgarizati":"vulgariza","sa vulgarizez":"vulgariza","sa vulgarizeze":"vulgariza","sa vulgarizezi":"vulgariza","sa vulneram":"vulnera","sa vulnerati":"vulnera","sa vulnerez":"vulnera","sa vulnereze":"vulnera","sa vulnerezi":"vulnera","sa vuvui":"vuvui","sa vuvuie":"vuvui","sa vuvuim":"vuvui","sa vuvuiti":"vuvui","sa xerocopiati":"xerocopia","sa xerocopiem":"xerocopia","sa xerocopiez":"xerocopia","sa xerocopieze":"xerocopia","sa xerocopiezi":"xerocopia","sa xerografiati":"xerografia","sa xerografiem":"xerografia","sa xerografiez":"xerografia","sa xerografieze":"xerografia","sa xerografiezi":"xerografia","sa xeroxam":"xeroxa","sa xeroxati":"xeroxa","sa xeroxez":"xeroxa","sa xeroxeze":"xeroxa","sa xeroxezi":"xeroxa","sa zabaveasca":"zăbăvi","sa zabavesc":"zăbăvi","sa zabavesti":"zăbăvi","sa zabavim":"zăbăvi","sa zabaviti":"zăbăvi","sa zaboveasca":"zăbovi","sa zabovesc":"zăbovi","sa zabovesti":"zăbovi","sa zabovim":"zăbovi","sa zaboviti":"zăbovi","sa zac":"zăcea","sa zaca":"zăcea","sa zacem":"zăcea","sa zaceti":"zăcea","sa zaci":"zăcea","sa zacuseasca":"zacusi","sa zacusesc":"zacusi","sa zacusesti":"zacusi","sa zacusim":"zacusi","sa zacusiti":"zacusi","sa zadaram":"zădărî","sa zadarasc":"zădărî","sa zadarasca":"zădărî","sa zadarasti":"zădărî","sa zadarati":"zădărî","sa zadareasca":"zădări","sa zadaresc":"zădări","sa zadaresti":"zădări","sa zadarim":"zădări","sa zadariti":"zădări","sa zadarniceasca":"zădărnici","sa zadarnicesc":"zădărnici","sa zadarnicesti":"zădărnici","sa zadarnicim":"zădărnici","sa zadarniciti":"zădărnici","sa zagazuiasca":"zăgăzui","sa zagazuiesc":"zăgăzui","sa zagazuiesti":"zăgăzui","sa zagazuim":"zăgăzui","sa zagazuiti":"zăgăzui","sa zaharific":"zaharifica","sa zaharificam":"zaharifica","sa zaharificati":"zaharifica","sa zaharifice":"zaharifica","sa zaharifici":"zaharifica","sa zahariseasca":"zaharisi","sa zaharisesc":"zaharisi","sa zaharisesti":"zaharisi","sa zaharisim":"zaharisi","sa zaharisiti":"zaharisi","sa zahatuiasca":"zăhătui","sa zahatuiesc":"zăhătui","sa zahatuiesti":"zăhătui","sa zahatuim":"zăhătui","sa zahatuiti":"zăhătui","sa zambeasca":"zâmbi","sa zambesc":"zâmbi","sa zambesti":"zâmbi","sa zambim":"zâmbi","sa zambiti":"zâmbi","sa zamisleasca":"zămisli","sa zamislesc":"zămisli","sa zamislesti":"zămisli","sa zamislim":"zămisli","sa zamisliti":"zămisli","sa zamisluiasca":"zamislui","sa zamisluiesc":"zamislui","sa zamisluiesti":"zamislui","sa zamisluim":"zamislui","sa zamisluiti":"zamislui","sa zanganeasca":["să zângănească","zângăni","să zăngănească","zăngăni"],"sa zanganesc":["să zângănesc","zângăni","să zăngănesc","zăngăni"],"sa zanganesti":["să zângănești","zângăni","să zăngănești","zăngăni"],"sa zanganim":["să zângănim","zângăni","să zăngănim","zăngăni"],"sa zanganiti":["să zângăniți","zângăni","să zăngăniți","zăngăni"],"sa zapaceasca":"zăpăci","sa zapacesc":"zăpăci","sa zapacesti":"zăpăci","sa zapacim":"zăpăci","sa zapaciti":"zăpăci","sa zapam":"zapa","sa zapati":"zapa","sa zapciasca":"zapcii","sa zapciesc":"zapcii","sa zapciesti":"zapcii","sa zapciim":"zapcii","sa zapciiti":"zapcii","sa zapez":"zapa","sa zapeze":"zapa","sa zapezi":"zapa","sa zapuseasca":"zăpuși","sa zapusesc":"zăpuși","sa zapusesti":"zăpuși","sa zapusim":"zăpuși","sa zapusiti":"zăpuși","sa zareasca":"zări","sa zaresc":"zări","sa zaresti":"zări","sa zarim":"zări","sa zariti":"zări","sa zatigneasca":"zătigni","sa zatignesc":"zătigni","sa zatignesti":"zătigni","sa zatignim":"zătigni","sa zatigniti":"zătigni","sa zavergiseasca":"zavergisi","sa zavergisesc":"zavergisi","sa zavergisesti":"zavergisi","sa zavergisim":"zavergisi","sa zavergisiti":"zavergisi","sa zavistiasca":"zavistii","sa zavistiesc":"zavistii","sa zavistiesti":"zavistii","sa zavistiim":"zavistii","sa zavistiiti":"zavistii","sa zavoram":"zăvorî","sa zavorasc":"zăvorî","sa zavorasca":"zăvorî","sa zavorasti":"zăvorî","sa zavorati":"zăvorî","sa zavoreasca":"zăvori","sa zavoresc":"zăvori","sa zavoresti":"zăvori","sa zavorim":"zăvori","sa zavoriti":"zăvori","sa zbantuiasca":"zbănțui","sa zbantuiesc":"zbănțui","sa zbantuiesti":"zbănțui","sa zbantuim":"zbănțui","sa zbantuiti":"zbănțui","sa zbarceasca":"zbârci","sa zbarcesc":"zbârci","sa zbarcesti":"zbârci","sa zbarcim":"zbârci","sa zbarciti":"zbârci","sa zbarleasca":"zbârli","sa zbarlesc":"zbârli","sa zbarlesti":"zbârli","sa zbarlim":"zbârli","sa zbarliti":"zbârli","sa zbarnai":"zbârnăi","sa zbarnaie":"zbârnăi","sa zbarnaim":"zbârnăi","sa zbarnaiti":"zbârnăi","sa zbat":"zbate","sa zbata":"zbate","sa zbatem":"zbate","sa zbateti":"zbate","sa zbati":"zbate","sa zbea":"zbea","sa zbeau":"zbea","sa zbei":"zbea","sa zbem":"zbea","sa zbenguiasca":"zbengui","sa zbenguiesc":"zbengui","sa zbenguiesti":"zbengui","sa zbenguim":"zbengui","sa zbenguiti":"zbengui","sa zbeti":"zbea","sa zbiceasca":"zbici","sa zbicesc":"zbici","sa zbicesti":"zbici","sa zbicim":"zbici","sa zbiciti":"zbici","sa zbier":"zbiera","sa zbieram":"zbiera","sa zbierati":"zbiera","sa zbiere":"zbiera","sa zbieri":"zbiera","sa zbihuiasca":"zbihui","sa zbihuiesc":"zbihui","sa zbihuiesti":"zbihui","sa zbihuim":"zbihui","sa zbihuiti":"zbihui","sa zblenduiasca":"zblendui","sa zblenduiesc":"zblendui","sa zblenduiesti":"zblendui","sa zblenduim":"zblendui","sa zblenduiti":"zblendui","sa zboare":"zbura","sa zbor":"zbura","sa zbori":"zbura","sa zbucium":"zbuciuma","sa zbuciumam":"zbuciuma","sa zbuciumati":"zbuciuma","sa zbuciume":"zbuciuma","sa zbuciumi":"zbuciuma","sa zbucneasca":"zbucni","sa zbucnesc":"zbucni","sa zbucnesti":"zbucni","sa zbucnim":"zbucni","sa zbucniti":"zbucni","sa zburam":"zbura","sa zburati":"zbura","sa zburatoreasca":"zburători","sa zburatoresc":"zburători","sa zburatoresti":"zburători","sa zburatorim":"zburători","sa zburatoriti":"zburători","sa zburd":"zburda","sa zburdam":"zburda","sa zburdati":"zburda","sa zburde":"zburda","sa zburleasca":"zburli","sa zburlesc":"zburli","sa zburlesti":"zburli","sa zburlim":"zburli","sa zburliti":"zburli","sa zburzi":"zburda","sa zdrancaneasca":"zdrăncăni","sa zdrancanesc":"zdrăncăni","sa zdrancanesti":"zdrăncăni","sa zdrancanim":"zdrăncăni","sa zdrancaniti":"zdrăncăni","sa zdranganeasca":["să zdrângănească","zdrângăni","să zdrăngănească","zdrăngăni"],"sa zdranganesc":["să zdrângănesc","zdrângăni","să zdrăngănesc","zdrăngăni"],"sa zdranganesti":["să zdrângănești","zdrângăni","să zdrăngănești","zdrăngăni"],"sa zdranganim":["să zdrângănim","zdrângăni","să zdrăngănim","zdrăngăni"],"sa zdranganiti":["să zdrângăniți","zdrângăni","să zdrăngăniți","zdrăngăni"],"sa zdreleasca":"zdreli","sa zdrelesc":"zdreli","sa zdrelesti":"zdreli","sa zdrelim":"zdreli","sa zdreliti":"zdreli","sa zdrobeasca":"zdrobi","sa zdrobesc":"zdrobi","sa zdrobesti":"zdrobi","sa zdrobim":"zdrobi","sa zdrobiti":"zdrobi","sa zdrumec":"zdrumeca","sa zdrumecam":"zdrumeca","sa zdrumecati":"zdrumeca","sa zdrumece":"zdrumeca","sa zdrumeci":"zdrumeca","sa zdrumic":"zdrumica","sa zdrumicam":"zdrumica","sa zdrumicati":"zdrumica","sa zdrumice":"zdrumica","sa zdrumici":"zdrumica","sa zdruncinam":"zdruncina","sa zdruncinati":"zdruncina","sa zdruncinez":"zdruncina","sa zdruncineze":"zdruncina","sa zdruncinezi":"zdruncina","sa zdruseasca":"zdruși","sa zdrusesc":"zdruși","sa zdrusesti":"zdruși","sa zdrusim":"zdruși","sa zdrusiti":"zdruși","sa zdupai":"zdupăi","sa zdupaie":"zdupăi","sa zdupaim":"zdupăi","sa zdupaiti":"zdupăi","sa zebereasca":"zeberi","sa zeberesc":"zeberi","sa zeberesti":"zeberi","sa zeberim":"zeberi","sa zeberiti":"zeberi","sa zeciuiasca":"zeciui","sa zeciuiesc":"zeciui","sa zeciuiesti":"zeciui","sa zeciuim":"zeciui","sa zeciuiti":"zeciui","sa zeflemiseasca":"zeflemisi","sa zeflemisesc":"zeflemisi","sa zeflemisesti":"zeflemisi","sa zeflemisim":"zeflemisi","sa zeflemisiti":"zeflemisi","sa zeific":"zeifica","sa zeificam":"zeifica","sa zeificati":"zeifica","sa zeifice":"zeifica","sa zeifici":"zeifica","sa zemos":"zemoși","sa zemosa":"zemoși","sa zemosi":"zemoși","sa zemosim":"zemoși","sa zemositi":"zemoși","sa zemui":"zemui","sa zemuie":"zemui","sa zemuim":"zemui","sa zemuiti":"zemui","sa zetuiasca":"zețui","sa zetuiesc":"zețui","sa zetuiesti":"zețui","sa zetuim":"zețui","sa zetuiti":"zețui","sa zgaiasca":"zgâi","sa zgaiesc":"zgâi","sa zgaiesti":"zgâi","sa zgaim":"zgâi","sa zgaiti":"zgâi","sa zgaltai":"zgâlțâi","sa zgaltaie":"zgâlțâi","sa zgaltaim":"zgâlțâi","sa zgaltaiti":"zgâlțâi","sa zgancileasca":"zgâncili","sa zgancilesc":"zgâncili","sa zgancilesti":"zgâncili","sa zgancilim":"zgâncili","sa zganciliti":"zgâncili","sa zgandareasca":"zgândări","sa zgandaresc":"zgândări","sa zgandaresti":"zgândări","sa zgandarim":"zgândări","sa zgandariti":"zgândări","sa zgarceasca":"zgârci","sa zgarcesc":"zgârci","sa zgarcesti":"zgârci","sa zgarcim":"zgârci","sa zgarciti":"zgârci","sa zgariati":"zgâria","sa zgarie":"zgâria","sa zgariem":"zgâria","sa zgarii":"zgâria","sa zgaur":"zgăura","sa zgauram":"zgăura","sa zgaurati":"zgăura","sa zgaure":"zgăura","sa zgauri":"zgăura","sa zgorneasca":"zgorni","sa zgornesc":"zgorni","sa zgornesti":"zgorni","sa zgornim":"zgorni","sa zgorniti":"zgorni","sa zgreaptan":"zgrepțăna","sa zgreaptane":"zgrepțăna","sa zgreaptani":"zgrepțăna","sa zgrebuleasca":"zgrebuli","sa zgrebulesc":"zgrebuli","sa zgrebulesti":"zgrebuli","sa zgrebulim":"zgrebuli","sa zgrebuliti":"zgrebuli","sa zgreptanam":"zgrepțăna","sa zgreptanati":"zgrepțăna","sa zgribuleasca":"zgribuli","sa zgribulesc":"zgribuli","sa zgribulesti":"zgribuli","sa zgribulim":"zgribuli","sa zgribuliti":"zgribuli","sa zgriburam":"zgribura","sa zgriburati":"zgribura","sa zgribureasca":"zgriburi","sa zgriburesc":"zgriburi","sa zgriburesti":"zgriburi","sa zgriburez":"zgribura","sa zgribureze":"zgribura","sa zgriburezi":"zgribura","sa zgriburim":"zgriburi","sa zgriburiti":"zgriburi","sa zgudui":"zgudui","sa zguduie":"zgudui","sa zguduim":"zgudui","sa zguduiti":"zgudui","sa zgurific":"zgurifica","sa zgurificam":"zgurifica","sa zgurificati":"zgurifica","sa zgurifice":"zgurifica","sa zgurifici":"zgurifica","sa zic":"zice","sa zica":"zice","sa zicem":"zice","sa ziceti":"zice","sa zici":"zice","sa zideasca":"zidi","sa zidesc":"zidi","sa zidesti":"zidi","sa zidim":"zidi","sa ziditi":"zidi","sa ziduiasca":"zidui","sa ziduiesc":"zidui","sa ziduiesti":"zidui","sa ziduim":"zidui","sa ziduiti":"zidui","sa zigzagam":"zigzaga","sa zigzagati":"zigzaga","sa zigzaghez":"zigzaga","sa zigzagheze":"zigzaga","sa zigzaghezi":"zigzaga","sa zimbeasca":"zimbi","sa zimbesc":"zimbi","sa zimbesti":"zimbi","sa zimbim":"zimbi","sa zimbiti":"zimbi","sa zimtam":"zimța","sa zimtati":"zimța","sa zimtez":"zimța","sa zimteze":"zimța","sa zimtezi":"zimța","sa zimtuiasca":"zimțui","sa zimtuiesc":"zimțui","sa zimtuiesti":"zimțui","sa zimtuim":"zimțui","sa zimtuiti":"zimțui","sa zincam":"zinca","sa zincati":"zinca","sa zinchez":"zinca","sa zincheze":"zinca","sa zinchezi":"zinca","sa zincografiati":"zincografia","sa zincografiem":"zincografia","sa zincografiez":"zincografia","sa zincografieze":"zincografia","sa zincografiezi":"zincografia","sa zincuiasca":"zincui","sa zincuiesc":"zincui","sa zincuiesti":"zincui","sa zincuim":"zincui","sa zincuiti":"zincui","sa zinganeasca":"zingăni","sa zinganesc":"zingăni","sa zinganesti":"zingăni","sa zinganim":"zingăni","sa zinganiti":"zingăni","sa zingheneasca":"zingheni","sa zinghenesc":"zingheni","sa zinghenesti":"zingheni","sa zinghenim":"zingheni","sa zingheniti":"zingheni","sa zmaceasca":"zmâci","sa zmacesc":"zmâci","sa zmacesti":"zmâci","sa zmacim":"zmâci","sa zmaciti":"zmâci","sa zmangaleasca":"zmângăli","sa zmangalesc":"zmângăli","sa zmangalesti":"zmângăli","sa zmangalim":"zmângăli","sa zmangaliti":"zmângăli","sa zmereasca":"zmeri","sa zmeresc":"zmeri","sa zmeresti":"zmeri","sa zmerim":"zmeri","sa zmeriti":"zmeri","sa zminteasca":"zminti","sa zmintesc":"zminti","sa zmintesti":"zminti","sa zmintim":"zminti","sa zmintiti":"zminti","sa zmuceasca":"zmuci","sa zmucesc":"zmuci","sa zmucesti":"zmuci","sa zmucim":"zmuci","sa zmuciti":"zmuci","sa zobeasca":"zobi","sa zobesc":"zobi","sa zobesti":"zobi","sa zobim":"zobi","sa zobiti":"zobi","sa zonific":"zonifica","sa zonificam":"zonifica","sa zonificati":"zonifica","sa zonifice":"zonifica","sa zonifici":"zonifica","sa zopaiasca":"zopăi","sa zopaiesc":"zopăi","sa zopaiesti":"zopăi","sa zopaim":"zopăi","sa zopaiti":"zopăi","sa zornai":"zornăi","sa zornaie":"zornăi","sa zornaim":"zornăi","sa zornaiti":"zornăi","sa zorobeasca":"zorobi","sa zorobesc":"zorobi","sa zorobesti":"zorobi","sa zorobim":"zorobi","sa zorobiti":"zorobi","sa zorzoiasca":"zorzoi","sa zorzoiesc":"zorzoi","sa zorzoiesti":"zorzoi","sa zorzoim":"zorzoi","sa zorzoiti":"zorzoi","sa zugraveasca":"zugrăvi","sa zugravesc":"zugrăvi","sa zugravesti":"zugrăvi","sa zugravim":"zugrăvi","sa zugraviti":"zugrăvi","sa zugrum":"zugruma","sa zugrumam":"zugruma","sa zugrumati":"zugruma","sa zugrume":"zugruma","sa zugrumi":"zugruma","sa zulufam":"zulufa","sa zulufati":"zulufa","sa zulufez":"zulufa","sa zulufeze":"zulufa","sa zulufezi":"zulufa","sa zumzai":"zumzăi","sa zumzaie":"zumzăi","sa zumzaim":"zumzăi","sa zumzaiti":"zumzăi","sa zupaiasca":"zupăi","sa zupaiesc":"zupăi","sa zupaiesti":"zupăi","sa zupaim":"zupăi","sa zupaiti":"zupăi","sa zupuiasca":"zupui","sa zupuiesc":"zupui","sa zupuiesti":"zupui","sa zupuim":"zupui","sa zupuiti":"zupui","sa zurai":"zurăi","sa zuraie":"zurăi","sa zuraim":"zurăi","sa zuraiti":"zurăi","sa zuzai":"zuzăi","sa zuzaie":"zuzăi","sa zuzaim":"zuzăi","sa zuzaiti":"zuzăi","sa zvacneasca":"zvâcni","sa zvacnesc":"zvâcni","sa zvacnesti":"zvâcni","sa zvacnim":"zvâcni","sa zvacniti":"zvâcni","sa zvant":"zvânta","sa zvantam":"zvânta","sa zvantati":"zvânta","sa zvante":"zvânta","sa zvanti":"zvânta","sa zvantur":"zvântura","sa zvanturam":"zvântura","sa zvanturati":"zvântura","sa zvanture":"zvântura","sa zvanturi":"zvântura","sa zvarleasca":"zvârli","sa zvarlesc":"zvârli","sa zvarlesti":"zvârli","sa zvarlim":"zvârli","sa zvarliti":"zvârli","sa zvoneasca":"zvoni","sa zvonesc":"zvoni","sa zvonesti":"zvoni","sa zvonim":"zvoni","sa zvoniti":"zvoni","sai":["săi","ea","săi","el"],"sale":["sale","ea","sale","el"],"sau":["său","ea","său","el"],"sbea":"zbea","sbici":"zbici","sbiera":"zbiera","sbura":"zbura","se":["se","ea","se","ei","se","el","se","ele"],"sei":"-e","sera":"-e","seram":"-e","serati":"-e","sesem":"-e","sesera":"-e","seseram":"-e","seserati":"-e","sesesi":"-e","sesi":"-e","sgarci":"zgârci","sgaria":"zgâria","sgau":"zgău","sgura":"zgură","sie":"el","siesi":["sieși","ea","sieși","ei","sieși","ele"],"sine":["sine","ea","sine","ei","sine","el","sine","ele"],"sloata":"zloată","smeu":"zmeu","soaie":"zoaie","sters-o":"o șterge","sunt":"fi","suntem":"fi","sunteti":"fi","svanta":"zvânta"};
@@ -0,0 +1 @@
+export default {"ta":["ta","tău","ta","tu"],"tabacareasca":["tăbăcărească","tăbăcăresc","tăbăcăreasca","tăbăcăresc"],"tabacarescul":"tăbăcăresc","tabacarese":"tăbăcăreasă","tabacaresei":"tăbăcăreasă","tabacaresele":"tăbăcăreasă","tabacareselor":"tăbăcăreasă","tabacaresti":"tăbăcăresc","tabacarestii":"tăbăcăresc","tabacarestile":"tăbăcăresc","tabacari":"tăbăcar","tabacaria":"tăbăcărie","tabacariei":"tăbăcărie","tabacarii":["tăbăcarii","tăbăcar","tăbăcării","tăbăcărie"],"tabacariile":"tăbăcărie","tabacariilor":"tăbăcărie","tabacarilor":"tăbăcar","tabacarite":"tăbăcăriță","tabacaritei":"tăbăcăriță","tabacaritele":"tăbăcăriță","tabacaritelor":"tăbăcăriță","tabacarul":"tăbăcar","tabacarule":"tăbăcar","tabacarului":"tăbăcar","tabacasi":"tăbăcaș","tabacasii":"tăbăcaș","tabacasilor":"tăbăcaș","tabacasul":"tăbăcaș","tabacasule":"tăbăcaș","tabacasului":"tăbăcaș","tabacea":"tăbăci","tabaceai":"tăbăci","tabaceam":"tăbăci","tabaceati":"tăbăci","tabaceau":"tăbăci","tabacele":"tăbăceală","tabacelei":"tăbăceală","tabacelele":"tăbăceală","tabacelelor":"tăbăceală","tabaceli":"tăbăceală","tabacesc":"tăbăci","tabaceste":"tăbăci","tabacesti":"tăbăci","tabachere":"tabacheră","tabacherea":"tabachere","tabacherei":"tabacheră","tabacherele":"tabacheră","tabacherelor":"tabacheră","tabacheri":"tabachere","tabacherii":"tabachere","tabacherile":"tabachere","tabacherilor":"tabachere","tabachernite":"tabacherniță","tabachernitei":"tabacherniță","tabachernitele":"tabacherniță","tabachernitelor":"tabacherniță","tabaci":"tabac","tabacii":["tabacii","tabac","tăbăcii","tăbăci"],"tabacilor":"tabac","tabacim":"tăbăci","tabacind":"tăbăci","tabaciocul":"tabacioc","tabaciocule":"tabacioc","tabaciocului":"tabacioc","tabacira":"tăbăci","tabaciram":"tăbăci","tabacirati":"tăbăci","tabacirea":"tăbăcire","tabaciri":"tăbăcire","tabacirii":"tăbăcire","tabacirile":"tăbăcire","tabacirilor":"tăbăcire","tabacise":"tăbăci","tabacisem":"tăbăci","tabacisera":"tăbăci","tabaciseram":"tăbăci","tabaciserati":"tăbăci","tabacisesi":"tăbăci","tabacisi":"tăbăci","tabacit":"tăbăci","tabaciti":"tăbăci","tabacitul":"tăbăcit","tabacitule":"tăbăcit","tabacitului":"tăbăcit","tabacoze":"tabacoză","tabacozei":"tabacoză","tabacozele":"tabacoză","tabacozelor":"tabacoză","tabacul":"tabac","tabacule":"tabac","tabacului":"tabac","tabagica":["tabagică","tabagic","tabagica","tabagic"],"tabagice":"tabagic","tabagicele":"tabagic","tabagici":"tabagic","tabagicii":"tabagic","tabagicul":"tabagic","tabagismul":"tabagism","tabagismule":"tabagism","tabagismului":"tabagism","tabalhanale":"tabalhana","tabalhanalei":"tabalhana","tabalhanalele":"tabalhana","tabalhanalelor":"tabalhana","tabalhanaua":"tabalhana","tabanale":"tabana","tabanalei":"tabana","tabanalele":"tabana","tabanalelor":"tabana","tabanase":"tăbănaș","tabanasele":"tăbănaș","tabanaselor":"tăbănaș","tabanasul":"tăbănaș","tabanasule":"tăbănaș","tabanasului":"tăbănaș","tabanaua":"tabana","tabani":"taban","tabanii":"taban","tabanilor":"taban","tabanul":"taban","tabanule":"taban","tabanului":"taban","tabar":"tăbărî","tabara":["tabără","tăbărî","tăbăra","tăbărî"],"tabarai":["tăbărai","tăbărî","tăbărâi","tăbărî"],"tabaram":["tăbărâm","tăbărî","tăbăram","tăbărî"],"tabarand":"tăbărî","tabarara":"tăbărî","tabararam":"tăbărî","tabararati":"tăbărî","tabararea":"tăbărâre","tabarari":"tăbărâre","tabararii":"tăbărâre","tabararile":"tăbărâre","tabararilor":"tăbărâre","tabarase":"tăbărî","tabarasem":"tăbărî","tabarasera":"tăbărî","tabaraseram":"tăbărî","tabaraserati":"tăbărî","tabarasesi":"tăbărî","tabarasi":"tăbărî","tabarat":"tăbărî","tabarati":["tăbărâți","tăbărî","tăbărați","tăbărî"],"tabarau":"tăbărî","tabarcea":"tăbârci","tabarceai":"tăbârci","tabarceam":"tăbârci","tabarceati":"tăbârci","tabarceau":"tăbârci","tabarcesc":"tăbârci","tabarceste":"tăbârci","tabarcesti":"tăbârci","tabarcii":"tăbârci","tabarcim":"tăbârci","tabarcind":"tăbârci","tabarcira":"tăbârci","tabarciram":"tăbârci","tabarcirati":"tăbârci","tabarcise":"tăbârci","tabarcisem":"tăbârci","tabarcisera":"tăbârci","tabarciseram":"tăbârci","tabarciserati":"tăbârci","tabarcisesi":"tăbârci","tabarcisi":"tăbârci","tabarcit":"tăbârci","tabarciti":"tăbârci","tabelai":"tabela","tabelam":["tabelăm","tabela","tabelam","tabela"],"tabeland":"tabela","tabelara":["tabelară","tabela","tabelară","tabelar","tabelara","tabelar"],"tabelaram":"tabela","tabelarati":"tabela","tabelare":"tabelar","tabelarele":"tabelar","tabelari":"tabelar","tabelarii":"tabelar","tabelarul":"tabelar","tabelase":"tabela","tabelasem":"tabela","tabelasera":"tabela","tabelaseram":"tabela","tabelaserati":"tabela","tabelasesi":"tabela","tabelasi":"tabela","tabelat":"tabela","tabelati":"tabela","tabelau":"tabela","tabele":["tabele","tabel","tabele","tabelă"],"tabele de marcaj":"tabelă de marcaj","tabele hash":"tabelă hash","tabeleaza":"tabela","tabelei":"tabelă","tabelele":["tabelele","tabel","tabelele","tabelă"],"tabelelor":["tabelelor","tabel","tabelelor","tabelă"],"tabelez":"tabela","tabelezi":"tabela","tabelul":"tabel","tabelule":"tabel","tabelului":"tabel","tabera":"tabără","tabere":"tabără","taberei":"tabără","taberele":"tabără","taberelor":"tabără","taberi":"tăbărî","tabernacle":"tabernaclu","tabernaclele":"tabernaclu","tabernaclelor":"tabernaclu","tabernacluul":"tabernaclu","tabernacluule":"tabernaclu","tabernacluului":"tabernaclu","tabernacole":"tabernacol","tabernacolele":"tabernacol","tabernacolelor":"tabernacol","tabernacolul":"tabernacol","tabernacolule":"tabernacol","tabernacolului":"tabernacol","tabernacule":"tabernacul","tabernaculele":"tabernacul","tabernaculelor":"tabernacul","tabernaculul":"tabernacul","tabernaculule":"tabernacul","tabernaculului":"tabernacul","tabetica":["tabetică","tabetic","tabetica","tabetic"],"tabetice":"tabetic","tabeticele":"tabetic","tabetici":"tabetic","tabeticii":"tabetic","tabeticul":"tabetic","tabiea":"tabie","tabietlia":"tabietliu","tabietlie":"tabietliu","tabietlii":"tabietliu","tabietliii":"tabietliu","tabietliile":"tabietliu","tabietliul":"tabietliu","tabietosi":"tabietos","tabietosii":"tabietos","tabietosilor":"tabietos","tabietosul":"tabietos","tabietosule":"tabietos","tabietosului":"tabietos","tabietul":"tabiet","tabietule":"tabiet","tabietului":"tabiet","tabieturi":"tabiet","tabieturile":"tabiet","tabieturilor":"tabiet","tabii":"tabie","tabiii":"tabie","tabiile":"tabie","tabiilor":"tabie","tabinete":"tabinet","tabinetele":"tabinet","tabinetelor":"tabinet","tabinetul":"tabinet","tabinetule":"tabinet","tabinetului":"tabinet","tabinite":"tabiniță","tabinitei":"tabiniță","tablabirai":"tablăbirău","tablabiraii":"tablăbirău","tablabirailor":"tablăbirău","tablabirauul":"tablăbirău","tablabirauule":"tablăbirău","tablabirauului":"tablăbirău","tablagii":"tablagiu","tablagiii":"tablagiu","tablagiilor":"tablagiu","tablagiuul":"tablagiu","tablagiuule":"tablagiu","tablagiuului":"tablagiu","tablalute":"tăblăluță","tablalutei":"tăblăluță","tablalutele":"tăblăluță","tablalutelor":"tăblăluță","tablari":"tăblar","tablarii":"tăblar","tablarilor":"tăblar","tablarul":"tăblar","tablarule":"tăblar","tablarului":"tăblar","tablasi":"tăblaș","tablasii":"tăblaș","tablasilor":"tăblaș","tablasul":"tăblaș","tablasule":"tăblaș","tablasului":"tăblaș","tablature":"tablatură","tablaturei":"tablatură","table":"tablă","tablei":"tablă","tablele":["tablele","tablă","tablele","table"],"tablelor":["tablelor","tablă","tablelor","table"],"tablete":"tabletă","tablete de ciocolata":"tabletă de ciocolată","tabletei":"tabletă","tabletele":"tabletă","tabletelor":"tabletă","tablia":"tăblie","tabliei":"tăblie","tablii":"tăblie","tabliile":"tăblie","tabliilor":"tăblie","tablite":"tăbliță","tablitei":"tăbliță","tablitele":"tăbliță","tablitelor":"tăbliță","tabloida":["tabloidă","tabloid","tabloida","tabloid"],"tabloide":"tabloid","tabloidele":"tabloid","tabloidul":"tabloid","tabloidule":"tabloid","tabloidului":"tabloid","tabloizi":"tabloid","tabloizii":"tabloid","tabloizile":"tabloid","tabloizilor":"tabloid","tabloul":"tablou","tabloule":"tablou","tabloului":"tablou","tablouri":"tablou","tablouri de bord":"tablou de bord","tablouri de onoare":"tablou de onoare","tablouri in ulei":"tablou în ulei","tablourile":"tablou","tablourilor":"tablou","tabluia":"tăblui","tabluiai":"tăblui","tabluiam":"tăblui","tabluiati":"tăblui","tabluiau":"tăblui","tabluiesc":"tăblui","tabluieste":"tăblui","tabluiesti":"tăblui","tabluii":"tăblui","tabluim":"tăblui","tabluind":"tăblui","tabluira":"tăblui","tabluiram":"tăblui","tabluirati":"tăblui","tabluise":"tăblui","tabluisem":"tăblui","tabluisera":"tăblui","tabluiseram":"tăblui","tabluiserati":"tăblui","tabluisesi":"tăblui","tabluisi":"tăblui","tabluit":"tăblui","tabluita":["tăbluită","tăbluit","tăbluita","tăbluit"],"tabluite":"tăbluit","tabluitele":"tăbluit","tabluiti":["tăbluiți","tăblui","tăbluiți","tăbluit"],"tabluitii":"tăbluit","tabluitul":"tăbluit","tablute":"tăbluță","tablutei":"tăbluță","tablutele":"tăbluță","tablutelor":"tăbluță","taboare":"tabără","tabuismul":"tabuism","tabuismule":"tabuism","tabuismului":"tabuism","tabuistica":["tabuistică","tabuistic","tabuistica","tabuistic"],"tabuistice":"tabuistic","tabuisticele":"tabuistic","tabuistici":"tabuistic","tabuisticii":"tabuistic","tabuisticul":"tabuistic","tabuizarea":"tabuizare","tabuizari":"tabuizare","tabuizarii":"tabuizare","tabul":"tabu","tabulara":["tabulară","tabular","tabulara","tabular"],"tabulare":"tabular","tabularea":"tabulare","tabularele":"tabular","tabulari":["tabulari","tabular","tabulări","tabulare"],"tabularii":["tabularii","tabular","tabulării","tabulare","tabularii","tabulariu"],"tabulariile":"tabulariu","tabulariilor":"tabulariu","tabularile":"tabulare","tabularilor":"tabulare","tabulariuul":"tabulariu","tabulariuule":"tabulariu","tabulariuului":"tabulariu","tabularul":"tabular","tabulatia":"tabulație","tabulatiei":"tabulație","tabulatii":"tabulație","tabulatiile":"tabulație","tabulatiilor":"tabulație","tabulatoare":"tabulator","tabulatoarele":"tabulator","tabulatoarelor":"tabulator","tabulatorul":"tabulator","tabulatorule":"tabulator","tabulatorului":"tabulator","tabule":["tabule","tabu","tabule","tabulă"],"tabulei":"tabulă","tabulele":"tabulă","tabulelor":"tabulă","tabulhanale":"tabulhana","tabulhanalei":"tabulhana","tabulhanalele":"tabulhana","tabulhanalelor":"tabulhana","tabulhanaua":"tabulhana","tabultoci":"tăbultoc","tabultocii":"tăbultoc","tabultocilor":"tăbultoc","tabultocul":"tăbultoc","tabultocule":"tăbultoc","tabultocului":"tăbultoc","tabului":"tabu","tabunele":"tabunel","tabunelele":"tabunel","tabunelelor":"tabunel","tabunelul":"tabunel","tabunelule":"tabunel","tabunelului":"tabunel","taburele":"taburel","taburelele":"taburel","taburelelor":"taburel","taburelul":"taburel","taburelule":"taburel","taburelului":"taburel","taburete":"taburet","tabuuri":"tabu","tabuurile":"tabu","tabuurilor":"tabu","tac":"tăcea","taca":"tăcea","tacacia":"tacaciu","tacacie":"tacaciu","tacacii":"tacaciu","tacaciii":"tacaciu","tacaciile":"tacaciu","tacaciul":"tacaciu","tacaeste":"tăcăi","tacaia":["tâcâia","tâcâi","tăcăia","tăcăi"],"tacaiai":["tâcâiai","tâcâi","tăcăiai","tăcăi"],"tacaiam":["tâcâiam","tâcâi","tăcăiam","tăcăi"],"tacaiati":["tâcâiați","tâcâi","tăcăiați","tăcăi"],"tacaiau":["tâcâiau","tâcâi","tăcăiau","tăcăi"],"tacaiele":"tâcâială","tacaielei":"tâcâială","tacaielele":"tâcâială","tacaielelor":"tâcâială","tacaieli":"tâcâială","tacaiesc":["tâcâiesc","tâcâi","tăcăiesc","tăcăi"],"tacaieste":["tâcâiește","tâcâi","tăcăiește","tăcăi"],"tacaiesti":["tâcâiești","tâcâi","tăcăiești","tăcăi"],"tacaii":["tâcâii","tâcâi","tăcăii","tăcăi"],"tacaim":["tâcâim","tâcâi","tăcăim","tăcăi"],"tacaind":["tâcâind","tâcâi","tăcăind","tăcăi"],"tacaira":["tâcâiră","tâcâi","tăcăiră","tăcăi"],"tacairam":["tâcâirăm","tâcâi","tăcăirăm","tăcăi"],"tacairati":["tâcâirăți","tâcâi","tăcăirăți","tăcăi"],"tacaise":["tâcâise","tâcâi","tăcăise","tăcăi"],"tacaisem":["tâcâisem","tâcâi","tăcăisem","tăcăi"],"tacaisera":["tâcâiseră","tâcâi","tăcăiseră","tăcăi"],"tacaiseram":["tâcâiserăm","tâcâi","tăcăiserăm","tăcăi"],"tacaiserati":["tâcâiserăți","tâcâi","tăcăiserăți","tăcăi"],"tacaisesi":["tâcâiseși","tâcâi","tăcăiseși","tăcăi"],"tacaisi":["tâcâiși","tâcâi","tăcăiși","tăcăi"],"tacait":["tâcâit","tâcâi","tăcăit","tăcăi"],"tacaiti":["tâcâiți","tâcâi","tăcăiți","tăcăi"],"tacaitoarea":"tăcăitoare","tacaitori":"tăcăitoare","tacaitorii":"tăcăitoare","tacaitorile":"tăcăitoare","tacaitorilor":"tăcăitoare","tacaituri":["tâcâituri","tâcâitură","tăcăituri","tăcăitură"],"tacaiturii":["tâcâiturii","tâcâitură","tăcăiturii","tăcăitură"],"tacaiturile":["tâcâiturile","tâcâitură","tăcăiturile","tăcăitură"],"tacaiturilor":["tâcâiturilor","tâcâitură","tăcăiturilor","tăcăitură"],"tacalasul":"țăcălaș","tacalasule":"țăcălaș","tacalasului":"țăcălaș","tacalasuri":"țăcălaș","tacalasurile":"țăcălaș","tacalasurilor":"țăcălaș","tacalia":"țăcălie","tacaliei":"țăcălie","tacalii":"țăcălie","tacaliile":"țăcălie","tacaliilor":"țăcălie","tacamul":"tacâm","tacamule":"tacâm","tacamului":"tacâm","tacamuri":"tacâm","tacamurile":"tacâm","tacamurilor":"tacâm","tacand":"tăcea","tacanea":"țăcăni","tacaneai":"țăcăni","tacaneam":"țăcăni","tacaneati":"țăcăni","tacaneau":"țăcăni","tacanele":"țăcăneală","tacanelei":"țăcăneală","tacanelele":"țăcăneală","tacanelelor":"țăcăneală","tacaneli":"țăcăneală","tacanesc":"țăcăni","tacaneste":"țăcăni","tacanesti":"țăcăni","tacanii":"țăcăni","tacanim":"țăcăni","tacanind":"țăcăni","tacanira":"țăcăni","tacaniram":"țăcăni","tacanirati":"țăcăni","tacanise":"țăcăni","tacanisem":"țăcăni","tacanisera":"țăcăni","tacaniseram":"țăcăni","tacaniserati":"țăcăni","tacanisesi":"țăcăni","tacanisi":"țăcăni","tacanit":"țăcăni","tacaniti":"țăcăni","tacanitoare":"țăcănitor","tacanitoarea":"țăcănitor","tacanitoarele":"țăcănitor","tacanitori":"țăcănitor","tacanitorii":"țăcănitor","tacanitorul":"țăcănitor","tacanitul":"țăcănit","tacanitule":"țăcănit","tacanitului":"țăcănit","tacanituri":["țăcănituri","țăcănit","țăcănituri","țăcănitură"],"tacaniturii":"țăcănitură","tacaniturile":["țăcăniturile","țăcănit","țăcăniturile","țăcănitură"],"tacaniturilor":["țăcăniturilor","țăcănit","țăcăniturilor","țăcănitură"],"tacatoare":"tăcător","tacatoarea":"tăcător","tacatoarele":"tăcător","tacatori":"tăcător","tacatorii":"tăcător","tacatorul":"tăcător","tace":["tăce","tacă","țace","țacă","tace","tăcea"],"taceai":"tăcea","taceam":"tăcea","taceati":"tăcea","taceau":"tăcea","tacei":["tăcei","tacă","țacei","țacă"],"tacele":["tăcele","tacă","țacele","țacă"],"tacelor":["tăcelor","tacă","țacelor","țacă"],"tacem":"tăcea","tacerea":"tăcere","taceri":"tăcere","tacerii":"tăcere","tacerile":"tăcere","tacerilor":"tăcere","taceti":"tăcea","tachinai":"tachina","tachinam":["tachinăm","tachina","tachinam","tachina"],"tachinand":"tachina","tachinara":"tachina","tachinaram":"tachina","tachinarati":"tachina","tachinarea":"tachinare","tachinaria":"tachinărie","tachinariei":"tachinărie","tachinarii":"tachinărie","tachinariile":"tachinărie","tachinariilor":"tachinărie","tachinase":"tachina","tachinasem":"tachina","tachinasera":"tachina","tachinaseram":"tachina","tachinaserati":"tachina","tachinasesi":"tachina","tachinasi":"tachina","tachinat":"tachina","tachinati":"tachina","tachinau":"tachina","tachineaza":"tachina","tachinez":"tachina","tachinezi":"tachina","taci":["tăci","tacă","taci","tăcea"],"tacita":["tacită","tacit","tacita","tacit"],"tacite":"tacit","tacitele":"tacit","taciti":"tacit","tacitii":"tacit","tacitul":"tacit","taciturna":["taciturnă","taciturn","taciturna","taciturn"],"taciturne":"taciturn","taciturnele":"taciturn","taciturni":"taciturn","taciturnii":"taciturn","taciturnitatea":"taciturnitate","taciturnitati":"taciturnitate","taciturnitatii":"taciturnitate","taciturnul":"taciturn","taciunai":"tăciuna","taciunam":["tăciunăm","tăciuna","tăciunam","tăciuna"],"taciunand":"tăciuna","taciunara":"tăciuna","taciunaram":"tăciuna","taciunarati":"tăciuna","taciunaria":"tăciunărie","taciunariei":"tăciunărie","taciunarii":"tăciunărie","taciunariile":"tăciunărie","taciunariilor":"tăciunărie","taciunase":"tăciuna","taciunasem":"tăciuna","taciunasera":"tăciuna","taciunaseram":"tăciuna","taciunaserati":"tăciuna","taciunasesi":"tăciuna","taciunasi":["tăciunași","tăciuna","tăciunași","tăciunaș"],"taciunasii":"tăciunaș","taciunasilor":"tăciunaș","taciunasul":"tăciunaș","taciunasule":"tăciunaș","taciunasului":"tăciunaș","taciunat":"tăciuna","taciunati":"tăciuna","taciunau":"tăciuna","taciuneaza":"tăciuna","taciunez":"tăciuna","taciunezi":"tăciuna","taciuni":"tăciune","tacla":"țaglă","taclagiuul":"taclagiu","taclagiuule":"taclagiu","taclagiuului":"taclagiu","tactai":"tacta","tactam":["tactăm","tacta","tactam","tacta"],"tactand":"tacta","tactara":"tacta","tactaram":"tacta","tactarati":"tacta","tactase":"tacta","tactasem":"tacta","tactasera":"tacta","tactaseram":"tacta","tactaserati":"tacta","tactasesi":"tacta","tactasi":"tacta","tactat":"tacta","tactati":"tacta","tactau":"tacta","tacteaza":"tacta","tactez":"tacta","tactezi":"tacta","tactica":["tactică","tactic","tactica","tactic"],"tactice":"tactic","tacticele":"tactic","tactici":["tactici","tactic","tactici","tactică"],"tacticianul":"tactician","tacticianule":"tactician","tacticianului":"tactician","tacticiene":"tacticiană","tacticienei":"tacticiană","tacticienele":"tacticiană","tacticienelor":"tacticiană","tacticieni":"tactician","tacticienii":"tactician","tacticienilor":"tactician","tacticii":["tacticii","tactic","tacticii","tactică"],"tacticile":"tactică","tacticilor":"tactică","tacticoasa":["tacticoasă","tacticos","tacticoasa","tacticos"],"tacticoase":"tacticos","tacticoasele":"tacticos","tacticosi":"tacticos","tacticosii":"tacticos","tacticosul":"tacticos","tacticul":"tactic","tactila":["tactilă","tactil","tactila","tactil"],"tactile":"tactil","tactilele":"tactil","tactili":"tactil","tactilii":"tactil","tactilitatea":"tactilitate","tactilitati":"tactilitate","tactilitatii":"tactilitate","tactilul":"tactil","tactisme":"tactism","tactismele":"tactism","tactismelor":"tactism","tactismul":"tactism","tactismule":"tactism","tactismului":"tactism","tactul":"tact","tactule":"tact","tactului":"tact","tacturi":"tact","tacturile":"tact","tacturilor":"tact","tacu":"tăcea","tacui":"tăcea","tacul":"tac","tacule":"tac","tacului":"tac","tacura":"tăcea","tacuram":"tăcea","tacurati":"tăcea","tacuri":"tac","tacurile":"tac","tacurilor":"tac","tacuse":"tăcea","tacusem":"tăcea","tacusera":"tăcea","tacuseram":"tăcea","tacuserati":"tăcea","tacusesi":"tăcea","tacusi":"tăcea","tacut":"tăcea","tacuta":["tăcută","tăcut","tăcuta","tăcut"],"tacute":"tăcut","tacutele":"tăcut","tacuti":"tăcut","tacutii":"tăcut","tacutul":"tăcut","tadjice":"tadjică","tadjicei":"tadjică","tadjicele":"tadjică","tadjicelor":"tadjică","tadjika":["tadjikă","tadjik","tadjika","tadjik"],"tadjike":["tadjike","tadjik","tadjike","tadjikă"],"tadjikei":"tadjikă","tadjikele":["tadjikele","tadjik","tadjikele","tadjikă"],"tadjikelor":"tadjikă","tadjiki":"tadjik","tadjikii":"tadjik","tadjikul":"tadjik","taefetul":"taefet","taefetule":"taefet","taefetului":"taefet","taefeturi":"taefet","taefeturile":"taefet","taefeturilor":"taefet","tafalcute":"tăfâlcuță","tafalcutei":"tăfâlcuță","tafalcutele":"tăfâlcuță","tafalcutelor":"tăfâlcuță","tafne":"țâfnă","tafnea":"țâfni","tafneai":"țâfni","tafneam":"țâfni","tafneati":"țâfni","tafneau":"țâfni","tafnei":"țâfnă","tafnele":"țâfnă","tafnelor":"țâfnă","tafnesc":"țâfni","tafneste":"țâfni","tafnesti":"țâfni","tafnii":"țâfni","tafnim":"țâfni","tafnind":"țâfni","tafnira":"țâfni","tafniram":"țâfni","tafnirati":"țâfni","tafnise":"țâfni","tafnisem":"țâfni","tafnisera":"țâfni","tafniseram":"țâfni","tafniserati":"țâfni","tafnisesi":"țâfni","tafnisi":"țâfni","tafnit":"țâfni","tafniti":"țâfni","tafnoasa":["țâfnoasă","țâfnos","țâfnoasa","țâfnos"],"tafnoase":"țâfnos","tafnoasele":"țâfnos","tafnosi":"țâfnos","tafnosii":"țâfnos","tafnosul":"țâfnos","tafofobia":"tafofobie","tafofobiei":"tafofobie","tafofobii":"tafofobie","tafofobiile":"tafofobie","tafofobiilor":"tafofobie","tafonomia":"tafonomie","tafonomiei":"tafonomie","tafonomii":"tafonomie","tafonomiile":"tafonomie","tafonomiilor":"tafonomie","tafte":"taftă","taftei":"taftă","taftele":"taftă","taftelor":"taftă","taftul":"taft","taftule":"taft","taftului":"taft","tafturasi":"tăfturaș","tafturasii":"tăfturaș","tafturasilor":"tăfturaș","tafturasul":"tăfturaș","tafturasule":"tăfturaș","tafturasului":"tăfturaș","tafturi":"taft","tafturile":"taft","tafturilor":"taft","tagadasul":"tăgădaș","tagadasule":"tăgădaș","tagadasului":"tăgădaș","tagadasuri":"tăgădaș","tagadasurile":"tăgădaș","tagadasurilor":"tăgădaș","tagadatul":"tăgădat","tagadatule":"tăgădat","tagadatului":"tăgădat","tagade":"tăgadă","tagadei":"tăgadă","tagadele":"tăgadă","tagadelor":"tăgadă","tagadnica":["tăgadnică","tăgadnic","tăgadnica","tăgadnic"],"tagadnice":"tăgadnic","tagadnicele":"tăgadnic","tagadnici":"tăgadnic","tagadnicii":"tăgadnic","tagadnicul":"tăgadnic","tagaduia":"tăgădui","tagaduiai":"tăgădui","tagaduiam":"tăgădui","tagaduiati":"tăgădui","tagaduiau":"tăgădui","tagaduieli":"tăgăduială","tagaduielii":"tăgăduială","tagaduielile":"tăgăduială","tagaduielilor":"tăgăduială","tagaduiesc":"tăgădui","tagaduieste":"tăgădui","tagaduiesti":"tăgădui","tagaduii":"tăgădui","tagaduim":"tăgădui","tagaduind":"tăgădui","tagaduinte":"tăgăduință","tagaduintei":"tăgăduință","tagaduintele":"tăgăduință","tagaduintelor":"tăgăduință","tagaduira":"tăgădui","tagaduiram":"tăgădui","tagaduirati":"tăgădui","tagaduirea":"tăgăduire","tagaduiri":"tăgăduire","tagaduirii":"tăgăduire","tagaduirile":"tăgăduire","tagaduirilor":"tăgăduire","tagaduise":"tăgădui","tagaduisem":"tăgădui","tagaduisera":"tăgădui","tagaduiseram":"tăgădui","tagaduiserati":"tăgădui","tagaduisesi":"tăgădui","tagaduisi":"tăgădui","tagaduit":"tăgădui","tagaduita":["tăgăduită","tăgăduit","tăgăduita","tăgăduit"],"tagaduite":"tăgăduit","tagaduitele":"tăgăduit","tagaduiti":["tăgăduiți","tăgădui","tăgăduiți","tăgăduit"],"tagaduitii":"tăgăduit","tagaduitori":"tăgăduitor","tagaduitorii":"tăgăduitor","tagaduitorilor":"tăgăduitor","tagaduitorul":"tăgăduitor","tagaduitorule":"tăgăduitor","tagaduitorului":"tăgăduitor","tagaduitul":"tăgăduit","tagarcioare":"tăgârcioară","tagarcioarei":"tăgârcioară","tagarcioarele":"tăgârcioară","tagarcioarelor":"tăgârcioară","tagasirea":"tăgășire","tagasiri":"tăgășire","tagasirii":"tăgășire","tagasirile":"tăgășire","tagasirilor":"tăgășire","tage":"tagă","tagei":"tagă","tagle":"țaglă","tagme":"tagmă","tagmei":"tagmă","tagmele":"tagmă","tagmelor":"tagmă","tahaci":"tahac","tahacii":"tahac","tahacilor":"tahac","tahacul":"tahac","tahacule":"tahac","tahacului":"tahac","tahanul":"tahân","tahanule":"tahân","tahanului":"tahân","tahanuri":"tahân","tahanurile":"tahân","tahanurilor":"tahân","taharai":"taharău","taharaii":"taharău","taharailor":"taharău","taharauul":"taharău","taharauule":"taharău","taharauului":"taharău","taheometre":"taheometru","taheometrele":"taheometru","taheometrelor":"taheometru","taheometria":"taheometrie","taheometriei":"taheometrie","taheometrii":"taheometrie","taheometrul":"taheometru","taheometrule":"taheometru","taheometrului":"taheometru","tahiaritmia":"tahiaritmie","tahiaritmiei":"tahiaritmie","tahiaritmii":"tahiaritmie","tahiaritmiile":"tahiaritmie","tahiaritmiilor":"tahiaritmie","tahicardia":"tahicardie","tahicardiei":"tahicardie","tahicardii":"tahicardie","tahicardiile":"tahicardie","tahicardiilor":"tahicardie","tahifagia":"tahifagie","tahifagiei":"tahifagie","tahifagii":"tahifagie","tahifagiile":"tahifagie","tahifagiilor":"tahifagie","tahifemia":"tahifemie","tahifemiei":"tahifemie","tahifemii":"tahifemie","tahifemiile":"tahifemie","tahifemiilor":"tahifemie","tahifrazia":"tahifrazie","tahifraziei":"tahifrazie","tahifrazii":"tahifrazie","tahifraziile":"tahifrazie","tahifraziilor":"tahifrazie","tahigrafi":"tahigraf","tahigrafia":"tahigrafie","tahigrafica":["tahigrafică","tahigrafic","tahigrafica","tahigrafic"],"tahigrafice":"tahigrafic","tahigraficele":"tahigrafic","tahigrafici":"tahigrafic","tahigraficii":"tahigrafic","tahigraficul":"tahigrafic","tahigrafiei":"tahigrafie","tahigrafii":["tahigrafii","tahigraf","tahigrafii","tahigrafie"],"tahigrafiile":"tahigrafie","tahigrafiilor":"tahigrafie","tahigrafilor":"tahigraf","tahigraful":"tahigraf","tahigrafule":"tahigraf","tahigrafului":"tahigraf","tahilalia":"tahilalie","tahilalica":["tahilalică","tahilalic","tahilalica","tahilalic"],"tahilalice":["tahilalice","tahilalic","tahilalice","tahilalică"],"tahilalicei":"tahilalică","tahilalicele":["tahilalicele","tahilalic","tahilalicele","tahilalică"],"tahilalicelor":"tahilalică","tahilalici":"tahilalic","tahilalicii":"tahilalic","tahilalicul":"tahilalic","tahilaliei":"tahilalie","tahilalii":"tahilalie","tahilaliile":"tahilalie","tahilaliilor":"tahilalie","tahimetre":"tahimetru","tahimetrele":"tahimetru","tahimetrelor":"tahimetru","tahimetria":"tahimetrie","tahimetrica":["tahimetrică","tahimetric","tahimetrica","tahimetric"],"tahimetrice":"tahimetric","tahimetricele":"tahimetric","tahimetrici":"tahimetric","tahimetricii":"tahimetric","tahimetricul":"tahimetric","tahimetriei":"tahimetrie","tahimetrii":"tahimetrie","tahimetriile":"tahimetrie","tahimetriilor":"tahimetrie","tahimetrul":"tahimetru","tahimetrule":"tahimetru","tahimetrului":"tahimetru","tahiometre":"tahiometru","tahiometrele":"tahiometru","tahiometrelor":"tahiometru","tahiometruul":"tahiometru","tahiometruule":"tahiometru","tahiometruului":"tahiometru","tahioni":"tahion","tahionii":"tahion","tahionilor":"tahion","tahionul":"tahion","tahionule":"tahion","tahionului":"tahion","tahipneea":"tahipnee","tahipneei":"tahipnee","tahipneele":"tahipnee","tahipneelor":"tahipnee","tahipsia":"tahipsie","tahipsiei":"tahipsie","tahipsii":"tahipsie","tahipsiile":"tahipsie","tahipsiilor":"tahipsie","tahiscoape":"tahiscop","tahiscoapele":"tahiscop","tahiscoapelor":"tahiscop","tahiscopul":"tahiscop","tahiscopule":"tahiscop","tahiscopului":"tahiscop","tahisistolia":"tahisistolie","tahisistoliei":"tahisistolie","tahisistolii":"tahisistolie","tahisistoliile":"tahisistolie","tahisistoliilor":"tahisistolie","tahistoscoape":"tahistoscop","tahistoscoapele":"tahistoscop","tahistoscoapelor":"tahistoscop","tahistoscopica":["tahistoscopică","tahistoscopic","tahistoscopica","tahistoscopic"],"tahistoscopice":"tahistoscopic","tahistoscopicele":"tahistoscopic","tahistoscopici":"tahistoscopic","tahistoscopicii":"tahistoscopic","tahistoscopicul":"tahistoscopic","tahistoscopul":"tahistoscop","tahistoscopule":"tahistoscop","tahistoscopului":"tahistoscop","tahitiana":["tahitiană","tahitian","tahitiana","tahitian"],"tahitianul":"tahitian","tahitiene":["tahitiene","tahitian","tahitiene","tahitiană"],"tahitienei":"tahitiană","tahitienele":["tahitienele","tahitian","tahitienele","tahitiană"],"tahitienelor":"tahitiană","tahitieni":"tahitian","tahitienii":"tahitian","tahle":"țâhlă","tahlei":"țâhlă","tahlele":"țâhlă","tahlelor":"țâhlă","tahminul":"tahmin","tahminule":"tahmin","tahminului":"tahmin","tahminuri":"tahmin","tahminurile":"tahmin","tahminurilor":"tahmin","tahmisul":"tahmis","tahmisule":"tahmis","tahmisului":"tahmis","tahmisuri":"tahmis","tahmisurile":"tahmis","tahmisurilor":"tahmis","tahografe":"tahograf","tahografele":"tahograf","tahografelor":"tahograf","tahografia":"tahografie","tahografiei":"tahografie","tahografii":"tahografie","tahografiile":"tahografie","tahografiilor":"tahografie","tahograful":"tahograf","tahografule":"tahograf","tahografului":"tahograf","tahometre":"tahometru","tahometrele":"tahometru","tahometrelor":"tahometru","tahometrul":"tahometru","tahometrule":"tahometru","tahometrului":"tahometru","tahregii":"tahregiu","tahregiii":"tahregiu","tahregiilor":"tahregiu","tahregiuul":"tahregiu","tahregiuule":"tahregiu","tahregiuului":"tahregiu","tahtul":"taht","tahtule":"taht","tahtului":"taht","tahturi":"taht","tahturile":"taht","tahturilor":"taht","tahuia":"tăhui","tahuie":"tăhui","tahuiele":"tăhui","tahuii":"tăhui","tahuiul":"tăhui","tahvilul":"tahvil","tahvilule":"tahvil","tahvilului":"tahvil","tahviluri":"tahvil","tahvilurile":"tahvil","tahvilurilor":"tahvil","tai":["tai","tăia","tăi","tău","tăi","tu"],"taiai":"tăia","taiam":"tăia","taiara":"tăia","taiaram":"tăia","taiarati":"tăia","taiase":"tăia","taiasem":"tăia","taiasera":"tăia","taiaseram":"tăia","taiaserati":"tăia","taiasesi":"tăia","taiasi":"tăia","taiat":"tăia","taiat frunza la caini":"tăia frunză la câini","taiat si spanzurat":"tăia și spânzura","taiata":["tăiată","tăiat","tăiata","tăiat"],"taiate":"tăiat","taiatele":"tăiat","taiati":["tăiați","tăia","tăiați","tăiat"],"taiatii":"tăiat","taiatul":"tăiat","taiau":"tăia","taicii":"taică","taiculeanul":"tăiculean","taiculeanule":"tăiculean","taiculeanului":"tăiculean","taiculeni":"tăiculean","taiculenii":"tăiculean","taiculenilor":"tăiculean","taiculitei":"tăiculiță","taicusori":"tăicușor","taicusorii":"tăicușor","taicusorilor":"tăicușor","taicusorul":"tăicușor","taicusorule":"tăicușor","taicusorului":"tăicușor","taicutei":"tăicuță","taicuti":"tăicuț","taicutii":"tăicuț","taicutilor":"tăicuț","taicutul":"tăicuț","taicutule":"tăicuț","taicutului":"tăicuț","taie":["taie","tăia","tăie","tăia"],"taie frunza la caini":"tăia frunză la câini","taie si spanzura":"tăia și spânzura","taiem":"tăia","taiere":["taiere","taier","tăiere","tăier"],"taierele":["taierele","taier","tăierele","tăier","tăierele","tăierel"],"taierelele":"tăierel","taierelelor":"tăierel","taierelor":["taierelor","taier","tăierelor","tăier"],"taierelul":"tăierel","taierelule":"tăierel","taierelului":"tăierel","taieri":"tăiere","taieri de par":"tăiere de păr","taierul":["taierul","taier","tăierul","tăier"],"taierule":["taierule","taier","tăierule","tăier"],"taierului":["taierului","taier","tăierului","tăier"],"taieteii":"tăieței","taieteilor":"tăieței","taietoara":"tăietor","taietoare":"tăietor","taietoarea":"tăietoare","taietoarei":"tăietoare","taietoarele":["tăietoarele","tăietoare","tăietoarele","tăietor"],"taietoarelor":"tăietoare","taietori":"tăietor","taietorii":"tăietor","taietorul":"tăietor","taieturi":"tăietură","taieturii":"tăietură","taieturile":"tăietură","taieturilor":"tăietură","taifasuia":"tăifăsui","taifasuiai":"tăifăsui","taifasuiam":"tăifăsui","taifasuiati":"tăifăsui","taifasuiau":"tăifăsui","taifasuiele":"tăifăsuială","taifasuielei":"tăifăsuială","taifasuielele":"tăifăsuială","taifasuielelor":"tăifăsuială","taifasuieli":"tăifăsuială","taifasuiesc":"tăifăsui","taifasuieste":"tăifăsui","taifasuiesti":"tăifăsui","taifasuii":"tăifăsui","taifasuim":"tăifăsui","taifasuind":"tăifăsui","taifasuira":"tăifăsui","taifasuiram":"tăifăsui","taifasuirati":"tăifăsui","taifasuise":"tăifăsui","taifasuisem":"tăifăsui","taifasuisera":"tăifăsui","taifasuiseram":"tăifăsui","taifasuiserati":"tăifăsui","taifasuisesi":"tăifăsui","taifasuisi":"tăifăsui","taifasuit":"tăifăsui","taifasuiti":"tăifăsui","taifasul":"taifas","taifasule":"taifas","taifasului":"taifas","taifasuri":"taifas","taifasurile":"taifas","taifasurilor":"taifas","taifetul":"taifet","taifetule":"taifet","taifetului":"taifet","taifeturi":"taifet","taifeturile":"taifet","taifeturilor":"taifet","taifunul":"taifun","taifunule":"taifun","taifunului":"taifun","taifunuri":"taifun","taifunurile":"taifun","taifunurilor":"taifun","taigale":"taiga","taigalei":"taiga","taigalele":"taiga","taigalelor":"taiga","taigaua":"taiga","taikonaute":"taikonaută","taikonautei":"taikonaută","taikonautele":"taikonaută","taikonautelor":"taikonaută","taim-autul":"taim-aut","taim-autule":"taim-aut","taim-autului":"taim-aut","taim-auturi":"taim-aut","taim-auturile":"taim-aut","taim-auturilor":"taim-aut","taind":"tăia","taine":"taină","tainei":"taină","tainele":"taină","tainelor":"taină","tainica":["tainică","tainic","tainica","tainic"],"tainice":"tainic","tainicele":"tainic","tainici":"tainic","tainicia":"tăinicie","tainiciei":"tăinicie","tainicii":["tainicii","tainic","tăinicii","tăinicie"],"tainiciile":"tăinicie","tainiciilor":"tăinicie","tainicul":"tainic","tainite":"tainiță","tainitei":"tainiță","tainitele":"tainiță","tainitelor":"tainiță","tainitul":"tăinit","tainitule":"tăinit","tainitului":"tăinit","tainuia":"tăinui","tainuiai":"tăinui","tainuiam":"tăinui","tainuiati":"tăinui","tainuiau":"tăinui","tainuiesc":"tăinui","tainuieste":"tăinui","tainuiesti":"tăinui","tainuii":"tăinui","tainuim":"tăinui","tainuind":"tăinui","tainuira":"tăinui","tainuiram":"tăinui","tainuirati":"tăinui","tainuirea":"tăinuire","tainuiri":"tăinuire","tainuirii":"tăinuire","tainuirile":"tăinuire","tainuirilor":"tăinuire","tainuise":"tăinui","tainuisem":"tăinui","tainuisera":"tăinui","tainuiseram":"tăinui","tainuiserati":"tăinui","tainuisesi":"tăinui","tainuisi":"tăinui","tainuit":"tăinui","tainuita":["tăinuită","tăinuit","tăinuita","tăinuit"],"tainuite":"tăinuit","tainuitele":"tăinuit","tainuiti":["tăinuiți","tăinui","tăinuiți","tăinuit"],"tainuitii":"tăinuit","tainuitoare":"tăinuitor","tainuitoarea":["tăinuitoarea","tăinuitoare","tăinuitoarea","tăinuitor"],"tainuitoarei":"tăinuitoare","tainuitoarele":["tăinuitoarele","tăinuitoare","tăinuitoarele","tăinuitor"],"tainuitoarelor":"tăinuitoare","tainuitori":"tăinuitor","tainuitoria":"tăinuitoriu","tainuitorie":"tăinuitoriu","tainuitorii":["tăinuitorii","tăinuitor","tăinuitorii","tăinuitoriu"],"tainuitoriii":"tăinuitoriu","tainuitoriile":"tăinuitoriu","tainuitoriul":"tăinuitoriu","tainuitoriuul":"tăinuitoriu","tainuitoriuule":"tăinuitoriu","tainuitoriuului":"tăinuitoriu","tainuitorul":"tăinuitor","tainuitul":"tăinuit","tainul":"tain","tainule":"tain","tainului":"tain","tainuri":"tain","tainurile":"tain","tainurilor":"tain","taioare":"taior","taioarele":"taior","taioarelor":"taior","taioasa":["tăioasă","tăios","tăioasa","tăios"],"taioase":"tăios","taioasele":"tăios","taiorase":"taioraș","taiorasele":"taioraș","taioraselor":"taioraș","taiorasul":"taioraș","taiorasule":"taioraș","taiorasului":"taioraș","taiorul":"taior","taiorule":"taior","taiorului":"taior","taiosi":"tăios","taiosii":"tăios","taiosul":"tăios","taisul":"tăiș","taisule":"tăiș","taisului":"tăiș","taisuri":"tăiș","taisurile":"tăiș","taisurilor":"tăiș","taiteii":"tăiței","taiteilor":"tăiței","taiteiul":"tăiței","taiteiule":"tăiței","taiteiului":"tăiței","taiwaneze":"taiwaneză","taiwanezei":"taiwaneză","taiwanezele":"taiwaneză","taiwanezelor":"taiwaneză","talai":"tălaie","talaiea":"tălaie","talaii":"tălaie","talaile":"tălaie","talailor":"tălaie","talajul":"talaj","talajule":"talaj","talajului":"talaj","talalaia":"tălălăi","talalaiai":"tălălăi","talalaiam":"tălălăi","talalaiati":"tălălăi","talalaiau":"tălălăi","talalaiele":"tălălăială","talalaielei":"tălălăială","talalaielele":"tălălăială","talalaielelor":"tălălăială","talalaieli":"tălălăială","talalaiesc":"tălălăi","talalaieste":"tălălăi","talalaiesti":"tălălăi","talalaii":"tălălăi","talalaim":"tălălăi","talalaind":"tălălăi","talalaira":"tălălăi","talalairam":"tălălăi","talalairati":"tălălăi","talalaise":"tălălăi","talalaisem":"tălălăi","talalaisera":"tălălăi","talalaiseram":"tălălăi","talalaiserati":"tălălăi","talalaisesi":"tălălăi","talalaisi":"tălălăi","talalait":"tălălăi","talalaiti":"tălălăi","talalauul":"tălălău","talalauule":"tălălău","talalauului":"tălălău","talamica":["talamică","talamic","talamica","talamic"],"talamice":"talamic","talamicele":"talamic","talamici":"talamic","talamicii":"talamic","talamicul":"talamic","talamotomia":"talamotomie","talamotomiei":"talamotomie","talamotomii":"talamotomie","talamotomiile":"talamotomie","talamotomiilor":"talamotomie","talamul":"talâm","talamule":"talâm","talamului":"talâm","talamuri":"talâm","talamurile":"talâm","talamurilor":"talâm","talamusul":"talamus","talamusule":"talamus","talamusului":"talamus","talamusuri":"talamus","talamusurile":"talamus","talamusurilor":"talamus","talance":"talancă","talancei":"talancă","talancele":"talancă","talancelor":"talancă","talanci":"talancă","talancute":"tălăncuță","talancutei":"tălăncuță","talancutele":"tălăncuță","talancutelor":"tălăncuță","talange":"talangă","talangei":"talangă","talangele":"talangă","talangelor":"talangă","talangi":"talangă","talanite":"tălaniță","talanitei":"tălaniță","talanitele":"tălaniță","talanitelor":"tălaniță","talanti":"talant","talantii":"talant","talantilor":"talant","talantul":"talant","talantule":"talant","talantului":"talant","talasemia":"talasemie","talasemiei":"talasemie","talasemii":"talasemie","talasemiile":"talasemie","talasemiilor":"talasemie","talasmana":["tălășmană","tălășman","tălășmana","tălășman"],"talasmane":"tălășman","talasmanea":"tălășmăni","talasmaneai":"tălășmăni","talasmaneam":"tălășmăni","talasmaneati":"tălășmăni","talasmaneau":"tălășmăni","talasmanele":"tălășman","talasmanesc":"tălășmăni","talasmaneste":"tălășmăni","talasmanesti":"tălășmăni","talasmani":"tălășman","talasmanii":["tălășmanii","tălășman","tălășmănii","tălășmăni"],"talasmanim":"tălășmăni","talasmanind":"tălășmăni","talasmanira":"tălășmăni","talasmaniram":"tălășmăni","talasmanirati":"tălășmăni","talasmanise":"tălășmăni","talasmanisem":"tălășmăni","talasmanisera":"tălășmăni","talasmaniseram":"tălășmăni","talasmaniserati":"tălășmăni","talasmanisesi":"tălășmăni","talasmanisi":"tălășmăni","talasmanit":"tălășmăni","talasmaniti":"tălășmăni","talasmanul":"tălășman","talasocratia":"talasocrație","talasocratiei":"talasocrație","talasocratii":"talasocrație","talasofobia":"talasofobie","talasofobiei":"talasofobie","talasofobii":"talasofobie","talasofobiile":"talasofobie","talasofobiilor":"talasofobie","talasogeneze":"talasogeneză","talasogenezei":"talasogeneză","talasogenezele":"talasogeneză","talasogenezelor":"talasogeneză","talasografia":"talasografie","talasografiei":"talasografie","talasografii":"talasografie","talasoterapia":"talasoterapie","talasoterapiei":"talasoterapie","talasoterapii":"talasoterapie","talaste":"talașcă","talastei":"talașcă","talastele":"talașcă","talastelor":"talașcă","talasti":"talașcă","talasul":"talaș","talasule":"talaș","talasului":"talaș","talazoterapia":"talazoterapie","talazoterapiei":"talazoterapie","talazoterapii":"talazoterapie","talazoterapiile":"talazoterapie","talazoterapiilor":"talazoterapie","talazuirea":"tălăzuire","talazuiri":"tălăzuire","talazuirii":"tălăzuire","talazuirile":"tălăzuire","talazuirilor":"tălăzuire","talazuita":["tălăzuită","tălăzuit","tălăzuita","tălăzuit"],"talazuite":"tălăzuit","talazuitele":"tălăzuit","talazuiti":"tălăzuit","talazuitii":"tălăzuit","talazuitul":"tălăzuit","talazul":"talaz","talazule":"talaz","talazului":"talaz","talazuri":"talaz","talazurile":"talaz","talazurilor":"talaz","talbacituri":"tălbăcitură","talbaciturii":"tălbăcitură","talbaciturile":"tălbăcitură","talbaciturilor":"tălbăcitură","talciocul":"talcioc","talciocule":"talcioc","talciocului":"talcioc","talciocuri":"talcioc","talciocurile":"talcioc","talciocurilor":"talcioc","talcovania":"tâlcovanie","talcovaniei":"tâlcovanie","talcovanii":"tâlcovanie","talcovaniile":"tâlcovanie","talcovaniilor":"tâlcovanie","talcovnici":"tâlcovnic","talcovnicii":"tâlcovnic","talcovnicilor":"tâlcovnic","talcovnicul":"tâlcovnic","talcovnicule":"tâlcovnic","talcovnicului":"tâlcovnic","talcoze":"talcoză","talcozei":"talcoză","talcozele":"talcoză","talcozelor":"talcoză","talcsistul":"talcșist","talcsistule":"talcșist","talcsistului":"talcșist","talcsisturi":"talcșist","talcsisturile":"talcșist","talcsisturilor":"talcșist","talcuia":"tâlcui","talcuiai":"tâlcui","talcuiam":"tâlcui","talcuiati":"tâlcui","talcuiau":"tâlcui","talcuiesc":"tâlcui","talcuieste":"tâlcui","talcuiesti":"tâlcui","talcuii":"tâlcui","talcuim":"tâlcui","talcuind":"tâlcui","talcuira":"tâlcui","talcuiram":"tâlcui","talcuirati":"tâlcui","talcuirea":"tâlcuire","talcuiri":"tâlcuire","talcuirii":"tâlcuire","talcuirile":"tâlcuire","talcuirilor":"tâlcuire","talcuise":"tâlcui","talcuisem":"tâlcui","talcuisera":"tâlcui","talcuiseram":"tâlcui","talcuiserati":"tâlcui","talcuisesi":"tâlcui","talcuisi":"tâlcui","talcuit":"tâlcui","talcuiti":"tâlcui","talcuitoarea":"tâlcuitoare","talcuitoarei":"tâlcuitoare","talcuitoarele":"tâlcuitoare","talcuitoarelor":"tâlcuitoare","talcuitori":"tâlcuitor","talcuitorii":"tâlcuitor","talcuitorilor":"tâlcuitor","talcuitorul":"tâlcuitor","talcuitorule":"tâlcuitor","talcuitorului":"tâlcuitor","talcul":["talcul","talc","tâlcul","tâlc"],"talcule":["talcule","talc","tâlcule","tâlc"],"talcului":["talcului","talc","tâlcului","tâlc"],"talcuri":"tâlc","talcurile":"tâlc","talcurilor":"tâlc","tale":["tale","tală","tale","tău","tale","tu"],"talei":"tală","talele":"tală","talelor":"tală","talentata":["talentată","talentat","talentata","talentat"],"talentate":"talentat","talentatele":"talentat","talentati":"talentat","talentatii":"talentat","talentatul":"talentat","talente":"talent","talentele":"talent","talentelor":"talent","talentoasa":["talentoasă","talentos","talentoasa","talentos"],"talentoase":"talentos","talentoasele":"talentos","talentosi":"talentos","talentosii":"talentos","talentosul":"talentos","talentul":"talent","talentule":"talent","talentului":"talent","talerase":"taleraș","talerasele":"taleraș","taleraselor":"taleraș","talerasi":"tăleraș","talerasii":"tăleraș","talerasilor":"tăleraș","talerasul":["talerașul","taleraș","tălerașul","tăleraș"],"talerasule":["talerașule","taleraș","tălerașule","tăleraș"],"talerasului":["talerașului","taleraș","tălerașului","tăleraș"],"talerele":"tălerel","talerelele":"tălerel","talerelelor":"tălerel","talerelul":"tălerel","talerelule":"tălerel","talerelului":"tălerel","taleri":"taler","talerii":"taler","talerilor":"taler","taleriste":"taleristă","taleristei":"taleristă","taleristele":"taleristă","taleristelor":"taleristă","talerul":"taler","talerule":"taler","talerului":"taler","talgerase":["talgerașe","talgeraș","tălgerașe","tălgeraș"],"talgerasele":["talgerașele","talgeraș","tălgerașele","tălgeraș"],"talgeraselor":["talgerașelor","talgeraș","tălgerașelor","tălgeraș"],"talgerasul":["talgerașul","talgeraș","tălgerașul","tălgeraș"],"talgerasule":["talgerașule","talgeraș","tălgerașule","tălgeraș"],"talgerasului":["talgerașului","talgeraș","tălgerașului","tălgeraș"],"talgere":"talger","talgerele":["talgerele","talger","tălgerele","tălgerel"],"talgerelele":"tălgerel","talgerelelor":"tălgerel","talgerelor":"talger","talgerelul":"tălgerel","talgerelule":"tălgerel","talgerelului":"tălgerel","talgerul":"talger","talgerule":"talger","talgerului":"talger","talgerute":"tălgeruț","talgerutele":"tălgeruț","talgerutelor":"tălgeruț","talgerutul":"tălgeruț","talgerutule":"tălgeruț","talgerutului":"tălgeruț","talgiori":"tălgior","talgiorii":"tălgior","talgiorilor":"tălgior","talgiorul":"tălgior","talgiorule":"tălgior","talgiorului":"tălgior","talharasi":"tâlhăraș","talharasii":"tâlhăraș","talharasilor":"tâlhăraș","talharasugul":["tâlhărășugul","tâlhărășug","tălhărășugul","tălhărășug"],"talharasugule":["tâlhărășugule","tâlhărășug","tălhărășugule","tălhărășug"],"talharasugului":["tâlhărășugului","tâlhărășug","tălhărășugului","tălhărășug"],"talharasuguri":["tâlhărășuguri","tâlhărășug","tălhărășuguri","tălhărășug"],"talharasugurile":["tâlhărășugurile","tâlhărășug","tălhărășugurile","tălhărășug"],"talharasugurilor":["tâlhărășugurilor","tâlhărășug","tălhărășugurilor","tălhărășug"],"talharasul":"tâlhăraș","talharasule":"tâlhăraș","talharasului":"tâlhăraș","talharea":"tâlhări","talhareai":"tâlhări","talhaream":"tâlhări","talhareasca":["tâlhărească","tâlhăresc","tâlhăreasca","tâlhăresc"],"talhareati":"tâlhări","talhareau":"tâlhări","talhareaua":"tâlhărea","talharei":"tâlhărel","talhareii":"tâlhărel","talhareilor":"tâlhărel","talharele":"tâlhărea","talharelei":"tâlhărea","talharelele":"tâlhărea","talharelelor":"tâlhărea","talharelul":"tâlhărel","talharelule":"tâlhărel","talharelului":"tâlhărel","talharesc":"tâlhări","talharescul":"tâlhăresc","talhareste":"tâlhări","talharesti":["tâlhărești","tâlhăresc","tâlhărești","tâlhări"],"talharestii":"tâlhăresc","talharestile":"tâlhăresc","talharetul":"tâlhăret","talharetule":"tâlhăret","talharetului":"tâlhăret","talhari":["tâlhari","tâlhar","tălhari","tălhar"],"talharia":"tâlhărie","talhariei":"tâlhărie","talharii":["tâlharii","tâlhar","tălharii","tălhar","tâlhării","tâlhări","tâlhării","tâlhărie"],"talharii la drumul mare":"tâlhărie la drumul mare","talhariile":"tâlhărie","talhariilor":"tâlhărie","talharilor":["tâlharilor","tâlhar","tălharilor","tălhar"],"talharim":"tâlhări","talharimea":"tâlhărime","talharimi":"tâlhărime","talharimii":"tâlhărime","talharind":"tâlhări","talharira":"tâlhări","talhariram":"tâlhări","talharirati":"tâlhări","talharirea":"tâlhărire","talhariri":"tâlhărire","talharirii":"tâlhărire","talharirile":"tâlhărire","talharirilor":"tâlhărire","talharise":"tâlhări","talharisem":"tâlhări","talharisera":"tâlhări","talhariseram":"tâlhări","talhariserati":"tâlhări","talharisesi":"tâlhări","talharisi":"tâlhări","talharit":"tâlhări","talharita":["tâlhărită","tâlhărit","tâlhărita","tâlhărit"],"talharite":["tâlhărite","tâlhărit","tâlhărițe","tâlhăriță"],"talharitei":"tâlhăriță","talharitele":["tâlhăritele","tâlhărit","tâlhărițele","tâlhăriță"],"talharitelor":"tâlhăriță","talhariti":["tâlhăriți","tâlhări","tâlhăriți","tâlhărit"],"talharitii":"tâlhărit","talharitul":"tâlhărit","talharoaice":"tâlhăroaică","talharoaicei":"tâlhăroaică","talharoaicele":"tâlhăroaică","talharoaicelor":"tâlhăroaică","talharoii":"tâlhăroi","talharoilor":"tâlhăroi","talharoiul":"tâlhăroi","talharoiule":"tâlhăroi","talharoiului":"tâlhăroi","talharsagul":"tâlhărșag","talharsagule":"tâlhărșag","talharsagului":"tâlhărșag","talharsaguri":"tâlhărșag","talharsagurile":"tâlhărșag","talharsagurilor":"tâlhărșag","talharul":["tâlharul","tâlhar","tălharul","tălhar"],"talharule":["tâlharule","tâlhar","tălharule","tălhar"],"talharului":["tâlharului","tâlhar","tălharului","tălhar"],"talharusi":"tâlhăruș","talharusii":"tâlhăruș","talharusilor":"tâlhăruș","talharusul":"tâlhăruș","talharusule":"tâlhăruș","talharusului":"tâlhăruș","talhuia":"tâlhui","talhuiai":"tâlhui","talhuiam":"tâlhui","talhuiati":"tâlhui","talhuiau":"tâlhui","talhuiesc":"tâlhui","talhuieste":"tâlhui","talhuiesti":"tâlhui","talhuii":"tâlhui","talhuim":"tâlhui","talhuind":"tâlhui","talhuira":"tâlhui","talhuiram":"tâlhui","talhuirati":"tâlhui","talhuise":"tâlhui","talhuisem":"tâlhui","talhuisera":"tâlhui","talhuiseram":"tâlhui","talhuiserati":"tâlhui","talhuisesi":"tâlhui","talhuisi":"tâlhui","talhuit":"tâlhui","talhuiti":"tâlhui","talhusagul":"tâlhușag","talhusagule":"tâlhușag","talhusagului":"tâlhușag","talhusaguri":"tâlhușag","talhusagurile":"tâlhușag","talhusagurilor":"tâlhușag","talia":"talie","talibani":"taliban","talibanii":"taliban","talibanilor":"taliban","talibanul":"taliban","talibanule":"taliban","talibanului":"taliban","taliei":"talie","talii":"talie","taliile":"talie","taliilor":"talie","talimani":"taliman","talimanii":"taliman","talimanilor":"taliman","talimanul":"taliman","talimanule":"taliman","talimanului":"taliman","talionica":["talionică","talionic","talionica","talionic"],"talionice":"talionic","talionicele":"talionic","talionici":"talionic","talionicii":"talionic","talionicul":"talionic","talionul":"talion","talionule":"talion","talionului":"talion","talismane":"talisman","talismanele":"talisman","talismanelor":"talisman","talismanica":["talismanică","talismanic","talismanica","talismanic"],"talismanice":"talismanic","talismanicele":"talismanic","talismanici":"talismanic","talismanicii":"talismanic","talismanicul":"talismanic","talismanul":"talisman","talismanule":"talisman","talismanului":"talisman","taliul":"taliu","taliule":"taliu","taliului":"taliu","taliute":"tăliuță","taliutei":"tăliuță","taliutele":"tăliuță","taliutelor":"tăliuță","talk-show-uri":"talk-show","talk-show-urile":"talk-show","talk-show-urilor":"talk-show","talk-showul":"talk-show","talk-showule":"talk-show","talk-showului":"talk-show","talkie-walkieul":"talkie-walkie","talkie-walkieule":"talkie-walkie","talkie-walkieului":"talkie-walkie","talmacea":"tălmăci","talmaceai":"tălmăci","talmaceam":"tălmăci","talmaceati":"tălmăci","talmaceau":"tălmăci","talmacesc":"tălmăci","talmaceste":"tălmăci","talmacesti":"tălmăci","talmacia":"tălmăcie","talmaciari":"tălmăciar","talmaciarii":"tălmăciar","talmaciarilor":"tălmăciar","talmaciarul":"tălmăciar","talmaciarule":"tălmăciar","talmaciarului":"tălmăciar","talmaciei":"tălmăcie","talmacii":["tâlmacii","tâlmaci","tălmacii","tălmaci","tălmăcii","tălmăci","tălmăcii","tălmăcie"],"talmaciile":"tălmăcie","talmaciilor":"tălmăcie","talmacilor":["tâlmacilor","tâlmaci","tălmacilor","tălmaci"],"talmacim":"tălmăci","talmacind":"tălmăci","talmacira":"tălmăci","talmaciram":"tălmăci","talmacirati":"tălmăci","talmacirea":"tălmăcire","talmaciri":"tălmăcire","talmacirii":"tălmăcire","talmacirile":"tălmăcire","talmacirilor":"tălmăcire","talmacise":"tălmăci","talmacisem":"tălmăci","talmacisera":"tălmăci","talmaciseram":"tălmăci","talmaciserati":"tălmăci","talmacisesi":"tălmăci","talmacisi":"tălmăci","talmacit":"tălmăci","talmacita":["tălmăcită","tălmăcit","tălmăcita","tălmăcit"],"talmacite":"tălmăcit","talmacitele":"tălmăcit","talmaciti":["tălmăciți","tălmăci","tălmăciți","tălmăcit"],"talmacitii":"tălmăcit","talmacitoarea":"tălmăcitoare","talmacitoarei":"tălmăcitoare","talmacitoarele":"tălmăcitoare","talmacitoarelor":"tălmăcitoare","talmacitori":"tălmăcitor","talmacitorii":"tălmăcitor","talmacitorilor":"tălmăcitor","talmacitorul":"tălmăcitor","talmacitorule":"tălmăcitor","talmacitorului":"tălmăcitor","talmacitul":"tălmăcit","talmacituri":"tălmăcitură","talmaciturii":"tălmăcitură","talmaciturile":"tălmăcitură","talmaciturilor":"tălmăcitură","talmaciul":["tâlmaciul","tâlmaci","tălmaciul","tălmaci"],"talmaciule":["tâlmaciule","tâlmaci","tălmaciule","tălmaci"],"talmaciului":["tâlmaciului","tâlmaci","tălmaciului","tălmaci"],"talmazoaicele":"tălmăzoaice","talmazoaicelor":"tălmăzoaice","talmes-balmesul":"talmeș-balmeș","talmes-balmesule":"talmeș-balmeș","talmes-balmesului":"talmeș-balmeș","talmudica":["talmudică","talmudic","talmudica","talmudic"],"talmudice":"talmudic","talmudicele":"talmudic","talmudici":"talmudic","talmudicii":"talmudic","talmudicul":"talmudic","talmudisme":"talmudism","talmudismele":"talmudism","talmudismelor":"talmudism","talmudismul":"talmudism","talmudismule":"talmudism","talmudismului":"talmudism","talmudiste":"talmudistă","talmudistei":"talmudistă","talmudistele":"talmudistă","talmudistelor":"talmudistă","talmudisti":"talmudist","talmudistii":"talmudist","talmudistilor":"talmudist","talmudistul":"talmudist","talmudistule":"talmudist","talmudistului":"talmudist","talmudul":"talmud","talmudule":"talmud","talmudului":"talmud","talnisul":"tâlniș","talnisule":"tâlniș","talnisului":"tâlniș","talnisuri":"tâlniș","talnisurile":"tâlniș","talnisurilor":"tâlniș","talofite":"talofită","talofitei":"talofită","talofitele":"talofită","talofitelor":"talofită","talonajul":"talonaj","talonajule":"talonaj","talonajului":"talonaj","taloneri":"taloner","talonerii":"taloner","talonerilor":"taloner","talonerul":"taloner","talonerule":"taloner","talonerului":"taloner","talonete":"talonet","talonetele":"talonet","talonetelor":"talonet","talonetul":"talonet","talonetule":"talonet","talonetului":"talonet","talpasi":"tălpaș","talpasii":"tălpaș","talpasilor":"tălpaș","talpasul":"tălpaș","talpasule":"tălpaș","talpasului":"tălpaș","talpi":"talpă","talpici":["tălpici","tălpic","tălpici","tălpică"],"talpicii":["tălpicii","tălpic","tălpicii","tălpică"],"talpicile":"tălpică","talpicilor":["tălpicilor","tălpic","tălpicilor","tălpică"],"talpicul":"tălpic","talpicule":"tălpic","talpicului":"tălpic","talpigeii":"tălpigei","talpigeilor":"tălpigei","talpii":"talpă","talpile":"talpă","talpilor":"talpă","talpite":"tălpiță","talpitei":"tălpiță","talpitele":"tălpiță","talpitelor":"tălpiță","talpiza":["tălpiză","tălpiz","tălpiza","tălpiz"],"talpize":"tălpiz","talpizele":"tălpiz","talpizi":"tălpiz","talpizii":"tălpiz","talpizul":"tălpiz","talpoaie":"tălpoi","talpoaiele":"tălpoi","talpoaielor":"tălpoi","talpoiul":"tălpoi","talpoiule":"tălpoi","talpoiului":"tălpoi","talposi":"talpoș","talposii":"talpoș","talposilor":"talpoș","talposul":"talpoș","talposule":"talpoș","talposului":"talpoș","talpute":"tălpuță","talputei":"tălpuță","talputele":"tălpuță","talputelor":"tălpuță","talul":"tal","talule":"tal","talului":"tal","taluri":"tal","talurile":"tal","talurilor":"tal","taluzul":"taluz","taluzule":"taluz","taluzului":"taluz","taluzuri":"taluz","taluzurile":"taluz","taluzurilor":"taluz","talvegul":"talveg","talvegule":"talveg","talvegului":"talveg","talveguri":"talveg","talvegurile":"talveg","talvegurilor":"talveg","talvi":"tâlv","talvii":"tâlv","talvilor":"tâlv","talvul":"tâlv","talvule":"tâlv","talvului":"tâlv","tam-tamul":"tam-tam","tam-tamule":"tam-tam","tam-tamului":"tam-tam","tam-tamuri":"tam-tam","tam-tamurile":"tam-tam","tam-tamurilor":"tam-tam","tamachiara":["tamachiară","tamachiar","tamachiara","tamachiar"],"tamachiare":"tamachiar","tamachiarele":"tamachiar","tamachiari":"tamachiar","tamachiarii":"tamachiar","tamachiarul":"tamachiar","tamadasul":"tămădaș","tamadasule":"tămădaș","tamadasului":"tămădaș","tamadasuri":"tămădaș","tamadasurile":"tămădaș","tamadasurilor":"tămădaș","tamaduia":"tămădui","tamaduiai":"tămădui","tamaduiam":"tămădui","tamaduiati":"tămădui","tamaduiau":"tămădui","tamaduie":"tămădui","tamaduieli":"tămăduială","tamaduielii":"tămăduială","tamaduielile":"tămăduială","tamaduielilor":"tămăduială","tamaduiesc":"tămădui","tamaduieste":"tămădui","tamaduiesti":"tămădui","tamaduii":"tămădui","tamaduim":"tămădui","tamaduind":"tămădui","tamaduinte":"tămăduință","tamaduintei":"tămăduință","tamaduintele":"tămăduință","tamaduintelor":"tămăduință","tamaduira":"tămădui","tamaduiram":"tămădui","tamaduirati":"tămădui","tamaduirea":"tămăduire","tamaduiri":"tămăduire","tamaduirii":"tămăduire","tamaduirile":"tămăduire","tamaduirilor":"tămăduire","tamaduise":"tămădui","tamaduisem":"tămădui","tamaduisera":"tămădui","tamaduiseram":"tămădui","tamaduiserati":"tămădui","tamaduisesi":"tămădui","tamaduisi":"tămădui","tamaduit":"tămădui","tamaduita":["tămăduită","tămăduit","tămăduita","tămăduit"],"tamaduite":"tămăduit","tamaduitele":"tămăduit","tamaduiti":["tămăduiți","tămădui","tămăduiți","tămăduit"],"tamaduitii":"tămăduit","tamaduitoare":"tămăduitor","tamaduitoarea":"tămăduitor","tamaduitoarele":"tămăduitor","tamaduitori":"tămăduitor","tamaduitorii":"tămăduitor","tamaduitorul":"tămăduitor","tamaduitul":"tămăduit","tamai":"tămâie","tamaia":"tămâie","tamaiai":"tămâia","tamaiam":"tămâia","tamaiara":"tămâia","tamaiaram":"tămâia","tamaiarati":"tămâia","tamaiase":"tămâia","tamaiasem":"tămâia","tamaiasera":"tămâia","tamaiaseram":"tămâia","tamaiaserati":"tămâia","tamaiasesi":"tămâia","tamaiasi":"tămâia","tamaiat":"tămâia","tamaiata":["tămâiată","tămâiat","tămâiata","tămâiat"],"tamaiate":"tămâiat","tamaiatele":"tămâiat","tamaiati":["tămâiați","tămâia","tămâiați","tămâiat"],"tamaiatii":"tămâiat","tamaiatul":"tămâiat","tamaiau":"tămâia","tamaiaza":"tămâia","tamaici":"tămâică","tamaicii":"tămâică","tamaicile":"tămâică","tamaicilor":"tămâică","tamaie":"tămâia","tamaiem":"tămâia","tamaierea":"tămâiere","tamaieri":["tămâieri","tămâier","tămâieri","tămâiere"],"tamaierii":["tămâierii","tămâier","tămâierii","tămâiere"],"tamaierile":"tămâiere","tamaierilor":["tămâierilor","tămâier","tămâierilor","tămâiere"],"tamaiernite":"tămâierniță","tamaiernitei":"tămâierniță","tamaiernitele":"tămâierniță","tamaiernitelor":"tămâierniță","tamaierul":"tămâier","tamaierule":"tămâier","tamaierului":"tămâier","tamaietorese":"tămâietoreasă","tamaietoresei":"tămâietoreasă","tamaietoresele":"tămâietoreasă","tamaietoreselor":"tămâietoreasă","tamaietori":"tămâietor","tamaietorii":"tămâietor","tamaietorilor":"tămâietor","tamaietorul":"tămâietor","tamaietorule":"tămâietor","tamaietorului":"tămâietor","tamaieturi":"tămâietură","tamaieturii":"tămâietură","tamaieturile":"tămâietură","tamaieturilor":"tămâietură","tamaiez":"tămâia","tamaiezi":"tămâia","tamaii":"tămâie","tamaile":"tămâie","tamailor":"tămâie","tamaind":"tămâia","tamaioare":"tămâioară","tamaioarei":"tămâioară","tamaioarele":"tămâioară","tamaioarelor":"tămâioară","tamaioasa":["tămâioasă","tămâios","tămâioasa","tămâios"],"tamaioase":["tămâioase","tămâioasă","tămâioase","tămâios"],"tamaioasei":"tămâioasă","tamaioasele":["tămâioasele","tămâioasă","tămâioasele","tămâios"],"tamaioaselor":"tămâioasă","tamaiosi":"tămâios","tamaiosii":"tămâios","tamaiosul":"tămâios","tamaite":"tămâiță","tamaitei":"tămâiță","tamaitele":"tămâiță","tamaitelor":"tămâiță","tamandarea":"tămândare","tamandari":"tămândare","tamandarii":"tămândare","tamandarile":"tămândare","tamandarilor":"tămândare","tamane":"tămâie","tamarini":"tamarin","tamarinii":"tamarin","tamarinilor":"tamarin","tamarinul":"tamarin","tamarinule":"tamarin","tamarinului":"tamarin","tamariscaul":"tamariscă","tamariscaule":"tamariscă","tamariscaului":"tamariscă","tamarixul":"tamarix","tamarixule":"tamarix","tamarixului":"tamarix","tamarjacul":"tămârjac","tamarjacule":"tămârjac","tamarjacului":"tămârjac","tamasagul":"tămășag","tamasagule":"tămășag","tamasagului":"tămășag","tamasaguri":"tămășag","tamasagurile":"tămășag","tamasagurilor":"tămășag","tamasul":"tamâș","tamasule":"tamâș","tamasului":"tamâș","tamasuri":"tamâș","tamasurile":"tamâș","tamasurilor":"tamâș","tambalagii":"țambalagiu","tambalagiii":"țambalagiu","tambalagiilor":"țambalagiu","tambalagioaice":"țambalagioaică","tambalagioaicei":"țambalagioaică","tambalagioaicele":"țambalagioaică","tambalagioaicelor":"țambalagioaică","tambalagiuul":"țambalagiu","tambalagiuule":"țambalagiu","tambalagiuului":"țambalagiu","tambalaul":"tămbălău","tambalaule":"tămbălău","tambalaului":"tămbălău","tambale":"țambal","tambalele":"țambal","tambalelor":"țambal","tambalisti":"țambalist","tambalistii":"țambalist","tambalistilor":"țambalist","tambalistul":"țambalist","tambalistule":"țambalist","tambalistului":"țambalist","tambalul":"țambal","tambalule":"țambal","tambalului":"țambal","tambuchiul":"tambuchi","tambuchiule":"tambuchi","tambuchiului":"tambuchi","tambuchiuri":"tambuchi","tambuchiurile":"tambuchi","tambuchiurilor":"tambuchi","tamburagii":"tamburagiu","tamburagiii":"tamburagiu","tamburagiilor":"tamburagiu","tamburagiuul":"tamburagiu","tamburagiuule":"tamburagiu","tamburagiuului":"tamburagiu","tambure":["tambure","tambur","tambure","tambură"],"tamburei":"tambură","tamburele":["tamburele","tambur","tamburele","tambură"],"tamburelor":["tamburelor","tambur","tamburelor","tambură"],"tamburice":"tamburică","tamburicei":"tamburică","tamburinai":"tamburina","tamburinam":["tamburinăm","tamburina","tamburinam","tamburina"],"tamburinand":"tamburina","tamburinara":"tamburina","tamburinaram":"tamburina","tamburinarati":"tamburina","tamburinase":"tamburina","tamburinasem":"tamburina","tamburinasera":"tamburina","tamburinaseram":"tamburina","tamburinaserati":"tamburina","tamburinasesi":"tamburina","tamburinasi":"tamburina","tamburinat":"tamburina","tamburinati":"tamburina","tamburinau":"tamburina","tamburine":["tamburine","tamburin","tamburine","tamburină"],"tamburineaza":"tamburina","tamburinei":"tamburină","tamburinele":["tamburinele","tamburin","tamburinele","tamburină"],"tamburinelor":["tamburinelor","tamburin","tamburinelor","tamburină"],"tamburinez":"tamburina","tamburinezi":"tamburina","tamburinul":"tamburin","tamburinule":"tamburin","tamburinului":"tamburin","tamburite":"tamburiță","tamburitei":"tamburiță","tamburitele":"tamburiță","tamburitelor":"tamburiță","tamburul":"tambur","tamburule":"tambur","tamburului":"tambur","tamburusul":"țâmburuș","tamburusule":"țâmburuș","tamburusului":"țâmburuș","tamburusuri":"țâmburuș","tamburusurile":"țâmburuș","tamburusurilor":"țâmburuș","tamje":"tamjă","tamjei":"tamjă","tamjele":"tamjă","tamjelor":"tamjă","tamojne":"tamojnă","tamojnei":"tamojnă","tamojnele":"tamojnă","tamojnelor":"tamojnă","tampa":["tâmpă","tâmp","tâmpa","tâmp"],"tampane":"tâmpănă","tampanei":"tâmpănă","tampanele":"tâmpănă","tampanelor":"tâmpănă","tampe":"tâmp","tampea":"tâmpi","tampeai":"tâmpi","tampeam":"tâmpi","tampeati":"tâmpi","tampeau":"tâmpi","tampele":"tâmp","tampeli":"tâmpeală","tampelii":"tâmpeală","tampelile":"tâmpeală","tampelilor":"tâmpeală","tampenia":"tâmpenie","tampeniei":"tâmpenie","tampenii":"tâmpenie","tampeniile":"tâmpenie","tampeniilor":"tâmpenie","tampesc":"tâmpi","tampeste":"tâmpi","tampesti":"tâmpi","tampi":"tâmp","tampia":"tâmpie","tampiei":"tâmpie","tampii":["tâmpii","tâmp","tâmpii","tâmpi","tâmpii","tâmpie"],"tampiile":"tâmpie","tampiilor":"tâmpie","tampim":"tâmpi","tampimea":"tâmpime","tampimi":"tâmpime","tampimii":"tâmpime","tampimile":"tâmpime","tampimilor":"tâmpime","tampin":"tâmpina","tampina":"tâmpănă","tampinaciunea":"tâmpinăciune","tampinaciuni":"tâmpinăciune","tampinaciunii":"tâmpinăciune","tampinaciunile":"tâmpinăciune","tampinaciunilor":"tâmpinăciune","tampinai":"tâmpina","tampinam":["tâmpinăm","tâmpina","tâmpinam","tâmpina"],"tampinand":"tâmpina","tampinara":"tâmpina","tampinaram":"tâmpina","tampinarati":"tâmpina","tampinarea":"tâmpinare","tampinari":"tâmpinare","tampinarii":"tâmpinare","tampinarile":"tâmpinare","tampinarilor":"tâmpinare","tampinase":"tâmpina","tampinasem":"tâmpina","tampinasera":"tâmpina","tampinaseram":"tâmpina","tampinaserati":"tâmpina","tampinasesi":"tâmpina","tampinasi":"tâmpina","tampinat":"tâmpina","tampinati":"tâmpina","tampinau":"tâmpina","tampind":"tâmpi","tampine":"tâmpină","tampini":"tâmpina","tampira":"tâmpi","tampiram":"tâmpi","tampirati":"tâmpi","tampirea":"tâmpire","tampiri":"tâmpire","tampirii":"tâmpire","tampirile":"tâmpire","tampirilor":"tâmpire","tampise":"tâmpi","tampisem":"tâmpi","tampisera":"tâmpi","tampiseram":"tâmpi","tampiserati":"tâmpi","tampisesi":"tâmpi","tampisi":"tâmpi","tampit":"tâmpi","tampita":["tâmpită","tâmpit","tâmpita","tâmpit"],"tampite":["tâmpite","tâmpit","tâmpite","tâmpită"],"tampitei":"tâmpită","tampitele":["tâmpitele","tâmpit","tâmpitele","tâmpită"],"tampitelor":"tâmpită","tampiti":["tâmpiți","tâmpi","tâmpiți","tâmpit"],"tampitii":"tâmpit"};
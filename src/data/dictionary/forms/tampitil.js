@@ -0,0 +1 @@
+export default {"tampitilor":"tâmpit","tampitul":"tâmpit","tampitule":"tâmpit","tampitului":"tâmpit","tampland":"tâmpla","tamplara":"tâmpla","tamplarea":"tâmplare","tamplareasca":["tâmplărească","tâmplăresc","tâmplăreasca","tâmplăresc"],"tamplarescul":"tâmplăresc","tamplarese":"tâmplăreasă","tamplaresei":"tâmplăreasă","tamplaresele":"tâmplăreasă","tamplareselor":"tâmplăreasă","tamplaresti":"tâmplăresc","tamplarestii":"tâmplăresc","tamplarestile":"tâmplăresc","tamplari":["tâmplari","tâmplar","tâmplări","tâmplare"],"tamplaria":"tâmplărie","tamplariei":"tâmplărie","tamplarii":["tâmplarii","tâmplar","tâmplării","tâmplare","tâmplării","tâmplărie"],"tamplariile":"tâmplărie","tamplariilor":"tâmplărie","tamplarile":"tâmplare","tamplarilor":["tâmplarilor","tâmplar","tâmplărilor","tâmplare"],"tamplarite":"tâmplăriță","tamplaritei":"tâmplăriță","tamplaritele":"tâmplăriță","tamplaritelor":"tâmplăriță","tamplarul":"tâmplar","tamplarule":"tâmplar","tamplarului":"tâmplar","tamplarusi":"tâmplăruș","tamplarusii":"tâmplăruș","tamplarusilor":"tâmplăruș","tamplarusul":"tâmplăruș","tamplarusule":"tâmplăruș","tamplarusului":"tâmplăruș","tamplase":"tâmpla","tamplasera":"tâmpla","tamplat":"tâmpla","tamplau":"tâmpla","tample":"tâmplă","tamplei":"tâmplă","tamplele":"tâmplă","tamplelor":"tâmplă","tampoane":"tampon","tampoanele":"tampon","tampoanelor":"tampon","tamponade":"tamponadă","tamponadei":"tamponadă","tamponadele":"tamponadă","tamponadelor":"tamponadă","tamponai":"tampona","tamponam":["tamponăm","tampona","tamponam","tampona"],"tamponamente":"tamponament","tamponamentele":"tamponament","tamponamentelor":"tamponament","tamponamentul":"tamponament","tamponamentule":"tamponament","tamponamentului":"tamponament","tamponand":"tampona","tamponara":"tampona","tamponaram":"tampona","tamponarati":"tampona","tamponarea":"tamponare","tamponari":"tamponare","tamponarii":"tamponare","tamponarile":"tamponare","tamponarilor":"tamponare","tamponase":"tampona","tamponasem":"tampona","tamponasera":"tampona","tamponaseram":"tampona","tamponaserati":"tampona","tamponasesi":"tampona","tamponasi":"tampona","tamponat":"tampona","tamponata":["tamponată","tamponat","tamponata","tamponat"],"tamponate":"tamponat","tamponatele":"tamponat","tamponati":["tamponați","tampona","tamponați","tamponat"],"tamponatii":"tamponat","tamponatul":"tamponat","tamponau":"tampona","tamponeaza":"tampona","tamponez":"tampona","tamponezi":"tampona","tamponul":"tampon","tamponule":"tampon","tamponului":"tampon","tampul":"tâmp","tanace":"tănaci","tanacele":"tănaci","tanacelor":"tănaci","tanaciul":"tănaci","tanaciule":"tănaci","tanaciului":"tănaci","tanagraua":"tanagra","tanai":"tanău","tanaii":"tanău","tanailor":"tanău","tanaje":"tanaj","tanajele":"tanaj","tanajelor":"tanaj","tanajul":"tanaj","tanajule":"tanaj","tanajului":"tanaj","tananale":"tanana","tananalei":"tanana","tananaua":"tanana","tananici":"tananică","tananicii":"tananică","tanara":["tânără","tânăr","tânăra","tânăr"],"tanaruca":["tânărucă","tânăruc","tânăruca","tânăruc"],"tanaruce":"tânăruc","tanarucele":"tânăruc","tanaruci":"tânăruc","tanarucii":"tânăruc","tanarucul":"tânăruc","tanarul":"tânăr","tanarule":"tânăr","tanarului":"tânăr","tanaruta":["tânăruță","tânăruț","tânăruța","tânăruț"],"tanarute":"tânăruț","tanarutele":"tânăruț","tanaruti":"tânăruț","tanarutii":"tânăruț","tanarutul":"tânăruț","tanati":"tanat","tanatica":["tanatică","tanatic","tanatica","tanatic"],"tanatice":"tanatic","tanaticele":"tanatic","tanatici":"tanatic","tanaticii":"tanatic","tanaticul":"tanatic","tanatii":"tanat","tanatilor":"tanat","tanatofobia":"tanatofobie","tanatofobiei":"tanatofobie","tanatofobii":"tanatofobie","tanatofobiile":"tanatofobie","tanatofobiilor":"tanatofobie","tanatogeneze":"tanatogeneză","tanatogenezei":"tanatogeneză","tanatogenezele":"tanatogeneză","tanatogenezelor":"tanatogeneză","tanatologia":"tanatologie","tanatologica":["tanatologică","tanatologic","tanatologica","tanatologic"],"tanatologice":"tanatologic","tanatologicele":"tanatologic","tanatologici":"tanatologic","tanatologicii":"tanatologic","tanatologicul":"tanatologic","tanatologiei":"tanatologie","tanatologii":"tanatologie","tanatologiile":"tanatologie","tanatologiilor":"tanatologie","tanatul":"tanat","tanatule":"tanat","tanatului":"tanat","tanauul":"tanău","tanauule":"tanău","tanauului":"tanău","tance":"țâncă","tancei":"țâncă","tancele":"țâncă","tancelor":"țâncă","tanchete":"tanchetă","tanchetei":"tanchetă","tanchetele":"tanchetă","tanchetelor":"tanchetă","tanchiste":"tanchistă","tanchistei":"tanchistă","tanchistele":"tanchistă","tanchistelor":"tanchistă","tanchisti":"tanchist","tanchistii":"tanchist","tanchistilor":"tanchist","tanchistul":"tanchist","tanchistule":"tanchist","tanchistului":"tanchist","tanci":"țânc","tancii":"țânc","tancilor":"țânc","tancodromul":"tancodrom","tancodromule":"tancodrom","tancodromului":"tancodrom","tancodromuri":"tancodrom","tancodromurile":"tancodrom","tancodromurilor":"tancodrom","tancul":["tancul","tanc","țâncul","țânc"],"tancule":["tancule","tanc","țâncule","țânc"],"tancului":["tancului","tanc","țâncului","țânc"],"tancuri":"tanc","tancuri petroliere":"tanc petrolier","tancurile":"tanc","tancurilor":"tanc","tancusori":"țâncușor","tancusorii":"țâncușor","tancusorilor":"țâncușor","tancusorul":"țâncușor","tancusorule":"țâncușor","tancusorului":"țâncușor","tandalaul":"tândală","tandalaule":"tândală","tandalaului":"tândală","tandalea":"tândăli","tandaleai":"tândăli","tandaleam":"tândăli","tandaleati":"tândăli","tandaleau":"tândăli","tandalele":"tândăleală","tandalelei":"tândăleală","tandalelele":"tândăleală","tandalelelor":"tândăleală","tandaleli":"tândăleală","tandalesc":"tândăli","tandaleste":"tândăli","tandalesti":"tândăli","tandalii":"tândăli","tandalim":"tândăli","tandalind":"tândăli","tandalira":"tândăli","tandaliram":"tândăli","tandalirati":"tândăli","tandalise":"tândăli","tandalisem":"tândăli","tandalisera":"tândăli","tandaliseram":"tândăli","tandaliserati":"tândăli","tandalisesi":"tândăli","tandalisi":"tândăli","tandalit":"tândăli","tandalite":"tândălit","tandalitele":"tândălit","tandalitelor":"tândălit","tandaliti":"tândăli","tandalitul":"tândălit","tandalitule":"tândălit","tandalitului":"tândălit","tandalituri":"tândălitură","tandaliturii":"tândălitură","tandaliturile":"tândălitură","tandaliturilor":"tândălitură","tandarea":"țăndări","tandareai":"țăndări","tandaream":"țăndări","tandareati":"țăndări","tandareau":"țăndări","tandarele":"țăndărică","tandaresc":"țăndări","tandareste":"țăndări","tandaresti":"țăndări","tandari":["țăndări","țandără","țândări","țândără"],"tandarice":"țăndărică","tandaricea":"țăndărice","tandaricei":"țăndărică","tandaricele":"țăndărică","tandaricelor":"țăndărică","tandarici":"țăndărice","tandaricii":"țăndărice","tandaricile":"țăndărice","tandaricilor":"țăndărice","tandarii":["țăndării","țandără","țândării","țândără","țăndării","țăndări"],"tandarile":["țăndările","țandără","țândările","țândără"],"tandarilor":["țăndărilor","țandără","țândărilor","țândără"],"tandarim":"țăndări","tandarind":"țăndări","tandarira":"țăndări","tandariram":"țăndări","tandarirati":"țăndări","tandarise":"țăndări","tandarisem":"țăndări","tandarisera":"țăndări","tandariseram":"țăndări","tandariserati":"țăndări","tandarisesi":"țăndări","tandarisi":"țăndări","tandarit":"țăndări","tandariti":"țăndări","tandaroasa":["țăndăroasă","țăndăros","țăndăroasa","țăndăros"],"tandaroase":"țăndăros","tandaroasele":"țăndăros","tandarosi":"țăndăros","tandarosii":"țăndăros","tandarosul":"țăndăros","tandarute":"țăndăruță","tandarutei":"țăndăruță","tandarutele":"țăndăruță","tandarutelor":"țăndăruță","tandemul":"tandem","tandemule":"tandem","tandemului":"tandem","tandemuri":"tandem","tandemurile":"tandem","tandemurilor":"tandem","tandra":["tandră","tandru","tandra","tandru"],"tandre":"tandru","tandrele":"tandru","tandrete":"tandreță","tandretea":"tandrețe","tandretei":["tandreței","tandreță","tandreței","tandrețe"],"tandretele":"tandreță","tandretelor":"tandreță","tandri":"tandru","tandrii":"tandru","tandrul":"tandru","tandurele":"țăndurică","tandurelei":"țăndurică","tandurelele":"țăndurică","tandurelelor":"țăndurică","tanduri":"țandură","tandurii":"țandură","tandurile":"țandură","tandurilor":"țandură","tanga":["tângă","tâng","tânga","tâng"],"tangai":["tangai","tanga","țângăi","țângău"],"tangaii":"țângău","tangailor":"țângău","tangajul":"tangaj","tangajule":"tangaj","tangajului":"tangaj","tangajuri":"tangaj","tangajurile":"tangaj","tangajurilor":"tangaj","tangam":["tangăm","tanga","tangam","tanga"],"tangand":"tanga","tangara":"tanga","tangaram":"tanga","tangarati":"tanga","tangase":"tanga","tangasem":"tanga","tangasera":"tanga","tangaseram":"tanga","tangaserati":"tanga","tangasesi":"tanga","tangasi":"tanga","tangat":"tanga","tangati":"tanga","tangau":"tanga","tangaul":"tângă","tangaule":"tângă","tangaului":"tângă","tangauul":"țângău","tangauule":"țângău","tangauului":"țângău","tange":"tâng","tangele":"tâng","tangenta":["tangentă","tangent","tangenta","tangent"],"tangente":["tangente","tangent","tangente","tangentă","tangențe","tangență"],"tangentei":["tangentei","tangentă","tangenței","tangență"],"tangentele":["tangentele","tangent","tangentele","tangentă","tangențele","tangență"],"tangentelor":["tangentelor","tangentă","tangențelor","tangență"],"tangenti":"tangent","tangentiala":["tangențială","tangențial","tangențiala","tangențial"],"tangentiale":"tangențial","tangentialele":"tangențial","tangentiali":"tangențial","tangentialii":"tangențial","tangentialul":"tangențial","tangentii":"tangent","tangentul":"tangent","tangheaza":"tanga","tanghez":"tanga","tanghezi":"tanga","tangi":["tângi","tâng","tângi","tângă"],"tangibila":["tangibilă","tangibil","tangibila","tangibil"],"tangibile":"tangibil","tangibilele":"tangibil","tangibili":"tangibil","tangibilii":"tangibil","tangibilitatea":"tangibilitate","tangibilitati":"tangibilitate","tangibilitatii":"tangibilitate","tangibilul":"tangibil","tangii":"tâng","tangile":"tângă","tangilor":"tângă","tangoane":"tangon","tangoanele":"tangon","tangoanelor":"tangon","tangonul":"tangon","tangonule":"tangon","tangonului":"tangon","tangoul":["tangoul","tango","tangoul","tangou"],"tangoule":["tangoule","tango","tangoule","tangou"],"tangoului":["tangoului","tango","tangoului","tangou"],"tangouri":["tangouri","tango","tangouri","tangou"],"tangourile":["tangourile","tango","tangourile","tangou"],"tangourilor":["tangourilor","tango","tangourilor","tangou"],"tanguia":"tângui","tanguiai":"tângui","tanguiam":"tângui","tanguiati":"tângui","tanguiau":"tângui","tanguibila":["tânguibilă","tânguibil","tânguibila","tânguibil"],"tanguibile":"tânguibil","tanguibilele":"tânguibil","tanguibili":"tânguibil","tanguibilii":"tânguibil","tanguibilul":"tânguibil","tanguiele":"tânguială","tanguielei":"tânguială","tanguielele":"tânguială","tanguielelor":"tânguială","tanguieli":"tânguială","tanguiesc":"tângui","tanguieste":"tângui","tanguiesti":"tângui","tanguii":"tângui","tanguim":"tângui","tanguind":"tângui","tanguioasa":["tânguioasă","tânguios","tânguioasa","tânguios"],"tanguioase":"tânguios","tanguioasele":"tânguios","tanguiosi":"tânguios","tanguiosii":"tânguios","tanguiosul":"tânguios","tanguira":"tângui","tanguiram":"tângui","tanguirati":"tângui","tanguirea":"tânguire","tanguiri":"tânguire","tanguirii":"tânguire","tanguirile":"tânguire","tanguirilor":"tânguire","tanguise":"tângui","tanguisem":"tângui","tanguisera":"tângui","tanguiseram":"tângui","tanguiserati":"tângui","tanguisesi":"tângui","tanguisi":"tângui","tanguit":"tângui","tanguiti":"tângui","tanguitoare":"tânguitor","tanguitoarea":"tânguitor","tanguitoarele":"tânguitor","tanguitori":"tânguitor","tanguitorii":"tânguitor","tanguitorul":"tânguitor","tanguitul":"tânguit","tanguitule":"tânguit","tanguitului":"tânguit","tangul":"tâng","tanica":["tanică","tanic","tanica","tanic"],"tanice":"tanic","tanicele":"tanic","tanici":"tanic","tanicii":"tanic","tanicul":"tanic","taninoasa":["taninoasă","taninos","taninoasa","taninos"],"taninoase":"taninos","taninoasele":"taninos","taninosi":"taninos","taninosii":"taninos","taninosul":"taninos","taninul":"tanin","taninule":"tanin","taninului":"tanin","taninuri":"tanin","taninurile":"tanin","taninurilor":"tanin","tanizai":"taniza","tanizam":["tanizăm","taniza","tanizam","taniza"],"tanizand":"taniza","tanizara":"taniza","tanizaram":"taniza","tanizarati":"taniza","tanizarea":"tanizare","tanizari":"tanizare","tanizarii":"tanizare","tanizarile":"tanizare","tanizarilor":"tanizare","tanizase":"taniza","tanizasem":"taniza","tanizasera":"taniza","tanizaseram":"taniza","tanizaserati":"taniza","tanizasesi":"taniza","tanizasi":"taniza","tanizat":"taniza","tanizati":"taniza","tanizau":"taniza","tanizeaza":"taniza","tanizez":"taniza","tanizezi":"taniza","tanjea":"tânji","tanjeai":"tânji","tanjeam":"tânji","tanjeati":"tânji","tanjeau":"tânji","tanjele":"tânjeală","tanjelei":"tânjeală","tanjelele":"tânjeală","tanjelelor":"tânjeală","tanjeli":"tânjeală","tanjesc":"tânji","tanjeste":"tânji","tanjesti":"tânji","tanjii":"tânji","tanjim":"tânji","tanjind":"tânji","tanjira":"tânji","tanjiram":"tânji","tanjirati":"tânji","tanjirea":"tânjire","tanjiri":"tânjire","tanjirii":"tânjire","tanjirile":"tânjire","tanjirilor":"tânjire","tanjise":"tânji","tanjisem":"tânji","tanjisera":"tânji","tanjiseram":"tânji","tanjiserati":"tânji","tanjisesi":"tânji","tanjisi":"tânji","tanjit":"tânji","tanjiti":"tânji","tanjitoare":"tânjitor","tanjitoarea":"tânjitor","tanjitoarele":"tânjitor","tanjitori":"tânjitor","tanjitorii":"tânjitor","tanjitorul":"tânjitor","tanreci":"tanrec","tanrecii":"tanrec","tanrecilor":"tanrec","tanrecul":"tanrec","tanrecule":"tanrec","tanrecului":"tanrec","tant":"tont","tanta":["tântă","tânt","tânta","tânt"],"tantalai":"tăntălău","tantalaii":"tăntălău","tantalaul":"tăntălău","tantalitul":"tantalit","tantalitule":"tantalit","tantalitului":"tantalit","tantalituri":"tantalit","tantaliturile":"tantalit","tantaliturilor":"tantalit","tantaloaica":["tăntăloaică","tăntălău","tăntăloaica","tăntălău"],"tantaloaice":"tăntălău","tantaloaicele":"tăntălău","tantalul":"tantal","tantalule":"tantal","tantalului":"tantal","tantarasi":"țânțăraș","tantarasii":"țânțăraș","tantarasilor":"țânțăraș","tantarasul":"țânțăraș","tantarasule":"țânțăraș","tantarasului":"țânțăraș","tantarei":"țânțărel","tantareii":"țânțărel","tantareilor":"țânțărel","tantarelul":"țânțărel","tantarelule":"țânțărel","tantarelului":"țânțărel","tantari":"țânțar","tantarii":"țânțar","tantarilor":"țânțar","tantarimea":"țânțărime","tantarimei":"țânțărime","tantarul":"țânțar","tantarule":"țânțar","tantarului":"țânțar","tante":"tânt","tantele":"tânt","tanti":"tânt","tantieme":"tantiemă","tantiemei":"tantiemă","tantiemele":"tantiemă","tantiemelor":"tantiemă","tantii":"tânt","tantite":"tăntiță","tantitei":"tăntiță","tantitele":"tăntiță","tantitelor":"tăntiță","tantosa":["țanțoșă","țanțoș","țanțoșa","țanțoș"],"tantose":"țanțoș","tantosele":"țanțoș","tantosenia":"țânțoșenie","tantoseniei":"țânțoșenie","tantosenii":"țânțoșenie","tantosi":"țanțoș","tantosia":"țanțoșie","tantosiei":"țanțoșie","tantosii":["țanțoșii","țanțoș","țanțoșii","țanțoșie"],"tantosul":"țanțoș","tantrismul":"tantrism","tantrismule":"tantrism","tantrismului":"tantrism","tantul":"tânt","tantusa":["țanțușă","țanțuș","țanțușa","țanțuș"],"tantuse":"țanțuș","tantusele":"țanțuș","tantusi":"țanțuș","tantusii":"țanțuș","tantusul":"țanțuș","tanzaniana":["tanzaniană","tanzanian","tanzaniana","tanzanian"],"tanzanianul":"tanzanian","tanzanianule":"tanzanian","tanzanianului":"tanzanian","tanzaniene":["tanzaniene","tanzanian","tanzaniene","tanzaniană"],"tanzanienei":"tanzaniană","tanzanienele":["tanzanienele","tanzanian","tanzanienele","tanzaniană"],"tanzanienelor":"tanzaniană","tanzanieni":"tanzanian","tanzanienii":"tanzanian","tanzanienilor":"tanzanian","tanzimatul":"tanzimat","tanzimatule":"tanzimat","tanzimatului":"tanzimat","taoisme":"taoism","taoismele":"taoism","taoismelor":"taoism","taoismul":"taoism","taoismule":"taoism","taoismului":"taoism","taoista":["taoistă","taoist","taoista","taoist"],"taoiste":"taoist","taoistele":"taoist","taoisti":"taoist","taoistii":"taoist","taoistul":"taoist","taoul":"tao","taoule":"tao","taoului":"tao","tap":"țâpa","tapa":"țipa","tapai":["tapai","tapa","țâpai","țâpa"],"tapajul":"tapaj","tapajule":"tapaj","tapajului":"tapaj","tapam":["tapăm","tapa","tapam","tapa","țâpăm","țâpa","țâpam","țâpa"],"tapand":["tapând","tapa","țâpând","țâpa"],"tapangeaua":"tapangea","tapangele":"tapangea","tapangelei":"tapangea","tapangelele":"tapangea","tapangelelor":"tapangea","tapara":["tapară","tapa","țâpară","țâpa"],"taparam":["taparăm","tapa","țâparăm","țâpa"],"taparati":["taparăți","tapa","țâparăți","țâpa"],"tapase":["tapase","tapa","țâpase","țâpa"],"tapasem":["tapasem","tapa","țâpasem","țâpa"],"tapasera":["tapaseră","tapa","țâpaseră","țâpa"],"tapaseram":["tapaserăm","tapa","țâpaserăm","țâpa"],"tapaserati":["tapaserăți","tapa","țâpaserăți","țâpa"],"tapasesi":["tapaseși","tapa","țâpaseși","țâpa"],"tapasi":["tapași","tapa","țâpași","țâpa"],"tapat":["tapat","tapa","țâpat","țâpa"],"tapati":["tapați","tapa","țâpați","țâpa"],"tapau":["tapau","tapa","țâpau","țâpa"],"tapaurile":"tapâuri","tapaurilor":"tapâuri","tape":"țâpa","tapeaza":"tapa","tapetai":"tapeta","tapetam":["tapetăm","tapeta","tapetam","tapeta"],"tapetand":"tapeta","tapetara":"tapeta","tapetaram":"tapeta","tapetarati":"tapeta","tapetarea":"tapetare","tapetari":["tapetari","tapetar","tapetări","tapetare"],"tapetarii":["tapetarii","tapetar","tapetării","tapetare"],"tapetarile":"tapetare","tapetarilor":["tapetarilor","tapetar","tapetărilor","tapetare"],"tapetarul":"tapetar","tapetarule":"tapetar","tapetarului":"tapetar","tapetase":"tapeta","tapetasem":"tapeta","tapetasera":"tapeta","tapetaseram":"tapeta","tapetaserati":"tapeta","tapetasesi":"tapeta","tapetasi":"tapeta","tapetat":"tapeta","tapetati":"tapeta","tapetau":"tapeta","tapete":"tapet","tapeteaza":"tapeta","tapetele":"tapet","tapetelor":"tapet","tapetez":"tapeta","tapetezi":"tapeta","tapetul":"tapet","tapetule":"tapet","tapetului":"tapet","tapeuri":"tapeur","tapeurii":"tapeur","tapeurilor":"tapeur","tapeurul":"tapeur","tapeurule":"tapeur","tapeurului":"tapeur","tapez":"tapa","tapezi":"tapa","tapi":["țapi","țap","țâpi","țâpa"],"tapi ispasitori":"țap ispășitor","tapii":"țap","tapilor":"țap","tapinari":"țapinar","tapinarii":"țapinar","tapinarilor":"țapinar","tapinarul":"țapinar","tapinarule":"țapinar","tapinarului":"țapinar","tapine":["țapine","țapin","țapine","țapină"],"tapinei":"țapină","tapinele":["țapinele","țapin","țapinele","țapină"],"tapinelor":["țapinelor","țapin","țapinelor","țapină"],"tapinul":"țapin","tapinule":"țapin","tapinului":"țapin","tapioce":"tapiocă","tapiocei":"tapiocă","tapiri":"tapir","tapirii":"tapir","tapirilor":"tapir","tapirul":"tapir","tapirule":"tapir","tapirului":"tapir","tapisai":"tapisa","tapisam":["tapisăm","tapisa","tapisam","tapisa"],"tapisand":"tapisa","tapisara":"tapisa","tapisaram":"tapisa","tapisarati":"tapisa","tapisarea":"tapisare","tapisari":"tapisare","tapisarii":"tapisare","tapisarile":"tapisare","tapisarilor":"tapisare","tapisase":"tapisa","tapisasem":"tapisa","tapisasera":"tapisa","tapisaseram":"tapisa","tapisaserati":"tapisa","tapisasesi":"tapisa","tapisasi":"tapisa","tapisat":"tapisa","tapisata":["tapisată","tapisat","tapisata","tapisat"],"tapisate":"tapisat","tapisatele":"tapisat","tapisati":["tapisați","tapisa","tapisați","tapisat"],"tapisatii":"tapisat","tapisatul":"tapisat","tapisau":"tapisa","tapiseaza":"tapisa","tapiseri":"tapiser","tapiserii":["tapiserii","tapiser","tapiserii","tapiserie"],"tapiserilor":"tapiser","tapiserul":"tapiser","tapiserule":"tapiser","tapiserului":"tapiser","tapisez":"tapisa","tapisezi":"tapisa","tapisieri":"tapisier","tapisierii":"tapisier","tapisierilor":"tapisier","tapisierul":"tapisier","tapisierule":"tapisier","tapisierului":"tapisier","tapitai":"tapița","tapitam":["tapițăm","tapița","tapițam","tapița"],"tapitand":"tapița","tapitara":"tapița","tapitaram":"tapița","tapitarati":"tapița","tapitarea":"tapițare","tapitari":"tapițare","tapitarii":"tapițare","tapitase":"tapița","tapitasem":"tapița","tapitasera":"tapița","tapitaseram":"tapița","tapitaserati":"tapița","tapitasesi":"tapița","tapitasi":"tapița","tapitat":"tapița","tapitata":["tapițată","tapițat","tapițata","tapițat"],"tapitate":"tapițat","tapitatele":"tapițat","tapitati":["tapițați","tapița","tapițați","tapițat"],"tapitatii":"tapițat","tapitatul":"tapițat","tapitau":"tapița","tapiteaza":"tapița","tapiteri":"tapițer","tapiterii":["tapițerii","tapițer","tapițerii","tapițerie"],"tapiterilor":"tapițer","tapiterul":"tapițer","tapiterule":"tapițer","tapiterului":"tapițer","tapitez":"tapița","tapitezi":"tapița","tapotai":"tapota","tapotam":["tapotăm","tapota","tapotam","tapota"],"tapotand":"tapota","tapotara":"tapota","tapotaram":"tapota","tapotarati":"tapota","tapotase":"tapota","tapotasem":"tapota","tapotasera":"tapota","tapotaseram":"tapota","tapotaserati":"tapota","tapotasesi":"tapota","tapotasi":"tapota","tapotat":"tapota","tapotati":"tapota","tapotau":"tapota","tapoteaza":"tapota","tapoteiul":"țăpotei","tapoteiule":"țăpotei","tapoteiului":"țăpotei","tapotez":"tapota","tapotezi":"tapota","tapsanase":"tăpșănaș","tapsanasele":"tăpșănaș","tapsanaselor":"tăpșănaș","tapsanasul":"tăpșănaș","tapsanasule":"tăpșănaș","tapsanasului":"tăpșănaș","tapsane":"tăpșan","tapsanele":"tăpșan","tapsanelor":"tăpșan","tapsani":"țăpșan","tapsanii":"țăpșan","tapsanilor":"țăpșan","tapsanul":["tăpșanul","tăpșan","țăpșanul","țăpșan"],"tapsanule":["tăpșanule","tăpșan","țăpșanule","țăpșan"],"tapsanului":["tăpșanului","tăpșan","țăpșanului","țăpșan"],"tapuci":"țăpuc","tapucii":"țăpuc","tapucilor":"țăpuc","tapucul":"țăpuc","tapucule":"țăpuc","tapucului":"țăpuc","tapul":"țap","tapule":"țap","tapuleanul":"țăpulean","tapuleanule":"țăpulean","tapuleanului":"țăpulean","tapuleni":"țăpulean","tapulenii":"țăpulean","tapulenilor":"țăpulean","tapuleti":"țăpuleț","tapuletii":"țăpuleț","tapuletilor":"țăpuleț","tapuletul":"țăpuleț","tapuletule":"țăpuleț","tapuletului":"țăpuleț","tapului":"țap","tapurea":"țâpuri","tapureai":"țâpuri","tapuream":"țâpuri","tapureati":"țâpuri","tapureau":"țâpuri","tapuresc":"țâpuri","tapureste":"țâpuri","tapuresti":"țâpuri","tapuri":"tapură","tapurii":["tapurii","tapură","țâpurii","țâpuri"],"tapurile":"tapură","tapurilor":"tapură","tapurim":"țâpuri","tapurind":"țâpuri","tapurira":"țâpuri","tapuriram":"țâpuri","tapurirati":"țâpuri","tapurise":"țâpuri","tapurisem":"țâpuri","tapurisera":"țâpuri","tapuriseram":"țâpuri","tapuriserati":"țâpuri","tapurisesi":"țâpuri","tapurisi":"țâpuri","tapurit":"țâpuri","tapuriti":"țâpuri","tapusori":"țăpușor","tapusorii":"țăpușor","tapusorilor":"țăpușor","tapusorul":"țăpușor","tapusorule":"țăpușor","tapusorului":"țăpușor","tara":"târî","tarabagii":"tarabagiu","tarabagiii":"tarabagiu","tarabagiilor":"tarabagiu","tarabagiuul":"tarabagiu","tarabagiuule":"tarabagiu","tarabagiuului":"tarabagiu","tarabani":"taraban","tarabanii":"taraban","tarabanilor":"taraban","tarabanul":"taraban","tarabanule":"taraban","tarabanului":"taraban","tarabe":"tarabă","tarabei":"tarabă","tarabele":"tarabă","tarabelor":"tarabă","tarabioare":"tărăbioară","tarabioarei":"tărăbioară","tarabioarele":"tărăbioară","tarabioarelor":"tărăbioară","taraboaie":"tărăboi","taraboaiele":"tărăboi","taraboaielor":"tărăboi","taraboante":"tărăboanță","taraboantei":"tărăboanță","taraboantele":"tărăboanță","taraboantelor":"tărăboanță","taraboiul":"tărăboi","taraboiule":"tărăboi","taraboiului":"tărăboi","taracani":"taracan","taracanii":"taracan","taracanilor":"taracan","taracanul":"taracan","taracanule":"taracan","taracanului":"taracan","taraci":"tarac","taracii":"tarac","taracilor":"tarac","taracioare":"tărâcioară","taracioarea":"tărâcioare","taracioarei":["tărâcioarei","tărâcioară","tărâcioarei","tărâcioare"],"taracioarele":["tărâcioarele","tărâcioară","tărâcioarele","tărâcioare"],"taracioarelor":["tărâcioarelor","tărâcioară","tărâcioarelor","tărâcioare"],"taracul":"tarac","taracule":"tarac","taracului":"tarac","taraful":"taraf","tarafule":"taraf","tarafului":"taraf","tarafuri":"taraf","tarafurile":"taraf","tarafurilor":"taraf","taragaia":"tărăgăi","taragaiai":["tărăgăiai","tărăgăi","tărăgăiai","tărăgăia"],"taragaiam":["tărăgăiam","tărăgăi","tărăgăiam","tărăgăia"],"taragaiara":"tărăgăia","taragaiaram":"tărăgăia","taragaiarati":"tărăgăia","taragaiase":"tărăgăia","taragaiasem":"tărăgăia","taragaiasera":"tărăgăia","taragaiaseram":"tărăgăia","taragaiaserati":"tărăgăia","taragaiasesi":"tărăgăia","taragaiasi":"tărăgăia","taragaiat":"tărăgăia","taragaiati":["tărăgăiați","tărăgăi","tărăgăiați","tărăgăia"],"taragaiau":["tărăgăiau","tărăgăi","tărăgăiau","tărăgăia"],"taragaiaza":"tărăgăia","taragaie":"tărăgăia","taragaiele":"tărăgăială","taragaielei":"tărăgăială","taragaielele":"tărăgăială","taragaielelor":"tărăgăială","taragaieli":"tărăgăială","taragaiem":"tărăgăia","taragaiesc":"tărăgăi","taragaieste":"tărăgăi","taragaiesti":"tărăgăi","taragaiez":"tărăgăia","taragaiezi":"tărăgăia","taragaii":"tărăgăi","taragaim":"tărăgăi","taragaind":["tărăgăind","tărăgăi","tărăgăind","tărăgăia"],"taragaira":"tărăgăi","taragairam":"tărăgăi","taragairati":"tărăgăi","taragaise":"tărăgăi","taragaisem":"tărăgăi","taragaisera":"tărăgăi","taragaiseram":"tărăgăi","taragaiserati":"tărăgăi","taragaisesi":"tărăgăi","taragaisi":"tărăgăi","taragait":"tărăgăi","taragaiti":"tărăgăi","taraganai":"tărăgăna","taraganam":["tărăgănăm","tărăgăna","tărăgănam","tărăgăna"],"taraganand":"tărăgăna","taraganara":"tărăgăna","taraganaram":"tărăgăna","taraganarati":"tărăgăna","taraganarea":"tărăgănare","taraganari":"tărăgănare","taraganarii":"tărăgănare","taraganarile":"tărăgănare","taraganarilor":"tărăgănare","taraganase":"tărăgăna","taraganasem":"tărăgăna","taraganasera":"tărăgăna","taraganaseram":"tărăgăna","taraganaserati":"tărăgăna","taraganasesi":"tărăgăna","taraganasi":"tărăgăna","taraganat":"tărăgăna","taraganata":["tărăgănată","tărăgănat","tărăgănata","tărăgănat"],"taraganate":"tărăgănat","taraganatele":"tărăgănat","taraganati":["tărăgănați","tărăgăna","tărăgănați","tărăgănat"],"taraganatii":"tărăgănat","taraganatul":"tărăgănat","taraganau":"tărăgăna","taraganea":"tărăgăni","taraganeai":"tărăgăni","taraganeam":"tărăgăni","taraganeati":"tărăgăni","taraganeau":"tărăgăni","taraganeaza":"tărăgăna","taraganele":"tărăgăneală","taraganelei":"tărăgăneală","taraganelele":"tărăgăneală","taraganelelor":"tărăgăneală","taraganeli":"tărăgăneală","taraganesc":"tărăgăni","taraganeste":"tărăgăni","taraganesti":"tărăgăni","taraganez":"tărăgăna","taraganezi":"tărăgăna","taraganii":"tărăgăni","taraganim":"tărăgăni","taraganind":"tărăgăni","taraganira":"tărăgăni","taraganiram":"tărăgăni","taraganirati":"tărăgăni","taraganirea":"tărăgănire","taraganiri":"tărăgănire","taraganirii":"tărăgănire","taraganirile":"tărăgănire","taraganirilor":"tărăgănire","taraganise":"tărăgăni","taraganisem":"tărăgăni","taraganisera":"tărăgăni","taraganiseram":"tărăgăni","taraganiserati":"tărăgăni","taraganisesi":"tărăgăni","taraganisi":"tărăgăni","taraganit":"tărăgăni","taraganiti":"tărăgăni","taragotisti":"taragotist","taragotistii":"taragotist","taragotistilor":"taragotist","taragotistul":"taragotist","taragotistule":"taragotist","taragotistului":"taragotist","taragotul":"taragot","taragotule":"taragot","taragotului":"taragot","taragoturi":"taragot","taragoturile":"taragot","taragoturilor":"taragot","tarai":["târai","târî","târâi","târî"],"taraia":["târâia","târâi","țârâia","țârâi"],"taraiai":["târâiai","târâi","țârâiai","țârâi"],"taraiam":["târâiam","târâi","țârâiam","țârâi"],"taraiati":["târâiați","târâi","țârâiați","țârâi"],"taraiau":["târâiau","târâi","țârâiau","țârâi"],"taraie":["târâie","târâi","țârâie","țârâi"],"taraiele":"țârâială","taraielei":"țârâială","taraielele":"țârâială","taraielelor":"țârâială","taraieli":["târâieli","târâială","țârâieli","țârâială"],"taraielii":"târâială","taraielile":"târâială","taraielilor":"târâială","taraii":["târâii","târâi","țârâii","țârâi"],"taraim":["târâim","târâi","țârâim","țârâi"],"taraind":["târâind","târâi","țârâind","țârâi"],"taraira":["târâiră","târâi","țârâiră","țârâi"],"tarairam":["târâirăm","târâi","țârâirăm","țârâi"],"tarairati":["târâirăți","târâi","țârâirăți","țârâi"],"tarairea":"târâire","tarairi":"târâire","tarairii":"târâire","taraise":["târâise","târâi","țârâise","țârâi"],"taraisem":["târâisem","târâi","țârâisem","țârâi"],"taraisera":["târâiseră","târâi","țârâiseră","țârâi"],"taraiseram":["târâiserăm","târâi","țârâiserăm","țârâi"],"taraiserati":["târâiserăți","târâi","țârâiserăți","țârâi"],"taraisesi":["târâiseși","târâi","țârâiseși","țârâi"],"taraisi":["târâiși","târâi","țârâiși","țârâi"],"tarait":["târâit","târâi","țârâit","țârâi"],"taraiti":["târâiți","târâi","țârâiți","țârâi"],"taraitoare":"târâitor","taraitoarea":"târâitor","taraitoarele":"târâitor","taraitori":"târâitor","taraitorii":"târâitor","taraitorul":"târâitor","taraitul":"țârâit","taraitule":"țârâit","taraitului":"țârâit","taraituri":["țârâituri","țârâit","țârâituri","țârâitură"],"taraiturii":"țârâitură","taraiturile":["țârâiturile","țârâit","țârâiturile","țârâitură"],"taraiturilor":["țârâiturilor","țârâit","țârâiturilor","țârâitură"],"tarale":"tara","taralei":"tara","taralele":"tara","taralelor":"tara","taram":["târâm","târî","târam","târî"],"taramale":"tarama","taramalei":"tarama","taramaua":"tarama","taramuri":"tărâm","taranasi":"țărănaș","taranasii":"țărănaș","taranasilor":"țărănaș","taranasul":"țărănaș","taranasule":"țărănaș","taranasului":"țărănaș","tarance":"tarancă","tarancei":"tarancă","tarancele":"tarancă","tarancelor":"tarancă","taranci":["tărănci","tarancă","țărănci","țărancă"],"tarancii":"țărancă","tarancile":"țărancă","tarancilor":"țărancă","tarancute":"țărăncuță","tarancutei":"țărăncuță","tarancutele":"țărăncuță","tarancutelor":"țărăncuță","tarand":"târî","tarane":"țărână","taraneasca":["țărănească","țărănesc","țărăneasca","țărănesc"],"taranei":"țărână","taranele":"țărână","taranelor":"țărână","taranescul":"țărănesc","taranesti":"țărănesc","taranestii":"țărănesc","taranestile":"țărănesc","tarani":"țăran","tarania":"țărănie","taraniei":"țărănie","taranii":["țăranii","țăran","țărănii","țărănie"],"taraniile":"țărănie","taraniilor":"țărănie","taranilor":"țăran","taranimea":"țărănime","taranimi":"țărănime","taranimii":"țărănime","taranioare":"țărânioară","taranioarei":"țărânioară","taranismul":"țărănism","taranismule":"țărănism","taranismului":"țărănism","taranista":["țărănistă","țărănist","țărănista","țărănist"],"taraniste":["țărăniste","țărănist","țărăniste","țărănistă"],"taranistei":"țărănistă","taranistele":["țărănistele","țărănist","țărănistele","țărănistă"],"taranistelor":"țărănistă","taranisti":"țărănist","taranistii":"țărănist","taranistilor":"țărănist","taranistul":"țărănist","taranistule":"țărănist","taranistului":"țărănist","taranoasa":["țărânoasă","țărânos","țărânoasa","țărânos","țărănoasă","țărănos","țărănoasa","țărănos"],"taranoase":["țărânoase","țărânos","țărănoase","țărănos"],"taranoasele":["țărânoasele","țărânos","țărănoasele","țărănos"],"taranoii":"țărănoi","taranoilor":"țărănoi","taranoiul":"țărănoi","taranoiule":"țărănoi","taranoiului":"țărănoi","taranosi":["țărânoși","țărânos","țărănoși","țărănos"],"taranosii":["țărânoșii","țărânos","țărănoșii","țărănos"],"taranosul":["țărânosul","țărânos","țărănosul","țărănos"],"tarantela":"tarantulă","tarantele":"tarantelă","tarantelei":"tarantelă","tarantelele":"tarantelă","tarantelelor":"tarantelă","tarantisme":"tarantism","tarantismele":"tarantism","tarantismelor":"tarantism","tarantismul":"tarantism","tarantismule":"tarantism","tarantismului":"tarantism","tarantule":"tarantulă","tarantulei":"tarantulă","tarantulele":"tarantulă","tarantulelor":"tarantulă","taranul":["taranul","taran","țăranul","țăran"],"taranule":["taranule","taran","țăranule","țăran"],"taranului":["taranului","taran","țăranului","țăran"],"taranuri":"taran","taranurile":"taran","taranurilor":"taran","taranusi":"țărănuș","taranusii":"țărănuș","taranusilor":"țărănuș","taranusul":"țărănuș","taranusule":"țărănuș","taranusului":"țărănuș","tarapanale":"tarapana","tarapanalei":"tarapana","tarapanalele":"tarapana","tarapanalelor":"tarapana","tarapanaua":"tarapana","tarapangelele":"tarapangele","tarapangelelor":"tarapangele","tarapangii":"tarapangiu","tarapangiii":"tarapangiu","tarapangiilor":"tarapangiu","tarapangiuul":"tarapangiu","tarapangiuule":"tarapangiu","tarapangiuului":"tarapangiu","tarara":"târî","tararam":"târî","tararati":"târî","tararea":"târâre","tarari":"târâre","tararii":"târâre","tararile":"târâre","tararilor":"târâre","tarasc":"târî","tarase":"târî","tarasem":"târî","tarasenia":"tărășenie","taraseniei":"tărășenie","tarasenii":"tărășenie","taraseniile":"tărășenie","taraseniilor":"tărășenie","tarasera":"târî","taraseram":"târî","taraserati":"târî","tarasesi":"târî","tarasi":["tarași","taraș","târâși","târî"],"tarasii":"taraș","tarasilor":"taraș","taraste":"târî","tarasti":"târî","tarasul":"taraș","tarasule":"taraș","tarasului":"taraș","tarat":"târî","tarata":"tărâțe","tarate":["țarate","țarat","tărâțe","tărâță"],"taratei":"tărâță","taratele":["țaratele","țarat","tărâțele","tărâță","tărâțele","tărâțe"],"taratelor":["țaratelor","țarat","tărâțelor","tărâță","tărâțelor","tărâțe"],"tarati":["târâți","târî","târați","târî"],"taratoare":"târâtor","taratoarea":"târâtor","taratoarele":"târâtor","taratoasa":["tărâțoasă","tărâțos","tărâțoasa","tărâțos"],"taratoase":"tărâțos","taratoasele":"tărâțos","taratori":"târâtor","taratorii":"târâtor","taratorul":"târâtor","taratosi":"tărâțos","taratosii":"tărâțos","taratosul":"tărâțos","taratul":["târâtul","târât","țaratul","țarat"],"taratule":["târâtule","târât","țaratule","țarat"],"taratului":["târâtului","târât","țaratului","țarat"],"taraturi":"târâtură","taraturii":"târâtură","taraturile":"târâtură","taraturilor":"târâtură","tarau":"târî","taraua":"tara","tarbacea":"tărbăci","tarbaceai":"tărbăci","tarbaceam":"tărbăci","tarbaceati":"tărbăci","tarbaceau":"tărbăci","tarbacele":"tărbăceală","tarbacelei":"tărbăceală","tarbacelele":"tărbăceală","tarbacelelor":"tărbăceală","tarbaceli":"tărbăceală","tarbacesc":"tărbăci","tarbaceste":"tărbăci","tarbacesti":"tărbăci","tarbacii":"tărbăci","tarbacim":"tărbăci","tarbacind":"tărbăci","tarbacira":"tărbăci","tarbaciram":"tărbăci","tarbacirati":"tărbăci","tarbacirea":"tărbăcire","tarbaciri":"tărbăcire","tarbacirii":"tărbăcire","tarbacirile":"tărbăcire","tarbacirilor":"tărbăcire","tarbacise":"tărbăci","tarbacisem":"tărbăci","tarbacisera":"tărbăci","tarbaciseram":"tărbăci","tarbaciserati":"tărbăci","tarbacisesi":"tărbăci","tarbacisi":"tărbăci","tarbacit":"tărbăci","tarbacita":["tărbăcită","tărbăcit","tărbăcita","tărbăcit"],"tarbacite":"tărbăcit","tarbacitele":"tărbăcit","tarbaciti":["tărbăciți","tărbăci","tărbăciți","tărbăcit"],"tarbacitii":"tărbăcit","tarbacitul":"tărbăcit","tarcaia":"țârcâi","tarcaiai":"țârcâi","tarcaiam":"țârcâi","tarcaiati":"țârcâi","tarcaiau":"țârcâi","tarcaie":"țârcâi","tarcaiele":"țârcâială","tarcaielei":"țârcâială","tarcaielele":"țârcâială","tarcaielelor":"țârcâială","tarcaieli":"țârcâială","tarcaii":"țârcâi","tarcaim":"țârcâi","tarcaind":"țârcâi","tarcaira":"țârcâi","tarcairam":"țârcâi","tarcairati":"țârcâi","tarcaise":"țârcâi","tarcaisem":"țârcâi","tarcaisera":"țârcâi","tarcaiseram":"țârcâi","tarcaiserati":"țârcâi","tarcaisesi":"țârcâi","tarcaisi":"țârcâi","tarcait":"țârcâi","tarcaiti":"țârcâi","tarcaituri":"țârcâitură","tarcaiturii":"țârcâitură","tarcaiturile":"țârcâitură","tarcaiturilor":"țârcâitură","tarcalane":"țărcălan","tarcalanele":"țărcălan","tarcalanelor":"țărcălan","tarcalanul":"țărcălan","tarcalanule":"țărcălan","tarcalanului":"țărcălan","tarcarelul":"țărcărel","tarcarelule":"țărcărel","tarcarelului":"țărcărel","tarcata":["tarcată","tarcat","tarcata","tarcat","tărcată","tărcat","tărcata","tărcat"],"tarcate":["tarcate","tarcat","tărcate","tărcat"],"tarcatele":["tarcatele","tarcat","tărcatele","tărcat"],"tarcati":["tarcați","tarcat","tărcați","tărcat"],"tarcatii":["tarcații","tarcat","tărcații","tărcat"],"tarcatul":["tarcatul","tarcat","tărcatul","tărcat"],"tarcava":["târcavă","târcav","târcava","târcav"],"tarcave":"târcav","tarcavele":"târcav","tarcavi":"târcav","tarcavii":"târcav","tarcavul":"târcav","tarchilaul":"tărchilă","tarchilaule":"tărchilă","tarchilaului":"tărchilă","tarci":"țarcă","tarcii":"țarcă","tarcile":"țarcă","tarcilor":"țarcă","tarcinia":"tarciniu","tarcinie":"tarciniu","tarcinii":"tarciniu","tarciniii":"tarciniu","tarciniile":"tarciniu","tarciniul":"tarciniu","tarcolea":"târcoli","tarcoleai":"târcoli","tarcoleam":"târcoli","tarcoleati":"târcoli","tarcoleau":"târcoli","tarcolesc":"târcoli","tarcoleste":"târcoli","tarcolesti":"târcoli","tarcolii":"târcoli","tarcolim":"târcoli","tarcolind":"târcoli","tarcolira":"târcoli","tarcoliram":"târcoli","tarcolirati":"târcoli","tarcolise":"târcoli","tarcolisem":"târcoli","tarcolisera":"târcoli","tarcoliseram":"târcoli","tarcoliserati":"târcoli","tarcolisesi":"târcoli","tarcolisi":"târcoli","tarcolit":"târcoli","tarcoliti":"târcoli","tarcovniceasca":["țârcovnicească","țârcovnicesc","țârcovniceasca","țârcovnicesc"],"tarcovnicescul":"țârcovnicesc","tarcovnicesti":"țârcovnicesc","tarcovnicestii":"țârcovnicesc","tarcovnicestile":"țârcovnicesc","tarcovnici":"țârcovnic","tarcovnicii":"țârcovnic","tarcovnicilor":"țârcovnic","tarcovnicul":"țârcovnic","tarcovnicule":"țârcovnic","tarcovnicului":"țârcovnic","tarcuia":"țărcui","tarcuiai":"țărcui","tarcuiam":"țărcui","tarcuiati":"țărcui","tarcuiau":"țărcui","tarcuiesc":"țărcui","tarcuieste":"țărcui","tarcuiesti":"țărcui","tarcuii":"țărcui","tarcuim":"țărcui","tarcuind":"țărcui","tarcuira":"țărcui","tarcuiram":"țărcui","tarcuirati":"țărcui","tarcuise":"țărcui","tarcuisem":"țărcui","tarcuisera":"țărcui","tarcuiseram":"țărcui","tarcuiserati":"țărcui","tarcuisesi":"țărcui","tarcuisi":"țărcui","tarcuit":"țărcui","tarcuiti":"țărcui","tarcul":"țarc","tarcule":"țarc","tarcului":"țarc","tarcuri":"țarc","tarcurile":"țarc","tarcurilor":"țarc","tarcusoare":"țărcușor","tarcusoarele":"țărcușor","tarcusoarelor":"țărcușor","tarcusorul":"țărcușor","tarcusorule":"țărcușor","tarcusorului":"țărcușor","tarcutul":"țărcuț","tarcutule":"țărcuț","tarcutului":"țărcuț","tardigradul":"tardigrad","tardigradule":"tardigrad","tardigradului":"tardigrad","tardigrazi":"tardigrad","tardigrazile":"tardigrad","tardigrazilor":"tardigrad","tardiu":"târziu","tardiva":["tardivă","tardiv","tardiva","tardiv"],"tardive":"tardiv","tardivele":"tardiv","tardivi":"tardiv","tardivii":"tardiv","tardivitatea":"tardivitate","tardivitati":"tardivitate","tardivitatii":"tardivitate","tardivitatile":"tardivitate","tardivitatilor":"tardivitate","tardivul":"tardiv","tare":["tare","tară","țâre","țâră"],"tarea":"tare","tareata":["tăreață","tăreț","tăreața","tăreț"],"tarei":["tarei","tară","țârei","țâră"],"tarele":["tarele","tară","țârele","țâră","tarele","tare"],"tarelor":["tarelor","tară","țârelor","țâră"],"tarete":"tăreț","taretele":"tăreț","tareti":"tăreț","taretii":"tăreț","taretul":"tăreț","tarevicii":"țarevici","tarevicilor":"țarevici","tareviciul":"țarevici","tareviciule":"țarevici","tareviciului":"țarevici","tarfaloage":"tărfălog","tarfaloagele":"tărfălog","tarfaloagelor":"tărfălog","tarfalogul":"tărfălog","tarfalogule":"tărfălog","tarfalogului":"tărfălog","tarfe":"târfă","tarfoi":"trifoi","tarforele":"târforeală","tarforelei":"târforeală","tarforelele":"târforeală","tarforelelor":"târforeală","tarforeli":"târforeală","targasi":"târgaș","targasii":"târgaș","targasilor":"târgaș","targasul":"târgaș","targasule":"târgaș","targasului":"târgaș","targhelasul":"tărghelaș","targhelasule":"tărghelaș","targhelasului":"tărghelaș","targhelasuri":"tărghelaș","targhelasurile":"tărghelaș","targhelasurilor":"tărghelaș","targi":"targă","targmureseanul":"târgmureșean","targmureseanule":"târgmureșean","targmureseanului":"târgmureșean","targmuresence":"târgmureșeancă","targmuresencei":"târgmureșeancă","targmuresencele":"târgmureșeancă","targmuresencelor":"târgmureșeancă","targmuresene":"târgmureșeană","targmuresenei":"târgmureșeană","targmuresenele":"târgmureșeană","targmuresenelor":"târgmureșeană","targmureseni":"târgmureșean","targmuresenii":"târgmureșean","targmuresenilor":"târgmureșean","targoveate":"târgoveață","targoveatei":"târgoveață","targoveatele":"târgoveață","targoveatelor":"târgoveață","targoveteasca":["târgovețească","târgovețesc","târgovețeasca","târgovețesc"],"targovetescul":"târgovețesc","targovetesti":"târgovețesc","targovetestii":"târgovețesc","targovetestile":"târgovețesc","targoveti":"târgoveț","targovetii":"târgoveț","targovetilor":"târgoveț","targovetimea":"târgovețime","targovetimei":"târgovețime","targovetul":"târgoveț","targovetule":"târgoveț","targovetului":"târgoveț","targovistea":"târgoviște","targovisteanul":"târgoviștean","targovisteanule":"târgoviștean","targovisteanului":"târgoviștean","targovistence":"târgovișteancă","targovistencei":"târgovișteancă","targovistencele":"târgovișteancă","targovistencelor":"târgovișteancă","targovistene":"târgovișteană","targovistenei":"târgovișteană","targovistenele":"târgovișteană","targovistenelor":"târgovișteană","targovisteni":"târgoviștean","targovistenii":"târgoviștean","targovistenilor":"târgoviștean","targovisti":"târgoviște","targovistii":"târgoviște","targovistile":"târgoviște","targovistilor":"târgoviște","targu jiul":"Târgu Jiu","targu jiule":"Târgu Jiu","targu jiului":"Târgu Jiu","targu muresul":"Târgu Mureș","targu muresule":"Târgu Mureș","targu muresului":"Târgu Mureș","targuia":"târgui","targuiai":"târgui","targuiam":"târgui","targuiati":"târgui","targuiau":"târgui","targuieli":"târguială","targuielii":"târguială","targuielile":"târguială","targuielilor":"târguială","targuiesc":"târgui","targuieste":"târgui","targuiesti":"târgui","targuii":"târgui","targuim":"târgui","targuind":"târgui","targuira":"târgui","targuiram":"târgui","targuirati":"târgui","targuirea":"târguire","targuirei":"târguire","targuise":"târgui","targuisem":"târgui","targuisera":"târgui","targuiseram":"târgui","targuiserati":"târgui","targuisesi":"târgui","targuisi":"târgui","targuit":"târgui","targuiti":"târgui","targuituri":"târguitură","targuiturii":"târguitură","targuiturile":"târguitură","targuiturilor":"târguitură","targul":"târg","targule":"târg","targulete":"târguleț","targuletele":"târguleț","targuletelor":"târguleț","targuletul":"târguleț","targuletule":"târguleț","targuletului":"târguleț","targului":"târg","targului secuiesc":"Târgu Secuiesc","targumureseana":["târgumureșeană","târgumureșean","târgumureșeana","târgumureșean"],"targumureseanul":"târgumureșean","targumureseanule":"târgumureșean","targumureseanului":"târgumureșean","targumuresence":"târgumureșeancă","targumuresencei":"târgumureșeancă","targumuresencele":"târgumureșeancă","targumuresencelor":"târgumureșeancă","targumuresene":"târgumureșean","targumuresenele":"târgumureșean","targumureseni":"târgumureșean","targumuresenii":"târgumureșean","targumuresenilor":"târgumureșean","targuri":"târg","targurile":"târg","targurilor":"târg","targusoare":"târgușor","targusoarele":"târgușor","targusoarelor":"târgușor","targusorul":"târgușor","targusorule":"târgușor","targusorului":"târgușor","targutul":"târguț","targutule":"târguț","targutului":"târguț","targuturi":"târguț","targuturile":"târguț","targuturilor":"târguț","tarhani":"tarhan","tarhanii":"tarhan","tarhanilor":"tarhan","tarhanul":"tarhan","tarhanule":"tarhan","tarhanului":"tarhan","tarhite":"tarhită","tarhitei":"tarhită","tarhitele":"tarhită","tarhitelor":"tarhită","tarhonul":"tarhon","tarhonule":"tarhon","tarhonului":"tarhon","tari":["țari","țar","țări","țară","tari","tare"],"tari de origine":"țară de origine","taria":"tărie","tarice":"țârică","taricei":"țârică","taricela":["tăricelă","tăricel","tăricela","tăricel"],"taricele":["țâricele","țârică","tăricele","tăricel"],"taricelele":"tăricel","tariceli":"tăricel","taricelii":"tăricel","taricelor":"țârică","taricelul":"tăricel","tariei":"tărie","tarifai":"tarifa","tarifam":["tarifăm","tarifa","tarifam","tarifa"],"tarifand":"tarifa","tarifara":["tarifară","tarifa","tarifară","tarifar","tarifara","tarifar"],"tarifaram":"tarifa","tarifarati":"tarifa","tarifare":"tarifar","tarifarea":"tarifare","tarifarei":"tarifare","tarifarele":["tarifarele","tarifar","tarifarele","tarifare"],"tarifarelor":"tarifare","tarifari":"tarifar","tarifarii":"tarifar","tarifarul":"tarifar","tarifase":"tarifa","tarifasem":"tarifa","tarifasera":"tarifa","tarifaseram":"tarifa","tarifaserati":"tarifa","tarifasesi":"tarifa","tarifasi":"tarifa","tarifat":"tarifa","tarifati":"tarifa","tarifau":"tarifa","tarife":"tarif","tarife vamale":"tarif vamal","tarifeaza":"tarifa","tarifele":"tarif","tarifelor":"tarif","tarifez":"tarifa","tarifezi":"tarifa","tariful":"tarif","tarifule":"tarif","tarifului":"tarif","tarigradeana":["țarigrădeană","țarigrădean","țarigrădeana","țarigrădean","țărigrădeană","țărigrădean","țărigrădeana","țărigrădean"],"tarigradeanul":["țarigrădeanul","țarigrădean","țărigrădeanul","țărigrădean"],"tarigradeanule":"țarigrădean","tarigradeanului":"țarigrădean","tarigradence":"țarigrădeancă","tarigradencei":"țarigrădeancă","tarigradencele":"țarigrădeancă","tarigradencelor":"țarigrădeancă","tarigradene":["țarigrădene","țarigrădean","țărigrădene","țărigrădean","țarigrădene","țarigrădeană"],"tarigradenei":"țarigrădeană","tarigradenele":["țarigrădenele","țarigrădean","țărigrădenele","țărigrădean","țarigrădenele","țarigrădeană"],"tarigradenelor":"țarigrădeană","tarigradeni":["țarigrădeni","țarigrădean","țărigrădeni","țărigrădean"],"tarigradenii":["țarigrădenii","țarigrădean","țărigrădenii","țărigrădean"],"tarigradenilor":"țarigrădean","tarii":["țarii","țar","țării","țară","tarii","tare","tării","tărie"],"tarii romanesti":"Țara Românească","tariile":"tărie","tariilor":"tărie","tarile":["țările","țară","tarile","tare"],"tarilor":["țarilor","țar","țărilor","țară"],"tarilor de jos":"Țările de Jos","tarimea":"tărime","tarimi":"tărime","tarimii":"tărime","tarimile":"tărime","tarimilor":"tărime","tarina":"țărână","tarine":"țarină","tarinei":"țarină","tarinele":"țarină","tarinelor":"țarină","tarini":"țarină","tarinii":"țarină","tarinile":"țarină","tarinilor":"țarină","tarinute":"țărinuță","tarinutei":"țărinuță","tarinutele":"țărinuță","tarinutelor":"țărinuță","tarisme":"țarism","tarismele":"țarism","tarismelor":"țarism","tarismul":"țarism","tarismule":"țarism","tarismului":"țarism","tarisoara":["tărișoară","tărișor","tărișoara","tărișor"],"tarisoare":["țârișoare","țârișoară","țărișoare","țărișoară","tărișoare","tărișor"],"tarisoarei":["țârișoarei","țârișoară","țărișoarei","țărișoară"],"tarisoarele":["țărișoarele","țărișoară","tărișoarele","tărișor"],"tarisoarelor":"țărișoară","tarisori":"tărișor","tarisorii":"tărișor","tarisorul":"tărișor","tarista":["țaristă","țarist","țarista","țarist"],"tariste":"țarist","taristele":"țarist","taristi":"țarist","taristii":"țarist","taristul":"țarist","tarisul":"tăriș","tarisule":"tăriș","tarisului":"tăriș","tarisuri":"tăriș","tarisurile":"tăriș","tarisurilor":"tăriș","tarlaia":"țârlăi","tarlaiai":"țârlăi","tarlaiam":"țârlăi","tarlaiati":"țârlăi","tarlaiau":"țârlăi","tarlaie":"țârlăi","tarlaii":"țârlăi","tarlaim":"țârlăi","tarlaind":"țârlăi","tarlaira":"țârlăi","tarlairam":"țârlăi","tarlairati":"țârlăi","tarlaise":"țârlăi","tarlaisem":"țârlăi","tarlaisera":"țârlăi","tarlaiseram":"țârlăi","tarlaiserati":"țârlăi","tarlaisesi":"țârlăi","tarlaisi":"țârlăi","tarlait":"țârlăi","tarlaiti":"țârlăi","tarlale":"tarla","tarlalei":"tarla","tarlalele":"tarla","tarlalelor":"tarla","tarlalizai":"tarlaliza","tarlalizam":["tarlalizăm","tarlaliza","tarlalizam","tarlaliza"],"tarlalizand":"tarlaliza","tarlalizara":"tarlaliza","tarlalizaram":"tarlaliza","tarlalizarati":"tarlaliza","tarlalizarea":"tarlalizare","tarlalizari":"tarlalizare","tarlalizarii":"tarlalizare","tarlalizarile":"tarlalizare","tarlalizarilor":"tarlalizare","tarlalizase":"tarlaliza","tarlalizasem":"tarlaliza","tarlalizasera":"tarlaliza","tarlalizaseram":"tarlaliza","tarlalizaserati":"tarlaliza","tarlalizasesi":"tarlaliza","tarlalizasi":"tarlaliza","tarlalizat":"tarlaliza","tarlalizati":"tarlaliza","tarlalizau":"tarlaliza","tarlalizeaza":"tarlaliza","tarlalizez":"tarlaliza","tarlalizezi":"tarlaliza","tarlatanul":"tarlatan","tarlatanule":"tarlatan","tarlatanului":"tarlatan","tarlaua":"tarla","tarle":"târlă","tarlei":"târlă","tarlele":"târlă","tarlelor":"târlă","tarlici":"târlic","tarlicii":"târlic","tarlicilor":"târlic","tarliciul":"târlici","tarliciule":"târlici","tarliciului":"târlici","tarlicul":"târlic","tarlicule":"târlic","tarlicului":"târlic","tarligiul":"târligi","tarligiule":"târligi","tarligiului":"târligi","tarlisoare":"târlișoară","tarlisoarei":"târlișoară","tarlisoarele":"târlișoară","tarlisoarelor":"târlișoară","tarlite":"târliță","tarlitei":"târliță","tarlitele":"târliță","tarlitelor":"târliță","tarlulite":"târluliță","tarlulitei":"târluliță","tarlulitele":"târluliță","tarlulitelor":"târluliță","tarlute":"târluță","tarlutei":"târluță","tarlutele":"târluță","tarlutelor":"târluță","tarmoace":"târmoacă","tarmoacei":"târmoacă","tarmocele":"târmoceală","tarmocelei":"târmoceală","tarmocelele":"târmoceală","tarmocelelor":"târmoceală","tarmoceli":"târmoceală","tarmonia":"țărmonie","tarmoniei":"țărmonie","tarmonii":"țărmonie","tarmoniile":"țărmonie","tarmoniilor":"țărmonie","tarmul":"țărm","tarmule":"țărm","tarmului":"țărm","tarmur":"țărm","tarmure":"țărmur","tarmureanul":"țărmurean","tarmureanule":"țărmurean","tarmureanului":"țărmurean","tarmurele":["țărmurele","țărmur","țărmurele","țărmure","țărmurele","țărmurel"],"tarmurelee":"țărmure","tarmurelele":"țărmurel","tarmurelelor":"țărmurel","tarmureleui":"țărmure","tarmurelor":"țărmur","tarmurelul":"țărmurel","tarmurelule":"țărmurel","tarmurelului":"țărmurel","tarmurene":"țărmureană","tarmurenei":"țărmureană","tarmurenele":"țărmureană","tarmurenelor":"țărmureană","tarmureni":"țărmurean","tarmurenii":"țărmurean","tarmurenilor":"țărmurean","tarmuri":["țărmuri","țărm","țărmuri","țărmure"],"tarmurile":["țărmurile","țărm","țărmurile","țărmure"],"tarmurilor":["țărmurilor","țărm","țărmurilor","țărmure"],"tarmurirea":"țărmurire","tarmuriri":"țărmurire","tarmuririi":"țărmurire","tarmuririle":"țărmurire","tarmuririlor":"țărmurire","tarmurita":["țărmurită","țărmurit","țărmurita","țărmurit"],"tarmurite":"țărmurit","tarmuritele":"țărmurit","tarmuriti":"țărmurit","tarmuritii":"țărmurit","tarmuritul":"țărmurit","tarmurul":"țărmur","tarmurule":"țărmur","tarmurului":"țărmur","tarnacioare":"târnăcior","tarnacioarele":"târnăcior","tarnacioarelor":"târnăcior","tarnaciorul":"târnăcior","tarnaciorule":"târnăcior","tarnaciorului":"târnăcior","tarnacoape":"târnăcop","tarnacoapele":"târnăcop","tarnacoapelor":"târnăcop","tarnacopul":"târnăcop","tarnacopule":"târnăcop","tarnacopului":"târnăcop","tarnate":"târnaț","tarnatele":"târnaț","tarnatelor":"târnaț","tarnatul":"târnaț","tarnatule":"târnaț","tarnatului":"târnaț","tarnaul":"târnă","tarnaule":"târnă","tarnaului":"târnă","tarnaveana":["târnăveană","târnăvean","târnăveana","târnăvean"],"tarnaveanul":"târnăvean","tarnaveanule":"târnăvean","tarnaveanului":"târnăvean","tarnavence":"târnăveancă","tarnavencei":"târnăveancă","tarnavencele":"târnăveancă","tarnavencelor":"târnăveancă","tarnavene":"târnăvean","tarnavenele":"târnăvean","tarnaveni":"târnăvean","tarnavenii":"târnăvean","tarnavenilor":"târnăvean","tarne":["târne","târnă","țărne","țărnă"],"tarneciul":"târneci","tarneciule":"târneci","tarneciului":"târneci","tarnei":"țărnă","tarnele":["târnele","târnă","țărnele","țărnă"],"tarnelor":["târnelor","târnă","țărnelor","țărnă"],"tarni":"țarnă","tarniceri":"tărnicer","tarnicerii":"tărnicer","tarnicerilor":"tărnicer","tarnicerul":"tărnicer","tarnicerule":"tărnicer","tarnicerului":"tărnicer","tarnii":"țarnă","tarnile":"țarnă","tarnilor":"țarnă","tarnite":"tarniță","tarnitei":"tarniță","tarnitele":"tarniță","tarnitelor":"tarniță","tarnoaie":"târnoi","tarnoaiele":"târnoi","tarnoaielor":"târnoi","tarnoiul":"târnoi","tarnoiule":"târnoi","tarnoiului":"târnoi","tarnosania":"târnosanie","tarnosaniei":"târnosanie","tarnosanii":"târnosanie","tarnosaniile":"târnosanie","tarnosaniilor":"târnosanie","tarnosea":"târnosi","tarnoseai":"târnosi","tarnoseam":"târnosi","tarnoseati":"târnosi","tarnoseau":"târnosi","tarnosele":"târnoseală","tarnoselei":"târnoseală","tarnoselele":"târnoseală","tarnoselelor":"târnoseală","tarnoseli":"târnoseală","tarnosesc":"târnosi","tarnoseste":"târnosi","tarnosesti":"târnosi","tarnosii":"târnosi","tarnosim":"târnosi","tarnosind":"târnosi","tarnosira":"târnosi","tarnosiram":"târnosi","tarnosirati":"târnosi","tarnosirea":"târnosire","tarnosiri":"târnosire","tarnosirii":"târnosire","tarnosirile":"târnosire","tarnosirilor":"târnosire","tarnosise":"târnosi","tarnosisem":"târnosi","tarnosisera":"târnosi","tarnosiseram":"târnosi","tarnosiserati":"târnosi","tarnosisesi":"târnosi","tarnosisi":"târnosi","tarnosit":"târnosi","tarnosita":["târnosită","târnosit","târnosita","târnosit"],"tarnosite":"târnosit","tarnositele":"târnosit","tarnositi":["târnosiți","târnosi","târnosiți","târnosit"],"tarnositii":"târnosit","tarnositul":"târnosit","tarnosituri":"târnositură","tarnositurii":"târnositură","tarnositurile":"târnositură","tarnositurilor":"târnositură","tarnuia":"târnui","tarnuiai":"târnui","tarnuiam":"târnui","tarnuiati":"târnui","tarnuiau":"târnui","tarnuiele":"târnuială","tarnuielei":"târnuială","tarnuielele":"târnuială","tarnuielelor":"târnuială","tarnuieli":"târnuială","tarnuiesc":"târnui","tarnuieste":"târnui","tarnuiesti":"târnui","tarnuii":"târnui","tarnuim":"târnui","tarnuind":"târnui","tarnuira":"târnui","tarnuiram":"târnui","tarnuirati":"târnui","tarnuirea":"târnuire","tarnuiri":"târnuire","tarnuirii":"târnuire","tarnuirile":"târnuire","tarnuirilor":"târnuire","tarnuise":"târnui","tarnuisem":"târnui","tarnuisera":"târnui","tarnuiseram":"târnui","tarnuiserati":"târnui","tarnuisesi":"târnui","tarnuisi":"târnui","tarnuit":"târnui","tarnuiti":"târnui","tarnul":"târn","tarnule":"târn","tarnului":"târn","tarnuri":"târn","tarnurile":"târn","tarnurilor":"târn","tarnute":"târnuță","tarnutei":"târnuță","tarnutele":"târnuță","tarnutelor":"târnuță","taro":"țară","tarocul":"taroc","tarocule":"taroc","tarocului":"taroc","taromele":"târomeală","taromelei":"târomeală","taromelele":"târomeală","taromelelor":"târomeală","taromeli":"târomeală","tarotul":"tarot","tarotule":"tarot","tarotului":"tarot","tarpane":"târpan","tarpanele":"târpan","tarpanelor":"târpan","tarpani":"tarpan","tarpanii":"tarpan","tarpanilor":"tarpan","tarpanul":["tarpanul","tarpan","târpanul","târpan"],"tarpanule":["tarpanule","tarpan","târpanule","târpan"],"tarpanului":["tarpanului","tarpan","târpanului","târpan"],"tarpenia":"târpenie","tarpeniei":"târpenie","tarpenii":"târpenie","tarpeniile":"târpenie","tarpeniilor":"târpenie","tarsaia":"târșâi","tarsaiai":"târșâi","tarsaiam":"târșâi","tarsaiati":"târșâi","tarsaiau":"târșâi","tarsaie":"târșâi","tarsaieli":"târșâială","tarsaielii":"târșâială","tarsaielile":"târșâială","tarsaielilor":"târșâială","tarsaii":"târșâi","tarsaim":"târșâi","tarsaind":"târșâi","tarsaira":"târșâi","tarsairam":"târșâi","tarsairati":"târșâi","tarsaise":"târșâi","tarsaisem":"târșâi","tarsaisera":"târșâi","tarsaiseram":"târșâi","tarsaiserati":"târșâi","tarsaisesi":"târșâi","tarsaisi":"târșâi","tarsait":"târșâi","tarsaita":["târșăită","târșăit","târșăita","târșăit"],"tarsaite":"târșăit","tarsaitele":"târșăit","tarsaiti":["târșâiți","târșâi","târșăiți","târșăit"],"tarsaitii":"târșăit","tarsaitul":"târșăit","tarsalgia":"tarsalgie","tarsalgiei":"tarsalgie","tarsalgii":"tarsalgie","tarsalgiile":"tarsalgie","tarsalgiilor":"tarsalgie","tarsane":"târsână","tarsanei":"târsână","tarsanele":"târsână","tarsanelor":"târsână","tarsciori":"târscior","tarsciorii":"târscior","tarsciorilor":"târscior","tarsciorul":"târscior","tarsciorule":"târscior","tarsciorului":"târscior","tarse":["târse","târsă","târșe","târșă"],"tarsea":"târși","tarseai":"târși","tarseam":"târși","tarseati":"târși","tarseau":"târși","tarsectomia":"tarsectomie","tarsectomiei":"tarsectomie","tarsectomii":"tarsectomie","tarsectomiile":"tarsectomie","tarsectomiilor":"tarsectomie","tarsei":["târsei","târsă","târșei","târșă"],"tarsele":["târsele","târsă","târșele","târșă"],"tarselor":["târselor","târsă","târșelor","târșă"],"tarsenirea":"târșenire","tarseniri":"târșenire","tarsenirii":"târșenire","tarsenirile":"târșenire","tarsenirilor":"târșenire","tarsesc":"târși","tarseste":"târși","tarsesti":"târși","tarsiana":["tarsiană","tarsian","tarsiana","tarsian"],"tarsianul":"tarsian","tarsie":"târșii","tarsiele":"târșială","tarsielei":"târșială","tarsielele":"târșială","tarsielelor":"târșială","tarsieli":"târșială","tarsiene":"tarsian","tarsienele":"tarsian","tarsieni":"tarsian","tarsienii":"tarsian","tarsii":"târși","tarsiia":"târșii","tarsiiai":"târșii","tarsiiam":"târșii","tarsiiati":"târșii","tarsiiau":"târșii","tarsiie":"târșii","tarsiii":"târșii","tarsiim":"târșii","tarsiind":"târșii","tarsiira":"târșii","tarsiiram":"târșii","tarsiirati":"târșii","tarsiise":"târșii","tarsiisem":"târșii","tarsiisera":"târșii","tarsiiseram":"târșii","tarsiiserati":"târșii","tarsiisesi":"târșii","tarsiisi":"târșii","tarsiit":"târșii","tarsiiti":"târșii","tarsiitul":"târșiit","tarsiitule":"târșiit","tarsiitului":"târșiit","tarsiituri":"târșiitură","tarsiiturii":"târșiitură","tarsiiturile":"târșiitură","tarsiiturilor":"târșiitură","tarsim":"târși","tarsina":"târsână","tarsind":"târși","tarsira":"târși","tarsiram":"târși","tarsirati":"târși","tarsise":"târși","tarsisem":"târși","tarsisera":"târși","tarsiseram":"târși","tarsiserati":"târși","tarsisesi":"târși","tarsisi":"târși","tarsit":"târși","tarsita":["târșită","târșit","târșita","târșit"],"tarsite":"târșit","tarsitele":"târșit","tarsiti":["târșiți","târși","târșiți","târșit"],"tarsitii":"târșit","tarsitul":"târșit","tarsoage":"târsoagă","tarsoagei":"târsoagă","tarsoagele":"târsoagă","tarsoagelor":"târsoagă","tarsoare":"târșoară","tarsoarei":"târșoară","tarsoarele":"târșoară","tarsoarelor":"târșoară","tarsonele":"târșoneală","tarsonelei":"târșoneală","tarsonelele":"târșoneală","tarsonelelor":"târșoneală","tarsoneli":"târșoneală","tarsorafia":"tarsorafie","tarsorafiei":"tarsorafie","tarsorafii":"tarsorafie","tarsotomia":"tarsotomie","tarsotomiei":"tarsotomie","tarsotomii":"tarsotomie","tarsotomiile":"tarsotomie","tarsotomiilor":"tarsotomie","tarsuti":"târșuț","tarsutii":"târșuț","tarsutilor":"târșuț","tarsutul":"târșuț","tarsutule":"târșuț","tarsutului":"târșuț","tartacute":"tărtăcuță","tartacutei":"tărtăcuță","tartacutele":"tărtăcuță","tartacutelor":"tărtăcuță","tartalogi":"tărtălog","tartalogii":"tărtălog","tartalogilor":"tărtălog","tartalogul":"tărtălog","tartalogule":"tărtălog","tartalogului":"tărtălog","tartamul":"țarțam","tartamule":"țarțam","tartamului":"țarțam","tartamuri":"țarțam","tartamurile":"țarțam","tartamurilor":"țarțam","tartanase":"tărtănaș","tartanasele":"tărtănaș","tartanaselor":"tărtănaș","tartanasul":"tărtănaș","tartanasule":"tărtănaș","tartanasului":"tărtănaș","tartane":["tartane","tartan","tartane","tartană"],"tartanei":"tartană","tartanele":["tartanele","tartan","tartanele","tartană"],"tartanelor":["tartanelor","tartan","tartanelor","tartană"],"tartani":"târtan","tartanii":"târtan","tartanilor":"târtan","tartanul":["tartanul","tartan","târtanul","târtan"],"tartanule":["tartanule","tartan","târtanule","târtan"],"tartanului":["tartanului","tartan","târtanului","târtan"],"tartarei":"țârțărel","tartareii":"țârțărel","tartareilor":"țârțărel","tartarelul":"țârțărel","tartarelule":"țârțărel","tartarelului":"țârțărel","tartaroaice":"tărtăroaică","tartaroaicei":"tărtăroaică","tartaroaicele":"tărtăroaică","tartaroaicelor":"tărtăroaică","tartaroiul":"tărtăroi","tartaroiule":"tărtăroi","tartaroiului":"tărtăroi","tartarul":"tartar","tartarule":"tartar","tartarului":"tartar","tartaruri":"tartar","tartarurile":"tartar","tartarurilor":"tartar","tarte":["tarte","tartă","tarțe","tarță"],"tartei":["tartei","tartă","tarței","tarță"],"tartele":["tartele","tartă","tarțele","tarță"],"tartelor":["tartelor","tartă","tarțelor","tarță"],"tartine":"tartină","tartinei":"tartină","tartinele":"tartină","tartinelor":"tartină","tartite":"târtiță","tartitei":"târtiță","tartitele":"târtiță","tartitelor":"târtiță","tartiu":["tărțiu","terțiu","târțiu","terțiu"],"tartori":"tartor","tartorii":"tartor","tartorilor":"tartor","tartorite":"tartoriță","tartoritei":"tartoriță","tartoritele":"tartoriță","tartoritelor":"tartoriță","tartorul":"tartor","tartorule":"tartor"};
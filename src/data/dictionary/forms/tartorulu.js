@@ -0,0 +1 @@
+export default {"tartorului":"tartor","tartrati":"tartrat","tartratii":"tartrat","tartratilor":"tartrat","tartratul":"tartrat","tartratule":"tartrat","tartratului":"tartrat","tartrica":["tartrică","tartric","tartrica","tartric"],"tartrice":"tartric","tartricele":"tartric","tartrici":"tartric","tartricii":"tartric","tartricul":"tartric","tartrul":"tartru","tartrule":"tartru","tartrului":"tartru","tartruri":"tartru","tartrurile":"tartru","tartrurilor":"tartru","tartuferia":"tartuferie","tartuferiei":"tartuferie","tartuferii":"tartuferie","tartuferiile":"tartuferie","tartuferiilor":"tartuferie","tartufismul":"tartufism","tartufismule":"tartufism","tartufismului":"tartufism","taruce":"țârucă","tarucei":"țârucă","tarucele":"țârucă","tarucelor":"țârucă","tarul":["tarul","tar","țarul","țar"],"tarule":["tarule","tar","țarule","țar"],"tarului":["tarului","tar","țarului","țar"],"taruri":"tar","tarurii":"tar","tarurilor":"tar","tarusei":"țărușel","taruseii":"țărușel","taruseilor":"țărușel","taruselul":"țărușel","taruselule":"țărușel","taruselului":"țărușel","tarusi":"țăruș","tarusii":"țăruș","tarusilor":"țăruș","tarusul":"țăruș","tarusule":"țăruș","tarusului":"țăruș","tarute":"țăruță","tarutei":"țăruță","tarutele":"țăruță","tarutelor":"țăruță","tarzia":"târziu","tarzie":"târziu","tarzielnica":["târzielnică","târzielnic","târzielnica","târzielnic"],"tarzielnice":"târzielnic","tarzielnicele":"târzielnic","tarzielnici":"târzielnic","tarzielnicii":"târzielnic","tarzielnicul":"târzielnic","tarzii":"târziu","tarziii":"târziu","tarziile":"târziu","tarziora":["târzioră","târzior","târziora","târzior"],"tarziore":"târzior","tarziorele":"târzior","tarziori":"târzior","tarziorii":"târzior","tarziorul":"târzior","tarziul":"târziu","tarziuta":["târziuță","târziuț","târziuța","târziuț"],"tarziute":"târziuț","tarziutele":"târziuț","tarziuti":"târziuț","tarziutii":"târziuț","tarziutul":"târziuț","tarzul":"tarz","tarzule":"tarz","tarzului":"tarz","tarzuri":"tarz","tarzurile":"tarz","tarzurilor":"tarz","tasai":"tasa","tasam":["tasăm","tasa","tasam","tasa"],"tasand":"tasa","tasara":"tasa","tasaram":"tasa","tasarati":"tasa","tasase":"tasa","tasasem":"tasa","tasasera":"tasa","tasaseram":"tasa","tasaserati":"tasa","tasasesi":"tasa","tasasi":"tasa","tasat":"tasa","tasati":"tasa","tasau":"tasa","tascarea":"tășcare","tascari":"tășcare","tascarii":"tășcare","tascaturi":"tășcătură","tascaturii":"tășcătură","tascaturile":"tășcătură","tascaturilor":"tășcătură","tasculite":"tășculiță","tasculitei":"tășculiță","tasculitele":"tășculiță","tasculitelor":"tășculiță","tascute":"tășcuță","tascutei":"tășcuță","tascutele":"tășcuță","tascutelor":"tășcuță","taseaza":"tasa","tasez":"tasa","tasezi":"tasa","tasista":["tașistă","tașist","tașista","tașist"],"tasiste":"tașist","tasistele":"tașist","tasisti":"tașist","tasistii":"tașist","tasistul":"tașist","tasmaie":"tașmău","tasmaiele":"tașmău","tasmaielor":"tașmău","tasmale":"tasma","tasmalei":"tasma","tasmalele":"tasma","tasmalelor":"tasma","tasmalute":"tăsmăluță","tasmalutei":"tăsmăluță","tasmalutele":"tăsmăluță","tasmalutelor":"tăsmăluță","tasmaua":"tasma","tasmauul":"tașmău","tasmauule":"tașmău","tasmauului":"tașmău","tasnea":"țâșni","tasneai":"țâșni","tasneam":"țâșni","tasneati":"țâșni","tasneau":"țâșni","tasnesc":"țâșni","tasneste":"țâșni","tasnesti":"țâșni","tasnii":"țâșni","tasnim":"țâșni","tasnind":"țâșni","tasnira":"țâșni","tasniram":"țâșni","tasnirati":"țâșni","tasnirea":"țâșnire","tasniri":"țâșnire","tasnirii":"țâșnire","tasnirile":"țâșnire","tasnirilor":"țâșnire","tasnise":"țâșni","tasnisem":"țâșni","tasnisera":"țâșni","tasniseram":"țâșni","tasniserati":"țâșni","tasnisesi":"țâșni","tasnisi":"țâșni","tasnit":"țâșni","tasniti":"țâșni","tasnitoare":"țâșnitor","tasnitoarea":"țâșnitor","tasnitoarele":"țâșnitor","tasnitori":"țâșnitor","tasnitorii":"țâșnitor","tasnitorul":"țâșnitor","tasnituri":"țâșnitură","tasniturii":"țâșnitură","tasniturile":"țâșnitură","tasniturilor":"țâșnitură","tastai":"tasta","tastam":["tastăm","tasta","tastam","tasta"],"tastand":"tasta","tastara":"tasta","tastaram":"tasta","tastarati":"tasta","tastase":"tasta","tastasem":"tasta","tastasera":"tasta","tastaseram":"tasta","tastaserati":"tasta","tastasesi":"tasta","tastasi":"tasta","tastat":"tasta","tastati":"tasta","tastaturi":"tastatură","tastaturii":"tastatură","tastaturile":"tastatură","tastaturilor":"tastatură","tastau":"tasta","taste":"tastă","taste sageti":"tastă săgeată","taste shift":"tastă shift","tasteaza":"tasta","tastei":"tastă","tastele":"tastă","tastelor":"tastă","tasteriste":"tasteristă","tasteristei":"tasteristă","tasteristele":"tasteristă","tasteristelor":"tasteristă","tastez":"tasta","tastezi":"tasta","tasti":"tașcă","tastiere":"tastieră","tastierei":"tastieră","tastierele":"tastieră","tastierelor":"tastieră","tastii":"tașcă","tastile":"tașcă","tastilor":"tașcă","tat":"tot","tata":"tăt","tatace":"țâțacă","tatacei":"țâțacă","tatacele":"țâțacă","tatacelor":"țâțacă","tatacute":"țățăcuță","tatacutei":"țățăcuță","tatacutele":"țățăcuță","tatacutelor":"țățăcuță","tataiele":"tataie","tataielui":"tataie","tataise":"tătăișă","tataisei":"tătăișă","tataisele":"tătăișă","tataiselor":"tătăișă","tataisi":"tătăiș","tataisii":"tătăiș","tataisilor":"tătăiș","tataisul":"tătăiș","tataisule":"tătăiș","tataisului":"tătăiș","tatal":"tată","tatalui":"tată","tataneasca":["tătânească","tătânesc","tătâneasca","tătânesc"],"tatanescul":"tătânesc","tatanese":"tătăneasă","tatanesei":"tătăneasă","tatanesele":"tătăneasă","tataneselor":"tătăneasă","tatanesti":"tătânesc","tatanestii":"tătânesc","tatanestile":"tătânesc","tataneul":"tătâne","tataneule":"tătâne","tataneului":"tătâne","tatani":["țâțâni","țâțână","tătăni","tătâne"],"tatanii":["țâțânii","țâțână","tătănii","tătâne"],"tatanile":"țâțână","tatanilor":["țâțânilor","țâțână","tătănilor","tătâne"],"tatara":"tătărî","tatarai":["tătărai","tătărî","tătărâi","tătărî"],"tataram":["tătărâm","tătărî","tătăram","tătărî"],"tatarand":"tătărî","tatarara":"tătărî","tatararam":"tătărî","tatararati":"tătărî","tatararea":"tătărâre","tatarari":"tătărâre","tatararii":"tătărâre","tatararile":"tătărâre","tatararilor":"tătărâre","tatarasc":"tătărî","tatarase":"tătărî","tatarasem":"tătărî","tatarasera":"tătărî","tataraseram":"tătărî","tataraserati":"tătărî","tatarasesi":"tătărî","tatarasi":["tătărași","tătăraș","tătărâși","tătărî"],"tatarasii":"tătăraș","tatarasilor":"tătăraș","tataraste":"tătărî","tatarasti":"tătărî","tatarasti de jos":"Tătărăștii de Jos","tatarasul":"tătăraș","tatarasule":"tătăraș","tatarasului":"tătăraș","tatarati":["tătărâți","tătărî","tătărați","tătărî"],"tatarau":"tătărî","tatarce":"tătarcă","tatarcei":"tătarcă","tatarcele":"tătarcă","tatarcelele":"tătărcele","tatarcelelor":"tătărcele","tatarcelor":"tătarcă","tatare":"tătară","tatareasca":["tătărească","tătăresc","tătăreasca","tătăresc"],"tatarei":"tătară","tatarele":"tătară","tatarelor":"tătară","tatarescul":"tătăresc","tataresti":"tătăresc","tatarestii":"tătăresc","tatarestile":"tătăresc","tatari":"tătar","tatarimea":"tătărime","tatarimi":"tătărime","tatarimii":"tătărime","tatarit":"tătărî","tatarite":"tătăriță","tataritei":"tătăriță","tataritele":"tătăriță","tataritelor":"tătăriță","tatarnice":"tătarnică","tatarnicei":"tătarnică","tatarnicele":"tătarnică","tatarnicelor":"tătarnică","tataroaice":"tătăroaică","tataroaicei":"tătăroaică","tataroaicele":"tătăroaică","tataroaicelor":"tătăroaică","tataroii":"tătăroi","tataroilor":"tătăroi","tataroiul":"tătăroi","tataroiule":"tătăroi","tataroiului":"tătăroi","tate":["tăte","tăt","țațe","țață","țâțe","țâță"],"tatei":["țaței","țață","țâței","țâță"],"tatele":["țațele","țață","țâțele","țâță"],"tatelor":["țațelor","țață","țâțelor","țâță"],"tati":["tăți","tăt","tați","tată"],"tati mari":"tată mare","tati vitregi":"tată vitreg","tatianei":"Tatiana","taticaul":"tătică","taticaule":"tătică","taticaului":"tătică","tatice":["țâțice","țâțică","țățice","țățică"],"taticei":["țâțicei","țâțică","țățicei","țățică"],"taticele":["țâțicele","țâțică","țățicele","țățică"],"taticelor":["țâțicelor","țâțică","țățicelor","țățică"],"tatici":["tătici","tătic","tătici","tătică","țâțici","țâțică","țățici","țățică"],"taticii":["tăticii","tătic","tăticii","tătică"],"taticilor":["tăticilor","tătic","tăticilor","tătică"],"taticul":"tătic","taticule":"tătic","taticului":"tătic","taticuti":"tăticuț","taticutii":"tăticuț","taticutilor":"tăticuț","taticutul":"tăticuț","taticutule":"tăticuț","taticutului":"tăticuț","tatii":"tată","tatilor":"tată","tatisoare":"țâțișoară","tatisoarei":"țâțișoară","tatisoarele":"țâțișoară","tatisoarelor":"țâțișoară","tatisori":"tătișor","tatisorii":"tătișor","tatisorilor":"tătișor","tatisorul":"tătișor","tatisorule":"tătișor","tatisorului":"tătișor","tatitei":"tătiță","tatiul":"tati","tatiule":"tati","tatiului":"tati","tatoaiea":"tâțoaie","tatoasa":["țâțoasă","țâțos","țâțoasa","țâțos"],"tatoase":["țâțoase","țâțoasă","țâțoase","țâțos"],"tatoasei":"țâțoasă","tatoasele":["țâțoasele","țâțoasă","țâțoasele","țâțos"],"tatoaselor":"țâțoasă","tatoi":"tâțoaie","tatoii":"tâțoaie","tatoile":"tâțoaie","tatoilor":"tâțoaie","tatonai":"tatona","tatonam":["tatonăm","tatona","tatonam","tatona"],"tatonand":"tatona","tatonanta":["tatonantă","tatonant","tatonanta","tatonant"],"tatonante":"tatonant","tatonantele":"tatonant","tatonanti":"tatonant","tatonantii":"tatonant","tatonantul":"tatonant","tatonara":"tatona","tatonaram":"tatona","tatonarati":"tatona","tatonarea":"tatonare","tatonari":"tatonare","tatonarii":"tatonare","tatonarile":"tatonare","tatonarilor":"tatonare","tatonase":"tatona","tatonasem":"tatona","tatonasera":"tatona","tatonaseram":"tatona","tatonaserati":"tatona","tatonasesi":"tatona","tatonasi":"tatona","tatonat":"tatona","tatonati":"tatona","tatonau":"tatona","tatoneaza":"tatona","tatonez":"tatona","tatonezi":"tatona","tatosi":"țâțos","tatosii":"țâțos","tatosul":"țâțos","tatuai":"tatua","tatuaje":"tatuaj","tatuajele":"tatuaj","tatuajelor":"tatuaj","tatuajul":"tatuaj","tatuajule":"tatuaj","tatuajului":"tatuaj","tatuam":["tatuăm","tatua","tatuam","tatua"],"tatuand":"tatua","tatuara":"tatua","tatuaram":"tatua","tatuarati":"tatua","tatuarea":"tatuare","tatuarei":"tatuare","tatuase":"tatua","tatuasem":"tatua","tatuasera":"tatua","tatuaseram":"tatua","tatuaserati":"tatua","tatuasesi":"tatua","tatuasi":"tatua","tatuat":"tatua","tatuata":["tatuată","tatuat","tatuata","tatuat"],"tatuate":"tatuat","tatuatele":"tatuat","tatuati":["tatuați","tatua","tatuați","tatuat"],"tatuatia":"tatuație","tatuatiei":"tatuație","tatuatii":["tatuații","tatuat","tatuații","tatuație"],"tatuatiile":"tatuație","tatuatiilor":"tatuație","tatuatul":"tatuat","tatuau":"tatua","tatuce":"țățucă","tatucei":"țățucă","tatuci":["tătuci","tătuc","tătuci","tătucă","țâțuci","țâțucă"],"tatucii":["tătucii","tătuc","tătucii","tătucă","țâțucii","țâțucă"],"tatucile":"țâțucă","tatucilor":["tătucilor","tătuc","tătucilor","tătucă","țâțucilor","țâțucă"],"tatucul":"tătuc","tatucule":"tătuc","tatucului":"tătuc","tatucutei":"tătucuță","tatucuti":"tătucuță","tatucutii":"tătucuță","tatucutilor":"tătucuță","tatueaza":"tatua","tatuez":"tatua","tatuezi":"tatua","tatuicaul":"tătuică","tatuicaule":"tătuică","tatuicaului":"tătuică","tatuici":"tătuică","tatuicii":"tătuică","tatuicilor":"tătuică","tatul":"țâț","tatule":["țâțule","țâț","tătule","tătulă"],"tatulei":"tătulă","tatulele":"tătulă","tatulelor":"tătulă","tatuluci":"tătuluc","tatulucii":"tătuluc","tatulucilor":"tătuluc","tatulucul":"tătuluc","tatulucule":"tătuluc","tatulucului":"tătuluc","tatului":"țâț","tatuluti":"tătuluț","tatulutii":"tătuluț","tatulutilor":"tătuluț","tatulutul":"tătuluț","tatulutule":"tătuluț","tatulutului":"tătuluț","taturi":"țâț","taturile":"țâț","taturilor":"țâț","tatusori":"tătușor","tatusorii":"tătușor","tatusorilor":"tătușor","tatusorul":"tătușor","tatusorule":"tătușor","tatusorului":"tătușor","tatutaul":"tătuță","tatutaule":"tătuță","tatutaului":"tătuță","tatute":"țâțuță","tatutei":"țâțuță","tatutele":"țâțuță","tatutelor":"țâțuță","tatuti":"tătuț","tatutii":"tătuț","tatutilor":"tătuț","tatutul":"tătuț","tatutule":"tătuț","tatutului":"tătuț","tatuul":"tatu","tatuului":"tatu","tau":"tu","taul":"tău","taule":["tăule","tău","taule","taulă"],"taulei":"taulă","taulele":"taulă","taulelor":"taulă","taului":"tău","taumaturgi":"taumaturg","taumaturgia":"taumaturgie","taumaturgica":["taumaturgică","taumaturgic","taumaturgica","taumaturgic"],"taumaturgice":"taumaturgic","taumaturgicele":"taumaturgic","taumaturgici":"taumaturgic","taumaturgicii":"taumaturgic","taumaturgicul":"taumaturgic","taumaturgiei":"taumaturgie","taumaturgii":["taumaturgii","taumaturg","taumaturgii","taumaturgie"],"taumaturgiile":"taumaturgie","taumaturgiilor":"taumaturgie","taumaturgilor":"taumaturg","taumaturgul":"taumaturg","taumaturgule":"taumaturg","taumaturgului":"taumaturg","taune":"tăun","tauneul":"tăune","tauneule":"tăune","tauneului":"tăune","tauni":["tăuni","tăun","tăuni","tăune"],"taunii":["tăunii","tăun","tăunii","tăune"],"taunilor":["tăunilor","tăun","tăunilor","tăune"],"taunul":"tăun","taunule":"tăun","taunului":"tăun","taurasi":"tăuraș","taurasii":"tăuraș","taurasilor":"tăuraș","taurasul":"tăuraș","taurasule":"tăuraș","taurasului":"tăuraș","taureacul":"tăureac","taureacule":"tăureac","taureacului":"tăureac","taureancul":"tăureanc","taureancule":"tăureanc","taureancului":"tăureanc","taureanul":"tăurean","taureanule":"tăurean","taureanului":"tăurean","taureci":"tăureac","taurecii":["tăurecii","tăureac","tăurecii","tăureci"],"taurecilor":["tăurecilor","tăureac","tăurecilor","tăureci"],"taureciul":"tăureci","taureciule":"tăureci","taureciului":"tăureci","taurei":"tăurel","taureii":"tăurel","taureilor":"tăurel","taurelul":"tăurel","taurelule":"tăurel","taurelului":"tăurel","taurenci":"tăureanc","taurencii":"tăureanc","taurencilor":"tăureanc","taureni":"tăurean","taurenii":"tăurean","taurenilor":"tăurean","tauri":["tăuri","tău","tauri","taur"],"taurice":"tăurică","tauricei":"tăurică","tauriciul":"tăurici","tauriciule":"tăurici","tauriciului":"tăurici","taurii":"taur","taurile":"tău","taurilor":["tăurilor","tău","taurilor","taur"],"taurina":["taurină","taurin","taurina","taurin"],"taurine":["taurine","taurin","taurine","taurină"],"taurinei":"taurină","taurinele":"taurin","taurini":"taurin","taurinii":"taurin","taurinul":"taurin","taurobolii":"taurobol","tauroboliile":"taurobol","tauroboliilor":"taurobol","taurobolul":"taurobol","taurobolule":"taurobol","taurobolului":"taurobol","taurocefali":"taurocefal","taurocefalii":"taurocefal","taurocefalilor":"taurocefal","taurocefalul":"taurocefal","taurocefalule":"taurocefal","taurocefalului":"taurocefal","taurocolica":["taurocolică","taurocolic","taurocolica","taurocolic"],"taurocolice":"taurocolic","taurocolicele":"taurocolic","taurocolici":"taurocolic","taurocolicii":"taurocolic","taurocolicul":"taurocolic","tauromahia":"tauromahie","tauromahiei":"tauromahie","tauromahii":"tauromahie","taurul":"taur","taurule":"taur","taurului":"taur","tausori":"tăușor","tausorile":"tăușor","tausorilor":"tăușor","tausorul":"tăușor","tausorule":"tăușor","tausorului":"tăușor","tauteasca":["tăuțească","tăuțesc","tăuțeasca","tăuțesc"],"tautescul":"tăuțesc","tautesti":"tăuțesc","tautestii":"tăuțesc","tautestile":"tăuțesc","tauti":"tăut","tautii":"tăut","tautilor":"tăut","tautocrona":["tautocronă","tautocron","tautocrona","tautocron"],"tautocrone":"tautocron","tautocronele":"tautocron","tautocroni":"tautocron","tautocronii":"tautocron","tautocronul":"tautocron","tautofonia":"tautofonie","tautofoniei":"tautofonie","tautofonii":"tautofonie","tautofoniile":"tautofonie","tautofoniilor":"tautofonie","tautogramaul":"tautogramă","tautogramaule":"tautogramă","tautogramaului":"tautogramă","tautologia":"tautologie","tautologica":["tautologică","tautologic","tautologica","tautologic"],"tautologice":"tautologic","tautologicele":"tautologic","tautologici":"tautologic","tautologicii":"tautologic","tautologicul":"tautologic","tautologiei":"tautologie","tautologii":"tautologie","tautologiile":"tautologie","tautologiilor":"tautologie","tautomera":["tautomeră","tautomer","tautomera","tautomer"],"tautomere":"tautomer","tautomerele":"tautomer","tautomeri":"tautomer","tautomeria":"tautomerie","tautomeriei":"tautomerie","tautomerii":["tautomerii","tautomer","tautomerii","tautomerie"],"tautomerul":"tautomer","tautul":["tăutul","tăut","tăuțul","tăuț"],"tautule":["tăutule","tăut","tăuțule","tăuț"],"tautului":["tăutului","tăut","tăuțului","tăuț"],"tauturi":"tăuț","tauturile":"tăuț","tauturilor":"tăuț","tavale":["tavale","tava","tăvale","tăvală"],"tavalea":"tăvăli","tavaleai":"tăvăli","tavaleam":"tăvăli","tavaleati":"tăvăli","tavaleau":"tăvăli","tavalei":["tavalei","tava","tăvalei","tăvală"],"tavalele":["tavalele","tava","tăvalele","tăvală","tăvălele","tăvăleală"],"tavalelei":"tăvăleală","tavalelele":"tăvăleală","tavalelelor":"tăvăleală","tavaleli":"tăvăleală","tavalelor":["tavalelor","tava","tăvalelor","tăvală"],"tavalesc":"tăvăli","tavaleste":"tăvăli","tavalesti":"tăvăli","tavalii":"tăvăli","tavalim":"tăvăli","tavalind":"tăvăli","tavalira":"tăvăli","tavaliram":"tăvăli","tavalirati":"tăvăli","tavalirea":"tăvălire","tavaliri":"tăvălire","tavalirii":"tăvălire","tavalirile":"tăvălire","tavalirilor":"tăvălire","tavalise":"tăvăli","tavalisem":"tăvăli","tavalisera":"tăvăli","tavaliseram":"tăvăli","tavaliserati":"tăvăli","tavalisesi":"tăvăli","tavalisi":"tăvăli","tavalit":"tăvăli","tavaliti":"tăvăli","tavaliture":"tăvălitură","tavaliturei":"tăvălitură","tavaliturele":"tăvălitură","tavaliturelor":"tăvălitură","tavalituri":"tăvălitură","tavaluci":"tăvăluc","tavalucii":"tăvăluc","tavalucilor":"tăvăluc","tavalucul":"tăvăluc","tavalucule":"tăvăluc","tavalucului":"tăvăluc","tavalugi":"tăvălug","tavalugii":"tăvălug","tavalugilor":"tăvălug","tavalugul":"tăvălug","tavalugule":"tăvălug","tavalugului":"tăvălug","tavane":"tavan","tavanele":"tavan","tavanelor":"tavan","tavanul":"tavan","tavanule":"tavan","tavanului":"tavan","tavaua":"tava","taverne":"tavernă","tavernei":"tavernă","tavernele":"tavernă","tavernelor":"tavernă","tavi":"tavă","tavii":"tavă","tavile":"tavă","tavilor":"tavă","tavite":"tăviță","tavitei":"tăviță","tavitele":"tăviță","tavitelor":"tăviță","taxai":"taxa","taxam":["taxăm","taxa","taxam","taxa"],"taxand":"taxa","taxara":"taxa","taxaram":"taxa","taxarati":"taxa","taxarea":"taxare","taxari":"taxare","taxarii":"taxare","taxarile":"taxare","taxarilor":"taxare","taxase":"taxa","taxasem":"taxa","taxasera":"taxa","taxaseram":"taxa","taxaserati":"taxa","taxasesi":"taxa","taxasi":"taxa","taxat":"taxa","taxati":"taxa","taxatia":"taxație","taxatiei":"taxație","taxatii":"taxație","taxatiile":"taxație","taxatiilor":"taxație","taxatoarea":"taxatoare","taxatoarei":"taxatoare","taxatoarele":"taxatoare","taxatoarelor":"taxatoare","taxatori":"taxator","taxatorii":"taxator","taxatorilor":"taxator","taxatorul":"taxator","taxatorule":"taxator","taxatorului":"taxator","taxau":"taxa","taxe":"taxă","taxeaza":"taxa","taxei":"taxă","taxele":"taxă","taxelor":"taxă","taxez":"taxa","taxezi":"taxa","taxicamioane":"taxicamion","taxicamioanele":"taxicamion","taxicamioanelor":"taxicamion","taxicamionul":"taxicamion","taxicamionule":"taxicamion","taxicamionului":"taxicamion","taxidari":"taxidar","taxidaria":"taxidărie","taxidariei":"taxidărie","taxidarii":["taxidarii","taxidar","taxidării","taxidărie"],"taxidarilor":"taxidar","taxidarul":"taxidar","taxidarule":"taxidar","taxidarului":"taxidar","taxidermia":"taxidermie","taxidermiei":"taxidermie","taxidermii":"taxidermie","taxidermisti":"taxidermist","taxidermistii":"taxidermist","taxidermistilor":"taxidermist","taxidermistul":"taxidermist","taxidermistule":"taxidermist","taxidermistului":"taxidermist","taxidul":"taxid","taxidule":"taxid","taxidului":"taxid","taxiduri":"taxid","taxidurile":"taxid","taxidurilor":"taxid","taxifurgonetaul":"taxifurgonetă","taxifurgonetaule":"taxifurgonetă","taxifurgonetaului":"taxifurgonetă","taxifurgonete":["taxifurgonete","taxifurgonet","taxifurgonete","taxifurgonetă"],"taxifurgonetele":["taxifurgonetele","taxifurgonet","taxifurgonetele","taxifurgonetă"],"taxifurgonetelor":["taxifurgonetelor","taxifurgonet","taxifurgonetelor","taxifurgonetă"],"taxifurgonetul":"taxifurgonet","taxifurgonetule":"taxifurgonet","taxifurgonetului":"taxifurgonet","taximetre":"taximetru","taximetrele":"taximetru","taximetrelor":"taximetru","taximetriste":"taximetristă","taximetristei":"taximetristă","taximetristele":"taximetristă","taximetristelor":"taximetristă","taximetristi":["taximetriști","taximetrist","taximetristi","taximetrist"],"taximetristii":"taximetrist","taximetristilor":"taximetrist","taximetristul":"taximetrist","taximetristule":"taximetrist","taximetristului":"taximetrist","taximetrul":"taximetru","taximetrule":"taximetru","taximetrului":"taximetru","taximul":"taxim","taximule":"taxim","taximului":"taxim","taximuri":"taxim","taximurile":"taxim","taximurilor":"taxim","taxinomia":"taxinomie","taxinomiei":"taxinomie","taxinomii":"taxinomie","taxinomiile":"taxinomie","taxinomiilor":"taxinomie","taxiul":"taxi","taxiule":"taxi","taxiului":"taxi","taxiuri":"taxi","taxiurile":"taxi","taxiurilor":"taxi","taxodiumul":"taxodium","taxodiumule":"taxodium","taxodiumului":"taxodium","taxologia":"taxologie","taxologiei":"taxologie","taxologii":"taxologie","taxoni":"taxon","taxonii":"taxon","taxonilor":"taxon","taxonomia":"taxonomie","taxonomica":["taxonomică","taxonomic","taxonomica","taxonomic"],"taxonomice":"taxonomic","taxonomicele":"taxonomic","taxonomici":"taxonomic","taxonomicii":"taxonomic","taxonomicul":"taxonomic","taxonomiei":"taxonomie","taxonomii":"taxonomie","taxonul":"taxon","taxonule":"taxon","taxonului":"taxon","taylorisme":"taylorism","taylorismele":"taylorism","taylorismelor":"taylorism","taylorismul":"taylorism","taylorismule":"taylorism","taylorismului":"taylorism","te":"tu","teafara":["teafără","teafăr","teafăra","teafăr"],"teafarul":"teafăr","teama":"teme","teamatul":"teamăt","teamatule":"teamăt","teamatului":"teamăt","teamul":"team","teamule":"team","teamului":"team","teancul":"teanc","teancule":"teanc","teancului":"teanc","teancuri":"teanc","teancurile":"teanc","teancurilor":"teanc","teapana":["țeapănă","țeapăn","țeapăna","țeapăn"],"teapanul":"țeapăn","teara":"țară","tearine":"țearină","tearinei":"țearină","tearinele":"țearină","tearinelor":"țearină","teasa":"țese","teascul":"teasc","teascule":"teasc","teascului":"teasc","teascuri":"teasc","teascurile":"teasc","teascurilor":"teasc","teasul":"teas","teasule":"teas","teasului":"teas","teasuri":"teas","teasurile":"teas","teasurilor":"teas","teatragii":"teatragiu","teatragiii":"teatragiu","teatragiilor":"teatragiu","teatragiuul":"teatragiu","teatragiuule":"teatragiu","teatragiuului":"teatragiu","teatrala":["teatrală","teatral","teatrala","teatral"],"teatrale":"teatral","teatralele":"teatral","teatrali":"teatral","teatraliceasca":["teatralicească","teatralicesc","teatraliceasca","teatralicesc"],"teatralicescul":"teatralicesc","teatralicesti":"teatralicesc","teatralicestii":"teatralicesc","teatralicestile":"teatralicesc","teatralii":"teatral","teatralismul":"teatralism","teatralismule":"teatralism","teatralismului":"teatralism","teatralista":["teatralistă","teatralist","teatralista","teatralist"],"teatraliste":"teatralist","teatralistele":"teatralist","teatralisti":"teatralist","teatralistii":"teatralist","teatralistul":"teatralist","teatralitatea":"teatralitate","teatralitati":"teatralitate","teatralitatii":"teatralitate","teatralitatile":"teatralitate","teatralitatilor":"teatralitate","teatralizai":"teatraliza","teatralizam":["teatralizăm","teatraliza","teatralizam","teatraliza"],"teatralizand":"teatraliza","teatralizara":"teatraliza","teatralizaram":"teatraliza","teatralizarati":"teatraliza","teatralizarea":"teatralizare","teatralizari":"teatralizare","teatralizarii":"teatralizare","teatralizarile":"teatralizare","teatralizarilor":"teatralizare","teatralizase":"teatraliza","teatralizasem":"teatraliza","teatralizasera":"teatraliza","teatralizaseram":"teatraliza","teatralizaserati":"teatraliza","teatralizasesi":"teatraliza","teatralizasi":"teatraliza","teatralizat":"teatraliza","teatralizati":"teatraliza","teatralizau":"teatraliza","teatralizeaza":"teatraliza","teatralizez":"teatraliza","teatralizezi":"teatraliza","teatralul":"teatral","teatre":"teatru","teatre de razboi":"teatru de război","teatrele":"teatru","teatrelor":"teatru","teatrologe":"teatrologă","teatrologei":"teatrologă","teatrologele":"teatrologă","teatrologelor":"teatrologă","teatrologia":"teatrologie","teatrologica":["teatrologică","teatrologic","teatrologica","teatrologic"],"teatrologice":"teatrologic","teatrologicele":"teatrologic","teatrologici":"teatrologic","teatrologicii":"teatrologic","teatrologicul":"teatrologic","teatrologiei":"teatrologie","teatrologii":"teatrologie","teatrul":"teatru","teatrule":"teatru","teatrului":"teatru","tebaine":"tebaină","tebainei":"tebaină","tebainele":"tebaină","tebainelor":"tebaină","tebaisme":"tebaism","tebaismele":"tebaism","tebaismelor":"tebaism","tebaismul":"tebaism","tebaismule":"tebaism","tebaismului":"tebaism","tebeciste":"tebecistă","tebecistei":"tebecistă","tebecistele":"tebecistă","tebecistelor":"tebecistă","teberuul":"teberu","teberuule":"teberu","teberuului":"teberu","tecalemite":"tecalemit","tecalemitele":"tecalemit","tecalemitelor":"tecalemit","tecalemitul":"tecalemit","tecalemitule":"tecalemit","tecalemitului":"tecalemit","techerghei":"techergheu","techergheii":"techergheu","techergheilor":"techergheu","techergheuul":"techergheu","techergheuule":"techergheu","techergheuului":"techergheu","techeruici":"țecheruică","techeruicii":"țecheruică","techeruicile":"țecheruică","techeruicilor":"țecheruică","techerute":"țecheruță","techerutei":"țecheruță","techerutele":"țecheruță","techerutelor":"țecheruță","techini":"țechin","techinii":"țechin","techinilor":"țechin","techinul":"țechin","techinule":"țechin","techinului":"țechin","technetiul":"technețiu","technetiule":"technețiu","technetiului":"technețiu","teci":["teci","teacă","teci","tec"],"tecii":["tecii","teacă","tecii","tec"],"tecile":"teacă","tecilor":["tecilor","teacă","tecilor","tec"],"tecisoare":"tecișoară","tecisoarei":"tecișoară","tecisoarele":"tecișoară","tecisoarelor":"tecișoară","teclifsisleacul":"teclifsisleac","teclifsisleacule":"teclifsisleac","teclifsisleacului":"teclifsisleac","teclifsisleacuri":"teclifsisleac","teclifsisleacurile":"teclifsisleac","teclifsisleacurilor":"teclifsisleac","tecsita":["tecsită","tecsit","tecsita","tecsit"],"tecsite":"tecsit","tecsitele":"tecsit","tecsiti":"tecsit","tecsitii":"tecsit","tecsitul":"tecsit","tecsuia":"tecsui","tecsuiai":"tecsui","tecsuiam":"tecsui","tecsuiati":"tecsui","tecsuiau":"tecsui","tecsuiesc":"tecsui","tecsuieste":"tecsui","tecsuiesti":"tecsui","tecsuii":"tecsui","tecsuim":"tecsui","tecsuind":"tecsui","tecsuira":"tecsui","tecsuiram":"tecsui","tecsuirati":"tecsui","tecsuise":"tecsui","tecsuisem":"tecsui","tecsuisera":"tecsui","tecsuiseram":"tecsui","tecsuiserati":"tecsui","tecsuisesi":"tecsui","tecsuisi":"tecsui","tecsuit":"tecsui","tecsuita":["tecsuită","tecsuit","tecsuita","tecsuit"],"tecsuite":"tecsuit","tecsuitele":"tecsuit","tecsuiti":["tecsuiți","tecsui","tecsuiți","tecsuit"],"tecsuitii":"tecsuit","tecsuitul":"tecsuit","tectite":"tectită","tectitei":"tectită","tectitele":"tectită","tectitelor":"tectită","tectogeneze":"tectogeneză","tectogenezei":"tectogeneză","tectogenezele":"tectogeneză","tectogenezelor":"tectogeneză","tectoni":"tecton","tectonica":["tectonică","tectonic","tectonica","tectonic"],"tectonice":["tectonice","tectonic","tectonice","tectonică"],"tectonicei":"tectonică","tectonicele":["tectonicele","tectonic","tectonicele","tectonică"],"tectonicelor":"tectonică","tectonici":"tectonic","tectonicii":"tectonic","tectonicul":"tectonic","tectonii":"tecton","tectonilor":"tecton","tectonul":"tecton","tectonule":"tecton","tectonului":"tecton","tectricea":"tectrice","tectricei":"tectrice","tecuceanul":"tecucean","tecuceanule":"tecucean","tecuceanului":"tecucean","tecucence":"tecuceancă","tecucencei":"tecuceancă","tecucencele":"tecuceancă","tecucencelor":"tecuceancă","tecucene":"tecuceană","tecucenei":"tecuceană","tecucenele":"tecuceană","tecucenelor":"tecuceană","tecuceni":"tecucean","tecucenii":"tecucean","tecucenilor":"tecucean","tecuciul":"Tecuci","tecuciule":"Tecuci","tecuciului":"Tecuci","tecul":"tec","tecule":"tec","teculite":"teculiță","teculitei":"teculiță","teculitele":"teculiță","teculitelor":"teculiță","tecului":"tec","tecusul":"tecuș","tecusule":"tecuș","tecusului":"tecuș","tecusuri":"tecuș","tecusurile":"tecuș","tecusurilor":"tecuș","tecute":"tecuță","tecutei":"tecuță","tecutele":"tecuță","tecutelor":"tecuță","tedaricul":"tedaric","tedaricule":"tedaric","tedaricului":"tedaric","tedeumul":"tedeum","tedeumule":"tedeum","tedeumului":"tedeum","tedeumuri":"tedeum","tedeumurile":"tedeum","tedeumurilor":"tedeum","tedulute":"țeduluță","tedulutei":"țeduluță","tedulutele":"țeduluță","tedulutelor":"țeduluță","tefaricul":"tefaric","tefaricule":"tefaric","tefaricului":"tefaric","tefaricuri":"tefaric","tefaricurile":"tefaric","tefaricurilor":"tefaric","tefaruta":["tefăruță","tefăruț","tefăruța","tefăruț"],"tefarute":"tefăruț","tefarutele":"tefăruț","tefaruti":"tefăruț","tefarutii":"tefăruț","tefarutul":"tefăruț","tefelisti":"tefelist","tefelistii":"tefelist","tefelistilor":"tefelist","tefelistul":"tefelist","tefelistule":"tefelist","tefelistului":"tefelist","tefere":"teafăr","teferela":["teferelă","teferel","teferela","teferel"],"teferele":["teferele","teafăr","teferele","teferel"],"teferelele":"teferel","tefereli":"teferel","teferelii":"teferel","teferelul":"teferel","teferi":"teafăr","tefericia":"tefericie","tefericiei":"tefericie","tefericii":"tefericie","tefericiile":"tefericie","tefericiilor":"tefericie","teferii":"teafăr","teferisul":"teferiș","teferisule":"teferiș","teferisului":"teferiș","teferisuri":"teferiș","teferisurile":"teferiș","teferisurilor":"teferiș","teflonata":["teflonată","teflonat","teflonata","teflonat"],"teflonate":"teflonat","teflonatele":"teflonat","teflonati":"teflonat","teflonatii":"teflonat","teflonatul":"teflonat","teflonul":"teflon","teflonule":"teflon","teflonului":"teflon","tefrocronologia":"tefrocronologie","tefrocronologiei":"tefrocronologie","tefrocronologii":"tefrocronologie","tefrocronologiile":"tefrocronologie","tefrocronologiilor":"tefrocronologie","tefterdarul":"tefterdar","tefterdarule":"tefterdar","tefterdarului":"tefterdar","teftergii":"teftergiu","teftergiii":"teftergiu","teftergiilor":"teftergiu","teftergiuul":"teftergiu","teftergiuule":"teftergiu","teftergiuului":"teftergiu","tefterhaneaua":"tefterhanea","tefterhanele":"tefterhanea","tefterhanelei":"tefterhanea","tefterhanelele":"tefterhanea","tefterhanelelor":"tefterhanea","tefterul":"tefter","tefterule":"tefter","tefterului":"tefter","tefteruri":"tefter","tefterurile":"tefter","tefterurilor":"tefter","teglaria":"teglărie","teglariei":"teglărie","teglarii":"teglărie","teglariile":"teglărie","teglariilor":"teglărie","tegle":"teglă","teglei":"teglă","teglele":"teglă","teglelor":"teglă","tegumentara":["tegumentară","tegumentar","tegumentara","tegumentar"],"tegumentare":"tegumentar","tegumentarele":"tegumentar","tegumentari":"tegumentar","tegumentarii":"tegumentar","tegumentarul":"tegumentar","tegumente":"tegument","tegumentele":"tegument","tegumentelor":"tegument","tegumentul":"tegument","tegumentule":"tegument","tegumentului":"tegument","tehne":"teahnă","tehnei":"teahnă","tehnele":"teahnă","tehnelor":"teahnă","tehnica":"tehnic","tehnice":"tehnic","tehnici":["tehnici","tehnic","tehnici","tehnică"],"tehnicianul":"tehnician","tehnicianule":"tehnician","tehnicianului":"tehnician","tehniciene":"tehniciană","tehnicienei":"tehniciană","tehnicienele":"tehniciană","tehnicienelor":"tehniciană","tehnicieni":"tehnician","tehnicieni veterinari":"tehnician veterinar","tehnicienii":"tehnician","tehnicienilor":"tehnician","tehnicii":"tehnică","tehnicile":"tehnică","tehnicilor":"tehnică","tehnicisme":"tehnicism","tehnicismele":"tehnicism","tehnicismelor":"tehnicism","tehnicismul":"tehnicism","tehnicismule":"tehnicism","tehnicismului":"tehnicism","tehnicista":["tehnicistă","tehnicist","tehnicista","tehnicist"],"tehniciste":"tehnicist","tehnicistele":"tehnicist","tehnicisti":"tehnicist","tehnicistii":"tehnicist","tehnicistul":"tehnicist","tehnicitatea":"tehnicitate","tehnicitati":"tehnicitate","tehnicitatii":"tehnicitate","tehnicitatile":"tehnicitate","tehnicitatilor":"tehnicitate","tehnicizai":"tehniciza","tehnicizam":["tehnicizăm","tehniciza","tehnicizam","tehniciza"],"tehnicizand":"tehniciza","tehnicizara":"tehniciza","tehnicizaram":"tehniciza","tehnicizarati":"tehniciza","tehnicizarea":"tehnicizare","tehnicizari":"tehnicizare","tehnicizarii":"tehnicizare","tehnicizarile":"tehnicizare","tehnicizarilor":"tehnicizare","tehnicizase":"tehniciza","tehnicizasem":"tehniciza","tehnicizasera":"tehniciza","tehnicizaseram":"tehniciza","tehnicizaserati":"tehniciza","tehnicizasesi":"tehniciza","tehnicizasi":"tehniciza","tehnicizat":"tehniciza","tehnicizati":"tehniciza","tehnicizau":"tehniciza","tehnicizeaza":"tehniciza","tehnicizez":"tehniciza","tehnicizezi":"tehniciza","tehnico-economica":["tehnico-economică","tehnico-economic","tehnico-economica","tehnico-economic"],"tehnico-economice":"tehnico-economic","tehnico-economicele":"tehnico-economic","tehnico-economici":"tehnico-economic","tehnico-economicii":"tehnico-economic","tehnico-economicul":"tehnico-economic","tehnicolora":["tehnicoloră","tehnicolor","tehnicolora","tehnicolor"],"tehnicolore":"tehnicolor","tehnicolorele":"tehnicolor","tehnicolori":"tehnicolor","tehnicolorii":"tehnicolor","tehnicolorul":"tehnicolor","tehnocrate":"tehnocrată","tehnocratei":"tehnocrată","tehnocratele":"tehnocrată","tehnocratelor":"tehnocrată","tehnocrati":"tehnocrat","tehnocratia":"tehnocrație","tehnocratica":["tehnocratică","tehnocratic","tehnocratica","tehnocratic"],"tehnocratice":"tehnocratic","tehnocraticele":"tehnocratic","tehnocratici":"tehnocratic","tehnocraticii":"tehnocratic","tehnocraticul":"tehnocratic","tehnocratiei":"tehnocrație","tehnocratii":["tehnocrații","tehnocrat","tehnocrații","tehnocrație"],"tehnocratilor":"tehnocrat","tehnocratisme":"tehnocratism","tehnocratismele":"tehnocratism","tehnocratismelor":"tehnocratism","tehnocratismul":"tehnocratism","tehnocratismule":"tehnocratism","tehnocratismului":"tehnocratism","tehnocratul":"tehnocrat","tehnocratule":"tehnocrat","tehnocratului":"tehnocrat","tehnofilia":"tehnofilie","tehnofiliei":"tehnofilie","tehnofilii":"tehnofilie","tehnofiliile":"tehnofilie","tehnofiliilor":"tehnofilie","tehnofobia":"tehnofobie","tehnofobiei":"tehnofobie","tehnofobii":"tehnofobie","tehnografia":"tehnografie","tehnografica":["tehnografică","tehnografic","tehnografica","tehnografic"],"tehnografice":"tehnografic","tehnograficele":"tehnografic","tehnografici":"tehnografic","tehnograficii":"tehnografic","tehnograficul":"tehnografic","tehnografiei":"tehnografie","tehnografii":"tehnografie","tehnologe":"tehnologă","tehnologei":"tehnologă","tehnologele":"tehnologă","tehnologelor":"tehnologă","tehnologi":"tehnolog","tehnologia":"tehnologie","tehnologica":["tehnologică","tehnologic","tehnologica","tehnologic"],"tehnologice":"tehnologic","tehnologiceasca":["tehnologicească","tehnologicesc","tehnologiceasca","tehnologicesc"],"tehnologicele":"tehnologic","tehnologicescul":"tehnologicesc","tehnologicesti":"tehnologicesc","tehnologicestii":"tehnologicesc","tehnologicestile":"tehnologicesc","tehnologici":"tehnologic","tehnologicii":"tehnologic","tehnologicul":"tehnologic","tehnologiei":"tehnologie","tehnologii":["tehnologii","tehnolog","tehnologii","tehnologie"],"tehnologiile":"tehnologie","tehnologiilor":"tehnologie","tehnologilor":"tehnolog","tehnologisme":"tehnologism","tehnologismele":"tehnologism","tehnologismelor":"tehnologism","tehnologismul":"tehnologism","tehnologismule":"tehnologism","tehnologismului":"tehnologism","tehnologizai":"tehnologiza","tehnologizam":["tehnologizăm","tehnologiza","tehnologizam","tehnologiza"],"tehnologizand":"tehnologiza","tehnologizara":"tehnologiza","tehnologizaram":"tehnologiza","tehnologizarati":"tehnologiza","tehnologizarea":"tehnologizare","tehnologizari":"tehnologizare","tehnologizarii":"tehnologizare","tehnologizarile":"tehnologizare","tehnologizarilor":"tehnologizare","tehnologizase":"tehnologiza","tehnologizasem":"tehnologiza","tehnologizasera":"tehnologiza","tehnologizaseram":"tehnologiza","tehnologizaserati":"tehnologiza","tehnologizasesi":"tehnologiza","tehnologizasi":"tehnologiza","tehnologizat":"tehnologiza","tehnologizata":["tehnologizată","tehnologizat","tehnologizata","tehnologizat"],"tehnologizate":"tehnologizat","tehnologizatele":"tehnologizat","tehnologizati":["tehnologizați","tehnologiza","tehnologizați","tehnologizat"],"tehnologizatii":"tehnologizat","tehnologizatul":"tehnologizat","tehnologizau":"tehnologiza","tehnologizeaza":"tehnologiza","tehnologizez":"tehnologiza","tehnologizezi":"tehnologiza","tehnologul":"tehnolog","tehnologule":"tehnolog","tehnologului":"tehnolog","tehnoredactai":"tehnoredacta","tehnoredactam":["tehnoredactăm","tehnoredacta","tehnoredactam","tehnoredacta"],"tehnoredactand":"tehnoredacta","tehnoredactara":"tehnoredacta","tehnoredactaram":"tehnoredacta","tehnoredactarati":"tehnoredacta","tehnoredactarea":"tehnoredactare","tehnoredactari":"tehnoredactare","tehnoredactarii":"tehnoredactare","tehnoredactarile":"tehnoredactare","tehnoredactarilor":"tehnoredactare","tehnoredactase":"tehnoredacta","tehnoredactasem":"tehnoredacta","tehnoredactasera":"tehnoredacta","tehnoredactaseram":"tehnoredacta","tehnoredactaserati":"tehnoredacta","tehnoredactasesi":"tehnoredacta","tehnoredactasi":"tehnoredacta","tehnoredactat":"tehnoredacta","tehnoredactati":"tehnoredacta","tehnoredactau":"tehnoredacta","tehnoredacteaza":"tehnoredacta","tehnoredactez":"tehnoredacta","tehnoredactezi":"tehnoredacta","tehnoredactori":"tehnoredactor","tehnoredactorii":"tehnoredactor","tehnoredactorilor":"tehnoredactor","tehnoredactorul":"tehnoredactor","tehnoredactorule":"tehnoredactor","tehnoredactorului":"tehnoredactor","tehnosfere":"tehnosferă","tehnosferei":"tehnosferă","tehnostructure":"tehnostructură","tehnostructurei":"tehnostructură","tehuia":"tehui","tehuiai":"tehui","tehuiam":"tehui","tehuiati":"tehui","tehuiau":"tehui","tehuiesc":"tehui","tehuieste":"tehui","tehuiesti":"tehui","tehuii":"tehui","tehuim":"tehui","tehuind":"tehui","tehuira":"tehui","tehuiram":"tehui","tehuirati":"tehui","tehuise":"tehui","tehuisem":"tehui","tehuisera":"tehui","tehuiseram":"tehui","tehuiserati":"tehui","tehuisesi":"tehui","tehuisi":"tehui","tehuit":"tehui","tehuiti":"tehui","teicute":"teicuță","teicutei":"teicuță","teicutele":"teicuță","teicutelor":"teicuță","teii":"tei","teilor":"tei","teine":"teină","teinei":"teină","teinele":"teină","teinelor":"teină","teioasa":["teioasă","teios","teioasa","teios"],"teioase":"teios","teioasele":"teios","teiosi":"teios","teiosii":"teios","teiosul":"teios","teismul":"teism","teismule":"teism","teismului":"teism","teisori":"teișor","teisorii":"teișor","teisorilor":"teișor","teisorul":"teișor","teisorule":"teișor","teisorului":"teișor","teiste":"teistă","teistei":"teistă","teistele":"teistă","teistelor":"teistă","teisti":"teist","teistii":"teist","teistilor":"teist","teistul":"teist","teistule":"teist","teistului":"teist","teisul":"teiș","teisule":"teiș","teisului":"teiș","teisuri":"teiș","teisurile":"teiș","teisurilor":"teiș","teiul":"tei","teiule":"tei","teiuleti":"teiuleț","teiuletii":"teiuleț","teiuletilor":"teiuleț","teiuletul":"teiuleț","teiuletule":"teiuleț","teiuletului":"teiuleț","teiului":"tei","tejgheaua":"tejghea","tejghele":"tejghea","tejghelei":"tejghea","tejghelele":"tejghea","tejghelelor":"tejghea","tejghelute":"tejgheluță","tejghelutei":"tejgheluță","tejghelutele":"tejgheluță","tejghelutelor":"tejgheluță","tejghetari":"tejghetar","tejghetarii":"tejghetar","tejghetarilor":"tejghetar","tejghetarul":"tejghetar","tejghetarule":"tejghetar","tejghetarului":"tejghetar","tejnisul":"tejniș","tejnisule":"tejniș","tejnisului":"tejniș","tejnisuri":"tejniș","tejnisurile":"tejniș","tejnisurilor":"tejniș","telalacul":"telalâc","telalacule":"telalâc","telalacului":"telalâc","telalacuri":"telalâc","telalacurile":"telalâc","telalacurilor":"telalâc","telalgia":"telalgie","telalgiei":"telalgie","telalgii":"telalgie","telalgiile":"telalgie","telalgiilor":"telalgie","telali":"telal","telalii":"telal","telalilor":"telal","telalite":"telăliță","telalitei":"telăliță","telalitele":"telăliță","telalitelor":"telăliță","telalul":"telal","telalule":"telal","telalului":"telal","telangiectazia":"telangiectazie","telangiectaziei":"telangiectazie","telangiectazii":"telangiectazie","telangiectaziile":"telangiectazie","telangiectaziilor":"telangiectazie","telebiometria":"telebiometrie","telebiometriei":"telebiometrie","telebiometrii":"telebiometrie","telecabine":"telecabină","telecabinei":"telecabină","telecabinele":"telecabină","telecabinelor":"telecabină","telecamere":"telecameră","telecamerei":"telecameră","telecamerele":"telecameră","telecamerelor":"telecameră","telechimul":"telechim","telechimule":"telechim","telechimului":"telechim","telechimuri":"telechim","telechimurile":"telechim","telechimurilor":"telechim","telechinezia":"telechinezie","telechineziei":"telechinezie","telechinezii":"telechinezie","telechiul":"telechi","telechiule":"telechi","telechiului":"telechi","telechiuri":"telechi","telechiurile":"telechi","telechiurilor":"telechi","telecineaste":"telecineastă","telecineastei":"telecineastă","telecineastele":"telecineastă","telecineastelor":"telecineastă","telecinemaul":"telecinema","telecinemaule":"telecinema","telecinemaului":"telecinema","telecomand":"telecomanda","telecomandabila":["telecomandabilă","telecomandabil","telecomandabila","telecomandabil"],"telecomandabile":"telecomandabil","telecomandabilele":"telecomandabil","telecomandabili":"telecomandabil","telecomandabilii":"telecomandabil","telecomandabilul":"telecomandabil","telecomandai":"telecomanda","telecomandam":["telecomandăm","telecomanda","telecomandam","telecomanda"],"telecomandand":"telecomanda","telecomandara":"telecomanda","telecomandaram":"telecomanda","telecomandarati":"telecomanda","telecomandase":"telecomanda","telecomandasem":"telecomanda","telecomandasera":"telecomanda","telecomandaseram":"telecomanda","telecomandaserati":"telecomanda","telecomandasesi":"telecomanda","telecomandasi":"telecomanda","telecomandat":"telecomanda","telecomandata":["telecomandată","telecomandat","telecomandata","telecomandat"],"telecomandate":"telecomandat","telecomandatele":"telecomandat","telecomandati":["telecomandați","telecomanda","telecomandați","telecomandat"],"telecomandatii":"telecomandat","telecomandatul":"telecomandat","telecomandau":"telecomanda","telecomande":"telecomanda","telecomanzi":"telecomanda","telecomenze":"telecomandă","telecomenzei":"telecomandă","telecomenzele":"telecomandă","telecomenzelor":"telecomandă","telecomenzi":"telecomandă","telecomunicatia":"telecomunicație","telecomunicatiei":"telecomunicație","telecomunicatii":"telecomunicație","telecomunicatiile":"telecomunicație","telecomunicatiilor":"telecomunicație","teleconferinte":"teleconferință","teleconferintei":"teleconferință","teleconferintele":"teleconferință","teleconferintelor":"teleconferință","telecontroale":"telecontrol","telecontroalele":"telecontrol","telecontroalelor":"telecontrol","telecontrolul":"telecontrol","telecontrolule":"telecontrol","telecontrolului":"telecontrol","telecoptere":"telecopter","telecopterele":"telecopter","telecopterelor":"telecopter","telecopterul":"telecopter","telecopterule":"telecopter","telecopterului":"telecopter","telecronicare":"telecronicară","telecronicarei":"telecronicară","telecronicarele":"telecronicară","telecronicarelor":"telecronicară","teledetectia":"teledetecție","teledetectiei":"teledetecție","teledetectii":"teledetecție","teledetectiile":"teledetecție","teledetectiilor":"teledetecție","teledifuzai":"teledifuza","teledifuzam":["teledifuzăm","teledifuza","teledifuzam","teledifuza"],"teledifuzand":"teledifuza","teledifuzara":"teledifuza","teledifuzaram":"teledifuza","teledifuzarati":"teledifuza","teledifuzarea":"teledifuzare","teledifuzarei":"teledifuzare","teledifuzase":"teledifuza","teledifuzasem":"teledifuza","teledifuzasera":"teledifuza","teledifuzaseram":"teledifuza","teledifuzaserati":"teledifuza","teledifuzasesi":"teledifuza","teledifuzasi":"teledifuza","teledifuzat":"teledifuza","teledifuzata":["teledifuzată","teledifuzat","teledifuzata","teledifuzat"],"teledifuzate":"teledifuzat","teledifuzatele":"teledifuzat","teledifuzati":["teledifuzați","teledifuza","teledifuzați","teledifuzat"],"teledifuzatii":"teledifuzat","teledifuzatul":"teledifuzat","teledifuzau":"teledifuza","teledifuzeaza":"teledifuza","teledifuzez":"teledifuza","teledifuzezi":"teledifuza","teledinamica":["teledinamică","teledinamic","teledinamica","teledinamic"],"teledinamice":"teledinamic","teledinamicele":"teledinamic","teledinamici":"teledinamic","teledinamicii":"teledinamic","teledinamicul":"teledinamic","teledirijai":"teledirija","teledirijam":["teledirijăm","teledirija","teledirijam","teledirija"],"teledirijand":"teledirija","teledirijara":"teledirija","teledirijaram":"teledirija","teledirijarati":"teledirija","teledirijarea":"teledirijare","teledirijari":"teledirijare","teledirijarii":"teledirijare","teledirijarile":"teledirijare","teledirijarilor":"teledirijare","teledirijase":"teledirija","teledirijasem":"teledirija","teledirijasera":"teledirija","teledirijaseram":"teledirija","teledirijaserati":"teledirija","teledirijasesi":"teledirija","teledirijasi":"teledirija","teledirijat":"teledirija","teledirijati":"teledirija","teledirijau":"teledirija","teledirijeaza":"teledirija","teledirijez":"teledirija","teledirijezi":"teledirija","teleecranizarea":"teleecranizare","teleecranizari":"teleecranizare","teleecranizarii":"teleecranizare","teleecranizarile":"teleecranizare","teleecranizarilor":"teleecranizare","teleeducatia":"teleeducație","teleeducatiei":"teleeducație","teleeducatii":"teleeducație","teleevanghelismul":"teleevanghelism","teleevanghelismule":"teleevanghelism","teleevanghelismului":"teleevanghelism","teleevanghelisti":"teleevanghelist","teleevanghelistii":"teleevanghelist","teleevanghelistilor":"teleevanghelist","teleevanghelistul":"teleevanghelist","teleevanghelistule":"teleevanghelist","teleevanghelistului":"teleevanghelist","teleferice":"teleferic","telefericele":"teleferic","telefericelor":"teleferic","telefericul":"teleferic","telefericule":"teleferic","telefericului":"teleferic","telefilme":"telefilm","telefilmele":"telefilm","telefilmelor":"telefilm","telefilmul":"telefilm","telefilmule":"telefilm","telefilmului":"telefilm","telefoane":"telefon","telefoane celulare":"telefon celular","telefoane mobile":"telefon mobil","telefoanele":"telefon","telefoanelor":"telefon","telefonai":"telefona","telefonam":["telefonăm","telefona","telefonam","telefona"],"telefonand":"telefona","telefonara":"telefona","telefonaram":"telefona","telefonarati":"telefona","telefonarea":"telefonare","telefonarei":"telefonare","telefonase":"telefona","telefonasem":"telefona","telefonasera":"telefona","telefonaseram":"telefona","telefonaserati":"telefona","telefonasesi":"telefona","telefonasi":"telefona","telefonat":"telefona","telefonati":"telefona","telefonatul":"telefonat","telefonatule":"telefonat","telefonatului":"telefonat","telefonaturi":"telefonat","telefonaturile":"telefonat","telefonaturilor":"telefonat","telefonau":"telefona","telefoneaza":"telefona","telefonez":"telefona","telefonezi":"telefona","telefonia":"telefonie","telefonica":["telefonică","telefonic","telefonica","telefonic"],"telefonice":"telefonic","telefonicele":"telefonic","telefonici":"telefonic","telefonicii":"telefonic","telefonicul":"telefonic","telefoniei":"telefonie","telefonii":"telefonie","telefoniste":"telefonistă","telefonistei":"telefonistă","telefonistele":"telefonistă","telefonistelor":"telefonistă","telefonisti":"telefonist","telefonistii":"telefonist","telefonistilor":"telefonist","telefonistul":"telefonist","telefonistule":"telefonist","telefonistului":"telefonist","telefonometre":"telefonometru","telefonometrele":"telefonometru","telefonometrelor":"telefonometru","telefonometrul":"telefonometru","telefonometrule":"telefonometru","telefonometrului":"telefonometru","telefonul":"telefon","telefonule":"telefon","telefonului":"telefon","telefotografia":"telefotografie","telefotografiai":"telefotografia","telefotografiam":"telefotografia","telefotografiara":"telefotografia","telefotografiaram":"telefotografia","telefotografiarati":"telefotografia","telefotografiase":"telefotografia","telefotografiasem":"telefotografia","telefotografiasera":"telefotografia","telefotografiaseram":"telefotografia","telefotografiaserati":"telefotografia","telefotografiasesi":"telefotografia","telefotografiasi":"telefotografia","telefotografiat":"telefotografia","telefotografiati":"telefotografia","telefotografiau":"telefotografia","telefotografiaza":"telefotografia","telefotografica":["telefotografică","telefotografic","telefotografica","telefotografic"],"telefotografice":"telefotografic","telefotograficele":"telefotografic","telefotografici":"telefotografic","telefotograficii":"telefotografic","telefotograficul":"telefotografic","telefotografie":"telefotografia","telefotografieaza":"telefotografia","telefotografiei":"telefotografie","telefotografiem":"telefotografia","telefotografierea":"telefotografiere","telefotografieri":"telefotografiere","telefotografierii":"telefotografiere","telefotografierile":"telefotografiere","telefotografierilor":"telefotografiere","telefotografiez":"telefotografia","telefotografiezi":"telefotografia","telefotografii":"telefotografie","telefotografiile":"telefotografie","telefotografiilor":"telefotografie","telefotografiind":"telefotografia","telefotoul":"telefoto","telefotoule":"telefoto","telefotoului":"telefoto","telegari":"telegar","telegarii":"telegar","telegarilor":"telegar","telegarul":"telegar","telegarule":"telegar","telegarului":"telegar","telegenia":"telegenie","telegenica":["telegenică","telegenic","telegenica","telegenic"],"telegenice":"telegenic","telegenicele":"telegenic","telegenici":"telegenic","telegenicii":"telegenic","telegenicul":"telegenic","telegeniei":"telegenie","telegenii":"telegenie","telegeniile":"telegenie","telegeniilor":"telegenie","teleghidai":"teleghida","teleghidaje":"teleghidaj","teleghidajele":"teleghidaj","teleghidajelor":"teleghidaj","teleghidajul":"teleghidaj","teleghidajule":"teleghidaj","teleghidajului":"teleghidaj","teleghidam":["teleghidăm","teleghida","teleghidam","teleghida"],"teleghidand":"teleghida","teleghidara":"teleghida","teleghidaram":"teleghida","teleghidarati":"teleghida","teleghidarea":"teleghidare","teleghidari":"teleghidare","teleghidarii":"teleghidare","teleghidarile":"teleghidare","teleghidarilor":"teleghidare","teleghidase":"teleghida","teleghidasem":"teleghida","teleghidasera":"teleghida","teleghidaseram":"teleghida","teleghidaserati":"teleghida","teleghidasesi":"teleghida","teleghidasi":"teleghida","teleghidat":"teleghida","teleghidata":["teleghidată","teleghidat","teleghidata","teleghidat"],"teleghidate":"teleghidat","teleghidatele":"teleghidat","teleghidati":["teleghidați","teleghida","teleghidați","teleghidat"],"teleghidatii":"teleghidat","teleghidatul":"teleghidat","teleghidau":"teleghida","teleghideaza":"teleghida","teleghidez":"teleghida","teleghidezi":"teleghida","telegi":"teleagă","telegii":"teleagă","telegile":"teleagă","telegilor":"teleagă","telegnozisul":"telegnozis","telegnozisule":"telegnozis","telegnozisului":"telegnozis","telegrafe":"telegraf","telegrafele":"telegraf","telegrafelor":"telegraf","telegrafia":"telegrafie","telegrafiai":"telegrafia","telegrafiam":"telegrafia","telegrafiara":"telegrafia","telegrafiaram":"telegrafia","telegrafiarati":"telegrafia","telegrafiase":"telegrafia","telegrafiasem":"telegrafia","telegrafiasera":"telegrafia","telegrafiaseram":"telegrafia","telegrafiaserati":"telegrafia","telegrafiasesi":"telegrafia","telegrafiasi":"telegrafia","telegrafiat":"telegrafia","telegrafiati":"telegrafia","telegrafiau":"telegrafia","telegrafiaza":"telegrafia","telegrafica":["telegrafică","telegrafic","telegrafica","telegrafic"],"telegrafice":"telegrafic","telegraficeasca":["telegraficească","telegraficesc","telegraficeasca","telegraficesc"],"telegraficele":"telegrafic","telegraficescul":"telegraficesc","telegraficesti":"telegraficesc","telegraficestii":"telegraficesc","telegraficestile":"telegraficesc","telegrafici":"telegrafic","telegraficii":"telegrafic","telegraficul":"telegrafic","telegrafie":"telegrafia","telegrafieaza":"telegrafia","telegrafiei":"telegrafie","telegrafiem":"telegrafia","telegrafierea":"telegrafiere","telegrafieri":"telegrafiere","telegrafierii":"telegrafiere","telegrafierile":"telegrafiere","telegrafierilor":"telegrafiere","telegrafiez":"telegrafia","telegrafiezi":"telegrafia","telegrafii":"telegrafie","telegrafiile":"telegrafie","telegrafiilor":"telegrafie","telegrafiind":"telegrafia","telegrafiste":"telegrafistă","telegrafistei":"telegrafistă","telegrafistele":"telegrafistă","telegrafistelor":"telegrafistă","telegrafisti":"telegrafist","telegrafistii":"telegrafist","telegrafistilor":"telegrafist","telegrafistul":"telegrafist","telegrafistule":"telegrafist","telegrafistului":"telegrafist","telegraful":"telegraf","telegrafule":"telegraf","telegrafului":"telegraf","telegramaul":"telegramă","telegramaule":"telegramă","telegramaului":"telegramă","telegrame":["telegrame","telegram","telegrame","telegramă"],"telegramele":["telegramele","telegram","telegramele","telegramă"],"telegramelor":["telegramelor","telegram","telegramelor","telegramă"],"telegramul":"telegram","telegramule":"telegram","telegramului":"telegram","telegusce":"telegușcă","teleguscei":"telegușcă","telegute":"teleguță","telegutei":"teleguță","telegutele":"teleguță","telegutelor":"teleguță","teleimprim":"teleimprima","teleimprimai":"teleimprima","teleimprimam":["teleimprimăm","teleimprima","teleimprimam","teleimprima"],"teleimprimand":"teleimprima","teleimprimara":"teleimprima","teleimprimaram":"teleimprima","teleimprimarati":"teleimprima","teleimprimarea":"teleimprimare","teleimprimari":["teleimprimări","teleimprimare","teleimprimari","teleimprimare"],"teleimprimarii":"teleimprimare","teleimprimarile":"teleimprimare","teleimprimarilor":"teleimprimare","teleimprimase":"teleimprima","teleimprimasem":"teleimprima","teleimprimasera":"teleimprima","teleimprimaseram":"teleimprima","teleimprimaserati":"teleimprima","teleimprimasesi":"teleimprima","teleimprimasi":"teleimprima","teleimprimat":"teleimprima","teleimprimati":"teleimprima","teleimprimatoare":"teleimprimator","teleimprimatoarele":"teleimprimator","teleimprimatoarelor":"teleimprimator","teleimprimatorul":"teleimprimator","teleimprimatorule":"teleimprimator","teleimprimatorului":"teleimprimator","teleimprimau":"teleimprima","teleimprimi":"teleimprima","teleinformatica":["teleinformatică","teleinformatic","teleinformatica","teleinformatic"],"teleinformatice":["teleinformatice","teleinformatic","teleinformatice","teleinformatică"],"teleinformaticei":"teleinformatică","teleinformaticele":["teleinformaticele","teleinformatic","teleinformaticele","teleinformatică"],"teleinformaticelor":"teleinformatică","teleinformatici":"teleinformatic","teleinformaticii":"teleinformatic","teleinformaticul":"teleinformatic","teleinregistrarea":"teleînregistrare","teleinregistrari":["teleînregistrări","teleînregistrare","teleînregistrari","teleînregistrare"],"teleinregistrarii":"teleînregistrare","teleinregistrarile":"teleînregistrare","teleinregistrarilor":"teleînregistrare","teleinterviul":"teleinterviu","teleinterviule":"teleinterviu","teleinterviului":"teleinterviu","teleinterviuri":"teleinterviu","teleinterviurile":"teleinterviu","teleinterviurilor":"teleinterviu","telejurnale":"telejurnal","telejurnalele":"telejurnal","telejurnalelor":"telejurnal","telejurnalul":"telejurnal","telejurnalule":"telejurnal","telejurnalului":"telejurnal","telelei":"teleleu","teleleii":"teleleu","teleleilor":"teleleu","teleleul":"teleleu","teleleule":"teleleu","teleleului":"teleleu","teleloaice":"teleloaică","teleloaicei":"teleloaică","teleloaicele":"teleloaică","teleloaicelor":"teleloaică","telemasuri":"telemăsură","telemasurii":"telemăsură","telemasurile":"telemăsură","telemasurilor":"telemăsură","telematica":["telematică","telematic","telematica","telematic"],"telematice":"telematic","telematicele":"telematic","telematici":["telematici","telematic","telematici","telematică"],"telematicii":["telematicii","telematic","telematicii","telematică"],"telematicile":"telematică","telematicilor":"telematică","telematicul":"telematic","telemeaua":"telemea","telemecanica":["telemecanică","telemecanic","telemecanica","telemecanic"],"telemecanice":["telemecanice","telemecanic","telemecanice","telemecanică"],"telemecanicei":"telemecanică","telemecanicele":"telemecanic","telemecanici":"telemecanic","telemecanicii":"telemecanic","telemecanicul":"telemecanic","telemele":"telemea","telemelei":"telemea","telemetre":"telemetru","telemetrele":"telemetru","telemetrelor":"telemetru","telemetria":"telemetrie","telemetrica":["telemetrică","telemetric","telemetrica","telemetric"],"telemetrice":"telemetric","telemetricele":"telemetric","telemetrici":"telemetric","telemetricii":"telemetric","telemetricul":"telemetric","telemetriei":"telemetrie","telemetrii":"telemetrie","telemetrul":"telemetru","telemetrule":"telemetru","telemetrului":"telemetru","telemobile":"telemobil","telemobilele":"telemobil","telemobilelor":"telemobil","telemobilul":"telemobil","telemobilule":"telemobil","telemobilului":"telemobil","telemunci":"telemuncă","telemuncii":"telemuncă","telemuncile":"telemuncă","telemuncilor":"telemuncă","telencefale":"telencefal","telencefalele":"telencefal","telencefalelor":"telencefal","telencefalul":"telencefal","telencefalule":"telencefal","telencefalului":"telencefal","telenovele":"telenovelă","telenovelei":"telenovelă","telenovelele":"telenovelă","telenovelelor":"telenovelă","teleobiective":"teleobiectiv","teleobiectivele":"teleobiectiv","teleobiectivelor":"teleobiectiv","teleobiectivul":"teleobiectiv","teleobiectivule":"teleobiectiv","teleobiectivului":"teleobiectiv","teleobservarea":"teleobservare","teleobservari":"teleobservare","teleobservarii":"teleobservare","teleobservarile":"teleobservare","teleobservarilor":"teleobservare","teleobservatori":"teleobservator","teleobservatorii":"teleobservator","teleobservatorilor":"teleobservator","teleobservatorul":"teleobservator","teleobservatorule":"teleobservator","teleobservatorului":"teleobservator","teleologia":"teleologie","teleologica":["teleologică","teleologic","teleologica","teleologic"],"teleologice":"teleologic","teleologiceasca":["teleologicească","teleologicesc","teleologiceasca","teleologicesc"],"teleologicele":"teleologic","teleologicescul":"teleologicesc","teleologicesti":"teleologicesc","teleologicestii":"teleologicesc","teleologicestile":"teleologicesc","teleologici":"teleologic","teleologicii":"teleologic","teleologicul":"teleologic","teleologiei":"teleologie","teleologii":"teleologie","teleonomia":"teleonomie","teleonomiei":"teleonomie","teleonomii":"teleonomie","teleonomiile":"teleonomie","teleonomiilor":"teleonomie","teleoperatori":"teleoperator","teleoperatorii":"teleoperator","teleoperatorilor":"teleoperator","teleoperatorul":"teleoperator","teleoperatorule":"teleoperator","teleoperatorului":"teleoperator","teleormaneanul":"teleormănean","teleormaneanule":"teleormănean","teleormaneanului":"teleormănean","teleormanence":"teleormăneancă","teleormanencei":"teleormăneancă","teleormanencele":"teleormăneancă","teleormanencelor":"teleormăneancă","teleormanene":"teleormăneană","teleormanenei":"teleormăneană","teleormanenele":"teleormăneană","teleormanenelor":"teleormăneană","teleormaneni":"teleormănean","teleormanenii":"teleormănean","teleormanenilor":"teleormănean","teleosteanul":"teleostean","teleosteanule":"teleostean","teleosteanului":"teleostean","teleosteeni":"teleostean","teleosteenii":"teleostean","teleosteenilor":"teleostean","telepati":"telepat","telepatia":"telepatie","telepatica":["telepatică","telepatic","telepatica","telepatic"],"telepatice":"telepatic","telepaticele":"telepatic","telepatici":"telepatic","telepaticii":"telepatic","telepaticul":"telepatic","telepatiei":"telepatie","telepatii":["telepații","telepat","telepatii","telepatie"],"telepatilor":"telepat","telepatul":"telepat","telepatule":"telepat","telepatului":"telepat","telepublicitatea":"telepublicitate","telepublicitati":"telepublicitate","telepublicitatii":"telepublicitate","teleradiografia":"teleradiografie","teleradiografiei":"teleradiografie","teleradiografii":"teleradiografie","teleradioterapia":"teleradioterapie","teleradioterapiei":"teleradioterapie","teleradioterapii":"teleradioterapie","teleradioterapiile":"teleradioterapie","teleradioterapiilor":"teleradioterapie","teleredactoarea":"teleredactoare","teleredactoarei":"teleredactoare","teleredactoarele":"teleredactoare","teleredactoarelor":"teleredactoare","telereglarea":"telereglare","telereglari":["telereglări","telereglare","telereglari","telereglare"],"telereglarii":"telereglare","telereglarile":"telereglare","telereglarilor":"telereglare","telereportere":"telereporteră","telereporterei":"telereporteră","telereporterele":"telereporteră","telereporterelor":"telereporteră","telescaune":"telescaun","telescaunele":"telescaun","telescaunelor":"telescaun","telescaunul":"telescaun","telescaunule":"telescaun","telescaunului":"telescaun","teleschiul":"teleschi","teleschiule":"teleschi","teleschiului":"teleschi","teleschiuri":"teleschi","teleschiurile":"teleschi","teleschiurilor":"teleschi","telescoale":"teleșcoală","telescoalei":"teleșcoală","telescoape":"telescop","telescoapele":"telescop","telescoapelor":"telescop","telescopica":["telescopică","telescopic","telescopica","telescopic"],"telescopice":"telescopic","telescopicele":"telescopic","telescopici":"telescopic","telescopicii":"telescopic","telescopicul":"telescopic","telescopul":"telescop","telescopule":"telescop","telescopului":"telescop","telescriptoare":"telescriptor","telescriptoarele":"telescriptor","telescriptoarelor":"telescriptor","telescriptorul":"telescriptor","telescriptorule":"telescriptor","telescriptorului":"telescriptor","teleshoppingul":"teleshopping","teleshoppingule":"teleshopping","teleshoppingului":"teleshopping","telespectatoarea":"telespectatoare","telespectatoarei":"telespectatoare","telespectatoarele":"telespectatoare","telespectatoarelor":"telespectatoare","telespectatori":"telespectator","telespectatorii":"telespectator","telespectatorilor":"telespectator","telespectatorul":"telespectator","telespectatorule":"telespectator","telespectatorului":"telespectator","telespicheri":["telespicheri","telespicher","teleșpicheri","teleșpicher"],"telespicherii":"teleșpicher","telespicherile":"telespicher","telespicherilor":["telespicherilor","telespicher","teleșpicherilor","teleșpicher"],"telespicherul":["telespicherul","telespicher","teleșpicherul","teleșpicher"],"telespicherule":["telespicherule","telespicher","teleșpicherule","teleșpicher"],"telespicherului":["telespicherului","telespicher","teleșpicherului","teleșpicher"],"telesportul":"telesport","telesportule":"telesport","telesportului":"telesport","telestereografe":"telestereograf"};
@@ -0,0 +1 @@
+export default {"telestereografele":"telestereograf","telestereografelor":"telestereograf","telestereograful":"telestereograf","telestereografule":"telestereograf","telestereografului":"telestereograf","teletermometre":"teletermometru","teletermometrele":"teletermometru","teletermometrelor":"teletermometru","teletermometrul":"teletermometru","teletermometrule":"teletermometru","teletermometrului":"teletermometru","teletextul":"teletext","teletextule":"teletext","teletextului":"teletext","teletexul":"teletex","teletexule":"teletex","teletexului":"teletex","teletexuri":"teletex","teletexurile":"teletex","teletexurilor":"teletex","teletipul":"teletip","teletipule":"teletip","teletipului":"teletip","teletipuri":"teletip","teletipurile":"teletip","teletipurilor":"teletip","televizai":"televiza","televizam":["televizăm","televiza","televizam","televiza"],"televizand":"televiza","televizara":"televiza","televizaram":"televiza","televizarati":"televiza","televizarea":"televizare","televizari":"televizare","televizarii":"televizare","televizarile":"televizare","televizarilor":"televizare","televizase":"televiza","televizasem":"televiza","televizasera":"televiza","televizaseram":"televiza","televizaserati":"televiza","televizasesi":"televiza","televizasi":"televiza","televizat":"televiza","televizati":"televiza","televizau":"televiza","televizeaza":"televiza","televizez":"televiza","televizezi":"televiza","televiziuni":"televiziune","televizoare":"televizor","televizoristi":"televizorist","televizoristii":"televizorist","televizoristilor":"televizorist","televizoristul":"televizorist","televizoristule":"televizorist","televizoristului":"televizorist","televizuala":["televizuală","televizual","televizuala","televizual"],"televizuale":"televizual","televizualele":"televizual","televizuali":"televizual","televizualii":"televizual","televizualul":"televizual","telexul":"telex","telexule":"telex","telexului":"telex","telexuri":"telex","telexurile":"telex","telexurilor":"telex","telinci":"telincă","telincii":"telincă","telincile":"telincă","telincilor":"telincă","teline":"țelină","telinei":"țelină","telinele":"țelină","telinelor":"țelină","telingi":"telingă","telingii":"telingă","telingile":"telingă","telingilor":"telingă","telinioare":"țelinioară","telinioarei":"țelinioară","telinioarele":"țelinioară","telinioarelor":"țelinioară","telinoasa":["țelinoasă","țelinos","țelinoasa","țelinos"],"telinoase":"țelinos","telinoasele":"țelinos","telinosi":"țelinos","telinosii":"țelinos","telinosul":"țelinos","telmatologia":"telmatologie","telmatologica":["telmatologică","telmatologic","telmatologica","telmatologic"],"telmatologice":"telmatologic","telmatologicele":"telmatologic","telmatologici":"telmatologic","telmatologicii":"telmatologic","telmatologicul":"telmatologic","telmatologiei":"telmatologie","telmatologii":"telmatologie","telofaze":"telofază","telofazei":"telofază","telofazele":"telofază","telofazelor":"telofază","telomi":"telom","telomii":"telom","telomilor":"telom","telomul":"telom","telomule":"telom","telomului":"telom","telpiza":["telpiză","telpiz","telpiza","telpiz"],"telpize":"telpiz","telpizele":"telpiz","telpizi":"telpiz","telpizii":"telpiz","telpizlicul":"telpizlic","telpizlicule":"telpizlic","telpizlicului":"telpizlic","telpizlicuri":"telpizlic","telpizlicurile":"telpizlic","telpizlicurilor":"telpizlic","telpizul":"telpiz","telsoane":"telson","telsoanele":"telson","telsoanelor":"telson","telsonul":"telson","telsonule":"telson","telsonului":"telson","telteiase":"telteiaș","telteiasele":"telteiaș","telteiaselor":"telteiaș","telteiasul":"telteiaș","telteiasule":"telteiaș","telteiasului":"telteiaș","telteute":"telteuț","telteutele":"telteuț","telteutelor":"telteuț","telteutul":"telteuț","telteutule":"telteuț","telteutului":"telteuț","telul":"țel","telule":"țel","telului":"țel","teluri":"țel","telurica":["telurică","teluric","telurica","teluric"],"telurice":"teluric","teluricele":"teluric","telurici":"teluric","teluricii":"teluric","teluricul":"teluric","telurile":"țel","telurilor":"țel","teluritul":"telurit","teluritule":"telurit","teluritului":"telurit","teluroasa":["teluroasă","teluros","teluroasa","teluros"],"teluroase":"teluros","teluroasele":"teluros","telurometre":"telurometru","telurometrele":"telurometru","telurometrelor":"telurometru","telurometrul":"telurometru","telurometrule":"telurometru","telurometrului":"telurometru","telurosi":"teluros","telurosii":"teluros","telurosul":"teluros","telurul":"telur","telurule":"telur","telurului":"telur","telururi":"telurură","telururii":"telurură","telururile":"telurură","telururilor":"telurură","telveaua":"telvea","telvele":"telvea","telvelei":"telvea","telvelele":"telvea","telvelelor":"telvea","tem":"teme","temand":"teme","tematica":["tematică","tematic","tematica","tematic"],"tematice":["tematice","tematic","tematice","tematică"],"tematicei":"tematică","tematicele":["tematicele","tematic","tematicele","tematică"],"tematicelor":"tematică","tematici":["tematici","tematic","tematici","tematică"],"tematicii":"tematic","tematicul":"tematic","tematoare":"temător","tematoarea":"temător","tematoarele":"temător","tematologia":"tematologie","tematologica":["tematologică","tematologic","tematologica","tematologic"],"tematologice":"tematologic","tematologicele":"tematologic","tematologici":"tematologic","tematologicii":"tematologic","tematologicul":"tematologic","tematologiei":"tematologie","tematologii":"tematologie","tematologiile":"tematologie","tematologiilor":"tematologie","tematori":"temător","tematoria":"temătoriu","tematorie":"temătoriu","tematorii":["temătorii","temător","temătorii","temătoriu"],"tematoriii":"temătoriu","tematoriile":"temătoriu","tematoriul":"temătoriu","tematorul":"temător","tematuri":"temătură","tematurii":"temătură","tematurile":"temătură","tematurilor":"temătură","tembela":["tembelă","tembel","tembela","tembel"],"tembele":"tembel","tembelele":"tembel","tembeli":"tembel","tembelicul":"tembelic","tembelicule":"tembelic","tembelicului":"tembelic","tembelii":"tembel","tembelisme":"tembelism","tembelismele":"tembelism","tembelismelor":"tembelism","tembelismul":"tembelism","tembelismule":"tembelism","tembelismului":"tembelism","tembelizai":"tembeliza","tembelizam":["tembelizăm","tembeliza","tembelizam","tembeliza"],"tembelizand":"tembeliza","tembelizara":"tembeliza","tembelizaram":"tembeliza","tembelizarati":"tembeliza","tembelizase":"tembeliza","tembelizasem":"tembeliza","tembelizasera":"tembeliza","tembelizaseram":"tembeliza","tembelizaserati":"tembeliza","tembelizasesi":"tembeliza","tembelizasi":"tembeliza","tembelizat":"tembeliza","tembelizati":"tembeliza","tembelizau":"tembeliza","tembelizeaza":"tembeliza","tembelizez":"tembeliza","tembelizezi":"tembeliza","tembelul":"tembel","teme":["teme","teamă","teme","temă"],"temea":"teme","temeai":"teme","temeam":"teme","temeati":"teme","temeau":"teme","temei":["temei","teamă","temei","temă"],"temeinica":["temeinică","temeinic","temeinica","temeinic"],"temeinice":"temeinic","temeinicele":"temeinic","temeinici":"temeinic","temeinicia":"temeinicie","temeiniciei":"temeinicie","temeinicii":["temeinicii","temeinic","temeinicii","temeinicie"],"temeinicul":"temeinic","temeiul":"temei","temeiule":"temei","temeiului":"temei","temeiuri":"temei","temeiurile":"temei","temeiurilor":"temei","temele":"temă","temelia":"temelie","temeliei":"temelie","temelii":"temelie","temeliile":"temelie","temeliilor":"temelie","temeliitori":"temeliitoriu","temeliitorii":"temeliitoriu","temeliitorilor":"temeliitoriu","temeliitoriuul":"temeliitoriu","temeliitoriuule":"temeliitoriu","temeliitoriuului":"temeliitoriu","temelnica":["temelnică","temelnic","temelnica","temelnic"],"temelnice":"temelnic","temelnicele":"temelnic","temelnici":"temelnic","temelnicii":"temelnic","temelnicul":"temelnic","temelor":"temă","temem":"teme","temenea":"temeni","temeneai":"temeni","temeneam":"temeni","temeneati":"temeni","temeneau":"temeni","temeneaua":"temenea","temenele":"temenea","temenelei":"temenea","temenelele":"temenea","temenelelor":"temenea","temenesc":"temeni","temeneste":"temeni","temenesti":"temeni","temenii":"temeni","temenim":"temeni","temenind":"temeni","temenira":"temeni","temeniram":"temeni","temenirati":"temeni","temenise":"temeni","temenisem":"temeni","temenisera":"temeni","temeniseram":"temeni","temeniserati":"temeni","temenisesi":"temeni","temenisi":"temeni","temenit":"temeni","temeniti":"temeni","temerara":["temerară","temerar","temerara","temerar"],"temerare":"temerar","temerarele":"temerar","temerari":"temerar","temerarii":"temerar","temerarul":"temerar","temeri":"temere","temeritatea":"temeritate","temeritati":"temeritate","temeritatii":"temeritate","temeritatile":"temeritate","temeritatilor":"temeritate","temeteie":"temeteu","temeteiele":"temeteu","temeteielor":"temeteu","temeteul":"temeteu","temeteule":"temeteu","temeteului":"temeteu","temeti":"teme","temi":"teme","temice":"temică","temicei":"temică","teminte":"temință","temintei":"temință","temniceri":"temnicer","temnicerii":"temnicer","temnicerilor":"temnicer","temnicerul":"temnicer","temnicerule":"temnicer","temnicerului":"temnicer","temnicioare":"temnicioară","temnicioarei":"temnicioară","temnicioarele":"temnicioară","temnicioarelor":"temnicioară","temnitai":"temnița","temnitam":["temnițăm","temnița","temnițam","temnița"],"temnitand":"temnița","temnitara":"temnița","temnitaram":"temnița","temnitarati":"temnița","temnitase":"temnița","temnitasem":"temnița","temnitasera":"temnița","temnitaseram":"temnița","temnitaserati":"temnița","temnitasesi":"temnița","temnitasi":"temnița","temnitat":"temnița","temnitati":"temnița","temnitau":"temnița","temnite":"temniță","temniteaza":"temnița","temnitei":"temniță","temnitele":"temniță","temnitelor":"temniță","temnitez":"temnița","temnitezi":"temnița","temori":"temoare","temperai":"tempera","temperam":["temperăm","tempera","temperam","tempera"],"temperamentala":["temperamentală","temperamental","temperamentala","temperamental"],"temperamentale":"temperamental","temperamentalele":"temperamental","temperamentali":"temperamental","temperamentalii":"temperamental","temperamentalul":"temperamental","temperamente":"temperament","temperamentele":"temperament","temperamentelor":"temperament","temperamentoasa":["temperamentoasă","temperamentos","temperamentoasa","temperamentos"],"temperamentoase":"temperamentos","temperamentoasele":"temperamentos","temperamentosi":"temperamentos","temperamentosii":"temperamentos","temperamentosul":"temperamentos","temperamentul":"temperament","temperamentule":"temperament","temperamentului":"temperament","temperand":"tempera","temperante":"temperanță","temperantei":"temperanță","temperantele":"temperanță","temperantelor":"temperanță","temperara":"tempera","temperaram":"tempera","temperarati":"tempera","temperarea":"temperare","temperarei":"temperare","temperase":"tempera","temperasem":"tempera","temperasera":"tempera","temperaseram":"tempera","temperaserati":"tempera","temperasesi":"tempera","temperasi":"tempera","temperat":"tempera","temperata":["temperată","temperat","temperata","temperat"],"temperate":"temperat","temperatele":"temperat","temperati":["temperați","tempera","temperați","temperat"],"temperatii":"temperat","temperatul":"temperat","temperaturi":"temperatură","temperaturi absolute":"temperatură absolută","temperaturi critice":"temperatură critică","temperaturi de roua":"temperatură de rouă","temperaturii":"temperatură","temperaturile":"temperatură","temperaturilor":"temperatură","temperau":"tempera","tempereaza":"tempera","temperez":"tempera","temperezi":"tempera","temperia":"temperie","temperiei":"temperie","temperii":"temperie","temperiile":"temperie","temperiilor":"temperie","tempestatea":"tempestate","tempestati":"tempestate","tempestatii":"tempestate","tempestatile":"tempestate","tempestatilor":"tempestate","tempeste":"tempestă","tempestei":"tempestă","tempestele":"tempestă","tempestelor":"tempestă","tempestuoasa":["tempestuoasă","tempestuos","tempestuoasa","tempestuos"],"tempestuoase":"tempestuos","tempestuoasele":"tempestuos","tempestuosi":"tempestuos","tempestuosii":"tempestuos","tempestuosul":"tempestuos","temple":"templu","templele":"templu","templelor":"templu","templia":"templiu","templie":"templiu","templieri":"templier","templierii":"templier","templierilor":"templier","templierul":"templier","templierule":"templier","templierului":"templier","templii":"templiu","templiii":"templiu","templiile":"templiu","templiul":"templiu","templul":"templu","templule":"templu","templului":"templu","temporala":["temporală","temporal","temporala","temporal"],"temporale":"temporal","temporalele":"temporal","temporali":"temporal","temporalii":"temporal","temporalitatea":"temporalitate","temporalitati":"temporalitate","temporalitatii":"temporalitate","temporalul":"temporal","temporara":["temporară","temporar","temporara","temporar"],"temporare":"temporar","temporarele":"temporar","temporari":"temporar","temporarii":"temporar","temporarul":"temporar","temporizai":"temporiza","temporizam":["temporizăm","temporiza","temporizam","temporiza"],"temporizand":"temporiza","temporizara":"temporiza","temporizaram":"temporiza","temporizarati":"temporiza","temporizarea":"temporizare","temporizari":"temporizare","temporizarii":"temporizare","temporizarile":"temporizare","temporizarilor":"temporizare","temporizase":"temporiza","temporizasem":"temporiza","temporizasera":"temporiza","temporizaseram":"temporiza","temporizaserati":"temporiza","temporizasesi":"temporiza","temporizasi":"temporiza","temporizat":"temporiza","temporizati":"temporiza","temporizatoare":"temporizator","temporizatoarea":"temporizator","temporizatoarele":"temporizator","temporizatori":"temporizator","temporizatorii":"temporizator","temporizatorul":"temporizator","temporizau":"temporiza","temporizeaza":"temporiza","temporizez":"temporiza","temporizezi":"temporiza","tempoul":"tempo","tempoule":"tempo","tempoului":"tempo","tempouri":"tempo","tempourile":"tempo","tempourilor":"tempo","temu":"teme","temui":"teme","temura":"teme","temuram":"teme","temurati":"teme","temuse":"teme","temusem":"teme","temusera":"teme","temuseram":"teme","temuserati":"teme","temusesi":"teme","temusi":"teme","temut":"teme","temuta":["temută","temut","temuta","temut"],"temute":"temut","temutele":"temut","temuti":"temut","temutii":"temut","temutul":"temut","tenacea":"tenace","tenacele":"tenace","tenaci":"tenace","tenacii":"tenace","tenacitatea":"tenacitate","tenacitati":"tenacitate","tenacitatii":"tenacitate","tenalgia":"tenalgie","tenalgiei":"tenalgie","tenalgii":"tenalgie","tenalgiile":"tenalgie","tenalgiilor":"tenalgie","tencuia":"tencui","tencuiai":"tencui","tencuiam":"tencui","tencuiati":"tencui","tencuiau":"tencui","tencuieli":"tencuială","tencuielii":"tencuială","tencuielile":"tencuială","tencuielilor":"tencuială","tencuiesc":"tencui","tencuieste":"tencui","tencuiesti":"tencui","tencuii":"tencui","tencuim":"tencui","tencuind":"tencui","tencuira":"tencui","tencuiram":"tencui","tencuirati":"tencui","tencuirea":"tencuire","tencuiri":"tencuire","tencuirii":"tencuire","tencuirile":"tencuire","tencuirilor":"tencuire","tencuise":"tencui","tencuisem":"tencui","tencuisera":"tencui","tencuiseram":"tencui","tencuiserati":"tencui","tencuisesi":"tencui","tencuisi":"tencui","tencuit":"tencui","tencuiti":"tencui","tencuitori":"tencuitor","tencuitorii":"tencuitor","tencuitorilor":"tencuitor","tencuitorul":"tencuitor","tencuitorule":"tencuitor","tencuitorului":"tencuitor","tencuitul":"tencuit","tencuitule":"tencuit","tencuitului":"tencuit","tencuituri":"tencuitură","tencuiturii":"tencuitură","tencuiturile":"tencuitură","tencuiturilor":"tencuitură","tenculete":"tenculeț","tenculetele":"tenculeț","tenculetelor":"tenculeț","tenculetul":"tenculeț","tenculetule":"tenculeț","tenculetului":"tenculeț","tendalete":"tendaletă","tendaletei":"tendaletă","tendaletele":"tendaletă","tendaletelor":"tendaletă","tendente":"tendență","tendentei":"tendență","tendentele":"tendență","tendentelor":"tendență","tendentia":"tendenție","tendentiei":"tendenție","tendentii":"tendenție","tendentiile":"tendenție","tendentiilor":"tendenție","tendentioasa":["tendențioasă","tendențios","tendențioasa","tendențios"],"tendentioase":"tendențios","tendentioasele":"tendențios","tendentionala":["tendențională","tendențional","tendenționala","tendențional"],"tendentionale":"tendențional","tendentionalele":"tendențional","tendentionali":"tendențional","tendentionalii":"tendențional","tendentionalul":"tendențional","tendentionismul":"tendenționism","tendentionismule":"tendenționism","tendentionismului":"tendenționism","tendentionista":["tendenționistă","tendenționist","tendenționista","tendenționist"],"tendentioniste":"tendenționist","tendentionistele":"tendenționist","tendentionisti":"tendenționist","tendentionistii":"tendenționist","tendentionistul":"tendenționist","tendentiosi":"tendențios","tendentiosii":"tendențios","tendentiosul":"tendențios","tendentiozitatea":"tendențiozitate","tendentiozitati":"tendențiozitate","tendentiozitatii":"tendențiozitate","tendentiozitatile":"tendențiozitate","tendentiozitatilor":"tendențiozitate","tendere":"tender","tenderele":"tender","tenderelor":"tender","tenderul":"tender","tenderule":"tender","tenderului":"tender","tendinite":"tendinită","tendinitei":"tendinită","tendinitele":"tendinită","tendinitelor":"tendinită","tendinoasa":["tendinoasă","tendinos","tendinoasa","tendinos"],"tendinoase":"tendinos","tendinoasele":"tendinos","tendinosi":"tendinos","tendinosii":"tendinos","tendinosul":"tendinos","tendinte":"tendință","tendintei":"tendință","tendintele":"tendință","tendintelor":"tendință","tendoane":"tendon","tendoanele":"tendon","tendoanele lui ahile":"tendonul lui Ahile","tendoanelor":"tendon","tendonul":"tendon","tendonule":"tendon","tendonului":"tendon","tenebre":"tenebră","tenebrei":"tenebră","tenebrele":"tenebră","tenebrelor":"tenebră","tenebritatati":"tenebritate","tenebritatatii":"tenebritate","tenebritatatile":"tenebritate","tenebritatatilor":"tenebritate","tenebritatea":"tenebritate","tenebroasa":["tenebroasă","tenebros","tenebroasa","tenebros"],"tenebroase":"tenebros","tenebroasele":"tenebros","tenebrosi":"tenebros","tenebrosii":"tenebros","tenebrosul":"tenebros","tenebrozitatati":"tenebrozitate","tenebrozitatatii":"tenebrozitate","tenebrozitatatile":"tenebrozitate","tenebrozitatatilor":"tenebrozitate","tenebrozitatea":"tenebrozitate","tenesmea":"tenesme","tenesmi":"tenesme","tenesmii":"tenesme","tenia":"tenie","teniaze":"teniază","teniazei":"teniază","teniazele":"teniază","teniazelor":"teniază","tenicida":["tenicidă","tenicid","tenicida","tenicid"],"tenicide":"tenicid","tenicidele":"tenicid","tenicidul":"tenicid","tenicizi":"tenicid","tenicizii":"tenicid","teniei":"tenie","tenifuga":["tenifugă","tenifug","tenifuga","tenifug"],"tenifuge":"tenifug","tenifugele":"tenifug","tenifugi":"tenifug","tenifugii":"tenifug","tenifugul":"tenifug","tenii":"tenie","teniile":"tenie","teniilor":"tenie","tenisi":"tenis","tenisile":"tenis","tenisilor":"tenis","tenisistica":["tenisistică","tenisistic","tenisistica","tenisistic"],"tenisistice":"tenisistic","tenisisticele":"tenisistic","tenisistici":"tenisistic","tenisisticii":"tenisistic","tenisisticul":"tenisistic","tenismanul":"tenisman","tenismanule":"tenisman","tenismanului":"tenisman","tenismen":"tenisman","tenismena":"tenismană","tenismene":["tenismene","tenismană","tenismene","tenismenă"],"tenismenei":"tenismană","tenismenele":"tenismană","tenismenelor":"tenismană","tenismeni":["tenismeni","tenisman","tenismeni","tenismen"],"tenismenii":"tenisman","tenismenilor":"tenisman","tenisul":"tenis","tenisule":"tenis","tenisului":"tenis","tenodeze":"tenodeză","tenodezei":"tenodeză","tenodezele":"tenodeză","tenodezelor":"tenodeză","tenolize":"tenoliză","tenolizei":"tenoliză","tenolizele":"tenoliză","tenolizelor":"tenoliză","tenopatia":"tenopatie","tenopatiei":"tenopatie","tenopatii":"tenopatie","tenopatiile":"tenopatie","tenopatiilor":"tenopatie","tenorasi":"tenoraș","tenorasii":"tenoraș","tenorasilor":"tenoraș","tenorasul":"tenoraș","tenorasule":"tenoraș","tenorasului":"tenoraș","tenori":"tenor","tenorii":"tenor","tenorilor":"tenor","tenorinoul":"tenorino","tenorinoule":"tenorino","tenorinoului":"tenorino","tenorul":"tenor","tenorule":"tenor","tenorului":"tenor","tenosinovite":"tenosinovită","tenosinovitei":"tenosinovită","tenosinovitele":"tenosinovită","tenosinovitelor":"tenosinovită","tenotoame":"tenotom","tenotoamele":"tenotom","tenotoamelor":"tenotom","tenotomia":"tenotomie","tenotomiei":"tenotomie","tenotomii":"tenotomie","tenotomiile":"tenotomie","tenotomiilor":"tenotomie","tenotomul":"tenotom","tenotomule":"tenotom","tenotomului":"tenotom","tensioactiva":["tensioactivă","tensioactiv","tensioactiva","tensioactiv"],"tensioactive":"tensioactiv","tensioactivele":"tensioactiv","tensioactivi":"tensioactiv","tensioactivii":"tensioactiv","tensioactivitatea":"tensioactivitate","tensioactivitati":"tensioactivitate","tensioactivitatii":"tensioactivitate","tensioactivitatile":"tensioactivitate","tensioactivitatilor":"tensioactivitate","tensioactivul":"tensioactiv","tensiometre":"tensiometru","tensiometrele":"tensiometru","tensiometrelor":"tensiometru","tensiometrul":"tensiometru","tensiometrule":"tensiometru","tensiometrului":"tensiometru","tensionai":"tensiona","tensionala":["tensională","tensional","tensionala","tensional"],"tensionale":"tensional","tensionalele":"tensional","tensionali":"tensional","tensionalii":"tensional","tensionalul":"tensional","tensionam":["tensionăm","tensiona","tensionam","tensiona"],"tensionand":"tensiona","tensionara":"tensiona","tensionaram":"tensiona","tensionarati":"tensiona","tensionarea":"tensionare","tensionari":"tensionare","tensionarii":"tensionare","tensionarile":"tensionare","tensionarilor":"tensionare","tensionase":"tensiona","tensionasem":"tensiona","tensionasera":"tensiona","tensionaseram":"tensiona","tensionaserati":"tensiona","tensionasesi":"tensiona","tensionasi":"tensiona","tensionat":"tensiona","tensionata":["tensionată","tensionat","tensionata","tensionat"],"tensionate":"tensionat","tensionatele":"tensionat","tensionati":["tensionați","tensiona","tensionați","tensionat"],"tensionatii":"tensionat","tensionatul":"tensionat","tensionau":"tensiona","tensioneaza":"tensiona","tensionez":"tensiona","tensionezi":"tensiona","tensiunea":"tensiune","tensiunei":"tensiune","tensiunele":"tensiune","tensiunelor":"tensiune","tensiuni":"tensiune","tensiuni arteriale":"tensiune arterială","tensiuni superficiale":"tensiune superficială","tensometre":"tensometru","tensometrele":"tensometru","tensometrelor":"tensometru","tensometruul":"tensometru","tensometruule":"tensometru","tensometruului":"tensometru","tensori":"tensor","tensoriala":["tensorială","tensorial","tensoriala","tensorial"],"tensoriale":"tensorial","tensorialele":"tensorial","tensoriali":"tensorial","tensorialii":"tensorial","tensorialul":"tensorial","tensorii":"tensor","tensorilor":"tensor","tensorul":"tensor","tensorule":"tensor","tensorului":"tensor","tentaculara":["tentaculară","tentacular","tentaculara","tentacular"],"tentaculare":"tentacular","tentacularele":"tentacular","tentaculari":"tentacular","tentacularii":"tentacular","tentacularul":"tentacular","tentaculate":"tentaculat","tentaculatele":"tentaculat","tentaculatelor":"tentaculat","tentaculatul":"tentaculat","tentaculatule":"tentaculat","tentaculatului":"tentaculat","tentacule":["tentacule","tentacul","tentacule","tentaculă"],"tentaculei":"tentaculă","tentaculele":["tentaculele","tentacul","tentaculele","tentaculă"],"tentaculelor":["tentaculelor","tentacul","tentaculelor","tentaculă"],"tentaculul":"tentacul","tentaculule":"tentacul","tentaculului":"tentacul","tentai":"tenta","tentam":["tentăm","tenta","tentam","tenta"],"tentamenul":"tentamen","tentamenule":"tentamen","tentamenului":"tentamen","tentand":"tenta","tentanta":["tentantă","tentant","tentanta","tentant"],"tentante":"tentant","tentantele":"tentant","tentanti":"tentant","tentantii":"tentant","tentantul":"tentant","tentara":"tenta","tentaram":"tenta","tentarati":"tenta","tentase":"tenta","tentasem":"tenta","tentasera":"tenta","tentaseram":"tenta","tentaserati":"tenta","tentasesi":"tenta","tentasi":"tenta","tentat":"tenta","tentata":["tentată","tentat","tentata","tentat"],"tentate":"tentat","tentatele":"tentat","tentati":["tentați","tenta","tentați","tentat"],"tentatii":["tentații","tentat","tentații","tentație"],"tentatiunea":"tentațiune","tentatiuni":"tentațiune","tentatiunii":"tentațiune","tentatiunile":"tentațiune","tentatiunilor":"tentațiune","tentative":"tentativă","tentativei":"tentativă","tentativele":"tentativă","tentativelor":"tentativă","tentatul":"tentat","tentau":"tenta","tente":"tentă","tenteaza":"tenta","tentei":"tentă","tentele":"tentă","tentelor":"tentă","tentez":"tenta","tentezi":"tenta","tentrala":["țentrală","țentral","țentrala","țentral"],"tentrale":"țentral","tentralele":"țentral","tentrali":"țentral","tentralii":"țentral","tentralul":"țentral","tenuitatea":"tenuitate","tenuitati":"tenuitate","tenuitatii":"tenuitate","tenul":"ten","tenule":"ten","tenului":"ten","tenuri":"ten","tenurile":"ten","tenurilor":"ten","tenzuhul":"tenzuh","tenzuhule":"tenzuh","tenzuhului":"tenzuh","tenzuhuri":"tenzuh","tenzuhurile":"tenzuh","tenzuhurilor":"tenzuh","teobromine":"teobromină","teobrominei":"teobromină","teobrominele":"teobromină","teobrominelor":"teobromină","teocapili":"teocapil","teocapilii":"teocapil","teocapililor":"teocapil","teocapilul":"teocapil","teocapilule":"teocapil","teocapilului":"teocapil","teocentrismul":"teocentrism","teocentrismule":"teocentrism","teocentrismului":"teocentrism","teocrati":"teocrat","teocratia":"teocrație","teocratica":["teocratică","teocratic","teocratica","teocratic"],"teocratice":"teocratic","teocraticele":"teocratic","teocratici":"teocratic","teocraticii":"teocratic","teocraticul":"teocratic","teocratiei":"teocrație","teocratii":["teocrații","teocrat","teocrații","teocrație"],"teocratiile":"teocrație","teocratiilor":"teocrație","teocratilor":"teocrat","teocratul":"teocrat","teocratule":"teocrat","teocratului":"teocrat","teodiceea":"teodicee","teodiceei":"teodicee","teodolite":"teodolit","teodolitele":"teodolit","teodolitelor":"teodolit","teodolitul":"teodolit","teodolitule":"teodolit","teodolitului":"teodolit","teofania":"teofanie","teofaniei":"teofanie","teofanii":"teofanie","teofiline":"teofilină","teofilinei":"teofilină","teofilinele":"teofilină","teofilinelor":"teofilină","teogamia":"teogamie","teogamiei":"teogamie","teogamii":"teogamie","teogamiile":"teogamie","teogamiilor":"teogamie","teogonia":"teogonie","teogonica":["teogonică","teogonic","teogonica","teogonic"],"teogonice":"teogonic","teogonicele":"teogonic","teogonici":"teogonic","teogonicii":"teogonic","teogonicul":"teogonic","teogoniei":"teogonie","teogonii":"teogonie","teogoniile":"teogonie","teogoniilor":"teogonie","teologala":["teologală","teologal","teologala","teologal"],"teologale":"teologal","teologalele":"teologal","teologali":"teologal","teologalii":"teologal","teologalul":"teologal","teologi":"teolog","teologia":"teologie","teologica":["teologică","teologic","teologica","teologic"],"teologice":"teologic","teologiceasca":["teologicească","teologicesc","teologiceasca","teologicesc"],"teologicele":"teologic","teologicescul":"teologicesc","teologicesti":"teologicesc","teologicestii":"teologicesc","teologicestile":"teologicesc","teologici":"teologic","teologicii":"teologic","teologicul":"teologic","teologiei":"teologie","teologii":["teologii","teolog","teologii","teologie"],"teologilor":"teolog","teologizai":"teologiza","teologizam":["teologizăm","teologiza","teologizam","teologiza"],"teologizand":"teologiza","teologizara":"teologiza","teologizaram":"teologiza","teologizarati":"teologiza","teologizase":"teologiza","teologizasem":"teologiza","teologizasera":"teologiza","teologizaseram":"teologiza","teologizaserati":"teologiza","teologizasesi":"teologiza","teologizasi":"teologiza","teologizat":"teologiza","teologizati":"teologiza","teologizau":"teologiza","teologizeaza":"teologiza","teologizez":"teologiza","teologizezi":"teologiza","teologul":"teolog","teologule":"teolog","teologului":"teolog","teomahia":"teomahie","teomahiei":"teomahie","teomahii":"teomahie","teomantia":"teomanție","teomantiei":"teomanție","teomantii":"teomanție","teorbe":"teorbă","teorbei":"teorbă","teorbele":"teorbă","teorbelor":"teorbă","teorematica":["teorematică","teorematic","teorematica","teorematic"],"teorematice":"teorematic","teorematicele":"teorematic","teorematici":"teorematic","teorematicii":"teorematic","teorematicul":"teorematic","teoreme":"teoremă","teoremei":"teoremă","teoremele":"teoremă","teoremelor":"teoremă","teoretica":["teoretică","teoretic","teoretica","teoretic"],"teoretice":"teoretic","teoreticeasca":["teoreticească","teoreticesc","teoreticeasca","teoreticesc"],"teoreticele":"teoretic","teoreticescul":"teoreticesc","teoreticesti":"teoreticesc","teoreticestii":"teoreticesc","teoreticestile":"teoreticesc","teoretici":"teoretic","teoreticianul":"teoretician","teoreticianule":"teoretician","teoreticianului":"teoretician","teoreticiene":"teoreticiană","teoreticienei":"teoreticiană","teoreticienele":"teoreticiană","teoreticienelor":"teoreticiană","teoreticieni":"teoretician","teoreticienii":"teoretician","teoreticienilor":"teoretician","teoreticii":"teoretic","teoreticilor":"teoretic","teoreticul":"teoretic","teoreticule":"teoretic","teoreticului":"teoretic","teoretizai":"teoretiza","teoretizam":["teoretizăm","teoretiza","teoretizam","teoretiza"],"teoretizand":"teoretiza","teoretizara":"teoretiza","teoretizaram":"teoretiza","teoretizarati":"teoretiza","teoretizarea":"teoretizare","teoretizari":"teoretizare","teoretizarii":"teoretizare","teoretizarile":"teoretizare","teoretizarilor":"teoretizare","teoretizase":"teoretiza","teoretizasem":"teoretiza","teoretizasera":"teoretiza","teoretizaseram":"teoretiza","teoretizaserati":"teoretiza","teoretizasesi":"teoretiza","teoretizasi":"teoretiza","teoretizat":"teoretiza","teoretizati":"teoretiza","teoretizau":"teoretiza","teoretizeaza":"teoretiza","teoretizez":"teoretiza","teoretizezi":"teoretiza","teoria":"teorie","teorica":["teorică","teoric","teorica","teoric"],"teorice":"teoric","teoriceasca":["teoricească","teoricesc","teoriceasca","teoricesc"],"teoricele":"teoric","teoricescul":"teoricesc","teoricesti":"teoricesc","teoricestii":"teoricesc","teoricestile":"teoricesc","teorici":"teoric","teoricii":"teoric","teoricul":"teoric","teoriei":"teorie","teorii":"teorie","teoriile":"teorie","teoriilor":"teorie","teorisirea":"teorisire","teorisiri":"teorisire","teorisirii":"teorisire","teorisirile":"teorisire","teorisirilor":"teorisire","teoristi":"teorist","teoristii":"teorist","teoristilor":"teorist","teoristul":"teorist","teoristule":"teorist","teoristului":"teorist","teorizai":"teoriza","teorizam":["teorizăm","teoriza","teorizam","teoriza"],"teorizand":"teoriza","teorizara":"teoriza","teorizaram":"teoriza","teorizarati":"teoriza","teorizase":"teoriza","teorizasem":"teoriza","teorizasera":"teoriza","teorizaseram":"teoriza","teorizaserati":"teoriza","teorizasesi":"teoriza","teorizasi":"teoriza","teorizat":"teoriza","teorizati":"teoriza","teorizau":"teoriza","teorizeaza":"teoriza","teorizez":"teoriza","teorizezi":"teoriza","teosevia":"teosevie","teoseviei":"teosevie","teosevii":"teosevie","teozofi":"teozof","teozofia":"teozofie","teozofica":["teozofică","teozofic","teozofica","teozofic"],"teozofice":"teozofic","teozoficele":"teozofic","teozofici":"teozofic","teozoficii":"teozofic","teozoficul":"teozofic","teozofiei":"teozofie","teozofii":["teozofii","teozof","teozofii","teozofie"],"teozofilor":"teozof","teozoful":"teozof","teozofule":"teozof","teozofului":"teozof","tepari":"țepar","teparii":"țepar","teparilor":"țepar","teparul":"țepar","teparule":"țepar","teparului":"țepar","tepe":"teapă","tepei":"teapă","tepene":"țeapăn","tepenele":"țeapăn","tepeni":"țeapăn","tepenia":"țepenie","tepeniei":"țepenie","tepenii":["țepenii","țeapăn","țepenii","țepenie"],"tepeniile":"țepenie","tepeniilor":"țepenie","tepesi":"țepeș","tepi":["țepi","țeapă","țepi","țep"],"tepidariumul":"tepidarium","tepidariumule":"tepidarium","tepidariumului":"tepidarium","tepii":["țepii","țeapă","țepii","țep"],"tepile":"țeapă","tepilor":["țepilor","țeapă","țepilor","țep"],"teplote":"teplotă","teplotei":"teplotă","teplotele":"teplotă","teplotelor":"teplotă","tepoasa":["țepoasă","țepos","țepoasa","țepos"],"tepoase":"țepos","tepoasele":"țepos","tepoiase":"țepoiaș","tepoiasele":"țepoiaș","tepoiaselor":"țepoiaș","tepoiasul":"țepoiaș","tepoiasule":"țepoiaș","tepoiasului":"țepoiaș","teposi":"țepos","teposici":"țepoșică","teposicii":"țepoșică","teposicile":"țepoșică","teposicilor":"țepoșică","teposii":"țepos","teposul":"țepos","teptere":"țepter","tepterele":"țepter","tepterelor":"țepter","tepterul":"țepter","tepterule":"țepter","tepterului":"țepter","tepuitori":"țepuitor","tepuitorii":"țepuitor","tepuitorilor":"țepuitor","tepuitorul":"țepuitor","tepuitorule":"țepuitor","tepuitorului":"țepuitor","tepul":"țep","tepule":"țep","tepulice":"țepulică","tepulicei":"țepulică","tepulicele":"țepulică","tepulicelor":"țepulică","tepulite":"țepuliță","tepulitei":"țepuliță","tepulitele":"țepuliță","tepulitelor":"țepuliță","tepului":"țep","tepurici":"țepurică","tepuricii":"țepurică","tepuricile":"țepurică","tepuricilor":"țepurică","tepuse":"țepușă","tepusei":"țepușă","tepusele":"țepușă","tepuselor":"țepușă","tepuste":"țepușcă","tepustei":"țepușcă","tepustele":"țepușcă","tepustelor":"țepușcă","tepusti":"țepușcă","teracote":"teracotă","teracotei":"teracotă","teracotele":"teracotă","teracotelor":"teracotă","teracotisti":"teracotist","teracotistii":"teracotist","teracotistilor":"teracotist","teracotistul":"teracotist","teracotistule":"teracotist","teracotistului":"teracotist","teranblehul":"terânbleh","teranblehule":"terânbleh","teranblehului":"terânbleh","terapeute":"terapeută","terapeutei":"terapeută","terapeutele":"terapeută","terapeutelor":"terapeută","terapeuti":"terapeut","terapeutica":["terapeutică","terapeutic","terapeutica","terapeutic"],"terapeutice":"terapeutic","terapeuticele":"terapeutic","terapeutici":["terapeutici","terapeutic","terapeutici","terapeutică"],"terapeuticii":["terapeuticii","terapeutic","terapeuticii","terapeutică"],"terapeuticile":"terapeutică","terapeuticilor":"terapeutică","terapeuticul":"terapeutic","terapeutii":"terapeut","terapeutilor":"terapeut","terapeutisti":"terapeutist","terapeutistii":"terapeutist","terapeutistilor":"terapeutist","terapeutistul":"terapeutist","terapeutistule":"terapeutist","terapeutistului":"terapeutist","terapeutul":"terapeut","terapeutule":"terapeut","terapeutului":"terapeut","terapia":"terapie","terapiei":"terapie","terapii":"terapie","terapiile":"terapie","terapiilor":"terapie","terarii":"terariu","terariile":"terariu","terariilor":"terariu","terariul":"terariu","terariule":"terariu","terariului":"terariu","terasai":"terasa","terasam":["terasăm","terasa","terasam","terasa"],"terasamente":"terasament","terasamentele":"terasament","terasamentelor":"terasament","terasamentul":"terasament","terasamentule":"terasament","terasamentului":"terasament","terasand":"terasa","terasara":"terasa","terasaram":"terasa","terasarati":"terasa","terasase":"terasa","terasasem":"terasa","terasasera":"terasa","terasaseram":"terasa","terasaserati":"terasa","terasasesi":"terasa","terasasi":"terasa","terasat":"terasa","terasati":"terasa","terasau":"terasa","terase":"terasă","teraseaza":"terasa","terasez":"terasa","terasezi":"terasa","terasieri":"terasier","terasierii":"terasier","terasierilor":"terasier","terasierul":"terasier","terasierule":"terasier","terasierului":"terasier","terasul":"teras","terasule":"teras","terasului":"teras","teratismul":"teratism","teratismule":"teratism","teratismului":"teratism","teratogena":["teratogenă","teratogen","teratogena","teratogen"],"teratogene":"teratogen","teratogenele":"teratogen","teratogeneze":"teratogeneză","teratogenezei":"teratogeneză","teratogenezele":"teratogeneză","teratogenezelor":"teratogeneză","teratogeni":"teratogen","teratogenii":"teratogen","teratogenul":"teratogen","teratologi":"teratolog","teratologia":"teratologie","teratologica":["teratologică","teratologic","teratologica","teratologic"],"teratologice":"teratologic","teratologicele":"teratologic","teratologici":"teratologic","teratologicii":"teratologic","teratologicul":"teratologic","teratologiei":"teratologie","teratologii":["teratologii","teratolog","teratologii","teratologie"],"teratologilor":"teratolog","teratologul":"teratolog","teratologule":"teratolog","teratologului":"teratolog","teratomul":"teratom","teratomule":"teratom","teratomului":"teratom","teratomuri":"teratom","teratomurile":"teratom","teratomurilor":"teratom","terbentine":"terbentină","terbentinei":"terbentină","terbentinele":"terbentină","terbentinelor":"terbentină","terbiul":"terbiu","terbiule":"terbiu","terbiului":"terbiu","terciuia":"terciui","terciuiai":"terciui","terciuiam":"terciui","terciuiati":"terciui","terciuiau":"terciui","terciuiele":"terciuială","terciuielei":"terciuială","terciuielele":"terciuială","terciuielelor":"terciuială","terciuieli":"terciuială","terciuiesc":"terciui","terciuieste":"terciui","terciuiesti":"terciui","terciuii":"terciui","terciuim":"terciui","terciuind":"terciui","terciuira":"terciui","terciuiram":"terciui","terciuirati":"terciui","terciuirea":"terciuire","terciuiri":"terciuire","terciuirii":"terciuire","terciuirile":"terciuire","terciuirilor":"terciuire","terciuise":"terciui","terciuisem":"terciui","terciuisera":"terciui","terciuiseram":"terciui","terciuiserati":"terciui","terciuisesi":"terciui","terciuisi":"terciui","terciuit":"terciui","terciuita":["terciuită","terciuit","terciuita","terciuit"],"terciuite":"terciuit","terciuitele":"terciuit","terciuiti":["terciuiți","terciui","terciuiți","terciuit"],"terciuitii":"terciuit","terciuitul":"terciuit","terciul":"terci","terciule":"terci","terciului":"terci","terciuri":"terci","terciuri de ovaz":"terci de ovăz","terciurile":"terci","terciurilor":"terci","terebentine":"terebentină","terebentinei":"terebentină","terebentinele":"terebentină","terebentinelor":"terebentină","terebinti":"terebint","terebintii":"terebint","terebintilor":"terebint","terebintul":"terebint","terebintule":"terebint","terebintului":"terebint","terebranta":["terebrantă","terebrant","terebranta","terebrant"],"terebrante":"terebrant","terebrantele":"terebrant","terebranti":"terebrant","terebrantii":"terebrant","terebrantul":"terebrant","terebratia":"terebrație","terebratiei":"terebrație","terebratii":"terebrație","terebratiile":"terebrație","terebratiilor":"terebrație","terebratule":"terebratulă","terebratulei":"terebratulă","terebratulele":"terebratulă","terebratulelor":"terebratulă","teremonia":"țeremonie","teremoniei":"țeremonie","teremonii":"țeremonie","teremoniile":"țeremonie","teremoniilor":"țeremonie","terenul":"teren","terenule":"teren","terenului":"teren","terenuri":"teren","terenurile":"teren","terenurilor":"teren","terestra":["terestră","terestru","terestra","terestru"],"terestre":"terestru","terestrele":"terestru","terestri":"terestru","terestrii":"terestru","terestritatea":"terestritate","terestritati":"terestritate","terestritatii":"terestritate","terestrul":"terestru","teretine":"teretină","teretinei":"teretină","terezia":"terezie","tereziei":"terezie","terezii":"terezie","tereziile":"terezie","tereziilor":"terezie","terfe":"tearfă","terfei":"tearfă","terfele":"tearfă","terfelea":"terfeli","terfeleai":"terfeli","terfeleam":"terfeli","terfeleati":"terfeli","terfeleau":"terfeli","terfelegoasa":["terfelegoasă","terfelegos","terfelegoasa","terfelegos"],"terfelegoase":"terfelegos","terfelegoasele":"terfelegos","terfelegosi":"terfelegos","terfelegosii":"terfelegos","terfelegosul":"terfelegos","terfelele":"terfeleală","terfelelei":"terfeleală","terfelelele":"terfeleală","terfelelelor":"terfeleală","terfeleli":"terfeleală","terfelesc":"terfeli","terfeleste":"terfeli","terfelesti":"terfeli","terfelii":"terfeli","terfelim":"terfeli","terfelind":"terfeli","terfelira":"terfeli","terfeliram":"terfeli","terfelirati":"terfeli","terfelirea":"terfelire","terfeliri":"terfelire","terfelirii":"terfelire","terfelirile":"terfelire","terfelirilor":"terfelire","terfelise":"terfeli","terfelisem":"terfeli","terfelisera":"terfeli","terfeliseram":"terfeli","terfeliserati":"terfeli","terfelisesi":"terfeli","terfelisi":"terfeli","terfelit":"terfeli","terfelita":["terfelită","terfelit","terfelita","terfelit"],"terfelite":"terfelit","terfelitele":"terfelit","terfeliti":["terfeliți","terfeli","terfeliți","terfelit"],"terfelitii":"terfelit","terfelitul":"terfelit","terfeloage":["terfeloage","terfeloagă","terfeloage","terfelog"],"terfeloagei":"terfeloagă","terfeloagele":["terfeloagele","terfeloagă","terfeloagele","terfelog"],"terfeloagelor":["terfeloagelor","terfeloagă","terfeloagelor","terfelog"],"terfelogul":"terfelog","terfelogule":"terfelog","terfelogului":"terfelog","terfelor":"tearfă","tergalul":"tergal","tergalule":"tergal","tergalului":"tergal","tergaluri":"tergal","tergalurile":"tergal","tergalurilor":"tergal","tergimani":"tergiman","tergimanii":"tergiman","tergimanilor":"tergiman","tergimanlacul":"tergimanlâc","tergimanlacule":"tergimanlâc","tergimanlacului":"tergimanlâc","tergimanul":"tergiman","tergimanule":"tergiman","tergimanului":"tergiman","tergimele":"tergimea","tergimelei":"tergimea","tergimelele":"tergimea","tergimelelor":"tergimea","tergiversai":"tergiversa","tergiversam":["tergiversăm","tergiversa","tergiversam","tergiversa"],"tergiversand":"tergiversa","tergiversara":"tergiversa","tergiversaram":"tergiversa","tergiversarati":"tergiversa","tergiversarea":"tergiversare","tergiversari":"tergiversare","tergiversarii":"tergiversare","tergiversarile":"tergiversare","tergiversarilor":"tergiversare","tergiversase":"tergiversa","tergiversasem":"tergiversa","tergiversasera":"tergiversa","tergiversaseram":"tergiversa","tergiversaserati":"tergiversa","tergiversasesi":"tergiversa","tergiversasi":"tergiversa","tergiversat":"tergiversa","tergiversati":"tergiversa","tergiversatia":"tergiversație","tergiversatiei":"tergiversație","tergiversatii":"tergiversație","tergiversatiile":"tergiversație","tergiversatiilor":"tergiversație","tergiversatiunea":"tergiversațiune","tergiversatiuni":"tergiversațiune","tergiversatiunii":"tergiversațiune","tergiversatiunile":"tergiversațiune","tergiversatiunilor":"tergiversațiune","tergiversau":"tergiversa","tergiverseaza":"tergiversa","tergiversez":"tergiversa","tergiversezi":"tergiversa","teri":["teri","teară","țeri","țeară"],"teriacul":"teriac","teriacule":"teriac","teriacului":"teriac","teriacuri":"teriac","teriacurile":"teriac","teriacurilor":"teriac","teribila":["teribilă","teribil","teribila","teribil"],"teribile":"teribil","teribilele":"teribil","teribili":"teribil","teribilii":"teribil","teribilisme":"teribilism","teribilismele":"teribilism","teribilismelor":"teribilism","teribilismul":"teribilism","teribilismule":"teribilism","teribilismului":"teribilism","teribilista":["teribilistă","teribilist","teribilista","teribilist"],"teribiliste":["teribiliste","teribilist","teribiliste","teribilistă"],"teribilistei":"teribilistă","teribilistele":["teribilistele","teribilist","teribilistele","teribilistă"],"teribilistelor":"teribilistă","teribilisti":"teribilist","teribilistii":"teribilist","teribilistilor":"teribilist","teribilistul":"teribilist","teribilistule":"teribilist","teribilistului":"teribilist","teribilitatea":"teribilitate","teribilitati":"teribilitate","teribilitatii":"teribilitate","teribilitatile":"teribilitate","teribilitatilor":"teribilitate","teribilul":"teribil","tericola":["tericolă","tericol","tericola","tericol"],"tericole":"tericol","tericolele":"tericol","tericoli":"tericol","tericolii":"tericol","tericolul":"tericol","terieri":"terier","terierii":"terier","terierilor":"terier","terierul":"terier","terierule":"terier","terierului":"terier","terifiai":"terifia","terifiam":"terifia","terifianta":["terifiantă","terifiant","terifianta","terifiant"],"terifiante":"terifiant","terifiantele":"terifiant","terifianti":"terifiant","terifiantii":"terifiant","terifiantul":"terifiant","terifiara":"terifia","terifiaram":"terifia","terifiarati":"terifia","terifiase":"terifia","terifiasem":"terifia","terifiasera":"terifia","terifiaseram":"terifia","terifiaserati":"terifia","terifiasesi":"terifia","terifiasi":"terifia","terifiat":"terifia","terifiati":"terifia","terifiau":"terifia","terifiaza":"terifia","terifica":["terifică","terific","terifica","terific"],"terifice":"terific","terificele":"terific","terifici":"terific","terificii":"terific","terificul":"terific","terifie":"terifia","terifiem":"terifia","terifii":"terifia","terifiind":"terifia","terigena":["terigenă","terigen","terigena","terigen"],"terigene":"terigen","terigenele":"terigen","terigeni":"terigen","terigenii":"terigen","terigenul":"terigen","terii":["terii","teară","țerii","țeară"],"terile":["terile","teară","țerile","țeară"],"terilenae":"terilenă","terilenaele":"terilenă","terilenaelor":"terilenă","terilenaul":"terilenă","terilenaule":"terilenă","terilenaului":"terilenă","terilenul":"terilen","terilenule":"terilen","terilenului":"terilen","terilor":["terilor","teară","țerilor","țeară"],"terine":["țerine","țearină","terine","terină"],"terinei":"terină","terinele":"terină","terinelor":"terină","teriomorfismul":"teriomorfism","teriomorfismule":"teriomorfism","teriomorfismului":"teriomorfism","teritoriala":["teritorială","teritorial","teritoriala","teritorial"],"teritoriale":"teritorial","teritorialele":"teritorial","teritoriali":"teritorial","teritorialii":"teritorial","teritorialitatea":"teritorialitate","teritorialitati":"teritorialitate","teritorialitatii":"teritorialitate","teritorializarea":"teritorializare","teritorializari":"teritorializare","teritorializarii":"teritorializare","teritorializarile":"teritorializare","teritorializarilor":"teritorializare","teritorialul":"teritorial","teritorii":"teritoriu","teritoriile":"teritoriu","teritoriilor":"teritoriu","teritoriul":"teritoriu","teritoriule":"teritoriu","teritoriului":"teritoriu","termala":["termală","termal","termala","termal"],"termale":"termal","termalele":"termal","termali":"termal","termalii":"termal","termalismul":"termalism","termalismule":"termalism","termalismului":"termalism","termalitatea":"termalitate","termalitati":"termalitate","termalitatii":"termalitate","termalul":"termal","termele":"terme","termelor":"terme","termene":"termen","termenele":"termen","termenelor":"termen","termeni":"termen","termeni generici":"termen generic","termeni tehnici":"termen tehnic","termenii":"termen","termenilor":"termen","termenul":"termen","termenule":"termen","termenului":"termen","termenvoxul":"termenvox","termenvoxule":"termenvox","termenvoxului":"termenvox","termenvoxuri":"termenvox","termenvoxurile":"termenvox","termenvoxurilor":"termenvox","termia":"termie","termica":["termică","termic","termica","termic"],"termice":"termic","termicele":"termic","termici":"termic","termicianul":"termician","termicianule":"termician","termicianului":"termician","termicieni":"termician","termicienii":"termician","termicienilor":"termician","termicii":"termic","termicul":"termic","termidorianul":"termidorian","termidorianule":"termidorian","termidorianului":"termidorian","termidoriene":"termidoriană","termidorienei":"termidoriană","termidorienele":"termidoriană","termidorienelor":"termidoriană","termidorieni":"termidorian","termidorienii":"termidorian","termidorienilor":"termidorian","termidorul":"termidor","termidorule":"termidor","termidorului":"termidor","termiei":"termie","termificarea":"termificare","termificari":"termificare","termificarii":"termificare","termificarile":"termificare","termificarilor":"termificare","termii":"termie","termiile":"termie","termiilor":"termie","termin":["termin","termen","termin","termina"],"terminabila":["terminabilă","terminabil","terminabila","terminabil"],"terminabile":"terminabil","terminabilele":"terminabil","terminabili":"terminabil","terminabilii":"terminabil","terminabilul":"terminabil","terminai":"termina","terminala":["terminală","terminal","terminala","terminal"],"terminale":"terminal","terminalele":"terminal","terminali":"terminal","terminalii":"terminal","terminalul":"terminal","terminam":["terminăm","termina","terminam","termina"],"terminand":"termina","terminara":"termina","terminaram":"termina","terminarati":"termina","terminarea":"terminare","terminari":"terminare","terminarii":"terminare","terminarile":"terminare","terminarilor":"terminare","terminase":"termina","terminasem":"termina","terminasera":"termina","terminaseram":"termina","terminaserati":"termina","terminasesi":"termina","terminasi":"termina","terminat":"termina","terminat in coada de peste":"termina în coadă de pește","terminata":["terminată","terminat","terminata","terminat"],"terminate":"terminat","terminatele":"terminat","terminati":["terminați","termina","terminați","terminat"],"terminatia":"terminație","terminatiei":"terminație","terminatii":["terminații","terminat","terminații","terminație"],"terminatiile":"terminație","terminatiilor":"terminație","terminatilor":"terminat","terminatiunea":"terminațiune","terminatiuni":"terminațiune","terminatiunii":"terminațiune","terminatiunile":"terminațiune","terminatiunilor":"terminațiune","terminatul":"terminat","terminatule":"terminat","terminatului":"terminat","terminau":"termina","termine":"termina","termineaza":"termina","termineze":"termina","termini":"termina","terminologi":"terminolog","terminologia":"terminologie","terminologica":["terminologică","terminologic","terminologica","terminologic"],"terminologice":"terminologic","terminologicele":"terminologic","terminologici":"terminologic","terminologicii":"terminologic","terminologicul":"terminologic","terminologiei":"terminologie","terminologii":["terminologii","terminolog","terminologii","terminologie"],"terminologiile":"terminologie","terminologiilor":"terminologie","terminologilor":"terminolog","terminologul":"terminolog","terminologule":"terminolog","terminologului":"terminolog","terminusul":"terminus","terminusule":"terminus","terminusului":"terminus","termioni":"termion","termionice":"termionică","termionicei":"termionică","termionii":"termion","termionilor":"termion","termionul":"termion","termionule":"termion","termionului":"termion","termistante":"termistanță","termistantei":"termistanță","termistantele":"termistanță","termistantelor":"termistanță","termisti":"termist","termistii":"termist","termistilor":"termist","termistori":"termistor","termistorii":"termistor","termistorilor":"termistor","termistorul":"termistor","termistorule":"termistor","termistorului":"termistor","termistul":"termist","termistule":"termist","termistului":"termist","termite":"termită","termitei":"termită","termitele":"termită","termitelor":"termită","termitiere":"termitieră","termitierei":"termitieră","termitierele":"termitieră","termitierelor":"termitieră","termitul":"termit","termitule":"termit","termitului":"termit","termituri":"termit","termiturile":"termit","termiturilor":"termit","termoacustica":["termoacustică","termoacustic","termoacustica","termoacustic"],"termoacustice":"termoacustic","termoacusticele":"termoacustic","termoacustici":["termoacustici","termoacustic","termoacustici","termoacustică"],"termoacusticii":["termoacusticii","termoacustic","termoacusticii","termoacustică"],"termoacusticile":"termoacustică","termoacusticilor":"termoacustică","termoacusticul":"termoacustic","termoanemometre":"termoanemometru","termoanemometrele":"termoanemometru","termoanemometrelor":"termoanemometru","termoanemometrul":"termoanemometru","termoanemometrule":"termoanemometru","termoanemometrului":"termoanemometru","termoaprinderea":"termoaprindere","termoaprinderi":"termoaprindere","termoaprinderii":"termoaprindere","termobarografe":"termobarograf","termobarografele":"termobarograf","termobarografelor":"termobarograf","termobarograful":"termobarograf","termobarografule":"termobarograf","termobarografului":"termobarograf","termobarometre":"termobarometru","termobarometrele":"termobarometru","termobarometrelor":"termobarometru","termobarometrul":"termobarometru","termobarometrule":"termobarometru","termobarometrului":"termobarometru","termocarstul":"termocarst","termocarstule":"termocarst","termocarstului":"termocarst","termocarsturi":"termocarst","termocarsturile":"termocarst","termocarsturilor":"termocarst","termocautere":"termocauter","termocauterele":"termocauter","termocauterelor":"termocauter","termocauterul":"termocauter","termocauterule":"termocauter","termocauterului":"termocauter","termocentrale":"termocentrală","termocentralei":"termocentrală","termocentralele":"termocentrală","termocentralelor":"termocentrală","termochimia":"termochimie","termochimica":["termochimică","termochimic","termochimica","termochimic"],"termochimice":"termochimic","termochimicele":"termochimic","termochimici":"termochimic","termochimicii":"termochimic","termochimicul":"termochimic","termochimiei":"termochimie","termochimii":"termochimie","termocinetice":"termocinetică","termocineticei":"termocinetică","termocoagularea":"termocoagulare","termocoagulari":["termocoagulări","termocoagulare","termocoagulari","termocoagulare"],"termocoagularii":"termocoagulare","termocoagularile":"termocoagulare","termocoagularilor":"termocoagulare","termocompresoare":"termocompresor","termocompresoarele":"termocompresor","termocompresoarelor":"termocompresor","termocompresorul":"termocompresor","termocompresorule":"termocompresor","termocompresorului":"termocompresor","termoconductia":"termoconducție","termoconductibilitatea":"termoconductibilitate","termoconductibilitati":"termoconductibilitate","termoconductibilitatii":"termoconductibilitate","termoconductibilitatile":"termoconductibilitate","termoconductibilitatilor":"termoconductibilitate","termoconductiei":"termoconducție","termoconductii":"termoconducție","termoconductiile":"termoconducție","termoconductiilor":"termoconducție","termoconvectia":"termoconvecție","termoconvectiei":"termoconvecție","termoconvectii":"termoconvecție","termoconvectiile":"termoconvecție","termoconvectiilor":"termoconvecție","termocuplul":"termocuplu","termocuplule":"termocuplu","termocuplului":"termocuplu","termocupluri":"termocuplu","termocuplurile":"termocuplu","termocuplurilor":"termocuplu","termodifuzia":"termodifuzie","termodifuziei":"termodifuzie","termodifuzii":"termodifuzie","termodifuziile":"termodifuzie","termodifuziilor":"termodifuzie","termodifuziunea":"termodifuziune","termodifuziuni":"termodifuziune","termodifuziunii":"termodifuziune","termodifuziunile":"termodifuziune","termodifuziunilor":"termodifuziune","termodinamica":["termodinamică","termodinamic","termodinamica","termodinamic"],"termodinamice":"termodinamic","termodinamicele":"termodinamic","termodinamici":["termodinamici","termodinamic","termodinamici","termodinamică"],"termodinamicii":["termodinamicii","termodinamic","termodinamicii","termodinamică"],"termodinamicile":"termodinamică","termodinamicilor":"termodinamică","termodinamicul":"termodinamic","termodispersia":"termodispersie","termodispersiei":"termodispersie","termodispersii":"termodispersie","termoelasticitatea":"termoelasticitate","termoelasticitati":"termoelasticitate","termoelasticitatii":"termoelasticitate","termoelectrica":["termoelectrică","termoelectric","termoelectrica","termoelectric"],"termoelectrice":"termoelectric","termoelectricele":"termoelectric","termoelectrici":"termoelectric","termoelectricii":"termoelectric","termoelectricitatea":"termoelectricitate","termoelectricitati":"termoelectricitate","termoelectricitatii":"termoelectricitate","termoelectricitatile":"termoelectricitate","termoelectricitatilor":"termoelectricitate","termoelectricul":"termoelectric","termoelemente":"termoelement","termoelementele":"termoelement","termoelementelor":"termoelement","termoelementul":"termoelement","termoelementule":"termoelement","termoelementului":"termoelement","termoenergetica":["termoenergetică","termoenergetic","termoenergetica","termoenergetic"],"termoenergetice":"termoenergetic","termoenergeticele":"termoenergetic","termoenergetici":"termoenergetic","termoenergeticiene":"termoenergeticiană","termoenergeticienei":"termoenergeticiană","termoenergeticienele":"termoenergeticiană","termoenergeticienelor":"termoenergeticiană","termoenergeticii":"termoenergetic","termoenergeticul":"termoenergetic","termofila":["termofilă","termofil","termofila","termofil"],"termofile":"termofil","termofilele":"termofil","termofili":"termofil","termofilii":"termofil","termofilul":"termofil","termofoane":"termofon","termofoanele":"termofon","termofoanelor":"termofon","termofoare":"termofor","termofoarele":"termofor","termofoarelor":"termofor","termofobia":"termofobie","termofobiei":"termofobie","termofobii":"termofobie","termofobiile":"termofobie","termofobiilor":"termofobie","termofonul":"termofon","termofonule":"termofon","termofonului":"termofon","termoforul":"termofor","termoforule":"termofor","termoforului":"termofor","termofosfati":"termofosfat","termofosfatii":"termofosfat","termofosfatilor":"termofosfat","termofosfatul":"termofosfat","termofosfatule":"termofosfat","termofosfatului":"termofosfat","termogeneze":"termogeneză","termogenezei":"termogeneză","termogenezele":"termogeneză","termogenezelor":"termogeneză","termogeni":"termogen","termogenile":"termogen","termogenilor":"termogen","termogenul":"termogen","termogenule":"termogen","termogenului":"termogen","termografe":"termograf","termografele":"termograf","termografelor":"termograf","termografia":"termografie","termografica":["termografică","termografic","termografica","termografic"],"termografice":"termografic","termograficele":"termografic","termografici":"termografic","termograficii":"termografic","termograficul":"termografic","termografiei":"termografie","termografii":"termografie","termograful":"termograf","termografule":"termograf","termografului":"termograf","termograme":"termogramă","termogramei":"termogramă","termogramele":"termogramă","termogramelor":"termogramă","termoizolai":"termoizola","termoizolam":["termoizolăm","termoizola","termoizolam","termoizola"],"termoizoland":"termoizola","termoizolara":"termoizola","termoizolaram":"termoizola","termoizolarati":"termoizola","termoizolarea":"termoizolare","termoizolari":["termoizolări","termoizolare","termoizolari","termoizolare"],"termoizolarii":"termoizolare","termoizolarile":"termoizolare","termoizolarilor":"termoizolare","termoizolase":"termoizola","termoizolasem":"termoizola","termoizolasera":"termoizola","termoizolaseram":"termoizola","termoizolaserati":"termoizola","termoizolasesi":"termoizola","termoizolasi":"termoizola","termoizolat":"termoizola","termoizolata":["termoizolată","termoizolat","termoizolata","termoizolat"],"termoizolate":"termoizolat","termoizolatele":"termoizolat","termoizolati":["termoizolați","termoizola","termoizolați","termoizolat"],"termoizolatia":"termoizolație","termoizolatiei":"termoizolație","termoizolatii":["termoizolații","termoizolat","termoizolații","termoizolație"],"termoizolatiile":"termoizolație","termoizolatiilor":"termoizolație","termoizolatoare":"termoizolator","termoizolatoarea":"termoizolator","termoizolatoarele":"termoizolator","termoizolatori":"termoizolator","termoizolatorii":"termoizolator","termoizolatorul":"termoizolator","termoizolatul":"termoizolat","termoizolau":"termoizola","termoizoleaza":"termoizola","termoizolez":"termoizola","termoizolezi":"termoizola","termolabila":["termolabilă","termolabil","termolabila","termolabil"],"termolabile":"termolabil","termolabilele":"termolabil","termolabili":"termolabil","termolabilii":"termolabil","termolabilul":"termolabil","termolize":"termoliză","termolizei":"termoliză","termolizele":"termoliză","termolizelor":"termoliză","termologia":"termologie","termologiei":"termologie","termologii":"termologie","termoluminescenta":["termoluminescentă","termoluminescent","termoluminescenta","termoluminescent"],"termoluminescente":["termoluminescente","termoluminescent","termoluminescențe","termoluminescență"],"termoluminescentei":"termoluminescență","termoluminescentele":["termoluminescentele","termoluminescent","termoluminescențele","termoluminescență"],"termoluminescentelor":"termoluminescență","termoluminescenti":"termoluminescent","termoluminescentii":"termoluminescent","termoluminescentul":"termoluminescent","termoluminiscenta":["termoluminiscentă","termoluminiscent","termoluminiscenta","termoluminiscent"],"termoluminiscente":["termoluminiscente","termoluminiscent","termoluminiscențe","termoluminiscență"],"termoluminiscentei":"termoluminiscență","termoluminiscentele":["termoluminiscentele","termoluminiscent","termoluminiscențele","termoluminiscență"],"termoluminiscentelor":"termoluminiscență","termoluminiscenti":"termoluminiscent","termoluminiscentii":"termoluminiscent","termoluminiscentul":"termoluminiscent","termomanometre":"termomanometru","termomanometrele":"termomanometru","termomanometrelor":"termomanometru","termomanometruul":"termomanometru","termomanometruule":"termomanometru","termomanometruului":"termomanometru","termometre":"termometru","termometrele":"termometru","termometrelor":"termometru","termometria":"termometrie","termometrica":["termometrică","termometric","termometrica","termometric"],"termometrice":"termometric","termometricele":"termometric","termometrici":"termometric","termometricii":"termometric","termometricul":"termometric","termometriei":"termometrie","termometrii":"termometrie","termometrul":"termometru","termometrule":"termometru","termometrului":"termometru","termonastia":"termonastie","termonastiei":"termonastie","termonastii":"termonastie","termonastiile":"termonastie","termonastiilor":"termonastie","termonucleara":["termonucleară","termonuclear","termonucleara","termonuclear"],"termonucleare":"termonuclear","termonuclearele":"termonuclear","termonucleari":"termonuclear","termonuclearii":"termonuclear","termonuclearul":"termonuclear","termopane":"termopan","termopanele":"termopan","termopanelor":"termopan","termopanul":"termopan","termopanule":"termopan","termopanului":"termopan","termopauze":"termopauză","termopauzei":"termopauză","termopile":"termopilă","termopilei":"termopilă","termopilele":"termopilă","termopilelor":"termopilă","termoplaste":"termoplast","termoplastele":"termoplast","termoplastelor":"termoplast","termoplastica":["termoplastică","termoplastic","termoplastica","termoplastic"],"termoplastice":"termoplastic","termoplasticele":"termoplastic","termoplastici":"termoplastic","termoplasticii":"termoplastic","termoplasticul":"termoplastic","termoplastul":"termoplast","termoplastule":"termoplast","termoplastului":"termoplast","termopropulsarea":"termopropulsare","termopropulsari":"termopropulsare","termopropulsarii":"termopropulsare","termopropulsarile":"termopropulsare","termopropulsarilor":"termopropulsare","termoprotectia":"termoprotecție","termoprotectiei":"termoprotecție","termoprotectii":"termoprotecție","termoprotectiile":"termoprotecție","termoprotectiilor":"termoprotecție","termoreceptori":"termoreceptor","termoreceptorii":"termoreceptor","termoreceptorilor":"termoreceptor","termoreceptorul":"termoreceptor","termoreceptorule":"termoreceptor","termoreceptorului":"termoreceptor","termoreglai":"termoregla","termoreglam":["termoreglăm","termoregla","termoreglam","termoregla"],"termoregland":"termoregla","termoreglara":"termoregla","termoreglaram":"termoregla","termoreglarati":"termoregla","termoreglarea":"termoreglare","termoreglari":["termoreglări","termoreglare","termoreglari","termoreglare"],"termoreglarii":"termoreglare","termoreglarile":"termoreglare","termoreglarilor":"termoreglare","termoreglase":"termoregla","termoreglasem":"termoregla","termoreglasera":"termoregla","termoreglaseram":"termoregla","termoreglaserati":"termoregla","termoreglasesi":"termoregla","termoreglasi":"termoregla","termoreglat":"termoregla","termoreglati":"termoregla","termoreglau":"termoregla","termoregleaza":"termoregla","termoreglez":"termoregla","termoreglezi":"termoregla","termoregulatoare":"termoregulator","termoregulatoarele":"termoregulator","termoregulatoarelor":"termoregulator","termoregulatorul":"termoregulator","termoregulatorule":"termoregulator","termoregulatorului":"termoregulator","termorezistenta":["termorezistentă","termorezistent","termorezistenta","termorezistent"],"termorezistente":["termorezistente","termorezistent","termorezistențe","termorezistență"],"termorezistentei":"termorezistență","termorezistentele":["termorezistentele","termorezistent","termorezistențele","termorezistență"]};
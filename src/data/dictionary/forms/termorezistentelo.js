@@ -0,0 +1 @@
+export default {"termorezistentelor":"termorezistență","termorezistenti":"termorezistent","termorezistentii":"termorezistent","termorezistentul":"termorezistent","termoscoape":"termoscop","termoscoapele":"termoscop","termoscoapelor":"termoscop","termoscopia":"termoscopie","termoscopiei":"termoscopie","termoscopii":"termoscopie","termoscopul":"termoscop","termoscopule":"termoscop","termoscopului":"termoscop","termose":"termos","termosele":"termos","termoselor":"termos","termosensibila":["termosensibilă","termosensibil","termosensibila","termosensibil"],"termosensibile":"termosensibil","termosensibilele":"termosensibil","termosensibili":"termosensibil","termosensibilii":"termosensibil","termosensibilitatea":"termosensibilitate","termosensibilitati":"termosensibilitate","termosensibilitatii":"termosensibilitate","termosensibilitatile":"termosensibilitate","termosensibilitatilor":"termosensibilitate","termosensibilul":"termosensibil","termosfere":"termosferă","termosferei":"termosferă","termosifoane":"termosifon","termosifoanele":"termosifon","termosifoanelor":"termosifon","termosifonul":"termosifon","termosifonule":"termosifon","termosifonului":"termosifon","termostabila":["termostabilă","termostabil","termostabila","termostabil"],"termostabile":"termostabil","termostabilele":"termostabil","termostabili":"termostabil","termostabilii":"termostabil","termostabilitatea":"termostabilitate","termostabilitati":"termostabilitate","termostabilitatii":"termostabilitate","termostabilitatile":"termostabilitate","termostabilitatilor":"termostabilitate","termostabilul":"termostabil","termostate":"termostat","termostatele":"termostat","termostatelor":"termostat","termostatica":["termostatică","termostatic","termostatica","termostatic"],"termostatice":"termostatic","termostaticele":"termostatic","termostatici":"termostatic","termostaticii":"termostatic","termostaticul":"termostatic","termostatul":"termostat","termostatule":"termostat","termostatului":"termostat","termosterilizarea":"termosterilizare","termosterilizari":["termosterilizări","termosterilizare","termosterilizari","termosterilizare"],"termosterilizarii":"termosterilizare","termosterilizarile":"termosterilizare","termosterilizarilor":"termosterilizare","termosudabila":["termosudabilă","termosudabil","termosudabila","termosudabil"],"termosudabile":"termosudabil","termosudabilele":"termosudabil","termosudabili":"termosudabil","termosudabilii":"termosudabil","termosudabilul":"termosudabil","termosul":"termos","termosule":"termos","termosului":"termos","termosuri":"termos","termotactismul":"termotactism","termotactismule":"termotactism","termotactismului":"termotactism","termotehnice":"termotehnică","termotehnicei":"termotehnică","termoterapia":"termoterapie","termoterapiei":"termoterapie","termoterapii":"termoterapie","termotropisme":"termotropism","termotropismele":"termotropism","termotropismelor":"termotropism","termotropismul":"termotropism","termotropismule":"termotropism","termotropismului":"termotropism","terna":["ternă","tern","terna","tern"],"ternara":["ternară","ternar","ternara","ternar"],"ternare":"ternar","ternarele":"ternar","ternari":"ternar","ternarii":"ternar","ternarul":"ternar","terne":["terne","tern","țerne","țernă"],"ternei":"țernă","ternele":["ternele","tern","țernele","țernă"],"ternelor":"țernă","terni":"tern","ternii":"tern","ternocop":"târnăcop","ternul":"tern","teroarea":"teroare","teroari":"teroare","teroarii":"teroare","teroarile":"teroare","teroarilor":"teroare","terofite":"terofită","terofitei":"terofită","terofitele":"terofită","terofitelor":"terofită","terori":"teroare","terori albe":"teroare albă","terorismul":"terorism","terorismule":"terorism","terorismului":"terorism","teroriste":"teroristă","teroristi":"terorist","teroristi sinucigasi":"terorist sinucigaș","teroristica":["teroristică","teroristic","teroristica","teroristic"],"teroristice":"teroristic","teroristicele":"teroristic","teroristici":"teroristic","teroristicii":"teroristic","teroristicul":"teroristic","teroristii":"terorist","teroristilor":"terorist","teroristul":"terorist","teroristule":"terorist","teroristului":"terorist","terorizai":"teroriza","terorizam":["terorizăm","teroriza","terorizam","teroriza"],"terorizand":"teroriza","terorizara":"teroriza","terorizaram":"teroriza","terorizarati":"teroriza","terorizarea":"terorizare","terorizari":"terorizare","terorizarii":"terorizare","terorizarile":"terorizare","terorizarilor":"terorizare","terorizase":"teroriza","terorizasem":"teroriza","terorizasera":"teroriza","terorizaseram":"teroriza","terorizaserati":"teroriza","terorizasesi":"teroriza","terorizasi":"teroriza","terorizat":"teroriza","terorizata":["terorizată","terorizat","terorizata","terorizat"],"terorizate":"terorizat","terorizatele":"terorizat","terorizati":["terorizați","teroriza","terorizați","terorizat"],"terorizatii":"terorizat","terorizatul":"terorizat","terorizau":"teroriza","terorizeaza":"teroriza","terorizez":"teroriza","terorizezi":"teroriza","terpene":"terpenă","terpenei":"terpenă","terpenele":"terpenă","terpenelor":"terpenă","terpentine":["terpentine","terpentin","terpentine","terpentină"],"terpentinei":"terpentină","terpentinele":["terpentinele","terpentin","terpentinele","terpentină"],"terpentinelor":["terpentinelor","terpentin","terpentinelor","terpentină"],"terpentinul":"terpentin","terpentinule":"terpentin","terpentinului":"terpentin","terpine":"terpină","terpinei":"terpină","terpinele":"terpină","terpinelor":"terpină","terpinolul":"terpinol","terpinolule":"terpinol","terpinolului":"terpinol","terraformingul":"terraforming","terraformingule":"terraforming","terraformingului":"terraforming","tersanale":"tersana","tersanalei":"tersana","tersanalele":"tersana","tersanalelor":"tersana","tersanaua":"tersana","terta":["terță","terț","terța","terț"],"terte":["terțe","terț","terțe","terță"],"tertei":"terță","tertele":["terțele","terț","terțele","terță"],"tertelor":"terță","tertelul":"tertel","tertelule":"tertel","tertelului":"tertel","terteluri":"tertel","tertelurile":"tertel","tertelurilor":"tertel","tertete":"terțet","tertetele":"terțet","tertetelor":"terțet","tertetul":"terțet","tertetule":"terțet","tertetului":"terțet","terti":"terț","tertia":["terția","terție","terția","terțiu"],"tertiara":["terțiară","terțiar","terțiara","terțiar"],"tertiare":"terțiar","tertiarele":"terțiar","tertiari":"terțiar","tertiarii":"terțiar","tertiarul":"terțiar","tertie":"terțiu","tertiei":"terție","tertii":["terții","terț","terții","terție","terții","terțiu"],"tertiii":"terțiu","tertiile":["terțiile","terție","terțiile","terțiu"],"tertiilor":"terție","tertilor":"terț","tertina":["terțină","terțin","terțina","terțin"],"tertine":["terține","terțin","țerține","țerțin","terține","terțină"],"tertinei":"terțină","tertinele":["terținele","terțin","țerținele","țerțin","terținele","terțină"],"tertinelor":["țerținelor","țerțin","terținelor","terțină"],"tertini":"terțin","tertinii":"terțin","tertinilor":"terțin","tertinul":["terținul","terțin","țerținul","țerțin"],"tertinule":["terținule","terțin","țerținule","țerțin"],"tertinului":["terținului","terțin","țerținului","țerțin"],"tertipatul":"tertipat","tertipatule":"tertipat","tertipatului":"tertipat","tertipaturi":"tertipat","tertipaturile":"tertipat","tertipaturilor":"tertipat","tertipgii":"tertipgiu","tertipgiii":"tertipgiu","tertipgiilor":"tertipgiu","tertipgiuul":"tertipgiu","tertipgiuule":"tertipgiu","tertipgiuului":"tertipgiu","tertipul":"tertip","tertipule":"tertip","tertipului":"tertip","tertipuri":"tertip","tertipurile":"tertip","tertipurilor":"tertip","tertiuasi":"terțiuaș","tertiuasii":"terțiuaș","tertiuasilor":"terțiuaș","tertiuasul":"terțiuaș","tertiuasule":"terțiuaș","tertiuasului":"terțiuaș","tertiul":"terțiu","tertul":"terț","tertule":"terț","tertului":"terț","terzii":"terziu","terziii":"terziu","terziilor":"terziu","terzimani":"terziman","terzimanii":"terziman","terzimanilor":"terziman","terzimanul":"terziman","terzimanule":"terziman","terzimanului":"terziman","terziuul":"terziu","terziuule":"terziu","terziuului":"terziu","tes":"țese","tesace":"tesac","tesacele":"tesac","tesacelor":"tesac","tesacul":"tesac","tesacule":"tesac","tesacului":"tesac","tesal":["țesal","țesăla","țesăl","țesăla"],"tesalai":"țesăla","tesalam":["țesălăm","țesăla","țesălam","țesăla"],"tesaland":"țesăla","tesalara":"țesăla","tesalaram":"țesăla","tesalarati":"țesăla","tesalarea":"țesălare","tesalari":"țesălare","tesalarii":"țesălare","tesalarile":"țesălare","tesalarilor":"țesălare","tesalase":"țesăla","tesalasem":"țesăla","tesalasera":"țesăla","tesalaseram":"țesăla","tesalaserati":"țesăla","tesalasesi":"țesăla","tesalasi":"țesăla","tesalat":"țesăla","tesalati":"țesăla","tesalatul":"țesălat","tesalatule":"țesălat","tesalatului":"țesălat","tesalau":"țesăla","tesale":"țesală","tesalei":"țesală","tesalele":"țesală","tesalelor":"țesală","tesali":"țesăla","tesaliana":["tesaliană","tesalian","tesaliana","tesalian"],"tesalianul":"tesalian","tesalica":["tesalică","tesalic","tesalica","tesalic"],"tesalice":"tesalic","tesalicele":"tesalic","tesalici":"tesalic","tesalicii":"tesalic","tesalicul":"tesalic","tesaliene":"tesalian","tesalienele":"tesalian","tesalieni":"tesalian","tesalienii":"tesalian","tesalute":"țesăluță","tesalutei":"țesăluță","tesalutele":"țesăluță","tesalutelor":"țesăluță","tesand":"țese","tesatoarea":"țesătoare","tesatoarei":"țesătoare","tesatoarele":"țesătoare","tesatoarelor":"țesătoare","tesatorese":"țesătoreasă","tesatoresei":"țesătoreasă","tesatoresele":"țesătoreasă","tesatoreselor":"țesătoreasă","tesatori":"țesător","tesatoria":"țesătorie","tesatoriei":"țesătorie","tesatorii":["țesătorii","țesător","țesătorii","țesătorie"],"tesatoriile":"țesătorie","tesatoriilor":"țesătorie","tesatorilor":"țesător","tesatorul":"țesător","tesatorule":"țesător","tesatorului":"țesător","tesaturi":"țesătură","tesaturii":"țesătură","tesaturile":"țesătură","tesaturilor":"țesătură","tescarese":"tescăreasă","tescaresei":"tescăreasă","tescaresele":"tescăreasă","tescareselor":"tescăreasă","teschereaua":["teschereaua","tescherea","teșchereaua","teșcherea"],"tescheregii":"tescheregiu","tescheregiii":"tescheregiu","tescheregiilor":"tescheregiu","tescheregiuul":"tescheregiu","tescheregiuule":"tescheregiu","tescheregiuului":"tescheregiu","tescherele":["tescherele","tescherea","teșcherele","teșcherea"],"tescherelei":["tescherelei","tescherea","teșcherelei","teșcherea"],"tescherelele":["tescherelele","tescherea","teșcherelele","teșcherea"],"tescherelelor":["tescherelelor","tescherea","teșcherelelor","teșcherea"],"tescoaie":"teșcoi","tescoaiele":"teșcoi","tescoaielor":"teșcoi","tescoiul":"teșcoi","tescoiule":"teșcoi","tescoiului":"teșcoi","tescovine":"tescovină","tescovinei":"tescovină","tescovinele":"tescovină","tescovinelor":"tescovină","tescuia":"tescui","tescuiai":"tescui","tescuiam":"tescui","tescuiati":"tescui","tescuiau":"tescui","tescuiesc":"tescui","tescuieste":"tescui","tescuiesti":"tescui","tescuii":"tescui","tescuim":"tescui","tescuind":"tescui","tescuira":"tescui","tescuiram":"tescui","tescuirati":"tescui","tescuirea":"tescuire","tescuiri":"tescuire","tescuirii":"tescuire","tescuirile":"tescuire","tescuirilor":"tescuire","tescuise":"tescui","tescuisem":"tescui","tescuisera":"tescui","tescuiseram":"tescui","tescuiserati":"tescui","tescuisesi":"tescui","tescuisi":"tescui","tescuit":"tescui","tescuita":["tescuită","tescuit","tescuita","tescuit"],"tescuite":"tescuit","tescuitele":"tescuit","tescuiti":["tescuiți","tescui","tescuiți","tescuit"],"tescuitii":"tescuit","tescuitul":"tescuit","tesculete":"tesculeț","tesculetele":"tesculeț","tesculetelor":"tesculeț","tesculetul":"tesculeț","tesculetule":"tesculeț","tesculetului":"tesculeț","tesea":["țesea","țese","teșea","teși"],"teseai":["țeseai","țese","teșeai","teși"],"teseam":["țeseam","țese","teșeam","teși"],"teseati":["țeseați","țese","teșeați","teși"],"teseau":["țeseau","țese","teșeau","teși"],"tesem":"țese","tesere":"teseră","teserea":"țesere","teserei":"teseră","teserele":"teseră","teserelor":"teseră","teseri":"țesere","teserii":"țesere","teserile":"țesere","teserilor":"țesere","tesesc":"teși","teseste":"teși","tesesti":"teși","teseti":"țese","tesi":"țese","tesii":"teși","tesim":"teși","tesind":"teși","tesira":"teși","tesiram":"teși","tesirati":"teși","tesirea":"teșire","tesiri":"teșire","tesirii":"teșire","tesirile":"teșire","tesirilor":"teșire","tesise":"teși","tesisem":"teși","tesisera":"teși","tesiseram":"teși","tesiserati":"teși","tesisesi":"teși","tesisi":"teși","tesit":"teși","tesita":["teșită","teșit","teșita","teșit"],"tesite":"teșit","tesitele":"teșit","tesiti":["teșiți","teși","teșiți","teșit"],"tesitii":"teșit","tesitul":"teșit","tesituri":"teșitură","tesiturii":"teșitură","tesiturile":"teșitură","tesiturilor":"teșitură","teslarese":"teslăreasă","teslaresei":"teslăreasă","teslaresele":"teslăreasă","teslareselor":"teslăreasă","teslari":"teslar","teslaria":"teslărie","teslariei":"teslărie","teslarii":["teslarii","teslar","teslării","teslărie"],"teslariile":"teslărie","teslariilor":"teslărie","teslarilor":"teslar","teslarul":"teslar","teslarule":"teslar","teslarului":"teslar","teslaua":"tesla","tesle":"teslă","teslei":"teslă","teslele":"teslă","teslelor":"teslă","teslimatul":"teslimat","teslimatule":"teslimat","teslimatului":"teslimat","teslimaturi":"teslimat","teslimaturile":"teslimat","teslimaturilor":"teslimat","teslimul":"teslim","teslimule":"teslim","teslimului":"teslim","teslimuri":"teslim","teslimurile":"teslim","teslimurilor":"teslim","teslisoare":"teslișoară","teslisoarei":"teslișoară","teslisoarele":"teslișoară","teslisoarelor":"teslișoară","tesloaie":"tesloi","tesloaiele":"tesloi","tesloaielor":"tesloi","tesloiul":"tesloi","tesloiule":"tesloi","tesloiului":"tesloi","teslulite":"tesluliță","teslulitei":"tesluliță","teslulitele":"tesluliță","teslulitelor":"tesluliță","teslute":"tesluță","teslutei":"tesluță","teslutele":"tesluță","teslutelor":"tesluță","tesmenita":["teșmenită","teșmenit","teșmenita","teșmenit"],"tesmenite":"teșmenit","tesmenitele":"teșmenit","tesmeniti":"teșmenit","tesmenitii":"teșmenit","tesmenitul":"teșmenit","tesmoteti":"tesmotet","tesmotetii":"tesmotet","tesmotetilor":"tesmotet","tesmotetul":"tesmotet","tesmotetule":"tesmotet","tesmotetului":"tesmotet","tesoasa":["teșoasă","teșos","teșoasa","teșos"],"tesoase":"teșos","tesoasele":"teșos","tesosi":"teșos","tesosii":"teșos","tesosul":"teșos","tesrifatul":"teșrifat","tesrifatule":"teșrifat","tesrifatului":"teșrifat","tesrifaturi":"teșrifat","tesrifaturile":"teșrifat","tesrifaturilor":"teșrifat","testabila":["testabilă","testabil","testabila","testabil"],"testabile":"testabil","testabilele":"testabil","testabili":"testabil","testabilii":"testabil","testabilitatea":"testabilitate","testabilitati":"testabilitate","testabilitatii":"testabilitate","testabilul":"testabil","testacee":"testaceu","testaceele":"testaceu","testaceelor":"testaceu","testaceuul":"testaceu","testaceuule":"testaceu","testaceuului":"testaceu","testai":"testa","testam":["testăm","testa","testam","testa"],"testamentara":["testamentară","testamentar","testamentara","testamentar"],"testamentare":"testamentar","testamentarele":"testamentar","testamentari":"testamentar","testamentarii":"testamentar","testamentarul":"testamentar","testamente":"testament","testamente olografice":"testament olograf","testamentele":"testament","testamentelor":"testament","testamentul":"testament","testamentule":"testament","testamentului":"testament","testand":"testa","testara":"testa","testaram":"testa","testarati":"testa","testarea":"testare","testari":"testare","testarii":"testare","testarile":"testare","testarilor":"testare","testase":"testa","testasem":"testa","testasera":"testa","testaseram":"testa","testaserati":"testa","testasesi":"testa","testasi":"testa","testat":"testa","testati":"testa","testatoarea":"testatoare","testatoarei":"testatoare","testatoarele":"testatoare","testatoarelor":"testatoare","testatori":"testator","testatorii":"testator","testatorilor":"testator","testatorul":"testator","testatorule":"testator","testatorului":"testator","testau":"testa","teste":["țeste","țeastă","teste","test"],"teste de sarcina":"test de sarcină","testeaua":"testea","testeaza":"testa","testei":"țeastă","testele":["țestele","țeastă","testele","test","testele","testea"],"testelei":"testea","testelele":"testea","testelelor":"testea","testelor":["țestelor","țeastă","testelor","test"],"testemele":"testemel","testemelele":"testemel","testemelelor":"testemel","testemelul":"testemel","testemelule":"testemel","testemelului":"testemel","testere":"tester","testerele":"tester","testerelor":"tester","testerul":"tester","testerule":"tester","testerului":"tester","testez":"testa","testezi":"testa","testiculara":["testiculară","testicular","testiculara","testicular"],"testiculare":"testicular","testicularele":"testicular","testiculari":"testicular","testicularii":"testicular","testicularul":"testicular","testicule":"testicul","testiculele":"testicul","testiculelor":"testicul","testiculul":"testicul","testiculule":"testicul","testiculului":"testicul","testimoniala":["testimonială","testimonial","testimoniala","testimonial"],"testimoniale":"testimonial","testimonialele":"testimonial","testimoniali":"testimonial","testimonialii":"testimonial","testimonialul":"testimonial","testimonii":"testimoniu","testimoniile":"testimoniu","testimoniilor":"testimoniu","testimoniul":"testimoniu","testimoniule":"testimoniu","testimoniului":"testimoniu","testoasa":["țestoasă","țestos","țestoasa","țestos"],"testoase":["țestoase","țestoasă","țestoase","țestos"],"testoasei":"țestoasă","testoasele":["țestoasele","țestoasă","țestoasele","țestos"],"testoaselor":"țestoasă","testosi":"țestos","testosii":"țestos","testosterone":"testosteronă","testosteronei":"testosteronă","testosteronele":"testosteronă","testosteronelor":"testosteronă","testosteronul":"testosteron","testosteronule":"testosteron","testosteronului":"testosteron","testosul":"țestos","testul":["testul","test","țestul","țest"],"testule":["testule","test","țestule","țest"],"testului":["testului","test","țestului","țest"],"testuri":"țest","testurile":"țest","testurilor":"țest","tesu":"țese","tesui":"țese","tesulite":"teșuliță","tesulitei":"teșuliță","tesulitele":"teșuliță","tesulitelor":"teșuliță","tesura":"țese","tesuram":"țese","tesurati":"țese","tesuse":"țese","tesusem":"țese","tesusera":"țese","tesuseram":"țese","tesuserati":"țese","tesusesi":"țese","tesusi":"țese","tesut":"țese","tesuta":["țesută","țesut","țesuta","țesut"],"tesute":"țesut","tesutele":"țesut","tesuti":"țesut","tesutii":"țesut","tesutoterapia":"țesutoterapie","tesutoterapiei":"țesutoterapie","tesutoterapii":"țesutoterapie","tesutul":"țesut","tesutule":"țesut","tesutului":"țesut","tesuturi":"țesut","tesuturi adipoase":"țesut adipos","tesuturi conjunctive":"țesut conjunctiv","tesuturi epiteliale":"țesut epitelial","tesuturi vasculare":"țesut vascular","tesuturile":"țesut","tesuturilor":"țesut","tetania":"tetanie","tetanica":["tetanică","tetanic","tetanica","tetanic"],"tetanice":"tetanic","tetanicele":"tetanic","tetanici":"tetanic","tetanicii":"tetanic","tetanicul":"tetanic","tetaniei":"tetanie","tetanii":"tetanie","tetaniile":"tetanie","tetaniilor":"tetanie","tetanismul":"tetanism","tetanismule":"tetanism","tetanismului":"tetanism","tetanizai":"tetaniza","tetanizam":["tetanizăm","tetaniza","tetanizam","tetaniza"],"tetanizand":"tetaniza","tetanizara":"tetaniza","tetanizaram":"tetaniza","tetanizarati":"tetaniza","tetanizase":"tetaniza","tetanizasem":"tetaniza","tetanizasera":"tetaniza","tetanizaseram":"tetaniza","tetanizaserati":"tetaniza","tetanizasesi":"tetaniza","tetanizasi":"tetaniza","tetanizat":"tetaniza","tetanizati":"tetaniza","tetanizau":"tetaniza","tetanizeaza":"tetaniza","tetanizez":"tetaniza","tetanizezi":"tetaniza","tetanosul":"tetanos","tetanosule":"tetanos","tetanosului":"tetanos","tetaul":"teta","tetaule":"teta","tetaului":"teta","tete-a-tete-uri":"tête-à-tête","tete-a-tete-urile":"tête-à-tête","tete-a-tete-urilor":"tête-à-tête","tete-a-teteul":"tête-à-tête","tete-a-teteule":"tête-à-tête","tete-a-teteului":"tête-à-tête","teticaul":"tetică","teticaule":"tetică","teticaului":"tetică","tetici":"tetică","teticii":"tetică","teticilor":"tetică","tetiere":"tetieră","tetierei":"tetieră","tetierele":"tetieră","tetierelor":"tetieră","tetine":"tetină","tetinei":"tetină","tetinele":"tetină","tetinelor":"tetină","tetrabromure":"tetrabromură","tetrabromurei":"tetrabromură","tetracarbonilul":"tetracarbonil","tetracarbonilule":"tetracarbonil","tetracarbonilului":"tetracarbonil","tetrachene":"tetrachenă","tetrachenei":"tetrachenă","tetrachenele":"tetrachenă","tetrachenelor":"tetrachenă","tetracicline":"tetraciclină","tetraciclinei":"tetraciclină","tetraciclinele":"tetraciclină","tetraciclinelor":"tetraciclină","tetraclormetanul":"tetraclormetan","tetraclormetanule":"tetraclormetan","tetraclormetanului":"tetraclormetan","tetracloruri":"tetraclorură","tetraclorurii":"tetraclorură","tetraclorurile":"tetraclorură","tetraclorurilor":"tetraclorură","tetracordul":"tetracord","tetracordule":"tetracord","tetracordului":"tetracord","tetracorduri":"tetracord","tetracordurile":"tetracord","tetracordurilor":"tetracord","tetracromatica":["tetracromatică","tetracromatic","tetracromatica","tetracromatic"],"tetracromatice":"tetracromatic","tetracromaticele":"tetracromatic","tetracromatici":"tetracromatic","tetracromaticii":"tetracromatic","tetracromaticul":"tetracromatic","tetradactila":["tetradactilă","tetradactil","tetradactila","tetradactil"],"tetradactile":"tetradactil","tetradactilele":"tetradactil","tetradactili":"tetradactil","tetradactilia":"tetradactilie","tetradactiliei":"tetradactilie","tetradactilii":["tetradactilii","tetradactil","tetradactilii","tetradactilie"],"tetradactilul":"tetradactil","tetrade":"tetradă","tetradei":"tetradă","tetradele":"tetradă","tetradelor":"tetradă","tetradinama":["tetradinamă","tetradinam","tetradinama","tetradinam"],"tetradiname":"tetradinam","tetradinamele":"tetradinam","tetradinami":"tetradinam","tetradinamii":"tetradinam","tetradinamul":"tetradinam","tetradrahme":"tetradrahmă","tetradrahmei":"tetradrahmă","tetradrahmele":"tetradrahmă","tetradrahmelor":"tetradrahmă","tetraedre":"tetraedru","tetraedrele":"tetraedru","tetraedrelor":"tetraedru","tetraedrica":["tetraedrică","tetraedric","tetraedrica","tetraedric"],"tetraedrice":"tetraedric","tetraedricele":"tetraedric","tetraedrici":"tetraedric","tetraedricii":"tetraedric","tetraedricul":"tetraedric","tetraedritul":"tetraedrit","tetraedritule":"tetraedrit","tetraedritului":"tetraedrit","tetraedrul":"tetraedru","tetraedrule":"tetraedru","tetraedrului":"tetraedru","tetraevanghelia":"tetraevanghelie","tetraevangheliei":"tetraevanghelie","tetraevanghelii":"tetraevanghelie","tetraevangheliile":"tetraevanghelie","tetraevangheliilor":"tetraevanghelie","tetrafluoruri":"tetrafluorură","tetrafluorurii":"tetrafluorură","tetrafluorurile":"tetrafluorură","tetrafluorurilor":"tetrafluorură","tetrafonia":"tetrafonie","tetrafonica":["tetrafonică","tetrafonic","tetrafonica","tetrafonic"],"tetrafonice":"tetrafonic","tetrafonicele":"tetrafonic","tetrafonici":"tetrafonic","tetrafonicii":"tetrafonic","tetrafonicul":"tetrafonic","tetrafoniei":"tetrafonie","tetrafonii":"tetrafonie","tetragoane":"tetragon","tetragoanele":"tetragon","tetragoanelor":"tetragon","tetragonala":["tetragonală","tetragonal","tetragonala","tetragonal"],"tetragonale":"tetragonal","tetragonalele":"tetragonal","tetragonali":"tetragonal","tetragonalii":"tetragonal","tetragonalul":"tetragonal","tetragonica":["tetragonică","tetragonic","tetragonica","tetragonic"],"tetragonice":"tetragonic","tetragonicele":"tetragonic","tetragonici":"tetragonic","tetragonicii":"tetragonic","tetragonicul":"tetragonic","tetragonul":"tetragon","tetragonule":"tetragon","tetragonului":"tetragon","tetragrame":"tetragramă","tetragramei":"tetragramă","tetragramele":"tetragramă","tetragramelor":"tetragramă","tetrahidronaftaline":"tetrahidronaftalină","tetrahidronaftalinei":"tetrahidronaftalină","tetraline":"tetralină","tetralinei":"tetralină","tetralinele":"tetralină","tetralinelor":"tetralină","tetralogia":"tetralogie","tetralogiei":"tetralogie","tetralogii":"tetralogie","tetralogiile":"tetralogie","tetralogiilor":"tetralogie","tetramera":["tetrameră","tetramer","tetramera","tetramer"],"tetramere":"tetramer","tetramerele":"tetramer","tetrameri":"tetramer","tetramerii":"tetramer","tetramerul":"tetramer","tetrametri":"tetrametru","tetrametrii":"tetrametru","tetrametrilor":"tetrametru","tetrametrul":"tetrametru","tetrametrule":"tetrametru","tetrametrului":"tetrametru","tetraonide":"tetraonidă","tetraonidei":"tetraonidă","tetraonidele":"tetraonidă","tetraonidelor":"tetraonidă","tetrapetala":["tetrapetală","tetrapetal","tetrapetala","tetrapetal"],"tetrapetale":"tetrapetal","tetrapetalele":"tetrapetal","tetrapetali":"tetrapetal","tetrapetalii":"tetrapetal","tetrapetalul":"tetrapetal","tetraplegia":"tetraplegie","tetraplegiei":"tetraplegie","tetraplegii":"tetraplegie","tetraplegiile":"tetraplegie","tetraplegiilor":"tetraplegie","tetrapoda":["tetrapodă","tetrapod","tetrapoda","tetrapod"],"tetrapode":"tetrapod","tetrapodele":"tetrapod","tetrapodia":"tetrapodie","tetrapodiei":"tetrapodie","tetrapodii":"tetrapodie","tetrapodiile":"tetrapodie","tetrapodiilor":"tetrapodie","tetrapodul":"tetrapod","tetrapozi":"tetrapod","tetrapozii":"tetrapod","tetrarhate":"tetrarhat","tetrarhatele":"tetrarhat","tetrarhatelor":"tetrarhat","tetrarhatul":"tetrarhat","tetrarhatule":"tetrarhat","tetrarhatului":"tetrarhat","tetrarhi":"tetrarh","tetrarhia":"tetrarhie","tetrarhiei":"tetrarhie","tetrarhii":["tetrarhii","tetrarh","tetrarhii","tetrarhie"],"tetrarhiile":"tetrarhie","tetrarhiilor":"tetrarhie","tetrarhilor":"tetrarh","tetrarhul":"tetrarh","tetrarhule":"tetrarh","tetrarhului":"tetrarh","tetrasi":"tetras","tetrasii":"tetras","tetrasilabe":"tetrasilab","tetrasilabele":"tetrasilab","tetrasilabelor":"tetrasilab","tetrasilabica":["tetrasilabică","tetrasilabic","tetrasilabica","tetrasilabic"],"tetrasilabice":"tetrasilabic","tetrasilabicele":"tetrasilabic","tetrasilabici":"tetrasilabic","tetrasilabicii":"tetrasilabic","tetrasilabicul":"tetrasilabic","tetrasilabul":"tetrasilab","tetrasilabule":"tetrasilab","tetrasilabului":"tetrasilab","tetrasilor":"tetras","tetrastiha":["tetrastihă","tetrastih","tetrastiha","tetrastih"],"tetrastihe":"tetrastih","tetrastihele":"tetrastih","tetrastihi":"tetrastih","tetrastihii":"tetrastih","tetrastihul":"tetrastih","tetrasul":"tetras","tetrasule":"tetras","tetrasulfuri":"tetrasulfură","tetrasulfurii":"tetrasulfură","tetrasulfurile":"tetrasulfură","tetrasulfurilor":"tetrasulfură","tetrasului":"tetras","tetratloane":"tetratlon","tetratloanele":"tetratlon","tetratloanelor":"tetratlon","tetratloniste":"tetratlonistă","tetratlonistei":"tetratlonistă","tetratlonistele":"tetratlonistă","tetratlonistelor":"tetratlonistă","tetratlonisti":"tetratlonist","tetratlonistii":"tetratlonist","tetratlonistilor":"tetratlonist","tetratlonistul":"tetratlonist","tetratlonistule":"tetratlonist","tetratlonistului":"tetratlonist","tetratlonul":"tetratlon","tetratlonule":"tetratlon","tetratlonului":"tetratlon","tetravaccine":"tetravaccin","tetravaccinele":"tetravaccin","tetravaccinelor":"tetravaccin","tetravaccinul":"tetravaccin","tetravaccinule":"tetravaccin","tetravaccinului":"tetravaccin","tetravalenta":["tetravalentă","tetravalent","tetravalenta","tetravalent"],"tetravalente":"tetravalent","tetravalentele":"tetravalent","tetravalenti":"tetravalent","tetravalentii":"tetravalent","tetravalentul":"tetravalent","tetravanghele":"tetravanghel","tetravanghelele":"tetravanghel","tetravanghelelor":"tetravanghel","tetravanghelul":"tetravanghel","tetravanghelule":"tetravanghel","tetravanghelului":"tetravanghel","tetreaua":"tetrea","tetrele":"tetrea","tetrelei":"tetrea","tetrelele":"tetrea","tetrelelor":"tetrea","tetrode":"tetrodă","tetrodei":"tetrodă","tetrodele":"tetrodă","tetrodelor":"tetrodă","tetroze":"tetroză","tetrozei":"tetroză","teuci":"teucă","teucii":"teucă","teucile":"teucă","teucilor":"teucă","teul":"teu","teule":"teu","teului":"teu","teurgia":"teurgie","teurgiei":"teurgie","teurgii":"teurgie","teuri":"teu","teurile":"teu","teurilor":"teu","teutona":["teutonă","teuton","teutona","teuton"],"teutone":["teutone","teuton","teutone","teutonă"],"teutonei":"teutonă","teutonele":["teutonele","teuton","teutonele","teutonă"],"teutonelor":"teutonă","teutoni":"teuton","teutonica":["teutonică","teutonic","teutonica","teutonic"],"teutonice":"teutonic","teutonicele":"teutonic","teutonici":"teutonic","teutonicii":"teutonic","teutonicul":"teutonic","teutonii":"teuton","teutonul":"teuton","tevaria":"țevărie","tevariei":"țevărie","tevarihul":"tevarih","tevarihule":"tevarih","tevarihului":"tevarih","tevarihuri":"tevarih","tevarihurile":"tevarih","tevarihurilor":"tevarih","tevarii":"țevărie","tevariile":"țevărie","tevariilor":"țevărie","tevature":"tevatură","tevaturei":"tevatură","tevi":"țeavă","tevi de esapament":"țeavă de eșapament","tevia":"țevie","teviei":"țevie","tevii":["țevii","țeavă","țevii","țevie"],"teviile":"țevie","teviilor":"țevie","tevile":"țeavă","tevilor":"țeavă","tevioare":"țevioară","tevioarei":"țevioară","tevioarele":"țevioară","tevioarelor":"țevioară","tevisoare":"țevișoară","tevisoarei":"țevișoară","tevisoarele":"țevișoară","tevisoarelor":"țevișoară","tevite":"țeviță","tevitei":"țeviță","tevitele":"țeviță","tevitelor":"țeviță","tevoasa":["țevoasă","țevos","țevoasa","țevos"],"tevoase":"țevos","tevoasele":"țevos","tevosi":"țevos","tevosii":"țevos","tevosul":"țevos","tevuci":"țevucă","tevucii":"țevucă","tevucile":"țevucă","tevucilor":"țevucă","tevuici":"țevuică","tevuicii":"țevuică","tevuicile":"țevuică","tevuicilor":"țevuică","tevusoare":"țevușoară","tevusoarei":"țevușoară","tevusoarele":"țevușoară","tevusoarelor":"țevușoară","texte":"text","textiere":"textieră","textierei":"textieră","textierele":"textieră","textierelor":"textieră","textieri":"textier","textierii":"textier","textierilor":"textier","textierul":"textier","textierule":"textier","textierului":"textier","textila":["textilă","textil","textila","textil"],"textile":["textile","textil","textile","textilă"],"textilei":"textilă","textilele":["textilele","textil","textilele","textilă"],"textilelor":"textilă","textili":"textil","textilii":"textil","textilista":["textilistă","textilist","textilista","textilist"],"textiliste":"textilist","textilistele":"textilist","textilisti":"textilist","textilistii":"textilist","textilistilor":"textilist","textilistul":"textilist","textilistule":"textilist","textilistului":"textilist","textilul":"textil","textologe":"textologă","textologei":"textologă","textologele":"textologă","textologelor":"textologă","textologi":"textolog","textologia":"textologie","textologica":["textologică","textologic","textologica","textologic"],"textologice":"textologic","textologicele":"textologic","textologici":"textologic","textologicii":"textologic","textologicul":"textologic","textologiei":"textologie","textologii":"textologie","textuala":["textuală","textual","textuala","textual"],"textuale":"textual","textualele":"textual","textuali":"textual","textualii":"textual","textualisme":"textualism","textualismele":"textualism","textualismelor":"textualism","textualismul":"textualism","textualismule":"textualism","textualismului":"textualism","textualul":"textual","textulete":"textuleț","textuletele":"textuleț","textuletelor":"textuleț","textuletul":"textuleț","textuletule":"textuleț","textuletului":"textuleț","texturai":"textura","texturam":["texturăm","textura","texturam","textura"],"texturand":"textura","texturara":"textura","texturaram":"textura","texturarati":"textura","texturase":"textura","texturasem":"textura","texturasera":"textura","texturaseram":"textura","texturaserati":"textura","texturasesi":"textura","texturasi":"textura","texturat":"textura","texturati":"textura","texturau":"textura","textureaza":"textura","texturez":"textura","texturezi":"textura","texturi":"textură","texturii":"textură","texturile":"textură","texturilor":"textură","tezaurari":"tezaurar","tezaurarii":"tezaurar","tezaurarilor":"tezaurar","tezaurarul":"tezaurar","tezaurarule":"tezaurar","tezaurarului":"tezaurar","tezaure":"tezaur","tezaurele":"tezaur","tezaurelor":"tezaur","tezaurizai":"tezauriza","tezaurizam":["tezaurizăm","tezauriza","tezaurizam","tezauriza"],"tezaurizand":"tezauriza","tezaurizara":"tezauriza","tezaurizaram":"tezauriza","tezaurizarati":"tezauriza","tezaurizarea":"tezaurizare","tezaurizari":"tezaurizare","tezaurizarii":"tezaurizare","tezaurizarile":"tezaurizare","tezaurizarilor":"tezaurizare","tezaurizase":"tezauriza","tezaurizasem":"tezauriza","tezaurizasera":"tezauriza","tezaurizaseram":"tezauriza","tezaurizaserati":"tezauriza","tezaurizasesi":"tezauriza","tezaurizasi":"tezauriza","tezaurizat":"tezauriza","tezaurizati":"tezauriza","tezaurizatori":"tezaurizator","tezaurizatorii":"tezaurizator","tezaurizatorilor":"tezaurizator","tezaurizatorul":"tezaurizator","tezaurizatorule":"tezaurizator","tezaurizatorului":"tezaurizator","tezaurizau":"tezauriza","tezaurizeaza":"tezauriza","tezaurizez":"tezauriza","tezaurizezi":"tezauriza","tezaurul":"tezaur","tezaurule":"tezaur","tezaurului":"tezaur","teze":"teză","teze de doctorat":"teză de doctorat","teze de licenta":"teză de licență","tezei":"teză","tezele":"teză","tezelor":"teză","teziste":"tezistă","tezistei":"tezistă","tezistele":"tezistă","tezistelor":"tezistă","thailandeza":["thailandeză","thailandez","thailandeza","thailandez"],"thailandeze":["thailandeze","thailandez","thailandeze","thailandeză"],"thailandezei":"thailandeză","thailandezele":["thailandezele","thailandez","thailandezele","thailandeză"],"thailandezelor":"thailandeză","thailandezi":"thailandez","thailandezii":"thailandez","thailandezilor":"thailandez","thailandezul":"thailandez","thailandezule":"thailandez","thailandezului":"thailandez","thalidomide":"thalidomidă","thalidomidei":"thalidomidă","thanetiana":["thanetiană","thanetian","thanetiana","thanetian"],"thanetianul":"thanetian","thanetianule":"thanetian","thanetianului":"thanetian","thanetiene":"thanetian","thanetienele":"thanetian","thanetieni":"thanetian","thanetienii":"thanetian","thanetienile":"thanetian","thanetienilor":"thanetian","thrillere":"thriller","thrillerele":"thriller","thrillerelor":"thriller","thrillerul":"thriller","thrillerule":"thriller","thrillerului":"thriller","tiamine":"tiamină","tiaminei":"tiamină","tiaminele":"tiamină","tiaminelor":"tiamină","tiare":"tiară","tiarei":"tiară","tiarele":"tiară","tiarelor":"tiară","tibetana":["tibetană","tibetan","tibetana","tibetan"],"tibetane":["tibetane","tibetan","tibetane","tibetană"],"tibetanei":"tibetană","tibetanele":["tibetanele","tibetan","tibetanele","tibetană"],"tibetanelor":"tibetană","tibetani":"tibetan","tibetanii":"tibetan","tibetanul":"tibetan","tibiala":["tibială","tibial","tibiala","tibial"],"tibiale":"tibial","tibialele":"tibial","tibiali":"tibial","tibialii":"tibial","tibialul":"tibial","tibii":"tibia","tibisire":"tibișir","tibisirele":"tibișir","tibisirelor":"tibișir","tibisiroasa":["tibișiroasă","tibișiros","tibișiroasa","tibișiros"],"tibisiroase":"tibișiros","tibisiroasele":"tibișiros","tibisirosi":"tibișiros","tibisirosii":"tibișiros","tibisirosul":"tibișiros","tibisirul":"tibișir","tibisirule":"tibișir","tibisirului":"tibișir","ticaia":"ticăi","ticaiai":"ticăi","ticaiam":"ticăi","ticaiati":"ticăi","ticaiau":"ticăi","ticaie":"ticăi","ticaieli":"ticăială","ticaielii":"ticăială","ticaielile":"ticăială","ticaielilor":"ticăială","ticaii":"ticăi","ticaim":"ticăi","ticaind":"ticăi","ticainte":"ticăință","ticaintei":"ticăință","ticaintele":"ticăință","ticaintelor":"ticăință","ticaira":"ticăi","ticairam":"ticăi","ticairati":"ticăi","ticaise":"ticăi","ticaisem":"ticăi","ticaisera":"ticăi","ticaiseram":"ticăi","ticaiserati":"ticăi","ticaisesi":"ticăi","ticaisi":"ticăi","ticait":"ticăi","ticaita":["ticăită","ticăit","ticăita","ticăit"],"ticaite":"ticăit","ticaitele":"ticăit","ticaiti":["ticăiți","ticăi","ticăiți","ticăit"],"ticaitia":"ticăiție","ticaitiei":"ticăiție","ticaitii":["ticăiții","ticăit","ticăiții","ticăiție"],"ticaitiile":"ticăiție","ticaitiilor":"ticăiție","ticaitul":"ticăit","ticaloasa":["ticăloasă","ticălos","ticăloasa","ticălos"],"ticaloase":["ticăloase","ticăloasă","ticăloase","ticălos"],"ticaloasei":"ticăloasă","ticaloasele":["ticăloasele","ticăloasă","ticăloasele","ticălos"],"ticaloaselor":"ticăloasă","ticalosea":"ticăloși","ticaloseai":"ticăloși","ticaloseam":"ticăloși","ticaloseati":"ticăloși","ticaloseau":"ticăloși","ticalosenia":"ticăloșenie","ticaloseniei":"ticăloșenie","ticalosenii":"ticăloșenie","ticaloseniile":"ticăloșenie","ticaloseniilor":"ticăloșenie","ticalosesc":"ticăloși","ticaloseste":"ticăloși","ticalosesti":"ticăloși","ticalosi":"ticălos","ticalosia":"ticăloșie","ticalosiei":"ticăloșie","ticalosii":["ticăloșii","ticălos","ticăloșii","ticăloși","ticăloșii","ticăloșie"],"ticalosiile":"ticăloșie","ticalosiilor":"ticăloșie","ticalosim":"ticăloși","ticalosind":"ticăloși","ticalosira":"ticăloși","ticalosiram":"ticăloși","ticalosirati":"ticăloși","ticalosirea":"ticăloșire","ticalosiri":"ticăloșire","ticalosirii":"ticăloșire","ticalosirile":"ticăloșire","ticalosirilor":"ticăloșire","ticalosise":"ticăloși","ticalosisem":"ticăloși","ticalosisera":"ticăloși","ticalosiseram":"ticăloși","ticalosiserati":"ticăloși","ticalosisesi":"ticăloși","ticalosisi":"ticăloși","ticalosit":"ticăloși","ticalosita":["ticăloșită","ticăloșit","ticăloșita","ticăloșit"],"ticalosite":"ticăloșit","ticalositele":"ticăloșit","ticalositi":["ticăloșiți","ticăloși","ticăloșiți","ticăloșit"],"ticalositii":"ticăloșit","ticalositul":"ticăloșit","ticalosul":"ticălos","tichete":"tichet","tichetele":"tichet","tichetelor":"tichet","tichetul":"tichet","tichetule":"tichet","tichetului":"tichet","tichia":"tichie","tichiei":"tichie","tichii":"tichie","tichiile":"tichie","tichiilor":"tichie","tichioare":"tichioară","tichioarei":"tichioară","tichioarele":"tichioară","tichioarelor":"tichioară","tichiute":"tichiuță","tichiutei":"tichiuță","tichiutele":"tichiuță","tichiutelor":"tichiuță","ticlaul":"țiclău","ticlaule":"țiclău","ticlaului":"țiclău","ticlauri":"țiclău","ticlaurile":"țiclău","ticlaurilor":"țiclău","ticle":"țiclă","ticleanul":"țiclean","ticleanule":"țiclean","ticleanului":"țiclean","ticlei":"țiclă","ticlele":"țiclă","ticlelor":"țiclă","ticleni":"țiclean","ticlenii":"țiclean","ticlenilor":"țiclean","ticleteul":"țiclete","ticleteule":"țiclete","ticleteului":"țiclete","ticleti":"țiclete","ticletii":"țiclete","ticletilor":"țiclete","ticlincul":"țiclinc","ticlincule":"țiclinc","ticlincului":"țiclinc","ticlincuri":"țiclinc","ticlincurile":"țiclinc","ticlincurilor":"țiclinc","ticlingul":"țicling","ticlingule":"țicling","ticlingului":"țicling","ticlinguri":"țicling","ticlingurile":"țicling","ticlingurilor":"țicling","ticluia":"ticlui","ticluiai":"ticlui","ticluiam":"ticlui","ticluiati":"ticlui","ticluiau":"ticlui","ticluiesc":"ticlui","ticluieste":"ticlui","ticluiesti":"ticlui","ticluii":"ticlui","ticluim":"ticlui","ticluind":"ticlui","ticluira":"ticlui","ticluiram":"ticlui","ticluirati":"ticlui","ticluirea":"ticluire","ticluiri":"ticluire","ticluirii":"ticluire","ticluirile":"ticluire","ticluirilor":"ticluire","ticluise":"ticlui","ticluisem":"ticlui","ticluisera":"ticlui","ticluiseram":"ticlui","ticluiserati":"ticlui","ticluisesi":"ticlui","ticluisi":"ticlui","ticluit":"ticlui","ticluita":["ticluită","ticluit","ticluita","ticluit"],"ticluite":"ticluit","ticluitele":"ticluit","ticluiti":["ticluiți","ticlui","ticluiți","ticluit"],"ticluitii":"ticluit","ticluitul":"ticluit","ticlute":"țicluță","ticlutei":"țicluță","ticlutele":"țicluță","ticlutelor":"țicluță","ticne":"ticnă","ticnea":["ticnea","ticni","țicnea","țicni"],"ticneai":["ticneai","ticni","țicneai","țicni"],"ticneam":["ticneam","ticni","țicneam","țicni"],"ticneati":["ticneați","ticni","țicneați","țicni"],"ticneau":["ticneau","ticni","țicneau","țicni"],"ticnei":"ticnă","ticnele":["ticnele","ticnă","ticnele","ticneală"],"ticnelei":"ticneală","ticnelele":"ticneală","ticnelelor":"ticneală","ticneli":["ticneli","ticneală","țicneli","țicneală"],"ticnelii":"țicneală","ticnelor":"ticnă","ticnesc":["ticnesc","ticni","țicnesc","țicni"],"ticneste":["ticnește","ticni","țicnește","țicni"],"ticnesti":["ticnești","ticni","țicnești","țicni"],"ticnii":["ticnii","ticni","țicnii","țicni"],"ticnim":["ticnim","ticni","țicnim","țicni"],"ticnind":["ticnind","ticni","țicnind","țicni"],"ticnira":["ticniră","ticni","țicniră","țicni"],"ticniram":["ticnirăm","ticni","țicnirăm","țicni"],"ticnirati":["ticnirăți","ticni","țicnirăți","țicni"],"ticnirea":"ticnire","ticniri":"ticnire","ticnirii":"ticnire","ticnirile":"ticnire","ticnirilor":"ticnire","ticnise":["ticnise","ticni","țicnise","țicni"],"ticnisem":["ticnisem","ticni","țicnisem","țicni"],"ticnisera":["ticniseră","ticni","țicniseră","țicni"],"ticniseram":["ticniserăm","ticni","țicniserăm","țicni"],"ticniserati":["ticniserăți","ticni","țicniserăți","țicni"],"ticnisesi":["ticniseși","ticni","țicniseși","țicni"],"ticnisi":["ticniși","ticni","țicniși","țicni"],"ticnit":["ticnit","ticni","țicnit","țicni"],"ticnita":["ticnită","ticnit","ticnita","ticnit","țicnită","țicnit","țicnita","țicnit"],"ticnite":["ticnite","ticnit","țicnite","țicnit"],"ticnitele":["ticnitele","ticnit","țicnitele","țicnit"],"ticniti":["ticniți","ticni","țicniți","țicni","ticniți","ticnit","țicniți","țicnit"],"ticnitii":["ticniții","ticnit","țicniții","țicnit"],"ticnitul":["ticnitul","ticnit","țicnitul","țicnit"],"ticsea":"ticsi","ticseai":"ticsi","ticseam":"ticsi","ticseati":"ticsi","ticseau":"ticsi","ticsesc":"ticsi","ticseste":"ticsi","ticsesti":"ticsi","ticsii":"ticsi","ticsim":"ticsi","ticsind":"ticsi","ticsira":"ticsi","ticsiram":"ticsi","ticsirati":"ticsi","ticsirea":"ticsire","ticsiri":"ticsire","ticsirii":"ticsire","ticsirile":"ticsire","ticsirilor":"ticsire","ticsise":"ticsi","ticsisem":"ticsi","ticsisera":"ticsi","ticsiseram":"ticsi","ticsiserati":"ticsi","ticsisesi":"ticsi","ticsisi":"ticsi","ticsit":"ticsi","ticsita":["ticsită","ticsit","ticsita","ticsit"],"ticsite":"ticsit","ticsitele":"ticsit","ticsiti":["ticsiți","ticsi","ticsiți","ticsit"],"ticsitii":"ticsit","ticsitul":"ticsit","ticul":"tic","ticule":"tic","ticului":"tic","ticuri":"tic","ticurile":"tic","ticurilor":"tic","ticusori":"țicușor","ticusorii":"țicușor","ticusorilor":"țicușor","ticusorul":"țicușor","ticusorule":"țicușor","ticusorului":"țicușor","tidule":"țidulă","tidulei":"țidulă","tidulele":"țidulă","tidulelor":"țidulă","tidulici":"țidulică","tidulicii":"țidulică","tidulicile":"țidulică","tidulicilor":"țidulică","tidulite":"țiduliță","tidulitei":"țiduliță","tidulitele":"țiduliță","tidulitelor":"țiduliță","tidve":"tidvă","tidvei":"tidvă","tidvele":"tidvă","tidvelor":"tidvă","tie":"tu","tierseronul":"tierseron","tierseronule":"tierseron","tierseronului":"tierseron","tifica":["tifică","tific","tifica","tific"],"tifice":["tifice","tific","tifice","tifică"],"tificei":"tifică","tificele":["tificele","tific","tificele","tifică"],"tificelor":"tifică","tifici":"tific","tificii":"tific","tificul":"tific","tiflite":"tiflită","tiflitei":"tiflită","tiflitele":"tiflită","tiflitelor":"tiflită","tiflocolite":"tiflocolită","tiflocolitei":"tiflocolită","tiflocolitele":"tiflocolită","tiflocolitelor":"tiflocolită","tiflografe":"tiflograf","tiflografele":"tiflograf","tiflografelor":"tiflograf","tiflograful":"tiflograf","tiflografule":"tiflograf","tiflografului":"tiflograf","tiflologia":"tiflologie","tiflologiei":"tiflologie","tiflologii":"tiflologie","tiflologiile":"tiflologie","tiflologiilor":"tiflologie","tiflomegalia":"tiflomegalie","tiflomegaliei":"tiflomegalie","tiflomegalii":"tiflomegalie","tiflomegaliile":"tiflomegalie","tiflomegaliilor":"tiflomegalie","tifoane":"tifon","tifoanele":"tifon","tifoanelor":"tifon","tifobaciloze":"tifobaciloză","tifobacilozei":"tifobaciloză","tifobacilozele":"tifobaciloză","tifobacilozelor":"tifobaciloză","tifoida":["tifoidă","tifoid","tifoida","tifoid"],"tifoide":["tifoide","tifoid","tifoide","tifoidă"],"tifoidele":["tifoidele","tifoid","tifoidele","tifoidă"],"tifoidica":["tifoidică","tifoidic","tifoidica","tifoidic"],"tifoidice":"tifoidic","tifoidicele":"tifoidic","tifoidici":"tifoidic","tifoidicii":"tifoidic","tifoidicul":"tifoidic","tifoidul":"tifoid","tifoizi":"tifoid","tifoizii":"tifoid","tifonul":"tifon","tifonule":"tifon","tifonului":"tifon","tifosul":"tifos","tifosule":"tifos","tifosului":"tifos","tifosuri":"tifos","tifosurile":"tifos","tifosurilor":"tifos","tifticul":"tiftic","tifticule":"tiftic","tifticului":"tiftic","tigai":["tigăi","tigaie","țigăi","țigaie"],"tigaia":["tigaia","tigaie","țigaia","țigaie"],"tigaii":["țigâii","țigâi","tigăii","tigaie","țigăii","țigaie"],"tigaile":["tigăile","tigaie","țigăile","țigaie"],"tigailor":["țigâilor","țigâi","tigăilor","tigaie","țigăilor","țigaie"],"tigaioare":"tigăioară","tigaioarei":"tigăioară","tigaioarele":"tigăioară","tigaioarelor":"tigăioară","tigaite":"tigăiță","tigaitei":"tigăiță","tigaitele":"tigăiță","tigaitelor":"tigăiță","tigaiul":"țigâi","tigaiule":"țigâi","tigaiului":"țigâi","tigana":["țigană","țigan","țigana","țigan"],"tiganaritul":"țigănărit","tiganaritule":"țigănărit","tiganaritului":"țigănărit","tiganasi":"țigănaș","tiganasii":"țigănaș","tiganasilor":"țigănaș","tiganasul":"țigănaș","tiganasule":"țigănaș","tiganasului":"țigănaș","tiganatica":["țigănatică","țigănatic","țigănatica","țigănatic"],"tiganatice":"țigănatic","tiganaticele":"țigănatic","tiganatici":"țigănatic","tiganaticii":"țigănatic","tiganaticul":"țigănatic","tiganci":"țigancă","tigancuse":"țigăncușă","tigancusei":"țigăncușă","tigancusele":"țigăncușă","tigancuselor":"țigăncușă","tigancute":"țigăncuță","tigancutei":"țigăncuță","tigancutele":"țigăncuță","tigancutelor":"țigăncuță","tigane":["țigane","țigan","țigane","țigană"],"tiganea":"țigăni","tiganeai":"țigăni","tiganeam":"țigăni","tiganeasca":["țigănească","țigănesc","țigăneasca","țigănesc"],"tiganeati":"țigăni","tiganeau":"țigăni","tiganei":["țiganei","țigană","țigănei","țigănel"],"tiganele":["țiganele","țigan","țiganele","țigană","țigănele","țigăneală"],"tiganelei":"țigăneală","tiganelele":"țigăneală","tiganelelor":"țigăneală","tiganeli":["țigăneli","țigăneală","țigăneli","țigănel"],"tiganelii":"țigănel","tiganelilor":"țigănel","tiganelor":"țigană","tiganelul":"țigănel","tiganelule":"țigănel","tiganelului":"țigănel","tiganesc":"țigăni","tiganescul":"țigănesc","tiganeste":"țigăni","tiganesti":["țigănești","țigănesc","țigănești","țigăni"],"tiganestii":"țigănesc","tiganestile":"țigănesc","tigani":"țigan","tiganii":["țiganii","țigan","țigănii","țigăni","țigănii","țigănie"],"tiganilor":"țigan","tiganim":"țigăni","tiganimea":"țigănime","tiganimei":"țigănime","tiganind":"țigăni","tiganira":"țigăni","tiganiram":"țigăni","tiganirati":"țigăni","tiganise":"țigăni","tiganisem":"țigăni","tiganisera":"țigăni","tiganiseram":"țigăni","tiganiserati":"țigăni","tiganisesi":"țigăni","tiganisi":"țigăni","tiganisme":"țigănism","tiganismele":"țigănism","tiganismelor":"țigănism","tiganismul":"țigănism","tiganismule":"țigănism","tiganismului":"țigănism","tiganit":"țigăni","tiganiti":"țigăni","tiganoasa":["țigănoasă","țigănos","țigănoasa","țigănos"],"tiganoase":"țigănos","tiganoasele":"țigănos","tiganosi":"țigănos","tiganosii":"țigănos","tiganosul":"țigănos","tiganul":"țigan","tiganule":"țigan","tiganului":"țigan","tiganusi":"țigănuș","tiganusii":"țigănuș","tiganusilor":"țigănuș","tiganusul":"țigănuș","tiganusule":"țigănuș","tiganusului":"țigănuș","tigarari":"țigărar","tigararii":"țigărar","tigararilor":"țigărar","tigararul":"țigărar","tigararule":"țigărar","tigararului":"țigărar","tigarea":"țigare","tigarele":"țigare","tigarete":["țigarete","țigaret","țigarete","țigaretă"],"tigaretei":"țigaretă","tigaretele":["țigaretele","țigaret","țigaretele","țigaretă"],"tigaretelor":["țigaretelor","țigaret","țigaretelor","țigaretă"],"tigaretul":"țigaret","tigaretule":"țigaret","tigaretului":"țigaret","tigari":["țigări","țigară","țigari","țigare","țigări","țigare"],"tigari de foi":"țigară de foi","tigarici":"țigărică","tigaricii":"țigărică","tigaricile":"țigărică","tigaricilor":"țigărică","tigarii":["țigării","țigară","țigarii","țigare","țigării","țigare"],"tigarile":["țigările","țigară","țigările","țigare"],"tigarilor":["țigărilor","țigară","țigărilor","țigare"],"tighelea":"tigheli","tigheleai":"tigheli","tigheleam":"tigheli","tigheleati":"tigheli","tigheleau":"tigheli","tighelesc":"tigheli","tigheleste":"tigheli","tighelesti":"tigheli","tighelii":"tigheli","tighelim":"tigheli","tighelind":"tigheli","tighelira":"tigheli","tigheliram":"tigheli","tighelirati":"tigheli","tighelirea":"tighelire","tigheliri":"tighelire","tighelirii":"tighelire","tighelirile":"tighelire","tighelirilor":"tighelire","tighelise":"tigheli","tighelisem":"tigheli","tighelisera":"tigheli","tigheliseram":"tigheli","tigheliserati":"tigheli","tighelisesi":"tigheli","tighelisi":"tigheli","tighelit":"tigheli","tigheliti":"tigheli","tighelitul":"tighelit","tighelitule":"tighelit","tighelitului":"tighelit","tigheluita":["tigheluită","tigheluit","tigheluita","tigheluit"],"tigheluite":"tigheluit","tigheluitele":"tigheluit","tigheluiti":"tigheluit","tigheluitii":"tigheluit","tigheluitul":"tigheluit","tighelul":"tighel","tighelule":"tighel","tighelului":"tighel","tigheluri":"tighel","tighelurile":"tighel","tighelurilor":"tighel","tiglari":"țiglar","tiglaria":"țiglărie","tiglariei":"țiglărie","tiglarii":["țiglarii","țiglar","țiglării","țiglărie"],"tiglariile":"țiglărie","tiglariilor":"țiglărie","tiglarilor":"țiglar","tiglarul":"țiglar","tiglarule":"țiglar","tiglarului":"țiglar","tigle":"țiglă","tiglei":"țiglă","tiglele":"țiglă","tiglelor":"țiglă","tignafesul":"tignafes","tignafesule":"tignafes","tignafesului":"tignafes","tignafesuri":"tignafes","tignafesurile":"tignafes","tignafesurilor":"tignafes","tignale":"țignal","tignalele":"țignal","tignalelor":"țignal","tignalul":"țignal","tignalule":"țignal","tignalului":"țignal","tignea":"tigni","tigneai":"tigni","tigneam":"tigni","tigneati":"tigni","tigneau":"tigni","tignele":"tigneală","tignelei":"tigneală","tignelele":"tigneală","tignelelor":"tigneală","tigneli":"tigneală","tignelute":"tigneluță","tignelutei":"tigneluță","tignelutele":"tigneluță","tignelutelor":"tigneluță","tignesc":"tigni","tigneste":"tigni","tignesti":"tigni","tignii":"tigni","tignim":"tigni","tignind":"tigni","tignira":"tigni","tigniram":"tigni","tignirati":"tigni","tignise":"tigni","tignisem":"tigni","tignisera":"tigni","tigniseram":"tigni","tigniserati":"tigni","tignisesi":"tigni","tignisi":"tigni","tignit":"tigni","tigniti":"tigni","tigrata":["tigrată","tigrat","tigrata","tigrat"],"tigrate":"tigrat","tigratele":"tigrat","tigrati":"tigrat","tigratii":"tigrat","tigratul":"tigrat","tigrese":"tigresă","tigresei":"tigresă","tigresele":"tigresă","tigreselor":"tigresă","tigri":"tigru","tigri bengalezi":"tigru bengalez","tigrii":"tigru","tigrilor":"tigru","tigroaice":"tigroaică","tigroaicei":"tigroaică","tigroaicele":"tigroaică","tigroaicelor":"tigroaică","tigroaiea":"tigroaie","tigroaiei":"tigroaie","tigroaiele":"tigroaie","tigroaielor":"tigroaie","tigrul":"tigru","tigrule":"tigru","tigrului":"tigru","tigve":"tigvă","tigvei":"tigvă","tigvele":"tigvă","tigvelor":"tigvă","tigvulite":"tigvuliță","tigvulitei":"tigvuliță","tigvulitele":"tigvuliță","tigvulitelor":"tigvuliță","tihn":"tihni","tihne":["tihne","tihnă","tihne","tihni"],"tihnea":"tihni","tihneai":"tihni","tihneam":"tihni","tihneati":"tihni","tihneau":"tihni","tihnei":"tihnă","tihnele":["tihnele","tihnă","tihnele","tihneală"],"tihnelei":"tihneală","tihnelele":"tihneală","tihnelelor":"tihneală","tihneli":"tihneală","tihnelor":"tihnă","tihneste":"tihni","tihnii":"tihni","tihnim":"tihni","tihnind":"tihni","tihnira":"tihni","tihniram":"tihni","tihnirati":"tihni","tihnise":"tihni","tihnisem":"tihni","tihnisera":"tihni","tihniseram":"tihni","tihniserati":"tihni","tihnisesi":"tihni","tihnisi":"tihni","tihnit":"tihni","tihnita":["tihnită","tihnit","tihnita","tihnit"],"tihnite":"tihnit","tihnitele":"tihnit","tihniti":["tihniți","tihni","tihniți","tihnit"],"tihnitii":"tihnit","tihnitul":"tihnit","tii":["ții","ține","ții","ținea"],"tiitoare":"țiitor","tiitoarea":["țiitoarea","țiitoare","țiitoarea","țiitor"],"tiitoarei":"țiitoare","tiitoarele":["țiitoarele","țiitoare","țiitoarele","țiitor"],"tiitoarelor":"țiitoare","tiitori":"țiitor","tiitoria":"țiitorie","tiitoriei":"țiitorie","tiitorii":["țiitorii","țiitor","țiitorii","țiitorie"],"tiitoriile":"țiitorie","tiitoriilor":"țiitorie","tiitorul":"țiitor","tije":"tijă","tijei":"tijă","tijele":"tijă","tijelor":"tijă","tilde":"tildă","tildei":"tildă","tildele":"tildă","tildelor":"tildă","tilfanelul":"țilfănel","tilfanelule":"țilfănel","tilfanelului":"țilfănel","tilincasul":"tilincaș","tilincasule":"tilincaș","tilincasului":"tilincaș","tilinci":"tilincă","tilincii":"tilincă","tilincile":"tilincă","tilincilor":"tilincă","tilincul":"tilinc","tilincule":"tilinc","tilincului":"tilinc","tilincute":"tilincuță","tilincutei":"tilincuță","tilincutele":"tilincuță","tilincutelor":"tilincuță","tilindre":"țilindru","tilindrele":"țilindru","tilindrelor":"țilindru","tilindruul":"țilindru","tilindruule":"țilindru","tilindruului":"țilindru","tilingi":"tilingă","tilingii":"tilingă","tilingile":"tilingă","tilingilor":"tilingă","tiliste":"tilișcă","tilistei":"tilișcă","tilistele":"tilișcă","tilistelor":"tilișcă","tilisti":"tilișcă","tilul":"țil","tilule":"țil","tilului":"țil","tiluri":"țil","tilurile":"țil","tilurilor":"țil","timaica":["timaică","timaic","timaica","timaic"],"timaice":"timaic","timaicele":"timaic","timaici":"timaic","timaicii":"timaic","timaicul":"timaic","timare":"țimară","timarei":"țimară","timarele":"țimară","timarelor":"țimară","timarioti":"timariot","timariotii":"timariot","timariotilor":"timariot","timariotul":"timariot","timariotule":"timariot","timariotului":"timariot","timarite":"timăriță","timaritei":"timăriță","timaritele":"timăriță","timaritelor":"timăriță","timarul":"timar","timarule":"timar","timarului":"timar","timaruri":"timar","timarurii":"timar","timarurilor":"timar","timbale":"țimbală","timbalei":"țimbală","timbalele":"țimbală","timbalelor":"țimbală","timbalul":"țimbal","timbalule":"țimbal","timbalului":"țimbal","timbaluri":"țimbal","timbalurile":"țimbal","timbalurilor":"țimbal","timbrai":"timbra","timbram":["timbrăm","timbra","timbram","timbra"],"timbrand":"timbra","timbrara":"timbra","timbraram":"timbra","timbrarari":"timbrare","timbrararii":"timbrare","timbrararile":"timbrare","timbrararilor":"timbrare","timbrarati":"timbra","timbrarea":"timbrare","timbrase":"timbra","timbrasem":"timbra","timbrasera":"timbra","timbraseram":"timbra","timbraserati":"timbra","timbrasesi":"timbra","timbrasi":"timbra","timbrat":"timbra","timbrata":["timbrată","timbrat","timbrata","timbrat"],"timbrate":"timbrat","timbratele":"timbrat","timbrati":["timbrați","timbra","timbrați","timbrat"],"timbratii":"timbrat","timbratul":"timbrat","timbrau":"timbra","timbre":"timbru","timbre fiscale":"timbru fiscal","timbre postale":"timbru poștal","timbre seci":"timbru sec","timbreaza":"timbra","timbrele":"timbru","timbrelor":"timbru","timbrez":"timbra","timbrezi":"timbra","timbrofilia":"timbrofilie","timbrofiliei":"timbrofilie","timbrofilii":"timbrofilie","timbrologia":"timbrologie","timbrologiei":"timbrologie","timbrologii":"timbrologie","timbrologiile":"timbrologie","timbrologiilor":"timbrologie","timbrul":"timbru","timbrule":"timbru","timbrului":"timbru","timbruri":"timbru","timbrurile":"timbru","timbrurilor":"timbru","timectomia":"timectomie","timectomiei":"timectomie","timectomii":"timectomie","timectomiile":"timectomie","timectomiilor":"timectomie","timeul":"Timeu","timeule":"Timeu","timeului":"Timeu","timfi":"timf","timfii":"timf","timfilor":"timf","timful":"timf","timfule":"timf","timfului":"timf","timia":"timie","timica":["timică","timic","timica","timic"],"timice":"timic","timicele":"timic","timici":"timic","timicii":"timic","timicul":"timic","timida":["timidă","timid","timida","timid"],"timide":"timid","timidele":"timid","timiditatea":"timiditate","timiditati":"timiditate","timiditatii":"timiditate","timidul":"timid","timiei":"timie","timii":"timie","timingul":"timing","timingule":"timing","timingului":"timing","timinguri":"timing","timingurile":"timing","timingurilor":"timing","timiseanul":"timișean","timiseanule":"timișean","timiseanului":"timișean","timisence":"timișeancă","timisencei":"timișeancă","timisencele":"timișeancă","timisencelor":"timișeancă","timisene":"timișeană","timisenei":"timișeană","timisenele":"timișeană","timisenelor":"timișeană","timiseni":"timișean","timisenii":"timișean","timisenilor":"timișean","timisoare":"Timișoara","timisoarei":"Timișoara","timisoreana":["timișoreană","timișorean","timișoreana","timișorean"],"timisoreanul":"timișorean","timisoreanule":"timișorean","timisoreanului":"timișorean","timisorence":"timișoreancă","timisorencei":"timișoreancă","timisorencele":"timișoreancă","timisorencelor":"timișoreancă","timisorene":["timișorene","timișorean","timișorene","timișoreană"],"timisorenei":"timișoreană","timisorenele":["timișorenele","timișorean","timișorenele","timișoreană"],"timisorenelor":"timișoreană","timisoreni":"timișorean","timisorenii":"timișorean","timisorenilor":"timișorean","timizi":"timid","timizii":"timid","timnicele":"timnicel","timnicelele":"timnicel","timnicelelor":"timnicel","timnicelul":"timnicel","timnicelule":"timnicel","timnicelului":"timnicel","timnicioare":"timnicior","timnicioarele":"timnicior","timnicioarelor":"timnicior","timniciorul":"timnicior","timniciorule":"timnicior","timniciorului":"timnicior","timnicute":"timnicuț","timnicutele":"timnicuț","timnicutelor":"timnicuț","timnicutul":"timnicuț","timnicutule":"timnicuț","timnicutului":"timnicuț","timoame":"timom","timoamele":"timom","timoamelor":"timom","timoceance":"timoceancă","timoceancei":"timoceancă","timoceancele":"timoceancă","timoceancelor":"timoceancă","timoceanul":"timocean","timoceanule":"timocean","timoceanului":"timocean","timocena":["timocenă","timoceană","timocena","timoceană"],"timocene":"timoceană","timocenei":"timoceană","timocenele":"timoceană","timocenelor":"timoceană","timoceni":"timocean","timocenii":"timocean","timocenilor":"timocean","timocratia":"timocrație","timocratica":["timocratică","timocratic","timocratica","timocratic"],"timocratice":"timocratic","timocraticele":"timocratic","timocratici":"timocratic","timocraticii":"timocratic","timocraticul":"timocratic","timocratiei":"timocrație","timocratii":"timocrație","timocratiile":"timocrație","timocratiilor":"timocrație","timofte":"timoftă","timoftei":"timoftă","timoftele":"timoftă","timoftelor":"timoftă","timoftici":"timoftică","timofticii":"timoftică","timofticile":"timoftică","timofticilor":"timoftică","timolul":"timol","timolule":"timol","timolului":"timol","timoluri":"timol","timolurile":"timol","timolurilor":"timol","timomul":"timom","timomule":"timom","timomului":"timom","timone":"timonă","timonei":"timonă","timonele":"timonă","timonelor":"timonă","timoneria":"timonerie","timoneriei":"timonerie","timonerii":"timonerie","timoneriile":"timonerie","timoneriilor":"timonerie","timonieri":"timonier","timonierii":"timonier","timonierilor":"timonier","timonierul":"timonier","timonierule":"timonier","timonierului":"timonier","timorai":"timora","timoram":["timorăm","timora","timoram","timora"],"timorand":"timora","timorara":"timora","timoraram":"timora","timorarati":"timora","timorarea":"timorare","timorari":"timorare","timorarii":"timorare","timorarile":"timorare","timorarilor":"timorare","timorase":"timora","timorasem":"timora","timorasera":"timora","timoraseram":"timora","timoraserati":"timora","timorasesi":"timora","timorasi":"timora","timorat":"timora","timorata":["timorată","timorat","timorata","timorat"],"timorate":"timorat","timoratele":"timorat","timorati":["timorați","timora","timorați","timorat"],"timoratii":"timorat","timoratul":"timorat","timorau":"timora","timoreaza":"timora","timorez":"timora","timorezi":"timora","timorul":"Timor","timorule":"Timor","timorului":"Timor","timorului de est":"Timorul de Est","timpanala":["timpanală","timpanal","timpanala","timpanal"],"timpanale":"timpanal","timpanalele":"timpanal","timpanali":"timpanal","timpanalii":"timpanal","timpanalul":"timpanal","timpane":"timpan","timpanele":"timpan","timpanelor":"timpan","timpanica":["timpanică","timpanic","timpanica","timpanic"],"timpanice":"timpanic","timpanicele":"timpanic","timpanici":"timpanic","timpanicii":"timpanic","timpanicul":"timpanic","timpanisme":"timpanism","timpanismele":"timpanism","timpanismelor":"timpanism","timpanismul":"timpanism","timpanismule":"timpanism","timpanismului":"timpanism","timpaniste":"timpanistă","timpanistei":"timpanistă","timpanistele":"timpanistă","timpanistelor":"timpanistă","timpanisti":"timpanist","timpanistii":"timpanist","timpanistilor":"timpanist","timpanistul":"timpanist","timpanistule":"timpanist","timpanistului":"timpanist","timpanite":"timpanită","timpanitei":"timpanită","timpanitele":"timpanită","timpanitelor":"timpanită","timpanoane":"timpanon","timpanoanele":"timpanon","timpanoanelor":"timpanon","timpanonul":"timpanon","timpanonule":"timpanon","timpanonului":"timpanon","timpanoplastia":"timpanoplastie","timpanoplastiei":"timpanoplastie","timpanoplastii":"timpanoplastie","timpanoplastiile":"timpanoplastie","timpanoplastiilor":"timpanoplastie","timpanoscleroze":"timpanoscleroză","timpanosclerozei":"timpanoscleroză","timpanosclerozele":"timpanoscleroză","timpanosclerozelor":"timpanoscleroză","timpanotomia":"timpanotomie","timpanotomiei":"timpanotomie","timpanotomii":"timpanotomie","timpanotomiile":"timpanotomie","timpanotomiilor":"timpanotomie","timpanul":"timpan","timpanule":"timpan","timpanului":"timpan","timpi de compilare":"timp de compilare","timpi de incubatie":"timp de incubație","timpi de procesare":"timp de procesare","timpi limita":"timp limită","timpine":"timpină","timpinei":"timpină","timpinele":"timpină","timpinelor":"timpină","timporala":["timporală","timporal","timporala","timporal"],"timporale":"timporal","timporalele":"timporal","timporali":"timporal","timporalii":"timporal","timporalul":"timporal","timporara":["timporară","timporar","timporara","timporar"],"timporare":"timporar","timporarele":"timporar","timporari":"timporar","timporarii":"timporar","timporarul":"timporar","timpul":"timp","timpule":"timp","timpului":"timp","timpurala":["timpurală","timpural","timpurala","timpural"],"timpurale":"timpural","timpuralele":"timpural","timpurali":"timpural","timpuralii":"timpural","timpuralul":"timpural","timpuri":"timp","timpuria":"timpuriu","timpurie":"timpuriu","timpurii":"timpuriu","timpuriii":"timpuriu","timpuriile":"timpuriu","timpurile":"timp","timpurilor":"timp","timpuriul":"timpuriu","timusul":"timus","timusule":"timus","timusului":"timus","tin":["țin","ține","țin","ținea"],"tina":["țină","ține","țină","ținea"],"tina minte":"ține minte","tina pasul":"ține pasul","tinal":"tinăli","tinale":"tinăli","tinalea":"tinăli","tinaleai":"tinăli","tinaleam":"tinăli","tinaleati":"tinăli","tinaleau":"tinăli","tinalie":"tinăli","tinalii":"tinăli","tinalim":"tinăli","tinalind":"tinăli","tinalira":"tinăli","tinaliram":"tinăli","tinalirati":"tinăli","tinalise":"tinăli","tinalisem":"tinăli","tinalisera":"tinăli"};
@@ -0,0 +1 @@
+export default {"tinaliseram":"tinăli","tinaliserati":"tinăli","tinalisesi":"tinăli","tinalisi":"tinăli","tinalit":"tinăli","tinaliti":"tinăli","tinand":["ținând","ține","ținând","ținea"],"tinar":"tânăr","tincari":"țincar","tincarii":"țincar","tincarilor":"țincar","tincarul":"țincar","tincarule":"țincar","tincarului":"țincar","tinci":["ținci","ținc","ținci","țincă"],"tincii":["țincii","ținc","țincii","țincă"],"tincile":"țincă","tincilor":["țincilor","ținc","țincilor","țincă"],"tinctoriala":["tinctorială","tinctorial","tinctoriala","tinctorial"],"tinctoriale":"tinctorial","tinctorialele":"tinctorial","tinctoriali":"tinctorial","tinctorialii":"tinctorial","tinctorialul":"tinctorial","tincturai":"tinctura","tincturam":["tincturăm","tinctura","tincturam","tinctura"],"tincturand":"tinctura","tincturara":"tinctura","tincturaram":"tinctura","tincturarati":"tinctura","tincturase":"tinctura","tincturasem":"tinctura","tincturasera":"tinctura","tincturaseram":"tinctura","tincturaserati":"tinctura","tincturasesi":"tinctura","tincturasi":"tinctura","tincturat":"tinctura","tincturata":["tincturată","tincturat","tincturata","tincturat"],"tincturate":"tincturat","tincturatele":"tincturat","tincturati":["tincturați","tinctura","tincturați","tincturat"],"tincturatii":"tincturat","tincturatul":"tincturat","tincturau":"tinctura","tinctureaza":"tinctura","tincturez":"tinctura","tincturezi":"tinctura","tincturi":"tinctură","tincul":"ținc","tincule":"ținc","tincului":"ținc","tincvaisul":"țincvais","tincvaisule":"țincvais","tincvaisului":"țincvais","tind":"tinde","tinda":"tinde","tinde":"tindă","tindea":"tinde","tindeai":"tinde","tindeam":"tinde","tindeati":"tinde","tindeau":"tinde","tindechea":"tindeche","tindechi":"tindeche","tindechii":"tindeche","tindechile":"tindeche","tindechilor":"tindeche","tindei":"tindă","tindele":"tindă","tindelor":"tindă","tindem":"tinde","tinderea":"tindere","tinderi":"tindere","tinderii":"tindere","tindeti":"tinde","tindiee":"tindică","tindieei":"tindică","tindieele":"tindică","tindieelor":"tindică","tindiez":"tindică","tindite":"tindiță","tinditei":"tindiță","tinditele":"tindiță","tinditelor":"tindiță","tindocul":"tindoc","tindocule":"tindoc","tindocului":"tindoc","tindute":"tinduță","tindutei":"tinduță","tindutele":"tinduță","tindutelor":"tinduță","tine":["tine","tină","ține","ținea","tine","tu"],"tinea":"ține","tineai":["țineai","ține","țineai","ținea"],"tineam":["țineam","ține","țineam","ținea"],"tineati":["țineați","ține","țineați","ținea"],"tineau":["țineau","ține","țineau","ținea"],"tinei":"tină","tinem":["ținem","ține","ținem","ținea"],"tinera":["tineră","tiner","tinera","tiner"],"tinere":["tinere","tânăr","tinere","tânără","tinere","tiner"],"tinerea":"ținere","tinereasca":["tinerească","tineresc","tinereasca","tineresc"],"tinerei":["tinerei","tânără","tinerei","tinerel"],"tinereii":"tinerel","tinereilor":"tinerel","tinerele":["tinerele","tânăr","tinerele","tânără","tinerele","tiner"],"tinerelor":"tânără","tinerelul":"tinerel","tinerelule":"tinerel","tinerelului":"tinerel","tinerescul":"tineresc","tineresti":"tineresc","tinerestii":"tineresc","tinerestile":"tineresc","tineretea":"tinerețe","tinereti":"tinerețe","tineretii":"tinerețe","tineretile":"tinerețe","tineretilor":"tinerețe","tineretul":"tineret","tineretule":"tineret","tineretului":"tineret","tineri":["tineri","tânăr","tineri","tiner","țineri","ținere"],"tineria":["tineria","tinerie","tineria","tineriu"],"tinerie":"tineriu","tineriei":"tinerie","tinerii":["tinerii","tânăr","tinerii","tiner","ținerii","ținere","tinerii","tinerie","tinerii","tineriu"],"tineriii":"tineriu","tineriile":["tineriile","tinerie","tineriile","tineriu"],"tineriilor":"tinerie","tinerile":"ținere","tinerilor":["tinerilor","tânăr","ținerilor","ținere"],"tinerimea":"tinerime","tinerimi":"tinerime","tinerimii":"tinerime","tineriora":["tinerioră","tinerior","tineriora","tinerior"],"tineriore":"tinerior","tineriorele":"tinerior","tineriori":"tinerior","tineriorii":"tinerior","tineriorul":"tinerior","tinerit":"tineret","tineriul":"tineriu","tinerul":"tiner","tinete":"tinetă","tinetei":"tinetă","tinetele":"tinetă","tinetelor":"tinetă","tineti":["țineți","ține","țineți","ținea"],"tingai":"țingău","tingaii":"țingău","tingailor":"țingău","tingauul":"țingău","tingauule":"țingău","tingauului":"țingău","tingirea":"tingire","tingirele":"tingirică","tingirelei":"tingirică","tingirelele":"tingirică","tingirelelor":"tingirică","tingiri":"tingire","tingirii":"tingire","tingirile":"tingire","tingirilor":"tingire","tingirute":"tingiruță","tingirutei":"tingiruță","tingirutele":"tingiruță","tingirutelor":"tingiruță","tingui":"tângui","tinicheaua":"tinichea","tinichele":"tinichea","tinichelei":"tinichea","tinichelele":"tinichea","tinichelelor":"tinichea","tinichelute":"tinicheluță","tinichelutei":"tinicheluță","tinichelutele":"tinicheluță","tinichelutelor":"tinicheluță","tinicherese":"tinichereasă","tinicheresei":"tinichereasă","tinicheresele":"tinichereasă","tinichereselor":"tinichereasă","tinicheri":"tinicher","tinicheria":"tinicherie","tinicheriei":"tinicherie","tinicherii":["tinicherii","tinicher","tinicherii","tinicherie"],"tinicheriile":"tinicherie","tinicheriilor":"tinicherie","tinicherilor":"tinicher","tinicherul":"tinicher","tinicherule":"tinicher","tinicherului":"tinicher","tinichigerese":"tinichigereasă","tinichigeresei":"tinichigereasă","tinichigeresele":"tinichigereasă","tinichigereselor":"tinichigereasă","tinichigeria":"tinichigerie","tinichigeriei":"tinichigerie","tinichigerii":"tinichigerie","tinichigeriile":"tinichigerie","tinichigeriilor":"tinichigerie","tinichigii":"tinichigiu","tinichigiii":"tinichigiu","tinichigiilor":"tinichigiu","tinichigioaice":"tinichigioaică","tinichigioaicei":"tinichigioaică","tinichigioaicele":"tinichigioaică","tinichigioaicelor":"tinichigioaică","tinichigite":"tinichigiță","tinichigitei":"tinichigiță","tinichigitele":"tinichigiță","tinichigitelor":"tinichigiță","tinichigiul":"tinichigiu","tinichigiule":"tinichigiu","tinichigiului":"tinichigiu","tinite":"tiniță","tinitei":"tiniță","tinoasa":["tinoasă","tinos","tinoasa","tinos"],"tinoase":"tinos","tinoasele":"tinos","tinosi":"tinos","tinosii":"tinos","tinosul":"tinos","tins":"tinde","tinsa":["tinsă","tins","tinsa","tins"],"tinse":["tinse","tinde","tinse","tins"],"tinsei":"tinde","tinsele":"tins","tinsera":"tinde","tinseram":"tinde","tinserati":"tinde","tinsese":"tinde","tinsesem":"tinde","tinsesera":"tinde","tinseseram":"tinde","tinseserati":"tinde","tinsesesi":"tinde","tinsesi":"tinde","tinsi":"tins","tinsii":"tins","tinsul":"tins","tintar":["țînțar","țânțar","țințar","țânțar"],"tintare":"țintar","tintarei":"țintar","tintarelor":"țintar","tintari":"țințar","tintarii":"țințar","tintarilor":"țințar","tintarul":["țintarul","țintar","țințarul","țințar"],"tintarule":["țintarule","țintar","țințarule","țințar"],"tintarului":["țintarului","țintar","țințarului","țințar"],"tintasi":"țintaș","tintasii":"țintaș","tintasilor":"țintaș","tintasul":"țintaș","tintasule":"țintaș","tintasului":"țintaș","tintata":["țintată","țintat","țintata","țintat"],"tintate":"țintat","tintatela":["țintățelă","țintățel","țintățela","țintățel"],"tintatele":["țintatele","țintat","țintățele","țintățel"],"tintatelele":"țintățel","tintateli":"țintățel","tintatelii":"țintățel","tintatelul":"țintățel","tintati":"țintat","tintatii":"țintat","tintatul":"țintat","tintaure":"țintaură","tintaurei":"țintaură","tintaurele":"țintaură","tintaurelor":"țintaură","tinte":"țintă","tintea":"ținti","tinteai":"ținti","tinteam":"ținti","tinteati":"ținti","tinteau":"ținti","tintei":"țintă","tintele":"țintă","tintelor":"țintă","tinterimul":"ținterim","tinterimule":"ținterim","tinterimului":"ținterim","tinterimuri":"ținterim","tinterimurile":"ținterim","tinterimurilor":"ținterim","tintesc":"ținti","tinteste":"ținti","tintesti":"ținti","tintii":"ținti","tintim":"ținti","tintind":"ținti","tintira":"ținti","tintiram":"ținti","tintirati":"ținti","tintirea":"țintire","tintiri":"țintire","tintirii":"țintire","tintirile":"țintire","tintirilor":"țintire","tintirimul":"țintirim","tintirimule":"țintirim","tintirimului":"țintirim","tintirimuri":"țintirim","tintirimurile":"țintirim","tintirimurilor":"țintirim","tintise":"ținti","tintisem":"ținti","tintisera":"ținti","tintiseram":"ținti","tintiserati":"ținti","tintisesi":"ținti","tintisi":"ținti","tintisoare":"țintișoară","tintisoarei":"țintișoară","tintisoarele":"țintișoară","tintisoarelor":"țintișoară","tintit":"ținti","tintita":["țintită","țintit","țintita","țintit"],"tintite":"țintit","tintitele":"țintit","tintiti":["țintiți","ținti","țintiți","țintit"],"tintitii":"țintit","tintitoare":"țintitor","tintitoarea":"țintitor","tintitoarele":"țintitor","tintitori":"țintitor","tintitorii":"țintitor","tintitorul":"țintitor","tintitul":"țintit","tintometre":"tintometru","tintometrele":"tintometru","tintometrelor":"tintometru","tintometruul":"tintometru","tintometruule":"tintometru","tintometruului":"tintometru","tintuia":"țintui","tintuiai":"țintui","tintuiam":"țintui","tintuiati":"țintui","tintuiau":"țintui","tintuiesc":"țintui","tintuieste":"țintui","tintuiesti":"țintui","tintuii":"țintui","tintuim":"țintui","tintuind":"țintui","tintuira":"țintui","tintuiram":"țintui","tintuirati":"țintui","tintuirea":"țintuire","tintuiri":"țintuire","tintuirii":"țintuire","tintuirile":"țintuire","tintuirilor":"țintuire","tintuise":"țintui","tintuisem":"țintui","tintuisera":"țintui","tintuiseram":"țintui","tintuiserati":"țintui","tintuisesi":"țintui","tintuisi":"țintui","tintuit":"țintui","tintuita":["țintuită","țintuit","țintuita","țintuit"],"tintuite":"țintuit","tintuitele":"țintuit","tintuiti":["țintuiți","țintui","țintuiți","țintuit"],"tintuitii":"țintuit","tintuitul":"țintuit","tinu":["ținu","ține","ținu","ținea"],"tinui":["ținui","ține","ținui","ținea"],"tinura":["ținură","ține","ținură","ținea"],"tinuram":["ținurăm","ține","ținurăm","ținea"],"tinurati":["ținurăți","ține","ținurăți","ținea"],"tinuse":["ținuse","ține","ținuse","ținea"],"tinusem":["ținusem","ține","ținusem","ținea"],"tinusera":["ținuseră","ține","ținuseră","ținea"],"tinuseram":["ținuserăm","ține","ținuserăm","ținea"],"tinuserati":["ținuserăți","ține","ținuserăți","ținea"],"tinusesi":["ținuseși","ține","ținuseși","ținea"],"tinusi":["ținuși","ține","ținuși","ținea"],"tinut":["ținut","ține","ținut","ținea"],"tinut minte":"ține minte","tinut pasul":"ține pasul","tinuta":["ținută","ținut","ținuta","ținut"],"tinutala":["ținutală","ținutal","ținutala","ținutal"],"tinutale":"ținutal","tinutalele":"ținutal","tinutali":"ținutal","tinutalii":"ținutal","tinutalul":"ținutal","tinutase":"ținutașă","tinutasei":"ținutașă","tinutasele":"ținutașă","tinutaselor":"ținutașă","tinutasi":"ținutaș","tinutasii":"ținutaș","tinutasilor":"ținutaș","tinutasul":"ținutaș","tinutasule":"ținutaș","tinutasului":"ținutaș","tinute":["ținute","ținut","tinuțe","tinuță","ținute","ținută"],"tinute de seara":"ținută de seară","tinutei":"tinuță","tinutele":["ținutele","ținut","tinuțele","tinuță"],"tinutelor":"tinuță","tinuti":"ținut","tinutii":"ținut","tinutul":"ținut","tinutule":"ținut","tinutului":"ținut","tinuturi":"ținut","tinuturi graniceresti":"ținut grăniceresc","tinuturile":"ținut","tinuturilor":"ținut","tinzand":"tinde","tinzi":"tinde","tioalcoolul":"tioalcool","tioalcoolule":"tioalcool","tioalcoolului":"tioalcool","tioance":"tioancă","tioancei":"tioancă","tioancele":"tioancă","tioancelor":"tioancă","tiocianati":"tiocianat","tiocianatii":"tiocianat","tiocianatilor":"tiocianat","tiocianatul":"tiocianat","tiocianatule":"tiocianat","tiocianatului":"tiocianat","tiocul":"tioc","tiocule":"tioc","tiocului":"tioc","tiocuri":"tioc","tiocurile":"tioc","tiocurilor":"tioc","tiocusoare":"tiocușor","tiocusoarele":"tiocușor","tiocusoarelor":"tiocușor","tiocusorul":"tiocușor","tiocusorule":"tiocușor","tiocusorului":"tiocușor","tiofenul":"tiofen","tiofenule":"tiofen","tiofenului":"tiofen","tiofenuri":"tiofen","tiofenurile":"tiofen","tiofenurilor":"tiofen","tioli":"tiol","tiolii":"tiol","tiolilor":"tiol","tiolul":"tiol","tiolule":"tiol","tiolului":"tiol","tiosulfati":"tiosulfat","tiosulfatii":"tiosulfat","tiosulfatilor":"tiosulfat","tiosulfatul":"tiosulfat","tiosulfatule":"tiosulfat","tiosulfatului":"tiosulfat","tioureea":"tiouree","tioureei":"tiouree","tip":"țipa","tipa":"țâpa","tipai":"țipa","tipam":["țipăm","țipa","țipam","țipa"],"tipand":"țipa","tipara":"țipa","tiparam":"țipa","tiparasi":"țipăraș","tiparasii":"țipăraș","tiparasilor":"țipăraș","tiparasul":"țipăraș","tiparasule":"țipăraș","tiparasului":"țipăraș","tiparati":"țipa","tipare":"tipar","tiparea":["țiparea","țipare","tipărea","tipări"],"tipareai":"tipări","tipaream":"tipări","tipareati":"tipări","tipareau":"tipări","tiparele":["tiparele","tipar","tipărele","tipăreală"],"tiparelei":"tipăreală","tiparelele":"tipăreală","tiparelelor":"tipăreală","tipareli":"tipăreală","tiparelor":"tipar","tiparesc":"tipări","tipareste":"tipări","tiparesti":"tipări","tipari":["țipari","țipar","țipări","țipare"],"tipari de mare":"țipar de mare","tiparia":"tipărie","tipariei":"tipărie","tiparii":["țiparii","țipar","țipării","țipare","tipării","tipări","tipării","tipărie"],"tipariile":"tipărie","tipariilor":"tipărie","tiparile":"țipare","tiparilor":["țiparilor","țipar","țipărilor","țipare"],"tiparim":"tipări","tiparind":"tipări","tiparira":"tipări","tipariram":"tipări","tiparirati":"tipări","tiparirea":"tipărire","tipariri":"tipărire","tiparirii":"tipărire","tiparirile":"tipărire","tiparirilor":"tipărire","tiparise":"tipări","tiparisem":"tipări","tiparisera":"tipări","tipariseram":"tipări","tipariserati":"tipări","tiparisesi":"tipări","tiparisi":"tipări","tiparit":"tipări","tipariti":"tipări","tiparitori":"tipăritor","tiparitorii":"tipăritor","tiparitorilor":"tipăritor","tiparitorul":"tipăritor","tiparitorule":"tipăritor","tiparitorului":"tipăritor","tiparitul":"tipărit","tiparitule":"tipărit","tiparitului":"tipărit","tipariture":"tipăritură","tipariturei":"tipăritură","tipariturele":"tipăritură","tipariturelor":"tipăritură","tiparituri":"tipăritură","tiparne":"tiparnă","tiparnei":"tiparnă","tiparnele":"tiparnă","tiparnelor":"tiparnă","tiparnica":["tiparnică","tiparnic","tiparnica","tiparnic"],"tiparnice":"tiparnic","tiparnicele":"tiparnic","tiparnici":"tiparnic","tiparnicii":"tiparnic","tiparnicilor":"tiparnic","tiparnicul":"tiparnic","tiparnicule":"tiparnic","tiparnicului":"tiparnic","tiparnite":"tiparniță","tiparnitei":"tiparniță","tiparnitele":"tiparniță","tiparnitelor":"tiparniță","tiparoase":"tiparoasă","tiparoasei":"tiparoasă","tiparoasele":"tiparoasă","tiparoaselor":"tiparoasă","tiparuia":"tipărui","tiparuiai":"tipărui","tiparuiam":"tipărui","tiparuiati":"tipărui","tiparuiau":"tipărui","tiparuie":"tipărui","tiparuii":"tipărui","tiparuim":"tipărui","tiparuind":"tipărui","tiparuira":"tipărui","tiparuiram":"tipărui","tiparuirati":"tipărui","tiparuise":"tipărui","tiparuisem":"tipărui","tiparuisera":"tipărui","tiparuiseram":"tipărui","tiparuiserati":"tipărui","tiparuisesi":"tipărui","tiparuisi":"tipărui","tiparuit":"tipărui","tiparuiti":"tipărui","tiparul":["tiparul","tipar","țiparul","țipar"],"tiparule":["tiparule","tipar","țiparule","țipar"],"tiparului":["tiparului","tipar","țiparului","țipar"],"tipase":"țipa","tipasem":"țipa","tipasera":"țipa","tipaseram":"țipa","tipaserati":"țipa","tipasesi":"țipa","tipasi":"țipa","tipat":"țipa","tipata":["țipată","țipat","țipata","țipat"],"tipate":"țipat","tipatele":"țipat","tipati":["țipați","țipa","țipați","țipat"],"tipatii":"țipat","tipato":"țipător","tipatoarea":"țipătoare","tipatoarei":"țipătoare","tipatoarele":"țipătoare","tipatoarelor":"țipătoare","tipatori":"țipător","tipatorii":"țipător","tipatorile":"țipător","tipatorilor":"țipător","tipatul":["țipatul","țipat","țipătul","țipăt"],"tipatule":"țipăt","tipatului":"țipăt","tipau":"țipa","tipe":["tipe","tipă","țipe","țipa"],"tipei":"tipă","tipeicari":"țipeicar","tipeicarii":"țipeicar","tipeicarilor":"țipeicar","tipeicarul":"țipeicar","tipeicarule":"țipeicar","tipeicarului":"țipeicar","tipele":"tipă","tipelor":"tipă","tipenia":"țipenie","tipeniei":"țipenie","tipenii":"țipenie","tipese":"tipesă","tipesei":"tipesă","tipesele":"tipesă","tipeselor":"tipesă","tipete":["țipete","țipăt","țipete","țipet"],"tipetele":["țipetele","țipăt","țipetele","țipet"],"tipetelor":["țipetelor","țipăt","țipetelor","țipet"],"tipetul":"țipet","tipetule":"țipet","tipetului":"țipet","tipi":["tipi","tip","țipi","țipa"],"tipica":["tipică","tipic","tipica","tipic"],"tipicara":["tipicară","tipicar","tipicara","tipicar"],"tipicare":["tipicare","tipicar","tipicare","tipicară"],"tipicarei":"tipicară","tipicarele":["tipicarele","tipicar","tipicarele","tipicară"],"tipicarelor":"tipicară","tipicari":"tipicar","tipicarii":"tipicar","tipicarul":"tipicar","tipice":"tipic","tipicele":"tipic","tipici":"tipic","tipicii":"tipic","tipicitatea":"tipicitate","tipicitati":"tipicitate","tipicitatii":"tipicitate","tipicul":"tipic","tipii":"tip","tipilor":"tip","tipisar":"tibișir","tipisme":"tipism","tipismele":"tipism","tipismelor":"tipism","tipismul":"tipism","tipismule":"tipism","tipismului":"tipism","tipizai":"tipiza","tipizam":["tipizăm","tipiza","tipizam","tipiza"],"tipizand":"tipiza","tipizara":"tipiza","tipizaram":"tipiza","tipizarati":"tipiza","tipizarea":"tipizare","tipizari":"tipizare","tipizarii":"tipizare","tipizarile":"tipizare","tipizarilor":"tipizare","tipizase":"tipiza","tipizasem":"tipiza","tipizasera":"tipiza","tipizaseram":"tipiza","tipizaserati":"tipiza","tipizasesi":"tipiza","tipizasi":"tipiza","tipizat":"tipiza","tipizate":"tipizat","tipizatele":"tipizat","tipizatelor":"tipizat","tipizati":"tipiza","tipizatul":"tipizat","tipizatule":"tipizat","tipizatului":"tipizat","tipizau":"tipiza","tipizeaza":"tipiza","tipizez":"tipiza","tipizezi":"tipiza","tiplici":"țiplică","tiplicii":"țiplică","tiplicile":"țiplică","tiplicilor":"țiplică","tipografe":"tipografă","tipografei":"tipografă","tipografele":"tipografă","tipografelor":"tipografă","tipografi":"tipograf","tipografia":"tipografie","tipografica":["tipografică","tipografic","tipografica","tipografic"],"tipografice":"tipografic","tipograficeasca":["tipograficească","tipograficesc","tipograficeasca","tipograficesc"],"tipograficele":"tipografic","tipograficescul":"tipograficesc","tipograficesti":"tipograficesc","tipograficestii":"tipograficesc","tipograficestile":"tipograficesc","tipografici":"tipografic","tipograficii":"tipografic","tipograficul":"tipografic","tipografiei":"tipografie","tipografii":["tipografii","tipograf","tipografii","tipografie"],"tipografiile":"tipografie","tipografiilor":"tipografie","tipografilor":"tipograf","tipograful":"tipograf","tipografule":"tipograf","tipografului":"tipograf","tipolitografia":"tipolitografie","tipolitografiei":"tipolitografie","tipolitografii":"tipolitografie","tipolitografiile":"tipolitografie","tipolitografiilor":"tipolitografie","tipologia":"tipologie","tipologica":["tipologică","tipologic","tipologica","tipologic"],"tipologice":"tipologic","tipologicele":"tipologic","tipologici":"tipologic","tipologicii":"tipologic","tipologicul":"tipologic","tipologiei":"tipologie","tipologii":"tipologie","tipologiile":"tipologie","tipologiilor":"tipologie","tipometre":"tipometru","tipometrele":"tipometru","tipometrelor":"tipometru","tipometria":"tipometrie","tipometriei":"tipometrie","tipometrii":"tipometrie","tipometrul":"tipometru","tipometrule":"tipometru","tipometrului":"tipometru","tipotea":"țipoti","tipoteai":"țipoti","tipoteam":"țipoti","tipoteati":"țipoti","tipoteau":"țipoti","tipotesc":"țipoti","tipoteste":"țipoti","tipotesti":"țipoti","tipotii":"țipoti","tipotim":"țipoti","tipotind":"țipoti","tipotira":"țipoti","tipotiram":"țipoti","tipotirati":"țipoti","tipotise":"țipoti","tipotisem":"țipoti","tipotisera":"țipoti","tipotiseram":"țipoti","tipotiserati":"țipoti","tipotisesi":"țipoti","tipotisi":"țipoti","tipotit":"țipoti","tipotiti":"țipoti","tipsia":"tipsie","tipsiei":"tipsie","tipsii":"tipsie","tipsiile":"tipsie","tipsiilor":"tipsie","tipsioare":"tipsioară","tipsioarei":"tipsioară","tipsioarele":"tipsioară","tipsioarelor":"tipsioară","tipsiute":"tipsiuță","tipsiutei":"tipsiuță","tipsiutele":"tipsiuță","tipsiutelor":"tipsiuță","tiptine":"tiptină","tiptinei":"tiptină","tipul":"tip","tipule":"tip","tipulite":"țipuliță","tipulitei":"țipuliță","tipulitele":"țipuliță","tipulitelor":"țipuliță","tipului":"tip","tipuri":"tip","tipuri de date":"tip de date","tipurile":"tip","tipurilor":"tip","tirade":"tiradă","tiradei":"tiradă","tiradele":"tiradă","tiradelor":"tiradă","tiraje":"tiraj","tirajele":"tiraj","tirajelor":"tiraj","tirajul":"tiraj","tirajule":"tiraj","tirajului":"tiraj","tiraliori":"tiralior","tiraliorii":"tiralior","tiraliorilor":"tiralior","tiraliorul":"tiralior","tiraliorule":"tiralior","tiraliorului":"tiralior","tiramisul":"tiramisu","tiramisule":"tiramisu","tiramisului":"tiramisu","tirane":"tirană","tiraneasca":["tirănească","tirănesc","tirăneasca","tirănesc"],"tiranei":"tirană","tiranele":"tirană","tiranelor":"tirană","tiranescul":"tirănesc","tiranesti":"tirănesc","tiranestii":"tirănesc","tiranestile":"tirănesc","tirani":"tiran","tirania":["tirania","tiranie","tirănia","tirănie"],"tiranica":["tiranică","tiranic","tiranica","tiranic"],"tiranice":"tiranic","tiraniceasca":["tiranicească","tiranicesc","tiraniceasca","tiranicesc"],"tiranicele":"tiranic","tiranicescul":"tiranicesc","tiranicesti":"tiranicesc","tiranicestii":"tiranicesc","tiranicestile":"tiranicesc","tiranici":"tiranic","tiranicide":"tiranicid","tiranicidele":"tiranicid","tiranicidelor":"tiranicid","tiranicidul":"tiranicid","tiranicidule":"tiranicid","tiranicidului":"tiranicid","tiranicii":"tiranic","tiranicul":"tiranic","tiraniei":["tiraniei","tiranie","tirăniei","tirănie"],"tiranii":["tiranii","tiran","tiranii","tiranie","tirănii","tirănie"],"tiraniile":["tiraniile","tiranie","tirăniile","tirănie"],"tiraniilor":["tiraniilor","tiranie","tirăniilor","tirănie"],"tiranilor":"tiran","tiranisea":"tiranisi","tiraniseai":"tiranisi","tiraniseam":"tiranisi","tiraniseati":"tiranisi","tiraniseau":"tiranisi","tiranisesc":"tiranisi","tiraniseste":"tiranisi","tiranisesti":"tiranisi","tiranisii":"tiranisi","tiranisim":"tiranisi","tiranisind":"tiranisi","tiranisira":"tiranisi","tiranisiram":"tiranisi","tiranisirati":"tiranisi","tiranisise":"tiranisi","tiranisisem":"tiranisi","tiranisisera":"tiranisi","tiranisiseram":"tiranisi","tiranisiserati":"tiranisi","tiranisisesi":"tiranisi","tiranisisi":"tiranisi","tiranisit":"tiranisi","tiranisiti":"tiranisi","tiranismul":"tiranism","tiranismule":"tiranism","tiranismului":"tiranism","tiranizai":"tiraniza","tiranizam":["tiranizăm","tiraniza","tiranizam","tiraniza"],"tiranizand":"tiraniza","tiranizara":"tiraniza","tiranizaram":"tiraniza","tiranizarati":"tiraniza","tiranizarea":"tiranizare","tiranizari":"tiranizare","tiranizarii":"tiranizare","tiranizase":"tiraniza","tiranizasem":"tiraniza","tiranizasera":"tiraniza","tiranizaseram":"tiraniza","tiranizaserati":"tiraniza","tiranizasesi":"tiraniza","tiranizasi":"tiraniza","tiranizat":"tiraniza","tiranizati":"tiraniza","tiranizau":"tiraniza","tiranizeaza":"tiraniza","tiranizez":"tiraniza","tiranizezi":"tiraniza","tiranozauri":"tiranozaur","tiranozaurii":"tiranozaur","tiranozaurilor":"tiranozaur","tiranozaurul":"tiranozaur","tiranozaurule":"tiranozaur","tiranozaurului":"tiranozaur","tiranul":"tiran","tiranule":"tiran","tiranului":"tiran","tiratroane":"tiratron","tiratroanele":"tiratron","tiratroanelor":"tiratron","tiratronul":"tiratron","tiratronule":"tiratron","tiratronului":"tiratron","tirbusoane":"tirbușon","tircalane":"țircălan","tircalanele":"țircălan","tircalanelor":"țircălan","tircalanul":"țircălan","tircalanule":"țircălan","tircalanului":"țircălan","tireoglobuline":"tireoglobulină","tireoglobulinei":"tireoglobulină","tireoglobulinele":"tireoglobulină","tireoglobulinelor":"tireoglobulină","tireotomia":"tireotomie","tireotomiei":"tireotomie","tireotomii":"tireotomie","tireotomiile":"tireotomie","tireotomiilor":"tireotomie","tireotoxicoze":"tireotoxicoză","tireotoxicozei":"tireotoxicoză","tireotoxicozele":"tireotoxicoză","tireotoxicozelor":"tireotoxicoză","tireotropul":"tireotrop","tireotropule":"tireotrop","tireotropului":"tireotrop","tiriachia":"tiriachiu","tiriachie":"tiriachiu","tiriachii":"tiriachiu","tiriachiii":"tiriachiu","tiriachiile":"tiriachiu","tiriachiul":"tiriachiu","tiriacul":"tiriac","tiriacule":"tiriac","tiriacului":"tiriac","tiribombe":"tiribombă","tiribombei":"tiribombă","tiribombele":"tiribombă","tiribombelor":"tiribombă","tirighia":"tirighie","tirighiei":"tirighie","tirighii":"tirighie","tirigia":"tirigie","tirigiei":"tirigie","tirigii":"tirigie","tirispolea":"Tiraspol","tiristoare":"tiristor","tiristoarele":"tiristor","tiristoarelor":"tiristor","tiristorul":"tiristor","tiristorule":"tiristor","tiristorului":"tiristor","tirizia":"tirizie","tiriziei":"tirizie","tirizii":"tirizie","tiriziile":"tirizie","tiriziilor":"tirizie","tiroida":["tiroidă","tiroid","tiroida","tiroid"],"tiroide":["tiroide","tiroid","tiroide","tiroidă"],"tiroidectomia":"tiroidectomie","tiroidectomiei":"tiroidectomie","tiroidectomii":"tiroidectomie","tiroidectomiile":"tiroidectomie","tiroidectomiilor":"tiroidectomie","tiroidei":"tiroidă","tiroidele":["tiroidele","tiroid","tiroidele","tiroidă"],"tiroidelor":"tiroidă","tiroidiana":["tiroidiană","tiroidian","tiroidiana","tiroidian"],"tiroidianul":"tiroidian","tiroidiene":"tiroidian","tiroidienele":"tiroidian","tiroidieni":"tiroidian","tiroidienii":"tiroidian","tiroidismi":"tiroidism","tiroidismii":"tiroidism","tiroidismilor":"tiroidism","tiroidismul":"tiroidism","tiroidismule":"tiroidism","tiroidismului":"tiroidism","tiroidite":"tiroidită","tiroiditei":"tiroidită","tiroiditele":"tiroidită","tiroiditelor":"tiroidită","tiroidul":"tiroid","tiroizi":"tiroid","tiroizii":"tiroid","tiroleza":["tiroleză","tirolez","tiroleza","tirolez"],"tiroleze":["tiroleze","tirolez","tiroleze","tiroleză"],"tirolezei":"tiroleză","tirolezele":["tirolezele","tirolez","tirolezele","tiroleză"],"tirolezelor":"tiroleză","tirolezi":"tirolez","tirolezii":"tirolez","tirolezilor":"tirolez","tirolezul":"tirolez","tirolezule":"tirolez","tirolezului":"tirolez","tirotomia":"tirotomie","tirotomiei":"tirotomie","tirotomii":"tirotomie","tirotomiile":"tirotomie","tirotomiilor":"tirotomie","tiroxine":"tiroxină","tiroxinei":"tiroxină","tiroxinele":"tiroxină","tiroxinelor":"tiroxină","tirozine":"tirozină","tirozinei":"tirozină","tirozinele":"tirozină","tirozinelor":"tirozină","tirsoida":["tirsoidă","tirsoid","tirsoida","tirsoid"],"tirsoide":"tirsoid","tirsoidele":"tirsoid","tirsoidul":"tirsoid","tirsoizi":"tirsoid","tirsoizii":"tirsoid","tirtip":"tertip","tirul":"tir","tirule":"tir","tirulici":"țirulic","tirulicii":"țirulic","tirulicilor":"țirulic","tirulicul":"țirulic","tirulicule":"țirulic","tirulicului":"țirulic","tirului":"tir","tirziu":"târziu","tisaie":"tisău","tisaiele":"tisău","tisaielor":"tisău","tisauul":"tisău","tisauule":"tisău","tisauului":"tisău","tise":"tisă","tisei":"tisă","tisele":"tisă","tiselor":"tisă","tisi":"tis","tisii":"tis","tisilor":"tis","tislaria":"tișlărie","tislariei":"tișlărie","tislarii":"tișlărie","tislariile":"tișlărie","tislariilor":"tișlărie","tisnea":"țișni","tisneai":"țișni","tisneam":"țișni","tisneati":"țișni","tisneau":"țișni","tisnesc":"țișni","tisneste":"țișni","tisnesti":"țișni","tisnii":"țișni","tisnim":"țișni","tisnind":"țișni","tisnira":"țișni","tisniram":"țișni","tisnirati":"țișni","tisnise":"țișni","tisnisem":"țișni","tisnisera":"țișni","tisniseram":"țișni","tisniserati":"țișni","tisnisesi":"țișni","tisnisi":"țișni","tisnit":"țișni","tisniti":"țișni","tisoiul":"tisoi","tisoiule":"tisoi","tisoiului":"tisoi","tistimele":"tistimel","tistimelele":"tistimel","tistimelelor":"tistimel","tistimelul":"tistimel","tistimelule":"tistimel","tistimelului":"tistimel","tistul":"tist","tistule":"tist","tistului":"tist","tisturi":"tist","tisturice":"tișturică","tisturicei":"tișturică","tisturile":"tist","tisturilor":"tist","tisul":"tis","tisulara":["tisulară","tisular","tisulara","tisular"],"tisulare":"tisular","tisularele":"tisular","tisulari":"tisular","tisularii":"tisular","tisularul":"tisular","tisule":"tis","tisului":"tis","tita":["țiță","țâță","țîță","țâță"],"titaneasca":["titanească","titanesc","titaneasca","titanesc"],"titanescul":"titanesc","titanesti":"titanesc","titanestii":"titanesc","titanestile":"titanesc","titani":"titan","titanica":["titanică","titanic","titanica","titanic"],"titanice":"titanic","titanicele":"titanic","titanici":"titanic","titanicii":"titanic","titanicul":"titanic","titanifera":["titaniferă","titanifer","titanifera","titanifer"],"titanifere":"titanifer","titaniferele":"titanifer","titaniferi":"titanifer","titaniferii":"titanifer","titaniferul":"titanifer","titanii":"titan","titanilor":"titan","titanismul":"titanism","titanismule":"titanism","titanismului":"titanism","titanitul":"titanit","titanitule":"titanit","titanitului":"titanit","titanituri":"titanit","titaniturile":"titanit","titaniturilor":"titanit","titaniuul":"titaniu","titaniuule":"titaniu","titaniuului":"titaniu","titanul":"titan","titanule":"titan","titanului":"titan","titci":"titcă","titcii":"titcă","titcile":"titcă","titcilor":"titcă","tite":"țiță","titei":"țiță","titeiul":"țiței","titeiule":"țiței","titeiului":"țiței","titeiuri":"țiței","titeiurile":"țiței","titeiurilor":"țiței","titele":"țiță","titelor":"țiță","titere":"țiteră","titerei":"țiteră","titerele":"țiteră","titerelor":"țiteră","titini":"țițină","titinii":"țițină","titinile":"țițină","titinilor":"țițină","titirea":"titiri","titireai":"titiri","titiream":"titiri","titireati":"titiri","titireau":"titiri","titiresc":"titiri","titireste":"titiri","titiresti":"titiri","titirezi":"titirez","titirezii":"titirez","titirezilor":"titirez","titirezul":"titirez","titirezule":"titirez","titirezului":"titirez","titirii":"titiri","titirim":"titiri","titirind":"titiri","titirira":"titiri","titiriram":"titiri","titirirati":"titiri","titirise":"titiri","titirisea":"titirisi","titiriseai":"titirisi","titiriseam":"titirisi","titiriseati":"titirisi","titiriseau":"titirisi","titirisem":"titiri","titirisera":"titiri","titiriseram":"titiri","titiriserati":"titiri","titirisesc":"titirisi","titirisesi":"titiri","titiriseste":"titirisi","titirisesti":"titirisi","titirisi":"titiri","titirisii":"titirisi","titirisim":"titirisi","titirisind":"titirisi","titirisira":"titirisi","titirisiram":"titirisi","titirisirati":"titirisi","titirisise":"titirisi","titirisisem":"titirisi","titirisisera":"titirisi","titirisiseram":"titirisi","titirisiserati":"titirisi","titirisisesi":"titirisi","titirisisi":"titirisi","titirisit":"titirisi","titirisiti":"titirisi","titirit":"titiri","titiriti":"titiri","titiunul":"titiun","titiunule":"titiun","titiunului":"titiun","titiunuri":"titiun","titiunurile":"titiun","titiunurilor":"titiun","titluirea":"titluire","titluiri":"titluire","titluirii":"titluire","titluirile":"titluire","titluirilor":"titluire","titlul":"titlu","titlule":"titlu","titlului":"titlu","titluri":"titlu","titluri de valoare":"titlu de valoare","titlurile":"titlu","titlurilor":"titlu","titori":"titor","titorii":"titor","titorilor":"titor","titorul":"titor","titorule":"titor","titorului":"titor","titrai":"titra","titram":["titrăm","titra","titram","titra"],"titrand":"titra","titrara":"titra","titraram":"titra","titrarati":"titra","titrarea":"titrare","titrari":"titrare","titrarii":"titrare","titrarile":"titrare","titrarilor":"titrare","titrase":"titra","titrasem":"titra","titrasera":"titra","titraseram":"titra","titraserati":"titra","titrasesi":"titra","titrasi":"titra","titrat":"titra","titrata":["titrată","titrat","titrata","titrat"],"titrate":["titrate","titrat","titrate","titrată"],"titratei":"titrată","titratele":["titratele","titrat","titratele","titrată"],"titratelor":"titrată","titrati":["titrați","titra","titrați","titrat"],"titratii":"titrat","titratoarea":"titratoare","titratoarei":"titratoare","titratoarele":"titratoare","titratoarelor":"titratoare","titratori":"titrator","titratorii":"titrator","titratorilor":"titrator","titratorul":"titrator","titratorule":"titrator","titratorului":"titrator","titratul":"titrat","titrau":"titra","titre":["țitre","țitră","titre","titru"],"titreaza":"titra","titrei":"țitră","titrele":["țitrele","țitră","titrele","titru"],"titrelor":["țitrelor","țitră","titrelor","titru"],"titrez":"titra","titrezi":"titra","titrimetria":"titrimetrie","titrimetriei":"titrimetrie","titrimetrii":"titrimetrie","titrul":"titru","titrule":"titru","titrului":"titru","titubanta":["titubantă","titubant","titubanta","titubant"],"titubante":"titubant","titubantele":"titubant","titubanti":"titubant","titubantii":"titubant","titubantul":"titubant","titubatia":"titubație","titubatiei":"titubație","titubatii":"titubație","titubatiile":"titubație","titubatiilor":"titubație","titulare":"titulară","titularei":"titulară","titularele":"titulară","titularelor":"titulară","titulari":"titular","titularii":"titular","titularilor":"titular","titularizai":"titulariza","titularizam":["titularizăm","titulariza","titularizam","titulariza"],"titularizand":"titulariza","titularizara":"titulariza","titularizaram":"titulariza","titularizarati":"titulariza","titularizarea":"titularizare","titularizari":"titularizare","titularizarii":"titularizare","titularizarile":"titularizare","titularizarilor":"titularizare","titularizase":"titulariza","titularizasem":"titulariza","titularizasera":"titulariza","titularizaseram":"titulariza","titularizaserati":"titulariza","titularizasesi":"titulariza","titularizasi":"titulariza","titularizat":"titulariza","titularizata":["titularizată","titularizat","titularizata","titularizat"],"titularizate":"titularizat","titularizatele":"titularizat","titularizati":["titularizați","titulariza","titularizați","titularizat"],"titularizatii":"titularizat","titularizatul":"titularizat","titularizau":"titulariza","titularizeaza":"titulariza","titularizez":"titulariza","titularizezi":"titulariza","titularul":"titular","titularule":"titular","titularului":"titular","titulaturi":"titulatură","titulaturii":"titulatură","titulaturile":"titulatură","titulaturilor":"titulatură","titule":"titulă","titulei":"titulă","titulele":"titulă","titulelor":"titulă","titve":"titvă","titvei":"titvă","titvele":"titvă","titvelor":"titvă","tiuia":"țiui","tiuiai":"țiui","tiuiam":"țiui","tiuiati":"țiui","tiuiau":"țiui","tiuie":"țiui","tiuii":"țiui","tiuim":"țiui","tiuind":"țiui","tiuira":"țiui","tiuiram":"țiui","tiuirati":"țiui","tiuise":"țiui","tiuisem":"țiui","tiuisera":"țiui","tiuiseram":"țiui","tiuiserati":"țiui","tiuisesi":"țiui","tiuisi":"țiui","tiuit":"țiui","tiuiti":"țiui","tiuitoare":"țiuitor","tiuitoarea":["țiuitoarea","țiuitoare","țiuitoarea","țiuitor"],"tiuitoarei":"țiuitoare","tiuitoarele":["țiuitoarele","țiuitoare","țiuitoarele","țiuitor"],"tiuitoarelor":"țiuitoare","tiuitori":"țiuitor","tiuitorii":"țiuitor","tiuitorul":"țiuitor","tiuitul":"țiuit","tiuitule":"țiuit","tiuitului":"țiuit","tiuituri":["țiuituri","țiuit","țiuituri","țiuitură"],"tiuiturii":"țiuitură","tiuiturile":["țiuiturile","țiuit","țiuiturile","țiuitură"],"tiuiturilor":["țiuiturilor","țiuit","țiuiturilor","țiuitură"],"tiulcute":"tiulcuță","tiulcutei":"tiulcuță","tiulcutele":"tiulcuță","tiulcutelor":"tiulcuță","tiutiunul":"tiutiun","tiutiunule":"tiutiun","tiutiunului":"tiutiun","tiutiunuri":"tiutiun","tiutiunurile":"tiutiun","tiutiunurilor":"tiutiun","tiutiuroiul":"tiutiuroi","tiutiuroiule":"tiutiuroi","tiutiuroiului":"tiutiuroi","tivde":"tivdă","tivdei":"tivdă","tivdele":"tivdă","tivdelor":"tivdă","tivea":"tivi","tiveai":"tivi","tiveam":"tivi","tiveati":"tivi","tiveau":"tivi","tivele":"tiveală","tivelei":"tiveală","tivelele":"tiveală","tivelelor":"tiveală","tiveli":"tiveală","tivesc":"tivi","tiveste":"tivi","tivesti":"tivi","tivgi":"tivgă","tivgii":"tivgă","tivgile":"tivgă","tivgilor":"tivgă","tivii":"tivi","tivila":["țivilă","țivil","țivila","țivil"],"tivilchia":"tivilchie","tivilchiei":"tivilchie","tivilchii":"tivilchie","tivilchiile":"tivilchie","tivilchiilor":"tivilchie","tivile":"țivil","tivilele":"țivil","tivili":"țivil","tivilia":"țivilie","tivilichia":"tivilichiu","tivilichie":"tivilichiu","tivilichii":"tivilichiu","tivilichiii":"tivilichiu","tivilichiile":"tivilichiu","tivilichiul":"tivilichiu","tiviliei":"țivilie","tivilii":["țivilii","țivil","țivilii","țivilie"],"tivilul":"țivil","tivim":"tivi","tivind":"tivi","tivira":"tivi","tiviram":"tivi","tivirati":"tivi","tivise":"tivi","tivisem":"tivi","tivisera":"tivi","tiviseram":"tivi","tiviserati":"tivi","tivisesi":"tivi","tivisi":"tivi","tivit":"tivi","tiviti":"tivi","tiviture":"tivitură","tiviturei":"tivitură","tiviturele":"tivitură","tiviturelor":"tivitură","tivituri":"tivitură","tivul":"tiv","tivule":"tiv","tivulete":"tivuleț","tivuletele":"tivuleț","tivuletelor":"tivuleț","tivuletul":"tivuleț","tivuletule":"tivuleț","tivuletului":"tivuleț","tivului":"tiv","tivuri":"tiv","tivurile":"tiv","tivurilor":"tiv","tixotropa":["tixotropă","tixotrop","tixotropa","tixotrop"],"tixotrope":"tixotrop","tixotropele":"tixotrop","tixotropi":"tixotrop","tixotropia":"tixotropie","tixotropiei":"tixotropie","tixotropii":["tixotropii","tixotrop","tixotropii","tixotropie"],"tixotropul":"tixotrop","tizane":"tizană","tizanei":"tizană","tizanele":"tizană","tizanelor":"tizană","tize":"tiză","tizei":"tiză","tizele":"tiză","tizelor":"tiză","tizi":"tiz","tizicul":"tizic","tizicule":"tizic","tizicului":"tizic","tizicuri":"tizic","tizicurile":"tizic","tizicurilor":"tizic","tizii":"tiz","tizilor":"tiz","tizul":"tiz","tizule":"tiz","tizului":"tiz","tmeze":"tmeză","tmezei":"tmeză","tmezele":"tmeză","tmezelor":"tmeză","tn":"tine","toaca":"toca","toace":["toace","toacă","toace","toca"],"toacei":"toacă","toacele":"toacă","toacelor":"toacă","toale":"țoală","toalei":"țoală","toalele":"țoală","toalelor":"țoală","toaletai":"toaleta","toaletam":["toaletăm","toaleta","toaletam","toaleta"],"toaletand":"toaleta","toaletara":"toaleta","toaletaram":"toaleta","toaletarati":"toaleta","toaletase":"toaleta","toaletasem":"toaleta","toaletasera":"toaleta","toaletaseram":"toaleta","toaletaserati":"toaleta","toaletasesi":"toaleta","toaletasi":"toaleta","toaletat":"toaleta","toaletati":"toaleta","toaletau":"toaleta","toalete":"toaletă","toaleteaza":"toaleta","toaletei":"toaletă","toaletele":"toaletă","toaletelor":"toaletă","toaletez":"toaleta","toaletezi":"toaleta","toamne":"toamnă","toamnei":"toamnă","toamnele":"toamnă","toamnelor":"toamnă","toane":"toană","toanei":"toană","toanele":"toană","toanelor":"toană","toanta":["toantă","tont","toanta","tont"],"toante":["toante","toantă","toante","tont"],"toantei":"toantă","toantele":["toantele","toantă","toantele","tont"],"toantelor":"toantă","toape":"țoapă","toapei":"țoapă","toapele":"țoapă","toapelor":"țoapă","toapsac":"toapsec","toapsec":"topseca","toapseca":"topseca","toapsece":"toapsec","toapsecele":"toapsec","toapsecelor":"toapsec","toapseci":"topseca","toapsecul":"toapsec","toapsecule":"toapsec","toapsecului":"toapsec","toarca":"toarce","toarcem":"toarce","toarcerea":"toarcere","toarceri":"toarcere","toarcerii":"toarcere","toarcerile":"toarcere","toarcerilor":"toarcere","toarceti":"toarce","toarna":"turna","toarna ulei pe foc":"turna ulei pe foc","toarse":"toarce","toarsera":"toarce","toarseram":"toarce","toarserati":"toarce","toarte":"toartă","toartei":"toartă","toartele":"toartă","toartelor":"toartă","toastai":"toasta","toastam":["toastăm","toasta","toastam","toasta"],"toastand":"toasta","toastara":"toasta","toastaram":"toasta","toastarati":"toasta","toastase":"toasta","toastasem":"toasta","toastasera":"toasta","toastaseram":"toasta","toastaserati":"toasta","toastasesi":"toasta","toastasi":"toasta","toastat":"toasta","toastati":"toasta","toastau":"toasta","toasteaza":"toasta","toastez":"toasta","toastezi":"toasta","toastul":"toast","toastule":"toast","toastului":"toast","toasturi":"toast","toasturile":"toast","toasturilor":"toast","toata":"tot","toate":"tot","tobagoana":["tobagoană","tobagoan","tobagoana","tobagoan"],"tobagoane":["tobagoane","tobagoan","tobagoane","tobagoană"],"tobagoanei":"tobagoană","tobagoanele":["tobagoanele","tobagoan","tobagoanele","tobagoană"],"tobagoanelor":"tobagoană","tobagoani":"tobagoan","tobagoanii":"tobagoan","tobagoanilor":"tobagoan","tobagoanul":"tobagoan","tobagoanule":"tobagoan","tobagoanului":"tobagoan","tobasi":"tobaș","tobasii":"tobaș","tobasilor":"tobaș","tobasul":"tobaș","tobasule":"tobaș","tobasului":"tobaș","tobe":"tobă","tobe de esapament":"tobă de eșapament","tobei":"tobă","tobele":"tobă","tobelor":"tobă","tobite":"tobiță","tobitei":"tobiță","tobitele":"tobiță","tobitelor":"tobiță","tobogane":"tobogan","toboganele":"tobogan","toboganelor":"tobogan","toboganul":"tobogan","toboganule":"tobogan","toboganului":"tobogan","tobosari":"toboșar","tobosarii":"toboșar","tobosarilor":"toboșar","tobosarul":"toboșar","tobosarule":"toboșar","tobosarului":"toboșar","tobsoare":"tobșoară","tobsoarei":"tobșoară","tobsoarele":"tobșoară","tobsoarelor":"tobșoară","toc":"toca","tocai":"toca","tocaia":"țocăi","tocaiai":"țocăi","tocaiam":"țocăi","tocaiati":"țocăi","tocaiau":"țocăi","tocaie":"țocăi","tocaii":"țocăi","tocaim":"țocăi","tocaind":"țocăi","tocaira":"țocăi","tocairam":"țocăi","tocairati":"țocăi","tocaise":"țocăi","tocaisem":"țocăi","tocaisera":"țocăi","tocaiseram":"țocăi","tocaiserati":"țocăi","tocaisesi":"țocăi","tocaisi":"țocăi","tocait":"țocăi","tocaiti":"țocăi","tocaitul":"țocăit","tocaitule":"țocăit","tocaitului":"țocăit","tocaituri":"țocăit","tocaiturile":"țocăit","tocaiturilor":"țocăit","tocam":["tocăm","toca","tocam","toca"],"tocand":"toca","tocane":"tocană","tocanea":"tocăni","tocaneai":"tocăni","tocaneam":"tocăni","tocaneati":"tocăni","tocaneau":"tocăni","tocanei":"tocană","tocanele":["tocanele","tocană","tocănele","tocăneală"],"tocanelei":"tocăneală","tocanelele":"tocăneală","tocanelelor":"tocăneală","tocaneli":"tocăneală","tocanelor":"tocană","tocanesc":"tocăni","tocaneste":"tocăni","tocanesti":"tocăni","tocanii":"tocăni","tocanim":"tocăni","tocanind":"tocăni","tocanira":"tocăni","tocaniram":"tocăni","tocanirati":"tocăni","tocanirea":"tocănire","tocaniri":"tocănire","tocanirii":"tocănire","tocanirile":"tocănire","tocanirilor":"tocănire","tocanise":"tocăni","tocanisem":"tocăni","tocanisera":"tocăni","tocaniseram":"tocăni","tocaniserati":"tocăni","tocanisesi":"tocăni","tocanisi":"tocăni","tocanit":"tocăni","tocanite":"tocăniță","tocanitei":"tocăniță","tocanitele":"tocăniță","tocanitelor":"tocăniță","tocaniti":"tocăni","tocanituri":"tocănitură","tocaniturii":"tocănitură","tocaniturile":"tocănitură","tocaniturilor":"tocănitură","tocara":"toca","tocaram":"toca","tocarati":"toca","tocase":"toca","tocasem":"toca","tocasera":"toca","tocaseram":"toca","tocaserati":"toca","tocasesi":"toca","tocasi":"toca","tocat":"toca","tocata":["tocată","tocat","tocata","tocat"],"tocate":"tocat","tocatele":"tocat","tocati":["tocați","toca","tocați","tocat"],"tocatii":"tocat","tocatine":"tocatină","tocatinei":"tocatină","tocatinele":"tocatină","tocatinelor":"tocatină","tocatoare":"tocător","tocatoarea":"tocătoare","tocatoarele":"tocător","tocatoarelor":"tocător","tocatori":"tocătoare","tocatorii":"tocătoare","tocatorile":"tocătoare","tocatorilor":"tocătoare","tocatorul":"tocător","tocatorule":"tocător","tocatorului":"tocător","tocatul":"tocat","tocaturi":"tocătură","tocaturii":"tocătură","tocaturile":"tocătură","tocaturilor":"tocătură","tocau":"toca","tocea":"toci","toceai":"toci","toceam":"toci","toceati":"toci","toceau":"toci","toceli":"toceală","tocelii":"toceală","tocelile":"toceală","tocelilor":"toceală","tocesc":"toci","toceste":"toci","tocesti":"toci","tochite":"tochiță","tochitei":"tochiță","tochitele":"tochiță","tochitelor":"tochiță","tochitura":"topitură","tochituri":"tochitură","tochiturii":"tochitură","tochiturile":"tochitură","tochiturilor":"tochitură","toci":["toci","toca","toci","tocă"],"tocii":["tocii","tocă","tocii","toci"],"tocilare":"tocilară","tocilarei":"tocilară","tocilarele":"tocilară","tocilarelor":"tocilară","tocilari":"tocilar","tocilaria":"tocilărie","tocilariei":"tocilărie","tocilarii":["tocilarii","tocilar","tocilării","tocilărie"],"tocilarilor":"tocilar","tocilarul":"tocilar","tocilarule":"tocilar","tocilarului":"tocilar","tocile":["tocile","tocă","tocile","tocilă"],"tocilei":"tocilă","tocilele":"tocilă","tocilelor":"tocilă","tocilor":"tocă","tocim":"toci","tocind":"toci","tocira":"toci","tociram":"toci","tocirati":"toci","tocirea":"tocire","tociri":"tocire","tocirii":"tocire","tocirile":"tocire","tocirilor":"tocire","tocise":"toci","tocisem":"toci","tocisera":"toci","tociseram":"toci","tociserati":"toci","tocisesi":"toci","tocisi":"toci","tocit":"toci","tocita":["tocită","tocit","tocita","tocit"],"tocite":"tocit","tocitele":"tocit","tociti":["tociți","toci","tociți","tocit"],"tocitii":"tocit","tocitoarea":"tocitoare","tocitoarei":"tocitoare","tocitoarele":"tocitoare","tocitoarelor":"tocitoare","tocitori":"tocitor","tocitorii":"tocitor","tocitorilor":"tocitor","tocitorul":"tocitor","tocitorule":"tocitor","tocitorului":"tocitor","tocitul":"tocit","tocmace":"tocmac","tocmacele":"tocmac","tocmacelor":"tocmac","tocmacul":"tocmac","tocmacule":"tocmac","tocmacului":"tocmac","tocmagei":"tocmăgel","tocmageii":"tocmăgel","tocmageilor":"tocmăgel","tocmageiul":"tocmăgei","tocmageiule":"tocmăgei","tocmageiului":"tocmăgei","tocmagelul":"tocmăgel","tocmagelule":"tocmăgel","tocmagelului":"tocmăgel","tocmagii":"tocmagi","tocmagilor":"tocmagi","tocme":"tocmă","tocmea":"tocmi","tocmeai":"tocmi","tocmeam":"tocmi","tocmeati":"tocmi","tocmeau":"tocmi","tocmei":"tocmă","tocmele":["tocmele","tocmă","tocmele","tocmală"],"tocmelei":"tocmală","tocmelele":"tocmală","tocmelelor":"tocmală","tocmeli":["tocmeli","tocmală","tocmeli","tocmeală"],"tocmelii":"tocmeală","tocmelile":"tocmeală","tocmelilor":"tocmeală","tocmelor":"tocmă","tocmesc":"tocmi","tocmeste":"tocmi","tocmesti":"tocmi","tocmii":"tocmi","tocmim":"tocmi","tocmind":"tocmi","tocmira":"tocmi","tocmiram":"tocmi","tocmirati":"tocmi","tocmirea":"tocmire","tocmiri":"tocmire","tocmirii":"tocmire","tocmise":"tocmi","tocmisem":"tocmi","tocmisera":"tocmi","tocmiseram":"tocmi","tocmiserati":"tocmi","tocmisesi":"tocmi","tocmisi":"tocmi","tocmisul":"tocmiș","tocmisule":"tocmiș","tocmisului":"tocmiș","tocmit":"tocmi","tocmiti":"tocmi","tocmitori":"tocmitor","tocmitorii":"tocmitor","tocmitorilor":"tocmitor","tocmitorul":"tocmitor","tocmitorule":"tocmitor","tocmitorului":"tocmitor","tocoferolul":"tocoferol","tocoferolule":"tocoferol","tocoferolului":"tocoferol","tocologia":"tocologie","tocologiei":"tocologie","tocologii":"tocologie","tocsine":"tocsin","tocsinele":"tocsin","tocsinelor":"tocsin","tocsinul":"tocsin","tocsinule":"tocsin","tocsinului":"tocsin","tocul":"toc","tocule":"toc","toculete":"toculeț","toculetele":"toculeț","toculetelor":"toculeț","toculetul":"toculeț","toculetule":"toculeț","toculetului":"toculeț","tocului":"toc","tocuri":"toc","tocurile":"toc","tocurilor":"toc","tofusul":"tofus","tofusule":"tofus","tofusului":"tofus","tofusuri":"tofus","tofusurile":"tofus","tofusurilor":"tofus","togi":"togă","togii":"togă","togile":"togă","togilor":"togă","togoleze":"togoleză","togolezei":"togoleză","togolezele":"togoleză","togolezelor":"togoleză","toharice":"toharică","toharicei":"toharică","toharicele":"toharică","toharicelor":"toharică","toiege":"toiag","toiegele":"toiegel","toiegelele":"toiegel","toiegelelor":"toiegel","toiegelul":"toiegel","toiegelule":"toiegel","toiegelului":"toiegel","toiegute":"toieguț","toiegutele":"toieguț","toiegutelor":"toieguț","toiegutul":"toieguț","toiegutule":"toieguț","toiegutului":"toieguț","toii":"țoi","toilor":"țoi","toitanei":"toitănel","toitanela":["toitănelă","toitănel","toitănela","toitănel"],"toitanele":"toitănel","toitanelele":"toitănel","toitaneli":"toitănel","toitanelii":"toitănel","toitanelul":"toitănel","toiul":["toiul","toi","țoiul","țoi"],"toiule":["toiule","toi","țoiule","țoi"],"toiului":["toiului","toi","țoiului","țoi"],"toiuri":"toi","toiurile":"toi","toiurilor":"toi","tojerai":"tojera","tojeram":["tojerăm","tojera","tojeram","tojera"],"tojerand":"tojera","tojerara":"tojera","tojeraram":"tojera","tojerarati":"tojera","tojerase":"tojera","tojerasem":"tojera","tojerasera":"tojera","tojeraseram":"tojera","tojeraserati":"tojera","tojerasesi":"tojera","tojerasi":"tojera","tojerat":"tojera","tojerati":"tojera","tojerau":"tojera","tojereaza":"tojera","tojerez":"tojera","tojerezi":"tojera","tokiote":"tokiotă","tokiotei":"tokiotă","tokiotele":"tokiotă","tokiotelor":"tokiotă","tokioti":"tokiot","tokiotii":"tokiot","tokiotilor":"tokiot","tokiotul":"tokiot","tokiotule":"tokiot","tokiotului":"tokiot","tol":"țoală","tolanea":"tolăni","tolaneai":"tolăni","tolaneam":"tolăni","tolaneati":"tolăni","tolaneau":"tolăni","tolanele":"tolăneală","tolanelei":"tolăneală","tolanelele":"tolăneală","tolanelelor":"tolăneală","tolaneli":"tolăneală","tolanesc":"tolăni","tolaneste":"tolăni","tolanesti":"tolăni","tolanii":"tolăni","tolanim":"tolăni","tolanind":"tolăni","tolanira":"tolăni","tolaniram":"tolăni","tolanirati":"tolăni","tolanirea":"tolănire","tolaniri":"tolănire","tolanirii":"tolănire","tolanise":"tolăni","tolanisem":"tolăni","tolanisera":"tolăni","tolaniseram":"tolăni","tolaniserati":"tolăni","tolanisesi":"tolăni","tolanisi":"tolăni","tolanit":"tolăni","tolanita":["tolănită","tolănit","tolănita","tolănit"],"tolanite":"tolănit","tolanitele":"tolănit","tolaniti":["tolăniți","tolăni","tolăniți","tolănit"],"tolanitii":"tolănit","tolanitul":"tolănit","tolbari":"tolbar","tolbarii":"tolbar","tolbarilor":"tolbar","tolbarul":"tolbar","tolbarule":"tolbar","tolbarului":"tolbar","tolbasi":"tolbaș","tolbasii":"tolbaș","tolbasilor":"tolbaș","tolbasul":"tolbaș","tolbasule":"tolbaș","tolbasului":"tolbaș","tolbe":"tolbă","tolbei":"tolbă","tolbele":"tolbă","tolbelor":"tolbă","tolcerase":"tolceraș","tolcerasele":"tolceraș","tolceraselor":"tolceraș","tolcerasul":"tolceraș","tolcerasule":"tolceraș","tolcerasului":"tolceraș","tole":"tolă","tolei":"tolă","tolele":"tolă","tolelor":"tolă","tolerabila":["tolerabilă","tolerabil","tolerabila","tolerabil"],"tolerabile":"tolerabil","tolerabilele":"tolerabil","tolerabili":"tolerabil","tolerabilii":"tolerabil","tolerabilul":"tolerabil","tolerai":"tolera","toleram":["tolerăm","tolera","toleram","tolera"],"tolerand":"tolera","toleranta":["tolerantă","tolerant","toleranta","tolerant"],"tolerante":["tolerante","tolerant","toleranțe","toleranță"],"tolerantei":"toleranță","tolerantele":["tolerantele","tolerant","toleranțele","toleranță"],"tolerantelor":"toleranță","toleranti":"tolerant","tolerantii":"tolerant","tolerantismul":"tolerantism","tolerantismule":"tolerantism","tolerantismului":"tolerantism","tolerantul":"tolerant","tolerara":"tolera","toleraram":"tolera","tolerarati":"tolera","tolerarea":"tolerare","tolerari":"tolerare","tolerarii":"tolerare","tolerarile":"tolerare","tolerarilor":"tolerare","tolerase":"tolera","tolerasem":"tolera","tolerasera":"tolera","toleraseram":"tolera","toleraserati":"tolera","tolerasesi":"tolera","tolerasi":"tolera","tolerat":"tolera","tolerati":"tolera","tolerau":"tolera","tolereaza":"tolera","tolerez":"tolera","tolerezi":"tolera","toletul":"țolet","toletule":"țolet","toletului":"țolet","toleturi":"țolet","toleturile":"țolet","toleturilor":"țolet","toli":"țol","toli patrati":"țol pătrat","tolicaul":"țolică","tolicaule":"țolică","tolicaului":"țolică","tolici":"țolică","tolicile":"țolică","tolicilor":"țolică","tolii":"țol","tolilor":"țol","tolince":"țolinc","tolincele":"țolinc","tolincelor":"țolinc","tolincul":"țolinc","tolincule":"țolinc","tolincului":"țolinc","toline":"țolină","tolinei":"țolină","tolinele":"țolină","tolinelor":"țolină","tolisoare":"țolișor","tolisoarele":"țolișor","tolisoarelor":"țolișor","tolisorul":"țolișor","tolisorule":"țolișor","tolisorului":"țolișor","tolite":"țoliță","tolitei":"țoliță","tolitele":"țoliță","tolitelor":"țoliță","tolocanele":"tolocăneală","tolocanelei":"tolocăneală","tolocanelele":"tolocăneală","tolocanelelor":"tolocăneală","tolocaneli":"tolocăneală","tologele":"tologeală","tologelei":"tologeală","tologelele":"tologeală","tologelelor":"tologeală","tologeli":"tologeală","tolomace":"tolomacă","tolomacei":"tolomacă","tolomacele":"tolomacă","tolomacelor":"tolomacă","tolometre":"tolometru","tolometrele":"tolometru","tolometrelor":"tolometru","tolometrul":"tolometru","tolometrule":"tolometru","tolometrului":"tolometru","toloscane":"toloșcană","toloscanei":"toloșcană","toloscanele":"toloșcană","toloscanelor":"toloșcană","tolstoiana":["tolstoiană","tolstoian","tolstoiana","tolstoian"],"tolstoianul":"tolstoian","tolstoiene":"tolstoian","tolstoienele":"tolstoian","tolstoieni":"tolstoian","tolstoienii":"tolstoian","toltece":"toltecă","toltecei":"toltecă","toltecele":"toltecă","toltecelor":"toltecă","tolteci":"toltec","toltusi":"toltuș","toltusii":"toltuș","toltusilor":"toltuș","toltusul":"toltuș","toltusule":"toltuș","toltusului":"toltuș","toluenul":"toluen","toluenule":"toluen","toluenului":"toluen","toluidine":"toluidină","toluidinei":"toluidină","toluidinele":"toluidină","toluidinelor":"toluidină","tolul":"țol","tolule":"țol","tolului":"țol","toluri":"țol","tolurile":"țol","tolurilor":"țol","tolute":"țoluț","tolutele":"țoluț","tolutelor":"țoluț","tolutul":"țoluț","tolutule":"țoluț","tolutului":"țoluț","toluturi":"țoluț","tomahawkul":"tomahawk","tomahawkule":"tomahawk","tomahawkului":"tomahawk","tomahawkuri":"tomahawk","tomahawkurile":"tomahawk","tomahawkurilor":"tomahawk","tomate":"tomată","tomatei":"tomată","tomatele":"tomată","tomatelor":"tomată","tombacul":"tombac","tombacule":"tombac","tombacului":"tombac","tombala":["tombală","tombal","tombala","tombal"],"tombale":"tombal","tombalele":"tombal","tombali":"tombal","tombalii":"tombal","tombalul":"tombal","tomberoane":"tomberon","tomberoanele":"tomberon","tomberoanelor":"tomberon","tomberonul":"tomberon","tomberonule":"tomberon","tomberonului":"tomberon","tombole":"tombolă","tombolei":"tombolă","tombolele":"tombolă","tombolelor":"tombolă","tomboloul":"tombolo","tomboloule":"tombolo","tomboloului":"tombolo","tombolouri":"tombolo","tombolourile":"tombolo","tombolourilor":"tombolo","tomentoasa":["tomentoasă","tomentos","tomentoasa","tomentos"],"tomentoase":"tomentos","tomentoasele":"tomentos","tomentosi":"tomentos","tomentosii":"tomentos","tomentosul":"tomentos","tomisme":"tomism","tomismele":"tomism","tomismelor":"tomism","tomismul":"tomism","tomismule":"tomism","tomismului":"tomism","tomista":["tomistă","tomist","tomista","tomist"],"tomiste":"tomist","tomistele":"tomist","tomisti":"tomist","tomistii":"tomist","tomistul":"tomist","tomnai":"tomna","tomnam":["tomnăm","tomna","tomnam","tomna"],"tomnand":"tomna","tomnara":"tomna","tomnaram":"tomna","tomnarati":"tomna","tomnase":"tomna","tomnasem":"tomna","tomnasera":"tomna","tomnaseram":"tomna","tomnaserati":"tomna","tomnasesi":"tomna","tomnasi":"tomna","tomnat":"tomna","tomnatec":"tomnatic","tomnateca":["tomnatecă","tomnatec","tomnateca","tomnatec"],"tomnatece":"tomnatec","tomnatecele":"tomnatec","tomnateci":"tomnatec","tomnatecii":"tomnatec","tomnatecul":"tomnatec","tomnati":"tomna","tomnatica":["tomnatică","tomnatic","tomnatica","tomnatic"],"tomnatice":"tomnatic","tomnaticele":"tomnatic","tomnatici":"tomnatic","tomnaticii":"tomnatic","tomnaticul":"tomnatic","tomnau":"tomna","tomneaza":"tomna","tomnez":"tomna","tomnezi":"tomna","tomnia":"tomniu","tomnie":"tomniu","tomnii":"tomniu","tomniii":"tomniu","tomniile":"tomniu","tomniul":"tomniu","tomografe":"tomograf","tomografele":"tomograf","tomografelor":"tomograf","tomografia":"tomografie","tomografiei":"tomografie","tomografii":"tomografie","tomografiile":"tomografie","tomografiilor":"tomografie","tomograful":"tomograf","tomografule":"tomograf","tomografului":"tomograf","tompatere":"tompateră","tompaterei":"tompateră","tompaterele":"tompateră","tompaterelor":"tompateră","tomul":"tom","tomule":"tom","tomului":"tom","tomuri":"tom","tomurile":"tom","tomurilor":"tom","tonaje":"tonaj","tonajele":"tonaj","tonajelor":"tonaj","tonajul":"tonaj","tonajule":"tonaj","tonajului":"tonaj","tonala":["tonală","tonal","tonala","tonal"],"tonale":"tonal","tonalele":"tonal","tonali":"tonal","tonalii":"tonal","tonalitatea":"tonalitate","tonalitati":"tonalitate","tonalitatii":"tonalitate","tonalitatile":"tonalitate","tonalitatilor":"tonalitate","tonalul":"tonal","toncute":"toncuță","toncutei":"toncuță","toncutele":"toncuță","toncutelor":"toncuță","tondoul":"tondo","tondoule":"tondo","tondoului":"tondo","tondouri":"tondo","tondourile":"tondo","tondourilor":"tondo","tone":"tonă","tonei":"tonă","tonele":"tonă","tonelor":"tonă","tonere":"toner","tonerele":"toner","tonerelor":"toner","tonerul":"toner","tonerule":"toner","tonerului":"toner","tongaleze":"tongaleză","tongalezei":"tongaleză","tongalezele":"tongaleză","tongalezelor":"tongaleză","tongana":["tongană","tongan","tongana","tongan"],"tongane":["tongane","tongan","tongane","tongană"],"tonganei":"tongană","tonganele":["tonganele","tongan","tonganele","tongană"],"tonganelor":"tongană","tongani":"tongan","tonganii":"tongan","tonganilor":"tongan","tonganul":"tongan","tonganule":"tongan","tonganului":"tongan","toni":"ton","tonicardiace":"tonicardiac","tonicardiacele":"tonicardiac","tonicardiacelor":"tonicardiac","tonicardiacul":"tonicardiac","tonicardiacule":"tonicardiac","tonicardiacului":"tonicardiac","tonici":"tonic","tonicile":"tonic","tonicilor":"tonic","tonicitatea":"tonicitate","tonicitati":"tonicitate","tonicitatii":"tonicitate","tonicitatile":"tonicitate","tonicitatilor":"tonicitate","tonicul":"tonic","tonicule":"tonic","tonicului":"tonic","tonifianta":["tonifiantă","tonifiant","tonifianta","tonifiant"],"tonifiante":"tonifiant","tonifiantele":"tonifiant","tonifianti":"tonifiant","tonifiantii":"tonifiant","tonifiantul":"tonifiant","tonific":"tonifica","tonificai":"tonifica","tonificam":["tonificăm","tonifica","tonificam","tonifica"],"tonificand":"tonifica","tonificara":"tonifica","tonificaram":"tonifica","tonificarati":"tonifica","tonificarea":"tonificare","tonificari":"tonificare","tonificarii":"tonificare","tonificarile":"tonificare","tonificarilor":"tonificare","tonificase":"tonifica","tonificasem":"tonifica","tonificasera":"tonifica","tonificaseram":"tonifica","tonificaserati":"tonifica","tonificasesi":"tonifica","tonificasi":"tonifica","tonificat":"tonifica","tonificati":"tonifica","tonificau":"tonifica","tonifice":"tonifica","tonifici":"tonifica","tonii":"ton","tonilor":"ton","tonitruanta":["tonitruantă","tonitruant","tonitruanta","tonitruant"],"tonitruante":"tonitruant","tonitruantele":"tonitruant","tonitruanti":"tonitruant","tonitruantii":"tonitruant","tonitruantul":"tonitruant","tonofibrilaul":"tonofibrilă","tonofibrilaule":"tonofibrilă","tonofibrilaului":"tonofibrilă","tonofibrile":"tonofibrilă","tonofibrilei":"tonofibrilă","tonofibrilelor":"tonofibrilă","tonomate":"tonomat","tonomatele":"tonomat","tonomatelor":"tonomat","tonomatul":"tonomat","tonomatule":"tonomat","tonomatului":"tonomat","tonometre":"tonometru","tonometrele":"tonometru","tonometrelor":"tonometru","tonometria":"tonometrie","tonometrica":["tonometrică","tonometric","tonometrica","tonometric"],"tonometrice":"tonometric","tonometricele":"tonometric","tonometrici":"tonometric","tonometricii":"tonometric","tonometricul":"tonometric","tonometriei":"tonometrie","tonometrii":"tonometrie","tonometrul":"tonometru","tonometrule":"tonometru","tonometrului":"tonometru","tonoscoape":"tonoscop","tonoscoapele":"tonoscop","tonoscoapelor":"tonoscop","tonoscopul":"tonoscop","tonoscopule":"tonoscop","tonoscopului":"tonoscop","tonsilectomia":"tonsilectomie","tonsilectomiei":"tonsilectomie","tonsilectomii":"tonsilectomie","tonsilectomiile":"tonsilectomie","tonsilectomiilor":"tonsilectomie","tonsilotomia":"tonsilotomie","tonsilotomiei":"tonsilotomie","tonsilotomii":"tonsilotomie","tonsilotomiile":"tonsilotomie","tonsilotomiilor":"tonsilotomie","tonsuri":"tonsură","tonsurii":"tonsură","tonsurile":"tonsură","tonsurilor":"tonsură","tontalai":"tontălău","tontalaii":"tontălău","tontalaul":"tontălău","tontaloaica":["tontăloaică","tontălău","tontăloaica","tontălău"],"tontaloaice":"tontălău","tontaloaicele":"tontălău","tonti":"tont","tontia":"tonție","tontiei":"tonție","tontii":["tonții","tont","tonții","tonție"],"tontiile":"tonție","tontiilor":"tonție","tontoletea":"tontolete","tontoletele":"tontolete","tontoleteul":"tontolete","tontoleteule":"tontolete","tontoleteului":"tontolete","tontoleti":"tontolete","tontoletii":"tontolete","tontoletilor":"tontolete","tontologi":"tontolog","tontologii":"tontolog","tontologilor":"tontolog","tontologul":"tontolog","tontologule":"tontolog","tontologului":"tontolog","tontul":"tont","tontule":"tont","tontului":"tont","tontuta":["tontuță","tontuț","tontuța","tontuț"],"tontute":"tontuț","tontutele":"tontuț","tontuti":"tontuț","tontutii":"tontuț","tontutul":"tontuț","tonul":"ton","tonule":"ton","tonului":"ton","tonuri":"ton","tonurile":"ton","tonurilor":"ton","tonusul":"tonus","tonusule":"tonus","tonusului":"tonus","tonusuri":"tonus","tonusurile":"tonus","tonusurilor":"tonus","tonutul":"tonuț","tonutule":"tonuț","tonutului":"tonuț","tonuturi":"tonuț","tonuturile":"tonuț","tonuturilor":"tonuț","top-modele":"top-model","top-modelele":"top-model","top-modelelor":"top-model","top-modelul":"top-model","top-modelule":"top-model","top-modelului":"top-model","topaia":"țopăi","topaiai":"țopăi","topaiam":"țopăi","topaiati":"țopăi","topaiau":"țopăi","topaie":"țopăi","topaieli":"țopăială","topaielii":"țopăială","topaielile":"țopăială","topaielilor":"țopăială","topaii":"țopăi","topaim":"țopăi","topaind":"țopăi","topaira":"țopăi","topairam":"țopăi","topairati":"țopăi","topairea":"țopăire","topairi":"țopăire","topairii":"țopăire","topairile":"țopăire","topairilor":"țopăire","topaise":"țopăi","topaisem":"țopăi","topaisera":"țopăi","topaiseram":"țopăi","topaiserati":"țopăi","topaisesi":"țopăi","topaisi":"țopăi","topait":"țopăi","topaiti":"țopăi","topaitul":"țopăit","topaitule":"țopăit","topaitului":"țopăit","topaiture":"țopăitură","topaiturei":"țopăitură","topaiturele":"țopăitură","topaiturelor":"țopăitură","topaituri":"țopăitură","topale":"topală","topalei":"topală","topalele":"topală","topalelor":"topală","topancute":"topăncuță","topancutei":"topăncuță","topancutele":"topăncuță","topancutelor":"topăncuță","toparci":"țopârcă","toparcii":"țopârcă","toparcile":"țopârcă","toparcilor":"țopârcă","toparlance":"țopârlancă","toparlancei":"țopârlancă","toparlancele":"țopârlancă","toparlancelor":"țopârlancă","toparlaneasca":["țopârlănească","țopârlănesc","țopârlăneasca","țopârlănesc"],"toparlanescul":"țopârlănesc","toparlanesti":"țopârlănesc","toparlanestii":"țopârlănesc","toparlanestile":"țopârlănesc","toparlani":"țopârlan","toparlanii":"țopârlan","toparlanilor":"țopârlan","toparlanul":"țopârlan","toparlanule":"țopârlan","toparlanului":"țopârlan","topaze":"topaz","topazele":"topaz","topazelor":"topaz","topazul":"topaz","topazule":"topaz","topazului":"topaz","topcii":"topciu","topciii":"topciu","topciilor":"topciu","topciul":"topciu","topciule":"topciu","topciului":"topciu","topea":"topi","topeai":"topi","topeam":"topi","topeati":"topi","topeau":"topi","topele":"topeală","topelei":"topeală","topelele":"topeală","topelelor":"topeală","topeli":"topeală","topenia":"topenie","topeniei":"topenie","topenii":"topenie"};
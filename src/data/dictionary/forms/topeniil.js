@@ -0,0 +1 @@
+export default {"topeniile":"topenie","topeniilor":"topenie","topesc":"topi","topeste":"topi","topesti":"topi","topicaul":"topică","topicaule":"topică","topicaului":"topică","topici":["topici","topică","țopici","țopică"],"topicii":"țopică","topicile":["topicile","topică","țopicile","țopică"],"topicilor":["topicilor","topică","țopicilor","țopică"],"topii":"topi","topim":"topi","topinamburi":"topinambur","topinamburii":"topinambur","topinamburilor":"topinambur","topinamburul":"topinambur","topinamburule":"topinambur","topinamburului":"topinambur","topind":"topi","topira":"topi","topiram":"topi","topirati":"topi","topirea":"topire","topirei":"topire","topise":"topi","topisem":"topi","topisera":"topi","topiseram":"topi","topiserati":"topi","topisesi":"topi","topisi":"topi","topisoare":"țopișoară","topisoarei":"țopișoară","topisoarele":"țopișoară","topisoarelor":"țopișoară","topit":"topi","topita":["topită","topit","topita","topit"],"topite":"topit","topitele":"topit","topiti":["topiți","topi","topiți","topit"],"topitii":"topit","topitoarea":"topitoare","topitoarei":"topitoare","topitoarele":"topitoare","topitoarelor":"topitoare","topitori":"topitor","topitoria":"topitorie","topitoriei":"topitorie","topitorii":["topitorii","topitor","topitorii","topitorie"],"topitoriile":"topitorie","topitoriilor":"topitorie","topitorilor":"topitor","topitorul":"topitor","topitorule":"topitor","topitorului":"topitor","topitul":"topit","topiture":"topitură","topiturei":"topitură","topiturele":"topitură","topiturelor":"topitură","topituri":"topitură","toplicioasa":["toplicioasă","toplicios","toplicioasa","toplicios"],"toplicioase":"toplicios","toplicioasele":"toplicios","topliciosi":"toplicios","topliciosii":"toplicios","topliciosul":"toplicios","toplite":["toplițe","Toplița","toplițe","topliță"],"topliteana":["toplițeană","toplițean","toplițeana","toplițean"],"topliteanul":"toplițean","topliteanule":"toplițean","topliteanului":"toplițean","toplitei":["topliței","Toplița","topliței","topliță"],"toplitele":"topliță","toplitelor":"topliță","toplitence":"toplițeancă","toplitencei":"toplițeancă","toplitencele":"toplițeancă","toplitencelor":"toplițeancă","toplitene":"toplițean","toplitenele":"toplițean","topliteni":"toplițean","toplitenii":"toplițean","toplitenilor":"toplițean","topoare":"topor","topoarele":"topor","topoarelor":"topor","topoclime":"topoclimă","topoclimei":"topoclimă","topofobia":"topofobie","topofobiei":"topofobie","topofobii":"topofobie","topogane":"topogan","topoganele":"topogan","topoganelor":"topogan","topoganul":"topogan","topoganule":"topogan","topoganului":"topogan","topografe":"topografă","topografei":"topografă","topografele":"topografă","topografelor":"topografă","topografi":"topograf","topografia":"topografie","topografica":["topografică","topografic","topografica","topografic"],"topografice":"topografic","topograficele":"topografic","topografici":"topografic","topograficii":"topografic","topograficul":"topografic","topografiei":"topografie","topografii":["topografii","topograf","topografii","topografie"],"topografilor":"topograf","topograful":"topograf","topografule":"topograf","topografului":"topograf","topologia":"topologie","topologica":["topologică","topologic","topologica","topologic"],"topologice":"topologic","topologicele":"topologic","topologici":"topologic","topologicii":"topologic","topologicul":"topologic","topologiei":"topologie","topologii":"topologie","topometri":"topometru","topometria":"topometrie","topometrica":["topometrică","topometric","topometrica","topometric"],"topometrice":"topometric","topometricele":"topometric","topometrici":"topometric","topometricii":"topometric","topometricul":"topometric","topometriei":"topometrie","topometrii":["topometrii","topometrie","topometrii","topometru"],"topometrilor":"topometru","topometriste":"topometristă","topometristei":"topometristă","topometristele":"topometristă","topometristelor":"topometristă","topometristi":["topometriști","topometrist","topometristi","topometrist"],"topometristii":"topometrist","topometristilor":"topometrist","topometristul":"topometrist","topometristule":"topometrist","topometristului":"topometrist","topometruul":"topometru","topometruule":"topometru","topometruului":"topometru","toponime":"toponim","toponimele":"toponim","toponimelor":"toponim","toponimia":"toponimie","toponimica":["toponimică","toponimic","toponimica","toponimic"],"toponimice":"toponimic","toponimicele":"toponimic","toponimici":"toponimic","toponimicii":"toponimic","toponimicul":"toponimic","toponimiei":"toponimie","toponimii":"toponimie","toponimul":"toponim","toponimule":"toponim","toponimului":"toponim","toponomastice":"toponomastică","toponomasticei":"toponomastică","toponomasticele":"toponomastică","toponomasticelor":"toponomastică","toporani":"toporan","toporanii":"toporan","toporanilor":"toporan","toporanul":"toporan","toporanule":"toporan","toporanului":"toporan","toporase":"toporaș","toporasele":"toporaș","toporaselor":"toporaș","toporasi":"toporaș","toporasia":"toporășiu","toporasie":"toporășiu","toporasii":["toporașii","toporaș","toporășii","toporășiu"],"toporasiii":"toporășiu","toporasiile":"toporășiu","toporasilor":"toporaș","toporasiul":"toporășiu","toporastea":"toporâște","toporasti":"toporâște","toporastii":"toporâște","toporastile":"toporâște","toporastilor":"toporâște","toporasul":"toporaș","toporasule":"toporaș","toporasului":"toporaș","toporele":"toporel","toporelele":"toporel","toporelelor":"toporel","toporelul":"toporel","toporelule":"toporel","toporelului":"toporel","toporistea":"toporiște","toporisti":["toporiști","toporișcă","toporiști","toporiște"],"toporistii":["toporiștii","toporișcă","toporiștii","toporiște"],"toporistile":["toporiștile","toporișcă","toporiștile","toporiște"],"toporistilor":["toporiștilor","toporișcă","toporiștilor","toporiște"],"toporite":"toporiță","toporitei":"toporiță","toporitele":"toporiță","toporitelor":"toporiță","toporul":"topor","toporule":"topor","toporului":"topor","toporusi":"toporuș","toporusii":"toporuș","toporusilor":"toporuș","toporusul":"toporuș","toporusule":"toporuș","toporusului":"toporuș","topsecai":"topseca","topsecam":["topsecăm","topseca","topsecam","topseca"],"topsecand":"topseca","topsecara":"topseca","topsecaram":"topseca","topsecarati":"topseca","topsecase":"topseca","topsecasem":"topseca","topsecasera":"topseca","topsecaseram":"topseca","topsecaserati":"topseca","topsecasesi":"topseca","topsecasi":"topseca","topsecat":"topseca","topsecati":"topseca","topsecau":"topseca","topsecoasa":["topsecoasă","topsecos","topsecoasa","topsecos"],"topsecoase":"topsecos","topsecoasele":"topsecos","topsecosi":"topsecos","topsecosii":"topsecos","topsecosul":"topsecos","topsine":"topsin","topsinele":"topsin","topsinelor":"topsin","topsinul":"topsin","topsinule":"topsin","topsinului":"topsin","topspinul":"topspin","topspinule":"topspin","topspinului":"topspin","toptangii":"toptangiu","toptangiii":"toptangiu","toptangiilor":"toptangiu","toptangiul":"toptangiu","toptangiule":"toptangiu","toptangiului":"toptangiu","toptanul":"toptan","toptanule":"toptan","toptanului":"toptan","topul":"top","topule":"top","topului":"top","topuri":"top","topurile":"top","topurilor":"top","topuzul":"topuz","topuzule":"topuz","topuzului":"topuz","topuzuri":"topuz","topuzurile":"topuz","topuzurilor":"topuz","toracele":"torace","toracelor":"torace","toracelui":"torace","toracenteze":"toracenteză","toracentezei":"toracenteză","toracentezele":"toracenteză","toracentezelor":"toracenteză","toracica":["toracică","toracic","toracica","toracic"],"toracice":"toracic","toracicele":"toracic","toracici":"toracic","toracicii":"toracic","toracicul":"toracic","toracoplastia":"toracoplastie","toracoplastiei":"toracoplastie","toracoplastii":"toracoplastie","toracoplastiile":"toracoplastie","toracoplastiilor":"toracoplastie","toracoscopia":"toracoscopie","toracoscopiei":"toracoscopie","toracoscopii":"toracoscopie","toracoscopiile":"toracoscopie","toracoscopiilor":"toracoscopie","toracostomia":"toracostomie","toracostomiei":"toracostomie","toracostomii":"toracostomie","toracostomiile":"toracostomie","toracostomiilor":"toracostomie","toracotomia":"toracotomie","toracotomiei":"toracotomie","toracotomii":"toracotomie","toracotomiile":"toracotomie","toracotomiilor":"toracotomie","toraia":"torăi","toraiai":"torăi","toraiam":"torăi","toraiati":"torăi","toraiau":"torăi","toraiesc":"torăi","toraieste":"torăi","toraiesti":"torăi","toraii":"torăi","toraim":"torăi","toraind":"torăi","toraira":"torăi","torairam":"torăi","torairati":"torăi","toraise":"torăi","toraisem":"torăi","toraisera":"torăi","toraiseram":"torăi","toraiserati":"torăi","toraisesi":"torăi","toraisi":"torăi","torait":"torăi","toraiti":"torăi","torba":"tolbă","torbe":"torbă","torbei":"torbă","torbele":"torbă","torbelor":"torbă","torc":"toarce","torcand":"toarce","torcarese":"torcăreasă","torcaresei":"torcăreasă","torcaresele":"torcăreasă","torcareselor":"torcăreasă","torcatoarea":"torcătoare","torcatoarei":"torcătoare","torcatoarele":"torcătoare","torcatoarelor":"torcătoare","torcatori":"torcător","torcatoria":"torcătorie","torcatoriei":"torcătorie","torcatorii":["torcătorii","torcător","torcătorii","torcătorie"],"torcatoriile":"torcătorie","torcatoriilor":"torcătorie","torcatorilor":"torcător","torcatorul":"torcător","torcatorule":"torcător","torcatorului":"torcător","torce":"toarce","torcea":"toarce","torceai":"toarce","torceam":"toarce","torceati":"toarce","torceau":"toarce","torci":"toarce","toreadori":"toreador","toreadorii":"toreador","toreadorilor":"toreador","toreadorul":"toreador","toreadorule":"toreador","toreadorului":"toreador","torefierea":"torefiere","torefieri":"torefiere","torefierii":"torefiere","torefierile":"torefiere","torefierilor":"torefiere","torent m torent":"torent","torenti":"torent","torentiala":["torențială","torențial","torențiala","torențial"],"torentiale":"torențial","torentialele":"torențial","torentiali":"torențial","torentialii":"torențial","torentialul":"torențial","torentii":"torent","torentilor":"torent","torentul":"torent","torentule":"torent","torentului":"torent","toreros":"torero","toreroul":"torero","toreroului":"torero","torida":["toridă","torid","torida","torid"],"toride":"torid","toridele":"torid","toriditatea":"toriditate","toriditati":"toriditate","toriditatii":"toriditate","toriditatile":"toriditate","toriditatilor":"toriditate","toridul":"torid","torite":"torit","toritele":"torit","toritelor":"torit","toritul":"torit","toritule":"torit","toritului":"torit","toriul":"toriu","toriule":"toriu","toriului":"toriu","torizi":"torid","torizii":"torid","torn":"turna","tornade":"tornadă","tornadei":"tornadă","tornadele":"tornadă","tornadelor":"tornadă","torni":"turna","toroane":"toron","toroanele":"toron","toroanelor":"toron","toroidala":["toroidală","toroidal","toroidala","toroidal"],"toroidale":"toroidal","toroidalele":"toroidal","toroidali":"toroidal","toroidalii":"toroidal","toroidalul":"toroidal","toroide":"toroid","toroidele":"toroid","toroidelor":"toroid","toroidul":"toroid","toroidule":"toroid","toroidului":"toroid","toroipane":"toroipan","toroipanele":"toroipan","toroipanelor":"toroipan","toroipanul":"toroipan","toroipanule":"toroipan","toroipanului":"toroipan","toronul":"toron","toronule":"toron","toronului":"toron","toropea":"toropi","toropeai":"toropi","toropeam":"toropi","toropeati":"toropi","toropeau":"toropi","toropeli":"toropeală","toropelii":"toropeală","toropelile":"toropeală","toropelilor":"toropeală","toropesc":"toropi","toropeste":"toropi","toropesti":"toropi","toropii":"toropi","toropim":"toropi","toropind":"toropi","toropira":"toropi","toropiram":"toropi","toropirati":"toropi","toropise":"toropi","toropisem":"toropi","toropisera":"toropi","toropiseram":"toropi","toropiserati":"toropi","toropisesi":"toropi","toropisi":"toropi","toropit":"toropi","toropita":["toropită","toropit","toropita","toropit"],"toropite":"toropit","toropitele":"toropit","toropiti":["toropiți","toropi","toropiți","toropit"],"toropitii":"toropit","toropitoare":"toropitor","toropitoarea":"toropitor","toropitoarele":"toropitor","toropitori":"toropitor","toropitorii":"toropitor","toropitorul":"toropitor","toropitul":"toropit","torpedouri":"torpedou","torpedouul":"torpedou","torpedouule":"torpedou","torpedouului":"torpedou","torpedouuri":"torpedou","torpedouurile":"torpedou","torpedouurilor":"torpedou","torpida":["torpidă","torpid","torpida","torpid"],"torpide":"torpid","torpidele":"torpid","torpidul":"torpid","torpilai":"torpila","torpilam":["torpilăm","torpila","torpilam","torpila"],"torpiland":"torpila","torpilara":"torpila","torpilaram":"torpila","torpilarati":"torpila","torpilarea":"torpilare","torpilari":"torpilare","torpilarii":"torpilare","torpilarile":"torpilare","torpilarilor":"torpilare","torpilase":"torpila","torpilasem":"torpila","torpilasera":"torpila","torpilaseram":"torpila","torpilaserati":"torpila","torpilasesi":"torpila","torpilasi":"torpila","torpilat":"torpila","torpilati":"torpila","torpilau":"torpila","torpile":"torpilă","torpileaza":"torpila","torpilei":"torpilă","torpilele":"torpilă","torpilelor":"torpilă","torpilez":"torpila","torpilezi":"torpila","torpiloare":"torpilor","torpiloarele":"torpilor","torpiloarelor":"torpilor","torpilorul":"torpilor","torpilorule":"torpilor","torpilorului":"torpilor","torpizi":"torpid","torpizii":"torpid","tors":"toarce","torsade":"torsadă","torsadei":"torsadă","torsadele":"torsadă","torsadelor":"torsadă","torsei":"toarce","torsese":"toarce","torsesem":"toarce","torsesera":"toarce","torseseram":"toarce","torseserati":"toarce","torsesesi":"toarce","torsesi":"toarce","torsiografe":"torsiograf","torsiografele":"torsiograf","torsiografelor":"torsiograf","torsiograful":"torsiograf","torsiografule":"torsiograf","torsiografului":"torsiograf","torsiometre":"torsiometru","torsiometrele":"torsiometru","torsiometrelor":"torsiometru","torsiometrul":"torsiometru","torsiometrule":"torsiometru","torsiometrului":"torsiometru","torsionai":"torsiona","torsionam":["torsionăm","torsiona","torsionam","torsiona"],"torsionand":"torsiona","torsionara":"torsiona","torsionaram":"torsiona","torsionarati":"torsiona","torsionase":"torsiona","torsionasem":"torsiona","torsionasera":"torsiona","torsionaseram":"torsiona","torsionaserati":"torsiona","torsionasesi":"torsiona","torsionasi":"torsiona","torsionat":"torsiona","torsionata":["torsionată","torsionat","torsionata","torsionat"],"torsionate":"torsionat","torsionatele":"torsionat","torsionati":["torsionați","torsiona","torsionați","torsionat"],"torsionatii":"torsionat","torsionatul":"torsionat","torsionau":"torsiona","torsioneaza":"torsiona","torsionez":"torsiona","torsionezi":"torsiona","torsiunea":"torsiune","torsiuni":"torsiune","torsiunii":"torsiune","torsiunile":"torsiune","torsiunilor":"torsiune","torsoane":"torșon","torsoanele":"torșon","torsoanelor":"torșon","torsonul":"torșon","torsonule":"torșon","torsonului":"torșon","torta":"tort","torte":["torte","tortă","torțe","torță"],"tortei":["tortei","tortă","torței","torță","torței","torțel"],"torteii":"torțel","torteilor":"torțel","tortele":["tortele","tortă","torțele","torță"],"tortelor":["tortelor","tortă","torțelor","torță"],"tortelul":"torțel","tortelule":"torțel","tortelului":"torțel","tortia":"torție","torticolisul":"torticolis","torticolisule":"torticolis","torticolisului":"torticolis","tortiei":"torție","tortii":"torție","tortiile":"torție","tortiilor":"torție","tortionare":"torționară","tortionarei":"torționară","tortionarele":"torționară","tortionarelor":"torționară","tortionari":"torționar","tortionarii":"torționar","tortionarilor":"torționar","tortionarul":"torționar","tortionarule":"torționar","tortionarului":"torționar","tortite":"tortiță","tortitei":"tortiță","tortitele":"tortiță","tortitelor":"tortiță","tortonarea":"țorțonare","tortonari":"țorțonare","tortonarii":"țorțonare","tortonarile":"țorțonare","tortonarilor":"țorțonare","tortul":"tort","tortule":"tort","tortului":"tort","tortuoasa":["tortuoasă","tortuos","tortuoasa","tortuos"],"tortuoase":"tortuos","tortuoasele":"tortuos","tortuosi":"tortuos","tortuosii":"tortuos","tortuosul":"tortuos","tortuozitatea":"tortuozitate","tortuozitati":"tortuozitate","tortuozitatii":"tortuozitate","torturai":"tortura","torturam":["torturăm","tortura","torturam","tortura"],"torturand":"tortura","torturanta":["torturantă","torturant","torturanta","torturant"],"torturante":"torturant","torturantele":"torturant","torturanti":"torturant","torturantii":"torturant","torturantul":"torturant","torturara":"tortura","torturaram":"tortura","torturarati":"tortura","torturarea":"torturare","torturari":"torturare","torturarii":"torturare","torturarile":"torturare","torturarilor":"torturare","torturase":"tortura","torturasem":"tortura","torturasera":"tortura","torturaseram":"tortura","torturaserati":"tortura","torturasesi":"tortura","torturasi":"tortura","torturat":"tortura","torturata":["torturată","torturat","torturata","torturat"],"torturate":"torturat","torturatele":"torturat","torturati":["torturați","tortura","torturați","torturat"],"torturatii":"torturat","torturatoare":"torturător","torturatoarea":"torturător","torturatoarele":"torturător","torturatori":"torturător","torturatorii":"torturător","torturatorilor":"torturător","torturatorul":"torturător","torturatorule":"torturător","torturatorului":"torturător","torturatul":"torturat","torturau":"tortura","tortureaza":"tortura","torturez":"tortura","torturezi":"tortura","torturi":["torturi","tort","torturi","tortură"],"torturi aniversare":"tort aniversar","torturii":"tortură","torturile":["torturile","tort","torturile","tortură"],"torturilor":["torturilor","tort","torturilor","tortură"],"toruri":"tor","toryul":"tory","toryule":"tory","toryului":"tory","toscana":["toscană","toscan","toscana","toscan"],"toscane":["toscane","toscan","toscane","toscană"],"toscanei":"toscană","toscanele":["toscanele","toscan","toscanele","toscană"],"toscanelor":"toscană","toscani":"toscan","toscanii":"toscan","toscanul":"toscan","totala":["totală","total","totala","total"],"totale":"total","totalele":"total","totali":"total","totalii":"total","totalitara":["totalitară","totalitar","totalitara","totalitar"],"totalitare":"totalitar","totalitarele":"totalitar","totalitari":"totalitar","totalitarii":"totalitar","totalitarismul":"totalitarism","totalitarismule":"totalitarism","totalitarismului":"totalitarism","totalitarul":"totalitar","totalitatea":"totalitate","totalitati":"totalitate","totalitatii":"totalitate","totalitatile":"totalitate","totalitatilor":"totalitate","totalizai":"totaliza","totalizam":["totalizăm","totaliza","totalizam","totaliza"],"totalizand":"totaliza","totalizanta":["totalizantă","totalizant","totalizanta","totalizant"],"totalizante":"totalizant","totalizantele":"totalizant","totalizanti":"totalizant","totalizantii":"totalizant","totalizantul":"totalizant","totalizara":"totaliza","totalizaram":"totaliza","totalizarati":"totaliza","totalizarea":"totalizare","totalizari":"totalizare","totalizarii":"totalizare","totalizarile":"totalizare","totalizarilor":"totalizare","totalizase":"totaliza","totalizasem":"totaliza","totalizasera":"totaliza","totalizaseram":"totaliza","totalizaserati":"totaliza","totalizasesi":"totaliza","totalizasi":"totaliza","totalizat":"totaliza","totalizati":"totaliza","totalizatoare":"totalizator","totalizatoarele":"totalizator","totalizatoarelor":"totalizator","totalizatorul":"totalizator","totalizatorule":"totalizator","totalizatorului":"totalizator","totalizau":"totaliza","totalizeaza":"totaliza","totalizez":"totaliza","totalizezi":"totaliza","totalul":"total","totemica":["totemică","totemic","totemica","totemic"],"totemice":"totemic","totemicele":"totemic","totemici":"totemic","totemicii":"totemic","totemicul":"totemic","totemismul":"totemism","totemismule":"totemism","totemismului":"totemism","totemul":"totem","totemule":"totem","totemului":"totem","totemuri":"totem","totemurile":"totem","totemurilor":"totem","toti":"tot","totimea":"totime","totimi":"totime","totimii":"totime","totimile":"totime","totimilor":"totime","totul":"tot","totule":"tot","totului":"tot","tovalasul":"tovălaș","tovalasule":"tovălaș","tovalasului":"tovălaș","tovalasuri":"tovălaș","tovalasurile":"tovălaș","tovalasurilor":"tovălaș","tovarase":"tovarășă","tovarase de viata":"tovarășă de viață","tovaraseasca":["tovărășească","tovărășesc","tovărășeasca","tovărășesc"],"tovarasei":["tovarășei","tovarășă","tovărășei","tovărășel"],"tovaraseii":"tovărășel","tovaraseilor":"tovărășel","tovarasele":["tovarășele","tovarășă","tovărășele","tovărășică"],"tovaraselei":"tovărășică","tovaraselele":"tovărășică","tovaraselelor":"tovărășică","tovaraselor":"tovarășă","tovaraselul":"tovărășel","tovaraselule":"tovărășel","tovaraselului":"tovărășel","tovarasescul":"tovărășesc","tovarasesti":"tovărășesc","tovarasestii":"tovărășesc","tovarasestile":"tovărășesc","tovarasi":"tovarăș","tovarasi de joaca":"tovarăș de joacă","tovarasi de viata":"tovarăș de viață","tovarasia":"tovărășie","tovarasiei":"tovărășie","tovarasii":["tovarășii","tovarăș","tovărășii","tovărășie"],"tovarasiile":"tovărășie","tovarasiilor":"tovărășie","tovarasilor":"tovarăș","tovarasirea":"tovărășire","tovarasiri":"tovărășire","tovarasirii":"tovărășire","tovarasirile":"tovărășire","tovarasirilor":"tovărășire","tovarasite":"tovărășiță","tovarasitei":"tovărășiță","tovarasitele":"tovărășiță","tovarasitelor":"tovărășiță","tovarasul":"tovarăș","tovarasule":"tovarăș","tovarasului":"tovarăș","toxalbumine":"toxalbumină","toxalbuminei":"toxalbumină","toxalbuminele":"toxalbumină","toxalbuminelor":"toxalbumină","toxemia":"toxemie","toxemiei":"toxemie","toxemii":"toxemie","toxemiile":"toxemie","toxemiilor":"toxemie","toxica":["toxică","toxic","toxica","toxic"],"toxice":"toxic","toxicele":"toxic","toxici":"toxic","toxicii":"toxic","toxicitatea":"toxicitate","toxicitati":"toxicitate","toxicitatii":"toxicitate","toxicodermia":"toxicodermie","toxicodermiei":"toxicodermie","toxicodermii":"toxicodermie","toxicodermiile":"toxicodermie","toxicodermiilor":"toxicodermie","toxicofobia":"toxicofobie","toxicofobiei":"toxicofobie","toxicofobii":"toxicofobie","toxicofobiile":"toxicofobie","toxicofobiilor":"toxicofobie","toxicofora":["toxicoforă","toxicofor","toxicofora","toxicofor"],"toxicofore":"toxicofor","toxicoforele":"toxicofor","toxicofori":"toxicofor","toxicoforii":"toxicofor","toxicoforul":"toxicofor","toxicogena":["toxicogenă","toxicogen","toxicogena","toxicogen"],"toxicogene":"toxicogen","toxicogenele":"toxicogen","toxicogeni":"toxicogen","toxicogenii":"toxicogen","toxicogenul":"toxicogen","toxicologe":"toxicologă","toxicologei":"toxicologă","toxicologele":"toxicologă","toxicologelor":"toxicologă","toxicologi":"toxicolog","toxicologica":["toxicologică","toxicologic","toxicologica","toxicologic"],"toxicologice":"toxicologic","toxicologicele":"toxicologic","toxicologici":"toxicologic","toxicologicii":"toxicologic","toxicologicul":"toxicologic","toxicologii":["toxicologii","toxicolog","toxicologii","toxicologie"],"toxicologilor":"toxicolog","toxicologul":"toxicolog","toxicologule":"toxicolog","toxicologului":"toxicolog","toxicomane":"toxicomană","toxicomanei":"toxicomană","toxicomanele":"toxicomană","toxicomanelor":"toxicomană","toxicomani":"toxicoman","toxicomania":"toxicomanie","toxicomaniei":"toxicomanie","toxicomanii":["toxicomanii","toxicoman","toxicomanii","toxicomanie"],"toxicomaniile":"toxicomanie","toxicomaniilor":"toxicomanie","toxicomanilor":"toxicoman","toxicomanul":"toxicoman","toxicomanule":"toxicoman","toxicomanului":"toxicoman","toxicoze":"toxicoză","toxicozei":"toxicoză","toxicozele":"toxicoză","toxicozelor":"toxicoză","toxicul":"toxic","toxidermia":"toxidermie","toxidermiei":"toxidermie","toxidermii":"toxidermie","toxidermiile":"toxidermie","toxidermiilor":"toxidermie","toxigena":["toxigenă","toxigen","toxigena","toxigen"],"toxigene":"toxigen","toxigenele":"toxigen","toxigeni":"toxigen","toxigenii":"toxigen","toxigenul":"toxigen","toxiinfectia":"toxiinfecție","toxiinfectiei":"toxiinfecție","toxiinfectii":"toxiinfecție","toxiinfectiile":"toxiinfecție","toxiinfectiilor":"toxiinfecție","toxiinfectioasa":["toxiinfecțioasă","toxiinfecțios","toxiinfecțioasa","toxiinfecțios"],"toxiinfectioase":"toxiinfecțios","toxiinfectioasele":"toxiinfecțios","toxiinfectiosi":"toxiinfecțios","toxiinfectiosii":"toxiinfecțios","toxiinfectiosul":"toxiinfecțios","toxine":"toxină","toxinei":"toxină","toxinele":"toxină","toxinelor":"toxină","toxinemia":"toxinemie","toxinemiei":"toxinemie","toxinemii":"toxinemie","toxinemiile":"toxinemie","toxinemiilor":"toxinemie","toxofobia":"toxofobie","toxofobiei":"toxofobie","toxofobii":"toxofobie","toxofobiile":"toxofobie","toxofobiilor":"toxofobie","toxoplasme":"toxoplasmă","toxoplasmei":"toxoplasmă","toxoplasmele":"toxoplasmă","toxoplasmelor":"toxoplasmă","toxoplasmoze":"toxoplasmoză","toxoplasmozei":"toxoplasmoză","toxoplasmozele":"toxoplasmoză","toxoplasmozelor":"toxoplasmoză","trabecule":"trabeculă","trabeculei":"trabeculă","trabeculele":"trabeculă","trabeculelor":"trabeculă","trabucul":"trabuc","trabucule":"trabuc","trabucului":"trabuc","trabucuri":"trabuc","trabucurile":"trabuc","trabucurilor":"trabuc","traca":["tracă","trac","traca","trac"],"tracasai":"tracasa","tracasam":["tracasăm","tracasa","tracasam","tracasa"],"tracasand":"tracasa","tracasanta":["tracasantă","tracasant","tracasanta","tracasant"],"tracasante":"tracasant","tracasantele":"tracasant","tracasanti":"tracasant","tracasantii":"tracasant","tracasantul":"tracasant","tracasara":"tracasa","tracasaram":"tracasa","tracasarati":"tracasa","tracasase":"tracasa","tracasasem":"tracasa","tracasasera":"tracasa","tracasaseram":"tracasa","tracasaserati":"tracasa","tracasasesi":"tracasa","tracasasi":"tracasa","tracasat":"tracasa","tracasati":"tracasa","tracasau":"tracasa","tracaseaza":"tracasa","tracasez":"tracasa","tracasezi":"tracasa","tracatruci":"tracatrucă","tracatrucii":"tracatrucă","tracatrucile":"tracatrucă","tracatrucilor":"tracatrucă","trace":["trace","trac","trace","tracă"],"tracei":"tracă","tracele":["tracele","trac","tracele","tracă"],"tracelor":["tracelor","trac","tracelor","tracă"],"traci":"trac","tracica":["tracică","tracic","tracica","tracic"],"tracice":"tracic","tracicele":"tracic","tracici":"tracic","tracicii":"tracic","tracicul":"tracic","traciei":"Tracia","tracii":"trac","traco-daca":["traco-dacă","traco-dac","traco-daca","traco-dac"],"traco-dace":["traco-dace","traco-dac","traco-dace","traco-dacă"],"traco-dacei":"traco-dacă","traco-dacele":["traco-dacele","traco-dac","traco-dacele","traco-dacă"],"traco-dacelor":"traco-dacă","traco-daci":"traco-dac","traco-dacica":["traco-dacică","traco-dacic","traco-dacica","traco-dacic"],"traco-dacice":"traco-dacic","traco-dacicele":"traco-dacic","traco-dacici":"traco-dacic","traco-dacicii":"traco-dacic","traco-dacicul":"traco-dacic","traco-dacii":"traco-dac","traco-dacilor":"traco-dac","traco-dacul":"traco-dac","traco-dacule":"traco-dac","traco-dacului":"traco-dac","tracologi":"tracolog","tracologia":"tracologie","tracologiei":"tracologie","tracologii":["tracologii","tracolog","tracologii","tracologie"],"tracologiile":"tracologie","tracologiilor":"tracologie","tracologilor":"tracolog","tracologul":"tracolog","tracologule":"tracolog","tracologului":"tracolog","tracomane":"tracomană","tracomanei":"tracomană","tracomanele":"tracomană","tracomanelor":"tracomană","tractai":"tracta","tractam":["tractăm","tracta","tractam","tracta"],"tractand":"tracta","tractara":"tracta","tractaram":"tracta","tractarati":"tracta","tractarea":"tractare","tractari":"tractare","tractarii":"tractare","tractarile":"tractare","tractarilor":"tractare","tractase":"tracta","tractasem":"tracta","tractasera":"tracta","tractaseram":"tracta","tractaserati":"tracta","tractasesi":"tracta","tractasi":"tracta","tractat":["tractat","tracta","tractat","tratat"],"tractata":["tractată","tractat","tractata","tractat"],"tractate":"tractat","tractatele":"tractat","tractati":["tractați","tracta","tractați","tractat"],"tractatia":"tractație","tractatiei":"tractație","tractatii":["tractații","tractat","tractații","tractație"],"tractatiile":"tractație","tractatiilor":"tractație","tractatul":"tractat","tractau":"tracta","tracteaza":"tracta","tractez":"tracta","tractezi":"tracta","tractire":"tractir","tractirele":"tractir","tractirelor":"tractir","tractirgii":"tractirgiu","tractirgiii":"tractirgiu","tractirgiilor":"tractirgiu","tractirgiuul":"tractirgiu","tractirgiuule":"tractirgiu","tractirgiuului":"tractirgiu","tractirite":"tractiriță","tractiritei":"tractiriță","tractiritele":"tractiriță","tractiritelor":"tractiriță","tractirul":"tractir","tractirule":"tractir","tractirului":"tractir","tractiunea":"tracțiune","tractiuni":"tracțiune","tractiunii":"tracțiune","tractiunile":"tracțiune","tractiunilor":"tracțiune","tractoare":"tractor","tractoarele":"tractor","tractoarelor":"tractor","tractoristi":"tractorist","tractoristii":"tractorist","tractoristilor":"tractorist","tractoristul":"tractorist","tractoristule":"tractorist","tractoristului":"tractorist","tractorite":"tractoriță","tractoritei":"tractoriță","tractoritele":"tractoriță","tractoritelor":"tractoriță","tractorul":"tractor","tractorule":"tractor","tractorului":"tractor","tractotomia":"tractotomie","tractotomiei":"tractotomie","tractotomii":"tractotomie","tractotomiile":"tractotomie","tractotomiilor":"tractotomie","tractusul":"tractus","tractusule":"tractus","tractusului":"tractus","tractusuri":"tractus","tractusurile":"tractus","tractusurilor":"tractus","tracul":"trac","tracule":"trac","tracului":"trac","tradaciunea":"trădăciune","tradaciuni":"trădăciune","tradaciunii":"trădăciune","tradaciunile":"trădăciune","tradaciunilor":"trădăciune","tradai":"trăda","tradam":["trădăm","trăda","trădam","trăda"],"tradamantul":"trădământ","tradamantule":"trădământ","tradamantului":"trădământ","tradaminte":"trădământ","tradamintele":"trădământ","tradamintelor":"trădământ","tradand":"trăda","tradania":"trădanie","tradaniei":"trădanie","tradanii":"trădanie","tradaniile":"trădanie","tradaniilor":"trădanie","tradara":"trăda","tradaram":"trăda","tradarati":"trăda","tradarea":"trădare","tradari":"trădare","tradarii":"trădare","tradarile":"trădare","tradarilor":"trădare","tradase":"trăda","tradasem":"trăda","tradasera":"trăda","tradaseram":"trăda","tradaserati":"trăda","tradasesi":"trăda","tradasi":"trăda","tradat":"trăda","tradata":["trădată","trădat","trădata","trădat"],"tradate":"trădat","tradatele":"trădat","tradati":["trădați","trăda","trădați","trădat"],"tradatii":"trădat","tradatoarea":"trădătoare","tradatoarei":"trădătoare","tradatoarele":"trădătoare","tradatoarelor":"trădătoare","tradatori":"trădător","tradatorii":"trădător","tradatorilor":"trădător","tradatorul":"trădător","tradatorule":"trădător","tradatorului":"trădător","tradatul":"trădat","tradau":"trăda","trade":"tradă","trade-unioniste":"trade-unionistă","trade-unionistei":"trade-unionistă","trade-unionistele":"trade-unionistă","trade-unionistelor":"trade-unionistă","trade-unionisti":"trade-unionist","trade-unionistii":"trade-unionist","trade-unionistilor":"trade-unionist","trade-unionistul":"trade-unionist","trade-unionistule":"trade-unionist","trade-unionistului":"trade-unionist","tradeaza":"trăda","tradei":"tradă","tradez":"trăda","tradezi":"trăda","traditia":"tradiție","traditiei":"tradiție","traditii":"tradiție","traditiile":"tradiție","traditiilor":"tradiție","traditionala":["tradițională","tradițional","tradiționala","tradițional"],"traditionale":"tradițional","traditionalele":"tradițional","traditionali":"tradițional","traditionalii":"tradițional","traditionalisme":"tradiționalism","traditionalismele":"tradiționalism","traditionalismelor":"tradiționalism","traditionalismul":"tradiționalism","traditionalismule":"tradiționalism","traditionalismului":"tradiționalism","traditionalista":["tradiționalistă","tradiționalist","tradiționalista","tradiționalist"],"traditionaliste":"tradiționalist","traditionalistele":"tradiționalist","traditionalisti":"tradiționalist","traditionalistii":"tradiționalist","traditionalistul":"tradiționalist","traditionalul":"tradițional","traditiune":"tradiție","traditiunea":"tradițiune","traditiuni":"tradițiune","traditiunii":"tradițiune","traditiunile":"tradițiune","traditiunilor":"tradițiune","tradu":"traduce","traduc":"traduce","traduca":"traduce","traducaciunea":"trăducăciune","traducaciuni":"trăducăciune","traducaciunii":"trăducăciune","traducaciunile":"trăducăciune","traducaciunilor":"trăducăciune","traducand":"traduce","traducatoarea":"traducătoare","traducatoarei":"traducătoare","traducatoarele":"traducătoare","traducatoarelor":"traducătoare","traducatori":"traducător","traducatorii":"traducător","traducatorilor":"traducător","traducatorul":"traducător","traducatorule":"traducător","traducatorului":"traducător","traducea":"traduce","traduceai":"traduce","traduceam":"traduce","traduceati":"traduce","traduceau":"traduce","traducem":"traduce","traducerea":"traducere","traducerea automata":"traducere automată","traduceri":"traducere","traduceri automate":"traducere automată","traducerii":"traducere","traducerii automate":"traducere automată","traducerile":"traducere","traducerile automate":"traducere automată","traducerilor":"traducere","traducerilor automate":"traducere automată","traduceti":"traduce","traduci":"traduce","traductia":"traducție","traductibila":["traductibilă","traductibil","traductibila","traductibil"],"traductibile":"traductibil","traductibilele":"traductibil","traductibili":"traductibil","traductibilii":"traductibil","traductibilitatea":"traductibilitate","traductibilitati":"traductibilitate","traductibilitatii":"traductibilitate","traductibilul":"traductibil","traductiei":"traducție","traductii":"traducție","traductiile":"traducție","traductiilor":"traducție","traductiunea":"traducțiune","traductiuni":"traducțiune","traductiunii":"traducțiune","traductiunile":"traducțiune","traductiunilor":"traducțiune","traductoare":"traductor","traductoarele":"traductor","traductoarelor":"traductor","traductorul":"traductor","traductorule":"traductor","traductorului":"traductor","tradus":"traduce","tradusa":["tradusă","tradus","tradusa","tradus"],"traduse":["traduse","traduce","traduse","tradus"],"tradusei":"traduce","tradusele":"tradus","tradusera":"traduce","traduseram":"traduce","traduserati":"traduce","tradusese":"traduce","tradusesem":"traduce","tradusesera":"traduce","traduseseram":"traduce","traduseserati":"traduce","tradusesesi":"traduce","tradusesi":"traduce","tradusi":"tradus","tradusii":"tradus","tradusul":"tradus","traficai":"trafica","traficam":["traficăm","trafica","traficam","trafica"],"traficand":"trafica","traficante":"traficantă","traficantei":"traficantă","traficantele":"traficantă","traficantelor":"traficantă","traficanti":"traficant","traficantii":"traficant","traficantilor":"traficant","traficantul":"traficant","traficantule":"traficant","traficantului":"traficant","traficara":"trafica","traficaram":"trafica","traficarati":"trafica","traficarea":"traficare","traficari":"traficare","traficarii":"traficare","traficarile":"traficare","traficarilor":"traficare","traficase":"trafica","traficasem":"trafica","traficasera":"trafica","traficaseram":"trafica","traficaserati":"trafica","traficasesi":"trafica","traficasi":"trafica","traficat":"trafica","traficati":"trafica","traficau":"trafica","traficheaza":"trafica","trafichez":"trafica","trafichezi":"trafica","traficul":"trafic","traficule":"trafic","traficului":"trafic","traficuri":"trafic","traficurile":"trafic","traficurilor":"trafic","traforaje":"traforaj","traforajele":"traforaj","traforajelor":"traforaj","traforajul":"traforaj","traforajule":"traforaj","traforajului":"traforaj","traforata":["traforată","traforat","traforata","traforat"],"traforate":"traforat","traforatele":"traforat","traforati":"traforat","traforatii":"traforat","traforatul":"traforat","trag":"trage","traga":["tragă","targă","tragă","trage"],"traga apa":"trage apa","traga cu ochiul":"trage cu ochiul","traga cu urechea":"trage cu urechea","traga de limba":"trage de limbă","traga la cantar":"trage la cântar","traga la masea":"trage la măsea","traga la raspundere":"trage la răspundere","traga mata de coada":"trage mâța de coadă","traga nadejde":"trage nădejde","traga pe dreapta":"trage pe dreapta","traga pe nas":"trage pe nas","traga pe roata":"trage pe roată","traga pe sfoara":"trage pe sfoară","traga sforile":"trage sforile","traga targa pe uscat":"trage targa pe uscat","tragace":"trăgaci","tragacele":"trăgaci","tragacelor":"trăgaci","tragaciul":"trăgaci","tragaciule":"trăgaci","tragaciului":"trăgaci","tragana":"tărăgăna","traganai":"trăgăna","traganam":["trăgănăm","trăgăna","trăgănam","trăgăna"],"traganand":"trăgăna","traganara":"trăgăna","traganaram":"trăgăna","traganarati":"trăgăna","traganarea":"trăgănare","traganari":"trăgănare","traganarii":"trăgănare","traganarile":"trăgănare","traganarilor":"trăgănare","traganase":"trăgăna","traganasem":"trăgăna","traganasera":"trăgăna","traganaseram":"trăgăna","traganaserati":"trăgăna","traganasesi":"trăgăna","traganasi":"trăgăna","traganat":"trăgăna","traganata":["trăgănată","trăgănat","trăgănata","trăgănat"],"traganate":"trăgănat","traganatele":"trăgănat","traganati":["trăgănați","trăgăna","trăgănați","trăgănat"],"traganatii":"trăgănat","traganatoare":"trăgănător","traganatoarea":"trăgănător","traganatoarele":"trăgănător","traganatori":"trăgănător","traganatorii":"trăgănător","traganatorul":"trăgănător","traganatul":"trăgănat","traganau":"trăgăna","tragand":"trage","traganeaza":"trăgăna","traganez":"trăgăna","traganezi":"trăgăna","tragatoare":"trăgător","tragatoarea":"trăgător","tragatoarele":"trăgător","tragatori":["trăgători","trăgătoare","trăgători","trăgător"],"tragatorii":"trăgător","tragatorilor":"trăgător","tragatorul":"trăgător","tragatorule":"trăgător","tragatorului":"trăgător","trage pe sfoare":"trage pe sfoară","tragea":"trage","trageai":"trage","trageam":"trage","trageati":"trage","trageau":"trage","tragedia":"tragedie","tragedianul":"tragedian","tragedianule":"tragedian","tragedianului":"tragedian","tragediei":"tragedie","tragediene":"tragediană","tragedienei":"tragediană","tragedienele":"tragediană","tragedienelor":"tragediană","tragedieni":"tragedian","tragedienii":"tragedian","tragedienilor":"tragedian","tragedii":"tragedie","tragediile":"tragedie","tragediilor":"tragedie","tragem":"trage","tragerea":"tragere","trageri":"tragere","trageri la sorti":"tragere la sorți","tragerii":"tragere","tragerile":"tragere","tragerilor":"tragere","trageti":"trage","traghelafi":"traghelaf","traghelafii":"traghelaf","traghelafilor":"traghelaf","traghelaful":"traghelaf","traghelafule":"traghelaf","traghelafului":"traghelaf","traghiceasca":["traghicească","traghicesc","traghiceasca","traghicesc"],"traghicescul":"traghicesc","traghicesti":"traghicesc","traghicestii":"traghicesc","traghicestile":"traghicesc","tragi":"trage","tragica":["tragică","tragic","tragica","tragic"],"tragice":"tragic","tragicele":"tragic","tragici":"tragic","tragicii":"tragic","tragicomedia":"tragicomedie","tragicomediei":"tragicomedie","tragicomedii":"tragicomedie","tragicomediile":"tragicomedie","tragicomediilor":"tragicomedie","tragicomica":["tragicomică","tragicomic","tragicomica","tragicomic"],"tragicomice":"tragicomic","tragicomicele":"tragicomic","tragicomici":"tragicomic","tragicomicii":"tragicomic","tragicomicul":"tragicomic","tragicul":"tragic","tragismul":"tragism","tragismule":"tragism","tragismului":"tragism","tragodia":"tragodie","tragodiei":"tragodie","tragodii":"tragodie","tragodiile":"tragodie","tragodiilor":"tragodie","traguse":"trăguș","tragusele":"trăguș","traguselor":"trăguș","tragusul":"trăguș","tragusule":"trăguș","tragusului":"trăguș","tragute":"trăguță","tragutei":"trăguță","tragutele":"trăguță","tragutelor":"trăguță","traheala":["traheală","traheal","traheala","traheal"],"traheale":"traheal","trahealele":"traheal","traheali":"traheal","trahealii":"traheal","trahealul":"traheal","traheana":["traheană","trahean","traheana","trahean"],"traheanul":"trahean","traheea":"trahee","traheeana":["traheeană","traheean","traheeana","traheean"],"traheeanul":"traheean","traheene":"traheean","traheenele":"traheean","traheeni":"traheean","traheenii":"traheean","trahei":"trahee","traheide":"traheidă","traheidei":"traheidă","traheidele":"traheidă","traheidelor":"traheidă","traheii":"trahee","traheile":"trahee","traheilor":"trahee","traheite":"traheită","traheitei":"traheită","traheitele":"traheită","traheitelor":"traheită","traheloctomii":"traheloctomie","trahene":"trahean","trahenele":"trahean","traheni":"trahean","trahenii":"trahean","traheobronsite":"traheobronșită","traheobronsitei":"traheobronșită","traheobronsitele":"traheobronșită","traheobronsitelor":"traheobronșită","traheocelul":"traheocel","traheocelule":"traheocel","traheocelului":"traheocel","traheomalacia":"traheomalacie","traheomalaciei":"traheomalacie","traheomalacii":"traheomalacie","traheomalaciile":"traheomalacie","traheomalaciilor":"traheomalacie","traheomicoze":"traheomicoză","traheomicozei":"traheomicoză","traheomicozele":"traheomicoză","traheomicozelor":"traheomicoză","traheoscoape":"traheoscop","traheoscoapele":"traheoscop","traheoscoapelor":"traheoscop","traheoscopia":"traheoscopie","traheoscopiei":"traheoscopie","traheoscopii":"traheoscopie","traheoscopiile":"traheoscopie","traheoscopiilor":"traheoscopie","traheoscopul":"traheoscop","traheoscopule":"traheoscop","traheoscopului":"traheoscop","traheostomia":"traheostomie","traheostomiei":"traheostomie","traheostomii":"traheostomie","traheostomiile":"traheostomie","traheostomiilor":"traheostomie","traheotomia":"traheotomie","traheotomiei":"traheotomie","traheotomii":"traheotomie","traheotomiile":"traheotomie","traheotomiilor":"traheotomie","trahite":"trahit","trahitele":"trahit","trahitelor":"trahit","trahitica":["trahitică","trahitic","trahitica","trahitic"],"trahitice":"trahitic","trahiticele":"trahitic","trahitici":"trahitic","trahiticii":"trahitic","trahiticul":"trahitic","trahitul":"trahit","trahitule":"trahit","trahitului":"trahit","trahoame":"trahom","trahoamele":"trahom","trahoamelor":"trahom","trahome":"trahomă","trahomei":"trahomă","trahomele":"trahomă","trahomelor":"trahomă","trahomul":"trahom","trahomule":"trahom","trahomului":"trahom","traia":"trăi","traiai":"trăi","traiam":"trăi","traiati":"trăi","traiau":"trăi","traide":"triadă","traidei":"triadă","traidele":"triadă","traidelor":"triadă","traiecte":"traiect","traiectele":"traiect","traiectelor":"traiect","traiectoria":"traiectorie","traiectoriei":"traiectorie","traiectorii":"traiectorie","traiectoriile":"traiectorie","traiectoriilor":"traiectorie","traiectul":"traiect","traiectule":"traiect","traiectului":"traiect","traiesc":"trăi","traieste":"trăi","traiesti":"trăi","traii":"trăi","traile":"trailă","trailei":"trailă","trailele":"trailă","trailelor":"trailă","trailere":"trailer","trailerele":"trailer","trailerelor":"trailer","trailerul":"trailer","trailerule":"trailer","trailerului":"trailer","traim":"trăi","traind":"trăi","traineri":"trainer","trainerii":"trainer","trainerilor":"trainer","trainerul":"trainer","trainerule":"trainer","trainerului":"trainer","trainica":["trainică","trainic","trainica","trainic"],"trainice":"trainic","trainicela":["trăinicelă","trăinicel","trăinicela","trăinicel"],"trainicele":["trainicele","trainic","trăinicele","trăinicel"],"trainicelele":"trăinicel","trainiceli":"trăinicel","trainicelii":"trăinicel","trainicelul":"trăinicel","trainici":"trainic","trainicia":"trăinicie","trainiciei":"trăinicie","trainicii":["trainicii","trainic","trăinicii","trăinicie"],"trainicul":"trainic","trainingul":"training","trainingule":"training","trainingului":"training","traininguri":"training","trainingurile":"training","trainingurilor":"training","traira":"trăi","trairam":"trăi","trairati":"trăi","trairea":"trăire","trairi":"trăire","trairii":"trăire","trairiste":"trăiristă","trairistei":"trăiristă","trairistele":"trăiristă","trairistelor":"trăiristă","traise":"trăi","traisem":"trăi","traisera":"trăi","traiseram":"trăi","traiserati":"trăi","traisesi":"trăi","traisi":"trăi","traiste":"traistă","traistei":"traistă","traistele":"traistă","traistelor":"traistă","traistici":"trăistică","traisticii":"trăistică","traisticile":"trăistică","traisticilor":"trăistică","traistioare":"trăistioară","traistioarei":"trăistioară","traistioarele":"trăistioară","traistioarelor":"trăistioară","traistisoare":"trăistișoară","traistisoarei":"trăistișoară","traistisoarele":"trăistișoară","traistisoarelor":"trăistișoară","traistuce":"trăistucă","traistucei":"trăistucă","traistute":"trăistuță","traistutei":"trăistuță","traistutele":"trăistuță","traistutelor":"trăistuță","trait":"trăi","traiti":"trăi","traitoare":"trăitor","traitoarea":"trăitor","traitoarele":"trăitor","traitori":"trăitor","traitorii":"trăitor","traitorul":"trăitor","traitul":"trăit","traitule":"trăit","traitului":"trăit","traiul":"trai","traiule":"trai","traiului":"trai","traiutul":"trăiuț","traiutule":"trăiuț","traiutului":"trăiuț","traiuturi":"trăiuț","traiuturile":"trăiuț","traiuturilor":"trăiuț","trambacii":"trâmbaci","trambacilor":"trâmbaci","trambaciul":"trâmbaci","trambaciule":"trâmbaci","trambaciului":"trâmbaci","trambe":"trâmbă","trambei":"trâmbă","trambele":"trâmbă","trambelor":"trâmbă","trambicioare":"trâmbicioară","trambicioarei":"trâmbicioară","trambicioarele":"trâmbicioară","trambicioarelor":"trâmbicioară","trambitai":"trâmbița","trambitam":["trâmbițăm","trâmbița","trâmbițam","trâmbița"],"trambitand":"trâmbița","trambitara":"trâmbița","trambitaram":"trâmbița","trambitarati":"trâmbița","trambitarea":"trâmbițare","trambitari":["trâmbițari","trâmbițar","trâmbițări","trâmbițare"],"trambitarii":["trâmbițarii","trâmbițar","trâmbițării","trâmbițare"],"trambitarile":"trâmbițare","trambitarilor":["trâmbițarilor","trâmbițar","trâmbițărilor","trâmbițare"],"trambitarul":"trâmbițar","trambitarule":"trâmbițar","trambitarului":"trâmbițar","trambitase":"trâmbița","trambitasem":"trâmbița","trambitasera":"trâmbița","trambitaseram":"trâmbița","trambitaserati":"trâmbița","trambitasesi":"trâmbița","trambitasi":["trâmbițași","trâmbița","trâmbițași","trâmbițaș"],"trambitasii":"trâmbițaș","trambitasilor":"trâmbițaș","trambitasul":"trâmbițaș","trambitasule":"trâmbițaș","trambitasului":"trâmbițaș","trambitat":"trâmbița","trambitati":"trâmbița","trambitatoare":"trâmbițător","trambitatoarea":"trâmbițător","trambitatoarele":"trâmbițător","trambitatori":"trâmbițător","trambitatorii":"trâmbițător","trambitatorul":"trâmbițător","trambitau":"trâmbița","trambite":"trâmbiță","trambiteaza":"trâmbița","trambitei":"trâmbiță","trambitele":"trâmbiță","trambitelor":"trâmbiță","trambitez":"trâmbița","trambitezi":"trâmbița","trambitoaie":"trâmbițoi","trambitoaiele":"trâmbițoi","trambitoaielor":"trâmbițoi","trambitoiul":"trâmbițoi","trambitoiule":"trâmbițoi","trambitoiului":"trâmbițoi","trambituci":"trâmbitucă","trambitucii":"trâmbitucă","trambitucile":"trâmbitucă","trambitucilor":"trâmbitucă","trambituici":"trămbițuică","trambituicii":"trămbițuică","trambituicile":"trămbițuică","trambituicilor":"trămbițuică","trambulinae":"trambulină","trambulinaele":"trambulină","trambulinaelor":"trambulină","trambulinaul":"trambulină","trambulinaule":"trambulină","trambulinaului":"trambulină","trambuline":"trambulină","trambulite":"trâmbuliță","trambulitei":"trâmbuliță","trambulitele":"trâmbuliță","trambulitelor":"trâmbuliță","tramcare":"tramcar","tramcarele":"tramcar","tramcarelor":"tramcar","tramcarul":"tramcar","tramcarule":"tramcar","tramcarului":"tramcar","trame":"tramă","tramisi":"trămis","tramisii":"trămis","tramisilor":"trămis","tramisul":"trămis","tramisule":"trămis","tramisului":"trămis","tramite":"trimite","tramiterea":"trămitere","tramiteri":"trămitere","tramiterii":"trămitere","tramiterile":"trămitere","tramiterilor":"trămitere","tramvaie":"tramvai","tramvaiele":"tramvai","tramvaielor":"tramvai","tramvaisti":"tramvaist","tramvaistii":"tramvaist","tramvaistilor":"tramvaist","tramvaistul":"tramvaist","tramvaistule":"tramvaist","tramvaistului":"tramvaist","tramvaiul":"tramvai","tramvaiule":"tramvai","tramvaiului":"tramvai","tramversare":"traversare","tramversarea":"tramversare","tramversari":"tramversare","tramversarii":"tramversare","tramversarile":"tramversare","tramversarilor":"tramversare","trancanea":"trăncăni","trancaneai":"trăncăni","trancaneam":"trăncăni","trancaneati":"trăncăni","trancaneau":"trăncăni","trancaneli":"trăncăneală","trancanelii":"trăncăneală","trancanelile":"trăncăneală","trancanelilor":"trăncăneală","trancanesc":"trăncăni","trancaneste":"trăncăni","trancanesti":"trăncăni","trancanii":"trăncăni","trancanim":"trăncăni","trancanind":"trăncăni","trancanira":"trăncăni","trancaniram":"trăncăni","trancanirati":"trăncăni","trancanirea":"trăncănire","trancaniri":"trăncănire","trancanirii":"trăncănire","trancanirile":"trăncănire","trancanirilor":"trăncănire","trancanise":"trăncăni","trancanisem":"trăncăni","trancanisera":"trăncăni","trancaniseram":"trăncăni","trancaniserati":"trăncăni","trancanisesi":"trăncăni","trancanisi":"trăncăni","trancanit":"trăncăni","trancaniti":"trăncăni","trancanitori":"trăncănitor","trancanitorii":"trăncănitor","trancanitorilor":"trăncănitor","trancanitorul":"trăncănitor","trancanitorule":"trăncănitor","trancanitorului":"trăncănitor","tranchila":["tranchilă","tranchil","tranchila","tranchil"],"tranchile":"tranchil","tranchilele":"tranchil","tranchili":"tranchil","tranchilii":"tranchil","tranchilitatea":"tranchilitate","tranchilitati":"tranchilitate","tranchilitatii":"tranchilitate","tranchilizai":"tranchiliza","tranchilizam":["tranchilizăm","tranchiliza","tranchilizam","tranchiliza"],"tranchilizand":"tranchiliza","tranchilizanti":"tranchilizant","tranchilizantile":"tranchilizant","tranchilizantilor":"tranchilizant","tranchilizantul":"tranchilizant","tranchilizantule":"tranchilizant","tranchilizantului":"tranchilizant","tranchilizara":"tranchiliza","tranchilizaram":"tranchiliza","tranchilizarati":"tranchiliza","tranchilizase":"tranchiliza","tranchilizasem":"tranchiliza","tranchilizasera":"tranchiliza","tranchilizaseram":"tranchiliza","tranchilizaserati":"tranchiliza","tranchilizasesi":"tranchiliza","tranchilizasi":"tranchiliza","tranchilizat":"tranchiliza","tranchilizati":"tranchiliza","tranchilizau":"tranchiliza","tranchilizeaza":"tranchiliza","tranchilizez":"tranchiliza","tranchilizezi":"tranchiliza","tranchilul":"tranchil","tranda":["trândă","trând","trânda","trând"],"trandadai":"trandadaie","trandadaiea":"trandadaie","trandadaii":"trandadaie","trandadaile":"trandadaie","trandadailor":"trandadaie","trandafirasi":"trandafiraș","trandafirasii":"trandafiraș","trandafirasilor":"trandafiraș","trandafirasul":"trandafiraș","trandafirasule":"trandafiraș","trandafirasului":"trandafiraș","trandafirate":"trandafirată","trandafiratei":"trandafirată","trandafiratele":"trandafirată","trandafiratelor":"trandafirată","trandafirei":"trandafirel","trandafireli":"trandafirel","trandafirelii":"trandafirel","trandafirelilor":"trandafirel","trandafirelul":"trandafirel","trandafirelule":"trandafirel","trandafirelului":"trandafirel","trandafiri":"trandafir","trandafiria":"trandafiriu","trandafirie":"trandafiriu","trandafirii":["trandafirii","trandafir","trandafirii","trandafiriu"],"trandafiriii":"trandafiriu","trandafiriile":"trandafiriu","trandafirilor":"trandafir","trandafirisul":"trandafiriș","trandafirisule":"trandafiriș","trandafirisului":"trandafiriș","trandafirisuri":"trandafiriș","trandafirisurile":"trandafiriș","trandafirisurilor":"trandafiriș","trandafiriul":"trandafiriu","trandafirul":"trandafir","trandafirule":"trandafir","trandafirului":"trandafir","trandafiruti":"trandafiruț","trandafirutii":"trandafiruț","trandafirutilor":"trandafiruț","trandafirutul":"trandafiruț","trandafirutule":"trandafiruț","trandafirutului":"trandafiruț","trandava":["trândavă","trândav","trândava","trândav"],"trandavaie":"trandavai","trandavaiele":"trandavai","trandavaielor":"trandavai","trandavaiul":"trandavai","trandavaiule":"trandavai","trandavaiului":"trandavai","trandave":"trândav","trandavea":"trândăvi","trandaveai":"trândăvi","trandaveam":"trândăvi","trandaveati":"trândăvi","trandaveau":"trândăvi","trandavele":["trândavele","trândav","trăndăvele","trândăveală"],"trandavelei":"trândăveală","trandavelele":"trândăveală","trandavelelor":"trândăveală","trandaveli":"trândăveală","trandavesc":"trândăvi","trandaveste":"trândăvi","trandavesti":"trândăvi","trandavi":"trândav","trandavii":["trândavii","trândav","trândăvii","trândăvi"],"trandavim":"trândăvi","trandavind":"trândăvi","trandavira":"trândăvi","trandaviram":"trândăvi","trandavirati":"trândăvi","trandavirea":"trândăvire","trandaviri":"trândăvire","trandavirii":"trândăvire","trandavirile":"trândăvire","trandavirilor":"trândăvire","trandavise":"trândăvi","trandavisem":"trândăvi","trandavisera":"trândăvi","trandaviseram":"trândăvi","trandaviserati":"trândăvi","trandavisesi":"trândăvi","trandavisi":"trândăvi","trandavit":"trândăvi","trandaviti":"trândăvi","trandavitul":"trândăvit","trandavitule":"trândăvit","trandavitului":"trândăvit","trandavoasa":["trândăvoasă","trândăvos","trândăvoasa","trândăvos"],"trandavoase":"trândăvos","trandavoasele":"trândăvos","trandavosi":"trândăvos","trandavosii":"trândăvos","trandavosul":"trândăvos","trandavul":"trândav","trande":"trând","trandeale":"trândeală","trandealei":"trândeală","trandele":"trând","trandul":"trând","tranjoaice":"trânjoaică","tranjoaicei":"trânjoaică","tranjoaicele":"trânjoaică","tranjoaicelor":"trânjoaică","transafricana":["transafricană","transafrican","transafricana","transafrican"],"transafricane":"transafrican","transafricanele":"transafrican","transafricani":"transafrican","transafricanii":"transafrican","transafricanul":"transafrican","transai":"tranșa","transalpina":["transalpină","transalpin","transalpina","transalpin"],"transalpine":"transalpin","transalpinele":"transalpin","transalpini":"transalpin","transalpinii":"transalpin","transalpinul":"transalpin","transam":["tranșăm","tranșa","tranșam","tranșa"],"transamazoniana":["transamazoniană","transamazonian","transamazoniana","transamazonian"],"transamazonianul":"transamazonian","transamazoniene":"transamazonian","transamazonienele":"transamazonian","transamazonieni":"transamazonian","transamazonienii":"transamazonian","transamericani":"transamerican","transamericanile":"transamerican","transamericanilor":"transamerican","transamericanul":"transamerican","transamericanule":"transamerican","transamericanului":"transamerican","transand":"tranșa","transanta":["tranșantă","tranșant","tranșanta","tranșant"],"transante":"tranșant","transantele":"tranșant","transanti":"tranșant","transantii":"tranșant","transantul":"tranșant","transara":"tranșa","transaram":"tranșa","transarati":"tranșa","transarea":"tranșare","transarei":"tranșare","transase":"tranșa","transasem":"tranșa","transasera":"tranșa","transaseram":"tranșa","transaserati":"tranșa","transasesi":"tranșa","transasi":"tranșa","transasiatica":["transasiatică","transasiatic","transasiatica","transasiatic"],"transasiatice":"transasiatic","transasiaticele":"transasiatic","transasiatici":"transasiatic","transasiaticii":"transasiatic","transasiaticul":"transasiatic","transat":"tranșa","transati":"tranșa","transatlantica":["transatlantică","transatlantic","transatlantica","transatlantic"],"transatlantice":"transatlantic","transatlanticele":"transatlantic","transatlantici":"transatlantic","transatlanticii":"transatlantic","transatlanticul":"transatlantic","transatori":"tranșator","transatorii":"tranșator","transatorilor":"tranșator","transatorul":"tranșator","transatorule":"tranșator","transatorului":"tranșator","transau":"tranșa","transbordai":"transborda","transbordam":["transbordăm","transborda","transbordam","transborda"],"transbordand":"transborda","transbordara":"transborda","transbordaram":"transborda","transbordarati":"transborda","transbordarea":"transbordare","transbordari":"transbordare","transbordarii":"transbordare","transbordarile":"transbordare","transbordarilor":"transbordare","transbordase":"transborda","transbordasem":"transborda","transbordasera":"transborda","transbordaseram":"transborda","transbordaserati":"transborda","transbordasesi":"transborda","transbordasi":"transborda","transbordat":"transborda","transbordati":"transborda","transbordau":"transborda","transbordeaza":"transborda","transbordez":"transborda","transbordezi":"transborda","transbordoare":"transbordor","transbordoarele":"transbordor","transbordoarelor":"transbordor","transbordorul":"transbordor","transbordorule":"transbordor","transbordorului":"transbordor","transbordul":"transbord","transbordule":"transbord","transbordului":"transbord","transborduri":"transbord","transbordurile":"transbord","transbordurilor":"transbord","transcalcularea":"transcalculare","transcalculari":"transcalculare","transcalcularii":"transcalculare","transcarpatina":["transcarpatină","transcarpatin","transcarpatina","transcarpatin"],"transcarpatine":"transcarpatin","transcarpatinele":"transcarpatin","transcarpatini":"transcarpatin","transcarpatinii":"transcarpatin","transcarpatinul":"transcarpatin","transcaucaziana":["transcaucaziană","transcaucazian","transcaucaziana","transcaucazian"],"transcaucazianul":"transcaucazian","transcaucazie":"Transcaucazia","transcaucaziei":"Transcaucazia","transcaucaziene":"transcaucazian","transcaucazienele":"transcaucazian","transcaucazieni":"transcaucazian","transcaucazienii":"transcaucazian","transcaucazii":"Transcaucazia","transceanda":"transcende","transcedentala":["transcedentală","transcedental","transcedentala","transcedental"],"transcedentale":"transcedental","transcedentalele":"transcedental","transcedentali":"transcedental","transcedentalii":"transcedental","transcedentalul":"transcedental","transcend":"transcende","transcendea":"transcende","transcendeai":"transcende","transcendeam":"transcende","transcendeati":"transcende","transcendeau":"transcende","transcendem":"transcende","transcendenta":["transcendentă","transcendent","transcendenta","transcendent"],"transcendentala":["transcendentală","transcendental","transcendentala","transcendental"],"transcendentale":"transcendental","transcendentalele":"transcendental","transcendentali":"transcendental","transcendentalii":"transcendental","transcendentalismul":"transcendentalism","transcendentalismule":"transcendentalism","transcendentalismului":"transcendentalism","transcendentaliste":"transcendentalistă","transcendentalistei":"transcendentalistă","transcendentalistele":"transcendentalistă","transcendentalistelor":"transcendentalistă","transcendentalisti":"transcendentalist","transcendentalistii":"transcendentalist","transcendentalistilor":"transcendentalist","transcendentalistul":"transcendentalist","transcendentalistule":"transcendentalist","transcendentalistului":"transcendentalist","transcendentalitatea":"transcendentalitate","transcendentalitati":"transcendentalitate","transcendentalitatii":"transcendentalitate","transcendentalizai":"transcendentaliza","transcendentalizam":["transcendentalizăm","transcendentaliza","transcendentalizam","transcendentaliza"],"transcendentalizand":"transcendentaliza","transcendentalizara":"transcendentaliza","transcendentalizaram":"transcendentaliza","transcendentalizarati":"transcendentaliza","transcendentalizase":"transcendentaliza","transcendentalizasem":"transcendentaliza","transcendentalizasera":"transcendentaliza","transcendentalizaseram":"transcendentaliza","transcendentalizaserati":"transcendentaliza","transcendentalizasesi":"transcendentaliza","transcendentalizasi":"transcendentaliza","transcendentalizat":"transcendentaliza","transcendentalizati":"transcendentaliza","transcendentalizau":"transcendentaliza","transcendentalizeaza":"transcendentaliza","transcendentalizez":"transcendentaliza","transcendentalizezi":"transcendentaliza","transcendentalul":"transcendental","transcendente":["transcendente","transcendent","transcendențe","transcendență"],"transcendentei":"transcendență","transcendentele":"transcendent","transcendenti":"transcendent","transcendentii":"transcendent","transcendentismul":"transcendentism","transcendentismule":"transcendentism","transcendentismului":"transcendentism","transcendentul":"transcendent","transcenderea":"transcendere","transcenderi":"transcendere","transcenderii":"transcendere","transcenderile":"transcendere","transcenderilor":"transcendere","transcendeti":"transcende","transcense":"transcende","transcensei":"transcende","transcensera":"transcende","transcenseram":"transcende","transcenserati":"transcende","transcensese":"transcende","transcensesem":"transcende","transcensesera":"transcende","transcenseseram":"transcende","transcenseserati":"transcende","transcensesesi":"transcende","transcensesi":"transcende","transcenzand":"transcende","transcenzi":"transcende","transconductante":"transconductanță","transconductantei":"transconductanță","transconductantele":"transconductanță","transconductantelor":"transconductanță","transcontainere":"transcontainer","transcontainerele":"transcontainer","transcontainerelor":"transcontainer","transcontainerul":"transcontainer","transcontainerule":"transcontainer","transcontainerului":"transcontainer","transcontinentala":["transcontinentală","transcontinental","transcontinentala","transcontinental"],"transcontinentale":"transcontinental","transcontinentalele":"transcontinental","transcontinentali":"transcontinental","transcontinentalii":"transcontinental","transcontinentalul":"transcontinental","transcria":"transcrie","transcriai":"transcrie","transcriam":"transcrie","transcriati":"transcrie","transcriau":"transcrie","transcriem":"transcrie","transcrierea":"transcriere","transcrieri":"transcriere","transcrierii":"transcriere","transcrierile":"transcriere","transcrierilor":"transcriere","transcrieti":"transcrie","transcrii":"transcrie","transcriind":"transcrie","transcriitoarea":"transcriitoare","transcriitoarei":"transcriitoare","transcriitoarele":"transcriitoare","transcriitoarelor":"transcriitoare","transcriitori":"transcriitor","transcriitorii":"transcriitor","transcriitorilor":"transcriitor","transcriitorul":"transcriitor","transcriitorule":"transcriitor","transcriitorului":"transcriitor","transcripte":"transcript","transcriptele":"transcript","transcriptelor":"transcript","transcriptia":"transcripție","transcriptiei":"transcripție","transcriptii":"transcripție","transcriptiile":"transcripție","transcriptiilor":"transcripție","transcriptiunea":"transcripțiune","transcriptiuni":"transcripțiune","transcriptiunii":"transcripțiune","transcriptiunile":"transcripțiune","transcriptiunilor":"transcripțiune","transcriptul":"transcript","transcriptule":"transcript","transcriptului":"transcript","transcris":"transcrie","transcrise":"transcrie","transcrisei":"transcrie","transcrisera":"transcrie","transcriseram":"transcrie","transcriserati":"transcrie","transcrisese":"transcrie","transcrisesem":"transcrie","transcrisesera":"transcrie","transcriseseram":"transcrie","transcriseserati":"transcrie","transcrisesesi":"transcrie","transcrisesi":"transcrie","transcriu":"transcrie","transdanubiana":["transdanubiană","transdanubian","transdanubiana","transdanubian"],"transdanubianul":"transdanubian","transdanubiene":"transdanubian","transdanubienele":"transdanubian","transdanubieni":"transdanubian","transdanubienii":"transdanubian","transductia":"transducție","transductiei":"transducție","transductii":"transducție","transductiile":"transducție","transductiilor":"transducție","transductiva":["transductivă","transductiv","transductiva","transductiv"],"transductive":"transductiv","transductivele":"transductiv","transductivi":"transductiv","transductivii":"transductiv"};
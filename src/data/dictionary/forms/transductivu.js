@@ -0,0 +1 @@
+export default {"transductivul":"transductiv","transductoare":"transductor","transductoarele":"transductor","transductoarelor":"transductor","transductorul":"transductor","transductorule":"transductor","transductorului":"transductor","transdunareana":["transdunăreană","transdunărean","transdunăreana","transdunărean"],"transdunareanul":"transdunărean","transdunareanule":"transdunărean","transdunareanului":"transdunărean","transdunarene":"transdunărean","transdunarenele":"transdunărean","transdunareni":"transdunărean","transdunarenii":"transdunărean","transdunarenilor":"transdunărean","transe":["transe","transă","tranșe","tranșă"],"transeaza":"tranșa","transee":"tranșeu","transeea":"tranșee","transeei":"tranșee","transeele":["tranșeele","tranșee","tranșeele","tranșeu"],"transeelor":["tranșeelor","tranșee","tranșeelor","tranșeu"],"transei":["transei","transă","tranșei","tranșă"],"transele":["transele","transă","tranșele","tranșă"],"transelor":["transelor","transă","tranșelor","tranșă"],"transeptul":"transept","transeptule":"transept","transeptului":"transept","transepturi":"transept","transepturile":"transept","transepturilor":"transept","transeuropeana":["transeuropeană","transeuropean","transeuropeana","transeuropean"],"transeuropeanul":"transeuropean","transeuropene":"transeuropean","transeuropenele":"transeuropean","transeuropeni":"transeuropean","transeuropenii":"transeuropean","transeuul":"tranșeu","transeuule":"tranșeu","transeuului":"tranșeu","transez":"tranșa","transezi":"tranșa","transfer":"transfera","transferabila":["transferabilă","transferabil","transferabila","transferabil"],"transferabile":"transferabil","transferabilele":"transferabil","transferabili":"transferabil","transferabilii":"transferabil","transferabilul":"transferabil","transferai":"transfera","transferam":["transferăm","transfera","transferam","transfera"],"transferand":"transfera","transferara":"transfera","transferaram":"transfera","transferarati":"transfera","transferarea":"transferare","transferari":"transferare","transferarii":"transferare","transferarile":"transferare","transferarilor":"transferare","transferase":"transfera","transferasem":"transfera","transferasera":"transfera","transferaseram":"transfera","transferaserati":"transfera","transferasesi":"transfera","transferasi":"transfera","transferat":"transfera","transferata":["transferată","transferat","transferata","transferat"],"transferate":"transferat","transferatele":"transferat","transferati":["transferați","transfera","transferați","transferat"],"transferatii":"transferat","transferatul":"transferat","transferau":"transfera","transferi":"transfera","transferul":"transfer","transferule":"transfer","transferului":"transfer","transferuri":"transfer","transferuri de credit":"transfer de credit","transferuri de tehnologie":"transfer de tehnologie","transferuri tehnologice":"transfer tehnologic","transferurile":"transfer","transferurilor":"transfer","transfigurai":"transfigura","transfiguram":["transfigurăm","transfigura","transfiguram","transfigura"],"transfigurand":"transfigura","transfigurara":"transfigura","transfiguraram":"transfigura","transfigurarati":"transfigura","transfigurarea":"transfigurare","transfigurari":"transfigurare","transfigurarii":"transfigurare","transfigurarile":"transfigurare","transfigurarilor":"transfigurare","transfigurase":"transfigura","transfigurasem":"transfigura","transfigurasera":"transfigura","transfiguraseram":"transfigura","transfiguraserati":"transfigura","transfigurasesi":"transfigura","transfigurasi":"transfigura","transfigurat":"transfigura","transfigurata":["transfigurată","transfigurat","transfigurata","transfigurat"],"transfigurate":"transfigurat","transfiguratele":"transfigurat","transfigurati":["transfigurați","transfigura","transfigurați","transfigurat"],"transfiguratia":"transfigurație","transfiguratiei":"transfigurație","transfiguratii":["transfigurații","transfigurat","transfigurații","transfigurație"],"transfiguratiile":"transfigurație","transfiguratiilor":"transfigurație","transfiguratiunea":"transfigurațiune","transfiguratiuni":"transfigurațiune","transfiguratiunii":"transfigurațiune","transfiguratiunile":"transfigurațiune","transfiguratiunilor":"transfigurațiune","transfiguratul":"transfigurat","transfigurau":"transfigura","transfigureaza":"transfigura","transfigurez":"transfigura","transfigurezi":"transfigura","transfinita":["transfinită","transfinit","transfinita","transfinit"],"transfinite":"transfinit","transfinitele":"transfinit","transfiniti":"transfinit","transfinitii":"transfinit","transfinitul":"transfinit","transfixia":"transfixie","transfixiei":"transfixie","transfixii":"transfixie","transfluente":"transfluență","transfluentei":"transfluență","transfluentele":"transfluență","transfluentelor":"transfluență","transfocatoare":"transfocator","transfocatoarele":"transfocator","transfocatoarelor":"transfocator","transfocatorul":"transfocator","transfocatorule":"transfocator","transfocatorului":"transfocator","transform":"transforma","transformabila":["transformabilă","transformabil","transformabila","transformabil"],"transformabile":"transformabil","transformabilele":"transformabil","transformabili":"transformabil","transformabilii":"transformabil","transformabilitatea":"transformabilitate","transformabilitati":"transformabilitate","transformabilitatii":"transformabilitate","transformabilitatile":"transformabilitate","transformabilitatilor":"transformabilitate","transformabilul":"transformabil","transformai":"transforma","transformam":["transformăm","transforma","transformam","transforma"],"transformand":"transforma","transformara":"transforma","transformaram":"transforma","transformarati":"transforma","transformarea":"transformare","transformari":"transformare","transformari fourier":"tranformare Fourier","transformarii":"transformare","transformarile":"transformare","transformarilor":"transformare","transformase":"transforma","transformasem":"transforma","transformasera":"transforma","transformaseram":"transforma","transformaserati":"transforma","transformasesi":"transforma","transformasi":"transforma","transformat":"transforma","transformata":["transformată","transformat","transformata","transformat"],"transformate":"transformat","transformate fourier inverse":"transformată Fourier inversă","transformate laplace":"transformată Laplace","transformatele":"transformat","transformati":["transformați","transforma","transformați","transformat"],"transformatia":"transformație","transformatiei":"transformație","transformatii":["transformații","transformat","transformații","transformație"],"transformatiile":"transformație","transformatiilor":"transformație","transformationala":["transformațională","transformațional","transformaționala","transformațional"],"transformationale":"transformațional","transformationalele":"transformațional","transformationali":"transformațional","transformationalii":"transformațional","transformationalismul":"transformaționalism","transformationalismule":"transformaționalism","transformationalismului":"transformaționalism","transformationalul":"transformațional","transformatiunea":"transformațiune","transformatiuni":"transformațiune","transformatiunii":"transformațiune","transformatiunile":"transformațiune","transformatiunilor":"transformațiune","transformatori":"transformator","transformatorile":"transformator","transformatorilor":"transformator","transformatorul":"transformator","transformatorule":"transformator","transformatorului":"transformator","transformatul":"transformat","transformau":"transforma","transforme":"transforma","transformi":"transforma","transformismul":"transformism","transformismule":"transformism","transformismului":"transformism","transformisti":"transformist","transformistii":"transformist","transformistilor":"transformist","transformistul":"transformist","transformistule":"transformist","transformistului":"transformist","transfrontaliera":["transfrontalieră","transfrontalier","transfrontaliera","transfrontalier"],"transfrontaliere":"transfrontalier","transfrontalierele":"transfrontalier","transfrontalieri":"transfrontalier","transfrontalierii":"transfrontalier","transfrontalierul":"transfrontalier","transfuge":"transfugă","transfugei":"transfugă","transfugele":"transfugă","transfugelor":"transfugă","transfugi":"transfug","transfugii":"transfug","transfugilor":"transfug","transfugul":"transfug","transfugule":"transfug","transfugului":"transfug","transfuzai":"transfuza","transfuzam":["transfuzăm","transfuza","transfuzam","transfuza"],"transfuzand":"transfuza","transfuzara":"transfuza","transfuzaram":"transfuza","transfuzarati":"transfuza","transfuzase":"transfuza","transfuzasem":"transfuza","transfuzasera":"transfuza","transfuzaseram":"transfuza","transfuzaserati":"transfuza","transfuzasesi":"transfuza","transfuzasi":"transfuza","transfuzat":"transfuza","transfuzati":"transfuza","transfuzau":"transfuza","transfuzeaza":"transfuza","transfuzez":"transfuza","transfuzezi":"transfuza","transfuzia":"transfuzie","transfuziei":"transfuzie","transfuzii":"transfuzie","transfuzii de sange":"transfuzie de sânge","transfuzii sanguine":"transfuzie sanguină","transfuziile":"transfuzie","transfuziilor":"transfuzie","transfuziunea":"transfuziune","transfuziuni":"transfuziune","transfuziunii":"transfuziune","transfuziunile":"transfuziune","transfuziunilor":"transfuziune","transgresai":"transgresa","transgresam":["transgresăm","transgresa","transgresam","transgresa"],"transgresand":"transgresa","transgresara":"transgresa","transgresaram":"transgresa","transgresarati":"transgresa","transgresarea":"transgresare","transgresari":"transgresare","transgresarii":"transgresare","transgresarile":"transgresare","transgresarilor":"transgresare","transgresase":"transgresa","transgresasem":"transgresa","transgresasera":"transgresa","transgresaseram":"transgresa","transgresaserati":"transgresa","transgresasesi":"transgresa","transgresasi":"transgresa","transgresat":"transgresa","transgresata":["transgresată","transgresat","transgresata","transgresat"],"transgresate":"transgresat","transgresatele":"transgresat","transgresati":["transgresați","transgresa","transgresați","transgresat"],"transgresatii":"transgresat","transgresatul":"transgresat","transgresau":"transgresa","transgreseaza":"transgresa","transgresez":"transgresa","transgresezi":"transgresa","transgresia":"transgresie","transgresiei":"transgresie","transgresii":"transgresie","transgresiile":"transgresie","transgresiilor":"transgresie","transgresiunea":"transgresiune","transgresiunei":"transgresiune","transgresiunele":"transgresiune","transgresiunelor":"transgresiune","transgresiuni":"transgresiune","transgresiva":["transgresivă","transgresiv","transgresiva","transgresiv"],"transgresive":"transgresiv","transgresivele":"transgresiv","transgresivi":"transgresiv","transgresivii":"transgresiv","transgresivul":"transgresiv","transgresori":"transgresor","transgresorii":"transgresor","transgresorilor":"transgresor","transgresorul":"transgresor","transgresorule":"transgresor","transgresorului":"transgresor","transhum":"transhuma","transhumai":"transhuma","transhumam":["transhumăm","transhuma","transhumam","transhuma"],"transhumand":"transhuma","transhumanta":["transhumantă","transhumant","transhumanta","transhumant"],"transhumante":["transhumante","transhumant","transhumanțe","transhumanță"],"transhumantei":"transhumanță","transhumantele":["transhumantele","transhumant","transhumanțele","transhumanță"],"transhumantelor":"transhumanță","transhumanti":"transhumant","transhumantii":"transhumant","transhumantul":"transhumant","transhumara":"transhuma","transhumaram":"transhuma","transhumarati":"transhuma","transhumase":"transhuma","transhumasem":"transhuma","transhumasera":"transhuma","transhumaseram":"transhuma","transhumaserati":"transhuma","transhumasesi":"transhuma","transhumasi":"transhuma","transhumat":"transhuma","transhumati":"transhuma","transhumau":"transhuma","transhumi":"transhuma","transig":"transige","transiga":"transige","transigand":"transige","transigea":"transige","transigeai":"transige","transigeam":"transige","transigeati":"transige","transigeau":"transige","transigem":"transige","transigenta":["transigentă","transigent","transigenta","transigent"],"transigente":["transigente","transigent","transigențe","transigență"],"transigentei":"transigență","transigentele":"transigent","transigenti":"transigent","transigentii":"transigent","transigentul":"transigent","transigeti":"transige","transigi":"transige","transiluminarea":"transiluminare","transiluminari":"transiluminare","transiluminarii":"transiluminare","transilvana":["transilvană","transilvan","transilvana","transilvan"],"transilvane":"transilvan","transilvaneana":["transilvăneană","transilvănean","transilvăneana","transilvănean"],"transilvaneanul":"transilvănean","transilvaneanule":"transilvănean","transilvaneanului":"transilvănean","transilvanele":"transilvan","transilvanence":"transilvăneancă","transilvanencei":"transilvăneancă","transilvanencele":"transilvăneancă","transilvanencelor":"transilvăneancă","transilvanene":["transilvănene","transilvănean","transilvănene","transilvăneană"],"transilvanenei":"transilvăneană","transilvanenele":["transilvănenele","transilvănean","transilvănenele","transilvăneană"],"transilvanenelor":"transilvăneană","transilvaneni":"transilvănean","transilvanenii":"transilvănean","transilvanenilor":"transilvănean","transilvani":"transilvan","transilvanie":"Transilvania","transilvaniei":"Transilvania","transilvanii":["transilvanii","transilvan","transilvanii","Transilvania"],"transilvanul":"transilvan","transise":"transige","transisei":"transige","transisera":"transige","transiseram":"transige","transiserati":"transige","transisese":"transige","transisesem":"transige","transisesera":"transige","transiseseram":"transige","transiseserati":"transige","transisesesi":"transige","transisesi":"transige","transistoare":"transistor","transistoarele":"transistor","transistoarelor":"transistor","transistorul":"transistor","transistorule":"transistor","transistorului":"transistor","translai":"transla","translam":["translăm","transla","translam","transla"],"transland":"transla","translara":"transla","translaram":"transla","translarati":"transla","translarea":"translare","translari":"translare","translarii":"translare","translarile":"translare","translarilor":"translare","translase":"transla","translasem":"transla","translasera":"transla","translaseram":"transla","translaserati":"transla","translasesi":"transla","translasi":"transla","translat":"transla","translatai":"translata","translatam":["translatăm","translata","translatam","translata"],"translatand":"translata","translatara":"translata","translataram":"translata","translatarati":"translata","translatase":"translata","translatasem":"translata","translatasera":"translata","translataseram":"translata","translataserati":"translata","translatasesi":"translata","translatasi":"translata","translatat":"translata","translatati":"translata","translatau":"translata","translateaza":"translata","translatez":"translata","translatezi":"translata","translati":"transla","translatia":"translație","translatiei":"translație","translatii":"translație","translatiile":"translație","translatiilor":"translație","translatiunea":"translațiune","translatiuni":"translațiune","translatiunii":"translațiune","translatiunile":"translațiune","translatiunilor":"translațiune","translativa":["translativă","translativ","translativa","translativ"],"translative":"translativ","translativele":"translativ","translativi":"translativ","translativii":"translativ","translativul":"translativ","translatoarea":"translatoare","translatoarei":"translatoare","translatoarele":"translatoare","translatoarelor":"translatoare","translatori":"translator","translau":"transla","transleaza":"transla","translez":"transla","translezi":"transla","transliterai":"translitera","transliteram":["transliterăm","translitera","transliteram","translitera"],"transliterand":"translitera","transliterara":"translitera","transliteraram":"translitera","transliterarati":"translitera","transliterarea":"transliterare","transliterari":"transliterare","transliterarii":"transliterare","transliterarile":"transliterare","transliterarilor":"transliterare","transliterase":"translitera","transliterasem":"translitera","transliterasera":"translitera","transliteraseram":"translitera","transliteraserati":"translitera","transliterasesi":"translitera","transliterasi":"translitera","transliterat":"translitera","transliterata":["transliterată","transliterat","transliterata","transliterat"],"transliterate":"transliterat","transliteratele":"transliterat","transliterati":["transliterați","translitera","transliterați","transliterat"],"transliteratia":"transliterație","transliteratiei":"transliterație","transliteratii":["transliterații","transliterat","transliterații","transliterație"],"transliteratiile":"transliterație","transliteratiilor":"transliterație","transliteratul":"transliterat","transliterau":"translitera","translitereaza":"translitera","transliterez":"translitera","transliterezi":"translitera","transloc":"transloca","translocai":"transloca","translocam":["translocăm","transloca","translocam","transloca"],"translocand":"transloca","translocara":"transloca","translocaram":"transloca","translocarati":"transloca","translocarea":"translocare","translocari":"translocare","translocarii":"translocare","translocarile":"translocare","translocarilor":"translocare","translocase":"transloca","translocasem":"transloca","translocasera":"transloca","translocaseram":"transloca","translocaserati":"transloca","translocasesi":"transloca","translocasi":"transloca","translocat":"transloca","translocata":["translocată","translocat","translocata","translocat"],"translocate":"translocat","translocatele":"translocat","translocati":["translocați","transloca","translocați","translocat"],"translocatia":"translocație","translocatiei":"translocație","translocatii":["translocații","translocat","translocații","translocație"],"translocatiile":"translocație","translocatiilor":"translocație","translocatul":"translocat","translocau":"transloca","transloci":"transloca","translucida":["translucidă","translucid","translucida","translucid"],"translucide":"translucid","translucidele":"translucid","transluciditatea":"transluciditate","transluciditati":"transluciditate","transluciditatii":"transluciditate","translucidul":"translucid","translucizi":"translucid","translucizii":"translucid","translunara":["translunară","translunar","translunara","translunar"],"translunare":"translunar","translunarele":"translunar","translunari":"translunar","translunarii":"translunar","translunarul":"translunar","transmarina":["transmarină","transmarin","transmarina","transmarin"],"transmarine":"transmarin","transmarinele":"transmarin","transmarini":"transmarin","transmarinii":"transmarin","transmarinul":"transmarin","transmediteraneana":["transmediteraneană","transmediteranean","transmediteraneana","transmediteranean"],"transmediteraneanul":"transmediteranean","transmediteranene":"transmediteranean","transmediteranenele":"transmediteranean","transmediteraneni":"transmediteranean","transmediteranenii":"transmediteranean","transmigrai":"transmigra","transmigram":["transmigrăm","transmigra","transmigram","transmigra"],"transmigrand":"transmigra","transmigranti":"transmigrant","transmigrantii":"transmigrant","transmigrantilor":"transmigrant","transmigrantul":"transmigrant","transmigrantule":"transmigrant","transmigrantului":"transmigrant","transmigrara":"transmigra","transmigraram":"transmigra","transmigrarari":"transmigrare","transmigrararii":"transmigrare","transmigrararile":"transmigrare","transmigrararilor":"transmigrare","transmigrarati":"transmigra","transmigrarea":"transmigrare","transmigrase":"transmigra","transmigrasem":"transmigra","transmigrasera":"transmigra","transmigraseram":"transmigra","transmigraserati":"transmigra","transmigrasesi":"transmigra","transmigrasi":"transmigra","transmigrat":"transmigra","transmigrati":"transmigra","transmigratia":"transmigrație","transmigratiei":"transmigrație","transmigratii":"transmigrație","transmigratiile":"transmigrație","transmigratiilor":"transmigrație","transmigratiunea":"transmigrațiune","transmigratiuni":"transmigrațiune","transmigratiunii":"transmigrațiune","transmigratiunile":"transmigrațiune","transmigratiunilor":"transmigrațiune","transmigrau":"transmigra","transmigreaza":"transmigra","transmigrez":"transmigra","transmigrezi":"transmigra","transmis":"transmite","transmisa":["transmisă","transmis","transmisa","transmis"],"transmise":["transmise","transmis","transmise","transmite"],"transmisei":"transmite","transmisele":"transmis","transmisera":"transmite","transmiseram":"transmite","transmiserati":"transmite","transmisese":"transmite","transmisesem":"transmite","transmisesera":"transmite","transmiseseram":"transmite","transmiseserati":"transmite","transmisesesi":"transmite","transmisesi":"transmite","transmisi":"transmis","transmisibila":["transmisibilă","transmisibil","transmisibila","transmisibil"],"transmisibile":"transmisibil","transmisibilele":"transmisibil","transmisibili":"transmisibil","transmisibilii":"transmisibil","transmisibilitatea":"transmisibilitate","transmisibilitati":"transmisibilitate","transmisibilitatii":"transmisibilitate","transmisibilitatile":"transmisibilitate","transmisibilitatilor":"transmisibilitate","transmisibilul":"transmisibil","transmisii":["transmișii","transmis","transmisii","transmisie"],"transmisioniste":"transmisionistă","transmisionistei":"transmisionistă","transmisionistele":"transmisionistă","transmisionistelor":"transmisionistă","transmisionisti":"transmisionist","transmisionistii":"transmisionist","transmisionistilor":"transmisionist","transmisionistul":"transmisionist","transmisionistule":"transmisionist","transmisionistului":"transmisionist","transmisiunea":"transmisiune","transmisiuni":"transmisiune","transmisiunii":"transmisiune","transmisiunile":"transmisiune","transmisiunilor":"transmisiune","transmisul":"transmis","transmit":"transmite","transmita":"transmite","transmitand":"transmite","transmitatori":"transmițător","transmitatorile":"transmițător","transmitatorilor":"transmițător","transmitatorul":"transmițător","transmitatorule":"transmițător","transmitatorului":"transmițător","transmitea":"transmite","transmiteai":"transmite","transmiteam":"transmite","transmiteati":"transmite","transmiteau":"transmite","transmitem":"transmite","transmiterea":"transmitere","transmiteri":"transmitere","transmiterii":"transmitere","transmiterile":"transmitere","transmiterilor":"transmitere","transmiteti":"transmite","transmiti":"transmite","transmodulatia":"transmodulație","transmodulatiei":"transmodulație","transmodulatii":"transmodulație","transmodulatiile":"transmodulație","transmodulatiilor":"transmodulație","transmontana":["transmontană","transmontan","transmontana","transmontan"],"transmontane":"transmontan","transmontanele":"transmontan","transmontani":"transmontan","transmontanii":"transmontan","transmontanul":"transmontan","transmut":"transmuta","transmutabila":["transmutabilă","transmutabil","transmutabila","transmutabil"],"transmutabile":"transmutabil","transmutabilele":"transmutabil","transmutabili":"transmutabil","transmutabilii":"transmutabil","transmutabilitatea":"transmutabilitate","transmutabilitati":"transmutabilitate","transmutabilitatii":"transmutabilitate","transmutabilul":"transmutabil","transmutai":"transmuta","transmutam":["transmutăm","transmuta","transmutam","transmuta"],"transmutand":"transmuta","transmutara":"transmuta","transmutaram":"transmuta","transmutarati":"transmuta","transmutarea":"transmutare","transmutari":"transmutare","transmutarii":"transmutare","transmutarile":"transmutare","transmutarilor":"transmutare","transmutase":"transmuta","transmutasem":"transmuta","transmutasera":"transmuta","transmutaseram":"transmuta","transmutaserati":"transmuta","transmutasesi":"transmuta","transmutasi":"transmuta","transmutat":"transmuta","transmutati":"transmuta","transmutatia":"transmutație","transmutatiei":"transmutație","transmutatii":"transmutație","transmutatiile":"transmutație","transmutatiilor":"transmutație","transmutatiunea":"transmutațiune","transmutatiuni":"transmutațiune","transmutatiunii":"transmutațiune","transmutatiunile":"transmutațiune","transmutatiunilor":"transmutațiune","transmutau":"transmuta","transmute":"transmuta","transmuti":"transmuta","transnationala":["transnațională","transnațional","transnaționala","transnațional"],"transnationale":"transnațional","transnationalele":"transnațional","transnationali":"transnațional","transnationalii":"transnațional","transnationalul":"transnațional","transnistreance":"transnistreancă","transnistreancei":"transnistreancă","transnistreancele":"transnistreancă","transnistreancelor":"transnistreancă","transnistreanul":"transnistrean","transnistreanule":"transnistrean","transnistreanului":"transnistrean","transnistrena":["transnistrenă","transnistreană","transnistrena","transnistreană"],"transnistrene":"transnistreană","transnistrenei":"transnistreană","transnistrenele":"transnistreană","transnistrenelor":"transnistreană","transnistreni":"transnistrean","transnistrenii":"transnistrean","transnistrenilor":"transnistrean","transnistriei":"Transnistria","transoceanica":["transoceanică","transoceanic","transoceanica","transoceanic"],"transoceanice":"transoceanic","transoceanicele":"transoceanic","transoceanici":"transoceanic","transoceanicii":"transoceanic","transoceanicul":"transoceanic","transpacifica":["transpacifică","transpacific","transpacifica","transpacific"],"transpacifice":"transpacific","transpacificele":"transpacific","transpacifici":"transpacific","transpacificii":"transpacific","transpacificile":"transpacific","transpacificilor":"transpacific","transpacificul":"transpacific","transpacificule":"transpacific","transpacificului":"transpacific","transpar":"transpărea","transpara":"transpărea","transparand":"transpărea","transpare":"transpărea","transpareai":"transpărea","transpaream":"transpărea","transpareat":"transpărea","transpareati":"transpărea","transpareau":"transpărea","transparem":"transpărea","transparenta":["transparentă","transparent","transparenta","transparent"],"transparente":["transparente","transparent","transparențe","transparență"],"transparentea":"transparente","transparentei":"transparență","transparentele":["transparentele","transparent","transparențele","transparență","transparentele","transparente"],"transparentelor":"transparență","transparenti":["transparenți","transparent","transparenți","transparente"],"transparentii":["transparenții","transparent","transparenții","transparente"],"transparentul":"transparent","transpareti":"transpărea","transpari":"transpărea","transparitiunea":"transparițiune","transparitiuni":"transparițiune","transparitiunii":"transparițiune","transparitiunile":"transparițiune","transparitiunilor":"transparițiune","transparu":"transpărea","transparui":"transpărea","transparura":"transpărea","transparuram":"transpărea","transparurati":"transpărea","transparuse":"transpărea","transparusem":"transpărea","transparusera":"transpărea","transparuseram":"transpărea","transparuserati":"transpărea","transparusesi":"transpărea","transparusi":"transpărea","transperitoneala":["transperitoneală","transperitoneal","transperitoneala","transperitoneal"],"transperitoneale":"transperitoneal","transperitonealele":"transperitoneal","transperitoneali":"transperitoneal","transperitonealii":"transperitoneal","transperitonealul":"transperitoneal","transpir":"transpira","transpirabila":["transpirabilă","transpirabil","transpirabila","transpirabil"],"transpirabile":"transpirabil","transpirabilele":"transpirabil","transpirabili":"transpirabil","transpirabilii":"transpirabil","transpirabilul":"transpirabil","transpirai":"transpira","transpiram":["transpirăm","transpira","transpiram","transpira"],"transpirand":"transpira","transpirara":"transpira","transpiraram":"transpira","transpirarati":"transpira","transpirarea":"transpirare","transpirari":"transpirare","transpirarii":"transpirare","transpirase":"transpira","transpirasem":"transpira","transpirasera":"transpira","transpiraseram":"transpira","transpiraserati":"transpira","transpirasesi":"transpira","transpirasi":"transpira","transpirat":"transpira","transpirata":["transpirată","transpirat","transpirata","transpirat"],"transpirate":"transpirat","transpiratele":"transpirat","transpirati":["transpirați","transpira","transpirați","transpirat"],"transpiratia":"transpirație","transpiratiei":"transpirație","transpiratii":["transpirații","transpirat","transpirații","transpirație"],"transpiratiunea":"transpirațiune","transpiratiuni":"transpirațiune","transpiratiunii":"transpirațiune","transpiratiunile":"transpirațiune","transpiratiunilor":"transpirațiune","transpiratul":"transpirat","transpirau":"transpira","transpire":"transpira","transpiri":"transpira","transplantabila":["transplantabilă","transplantabil","transplantabila","transplantabil"],"transplantabile":"transplantabil","transplantabilele":"transplantabil","transplantabili":"transplantabil","transplantabilii":"transplantabil","transplantabilul":"transplantabil","transplantai":"transplanta","transplantam":["transplantăm","transplanta","transplantam","transplanta"],"transplantand":"transplanta","transplantara":"transplanta","transplantaram":"transplanta","transplantarati":"transplanta","transplantarea":"transplantare","transplantari":"transplantare","transplantarii":"transplantare","transplantarile":"transplantare","transplantarilor":"transplantare","transplantase":"transplanta","transplantasem":"transplanta","transplantasera":"transplanta","transplantaseram":"transplanta","transplantaserati":"transplanta","transplantasesi":"transplanta","transplantasi":"transplanta","transplantat":"transplanta","transplantata":["transplantată","transplantat","transplantata","transplantat"],"transplantate":"transplantat","transplantatele":"transplantat","transplantati":["transplantați","transplanta","transplantați","transplantat"],"transplantatia":"transplantație","transplantatiei":"transplantație","transplantatii":["transplantații","transplantat","transplantații","transplantație"],"transplantatiile":"transplantație","transplantatiilor":"transplantație","transplantatul":"transplantat","transplantau":"transplanta","transplanteaza":"transplanta","transplantez":"transplanta","transplantezi":"transplanta","transplantologia":"transplantologie","transplantologiei":"transplantologie","transplantologii":"transplantologie","transplantul":"transplant","transplantule":"transplant","transplantului":"transplant","transplanturi":"transplant","transplanturile":"transplant","transplanturilor":"transplant","transpleurala":["transpleurală","transpleural","transpleurala","transpleural"],"transpleurale":"transpleural","transpleuralele":"transpleural","transpleurali":"transpleural","transpleuralii":"transpleural","transpleuralul":"transpleural","transport":"transporta","transportabila":["transportabilă","transportabil","transportabila","transportabil"],"transportabile":"transportabil","transportabilele":"transportabil","transportabili":"transportabil","transportabilii":"transportabil","transportabilul":"transportabil","transportai":"transporta","transportam":["transportăm","transporta","transportam","transporta"],"transportand":"transporta","transportara":"transporta","transportaram":"transporta","transportarati":"transporta","transportarea":"transportare","transportarei":"transportare","transportase":"transporta","transportasem":"transporta","transportasera":"transporta","transportaseram":"transporta","transportaserati":"transporta","transportasesi":"transporta","transportasi":"transporta","transportat":"transporta","transportata":["transportată","transportat","transportata","transportat"],"transportate":"transportat","transportatele":"transportat","transportati":["transportați","transporta","transportați","transportat"],"transportatia":"transportație","transportatiei":"transportație","transportatii":["transportații","transportat","transportații","transportație"],"transportatiile":"transportație","transportatiilor":"transportație","transportatoare":"transportator","transportatoarea":"transportator","transportatoarele":"transportator","transportatori":"transportator","transportatorii":"transportator","transportatorilor":"transportator","transportatorul":"transportator","transportatorule":"transportator","transportatorului":"transportator","transportatul":"transportat","transportau":"transporta","transporte":"transporta","transporti":"transporta","transportoare blindate":"transportor blindat","transportori":"transportor","transportorile":"transportor","transportorilor":"transportor","transportorul":"transportor","transportorule":"transportor","transportorului":"transportor","transportuia":"transportui","transportuiai":"transportui","transportuiam":"transportui","transportuiati":"transportui","transportuiau":"transportui","transportuie":"transportui","transportuii":"transportui","transportuim":"transportui","transportuind":"transportui","transportuira":"transportui","transportuiram":"transportui","transportuirati":"transportui","transportuise":"transportui","transportuisem":"transportui","transportuisera":"transportui","transportuiseram":"transportui","transportuiserati":"transportui","transportuisesi":"transportui","transportuisi":"transportui","transportuit":"transportui","transportuiti":"transportui","transportul":"transport","transportule":"transport","transportului":"transport","transporturi":"transport","transporturile":"transport","transporturilor":"transport","transpozitia":"transpoziție","transpozitiei":"transpoziție","transpozitii":"transpoziție","transpozitiile":"transpoziție","transpozitiilor":"transpoziție","transpozitiunea":"transpozițiune","transpozitiuni":"transpozițiune","transpozitiunii":"transpozițiune","transpozitiunile":"transpozițiune","transpozitiunilor":"transpozițiune","transpozitiva":["transpozitivă","transpozitiv","transpozitiva","transpozitiv"],"transpozitive":"transpozitiv","transpozitivele":"transpozitiv","transpozitivi":"transpozitiv","transpozitivii":"transpozitiv","transpozitivul":"transpozitiv","transpui":"transpune","transpun":"transpune","transpuna":"transpune","transpunand":"transpune","transpunea":"transpune","transpuneai":"transpune","transpuneam":"transpune","transpuneati":"transpune","transpuneau":"transpune","transpunem":"transpune","transpunerea":"transpunere","transpuneri":"transpunere","transpunerii":"transpunere","transpunerile":"transpunere","transpunerilor":"transpunere","transpuneti":"transpune","transpus":"transpune","transpusa":["transpusă","transpus","transpusa","transpus"],"transpuse":["transpuse","transpune","transpuse","transpus"],"transpusei":"transpune","transpusele":"transpus","transpusera":"transpune","transpuseram":"transpune","transpuserati":"transpune","transpusese":"transpune","transpusesem":"transpune","transpusesera":"transpune","transpuseseram":"transpune","transpuseserati":"transpune","transpusesesi":"transpune","transpusesi":"transpune","transpusi":"transpus","transpusii":"transpus","transpusul":"transpus","transregionala":["transregională","transregional","transregionala","transregional"],"transregionale":"transregional","transregionalele":"transregional","transregionali":"transregional","transregionalii":"transregional","transregionalul":"transregional","transsahariana":["transsahariană","transsaharian","transsahariana","transsaharian"],"transsaharianul":"transsaharian","transsaharianule":"transsaharian","transsaharianului":"transsaharian","transsahariene":"transsaharian","transsaharienele":"transsaharian","transsaharieni":"transsaharian","transsaharienii":"transsaharian","transsaharienile":"transsaharian","transsaharienilor":"transsaharian","transsexuala":["transsexuală","transsexual","transsexuala","transsexual"],"transsexuale":["transsexuale","transsexual","transsexuale","transsexuală"],"transsexualei":"transsexuală","transsexualele":["transsexualele","transsexual","transsexualele","transsexuală"],"transsexualelor":"transsexuală","transsexuali":"transsexual","transsexualii":"transsexual","transsexualismul":"transsexualism","transsexualismule":"transsexualism","transsexualismului":"transsexualism","transsexualul":"transsexual","transsiberianul":"transsiberian","transsiberianule":"transsiberian","transsiberianului":"transsiberian","transsiberiene":"transsiberian","transsiberienele":"transsiberian","transsiberienelor":"transsiberian","transsonica":["transsonică","transsonic","transsonica","transsonic"],"transsonice":"transsonic","transsonicele":"transsonic","transsonici":"transsonic","transsonicii":"transsonic","transsonicul":"transsonic","transsubstantiai":"transsubstanția","transsubstantiam":"transsubstanția","transsubstantiara":"transsubstanția","transsubstantiaram":"transsubstanția","transsubstantiarati":"transsubstanția","transsubstantiase":"transsubstanția","transsubstantiasem":"transsubstanția","transsubstantiasera":"transsubstanția","transsubstantiaseram":"transsubstanția","transsubstantiaserati":"transsubstanția","transsubstantiasesi":"transsubstanția","transsubstantiasi":"transsubstanția","transsubstantiat":"transsubstanția","transsubstantiati":"transsubstanția","transsubstantiatiunea":"transsubstanțiațiune","transsubstantiatiuni":"transsubstanțiațiune","transsubstantiatiunii":"transsubstanțiațiune","transsubstantiatiunile":"transsubstanțiațiune","transsubstantiatiunilor":"transsubstanțiațiune","transsubstantiau":"transsubstanția","transsubstantiaza":"transsubstanția","transsubstantie":"transsubstanția","transsubstantieaza":"transsubstanția","transsubstantiem":"transsubstanția","transsubstantierea":"transsubstanțiere","transsubstantieri":"transsubstanțiere","transsubstantierii":"transsubstanțiere","transsubstantiez":"transsubstanția","transsubstantiezi":"transsubstanția","transsubstantiind":"transsubstanția","transsudate":"transsudat","transsudatele":"transsudat","transsudatelor":"transsudat","transsudatia":"transsudație","transsudatiei":"transsudație","transsudatii":"transsudație","transsudatiile":"transsudație","transsudatiilor":"transsudație","transsudatul":"transsudat","transsudatule":"transsudat","transsudatului":"transsudat","transumana":["transumană","transuman","transumana","transuman"],"transumane":"transuman","transumanele":"transuman","transumani":"transuman","transumanii":"transuman","transumanul":"transuman","transuraniana":["transuraniană","transuranian","transuraniana","transuranian"],"transuranianul":"transuranian","transuranica":["transuranică","transuranic","transuranica","transuranic"],"transuranice":"transuranic","transuranicele":"transuranic","transuranici":"transuranic","transuranicii":"transuranic","transuranicul":"transuranic","transuraniene":"transuranian","transuranienele":"transuranian","transuranieni":"transuranian","transuranienii":"transuranian","transvazai":"transvaza","transvazam":["transvazăm","transvaza","transvazam","transvaza"],"transvazand":"transvaza","transvazara":"transvaza","transvazaram":"transvaza","transvazarati":"transvaza","transvazase":"transvaza","transvazasem":"transvaza","transvazasera":"transvaza","transvazaseram":"transvaza","transvazaserati":"transvaza","transvazasesi":"transvaza","transvazasi":"transvaza","transvazat":"transvaza","transvazati":"transvaza","transvazau":"transvaza","transvazeaza":"transvaza","transvazez":"transvaza","transvazezi":"transvaza","transverioare":"transvertor","transverioarele":"transvertor","transverioarelor":"transvertor","transversala":["transversală","transversal","transversala","transversal"],"transversale":["transversale","transversal","transversale","transversală"],"transversalei":"transversală","transversalele":["transversalele","transversal","transversalele","transversală"],"transversalelor":"transversală","transversali":"transversal","transversalii":"transversal","transversalul":"transversal","transvertere":"transverter","transverterele":"transverter","transverterelor":"transverter","transverterul":"transverter","transverterule":"transverter","transverterului":"transverter","transvertorul":"transvertor","transvertorule":"transvertor","transvertorului":"transvertor","trante":"trântă","trantea":"trânti","tranteai":"trânti","tranteam":"trânti","tranteati":"trânti","tranteau":"trânti","trantei":"trântă","trantele":["trântele","trântă","trântele","trânteală"],"trantelei":"trânteală","trantelele":"trânteală","trantelelor":"trânteală","tranteli":"trânteală","trantelor":"trântă","trantesc":"trânti","tranteste":"trânti","trantesti":"trânti","trantii":"trânti","trantim":"trânti","trantind":"trânti","trantira":"trânti","trantiram":"trânti","trantirati":"trânti","trantirea":"trântire","trantiri":"trântire","trantirii":"trântire","trantirile":"trântire","trantirilor":"trântire","trantise":"trânti","trantisem":"trânti","trantisera":"trânti","trantiseram":"trânti","trantiserati":"trânti","trantisesi":"trânti","trantisi":"trânti","trantit":"trânti","trantita":["trântită","trântit","trântita","trântit"],"trantite":"trântit","trantitele":"trântit","trantiti":["trântiți","trânti","trântiți","trântit"],"trantitii":"trântit","trantitul":"trântit","trantituri":"trântitură","trantiturii":"trântitură","trantiturile":"trântitură","trantiturilor":"trântitură","trantorasi":"trântoraș","trantorasii":"trântoraș","trantorasilor":"trântoraș","trantorasul":"trântoraș","trantorasule":"trântoraș","trantorasului":"trântoraș","trantorea":"trântori","trantoreai":"trântori","trantoream":"trântori","trantoreati":"trântori","trantoreau":"trântori","trantoresc":"trântori","trantoreste":"trântori","trantoresti":"trântori","trantori":"trântor","trantorii":["trântorii","trântor","trântorii","trântori"],"trantorilor":"trântor","trantorim":"trântori","trantorind":"trântori","trantorira":"trântori","trantoriram":"trântori","trantorirati":"trântori","trantorise":"trântori","trantorisem":"trântori","trantorisera":"trântori","trantoriseram":"trântori","trantoriserati":"trântori","trantorisesi":"trântori","trantorisi":"trântori","trantorit":"trântori","trantorite":"trântoriță","trantoritei":"trântoriță","trantoritele":"trântoriță","trantoritelor":"trântoriță","trantoriti":"trântori","trantorul":"trântor","trantorule":"trântor","trantorului":"trântor","tranzactia":"tranzacție","tranzactiei":"tranzacție","tranzactii":"tranzacție","tranzactiile":"tranzacție","tranzactiilor":"tranzacție","tranzactionai":"tranzacționa","tranzactionala":["tranzacțională","tranzacțional","tranzacționala","tranzacțional"],"tranzactionale":"tranzacțional","tranzactionalele":"tranzacțional","tranzactionali":"tranzacțional","tranzactionalii":"tranzacțional","tranzactionalul":"tranzacțional","tranzactionam":["tranzacționăm","tranzacționa","tranzacționam","tranzacționa"],"tranzactionand":"tranzacționa","tranzactionara":"tranzacționa","tranzactionaram":"tranzacționa","tranzactionarati":"tranzacționa","tranzactionarea":"tranzacționare","tranzactionari":"tranzacționare","tranzactionarii":"tranzacționare","tranzactionarile":"tranzacționare","tranzactionarilor":"tranzacționare","tranzactionase":"tranzacționa","tranzactionasem":"tranzacționa","tranzactionasera":"tranzacționa","tranzactionaseram":"tranzacționa","tranzactionaserati":"tranzacționa","tranzactionasesi":"tranzacționa","tranzactionasi":"tranzacționa","tranzactionat":"tranzacționa","tranzactionata":["tranzacționată","tranzacționat","tranzacționata","tranzacționat"],"tranzactionate":"tranzacționat","tranzactionatele":"tranzacționat","tranzactionati":["tranzacționați","tranzacționa","tranzacționați","tranzacționat"],"tranzactionatii":"tranzacționat","tranzactionatul":"tranzacționat","tranzactionau":"tranzacționa","tranzactioneaza":"tranzacționa","tranzactionez":"tranzacționa","tranzactionezi":"tranzacționa","tranzactiunea":"tranzacțiune","tranzactiuni":"tranzacțiune","tranzactiunii":"tranzacțiune","tranzactiunile":"tranzacțiune","tranzactiunilor":"tranzacțiune","tranzelute":"trânzeluță","tranzelutei":"trânzeluță","tranzelutele":"trânzeluță","tranzelutelor":"trânzeluță","tranzi":"trând","tranzienta":["tranzientă","tranzient","tranzienta","tranzient"],"tranziente":["tranziente","tranzient","tranziențe","tranziență"],"tranzientei":"tranziență","tranzientele":"tranzient","tranzienti":"tranzient","tranzientii":"tranzient","tranzientul":"tranzient","tranzii":"trând","tranzistoare":"tranzistor","tranzistoarele":"tranzistor","tranzistoarelor":"tranzistor","tranzistorizai":"tranzistoriza","tranzistorizam":["tranzistorizăm","tranzistoriza","tranzistorizam","tranzistoriza"],"tranzistorizand":"tranzistoriza","tranzistorizara":"tranzistoriza","tranzistorizaram":"tranzistoriza","tranzistorizarati":"tranzistoriza","tranzistorizarea":"tranzistorizare","tranzistorizari":"tranzistorizare","tranzistorizarii":"tranzistorizare","tranzistorizarile":"tranzistorizare","tranzistorizarilor":"tranzistorizare","tranzistorizase":"tranzistoriza","tranzistorizasem":"tranzistoriza","tranzistorizasera":"tranzistoriza","tranzistorizaseram":"tranzistoriza","tranzistorizaserati":"tranzistoriza","tranzistorizasesi":"tranzistoriza","tranzistorizasi":"tranzistoriza","tranzistorizat":"tranzistoriza","tranzistorizata":["tranzistorizată","tranzistorizat","tranzistorizata","tranzistorizat"],"tranzistorizate":"tranzistorizat","tranzistorizatele":"tranzistorizat","tranzistorizati":["tranzistorizați","tranzistoriza","tranzistorizați","tranzistorizat"],"tranzistorizatii":"tranzistorizat","tranzistorizatul":"tranzistorizat","tranzistorizau":"tranzistoriza","tranzistorizeaza":"tranzistoriza","tranzistorizez":"tranzistoriza","tranzistorizezi":"tranzistoriza","tranzistorul":"tranzistor","tranzistorule":"tranzistor","tranzistorului":"tranzistor","tranzitai":"tranzita","tranzitam":["tranzităm","tranzita","tranzitam","tranzita"],"tranzitand":"tranzita","tranzitara":["tranzitară","tranzita","tranzitară","tranzitar","tranzitara","tranzitar"],"tranzitaram":"tranzita","tranzitarati":"tranzita","tranzitare":"tranzitar","tranzitarea":"tranzitare","tranzitarele":"tranzitar","tranzitari":["tranzitari","tranzitar","tranzitări","tranzitare"],"tranzitarii":["tranzitarii","tranzitar","tranzitării","tranzitare"],"tranzitarile":"tranzitare","tranzitarilor":"tranzitare","tranzitarul":"tranzitar","tranzitase":"tranzita","tranzitasem":"tranzita","tranzitasera":"tranzita","tranzitaseram":"tranzita","tranzitaserati":"tranzita","tranzitasesi":"tranzita","tranzitasi":"tranzita","tranzitat":"tranzita","tranzitati":"tranzita","tranzitau":"tranzita","tranziteaza":"tranzita","tranzitez":"tranzita","tranzitezi":"tranzita","tranzitia":"tranziție","tranzitiei":"tranziție","tranzitii":"tranziție","tranzitii de faza":"tranziție de fază","tranzitiile":"tranziție","tranzitiilor":"tranziție","tranzitionala":["tranzițională","tranzițional","tranziționala","tranzițional"],"tranzitionale":"tranzițional","tranzitionalele":"tranzițional","tranzitionali":"tranzițional","tranzitionalii":"tranzițional","tranzitionalul":"tranzițional","tranzitiunea":"tranzițiune","tranzitiuni":"tranzițiune","tranzitiunii":"tranzițiune","tranzitiunile":"tranzițiune","tranzitiunilor":"tranzițiune","tranzitiva":["tranzitivă","tranzitiv","tranzitiva","tranzitiv"],"tranzitive":"tranzitiv","tranzitivele":"tranzitiv","tranzitivi":"tranzitiv","tranzitivii":"tranzitiv","tranzitivitatea":"tranzitivitate","tranzitivitati":"tranzitivitate","tranzitivitatii":"tranzitivitate","tranzitivitatile":"tranzitivitate","tranzitivitatilor":"tranzitivitate","tranzitivul":"tranzitiv","tranzitoria":"tranzitoriu","tranzitorie":"tranzitoriu","tranzitorii":"tranzitoriu","tranzitoriii":"tranzitoriu","tranzitoriile":"tranzitoriu","tranzitoriul":"tranzitoriu","tranzitul":"tranzit","tranzitule":"tranzit","tranzitului":"tranzit","tranzituri":"tranzit","tranziturile":"tranzit","tranziturilor":"tranzit","trapada":"trepăda","trapasi":"trăpaș","trapasii":"trăpaș","trapasilor":"trăpaș","trapasul":"trăpaș","trapasule":"trăpaș","trapasului":"trăpaș","trape":"trapă","trapei":"trapă","trapele":"trapă","trapelor":"trapă","trapezarea":"trapezare","trapezari":"trapezare","trapezaria":"trapezărie","trapezariei":"trapezărie","trapezarii":["trapezării","trapezare","trapezării","trapezărie"],"trapezariile":"trapezărie","trapezariilor":"trapezărie","trapezarile":"trapezare","trapezarilor":"trapezare","trapeze":["trapeze","trapez","trapeze","trapeză"],"trapezei":"trapeză","trapezele":["trapezele","trapez","trapezele","trapeză"],"trapezelor":["trapezelor","trapez","trapezelor","trapeză"],"trapezismul":"trapezism","trapezismule":"trapezism","trapezismului":"trapezism","trapeziste":"trapezistă","trapezistei":"trapezistă","trapezistele":"trapezistă","trapezistelor":"trapezistă","trapezisti":"trapezist","trapezistii":"trapezist","trapezistilor":"trapezist","trapezistul":"trapezist","trapezistule":"trapezist","trapezistului":"trapezist","trapezoedre":"trapezoedru","trapezoedrele":"trapezoedru","trapezoedrelor":"trapezoedru","trapezoedrul":"trapezoedru","trapezoedrule":"trapezoedru","trapezoedrului":"trapezoedru","trapezoidala":["trapezoidală","trapezoidal","trapezoidala","trapezoidal"],"trapezoidale":"trapezoidal","trapezoidalele":"trapezoidal","trapezoidali":"trapezoidal","trapezoidalii":"trapezoidal","trapezoidalul":"trapezoidal","trapezoide":"trapezoid","trapezoidele":"trapezoid","trapezoidelor":"trapezoid","trapezoidul":"trapezoid","trapezoidule":"trapezoid","trapezoidului":"trapezoid","trapezul":"trapez","trapezule":"trapez","trapezului":"trapez","trapiste":"trapistă","trapistei":"trapistă","trapistele":"trapistă","trapistelor":"trapistă","trapisti":"trapist","trapistile":"trapist","trapistilor":"trapist","trapistul":"trapist","trapistule":"trapist","trapistului":"trapist","trapul":"trap","trapule":"trap","trapului":"trap","trapuri":"trap","trapurile":"trap","trapurilor":"trap","tras":"trage","tras apa":"trage apa","tras cu ochiul":"trage cu ochiul","tras cu urechea":"trage cu urechea","tras de limba":"trage de limbă","tras la cantar":"trage la cântar","tras la masea":"trage la măsea","tras la raspundere":"trage la răspundere","tras mata de coada":"trage mâța de coadă","tras nadejde":"trage nădejde","tras pe dreapta":"trage pe dreapta","tras pe nas":"trage pe nas","tras pe roata":"trage pe roată","tras pe sfoara":"trage pe sfoară","tras sforile":"trage sforile","tras targa pe uscat":"trage targa pe uscat","tras-o":"o trage","trasabila":["trasabilă","trasabil","trasabila","trasabil"],"trasabile":"trasabil","trasabilele":"trasabil","trasabili":"trasabil","trasabilii":"trasabil","trasabilitati":"trasabilitate","trasabilul":"trasabil","trasai":"trasa","trasajul":"trasaj","trasajule":"trasaj","trasajului":"trasaj","trasam":["trasăm","trasa","trasam","trasa"],"trasand":"trasa","trasara":"trasa","trasaram":"trasa","trasarati":"trasa","trasarea":"trasare","trasari":"trasare","trasarii":"trasare","trasarile":"trasare","trasarilor":"trasare","trasase":"trasa","trasasem":"trasa","trasasera":"trasa","trasaseram":"trasa","trasaserati":"trasa","trasasesi":"trasa","trasasi":"trasa","trasat":"trasa","trasata":["trasată","trasat","trasata","trasat"],"trasate":"trasat","trasatele":"trasat","trasati":["trasați","trasa","trasați","trasat"],"trasatii":"trasat","trasatul":"trasat","trasaturi":"trăsătură","trasaturii":"trăsătură","trasaturile":"trăsătură","trasaturilor":"trăsătură","trasau":"trasa","trascalia":"trăscălie","trascaliei":"trăscălie","trascalii":"trăscălie","trascaua":"trascău","trascauale":"trascău","trascaualor":"trascău","trascauul":["trascăuul","trascău","trăscăuul","trăscău"],"trascauule":["trascăuule","trascău","trăscăuule","trăscău"],"trascauului":["trascăuului","trascău","trăscăuului","trăscău"],"trase":"trage","traseaza":"trasa","trasee":"traseu","trasee de biciclete":"traseu de bicicletă","traseele":"traseu","traseelor":"traseu","trasei":"trage","trasera":"trage","traseram":"trage","traserati":"trage","trasese":"trage","trasesem":"trage","trasesera":"trage","traseseram":"trage","traseserati":"trage","trasesesi":"trage","trasesi":"trage","traseul":"traseu","traseule":"traseu","traseului":"traseu","trasez":"trasa","trasezi":"trasa","trasnai":"trăsnaie","trasnaia":"trăsnaie","trasnaii":"trăsnaie","trasnaile":"trăsnaie","trasnailor":"trăsnaie","trasnea":"trăsni","trasneai":"trăsni","trasneam":"trăsni","trasneati":"trăsni","trasneau":"trăsni","trasnele":"trăsneală","trasnelei":"trăsneală","trasnelele":"trăsneală","trasnelelor":"trăsneală","trasneli":"trăsneală","trasnesc":"trăsni","trasneste":"trăsni","trasnesti":"trăsni","trasnete":"trăsnet","trasnii":"trăsni","trasnim":"trăsni","trasnind":"trăsni","trasnira":"trăsni","trasniram":"trăsni","trasnirati":"trăsni","trasnirea":"trăsnire","trasniri":"trăsnire","trasnirii":"trăsnire","trasnirile":"trăsnire","trasnirilor":"trăsnire","trasnise":"trăsni","trasnisem":"trăsni","trasnisera":"trăsni","trasniseram":"trăsni","trasniserati":"trăsni","trasnisesi":"trăsni","trasnisi":"trăsni","trasnit":"trăsni","trasnita":["trăsnită","trăsnit","trăsnita","trăsnit"],"trasnite":"trăsnit","trasnitele":"trăsnit","trasniti":["trăsniți","trăsni","trăsniți","trăsnit"],"trasnitii":"trăsnit","trasnitoare":"trăsnitor","trasnitoarea":"trăsnitor","trasnitoarele":"trăsnitor","trasnitori":"trăsnitor","trasnitorii":"trăsnitor","trasnitorul":"trăsnitor","trasnitul":"trăsnit","trasnituri":"trăsnitură","trasniturii":"trăsnitură","trasniturile":"trăsnitură","trasniturilor":"trăsnitură","trasoare":"trasor","trasoarele":"trasor","trasoarelor":"trasor","trasorul":"trasor","trasorule":"trasor","trasorului":"trasor","trasul":"tras","trasule":"tras","trasului":"tras","trasuri":"trăsură","trasuri cu aburi":"trăsură cu aburi","trasurice":"trăsurică","trasuricei":"trăsurică","trasuricele":"trăsurică","trasuricelor":"trăsurică","trasurici":"trăsurică","trasurii":"trăsură","trasurile":"trăsură","trasurilor":"trăsură","tratabila":["tratabilă","tratabil","tratabila","tratabil"],"tratabile":"tratabil","tratabilele":"tratabil","tratabili":"tratabil","tratabilii":"tratabil","tratabilul":"tratabil","tratai":"trata","trataje":"trătaj","tratajei":"trătăjel","tratajeii":"trătăjel","tratajeilor":"trătăjel","tratajele":"trătaj","tratajelor":"trătaj","tratajelul":"trătăjel","tratajelule":"trătăjel","tratajelului":"trătăjel","tratajul":"trătaj","tratajule":"trătaj","tratajului":"trătaj","tratam":["tratăm","trata","tratam","trata"],"tratamente":"tratament","tratamentele":"tratament","tratamentelor":"tratament","tratamentisti":"tratamentist","tratamentistii":"tratamentist","tratamentistilor":"tratamentist","tratamentistul":"tratamentist","tratamentistule":"tratamentist","tratamentistului":"tratamentist","tratamentul":"tratament","tratamentule":"tratament","tratamentului":"tratament","tratand":"trata","tratara":"trata","trataram":"trata","tratarati":"trata","tratarea":"tratare","tratarei":"tratare","tratase":"trata","tratasem":"trata","tratasera":"trata","trataseram":"trata","trataserati":"trata","tratasesi":"trata","tratasi":"trata","tratat":"trata","tratata":["tratată","tratat","tratata","tratat"],"tratate":"tratat","tratatele":"tratat","tratatelor":"tratat","tratati":["tratați","trata","tratați","tratat"],"tratatia":"tratație","tratatiei":"tratație","tratatii":["tratații","tratat","tratații","tratație"],"tratatiile":"tratație","tratatiilor":"tratație","tratatiunea":"tratațiune","tratatiuni":"tratațiune","tratatiunii":"tratațiune","tratatiunile":"tratațiune","tratatiunilor":"tratațiune","tratativele":"tratative","tratativelor":"tratative","tratatul":"tratat","tratatule":"tratat","tratatului":"tratat","tratau":"trata","trateaza":"trata","tratez":"trata","tratezi":"trata","traulai":"traula","traulam":["traulăm","traula","traulam","traula"],"trauland":"traula","traulara":"traula","traularam":"traula","traularati":"traula","traularea":"traulare","traulari":"traulare","traularii":"traulare","traulase":"traula","traulasem":"traula","traulasera":"traula","traulaseram":"traula","traulaserati":"traula","traulasesi":"traula","traulasi":"traula","traulat":"traula","traulati":"traula","traulau":"traula","traule":"traul","trauleaza":"traula","traulele":"traul","traulelor":"traul","traulere":"trauler","traulerele":"trauler","traulerelor":"trauler","trauleristi":"traulerist","trauleristii":"traulerist","trauleristilor":"traulerist","trauleristul":"traulerist","trauleristule":"traulerist","trauleristului":"traulerist","traulerul":"trauler","traulerule":"trauler","traulerului":"trauler","traulez":"traula","traulezi":"traula","traulul":"traul","traulule":"traul","traulului":"traul","traumatica":["traumatică","traumatic","traumatica","traumatic"],"traumatice":"traumatic","traumaticele":"traumatic","traumatici":"traumatic","traumaticii":"traumatic","traumaticinaul":"traumaticină","traumaticinaule":"traumaticină","traumaticinaului":"traumaticină","traumaticine":"traumaticină","traumaticinele":"traumaticină","traumaticinelor":"traumaticină","traumaticul":"traumatic","traumatisme":"traumatism","traumatismele":"traumatism","traumatismelor":"traumatism","traumatismul":"traumatism","traumatismule":"traumatism","traumatismului":"traumatism","traumatizai":"traumatiza","traumatizam":["traumatizăm","traumatiza","traumatizam","traumatiza"],"traumatizand":"traumatiza","traumatizanta":["traumatizantă","traumatizant","traumatizanta","traumatizant"],"traumatizante":"traumatizant","traumatizantele":"traumatizant","traumatizanti":"traumatizant","traumatizantii":"traumatizant","traumatizantul":"traumatizant","traumatizara":"traumatiza","traumatizaram":"traumatiza","traumatizarati":"traumatiza","traumatizarea":"traumatizare","traumatizari":"traumatizare","traumatizarii":"traumatizare","traumatizarile":"traumatizare","traumatizarilor":"traumatizare","traumatizase":"traumatiza","traumatizasem":"traumatiza","traumatizasera":"traumatiza","traumatizaseram":"traumatiza","traumatizaserati":"traumatiza","traumatizasesi":"traumatiza","traumatizasi":"traumatiza","traumatizat":"traumatiza","traumatizata":["traumatizată","traumatizat","traumatizata","traumatizat"],"traumatizate":"traumatizat","traumatizatele":"traumatizat","traumatizati":["traumatizați","traumatiza","traumatizați","traumatizat"],"traumatizatii":"traumatizat","traumatizatul":"traumatizat","traumatizau":"traumatiza","traumatizeaza":"traumatiza","traumatizez":"traumatiza","traumatizezi":"traumatiza","traumatologe":"traumatologă","traumatologei":"traumatologă","traumatologele":"traumatologă","traumatologelor":"traumatologă","traumatologi":"traumatolog","traumatologia":"traumatologie","traumatologica":["traumatologică","traumatologic","traumatologica","traumatologic"],"traumatologice":"traumatologic","traumatologicele":"traumatologic","traumatologici":"traumatologic","traumatologicii":"traumatologic","traumatologicul":"traumatologic","traumatologiei":"traumatologie","traumatologii":["traumatologii","traumatolog","traumatologii","traumatologie"],"traumatologiile":"traumatologie","traumatologiilor":"traumatologie","traumatologilor":"traumatolog","traumatologul":"traumatolog","traumatologule":"traumatolog","traumatologului":"traumatolog","traume":"traumă","traumei":"traumă","traumele":"traumă","traumelor":"traumă","travalii":"travaliu","travaliile":"travaliu","travaliilor":"travaliu","travaliul":"travaliu","travaliule":"travaliu","travaliului":"travaliu","traveea":"travee","traveei":"travee","traveele":"travee","traveelor":"travee","traversabila":["traversabilă","traversabil","traversabila","traversabil"],"traversabile":"traversabil","traversabilele":"traversabil","traversabili":"traversabil","traversabilii":"traversabil","traversabilul":"traversabil","traversai":"traversa","traversam":["traversăm","traversa","traversam","traversa"],"traversand":"traversa","traversara":"traversa","traversaram":"traversa","traversarati":"traversa","traversarea":"traversare","traversari":"traversare","traversarii":"traversare","traversarile":"traversare","traversarilor":"traversare","traversase":"traversa","traversasem":"traversa","traversasera":"traversa","traversaseram":"traversa","traversaserati":"traversa","traversasesi":"traversa","traversasi":"traversa","traversat":"traversa","traversata":["traversată","traversat","traversata","traversat"],"traversate":"traversat","traversatele":"traversat","traversati":["traversați","traversa","traversați","traversat"],"traversatii":"traversat","traversatul":"traversat","traversau":"traversa","traverse":"traversă","traverseaza":"traversa","traversei":"traversă","traversele":"traversă","traverselor":"traversă","traversez":"traversa","traversezi":"traversa","traversul":"travers","traversule":"travers","traversului":"travers","traversuri":"travers","traversurile":"travers","traversurilor":"travers","travertinul":"travertin","travertinule":"travertin","travertinului":"travertin","travestea":"travesti","travesteai":"travesti","travesteam":"travesti","travesteati":"travesti","travesteau":"travesti","travestesc":"travesti","travesteste":"travesti","travestesti":"travesti","travestii":"travesti","travestim":"travesti","travestind":"travesti","travestira":"travesti","travestiram":"travesti","travestirati":"travesti","travestirea":"travestire","travestiri":"travestire","travestirii":"travestire","travestirile":"travestire","travestirilor":"travestire","travestise":"travesti","travestisem":"travesti","travestisera":"travesti","travestiseram":"travesti","travestiserati":"travesti","travestisesi":"travesti","travestisi":"travesti","travestit":"travesti","travestita":["travestită","travestit","travestita","travestit"],"travestite":"travestit","travestitele":"travestit","travestiti":["travestiți","travesti","travestiți","travestit"],"travestitii":"travestit","travestitul":"travestit","travestiuri":"travestiu","travestiurile":"travestiu","travestiurilor":"travestiu","travestiuul":"travestiu","travestiuule":"travestiu","travestiuului":"travestiu","tre":["tre","tre'","tre","trebuie"],"treaca":"trece","treaca baba cu colacii":"trece baba cu colacii","treaca ca gasca prin apa":"trece ca gâsca prin apă","treaca cu vederea":"trece cu vederea","treacatul":"treacăt","treacatule":"treacăt","treacatului":"treacăt","treampe":"treampă","treampei":"treampă","treampele":"treampă","treampelor":"treampă","treante":"treanță","treantei":"treanță","treantele":"treanță","treantelor":"treanță","treapada":"trepăda","treapadul":"treapăd","treapadule":"treapăd","treapadului":"treapăd","treapatul":"treapăt","treapatule":"treapăt","treapatului":"treapăt","treascul":"treasc","treascule":"treasc","treascului":"treasc","treascuri":"treasc","treascurile":"treasc","treascurilor":"treasc","treaza":["trează","treaz","treaza","treaz"],"treazul":"treaz","treazva":["treazvă","treazv","treazva","treazv"],"treazve":"treazv","treazvele":"treazv","treazvi":"treazv","treazvii":"treazv","treazvul":"treazv","trebaluia":"trebălui","trebaluiai":"trebălui","trebaluiam":"trebălui","trebaluiati":"trebălui","trebaluiau":"trebălui","trebaluieli":"trebăluială","trebaluielii":"trebăluială","trebaluielile":"trebăluială","trebaluielilor":"trebăluială","trebaluiesc":"trebălui","trebaluieste":"trebălui","trebaluiesti":"trebălui","trebaluii":"trebălui","trebaluim":"trebălui","trebaluind":"trebălui","trebaluira":"trebălui","trebaluiram":"trebălui","trebaluirati":"trebălui","trebaluise":"trebălui","trebaluisem":"trebălui","trebaluisera":"trebălui","trebaluiseram":"trebălui","trebaluiserati":"trebălui","trebaluisesi":"trebălui","trebaluisi":"trebălui","trebaluit":"trebălui","trebaluiti":"trebălui","trebe":"trebui","trebi":"treabă","trebie":"trebuie","trebii":"treabă","trebnice":"trebnic","trebnicele":"trebnic","trebnicelor":"trebnic","trebnicia":"trebnicie","trebniciei":"trebnicie","trebnicii":"trebnicie","trebniciile":"trebnicie","trebniciilor":"trebnicie","trebnicul":"trebnic","trebnicule":"trebnic","trebnicului":"trebnic","trebsoare":"trebșoară","trebsoarei":"trebșoară","trebsoarele":"trebșoară","trebsoarelor":"trebșoară","trebuce":"trebucă","trebucei":"trebucă","trebuia":"trebui","trebuiai":"trebui","trebuiam":"trebui","trebuiati":"trebui","trebuiau":"trebui","trebuie":"trebui","trebuiesc":"trebui","trebuieste":"trebui","trebuiesti":"trebui","trebuii":"trebui","trebuim":"trebui","trebuincioasa":["trebuincioasă","trebuincios","trebuincioasa","trebuincios"],"trebuincioase":"trebuincios","trebuincioasele":"trebuincios","trebuinciosi":"trebuincios","trebuinciosii":"trebuincios","trebuinciosul":"trebuincios","trebuind":"trebui","trebuinte":"trebuință"};
@@ -0,0 +1 @@
+export default {"trebuintei":"trebuință","trebuintele":"trebuință","trebuintelor":"trebuință","trebuira":"trebui","trebuiram":"trebui","trebuirati":"trebui","trebuise":"trebui","trebuisem":"trebui","trebuisera":"trebui","trebuiseram":"trebui","trebuiserati":"trebui","trebuisesi":"trebui","trebuisi":"trebui","trebuit":"trebui","trebuiti":"trebui","trebuitoare":"trebuitor","trebuitoarea":"trebuitor","trebuitoarele":"trebuitor","trebuitori":"trebuitor","trebuitoria":"trebuitoriu","trebuitorie":"trebuitoriu","trebuitorii":["trebuitorii","trebuitor","trebuitorii","trebuitoriu"],"trebuitoriii":"trebuitoriu","trebuitoriile":"trebuitoriu","trebuitoriul":"trebuitoriu","trebuitorul":"trebuitor","trebunale":"trebunal","trebunalele":"trebunal","trebunalelor":"trebunal","trebunalul":"trebunal","trebunalule":"trebunal","trebunalului":"trebunal","trebunare":"trebunar","trebunarele":"trebunar","trebunarelor":"trebunar","trebunarul":"trebunar","trebunarule":"trebunar","trebunarului":"trebunar","treburi":"treabă","treburile":"treabă","treburilor":"treabă","trebusoare":"trebușoară","trebusoarei":"trebușoară","trebusoarele":"trebușoară","trebusoarelor":"trebușoară","trebute":"trebuță","trebutei":"trebuță","trebutele":"trebuță","trebutelor":"trebuță","trec":"trece","trecand":"trece","trecatoare":"trecător","trecatoarea":["trecătoarea","trecătoare","trecătoarea","trecător"],"trecatoarele":"trecător","trecatori":["trecători","trecătoare","trecători","trecător"],"trecatoria":"trecătoriu","trecatorie":"trecătoriu","trecatorii":["trecătorii","trecătoare","trecătorii","trecător","trecătorii","trecătoriu"],"trecatoriii":"trecătoriu","trecatoriile":"trecătoriu","trecatorile":"trecătoare","trecatorilor":["trecătorilor","trecătoare","trecătorilor","trecător"],"trecatoriul":"trecătoriu","trecatoriuul":"trecătoriu","trecatoriuule":"trecătoriu","trecatoriuului":"trecătoriu","trecatorul":"trecător","trecatorule":"trecător","trecatorului":"trecător","trecaturi":"trecătură","trecaturii":"trecătură","trecaturile":"trecătură","trecaturilor":"trecătură","trecea":"trece","treceai":"trece","treceam":"trece","treceati":"trece","treceau":"trece","trecem":"trece","trecentoul":"trecento","trecentoule":"trecento","trecentoului":"trecento","trecerea":"trecere","treceri":"trecere","treceri de nivel":"trecere de nivel","treceri de pietoni":"trecere de pietoni","treceri in revista":"trecere în revistă","trecerii":"trecere","trecerile":"trecere","trecerilor":"trecere","treceti":"trece","treci":"trece","trecleta":["trecletă","treclet","trecleta","treclet"],"treclete":"treclet","trecletele":"treclet","trecleti":"treclet","trecletii":"treclet","trecletul":"treclet","trecu":"trece","trecui":"trece","trecura":"trece","trecuram":"trece","trecurati":"trece","trecuse":"trece","trecusem":"trece","trecusera":"trece","trecuseram":"trece","trecuserati":"trece","trecusesi":"trece","trecusi":"trece","trecut":"trece","trecut baba cu colacii":"trece baba cu colacii","trecut ca gasca prin apa":"trece ca gâsca prin apă","trecut cu vederea":"trece cu vederea","trecuta":["trecută","trecut","trecuta","trecut"],"trecute":"trecut","trecutela":["trecuțelă","trecuțel","trecuțela","trecuțel"],"trecutele":["trecutele","trecut","trecuțele","trecuțel"],"trecutelele":"trecuțel","trecuteli":"trecuțel","trecutelii":"trecuțel","trecutelul":"trecuțel","trecuti":"trecut","trecutii":"trecut","trecutul":"trecut","treflata":["treflată","treflat","treflata","treflat"],"treflate":"treflat","treflatele":"treflat","treflati":"treflat","treflatii":"treflat","treflatul":"treflat","trefle":"treflă","treflei":"treflă","treflele":"treflă","treflelor":"treflă","tregheri":"tregher","tregherii":"tregher","tregherilor":"tregher","tregherul":"tregher","tregherule":"tregher","tregherului":"tregher","treiaje":"treiaj","treiajele":"treiaj","treiajelor":"treiaj","treiajul":"treiaj","treiajule":"treiaj","treiajului":"treiaj","treier":"treiera","treierai":"treiera","treieram":["treierăm","treiera","treieram","treiera"],"treierand":"treiera","treierara":"treiera","treieraram":"treiera","treierarati":"treiera","treierarea":"treierare","treierari":"treierare","treierarii":"treierare","treierase":"treiera","treierasem":"treiera","treierasera":"treiera","treieraseram":"treiera","treieraserati":"treiera","treierasesi":"treiera","treierasi":"treiera","treierat":"treiera","treierati":"treiera","treieratoarea":"treierătoare","treieratoarei":"treierătoare","treieratoarele":"treierătoare","treieratoarelor":"treierătoare","treieratori":"treierător","treieratorii":"treierător","treieratorilor":"treierător","treieratorul":"treierător","treieratorule":"treierător","treieratorului":"treierător","treieratul":"treierat","treieratule":"treierat","treieratului":"treierat","treierau":"treiera","treiere":"treiera","treieri":"treiera","treierisul":"treieriș","treierisule":"treieriș","treierisului":"treieriș","treierisuri":"treieriș","treierisurile":"treieriș","treierisurilor":"treieriș","treierul":"treier","treierule":"treier","treierului":"treier","treilere":"treiler","treilerele":"treiler","treilerelor":"treiler","treilerul":"treiler","treilerule":"treiler","treilerului":"treiler","treimea":"treime","treimi":"treime","treimii":"treime","treimile":"treime","treimilor":"treime","treispe":"treisprezece","treiti":"treiță","treitii":"treiță","treitile":"treiță","treitilor":"treiță","treizeci si doua f &":"treizeci și două","treizeci si una f &":"treizeci și una","treji":"treaz","trejii":"treaz","trematode":"trematod","trematodele":"trematod","trematodelor":"trematod","trematodul":"trematod","trematodule":"trematod","trematodului":"trematod","trembolente":"trembolență","trembolentei":"trembolență","trembolentele":"trembolență","trembolentelor":"trembolență","treme":"tremă","tremei":"tremă","tremele":"tremă","tremelor":"tremă","tremete":"trimite","tremolata":["tremolată","tremolat","tremolata","tremolat"],"tremolate":"tremolat","tremolatele":"tremolat","tremolati":"tremolat","tremolatii":"tremolat","tremolatul":"tremolat","tremolite":"tremolit","tremolitele":"tremolit","tremolitelor":"tremolit","tremolitul":"tremolit","tremolitule":"tremolit","tremolitului":"tremolit","tremoloul":"tremolo","tremoloule":"tremolo","tremoloului":"tremolo","tremolouri":"tremolo","tremolourile":"tremolo","tremolourilor":"tremolo","tremolul":"tremol","tremolule":"tremol","tremolului":"tremol","tremoluri":"tremol","tremolurile":"tremol","tremolurilor":"tremol","tremturoasa":["tremțuroasă","tremțuros","tremțuroasa","tremțuros"],"tremturoase":"tremțuros","tremturoasele":"tremțuros","tremturosi":"tremțuros","tremturosii":"tremțuros","tremturosul":"tremțuros","tremulatia":"tremulație","tremulatiei":"tremulație","tremulatii":"tremulație","tremulatiile":"tremulație","tremulatiilor":"tremulație","tremur":"tremura","tremuracioasa":["tremurăcioasă","tremurăcios","tremurăcioasa","tremurăcios"],"tremuracioase":"tremurăcios","tremuracioasele":"tremurăcios","tremuraciosi":"tremurăcios","tremuraciosii":"tremurăcios","tremuraciosul":"tremurăcios","tremurai":"tremura","tremuram":["tremurăm","tremura","tremuram","tremura"],"tremurand":"tremura","tremuranda":["tremurândă","tremurând","tremurânda","tremurând"],"tremurande":"tremurând","tremurandele":"tremurând","tremurandul":"tremurând","tremuranzi":"tremurând","tremuranzii":"tremurând","tremurara":"tremura","tremuraram":"tremura","tremurarati":"tremura","tremurarea":"tremurare","tremurari":"tremurare","tremurarii":"tremurare","tremurase":"tremura","tremurasem":"tremura","tremurasera":"tremura","tremuraseram":"tremura","tremuraserati":"tremura","tremurasesi":"tremura","tremurasi":"tremura","tremurat":"tremura","tremurata":["tremurată","tremurat","tremurata","tremurat"],"tremurate":"tremurat","tremuratele":"tremurat","tremurati":["tremurați","tremura","tremurați","tremurat"],"tremuratii":"tremurat","tremurato":"tremurător","tremuratoarea":"tremurătoare","tremuratoarei":"tremurătoare","tremuratoarele":"tremurătoare","tremuratoarelor":"tremurătoare","tremuratori":"tremurător","tremuratorii":"tremurător","tremuratorile":"tremurător","tremuratorilor":"tremurător","tremuratul":"tremurat","tremuraturi":"tremurătură","tremuraturii":"tremurătură","tremuraturile":"tremurătură","tremuraturilor":"tremurătură","tremurau":"tremura","tremure":["tremure","tremur","tremure","tremura"],"tremurele":["tremurele","tremur","tremurele","tremureală"],"tremurelei":"tremureală","tremurelele":"tremureală","tremurelelor":"tremureală","tremureli":"tremureală","tremurelor":"tremur","tremuri":"tremura","tremuriciul":"tremurici","tremuriciule":"tremurici","tremuriciului":"tremurici","tremuriciuri":"tremurici","tremuriciurile":"tremurici","tremuriciurilor":"tremurici","tremurinda":["tremurindă","tremurind","tremurinda","tremurind"],"tremurinde":"tremurind","tremurindele":"tremurind","tremurindul":"tremurind","tremurinzi":"tremurind","tremurinzii":"tremurind","tremuristea":"tremuriște","tremuristi":"tremuriște","tremuristii":"tremuriște","tremuristile":"tremuriște","tremuristilor":"tremuriște","tremuroasa":["tremuroasă","tremuros","tremuroasa","tremuros"],"tremuroase":"tremuros","tremuroasele":"tremuros","tremurosi":"tremuros","tremurosii":"tremuros","tremurosul":"tremuros","tremurul":"tremur","tremurule":"tremur","tremurului":"tremur","tremurusul":"tremuruș","tremurusule":"tremuruș","tremurusului":"tremuruș","trenai":"trena","trenajul":"trenaj","trenajule":"trenaj","trenajului":"trenaj","trenam":["trenăm","trena","trenam","trena"],"trenand":"trena","trenanta":["trenantă","trenant","trenanta","trenant"],"trenante":"trenant","trenantele":"trenant","trenanti":"trenant","trenantii":"trenant","trenantul":"trenant","trenara":"trena","trenaram":"trena","trenarati":"trena","trenase":"trena","trenasem":"trena","trenasera":"trena","trenaseram":"trena","trenaserati":"trena","trenasesi":"trena","trenasi":"trena","trenat":"trena","trenati":"trena","trenau":"trena","trencicotul":"trencicot","trencicotule":"trencicot","trencicotului":"trencicot","trencicoturi":"trencicot","trencicoturile":"trencicot","trencicoturilor":"trencicot","trenciul":"trenci","trenciule":"trenci","trenciului":"trenci","trenciuri":"trenci","trenciurile":"trenci","trenciurilor":"trenci","trendul":"trend","trendule":"trend","trendului":"trend","trenduri":"trend","trendurile":"trend","trendurilor":"trend","trene":"trenă","treneaza":"trena","trenei":"trenă","trenele":"trenă","trenelor":"trenă","trenez":"trena","trenezi":"trena","treningul":"trening","treningule":"trening","treningului":"trening","treninguri":"trening","treningurile":"trening","treningurilor":"trening","trentaroasa":["trențăroasă","trențăros","trențăroasa","trențăros"],"trentaroase":"trențăros","trentaroasele":"trențăros","trentarosi":"trențăros","trentarosii":"trențăros","trentarosul":"trențăros","trenteroasa":["trențeroasă","trențeros","trențeroasa","trențeros"],"trenteroase":"trențeros","trenteroasele":"trențeros","trenterosi":"trențeros","trenterosii":"trențeros","trenterosul":"trențeros","trentoasa":["trențoasă","trențos","trențoasa","trențos"],"trentoase":"trențos","trentoasele":"trențos","trentosi":"trențos","trentosii":"trențos","trentosul":"trențos","trentuia":"trențui","trentuiai":"trențui","trentuiam":"trențui","trentuiati":"trențui","trentuiau":"trențui","trentuiesc":"trențui","trentuieste":"trențui","trentuiesti":"trențui","trentuii":"trențui","trentuim":"trențui","trentuind":"trențui","trentuira":"trențui","trentuiram":"trențui","trentuirati":"trențui","trentuise":"trențui","trentuisem":"trențui","trentuisera":"trențui","trentuiseram":"trențui","trentuiserati":"trențui","trentuisesi":"trențui","trentuisi":"trențui","trentuit":"trențui","trentuiti":"trențui","trenul":"tren","trenule":"tren","trenulete":"trenuleț","trenuletele":"trenuleț","trenuletelor":"trenuleț","trenuletul":"trenuleț","trenuletule":"trenuleț","trenuletului":"trenuleț","trenului":"tren","trenuri":"tren","trenuri blindate":"tren blindat","trenuri de aterizare":"tren de aterizare","trenuri de mare viteza":"tren de mare viteză","trenuri de marfa":"tren de marfă","trenuri expres":"tren expres","trenuri locale":"tren local","trenuri mixte":"tren mixt","trenuri personale":"tren personal","trenurile":"tren","trenurilor":"tren","trenusoare":"trenușor","trenusoarele":"trenușor","trenusoarelor":"trenușor","trenusorul":"trenușor","trenusorule":"trenușor","trenusorului":"trenușor","trenute":"trenuț","trenutele":"trenuț","trenutelor":"trenuț","trenutul":"trenuț","trenutule":"trenuț","trenutului":"trenuț","trenuturi":"trenuț","trepad":"trepăda","trepadai":"trepăda","trepadam":["trepădăm","trepăda","trepădam","trepăda"],"trepadand":"trepăda","trepadara":"trepăda","trepadaram":"trepăda","trepadarati":"trepăda","trepadarea":"trepădare","trepadari":"trepădare","trepadarii":"trepădare","trepadarile":"trepădare","trepadarilor":"trepădare","trepadase":"trepăda","trepadasem":"trepăda","trepadasera":"trepăda","trepadaseram":"trepăda","trepadaserati":"trepăda","trepadasesi":"trepăda","trepadasi":"trepăda","trepadat":"trepăda","trepadati":"trepăda","trepadatoarea":"trepădătoare","trepadatoarei":"trepădătoare","trepadatoarele":"trepădătoare","trepadatoarelor":"trepădătoare","trepadaturi":"trepădătură","trepadaturii":"trepădătură","trepadaturile":"trepădătură","trepadaturilor":"trepădătură","trepadau":"trepăda","trepadusi":"trepăduș","trepadusii":"trepăduș","trepadusilor":"trepăduș","trepadusul":"trepăduș","trepadusule":"trepăduș","trepadusului":"trepăduș","trepanai":"trepana","trepanam":["trepanăm","trepana","trepanam","trepana"],"trepanand":"trepana","trepanara":"trepana","trepanaram":"trepana","trepanarati":"trepana","trepanarea":"trepanare","trepanari":"trepanare","trepanarii":"trepanare","trepanarile":"trepanare","trepanarilor":"trepanare","trepanase":"trepana","trepanasem":"trepana","trepanasera":"trepana","trepanaseram":"trepana","trepanaserati":"trepana","trepanasesi":"trepana","trepanasi":"trepana","trepanat":"trepana","trepanati":"trepana","trepanatia":"trepanație","trepanatiei":"trepanație","trepanatii":"trepanație","trepanatiile":"trepanație","trepanatiilor":"trepanație","trepanatiunea":"trepanațiune","trepanatiuni":"trepanațiune","trepanatiunii":"trepanațiune","trepanatiunile":"trepanațiune","trepanatiunilor":"trepanațiune","trepanau":"trepana","trepane":"trepan","trepaneaza":"trepana","trepanele":"trepan","trepanelor":"trepan","trepanez":"trepana","trepanezi":"trepana","trepanul":"trepan","trepanule":"trepan","trepanului":"trepan","trepede":"trepăda","trepetnice":"trepetnic","trepetnicele":"trepetnic","trepetnicelor":"trepetnic","trepetnicul":"trepetnic","trepetnicule":"trepetnic","trepetnicului":"trepetnic","trepezi":"trepăda","trepiciul":"trepici","trepiciule":"trepici","trepiciului":"trepici","trepidai":"trepida","trepidam":["trepidăm","trepida","trepidam","trepida"],"trepidand":"trepida","trepidanta":["trepidantă","trepidant","trepidanta","trepidant"],"trepidante":"trepidant","trepidantele":"trepidant","trepidanti":"trepidant","trepidantii":"trepidant","trepidantul":"trepidant","trepidara":"trepida","trepidaram":"trepida","trepidarati":"trepida","trepidarea":"trepidare","trepidari":"trepidare","trepidarii":"trepidare","trepidarile":"trepidare","trepidarilor":"trepidare","trepidase":"trepida","trepidasem":"trepida","trepidasera":"trepida","trepidaseram":"trepida","trepidaserati":"trepida","trepidasesi":"trepida","trepidasi":"trepida","trepidat":"trepida","trepidati":"trepida","trepidatia":"trepidație","trepidatiei":"trepidație","trepidatii":"trepidație","trepidatiile":"trepidație","trepidatiilor":"trepidație","trepidatiunea":"trepidațiune","trepidatiuni":"trepidațiune","trepidatiunii":"trepidațiune","trepidatiunile":"trepidațiune","trepidatiunilor":"trepidațiune","trepidau":"trepida","trepideaza":"trepida","trepidez":"trepida","trepidezi":"trepida","trepiede":"trepied","trepiedele":"trepied","trepiedelor":"trepied","trepiedul":"trepied","trepiedule":"trepied","trepiedului":"trepied","treponematoze":"treponematoză","treponematozei":"treponematoză","treponematozele":"treponematoză","treponematozelor":"treponematoză","treponeme":"treponemă","treponemei":"treponemă","treponemele":"treponemă","treponemelor":"treponemă","treponemoze":"treponemoză","treponemozei":"treponemoză","treponemozele":"treponemoză","treponemozelor":"treponemoză","treptata":["treptată","treptat","treptata","treptat"],"treptate":"treptat","treptatele":"treptat","treptati":"treptat","treptatii":"treptat","treptatul":"treptat","trepte":"treaptă","treptei":"treaptă","treptele":"treaptă","treptelor":"treaptă","tresalt":"tresălta","tresaltai":"tresălta","tresaltam":["tresăltăm","tresălta","tresăltam","tresălta"],"tresaltand":"tresălta","tresaltara":"tresălta","tresaltaram":"tresălta","tresaltarati":"tresălta","tresaltarea":"tresăltare","tresaltari":"tresăltare","tresaltarii":"tresăltare","tresaltarile":"tresăltare","tresaltarilor":"tresăltare","tresaltase":"tresălta","tresaltasem":"tresălta","tresaltasera":"tresălta","tresaltaseram":"tresălta","tresaltaserati":"tresălta","tresaltasesi":"tresălta","tresaltasi":"tresălta","tresaltat":"tresălta","tresaltati":"tresălta","tresaltau":"tresălta","tresalti":"tresălta","tresar":"tresări","tresara":"tresări","tresare":"tresări","tresarea":"tresări","tresareai":"tresări","tresaream":"tresări","tresareati":"tresări","tresareau":"tresări","tresarii":"tresări","tresarim":"tresări","tresarind":"tresări","tresarira":"tresări","tresariram":"tresări","tresarirati":"tresări","tresarirea":"tresărire","tresariri":"tresărire","tresaririi":"tresărire","tresaririle":"tresărire","tresaririlor":"tresărire","tresarise":"tresări","tresarisem":"tresări","tresarisera":"tresări","tresariseram":"tresări","tresariserati":"tresări","tresarisesi":"tresări","tresarisi":"tresări","tresarit":"tresări","tresariti":"tresări","tresariture":"tresăritură","tresariturei":"tresăritură","tresariturele":"tresăritură","tresariturelor":"tresăritură","tresarituri":"tresăritură","trese":"tresă","tresei":"tresă","tresele":"tresă","treselor":"tresă","trestaria":"trestărie","trestariei":"trestărie","trestarii":"trestărie","trestariile":"trestărie","trestariilor":"trestărie","trestia":"trestie","trestichea":"trestiche","trestichi":"trestiche","trestichii":"trestiche","trestichile":"trestiche","trestichilor":"trestiche","trestici":"trestică","tresticii":"trestică","tresticile":"trestică","tresticilor":"trestică","trestiei":"trestie","trestietul":"trestiet","trestietule":"trestiet","trestietului":"trestiet","trestii":"trestie","trestiile":"trestie","trestiilor":"trestie","trestiisul":"trestiiș","trestiisule":"trestiiș","trestiisului":"trestiiș","trestiisuri":"trestiiș","trestiisurile":"trestiiș","trestiisurilor":"trestiiș","trestioare":"trestioară","trestioarei":"trestioară","trestioarele":"trestioară","trestioarelor":"trestioară","trestioasa":["trestioasă","trestios","trestioasa","trestios"],"trestioase":"trestios","trestioasele":"trestios","trestiosi":"trestios","trestiosii":"trestios","trestiosul":"trestios","trestiute":"trestiuță","trestiutei":"trestiuță","trestiutele":"trestiuță","trestiutelor":"trestiuță","tresuri":"tresură","tresurii":"tresură","tresurile":"tresură","tresurilor":"tresură","tretinasi":"tretinaș","tretinasii":"tretinaș","tretinasilor":"tretinaș","tretinasul":"tretinaș","tretinasule":"tretinaș","tretinasului":"tretinaș","tretiori":"tretior","tretiorii":"tretior","tretiorilor":"tretior","tretiorul":"tretior","tretiorule":"tretior","tretiorului":"tretior","treuci":"treucă","treucii":"treucă","treucile":"treucă","treucilor":"treucă","treze":"treaz","trezea":"trezi","trezeai":"trezi","trezeam":"trezi","trezeati":"trezi","trezeau":"trezi","trezele":["trezele","treaz","trezele","trezeală"],"trezelei":"trezeală","trezelele":"trezeală","trezelelor":"trezeală","trezeli":"trezeală","trezesc":"trezi","trezeste":"trezi","trezesti":"trezi","trezia":"trezie","treziei":"trezie","trezii":["trezii","trezi","trezii","trezie"],"treziile":"trezie","treziilor":"trezie","trezim":"trezi","trezind":"trezi","trezira":"trezi","treziram":"trezi","trezirati":"trezi","trezirea":"trezire","treziri":"trezire","trezirii":"trezire","trezirile":"trezire","trezirilor":"trezire","trezise":"trezi","trezisem":"trezi","trezisera":"trezi","treziseram":"trezi","treziserati":"trezi","trezisesi":"trezi","trezisi":"trezi","trezit":"trezi","trezita":["trezită","trezit","trezita","trezit"],"trezite":"trezit","trezitele":"trezit","treziti":["treziți","trezi","treziți","trezit"],"trezitii":"trezit","trezitul":"trezit","trezoreria":"trezorerie","trezoreriei":"trezorerie","trezorerii":"trezorerie","trezoreriile":"trezorerie","trezoreriilor":"trezorerie","trezorieri":"trezorier","trezorierii":"trezorier","trezorierilor":"trezorier","trezorierul":"trezorier","trezorierule":"trezorier","trezorierului":"trezorier","trezvia":"trezvie","trezviei":"trezvie","trezvii":"trezvie","trezviile":"trezvie","trezviilor":"trezvie","trezvita":["trezvită","trezvit","trezvita","trezvit"],"trezvite":"trezvit","trezvitele":"trezvit","trezviti":"trezvit","trezvitii":"trezvit","trezvitul":"trezvit","triace":"triac","triacele":"triac","triacelor":"triac","triacidul":"triacid","triacidule":"triacid","triacidului":"triacid","triacul":"triac","triacule":"triac","triacului":"triac","triai":"tria","triaje":"triaj","triajele":"triaj","triajelor":"triaj","triajul":"triaj","triajule":"triaj","triajului":"triaj","trialismul":"trialism","trialismule":"trialism","trialismului":"trialism","triam":"tria","trianglul":"trianglu","trianglule":"trianglu","trianglului":"trianglu","triangluri":"trianglu","trianglurile":"trianglu","trianglurilor":"trianglu","triangulai":"triangula","triangulam":["triangulăm","triangula","triangulam","triangula"],"trianguland":"triangula","triangulara":["triangulară","triangula","triangulară","triangular","triangulara","triangular"],"triangularam":"triangula","triangularati":"triangula","triangulare":"triangular","triangularea":"triangulare","triangularei":"triangulare","triangularele":"triangular","triangulari":"triangular","triangularii":"triangular","triangularul":"triangular","triangulase":"triangula","triangulasem":"triangula","triangulasera":"triangula","triangulaseram":"triangula","triangulaserati":"triangula","triangulasesi":"triangula","triangulasi":"triangula","triangulat":"triangula","triangulati":"triangula","triangulatia":"triangulație","triangulatiei":"triangulație","triangulatii":"triangulație","triangulatiile":"triangulație","triangulatiilor":"triangulație","triangulatiunea":"triangulațiune","triangulatiuni":"triangulațiune","triangulatiunii":"triangulațiune","triangulatiunile":"triangulațiune","triangulatiunilor":"triangulațiune","triangulau":"triangula","triangule":"triangul","trianguleaza":"triangula","triangulele":"triangul","triangulelor":"triangul","triangulez":"triangula","triangulezi":"triangula","triangulul":"triangul","triangulule":"triangul","triangulului":"triangul","triara":"tria","triaram":"tria","triarati":"tria","triase":"tria","triasem":"tria","triasera":"tria","triaseram":"tria","triaserati":"tria","triasesi":"tria","triasi":"tria","triasica":["triasică","triasic","triasica","triasic"],"triasice":"triasic","triasicele":"triasic","triasici":"triasic","triasicii":"triasic","triasicul":"triasic","triat":"tria","triati":"tria","triatloniste":"triatlonistă","triatlonistei":"triatlonistă","triatlonistele":"triatlonistă","triatlonistelor":"triatlonistă","triatlonisti":"triatlonist","triatlonistii":"triatlonist","triatlonistilor":"triatlonist","triatlonistul":"triatlonist","triatlonistule":"triatlonist","triatlonistului":"triatlonist","triatlonul":"triatlon","triatlonule":"triatlon","triatlonului":"triatlon","triatlonuri":"triatlon","triatlonurile":"triatlon","triatlonurilor":"triatlon","triatomica":["triatomică","triatomic","triatomica","triatomic"],"triatomice":"triatomic","triatomicele":"triatomic","triatomici":"triatomic","triatomicii":"triatomic","triatomicul":"triatomic","triau":"tria","triaza":"tria","tribadismul":"tribadism","tribadismule":"tribadism","tribadismului":"tribadism","tribala":["tribală","tribal","tribala","tribal"],"tribale":"tribal","tribalele":"tribal","tribali":"tribal","tribalii":"tribal","tribalismul":"tribalism","tribalismule":"tribalism","tribalismului":"tribalism","tribalul":"tribal","tribazica":["tribazică","tribazic","tribazica","tribazic"],"tribazice":"tribazic","tribazicele":"tribazic","tribazici":"tribazic","tribazicii":"tribazic","tribazicul":"tribazic","triboelectricitatea":"triboelectricitate","triboelectricitati":"triboelectricitate","triboelectricitatii":"triboelectricitate","triboelectricitatile":"triboelectricitate","triboelectricitatilor":"triboelectricitate","tribologia":"tribologie","tribologica":["tribologică","tribologic","tribologica","tribologic"],"tribologice":"tribologic","tribologicele":"tribologic","tribologici":"tribologic","tribologicii":"tribologic","tribologicul":"tribologic","tribologiei":"tribologie","tribologii":"tribologie","triboluminescenta":["triboluminescentă","triboluminescent","triboluminescenta","triboluminescent"],"triboluminescente":["triboluminescente","triboluminescent","triboluminescențe","triboluminescență"],"triboluminescentei":"triboluminescență","triboluminescentele":["triboluminescentele","triboluminescent","triboluminescențele","triboluminescență"],"triboluminescentelor":"triboluminescență","triboluminescenti":"triboluminescent","triboluminescentii":"triboluminescent","triboluminescentul":"triboluminescent","tribometre":"tribometru","tribometrele":"tribometru","tribometrelor":"tribometru","tribometria":"tribometrie","tribometriei":"tribometrie","tribometrii":"tribometrie","tribometriile":"tribometrie","tribometriilor":"tribometrie","tribometrul":"tribometru","tribometrule":"tribometru","tribometrului":"tribometru","tribordul":"tribord","tribordule":"tribord","tribordului":"tribord","triborduri":"tribord","tribordurile":"tribord","tribordurilor":"tribord","tribrahi":"tribrah","tribrahii":"tribrah","tribrahilor":"tribrah","tribrahul":"tribrah","tribrahule":"tribrah","tribrahului":"tribrah","tribromuri":"tribromură","tribromurii":"tribromură","tribromurile":"tribromură","tribromurilor":"tribromură","tribul":"trib","tribularea":"tribulare","tribulari":"tribulare","tribularii":"tribulare","tribularile":"tribulare","tribularilor":"tribulare","tribulatia":"tribulație","tribulatiei":"tribulație","tribulatii":"tribulație","tribulatiile":"tribulație","tribulatiilor":"tribulație","tribulatiunea":"tribulațiune","tribulatiuni":"tribulațiune","tribulatiunii":"tribulațiune","tribulatiunile":"tribulațiune","tribulatiunilor":"tribulațiune","tribule":"trib","tribului":"trib","tribunale":"tribunal","tribunalele":"tribunal","tribunalelor":"tribunal","tribunalul":"tribunal","tribunalule":"tribunal","tribunalului":"tribunal","tribunate":"tribunat","tribunatele":"tribunat","tribunatelor":"tribunat","tribunatul":"tribunat","tribunatule":"tribunat","tribunatului":"tribunat","tribune":"tribună","tribunei":"tribună","tribunele":"tribună","tribunelor":"tribună","tribuni":"tribun","tribunicia":"tribuniciu","tribuniciana":["tribuniciană","tribunician","tribuniciana","tribunician"],"tribunicianul":"tribunician","tribunicie":"tribuniciu","tribuniciene":"tribunician","tribunicienele":"tribunician","tribunicieni":"tribunician","tribunicienii":"tribunician","tribunicii":"tribuniciu","tribuniciii":"tribuniciu","tribuniciile":"tribuniciu","tribuniciul":"tribuniciu","tribunii":"tribun","tribunilor":"tribun","tribunul":"tribun","tribunule":"tribun","tribunului":"tribun","triburi":"trib","triburile":"trib","triburilor":"trib","tributara":["tributară","tributar","tributara","tributar"],"tributare":"tributar","tributarele":"tributar","tributari":"tributar","tributarii":"tributar","tributarul":"tributar","tributul":"tribut","tributule":"tribut","tributului":"tribut","tributuri":"tribut","tributurile":"tribut","tributurilor":"tribut","tricarpelara":["tricarpelară","tricarpelar","tricarpelara","tricarpelar"],"tricarpelare":"tricarpelar","tricarpelarele":"tricarpelar","tricarpelari":"tricarpelar","tricarpelarii":"tricarpelar","tricarpelarul":"tricarpelar","tricefala":["tricefală","tricefal","tricefala","tricefal"],"tricefale":"tricefal","tricefalele":"tricefal","tricefali":"tricefal","tricefalii":"tricefal","tricefalul":"tricefal","tricentenara":["tricentenară","tricentenar","tricentenara","tricentenar"],"tricentenare":"tricentenar","tricentenarele":"tricentenar","tricentenarelor":"tricentenar","tricentenari":"tricentenar","tricentenarii":"tricentenar","tricentenarul":"tricentenar","tricentenarule":"tricentenar","tricentenarului":"tricentenar","tricepsi":"triceps","tricepsii":"triceps","tricepsilor":"triceps","tricepsul":"triceps","tricepsule":"triceps","tricepsului":"triceps","triceratopsi":"triceratops","triceratopsii":"triceratops","triceratopsilor":"triceratops","triceratopsul":"triceratops","triceratopsule":"triceratops","triceratopsului":"triceratops","trichere":"tricher","tricherele":"tricher","tricherelor":"tricher","tricherul":"tricher","tricherule":"tricher","tricherului":"tricher","trichiaze":"trichiază","trichiazei":"trichiază","trichiazele":"trichiază","trichiazelor":"trichiază","trichine":"trichină","trichinei":"trichină","trichinele":"trichină","trichinelor":"trichină","trichinoze":"trichinoză","trichinozei":"trichinoză","trichinozele":"trichinoză","trichinozelor":"trichinoză","triciclete":"tricicletă","tricicletei":"tricicletă","tricicletele":"tricicletă","tricicletelor":"tricicletă","triciclul":"triciclu","triciclule":"triciclu","triciclului":"triciclu","tricicluri":"triciclu","triciclurile":"triciclu","triciclurilor":"triciclu","tricilindri":"tricilindru","tricilindrii":"tricilindru","tricilindrilor":"tricilindru","tricilindruul":"tricilindru","tricilindruule":"tricilindru","tricilindruului":"tricilindru","triclinica":["triclinică","triclinic","triclinica","triclinic"],"triclinice":"triclinic","triclinicele":"triclinic","triclinici":"triclinic","triclinicii":"triclinic","triclinicul":"triclinic","triclinii":"tricliniu","tricliniile":"tricliniu","tricliniilor":"tricliniu","tricliniul":"tricliniu","tricliniule":"tricliniu","tricliniului":"tricliniu","tricloretilene":"tricloretilenă","tricloretilenei":"tricloretilenă","tricloretilenele":"tricloretilenă","tricloretilenelor":"tricloretilenă","triclorurata":["triclorurată","triclorurat","triclorurata","triclorurat"],"triclorurate":"triclorurat","tricloruratele":"triclorurat","triclorurati":"triclorurat","tricloruratii":"triclorurat","tricloruratul":"triclorurat","tricloruri":"triclorură","triclorurii":"triclorură","triclorurile":"triclorură","triclorurilor":"triclorură","trico":"tricou","tricocefali":"tricocefal","tricocefalii":"tricocefal","tricocefalilor":"tricocefal","tricocefaloze":"tricocefaloză","tricocefalozei":"tricocefaloză","tricocefalozele":"tricocefaloză","tricocefalozelor":"tricocefaloză","tricocefalul":"tricocefal","tricocefalule":"tricocefal","tricocefalului":"tricocefal","tricoclazia":"tricoclazie","tricoclaziei":"tricoclazie","tricoclazii":"tricoclazie","tricoclaziile":"tricoclazie","tricoclaziilor":"tricoclazie","tricofitia":"tricofiție","tricofitica":["tricofitică","tricofitic","tricofitica","tricofitic"],"tricofitice":"tricofitic","tricofiticele":"tricofitic","tricofitici":"tricofitic","tricofiticii":"tricofitic","tricofiticul":"tricofitic","tricofitiei":"tricofiție","tricofitii":"tricofiție","tricofitonul":"tricofiton","tricofitonule":"tricofiton","tricofitonului":"tricofiton","tricofobia":"tricofobie","tricofobiei":"tricofobie","tricofobii":"tricofobie","tricofobiile":"tricofobie","tricofobiilor":"tricofobie","tricolicii":"tricolici","tricolicilor":"tricolici","tricoliciul":"tricolici","tricoliciule":"tricolici","tricoliciului":"tricolici","tricologia":"tricologie","tricologiei":"tricologie","tricologii":"tricologie","tricolora":["tricoloră","tricolor","tricolora","tricolor"],"tricolore":"tricolor","tricolorele":"tricolor","tricolori":"tricolor","tricolorii":"tricolor","tricolorul":"tricolor","tricomi":"tricom","tricomicoze":"tricomicoză","tricomicozei":"tricomicoză","tricomicozele":"tricomicoză","tricomicozelor":"tricomicoză","tricomii":"tricom","tricomilor":"tricom","tricomonasul":"tricomonas","tricomonasule":"tricomonas","tricomonasului":"tricomonas","tricomonaze":"tricomonază","tricomonazei":"tricomonază","tricomonazele":"tricomonază","tricomonazelor":"tricomonază","tricomonoze":"tricomonoză","tricomonozei":"tricomonoză","tricomonozele":"tricomonoză","tricomonozelor":"tricomonoză","tricomul":"tricom","tricomule":"tricom","tricomului":"tricom","tricoptere":"tricopter","tricopterele":"tricopter","tricopterelor":"tricopter","tricopterul":"tricopter","tricopterule":"tricopter","tricopterului":"tricopter","tricordul":"tricord","tricordule":"tricord","tricordului":"tricord","tricorduri":"tricord","tricordurile":"tricord","tricordurilor":"tricord","tricornul":"tricorn","tricornule":"tricorn","tricornului":"tricorn","tricornuri":"tricorn","tricornurile":"tricorn","tricornurilor":"tricorn","tricotai":"tricota","tricotaje":"tricotaj","tricotajele":"tricotaj","tricotajelor":"tricotaj","tricotajul":"tricotaj","tricotajule":"tricotaj","tricotajului":"tricotaj","tricotam":["tricotăm","tricota","tricotam","tricota"],"tricotand":"tricota","tricotara":"tricota","tricotaram":"tricota","tricotarati":"tricota","tricotarea":"tricotare","tricotari":"tricotare","tricotarii":"tricotare","tricotarile":"tricotare","tricotarilor":"tricotare","tricotase":"tricota","tricotasem":"tricota","tricotasera":"tricota","tricotaseram":"tricota","tricotaserati":"tricota","tricotasesi":"tricota","tricotasi":"tricota","tricotat":"tricota","tricotati":"tricota","tricotatul":"tricotat","tricotatule":"tricotat","tricotatului":"tricotat","tricotau":"tricota","tricoteaza":"tricota","tricotere":"tricoteră","tricoterei":"tricoteră","tricoterele":"tricoteră","tricoterelor":"tricoteră","tricoteri":"tricoter","tricoterii":"tricoter","tricoterilor":"tricoter","tricoterul":"tricoter","tricoterule":"tricoter","tricoterului":"tricoter","tricotez":"tricota","tricoteze":"tricoteză","tricotezei":"tricoteză","tricotezele":"tricoteză","tricotezelor":"tricoteză","tricotezi":"tricota","tricotine":"tricotină","tricotinei":"tricotină","tricotinele":"tricotină","tricotinelor":"tricotină","tricotinul":"tricotin","tricotinule":"tricotin","tricotinului":"tricotin","tricotomia":"tricotomie","tricotomica":["tricotomică","tricotomic","tricotomica","tricotomic"],"tricotomice":"tricotomic","tricotomicele":"tricotomic","tricotomici":"tricotomic","tricotomicii":"tricotomic","tricotomicul":"tricotomic","tricotomiei":"tricotomie","tricotomii":"tricotomie","tricotomiile":"tricotomie","tricotomiilor":"tricotomie","tricotul":"tricot","tricotule":"tricot","tricotului":"tricot","tricoturi":"tricot","tricoturile":"tricot","tricoturilor":"tricot","tricoul":["tricoul","trico","tricoul","tricou"],"tricoule":["tricoule","trico","tricoule","tricou"],"tricoului":["tricoului","trico","tricoului","tricou"],"tricouri":["tricouri","trico","tricouri","tricou"],"tricouri galbene":"tricou galben","tricourile":["tricourile","trico","tricourile","tricou"],"tricourilor":["tricourilor","trico","tricourilor","tricou"],"tricroismul":"tricroism","tricroismule":"tricroism","tricroismului":"tricroism","tricroma":["tricromă","tricrom","tricroma","tricrom"],"tricromatica":["tricromatică","tricromatic","tricromatica","tricromatic"],"tricromatice":"tricromatic","tricromaticele":"tricromatic","tricromatici":"tricromatic","tricromaticii":"tricromatic","tricromaticul":"tricromatic","tricrome":"tricrom","tricromele":"tricrom","tricromi":"tricrom","tricromia":"tricromie","tricromiei":"tricromie","tricromii":["tricromii","tricrom","tricromii","tricromie"],"tricromul":"tricrom","trictracul":"trictrac","trictracule":"trictrac","trictracului":"trictrac","trictracuri":"trictrac","trictracurile":"trictrac","trictracurilor":"trictrac","tricuspida":["tricuspidă","tricuspid","tricuspida","tricuspid"],"tricuspide":"tricuspid","tricuspidele":"tricuspid","tricuspidul":"tricuspid","tricuspizi":"tricuspid","tricuspizii":"tricuspid","tridactila":["tridactilă","tridactil","tridactila","tridactil"],"tridactile":"tridactil","tridactilele":"tridactil","tridactili":"tridactil","tridactilii":"tridactil","tridactilul":"tridactil","tridente":"trident","tridentele":"trident","tridentelor":"trident","tridentul":"trident","tridentule":"trident","tridentului":"trident","tridimensionala":["tridimensională","tridimensional","tridimensionala","tridimensional"],"tridimensionale":"tridimensional","tridimensionalele":"tridimensional","tridimensionali":"tridimensional","tridimensionalii":"tridimensional","tridimensionalitatea":"tridimensionalitate","tridimensionalitati":"tridimensionalitate","tridimensionalitatii":"tridimensionalitate","tridimensionalul":"tridimensional","tridimitul":"tridimit","tridimitule":"tridimit","tridimitului":"tridimit","trie":"tria","triedre":"triedru","triedrele":"triedru","triedrelor":"triedru","triedrul":"triedru","triedrule":"triedru","triedrului":"triedru","triem":"tria","trienala":["trienală","trienal","trienala","trienal"],"trienale":"trienal","trienalele":"trienal","trienali":"trienal","trienalii":"trienal","trienalul":"trienal","trienate":"trienat","trienatele":"trienat","trienatelor":"trienat","trienatul":"trienat","trienatule":"trienat","trienatului":"trienat","trienii":"trieniu","trieniile":"trieniu","trieniilor":"trieniu","trieniuul":"trieniu","trieniuule":"trieniu","trieniuului":"trieniu","trier":"triera","trierai":"triera","trieram":["trierăm","triera","trieram","triera"],"trierand":"triera","trierara":"triera","trieraram":"triera","trierarati":"triera","trierarhi":"trierarh","trierarhii":"trierarh","trierarhilor":"trierarh","trierarhul":"trierarh","trierarhule":"trierarh","trierarhului":"trierarh","trierase":"triera","trierasem":"triera","trierasera":"triera","trieraseram":"triera","trieraserati":"triera","trierasesi":"triera","trierasi":"triera","trierat":"triera","trierati":"triera","trierau":"triera","triere":["triere","triera","triere","trieră"],"trierea":"triere","trierei":"trieră","trierele":"trieră","trierelor":"trieră","trieri":["trieri","triera","trieri","triere"],"trierii":"triere","trierile":"triere","trierilor":"triere","trietajata":["trietajată","trietajat","trietajata","trietajat"],"trietajate":"trietajat","trietajatele":"trietajat","trietajati":"trietajat","trietajatii":"trietajat","trietajatul":"trietajat","triez":"tria","triezi":"tria","trifazata":["trifazată","trifazat","trifazata","trifazat"],"trifazate":"trifazat","trifazatele":"trifazat","trifazati":"trifazat","trifazatii":"trifazat","trifazatul":"trifazat","trifazica":["trifazică","trifazic","trifazica","trifazic"],"trifazice":"trifazic","trifazicele":"trifazic","trifazici":"trifazic","trifazicii":"trifazic","trifazicul":"trifazic","trifenilmetanul":"trifenilmetan","trifenilmetanule":"trifenilmetan","trifenilmetanului":"trifenilmetan","trifide":"trifidă","trifidele":"trifidă","trifoiasi":"trifoiaș","trifoiasii":"trifoiaș","trifoiasilor":"trifoiaș","trifoiasul":"trifoiaș","trifoiasule":"trifoiaș","trifoiasului":"trifoiaș","trifoistea":"trifoiște","trifoisti":"trifoiște","trifoistii":"trifoiște","trifoistile":"trifoiște","trifoistilor":"trifoiște","trifoite":"trifoiță","trifoitei":"trifoiță","trifoitele":"trifoiță","trifoitelor":"trifoiță","trifoiul":"trifoi","trifoiule":"trifoi","trifoiului":"trifoi","trifoiuri":"trifoi","trifoiurile":"trifoi","trifoiurilor":"trifoi","trifoliata":["trifoliată","trifoliat","trifoliata","trifoliat"],"trifoliate":"trifoliat","trifoliatele":"trifoliat","trifoliati":"trifoliat","trifoliatii":"trifoliat","trifoliatul":"trifoliat","trifolienea":"trifoliene","trifolieni":"trifoliene","trifolienii":"trifoliene","trifolioze":"trifolioză","trifoliozei":"trifolioză","trifoliozele":"trifolioză","trifoliozelor":"trifolioză","triforii":"triforiu","triforiile":"triforiu","triforiilor":"triforiu","triforiul":"triforiu","triforiule":"triforiu","triforiului":"triforiu","triftongi":"triftong","triftongii":"triftong","triftongilor":"triftong","triftongul":"triftong","triftongule":"triftong","triftongului":"triftong","trifurc":"trifurca","trifurcai":"trifurca","trifurcam":["trifurcăm","trifurca","trifurcam","trifurca"],"trifurcand":"trifurca","trifurcara":"trifurca","trifurcaram":"trifurca","trifurcarati":"trifurca","trifurcarea":"trifurcare","trifurcari":"trifurcare","trifurcarii":"trifurcare","trifurcarile":"trifurcare","trifurcarilor":"trifurcare","trifurcase":"trifurca","trifurcasem":"trifurca","trifurcasera":"trifurca","trifurcaseram":"trifurca","trifurcaserati":"trifurca","trifurcasesi":"trifurca","trifurcasi":"trifurca","trifurcat":"trifurca","trifurcata":["trifurcată","trifurcat","trifurcata","trifurcat"],"trifurcate":"trifurcat","trifurcatele":"trifurcat","trifurcati":["trifurcați","trifurca","trifurcați","trifurcat"],"trifurcatia":"trifurcație","trifurcatiei":"trifurcație","trifurcatii":["trifurcații","trifurcat","trifurcații","trifurcație"],"trifurcatiile":"trifurcație","trifurcatiilor":"trifurcație","trifurcatul":"trifurcat","trifurcau":"trifurca","trifurci":"trifurca","trigama":["trigamă","trigam","trigama","trigam"],"trigame":"trigam","trigamele":"trigam","trigami":"trigam","trigamia":"trigamie","trigamiei":"trigamie","trigamii":["trigamii","trigam","trigamii","trigamie"],"trigamul":"trigam","trigemelara":["trigemelară","trigemelar","trigemelara","trigemelar"],"trigemelare":"trigemelar","trigemelarele":"trigemelar","trigemelari":"trigemelar","trigemelarii":"trigemelar","trigemelarul":"trigemelar","triggere":"trigger","triggerele":"trigger","triggerelor":"trigger","triggerul":"trigger","triggerule":"trigger","triggerului":"trigger","triglife":["triglife","triglif","triglife","triglifă"],"triglifei":"triglifă","triglifele":["triglifele","triglif","triglifele","triglifă"],"triglifelor":["triglifelor","triglif","triglifelor","triglifă"],"trigliful":"triglif","triglifule":"triglif","triglifului":"triglif","trigoane":"trigon","trigoanele":"trigon","trigoanelor":"trigon","trigonala":["trigonală","trigonal","trigonala","trigonal"],"trigonale":"trigonal","trigonalele":"trigonal","trigonali":"trigonal","trigonalii":"trigonal","trigonalul":"trigonal","trigonocefali":"trigonocefal","trigonocefalia":"trigonocefalie","trigonocefaliei":"trigonocefalie","trigonocefalii":["trigonocefalii","trigonocefal","trigonocefalii","trigonocefalie"],"trigonocefaliile":"trigonocefalie","trigonocefaliilor":"trigonocefalie","trigonocefalilor":"trigonocefal","trigonocefalul":"trigonocefal","trigonocefalule":"trigonocefal","trigonocefalului":"trigonocefal","trigonometria":"trigonometrie","trigonometrica":["trigonometrică","trigonometric","trigonometrica","trigonometric"],"trigonometrice":"trigonometric","trigonometriceasca":["trigonometricească","trigonometricesc","trigonometriceasca","trigonometricesc"],"trigonometricele":"trigonometric","trigonometricescul":"trigonometricesc","trigonometricesti":"trigonometricesc","trigonometricestii":"trigonometricesc","trigonometricestile":"trigonometricesc","trigonometrici":"trigonometric","trigonometricii":"trigonometric","trigonometricul":"trigonometric","trigonometriei":"trigonometrie","trigonometrii":"trigonometrie","trigonul":"trigon","trigonule":"trigon","trigonului":"trigon","trihebdomadara":["trihebdomadară","trihebdomadar","trihebdomadara","trihebdomadar"],"trihebdomadare":"trihebdomadar","trihebdomadarele":"trihebdomadar","trihebdomadari":"trihebdomadar","trihebdomadarii":"trihebdomadar","trihebdomadarul":"trihebdomadar","trihotomia":"trihotomie","trihotomica":["trihotomică","trihotomic","trihotomica","trihotomic"],"trihotomice":"trihotomic","trihotomicele":"trihotomic","trihotomici":"trihotomic","trihotomicii":"trihotomic","trihotomicul":"trihotomic","trihotomiei":"trihotomie","trihotomii":"trihotomie","trihotomiile":"trihotomie","trihotomiilor":"trihotomie","trihtare":"trihtăr","trihtarele":"trihtăr","trihtarelor":"trihtăr","trihtarul":"trihtăr","trihtarule":"trihtăr","trihtarului":"trihtăr","triind":"tria","trilaterala":["trilaterală","trilateral","trilaterala","trilateral"],"trilaterale":["trilaterale","trilateral","trilaterale","trilaterală"],"trilateralei":"trilaterală","trilateralele":["trilateralele","trilateral","trilateralele","trilaterală"],"trilateralelor":"trilaterală","trilaterali":"trilateral","trilateralii":"trilateral","trilateralul":"trilateral","trilateratia":"trilaterație","trilateratiei":"trilaterație","trilateratii":"trilaterație","trilatere":"trilater","trilaterele":"trilater","trilaterelor":"trilater","trilaterul":"trilater","trilaterule":"trilater","trilaterului":"trilater","trileme":"trilemă","trilemei":"trilemă","trilemele":"trilemă","trilemelor":"trilemă","trilingva":["trilingvă","trilingv","trilingva","trilingv"],"trilingve":"trilingv","trilingvele":"trilingv","trilingvi":"trilingv","trilingvii":"trilingv","trilingvul":"trilingv","trilioane":"trilion","trilioanele":"trilion","trilioanelor":"trilion","trilionul":"trilion","trilionule":"trilion","trilionului":"trilion","trilite":"trilit","trilitele":"trilit","trilitelor":"trilit","trilitul":"trilit","trilitule":"trilit","trilitului":"trilit","trilobata":["trilobată","trilobat","trilobata","trilobat"],"trilobate":"trilobat","trilobatele":"trilobat","trilobati":"trilobat","trilobatii":"trilobat","trilobatul":"trilobat","trilobiti":"trilobit","trilobitii":"trilobit","trilobitilor":"trilobit","trilobitul":"trilobit","trilobitule":"trilobit","trilobitului":"trilobit","triloculara":["triloculară","trilocular","triloculara","trilocular"],"triloculare":"trilocular","trilocularele":"trilocular","triloculari":"trilocular","trilocularii":"trilocular","trilocularul":"trilocular","trilogia":"trilogie","trilogiei":"trilogie","trilogii":"trilogie","trilogiile":"trilogie","trilogiilor":"trilogie","triluia":"trilui","triluiai":"trilui","triluiam":"trilui","triluiati":"trilui","triluiau":"trilui","triluiesc":"trilui","triluieste":"trilui","triluiesti":"trilui","triluii":"trilui","triluim":"trilui","triluind":"trilui","triluira":"trilui","triluiram":"trilui","triluirati":"trilui","triluise":"trilui","triluisem":"trilui","triluisera":"trilui","triluiseram":"trilui","triluiserati":"trilui","triluisesi":"trilui","triluisi":"trilui","triluit":"trilui","triluiti":"trilui","trilul":"tril","trilule":"tril","trilului":"tril","triluri":"tril","trilurile":"tril","trilurilor":"tril","trimarane":"trimaran","trimaranele":"trimaran","trimaranelor":"trimaran","trimaranul":"trimaran","trimaranule":"trimaran","trimaranului":"trimaran","trimbitasi":"trimbițaș","trimbitasii":"trimbițaș","trimbitasilor":"trimbițaș","trimbitasul":"trimbițaș","trimbitasule":"trimbițaș","trimbitasului":"trimbițaș","trimeata":"trimete","trimes":"trimete","trimese":"trimete","trimesei":"trimete","trimesera":"trimete","trimeseram":"trimete","trimeserati":"trimete","trimesese":"trimete","trimesesem":"trimete","trimesesera":"trimete","trimeseseram":"trimete","trimeseserati":"trimete","trimesesesi":"trimete","trimesesi":"trimete","trimestre":"trimestru","trimestriala":["trimestrială","trimestrial","trimestriala","trimestrial"],"trimestriale":"trimestrial","trimestrialele":"trimestrial","trimestriali":"trimestrial","trimestrialii":"trimestrial","trimestrialul":"trimestrial","trimet":"trimete","trimetand":"trimete","trimete":"trimite","trimetea":"trimete","trimeteai":"trimete","trimeteam":"trimete","trimeteati":"trimete","trimeteau":"trimete","trimetem":"trimete","trimeterea":"trimetere","trimeteri":"trimetere","trimeterii":"trimetere","trimeterile":"trimetere","trimeterilor":"trimetere","trimeteti":"trimete","trimeti":"trimete","trimetre":"trimetru","trimetrele":"trimetru","trimetrelor":"trimetru","trimetrica":["trimetrică","trimetric","trimetrica","trimetric"],"trimetrice":"trimetric","trimetricele":"trimetric","trimetrici":"trimetric","trimetricii":"trimetric","trimetricul":"trimetric","trimetrul":"trimetru","trimetrule":"trimetru","trimetrului":"trimetru","trimis":"trimite","trimise":"trimite","trimisei":"trimite","trimisera":"trimite","trimiseram":"trimite","trimiserati":"trimite","trimisese":"trimite","trimisesem":"trimite","trimisesera":"trimite","trimiseseram":"trimite","trimiseserati":"trimite","trimisesesi":"trimite","trimisesi":"trimite","trimisul":"trimis","trimisule":"trimis","trimisului":"trimis","trimit":"trimite","trimita":"trimite","trimitand":"trimite","trimitatoare":"trimițător","trimitatoarea":"trimițător","trimitatoarele":"trimițător","trimitatori":"trimițător","trimitatorii":"trimițător","trimitatorul":"trimițător","trimitaturi":"trimițătură","trimitaturii":"trimițătură","trimitaturile":"trimițătură","trimitaturilor":"trimițătură","trimitea":"trimite","trimiteai":"trimite","trimiteam":"trimite","trimiteati":"trimite","trimiteau":"trimite","trimitem":"trimite","trimiterea":"trimitere","trimiteri":"trimitere","trimiterii":"trimitere","trimiterile":"trimitere","trimiterilor":"trimitere","trimiteti":"trimite","trimiti":"trimite","trimorfa":["trimorfă","trimorf","trimorfa","trimorf"],"trimorfe":"trimorf","trimorfele":"trimorf","trimorfi":"trimorf","trimorfii":"trimorf","trimorfisme":"trimorfism","trimorfismele":"trimorfism","trimorfismelor":"trimorfism","trimorfismul":"trimorfism","trimorfismule":"trimorfism","trimorfismului":"trimorfism","trimorful":"trimorf","trimotoare":"trimotor","trimotoarea":"trimotor","trimotoarele":"trimotor","trimotori":"trimotor","trimotorii":"trimotor","trimotorul":"trimotor","trincheti":"trinchet","trinchetii":"trinchet","trinchetilor":"trinchet","trinchetul":"trinchet","trinchetule":"trinchet","trinchetului":"trinchet","tringheltul":"tringhelt","tringheltule":"tringhelt","tringheltului":"tringhelt","trinidadiana":["trinidadiană","trinidadian","trinidadiana","trinidadian"],"trinidadiane":"trinidadiană","trinidadianul":"trinidadian","trinidadianule":"trinidadian","trinidadianului":"trinidadian","trinidadiene":["trinidadiene","trinidadian","trinidadiene","trinidadiană"],"trinidadienei":"trinidadiană","trinidadienele":["trinidadienele","trinidadian","trinidadienele","trinidadiană"],"trinidadienelor":"trinidadiană","trinidadieni":"trinidadian","trinidadienii":"trinidadian","trinidadienilor":"trinidadian","trinitara":["trinitară","trinitar","trinitara","trinitar"],"trinitare":"trinitar","trinitarele":"trinitar","trinitari":"trinitar","trinitariana":["trinitariană","trinitarian","trinitariana","trinitarian"],"trinitarianul":"trinitarian","trinitarianule":"trinitarian","trinitarianului":"trinitarian","trinitariene":["trinitariene","trinitarian","trinitariene","trinitariană"],"trinitarienei":"trinitariană","trinitarienele":["trinitarienele","trinitarian","trinitarienele","trinitariană"],"trinitarienelor":"trinitariană","trinitarieni":"trinitarian","trinitarienii":"trinitarian","trinitarienilor":"trinitarian","trinitarii":"trinitar","trinitarul":"trinitar","trinitatea":"trinitate","trinitati":"trinitate","trinitatii":"trinitate","trinitatile":"trinitate","trinitatilor":"trinitate","trinitratul":"trinitrat","trinitratule":"trinitrat","trinitratului":"trinitrat","trinitrine":"trinitrină","trinitrinei":"trinitrină","trinitrinele":"trinitrină","trinitrinelor":"trinitrină","trinitrobenzenul":"trinitrobenzen","trinitrobenzenule":"trinitrobenzen","trinitrobenzenului":"trinitrobenzen","trinitroceluloze":"trinitroceluloză","trinitrocelulozei":"trinitroceluloză","trinitrocelulozele":"trinitroceluloză","trinitrocelulozelor":"trinitroceluloză","trinitrofenolul":"trinitrofenol","trinitrofenolule":"trinitrofenol","trinitrofenolului":"trinitrofenol","trinitroglicerine":"trinitroglicerină","trinitroglicerinei":"trinitroglicerină","trinitroglicerinele":"trinitroglicerină","trinitroglicerinelor":"trinitroglicerină","trinitrotoluenul":"trinitrotoluen","trinitrotoluenule":"trinitrotoluen","trinitrotoluenului":"trinitrotoluen","trinoame":"trinom","trinoamele":"trinom","trinoamelor":"trinom","trinomul":"trinom","trinomule":"trinom","trinomului":"trinom","trinul":"trin","trinule":"trin","trinului":"trin","trinuri":"trin","trinurile":"trin","trinurilor":"trin","trioare":"trior","trioarele":"trior","trioarelor":"trior","triocaianici":"triocaianic","triocaianicii":"triocaianic","triocaianicilor":"triocaianic","triocaianicul":"triocaianic","triocaianicule":"triocaianic","triocaianicului":"triocaianic","triode":"triodă","triodei":"triodă","triodele":"triodă","triodelor":"triodă","triole":"triolă","triolei":"triolă","trioleine":"trioleină","trioleinei":"trioleină","trioleinele":"trioleină","trioleinelor":"trioleină","triolele":"triolă","triolelor":"triolă","triolete":"triolet","trioletele":"triolet","trioletelor":"triolet","trioletul":"triolet","trioletule":"triolet","trioletului":"triolet","triorhidia":"triorhidie","triorhidiei":"triorhidie","triorhidii":"triorhidie","triorhidiile":"triorhidie","triorhidiilor":"triorhidie","triorhidul":"triorhid","triorhidule":"triorhid","triorhidului":"triorhid","triorhizi":"triorhid","triorhizii":"triorhid","triorhizilor":"triorhid","triorul":"trior","triorule":"trior","triorului":"trior","trioul":"trio","trioule":"trio","trioului":"trio","triouri":"trio","triourile":"trio","triourilor":"trio","triovul":"triov","triovule":"triov","triovului":"triov","trioxidul":"trioxid","trioxidule":"trioxid","trioxidului":"trioxid","trioxizi":"trioxid","trioxizii":"trioxid","trioxizilor":"trioxid","trioze":"trioză","triozei":"trioză","tripaflavine":"tripaflavină","tripaflavinei":"tripaflavină","tripaflavinele":"tripaflavină","tripaflavinelor":"tripaflavină","tripalmitine":"tripalmitină","tripalmitinei":"tripalmitină","tripanozome":"tripanozomă","tripanozomei":"tripanozomă","tripanozomele":"tripanozomă","tripanozomelor":"tripanozomă","tripanozomiaze":"tripanozomiază","tripanozomiazei":"tripanozomiază","tripanozomiazele":"tripanozomiază","tripanozomiazelor":"tripanozomiază","tripartisme":"tripartism","tripartismele":"tripartism","tripartismelor":"tripartism","tripartismul":"tripartism","tripartismule":"tripartism","tripartismului":"tripartism","tripartita":["tripartită","tripartit","tripartita","tripartit"],"tripartite":"tripartit","tripartitele":"tripartit","tripartiti":"tripartit","tripartitia":"tripartiție","tripartitiei":"tripartiție","tripartitii":["tripartiții","tripartit","tripartiții","tripartiție"],"tripartitiile":"tripartiție","tripartitiilor":"tripartiție","tripartitul":"tripartit","triperia":"triperie","triperiei":"triperie","triperii":"triperie","triperiile":"triperie","triperiilor":"triperie","triperul":"triper","triperule":"triper","triperului":"triper","tripetala":["tripetală","tripetal","tripetala","tripetal"],"tripetale":"tripetal","tripetalele":"tripetal","tripetali":"tripetal","tripetalii":"tripetal","tripetalul":"tripetal","tripla":["triplă","triplu","tripla","triplu"],"triplai":"tripla","triplam":["triplăm","tripla","triplam","tripla"],"tripland":"tripla","triplane":"triplan","triplanele":"triplan","triplanelor":"triplan","triplanul":"triplan","triplanule":"triplan","triplanului":"triplan","triplara":"tripla","triplaram":"tripla","triplarati":"tripla","triplarea":"triplare","triplari":"triplare","triplarii":"triplare","triplarile":"triplare","triplarilor":"triplare","triplase":"tripla","triplasem":"tripla","triplasera":"tripla","triplaseram":"tripla","triplaserati":"tripla","triplasesi":"tripla","triplasi":"tripla","triplat":"tripla","triplati":"tripla","triplau":"tripla","triple":"triplu","tripleaza":"tripla","triplegia":"triplegie","triplegiei":"triplegie","triplegii":"triplegie","triplegiile":"triplegie","triplegiilor":"triplegie","triplele":"triplu","triplete":["triplete","triplet","triplete","tripletă"],"tripletei":"tripletă","tripletele":["tripletele","triplet","tripletele","tripletă"],"tripletelor":["tripletelor","triplet","tripletelor","tripletă"],"tripleti":"triplet","tripletii":"triplet","tripletilor":"triplet","tripletul":"triplet","tripletule":"triplet","tripletului":"triplet","tripleturi":"triplet","tripleturile":"triplet","tripleturilor":"triplet","triplexul":"triplex","triplexule":"triplex","triplexului":"triplex","triplez":"tripla","triplezi":"tripla","tripli":"triplu","triplicarea":"triplicare","triplicari":"triplicare","triplicarii":"triplicare","triplicarile":"triplicare","triplicarilor":"triplicare","triplicate":"triplicat","triplicatele":"triplicat","triplicatelor":"triplicat","triplicatul":"triplicat","triplicatule":"triplicat","triplicatului":"triplicat","triplicitatea":"triplicitate","triplicitati":"triplicitate","triplicitatii":"triplicitate","triplicitatile":"triplicitate","triplicitatilor":"triplicitate","triplii":"triplu","triploida":["triploidă","triploid","triploida","triploid"],"triploide":"triploid","triploidele":"triploid","triploidul":"triploid","triploizi":"triploid","triploizii":"triploid","triplopia":"triplopie","triplopiei":"triplopie","triplopii":"triplopie","triplopiile":"triplopie","triplopiilor":"triplopie","triplul":"triplu","triplusaltiste":"triplusaltistă","triplusaltistei":"triplusaltistă","triplusaltistele":"triplusaltistă","triplusaltistelor":"triplusaltistă","triplusaltul":"triplusalt","triplusaltule":"triplusalt","triplusaltului":"triplusalt","triplusalturi":"triplusalt","triplusalturile":"triplusalt","triplusalturilor":"triplusalt","tripodia":"tripodie","tripodiei":"tripodie","tripodii":"tripodie","tripodiile":"tripodie","tripodiilor":"tripodie","tripodul":"tripod","tripodule":"tripod","tripodului":"tripod","tripoduri":"tripod","tripodurile":"tripod","tripodurilor":"tripod","tripolara":["tripolară","tripolar","tripolara","tripolar"],"tripolare":"tripolar","tripolarele":"tripolar","tripolari":"tripolar","tripolarii":"tripolar","tripolarul":"tripolar","tripoli":"tripol","tripolii":"tripol","tripolilor":"tripol","tripoliul":"tripoli","tripoliule":"tripoli","tripoliului":"tripoli","tripolul":"tripol","tripolule":"tripol","tripolului":"tripol","triposul":"tripos","triposule":"tripos","triposului":"tripos","triposuri":"tripos","triposurile":"tripos","triposurilor":"tripos","tripotai":"tripota","tripotaje":"tripotaj","tripotajele":"tripotaj","tripotajelor":"tripotaj","tripotajul":"tripotaj","tripotajule":"tripotaj","tripotajului":"tripotaj","tripotam":["tripotăm","tripota","tripotam","tripota"],"tripotand":"tripota","tripotara":"tripota","tripotaram":"tripota","tripotarati":"tripota","tripotase":"tripota","tripotasem":"tripota","tripotasera":"tripota","tripotaseram":"tripota","tripotaserati":"tripota","tripotasesi":"tripota","tripotasi":"tripota","tripotat":"tripota","tripotati":"tripota","tripotau":"tripota","tripoteaza":"tripota","tripotez":"tripota","tripotezi":"tripota","tripoul":"tripou","tripoule":"tripou","tripoului":"tripou","tripouri":"tripou","tripourile":"tripou","tripourilor":"tripou","tripsine":"tripsină","tripsinei":"tripsină","tripsinele":"tripsină","tripsinelor":"tripsină","tripsinogenul":"tripsinogen","tripsinogenule":"tripsinogen","tripsinogenului":"tripsinogen","triptice":"triptic","tripticele":"triptic","tripticelor":"triptic","tripticul":"triptic","tripticule":"triptic","tripticului":"triptic","triptofanul":"triptofan","triptofanule":"triptofan","triptofanului":"triptofan","tripul":"trip","tripule":"trip","tripului":"trip","tripuri":"trip","tripurile":"trip","tripurilor":"trip","trireactoare":"trireactor","trireactoarele":"trireactor","trireactoarelor":"trireactor","trireactorul":"trireactor","trireactorule":"trireactor","trireactorului":"trireactor","triregnul":"triregn","triregnule":"triregn","triregnului":"triregn","triregnuri":"triregn","triregnurile":"triregn","triregnurilor":"triregn","trireme":"triremă","triremei":"triremă","triremele":"triremă","triremelor":"triremă","trisai":"trișa","trisaje":"trișaj","trisajele":"trișaj","trisajelor":"trișaj","trisajul":"trișaj","trisajule":"trișaj","trisajului":"trișaj","trisam":["trișăm","trișa","trișam","trișa"],"trisand":"trișa","trisara":"trișa","trisaram":"trișa","trisarati":"trișa","trisarea":"trișare","trisari":"trișare","trisarii":"trișare","trisarile":"trișare","trisarilor":"trișare","trisase":"trișa","trisasem":"trișa","trisasera":"trișa","trisaseram":"trișa","trisaserati":"trișa","trisasesi":"trișa","trisasi":"trișa","trisat":"trișa","trisati":"trișa","trisau":"trișa","triscari":"trișcar","triscarii":"trișcar","triscarilor":"trișcar","triscarite":"trișcăriță","triscaritei":"trișcăriță","triscaritele":"trișcăriță","triscaritelor":"trișcăriță","triscarul":"trișcar","triscarule":"trișcar","triscarului":"trișcar","trisculite":"trișculiță","trisculitei":"trișculiță","trisculitele":"trișculiță","trisculitelor":"trișculiță","triscusoare":"trișcușoară","triscusoarei":"trișcușoară","triscusoarele":"trișcușoară","triscusoarelor":"trișcușoară","triscute":"trișcuță","triscutei":"trișcuță","triscutele":"trișcuță","triscutelor":"trișcuță","triseaza":"trișa","trisectii":"trisecție","trisectiunea":"trisecțiune","trisectiuni":"trisecțiune","trisectiunii":"trisecțiune","trisectiunile":"trisecțiune","trisectiunilor":"trisecțiune","trisepala":["trisepală","trisepal","trisepala","trisepal"],"trisepale":"trisepal","trisepalele":"trisepal","trisepali":"trisepal","trisepalii":"trisepal","trisepalul":"trisepal","triseria":"trișerie","triseriei":"trișerie","triserii":"trișerie","triseriile":"trișerie","triseriilor":"trișerie","trisez":"trișa","trisezi":"trișa","trisfetitele":["trisfetitele","Trisfetite","trisfetitele","trisfetite"],"trisfetitelor":["trisfetitelor","Trisfetite","trisfetitelor","trisfetite"],"trisilabe":"trisilab","trisilabele":"trisilab","trisilabelor":"trisilab","trisilabica":["trisilabică","trisilabic","trisilabica","trisilabic"],"trisilabice":"trisilabic","trisilabicele":"trisilabic","trisilabici":"trisilabic","trisilabicii":"trisilabic","trisilabicul":"trisilabic","trisilabul":"trisilab","trisilabule":"trisilab","trisilabului":"trisilab","trismusul":"trismus","trismusule":"trismus","trismusului":"trismus","trismusuri":"trismus","trismusurile":"trismus","trismusurilor":"trismus","trisomia":"trisomie","trisomiei":"trisomie","trisomii":"trisomie","trisomiile":"trisomie","trisomiilor":"trisomie","trisori":"trișor","trisorii":"trișor","trisorilor":"trișor","trisorul":"trișor","trisorule":"trișor","trisorului":"trișor","trista":["tristă","trist","trista","trist"],"tristata":["tristată","tristat","tristata","tristat"],"tristate":"tristat","tristatele":"tristat","tristati":"tristat","tristatii":"tristat","tristatul":"tristat","triste":["triște","trișcă","triste","trist","triste","tristă"],"tristea":"triște","tristearine":"tristearină","tristearinei":"tristearină","tristearinele":"tristearină","tristearinelor":"tristearină","tristei":["triștei","trișcă","tristei","tristă"],"tristele":["triștele","trișcă","tristele","trist","tristele","tristă","tristele","tristeală"],"tristelei":"tristeală","tristelele":"tristeală","tristelelor":"tristeală","tristeli":"tristeală","tristelor":["triștelor","trișcă","tristelor","tristă"],"tristeta":"tristețe","tristetea":"tristețe","tristeti":"tristețe","tristetii":"tristețe","tristetile":"tristețe","tristetilor":"tristețe","tristi":["triști","trist","triști","triște"],"tristihul":"tristih","tristihule":"tristih","tristihului":"tristih","tristihuri":"tristih","tristihurile":"tristih","tristihurilor":"tristih","tristii":["triștii","trist","triștii","triște"],"tristile":"triște","tristilor":"triște","tristisora":["tristișoră","tristișor","tristișora","tristișor"],"tristisore":"tristișor","tristisorele":"tristișor","tristisori":"tristișor","tristisorii":"tristișor","tristisorul":"tristișor","tristul":"trist","tristuta":["tristuță","tristuț","tristuța","tristuț"],"tristute":"tristuț","tristutele":"tristuț","tristuti":"tristuț","tristutii":"tristuț","tristutul":"tristuț","trisulfure":"trisulfură","trisulfurei":"trisulfură","tritanopa":["tritanopă","tritanop","tritanopa","tritanop"],"tritanope":"tritanop","tritanopele":"tritanop","tritanopi":"tritanop","tritanopia":"tritanopie","tritanopiei":"tritanopie","tritanopii":["tritanopii","tritanop","tritanopii","tritanopie"],"tritanopiile":"tritanopie","tritanopiilor":"tritanopie","tritanopul":"tritanop","triteismul":"triteism","triteismule":"triteism","triteismului":"triteism","tritiul":"tritiu","tritiule":"tritiu","tritiului":"tritiu","tritoni":"triton","tritonica":["tritonică","tritonic","tritonica","tritonic"],"tritonice":"tritonic","tritonicele":"tritonic","tritonici":"tritonic","tritonicii":"tritonic","tritonicul":"tritonic","tritonii":"triton","tritonilor":"triton","tritonul":"triton","tritonule":"triton","tritonului":"triton"};
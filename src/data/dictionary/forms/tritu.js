@@ -0,0 +1 @@
+export default {"triturai":"tritura","trituram":["triturăm","tritura","trituram","tritura"],"triturand":"tritura","triturara":"tritura","trituraram":"tritura","triturarati":"tritura","triturarea":"triturare","triturari":"triturare","triturarii":"triturare","triturarile":"triturare","triturarilor":"triturare","triturase":"tritura","triturasem":"tritura","triturasera":"tritura","trituraseram":"tritura","trituraserati":"tritura","triturasesi":"tritura","triturasi":"tritura","triturat":"tritura","triturati":"tritura","triturau":"tritura","tritureaza":"tritura","triturez":"tritura","triturezi":"tritura","triumfai":"triumfa","triumfala":["triumfală","triumfal","triumfala","triumfal"],"triumfale":"triumfal","triumfalele":"triumfal","triumfali":"triumfal","triumfalii":"triumfal","triumfalul":"triumfal","triumfam":["triumfăm","triumfa","triumfam","triumfa"],"triumfand":"triumfa","triumfara":"triumfa","triumfaram":"triumfa","triumfarati":"triumfa","triumfarea":"triumfare","triumfari":"triumfare","triumfarii":"triumfare","triumfase":"triumfa","triumfasem":"triumfa","triumfasera":"triumfa","triumfaseram":"triumfa","triumfaserati":"triumfa","triumfasesi":"triumfa","triumfasi":"triumfa","triumfat":"triumfa","triumfati":"triumfa","triumfatoare":"triumfător","triumfatoarea":"triumfător","triumfatoarele":"triumfător","triumfatori":["triumfatori","triumfator","triumfători","triumfător"],"triumfatorii":["triumfatorii","triumfator","triumfătorii","triumfător"],"triumfatorilor":"triumfator","triumfatorul":["triumfatorul","triumfator","triumfătorul","triumfător"],"triumfatorule":"triumfator","triumfatorului":"triumfator","triumfau":"triumfa","triumfeaza":"triumfa","triumfez":"triumfa","triumfezi":"triumfa","triumful":"triumf","triumfule":"triumf","triumfului":"triumf","triumfuri":"triumf","triumfurile":"triumf","triumfurilor":"triumf","triumvirate":"triumvirat","triumviratele":"triumvirat","triumviratelor":"triumvirat","triumviratul":"triumvirat","triumviratule":"triumvirat","triumviratului":"triumvirat","triumviri":"triumvir","triumvirii":"triumvir","triumvirilor":"triumvir","triumvirul":"triumvir","triumvirule":"triumvir","triumvirului":"triumvir","triunghica":["triunghică","triunghic","triunghica","triunghic"],"triunghice":"triunghic","triunghiceasca":["triunghicească","triunghicesc","triunghiceasca","triunghicesc"],"triunghicele":"triunghic","triunghicescul":"triunghicesc","triunghicesti":"triunghicesc","triunghicestii":"triunghicesc","triunghicestile":"triunghicesc","triunghici":"triunghic","triunghicii":"triunghic","triunghicul":"triunghic","triunghiul":"triunghi","triunghiulara":["triunghiulară","triunghiular","triunghiulara","triunghiular"],"triunghiulare":"triunghiular","triunghiularele":"triunghiular","triunghiulari":"triunghiular","triunghiularii":"triunghiular","triunghiularul":"triunghiular","triunghiule":"triunghi","triunghiului":"triunghi","triunghiuri":"triunghi","triunghiuri dreptunghice":"triunghi dreptunghic","triunghiuri obtuze":"triunghi obtuz","triunghiuri scalene":"triunghi scalen","triunghiurile":"triunghi","triunghiurilor":"triunghi","trivalenta":["trivalentă","trivalent","trivalenta","trivalent"],"trivalente":["trivalente","trivalent","trivalențe","trivalență"],"trivalentei":"trivalență","trivalentele":["trivalentele","trivalent","trivalențele","trivalență"],"trivalentelor":"trivalență","trivalenti":"trivalent","trivalentii":"trivalent","trivalentul":"trivalent","trivalva":["trivalvă","trivalv","trivalva","trivalv"],"trivalve":"trivalv","trivalvele":"trivalv","trivalvi":"trivalv","trivalvii":"trivalv","trivalvul":"trivalv","triviala":["trivială","trivial","triviala","trivial"],"triviale":"trivial","trivialele":"trivial","triviali":"trivial","trivialii":"trivial","trivialitatea":"trivialitate","trivialitati":"trivialitate","trivialitatii":"trivialitate","trivialitatile":"trivialitate","trivialitatilor":"trivialitate","trivializai":"trivializa","trivializam":["trivializăm","trivializa","trivializam","trivializa"],"trivializand":"trivializa","trivializara":"trivializa","trivializaram":"trivializa","trivializarati":"trivializa","trivializarea":"trivializare","trivializari":"trivializare","trivializarii":"trivializare","trivializarile":"trivializare","trivializarilor":"trivializare","trivializase":"trivializa","trivializasem":"trivializa","trivializasera":"trivializa","trivializaseram":"trivializa","trivializaserati":"trivializa","trivializasesi":"trivializa","trivializasi":"trivializa","trivializat":"trivializa","trivializata":["trivializată","trivializat","trivializata","trivializat"],"trivializate":"trivializat","trivializatele":"trivializat","trivializati":["trivializați","trivializa","trivializați","trivializat"],"trivializatii":"trivializat","trivializatul":"trivializat","trivializau":"trivializa","trivializeaza":"trivializa","trivializez":"trivializa","trivializezi":"trivializa","trivialul":"trivial","triviumul":"trivium","triviumule":"trivium","triviumului":"trivium","trivogi":"trivogă","trivogii":"trivogă","trivogile":"trivogă","trivogilor":"trivogă","trizaharide":"trizaharidă","trizaharidei":"trizaharidă","trizaharidele":"trizaharidă","trizaharidelor":"trizaharidă","troace":"troacă","troacei":"troacă","troacele":"troacă","troacelor":"troacă","troahne":"troahnă","troahnei":"troahnă","troahnele":"troahnă","troahnelor":"troahnă","troc":"troacă","trocarasi":"trocăraș","trocarasii":"trocăraș","trocarasilor":"trocăraș","trocarasul":"trocăraș","trocarasule":"trocăraș","trocarasului":"trocăraș","trocare":"trocar","trocarele":"trocar","trocarelor":"trocar","trocarul":"trocar","trocarule":"trocar","trocarului":"trocar","trocatele":"trocățică","trocatelei":"trocățică","trocatelele":"trocățică","trocatelelor":"trocățică","trochitaul":"trochiță","trochitaule":"trochiță","trochitaului":"trochiță","trochite":"trochiță","trochitele":"trochiță","trochitelor":"trochiță","troci":"troacă","trocofore":"trocoforă","trocoforei":"trocoforă","trocoforele":"trocoforă","trocoforelor":"trocoforă","trocul":"troc","trocule":"troc","troculetul":"troculeț","troculetule":"troculeț","troculetului":"troculeț","trocului":"troc","trocuri":"troc","trocurile":"troc","trocurilor":"troc","trocusoare":"trocușor","trocusoarele":"trocușor","trocusoarelor":"trocușor","trocusorul":"trocușor","trocusorule":"trocușor","trocusorului":"trocușor","trocute":"trocuță","trocutei":"trocuță","trocutele":"trocuță","trocutelor":"trocuță","trofee":"trofeu","trofeele":"trofeu","trofeelor":"trofeu","trofeul":"trofeu","trofeule":"trofeu","trofeului":"trofeu","trofia":"trofie","trofica":["trofică","trofic","trofica","trofic"],"trofice":"trofic","troficele":"trofic","trofici":"trofic","troficii":"trofic","troficitatea":"troficitate","troficitati":"troficitate","troficitatii":"troficitate","troficitatile":"troficitate","troficitatilor":"troficitate","troficul":"trofic","trofiei":"trofie","trofii":"trofie","trofiile":"trofie","trofiilor":"trofie","trofisme":"trofism","trofismele":"trofism","trofismelor":"trofism","trofismul":"trofism","trofismule":"trofism","trofismului":"trofism","trofonevroze":"trofonevroză","trofonevrozei":"trofonevroză","trofonevrozele":"trofonevroză","trofonevrozelor":"trofonevroză","trofotropismul":"trofotropism","trofotropismule":"trofotropism","trofotropismului":"trofotropism","troglodite":"troglodită","trogloditei":"troglodită","trogloditele":"troglodită","trogloditelor":"troglodită","trogloditi":"troglodit","trogloditica":["trogloditică","trogloditic","trogloditica","trogloditic"],"trogloditice":"trogloditic","trogloditiceasca":["trogloditicească","trogloditicesc","trogloditiceasca","trogloditicesc"],"trogloditicele":"trogloditic","trogloditicescul":"trogloditicesc","trogloditicesti":"trogloditicesc","trogloditicestii":"trogloditicesc","trogloditicestile":"trogloditicesc","trogloditici":"trogloditic","trogloditicii":"trogloditic","trogloditicul":"trogloditic","trogloditii":"troglodit","trogloditilor":"troglodit","trogloditul":"troglodit","trogloditule":"troglodit","trogloditului":"troglodit","trohaica":["trohaică","trohaic","trohaica","trohaic"],"trohaice":"trohaic","trohaicele":"trohaic","trohaici":"trohaic","trohaicii":"trohaic","trohaicul":"trohaic","trohantere":"trohanter","trohanterele":"trohanter","trohanterelor":"trohanter","trohanterul":"trohanter","trohanterule":"trohanter","trohanterului":"trohanter","trohei":"troheu","troheii":"troheu","troheilor":"troheu","troheuul":"troheu","troheuule":"troheu","troheuului":"troheu","trohnele":"trohneală","trohnelei":"trohneală","trohnelele":"trohneală","trohnelelor":"trohneală","trohneli":"trohneală","trohoide":"trohoidă","trohoidei":"trohoidă","trohoidele":"trohoidă","trohoidelor":"trohoidă","troiana":"troian","troiane":"troiană","troianul":"troian","troianule":"troian","troianului":"troian","troici":"troică","troicii":"troică","troicile":"troică","troicilor":"troică","troiene":["troiene","troian","troiene","troiană"],"troienea":"troieni","troieneai":"troieni","troieneam":"troieni","troieneati":"troieni","troieneau":"troieni","troienei":"troiană","troienele":["troienele","troian","troienele","troiană"],"troienelor":["troienelor","troian","troienelor","troiană"],"troienesc":"troieni","troieneste":"troieni","troienesti":"troieni","troieni":"troian","troienii":["troienii","troian","troienii","troieni"],"troienilor":"troian","troienim":"troieni","troienind":"troieni","troienira":"troieni","troieniram":"troieni","troienirati":"troieni","troienise":"troieni","troienisem":"troieni","troienisera":"troieni","troieniseram":"troieni","troieniserati":"troieni","troienisesi":"troieni","troienisi":"troieni","troienit":"troieni","troienita":["troienită","troienit","troienita","troienit"],"troienite":"troienit","troienitele":"troienit","troieniti":["troieniți","troieni","troieniți","troienit"],"troienitii":"troienit","troienitul":"troienit","troite":"troiță","trolee":"troleu","troleele":"troleu","troleelor":"troleu","troleibuze":"troleibuz","troleibuzele":"troleibuz","troleibuzelor":"troleibuz","troleibuzul":"troleibuz","troleibuzule":"troleibuz","troleibuzului":"troleibuz","troleul":"troleu","troleule":"troleu","troleului":"troleu","troli":"trol","trolii":"trol","trolilor":"trol","trolul":"trol","trolule":"trol","trolului":"trol","trombangeite":"trombangeită","trombangeitei":"trombangeită","trombangeitele":"trombangeită","trombangeitelor":"trombangeită","trombe":"trombă","trombectomia":"trombectomie","trombectomiei":"trombectomie","trombectomii":"trombectomie","trombectomiile":"trombectomie","trombectomiilor":"trombectomie","trombei":"trombă","trombele":"trombă","trombelor":"trombă","trombine":"trombină","trombinei":"trombină","trombinele":"trombină","trombinelor":"trombină","trombloane":"tromblon","trombloanele":"tromblon","trombloanelor":"tromblon","tromblonul":"tromblon","tromblonule":"tromblon","tromblonului":"tromblon","tromboane":"trombon","tromboanele":"trombon","tromboanelor":"trombon","trombochinaze":"trombochinază","trombochinazei":"trombochinază","trombochinazele":"trombochinază","trombochinazelor":"trombochinază","trombocite":["trombocite","trombocit","trombocite","trombocită"],"trombocitei":"trombocită","trombocitele":["trombocitele","trombocit","trombocitele","trombocită"],"trombocitelor":["trombocitelor","trombocit","trombocitelor","trombocită"],"trombocitemia":"trombocitemie","trombocitemiei":"trombocitemie","trombocitemii":"trombocitemie","trombocitemiile":"trombocitemie","trombocitemiilor":"trombocitemie","trombocitopenia":"trombocitopenie","trombocitopeniei":"trombocitopenie","trombocitopenii":"trombocitopenie","trombocitoze":"trombocitoză","trombocitozei":"trombocitoză","trombocitozele":"trombocitoză","trombocitozelor":"trombocitoză","trombocitul":"trombocit","trombocitule":"trombocit","trombocitului":"trombocit","tromboflebite":"tromboflebită","tromboflebitei":"tromboflebită","tromboflebitele":"tromboflebită","tromboflebitelor":"tromboflebită","trombogena":["trombogenă","trombogen","trombogena","trombogen"],"trombogene":"trombogen","trombogenele":"trombogen","trombogeneze":"trombogeneză","trombogenezei":"trombogeneză","trombogenezele":"trombogeneză","trombogenezelor":"trombogeneză","trombogeni":"trombogen","trombogenii":"trombogen","trombogenul":"trombogen","trombolize":"tromboliză","trombolizei":"tromboliză","trombolizele":"tromboliză","trombolizelor":"tromboliză","trombonea":"tromboni","tromboneai":"tromboni","tromboneam":"tromboni","tromboneati":"tromboni","tromboneau":"tromboni","trombonesc":"tromboni","tromboneste":"tromboni","trombonesti":"tromboni","trombonii":"tromboni","trombonim":"tromboni","trombonind":"tromboni","trombonira":"tromboni","tromboniram":"tromboni","trombonirati":"tromboni","trombonise":"tromboni","trombonisem":"tromboni","trombonisera":"tromboni","tromboniseram":"tromboni","tromboniserati":"tromboni","trombonisesi":"tromboni","trombonisi":"tromboni","trombonisti":"trombonist","trombonistii":"trombonist","trombonistilor":"trombonist","trombonistul":"trombonist","trombonistule":"trombonist","trombonistului":"trombonist","trombonit":"tromboni","tromboniti":"tromboni","trombonul":"trombon","trombonule":"trombon","trombonului":"trombon","trombopatia":"trombopatie","trombopatiei":"trombopatie","trombopatii":"trombopatie","trombopatiile":"trombopatie","trombopatiilor":"trombopatie","tromboplastica":["tromboplastică","tromboplastic","tromboplastica","tromboplastic"],"tromboplastice":"tromboplastic","tromboplasticele":"tromboplastic","tromboplastici":"tromboplastic","tromboplasticii":"tromboplastic","tromboplasticul":"tromboplastic","tromboplastine":"tromboplastină","tromboplastinei":"tromboplastină","tromboplastinele":"tromboplastină","tromboplastinelor":"tromboplastină","trombopoieze":"trombopoieză","trombopoiezei":"trombopoieză","trombopoiezele":"trombopoieză","trombopoiezelor":"trombopoieză","tromboze":"tromboză","trombozei":"tromboză","trombozele":"tromboză","trombozelor":"tromboză","trombusul":"trombus","trombusule":"trombus","trombusului":"trombus","trombusuri":"trombus","trombusurile":"trombus","trombusurilor":"trombus","tromele":"tromel","tromelele":"tromel","tromelelor":"tromel","tromelul":"tromel","tromelule":"tromel","tromelului":"tromel","trompe":"trompă","trompe uterine":"trompă uterină","trompei":"trompă","trompele":"trompă","trompelor":"trompă","trompetasi":"trompetaș","trompetasii":"trompetaș","trompetasilor":"trompetaș","trompetasul":"trompetaș","trompetasule":"trompetaș","trompetasului":"trompetaș","trompete":"trompetă","trompetei":"trompetă","trompetele":"trompetă","trompetelor":"trompetă","trompeti":"trompet","trompetii":"trompet","trompetilor":"trompet","trompetiste":"trompetistă","trompetistei":"trompetistă","trompetistele":"trompetistă","trompetistelor":"trompetistă","trompetisti":"trompetist","trompetistii":"trompetist","trompetistilor":"trompetist","trompetistul":"trompetist","trompetistule":"trompetist","trompetistului":"trompetist","trompetul":"trompet","trompetule":"trompet","trompetului":"trompet","tronai":"trona","tronam":["tronăm","trona","tronam","trona"],"tronand":"trona","tronara":"trona","tronaram":"trona","tronarati":"trona","tronase":"trona","tronasem":"trona","tronasera":"trona","tronaseram":"trona","tronaserati":"trona","tronasesi":"trona","tronasi":"trona","tronat":"trona","tronati":"trona","tronau":"trona","troncanea":"troncăni","troncaneai":"troncăni","troncaneam":"troncăni","troncaneati":"troncăni","troncaneau":"troncăni","troncanele":"troncăneală","troncanelei":"troncăneală","troncanelele":"troncăneală","troncanelelor":"troncăneală","troncaneli":"troncăneală","troncanesc":"troncăni","troncaneste":"troncăni","troncanesti":"troncăni","troncanii":"troncăni","troncanim":"troncăni","troncanind":"troncăni","troncanira":"troncăni","troncaniram":"troncăni","troncanirati":"troncăni","troncanirea":"troncănire","troncaniri":"troncănire","troncanirii":"troncănire","troncanirile":"troncănire","troncanirilor":"troncănire","troncanise":"troncăni","troncanisem":"troncăni","troncanisera":"troncăni","troncaniseram":"troncăni","troncaniserati":"troncăni","troncanisesi":"troncăni","troncanisi":"troncăni","troncanit":"troncăni","troncaniti":"troncăni","troncanitul":"troncănit","troncanitule":"troncănit","troncanitului":"troncănit","troncanituri":["troncănituri","troncănit","troncănituri","troncănitură"],"troncaniturii":"troncănitură","troncaniturile":["troncăniturile","troncănit","troncăniturile","troncănitură"],"troncaniturilor":["troncăniturilor","troncănit","troncăniturilor","troncănitură"],"tronconica":["tronconică","tronconic","tronconica","tronconic"],"tronconice":"tronconic","tronconicele":"tronconic","tronconici":"tronconic","tronconicii":"tronconic","tronconicul":"tronconic","troncote":"troncot","troncotele":"troncot","troncotelor":"troncot","troncotul":"troncot","troncotule":"troncot","troncotului":"troncot","troneaza":"trona","troneciul":"troneci","troneciule":"troneci","troneciului":"troneci","troneciuri":"troneci","troneciurile":"troneci","troneciurilor":"troneci","tronez":"trona","tronezi":"trona","tronisoare":"tronișor","tronisore":"tronișor","tronisorele":"tronișor","tronisorelor":"tronișor","tronisorul":"tronișor","tronisorule":"tronișor","tronisorului":"tronișor","tronsoane":"tronson","tronsoanele":"tronson","tronsoanelor":"tronson","tronsonul":"tronson","tronsonule":"tronson","tronsonului":"tronson","tronul":"tron","tronule":"tron","tronulete":"tronuleț","tronuletele":"tronuleț","tronuletelor":"tronuleț","tronuletul":"tronuleț","tronuletule":"tronuleț","tronuletului":"tronuleț","tronului":"tron","tronuri":"tron","tronurile":"tron","tronurilor":"tron","tropaia":"tropăi","tropaiai":"tropăi","tropaiam":"tropăi","tropaiati":"tropăi","tropaiau":"tropăi","tropaie":"tropăi","tropaiele":"tropăială","tropaielei":"tropăială","tropaielele":"tropăială","tropaielelor":"tropăială","tropaieli":"tropăială","tropaii":"tropăi","tropaim":"tropăi","tropaind":"tropăi","tropaira":"tropăi","tropairam":"tropăi","tropairati":"tropăi","tropairea":"tropăire","tropairi":"tropăire","tropairii":"tropăire","tropairile":"tropăire","tropairilor":"tropăire","tropaise":"tropăi","tropaisem":"tropăi","tropaisera":"tropăi","tropaiseram":"tropăi","tropaiserati":"tropăi","tropaisesi":"tropăi","tropaisi":"tropăi","tropait":"tropăi","tropaiti":"tropăi","tropaitul":"tropăit","tropaitule":"tropăit","tropaitului":"tropăit","tropaiture":"tropăitură","tropaiturei":"tropăitură","tropaiturele":"tropăitură","tropaiturelor":"tropăitură","tropaituri":["tropăituri","tropăit","tropăituri","tropăitură"],"tropaiturile":"tropăit","tropaiturilor":"tropăit","tropare":"tropar","troparele":"tropar","troparelor":"tropar","troparelul":"tropărel","troparelule":"tropărel","troparelului":"tropărel","troparul":"tropar","troparule":"tropar","troparului":"tropar","tropi":"trop","tropia":"tropie","tropica":["tropică","tropic","tropica","tropic"],"tropicala":["tropicală","tropical","tropicala","tropical"],"tropicale":"tropical","tropicalele":"tropical","tropicali":"tropical","tropicalii":"tropical","tropicalizai":"tropicaliza","tropicalizam":["tropicalizăm","tropicaliza","tropicalizam","tropicaliza"],"tropicalizand":"tropicaliza","tropicalizara":"tropicaliza","tropicalizaram":"tropicaliza","tropicalizarati":"tropicaliza","tropicalizarea":"tropicalizare","tropicalizari":"tropicalizare","tropicalizarii":"tropicalizare","tropicalizarile":"tropicalizare","tropicalizarilor":"tropicalizare","tropicalizase":"tropicaliza","tropicalizasem":"tropicaliza","tropicalizasera":"tropicaliza","tropicalizaseram":"tropicaliza","tropicalizaserati":"tropicaliza","tropicalizasesi":"tropicaliza","tropicalizasi":"tropicaliza","tropicalizat":"tropicaliza","tropicalizata":["tropicalizată","tropicalizat","tropicalizata","tropicalizat"],"tropicalizate":"tropicalizat","tropicalizatele":"tropicalizat","tropicalizati":["tropicalizați","tropicaliza","tropicalizați","tropicalizat"],"tropicalizatia":"tropicalizație","tropicalizatiei":"tropicalizație","tropicalizatii":["tropicalizații","tropicalizat","tropicalizații","tropicalizație"],"tropicalizatiile":"tropicalizație","tropicalizatiilor":"tropicalizație","tropicalizatul":"tropicalizat","tropicalizau":"tropicaliza","tropicalizeaza":"tropicaliza","tropicalizez":"tropicaliza","tropicalizezi":"tropicaliza","tropicalul":"tropical","tropice":"tropic","tropiceasca":["tropicească","tropicesc","tropiceasca","tropicesc"],"tropicele":"tropic","tropicescul":"tropicesc","tropicesti":"tropicesc","tropicestii":"tropicesc","tropicestile":"tropicesc","tropici":"tropic","tropicii":"tropic","tropicul":"tropic","tropiei":"tropie","tropii":["tropii","trop","tropii","tropie"],"tropiile":"tropie","tropiilor":"tropie","tropilor":"trop","tropisme":"tropism","tropismele":"tropism","tropismelor":"tropism","tropismul":"tropism","tropismule":"tropism","tropismului":"tropism","tropofila":["tropofilă","tropofil","tropofila","tropofil"],"tropofile":"tropofil","tropofilele":"tropofil","tropofili":"tropofil","tropofilii":"tropofil","tropofilul":"tropofil","tropologia":"tropologie","tropologica":["tropologică","tropologic","tropologica","tropologic"],"tropologice":"tropologic","tropologicele":"tropologic","tropologici":"tropologic","tropologicii":"tropologic","tropologicul":"tropologic","tropologiei":"tropologie","tropologii":"tropologie","tropopauze":"tropopauză","tropopauzei":"tropopauză","troposfere":"troposferă","troposferei":"troposferă","troposferele":"troposferă","troposferelor":"troposferă","tropotai":"tropota","tropotam":["tropotăm","tropota","tropotam","tropota"],"tropotand":"tropota","tropotara":"tropota","tropotaram":"tropota","tropotarati":"tropota","tropotase":"tropota","tropotasem":"tropota","tropotasera":"tropota","tropotaseram":"tropota","tropotaserati":"tropota","tropotasesi":"tropota","tropotasi":"tropota","tropotat":"tropota","tropotati":"tropota","tropotau":"tropota","tropote":"tropot","tropotea":"tropoti","tropoteai":"tropoti","tropoteam":"tropoti","tropoteati":"tropoti","tropoteau":"tropoti","tropoteaza":"tropota","tropotele":["tropotele","tropot","tropotele","tropoteală"],"tropotelei":"tropoteală","tropotelele":"tropoteală","tropotelelor":"tropoteală","tropoteli":"tropoteală","tropotelor":"tropot","tropotesc":"tropoti","tropoteste":"tropoti","tropotesti":"tropoti","tropotez":"tropota","tropotezi":"tropota","tropotii":"tropoti","tropotim":"tropoti","tropotind":"tropoti","tropotira":"tropoti","tropotiram":"tropoti","tropotirati":"tropoti","tropotise":"tropoti","tropotisem":"tropoti","tropotisera":"tropoti","tropotiseram":"tropoti","tropotiserati":"tropoti","tropotisesi":"tropoti","tropotisi":"tropoti","tropotit":"tropoti","tropotiti":"tropoti","tropotul":"tropot","tropotule":"tropot","tropotului":"tropot","tropul":"trop","tropule":"trop","tropului":"trop","troscanelul":"troscănel","troscanelule":"troscănel","troscanelului":"troscănel","troscoaie":"troscoi","troscoaiele":"troscoi","troscoaielor":"troscoi","troscoiul":"troscoi","troscoiule":"troscoi","troscoiului":"troscoi","troscotelul":"troscoțel","troscotelule":"troscoțel","troscotelului":"troscoțel","troscotul":"troscot","troscotule":"troscot","troscotului":"troscot","trosenirea":"troșenire","troseniri":"troșenire","trosenirii":"troșenire","trosenirile":"troșenire","trosenirilor":"troșenire","trosnea":"trosni","trosneai":"trosni","trosneam":"trosni","trosneati":"trosni","trosneau":"trosni","trosnele":"trosneală","trosnelei":"trosneală","trosnelele":"trosneală","trosnelelor":"trosneală","trosneli":"trosneală","trosnesc":"trosni","trosneste":"trosni","trosnesti":"trosni","trosnete":"trosnet","trosnetele":"trosnet","trosnetelor":"trosnet","trosnetul":"trosnet","trosnetule":"trosnet","trosnetului":"trosnet","trosnii":"trosni","trosnim":"trosni","trosnind":"trosni","trosnira":"trosni","trosniram":"trosni","trosnirati":"trosni","trosnise":"trosni","trosnisem":"trosni","trosnisera":"trosni","trosniseram":"trosni","trosniserati":"trosni","trosnisesi":"trosni","trosnisi":"trosni","trosnit":"trosni","trosniti":"trosni","trosnitoare":"trosnitor","trosnitoarea":"trosnitor","trosnitoarele":"trosnitor","trosnitori":"trosnitor","trosnitorii":"trosnitor","trosnitorul":"trosnitor","trosnituri":"trosnitură","trosniturii":"trosnitură","trosniturile":"trosnitură","trosniturilor":"trosnitură","trotai":"trota","trotam":["trotăm","trota","trotam","trota"],"trotand":"trota","trotara":"trota","trotaram":"trota","trotarati":"trota","trotase":"trota","trotasem":"trota","trotasera":"trota","trotaseram":"trota","trotaserati":"trota","trotasesi":"trota","trotasi":"trota","trotat":"trota","trotati":"trota","trotau":"trota","troteaza":"trota","troteuri":"troteur","troteurii":"troteur","troteurilor":"troteur","troteurul":"troteur","troteurule":"troteur","troteurului":"troteur","trotez":"trota","trotezi":"trota","trotilul":"trotil","trotilule":"trotil","trotilului":"trotil","trotiluri":"trotil","trotilurile":"trotil","trotilurilor":"trotil","trotinai":"trotina","trotinam":["trotinăm","trotina","trotinam","trotina"],"trotinand":"trotina","trotinara":"trotina","trotinaram":"trotina","trotinarati":"trotina","trotinase":"trotina","trotinasem":"trotina","trotinasera":"trotina","trotinaseram":"trotina","trotinaserati":"trotina","trotinasesi":"trotina","trotinasi":"trotina","trotinat":"trotina","trotinati":"trotina","trotinau":"trotina","trotineaza":"trotina","trotinete":"trotinetă","trotinetei":"trotinetă","trotinetele":"trotinetă","trotinetelor":"trotinetă","trotinez":"trotina","trotinezi":"trotina","trotkismul":"troțkism","trotkismule":"troțkism","trotkismului":"troțkism","trotkista":["troțkistă","troțkist","troțkista","troțkist"],"trotkiste":"troțkist","trotkistele":"troțkist","trotkisti":"troțkist","trotkistii":"troțkist","trotkistilor":"troțkist","trotkistul":"troțkist","trotkistule":"troțkist","trotkistului":"troțkist","trotteuri":"trotteur","trotteurii":"trotteur","trotteurilor":"trotteur","trotteurul":"trotteur","trotteurule":"trotteur","trotteurului":"trotteur","trotuare":"trotuar","trotuarele":"trotuar","trotuarelor":"trotuar","trotuarul":"trotuar","trotuarule":"trotuar","trotuarului":"trotuar","trubacii":"trubaci","trubacilor":"trubaci","trubaciul":"trubaci","trubaciule":"trubaci","trubaciului":"trubaci","trubaduri":"trubadur","trucai":"truca","trucaje":"trucaj","trucajele":"trucaj","trucajelor":"trucaj","trucajul":"trucaj","trucajule":"trucaj","trucajului":"trucaj","trucam":["trucăm","truca","trucam","truca"],"trucand":"truca","trucara":"truca","trucaram":"truca","trucarati":"truca","trucarea":"trucare","trucari":"trucare","trucarii":"trucare","trucarile":"trucare","trucarilor":"trucare","trucase":"truca","trucasem":"truca","trucasera":"truca","trucaseram":"truca","trucaserati":"truca","trucasesi":"truca","trucasi":"truca","trucat":"truca","trucata":["trucată","trucat","trucata","trucat"],"trucate":"trucat","trucatele":"trucat","trucati":["trucați","truca","trucați","trucat"],"trucatii":"trucat","trucatul":"trucat","trucau":"truca","truce":"trucă","trucei":"trucă","trucheaza":"truca","truchez":"truca","truchezi":"truca","trucul":"truc","trucule":"truc","truculenta":["truculentă","truculent","truculenta","truculent"],"truculente":["truculente","truculent","truculențe","truculență"],"truculentei":"truculență","truculentele":["truculentele","truculent","truculențele","truculență"],"truculentelor":"truculență","truculenti":"truculent","truculentii":"truculent","truculentul":"truculent","trucului":"truc","trucuri":"truc","trucuri de magie":"truc de magie","trucurile":"truc","trucurilor":"truc","trude":"trudă","trudea":"trudi","trudeai":"trudi","trudeam":"trudi","trudeati":"trudi","trudeau":"trudi","trudei":"trudă","trudele":"trudă","trudelor":"trudă","trudesc":"trudi","trudeste":"trudi","trudesti":"trudi","trudii":"trudi","trudim":"trudi","trudind":"trudi","trudira":"trudi","trudiram":"trudi","trudirati":"trudi","trudirea":"trudire","trudiri":"trudire","trudirii":"trudire","trudirile":"trudire","trudirilor":"trudire","trudise":"trudi","trudisem":"trudi","trudisera":"trudi","trudiseram":"trudi","trudiserati":"trudi","trudisesi":"trudi","trudisi":"trudi","trudit":"trudi","trudita":["trudită","trudit","trudita","trudit"],"trudite":"trudit","truditele":"trudit","truditi":["trudiți","trudi","trudiți","trudit"],"truditii":"trudit","truditoare":"truditor","truditoarea":["truditoarea","truditoare","truditoarea","truditor"],"truditoarei":"truditoare","truditoarele":["truditoarele","truditoare","truditoarele","truditor"],"truditoarelor":"truditoare","truditori":"truditor","truditorii":"truditor","truditorilor":"truditor","truditorul":"truditor","truditorule":"truditor","truditorului":"truditor","truditul":"trudit","trudnica":["trudnică","trudnic","trudnica","trudnic"],"trudnice":"trudnic","trudnicele":"trudnic","trudnici":"trudnic","trudnicia":"trudnicie","trudniciei":"trudnicie","trudnicii":["trudnicii","trudnic","trudnicii","trudnicie"],"trudniciile":"trudnicie","trudniciilor":"trudnicie","trudnicul":"trudnic","trufandale":"trufanda","trufandalei":"trufanda","trufandalele":"trufanda","trufandalelor":"trufanda","trufandaua":"trufanda","trufasa":["trufașă","trufaș","trufașa","trufaș"],"trufasagul":"trufășag","trufasagule":"trufășag","trufasagului":"trufășag","trufasaguri":"trufășag","trufasagurile":"trufășag","trufasagurilor":"trufășag","trufase":"trufaș","trufasele":"trufaș","trufasi":"trufaș","trufasia":"trufășie","trufasiei":"trufășie","trufasii":["trufașii","trufaș","trufășii","trufășie"],"trufasiile":"trufășie","trufasiilor":"trufășie","trufasul":"trufaș","trufe":"trufă","trufei":"trufă","trufele":"trufă","trufelor":"trufă","trufia":"trufie","trufiei":"trufie","trufii":"trufie","trufiile":"trufie","trufiilor":"trufie","trufoasa":["trufoasă","trufos","trufoasa","trufos"],"trufoase":"trufos","trufoasele":"trufos","trufosi":"trufos","trufosii":"trufos","trufosul":"trufos","truisme":"truism","truismele":"truism","truismelor":"truism","truismul":"truism","truismule":"truism","truismului":"truism","trunchiai":"trunchia","trunchiam":"trunchia","trunchiara":"trunchia","trunchiaram":"trunchia","trunchiarati":"trunchia","trunchiase":"trunchia","trunchiasem":"trunchia","trunchiasera":"trunchia","trunchiaseram":"trunchia","trunchiaserati":"trunchia","trunchiasesi":"trunchia","trunchiasi":"trunchia","trunchiasul":"trunchiaș","trunchiasule":"trunchiaș","trunchiasului":"trunchiaș","trunchiat":"trunchia","trunchiata":["trunchiată","trunchiat","trunchiata","trunchiat"],"trunchiate":"trunchiat","trunchiatele":"trunchiat","trunchiati":["trunchiați","trunchia","trunchiați","trunchiat"],"trunchiatii":"trunchiat","trunchiatul":"trunchiat","trunchiau":"trunchia","trunchiaza":"trunchia","trunchie":"trunchia","trunchiem":"trunchia","trunchierea":"trunchiere","trunchieri":"trunchiere","trunchierii":"trunchiere","trunchierile":"trunchiere","trunchierilor":"trunchiere","trunchiez":"trunchia","trunchiezi":"trunchia","trunchiind":"trunchia","trunchisoare":"trunchișor","trunchisoarei":"trunchișor","trunchisoarelor":"trunchișor","trunchisorul":"trunchișor","trunchisorule":"trunchișor","trunchisorului":"trunchișor","trunchiu":"trunchi","trunchiul":"trunchi","trunchiule":"trunchi","trunchiulete":"trunchiuleț","trunchiuletele":"trunchiuleț","trunchiuletelor":"trunchiuleț","trunchiuletul":"trunchiuleț","trunchiuletule":"trunchiuleț","trunchiuletului":"trunchiuleț","trunchiului":"trunchi","trunchiuri":"trunchi","trunchiurile":"trunchi","trunchiurilor":"trunchi","trupe":"trupă","trupeana":["trupeană","trupean","trupeana","trupean"],"trupeanul":"trupean","trupeasca":["trupească","trupesc","trupeasca","trupesc"],"trupei":"trupă","trupele":"trupă","trupelor":"trupă","trupene":"trupean","trupenele":"trupean","trupeni":"trupean","trupenii":"trupean","trupesa":["trupeșă","trupeș","trupeșa","trupeș"],"trupescul":"trupesc","trupese":"trupeș","trupesele":"trupeș","trupesi":"trupeș","trupesia":"trupeșie","trupesiei":"trupeșie","trupesii":["trupeșii","trupeș","trupeșii","trupeșie"],"trupesti":"trupesc","trupestii":"trupesc","trupestile":"trupesc","trupesul":"trupeș","trupeti":"trupet","trupetii":"trupet","trupetilor":"trupet","trupetul":"trupet","trupetule":"trupet","trupetului":"trupet","trupina":"tulpină","trupine":"trupină","trupinei":"trupină","trupinele":"trupină","trupinelor":"trupină","trupite":"trupiță","trupitei":"trupiță","trupitele":"trupiță","trupitelor":"trupiță","trupoasa":["trupoasă","trupos","trupoasa","trupos"],"trupoase":"trupos","trupoasele":"trupos","truposi":"trupos","truposii":"trupos","truposul":"trupos","trupsoare":"trupșor","trupsoarele":"trupșor","trupsoarelor":"trupșor","trupsorele":"trupșorel","trupsorelele":"trupșorel","trupsorelelor":"trupșorel","trupsorelul":"trupșorel","trupsorelule":"trupșorel","trupsorelului":"trupșorel","trupsorul":"trupșor","trupsorule":"trupșor","trupsorului":"trupșor","trupul":"trup","trupule":"trup","trupulete":"trupuleț","trupuletele":"trupuleț","trupuletelor":"trupuleț","trupuletul":"trupuleț","trupuletule":"trupuleț","trupuletului":"trupuleț","trupului":"trup","trupurele":"trupurel","trupurelele":"trupurel","trupurelelor":"trupurel","trupurelul":"trupurel","trupurelule":"trupurel","trupurelului":"trupurel","trupuri":"trup","trupurile":"trup","trupurilor":"trup","trupusoare":"trupușor","trupusoarele":"trupușor","trupusoarelor":"trupușor","trupusorul":"trupușor","trupusorule":"trupușor","trupusorului":"trupușor","trupute":"trupuț","truputele":"trupuț","truputelor":"trupuț","truputul":"trupuț","truputule":"trupuț","truputului":"trupuț","truse":"trusă","trusei":"trusă","trusele":"trusă","truselor":"trusă","trusoul":"trusou","trusoule":"trusou","trusoului":"trusou","trusouri":"trusou","trusourile":"trusou","trusourilor":"trusou","truste":"trușcă","trustei":"trușcă","trustele":"trușcă","trustelor":"trușcă","trustmanul":"trustman","trustmanule":"trustman","trustmanului":"trustman","trustmeni":["trustmeni","trustman","trustmeni","trustmen"],"trustmenii":["trustmenii","trustman","trustmenii","trustmen"],"trustmenilor":["trustmenilor","trustman","trustmenilor","trustmen"],"trustmenul":"trustmen","trustmenule":"trustmen","trustmenului":"trustmen","trustul":"trust","trustule":"trust","trustului":"trust","trusturi":"trust","trusturile":"trust","trusturilor":"trust","truvabila":["truvabilă","truvabil","truvabila","truvabil"],"truvabile":"truvabil","truvabilele":"truvabil","truvabili":"truvabil","truvabilii":"truvabil","truvabilul":"truvabil","truveri":"truver","truverii":"truver","truverilor":"truver","truverul":"truver","truverule":"truver","truverului":"truver","tsunamiuri":"tsunami","tuarege":"tuaregă","tuaregei":"tuaregă","tuaregele":"tuaregă","tuaregelor":"tuaregă","tuaregi":"tuareg","tuaregii":"tuareg","tuaregilor":"tuareg","tuaregul":"tuareg","tuaregule":"tuareg","tuaregului":"tuareg","tubaje":"tubaj","tubajele":"tubaj","tubajelor":"tubaj","tubajul":"tubaj","tubajule":"tubaj","tubajului":"tubaj","tubalhanale":"tubalhana","tubalhanalei":"tubalhana","tubalhanalele":"tubalhana","tubalhanalelor":"tubalhana","tubalhanaua":"tubalhana","tube":"tubă","tubei":"tubă","tubele":"tubă","tubelor":"tubă","tuberculata":["tuberculată","tuberculat","tuberculata","tuberculat"],"tuberculate":"tuberculat","tuberculatele":"tuberculat","tuberculati":"tuberculat","tuberculatii":"tuberculat","tuberculatul":"tuberculat","tubercule":"tuberculă","tuberculei":"tuberculă","tuberculele":"tuberculă","tuberculelor":"tuberculă","tuberculi":"tubercul","tuberculii":"tubercul","tuberculilor":"tubercul","tuberculinarea":"tuberculinare","tuberculinari":"tuberculinare","tuberculinarii":"tuberculinare","tuberculinarile":"tuberculinare","tuberculinarilor":"tuberculinare","tuberculine":"tuberculină","tuberculinei":"tuberculină","tuberculinele":"tuberculină","tuberculinelor":"tuberculină","tuberculizai":"tuberculiza","tuberculizam":["tuberculizăm","tuberculiza","tuberculizam","tuberculiza"],"tuberculizand":"tuberculiza","tuberculizara":"tuberculiza","tuberculizaram":"tuberculiza","tuberculizarati":"tuberculiza","tuberculizarea":"tuberculizare","tuberculizari":"tuberculizare","tuberculizarii":"tuberculizare","tuberculizarile":"tuberculizare","tuberculizarilor":"tuberculizare","tuberculizase":"tuberculiza","tuberculizasem":"tuberculiza","tuberculizasera":"tuberculiza","tuberculizaseram":"tuberculiza","tuberculizaserati":"tuberculiza","tuberculizasesi":"tuberculiza","tuberculizasi":"tuberculiza","tuberculizat":"tuberculiza","tuberculizati":"tuberculiza","tuberculizau":"tuberculiza","tuberculizeaza":"tuberculiza","tuberculizez":"tuberculiza","tuberculizezi":"tuberculiza","tuberculoame":"tuberculom","tuberculoamele":"tuberculom","tuberculoamelor":"tuberculom","tuberculoase":"tuberculoasă","tuberculoasei":"tuberculoasă","tuberculoasele":"tuberculoasă","tuberculoaselor":"tuberculoasă","tuberculoida":["tuberculoidă","tuberculoid","tuberculoida","tuberculoid"],"tuberculoide":"tuberculoid","tuberculoidele":"tuberculoid","tuberculoidul":"tuberculoid","tuberculoizi":"tuberculoid","tuberculoizii":"tuberculoid","tuberculomul":"tuberculom","tuberculomule":"tuberculom","tuberculomului":"tuberculom","tuberculosi":"tuberculos","tuberculosii":"tuberculos","tuberculosilor":"tuberculos","tuberculostatica":["tuberculostatică","tuberculostatic","tuberculostatica","tuberculostatic"],"tuberculostatice":"tuberculostatic","tuberculostaticele":"tuberculostatic","tuberculostatici":"tuberculostatic","tuberculostaticii":"tuberculostatic","tuberculostaticul":"tuberculostatic","tuberculosul":"tuberculos","tuberculosule":"tuberculos","tuberculosului":"tuberculos","tuberculoze":"tuberculoză","tuberculul":"tubercul","tuberculule":"tubercul","tuberculului":"tubercul","tuberoasa":["tuberoasă","tuberos","tuberoasa","tuberos"],"tuberoase":"tuberos","tuberoasele":"tuberos","tuberosi":"tuberos","tuberosii":"tuberos","tuberosul":"tuberos","tuberoze":"tuberoză","tuberozei":"tuberoză","tuberozele":"tuberoză","tuberozelor":"tuberoză","tuberozitatea":"tuberozitate","tuberozitati":"tuberozitate","tuberozitatii":"tuberozitate","tuberozitatile":"tuberozitate","tuberozitatilor":"tuberozitate","tubiforma":["tubiformă","tubiform","tubiforma","tubiform"],"tubiforme":"tubiform","tubiformele":"tubiform","tubiformi":"tubiform","tubiformii":"tubiform","tubiformul":"tubiform","tubul":"tub","tubulara":["tubulară","tubular","tubulara","tubular"],"tubulare":"tubular","tubularele":"tubular","tubulari":"tubular","tubularii":"tubular","tubularul":"tubular","tubulaturi":"tubulatură","tubulaturii":"tubulatură","tubulaturile":"tubulatură","tubulaturilor":"tubulatură","tubule":"tub","tubulete":"tubuleț","tubuletele":"tubuleț","tubuletelor":"tubuleț","tubuletul":"tubuleț","tubuletule":"tubuleț","tubuletului":"tubuleț","tubului":"tub","tubuluri":"tubulură","tubulurii":"tubulură","tubulurile":"tubulură","tubulurilor":"tubulură","tuburi":"tub","tuburi catodice":"tub catodic","tuburi digestive":"tub digestiv","tuburi fluorescente":"tub fluorescent","tuburile":"tub","tuburilor":"tub","tubusoare":"tubușor","tubusoarele":"tubușor","tubusoarelor":"tubușor","tubusorul":"tubușor","tubusorule":"tubușor","tubusorului":"tubușor","tuc":"țuca","tucai":"țuca","tucale":"țucal","tucalele":"țucal","tucalelor":"țucal","tucalul":"țucal","tucalule":"țucal","tucalului":"țucal","tucam":["țucăm","țuca","țucam","țuca"],"tucand":"țuca","tucani":"tucan","tucanii":"tucan","tucanilor":"tucan","tucanul":"tucan","tucanule":"tucan","tucanului":"tucan","tucara":"țuca","tucaram":"țuca","tucarati":"țuca","tucase":"țuca","tucasem":"țuca","tucasera":"țuca","tucaseram":"țuca","tucaserati":"țuca","tucasesi":"țuca","tucasi":"țuca","tucat":"țuca","tucati":"țuca","tucatul":"țucat","tucatule":"țucat","tucatului":"țucat","tucaturi":"țucat","tucaturile":"țucat","tucaturilor":"țucat","tucau":"țuca","tuceria":"tucerie","tuceriei":"tucerie","tucerii":"tucerie","tuceriile":"tucerie","tuceriilor":"tucerie","tuci":"țuca","tuciul":"tuci","tuciule":"tuci","tuciului":"tuci","tuciuri":"tuci","tuciuria":"tuciuriu","tuciurie":"tuciuriu","tuciurii":"tuciuriu","tuciuriii":"tuciuriu","tuciuriile":"tuciuriu","tuciurile":"tuci","tuciurilor":"tuci","tuciuriul":"tuciuriu","tucui":"țugui","tudeasca":["tudească","tudesc","tudeasca","tudesc"],"tudescul":"tudesc","tudesti":"tudesc","tudestii":"tudesc","tudestile":"tudesc","tudumanea":"tudumăni","tudumaneai":"tudumăni","tudumaneam":"tudumăni","tudumaneati":"tudumăni","tudumaneau":"tudumăni","tudumanesc":"tudumăni","tudumaneste":"tudumăni","tudumanesti":"tudumăni","tudumanii":"tudumăni","tudumanim":"tudumăni","tudumanind":"tudumăni","tudumanira":"tudumăni","tudumaniram":"tudumăni","tudumanirati":"tudumăni","tudumanise":"tudumăni","tudumanisem":"tudumăni","tudumanisera":"tudumăni","tudumaniseram":"tudumăni","tudumaniserati":"tudumăni","tudumanisesi":"tudumăni","tudumanisi":"tudumăni","tudumanit":"tudumăni","tudumaniti":"tudumăni","tufaioare":"tufăioară","tufaioarei":"tufăioară","tufaioarele":"tufăioară","tufaioarelor":"tufăioară","tufaiori":"tufăior","tufaiorii":"tufăior","tufaiorilor":"tufăior","tufaiorul":"tufăior","tufaiorule":"tufăior","tufaiorului":"tufăior","tufanele":"tufănică","tufani":"tufan","tufanice":"tufănică","tufanicei":"tufănică","tufanicele":"tufănică","tufanicelor":"tufănică","tufanii":"tufan","tufanilor":"tufan","tufanul":"tufan","tufanule":"tufan","tufanului":"tufan","tufarasi":"tufăraș","tufarasii":"tufăraș","tufarasilor":"tufăraș","tufarasul":"tufăraș","tufarasule":"tufăraș","tufarasului":"tufăraș","tufari":"tufar","tufaria":"tufărie","tufariei":"tufărie","tufarii":["tufarii","tufar","tufării","tufărie"],"tufariile":"tufărie","tufariilor":"tufărie","tufarilor":"tufar","tufarimea":"tufărime","tufarimi":"tufărime","tufarimii":"tufărime","tufarimile":"tufărime","tufarimilor":"tufărime","tufaristea":"tufăriște","tufaristi":"tufăriște","tufaristii":"tufăriște","tufaristile":"tufăriște","tufaristilor":"tufăriște","tufarisul":"tufăriș","tufarisule":"tufăriș","tufarisului":"tufăriș","tufarisuri":"tufăriș","tufarisurile":"tufăriș","tufarisurilor":"tufăriș","tufarul":"tufar","tufarule":"tufar","tufarului":"tufar","tufceanaul":"tufceană","tufceanaule":"tufceană","tufceanaului":"tufceană","tufceaua":"tufcea","tufcele":"tufcea","tufcelei":"tufcea","tufcelele":"tufcea","tufcelelor":"tufcea","tufcene":"tufceană","tufcenei":"tufceană","tufcenelor":"tufceană","tufe":"tufă","tufeccii":["tufeccii","tufecci","tufeccii","tufecciu"],"tufecciii":"tufecciu","tufecciilor":"tufecciu","tufeccilor":"tufecci","tufecciul":"tufecci","tufecciule":"tufecci","tufecciului":"tufecci","tufecciuul":"tufecciu","tufecciuule":"tufecciu","tufecciuului":"tufecciu","tufei":"tufă","tufele":"tufă","tufelor":"tufă","tufisoare":"tufișoară","tufisoarei":"tufișoară","tufisoarele":"tufișoară","tufisoarelor":"tufișoară","tufisul":"tufiș","tufisule":"tufiș","tufisului":"tufiș","tufisuri":"tufiș","tufisurile":"tufiș","tufisurilor":"tufiș","tufite":["tufite","tufit","tufite","tufiță","tufițe","tufiță"],"tufitei":"tufiță","tufitele":["tufitele","tufit","tufițele","tufiță"],"tufitelor":["tufitelor","tufit","tufițelor","tufiță"],"tufitul":"tufit","tufitule":"tufit","tufitului":"tufit","tuflea":"tufli","tufleai":"tufli","tufleam":"tufli","tufleati":"tufli","tufleau":"tufli","tuflesc":"tufli","tufleste":"tufli","tuflesti":"tufli","tuflii":"tufli","tuflim":"tufli","tuflind":"tufli","tuflira":"tufli","tufliram":"tufli","tuflirati":"tufli","tuflise":"tufli","tuflisem":"tufli","tuflisera":"tufli","tufliseram":"tufli","tufliserati":"tufli","tuflisesi":"tufli","tuflisi":"tufli","tuflit":"tufli","tufliti":"tufli","tufoasa":["tufoasă","tufos","tufoasa","tufos"],"tufoase":"tufos","tufoasele":"tufos","tufosi":"tufos","tufosii":"tufos","tufosul":"tufos","tuful":"tuf","tufule":"tuf","tufulite":"tufuliță","tufulitei":"tufuliță","tufulitele":"tufuliță","tufulitelor":"tufuliță","tufului":"tuf","tufuri":"tuf","tufurile":"tuf","tufurilor":"tuf","tufusoare":"tufușoară","tufusoarei":"tufușoară","tufusoarele":"tufușoară","tufusoarelor":"tufușoară","tufute":"tufuță","tufutei":"tufuță","tufutele":"tufuță","tufutelor":"tufuță","tuguiata":["țuguiată","țuguiat","țuguiata","țuguiat"],"tuguiate":"țuguiat","tuguiatele":"țuguiat","tuguiati":"țuguiat","tuguiatii":"țuguiat","tuguiatul":"țuguiat","tuguie":"țugui","tuguiele":"țugui","tuguielor":"țugui","tuguiul":"țugui","tuguiule":"țugui","tuguiului":"țugui","tugul":"țug","tugule":"țug","tugului":"țug","tuguri":"țug","tugurile":"țug","tugurilor":"țug","tuhausul":"țuhaus","tuhausule":"țuhaus","tuhausului":"țuhaus","tuhma":"tocmai","tuicarea":"țuicări","tuicareai":"țuicări","tuicaream":"țuicări","tuicareati":"țuicări","tuicareau":"țuicări","tuicarele":"țuicăreală","tuicarelei":"țuicăreală","tuicarelele":"țuicăreală","tuicarelelor":"țuicăreală","tuicareli":"țuicăreală","tuicaresc":"țuicări","tuicareste":"țuicări","tuicaresti":"țuicări","tuicari":"țuicar","tuicaria":"țuicărie","tuicariei":"țuicărie","tuicarii":["țuicarii","țuicar","țuicării","țuicări","țuicării","țuicărie"],"tuicariile":"țuicărie","tuicariilor":"țuicărie","tuicarilor":"țuicar","tuicarim":"țuicări","tuicarind":"țuicări","tuicarira":"țuicări","tuicariram":"țuicări","tuicarirati":"țuicări","tuicarise":"țuicări","tuicarisem":"țuicări","tuicarisera":"țuicări","tuicariseram":"țuicări","tuicariserati":"țuicări","tuicarisesi":"țuicări","tuicarisi":"țuicări","tuicarit":"țuicări","tuicariti":"țuicări","tuicarul":"țuicar","tuicarule":"țuicar","tuicarului":"țuicar","tuici":"țuică","tuicii":"țuică","tuicile":"țuică","tuicilor":"țuică","tuicuia":"țuicui","tuicuiai":"țuicui","tuicuiam":"țuicui","tuicuiati":"țuicui","tuicuiau":"țuicui","tuicuiele":"țuicuială","tuicuielei":"țuicuială","tuicuielele":"țuicuială","tuicuielelor":"țuicuială","tuicuieli":"țuicuială","tuicuiesc":"țuicui","tuicuieste":"țuicui","tuicuiesti":"țuicui","tuicuii":"țuicui","tuicuim":"țuicui","tuicuind":"țuicui","tuicuira":"țuicui","tuicuiram":"țuicui","tuicuirati":"țuicui","tuicuise":"țuicui","tuicuisem":"țuicui","tuicuisera":"țuicui","tuicuiseram":"țuicui","tuicuiserati":"țuicui","tuicuisesi":"țuicui","tuicuisi":"țuicui","tuicuit":"țuicui","tuicuiti":"țuicui","tuiculene":"țuiculeană","tuiculenei":"țuiculeană","tuiculenele":"țuiculeană","tuiculenelor":"țuiculeană","tuiculite":"țuiculiță","tuiculitei":"țuiculiță","tuiculitele":"țuiculiță","tuiculitelor":"țuiculiță","tuicusoare":"țuicușoară","tuicusoarei":"țuicușoară","tuicusoarele":"țuicușoară","tuicusoarelor":"țuicușoară","tuiesa":["tuieșă","tuieș","tuieșa","tuieș"],"tuiese":"tuieș","tuiesele":"tuieș","tuiesi":"tuieș","tuiesii":"tuieș","tuiesul":"tuieș","tujlenasi":"tujlenaș","tujlenasii":"tujlenaș","tujlenasilor":"tujlenaș","tujlenasul":"tujlenaș","tujlenasule":"tujlenaș","tujlenasului":"tujlenaș","tularemia":"tularemie","tularemiei":"tularemie","tularemii":"tularemie","tularemiile":"tularemie","tularemiilor":"tularemie","tulauasi":"tulăuaș","tulauasii":"tulăuaș","tulauasilor":"tulăuaș","tulauasul":"tulăuaș","tulauasule":"tulăuaș","tulauasului":"tulăuaș","tulbite":"tulbiță","tulbitei":"tulbiță","tulbitele":"tulbiță","tulbitelor":"tulbiță","tulbur":"tulbura","tulburai":"tulbura","tulburam":["tulburăm","tulbura","tulburam","tulbura"],"tulburand":"tulbura","tulburara":"tulbura","tulburaram":"tulbura","tulburarati":"tulbura","tulburari":"tulburare","tulburari bipolare":"tulburare bipolară","tulburase":"tulbura","tulburasem":"tulbura","tulburasera":"tulbura","tulburaseram":"tulbura","tulburaserati":"tulbura","tulburasesi":"tulbura","tulburasi":"tulbura","tulburat":"tulbura","tulburata":["tulburată","tulburat","tulburata","tulburat"],"tulburate":"tulburat","tulburatele":"tulburat","tulburati":["tulburați","tulbura","tulburați","tulburat"],"tulburatii":"tulburat","tulburatoare":"tulburător","tulburatoarea":"tulburător","tulburatoarele":"tulburător","tulburatori":"tulburător","tulburatorii":"tulburător","tulburatorul":"tulburător","tulburatul":"tulburat","tulburau":"tulbura","tulbure":"tulbura","tulburea":"tulbure","tulburei":"tulburel","tulbureii":"tulburel","tulbureilor":"tulburel","tulburele":["tulburele","tulbure","tulburele","tulbureală"],"tulburelei":"tulbureală","tulburelele":"tulbureală","tulburelelor":"tulbureală","tulbureli":"tulbureală","tulburelul":"tulburel","tulburelule":"tulburel","tulburelului":"tulburel","tulburi":["tulburi","tulbura","tulburi","tulbure"],"tulburia":"tulburiu","tulburie":"tulburiu","tulburii":["tulburii","tulbure","tulburii","tulburiu"],"tulburiii":"tulburiu","tulburiile":"tulburiu","tulburile":"tulbure","tulburiul":"tulburiu","tulburoasa":["tulburoasă","tulburos","tulburoasa","tulburos"],"tulburoase":"tulburos","tulburoasele":"tulburos","tulburosi":"tulburos","tulburosii":"tulburos","tulburosul":"tulburos","tulceanul":"tulcean","tulceanule":"tulcean","tulceanului":"tulcean","tulcence":"tulceancă","tulcencei":"tulceancă","tulcencele":"tulceancă","tulcencelor":"tulceancă","tulcene":"tulceană","tulcenei":"tulceană","tulcenele":"tulceană","tulcenelor":"tulceană","tulceni":"tulcean","tulcenii":"tulcean","tulcenilor":"tulcean","tulea":"tuli","tuleai":"tuli","tuleam":"tuli","tuleasca":"tuli","tuleati":"tuli","tuleau":"tuli","tulele":"tuleală","tulelei":"tuleală","tulelele":"tuleală","tulelelor":"tuleală","tuleli":"tuleală","tulesc":"tuli","tuleste":"tuli","tulesti":"tuli","tulichinaul":"tulichină","tulichinaule":"tulichină","tulichinaului":"tulichină","tulichine":"tulichină","tulichinei":"tulichină","tulichinelor":"tulichină","tulii":"tuli","tulim":"tuli","tulind":"tuli","tulipe":"tulipă","tulipei":"tulipă","tulipele":"tulipă","tulipelor":"tulipă","tulipieri":"tulipier","tulipierii":"tulipier","tulipierilor":"tulipier","tulipierul":"tulipier","tulipierule":"tulipier","tulipierului":"tulipier","tulira":"tuli","tuliram":"tuli","tulirati":"tuli","tulise":"tuli","tulisem":"tuli","tulisera":"tuli","tuliseram":"tuli","tuliserati":"tuli","tulisesi":"tuli","tulisi":"tuli","tulit":"tuli","tulit-o":"o tuli","tuliti":"tuli","tuliul":"tuliu","tuliule":"tuliu","tuliului":"tuliu","tulnica":["tulnică","tulnic","tulnica","tulnic"],"tulnicarese":"tulnicăreasă","tulnicaresei":"tulnicăreasă","tulnicaresele":"tulnicăreasă","tulnicareselor":"tulnicăreasă","tulnicase":"tulnicașă","tulnicasei":"tulnicașă","tulnicasele":"tulnicașă","tulnicaselor":"tulnicașă","tulnice":"tulnic","tulnicele":["tulnicele","tulnic","tulnicele","tulniceală"],"tulnicelei":"tulniceală","tulnicelele":"tulniceală","tulnicelelor":"tulniceală","tulniceli":"tulniceală","tulnici":"tulnic","tulnicii":"tulnic","tulnicul":"tulnic","tulpaioare":"tulpăior","tulpaioarele":"tulpăior","tulpaioarelor":"tulpăior","tulpaiorul":"tulpăior","tulpaiorule":"tulpăior","tulpaiorului":"tulpăior","tulpanase":"tulpănaș","tulpanasele":"tulpănaș","tulpanaselor":"tulpănaș","tulpanasul":"tulpănaș","tulpanasule":"tulpănaș","tulpanasului":"tulpănaș","tulpanele":"tulpănel","tulpanelele":"tulpănel","tulpanelelor":"tulpănel","tulpanelul":"tulpănel","tulpanelule":"tulpănel","tulpanelului":"tulpănel","tulpinala":["tulpinală","tulpinal","tulpinala","tulpinal"],"tulpinale":"tulpinal","tulpinalele":"tulpinal","tulpinali":"tulpinal","tulpinalii":"tulpinal","tulpinalul":"tulpinal","tulpini":"tulpină","tulpinite":"tulpiniță","tulpinitei":"tulpiniță","tulpinitele":"tulpiniță","tulpinitelor":"tulpiniță","tulpioare":"tulpioară","tulpioarei":"tulpioară","tulpioarele":"tulpioară","tulpioarelor":"tulpioară","tuluci":"tuluc","tulucii":"tuluc","tulucilor":"tuluc","tulucul":"tuluc","tulucule":"tuluc","tulucului":"tuluc","tulul":"tul","tulule":"tul","tulului":"tul","tulumbagii":"tulumbagiu","tulumbagiii":"tulumbagiu","tulumbagiilor":"tulumbagiu","tulumbagiul":"tulumbagiu","tulumbagiule":"tulumbagiu","tulumbagiului":"tulumbagiu","tulumbe":"tulumbă","tulumbei":"tulumbă","tulumbele":"tulumbă","tulumbelor":"tulumbă","tulumul":"tulum","tulumule":"tulum","tulumului":"tulum","tulumuri":"tulum","tulumurile":"tulum","tulumurilor":"tulum","tuluri":"tul","tulurile":"tul","tulurilor":"tul","tumanea":"tumăni","tumaneai":"tumăni","tumaneam":"tumăni","tumaneati":"tumăni","tumaneau":"tumăni","tumanesc":"tumăni","tumaneste":"tumăni","tumanesti":"tumăni","tumanii":"tumăni","tumanim":"tumăni","tumanind":"tumăni","tumanira":"tumăni","tumaniram":"tumăni","tumanirati":"tumăni","tumanise":"tumăni","tumanisem":"tumăni","tumanisera":"tumăni","tumaniseram":"tumăni","tumaniserati":"tumăni","tumanisesi":"tumăni","tumanisi":"tumăni","tumanit":"tumăni","tumaniti":"tumăni","tumbacul":"tumbac","tumbacule":"tumbac","tumbacului":"tumbac","tumbaraie":"tumbărău","tumbaraiele":"tumbărău","tumbaraielor":"tumbărău","tumbarauul":"tumbărău","tumbarauule":"tumbărău","tumbarauului":"tumbărău","tumbe":"tumbă","tumbei":"tumbă","tumbele":"tumbă","tumbelechiul":"tumbelechi","tumbelechiule":"tumbelechi","tumbelechiului":"tumbelechi","tumbelechiuri":"tumbelechi","tumbelechiurile":"tumbelechi","tumbelechiurilor":"tumbelechi","tumbelehelul":"tumbelehel","tumbelehelule":"tumbelehel","tumbelehelului":"tumbelehel","tumbeleheluri":"tumbelehel","tumbelehelurile":"tumbelehel","tumbelehelurilor":"tumbelehel","tumbelor":"tumbă","tumburuse":"țumburuș","tumburusele":"țumburuș","tumburuselor":"țumburuș","tumburusul":"țumburuș","tumburusule":"țumburuș","tumburusului":"țumburuș","tumefactia":"tumefacție","tumefactiei":"tumefacție","tumefactii":"tumefacție","tumefactiile":"tumefacție","tumefactiilor":"tumefacție","tumefiai":"tumefia","tumefiam":"tumefia","tumefiara":"tumefia","tumefiaram":"tumefia","tumefiarati":"tumefia","tumefiase":"tumefia","tumefiasem":"tumefia","tumefiasera":"tumefia","tumefiaseram":"tumefia","tumefiaserati":"tumefia","tumefiasesi":"tumefia","tumefiasi":"tumefia","tumefiat":"tumefia","tumefiata":["tumefiată","tumefiat","tumefiata","tumefiat"],"tumefiate":"tumefiat","tumefiatele":"tumefiat","tumefiati":["tumefiați","tumefia","tumefiați","tumefiat"],"tumefiatii":"tumefiat","tumefiatul":"tumefiat","tumefiau":"tumefia","tumefiaza":"tumefia","tumefie":"tumefia","tumefiem":"tumefia","tumefierea":"tumefiere","tumefieri":"tumefiere","tumefierii":"tumefiere","tumefierile":"tumefiere","tumefierilor":"tumefiere","tumefii":"tumefia","tumefiind":"tumefia","tumentoasa":["tumentoasă","tumentos","tumentoasa","tumentos"],"tumentoase":"tumentos","tumentoasele":"tumentos","tumentosi":"tumentos","tumentosii":"tumentos","tumentosul":"tumentos","tumescenta":["tumescentă","tumescent","tumescenta","tumescent"],"tumescente":["tumescente","tumescent","tumescențe","tumescență"],"tumescentei":"tumescență","tumescentele":["tumescentele","tumescent","tumescențele","tumescență"],"tumescentelor":"tumescență","tumescenti":"tumescent","tumescentii":"tumescent","tumescentul":"tumescent","tumida":["tumidă","tumid","tumida","tumid"],"tumide":"tumid","tumidele":"tumid","tumidul":"tumid","tumizi":"tumid","tumizii":"tumid","tumoarea":"tumoare","tumorala":["tumorală","tumoral","tumorala","tumoral"],"tumorale":"tumoral","tumoralele":"tumoral","tumorali":"tumoral","tumoralii":"tumoral","tumoralul":"tumoral","tumore":"tumoră","tumorei":"tumoră","tumorele":"tumoră","tumorelor":"tumoră","tumori":"tumoare","tumori cerebrale":"tumoare cerebrală","tumorigeneze":"tumorigeneză","tumorigenezei":"tumorigeneză","tumorigenezele":"tumorigeneză","tumorigenezelor":"tumorigeneză","tumorii":"tumoare","tumorile":"tumoare","tumorilor":"tumoare","tumulara":["tumulară","tumular","tumulara","tumular"],"tumulare":"tumular","tumularele":"tumular","tumulari":"tumular","tumularii":"tumular","tumularul":"tumular","tumuli":"tumul","tumulii":"tumul","tumulilor":"tumul","tumultoasa":["tumultoasă","tumultos","tumultoasa","tumultos"],"tumultoase":"tumultos","tumultoasele":"tumultos","tumultosi":"tumultos","tumultosii":"tumultos","tumultosul":"tumultos","tumultuoasa":["tumultuoasă","tumultuos","tumultuoasa","tumultuos"],"tumultuoase":"tumultuos","tumultuoasele":"tumultuos","tumultuosi":"tumultuos","tumultuosii":"tumultuos","tumultuosul":"tumultuos","tumulturi":"tumult","tumulul":"tumul","tumulule":"tumul","tumulului":"tumul","tumulusi":"tumulus","tumulusii":"tumulus","tumulusilor":"tumulus","tumulusul":"tumulus","tumulusule":"tumulus","tumulusului":"tumulus","tumurugi":"tumurug","tumurugii":"tumurug","tumurugilor":"tumurug","tumurugul":"tumurug","tumurugule":"tumurug","tumurugului":"tumurug","tun":"tuna","tunai":"tuna","tunam":["tunăm","tuna","tunam","tuna"],"tunand":"tuna","tunara":"tuna","tunaram":"tuna","tunarati":"tuna","tunari":"tunar","tunarii":"tunar","tunarilor":"tunar","tunarirea":"tunărire","tunariri":"tunărire","tunaririi":"tunărire","tunaririle":"tunărire","tunaririlor":"tunărire","tunarul":"tunar","tunarule":"tunar","tunarului":"tunar","tunase":"tuna","tunasem":"tuna","tunasera":"tuna","tunaseram":"tuna","tunaserati":"tuna","tunasesi":"tuna","tunasi":"tuna","tunat":"tuna","tunati":"tuna","tunatoare":"tunător","tunatoarea":"tunător","tunatoarele":"tunător","tunatori":"tunător","tunatorii":"tunător","tunatorul":"tunător","tunau":"tuna","tund":"tunde","tunda":"tunde","tundea":"tunde","tundeai":"tunde","tundeam":"tunde","tundeati":"tunde","tundeau":"tunde","tundem":"tunde","tunderea":"tundere","tunderi":"tundere","tunderii":"tundere","tunderile":"tundere","tunderilor":"tundere","tundeti":"tunde","tundre":"tundră","tundrei":"tundră","tundrele":"tundră","tundrelor":"tundră","tundrici":"țundrică","tundricii":"țundrică","tundricile":"țundrică","tundricilor":"țundrică","tundrite":"țundriță","tundritei":"țundriță","tundritele":"țundriță","tundritelor":"țundriță","tune":"tuna","tunelisti":"tunelist","tunelistii":"tunelist","tunelistilor":"tunelist","tunelistul":"tunelist","tunelistule":"tunelist","tunelistului":"tunelist","tunelul":"tunel","tunelule":"tunel","tunelului":"tunel","tuneluri":"tunel","tunelurile":"tunel","tunelurilor":"tunel","tunere":"tuner","tunerele":"tuner","tunerelor":"tuner","tunerul":"tuner","tunerule":"tuner","tunerului":"tuner","tuneslia":"tunesliu","tuneslie":"tunesliu","tuneslii":"tunesliu","tunesliii":"tunesliu","tunesliile":"tunesliu","tunesliul":"tunesliu","tunete":"tunet","tunetele":"tunet","tunetelor":"tunet","tunetul":"tunet","tunetule":"tunet","tunetului":"tunet","tungstenul":"tungsten","tungstenule":"tungsten","tungstenului":"tungsten","tuni":"tuna","tunicata":["tunicată","tunicat","tunicata","tunicat"],"tunicate":"tunicat","tunicatele":"tunicat","tunicati":"tunicat","tunicatii":"tunicat","tunicatul":"tunicat","tunice":"tunică","tunicei":"tunică","tunicele":"tunică","tunicelor":"tunică","tunici":"tunică","tunicine":"tunicină","tunicinei":"tunicină","tunisiana":["tunisiană","tunisian","tunisiana","tunisian"],"tunisianul":"tunisian","tunisiene":["tunisiene","tunisian","tunisiene","tunisiană"],"tunisienei":"tunisiană","tunisienele":["tunisienele","tunisian","tunisienele","tunisiană"],"tunisienelor":"tunisiană","tunisieni":"tunisian","tunisienii":"tunisian","tuns":"tunde","tunsa":["tunsă","tuns","tunsa","tuns"],"tunse":["tunse","tunde","tunse","tuns"],"tunsei":"tunde","tunsele":"tuns","tunsera":"tunde","tunseram":"tunde","tunserati":"tunde","tunsese":"tunde","tunsesem":"tunde","tunsesera":"tunde","tunseseram":"tunde","tunseserati":"tunde","tunsesesi":"tunde","tunsesi":"tunde","tunsi":"tuns","tunsii":"tuns","tunsori":"tunsoare","tunsul":"tuns","tunsule":"tuns","tunsului":"tuns","tunsuri":["tunsuri","tuns","tunsuri","tunsură"],"tunsurile":"tuns","tunsurilor":"tuns","tunul":"tun","tunule":"tun","tunulete":"tunuleț","tunuletele":"tunuleț","tunuletelor":"tunuleț","tunuletul":"tunuleț","tunuletule":"tunuleț","tunuletului":"tunuleț","tunului":"tun","tunuri":"tun","tunurile":"tun","tunurilor":"tun","tunzand":"tunde","tunzi":"tunde","tupaia":"țupăi","tupaiai":"țupăi","tupaiam":"țupăi","tupaiati":"țupăi","tupaiau":"țupăi","tupaie":"țupăi","tupaii":"țupăi","tupaim":"țupăi","tupaind":"țupăi","tupaira":"țupăi","tupairam":"țupăi","tupairati":"țupăi","tupaise":"țupăi","tupaisem":"țupăi","tupaisera":"țupăi","tupaiseram":"țupăi","tupaiserati":"țupăi","tupaisesi":"țupăi","tupaisi":"țupăi","tupait":"țupăi","tupaiti":"țupăi","tupeul":"tupeu","tupeule":"tupeu","tupeului":"tupeu","tupeuri":"tupeu","tupeurile":"tupeu","tupeurilor":"tupeu","tupilai":"tupila","tupilam":["tupilăm","tupila","tupilam","tupila"],"tupiland":"tupila","tupilara":"tupila","tupilaram":"tupila","tupilarati":"tupila","tupilarea":"tupilare","tupilari":"tupilare","tupilarii":"tupilare","tupilarile":"tupilare","tupilarilor":"tupilare","tupilase":"tupila","tupilasem":"tupila","tupilasera":"tupila","tupilaseram":"tupila","tupilaserati":"tupila","tupilasesi":"tupila","tupilasi":"tupila","tupilat":"tupila","tupilati":"tupila","tupilau":"tupila","tupileaza":"tupila","tupilez":"tupila","tupilezi":"tupila","tupilita":["tupilită","tupilit","tupilita","tupilit"],"tupilite":"tupilit","tupilitele":"tupilit","tupiliti":"tupilit","tupilitii":"tupilit","tupilitul":"tupilit","tur n tur":"tur","turana":["turană","turan","turana","turan"],"turane":["turane","turan","turane","turană"],"turanei":"turană","turanele":["turanele","turan","turanele","turană"],"turanelor":"turană","turani":"turan","turanianul":"turanian","turanianule":"turanian","turanianului":"turanian","turanica":["turanică","turanic","turanica","turanic"],"turanice":"turanic","turanicele":"turanic","turanici":"turanic","turanicii":"turanic","turanicul":"turanic","turanieni":"turanian","turanienii":"turanian","turanienilor":"turanian","turanii":"turan","turanilor":"turan","turanitul":"turanit","turanitule":"turanit","turanitului":"turanit","turanul":"turan","turanule":"turan","turanului":"turan","turatia":"turație","turatiei":"turație","turatii":"turație","turatiile":"turație","turatiilor":"turație","turbaciuni":"turbăciune","turbai":"turba","turbam":["turbăm","turba","turbam","turba"],"turband":"turba","turbane":"turban","turbanele":"turban","turbanelor":"turban","turbanul":"turban","turbanule":"turban","turbanului":"turban","turbara":"turba","turbaram":"turba","turbarati":"turba","turbari":"turbare","turbaria":"turbărie","turbariei":"turbărie","turbarii":"turbărie","turbariile":"turbărie","turbariilor":"turbărie","turbase":"turba","turbasem":"turba","turbasera":"turba","turbaseram":"turba","turbaserati":"turba","turbasesi":"turba","turbasi":"turba","turbat":"turba","turbata":["turbată","turbat","turbata","turbat"],"turbate":"turbat","turbatele":"turbat","turbati":["turbați","turba","turbați","turbat"],"turbatii":"turbat","turbatul":"turbat","turbau":"turba","turbe":"turbă","turbeaza":"turba","turbei":"turbă","turbele":"turbă","turbelor":"turbă","turbez":"turba","turbeze":"turba","turbezi":"turba","turbidimetre":"turbidimetru","turbidimetrele":"turbidimetru","turbidimetrelor":"turbidimetru","turbidimetria":"turbidimetrie","turbidimetrica":["turbidimetrică","turbidimetric","turbidimetrica","turbidimetric"],"turbidimetrice":"turbidimetric","turbidimetricele":"turbidimetric","turbidimetrici":"turbidimetric","turbidimetricii":"turbidimetric","turbidimetricul":"turbidimetric","turbidimetriei":"turbidimetrie","turbidimetrii":"turbidimetrie","turbidimetriile":"turbidimetrie","turbidimetriilor":"turbidimetrie","turbidimetrul":"turbidimetru","turbidimetrule":"turbidimetru","turbidimetrului":"turbidimetru","turbiditatea":"turbiditate","turbiditati":"turbiditate","turbiditatii":"turbiditate","turbinci":"turbincă","turbincii":"turbincă","turbincile":"turbincă","turbincilor":"turbincă","turbine":"turbină","turbine eoliane":"turbină eoliană","turbinectomia":"turbinectomie","turbinectomiei":"turbinectomie","turbinectomii":"turbinectomie","turbinectomiile":"turbinectomie","turbinectomiilor":"turbinectomie","turbioane":"turbion","turbioanele":"turbion","turbioanelor":"turbion","turbionara":["turbionară","turbionar","turbionara","turbionar"],"turbionare":"turbionar","turbionarele":"turbionar","turbionari":"turbionar","turbionarii":"turbionar","turbionarul":"turbionar","turbionul":"turbion","turbionule":"turbion","turbionului":"turbion","turboalternatoare":"turboalternator","turboalternatoarele":"turboalternator","turboalternatoarelor":"turboalternator","turboalternatorul":"turboalternator","turboalternatorule":"turboalternator","turboalternatorului":"turboalternator","turboasa":["turboasă","turbos","turboasa","turbos"],"turboase":"turbos","turboasele":"turbos","turbocompresoare":"turbocompresor","turbocompresoarele":"turbocompresor","turbocompresoarelor":"turbocompresor","turbocompresorul":"turbocompresor","turbocompresorule":"turbocompresor"};
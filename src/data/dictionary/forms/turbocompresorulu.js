@@ -0,0 +1 @@
+export default {"turbocompresorului":"turbocompresor","turbogeneratoare":"turbogenerator","turbogeneratoarele":"turbogenerator","turbogeneratoarelor":"turbogenerator","turbogeneratorul":"turbogenerator","turbogeneratorule":"turbogenerator","turbogeneratorului":"turbogenerator","turbopompe":"turbopompă","turbopompei":"turbopompă","turbopompele":"turbopompă","turbopompelor":"turbopompă","turbopropulsoare":"turbopropulsor","turbopropulsoarele":"turbopropulsor","turbopropulsoarelor":"turbopropulsor","turbopropulsorul":"turbopropulsor","turbopropulsorule":"turbopropulsor","turbopropulsorului":"turbopropulsor","turboreactoare":"turboreactor","turboreactoarele":"turboreactor","turboreactoarelor":"turboreactor","turboreactorul":"turboreactor","turboreactorule":"turboreactor","turboreactorului":"turboreactor","turbosi":"turbos","turbosii":"turbos","turbosuflante":"turbosuflantă","turbosuflantei":"turbosuflantă","turbosuflantele":"turbosuflantă","turbosuflantelor":"turbosuflantă","turbosul":"turbos","turbotrenul":"turbotren","turbotrenule":"turbotren","turbotrenului":"turbotren","turbotrenuri":"turbotren","turbotrenurile":"turbotren","turbotrenurilor":"turbotren","turboventilatoare":"turboventilator","turboventilatoarele":"turboventilator","turboventilatoarelor":"turboventilator","turboventilatorul":"turboventilator","turboventilatorule":"turboventilator","turboventilatorului":"turboventilator","turbulenta":["turbulentă","turbulent","turbulenta","turbulent"],"turbulente":["turbulente","turbulent","turbulențe","turbulență"],"turbulentei":"turbulență","turbulentele":["turbulentele","turbulent","turbulențele","turbulență"],"turbulentelor":"turbulență","turbulenti":"turbulent","turbulentii":"turbulent","turbulentul":"turbulent","turbur":"turbura","turbura":"tulbura","turburai":"turbura","turburam":["turburăm","turbura","turburam","turbura"],"turburand":"turbura","turburara":"turbura","turburaram":"turbura","turburarati":"turbura","turburarea":"turburare","turburari":["turburări","turburare","turburari","turburare"],"turburarii":"turburare","turburarile":"turburare","turburarilor":"turburare","turburase":"turbura","turburasem":"turbura","turburasera":"turbura","turburaseram":"turbura","turburaserati":"turbura","turburasesi":"turbura","turburasi":"turbura","turburat":"turbura","turburata":["turburată","turburat","turburata","turburat"],"turburate":"turburat","turburatele":"turburat","turburati":["turburați","turbura","turburați","turburat"],"turburatii":"turburat","turburatoare":"turburător","turburatoarea":"turburător","turburatoarele":"turburător","turburatori":"turburător","turburatorii":"turburător","turburatorul":"turburător","turburatul":"turburat","turburau":"turbura","turbure":"tulbure","turbureaua":"turburea","turburele":["turburele","turburea","turburele","turbureală","turburele","turburel"],"turburelei":["turburelei","turburea","turburelei","turbureală"],"turburelele":["turburelele","turbureală","turburelele","turburel"],"turburelelor":["turburelelor","turbureală","turburelelor","turburel"],"turbureli":"turbureală","turburelul":"turburel","turburelule":"turburel","turburelului":"turburel","turburi":"turbura","turburia":"turburiu","turburie":"turburiu","turburii":"turburiu","turburiii":"turburiu","turburiile":"turburiu","turburiul":"turburiu","turburoasa":["turburoasă","turburos","turburoasa","turburos"],"turburoase":"turburos","turburoasele":"turburos","turburosi":"turburos","turburosii":"turburos","turburosul":"turburos","turca":["turcă","turc","turca","turc"],"turcalet":"turculeț","turcalete":"turcaleț","turcaletele":"turcaleț","turcaletelor":"turcaleț","turcaletul":"turcaleț","turcaletule":"turcaleț","turcaletului":"turcaleț","turcance":"țurcancă","turcancei":"țurcancă","turcancele":"țurcancă","turcancelor":"țurcancă","turcani":"țurcan","turcanii":"țurcan","turcanilor":"țurcan","turcanul":"țurcan","turcanule":"țurcan","turcanului":"țurcan","turce":"turc","turcea":"turci","turceagul":"turceag","turceagule":"turceag","turceagului":"turceag","turceai":"turci","turceam":"turci","turceasca":["turcească","turcesc","turceasca","turcesc"],"turceati":"turci","turceau":"turci","turcele":"turc","turcesc":"turci","turcescul":"turcesc","turceste":"turci","turcesti":["turcești","turcesc","turcești","turci"],"turcestii":"turcesc","turcestile":"turcesc","turchina":["turchină","turchin","turchina","turchin"],"turchine":"turchin","turchinele":"turchin","turchini":"turchin","turchinii":"turchin","turchinul":"turchin","turci":["turci","turc","turci","turcă"],"turcica":["turcică","turcic","turcica","turcic"],"turcice":"turcic","turcicele":"turcic","turcici":"turcic","turcicii":"turcic","turcicul":"turcic","turcie":"Turcia","turciei":"Turcia","turcii":["turcii","turc","turcii","turci","turcii","Turcia"],"turcilor":"turc","turcim":"turci","turcimea":"turcime","turcimi":"turcime","turcimii":"turcime","turcind":"turci","turcira":"turci","turciram":"turci","turcirati":"turci","turcirea":"turcire","turciri":"turcire","turcirii":"turcire","turcirile":"turcire","turcirilor":"turcire","turcise":"turci","turcisem":"turci","turcisera":"turci","turciseram":"turci","turciserati":"turci","turcisesi":"turci","turcisi":"turci","turcisme":"turcism","turcismele":"turcism","turcismelor":"turcism","turcismul":"turcism","turcismule":"turcism","turcismului":"turcism","turcit":"turci","turcita":["turcită","turcit","turcita","turcit"],"turcite":"turcit","turcitele":"turcit","turciti":["turciți","turci","turciți","turcit"],"turcitii":"turcit","turcitul":"turcit","turcoaice":"turcoaică","turcoaicei":"turcoaică","turcoaicele":"turcoaică","turcoaicelor":"turcoaică","turcoaiea":"turcoaie","turcoaiei":"turcoaie","turcoaiele":"turcoaie","turcoaielor":"turcoaie","turcoaza":["turcoază","turcoaz","turcoaza","turcoaz"],"turcoaze":["turcoaze","turcoaz","turcoaze","turcoază"],"turcoazei":"turcoază","turcoazele":["turcoazele","turcoaz","turcoazele","turcoază"],"turcoazelor":"turcoază","turcoazi":"turcoaz","turcoazii":"turcoaz","turcoazul":"turcoaz","turcofile":"turcofilă","turcofilei":"turcofilă","turcofilele":"turcofilă","turcofilelor":"turcofilă","turcofili":"turcofil","turcofilia":"turcofilie","turcofiliei":"turcofilie","turcofilii":["turcofilii","turcofil","turcofilii","turcofilie"],"turcofiliile":"turcofilie","turcofiliilor":"turcofilie","turcofililor":"turcofil","turcofilul":"turcofil","turcofilule":"turcofil","turcofilului":"turcofil","turcofobi":"turcofob","turcofobia":"turcofobie","turcofobiei":"turcofobie","turcofobii":["turcofobii","turcofob","turcofobii","turcofobie"],"turcofobiile":"turcofobie","turcofobiilor":"turcofobie","turcofobilor":"turcofob","turcofobul":"turcofob","turcofobule":"turcofob","turcofobului":"turcofob","turcoiul":"turcoi","turcoiule":"turcoi","turcoiului":"turcoi","turcologi":"turcolog","turcologia":"turcologie","turcologiei":"turcologie","turcologii":["turcologii","turcolog","turcologii","turcologie"],"turcologilor":"turcolog","turcologul":"turcolog","turcologule":"turcolog","turcologului":"turcolog","turcomani":"turcoman","turcomanii":"turcoman","turcomanilor":"turcoman","turcomanul":"turcoman","turcomanule":"turcoman","turcomanului":"turcoman","turcomerita":["turcomerită","turcomerit","turcomerita","turcomerit"],"turcomerite":"turcomerit","turcomeritele":"turcomerit","turcomeriti":"turcomerit","turcomeritii":"turcomerit","turcomeritul":"turcomerit","turcul":"turc","turcule":"turc","turculeanul":"turculean","turculeanule":"turculean","turculeanului":"turculean","turculeni":"turculean","turculenii":"turculean","turculenilor":"turculean","turculet":"turcaleț","turculeti":"turculeț","turculetii":"turculeț","turculetilor":"turculeț","turculetul":"turculeț","turculetule":"turculeț","turculetului":"turculeț","turcului":"turc","turcuti":"turcuț","turcutii":"turcuț","turcutilor":"turcuț","turcutul":"turcuț","turcutule":"turcuț","turcutului":"turcuț","turde":"Turda","turdeana":["turdeană","turdean","turdeana","turdean"],"turdeanul":"turdean","turdeanule":"turdean","turdeanului":"turdean","turdei":"Turda","turdence":"turdeancă","turdencei":"turdeancă","turdencele":"turdeancă","turdencelor":"turdeancă","turdene":"turdean","turdenele":"turdean","turdeni":"turdean","turdenii":"turdean","turdenilor":"turdean","ture":"tură","tureac":"tureatcă","tureacul":"tureac","tureacule":"tureac","tureacului":"tureac","turece":"tureac","turecele":"tureac","turecelor":"tureac","turei":"tură","turele":["turele","tură","turele","turelă"],"turelei":"turelă","turelele":"turelă","turelelor":"turelă","turelor":"tură","turetci":"tureatcă","turetcii":"tureatcă","turetcile":"tureatcă","turetcilor":"tureatcă","turfisti":"turfist","turfistii":"turfist","turfistilor":"turfist","turfistul":"turfist","turfistule":"turfist","turfistului":"turfist","turful":"turf","turfule":"turf","turfului":"turf","turfuri":"turf","turfurile":"turf","turfurilor":"turf","turgescenta":["turgescentă","turgescent","turgescenta","turgescent"],"turgescente":["turgescente","turgescent","turgescențe","turgescență"],"turgescentei":"turgescență","turgescentele":"turgescent","turgescenti":"turgescent","turgescentii":"turgescent","turgescentul":"turgescent","turicei":"turicel","turiceii":"turicel","turiceilor":"turicel","turicelul":"turicel","turicelule":"turicel","turicelului":"turicel","turingianul":"turingian","turingianule":"turingian","turingianului":"turingian","turingieni":"turingian","turingienile":"turingian","turingienilor":"turingian","turingitul":"turingit","turingitule":"turingit","turingitului":"turingit","turisme":"turism","turismele":"turism","turismelor":"turism","turismul":"turism","turismule":"turism","turismului":"turism","turiste":"turistă","turistei":"turistă","turistele":"turistă","turistelor":"turistă","turisti":"turist","turistica":["turistică","turistic","turistica","turistic"],"turistice":"turistic","turisticele":"turistic","turistici":"turistic","turisticii":"turistic","turisticul":"turistic","turistii":"turist","turistilor":"turist","turistul":"turist","turistule":"turist","turistului":"turist","turite":"turiță","turite mari":"turiță mare","turitei":"turiță","turitele":"turiță","turitelor":"turiță","turkmena":["turkmenă","turkmen","turkmena","turkmen"],"turkmene":["turkmene","turkmen","turkmene","turkmenă"],"turkmenei":"turkmenă","turkmenele":["turkmenele","turkmen","turkmenele","turkmenă"],"turkmenelor":"turkmenă","turkmeni":"turkmen","turkmenii":"turkmen","turkmenul":"turkmen","turlacea":"turlăci","turlaceai":"turlăci","turlaceam":"turlăci","turlaceati":"turlăci","turlaceau":"turlăci","turlacele":"turlăceală","turlacelei":"turlăceală","turlacelele":"turlăceală","turlacelelor":"turlăceală","turlaceli":"turlăceală","turlacesc":"turlăci","turlaceste":"turlăci","turlacesti":"turlăci","turlacii":"turlăci","turlacim":"turlăci","turlacind":"turlăci","turlacira":"turlăci","turlaciram":"turlăci","turlacirati":"turlăci","turlacise":"turlăci","turlacisem":"turlăci","turlacisera":"turlăci","turlaciseram":"turlăci","turlaciserati":"turlăci","turlacisesi":"turlăci","turlacisi":"turlăci","turlacit":"turlăci","turlaciti":"turlăci","turle":"turlă","turlei":"turlă","turlele":"turlă","turlelor":"turlă","turlisoaraul":"turlișoară","turlisoaraule":"turlișoară","turlisoaraului":"turlișoară","turlisoare":"turlișoară","turlisoarele":"turlișoară","turlisoarelor":"turlișoară","turlisti":"turlist","turlistii":"turlist","turlistilor":"turlist","turlistul":"turlist","turlistule":"turlist","turlistului":"turlist","turluce":"turluc","turlucele":"turluc","turlucelor":"turluc","turlucul":"turluc","turlucule":"turluc","turlucului":"turluc","turluitul":"țurluit","turluitule":"țurluit","turluitului":"țurluit","turluituri":"țurluit","turluiturile":"țurluit","turluiturilor":"țurluit","turlulite":"turluliță","turlulitei":"turluliță","turlulitele":"turluliță","turlulitelor":"turluliță","turmace":"turmacă","turmacei":"turmacă","turmacele":"turmacă","turmacelor":"turmacă","turmaline":"turmalină","turmalinei":"turmalină","turmalinele":"turmalină","turmalinelor":"turmalină","turmari":"turmar","turmarii":"turmar","turmarilor":"turmar","turmarul":"turmar","turmarule":"turmar","turmarului":"turmar","turme":"turmă","turmei":"turmă","turmele":"turmă","turmelor":"turmă","turmentai":"turmenta","turmentam":["turmentăm","turmenta","turmentam","turmenta"],"turmentand":"turmenta","turmentara":"turmenta","turmentaram":"turmenta","turmentarati":"turmenta","turmentarea":"turmentare","turmentari":"turmentare","turmentarii":"turmentare","turmentarile":"turmentare","turmentarilor":"turmentare","turmentase":"turmenta","turmentasem":"turmenta","turmentasera":"turmenta","turmentaseram":"turmenta","turmentaserati":"turmenta","turmentasesi":"turmenta","turmentasi":"turmenta","turmentat":"turmenta","turmentata":["turmentată","turmentat","turmentata","turmentat"],"turmentate":"turmentat","turmentatele":"turmentat","turmentati":["turmentați","turmenta","turmentați","turmentat"],"turmentatii":"turmentat","turmentatul":"turmentat","turmentau":"turmenta","turmente":"turment","turmenteaza":"turmenta","turmentele":"turment","turmentelor":"turment","turmentez":"turmenta","turmentezi":"turmenta","turmentul":"turment","turmentule":"turment","turmentului":"turment","turmite":"turmiță","turmitei":"turmiță","turmitele":"turmiță","turmitelor":"turmiță","turmulite":"turmuliță","turmulitei":"turmuliță","turmulitele":"turmuliță","turmulitelor":"turmuliță","turmusoare":"turmușoară","turmusoarei":"turmușoară","turmusoarele":"turmușoară","turmusoarelor":"turmușoară","turmute":"turmuță","turmutei":"turmuță","turmutele":"turmuță","turmutelor":"turmuță","turnai":"turna","turnam":["turnăm","turna","turnam","turna"],"turnan":"turnant","turnand":"turna","turnante":"turnantă","turnantei":"turnantă","turnantele":"turnantă","turnantelor":"turnantă","turnanti":"turnant","turnantii":"turnant","turnantile":"turnant","turnantilor":"turnant","turnara":"turna","turnaram":"turna","turnarati":"turna","turnarea":"turnare","turnari":"turnare","turnarii":"turnare","turnarile":"turnare","turnarilor":"turnare","turnase":"turna","turnasem":"turna","turnasera":"turna","turnaseram":"turna","turnaserati":"turna","turnasesi":"turna","turnasi":"turna","turnat":"turna","turnat ulei pe foc":"turna ulei pe foc","turnati":"turna","turnatoarea":"turnătoare","turnatoarei":"turnătoare","turnatoarele":"turnătoare","turnatoarelor":"turnătoare","turnatori":"turnător","turnatoria":"turnătorie","turnatoriei":"turnătorie","turnatorii":["turnătorii","turnător","turnătorii","turnătorie"],"turnatoriile":"turnătorie","turnatoriilor":"turnătorie","turnatorilor":"turnător","turnatorul":"turnător","turnatorule":"turnător","turnatorului":"turnător","turnatul":"turnat","turnatule":"turnat","turnatului":"turnat","turnau":"turna","turneanul":"turnean","turneanule":"turnean","turneanului":"turnean","turneaza":"turna","turnee":"turneu","turneele":"turneu","turneelor":"turneu","turnence":"turneancă","turnencei":"turneancă","turnencele":"turneancă","turnencelor":"turneancă","turneni":"turnean","turnenii":"turnean","turnenilor":"turnean","turnesolul":"turnesol","turnesolule":"turnesol","turnesolului":"turnesol","turneul":"turneu","turneule":"turneu","turneului":"turneu","turnez":"turna","turnezi":"turna","turnichete":"turnichet","turnichetele":"turnichet","turnichetelor":"turnichet","turnichetul":"turnichet","turnichetule":"turnichet","turnichetului":"turnichet","turnirul":"turnir","turnirule":"turnir","turnirului":"turnir","turniruri":"turnir","turnirurile":"turnir","turnirurilor":"turnir","turnisoare":"turnișor","turnisore":"turnișor","turnisorele":"turnișor","turnisorelor":"turnișor","turnisorul":"turnișor","turnisorule":"turnișor","turnisorului":"turnișor","turniuri":"turniură","turniurii":"turniură","turniurile":"turniură","turniurilor":"turniură","turnul":"turn","turnule":"turn","turnulete":"turnuleț","turnuletele":"turnuleț","turnuletelor":"turnuleț","turnuletul":"turnuleț","turnuletule":"turnuleț","turnuletului":"turnuleț","turnului":"turn","turnuri":["turnuri","turn","turnuri","turnură"],"turnuri cu ceas":"turn cu ceas","turnuri de apa":"turn de apă","turnuri de control":"turn de control","turnuri de racire":"turn de răcire","turnuri de sonda":"turn de sondă","turnurii":"turnură","turnurile":["turnurile","turn","turnurile","turnură"],"turnurilor":["turnurilor","turn","turnurilor","turnură"],"turnusoare":"turnușor","turnusoarele":"turnușor","turnusoarelor":"turnușor","turnusorul":"turnușor","turnusorule":"turnușor","turnusorului":"turnușor","turnute":"turnuț","turnutele":"turnuț","turnutelor":"turnuț","turnutul":"turnuț","turnutule":"turnuț","turnutului":"turnuț","turometre":"turometru","turoniana":["turoniană","turonian","turoniana","turonian"],"turonianul":"turonian","turonianule":"turonian","turonianului":"turonian","turoniene":"turonian","turonienele":"turonian","turonieni":"turonian","turonienii":"turonian","turonienile":"turonian","turonienilor":"turonian","turpitudinea":"turpitudine","turpitudini":"turpitudine","turpitudinii":"turpitudine","turpitudinile":"turpitudine","turpitudinilor":"turpitudine","turte":"turtă","turtea":"turti","turteai":"turti","turteam":"turti","turteati":"turti","turteau":"turti","turteaua":"turtea","turtei":"turtă","turtele":["turtele","turtă","turtele","turtea"],"turtelei":"turtea","turtelele":"turtea","turtelelor":"turtea","turtelor":"turtă","turtesc":"turti","turteste":"turti","turtesti":"turti","turticele":"turticică","turticelei":"turticică","turticelele":"turticică","turticelelor":"turticică","turtii":"turti","turtim":"turti","turtind":"turti","turtira":"turti","turtiram":"turti","turtirati":"turti","turtirea":"turtire","turtiri":"turtire","turtirii":"turtire","turtirile":"turtire","turtirilor":"turtire","turtise":"turti","turtisem":"turti","turtisera":"turti","turtiseram":"turti","turtiserati":"turti","turtisesi":"turti","turtisi":"turti","turtisoare":"turtișoară","turtisoarei":"turtișoară","turtisoarele":"turtișoară","turtisoarelor":"turtișoară","turtit":"turti","turtita":["turtită","turtit","turtita","turtit"],"turtite":["turtite","turtit","turtițe","turtiță"],"turtitei":"turtiță","turtitele":["turtitele","turtit","turtițele","turtiță"],"turtitelor":"turtiță","turtiti":["turtiți","turti","turtiți","turtit"],"turtitii":"turtit","turtitul":"turtit","turtoaie":"turtoi","turtoaiele":"turtoi","turtoaielor":"turtoi","turtoiul":"turtoi","turtoiule":"turtoi","turtoiului":"turtoi","turture":"turtură","turtureaua":"turturea","turturei":["turturei","turtură","țurțurei","țurțurel"],"turtureii":"țurțurel","turtureilor":"țurțurel","turturele":["turturele","turtură","turturele","turturea","turturele","turturică"],"turturelei":["turturelei","turturea","turturelei","turturică"],"turturelele":["turturelele","turturea","turturelele","turturică"],"turturelelor":["turturelelor","turturea","turturelelor","turturică"],"turtureli":"turturel","turturellor":"turturel","turturelor":"turtură","turturelul":["turturelul","turturel","țurțurelul","țurțurel"],"turturelule":["turturelule","turturel","țurțurelule","țurțurel"],"turturelului":["turturelului","turturel","țurțurelului","țurțurel"],"turtureluse":"turturelușă","turturelusei":"turturelușă","turturelusele":"turturelușă","turtureluselor":"turturelușă","turturelute":"turtureluță","turturelutei":"turtureluță","turturelutele":"turtureluță","turturelutelor":"turtureluță","turtureul":"țurțure","turtureule":"țurțure","turtureului":"țurțure","turturi":["țurțuri","țurțur","țurțuri","țurțure"],"turturica":"turturea","turturici roscate":"turturică roșcată","turturii":["țurțurii","țurțur","țurțurii","țurțure"],"turturilor":["țurțurilor","țurțur","țurțurilor","țurțure"],"turturite":"turturiță","turturitei":"turturiță","turturitele":"turturiță","turturitelor":"turturiță","turturul":"țurțur","turturule":"țurțur","turturului":"țurțur","turturute":"turturuță","turturutei":"turturuță","turturutele":"turturuță","turturutelor":"turturuță","turuia":"turui","turuiai":"turui","turuiam":"turui","turuiati":"turui","turuiau":"turui","turuie":"turui","turuiele":"turuială","turuielei":"turuială","turuielele":"turuială","turuielelor":"turuială","turuieli":"turuială","turuii":"turui","turuim":"turui","turuind":"turui","turuira":"turui","turuiram":"turui","turuirati":"turui","turuise":"turui","turuisem":"turui","turuisera":"turui","turuiseram":"turui","turuiserati":"turui","turuisesi":"turui","turuisi":"turui","turuit":"turui","turuiti":"turui","turul":"tur","turule":"tur","turului":"tur","turungia":"turungiu","turungie":"turungiu","turungii":"turungiu","turungiii":"turungiu","turungiile":"turungiu","turungiul":"turungiu","tururi":"tur","tururi de forta":"tur de forță","tururile":"tur","tururilor":"tur","turvenele":"turveneală","turvenelei":"turveneală","turvenelele":"turveneală","turvenelelor":"turveneală","tusai":"tușa","tusam":["tușăm","tușa","tușam","tușa"],"tusand":"tușa","tusara":"tușa","tusaram":"tușa","tusarati":"tușa","tusarea":"tușare","tusari":"tușare","tusarii":"tușare","tusarile":"tușare","tusarilor":"tușare","tusase":"tușa","tusasem":"tușa","tusasera":"tușa","tusaseram":"tușa","tusaserati":"tușa","tusasesi":"tușa","tusasi":"tușa","tusat":"tușa","tusata":["tușată","tușat","tușata","tușat"],"tusate":"tușat","tusatele":"tușat","tusati":["tușați","tușa","tușați","tușat"],"tusatii":"tușat","tusatul":"tușat","tusau":"tușa","tuscovi":"țușcov","tuscovii":"țușcov","tuscovilor":"țușcov","tuscovul":"țușcov","tuscovule":"țușcov","tuscovului":"țușcov","tuse":"tușă","tusea":["tusea","tuse","tușea","tuși"],"tuseai":"tuși","tuseam":"tuși","tuseati":"tuși","tuseau":"tuși","tuseaza":"tușa","tusei":["tușei","tușă","tusei","tuse"],"tusele":"tușă","tuselor":"tușă","tusesc":"tuși","tuseste":"tuși","tusesti":"tuși","tusete":"tuset","tusetele":"tuset","tusetelor":"tuset","tusetul":"tuset","tusetule":"tuset","tusetului":"tuset","tuseul":"tușeu","tuseule":"tușeu","tuseului":"tușeu","tuseuri":"tușeu","tuseurile":"tușeu","tuseurilor":"tușeu","tusez":"tușa","tusezi":"tușa","tusici":"tușică","tusicii":"tușică","tusicile":"tușică","tusicilor":"tușică","tusiere":"tușieră","tusierei":"tușieră","tusierele":"tușieră","tusierelor":"tușieră","tusieri":"tușier","tusierii":"tușier","tusierilor":"tușier","tusierul":"tușier","tusierule":"tușier","tusierului":"tușier","tusigena":["tusigenă","tusigen","tusigena","tusigen"],"tusigene":"tusigen","tusigenele":"tusigen","tusigeni":"tusigen","tusigenii":"tusigen","tusigenul":"tusigen","tusii":"tuși","tusim":"tuși","tusinai":"tușina","tusinam":["tușinăm","tușina","tușinam","tușina"],"tusinand":"tușina","tusinara":"tușina","tusinaram":"tușina","tusinarati":"tușina","tusinase":"tușina","tusinasem":"tușina","tusinasera":"tușina","tusinaseram":"tușina","tusinaserati":"tușina","tusinasesi":"tușina","tusinasi":"tușina","tusinat":"tușina","tusinati":"tușina","tusinaturi":"tușinătură","tusinaturii":"tușinătură","tusinaturile":"tușinătură","tusinaturilor":"tușinătură","tusinau":"tușina","tusind":"tuși","tusineaza":"tușina","tusinez":"tușina","tusinezi":"tușina","tusira":"tuși","tusiram":"tuși","tusirati":"tuși","tusirea":"tușire","tusiri":"tușire","tusirii":"tușire","tusirile":"tușire","tusirilor":"tușire","tusise":"tuși","tusisem":"tuși","tusisera":"tuși","tusiseram":"tuși","tusiserati":"tuși","tusisesi":"tuși","tusisi":"tuși","tusit":"tuși","tusiti":"tuși","tusitul":"tușit","tusitule":"tușit","tusitului":"tușit","tusiture":"tușitură","tusiturei":"tușitură","tusiturele":"tușitură","tusiturelor":"tușitură","tusituri":"tușitură","tuslamale":"tuslama","tuslamalei":"tuslama","tuslamalele":"tuslama","tuslamalelor":"tuslama","tuslamaua":"tuslama","tusorul":"tusor","tusorule":"tusor","tusorului":"tusor","tuste":"țușcă","tustei":"țușcă","tustele":"țușcă","tustelor":"țușcă","tusti":"țușcă","tusul":"tuș","tusule":"tuș","tusului":"tuș","tusuri":"tuș","tusurile":"tuș","tusurilor":"tuș","tutale":"țuțăl","tutalei":"țuțăl","tutalelor":"țuțăl","tutalul":"țuțăl","tutalule":"țuțăl","tutalului":"țuțăl","tutanesti":"țuțăneasca","tutanestii":"țuțăneasca","tutcheaua":"tutchea","tutchele":"tutchea","tutchelei":"tutchea","tutchelele":"tutchea","tutchelelor":"tutchea","tute":"tută","tutei":"tută","tutelai":"tutela","tutelaje":"tutelaj","tutelajele":"tutelaj","tutelajelor":"tutelaj","tutelajul":"tutelaj","tutelajule":"tutelaj","tutelajului":"tutelaj","tutelam":["tutelăm","tutela","tutelam","tutela"],"tuteland":"tutela","tutelara":["tutelară","tutela","tutelară","tutelar","tutelara","tutelar"],"tutelaram":"tutela","tutelarati":"tutela","tutelare":"tutelar","tutelarea":"tutelare","tutelarele":"tutelar","tutelari":["tutelari","tutelar","tutelări","tutelare"],"tutelarii":["tutelarii","tutelar","tutelării","tutelare"],"tutelarul":"tutelar","tutelase":"tutela","tutelasem":"tutela","tutelasera":"tutela","tutelaseram":"tutela","tutelaserati":"tutela","tutelasesi":"tutela","tutelasi":"tutela","tutelat":"tutela","tutelati":"tutela","tutelau":"tutela","tutelcute":"tutelcuță","tutelcutei":"tutelcuță","tutelcutele":"tutelcuță","tutelcutelor":"tutelcuță","tutele":["tutele","tută","tutele","tutelă"],"tuteleaza":"tutela","tutelei":"tutelă","tutelele":"tutelă","tutelelor":"tutelă","tutelez":"tutela","tutelezi":"tutela","tutelor":"tută","tutorai":"tutora","tutoraje":"tutoraj","tutorajele":"tutoraj","tutorajelor":"tutoraj","tutorajul":"tutoraj","tutorajule":"tutoraj","tutorajului":"tutoraj","tutoram":["tutorăm","tutora","tutoram","tutora"],"tutorand":"tutora","tutorara":"tutora","tutoraram":"tutora","tutorarati":"tutora","tutorase":"tutora","tutorasem":"tutora","tutorasera":"tutora","tutoraseram":"tutora","tutoraserati":"tutora","tutorasesi":"tutora","tutorasi":"tutora","tutorat":"tutora","tutorati":"tutora","tutorau":"tutora","tutoreaza":"tutora","tutoreul":"tutore","tutoreule":"tutore","tutoreului":"tutore","tutorez":"tutora","tutorezi":"tutora","tutori":"tutore","tutoria":"tutorie","tutoriei":"tutorie","tutorii":["tutorii","tutore","tutorii","tutorie"],"tutoriile":"tutorie","tutoriilor":"tutorie","tutorilor":"tutore","tutui":"țuțuia","tutuia":"tutui","tutuiai":["tutuiai","tutui","țuțuiai","țuțuia"],"tutuiam":["tutuiam","tutui","țuțuiam","țuțuia"],"tutuiara":"țuțuia","tutuiaram":"țuțuia","tutuiarati":"țuțuia","tutuiase":"țuțuia","tutuiasem":"țuțuia","tutuiasera":"țuțuia","tutuiaseram":"țuțuia","tutuiaserati":"țuțuia","tutuiasesi":"țuțuia","tutuiasi":"țuțuia","tutuiat":"țuțuia","tutuiati":["tutuiați","tutui","țuțuiați","țuțuia"],"tutuiau":["tutuiau","tutui","țuțuiau","țuțuia"],"tutuie":"țuțuia","tutuieli":"tutuială","tutuielii":"tutuială","tutuielile":"tutuială","tutuielilor":"tutuială","tutuiem":"țuțuia","tutuience":"țuțuiancă","tutuiencei":"țuțuiancă","tutuiencele":"țuțuiancă","tutuiencelor":"țuțuiancă","tutuiesc":"tutui","tutuieste":"tutui","tutuiesti":"tutui","tutuii":"tutui","tutuim":"tutui","tutuind":["tutuind","tutui","țuțuind","țuțuia"],"tutuira":"tutui","tutuiram":"tutui","tutuirati":"tutui","tutuirea":"tutuire","tutuiri":"tutuire","tutuirii":"tutuire","tutuirile":"tutuire","tutuirilor":"tutuire","tutuise":"tutui","tutuisem":"tutui","tutuisera":"tutui","tutuiseram":"tutui","tutuiserati":"tutui","tutuisesi":"tutui","tutuisi":"tutui","tutuit":"tutui","tutuiti":"tutui","tutuitul":"tutuit","tutuitule":"tutuit","tutuitului":"tutuit","tutuituri":"tutuit","tutuiturile":"tutuit","tutuiturilor":"tutuit","tutul":"tutu","tutule":"tutu","tutului":"tutu","tutunari":"tutunar","tutunaria":"tutunărie","tutunariei":"tutunărie","tutunarii":["tutunarii","tutunar","tutunării","tutunărie"],"tutunariile":"tutunărie","tutunariilor":"tutunărie","tutunarilor":"tutunar","tutunaritul":"tutunărit","tutunaritule":"tutunărit","tutunaritului":"tutunărit","tutunarul":"tutunar","tutunarule":"tutunar","tutunarului":"tutunar","tutungerese":"tutungereasă","tutungeresei":"tutungereasă","tutungeresele":"tutungereasă","tutungereselor":"tutungereasă","tutungeria":"tutungerie","tutungeriei":"tutungerie","tutungerii":"tutungerie","tutungeriile":"tutungerie","tutungeriilor":"tutungerie","tutungii":"tutungiu","tutungiii":"tutungiu","tutungiilor":"tutungiu","tutungioaice":"tutungioaică","tutungioaicei":"tutungioaică","tutungioaicele":"tutungioaică","tutungioaicelor":"tutungioaică","tutungiul":"tutungiu","tutungiule":"tutungiu","tutungiului":"tutungiu","tutunia":"tutuniu","tutunie":"tutuniu","tutunii":"tutuniu","tutuniii":"tutuniu","tutuniile":"tutuniu","tutunistea":"tutuniște","tutunisti":"tutuniște","tutunistii":"tutuniște","tutunistile":"tutuniște","tutunistilor":"tutuniște","tutuniul":"tutuniu","tutunul":"tutun","tutunule":"tutun","tutunului":"tutun","tutunuri":"tutun","tutunurile":"tutun","tutunurilor":"tutun","tuturoaie":"țuțuroi","tuturoaiele":"țuțuroi","tuturoaielor":"țuțuroi","tuturoiul":"țuțuroi","tuturoiule":"țuțuroi","tuturoiului":"țuțuroi","tuturor":"tot","tuturusul":"țuțuruș","tuturusule":"țuțuruș","tuturusului":"țuțuruș","tutuuri":"tutu","tutuurile":"tutu","tutuurilor":"tutu","tuvaluana":["tuvaluană","tuvaluan","tuvaluana","tuvaluan"],"tuvaluane":["tuvaluane","tuvaluan","tuvaluane","tuvaluană"],"tuvaluanei":"tuvaluană","tuvaluanele":["tuvaluanele","tuvaluan","tuvaluanele","tuvaluană"],"tuvaluanelor":"tuvaluană","tuvaluani":"tuvaluan","tuvaluanii":"tuvaluan","tuvaluanilor":"tuvaluan","tuvaluanul":"tuvaluan","tuvaluanule":"tuvaluan","tuvaluanului":"tuvaluan","tuzuci":"tuzuc","tuzucii":"tuzuc","tuzucilor":"tuzuc","tuzucul":"tuzuc","tuzucule":"tuzuc","tuzucului":"tuzuc","tva-ul":"TVA","tva-ule":"TVA","tva-ului":"TVA","tva-uri":"TVA","tva-urile":"TVA","tva-urilor":"TVA","tvetoslovul":"țvetoslov","tvetoslovule":"țvetoslov","tvetoslovului":"țvetoslov","tvorenia":"tvorenie","tvoreniei":"tvorenie","tvorenii":"tvorenie","tvoreniile":"tvorenie","tvoreniilor":"tvorenie","tvoreti":"tvoreț","tvoretii":"tvoreț","tvoretilor":"tvoreț","tvoretul":"tvoreț","tvoretule":"tvoreț","tvoretului":"tvoreț","tweedul":"tweed","tweedule":"tweed","tweedului":"tweed","tweeduri":"tweed","tweedurile":"tweed","tweedurilor":"tweed","tweetere":"tweeter","tweeterele":"tweeter","tweeterelor":"tweeter","tweeterul":"tweeter","tweeterule":"tweeter","tweeterului":"tweeter","twistul":"twist","twistule":"twist","twistului":"twist","twisturi":"twist","twisturile":"twist","twisturilor":"twist"};
@@ -0,0 +1 @@
+export default {"ubertatea":"ubertate","ubertati":"ubertate","ubertatii":"ubertate","ubichinone":"ubichinonă","ubichinonei":"ubichinonă","ubichinonele":"ubichinonă","ubichinonelor":"ubichinonă","ubicua":["ubicuă","ubicuu","ubicua","ubicuu"],"ubicue":"ubicuu","ubicuele":"ubicuu","ubicui":"ubicuu","ubicuii":"ubicuu","ubicuitatea":"ubicuitate","ubicuitati":"ubicuitate","ubicuitatii":"ubicuitate","ubicuul":"ubicuu","ubicvista":["ubicvistă","ubicvist","ubicvista","ubicvist"],"ubicviste":"ubicvist","ubicvistele":"ubicvist","ubicvisti":"ubicvist","ubicvistii":"ubicvist","ubicvistul":"ubicvist","ucanelul":"ucanel","ucanelule":"ucanel","ucanelului":"ucanel","ucazul":"ucaz","ucazule":"ucaz","ucazului":"ucaz","ucazuri":"ucaz","ucazurile":"ucaz","ucazurilor":"ucaz","ucei":"ucel","uceii":"ucel","uceilor":"ucel","ucelul":"ucel","ucelule":"ucel","ucelului":"ucel","ucenia":"ucenie","ucenicea":"ucenici","uceniceai":"ucenici","uceniceam":"ucenici","uceniceati":"ucenici","uceniceau":"ucenici","ucenicesc":"ucenici","uceniceste":"ucenici","ucenicesti":"ucenici","ucenici":["ucenici","ucenic","ucenici","ucenică"],"ucenicia":"ucenicie","uceniciei":"ucenicie","ucenicii":["ucenicii","ucenic","ucenicii","ucenică","ucenicii","ucenici","ucenicii","ucenicie"],"uceniciile":"ucenicie","uceniciilor":"ucenicie","ucenicile":"ucenică","ucenicilor":["ucenicilor","ucenic","ucenicilor","ucenică"],"ucenicim":"ucenici","ucenicind":"ucenici","ucenicira":"ucenici","uceniciram":"ucenici","ucenicirati":"ucenici","ucenicise":"ucenici","ucenicisem":"ucenici","ucenicisera":"ucenici","uceniciseram":"ucenici","uceniciserati":"ucenici","ucenicisesi":"ucenici","ucenicisi":"ucenici","ucenicit":"ucenici","uceniciti":"ucenici","ucenicul":"ucenic","ucenicule":"ucenic","ucenicului":"ucenic","uceniei":"ucenie","ucenii":"ucenie","uceniile":"ucenie","uceniilor":"ucenie","ucenite":"uceniță","ucenitei":"uceniță","ucenitele":"uceniță","ucenitelor":"uceniță","ucid":"ucide","ucida":"ucide","ucidea":"ucide","ucideai":"ucide","ucideam":"ucide","ucideati":"ucide","ucideau":"ucide","ucidem":"ucide","uciderea":"ucidere","ucideri":"ucidere","ucideri in masa":"ucidere în masă","uciderii":"ucidere","uciderile":"ucidere","uciderilor":"ucidere","ucideti":"ucide","ucigand":"ucide","ucigaria":"ucigărie","ucigariei":"ucigărie","ucigarii":"ucigărie","ucigariile":"ucigărie","ucigariilor":"ucigărie","ucigasa":["ucigașă","ucigaș","ucigașa","ucigaș"],"ucigase":["ucigașe","ucigaș","ucigașe","ucigașă"],"ucigasei":"ucigașă","ucigasele":["ucigașele","ucigaș","ucigașele","ucigașă"],"ucigaselor":"ucigașă","ucigasi":"ucigaș","ucigasi in serie":"ucigaș în serie","ucigasii":"ucigaș","ucigasilor":"ucigaș","ucigasul":"ucigaș","ucigasule":"ucigaș","ucigasului":"ucigaș","ucigatoare":"ucigător","ucigatoarea":"ucigător","ucigatoarele":"ucigător","ucigatori":"ucigător","ucigatorii":"ucigător","ucigatorul":"ucigător","ucis":"ucide","ucisaturi":"ucisătură","ucisaturii":"ucisătură","ucisaturile":"ucisătură","ucisaturilor":"ucisătură","ucise":["ucise","ucide","ucise","ucis"],"ucisei":"ucide","ucisele":"ucis","uciselor":"ucis","ucisera":"ucide","uciseram":"ucide","uciserati":"ucide","ucisese":"ucide","ucisesem":"ucide","ucisesera":"ucide","uciseseram":"ucide","uciseserati":"ucide","ucisesesi":"ucide","ucisesi":"ucide","ucisul":"ucis","ucisule":"ucis","ucisului":"ucis","ucisuri":"ucis","ucitelne":"ucitelnă","ucitelnei":"ucitelnă","ucitelnele":"ucitelnă","ucitelnelor":"ucitelnă","ucizatoare":"ucizător","ucizatoarea":"ucizător","ucizatoarele":"ucizător","ucizatori":"ucizător","ucizatorii":"ucizător","ucizatorul":"ucizător","ucizi":"ucide","ucraine":"Ucraina","ucraineana":["ucraineană","ucrainean","ucraineana","ucrainean"],"ucraineance":"ucraineancă","ucraineancei":"ucraineancă","ucraineancele":"ucraineancă","ucraineancelor":"ucraineancă","ucraineanul":"ucrainean","ucraineanule":"ucrainean","ucraineanului":"ucrainean","ucrainei":"Ucraina","ucrainence":"ucraineancă","ucrainene":["ucrainene","ucrainean","ucrainene","ucraineană"],"ucrainenei":"ucraineană","ucrainenele":["ucrainenele","ucrainean","ucrainenele","ucraineană"],"ucrainenelor":"ucraineană","ucraineni":"ucrainean","ucrainenii":"ucrainean","ucrainenilor":"ucrainean","ucronia":"ucronie","ucroniei":"ucronie","ucronii":"ucronie","ucul":"ucu","ucule":"ucu","ucului":"ucu","ud":"uda","uda":["udă","ud","uda","ud"],"udai":"uda","udam":["udăm","uda","udam","uda"],"udand":"uda","udara":"uda","udaram":"uda","udarati":"uda","udarea":"udare","udari":"udare","udarii":"udare","udarile":"udare","udarilor":"udare","udase":"uda","udasem":"uda","udasera":"uda","udaseram":"uda","udaserati":"uda","udasesi":"uda","udasi":"uda","udat":"uda","udata":["udată","udat","udata","udat"],"udate":"udat","udatele":"udat","udati":["udați","uda","udați","udat"],"udatii":"udat","udatul":"udat","udaturi":"udătură","udaturice":"udăturică","udaturicei":"udăturică","udaturicele":"udăturică","udaturicelor":"udăturică","udaturii":"udătură","udaturile":"udătură","udaturilor":"udătură","udau":"uda","ude":["ude","ud","ude","uda"],"udele":["udele","ud","udele","udeală"],"udelei":"udeală","udelele":"udeală","udelelor":"udeală","udeli":"udeală","udelistea":"udeliște","udelisti":"udeliște","udelistii":"udeliște","udelistile":"udeliște","udelistilor":"udeliște","udisora":["udișoră","udișor","udișora","udișor"],"udisore":"udișor","udisorele":"udișor","udisori":"udișor","udisorii":"udișor","udisorul":"udișor","udma":"uimă","udme":"udmă","udmei":"udmă","udmele":"udmă","udmelor":"udmă","udmite":"udmiță","udmitei":"udmiță","udmitele":"udmiță","udmitelor":"udmiță","udmulite":"udmuliță","udmulitei":"udmuliță","udmulitele":"udmuliță","udmulitelor":"udmuliță","udmurta":["udmurtă","udmurt","udmurta","udmurt"],"udmurte":"udmurt","udmurtele":"udmurt","udmurti":"udmurt","udmurtii":"udmurt","udmurtilor":"udmurt","udmurtul":"udmurt","udmurtule":"udmurt","udmurtului":"udmurt","udometre":"udometru","udometrele":"udometru","udometrelor":"udometru","udometrul":"udometru","udometrule":"udometru","udometrului":"udometru","udul":"ud","udule":"ud","udului":"ud","uduri":"ud","udurile":"ud","udurilor":"ud","uedul":"ued","uedule":"ued","uedului":"ued","ueduri":"ued","uedurile":"ued","uedurilor":"ued","ufologi":["ufologi","ufolog","ufologi","ufologie"],"ufologia":"ufologie","ufologii":["ufologii","ufolog","ufologii","ufologie"],"ufologilor":"ufolog","ufologul":"ufolog","ufologule":"ufolog","ufologului":"ufolog","ugandeza":["ugandeză","ugandez","ugandeza","ugandez"],"ugandeze":["ugandeze","ugandez","ugandeze","ugandeză"],"ugandezei":"ugandeză","ugandezele":["ugandezele","ugandez","ugandezele","ugandeză"],"ugandezelor":"ugandeză","ugandezi":"ugandez","ugandezii":"ugandez","ugandezilor":"ugandez","ugandezul":"ugandez","ugandezule":"ugandez","ugandezului":"ugandez","ugere":"uger","ugeretul":"ugeret","ugeretule":"ugeret","ugeretului":"ugeret","ugereturi":"ugeret","ugereturile":"ugeret","ugereturilor":"ugeret","ughii":"ughi","ughilor":"ughi","ughiul":"ughi","ughiule":"ughi","ughiului":"ughi","ugilita":["ugilită","ugilit","ugilita","ugilit"],"ugilite":"ugilit","ugilitele":"ugilit","ugiliti":"ugilit","ugilitii":"ugilit","ugilitul":"ugilit","ugori":"ugor","ugorii":"ugor","ugorilor":"ugor","ugorul":"ugor","ugorule":"ugor","ugorului":"ugor","ugrica":["ugrică","ugric","ugrica","ugric"],"ugrice":"ugric","ugricele":"ugric","ugrici":"ugric","ugricii":"ugric","ugricul":"ugric","ugurlacul":"ugurlâc","ugurlacule":"ugurlâc","ugurlacului":"ugurlâc","ugurlia":"ugurliu","ugurlie":"ugurliu","ugurlii":"ugurliu","ugurliii":"ugurliu","ugurliile":"ugurliu","ugurliul":"ugurliu","uia":"ui","uiai":"ui","uiam":"ui","uiati":"ui","uiau":"ui","uibul":"uib","uibule":"uib","uibului":"uib","uiburi":"uib","uiburile":"uib","uiburilor":"uib","uichitaul":"uichiță","uichitaule":"uichiță","uichitaului":"uichiță","uiege":"uiagă","uiegei":"uiagă","uiegele":"uiagă","uiegelor":"uiagă","uiegi":"uiagă","uiegute":"uieguță","uiegutei":"uieguță","uiegutele":"uieguță","uiegutelor":"uieguță","uiesc":"ui","uieste":"ui","uiesti":"ui","uiete":"uiet","uietele":"uiet","uietelor":"uiet","uietul":"uiet","uietule":"uiet","uietului":"uiet","uii":"ui","uim":"ui","uimacele":"uimăceală","uimacelei":"uimăceală","uimacelele":"uimăceală","uimacelelor":"uimăceală","uimaceli":"uimăceală","uimacirea":"uimăcire","uimaciri":"uimăcire","uimacirii":"uimăcire","uime":"uimă","uimea":"uimi","uimeai":"uimi","uimeam":"uimi","uimeati":"uimi","uimeau":"uimi","uimele":"uimeală","uimelei":"uimeală","uimelele":"uimeală","uimelelor":"uimeală","uimeli":"uimeală","uimesc":"uimi","uimeste":"uimi","uimesti":"uimi","uimii":"uimi","uimim":"uimi","uimind":"uimi","uimira":"uimi","uimiram":"uimi","uimirati":"uimi","uimirea":"uimire","uimiri":"uimire","uimirii":"uimire","uimirile":"uimire","uimirilor":"uimire","uimise":"uimi","uimisem":"uimi","uimisera":"uimi","uimiseram":"uimi","uimiserati":"uimi","uimisesi":"uimi","uimisi":"uimi","uimit":"uimi","uimita":["uimită","uimit","uimita","uimit"],"uimite":"uimit","uimitele":"uimit","uimiti":["uimiți","uimi","uimiți","uimit"],"uimitii":"uimit","uimitoare":"uimitor","uimitoarea":"uimitor","uimitoarele":"uimitor","uimitori":"uimitor","uimitorii":"uimitor","uimitorul":"uimitor","uimitul":"uimit","uimute":"uimuță","uimutei":"uimuță","uimutele":"uimuță","uimutelor":"uimuță","uind":"ui","uira":"ui","uiram":"ui","uirati":"ui","uischi":"whisky","uise":"ui","uisem":"ui","uisera":"ui","uiseram":"ui","uiserati":"ui","uisesi":"ui","uisi":"ui","uistitii":"uistiti","uistitilor":"uistiti","uistitiul":"uistiti","uistitiule":"uistiti","uistitiului":"uistiti","uit":["uit","ui","uit","uita"],"uitaciunea":"uităciune","uitaciuni":"uităciune","uitaciunii":"uităciune","uitaciunile":"uităciune","uitaciunilor":"uităciune","uitai":"uita","uitam":["uităm","uita","uitam","uita"],"uitand":"uita","uitara":"uita","uitaram":"uita","uitarati":"uita","uitarea":"uitare","uitari":"uitare","uitarii":"uitare","uitarile":"uitare","uitarilor":"uitare","uitase":"uita","uitasem":"uita","uitasera":"uita","uitaseram":"uita","uitaserati":"uita","uitasesi":"uita","uitasi":"uita","uitat":"uita","uitata":["uitată","uitat","uitata","uitat"],"uitate":"uitat","uitatele":"uitat","uitati":["uitați","uita","uitați","uitat"],"uitatii":"uitat","uitatoare":"uitător","uitatoarea":"uitător","uitatoarele":"uitător","uitatori":"uitător","uitatorii":"uitător","uitatorul":"uitător","uitatul":"uitat","uitatule":"uitat","uitatului":"uitat","uitaturi":"uitătură","uitaturii":"uitătură","uitaturile":"uitătură","uitaturilor":"uitătură","uitau":"uita","uite":"uita","uiti":["uiți","ui","uiți","uita"],"uituca":["uitucă","uituc","uituca","uituc"],"uituce":"uituc","uitucele":"uituc","uituceli":"uituceală","uitucelii":"uituceală","uitucelile":"uituceală","uitucelilor":"uituceală","uitucenia":"uitucenie","uituceniei":"uitucenie","uitucenii":"uitucenie","uituci":"uituc","uitucia":"uitucie","uituciei":"uitucie","uitucii":["uitucii","uituc","uitucii","uitucie"],"uituciile":"uitucie","uituciilor":"uitucie","uitucul":"uituc","uiudumul":"uiudum","uiudumule":"uiudum","uiudumului":"uiudum","ujini":"ujină","ujinii":"ujină","ujinile":"ujină","ujinilor":"ujină","ujinite":"ujiniță","ujinitei":"ujiniță","ujinitele":"ujiniță","ujinitelor":"ujiniță","ujinute":"ujinuță","ujinutei":"ujinuță","ujinutele":"ujinuță","ujinutelor":"ujinuță","ujubirea":"ujubire","ujubiri":"ujubire","ujubirii":"ujubire","ujubitul":"ujubit","ujubitule":"ujubit","ujubitului":"ujubit","ujurasi":"ujuraș","ujurasii":"ujuraș","ujurasilor":"ujuraș","ujurasul":"ujuraș","ujurasule":"ujuraș","ujurasului":"ujuraș","ulceaua":"ulcea","ulcele":["ulcele","ulcea","ulcele","ulcică"],"ulcelei":["ulcelei","ulcea","ulcelei","ulcică"],"ulcelele":["ulcelele","ulcea","ulcelele","ulcică"],"ulcelelor":["ulcelelor","ulcea","ulcelelor","ulcică"],"ulceluse":"ulcelușă","ulcelusei":"ulcelușă","ulcelusele":"ulcelușă","ulceluselor":"ulcelușă","ulcelute":"ulceluță","ulcelutei":"ulceluță","ulcelutele":"ulceluță","ulcelutelor":"ulceluță","ulcerai":"ulcera","ulceram":["ulcerăm","ulcera","ulceram","ulcera"],"ulcerand":"ulcera","ulcerara":"ulcera","ulceraram":"ulcera","ulcerarati":"ulcera","ulcerarea":"ulcerare","ulcerari":"ulcerare","ulcerarii":"ulcerare","ulcerarile":"ulcerare","ulcerarilor":"ulcerare","ulcerase":"ulcera","ulcerasem":"ulcera","ulcerasera":"ulcera","ulceraseram":"ulcera","ulceraserati":"ulcera","ulcerasesi":"ulcera","ulcerasi":"ulcera","ulcerat":"ulcera","ulcerata":["ulcerată","ulcerat","ulcerata","ulcerat"],"ulcerate":"ulcerat","ulceratele":"ulcerat","ulcerati":["ulcerați","ulcera","ulcerați","ulcerat"],"ulceratia":"ulcerație","ulceratiei":"ulcerație","ulceratii":["ulcerații","ulcerat","ulcerații","ulcerație"],"ulceratiile":"ulcerație","ulceratiilor":"ulcerație","ulceratiunea":"ulcerațiune","ulceratiuni":"ulcerațiune","ulceratiunii":"ulcerațiune","ulceratiunile":"ulcerațiune","ulceratiunilor":"ulcerațiune","ulcerativa":["ulcerativă","ulcerativ","ulcerativa","ulcerativ"],"ulcerative":"ulcerativ","ulcerativele":"ulcerativ","ulcerativi":"ulcerativ","ulcerativii":"ulcerativ","ulcerativul":"ulcerativ","ulceratul":"ulcerat","ulcerau":"ulcera","ulcere":"ulcer","ulcereaza":"ulcera","ulcerele":"ulcer","ulcerelor":"ulcer","ulcerez":"ulcera","ulcerezi":"ulcera","ulceroase":"ulceroasă","ulceroasei":"ulceroasă","ulceroasele":"ulceroasă","ulceroaselor":"ulceroasă","ulcerogena":["ulcerogenă","ulcerogen","ulcerogena","ulcerogen"],"ulcerogene":"ulcerogen","ulcerogenele":"ulcerogen","ulcerogeni":"ulcerogen","ulcerogenii":"ulcerogen","ulcerogenul":"ulcerogen","ulceroida":["ulceroidă","ulceroid","ulceroida","ulceroid"],"ulceroide":"ulceroid","ulceroidele":"ulceroid","ulceroidul":"ulceroid","ulceroizi":"ulceroid","ulceroizii":"ulceroid","ulcerosi":"ulceros","ulcerosii":"ulceros","ulcerosilor":"ulceros","ulcerosul":"ulceros","ulcerosule":"ulceros","ulcerosului":"ulceros","ulcerul":"ulcer","ulcerule":"ulcer","ulcerului":"ulcer","ulcicuse":"ulcicușă","ulcicusei":"ulcicușă","ulcicusele":"ulcicușă","ulcicuselor":"ulcicușă","ulcicute":"ulcicuță","ulcicutei":"ulcicuță","ulcicutele":"ulcicuță","ulcicutelor":"ulcicuță","ulcioare":["ulcioare","ulcioară","ulcioare","ulcior"],"ulcioarei":"ulcioară","ulcioarele":["ulcioarele","ulcioară","ulcioarele","ulcior"],"ulcioarelor":["ulcioarelor","ulcioară","ulcioarelor","ulcior"],"ulcior":"urcior","ulciorase":"ulcioraș","ulciorasele":"ulcioraș","ulcioraselor":"ulcioraș","ulciorasul":"ulcioraș","ulciorasule":"ulcioraș","ulciorasului":"ulcioraș","ulciorul":"ulcior","ulciorule":"ulcior","ulciorului":"ulcior","ulcioruse":"ulcioruș","ulciorusele":"ulcioruș","ulcioruselor":"ulcioruș","ulciorusul":"ulcioruș","ulciorusule":"ulcioruș","ulciorusului":"ulcioruș","ulcite":"ulciță","ulcitei":"ulciță","ulcitele":"ulciță","ulcitelor":"ulciță","ulcuse":"ulcus","ulcusele":"ulcus","ulcuselor":"ulcus","ulcusul":"ulcus","ulcusule":"ulcus","ulcusului":"ulcus","uleiai":"uleia","uleiam":"uleia","uleiara":"uleia","uleiaram":"uleia","uleiarati":"uleia","uleiase":["uleiase","uleia","uleiașe","uleiaș"],"uleiasele":"uleiaș","uleiaselor":"uleiaș","uleiasem":"uleia","uleiasera":"uleia","uleiaseram":"uleia","uleiaserati":"uleia","uleiasesi":"uleia","uleiasi":"uleia","uleiasul":"uleiaș","uleiasule":"uleiaș","uleiasului":"uleiaș","uleiat":"uleia","uleiata":["uleiată","uleiat","uleiata","uleiat"],"uleiate":"uleiat","uleiatele":"uleiat","uleiati":["uleiați","uleia","uleiați","uleiat"],"uleiatii":"uleiat","uleiatul":"uleiat","uleiau":"uleia","uleiaza":"uleia","uleie":"uleia","uleiem":"uleia","uleierea":"uleiere","uleieri":["uleieri","uleier","uleieri","uleiere"],"uleierii":["uleierii","uleier","uleierii","uleiere"],"uleierile":"uleiere","uleierilor":["uleierilor","uleier","uleierilor","uleiere"],"uleierul":"uleier","uleierule":"uleier","uleierului":"uleier","uleiez":"uleia","uleiezi":"uleia","uleind":"uleia","uleioasa":["uleioasă","uleios","uleioasa","uleios"],"uleioase":"uleios","uleioasele":"uleios","uleiosi":"uleios","uleiosii":"uleios","uleiosul":"uleios","uleiul":"ulei","uleiule":"ulei","uleiului":"ulei","uleiuri":"ulei","uleiuri de migdale":"ulei de migdale","uleiuri de palmier":"ulei de palmier","uleiuri esentiale":"ulei esențial","uleiuri eterice":"ulei eteric","uleiuri minerale":"ulei mineral","uleiuri vegetale":"ulei vegetal","uleiurile":"ulei","uleiurilor":"ulei","ulemale":"ulema","ulemalei":"ulema","ulemalele":"ulema","ulemalelor":"ulema","ulemaua":"ulema","ulexitul":"ulexit","ulexitule":"ulexit","ulexitului":"ulexit","ulger":"uger","uliasi":"uliaș","uliasii":"uliaș","uliasilor":"uliaș","uliasul":"uliaș","uliasule":"uliaș","uliasului":"uliaș","ulicioare":"ulicioară","ulicioarei":"ulicioară","ulicioarele":"ulicioară","ulicioarelor":"ulicioară","uligani pescari":"uligan pescar","uliginoasa":["uliginoasă","uliginos","uliginoasa","uliginos"],"uliginoase":"uliginos","uliginoasele":"uliginos","uliginosi":"uliginos","uliginosii":"uliginos","uliginosul":"uliginos","ulii":"uliu","ulii cu picioare scurte":"uliu cu picioare scurte","ulii pasarari":"uliu păsărar","ulii porumbari":"uliu porumbar","uliii":"uliu","uliilor":"uliu","ulisori":"ulișor","ulisorii":"ulișor","ulisorilor":"ulișor","ulisorul":"ulișor","ulisorule":"ulișor","ulisorului":"ulișor","ulitarnice":"ulițarnică","ulitarnicei":"ulițarnică","ulitarnicele":"ulițarnică","ulitarnicelor":"ulițarnică","ulite":"uliță","ulitei":"uliță","ulitele":"uliță","ulitelor":"uliță","ulituce":"ulițucă","ulitucei":"ulițucă","ulitute":"ulițuță","ulitutei":"ulițuță","ulitutele":"ulițuță","ulitutelor":"ulițuță","uliul":"uliu","uliule":"uliu","uliului":"uliu","uliuti":"uliuț","uliutii":"uliuț","uliutilor":"uliuț","uliutul":"uliuț","uliutule":"uliuț","uliutului":"uliuț","ulmaria":"ulmărie","ulmariei":"ulmărie","ulmarii":"ulmărie","ulmariile":"ulmărie","ulmariilor":"ulmărie","ulmetul":"ulmet","ulmetule":"ulmet","ulmetului":"ulmet","ulmeturi":"ulmet","ulmeturile":"ulmet","ulmeturilor":"ulmet","ulmi":"ulm","ulmi de camp":"ulm de câmp","ulmii":"ulm","ulmilor":"ulm","ulmisori":"ulmișor","ulmisorii":"ulmișor","ulmisorilor":"ulmișor","ulmisorul":"ulmișor","ulmisorule":"ulmișor","ulmisorului":"ulmișor","ulmistea":"ulmiște","ulmisti":"ulmiște","ulmistii":"ulmiște","ulmistile":"ulmiște","ulmistilor":"ulmiște","ulmisul":"ulmiș","ulmisule":"ulmiș","ulmisului":"ulmiș","ulmisuri":"ulmiș","ulmisurile":"ulmiș","ulmisurilor":"ulmiș","ulmul":"ulm","ulmule":"ulm","ulmuleti":"ulmuleț","ulmuletii":"ulmuleț","ulmuletilor":"ulmuleț","ulmuletul":"ulmuleț","ulmuletule":"ulmuleț","ulmuletului":"ulmuleț","ulmului":"ulm","ulmusi":"ulmuș","ulmusii":"ulmuș","ulmusilor":"ulmuș","ulmusul":"ulmuș","ulmusule":"ulmuș","ulmusului":"ulmuș","ulmuti":"ulmuț","ulmutii":"ulmuț","ulmutilor":"ulmuț","ulmutul":"ulmuț","ulmutule":"ulmuț","ulmutului":"ulmuț","ulstere":"ulster","ulsterele":"ulster","ulsterelor":"ulster","ulsterul":"ulster","ulsterule":"ulster","ulsterului":"ulster","ulterioara":["ulterioară","ulterior","ulterioara","ulterior"],"ulterioare":"ulterior","ulterioarele":"ulterior","ulteriori":"ulterior","ulteriorii":"ulterior","ulteriorul":"ulterior","ultima":["ultimă","ultim","ultima","ultim"],"ultimativa":["ultimativă","ultimativ","ultimativa","ultimativ"],"ultimative":"ultimativ","ultimativele":"ultimativ","ultimativi":"ultimativ","ultimativii":"ultimativ","ultimativul":"ultimativ","ultimatul":"ultimat","ultimatule":"ultimat","ultimatului":"ultimat","ultimatumul":"ultimatum","ultimatumule":"ultimatum","ultimatumului":"ultimatum","ultimatumuri":"ultimatum","ultimatumurile":"ultimatum","ultimatumurilor":"ultimatum","ultimaturi":"ultimat","ultimaturile":"ultimat","ultimaturilor":"ultimat","ultime":"ultim","ultimele":"ultim","ultimi":"ultim","ultimii":"ultim","ultimul":"ultim","ultraacusti":"ultraacustic","ultraacustice":"ultraacustică","ultraacusticei":"ultraacustică","ultraacusticele":"ultraacustică","ultraacusticelor":"ultraacustică","ultrabazica":["ultrabazică","ultrabazic","ultrabazica","ultrabazic"],"ultrabazice":"ultrabazic","ultrabazicele":"ultrabazic","ultrabazici":"ultrabazic","ultrabazicii":"ultrabazic","ultrabazicul":"ultrabazic","ultracentrala":["ultracentrală","ultracentral","ultracentrala","ultracentral"],"ultracentrale":"ultracentral","ultracentralele":"ultracentral","ultracentrali":"ultracentral","ultracentralii":"ultracentral","ultracentralul":"ultracentral","ultracentrifuge":"ultracentrifugă","ultracentrifugei":"ultracentrifugă","ultracentrifugele":"ultracentrifugă","ultracentrifugelor":"ultracentrifugă","ultracondensoare":"ultracondensor","ultracondensoarele":"ultracondensor","ultracondensoarelor":"ultracondensor","ultracondensorul":"ultracondensor","ultracondensorule":"ultracondensor","ultracondensorului":"ultracondensor","ultraconfortabila":["ultraconfortabilă","ultraconfortabil","ultraconfortabila","ultraconfortabil"],"ultraconfortabile":"ultraconfortabil","ultraconfortabilele":"ultraconfortabil","ultraconfortabili":"ultraconfortabil","ultraconfortabilii":"ultraconfortabil","ultraconfortabilul":"ultraconfortabil","ultraconservatoare":"ultraconservator","ultraconservatoarea":"ultraconservator","ultraconservatoarele":"ultraconservator","ultraconservatori":"ultraconservator","ultraconservatorii":"ultraconservator","ultraconservatorul":"ultraconservator","ultrademagoge":"ultrademagogă","ultrademagogei":"ultrademagogă","ultrademagogele":"ultrademagogă","ultrademagogelor":"ultrademagogă","ultrademocrata":["ultrademocrată","ultrademocrat","ultrademocrata","ultrademocrat"],"ultrademocrate":"ultrademocrat","ultrademocratele":"ultrademocrat","ultrademocrati":"ultrademocrat","ultrademocratica":["ultrademocratică","ultrademocratic","ultrademocratica","ultrademocratic"],"ultrademocratice":"ultrademocratic","ultrademocraticele":"ultrademocratic","ultrademocratici":"ultrademocratic","ultrademocraticii":"ultrademocratic","ultrademocraticul":"ultrademocratic","ultrademocratii":"ultrademocrat","ultrademocratul":"ultrademocrat","ultraeficienta":["ultraeficientă","ultraeficient","ultraeficienta","ultraeficient"],"ultraeficiente":"ultraeficient","ultraeficientele":"ultraeficient","ultraeficienti":"ultraeficient","ultraeficientii":"ultraeficient","ultraeficientul":"ultraeficient","ultrafiltrarea":"ultrafiltrare","ultrafiltrari":"ultrafiltrare","ultrafiltrarii":"ultrafiltrare","ultrafiltrarile":"ultrafiltrare","ultrafiltrarilor":"ultrafiltrare","ultrafiltre":"ultrafiltru","ultrafiltrele":"ultrafiltru","ultrafiltrelor":"ultrafiltru","ultrafiltrul":"ultrafiltru","ultrafiltrule":"ultrafiltru","ultrafiltrului":"ultrafiltru","ultragiai":"ultragia","ultragiam":"ultragia","ultragiara":"ultragia","ultragiaram":"ultragia","ultragiarati":"ultragia","ultragiase":"ultragia","ultragiasem":"ultragia","ultragiasera":"ultragia","ultragiaseram":"ultragia","ultragiaserati":"ultragia","ultragiasesi":"ultragia","ultragiasi":"ultragia","ultragiat":"ultragia","ultragiata":["ultragiată","ultragiat","ultragiata","ultragiat"],"ultragiate":"ultragiat","ultragiatele":"ultragiat","ultragiati":["ultragiați","ultragia","ultragiați","ultragiat"],"ultragiatii":"ultragiat","ultragiatul":"ultragiat","ultragiau":"ultragia","ultragiaza":"ultragia","ultragie":"ultragia","ultragiem":"ultragia","ultragierea":"ultragiere","ultragieri":"ultragiere","ultragierii":"ultragiere","ultragierile":"ultragiere","ultragierilor":"ultragiere","ultragiez":"ultragia","ultragiezi":"ultragia","ultragii":"ultragiu","ultragiile":"ultragiu","ultragiilor":"ultragiu","ultragiind":"ultragia","ultragiuul":"ultragiu","ultragiuule":"ultragiu","ultragiuului":"ultragiu","ultraismul":"ultraism","ultraismule":"ultraism","ultraismului":"ultraism","ultraje":"ultraj","ultrajele":"ultraj","ultrajelor":"ultraj","ultrajul":"ultraj","ultrajule":"ultraj","ultrajului":"ultraj","ultraliberala":["ultraliberală","ultraliberal","ultraliberala","ultraliberal"],"ultraliberale":"ultraliberal","ultraliberalele":"ultraliberal","ultraliberali":"ultraliberal","ultraliberalii":"ultraliberal","ultraliberalismul":"ultraliberalism","ultraliberalismule":"ultraliberalism","ultraliberalismului":"ultraliberalism","ultraliberalul":"ultraliberal","ultraluxoasa":["ultraluxoasă","ultraluxos","ultraluxoasa","ultraluxos"],"ultraluxoase":"ultraluxos","ultraluxoasele":"ultraluxos","ultraluxosi":"ultraluxos","ultraluxosii":"ultraluxos","ultraluxosul":"ultraluxos","ultramaratoniste":"ultramaratonistă","ultramaratonistei":"ultramaratonistă","ultramaratonistele":"ultramaratonistă","ultramaratonistelor":"ultramaratonistă","ultramarinul":"ultramarin","ultramarinule":"ultramarin","ultramarinului":"ultramarin","ultramicrochimia":"ultramicrochimie","ultramicrochimiei":"ultramicrochimie","ultramicrochimii":"ultramicrochimie","ultramicrochimiile":"ultramicrochimie","ultramicrochimiilor":"ultramicrochimie","ultramicroscoape":"ultramicroscop","ultramicroscoapele":"ultramicroscop","ultramicroscoapelor":"ultramicroscop","ultramicroscopia":"ultramicroscopie","ultramicroscopica":["ultramicroscopică","ultramicroscopic","ultramicroscopica","ultramicroscopic"],"ultramicroscopice":"ultramicroscopic","ultramicroscopicele":"ultramicroscopic","ultramicroscopici":"ultramicroscopic","ultramicroscopicii":"ultramicroscopic","ultramicroscopicul":"ultramicroscopic","ultramicroscopiei":"ultramicroscopie","ultramicroscopii":"ultramicroscopie","ultramicroscopul":"ultramicroscop","ultramicroscopule":"ultramicroscop","ultramicroscopului":"ultramicroscop","ultramoderna":["ultramodernă","ultramodern","ultramoderna","ultramodern"],"ultramoderne":"ultramodern","ultramodernele":"ultramodern","ultramoderni":"ultramodern","ultramodernii":"ultramodern","ultramodernista":["ultramodernistă","ultramodernist","ultramodernista","ultramodernist"],"ultramoderniste":"ultramodernist","ultramodernistele":"ultramodernist","ultramodernisti":"ultramodernist","ultramodernistii":"ultramodernist","ultramodernistul":"ultramodernist","ultramodernul":"ultramodern","ultramontana":["ultramontană","ultramontan","ultramontana","ultramontan"],"ultramontane":"ultramontan","ultramontanele":"ultramontan","ultramontani":"ultramontan","ultramontanii":"ultramontan","ultramontanismul":"ultramontanism","ultramontanismule":"ultramontanism","ultramontanismului":"ultramontanism","ultramontanul":"ultramontan","ultramunteana":["ultramunteană","ultramuntean","ultramunteana","ultramuntean"],"ultramunteanul":"ultramuntean","ultramuntene":"ultramuntean","ultramuntenele":"ultramuntean","ultramunteni":"ultramuntean","ultramuntenii":"ultramuntean","ultranationalisme":"ultranaționalism","ultranationalismele":"ultranaționalism","ultranationalismelor":"ultranaționalism","ultranationalismul":"ultranaționalism","ultranationalismule":"ultranaționalism","ultranationalismului":"ultranaționalism","ultranationalista":["ultranaționalistă","ultranaționalist","ultranaționalista","ultranaționalist"],"ultranationaliste":"ultranaționalist","ultranationalistele":"ultranaționalist","ultranationalisti":"ultranaționalist","ultranationalistii":"ultranaționalist","ultranationalistul":"ultranaționalist","ultraoptimisti":"ultraoptimist","ultraoptimistii":"ultraoptimist","ultraoptimistilor":"ultraoptimist","ultraoptimistul":"ultraoptimist","ultraoptimistule":"ultraoptimist","ultraoptimistului":"ultraoptimist","ultraprogresista":["ultraprogresistă","ultraprogresist","ultraprogresista","ultraprogresist"],"ultraprogresiste":"ultraprogresist","ultraprogresistele":"ultraprogresist","ultraprogresisti":"ultraprogresist","ultraprogresistii":"ultraprogresist","ultraprogresistul":"ultraprogresist","ultrarafinata":["ultrarafinată","ultrarafinat","ultrarafinata","ultrarafinat"],"ultrarafinate":"ultrarafinat","ultrarafinatele":"ultrarafinat","ultrarafinati":"ultrarafinat","ultrarafinatii":"ultrarafinat","ultrarafinatul":"ultrarafinat","ultrarapida":["ultrarapidă","ultrarapid","ultrarapida","ultrarapid"],"ultrarapide":"ultrarapid","ultrarapidele":"ultrarapid","ultrarapidul":"ultrarapid","ultrarapizi":"ultrarapid","ultrarapizii":"ultrarapid","ultrareactionare":"ultrareacționară","ultrareactionarei":"ultrareacționară","ultrareactionarele":"ultrareacționară","ultrareactionarelor":"ultrareacționară","ultrareactionari":"ultrareacționar","ultrareactionarii":"ultrareacționar","ultrareactionarilor":"ultrareacționar","ultrareactionarul":"ultrareacționar","ultrareactionarule":"ultrareacționar","ultrareactionarului":"ultrareacționar","ultraregalista":["ultraregalistă","ultraregalist","ultraregalista","ultraregalist"],"ultraregaliste":"ultraregalist","ultraregalistele":"ultraregalist","ultraregalisti":"ultraregalist","ultraregalistii":"ultraregalist","ultraregalistul":"ultraregalist","ultraretrogradul":"ultraretrograd","ultraretrogradule":"ultraretrograd","ultraretrogradului":"ultraretrograd","ultraretrograzi":"ultraretrograd","ultraretrograzii":"ultraretrograd","ultraretrograzilor":"ultraretrograd","ultrarevolutionari":"ultrarevoluționar","ultrarevolutionarii":"ultrarevoluționar","ultrarevolutionarilor":"ultrarevoluționar","ultrarevolutionarul":"ultrarevoluționar","ultrarevolutionarule":"ultrarevoluționar","ultrarevolutionarului":"ultrarevoluționar","ultraromantica":["ultraromantică","ultraromantic","ultraromantica","ultraromantic"],"ultraromantice":"ultraromantic","ultraromanticele":"ultraromantic","ultraromantici":"ultraromantic","ultraromanticii":"ultraromantic","ultraromanticul":"ultraromantic","ultrascurta":["ultrascurtă","ultrascurt","ultrascurta","ultrascurt"],"ultrascurte":["ultrascurte","ultrascurt","ultrascurte","ultrascurtă"],"ultrascurtei":"ultrascurtă","ultrascurtele":["ultrascurtele","ultrascurt","ultrascurtele","ultrascurtă"],"ultrascurtelor":"ultrascurtă","ultrascurti":"ultrascurt","ultrascurtii":"ultrascurt","ultrascurtul":"ultrascurt","ultrasecreta":["ultrasecretă","ultrasecret","ultrasecreta","ultrasecret"],"ultrasecrete":"ultrasecret","ultrasecretele":"ultrasecret","ultrasecreti":"ultrasecret","ultrasecretii":"ultrasecret","ultrasecretul":"ultrasecret","ultrasensibila":["ultrasensibilă","ultrasensibil","ultrasensibila","ultrasensibil"],"ultrasensibile":"ultrasensibil","ultrasensibilele":"ultrasensibil","ultrasensibili":"ultrasensibil","ultrasensibilii":"ultrasensibil","ultrasensibilul":"ultrasensibil","ultrasonica":["ultrasonică","ultrasonic","ultrasonica","ultrasonic"],"ultrasonice":"ultrasonic","ultrasonicele":"ultrasonic","ultrasonici":"ultrasonic","ultrasonicii":"ultrasonic","ultrasonicul":"ultrasonic","ultrasonografia":"ultrasonografie","ultrasonografiei":"ultrasonografie","ultrasonografii":"ultrasonografie","ultrasonografiile":"ultrasonografie","ultrasonografiilor":"ultrasonografie","ultrasonora":["ultrasonoră","ultrasonor","ultrasonora","ultrasonor"],"ultrasonore":"ultrasonor","ultrasonorele":"ultrasonor","ultrasonori":"ultrasonor","ultrasonorii":"ultrasonor","ultrasonorul":"ultrasonor","ultrastructure":"ultrastructură","ultrastructurei":"ultrastructură","ultrastructurele":"ultrastructură","ultrastructurelor":"ultrastructură","ultrastructuri":"ultrastructură","ultrasunete":"ultrasunet","ultrasunetele":"ultrasunet","ultrasunetelor":"ultrasunet","ultrasunetul":"ultrasunet","ultrasunetule":"ultrasunet","ultrasunetului":"ultrasunet","ultravioleta":["ultravioletă","ultraviolet","ultravioleta","ultraviolet"],"ultraviolete":["ultraviolete","ultraviolet","ultraviolete","ultravioletă"],"ultravioletei":"ultravioletă","ultravioletele":["ultravioletele","ultraviolet","ultravioletele","ultravioletă","ultravioletele","ultraviolete"],"ultravioletelor":["ultravioletelor","ultravioletă","ultravioletelor","ultraviolete"],"ultravioleti":"ultraviolet","ultravioletii":"ultraviolet","ultravioletul":"ultraviolet","ultravirusul":"ultravirus","ultravirusule":"ultravirus","ultravirusului":"ultravirus","ultravirusuri":"ultravirus","ultravirusurile":"ultravirus","ultravirusurilor":"ultravirus","ulube":"ulubă","ulubei":"ulubă","ulubele":"ulubă","ulubelor":"ulubă","ulucase":"ulucaș","ulucasele":"ulucaș","ulucaselor":"ulucaș","ulucasul":"ulucaș","ulucasule":"ulucaș","ulucasului":"ulucaș","uluce":["uluce","uluc","uluce","ulucă"],"ulucei":"ulucă","ulucele":["ulucele","uluc","ulucele","ulucă"],"ulucelor":["ulucelor","uluc","ulucelor","ulucă"],"ulucul":"uluc","ulucule":"uluc","ulucului":"uluc","uluia":"ului","uluiai":"ului","uluiam":"ului","uluiati":"ului","uluiau":"ului","uluieli":"uluială","uluielii":"uluială","uluielile":"uluială","uluielilor":"uluială","uluiesc":"ului","uluieste":"ului","uluiesti":"ului","uluii":"ului","uluim":"ului","uluind":"ului","uluira":"ului","uluiram":"ului","uluirati":"ului","uluirea":"uluire","uluiri":"uluire","uluirii":"uluire","uluirile":"uluire","uluirilor":"uluire","uluise":"ului","uluisem":"ului","uluisera":"ului","uluiseram":"ului","uluiserati":"ului","uluisesi":"ului","uluisi":"ului","uluit":"ului","uluita":["uluită","uluit","uluita","uluit"],"uluite":"uluit","uluitele":"uluit","uluiti":["uluiți","ului","uluiți","uluit"],"uluitii":"uluit","uluitoare":"uluitor","uluitoarea":"uluitor","uluitoarele":"uluitor","uluitori":"uluitor","uluitorii":"uluitor","uluitorul":"uluitor","uluitul":"uluit","uluituri":"uluitură","uluiturii":"uluitură","uluiturile":"uluitură","uluiturilor":"uluitură","umana":["umană","uman","umana","uman"],"umane":"uman","umanele":"uman","umani":"uman","umanii":"uman","umanilor":"uman","umanioarele":"umanioare","umanioarelor":"umanioare","umanisme":"umanism","umanismele":"umanism","umanismelor":"umanism","umanismul":"umanism","umanismule":"umanism","umanismului":"umanism","umaniste":"umanistă","umanistei":"umanistă","umanistele":"umanistă","umanistelor":"umanistă","umanisti":"umanist","umanistica":["umanistică","umanistic","umanistica","umanistic"],"umanistice":"umanistic","umanisticele":"umanistic","umanistici":"umanistic","umanisticii":"umanistic","umanisticul":"umanistic","umanistii":"umanist","umanistilor":"umanist","umanistul":"umanist","umanistule":"umanist","umanistului":"umanist","umanitara":["umanitară","umanitar","umanitara","umanitar"],"umanitare":"umanitar","umanitarele":"umanitar","umanitari":"umanitar","umanitarii":"umanitar","umanitarisme":"umanitarism","umanitarismele":"umanitarism","umanitarismelor":"umanitarism","umanitarismul":"umanitarism","umanitarismule":"umanitarism","umanitarismului":"umanitarism","umanitariste":"umanitaristă","umanitaristei":"umanitaristă","umanitaristele":"umanitaristă","umanitaristelor":"umanitaristă","umanitaristi":"umanitarist","umanitaristii":"umanitarist","umanitaristilor":"umanitarist","umanitaristul":"umanitarist","umanitaristule":"umanitarist","umanitaristului":"umanitarist","umanitarul":"umanitar","umanitatea":"umanitate","umanitati":"umanitate","umanitatii":"umanitate","umanizai":"umaniza","umanizam":["umanizăm","umaniza","umanizam","umaniza"],"umanizand":"umaniza","umanizara":"umaniza","umanizaram":"umaniza","umanizarati":"umaniza","umanizarea":"umanizare","umanizarei":"umanizare","umanizase":"umaniza","umanizasem":"umaniza","umanizasera":"umaniza","umanizaseram":"umaniza","umanizaserati":"umaniza","umanizasesi":"umaniza","umanizasi":"umaniza","umanizat":"umaniza","umanizati":"umaniza","umanizau":"umaniza","umanizeaza":"umaniza","umanizez":"umaniza","umanizezi":"umaniza","umanoide":"umanoidă","umanoidei":"umanoidă","umanoidele":"umanoidă","umanoidelor":"umanoidă","umanoidul":"umanoid","umanoidule":"umanoid","umanoidului":"umanoid","umanoizi":"umanoid","umanoizii":"umanoid","umanoizilor":"umanoid","umanul":"uman","umanule":"uman","umanului":"uman","umarare":"umărar","umararele":"umărar","umararelor":"umărar","umararul":"umărar","umararule":"umărar","umararului":"umărar","umarul":"umăr","umarule":"umăr","umarului":"umăr","umbele":"umbelă","umbelei":"umbelă","umbelele":"umbelă","umbelelor":"umbelă","umbelifere":"umbeliferă","umbeliferei":"umbeliferă","umbeliferele":"umbeliferă","umbeliferelor":"umbeliferă","umbeliforma":["umbeliformă","umbeliform","umbeliforma","umbeliform"],"umbeliforme":"umbeliform","umbeliformele":"umbeliform","umbeliformi":"umbeliform","umbeliformii":"umbeliform","umbeliformul":"umbeliform","umblacitul":"umblăcit","umblacitule":"umblăcit","umblacitului":"umblăcit","umblai":"umbla","umblam":["umblăm","umbla","umblam","umbla"],"umbland":"umbla","umblara":"umbla","umblaram":"umbla","umblarati":"umbla","umblarea":"umblare","umblareata":["umblăreață","umblăreț","umblăreața","umblăreț"],"umblarete":"umblăreț","umblaretele":"umblăreț","umblareti":"umblăreț","umblaretii":"umblăreț","umblaretul":"umblăreț","umblari":"umblare","umblarii":"umblare","umblarile":"umblare","umblarilor":"umblare","umblase":"umbla","umblasem":"umbla","umblasera":"umbla","umblaseram":"umbla","umblaserati":"umbla","umblasesi":"umbla","umblasi":"umbla","umblat":"umbla","umblat cu cioara vopsit":"umbla cu cioara vopsită","umblat teleleu":"umbla teleleu","umblata":["umblată","umblat","umblata","umblat"],"umblate":"umblat","umblatele":"umblat","umblati":["umblați","umbla","umblați","umblat"],"umblatii":"umblat","umblatoarea":"umblătoare","umblatoarei":"umblătoare","umblatoarele":"umblătoare","umblatoarelor":"umblătoare","umblatori":"umblător","umblatorii":"umblător","umblatorilor":"umblător","umblatorul":"umblător","umblatorule":"umblător","umblatorului":"umblător","umblatul":"umblat","umblaturi":"umblătură","umblaturii":"umblătură","umblaturile":"umblătură","umblaturilor":"umblătură","umblau":"umbla","umble":"umbla","umblete":"umblet","umbli":"umbla","umblu":"umbla","umbrare":"umbrar","umbratec":"umbratic","umbratica":["umbratică","umbratic","umbratica","umbratic"],"umbratice":"umbratic","umbraticele":"umbratic","umbratici":"umbratic","umbraticii":"umbratic","umbraticul":"umbratic","umbre":"umbră","umbrea":"umbri","umbreai":"umbri","umbream":"umbri","umbreati":"umbri","umbreau":"umbri","umbrei":"umbră","umbrele":["umbrele","umbră","umbrele","umbrelă"],"umbrelei":"umbrelă","umbrelele":"umbrelă","umbrelelor":"umbrelă","umbrelor":"umbră","umbreluse":"umbrelușă","umbrelusei":"umbrelușă","umbrelusele":"umbrelușă","umbreluselor":"umbrelușă","umbrelute":"umbreluță","umbrelutei":"umbreluță","umbrelutele":"umbreluță","umbrelutelor":"umbreluță","umbresc":"umbri","umbreste":"umbri","umbresti":"umbri","umbrii":"umbri","umbrim":"umbri","umbrind":"umbri","umbrira":"umbri","umbriram":"umbri","umbrirati":"umbri","umbrirea":"umbrire","umbriri":"umbrire","umbririi":"umbrire","umbririle":"umbrire","umbririlor":"umbrire","umbrise":"umbri","umbrisem":"umbri","umbrisera":"umbri","umbriseram":"umbri","umbriserati":"umbri","umbrisesi":"umbri","umbrisi":"umbri","umbrisoare":"umbrișoară","umbrisoarei":"umbrișoară","umbrisoarele":"umbrișoară","umbrisoarelor":"umbrișoară","umbrisul":"umbriș","umbrisule":"umbriș","umbrisului":"umbriș","umbrisuri":"umbriș","umbrisurile":"umbriș","umbrisurilor":"umbriș","umbrit":"umbri","umbrita":["umbrită","umbrit","umbrita","umbrit"],"umbrite":["umbrite","umbrit","umbrițe","umbriță"],"umbritei":"umbriță","umbritele":["umbritele","umbrit","umbrițele","umbriță"],"umbritelor":"umbriță","umbriti":["umbriți","umbri","umbriți","umbrit"],"umbritii":"umbrit","umbritoare":"umbritor","umbritoarea":"umbritor","umbritoarele":"umbritor","umbritori":"umbritor","umbritorii":"umbritor","umbritorul":"umbritor","umbritul":"umbrit","umbroasa":["umbroasă","umbros","umbroasa","umbros"],"umbroase":"umbros","umbroasele":"umbros","umbrosi":"umbros","umbrosii":"umbros","umbrosul":"umbros","umbrulite":"umbruliță","umbrulitei":"umbruliță","umbrulitele":"umbruliță","umbrulitelor":"umbruliță","umbrusoare":"umbrușoară","umbrusoarei":"umbrușoară","umbrusoarele":"umbrușoară","umbrusoarelor":"umbrușoară","umbruti":"umbruță","umbrutii":"umbruță","umbrutile":"umbruță","umbrutilor":"umbruță","umectai":"umecta","umectam":["umectăm","umecta","umectam","umecta"],"umectand":"umecta","umectara":"umecta","umectaram":"umecta","umectarati":"umecta","umectarea":"umectare","umectari":"umectare","umectarii":"umectare","umectarile":"umectare","umectarilor":"umectare","umectase":"umecta","umectasem":"umecta","umectasera":"umecta","umectaseram":"umecta","umectaserati":"umecta","umectasesi":"umecta","umectasi":"umecta","umectat":"umecta","umectata":["umectată","umectat","umectata","umectat"],"umectate":"umectat","umectatele":"umectat","umectati":["umectați","umecta","umectați","umectat"],"umectatii":"umectat","umectatul":"umectat","umectau":"umecta","umecteaza":"umecta","umectez":"umecta","umectezi":"umecta","umeda":["umedă","umed","umeda","umed"],"umede":"umed","umedele":"umed","umedoasa":["umedoasă","umedos","umedoasa","umedos"],"umedoase":"umedos","umedoasele":"umedos","umedosi":"umedos","umedosii":"umedos","umedosul":"umedos","umedul":"umed","umeduta":["umeduță","umeduț","umeduța","umeduț"],"umedute":"umeduț","umedutele":"umeduț","umeduti":"umeduț","umedutii":"umeduț","umedutul":"umeduț","umelita":["umelită","umelit","umelita","umelit"],"umelite":"umelit","umelitele":"umelit","umeliti":"umelit","umelitii":"umelit","umelitul":"umelit","umer":"umăr","umerala":["umerală","umeral","umerala","umeral"],"umerale":"umeral","umeralele":"umeral","umerali":"umeral","umeralii":"umeral","umeralul":"umeral","umerare":"umerar","umerarele":"umerar","umerarelor":"umerar","umerarul":"umerar","umerarule":"umerar","umerarului":"umerar","umerase":"umeraș","umerasele":"umeraș","umeraselor":"umeraș","umerasul":"umeraș","umerasule":"umeraș","umerasului":"umeraș","umerei":"umerel","umereii":"umerel","umereilor":"umerel","umerelul":"umerel","umerelule":"umerel","umerelului":"umerel","umeri":"umăr","umerii":"umăr","umerilor":"umăr","umeroasa":["umeroasă","umeros","umeroasa","umeros"],"umeroase":"umeros","umeroasele":"umeros","umerosi":"umeros","umerosii":"umeros","umerosul":"umeros","umeruti":"umeruț","umerutii":"umeruț","umerutilor":"umeruț","umerutul":"umeruț","umerutule":"umeruț","umerutului":"umeruț","umezea":"umezi","umezeai":"umezi","umezeam":"umezi","umezeati":"umezi","umezeau":"umezi","umezela":"umezeală","umezeli":"umezeală","umezelii":"umezeală","umezelile":"umezeală","umezelilor":"umezeală","umezesc":"umezi","umezeste":"umezi","umezesti":"umezi","umezi":"umed","umezii":["umezii","umed","umezii","umezi"],"umezim":"umezi","umezind":"umezi","umezira":"umezi","umeziram":"umezi","umezirati":"umezi","umezirea":"umezire","umeziri":"umezire","umezirii":"umezire","umezirile":"umezire","umezirilor":"umezire","umezise":"umezi","umezisem":"umezi","umezisera":"umezi","umeziseram":"umezi","umeziserati":"umezi","umezisesi":"umezi","umezisi":"umezi","umezit":"umezi","umezita":["umezită","umezit","umezita","umezit"],"umezite":"umezit","umezitele":"umezit","umeziti":["umeziți","umezi","umeziți","umezit"],"umezitii":"umezit","umezitoare de aer":"umezitor de aer","umezitul":"umezit","umflacioasa":["umflăcioasă","umflăcios","umflăcioasa","umflăcios"],"umflacioase":"umflăcios","umflacioasele":"umflăcios","umflaciosi":"umflăcios","umflaciosii":"umflăcios","umflaciosul":"umflăcios","umflaciuni":"umflăciune","umflai":"umfla","umflam":["umflăm","umfla","umflam","umfla"],"umfland":"umfla","umflara":"umfla","umflaram":"umfla","umflarati":"umfla","umflarea":"umflare","umflari":"umflare","umflarii":"umflare","umflarile":"umflare","umflarilor":"umflare","umflase":"umfla","umflasem":"umfla","umflasera":"umfla","umflaseram":"umfla","umflaserati":"umfla","umflasesi":"umfla","umflasi":"umfla","umflat":"umfla","umflata":["umflată","umflat","umflata","umflat"],"umflate":"umflat","umflatele":"umflat","umflati":["umflați","umfla","umflați","umflat"],"umflatii":"umflat","umflatul":"umflat","umflaturi":"umflătură","umflaturii":"umflătură","umflaturile":"umflătură","umflaturilor":"umflătură","umflaturite":"umflăturiță","umflaturitei":"umflăturiță","umflaturitele":"umflăturiță","umflaturitelor":"umflăturiță","umflau":"umfla","umfli":"umfla","umflu":"umfla","umidific":"umidifica","umidificai":"umidifica","umidificam":["umidificăm","umidifica","umidificam","umidifica"],"umidificand":"umidifica","umidificara":"umidifica","umidificaram":"umidifica","umidificarati":"umidifica","umidificarea":"umidificare","umidificari":"umidificare","umidificarii":"umidificare","umidificarile":"umidificare","umidificarilor":"umidificare","umidificase":"umidifica","umidificasem":"umidifica","umidificasera":"umidifica","umidificaseram":"umidifica","umidificaserati":"umidifica","umidificasesi":"umidifica","umidificasi":"umidifica","umidificat":"umidifica","umidificati":"umidifica","umidificau":"umidifica","umidifice":"umidifica","umidifici":"umidifica","umidifuga":["umidifugă","umidifug","umidifuga","umidifug"],"umidifuge":"umidifug","umidifugele":"umidifug","umidifugi":"umidifug","umidifugii":"umidifug","umidifugul":"umidifug","umiditatea":"umiditate","umiditati":"umiditate","umiditatii":"umiditate","umidometre":"umidometru","umidometrele":"umidometru","umidometrelor":"umidometru","umidometrul":"umidometru","umidometrule":"umidometru","umidometrului":"umidometru","umila":["umilă","umil","umila","umil"],"umilai":"umila","umilam":["umilăm","umila","umilam","umila"],"umiland":"umila","umilara":"umila","umilaram":"umila","umilarati":"umila","umilase":"umila","umilasem":"umila","umilasera":"umila","umilaseram":"umila","umilaserati":"umila","umilasesi":"umila","umilasi":"umila","umilat":"umila","umilati":"umila","umilau":"umila","umile":"umil","umilea":"umili","umileai":"umili","umileam":"umili","umileati":"umili","umileau":"umili","umileaza":"umila","umilele":"umil","umilenia":"umilenie","umileniei":"umilenie","umilenii":"umilenie","umileniile":"umilenie","umileniilor":"umilenie","umilesc":"umili","umileste":"umili","umilesti":"umili","umilez":"umila","umilezi":"umila","umili":"umil","umiliatiunea":"umiliațiune","umiliatiuni":"umiliațiune","umiliatiunii":"umiliațiune","umiliatiunile":"umiliațiune","umiliatiunilor":"umiliațiune","umilii":["umilii","umil","umilii","umili"],"umilim":"umili","umilind":"umili","umilinte":"umilință","umilintei":"umilință","umilintele":"umilință","umilintelor":"umilință","umilira":"umili","umiliram":"umili","umilirati":"umili","umilirea":"umilire","umiliri":"umilire","umilirii":"umilire","umilirile":"umilire","umilirilor":"umilire","umilise":"umili","umilisem":"umili","umilisera":"umili","umiliseram":"umili","umiliserati":"umili","umilisesi":"umili","umilisi":"umili","umilit":"umili","umilita":["umilită","umilit","umilita","umilit"],"umilitatea":"umilitate","umilitati":"umilitate","umilitatii":"umilitate","umilitatile":"umilitate","umilitatilor":"umilitate","umilite":"umilit","umilitele":"umilit","umiliti":["umiliți","umili","umiliți","umilit"],"umilitii":"umilit","umilitoare":"umilitor","umilitoarea":"umilitor","umilitoarele":"umilitor","umilitori":"umilitor","umilitorii":"umilitor","umilitorul":"umilitor","umilitul":"umilit","umilul":"umil","umivalnite":"umivalniță","umivalnitei":"umivalniță","umivalnitele":"umivalniță","umivalnitelor":"umivalniță","umivania":"umivanie","umivaniei":"umivanie","umivanii":"umivanie","umivaniile":"umivanie","umivaniilor":"umivanie","umlautul":"umlaut","umlautule":"umlaut","umlautului":"umlaut","umnenia":"umnenie","umneniei":"umnenie","umnenii":"umnenie","umoarea":"umoare","umoari":"umoare","umoarii":"umoare","umoarile":"umoare","umoarilor":"umoare","umorala":["umorală","umoral","umorala","umoral"],"umorale":"umoral","umoralele":"umoral","umorali":"umoral","umoralii":"umoral","umoralul":"umoral","umore":"umor","umorele":"umor","umorelor":"umor","umori":"umoare","umori vitroase":"umoare vitroasă","umorismul":"umorism","umorismule":"umorism","umorismului":"umorism","umoriste":"umoristă","umoristei":"umoristă","umoristele":"umoristă","umoristelor":"umoristă","umoristi":"umorist","umoristica":["umoristică","umoristic","umoristica","umoristic"],"umoristice":"umoristic","umoristicele":"umoristic","umoristici":"umoristic","umoristicii":"umoristic","umoristicul":"umoristic","umoristii":"umorist","umoristilor":"umorist","umoristul":"umorist","umoristule":"umorist","umoristului":"umorist","umorul":"umor","umorule":"umor","umorului":"umor","umpica":["umpica","umpic","umpica","unpica"],"umpland":"umple","umplea":"umple","umpleai":"umple","umpleam":"umple","umpleati":"umple","umpleau":"umple","umplem":"umple","umplerea":"umplere","umpleri":"umplere","umplerii":"umplere","umplerile":"umplere","umplerilor":"umplere","umpleti":"umple","umpli":"umple","umplu":"umple","umplui":"umple","umplura":"umple","umpluram":"umple","umplurati":"umple","umpluse":"umple","umplusem":"umple","umplusera":"umple","umpluseram":"umple","umpluserati":"umple","umplusesi":"umple","umplusi":"umple","umplut":"umple","umpluta":["umplută","umplut","umpluta","umplut"],"umplute":"umplut","umplutele":"umplut","umpluti":"umplut","umplutii":"umplut","umplutul":"umplut","umpluture":"umplutură","umpluturei":"umplutură","umpluturele":"umplutură","umpluturelor":"umplutură","umpluturi":"umplutură","una":["una","unu","una","unul"],"unanima":["unanimă","unanim","unanima","unanim"],"unanime":"unanim","unanimele":"unanim","unanimi":"unanim","unanimii":"unanim","unanimismul":"unanimism","unanimismule":"unanimism","unanimismului":"unanimism","unanimista":["unanimistă","unanimist","unanimista","unanimist"],"unanimiste":"unanimist","unanimistele":"unanimist","unanimisti":"unanimist","unanimistii":"unanimist","unanimistilor":"unanimist","unanimistul":"unanimist","unanimistule":"unanimist","unanimistului":"unanimist","unanimitatea":"unanimitate","unanimitati":"unanimitate","unanimitatii":"unanimitate","unanimul":"unanim","unchesei":"uncheșel","uncheseii":"uncheșel","uncheseilor":"uncheșel","uncheselul":"uncheșel","uncheselule":"uncheșel","uncheselului":"uncheșel","unchesi":"uncheș","unchesii":"uncheș","unchesilor":"uncheș","unchesul":"uncheș","unchesule":"uncheș","unchesului":"uncheș","unchiasi":"unchiaș","unchiasii":"unchiaș","unchiasilor":"unchiaș","unchiasul":"unchiaș","unchiasule":"unchiaș","unchiasului":"unchiaș","unchii":"unchi","unchilor":"unchi","unchisori":"unchișor","unchisorii":"unchișor","unchisorilor":"unchișor","unchisorul":"unchișor","unchisorule":"unchișor","unchisorului":"unchișor","unchiu":"unchi","unchiul":"unchi","unchiule":"unchi","unchiuleti":"unchiuleț","unchiuletii":"unchiuleț","unchiuletilor":"unchiuleț","unchiuletul":"unchiuleț","unchiuletule":"unchiuleț","unchiuletului":"unchiuleț","unchiulicaul":"unchiulică","unchiulicaule":"unchiulică","unchiulicaului":"unchiulică","unchiului":"unchi","unchiusori":"unchiușor","unchiusorii":"unchiușor","unchiusorilor":"unchiușor","unchiusorul":"unchiușor","unchiusorule":"unchiușor","unchiusorului":"unchiușor","unchiuti":"unchiuț","unchiutii":"unchiuț","unchiutilor":"unchiuț","unchiutul":"unchiuț","unchiutule":"unchiuț","unchiutului":"unchiuț","uncia":"uncie","unciala":["uncială","uncial","unciala","uncial"],"unciale":"uncial","uncialele":"uncial","unciali":"uncial","uncialii":"uncial","uncialul":"uncial","unciei":"uncie","unciforma":["unciformă","unciform","unciforma","unciform"],"unciforme":"unciform","unciformele":"unciform","unciformi":"unciform","unciformii":"unciform","unciformul":"unciform","uncii":"uncie","unciile":"uncie","unciilor":"uncie","uncinata":["uncinată","uncinat","uncinata","uncinat"],"uncinate":"uncinat","uncinatele":"uncinat","uncinati":"uncinat","uncinatii":"uncinat","uncinatul":"uncinat","uncropeale":"uncropeală","uncropealei":"uncropeală","uncropele":"uncropel","uncropelele":"uncropel","uncropelelor":"uncropel","uncropelul":"uncropel","uncropelule":"uncropel","uncropelului":"uncropel","unctiunea":"uncțiune","unctiuni":"uncțiune","unctiunii":"uncțiune","undai":"unda","undam":["undăm","unda","undam","unda"],"undametre":"undametru","undametrele":"undametru","undametrelor":"undametru","undametrul":"undametru","undametrule":"undametru","undametrului":"undametru","undand":"unda","undara":"unda","undaram":"unda","undarati":"unda","undase":"unda","undasem":"unda","undasera":"unda","undaseram":"unda","undaserati":"unda","undasesi":"unda","undasi":"unda","undat":"unda","undati":"unda","undaturi":"undătură","undaturii":"undătură","undaturile":"undătură","undaturilor":"undătură","undau":"unda","unde":"undă","unde acustice":"undă acustică","unde de cutremur":"undă de cutremur","unde de soc":"undă de șoc","unde electromagnetice":"undă electromagnetică","unde lungi":"undă lungă","unde mijlocii":"undă mijlocie","unde purtatoare":"undă purtătoare","unde radio":"undă radio","unde scurte":"undă scurtă","unde seismice":"undă seismică","unde sonore":"undă sonoră","undea":"undi","undeai":"undi","undeam":"undi","undeati":"undi","undeau":"undi","undeaza":["undează","unda","undează","undeza"],"undei":"undă","undele":"undă","undelemn":"untdelemn","undelemnia":"undelemniu","undelemnie":"undelemniu","undelemnii":"undelemniu","undelemniii":"undelemniu","undelemniile":"undelemniu","undelemniul":"undelemniu","undelemnul":"undelemn","undelemnule":"undelemn","undelemnului":"undelemn","undelor":"undă","undesc":"undi","undeste":"undi","undesti":"undi","undez":"unda","undezat":"undeza","undeze":"undeza","undezi":"unda","undicioare":"undicioară","undicioarei":"undicioară","undicioarele":"undicioară","undicioarelor":"undicioară","undii":"undi","undim":"undi","undind":"undi","undine":"undină","undinei":"undină","undinele":"undină","undinelor":"undină","undira":"undi","undiram":"undi","undirati":"undi","undise":"undi","undisem":"undi","undisera":"undi","undiseram":"undi","undiserati":"undi","undisesi":"undi","undisi":"undi","undisoare":"undișoară","undisoarei":"undișoară","undisoarele":"undișoară","undisoarelor":"undișoară","undit":"undi","unditari":"undițar","unditarii":"undițar","unditarilor":"undițar","unditarul":"undițar","unditarule":"undițar","unditarului":"undițar","unditasi":"undițaș","unditasii":"undițaș","unditasilor":"undițaș","unditasul":"undițaș","unditasule":"undițaș","unditasului":"undițaș","undite":"undiță","unditei":"undiță","unditele":"undiță","unditelor":"undiță","unditi":"undi","undoasa":["undoasă","undos","undoasa","undos"],"undoase":"undos","undoasele":"undos","undoia":"undoi","undoiai":["undoiai","undoi","undoiai","undoia"],"undoiam":["undoiam","undoi","undoiam","undoia"],"undoiara":"undoia","undoiaram":"undoia","undoiarati":"undoia","undoiarea":"undoiare","undoiase":"undoia","undoiasem":"undoia","undoiasera":"undoia","undoiaseram":"undoia","undoiaserati":"undoia","undoiasesi":"undoia","undoiasi":"undoia","undoiat":"undoia","undoiati":["undoiați","undoi","undoiați","undoia"],"undoiau":["undoiau","undoi","undoiau","undoia"],"undoiaza":"undoia","undoie":"undoia","undoiem":"undoia","undoieri":"undoiare","undoierii":"undoiare","undoierile":"undoiare","undoierilor":"undoiare","undoiesc":"undoi","undoieste":"undoi","undoiesti":"undoi","undoiez":"undoia","undoiezi":"undoia","undoii":"undoi","undoim":"undoi","undoind":["undoind","undoi","undoind","undoia"],"undoioasa":["undoioasă","undoios","undoioasa","undoios"],"undoioase":"undoios","undoioasele":"undoios","undoiosi":"undoios","undoiosii":"undoios","undoiosul":"undoios","undoira":"undoi","undoiram":"undoi","undoirati":"undoi","undoirea":"undoire","undoiri":"undoire","undoirii":"undoire","undoirile":"undoire","undoirilor":"undoire","undoise":"undoi","undoisem":"undoi","undoisera":"undoi","undoiseram":"undoi","undoiserati":"undoi","undoisesi":"undoi","undoisi":"undoi","undoit":"undoi","undoiti":"undoi","undosi":"undos","undosii":"undos","undosul":"undos","undreaua":"undrea","undrele":"undrea","undrelei":"undrea","undrelele":"undrea","undrelelor":"undrea","unduia":"undui","unduiai":"undui","unduiam":"undui","unduiati":"undui","unduiau":"undui","unduiesc":"undui","unduieste":"undui","unduiesti":"undui","unduii":"undui","unduim":"undui","unduind":"undui","unduioasa":["unduioasă","unduios","unduioasa","unduios"],"unduioase":"unduios","unduioasele":"unduios","unduiosi":"unduios","unduiosii":"unduios","unduiosul":"unduios","unduira":"undui","unduiram":"undui","unduirati":"undui","unduirea":"unduire","unduiri":"unduire","unduirii":"unduire","unduirile":"unduire","unduirilor":"unduire","unduise":"undui","unduisem":"undui","unduisera":"undui","unduiseram":"undui","unduiserati":"undui","unduisesi":"undui","unduisi":"undui","unduit":"undui","unduita":["unduită","unduit","unduita","unduit"],"unduite":"unduit","unduitele":"unduit","unduiti":["unduiți","undui","unduiți","unduit"],"unduitii":"unduit","unduitoare":"unduitor","unduitoarea":"unduitor","unduitoarele":"unduitor","unduitori":"unduitor","unduitorii":"unduitor","unduitorul":"unduitor","unduitul":"unduit","undulai":"undula","undulam":["undulăm","undula","undulam","undula"],"unduland":"undula","undulanta":["undulantă","undulant","undulanta","undulant"],"undulante":"undulant","undulantele":"undulant","undulanti":"undulant","undulantii":"undulant","undulantul":"undulant","undulara":"undula","undularam":"undula","undularati":"undula","undularea":"undulare","undulari":["undulări","undulare","undulari","undulare"],"undularii":"undulare","undularile":"undulare","undularilor":"undulare","undulase":"undula","undulasem":"undula","undulasera":"undula","undulaseram":"undula","undulaserati":"undula","undulasesi":"undula","undulasi":"undula","undulat":"undula","undulata":["undulată","undulat","undulata","undulat"],"undulate":"undulat","undulatele":"undulat","undulati":["undulați","undula","undulați","undulat"],"undulatii":"undulat","undulatiunea":"undulațiune","undulatiuni":"undulațiune","undulatiunii":"undulațiune","undulatiunile":"undulațiune","undulatiunilor":"undulațiune","undulatoare":"undulător","undulatoarea":"undulător","undulatoarele":"undulător","undulatori":"undulător","undulatorii":"undulător","undulatorul":"undulător","undulatul":"undulat","undulaturi":"undulătură","undulaturii":"undulătură","undulaturile":"undulătură","undulaturilor":"undulătură","undulau":"undula","unduleaza":"undula","undulez":"undula","undulezi":"undula","unduloasa":["unduloasă","undulos","unduloasa","undulos"],"unduloase":"undulos","unduloasele":"undulos","undulosi":"undulos","undulosii":"undulos","undulosul":"undulos","unea":"uni","uneai":"uni","uneam":"uni","uneati":"uni","uneau":"uni","unei":"un","uneia":"unul","unele":["unele","uneală","unele","unul"],"unelei":"uneală","unelele":"uneală","unelelor":"uneală","uneli":"uneală","unelte":"unealtă","uneltea":"unelti","unelteai":"unelti","unelteam":"unelti","unelteati":"unelti","unelteau":"unelti","uneltei":"unealtă","uneltele":"unealtă","uneltelor":"unealtă","uneltesc":"unelti","unelteste":"unelti","uneltesti":"unelti","uneltii":"unelti","uneltim":"unelti","uneltind":"unelti","uneltioare":"uneltioară","uneltioarei":"uneltioară","uneltioarele":"uneltioară","uneltioarelor":"uneltioară","uneltira":"unelti","uneltiram":"unelti","uneltirati":"unelti","uneltirea":"uneltire","uneltiri":"uneltire","uneltirii":"uneltire","uneltirile":"uneltire","uneltirilor":"uneltire","uneltise":"unelti","uneltisem":"unelti","uneltisera":"unelti","uneltiseram":"unelti","uneltiserati":"unelti","uneltisesi":"unelti","uneltisi":"unelti","uneltit":"unelti","uneltita":["uneltită","uneltit","uneltita","uneltit"],"uneltite":"uneltit","uneltitele":"uneltit","uneltiti":["uneltiți","unelti","uneltiți","uneltit"],"uneltitii":"uneltit","uneltitoarea":"uneltitoare","uneltitoarei":"uneltitoare","uneltitoarele":"uneltitoare","uneltitoarelor":"uneltitoare","uneltitori":"uneltitor","uneltitorii":"uneltitor","uneltitorilor":"uneltitor","uneltitorul":"uneltitor","uneltitorule":"uneltitor","uneltitorului":"uneltitor","uneltitul":"uneltit","uneltute":"uneltuță","uneltutei":"uneltuță","uneltutele":"uneltuță","uneltutelor":"uneltuță","unesc":"uni","uneste":"uni","unesti":"uni","ung":"unge","unga":"unge","ungand":"unge","ungara":["ungară","ungar","ungara","ungar"],"ungare":["ungare","ungar","ungare","ungară"],"ungarei":"ungară","ungarele":["ungarele","ungar","ungarele","ungară"],"ungarelor":"ungară","ungari":"ungar","ungarie":"Ungaria","ungariei":"Ungaria","ungarii":["ungarii","ungar","ungarii","Ungaria"],"ungarul":"ungar","ungatoare":"ungător","ungatoarea":"ungătoare","ungatoarei":"ungătoare","ungatoarele":["ungătoarele","ungătoare","ungătoarele","ungător"],"ungatoarelor":["ungătoarelor","ungătoare","ungătoarelor","ungător"],"ungatorul":"ungător","ungatorule":"ungător","ungatorului":"ungător","ungea":"unge","ungeai":"unge","ungeam":"unge","ungeati":"unge","ungeau":"unge","ungem":"unge","ungerea":"ungere","ungeri":"ungere","ungerii":"ungere","ungerile":"ungere","ungerilor":"ungere","ungeti":"unge","ungherase":"ungheraș","ungherasele":"ungheraș","ungheraselor":"ungheraș","ungherasul":"ungheraș","ungherasule":"ungheraș","ungherasului":"ungheraș","unghere":"ungher","ungherele":"ungher","ungherelor":"ungher","ungherul":"ungher","ungherule":"ungher","ungherului":"ungher","unghete":"ungheț","unghetei":"ungheț","unghetelor":"ungheț","unghetul":"ungheț","unghetule":"ungheț","unghetului":"ungheț","unghia":"unghie","unghiei":"unghie","unghiere":"unghieră","unghieree":"unghieră","unghiereei":"unghieră","unghiereele":"unghieră","unghiereelor":"unghieră","unghii":"unghie","unghiile":"unghie","unghiilor":"unghie","unghinala":["unghinală","unghinal","unghinala","unghinal"],"unghinale":"unghinal","unghinalele":"unghinal","unghinali":"unghinal","unghinalii":"unghinal","unghinalul":"unghinal","unghioare":"unghioară","unghioarei":"unghioară","unghioarele":"unghioară","unghioarelor":"unghioară","unghisoare":"unghișoară","unghisoarei":"unghișoară","unghisoarele":"unghișoară","unghisoarelor":"unghișoară","unghite":"unghiță","unghitei":"unghiță","unghitele":"unghiță","unghitelor":"unghiță","unghiul":"unghi","unghiulara":["unghiulară","unghiular","unghiulara","unghiular"],"unghiulare":"unghiular","unghiularele":"unghiular","unghiulari":"unghiular","unghiularii":"unghiular","unghiularul":"unghiular","unghiulatia":"unghiulație","unghiulatiei":"unghiulație","unghiulatii":"unghiulație","unghiulatiile":"unghiulație","unghiulatiilor":"unghiulație","unghiule":"unghi","unghiulete":"unghiuleț","unghiuletele":"unghiuleț","unghiuletelor":"unghiuleț","unghiuletul":"unghiuleț","unghiuletule":"unghiuleț","unghiuletului":"unghiuleț","unghiului":"unghi","unghiuri":"unghi","unghiuri ascutite":"unghi ascuțit","unghiuri de incidenta":"unghi de incidență","unghiuri drepte":"unghi drept","unghiuri moarte":"unghi mort","unghiuri obtuze":"unghi obtuz","unghiuri plane":"unghi plan","unghiuri rectilinii":"unghi rectiliniu","unghiurile":"unghi","unghiurilor":"unghi","unghiusoare":"unghiușor","unghiusoarele":"unghiușor","unghiusoarelor":"unghiușor","unghiusorul":"unghiușor","unghiusorule":"unghiușor","unghiusorului":"unghiușor","unghiute":"unghiuță","unghiutei":"unghiuță","unghiutele":"unghiuță","unghiutelor":"unghiuță","ungi":"unge","unguente":"unguent","unguentele":"unguent","unguentelor":"unguent","unguentul":"unguent","unguentule":"unguent","unguentului":"unguent","ungulate":"ungulat","ungulatele":"ungulat","ungulatelor":"ungulat","ungulatul":"ungulat","ungulatule":"ungulat","ungulatului":"ungulat","unguligrada":["unguligradă","unguligrad","unguligrada","unguligrad"],"unguligrade":"unguligrad","unguligradele":"unguligrad","unguligradul":"unguligrad","unguligrazi":"unguligrad","unguligrazii":"unguligrad","ungurasi":"unguraș","ungurasii":"unguraș","ungurasilor":"unguraș","ungurasul":"unguraș","ungurasule":"unguraș","ungurasului":"unguraș","ungureasca":["ungurească","unguresc","ungureasca","unguresc"],"ungurenasi":"ungurenaș","ungurenasii":"ungurenaș","ungurenasilor":"ungurenaș","ungurenasul":"ungurenaș","ungurenasule":"ungurenaș","ungurenasului":"ungurenaș","ungurence":"ungureancă","ungurencei":"ungureancă","ungurencele":"ungureancă","ungurencelor":"ungureancă","ungurencute":"ungurencuță","ungurencutei":"ungurencuță","ungurencutele":"ungurencuță","ungurencutelor":"ungurencuță","ungureneasca":["ungurenească","ungurenesc","ungureneasca","ungurenesc"],"ungurenescul":"ungurenesc","ungurenesti":"ungurenesc","ungurenestii":"ungurenesc","ungurenestile":"ungurenesc","ungureni":"ungurean","ungurenita":["ungurenită","ungurenit","ungurenita","ungurenit"],"ungurenite":"ungurenit","ungurenitele":"ungurenit","ungureniti":"ungurenit","ungurenitii":"ungurenit","ungurenitul":"ungurenit","ungurescul":"unguresc","ungurese":"ungureasă","unguresei":"ungureasă","unguresele":"ungureasă","ungureselor":"ungureasă","unguresti":"unguresc","ungurestii":"unguresc","ungurestile":"unguresc","unguri":"ungur","ungurii":"ungur","ungurilor":"ungur","ungurimea":"ungurime","ungurimi":"ungurime","ungurimii":"ungurime","ungurisme":"ungurism","ungurismele":"ungurism","ungurismelor":"ungurism","ungurismul":"ungurism","ungurismule":"ungurism","ungurismului":"ungurism","unguroaice":"unguroaică","unguroaicei":"unguroaică","unguroaicele":"unguroaică","unguroaicelor":"unguroaică","unguroance":"unguroancă"};
@@ -0,0 +1 @@
+export default {"unguroancei":"unguroancă","unguroancele":"unguroancă","unguroancelor":"unguroancă","ungurul":"ungur","ungurule":"ungur","ungurului":"ungur","unia":"unie","uniacsi":"uniax","uniacsii":"uniax","uniarticulata":["uniarticulată","uniarticulat","uniarticulata","uniarticulat"],"uniarticulate":"uniarticulat","uniarticulatele":"uniarticulat","uniarticulati":"uniarticulat","uniarticulatii":"uniarticulat","uniarticulatul":"uniarticulat","uniata":["uniată","uniat","uniata","uniat"],"uniate":["uniate","uniat","uniate","uniată"],"uniatei":"uniată","uniatele":["uniatele","uniat","uniatele","uniată"],"uniatelor":"uniată","uniati":"uniat","uniatii":"uniat","uniatismul":"uniatism","uniatismule":"uniatism","uniatismului":"uniatism","uniatul":"uniat","uniaxa":["uniaxă","uniax","uniaxa","uniax"],"uniaxe":"uniax","uniaxele":"uniax","uniaxul":"uniax","unica":["unică","unic","unica","unic"],"unicamerala":["unicamerală","unicameral","unicamerala","unicameral"],"unicamerale":"unicameral","unicameralele":"unicameral","unicamerali":"unicameral","unicameralii":"unicameral","unicameralul":"unicameral","unicapsulara":["unicapsulară","unicapsular","unicapsulara","unicapsular"],"unicapsulare":"unicapsular","unicapsularele":"unicapsular","unicapsulari":"unicapsular","unicapsularii":"unicapsular","unicapsularul":"unicapsular","unicarpelara":["unicarpelară","unicarpelar","unicarpelara","unicarpelar"],"unicarpelare":"unicarpelar","unicarpelarele":"unicarpelar","unicarpelari":"unicarpelar","unicarpelarii":"unicarpelar","unicarpelarul":"unicarpelar","unicate":"unicat","unicatele":"unicat","unicatelor":"unicat","unicatul":"unicat","unicatule":"unicat","unicatului":"unicat","unice":"unic","unicele":"unic","unicelulara":["unicelulară","unicelular","unicelulara","unicelular"],"unicelulare":"unicelular","unicelularele":"unicelular","unicelulari":"unicelular","unicelularii":"unicelular","unicelularul":"unicelular","unici":"unic","unicii":"unic","unicitatea":"unicitate","unicitati":"unicitate","unicitatii":"unicitate","unicizai":"uniciza","unicizam":["unicizăm","uniciza","unicizam","uniciza"],"unicizand":"uniciza","unicizara":"uniciza","unicizaram":"uniciza","unicizarati":"uniciza","unicizarea":"unicizare","unicizari":"unicizare","unicizarii":"unicizare","unicizarile":"unicizare","unicizarilor":"unicizare","unicizase":"uniciza","unicizasem":"uniciza","unicizasera":"uniciza","unicizaseram":"uniciza","unicizaserati":"uniciza","unicizasesi":"uniciza","unicizasi":"uniciza","unicizat":"uniciza","unicizati":"uniciza","unicizau":"uniciza","unicizeaza":"uniciza","unicizez":"uniciza","unicizezi":"uniciza","unicolora":["unicoloră","unicolor","unicolora","unicolor"],"unicolore":"unicolor","unicolorele":"unicolor","unicolori":"unicolor","unicolorii":"unicolor","unicolorul":"unicolor","unicorda":["unicordă","unicord","unicorda","unicord"],"unicorde":"unicord","unicordele":"unicord","unicordul":"unicord","unicordule":"unicord","unicordului":"unicord","unicorna":["unicornă","unicorn","unicorna","unicorn"],"unicorne":"unicorn","unicornele":"unicorn","unicorni":"unicorn","unicornii":"unicorn","unicornul":"unicorn","unicorzi":"unicord","unicorzii":"unicord","unicorzile":"unicord","unicorzilor":"unicord","unicotiledonata":["unicotiledonată","unicotiledonat","unicotiledonata","unicotiledonat"],"unicotiledonate":"unicotiledonat","unicotiledonatele":"unicotiledonat","unicotiledonati":"unicotiledonat","unicotiledonatii":"unicotiledonat","unicotiledonatul":"unicotiledonat","unicul":"unic","unicuspida":["unicuspidă","unicuspid","unicuspida","unicuspid"],"unicuspide":"unicuspid","unicuspidele":"unicuspid","unicuspidul":"unicuspid","unicuspizi":"unicuspid","unicuspizii":"unicuspid","unidimensionai":"unidimensiona","unidimensionala":["unidimensională","unidimensional","unidimensionala","unidimensional"],"unidimensionale":"unidimensional","unidimensionalele":"unidimensional","unidimensionali":"unidimensional","unidimensionalii":"unidimensional","unidimensionalitatea":"unidimensionalitate","unidimensionalitati":"unidimensionalitate","unidimensionalitatii":"unidimensionalitate","unidimensionalul":"unidimensional","unidimensionam":["unidimensionăm","unidimensiona","unidimensionam","unidimensiona"],"unidimensionand":"unidimensiona","unidimensionara":"unidimensiona","unidimensionaram":"unidimensiona","unidimensionarati":"unidimensiona","unidimensionarea":"unidimensionare","unidimensionari":"unidimensionare","unidimensionarii":"unidimensionare","unidimensionarile":"unidimensionare","unidimensionarilor":"unidimensionare","unidimensionase":"unidimensiona","unidimensionasem":"unidimensiona","unidimensionasera":"unidimensiona","unidimensionaseram":"unidimensiona","unidimensionaserati":"unidimensiona","unidimensionasesi":"unidimensiona","unidimensionasi":"unidimensiona","unidimensionat":"unidimensiona","unidimensionata":["unidimensionată","unidimensionat","unidimensionata","unidimensionat"],"unidimensionate":"unidimensionat","unidimensionatele":"unidimensionat","unidimensionati":["unidimensionați","unidimensiona","unidimensionați","unidimensionat"],"unidimensionatii":"unidimensionat","unidimensionatul":"unidimensionat","unidimensionau":"unidimensiona","unidimensioneaza":"unidimensiona","unidimensionez":"unidimensiona","unidimensionezi":"unidimensiona","unidirectionala":["unidirecțională","unidirecțional","unidirecționala","unidirecțional"],"unidirectionale":"unidirecțional","unidirectionalele":"unidirecțional","unidirectionali":"unidirecțional","unidirectionalii":"unidirecțional","unidirectionalul":"unidirecțional","uniei":"unie","uniembrionara":["uniembrionară","uniembrionar","uniembrionara","uniembrionar"],"uniembrionare":"uniembrionar","uniembrionarele":"uniembrionar","uniembrionari":"uniembrionar","uniembrionarii":"uniembrionar","uniembrionarul":"uniembrionar","unifamiliala":["unifamilială","unifamilial","unifamiliala","unifamilial"],"unifamiliale":"unifamilial","unifamilialele":"unifamilial","unifamiliali":"unifamilial","unifamilialii":"unifamilial","unifamilialul":"unifamilial","unific":"unifica","unificai":"unifica","unificam":["unificăm","unifica","unificam","unifica"],"unificand":"unifica","unificara":"unifica","unificaram":"unifica","unificarati":"unifica","unificarea":"unificare","unificari":"unificare","unificarii":"unificare","unificarile":"unificare","unificarilor":"unificare","unificase":"unifica","unificasem":"unifica","unificasera":"unifica","unificaseram":"unifica","unificaserati":"unifica","unificasesi":"unifica","unificasi":"unifica","unificat":"unifica","unificata":["unificată","unificat","unificata","unificat"],"unificate":"unificat","unificatele":"unificat","unificati":["unificați","unifica","unificați","unificat"],"unificatii":"unificat","unificatoare":"unificator","unificatoarea":"unificator","unificatoarele":"unificator","unificatori":"unificator","unificatorii":"unificator","unificatorul":"unificator","unificatul":"unificat","unificau":"unifica","unifice":"unifica","unifici":"unifica","uniflora":["unifloră","uniflor","uniflora","uniflor"],"uniflore":"uniflor","uniflorele":"uniflor","uniflori":"uniflor","uniflorii":"uniflor","uniflorul":"uniflor","unifoliata":["unifoliată","unifoliat","unifoliata","unifoliat"],"unifoliate":"unifoliat","unifoliatele":"unifoliat","unifoliati":"unifoliat","unifoliatii":"unifoliat","unifoliatul":"unifoliat","uniforma":["uniformă","uniform","uniforma","uniform"],"uniforme":["uniforme","uniform","uniforme","uniformă"],"uniforme scolare":"uniformă școlară","uniformei":"uniformă","uniformele":["uniformele","uniform","uniformele","uniformă"],"uniformelor":"uniformă","uniformi":"uniform","uniformii":"uniform","uniformitatea":"uniformitate","uniformitati":"uniformitate","uniformitatii":"uniformitate","uniformizai":"uniformiza","uniformizam":["uniformizăm","uniformiza","uniformizam","uniformiza"],"uniformizand":"uniformiza","uniformizara":"uniformiza","uniformizaram":"uniformiza","uniformizarati":"uniformiza","uniformizarea":"uniformizare","uniformizari":"uniformizare","uniformizarii":"uniformizare","uniformizarile":"uniformizare","uniformizarilor":"uniformizare","uniformizase":"uniformiza","uniformizasem":"uniformiza","uniformizasera":"uniformiza","uniformizaseram":"uniformiza","uniformizaserati":"uniformiza","uniformizasesi":"uniformiza","uniformizasi":"uniformiza","uniformizat":"uniformiza","uniformizata":["uniformizată","uniformizat","uniformizata","uniformizat"],"uniformizate":"uniformizat","uniformizatele":"uniformizat","uniformizati":["uniformizați","uniformiza","uniformizați","uniformizat"],"uniformizatii":"uniformizat","uniformizatoare":"uniformizator","uniformizatoarea":"uniformizator","uniformizatoarele":"uniformizator","uniformizatori":"uniformizator","uniformizatorii":"uniformizator","uniformizatorul":"uniformizator","uniformizatul":"uniformizat","uniformizau":"uniformiza","uniformizeaza":"uniformiza","uniformizez":"uniformiza","uniformizezi":"uniformiza","uniformul":"uniform","uniglanda":["uniglandă","unigland","uniglanda","unigland"],"uniglande":"unigland","uniglandele":"unigland","uniglandul":"unigland","uniglanzi":"unigland","uniglanzii":"unigland","unii":["unii","uni","unii","unie","unii","unul"],"uniile":"unie","uniilor":"unie","unilabiata":["unilabiată","unilabiat","unilabiata","unilabiat"],"unilabiate":"unilabiat","unilabiatele":"unilabiat","unilabiati":"unilabiat","unilabiatii":"unilabiat","unilabiatul":"unilabiat","unilaterala":["unilaterală","unilateral","unilaterala","unilateral"],"unilaterale":"unilateral","unilateralele":"unilateral","unilaterali":"unilateral","unilateralii":"unilateral","unilateralitatea":"unilateralitate","unilateralitati":"unilateralitate","unilateralitatii":"unilateralitate","unilateralitatile":"unilateralitate","unilateralitatilor":"unilateralitate","unilateralizarea":"unilateralizare","unilateralizari":"unilateralizare","unilateralizarii":"unilateralizare","unilateralul":"unilateral","unilingva":["unilingvă","unilingv","unilingva","unilingv"],"unilingve":"unilingv","unilingvele":"unilingv","unilingvi":"unilingv","unilingvii":"unilingv","unilingvul":"unilingv","uniliniara":["uniliniară","uniliniar","uniliniara","uniliniar"],"uniliniare":"uniliniar","uniliniarele":"uniliniar","uniliniari":"uniliniar","uniliniarii":"uniliniar","uniliniarul":"uniliniar","unilobata":["unilobată","unilobat","unilobata","unilobat"],"unilobate":"unilobat","unilobatele":"unilobat","unilobati":"unilobat","unilobatii":"unilobat","unilobatul":"unilobat","uniloculara":["uniloculară","unilocular","uniloculara","unilocular"],"uniloculare":"unilocular","unilocularele":"unilocular","uniloculari":"unilocular","unilocularii":"unilocular","unilocularul":"unilocular","unim":"uni","unimana":["unimană","uniman","unimana","uniman"],"unimane":"uniman","unimanele":"uniman","unimani":"uniman","unimanii":"uniman","unimanul":"uniman","unimea":"unime","unimi":"unime","unimii":"unime","unimile":"unime","unimilor":"unime","uninationala":["uninațională","uninațional","uninaționala","uninațional"],"uninationale":"uninațional","uninationalele":"uninațional","uninationali":"uninațional","uninationalii":"uninațional","uninationalul":"uninațional","unind":"uni","uninominala":["uninominală","uninominal","uninominala","uninominal"],"uninominale":"uninominal","uninominalele":"uninominal","uninominali":"uninominal","uninominalii":"uninominal","uninominalul":"uninominal","unioculara":["unioculară","uniocular","unioculara","uniocular"],"unioculare":"uniocular","uniocularele":"uniocular","unioculari":"uniocular","uniocularii":"uniocular","uniocularul":"uniocular","unionala":["unională","unional","unionala","unional"],"unionale":"unional","unionalele":"unional","unionali":"unional","unionalii":"unional","unionalul":"unional","unionismul":"unionism","unionismule":"unionism","unionismului":"unionism","unionista":["unionistă","unionist","unionista","unionist"],"unioniste":"unionist","unionistele":"unionist","unionisti":"unionist","unionistii":"unionist","unionistul":"unionist","uniovulata":["uniovulată","uniovulat","uniovulata","uniovulat"],"uniovulate":"uniovulat","uniovulatele":"uniovulat","uniovulati":"uniovulat","uniovulatii":"uniovulat","uniovulatul":"uniovulat","unipara":["unipară","unipar","unipara","unipar"],"unipare":"unipar","uniparele":"unipar","unipari":"unipar","uniparii":"unipar","uniparipenata":["uniparipenată","uniparipenat","uniparipenata","uniparipenat"],"uniparipenate":"uniparipenat","uniparipenatele":"uniparipenat","uniparipenati":"uniparipenat","uniparipenatii":"uniparipenat","uniparipenatul":"uniparipenat","uniparul":"unipar","unipersonala":["unipersonală","unipersonal","unipersonala","unipersonal"],"unipersonale":"unipersonal","unipersonalele":"unipersonal","unipersonali":"unipersonal","unipersonalii":"unipersonal","unipersonalul":"unipersonal","unipetala":["unipetală","unipetal","unipetala","unipetal"],"unipetale":"unipetal","unipetalele":"unipetal","unipetali":"unipetal","unipetalii":"unipetal","unipetalul":"unipetal","unipolara":["unipolară","unipolar","unipolara","unipolar"],"unipolare":"unipolar","unipolarele":"unipolar","unipolari":"unipolar","unipolarii":"unipolar","unipolarul":"unipolar","unira":"uni","uniram":"uni","unirati":"uni","uniri":"unire","uniscrisul":"uniscris","uniscrisule":"uniscris","uniscrisului":"uniscris","unise":"uni","unisem":"uni","unisepala":["unisepală","unisepal","unisepala","unisepal"],"unisepale":"unisepal","unisepalele":"unisepal","unisepali":"unisepal","unisepalii":"unisepal","unisepalul":"unisepal","unisera":"uni","uniseram":"uni","uniserati":"uni","uniseriata":["uniseriată","uniseriat","uniseriata","uniseriat"],"uniseriate":"uniseriat","uniseriatele":"uniseriat","uniseriati":"uniseriat","uniseriatii":"uniseriat","uniseriatul":"uniseriat","unisesi":"uni","unisexuala":["unisexuală","unisexual","unisexuala","unisexual"],"unisexuale":"unisexual","unisexualele":"unisexual","unisexuali":"unisexual","unisexualii":"unisexual","unisexualitatea":"unisexualitate","unisexualitati":"unisexualitate","unisexualitatii":"unisexualitate","unisexualitatile":"unisexualitate","unisexualitatilor":"unisexualitate","unisexualul":"unisexual","unisexuata":["unisexuată","unisexuat","unisexuata","unisexuat"],"unisexuate":"unisexuat","unisexuatele":"unisexuat","unisexuati":"unisexuat","unisexuatii":"unisexuat","unisexuatul":"unisexuat","unisi":"uni","unisilaba":["unisilabă","unisilab","unisilaba","unisilab"],"unisilabe":"unisilab","unisilabele":"unisilab","unisilabi":"unisilab","unisilabica":["unisilabică","unisilabic","unisilabica","unisilabic"],"unisilabice":"unisilabic","unisilabicele":"unisilabic","unisilabici":"unisilabic","unisilabicii":"unisilabic","unisilabicul":"unisilabic","unisilabii":"unisilab","unisilabul":"unisilab","unisonante":"unisonanță","unisonantei":"unisonanță","unisonantele":"unisonanță","unisonantelor":"unisonanță","unisonul":"unison","unisonule":"unison","unisonului":"unison","unit":"uni","unita":["unită","unit","unita","unit"],"unitara":["unitară","unitar","unitara","unitar"],"unitaraseasca":["unitărășească","unitărășesc","unitărășeasca","unitărășesc"],"unitarasescul":"unitărășesc","unitarasesti":"unitărășesc","unitarasestii":"unitărășesc","unitarasestile":"unitărășesc","unitare":"unitar","unitarele":"unitar","unitari":"unitar","unitariana":["unitariană","unitarian","unitariana","unitarian"],"unitarianismul":"unitarianism","unitarianismule":"unitarianism","unitarianismului":"unitarianism","unitarianul":"unitarian","unitariene":"unitarian","unitarienele":"unitarian","unitarieni":"unitarian","unitarienii":"unitarian","unitarii":"unitar","unitarismul":"unitarism","unitarismule":"unitarism","unitarismului":"unitarism","unitarul":"unitar","unitatea":"unitate","unitati":"unitate","unitati aritmetice si logice":"unitate aritmetică și logică","unitati astronomice":"unitate astronomică","unitati de cd":"unitate de CD","unitati de discheta":"unitate de dischetă","unitati de dvd":"unitate de DVD","unitati de hd dvd":"unitate de HD DVD","unitati de terapie intensiva":"unitate de terapie intensivă","unitati optice":"unitate optică","unitati periferice":"unitate periferică","unitatii":"unitate","unitatile":"unitate","unitatilor":"unitate","unite":"unit","unitele":"unit","uniti":["uniți","uni","uniți","unit"],"unitii":"unit","unitona":["unitonă","uniton","unitona","uniton"],"unitone":"uniton","unitonele":"uniton","unitoni":"uniton","unitonica":["unitonică","unitonic","unitonica","unitonic"],"unitonice":"unitonic","unitonicele":"unitonic","unitonici":"unitonic","unitonicii":"unitonic","unitonicul":"unitonic","unitonii":"uniton","unitonul":"uniton","unitul":"unit","uniunea":"uniune","uniuni":"uniune","uniuni vamale":"uniune vamală","uniunii":"uniune","uniunile":"uniune","uniunilor":"uniune","univalenta":["univalentă","univalent","univalenta","univalent"],"univalente":"univalent","univalentele":"univalent","univalenti":"univalent","univalentii":"univalent","univalentul":"univalent","univalva":["univalvă","univalv","univalva","univalv"],"univalve":"univalv","univalvele":"univalv","univalvi":"univalv","univalvii":"univalv","univalvul":"univalv","universala":["universală","universal","universala","universal"],"universale":"universal","universalele":"universal","universali":"universal","universalii":"universal","universalismul":"universalism","universalismule":"universalism","universalismului":"universalism","universalista":["universalistă","universalist","universalista","universalist"],"universaliste":"universalist","universalistele":"universalist","universalisti":"universalist","universalistii":"universalist","universalistul":"universalist","universalitatea":"universalitate","universalitati":"universalitate","universalitatii":"universalitate","universalitatile":"universalitate","universalitatilor":"universalitate","universalizai":"universaliza","universalizam":["universalizăm","universaliza","universalizam","universaliza"],"universalizand":"universaliza","universalizara":"universaliza","universalizaram":"universaliza","universalizarati":"universaliza","universalizarea":"universalizare","universalizari":"universalizare","universalizarii":"universalizare","universalizarile":"universalizare","universalizarilor":"universalizare","universalizase":"universaliza","universalizasem":"universaliza","universalizasera":"universaliza","universalizaseram":"universaliza","universalizaserati":"universaliza","universalizasesi":"universaliza","universalizasi":"universaliza","universalizat":"universaliza","universalizati":"universaliza","universalizau":"universaliza","universalizeaza":"universaliza","universalizez":"universaliza","universalizezi":"universaliza","universalul":"universal","universiade":"universiadă","universiadei":"universiadă","universiadele":"universiadă","universiadelor":"universiadă","universitara":["universitară","universitar","universitara","universitar"],"universitare":"universitar","universitarele":"universitar","universitari":"universitar","universitarii":"universitar","universitarilor":"universitar","universitarul":"universitar","universitarule":"universitar","universitarului":"universitar","universitatea":"universitate","universitati":"universitate","universitatii":"universitate","universitatile":"universitate","universitatilor":"universitate","universul":"univers","universule":"univers","universului":"univers","universuri":"univers","universurile":"univers","universurilor":"univers","univoca":["univocă","univoc","univoca","univoc"],"univocatia":"univocație","univocatiei":"univocație","univocatii":"univocație","univoce":"univoc","univocele":"univoc","univoci":"univoc","univocii":"univoc","univocitatea":"univocitate","univocitati":"univocitate","univocitatii":"univocitate","univocitatile":"univocitate","univocitatilor":"univocitate","univocul":"univoc","unoglasnice":"unoglasnică","unoglasnicei":"unoglasnică","unoglasnicele":"unoglasnică","unoglasnicelor":"unoglasnică","unor":"un","unora":"unul","unpica":"un pic","uns":"unge","unsa":["unsă","uns","unsa","uns"],"unsature":"unsătură","unsaturei":"unsătură","unse":["unse","unge","unse","uns"],"unsei":"unge","unsele":"uns","unsera":"unge","unseram":"unge","unserati":"unge","unsese":"unge","unsesem":"unge","unsesera":"unge","unseseram":"unge","unseserati":"unge","unsesesi":"unge","unsesi":"unge","unsi":"uns","unsii":"uns","unsoarea":"unsoare","unsori":"unsoare","unsorice":"unsorică","unsoricei":"unsorică","unsorii":"unsoare","unsorile":"unsoare","unsorilor":"unsoare","unspe":"unsprezece","unsul":"uns","unsuroasa":["unsuroasă","unsuros","unsuroasa","unsuros"],"unsuroase":"unsuros","unsuroasele":"unsuros","unsurosi":"unsuros","unsurosia":"unsuroșie","unsurosiei":"unsuroșie","unsurosii":["unsuroșii","unsuros","unsuroșii","unsuroșie"],"unsurosiile":"unsuroșie","unsurosiilor":"unsuroșie","unsurosul":"unsuros","untarese":"untăreasă","untaresei":"untăreasă","untaresele":"untăreasă","untareselor":"untăreasă","untari":"untar","untaria":"untărie","untariei":"untărie","untarii":"untărie","untariile":"untărie","untariilor":"untărie","untarile":"untar","untarilor":"untar","untarul":"untar","untarule":"untar","untarului":"untar","untdelemngii":"untdelemngiu","untdelemngiii":"untdelemngiu","untdelemngiilor":"untdelemngiu","untdelemngiuul":"untdelemngiu","untdelemngiuule":"untdelemngiu","untdelemngiuului":"untdelemngiu","untdelemnia":"untdelemniu","untdelemnie":"untdelemniu","untdelemnii":"untdelemniu","untdelemniii":"untdelemniu","untdelemniile":"untdelemniu","untdelemnite":"untdelemniță","untdelemnitei":"untdelemniță","untdelemniul":"untdelemniu","unterofiteri":"unterofițer","unterofiterii":"unterofițer","unterofiterilor":"unterofițer","unterofiterul":"unterofițer","unterofiterule":"unterofițer","unterofiterului":"unterofițer","untiere":"untieră","untierei":"untieră","untierele":"untieră","untierelor":"untieră","untisori":"untișor","untisorii":"untișor","untisorilor":"untișor","untisorul":"untișor","untisorule":"untișor","untisorului":"untișor","untoasa":["untoasă","untos","untoasa","untos"],"untoase":"untos","untoasele":"untos","untosi":"untos","untosii":"untos","untosul":"untos","untul":"unt","untule":"unt","untului":"unt","unturi":["unturi","unt","unturi","untură"],"unturii":"untură","unturile":["unturile","unt","unturile","untură"],"unturilor":["unturilor","unt","unturilor","untură"],"unturoasa":["unturoasă","unturos","unturoasa","unturos"],"unturoase":"unturos","unturoasele":"unturos","unturosi":"unturos","unturosii":"unturos","unturosul":"unturos","unui":"un","unuia":"unul","ununbiul":"ununbiu","ununbiule":"ununbiu","ununbiului":"ununbiu","ununoctiul":"ununoctiu","ununoctiule":"ununoctiu","ununoctiului":"ununoctiu","ununpentiul":"ununpentiu","ununpentiule":"ununpentiu","ununpentiului":"ununpentiu","ununquadiul":"ununquadiu","ununquadiule":"ununquadiu","ununquadiului":"ununquadiu","ununtriul":"ununtriu","ununtriule":"ununtriu","ununtriului":"ununtriu","upercutai":"upercuta","upercutam":["upercutăm","upercuta","upercutam","upercuta"],"upercutand":"upercuta","upercutara":"upercuta","upercutaram":"upercuta","upercutarati":"upercuta","upercutase":"upercuta","upercutasem":"upercuta","upercutasera":"upercuta","upercutaseram":"upercuta","upercutaserati":"upercuta","upercutasesi":"upercuta","upercutasi":"upercuta","upercutat":"upercuta","upercutati":"upercuta","upercutau":"upercuta","upercuteaza":"upercuta","upercutez":"upercuta","upercutezi":"upercuta","upercutul":"upercut","upercutule":"upercut","upercutului":"upercut","upercuturi":"upercut","upercuturile":"upercut","upercuturilor":"upercut","upovaia":"upovăi","upovaiai":"upovăi","upovaiam":"upovăi","upovaiati":"upovăi","upovaiau":"upovăi","upovaiesc":"upovăi","upovaieste":"upovăi","upovaiesti":"upovăi","upovaii":"upovăi","upovaim":"upovăi","upovaind":"upovăi","upovaira":"upovăi","upovairam":"upovăi","upovairati":"upovăi","upovaise":"upovăi","upovaisem":"upovăi","upovaisera":"upovăi","upovaiseram":"upovăi","upovaiserati":"upovăi","upovaisesi":"upovăi","upovaisi":"upovăi","upovait":"upovăi","upovaiti":"upovăi","upovania":"upovanie","upovaniei":"upovanie","upovanii":"upovanie","upovaniile":"upovanie","upovaniilor":"upovanie","ura":"urî","uracilul":"uracil","uracilule":"uracil","uracilului":"uracil","uracioasa":["urâcioasă","urâcios","urâcioasa","urâcios"],"uracioase":"urâcios","uracioasele":"urâcios","uraciosi":"urâcios","uraciosii":"urâcios","uraciosilor":"urâcios","uraciosul":"urâcios","uraciosule":"urâcios","uraciosului":"urâcios","uraciunea":["urâciunea","urâciune","urăciunea","urăciune"],"uraciuni":["urâciuni","urâciune","urăciuni","urăciune"],"uraciunii":["urâciunii","urâciune","urăciunii","urăciune"],"uraciunile":["urâciunile","urâciune","urăciunile","urăciune"],"uraciunilor":["urâciunilor","urâciune","urăciunilor","urăciune"],"uragane":"uragan","uraganele":"uragan","uraganelor":"uragan","uraganica":["uraganică","uraganic","uraganica","uraganic"],"uraganice":"uraganic","uraganicele":"uraganic","uraganici":"uraganic","uraganicii":"uraganic","uraganicul":"uraganic","uraganul":"uragan","uraganule":"uragan","uraganului":"uragan","urai":["urai","ura","urai","urî","urâi","urî"],"uralele":"urale","uralelor":"urale","uralitul":"uralit","uralitule":"uralit","uralitului":"uralit","uralo-altaica":["uralo-altaică","uralo-altaic","uralo-altaica","uralo-altaic"],"uralo-altaice":["uralo-altaice","uralo-altaic","uralo-altaice","uralo-altaică"],"uralo-altaicei":"uralo-altaică","uralo-altaicele":["uralo-altaicele","uralo-altaic","uralo-altaicele","uralo-altaică"],"uralo-altaicelor":"uralo-altaică","uralo-altaici":"uralo-altaic","uralo-altaicii":"uralo-altaic","uralo-altaicul":"uralo-altaic","uram":["urăm","ura","uram","ura","urâm","urî","uram","urî"],"uranati":"uranat","uranatii":"uranat","uranatilor":"uranat","uranatul":"uranat","uranatule":"uranat","uranatului":"uranat","urand":["urând","ura","urând","urî"],"urangutani":"urangutan","urangutanii":"urangutan","urangutanilor":"urangutan","urangutanul":"urangutan","urangutanule":"urangutan","urangutanului":"urangutan","uraniana":["uraniană","uranian","uraniana","uranian"],"uranianul":"uranian","uranica":["uranică","uranic","uranica","uranic"],"uranice":"uranic","uranicele":"uranic","uranici":"uranic","uranicii":"uranic","uranicul":"uranic","uraniene":"uranian","uranienele":"uranian","uranieni":"uranian","uranienii":"uranian","uranifera":["uraniferă","uranifer","uranifera","uranifer"],"uranifere":"uranifer","uraniferele":"uranifer","uraniferi":"uranifer","uraniferii":"uranifer","uraniferul":"uranifer","uranine":"uranină","uraninei":"uranină","uraninele":"uranină","uraninelor":"uranină","uraninitul":"uraninit","uraninitule":"uraninit","uraninitului":"uraninit","uraniscul":"uranisc","uraniscule":"uranisc","uraniscului":"uranisc","uranismul":"uranism","uranismule":"uranism","uranismului":"uranism","uranisti":"uranist","uranistii":"uranist","uranistilor":"uranist","uranistul":"uranist","uranistule":"uranist","uranistului":"uranist","uranite":"uranit","uranitele":"uranit","uranitelor":"uranit","uranitul":"uranit","uranitule":"uranit","uranitului":"uranit","uraniul":"uraniu","uraniule":"uraniu","uraniului":"uraniu","uranofani":"uranofan","uranofanii":"uranofan","uranofanilor":"uranofan","uranofanul":"uranofan","uranofanule":"uranofan","uranofanului":"uranofan","uranografia":"uranografie","uranografica":["uranografică","uranografic","uranografica","uranografic"],"uranografice":"uranografic","uranograficele":"uranografic","uranografici":"uranografic","uranograficii":"uranografic","uranograficul":"uranografic","uranografiei":"uranografie","uranografii":"uranografie","uranoliti":"uranolit","uranolitii":"uranolit","uranolitilor":"uranolit","uranolitul":"uranolit","uranolitule":"uranolit","uranolitului":"uranolit","uranologia":"uranologie","uranologiei":"uranologie","uranologii":"uranologie","uranometria":"uranometrie","uranometriei":"uranometrie","uranometrii":"uranometrie","uranoplastia":"uranoplastie","uranoplastiei":"uranoplastie","uranoplastii":"uranoplastie","uranoplastiile":"uranoplastie","uranoplastiilor":"uranoplastie","uranotili":"uranotil","uranotilii":"uranotil","uranotililor":"uranotil","uranotilul":"uranotil","uranotilule":"uranotil","uranotilului":"uranotil","urara":["urară","ura","urâră","urî"],"uraram":["urarăm","ura","urârăm","urî"],"urarati":["urarăți","ura","urârăți","urî"],"urarea":"urâre","urari":["urări","urare","urâri","urâre"],"urarii":"urâre","urarile":"urâre","urarilor":"urâre","urasc":"urî","urase":["urase","ura","urâse","urî"],"urasem":["urasem","ura","urâsem","urî"],"urasera":["uraseră","ura","urâseră","urî"],"uraseram":["uraserăm","ura","urâserăm","urî"],"uraserati":["uraserăți","ura","urâserăți","urî"],"urasesi":["uraseși","ura","urâseși","urî"],"urasi":["urași","ura","urâși","urî"],"uraste":"urî","urasti":"urî","urat":["urat","ura","urât","urî"],"urata":["urâtă","urât","urâta","urât"],"urate":"urât","uratea":"urâți","urateai":"urâți","urateam":"urâți","urateati":"urâți","urateau":"urâți","uratela":["urâțelă","urâțel","urâțela","urâțel"],"uratele":["urâtele","urât","urâțele","urâțel"],"uratelele":"urâțel","urateli":"urâțel","uratelii":"urâțel","uratelul":"urâțel","uratenia":"urâțenie","urateniei":"urâțenie","uratenii":"urâțenie","urateniile":"urâțenie","urateniilor":"urâțenie","uratesc":"urâți","urateste":"urâți","uratesti":"urâți","urati":["urați","ura","urâți","urât","urâți","urî","urați","urî"],"uratia":"urație","uratiei":"urație","uratii":["urâții","urât","urâții","urâți","urații","urație"],"uratiile":"urație","uratiilor":"urație","uratim":"urâți","uratind":"urâți","uratira":"urâți","uratiram":"urâți","uratirati":"urâți","uratirea":"urâțire","uratiri":"urâțire","uratirii":"urâțire","uratirile":"urâțire","uratirilor":"urâțire","uratise":"urâți","uratisem":"urâți","uratisera":"urâți","uratiseram":"urâți","uratiserati":"urâți","uratisesi":"urâți","uratisi":"urâți","uratit":"urâți","uratita":["urâțită","urâțit","urâțita","urâțit"],"uratite":"urâțit","uratitele":"urâțit","uratiti":["urâțiți","urâți","urâțiți","urâțit"],"uratitii":"urâțit","uratitul":"urâțit","uratoarea":"urătoare","uratoarei":"urătoare","uratoarele":"urătoare","uratoarelor":"urătoare","uratorese":"urătoreasă","uratoresei":"urătoreasă","uratoresele":"urătoreasă","uratoreselor":"urătoreasă","uratori":["urâtori","urâtor","urători","urător"],"uratorii":["urâtorii","urâtor","urătorii","urător"],"uratorilor":["urâtorilor","urâtor","urătorilor","urător"],"uratorul":["urâtorul","urâtor","urătorul","urător"],"uratorule":["urâtorule","urâtor","urătorule","urător"],"uratorului":["urâtorului","urâtor","urătorului","urător"],"uratul":["uratul","urat","urâtul","urât"],"uratule":"urat","uratului":"urat","urature":"urătură","uraturei":"urătură","uraturele":"urătură","uraturelor":"urătură","uraturi":["uraturi","urat","uraturi","urătură"],"uraturile":"urat","uraturilor":"urat","uratuta":["urâtuță","urâtuț","urâtuța","urâtuț"],"uratute":"urâtuț","uratutele":"urâtuț","uratuti":"urâtuț","uratutii":"urâtuț","uratutul":"urâtuț","urau":["urau","ura","urau","urî"],"urbana":["urbană","urban","urbana","urban"],"urbane":"urban","urbanele":"urban","urbani":"urban","urbanii":"urban","urbanismul":"urbanism","urbanismule":"urbanism","urbanismului":"urbanism","urbaniste":"urbanistă","urbanistei":"urbanistă","urbanistele":"urbanistă","urbanistelor":"urbanistă","urbanisti":"urbanist","urbanistica":["urbanistică","urbanistic","urbanistica","urbanistic"],"urbanistice":["urbanistice","urbanistic","urbanistice","urbanistică"],"urbanisticei":"urbanistică","urbanisticele":["urbanisticele","urbanistic","urbanisticele","urbanistică"],"urbanisticelor":"urbanistică","urbanistici":"urbanistic","urbanisticii":"urbanistic","urbanisticul":"urbanistic","urbanistii":"urbanist","urbanistilor":"urbanist","urbanistul":"urbanist","urbanistule":"urbanist","urbanistului":"urbanist","urbanitatea":"urbanitate","urbanitati":"urbanitate","urbanitatii":"urbanitate","urbanizai":"urbaniza","urbanizam":["urbanizăm","urbaniza","urbanizam","urbaniza"],"urbanizand":"urbaniza","urbanizara":"urbaniza","urbanizaram":"urbaniza","urbanizarati":"urbaniza","urbanizarea":"urbanizare","urbanizari":"urbanizare","urbanizarii":"urbanizare","urbanizarile":"urbanizare","urbanizarilor":"urbanizare","urbanizase":"urbaniza","urbanizasem":"urbaniza","urbanizasera":"urbaniza","urbanizaseram":"urbaniza","urbanizaserati":"urbaniza","urbanizasesi":"urbaniza","urbanizasi":"urbaniza","urbanizat":"urbaniza","urbanizata":["urbanizată","urbanizat","urbanizata","urbanizat"],"urbanizate":"urbanizat","urbanizatele":"urbanizat","urbanizati":["urbanizați","urbaniza","urbanizați","urbanizat"],"urbanizatii":"urbanizat","urbanizatul":"urbanizat","urbanizau":"urbaniza","urbanizeaza":"urbaniza","urbanizez":"urbaniza","urbanizezi":"urbaniza","urbanul":"urban","urbarii":"urbariu","urbariile":"urbariu","urbariilor":"urbariu","urbariul":"urbariu","urbariule":"urbariu","urbariului":"urbariu","urbea":"urbe","urbei":"urbe","urc":"urca","urcai":"urca","urcam":["urcăm","urca","urcam","urca"],"urcand":"urca","urcara":"urca","urcaram":"urca","urcarati":"urca","urcarea":"urcare","urcari":"urcare","urcarii":"urcare","urcarile":"urcare","urcarilor":"urcare","urcase":"urca","urcasem":"urca","urcasera":"urca","urcaseram":"urca","urcaserati":"urca","urcasesi":"urca","urcasi":"urca","urcat":"urca","urcata":["urcată","urcat","urcata","urcat"],"urcate":"urcat","urcatele":"urcat","urcati":["urcați","urca","urcați","urcat"],"urcatii":"urcat","urcatoare":"urcător","urcatoarea":"urcător","urcatoarele":"urcător","urcatori":"urcător","urcatorii":"urcător","urcatorul":"urcător","urcatul":"urcat","urcatule":"urcat","urcatului":"urcat","urcaturi":"urcătură","urcaturii":"urcătură","urcaturile":"urcătură","urcaturilor":"urcătură","urcau":"urca","urce":"urca","urceolata":["urceolată","urceolat","urceolata","urceolat"],"urceolate":"urceolat","urceolatele":"urceolat","urceolati":"urceolat","urceolatii":"urceolat","urceolatul":"urceolat","urceole":"urceol","urceolele":"urceol","urceolelor":"urceol","urceolul":"urceol","urceolule":"urceol","urceolului":"urceol","urci":"urca","urcioare":"urcior","urcioarele":"urcior","urcioarelor":"urcior","urciorase":"urcioraș","urciorasele":"urcioraș","urcioraselor":"urcioraș","urciorasul":"urcioraș","urciorasule":"urcioraș","urciorasului":"urcioraș","urciorele":"urciorel","urciorelele":"urciorel","urciorelelor":"urciorel","urciorelul":"urciorel","urciorelule":"urciorel","urciorelului":"urciorel","urciorul":"urcior","urciorule":"urcior","urciorului":"urcior","urcioruse":"urcioruș","urciorusele":"urcioruș","urcioruselor":"urcioruș","urciorusul":"urcioruș","urciorusule":"urcioruș","urciorusului":"urcioruș","urciorute":"urcioruț","urciorutele":"urcioruț","urciorutelor":"urcioruț","urciorutul":"urcioruț","urciorutule":"urcioruț","urciorutului":"urcioruț","urcusul":"urcuș","urcusule":"urcuș","urcusului":"urcuș","urcusuri":"urcuș","urcusurile":"urcuș","urcusurilor":"urcuș","urdari":"urdar","urdarii":"urdar","urdarilor":"urdar","urdarul":"urdar","urdarule":"urdar","urdarului":"urdar","urde":"urdă","urdea":"urdi","urdeai":"urdi","urdeam":"urdi","urdeati":"urdi","urdeau":"urdi","urdei":"urdă","urdelniti":"urdelniță","urdelnitii":"urdelniță","urdelnitile":"urdelniță","urdelnitilor":"urdelniță","urdesc":"urdi","urdeste":"urdi","urdesti":"urdi","urdi":"urzi","urdii":"urdi","urdim":"urdi","urdin":"urdina","urdinai":"urdina","urdinam":["urdinăm","urdina","urdinam","urdina"],"urdinand":"urdina","urdinara":"urdina","urdinaram":"urdina","urdinarati":"urdina","urdinarea":"urdinare","urdinari":"urdinare","urdinarii":"urdinare","urdinarile":"urdinare","urdinarilor":"urdinare","urdinase":"urdina","urdinasem":"urdina","urdinasera":"urdina","urdinaseram":"urdina","urdinaserati":"urdina","urdinasesi":"urdina","urdinasi":"urdina","urdinat":"urdina","urdinati":"urdina","urdinau":"urdina","urdind":"urdi","urdine":"urdina","urdini":"urdina","urdinisul":"urdiniș","urdinisule":"urdiniș","urdinisului":"urdiniș","urdinisuri":"urdiniș","urdinisurile":"urdiniș","urdinisurilor":"urdiniș","urdinusul":"urdinuș","urdinusule":"urdinuș","urdinusului":"urdinuș","urdira":"urdi","urdiram":"urdi","urdirati":"urdi","urdise":"urdi","urdisem":"urdi","urdisera":"urdi","urdiseram":"urdi","urdiserati":"urdi","urdisesi":"urdi","urdisi":"urdi","urdit":"urdi","urdite":"urdiță","urditei":"urdiță","urditi":"urdi","urdoarea":"urdoare","urdori":"urdoare","urdorii":"urdoare","urdorile":"urdoare","urdorilor":"urdoare","urduc":"urduca","urducai":"urduca","urducam":["urducăm","urduca","urducam","urduca"],"urducand":"urduca","urducara":"urduca","urducaram":"urduca","urducarati":"urduca","urducase":"urduca","urducasem":"urduca","urducasera":"urduca","urducaseram":"urduca","urducaserati":"urduca","urducasesi":"urduca","urducasi":"urduca","urducat":"urduca","urducati":"urduca","urducau":"urduca","urduci":"urduca","urdul":"urdu","urdule":"urdu","urdului":"urdu","urduroasa":["urduroasă","urduros","urduroasa","urduros"],"urduroase":"urduros","urduroasele":"urduros","urdurosi":"urduros","urdurosii":"urduros","urdurosul":"urduros","ureaza":"ura","ureche":"urechea","urechea":"ureche","urecheai":"urechea","urecheam":"urechea","urecheara":"urechea","urechearam":"urechea","urechearati":"urechea","urechease":"urechea","urecheasem":"urechea","urecheasera":"urechea","urecheaseram":"urechea","urecheaserati":"urechea","urecheasesi":"urechea","urecheasi":"urechea","urecheat":"urechea","urecheata":["urecheată","urecheat","urecheata","urecheat"],"urecheate":"urecheat","urecheatele":"urecheat","urecheati":["urecheați","urechea","urecheați","urecheat"],"urecheatii":"urecheat","urecheatul":"urecheat","urecheau":"urechea","urecheaza":"urechea","urechele":"urecheală","urechelei":"urecheală","urechelele":"urecheală","urechelelor":"urecheală","urecheli":"urecheală","urechelnite":"urechelniță","urechelnitei":"urechelniță","urechelnitele":"urechelniță","urechelnitelor":"urechelniță","urechem":"urechea","urechez":"urechea","urechezi":"urechea","urechi":"ureche","urechi externe":"ureche externă","urechi interne":"ureche internă","urechi medii":"ureche medie","urechie":"ureche","urechii":"ureche","urechilaul":"urechilă","urechilaule":"urechilă","urechilaului":"urechilă","urechile":"ureche","urechilor":"ureche","urechind":"urechea","urechitaul":"urechiță","urechitaule":"urechiță","urechitaului":"urechiță","urechite":"urechiță","urechitei":"urechiță","urechitelor":"urechiță","urechiuse":"urechiușă","urechiusei":"urechiușă","urechiusele":"urechiușă","urechiuselor":"urechiușă","urechiuste":"urechiușcă","urechiustei":"urechiușcă","urechiustele":"urechiușcă","urechiustelor":"urechiușcă","urechiusti":"urechiușcă","urechiute":"urechiuță","urechiutei":"urechiuță","urechiutele":"urechiuță","urechiutelor":"urechiuță","uredospori":"uredospor","uredosporii":"uredospor","uredosporilor":"uredospor","uredosporul":"uredospor","uredosporule":"uredospor","uredosporului":"uredospor","ureea":"uree","ureei":"uree","uremia":"uremie","uremica":["uremică","uremic","uremica","uremic"],"uremice":["uremice","uremic","uremice","uremică"],"uremicei":"uremică","uremicele":["uremicele","uremic","uremicele","uremică"],"uremicelor":"uremică","uremici":"uremic","uremicii":"uremic","uremicul":"uremic","uremiei":"uremie","uremii":"uremie","uremiile":"uremie","uremiilor":"uremie","uretani":"uretan","uretanii":"uretan","uretanilor":"uretan","uretanul":"uretan","uretanule":"uretan","uretanului":"uretan","ureterala":["ureterală","ureteral","ureterala","ureteral"],"ureterale":"ureteral","ureteralele":"ureteral","ureterali":"ureteral","ureteralii":"ureteral","ureteralul":"ureteral","uretere":"ureter","ureterele":"ureter","ureterelor":"ureter","ureterografia":"ureterografie","ureterografiei":"ureterografie","ureterografii":"ureterografie","ureterografiile":"ureterografie","ureterografiilor":"ureterografie","ureterotomia":"ureterotomie","ureterotomiei":"ureterotomie","ureterotomii":"ureterotomie","ureterotomiile":"ureterotomie","ureterotomiilor":"ureterotomie","ureterul":"ureter","ureterule":"ureter","ureterului":"ureter","uretrala":["uretrală","uretral","uretrala","uretral"],"uretrale":"uretral","uretralele":"uretral","uretrali":"uretral","uretralii":"uretral","uretralul":"uretral","uretre":["uretre","uretră","uretre","uretru"],"uretrei":"uretră","uretrele":["uretrele","uretră","uretrele","uretru"],"uretrelor":["uretrelor","uretră","uretrelor","uretru"],"uretrite":"uretrită","uretritei":"uretrită","uretritele":"uretrită","uretritelor":"uretrită","uretrografia":"uretrografie","uretrografiei":"uretrografie","uretrografii":"uretrografie","uretrografiile":"uretrografie","uretrografiilor":"uretrografie","uretroplastia":"uretroplastie","uretroplastiei":"uretroplastie","uretroplastii":"uretroplastie","uretroplastiile":"uretroplastie","uretroplastiilor":"uretroplastie","uretroscoape":"uretroscop","uretroscoapele":"uretroscop","uretroscoapelor":"uretroscop","uretroscopia":"uretroscopie","uretroscopiei":"uretroscopie","uretroscopii":"uretroscopie","uretroscopiile":"uretroscopie","uretroscopiilor":"uretroscopie","uretroscopul":"uretroscop","uretroscopule":"uretroscop","uretroscopului":"uretroscop","uretrotomia":"uretrotomie","uretrotomiei":"uretrotomie","uretrotomii":"uretrotomie","uretrotomiile":"uretrotomie","uretrotomiilor":"uretrotomie","uretrul":"uretru","uretrule":"uretru","uretrului":"uretru","urez":"ura","urezi":"ura","urgane":"urgan","urganele":"urgan","urganelor":"urgan","urganul":"urgan","urganule":"urgan","urganului":"urgan","urgelnica":["urgelnică","urgelnic","urgelnica","urgelnic"],"urgelnice":"urgelnic","urgelnicele":"urgelnic","urgelnici":"urgelnic","urgelnicii":"urgelnic","urgelnicul":"urgelnic","urgenta":["urgentă","urgent","urgenta","urgent"],"urgentai":"urgenta","urgentam":["urgentăm","urgenta","urgentam","urgenta"],"urgentand":"urgenta","urgentara":"urgenta","urgentaram":"urgenta","urgentarati":"urgenta","urgentarea":"urgentare","urgentari":"urgentare","urgentarii":"urgentare","urgentarile":"urgentare","urgentarilor":"urgentare","urgentase":"urgenta","urgentasem":"urgenta","urgentasera":"urgenta","urgentaseram":"urgenta","urgentaserati":"urgenta","urgentasesi":"urgenta","urgentasi":"urgenta","urgentat":"urgenta","urgentata":["urgentată","urgentat","urgentata","urgentat"],"urgentate":"urgentat","urgentatele":"urgentat","urgentati":["urgentați","urgenta","urgentați","urgentat"],"urgentatii":"urgentat","urgentatul":"urgentat","urgentau":"urgenta","urgente":["urgente","urgent","urgențe","urgență"],"urgenteaza":"urgenta","urgentei":"urgență","urgentele":["urgentele","urgent","urgențele","urgență"],"urgentelor":"urgență","urgentez":"urgenta","urgentezi":"urgenta","urgenti":"urgent","urgentii":"urgent","urgentul":"urgent","urgia":"urgie","urgiei":"urgie","urgii":"urgie","urgiile":"urgie","urgiilor":"urgie","urgisea":"urgisi","urgiseai":"urgisi","urgiseam":"urgisi","urgiseati":"urgisi","urgiseau":"urgisi","urgisesc":"urgisi","urgiseste":"urgisi","urgisesti":"urgisi","urgisii":"urgisi","urgisim":"urgisi","urgisind":"urgisi","urgisira":"urgisi","urgisiram":"urgisi","urgisirati":"urgisi","urgisirea":"urgisire","urgisiri":"urgisire","urgisirii":"urgisire","urgisirile":"urgisire","urgisirilor":"urgisire","urgisise":"urgisi","urgisisem":"urgisi","urgisisera":"urgisi","urgisiseram":"urgisi","urgisiserati":"urgisi","urgisisesi":"urgisi","urgisisi":"urgisi","urgisit":"urgisi","urgisita":["urgisită","urgisit","urgisita","urgisit"],"urgisite":"urgisit","urgisitele":"urgisit","urgisiti":["urgisiți","urgisi","urgisiți","urgisit"],"urgisitii":"urgisit","urgisitul":"urgisit","uri":"ură","uriasa":["uriașă","uriaș","uriașa","uriaș"],"uriase":["uriașe","uriaș","uriașe","uriașă"],"uriasei":"uriașă","uriasele":["uriașele","uriaș","uriașele","uriașă"],"uriaselor":"uriașă","uriasi":"uriaș","uriasii":"uriaș","uriasilor":"uriaș","uriasul":"uriaș","uriasule":"uriaș","uriasului":"uriaș","urica":["urică","uric","urica","uric"],"uricari":"uricar","uricarii":"uricar","uricarilor":"uricar","uricarul":"uricar","uricarule":"uricar","uricarului":"uricar","urice":"uric","uricele":"uric","uricelor":"uric","uricemia":"uricemie","uricemiei":"uricemie","uricemii":"uricemie","uricemiile":"uricemie","uricemiilor":"uricemie","urici":"uric","uricii":"uric","uricioasa":["uricioasă","uricios","uricioasa","uricios"],"uricioase":"uricios","uricioasele":"uricios","uriciosi":"uricios","uriciosii":"uricios","uriciosul":"uricios","uricirea":"uricire","uriciri":"uricire","uricirii":"uricire","uricirile":"uricire","uricirilor":"uricire","uriciunea":"uriciune","uriciuni":"uriciune","uriciunii":"uriciune","uriciunile":"uriciune","uriciunilor":"uriciune","uricul":"uric","uricule":"uric","uricului":"uric","urieseasca":["urieșească","urieșesc","urieșeasca","urieșesc"],"uriesescul":"urieșesc","uriesesti":"urieșesc","uriesestii":"urieșesc","uriesestile":"urieșesc","uriesite":"urieșiță","uriesitei":"urieșiță","uriesitele":"urieșiță","uriesitelor":"urieșiță","urii":"ură","urile":"ură","urilor":"ură","urinai":"urina","urinale":"urinal","urinalele":"urinal","urinalelor":"urinal","urinalul":"urinal","urinalule":"urinal","urinalului":"urinal","urinam":["urinăm","urina","urinam","urina"],"urinand":"urina","urinara":["urinară","urina","urinară","urinar","urinara","urinar"],"urinaram":"urina","urinarati":"urina","urinare":"urinar","urinarea":"urinare","urinarele":"urinar","urinari":["urinari","urinar","urinări","urinare"],"urinarii":["urinarii","urinar","urinării","urinare"],"urinarile":"urinare","urinarilor":"urinare","urinarul":"urinar","urinase":"urina","urinasem":"urina","urinasera":"urina","urinaseram":"urina","urinaserati":"urina","urinasesi":"urina","urinasi":"urina","urinat":"urina","urinata":["urinată","urinat","urinata","urinat"],"urinate":"urinat","urinatele":"urinat","urinati":["urinați","urina","urinați","urinat"],"urinatii":"urinat","urinatul":"urinat","urinau":"urina","urine":"urină","urineaza":"urina","urinei":"urină","urinele":"urineală","urinelei":"urineală","urinelele":"urineală","urinelelor":"urineală","urineli":"urineală","urinez":"urina","urinezi":"urina","urinifera":["uriniferă","urinifer","urinifera","urinifer"],"urinifere":"urinifer","uriniferele":"urinifer","uriniferi":"urinifer","uriniferii":"urinifer","uriniferul":"urinifer","urinoasa":["urinoasă","urinos","urinoasa","urinos"],"urinoase":"urinos","urinoasele":"urinos","urinosi":"urinos","urinosii":"urinos","urinosul":"urinos","urit":"urât","urita":["urită","urit","urita","urit"],"urite":"urit","uritele":"urit","uriti":"urit","uritii":"urit","uritul":"urit","urlabul":"urlab","urlabule":"urlab","urlabului":"urlab","urlai":"urla","urlam":["urlăm","urla","urlam","urla"],"urland":"urla","urlara":"urla","urlaram":"urla","urlarati":"urla","urlarea":"urlare","urlari":"urlare","urlarii":"urlare","urlarile":"urlare","urlarilor":"urlare","urlase":"urla","urlasem":"urla","urlasera":"urla","urlaseram":"urla","urlaserati":"urla","urlasesi":"urla","urlasi":"urla","urlat":"urla","urlati":"urla","urlatoarea":"urlătoare","urlatoarei":"urlătoare","urlatoarele":"urlătoare","urlatoarelor":"urlătoare","urlatori":"urlător","urlatul":"urlat","urlatule":"urlat","urlatului":"urlat","urlau":"urla","urle":"urla","urlete":"urlet","urletele":"urlet","urletelor":"urlet","urletul":"urlet","urletule":"urlet","urletului":"urlet","urli":"urla","urloaie":"urloi","urloaiele":"urloi","urloaielor":"urloi","urloieri":"urloier","urloierii":"urloier","urloierilor":"urloier","urloierul":"urloier","urloierule":"urloier","urloierului":"urloier","urloiul":"urloi","urloiule":"urloi","urloiului":"urloi","urlu":"urla","urluia":"urlui","urluiai":"urlui","urluiam":"urlui","urluiati":"urlui","urluiau":"urlui","urluiele":"urluială","urluielei":"urluială","urluielele":"urluială","urluielelor":"urluială","urluieli":"urluială","urluiesc":"urlui","urluieste":"urlui","urluiesti":"urlui","urluii":"urlui","urluim":"urlui","urluind":"urlui","urluira":"urlui","urluiram":"urlui","urluirati":"urlui","urluise":"urlui","urluisem":"urlui","urluisera":"urlui","urluiseram":"urlui","urluiserati":"urlui","urluisesi":"urlui","urluisi":"urlui","urluit":"urlui","urluita":["urluită","urluit","urluita","urluit"],"urluite":"urluit","urluitele":"urluit","urluiti":["urluiți","urlui","urluiți","urluit"],"urluitii":"urluit","urluitoarea":"urluitoare","urluitori":"urluitoare","urluitorii":"urluitoare","urluitorile":"urluitoare","urluitorilor":"urluitoare","urluitul":"urluit","urmai":"urma","urmam":["urmăm","urma","urmam","urma"],"urmand":"urma","urmara":"urma","urmaram":"urma","urmarati":"urma","urmarea":["urmarea","urmare","urmărea","urmări"],"urmareai":"urmări","urmaream":"urmări","urmareati":"urmări","urmareau":"urmări","urmaresc":"urmări","urmareste":"urmări","urmaresti":"urmări","urmari":"urmare","urmarii":["urmării","urmare","urmării","urmări"],"urmarile":"urmare","urmarilor":"urmare","urmarim":"urmări","urmarind":"urmări","urmarira":"urmări","urmariram":"urmări","urmarirati":"urmări","urmarirea":"urmărire","urmariri":"urmărire","urmaririi":"urmărire","urmaririle":"urmărire","urmaririlor":"urmărire","urmarise":"urmări","urmarisem":"urmări","urmarisera":"urmări","urmariseram":"urmări","urmariserati":"urmări","urmarisesi":"urmări","urmarisi":"urmări","urmarit":"urmări","urmarite":"urmărită","urmaritei":"urmărită","urmaritele":"urmărită","urmaritelor":"urmărită","urmariti":["urmăriți","urmări","urmăriți","urmărit"],"urmaritii":"urmărit","urmaritilor":"urmărit","urmaritoarea":"urmăritoare","urmaritoarei":"urmăritoare","urmaritoarele":"urmăritoare","urmaritoarelor":"urmăritoare","urmaritori":"urmăritor","urmaritorii":"urmăritor","urmaritorilor":"urmăritor","urmaritorul":"urmăritor","urmaritorule":"urmăritor","urmaritorului":"urmăritor","urmaritul":"urmărit","urmaritule":"urmărit","urmaritului":"urmărit","urmase":["urmase","urma","urmașe","urmașă"],"urmasei":"urmașă","urmasele":"urmașă","urmaselor":"urmașă","urmasem":"urma","urmasera":"urma","urmaseram":"urma","urmaserati":"urma","urmasesi":"urma","urmasi":["urmași","urma","urmași","urmaș"],"urmasii":"urmaș","urmasilor":"urmaș","urmasul":"urmaș","urmasule":"urmaș","urmasului":"urmaș","urmat":"urma","urmati":"urma","urmatoare":"următor","urmatoarea":"următor","urmatoarele":"următor","urmatori":"următor","urmatorii":"următor","urmatorilor":"următor","urmatorul":"următor","urmatorule":"următor","urmatorului":"următor","urmau":"urma","urme":"urmă","urmeaza":"urma","urmei":"urmă","urmele":"urmă","urmelor":"urmă","urmeteale":"urmețeală","urmetealei":"urmețeală","urmez":"urma","urmezi":"urma","urmi":"urm","urmii":"urm","urmilor":"urm","urmisoare":"urmișoară","urmisoarei":"urmișoară","urmisoarele":"urmișoară","urmisoarelor":"urmișoară","urmite":"urmiță","urmitei":"urmiță","urmitele":"urmiță","urmitelor":"urmiță","urmuia":"urmui","urmuiai":"urmui","urmuiam":"urmui","urmuiati":"urmui","urmuiau":"urmui","urmuie":"urmui","urmuii":"urmui","urmuim":"urmui","urmuind":"urmui","urmuira":"urmui","urmuiram":"urmui","urmuirati":"urmui","urmuise":"urmui","urmuisem":"urmui","urmuisera":"urmui","urmuiseram":"urmui","urmuiserati":"urmui","urmuisesi":"urmui","urmuisi":"urmui","urmuit":"urmui","urmuiti":"urmui","urmul":"urm","urmule":"urm","urmulite":"urmuliță","urmulitei":"urmuliță","urmulitele":"urmuliță","urmulitelor":"urmuliță","urmului":"urm","urmusoare":"urmușoară","urmusoarei":"urmușoară","urmusoarele":"urmușoară","urmusoarelor":"urmușoară","urmute":"urmuță","urmutei":"urmuță","urmutele":"urmuță","urmutelor":"urmuță","urne":"urnă","urne cinerare":"urnă cinerară","urnea":"urni","urneai":"urni","urneam":"urni","urneati":"urni","urneau":"urni","urnei":"urnă","urnele":"urnă","urnelor":"urnă","urnesc":"urni","urneste":"urni","urnesti":"urni","urnii":"urni","urnim":"urni","urnind":"urni","urnira":"urni","urniram":"urni","urnirati":"urni","urnirea":"urnire","urniri":"urnire","urnirii":"urnire","urnirile":"urnire","urnirilor":"urnire","urnise":"urni","urnisem":"urni","urnisera":"urni","urniseram":"urni","urniserati":"urni","urnisesi":"urni","urnisi":"urni","urnit":"urni","urniti":"urni","urobacteria":"urobacterie","urobacteriei":"urobacterie","urobacterii":"urobacterie","urobacteriile":"urobacterie","urobacteriilor":"urobacterie","urobiline":"urobilină","urobilinei":"urobilină","urobilinele":"urobilină","urobilinelor":"urobilină","urobilinogenul":"urobilinogen","urobilinogenule":"urobilinogen","urobilinogenului":"urobilinogen","urocordate":"urocordat","urocordatele":"urocordat","urocordatelor":"urocordat","urocordatul":"urocordat","urocordatule":"urocordat","urocordatului":"urocordat","uroculture":"urocultură","uroculturei":"urocultură","uroculturele":"urocultură","uroculturelor":"urocultură","uroculturi":"urocultură","urodele":"urodel","urodelele":"urodel","urodelelor":"urodel","urodelul":"urodel","urodelule":"urodel","urodelului":"urodel","urodiva":["urodivă","urodiv","urodiva","urodiv"],"urodive":"urodiv","urodivele":"urodiv","urodivi":"urodiv","urodivii":"urodiv","urodivul":"urodiv","urogastrone":"urogastronă","urogastronei":"urogastronă","urogenitala":["urogenitală","urogenital","urogenitala","urogenital"],"urogenitale":"urogenital","urogenitalele":"urogenital","urogenitali":"urogenital","urogenitalii":"urogenital","urogenitalul":"urogenital","urografia":"urografie","urografiei":"urografie","urografii":"urografie","urografiile":"urografie","urografiilor":"urografie","urologe":"urologă","urologei":"urologă","urologele":"urologă","urologelor":"urologă","urologi":"urolog","urologia":"urologie","urologica":["urologică","urologic","urologica","urologic"],"urologice":"urologic","urologicele":"urologic","urologici":"urologic","urologicii":"urologic","urologicul":"urologic","urologiei":"urologie","urologii":["urologii","urolog","urologii","urologie"],"urologilor":"urolog","urologul":"urolog","urologule":"urolog","urologului":"urolog","urometre":"urometru","urometrele":"urometru","urometrelor":"urometru","urometrul":"urometru","urometrule":"urometru","urometrului":"urometru","uroscopia":"uroscopie","uroscopiei":"uroscopie","uroscopii":"uroscopie","uroscopiile":"uroscopie","uroscopiilor":"uroscopie","urotropine":"urotropină","urotropinei":"urotropină","urotropinele":"urotropină","urotropinelor":"urotropină","ursaci":"ursac","ursacii":"ursac","ursacilor":"ursac","ursacul":"ursac","ursacule":"ursac","ursacului":"ursac","ursareasca":["ursărească","ursăresc","ursăreasca","ursăresc"],"ursarescul":"ursăresc","ursarese":"ursăreasă","ursaresei":"ursăreasă","ursaresele":"ursăreasă","ursareselor":"ursăreasă","ursaresti":"ursăresc","ursarestii":"ursăresc","ursarestile":"ursăresc","ursari":"ursar","ursarii":"ursar","ursarilor":"ursar","ursarimea":"ursărime","ursarimi":"ursărime","ursarimii":"ursărime","ursarite":"ursăriță","ursaritei":"ursăriță","ursaritele":"ursăriță","ursaritelor":"ursăriță","ursarul":"ursar","ursarule":"ursar","ursarului":"ursar","urse":"ursă","ursea":"ursi","urseai":"ursi","urseam":"ursi","urseasca":["ursească","ursesc","urseasca","ursesc"],"urseati":"ursi","urseau":"ursi","ursei":"ursă","urseiul":"ursei","urseiule":"ursei","urseiului":"ursei","ursele":"ursă","urselor":"ursă","ursesc":"ursi","ursescul":"ursesc","urseste":"ursi","ursesti":["ursești","ursesc","ursești","ursi"],"ursestii":"ursesc","ursestile":"ursesc","ursi":"urs","ursi albi":"urs alb","ursi bruni":"urs brun","ursi cu ochelari":"urs cu ochelari","ursi grizzly":"urs grizzly","ursi koala":"urs koala","ursi kodiak":"urs Kodiak","ursi negri americani":"urs negru american","ursi panda":"urs panda","ursi polari":"urs polar","urside":"ursidă","ursidei":"ursidă","ursidele":"ursidă","ursidelor":"ursidă","ursii":["urșii","urs","ursii","ursi"],"ursilor":"urs","ursim":"ursi","ursina":["ursină","ursin","ursina","ursin"],"ursind":"ursi","ursine":"ursin","ursinele":"ursin","ursini":"ursin","ursinice":"urșinic","ursinicele":"urșinic","ursinicelor":"urșinic","ursinicul":"urșinic","ursinicule":"urșinic","ursinicului":"urșinic","ursinii":"ursin","ursinul":"ursin","ursira":"ursi","ursiram":"ursi","ursirati":"ursi","ursirea":"ursire","ursiri":"ursire","ursirii":"ursire","ursirile":"ursire","ursirilor":"ursire","ursise":"ursi","ursisem":"ursi","ursisera":"ursi","ursiseram":"ursi","ursiserati":"ursi","ursisesi":"ursi","ursisi":"ursi","ursisori":"ursișor","ursisorii":"ursișor","ursisorilor":"ursișor","ursisorul":"ursișor","ursisorule":"ursișor","ursisorului":"ursișor","ursit":"ursi","ursita":["ursită","ursit","ursita","ursit"],"ursite":["ursite","ursit","ursite","ursită"],"ursitei":"ursită","ursitele":["ursitele","ursit","ursitele","ursită"],"ursitelor":"ursită","ursiti":["ursiți","ursi","ursiți","ursit"],"ursitii":"ursit","ursitoarea":"ursitoare","ursitoarei":"ursitoare","ursitoarele":"ursitoare","ursitoarelor":"ursitoare","ursitul":"ursit","ursoaice":"ursoaică","ursoaicei":"ursoaică","ursoaicele":"ursoaică","ursoaicelor":"ursoaică","ursoaiea":"ursoaie","ursoi":"ursoaie","ursoicute":"ursoicuță","ursoicutei":"ursoicuță","ursoicutele":"ursoicuță","ursoicutelor":"ursoicuță","ursoii":"ursoaie","ursoile":"ursoaie","ursoilor":"ursoaie","ursul":"urs","ursule":"urs","ursuleti":"ursuleț","ursuleti spalatori":"ursuleț spălător","ursuletii":"ursuleț","ursuletilor":"ursuleț","ursuletul":"ursuleț","ursuletule":"ursuleț","ursuletului":"ursuleț","ursulicaul":"ursulică","ursulicaule":"ursulică","ursulicaului":"ursulică","ursulici":"ursulică","ursulicii":"ursulică","ursulicilor":"ursulică","ursuline":"ursulină","ursulinei":"ursulină","ursulinele":"ursulină","ursulinelor":"ursulină","ursului":"urs","ursusori":"ursușor","ursusorii":"ursușor","ursusorilor":"ursușor","ursusorul":"ursușor","ursusorule":"ursușor","ursusorului":"ursușor","ursuti":"ursuț","ursutii":"ursuț","ursutilor":"ursuț","ursutul":"ursuț","ursutule":"ursuț","ursutului":"ursuț","ursuza":["ursuză","ursuz","ursuza","ursuz"],"ursuze":"ursuz","ursuzele":"ursuz","ursuzenia":"ursuzenie","ursuzeniei":"ursuzenie","ursuzenii":"ursuzenie","ursuzi":"ursuz","ursuzia":"ursuzie","ursuziei":"ursuzie","ursuzii":["ursuzii","ursuz","ursuzii","ursuzie"],"ursuziile":"ursuzie","ursuziilor":"ursuzie","ursuzlacul":"ursuzlâc","ursuzlacule":"ursuzlâc","ursuzlacului":"ursuzlâc","ursuzul":"ursuz","urticaceea":"urticacee","urticaceei":"urticacee","urticaceele":"urticacee","urticaceelor":"urticacee","urticanta":["urticantă","urticant","urticanta","urticant"],"urticante":"urticant","urticantele":"urticant","urticanti":"urticant","urticantii":"urticant","urticantul":"urticant","urticarea":"urticare","urticari":["urticări","urticare","urticari","urticare"],"urticaria":"urticarie","urticariei":"urticarie","urticarii":["urticarii","urticare","urticarii","urticarie"],"urticariile":"urticarie","urticariilor":"urticarie","urticarile":"urticare","urticarilor":"urticare","urticatia":"urticație","urticatiei":"urticație","urticatii":"urticație","urticatiile":"urticație","urticatiilor":"urticație","uruguayana":["uruguayană","uruguayan","uruguayana","uruguayan"],"uruguayane":"uruguayană","uruguayanei":"uruguayană","uruguayanele":"uruguayană","uruguayanelor":"uruguayană","uruguayanul":"uruguayan","uruguayanule":"uruguayan","uruguayanului":"uruguayan","uruguayene":"uruguayan","uruguayenele":"uruguayan","uruguayeni":"uruguayan","uruguayenii":"uruguayan","uruguayenilor":"uruguayan","uruia":"urui","uruiai":"urui","uruiam":"urui","uruiati":"urui","uruiau":"urui","uruiele":"uruială","uruielei":"uruială","uruielele":"uruială","uruielelor":"uruială","uruieli":"uruială","uruiesc":"urui","uruieste":"urui","uruiesti":"urui","uruii":"urui","uruim":"urui","uruind":"urui","uruira":"urui","uruiram":"urui","uruirati":"urui","uruise":"urui","uruisem":"urui","uruisera":"urui","uruiseram":"urui","uruiserati":"urui","uruisesi":"urui","uruisi":"urui","uruit":"urui","uruita":["uruită","uruit","uruita","uruit"],"uruite":"uruit","uruitele":"uruit","uruiti":["uruiți","urui","uruiți","uruit"],"uruitii":"uruit","uruitoarea":"uruitoare","uruitori":"uruitoare","uruitorii":"uruitoare","uruitorile":"uruitoare","uruitorilor":"uruitoare","uruitul":"uruit","uruituri":"uruitură","uruiturii":"uruitură","uruiturile":"uruitură","uruiturilor":"uruitură","urzarese":"urzăreasă","urzaresei":"urzăreasă","urzaresele":"urzăreasă","urzareselor":"urzăreasă","urzea":"urzi","urzeai":"urzi","urzeam":"urzi","urzeati":"urzi","urzeau":"urzi","urzeli":"urzeală","urzelii":"urzeală","urzelile":"urzeală","urzelilor":"urzeală","urzesc":"urzi","urzeste":"urzi","urzesti":"urzi","urzic":"urzica","urzicai":"urzica","urzicam":["urzicăm","urzica","urzicam","urzica"],"urzicand":"urzica","urzicara":"urzica","urzicaram":"urzica","urzicarati":"urzica","urzicarea":"urzicare","urzicari":"urzicare","urzicarii":"urzicare","urzicarile":"urzicare","urzicarilor":"urzicare","urzicase":"urzica","urzicasem":"urzica","urzicasera":"urzica","urzicaseram":"urzica","urzicaserati":"urzica","urzicasesi":"urzica","urzicasi":"urzica","urzicat":"urzica","urzicata":["urzicată","urzicat","urzicata","urzicat"],"urzicate":"urzicat","urzicatele":"urzicat","urzicati":["urzicați","urzica","urzicați","urzicat"],"urzicatii":"urzicat","urzicatoare":"urzicător","urzicatoarea":"urzicător","urzicatoarele":"urzicător","urzicatori":"urzicător","urzicatorii":"urzicător","urzicatorul":"urzicător","urzicatul":"urzicat","urzicaturi":"urzicătură","urzicaturii":"urzicătură","urzicaturile":"urzicătură","urzicaturilor":"urzicătură","urzicau":"urzica","urziceaua":"urzicea","urzicele":"urzicea","urzicelei":"urzicea","urzicelele":"urzicea","urzicelelor":"urzicea","urzici":["urzici","urzica","urzici","urzică"],"urzici moarte":"urzică moartă","urzicia":"urziciu","urzicie":"urziciu","urzicii":["urzicii","urzică","urzicii","urziciu"],"urziciii":"urziciu","urziciile":"urziciu","urzicile":"urzică","urzicilor":"urzică","urziciul":"urziciu","urzicute":"urzicuță","urzicutei":"urzicuță","urzicutele":"urzicuță","urzicutelor":"urzicuță","urzii":"urzi","urzim":"urzi","urzind":"urzi","urzira":"urzi","urziram":"urzi","urzirati":"urzi","urzirea":"urzire","urziri":"urzire","urzirii":"urzire","urzirile":"urzire","urzirilor":"urzire","urzise":"urzi","urzisem":"urzi","urzisera":"urzi","urziseram":"urzi","urziserati":"urzi","urzisesi":"urzi","urzisi":"urzi","urzit":"urzi","urziti":"urzi","urzito":"urzitor","urzitoarea":"urzitoare","urzitoarei":"urzitoare","urzitoarele":"urzitoare","urzitoarelor":"urzitoare","urzitorese":"urzitoreasă","urzitoresei":"urzitoreasă","urzitoresele":"urzitoreasă","urzitoreselor":"urzitoreasă","urzitori":"urzitor","urzitorii":"urzitor","urzitorile":"urzitor","urzitorilor":"urzitor","urzitul":"urzit","urzitule":"urzit","urzitului":"urzit","urzituri":"urzitură","urziturii":"urzitură","urziturile":"urzitură","urziturilor":"urzitură","urzoiesul":"urzoieș","urzoiesule":"urzoieș","urzoiesului":"urzoieș","usari":"ușar","usarii":"ușar","usarilor":"ușar","usarnice":"ușarnică","usarnicei":"ușarnică","usarnicele":"ușarnică","usarnicelor":"ușarnică","usarul":"ușar","usarule":"ușar","usarului":"ușar","uscacioasa":["uscăcioasă","uscăcios","uscăcioasa","uscăcios"],"uscacioase":"uscăcios","uscacioasele":"uscăcios","uscaciora":["uscăcioră","uscăcior","uscăciora","uscăcior"],"uscaciore":"uscăcior","uscaciorele":"uscăcior","uscaciori":"uscăcior","uscaciorii":"uscăcior","uscaciorul":"uscăcior","uscaciosi":"uscăcios","uscaciosii":"uscăcios","uscaciosul":"uscăcios","uscaciunea":"uscăciune","uscaciuni":"uscăciune","uscaciunii":"uscăciune","uscaciunile":"uscăciune","uscaciunilor":"uscăciune","uscai":"usca","uscam":["uscăm","usca","uscam","usca"],"uscand":"usca","uscara":"usca","uscaram":"usca","uscarati":"usca","uscarea":"uscare","uscari":"uscare","uscarii":"uscare","uscarile":"uscare","uscarilor":"uscare","uscase":"usca","uscasem":"usca","uscasera":"usca","uscaseram":"usca","uscaserati":"usca","uscasesi":"usca","uscasi":"usca","uscat":"usca","uscata":["uscată","uscat","uscata","uscat"],"uscate":"uscat","uscatei":"uscățel","uscateii":"uscățel","uscateilor":"uscățel","uscatele":"uscat","uscatelul":"uscățel","uscatelule":"uscățel","uscatelului":"uscățel","uscati":["uscați","usca","uscați","uscat"],"uscatii":"uscat","uscativa":["uscățivă","uscățiv","uscățiva","uscățiv"],"uscative":"uscățiv","uscativele":"uscățiv","uscativi":"uscățiv","uscativii":"uscățiv","uscativul":"uscățiv","uscatoarea":"uscătoare","uscatoarei":"uscătoare","uscatoarele":"uscătoare","uscatoarelor":"uscătoare","uscatori":"uscător","uscatoria":"uscătorie","uscatoriei":"uscătorie","uscatorii":"uscătorie"};
@@ -0,0 +1 @@
+export default {"uscatoriile":"uscătorie","uscatoriilor":"uscătorie","uscatorile":"uscător","uscatorilor":"uscător","uscatorul":"uscător","uscatorule":"uscător","uscatorului":"uscător","uscatul":"uscat","uscatureaua":"uscăturea","uscaturele":["uscăturele","uscăturea","uscăturele","uscăturică"],"uscaturelei":["uscăturelei","uscăturea","uscăturelei","uscăturică"],"uscaturelele":["uscăturelele","uscăturea","uscăturelele","uscăturică"],"uscaturelelor":["uscăturelelor","uscăturea","uscăturelelor","uscăturică"],"uscaturi":"uscătură","uscaturii":"uscătură","uscaturile":"uscătură","uscaturilor":"uscătură","uscau":"usca","uschea":"ușchi","uscheai":"ușchi","uscheam":"ușchi","uscheati":"ușchi","uscheau":"ușchi","uschesc":"ușchi","uscheste":"ușchi","uschesti":"ușchi","uschii":"ușchi","uschim":"ușchi","uschind":"ușchi","uschira":"ușchi","uschiram":"ușchi","uschirati":"ușchi","uschise":"ușchi","uschisem":"ușchi","uschisera":"ușchi","uschiseram":"ușchi","uschiserati":"ușchi","uschisesi":"ușchi","uschisi":"ușchi","uschit":"ușchi","uschiti":"ușchi","uscioare":["uscioare","uscioară","ușcioare","ușcioară"],"uscioarei":["uscioarei","uscioară","ușcioarei","ușcioară"],"uscioarele":["uscioarele","uscioară","ușcioarele","ușcioară"],"uscioarelor":["uscioarelor","uscioară","ușcioarelor","ușcioară"],"usciori":["usciori","uscior","ușciori","ușcior"],"usciorii":["usciorii","uscior","ușciorii","ușcior"],"usciorilor":["usciorilor","uscior","ușciorilor","ușcior"],"usciorul":["usciorul","uscior","ușciorul","ușcior"],"usciorule":["usciorule","uscior","ușciorule","ușcior"],"usciorului":["usciorului","uscior","ușciorului","ușcior"],"usebi":"osebi","usebita":["usebită","usebit","usebita","usebit"],"usebite":"usebit","usebitele":"usebit","usebiti":"usebit","usebitii":"usebit","usebitul":"usebit","usecnovenia":"usecnovenie","usecnoveniei":"usecnovenie","usecnovenii":"usecnovenie","usecnoveniile":"usecnovenie","usecnoveniilor":"usecnovenie","user":"ușar","userul":"ușer","userule":"ușer","userului":"ușer","usi":"ușă","usi rotative":"ușă rotativă","usi turnante":"ușă turnantă","usieri":"ușier","usierii":"ușier","usierilor":"ușier","usierul":"ușier","usierule":"ușier","usierului":"ușier","usii":"ușă","usile":"ușă","usilor":"ușă","usisoare":"ușișoară","usisoarei":"ușișoară","usisoarele":"ușișoară","usisoarelor":"ușișoară","usite":"ușiță","usitei":"ușiță","usitele":"ușiță","usitelor":"ușiță","usl-ul":"USL","usl-ule":"USL","usl-ului":"USL","usoara":["ușoară","ușor","ușoara","ușor"],"usoare":"ușor","usoarele":"ușor","usori":"ușor","usorii":"ușor","usorilor":"ușor","usorul":"ușor","usorule":"ușor","usorului":"ușor","uspenia":"uspenie","uspeniei":"uspenie","uspenii":"uspenie","uspeniile":"uspenie","uspeniilor":"uspenie","ustale":"usta","ustalei":"usta","ustalele":"usta","ustalelor":"usta","ustasi":"ustaș","ustasii":"ustaș","ustasilor":"ustaș","ustasul":"ustaș","ustasule":"ustaș","ustasului":"ustaș","ustaua":"usta","ustave":"ustavă","ustavei":"ustavă","ustavele":"ustavă","ustavelor":"ustavă","ustavul":"ustav","ustavule":"ustav","ustavului":"ustav","ustavuri":"ustav","ustavurile":"ustav","ustavurilor":"ustav","uste":"usca","ustensile":"ustensilă","ustensilei":"ustensilă","ustensilele":"ustensilă","ustensilelor":"ustensilă","usturand":"ustura","usturara":"ustura","usturarea":"usturare","usturari":"usturare","usturarii":"usturare","usturarile":"usturare","usturarilor":"usturare","usturase":"ustura","usturasera":"ustura","usturat":"ustura","usturatoare":"usturător","usturatoarea":"usturător","usturatoarele":"usturător","usturatori":"usturător","usturatorii":"usturător","usturatorul":"usturător","usturaturi":"usturătură","usturaturii":"usturătură","usturaturile":"usturătură","usturaturilor":"usturătură","usturau":"ustura","usture":"ustura","usturimea":"usturime","usturimi":"usturime","usturimii":"usturime","usturimile":"usturime","usturimilor":"usturime","usturoiai":"usturoia","usturoiam":"usturoia","usturoiara":"usturoia","usturoiaram":"usturoia","usturoiarati":"usturoia","usturoiase":"usturoia","usturoiasem":"usturoia","usturoiasera":"usturoia","usturoiaseram":"usturoia","usturoiaserati":"usturoia","usturoiasesi":"usturoia","usturoiasi":"usturoia","usturoiasul":"usturoiaș","usturoiasule":"usturoiaș","usturoiasului":"usturoiaș","usturoiat":"usturoia","usturoiata":["usturoiată","usturoiat","usturoiata","usturoiat"],"usturoiate":"usturoiat","usturoiatele":"usturoiat","usturoiati":["usturoiați","usturoia","usturoiați","usturoiat"],"usturoiatii":"usturoiat","usturoiatul":"usturoiat","usturoiau":"usturoia","usturoiaza":"usturoia","usturoie":"usturoia","usturoiem":"usturoia","usturoiez":"usturoia","usturoiezi":"usturoia","usturoii":"usturoi","usturoilor":"usturoi","usturoind":"usturoia","usturoite":"usturoiță","usturoitei":"usturoiță","usturoitele":"usturoiță","usturoitelor":"usturoiță","usturoiul":"usturoi","usturoiule":"usturoi","usturoiului":"usturoi","usuc":"usca","usuca":"usca","usuce":"usca","usuci":"usca","usucul":"usuc","usucule":"usuc","usucului":"usuc","usucuri":"usuc","usucurile":"usuc","usucurilor":"usuc","usuia":"ușui","usuiai":"ușui","usuiam":"ușui","usuiati":"ușui","usuiau":"ușui","usuiesc":"ușui","usuieste":"ușui","usuiesti":"ușui","usuii":"ușui","usuim":"ușui","usuind":"ușui","usuira":"ușui","usuiram":"ușui","usuirati":"ușui","usuise":"ușui","usuisem":"ușui","usuisera":"ușui","usuiseram":"ușui","usuiserati":"ușui","usuisesi":"ușui","usuisi":"ușui","usuit":"ușui","usuiti":"ușui","usulite":"ușuliță","usulitei":"ușuliță","usulitele":"ușuliță","usulitelor":"ușuliță","usurai":"ușura","usuram":["ușurăm","ușura","ușuram","ușura"],"usurand":"ușura","usurara":"ușura","usuraram":"ușura","usurarati":"ușura","usurarea":"ușurare","usurari":"ușurare","usurarii":"ușurare","usurarile":"ușurare","usurarilor":"ușurare","usurase":"ușura","usurasem":"ușura","usurasera":"ușura","usuraseram":"ușura","usuraserati":"ușura","usurasesi":"ușura","usurasi":"ușura","usurat":"ușura","usurata":["ușurată","ușurat","ușurata","ușurat"],"usuratatea":"ușurătate","usuratati":"ușurătate","usuratatii":"ușurătate","usurate":"ușurat","usurateca":["ușuratecă","ușuratec","ușurateca","ușuratec"],"usuratece":"ușuratec","usuratecele":"ușuratec","usurateci":"ușuratec","usuratecii":"ușuratec","usuratecul":"ușuratec","usuratele":"ușurat","usurati":["ușurați","ușura","ușurați","ușurat"],"usuratica":["ușuratică","ușuratic","ușuratica","ușuratic"],"usuratice":"ușuratic","usuraticele":"ușuratic","usuratici":"ușuratic","usuraticii":"ușuratic","usuraticul":"ușuratic","usuratii":"ușurat","usuratoare":"ușurător","usuratoarea":"ușurător","usuratoarele":"ușurător","usuratori":"ușurător","usuratorii":"ușurător","usuratorul":"ușurător","usuratul":"ușurat","usurau":"ușura","usure":"ușor","usureaza":"ușura","usurela":["ușurelă","ușurel","ușurela","ușurel"],"usurele":"ușurel","usurelele":"ușurel","usureli":"ușurel","usurelii":"ușurel","usurelul":"ușurel","usurez":"ușura","usurezi":"ușura","usurice":"ușurică","usuricele":"ușurică","usurimea":"ușurime","usurimei":"ușurime","usurinte":"ușurință","usurintei":"ușurință","usurintele":"ușurință","usurintelor":"ușurință","usute":"ușuță","usutei":"ușuță","usutele":"ușuță","usutelor":"ușuță","utalmazul":"utalmaz","utalmazule":"utalmaz","utalmazului":"utalmaz","uteciste":"utecistă","utecistei":"utecistă","utecistele":"utecistă","utecistelor":"utecistă","utere":"uter","uterele":"uter","uterelor":"uter","uterina":["uterină","uterin","uterina","uterin"],"uterine":"uterin","uterinele":"uterin","uterini":"uterin","uterinii":"uterin","uterinul":"uterin","uterul":"uter","uterule":"uter","uterului":"uter","utila":["utilă","util","utila","util"],"utilai":"utila","utilaje":"utilaj","utilajele":"utilaj","utilajelor":"utilaj","utilajul":"utilaj","utilajule":"utilaj","utilajului":"utilaj","utilam":["utilăm","utila","utilam","utila"],"utiland":"utila","utilara":"utila","utilaram":"utila","utilarati":"utila","utilarea":"utilare","utilari":"utilare","utilarii":"utilare","utilarile":"utilare","utilarilor":"utilare","utilase":"utila","utilasem":"utila","utilasera":"utila","utilaseram":"utila","utilaserati":"utila","utilasesi":"utila","utilasi":"utila","utilat":"utila","utilati":"utila","utilau":"utila","utile":"util","utileaza":"utila","utilele":"util","utilez":"utila","utilezi":"utila","utili":"util","utilii":"util","utilitara":["utilitară","utilitar","utilitara","utilitar"],"utilitare":"utilitar","utilitarele":"utilitar","utilitari":"utilitar","utilitarii":"utilitar","utilitarisme":"utilitarism","utilitarismele":"utilitarism","utilitarismelor":"utilitarism","utilitarismul":"utilitarism","utilitarismule":"utilitarism","utilitarismului":"utilitarism","utilitarista":["utilitaristă","utilitarist","utilitarista","utilitarist"],"utilitariste":["utilitariste","utilitarist","utilitariste","utilitaristă"],"utilitaristei":"utilitaristă","utilitaristele":["utilitaristele","utilitarist","utilitaristele","utilitaristă"],"utilitaristelor":"utilitaristă","utilitaristi":"utilitarist","utilitaristii":"utilitarist","utilitaristilor":"utilitarist","utilitaristul":"utilitarist","utilitaristule":"utilitarist","utilitaristului":"utilitarist","utilitarul":"utilitar","utilitatea":"utilitate","utilitati":"utilitate","utilitatii":"utilitate","utilitatile":"utilitate","utilitatilor":"utilitate","utilizabila":["utilizabilă","utilizabil","utilizabila","utilizabil"],"utilizabile":"utilizabil","utilizabilele":"utilizabil","utilizabili":"utilizabil","utilizabilii":"utilizabil","utilizabilul":"utilizabil","utilizai":"utiliza","utilizam":["utilizăm","utiliza","utilizam","utiliza"],"utilizand":"utiliza","utilizara":"utiliza","utilizaram":"utiliza","utilizarati":"utiliza","utilizarea":"utilizare","utilizari":"utilizare","utilizarii":"utilizare","utilizarile":"utilizare","utilizarilor":"utilizare","utilizase":"utiliza","utilizasem":"utiliza","utilizasera":"utiliza","utilizaseram":"utiliza","utilizaserati":"utiliza","utilizasesi":"utiliza","utilizasi":"utiliza","utilizat":"utiliza","utilizati":"utiliza","utilizatori":"utilizator","utilizatorii":"utilizator","utilizatorilor":"utilizator","utilizatorul":"utilizator","utilizatorule":"utilizator","utilizatorului":"utilizator","utilizau":"utiliza","utilizeaza":"utiliza","utilizez":"utiliza","utilizezi":"utiliza","utilul":"util","utopia":"utopie","utopica":["utopică","utopic","utopica","utopic"],"utopice":"utopic","utopicele":"utopic","utopici":"utopic","utopicii":"utopic","utopicul":"utopic","utopiei":"utopie","utopii":"utopie","utopiile":"utopie","utopiilor":"utopie","utopismul":"utopism","utopismule":"utopism","utopismului":"utopism","utopiste":"utopistă","utopistei":"utopistă","utopistele":"utopistă","utopistelor":"utopistă","utopisti":"utopist","utopistii":"utopist","utopistilor":"utopist","utopistul":"utopist","utopistule":"utopist","utopistului":"utopist","utrenea":"utrene","utreni":"utrene","utrenia":"utrenie","utreniei":"utrenie","utrenii":["utrenii","utrene","utrenii","utrenie"],"utreniile":"utrenie","utreniilor":"utrenie","utrenile":"utrene","utrenilor":"utrene","utricule":"utricul","utriculele":"utricul","utriculelor":"utricul","utriculul":"utricul","utriculule":"utricul","utriculului":"utricul","utrine":"utrină","utrinei":"utrină","utrinele":"utrină","utrinelor":"utrină","utul":"ut","utule":"ut","utului":"ut","uvajenia":"uvajenie","uvajeniei":"uvajenie","uvajenii":"uvajenie","uverturi":"uvertură","uverturii":"uvertură","uverturile":"uvertură","uverturilor":"uvertură","uviolul":"uviol","uviolule":"uviol","uviolului":"uviol","uvologia":"uvologie","uvologiei":"uvologie","uvologii":"uvologie","uvologiile":"uvologie","uvologiilor":"uvologie","uvragii":"uvragiu","uvragiile":"uvragiu","uvragiilor":"uvragiu","uvragiuul":"uvragiu","uvragiuule":"uvragiu","uvragiuului":"uvragiu","uvraje":"uvraj","uvrajele":"uvraj","uvrajelor":"uvraj","uvrajul":"uvraj","uvrajule":"uvraj","uvrajului":"uvraj","uvriere":"uvrieră","uvrierei":"uvrieră","uvrierele":"uvrieră","uvrierelor":"uvrieră","uvrieri":"uvrier","uvrierii":"uvrier","uvrierilor":"uvrier","uvrierul":"uvrier","uvrierule":"uvrier","uvrierului":"uvrier","uvulara":["uvulară","uvular","uvulara","uvular"],"uvulare":"uvular","uvularele":"uvular","uvulari":"uvular","uvularii":"uvular","uvularul":"uvular","uvule":"uvulă","uvulei":"uvulă","uvulele":"uvulă","uvulelor":"uvulă","uzabila":["uzabilă","uzabil","uzabila","uzabil"],"uzabile":"uzabil","uzabilele":"uzabil","uzabili":"uzabil","uzabilii":"uzabil","uzabilitatea":"uzabilitate","uzabilitati":"uzabilitate","uzabilitatii":"uzabilitate","uzabilul":"uzabil","uzagii":"uzagiu","uzagiile":"uzagiu","uzagiilor":"uzagiu","uzagiuul":"uzagiu","uzagiuule":"uzagiu","uzagiuului":"uzagiu","uzai":"uza","uzaje":"uzaj","uzajele":"uzaj","uzajelor":"uzaj","uzajul":"uzaj","uzajule":"uzaj","uzajului":"uzaj","uzajuri":"uzaj","uzam":["uzăm","uza","uzam","uza"],"uzand":"uza","uzante":"uzanță","uzantei":"uzanță","uzantele":"uzanță","uzantelor":"uzanță","uzara":"uza","uzaram":"uza","uzarati":"uza","uzarea":"uzare","uzari":"uzare","uzarii":"uzare","uzarile":"uzare","uzarilor":"uzare","uzase":"uza","uzasem":"uza","uzasera":"uza","uzaseram":"uza","uzaserati":"uza","uzasesi":"uza","uzasi":"uza","uzat":"uza","uzata":["uzată","uzat","uzata","uzat"],"uzate":"uzat","uzatele":"uzat","uzati":["uzați","uza","uzați","uzat"],"uzatii":"uzat","uzatul":"uzat","uzau":"uza","uzbaiele":"uzbăială","uzbaielei":"uzbăială","uzbaielele":"uzbăială","uzbaielelor":"uzbăială","uzbaieli":"uzbăială","uzbeca":["uzbecă","uzbec","uzbeca","uzbec"],"uzbece":["uzbece","uzbec","uzbece","uzbecă"],"uzbecei":"uzbecă","uzbecele":["uzbecele","uzbec","uzbecele","uzbecă"],"uzbecelor":"uzbecă","uzbeci":"uzbec","uzbecii":"uzbec","uzbecilor":"uzbec","uzbecul":"uzbec","uzbecule":"uzbec","uzbecului":"uzbec","uzeaza":"uza","uzez":"uza","uzezi":"uza","uzi":["uzi","ud","uzi","uda"],"uzii":"ud","uzinabila":["uzinabilă","uzinabil","uzinabila","uzinabil"],"uzinabile":"uzinabil","uzinabilele":"uzinabil","uzinabili":"uzinabil","uzinabilii":"uzinabil","uzinabilul":"uzinabil","uzinai":"uzina","uzinaje":"uzinaj","uzinajele":"uzinaj","uzinajelor":"uzinaj","uzinajul":"uzinaj","uzinajule":"uzinaj","uzinajului":"uzinaj","uzinala":["uzinală","uzinal","uzinala","uzinal"],"uzinale":"uzinal","uzinalele":"uzinal","uzinali":"uzinal","uzinalii":"uzinal","uzinalul":"uzinal","uzinam":["uzinăm","uzina","uzinam","uzina"],"uzinand":"uzina","uzinara":"uzina","uzinaram":"uzina","uzinarati":"uzina","uzinase":"uzina","uzinasem":"uzina","uzinasera":"uzina","uzinaseram":"uzina","uzinaserati":"uzina","uzinasesi":"uzina","uzinasi":"uzina","uzinat":"uzina","uzinati":"uzina","uzinau":"uzina","uzine":"uzină","uzineaza":"uzina","uzinei":"uzină","uzinele":"uzină","uzinelor":"uzină","uzinez":"uzina","uzinezi":"uzina","uzitabila":["uzitabilă","uzitabil","uzitabila","uzitabil"],"uzitabile":"uzitabil","uzitabilele":"uzitabil","uzitabili":"uzitabil","uzitabilii":"uzitabil","uzitabilul":"uzitabil","uzitai":"uzita","uzitam":["uzităm","uzita","uzitam","uzita"],"uzitand":"uzita","uzitara":"uzita","uzitaram":"uzita","uzitarati":"uzita","uzitarea":"uzitare","uzitari":"uzitare","uzitarii":"uzitare","uzitarile":"uzitare","uzitarilor":"uzitare","uzitase":"uzita","uzitasem":"uzita","uzitasera":"uzita","uzitaseram":"uzita","uzitaserati":"uzita","uzitasesi":"uzita","uzitasi":"uzita","uzitat":"uzita","uzitata":["uzitată","uzitat","uzitata","uzitat"],"uzitate":"uzitat","uzitatele":"uzitat","uzitati":["uzitați","uzita","uzitați","uzitat"],"uzitatii":"uzitat","uzitatul":"uzitat","uzitau":"uzita","uziteaza":"uzita","uzitez":"uzita","uzitezi":"uzita","uzuala":["uzuală","uzual","uzuala","uzual"],"uzuale":"uzual","uzualele":"uzual","uzuali":"uzual","uzualii":"uzual","uzualitatea":"uzualitate","uzualitati":"uzualitate","uzualitatii":"uzualitate","uzualitatile":"uzualitate","uzualitatilor":"uzualitate","uzualul":"uzual","uzucapiunea":"uzucapiune","uzucapiunei":"uzucapiune","uzucapiunele":"uzucapiune","uzucapiunelor":"uzucapiune","uzufructuare":"uzufructuară","uzufructuarei":"uzufructuară","uzufructuarele":"uzufructuară","uzufructuarelor":"uzufructuară","uzufructuari":"uzufructuar","uzufructuarii":"uzufructuar","uzufructuarilor":"uzufructuar","uzufructuarul":"uzufructuar","uzufructuarule":"uzufructuar","uzufructuarului":"uzufructuar","uzufructul":"uzufruct","uzufructule":"uzufruct","uzufructului":"uzufruct","uzul":"uz","uzule":"uz","uzului":"uz","uzurari":"uzurar","uzurarii":"uzurar","uzurarilor":"uzurar","uzurarul":"uzurar","uzurarule":"uzurar","uzurarului":"uzurar","uzure":"uzură","uzurei":"uzură","uzurele":"uzură","uzurelor":"uzură","uzuri":"uz","uzurile":"uz","uzurilor":"uz","uzurp":"uzurpa","uzurpai":"uzurpa","uzurpam":["uzurpăm","uzurpa","uzurpam","uzurpa"],"uzurpand":"uzurpa","uzurpara":"uzurpa","uzurparam":"uzurpa","uzurparati":"uzurpa","uzurparea":"uzurpare","uzurpari":"uzurpare","uzurparii":"uzurpare","uzurparile":"uzurpare","uzurparilor":"uzurpare","uzurpase":"uzurpa","uzurpasem":"uzurpa","uzurpasera":"uzurpa","uzurpaseram":"uzurpa","uzurpaserati":"uzurpa","uzurpasesi":"uzurpa","uzurpasi":"uzurpa","uzurpat":"uzurpa","uzurpata":["uzurpată","uzurpat","uzurpata","uzurpat"],"uzurpate":"uzurpat","uzurpatele":"uzurpat","uzurpati":["uzurpați","uzurpa","uzurpați","uzurpat"],"uzurpatia":"uzurpație","uzurpatiei":"uzurpație","uzurpatii":["uzurpații","uzurpat","uzurpații","uzurpație"],"uzurpatiile":"uzurpație","uzurpatiilor":"uzurpație","uzurpatiunea":"uzurpațiune","uzurpatiuni":"uzurpațiune","uzurpatiunii":"uzurpațiune","uzurpatiunile":"uzurpațiune","uzurpatiunilor":"uzurpațiune","uzurpatoarea":"uzurpatoare","uzurpatoarei":"uzurpatoare","uzurpatoarele":"uzurpatoare","uzurpatoarelor":"uzurpatoare","uzurpatori":"uzurpator","uzurpatorii":"uzurpator","uzurpatorilor":"uzurpator","uzurpatorul":"uzurpator","uzurpatorule":"uzurpator","uzurpatorului":"uzurpator","uzurpatul":"uzurpat","uzurpau":"uzurpa","uzurpi":"uzurpa"};
@@ -0,0 +1 @@
+export default {"va":["vă","voi","va","voi"],"vacanta":["vacantă","vacant","vacanta","vacant"],"vacante":["vacante","vacant","vacanțe","vacanță"],"vacantele":"vacant","vacanti":"vacant","vacantieri":"vacanțier","vacantierii":"vacanțier","vacantierilor":"vacanțier","vacantierul":"vacanțier","vacantierule":"vacanțier","vacantierului":"vacanțier","vacantii":["vacanții","vacant","vacanții","vacanție"],"vacantul":"vacant","vacarasi":"văcăraș","vacarasii":"văcăraș","vacarasilor":"văcăraș","vacarasul":"văcăraș","vacarasule":"văcăraș","vacarasului":"văcăraș","vacarei":"văcărel","vacareii":"văcărel","vacareilor":"văcărel","vacarelul":"văcărel","vacarelule":"văcărel","vacarelului":"văcărel","vacarese":"văcăreasă","vacaresei":"văcăreasă","vacaresele":"văcăreasă","vacareselor":"văcăreasă","vacarete":"văcăreață","vacaretei":"văcăreață","vacaretele":"văcăreață","vacaretelor":"văcăreață","vacari":"văcar","vacaria":"văcărie","vacariei":"văcărie","vacarii":["văcarii","văcar","văcării","văcărie"],"vacariile":"văcărie","vacariilor":"văcărie","vacarilor":"văcar","vacarite":"văcăriță","vacaritei":"văcăriță","vacaritele":"văcăriță","vacaritelor":"văcăriță","vacaritul":"văcărit","vacaritule":"văcărit","vacaritului":"văcărit","vacariute":"văcăriuță","vacariutei":"văcăriuță","vacarmul":"vacarm","vacarmule":"vacarm","vacarmului":"vacarm","vacarmuri":"vacarm","vacarmurile":"vacarm","vacarmurilor":"vacarm","vacaroaia":"văcăroaie","vacaroaiei":"văcăroaie","vacaroaii":"văcăroaie","vacarul":"văcar","vacarule":"văcar","vacarului":"văcar","vacatia":"vacație","vacatiei":"vacație","vacatii":"vacație","vacatiile":"vacație","vacatiilor":"vacație","vaccinabila":["vaccinabilă","vaccinabil","vaccinabila","vaccinabil"],"vaccinabile":"vaccinabil","vaccinabilele":"vaccinabil","vaccinabili":"vaccinabil","vaccinabilii":"vaccinabil","vaccinabilul":"vaccinabil","vaccinai":"vaccina","vaccinala":["vaccinală","vaccinal","vaccinala","vaccinal"],"vaccinale":"vaccinal","vaccinalele":"vaccinal","vaccinali":"vaccinal","vaccinalii":"vaccinal","vaccinalul":"vaccinal","vaccinam":["vaccinăm","vaccina","vaccinam","vaccina"],"vaccinand":"vaccina","vaccinara":"vaccina","vaccinaram":"vaccina","vaccinarati":"vaccina","vaccinarea":"vaccinare","vaccinari":"vaccinare","vaccinarii":"vaccinare","vaccinarile":"vaccinare","vaccinarilor":"vaccinare","vaccinase":"vaccina","vaccinasem":"vaccina","vaccinasera":"vaccina","vaccinaseram":"vaccina","vaccinaserati":"vaccina","vaccinasesi":"vaccina","vaccinasi":"vaccina","vaccinat":"vaccina","vaccinata":["vaccinată","vaccinat","vaccinata","vaccinat"],"vaccinate":"vaccinat","vaccinatele":"vaccinat","vaccinati":["vaccinați","vaccina","vaccinați","vaccinat"],"vaccinatia":"vaccinație","vaccinatiei":"vaccinație","vaccinatii":["vaccinații","vaccinat","vaccinații","vaccinație"],"vaccinatiile":"vaccinație","vaccinatiilor":"vaccinație","vaccinatorul":"vaccinator","vaccinatorule":"vaccinator","vaccinatorului":"vaccinator","vaccinatul":"vaccinat","vaccinau":"vaccina","vaccine":"vaccină","vaccineaza":"vaccina","vaccinez":"vaccina","vaccinezi":"vaccina","vaccinica":["vaccinică","vaccinic","vaccinica","vaccinic"],"vaccinice":"vaccinic","vaccinicele":"vaccinic","vaccinici":"vaccinic","vaccinicii":"vaccinic","vaccinicul":"vaccinic","vaccinogena":["vaccinogenă","vaccinogen","vaccinogena","vaccinogen"],"vaccinogene":"vaccinogen","vaccinogenele":"vaccinogen","vaccinogeni":"vaccinogen","vaccinogenii":"vaccinogen","vaccinogenul":"vaccinogen","vaccinostilul":"vaccinostil","vaccinostilule":"vaccinostil","vaccinostilului":"vaccinostil","vaccinostiluri":"vaccinostil","vaccinostilurile":"vaccinostil","vaccinostilurilor":"vaccinostil","vaccinoterapia":"vaccinoterapie","vaccinoterapiei":"vaccinoterapie","vaccinoterapii":"vaccinoterapie","vaccinuiri":"vacsinuire","vaccinuirii":"vacsinuire","vaccinuirile":"vacsinuire","vaccinuirilor":"vacsinuire","vaccinul":"vaccin","vaccinule":"vaccin","vaccinului":"vaccin","vaccinuri":"vaccin","vaccinurile":"vaccin","vaccinurilor":"vaccin","vaci":"vacă","vaci de mare":"vacă de mare","vacii":"vacă","vacilatia":"vacilație","vacilatiei":"vacilație","vacilatii":"vacilație","vacilatoria":"vacilatoriu","vacilatorie":"vacilatoriu","vacilatorii":"vacilatoriu","vacilatoriii":"vacilatoriu","vacilatoriile":"vacilatoriu","vacilatoriul":"vacilatoriu","vacile":"vacă","vacilor":"vacă","vacsoare":"văcșoară","vacsoarei":"văcșoară","vacsoarele":"văcșoară","vacsoarelor":"văcșoară","vacsuia":"văcsui","vacsuiai":"văcsui","vacsuiam":"văcsui","vacsuiati":"văcsui","vacsuiau":"văcsui","vacsuiesc":"văcsui","vacsuieste":"văcsui","vacsuiesti":"văcsui","vacsuii":"văcsui","vacsuim":"văcsui","vacsuind":"văcsui","vacsuira":"văcsui","vacsuiram":"văcsui","vacsuirati":"văcsui","vacsuirea":"văcsuire","vacsuiri":"văcsuire","vacsuirii":"văcsuire","vacsuirile":"văcsuire","vacsuirilor":"văcsuire","vacsuise":"văcsui","vacsuisem":"văcsui","vacsuisera":"văcsui","vacsuiseram":"văcsui","vacsuiserati":"văcsui","vacsuisesi":"văcsui","vacsuisi":"văcsui","vacsuit":"văcsui","vacsuita":["văcsuită","văcsuit","văcsuita","văcsuit"],"vacsuite":"văcsuit","vacsuitele":"văcsuit","vacsuiti":["văcsuiți","văcsui","văcsuiți","văcsuit"],"vacsuitii":"văcsuit","vacsuitoarea":"văcsuitoare","vacsuitoarei":"văcsuitoare","vacsuitoarele":"văcsuitoare","vacsuitoarelor":"văcsuitoare","vacsuitori":"văcsuitor","vacsuitorii":"văcsuitor","vacsuitorilor":"văcsuitor","vacsuitorul":"văcsuitor","vacsuitorule":"văcsuitor","vacsuitorului":"văcsuitor","vacsuitul":"văcsuit","vacsul":"vacs","vacsule":"vacs","vacsului":"vacs","vacsuri":"vacs","vacsurile":"vacs","vacsurilor":"vacs","vacua":["vacuă","vacuu","vacua","vacuu"],"vacue":"vacuu","vacuele":"vacuu","vacuful":"vacuf","vacufule":"vacuf","vacufului":"vacuf","vacufuri":"vacuf","vacufurile":"vacuf","vacufurilor":"vacuf","vacui":"vacuu","vacuia":"văcui","vacuiai":"văcui","vacuiam":"văcui","vacuiati":"văcui","vacuiau":"văcui","vacuiesc":"văcui","vacuieste":"văcui","vacuiesti":"văcui","vacuii":["văcuii","văcui","vacuii","vacuu"],"vacuim":"văcui","vacuind":"văcui","vacuira":"văcui","vacuiram":"văcui","vacuirati":"văcui","vacuise":"văcui","vacuisem":"văcui","vacuisera":"văcui","vacuiseram":"văcui","vacuiserati":"văcui","vacuisesi":"văcui","vacuisi":"văcui","vacuit":"văcui","vacuitatea":"vacuitate","vacuitati":"vacuitate","vacuitatii":"vacuitate","vacuitatile":"vacuitate","vacuitatilor":"vacuitate","vacuiti":"văcui","vacul":"vac","vacule":"vac","vacului":"vac","vacuolara":["vacuolară","vacuolar","vacuolara","vacuolar"],"vacuolare":"vacuolar","vacuolarele":"vacuolar","vacuolari":"vacuolar","vacuolarii":"vacuolar","vacuolarul":"vacuolar","vacuole":"vacuolă","vacuolei":"vacuolă","vacuolele":"vacuolă","vacuolelor":"vacuolă","vacuri":"vac","vacurile":"vac","vacurilor":"vac","vacusoare":"văcușoară","vacusoarei":"văcușoară","vacusoarele":"văcușoară","vacusoarelor":"văcușoară","vacute":"văcuță","vacutei":"văcuță","vacutele":"văcuță","vacutelor":"văcuță","vacuul":"vacuu","vacuumarea":"vacuumare","vacuumari":"vacuumare","vacuumarii":"vacuumare","vacuumarile":"vacuumare","vacuumarilor":"vacuumare","vacuummetre":"vacuummetru","vacuummetrele":"vacuummetru","vacuummetrelor":"vacuummetru","vacuummetruul":"vacuummetru","vacuummetruule":"vacuummetru","vacuummetruului":"vacuummetru","vacuumul":"vacuum","vacuumule":"vacuum","vacuumului":"vacuum","vacuumuri":"vacuum","vacuumurile":"vacuum","vacuumurilor":"vacuum","vad":"vedea","vada":"vedea","vada lumina zilei":"vedea lumina zilei","vada negru inaintea ochilor":"vedea negru înaintea ochilor","vada rosu inaintea ochilor":"vedea roșu înaintea ochilor","vada stele verzi":"vedea stele verzi","vadana":["vădană","vădan","vădana","vădan"],"vadance":"vădancă","vadancei":"vădancă","vadancele":"vădancă","vadancelor":"vădancă","vadane":["vădane","vădan","vădane","vădană"],"vadanei":"vădană","vadanele":["vădanele","vădan","vădanele","vădană"],"vadanelor":"vădană","vadani":"vădan","vadanii":"vădan","vadanul":"vădan","vadaoii":"vădăoi","vadaoilor":"vădăoi","vadaoiul":"vădăoi","vadaoiule":"vădăoi","vadaoiului":"vădăoi","vadea":"vădi","vadeai":"vădi","vadeam":"vădi","vadeati":"vădi","vadeau":"vădi","vadeaua":"vadea","vadele":"vadea","vadelei":"vadea","vadelele":"vadea","vadelelor":"vadea","vademecumul":"vademecum","vademecumule":"vademecum","vademecumului":"vademecum","vadesc":"vădi","vadeste":"vădi","vadesti":"vădi","vadicelul":"vădicel","vadicelule":"vădicel","vadicelului":"vădicel","vadii":"vădi","vadim":"vădi","vadind":"vădi","vadira":"vădi","vadiram":"vădi","vadirati":"vădi","vadirea":"vădire","vadiri":"vădire","vadirii":"vădire","vadise":"vădi","vadisem":"vădi","vadisera":"vădi","vadiseram":"vădi","vadiserati":"vădi","vadisesi":"vădi","vadisi":"vădi","vadit":"vădi","vadita":"vădit","vadite":"vădit","vaditi":["vădiți","vădi","vădiți","vădit"],"vadnica":["vadnică","vadnic","vadnica","vadnic"],"vadnice":"vadnic","vadnicele":"vadnic","vadnici":"vadnic","vadnicii":"vadnic","vadnicul":"vadnic","vadoasa":["vădoasă","vădos","vădoasa","vădos"],"vadoase":"vădos","vadoasele":"vădos","vadosi":"vădos","vadosii":"vădos","vadosul":"vădos","vadrari":"vădrar","vadrarii":"vădrar","vadrarilor":"vădrar","vadraritul":"vădrărit","vadraritule":"vădrărit","vadraritului":"vădrărit","vadrarul":"vădrar","vadrarule":"vădrar","vadrarului":"vădrar","vadrute":"vădruță","vadrutei":"vădruță","vadul":"vad","vadul leca":"Vadul-Leca","vadule":"vad","vadului":"vad","vaduoia":"văduoi","vaduoie":"văduoi","vaduoiele":"văduoi","vaduoii":"văduoi","vaduoiul":"văduoi","vaduri":"vad","vadurile":"vad","vadurilor":"vad","vadutul":"văduț","vadutule":"văduț","vadutului":"văduț","vaduva":["văduvă","văduv","văduva","văduv"],"vaduvari":"văduvar","vaduvarii":"văduvar","vaduvarilor":"văduvar","vaduvarul":"văduvar","vaduvarule":"văduvar","vaduvarului":"văduvar","vaduve":["văduve","văduv","văduve","văduvă"],"vaduvea":"văduvi","vaduveai":"văduvi","vaduveam":"văduvi","vaduveasca":["văduvească","văduvesc","văduveasca","văduvesc"],"vaduveati":"văduvi","vaduveau":"văduvi","vaduvei":"văduvă","vaduvele":["văduvele","văduv","văduvele","văduvă"],"vaduvelor":"văduvă","vaduvesc":"văduvi","vaduvescul":"văduvesc","vaduveste":"văduvi","vaduvesti":["văduvești","văduvesc","văduvești","văduvi"],"vaduvestii":"văduvesc","vaduvestile":"văduvesc","vaduvi":"văduv","vaduvii":["văduvii","văduv","văduvii","văduvi"],"vaduvilor":"văduv","vaduvim":"văduvi","vaduvind":"văduvi","vaduvioare":"văduvioară","vaduvioarei":"văduvioară","vaduvioarele":"văduvioară","vaduvioarelor":"văduvioară","vaduviori":"văduvior","vaduviorii":"văduvior","vaduviorilor":"văduvior","vaduviorul":"văduvior","vaduviorule":"văduvior","vaduviorului":"văduvior","vaduvira":"văduvi","vaduviram":"văduvi","vaduvirati":"văduvi","vaduvirea":"văduvire","vaduviri":"văduvire","vaduvirii":"văduvire","vaduvisce":"văduvișcă","vaduviscei":"văduvișcă","vaduvise":"văduvi","vaduvisem":"văduvi","vaduvisera":"văduvi","vaduviseram":"văduvi","vaduviserati":"văduvi","vaduvisesi":"văduvi","vaduvisi":"văduvi","vaduvit":"văduvi","vaduvita":["văduvită","văduvit","văduvita","văduvit"],"vaduvite":["văduvite","văduvit","văduvițe","văduviță"],"vaduvitei":"văduviță","vaduvitele":["văduvitele","văduvit","văduvițele","văduviță"],"vaduvitelor":"văduviță","vaduviti":["văduviți","văduvi","văduviți","văduvit"],"vaduvitii":"văduvit","vaduvitul":"văduvit","vaduvoaiea":"văduvoaie","vaduvoaiei":"văduvoaie","vaduvoaiele":"văduvoaie","vaduvoaielor":"văduvoaie","vaduvoance":"văduvoancă","vaduvoancei":"văduvoancă","vaduvoancele":"văduvoancă","vaduvoancelor":"văduvoancă","vaduvoi":"rămăsoi","vaduvoii":["văduvoii","rămăsoi","văduvoii","văduvoi"],"vaduvoilor":["văduvoilor","rămăsoi","văduvoilor","văduvoi"],"vaduvoiul":"văduvoi","vaduvoiule":"văduvoi","vaduvoiului":"văduvoi","vaduvul":"văduv","vaduvule":"văduv","vaduvului":"văduv","vaga":["vagă","vag","vaga","vag"],"vagaboande":"vagaboandă","vagaboandei":"vagaboandă","vagaboandele":"vagaboandă","vagaboandelor":"vagaboandă","vagabondai":"vagabonda","vagabondajul":"vagabondaj","vagabondajule":"vagabondaj","vagabondajului":"vagabondaj","vagabondam":["vagabondăm","vagabonda","vagabondam","vagabonda"],"vagabondand":"vagabonda","vagabondanta":["vagabondantă","vagabondant","vagabondanta","vagabondant"],"vagabondante":"vagabondant","vagabondantele":"vagabondant","vagabondanti":"vagabondant","vagabondantii":"vagabondant","vagabondantul":"vagabondant","vagabondara":"vagabonda","vagabondaram":"vagabonda","vagabondarati":"vagabonda","vagabondarea":"vagabondare","vagabondari":"vagabondare","vagabondarii":"vagabondare","vagabondarile":"vagabondare","vagabondarilor":"vagabondare","vagabondase":"vagabonda","vagabondasem":"vagabonda","vagabondasera":"vagabonda","vagabondaseram":"vagabonda","vagabondaserati":"vagabonda","vagabondasesi":"vagabonda","vagabondasi":"vagabonda","vagabondat":"vagabonda","vagabondati":"vagabonda","vagabondatul":"vagabondat","vagabondatule":"vagabondat","vagabondatului":"vagabondat","vagabondau":"vagabonda","vagabondeaza":"vagabonda","vagabondez":"vagabonda","vagabondezi":"vagabonda","vagabonzi":"vagabond","vagabundagii":"vagabundagiu","vagabundagiile":"vagabundagiu","vagabundagiilor":"vagabundagiu","vagabundagiuul":"vagabundagiu","vagabundagiuule":"vagabundagiu","vagabundagiuului":"vagabundagiu","vagala":["vagală","vagal","vagala","vagal"],"vagale":"vagal","vagalele":"vagal","vagali":"vagal","vagalii":"vagal","vagalul":"vagal","vaganti":"vagant","vagantii":"vagant","vagantilor":"vagant","vagantul":"vagant","vagantule":"vagant","vagantului":"vagant","vagase":"văgaș","vagasele":"văgaș","vagaselor":"văgaș","vagasul":"văgaș","vagasule":"văgaș","vagasului":"văgaș","vagauni":"văgăună","vagaunii":"văgăună","vagaunile":"văgăună","vagaunilor":"văgăună","vagi":"vag","vagii":"vag","vagila":["vagilă","vagil","vagila","vagil"],"vagile":["vagile","vag","vagile","vagil"],"vagilele":"vagil","vagili":"vagil","vagilii":"vagil","vagilul":"vagil","vaginala":["vaginală","vaginal","vaginala","vaginal"],"vaginale":"vaginal","vaginalele":"vaginal","vaginali":"vaginal","vaginalii":"vaginal","vaginalite":"vaginalită","vaginalitei":"vaginalită","vaginalul":"vaginal","vagine":"vagin","vaginele":"vagin","vaginelor":"vagin","vaginismul":"vaginism","vaginismule":"vaginism","vaginismului":"vaginism","vaginite":"vaginită","vaginitei":"vaginită","vaginitele":"vaginită","vaginitelor":"vaginită","vaginoscopia":"vaginoscopie","vaginoscopiei":"vaginoscopie","vaginoscopii":"vaginoscopie","vaginoscopiile":"vaginoscopie","vaginoscopiilor":"vaginoscopie","vaginul":"vagin","vaginule":["vaginule","vagin","vaginule","vaginulă"],"vaginulei":"vaginulă","vaginulele":"vaginulă","vaginulelor":"vaginulă","vaginului":"vagin","vagoane":"vagon","vagoane de bagaje":"vagon de bagaje","vagoane de dormit":"vagon de dormit","vagoane de marfa":"vagon de marfă","vagoane restaurant":"vagon restaurant","vagoanele":"vagon","vagoanelor":"vagon","vagohidul":"vagohid","vagohidule":"vagohid","vagohidului":"vagohid","vagomimetica":["vagomimetică","vagomimetic","vagomimetica","vagomimetic"],"vagomimetice":"vagomimetic","vagomimeticele":"vagomimetic","vagomimetici":"vagomimetic","vagomimeticii":"vagomimetic","vagomimeticul":"vagomimetic","vagonasul":"vagonaș","vagonasule":"vagonaș","vagonasului":"vagonaș","vagonetari":"vagonetar","vagonetarii":"vagonetar","vagonetarilor":"vagonetar","vagonetarul":"vagonetar","vagonetarule":"vagonetar","vagonetarului":"vagonetar","vagonete":["vagonete","vagonet","vagonete","vagonetă"],"vagonetei":"vagonetă","vagonetele":["vagonetele","vagonet","vagonetele","vagonetă"],"vagonetelor":["vagonetelor","vagonet","vagonetelor","vagonetă"],"vagonetul":"vagonet","vagonetule":"vagonet","vagonetului":"vagonet","vagonul":"vagon","vagonule":"vagon","vagonului":"vagon","vagotomia":"vagotomie","vagotomiei":"vagotomie","vagotomii":"vagotomie","vagotomiile":"vagotomie","vagotomiilor":"vagotomie","vagotonia":"vagotonie","vagotoniei":"vagotonie","vagotonii":"vagotonie","vagotoniile":"vagotonie","vagotoniilor":"vagotonie","vagul":"vag","vai":"vale","vaia":"vaie","vaicarai":"văicăra","vaicaram":["văicărăm","văicăra","văicăram","văicăra"],"vaicarand":"văicăra","vaicarara":"văicăra","vaicararam":"văicăra","vaicararati":"văicăra","vaicarase":"văicăra","vaicarasem":"văicăra","vaicarasera":"văicăra","vaicaraseram":"văicăra","vaicaraserati":"văicăra","vaicarasesi":"văicăra","vaicarasi":"văicăra","vaicarat":"văicăra","vaicarati":"văicăra","vaicarau":"văicăra","vaicare":"vaicăr","vaicarea":"văicări","vaicareai":"văicări","vaicaream":"văicări","vaicareata":["văicăreață","văicăreț","văicăreața","văicăreț"],"vaicareati":"văicări","vaicareau":"văicări","vaicareaza":"văicăra","vaicarele":"vaicăr","vaicareli":"văicăreală","vaicarelii":"văicăreală","vaicarelile":"văicăreală","vaicarelilor":"văicăreală","vaicarelor":"vaicăr","vaicaresc":"văicări","vaicareste":"văicări","vaicaresti":"văicări","vaicarete":"văicăreț","vaicaretele":"văicăreț","vaicareti":"văicăreț","vaicaretii":"văicăreț","vaicaretul":"văicăreț","vaicarez":"văicăra","vaicarezi":"văicăra","vaicarii":"văicări","vaicarim":"văicări","vaicarind":"văicări","vaicarira":"văicări","vaicariram":"văicări","vaicarirati":"văicări","vaicarise":"văicări","vaicarisem":"văicări","vaicarisera":"văicări","vaicariseram":"văicări","vaicariserati":"văicări","vaicarisesi":"văicări","vaicarisi":"văicări","vaicarit":"văicări","vaicariti":"văicări","vaicarul":"vaicăr","vaicarule":"vaicăr","vaicarului":"vaicăr","vaiei":"vaie","vaierarea":"văierare","vaierari":"văierare","vaierarii":"văierare","vaierarile":"văierare","vaierarilor":"văierare","vaiere":"vaier","vaierele":"vaier","vaierelor":"vaier","vaierul":"vaier","vaierule":"vaier","vaierului":"vaier","vaiet":"văieta","vaieta":"văita","vaietai":"văieta","vaietam":["văietăm","văieta","văietam","văieta"],"vaietand":"văieta","vaietara":"văieta","vaietaram":"văieta","vaietarati":"văieta","vaietarea":"văietare","vaietari":"văietare","vaietarii":"văietare","vaietarile":"văietare","vaietarilor":"văietare","vaietase":"văieta","vaietasem":"văieta","vaietasera":"văieta","vaietaseram":"văieta","vaietaserati":"văieta","vaietasesi":"văieta","vaietasi":"văieta","vaietat":"văieta","vaietati":"văieta","vaietatoara":"văietător","vaietatoare":"văietător","vaietatoarele":"văietător","vaietatori":"văietător","vaietatorii":"văietător","vaietatorul":"văietător","vaietaturi":"văietătură","vaietaturii":"văietătură","vaietaturile":"văietătură","vaietaturilor":"văietătură","vaietau":"văieta","vaiete":"vaiet","vaietele":"vaiet","vaietelor":"vaiet","vaieti":"văieta","vaietul":"vaiet","vaietule":"vaiet","vaietului":"vaiet","vaii":["vaii","vaie","văii","vale"],"vaile":"vale","vailingul":"vailing","vailingule":"vailing","vailingului":"vailing","vailinguri":"vailing","vailingurile":"vailing","vailingurilor":"vailing","vailor":"vale","vaioage":"văioagă","vaioagei":"văioagă","vaioagele":"văioagă","vaioagelor":"văioagă","vaisoare":"văișoară","vaisoarei":"văișoară","vaisoarele":"văișoară","vaisoarelor":"văișoară","vait":"văita","vaitai":"văita","vaitam":["văităm","văita","văitam","văita"],"vaitand":"văita","vaitara":"văita","vaitaram":"văita","vaitarati":"văita","vaitarea":"văitare","vaitareata":["văităreață","văităreț","văităreața","văităreț"],"vaitarete":"văităreț","vaitaretele":"văităreț","vaitareti":"văităreț","vaitaretii":"văităreț","vaitaretul":"văităreț","vaitari":"văitare","vaitarii":"văitare","vaitarile":"văitare","vaitarilor":"văitare","vaitase":"văita","vaitasem":"văita","vaitasera":"văita","vaitaseram":"văita","vaitaserati":"văita","vaitasesi":"văita","vaitasi":"văita","vaitat":"văita","vaitati":"văita","vaitatoare":"văitător","vaitatoarea":"văitător","vaitatoarele":"văitător","vaitatori":"văitător","vaitatorii":"văitător","vaitatorul":"văitător","vaitaturi":"văitătură","vaitaturii":"văitătură","vaitaturile":"văitătură","vaitaturilor":"văitătură","vaitau":"văita","vaiti":"văita","vaiugi":"văiugă","vaiugii":"văiugă","vaiugile":"văiugă","vaiugilor":"văiugă","vaiuse":"văiușă","vaiusei":"văiușă","vaiute":"văiuță","vaiutei":"văiuță","vajaia":"vâjâi","vajaiai":"vâjâi","vajaiam":"vâjâi","vajaiati":"vâjâi","vajaiau":"vâjâi","vajaie":"vâjâi","vajaiele":"vâjâială","vajaielei":"vâjâială","vajaielele":"vâjâială","vajaielelor":"vâjâială","vajaieli":"vâjâială","vajaii":"vâjâi","vajaim":"vâjâi","vajaind":"vâjâi","vajaira":"vâjâi","vajairam":"vâjâi","vajairati":"vâjâi","vajairea":"vâjâire","vajairi":"vâjâire","vajairii":"vâjâire","vajairile":"vâjâire","vajairilor":"vâjâire","vajaise":"vâjâi","vajaisem":"vâjâi","vajaisera":"vâjâi","vajaiseram":"vâjâi","vajaiserati":"vâjâi","vajaisesi":"vâjâi","vajaisi":"vâjâi","vajait":"vâjâi","vajaiti":"vâjâi","vajaito":"vâjâitor","vajaitori":"vâjâitor","vajaitorii":"vâjâitor","vajaitorile":"vâjâitor","vajaitorilor":"vâjâitor","vajaitul":"vâjâit","vajaitule":"vâjâit","vajaitului":"vâjâit","vajaituri":["vâjâituri","vâjâit","vâjâituri","vâjâitură"],"vajaiturii":"vâjâitură","vajaiturile":["vâjâiturile","vâjâit","vâjâiturile","vâjâitură"],"vajaiturilor":["vâjâiturilor","vâjâit","vâjâiturilor","vâjâitură"],"vajdocute":"vâjdocuț","vajdocutele":"vâjdocuț","vajdocutelor":"vâjdocuț","vajdocutul":"vâjdocuț","vajdocutule":"vâjdocuț","vajdocutului":"vâjdocuț","vajea":["vâjea","vâji","văjea","văji"],"vajeai":["vâjeai","vâji","văjeai","văji"],"vajeam":["vâjeam","vâji","văjeam","văji"],"vajeati":["vâjeați","vâji","văjeați","văji"],"vajeau":["vâjeau","vâji","văjeau","văji"],"vajeituri":"vâjeitură","vajeiturii":"vâjeitură","vajeiturile":"vâjeitură","vajeiturilor":"vâjeitură","vajesc":["vâjesc","vâji","văjesc","văji"],"vajeste":["vâjește","vâji","văjește","văji"],"vajesti":["vâjești","vâji","văjești","văji"],"vajie":"vâjii","vajiele":"vâjială","vajielei":"vâjială","vajielele":"vâjială","vajielelor":"vâjială","vajieli":"vâjială","vajieturi":"vâjietură","vajieturii":"vâjietură","vajieturile":"vâjietură","vajieturilor":"vâjietură","vajii":["vâjii","vâji","văjii","văji"],"vajiia":"vâjii","vajiiai":"vâjii","vajiiam":"vâjii","vajiiati":"vâjii","vajiiau":"vâjii","vajiie":"vâjii","vajiii":"vâjii","vajiim":"vâjii","vajiind":"vâjii","vajiira":"vâjii","vajiiram":"vâjii","vajiirati":"vâjii","vajiise":"vâjii","vajiisem":"vâjii","vajiisera":"vâjii","vajiiseram":"vâjii","vajiiserati":"vâjii","vajiisesi":"vâjii","vajiisi":"vâjii","vajiit":"vâjii","vajiiti":"vâjii","vajiitoare":"vâjiitor","vajiitoarea":"vâjiitor","vajiitoarele":"vâjiitor","vajiitori":"vâjiitor","vajiitorii":"vâjiitor","vajiitorul":"vâjiitor","vajiitul":"vâjiit","vajiitule":"vâjiit","vajiitului":"vâjiit","vajiituri":["vâjiituri","vâjiit","vâjiituri","vâjiitură"],"vajiiturii":"vâjiitură","vajiiturile":["vâjiiturile","vâjiit","vâjiiturile","vâjiitură"],"vajiiturilor":["vâjiiturilor","vâjiit","vâjiiturilor","vâjiitură"],"vajim":["vâjim","vâji","văjim","văji"],"vajind":["vâjind","vâji","văjind","văji"],"vajira":["vâjiră","vâji","văjiră","văji"],"vajiram":["vâjirăm","vâji","văjirăm","văji"],"vajirati":["vâjirăți","vâji","văjirăți","văji"],"vajise":["vâjise","vâji","văjise","văji"],"vajisem":["vâjisem","vâji","văjisem","văji"],"vajisera":["vâjiseră","vâji","văjiseră","văji"],"vajiseram":["vâjiserăm","vâji","văjiserăm","văji"],"vajiserati":["vâjiserăți","vâji","văjiserăți","văji"],"vajisesi":["vâjiseși","vâji","văjiseși","văji"],"vajisi":["vâjiși","vâji","văjiși","văji"],"vajit":["vâjit","vâji","văjit","văji"],"vajiti":["vâjiți","vâji","văjiți","văji"],"vajnica":["vajnică","vajnic","vajnica","vajnic"],"vajnice":"vajnic","vajnicele":"vajnic","vajnici":"vajnic","vajnicii":"vajnic","vajnicul":"vajnic","valabila":["valabilă","valabil","valabila","valabil"],"valabile":"valabil","valabilele":"valabil","valabili":"valabil","valabilii":"valabil","valabilitatea":"valabilitate","valabilitati":"valabilitate","valabilitatii":"valabilitate","valabilitatile":"valabilitate","valabilitatilor":"valabilitate","valabilul":"valabil","valaha":["valahă","valah","valaha","valah"],"valahe":["valahe","valah","valahe","valahă"],"valahei":"valahă","valahele":["valahele","valah","valahele","valahă"],"valahelor":"valahă","valahi":"valah","valahica":["valahică","valahic","valahica","valahic"],"valahice":"valahic","valahiceasca":["valahicească","valahicesc","valahiceasca","valahicesc"],"valahicele":"valahic","valahicescul":"valahicesc","valahicesti":"valahicesc","valahicestii":"valahicesc","valahicestile":"valahicesc","valahici":"valahic","valahicii":"valahic","valahicul":"valahic","valahie":"Valahia","valahiei":"Valahia","valahii":["valahii","valah","valahii","Valahia"],"valahilor":"valah","valahul":"valah","valahule":"valah","valahului":"valah","valautul":"vălăuț","valautule":"vălăuț","valautului":"vălăuț","valceanul":"vâlcean","valceanule":"vâlcean","valceanului":"vâlcean","valceaua":["vâlceaua","Vâlcea","vâlceaua","vâlcea","vălceaua","vălcea"],"valceda":["vâlcedă","vâlced","vâlceda","vâlced"],"valcede":"vâlced","valcedele":"vâlced","valcedul":"vâlced","valcele":["vâlcele","Vâlcea","vâlcele","vâlcea","vălcele","vălcea","vâlcele","vâlcică","vălcele","vălcică"],"valcelei":["vâlcelei","Vâlcea","vâlcelei","vâlcea","vălcelei","vălcea","vâlcelei","vâlcică","vălcelei","vălcică"],"valcelele":["vâlcelele","vâlcea","vălcelele","vălcea","vâlcelele","vâlcică","vălcelele","vălcică"],"valcelelor":["vâlcelelor","vâlcea","vălcelelor","vălcea","vâlcelelor","vâlcică","vălcelelor","vălcică"],"valceluse":["vâlcelușe","vâlcelușă","vălcelușe","vălcelușă"],"valcelusei":["vâlcelușei","vâlcelușă","vălcelușei","vălcelușă"],"valcelusele":["vâlcelușele","vâlcelușă","vălcelușele","vălcelușă"],"valceluselor":["vâlcelușelor","vâlcelușă","vălcelușelor","vălcelușă"],"valcelute":"vâlceluță","valcelutei":"vâlceluță","valcelutele":"vâlceluță","valcelutelor":"vâlceluță","valcence":"vâlceancă","valcencei":"vâlceancă","valcencele":"vâlceancă","valcencelor":"vâlceancă","valcene":"vâlceană","valcenei":"vâlceană","valcenele":"vâlceană","valcenelor":"vâlceană","valceni":"vâlcean","valcenii":"vâlcean","valcenilor":"vâlcean","valcezi":"vâlced","valcezii":"vâlced","valcezirea":"vâlcezire","valceziri":"vâlcezire","valcezirii":"vâlcezire","valcezirile":"vâlcezire","valcezirilor":"vâlcezire","valcicute":"vâlcicuță","valcicutei":"vâlcicuță","valcicutele":"vâlcicuță","valcicutelor":"vâlcicuță","valcioare":"vâlcioară","valcioarei":"vâlcioară","valcioarele":"vâlcioară","valcioarelor":"vâlcioară","valdrapul":"valdrap","valdrapule":"valdrap","valdrapului":"valdrap","valdrapuri":"valdrap","valdrapurile":"valdrap","valdrapurilor":"valdrap","valea":"vale","valea hotarilor":"Valea Hotarelor","valea intunecosa":"Valea Întunecoasă","valea parului":"Vadu Părului","valeanul":"vălean","valeanule":"vălean","valeanului":"vălean","valeatul":"văleat","valeatule":"văleat","valeatului":"văleat","valence":"văleancă","valencei":"văleancă","valencele":"văleancă","valencelor":"văleancă","valene":"văleană","valenei":"văleană","valenele":"văleană","valenelor":"văleană","valeni":"vălean","valenii":"vălean","valenilor":"vălean","valente":"valență","valentei":"valență","valentele":"valență","valentelor":"valență","valerase":"valeraș","valerasele":"valeraș","valeraselor":"valeraș","valerasul":"valeraș","valerasule":"valeraș","valerasului":"valeraș","valerianatul":"valerianat","valerianatule":"valerianat","valerianatului":"valerianat","valerianica":["valerianică","valerianic","valerianica","valerianic"],"valerianice":"valerianic","valerianicele":"valerianic","valerianici":"valerianic","valerianicii":"valerianic","valerianicul":"valerianic","valeriene":"valeriană","valerienei":"valeriană","valerienele":"valeriană","valerienelor":"valeriană","valeti":"valet","valetii":"valet","valetilor":"valet","valetudinariuul":"valetudinariu","valetudinariuule":"valetudinariu","valetudinariuului":"valetudinariu","valetul":"valet","valetule":"valet","valetului":"valet","valfe":"vâlfă","valfei":"vâlfă","valfele":"vâlfă","valfelor":"vâlfă","valgusul":"valgus","valgusule":"valgus","valgusului":"valgus","valhovnici":"vâlhovnic","valhovnicii":"vâlhovnic","valhovnicilor":"vâlhovnic","valhovnicul":"vâlhovnic","valhovnicule":"vâlhovnic","valhovnicului":"vâlhovnic","valicele":"vălicică","valicice":"vălicică","valicicei":"vălicică","valicicele":"vălicică","valicicelor":"vălicică","valida":["validă","valid","valida","valid"],"validai":"valida","validam":["validăm","valida","validam","valida"],"validand":"valida","validara":"valida","validaram":"valida","validarati":"valida","validarea":"validare","validari":"validare","validarii":"validare","validarile":"validare","validarilor":"validare","validase":"valida","validasem":"valida","validasera":"valida","validaseram":"valida","validaserati":"valida","validasesi":"valida","validasi":"valida","validat":"valida","validata":["validată","validat","validata","validat"],"validate":"validat","validatele":"validat","validati":["validați","valida","validați","validat"],"validatia":"validație","validatiei":"validație","validatii":["validații","validat","validații","validație"],"validatul":"validat","validau":"valida","valide":"valid","valideaua":"validea","valideaza":"valida","validele":["validele","valid","validele","validea"],"validelei":"validea","validelele":"validea","validelelor":"validea","validez":"valida","validezi":"valida","validitarea":"validitare","validitari":"validitare","validitarii":"validitare","validitarile":"validitare","validitarilor":"validitare","validitatea":"validitate","validitati":"validitate","validitatii":"validitate","validitatile":"validitate","validitatilor":"validitate","validul":"valid","valii":"valiu","valiii":"valiu","valiilor":"valiu","valijoare":"valijoară","valijoarei":"valijoară","valijoarele":"valijoară","valijoarelor":"valijoară","valine":"valină","valinei":"valină","valioare":"vălioară","valioarei":"vălioară","valisoare":"vălișoară","valisoarei":"vălișoară","valisoarele":"vălișoară","valisoarelor":"vălișoară","valisorul":"vălișor","valisorule":"vălișor","valisorului":"vălișor","valite":"văliță","valitei":"văliță","valiuul":"valiu","valiuule":"valiu","valiuului":"valiu","valize":"valiză","valize diplomatice":"valiză diplomatică","valizei":"valiză","valizele":"valiză","valizelor":"valiză","valizi":"valid","valizii":"valid","valmasagul":"vălmășag","valmasagule":"vălmășag","valmasagului":"vălmășag","valmaseli":"vălmășeală","valmaselii":"vălmășeală","valmaselile":"vălmășeală","valmaselilor":"vălmășeală","valmasirea":"vălmășire","valmasirei":"vălmășire","valmi":"valmă","valmii":"valmă","valmile":"valmă","valmilor":"valmă","valoarea":"valoare","valona":["valonă","valon","valona","valon"],"valone":["valone","valon","valone","valonă"],"valoneea":"valonee","valoneei":"valonee","valoneele":"valonee","valoneelor":"valonee","valonei":"valonă","valonele":["valonele","valon","valonele","valonă"],"valonelor":"valonă","valoni":"valon","valonii":"valon","valonilor":"valon","valonul":"valon","valonule":"valon","valonului":"valon","valorai":"valora","valoram":["valorăm","valora","valoram","valora"],"valorand":"valora","valorara":"valora","valoraram":"valora","valorarati":"valora","valorase":"valora","valorasem":"valora","valorasera":"valora","valoraseram":"valora","valoraserati":"valora","valorasesi":"valora","valorasi":"valora","valorat":"valora","valorati":"valora","valorau":"valora","valoreaza":"valora","valorez":"valora","valorezi":"valora","valori":["valori","valoare","valori","valoră"],"valori absolute":"valoare absolută","valori de schimb":"valoare de schimb","valori nominale":"valoare nominală","valorica":["valorică","valoric","valorica","valoric"],"valorice":"valoric","valoricele":"valoric","valorici":"valoric","valoricii":"valoric","valoricul":"valoric","valorific":"valorifica","valorificabila":["valorificabilă","valorificabil","valorificabila","valorificabil"],"valorificabile":"valorificabil","valorificabilele":"valorificabil","valorificabili":"valorificabil","valorificabilii":"valorificabil","valorificabilul":"valorificabil","valorificai":"valorifica","valorificam":["valorificăm","valorifica","valorificam","valorifica"],"valorificand":"valorifica","valorificara":"valorifica","valorificaram":"valorifica","valorificarati":"valorifica","valorificarea":"valorificare","valorificari":"valorificare","valorificarii":"valorificare","valorificarile":"valorificare","valorificarilor":"valorificare","valorificase":"valorifica","valorificasem":"valorifica","valorificasera":"valorifica","valorificaseram":"valorifica","valorificaserati":"valorifica","valorificasesi":"valorifica","valorificasi":"valorifica","valorificat":"valorifica","valorificata":["valorificată","valorificat","valorificata","valorificat"],"valorificate":"valorificat","valorificatele":"valorificat","valorificati":["valorificați","valorifica","valorificați","valorificat"],"valorificatii":"valorificat","valorificatul":"valorificat","valorificau":"valorifica","valorifici":"valorifica","valorii":["valorii","valoare","valorii","valoră"],"valorile":["valorile","valoare","valorile","valoră"],"valorilor":["valorilor","valoare","valorilor","valoră"],"valorizai":"valoriza","valorizam":["valorizăm","valoriza","valorizam","valoriza"],"valorizand":"valoriza","valorizara":"valoriza","valorizaram":"valoriza","valorizarati":"valoriza","valorizarea":"valorizare","valorizari":"valorizare","valorizarii":"valorizare","valorizarile":"valorizare","valorizarilor":"valorizare","valorizase":"valoriza","valorizasem":"valoriza","valorizasera":"valoriza","valorizaseram":"valoriza","valorizaserati":"valoriza","valorizasesi":"valoriza","valorizasi":"valoriza","valorizat":"valoriza","valorizata":["valorizată","valorizat","valorizata","valorizat"],"valorizate":"valorizat","valorizatele":"valorizat","valorizati":["valorizați","valoriza","valorizați","valorizat"],"valorizatii":"valorizat","valorizatul":"valorizat","valorizau":"valoriza","valorizeaza":"valoriza","valorizez":"valoriza","valorizezi":"valoriza","valoroasa":["valoroasă","valoros","valoroasa","valoros"],"valoroase":"valoros","valoroasele":"valoros","valorosi":"valoros","valorosii":"valoros","valorosul":"valoros","valsai":"valsa","valsam":["valsăm","valsa","valsam","valsa"],"valsand":"valsa","valsara":"valsa","valsaram":"valsa","valsarati":"valsa","valsase":"valsa","valsasem":"valsa","valsasera":"valsa","valsaseram":"valsa","valsaserati":"valsa","valsasesi":"valsa","valsasi":"valsa","valsat":"valsa","valsati":"valsa","valsatoarea":"valsatoare","valsatoarei":"valsatoare","valsatoarele":"valsatoare","valsatoarelor":"valsatoare","valsatori":"valsator","valsatorii":"valsator","valsatorilor":"valsator","valsatorul":"valsator","valsatorule":"valsator","valsatorului":"valsator","valsau":"valsa","valseaza":"valsa","valsebnicia":"vâlșebnicie","valsebniciei":"vâlșebnicie","valsebnicii":"vâlșebnicie","valsebniciile":"vâlșebnicie","valsebniciilor":"vâlșebnicie","valsez":"valsa","valsezi":"valsa","valsul":"vals","valsule":"vals","valsului":"vals","valsuri":"vals","valsuri vieneze":"vals vienez","valsurile":"vals","valsurilor":"vals","valtoarea":"vâltoare","valtori":"vâltoare","valtorii":"vâltoare","valtorile":"vâltoare","valtorilor":"vâltoare","valtrapul":"valtrap","valtrapule":"valtrap","valtrapului":"valtrap","valtrapuri":"valtrap","valtrapurile":"valtrap","valtrapurilor":"valtrap","valtuia":"vălțui","valtuiai":"vălțui","valtuiam":"vălțui","valtuiati":"vălțui","valtuiau":"vălțui","valtuiesc":"vălțui","valtuieste":"vălțui","valtuiesti":"vălțui","valtuii":"vălțui","valtuim":"vălțui","valtuind":"vălțui","valtuira":"vălțui","valtuiram":"vălțui","valtuirati":"vălțui","valtuirea":"vălțuire","valtuiri":"vălțuire","valtuirii":"vălțuire","valtuirile":"vălțuire","valtuirilor":"vălțuire","valtuise":"vălțui","valtuisem":"vălțui","valtuisera":"vălțui","valtuiseram":"vălțui","valtuiserati":"vălțui","valtuisesi":"vălțui","valtuisi":"vălțui","valtuit":"vălțui","valtuiti":"vălțui","valtuitoarea":"vălțuitoare","valtuitoarei":"vălțuitoare","valtuitoarele":"vălțuitoare","valtuitoarelor":"vălțuitoare","valtul":"valț","valtule":"valț","valtului":"valț","valturi":"valț","valturile":"valț","valturilor":"valț","valul":["valul","val","vălul","văl"],"valule":["valule","val","vălule","văl"],"valului":["valului","val","vălului","văl"],"valurele":"vălurel","valurelele":"vălurel","valurelelor":"vălurel","valurelul":"vălurel","valurelule":"vălurel","valurelului":"vălurel","valuri":["valuri","val","văluri","văl"],"valuri de caldura":"val de căldură","valurile":["valurile","val","vălurile","văl"],"valurilor":["valurilor","val","vălurilor","văl"],"valurita":["vălurită","vălurit","vălurita","vălurit"],"valurite":"vălurit","valuritele":"vălurit","valuriti":"vălurit","valuritii":"vălurit","valuritul":"vălurit","valuroasa":["văluroasă","văluros","văluroasa","văluros"],"valuroase":"văluros","valuroasele":"văluros","valurosi":"văluros","valurosii":"văluros","valurosul":"văluros","valusele":"vălușel","valuselele":"vălușel","valuselelor":"vălușel","valuselul":"vălușel","valuselule":"vălușel","valuselului":"vălușel","valusoare":"vălușor","valusoarele":"vălușor","valusoarelor":"vălușor","valusorul":"vălușor","valusorule":"vălușor","valusorului":"vălușor","valustetul":"vălușteț","valustetule":"vălușteț","valustetului":"vălușteț","valusul":"văluș","valusule":"văluș","valusului":"văluș","valutara":["valutară","valutar","valutara","valutar"],"valutare":"valutar","valutarea":"valutare","valutarele":"valutar","valutari":["valutari","valutar","valutări","valutare"],"valutarii":["valutarii","valutar","valutării","valutare"],"valutarul":"valutar","valute":"valută","valute forte":"valută forte","valutei":"valută","valutele":"valută","valutelor":"valută","valutisti":"valutist","valutistii":"valutist","valutistilor":"valutist","valutistul":"valutist","valutistule":"valutist","valutistului":"valutist","valutul":"văluț","valutule":"văluț","valutului":"văluț","valvaiele":"vâlvâială","valvaielei":"vâlvâială","valvaielele":"vâlvâială","valvaielelor":"vâlvâială","valvaieli":"vâlvâială","valvara":["valvară","valvar","valvara","valvar"],"valvare":"valvar","valvarele":"valvar","valvari":"valvar","valvarii":"valvar","valvarul":"valvar","valvatai":["vâlvătăi","vâlvătaie","vălvătăi","vălvătaie"],"valvataiea":["vâlvătaiea","vâlvătaie","vălvătaiea","vălvătaie"],"valvataii":["vâlvătăii","vâlvătaie","vălvătăii","vălvătaie"],"valvataile":["vâlvătăile","vâlvătaie","vălvătăile","vălvătaie"],"valvatailor":["vâlvătăilor","vâlvătaie","vălvătăilor","vălvătaie"],"valve":["valve","valvă","vâlve","vâlvă"],"valve de presiune":"valvă de presiune","valvei":["valvei","valvă","vâlvei","vâlvă"],"valvele":["valvele","valvă","vâlvele","vâlvă"],"valvelor":["valvelor","valvă","vâlvelor","vâlvă"],"valvoarea":"vâlvoare","valvorarea":"vâlvorare","valvorari":"vâlvorare","valvorarii":"vâlvorare","valvorarile":"vâlvorare","valvorarilor":"vâlvorare","valvori":"vâlvoare","valvorii":"vâlvoare","valvorile":"vâlvoare","valvorilor":"vâlvoare","valvotai":"vâlvotaie","valvotaiea":"vâlvotaie","valvotaii":"vâlvotaie","valvotaile":"vâlvotaie","valvotailor":"vâlvotaie","valvulara":["valvulară","valvular","valvulara","valvular"],"valvulare":"valvular","valvularele":"valvular","valvulari":"valvular","valvularii":"valvular","valvularul":"valvular","valvule":"valvulă","valvule tricuspide":"valvulă tricuspidă","valvulei":"valvulă","valvulele":"valvulă","valvulelor":"valvulă","valvulite":"valvulită","valvulitei":"valvulită","valvulitele":"valvulită","valvulitelor":"valvulită","valvulopatia":"valvulopatie","valvulopatiei":"valvulopatie","valvulopatii":"valvulopatie","valvulopatiile":"valvulopatie","valvulopatiilor":"valvulopatie","valvuloplastia":"valvuloplastie","valvuloplastiei":"valvuloplastie","valvuloplastii":"valvuloplastie","valvuloplastiile":"valvuloplastie","valvuloplastiilor":"valvuloplastie","valvulotomia":"valvulotomie","valvulotomiei":"valvulotomie","valvulotomii":"valvulotomie","valvulotomiile":"valvulotomie","valvulotomiilor":"valvulotomie","vamala":["vamală","vamal","vamala","vamal"],"vamale":"vamal","vamalele":"vamal","vamali":"vamal","vamalii":"vamal","vamalul":"vamal","vameseasca":["vămeșească","vămeșesc","vămeșeasca","vămeșesc"],"vamesescul":"vămeșesc","vamesesti":"vămeșesc","vamesestii":"vămeșesc","vamesestile":"vămeșesc","vamesi":"vameș","vamesii":"vameș","vamesilor":"vameș","vamesoaice":"vămeșoaică","vamesoaicei":"vămeșoaică","vamesoaicele":"vămeșoaică","vamesoaicelor":"vămeșoaică","vamesul":"vameș","vamesule":"vameș","vamesului":"vameș","vami":"vamă","vamii":"vamă","vamile":"vamă","vamilor":"vamă","vampe":"vampă","vampei":"vampă","vampele":"vampă","vampelor":"vampă","vampire":"vampiră","vampirei":"vampiră","vampirele":"vampiră","vampirelor":"vampiră","vampiri":"vampir","vampirica":["vampirică","vampiric","vampirica","vampiric"],"vampirice":"vampiric","vampiricele":"vampiric","vampirici":"vampiric","vampiricii":"vampiric","vampiricul":"vampiric","vampirii":"vampir","vampirilor":"vampir","vampirismul":"vampirism","vampirismule":"vampirism","vampirismului":"vampirism","vampirizai":"vampiriza","vampirizam":["vampirizăm","vampiriza","vampirizam","vampiriza"],"vampirizand":"vampiriza","vampirizara":"vampiriza","vampirizaram":"vampiriza","vampirizarati":"vampiriza","vampirizarea":"vampirizare","vampirizari":"vampirizare","vampirizarii":"vampirizare","vampirizase":"vampiriza","vampirizasem":"vampiriza","vampirizasera":"vampiriza","vampirizaseram":"vampiriza","vampirizaserati":"vampiriza","vampirizasesi":"vampiriza","vampirizasi":"vampiriza","vampirizat":"vampiriza","vampirizati":"vampiriza","vampirizau":"vampiriza","vampirizeaza":"vampiriza","vampirizez":"vampiriza","vampirizezi":"vampiriza","vampirul":"vampir","vampirule":"vampir","vampirului":"vampir","vamuia":"vămui","vamuiai":"vămui","vamuiam":"vămui","vamuiati":"vămui","vamuiau":"vămui","vamuieli":"vămuială","vamuielii":"vămuială","vamuielile":"vămuială","vamuielilor":"vămuială","vamuiesc":"vămui","vamuieste":"vămui","vamuiesti":"vămui","vamuii":"vămui","vamuim":"vămui","vamuind":"vămui","vamuira":"vămui","vamuiram":"vămui","vamuirati":"vămui","vamuirea":"vămuire","vamuiri":"vămuire","vamuirii":"vămuire","vamuirile":"vămuire","vamuirilor":"vămuire","vamuise":"vămui","vamuisem":"vămui","vamuisera":"vămui","vamuiseram":"vămui","vamuiserati":"vămui","vamuisesi":"vămui","vamuisi":"vămui","vamuit":"vămui","vamuiti":"vămui","vamuitori":"vămuitor","vamuitorii":"vămuitor","vamuitorilor":"vămuitor","vamuitorul":"vămuitor","vamuitorule":"vămuitor","vamuitorului":"vămuitor","vana":["vană","van","vana","van"],"vanadati":"vanadat","vanadatii":"vanadat","vanadatilor":"vanadat","vanadatul":"vanadat","vanadatule":"vanadat","vanadatului":"vanadat","vanadica":["vanadică","vanadic","vanadica","vanadic"],"vanadice":"vanadic","vanadicele":"vanadic","vanadici":"vanadic","vanadicii":"vanadic","vanadicul":"vanadic","vanadifera":["vanadiferă","vanadifer","vanadifera","vanadifer"],"vanadifere":"vanadifer","vanadiferele":"vanadifer","vanadiferi":"vanadifer","vanadiferii":"vanadifer","vanadiferul":"vanadifer","vanadinitul":"vanadinit","vanadinitule":"vanadinit","vanadinitului":"vanadinit","vanadiul":"vanadiu","vanadiule":"vanadiu","vanadiului":"vanadiu","vanadoasa":["vanadoasă","vanados","vanadoasa","vanados"],"vanadoase":"vanados","vanadoasele":"vanados","vanadosi":"vanados","vanadosii":"vanados","vanadosul":"vanados","vanai":"vâna","vanam":["vânăm","vâna","vânam","vâna"],"vanand":"vâna","vanara":"vâna","vanaram":"vâna","vanarati":"vâna","vanarea":"vânare","vanari":"vânare","vanarii":"vânare","vanarile":"vânare","vanarilor":"vânare","vanase":"vâna","vanasem":"vâna","vanasera":"vâna","vanaseram":"vâna","vanaserati":"vâna","vanasesi":"vâna","vanasi":"vâna","vanat":"vâna","vanata":["vânată","vânat","vânata","vânat","vânătă","vânăt","vânăta","vânăt"],"vanatai":"vânătaie","vanataia":"vânătaie","vanataii":"vânătaie","vanataile":"vânătaie","vanatailor":"vânătaie","vanate":"vânat","vanatele":"vânat","vanati":["vânați","vâna","vânați","vânat"],"vanatii":"vânat","vanatoarea":"vânătoare","vanatorasul":"vânătoraș","vanatorasule":"vânătoraș","vanatorasului":"vânătoraș","vanatoreasca":["vânătorească","vânătoresc","vânătoreasca","vânătoresc"],"vanatorescul":"vânătoresc","vanatoresti":"vânătoresc","vanatorestii":"vânătoresc","vanatorestile":"vânătoresc","vanatori":["vânători","vânătoare","vânători","vânător"],"vanatori de capete":"vânător de capete","vanatori de fantome":"vânător de fantome","vanatori de recompense":"vânător de recompense","vanatori de vrajitoare":"vânătoare de vrăjitoare","vanatoria":"vânătorie","vanatoriei":"vânătorie","vanatorii":["vânătorii","vânătoare","vânătorii","vânător","vânătorii","vânătorie"],"vanatorile":"vânătoare","vanatorilor":["vânătorilor","vânătoare","vânătorilor","vânător"],"vanatorimea":"vânătorime","vanatorimei":"vânătorime","vanatorite":"vânătoriță","vanatoritei":"vânătoriță","vanatoritele":"vânătoriță","vanatoritelor":"vânătoriță","vanatorul":"vânător","vanatorule":"vânător","vanatorului":"vânător","vanatucul":"vânătuc","vanatucule":"vânătuc","vanatucului":"vânătuc","vanatul":["vânatul","vânat","vânătul","vânăt"],"vanatule":"vânat","vanatului":"vânat","vanaturi":["vânaturi","vânat","vânături","vânătură"],"vanaturii":"vânătură","vanaturile":["vânaturile","vânat","vânăturile","vânătură"],"vanaturilor":["vânaturilor","vânat","vânăturilor","vânătură"],"vanau":"vâna","vand":"vinde","vanda":"vinde","vanda castraveti gradinarului":"vinde castraveți grădinarului","vanda gogosi":"vinde gogoși","vandabila":["vandabilă","vandabil","vandabila","vandabil"],"vandabile":"vandabil","vandabilele":"vandabil","vandabili":"vandabil","vandabilii":"vandabil","vandabilitatea":"vandabilitate","vandabilitati":"vandabilitate","vandabilitatii":"vandabilitate","vandabilitatile":"vandabilitate","vandabilitatilor":"vandabilitate","vandabilul":"vandabil","vandali":"vandal","vandalica":["vandalică","vandalic","vandalica","vandalic"],"vandalice":"vandalic","vandalicele":"vandalic","vandalici":"vandalic","vandalicii":"vandalic","vandalicul":"vandalic","vandalii":"vandal","vandalilor":"vandal","vandalismul":"vandalism","vandalismule":"vandalism","vandalismului":"vandalism","vandalizai":"vandaliza","vandalizam":["vandalizăm","vandaliza","vandalizam","vandaliza"],"vandalizand":"vandaliza","vandalizara":"vandaliza","vandalizaram":"vandaliza","vandalizarati":"vandaliza","vandalizareul":"vandalizare","vandalizareule":"vandalizare","vandalizareului":"vandalizare","vandalizase":"vandaliza","vandalizasem":"vandaliza","vandalizasera":"vandaliza","vandalizaseram":"vandaliza","vandalizaserati":"vandaliza","vandalizasesi":"vandaliza","vandalizasi":"vandaliza","vandalizat":"vandaliza","vandalizata":["vandalizată","vandalizat","vandalizata","vandalizat"],"vandalizate":"vandalizat","vandalizatele":"vandalizat","vandalizati":["vandalizați","vandaliza","vandalizați","vandalizat"],"vandalizatii":"vandalizat","vandalizatul":"vandalizat","vandalizau":"vandaliza","vandalizeaza":"vandaliza","vandalizez":"vandaliza","vandalizezi":"vandaliza","vandalul":"vandal","vandalule":"vandal","vandalului":"vandal","vandralai":"vandralău","vandralaii":"vandralău","vandralailor":"vandralău","vandralauul":"vandralău","vandralauule":"vandralău","vandralauului":"vandralău","vandrasi":"vandraș","vandrasii":"vandraș","vandrasilor":"vandraș","vandrasul":"vandraș","vandrasule":"vandraș","vandrasului":"vandraș","vandu":"vinde","vandui":"vinde","vandura":"vinde","vanduram":"vinde","vandurati":"vinde","vanduse":"vinde","vandusem":"vinde","vandusera":"vinde","vanduseram":"vinde","vanduserati":"vinde","vandusesi":"vinde","vandusi":"vinde","vandut":"vinde","vandut castraveti gradinarului":"vinde castraveți grădinarului","vandut gogosi":"vinde gogoși","vanduta":["vândută","vândut","vânduta","vândut"],"vandute":"vândut","vandutele":"vândut","vanduti":"vândut","vandutii":"vândut","vandutul":"vândut","vane":["vane","van","vane","vană"],"vaneaza":"vâna","vanei":"vană","vanele":["vanele","van","vanele","vană"],"vanelor":"vană","vanez":"vâna","vanezi":"vâna","vanghelia":"vanghelie","vangheliei":"vanghelie","vanghelii":"vanghelie","vangheliile":"vanghelie","vangheliilor":"vanghelie","vanghelisti":"vanghelist","vanghelistii":"vanghelist","vanghelistilor":"vanghelist","vanghelistul":"vanghelist","vanghelistule":"vanghelist","vanghelistului":"vanghelist","vani":"van","vanii":"van","vanilata":["vanilată","vanilat","vanilata","vanilat"],"vanilate":"vanilat","vanilatele":"vanilat","vanilati":"vanilat","vanilatii":"vanilat","vanilatul":"vanilat","vanilia":"vanilie","vaniliei":"vanilie","vanilii":"vanilie","vaniliile":"vanilie","vaniliilor":"vanilie","vanilinata":["vanilinată","vanilinat","vanilinata","vanilinat"],"vanilinate":"vanilinat","vanilinatele":"vanilinat","vanilinati":"vanilinat","vanilinatii":"vanilinat","vanilinatul":"vanilinat","vaniline":"vanilină","vanilinei":"vanilină","vanilinele":"vanilină","vanilinelor":"vanilină","vanilismul":"vanilism","vanilismule":"vanilism","vanilismului":"vanilism","vanitati":"vanitate","vanite":"vaniță","vanitei":"vaniță","vanitoasa":["vanitoasă","vanitos","vanitoasa","vanitos"],"vanitoase":"vanitos","vanitoasele":"vanitos","vanitosi":"vanitos","vanitosii":"vanitos","vanitosul":"vanitos","vanjoasa":["vânjoasă","vânjos","vânjoasa","vânjos"],"vanjoase":"vânjos","vanjoasele":"vânjos","vanjosi":"vânjos","vanjosia":"vânjoșie","vanjosiei":"vânjoșie","vanjosii":["vânjoșii","vânjos","vânjoșii","vânjoșie"],"vanjosiile":"vânjoșie","vanjosiilor":"vânjoșie","vanjosul":"vânjos","vanoasa":["vânoasă","vânos","vânoasa","vânos"],"vanoase":"vânos","vanoasele":"vânos","vanosi":"vânos","vanosii":"vânos","vanosul":"vânos","vanslea":"vânsli","vansleai":"vânsli","vansleam":"vânsli","vansleati":"vânsli","vansleau":"vânsli","vanslesc":"vânsli","vansleste":"vânsli","vanslesti":"vânsli","vanslii":"vânsli","vanslim":"vânsli","vanslind":"vânsli","vanslira":"vânsli","vansliram":"vânsli","vanslirati":"vânsli","vanslise":"vânsli","vanslisem":"vânsli","vanslisera":"vânsli","vansliseram":"vânsli","vansliserati":"vânsli","vanslisesi":"vânsli","vanslisi":"vânsli","vanslit":"vânsli","vansliti":"vânsli","vanticele":"vânticel","vanticelele":"vânticel","vanticelelor":"vânticel","vanticelul":"vânticel","vanticelule":"vânticel","vanticelului":"vânticel","vantisoare":"vântișor","vantisore":"vântișor","vantisorele":"vântișor","vantisorelor":"vântișor","vantisorul":"vântișor","vantisorule":"vântișor","vantisorului":"vântișor","vantoaice":"vântoaică","vantoaicei":"vântoaică","vantoasa":["vântoasă","vântos","vântoasa","vântos"],"vantoase":["vântoase","vântoasă","vântoase","vântos"],"vantoasele":"vântos","vantosi":"vântos","vantosii":"vântos","vantosul":"vântos","vantre":"vântră","vantrei":"vântră","vantrele":"vântră","vantrelor":"vântră","vantucelul":"vântucel","vantucelule":"vântucel","vantucelului":"vântucel","vantuia":"vântui","vantuiai":"vântui","vantuiam":"vântui","vantuiati":"vântui","vantuiau":"vântui","vantuie":"vântui","vantuii":"vântui","vantuim":"vântui","vantuind":"vântui","vantuira":"vântui","vantuiram":"vântui","vantuirati":"vântui","vantuise":"vântui","vantuisem":"vântui","vantuisera":"vântui","vantuiseram":"vântui","vantuiserati":"vântui","vantuisesi":"vântui","vantuisi":"vântui","vantuit":"vântui","vantuita":["vântuită","vântuit","vântuita","vântuit"],"vantuite":"vântuit","vantuitele":"vântuit","vantuiti":["vântuiți","vântui","vântuiți","vântuit"],"vantuitii":"vântuit","vantuitul":"vântuit","vantul":"vânt","vantule":"vânt","vantulete":"vântuleț","vantuletele":"vântuleț","vantuletelor":"vântuleț","vantuletul":"vântuleț","vantuletule":"vântuleț","vantuletului":"vântuleț","vantului":"vânt","vantur":"vântura","vanturai":"vântura","vanturam":["vânturăm","vântura","vânturam","vântura"],"vanturand":"vântura","vanturara":"vântura","vanturaram":"vântura","vanturarati":"vântura","vanturare":"vânturar","vanturarea":"vânturare","vanturarele":"vânturar","vanturarelor":"vânturar","vanturari":"vânturare","vanturarii":"vânturare","vanturarile":"vânturare","vanturarilor":"vânturare","vanturarul":"vânturar","vanturarule":"vânturar","vanturarului":"vânturar","vanturase":"vântura","vanturasem":"vântura","vanturasera":"vântura","vanturaseram":"vântura","vanturaserati":"vântura","vanturasesi":"vântura","vanturasi":"vântura","vanturat":"vântura","vanturati":"vântura","vanturatica":["vânturatică","vânturatic","vânturatica","vânturatic"],"vanturatice":"vânturatic","vanturaticele":"vânturatic","vanturatici":"vânturatic","vanturaticii":"vânturatic","vanturaticul":"vânturatic","vanturau":"vântura","vanture":"vântura","vanturei":"vânturel","vanturei de amur":"vânturel de Amur","vanturei de seara":"vânturel de seară","vanturei mici":"vânturel mic","vanturei rosii":"vânturel roșu","vantureii":"vânturel","vantureilor":"vânturel","vanturelul":"vânturel","vanturelule":"vânturel","vanturelului":"vânturel","vanturi":["vânturi","vânt","vânturi","vântura"],"vanturi solare":"vânt solar","vanturile":"vânt","vanturilor":"vânt","vanturoasa":["vânturoasă","vânturos","vânturoasa","vânturos"],"vanturoase":"vânturos","vanturoasele":"vânturos","vanturosi":"vânturos","vanturosii":"vânturos","vanturosul":"vânturos","vantuselul":"vântușel","vantuselule":"vântușel","vantuselului":"vântușel","vantusorul":"vântușor","vantusorule":"vântușor","vantusorului":"vântușor","vantusul":"vântuș","vantusule":"vântuș","vantusului":"vântuș","vantutul":"vântuț","vantutule":"vântuț","vantutului":"vântuț","vanul":"van","vanute":["vânuțe","vânuță","vănuțe","vănuță"],"vanutei":["vânuței","vânuță","vănuței","vănuță"],"vanutele":"vănuță","vanutelor":"vănuță","vanzand":"vinde","vanzarea":"vânzare","vanzari":["vânzari","vânzar","vânzări","vânzare","vânzari","vânzare"],"vanzaria":"vânzărie","vanzariei":"vânzărie","vanzarii":["vânzarii","vânzar","vânzarii","vânzare","vânzării","vânzărie"],"vanzarile":"vânzare","vanzarilor":["vânzarilor","vânzar","vânzarilor","vânzare"],"vanzarul":"vânzar","vanzarule":"vânzar","vanzarului":"vânzar","vanzasul":"vânzaș","vanzasule":"vânzaș","vanzasului":"vânzaș","vanzatoarea":"vânzătoare","vanzatoarei":"vânzătoare","vanzatoarele":"vânzătoare","vanzatoarelor":"vânzătoare","vanzatori":"vânzător","vanzatorii":"vânzător","vanzatorilor":"vânzător","vanzatorul":"vânzător","vanzatorule":"vânzător","vanzatorului":"vânzător","vanzolea":"vânzoli","vanzoleai":"vânzoli","vanzoleam":"vânzoli","vanzoleati":"vânzoli","vanzoleau":"vânzoli","vanzolele":"vânzoleală","vanzolelei":"vânzoleală","vanzolelele":"vânzoleală","vanzolelelor":"vânzoleală","vanzoleli":"vânzoleală","vanzolesc":"vânzoli","vanzoleste":"vânzoli","vanzolesti":"vânzoli","vanzolii":"vânzoli","vanzolim":"vânzoli","vanzolind":"vânzoli","vanzolira":"vânzoli","vanzoliram":"vânzoli","vanzolirati":"vânzoli","vanzolirea":"vânzolire","vanzoliri":"vânzolire","vanzolirii":"vânzolire","vanzolirile":"vânzolire","vanzolirilor":"vânzolire","vanzolise":"vânzoli","vanzolisem":"vânzoli","vanzolisera":"vânzoli","vanzoliseram":"vânzoli","vanzoliserati":"vânzoli","vanzolisesi":"vânzoli","vanzolisi":"vânzoli","vanzolit":"vânzoli","vanzoliti":"vânzoli","vapai":["vapai","vapa","văpăi","văpaie"],"vapaia":"văpaie","vapaiai":"văpăia","vapaiam":"văpăia","vapaiara":"văpăia","vapaiaram":"văpăia","vapaiarati":"văpăia","vapaiase":"văpăia","vapaiasem":"văpăia","vapaiasera":"văpăia","vapaiaseram":"văpăia","vapaiaserati":"văpăia","vapaiasesi":"văpăia","vapaiasi":"văpăia","vapaiat":"văpăia","vapaiati":"văpăia","vapaiau":"văpăia","vapaiaza":"văpăia","vapaie":"văpăia","vapaiem":"văpăia","vapaierea":"văpăiere","vapaieri":"văpăiere","vapaierii":"văpăiere","vapaierile":"văpăiere","vapaierilor":"văpăiere","vapaiez":"văpăia","vapaiezi":"văpăia","vapaii":"văpaie","vapaile":"văpaie","vapailor":"văpaie","vapaind":"văpăia","vapam":["vapăm","vapa","vapam","vapa"],"vapand":"vapa","vapara":"vapa","vaparam":"vapa","vaparati":"vapa","vapase":"vapa","vapasem":"vapa","vapasera":"vapa","vapaseram":"vapa","vapaserati":"vapa","vapasesi":"vapa","vapasi":"vapa","vapat":"vapa","vapati":"vapa","vapau":"vapa","vapeaza":"vapa","vapez":"vapa","vapezi":"vapa","vapoare":"vapor","vapoarele":"vapor","vapoarelor":"vapor","vaporarea":"vaporare","vaporari":"vaporare","vaporarii":"vaporare","vaporase":"vaporaș","vaporasele":"vaporaș","vaporaselor":"vaporaș","vaporasul":"vaporaș","vaporasule":"vaporaș","vaporasului":"vaporaș","vaporeanul":"vaporean","vaporeanule":"vaporean","vaporeanului":"vaporean","vaporeni":"vaporean","vaporenii":"vaporean","vaporenilor":"vaporean","vaporii":"vapori","vaporilor":"vapori","vaporizai":"vaporiza","vaporizam":["vaporizăm","vaporiza","vaporizam","vaporiza"],"vaporizand":"vaporiza","vaporizara":"vaporiza","vaporizaram":"vaporiza","vaporizarati":"vaporiza","vaporizarea":"vaporizare","vaporizari":"vaporizare","vaporizarii":"vaporizare","vaporizarile":"vaporizare","vaporizarilor":"vaporizare","vaporizase":"vaporiza","vaporizasem":"vaporiza","vaporizasera":"vaporiza","vaporizaseram":"vaporiza","vaporizaserati":"vaporiza","vaporizasesi":"vaporiza","vaporizasi":"vaporiza","vaporizat":"vaporiza","vaporizata":["vaporizată","vaporizat","vaporizata","vaporizat"],"vaporizate":"vaporizat","vaporizatele":"vaporizat","vaporizati":["vaporizați","vaporiza","vaporizați","vaporizat"],"vaporizatia":"vaporizație","vaporizatiei":"vaporizație","vaporizatii":["vaporizații","vaporizat","vaporizații","vaporizație"],"vaporizatiile":"vaporizație","vaporizatiilor":"vaporizație","vaporizatiunea":"vaporizațiune","vaporizatiuni":"vaporizațiune","vaporizatiunii":"vaporizațiune","vaporizatiunile":"vaporizațiune","vaporizatiunilor":"vaporizațiune","vaporizatoare":"vaporizator","vaporizatoarele":"vaporizator","vaporizatoarelor":"vaporizator","vaporizatorul":"vaporizator","vaporizatorule":"vaporizator","vaporizatorului":"vaporizator","vaporizatul":"vaporizat","vaporizau":"vaporiza","vaporizeaza":"vaporiza","vaporizez":"vaporiza","vaporizezi":"vaporiza","vaporoasa":["vaporoasă","vaporos","vaporoasa","vaporos"],"vaporoase":"vaporos","vaporoasele":"vaporos","vaporosi":"vaporos","vaporosii":"vaporos","vaporosul":"vaporos","vaporozitatea":"vaporozitate","vaporozitati":"vaporozitate","vaporozitatii":"vaporozitate","vaporul":"vapor","vaporule":"vapor","vaporului":"vapor","vapsea":"văpsi","vapseai":"văpsi","vapseam":"văpsi","vapseati":"văpsi","vapseau":"văpsi","vapseaua":"văpsea","vapsele":["văpsele","văpsea","văpsele","văpseală"],"vapselei":"văpsea","vapselele":"văpsea","vapselelor":"văpsea","vapseli":"văpseală","vapselii":"văpseală","vapselile":"văpseală","vapselilor":"văpseală","vapsesc":"văpsi","vapseste":"văpsi","vapsesti":"văpsi","vapsii":"văpsi","vapsim":"văpsi","vapsind":"văpsi","vapsira":"văpsi","vapsiram":"văpsi","vapsirati":"văpsi","vapsise":"văpsi","vapsisem":"văpsi","vapsisera":"văpsi","vapsiseram":"văpsi","vapsiserati":"văpsi","vapsisesi":"văpsi","vapsisi":"văpsi","vapsit":"văpsi","vapsiti":"văpsi","var":"vârî","vara":["vâră","vârî","vâra","vârî"],"varactoare":"varactor","varactoarele":"varactor","varactoarelor":"varactor","varactorul":"varactor","varactorule":"varactor","varactorului":"varactor","varai":["vărai","văra","vârai","vârî","vârâi","vârî"],"varam":["vărăm","văra","văram","văra","vârâm","vârî","vâram","vârî"],"varand":["vărând","văra","vârând","vârî"],"varani":"varan","varanii":"varan","varanilor":"varan","varanul":"varan","varanule":"varan","varanului":"varan","varara":["vărară","văra","vârâră","vârî"],"vararam":["vărarăm","văra","vârârăm","vârî"],"vararati":["vărarăți","văra","vârârăți","vârî"],"vararea":["vârârea","vârâre","vărarea","vărare"],"varari":["vărari","vărar","vârâri","vârâre","vărări","vărare"],"vararia":"vărărie","varariei":"vărărie","vararii":["vărarii","vărar","vârârii","vârâre","vărării","vărare","vărării","vărărie"],"varariile":"vărărie","varariilor":"vărărie","vararile":"vârâre","vararilor":["vărarilor","vărar","vârârilor","vârâre"],"vararul":"vărar","vararule":"vărar","vararului":"vărar","varase":["vărase","văra","vârâse","vârî"],"varasem":["vărasem","văra","vârâsem","vârî"],"varasera":["văraseră","văra","vârâseră","vârî"],"varaseram":["văraserăm","văra","vârâserăm","vârî"],"varaserati":["văraserăți","văra","vârâserăți","vârî"],"varasesi":["văraseși","văra","vârâseși","vârî"],"varasi":["vărași","văra","vârâși","vârî"],"varat":["vărat","văra","vârât","vârî"],"varatate":"veritate","varatec":"văratic","varateca":["văratecă","văratec","vărateca","văratec"],"varatece":"văratec","varatecele":"văratec","varateci":"văratec","varatecii":"văratec","varatecul":"văratec","varati":["vărați","văra","vârâți","vârî","vârați","vârî"],"varatica":["văratică","văratic","văratica","văratic"],"varatice":"văratic","varaticele":"văratic","varaticelor":"văratic","varatici":"văratic","varaticii":"văratic","varaticul":"văratic","varaticule":"văratic","varaticului":"văratic","varatul":"vărat","varatule":"vărat","varatului":"vărat","varau":["vărau","văra","vârau","vârî"],"varcolaci":"vârcolac","varcolacii":["vârcolacii","vârcolac","vârcolacii","vârcolaci"],"varcolacilor":["vârcolacilor","vârcolac","vârcolacilor","vârcolaci"],"varcolaciul":"vârcolaci","varcolaciule":"vârcolaci","varcolaciului":"vârcolaci","varcolacul":"vârcolac","varcolacule":"vârcolac","varcolacului":"vârcolac","varcolagi":"vârcolag","varcolagii":"vârcolag","varcolagilor":"vârcolag","varcolagul":"vârcolag","varcolagule":"vârcolag","varcolagului":"vârcolag","varcolici":"vârcolic","varcolicii":"vârcolic","varcolicilor":"vârcolic","varcolicul":"vârcolic","varcolicule":"vârcolic","varcolicului":"vârcolic","varda":"varză","vardisti":"vardist","vardistii":"vardist","vardistilor":"vardist","vardistul":"vardist","vardistule":"vardist","vardistului":"vardist","vareaza":"văra","varecul":"varec","varecule":"varec","varecului":"varec","varegi":"vareg","varegii":"vareg","varegilor":"vareg","varegul":"vareg","varegule":"vareg","varegului":"vareg","varez":"văra","varezi":"văra","varfsciorul":"vârfșcior","varfsciorule":"vârfșcior","varfsciorului":"vârfșcior","varfsoare":"vârfșor","varfsoarele":"vârfșor","varfsoarelor":"vârfșor","varfsorul":"vârfșor","varfsorule":"vârfșor","varfsorului":"vârfșor","varfuia":"vârfui","varfuiai":"vârfui","varfuiam":"vârfui","varfuiati":"vârfui","varfuiau":"vârfui","varfuiesc":"vârfui","varfuieste":"vârfui","varfuiesti":"vârfui","varfuii":"vârfui","varfuim":"vârfui","varfuind":"vârfui","varfuira":"vârfui","varfuiram":"vârfui","varfuirati":"vârfui","varfuise":"vârfui","varfuisem":"vârfui","varfuisera":"vârfui","varfuiseram":"vârfui","varfuiserati":"vârfui","varfuisesi":"vârfui","varfuisi":"vârfui","varfuit":"vârfui","varfuita":["vârfuită","vârfuit","vârfuita","vârfuit"],"varfuite":"vârfuit","varfuitele":"vârfuit","varfuiti":["vârfuiți","vârfui","vârfuiți","vârfuit"],"varfuitii":"vârfuit","varfuitul":"vârfuit","varful":"vârf","varfule":"vârf","varfulete":"vârfuleț","varfuletele":"vârfuleț","varfuletelor":"vârfuleț"};
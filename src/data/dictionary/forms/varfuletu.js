@@ -0,0 +1 @@
+export default {"varfuletul":"vârfuleț","varfuletule":"vârfuleț","varfuletului":"vârfuleț","varfului":"vârf","varfurelul":"vârfurel","varfurelule":"vârfurel","varfurelului":"vârfurel","varfuri":"vârf","varfurile":"vârf","varfurilor":"vârf","varfusoare":"vârfușor","varfusoarele":"vârfușor","varfusoarelor":"vârfușor","varfusorul":"vârfușor","varfusorule":"vârfușor","varfusorului":"vârfușor","varfutul":"vârfuț","varfutule":"vârfuț","varfutului":"vârfuț","vargai":"vărga","vargalute":"vărgăluță","vargalutei":"vărgăluță","vargam":["vărgăm","vărga","vărgam","vărga"],"vargand":"vărga","vargara":"vărga","vargaram":"vărga","vargarati":"vărga","vargase":"vărga","vargasem":"vărga","vargasera":"vărga","vargaseram":"vărga","vargaserati":"vărga","vargasesi":"vărga","vargasi":"vărga","vargasul":"vărgaș","vargasule":"vărgaș","vargasului":"vărgaș","vargat":"vărga","vargata":["vărgată","vărgat","vărgata","vărgat"],"vargate":"vărgat","vargatela":["vărgățelă","vărgățel","vărgățela","vărgățel"],"vargatele":["vărgatele","vărgat","vărgățele","vărgățel"],"vargatelele":"vărgățel","vargateli":"vărgățel","vargatelii":"vărgățel","vargatelul":"vărgățel","vargati":["vărgați","vărga","vărgați","vărgat"],"vargatii":"vărgat","vargatul":"vărgat","vargau":"vărga","vargeaza":"vărga","vargheaza":"vărga","varghez":"vărga","varghezi":"vărga","vargolagi":"vârgolag","vargolagii":"vârgolag","vargolagilor":"vârgolag","vargolagul":"vârgolag","vargolagule":"vârgolag","vargolagului":"vârgolag","vargulite":"vărguliță","vargulitei":"vărguliță","vargulitele":"vărguliță","vargulitelor":"vărguliță","vargusoare":"vărgușoară","vargusoarei":"vărgușoară","vargute":"vărguță","vargutei":"vărguță","vargutele":"vărguță","vargutelor":"vărguță","vari-ore":"var-oră","vari-orei":"var-oră","vari-orele":"var-oră","vari-orelor":"var-oră","varia":"variu","variabila":["variabilă","variabil","variabila","variabil"],"variabile":["variabile","variabil","variabile","variabilă"],"variabile aleatorii":"variabilă aleatorie","variabile continue":"variabilă continuă","variabile dependente":"variabilă dependentă","variabile independente":"variabilă independentă","variabilei":"variabilă","variabilele":["variabilele","variabil","variabilele","variabilă"],"variabilelor":"variabilă","variabili":"variabil","variabilii":"variabil","variabilitatea":"variabilitate","variabilitati":"variabilitate","variabilitatii":"variabilitate","variabilitatile":"variabilitate","variabilitatilor":"variabilitate","variabilul":"variabil","variace":"variac","variacele":"variac","variacelor":"variac","variacul":"variac","variacule":"variac","variacului":"variac","variai":"varia","variam":"varia","variante":["variante","variantă","varianțe","varianță"],"variantei":["variantei","variantă","varianței","varianță"],"variantele":["variantele","variantă","varianțele","varianță"],"variantelor":["variantelor","variantă","varianțelor","varianță"],"variara":"varia","variaram":"varia","variarati":"varia","variase":"varia","variasem":"varia","variasera":"varia","variaseram":"varia","variaserati":"varia","variasesi":"varia","variasi":"varia","variat":"varia","variata":["variată","variat","variata","variat"],"variate":"variat","variatele":"variat","variati":["variați","varia","variați","variat"],"variatia":"variație","variatiei":"variație","variatii":["variații","variat","variații","variație"],"variatii magnetice":"variație magnetică","variatiile":"variație","variatiilor":"variație","variationala":["variațională","variațional","variaționala","variațional"],"variationale":"variațional","variationalele":"variațional","variationali":"variațional","variationalii":"variațional","variationalul":"variațional","variatiunea":"variațiune","variatiuni":"variațiune","variatiunii":"variațiune","variatiunile":"variațiune","variatiunilor":"variațiune","variatul":"variat","variau":"varia","variaza":"varia","varicape":"varicap","varicapele":"varicap","varicapelor":"varicap","varicapul":"varicap","varicapule":"varicap","varicapului":"varicap","varicea":"varice","varicei":"varice","varicele":"varicelă","varicelei":"varicelă","varicelele":"varicelă","varicelelor":"varicelă","variceliforma":["variceliformă","variceliform","variceliforma","variceliform"],"variceliforme":"variceliform","variceliformele":"variceliform","variceliformi":"variceliform","variceliformii":"variceliform","variceliformul":"variceliform","varicoasa":["varicoasă","varicos","varicoasa","varicos"],"varicoase":"varicos","varicoasele":"varicos","varicocele":"varicocel","varicocelele":"varicocel","varicocelelor":"varicocel","varicocelul":"varicocel","varicocelule":"varicocel","varicocelului":"varicocel","varicosi":"varicos","varicosii":"varicos","varicosul":"varicos","varicozitatea":"varicozitate","varicozitati":"varicozitate","varicozitatii":"varicozitate","varicozitatile":"varicozitate","varicozitatilor":"varicozitate","varie":["varie","varia","varie","variu"],"variem":"varia","varierea":"variere","varieri":"variere","varierii":"variere","varierile":"variere","varierilor":"variere","varietatea":"varietate","varietati":["varietăți","varietate","varietati","varietate"],"varietatii":"varietate","varietatile":"varietate","varietatilor":"varietate","varieteul":["varieteul","variete","varieteul","varieteu"],"varieteule":["varieteule","variete","varieteule","varieteu"],"varieteului":["varieteului","variete","varieteului","varieteu"],"varieteuri":["varieteuri","variete","varieteuri","varieteu"],"varieteurile":["varieteurile","variete","varieteurile","varieteu"],"varieteurilor":["varieteurilor","variete","varieteurilor","varieteu"],"variez":"varia","variezi":"varia","varii":"variu","variii":"variu","variile":"variu","variind":"varia","variole":"variolă","variolei":"variolă","variolele":"variolă","variolelor":"variolă","variolica":["variolică","variolic","variolica","variolic"],"variolice":"variolic","variolicele":"variolic","variolici":"variolic","variolicii":"variolic","variolicul":"variolic","varioliforma":["varioliformă","varioliform","varioliforma","varioliform"],"varioliforme":"varioliform","varioliformele":"varioliform","varioliformi":"varioliform","varioliformii":"varioliform","varioliformul":"varioliform","variolizarea":"variolizare","variolizari":"variolizare","variolizarii":"variolizare","variolizarile":"variolizare","variolizarilor":"variolizare","variolizatiunea":"variolizațiune","variolizatiuni":"variolizațiune","variolizatiunii":"variolizațiune","varioloasa":["varioloasă","variolos","varioloasa","variolos"],"varioloase":"variolos","varioloasele":"variolos","varioloidul":"varioloid","varioloidule":"varioloid","varioloidului":"varioloid","variolosi":"variolos","variolosii":"variolos","variolosul":"variolos","variometre":"variometru","variometrele":"variometru","variometrelor":"variometru","variometrul":"variometru","variometrule":"variometru","variometrului":"variometru","varistoare":"varistor","varistoarele":"varistor","varistoarelor":"varistor","varistorul":"varistor","varistorule":"varistor","varistorului":"varistor","variul":"variu","varlaiora":["vârlăioră","vârlăior","vârlăiora","vârlăior"],"varlaiore":"vârlăior","varlaiorele":"vârlăior","varlaiori":"vârlăior","varlaiorii":"vârlăior","varlaiorul":"vârlăior","varlava":["vârlavă","vârlav","vârlava","vârlav"],"varlave":"vârlav","varlavele":"vârlav","varlavi":"vârlav","varlavii":"vârlav","varlaviora":["vârlăvioră","vârlăvior","vârlăviora","vârlăvior"],"varlaviore":"vârlăvior","varlaviorele":"vârlăvior","varlaviori":"vârlăvior","varlaviorii":"vârlăvior","varlaviorul":"vârlăvior","varlavul":"vârlav","varlugi":"vârlugă","varlugii":"vârlugă","varlugile":"vârlugă","varlugilor":"vârlugă","varmetre":"varmetru","varmetrele":"varmetru","varmetrelor":"varmetru","varmetrul":"varmetru","varmetrule":"varmetru","varmetrului":"varmetru","varnite":"varniță","varnitei":"varniță","varnitele":"varniță","varnitelor":"varniță","varoasa":["văroasă","văros","văroasa","văros"],"varoase":"văros","varoasele":"văros","varometre":"varometru","varometrele":"varometru","varometrelor":"varometru","varometrul":"varometru","varometrule":"varometru","varometrului":"varometru","varosi":"văros","varosii":"văros","varosul":"văros","vars":"vărsa","varsai":"vărsa","varsam":["vărsăm","vărsa","vărsam","vărsa"],"varsamantul":"vărsământ","varsamantule":"vărsământ","varsamantului":"vărsământ","varsaminte":"vărsământ","varsamintele":"vărsământ","varsamintelor":"vărsământ","varsand":"vărsa","varsara":"vărsa","varsaram":"vărsa","varsarati":"vărsa","varsarea":"vărsare","varsari":"vărsare","varsarii":"vărsare","varsarile":"vărsare","varsarilor":"vărsare","varsase":"vărsa","varsasem":"vărsa","varsasera":"vărsa","varsaseram":"vărsa","varsaserati":"vărsa","varsasesi":"vărsa","varsasi":"vărsa","varsat":"vărsa","varsat sange":"vărsa sânge","varsata":["vărsată","vărsat","vărsata","vărsat"],"varsate":"vărsat","varsatele":"vărsat","varsati":["vărsați","vărsa","vărsați","vărsat"],"varsatii":"vărsat","varsatoare":"vărsător","varsatoarea":["vărsătoarea","vărsătoare","vărsătoarea","vărsător"],"varsatoarei":"vărsătoare","varsatoarele":["vărsătoarele","vărsătoare","vărsătoarele","vărsător"],"varsatoarelor":"vărsătoare","varsatori":"vărsător","varsatorii":"vărsător","varsatorilor":"vărsător","varsatorul":"vărsător","varsatorule":"vărsător","varsatorului":"vărsător","varsatul":"vărsat","varsaturi":"vărsătură","varsaturii":"vărsătură","varsaturile":"vărsătură","varsaturilor":"vărsătură","varsau":"vărsa","varsecunde":"varsecundă","varsecundei":"varsecundă","varsecundele":"varsecundă","varsecundelor":"varsecundă","varsegute":"vârșeguț","varsegutele":"vârșeguț","varsegutelor":"vârșeguț","varsegutul":"vârșeguț","varsegutule":"vârșeguț","varsegutului":"vârșeguț","varselul":"vârșel","varselule":"vârșel","varselului":"vârșel","varsi":"vârșă","varsii":"vârșă","varsile":"vârșă","varsilor":"vârșă","varste":"vârstă","varste de consimtamant":"vârstă de consimțământ","varsteanul":"vârstean","varsteanule":"vârstean","varsteanului":"vârstean","varstei":"vârstă","varstele":"vârstă","varstelor":"vârstă","varsteni":"vârstean","varstenii":"vârstean","varstenilor":"vârstean","varstnica":["vârstnică","vârstnic","vârstnica","vârstnic"],"varstnice":["vârstnice","vârstnic","vârstnice","vârstnică"],"varstnicei":"vârstnică","varstnicele":["vârstnicele","vârstnic","vârstnicele","vârstnică"],"varstnicelor":"vârstnică","varstnici":"vârstnic","varstnicia":"vârstnicie","varstniciei":"vârstnicie","varstnicii":["vârstnicii","vârstnic","vârstnicii","vârstnicie"],"varstnicul":"vârstnic","varsulite":"vârșuliță","varsulitei":"vârșuliță","vartecapul":"vârtecap","vartecapule":"vârtecap","vartecapului":"vârtecap","vartecusul":"vârtecuș","vartecusule":"vârtecuș","vartecusului":"vârtecuș","vartecusuri":"vârtecuș","vartecusurile":"vârtecuș","vartecusurilor":"vârtecuș","vartejea":"vârteji","vartejeai":"vârteji","vartejeam":"vârteji","vartejeati":"vârteji","vartejeau":"vârteji","vartejesc":"vârteji","vartejeste":"vârteji","vartejesti":"vârteji","vartejii":"vârteji","vartejim":"vârteji","vartejind":"vârteji","vartejira":"vârteji","vartejiram":"vârteji","vartejirati":"vârteji","vartejirea":"vârtejire","vartejise":"vârteji","vartejisem":"vârteji","vartejisera":"vârteji","vartejiseram":"vârteji","vartejiserati":"vârteji","vartejisesi":"vârteji","vartejisi":"vârteji","vartejit":"vârteji","vartejiti":"vârteji","vartejitoare":"vârtejitor","vartejitoarea":"vârtejitor","vartejitoarele":"vârtejitor","vartejitori":"vârtejitor","vartejitorii":"vârtejitor","vartejitorul":"vârtejitor","vartejiture":"vârtejitură","vartejiturei":"vârtejitură","vartejuia":"vârtejui","vartejuiai":"vârtejui","vartejuiam":"vârtejui","vartejuiati":"vârtejui","vartejuiau":"vârtejui","vartejuiesc":"vârtejui","vartejuieste":"vârtejui","vartejuiesti":"vârtejui","vartejuii":"vârtejui","vartejuim":"vârtejui","vartejuind":"vârtejui","vartejuira":"vârtejui","vartejuiram":"vârtejui","vartejuirati":"vârtejui","vartejuirea":"vârtejuire","vartejuiri":"vârtejuire","vartejuirii":"vârtejuire","vartejuirile":"vârtejuire","vartejuirilor":"vârtejuire","vartejuise":"vârtejui","vartejuisem":"vârtejui","vartejuisera":"vârtejui","vartejuiseram":"vârtejui","vartejuiserati":"vârtejui","vartejuisesi":"vârtejui","vartejuisi":"vârtejui","vartejuit":"vârtejui","vartejuiti":"vârtejui","vartejul":"vârtej","vartejule":"vârtej","vartejului":"vârtej","vartejuri":"vârtej","vartejurile":"vârtej","vartejurilor":"vârtej","vartelnicioare":"vârtelnicioară","vartelnicioarei":"vârtelnicioară","vartesce":"vârteșcă","vartescei":"vârteșcă","varticusul":"vârticuș","varticusule":"vârticuș","varticusului":"vârticuș","varticusuri":"vârticuș","varticusurile":"vârticuș","varticusurilor":"vârticuș","vartirea":"vârtire","vartiri":"vârtire","vartirii":"vârtire","vartirile":"vârtire","vartirilor":"vârtire","vartoasa":["vârtoasă","vârtos","vârtoasa","vârtos"],"vartoase":"vârtos","vartoasele":"vârtos","vartopul":"vârtop","vartopule":"vârtop","vartopului":"vârtop","vartopuri":"vârtop","vartopurile":"vârtop","vartopurilor":"vârtop","vartosi":"vârtos","vartosia":"vârtoșie","vartosiei":"vârtoșie","vartosii":["vârtoșii","vârtos","vârtoșii","vârtoșie"],"vartosiile":"vârtoșie","vartosiilor":"vârtoșie","vartosul":"vârtos","vartucioasa":["vârtucioasă","vârtucios","vârtucioasa","vârtucios"],"vartucioase":"vârtucios","vartucioasele":"vârtucios","vartuciosi":"vârtucios","vartuciosii":"vârtucios","vartuciosul":"vârtucios","vartutea":"vârtute","vartuti":"vârtute","vartutii":"vârtute","vartutile":"vârtute","vartutilor":"vârtute","varuce":"vărucă","varucei":"vărucă","varucul":"văruc","varucule":"văruc","varucului":"văruc","varuia":"vărui","varuiai":"vărui","varuiam":"vărui","varuiati":"vărui","varuiau":"vărui","varuice":"văruică","varuicei":"văruică","varuieli":"văruială","varuielii":"văruială","varuielile":"văruială","varuielilor":"văruială","varuiesc":"vărui","varuieste":"vărui","varuiesti":"vărui","varuii":"vărui","varuim":"vărui","varuind":"vărui","varuira":"vărui","varuiram":"vărui","varuirati":"vărui","varuirea":"văruire","varuiri":"văruire","varuirii":"văruire","varuirile":"văruire","varuirilor":"văruire","varuise":"vărui","varuisem":"vărui","varuisera":"vărui","varuiseram":"vărui","varuiserati":"vărui","varuisesi":"vărui","varuisi":"vărui","varuit":"vărui","varuita":["văruită","văruit","văruita","văruit"],"varuite":"văruit","varuitele":"văruit","varuiti":["văruiți","vărui","văruiți","văruit"],"varuitii":"văruit","varuitorutul":"văruitoruț","varuitorutule":"văruitoruț","varuitorutului":"văruitoruț","varuitul":"văruit","varul":["varul","var","vărul","văr"],"varule":["varule","var","vărule","văr"],"varului":["varului","var","vărului","văr"],"varuri":"var","varurile":"var","varurilor":"var","varusul":"varus","varusule":"varus","varusului":"varus","varutul":"văruț","varutule":"văruț","varutului":"văruț","varvara":["varvară","varvar","varvara","varvar"],"varvare":"varvar","varvarele":"varvar","varvari":"varvar","varvaria":"varvarie","varvariceasca":["varvaricească","varvaricesc","varvariceasca","varvaricesc"],"varvaricescul":"varvaricesc","varvaricesti":"varvaricesc","varvaricestii":"varvaricesc","varvaricestile":"varvaricesc","varvariei":"varvarie","varvarii":["varvarii","varvar","varvarii","varvarie"],"varvariile":"varvarie","varvariilor":"varvarie","varvarilor":"varvar","varvarimea":"varvarime","varvarimi":"varvarime","varvarimii":"varvarime","varvarlacul":"varvarlâc","varvarlacule":"varvarlâc","varvarlacului":"varvarlâc","varvarul":"varvar","varvarule":"varvar","varvarului":"varvar","varve":"varvă","varvei":"varvă","varvele":"varvă","varvelor":"varvă","varvul":"vârv","varvule":"vârv","varvului":"vârv","varvuri":"vârv","varvurile":"vârv","varvurilor":"vârv","varvutul":"vârvuț","varvutule":"vârvuț","varvutului":"vârvuț","varvuturi":"vârvuț","varvuturile":"vârvuț","varvuturilor":"vârvuț","varzarea":"vărzare","varzari":["vărzari","vărzar","vărzări","vărzare"],"varzaria":"vărzărie","varzariei":"vărzărie","varzarii":["vărzarii","vărzar","vărzării","vărzare","vărzării","vărzărie"],"varzariile":"vărzărie","varzariilor":"vărzărie","varzarile":"vărzare","varzarilor":["vărzarilor","vărzar","vărzărilor","vărzare"],"varzarul":"vărzar","varzarule":"vărzar","varzarului":"vărzar","varzuia":"vărzui","varzuiai":"vărzui","varzuiam":"vărzui","varzuiati":"vărzui","varzuiau":"vărzui","varzuiesc":"vărzui","varzuieste":"vărzui","varzuiesti":"vărzui","varzuii":"vărzui","varzuim":"vărzui","varzuind":"vărzui","varzuira":"vărzui","varzuiram":"vărzui","varzuirati":"vărzui","varzuise":"vărzui","varzuisem":"vărzui","varzuisera":"vărzui","varzuiseram":"vărzui","varzuiserati":"vărzui","varzuisesi":"vărzui","varzuisi":"vărzui","varzuit":"vărzui","varzuita":["vărzuită","vărzuit","vărzuita","vărzuit"],"varzuite":"vărzuit","varzuitele":"vărzuit","varzuiti":["vărzuiți","vărzui","vărzuiți","vărzuit"],"varzuitii":"vărzuit","varzuitul":"vărzuit","varzulite":"vărzuliță","varzulitei":"vărzuliță","varzute":"vărzuță","varzutei":"vărzuță","varzutele":"vărzuță","varzutelor":"vărzuță","vasale":"vasală","vasalei":"vasală","vasalele":"vasală","vasalelor":"vasală","vasali":"vasal","vasalia":"văsălie","vasalica":["vasalică","vasalic","vasalica","vasalic"],"vasalice":"vasalic","vasalicele":"vasalic","vasalici":"vasalic","vasalicii":"vasalic","vasalicul":"vasalic","vasaliei":"văsălie","vasalii":["vasalii","vasal","văsălii","văsălie"],"vasalilor":"vasal","vasalitatea":"vasalitate","vasalitati":"vasalitate","vasalitatii":"vasalitate","vasalitatile":"vasalitate","vasalitatilor":"vasalitate","vasalitica":["vasalitică","vasalitic","vasalitica","vasalitic"],"vasalitice":"vasalitic","vasaliticele":"vasalitic","vasalitici":"vasalitic","vasaliticii":"vasalitic","vasaliticul":"vasalitic","vasalul":"vasal","vasalule":"vasal","vasalului":"vasal","vasarea":"văsări","vasareai":"văsări","vasaream":"văsări","vasareati":"văsări","vasareau":"văsări","vasaresc":"văsări","vasareste":"văsări","vasaresti":"văsări","vasari":"văsar","vasaria":"văsărie","vasariei":"văsărie","vasarii":["văsarii","văsar","văsării","văsări","văsării","văsărie"],"vasarilor":"văsar","vasarim":"văsări","vasarind":"văsări","vasarira":"văsări","vasariram":"văsări","vasarirati":"văsări","vasarise":"văsări","vasarisem":"văsări","vasarisera":"văsări","vasariseram":"văsări","vasariserati":"văsări","vasarisesi":"văsări","vasarisi":"văsări","vasarit":"văsări","vasariti":"văsări","vasarul":"văsar","vasarule":"văsar","vasarului":"văsar","vasarvagul":"vasărvag","vasarvagule":"vasărvag","vasarvagului":"vasărvag","vasce":"vască","vascei":"vască","vascele":"vască","vascelor":"vască","vascioare":"văscior","vascioarele":"văscior","vascioarelor":"văscior","vasciorul":"văscior","vasciorule":"văscior","vasciorului":"văscior","vascoasa":["vâscoasă","vâscos","vâscoasa","vâscos"],"vascoase":"vâscos","vascoasele":"vâscos","vascosi":"vâscos","vascosii":"vâscos","vascosul":"vâscos","vascozitate":"viscozitate","vascozitatea":"vâscozitate","vascozitati":"vâscozitate","vascozitatii":"vâscozitate","vascozitatile":"vâscozitate","vascozitatilor":"vâscozitate","vascul":"vâsc","vasculara":["vasculară","vascular","vasculara","vascular"],"vasculare":"vascular","vascularele":"vascular","vasculari":"vascular","vascularii":"vascular","vascularitatea":"vascularitate","vascularitati":"vascularitate","vascularitatii":"vascularitate","vascularite":"vascularită","vascularitei":"vascularită","vasculariz":"vasculariza","vascularizai":"vasculariza","vascularizam":["vascularizăm","vasculariza","vascularizam","vasculariza"],"vascularizand":"vasculariza","vascularizara":"vasculariza","vascularizaram":"vasculariza","vascularizarati":"vasculariza","vascularizarea":"vascularizare","vascularizari":"vascularizare","vascularizarii":"vascularizare","vascularizarile":"vascularizare","vascularizarilor":"vascularizare","vascularizase":"vasculariza","vascularizasem":"vasculariza","vascularizasera":"vasculariza","vascularizaseram":"vasculariza","vascularizaserati":"vasculariza","vascularizasesi":"vasculariza","vascularizasi":"vasculariza","vascularizat":"vasculariza","vascularizata":["vascularizată","vascularizat","vascularizata","vascularizat"],"vascularizate":"vascularizat","vascularizatele":"vascularizat","vascularizati":["vascularizați","vasculariza","vascularizați","vascularizat"],"vascularizatia":"vascularizație","vascularizatiei":"vascularizație","vascularizatii":["vascularizații","vascularizat","vascularizații","vascularizație"],"vascularizatiile":"vascularizație","vascularizatiilor":"vascularizație","vascularizatul":"vascularizat","vascularizau":"vasculariza","vascularizeaza":"vasculariza","vascularizi":"vasculariza","vascularul":"vascular","vascule":"vâsc","vascului":"vâsc","vascusorul":"vâscușor","vascusorule":"vâscușor","vascusorului":"vâscușor","vase":"vas","vase de razboi":"vas de război","vase de sange":"vas de sânge","vase deferente":"vas deferent","vase sanguine":"vas sanguin","vasectomia":"vasectomie","vasectomiei":"vasectomie","vasectomii":"vasectomie","vasectomiile":"vasectomie","vasectomiilor":"vasectomie","vaselagiuul":"vaselagiu","vaselagiuule":"vaselagiu","vaselagiuului":"vaselagiu","vasele":["vasele","vas","vasele","vasel","vașele","vașel"],"vaselele":["vaselele","vasel","vașelele","vașel"],"vaselelor":["vaselelor","vasel","vașelelor","vașel"],"vaseline":"vaselină","vaselinei":"vaselină","vaselinele":"vaselină","vaselinelor":"vaselină","vaselor":"vas","vaselul":["vaselul","vasel","vașelul","vașel"],"vaselule":["vaselule","vasel","vașelule","vașel"],"vaselului":["vaselului","vasel","vașelului","vașel"],"vasete":"vașetă","vasetei":"vașetă","vasetele":"vașetă","vasetelor":"vașetă","vasfrangerea":"vasfrângere","vasfrangeri":"vasfrângere","vasfrangerii":"vasfrângere","vasilicai":"Vasilica","vasiline":"vasilină","vasilinei":"vasilină","vasilinele":"vasilină","vasilinelor":"vasilină","vasiliscul":"vasilisc","vasiliscule":"vasilisc","vasiliscului":"vasilisc","vasilisti":"vasilisc","vasilistii":"vasilisc","vasilistilor":"vasilisc","vasisorul":"văsișor","vasisorule":"văsișor","vasisorului":"văsișor","vaslai":"vâsla","vaslam":["vâslăm","vâsla","vâslam","vâsla"],"vasland":"vâsla","vaslara":"vâsla","vaslaram":"vâsla","vaslarati":"vâsla","vaslase":"vâsla","vaslasem":"vâsla","vaslasera":"vâsla","vaslaseram":"vâsla","vaslaserati":"vâsla","vaslasesi":"vâsla","vaslasi":["vâslași","vâsla","vâslași","vâslaș"],"vaslasii":"vâslaș","vaslasilor":"vâslaș","vaslasul":"vâslaș","vaslasule":"vâslaș","vaslasului":"vâslaș","vaslat":"vâsla","vaslati":"vâsla","vaslau":"vâsla","vasle":"vâslă","vaslea":"vâsli","vasleai":"vâsli","vasleam":"vâsli","vasleati":"vâsli","vasleau":"vâsli","vasleaza":"vâsla","vaslei":"vâslă","vaslele":"vâslă","vaslelor":"vâslă","vaslesc":"vâsli","vasleste":"vâsli","vaslesti":"vâsli","vaslez":"vâsla","vaslezi":"vâsla","vaslii":"vâsli","vaslim":"vâsli","vaslind":"vâsli","vaslira":"vâsli","vasliram":"vâsli","vaslirati":"vâsli","vaslirea":"vâslire","vasliri":"vâslire","vaslirii":"vâslire","vaslirile":"vâslire","vaslirilor":"vâslire","vaslise":"vâsli","vaslisem":"vâsli","vaslisera":"vâsli","vasliseram":"vâsli","vasliserati":"vâsli","vaslisesi":"vâsli","vaslisi":"vâsli","vaslisoare":"vâslișoară","vaslisoarei":"vâslișoară","vaslisoarele":"vâslișoară","vaslisoarelor":"vâslișoară","vaslit":"vâsli","vasliti":"vâsli","vaslitori":"vâslitor","vaslitorii":"vâslitor","vaslitorilor":"vâslitor","vaslitorul":"vâslitor","vaslitorule":"vâslitor","vaslitorului":"vâslitor","vaslitul":"vâslit","vaslitule":"vâslit","vaslitului":"vâslit","vaslituri":"vâslit","vasliturile":"vâslit","vasliturilor":"vâslit","vasluianul":"vasluian","vasluianule":"vasluian","vasluianului":"vasluian","vasluience":"vasluiancă","vasluiencei":"vasluiancă","vasluiencele":"vasluiancă","vasluiencelor":"vasluiancă","vasluiene":"vasluiană","vasluienei":"vasluiană","vasluienele":"vasluiană","vasluienelor":"vasluiană","vasluieni":"vasluian","vasluienii":"vasluian","vasluienilor":"vasluian","vasluiul":"Vaslui","vasluiule":"Vaslui","vasluiului":"Vaslui","vasoconstrictia":"vasoconstricție","vasoconstrictiei":"vasoconstricție","vasoconstrictii":"vasoconstricție","vasoconstrictiile":"vasoconstricție","vasoconstrictiilor":"vasoconstricție","vasoconstrictiunea":"vasoconstricțiune","vasoconstrictiuni":"vasoconstricțiune","vasoconstrictiunii":"vasoconstricțiune","vasoconstrictiunile":"vasoconstricțiune","vasoconstrictiunilor":"vasoconstricțiune","vasoconstrictoare":"vasoconstrictor","vasoconstrictoarea":"vasoconstrictor","vasoconstrictoarele":"vasoconstrictor","vasoconstrictori":"vasoconstrictor","vasoconstrictorii":"vasoconstrictor","vasoconstrictorul":"vasoconstrictor","vasocontrictia":"vasocontricție","vasocontrictiei":"vasocontricție","vasocontrictii":"vasocontricție","vasodilatarea":"vasodilatare","vasodilatari":"vasodilatare","vasodilatarii":"vasodilatare","vasodilatarile":"vasodilatare","vasodilatarilor":"vasodilatare","vasodilatatia":"vasodilatație","vasodilatatiei":"vasodilatație","vasodilatatii":"vasodilatație","vasodilatatiile":"vasodilatație","vasodilatatiilor":"vasodilatație","vasodilatatiunea":"vasodilatațiune","vasodilatatiuni":"vasodilatațiune","vasodilatatiunii":"vasodilatațiune","vasodilatatiunile":"vasodilatațiune","vasodilatatiunilor":"vasodilatațiune","vasodilatatoare":"vasodilatator","vasodilatatoarea":"vasodilatator","vasodilatatoarele":"vasodilatator","vasodilatatori":"vasodilatator","vasodilatatorii":"vasodilatator","vasodilatatorul":"vasodilatator","vasografia":"vasografie","vasografiei":"vasografie","vasografii":"vasografie","vasografiile":"vasografie","vasografiilor":"vasografie","vasomotricitatea":"vasomotricitate","vasomotricitati":"vasomotricitate","vasomotricitatii":"vasomotricitate","vasoplegia":"vasoplegie","vasoplegiei":"vasoplegie","vasoplegii":"vasoplegie","vasopresine":"vasopresină","vasopresinei":"vasopresină","vasopresinele":"vasopresină","vasopresinelor":"vasopresină","vasotomia":"vasotomie","vasotomiei":"vasotomie","vasotomii":"vasotomie","vasotomiile":"vasotomie","vasotomiilor":"vasotomie","vaspriemnicul":"văspriemnic","vaspriemnicule":"văspriemnic","vaspriemnicului":"văspriemnic","vasta":["vastă","vast","vasta","vast"],"vaste":"vast","vastele":"vast","vasti":"vast","vastii":"vast","vastitatea":"vastitate","vastitati":"vastitate","vastitatii":"vastitate","vastul":"vast","vasucul":"văsuc","vasucule":"văsuc","vasucului":"văsuc","vasul":"vas","vasule":"vas","vasuleanul":"văsulean","vasuleanule":"văsulean","vasuleanului":"văsulean","vasulene":"văsulean","vasulenele":"văsulean","vasulenelor":"văsulean","vasulete":"văsuleț","vasuletele":"văsuleț","vasuletelor":"văsuleț","vasuletul":"văsuleț","vasuletule":"văsuleț","vasuletului":"văsuleț","vasului":"vas","vasusoare":"văsușor","vasusoarele":"văsușor","vasusoarelor":"văsușor","vasusorul":"văsușor","vasusorule":"văsușor","vasusorului":"văsușor","vasute":"văsuț","vasutele":"văsuț","vasutelor":"văsuț","vasutul":"văsuț","vasutule":"văsuț","vasutului":"văsuț","vatajea":"vătăji","vatajeai":"vătăji","vatajeam":"vătăji","vatajeasca":["vătăjească","vătăjesc","vătăjeasca","vătăjesc"],"vatajeati":"vătăji","vatajeau":"vătăji","vatajeli":"vătăjel","vatajelii":"vătăjel","vatajelilor":"vătăjel","vatajelul":"vătăjel","vatajelule":"vătăjel","vatajelului":"vătăjel","vatajesc":"vătăji","vatajescul":"vătăjesc","vatajeste":"vătăji","vatajesti":["vătăjești","vătăjesc","vătăjești","vătăji"],"vatajestii":"vătăjesc","vatajestile":"vătăjesc","vatajii":"vătăji","vatajim":"vătăji","vatajind":"vătăji","vatajira":"vătăji","vatajiram":"vătăji","vatajirati":"vătăji","vatajise":"vătăji","vatajisem":"vătăji","vatajisera":"vătăji","vatajiseram":"vătăji","vatajiserati":"vătăji","vatajisesi":"vătăji","vatajisi":"vătăji","vatajit":"vătăji","vatajite":"vătăjiță","vatajitei":"vătăjiță","vatajitele":"vătăjiță","vatajitelor":"vătăjiță","vatajiti":"vătăji","vatale":"vatală","vatalei":"vatală","vatalele":"vatală","vatalelor":"vatală","vatam":"vătăma","vatamai":"vătăma","vatamam":["vătămăm","vătăma","vătămam","vătăma"],"vatamand":"vătăma","vatamani":"vătăman","vatamanii":"vătăman","vatamanilor":"vătăman","vatamanul":"vătăman","vatamanule":"vătăman","vatamanului":"vătăman","vatamara":"vătăma","vatamaram":"vătăma","vatamarati":"vătăma","vatamari":"vătămare","vatamase":"vătăma","vatamasem":"vătăma","vatamasera":"vătăma","vatamaseram":"vătăma","vatamaserati":"vătăma","vatamasesi":"vătăma","vatamasi":"vătăma","vatamat":"vătăma","vatamata":["vătămată","vătămat","vătămata","vătămat"],"vatamate":"vătămat","vatamatele":"vătămat","vatamati":["vătămați","vătăma","vătămați","vătămat"],"vatamatii":"vătămat","vatamatoare":"vătămător","vatamatoarea":["vătămătoarea","vătămătoare","vătămătoarea","vătămător"],"vatamatoarei":"vătămătoare","vatamatoarele":["vătămătoarele","vătămătoare","vătămătoarele","vătămător"],"vatamatoarelor":"vătămătoare","vatamatori":"vătămător","vatamatorii":"vătămător","vatamatorul":"vătămător","vatamatul":"vătămat","vatamaturi":"vătămătură","vatamaturii":"vătămătură","vatamaturile":"vătămătură","vatamaturilor":"vătămătură","vatamau":"vătăma","vatame":"vătăma","vatami":"vătăma","vatasei":"vătășel","vataseii":"vătășel","vataseilor":"vătășel","vataselul":"vătășel","vataselule":"vătășel","vataselului":"vătășel","vatasi":"vătaș","vatasii":"vătaș","vatasilor":"vătaș","vatasul":"vătaș","vatasule":"vătaș","vatasului":"vătaș","vatavi":"vătav","vatavii":"vătav","vatavilor":"vătav","vatavul":"vătav","vatavule":"vătav","vatavului":"vătav","vate":"vată","vatei":"vată","vaticana":["vaticană","vatican","vaticana","vatican"],"vaticane":"vatican","vaticanele":"vatican","vaticani":"vatican","vaticanii":"vatican","vaticanul":["vaticanul","Vatican","vaticanul","vatican"],"vaticanule":"Vatican","vaticanului":"Vatican","vaticinara":["vaticinară","vaticinar","vaticinara","vaticinar"],"vaticinare":"vaticinar","vaticinarele":"vaticinar","vaticinari":"vaticinar","vaticinarii":"vaticinar","vaticinarul":"vaticinar","vaticinatia":"vaticinație","vaticinatiei":"vaticinație","vaticinatii":"vaticinație","vaticinatiile":"vaticinație","vaticinatiilor":"vaticinație","vatmani":"vatman","vatmanii":"vatman","vatmanilor":"vatman","vatmanite":"vătmăniță","vatmanitei":"vătmăniță","vatmanitele":"vătmăniță","vatmanitelor":"vătmăniță","vatmanul":"vatman","vatmanule":"vatman","vatmanului":"vatman","vatologhia":"vatologhie","vatologhiei":"vatologhie","vatologhii":"vatologhie","vatosi":"vatos","vatosii":"vatos","vatosilor":"vatos","vatosul":"vatos","vatosule":"vatos","vatosului":"vatos","vatraiase":"vătrăiaș","vatraiasele":"vătrăiaș","vatraiaselor":"vătrăiaș","vatraiasul":"vătrăiaș","vatraiasule":"vătrăiaș","vatraiasului":"vătrăiaș","vatraie":"vătrai","vatraiele":"vătrai","vatraielor":"vătrai","vatraiul":"vătrai","vatraiule":"vătrai","vatraiului":"vătrai","vatrare":"vătrar","vatrarele":["vătrarele","vătrar","vătrărele","vătrărel"],"vatrarelele":"vătrărel","vatrarelelor":"vătrărel","vatrarelor":"vătrar","vatrarelul":"vătrărel","vatrarelule":"vătrărel","vatrarelului":"vătrărel","vatrarite":"vătrăriță","vatraritei":"vătrăriță","vatrarul":"vătrar","vatrarule":"vătrar","vatrarului":"vătrar","vatrarutul":"vătrăruț","vatrarutule":"vătrăruț","vatrarutului":"vătrăruț","vatrasul":"vătraș","vatrasule":"vătraș","vatrasului":"vătraș","vatrute":"vătruță","vatrutei":"vătruță","vatuia":"vătui","vatuiai":"vătui","vatuiam":"vătui","vatuiasul":"vătuiaș","vatuiasule":"vătuiaș","vatuiasului":"vătuiaș","vatuiati":"vătui","vatuiau":"vătui","vatuiesc":"vătui","vatuieste":"vătui","vatuiesti":"vătui","vatuii":"vătui","vatuilor":"vătui","vatuim":"vătui","vatuind":"vătui","vatuiorul":"vătuior","vatuiorule":"vătuior","vatuiorului":"vătuior","vatuira":"vătui","vatuiram":"vătui","vatuirati":"vătui","vatuirea":"vătuire","vatuiri":"vătuire","vatuirii":"vătuire","vatuirile":"vătuire","vatuirilor":"vătuire","vatuise":"vătui","vatuisem":"vătui","vatuisera":"vătui","vatuiseram":"vătui","vatuiserati":"vătui","vatuisesi":"vătui","vatuisi":"vătui","vatuit":"vătui","vatuite":"vătuiță","vatuitei":"vătuiță","vatuiti":"vătui","vatuiu":"vătui","vatuiul":"vătui","vatuiule":"vătui","vatuiului":"vătui","vaviloneasca":["vavilonească","vavilonesc","vaviloneasca","vavilonesc"],"vavilonescul":"vavilonesc","vavilonesti":"vavilonesc","vavilonestii":"vavilonesc","vavilonestile":"vavilonesc","vavilonia":"vavilonie","vaviloniei":"vavilonie","vavilonii":"vavilonie","vaviloniile":"vavilonie","vaviloniilor":"vavilonie","vazand":"vedea","vazatoare":"văzător","vazatoarea":"văzător","vazatoarele":"văzător","vazatori":"văzător","vazatorii":"văzător","vazatorul":"văzător","vazdarjania":"văzdârjanie","vazdarjaniei":"văzdârjanie","vazdarjanii":"văzdârjanie","vazdarjaniile":"văzdârjanie","vazdarjaniilor":"văzdârjanie","vazdarjnica":["văzdârjnică","văzdârjnic","văzdârjnica","văzdârjnic"],"vazdarjnice":"văzdârjnic","vazdarjnicele":"văzdârjnic","vazdarjnici":"văzdârjnic","vazdarjnicii":"văzdârjnic","vazdarjnicul":"văzdârjnic","vazdogeaua":"vâzdogea","vazdogele":"vâzdogea","vazdogelei":"vâzdogea","vazdogelele":"vâzdogea","vazdogelelor":"vâzdogea","vazdogice":"vâzdogică","vazdogicei":"vâzdogică","vazdogute":"vâzdoguță","vazdogutei":"vâzdoguță","vazduhul":"văzduh","vazduhule":"văzduh","vazduhului":"văzduh","vazduhuri":"văzduh","vazduhurile":"văzduh","vazduhurilor":"văzduh","vaze":"vază","vazei":"vază","vazele":"vază","vazelor":"vază","vazoane":"vazon","vazoanele":"vazon","vazoanelor":"vazon","vazonul":"vazon","vazonule":"vazon","vazonului":"vazon","vazu":"vedea","vazui":"vedea","vazul":"văz","vazule":"văz","vazului":"văz","vazura":"vedea","vazuram":"vedea","vazurati":"vedea","vazuse":"vedea","vazusem":"vedea","vazusera":"vedea","vazuseram":"vedea","vazuserati":"vedea","vazusesi":"vedea","vazusi":"vedea","vazut":"vedea","vazut lumina zilei":"vedea lumina zilei","vazut negru inaintea ochilor":"vedea negru înaintea ochilor","vazut rosu inaintea ochilor":"vedea roșu înaintea ochilor","vazut stele verzi":"vedea stele verzi","vazutul":"văzut","vazutule":"văzut","vazutului":"văzut","vazvijenia":"văzvijenie","vazvijeniei":"văzvijenie","vazvijenii":"văzvijenie","vazvijeniile":"văzvijenie","vazvijeniilor":"văzvijenie","veacinica":["veacinică","veacinic","veacinica","veacinic"],"veacinice":"veacinic","veacinicele":"veacinic","veacinici":"veacinic","veacinicii":"veacinic","veacinicul":"veacinic","veacul":"veac","veacule":"veac","veacului":"veac","veacuri":"veac","veacuri de aur":"veac de aur","veacurile":"veac","veacurilor":"veac","veastnici":"veastnic","veastnicii":"veastnic","veastnicilor":"veastnic","veastnicul":"veastnic","veastnicule":"veastnic","veastnicului":"veastnic","vecarul":"vecăr","vecarule":"vecăr","vecarului":"vecăr","vecea":"vece","vecernea":"vecerne","vecerni":"vecerne","vecernia":"vecernie","vecerniei":"vecernie","vecernii":["vecernii","vecerne","vecernii","vecernie"],"vecerniile":"vecernie","vecerniilor":"vecernie","vecernile":"vecerne","vecernilor":"vecerne","veceuri":"veceu","veceurile":"veceu","veceurilor":"veceu","veceuul":"veceu","veceuule":"veceu","veceuului":"veceu","veche":"vechi","vechea":"vechi","vechia":"vechie","vechiei":"vechie","vechietatea":"vechietate","vechietati":"vechietate","vechietatii":"vechietate","vechii":["vechii","vechi","vechii","vechie"],"vechilasi":"vechilaș","vechilasii":"vechilaș","vechilasilor":"vechilaș","vechilasul":"vechilaș","vechilasule":"vechilaș","vechilasului":"vechilaș","vechile":"vechi","vechiletul":"vechilet","vechiletule":"vechilet","vechiletului":"vechilet","vechileturi":"vechilet","vechileturile":"vechilet","vechileturilor":"vechilet","vechili":"vechil","vechilii":"vechil","vechililor":"vechil","vechilul":"vechil","vechilule":"vechil","vechilului":"vechil","vechimea":"vechime","vechimi":"vechime","vechimii":"vechime","vechimile":"vechime","vechimilor":"vechime","vechisora":["vechișoră","vechișor","vechișora","vechișor"],"vechisore":"vechișor","vechisorele":"vechișor","vechisori":"vechișor","vechisorii":"vechișor","vechisorul":"vechișor","vechita":["vechită","vechit","vechita","vechit"],"vechite":"vechit","vechitele":"vechit","vechiti":"vechit","vechitii":"vechit","vechitul":"vechit","vechituri":"vechitură","vechiturii":"vechitură","vechiturile":"vechitură","vechiturilor":"vechitură","vechiul":"vechi","vechiuti":"vechiuț","vechiutii":"vechiuț","vechiutilor":"vechiuț","vechiutul":"vechiuț","vechiutule":"vechiuț","vechiutului":"vechiuț","veci":["veci","veac","veci","vece"],"vecia":"vecie","veciei":"vecie","vecii":["vecii","vece","vecii","vecie"],"vecile":"vece","vecilor":"vece","vecina":["vecină","vecin","vecina","vecin"],"vecinala":["vecinală","vecinal","vecinala","vecinal"],"vecinale":"vecinal","vecinalele":"vecinal","vecinali":"vecinal","vecinalii":"vecinal","vecinalul":"vecinal","vecinasa":["vecinașă","vecinaș","vecinașa","vecinaș"],"vecinase":"vecinaș","vecinasele":"vecinaș","vecinasi":"vecinaș","vecinasii":"vecinaș","vecinasilor":"vecinaș","vecinasul":"vecinaș","vecinasule":"vecinaș","vecinasului":"vecinaș","vecinatatea":"vecinătate","vecinatateasca":["vecinătățească","vecinătățesc","vecinătățeasca","vecinătățesc"],"vecinatatescul":"vecinătățesc","vecinatatesti":"vecinătățesc","vecinatatestii":"vecinătățesc","vecinatatestile":"vecinătățesc","vecinatati":"vecinătate","vecinatatii":"vecinătate","vecinatatile":"vecinătate","vecinatatilor":"vecinătate","vecine":["vecine","vecin","vecine","vecină"],"vecineasca":["vecinească","vecinesc","vecineasca","vecinesc"],"vecinei":["vecinei","vecină","vecinei","vecinel"],"vecineii":"vecinel","vecineilor":"vecinel","vecinele":["vecinele","vecin","vecinele","vecină","vecinele","vecinică"],"vecinelei":"vecinică","vecinelele":"vecinică","vecinelelor":"vecinică","vecinelor":"vecină","vecinelul":"vecinel","vecinelule":"vecinel","vecinelului":"vecinel","vecinescul":"vecinesc","vecinesti":"vecinesc","vecinestii":"vecinesc","vecinestile":"vecinesc","vecini":"vecin","vecinia":"vecinie","vecinica":["vecinică","vecinic","vecinica","vecinic"],"vecinice":"vecinic","vecinicele":"vecinic","vecinici":"vecinic","vecinicia":"vecinicie","vecinicie":"veșnicie","veciniciei":"vecinicie","vecinicii":["vecinicii","vecinic","vecinicii","vecinicie"],"veciniciile":"vecinicie","veciniciilor":"vecinicie","vecinicul":"vecinic","veciniei":"vecinie","vecinii":["vecinii","vecin","vecinii","vecinie"],"vecinilor":"vecin","vecinimea":"vecinime","vecinimi":"vecinime","vecinimii":"vecinime","vecinioare":"vecinioară","vecinioarei":"vecinioară","vecinite":"veciniță","vecinitei":"veciniță","vecinuia":"vecinui","vecinuiai":"vecinui","vecinuiam":"vecinui","vecinuiati":"vecinui","vecinuiau":"vecinui","vecinuie":"vecinui","vecinuii":"vecinui","vecinuim":"vecinui","vecinuind":"vecinui","vecinuira":"vecinui","vecinuiram":"vecinui","vecinuirati":"vecinui","vecinuirea":"vecinuire","vecinuiri":"vecinuire","vecinuirii":"vecinuire","vecinuise":"vecinui","vecinuisem":"vecinui","vecinuisera":"vecinui","vecinuiseram":"vecinui","vecinuiserati":"vecinui","vecinuisesi":"vecinui","vecinuisi":"vecinui","vecinuit":"vecinui","vecinuiti":"vecinui","vecinul":"vecin","vecinule":"vecin","vecinului":"vecin","vecinute":"vecinuță","vecinutei":"vecinuță","vectarul":"vectăr","vectarule":"vectăr","vectarului":"vectăr","vectocardiografe":"vectocardiograf","vectocardiografele":"vectocardiograf","vectocardiografelor":"vectocardiograf","vectocardiografia":"vectocardiografie","vectocardiografiei":"vectocardiografie","vectocardiografii":"vectocardiografie","vectocardiografiile":"vectocardiografie","vectocardiografiilor":"vectocardiografie","vectocardiograful":"vectocardiograf","vectocardiografule":"vectocardiograf","vectocardiografului":"vectocardiograf","vectocardiograme":"vectocardiogramă","vectocardiogramei":"vectocardiogramă","vectocardiogramele":"vectocardiogramă","vectocardiogramelor":"vectocardiogramă","vectori":"vector","vectori proprii":"vector propriu","vectoriala":["vectorială","vectorial","vectoriala","vectorial"],"vectoriale":"vectorial","vectorialele":"vectorial","vectoriali":"vectorial","vectorialii":"vectorial","vectorialul":"vectorial","vectorii":"vector","vectorilor":"vector","vectorul":"vector","vectorule":"vector","vectorului":"vector","vecuia":"vecui","vecuiai":"vecui","vecuiam":"vecui","vecuiati":"vecui","vecuiau":"vecui","vecuiesc":"vecui","vecuieste":"vecui","vecuiesti":"vecui","vecuii":"vecui","vecuim":"vecui","vecuind":"vecui","vecuira":"vecui","vecuiram":"vecui","vecuirati":"vecui","vecuise":"vecui","vecuisem":"vecui","vecuisera":"vecui","vecuiseram":"vecui","vecuiserati":"vecui","vecuisesi":"vecui","vecuisi":"vecui","vecuit":"vecui","vecuiti":"vecui","vecuitoare":"vecuitor","vecuitoarea":"vecuitor","vecuitoarele":"vecuitor","vecuitori":"vecuitor","vecuitorii":"vecuitor","vecuitorul":"vecuitor","vede":"vedea","vede lumina zilei":"vedea lumina zilei","vede negru inaintea ochilor":"vedea negru înaintea ochilor","vede rosu inaintea ochilor":"vedea roșu înaintea ochilor","vede stele verzi":"vedea stele verzi","vedeai":"vedea","vedeam":"vedea","vedeati":"vedea","vedeau":"vedea","vedele":"vede","vedelor":"vede","vedem":"vedea","vedenia":"vedenie","vedeniei":"vedenie","vedenii":"vedenie","vedeniile":"vedenie","vedeniilor":"vedenie","vederi":"vedere","vedete":"vedetă","vedetei":"vedetă","vedetele":"vedetă","vedetelor":"vedetă","vedeti":"vedea","vedica":["vedică","vedic","vedica","vedic"],"vedice":"vedic","vedicele":"vedic","vedici":"vedic","vedicii":"vedic","vedicul":"vedic","vedismul":"vedism","vedismule":"vedism","vedismului":"vedism","vedre":"vadră","vedrei":"vadră","vedrele":"vadră","vedrelor":"vadră","vedrisoare":"vedrișoară","vedrisoarei":"vedrișoară","vedrisoarele":"vedrișoară","vedrisoarelor":"vedrișoară","vedrite":"vedriță","vedritei":"vedriță","vedritele":"vedriță","vedritelor":"vedriță","vegetai":"vegeta","vegetala":["vegetală","vegetal","vegetala","vegetal"],"vegetale":["vegetale","vegetal","vegetale","vegetală"],"vegetalei":"vegetală","vegetalele":["vegetalele","vegetal","vegetalele","vegetală"],"vegetalelor":"vegetală","vegetali":"vegetal","vegetalii":"vegetal","vegetalul":"vegetal","vegetam":["vegetăm","vegeta","vegetam","vegeta"],"vegetand":"vegeta","vegetara":"vegeta","vegetaram":"vegeta","vegetarati":"vegeta","vegetarea":"vegetare","vegetari":"vegetare","vegetariana":["vegetariană","vegetarian","vegetariana","vegetarian"],"vegetarianismul":"vegetarianism","vegetarianismule":"vegetarianism","vegetarianismului":"vegetarianism","vegetarianul":"vegetarian","vegetariene":["vegetariene","vegetarian","vegetariene","vegetariană"],"vegetarienei":"vegetariană","vegetarienele":["vegetarienele","vegetarian","vegetarienele","vegetariană"],"vegetarienelor":"vegetariană","vegetarieni":"vegetarian","vegetarienii":"vegetarian","vegetarii":"vegetare","vegetarile":"vegetare","vegetarilor":"vegetare","vegetarismul":"vegetarism","vegetarismule":"vegetarism","vegetarismului":"vegetarism","vegetase":"vegeta","vegetasem":"vegeta","vegetasera":"vegeta","vegetaseram":"vegeta","vegetaserati":"vegeta","vegetasesi":"vegeta","vegetasi":"vegeta","vegetat":"vegeta","vegetati":"vegeta","vegetatia":"vegetație","vegetatiei":"vegetație","vegetatii":"vegetație","vegetatiile":"vegetație","vegetatiilor":"vegetație","vegetatiune":"vegetație","vegetatiunea":"vegetațiune","vegetatiuni":"vegetațiune","vegetatiunii":"vegetațiune","vegetatiunile":"vegetațiune","vegetatiunilor":"vegetațiune","vegetativa":["vegetativă","vegetativ","vegetativa","vegetativ"],"vegetative":"vegetativ","vegetativele":"vegetativ","vegetativi":"vegetativ","vegetativii":"vegetativ","vegetativitatea":"vegetativitate","vegetativitati":"vegetativitate","vegetativitatii":"vegetativitate","vegetativul":"vegetativ","vegetau":"vegeta","vegeteaza":"vegeta","vegetez":"vegeta","vegetezi":"vegeta","veghe":"veghea","vegheai":"veghea","vegheam":"veghea","vegheara":"veghea","veghearam":"veghea","veghearati":"veghea","veghease":"veghea","vegheasem":"veghea","vegheasera":"veghea","vegheaseram":"veghea","vegheaserati":"veghea","vegheasesi":"veghea","vegheasi":"veghea","vegheat":"veghea","vegheata":["vegheată","vegheat","vegheata","vegheat"],"vegheate":"vegheat","vegheatele":"vegheat","vegheati":["vegheați","veghea","vegheați","vegheat"],"vegheatii":"vegheat","vegheatul":"vegheat","vegheau":"veghea","vegheaza":"veghea","veghem":"veghea","vegherea":"veghere","vegheri":"veghere","vegherii":"veghere","vegherile":"veghere","vegherilor":"veghere","veghetatie":"vegetație","veghetoare":"veghetor","veghetoarea":"veghetor","veghetoarele":"veghetor","veghetori":"veghetor","veghetorii":"veghetor","veghetorul":"veghetor","veghez":"veghea","veghezi":"veghea","veghi":"veghe","veghind":"veghea","vehementa":["vehementă","vehement","vehementa","vehement"],"vehemente":["vehemente","vehement","vehemențe","vehemență"],"vehementei":"vehemență","vehementele":"vehement","vehementi":"vehement","vehementii":"vehement","vehementul":"vehement","vehiculai":"vehicula","vehiculam":["vehiculăm","vehicula","vehiculam","vehicula"],"vehiculand":"vehicula","vehiculara":["vehiculară","vehicula","vehiculară","vehicular","vehiculara","vehicular"],"vehicularam":"vehicula","vehicularati":"vehicula","vehiculare":"vehicular","vehicularea":"vehiculare","vehicularele":"vehicular","vehiculari":["vehiculari","vehicular","vehiculări","vehiculare"],"vehicularii":["vehicularii","vehicular","vehiculării","vehiculare"],"vehicularile":"vehiculare","vehicularilor":"vehiculare","vehicularul":"vehicular","vehiculase":"vehicula","vehiculasem":"vehicula","vehiculasera":"vehicula","vehiculaseram":"vehicula","vehiculaserati":"vehicula","vehiculasesi":"vehicula","vehiculasi":"vehicula","vehiculat":"vehicula","vehiculata":["vehiculată","vehiculat","vehiculata","vehiculat"],"vehiculate":"vehiculat","vehiculatele":"vehiculat","vehiculati":["vehiculați","vehicula","vehiculați","vehiculat"],"vehiculatii":"vehiculat","vehiculatul":"vehiculat","vehiculau":"vehicula","vehicule":"vehicul","vehicule blindate":"vehicul blindat","vehiculeaza":"vehicula","vehiculele":"vehicul","vehiculelor":"vehicul","vehiculez":"vehicula","vehiculezi":"vehicula","vehiculul":"vehicul","vehiculule":"vehicul","vehiculului":"vehicul","vei":"voi","veioze":"veioză","veiozei":"veioză","veiozele":"veioză","veiozelor":"veioză","velara":["velară","velar","velara","velar"],"velare":["velare","velar","velare","velară"],"velarei":"velară","velarele":["velarele","velar","velarele","velară"],"velarelor":"velară","velari":"velar","velaria":"velărie","velariei":"velărie","velarii":["velarii","velar","velării","velărie"],"velariile":"velărie","velariilor":"velărie","velariumul":"velarium","velariumule":"velarium","velariumului":"velarium","velarizai":"velariza","velarizam":["velarizăm","velariza","velarizam","velariza"],"velarizand":"velariza","velarizara":"velariza","velarizaram":"velariza","velarizarati":"velariza","velarizarea":"velarizare","velarizari":"velarizare","velarizarii":"velarizare","velarizarile":"velarizare","velarizarilor":"velarizare","velarizase":"velariza","velarizasem":"velariza","velarizasera":"velariza","velarizaseram":"velariza","velarizaserati":"velariza","velarizasesi":"velariza","velarizasi":"velariza","velarizat":"velariza","velarizata":["velarizată","velarizat","velarizata","velarizat"],"velarizate":"velarizat","velarizatele":"velarizat","velarizati":["velarizați","velariza","velarizați","velarizat"],"velarizatii":"velarizat","velarizatul":"velarizat","velarizau":"velariza","velarizeaza":"velariza","velarizez":"velariza","velarizezi":"velariza","velarul":"velar","velaturi":"velatură","velaturii":"velatură","velaturile":"velatură","velaturilor":"velatură","vele":"velă","veleitara":["veleitară","veleitar","veleitara","veleitar"],"veleitare":["veleitare","veleitar","veleitare","veleitară"],"veleitarei":"veleitară","veleitarele":["veleitarele","veleitar","veleitarele","veleitară"],"veleitarelor":"veleitară","veleitari":"veleitar","veleitarii":"veleitar","veleitarul":"veleitar","veleitatea":"veleitate","veleitati":"veleitate","veleitatii":"veleitate","veleitatile":"veleitate","veleitatilor":"veleitate","velicia":"velicie","veliciei":"velicie","velicii":"velicie","velicoruse":"velicorusă","velicorusei":"velicorusă","velicorusele":"velicorusă","velicoruselor":"velicorusă","velicorusi":"velicorus","velicorusii":"velicorus","velicorusilor":"velicorus","velicorusul":"velicorus","velicorusule":"velicorus","velicorusului":"velicorus","veliere":"velier","velierele":"velier","velierelor":"velier","velierul":"velier","velierule":"velier","velierului":"velier","velina":["velină","velin","velina","velin"],"veline":"velin","velinele":"velin","velini":"velin","velinii":"velin","velinul":"velin","veliste":"velistă","velistei":"velistă","velistele":"velistă","velistelor":"velistă","velita":["velită","velit","velita","velit"],"velite":"velit","velitele":"velit","veliti":"velit","velitii":"velit","velitul":"velit","veljul":"velj","veljule":"velj","veljului":"velj","velniceri":"velnicer","velnicerii":"velnicer","velnicerilor":"velnicer","velnicerul":"velnicer","velnicerule":"velnicer","velnicerului":"velnicer","velnisi":"velniș","velnisii":"velniș","velnisilor":"velniș","velnisul":"velniș","velnisule":"velniș","velnisului":"velniș","velnite":"velniță","velnitei":"velniță","velnitele":"velniță","velnitelor":"velniță","velocea":"veloce","velocele":"veloce","veloci":"veloce","velocii":"veloce","velocipede":"velociped","velocipedele":"velociped","velocipedelor":"velociped","velocipedia":"velocipedie","velocipedica":["velocipedică","velocipedic","velocipedica","velocipedic"],"velocipedice":"velocipedic","velocipedicele":"velocipedic","velocipedici":"velocipedic","velocipedicii":"velocipedic","velocipedicul":"velocipedic","velocipediei":"velocipedie","velocipedii":"velocipedie","velocipediste":"velocipedistă","velocipedistei":"velocipedistă","velocipedistele":"velocipedistă","velocipedistelor":"velocipedistă","velocipedisti":"velocipedist","velocipedistica":["velocipedistică","velocipedistic","velocipedistica","velocipedistic"],"velocipedistice":"velocipedistic","velocipedisticele":"velocipedistic","velocipedistici":"velocipedistic","velocipedisticii":"velocipedistic","velocipedisticul":"velocipedistic","velocipedistii":"velocipedist","velocipedistilor":"velocipedist","velocipedistul":"velocipedist","velocipedistule":"velocipedist","velocipedistului":"velocipedist","velocipedul":"velociped","velocipedule":"velociped","velocipedului":"velociped","velocitatea":"velocitate","velocitati":"velocitate","velocitatii":"velocitate","velocitatile":"velocitate","velocitatilor":"velocitate","velodromuri":"velodrom","veluri":"velură","velurii":"velură","velurile":"velură","velurilor":"velură","velurul":"velur","velurule":"velur","velurului":"velur","velutine":"velutină","velutinei":"velutină","velutinele":"velutină","velutinelor":"velutină","venala":["venală","venal","venala","venal"],"venale":"venal","venalele":"venal","venali":"venal","venalii":"venal","venalitatea":"venalitate","venalitati":"venalitate","venalitatii":"venalitate","venalitatile":"venalitate","venalitatilor":"venalitate","venalul":"venal","vendemiarul":"vendemiar","vendemiarule":"vendemiar","vendemiarului":"vendemiar","vendete":"vendetă","vendetei":"vendetă","vendetele":"vendetă","vendetelor":"vendetă","vene":"venă","vene cava":"venă cavă","vene jugulare":"venă jugulară","vene porta":"venă portă","venea":"veni","veneai":"veni","veneam":"veni","veneati":"veni","veneau":"veni","venei":"venă","venele":"venă","venelor":"venă","venenifera":["veneniferă","venenifer","venenifera","venenifer"],"venenifere":"venenifer","veneniferele":"venenifer","veneniferi":"venenifer","veneniferii":"venenifer","veneniferul":"venenifer","venerabila":["venerabilă","venerabil","venerabila","venerabil"],"venerabile":"venerabil","venerabilele":"venerabil","venerabili":"venerabil","venerabilii":"venerabil","venerabilitatea":"venerabilitate","venerabilitati":"venerabilitate","venerabilitatii":"venerabilitate","venerabilul":"venerabil","venerai":"venera","veneram":["venerăm","venera","veneram","venera"],"venerand":"venera","venerara":"venera","veneraram":"venera","venerarati":"venera","venerarea":"venerare","venerari":"venerare","venerarii":"venerare","venerarile":"venerare","venerarilor":"venerare","venerase":"venera","venerasem":"venera","venerasera":"venera","veneraseram":"venera","veneraserati":"venera","venerasesi":"venera","venerasi":"venera","venerat":"venera","venerata":["venerată","venerat","venerata","venerat"],"venerate":"venerat","veneratele":"venerat","venerati":["venerați","venera","venerați","venerat"],"veneratia":"venerație","veneratiei":"venerație","veneratii":["venerații","venerat","venerații","venerație"],"veneratiunea":"venerațiune","veneratiuni":"venerațiune","veneratiunii":"venerațiune","veneratiunile":"venerațiune","veneratiunilor":"venerațiune","veneratul":"venerat","venerau":"venera","venereaza":"venera","venerez":"venera","venerezi":"venera","veneriana":["veneriană","venerian","veneriana","venerian"],"venerianul":"venerian","venerica":["venerică","veneric","venerica","veneric"],"venerice":"veneric","venericele":"veneric","venerici":"veneric","venericii":"veneric","venericul":"veneric","veneriene":"venerian","venerienele":"venerian","venerieni":"venerian","venerienii":"venerian","venerologe":"venerologă","venerologei":"venerologă","venerologele":"venerologă","venerologelor":"venerologă","venerologi":"venerolog","venerologia":"venerologie","venerologiei":"venerologie","venerologii":["venerologii","venerolog","venerologii","venerologie"],"venerologilor":"venerolog","venerologul":"venerolog","venerologule":"venerolog","venerologului":"venerolog","venesectia":"venesecție","venesectiei":"venesecție","venesectii":"venesecție","venesectiile":"venesecție","venesectiilor":"venesecție","venesectiunea":"venesecțiune","venesectiuni":"venesecțiune","venesectiunii":"venesecțiune","venesectiunile":"venesecțiune","venesectiunilor":"venesecțiune","veneti":"venet","venetiana":["venețiană","venețian","venețiana","venețian"],"venetianul":"venețian","venetica":["venetică","venetic","venetica","venetic"],"venetice":["venetice","venetic","venetice","venetică"],"veneticei":"venetică","veneticele":["veneticele","venetic","veneticele","venetică"],"veneticelor":"venetică","venetici":"venetic","veneticii":"venetic","veneticilor":"venetic","veneticul":"venetic","veneticule":"venetic","veneticului":"venetic","venetience":"venețiancă","venetiencei":"venețiancă","venetiencele":"venețiancă","venetiencelor":"venețiancă","venetiene":["venețiene","venețian","venețiene","venețiană"],"venetienei":"venețiană","venetienele":["venețienele","venețian","venețienele","venețiană"],"venetienelor":"venețiană","venetieni":"venețian","venetienii":"venețian","venetii":"venet","venetilor":"venet","venetul":"venet","venetule":"venet","venetului":"venet","venezuelan":"venezuelean","venezuelana":["venezuelană","venezuelan","venezuelana","venezuelan"],"venezuelane":["venezuelane","venezuelan","venezuelane","venezuelană"],"venezuelanei":"venezuelană","venezuelanele":["venezuelanele","venezuelan","venezuelanele","venezuelană"],"venezuelanelor":"venezuelană","venezuelani":"venezuelan","venezuelanii":"venezuelan","venezuelanilor":"venezuelan","venezuelanul":"venezuelan","venezuelanule":"venezuelan","venezuelanului":"venezuelan","venezueleana":["venezueleană","venezuelean","venezueleana","venezuelean"],"venezueleanul":"venezuelean","venezuelene":["venezuelene","venezuelean","venezuelene","venezueleană"],"venezuelenei":"venezueleană","venezuelenele":["venezuelenele","venezuelean","venezuelenele","venezueleană"],"venezuelenelor":"venezueleană","venezueleni":"venezuelean","venezuelenii":"venezuelean","venezueliana":["venezueliană","venezuelian","venezueliana","venezuelian"],"venezuelianul":"venezuelian","venezueliene":["venezueliene","venezuelian","venezueliene","venezueliană"],"venezuelienei":"venezueliană","venezuelienele":["venezuelienele","venezuelian","venezuelienele","venezueliană"],"venezuelienelor":"venezueliană","venezuelieni":"venezuelian","venezuelienii":"venezuelian","venezuelita":["venezuelită","venezuelit","venezuelita","venezuelit"],"venezuelite":"venezuelit","venezuelitele":"venezuelit","venezueliti":"venezuelit","venezuelitii":"venezuelit","venezuelitul":"venezuelit","vengherci":"venghercă","venghercii":"venghercă","venghercile":"venghercă","venghercilor":"venghercă","venghercute":"venghercuță","venghercutei":"venghercuță","venii":"veni","venim":"veni","venimozitatati":"venimozitate","venimozitatatii":"venimozitate","venimozitatatile":"venimozitate","venimozitatatilor":"venimozitate","venimozitatea":"venimozitate","veninai":"venina","veninam":["veninăm","venina","veninam","venina"],"veninand":"venina","veninara":"venina","veninaram":"venina","veninarati":"venina","veninarite":"veninariță","veninaritei":"veninariță","veninaritele":"veninariță","veninaritelor":"veninariță","veninase":"venina","veninasem":"venina","veninasera":"venina","veninaseram":"venina","veninaserati":"venina","veninasesi":"venina","veninasi":"venina","veninasul":"veninaș","veninasule":"veninaș","veninasului":"veninaș","veninat":"venina","veninata":["veninată","veninat","veninata","veninat"],"veninate":"veninat","veninatele":"veninat","veninati":["veninați","venina","veninați","veninat"],"veninatii":"veninat","veninatul":"veninat","veninau":"venina","venind":"veni","venineaza":"venina","veninez":"venina","veninezi":"venina","veninoasa":["veninoasă","veninos","veninoasa","veninos"],"veninoase":"veninos","veninoasele":"veninos","veninosi":"veninos","veninosii":"veninos","veninosul":"veninos","veninul":"venin","veninule":"venin","veninului":"venin","veninuri":"venin","veninurile":"venin","veninurilor":"venin","venira":"veni","veniram":"veni","venirati":"veni","veniri":"venire","venise":"veni","venisem":"veni","venisera":"veni","veniseram":"veni","veniserati":"veni","venisesi":"veni","venisi":"veni","venit":"veni","venit de hac":"veni de hac","venit pe nepusa masa":"veni pe nepusă masă","venite":"venită","venitei":"venită","venitele":"venită","venitelor":"venită","veniti":"veni","venitoare":"venitor","venitoarea":"venitor","venitoarele":"venitor","venitori":"venitor","venitorii":"venitor","venitorul":"venitor","venitul":"venit","venitule":"venit","venitului":"venit","venituri":["venituri","venit","venituri","venitură"],"veniturii":"venitură","veniturile":["veniturile","venit","veniturile","venitură"],"veniturilor":["veniturilor","venit","veniturilor","venitură"],"venoasa":["venoasă","venos","venoasa","venos"],"venoase":"venos","venoasele":"venos","venosi":"venos","venosii":"venos","venosul":"venos","venozitatea":"venozitate","venozitati":"venozitate","venozitatii":"venozitate","venozitatile":"venozitate","venozitatilor":"venozitate","vent":["vênt","vânt","vent","venit"],"ventilai":"ventila","ventilam":["ventilăm","ventila","ventilam","ventila"],"ventiland":"ventila","ventilara":"ventila","ventilaram":"ventila","ventilarati":"ventila","ventilarea":"ventilare","ventilari":"ventilare","ventilarii":"ventilare","ventilarile":"ventilare","ventilarilor":"ventilare","ventilase":"ventila","ventilasem":"ventila","ventilasera":"ventila","ventilaseram":"ventila","ventilaserati":"ventila","ventilasesi":"ventila","ventilasi":"ventila","ventilat":"ventila","ventilata":["ventilată","ventilat","ventilata","ventilat"],"ventilate":"ventilat","ventilatele":"ventilat","ventilati":["ventilați","ventila","ventilați","ventilat"],"ventilatia":"ventilație","ventilatiei":"ventilație","ventilatii":["ventilații","ventilat","ventilații","ventilație"],"ventilatiile":"ventilație","ventilatiilor":"ventilație","ventilatiunea":"ventilațiune","ventilatiuni":"ventilațiune","ventilatiunii":"ventilațiune","ventilatiunile":"ventilațiune","ventilatiunilor":"ventilațiune","ventilatoare":"ventilator","ventilatoarele":"ventilator","ventilatoarelor":"ventilator","ventilatorul":"ventilator","ventilatorule":"ventilator","ventilatorului":"ventilator","ventilatul":"ventilat","ventilau":"ventila","ventile":"ventil","ventileaza":"ventila","ventilele":"ventil","ventilelor":"ventil","ventilez":"ventila","ventilezi":"ventila","ventilul":"ventil","ventilule":"ventil","ventilului":"ventil","ventrala":["ventrală","ventral","ventrala","ventral"],"ventrale":"ventral","ventralele":"ventral","ventrali":"ventral","ventralii":"ventral","ventralul":"ventral","ventre":"ventru","ventrele":"ventru","ventrelor":"ventru","ventriculara":["ventriculară","ventricular","ventriculara","ventricular"],"ventriculare":"ventricular","ventricularele":"ventricular","ventriculari":"ventricular","ventricularii":"ventricular","ventricularul":"ventricular","ventricule":"ventricul","ventriculele":"ventricul","ventriculelor":"ventricul","ventriculite":"ventriculită","ventriculitei":"ventriculită","ventriculografia":"ventriculografie","ventriculografiei":"ventriculografie","ventriculografii":"ventriculografie","ventriculografiile":"ventriculografie","ventriculografiilor":"ventriculografie","ventriculograme":"ventriculogramă","ventriculogramei":"ventriculogramă","ventriculogramele":"ventriculogramă","ventriculogramelor":"ventriculogramă","ventriculostomia":"ventriculostomie","ventriculostomiei":"ventriculostomie","ventriculostomii":"ventriculostomie","ventriculostomiile":"ventriculostomie","ventriculostomiilor":"ventriculostomie","ventriculotomia":"ventriculotomie","ventriculotomiei":"ventriculotomie","ventriculotomii":"ventriculotomie","ventriculotomiile":"ventriculotomie","ventriculotomiilor":"ventriculotomie","ventriculul":"ventricul","ventriculule":"ventricul","ventriculului":"ventricul","ventriloce":"ventrilocă","ventrilocei":"ventrilocă","ventrilocele":"ventrilocă","ventrilocelor":"ventrilocă","ventriloci":"ventriloc","ventrilocia":"ventrilocie","ventrilociei":"ventrilocie","ventrilocii":["ventrilocii","ventriloc","ventrilocii","ventrilocie"],"ventrilocilor":"ventriloc","ventrilocul":"ventriloc","ventrilocule":"ventriloc","ventrilocului":"ventriloc","ventriloge":"ventrilogă","ventrilogei":"ventrilogă","ventrilogele":"ventrilogă","ventrilogelor":"ventrilogă","ventrilogi":"ventrilog","ventrilogii":"ventrilog","ventrilogilor":"ventrilog","ventrilogul":"ventrilog","ventrilogule":"ventrilog","ventrilogului":"ventrilog","ventripotenta":["ventripotentă","ventripotent","ventripotenta","ventripotent"],"ventripotente":"ventripotent","ventripotentele":"ventripotent","ventripotenti":"ventripotent","ventripotentii":"ventripotent","ventripotentul":"ventripotent","ventrul":"ventru","ventrule":"ventru","ventrului":"ventru","venturimetre":"venturimetru","venturimetrele":"venturimetru","venturimetrelor":"venturimetru","venturimetruul":"venturimetru","venturimetruule":"venturimetru","venturimetruului":"venturimetru","ventuze":"ventuză","ventuzei":"ventuză","ventuzele":"ventuză","ventuzelor":"ventuză","venusiene":"venusiană","venusienei":"venusiană","venusienele":"venusiană","venusienelor":"venusiană","venusta":["venustă","venust","venusta","venust"],"venuste":"venust","venustele":"venust","venusti":"venust","venustii":"venust","venustul":"venust","veracitatea":"veracitate","veracitati":"veracitate","veracitatii":"veracitate","veracitatile":"veracitate","veracitatilor":"veracitate","verande":"verandă","verandei":"verandă","verandele":"verandă","verandelor":"verandă","veratrine":"veratrină","veratrinei":"veratrină","verb":["verb","voi","verb","vrea"],"verbala":["verbală","verbal","verbala","verbal"],"verbale":"verbal","verbalele":"verbal","verbali":"verbal","verbalii":"verbal","verbalismul":"verbalism","verbalismule":"verbalism","verbalismului":"verbalism","verbalitatea":"verbalitate","verbalitati":"verbalitate","verbalitatii":"verbalitate"};
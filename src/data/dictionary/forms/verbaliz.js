@@ -0,0 +1 @@
+export default {"verbalizai":"verbaliza","verbalizam":["verbalizăm","verbaliza","verbalizam","verbaliza"],"verbalizand":"verbaliza","verbalizara":"verbaliza","verbalizaram":"verbaliza","verbalizarati":"verbaliza","verbalizarea":"verbalizare","verbalizari":"verbalizare","verbalizarii":"verbalizare","verbalizarile":"verbalizare","verbalizarilor":"verbalizare","verbalizase":"verbaliza","verbalizasem":"verbaliza","verbalizasera":"verbaliza","verbalizaseram":"verbaliza","verbalizaserati":"verbaliza","verbalizasesi":"verbaliza","verbalizasi":"verbaliza","verbalizat":"verbaliza","verbalizata":["verbalizată","verbalizat","verbalizata","verbalizat"],"verbalizate":"verbalizat","verbalizatele":"verbalizat","verbalizati":["verbalizați","verbaliza","verbalizați","verbalizat"],"verbalizatii":"verbalizat","verbalizatul":"verbalizat","verbalizau":"verbaliza","verbalizeaza":"verbaliza","verbalizez":"verbaliza","verbalizezi":"verbaliza","verbalul":"verbal","verbe":"verb","verbe abstracte":"verb abstract","verbe auxiliare":"verb auxiliar","verbe intranzitive":"verb intranzitiv","verbe neregulate":"verb neregulat","verbe reflexive":"verb reflexiv","verbe tranzitive":"verb tranzitiv","verbele":"verb","verbelor":"verb","verberatia":"verberație","verberatiei":"verberație","verberatii":"verberație","verberatiile":"verberație","verberatiilor":"verberație","verbiaje":"verbiaj","verbiajele":"verbiaj","verbiajelor":"verbiaj","verbiajul":"verbiaj","verbiajule":"verbiaj","verbiajului":"verbiaj","verbine":"verbină","verbinei":"verbină","verbinele":"verbină","verbinelor":"verbină","verbozitatea":"verbozitate","verbozitati":"verbozitate","verbozitatii":"verbozitate","verbozitatile":"verbozitate","verbozitatilor":"verbozitate","verbul":"verb","verbule":"verb","verbului":"verb","verdarea":"verdare","verdari":"verdare","verdarii":"verdare","verdarile":"verdare","verdarilor":"verdare","verdea":"verde","verdele":"verde","verdelui":"verde","verdeti":"verdeață","verdetii":"verdeață","verdeturi":"verdeață","verdeturile":"verdeață","verdeturilor":"verdeață","verdiana":["verdiană","verdian","verdiana","verdian"],"verdianul":"verdian","verdicela":["verdicelă","verdicel","verdicela","verdicel"],"verdicele":"verdicel","verdicelele":"verdicel","verdiceli":"verdicel","verdicelii":"verdicel","verdicelul":"verdicel","verdicicele":"verdicică","verdicicelei":"verdicică","verdicicelele":"verdicică","verdicicelelor":"verdicică","verdicte":"verdict","verdictele":"verdict","verdictelor":"verdict","verdictul":"verdict","verdictule":"verdict","verdictului":"verdict","verdiene":"verdian","verdienele":"verdian","verdieni":"verdian","verdienii":"verdian","verduri":"verdură","vere":"vară","verei":"vară","verele":"vară","verelor":"vară","veresia":"veresie","veresiei":"veresie","veresii":"veresie","vergeaua":"vergea","vergele":"vergea","vergelei":"vergea","vergelele":"vergea","vergelelor":"vergea","vergeluse":"vergelușă","vergelusei":"vergelușă","vergelusele":"vergelușă","vergeluselor":"vergelușă","vergelute":"vergeluță","vergelutei":"vergeluță","vergelutele":"vergeluță","vergelutelor":"vergeluță","vergente":"vergență","vergentei":"vergență","vergentele":"vergență","vergentelor":"vergență","vergeturi":"vergetură","vergeturii":"vergetură","vergeturile":"vergetură","vergeturilor":"vergetură","vergi":"vargă","vergii":"vargă","vergile":"vargă","vergilor":"vargă","vergin":"virgin","vergina":["vergină","vergin","vergina","vergin"],"verginala":["verginală","verginal","verginala","verginal"],"verginale":"verginal","verginalele":"verginal","verginali":"verginal","verginalii":"verginal","verginalul":"verginal","vergine":"vergin","verginele":"vergin","vergini":"vergin","verginii":"vergin","verginul":"vergin","vergura":["vergură","vergur","vergura","vergur"],"vergure":["vergure","vergur","vergure","vergură"],"vergurei":"vergură","vergurele":["vergurele","vergur","vergurele","vergură"],"vergurelor":"vergură","verguri":"vergur","vergurii":"vergur","verguritatea":"verguritate","verguritati":"verguritate","verguritatii":"verguritate","vergurite":"verguriță","verguritei":"verguriță","vergurul":"vergur","veri":["veri","văr","veri","vară"],"veri primari":"văr primar","vericeaua":"vericea","vericele":["vericele","vericea","vericele","vericică"],"vericelei":["vericelei","vericea","vericelei","vericică"],"vericelele":["vericelele","vericea","vericelele","vericică"],"vericelelor":["vericelelor","vericea","vericelelor","vericică"],"verici":"veric","vericii":"veric","vericilor":"veric","vericul":"veric","vericule":"veric","vericului":"veric","veridica":["veridică","veridic","veridica","veridic"],"veridice":"veridic","veridicele":"veridic","veridici":"veridic","veridicii":"veridic","veridicitatea":"veridicitate","veridicitati":"veridicitate","veridicitatii":"veridicitate","veridicitatile":"veridicitate","veridicitatilor":"veridicitate","veridicul":"veridic","verific":"verifica","verificabila":["verificabilă","verificabil","verificabila","verificabil"],"verificabile":"verificabil","verificabilele":"verificabil","verificabili":"verificabil","verificabilii":"verificabil","verificabilitatea":"verificabilitate","verificabilitati":"verificabilitate","verificabilitatii":"verificabilitate","verificabilul":"verificabil","verificaciunea":"verificăciune","verificaciuni":"verificăciune","verificaciunii":"verificăciune","verificaciunile":"verificăciune","verificaciunilor":"verificăciune","verificai":"verifica","verificam":["verificăm","verifica","verificam","verifica"],"verificand":"verifica","verificara":"verifica","verificaram":"verifica","verificarati":"verifica","verificarea":"verificare","verificari":"verificare","verificarii":"verificare","verificarile":"verificare","verificarilor":"verificare","verificase":"verifica","verificasem":"verifica","verificasera":"verifica","verificaseram":"verifica","verificaserati":"verifica","verificasesi":"verifica","verificasi":"verifica","verificat":"verifica","verificata":["verificată","verificat","verificata","verificat"],"verificate":"verificat","verificatele":"verificat","verificati":["verificați","verifica","verificați","verificat"],"verificatia":"verificație","verificatiei":"verificație","verificatii":["verificații","verificat","verificații","verificație"],"verificatiile":"verificație","verificatiilor":"verificație","verificatiunea":"verificațiune","verificatiuni":"verificațiune","verificatiunii":"verificațiune","verificatiunile":"verificațiune","verificatiunilor":"verificațiune","verificatoare ortografice":"verificator ortografic","verificatoarea":"verificatoare","verificatoarei":"verificatoare","verificatoarele":"verificatoare","verificatoarelor":"verificatoare","verificatori":"verificator","verificatorii":"verificator","verificatorilor":"verificator","verificatorul":"verificator","verificatorule":"verificator","verificatorului":"verificator","verificatul":"verificat","verificau":"verifica","verifice":"verifica","verifici":"verifica","verigari":"verigar","verigarii":["verigarii","verigar","verigarii","verigariu"],"verigariii":"verigariu","verigariilor":"verigariu","verigarilor":"verigar","verigariuul":"verigariu","verigariuule":"verigariu","verigariuului":"verigariu","verigarul":"verigar","verigarule":"verigar","verigarului":"verigar","verigasi":"verigaș","verigasii":"verigaș","verigasilor":"verigaș","verigasul":"verigaș","verigasule":"verigaș","verigasului":"verigaș","verighete":"verighetă","verighetei":"verighetă","verighetele":"verighetă","verighetelor":"verighetă","verigi":"verigă","verigice":"verigică","verigicei":"verigică","verigigarul":"verigigar","verigigarule":"verigigar","verigigarului":"verigigar","verigii":"verigă","verigile":"verigă","verigilor":"verigă","verigute":"veriguță","verigutei":"veriguță","verigutele":"veriguță","verigutelor":"veriguță","verii":["verii","văr","verii","vară"],"verile":"vară","verilor":["verilor","văr","verilor","vară"],"veringhelul":"veringhel","veringhelule":"veringhel","veringhelului":"veringhel","verisane":"verișană","verisanei":"verișană","verisanele":"verișană","verisanelor":"verișană","veriscane":"verișcană","veriscanei":"verișcană","veriscanele":"verișcană","veriscanelor":"verișcană","veriscani":"verișcan","veriscanii":"verișcan","veriscanilor":"verișcan","veriscanul":"verișcan","veriscanule":"verișcan","veriscanului":"verișcan","verismul":"verism","verismule":"verism","verismului":"verism","verisoare":"verișoară","verisoarei":"verișoară","verisoarele":"verișoară","verisoarelor":"verișoară","verisori":"verișor","verisorice":"verișorică","verisoricei":"verișorică","verisoricele":"verișorică","verisoricelor":"verișorică","verisorici":"verișorică","verisorii":"verișor","verisorilor":"verișor","verisorul":"verișor","verisorule":"verișor","verisorului":"verișor","veriste":"veristă","veristei":"veristă","veristele":"veristă","veristelor":"veristă","veristi":"verist","veristii":"verist","veristilor":"verist","veristul":"verist","veristule":"verist","veristului":"verist","veritabila":["veritabilă","veritabil","veritabila","veritabil"],"veritabile":"veritabil","veritabilele":"veritabil","veritabili":"veritabil","veritabilii":"veritabil","veritabilul":"veritabil","veritatea":"veritate","veritati":"veritate","veritatii":"veritate","veritatile":"veritate","veritatilor":"veritate","vermasine":"vermașină","vermasinei":"vermașină","vermicide":"vermicid","vermicidele":"vermicid","vermicidelor":"vermicid","vermicidul":"vermicid","vermicidule":"vermicid","vermicidului":"vermicid","vermiculara":["vermiculară","vermicular","vermiculara","vermicular"],"vermiculare":"vermicular","vermicularele":"vermicular","vermiculari":"vermicular","vermicularii":"vermicular","vermicularul":"vermicular","vermiculata":["vermiculată","vermiculat","vermiculata","vermiculat"],"vermiculate":"vermiculat","vermiculatele":"vermiculat","vermiculati":"vermiculat","vermiculatia":"vermiculație","vermiculatiei":"vermiculație","vermiculatii":["vermiculații","vermiculat","vermiculații","vermiculație"],"vermiculatiile":"vermiculație","vermiculatiilor":"vermiculație","vermiculatul":"vermiculat","vermiculitul":"vermiculit","vermiculitule":"vermiculit","vermiculitului":"vermiculit","vermiforma":["vermiformă","vermiform","vermiforma","vermiform"],"vermiforme":"vermiform","vermiformele":"vermiform","vermiformi":"vermiform","vermiformii":"vermiform","vermiformul":"vermiform","vermifuge":"vermifug","vermifugele":"vermifug","vermifugelor":"vermifug","vermifugul":"vermifug","vermifugule":"vermifug","vermifugului":"vermifug","vermillonul":"vermillon","vermillonule":"vermillon","vermillonului":"vermillon","verminatia":"verminație","verminatiei":"verminație","verminatii":"verminație","verminatiile":"verminație","verminatiilor":"verminație","vermine":"vermină","verminei":"vermină","verminele":"vermină","verminelor":"vermină","verminoze":"verminoză","verminozei":"verminoză","verminozele":"verminoză","verminozelor":"verminoză","vermisul":"vermis","vermisule":"vermis","vermisului":"vermis","vermutizai":"vermutiza","vermutizam":["vermutizăm","vermutiza","vermutizam","vermutiza"],"vermutizand":"vermutiza","vermutizara":"vermutiza","vermutizaram":"vermutiza","vermutizarati":"vermutiza","vermutizase":"vermutiza","vermutizasem":"vermutiza","vermutizasera":"vermutiza","vermutizaseram":"vermutiza","vermutizaserati":"vermutiza","vermutizasesi":"vermutiza","vermutizasi":"vermutiza","vermutizat":"vermutiza","vermutizati":"vermutiza","vermutizau":"vermutiza","vermutizeaza":"vermutiza","vermutizez":"vermutiza","vermutizezi":"vermutiza","vermutul":"vermut","vermutule":"vermut","vermutului":"vermut","vermuturi":"vermut","vermuturile":"vermut","vermuturilor":"vermut","vernaculara":["vernaculară","vernacular","vernaculara","vernacular"],"vernaculare":"vernacular","vernacularele":"vernacular","vernaculari":"vernacular","vernacularii":"vernacular","vernacularul":"vernacular","vernala":["vernală","vernal","vernala","vernal"],"vernale":"vernal","vernalele":"vernal","vernali":"vernal","vernalii":"vernal","vernalizai":"vernaliza","vernalizam":["vernalizăm","vernaliza","vernalizam","vernaliza"],"vernalizand":"vernaliza","vernalizara":"vernaliza","vernalizaram":"vernaliza","vernalizarati":"vernaliza","vernalizarea":"vernalizare","vernalizari":"vernalizare","vernalizarii":"vernalizare","vernalizarile":"vernalizare","vernalizarilor":"vernalizare","vernalizase":"vernaliza","vernalizasem":"vernaliza","vernalizasera":"vernaliza","vernalizaseram":"vernaliza","vernalizaserati":"vernaliza","vernalizasesi":"vernaliza","vernalizasi":"vernaliza","vernalizat":"vernaliza","vernalizati":"vernaliza","vernalizau":"vernaliza","vernalizeaza":"vernaliza","vernalizez":"vernaliza","vernalizezi":"vernaliza","vernalul":"vernal","vernice":"vernis","verniere":"vernier","vernierele":"vernier","vernierelor":"vernier","vernierul":"vernier","vernierule":"vernier","vernierului":"vernier","vernilul":"vernil","vernilule":"vernil","vernilului":"vernil","vernisagii":"vernisagiu","vernisagiile":"vernisagiu","vernisagiilor":"vernisagiu","vernisagiuul":"vernisagiu","vernisagiuule":"vernisagiu","vernisagiuului":"vernisagiu","vernisai":"vernisa","vernisaje":"vernisaj","vernisajele":"vernisaj","vernisajelor":"vernisaj","vernisajul":"vernisaj","vernisajule":"vernisaj","vernisajului":"vernisaj","vernisam":["vernisăm","vernisa","vernisam","vernisa"],"vernisand":"vernisa","vernisara":"vernisa","vernisaram":"vernisa","vernisarati":"vernisa","vernisarea":"vernisare","vernisari":"vernisare","vernisarii":"vernisare","vernisarile":"vernisare","vernisarilor":"vernisare","vernisase":"vernisa","vernisasem":"vernisa","vernisasera":"vernisa","vernisaseram":"vernisa","vernisaserati":"vernisa","vernisasesi":"vernisa","vernisasi":"vernisa","vernisat":"vernisa","vernisati":"vernisa","vernisau":"vernisa","verniseaza":"vernisa","vernisez":"vernisa","vernisezi":"vernisa","vernisul":"vernis","vernisule":"vernis","vernisului":"vernis","veroasa":["veroasă","veros","veroasa","veros"],"veroase":"veros","veroasele":"veros","verole":"verolă","verolei":"verolă","verolele":"verolă","verolelor":"verolă","veronalul":"veronal","veronalule":"veronal","veronalului":"veronal","veronici":"veronică","veronicii":"veronică","veronicile":"veronică","veronicilor":"veronică","verosi":"veros","verosii":"veros","verosimila":["verosimilă","verosimil","verosimila","verosimil"],"verosimile":"verosimil","verosimilele":"verosimil","verosimili":"verosimil","verosimilii":"verosimil","verosimilitatea":"verosimilitate","verosimilitati":"verosimilitate","verosimilitatii":"verosimilitate","verosimilitudinea":"verosimilitudine","verosimilitudini":"verosimilitudine","verosimilitudinii":"verosimilitudine","verosimilitudinile":"verosimilitudine","verosimilitudinilor":"verosimilitudine","verosimilul":"verosimil","verosul":"veros","versante":"versant","versantele":"versant","versantelor":"versant","versantul":"versant","versantule":"versant","versantului":"versant","versata":["versată","versat","versata","versat"],"versate":"versat","versatele":"versat","versati":"versat","versatii":"versat","versatila":["versatilă","versatil","versatila","versatil"],"versatile":"versatil","versatilele":"versatil","versatili":"versatil","versatilii":"versatil","versatilitatea":"versatilitate","versatilitati":"versatilitate","versatilitatii":"versatilitate","versatilitatile":"versatilitate","versatilitatilor":"versatilitate","versatilul":"versatil","versatul":"versat","verse":"vărsa","versete":"verset","versetele":"verset","versetelor":"verset","versetul":"verset","versetule":"verset","versetului":"verset","versi":"vărsa","versific":"versifica","versificabila":["versificabilă","versificabil","versificabila","versificabil"],"versificabile":"versificabil","versificabilele":"versificabil","versificabili":"versificabil","versificabilii":"versificabil","versificabilul":"versificabil","versificai":"versifica","versificam":["versificăm","versifica","versificam","versifica"],"versificand":"versifica","versificara":"versifica","versificaram":"versifica","versificarati":"versifica","versificarea":"versificare","versificari":"versificare","versificarii":"versificare","versificarile":"versificare","versificarilor":"versificare","versificase":"versifica","versificasem":"versifica","versificasera":"versifica","versificaseram":"versifica","versificaserati":"versifica","versificasesi":"versifica","versificasi":"versifica","versificat":"versifica","versificata":["versificată","versificat","versificata","versificat"],"versificate":"versificat","versificatele":"versificat","versificati":["versificați","versifica","versificați","versificat"],"versificatia":"versificație","versificatiei":"versificație","versificatii":["versificații","versificat","versificații","versificație"],"versificatiile":"versificație","versificatiilor":"versificație","versificatiunea":"versificațiune","versificatiuni":"versificațiune","versificatiunii":"versificațiune","versificatiunile":"versificațiune","versificatiunilor":"versificațiune","versificatoarea":"versificatoare","versificatoarei":"versificatoare","versificatoarele":"versificatoare","versificatoarelor":"versificatoare","versificatori":"versificator","versificatorii":"versificator","versificatorilor":"versificator","versificatorul":"versificator","versificatorule":"versificator","versificatorului":"versificator","versificatul":"versificat","versificau":"versifica","versifice":"versifica","versifici":"versifica","versiunea":"versiune","versiuni":"versiune","versiunii":"versiune","versiunile":"versiune","versiunilor":"versiune","verslibrisme":"verslibrism","verslibrismele":"verslibrism","verslibrismelor":"verslibrism","verslibrismul":"verslibrism","verslibrismule":"verslibrism","verslibrismului":"verslibrism","verslibrista":["verslibristă","verslibrist","verslibrista","verslibrist"],"verslibriste":["verslibriste","verslibrist","verslibriste","verslibristă"],"verslibristei":"verslibristă","verslibristele":["verslibristele","verslibrist","verslibristele","verslibristă"],"verslibristelor":"verslibristă","verslibristi":"verslibrist","verslibristii":"verslibrist","verslibristilor":"verslibrist","verslibristul":"verslibrist","verslibristule":"verslibrist","verslibristului":"verslibrist","versoul":"verso","versoule":"verso","versoului":"verso","verstatul":"verștat","verstatule":"verștat","verstatului":"verștat","verste":"verstă","verstei":"verstă","verstele":"verstă","verstelor":"verstă","versuia":"versui","versuiai":"versui","versuiam":"versui","versuiati":"versui","versuiau":"versui","versuiesc":"versui","versuieste":"versui","versuiesti":"versui","versuii":"versui","versuim":"versui","versuind":"versui","versuira":"versui","versuiram":"versui","versuirati":"versui","versuirea":"versuire","versuiri":"versuire","versuirii":"versuire","versuirile":"versuire","versuirilor":"versuire","versuise":"versui","versuisem":"versui","versuisera":"versui","versuiseram":"versui","versuiserati":"versui","versuisesi":"versui","versuisi":"versui","versuit":"versui","versuita":["versuită","versuit","versuita","versuit"],"versuite":"versuit","versuitele":"versuit","versuiti":["versuiți","versui","versuiți","versuit"],"versuitii":"versuit","versuitori":"versuitor","versuitorii":"versuitor","versuitorilor":"versuitor","versuitorul":"versuitor","versuitorule":"versuitor","versuitorului":"versuitor","versuitul":"versuit","versul":"vers","versule":"vers","versuletul":["versulețul","versuleț","verșulețul","verșuleț"],"versuletule":["versulețule","versuleț","verșulețule","verșuleț"],"versuletului":["versulețului","versuleț","verșulețului","verșuleț"],"versului":"vers","versunia":"verșunie","versuniei":"verșunie","versunii":"verșunie","versurele":"versurel","versurelele":"versurel","versurelelor":"versurel","versurelul":"versurel","versurelule":"versurel","versurelului":"versurel","versuri":"vers","versuri albe":"vers alb","versurile":"vers","versurilor":"vers","vertebrala":["vertebrală","vertebral","vertebrala","vertebral"],"vertebrale":"vertebral","vertebralele":"vertebral","vertebrali":"vertebral","vertebralii":"vertebral","vertebralul":"vertebral","vertebrati":"vertebrat","vertebratia":"vertebrație","vertebratiei":"vertebrație","vertebratii":"vertebrație","vertebratile":"vertebrat","vertebratilor":"vertebrat","vertebratul":"vertebrat","vertebratule":"vertebrat","vertebratului":"vertebrat","vertebre":"vertebră","vertebre cervicale":"vertebră cervicală","vertebre lombare":"vertebră lombară","vertebrei":"vertebră","vertebrele":"vertebră","vertebrelor":"vertebră","vertebroterapia":"vertebroterapie","vertebroterapiei":"vertebroterapie","vertebroterapii":"vertebroterapie","vertexul":"vertex","vertexule":"vertex","vertexului":"vertex","verticala":["verticală","vertical","verticala","vertical"],"verticale":["verticale","vertical","verticale","verticală"],"verticalei":"verticală","verticalele":["verticalele","vertical","verticalele","verticală"],"verticalelor":"verticală","verticali":"vertical","verticalii":"vertical","verticalitatea":"verticalitate","verticalitati":"verticalitate","verticalitatii":"verticalitate","verticalul":"vertical","verticilata":["verticilată","verticilat","verticilata","verticilat"],"verticilate":"verticilat","verticilatele":"verticilat","verticilati":"verticilat","verticilatii":"verticilat","verticilatul":"verticilat","verticile":"verticil","verticilele":"verticil","verticilelor":"verticil","verticilul":"verticil","verticilule":"verticil","verticilului":"verticil","vertiginoasa":["vertiginoasă","vertiginos","vertiginoasa","vertiginos"],"vertiginoase":"vertiginos","vertiginoasele":"vertiginos","vertiginosi":"vertiginos","vertiginosii":"vertiginos","vertiginosul":"vertiginos","vertijul":"vertij","vertijule":"vertij","vertijului":"vertij","vertul":"vert","vertule":"vert","vertului":"vert","veruce":"verucă","verucei":"verucă","verucele":"verucă","verucelor":"verucă","verucoasa":["verucoasă","verucos","verucoasa","verucos"],"verucoase":"verucos","verucoasele":"verucos","verucosi":"verucos","verucosii":"verucos","verucosul":"verucos","verucozitatea":"verucozitate","verucozitati":"verucozitate","verucozitatii":"verucozitate","verucozitatile":"verucozitate","verucozitatilor":"verucozitate","verve":"vervă","vervei":"vervă","vervene":"vervenă","vervenei":"vervenă","vervenele":"vervenă","vervenelor":"vervenă","verzala":["verzală","verzal","verzala","verzal"],"verzale":["verzale","verzal","verzale","verzală"],"verzalei":"verzală","verzalele":["verzalele","verzal","verzalele","verzală"],"verzalelor":"verzală","verzali":"verzal","verzalii":"verzal","verzalul":"verzal","verzania":"verzanie","verzaniei":"verzanie","verzanii":"verzanie","verzaniile":"verzanie","verzaniilor":"verzanie","verzaturi":"verzătură","verzaturii":"verzătură","verzaturile":"verzătură","verzaturilor":"verzătură","verze":"varză","verze acre":"varză acră","verze chinezesti":"varză chinezească","verze de bruxelles":"varză de Bruxelles","verze rosii":"varză roșie","verzei":"varză","verzela":["verzelă","verzel","verzela","verzel"],"verzele":["verzele","varză","verzele","verzel"],"verzelele":"verzel","verzeli":"verzel","verzelii":"verzel","verzelor":"varză","verzelul":"verzel","verzi":"verde","verzia":"verziu","verziciunea":"verziciune","verziciuni":"verziciune","verziciunii":"verziciune","verziciunile":"verziciune","verziciunilor":"verziciune","verzie":"verziu","verzii":["verzii","verde","verzii","verziu"],"verziii":"verziu","verziile":"verziu","verzile":"verde","verzimea":"verzime","verzimi":"verzime","verzimii":"verzime","verzisoare":"verzișoară","verzisoarei":"verzișoară","verzisoarele":"verzișoară","verzisoarelor":"verzișoară","verzisori":"verzișor","verzisorii":"verzișor","verzisorilor":"verzișor","verzisorul":"verzișor","verzisorule":"verzișor","verzisorului":"verzișor","verzisul":"verziș","verzisule":"verziș","verzisului":"verziș","verzituri":"verzitură","verziturii":"verzitură","verziturile":"verzitură","verziturilor":"verzitură","verziul":"verziu","verzuia":"verzui","verzuie":"verzui","verzuii":"verzui","verzuile":"verzui","verzuiul":"verzui","verzunce":"verzuncă","verzuncei":"verzuncă","vesania":"vesanie","vesaniei":"vesanie","vesanii":"vesanie","vesela":["veselă","vesel","vesela","vesel"],"veselaria":"veselărie","veselariei":"veselărie","veselarii":"veselărie","vesele":["vesele","vesel","vesele","veselă"],"veselea":"veseli","veseleai":"veseli","veseleam":"veseli","veseleati":"veseli","veseleau":"veseli","veselei":"veselă","veselele":"vesel","veselesc":"veseli","veseleste":"veseli","veselesti":"veseli","veseli":"vesel","veselia":"veselie","veseliei":"veselie","veselii":["veselii","vesel","veselii","veseli","veselii","veselie"],"veseliile":"veselie","veseliilor":"veselie","veselim":"veseli","veselind":"veseli","veseliora":["veselioră","veselior","veseliora","veselior"],"veseliore":"veselior","veseliorele":"veselior","veseliori":"veselior","veseliorii":"veselior","veseliorul":"veselior","veselira":"veseli","veseliram":"veseli","veselirati":"veseli","veselirea":"veselire","veseliri":"veselire","veselirii":"veselire","veselirile":"veselire","veselirilor":"veselire","veselise":"veseli","veselisem":"veseli","veselisera":"veseli","veseliseram":"veseli","veseliserati":"veseli","veselisesi":"veseli","veselisi":"veseli","veselit":"veseli","veselita":["veselită","veselit","veselita","veselit"],"veselite":"veselit","veselitele":"veselit","veseliti":["veseliți","veseli","veseliți","veselit"],"veselitii":"veselit","veselitoare":"veselitor","veselitoarea":"veselitor","veselitoarele":"veselitor","veselitori":"veselitor","veselitorii":"veselitor","veselitorul":"veselitor","veselitul":"veselit","veselnica":["veselnică","veselnic","veselnica","veselnic"],"veselnice":"veselnic","veselnicele":"veselnic","veselnici":"veselnic","veselnicii":"veselnic","veselnicul":"veselnic","veselul":"vesel","vesmantaria":"veșmântărie","vesmantariei":"veșmântărie","vesmantarii":"veșmântărie","vesmantarul":"veșmântar","vesmantarule":"veșmântar","vesmantarului":"veșmântar","vesmantul":["vesmântul","vesmânt","veșmântul","veșmânt"],"vesmantule":["vesmântule","vesmânt","veșmântule","veșmânt"],"vesmantului":["vesmântului","vesmânt","veșmântului","veșmânt"],"vesminte":["vesminte","vesmânt","veșminte","veșmânt"],"vesmintele":["vesmintele","vesmânt","veșmintele","veșmânt"],"vesmintelor":["vesmintelor","vesmânt","veșmintelor","veșmânt"],"vesmintelul":"veșmințel","vesmintelule":"veșmințel","vesmintelului":"veșmințel","vesnica":["veșnică","veșnic","veșnica","veșnic"],"vesnice":"veșnic","vesnicea":"veșnici","vesniceai":"veșnici","vesniceam":"veșnici","vesniceati":"veșnici","vesniceau":"veșnici","vesnicele":"veșnic","vesnicesc":"veșnici","vesniceste":"veșnici","vesnicesti":"veșnici","vesnici":"veșnic","vesnicia":"veșnicie","vesniciei":"veșnicie","vesnicii":["veșnicii","veșnic","veșnicii","veșnici","veșnicii","veșnicie"],"vesniciile":"veșnicie","vesniciilor":"veșnicie","vesnicim":"veșnici","vesnicind":"veșnici","vesnicira":"veșnici","vesniciram":"veșnici","vesnicirati":"veșnici","vesnicise":"veșnici","vesnicisem":"veșnici","vesnicisera":"veșnici","vesniciseram":"veșnici","vesniciserati":"veșnici","vesnicisesi":"veșnici","vesnicisi":"veșnici","vesnicit":"veșnici","vesniciti":"veșnici","vesnicul":"veșnic","vespasiane":"vespasiană","vespasianei":"vespasiană","vespasianele":"vespasiană","vespasianelor":"vespasiană","vesperala":["vesperală","vesperal","vesperala","vesperal"],"vesperale":"vesperal","vesperalele":"vesperal","vesperali":"vesperal","vesperalii":"vesperal","vesperalul":"vesperal","vespere":"vesperă","vesperei":"vesperă","vesperele":"vesperă","vesperelor":"vesperă","vespertiliuul":"vespertiliu","vespertiliuule":"vespertiliu","vespertiliuului":"vespertiliu","vest-europeana":["vest-europeană","vest-european","vest-europeana","vest-european"],"vest-europeane":"vest-europeană","vest-europeanei":"vest-europeană","vest-europeanele":"vest-europeană","vest-europeanelor":"vest-europeană","vest-europeanul":"vest-european","vest-europene":"vest-european","vest-europenele":"vest-european","vest-europeni":"vest-european","vest-europenii":"vest-european","vest-germana":["vest-germană","vest-german","vest-germana","vest-german"],"vest-germane":"vest-german","vest-germanele":"vest-german","vest-germani":"vest-german","vest-germanii":"vest-german","vest-germanilor":"vest-german","vest-germanul":"vest-german","vest-germanule":"vest-german","vest-germanului":"vest-german","vestale":"vestală","vestalei":"vestală","vestalele":"vestală","vestalelor":"vestală","vestaline":"vestalină","vestalinei":"vestalină","veste":"vestă","vestea":["vestea","veste","vestea","vesti","veștea","vești"],"vesteai":["vesteai","vesti","veșteai","vești"],"vesteam":["vesteam","vesti","veșteam","vești"],"vesteati":["vesteați","vesti","veșteați","vești"],"vesteau":["vesteau","vesti","veșteau","vești"],"vesteda":["veștedă","veșted","veșteda","veșted"],"vestede":"veșted","vestedele":"veșted","vestedul":"veșted","vestei":"vestă","vestejea":["vestejea","vesteji","veștejea","veșteji"],"vestejeai":["vestejeai","vesteji","veștejeai","veșteji"],"vestejeam":["vestejeam","vesteji","veștejeam","veșteji"],"vestejeati":["vestejeați","vesteji","veștejeați","veșteji"],"vestejeau":["vestejeau","vesteji","veștejeau","veșteji"],"vestejeli":"veștejeală","vestejelii":"veștejeală","vestejelile":"veștejeală","vestejelilor":"veștejeală","vestejesc":["vestejesc","vesteji","veștejesc","veșteji"],"vestejeste":["vestejește","vesteji","veștejește","veșteji"],"vestejesti":["vestejești","vesteji","veștejești","veșteji"],"vestejii":["vestejii","vesteji","veștejii","veșteji"],"vestejim":["vestejim","vesteji","veștejim","veșteji"],"vestejind":["vestejind","vesteji","veștejind","veșteji"],"vestejira":["vestejiră","vesteji","veștejiră","veșteji"],"vestejiram":["vestejirăm","vesteji","veștejirăm","veșteji"],"vestejirati":["vestejirăți","vesteji","veștejirăți","veșteji"],"vestejirea":["vestejirea","vestejire","veștejirea","veștejire"],"vestejiri":["vestejiri","vestejire","veștejiri","veștejire"],"vestejirii":["vestejirii","vestejire","veștejirii","veștejire"],"vestejirile":["vestejirile","vestejire","veștejirile","veștejire"],"vestejirilor":["vestejirilor","vestejire","veștejirilor","veștejire"],"vestejise":["vestejise","vesteji","veștejise","veșteji"],"vestejisem":["vestejisem","vesteji","veștejisem","veșteji"],"vestejisera":["vestejiseră","vesteji","veștejiseră","veșteji"],"vestejiseram":["vestejiserăm","vesteji","veștejiserăm","veșteji"],"vestejiserati":["vestejiserăți","vesteji","veștejiserăți","veșteji"],"vestejisesi":["vestejiseși","vesteji","veștejiseși","veșteji"],"vestejisi":["vestejiși","vesteji","veștejiși","veșteji"],"vestejit":["vestejit","vesteji","veștejit","veșteji"],"vestejita":["vestejită","vestejit","vestejita","vestejit","veștejită","veștejit","veștejita","veștejit"],"vestejite":["vestejite","vestejit","veștejite","veștejit"],"vestejitele":["vestejitele","vestejit","veștejitele","veștejit"],"vestejiti":["vestejiți","vesteji","veștejiți","veșteji","vestejiți","vestejit","veștejiți","veștejit"],"vestejitii":["vestejiții","vestejit","veștejiții","veștejit"],"vestejitul":["vestejitul","vestejit","veștejitul","veștejit"],"vestele":"vestă","vestelor":"vestă","vestesc":["vestesc","vesti","veștesc","vești"],"vesteste":["vestește","vesti","veștește","vești"],"vestesti":["vestești","vesti","veștești","vești"],"vestez":"vestezi","vesteze":"vestezi","vestezea":["vestezea","vestezi","veștezea","veștezi"],"vestezeai":["vestezeai","vestezi","veștezeai","veștezi"],"vestezeam":["vestezeam","vestezi","veștezeam","veștezi"],"vestezeati":["vestezeați","vestezi","veștezeați","veștezi"],"vestezeau":["vestezeau","vestezi","veștezeau","veștezi"],"vestezesc":"veștezi","vestezeste":"veștezi","vestezesti":"veștezi","vestezi":"veșted","vestezie":"vestezi","vestezii":["veștezii","veșted","vestezii","vestezi","veștezii","veștezi"],"vestezim":["vestezim","vestezi","veștezim","veștezi"],"vestezind":["vestezind","vestezi","veștezind","veștezi"],"vestezira":["vesteziră","vestezi","veșteziră","veștezi"],"vesteziram":["vestezirăm","vestezi","veștezirăm","veștezi"],"vestezirati":["vestezirăți","vestezi","veștezirăți","veștezi"],"vestezise":["vestezise","vestezi","veștezise","veștezi"],"vestezisem":["vestezisem","vestezi","veștezisem","veștezi"],"vestezisera":["vesteziseră","vestezi","veșteziseră","veștezi"],"vesteziseram":["vesteziserăm","vestezi","veșteziserăm","veștezi"],"vesteziserati":["vesteziserăți","vestezi","veșteziserăți","veștezi"],"vestezisesi":["vesteziseși","vestezi","veșteziseși","veștezi"],"vestezisi":["vesteziși","vestezi","veșteziși","veștezi"],"vestezit":["vestezit","vestezi","veștezit","veștezi"],"vestezita":["vestezită","vestezit","vestezita","vestezit","veștezită","veștezit","veștezita","veștezit"],"vestezite":["vestezite","vestezit","veștezite","veștezit"],"vestezitele":["vestezitele","vestezit","veștezitele","veștezit"],"vesteziti":["vesteziți","vestezi","veșteziți","veștezi","vesteziți","vestezit","veșteziți","veștezit"],"vestezitii":["vesteziții","vestezit","veșteziții","veștezit"],"vestezitul":["vestezitul","vestezit","veștezitul","veștezit"],"vesti":"veste","vestiare":"vestiar","vestiarele":"vestiar","vestiarelor":"vestiar","vestiarul":"vestiar","vestiarule":"vestiar","vestiarului":"vestiar","vestibulara":["vestibulară","vestibular","vestibulara","vestibular"],"vestibulare":"vestibular","vestibularele":"vestibular","vestibulari":"vestibular","vestibularii":"vestibular","vestibularul":"vestibular","vestibulul":"vestibul","vestibulule":"vestibul","vestibulului":"vestibul","vestibuluri":"vestibul","vestibulurile":"vestibul","vestibulurilor":"vestibul","vestica":["vestică","vestic","vestica","vestic"],"vestice":"vestic","vesticele":"vestic","vestici":"vestic","vesticii":"vestic","vesticul":"vestic","vestigii":"vestigiu","vestigiile":"vestigiu","vestigiilor":"vestigiu","vestigiul":"vestigiu","vestigiule":"vestigiu","vestigiului":"vestigiu","vestii":["veștii","veste","vestii","vesti","veștii","vești"],"vestile":"veste","vestilor":"veste","vestim":["vestim","vesti","veștim","vești"],"vestimentara":["vestimentară","vestimentar","vestimentara","vestimentar"],"vestimentare":"vestimentar","vestimentarele":"vestimentar","vestimentari":"vestimentar","vestimentarii":"vestimentar","vestimentarul":"vestimentar","vestimentatia":"vestimentație","vestimentatiei":"vestimentație","vestimentatii":"vestimentație","vestind":["vestind","vesti","veștind","vești"],"vestira":["vestiră","vesti","veștiră","vești"],"vestiram":["vestirăm","vesti","veștirăm","vești"],"vestirati":["vestirăți","vesti","veștirăți","vești"],"vestirea":"vestire","vestiri":"vestire","vestirii":"vestire","vestirile":"vestire","vestirilor":"vestire","vestise":["vestise","vesti","veștise","vești"],"vestisem":["vestisem","vesti","veștisem","vești"],"vestisera":["vestiseră","vesti","veștiseră","vești"],"vestiseram":["vestiserăm","vesti","veștiserăm","vești"],"vestiserati":["vestiserăți","vesti","veștiserăți","vești"],"vestisesi":["vestiseși","vesti","veștiseși","vești"],"vestisi":["vestiși","vesti","veștiși","vești"],"vestit":["vestit","vesti","veștit","vești"],"vestita":["vestită","vestit","vestita","vestit","veștită","veștit","veștita","veștit"],"vestite":["vestite","vestit","veștite","veștit"],"vestitele":["vestitele","vestit","veștitele","veștit"],"vestiti":["vestiți","vesti","veștiți","vești","vestiți","vestit","veștiți","veștit"],"vestitii":["vestiții","vestit","veștiții","veștit"],"vestitoarea":"vestitoare","vestitoarei":"vestitoare","vestitoarele":"vestitoare","vestitoarelor":"vestitoare","vestitori":"vestitor","vestitorii":"vestitor","vestitorilor":"vestitor","vestitorul":"vestitor","vestitorule":"vestitor","vestitorului":"vestitor","vestitul":["vestitul","vestit","veștitul","veștit"],"vestmantul":["vestmântul","vestmânt","veștmântul","veștmânt"],"vestmantule":["vestmântule","vestmânt","veștmântule","veștmânt"],"vestmantului":["vestmântului","vestmânt","veștmântului","veștmânt"],"vestminte":["vestminte","vestmânt","veștminte","veștmânt"],"vestmintele":["vestmintele","vestmânt","veștmintele","veștmânt"],"vestmintelor":["vestmintelor","vestmânt","veștmintelor","veștmânt"],"vestoane":"veston","vestoanele":"veston","vestoanelor":"veston","vestonul":"veston","vestonule":"veston","vestonului":"veston","vestuia":"vestui","vestuiai":"vestui","vestuiam":"vestui","vestuiati":"vestui","vestuiau":"vestui","vestuie":"vestui","vestuii":"vestui","vestuim":"vestui","vestuind":"vestui","vestuira":"vestui","vestuiram":"vestui","vestuirati":"vestui","vestuise":"vestui","vestuisem":"vestui","vestuisera":"vestui","vestuiseram":"vestui","vestuiserati":"vestui","vestuisesi":"vestui","vestuisi":"vestui","vestuit":"vestui","vestuiti":"vestui","vestul":"vest","vestule":"vest","vestului":"vest","vestute":"vestuță","vestutei":"vestuță","veterane":"veterană","veteranei":"veterană","veteranele":"veterană","veteranelor":"veterană","veterani":"veteran","veterinara":["veterinară","veterinar","veterinara","veterinar"],"veterinare":["veterinare","veterinar","veterinare","veterinară"],"veterinarei":"veterinară","veterinarele":["veterinarele","veterinar","veterinarele","veterinară"],"veterinarelor":"veterinară","veterinari":"veterinar","veterinarii":"veterinar","veterinarul":"veterinar","veti":"voi","vetiveri":"vetiver","vetiverii":"vetiver","vetiverilor":"vetiver","vetiverul":"vetiver","vetiverule":"vetiver","vetiverului":"vetiver","vetoul":"veto","vetoule":"veto","vetoului":"veto","vetouri":"veto","vetourile":"veto","vetourilor":"veto","vetre":"vatră","vetrei":"vatră","vetrele":["vetrele","vatră","vetrele","vetrelă"],"vetrelei":"vetrelă","vetrelele":"vetrelă","vetrelelor":"vetrelă","vetrelor":"vatră","vetrice":"vetrică","vetricea":"vetrice","vetricei":["vetricei","vetrică","vetricei","vetrice"],"vetricele":"vetrice","vetricelor":"vetrice","vetricice":"vetricică","vetricicei":"vetricică","vetrile":"vetrilă","vetrilei":"vetrilă","vetrilele":"vetrilă","vetrilelor":"vetrilă","vetrisoare":"vetrișoară","vetrisoarei":"vetrișoară","vetrisoarele":"vetrișoară","vetrisoarelor":"vetrișoară","vetrite":"vetriță","vetritei":"vetriță","vetritele":"vetriță","vetritelor":"vetriță","vetruste":"vetrușcă","vetrustei":"vetrușcă","vetrustele":"vetrușcă","vetrustelor":"vetrușcă","vetrusti":"vetrușcă","veturini":"veturin","veturinii":"veturin","veturinilor":"veturin","veturinul":"veturin","veturinule":"veturin","veturinului":"veturin","vetusta":["vetustă","vetust","vetusta","vetust"],"vetustatea":"vetustate","vetustatei":"vetustate","vetuste":"vetust","vetustele":"vetust","vetusti":"vetust","vetustii":"vetust","vetustul":"vetust","veverite":"veveriță","veveritei":"veveriță","veveritele":"veveriță","veveritelor":"veveriță","vexai":"vexa","vexam":["vexăm","vexa","vexam","vexa"],"vexand":"vexa","vexanta":["vexantă","vexant","vexanta","vexant"],"vexante":"vexant","vexantele":"vexant","vexanti":"vexant","vexantii":"vexant","vexantul":"vexant","vexara":"vexa","vexaram":"vexa","vexarati":"vexa","vexarea":"vexare","vexari":"vexare","vexarii":"vexare","vexarile":"vexare","vexarilor":"vexare","vexase":"vexa","vexasem":"vexa","vexasera":"vexa","vexaseram":"vexa","vexaserati":"vexa","vexasesi":"vexa","vexasi":"vexa","vexat":"vexa","vexata":["vexată","vexat","vexata","vexat"],"vexate":"vexat","vexatele":"vexat","vexati":["vexați","vexa","vexați","vexat"],"vexatia":"vexație","vexatie":"vexațiune","vexatiei":"vexație","vexatii":["vexații","vexat","vexații","vexație"],"vexatiile":"vexație","vexatiilor":"vexație","vexatiunea":"vexațiune","vexatiuni":"vexațiune","vexatiunii":"vexațiune","vexatiunile":"vexațiune","vexatiunilor":"vexațiune","vexatoria":"vexatoriu","vexatorie":"vexatoriu","vexatorii":"vexatoriu","vexatoriii":"vexatoriu","vexatoriile":"vexatoriu","vexatoriul":"vexatoriu","vexatul":"vexat","vexau":"vexa","vexeaza":"vexa","vexez":"vexa","vexezi":"vexa","vexilatia":"vexilație","vexilatiei":"vexilație","vexilatii":"vexilație","vexile":"vexil","vexilele":"vexil","vexilelor":"vexil","vexilologia":"vexilologie","vexilologica":["vexilologică","vexilologic","vexilologica","vexilologic"],"vexilologice":"vexilologic","vexilologicele":"vexilologic","vexilologici":"vexilologic","vexilologicii":"vexilologic","vexilologicul":"vexilologic","vexilologiei":"vexilologie","vexilologii":"vexilologie","vexilul":"vexil","vexilule":"vexil","vexilului":"vexil","vezetei":"vezeteu","vezeteii":"vezeteu","vezeteilor":"vezeteu","vezeteuul":"vezeteu","vezeteuule":"vezeteu","vezeteuului":"vezeteu","vezi":"vedea","vezicala":["vezicală","vezical","vezicala","vezical"],"vezicale":"vezical","vezicalele":"vezical","vezicali":"vezical","vezicalii":"vezical","vezicalul":"vezical","vezicanta":["vezicantă","vezicant","vezicanta","vezicant"],"vezicante":"vezicant","vezicantele":"vezicant","vezicanti":"vezicant","vezicantii":"vezicant","vezicantul":"vezicant","vezicata":["vezicată","vezicat","vezicata","vezicat"],"vezicate":"vezicat","vezicatele":"vezicat","vezicati":"vezicat","vezicatia":"vezicație","vezicatiei":"vezicație","vezicatii":["vezicații","vezicat","vezicații","vezicație"],"vezicatiile":"vezicație","vezicatiilor":"vezicație","vezicatiunea":"vezicațiune","vezicatiuni":"vezicațiune","vezicatiunii":"vezicațiune","vezicatiunile":"vezicațiune","vezicatiunilor":"vezicațiune","vezicatoare":"vezicator","vezicatoarea":"vezicator","vezicatoarele":"vezicator","vezicatori":"vezicator","vezicatorii":"vezicator","vezicatorul":"vezicator","vezicatul":"vezicat","vezici":"vezică","vezici biliare":"vezică biliară","vezici urinare":"vezică urinară","veziculara":["veziculară","vezicular","veziculara","vezicular"],"veziculare":"vezicular","vezicularele":"vezicular","veziculari":"vezicular","vezicularii":"vezicular","vezicularul":"vezicular","veziculatia":"veziculație","veziculatiei":"veziculație","veziculatii":"veziculație","vezicule":"veziculă","vezicule biliare":"veziculă biliară","veziculectomia":"veziculectomie","veziculectomiei":"veziculectomie","veziculectomii":"veziculectomie","veziculectomiile":"veziculectomie","veziculectomiilor":"veziculectomie","veziculite":"veziculită","veziculitei":"veziculită","veziculoasa":["veziculoasă","veziculos","veziculoasa","veziculos"],"veziculoase":"veziculos","veziculoasele":"veziculos","veziculosi":"veziculos","veziculosii":"veziculos","veziculosul":"veziculos","veziri":"vezir","vezirii":"vezir","vezirilor":"vezir","vezirul":"vezir","vezirule":"vezir","vezirului":"vezir","vezunia":"vezunie","vezuniei":"vezunie","vezunii":"vezunie","vezuniile":"vezunie","vezuniilor":"vezunie","vezuvianul":"vezuvian","vezuvianule":"vezuvian","vezuvianului":"vezuvian","via":["via","vie","via","viu"],"viabila":["viabilă","viabil","viabila","viabil"],"viabile":"viabil","viabilele":"viabil","viabili":"viabil","viabilii":"viabil","viabilitatea":"viabilitate","viabilitati":"viabilitate","viabilitatii":"viabilitate","viabilitatile":"viabilitate","viabilitatilor":"viabilitate","viabilul":"viabil","viade":"viadă","viadei":"viadă","viaducte":"viaduct","viaductele":"viaduct","viaductelor":"viaduct","viaductul":"viaduct","viaductule":"viaduct","viaductului":"viaduct","viagera":["viageră","viager","viagera","viager"],"viagere":"viager","viagerele":"viager","viageri":"viager","viagerii":"viager","viagerul":"viager","viai":["viai","via","viai","vie"],"viajera":["viajeră","viajer","viajera","viajer"],"viajere":"viajer","viajerele":"viajer","viajeri":"viajer","viajerii":"viajer","viajerul":"viajer","viam":["viam","via","viam","vie"],"viara":"via","viaram":"via","viarati":"via","viase":"via","viasem":"via","viasera":"via","viaseram":"via","viaserati":"via","viasesi":"via","viasi":"via","viat":"via","viati":["viați","via","viați","vie"],"viatica":["viatică","viatic","viatica","viatic"],"viatice":"viatic","viaticele":"viatic","viatici":"viatic","viaticii":"viatic","viaticul":"viatic","viau":["viau","via","viau","vie"],"viaza":"via","vibrafoane":"vibrafon","vibrafoanele":"vibrafon","vibrafoanelor":"vibrafon","vibrafonisti":"vibrafonist","vibrafonistii":"vibrafonist","vibrafonistilor":"vibrafonist","vibrafonistul":"vibrafonist","vibrafonistule":"vibrafonist","vibrafonistului":"vibrafonist","vibrafonul":"vibrafon","vibrafonule":"vibrafon","vibrafonului":"vibrafon","vibrai":"vibra","vibram":["vibrăm","vibra","vibram","vibra"],"vibrand":"vibra","vibranta":["vibrantă","vibrant","vibranta","vibrant"],"vibrante":["vibrante","vibrant","vibrante","vibrantă"],"vibrantei":"vibrantă","vibrantele":["vibrantele","vibrant","vibrantele","vibrantă"],"vibrantelor":"vibrantă","vibranti":"vibrant","vibrantii":"vibrant","vibrantul":"vibrant","vibrara":"vibra","vibraram":"vibra","vibrarati":"vibra","vibrarea":"vibrare","vibrari":"vibrare","vibrarii":"vibrare","vibrarile":"vibrare","vibrarilor":"vibrare","vibrase":"vibra","vibrasem":"vibra","vibrasera":"vibra","vibraseram":"vibra","vibraserati":"vibra","vibrasesi":"vibra","vibrasi":"vibra","vibrat":"vibra","vibrati":"vibra","vibratia":"vibrație","vibratiei":"vibrație","vibratii":"vibrație","vibratiile":"vibrație","vibratiilor":"vibrație","vibratila":["vibratilă","vibratil","vibratila","vibratil"],"vibratile":"vibratil","vibratilele":"vibratil","vibratili":"vibratil","vibratilii":"vibratil","vibratilitatea":"vibratilitate","vibratilitati":"vibratilitate","vibratilitatii":"vibratilitate","vibratilitatile":"vibratilitate","vibratilitatilor":"vibratilitate","vibratilul":"vibratil","vibratiunea":"vibrațiune","vibratiuni":"vibrațiune","vibratiunii":"vibrațiune","vibratiunile":"vibrațiune","vibratiunilor":"vibrațiune","vibratoare":"vibrător","vibratoarea":"vibrător","vibratoarele":"vibrător","vibratori":["vibratori","vibrator","vibrători","vibrător"],"vibratoria":"vibratoriu","vibratorie":"vibratoriu","vibratorii":["vibrătorii","vibrător","vibratorii","vibratoriu"],"vibratoriii":"vibratoriu","vibratoriile":"vibratoriu","vibratorile":"vibrator","vibratorilor":"vibrator","vibratoriul":"vibratoriu","vibratorul":["vibratorul","vibrator","vibrătorul","vibrător"],"vibratorule":"vibrator","vibratorului":"vibrator","vibrau":"vibra","vibreaza":"vibra","vibrez":"vibra","vibrezi":"vibra","vibrioni":"vibrion","vibrionii":"vibrion","vibrionilor":"vibrion","vibrionul":"vibrion","vibrionule":"vibrion","vibrionului":"vibrion","vibrioze":"vibrioză","vibriozei":"vibrioză","vibriozele":"vibrioză","vibriozelor":"vibrioză","vibrise":"vibrisă","vibrisei":"vibrisă","vibrografe":"vibrograf","vibrografele":"vibrograf","vibrografelor":"vibrograf","vibrograful":"vibrograf","vibrografule":"vibrograf","vibrografului":"vibrograf","vibromasaje":"vibromasaj","vibromasajele":"vibromasaj","vibromasajelor":"vibromasaj","vibromasajul":"vibromasaj","vibromasajule":"vibromasaj","vibromasajului":"vibromasaj","vibrometre":"vibrometru","vibrometrele":"vibrometru","vibrometrelor":"vibrometru","vibrometrul":"vibrometru","vibrometrule":"vibrometru","vibrometrului":"vibrometru","vibroscoape":"vibroscop","vibroscoapele":"vibroscop","vibroscoapelor":"vibroscop","vibroscopul":"vibroscop","vibroscopule":"vibroscop","vibroscopului":"vibroscop","vibroterapia":"vibroterapie","vibroterapiei":"vibroterapie","vibroterapii":"vibroterapie","vicari":"vicar","vicariala":["vicarială","vicarial","vicariala","vicarial"],"vicariale":"vicarial","vicarialele":"vicarial","vicariali":"vicarial","vicarialii":"vicarial","vicarialul":"vicarial","vicariate":"vicariat","vicariatele":"vicariat","vicariatelor":"vicariat","vicariatul":"vicariat","vicariatule":"vicariat","vicariatului":"vicariat","vicarii":"vicar","vicarilor":"vicar","vicarul":"vicar","vicarule":"vicar","vicarului":"vicar","viceamirali":"viceamiral","viceamiralii":"viceamiral","viceamiralilor":"viceamiral","viceamiralitatea":"viceamiralitate","viceamiralitati":"viceamiralitate","viceamiralitatii":"viceamiralitate","viceamiralul":"viceamiral","viceamiralule":"viceamiral","viceamiralului":"viceamiral","vicecampioane":"vicecampioană","vicecampioanei":"vicecampioană","vicecampioanele":"vicecampioană","vicecampioanelor":"vicecampioană","vicecampioni":"vicecampion","vicecampionii":"vicecampion","vicecampionilor":"vicecampion","vicecampionul":"vicecampion","vicecampionule":"vicecampion","vicecampionului":"vicecampion","vicecancelari":"vicecancelar","vicecancelarii":"vicecancelar","vicecancelarilor":"vicecancelar","vicecancelarul":"vicecancelar","vicecancelarule":"vicecancelar","vicecancelarului":"vicecancelar","vicecomitatul":"vicecomitat","vicecomitatule":"vicecomitat","vicecomitatului":"vicecomitat","vicecomiteul":"vicecomite","vicecomiteule":"vicecomite","vicecomiteului":"vicecomite","vicecomiti":"vicecomite","vicecomitii":"vicecomite","vicecomitilor":"vicecomite","viceconsulate":"viceconsulat","viceconsulatele":"viceconsulat","viceconsulatelor":"viceconsulat","viceconsulatul":"viceconsulat","viceconsulatule":"viceconsulat","viceconsulatului":"viceconsulat","viceconsuli":"viceconsul","viceconsulii":"viceconsul","viceconsulilor":"viceconsul","viceconsulul":"viceconsul","viceconsulule":"viceconsul","viceconsulului":"viceconsul","vicecraiul":"vicecrai","vicecraiule":"vicecrai","vicecraiului":"vicecrai","vicedirectorul":"vicedirector","vicedirectorule":"vicedirector","vicedirectorului":"vicedirector","viceguvernatori":"viceguvernator","viceguvernatorii":"viceguvernator","viceguvernatorilor":"viceguvernator","viceguvernatorul":"viceguvernator","viceguvernatorule":"viceguvernator","viceguvernatorului":"viceguvernator","viceguvernorul":"viceguvernor","viceguvernorule":"viceguvernor","viceguvernorului":"viceguvernor","vicenotarul":"vicenotar","vicenotarule":"vicenotar","vicenotarului":"vicenotar","vicepresedinte":"vicepreședintă","vicepresedintei":"vicepreședintă","vicepresedintele":"vicepreședintă","vicepresedintelor":"vicepreședintă","vicepresedinteul":"vicepreședinte","vicepresedinteule":"vicepreședinte","vicepresedinteului":"vicepreședinte","vicepresedinti":"vicepreședinte","vicepresedintia":"vicepreședinție","vicepresedintiei":"vicepreședinție","vicepresedintii":["vicepreședinții","vicepreședinte","vicepreședinții","vicepreședinție"],"vicepresedintilor":"vicepreședinte","viceprezidenti":"viceprezident","viceprezidentia":"viceprezidenție","viceprezidentiei":"viceprezidenție","viceprezidentii":["viceprezidenții","viceprezident","viceprezidenții","viceprezidenție"],"viceprezidentilor":"viceprezident","viceprezidentul":"viceprezident","viceprezidentule":"viceprezident","viceprezidentului":"viceprezident","viceprim-ministri":"viceprim-ministru","viceprim-ministrii":"viceprim-ministru","viceprim-ministrilor":"viceprim-ministru","viceprim-ministruul":"viceprim-ministru","viceprim-ministruule":"viceprim-ministru","viceprim-ministruului":"viceprim-ministru","viceprimari":"viceprimar","viceprimarii":"viceprimar","viceprimarilor":"viceprimar","viceprimarul":"viceprimar","viceprimarule":"viceprimar","viceprimarului":"viceprimar","vicerectori":"vicerector","vicerectorii":"vicerector","vicerectorilor":"vicerector","vicerectorul":"vicerector","vicerectorule":"vicerector","vicerectorului":"vicerector","viceregala":["viceregală","viceregal","viceregala","viceregal"],"viceregale":"viceregal","viceregalele":"viceregal","viceregali":"viceregal","viceregalii":"viceregal","viceregalul":"viceregal","viceregeul":"vicerege","viceregeule":"vicerege","viceregeului":"vicerege","viceregi":"vicerege","viceregii":"vicerege","viceregilor":"vicerege","viciai":"vicia","viciam":"vicia","viciara":"vicia","viciaram":"vicia","viciarati":"vicia","viciase":"vicia","viciasem":"vicia","viciasera":"vicia","viciaseram":"vicia","viciaserati":"vicia","viciasesi":"vicia","viciasi":"vicia","viciat":"vicia","viciata":["viciată","viciat","viciata","viciat"],"viciate":"viciat","viciatele":"viciat","viciati":["viciați","vicia","viciați","viciat"],"viciatii":"viciat","viciatul":"viciat","viciau":"vicia","viciaza":"vicia","vicie":"vicia","vicieaza":"vicia","viciem":"vicia","vicierea":"viciere","vicieri":"viciere","vicierii":"viciere","vicierile":"viciere","vicierilor":"viciere","viciez":"vicia","viciezi":"vicia","vicii":"viciu","viciind":"vicia","vicinala":["vicinală","vicinal","vicinala","vicinal"],"vicinale":"vicinal","vicinalele":"vicinal","vicinali":"vicinal","vicinalii":"vicinal","vicinalitatea":"vicinalitate","vicinalitati":"vicinalitate","vicinalitatii":"vicinalitate","vicinalitatile":"vicinalitate","vicinalitatilor":"vicinalitate","vicinalul":"vicinal","vicioasa":["vicioasă","vicios","vicioasa","vicios"],"vicioase":"vicios","vicioasele":"vicios","viciosi":"vicios","viciosii":"vicios","viciosul":"vicios","viciozitatea":"viciozitate","viciozitati":"viciozitate","viciozitatii":"viciozitate","vicisitudinea":"vicisitudine","vicisitudini":"vicisitudine","vicisitudinii":"vicisitudine","vicisitudinile":"vicisitudine","vicisitudinilor":"vicisitudine","vicleana":["vicleană","viclean","vicleana","viclean"],"vicleanul":"viclean","viclene":"viclean","viclenea":"vicleni","vicleneai":"vicleni","vicleneam":"vicleni","vicleneasca":["viclenească","viclenesc","vicleneasca","viclenesc"],"vicleneati":"vicleni","vicleneau":"vicleni","viclenele":"viclean","viclenesc":"vicleni","viclenescul":"viclenesc","vicleneste":"vicleni","viclenesti":["viclenești","viclenesc","viclenești","vicleni"],"viclenestii":"viclenesc","viclenestile":"viclenesc","vicleni":"viclean","viclenia":"viclenie","vicleniei":"viclenie","viclenii":["viclenii","viclean","viclenii","vicleni","viclenii","viclenie"],"vicleniile":"viclenie","vicleniilor":"viclenie","viclenim":"vicleni","viclenind":"vicleni","viclenira":"vicleni","vicleniram":"vicleni","viclenirati":"vicleni","viclenirea":"viclenire","vicleniri":"viclenire","viclenirii":"viclenire","viclenirile":"viclenire","viclenirilor":"viclenire","viclenise":"vicleni","viclenisem":"vicleni","viclenisera":"vicleni","vicleniseram":"vicleni","vicleniserati":"vicleni","viclenisesi":"vicleni","viclenisi":"vicleni","viclenit":"vicleni","vicleniti":"vicleni","viclesugul":"vicleșug","viclesugule":"vicleșug","viclesugului":"vicleșug","viclesuguri":"vicleșug","viclesugurile":"vicleșug","viclesugurilor":"vicleșug","vicole":"vicol","vicolea":"vicoli","vicoleai":"vicoli","vicoleam":"vicoli","vicoleati":"vicoli","vicoleau":"vicoli","vicolele":"vicol","vicolelor":"vicol","vicolesc":"vicoli","vicoleste":"vicoli","vicolesti":"vicoli","vicolii":"vicoli","vicolim":"vicoli","vicolind":"vicoli","vicolira":"vicoli","vicoliram":"vicoli","vicolirati":"vicoli","vicolise":"vicoli","vicolisem":"vicoli","vicolisera":"vicoli","vicoliseram":"vicoli","vicoliserati":"vicoli","vicolisesi":"vicoli","vicolisi":"vicoli","vicolit":"vicoli","vicoliti":"vicoli","vicolul":"vicol","vicolule":"vicol","vicolului":"vicol","vicontese":"vicontesă","vicontesei":"vicontesă","vicontesele":"vicontesă","viconteselor":"vicontesă","viconteul":"viconte","viconteule":"viconte","viconteului":"viconte","viconti":"viconte","vicontii":"viconte","vicontilor":"viconte","victime":"victimă","victimei":"victimă","victimele":"victimă","victimelor":"victimă","victimizai":"victimiza","victimizam":["victimizăm","victimiza","victimizam","victimiza"],"victimizand":"victimiza","victimizara":"victimiza","victimizaram":"victimiza","victimizarati":"victimiza","victimizarea":"victimizare","victimizari":"victimizare","victimizarii":"victimizare","victimizarile":"victimizare","victimizarilor":"victimizare","victimizase":"victimiza","victimizasem":"victimiza","victimizasera":"victimiza","victimizaseram":"victimiza","victimizaserati":"victimiza","victimizasesi":"victimiza","victimizasi":"victimiza","victimizat":"victimiza","victimizati":"victimiza","victimizau":"victimiza","victimizeaza":"victimiza","victimizez":"victimiza","victimizezi":"victimiza","victimologia":"victimologie","victimologiei":"victimologie","victimologii":"victimologie","victoria":"victorie","victoriana":["victoriană","victorian","victoriana","victorian"],"victorianul":"victorian","victorie a la pyrrhus":"victorie à la Pirus","victoriei":"victorie","victoriene":"victorian","victorienele":"victorian","victorieni":"victorian","victorienii":"victorian","victorii":"victorie","victorii a la pirus":"victorie à la Pirus","victoriile":"victorie","victoriilor":"victorie","victorioasa":["victorioasă","victorios","victorioasa","victorios"],"victorioase":"victorios","victorioasele":"victorios","victoriosi":"victorios","victoriosii":"victorios","victoriosul":"victorios","vida":["vidă","vid","vida","vid"],"vidai":"vida","vidam":["vidăm","vida","vidam","vida"],"vidand":"vida","vidanjai":"vidanja","vidanjam":["vidanjăm","vidanja","vidanjam","vidanja"],"vidanjand":"vidanja","vidanjara":"vidanja","vidanjaram":"vidanja","vidanjarati":"vidanja","vidanjarea":"vidanjare","vidanjari":"vidanjare","vidanjarii":"vidanjare","vidanjarile":"vidanjare","vidanjarilor":"vidanjare","vidanjase":"vidanja","vidanjasem":"vidanja","vidanjasera":"vidanja","vidanjaseram":"vidanja","vidanjaserati":"vidanja","vidanjasesi":"vidanja","vidanjasi":"vidanja","vidanjat":"vidanja","vidanjati":"vidanja","vidanjau":"vidanja","vidanje":"vidanjă","vidanjeaza":"vidanja","vidanjei":"vidanjă","vidanjele":"vidanjă","vidanjelor":"vidanjă","vidanjere":"vidanjeră","vidanjerei":"vidanjeră","vidanjerele":"vidanjeră","vidanjerelor":"vidanjeră","vidanjez":"vidanja","vidanjezi":"vidanja","vidanjori":"vidanjor","vidanjorii":"vidanjor","vidanjorilor":"vidanjor","vidanjorul":"vidanjor","vidanjorule":"vidanjor","vidanjorului":"vidanjor","vidanjul":"vidanj","vidanjule":"vidanj","vidanjului":"vidanj","vidanjuri":"vidanj","vidanjurile":"vidanj","vidanjurilor":"vidanj","vidara":"vida","vidaram":"vida","vidarati":"vida","vidarea":"vidare","vidari":"vidare","vidarii":"vidare","vidase":"vida","vidasem":"vida","vidasera":"vida","vidaseram":"vida","vidaserati":"vida","vidasesi":"vida","vidasi":"vida","vidat":"vida","vidati":"vida","vidau":"vida","vide":"vid","videaza":"vida","videle":"vid","videnia":"videnie","videniei":"videnie","videnii":"videnie","videniile":"videnie","videniilor":"videnie","videocamere":"videocameră","videocamerei":"videocameră","videocamerele":"videocameră","videocamerelor":"videocameră","videocaptoare":"videocaptor","videocaptoarele":"videocaptor","videocaptoarelor":"videocaptor","videocaptorul":"videocaptor","videocaptorule":"videocaptor","videocaptorului":"videocaptor","videocasete":"videocasetă","videocasetei":"videocasetă","videocasetele":"videocasetă","videocasetelor":"videocasetă","videocasetofoane":"videocasetofon","videocasetofoanele":"videocasetofon","videocasetofoanelor":"videocasetofon","videocasetofonul":"videocasetofon","videocasetofonule":"videocasetofon","videocasetofonului":"videocasetofon","videoclipul":"videoclip","videoclipule":"videoclip","videoclipului":"videoclip","videoclipuri":"videoclip","videoclipurile":"videoclip","videoclipurilor":"videoclip","videoconferinte":"videoconferință","videoconferintei":"videoconferință","videoconferintele":"videoconferință","videoconferintelor":"videoconferință","videodiscul":"videodisc","videodiscule":"videodisc","videodiscului":"videodisc","videodiscuri":"videodisc","videodiscurile":"videodisc","videodiscurilor":"videodisc","videofoane":"videofon","videofoanele":"videofon","videofoanelor":"videofon","videofonia":"videofonie","videofonica":["videofonică","videofonic","videofonica","videofonic"],"videofonice":"videofonic","videofonicele":"videofonic","videofonici":"videofonic","videofonicii":"videofonic","videofonicul":"videofonic","videofoniei":"videofonie","videofonii":"videofonie","videofonul":"videofon","videofonule":"videofon","videofonului":"videofon","videofrecvente":"videofrecvență","videofrecventei":"videofrecvență","videofrecventele":"videofrecvență","videofrecventelor":"videofrecvență","videografia":"videografie","videografiei":"videografie","videografii":"videografie","videografiile":"videografie","videografiilor":"videografie","videoteci":"videotecă","videotecii":"videotecă","videotecile":"videotecă","videotecilor":"videotecă","videotelefoane":"videotelefon","videotelefoanele":"videotelefon","videotelefoanelor":"videotelefon","videotelefonieul":"videotelefonie","videotelefonieule":"videotelefonie","videotelefonieului":"videotelefonie","videotelefonul":"videotelefon","videotelefonule":"videotelefon","videotelefonului":"videotelefon","videz":"vida","videzi":"vida","vidicoane":"vidicon","vidicoanele":"vidicon","vidicoanelor":"vidicon","vidiconul":"vidicon","vidiconule":"vidicon","vidiconului":"vidicon","vidme":"vidmă","vidmei":"vidmă","vidmele":"vidmă","vidmelor":"vidmă","vidre":"vidră","vidrei":"vidră","vidrele":"vidră","vidrelor":"vidră","viduitatea":"viduitate","viduitati":"viduitate","viduitatii":"viduitate","viduitatile":"viduitate","viduitatilor":"viduitate","vidul":"vid","vidule":"vid","vidului":"vid","viduri":"vid","vidurile":"vid","vidurilor":"vid","vie":["vie","via","vie","viu"],"viea":"vie","vieata":"viață","viei":"vie","viele":"vielă","vielei":"vielă","vielele":"vielă","vielelor":"vielă","viem":["viem","via","viem","vie"],"vieneza":["vieneză","vienez","vieneza","vienez"],"vieneze":"vienez","vienezele":"vienez","vienezi":"vienez","vienezii":"vienez","vienezlor":"vienez","vienezul":"vienez","vienezule":"vienez","vienezului":"vienez","vierese":"viereasă","vieresei":"viereasă","vieresele":"viereasă","viereselor":"viereasă","vieri":"vier","vierii":"vier","vierilor":"vier","vieritul":"vierit","vieritule":"vierit","vieritului":"vierit","viermanari":"viermănar","viermanarii":"viermănar","viermanarilor":"viermănar","viermanarul":"viermănar","viermanarule":"viermănar","viermanarului":"viermănar","viermanoasa":["viermănoasă","viermănos","viermănoasa","viermănos"],"viermanoase":"viermănos","viermanoasele":"viermănos","viermanosata":["viermănoșată","viermănoșat","viermănoșata","viermănoșat"],"viermanosate":"viermănoșat","viermanosatele":"viermănoșat","viermanosati":"viermănoșat","viermanosatii":"viermănoșat","viermanosatul":"viermănoșat","viermanosi":"viermănos","viermanosii":"viermănos","viermanosul":"viermănos","viermaraia":"viermăraie","viermaraiei":"viermăraie","viermaraii":"viermăraie","viermare":"viermar","viermarele":"viermar","viermarelor":"viermar","viermaria":"viermărie","viermariei":"viermărie","viermarii":"viermărie","viermariile":"viermărie","viermariilor":"viermărie","viermarul":"viermar","viermarule":"viermar","viermarului":"viermar","viermatul":"viermăt","viermatule":"viermăt","viermatului":"viermăt","viermele":"vierme","viermelui":"vierme","viermi":"vierme","viermi de galbeaza":"vierme de gălbează","viermi de matase":"vierme de mătase","viermii":"vierme","viermilor":"vierme","viermisori":"viermișor","viermisorii":"viermișor","viermisorilor":"viermișor","viermisorul":"viermișor","viermisorule":"viermișor","viermisorului":"viermișor","viermocul":"viermoc","viermocule":"viermoc","viermocului":"viermoc","viermuia":"viermui","viermuiai":"viermui","viermuiam":"viermui","viermuiati":"viermui","viermuiau":"viermui","viermuieli":"viermuială","viermuielii":"viermuială","viermuielile":"viermuială","viermuielilor":"viermuială","viermuiesc":"viermui","viermuieste":"viermui","viermuiesti":"viermui","viermuii":"viermui","viermuim":"viermui","viermuind":"viermui","viermuira":"viermui","viermuiram":"viermui","viermuirati":"viermui","viermuirea":"viermuire","viermuiri":"viermuire","viermuirii":"viermuire","viermuirile":"viermuire","viermuirilor":"viermuire","viermuise":"viermui","viermuisem":"viermui","viermuisera":"viermui","viermuiseram":"viermui","viermuiserati":"viermui","viermuisesi":"viermui","viermuisi":"viermui","viermuit":"viermui","viermuita":["viermuită","viermuit","viermuita","viermuit"],"viermuite":"viermuit","viermuitele":"viermuit","viermuiti":["viermuiți","viermui","viermuiți","viermuit"],"viermuitii":"viermuit","viermuitul":"viermuit","viermuleteul":"viermulete","viermuleteule":"viermulete","viermuleteului":"viermulete","viermuleti":"viermuleț","viermuletii":"viermuleț","viermuletilor":"viermuleț","viermuletul":"viermuleț","viermuletule":"viermuleț","viermuletului":"viermuleț","viermurelul":"viermurel","viermurelule":"viermurel","viermurelului":"viermurel","viermusi":"viermuș","viermusii":"viermuș","viermusilor":"viermuș","viermusori":"viermușor","viermusorii":"viermușor","viermusorilor":"viermușor","viermusorul":"viermușor","viermusorule":"viermușor","viermusorului":"viermușor","viermusul":"viermuș","viermusule":"viermuș","viermusului":"viermuș","viermuti":"viermuț","viermutii":"viermuț","viermutilor":"viermuț","viermutul":"viermuț","viermutule":"viermuț","viermutului":"viermuț","vieroaice":"vieroaică","vieroaicei":"vieroaică","viersuia":"viersui"};
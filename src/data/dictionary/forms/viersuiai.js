@@ -0,0 +1 @@
+export default {"viersuiai":"viersui","viersuiam":"viersui","viersuiati":"viersui","viersuiau":"viersui","viersuiesc":"viersui","viersuieste":"viersui","viersuiesti":"viersui","viersuii":"viersui","viersuim":"viersui","viersuind":"viersui","viersuira":"viersui","viersuiram":"viersui","viersuirati":"viersui","viersuise":"viersui","viersuisem":"viersui","viersuisera":"viersui","viersuiseram":"viersui","viersuiserati":"viersui","viersuisesi":"viersui","viersuisi":"viersui","viersuit":"viersui","viersuiti":"viersui","viersuri":"viers","vierul":"vier","vierule":"vier","vierului":"vier","vierusorul":"vierușor","vierusorule":"vierușor","vierusorului":"vierușor","vierusul":"vieruș","vierusule":"vieruș","vierusului":"vieruș","vierutul":"vieruț","vierutule":"vieruț","vierutului":"vieruț","viespare":"viespar","viesparele":"viespar","viesparelor":"viespar","viespari":"viespar","viesparia":"viespărie","viespariei":"viespărie","viesparii":["viesparii","viespar","viespării","viespărie"],"viespariile":"viespărie","viespariilor":"viespărie","viesparilor":"viespar","viesparul":"viespar","viesparule":"viespar","viesparului":"viespar","viespea":"viespe","viespi":"viespe","viespii":"viespe","viespile":"viespe","viespilor":"viespe","viespisori":"viespișor","viespisorii":"viespișor","viespisorilor":"viespișor","viespisorul":"viespișor","viespisorule":"viespișor","viespisorului":"viespișor","viespoaice":"viespoaică","viespoaicei":"viespoaică","viespoii":"viespoi","viespoilor":"viespoi","viespoiul":"viespoi","viespoiule":"viespoi","viespoiului":"viespoi","vietatea":"vietate","vietati":"vietate","vietatii":"vietate","vietatile":"vietate","vietatilor":"vietate","vieti":["vieți","viață","vieți","vie"],"vietii":"viață","vietile":"viață","vietilor":"viață","vietisoare":"viețișoară","vietisoarei":"viețișoară","vietisoarele":"viețișoară","vietisoarelor":"viețișoară","vietnameza":["vietnameză","vietnamez","vietnameza","vietnamez"],"vietnameze":["vietnameze","vietnamez","vietnameze","vietnameză"],"vietnamezei":"vietnameză","vietnamezele":["vietnamezele","vietnamez","vietnamezele","vietnameză"],"vietnamezelor":"vietnameză","vietnamezi":"vietnamez","vietnamezii":"vietnamez","vietnamezilor":"vietnamez","vietnamezul":"vietnamez","vietnamezule":"vietnamez","vietnamezului":"vietnamez","vietuia":"viețui","vietuiai":"viețui","vietuiam":"viețui","vietuiati":"viețui","vietuiau":"viețui","vietuiesc":"viețui","vietuieste":"viețui","vietuiesti":"viețui","vietuii":"viețui","vietuim":"viețui","vietuind":"viețui","vietuira":"viețui","vietuiram":"viețui","vietuirati":"viețui","vietuirea":"viețuire","vietuiri":"viețuire","vietuirii":"viețuire","vietuirile":"viețuire","vietuirilor":"viețuire","vietuise":"viețui","vietuisem":"viețui","vietuisera":"viețui","vietuiseram":"viețui","vietuiserati":"viețui","vietuisesi":"viețui","vietuisi":"viețui","vietuit":"viețui","vietuitatea":"viețuitate","vietuitati":"viețuitate","vietuitatii":"viețuitate","vietuiti":"viețui","vietuitoare":"viețuitor","vietuitoarea":["viețuitoarea","viețuitoare","viețuitoarea","viețuitor"],"vietuitoarei":"viețuitoare","vietuitoarele":["viețuitoarele","viețuitoare","viețuitoarele","viețuitor"],"vietuitoarelor":"viețuitoare","vietuitori":"viețuitor","vietuitorii":"viețuitor","vietuitorul":"viețuitor","viez":"via","viezatoare":"viezător","viezatoarea":"viezător","viezatoarele":"viezător","viezatori":"viezător","viezatorii":"viezător","viezatorul":"viezător","viezatorule":"viezător","viezatorului":"viezător","viezi":"via","viezunia":"viezunie","viezuniei":"viezunie","viezunii":"viezunie","viezuniile":"viezunie","viezuniilor":"viezunie","viezurele":"viezure","viezurelui":"viezure","viezuri":"viezure","viezurii":"viezure","viezurilor":"viezure","viezurine":"viezurină","viezurinei":"viezurină","viezurinele":"viezurină","viezurinelor":"viezurină","viezuristea":"viezuriște","viezuristi":"viezuriște","viezuristii":"viezuriște","viezuristile":"viezuriște","viezuristilor":"viezuriște","viezuroaice":"viezuroaică","viezuroaicei":"viezuroaică","viezuroaicele":"viezuroaică","viezuroaicelor":"viezuroaică","viezuroiul":"viezuroi","viezuroiule":"viezuroi","viezuroiului":"viezuroi","vifora":"viforî","viforand":"viforî","viforarea":"viforâre","viforari":"viforâre","viforarii":"viforâre","viforarile":"viforâre","viforarilor":"viforâre","viforase":"viforî","viforaste":"viforî","viforat":"viforî","viforateca":["viforatecă","viforatec","viforateca","viforatec"],"viforatece":"viforatec","viforatecele":"viforatec","viforateci":"viforatec","viforatecii":"viforatec","viforatecul":"viforatec","viforatica":["viforatică","viforatic","viforatica","viforatic"],"viforatice":"viforatic","viforaticele":"viforatic","viforatici":"viforatic","viforaticii":"viforatic","viforaticul":"viforatic","vifore":"vifor","viforele":["viforele","vifor","viforele","viforeală"],"viforelei":"viforeală","viforelele":"viforeală","viforelelor":"viforeală","viforeli":"viforeală","viforelor":"vifor","viforelul":"viforel","viforelule":"viforel","viforelului":"viforel","vifornite":"viforniță","vifornitei":"viforniță","vifornitele":"viforniță","vifornitelor":"viforniță","viforoasa":["viforoasă","viforos","viforoasa","viforos"],"viforoase":"viforos","viforoasele":"viforos","viforosi":"viforos","viforosii":"viforos","viforosul":"viforos","viforul":"vifor","viforule":"vifor","viforului":"vifor","vigavorul":"vigavor","vigavorule":"vigavor","vigavorului":"vigavor","vighilarea":"vighilare","vighilari":"vighilare","vighilarii":"vighilare","vigilenta":["vigilentă","vigilent","vigilenta","vigilent"],"vigilente":["vigilente","vigilent","vigilențe","vigilență"],"vigilentei":"vigilență","vigilentele":["vigilentele","vigilent","vigilențele","vigilență"],"vigilentelor":"vigilență","vigilenti":"vigilent","vigilentii":"vigilent","vigilentul":"vigilent","vignete":"vignetă","vignetei":"vignetă","vignetele":"vignetă","vignetelor":"vignetă","vigoarea":"vigoare","vigoari":"vigoare","vigoarii":"vigoare","vigonia":"vigonie","vigoniei":"vigonie","vigonii":"vigonie","vigoniile":"vigonie","vigoniilor":"vigonie","vigul":"vig","vigule":"vig","vigului":"vig","viguri":"vig","vigurile":"vig","vigurilor":"vig","viguroasa":["viguroasă","viguros","viguroasa","viguros"],"viguroase":"viguros","viguroasele":"viguros","vigurosi":"viguros","vigurosii":"viguros","vigurosul":"viguros","vigurozitatea":"vigurozitate","vigurozitati":"vigurozitate","vigurozitatii":"vigurozitate","vigutul":"viguț","vigutule":"viguț","vigutului":"viguț","vihore":"vihor","vihorele":"vihor","vihorelor":"vihor","vihorul":"vihor","vihorule":"vihor","vihorului":"vihor","vii":["vii","veni","vii","vie","vii","viu"],"viiariu":"vier","viiciunea":"viiciune","viiciuni":"viiciune","viiciunii":"viiciune","viii":"viu","viile":["viile","vie","viile","viu"],"viilor":"vie","viind":["viind","via","viind","vie"],"viisoare":"viișoară","viisoarei":"viișoară","viisoarele":"viișoară","viisoarelor":"viișoară","viitoare":"viitor","viitoarea":["viitoarea","viitoare","viitoarea","viitor"],"viitoarei":"viitoare","viitoarele":["viitoarele","viitoare","viitoarele","viitor"],"viitoarelor":"viitoare","viitori":"viitor","viitoria":"viitoriu","viitorie":"viitoriu","viitorii":["viitorii","viitor","viitorii","viitoriu"],"viitoriii":"viitoriu","viitoriile":"viitoriu","viitorimea":"viitorime","viitorimi":"viitorime","viitorimii":"viitorime","viitoriste":"viitoristă","viitoristei":"viitoristă","viitoristele":"viitoristă","viitoristelor":"viitoristă","viitoristi":"viitorist","viitoristii":"viitorist","viitoristilor":"viitorist","viitoristul":"viitorist","viitoristule":"viitorist","viitoristului":"viitorist","viitoriul":"viitoriu","viitorologe":"viitorologă","viitorologei":"viitorologă","viitorologele":"viitorologă","viitorologelor":"viitorologă","viitorologi":"viitorolog","viitorologia":"viitorologie","viitorologiei":"viitorologie","viitorologii":["viitorologii","viitorolog","viitorologii","viitorologie"],"viitorologilor":"viitorolog","viitorologul":"viitorolog","viitorologule":"viitorolog","viitorologului":"viitorolog","viitorul":"viitor","viitorule":"viitor","viitorului":"viitor","viitoruri":"viitor","viitorurile":"viitor","viitorurilor":"viitor","viituri":"viitură","viiturii":"viitură","viiturile":"viitură","viiturilor":"viitură","vijelia":"vijelie","vijeliei":"vijelie","vijelii":"vijelie","vijeliile":"vijelie","vijeliilor":"vijelie","vijelioasa":["vijelioasă","vijelios","vijelioasa","vijelios"],"vijelioase":"vijelios","vijelioasele":"vijelios","vijeliosi":"vijelios","vijeliosii":"vijelios","vijeliosul":"vijelios","vikingi":"viking","vikingii":"viking","vikingilor":"viking","vikingul":"viking","vikingule":"viking","vikingului":"viking","vila":["vilă","vil","vila","vil"],"vilaiete":"vilaiet","vilaietele":"vilaiet","vilaietelor":"vilaiet","vilaietul":"vilaiet","vilaietule":"vilaiet","vilaietului":"vilaiet","vilanele":"vilanelă","vilanelei":"vilanelă","vilanelele":"vilanelă","vilanelelor":"vilanelă","vilbrochenul":"vilbrochen","vilbrochenule":"vilbrochen","vilbrochenului":"vilbrochen","vilcu":"Vâlcu","vile":["vile","vil","vile","vilă"],"vileagul":"vileag","vileagule":"vileag","vileagului":"vileag","vileaguri":"vileag","vileagurile":"vileag","vileagurilor":"vileag","vilegiaturai":"vilegiatura","vilegiaturam":["vilegiaturăm","vilegiatura","vilegiaturam","vilegiatura"],"vilegiaturand":"vilegiatura","vilegiaturara":"vilegiatura","vilegiaturaram":"vilegiatura","vilegiaturarati":"vilegiatura","vilegiaturase":"vilegiatura","vilegiaturasem":"vilegiatura","vilegiaturasera":"vilegiatura","vilegiaturaseram":"vilegiatura","vilegiaturaserati":"vilegiatura","vilegiaturasesi":"vilegiatura","vilegiaturasi":"vilegiatura","vilegiaturat":"vilegiatura","vilegiaturati":"vilegiatura","vilegiaturau":"vilegiatura","vilegiatureaza":"vilegiatura","vilegiaturez":"vilegiatura","vilegiaturezi":"vilegiatura","vilegiaturi":"vilegiatură","vilegiaturii":"vilegiatură","vilegiaturile":"vilegiatură","vilegiaturilor":"vilegiatură","vilegiaturiste":"vilegiaturistă","vilegiaturistei":"vilegiaturistă","vilegiaturistele":"vilegiaturistă","vilegiaturistelor":"vilegiaturistă","vilegiaturisti":"vilegiaturist","vilegiaturistii":"vilegiaturist","vilegiaturistilor":"vilegiaturist","vilegiaturistul":"vilegiaturist","vilegiaturistule":"vilegiaturist","vilegiaturistului":"vilegiaturist","vilei":"vilă","vilele":["vilele","vil","vilele","vilă"],"vilelor":"vilă","vilenia":"vilenie","vileniei":"vilenie","vilenii":"vilenie","vili":"vil","viligiaturi":"viligiatură","viligiaturii":"viligiatură","viligiaturile":"viligiatură","viligiaturilor":"viligiatură","viligiaturiste":"viligiaturistă","viligiaturistei":"viligiaturistă","viligiaturistele":"viligiaturistă","viligiaturistelor":"viligiaturistă","viligiaturisti":"viligiaturist","viligiaturistii":"viligiaturist","viligiaturistilor":"viligiaturist","viligiaturistul":"viligiaturist","viligiaturistule":"viligiaturist","viligiaturistului":"viligiaturist","vilii":"vil","vilisoare":"vilișoară","vilisoarei":"vilișoară","viloasa":["viloasă","vilos","viloasa","vilos"],"viloase":"vilos","viloasele":"vilos","vilosi":"vilos","vilosii":"vilos","vilosul":"vilos","vilozitatea":"vilozitate","vilozitati":"vilozitate","vilozitatii":"vilozitate","vilozitatile":"vilozitate","vilozitatilor":"vilozitate","vilul":"vil","vin":"veni","vina":["vînă","vână","vină","veni"],"vina de hac":"veni de hac","vinari":"vinar","vinaria":["vinaria","vinarie","vinăria","vinărie"],"vinariceri":"vinăricer","vinaricerii":"vinăricer","vinaricerilor":"vinăricer","vinaricerul":"vinăricer","vinaricerule":"vinăricer","vinaricerului":"vinăricer","vinariciul":"vinărici","vinariciule":"vinărici","vinariciului":"vinărici","vinariciuri":"vinărici","vinariciurile":"vinărici","vinariciurilor":"vinărici","vinariei":["vinariei","vinarie","vinăriei","vinărie"],"vinarii":["vinarii","vinar","vinarii","vinarie","vinării","vinărie"],"vinariile":"vinărie","vinariilor":"vinărie","vinarilor":"vinar","vinarite":["vinarițe","vinariță","vinărițe","vinăriță"],"vinaritei":["vinariței","vinariță","vinăriței","vinăriță"],"vinaritele":"vinariță","vinaritelor":"vinariță","vinaritul":"vinărit","vinaritule":"vinărit","vinaritului":"vinărit","vinarituri":"vinărit","vinariturile":"vinărit","vinariturilor":"vinărit","vinarsul":"vinars","vinarsule":"vinars","vinarsului":"vinars","vinarsuri":"vinars","vinarsurile":"vinars","vinarsurilor":"vinars","vinarul":"vinar","vinarule":"vinar","vinarului":"vinar","vinasul":"vinaș","vinasule":"vinaș","vinasului":"vinaș","vinatul":"vinaț","vinatule":"vinaț","vinatului":"vinaț","vinaturi":"vinaț","vinaturile":"vinaț","vinaturilor":"vinaț","vinc":"vince","vincand":"vince","vincea":"vince","vinceai":"vince","vinceam":"vince","vinceati":"vince","vinceau":"vince","vincele":"vinceală","vincelei":"vinceală","vincelele":"vinceală","vincelelor":"vinceală","vincem":"vince","vinceti":"vince","vinci":"vince","vincibila":["vincibilă","vincibil","vincibila","vincibil"],"vincibile":"vincibil","vincibilele":"vincibil","vincibili":"vincibil","vincibilii":"vincibil","vincibilul":"vincibil","vincluul":"vinclu","vincluule":"vinclu","vincluului":"vinclu","vindea":"vinde","vindeai":"vinde","vindeam":"vinde","vindeati":"vinde","vindeau":"vinde","vindec":"vindeca","vindecabila":["vindecabilă","vindecabil","vindecabila","vindecabil"],"vindecabile":"vindecabil","vindecabilele":"vindecabil","vindecabili":"vindecabil","vindecabilii":"vindecabil","vindecabilul":"vindecabil","vindecacioasa":["vindecăcioasă","vindecăcios","vindecăcioasa","vindecăcios"],"vindecacioase":"vindecăcios","vindecacioasele":"vindecăcios","vindecaciosi":"vindecăcios","vindecaciosii":"vindecăcios","vindecaciosul":"vindecăcios","vindecaciunea":"vindecăciune","vindecaciuni":"vindecăciune","vindecaciunii":"vindecăciune","vindecai":"vindeca","vindecam":["vindecăm","vindeca","vindecam","vindeca"],"vindecamantul":"vindecământ","vindecamantule":"vindecământ","vindecamantului":"vindecământ","vindecand":"vindeca","vindecara":"vindeca","vindecaram":"vindeca","vindecarati":"vindeca","vindecarea":"vindecare","vindecari":"vindecare","vindecarii":"vindecare","vindecarile":"vindecare","vindecarilor":"vindecare","vindecase":"vindeca","vindecasem":"vindeca","vindecasera":"vindeca","vindecaseram":"vindeca","vindecaserati":"vindeca","vindecasesi":"vindeca","vindecasi":"vindeca","vindecat":"vindeca","vindecata":["vindecată","vindecat","vindecata","vindecat"],"vindecate":"vindecat","vindecatele":"vindecat","vindecati":["vindecați","vindeca","vindecați","vindecat"],"vindecatii":"vindecat","vindecatoare":"vindecător","vindecatoarea":"vindecător","vindecatoarele":"vindecător","vindecatori":"vindecător","vindecatorii":"vindecător","vindecatorilor":"vindecător","vindecatorul":"vindecător","vindecatorule":"vindecător","vindecatorului":"vindecător","vindecatul":"vindecat","vindecau":"vindeca","vindece":"vindeca","vindeceaua":"vindecea","vindecele":"vindecea","vindecelei":"vindecea","vindecelele":"vindecea","vindecelelor":"vindecea","vindeci":"vindeca","vindecul":"vindec","vindecule":"vindec","vindecului":"vindec","vindecuri":"vindec","vindecurile":"vindec","vindecurilor":"vindec","vindem":"vinde","vinderea":"vindere","vinderei":"vindereu","vindereii":"vindereu","vindereilor":"vindereu","vindereul":"vindereu","vindereule":"vindereu","vindereului":"vindereu","vinderi":"vindere","vinderii":"vindere","vinderile":"vindere","vinderilor":"vindere","vindeti":"vinde","vindiacul":"vindiac","vindiacule":"vindiac","vindiacului":"vindiac","vindiacuri":"vindiac","vindiacurile":"vindiac","vindiacurilor":"vindiac","vindicativa":["vindicativă","vindicativ","vindicativa","vindicativ"],"vindicative":"vindicativ","vindicativele":"vindicativ","vindicativi":"vindicativ","vindicativii":"vindicativ","vindicativul":"vindicativ","vindicte":"vindictă","vindictei":"vindictă","vindictele":"vindictă","vindictelor":"vindictă","vindirei":"vindireu","vindireii":"vindireu","vindireilor":"vindireu","vindireuul":"vindireu","vindireuule":"vindireu","vindireuului":"vindireu","vine":["vine","vână","vine","veni"],"vine de hac":"veni de hac","vine pe nepusa masa":"veni pe nepusă masă","vineciora":["vinecioră","vinecior","vineciora","vinecior"],"vineciore":"vinecior","vineciorele":"vinecior","vineciori":"vinecior","vineciorii":"vinecior","vineciorul":"vinecior","vinegrete":"vinegretă","vinegretei":"vinegretă","vinegretele":"vinegretă","vinegretelor":"vinegretă","vinei":"vână","vinele":"vână","vinelor":"vână","vinerite":"vineriță","vineritei":"vineriță","vineritele":"vineriță","vineritelor":"vineriță","vinete":["vinete","vânăt","vinete","vânătă"],"vineteaua":"vinețea","vinetei":"vânătă","vinetela":["vinețelă","vinețel","vinețela","vinețel"],"vinetele":["vinetele","vânăt","vinetele","vânătă","vinețéle","vinețea","vinețele","vinețel","vinețele","vinețică"],"vinetelei":["vinețélei","vinețea","vinețelei","vinețică"],"vinetelele":["vinețélele","vinețea","vinețelele","vinețel","vinețelele","vinețică"],"vinetelelor":["vinețélelor","vinețea","vinețelelor","vinețică"],"vineteli":["vinețeli","vinețeală","vinețeli","vinețel"],"vinetelii":["vinețelii","vinețeală","vinețelii","vinețel"],"vinetelile":"vinețeală","vinetelilor":"vinețeală","vinetelor":"vânătă","vinetelul":"vinețel","vineti":"vânăt","vinetia":"vinețiu","vinetie":"vinețiu","vinetii":["vineții","vânăt","vineții","vinețiu"],"vinetiii":"vinețiu","vinetiile":"vinețiu","vinetita":["vinețită","vinețit","vinețita","vinețit"],"vinetite":"vinețit","vinetitele":"vinețit","vinetiti":"vinețit","vinetitii":"vinețit","vinetitul":"vinețit","vinetiul":"vinețiu","ving":"vinge","vinga":"vinge","vingalace":["vingalace","vingalac","vingălace","vingălac"],"vingalacele":["vingalacele","vingalac","vingălacele","vingălac"],"vingalacelor":["vingalacelor","vingalac","vingălacelor","vingălac"],"vingalacul":["vingalacul","vingalac","vingălacul","vingălac"],"vingalacule":["vingalacule","vingalac","vingălacule","vingălac"],"vingalacului":["vingalacului","vingalac","vingălacului","vingălac"],"vingand":"vinge","vingatorul":"vingător","vingatorule":"vingător","vingatorului":"vingător","vingea":"vinge","vingeai":"vinge","vingeam":"vinge","vingeati":"vinge","vingeau":"vinge","vingem":"vinge","vingerea":"vingere","vingeri":"vingere","vingerii":"vingere","vingerile":"vingere","vingerilor":"vingere","vingeti":"vinge","vingherci":"vinghercă","vinghercii":"vinghercă","vinghercile":"vinghercă","vinghercilor":"vinghercă","vingi":"vinge","vini":"vină","vinicola":["vinicolă","vinicol","vinicola","vinicol"],"vinicole":"vinicol","vinicolele":"vinicol","vinicoli":"vinicol","vinicolii":"vinicol","vinicolul":"vinicol","viniete":"vinietă","vinietei":"vinietă","vinietele":"vinietă","vinietelor":"vinietă","vinietiste":"vinietistă","vinietistei":"vinietistă","vinietistele":"vinietistă","vinietistelor":"vinietistă","vinietisti":"vinietist","vinietistii":"vinietist","vinietistilor":"vinietist","vinietistul":"vinietist","vinietistule":"vinietist","vinietistului":"vinietist","vinifera":["viniferă","vinifer","vinifera","vinifer"],"vinifere":"vinifer","viniferele":"vinifer","viniferi":"vinifer","viniferii":"vinifer","viniferul":"vinifer","vinific":"vinifica","vinificai":"vinifica","vinificam":["vinificăm","vinifica","vinificam","vinifica"],"vinificand":"vinifica","vinificara":"vinifica","vinificaram":"vinifica","vinificarati":"vinifica","vinificarea":"vinificare","vinificari":"vinificare","vinificarii":"vinificare","vinificarile":"vinificare","vinificarilor":"vinificare","vinificase":"vinifica","vinificasem":"vinifica","vinificasera":"vinifica","vinificaseram":"vinifica","vinificaserati":"vinifica","vinificasesi":"vinifica","vinificasi":"vinifica","vinificat":"vinifica","vinificati":"vinifica","vinificatia":"vinificație","vinificatiei":"vinificație","vinificatii":"vinificație","vinificatiile":"vinificație","vinificatiilor":"vinificație","vinificatiunea":"vinificațiune","vinificatiuni":"vinificațiune","vinificatiunii":"vinificațiune","vinificatiunile":"vinificațiune","vinificatiunilor":"vinificațiune","vinificatoarea":"vinificatoare","vinificatoarei":"vinificatoare","vinificatoarele":"vinificatoare","vinificatoarelor":"vinificatoare","vinificatori":"vinificator","vinificatorii":"vinificator","vinificatorilor":"vinificator","vinificatorul":"vinificator","vinificatorule":"vinificator","vinificatorului":"vinificator","vinificau":"vinifica","vinifice":"vinifica","vinifici":"vinifica","vinii":"vină","vinilacetilene":"vinilacetilenă","vinilacetilenei":"vinilacetilenă","vinile":"vină","vinilica":["vinilică","vinilic","vinilica","vinilic"],"vinilice":"vinilic","vinilicele":"vinilic","vinilici":"vinilic","vinilicii":"vinilic","vinilicul":"vinilic","vinilor":"vină","vinilul":"vinil","vinilule":"vinil","vinilului":"vinil","viniluri":"vinil","vinilurile":"vinil","vinilurilor":"vinil","vinimeriuul":"vinimeriu","vinimeriuule":"vinimeriu","vinimeriuului":"vinimeriu","vinisoare":["vinișoare","vinișoară","vinișoare","vinișor"],"vinisoarei":"vinișoară","vinisoarele":"vinișoară","vinisoarelor":"vinișoară","vinisore":"vinișor","vinisorele":"vinișor","vinisorelor":"vinișor","vinisorul":"vinișor","vinisorule":"vinișor","vinisorului":"vinișor","viniture":"vinitură","viniturei":"vinitură","viniturele":"vinitură","viniturelor":"vinitură","vinituri":"vinitură","vino":"veni","vinoaice":"vinoaică","vinoaicei":"vinoaică","vinoasa":["vinoasă","vinos","vinoasa","vinos"],"vinoase":"vinos","vinoasele":"vinos","vinogradul":"vinograd","vinogradule":"vinograd","vinogradului":"vinograd","vinograduri":"vinograd","vinogradurile":"vinograd","vinogradurilor":"vinograd","vinometruul":"vinometru","vinometruule":"vinometru","vinometruului":"vinometru","vinosi":"vinos","vinosii":"vinos","vinosul":"vinos","vinoteci":"vinotecă","vinotecii":"vinotecă","vinotecile":"vinotecă","vinotecilor":"vinotecă","vinovata":["vinovată","vinovat","vinovata","vinovat"],"vinovate":"vinovat","vinovatea":"vinovăți","vinovateai":"vinovăți","vinovateam":"vinovăți","vinovateati":"vinovăți","vinovateau":"vinovăți","vinovatele":"vinovat","vinovatesc":"vinovăți","vinovateste":"vinovăți","vinovatesti":"vinovăți","vinovati":"vinovat","vinovatia":"vinovăție","vinovaticioasa":["vinovățicioasă","vinovățicios","vinovățicioasa","vinovățicios"],"vinovaticioase":"vinovățicios","vinovaticioasele":"vinovățicios","vinovaticiosi":"vinovățicios","vinovaticiosii":"vinovățicios","vinovaticiosul":"vinovățicios","vinovatiei":"vinovăție","vinovatii":["vinovații","vinovat","vinovății","vinovăți","vinovății","vinovăție"],"vinovatiile":"vinovăție","vinovatiilor":"vinovăție","vinovatim":"vinovăți","vinovatind":"vinovăți","vinovatira":"vinovăți","vinovatiram":"vinovăți","vinovatirati":"vinovăți","vinovatise":"vinovăți","vinovatisem":"vinovăți","vinovatisera":"vinovăți","vinovatiseram":"vinovăți","vinovatiserati":"vinovăți","vinovatisesi":"vinovăți","vinovatisi":"vinovăți","vinovatit":"vinovăți","vinovatiti":"vinovăți","vinovatul":"vinovat","vinozitatea":"vinozitate","vinozitati":"vinozitate","vinozitatii":"vinozitate","vins":["vins","vince","vins","vinge"],"vinse":["vinse","vince","vinse","vinge"],"vinsei":["vinsei","vince","vinsei","vinge"],"vinsera":["vinseră","vince","vinseră","vinge"],"vinseram":["vinserăm","vince","vinserăm","vinge"],"vinserati":["vinserăți","vince","vinserăți","vinge"],"vinsese":["vinsese","vince","vinsese","vinge"],"vinsesem":["vinsesem","vince","vinsesem","vinge"],"vinsesera":["vinseseră","vince","vinseseră","vinge"],"vinseseram":["vinseserăm","vince","vinseserăm","vinge"],"vinseserati":["vinseserăți","vince","vinseserăți","vinge"],"vinsesesi":["vinseseși","vince","vinseseși","vinge"],"vinsesi":["vinseși","vince","vinseși","vinge"],"vinta":"vântă","vinte":"vântă","vintei":"vântă","vintele":"vântă","vinteleri":"vințeler","vintelerii":"vințeler","vintelerilor":"vințeler","vintelerul":"vințeler","vintelerule":"vințeler","vintelerului":"vințeler","vintelor":"vântă","vintile":"vintil","vintilele":"vintil","vintilelor":"vintil","vintilul":"vintil","vintilule":"vintil","vintilului":"vintil","vintrea":"vintre","vintreaua":"vintrea","vintrei":"vintre","vintrele":["vintrele","vintre","vintrele","vintrea"],"vintrelei":"vintrea","vintrelele":"vintrea","vintrelelor":"vintrea","vintrelor":"vintre","vintrisce":"vintrișcă","vintriscei":"vintrișcă","vintul":"vînt","vintule":"vînt","vintului":"vînt","vintura":"vântura","vinturi":"vînt","vinturile":"vînt","vinturilor":"vînt","vinuia":"vinui","vinuiai":"vinui","vinuiam":"vinui","vinuiati":"vinui","vinuiau":"vinui","vinuiesc":"vinui","vinuieste":"vinui","vinuiesti":"vinui","vinuii":"vinui","vinuim":"vinui","vinuind":"vinui","vinuira":"vinui","vinuiram":"vinui","vinuirati":"vinui","vinuirea":"vinuire","vinuiri":"vinuire","vinuirii":"vinuire","vinuirile":"vinuire","vinuirilor":"vinuire","vinuise":"vinui","vinuisem":"vinui","vinuisera":"vinui","vinuiseram":"vinui","vinuiserati":"vinui","vinuisesi":"vinui","vinuisi":"vinui","vinuit":"vinui","vinuita":["vinuită","vinuit","vinuita","vinuit"],"vinuite":"vinuit","vinuitele":"vinuit","vinuiti":["vinuiți","vinui","vinuiți","vinuit"],"vinuitii":"vinuit","vinuitul":"vinuit","vinul":"vin","vinule":"vin","vinulete":"vinuleț","vinuletele":"vinuleț","vinuletelor":"vinuleț","vinuletul":"vinuleț","vinuletule":"vinuleț","vinuletului":"vinuleț","vinului":"vin","vinuri":"vin","vinuri albe":"vin alb","vinuri fierte":"vin fiert","vinuri negre":"vin negru","vinuri rosii":"vin roșu","vinurile":"vin","vinurilor":"vin","vinute":"vinuț","vinutele":"vinuț","vinutelor":"vinuț","vinutul":"vinuț","vinutule":"vinuț","vinutului":"vinuț","vinuturi":"vinuț","vinzi":"vinde","vioaia":"vioi","vioaie":"vioi","vioaiele":"vioi","vioare":"vioară","vioarei":"vioară","vioarele":"vioară","vioarelor":"vioară","vioiciunea":"vioiciune","vioiciuni":"vioiciune","vioiciunii":"vioiciune","vioii":"vioi","vioitatea":"vioitate","vioitati":"vioitate","vioitatii":"vioitate","vioiul":"vioi","violabila":["violabilă","violabil","violabila","violabil"],"violabile":"violabil","violabilele":"violabil","violabili":"violabil","violabilii":"violabil","violabilitatea":"violabilitate","violabilitati":"violabilitate","violabilitatii":"violabilitate","violabilul":"violabil","violace":"violaceu","violacei":"violaceu","violaceii":"violaceu","violaceile":"violaceu","violaceilor":"violaceu","violai":"viola","violam":["violăm","viola","violam","viola"],"violand":"viola","violara":"viola","violaram":"viola","violarati":"viola","violarea":"violare","violari":"violare","violarii":"violare","violarile":"violare","violarilor":"violare","violase":"viola","violasem":"viola","violasera":"viola","violaseram":"viola","violaserati":"viola","violasesi":"viola","violasi":"viola","violat":"viola","violati":"viola","violatia":"violație","violatiei":"violație","violatii":"violație","violatiile":"violație","violatiilor":"violație","violatiunea":"violațiune","violatiuni":"violațiune","violatiunii":"violațiune","violatiunile":"violațiune","violatiunilor":"violațiune","violatoarea":"violatoare","violatoarei":"violatoare","violatoarele":"violatoare","violatoarelor":"violatoare","violatori":"violator","violatorii":"violator","violatorilor":"violator","violatorul":"violator","violatorule":"violator","violatorului":"violator","violau":"viola","viole":"violă","violeaza":"viola","violei":"violă","violele":"violă","violelor":"violă","violenta":["violentă","violent","violenta","violent"],"violentai":"violenta","violentam":["violentăm","violenta","violentam","violenta"],"violentand":"violenta","violentara":"violenta","violentaram":"violenta","violentarati":"violenta","violentarea":"violentare","violentari":"violentare","violentarii":"violentare","violentarile":"violentare","violentarilor":"violentare","violentase":"violenta","violentasem":"violenta","violentasera":"violenta","violentaseram":"violenta","violentaserati":"violenta","violentasesi":"violenta","violentasi":"violenta","violentat":"violenta","violentata":["violentată","violentat","violentata","violentat"],"violentate":"violentat","violentatele":"violentat","violentati":["violentați","violenta","violentați","violentat"],"violentatii":"violentat","violentatul":"violentat","violentau":"violenta","violente":["violente","violent","violențe","violență"],"violente domestice":"violență domestică","violente sexuale":"violență sexuală","violenteaza":"violenta","violentei":"violență","violentele":["violentele","violent","violențele","violență"],"violentelor":"violență","violentez":"violenta","violentezi":"violenta","violenti":"violent","violentii":"violent","violentul":"violent","violeta":["violetă","violet","violeta","violet"],"violete":["violete","violet","violete","violetă"],"violetei":"violetă","violetele":["violetele","violet","violetele","violetă"],"violetelor":"violetă","violeti":"violet","violetii":"violet","violetul":"violet","violetule":"violet","violetului":"violet","violez":"viola","violezi":"viola","violicea":"violice","violici":"violice","violicii":"violice","violicile":"violice","violicilor":"violice","violine":"violină","violinei":"violină","violinele":"violină","violinelor":"violină","violinte":"violință","violintei":"violință","violintele":"violință","violintelor":"violință","violoncele":"violoncel","violoncelele":"violoncel","violoncelelor":"violoncel","violonceliste":"violoncelistă","violoncelistei":"violoncelistă","violoncelistele":"violoncelistă","violoncelistelor":"violoncelistă","violoncelisti":"violoncelist","violoncelistii":"violoncelist","violoncelistilor":"violoncelist","violoncelistul":"violoncelist","violoncelistule":"violoncelist","violoncelistului":"violoncelist","violoncelul":"violoncel","violoncelule":"violoncel","violoncelului":"violoncel","violoniste":"violonistă","violonistei":"violonistă","violonistele":"violonistă","violonistelor":"violonistă","violonisti":"violonist","violonistica":["violonistică","violonistic","violonistica","violonistic"],"violonistice":"violonistic","violonisticele":"violonistic","violonistici":"violonistic","violonisticii":"violonistic","violonisticul":"violonistic","violonistii":"violonist","violonistilor":"violonist","violonistul":"violonist","violonistule":"violonist","violonistului":"violonist","violonul":"violon","violonule":"violon","violonului":"violon","violul":"viol","violule":"viol","violului":"viol","violuri":"viol","violurile":"viol","violurilor":"viol","vioreaua":"viorea","viorela":["viorelă","viorel","viorela","viorel"],"viorele":["viorele","viorea","viorele","viorel","viorele","viorică"],"viorelei":["viorelei","viorea","viorelei","viorică"],"viorelele":["viorelele","viorea","viorelele","viorel","viorelele","viorică"],"viorelelor":["viorelelor","viorea","viorelelor","viorică"],"vioreli":"viorel","viorelii":"viorel","viorelul":"viorel","viori":"vioară","vioria":"vioriu","viorie":"vioriu","viorii":["viorii","vioară","viorii","vioriu"],"vioriii":"vioriu","vioriile":"vioriu","viorile":"vioară","viorilor":"vioară","vioriste":"vioristă","vioristei":"vioristă","vioristele":"vioristă","vioristelor":"vioristă","vioristi":"viorist","vioristii":"viorist","vioristilor":"viorist","vioristul":"viorist","vioristule":"viorist","vioristului":"viorist","vioriul":"vioriu","viosia":"vioșie","viosiei":"vioșie","viosii":"vioșie","viosiile":"vioșie","viosiilor":"vioșie","viosimea":"vioșime","viosimi":"vioșime","viosimii":"vioșime","vipere":"viperă","viperei":"viperă","viperele":"viperă","viperelor":"viperă","viperina":["viperină","viperin","viperina","viperin"],"viperine":"viperin","viperinele":"viperin","viperini":"viperin","viperinii":"viperin","viperinul":"viperin","vipia":"vipie","vipiei":"vipie","vipii":"vipie","vipiile":"vipie","vipiilor":"vipie","vipiste":"vipiscă","vipistei":"vipiscă","vipistele":"vipiscă","vipistelor":"vipiscă","vipisti":"vipiscă","viptul":"vipt","viptule":"vipt","viptului":"vipt","vipturi":"vipt","vipturile":"vipt","vipturilor":"vipt","vipusti":"vipușcă","viragii":"viragiu","viragiile":"viragiu","viragiilor":"viragiu","viragiuul":"viragiu","viragiuule":"viragiu","viragiuului":"viragiu","virai":"vira","viraje":"viraj","virajele":"viraj","virajelor":"viraj","virajul":"viraj","virajule":"viraj","virajului":"viraj","virala":["virală","viral","virala","viral"],"virale":"viral","viralele":"viral","virali":"viral","viralii":"viral","viralul":"viral","viram":["virăm","vie","virăm","vira","viram","vira"],"viramente":"virament","viramentele":"virament","viramentelor":"virament","viramentul":"virament","viramentule":"virament","viramentului":"virament","virana":["virană","viran","virana","viran"],"virand":"vira","virane":"viran","viraneaua":"viranea","viranele":["viranele","viran","viranele","viranea"],"viranelei":"viranea","viranelele":"viranea","viranelelor":"viranea","virani":"viran","viranii":"viran","viranul":"viran","virara":"vira","viraram":"vira","virarati":"vira","virase":"vira","virasem":"vira","virasera":"vira","viraseram":"vira","viraserati":"vira","virasesi":"vira","virasi":"vira","virat":"vira","virati":"vira","virau":"vira","vireaza":"vira","viremia":"viremie","viremiei":"viremie","viremii":"viremie","virescente":"virescență","virescentei":"virescență","virez":"vira","virezi":"vira","virf":"vârf","virgina":["virgină","virgin","virgina","virgin"],"virginala":["virginală","virginal","virginala","virginal"],"virginale":"virginal","virginalele":"virginal","virginali":"virginal","virginalii":"virginal","virginalul":"virginal","virgine":["virgine","virgin","virgine","virgină"],"virginei":"virgină","virginele":["virginele","virgin","virginele","virgină"],"virginelor":"virgină","virgini":"virgin","virginii":"virgin","virginitatea":"virginitate","virginitati":"virginitate","virginitatii":"virginitate","virginitatile":"virginitate","virginitatilor":"virginitate","virginul":"virgin","virgule":"virgulă","virgulei":"virgulă","virgulele":"virgulă","virgulelor":"virgulă","virgusul":"virguș","virgusule":"virguș","virgusului":"virguș","viridinul":"viridin","viridinule":"viridin","viridinului":"viridin","virigucioare":"virigucioară","virigucioarei":"virigucioară","virila":["virilă","viril","virila","viril"],"virile":"viril","virilele":"viril","virili":"viril","virilii":"viril","virilionul":"virilion","virilionule":"virilion","virilionului":"virilion","virilismul":"virilism","virilismule":"virilism","virilismului":"virilism","virilitatea":"virilitate","virilitati":"virilitate","virilitatii":"virilitate","virilizai":"viriliza","virilizam":["virilizăm","viriliza","virilizam","viriliza"],"virilizand":"viriliza","virilizara":"viriliza","virilizaram":"viriliza","virilizarati":"viriliza","virilizarea":"virilizare","virilizari":"virilizare","virilizarii":"virilizare","virilizarile":"virilizare","virilizarilor":"virilizare","virilizase":"viriliza","virilizasem":"viriliza","virilizasera":"viriliza","virilizaseram":"viriliza","virilizaserati":"viriliza","virilizasesi":"viriliza","virilizasi":"viriliza","virilizat":"viriliza","virilizati":"viriliza","virilizau":"viriliza","virilizeaza":"viriliza","virilizez":"viriliza","virilizezi":"viriliza","virilul":"viril","virnanti":"virnanț","virnantii":"virnanț","virnantilor":"virnanț","virnantul":"virnanț","virnantule":"virnanț","virnantului":"virnanț","viroage":"viroagă","viroagei":"viroagă","viroagele":"viroagă","viroagelor":"viroagă","virologe":"virologă","virologei":"virologă","virologele":"virologă","virologelor":"virologă","virologi":"virolog","virologia":"virologie","virologiei":"virologie","virologii":["virologii","virolog","virologii","virologie"],"virologilor":"virolog","virologul":"virolog","virologule":"virolog","virologului":"virolog","virotica":["virotică","virotic","virotica","virotic"],"virotice":"virotic","viroticele":"virotic","virotici":"virotic","viroticii":"virotic","viroticul":"virotic","viroze":"viroză","virozei":"viroză","virozele":"viroză","virozelor":"viroză","virtoasa":["virtoasă","virtos","virtoasa","virtos"],"virtoase":"virtos","virtoasele":"virtos","virtos":"vârtos","virtosi":"virtos","virtosii":"virtos","virtosul":"virtos","virtuala":["virtuală","virtual","virtuala","virtual"],"virtuale":"virtual","virtualea":"virtuale","virtualele":["virtualele","virtual","virtualele","virtuale"],"virtuali":["virtuali","virtual","virtuali","virtuale"],"virtualii":["virtualii","virtual","virtualii","virtuale"],"virtualitatea":"virtualitate","virtualitati":"virtualitate","virtualitatii":"virtualitate","virtualitatile":"virtualitate","virtualitatilor":"virtualitate","virtualizai":"virtualiza","virtualizam":["virtualizăm","virtualiza","virtualizam","virtualiza"],"virtualizand":"virtualiza","virtualizara":"virtualiza","virtualizaram":"virtualiza","virtualizarati":"virtualiza","virtualizarea":"virtualizare","virtualizari":"virtualizare","virtualizarii":"virtualizare","virtualizarile":"virtualizare","virtualizarilor":"virtualizare","virtualizase":"virtualiza","virtualizasem":"virtualiza","virtualizasera":"virtualiza","virtualizaseram":"virtualiza","virtualizaserati":"virtualiza","virtualizasesi":"virtualiza","virtualizasi":"virtualiza","virtualizat":"virtualiza","virtualizati":"virtualiza","virtualizau":"virtualiza","virtualizeaza":"virtualiza","virtualizez":"virtualiza","virtualizezi":"virtualiza","virtualul":"virtual","virtuoasa":["virtuoasă","virtuos","virtuoasa","virtuos"],"virtuoase":"virtuos","virtuoasele":"virtuos","virtuosi":"virtuos","virtuosii":"virtuos","virtuosul":"virtuos","virtuozi":"virtuoz","virtuozii":"virtuoz","virtuozilor":"virtuoz","virtuozitatea":"virtuozitate","virtuozitati":"virtuozitate","virtuozitatii":"virtuozitate","virtuozitatile":"virtuozitate","virtuozitatilor":"virtuozitate","virtuozul":"virtuoz","virtuozule":"virtuoz","virtuozului":"virtuoz","virtute":"vârtute","virtuti":"virtute","virulenta":["virulentă","virulent","virulenta","virulent"],"virulente":["virulente","virulent","virulențe","virulență"],"virulentei":"virulență","virulentele":["virulentele","virulent","virulențele","virulență"],"virulentelor":"virulență","virulenti":"virulent","virulentii":"virulent","virulentul":"virulent","virulicidul":"virulicid","virulicidule":"virulicid","virulicidului":"virulicid","virulicizi":"virulicid","virulicizile":"virulicid","virulicizilor":"virulicid","virusi":"virus","virusii":"virus","virusilor":"virus","virusologe":"virusologă","virusologei":"virusologă","virusologele":"virusologă","virusologelor":"virusologă","virusologi":"virusolog","virusologia":"virusologie","virusologiei":"virusologie","virusologii":["virusologii","virusolog","virusologii","virusologie"],"virusologilor":"virusolog","virusologul":"virusolog","virusologule":"virusolog","virusologului":"virusolog","virusul":"virus","virusule":"virus","virusului":"virus","virusuri":"virus","virusurile":"virus","virusurilor":"virus","vis":"vie","visai":"visa","visam":["visăm","visa","visam","visa"],"visand":"visa","visara":"visa","visaram":"visa","visarati":"visa","visarea":"visare","visari":"visare","visaria":"visărie","visariei":"visărie","visarii":["visării","visare","visării","visărie"],"visarile":"visare","visarilor":"visare","visase":"visa","visasem":"visa","visasera":"visa","visaseram":"visa","visaserati":"visa","visasesi":"visa","visasi":"visa","visat":"visa","visata":["visată","visat","visata","visat"],"visate":"visat","visatele":"visat","visati":["visați","visa","visați","visat"],"visatii":"visat","visatoarea":"visătoare","visatoarei":"visătoare","visatoarele":"visătoare","visatoarelor":"visătoare","visatori":"visător","visatoria":"visătorie","visatoriei":"visătorie","visatorii":["visătorii","visător","visătorii","visătorie"],"visatoriile":"visătorie","visatoriilor":"visătorie","visatorilor":"visător","visatorul":"visător","visatorule":"visător","visatorului":"visător","visatul":"visat","visau":"visa","visc":"vâsc","viscerala":["viscerală","visceral","viscerala","visceral"],"viscerale":"visceral","visceralele":"visceral","viscerali":"visceral","visceralii":"visceral","visceralul":"visceral","viscerele":"viscere","viscerelor":"viscere","visceroptoze":"visceroptoză","visceroptozei":"visceroptoză","visceroptozele":"visceroptoză","visceroptozelor":"visceroptoză","viscerotropa":["viscerotropă","viscerotrop","viscerotropa","viscerotrop"],"viscerotrope":"viscerotrop","viscerotropele":"viscerotrop","viscerotropi":"viscerotrop","viscerotropii":"viscerotrop","viscerotropul":"viscerotrop","viscoelastica":["viscoelastică","viscoelastic","viscoelastica","viscoelastic"],"viscoelastice":"viscoelastic","viscoelasticele":"viscoelastic","viscoelastici":"viscoelastic","viscoelasticii":"viscoelastic","viscoelasticitatea":"viscoelasticitate","viscoelasticitati":"viscoelasticitate","viscoelasticitatii":"viscoelasticitate","viscoelasticul":"viscoelastic","viscol":"viscoli","viscole":["viscole","viscol","viscole","viscoli"],"viscolea":"viscoli","viscoleai":"viscoli","viscoleam":"viscoli","viscoleati":"viscoli","viscoleau":"viscoli","viscolele":"viscol","viscoleli":"viscoleală","viscolelii":"viscoleală","viscolelile":"viscoleală","viscolelilor":"viscoleală","viscolelor":"viscol","viscolie":"viscoli","viscolii":"viscoli","viscolim":"viscoli","viscolind":"viscoli","viscolira":"viscoli","viscoliram":"viscoli","viscolirati":"viscoli","viscolirea":"viscolire","viscoliri":"viscolire","viscolirii":"viscolire","viscolirile":"viscolire","viscolirilor":"viscolire","viscolise":"viscoli","viscolisem":"viscoli","viscolisera":"viscoli","viscoliseram":"viscoli","viscoliserati":"viscoli","viscolisesi":"viscoli","viscolisi":"viscoli","viscolit":"viscoli","viscolita":["viscolită","viscolit","viscolita","viscolit"],"viscolite":"viscolit","viscolitele":"viscolit","viscoliti":["viscoliți","viscoli","viscoliți","viscolit"],"viscolitii":"viscolit","viscolitul":"viscolit","viscoliture":"viscolitură","viscoliturei":"viscolitură","viscoliturele":"viscolitură","viscoliturelor":"viscolitură","viscolituri":"viscolitură","viscoloasa":["viscoloasă","viscolos","viscoloasa","viscolos"],"viscoloase":"viscolos","viscoloasele":"viscolos","viscolosi":"viscolos","viscolosii":"viscolos","viscolosul":"viscolos","viscolul":"viscol","viscolule":"viscol","viscolului":"viscol","viscos":"vâscos","viscoze":"viscoză","viscozei":"viscoză","viscozele":"viscoză","viscozelor":"viscoză","viscozimetre":"viscozimetru","viscozimetrele":"viscozimetru","viscozimetrelor":"viscozimetru","viscozimetria":"viscozimetrie","viscozimetriei":"viscozimetrie","viscozimetrii":"viscozimetrie","viscozimetrul":"viscozimetru","viscozimetrule":"viscozimetru","viscozimetrului":"viscozimetru","viscozitate":"vâscozitate","viscozitatea":"viscozitate","viscozitati":"viscozitate","viscozitatii":"viscozitate","viscozitatile":"viscozitate","viscozitatilor":"viscozitate","viseaza":"visa","visecta":["visectă","visect","visecta","visect"],"visecte":"visect","visectele":"visect","visecti":"visect","visectii":"visect","visectul":"visect","visem":"vie","viseni":"vișen","visenii":"vișen","visenilor":"vișen","visenul":"vișen","visenule":"vișen","visenului":"vișen","visese":"vie","visez":"visa","visezi":"visa","visinapul":"vișinap","visinapule":"vișinap","visinapului":"vișinap","visinapuri":"vișinap","visinapurile":"vișinap","visinapurilor":"vișinap","visinari":"vișinar","visinarii":"vișinar","visinarilor":"vișinar","visinarul":"vișinar","visinarule":"vișinar","visinarului":"vișinar","visinate":"vișinată","visinatei":"vișinată","visinatele":"vișinată","visinatelor":"vișinată","visine":"vișină","visine salbatice":"vișină sălbatică","visineaua":"vișinea","visinei":["vișinei","vișină","vișinei","vișinel"],"visinele":["vișinele","vișină","vișinele","vișinea","vișinele","vișinică"],"visinelei":["vișinelei","vișinea","vișinelei","vișinică"],"visinelele":["vișinelele","vișinea","vișinelele","vișinică"],"visinelelor":["vișinelelor","vișinea","vișinelelor","vișinică"],"visineli":"vișinel","visinelii":"vișinel","visinelilor":"vișinel","visinelor":"vișină","visinelul":"vișinel","visinelule":"vișinel","visinelului":"vișinel","visinetul":"vișinet","visinetule":"vișinet","visinetului":"vișinet","visineturi":"vișinet","visineturile":"vișinet","visineturilor":"vișinet","visini":"vișin","visini salbatici":"vișin sălbatic","visinia":"vișiniu","visinie":"vișiniu","visinii":["vișinii","vișin","vișinii","vișiniu"],"visiniii":"vișiniu","visiniile":"vișiniu","visinilor":"vișin","visiniorul":"vișinior","visiniorule":"vișinior","visiniorului":"vișinior","visiniul":"vișiniu","visinul":"vișin","visinule":"vișin","visinului":"vișin","vistavoii":"vistavoi","vistavoilor":"vistavoi","vistavoiul":"vistavoi","vistavoiule":"vistavoi","vistavoiului":"vistavoi","vistea":"viști","visteai":"viști","visteam":"viști","visteati":"viști","visteau":"viști","visteria":"visterie","visteriei":"visterie","visterii":"visterie","visteriile":"visterie","visteriilor":"visterie","visternicei":"visternicel","visterniceii":"visternicel","visterniceilor":"visternicel","visternicelul":"visternicel","visternicelule":"visternicel","visternicelului":"visternicel","visternici":"visternic","visternicia":"visternicie","visterniciei":"visternicie","visternicii":["visternicii","visternic","visternicii","visternicie"],"visterniciile":"visternicie","visterniciilor":"visternicie","visternicilor":"visternic","visternicul":"visternic","visternicule":"visternic","visternicului":"visternic","vistesc":"viști","visteste":"viști","vistesti":"viști","vistieria":"vistierie","vistieriei":"vistierie","vistierii":"vistierie","vistieriile":"vistierie","vistieriilor":"vistierie","vistiernicei":"vistiernicel","vistierniceii":"vistiernicel","vistierniceilor":"vistiernicel","vistiernicelul":"vistiernicel","vistiernicelule":"vistiernicel","vistiernicelului":"vistiernicel","vistiernicese":"vistierniceasă","vistiernicesei":"vistierniceasă","vistiernicesele":"vistierniceasă","vistierniceselor":"vistierniceasă","vistiernici":"vistiernic","vistiernicia":"vistiernicie","vistierniciei":"vistiernicie","vistiernicii":["vistiernicii","vistiernic","vistiernicii","vistiernicie"],"vistierniciile":"vistiernicie","vistierniciilor":"vistiernicie","vistiernicilor":"vistiernic","vistiernicul":"vistiernic","vistiernicule":"vistiernic","vistiernicului":"vistiernic","vistii":"viști","vistim":"viști","vistind":"viști","vistira":"viști","vistiram":"viști","vistirati":"viști","vistise":"viști","vistisem":"viști","vistisera":"viști","vistiseram":"viști","vistiserati":"viști","vistisesi":"viști","vistisi":"viști","vistit":"viști","vistiti":"viști","vistul":"vist","vistule":"vist","vistului":"vist","visuitori":"visuitor","visuitorii":"visuitor","visuitorilor":"visuitor","visuitorul":"visuitor","visuitorule":"visuitor","visuitorului":"visuitor","visul":"vis","visule":"vis","visuletul":"visuleț","visuletule":"visuleț","visuletului":"visuleț","visului":"vis","visuri":"vis","visurile":"vis","visurilor":"vis","vitala":["vitală","vital","vitala","vital"],"vitale":"vital","vitalele":"vital","vitali":"vital","vitalii":"vital","vitalismul":"vitalism","vitalismule":"vitalism","vitalismului":"vitalism","vitaliste":"vitalistă","vitalistei":"vitalistă","vitalistele":"vitalistă","vitalistelor":"vitalistă","vitalisti":"vitalist","vitalistii":"vitalist","vitalistilor":"vitalist","vitalistul":"vitalist","vitalistule":"vitalist","vitalistului":"vitalist","vitalitatea":"vitalitate","vitalitati":"vitalitate","vitalitatii":"vitalitate","vitalitatile":"vitalitate","vitalitatilor":"vitalitate","vitalizai":"vitaliza","vitalizam":["vitalizăm","vitaliza","vitalizam","vitaliza"],"vitalizand":"vitaliza","vitalizara":"vitaliza","vitalizaram":"vitaliza","vitalizarati":"vitaliza","vitalizarea":"vitalizare","vitalizari":"vitalizare","vitalizarii":"vitalizare","vitalizarile":"vitalizare","vitalizarilor":"vitalizare","vitalizase":"vitaliza","vitalizasem":"vitaliza","vitalizasera":"vitaliza","vitalizaseram":"vitaliza","vitalizaserati":"vitaliza","vitalizasesi":"vitaliza","vitalizasi":"vitaliza","vitalizat":"vitaliza","vitalizata":["vitalizată","vitalizat","vitalizata","vitalizat"],"vitalizate":"vitalizat","vitalizatele":"vitalizat","vitalizati":["vitalizați","vitaliza","vitalizați","vitalizat"],"vitalizatii":"vitalizat","vitalizatul":"vitalizat","vitalizau":"vitaliza","vitalizeaza":"vitaliza","vitalizez":"vitaliza","vitalizezi":"vitaliza","vitalliumul":"vitallium","vitalliumule":"vitallium","vitalliumului":"vitallium","vitalul":"vital","vitamine":"vitamină","vitaminei":"vitamină","vitaminele":"vitamină","vitaminelor":"vitamină","vitaminica":["vitaminică","vitaminic","vitaminica","vitaminic"],"vitaminice":"vitaminic","vitaminicele":"vitaminic","vitaminici":"vitaminic","vitaminicii":"vitaminic","vitaminicul":"vitaminic","vitaminizai":"vitaminiza","vitaminizam":["vitaminizăm","vitaminiza","vitaminizam","vitaminiza"],"vitaminizand":"vitaminiza","vitaminizara":"vitaminiza","vitaminizaram":"vitaminiza","vitaminizarati":"vitaminiza","vitaminizase":"vitaminiza","vitaminizasem":"vitaminiza","vitaminizasera":"vitaminiza","vitaminizaseram":"vitaminiza","vitaminizaserati":"vitaminiza","vitaminizasesi":"vitaminiza","vitaminizasi":"vitaminiza","vitaminizat":"vitaminiza","vitaminizata":["vitaminizată","vitaminizat","vitaminizata","vitaminizat"],"vitaminizate":"vitaminizat","vitaminizatele":"vitaminizat","vitaminizati":["vitaminizați","vitaminiza","vitaminizați","vitaminizat"],"vitaminizatii":"vitaminizat","vitaminizatul":"vitaminizat","vitaminizau":"vitaminiza","vitaminizeaza":"vitaminiza","vitaminizez":"vitaminiza","vitaminizezi":"vitaminiza","vitaminoasa":["vitaminoasă","vitaminos","vitaminoasa","vitaminos"],"vitaminoase":"vitaminos","vitaminoasele":"vitaminos","vitaminosi":"vitaminos","vitaminosii":"vitaminos","vitaminosul":"vitaminos","vitaminoterapia":"vitaminoterapie","vitaminoterapiei":"vitaminoterapie","vitaminoterapii":"vitaminoterapie","vite":["vite","vită","vițe","viță"],"vite de canada":"viță de Canada","vite de vie":"viță de vie","viteaua":"vițea","viteaza":["vitează","viteaz","viteaza","viteaz"],"viteazul":"viteaz","vitei":["vitei","vită","viței","viță","viței","vițel"],"viteii":"vițel","viteilor":"vițel","vitejea":"viteji","vitejeai":"viteji","vitejeam":"viteji","vitejeasca":["vitejească","vitejesc","vitejeasca","vitejesc"],"vitejeati":"viteji","vitejeau":"viteji","vitejesc":"viteji","vitejescul":"vitejesc","vitejeste":"viteji","vitejesti":["vitejești","vitejesc","vitejești","viteji"],"vitejestii":"vitejesc","vitejestile":"vitejesc","viteji":"viteaz","vitejia":"vitejie","vitejiei":"vitejie","vitejii":["vitejii","viteaz","vitejii","viteji","vitejii","vitejie"],"vitejiile":"vitejie","vitejiilor":"vitejie","vitejim":"viteji","vitejimea":"vitejime","vitejimi":"vitejime","vitejimii":"vitejime","vitejimile":"vitejime","vitejimilor":"vitejime","vitejind":"viteji","vitejira":"viteji","vitejiram":"viteji","vitejirati":"viteji","vitejise":"viteji","vitejisem":"viteji","vitejisera":"viteji","vitejiseram":"viteji","vitejiserati":"viteji","vitejisesi":"viteji","vitejisi":"viteji","vitejit":"viteji","vitejite":"vitejiță","vitejitei":"vitejiță","vitejiti":"viteji","vitelari":"vițelar","vitelarii":"vițelar","vitelarilor":"vițelar","vitelarul":"vițelar","vitelarule":"vițelar","vitelarului":"vițelar","vitelasi":"vițelaș","vitelasii":"vițelaș","vitelasilor":"vițelaș","vitelasul":"vițelaș","vitelasule":"vițelaș","vitelasului":"vițelaș","vitele":["vitele","vită","vițele","viță","vițele","vițea","vițele","vițică"],"vitelei":["vițelei","vițea","vițelei","vițică"],"vitelele":["vițelele","vițea","vițelele","vițică"],"vitelelor":["vițelelor","vițea","vițelelor","vițică"],"viteli":"vitelin","viteline":"vitelină","vitelinei":"vitelină","vitelinele":"vitelină","vitelinelor":"vitelină","vitelini":"vitelin","vitelinii":"vitelin","vitelinile":"vitelin","vitelinilor":"vitelin","vitellusul":"vitellus","vitellusule":"vitellus","vitellusului":"vitellus","vitelogena":["vitelogenă","vitelogen","vitelogena","vitelogen"],"vitelogene":"vitelogen","vitelogenele":"vitelogen","vitelogeneze":"vitelogeneză","vitelogenezei":"vitelogeneză","vitelogenezele":"vitelogeneză","vitelogenezelor":"vitelogeneză","vitelogeni":"vitelogen","vitelogenii":"vitelogen","vitelogenul":"vitelogen","vitelor":["vitelor","vită","vițelor","viță"],"viteluci":"vițelucă","vitelucii":"vițelucă","vitelucile":"vițelucă","vitelucilor":"vițelucă","vitelul":"vițel","vitelule":"vițel","vitelului":"vițel","vitelusce":"vițelușcă","viteluscei":"vițelușcă","viteluse":"vițelușă","vitelusei":"vițelușă","vitelusele":"vițelușă","viteluselor":"vițelușă","vitelusi":"vițeluș","vitelusii":"vițeluș","vitelusilor":"vițeluș","vitelusul":"vițeluș","vitelusule":"vițeluș","vitelusului":"vițeluș","vitelutul":"vițeluț","vitelutule":"vițeluț","vitelutului":"vițeluț","vitesa":"viteză","viteze":["viteze","viteaz","viteze","viteză"],"viteze de eliberare":"viteză de eliberare","vitezei":"viteză","vitezei luminii":"viteza luminii","vitezele":["vitezele","viteaz","vitezele","viteză"],"vitezelor":"viteză","vitezomani":"vitezoman","vitezomanii":"vitezoman","vitezomanilor":"vitezoman","vitezomanul":"vitezoman","vitezomanule":"vitezoman","vitezomanului":"vitezoman","vitezometre":"vitezometru","vitezometrele":"vitezometru","vitezometrelor":"vitezometru","vitezometrul":"vitezometru","vitezometrule":"vitezometru","vitezometrului":"vitezometru","vitiai":"viția","vitiam":"viția","vitiara":"viția","vitiaram":"viția","vitiarati":"viția","vitiase":"viția","vitiasem":"viția","vitiasera":"viția","vitiaseram":"viția","vitiaserati":"viția","vitiasesi":"viția","vitiasi":"viția","vitiat":"viția","vitiata":["vițiată","vițiat","vițiata","vițiat"],"vitiate":"vițiat","vitiatele":"vițiat","vitiati":["vițiați","viția","vițiați","vițiat"],"vitiatii":"vițiat","vitiatul":"vițiat","vitiau":"viția","vitiaza":"viția","viticola":["viticolă","viticol","viticola","viticol"],"viticole":"viticol","viticolele":"viticol","viticoli":"viticol","viticolii":"viticol","viticolul":"viticol","viticultoarea":"viticultoare","viticultoarei":"viticultoare","viticultoarele":"viticultoare","viticultoarelor":"viticultoare","viticultori":"viticultor","viticultorii":"viticultor","viticultorilor":"viticultor","viticultorul":"viticultor","viticultorule":"viticultor","viticultorului":"viticultor","viticulture":"viticultură","viticulturei":"viticultură","viticulturele":"viticultură","viticulturelor":"viticultură","viticulturi":"viticultură","vitie":"viția","vitiem":"viția","vitii":["viții","viția","viții","vițiu"],"vitiile":"vițiu","vitiilor":"vițiu","vitiind":"viția","vitiligoul":"vitiligo","vitiligoule":"vitiligo","vitiligoului":"vitiligo","vitioasa":["vițioasă","vițios","vițioasa","vițios"],"vitioase":"vițios","vitioasele":"vițios","vitiosi":"vițios","vitiosii":"vițios","vitiosul":"vițios","vitisoare":["vitișoare","vitișoară","vițișoare","vițișoară"],"vitisoarei":["vitișoarei","vitișoară","vițișoarei","vițișoară"],"vitisoarele":"vitișoară","vitisoarelor":"vitișoară","vitite":"vițiță","vititei":"vițiță","vitiu":"viciu","vitiuul":"vițiu","vitiuule":"vițiu","vitiuului":"vițiu","vitraiul":"vitrai","vitraiule":"vitrai","vitraiului":"vitrai","vitraiuri":"vitrai","vitraiurile":"vitrai","vitraiurilor":"vitrai","vitraje":"vitraj","vitrajele":"vitraj","vitrajelor":"vitraj","vitrajul":"vitraj","vitrajule":"vitraj","vitrajului":"vitraj","vitrajuri":"vitraj","vitralii":"vitraliu","vitraliile":"vitraliu","vitraliilor":"vitraliu","vitraliul":"vitraliu","vitraliule":"vitraliu","vitraliului":"vitraliu","vitrata":["vitrată","vitrat","vitrata","vitrat"],"vitrate":"vitrat","vitratele":"vitrat","vitrati":"vitrat","vitratii":"vitrat","vitratul":"vitrat","vitrega":["vitregă","vitreg","vitrega","vitreg"],"vitrege":"vitreg","vitregele":"vitreg","vitregi":"vitreg","vitregia":"vitregie","vitregiei":"vitregie","vitregii":["vitregii","vitreg","vitregii","vitregie"],"vitregiile":"vitregie","vitregiilor":"vitregie","vitregimea":"vitregime","vitregimi":"vitregime","vitregimii":"vitregime","vitregita":["vitregită","vitregit","vitregita","vitregit"],"vitregite":"vitregit","vitregitele":"vitregit","vitregiti":"vitregit","vitregitii":"vitregit","vitregitul":"vitregit","vitregul":"vitreg","vitrifiabila":["vitrifiabilă","vitrifiabil","vitrifiabila","vitrifiabil"],"vitrifiabile":"vitrifiabil","vitrifiabilele":"vitrifiabil","vitrifiabili":"vitrifiabil","vitrifiabilii":"vitrifiabil","vitrifiabilul":"vitrifiabil","vitrifianti":"vitrifiant","vitrifiantii":"vitrifiant","vitrifiantilor":"vitrifiant","vitrifiantul":"vitrifiant","vitrifiantule":"vitrifiant","vitrifiantului":"vitrifiant","vitrific":"vitrifica","vitrificabila":["vitrificabilă","vitrificabil","vitrificabila","vitrificabil"],"vitrificabile":"vitrificabil","vitrificabilele":"vitrificabil","vitrificabili":"vitrificabil","vitrificabilii":"vitrificabil","vitrificabilul":"vitrificabil","vitrificai":"vitrifica","vitrificam":["vitrificăm","vitrifica","vitrificam","vitrifica"],"vitrificand":"vitrifica","vitrificara":"vitrifica","vitrificaram":"vitrifica","vitrificarati":"vitrifica","vitrificarea":"vitrificare","vitrificari":"vitrificare","vitrificarii":"vitrificare","vitrificarile":"vitrificare","vitrificarilor":"vitrificare","vitrificase":"vitrifica","vitrificasem":"vitrifica","vitrificasera":"vitrifica","vitrificaseram":"vitrifica","vitrificaserati":"vitrifica","vitrificasesi":"vitrifica","vitrificasi":"vitrifica","vitrificat":"vitrifica","vitrificata":["vitrificată","vitrificat","vitrificata","vitrificat"],"vitrificate":"vitrificat","vitrificatele":"vitrificat","vitrificati":["vitrificați","vitrifica","vitrificați","vitrificat"],"vitrificatia":"vitrificație","vitrificatiei":"vitrificație","vitrificatii":["vitrificații","vitrificat","vitrificații","vitrificație"],"vitrificatul":"vitrificat","vitrificau":"vitrifica","vitrifici":"vitrifica","vitrifierea":"vitrifiere","vitrifieri":"vitrifiere","vitrifierii":"vitrifiere","vitrifierile":"vitrifiere","vitrifierilor":"vitrifiere","vitrig":"vitreg","vitriga":["vitrigă","vitrig","vitriga","vitrig"],"vitrige":"vitrig","vitrigele":"vitrig","vitrigi":"vitrig","vitrigii":"vitrig","vitrigul":"vitrig","vitrine":"vitrină","vitrinei":"vitrină","vitrinele":"vitrină","vitrinelor":"vitrină","vitriniere":"vitrinieră","vitrinierei":"vitrinieră","vitrinierele":"vitrinieră","vitrinierelor":"vitrinieră","vitrinieri":"vitrinier","vitrinierii":"vitrinier","vitrinierilor":"vitrinier","vitrinierul":"vitrinier","vitrinierule":"vitrinier","vitrinierului":"vitrinier","vitriolai":"vitriola","vitriolaje":"vitriolaj","vitriolajele":"vitriolaj","vitriolajelor":"vitriolaj","vitriolajul":"vitriolaj","vitriolajule":"vitriolaj","vitriolajului":"vitriolaj","vitriolam":["vitriolăm","vitriola","vitriolam","vitriola"],"vitrioland":"vitriola","vitriolara":"vitriola","vitriolaram":"vitriola","vitriolarati":"vitriola","vitriolase":"vitriola","vitriolasem":"vitriola","vitriolasera":"vitriola","vitriolaseram":"vitriola","vitriolaserati":"vitriola","vitriolasesi":"vitriola","vitriolasi":"vitriola","vitriolat":"vitriola","vitriolati":"vitriola","vitriolau":"vitriola","vitrioleaza":"vitriola","vitriolez":"vitriola","vitriolezi":"vitriola","vitriolica":["vitriolică","vitriolic","vitriolica","vitriolic"],"vitriolice":"vitriolic","vitriolicele":"vitriolic","vitriolici":"vitriolic","vitriolicii":"vitriolic","vitriolicul":"vitriolic","vitriolizai":"vitrioliza","vitriolizam":["vitriolizăm","vitrioliza","vitriolizam","vitrioliza"],"vitriolizand":"vitrioliza","vitriolizara":"vitrioliza","vitriolizaram":"vitrioliza","vitriolizarati":"vitrioliza","vitriolizarea":"vitriolizare","vitriolizari":"vitriolizare","vitriolizarii":"vitriolizare","vitriolizase":"vitrioliza","vitriolizasem":"vitrioliza","vitriolizasera":"vitrioliza","vitriolizaseram":"vitrioliza","vitriolizaserati":"vitrioliza","vitriolizasesi":"vitrioliza","vitriolizasi":"vitrioliza","vitriolizat":"vitrioliza","vitriolizati":"vitrioliza","vitriolizatia":"vitriolizație","vitriolizatiei":"vitriolizație","vitriolizatii":"vitriolizație","vitriolizau":"vitrioliza","vitriolizeaza":"vitrioliza","vitriolizez":"vitrioliza","vitriolizezi":"vitrioliza","vitriolul":"vitriol","vitriolule":"vitriol","vitriolului":"vitriol","vitrioluri":"vitriol","vitriolurile":"vitriol","vitriolurilor":"vitriol","vitrionul":"vitrion","vitrionule":"vitrion","vitrionului":"vitrion","vitrionuri":"vitrion","vitrionurile":"vitrion","vitrionurilor":"vitrion","vitrita":"vetrice","vitritul":"vitrit","vitritule":"vitrit","vitritului":"vitrit","vitroasa":["vitroasă","vitros","vitroasa","vitros"],"vitroase":"vitros","vitroasele":"vitros","vitrosi":"vitros","vitrosii":"vitros","vitrosul":"vitros","vitrouri":"vitrou","vitrourile":"vitrou","vitrourilor":"vitrou","vitrouul":"vitrou","vitrouule":"vitrou","vitrouului":"vitrou","vitrozitatea":"vitrozitate","vitrozitati":"vitrozitate","vitrozitatii":"vitrozitate","vitrozitatile":"vitrozitate","vitrozitatilor":"vitrozitate","vitruul":"vitru","vitruule":"vitru","vitruului":"vitru","vitul":"viț","vitule":"viț","vitului":"viț","vituperai":"vitupera","vituperam":["vituperăm","vitupera","vituperam","vitupera"],"vituperand":"vitupera","vituperara":"vitupera","vituperaram":"vitupera","vituperarati":"vitupera","vituperarea":"vituperare","vituperari":"vituperare","vituperarii":"vituperare","vituperarile":"vituperare","vituperarilor":"vituperare","vituperase":"vitupera","vituperasem":"vitupera","vituperasera":"vitupera","vituperaseram":"vitupera","vituperaserati":"vitupera","vituperasesi":"vitupera","vituperasi":"vitupera","vituperat":"vitupera","vituperati":"vitupera","vituperatia":"vituperație","vituperatiei":"vituperație","vituperatii":"vituperație","vituperatiile":"vituperație","vituperatiilor":"vituperație","vituperativa":["vituperativă","vituperativ","vituperativa","vituperativ"],"vituperative":"vituperativ","vituperativele":"vituperativ","vituperativi":"vituperativ","vituperativii":"vituperativ","vituperativul":"vituperativ","vituperatoare":"vituperator","vituperatoarea":"vituperator","vituperatoarele":"vituperator","vituperatori":"vituperator","vituperatorii":"vituperator","vituperatorul":"vituperator","vituperau":"vitupera","vitupereaza":"vitupera","vituperez":"vitupera","vituperezi":"vitupera","vituri":"viț","viturile":"viț","viturilor":"viț","vitute":["vituțe","vituță","vițuțe","vițuță"],"vitutei":["vituței","vituță","vițuței","vițuță"],"vitutele":"vituță","vitutelor":"vituță","viu":"vie","viul":"viu","viuleata":["viuleață","viuleț","viuleața","viuleț"],"viulete":"viuleț","viuletele":"viuleț","viuleti":"viuleț","viuletii":"viuleț","viuletul":"viuleț","viuta":["viuță","viuț","viuța","viuț"],"viute":["viuțe","viuț","viuțe","viuță"],"viutei":"viuță","viutele":["viuțele","viuț","viuțele","viuță"],"viutelor":"viuță","viuti":"viuț","viutii":"viuț","viutul":"viuț","vivace":"vivaci","vivacea":"vivaci","vivacele":"vivaci","vivacii":"vivaci","vivacitatea":"vivacitate","vivacitati":"vivacitate","vivacitatii":"vivacitate","vivaciul":"vivaci","vivandiere":"vivandieră","vivandierei":"vivandieră","vivandierele":"vivandieră","vivandierelor":"vivandieră","vivanta":["vivantă","vivant","vivanta","vivant"],"vivante":"vivant","vivantele":"vivant","vivanti":"vivant","vivantii":"vivant","vivantul":"vivant","vivarii":"vivariu","vivariile":"vivariu","vivariilor":"vivariu","vivariul":"vivariu","vivariule":"vivariu","vivariului":"vivariu","viveuri":"viveur","viveurii":"viveur","viveurilor":"viveur","viveurul":"viveur","viveurule":"viveur","viveurului":"viveur","viviere":"vivieră","vivierei":"vivieră","vivierele":"vivieră","vivierelor":"vivieră","vivifianta":["vivifiantă","vivifiant","vivifianta","vivifiant"],"vivifiante":"vivifiant","vivifiantele":"vivifiant","vivifianti":"vivifiant","vivifiantii":"vivifiant","vivifiantul":"vivifiant","vivific":"vivifica","vivifica":["vivifică","vivific","vivifica","vivific"],"vivificai":"vivifica","vivificam":["vivificăm","vivifica","vivificam","vivifica"],"vivificand":"vivifica","vivificara":"vivifica","vivificaram":"vivifica","vivificarati":"vivifica","vivificarea":"vivificare","vivificari":"vivificare","vivificarii":"vivificare","vivificarile":"vivificare","vivificarilor":"vivificare","vivificase":"vivifica","vivificasem":"vivifica","vivificasera":"vivifica","vivificaseram":"vivifica","vivificaserati":"vivifica","vivificasesi":"vivifica","vivificasi":"vivifica","vivificat":"vivifica","vivificati":"vivifica","vivificatia":"vivificație","vivificatiei":"vivificație","vivificatii":"vivificație","vivificatoare":"vivificator","vivificatoarea":"vivificator","vivificatoarele":"vivificator"};
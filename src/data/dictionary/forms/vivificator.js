@@ -0,0 +1 @@
+export default {"vivificatori":"vivificator","vivificatorii":"vivificator","vivificatorul":"vivificator","vivificau":"vivifica","vivifice":["vivifice","vivific","vivifice","vivifica"],"vivificele":"vivific","vivifici":["vivifici","vivific","vivifici","vivifica"],"vivificii":"vivific","vivificul":"vivific","vivipara":["vivipară","vivipar","vivipara","vivipar"],"vivipare":"vivipar","viviparele":"vivipar","vivipari":"vivipar","viviparii":"vivipar","viviparitatea":"viviparitate","viviparitati":"viviparitate","viviparitatii":"viviparitate","viviparul":"vivipar","vivisectia":"vivisecție","vivisectiei":"vivisecție","vivisectii":"vivisecție","vivisectiile":"vivisecție","vivisectiilor":"vivisecție","vivisectionai":"vivisecționa","vivisectionam":["vivisecționăm","vivisecționa","vivisecționam","vivisecționa"],"vivisectionand":"vivisecționa","vivisectionara":"vivisecționa","vivisectionaram":"vivisecționa","vivisectionarati":"vivisecționa","vivisectionarea":"vivisecționare","vivisectionari":"vivisecționare","vivisectionarii":"vivisecționare","vivisectionarile":"vivisecționare","vivisectionarilor":"vivisecționare","vivisectionase":"vivisecționa","vivisectionasem":"vivisecționa","vivisectionasera":"vivisecționa","vivisectionaseram":"vivisecționa","vivisectionaserati":"vivisecționa","vivisectionasesi":"vivisecționa","vivisectionasi":"vivisecționa","vivisectionat":"vivisecționa","vivisectionata":["vivisecționată","vivisecționat","vivisecționata","vivisecționat"],"vivisectionate":"vivisecționat","vivisectionatele":"vivisecționat","vivisectionati":["vivisecționați","vivisecționa","vivisecționați","vivisecționat"],"vivisectionatii":"vivisecționat","vivisectionatul":"vivisecționat","vivisectionau":"vivisecționa","vivisectioneaza":"vivisecționa","vivisectionez":"vivisecționa","vivisectionezi":"vivisecționa","vivisectiunea":"vivisecțiune","vivisectiuni":"vivisecțiune","vivisectiunii":"vivisecțiune","vivisectiunile":"vivisecțiune","vivisectiunilor":"vivisecțiune","vivore":"vivor","vivorele":"vivor","vivorelor":"vivor","vivorul":"vivor","vivorule":"vivor","vivorului":"vivor","vizai":"viza","vizam":["vizăm","viza","vizam","viza"],"vizand":"viza","vizara":"viza","vizaram":"viza","vizarati":"viza","vizarea":"vizare","vizari":"vizare","vizarii":"vizare","vizarile":"vizare","vizarilor":"vizare","vizase":"viza","vizasem":"viza","vizasera":"viza","vizaseram":"viza","vizaserati":"viza","vizasesi":"viza","vizasi":"viza","vizat":"viza","vizati":"viza","vizau":"viza","vize":"viză","vizeaza":"viza","vizei":"viză","vizele":"viză","vizelor":"viză","vizete":"vizetă","vizetei":"vizetă","vizez":"viza","vizezi":"viza","vizi":"vid","vizibila":["vizibilă","vizibil","vizibila","vizibil"],"vizibile":"vizibil","vizibilea":"vizibile","vizibilele":["vizibilele","vizibil","vizibilele","vizibile"],"vizibili":["vizibili","vizibil","vizibili","vizibile"],"vizibilii":["vizibilii","vizibil","vizibilii","vizibile"],"vizibilitatea":"vizibilitate","vizibilitati":"vizibilitate","vizibilitatii":"vizibilitate","vizibilul":"vizibil","viziere":"vizieră","vizierei":"vizieră","vizierele":"vizieră","vizierelor":"vizieră","vizigota":["vizigotă","vizigot","vizigota","vizigot"],"vizigote":["vizigote","vizigot","vizigote","vizigotă"],"vizigotei":"vizigotă","vizigotele":["vizigotele","vizigot","vizigotele","vizigotă"],"vizigotelor":"vizigotă","vizigoti":"vizigot","vizigoticeasca":["vizigoticească","vizigoticesc","vizigoticeasca","vizigoticesc"],"vizigoticescul":"vizigoticesc","vizigoticesti":"vizigoticesc","vizigoticestii":"vizigoticesc","vizigoticestile":"vizigoticesc","vizigotii":"vizigot","vizigotilor":"vizigot","vizigotul":"vizigot","vizigotule":"vizigot","vizigotului":"vizigot","vizii":"vid","vizineaua":"vizinea","vizinele":"vizinea","vizinelei":"vizinea","vizinelele":"vizinea","vizinelelor":"vizinea","vizionai":"viziona","vizionam":["vizionăm","viziona","vizionam","viziona"],"vizionand":"viziona","vizionara":["vizionară","viziona","vizionară","vizionar","vizionara","vizionar"],"vizionaram":"viziona","vizionarati":"viziona","vizionare":"vizionar","vizionarea":"vizionare","vizionarele":"vizionar","vizionari":["vizionari","vizionar","vizionări","vizionare"],"vizionarii":["vizionarii","vizionar","vizionării","vizionare"],"vizionarile":"vizionare","vizionarilor":"vizionare","vizionarismul":"vizionarism","vizionarismule":"vizionarism","vizionarismului":"vizionarism","vizionarul":"vizionar","vizionase":"viziona","vizionasem":"viziona","vizionasera":"viziona","vizionaseram":"viziona","vizionaserati":"viziona","vizionasesi":"viziona","vizionasi":"viziona","vizionat":"viziona","vizionati":"viziona","vizionau":"viziona","vizioneaza":"viziona","vizionez":"viziona","vizionezi":"viziona","vizirate":"vizirat","viziratele":"vizirat","viziratelor":"vizirat","viziratul":"vizirat","viziratule":"vizirat","viziratului":"vizirat","vizireasca":["vizirească","viziresc","vizireasca","viziresc"],"vizirescul":"viziresc","viziresti":"viziresc","vizirestii":"viziresc","vizirestile":"viziresc","viziri":"vizir","viziria":"vizirie","viziriala":["vizirială","vizirial","viziriala","vizirial"],"viziriale":"vizirial","vizirialele":"vizirial","viziriali":"vizirial","vizirialii":"vizirial","vizirialul":"vizirial","viziriei":"vizirie","vizirii":["vizirii","vizir","vizirii","vizirie"],"vizirilor":"vizir","vizirlacul":"vizirlâc","vizirlacule":"vizirlâc","vizirlacului":"vizirlâc","vizirlacuri":"vizirlâc","vizirlacurile":"vizirlâc","vizirlacurilor":"vizirlâc","vizirul":"vizir","vizirule":"vizir","vizirului":"vizir","vizitai":"vizita","vizitam":["vizităm","vizita","vizitam","vizita"],"vizitand":"vizita","vizitara":"vizita","vizitaram":"vizita","vizitarati":"vizita","vizitarea":"vizitare","vizitari":"vizitare","vizitarii":"vizitare","vizitarile":"vizitare","vizitarilor":"vizitare","vizitase":"vizita","vizitasem":"vizita","vizitasera":"vizita","vizitaseram":"vizita","vizitaserati":"vizita","vizitasesi":"vizita","vizitasi":"vizita","vizitat":"vizita","vizitata":["vizitată","vizitat","vizitata","vizitat"],"vizitate":"vizitat","vizitatele":"vizitat","vizitati":["vizitați","vizita","vizitați","vizitat"],"vizitatia":"vizitație","vizitatiei":"vizitație","vizitatii":["vizitații","vizitat","vizitații","vizitație"],"vizitatoarea":"vizitatoare","vizitatoarei":"vizitatoare","vizitatoarele":"vizitatoare","vizitatoarelor":"vizitatoare","vizitatori":"vizitator","vizitatorii":"vizitator","vizitatorilor":"vizitator","vizitatorul":"vizitator","vizitatorule":"vizitator","vizitatorului":"vizitator","vizitatul":"vizitat","vizitau":"vizita","vizite":"vizită","viziteaza":"vizita","vizitei":"vizită","viziteiasca":["viziteiască","viziteiesc","viziteiasca","viziteiesc"],"viziteiescul":"viziteiesc","viziteiesti":"viziteiesc","viziteiestii":"viziteiesc","viziteiestile":"viziteiesc","vizitele":"vizită","vizitelor":"vizită","vizitez":"vizita","vizitezi":"vizita","vizitii":"vizitiu","vizitiii":"vizitiu","vizitiilor":"vizitiu","vizitiul":"vizitiu","vizitiule":"vizitiu","vizitiului":"vizitiu","vizitoaice":"vizitoaică","vizitoaicei":"vizitoaică","viziunea":"viziune","viziuni":"viziune","viziunii":"viziune","viziunile":"viziune","viziunilor":"viziune","vizoare":"vizor","vizoarele":"vizor","vizoarelor":"vizor","vizocul":"vizoc","vizocule":"vizoc","vizocului":"vizoc","vizocuri":"vizoc","vizocurile":"vizoc","vizocurilor":"vizoc","vizoni":"vizon","vizonii":"vizon","vizonilor":"vizon","vizonul":"vizon","vizonule":"vizon","vizonului":"vizon","vizorul":"vizor","vizorule":"vizor","vizorului":"vizor","vizuala":["vizuală","vizual","vizuala","vizual"],"vizuale":"vizual","vizualele":"vizual","vizuali":"vizual","vizualii":"vizual","vizualitatea":"vizualitate","vizualitati":"vizualitate","vizualitatii":"vizualitate","vizualizai":"vizualiza","vizualizam":["vizualizăm","vizualiza","vizualizam","vizualiza"],"vizualizand":"vizualiza","vizualizara":"vizualiza","vizualizaram":"vizualiza","vizualizarati":"vizualiza","vizualizarea":"vizualizare","vizualizari":"vizualizare","vizualizarii":"vizualizare","vizualizarile":"vizualizare","vizualizarilor":"vizualizare","vizualizase":"vizualiza","vizualizasem":"vizualiza","vizualizasera":"vizualiza","vizualizaseram":"vizualiza","vizualizaserati":"vizualiza","vizualizasesi":"vizualiza","vizualizasi":"vizualiza","vizualizat":"vizualiza","vizualizata":["vizualizată","vizualizat","vizualizata","vizualizat"],"vizualizate":"vizualizat","vizualizatele":"vizualizat","vizualizati":["vizualizați","vizualiza","vizualizați","vizualizat"],"vizualizatii":"vizualizat","vizualizatul":"vizualizat","vizualizau":"vizualiza","vizualizeaza":"vizualiza","vizualizez":"vizualiza","vizualizezi":"vizualiza","vizualul":"vizual","vizuine":"vizuină","vizuinei":"vizuină","vizuinele":"vizuină","vizuinelor":"vizuină","vizunia":"vizunie","vizuniei":"vizunie","vizunii":"vizunie","vizuniile":"vizunie","vizuniilor":"vizunie","vladichii":"vlădică","vladici":["vlădici","vlădic","vlădici","vlădică"],"vladicia":"vlădicie","vladiciei":"vlădicie","vladicii":["vlădicii","vlădic","vlădicii","vlădică","vlădicii","vlădicie"],"vladiciile":"vlădicie","vladiciilor":"vlădicie","vladicilor":["vlădicilor","vlădic","vlădicilor","vlădică"],"vladicul":"vlădic","vladicule":"vlădic","vladicului":"vlădic","vladnica":["vladnică","vladnic","vladnica","vladnic"],"vladnice":"vladnic","vladnicele":"vladnic","vladnici":"vladnic","vladnicii":"vladnic","vladnicul":"vladnic","vladuia":"vlădui","vladuiai":"vlădui","vladuiam":"vlădui","vladuiati":"vlădui","vladuiau":"vlădui","vladuiesc":"vlădui","vladuieste":"vlădui","vladuiesti":"vlădui","vladuii":"vlădui","vladuim":"vlădui","vladuind":"vlădui","vladuira":"vlădui","vladuiram":"vlădui","vladuirati":"vlădui","vladuise":"vlădui","vladuisem":"vlădui","vladuisera":"vlădui","vladuiseram":"vlădui","vladuiserati":"vlădui","vladuisesi":"vlădui","vladuisi":"vlădui","vladuit":"vlădui","vladuiti":"vlădui","vladuitori":"vlăduitor","vladuitorii":"vlăduitor","vladuitorilor":"vlăduitor","vladuitorul":"vlăduitor","vladuitorule":"vlăduitor","vladuitorului":"vlăduitor","vlage":"vlagă","vlagei":"vlagă","vlagoasa":["vlăgoasă","vlăgos","vlăgoasa","vlăgos"],"vlagoase":"vlăgos","vlagoasele":"vlăgos","vlagosi":"vlăgos","vlagosii":"vlăgos","vlagosul":"vlăgos","vlaguia":"vlăgui","vlaguiai":"vlăgui","vlaguiam":"vlăgui","vlaguiati":"vlăgui","vlaguiau":"vlăgui","vlaguiesc":"vlăgui","vlaguieste":"vlăgui","vlaguiesti":"vlăgui","vlaguii":"vlăgui","vlaguim":"vlăgui","vlaguind":"vlăgui","vlaguira":"vlăgui","vlaguiram":"vlăgui","vlaguirati":"vlăgui","vlaguirea":"vlăguire","vlaguiri":"vlăguire","vlaguirii":"vlăguire","vlaguise":"vlăgui","vlaguisem":"vlăgui","vlaguisera":"vlăgui","vlaguiseram":"vlăgui","vlaguiserati":"vlăgui","vlaguisesi":"vlăgui","vlaguisi":"vlăgui","vlaguit":"vlăgui","vlaguita":["vlăguită","vlăguit","vlăguita","vlăguit"],"vlaguite":"vlăguit","vlaguitele":"vlăguit","vlaguiti":["vlăguiți","vlăgui","vlăguiți","vlăguit"],"vlaguitii":"vlăguit","vlaguitoare":"vlăguitor","vlaguitoarea":["vlăguitoarea","vlăguitoare","vlăguitoarea","vlăguitor"],"vlaguitoarei":"vlăguitoare","vlaguitoarele":["vlăguitoarele","vlăguitoare","vlăguitoarele","vlăguitor"],"vlaguitoarelor":"vlăguitoare","vlaguitori":"vlăguitor","vlaguitorii":"vlăguitor","vlaguitorul":"vlăguitor","vlaguitul":"vlăguit","vlaha":["vlahă","vlah","vlaha","vlah"],"vlahe":["vlahe","vlah","vlahe","vlahă"],"vlahei":"vlahă","vlahele":["vlahele","vlah","vlahele","vlahă"],"vlahelor":"vlahă","vlahi":"vlah","vlahii":"vlah","vlahilor":"vlah","vlahul":"vlah","vlahule":"vlah","vlahului":"vlah","vlajgane":"vlăjgană","vlajganei":"vlăjgană","vlajganele":"vlăjgană","vlajganelor":"vlăjgană","vlajgani":"vlăjgan","vlajganii":"vlăjgan","vlajganilor":"vlăjgan","vlajganul":"vlăjgan","vlajganule":"vlăjgan","vlajganului":"vlăjgan","vlasceanul":"vlășcean","vlasceanule":"vlășcean","vlasceanului":"vlășcean","vlascene":"vlășceană","vlascenei":"vlășceană","vlascenele":"vlășceană","vlascenelor":"vlășceană","vlasceni":"vlășcean","vlascenii":"vlășcean","vlascenilor":"vlășcean","vlasite":"vlașiță","vlasitei":"vlașiță","vlasitele":"vlașiță","vlasitelor":"vlașiță","vlastare":"vlăstar","vlastarele":"vlăstar","vlastarelor":"vlăstar","vlastarul":"vlăstar","vlastarule":"vlăstar","vlastarului":"vlăstar","vlaste":"vlastă","vlastei":"vlastă","vlastele":"vlastă","vlasteli":"vlastel","vlastelii":"vlastel","vlastelilor":"vlastel","vlastelini":"vlastelin","vlastelinul":"vlastelin","vlastelinule":"vlastelin","vlastelinului":"vlastelin","vlastelor":"vlastă","vlastelul":"vlastel","vlastelule":"vlastel","vlastelului":"vlastel","vlavia":"vlavie","vlaviei":"vlavie","vlavii":"vlavie","vlestioare":"vleștioară","vlestioarei":"vleștioară","vloggeri":"vlogger","vloggerii":"vlogger","vloggerilor":"vlogger","vloggerul":"vlogger","vloggerule":"vlogger","vloggerului":"vlogger","vloguri":"vlog","vnuci":"vnuc","vnucii":"vnuc","vnucilor":"vnuc","vnucul":"vnuc","vnucule":"vnuc","vnucului":"vnuc","voalai":"voala","voalam":["voalăm","voala","voalam","voala"],"voaland":"voala","voalara":"voala","voalaram":"voala","voalarati":"voala","voalarea":"voalare","voalari":"voalare","voalarii":"voalare","voalarile":"voalare","voalarilor":"voalare","voalase":"voala","voalasem":"voala","voalasera":"voala","voalaseram":"voala","voalaserati":"voala","voalasesi":"voala","voalasi":"voala","voalat":"voala","voalata":["voalată","voalat","voalata","voalat"],"voalate":"voalat","voalatele":"voalat","voalati":["voalați","voala","voalați","voalat"],"voalatii":"voalat","voalatul":"voalat","voalau":"voala","voaleaza":"voala","voalete":"voaletă","voaletei":"voaletă","voaletele":"voaletă","voaletelor":"voaletă","voalez":"voala","voalezi":"voala","voaluri":"voal","voama":"voame","voame":"voma","voamem":"voame","voameti":"voame","voastra":["voastră","voi","voastră","vostru"],"voastre":["voastre","voi","voastre","vostru"],"vocabulare":"vocabular","vocabularele":"vocabular","vocabularelor":"vocabular","vocabularii":"vocabulariu","vocabularul":"vocabular","vocabularule":"vocabular","vocabularului":"vocabular","vocabule":"vocabulă","vocabulei":"vocabulă","vocabulele":"vocabulă","vocabulelor":"vocabulă","vocala":["vocală","vocal","vocala","vocal"],"vocale":["vocale","vocal","vocale","vocală"],"vocale lungi":"vocală lungă","vocale nazale":"vocală nazală","vocale neutre":"vocală neutră","vocale rotunjite":"vocală rotunjită","vocale scurte":"vocală scurtă","vocale tematice":"vocală tematică","vocalei":"vocală","vocalele":["vocalele","vocal","vocalele","vocală"],"vocalelor":"vocală","vocali":"vocal","vocalica":["vocalică","vocalic","vocalica","vocalic"],"vocalice":"vocalic","vocalicele":"vocalic","vocalici":"vocalic","vocalicii":"vocalic","vocalicul":"vocalic","vocalii":"vocal","vocalismul":"vocalism","vocalismule":"vocalism","vocalismului":"vocalism","vocalisti":"vocalist","vocalistii":"vocalist","vocalistilor":"vocalist","vocalistul":"vocalist","vocalistule":"vocalist","vocalistului":"vocalist","vocalizai":"vocaliza","vocalizam":["vocalizăm","vocaliza","vocalizam","vocaliza"],"vocalizand":"vocaliza","vocalizara":"vocaliza","vocalizaram":"vocaliza","vocalizarati":"vocaliza","vocalizarea":"vocalizare","vocalizari":"vocalizare","vocalizarii":"vocalizare","vocalizarile":"vocalizare","vocalizarilor":"vocalizare","vocalizase":"vocaliza","vocalizasem":"vocaliza","vocalizasera":"vocaliza","vocalizaseram":"vocaliza","vocalizaserati":"vocaliza","vocalizasesi":"vocaliza","vocalizasi":"vocaliza","vocalizat":"vocaliza","vocalizata":["vocalizată","vocalizat","vocalizata","vocalizat"],"vocalizate":"vocalizat","vocalizatele":"vocalizat","vocalizati":["vocalizați","vocaliza","vocalizați","vocalizat"],"vocalizatia":"vocalizație","vocalizatiei":"vocalizație","vocalizatii":["vocalizații","vocalizat","vocalizații","vocalizație"],"vocalizatul":"vocalizat","vocalizau":"vocaliza","vocalize":"vocaliză","vocalizeaza":"vocaliza","vocalizei":"vocaliză","vocalizele":"vocaliză","vocalizelor":"vocaliză","vocalizez":"vocaliza","vocalizezi":"vocaliza","vocalul":"vocal","vocatia":"vocație","vocatiei":"vocație","vocatii":"vocație","vocatiile":"vocație","vocatiilor":"vocație","vocationala":["vocațională","vocațional","vocaționala","vocațional"],"vocationale":"vocațional","vocationalele":"vocațional","vocationali":"vocațional","vocationalii":"vocațional","vocationalul":"vocațional","vocatiunea":"vocațiune","vocatiuni":"vocațiune","vocatiunii":"vocațiune","vocatiunile":"vocațiune","vocatiunilor":"vocațiune","vocative":"vocativ","vocativele":"vocativ","vocativelor":"vocativ","vocativul":"vocativ","vocativule":"vocativ","vocativului":"vocativ","vocea":"voce","voci":"voce","vociferai":"vocifera","vociferam":["vociferăm","vocifera","vociferam","vocifera"],"vociferand":"vocifera","vociferante":"vociferantă","vociferantei":"vociferantă","vociferantele":"vociferantă","vociferantelor":"vociferantă","vociferanti":"vociferant","vociferantii":"vociferant","vociferantilor":"vociferant","vociferantul":"vociferant","vociferantule":"vociferant","vociferantului":"vociferant","vociferara":"vocifera","vociferaram":"vocifera","vociferarati":"vocifera","vociferarea":"vociferare","vociferari":"vociferare","vociferarii":"vociferare","vociferarile":"vociferare","vociferarilor":"vociferare","vociferase":"vocifera","vociferasem":"vocifera","vociferasera":"vocifera","vociferaseram":"vocifera","vociferaserati":"vocifera","vociferasesi":"vocifera","vociferasi":"vocifera","vociferat":"vocifera","vociferati":"vocifera","vociferatia":"vociferație","vociferatiei":"vociferație","vociferatii":"vociferație","vociferatiile":"vociferație","vociferatiilor":"vociferație","vociferau":"vocifera","vocifereaza":"vocifera","vociferez":"vocifera","vociferezi":"vocifera","vocii":"voce","vocile":"voce","vocilor":"voce","vocodere":"vocoder","vocoderele":"vocoder","vocoderelor":"vocoder","vocoderul":"vocoder","vocoderule":"vocoder","vocoderului":"vocoder","vodaul":"vodă","vodaule":"vodă","vodaului":"vodă","vodca":"votcă","vodci":"vodcă","vodcii":"vodcă","vodcile":"vodcă","vodcilor":"vodcă","vodea":"vodi","vodeai":"vodi","vodeam":"vodi","vodeati":"vodi","vodeau":"vodi","vodesc":"vodi","vodese":"vodeasă","vodesei":"vodeasă","vodesele":"vodeasă","vodeselor":"vodeasă","vodeste":"vodi","vodesti":"vodi","vodevileasca":["vodevilească","vodevilesc","vodevileasca","vodevilesc"],"vodevilescul":"vodevilesc","vodevilesti":"vodevilesc","vodevilestii":"vodevilesc","vodevilestile":"vodevilesc","vodevilisti":"vodevilist","vodevilistica":["vodevilistică","vodevilistic","vodevilistica","vodevilistic"],"vodevilistice":"vodevilistic","vodevilisticele":"vodevilistic","vodevilistici":"vodevilistic","vodevilisticii":"vodevilistic","vodevilisticul":"vodevilistic","vodevilistii":"vodevilist","vodevilistilor":"vodevilist","vodevilistul":"vodevilist","vodevilistule":"vodevilist","vodevilistului":"vodevilist","vodevilul":"vodevil","vodevilule":"vodevil","vodevilului":"vodevil","vodeviluri":"vodevil","vodevilurile":"vodevil","vodevilurilor":"vodevil","vodii":"vodi","vodim":"vodi","vodind":"vodi","vodira":"vodi","vodiram":"vodi","vodirati":"vodi","vodise":"vodi","vodisem":"vodi","vodisera":"vodi","vodiseram":"vodi","vodiserati":"vodi","vodisesi":"vodi","vodisi":"vodi","vodit":"vodi","vodite":"vodiță","voditei":"vodiță","voditele":"vodiță","voditelor":"vodiță","voditi":"vodi","voditori":"voditor","voditorii":"voditor","voditorilor":"voditor","voditorul":"voditor","voditorule":"voditor","voditorului":"voditor","vodulease":"voduleasă","voduleasei":"voduleasă","voge":"vogă","vogei":"vogă","vogele":"vogă","vogelor":"vogă","vohoade":"vohod","vohoadele":"vohod","vohoadelor":"vohod","vohodul":"vohod","vohodule":"vohod","vohodului":"vohod","voi":["voi","veți","voi","voie"],"voia":["voia","voi","voia","voie"],"voiagii":"voiagiu","voiagiile":"voiagiu","voiagiilor":"voiagiu","voiagiuul":"voiagiu","voiagiuule":"voiagiu","voiagiuului":"voiagiu","voiai":"voi","voiajai":"voiaja","voiajam":["voiajăm","voiaja","voiajam","voiaja"],"voiajand":"voiaja","voiajara":"voiaja","voiajaram":"voiaja","voiajarati":"voiaja","voiajase":"voiaja","voiajasem":"voiaja","voiajasera":"voiaja","voiajaseram":"voiaja","voiajaserati":"voiaja","voiajasesi":"voiaja","voiajasi":"voiaja","voiajat":"voiaja","voiajata":["voiajată","voiajat","voiajata","voiajat"],"voiajate":"voiajat","voiajatele":"voiajat","voiajati":["voiajați","voiaja","voiajați","voiajat"],"voiajatii":"voiajat","voiajatul":"voiajat","voiajau":"voiaja","voiajeaza":"voiaja","voiajez":"voiaja","voiajezi":"voiaja","voiajori":"voiajor","voiajori comerciali":"voiajor comercial","voiajorii":"voiajor","voiajorilor":"voiajor","voiajorul":"voiajor","voiajorule":"voiajor","voiajorului":"voiajor","voiajul":"voiaj","voiajule":"voiaj","voiajului":"voiaj","voiajuri":"voiaj","voiajurile":"voiaj","voiajurilor":"voiaj","voiam":"voi","voiati":"voi","voiau":"voi","voiesc":"voi","voieste":"voi","voiesti":"voi","voievodala":["voievodală","voievodal","voievodala","voievodal"],"voievodale":"voievodal","voievodalele":"voievodal","voievodali":"voievodal","voievodalii":"voievodal","voievodalul":"voievodal","voievodate":"voievodat","voievodatele":"voievodat","voievodatelor":"voievodat","voievodatul":"voievodat","voievodatule":"voievodat","voievodatului":"voievodat","voievodese":"voievodeasă","voievodesei":"voievodeasă","voievodesele":"voievodeasă","voievodeselor":"voievodeasă","voievodite":"voievodiță","voievoditei":"voievodiță","voievodul":"voievod","voievodule":"voievod","voievodului":"voievod","voievozi":"voievod","voievozia":"voievozie","voievoziei":"voievozie","voievozii":["voievozii","voievod","voievozii","voievozie"],"voievoziile":"voievozie","voievoziilor":"voievozie","voievozilor":"voievod","voii":["voii","voi","voii","voie"],"voile":"voie","voilor":"voie","voim":"voi","voincioasa":["voincioasă","voincios","voincioasa","voincios"],"voincioase":"voincios","voincioasele":"voincios","voinciosi":"voincios","voinciosii":"voincios","voinciosul":"voincios","voind":"voi","voineaul":"voinea","voineaule":"voinea","voineaului":"voinea","voinica":["voinică","voinic","voinica","voinic"],"voinicasi":"voinicaș","voinicasii":"voinicaș","voinicasilor":"voinicaș","voinicasul":"voinicaș","voinicasule":"voinicaș","voinicasului":"voinicaș","voinice":"voinic","voiniceasca":["voinicească","voinicesc","voiniceasca","voinicesc"],"voinicei":"voinicel","voinicele":["voinicele","voinic","voinicele","voinicică"],"voinicelei":"voinicică","voinicelele":"voinicică","voinicelelor":"voinicică","voiniceli":"voinicel","voinicelii":"voinicel","voinicelilor":"voinicel","voinicelul":"voinicel","voinicelule":"voinicel","voinicelului":"voinicel","voiniceri":"voinicer","voinicerii":"voinicer","voinicerilor":"voinicer","voinicerul":"voinicer","voinicerule":"voinicer","voinicerului":"voinicer","voinicescul":"voinicesc","voinicesti":"voinicesc","voinicestii":"voinicesc","voinicestile":"voinicesc","voinici":"voinic","voinicia":"voinicie","voinicici":"voinicic","voinicicii":"voinicic","voinicicilor":"voinicic","voinicicul":"voinicic","voinicicule":"voinicic","voinicicului":"voinicic","voiniciei":"voinicie","voinicii":["voinicii","voinic","voinicii","voinicie"],"voiniciile":"voinicie","voiniciilor":"voinicie","voinicimea":"voinicime","voinicimi":"voinicime","voinicimii":"voinicime","voinicimile":"voinicime","voinicimilor":"voinicime","voinicitul":"voinicit","voinicitule":"voinicit","voinicitului":"voinicit","voinicoasa":["voinicoasă","voinicos","voinicoasa","voinicos"],"voinicoase":"voinicos","voinicoasele":"voinicos","voinicosi":"voinicos","voinicosii":"voinicos","voinicosul":"voinicos","voinicul":"voinic","voinicute":"voinicuță","voinicutei":"voinicuță","voinicutele":"voinicuță","voinicutelor":"voinicuță","voinicuti":"voinicuț","voinicutii":"voinicuț","voinicutilor":"voinicuț","voinicutul":"voinicuț","voinicutule":"voinicuț","voinicutului":"voinicuț","vointe":"voință","vointei":"voință","vointele":"voință","vointelor":"voință","voioasa":["voioasă","voios","voioasa","voios"],"voioase":"voios","voioasele":"voios","voiosi":"voios","voiosii":["voioșii","voios","voioșii","voioșie"],"voiosul":"voios","voira":"voi","voiram":"voi","voirati":"voi","voirea":"voire","voiri":"voire","voirii":"voire","voirile":"voire","voirilor":"voire","voise":"voi","voisem":"voi","voisera":"voi","voiseram":"voi","voiserati":"voi","voisesi":"voi","voisi":"voi","voit":"voi","voita":["voită","voit","voita","voit"],"voite":"voit","voitele":"voit","voiti":["voiți","voi","voiți","voit"],"voitii":"voit","voitoare":"voitor","voitoarea":"voitor","voitoarele":"voitor","voitori":"voitor","voitori de bine":"voitor de bine","voitorii":"voitor","voitorul":"voitor","voitul":"voit","voivod":"voievod","voivodala":["voivodală","voivodal","voivodala","voivodal"],"voivodale":"voivodal","voivodalele":"voivodal","voivodali":"voivodal","voivodalii":"voivodal","voivodalul":"voivodal","voivodat":"voievodat","voivodatul":"voivodat","voivodatule":"voivodat","voivodatului":"voivodat","voivodeasca":["voivodească","voivodesc","voivodeasca","voivodesc"],"voivodescul":"voivodesc","voivodese":"voivodeasă","voivodesei":"voivodeasă","voivodesele":"voivodeasă","voivodeselor":"voivodeasă","voivodesti":"voivodesc","voivodestii":"voivodesc","voivodestile":"voivodesc","voivodete":"voivodat","voivodetele":"voivodat","voivodetelor":"voivodat","voivodul":"voivod","voivodule":"voivod","voivodului":"voivod","voivozi":"voivod","voivozii":"voivod","voivozilor":"voivod","volanase":"volănaș","volanasele":"volănaș","volanaselor":"volănaș","volanasul":"volănaș","volanasule":"volănaș","volanasului":"volănaș","volane":"volan","volatica":["volatică","volatic","volatica","volatic"],"volatice":"volatic","volaticele":"volatic","volatici":"volatic","volaticii":"volatic","volaticul":"volatic","volatila":["volatilă","volatil","volatila","volatil"],"volatile":"volatil","volatilele":"volatil","volatili":"volatil","volatilii":"volatil","volatilitatea":"volatilitate","volatilitati":"volatilitate","volatilitatii":"volatilitate","volatilitatile":"volatilitate","volatilitatilor":"volatilitate","volatilizabila":["volatilizabilă","volatilizabil","volatilizabila","volatilizabil"],"volatilizabile":"volatilizabil","volatilizabilele":"volatilizabil","volatilizabili":"volatilizabil","volatilizabilii":"volatilizabil","volatilizabilul":"volatilizabil","volatilizai":"volatiliza","volatilizam":["volatilizăm","volatiliza","volatilizam","volatiliza"],"volatilizand":"volatiliza","volatilizara":"volatiliza","volatilizaram":"volatiliza","volatilizarati":"volatiliza","volatilizarea":"volatilizare","volatilizari":"volatilizare","volatilizarii":"volatilizare","volatilizarile":"volatilizare","volatilizarilor":"volatilizare","volatilizase":"volatiliza","volatilizasem":"volatiliza","volatilizasera":"volatiliza","volatilizaseram":"volatiliza","volatilizaserati":"volatiliza","volatilizasesi":"volatiliza","volatilizasi":"volatiliza","volatilizat":"volatiliza","volatilizata":["volatilizată","volatilizat","volatilizata","volatilizat"],"volatilizate":"volatilizat","volatilizatele":"volatilizat","volatilizati":["volatilizați","volatiliza","volatilizați","volatilizat"],"volatilizatia":"volatilizație","volatilizatiei":"volatilizație","volatilizatii":["volatilizații","volatilizat","volatilizații","volatilizație"],"volatilizatul":"volatilizat","volatilizau":"volatiliza","volatilizeaza":"volatiliza","volatilizez":"volatiliza","volatilizezi":"volatiliza","volatilul":"volatil","volburarari":"volburare","volburararii":"volburare","volburararile":"volburare","volburararilor":"volburare","volburarea":"volburare","volburi":"volbură","volburii":"volbură","volburile":"volbură","volburilor":"volbură","volburoasa":["volburoasă","volburos","volburoasa","volburos"],"volburoase":"volburos","volburoasele":"volburos","volburosi":"volburos","volburosii":"volburos","volburosul":"volburos","volcani":"volcan","volcanica":["volcanică","volcanic","volcanica","volcanic"],"volcanice":"volcanic","volcanicele":"volcanic","volcanici":"volcanic","volcanicii":"volcanic","volcanicul":"volcanic","volcanii":"volcan","volcanilor":"volcan","volcanul":"volcan","volcanule":"volcan","volcanului":"volcan","voleibaliste":"voleibalistă","voleibalistei":"voleibalistă","voleibalistele":"voleibalistă","voleibalistelor":"voleibalistă","voleibalisti":"voleibalist","voleibalistica":["voleibalistică","voleibalistic","voleibalistica","voleibalistic"],"voleibalistice":"voleibalistic","voleibalisticele":"voleibalistic","voleibalistici":"voleibalistic","voleibalisticii":"voleibalistic","voleibalisticul":"voleibalistic","voleibalistii":"voleibalist","voleibalistilor":"voleibalist","voleibalistul":"voleibalist","voleibalistule":"voleibalist","voleibalistului":"voleibalist","voleiul":"volei","voleiule":"volei","voleiului":"volei","voleul":["voleul","vole","voleul","voleu"],"voleule":["voleule","vole","voleule","voleu"],"voleului":["voleului","vole","voleului","voleu"],"voleuri":["voleuri","vole","voleuri","voleu"],"voleurile":["voleurile","vole","voleurile","voleu"],"voleurilor":["voleurilor","vole","voleurilor","voleu"],"voliere":"volieră","volierei":"volieră","volierele":"volieră","volierelor":"volieră","volintirasi":"volintiraș","volintirasii":"volintiraș","volintirasilor":"volintiraș","volintirasul":"volintiraș","volintirasule":"volintiraș","volintirasului":"volintiraș","volintireasca":["volintirească","volintiresc","volintireasca","volintiresc"],"volintirescul":"volintiresc","volintiresti":"volintiresc","volintirestii":"volintiresc","volintirestile":"volintiresc","volintiri":"volintir","volintirii":"volintir","volintirilor":"volintir","volintirimea":"volintirime","volintirimi":"volintirime","volintirimii":"volintirime","volintiroii":"volintiroi","volintiroilor":"volintiroi","volintiroiul":"volintiroi","volintiroiule":"volintiroi","volintiroiului":"volintiroi","volintirul":"volintir","volintirule":"volintir","volintirului":"volintir","volitionala":["volițională","volițional","voliționala","volițional"],"volitionale":"volițional","volitionalele":"volițional","volitionali":"volițional","volitionalii":"volițional","volitionalul":"volițional","volitiunea":"volițiune","volitiuni":"volițiune","volitiunii":"volițiune","volitiunile":"volițiune","volitiunilor":"volițiune","volitiva":["volitivă","volitiv","volitiva","volitiv"],"volitive":"volitiv","volitivele":"volitiv","volitivi":"volitiv","volitivii":"volitiv","volitivul":"volitiv","volnica":["volnică","volnic","volnica","volnic"],"volnice":"volnic","volnicea":"volnici","volniceai":"volnici","volniceam":"volnici","volniceati":"volnici","volniceau":"volnici","volnicele":"volnic","volnicesc":"volnici","volniceste":"volnici","volnicesti":"volnici","volnici":"volnic","volnicia":"volnicie","volniciei":"volnicie","volnicii":["volnicii","volnic","volnicii","volnici","volnicii","volnicie"],"volniciile":"volnicie","volniciilor":"volnicie","volnicim":"volnici","volnicind":"volnici","volnicira":"volnici","volniciram":"volnici","volnicirati":"volnici","volnicise":"volnici","volnicisem":"volnici","volnicisera":"volnici","volniciseram":"volnici","volniciserati":"volnici","volnicisesi":"volnici","volnicisi":"volnici","volnicit":"volnici","volnicita":["volnicită","volnicit","volnicita","volnicit"],"volnicite":"volnicit","volnicitele":"volnicit","volniciti":["volniciți","volnici","volniciți","volnicit"],"volnicitii":"volnicit","volnicitul":"volnicit","volnicul":"volnic","voloage":"volog","voloagele":"volog","voloagelor":"volog","volocele":"volocel","volocelele":"volocel","volocelelor":"volocel","volocelul":"volocel","volocelule":"volocel","volocelului":"volocel","vologul":"volog","vologule":"volog","vologului":"volog","volontiri":"volontir","volontirii":"volontir","volontirilor":"volontir","volontirul":"volontir","volontirule":"volontir","volontirului":"volontir","volt-amperi":"volt-amper","volt-amperii":"volt-amper","volt-amperilor":"volt-amper","volt-amperul":"volt-amper","volt-amperule":"volt-amper","volt-amperului":"volt-amper","voltaica":["voltaică","voltaic","voltaica","voltaic"],"voltaice":"voltaic","voltaicele":"voltaic","voltaici":"voltaic","voltaicii":"voltaic","voltaicul":"voltaic","voltairiana":["voltairiană","voltairian","voltairiana","voltairian"],"voltairianismul":"voltairianism","voltairianismule":"voltairianism","voltairianismului":"voltairianism","voltairianul":"voltairian","voltairianule":"voltairian","voltairianului":"voltairian","voltairiene":"voltairian","voltairienele":"voltairian","voltairieni":"voltairian","voltairienii":"voltairian","voltairienilor":"voltairian","voltaje":"voltaj","voltajele":"voltaj","voltajelor":"voltaj","voltajul":"voltaj","voltajule":"voltaj","voltajului":"voltaj","voltametre":"voltametru","voltametrele":"voltametru","voltametrelor":"voltametru","voltametrul":"voltametru","voltametrule":"voltametru","voltametrului":"voltametru","voltamperi":"voltamper","voltamperii":"voltamper","voltamperilor":"voltamper","voltampermetre":"voltampermetru","voltampermetrele":"voltampermetru","voltampermetrelor":"voltampermetru","voltampermetrul":"voltampermetru","voltampermetrule":"voltampermetru","voltampermetrului":"voltampermetru","voltamperul":"voltamper","voltamperule":"voltamper","voltamperului":"voltamper","volte":"voltă","voltei":"voltă","voltele":"voltă","voltelor":"voltă","volti":"volt","voltii":"volt","voltijori":"voltijor","voltijorii":"voltijor","voltijorilor":"voltijor","voltijorul":"voltijor","voltijorule":"voltijor","voltijorului":"voltijor","voltilor":"volt","voltmetre":"voltmetru","voltmetrele":"voltmetru","voltmetrelor":"voltmetru","voltmetrul":"voltmetru","voltmetrule":"voltmetru","voltmetrului":"voltmetru","voltul":"volt","voltule":"volt","voltului":"volt","volubila":["volubilă","volubil","volubila","volubil"],"volubile":"volubil","volubilele":"volubil","volubili":"volubil","volubilii":"volubil","volubilitatea":"volubilitate","volubilitati":"volubilitate","volubilitatii":"volubilitate","volubilul":"volubil","volul":"vol","volule":"vol","volului":"vol","volumase":"volumaș","volumasele":"volumaș","volumaselor":"volumaș","volumasul":"volumaș","volumasule":"volumaș","volumasului":"volumaș","volume":"volum","volumele":"volum","volumelor":"volum","volumetre":"volumetru","volumetrele":"volumetru","volumetrelor":"volumetru","volumetria":"volumetrie","volumetrica":["volumetrică","volumetric","volumetrica","volumetric"],"volumetrice":"volumetric","volumetricele":"volumetric","volumetrici":"volumetric","volumetricii":"volumetric","volumetricul":"volumetric","volumetriei":"volumetrie","volumetrii":"volumetrie","volumetrul":"volumetru","volumetrule":"volumetru","volumetrului":"volumetru","volumica":["volumică","volumic","volumica","volumic"],"volumice":"volumic","volumicele":"volumic","volumici":"volumic","volumicii":"volumic","volumicul":"volumic","voluminitatea":"voluminitate","voluminitati":"voluminitate","voluminitatii":"voluminitate","voluminoasa":["voluminoasă","voluminos","voluminoasa","voluminos"],"voluminoase":"voluminos","voluminoasele":"voluminos","voluminosi":"voluminos","voluminosii":"voluminos","voluminosul":"voluminos","voluminozitatea":"voluminozitate","voluminozitati":"voluminozitate","voluminozitatii":"voluminozitate","volumul":"volum","volumule":"volum","volumului":"volum","voluntara":["voluntară","voluntar","voluntara","voluntar"],"voluntare":["voluntare","voluntar","voluntare","voluntară"],"voluntarei":"voluntară","voluntarele":["voluntarele","voluntar","voluntarele","voluntară"],"voluntarelor":"voluntară","voluntari":"voluntar","voluntariatul":"voluntariat","voluntariatule":"voluntariat","voluntariatului":"voluntariat","voluntarii":"voluntar","voluntarilor":"voluntar","voluntarismul":"voluntarism","voluntarismule":"voluntarism","voluntarismului":"voluntarism","voluntarista":["voluntaristă","voluntarist","voluntarista","voluntarist"],"voluntariste":"voluntarist","voluntaristele":"voluntarist","voluntaristi":"voluntarist","voluntaristii":"voluntarist","voluntaristul":"voluntarist","voluntarul":"voluntar","voluntarule":"voluntar","voluntarului":"voluntar","voluptatea":"voluptate","voluptati":["voluptăți","voluptate","voluptati","voluptate"],"voluptatii":"voluptate","voluptatile":"voluptate","voluptatilor":"voluptate","voluptoasa":["voluptoasă","voluptos","voluptoasa","voluptos"],"voluptoase":"voluptos","voluptoasele":"voluptos","voluptosi":"voluptos","voluptosii":"voluptos","voluptosul":"voluptos","voluptuoasa":["voluptuoasă","voluptuos","voluptuoasa","voluptuos"],"voluptuoase":"voluptuos","voluptuoasele":"voluptuos","voluptuosi":"voluptuos","voluptuosii":"voluptuos","voluptuosul":"voluptuos","voluptuozitatea":"voluptuozitate","voluptuozitati":"voluptuozitate","voluptuozitatii":"voluptuozitate","volute":"volută","volutei":"volută","volutele":"volută","volutelor":"volută","volvulusul":"volvulus","volvulusule":"volvulus","volvulusului":"volvulus","vom":["vom","voame","vom","voi"],"vomai":"voma","vomam":["vomăm","voma","vomam","voma"],"vomand":["vomând","voame","vomând","voma"],"vomara":"voma","vomaram":"voma","vomarati":"voma","vomarea":"vomare","vomari":"vomare","vomarii":"vomare","vomarile":"vomare","vomarilor":"vomare","vomase":"voma","vomasem":"voma","vomasera":"voma","vomaseram":"voma","vomaserati":"voma","vomasesi":"voma","vomasi":"voma","vomat":"voma","vomata":["vomată","vomat","vomata","vomat"],"vomate":"vomat","vomatele":"vomat","vomati":["vomați","voma","vomați","vomat"],"vomatii":"vomat","vomatul":"vomat","vomaturi":"vomătură","vomaturii":"vomătură","vomaturile":"vomătură","vomaturilor":"vomătură","vomau":"voma","vome":"vomă","vomea":"voame","vomeai":"voame","vomeam":"voame","vomeati":"voame","vomeau":"voame","vomeaza":"voma","vomei":"vomă","vomele":"vomă","vomelor":"vomă","vomere":"vomer","vomerele":"vomer","vomerelor":"vomer","vomeriana":["vomeriană","vomerian","vomeriana","vomerian"],"vomerianul":"vomerian","vomeriene":"vomerian","vomerienele":"vomerian","vomerieni":"vomerian","vomerienii":"vomerian","vomerul":"vomer","vomerule":"vomer","vomerului":"vomer","vomez":"voma","vomezi":"voma","vomi":"voame","vomica":["vomică","vomic","vomica","vomic"],"vomice":"vomic","vomicele":"vomic","vomici":"vomic","vomicii":"vomic","vomicul":"vomic","vomismente":"vomisment","vomismentele":"vomisment","vomismentelor":"vomisment","vomismentul":"vomisment","vomismentule":"vomisment","vomismentului":"vomisment","vomit":"vomita","vomitai":"vomita","vomitam":["vomităm","vomita","vomitam","vomita"],"vomitand":"vomita","vomitara":"vomita","vomitaram":"vomita","vomitarati":"vomita","vomitarea":"vomitare","vomitari":"vomitare","vomitarii":"vomitare","vomitarile":"vomitare","vomitarilor":"vomitare","vomitase":"vomita","vomitasem":"vomita","vomitasera":"vomita","vomitaseram":"vomita","vomitaserati":"vomita","vomitasesi":"vomita","vomitasi":"vomita","vomitat":"vomita","vomitati":"vomita","vomitau":"vomita","vomite":"vomita","vomiti":"vomita","vomitiva":["vomitivă","vomitiv","vomitiva","vomitiv"],"vomitive":"vomitiv","vomitivele":"vomitiv","vomitivi":"vomitiv","vomitivii":"vomitiv","vomitivul":"vomitiv","vomitorii":"vomitoriu","vomitoriile":"vomitoriu","vomitoriilor":"vomitoriu","vomitoriul":"vomitoriu","vomitoriule":"vomitoriu","vomitoriului":"vomitoriu","vomu":"voame","vomui":"voame","vomura":"voame","vomuram":"voame","vomurati":"voame","vomuse":"voame","vomusem":"voame","vomusera":"voame","vomuseram":"voame","vomuserati":"voame","vomusesi":"voame","vomusi":"voame","vomut":"voame","voniceri":"voinicer","vopaite":"vopaiță","vopaitei":"vopaiță","vopaitele":"vopaiță","vopaitelor":"vopaiță","vopsea":"vopsi","vopseai":"vopsi","vopseam":"vopsi","vopseati":"vopsi","vopseau":"vopsi","vopselariea":"vopselărie","vopselarii":"vopselărie","vopselariii":"vopselărie","vopselariile":"vopselărie","vopselariilor":"vopselărie","vopsele":["vopsele","vopsea","vopsele","vopseală"],"vopselei":"vopseală","vopselele":"vopseală","vopselelor":"vopseală","vopseli":"vopseală","vopsesc":"vopsi","vopseste":"vopsi","vopsesti":"vopsi","vopsii":"vopsi","vopsim":"vopsi","vopsind":"vopsi","vopsira":"vopsi","vopsiram":"vopsi","vopsirati":"vopsi","vopsirea":"vopsire","vopsiri":"vopsire","vopsirii":"vopsire","vopsirile":"vopsire","vopsirilor":"vopsire","vopsise":"vopsi","vopsisem":"vopsi","vopsisera":"vopsi","vopsiseram":"vopsi","vopsiserati":"vopsi","vopsisesi":"vopsi","vopsisi":"vopsi","vopsit":"vopsi","vopsita":["vopsită","vopsit","vopsita","vopsit"],"vopsite":"vopsit","vopsitele":"vopsit","vopsiti":["vopsiți","vopsi","vopsiți","vopsit"],"vopsitii":"vopsit","vopsitoarea":"vopsitoare","vopsitoarei":"vopsitoare","vopsitoarele":"vopsitoare","vopsitoarelor":"vopsitoare","vopsitori":"vopsitor","vopsitoria":"vopsitorie","vopsitoriei":"vopsitorie","vopsitorii":["vopsitorii","vopsitor","vopsitorii","vopsitorie"],"vopsitoriile":"vopsitorie","vopsitoriilor":"vopsitorie","vopsitorilor":"vopsitor","vopsitorul":"vopsitor","vopsitorule":"vopsitor","vopsitorului":"vopsitor","vopsitul":"vopsit","vor":["vor","voi","vor","vrea"],"voracea":"vorace","voracele":"vorace","voraci":"vorace","voracii":"vorace","voracitatea":"voracitate","voracitati":"voracitate","voracitatii":"voracitate","vorbagiuul":"vorbagiu","vorbagiuule":"vorbagiu","vorbagiuului":"vorbagiu","vorbara":["vorbară","vorbar","vorbara","vorbar"],"vorbaraiea":"vorbăraie","vorbaraiei":"vorbăraie","vorbaraiele":"vorbăraie","vorbaraielor":"vorbăraie","vorbare":"vorbar","vorbareata":["vorbareață","vorbareț","vorbareața","vorbareț","vorbăreață","vorbăreț","vorbăreața","vorbăreț"],"vorbarele":"vorbar","vorbarete":["vorbărețe","vorbăreață","vorbarețe","vorbareț","vorbărețe","vorbăreț"],"vorbaretei":"vorbăreață","vorbaretele":["vorbărețele","vorbăreață","vorbarețele","vorbareț","vorbărețele","vorbăreț"],"vorbaretelor":"vorbăreață","vorbareti":["vorbareți","vorbareț","vorbăreți","vorbăreț"],"vorbaretia":"vorbăreție","vorbaretiei":"vorbăreție","vorbaretii":["vorbareții","vorbareț","vorbăreții","vorbăreț","vorbăreții","vorbăreție"],"vorbaretul":["vorbarețul","vorbareț","vorbărețul","vorbăreț"],"vorbari":"vorbar","vorbaria":"vorbărie","vorbariei":"vorbărie","vorbarii":["vorbarii","vorbar","vorbării","vorbărie"],"vorbarita":["vorbariță","vorbariț","vorbarița","vorbariț"],"vorbarite":"vorbariț","vorbaritele":"vorbariț","vorbariti":"vorbariț","vorbaritii":"vorbariț","vorbaritul":"vorbariț","vorbariuul":"vorbariu","vorbariuule":"vorbariu","vorbariuului":"vorbariu","vorbarul":"vorbar","vorbe":"vorbă","vorbea":"vorbi","vorbeai":"vorbi","vorbeam":"vorbi","vorbeati":"vorbi","vorbeau":"vorbi","vorbei":"vorbă","vorbele":"vorbă","vorbelor":"vorbă","vorbesc":"vorbi","vorbeste":"vorbi","vorbeste de funie in casa spanzuratului":"vorbi de funie în casa spânzuratului","vorbeste singur":"vorbi singur","vorbesti":"vorbi","vorbii":"vorbi","vorbim":"vorbi","vorbind":"vorbi","vorbira":"vorbi","vorbiram":"vorbi","vorbirati":"vorbi","vorbirea":"vorbire","vorbiri":"vorbire","vorbirii":"vorbire","vorbirile":"vorbire","vorbirilor":"vorbire","vorbise":"vorbi","vorbisem":"vorbi","vorbisera":"vorbi","vorbiseram":"vorbi","vorbiserati":"vorbi","vorbisesi":"vorbi","vorbisi":"vorbi","vorbisoare":"vorbișoară","vorbisoarei":"vorbișoară","vorbisoarele":"vorbișoară","vorbisoarelor":"vorbișoară","vorbit":"vorbi","vorbit de funie in casa spanzuratului":"vorbi de funie în casa spânzuratului","vorbit singur":"vorbi singur","vorbita":["vorbită","vorbit","vorbita","vorbit"],"vorbite":["vorbite","vorbit","vorbițe","vorbiță"],"vorbitei":"vorbiță","vorbitele":"vorbit","vorbiti":["vorbiți","vorbi","vorbiți","vorbit"],"vorbitii":"vorbit","vorbitoarea":"vorbitoare","vorbitoarei":"vorbitoare","vorbitoarele":"vorbitoare","vorbitoarelor":"vorbitoare","vorbitori":"vorbitor","vorbitori nativi":"vorbitor nativ","vorbitorii":"vorbitor","vorbitorilor":"vorbitor","vorbitorul":"vorbitor","vorbitorule":"vorbitor","vorbitorului":"vorbitor","vorbitul":"vorbit","vorbiture":"vorbitură","vorbiturei":"vorbitură","vorbuleane":"vorbuleană","vorbuleanei":"vorbuleană","vorbulite":"vorbuliță","vorbulitei":"vorbuliță","vorbulitele":"vorbuliță","vorbulitelor":"vorbuliță","vorbusoare":"vorbușoară","vorbusoarei":"vorbușoară","vorbusoarele":"vorbușoară","vorbusoarelor":"vorbușoară","vorbute":"vorbuță","vorbutei":"vorbuță","vorbutele":"vorbuță","vorbutelor":"vorbuță","vornicese":"vorniceasă","vornicesei":"vorniceasă","vornicesele":"vorniceasă","vorniceselor":"vorniceasă","vornici":"vornic","vornicii":"vornic","vornicilor":"vornic","vornicite":"vorniciță","vornicitei":"vorniciță","vornicitele":"vorniciță","vornicitelor":"vorniciță","vornicul":"vornic","vornicule":"vornic","vornicului":"vornic","voroave":"voroavă","voroavei":"voroavă","vorovania":"vorovanie","vorovaniei":"vorovanie","vorovanii":"vorovanie","vorovea":"vorovi","voroveai":"vorovi","voroveam":"vorovi","voroveati":"vorovi","voroveau":"vorovi","vorovesc":"vorovi","voroveste":"vorovi","vorovesti":"vorovi","vorovii":"vorovi","vorovim":"vorovi","vorovind":"vorovi","vorovira":"vorovi","voroviram":"vorovi","vorovirati":"vorovi","vorovirea":"vorovire","voroviri":"vorovire","vorovirii":"vorovire","vorovirile":"vorovire","vorovirilor":"vorovire","vorovise":"vorovi","vorovisem":"vorovi","vorovisera":"vorovi","voroviseram":"vorovi","voroviserati":"vorovi","vorovisesi":"vorovi","vorovisi":"vorovi","vorovit":"vorovi","voroviti":"vorovi","vortexul":"vortex","vortexule":"vortex","vortexului":"vortex","vortexuri":"vortex","vortexurile":"vortex","vortexurilor":"vortex","vorticele":"vorticelă","vorticelei":"vorticelă","vorticelele":"vorticelă","vorticelelor":"vorticelă","vorticismul":"vorticism","vorticismule":"vorticism","vorticismului":"vorticism","voscresne":"voscreasnă","voscresnei":"voscreasnă","voscresnele":"voscreasnă","voscresnelor":"voscreasnă","vostra":"voastră","vostri":["voștri","voi","voștri","vostru"],"vostru":"voi","votai":"vota","votam":["votăm","vota","votam","vota"],"votand":"vota","votante":"votantă","votantei":"votantă","votantele":"votantă","votantelor":"votantă","votanti":"votant","votantii":"votant","votantilor":"votant","votantul":"votant","votantule":"votant","votantului":"votant","votara":"vota","votaram":"vota","votarati":"vota","votarea":"votare","votari":"votare","votarii":"votare","votarile":"votare","votarilor":"votare","votase":"vota","votasem":"vota","votasera":"vota","votaseram":"vota","votaserati":"vota","votasesi":"vota","votasi":"vota","votat":"vota","votata":["votată","votat","votata","votat"],"votate":"votat","votatele":"votat","votati":["votați","vota","votați","votat"],"votatia":"votație","votatiei":"votație","votatii":["votații","votat","votații","votație"],"votatiile":"votație","votatiilor":"votație","votatul":"votat","votau":"vota","votci":"votcă","votcii":"votcă","votcile":"votcă","votcilor":"votcă","voteaza":"vota","votez":"vota","votezi":"vota","votiva":["votivă","votiv","votiva","votiv"],"votive":"votiv","votivele":"votiv","votivi":"votiv","votivii":"votiv","votivul":"votiv","votul":"vot","votule":"vot","votului":"vot","voturi":"vot","voturi de blam":"vot de blam","voturi de incredere":"vot de încredere","voturi de neincredere":"vot de neîncredere","voturile":"vot","voturilor":"vot","voua":"voi","vozglasenia":"vozglașenie","vozglaseniei":"vozglașenie","vozglasenii":"vozglașenie","vozglaseniile":"vozglașenie","vozglaseniilor":"vozglașenie","vozglasul":"vozglas","vozglasule":"vozglas","vozglasului":"vozglas","vozglasuri":"vozglas","vozglasurile":"vozglas","vozglasurilor":"vozglas","vrabeteul":"vrăbete","vrabeteule":"vrăbete","vrabeteului":"vrăbete","vrabeti":["vrăbeți","vrăbeț","vrăbeți","vrăbete"],"vrabetii":["vrăbeții","vrăbeț","vrăbeții","vrăbete"],"vrabetilor":["vrăbeților","vrăbeț","vrăbeților","vrăbete"],"vrabetul":"vrăbeț","vrabetule":"vrăbeț","vrabetului":"vrăbeț","vrabia":"vrabie","vrabiei":"vrabie","vrabieri":"vrăbier","vrabierii":"vrăbier","vrabierilor":"vrăbier","vrabierul":"vrăbier","vrabierule":"vrăbier","vrabierului":"vrăbier","vrabii":"vrabie","vrabii de camp":"vrabie de câmp","vrabii de casa":"vrabie de casă","vrabii negricioase":"vrabie negricioasă","vrabiile":"vrabie","vrabiilor":"vrabie","vrabioare":"vrăbioară","vrabioarei":"vrăbioară","vrabioarele":"vrăbioară","vrabioarelor":"vrăbioară","vrabioii":"vrăbioi","vrabioilor":"vrăbioi","vrabioiul":"vrăbioi","vrabioiule":"vrăbioi","vrabioiului":"vrăbioi","vrabiute":"vrăbiuță","vrabiutei":"vrăbiuță","vrabiutele":"vrăbiuță","vrabiutelor":"vrăbiuță","vracebniceasca":["vrăcebnicească","vrăcebnicesc","vrăcebniceasca","vrăcebnicesc"],"vracebnicescul":"vrăcebnicesc","vracebnicesti":"vrăcebnicesc","vracebnicestii":"vrăcebnicesc","vracebnicestile":"vrăcebnicesc","vracebnicia":"vrăcebnicie","vracebniciei":"vrăcebnicie","vracebnicii":"vrăcebnicie","vracebniciile":"vrăcebnicie","vracebniciilor":"vrăcebnicie","vracii":"vraci","vracilor":"vraci","vracite":"vrăciță","vracitei":"vrăciță","vracitele":"vrăciță","vracitelor":"vrăciță","vraciul":"vraci","vraciule":"vraci","vraciului":"vraci","vracul":"vrac","vracule":"vrac","vracului":"vrac","vracuri":"vrac","vracurile":"vrac","vracurilor":"vrac","vrafuia":"vrăfui","vrafuiai":"vrăfui","vrafuiam":"vrăfui","vrafuiati":"vrăfui","vrafuiau":"vrăfui","vrafuiesc":"vrăfui","vrafuieste":"vrăfui","vrafuiesti":"vrăfui","vrafuii":"vrăfui","vrafuim":"vrăfui","vrafuind":"vrăfui","vrafuira":"vrăfui","vrafuiram":"vrăfui","vrafuirati":"vrăfui","vrafuise":"vrăfui","vrafuisem":"vrăfui","vrafuisera":"vrăfui","vrafuiseram":"vrăfui","vrafuiserati":"vrăfui","vrafuisesi":"vrăfui","vrafuisi":"vrăfui","vrafuit":"vrăfui","vrafuiti":"vrăfui","vraful":"vraf","vrafule":"vraf","vrafului":"vraf","vrafuri":"vraf","vrafurile":"vraf","vrafurilor":"vraf","vrajari":"vrăjar","vrajarii":"vrăjar","vrajarilor":"vrăjar","vrajarul":"vrăjar","vrajarule":"vrăjar","vrajarului":"vrăjar","vrajbe":"vrajbă","vrajbei":"vrajbă","vrajbele":"vrajbă","vrajbelor":"vrajbă","vrajbia":"vrăjbie","vrajbiei":"vrăjbie","vrajbii":"vrăjbie","vrajbiile":"vrăjbie","vrajbiilor":"vrăjbie","vraje":"vrajă","vrajea":"vrăji","vrajeai":"vrăji","vrajealo":"vrăjeală","vrajeam":"vrăji","vrajeati":"vrăji","vrajeau":"vrăji","vrajeli":"vrăjeală","vrajelii":"vrăjeală","vrajelile":"vrăjeală","vrajelilor":"vrăjeală","vrajesc":"vrăji","vrajeste":"vrăji","vrajesti":"vrăji","vraji":"vrajă","vrajii":["vrăjii","vrajă","vrăjii","vrăji"],"vrajile":"vrajă","vrajilor":"vrajă","vrajim":"vrăji","vrajind":"vrăji","vrajira":"vrăji","vrajiram":"vrăji","vrajirati":"vrăji","vrajirea":"vrăjire","vrajiri":"vrăjire","vrajirii":"vrăjire","vrajirile":"vrăjire","vrajirilor":"vrăjire","vrajise":"vrăji","vrajisem":"vrăji","vrajisera":"vrăji","vrajiseram":"vrăji","vrajiserati":"vrăji","vrajisesi":"vrăji","vrajisi":"vrăji","vrajit":"vrăji","vrajita":["vrăjită","vrăjit","vrăjita","vrăjit"],"vrajite":"vrăjit","vrajitele":"vrăjit","vrajiti":["vrăjiți","vrăji","vrăjiți","vrăjit"],"vrajitii":"vrăjit","vrajitoarea":"vrăjitoare","vrajitoarei":"vrăjitoare","vrajitoarele":"vrăjitoare","vrajitoarelor":"vrăjitoare","vrajitoreasca":["vrăjitorească","vrăjitoresc","vrăjitoreasca","vrăjitoresc"],"vrajitorescul":"vrăjitoresc","vrajitorese":"vrăjitoreasă","vrajitoresei":"vrăjitoreasă","vrajitoresele":"vrăjitoreasă","vrajitoreselor":"vrăjitoreasă","vrajitoresti":"vrăjitoresc","vrajitorestii":"vrăjitoresc","vrajitorestile":"vrăjitoresc","vrajitori":"vrăjitor","vrajitoria":"vrăjitorie","vrajitoriei":"vrăjitorie","vrajitorii":["vrăjitorii","vrăjitor","vrăjitorii","vrăjitorie"],"vrajitoriile":"vrăjitorie","vrajitoriilor":"vrăjitorie","vrajitorilor":"vrăjitor","vrajitorul":"vrăjitor","vrajitorule":"vrăjitor","vrajitorului":"vrăjitor","vrajitul":"vrăjit","vrajituri":"vrăjitură","vrajiturii":"vrăjitură","vrajiturile":"vrăjitură","vrajiturilor":"vrăjitură","vrajmasa":["vrăjmașă","vrăjmaș","vrăjmașa","vrăjmaș"],"vrajmase":["vrăjmașe","vrăjmaș","vrăjmașe","vrăjmașă"],"vrajmasea":"vrăjmăși","vrajmaseai":"vrăjmăși","vrajmaseam":"vrăjmăși","vrajmaseasca":["vrăjmășească","vrăjmășesc","vrăjmășeasca","vrăjmășesc"],"vrajmaseati":"vrăjmăși","vrajmaseau":"vrăjmăși","vrajmasei":"vrăjmașă","vrajmasele":["vrăjmașele","vrăjmaș","vrăjmașele","vrăjmașă"],"vrajmaselor":"vrăjmașă","vrajmasesc":"vrăjmăși","vrajmasescul":"vrăjmășesc","vrajmaseste":"vrăjmăși","vrajmasesti":["vrăjmășești","vrăjmășesc","vrăjmășești","vrăjmăși"],"vrajmasestii":"vrăjmășesc","vrajmasestile":"vrăjmășesc","vrajmasi":"vrăjmaș","vrajmasia":"vrăjmășie","vrajmasiei":"vrăjmășie","vrajmasii":["vrăjmașii","vrăjmaș","vrăjmășii","vrăjmăși","vrăjmășii","vrăjmășie"],"vrajmasiile":"vrăjmășie","vrajmasiilor":"vrăjmășie","vrajmasilor":"vrăjmaș","vrajmasim":"vrăjmăși","vrajmasind":"vrăjmăși","vrajmasira":"vrăjmăși","vrajmasiram":"vrăjmăși","vrajmasirati":"vrăjmăși","vrajmasise":"vrăjmăși","vrajmasisem":"vrăjmăși","vrajmasisera":"vrăjmăși","vrajmasiseram":"vrăjmăși","vrajmasiserati":"vrăjmăși","vrajmasisesi":"vrăjmăși","vrajmasisi":"vrăjmăși","vrajmasit":"vrăjmăși","vrajmasiti":"vrăjmăși","vrajmasoasa":["vrăjmășoasă","vrăjmășos","vrăjmășoasa","vrăjmășos"],"vrajmasoase":"vrăjmășos","vrajmasoasele":"vrăjmășos","vrajmasosi":"vrăjmășos","vrajmasosii":"vrăjmășos","vrajmasosul":"vrăjmășos","vrajmasul":"vrăjmaș","vrajmasule":"vrăjmaș","vrajmasului":"vrăjmaș","vramite":"vramiță","vramitei":"vramiță","vramitele":"vramiță","vramitelor":"vramiță","vranceanul":"vrâncean","vranceanule":"vrâncean","vranceanului":"vrâncean","vranceaua":"Vrancea","vrancele":"Vrancea","vrancelei":"Vrancea","vrancence":"vrânceancă","vrancencei":"vrânceancă","vrancencele":"vrânceancă","vrancencelor":"vrânceancă","vrancene":"vrânceană","vranceneasca":["vrâncenească","vrâncenesc","vrânceneasca","vrâncenesc"],"vrancenei":"vrânceană","vrancenele":"vrânceană","vrancenelor":"vrânceană","vrancenescul":"vrâncenesc","vrancenesti":"vrâncenesc","vrancenestii":"vrâncenesc","vrancenestile":"vrâncenesc","vranceni":"vrâncean","vrancenii":"vrâncean","vrancenilor":"vrâncean","vrand":"vrea","vranite":"vraniță","vranitei":"vraniță","vranitele":"vraniță","vranitelor":"vraniță","vrasmasa":["vrășmașă","vrășmaș","vrășmașa","vrășmaș"],"vrasmase":["vrășmașe","vrășmaș","vrășmașe","vrășmașă"],"vrasmasei":"vrășmașă","vrasmasele":["vrășmașele","vrășmaș","vrășmașele","vrășmașă"],"vrasmaselor":"vrășmașă","vrasmasi":"vrășmaș","vrasmasii":"vrășmaș","vrasmasul":"vrășmaș","vrasnica":["vrâsnică","vrâsnic","vrâsnica","vrâsnic"],"vrasnice":"vrâsnic","vrasnicele":"vrâsnic","vrasnici":"vrâsnic","vrasnicii":"vrâsnic","vrasnicul":"vrâsnic","vrastatela":["vrâstățelă","vrâstățel","vrâstățela","vrâstățel"],"vrastatele":"vrâstățel","vrastatelele":"vrâstățel","vrastateli":"vrâstățel","vrastatelii":"vrâstățel","vrastatelul":"vrâstățel","vraste":"vrâstă","vrastei":"vrâstă","vrastele":"vrâstă","vrastelor":"vrâstă","vrastnica":["vrâstnică","vrâstnic","vrâstnica","vrâstnic"],"vrastnice":"vrâstnic","vrastnicela":["vrâstnicelă","vrâstnicel","vrâstnicela","vrâstnicel"],"vrastnicele":["vrâstnicele","vrâstnic","vrâstnicele","vrâstnicel"],"vrastnicelele":"vrâstnicel","vrastniceli":"vrâstnicel","vrastnicelii":"vrâstnicel","vrastnicelul":"vrâstnicel","vrastnici":"vrâstnic","vrastnicia":"vrâstnicie","vrastniciei":"vrâstnicie","vrastnicii":["vrâstnicii","vrâstnic","vrâstnicii","vrâstnicie"],"vrastniciile":"vrâstnicie","vrastniciilor":"vrâstnicie","vrastnicul":"vrâstnic","vrastulite":"vrâstuliță","vrastulitei":"vrâstuliță","vrastute":"vrâstuță","vrastutei":"vrâstuță","vravuia":"vrăvui","vravuiai":"vrăvui","vravuiam":"vrăvui","vravuiati":"vrăvui","vravuiau":"vrăvui","vravuiesc":"vrăvui","vravuieste":"vrăvui","vravuiesti":"vrăvui","vravuii":"vrăvui","vravuim":"vrăvui","vravuind":"vrăvui","vravuira":"vrăvui","vravuiram":"vrăvui","vravuirati":"vrăvui","vravuise":"vrăvui","vravuisem":"vrăvui","vravuisera":"vrăvui","vravuiseram":"vrăvui","vravuiserati":"vrăvui","vravuisesi":"vrăvui","vravuisi":"vrăvui","vravuit":"vrăvui","vravuiti":"vrăvui","vravul":"vrav","vravule":"vrav","vravului":"vrav","vravuri":"vrav","vravurile":"vrav","vravurilor":"vrav","vreai":"vrea","vream":"vrea","vreascul":"vreasc","vreascule":"vreasc","vreascului":"vreasc","vreascuri":"vreasc","vreascurile":"vreasc","vreascurilor":"vreasc","vreati":"vrea","vreau":"vrea","vrednica":["vrednică","vrednic","vrednica","vrednic"],"vrednice":"vrednic","vrednicea":"vrednici","vredniceai":"vrednici","vredniceam":"vrednici","vredniceati":"vrednici","vredniceau":"vrednici","vrednicela":["vrednicelă","vrednicel","vrednicela","vrednicel"],"vrednicele":["vrednicele","vrednic","vrednicele","vrednicel"],"vrednicelele":"vrednicel","vredniceli":"vrednicel","vrednicelii":"vrednicel","vrednicelul":"vrednicel","vrednicesc":"vrednici","vredniceste":"vrednici","vrednicesti":"vrednici","vrednici":"vrednic","vrednicia":"vrednicie","vredniciei":"vrednicie","vrednicii":["vrednicii","vrednic","vrednicii","vrednici","vrednicii","vrednicie"],"vredniciile":"vrednicie","vredniciilor":"vrednicie","vrednicim":"vrednici","vrednicind":"vrednici","vrednicira":"vrednici","vredniciram":"vrednici","vrednicirati":"vrednici","vrednicise":"vrednici","vrednicisem":"vrednici","vrednicisera":"vrednici","vredniciseram":"vrednici","vredniciserati":"vrednici","vrednicisesi":"vrednici","vrednicisi":"vrednici","vrednicit":"vrednici","vrednicite":"vredniciță","vrednicitei":"vredniciță","vredniciti":"vrednici","vrednicul":"vrednic","vrei":"vrea","vrejul":"vrej","vrejule":"vrej","vrejului":"vrej","vrejuri":"vrej","vrejurile":"vrej","vrejurilor":"vrej","vrem":"vrea","vremea":"vreme","vremelnica":["vremelnică","vremelnic","vremelnica","vremelnic"],"vremelnice":"vremelnic","vremelniceasca":["vremelnicească","vremelnicesc","vremelniceasca","vremelnicesc"],"vremelnicele":"vremelnic","vremelnicescul":"vremelnicesc","vremelnicesti":"vremelnicesc","vremelnicestii":"vremelnicesc","vremelnicestile":"vremelnicesc","vremelnici":"vremelnic","vremelnicia":"vremelnicie","vremelniciei":"vremelnicie","vremelnicii":["vremelnicii","vremelnic","vremelnicii","vremelnicie"],"vremelnicul":"vremelnic","vremi":["vremi","vreme","vremi","vremuri"],"vremii":"vreme","vremile":"vremurile","vremilor":"vremurilor","vremuiele":"vremuială","vremuielei":"vremuială","vremuielele":"vremuială","vremuielelor":"vremuială","vremuieli":"vremuială","vremuirea":"vremuire","vremuiri":"vremuire","vremuirii":"vremuire","vremuirile":"vremuire","vremuirilor":"vremuire","vremuri":["vremuri","vreme","vremuri","vremi"],"vremurile":["vremurile","vreme","vremurile","vremile"],"vremurilor":["vremurilor","vreme","vremurilor","vremilor"],"vremute":"vremuță","vremutei":"vremuță","vremutele":"vremuță","vremutelor":"vremuță","vrenicuta":["vrenicuță","vrenicuț","vrenicuța","vrenicuț"],"vrenicute":"vrenicuț","vrenicutele":"vrenicuț","vrenicuti":"vrenicuț","vrenicutii":"vrenicuț","vrenicutul":"vrenicuț","vreo":"vreun","vreri":"vrere","vrescure":"vrescur","vrescurele":["vrescurele","vrescur","vrescurele","vrescurel"],"vrescurelele":"vrescurel","vrescurelelor":"vrescurel","vrescurelor":"vrescur","vrescurelul":"vrescurel","vrescurelule":"vrescurel","vrescurelului":"vrescurel","vrescurul":"vrescur","vrescurule":"vrescur","vrescurului":"vrescur","vreti":"vrea","vreuna":"vreunul","vreunele":"vreunul","vreunii":"vreunul","vria":"vrie","vriei":"vrie","vrii":"vrie","vriile":"vrie","vriilor":"vrie","vrile":"vrilă","vrilei":"vrilă","vrilele":"vrilă","vrilelor":"vrilă","vro":"vrun","vroi":"vrea","vroia":"vroi","vroiai":"vroi","vroiam":"vroi","vroiati":"vroi","vroiau":"vroi","vroiesc":"vroi","vroieste":"vroi","vroiesti":"vroi","vroii":"vroi","vroim":"vroi","vroind":"vroi","vrointe":"vroință","vrointei":"vroință","vrointele":"vroință","vrointelor":"vroință","vroira":"vroi","vroiram":"vroi","vroirati":"vroi","vroise":"vroi","vroisem":"vroi","vroisera":"vroi","vroiseram":"vroi","vroiserati":"vroi","vroisesi":"vroi","vroisi":"vroi","vroit":"vroi","vroiti":"vroi","vroitoare":"vroitor","vroitoarea":"vroitor","vroitoarele":"vroitor","vroitori":"vroitor","vroitorii":"vroitor","vroitorul":"vroitor","vruhi":"vruh","vruhii":"vruh","vruhilor":"vruh","vruhul":"vruh","vruhule":"vruh","vruhului":"vruh","vrui":"vrea","vrun":"vreun","vrura":"vrea","vruram":"vrea","vrurati":"vrea","vruse":"vrea","vrusem":"vrea","vrusera":"vrea","vruseram":"vrea","vruserati":"vrea","vrusesi":"vrea","vrusi":"vrea","vrut":"vrea","vruta":["vrută","vrut","vruta","vrut"],"vrute":"vrut","vrutele":"vrut","vruti":"vrut","vrutii":"vrut","vrutul":"vrut","vsei":"vie","vsera":"vie","vserati":"vie","vsese":"vie","vsesera":"vie","vseseram":"vie","vseserati":"vie","vsesesi":"vie","vsesi":"vie","vuia":"vui","vuiai":"vui","vuiam":"vui","vuiati":"vui","vuiau":"vui","vuieli":"vuială","vuielii":"vuială","vuielile":"vuială","vuielilor":"vuială","vuiesc":"vui","vuieste":"vui","vuiesti":"vui","vuiet":"vuieta","vuietai":"vuieta","vuietam":["vuietăm","vuieta","vuietam","vuieta"],"vuietand":"vuieta","vuietara":"vuieta","vuietaram":"vuieta","vuietarati":"vuieta","vuietase":"vuieta","vuietasem":"vuieta","vuietasera":"vuieta","vuietaseram":"vuieta","vuietaserati":"vuieta","vuietasesi":"vuieta","vuietasi":"vuieta","vuietat":"vuieta","vuietati":"vuieta","vuietau":"vuieta","vuiete":"vuiet","vuietele":"vuiet","vuietelor":"vuiet","vuieti":"vuieta","vuietul":"vuiet","vuietule":"vuiet","vuietului":"vuiet","vuii":"vui","vuim":"vui","vuind":"vui","vuira":"vui","vuiram":"vui","vuirati":"vui","vuise":"vui","vuisem":"vui","vuisera":"vui","vuiseram":"vui","vuiserati":"vui","vuisesi":"vui","vuisi":"vui","vuit":"vui","vuiti":"vui","vuitoare":"vuitor","vuitoarea":"vuitor","vuitoarele":"vuitor","vuitori":"vuitor","vuitorii":"vuitor","vuitorul":"vuitor","vuitul":"vuit","vuitule":"vuit","vuitului":"vuit","vulcani":"vulcan","vulcani activi":"vulcan activ","vulcani noroiosi":"vulcan noroios","vulcanica":["vulcanică","vulcanic","vulcanica","vulcanic"],"vulcanice":"vulcanic","vulcanicele":"vulcanic","vulcanici":"vulcanic","vulcanicii":"vulcanic","vulcanicul":"vulcanic","vulcanii":"vulcan","vulcanilor":"vulcan","vulcanismul":"vulcanism","vulcanismule":"vulcanism","vulcanismului":"vulcanism","vulcanite":"vulcanit","vulcanitele":"vulcanit","vulcanitelor":"vulcanit","vulcanitul":"vulcanit","vulcanitule":"vulcanit","vulcanitului":"vulcanit","vulcanizai":"vulcaniza","vulcanizam":["vulcanizăm","vulcaniza","vulcanizam","vulcaniza"],"vulcanizand":"vulcaniza","vulcanizara":"vulcaniza","vulcanizaram":"vulcaniza","vulcanizarati":"vulcaniza","vulcanizarea":"vulcanizare","vulcanizari":"vulcanizare","vulcanizarii":"vulcanizare","vulcanizarile":"vulcanizare","vulcanizarilor":"vulcanizare","vulcanizase":"vulcaniza","vulcanizasem":"vulcaniza","vulcanizasera":"vulcaniza","vulcanizaseram":"vulcaniza","vulcanizaserati":"vulcaniza","vulcanizasesi":"vulcaniza","vulcanizasi":"vulcaniza","vulcanizat":"vulcaniza","vulcanizata":["vulcanizată","vulcanizat","vulcanizata","vulcanizat"],"vulcanizate":"vulcanizat","vulcanizatele":"vulcanizat","vulcanizati":["vulcanizați","vulcaniza","vulcanizați","vulcanizat"],"vulcanizatii":"vulcanizat","vulcanizatiunea":"vulcanizațiune","vulcanizatiuni":"vulcanizațiune","vulcanizatiunii":"vulcanizațiune","vulcanizatoarea":"vulcanizatoare","vulcanizatoarei":"vulcanizatoare","vulcanizatoarele":"vulcanizatoare","vulcanizatoarelor":"vulcanizatoare","vulcanizatori":"vulcanizator","vulcanizatorii":"vulcanizator","vulcanizatorilor":"vulcanizator","vulcanizatorul":"vulcanizator","vulcanizatorule":"vulcanizator","vulcanizatorului":"vulcanizator","vulcanizatul":"vulcanizat","vulcanizau":"vulcaniza","vulcanizeaza":"vulcaniza","vulcanizez":"vulcaniza","vulcanizezi":"vulcaniza","vulcanologe":"vulcanologă","vulcanologei":"vulcanologă","vulcanologele":"vulcanologă","vulcanologelor":"vulcanologă","vulcanologi":"vulcanolog","vulcanologia":"vulcanologie","vulcanologica":["vulcanologică","vulcanologic","vulcanologica","vulcanologic"],"vulcanologice":"vulcanologic","vulcanologicele":"vulcanologic","vulcanologici":"vulcanologic","vulcanologicii":"vulcanologic","vulcanologicul":"vulcanologic","vulcanologiei":"vulcanologie","vulcanologii":["vulcanologii","vulcanolog","vulcanologii","vulcanologie"],"vulcanologilor":"vulcanolog","vulcanologul":"vulcanolog","vulcanologule":"vulcanolog","vulcanologului":"vulcanolog","vulcanul":"vulcan","vulcanule":"vulcan","vulcanului":"vulcan","vulgara":["vulgară","vulgar","vulgara","vulgar"],"vulgare":"vulgar","vulgarele":"vulgar","vulgari":"vulgar"};
@@ -0,0 +1 @@
+export default {"vulgariceasca":["vulgaricească","vulgaricesc","vulgariceasca","vulgaricesc"],"vulgaricescul":"vulgaricesc","vulgaricesti":"vulgaricesc","vulgaricestii":"vulgaricesc","vulgaricestile":"vulgaricesc","vulgarii":"vulgar","vulgarisme":"vulgarism","vulgarismele":"vulgarism","vulgarismelor":"vulgarism","vulgarismul":"vulgarism","vulgarismule":"vulgarism","vulgarismului":"vulgarism","vulgaritatea":"vulgaritate","vulgaritati":"vulgaritate","vulgaritatii":"vulgaritate","vulgaritatile":"vulgaritate","vulgaritatilor":"vulgaritate","vulgarizai":"vulgariza","vulgarizam":["vulgarizăm","vulgariza","vulgarizam","vulgariza"],"vulgarizand":"vulgariza","vulgarizanta":["vulgarizantă","vulgarizant","vulgarizanta","vulgarizant"],"vulgarizante":"vulgarizant","vulgarizantele":"vulgarizant","vulgarizanti":"vulgarizant","vulgarizantii":"vulgarizant","vulgarizantul":"vulgarizant","vulgarizara":"vulgariza","vulgarizaram":"vulgariza","vulgarizarati":"vulgariza","vulgarizarea":"vulgarizare","vulgarizari":"vulgarizare","vulgarizarii":"vulgarizare","vulgarizarile":"vulgarizare","vulgarizarilor":"vulgarizare","vulgarizase":"vulgariza","vulgarizasem":"vulgariza","vulgarizasera":"vulgariza","vulgarizaseram":"vulgariza","vulgarizaserati":"vulgariza","vulgarizasesi":"vulgariza","vulgarizasi":"vulgariza","vulgarizat":"vulgariza","vulgarizata":["vulgarizată","vulgarizat","vulgarizata","vulgarizat"],"vulgarizate":"vulgarizat","vulgarizatele":"vulgarizat","vulgarizati":["vulgarizați","vulgariza","vulgarizați","vulgarizat"],"vulgarizatii":"vulgarizat","vulgarizatoarea":"vulgarizatoare","vulgarizatoarei":"vulgarizatoare","vulgarizatoarele":"vulgarizatoare","vulgarizatoarelor":"vulgarizatoare","vulgarizatori":"vulgarizator","vulgarizatorii":"vulgarizator","vulgarizatorilor":"vulgarizator","vulgarizatorul":"vulgarizator","vulgarizatorule":"vulgarizator","vulgarizatorului":"vulgarizator","vulgarizatul":"vulgarizat","vulgarizau":"vulgariza","vulgarizeaza":"vulgariza","vulgarizez":"vulgariza","vulgarizezi":"vulgariza","vulgarul":"vulgar","vulgul":"vulg","vulgule":"vulg","vulgului":"vulg","vulnerabila":["vulnerabilă","vulnerabil","vulnerabila","vulnerabil"],"vulnerabile":"vulnerabil","vulnerabilele":"vulnerabil","vulnerabili":"vulnerabil","vulnerabilii":"vulnerabil","vulnerabilitatea":"vulnerabilitate","vulnerabilitati":"vulnerabilitate","vulnerabilitatii":"vulnerabilitate","vulnerabilul":"vulnerabil","vulnerai":"vulnera","vulneram":["vulnerăm","vulnera","vulneram","vulnera"],"vulnerand":"vulnera","vulnerara":"vulnera","vulneraram":"vulnera","vulnerarati":"vulnera","vulnerarea":"vulnerare","vulnerari":"vulnerare","vulnerarii":"vulnerare","vulnerarile":"vulnerare","vulnerarilor":"vulnerare","vulnerase":"vulnera","vulnerasem":"vulnera","vulnerasera":"vulnera","vulneraseram":"vulnera","vulneraserati":"vulnera","vulnerasesi":"vulnera","vulnerasi":"vulnera","vulnerat":"vulnera","vulnerata":["vulnerată","vulnerat","vulnerata","vulnerat"],"vulnerate":"vulnerat","vulneratele":"vulnerat","vulnerati":["vulnerați","vulnera","vulnerați","vulnerat"],"vulneratia":"vulnerație","vulneratiei":"vulnerație","vulneratii":["vulnerații","vulnerat","vulnerații","vulnerație"],"vulneratul":"vulnerat","vulnerau":"vulnera","vulnereaza":"vulnera","vulnerez":"vulnera","vulnerezi":"vulnera","vulpani":"vulpan","vulpanii":"vulpan","vulpanilor":"vulpan","vulpanul":"vulpan","vulpanule":"vulpan","vulpanului":"vulpan","vulpareasca":["vulpărească","vulpăresc","vulpăreasca","vulpăresc"],"vulparescul":"vulpăresc","vulparesti":"vulpăresc","vulparestii":"vulpăresc","vulparestile":"vulpăresc","vulparia":"vulpărie","vulpariei":"vulpărie","vulparii":"vulpărie","vulpariile":"vulpărie","vulpariilor":"vulpărie","vulpea":"vulpe","vulpeasca":["vulpească","vulpesc","vulpeasca","vulpesc"],"vulpenia":"vulpenie","vulpeniei":"vulpenie","vulpenii":"vulpenie","vulpeniile":"vulpenie","vulpeniilor":"vulpenie","vulpescul":"vulpesc","vulpesti":"vulpesc","vulpestii":"vulpesc","vulpestile":"vulpesc","vulpi":"vulpe","vulpi arctice":"vulpe arctică","vulpi argintii":"vulpe argintie","vulpi polare":"vulpe polară","vulpi zburatoare":"vulpe zburătoare","vulpii":"vulpe","vulpile":"vulpe","vulpilor":"vulpe","vulpisoare":"vulpișoară","vulpisoarei":"vulpișoară","vulpisoarele":"vulpișoară","vulpisoarelor":"vulpișoară","vulpite":"vulpiță","vulpitei":"vulpiță","vulpitele":"vulpiță","vulpitelor":"vulpiță","vulpoaice":"vulpoaică","vulpoaicei":"vulpoaică","vulpoaicele":"vulpoaică","vulpoaicelor":"vulpoaică","vulpoii":"vulpoi","vulpoilor":"vulpoi","vulpoiul":"vulpoi","vulpoiule":"vulpoi","vulpoiului":"vulpoi","vultani":"vultan","vultanii":"vultan","vultanilor":"vultan","vultanul":"vultan","vultanule":"vultan","vultanului":"vultan","vultoare":"vâltoare","vultoarea":"vultoare","vultoari":"vultoare","vultoarii":"vultoare","vultoarile":"vultoare","vultoarilor":"vultoare","vultori":"vultoare","vultuoasa":["vultuoasă","vultuos","vultuoasa","vultuos"],"vultuoase":"vultuos","vultuoasele":"vultuos","vultuosi":"vultuos","vultuosii":"vultuos","vultuosul":"vultuos","vulturasi":"vulturaș","vulturasii":"vulturaș","vulturasilor":"vulturaș","vulturasul":"vulturaș","vulturasule":"vulturaș","vulturasului":"vulturaș","vulture":"vultur","vultureasca":["vulturească","vulturesc","vultureasca","vulturesc"],"vulturei":"vulturel","vultureii":"vulturel","vultureilor":"vulturel","vulturelul":"vulturel","vulturelule":"vulturel","vulturelului":"vulturel","vulturescul":"vulturesc","vulturesti":"vulturesc","vulturestii":"vulturesc","vulturestile":"vulturesc","vulturi":"vultur","vulturi negri":"vultur negru","vulturi pescari":"vultur pescar","vulturi plesuvi":"vultur pleșuv","vulturi plesuvi suri":"vultur pleșuv sur","vulturi suri":"vultur sur","vulturici":"vulturică","vulturicii":"vulturică","vulturicile":"vulturică","vulturicilor":"vulturică","vulturii":"vultur","vulturilor":"vultur","vulturite":"vulturiță","vulturitei":"vulturiță","vulturitele":"vulturiță","vulturitelor":"vulturiță","vulturoaice":"vulturoaică","vulturoaicei":"vulturoaică","vulturoaicele":"vulturoaică","vulturoaicelor":"vulturoaică","vulturoaiea":"vulturoaie","vulturoaiei":"vulturoaie","vulturoaiele":"vulturoaie","vulturoaielor":"vulturoaie","vulturul":"vultur","vulturule":"vultur","vulturului":"vultur","vulvara":["vulvară","vulvar","vulvara","vulvar"],"vulvare":"vulvar","vulvarele":"vulvar","vulvari":"vulvar","vulvarii":"vulvar","vulvarul":"vulvar","vulve":"vulvă","vulvectomia":"vulvectomie","vulvectomiei":"vulvectomie","vulvectomii":"vulvectomie","vulvectomiile":"vulvectomie","vulvectomiilor":"vulvectomie","vulvei":"vulvă","vulvele":"vulvă","vulvelor":"vulvă","vulvite":"vulvită","vulvitei":"vulvită","vulvitele":"vulvită","vulvitelor":"vulvită","vulvoarea":"vulvoare","vulvoia":"vulvoi","vulvoie":"vulvoi","vulvoiele":"vulvoi","vulvoii":"vulvoi","vulvoiul":"vulvoi","vulvori":"vulvoare","vulvorii":"vulvoare","vulvorile":"vulvoare","vulvorilor":"vulvoare","vulvovaginite":"vulvovaginită","vulvovaginitei":"vulvovaginită","vumetre":"vumetru","vumetrele":"vumetru","vumetrelor":"vumetru","vumetrul":"vumetru","vumetrule":"vumetru","vumetrului":"vumetru","vurte":"vurtă","vurtei":"vurtă","vurtele":"vurtă","vurtelor":"vurtă","vutcari":"vutcar","vutcarii":"vutcar","vutcarilor":"vutcar","vutcarul":"vutcar","vutcarule":"vutcar","vutcarului":"vutcar","vutci":"vutcă","vutcii":"vutcă","vutcile":"vutcă","vutcilor":"vutcă","vute":"vută","vutei":"vută","vutele":"vută","vutelor":"vută","vuvari":"vuvar","vuvarii":"vuvar","vuvarilor":"vuvar","vuvarul":"vuvar","vuvarule":"vuvar","vuvarului":"vuvar","vuve":"vuvă","vuvei":"vuvă","vuvele":"vuvă","vuvelor":"vuvă","vuvuia":"vuvui","vuvuiai":"vuvui","vuvuiam":"vuvui","vuvuiati":"vuvui","vuvuiau":"vuvui","vuvuie":"vuvui","vuvuii":"vuvui","vuvuim":"vuvui","vuvuind":"vuvui","vuvuira":"vuvui","vuvuiram":"vuvui","vuvuirati":"vuvui","vuvuise":"vuvui","vuvuisem":"vuvui","vuvuisera":"vuvui","vuvuiseram":"vuvui","vuvuiserati":"vuvui","vuvuisesi":"vuvui","vuvuisi":"vuvui","vuvuit":"vuvui","vuvuiti":"vuvui","vuvuitoarea":"vuvuitoare","vuvuitori":"vuvuitoare","vuvuitorii":"vuvuitoare","vuvuitorile":"vuvuitoare","vuvuitorilor":"vuvuitoare","vuvuitul":"vuvuit","vuvuitule":"vuvuit","vuvuitului":"vuvuit","vuvuituri":["vuvuituri","vuvuit","vuvuituri","vuvuitură"],"vuvuiturii":"vuvuitură","vuvuiturile":["vuvuiturile","vuvuit","vuvuiturile","vuvuitură"],"vuvuiturilor":["vuvuiturilor","vuvuit","vuvuiturilor","vuvuitură"],"vz":"vzt","vzt":"văzut"};
@@ -0,0 +1 @@
+export default {"wagneriana":["wagneriană","wagnerian","wagneriana","wagnerian"],"wagnerianul":"wagnerian","wagneriene":"wagnerian","wagnerienele":"wagnerian","wagnerieni":"wagnerian","wagnerienii":"wagnerian","wagnerismul":"wagnerism","wagnerismule":"wagnerism","wagnerismului":"wagnerism","wagnerite":"wagnerit","wagneritele":"wagnerit","wagneritelor":"wagnerit","wagneritul":"wagnerit","wagneritule":"wagnerit","wagneritului":"wagnerit","walkie-talkiele":"walkie-talkie","walkie-talkielor":"walkie-talkie","walkie-talkielui":"walkie-talkie","walkiria":"walkirie","walkiriei":"walkirie","walkirii":"walkirie","walkiriile":"walkirie","walkiriilor":"walkirie","walkmanul":"walkman","walkmanule":"walkman","walkmanului":"walkman","walkmenuri":"walkman","walkmenurile":"walkman","walkmenurilor":"walkman","warfarinaul":"warfarină","warfarinaule":"warfarină","warfarinaului":"warfarină","warfarine":"warfarină","warfarinei":"warfarină","warfarinelor":"warfarină","waterpoloul":"waterpolo","waterpoloule":"waterpolo","waterpoloului":"waterpolo","waterprooful":"waterproof","waterproofule":"waterproof","waterproofului":"waterproof","waterproofuri":"waterproof","waterproofurile":"waterproof","waterproofurilor":"waterproof","wati":"watt","wati-ora":["wați-oră","watt-oră","wați-oră","wattoră"],"wati-orai":"watt-oră","wati-oralor":"watt-oră","watii":"watt","watilor":"watt","watman":"vatman","watt-oraul":"watt-oră","watt-oraule":"watt-oră","watt-oraului":"watt-oră","wattmetre":"wattmetru","wattmetrele":"wattmetru","wattmetrelor":"wattmetru","wattmetrul":"wattmetru","wattmetrule":"wattmetru","wattmetrului":"wattmetru","wattora m .":"wattoră","wattsecunde":"wattsecundă","wattsecundei":"wattsecundă","wattsecundele":"wattsecundă","wattsecundelor":"wattsecundă","wattul":"watt","wattule":"watt","wattului":"watt","weberi":"weber","weberii":"weber","weberilor":"weber","weberul":"weber","weberule":"weber","weberului":"weber","week-end":"weekend","weekendul":"weekend","weekendule":"weekend","weekendului":"weekend","weekenduri":"weekend","weekendurile":"weekend","weekendurilor":"weekend","weltanschauungul":"weltanschauung","weltanschauungule":"weltanschauung","weltanschauungului":"weltanschauung","westernul":"western","westernule":"western","westernului":"western","westernuri":"western","westernurile":"western","westernurilor":"western","westfaliana":["westfaliană","westfalian","westfaliana","westfalian"],"westfalianul":"westfalian","westfalianule":"westfalian","westfalianului":"westfalian","westfaliene":"westfalian","westfalienele":"westfalian","westfalieni":"westfalian","westfalienii":"westfalian","westfalienile":"westfalian","westfalienilor":"westfalian","whigul":"whig","whigule":"whig","whigului":"whig","whisky-ul":"whisky","whisky-ule":"whisky","whisky-ului":"whisky","whisky-uri":"whisky","whisky-urile":"whisky","whisky-urilor":"whisky","wigwamul":"wigwam","wigwamule":"wigwam","wigwamului":"wigwam","wigwamuri":"wigwam","wigwamurile":"wigwam","wigwamurilor":"wigwam","wiktionarul":"Wikționar","wiktionarule":"Wikționar","wiktionarului":"Wikționar","willemite":"willemit","willemitele":"willemit","willemitelor":"willemit","willemitul":"willemit","willemitule":"willemit","willemitului":"willemit","windsurfingul":"windsurfing","windsurfingule":"windsurfing","windsurfingului":"windsurfing","witheritul":"witherit","witheritule":"witherit","witheritului":"witherit","wolframica":["wolframică","wolframic","wolframica","wolframic"],"wolframice":"wolframic","wolframicele":"wolframic","wolframici":"wolframic","wolframicii":"wolframic","wolframicul":"wolframic","wolframitul":"wolframit","wolframitule":"wolframit","wolframitului":"wolframit","wolframul":"wolfram","wolframule":"wolfram","wolframului":"wolfram","wollastonite":"wollastonit","wollastonitele":"wollastonit","wollastonitelor":"wollastonit","wollastonitul":"wollastonit","wollastonitule":"wollastonit","wollastonitului":"wollastonit","wombati":"wombat","wombatii":"wombat","wombatilor":"wombat","wombatul":"wombat","wombatule":"wombat","wombatului":"wombat","wooferul":"woofer","wooferule":"woofer","wooferului":"woofer","wulfenite":"wulfenit","wulfenitele":"wulfenit","wulfenitelor":"wulfenit","wulfenitul":"wulfenit","wulfenitule":"wulfenit","wulfenitului":"wulfenit","wurtzitul":"wurtzit","wurtzitule":"wurtzit","wurtzitului":"wurtzit"};
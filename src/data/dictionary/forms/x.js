@@ -0,0 +1 @@
+export default {"xantelasme":"xantelasmă","xantelasmei":"xantelasmă","xantelasmele":"xantelasmă","xantelasmelor":"xantelasmă","xanthidrolul":"xanthidrol","xanthidrolule":"xanthidrol","xanthidrolului":"xanthidrol","xantine":"xantină","xantinei":"xantină","xantinele":"xantină","xantinelor":"xantină","xantinuria":"xantinurie","xantinuriei":"xantinurie","xantinurii":"xantinurie","xantinuriile":"xantinurie","xantinuriilor":"xantinurie","xantismul":"xantism","xantismule":"xantism","xantismului":"xantism","xantoame":"xantom","xantoamele":"xantom","xantoamelor":"xantom","xantocromatica":["xantocromatică","xantocromatic","xantocromatica","xantocromatic"],"xantocromatice":"xantocromatic","xantocromaticele":"xantocromatic","xantocromatici":"xantocromatic","xantocromaticii":"xantocromatic","xantocromaticul":"xantocromatic","xantocromia":"xantocromie","xantocromiei":"xantocromie","xantocromii":"xantocromie","xantodermia":"xantodermie","xantodermiei":"xantodermie","xantodermii":"xantodermie","xantodermiile":"xantodermie","xantodermiilor":"xantodermie","xantofile":"xantofilă","xantofilei":"xantofilă","xantofilele":"xantofilă","xantofilelor":"xantofilă","xantofilitul":"xantofilit","xantofilitule":"xantofilit","xantofilitului":"xantofilit","xantofori":"xantofor","xantoforii":"xantofor","xantoforilor":"xantofor","xantoforul":"xantofor","xantoforule":"xantofor","xantoforului":"xantofor","xantogenati":"xantogenat","xantogenatii":"xantogenat","xantogenatilor":"xantogenat","xantogenatul":"xantogenat","xantogenatule":"xantogenat","xantogenatului":"xantogenat","xantomatoasa":["xantomatoasă","xantomatos","xantomatoasa","xantomatos"],"xantomatoase":"xantomatos","xantomatoasele":"xantomatos","xantomatosi":"xantomatos","xantomatosii":"xantomatos","xantomatosul":"xantomatos","xantomatoze":"xantomatoză","xantomatozei":"xantomatoză","xantomatozele":"xantomatoză","xantomatozelor":"xantomatoză","xantomul":"xantom","xantomule":"xantom","xantomului":"xantom","xantopsia":"xantopsie","xantopsiei":"xantopsie","xantopsii":"xantopsie","xantopsiile":"xantopsie","xantopsiilor":"xantopsie","xantoze":"xantoză","xantozei":"xantoză","xantozele":"xantoză","xantozelor":"xantoză","xenelasia":"xenelasie","xenelasiei":"xenelasie","xenelasii":"xenelasie","xenia":"xenie","xeniei":"xenie","xenii":"xenie","xeniile":"xenie","xeniilor":"xenie","xenisme":"xenism","xenismele":"xenism","xenismelor":"xenism","xenismul":"xenism","xenismule":"xenism","xenismului":"xenism","xenobiotica":["xenobiotică","xenobiotic","xenobiotica","xenobiotic"],"xenobiotice":"xenobiotic","xenobioticele":"xenobiotic","xenobiotici":"xenobiotic","xenobioticii":"xenobiotic","xenobioticul":"xenobiotic","xenobioze":"xenobioză","xenobiozei":"xenobioză","xenobiozele":"xenobioză","xenobiozelor":"xenobioză","xenoblaste":"xenoblast","xenoblastele":"xenoblast","xenoblastelor":"xenoblast","xenoblastul":"xenoblast","xenoblastule":"xenoblast","xenoblastului":"xenoblast","xenocratia":"xenocrație","xenocratiei":"xenocrație","xenocratii":"xenocrație","xenocratiile":"xenocrație","xenocratiilor":"xenocrație","xenodiagnosticul":"xenodiagnostic","xenodiagnosticule":"xenodiagnostic","xenodiagnosticului":"xenodiagnostic","xenodiagnosticuri":"xenodiagnostic","xenodiagnosticurile":"xenodiagnostic","xenodiagnosticurilor":"xenodiagnostic","xenofile":"xenofilă","xenofilei":"xenofilă","xenofilele":"xenofilă","xenofilelor":"xenofilă","xenofili":"xenofil","xenofilia":"xenofilie","xenofiliei":"xenofilie","xenofilii":["xenofilii","xenofil","xenofilii","xenofilie"],"xenofililor":"xenofil","xenofilul":"xenofil","xenofilule":"xenofil","xenofilului":"xenofil","xenofoba":["xenofobă","xenofob","xenofoba","xenofob"],"xenofobe":["xenofobe","xenofob","xenofobe","xenofobă"],"xenofobei":"xenofobă","xenofobele":["xenofobele","xenofob","xenofobele","xenofobă"],"xenofobelor":"xenofobă","xenofobi":"xenofob","xenofobia":"xenofobie","xenofobiei":"xenofobie","xenofobii":["xenofobii","xenofob","xenofobii","xenofobie"],"xenofobilor":"xenofob","xenofobul":"xenofob","xenofobule":"xenofob","xenofobului":"xenofob","xenofonia":"xenofonie","xenofoniei":"xenofonie","xenofonii":"xenofonie","xenogamia":"xenogamie","xenogamiei":"xenogamie","xenogamii":"xenogamie","xenogeneze":"xenogeneză","xenogenezei":"xenogeneză","xenogenezele":"xenogeneză","xenogenezelor":"xenogeneză","xenoglosia":"xenoglosie","xenoglosiei":"xenoglosie","xenoglosii":"xenoglosie","xenografia":"xenografie","xenografiei":"xenografie","xenografii":"xenografie","xenolite":"xenolit","xenolitele":"xenolit","xenolitelor":"xenolit","xenolitul":"xenolit","xenolitule":"xenolit","xenolitului":"xenolit","xenologia":"xenologie","xenologiei":"xenologie","xenologii":"xenologie","xenomane":"xenomană","xenomanei":"xenomană","xenomanele":"xenomană","xenomanelor":"xenomană","xenomani":"xenoman","xenomania":"xenomanie","xenomaniei":"xenomanie","xenomanii":["xenomanii","xenoman","xenomanii","xenomanie"],"xenomaniile":"xenomanie","xenomaniilor":"xenomanie","xenomanilor":"xenoman","xenomanul":"xenoman","xenomanule":"xenoman","xenomanului":"xenoman","xenomorfa":["xenomorfă","xenomorf","xenomorfa","xenomorf"],"xenomorfe":"xenomorf","xenomorfele":"xenomorf","xenomorfi":"xenomorf","xenomorfia":"xenomorfie","xenomorfiei":"xenomorfie","xenomorfii":["xenomorfii","xenomorf","xenomorfii","xenomorfie"],"xenomorfiile":"xenomorfie","xenomorfiilor":"xenomorfie","xenomorfisme":"xenomorfism","xenomorfismele":"xenomorfism","xenomorfismelor":"xenomorfism","xenomorfismul":"xenomorfism","xenomorfismule":"xenomorfism","xenomorfismului":"xenomorfism","xenomorfoze":"xenomorfoză","xenomorfozei":"xenomorfoză","xenomorfozele":"xenomorfoză","xenomorfozelor":"xenomorfoză","xenomorful":"xenomorf","xenonul":"xenon","xenonule":"xenon","xenonului":"xenon","xenopatia":"xenopatie","xenopatiei":"xenopatie","xenopatii":"xenopatie","xenopatiile":"xenopatie","xenopatiilor":"xenopatie","xenoplastica":["xenoplastică","xenoplastic","xenoplastica","xenoplastic"],"xenoplastice":"xenoplastic","xenoplasticele":"xenoplastic","xenoplastici":"xenoplastic","xenoplasticii":"xenoplastic","xenoplasticul":"xenoplastic","xenotropisme":"xenotropism","xenotropismele":"xenotropism","xenotropismelor":"xenotropism","xenotropismul":"xenotropism","xenotropismule":"xenotropism","xenotropismului":"xenotropism","xeresul":"xeres","xeresule":"xeres","xeresului":"xeres","xerica":["xerică","xeric","xerica","xeric"],"xerice":"xeric","xericele":"xeric","xerici":"xeric","xericii":"xeric","xericul":"xeric","xeroame":"xerom","xeroamele":"xerom","xeroamelor":"xerom","xerocopia":"xerocopie","xerocopiai":"xerocopia","xerocopiam":"xerocopia","xerocopiara":"xerocopia","xerocopiaram":"xerocopia","xerocopiarati":"xerocopia","xerocopiase":"xerocopia","xerocopiasem":"xerocopia","xerocopiasera":"xerocopia","xerocopiaseram":"xerocopia","xerocopiaserati":"xerocopia","xerocopiasesi":"xerocopia","xerocopiasi":"xerocopia","xerocopiat":"xerocopia","xerocopiati":"xerocopia","xerocopiatul":"xerocopiat","xerocopiatule":"xerocopiat","xerocopiatului":"xerocopiat","xerocopiau":"xerocopia","xerocopiaza":"xerocopia","xerocopie":"xerocopia","xerocopiei":"xerocopie","xerocopiem":"xerocopia","xerocopierea":"xerocopiere","xerocopieri":"xerocopiere","xerocopierii":"xerocopiere","xerocopierile":"xerocopiere","xerocopierilor":"xerocopiere","xerocopiez":"xerocopia","xerocopiezi":"xerocopia","xerocopii":"xerocopie","xerocopiile":"xerocopie","xerocopiilor":"xerocopie","xerocopiind":"xerocopia","xerodermia":"xerodermie","xerodermiei":"xerodermie","xerodermii":"xerodermie","xerodermiile":"xerodermie","xerodermiilor":"xerodermie","xerofaga":["xerofagă","xerofag","xerofaga","xerofag"],"xerofage":"xerofag","xerofagele":"xerofag","xerofagi":"xerofag","xerofagia":"xerofagie","xerofagiei":"xerofagie","xerofagii":["xerofagii","xerofag","xerofagii","xerofagie"],"xerofagiile":"xerofagie","xerofagiilor":"xerofagie","xerofagul":"xerofag","xerofila":["xerofilă","xerofil","xerofila","xerofil"],"xerofile":["xerofile","xerofil","xerofile","xerofilă"],"xerofilei":"xerofilă","xerofilele":["xerofilele","xerofil","xerofilele","xerofilă"],"xerofilelor":"xerofilă","xerofili":"xerofil","xerofilii":"xerofil","xerofilul":"xerofil","xerofite":"xerofită","xerofitei":"xerofită","xerofitele":"xerofită","xerofitelor":"xerofită","xerofitica":["xerofitică","xerofitic","xerofitica","xerofitic"],"xerofitice":"xerofitic","xerofiticele":"xerofitic","xerofitici":"xerofitic","xerofiticii":"xerofitic","xerofiticul":"xerofitic","xerofoba":["xerofobă","xerofob","xerofoba","xerofob"],"xerofobe":"xerofob","xerofobele":"xerofob","xerofobi":"xerofob","xerofobii":"xerofob","xerofobul":"xerofob","xeroformul":"xeroform","xeroformule":"xeroform","xeroformului":"xeroform","xeroftalmia":"xeroftalmie","xeroftalmici":"xeroftalmic","xeroftalmicii":"xeroftalmic","xeroftalmicilor":"xeroftalmic","xeroftalmicul":"xeroftalmic","xeroftalmicule":"xeroftalmic","xeroftalmicului":"xeroftalmic","xeroftalmiei":"xeroftalmie","xeroftalmii":"xeroftalmie","xeroftalmiile":"xeroftalmie","xeroftalmiilor":"xeroftalmie","xerogelul":"xerogel","xerogelule":"xerogel","xerogelului":"xerogel","xerogeluri":"xerogel","xerogelurile":"xerogel","xerogelurilor":"xerogel","xerografe":"xerograf","xerografele":"xerograf","xerografelor":"xerograf","xerografia":"xerografie","xerografiai":"xerografia","xerografiam":"xerografia","xerografiara":"xerografia","xerografiaram":"xerografia","xerografiarati":"xerografia","xerografiase":"xerografia","xerografiasem":"xerografia","xerografiasera":"xerografia","xerografiaseram":"xerografia","xerografiaserati":"xerografia","xerografiasesi":"xerografia","xerografiasi":"xerografia","xerografiat":"xerografia","xerografiata":["xerografiată","xerografiat","xerografiata","xerografiat"],"xerografiate":"xerografiat","xerografiatele":"xerografiat","xerografiati":["xerografiați","xerografia","xerografiați","xerografiat"],"xerografiatii":"xerografiat","xerografiatul":"xerografiat","xerografiau":"xerografia","xerografiaza":"xerografia","xerografie":"xerografia","xerografiei":"xerografie","xerografiem":"xerografia","xerografiez":"xerografia","xerografieze":"xerografia","xerografiezi":"xerografia","xerografii":"xerografie","xerografiile":"xerografie","xerografiilor":"xerografie","xerografiind":"xerografia","xerograful":"xerograf","xerografule":"xerograf","xerografului":"xerograf","xeromenia":"xeromenie","xeromeniei":"xeromenie","xeromenii":"xeromenie","xeromorfa":["xeromorfă","xeromorf","xeromorfa","xeromorf"],"xeromorfe":"xeromorf","xeromorfele":"xeromorf","xeromorfi":"xeromorf","xeromorfia":"xeromorfie","xeromorfiei":"xeromorfie","xeromorfii":["xeromorfii","xeromorf","xeromorfii","xeromorfie"],"xeromorfisme":"xeromorfism","xeromorfismele":"xeromorfism","xeromorfismelor":"xeromorfism","xeromorfismul":"xeromorfism","xeromorfismule":"xeromorfism","xeromorfismului":"xeromorfism","xeromorfoze":"xeromorfoză","xeromorfozei":"xeromorfoză","xeromorfozele":"xeromorfoză","xeromorfozelor":"xeromorfoză","xeromorful":"xeromorf","xeromul":"xerom","xeromule":"xerom","xeromului":"xerom","xerostomia":"xerostomie","xerostomiei":"xerostomie","xerostomii":"xerostomie","xeroterma":["xerotermă","xeroterm","xeroterma","xeroterm"],"xeroterme":"xeroterm","xerotermele":"xeroterm","xerotermi":"xeroterm","xerotermica":["xerotermică","xerotermic","xerotermica","xerotermic"],"xerotermice":"xerotermic","xerotermicele":"xerotermic","xerotermici":"xerotermic","xerotermicii":"xerotermic","xerotermicul":"xerotermic","xerotermii":"xeroterm","xerotermul":"xeroterm","xeroxai":"xeroxa","xeroxam":["xeroxăm","xeroxa","xeroxam","xeroxa"],"xeroxand":"xeroxa","xeroxara":"xeroxa","xeroxaram":"xeroxa","xeroxarati":"xeroxa","xeroxarea":"xeroxare","xeroxari":"xeroxare","xeroxarii":"xeroxare","xeroxarile":"xeroxare","xeroxarilor":"xeroxare","xeroxase":"xeroxa","xeroxasem":"xeroxa","xeroxasera":"xeroxa","xeroxaseram":"xeroxa","xeroxaserati":"xeroxa","xeroxasesi":"xeroxa","xeroxasi":"xeroxa","xeroxat":"xeroxa","xeroxata":["xeroxată","xeroxat","xeroxata","xeroxat"],"xeroxate":"xeroxat","xeroxatele":"xeroxat","xeroxati":["xeroxați","xeroxa","xeroxați","xeroxat"],"xeroxatii":"xeroxat","xeroxatul":"xeroxat","xeroxau":"xeroxa","xeroxe":"xerox","xeroxeaza":"xeroxa","xeroxele":"xerox","xeroxelor":"xerox","xeroxez":"xeroxa","xeroxezi":"xeroxa","xeroxul":"xerox","xeroxule":"xerox","xeroxului":"xerox","xeroxuri":"xerox","xeroze":"xeroză","xerozei":"xeroză","xerozele":"xeroză","xerozelor":"xeroză","xifodinia":"xifodinie","xifodiniei":"xifodinie","xifodinii":"xifodinie","xifoidalgia":"xifoidalgie","xifoidalgiei":"xifoidalgie","xifoidalgii":"xifoidalgie","xifoidalgiile":"xifoidalgie","xifoidalgiilor":"xifoidalgie","xifoide":"xifoid","xifoidele":"xifoid","xifoidelor":"xifoid","xifoidiana":["xifoidiană","xifoidian","xifoidiana","xifoidian"],"xifoidianul":"xifoidian","xifoidiene":"xifoidian","xifoidienele":"xifoidian","xifoidieni":"xifoidian","xifoidienii":"xifoidian","xifoidite":"xifoidită","xifoiditei":"xifoidită","xifoiditele":"xifoidită","xifoiditelor":"xifoidită","xifoidul":"xifoid","xifoidule":"xifoid","xifoidului":"xifoid","xilani":"xilan","xilanii":"xilan","xilanilor":"xilan","xilanul":"xilan","xilanule":"xilan","xilanului":"xilan","xileme":"xilem","xilemele":"xilem","xilemelor":"xilem","xilemul":"xilem","xilemule":"xilem","xilemului":"xilem","xileni":"xilen","xilenii":"xilen","xilenilor":"xilen","xilenoli":"xilenol","xilenolii":"xilenol","xilenolilor":"xilenol","xilenolul":"xilenol","xilenolule":"xilenol","xilenolului":"xilenol","xilenul":"xilen","xilenule":"xilen","xilenului":"xilen","xilidine":"xilidină","xilidinei":"xilidină","xilidinele":"xilidină","xilidinelor":"xilidină","xilitul":"xilit","xilitule":"xilit","xilitului":"xilit","xilocaine":"xilocaină","xilocainei":"xilocaină","xilocainele":"xilocaină","xilocainelor":"xilocaină","xilocarpul":"xilocarp","xilocarpule":"xilocarp","xilocarpului":"xilocarp","xilocromi":"xilocrom","xilocromii":"xilocrom","xilocromilor":"xilocrom","xilocromul":"xilocrom","xilocromule":"xilocrom","xilocromului":"xilocrom","xilofaga":["xilofagă","xilofag","xilofaga","xilofag"],"xilofage":"xilofag","xilofagele":"xilofag","xilofagi":"xilofag","xilofagia":"xilofagie","xilofagiei":"xilofagie","xilofagii":["xilofagii","xilofag","xilofagii","xilofagie"],"xilofagiile":"xilofagie","xilofagiilor":"xilofagie","xilofagul":"xilofag","xilofila":["xilofilă","xilofil","xilofila","xilofil"],"xilofile":"xilofil","xilofilele":"xilofil","xilofili":"xilofil","xilofilii":"xilofil","xilofilul":"xilofil","xilofoane":"xilofon","xilofoanele":"xilofon","xilofoanelor":"xilofon","xilofoniste":"xilofonistă","xilofonistei":"xilofonistă","xilofonistele":"xilofonistă","xilofonistelor":"xilofonistă","xilofonisti":"xilofonist","xilofonistii":"xilofonist","xilofonistilor":"xilofonist","xilofonistul":"xilofonist","xilofonistule":"xilofonist","xilofonistului":"xilofonist","xilofonul":"xilofon","xilofonule":"xilofon","xilofonului":"xilofon","xilogina":["xilogină","xilogin","xilogina","xilogin"],"xilogine":"xilogin","xiloginele":"xilogin","xilogini":"xilogin","xiloginii":"xilogin","xiloginul":"xilogin","xilografe":"xilografă","xilografei":"xilografă","xilografele":"xilografă","xilografelor":"xilografă","xilografi":"xilograf","xilografia":"xilografie","xilografica":["xilografică","xilografic","xilografica","xilografic"],"xilografice":"xilografic","xilograficele":"xilografic","xilografici":"xilografic","xilograficii":"xilografic","xilograficul":"xilografic","xilografiei":"xilografie","xilografii":["xilografii","xilograf","xilografii","xilografie"],"xilografiile":"xilografie","xilografiilor":"xilografie","xilografilor":"xilograf","xilograful":"xilograf","xilografule":"xilograf","xilografului":"xilograf","xilogravuri":"xilogravură","xilogravurii":"xilogravură","xilogravurile":"xilogravură","xilogravurilor":"xilogravură","xiloida":["xiloidă","xiloid","xiloida","xiloid"],"xiloide":"xiloid","xiloidele":"xiloid","xiloidul":"xiloid","xiloizi":"xiloid","xiloizii":"xiloid","xilolatria":"xilolatrie","xilolatriei":"xilolatrie","xilolatrii":"xilolatrie","xilolatriile":"xilolatrie","xilolatriilor":"xilolatrie","xilolitografia":"xilolitografie","xilolitografiei":"xilolitografie","xilolitografii":"xilolitografie","xilolitografiile":"xilolitografie","xilolitografiilor":"xilolitografie","xilologia":"xilologie","xilologica":["xilologică","xilologic","xilologica","xilologic"],"xilologice":"xilologic","xilologicele":"xilologic","xilologici":"xilologic","xilologicii":"xilologic","xilologicul":"xilologic","xilologiei":"xilologie","xilologii":"xilologie","xilologiile":"xilologie","xilologiilor":"xilologie","xilolul":"xilol","xilolule":"xilol","xilolului":"xilol","xilomantia":"xilomanție","xilomantiei":"xilomanție","xilomantii":"xilomanție","xilomantiile":"xilomanție","xilomantiilor":"xilomanție","xilometre":"xilometru","xilometrele":"xilometru","xilometrelor":"xilometru","xilometruul":"xilometru","xilometruule":"xilometru","xilometruului":"xilometru","xilostrome":"xilostromă","xilostromei":"xilostromă","xilostromele":"xilostromă","xilostromelor":"xilostromă","xiloterapia":"xiloterapie","xiloterapiei":"xiloterapie","xiloterapii":"xiloterapie","xiloterapiile":"xiloterapie","xiloterapiilor":"xiloterapie","xilotilul":"xilotil","xilotilule":"xilotil","xilotilului":"xilotil","xilotomia":"xilotomie","xilotomiei":"xilotomie","xilotomii":"xilotomie","xilotomiile":"xilotomie","xilotomiilor":"xilotomie","xiloze":"xiloză","xilozei":"xiloză","xilozele":"xiloză","xilozelor":"xiloză","xisme":"xismă","xismei":"xismă","xismele":"xismă","xismelor":"xismă","xulescu":"X-ulescu"};
@@ -0,0 +1 @@
+export default {"yaci":"yak","yale":"yală","yalei":"yală","yalele":"yală","yalelor":"yală","yankei":"yankeu","yankeii":"yankeu","yankeilor":"yankeu","yankeul":"yankeu","yankeule":"yankeu","yankeului":"yankeu","yardul":"yard","yardule":"yard","yardului":"yard","yarzi":"yard","yarzii":"yard","yarzilor":"yard","yemenite":"yemenită","yemenitei":"yemenită","yemenitele":"yemenită","yemenitelor":"yemenită","yemeniti":"yemenit","yemenitii":"yemenit","yemenitilor":"yemenit","yemenitul":"yemenit","yemenitule":"yemenit","yemenitului":"yemenit","yeni":"yen","yenii":"yen","yenilor":"yen","yenul":"yen","yenule":"yen","yenului":"yen","yeomanul":"yeoman","yeomanule":"yeoman","yeomanului":"yeoman","yeomeni":"yeoman","yeomenii":"yeoman","yeomenilor":"yeoman","yesmanul":"yesman","yesmanule":"yesman","yesmanului":"yesman","yesmeni":"yesman","yesmenii":"yesman","yesmenilor":"yesman","yetii":"yeti","yetilor":"yeti","yetiul":"yeti","yetiule":"yeti","yetiului":"yeti","yoghini":"yoghin","yoghinii":"yoghin","yoghinilor":"yoghin","yoghinul":"yoghin","yoghinule":"yoghin","yoghinului":"yoghin","yoghista":["yoghistă","yoghist","yoghista","yoghist"],"yoghiste":["yoghiste","yoghist","yoghiste","yoghistă"],"yoghistei":"yoghistă","yoghistele":["yoghistele","yoghist","yoghistele","yoghistă"],"yoghistelor":"yoghistă","yoghisti":"yoghist","yoghistii":"yoghist","yoghistul":"yoghist","yogini":"yogin","yoginii":"yogin","yoginilor":"yogin","yoginul":"yogin","yoginule":"yogin","yoginului":"yogin","yohimbine":"yohimbină","yohimbinei":"yohimbină","yohimbinele":"yohimbină","yohimbinelor":"yohimbină","yperitae":"yperită","yperitaei":"yperită","yperitaele":"yperită","yperitaelor":"yperită","yterbiul":"yterbiu","yterbiule":"yterbiu","yterbiului":"yterbiu","ytriul":"ytriu","ytriule":"ytriu","ytriului":"ytriu","yttrotantalitul":"yttrotantalit","yttrotantalitule":"yttrotantalit","yttrotantalitului":"yttrotantalit","yuani":"yuan","yuanii":"yuan","yuanilor":"yuan","yuanul":"yuan","yuanule":"yuan","yuanului":"yuan"};
@@ -0,0 +1 @@
+export default {"zaanale":"zaana","zaanalei":"zaana","zaanalele":"zaana","zaanalelor":"zaana","zaanaua":"zaana","zabale":"zăbală","zabalei":"zăbală","zabalele":"zăbală","zabalelor":"zăbală","zabalute":"zăbăluță","zabalutei":"zăbăluță","zabalutele":"zăbăluță","zabalutelor":"zăbăluță","zabave":"zăbavă","zabavea":"zăbăvi","zabaveai":"zăbăvi","zabaveam":"zăbăvi","zabaveati":"zăbăvi","zabaveau":"zăbăvi","zabavei":"zăbavă","zabavele":"zăbavă","zabavelor":"zăbavă","zabavesc":"zăbăvi","zabaveste":"zăbăvi","zabavesti":"zăbăvi","zabavii":"zăbăvi","zabavim":"zăbăvi","zabavind":"zăbăvi","zabavira":"zăbăvi","zabaviram":"zăbăvi","zabavirati":"zăbăvi","zabavise":"zăbăvi","zabavisem":"zăbăvi","zabavisera":"zăbăvi","zabaviseram":"zăbăvi","zabaviserati":"zăbăvi","zabavisesi":"zăbăvi","zabavisi":"zăbăvi","zabavit":"zăbăvi","zabaviti":"zăbăvi","zabavnica":["zăbavnică","zăbavnic","zăbavnica","zăbavnic"],"zabavnice":"zăbavnic","zabavnicele":"zăbavnic","zabavnici":"zăbavnic","zabavnicia":"zăbăvnicie","zabavniciei":"zăbăvnicie","zabavnicii":["zăbavnicii","zăbavnic","zăbăvnicii","zăbăvnicie"],"zabavnicul":"zăbavnic","zaberirea":"zăberire","zaberiri":"zăberire","zaberirii":"zăberire","zabeti":"zabet","zabetii":"zabet","zabetilor":"zabet","zabetul":"zabet","zabetule":"zabet","zabetului":"zabet","zabit":"zabet","zabiti":"zabit","zabitii":"zabit","zabitilor":"zabit","zabitlacul":"zabitlâc","zabitlacule":"zabitlâc","zabitlacului":"zabitlâc","zabitlacuri":"zabitlâc","zabitlacurile":"zabitlâc","zabitlacurilor":"zabitlâc","zabitul":"zabit","zabitule":"zabit","zabitului":"zabit","zablaicute":"zăblăicuță","zablaicutei":"zăblăicuță","zabovea":"zăbovi","zaboveai":"zăbovi","zaboveale":"zăboveală","zabovealei":"zăboveală","zaboveam":"zăbovi","zaboveati":"zăbovi","zaboveau":"zăbovi","zabovesc":"zăbovi","zaboveste":"zăbovi","zabovesti":"zăbovi","zabovii":"zăbovi","zabovim":"zăbovi","zabovind":"zăbovi","zabovira":"zăbovi","zaboviram":"zăbovi","zabovirati":"zăbovi","zabovirea":"zăbovire","zaboviri":"zăbovire","zabovirii":"zăbovire","zabovirile":"zăbovire","zabovirilor":"zăbovire","zabovise":"zăbovi","zabovisem":"zăbovi","zabovisera":"zăbovi","zaboviseram":"zăbovi","zaboviserati":"zăbovi","zabovisesi":"zăbovi","zabovisi":"zăbovi","zabovit":"zăbovi","zabovita":["zăbovită","zăbovit","zăbovita","zăbovit"],"zabovite":"zăbovit","zabovitele":"zăbovit","zaboviti":["zăboviți","zăbovi","zăboviți","zăbovit"],"zabovitii":"zăbovit","zabovitoare":"zăbovitor","zabovitoarea":"zăbovitor","zabovitoarele":"zăbovitor","zabovitori":"zăbovitor","zabovitorii":"zăbovitor","zabovitorul":"zăbovitor","zabovitul":"zăbovit","zabreaua":"zăbrea","zabrele":"zăbrea","zabrelei":"zăbrea","zabrelele":"zăbrea","zabrelelor":"zăbrea","zabreluice":"zăbreluică","zabreluicei":"zăbreluică","zabrelute":"zăbreluță","zabrelutei":"zăbreluță","zabruice":"zăbruică","zabruicei":"zăbruică","zabunase":"zăbunaș","zabunasele":"zăbunaș","zabunaselor":"zăbunaș","zabunasul":"zăbunaș","zabunasule":"zăbunaș","zabunasului":"zăbunaș","zabunele":"zăbunel","zabunelele":"zăbunel","zabunelelor":"zăbunel","zabunelul":"zăbunel","zabunelule":"zăbunel","zabunelului":"zăbunel","zac":"zăcea","zaca":"zăcea","zacamantul":"zăcământ","zacamantule":"zăcământ","zacamantului":"zăcământ","zacaminte":"zăcământ","zacamintele":"zăcământ","zacamintelor":"zăcământ","zacand":"zăcea","zacasele":"zăcășeală","zacaselei":"zăcășeală","zacaselele":"zăcășeală","zacaselelor":"zăcășeală","zacaseli":"zăcășeală","zacasia":"zăcășie","zacasiei":"zăcășie","zacasii":"zăcășie","zace":"zăcea","zaceai":"zăcea","zaceale":"zaceală","zacealei":"zaceală","zacealele":"zaceală","zacealelor":"zaceală","zaceam":"zăcea","zaceati":"zăcea","zaceau":"zăcea","zacem":"zăcea","zacerea":"zăcere","zaceri":"zăcere","zacerii":"zăcere","zacerile":"zăcere","zacerilor":"zăcere","zaceti":"zăcea","zacetia":"zacetie","zacetiei":"zacetie","zacetii":"zacetie","zacetiile":"zacetie","zacetiilor":"zacetie","zaci":"zăcea","zaclinania":"zaclinanie","zaclinaniei":"zaclinanie","zaclinanii":"zaclinanie","zaclopul":"zăclop","zaclopule":"zăclop","zaclopului":"zăclop","zacoane":"zacon","zacoanele":"zacon","zacoanelor":"zacon","zacomi":"zacom","zacomii":"zacom","zacomilor":"zacom","zacomul":"zacom","zacomule":"zacom","zacomului":"zacom","zaconici":"zaconic","zaconicii":"zaconic","zaconicilor":"zaconic","zaconicul":"zaconic","zaconicule":"zaconic","zaconicului":"zaconic","zaconul":"zacon","zaconule":"zacon","zaconului":"zacon","zacu":"zăcea","zacui":"zăcea","zacura":"zăcea","zacuram":"zăcea","zacurati":"zăcea","zacuse":"zăcea","zacusea":"zacusi","zacuseai":"zacusi","zacuseam":"zacusi","zacuseati":"zacusi","zacuseau":"zacusi","zacusem":"zăcea","zacusera":"zăcea","zacuseram":"zăcea","zacuserati":"zăcea","zacusesc":"zacusi","zacusesi":"zăcea","zacuseste":"zacusi","zacusesti":"zacusi","zacusi":"zăcea","zacusii":"zacusi","zacusim":"zacusi","zacusind":"zacusi","zacusira":"zacusi","zacusiram":"zacusi","zacusirati":"zacusi","zacusise":"zacusi","zacusisem":"zacusi","zacusisera":"zacusi","zacusiseram":"zacusi","zacusiserati":"zacusi","zacusisesi":"zacusi","zacusisi":"zacusi","zacusit":"zacusi","zacusiti":"zacusi","zacuste":"zacuscă","zacustei":"zacuscă","zacustele":"zacuscă","zacustelor":"zacuscă","zacut":"zăcea","zacuta":["zăcută","zăcut","zăcuta","zăcut"],"zacute":"zăcut","zacutele":"zăcut","zacuti":"zăcut","zacutii":"zăcut","zacutul":"zăcut","zadara":["zadară","zadar","zadara","zadar","zădăra","zădărî"],"zadarai":["zădărai","zădărî","zădărâi","zădărî"],"zadaram":["zădărâm","zădărî","zădăram","zădărî"],"zadarand":"zădărî","zadarara":"zădărî","zadararam":"zădărî","zadararati":"zădărî","zadarasc":"zădărî","zadarase":"zădărî","zadarasem":"zădărî","zadarasera":"zădărî","zadaraseram":"zădărî","zadaraserati":"zădărî","zadarasesi":"zădărî","zadarasi":"zădărî","zadaraste":"zădărî","zadarasti":"zădărî","zadarati":["zădărâți","zădărî","zădărați","zădărî"],"zadarau":"zădărî","zadare":"zadar","zadarea":"zădări","zadareai":"zădări","zadaream":"zădări","zadareati":"zădări","zadareau":"zădări","zadarele":"zadar","zadaresc":"zădări","zadareste":"zădări","zadaresti":"zădări","zadari":"zadar","zadarii":["zadarii","zadar","zădării","zădări"],"zadarim":"zădări","zadarind":"zădări","zadarira":"zădări","zadariram":"zădări","zadarirati":"zădări","zadarirea":"zădărire","zadariri":"zădărire","zadaririi":"zădărire","zadaririle":"zădărire","zadaririlor":"zădărire","zadarise":"zădări","zadarisem":"zădări","zadarisera":"zădări","zadariseram":"zădări","zadariserati":"zădări","zadarisesi":"zădări","zadarisi":"zădări","zadarit":["zădărit","zădări","zădărît","zădărî"],"zadarita":["zădărită","zădărit","zădărita","zădărit"],"zadarite":"zădărit","zadaritele":"zădărit","zadariti":["zădăriți","zădări","zădăriți","zădărit"],"zadaritii":"zădărit","zadaritul":"zădărit","zadarnica":["zadarnică","zadarnic","zadarnica","zadarnic","zădarnică","zădarnic","zădarnica","zădarnic"],"zadarnice":["zadarnice","zadarnic","zădarnice","zădarnic"],"zadarnicea":"zădărnici","zadarniceai":"zădărnici","zadarniceam":"zădărnici","zadarniceati":"zădărnici","zadarniceau":"zădărnici","zadarnicele":["zadarnicele","zadarnic","zădarnicele","zădarnic"],"zadarnicesc":"zădărnici","zadarniceste":"zădărnici","zadarnicesti":"zădărnici","zadarnici":["zadarnici","zadarnic","zădarnici","zădarnic"],"zadarnicia":"zădărnicie","zadarniciei":"zădărnicie","zadarnicii":["zadarnicii","zadarnic","zădarnicii","zădarnic","zădărnicii","zădărnici","zădărnicii","zădărnicie"],"zadarniciile":"zădărnicie","zadarniciilor":"zădărnicie","zadarnicim":"zădărnici","zadarnicind":"zădărnici","zadarnicira":"zădărnici","zadarniciram":"zădărnici","zadarnicirati":"zădărnici","zadarnicirea":"zădărnicire","zadarniciri":"zădărnicire","zadarnicirii":"zădărnicire","zadarnicirile":"zădărnicire","zadarnicirilor":"zădărnicire","zadarnicise":"zădărnici","zadarnicisem":"zădărnici","zadarnicisera":"zădărnici","zadarniciseram":"zădărnici","zadarniciserati":"zădărnici","zadarnicisesi":"zădărnici","zadarnicisi":"zădărnici","zadarnicit":"zădărnici","zadarniciti":"zădărnici","zadarnicul":["zadarnicul","zadarnic","zădarnicul","zădarnic"],"zadarul":["zadarul","zadar","zădarul","zădar"],"zadarule":"zădar","zadarului":"zădar","zade":"zadă","zadei":"zadă","zadele":"zadă","zadelor":"zadă","zadia":"zadie","zadiei":"zadie","zadii":"zadie","zadiile":"zadie","zadiilor":"zadie","zadiute":"zădiuță","zadiutei":"zădiuță","zaduful":"zăduf","zadufule":"zăduf","zadufului":"zăduf","zadufuri":"zăduf","zadufurile":"zăduf","zadufurilor":"zăduf","zaduhul":"zăduh","zaduhule":"zăduh","zaduhului":"zăduh","zaduhuri":"zăduh","zaduhurile":"zăduh","zaduhurilor":"zăduh","zafire":"zafir","zafirele":"zafir","zafirelor":"zafir","zafirul":"zafir","zafirule":"zafir","zafirului":"zafir","zagaboiul":"zagaboi","zagaboiule":"zagaboi","zagaboiului":"zagaboi","zagani":"zăgan","zaganii":"zăgan","zaganilor":"zăgan","zaganul":"zăgan","zaganule":"zăgan","zaganului":"zăgan","zagarelul":"zăgărel","zagarelule":"zăgărel","zagarelului":"zăgărel","zagazuia":"zăgăzui","zagazuiai":"zăgăzui","zagazuiam":"zăgăzui","zagazuiati":"zăgăzui","zagazuiau":"zăgăzui","zagazuiesc":"zăgăzui","zagazuieste":"zăgăzui","zagazuiesti":"zăgăzui","zagazuii":"zăgăzui","zagazuim":"zăgăzui","zagazuind":"zăgăzui","zagazuira":"zăgăzui","zagazuiram":"zăgăzui","zagazuirati":"zăgăzui","zagazuirea":"zăgăzuire","zagazuiri":"zăgăzuire","zagazuirii":"zăgăzuire","zagazuirile":"zăgăzuire","zagazuirilor":"zăgăzuire","zagazuise":"zăgăzui","zagazuisem":"zăgăzui","zagazuisera":"zăgăzui","zagazuiseram":"zăgăzui","zagazuiserati":"zăgăzui","zagazuisesi":"zăgăzui","zagazuisi":"zăgăzui","zagazuit":"zăgăzui","zagazuita":["zăgăzuită","zăgăzuit","zăgăzuita","zăgăzuit"],"zagazuite":"zăgăzuit","zagazuitele":"zăgăzuit","zagazuiti":["zăgăzuiți","zăgăzui","zăgăzuiți","zăgăzuit"],"zagazuitii":"zăgăzuit","zagazuitul":"zăgăzuit","zagazul":"zăgaz","zagazule":"zăgaz","zagazului":"zăgaz","zagazuri":"zăgaz","zagazurile":"zăgaz","zagazurilor":"zăgaz","zahanale":"zahana","zahanalei":"zahana","zahanalele":"zahana","zahanalelor":"zahana","zahanaua":"zahana","zaharati":"zaharat","zaharatii":"zaharat","zaharatilor":"zaharat","zaharatul":"zaharat","zaharatule":"zaharat","zaharatului":"zaharat","zaharaze":"zaharază","zaharazei":"zaharază","zaharazele":"zaharază","zaharazelor":"zaharază","zahareaua":"zaharea","zaharele":["zaharele","zaharea","zăhărele","zăhărel"],"zaharelei":"zaharea","zaharelele":["zaharelele","zaharea","zăhărelele","zăhărel"],"zaharelelor":["zaharelelor","zaharea","zăhărelelor","zăhărel"],"zaharelul":"zăhărel","zaharelule":"zăhărel","zaharelului":"zăhărel","zaharica":["zaharică","zaharic","zaharica","zaharic"],"zaharicalele":"zaharicale","zaharicalelor":"zaharicale","zaharice":"zaharic","zaharicele":"zaharic","zaharici":"zaharic","zaharicii":"zaharic","zaharicoasa":["zaharicoasă","zaharicos","zaharicoasa","zaharicos"],"zaharicoase":"zaharicos","zaharicoasele":"zaharicos","zaharicosi":"zaharicos","zaharicosii":"zaharicos","zaharicosul":"zaharicos","zaharicul":"zaharic","zaharide":"zaharidă","zaharidei":"zaharidă","zaharidele":"zaharidă","zaharidelor":"zaharidă","zaharifera":["zahariferă","zaharifer","zaharifera","zaharifer"],"zaharifere":"zaharifer","zahariferele":"zaharifer","zahariferi":"zaharifer","zahariferii":"zaharifer","zahariferul":"zaharifer","zaharific":"zaharifica","zaharificai":"zaharifica","zaharificam":["zaharificăm","zaharifica","zaharificam","zaharifica"],"zaharificand":"zaharifica","zaharificara":"zaharifica","zaharificaram":"zaharifica","zaharificarati":"zaharifica","zaharificarea":"zaharificare","zaharificari":"zaharificare","zaharificarii":"zaharificare","zaharificarile":"zaharificare","zaharificarilor":"zaharificare","zaharificase":"zaharifica","zaharificasem":"zaharifica","zaharificasera":"zaharifica","zaharificaseram":"zaharifica","zaharificaserati":"zaharifica","zaharificasesi":"zaharifica","zaharificasi":"zaharifica","zaharificat":"zaharifica","zaharificati":"zaharifica","zaharificau":"zaharifica","zaharifici":"zaharifica","zaharigena":["zaharigenă","zaharigen","zaharigena","zaharigen"],"zaharigene":"zaharigen","zaharigenele":"zaharigen","zaharigeni":"zaharigen","zaharigenii":"zaharigen","zaharigenul":"zaharigen","zaharimetre":"zaharimetru","zaharimetrele":"zaharimetru","zaharimetrelor":"zaharimetru","zaharimetria":"zaharimetrie","zaharimetriei":"zaharimetrie","zaharimetrii":"zaharimetrie","zaharimetrul":"zaharimetru","zaharimetrule":"zaharimetru","zaharimetrului":"zaharimetru","zaharine":"zaharină","zaharinei":"zaharină","zaharinele":"zaharină","zaharinelor":"zaharină","zaharirea":"zăhărire","zahariri":"zăhărire","zaharirii":"zăhărire","zaharirile":"zăhărire","zaharirilor":"zăhărire","zaharisea":"zaharisi","zahariseai":"zaharisi","zahariseam":"zaharisi","zahariseati":"zaharisi","zahariseau":"zaharisi","zaharisesc":"zaharisi","zahariseste":"zaharisi","zaharisesti":"zaharisi","zaharisii":"zaharisi","zaharisim":"zaharisi","zaharisind":"zaharisi","zaharisira":"zaharisi","zaharisiram":"zaharisi","zaharisirati":"zaharisi","zaharisirea":"zaharisire","zaharisiri":"zaharisire","zaharisirii":"zaharisire","zaharisirile":"zaharisire","zaharisirilor":"zaharisire","zaharisise":"zaharisi","zaharisisem":"zaharisi","zaharisisera":"zaharisi","zaharisiseram":"zaharisi","zaharisiserati":"zaharisi","zaharisisesi":"zaharisi","zaharisisi":"zaharisi","zaharisit":"zaharisi","zaharisita":["zaharisită","zaharisit","zaharisita","zaharisit"],"zaharisite":"zaharisit","zaharisitele":"zaharisit","zaharisiti":["zaharisiți","zaharisi","zaharisiți","zaharisit"],"zaharisitii":"zaharisit","zaharisitul":"zaharisit","zaharita":["zaharită","zaharit","zaharita","zaharit","zăhărită","zăhărit","zăhărita","zăhărit"],"zaharite":["zaharite","zaharit","zăhărite","zăhărit"],"zaharitele":["zaharitele","zaharit","zăhăritele","zăhărit"],"zahariti":["zahariți","zaharit","zăhăriți","zăhărit"],"zaharitii":["zahariții","zaharit","zăhăriții","zăhărit"],"zaharitul":["zaharitul","zaharit","zăhăritul","zăhărit"],"zaharnite":"zaharniță","zaharnitei":"zaharniță","zaharnitele":"zaharniță","zaharnitelor":"zaharniță","zaharoasa":["zaharoasă","zaharos","zaharoasa","zaharos"],"zaharoase":"zaharos","zaharoasele":"zaharos","zaharoida":["zaharoidă","zaharoid","zaharoida","zaharoid"],"zaharoide":"zaharoid","zaharoidele":"zaharoid","zaharoidul":"zaharoid","zaharoizi":"zaharoid","zaharoizii":"zaharoid","zaharometre":"zaharometru","zaharometrele":"zaharometru","zaharometrelor":"zaharometru","zaharometrul":"zaharometru","zaharometrule":"zaharometru","zaharometrului":"zaharometru","zaharomicoze":"zaharomicoză","zaharomicozei":"zaharomicoză","zaharosi":"zaharos","zaharosii":"zaharos","zaharosul":"zaharos","zaharoze":"zaharoză","zaharozei":"zaharoză","zaharozele":"zaharoză","zaharozelor":"zaharoză","zaharul":["zaharul","zahar","zahărul","zahăr"],"zaharule":["zaharule","zahar","zahărule","zahăr"],"zaharului":["zaharului","zahar","zahărului","zahăr"],"zaharuri":"zahar","zaharurile":"zahar","zaharurilor":"zahar","zahatuia":"zăhătui","zahatuiai":"zăhătui","zahatuiam":"zăhătui","zahatuiati":"zăhătui","zahatuiau":"zăhătui","zahatuiesc":"zăhătui","zahatuieste":"zăhătui","zahatuiesti":"zăhătui","zahatuii":"zăhătui","zahatuim":"zăhătui","zahatuind":"zăhătui","zahatuira":"zăhătui","zahatuiram":"zăhătui","zahatuirati":"zăhătui","zahatuise":"zăhătui","zahatuisem":"zăhătui","zahatuisera":"zăhătui","zahatuiseram":"zăhătui","zahatuiserati":"zăhătui","zahatuisesi":"zăhătui","zahatuisi":"zăhătui","zahatuit":"zăhătui","zahatuiti":"zăhătui","zaiafetul":"zaiafet","zaiafetule":"zaiafet","zaiafetului":"zaiafet","zaiafeturi":"zaiafet","zaiafeturile":"zaiafet","zaiafeturilor":"zaiafet","zaici":"zaică","zaicii":"zaică","zaicile":"zaică","zaicilor":"zaică","zaicoii":"zaicoi","zaicoilor":"zaicoi","zaicoiul":"zaicoi","zaicoiule":"zaicoi","zaicoiului":"zaicoi","zaifa":["zaifă","zaif","zaifa","zaif"],"zaife":"zaif","zaifele":"zaif","zaifetul":"zaifet","zaifetule":"zaifet","zaifetului":"zaifet","zaifeturi":"zaifet","zaifeturile":"zaifet","zaifeturilor":"zaifet","zaifi":"zaif","zaifii":"zaif","zaiflacul":"zaiflâc","zaiflacule":"zaiflâc","zaiflacului":"zaiflâc","zaiflacuri":"zaiflâc","zaiflacurile":"zaiflâc","zaiflacurilor":"zaiflâc","zaiful":"zaif","zaimful":"zaimf","zaimfule":"zaimf","zaimfului":"zaimf","zaimfuri":"zaimf","zaimfurile":"zaimf","zaimfurilor":"zaimf","zaireza":["zaireză","zairez","zaireza","zairez"],"zaireze":["zaireze","zairez","zaireze","zaireză"],"zairezei":"zaireză","zairezele":["zairezele","zairez","zairezele","zaireză"],"zairezelor":"zaireză","zairezi":"zairez","zairezii":"zairez","zairezilor":"zairez","zairezul":"zairez","zairezule":"zairez","zairezului":"zairez","zalane":"zălan","zalanele":"zălan","zalanelor":"zălan","zalanul":"zălan","zalanule":"zălan","zalanului":"zălan","zalauana":["zălăuană","zălăuan","zălăuana","zălăuan"],"zalauance":"zălăuancă","zalauancei":"zălăuancă","zalauancele":"zălăuancă","zalauancelor":"zălăuancă","zalauane":"zălăuan","zalauanele":"zălăuan","zalauani":"zălăuan","zalauanii":"zălăuan","zalauanilor":"zălăuan","zalauanul":"zălăuan","zalauanule":"zălăuan","zalauanului":"zălăuan","zale":"zală","zalei":"zală","zalele":"zală","zalelor":"zală","zalfe":"zalfă","zalfei":"zalfă","zalfele":"zalfă","zalfelor":"zalfă","zalhanagii":"zalhanagiu","zalhanagiii":"zalhanagiu","zalhanagiilor":"zalhanagiu","zalhanagiuul":"zalhanagiu","zalhanagiuule":"zalhanagiu","zalhanagiuului":"zalhanagiu","zalhanale":"zalhana","zalhanalei":"zalhana","zalhanalele":"zalhana","zalhanalelor":"zalhana","zalhanaua":"zalhana","zalisoare":"zălișoară","zalisoarei":"zălișoară","zalisoarele":"zălișoară","zalisoarelor":"zălișoară","zalogirea":"zălogire","zalogiri":"zălogire","zalogirii":"zălogire","zalogirile":"zălogire","zalogirilor":"zălogire","zalute":"zăluță","zalutei":"zăluță","zalutele":"zăluță","zalutelor":"zăluță","zama":"zeamă","zamanul":"zaman","zamanule":"zaman","zamanului":"zaman","zamanuri":"zaman","zamanurile":"zaman","zamanurilor":"zaman","zamarci":"zămârcă","zamarcii":"zămârcă","zamarcile":"zămârcă","zamarcilor":"zămârcă","zambareata":["zâmbăreață","zâmbăreț","zâmbăreața","zâmbăreț"],"zambarete":"zâmbăreț","zambaretele":"zâmbăreț","zambareti":"zâmbăreț","zambaretii":"zâmbăreț","zambaretul":"zâmbăreț","zambea":"zâmbi","zambeai":"zâmbi","zambeam":"zâmbi","zambeati":"zâmbi","zambeau":"zâmbi","zambesc":"zâmbi","zambeste":"zâmbi","zambesti":"zâmbi","zambete":"zâmbet","zambetele":"zâmbet","zambetelor":"zâmbet","zambetul":"zâmbet","zambetule":"zâmbet","zambetului":"zâmbet","zambiana":["zambiană","zambian","zambiana","zambian"],"zambianul":"zambian","zambiene":["zambiene","zambian","zambiene","zambiană"],"zambienei":"zambiană","zambienele":["zambienele","zambian","zambienele","zambiană"],"zambienelor":"zambiană","zambieni":"zambian","zambienii":"zambian","zambii":"zâmbi","zambile":"zambilă","zambileaua":"zambilea","zambilei":"zambilă","zambilele":["zambilele","zambilă","zambilele","zambilea"],"zambilelei":"zambilea","zambilelele":"zambilea","zambilelelor":"zambilea","zambilelor":"zambilă","zambilia":"zambilie","zambilici":"zambilică","zambilicii":"zambilică","zambilicile":"zambilică","zambilicilor":"zambilică","zambiliei":"zambilie","zambilii":"zambilie","zambiliile":"zambilie","zambiliilor":"zambilie","zambim":"zâmbi","zambind":"zâmbi","zambira":"zâmbi","zambiram":"zâmbi","zambirati":"zâmbi","zambirea":"zâmbire","zambiri":"zâmbire","zambirii":"zâmbire","zambirile":"zâmbire","zambirilor":"zâmbire","zambise":"zâmbi","zambisem":"zâmbi","zambisera":"zâmbi","zambiseram":"zâmbi","zambiserati":"zâmbi","zambisesi":"zâmbi","zambisi":"zâmbi","zambit":"zâmbi","zambiti":"zâmbi","zambitoare":"zâmbitor","zambitoarea":"zâmbitor","zambitoarele":"zâmbitor","zambitori":"zâmbitor","zambitorii":"zâmbitor","zambitorul":"zâmbitor","zambiture":"zâmbitură","zambiturei":"zâmbitură","zambiturele":"zâmbitură","zambiturelor":"zâmbitură","zambituri":"zâmbitură","zambri":"zâmbru","zambrii":"zâmbru","zambrilor":"zâmbru","zambrul":"zâmbru","zambrule":"zâmbru","zambrului":"zâmbru","zamci":"zamcă","zamcii":"zamcă","zamcile":"zamcă","zamcilor":"zamcă","zamculite":"zămculiță","zamculitei":"zămculiță","zamculitele":"zămculiță","zamculitelor":"zămculiță","zamfire":["zamfire","zamfir","zamfire","zamfiră"],"zamfirei":"zamfiră","zamfirele":["zamfirele","zamfir","zamfirele","zamfiră"],"zamfirelor":["zamfirelor","zamfir","zamfirelor","zamfiră"],"zamfirul":"zamfir","zamfirule":"zamfir","zamfirului":"zamfir","zamintele":"zăminteală","zamintelei":"zăminteală","zamintelele":"zăminteală","zamintelelor":"zăminteală","zaminteli":"zăminteală","zamintituri":"zămintitură","zamintiturii":"zămintitură","zamintiturile":"zămintitură","zamintiturilor":"zămintitură","zamislea":"zămisli","zamisleai":"zămisli","zamisleam":"zămisli","zamisleati":"zămisli","zamisleau":"zămisli","zamislesc":"zămisli","zamisleste":"zămisli","zamislesti":"zămisli","zamisliciunea":"zămisliciune","zamisliciuni":"zămisliciune","zamisliciunii":"zămisliciune","zamisliciunile":"zămisliciune","zamisliciunilor":"zămisliciune","zamislii":"zămisli","zamislim":"zămisli","zamislind":"zămisli","zamislira":"zămisli","zamisliram":"zămisli","zamislirati":"zămisli","zamislirea":"zămislire","zamisliri":"zămislire","zamislirii":"zămislire","zamislirile":"zămislire","zamislirilor":"zămislire","zamislise":"zămisli","zamislisem":"zămisli","zamislisera":"zămisli","zamisliseram":"zămisli","zamisliserati":"zămisli","zamislisesi":"zămisli","zamislisi":"zămisli","zamislit":"zămisli","zamisliti":["zămisliți","zămisli","zămisliți","zămislit"],"zamislitii":"zămislit","zamislitilor":"zămislit","zamislitoare":"zămislitor","zamislitoarea":"zămislitor","zamislitoarele":"zămislitor","zamislitori":"zămislitor","zamislitorii":"zămislitor","zamislitorul":"zămislitor","zamislitul":"zămislit","zamislitule":"zămislit","zamislitului":"zămislit","zamisluia":"zamislui","zamisluiai":"zamislui","zamisluiam":"zamislui","zamisluiati":"zamislui","zamisluiau":"zamislui","zamisluiesc":"zamislui","zamisluieste":"zamislui","zamisluiesti":"zamislui","zamisluii":"zamislui","zamisluim":"zamislui","zamisluind":"zamislui","zamisluira":"zamislui","zamisluiram":"zamislui","zamisluirati":"zamislui","zamisluise":"zamislui","zamisluisem":"zamislui","zamisluisera":"zamislui","zamisluiseram":"zamislui","zamisluiserati":"zamislui","zamisluisesi":"zamislui","zamisluisi":"zamislui","zamisluit":"zamislui","zamisluiti":"zamislui","zamnice":"zămnic","zamnicele":"zămnic","zamnicelor":"zămnic","zamnicul":"zămnic","zamnicule":"zămnic","zamnicului":"zămnic","zamolxica":["zamolxică","zamolxic","zamolxica","zamolxic"],"zamolxice":"zamolxic","zamolxicele":"zamolxic","zamolxici":"zamolxic","zamolxicii":"zamolxic","zamolxicul":"zamolxic","zamoraturi":"zămorâtură","zamoraturii":"zămorâtură","zamoraturile":"zămorâtură","zamoraturilor":"zămorâtură","zamosi":"zămos","zamosii":"zămos","zamosilor":"zămos","zamosite":"zămoșiță","zamositei":"zămoșiță","zamositele":"zămoșiță","zamositelor":"zămoșiță","zamosul":"zămos","zamosule":"zămos","zamosului":"zămos","zamparalacul":"zamparalâc","zamparalacule":"zamparalâc","zamparalacului":"zamparalâc","zamparalacuri":"zamparalâc","zamparalacurile":"zamparalâc","zamparalacurilor":"zamparalâc","zamparale":"zampara","zamparalei":"zampara","zamparalele":"zampara","zamparalelor":"zampara","zamparaua":"zampara","zamuri":"zamă","zamute":"zămuță","zamutei":"zămuță","zamutele":"zămuță","zamutelor":"zămuță","zananale":"zanana","zananalei":"zanana","zananalele":"zanana","zananalelor":"zanana","zananaua":"zanana","zanatec":"zănatic","zanateca":["zănatecă","zănatec","zănateca","zănatec"],"zanatece":"zănatec","zanatecele":"zănatec","zanateci":"zănatec","zanatecii":"zănatec","zanatecul":"zănatec","zanatica":["zănatică","zănatic","zănatica","zănatic"],"zanatice":"zănatic","zanaticele":"zănatic","zanatici":"zănatic","zanaticii":"zănatic","zanaticul":"zănatic","zane":"zână","zanei":"zână","zanele":"zână","zanelor":"zână","zangaituri":"zăngăitură","zangaiturii":"zăngăitură","zangaiturile":"zăngăitură","zangaiturilor":"zăngăitură","zangalai":"zângălău","zangalaile":"zângălău","zangalailor":"zângălău","zangalauul":"zângălău","zangalauule":"zângălău","zangalauului":"zângălău","zanganea":["zângănea","zângăni","zăngănea","zăngăni"],"zanganeai":["zângăneai","zângăni","zăngăneai","zăngăni"],"zanganeam":["zângăneam","zângăni","zăngăneam","zăngăni"],"zanganeati":["zângăneați","zângăni","zăngăneați","zăngăni"],"zanganeau":["zângăneau","zângăni","zăngăneau","zăngăni"],"zanganele":"zăngăneală","zanganelei":"zăngăneală","zanganelele":"zăngăneală","zanganelelor":"zăngăneală","zanganeli":"zăngăneală","zanganesc":["zângănesc","zângăni","zăngănesc","zăngăni"],"zanganeste":["zângănește","zângăni","zăngănește","zăngăni"],"zanganesti":["zângănești","zângăni","zăngănești","zăngăni"],"zanganii":["zângănii","zângăni","zăngănii","zăngăni"],"zanganim":["zângănim","zângăni","zăngănim","zăngăni"],"zanganind":["zângănind","zângăni","zăngănind","zăngăni"],"zanganira":["zângăniră","zângăni","zăngăniră","zăngăni"],"zanganiram":["zângănirăm","zângăni","zăngănirăm","zăngăni"],"zanganirati":["zângănirăți","zângăni","zăngănirăți","zăngăni"],"zanganirea":["zângănirea","zângănire","zăngănirea","zăngănire"],"zanganiri":["zângăniri","zângănire","zăngăniri","zăngănire"],"zanganirii":["zângănirii","zângănire","zăngănirii","zăngănire"],"zanganirile":["zângănirile","zângănire","zăngănirile","zăngănire"],"zanganirilor":["zângănirilor","zângănire","zăngănirilor","zăngănire"],"zanganise":["zângănise","zângăni","zăngănise","zăngăni"],"zanganisem":["zângănisem","zângăni","zăngănisem","zăngăni"],"zanganisera":["zângăniseră","zângăni","zăngăniseră","zăngăni"],"zanganiseram":["zângăniserăm","zângăni","zăngăniserăm","zăngăni"],"zanganiserati":["zângăniserăți","zângăni","zăngăniserăți","zăngăni"],"zanganisesi":["zângăniseși","zângăni","zăngăniseși","zăngăni"],"zanganisi":["zângăniși","zângăni","zăngăniși","zăngăni"],"zanganit":["zângănit","zângăni","zăngănit","zăngăni"],"zanganiti":["zângăniți","zângăni","zăngăniți","zăngăni"],"zanganitoare":["zângănitoare","zângănitor","zăngănitoare","zăngănitor"],"zanganitoarea":["zângănitoarea","zângănitor","zăngănitoarea","zăngănitor"],"zanganitoarele":["zângănitoarele","zângănitor","zăngănitoarele","zăngănitor"],"zanganitori":["zângănitori","zângănitor","zăngănitori","zăngănitor"],"zanganitorii":["zângănitorii","zângănitor","zăngănitorii","zăngănitor"],"zanganitorul":["zângănitorul","zângănitor","zăngănitorul","zăngănitor"],"zanganitul":["zângănitul","zângănit","zăngănitul","zăngănit"],"zanganitule":["zângănitule","zângănit","zăngănitule","zăngănit"],"zanganitului":["zângănitului","zângănit","zăngănitului","zăngănit"],"zanganituri":["zângănituri","zângănit","zăngănituri","zăngănit","zângănituri","zângănitură","zăngănituri","zăngănitură"],"zanganiturii":["zângăniturii","zângănitură","zăngăniturii","zăngănitură"],"zanganiturile":["zângăniturile","zângănit","zăngăniturile","zăngănit","zângăniturile","zângănitură","zăngăniturile","zăngănitură"],"zanganiturilor":["zângăniturilor","zângănit","zăngăniturilor","zăngănit","zângăniturilor","zângănitură","zăngăniturilor","zăngănitură"],"zangate":"zângăt","zangatele":"zângăt","zangatelor":"zângăt","zangatul":"zângăt","zangatule":"zângăt","zangatului":"zângăt","zanghete":"zânghet","zanghetele":"zânghet","zanghetelor":"zânghet","zanghetul":"zânghet","zanghetule":"zânghet","zanghetului":"zânghet","zani":"zân","zanii":"zân","zanilor":"zân","zanisoare":"zânișoară","zanisoarei":"zânișoară","zanisoarele":"zânișoară","zanisoarelor":"zânișoară","zanogute":"zănoguță","zanogutei":"zănoguță","zanogutele":"zănoguță","zanogutelor":"zănoguță","zanul":"zân","zanule":"zân","zanului":"zân","zapacea":"zăpăci","zapaceai":"zăpăci","zapaceam":"zăpăci","zapaceati":"zăpăci","zapaceau":"zăpăci","zapaceli":"zăpăceală","zapacelii":"zăpăceală","zapacelile":"zăpăceală","zapacelilor":"zăpăceală","zapacesc":"zăpăci","zapaceste":"zăpăci","zapacesti":"zăpăci","zapacii":"zăpăci","zapacim":"zăpăci","zapacind":"zăpăci","zapacira":"zăpăci","zapaciram":"zăpăci","zapacirati":"zăpăci","zapacirea":"zăpăcire","zapaciri":"zăpăcire","zapacirii":"zăpăcire","zapacise":"zăpăci","zapacisem":"zăpăci","zapacisera":"zăpăci","zapaciseram":"zăpăci","zapaciserati":"zăpăci","zapacisesi":"zăpăci","zapacisi":"zăpăci","zapacit":"zăpăci","zapacita":["zăpăcită","zăpăcit","zăpăcita","zăpăcit"],"zapacite":"zăpăcit","zapacitele":"zăpăcit","zapaciti":["zăpăciți","zăpăci","zăpăciți","zăpăcit"],"zapacitii":"zăpăcit","zapacitoare":"zăpăcitor","zapacitoarea":"zăpăcitor","zapacitoarele":"zăpăcitor","zapacitori":"zăpăcitor","zapacitorii":"zăpăcitor","zapacitorul":"zăpăcitor","zapacitul":"zăpăcit","zapadoasa":["zăpădoasă","zăpădos","zăpădoasa","zăpădos"],"zapadoase":"zăpădos","zapadoasele":"zăpădos","zapadosi":"zăpădos","zapadosii":"zăpădos","zapadosul":"zăpădos","zapai":"zapa","zapam":["zapăm","zapa","zapam","zapa"],"zapand":"zapa","zapara":"zapa","zaparam":"zapa","zaparati":"zapa","zaparsteai":"zăpârstea","zaparstealor":"zăpârstea","zaparsteaul":"zăpârstea","zaparsteaule":"zăpârstea","zaparsteaului":"zăpârstea","zaparte":"zapartă","zapartei":"zapartă","zapartele":"zapartă","zapartelor":"zapartă","zapase":"zapa","zapasem":"zapa","zapasera":"zapa","zapaseram":"zapa","zapaserati":"zapa","zapasesi":"zapa","zapasi":"zapa","zapat":"zapa","zapati":"zapa","zapau":"zapa","zapauca":["zăpăucă","zăpăuc","zăpăuca","zăpăuc"],"zapauce":"zăpăuc","zapaucele":"zăpăuc","zapauci":"zăpăuc","zapaucii":"zăpăuc","zapaucul":"zăpăuc","zapcia":"zapcii","zapciai":"zapcii","zapciam":"zapcii","zapciati":"zapcii","zapciau":"zapcii","zapciele":"zapcială","zapcielei":"zapcială","zapcielele":"zapcială","zapcielelor":"zapcială","zapcieli":"zapcială","zapcieria":"zapcierie","zapcieriei":"zapcierie","zapcierii":"zapcierie","zapcieriile":"zapcierie","zapcieriilor":"zapcierie","zapciesc":"zapcii","zapcieste":"zapcii","zapciesti":"zapcii","zapcii":"zapciu","zapciii":["zapciii","zapcii","zapciii","zapciu"],"zapciilor":"zapciu","zapciim":"zapcii","zapciind":"zapcii","zapciira":"zapcii","zapciiram":"zapcii","zapciirati":"zapcii","zapciise":"zapcii","zapciisem":"zapcii","zapciisera":"zapcii","zapciiseram":"zapcii","zapciiserati":"zapcii","zapciisesi":"zapcii","zapciisi":"zapcii","zapciit":"zapcii","zapciiti":"zapcii","zapcilacul":"zapcilâc","zapcilacule":"zapcilâc","zapcilacului":"zapcilâc","zapcilacuri":"zapcilâc","zapcilacurile":"zapcilâc","zapcilacurilor":"zapcilâc","zapciretul":"zapciret","zapciretule":"zapciret","zapciretului":"zapciret","zapcireturi":"zapciret","zapcireturile":"zapciret","zapcireturilor":"zapciret","zapciul":"zapciu","zapciule":"zapciu","zapciului":"zapciu","zapeaza":"zapa","zapez":"zapa","zapezi":["zapezi","zapa","zăpezi","zăpadă"],"zapezii":"zăpadă","zapezile":"zăpadă","zapezilor":"zăpadă","zapise":"zapis","zapisele":"zapis","zapiselor":"zapis","zapisti":"zapiscă","zapistii":"zapiscă","zapistile":"zapiscă","zapistilor":"zapiscă","zapisul":"zapis","zapisule":"zapis","zapisului":"zapis","zaplajoare":"zăplăjor","zaplajoarele":"zăplăjor","zaplajoarelor":"zăplăjor","zaplajorul":"zăplăjor","zaplajorule":"zăplăjor","zaplajorului":"zăplăjor","zaplazul":"zăplaz","zaplazule":"zăplaz","zaplazului":"zăplaz","zaplazuri":"zăplaz","zaplazurile":"zăplaz","zaplazurilor":"zăplaz","zapoare":"zăpor","zapoarele":"zăpor","zapoarelor":"zăpor","zaporojeanul":"zaporojean","zaporojeanule":"zaporojean","zaporojeanului":"zaporojean","zaporojeni":"zaporojean","zaporojenii":"zaporojean","zaporojenilor":"zaporojean","zaporoji":"zaporoj","zaporojii":"zaporoj","zaporojilor":"zaporoj","zaporojul":"zaporoj","zaporojule":"zaporoj","zaporojului":"zaporoj","zaporul":"zăpor","zaporule":"zăpor","zaporului":"zăpor","zapoveze":"zapoveadă","zapovezei":"zapoveadă","zapovezele":"zapoveadă","zapovezelor":"zapoveadă","zapovezi":"zapoveadă","zapreastenia":"zăpreaștenie","zapreasteniei":"zăpreaștenie","zapreastenii":"zăpreaștenie","zapreasteniile":"zăpreaștenie","zapreasteniilor":"zăpreaștenie","zaprestenia":"zapreștenie","zapresteniei":"zapreștenie","zaprestenii":"zapreștenie","zapresteniile":"zapreștenie","zapresteniilor":"zapreștenie","zapsirea":"zăpșire","zapsiri":"zăpșire","zapsirii":"zăpșire","zapsirile":"zăpșire","zapsirilor":"zăpșire","zaptul":"zapt","zaptule":"zapt","zaptului":"zapt","zapucul":"zăpuc","zapucule":"zăpuc","zapucului":"zăpuc","zapucuri":"zăpuc","zapucurile":"zăpuc","zapucurilor":"zăpuc","zapusea":"zăpuși","zapuseai":"zăpuși","zapuseam":"zăpuși","zapuseati":"zăpuși","zapuseau":"zăpuși","zapusele":"zăpușeală","zapuselei":"zăpușeală","zapuselele":"zăpușeală","zapuselelor":"zăpușeală","zapuseli":"zăpușeală","zapusesc":"zăpuși","zapuseste":"zăpuși","zapusesti":"zăpuși","zapusii":"zăpuși","zapusim":"zăpuși","zapusind":"zăpuși","zapusira":"zăpuși","zapusiram":"zăpuși","zapusirati":"zăpuși","zapusise":"zăpuși","zapusisem":"zăpuși","zapusisera":"zăpuși","zapusiseram":"zăpuși","zapusiserati":"zăpuși","zapusisesi":"zăpuși","zapusisi":"zăpuși","zapusit":"zăpuși","zapusita":["zăpușită","zăpușit","zăpușita","zăpușit"],"zapusite":"zăpușit","zapusitele":"zăpușit","zapusiti":["zăpușiți","zăpuși","zăpușiți","zăpușit"],"zapusitii":"zăpușit","zapusitoare":"zăpușitor","zapusitoarea":"zăpușitor","zapusitoarele":"zăpușitor","zapusitori":"zăpușitor","zapusitorii":"zăpușitor","zapusitorul":"zăpușitor","zapusitul":"zăpușit","zar":"zer","zarafi":"zaraf","zarafii":"zaraf","zarafilor":"zaraf","zaraflacul":"zaraflâc","zaraflacule":"zaraflâc","zaraflacului":"zaraflâc","zaraflacuri":"zaraflâc","zaraflacurile":"zaraflâc","zaraflacurilor":"zaraflâc","zaraful":"zaraf","zarafule":"zaraf","zarafului":"zaraf","zarancirea":"zărâncire","zaranciri":"zărâncire","zarancirii":"zărâncire","zarancirile":"zărâncire","zarancirilor":"zărâncire","zarari":"zărar","zararii":"zărar","zararilor":"zărar","zararul":"zărar","zararule":"zărar","zararului":"zărar","zaratite":"zaratit","zaratitele":"zaratit","zaratitelor":"zaratit","zaratitul":"zaratit","zaratitule":"zaratit","zaratitului":"zaratit","zare":"zară","zarea":["zarea","zare","zărea","zări"],"zareai":"zări","zaream":"zări","zareati":"zări","zareau":"zări","zareaua":"zărea","zarei":"zară","zarele":"zărea","zarelei":"zărea","zarelele":"zărea","zarelelor":"zărea","zarelul":"zărel","zarelule":"zărel","zarelului":"zărel","zaresc":"zări","zareste":"zări","zaresti":"zări","zareze":"zărează","zarezei":"zărează","zarezele":"zărează","zarezelor":"zărează","zarezi":"zărează","zarful":"zarf","zarfule":"zarf","zarfului":"zarf","zarfuri":"zarf","zarfurile":"zarf","zarfurilor":"zarf","zarganeaua":"zărgănea","zarganele":"zărgănea","zarganelei":"zărgănea","zarganelele":"zărgănea","zarganelelor":"zărgănea","zargani":"zărgan","zarganii":"zărgan","zarganilor":"zărgan","zarganul":"zărgan","zarganule":"zărgan","zarganului":"zărgan","zarghele":"zărgheală","zarghelei":"zărgheală","zarghelele":"zărgheală","zarghelelor":"zărgheală","zargheli":"zărgheală","zarghenia":"zărghenie","zargheniei":"zărghenie","zarghenii":"zărghenie","zargheniile":"zărghenie","zargheniilor":"zărghenie","zarghita":["zărghită","zărghit","zărghita","zărghit"],"zarghite":"zărghit","zarghitele":"zărghit","zarghiti":"zărghit","zarghitii":"zărghit","zarghitul":"zărghit","zari":"zare","zarice":"zărică","zaricei":"zărică","zarifa":["zarifă","zarif","zarifa","zarif"],"zarife":"zarif","zarifele":"zarif","zarifi":"zarif","zarifii":"zarif","zariflacul":"zariflâc","zariflacule":"zariflâc","zariflacului":"zariflâc","zariflacuri":"zariflâc","zariflacurile":"zariflâc","zariflacurilor":"zariflâc","zariful":"zarif","zarii":["zării","zare","zării","zări"],"zarile":"zare","zarilor":"zare","zarim":"zări","zarind":"zări","zarira":"zări","zariram":"zări","zarirati":"zări","zarirea":"zărire","zariri":"zărire","zaririi":"zărire","zaririle":"zărire","zaririlor":"zărire","zarise":"zări","zarisem":"zări","zarisera":"zări","zariseram":"zări","zariserati":"zări","zarisesi":"zări","zarisi":"zări","zaristea":"zariște","zaristi":"zariște","zaristii":"zariște","zaristile":"zariște","zaristilor":"zariște","zarit":"zări","zariti":"zări","zarnacadeaua":"zarnacadea","zarnacadele":"zarnacadea","zarnacadelei":"zarnacadea","zarnacadelele":"zarnacadea","zarnacadelelor":"zarnacadea","zarne":"zârnă","zarnei":"zârnă","zarnele":"zârnă","zarnelor":"zârnă","zarniceale":"zărniceală","zarnicealei":"zărniceală","zarnuste":"zârnușcă","zarnustei":"zârnușcă","zarnustele":"zârnușcă","zarnustelor":"zârnușcă","zarpale":"zarpa","zarpalei":"zarpa","zarpalele":"zarpa","zarpalelor":"zarpa","zarpaua":"zarpa","zarul":["zarul","zar","zărul","zăr"],"zarule":["zarule","zar","zărule","zăr"],"zarului":["zarului","zar","zărului","zăr"],"zaruri":["zaruri","zar","zăruri","zăr"],"zarurile":["zarurile","zar","zărurile","zăr"],"zarurilor":["zarurilor","zar","zărurilor","zăr"],"zarzamul":"zarzam","zarzamule":"zarzam","zarzamului":"zarzam","zarzamuri":"zarzam","zarzamurile":"zarzam","zarzamurilor":"zarzam","zarzarasi":"zărzăraș","zarzarasii":"zărzăraș","zarzarasilor":"zărzăraș","zarzarasul":"zărzăraș","zarzarasule":"zărzăraș","zarzarasului":"zărzăraș","zarzare":"zarzără","zarzarei":["zarzărei","zarzără","zărzărei","zărzărel"],"zarzarele":["zarzărele","zarzără","zărzărele","zărzărică"],"zarzareli":"zărzărel","zarzarelii":"zărzărel","zarzarelilor":"zărzărel","zarzarelor":"zarzără","zarzarelul":"zărzărel","zarzarelule":"zărzărel","zarzarelului":"zărzărel","zarzari":["zarzari","zarzar","zarzări","zarzăr"],"zarzarice":"zărzărică","zarzaricei":"zărzărică","zarzaricele":"zărzărică","zarzaricelor":"zărzărică","zarzarii":["zarzarii","zarzar","zarzării","zarzăr"],"zarzarilor":["zarzarilor","zarzar","zarzărilor","zarzăr"],"zarzarul":["zarzarul","zarzar","zarzărul","zarzăr"],"zarzarule":["zarzarule","zarzar","zarzărule","zarzăr"],"zarzarului":["zarzarului","zarzar","zarzărului","zarzăr"],"zarzavagii":"zarzavagiu","zarzavagiii":"zarzavagiu","zarzavagiilor":"zarzavagiu","zarzavagioaice":"zarzavagioaică","zarzavagioaicei":"zarzavagioaică","zarzavagioaicele":"zarzavagioaică","zarzavagioaicelor":"zarzavagioaică","zarzavagiul":"zarzavagiu","zarzavagiule":"zarzavagiu","zarzavagiului":"zarzavagiu","zarzavatul":"zarzavat","zarzavatule":"zarzavat","zarzavatului":"zarzavat","zarzavaturi":"zarzavat","zarzavaturile":"zarzavat","zarzavaturilor":"zarzavat","zarzuele":"zarzuelă","zarzuelei":"zarzuelă","zarzuelele":"zarzuelă","zarzuelelor":"zarzuelă","zaslausi":"zăslăuș","zaslausii":"zăslăuș","zaslausilor":"zăslăuș","zaslausul":"zăslăuș","zaslausule":"zăslăuș","zaslausului":"zăslăuș","zast":"zât","zaticnirea":"zăticnire","zaticniri":"zăticnire","zaticnirii":"zăticnire","zaticnirile":"zăticnire","zaticnirilor":"zăticnire","zatignea":"zătigni","zatigneai":"zătigni","zatigneam":"zătigni","zatigneati":"zătigni","zatigneau":"zătigni","zatignesc":"zătigni","zatigneste":"zătigni","zatignesti":"zătigni","zatignii":"zătigni","zatignim":"zătigni","zatignind":"zătigni","zatignira":"zătigni","zatigniram":"zătigni","zatignirati":"zătigni","zatignise":"zătigni","zatignisem":"zătigni","zatignisera":"zătigni","zatigniseram":"zătigni","zatigniserati":"zătigni","zatignisesi":"zătigni","zatignisi":"zătigni","zatignit":"zătigni","zatigniti":"zătigni","zatocenia":"zatocenie","zatoceniei":"zatocenie","zatocenii":"zatocenie","zatoceniile":"zatocenie","zatoceniilor":"zatocenie","zatori":"zător","zatorii":"zător","zatorilor":"zător","zatorul":"zător","zatorule":"zător","zatorului":"zător","zatul":"zaț","zatule":"zaț","zatului":"zaț","zaturi":"zaț","zaturile":"zaț","zaturilor":"zaț","zavelci":"zavelcă","zavelcii":"zavelcă","zavelcile":"zavelcă","zavelcilor":"zavelcă","zavelcute":"zăvelcuță","zavelcutei":"zăvelcuță","zavelcutele":"zăvelcuță","zavelcutelor":"zăvelcuță","zavere":"zaveră","zaverei":"zaveră","zaverele":"zaveră","zaverelor":"zaveră","zavergii":"zavergiu","zavergiii":"zavergiu","zavergiilor":"zavergiu","zavergisea":"zavergisi","zavergiseai":"zavergisi","zavergiseam":"zavergisi","zavergiseati":"zavergisi","zavergiseau":"zavergisi","zavergisesc":"zavergisi","zavergiseste":"zavergisi","zavergisesti":"zavergisi","zavergisii":"zavergisi","zavergisim":"zavergisi","zavergisind":"zavergisi","zavergisira":"zavergisi","zavergisiram":"zavergisi","zavergisirati":"zavergisi","zavergisise":"zavergisi","zavergisisem":"zavergisi","zavergisisera":"zavergisi","zavergisiseram":"zavergisi","zavergisiserati":"zavergisi","zavergisisesi":"zavergisi","zavergisisi":"zavergisi","zavergisit":"zavergisi","zavergisiti":"zavergisi","zavergiuul":"zavergiu","zavergiuule":"zavergiu","zavergiuului":"zavergiu","zavisnica":["zavisnică","zavisnic","zavisnica","zavisnic"],"zavisnice":"zavisnic","zavisnicele":"zavisnic","zavisnici":"zavisnic","zavisnicii":"zavisnic","zavisnicul":"zavisnic","zavistia":["zavistia","zavistie","zavistia","zavistii"],"zavistiai":"zavistii","zavistiam":"zavistii","zavistiati":"zavistii","zavistiau":"zavistii","zavistica":["zavistică","zavistic","zavistica","zavistic"],"zavistice":"zavistic","zavisticele":"zavistic","zavistici":"zavistic","zavisticii":"zavistic","zavisticul":"zavistic","zavistiei":"zavistie","zavistiesc":"zavistii","zavistieste":"zavistii","zavistiesti":"zavistii","zavistii":"zavistie","zavistiii":"zavistii","zavistiile":"zavistie","zavistiilor":"zavistie","zavistiim":"zavistii","zavistiind":"zavistii","zavistiira":"zavistii","zavistiiram":"zavistii","zavistiirati":"zavistii","zavistiise":"zavistii","zavistiisem":"zavistii","zavistiisera":"zavistii","zavistiiseram":"zavistii","zavistiiserati":"zavistii","zavistiisesi":"zavistii","zavistiisi":"zavistii","zavistiit":"zavistii","zavistiiti":"zavistii","zavistioasa":["zavistioasă","zavistios","zavistioasa","zavistios"],"zavistioase":"zavistios","zavistioasele":"zavistios","zavistiosi":"zavistios","zavistiosii":"zavistios","zavistiosul":"zavistios","zavistliva":["zavistlivă","zavistliv","zavistliva","zavistliv"],"zavistlive":"zavistliv","zavistlivele":"zavistliv","zavistlivi":"zavistliv","zavistlivii":"zavistliv","zavistlivul":"zavistliv","zavistnica":["zavistnică","zavistnic","zavistnica","zavistnic"],"zavistnice":"zavistnic","zavistnicele":"zavistnic","zavistnici":"zavistnic","zavistnicia":"zavistnicie","zavistniciei":"zavistnicie","zavistnicii":["zavistnicii","zavistnic","zavistnicii","zavistnicie"],"zavistniciile":"zavistnicie","zavistniciilor":"zavistnicie","zavistnicul":"zavistnic","zavistuirea":"zavistuire","zavistuiri":"zavistuire","zavistuirii":"zavistuire","zavistuirile":"zavistuire","zavistuirilor":"zavistuire","zavistuitoare":"zavistuitor","zavistuitoarea":"zavistuitor","zavistuitoarele":"zavistuitor","zavistuitori":"zavistuitor","zavistuitorii":"zavistuitor","zavistuitorul":"zavistuitor","zavoaie":"zăvoi","zavoaiele":"zăvoi","zavoaielor":"zăvoi","zavoare":"zăvor","zavoarele":"zăvor","zavoarelor":"zăvor","zavodul":"zăvod","zavodule":"zăvod","zavodului":"zăvod","zavoduri":"zăvod","zavodurile":"zăvod","zavodurilor":"zăvod","zavoiul":"zăvoi","zavoiule":"zăvoi","zavoiului":"zăvoi","zavora":"zăvorî","zavorai":["zăvorai","zăvorî","zăvorâi","zăvorî"],"zavoram":["zăvorâm","zăvorî","zăvoram","zăvorî"],"zavorand":"zăvorî","zavorara":"zăvorî","zavoraram":"zăvorî","zavorarati":"zăvorî","zavorarea":"zăvorâre","zavorari":"zăvorâre","zavorarii":"zăvorâre","zavorasc":"zăvorî","zavorase":["zăvorașe","zăvoraș","zăvorâse","zăvorî"],"zavorasele":"zăvoraș","zavoraselor":"zăvoraș","zavorasem":"zăvorî","zavorasera":"zăvorî","zavoraseram":"zăvorî","zavoraserati":"zăvorî","zavorasesi":"zăvorî","zavorasi":"zăvorî","zavoraste":"zăvorî","zavorasti":"zăvorî","zavorasul":"zăvoraș","zavorasule":"zăvoraș","zavorasului":"zăvoraș","zavorati":["zăvorâți","zăvorî","zăvorați","zăvorî"],"zavorau":"zăvorî","zavorea":"zăvori","zavoreai":"zăvori","zavoream":"zăvori","zavoreati":"zăvori","zavoreau":"zăvori","zavoresc":"zăvori","zavoreste":"zăvori","zavoresti":"zăvori","zavorii":"zăvori","zavorim":"zăvori","zavorind":"zăvori","zavorira":"zăvori","zavoriram":"zăvori","zavorirati":"zăvori","zavorise":"zăvori","zavorisem":"zăvori","zavorisera":"zăvori","zavoriseram":"zăvori","zavoriserati":"zăvori","zavorisesi":"zăvori","zavorisi":"zăvori","zavorit":["zăvorit","zăvori","zăvorît","zăvorî"],"zavoriti":"zăvori","zavorul":"zăvor","zavorule":"zăvor","zavorului":"zăvor","zavragii":"zavragiu","zavragiii":"zavragiu","zavragiilor":"zavragiu","zavragiuul":"zavragiu","zavragiuule":"zavragiu","zavragiuului":"zavragiu","zazaitul":"zâzâit","zazaitule":"zâzâit","zazaitului":"zâzâit","zazaituri":"zâzâit","zazaiturile":"zâzâit","zazaiturilor":"zâzâit","zazania":"zâzanie","zazaniei":"zâzanie","zazanii":"zâzanie","zazaniile":"zâzanie","zazaniilor":"zâzanie","zbanai":"zbănaie","zbanaiea":"zbănaie","zbanaii":"zbănaie","zbanaile":"zbănaie","zbanailor":"zbănaie","zband":"zbea","zbanghia":"zbanghiu","zbanghie":"zbanghiu","zbanghii":"zbanghiu","zbanghiii":"zbanghiu","zbanghiile":"zbanghiu","zbanghiul":"zbanghiu","zbantuia":"zbănțui","zbantuiai":"zbănțui","zbantuiam":"zbănțui","zbantuiati":"zbănțui","zbantuiau":"zbănțui","zbantuiesc":"zbănțui","zbantuieste":"zbănțui","zbantuiesti":"zbănțui","zbantuii":"zbănțui","zbantuim":"zbănțui","zbantuind":"zbănțui","zbantuira":"zbănțui","zbantuiram":"zbănțui","zbantuirati":"zbănțui","zbantuirea":"zbânțuire","zbantuiri":"zbânțuire","zbantuirii":"zbânțuire","zbantuirile":"zbânțuire","zbantuirilor":"zbânțuire","zbantuise":"zbănțui","zbantuisem":"zbănțui","zbantuisera":"zbănțui","zbantuiseram":"zbănțui","zbantuiserati":"zbănțui","zbantuisesi":"zbănțui","zbantuisi":"zbănțui","zbantuit":"zbănțui","zbantuiti":"zbănțui","zbantuitul":"zbânțuit","zbantuitule":"zbânțuit","zbantuitului":"zbânțuit","zbantuiture":"zbânțuitură","zbantuiturei":"zbânțuitură","zbantuiturele":"zbânțuitură","zbantuiturelor":"zbânțuitură","zbantuituri":["zbânțuituri","zbânțuit","zbânțuituri","zbânțuitură","zbănțuituri","zbănțuitură"],"zbantuiturii":"zbănțuitură","zbantuiturile":["zbânțuiturile","zbânțuit","zbănțuiturile","zbănțuitură"],"zbantuiturilor":["zbânțuiturilor","zbânțuit","zbănțuiturilor","zbănțuitură"],"zbarcea":"zbârci","zbarceai":"zbârci","zbarceam":"zbârci","zbarceati":"zbârci","zbarceau":"zbârci","zbarcele":"zbârceală","zbarcelei":"zbârceală","zbarcelele":"zbârceală","zbarcelelor":"zbârceală","zbarceli":"zbârceală","zbarcesc":"zbârci","zbarceste":"zbârci","zbarcesti":"zbârci","zbarcete":"zbârceață","zbarcetei":"zbârceață","zbarcetele":"zbârceață","zbarcetelor":"zbârceață","zbarcii":"zbârci","zbarcim":"zbârci","zbarcind":"zbârci","zbarciogi":"zbârciog","zbarciogii":"zbârciog","zbarciogilor":"zbârciog","zbarciogul":"zbârciog","zbarciogule":"zbârciog","zbarciogului":"zbârciog","zbarcira":"zbârci","zbarciram":"zbârci","zbarcirati":"zbârci","zbarcirea":"zbârcire","zbarciri":"zbârcire","zbarcirii":"zbârcire","zbarcirile":"zbârcire","zbarcirilor":"zbârcire","zbarcise":"zbârci","zbarcisem":"zbârci","zbarcisera":"zbârci","zbarciseram":"zbârci","zbarciserati":"zbârci","zbarcisesi":"zbârci","zbarcisi":"zbârci","zbarcit":"zbârci","zbarcita":["zbârcită","zbârcit","zbârcita","zbârcit"],"zbarcite":"zbârcit","zbarcitele":"zbârcit","zbarciti":["zbârciți","zbârci","zbârciți","zbârcit"],"zbarcitii":"zbârcit","zbarcitul":"zbârcit","zbarcituri":"zbârcitură","zbarciturii":"zbârcitură","zbarciturile":"zbârcitură","zbarciturilor":"zbârcitură","zbarde":"zbardă","zbardei":"zbardă","zbardele":"zbardă","zbardelor":"zbardă","zbarlea":"zbârli","zbarleai":"zbârli","zbarleam":"zbârli","zbarleati":"zbârli","zbarleau":"zbârli","zbarlesc":"zbârli","zbarleste":"zbârli","zbarlesti":"zbârli","zbarlii":"zbârli","zbarlim":"zbârli","zbarlind":"zbârli","zbarlira":"zbârli","zbarliram":"zbârli","zbarlirati":"zbârli","zbarlirea":"zbârlire","zbarliri":"zbârlire","zbarlirii":"zbârlire","zbarlirile":"zbârlire","zbarlirilor":"zbârlire","zbarlise":"zbârli","zbarlisem":"zbârli","zbarlisera":"zbârli","zbarliseram":"zbârli","zbarliserati":"zbârli","zbarlisesi":"zbârli","zbarlisi":"zbârli","zbarlit":"zbârli","zbarlita":["zbârlită","zbârlit","zbârlita","zbârlit"],"zbarlite":"zbârlit","zbarlitele":"zbârlit","zbarliti":["zbârliți","zbârli","zbârliți","zbârlit"],"zbarlitii":"zbârlit","zbarlitul":"zbârlit","zbarnaia":"zbârnăi","zbarnaiai":"zbârnăi","zbarnaiam":"zbârnăi","zbarnaiati":"zbârnăi","zbarnaiau":"zbârnăi","zbarnaie":["zbârnâie","zbârnâi","zbârnăie","zbârnăi"],"zbarnaiele":"zbârnâială","zbarnaielei":"zbârnâială","zbarnaielele":"zbârnâială","zbarnaielelor":"zbârnâială","zbarnaieli":"zbârnâială","zbarnaii":"zbârnăi","zbarnaim":"zbârnăi","zbarnaind":"zbârnăi","zbarnaira":"zbârnăi","zbarnairam":"zbârnăi","zbarnairati":"zbârnăi","zbarnairea":["zbârnâirea","zbârnâire","zbârnăirea","zbârnăire"],"zbarnairi":["zbârnâiri","zbârnâire","zbârnăiri","zbârnăire"],"zbarnairii":["zbârnâirii","zbârnâire","zbârnăirii","zbârnăire"],"zbarnairile":"zbârnăire","zbarnairilor":"zbârnăire","zbarnaise":"zbârnăi","zbarnaisem":"zbârnăi","zbarnaisera":"zbârnăi","zbarnaiseram":"zbârnăi","zbarnaiserati":"zbârnăi","zbarnaisesi":"zbârnăi","zbarnaisi":"zbârnăi","zbarnait":["zbârnâit","zbârnâi","zbârnăit","zbârnăi"],"zbarnaiti":"zbârnăi","zbarnaitoare":"zbârnâitor","zbarnaitoarea":"zbârnâitor","zbarnaitoarele":"zbârnâitor","zbarnaitori":"zbârnâitor","zbarnaitorii":"zbârnâitor","zbarnaitorul":"zbârnâitor","zbarnaitul":"zbârnâit","zbarnaitule":"zbârnâit","zbarnaitului":"zbârnâit","zbarnaituri":["zbârnâituri","zbârnâit","zbârnâituri","zbârnâitură"],"zbarnaiturii":"zbârnâitură","zbarnaiturile":["zbârnâiturile","zbârnâit","zbârnâiturile","zbârnâitură"],"zbarnaiturilor":["zbârnâiturilor","zbârnâit","zbârnâiturilor","zbârnâitură"],"zbarne":"zbârnă","zbarnei":"zbârnă","zbarnele":"zbârnă","zbarnelor":"zbârnă","zbat":"zbate","zbata":"zbate","zbatand":"zbate","zbatea":"zbate","zbateai":"zbate","zbateam":"zbate","zbateati":"zbate","zbateau":"zbate","zbatem":"zbate","zbaterea":"zbatere","zbateri":"zbatere","zbaterii":"zbatere","zbaterile":"zbatere","zbaterilor":"zbatere","zbateti":"zbate","zbati":"zbate","zbatu":"zbate","zbatui":"zbate","zbatul":"zbat","zbatule":"zbat","zbatului":"zbat","zbatura":"zbate","zbaturam":"zbate","zbaturati":"zbate","zbaturi":"zbat","zbaturile":"zbat","zbaturilor":"zbat","zbatuse":"zbate","zbatusem":"zbate","zbatusera":"zbate","zbatuseram":"zbate","zbatuserati":"zbate","zbatusesi":"zbate","zbatusi":"zbate","zbatut":"zbate","zbau":"zbea","zbaui":"zbea","zbaura":"zbea","zbauram":"zbea","zbaurati":"zbea","zbause":"zbea","zbausem":"zbea","zbausera":"zbea","zbauseram":"zbea","zbauserati":"zbea","zbausesi":"zbea","zbausi":"zbea","zbaut":"zbea","zbeai":"zbea","zbeam":"zbea","zbeati":"zbea","zbeau":"zbea","zbegul":"zbeg","zbegule":"zbeg","zbegului":"zbeg","zbeguri":"zbeg","zbegurile":"zbeg","zbegurilor":"zbeg","zbei":"zbea","zbem":"zbea","zbenghiul":"zbenghi","zbenghiule":"zbenghi","zbenghiului":"zbenghi","zbenghiuri":"zbenghi","zbenghiurile":"zbenghi","zbenghiurilor":"zbenghi","zbenguia":"zbengui","zbenguiai":"zbengui","zbenguiam":"zbengui","zbenguiasca":"zbengui","zbenguiati":"zbengui","zbenguiau":"zbengui","zbenguieli":"zbenguială","zbenguielii":"zbenguială","zbenguielile":"zbenguială","zbenguielilor":"zbenguială","zbenguiesc":"zbengui","zbenguieste":"zbengui","zbenguiesti":"zbengui","zbenguii":"zbengui","zbenguim":"zbengui","zbenguind":"zbengui","zbenguira":"zbengui","zbenguiram":"zbengui","zbenguirati":"zbengui","zbenguirea":"zbenguire","zbenguiri":"zbenguire","zbenguirii":"zbenguire","zbenguirile":"zbenguire","zbenguirilor":"zbenguire","zbenguise":"zbengui","zbenguisem":"zbengui","zbenguisera":"zbengui","zbenguiseram":"zbengui","zbenguiserati":"zbengui","zbenguisesi":"zbengui","zbenguisi":"zbengui","zbenguit":"zbengui","zbenguita":["zbenguită","zbenguit","zbenguita","zbenguit"],"zbenguite":"zbenguit","zbenguitele":"zbenguit","zbenguiti":["zbenguiți","zbengui","zbenguiți","zbenguit"],"zbenguitii":"zbenguit","zbenguitul":"zbenguit","zberenguiele":"zberenguială","zberenguielei":"zberenguială","zberenguielele":"zberenguială","zberenguielelor":"zberenguială","zberenguieli":"zberenguială","zberengul":"zbereng","zberengule":"zbereng","zberengului":"zbereng","zberenguri":"zbereng","zberengurile":"zbereng","zberengurilor":"zbereng","zbeti":"zbea","zbiara":"zbiera","zbicea":"zbici","zbiceai":"zbici","zbiceam":"zbici","zbiceati":"zbici","zbiceau":"zbici","zbicesc":"zbici","zbiceste":"zbici","zbicesti":"zbici","zbicii":"zbici","zbicim":"zbici","zbicind":"zbici","zbicira":"zbici","zbiciram":"zbici","zbicirati":"zbici","zbicise":"zbici","zbicisem":"zbici","zbicisera":"zbici","zbiciseram":"zbici","zbiciserati":"zbici","zbicisesi":"zbici","zbicisi":"zbici","zbicit":"zbici","zbiciti":"zbici","zbiciuituri":"zbiciuitură","zbiciuiturii":"zbiciuitură","zbiciuiturile":"zbiciuitură","zbiciuiturilor":"zbiciuitură","zbiciuste":"zbiciușcă","zbiciustei":"zbiciușcă","zbiciustele":"zbiciușcă","zbiciustelor":"zbiciușcă","zbiciusti":"zbiciușcă","zbicute":"zbicuț","zbicutele":"zbicuț","zbicutelor":"zbicuț","zbicutul":"zbicuț","zbicutule":"zbicuț","zbicutului":"zbicuț","zbier":"zbiera","zbierai":"zbiera","zbieram":["zbierăm","zbiera","zbieram","zbiera"],"zbierand":"zbiera","zbierara":"zbiera","zbieraram":"zbiera","zbierarari":"zbierare","zbierararii":"zbierare","zbierararile":"zbierare","zbierararilor":"zbierare","zbierarati":"zbiera","zbierarea":"zbierare","zbierase":"zbiera","zbierasem":"zbiera","zbierasera":"zbiera","zbieraseram":"zbiera","zbieraserati":"zbiera","zbierasesi":"zbiera","zbierasi":"zbiera","zbierat":["zbierat","zbiera","zbierăt","zbieret"],"zbierate":"zbierăt","zbieratele":"zbierăt","zbieratelor":"zbierăt","zbierati":"zbiera","zbieratoare":"zbierător","zbieratoarea":"zbierător","zbieratoarele":"zbierător","zbieratori":"zbierător","zbieratorii":"zbierător","zbieratorilor":"zbierător","zbieratorul":"zbierător","zbieratorule":"zbierător","zbieratorului":"zbierător","zbieratul":"zbierăt","zbieratule":"zbierăt","zbieratului":"zbierăt","zbieraturi":"zbierătură","zbieraturii":"zbierătură","zbieraturile":"zbierătură","zbieraturilor":"zbierătură","zbierau":"zbiera","zbieret":"zbierat","zbierete":"zbieret","zbieri":"zbiera","zbihuia":"zbihui","zbihuiai":"zbihui","zbihuiam":"zbihui","zbihuiati":"zbihui","zbihuiau":"zbihui","zbihuiele":"zbihuială","zbihuielei":"zbihuială","zbihuielele":"zbihuială","zbihuielelor":"zbihuială","zbihuieli":"zbihuială","zbihuiesc":"zbihui","zbihuieste":"zbihui","zbihuiesti":"zbihui","zbihuii":"zbihui","zbihuim":"zbihui","zbihuind":"zbihui","zbihuira":"zbihui","zbihuiram":"zbihui","zbihuirati":"zbihui","zbihuise":"zbihui","zbihuisem":"zbihui","zbihuisera":"zbihui","zbihuiseram":"zbihui","zbihuiserati":"zbihui","zbihuisesi":"zbihui","zbihuisi":"zbihui","zbihuit":"zbihui","zbihuita":["zbihuită","zbihuit","zbihuita","zbihuit"],"zbihuite":"zbihuit","zbihuitele":"zbihuit","zbihuiti":["zbihuiți","zbihui","zbihuiți","zbihuit"],"zbihuitii":"zbihuit","zbihuitul":"zbihuit","zbiri":"zbir","zbirii":"zbir","zbirilor":"zbir","zbirisoare":"zbirișor","zbirisoarele":"zbirișor","zbirisoarelor":"zbirișor","zbirisorul":"zbirișor","zbirisorule":"zbirișor","zbirisorului":"zbirișor","zbirstine":"zbirștină","zbirstinei":"zbirștină","zbirstinele":"zbirștină","zbirstinelor":"zbirștină","zbirul":"zbir","zbirule":"zbir","zbirului":"zbir","zblenduia":"zblendui","zblenduiai":"zblendui","zblenduiam":"zblendui","zblenduiati":"zblendui","zblenduiau":"zblendui","zblenduiesc":"zblendui","zblenduieste":"zblendui","zblenduiesti":"zblendui","zblenduii":"zblendui","zblenduim":"zblendui","zblenduind":"zblendui","zblenduira":"zblendui","zblenduiram":"zblendui","zblenduirati":"zblendui","zblenduise":"zblendui","zblenduisem":"zblendui","zblenduisera":"zblendui","zblenduiseram":"zblendui","zblenduiserati":"zblendui","zblenduisesi":"zblendui","zblenduisi":"zblendui","zblenduit":"zblendui","zblenduiti":"zblendui","zboara":"zbura","zboare":"zbura","zbocotituri":"zbocotitură","zbocotiturii":"zbocotitură","zbocotiturile":"zbocotitură","zbocotiturilor":"zbocotitură","zbor":"zbura","zbori":"zbura","zboristea":"zboriște","zboristi":"zboriște","zboristii":"zboriște","zboristile":"zboriște","zboristilor":"zboriște","zbornice":"zbornic","zbornicele":"zbornic","zbornicelor":"zbornic","zbornicul":"zbornic","zbornicule":"zbornic","zbornicului":"zbornic","zborsita":["zborșită","zborșit","zborșita","zborșit"],"zborsite":"zborșit","zborsitele":"zborșit","zborsiti":"zborșit","zborsitii":"zborșit","zborsitul":"zborșit","zborul":"zbor","zborule":"zbor","zborului":"zbor","zboruri":"zbor","zboruri spatiale":"zbor spațial","zborurile":"zbor","zborurilor":"zbor","zbrehuda":["zbrehudă","zbrehud","zbrehuda","zbrehud"],"zbrehude":"zbrehud","zbrehudele":"zbrehud","zbrehudul":"zbrehud","zbrehuia":"zbrehui","zbrehuie":"zbrehui","zbrehuiele":"zbrehui","zbrehuii":"zbrehui","zbrehuiul":"zbrehui","zbrehuzi":"zbrehud","zbrehuzii":"zbrehud","zbucium":"zbuciuma","zbuciumai":"zbuciuma","zbuciumam":["zbuciumăm","zbuciuma","zbuciumam","zbuciuma"],"zbuciumand":"zbuciuma","zbuciumara":"zbuciuma","zbuciumaram":"zbuciuma","zbuciumarati":"zbuciuma","zbuciumarea":"zbuciumare","zbuciumari":"zbuciumare","zbuciumarii":"zbuciumare","zbuciumarile":"zbuciumare","zbuciumarilor":"zbuciumare","zbuciumase":"zbuciuma","zbuciumasem":"zbuciuma","zbuciumasera":"zbuciuma","zbuciumaseram":"zbuciuma","zbuciumaserati":"zbuciuma","zbuciumasesi":"zbuciuma","zbuciumasi":"zbuciuma","zbuciumat":"zbuciuma","zbuciumata":["zbuciumată","zbuciumat","zbuciumata","zbuciumat"],"zbuciumate":"zbuciumat","zbuciumatele":"zbuciumat","zbuciumati":["zbuciumați","zbuciuma","zbuciumați","zbuciumat"],"zbuciumatii":"zbuciumat","zbuciumatoare":"zbuciumător","zbuciumatoarea":"zbuciumător","zbuciumatoarele":"zbuciumător","zbuciumatori":"zbuciumător","zbuciumatorii":"zbuciumător","zbuciumatorul":"zbuciumător","zbuciumatul":"zbuciumat","zbuciumaturi":"zbuciumătură","zbuciumaturii":"zbuciumătură","zbuciumaturile":"zbuciumătură","zbuciumaturilor":"zbuciumătură","zbuciumau":"zbuciuma","zbuciume":"zbucium","zbuciumele":["zbuciumele","zbucium","zbuciumele","zbuciumeală"],"zbuciumelei":"zbuciumeală","zbuciumelele":"zbuciumeală","zbuciumelelor":"zbuciumeală","zbuciumeli":"zbuciumeală","zbuciumelor":"zbucium","zbuciumi":"zbuciuma","zbuciumul":"zbucium","zbuciumule":"zbucium","zbuciumului":"zbucium","zbucnea":"zbucni","zbucneai":"zbucni","zbucneam":"zbucni","zbucneati":"zbucni","zbucneau":"zbucni","zbucnesc":"zbucni","zbucneste":"zbucni","zbucnesti":"zbucni","zbucnii":"zbucni","zbucnim":"zbucni","zbucnind":"zbucni","zbucnira":"zbucni","zbucniram":"zbucni","zbucnirati":"zbucni","zbucnise":"zbucni","zbucnisem":"zbucni","zbucnisera":"zbucni","zbucniseram":"zbucni","zbucniserati":"zbucni","zbucnisesi":"zbucni","zbucnisi":"zbucni","zbucnit":"zbucni","zbucniti":"zbucni","zbughele":"zbugheală","zbughelei":"zbugheală","zbughelele":"zbugheală","zbughelelor":"zbugheală","zbugheli":"zbugheală","zbughirea":"zbughire","zbughiri":"zbughire","zbughirii":"zbughire","zbughirile":"zbughire","zbughirilor":"zbughire","zburaciunea":"zburăciune","zburaciuni":"zburăciune","zburaciunii":"zburăciune","zburaciunile":"zburăciune","zburaciunilor":"zburăciune","zburai":"zbura","zburam":["zburăm","zbura","zburam","zbura"],"zburand":"zbura","zburara":"zbura","zburaram":"zbura","zburarati":"zbura","zburarea":"zburare","zburari":"zburare","zburarii":"zburare","zburarile":"zburare","zburarilor":"zburare","zburase":"zbura","zburasem":"zbura","zburasera":"zbura","zburaseram":"zbura","zburaserati":"zbura","zburasesi":"zbura","zburasi":"zbura","zburat":"zbura","zburata":["zburată","zburat","zburata","zburat"],"zburatacirea":"zburătăcire","zburataciri":"zburătăcire","zburatacirii":"zburătăcire","zburatacirile":"zburătăcire","zburatacirilor":"zburătăcire","zburatairea":"zburătăire","zburatairi":"zburătăire","zburatairii":"zburătăire","zburatairile":"zburătăire","zburatairilor":"zburătăire","zburatatia":"zburătăție","zburatatiei":"zburătăție","zburatatii":"zburătăție","zburate":"zburat","zburatele":"zburat","zburati":["zburați","zbura","zburați","zburat"],"zburatii":"zburat","zburatoarea":"zburătoare","zburatoarei":"zburătoare","zburatoarele":"zburătoare","zburatoarelor":"zburătoare","zburatorea":"zburători","zburatoreai":"zburători","zburatoream":"zburători","zburatoreati":"zburători","zburatoreau":"zburători","zburatoresc":"zburători","zburatoreste":"zburători","zburatoresti":"zburători","zburatori":"zburător","zburatorii":["zburătorii","zburător","zburătorii","zburători"],"zburatorilor":"zburător","zburatorim":"zburători","zburatorind":"zburători","zburatorira":"zburători","zburatoriram":"zburători","zburatorirati":"zburători","zburatorise":"zburători","zburatorisem":"zburători","zburatorisera":"zburători","zburatoriseram":"zburători","zburatoriserati":"zburători","zburatorisesi":"zburători","zburatorisi":"zburători","zburatorit":"zburători","zburatoriti":"zburători","zburatorul":"zburător","zburatorule":"zburător","zburatorului":"zburător","zburatul":"zburat","zburau":"zbura","zburd":"zburda","zburdaciunea":"zburdăciune","zburdaciuni":"zburdăciune","zburdaciunii":"zburdăciune","zburdaciunile":"zburdăciune","zburdaciunilor":"zburdăciune","zburdai":"zburda","zburdalnicia":"zburdălnicie","zburdalniciei":"zburdălnicie","zburdalnicii":"zburdălnicie","zburdalniciile":"zburdălnicie","zburdalniciilor":"zburdălnicie","zburdam":["zburdăm","zburda","zburdam","zburda"],"zburdand":"zburda","zburdara":"zburda","zburdaram":"zburda","zburdarati":"zburda","zburdarea":"zburdare","zburdari":"zburdare","zburdarii":"zburdare","zburdarile":"zburdare","zburdarilor":"zburdare","zburdase":"zburda","zburdasem":"zburda","zburdasera":"zburda","zburdaseram":"zburda","zburdaserati":"zburda","zburdasesi":"zburda","zburdasi":"zburda","zburdat":"zburda","zburdati":"zburda","zburdaturi":"zburdătură","zburdaturii":"zburdătură","zburdaturile":"zburdătură","zburdaturilor":"zburdătură","zburdau":"zburda","zburdaul":"zburdă","zburdaule":"zburdă","zburdaului":"zburdă","zburde":["zburde","zburda","zburde","zburdă"],"zburdele":"zburdă","zburdelor":"zburdă","zburlea":"zburli","zburleai":"zburli","zburleam":"zburli","zburleati":"zburli","zburleau":"zburli","zburlesc":"zburli","zburleste":"zburli","zburlesti":"zburli","zburlii":"zburli","zburlim":"zburli","zburlind":"zburli","zburlira":"zburli","zburliram":"zburli","zburlirati":"zburli","zburlirea":"zburlire","zburliri":"zburlire","zburlirii":"zburlire","zburlirile":"zburlire","zburlirilor":"zburlire","zburlise":"zburli","zburlisem":"zburli","zburlisera":"zburli","zburliseram":"zburli","zburliserati":"zburli","zburlisesi":"zburli","zburlisi":"zburli","zburlit":"zburli","zburlita":["zburlită","zburlit","zburlita","zburlit"],"zburlite":"zburlit","zburlitele":"zburlit"};
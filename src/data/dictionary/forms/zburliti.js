@@ -0,0 +1 @@
+export default {"zburliti":["zburliți","zburli","zburliți","zburlit"],"zburlitii":"zburlit","zburlitul":"zburlit","zburzi":"zburda","zdarlogi":"zdârlog","zdarlogii":"zdârlog","zdarlogilor":"zdârlog","zdarlogul":"zdârlog","zdarlogule":"zdârlog","zdarlogului":"zdârlog","zdarneciul":"zdârneci","zdarneciule":"zdârneci","zdarneciului":"zdârneci","zdelci":"zdelcă","zdelcii":"zdelcă","zdelcile":"zdelcă","zdelcilor":"zdelcă","zdemnul":"zdemn","zdemnule":"zdemn","zdemnului":"zdemn","zdragoni":"zdragon","zdragonii":"zdragon","zdragonilor":"zdragon","zdragonul":"zdragon","zdragonule":"zdragon","zdragonului":"zdragon","zdramboaie":"zdrâmboi","zdramboaiele":"zdrâmboi","zdramboaielor":"zdrâmboi","zdramboiul":"zdrâmboi","zdramboiule":"zdrâmboi","zdramboiului":"zdrâmboi","zdrancanea":"zdrăncăni","zdrancaneai":"zdrăncăni","zdrancaneam":"zdrăncăni","zdrancaneati":"zdrăncăni","zdrancaneau":"zdrăncăni","zdrancanesc":"zdrăncăni","zdrancaneste":"zdrăncăni","zdrancanesti":"zdrăncăni","zdrancanii":"zdrăncăni","zdrancanim":"zdrăncăni","zdrancanind":"zdrăncăni","zdrancanira":"zdrăncăni","zdrancaniram":"zdrăncăni","zdrancanirati":"zdrăncăni","zdrancanise":"zdrăncăni","zdrancanisem":"zdrăncăni","zdrancanisera":"zdrăncăni","zdrancaniseram":"zdrăncăni","zdrancaniserati":"zdrăncăni","zdrancanisesi":"zdrăncăni","zdrancanisi":"zdrăncăni","zdrancanit":"zdrăncăni","zdrancaniti":"zdrăncăni","zdrancanitul":"zdrăncănit","zdrancanitule":"zdrăncănit","zdrancanitului":"zdrăncănit","zdranganea":["zdrângănea","zdrângăni","zdrăngănea","zdrăngăni"],"zdranganeai":["zdrângăneai","zdrângăni","zdrăngăneai","zdrăngăni"],"zdranganeam":["zdrângăneam","zdrângăni","zdrăngăneam","zdrăngăni"],"zdranganeati":["zdrângăneați","zdrângăni","zdrăngăneați","zdrăngăni"],"zdranganeau":["zdrângăneau","zdrângăni","zdrăngăneau","zdrăngăni"],"zdranganei":"zdrângănel","zdranganeii":"zdrângănel","zdranganeilor":"zdrângănel","zdranganele":"zdrăngăneală","zdranganelei":"zdrăngăneală","zdranganelele":"zdrăngăneală","zdranganelelor":"zdrăngăneală","zdranganeli":["zdrăngăneli","zdrăngăneală","zdrăngăneli","zdrăngănel"],"zdranganelii":"zdrăngănel","zdranganelilor":"zdrăngănel","zdranganelul":["zdrângănelul","zdrângănel","zdrăngănelul","zdrăngănel"],"zdranganelule":["zdrângănelule","zdrângănel","zdrăngănelule","zdrăngănel"],"zdranganelului":["zdrângănelului","zdrângănel","zdrăngănelului","zdrăngănel"],"zdranganesc":["zdrângănesc","zdrângăni","zdrăngănesc","zdrăngăni"],"zdranganeste":["zdrângănește","zdrângăni","zdrăngănește","zdrăngăni"],"zdranganesti":["zdrângănești","zdrângăni","zdrăngănești","zdrăngăni"],"zdranganii":["zdrângănii","zdrângăni","zdrăngănii","zdrăngăni"],"zdranganim":["zdrângănim","zdrângăni","zdrăngănim","zdrăngăni"],"zdranganind":["zdrângănind","zdrângăni","zdrăngănind","zdrăngăni"],"zdranganira":["zdrângăniră","zdrângăni","zdrăngăniră","zdrăngăni"],"zdranganiram":["zdrângănirăm","zdrângăni","zdrăngănirăm","zdrăngăni"],"zdranganirati":["zdrângănirăți","zdrângăni","zdrăngănirăți","zdrăngăni"],"zdranganirea":"zdrăngănire","zdranganiri":"zdrăngănire","zdranganirii":"zdrăngănire","zdranganirile":"zdrăngănire","zdranganirilor":"zdrăngănire","zdranganise":["zdrângănise","zdrângăni","zdrăngănise","zdrăngăni"],"zdranganisem":["zdrângănisem","zdrângăni","zdrăngănisem","zdrăngăni"],"zdranganisera":["zdrângăniseră","zdrângăni","zdrăngăniseră","zdrăngăni"],"zdranganiseram":["zdrângăniserăm","zdrângăni","zdrăngăniserăm","zdrăngăni"],"zdranganiserati":["zdrângăniserăți","zdrângăni","zdrăngăniserăți","zdrăngăni"],"zdranganisesi":["zdrângăniseși","zdrângăni","zdrăngăniseși","zdrăngăni"],"zdranganisi":["zdrângăniși","zdrângăni","zdrăngăniși","zdrăngăni"],"zdranganit":["zdrângănit","zdrângăni","zdrăngănit","zdrăngăni"],"zdranganiti":["zdrângăniți","zdrângăni","zdrăngăniți","zdrăngăni"],"zdranganitul":"zdrăngănit","zdranganitule":"zdrăngănit","zdranganitului":"zdrăngănit","zdranganituri":"zdrăngănitură","zdranganiturii":"zdrăngănitură","zdranganiturile":"zdrăngănitură","zdranganiturilor":"zdrăngănitură","zdrante":"zdranță","zdrantei":"zdranță","zdrantele":"zdranță","zdrantelor":"zdranță","zdravalauul":"zdrăvălău","zdravalauule":"zdrăvălău","zdravalauului":"zdrăvălău","zdravana":["zdravănă","zdravăn","zdravăna","zdravăn"],"zdravanul":"zdravăn","zdravene":"zdravăn","zdravenele":"zdravăn","zdraveni":"zdravăn","zdravenii":"zdravăn","zdrelea":"zdreli","zdreleai":"zdreli","zdreleam":"zdreli","zdreleati":"zdreli","zdreleau":"zdreli","zdrelesc":"zdreli","zdreleste":"zdreli","zdrelesti":"zdreli","zdrelii":"zdreli","zdrelim":"zdreli","zdrelind":"zdreli","zdrelira":"zdreli","zdreliram":"zdreli","zdrelirati":"zdreli","zdrelirea":"zdrelire","zdreliri":"zdrelire","zdrelirii":"zdrelire","zdrelirile":"zdrelire","zdrelirilor":"zdrelire","zdrelise":"zdreli","zdrelisem":"zdreli","zdrelisera":"zdreli","zdreliseram":"zdreli","zdreliserati":"zdreli","zdrelisesi":"zdreli","zdrelisi":"zdreli","zdrelit":"zdreli","zdrelita":["zdrelită","zdrelit","zdrelita","zdrelit"],"zdrelite":"zdrelit","zdrelitele":"zdrelit","zdreliti":["zdreliți","zdreli","zdreliți","zdrelit"],"zdrelitii":"zdrelit","zdrelitul":"zdrelit","zdrelituri":"zdrelitură","zdreliturii":"zdrelitură","zdreliturile":"zdrelitură","zdreliturilor":"zdrelitură","zdrentaroasa":["zdrențăroasă","zdrențăros","zdrențăroasa","zdrențăros"],"zdrentaroase":"zdrențăros","zdrentaroasele":"zdrențăros","zdrentarosi":"zdrențăros","zdrentarosii":"zdrențăros","zdrentarosul":"zdrențăros","zdrente":"zdreanță","zdrentei":"zdreanță","zdrentele":"zdreanță","zdrentelor":"zdreanță","zdrentoasa":["zdrențoasă","zdrențos","zdrențoasa","zdrențos"],"zdrentoase":"zdrențos","zdrentoasele":"zdrențos","zdrentosi":"zdrențos","zdrentosii":"zdrențos","zdrentosul":"zdrențos","zdrentuieste":"zdrențui","zdrentuirea":"zdrențuire","zdrentuiri":"zdrențuire","zdrentuirii":"zdrențuire","zdrentuirile":"zdrențuire","zdrentuirilor":"zdrențuire","zdrentuit":"zdrențui","zdrentuita":["zdrențuită","zdrențuit","zdrențuita","zdrențuit"],"zdrentuite":"zdrențuit","zdrentuitele":"zdrențuit","zdrentuiti":"zdrențuit","zdrentuitii":"zdrențuit","zdrentuitul":"zdrențuit","zdrenturoasa":["zdrențuroasă","zdrențuros","zdrențuroasa","zdrențuros"],"zdrenturoase":"zdrențuros","zdrenturoasele":"zdrențuros","zdrenturosi":"zdrențuros","zdrenturosii":"zdrențuros","zdrenturosul":"zdrențuros","zdroabe":"zdroabă","zdroabei":"zdroabă","zdroabele":"zdroabă","zdroabelor":"zdroabă","zdrobalauul":"zdrobalău","zdrobalauule":"zdrobalău","zdrobalauului":"zdrobalău","zdrobea":"zdrobi","zdrobeai":"zdrobi","zdrobeam":"zdrobi","zdrobeati":"zdrobi","zdrobeau":"zdrobi","zdrobesc":"zdrobi","zdrobeste":"zdrobi","zdrobesti":"zdrobi","zdrobiciunea":"zdrobiciune","zdrobiciuni":"zdrobiciune","zdrobiciunii":"zdrobiciune","zdrobiciunile":"zdrobiciune","zdrobiciunilor":"zdrobiciune","zdrobii":"zdrobi","zdrobim":"zdrobi","zdrobind":"zdrobi","zdrobira":"zdrobi","zdrobiram":"zdrobi","zdrobirati":"zdrobi","zdrobirea":"zdrobire","zdrobiri":"zdrobire","zdrobirii":"zdrobire","zdrobirile":"zdrobire","zdrobirilor":"zdrobire","zdrobise":"zdrobi","zdrobisem":"zdrobi","zdrobisera":"zdrobi","zdrobiseram":"zdrobi","zdrobiserati":"zdrobi","zdrobisesi":"zdrobi","zdrobisi":"zdrobi","zdrobit":"zdrobi","zdrobita":["zdrobită","zdrobit","zdrobita","zdrobit"],"zdrobite":"zdrobit","zdrobitele":"zdrobit","zdrobiti":["zdrobiți","zdrobi","zdrobiți","zdrobit"],"zdrobitii":"zdrobit","zdrobitoarea":"zdrobitoare","zdrobitoarei":"zdrobitoare","zdrobitoarele":"zdrobitoare","zdrobitoarelor":"zdrobitoare","zdrobitori":"zdrobitor","zdrobitorile":"zdrobitor","zdrobitorilor":"zdrobitor","zdrobitorul":"zdrobitor","zdrobitorule":"zdrobitor","zdrobitorului":"zdrobitor","zdrobitul":"zdrobit","zdrobiture":"zdrobitură","zdrobiturei":"zdrobitură","zdrobiturele":"zdrobitură","zdrobiturelor":"zdrobitură","zdrobituri":"zdrobitură","zdrobsere":"zdrobșer","zdrobserele":"zdrobșer","zdrobserelor":"zdrobșer","zdrobserul":"zdrobșer","zdrobserule":"zdrobșer","zdrobserului":"zdrobșer","zdroburi":"zdrobură","zdroburii":"zdrobură","zdroburile":"zdrobură","zdroburilor":"zdrobură","zdromsul":"zdromș","zdromsule":"zdromș","zdromsului":"zdromș","zdrucirea":"zdrucire","zdruciri":"zdrucire","zdrucirii":"zdrucire","zdrucirile":"zdrucire","zdrucirilor":"zdrucire","zdruhairea":"zdruhăire","zdruhairi":"zdruhăire","zdruhairii":"zdruhăire","zdruhairile":"zdruhăire","zdruhairilor":"zdruhăire","zdruhaituri":"zdruhăitură","zdruhaiturii":"zdruhăitură","zdruhaiturile":"zdruhăitură","zdruhaiturilor":"zdruhăitură","zdruholtul":"zdruholț","zdruholtule":"zdruholț","zdruholtului":"zdruholț","zdrumec":"zdrumeca","zdrumecai":"zdrumeca","zdrumecam":["zdrumecăm","zdrumeca","zdrumecam","zdrumeca"],"zdrumecand":"zdrumeca","zdrumecara":"zdrumeca","zdrumecaram":"zdrumeca","zdrumecarati":"zdrumeca","zdrumecase":"zdrumeca","zdrumecasem":"zdrumeca","zdrumecasera":"zdrumeca","zdrumecaseram":"zdrumeca","zdrumecaserati":"zdrumeca","zdrumecasesi":"zdrumeca","zdrumecasi":"zdrumeca","zdrumecat":"zdrumeca","zdrumecati":"zdrumeca","zdrumecau":"zdrumeca","zdrumeci":"zdrumeca","zdrumic":"zdrumica","zdrumicai":"zdrumica","zdrumicam":["zdrumicăm","zdrumica","zdrumicam","zdrumica"],"zdrumicand":"zdrumica","zdrumicara":"zdrumica","zdrumicaram":"zdrumica","zdrumicarati":"zdrumica","zdrumicarea":"zdrumicare","zdrumicari":"zdrumicare","zdrumicarii":"zdrumicare","zdrumicarile":"zdrumicare","zdrumicarilor":"zdrumicare","zdrumicase":"zdrumica","zdrumicasem":"zdrumica","zdrumicasera":"zdrumica","zdrumicaseram":"zdrumica","zdrumicaserati":"zdrumica","zdrumicasesi":"zdrumica","zdrumicasi":"zdrumica","zdrumicat":"zdrumica","zdrumicati":"zdrumica","zdrumicau":"zdrumica","zdrumici":"zdrumica","zdruncenul":"zdruncen","zdruncenule":"zdruncen","zdruncenului":"zdruncen","zdruncinai":"zdruncina","zdruncinam":["zdruncinăm","zdruncina","zdruncinam","zdruncina"],"zdruncinand":"zdruncina","zdruncinara":"zdruncina","zdruncinaram":"zdruncina","zdruncinarati":"zdruncina","zdruncinarea":"zdruncinare","zdruncinari":"zdruncinare","zdruncinarii":"zdruncinare","zdruncinarile":"zdruncinare","zdruncinarilor":"zdruncinare","zdruncinase":"zdruncina","zdruncinasem":"zdruncina","zdruncinasera":"zdruncina","zdruncinaseram":"zdruncina","zdruncinaserati":"zdruncina","zdruncinasesi":"zdruncina","zdruncinasi":"zdruncina","zdruncinat":"zdruncina","zdruncinata":["zdruncinată","zdruncinat","zdruncinata","zdruncinat"],"zdruncinate":"zdruncinat","zdruncinatele":"zdruncinat","zdruncinati":["zdruncinați","zdruncina","zdruncinați","zdruncinat"],"zdruncinatii":"zdruncinat","zdruncinatoare":"zdruncinător","zdruncinatoarea":"zdruncinător","zdruncinatoarele":"zdruncinător","zdruncinatori":"zdruncinător","zdruncinatorii":"zdruncinător","zdruncinatorul":"zdruncinător","zdruncinatul":"zdruncinat","zdruncinaturi":"zdruncinătură","zdruncinaturii":"zdruncinătură","zdruncinaturile":"zdruncinătură","zdruncinaturilor":"zdruncinătură","zdruncinau":"zdruncina","zdruncineaza":"zdruncina","zdruncinele":"zdruncineală","zdruncinelei":"zdruncineală","zdruncinelele":"zdruncineală","zdruncinelelor":"zdruncineală","zdruncineli":"zdruncineală","zdruncinez":"zdruncina","zdruncinezi":"zdruncina","zdruncinul":"zdruncin","zdruncinule":"zdruncin","zdruncinului":"zdruncin","zdrusea":"zdruși","zdruseai":"zdruși","zdruseam":"zdruși","zdruseati":"zdruși","zdruseau":"zdruși","zdrusesc":"zdruși","zdruseste":"zdruși","zdrusesti":"zdruși","zdrusii":"zdruși","zdrusim":"zdruși","zdrusind":"zdruși","zdrusira":"zdruși","zdrusiram":"zdruși","zdrusirati":"zdruși","zdrusise":"zdruși","zdrusisem":"zdruși","zdrusisera":"zdruși","zdrusiseram":"zdruși","zdrusiserati":"zdruși","zdrusisesi":"zdruși","zdrusisi":"zdruși","zdrusit":"zdruși","zdrusiti":"zdruși","zdupaia":"zdupăi","zdupaiai":"zdupăi","zdupaiam":"zdupăi","zdupaiati":"zdupăi","zdupaiau":"zdupăi","zdupaie":"zdupăi","zdupaiele":"zdupăială","zdupaielei":"zdupăială","zdupaielele":"zdupăială","zdupaielelor":"zdupăială","zdupaieli":"zdupăială","zdupaii":"zdupăi","zdupaim":"zdupăi","zdupaind":"zdupăi","zdupaira":"zdupăi","zdupairam":"zdupăi","zdupairati":"zdupăi","zdupaise":"zdupăi","zdupaisem":"zdupăi","zdupaisera":"zdupăi","zdupaiseram":"zdupăi","zdupaiserati":"zdupăi","zdupaisesi":"zdupăi","zdupaisi":"zdupăi","zdupait":"zdupăi","zdupaiti":"zdupăi","zdupul":"zdup","zdupule":"zdup","zdupului":"zdup","zeada":"zadă","zeberea":"zeberi","zebereai":"zeberi","zebeream":"zeberi","zebereati":"zeberi","zebereau":"zeberi","zeberele":"zebereală","zeberelei":"zebereală","zeberelele":"zebereală","zeberelelor":"zebereală","zebereli":"zebereală","zeberesc":"zeberi","zebereste":"zeberi","zeberesti":"zeberi","zeberii":"zeberi","zeberim":"zeberi","zeberind":"zeberi","zeberira":"zeberi","zeberiram":"zeberi","zeberirati":"zeberi","zeberise":"zeberi","zeberisem":"zeberi","zeberisera":"zeberi","zeberiseram":"zeberi","zeberiserati":"zeberi","zeberisesi":"zeberi","zeberisi":"zeberi","zeberit":"zeberi","zeberiti":"zeberi","zebrata":["zebrată","zebrat","zebrata","zebrat"],"zebrate":"zebrat","zebratele":"zebrat","zebrati":"zebrat","zebratii":"zebrat","zebratul":"zebrat","zebre":"zebră","zebreaua":"zebrea","zebrei":"zebră","zebrele":["zebrele","zebră","zebrele","zebrea"],"zebrelei":"zebrea","zebrelele":"zebrea","zebrelelor":"zebrea","zebrelor":"zebră","zebul":"zebu","zebule":"zebu","zebului":"zebu","zeceri":"zecer","zecerii":"zecer","zecerilor":"zecer","zecerul":"zecer","zecerule":"zecer","zecerului":"zecer","zeche":"zeghe","zechea":"zeche","zechi":"zeche","zechii":"zeche","zechile":"zeche","zechilor":"zeche","zeci":"zece","zecimala":["zecimală","zecimal","zecimala","zecimal"],"zecimale":["zecimale","zecimal","zecimale","zecimală"],"zecimalei":"zecimală","zecimalele":["zecimalele","zecimal","zecimalele","zecimală"],"zecimalelor":"zecimală","zecimali":"zecimal","zecimalii":"zecimal","zecimalul":"zecimal","zecimea":"zecime","zecimi":"zecime","zecimii":"zecime","zecimile":"zecime","zecimilor":"zecime","zeciuia":"zeciui","zeciuiai":"zeciui","zeciuiam":"zeciui","zeciuiati":"zeciui","zeciuiau":"zeciui","zeciuieli":"zeciuială","zeciuielii":"zeciuială","zeciuielile":"zeciuială","zeciuielilor":"zeciuială","zeciuiesc":"zeciui","zeciuieste":"zeciui","zeciuiesti":"zeciui","zeciuii":"zeciui","zeciuim":"zeciui","zeciuind":"zeciui","zeciuira":"zeciui","zeciuiram":"zeciui","zeciuirati":"zeciui","zeciuirea":"zeciuire","zeciuiri":"zeciuire","zeciuirii":"zeciuire","zeciuirile":"zeciuire","zeciuirilor":"zeciuire","zeciuise":"zeciui","zeciuisem":"zeciui","zeciuisera":"zeciui","zeciuiseram":"zeciui","zeciuiserati":"zeciui","zeciuisesi":"zeciui","zeciuisi":"zeciui","zeciuit":"zeciui","zeciuita":["zeciuită","zeciuit","zeciuita","zeciuit"],"zeciuite":"zeciuit","zeciuitele":"zeciuit","zeciuiti":["zeciuiți","zeciui","zeciuiți","zeciuit"],"zeciuitii":"zeciuit","zeciuitul":"zeciuit","zede":"zeadă","zedei":"zeadă","zedele":"zeadă","zedelor":"zeadă","zedice":"zedică","zedicei":"zedică","zeea":"zee","zeei":"zee","zeelandeza":["zeelandeză","zeelandez","zeelandeza","zeelandez"],"zeelandeze":"zeelandez","zeelandezele":"zeelandez","zeelandezi":"zeelandez","zeelandezii":"zeelandez","zeelandezilor":"zeelandez","zeelandezul":"zeelandez","zeelandezule":"zeelandez","zeelandezului":"zeelandez","zeele":"zee","zeelor":"zee","zefchiul":"zefchi","zefchiule":"zefchi","zefchiului":"zefchi","zefchiuri":"zefchi","zefchiurile":"zefchi","zefchiurilor":"zefchi","zefire":"zefir","zefirele":"zefir","zefirelor":"zefir","zefiri":"zefir","zefirii":"zefir","zefirilor":"zefir","zefirul":"zefir","zefirule":"zefir","zefirului":"zefir","zeflemeaua":"zeflemea","zeflemele":"zeflemea","zeflemelei":"zeflemea","zeflemelele":"zeflemea","zeflemelelor":"zeflemea","zeflemirea":"zeflemire","zeflemiri":"zeflemire","zeflemirii":"zeflemire","zeflemirile":"zeflemire","zeflemirilor":"zeflemire","zeflemisea":"zeflemisi","zeflemiseai":"zeflemisi","zeflemiseam":"zeflemisi","zeflemiseati":"zeflemisi","zeflemiseau":"zeflemisi","zeflemisesc":"zeflemisi","zeflemiseste":"zeflemisi","zeflemisesti":"zeflemisi","zeflemisii":"zeflemisi","zeflemisim":"zeflemisi","zeflemisind":"zeflemisi","zeflemisira":"zeflemisi","zeflemisiram":"zeflemisi","zeflemisirati":"zeflemisi","zeflemisirea":"zeflemisire","zeflemisiri":"zeflemisire","zeflemisirii":"zeflemisire","zeflemisirile":"zeflemisire","zeflemisirilor":"zeflemisire","zeflemisise":"zeflemisi","zeflemisisem":"zeflemisi","zeflemisisera":"zeflemisi","zeflemisiseram":"zeflemisi","zeflemisiserati":"zeflemisi","zeflemisisesi":"zeflemisi","zeflemisisi":"zeflemisi","zeflemisit":"zeflemisi","zeflemisiti":"zeflemisi","zeflemista":["zeflemistă","zeflemist","zeflemista","zeflemist"],"zeflemiste":"zeflemist","zeflemistele":"zeflemist","zeflemisti":"zeflemist","zeflemistii":"zeflemist","zeflemistul":"zeflemist","zeflemitoare":"zeflemitor","zeflemitoarea":"zeflemitor","zeflemitoarele":"zeflemitor","zeflemitori":"zeflemitor","zeflemitorii":"zeflemitor","zeflemitorul":"zeflemitor","zeflia":"zefliu","zeflie":"zefliu","zeflii":"zefliu","zefliii":"zefliu","zefliile":"zefliu","zefliul":"zefliu","zeghea":"zeghe","zeghi":"zeghe","zeghia":"zeghie","zeghiei":"zeghie","zeghii":["zeghii","zeghe","zeghii","zeghie"],"zeghiile":"zeghie","zeghiilor":"zeghie","zeghile":"zeghe","zeghilor":"zeghe","zeghioaie":"zeghioi","zeghioaiele":"zeghioi","zeghioaielor":"zeghioi","zeghioiul":"zeghioi","zeghioiule":"zeghioi","zeghioiului":"zeghioi","zeghiute":"zeghiuță","zeghiutei":"zeghiuță","zeghiutele":"zeghiuță","zeghiutelor":"zeghiuță","zegrasul":"zegras","zegrasule":"zegras","zegrasului":"zegras","zei":"zeu","zeiasca":["zeiască","zeiesc","zeiasca","zeiesc"],"zeiescul":"zeiesc","zeiesti":"zeiesc","zeiestii":"zeiesc","zeiestile":"zeiesc","zeifacerea":"zeifacere","zeifaceri":"zeifacere","zeifacerii":"zeifacere","zeific":"zeifica","zeificai":"zeifica","zeificam":["zeificăm","zeifica","zeificam","zeifica"],"zeificand":"zeifica","zeificara":"zeifica","zeificaram":"zeifica","zeificarati":"zeifica","zeificarea":"zeificare","zeificari":"zeificare","zeificarii":"zeificare","zeificarile":"zeificare","zeificarilor":"zeificare","zeificase":"zeifica","zeificasem":"zeifica","zeificasera":"zeifica","zeificaseram":"zeifica","zeificaserati":"zeifica","zeificasesi":"zeifica","zeificasi":"zeifica","zeificat":"zeifica","zeificata":["zeificată","zeificat","zeificata","zeificat"],"zeificate":"zeificat","zeificatele":"zeificat","zeificati":["zeificați","zeifica","zeificați","zeificat"],"zeificatia":"zeificație","zeificatiei":"zeificație","zeificatii":["zeificații","zeificat","zeificații","zeificație"],"zeificatiile":"zeificație","zeificatiilor":"zeificație","zeificatul":"zeificat","zeificau":"zeifica","zeifici":"zeifica","zeii":"zeu","zeilor":"zeu","zeimea":"zeime","zeimi":"zeime","zeimii":"zeime","zeimile":"zeime","zeimilor":"zeime","zeine":"zeină","zeinei":"zeină","zeinele":"zeină","zeinelor":"zeină","zeirea":"zeire","zeiri":"zeire","zeirii":"zeire","zeirile":"zeire","zeirilor":"zeire","zeismul":"zeism","zeismule":"zeism","zeismului":"zeism","zeisori":"zeișor","zeisorii":"zeișor","zeisorilor":"zeișor","zeisorul":"zeișor","zeisorule":"zeișor","zeisorului":"zeișor","zeitatea":"zeitate","zeitati":"zeitate","zeitatii":"zeitate","zeitatile":"zeitate","zeitatilor":"zeitate","zeite":"zeiță","zeitei":"zeiță","zeitele":"zeiță","zeitelor":"zeiță","zelare":"zelar","zelarele":"zelar","zelarelor":"zelar","zelarul":"zelar","zelarule":"zelar","zelarului":"zelar","zelatoarea":"zelatoare","zelatoarei":"zelatoare","zelatoarele":"zelatoare","zelatoarelor":"zelatoare","zelatori":"zelator","zelatorii":"zelator","zelatorilor":"zelator","zelatorul":"zelator","zelatorule":"zelator","zelatorului":"zelator","zele":"zea","zeloasa":["zeloasă","zelos","zeloasa","zelos"],"zeloase":"zelos","zeloasele":"zelos","zelosi":"zelos","zelosii":"zelos","zelosul":"zelos","zeloti":"zelot","zelotii":"zelot","zelotilor":"zelot","zelotismul":"zelotism","zelotismule":"zelotism","zelotismului":"zelotism","zelotul":"zelot","zelotule":"zelot","zelotului":"zelot","zelozitatea":"zelozitate","zelozitati":"zelozitate","zelozitatii":"zelozitate","zelul":"zel","zelule":"zel","zelului":"zel","zemfirei":"Zemfira","zemi":"zeamă","zemii":"zeamă","zemnice":"zemnic","zemnicele":"zemnic","zemnicelor":"zemnic","zemnicul":"zemnic","zemnicule":"zemnic","zemnicului":"zemnic","zemoasa":["zemoasă","zemos","zemoasa","zemos"],"zemoase":"zemos","zemoasele":"zemos","zemos":"zemoși","zemose":"zemoși","zemosea":"zemoși","zemoseai":"zemoși","zemoseam":"zemoși","zemoseati":"zemoși","zemoseau":"zemoși","zemosei":"zemoșel","zemoseii":"zemoșel","zemoseilor":"zemoșel","zemoselul":"zemoșel","zemoselule":"zemoșel","zemoselului":"zemoșel","zemosi":"zemos","zemosie":"zemoși","zemosii":["zemoșii","zemos","zemoșii","zemoși"],"zemosim":"zemoși","zemosind":"zemoși","zemosira":"zemoși","zemosiram":"zemoși","zemosirati":"zemoși","zemosirea":"zemoșire","zemosiri":"zemoșire","zemosirii":"zemoșire","zemosise":"zemoși","zemosisem":"zemoși","zemosisera":"zemoși","zemosiseram":"zemoși","zemosiserati":"zemoși","zemosisesi":"zemoși","zemosisi":"zemoși","zemosit":"zemoși","zemositi":"zemoși","zemosul":"zemos","zemuia":"zemui","zemuiai":"zemui","zemuiam":"zemui","zemuiati":"zemui","zemuiau":"zemui","zemuicaul":"zemuică","zemuicaule":"zemuică","zemuicaului":"zemuică","zemuie":"zemui","zemuii":"zemui","zemuim":"zemui","zemuind":"zemui","zemuira":"zemui","zemuiram":"zemui","zemuirati":"zemui","zemuise":"zemui","zemuisem":"zemui","zemuisera":"zemui","zemuiseram":"zemui","zemuiserati":"zemui","zemuisesi":"zemui","zemuisi":"zemui","zemuit":"zemui","zemuiti":"zemui","zemuri":"zeamă","zemurile":"zeamă","zemurilor":"zeamă","zemusoare":"zemușoară","zemusoarei":"zemușoară","zemusoarele":"zemușoară","zemusoarelor":"zemușoară","zemute":"zemuță","zemutei":"zemuță","zemutele":"zemuță","zemutelor":"zemuță","zenanale":"zenana","zenanalei":"zenana","zenanalele":"zenana","zenanalelor":"zenana","zenanaua":"zenana","zende":"zendă","zendei":"zendă","zenitala":["zenitală","zenital","zenitala","zenital"],"zenitale":"zenital","zenitalele":"zenital","zenitali":"zenital","zenitalii":"zenital","zenitalul":"zenital","zenitul":"zenit","zenitule":"zenit","zenitului":"zenit","zeoliti":"zeolit","zeolitii":"zeolit","zeolitilor":"zeolit","zeolitizarea":"zeolitizare","zeolitizari":"zeolitizare","zeolitizarii":"zeolitizare","zeolitizarile":"zeolitizare","zeolitizarilor":"zeolitizare","zeolitul":"zeolit","zeolitule":"zeolit","zeolitului":"zeolit","zepeline":"zepelin","zepelinele":"zepelin","zepelinelor":"zepelin","zepelinul":"zepelin","zepelinule":"zepelin","zepelinului":"zepelin","zerdiceaful":"zerdiceaf","zerdiceafule":"zerdiceaf","zerdiceafului":"zerdiceaf","zerna":"zârnă","zeroasa":["zeroasă","zeros","zeroasa","zeros"],"zeroase":"zeros","zeroasele":"zeros","zerosi":"zeros","zerosii":"zeros","zerosul":"zeros","zerovalenta":["zerovalentă","zerovalent","zerovalenta","zerovalent"],"zerovalente":"zerovalent","zerovalentele":"zerovalent","zerovalenti":"zerovalent","zerovalentii":"zerovalent","zerovalentul":"zerovalent","zerul":"zer","zerule":"zer","zerului":"zer","zeruri":"zer","zerurile":"zer","zerurilor":"zer","zestrasi":"zestraș","zestrasii":"zestraș","zestrasilor":"zestraș","zestrasul":"zestraș","zestrasule":"zestraș","zestrasului":"zestraș","zestrea":"zestre","zestrei":"zestre","zestriceaua":"zestricea","zestricele":["zestricele","zestricea","zestricele","zestricică"],"zestricelei":["zestricelei","zestricea","zestricelei","zestricică"],"zestricelele":["zestricelele","zestricea","zestricelele","zestricică"],"zestricelelor":["zestricelelor","zestricea","zestricelelor","zestricică"],"zestrisoare":"zestrișoară","zestrisoarei":"zestrișoară","zestrisoarele":"zestrișoară","zestrisoarelor":"zestrișoară","zestruci":"zestrucă","zestrucii":"zestrucă","zestrucile":"zestrucă","zestrucilor":"zestrucă","zetacismul":"zetacism","zetacismule":"zetacism","zetacismului":"zetacism","zetai":"zeta","zetalor":"zeta","zetari":"zețar","zetaria":"zețărie","zetariei":"zețărie","zetarii":["zețarii","zețar","zețării","zețărie"],"zetariile":"zețărie","zetariilor":"zețărie","zetarilor":"zețar","zetarite":"zețăriță","zetaritei":"zețăriță","zetaritele":"zețăriță","zetaritelor":"zețăriță","zetarul":"zețar","zetarule":"zețar","zetarului":"zețar","zetaul":"zeta","zetaule":"zeta","zetaului":"zeta","zetuia":"zețui","zetuiai":"zețui","zetuiam":"zețui","zetuiati":"zețui","zetuiau":"zețui","zetuiesc":"zețui","zetuieste":"zețui","zetuiesti":"zețui","zetuii":"zețui","zetuim":"zețui","zetuind":"zețui","zetuira":"zețui","zetuiram":"zețui","zetuirati":"zețui","zetuirea":"zețuire","zetuiri":"zețuire","zetuirii":"zețuire","zetuirile":"zețuire","zetuirilor":"zețuire","zetuise":"zețui","zetuisem":"zețui","zetuisera":"zețui","zetuiseram":"zețui","zetuiserati":"zețui","zetuisesi":"zețui","zetuisi":"zețui","zetuit":"zețui","zetuiti":"zețui","zetuitul":"zețuit","zetuitule":"zețuit","zetuitului":"zețuit","zetuituri":"zețuit","zetuiturile":"zețuit","zetuiturilor":"zețuit","zeugme":"zeugmă","zeugmei":"zeugmă","zeugmele":"zeugmă","zeugmelor":"zeugmă","zeul":"zeu","zeule":"zeu","zeului":"zeu","zeusori":"zeușor","zeusorii":"zeușor","zeusorilor":"zeușor","zeusorul":"zeușor","zeusorule":"zeușor","zeusorului":"zeușor","zevelci":"zevelcă","zevelcii":"zevelcă","zevelcile":"zevelcă","zevelcilor":"zevelcă","zevzeaca":["zevzeacă","zevzec","zevzeaca","zevzec"],"zevzece":"zevzec","zevzecele":"zevzec","zevzeci":"zevzec","zevzecia":"zevzecie","zevzeciei":"zevzecie","zevzecii":["zevzecii","zevzec","zevzecii","zevzecie"],"zevzeciile":"zevzecie","zevzeciilor":"zevzecie","zevzecilor":"zevzec","zevzeclacul":"zevzeclâc","zevzeclacule":"zevzeclâc","zevzeclacului":"zevzeclâc","zevzeclacuri":"zevzeclâc","zevzeclacurile":"zevzeclâc","zevzeclacurilor":"zevzeclâc","zevzecul":"zevzec","zevzecule":"zevzec","zevzecului":"zevzec","zgaia":"zgâi","zgaiai":"zgâi","zgaiam":"zgâi","zgaiati":"zgâi","zgaiau":"zgâi","zgaibata":["zgăibată","zgăibat","zgăibata","zgăibat"],"zgaibate":"zgăibat","zgaibatele":"zgăibat","zgaibati":"zgăibat","zgaibatii":"zgăibat","zgaibatul":"zgăibat","zgaibe":"zgaibă","zgaibei":"zgaibă","zgaibele":"zgaibă","zgaibelor":"zgaibă","zgaibulite":"zgăibuliță","zgaibulitei":"zgăibuliță","zgaibulitele":"zgăibuliță","zgaibulitelor":"zgăibuliță","zgaibute":"zgăibuță","zgaibutei":"zgăibuță","zgaibutele":"zgăibuță","zgaibutelor":"zgăibuță","zgaiesc":"zgâi","zgaieste":"zgâi","zgaiesti":"zgâi","zgaii":"zgâi","zgaim":"zgâi","zgaind":"zgâi","zgaira":"zgâi","zgairam":"zgâi","zgairati":"zgâi","zgaise":"zgâi","zgaisem":"zgâi","zgaisera":"zgâi","zgaiseram":"zgâi","zgaiserati":"zgâi","zgaisesi":"zgâi","zgaisi":"zgâi","zgait":"zgâi","zgaiti":"zgâi","zgaltaia":"zgâlțâi","zgaltaiai":"zgâlțâi","zgaltaiam":"zgâlțâi","zgaltaiati":"zgâlțâi","zgaltaiau":"zgâlțâi","zgaltaie":"zgâlțâi","zgaltaiele":"zgâlțâială","zgaltaielei":"zgâlțâială","zgaltaielele":"zgâlțâială","zgaltaielelor":"zgâlțâială","zgaltaieli":"zgâlțâială","zgaltaii":"zgâlțâi","zgaltaim":"zgâlțâi","zgaltaind":"zgâlțâi","zgaltaira":"zgâlțâi","zgaltairam":"zgâlțâi","zgaltairati":"zgâlțâi","zgaltairea":"zgâlțâire","zgaltairi":"zgâlțâire","zgaltairii":"zgâlțâire","zgaltairile":"zgâlțâire","zgaltairilor":"zgâlțâire","zgaltaise":"zgâlțâi","zgaltaisem":"zgâlțâi","zgaltaisera":"zgâlțâi","zgaltaiseram":"zgâlțâi","zgaltaiserati":"zgâlțâi","zgaltaisesi":"zgâlțâi","zgaltaisi":"zgâlțâi","zgaltait":"zgâlțâi","zgaltaiti":"zgâlțâi","zgaltaitul":"zgâlțâit","zgaltaitule":"zgâlțâit","zgaltaitului":"zgâlțâit","zgaltaiture":"zgâlțâitură","zgaltaiturei":"zgâlțâitură","zgaltaiturele":"zgâlțâitură","zgaltaiturelor":"zgâlțâitură","zgaltaituri":["zgâlțăituri","zgâlțâit","zgâlțâituri","zgâlțâitură"],"zgaltaiturile":"zgâlțâit","zgaltaiturilor":"zgâlțâit","zgamboii":"zgâmboi","zgamboilor":"zgâmboi","zgamboita":["zgâmboită","zgâmboit","zgâmboita","zgâmboit"],"zgamboite":"zgâmboit","zgamboitele":"zgâmboit","zgamboiti":"zgâmboit","zgamboitii":"zgâmboit","zgamboitul":"zgâmboit","zgamboiul":"zgâmboi","zgamboiule":"zgâmboi","zgamboiului":"zgâmboi","zganci":"zgancă","zgancii":"zgancă","zgancile":"zgancă","zgancilea":"zgâncili","zgancileai":"zgâncili","zgancileam":"zgâncili","zgancileati":"zgâncili","zgancileau":"zgâncili","zgancilesc":"zgâncili","zgancileste":"zgâncili","zgancilesti":"zgâncili","zgancilii":"zgâncili","zgancilim":"zgâncili","zgancilind":"zgâncili","zgancilira":"zgâncili","zganciliram":"zgâncili","zgancilirati":"zgâncili","zgancilise":"zgâncili","zgancilisem":"zgâncili","zgancilisera":"zgâncili","zganciliseram":"zgâncili","zganciliserati":"zgâncili","zgancilisesi":"zgâncili","zgancilisi":"zgâncili","zgancilit":"zgâncili","zganciliti":"zgâncili","zgancilor":"zgancă","zgancusoare":"zgăncușoară","zgancusoarei":"zgăncușoară","zgancusoarele":"zgăncușoară","zgancusoarelor":"zgăncușoară","zgandarea":"zgândări","zgandareai":"zgândări","zgandaream":"zgândări","zgandareati":"zgândări","zgandareau":"zgândări","zgandaresc":"zgândări","zgandareste":"zgândări","zgandaresti":"zgândări","zgandarii":"zgândări","zgandarim":"zgândări","zgandarind":"zgândări","zgandarira":"zgândări","zgandariram":"zgândări","zgandarirati":"zgândări","zgandarirea":"zgândărire","zgandariri":"zgândărire","zgandaririi":"zgândărire","zgandaririle":"zgândărire","zgandaririlor":"zgândărire","zgandarise":"zgândări","zgandarisem":"zgândări","zgandarisera":"zgândări","zgandariseram":"zgândări","zgandariserati":"zgândări","zgandarisesi":"zgândări","zgandarisi":"zgândări","zgandarit":"zgândări","zgandariti":"zgândări","zgarbacele":"zgârbăcel","zgarbacelele":"zgârbăcel","zgarbacelelor":"zgârbăcel","zgarbacelul":"zgârbăcel","zgarbacelule":"zgârbăcel","zgarbacelului":"zgârbăcel","zgarburi":"zgarbură","zgarburii":"zgarbură","zgarburile":"zgarbură","zgarburilor":"zgarbură","zgarcea":"zgârci","zgarceai":"zgârci","zgarceam":"zgârci","zgarceati":"zgârci","zgarceau":"zgârci","zgarcenia":"zgârcenie","zgarceniei":"zgârcenie","zgarcenii":"zgârcenie","zgarceniile":"zgârcenie","zgarceniilor":"zgârcenie","zgarcesc":"zgârci","zgarceste":"zgârci","zgarcesti":"zgârci","zgarcii":"zgârci","zgarcim":"zgârci","zgarcind":"zgârci","zgarcioabe":"zgârcioabă","zgarcioabei":"zgârcioabă","zgarcioabele":"zgârcioabă","zgarcioabelor":"zgârcioabă","zgarciobi":"zgârciob","zgarciobii":"zgârciob","zgarciobilor":"zgârciob","zgarciobul":"zgârciob","zgarciobule":"zgârciob","zgarciobului":"zgârciob","zgarcira":"zgârci","zgarciram":"zgârci","zgarcirati":"zgârci","zgarcirea":"zgârcire","zgarciri":"zgârcire","zgarcirii":"zgârcire","zgarcirile":"zgârcire","zgarcirilor":"zgârcire","zgarcise":"zgârci","zgarcisem":"zgârci","zgarcisera":"zgârci","zgarciseram":"zgârci","zgarciserati":"zgârci","zgarcisesi":"zgârci","zgarcisi":"zgârci","zgarcit":"zgârci","zgarcita":["zgârcită","zgârcit","zgârcita","zgârcit"],"zgarcite":"zgârcit","zgarcitele":"zgârcit","zgarciti":["zgârciți","zgârci","zgârciți","zgârcit"],"zgarcitii":"zgârcit","zgarcitul":"zgârcit","zgarciture":"zgârcitură","zgarciturei":"zgârcitură","zgarciturele":"zgârcitură","zgarciturelor":"zgârcitură","zgarcituri":"zgârcitură","zgarciulete":"zgârciuleț","zgarciuletele":"zgârciuleț","zgarciuletelor":"zgârciuleț","zgarciuletul":"zgârciuleț","zgarciuletule":"zgârciuleț","zgarciuletului":"zgârciuleț","zgarciuri":"zgârci","zgardite":"zgărdiță","zgarditei":"zgărdiță","zgarditele":"zgărdiță","zgarditelor":"zgărdiță","zgariai":"zgâria","zgariam":"zgâria","zgariara":"zgâria","zgariaram":"zgâria","zgariarati":"zgâria","zgariase":"zgâria","zgariasem":"zgâria","zgariasera":"zgâria","zgariaseram":"zgâria","zgariaserati":"zgâria","zgariasesi":"zgâria","zgariasi":"zgâria","zgariat":"zgâria","zgariata":["zgâriată","zgâriat","zgâriata","zgâriat"],"zgariate":"zgâriat","zgariatele":"zgâriat","zgariati":["zgâriați","zgâria","zgâriați","zgâriat"],"zgariatii":"zgâriat","zgariatul":"zgâriat","zgariau":"zgâria","zgarie":"zgâria","zgarie-norii":"zgârie-nori","zgarie-norilor":"zgârie-nori","zgarie-noriul":"zgârie-nori","zgarie-noriule":"zgârie-nori","zgarie-noriului":"zgârie-nori","zgariem":"zgâria","zgarierea":"zgâriere","zgarieri":"zgâriere","zgarierii":"zgâriere","zgarierile":"zgâriere","zgarierilor":"zgâriere","zgarietoare":"zgârietor","zgarietoarea":"zgârietor","zgarietoarele":"zgârietor","zgarietori":"zgârietor","zgarietorii":"zgârietor","zgarietorul":"zgârietor","zgarieturi":"zgârietură","zgarieturii":"zgârietură","zgarieturile":"zgârietură","zgarieturilor":"zgârietură","zgarii":"zgâria","zgariind":"zgâria","zgarnaiele":"zgârnăială","zgarnaielei":"zgârnăială","zgarnaielele":"zgârnăială","zgarnaielelor":"zgârnăială","zgarnaieli":"zgârnăială","zgarzi":"zgardă","zgarzii":"zgardă","zgarzile":"zgardă","zgarzilor":"zgardă","zgatiea":"zgâtie","zgatii":"zgâtie","zgatiii":"zgâtie","zgatiile":"zgâtie","zgatiilor":"zgâtie","zgaul":"zgău","zgaule":"zgău","zgaului":"zgău","zgaur":"zgăura","zgaurai":"zgăura","zgauram":["zgăurăm","zgăura","zgăuram","zgăura"],"zgaurand":"zgăura","zgaurara":"zgăura","zgauraram":"zgăura","zgaurarati":"zgăura","zgaurase":"zgăura","zgaurasem":"zgăura","zgaurasera":"zgăura","zgauraseram":"zgăura","zgauraserati":"zgăura","zgaurasesi":"zgăura","zgaurasi":"zgăura","zgaurat":"zgăura","zgaurati":"zgăura","zgaurau":"zgăura","zgauri":["zgăuri","zgău","zgăuri","zgăura"],"zgaurile":"zgău","zgaurilor":"zgău","zgavasul":"zgăvaș","zgavasule":"zgăvaș","zgavasului":"zgăvaș","zgheab":"jgheab","zglavo":"zglăvoc","zglavoci":"zglăvoc","zglavocii":"zglăvoc","zglavocile":"zglăvoc","zglavocilor":"zglăvoc","zglobenia":"zglobenie","zglobeniei":"zglobenie","zglobenii":"zglobenie","zglobeniile":"zglobenie","zglobeniilor":"zglobenie","zglobia":["zglobia","zglobie","zglobia","zglobiu"],"zglobiciunea":"zglobiciune","zglobiciuni":"zglobiciune","zglobiciunii":"zglobiciune","zglobiciunile":"zglobiciune","zglobiciunilor":"zglobiciune","zglobie":"zglobiu","zglobiei":"zglobie","zglobietatea":"zglobietate","zglobietati":"zglobietate","zglobietatii":"zglobietate","zglobii":["zglobii","zglobie","zglobii","zglobiu"],"zglobiii":"zglobiu","zglobiile":["zglobiile","zglobie","zglobiile","zglobiu"],"zglobiilor":"zglobie","zglobioara":["zglobioară","zglobior","zglobioara","zglobior"],"zglobioare":"zglobior","zglobioarele":"zglobior","zglobiori":"zglobior","zglobiorii":"zglobior","zglobiorul":"zglobior","zglobirea":"zglobire","zglobiri":"zglobire","zglobirii":"zglobire","zglobiul":"zglobiu","zgomote":"zgomot","zgomotele":"zgomot","zgomotelor":"zgomot","zgomotoasa":["zgomotoasă","zgomotos","zgomotoasa","zgomotos"],"zgomotoase":"zgomotos","zgomotoasele":"zgomotos","zgomotosi":"zgomotos","zgomotosii":"zgomotos","zgomotosul":"zgomotos","zgomotul":"zgomot","zgomotule":"zgomot","zgomotului":"zgomot","zgornea":"zgorni","zgorneai":"zgorni","zgorneam":"zgorni","zgorneati":"zgorni","zgorneau":"zgorni","zgornesc":"zgorni","zgorneste":"zgorni","zgornesti":"zgorni","zgornii":"zgorni","zgornim":"zgorni","zgornind":"zgorni","zgornira":"zgorni","zgorniram":"zgorni","zgornirati":"zgorni","zgornirea":"zgornire","zgorniri":"zgornire","zgornirii":"zgornire","zgornirile":"zgornire","zgornirilor":"zgornire","zgornise":"zgorni","zgornisem":"zgorni","zgornisera":"zgorni","zgorniseram":"zgorni","zgorniserati":"zgorni","zgornisesi":"zgorni","zgornisi":"zgorni","zgornit":"zgorni","zgorniti":"zgorni","zgrabuntaul":"zgrăbunță","zgrabuntaule":"zgrăbunță","zgrabuntaului":"zgrăbunță","zgrabunte":"zgrăbunță","zgrabuntei":"zgrăbunță","zgrabuntele":"zgrăbunțică","zgrabuntelei":"zgrăbunțică","zgrabuntelele":"zgrăbunțică","zgrabuntelelor":"zgrăbunțică","zgrabuntelor":"zgrăbunță","zgreaptan":"zgrepțăna","zgreaptana":"zgrepțăna","zgreaptani":"zgrepțăna","zgrebanoseturi":"zgrebănoșetură","zgrebanoseturii":"zgrebănoșetură","zgrebanoseturile":"zgrebănoșetură","zgrebanoseturilor":"zgrebănoșetură","zgrebenisul":"zgrebeniș","zgrebenisule":"zgrebeniș","zgrebenisului":"zgrebeniș","zgrebenisuri":"zgrebeniș","zgrebenisurile":"zgrebeniș","zgrebenisurilor":"zgrebeniș","zgreblaturi":"zgreblătură","zgreblaturii":"zgreblătură","zgreblaturile":"zgreblătură","zgreblaturilor":"zgreblătură","zgrebulea":"zgrebuli","zgrebuleai":"zgrebuli","zgrebuleam":"zgrebuli","zgrebuleati":"zgrebuli","zgrebuleau":"zgrebuli","zgrebulesc":"zgrebuli","zgrebuleste":"zgrebuli","zgrebulesti":"zgrebuli","zgrebulii":"zgrebuli","zgrebulim":"zgrebuli","zgrebulind":"zgrebuli","zgrebulira":"zgrebuli","zgrebuliram":"zgrebuli","zgrebulirati":"zgrebuli","zgrebulise":"zgrebuli","zgrebulisem":"zgrebuli","zgrebulisera":"zgrebuli","zgrebuliseram":"zgrebuli","zgrebuliserati":"zgrebuli","zgrebulisesi":"zgrebuli","zgrebulisi":"zgrebuli","zgrebulit":"zgrebuli","zgrebuliti":"zgrebuli","zgreptanai":"zgrepțăna","zgreptanam":["zgrepțănăm","zgrepțăna","zgrepțănam","zgrepțăna"],"zgreptanand":"zgrepțăna","zgreptanara":"zgrepțăna","zgreptanaram":"zgrepțăna","zgreptanarati":"zgrepțăna","zgreptanarea":"zgrepțănare","zgreptanari":"zgrepțănare","zgreptanarii":"zgrepțănare","zgreptanarile":"zgrepțănare","zgreptanarilor":"zgrepțănare","zgreptanase":"zgrepțăna","zgreptanasem":"zgrepțăna","zgreptanasera":"zgrepțăna","zgreptanaseram":"zgrepțăna","zgreptanaserati":"zgrepțăna","zgreptanasesi":"zgrepțăna","zgreptanasi":"zgrepțăna","zgreptanat":"zgrepțăna","zgreptanati":"zgrepțăna","zgreptanau":"zgrepțăna","zgribulea":"zgribuli","zgribuleai":"zgribuli","zgribuleam":"zgribuli","zgribuleati":"zgribuli","zgribuleau":"zgribuli","zgribulesc":"zgribuli","zgribuleste":"zgribuli","zgribulesti":"zgribuli","zgribulii":"zgribuli","zgribulim":"zgribuli","zgribulind":"zgribuli","zgribulira":"zgribuli","zgribuliram":"zgribuli","zgribulirati":"zgribuli","zgribulise":"zgribuli","zgribulisem":"zgribuli","zgribulisera":"zgribuli","zgribuliseram":"zgribuli","zgribuliserati":"zgribuli","zgribulisesi":"zgribuli","zgribulisi":"zgribuli","zgribulit":"zgribuli","zgribulita":["zgribulită","zgribulit","zgribulita","zgribulit"],"zgribulite":"zgribulit","zgribulitele":"zgribulit","zgribuliti":["zgribuliți","zgribuli","zgribuliți","zgribulit"],"zgribulitii":"zgribulit","zgribulitul":"zgribulit","zgriburai":"zgribura","zgriburam":["zgriburăm","zgribura","zgriburam","zgribura"],"zgriburand":"zgribura","zgriburara":"zgribura","zgriburaram":"zgribura","zgriburarati":"zgribura","zgriburase":"zgribura","zgriburasem":"zgribura","zgriburasera":"zgribura","zgriburaseram":"zgribura","zgriburaserati":"zgribura","zgriburasesi":"zgribura","zgriburasi":"zgribura","zgriburat":"zgribura","zgriburati":"zgribura","zgriburau":"zgribura","zgriburea":"zgriburi","zgribureai":"zgriburi","zgribuream":"zgriburi","zgribureati":"zgriburi","zgribureau":"zgriburi","zgribureaza":"zgribura","zgriburesc":"zgriburi","zgribureste":"zgriburi","zgriburesti":"zgriburi","zgriburez":"zgribura","zgriburezi":"zgribura","zgriburii":"zgriburi","zgriburim":"zgriburi","zgriburind":"zgriburi","zgriburira":"zgriburi","zgriburiram":"zgriburi","zgriburirati":"zgriburi","zgriburise":"zgriburi","zgriburisem":"zgriburi","zgriburisera":"zgriburi","zgriburiseram":"zgriburi","zgriburiserati":"zgriburi","zgriburisesi":"zgriburi","zgriburisi":"zgriburi","zgriburit":"zgriburi","zgriburiti":"zgriburi","zgripsor":"zgripțor","zgripsorasi":"zgripsoraș","zgripsorasii":"zgripsoraș","zgripsorasilor":"zgripsoraș","zgripsorasul":"zgripsoraș","zgripsorasule":"zgripsoraș","zgripsorasului":"zgripsoraș","zgripsori":"zgripsor","zgripsorii":"zgripsor","zgripsorilor":"zgripsor","zgripsoroaice":"zgripsoroaică","zgripsoroaicei":"zgripsoroaică","zgripsoroaicele":"zgripsoroaică","zgripsoroaicelor":"zgripsoroaică","zgripsorul":"zgripsor","zgripsorule":"zgripsor","zgripsorului":"zgripsor","zgriptorasi":"zgripțoraș","zgriptorasii":"zgripțoraș","zgriptorasilor":"zgripțoraș","zgriptorasul":"zgripțoraș","zgriptorasule":"zgripțoraș","zgriptorasului":"zgripțoraș","zgriptori":"zgripțor","zgriptorii":"zgripțor","zgriptorilor":"zgripțor","zgriptoroaice":"zgripțoroaică","zgriptoroaicei":"zgripțoroaică","zgriptoroaicele":"zgripțoroaică","zgriptoroaicelor":"zgripțoroaică","zgriptoroii":"zgripțoroi","zgriptoroilor":"zgripțoroi","zgriptoroiul":"zgripțoroi","zgriptoroiule":"zgripțoroi","zgriptoroiului":"zgripțoroi","zgriptorul":"zgripțor","zgriptorule":"zgripțor","zgriptorului":"zgripțor","zgripturoaice":"zgripțuroaică","zgripturoaicei":"zgripțuroaică","zgripturoaicele":"zgripțuroaică","zgripturoaicelor":"zgripțuroaică","zgripturoii":"zgripțuroi","zgripturoilor":"zgripțuroi","zgripturoiul":"zgripțuroi","zgripturoiule":"zgripțuroi","zgripturoiului":"zgripțuroi","zgruntisoare":"zgrunțișor","zgruntisoarele":"zgrunțișor","zgruntisoarelor":"zgrunțișor","zgruntisorul":"zgrunțișor","zgruntisorule":"zgrunțișor","zgruntisorului":"zgrunțișor","zgruntul":"zgrunț","zgruntule":"zgrunț","zgruntului":"zgrunț","zgrunturi":"zgrunț","zgrunturile":"zgrunț","zgrunturilor":"zgrunț","zgrunturoasa":["zgrunțuroasă","zgrunțuros","zgrunțuroasa","zgrunțuros"],"zgrunturoase":"zgrunțuros","zgrunturoasele":"zgrunțuros","zgrunturosi":"zgrunțuros","zgrunturosii":"zgrunțuros","zgrunturosul":"zgrunțuros","zgrunturozitatea":"zgrunțurozitate","zgrunturozitati":"zgrunțurozitate","zgrunturozitatii":"zgrunțurozitate","zguduia":"zgudui","zguduiai":"zgudui","zguduiam":"zgudui","zguduiati":"zgudui","zguduiau":"zgudui","zguduie":"zgudui","zguduiele":"zguduială","zguduielei":"zguduială","zguduielele":"zguduială","zguduielelor":"zguduială","zguduieli":"zguduială","zguduii":"zgudui","zguduim":"zgudui","zguduind":"zgudui","zguduira":"zgudui","zguduiram":"zgudui","zguduirati":"zgudui","zguduirea":"zguduire","zguduiri":"zguduire","zguduirii":"zguduire","zguduirile":"zguduire","zguduirilor":"zguduire","zguduise":"zgudui","zguduisem":"zgudui","zguduisera":"zgudui","zguduiseram":"zgudui","zguduiserati":"zgudui","zguduisesi":"zgudui","zguduisi":"zgudui","zguduit":"zgudui","zguduita":["zguduită","zguduit","zguduita","zguduit"],"zguduite":"zguduit","zguduitele":"zguduit","zguduiti":["zguduiți","zgudui","zguduiți","zguduit"],"zguduitii":"zguduit","zguduitoare":"zguduitor","zguduitoarea":"zguduitor","zguduitoarele":"zguduitor","zguduitori":"zguduitor","zguduitorii":"zguduitor","zguduitorul":"zguduitor","zguduitul":"zguduit","zguduiture":"zguduitură","zguduiturei":"zguduitură","zguduiturele":"zguduitură","zguduiturelor":"zguduitură","zguduituri":"zguduitură","zguri":"zgură","zgurific":"zgurifica","zgurificai":"zgurifica","zgurificam":["zgurificăm","zgurifica","zgurificam","zgurifica"],"zgurificand":"zgurifica","zgurificara":"zgurifica","zgurificaram":"zgurifica","zgurificarati":"zgurifica","zgurificase":"zgurifica","zgurificasem":"zgurifica","zgurificasera":"zgurifica","zgurificaseram":"zgurifica","zgurificaserati":"zgurifica","zgurificasesi":"zgurifica","zgurificasi":"zgurifica","zgurificat":"zgurifica","zgurificati":"zgurifica","zgurificau":"zgurifica","zgurifici":"zgurifica","zgurii":"zgură","zgurile":"zgură","zgurilor":"zgură","zguroasa":["zguroasă","zguros","zguroasa","zguros"],"zguroase":"zguros","zguroasele":"zguros","zgurosi":"zguros","zgurosii":"zguros","zgurosul":"zguros","zi":"zice","ziafetul":"ziafet","ziafetule":"ziafet","ziafetului":"ziafet","ziafeturi":"ziafet","ziafeturile":"ziafet","ziafeturilor":"ziafet","zianul":"zian","zianule":"zian","zianului":"zian","zianuri":"zian","zianurile":"zian","zianurilor":"zian","ziare":"ziar","ziarele":"ziar","ziarelor":"ziar","ziarismul":"ziarism","ziarismule":"ziarism","ziarismului":"ziarism","ziariste":"ziaristă","ziaristei":"ziaristă","ziaristele":"ziaristă","ziaristelor":"ziaristă","ziaristi":"ziarist","ziaristica":["ziaristică","ziaristic","ziaristica","ziaristic"],"ziaristice":["ziaristice","ziaristic","ziaristice","ziaristică"],"ziaristicei":"ziaristică","ziaristicele":["ziaristicele","ziaristic","ziaristicele","ziaristică"],"ziaristicelor":"ziaristică","ziaristici":"ziaristic","ziaristicii":"ziaristic","ziaristicul":"ziaristic","ziaristii":"ziarist","ziaristilor":"ziarist","ziaristul":"ziarist","ziaristule":"ziarist","ziaristului":"ziarist","ziarul":"ziar","ziarule":"ziar","ziarului":"ziar","zibeline":"zibelină","zibelinei":"zibelină","zibelinele":"zibelină","zibelinelor":"zibelină","zibete":"zibetă","zibetei":"zibetă","zibetele":"zibetă","zibetelor":"zibetă","zic":"zice","zica":"zice","zicalasi":"zicălaș","zicalasii":"zicălaș","zicalasilor":"zicălaș","zicalasul":"zicălaș","zicalasule":"zicălaș","zicalasului":"zicălaș","zicale":"zicală","zicalei":"zicală","zicalele":"zicală","zicalelor":"zicală","zicamantul":"zicământ","zicamantule":"zicământ","zicamantului":"zicământ","zicamanturi":"zicământ","zicamanturile":"zicământ","zicamanturilor":"zicământ","zicand":"zice","zicasi":"zicaș","zicasii":"zicaș","zicasilor":"zicaș","zicasul":"zicaș","zicasule":"zicaș","zicasului":"zicaș","zicatoare":"zicător","zicatoarea":"zicător","zicatoarele":"zicător","zicatori":["zicători","zicătoare","zicători","zicător"],"zicatorii":"zicător","zicatorilor":"zicător","zicatorul":"zicător","zicatorule":"zicător","zicatorului":"zicător","zicaturi":"zicătură","zicaturii":"zicătură","zicaturile":"zicătură","zicaturilor":"zicătură","zicea":"zice","ziceai":"zice","ziceam":"zice","ziceati":"zice","ziceau":"zice","zicem":"zice","zicerea":"zicere","ziceri":"zicere","zicerii":"zicere","zicerile":"zicere","zicerilor":"zicere","ziceti":"zice","zici":"zice","zidarasi":"zidăraș","zidarasii":"zidăraș","zidarasilor":"zidăraș","zidarasul":"zidăraș","zidarasule":"zidăraș","zidarasului":"zidăraș","zidarese":"zidăreasă","zidaresei":"zidăreasă","zidaresele":"zidăreasă","zidareselor":"zidăreasă","zidari":"zidar","zidaria":"zidărie","zidariei":"zidărie","zidarii":["zidarii","zidar","zidării","zidărie"],"zidariile":"zidărie","zidariilor":"zidărie","zidarilor":"zidar","zidarirea":"zidărire","zidariri":"zidărire","zidaririi":"zidărire","zidaririle":"zidărire","zidaririlor":"zidărire","zidarite":"zidăriță","zidaritei":"zidăriță","zidaritele":"zidăriță","zidaritelor":"zidăriță","zidaritul":"zidărit","zidaritule":"zidărit","zidaritului":"zidărit","zidarul":"zidar","zidarule":"zidar","zidarului":"zidar","zidea":"zidi","zideacul":"zideac","zideacule":"zideac","zideacului":"zideac","zideacuri":"zideac","zideacurile":"zideac","zideacurilor":"zideac","zideai":"zidi","zideam":"zidi","zideati":"zidi","zideau":"zidi","zidesc":"zidi","zideste":"zidi","zidesti":"zidi","zidii":"zidi","zidim":"zidi","zidind":"zidi","zidira":"zidi","zidiram":"zidi","zidirati":"zidi","zidirea":"zidire","zidiri":"zidire","zidirii":"zidire","zidirile":"zidire","zidirilor":"zidire","zidise":"zidi","zidisem":"zidi","zidisera":"zidi","zidiseram":"zidi","zidiserati":"zidi","zidisesi":"zidi","zidisi":"zidi","zidisoare":"zidișor","zidisoarele":"zidișor","zidisoarelor":"zidișor","zidisorul":"zidișor","zidisorule":"zidișor","zidisorului":"zidișor","zidit":"zidi","zidita":["zidită","zidit","zidita","zidit"],"zidite":"zidit","ziditele":"zidit","ziditi":["zidiți","zidi","zidiți","zidit"],"ziditii":"zidit","ziditori":"ziditor","ziditorii":"ziditor","ziditorilor":"ziditor","ziditorul":"ziditor","ziditorule":"ziditor","ziditorului":"ziditor","ziditul":"zidit","zidituri":"ziditură","ziditurii":"ziditură","ziditurile":"ziditură","ziditurilor":"ziditură","ziduia":"zidui","ziduiai":"zidui","ziduiam":"zidui","ziduiati":"zidui","ziduiau":"zidui","ziduiesc":"zidui","ziduieste":"zidui","ziduiesti":"zidui","ziduii":"zidui","ziduim":"zidui","ziduind":"zidui","ziduira":"zidui","ziduiram":"zidui","ziduirati":"zidui","ziduise":"zidui","ziduisem":"zidui","ziduisera":"zidui","ziduiseram":"zidui","ziduiserati":"zidui","ziduisesi":"zidui","ziduisi":"zidui","ziduit":"zidui","ziduiti":"zidui","zidul":"zid","zidule":"zid","zidului":"zid","zidurele":"zidurel","zidurelele":"zidurel","zidurelelor":"zidurel","zidurelul":"zidurel","zidurelule":"zidurel","zidurelului":"zidurel","ziduri":"zid","ziduri de caramida":"zid de cărămidă","zidurile":"zid","zidurilor":"zid","zigomatica":["zigomatică","zigomatic","zigomatica","zigomatic"],"zigomatice":"zigomatic","zigomaticele":"zigomatic","zigomatici":"zigomatic","zigomaticii":"zigomatic","zigomaticul":"zigomatic","zigome":"zigomă","zigomei":"zigomă","zigomele":"zigomă","zigomelor":"zigomă","zigomorfa":["zigomorfă","zigomorf","zigomorfa","zigomorf"],"zigomorfe":"zigomorf","zigomorfele":"zigomorf","zigomorfi":"zigomorf","zigomorfia":"zigomorfie","zigomorfiei":"zigomorfie","zigomorfii":["zigomorfii","zigomorf","zigomorfii","zigomorfie"],"zigomorful":"zigomorf","zigospori":"zigospor","zigosporii":"zigospor","zigosporilor":"zigospor","zigosporul":"zigospor","zigosporule":"zigospor","zigosporului":"zigospor","zigoti":"zigot","zigotii":"zigot","zigotilor":"zigot","zigotul":"zigot","zigotule":"zigot","zigotului":"zigot","zigurate":"zigurat","ziguratele":"zigurat","ziguratelor":"zigurat","ziguratul":"zigurat","ziguratule":"zigurat","ziguratului":"zigurat","zigzacul":"zigzac","zigzacule":"zigzac","zigzacului":"zigzac","zigzacuri":"zigzac","zigzacurile":"zigzac","zigzacurilor":"zigzac","zigzagai":"zigzaga","zigzagam":["zigzagăm","zigzaga","zigzagam","zigzaga"],"zigzagand":"zigzaga","zigzagara":"zigzaga","zigzagaram":"zigzaga","zigzagarati":"zigzaga","zigzagase":"zigzaga","zigzagasem":"zigzaga","zigzagasera":"zigzaga","zigzagaseram":"zigzaga","zigzagaserati":"zigzaga","zigzagasesi":"zigzaga","zigzagasi":"zigzaga","zigzagat":"zigzaga","zigzagata":["zigzagată","zigzagat","zigzagata","zigzagat"],"zigzagate":"zigzagat","zigzagatele":"zigzagat","zigzagati":["zigzagați","zigzaga","zigzagați","zigzagat"],"zigzagatii":"zigzagat","zigzagatul":"zigzagat","zigzagau":"zigzaga","zigzagheaza":"zigzaga","zigzaghez":"zigzaga","zigzaghezi":"zigzaga","zigzagul":"zigzag","zigzagule":"zigzag","zigzagului":"zigzag","zigzaguri":"zigzag","zigzagurile":"zigzag","zigzagurilor":"zigzag","zilasi":"zilaș","zilasii":"zilaș","zilasilor":"zilaș","zilasul":"zilaș","zilasule":"zilaș","zilasului":"zilaș","zile":["zile","zi","zile","ziuă"],"zile de anul nou":"ziua de Anul Nou","zile de munca":"zi de muncă","zile de nastere":"zi de naștere","zile lucratoare":"zi lucrătoare","zile onomastice":"zi onomastică","zile siderale":"zi siderală","zilei":["zilei","zi","zilei","ziuă"],"zilele":["zilele","zi","zilele","ziuă"],"zilelor":["zilelor","zi","zilelor","ziuă"],"zilere":"zileră","zilerei":"zileră","zilerele":"zileră","zilerelor":"zileră","zileri":"ziler","zilerii":"ziler","zilerilor":"ziler","zilerul":"ziler","zilerule":"ziler","zilerului":"ziler","ziliere":"zilieră","zilierei":"zilieră","zilierele":"zilieră","zilierelor":"zilieră","zilieri":"zilier","zilierii":"zilier","zilierilor":"zilier","zilierul":"zilier","zilierule":"zilier","zilierului":"zilier","zilisoare":"zilișoară","zilisoarei":"zilișoară","zilisoarele":"zilișoară","zilisoarelor":"zilișoară","zilnica":["zilnică","zilnic","zilnica","zilnic"],"zilnice":"zilnic","zilnicele":"zilnic","zilnici":"zilnic","zilnicii":"zilnic","zilnicul":"zilnic","zilosul":"zilos","zilosule":"zilos","zilosului":"zilos","zimaze":"zimază","zimazei":"zimază","zimazele":"zimază","zimazelor":"zimază","zimbabwiene":"zimbabwiană","zimbabwienei":"zimbabwiană","zimbabwienele":"zimbabwiană","zimbabwienelor":"zimbabwiană","zimbea":"zimbi","zimbeai":"zimbi","zimbeam":"zimbi","zimbeati":"zimbi","zimbeau":"zimbi","zimberechiul":"zimberechi","zimberechiule":"zimberechi","zimberechiului":"zimberechi","zimberechiuri":"zimberechi","zimberechiurile":"zimberechi","zimberechiurilor":"zimberechi","zimberecul":"zimberec","zimberecule":"zimberec","zimberecului":"zimberec","zimberecuri":"zimberec","zimberecurile":"zimberec","zimberecurilor":"zimberec","zimbesc":"zimbi","zimbeste":"zimbi","zimbesti":"zimbi","zimbet":"zâmbet","zimbii":"zimbi","zimbim":"zimbi","zimbind":"zimbi","zimbira":"zimbi","zimbiram":"zimbi","zimbirati":"zimbi","zimbise":"zimbi","zimbisem":"zimbi","zimbisera":"zimbi","zimbiseram":"zimbi","zimbiserati":"zimbi","zimbisesi":"zimbi","zimbisi":"zimbi","zimbit":"zimbi","zimbiti":"zimbi","zimbitura":"zâmbitură","zimbrea":"zimbre","zimbrei":"zimbre","zimbrele":"zimbre","zimbrelor":"zimbre","zimbrelul":"zimbrel","zimbrelule":"zimbrel","zimbrelului":"zimbrel","zimbri":"zimbru","zimbrii":"zimbru","zimbrilor":"zimbru","zimbrisori":"zimbrișor","zimbrisorii":"zimbrișor","zimbrisorilor":"zimbrișor","zimbrisorul":"zimbrișor","zimbrisorule":"zimbrișor","zimbrisorului":"zimbrișor","zimbrul":"zimbru","zimbrule":"zimbru","zimbrului":"zimbru","zimniceana":["zimniceană","zimnicean","zimniceana","zimnicean"],"zimniceanul":"zimnicean","zimniceanule":"zimnicean","zimniceanului":"zimnicean","zimnicence":"zimniceancă","zimnicencei":"zimniceancă","zimnicencele":"zimniceancă","zimnicencelor":"zimniceancă","zimnicene":"zimnicean","zimnicenele":"zimnicean","zimniceni":"zimnicean","zimnicenii":"zimnicean","zimnicenilor":"zimnicean","zimogene":"zimogen","zimogenele":"zimogen","zimogenelor":"zimogen","zimogeneze":"zimogeneză","zimogenezei":"zimogeneză","zimogenezele":"zimogeneză","zimogenezelor":"zimogeneză","zimogenul":"zimogen","zimogenule":"zimogen","zimogenului":"zimogen","zimotehnia":"zimotehnie","zimotehniei":"zimotehnie","zimotehnii":"zimotehnie","zimoterapia":"zimoterapie","zimoterapiei":"zimoterapie","zimoterapii":"zimoterapie","zimoterapiile":"zimoterapie","zimoterapiilor":"zimoterapie","zimotica":["zimotică","zimotic","zimotica","zimotic"],"zimotice":"zimotic","zimoticele":"zimotic","zimotici":"zimotic","zimoticii":"zimotic","zimoticul":"zimotic","zimtai":"zimța","zimtam":["zimțăm","zimța","zimțam","zimța"],"zimtand":"zimța","zimtara":"zimța","zimtaram":"zimța","zimtarati":"zimța","zimtarea":"zimțare","zimtari":"zimțare","zimtarii":"zimțare","zimtarile":"zimțare","zimtarilor":"zimțare","zimtase":"zimța","zimtasem":"zimța","zimtasera":"zimța","zimtaseram":"zimța","zimtaserati":"zimța","zimtasesi":"zimța","zimtasi":"zimța","zimtat":"zimța","zimtata":["zimțată","zimțat","zimțata","zimțat"],"zimtate":"zimțat","zimtatele":"zimțat","zimtati":["zimțați","zimța","zimțați","zimțat"],"zimtatii":"zimțat","zimtatul":"zimțat","zimtau":"zimța","zimteaza":"zimța","zimtez":"zimța","zimtezi":"zimța","zimti":"zimț","zimtii":"zimț","zimtilor":"zimț","zimtisori":"zimțișor","zimtisorii":"zimțișor","zimtisorilor":"zimțișor","zimtisorul":"zimțișor","zimtisorule":"zimțișor","zimtisorului":"zimțișor","zimtoasa":["zimțoasă","zimțos","zimțoasa","zimțos"],"zimtoase":"zimțos","zimtoasele":"zimțos","zimtosi":"zimțos","zimtosii":"zimțos","zimtosul":"zimțos","zimtuia":"zimțui","zimtuiai":"zimțui","zimtuiam":"zimțui","zimtuiati":"zimțui","zimtuiau":"zimțui","zimtuiesc":"zimțui","zimtuieste":"zimțui","zimtuiesti":"zimțui","zimtuii":"zimțui","zimtuim":"zimțui","zimtuind":"zimțui","zimtuira":"zimțui","zimtuiram":"zimțui","zimtuirati":"zimțui","zimtuirea":"zimțuire","zimtuiri":"zimțuire","zimtuirii":"zimțuire","zimtuirile":"zimțuire","zimtuirilor":"zimțuire","zimtuise":"zimțui","zimtuisem":"zimțui","zimtuisera":"zimțui","zimtuiseram":"zimțui","zimtuiserati":"zimțui","zimtuisesi":"zimțui","zimtuisi":"zimțui","zimtuit":"zimțui","zimtuita":["zimțuită","zimțuit","zimțuita","zimțuit"],"zimtuite":"zimțuit","zimtuitele":"zimțuit","zimtuiti":["zimțuiți","zimțui","zimțuiți","zimțuit"],"zimtuitii":"zimțuit","zimtuitul":"zimțuit","zimtul":"zimț","zimtule":"zimț","zimtului":"zimț","zina":"zână","zincai":"zinca","zincam":["zincăm","zinca","zincam","zinca"],"zincand":"zinca","zincara":"zinca","zincaram":"zinca","zincarati":"zinca","zincarea":"zincare","zincari":"zincare","zincarii":"zincare","zincarile":"zincare","zincarilor":"zincare","zincase":"zinca","zincasem":"zinca","zincasera":"zinca","zincaseram":"zinca","zincaserati":"zinca","zincasesi":"zinca","zincasi":"zinca","zincat":"zinca","zincata":["zincată","zincat","zincata","zincat"],"zincate":"zincat","zincatele":"zincat","zincati":["zincați","zinca","zincați","zincat"],"zincatii":"zincat","zincatul":"zincat","zincau":"zinca","zincheaza":"zinca","zinchez":"zinca","zinchezi":"zinca","zincitul":"zincit","zincitule":"zincit","zincitului":"zincit","zincografe":"zincografă","zincografei":"zincografă","zincografele":"zincografă","zincografelor":"zincografă","zincografi":"zincograf","zincografia":"zincografie","zincografiai":"zincografia","zincografiam":"zincografia","zincografiara":"zincografia","zincografiaram":"zincografia","zincografiarati":"zincografia","zincografiase":"zincografia","zincografiasem":"zincografia","zincografiasera":"zincografia","zincografiaseram":"zincografia","zincografiaserati":"zincografia","zincografiasesi":"zincografia","zincografiasi":"zincografia","zincografiat":"zincografia","zincografiati":"zincografia","zincografiau":"zincografia","zincografiaza":"zincografia","zincografica":["zincografică","zincografic","zincografica","zincografic"],"zincografice":"zincografic","zincograficele":"zincografic","zincografici":"zincografic","zincograficii":"zincografic","zincograficul":"zincografic","zincografie":"zincografia","zincografiei":"zincografie","zincografiem":"zincografia","zincografiez":"zincografia","zincografiezi":"zincografia","zincografii":["zincografii","zincograf","zincografii","zincografie"],"zincografiile":"zincografie","zincografiilor":"zincografie","zincografiind":"zincografia","zincografilor":"zincograf","zincograful":"zincograf","zincografule":"zincograf","zincografului":"zincograf","zincogravuri":"zincogravură","zincogravurii":"zincogravură","zincogravurile":"zincogravură","zincogravurilor":"zincogravură","zincuia":"zincui","zincuiai":"zincui","zincuiam":"zincui","zincuiati":"zincui","zincuiau":"zincui","zincuiesc":"zincui","zincuieste":"zincui","zincuiesti":"zincui","zincuii":"zincui","zincuim":"zincui","zincuind":"zincui","zincuira":"zincui","zincuiram":"zincui","zincuirati":"zincui","zincuirea":"zincuire","zincuiri":"zincuire","zincuirii":"zincuire","zincuirile":"zincuire","zincuirilor":"zincuire","zincuise":"zincui","zincuisem":"zincui","zincuisera":"zincui","zincuiseram":"zincui","zincuiserati":"zincui","zincuisesi":"zincui","zincuisi":"zincui","zincuit":"zincui","zincuiti":"zincui","zincuitul":"zincuit","zincuitule":"zincuit","zincuitului":"zincuit","zincul":"zinc","zincule":"zinc","zincului":"zinc","zine":"zină","zinei":"zină","zinele":"zină","zinelor":"zină","zinganea":"zingăni","zinganeai":"zingăni","zinganeam":"zingăni","zinganeati":"zingăni","zinganeau":"zingăni","zinganesc":"zingăni","zinganeste":"zingăni","zinganesti":"zingăni","zinganii":"zingăni","zinganim":"zingăni","zinganind":"zingăni","zinganira":"zingăni","zinganiram":"zingăni","zinganirati":"zingăni","zinganirea":"zingănire","zinganiri":"zingănire","zinganirii":"zingănire","zinganirile":"zingănire","zinganirilor":"zingănire","zinganise":"zingăni","zinganisem":"zingăni","zinganisera":"zingăni","zinganiseram":"zingăni","zinganiserati":"zingăni","zinganisesi":"zingăni","zinganisi":"zingăni","zinganit":"zingăni","zinganiti":"zingăni","zinganitul":"zingănit","zinganitule":"zingănit","zinganitului":"zingănit","zinganituri":"zingănit","zinganiturile":"zingănit","zinganiturilor":"zingănit","zingate":"zingăt","zingatele":"zingăt","zingatelor":"zingăt","zingatul":"zingăt","zingatule":"zingăt","zingatului":"zingăt","zinghenea":"zingheni","zingheneai":"zingheni","zingheneam":"zingheni","zingheneati":"zingheni","zingheneau":"zingheni","zinghenesc":"zingheni","zingheneste":"zingheni","zinghenesti":"zingheni","zinghenii":"zingheni","zinghenim":"zingheni","zinghenind":"zingheni","zinghenira":"zingheni","zingheniram":"zingheni","zinghenirati":"zingheni","zinghenirea":"zinghenire","zingheniri":"zinghenire","zinghenirii":"zinghenire","zinghenirile":"zinghenire","zinghenirilor":"zinghenire","zinghenise":"zingheni","zinghenisem":"zingheni","zinghenisera":"zingheni","zingheniseram":"zingheni","zingheniserati":"zingheni","zinghenisesi":"zingheni","zinghenisi":"zingheni","zinghenit":"zingheni","zingheniti":"zingheni","zinghenitoare":"zinghenitor","zinghenitoarea":"zinghenitor","zinghenitoarele":"zinghenitor","zinghenitori":"zinghenitor","zinghenitorii":"zinghenitor","zinghenitorul":"zinghenitor","zinghete":"zinghet","zinghetele":"zinghet","zinghetelor":"zinghet","zinghetul":"zinghet","zinghetule":"zinghet","zinghetului":"zinghet","zingirlii":"zingirliu","zingirliii":"zingirliu","zingirliilor":"zingirliu","zingirliuul":"zingirliu","zingirliuule":"zingirliu","zingirliuului":"zingirliu","zinnwaldite":"zinnwaldit","zinnwalditele":"zinnwaldit","zinnwalditelor":"zinnwaldit","zinnwalditul":"zinnwaldit","zinnwalditule":"zinnwaldit","zinnwalditului":"zinnwaldit","zinwalditul":"zinwaldit","zinwalditule":"zinwaldit","zinwalditului":"zinwaldit","zioare":"zioară","zioarei":"zioară","zioarele":"zioară","zioarelor":"zioară","zirconite":"zirconită","zirconitei":"zirconită","zirconiul":"zirconiu","zirconiule":"zirconiu","zirconiului":"zirconiu","zirconul":"zircon","zirconule":"zircon","zirconului":"zircon","zis":"zice","zisa":["zisă","zis","zisa","zis"],"zise":["zise","zice","zise","zis"],"zisei":"zice","zisele":"zis","zisera":"zice","ziseram":"zice","ziserati":"zice","zisese":"zice","zisesem":"zice","zisesera":"zice","ziseseram":"zice","ziseserati":"zice","zisesesi":"zice","zisesi":"zice","zisi":"zis","zisii":"zis","zisul":"zis","zitul":"ziț","zitule":"ziț","zitului":"ziț","zituri":"ziț","ziturile":"ziț","ziturilor":"ziț","ziua":["ziua","zi","ziuă","zi"],"ziuci":"ziucă","ziucii":"ziucă","ziucile":"ziucă","ziucilor":"ziucă","ziulici":"ziulică","ziulicii":"ziulică","ziulicile":"ziulică","ziulicilor":"ziulică","ziulite":"ziuliță","ziulitei":"ziuliță","ziulitele":"ziuliță","ziulitelor":"ziuliță","ziuo":"zi","ziusoare":"ziușoară","ziusoarei":"ziușoară","ziute":"ziuță","ziutei":"ziuță","ziutele":"ziuță","ziutelor":"ziuță","zivelci":"zivelcă","zivelcii":"zivelcă","zivelcile":"zivelcă","zivelcilor":"zivelcă","zizania":"zizanie","zizanie":"zâzanie","zizaniei":"zizanie","zizanii":"zizanie","zizaniile":"zizanie","zizaniilor":"zizanie","zlatarei":"zlătărel","zlatareii":"zlătărel","zlatareilor":"zlătărel","zlatarelul":"zlătărel","zlatarelule":"zlătărel","zlatarelului":"zlătărel","zlatarese":"zlătăreasă","zlataresei":"zlătăreasă","zlataresele":"zlătăreasă","zlatareselor":"zlătăreasă","zlatari":"zlătar","zlataria":"zlătărie","zlatariei":"zlătărie","zlatarii":["zlătarii","zlătar","zlătării","zlătărie"],"zlatariile":"zlătărie","zlatariilor":"zlătărie","zlatarilor":"zlătar","zlatarite":"zlătăriță","zlataritei":"zlătăriță","zlataritele":"zlătăriță","zlataritelor":"zlătăriță","zlatarul":"zlătar","zlatarule":"zlătar","zlatarului":"zlătar","zloabe":"zloabă","zloabei":"zloabă","zloabele":"zloabă","zloabelor":"zloabă","zloate":"zloată","zloatei":"zloată","zloatele":"zloată","zloatelor":"zloată","zlocestivi":"zlocestiv","zlocestivii":"zlocestiv","zlocestivilor":"zlocestiv","zlocestivul":"zlocestiv","zlocestivule":"zlocestiv","zlocestivului":"zlocestiv","zloslavia":"zloslavie","zloslaviei":"zloslavie","zloslavii":"zloslavie","zloslaviile":"zloslavie","zloslaviilor":"zloslavie","zlotaria":"zlotărie","zlotariei":"zlotărie","zlotarii":"zlotărie","zlotariile":"zlotărie","zlotariilor":"zlotărie","zlotasi":"zlotaș","zlotasii":"zlotaș","zlotasilor":"zlotaș","zlotasul":"zlotaș","zlotasule":"zlotaș","zlotasului":"zlotaș","zloti":"zlot","zlotii":"zlot","zlotilor":"zlot","zlotoasa":["zlotoasă","zlotos","zlotoasa","zlotos"],"zlotoase":"zlotos","zlotoasele":"zlotos","zlotosi":"zlotos","zlotosii":"zlotos","zlotosul":"zlotos","zlotul":"zlot","zlotule":"zlot","zlotului":"zlot","zmacea":"zmâci","zmaceai":"zmâci","zmaceam":"zmâci","zmaceati":"zmâci","zmaceau":"zmâci","zmacesc":"zmâci","zmaceste":"zmâci","zmacesti":"zmâci","zmacii":"zmâci","zmacim":"zmâci","zmacinarea":"zmăcinare","zmacinari":"zmăcinare","zmacinarii":"zmăcinare","zmacinarile":"zmăcinare","zmacinarilor":"zmăcinare","zmacinata":["zmăcinată","zmăcinat","zmăcinata","zmăcinat"],"zmacinate":"zmăcinat","zmacinatele":"zmăcinat","zmacinati":"zmăcinat"};
@@ -0,0 +1 @@
+export default {"zmacinatii":"zmăcinat","zmacinatul":"zmăcinat","zmacind":"zmâci","zmacira":"zmâci","zmaciram":"zmâci","zmacirati":"zmâci","zmacise":"zmâci","zmacisem":"zmâci","zmacisera":"zmâci","zmaciseram":"zmâci","zmaciserati":"zmâci","zmacisesi":"zmâci","zmacisi":"zmâci","zmacit":"zmâci","zmaciti":"zmâci","zmadicute":"zmadicuță","zmadicutei":"zmadicuță","zmadicutele":"zmadicuță","zmadicutelor":"zmadicuță","zmadite":"zmadiță","zmaditei":"zmadiță","zmaditele":"zmadiță","zmaditelor":"zmadiță","zmaltul":"zmalț","zmaltule":"zmalț","zmaltului":"zmalț","zmalturi":"zmalț","zmalturile":"zmalț","zmalturilor":"zmalț","zmangalea":"zmângăli","zmangaleai":"zmângăli","zmangaleam":"zmângăli","zmangaleati":"zmângăli","zmangaleau":"zmângăli","zmangalele":"zmângăleală","zmangalelei":"zmângăleală","zmangalelele":"zmângăleală","zmangalelelor":"zmângăleală","zmangaleli":"zmângăleală","zmangalesc":"zmângăli","zmangaleste":"zmângăli","zmangalesti":"zmângăli","zmangalii":"zmângăli","zmangalim":"zmângăli","zmangalind":"zmângăli","zmangalira":"zmângăli","zmangaliram":"zmângăli","zmangalirati":"zmângăli","zmangalirea":"zmângălire","zmangaliri":"zmângălire","zmangalirii":"zmângălire","zmangalirile":"zmângălire","zmangalirilor":"zmângălire","zmangalise":"zmângăli","zmangalisem":"zmângăli","zmangalisera":"zmângăli","zmangaliseram":"zmângăli","zmangaliserati":"zmângăli","zmangalisesi":"zmângăli","zmangalisi":"zmângăli","zmangalit":"zmângăli","zmangalita":["zmângălită","zmângălit","zmângălita","zmângălit"],"zmangalite":"zmângălit","zmangalitele":"zmângălit","zmangaliti":["zmângăliți","zmângăli","zmângăliți","zmângălit"],"zmangalitii":"zmângălit","zmangalitul":"zmângălit","zmangalituri":"zmângălitură","zmangaliturii":"zmângălitură","zmangaliturile":"zmângălitură","zmangaliturilor":"zmângălitură","zmaragde":"zmaragd","zmaragdele":"zmaragd","zmaragdelor":"zmaragd","zmaragdul":"zmaragd","zmaragdule":"zmaragd","zmaragdului":"zmaragd","zmarande":"zmarand","zmarandele":"zmarand","zmarandelor":"zmarand","zmarandul":"zmarand","zmarandule":"zmarand","zmarandului":"zmarand","zmei":"zmeu","zmeie":"zmeu","zmeiele":"zmeu","zmeielor":"zmeu","zmeii":"zmeu","zmeilor":"zmeu","zmeioasa":["zmeioasă","zmeios","zmeioasa","zmeios"],"zmeioase":"zmeios","zmeioasele":"zmeios","zmeiosi":"zmeios","zmeiosii":"zmeios","zmeiosul":"zmeios","zmeoaia":"zmeoaie","zmeoaice":"zmeoaică","zmeoaicei":"zmeoaică","zmeoaicele":"zmeoaică","zmeoaicelor":"zmeoaică","zmeoaiei":"zmeoaie","zmeoaii":"zmeoaie","zmeoaiile":"zmeoaie","zmeoaiilor":"zmeoaie","zmeoii":"zmeoi","zmeoilor":"zmeoi","zmeoiul":"zmeoi","zmeoiule":"zmeoi","zmeoiului":"zmeoi","zmerea":"zmeri","zmereai":"zmeri","zmeream":"zmeri","zmereati":"zmeri","zmereau":"zmeri","zmeresc":"zmeri","zmereste":"zmeri","zmeresti":"zmeri","zmerii":"zmeri","zmerim":"zmeri","zmerind":"zmeri","zmerira":"zmeri","zmeriram":"zmeri","zmerirati":"zmeri","zmerise":"zmeri","zmerisem":"zmeri","zmerisera":"zmeri","zmeriseram":"zmeri","zmeriserati":"zmeri","zmerisesi":"zmeri","zmerisi":"zmeri","zmerit":"zmeri","zmeriti":"zmeri","zmeuasi":"zmeuaș","zmeuasii":"zmeuaș","zmeuasilor":"zmeuaș","zmeuasul":"zmeuaș","zmeuasule":"zmeuaș","zmeuasului":"zmeuaș","zmeul":"zmeu","zmeule":"zmeu","zmeuleti":"zmeuleț","zmeuletii":"zmeuleț","zmeuletilor":"zmeuleț","zmeuletul":"zmeuleț","zmeuletule":"zmeuleț","zmeuletului":"zmeuleț","zmeului":"zmeu","zmeurari":"zmeurar","zmeurarii":"zmeurar","zmeurarilor":"zmeurar","zmeurarul":"zmeurar","zmeurarule":"zmeurar","zmeurarului":"zmeurar","zmeurase":"zmeuraș","zmeurasele":"zmeuraș","zmeuraselor":"zmeuraș","zmeurasul":"zmeuraș","zmeurasule":"zmeuraș","zmeurasului":"zmeuraș","zmeurate":"zmeurată","zmeuratei":"zmeurată","zmeuratele":"zmeurată","zmeuratelor":"zmeurată","zmeure":"zmeură","zmeurei":"zmeură","zmeurele":"zmeură","zmeurelor":"zmeură","zmeuretul":"zmeuret","zmeuretule":"zmeuret","zmeuretului":"zmeuret","zmeuri":"zmeur","zmeuria":"zmeuriu","zmeurici":"zmeurică","zmeuricii":"zmeurică","zmeuricile":"zmeurică","zmeuricilor":"zmeurică","zmeurie":"zmeuriu","zmeurii":["zmeurii","zmeur","zmeurii","zmeuriu"],"zmeuriii":"zmeuriu","zmeuriile":"zmeuriu","zmeurilor":"zmeur","zmeuristea":"zmeuriște","zmeuristi":"zmeuriște","zmeuristii":"zmeuriște","zmeuristile":"zmeuriște","zmeuristilor":"zmeuriște","zmeurisul":"zmeuriș","zmeurisule":"zmeuriș","zmeurisului":"zmeuriș","zmeurisuri":"zmeuriș","zmeurisurile":"zmeuriș","zmeurisurilor":"zmeuriș","zmeurite":"zmeuriță","zmeuritei":"zmeuriță","zmeuritele":"zmeuriță","zmeuritelor":"zmeuriță","zmeuriul":"zmeuriu","zmeurul":"zmeur","zmeurule":"zmeur","zmeurului":"zmeur","zmeurusul":"zmeuruș","zmeurusule":"zmeuruș","zmeurusului":"zmeuruș","zmeurusuri":"zmeuruș","zmeurusurile":"zmeuruș","zmeurusurilor":"zmeuruș","zmintea":"zminti","zminteai":"zminti","zminteam":"zminti","zminteati":"zminti","zminteau":"zminti","zmintele":"zminteală","zmintelei":"zminteală","zmintelele":"zminteală","zmintelelor":"zminteală","zminteli":"zminteală","zmintesc":"zminti","zminteste":"zminti","zmintesti":"zminti","zmintii":"zminti","zmintim":"zminti","zmintind":"zminti","zmintira":"zminti","zmintiram":"zminti","zmintirati":"zminti","zmintise":"zminti","zmintisem":"zminti","zmintisera":"zminti","zmintiseram":"zminti","zmintiserati":"zminti","zmintisesi":"zminti","zmintisi":"zminti","zmintit":"zminti","zmintiti":"zminti","zmochine":"zmochină","zmochinei":"zmochină","zmochinele":"zmochină","zmochinelor":"zmochină","zmochini":"zmochin","zmochinii":"zmochin","zmochinilor":"zmochin","zmochinul":"zmochin","zmochinule":"zmochin","zmochinului":"zmochin","zmucea":"zmuci","zmuceai":"zmuci","zmuceam":"zmuci","zmuceati":"zmuci","zmuceau":"zmuci","zmucesc":"zmuci","zmuceste":"zmuci","zmucesti":"zmuci","zmucii":"zmuci","zmucim":"zmuci","zmucind":"zmuci","zmucira":"zmuci","zmuciram":"zmuci","zmucirati":"zmuci","zmucise":"zmuci","zmucisem":"zmuci","zmucisera":"zmuci","zmuciseram":"zmuci","zmuciserati":"zmuci","zmucisesi":"zmuci","zmucisi":"zmuci","zmucit":"zmuci","zmuciti":"zmuci","zmucituri":"zmucitură","zmuciturii":"zmucitură","zmuciturile":"zmucitură","zmuciturilor":"zmucitură","zmuncituri":"zmuncitură","zmunciturii":"zmuncitură","zmunciturile":"zmuncitură","zmunciturilor":"zmuncitură","znamenia":"znamenie","znameniei":"znamenie","znamenii":"znamenie","znameniile":"znamenie","znameniilor":"znamenie","znamia":"znamie","znamiei":"znamie","znamii":"znamie","znamiile":"znamie","znamiilor":"znamie","zoaia":"zoaie","zoale":"zoală","zoalei":"zoală","zoalele":"zoală","zoalelor":"zoală","zoantropi":"zoantrop","zoantropia":"zoantropie","zoantropiei":"zoantropie","zoantropii":["zoantropii","zoantrop","zoantropii","zoantropie"],"zoantropilor":"zoantrop","zoantropul":"zoantrop","zoantropule":"zoantrop","zoantropului":"zoantrop","zobea":"zobi","zobeai":"zobi","zobeam":"zobi","zobeati":"zobi","zobeau":"zobi","zobesc":"zobi","zobeste":"zobi","zobesti":"zobi","zobii":"zobi","zobim":"zobi","zobind":"zobi","zobira":"zobi","zobiram":"zobi","zobirati":"zobi","zobirea":"zobire","zobiri":"zobire","zobirii":"zobire","zobirile":"zobire","zobirilor":"zobire","zobise":"zobi","zobisem":"zobi","zobisera":"zobi","zobiseram":"zobi","zobiserati":"zobi","zobisesi":"zobi","zobisi":"zobi","zobit":"zobi","zobita":["zobită","zobit","zobita","zobit"],"zobite":"zobit","zobitele":"zobit","zobiti":["zobiți","zobi","zobiți","zobit"],"zobitii":"zobit","zobitoarea":"zobitoare","zobitori":"zobitoare","zobitorii":"zobitoare","zobitorile":"zobitoare","zobitorilor":"zobitoare","zobitul":"zobit","zobonase":"zobonaș","zobonasele":"zobonaș","zobonaselor":"zobonaș","zobonasul":"zobonaș","zobonasule":"zobonaș","zobonasului":"zobonaș","zobone":"zobon","zobonele":"zobon","zobonelor":"zobon","zobonul":"zobon","zobonule":"zobon","zobonului":"zobon","zobulete":"zobuleț","zobuletele":"zobuleț","zobuletelor":"zobuleț","zobuletul":"zobuleț","zobuletule":"zobuleț","zobuletului":"zobuleț","zodia":"zodie","zodiacala":["zodiacală","zodiacal","zodiacala","zodiacal"],"zodiacale":"zodiacal","zodiacalele":"zodiacal","zodiacali":"zodiacal","zodiacalii":"zodiacal","zodiacalul":"zodiacal","zodiace":"zodiac","zodiacele":"zodiac","zodiacelor":"zodiac","zodiacul":"zodiac","zodiacule":"zodiac","zodiacului":"zodiac","zodiare":"zodiar","zodiarele":"zodiar","zodiarelor":"zodiar","zodiarul":"zodiar","zodiarule":"zodiar","zodiarului":"zodiar","zodiasi":"zodiaș","zodiasii":"zodiaș","zodiasilor":"zodiaș","zodiasul":"zodiaș","zodiasule":"zodiaș","zodiasului":"zodiaș","zodiei":"zodie","zodieri":"zodier","zodierii":"zodier","zodierilor":"zodier","zodierite":"zodieriță","zodieritei":"zodieriță","zodieritele":"zodieriță","zodieritelor":"zodieriță","zodierul":"zodier","zodierule":"zodier","zodierului":"zodier","zodii":"zodie","zodiile":"zodie","zodiilor":"zodie","zograf":"zugrav","zoi":"zoaie","zoii":"zoaie","zoile":"zoaie","zoilor":"zoaie","zoioasa":["zoioasă","zoios","zoioasa","zoios"],"zoioase":"zoios","zoioasele":"zoios","zoiosi":"zoios","zoiosii":"zoios","zoiosul":"zoios","zolnite":"zolniță","zolnitei":"zolniță","zolnitele":"zolniță","zolnitelor":"zolniță","zombii":"zombi","zombilor":"zombi","zombiul":"zombi","zombiule":"zombi","zombiului":"zombi","zonala":["zonală","zonal","zonala","zonal"],"zonale":"zonal","zonalele":"zonal","zonali":"zonal","zonalii":"zonal","zonalitatati":"zonalitate","zonalitatatii":"zonalitate","zonalitatatile":"zonalitate","zonalitatatilor":"zonalitate","zonalitatea":"zonalitate","zonalul":"zonal","zonarea":"zonare","zonari":"zonare","zonarii":"zonare","zonarile":"zonare","zonarilor":"zonare","zone":"zonă","zone demilitarizate":"zonă demilitarizată","zone erogene":"zonă erogenă","zone neutre":"zonă neutră","zone tampon":"zonă tampon","zone temperate":"zonă temperată","zonei":"zonă","zonele":"zonă","zonelor":"zonă","zongorasi":"zongoraș","zongorasii":"zongoraș","zongorasilor":"zongoraș","zongorasul":"zongoraș","zongorasule":"zongoraș","zongorasului":"zongoraș","zonific":"zonifica","zonificai":"zonifica","zonificam":["zonificăm","zonifica","zonificam","zonifica"],"zonificand":"zonifica","zonificara":"zonifica","zonificaram":"zonifica","zonificarati":"zonifica","zonificarea":"zonificare","zonificari":"zonificare","zonificarii":"zonificare","zonificarile":"zonificare","zonificarilor":"zonificare","zonificase":"zonifica","zonificasem":"zonifica","zonificasera":"zonifica","zonificaseram":"zonifica","zonificaserati":"zonifica","zonificasesi":"zonifica","zonificasi":"zonifica","zonificat":"zonifica","zonificati":"zonifica","zonificau":"zonifica","zonifici":"zonifica","zonule":"zonulă","zonulei":"zonulă","zonulele":"zonulă","zonulelor":"zonulă","zoobiologia":"zoobiologie","zoobiologiei":"zoobiologie","zoobiologii":"zoobiologie","zooblaste":"zooblast","zooblastele":"zooblast","zooblastelor":"zooblast","zooblastul":"zooblast","zooblastule":"zooblast","zooblastului":"zooblast","zoocenoze":"zoocenoză","zoocenozei":"zoocenoză","zoocenozele":"zoocenoză","zoocenozelor":"zoocenoză","zoochimia":"zoochimie","zoochimiei":"zoochimie","zoochimii":"zoochimie","zoocora":["zoocoră","zoocor","zoocora","zoocor"],"zoocore":["zoocore","zoocor","zoocore","zoocoră"],"zoocorei":"zoocoră","zoocorele":["zoocorele","zoocor","zoocorele","zoocoră"],"zoocorelor":"zoocoră","zoocori":"zoocor","zoocorii":"zoocor","zoocorul":"zoocor","zoofaga":["zoofagă","zoofag","zoofaga","zoofag"],"zoofage":"zoofag","zoofagele":"zoofag","zoofagi":"zoofag","zoofagia":"zoofagie","zoofagiei":"zoofagie","zoofagii":["zoofagii","zoofag","zoofagii","zoofagie"],"zoofagul":"zoofag","zoofilia":"zoofilie","zoofiliei":"zoofilie","zoofilii":"zoofilie","zoofite":"zoofit","zoofitele":"zoofit","zoofitelor":"zoofit","zoofitica":["zoofitică","zoofitic","zoofitica","zoofitic"],"zoofitice":"zoofitic","zoofiticele":"zoofitic","zoofitici":"zoofitic","zoofiticii":"zoofitic","zoofiticul":"zoofitic","zoofitul":"zoofit","zoofitule":"zoofit","zoofitului":"zoofit","zoofobia":"zoofobie","zoofobiei":"zoofobie","zoofobii":"zoofobie","zoofobiile":"zoofobie","zoofobiilor":"zoofobie","zoogenia":"zoogenie","zoogeniei":"zoogenie","zoogenii":"zoogenie","zoogeniile":"zoogenie","zoogeniilor":"zoogenie","zoogeografe":"zoogeografă","zoogeografei":"zoogeografă","zoogeografele":"zoogeografă","zoogeografelor":"zoogeografă","zoogeografi":"zoogeograf","zoogeografia":"zoogeografie","zoogeografiei":"zoogeografie","zoogeografii":["zoogeografii","zoogeograf","zoogeografii","zoogeografie"],"zoogeografilor":"zoogeograf","zoogeograful":"zoogeograf","zoogeografule":"zoogeograf","zoogeografului":"zoogeograf","zoogleea":"zooglee","zoogleei":"zooglee","zoogleele":"zooglee","zoogleelor":"zooglee","zoografi":"zoograf","zoografia":"zoografie","zoografiei":"zoografie","zoografii":["zoografii","zoograf","zoografii","zoografie"],"zoografilor":"zoograf","zoograful":"zoograf","zoografule":"zoograf","zoografului":"zoograf","zoolatra":["zoolatră","zoolatru","zoolatra","zoolatru"],"zoolatre":["zoolatre","zoolatră","zoolatre","zoolatru"],"zoolatrei":"zoolatră","zoolatrele":["zoolatrele","zoolatră","zoolatrele","zoolatru"],"zoolatrelor":"zoolatră","zoolatri":"zoolatru","zoolatria":"zoolatrie","zoolatriei":"zoolatrie","zoolatrii":["zoolatrii","zoolatrie","zoolatrii","zoolatru"],"zoolatrul":"zoolatru","zooliti":"zoolit","zoolitii":"zoolit","zoolitilor":"zoolit","zoolitul":"zoolit","zoolitule":"zoolit","zoolitului":"zoolit","zoologe":"zoologă","zoologei":"zoologă","zoologele":"zoologă","zoologelor":"zoologă","zoologi":"zoolog","zoologia":"zoologie","zoologica":["zoologică","zoologic","zoologica","zoologic"],"zoologice":"zoologic","zoologicele":"zoologic","zoologici":"zoologic","zoologicii":"zoologic","zoologicul":"zoologic","zoologiei":"zoologie","zoologii":["zoologii","zoolog","zoologii","zoologie"],"zoologilor":"zoolog","zoologiste":"zoologistă","zoologistei":"zoologistă","zoologistele":"zoologistă","zoologistelor":"zoologistă","zoologisti":"zoologist","zoologistii":"zoologist","zoologistilor":"zoologist","zoologistul":"zoologist","zoologistule":"zoologist","zoologistului":"zoologist","zoologul":"zoolog","zoologule":"zoolog","zoologului":"zoolog","zoomagnetismul":"zoomagnetism","zoomagnetismule":"zoomagnetism","zoomagnetismului":"zoomagnetism","zoomania":"zoomanie","zoomaniei":"zoomanie","zoomanii":"zoomanie","zoomaniile":"zoomanie","zoomaniilor":"zoomanie","zoometre":"zoometru","zoometrele":"zoometru","zoometrelor":"zoometru","zoometrul":"zoometru","zoometrule":"zoometru","zoometrului":"zoometru","zoomorfa":["zoomorfă","zoomorf","zoomorfa","zoomorf"],"zoomorfe":"zoomorf","zoomorfele":"zoomorf","zoomorfi":"zoomorf","zoomorfia":"zoomorfie","zoomorfica":["zoomorfică","zoomorfic","zoomorfica","zoomorfic"],"zoomorfice":"zoomorfic","zoomorficele":"zoomorfic","zoomorfici":"zoomorfic","zoomorficii":"zoomorfic","zoomorficul":"zoomorfic","zoomorfiei":"zoomorfie","zoomorfii":["zoomorfii","zoomorf","zoomorfii","zoomorfie"],"zoomorfiile":"zoomorfie","zoomorfiilor":"zoomorfie","zoomorfisme":"zoomorfism","zoomorfismele":"zoomorfism","zoomorfismelor":"zoomorfism","zoomorfismul":"zoomorfism","zoomorfismule":"zoomorfism","zoomorfismului":"zoomorfism","zoomorful":"zoomorf","zoomul":"zoom","zoomule":"zoom","zoomului":"zoom","zoomuri":"zoom","zoomurile":"zoom","zoomurilor":"zoom","zoonime":"zoonim","zoonimele":"zoonim","zoonimelor":"zoonim","zoonimul":"zoonim","zoonimule":"zoonim","zoonimului":"zoonim","zoonomia":"zoonomie","zoonomiei":"zoonomie","zoonomii":"zoonomie","zoonoze":"zoonoză","zoonozei":"zoonoză","zoonozele":"zoonoză","zoonozelor":"zoonoză","zoopaleontologia":"zoopaleontologie","zoopaleontologiei":"zoopaleontologie","zoopaleontologii":"zoopaleontologie","zooparaziti":"zooparazit","zooparazitii":"zooparazit","zooparazitilor":"zooparazit","zooparazitul":"zooparazit","zooparazitule":"zooparazit","zooparazitului":"zooparazit","zooparcul":"zooparc","zooparcule":"zooparc","zooparcului":"zooparc","zooparcuri":"zooparc","zooparcurile":"zooparc","zooparcurilor":"zooparc","zoopatia":"zoopatie","zoopatiei":"zoopatie","zoopatii":"zoopatie","zoopatiile":"zoopatie","zoopatiilor":"zoopatie","zoopatologia":"zoopatologie","zoopatologiei":"zoopatologie","zoopatologii":"zoopatologie","zooplanctonul":"zooplancton","zooplanctonule":"zooplancton","zooplanctonului":"zooplancton","zooprofilaxia":"zooprofilaxie","zooprofilaxiei":"zooprofilaxie","zooprofilaxii":"zooprofilaxie","zooprofilaxiile":"zooprofilaxie","zooprofilaxiilor":"zooprofilaxie","zoopsia":"zoopsie","zoopsiei":"zoopsie","zoopsihologia":"zoopsihologie","zoopsihologiei":"zoopsihologie","zoopsihologii":"zoopsihologie","zoopsihologiile":"zoopsihologie","zoopsihologiilor":"zoopsihologie","zoopsii":"zoopsie","zoosemiotice":"zoosemiotică","zoosemioticei":"zoosemiotică","zoospermia":"zoospermie","zoospermiei":"zoospermie","zoospermii":"zoospermie","zoospermiile":"zoospermie","zoospermiilor":"zoospermie","zoosporangeul":"zoosporange","zoosporangeule":"zoosporange","zoosporangeului":"zoosporange","zoosporangi":"zoosporange","zoosporangii":"zoosporange","zoosporangilor":"zoosporange","zoospori":"zoospor","zoosporii":"zoospor","zoosporilor":"zoospor","zoosporul":"zoospor","zoosporule":"zoospor","zoosporului":"zoospor","zoosterolul":"zoosterol","zoosterolule":"zoosterol","zoosterolului":"zoosterol","zootaxia":"zootaxie","zootaxiei":"zootaxie","zootaxii":"zootaxie","zootaxiile":"zootaxie","zootaxiilor":"zootaxie","zootehnia":"zootehnie","zootehnica":["zootehnică","zootehnic","zootehnica","zootehnic"],"zootehnice":"zootehnic","zootehnicele":"zootehnic","zootehnici":"zootehnic","zootehnicianul":"zootehnician","zootehnicianule":"zootehnician","zootehnicianului":"zootehnician","zootehniciene":"zootehniciană","zootehnicienei":"zootehniciană","zootehnicienele":"zootehniciană","zootehnicienelor":"zootehniciană","zootehnicieni":"zootehnician","zootehnicienii":"zootehnician","zootehnicienilor":"zootehnician","zootehnicii":"zootehnic","zootehnicul":"zootehnic","zootehniei":"zootehnie","zootehnii":"zootehnie","zootehniile":"zootehnie","zootehniilor":"zootehnie","zootehniste":"zootehnistă","zootehnistei":"zootehnistă","zootehnistele":"zootehnistă","zootehnistelor":"zootehnistă","zootehnisti":"zootehnist","zootehnistii":"zootehnist","zootehnistilor":"zootehnist","zootehnistul":"zootehnist","zootehnistule":"zootehnist","zootehnistului":"zootehnist","zooterapeutica":["zooterapeutică","zooterapeutic","zooterapeutica","zooterapeutic"],"zooterapeutice":["zooterapeutice","zooterapeutic","zooterapeutice","zooterapeutică"],"zooterapeuticei":"zooterapeutică","zooterapeuticele":["zooterapeuticele","zooterapeutic","zooterapeuticele","zooterapeutică"],"zooterapeuticelor":"zooterapeutică","zooterapeutici":"zooterapeutic","zooterapeuticii":"zooterapeutic","zooterapeuticul":"zooterapeutic","zooterapia":"zooterapie","zooterapiei":"zooterapie","zooterapii":"zooterapie","zooterapiile":"zooterapie","zooterapiilor":"zooterapie","zootomia":"zootomie","zootomiei":"zootomie","zootomii":"zootomie","zootoxine":"zootoxină","zootoxinei":"zootoxină","zootoxinele":"zootoxină","zootoxinelor":"zootoxină","zooul":"zoo","zooule":"zoo","zooului":"zoo","zopaia":"zopăi","zopaiai":"zopăi","zopaiam":"zopăi","zopaiati":"zopăi","zopaiau":"zopăi","zopaiesc":"zopăi","zopaieste":"zopăi","zopaiesti":"zopăi","zopaii":"zopăi","zopaim":"zopăi","zopaind":"zopăi","zopaira":"zopăi","zopairam":"zopăi","zopairati":"zopăi","zopaise":"zopăi","zopaisem":"zopăi","zopaisera":"zopăi","zopaiseram":"zopăi","zopaiserati":"zopăi","zopaisesi":"zopăi","zopaisi":"zopăi","zopait":"zopăi","zopaiti":"zopăi","zopaituri":"zopăitură","zopaiturii":"zopăitură","zopaiturile":"zopăitură","zopaiturilor":"zopăitură","zorcani":"zorcan","zorcanii":"zorcan","zorcanilor":"zorcan","zorcanul":"zorcan","zorcanule":"zorcan","zorcanului":"zorcan","zoreaua":"zorea","zorele":"zorea","zorelei":"zorea","zorelele":"zorea","zorelelor":"zorea","zorii":"zori","zorili":"zoril","zorilii":"zoril","zorililor":"zoril","zorilor":"zori","zorilul":"zoril","zorilule":"zoril","zorilului":"zoril","zorirea":"zorire","zoriri":"zorire","zoririi":"zorire","zoririle":"zorire","zoririlor":"zorire","zorita":["zorită","zorit","zorita","zorit"],"zorite":"zorit","zoritele":"zorit","zoriti":"zorit","zoritii":"zorit","zoritul":"zorit","zornaia":"zornăi","zornaiai":"zornăi","zornaiam":"zornăi","zornaiati":"zornăi","zornaiau":"zornăi","zornaie":"zornăi","zornaiele":"zornăială","zornaielei":"zornăială","zornaielele":"zornăială","zornaielelor":"zornăială","zornaieli":"zornăială","zornaii":"zornăi","zornaim":"zornăi","zornaind":"zornăi","zornaira":"zornăi","zornairam":"zornăi","zornairati":"zornăi","zornaise":"zornăi","zornaisem":"zornăi","zornaisera":"zornăi","zornaiseram":"zornăi","zornaiserati":"zornăi","zornaisesi":"zornăi","zornaisi":"zornăi","zornait":"zornăi","zornaiti":"zornăi","zornaitoare":"zornăitor","zornaitoarea":"zornăitor","zornaitoarele":"zornăitor","zornaitori":"zornăitor","zornaitorii":"zornăitor","zornaitorul":"zornăitor","zornaitul":"zornăit","zornaitule":"zornăit","zornaitului":"zornăit","zornaiture":"zornăitură","zornaiturei":"zornăitură","zornaiturele":"zornăitură","zornaiturelor":"zornăitură","zornaituri":["zornăituri","zornăit","zornăituri","zornăitură"],"zornaiturile":"zornăit","zornaiturilor":"zornăit","zornete":"zornet","zornetele":"zornet","zornetelor":"zornet","zornetul":"zornet","zornetule":"zornet","zornetului":"zornet","zoroastriana":["zoroastriană","zoroastrian","zoroastriana","zoroastrian"],"zoroastrianul":"zoroastrian","zoroastriene":"zoroastrian","zoroastrienele":"zoroastrian","zoroastrieni":"zoroastrian","zoroastrienii":"zoroastrian","zoroastrisme":"zoroastrism","zoroastrismele":"zoroastrism","zoroastrismelor":"zoroastrism","zoroastrismul":"zoroastrism","zoroastrismule":"zoroastrism","zoroastrismului":"zoroastrism","zorobea":"zorobi","zorobeai":"zorobi","zorobeam":"zorobi","zorobeati":"zorobi","zorobeau":"zorobi","zorobesc":"zorobi","zorobeste":"zorobi","zorobesti":"zorobi","zorobii":"zorobi","zorobim":"zorobi","zorobind":"zorobi","zorobira":"zorobi","zorobiram":"zorobi","zorobirati":"zorobi","zorobise":"zorobi","zorobisem":"zorobi","zorobisera":"zorobi","zorobiseram":"zorobi","zorobiserati":"zorobi","zorobisesi":"zorobi","zorobisi":"zorobi","zorobit":"zorobi","zorobiti":"zorobi","zorobocul":"zoroboc","zorobocule":"zoroboc","zorobocului":"zoroboc","zorobocuri":"zoroboc","zorobocurile":"zoroboc","zorobocurilor":"zoroboc","zorul":"zor","zorule":"zor","zorului":"zor","zorzoane":"zorzon","zorzoanele":"zorzon","zorzoanelor":"zorzon","zorzoeste":"zorzoi","zorzoia":"zorzoi","zorzoiai":"zorzoi","zorzoiam":"zorzoi","zorzoiati":"zorzoi","zorzoiau":"zorzoi","zorzoiesc":"zorzoi","zorzoieste":"zorzoi","zorzoiesti":"zorzoi","zorzoii":"zorzoi","zorzoim":"zorzoi","zorzoind":"zorzoi","zorzoira":"zorzoi","zorzoiram":"zorzoi","zorzoirati":"zorzoi","zorzoise":"zorzoi","zorzoisem":"zorzoi","zorzoisera":"zorzoi","zorzoiseram":"zorzoi","zorzoiserati":"zorzoi","zorzoisesi":"zorzoi","zorzoisi":"zorzoi","zorzoit":"zorzoi","zorzoiti":"zorzoi","zorzonata":["zorzonată","zorzonat","zorzonata","zorzonat"],"zorzonate":"zorzonat","zorzonatele":"zorzonat","zorzonati":"zorzonat","zorzonatii":"zorzonat","zorzonatul":"zorzonat","zorzonul":"zorzon","zorzonule":"zorzon","zorzonului":"zorzon","zovelci":"zovelcă","zovelcii":"zovelcă","zovelcile":"zovelcă","zovelcilor":"zovelcă","zovoane":"zovon","zovoanele":"zovon","zovoanelor":"zovon","zovonul":"zovon","zovonule":"zovon","zovonului":"zovon","zuavi":"zuav","zuavii":"zuav","zuavilor":"zuav","zuavul":"zuav","zuavule":"zuav","zuavului":"zuav","zuculele":"zuculeală","zuculelei":"zuculeală","zuculelele":"zuculeală","zuculelelor":"zuculeală","zuculeli":"zuculeală","zugrafi":"zugraf","zugrafii":"zugraf","zugrafilor":"zugraf","zugraful":"zugraf","zugrafule":"zugraf","zugrafului":"zugraf","zugravea":"zugrăvi","zugraveai":"zugrăvi","zugraveam":"zugrăvi","zugraveati":"zugrăvi","zugraveau":"zugrăvi","zugravele":"zugrăvală","zugravelei":"zugrăvală","zugravelele":"zugrăvală","zugravelelor":"zugrăvală","zugraveli":["zugrăveli","zugrăvală","zugrăveli","zugrăveală"],"zugravelii":"zugrăveală","zugravelile":"zugrăveală","zugravelilor":"zugrăveală","zugravesc":"zugrăvi","zugraveste":"zugrăvi","zugravesti":"zugrăvi","zugravi":"zugrav","zugravia":"zugrăvie","zugraviei":"zugrăvie","zugravii":["zugravii","zugrav","zugrăvii","zugrăvi","zugrăvii","zugrăvie"],"zugraviile":"zugrăvie","zugraviilor":"zugrăvie","zugravilor":"zugrav","zugravim":"zugrăvi","zugravind":"zugrăvi","zugravira":"zugrăvi","zugraviram":"zugrăvi","zugravirati":"zugrăvi","zugravirea":"zugrăvire","zugraviri":"zugrăvire","zugravirii":"zugrăvire","zugravirile":"zugrăvire","zugravirilor":"zugrăvire","zugravise":"zugrăvi","zugravisem":"zugrăvi","zugravisera":"zugrăvi","zugraviseram":"zugrăvi","zugraviserati":"zugrăvi","zugravisesi":"zugrăvi","zugravisi":"zugrăvi","zugravit":"zugrăvi","zugravita":["zugrăvită","zugrăvit","zugrăvita","zugrăvit"],"zugravite":["zugrăvite","zugrăvit","zugrăvițe","zugrăviță"],"zugravitei":"zugrăviță","zugravitele":["zugrăvitele","zugrăvit","zugrăvițele","zugrăviță"],"zugravitelor":"zugrăviță","zugraviti":["zugrăviți","zugrăvi","zugrăviți","zugrăvit"],"zugravitii":"zugrăvit","zugravitul":"zugrăvit","zugravul":"zugrav","zugravule":"zugrav","zugravului":"zugrav","zugrum":"zugruma","zugrumai":"zugruma","zugrumam":["zugrumăm","zugruma","zugrumam","zugruma"],"zugrumand":"zugruma","zugrumara":"zugruma","zugrumaram":"zugruma","zugrumarati":"zugruma","zugrumase":"zugruma","zugrumasem":"zugruma","zugrumasera":"zugruma","zugrumaseram":"zugruma","zugrumaserati":"zugruma","zugrumasesi":"zugruma","zugrumasi":"zugruma","zugrumat":"zugruma","zugrumati":"zugruma","zugrumau":"zugruma","zugrumi":"zugruma","zulea":"zule","zulei":"zule","zulele":"zule","zulelor":"zule","zulia":"zulie","zuliara":["zuliară","zuliar","zuliara","zuliar"],"zuliare":"zuliar","zuliarele":"zuliar","zuliari":"zuliar","zuliarii":"zuliar","zuliarul":"zuliar","zuliei":"zulie","zulieria":"zulierie","zulieriei":"zulierie","zulierii":"zulierie","zulii":"zulie","zulipsirea":"zulipsire","zulipsiri":"zulipsire","zulipsirii":"zulipsire","zulipsirile":"zulipsire","zulipsirilor":"zulipsire","zulufai":"zulufa","zulufam":["zulufăm","zulufa","zulufam","zulufa"],"zulufand":"zulufa","zulufara":"zulufa","zulufaram":"zulufa","zulufarati":"zulufa","zulufase":"zulufa","zulufasem":"zulufa","zulufasera":"zulufa","zulufaseram":"zulufa","zulufaserati":"zulufa","zulufasesi":"zulufa","zulufasi":"zulufa","zulufat":"zulufa","zulufata":["zulufată","zulufat","zulufata","zulufat"],"zulufate":"zulufat","zulufatele":"zulufat","zulufati":["zulufați","zulufa","zulufați","zulufat"],"zulufatii":"zulufat","zulufatul":"zulufat","zulufau":"zulufa","zulufeaza":"zulufa","zulufei":"zulufel","zulufeli":"zulufel","zulufelii":"zulufel","zulufelilor":"zulufel","zulufelul":"zulufel","zulufelule":"zulufel","zulufelului":"zulufel","zulufez":"zulufa","zulufezi":"zulufa","zulufi":"zuluf","zulufii":"zuluf","zulufilor":"zuluf","zulufiori":"zulufior","zulufiorii":"zulufior","zulufiorilor":"zulufior","zulufiorul":"zulufior","zulufiorule":"zulufior","zulufiorului":"zulufior","zuluful":"zuluf","zulufule":"zuluf","zulufului":"zuluf","zulumul":"zulum","zulumule":"zulum","zulumului":"zulum","zulumuri":"zulum","zulumurile":"zulum","zulumurilor":"zulum","zuluse":"zulusă","zulusei":"zulusă","zulusele":"zulusă","zuluselor":"zulusă","zulusi":"zulus","zulusii":["zulușii","zulus","zulușii","zuluși"],"zulusilor":["zulușilor","zulus","zulușilor","zuluși"],"zulusul":"zulus","zulusule":"zulus","zulusului":"zulus","zumbairea":"zumbăire","zumbairi":"zumbăire","zumbairii":"zumbăire","zumbairile":"zumbăire","zumbairilor":"zumbăire","zumerne":"zumărnă","zumernei":"zumărnă","zumernele":"zumărnă","zumernelor":"zumărnă","zumerni":"zumărnă","zumzaia":"zumzăi","zumzaiai":"zumzăi","zumzaiam":"zumzăi","zumzaiati":"zumzăi","zumzaiau":"zumzăi","zumzaie":"zumzăi","zumzaiele":"zumzăială","zumzaielei":"zumzăială","zumzaielele":"zumzăială","zumzaielelor":"zumzăială","zumzaieli":"zumzăială","zumzaii":"zumzăi","zumzaim":"zumzăi","zumzaind":"zumzăi","zumzaira":"zumzăi","zumzairam":"zumzăi","zumzairati":"zumzăi","zumzaise":"zumzăi","zumzaisem":"zumzăi","zumzaisera":"zumzăi","zumzaiseram":"zumzăi","zumzaiserati":"zumzăi","zumzaisesi":"zumzăi","zumzaisi":"zumzăi","zumzait":"zumzăi","zumzaiti":"zumzăi","zumzaitoare":"zumzăitor","zumzaitoarea":"zumzăitor","zumzaitoarele":"zumzăitor","zumzaitori":"zumzăitor","zumzaitorii":"zumzăitor","zumzaitorul":"zumzăitor","zumzete":"zumzet","zumzetele":"zumzet","zumzetelor":"zumzet","zumzetul":"zumzet","zumzetule":"zumzet","zumzetului":"zumzet","zumzurul":"zumzur","zumzurule":"zumzur","zumzurului":"zumzur","zupaeste":"zupăi","zupaia":"zupăi","zupaiai":"zupăi","zupaiam":"zupăi","zupaiati":"zupăi","zupaiau":"zupăi","zupaiesc":"zupăi","zupaieste":"zupăi","zupaiesti":"zupăi","zupaii":"zupăi","zupaim":"zupăi","zupaind":"zupăi","zupaira":"zupăi","zupairam":"zupăi","zupairati":"zupăi","zupaise":"zupăi","zupaisem":"zupăi","zupaisera":"zupăi","zupaiseram":"zupăi","zupaiserati":"zupăi","zupaisesi":"zupăi","zupaisi":"zupăi","zupait":"zupăi","zupaiti":"zupăi","zupaitul":"zupăit","zupaitule":"zupăit","zupaitului":"zupăit","zupaituri":"zupăitură","zupaiturii":"zupăitură","zupaiturile":"zupăitură","zupaiturilor":"zupăitură","zupe":"zupă","zupei":"zupă","zupele":"zupă","zupelor":"zupă","zupisele":"zupișel","zupiselele":"zupișel","zupiselelor":"zupișel","zupiselul":"zupișel","zupiselule":"zupișel","zupiselului":"zupișel","zupuia":"zupui","zupuiai":"zupui","zupuiam":"zupui","zupuiati":"zupui","zupuiau":"zupui","zupuiesc":"zupui","zupuieste":"zupui","zupuiesti":"zupui","zupuii":"zupui","zupuim":"zupui","zupuind":"zupui","zupuira":"zupui","zupuiram":"zupui","zupuirati":"zupui","zupuise":"zupui","zupuisem":"zupui","zupuisera":"zupui","zupuiseram":"zupui","zupuiserati":"zupui","zupuisesi":"zupui","zupuisi":"zupui","zupuit":"zupui","zupuiti":"zupui","zuraia":"zurăi","zuraiai":"zurăi","zuraiam":"zurăi","zuraiati":"zurăi","zuraiau":"zurăi","zuraie":"zurăi","zuraii":"zurăi","zuraim":"zurăi","zuraind":"zurăi","zuraira":"zurăi","zurairam":"zurăi","zurairati":"zurăi","zuraise":"zurăi","zuraisem":"zurăi","zuraisera":"zurăi","zuraiseram":"zurăi","zuraiserati":"zurăi","zuraisesi":"zurăi","zuraisi":"zurăi","zurait":"zurăi","zuraiti":"zurăi","zuralia":"zuralie","zuraliei":"zuralie","zuralii":"zuralie","zuraliile":"zuralie","zuraliilor":"zuralie","zurbagia":"zurbagiu","zurbagie":"zurbagiu","zurbagii":"zurbagiu","zurbagiii":"zurbagiu","zurbagiile":"zurbagiu","zurbagiilor":"zurbagiu","zurbagiul":"zurbagiu","zurbagiuul":"zurbagiu","zurbagiuule":"zurbagiu","zurbagiuului":"zurbagiu","zurbalacul":"zurbalâc","zurbalacule":"zurbalâc","zurbalacului":"zurbalâc","zurbalacuri":"zurbalâc","zurbalacurile":"zurbalâc","zurbalacurilor":"zurbalâc","zurbalai":["zurbalâi","zurbalâu","zurbalăi","zurbalău"],"zurbalaii":["zurbalâii","zurbalâu","zurbalăii","zurbalău"],"zurbalailor":["zurbalâilor","zurbalâu","zurbalăilor","zurbalău"],"zurbalauul":["zurbalâuul","zurbalâu","zurbalăuul","zurbalău"],"zurbalauule":["zurbalâuule","zurbalâu","zurbalăuule","zurbalău"],"zurbalauului":["zurbalâuului","zurbalâu","zurbalăuului","zurbalău"],"zurbale":["zurbale","zurba","zurbale","zurbală"],"zurbalei":["zurbalei","zurba","zurbalei","zurbală"],"zurbalele":["zurbalele","zurba","zurbalele","zurbală"],"zurbalelor":["zurbalelor","zurba","zurbalelor","zurbală"],"zurbalnica":["zurbalnică","zurbalnic","zurbalnica","zurbalnic"],"zurbalnice":"zurbalnic","zurbalnicele":"zurbalnic","zurbalnici":"zurbalnic","zurbalnicii":"zurbalnic","zurbalnicul":"zurbalnic","zurbaua":"zurba","zurbave":"zurbavă","zurbavei":"zurbavă","zurbavele":"zurbavă","zurbavelor":"zurbavă","zurbe":"zurbă","zurbei":"zurbă","zurbele":"zurbă","zurbelor":"zurbă","zurgaitul":"zurgăit","zurgaitule":"zurgăit","zurgaitului":"zurgăit","zurgaituri":"zurgăit","zurgaiturile":"zurgăit","zurgaiturilor":"zurgăit","zurgalai":["zurgalăi","zurgalău","zurgălăi","zurgălău"],"zurgalaii":["zurgalăii","zurgalău","zurgălăii","zurgălău"],"zurgalailor":["zurgalăilor","zurgalău","zurgălăilor","zurgălău"],"zurgalauul":["zurgalăuul","zurgalău","zurgălăuul","zurgălău"],"zurgalauule":["zurgalăuule","zurgalău","zurgălăuule","zurgălău"],"zurgalauului":["zurgalăuului","zurgalău","zurgălăuului","zurgălău"],"zurnale":"zurna","zurnalei":"zurna","zurnaua":"zurna","zurnazeni":"zurnazen","zurnazenii":"zurnazen","zurnazenilor":"zurnazen","zurnazenul":"zurnazen","zurnazenule":"zurnazen","zurnazenului":"zurnazen","zuruirea":"zuruire","zuruiri":"zuruire","zuruirii":"zuruire","zuruirile":"zuruire","zuruirilor":"zuruire","zuuituri":"zuuitură","zuuiturii":"zuuitură","zuuiturile":"zuuitură","zuuiturilor":"zuuitură","zuvelci":"zuvelcă","zuvelcii":"zuvelcă","zuvelcile":"zuvelcă","zuvelcilor":"zuvelcă","zuzaia":"zuzăi","zuzaiai":"zuzăi","zuzaiam":"zuzăi","zuzaiati":"zuzăi","zuzaiau":"zuzăi","zuzaie":"zuzăi","zuzaii":"zuzăi","zuzaim":"zuzăi","zuzaind":"zuzăi","zuzaira":"zuzăi","zuzairam":"zuzăi","zuzairati":"zuzăi","zuzaise":"zuzăi","zuzaisem":"zuzăi","zuzaisera":"zuzăi","zuzaiseram":"zuzăi","zuzaiserati":"zuzăi","zuzaisesi":"zuzăi","zuzaisi":"zuzăi","zuzait":"zuzăi","zuzaiti":"zuzăi","zuzete":"zuzet","zuzetele":"zuzet","zuzetelor":"zuzet","zuzetul":"zuzet","zuzetule":"zuzet","zuzetului":"zuzet","zuzure":"zuzur","zuzurele":"zuzur","zuzurelor":"zuzur","zuzurul":"zuzur","zuzurule":"zuzur","zuzurului":"zuzur","zvacnea":"zvâcni","zvacneai":"zvâcni","zvacneam":"zvâcni","zvacneati":"zvâcni","zvacneau":"zvâcni","zvacneli":"zvâcneală","zvacnelii":"zvâcneală","zvacnelile":"zvâcneală","zvacnelilor":"zvâcneală","zvacnesc":"zvâcni","zvacneste":"zvâcni","zvacnesti":"zvâcni","zvacnete":"zvâcnet","zvacnetele":"zvâcnet","zvacnetelor":"zvâcnet","zvacnetul":"zvâcnet","zvacnetule":"zvâcnet","zvacnetului":"zvâcnet","zvacnii":"zvâcni","zvacnim":"zvâcni","zvacnind":"zvâcni","zvacnira":"zvâcni","zvacniram":"zvâcni","zvacnirati":"zvâcni","zvacnirea":"zvâcnire","zvacniri":"zvâcnire","zvacnirii":"zvâcnire","zvacnirile":"zvâcnire","zvacnirilor":"zvâcnire","zvacnise":"zvâcni","zvacnisem":"zvâcni","zvacnisera":"zvâcni","zvacniseram":"zvâcni","zvacniserati":"zvâcni","zvacnisesi":"zvâcni","zvacnisi":"zvâcni","zvacnit":"zvâcni","zvacniti":"zvâcni","zvacnitoare":"zvâcnitor","zvacnitoarea":"zvâcnitor","zvacnitoarele":"zvâcnitor","zvacnitori":"zvâcnitor","zvacnitorii":"zvâcnitor","zvacnitorul":"zvâcnitor","zvacnitul":"zvâcnit","zvacnitule":"zvâcnit","zvacnitului":"zvâcnit","zvacnituri":"zvâcnitură","zvacniturii":"zvâcnitură","zvacniturile":"zvâcnitură","zvacniturilor":"zvâcnitură","zvant":"zvânta","zvantai":"zvânta","zvantam":["zvântăm","zvânta","zvântam","zvânta"],"zvantand":"zvânta","zvantara":"zvânta","zvantaram":"zvânta","zvantarati":"zvânta","zvantarea":"zvântare","zvantari":"zvântare","zvantarii":"zvântare","zvantarile":"zvântare","zvantarilor":"zvântare","zvantase":"zvânta","zvantasem":"zvânta","zvantasera":"zvânta","zvantaseram":"zvânta","zvantaserati":"zvânta","zvantasesi":"zvânta","zvantasi":"zvânta","zvantat":"zvânta","zvantata":["zvântată","zvântat","zvântata","zvântat"],"zvantate":"zvântat","zvantatele":"zvântat","zvantati":["zvântați","zvânta","zvântați","zvântat"],"zvantatii":"zvântat","zvantatul":"zvântat","zvantau":"zvânta","zvanti":"zvânta","zvantur":"zvântura","zvanturai":"zvântura","zvanturam":["zvânturăm","zvântura","zvânturam","zvântura"],"zvanturand":"zvântura","zvanturara":"zvântura","zvanturaram":"zvântura","zvanturarati":"zvântura","zvanturase":"zvântura","zvanturasem":"zvântura","zvanturasera":"zvântura","zvanturaseram":"zvântura","zvanturaserati":"zvântura","zvanturasesi":"zvântura","zvanturasi":"zvântura","zvanturat":"zvântura","zvanturateca":["zvânturatecă","zvânturatec","zvânturateca","zvânturatec"],"zvanturatece":"zvânturatec","zvanturatecele":"zvânturatec","zvanturateci":"zvânturatec","zvanturatecii":"zvânturatec","zvanturatecul":"zvânturatec","zvanturati":"zvântura","zvanturau":"zvântura","zvanturi":"zvântura","zvapaiata":["zvăpăiată","zvăpăiat","zvăpăiata","zvăpăiat"],"zvapaiate":"zvăpăiat","zvapaiatele":"zvăpăiat","zvapaiati":"zvăpăiat","zvapaiatii":"zvăpăiat","zvapaiatul":"zvăpăiat","zvarcolaci":"zvârcolac","zvarcolacii":"zvârcolac","zvarcolacilor":"zvârcolac","zvarcolacul":"zvârcolac","zvarcolacule":"zvârcolac","zvarcolacului":"zvârcolac","zvarcolele":"zvârcoleală","zvarcolelei":"zvârcoleală","zvarcolelele":"zvârcoleală","zvarcolelelor":"zvârcoleală","zvarcoleli":"zvârcoleală","zvarcolirea":"zvârcolire","zvarcoliri":"zvârcolire","zvarcolirii":"zvârcolire","zvarcolirile":"zvârcolire","zvarcolirilor":"zvârcolire","zvarcolitul":"zvârcolit","zvarcolitule":"zvârcolit","zvarcolitului":"zvârcolit","zvarcolituri":"zvârcolitură","zvarcoliturii":"zvârcolitură","zvarcoliturile":"zvârcolitură","zvarcoliturilor":"zvârcolitură","zvarcolul":"zvârcol","zvarcolule":"zvârcol","zvarcolului":"zvârcol","zvarlea":"zvârli","zvarleai":"zvârli","zvarleam":"zvârli","zvarleati":"zvârli","zvarleau":"zvârli","zvarlesc":"zvârli","zvarleste":"zvârli","zvarlesti":"zvârli","zvarletul":"zvârlet","zvarletule":"zvârlet","zvarletului":"zvârlet","zvarlii":"zvârli","zvarlim":"zvârli","zvarlind":"zvârli","zvarlira":"zvârli","zvarliram":"zvârli","zvarlirati":"zvârli","zvarlirea":"zvârlire","zvarliri":"zvârlire","zvarlirii":"zvârlire","zvarlirile":"zvârlire","zvarlirilor":"zvârlire","zvarlise":"zvârli","zvarlisem":"zvârli","zvarlisera":"zvârli","zvarliseram":"zvârli","zvarliserati":"zvârli","zvarlisesi":"zvârli","zvarlisi":"zvârli","zvarlit":"zvârli","zvarlita":["zvârlită","zvârlit","zvârlita","zvârlit"],"zvarlite":"zvârlit","zvarlitele":"zvârlit","zvarliti":["zvârliți","zvârli","zvârliți","zvârlit"],"zvarlitii":"zvârlit","zvarlitul":"zvârlit","zvarliture":"zvârlitură","zvarliturei":"zvârlitură","zvarliturele":"zvârlitură","zvarliturelor":"zvârlitură","zvarlituri":"zvârlitură","zvarlugi":"zvârlugă","zvarlugii":"zvârlugă","zvarlugile":"zvârlugă","zvarlugilor":"zvârlugă","zvastici":"zvastică","zvasticii":"zvastică","zvasticile":"zvastică","zvasticilor":"zvastică","zvelta":["zveltă","zvelt","zvelta","zvelt"],"zvelte":"zvelt","zveltele":"zvelt","zveltetea":"zveltețe","zvelteti":"zveltețe","zveltetii":"zveltețe","zvelti":"zvelt","zveltii":"zvelt","zveltul":"zvelt","zvezde":"zveazdă","zvezdei":"zveazdă","zvezdele":"zveazdă","zvezdelor":"zveazdă","zviduiele":"zviduială","zviduielei":"zviduială","zviduielele":"zviduială","zviduielelor":"zviduială","zviduieli":"zviduială","zviduirea":"zviduire","zviduiri":"zviduire","zviduirii":"zviduire","zviduirile":"zviduire","zviduirilor":"zviduire","zvinduituri":"zvinduitură","zvinduiturii":"zvinduitură","zvinduiturile":"zvinduitură","zvinduiturilor":"zvinduitură","zvoane":"zvoană","zvoanei":"zvoană","zvoanele":"zvoană","zvoanelor":"zvoană","zvonari":"zvonar","zvonarii":"zvonar","zvonarilor":"zvonar","zvonarul":"zvonar","zvonarule":"zvonar","zvonarului":"zvonar","zvoncicul":"zvoncic","zvoncicule":"zvoncic","zvoncicului":"zvoncic","zvonea":"zvoni","zvoneai":"zvoni","zvoneam":"zvoni","zvoneati":"zvoni","zvoneau":"zvoni","zvonesc":"zvoni","zvoneste":"zvoni","zvonesti":"zvoni","zvonii":"zvoni","zvonim":"zvoni","zvonind":"zvoni","zvonira":"zvoni","zvoniram":"zvoni","zvonirati":"zvoni","zvonirea":"zvonire","zvoniri":"zvonire","zvonirii":"zvonire","zvonirile":"zvonire","zvonirilor":"zvonire","zvonise":"zvoni","zvonisem":"zvoni","zvonisera":"zvoni","zvoniseram":"zvoni","zvoniserati":"zvoni","zvonisesi":"zvoni","zvonisi":"zvoni","zvonisoare":"zvonișor","zvonisoarele":"zvonișor","zvonisoarelor":"zvonișor","zvonisorul":"zvonișor","zvonisorule":"zvonișor","zvonisorului":"zvonișor","zvoniste":"zvonistă","zvonistei":"zvonistă","zvonistele":"zvonistă","zvonistelor":"zvonistă","zvonisti":"zvonist","zvonistii":"zvonist","zvonistilor":"zvonist","zvonistul":"zvonist","zvonistule":"zvonist","zvonistului":"zvonist","zvonit":"zvoni","zvonite":"zvoniț","zvonitele":"zvoniț","zvonitelor":"zvoniț","zvoniti":"zvoni","zvonitul":"zvoniț","zvonitule":"zvoniț","zvonitului":"zvoniț","zvonul":"zvon","zvonule":"zvon","zvonului":"zvon","zvonuri":"zvon","zvonurile":"zvon","zvonurilor":"zvon","zvoracul":"zvorac","zvoracule":"zvorac","zvoracului":"zvorac","zvoracuri":"zvorac","zvoracurile":"zvorac","zvoracurilor":"zvorac"};
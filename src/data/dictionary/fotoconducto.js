@@ -0,0 +1 @@
+export default [{"word":"fotoconductor","pos":"adj","definitions":["photoconductive"],"forms":{"feminine-singular":"fotoconductoare","masculine-plural":"fotoconductori","feminine-neuter-plural":"fotoconductoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoconductor","error-unrecognized-form-feminine-indefinite-singular":"fotoconductoare","error-unrecognized-form-indefinite-masculine-plural":"fotoconductori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoconductoare","definite-error-unrecognized-form-masculine-neuter-singular":"fotoconductorul","definite-error-unrecognized-form-feminine-singular":"fotoconductoarea","definite-error-unrecognized-form-masculine-plural":"fotoconductorii","definite-error-unrecognized-form-feminine-neuter-plural":"fotoconductoarele"}},{"word":"fotocopia","pos":"verb","definitions":["to photocopy"],"forms":{"canonical":"a fotocopia 1st conjugation","present-singular-third-person":"fotocopiază","participle-past":"fotocopiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fotocopia","gerund":"fotocopiind","first-person-indicative-present-singular":"fotocopiez","indicative-present-second-person-singular":"fotocopiezi","indicative-present-singular-third-person":"fotocopiază","first-person-indicative-plural-present":"fotocopiem","indicative-plural-present-second-person":"fotocopiați","indicative-plural-present-third-person":"fotocopiază","first-person-imperfect-indicative-singular":"fotocopiam","imperfect-indicative-second-person-singular":"fotocopiai","imperfect-indicative-singular-third-person":"fotocopia","first-person-imperfect-indicative-plural":"fotocopiam","imperfect-indicative-plural-second-person":"fotocopiați","imperfect-indicative-plural-third-person":"fotocopiau","first-person-indicative-perfect-singular":"fotocopiai","indicative-perfect-second-person-singular":"fotocopiași","indicative-perfect-singular-third-person":"fotocopie","first-person-indicative-perfect-plural":"fotocopiarăm","indicative-perfect-plural-second-person":"fotocopiarăți","indicative-perfect-plural-third-person":"fotocopiară","first-person-indicative-pluperfect-singular":"fotocopiasem","indicative-pluperfect-second-person-singular":"fotocopiaseși","indicative-pluperfect-singular-third-person":"fotocopiase","first-person-indicative-pluperfect-plural":"fotocopiaserăm","indicative-pluperfect-plural-second-person":"fotocopiaserăți","indicative-pluperfect-plural-third-person":"fotocopiaseră","first-person-present-singular-subjunctive":"să fotocopiez","present-second-person-singular-subjunctive":"să fotocopiezi","present-singular-subjunctive-third-person":"să fotocopieze","first-person-plural-present-subjunctive":"să fotocopiem","plural-present-second-person-subjunctive":"să fotocopiați","plural-present-subjunctive-third-person":"să fotocopieze","imperative-second-person-singular":"fotocopiază","imperative-plural-second-person":"fotocopiați","imperative-negative-second-person-singular":"nu fotocopia","imperative-negative-plural-second-person":"nu fotocopiați"}},{"word":"fotocopiator","pos":"noun","definitions":["photocopier"],"forms":{"plural":"fotocopiatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocopiator","accusative-definite-nominative-singular":"fotocopiatorul","accusative-indefinite-nominative-plural":"fotocopiatoare","accusative-definite-nominative-plural":"fotocopiatoarele","dative-genitive-indefinite-singular":"fotocopiator","dative-definite-genitive-singular":"fotocopiatorului","dative-genitive-indefinite-plural":"fotocopiatoare","dative-definite-genitive-plural":"fotocopiatoarelor","singular-vocative":"fotocopiatorule","plural-vocative":"fotocopiatoarelor"}},{"word":"fotocopie","pos":"noun","definitions":["photocopy"],"forms":{"plural":"fotocopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotocopie","accusative-definite-nominative-singular":"fotocopia","accusative-indefinite-nominative-plural":"fotocopii","accusative-definite-nominative-plural":"fotocopiile","dative-genitive-indefinite-singular":"fotocopii","dative-definite-genitive-singular":"fotocopiei","dative-genitive-indefinite-plural":"fotocopii","dative-definite-genitive-plural":"fotocopiilor","singular-vocative":"fotocopie","plural-vocative":"fotocopiilor"}},{"word":"fotocopier","pos":"noun","definitions":["photocopier"],"forms":{"plural":"fotocopiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocopier","accusative-definite-nominative-singular":"fotocopierul","accusative-indefinite-nominative-plural":"fotocopiere","accusative-definite-nominative-plural":"fotocopierele","dative-genitive-indefinite-singular":"fotocopier","dative-definite-genitive-singular":"fotocopierului","dative-genitive-indefinite-plural":"fotocopiere","dative-definite-genitive-plural":"fotocopierelor","singular-vocative":"fotocopierule","plural-vocative":"fotocopierelor"}},{"word":"fotocrom","pos":"adj","definitions":["photochrome"],"forms":{"feminine-singular":"fotocromă","masculine-plural":"fotocromi","feminine-neuter-plural":"fotocrome","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotocrom","error-unrecognized-form-feminine-indefinite-singular":"fotocromă","error-unrecognized-form-indefinite-masculine-plural":"fotocromi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotocrome","definite-error-unrecognized-form-masculine-neuter-singular":"fotocromul","definite-error-unrecognized-form-feminine-singular":"fotocroma","definite-error-unrecognized-form-masculine-plural":"fotocromii","definite-error-unrecognized-form-feminine-neuter-plural":"fotocromele"}},{"word":"fotocromatic","pos":"adj","definitions":["photochromic"],"forms":{"feminine-singular":"fotocromatică","masculine-plural":"fotocromatici","feminine-neuter-plural":"fotocromatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotocromatic","error-unrecognized-form-feminine-indefinite-singular":"fotocromatică","error-unrecognized-form-indefinite-masculine-plural":"fotocromatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotocromatice","definite-error-unrecognized-form-masculine-neuter-singular":"fotocromaticul","definite-error-unrecognized-form-feminine-singular":"fotocromatica","definite-error-unrecognized-form-masculine-plural":"fotocromaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fotocromaticele"}},{"word":"fotocromie","pos":"noun","definitions":["photochromy"],"forms":{"plural":"fotocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotocromie","accusative-definite-nominative-singular":"fotocromia","accusative-indefinite-nominative-plural":"fotocromii","accusative-definite-nominative-plural":"fotocromiile","dative-genitive-indefinite-singular":"fotocromii","dative-definite-genitive-singular":"fotocromiei","dative-genitive-indefinite-plural":"fotocromii","dative-definite-genitive-plural":"fotocromiilor","singular-vocative":"fotocromie","plural-vocative":"fotocromiilor"}},{"word":"fotocromografie","pos":"noun","definitions":["photochromography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotocromografie","accusative-definite-nominative-singular":"fotocromografia","accusative-indefinite-nominative-plural":"fotocromografii","accusative-definite-nominative-plural":"fotocromografiile","dative-genitive-indefinite-singular":"fotocromografii","dative-definite-genitive-singular":"fotocromografiei","dative-genitive-indefinite-plural":"fotocromografii","dative-definite-genitive-plural":"fotocromografiilor","singular-vocative":"fotocromografie","plural-vocative":"fotocromografiilor"}},{"word":"fotocronograf","pos":"noun","definitions":["photochronograph"],"forms":{"plural":"fotocronografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocronograf","accusative-definite-nominative-singular":"fotocronograful","accusative-indefinite-nominative-plural":"fotocronografe","accusative-definite-nominative-plural":"fotocronografele","dative-genitive-indefinite-singular":"fotocronograf","dative-definite-genitive-singular":"fotocronografului","dative-genitive-indefinite-plural":"fotocronografe","dative-definite-genitive-plural":"fotocronografelor","singular-vocative":"fotocronografule","plural-vocative":"fotocronografelor"}},{"word":"fotoculegere","pos":"noun","definitions":["photocomposition, phototypesetting"],"forms":{"plural":"fotoculegeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoculegere","accusative-definite-nominative-singular":"fotoculegerea","accusative-indefinite-nominative-plural":"fotoculegeri","accusative-definite-nominative-plural":"fotoculegerile","dative-genitive-indefinite-singular":"fotoculegeri","dative-definite-genitive-singular":"fotoculegerii","dative-genitive-indefinite-plural":"fotoculegeri","dative-definite-genitive-plural":"fotoculegerilor","singular-vocative":"fotoculegere","plural-vocative":"fotoculegerilor"}},{"word":"fotocuplor","pos":"noun","definitions":["photocoupler"],"forms":{"plural":"fotocuploare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotocuplor","accusative-definite-nominative-singular":"fotocuplorul","accusative-indefinite-nominative-plural":"fotocuplore","accusative-definite-nominative-plural":"fotocuplorele","dative-genitive-indefinite-singular":"fotocuplor","dative-definite-genitive-singular":"fotocuplorului","dative-genitive-indefinite-plural":"fotocuplore","dative-definite-genitive-plural":"fotocuplorelor","singular-vocative":"fotocuplorule","plural-vocative":"fotocuplorelor"}},{"word":"fotodermatoză","pos":"noun","definitions":["photodermatosis"],"forms":{"plural":"fotodermatoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotodermatoză","accusative-definite-nominative-singular":"fotodermatoza","accusative-indefinite-nominative-plural":"fotodermatoze","accusative-definite-nominative-plural":"fotodermatozele","dative-genitive-indefinite-singular":"fotodermatoze","dative-definite-genitive-singular":"fotodermatozei","dative-genitive-indefinite-plural":"fotodermatoze","dative-definite-genitive-plural":"fotodermatozelor","singular-vocative":"fotodermatoză","plural-vocative":"fotodermatozelor"}},{"word":"fotodezintegrare","pos":"noun","definitions":["photodisintegration"],"forms":{"plural":"fotodezintegrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotodezintegrare","accusative-definite-nominative-singular":"fotodezintegrarea","accusative-indefinite-nominative-plural":"fotodezintegrari","accusative-definite-nominative-plural":"fotodezintegrarile","dative-genitive-indefinite-singular":"fotodezintegrari","dative-definite-genitive-singular":"fotodezintegrarii","dative-genitive-indefinite-plural":"fotodezintegrari","dative-definite-genitive-plural":"fotodezintegrarilor","singular-vocative":"fotodezintegrare","plural-vocative":"fotodezintegrarilor"}},{"word":"fotodiodă","pos":"noun","definitions":["photodiode"],"forms":{"plural":"fotodiode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotodiodă","accusative-definite-nominative-singular":"fotodioda","accusative-indefinite-nominative-plural":"fotodiode","accusative-definite-nominative-plural":"fotodiodele","dative-genitive-indefinite-singular":"fotodiode","dative-definite-genitive-singular":"fotodiodei","dative-genitive-indefinite-plural":"fotodiode","dative-definite-genitive-plural":"fotodiodelor","singular-vocative":"fotodiodă","plural-vocative":"fotodiodelor"}},{"word":"fotodocument","pos":"noun","definitions":["photodocument"],"forms":{"plural":"fotodocumente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotodocument","accusative-definite-nominative-singular":"fotodocumentul","accusative-indefinite-nominative-plural":"fotodocumente","accusative-definite-nominative-plural":"fotodocumentele","dative-genitive-indefinite-singular":"fotodocument","dative-definite-genitive-singular":"fotodocumentului","dative-genitive-indefinite-plural":"fotodocumente","dative-definite-genitive-plural":"fotodocumentelor","singular-vocative":"fotodocumentule","plural-vocative":"fotodocumentelor"}},{"word":"fotoelasticimetrie","pos":"noun","definitions":["photo-elasticimetry"],"forms":{"plural":"fotoelasticimetrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotoelasticimetrie","accusative-definite-nominative-singular":"fotoelasticimetria","accusative-indefinite-nominative-plural":"fotoelasticimetrii","accusative-definite-nominative-plural":"fotoelasticimetriile","dative-genitive-indefinite-singular":"fotoelasticimetrii","dative-definite-genitive-singular":"fotoelasticimetriei","dative-genitive-indefinite-plural":"fotoelasticimetrii","dative-definite-genitive-plural":"fotoelasticimetriilor","singular-vocative":"fotoelasticimetrie","plural-vocative":"fotoelasticimetriilor"}},{"word":"fotoelasticimetru","pos":"noun","definitions":["photoelasticimeter"],"forms":{"plural":"fotoelasticimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoelasticimetru","accusative-definite-nominative-singular":"fotoelasticimetrul","accusative-indefinite-nominative-plural":"fotoelasticimetre","accusative-definite-nominative-plural":"fotoelasticimetrele","dative-genitive-indefinite-singular":"fotoelasticimetru","dative-definite-genitive-singular":"fotoelasticimetrului","dative-genitive-indefinite-plural":"fotoelasticimetre","dative-definite-genitive-plural":"fotoelasticimetrelor","singular-vocative":"fotoelasticimetrule","plural-vocative":"fotoelasticimetrelor"}},{"word":"fotoelasticitate","pos":"noun","definitions":["photoelasticity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoelasticitate","accusative-definite-nominative-singular":"fotoelasticitatea","accusative-indefinite-nominative-plural":"fotoelasticități","accusative-definite-nominative-plural":"fotoelasticitățile","dative-genitive-indefinite-singular":"fotoelasticități","dative-definite-genitive-singular":"fotoelasticității","dative-genitive-indefinite-plural":"fotoelasticități","dative-definite-genitive-plural":"fotoelasticităților","singular-vocative":"fotoelasticitate","plural-vocative":"fotoelasticităților"}},{"word":"fotoelectric","pos":"adj","definitions":["photoelectric"],"forms":{"feminine-singular":"fotoelectrică","masculine-plural":"fotoelectrici","feminine-neuter-plural":"fotoelectrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoelectric","error-unrecognized-form-feminine-indefinite-singular":"fotoelectrică","error-unrecognized-form-indefinite-masculine-plural":"fotoelectrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoelectrice","definite-error-unrecognized-form-masculine-neuter-singular":"fotoelectricul","definite-error-unrecognized-form-feminine-singular":"fotoelectrica","definite-error-unrecognized-form-masculine-plural":"fotoelectricii","definite-error-unrecognized-form-feminine-neuter-plural":"fotoelectricele"}},{"word":"fotoelectricitate","pos":"noun","definitions":["photoelectricity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoelectricitate","accusative-definite-nominative-singular":"fotoelectricitatea","accusative-indefinite-nominative-plural":"fotoelectricități","accusative-definite-nominative-plural":"fotoelectricitățile","dative-genitive-indefinite-singular":"fotoelectricități","dative-definite-genitive-singular":"fotoelectricității","dative-genitive-indefinite-plural":"fotoelectricități","dative-definite-genitive-plural":"fotoelectricităților","singular-vocative":"fotoelectricitate","plural-vocative":"fotoelectricităților"}},{"word":"fotoelectron","pos":"noun","definitions":["photoelectron"],"forms":{"plural":"fotoelectroni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotoelectron","accusative-definite-nominative-singular":"fotoelectronul","accusative-indefinite-nominative-plural":"fotoelectroni","accusative-definite-nominative-plural":"fotoelectronii","dative-genitive-indefinite-singular":"fotoelectron","dative-definite-genitive-singular":"fotoelectronului","dative-genitive-indefinite-plural":"fotoelectroni","dative-definite-genitive-plural":"fotoelectronilor","singular-vocative":"fotoelectronule","plural-vocative":"fotoelectronilor"}},{"word":"fotoelement","pos":"noun","definitions":["photocell"],"forms":{"plural":"fotoelemente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoelement","accusative-definite-nominative-singular":"fotoelementul","accusative-indefinite-nominative-plural":"fotoelemente","accusative-definite-nominative-plural":"fotoelementele","dative-genitive-indefinite-singular":"fotoelement","dative-definite-genitive-singular":"fotoelementului","dative-genitive-indefinite-plural":"fotoelemente","dative-definite-genitive-plural":"fotoelementelor","singular-vocative":"fotoelementule","plural-vocative":"fotoelementelor"}},{"word":"fotoemisie","pos":"noun","definitions":["photoemission"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotoemisie","accusative-definite-nominative-singular":"fotoemisia","accusative-indefinite-nominative-plural":"fotoemisii","accusative-definite-nominative-plural":"fotoemisiile","dative-genitive-indefinite-singular":"fotoemisii","dative-definite-genitive-singular":"fotoemisiei","dative-genitive-indefinite-plural":"fotoemisii","dative-definite-genitive-plural":"fotoemisiilor","singular-vocative":"fotoemisie","plural-vocative":"fotoemisiilor"}},{"word":"fotoemisiune","pos":"noun","definitions":["alternative form of fotoemisie"],"forms":{"plural":"fotoemisiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoemisiune","accusative-definite-nominative-singular":"fotoemisiunea","accusative-indefinite-nominative-plural":"fotoemisiuni","accusative-definite-nominative-plural":"fotoemisiunile","dative-genitive-indefinite-singular":"fotoemisiuni","dative-definite-genitive-singular":"fotoemisiunii","dative-genitive-indefinite-plural":"fotoemisiuni","dative-definite-genitive-plural":"fotoemisiunilor","singular-vocative":"fotoemisiune","plural-vocative":"fotoemisiunilor"}},{"word":"fotoenergetică","pos":"noun","definitions":["photoenergetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoenergetică","accusative-definite-nominative-singular":"fotoenergetica","accusative-indefinite-nominative-plural":"fotoenergetice","accusative-definite-nominative-plural":"fotoenergeticele","dative-genitive-indefinite-singular":"fotoenergetice","dative-definite-genitive-singular":"fotoenergeticei","dative-genitive-indefinite-plural":"fotoenergetice","dative-definite-genitive-plural":"fotoenergeticelor","singular-vocative":"fotoenergetică","plural-vocative":"fotoenergeticelor"}},{"word":"fotofisiune","pos":"noun","definitions":["photofission"],"forms":{"plural":"fotofisiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotofisiune","accusative-definite-nominative-singular":"fotofisiunea","accusative-indefinite-nominative-plural":"fotofisiuni","accusative-definite-nominative-plural":"fotofisiunile","dative-genitive-indefinite-singular":"fotofisiuni","dative-definite-genitive-singular":"fotofisiunii","dative-genitive-indefinite-plural":"fotofisiuni","dative-definite-genitive-plural":"fotofisiunilor","singular-vocative":"fotofisiune","plural-vocative":"fotofisiunilor"}},{"word":"fotofob","pos":"adj","definitions":["photophobic"],"forms":{"feminine-singular":"fotofobă","masculine-plural":"fotofobi","feminine-neuter-plural":"fotofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotofob","error-unrecognized-form-feminine-indefinite-singular":"fotofobă","error-unrecognized-form-indefinite-masculine-plural":"fotofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotofobe","definite-error-unrecognized-form-masculine-neuter-singular":"fotofobul","definite-error-unrecognized-form-feminine-singular":"fotofoba","definite-error-unrecognized-form-masculine-plural":"fotofobii","definite-error-unrecognized-form-feminine-neuter-plural":"fotofobele"}},{"word":"fotofobă","pos":"noun","definitions":["female equivalent of fotofob"],"forms":{"plural":"fotofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotofobă","accusative-definite-nominative-singular":"fotofoba","accusative-indefinite-nominative-plural":"fotofobe","accusative-definite-nominative-plural":"fotofobele","dative-genitive-indefinite-singular":"fotofobe","dative-definite-genitive-singular":"fotofobei","dative-genitive-indefinite-plural":"fotofobe","dative-definite-genitive-plural":"fotofobelor","singular-vocative":"fotofobă","plural-vocative":"fotofobelor"}},{"word":"fotofobie","pos":"noun","definitions":["photophobia"],"forms":{"plural":"fotofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotofobie","accusative-definite-nominative-singular":"fotofobia","accusative-indefinite-nominative-plural":"fotofobii","accusative-definite-nominative-plural":"fotofobiile","dative-genitive-indefinite-singular":"fotofobii","dative-definite-genitive-singular":"fotofobiei","dative-genitive-indefinite-plural":"fotofobii","dative-definite-genitive-plural":"fotofobiilor","singular-vocative":"fotofobie","plural-vocative":"fotofobiilor"}},{"word":"fotofon","pos":"noun","definitions":["photophone"],"forms":{"plural":"fotofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotofon","accusative-definite-nominative-singular":"fotofonul","accusative-indefinite-nominative-plural":"fotofoane","accusative-definite-nominative-plural":"fotofoanele","dative-genitive-indefinite-singular":"fotofon","dative-definite-genitive-singular":"fotofonului","dative-genitive-indefinite-plural":"fotofoane","dative-definite-genitive-plural":"fotofoanelor","singular-vocative":"fotofonule","plural-vocative":"fotofoanelor"}},{"word":"fotofonie","pos":"noun","definitions":["photophony"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotofonie","accusative-definite-nominative-singular":"fotofonia","accusative-indefinite-nominative-plural":"fotofonii","accusative-definite-nominative-plural":"fotofoniile","dative-genitive-indefinite-singular":"fotofonii","dative-definite-genitive-singular":"fotofoniei","dative-genitive-indefinite-plural":"fotofonii","dative-definite-genitive-plural":"fotofoniilor","singular-vocative":"fotofonie","plural-vocative":"fotofoniilor"}},{"word":"fotoforeză","pos":"noun","definitions":["photophoresis"],"forms":{"plural":"fotoforeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoforeză","accusative-definite-nominative-singular":"fotoforeza","accusative-indefinite-nominative-plural":"fotoforeze","accusative-definite-nominative-plural":"fotoforezele","dative-genitive-indefinite-singular":"fotoforeze","dative-definite-genitive-singular":"fotoforezei","dative-genitive-indefinite-plural":"fotoforeze","dative-definite-genitive-plural":"fotoforezelor","singular-vocative":"fotoforeză","plural-vocative":"fotoforezelor"}},{"word":"fotogen","pos":"adj","definitions":["photogenic"],"forms":{"feminine-singular":"fotogenă","masculine-plural":"fotogeni","feminine-neuter-plural":"fotogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotogen","error-unrecognized-form-feminine-indefinite-singular":"fotogenă","error-unrecognized-form-indefinite-masculine-plural":"fotogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotogene","definite-error-unrecognized-form-masculine-neuter-singular":"fotogenul","definite-error-unrecognized-form-feminine-singular":"fotogena","definite-error-unrecognized-form-masculine-plural":"fotogenii","definite-error-unrecognized-form-feminine-neuter-plural":"fotogenele"}},{"word":"fotogenic","pos":"adj","definitions":["photogenic"],"forms":{"feminine-singular":"fotogenică","masculine-plural":"fotogenici","feminine-neuter-plural":"fotogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotogenic","error-unrecognized-form-feminine-indefinite-singular":"fotogenică","error-unrecognized-form-indefinite-masculine-plural":"fotogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotogenice","definite-error-unrecognized-form-masculine-neuter-singular":"fotogenicul","definite-error-unrecognized-form-feminine-singular":"fotogenica","definite-error-unrecognized-form-masculine-plural":"fotogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"fotogenicele"}},{"word":"fotogenie","pos":"noun","definitions":["photogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fotogenie","accusative-definite-nominative":"fotogenia","dative-genitive-indefinite":"fotogenii","dative-definite-genitive":"fotogeniei","vocative":"fotogenie"}},{"word":"fotoghin","pos":"noun","definitions":["photogen"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fotoghin","accusative-definite-nominative":"fotoghinul","dative-genitive-indefinite":"fotoghin","dative-definite-genitive":"fotoghinului","vocative":"fotoghinule"}},{"word":"fotogoniometru","pos":"noun","definitions":["photogoniometer"],"forms":{"plural":"fotogoniometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotogoniometru","accusative-definite-nominative-singular":"fotogoniometruul","accusative-indefinite-nominative-plural":"fotogoniometre","accusative-definite-nominative-plural":"fotogoniometrele","dative-genitive-indefinite-singular":"fotogoniometru","dative-definite-genitive-singular":"fotogoniometruului","dative-genitive-indefinite-plural":"fotogoniometre","dative-definite-genitive-plural":"fotogoniometrelor","singular-vocative":"fotogoniometruule","plural-vocative":"fotogoniometrelor"}},{"word":"fotograf","pos":"noun","definitions":["a photographer"],"forms":{"plural":"fotografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotograf","accusative-definite-nominative-singular":"fotograful","accusative-indefinite-nominative-plural":"fotografi","accusative-definite-nominative-plural":"fotografii","dative-genitive-indefinite-singular":"fotograf","dative-definite-genitive-singular":"fotografului","dative-genitive-indefinite-plural":"fotografi","dative-definite-genitive-plural":"fotografilor","singular-vocative":"fotografule","plural-vocative":"fotografilor"}},{"word":"fotografă","pos":"noun","definitions":["female equivalent of fotograf"],"forms":{"plural":"fotografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotografă","accusative-definite-nominative-singular":"fotografa","accusative-indefinite-nominative-plural":"fotografe","accusative-definite-nominative-plural":"fotografele","dative-genitive-indefinite-singular":"fotografe","dative-definite-genitive-singular":"fotografei","dative-genitive-indefinite-plural":"fotografe","dative-definite-genitive-plural":"fotografelor","singular-vocative":"fotografă","plural-vocative":"fotografelor"}},{"word":"fotografi","pos":"noun","definitions":["indefinite plural of fotograf"],"pronunciation":"[fotoˈɡrafʲ]","gender":"m"},{"word":"fotografia","pos":"verb","definitions":["to photograph; to take a photograph"],"forms":{"canonical":"a fotografia 1st conjugation","present-singular-third-person":"fotografiază","participle-past":"fotografiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fotografia","gerund":"fotografiind","first-person-indicative-present-singular":"fotografiez","indicative-present-second-person-singular":"fotografiezi","indicative-present-singular-third-person":"fotografiază","first-person-indicative-plural-present":"fotografiem","indicative-plural-present-second-person":"fotografiați","indicative-plural-present-third-person":"fotografiază","first-person-imperfect-indicative-singular":"fotografiam","imperfect-indicative-second-person-singular":"fotografiai","imperfect-indicative-singular-third-person":"fotografia","first-person-imperfect-indicative-plural":"fotografiam","imperfect-indicative-plural-second-person":"fotografiați","imperfect-indicative-plural-third-person":"fotografiau","first-person-indicative-perfect-singular":"fotografiai","indicative-perfect-second-person-singular":"fotografiași","indicative-perfect-singular-third-person":"fotografie","first-person-indicative-perfect-plural":"fotografiarăm","indicative-perfect-plural-second-person":"fotografiarăți","indicative-perfect-plural-third-person":"fotografiară","first-person-indicative-pluperfect-singular":"fotografiasem","indicative-pluperfect-second-person-singular":"fotografiaseși","indicative-pluperfect-singular-third-person":"fotografiase","first-person-indicative-pluperfect-plural":"fotografiaserăm","indicative-pluperfect-plural-second-person":"fotografiaserăți","indicative-pluperfect-plural-third-person":"fotografiaseră","first-person-present-singular-subjunctive":"să fotografiez","present-second-person-singular-subjunctive":"să fotografiezi","present-singular-subjunctive-third-person":"să fotografieze","first-person-plural-present-subjunctive":"să fotografiem","plural-present-second-person-subjunctive":"să fotografiați","plural-present-subjunctive-third-person":"să fotografieze","imperative-second-person-singular":"fotografiază","imperative-plural-second-person":"fotografiați","imperative-negative-second-person-singular":"nu fotografia","imperative-negative-plural-second-person":"nu fotografiați","alternative":"фотография"}},{"word":"fotografia","pos":"noun","definitions":["definite nominative/accusative singular of fotografie"],"gender":"f","forms":{"alternative":"фотография"}},{"word":"fotografiat","pos":"noun","definitions":["photographed"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fotografiat","accusative-definite-nominative":"fotografiatul","dative-genitive-indefinite":"fotografiat","dative-definite-genitive":"fotografiatului","vocative":"fotografiatule"}},{"word":"fotografiat","pos":"verb","definitions":["past participle of fotografia"],"forms":{"participle-past":"of fotografia"}},{"word":"fotografic","pos":"adj","definitions":["photographic"],"forms":{"feminine-singular":"fotografică","masculine-plural":"fotografici","feminine-neuter-plural":"fotografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotografic","error-unrecognized-form-feminine-indefinite-singular":"fotografică","error-unrecognized-form-indefinite-masculine-plural":"fotografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotografice","definite-error-unrecognized-form-masculine-neuter-singular":"fotograficul","definite-error-unrecognized-form-feminine-singular":"fotografica","definite-error-unrecognized-form-masculine-plural":"fotograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fotograficele"}},{"word":"fotografica","pos":"adj","definitions":["definite nominative/accusative feminine singular of fotografic"],"pronunciation":"/fo.toˈɡra.fi.ka/","gender":"f-s","forms":{"alternative":"фотографика"}},{"word":"fotografică","pos":"adj","definitions":["nominative/accusative feminine singular of fotografic"],"pronunciation":"/fo.toˈɡra.fi.kə/","gender":"f-s","forms":{"alternative":"фотографикэ"}},{"word":"fotografici","pos":"adj","definitions":["nominative/accusative masculine plural of geografic"],"gender":"m-p"},{"word":"fotografie","pos":"noun","definitions":["photography","photograph"],"forms":{"plural":"fotografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotografie","accusative-definite-nominative-singular":"fotografia","accusative-indefinite-nominative-plural":"fotografii","accusative-definite-nominative-plural":"fotografiile","dative-genitive-indefinite-singular":"fotografii","dative-definite-genitive-singular":"fotografiei","dative-genitive-indefinite-plural":"fotografii","dative-definite-genitive-plural":"fotografiilor","singular-vocative":"fotografie","plural-vocative":"fotografiilor","alternative":"фотографие"}},{"word":"fotografie","pos":"verb","definitions":["third-person singular simple perfect indicative of fotografia"],"forms":{"alternative":"фотографие"}},{"word":"fotografiere","pos":"noun","definitions":["photo shooting"],"forms":{"plural":"fotografieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotografiere","accusative-definite-nominative-singular":"fotografierea","accusative-indefinite-nominative-plural":"fotografieri","accusative-definite-nominative-plural":"fotografierile","dative-genitive-indefinite-singular":"fotografieri","dative-definite-genitive-singular":"fotografierii","dative-genitive-indefinite-plural":"fotografieri","dative-definite-genitive-plural":"fotografierilor","singular-vocative":"fotografiere","plural-vocative":"fotografierilor"}},{"word":"fotografii","pos":"noun","definitions":["definite nominative/accusative plural of fotograf"],"pronunciation":"/fo.toˈɡra.fij/","gender":"m"},{"word":"fotografii","pos":"noun","definitions":["inflection of fotografie:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"/fo.to.ɡraˈfij/","gender":"f"},{"word":"fotogramă","pos":"noun","definitions":["photogram"],"forms":{"plural":"fotograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotogramă","accusative-definite-nominative-singular":"fotograma","accusative-indefinite-nominative-plural":"fotograme","accusative-definite-nominative-plural":"fotogramele","dative-genitive-indefinite-singular":"fotograme","dative-definite-genitive-singular":"fotogramei","dative-genitive-indefinite-plural":"fotograme","dative-definite-genitive-plural":"fotogramelor","singular-vocative":"fotogramă","plural-vocative":"fotogramelor"}},{"word":"fotogrammetric","pos":"adj","definitions":["photogrammetric"],"forms":{"feminine-singular":"fotogrammetrică","masculine-plural":"fotogrammetrici","feminine-neuter-plural":"fotogrammetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotogrammetric","error-unrecognized-form-feminine-indefinite-singular":"fotogrammetrică","error-unrecognized-form-indefinite-masculine-plural":"fotogrammetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotogrammetrice","definite-error-unrecognized-form-masculine-neuter-singular":"fotogrammetricul","definite-error-unrecognized-form-feminine-singular":"fotogrammetrica","definite-error-unrecognized-form-masculine-plural":"fotogrammetricii","definite-error-unrecognized-form-feminine-neuter-plural":"fotogrammetricele"}},{"word":"fotogrammetrie","pos":"noun","definitions":["photogrammetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fotogrammetrie","accusative-definite-nominative":"fotogrammetria","dative-genitive-indefinite":"fotogrammetrii","dative-definite-genitive":"fotogrammetriei","vocative":"fotogrammetrie"}},{"word":"fotogrammetrist","pos":"noun","definitions":["photogrammetrist"],"forms":{"plural":"fotogrammetriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotogrammetrist","accusative-definite-nominative-singular":"fotogrammetristul","accusative-indefinite-nominative-plural":"fotogrammetriști","accusative-definite-nominative-plural":"fotogrammetriștii","dative-genitive-indefinite-singular":"fotogrammetrist","dative-definite-genitive-singular":"fotogrammetristului","dative-genitive-indefinite-plural":"fotogrammetriști","dative-definite-genitive-plural":"fotogrammetriștilor","singular-vocative":"fotogrammetristule","plural-vocative":"fotogrammetriștilor"}},{"word":"fotogrammetristă","pos":"noun","definitions":["female equivalent of fotogrammetrist"],"forms":{"plural":"fotogrammetriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotogrammetristă","accusative-definite-nominative-singular":"fotogrammetrista","accusative-indefinite-nominative-plural":"fotogrammetriste","accusative-definite-nominative-plural":"fotogrammetristele","dative-genitive-indefinite-singular":"fotogrammetriste","dative-definite-genitive-singular":"fotogrammetristei","dative-genitive-indefinite-plural":"fotogrammetriste","dative-definite-genitive-plural":"fotogrammetristelor","singular-vocative":"fotogrammetristă","plural-vocative":"fotogrammetristelor"}},{"word":"fotogrammetru","pos":"noun","definitions":["photogrammeter"],"forms":{"plural":"fotogrammetri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotogrammetru","accusative-definite-nominative-singular":"fotogrammetruul","accusative-indefinite-nominative-plural":"fotogrammetri","accusative-definite-nominative-plural":"fotogrammetrii","dative-genitive-indefinite-singular":"fotogrammetru","dative-definite-genitive-singular":"fotogrammetruului","dative-genitive-indefinite-plural":"fotogrammetri","dative-definite-genitive-plural":"fotogrammetrilor","singular-vocative":"fotogrammetruule","plural-vocative":"fotogrammetrilor"}},{"word":"fotogravor","pos":"noun","definitions":["photoengraver"],"forms":{"plural":"fotogravori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotogravor","accusative-definite-nominative-singular":"fotogravorul","accusative-indefinite-nominative-plural":"fotogravori","accusative-definite-nominative-plural":"fotogravorii","dative-genitive-indefinite-singular":"fotogravor","dative-definite-genitive-singular":"fotogravorului","dative-genitive-indefinite-plural":"fotogravori","dative-definite-genitive-plural":"fotogravorilor","singular-vocative":"fotogravorule","plural-vocative":"fotogravorilor"}},{"word":"fotogravură","pos":"noun","definitions":["photogravure"],"forms":{"plural":"fotogravuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fotogravură","accusative-definite-nominative-singular":"fotogravura","accusative-indefinite-nominative-plural":"fotogravuri","accusative-definite-nominative-plural":"fotogravurile","dative-genitive-indefinite-singular":"fotogravuri","dative-definite-genitive-singular":"fotogravurii","dative-genitive-indefinite-plural":"fotogravuri","dative-definite-genitive-plural":"fotogravurilor","singular-vocative":"fotogravură","plural-vocative":"fotogravurilor"}},{"word":"fotohartă","pos":"noun","definitions":["photomap"],"forms":{"plural":"fotohărți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotohartă","accusative-definite-nominative-singular":"fotoharta","accusative-indefinite-nominative-plural":"fotohărțe","accusative-definite-nominative-plural":"fotohărțele","dative-genitive-indefinite-singular":"fotohărțe","dative-definite-genitive-singular":"fotohărței","dative-genitive-indefinite-plural":"fotohărțe","dative-definite-genitive-plural":"fotohărțelor","singular-vocative":"fotohartă","plural-vocative":"fotohărțelor"}},{"word":"fotoîntrerupător","pos":"noun","definitions":["photoswitch"],"forms":{"plural":"fotoîntrerupătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoîntrerupător","accusative-definite-nominative-singular":"fotoîntrerupătorul","accusative-indefinite-nominative-plural":"fotoîntrerupătoare","accusative-definite-nominative-plural":"fotoîntrerupătoarele","dative-genitive-indefinite-singular":"fotoîntrerupător","dative-definite-genitive-singular":"fotoîntrerupătorului","dative-genitive-indefinite-plural":"fotoîntrerupătoare","dative-definite-genitive-plural":"fotoîntrerupătoarelor","singular-vocative":"fotoîntrerupătorule","plural-vocative":"fotoîntrerupătoarelor"}},{"word":"fotolitografic","pos":"adj","definitions":["photolithographic"],"forms":{"feminine-singular":"fotolitografică","masculine-plural":"fotolitografici","feminine-neuter-plural":"fotolitografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotolitografic","error-unrecognized-form-feminine-indefinite-singular":"fotolitografică","error-unrecognized-form-indefinite-masculine-plural":"fotolitografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotolitografice","definite-error-unrecognized-form-masculine-neuter-singular":"fotolitograficul","definite-error-unrecognized-form-feminine-singular":"fotolitografica","definite-error-unrecognized-form-masculine-plural":"fotolitograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fotolitograficele"}},{"word":"fotolitografie","pos":"noun","definitions":["photolithography"],"forms":{"plural":"fotolitografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotolitografie","accusative-definite-nominative-singular":"fotolitografia","accusative-indefinite-nominative-plural":"fotolitografii","accusative-definite-nominative-plural":"fotolitografiile","dative-genitive-indefinite-singular":"fotolitografii","dative-definite-genitive-singular":"fotolitografiei","dative-genitive-indefinite-plural":"fotolitografii","dative-definite-genitive-plural":"fotolitografiilor","singular-vocative":"fotolitografie","plural-vocative":"fotolitografiilor"}},{"word":"fotoliu","pos":"noun","definitions":["armchair","easy chair, lounge chair, reclining chair"],"pronunciation":"/foˈto.lju/","forms":{"plural":"fotolii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoliu","accusative-definite-nominative-singular":"fotoliul","accusative-indefinite-nominative-plural":"fotolii","accusative-definite-nominative-plural":"fotoliile","dative-genitive-indefinite-singular":"fotoliu","dative-definite-genitive-singular":"fotoliului","dative-genitive-indefinite-plural":"fotolii","dative-definite-genitive-plural":"fotoliilor","singular-vocative":"fotoliule","plural-vocative":"fotoliilor"}},{"word":"fotoliză","pos":"noun","definitions":["photolysis"],"forms":{"plural":"fotolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoliză","accusative-definite-nominative-singular":"fotoliza","accusative-indefinite-nominative-plural":"fotolize","accusative-definite-nominative-plural":"fotolizele","dative-genitive-indefinite-singular":"fotolize","dative-definite-genitive-singular":"fotolizei","dative-genitive-indefinite-plural":"fotolize","dative-definite-genitive-plural":"fotolizelor","singular-vocative":"fotoliză","plural-vocative":"fotolizelor"}},{"word":"fotoluminescent","pos":"adj","definitions":["photoluminescent"],"forms":{"feminine-singular":"fotoluminescentă","masculine-plural":"fotoluminescenți","feminine-neuter-plural":"fotoluminescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoluminescent","error-unrecognized-form-feminine-indefinite-singular":"fotoluminescentă","error-unrecognized-form-indefinite-masculine-plural":"fotoluminescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoluminescente","definite-error-unrecognized-form-masculine-neuter-singular":"fotoluminescentul","definite-error-unrecognized-form-feminine-singular":"fotoluminescenta","definite-error-unrecognized-form-masculine-plural":"fotoluminescenții","definite-error-unrecognized-form-feminine-neuter-plural":"fotoluminescentele"}},{"word":"fotoluminescență","pos":"noun","definitions":["photoluminescence"],"forms":{"plural":"fotoluminescențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoluminescență","accusative-definite-nominative-singular":"fotoluminescența","accusative-indefinite-nominative-plural":"fotoluminescențe","accusative-definite-nominative-plural":"fotoluminescențele","dative-genitive-indefinite-singular":"fotoluminescențe","dative-definite-genitive-singular":"fotoluminescenței","dative-genitive-indefinite-plural":"fotoluminescențe","dative-definite-genitive-plural":"fotoluminescențelor","singular-vocative":"fotoluminescență","plural-vocative":"fotoluminescențelor"}},{"word":"fotoluminiscent","pos":"adj","definitions":["alternative form of fotoluminescent"],"forms":{"feminine-singular":"fotoluminiscentă","masculine-plural":"fotoluminiscenți","feminine-neuter-plural":"fotoluminiscente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotoluminiscent","error-unrecognized-form-feminine-indefinite-singular":"fotoluminiscentă","error-unrecognized-form-indefinite-masculine-plural":"fotoluminiscenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotoluminiscente","definite-error-unrecognized-form-masculine-neuter-singular":"fotoluminiscentul","definite-error-unrecognized-form-feminine-singular":"fotoluminiscenta","definite-error-unrecognized-form-masculine-plural":"fotoluminiscenții","definite-error-unrecognized-form-feminine-neuter-plural":"fotoluminiscentele"}},{"word":"fotoluminiscență","pos":"noun","definitions":["alternative form of fotoluminescență"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fotoluminiscență","accusative-definite-nominative":"fotoluminiscența","dative-genitive-indefinite":"fotoluminiscențe","dative-definite-genitive":"fotoluminiscenței","vocative":"fotoluminiscență"}},{"word":"fotomecanic","pos":"adj","definitions":["photomechanical"],"forms":{"feminine-singular":"fotomecanică","masculine-plural":"fotomecanici","feminine-neuter-plural":"fotomecanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotomecanic","error-unrecognized-form-feminine-indefinite-singular":"fotomecanică","error-unrecognized-form-indefinite-masculine-plural":"fotomecanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotomecanice","definite-error-unrecognized-form-masculine-neuter-singular":"fotomecanicul","definite-error-unrecognized-form-feminine-singular":"fotomecanica","definite-error-unrecognized-form-masculine-plural":"fotomecanicii","definite-error-unrecognized-form-feminine-neuter-plural":"fotomecanicele"}},{"word":"fotomecanică","pos":"adj","definitions":["photomechanical"],"forms":{"plural":"fotomecanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"fotomecanică","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotomecanice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"fotomecanica","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"fotomecanicele"}},{"word":"fotometalografist","pos":"noun","definitions":["photometallographer"],"forms":{"plural":"fotometalografiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotometalografist","accusative-definite-nominative-singular":"fotometalografistul","accusative-indefinite-nominative-plural":"fotometalografisti","accusative-definite-nominative-plural":"fotometalografistii","dative-genitive-indefinite-singular":"fotometalografist","dative-definite-genitive-singular":"fotometalografistului","dative-genitive-indefinite-plural":"fotometalografisti","dative-definite-genitive-plural":"fotometalografistilor","singular-vocative":"fotometalografistule","plural-vocative":"fotometalografistilor"}},{"word":"fotometalografistă","pos":"noun","definitions":["female equivalent of fotometalografist"],"forms":{"plural":"fotometalografiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotometalografistă","accusative-definite-nominative-singular":"fotometalografista","accusative-indefinite-nominative-plural":"fotometalografiste","accusative-definite-nominative-plural":"fotometalografistele","dative-genitive-indefinite-singular":"fotometalografiste","dative-definite-genitive-singular":"fotometalografistei","dative-genitive-indefinite-plural":"fotometalografiste","dative-definite-genitive-plural":"fotometalografistelor","singular-vocative":"fotometalografistă","plural-vocative":"fotometalografistelor"}},{"word":"fotometeor","pos":"noun","definitions":["photometeor"],"forms":{"plural":"fotometeori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotometeor","accusative-definite-nominative-singular":"fotometeorul","accusative-indefinite-nominative-plural":"fotometeori","accusative-definite-nominative-plural":"fotometeorii","dative-genitive-indefinite-singular":"fotometeor","dative-definite-genitive-singular":"fotometeorului","dative-genitive-indefinite-plural":"fotometeori","dative-definite-genitive-plural":"fotometeorilor","singular-vocative":"fotometeorule","plural-vocative":"fotometeorilor"}},{"word":"fotometric","pos":"adj","definitions":["photometric"],"forms":{"feminine-singular":"fotometrică","masculine-plural":"fotometrici","feminine-neuter-plural":"fotometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotometric","error-unrecognized-form-feminine-indefinite-singular":"fotometrică","error-unrecognized-form-indefinite-masculine-plural":"fotometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotometrice","definite-error-unrecognized-form-masculine-neuter-singular":"fotometricul","definite-error-unrecognized-form-feminine-singular":"fotometrica","definite-error-unrecognized-form-masculine-plural":"fotometricii","definite-error-unrecognized-form-feminine-neuter-plural":"fotometricele"}},{"word":"fotometrie","pos":"noun","definitions":["photometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fotometrie","accusative-definite-nominative":"fotometria","dative-genitive-indefinite":"fotometrii","dative-definite-genitive":"fotometriei","vocative":"fotometrie"}},{"word":"fotometru","pos":"noun","definitions":["photometer"],"forms":{"plural":"fotometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotometru","accusative-definite-nominative-singular":"fotometrul","accusative-indefinite-nominative-plural":"fotometre","accusative-definite-nominative-plural":"fotometrele","dative-genitive-indefinite-singular":"fotometru","dative-definite-genitive-singular":"fotometrului","dative-genitive-indefinite-plural":"fotometre","dative-definite-genitive-plural":"fotometrelor","singular-vocative":"fotometrule","plural-vocative":"fotometrelor"}},{"word":"fotomicrografic","pos":"adj","definitions":["photomicrographic"],"forms":{"feminine-singular":"fotomicrografică","masculine-plural":"fotomicrografici","feminine-neuter-plural":"fotomicrografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotomicrografic","error-unrecognized-form-feminine-indefinite-singular":"fotomicrografică","error-unrecognized-form-indefinite-masculine-plural":"fotomicrografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotomicrografice","definite-error-unrecognized-form-masculine-neuter-singular":"fotomicrograficul","definite-error-unrecognized-form-feminine-singular":"fotomicrografica","definite-error-unrecognized-form-masculine-plural":"fotomicrograficii","definite-error-unrecognized-form-feminine-neuter-plural":"fotomicrograficele"}},{"word":"fotomicrografie","pos":"noun","definitions":["photomicrography"],"forms":{"plural":"fotomicrografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotomicrografie","accusative-definite-nominative-singular":"fotomicrografia","accusative-indefinite-nominative-plural":"fotomicrografii","accusative-definite-nominative-plural":"fotomicrografiile","dative-genitive-indefinite-singular":"fotomicrografii","dative-definite-genitive-singular":"fotomicrografiei","dative-genitive-indefinite-plural":"fotomicrografii","dative-definite-genitive-plural":"fotomicrografiilor","singular-vocative":"fotomicrografie","plural-vocative":"fotomicrografiilor"}},{"word":"fotomicroscopie","pos":"noun","definitions":["photomicroscopy"],"forms":{"plural":"fotomicroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotomicroscopie","accusative-definite-nominative-singular":"fotomicroscopia","accusative-indefinite-nominative-plural":"fotomicroscopii","accusative-definite-nominative-plural":"fotomicroscopiile","dative-genitive-indefinite-singular":"fotomicroscopii","dative-definite-genitive-singular":"fotomicroscopiei","dative-genitive-indefinite-plural":"fotomicroscopii","dative-definite-genitive-plural":"fotomicroscopiilor","singular-vocative":"fotomicroscopie","plural-vocative":"fotomicroscopiilor"}},{"word":"fotomodel","pos":"noun","definitions":["model (person)"],"forms":{"plural":"fotomodele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotomodel","accusative-definite-nominative-singular":"fotomodelul","accusative-indefinite-nominative-plural":"fotomodele","accusative-definite-nominative-plural":"fotomodelele","dative-genitive-indefinite-singular":"fotomodel","dative-definite-genitive-singular":"fotomodelului","dative-genitive-indefinite-plural":"fotomodele","dative-definite-genitive-plural":"fotomodelelor","singular-vocative":"fotomodelule","plural-vocative":"fotomodelelor"}},{"word":"fotomontaj","pos":"noun","definitions":["photomontage"],"forms":{"plural":"fotomontaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotomontaj","accusative-definite-nominative-singular":"fotomontajul","accusative-indefinite-nominative-plural":"fotomontaje","accusative-definite-nominative-plural":"fotomontajele","dative-genitive-indefinite-singular":"fotomontaj","dative-definite-genitive-singular":"fotomontajului","dative-genitive-indefinite-plural":"fotomontaje","dative-definite-genitive-plural":"fotomontajelor","singular-vocative":"fotomontajule","plural-vocative":"fotomontajelor"}},{"word":"fotomozaic","pos":"noun","definitions":["photomosaic"],"forms":{"plural":"fotomozaicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fotomozaic","accusative-definite-nominative-singular":"fotomozaicul","accusative-indefinite-nominative-plural":"fotomozaicuri","accusative-definite-nominative-plural":"fotomozaicurile","dative-genitive-indefinite-singular":"fotomozaic","dative-definite-genitive-singular":"fotomozaicului","dative-genitive-indefinite-plural":"fotomozaicuri","dative-definite-genitive-plural":"fotomozaicurilor","singular-vocative":"fotomozaicule","plural-vocative":"fotomozaicurilor"}},{"word":"fotomultiplicator","pos":"noun","definitions":["photomultiplier"],"forms":{"plural":"fotomultiplicatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotomultiplicator","accusative-definite-nominative-singular":"fotomultiplicatorul","accusative-indefinite-nominative-plural":"fotomultiplicatore","accusative-definite-nominative-plural":"fotomultiplicatorele","dative-genitive-indefinite-singular":"fotomultiplicator","dative-definite-genitive-singular":"fotomultiplicatorului","dative-genitive-indefinite-plural":"fotomultiplicatore","dative-definite-genitive-plural":"fotomultiplicatorelor","singular-vocative":"fotomultiplicatorule","plural-vocative":"fotomultiplicatorelor"}},{"word":"foton","pos":"noun","definitions":["photon"],"forms":{"plural":"fotoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foton","accusative-definite-nominative-singular":"fotonul","accusative-indefinite-nominative-plural":"fotoni","accusative-definite-nominative-plural":"fotonii","dative-genitive-indefinite-singular":"foton","dative-definite-genitive-singular":"fotonului","dative-genitive-indefinite-plural":"fotoni","dative-definite-genitive-plural":"fotonilor","singular-vocative":"fotonule","plural-vocative":"fotonilor"}},{"word":"fotonastie","pos":"noun","definitions":["photonasty"],"forms":{"plural":"fotonastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotonastie","accusative-definite-nominative-singular":"fotonastia","accusative-indefinite-nominative-plural":"fotonastii","accusative-definite-nominative-plural":"fotonastiile","dative-genitive-indefinite-singular":"fotonastii","dative-definite-genitive-singular":"fotonastiei","dative-genitive-indefinite-plural":"fotonastii","dative-definite-genitive-plural":"fotonastiilor","singular-vocative":"fotonastie","plural-vocative":"fotonastiilor"}},{"word":"fotonic","pos":"adj","definitions":["photonic"],"forms":{"feminine-singular":"fotonică","masculine-plural":"fotonici","feminine-neuter-plural":"fotonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotonic","error-unrecognized-form-feminine-indefinite-singular":"fotonică","error-unrecognized-form-indefinite-masculine-plural":"fotonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotonice","definite-error-unrecognized-form-masculine-neuter-singular":"fotonicul","definite-error-unrecognized-form-feminine-singular":"fotonica","definite-error-unrecognized-form-masculine-plural":"fotonicii","definite-error-unrecognized-form-feminine-neuter-plural":"fotonicele"}},{"word":"fotoobiectiv","pos":"noun","definitions":["camera lens"],"forms":{"plural":"fotoobiective","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoobiectiv","accusative-definite-nominative-singular":"fotoobiectivul","accusative-indefinite-nominative-plural":"fotoobiective","accusative-definite-nominative-plural":"fotoobiectivele","dative-genitive-indefinite-singular":"fotoobiectiv","dative-definite-genitive-singular":"fotoobiectivului","dative-genitive-indefinite-plural":"fotoobiective","dative-definite-genitive-plural":"fotoobiectivelor","singular-vocative":"fotoobiectivule","plural-vocative":"fotoobiectivelor"}},{"word":"fotoperiodism","pos":"noun","definitions":["photoperiodism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoperiodism","accusative-definite-nominative-singular":"fotoperiodismul","accusative-indefinite-nominative-plural":"fotoperiodisme","accusative-definite-nominative-plural":"fotoperiodismele","dative-genitive-indefinite-singular":"fotoperiodism","dative-definite-genitive-singular":"fotoperiodismului","dative-genitive-indefinite-plural":"fotoperiodisme","dative-definite-genitive-plural":"fotoperiodismelor","singular-vocative":"fotoperiodismule","plural-vocative":"fotoperiodismelor"}},{"word":"fotopilă","pos":"noun","definitions":["photopile"],"forms":{"plural":"fotopile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotopilă","accusative-definite-nominative-singular":"fotopila","accusative-indefinite-nominative-plural":"fotopile","accusative-definite-nominative-plural":"fotopilele","dative-genitive-indefinite-singular":"fotopile","dative-definite-genitive-singular":"fotopilei","dative-genitive-indefinite-plural":"fotopile","dative-definite-genitive-plural":"fotopilelor","singular-vocative":"fotopilă","plural-vocative":"fotopilelor"}},{"word":"fotopolarimetru","pos":"noun","definitions":["photopolarimeter"],"forms":{"plural":"fotopolarimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotopolarimetru","accusative-definite-nominative-singular":"fotopolarimetruul","accusative-indefinite-nominative-plural":"fotopolarimetre","accusative-definite-nominative-plural":"fotopolarimetrele","dative-genitive-indefinite-singular":"fotopolarimetru","dative-definite-genitive-singular":"fotopolarimetruului","dative-genitive-indefinite-plural":"fotopolarimetre","dative-definite-genitive-plural":"fotopolarimetrelor","singular-vocative":"fotopolarimetruule","plural-vocative":"fotopolarimetrelor"}},{"word":"fotopsie","pos":"noun","definitions":["photopsia"],"forms":{"plural":"fotopsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotopsie","accusative-definite-nominative-singular":"fotopsia","accusative-indefinite-nominative-plural":"fotopsii","accusative-definite-nominative-plural":"fotopsiile","dative-genitive-indefinite-singular":"fotopsii","dative-definite-genitive-singular":"fotopsiei","dative-genitive-indefinite-plural":"fotopsii","dative-definite-genitive-plural":"fotopsiilor","singular-vocative":"fotopsie","plural-vocative":"fotopsiilor"}},{"word":"fotoreacție","pos":"noun","definitions":["photoreaction"],"forms":{"plural":"fotoreacții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotoreacție","accusative-definite-nominative-singular":"fotoreacția","accusative-indefinite-nominative-plural":"fotoreacții","accusative-definite-nominative-plural":"fotoreacțiile","dative-genitive-indefinite-singular":"fotoreacții","dative-definite-genitive-singular":"fotoreacției","dative-genitive-indefinite-plural":"fotoreacții","dative-definite-genitive-plural":"fotoreacțiilor","singular-vocative":"fotoreacție","plural-vocative":"fotoreacțiilor"}},{"word":"fotoreceptor","pos":"noun","definitions":["photoreceptor"],"forms":{"plural":"fotoreceptori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotoreceptor","accusative-definite-nominative-singular":"fotoreceptorul","accusative-indefinite-nominative-plural":"fotoreceptori","accusative-definite-nominative-plural":"fotoreceptorii","dative-genitive-indefinite-singular":"fotoreceptor","dative-definite-genitive-singular":"fotoreceptorului","dative-genitive-indefinite-plural":"fotoreceptori","dative-definite-genitive-plural":"fotoreceptorilor","singular-vocative":"fotoreceptorule","plural-vocative":"fotoreceptorilor"}},{"word":"fotoreportaj","pos":"noun","definitions":["photojournalism"],"forms":{"plural":"fotoreportaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotoreportaj","accusative-definite-nominative-singular":"fotoreportajul","accusative-indefinite-nominative-plural":"fotoreportaje","accusative-definite-nominative-plural":"fotoreportajele","dative-genitive-indefinite-singular":"fotoreportaj","dative-definite-genitive-singular":"fotoreportajului","dative-genitive-indefinite-plural":"fotoreportaje","dative-definite-genitive-plural":"fotoreportajelor","singular-vocative":"fotoreportajule","plural-vocative":"fotoreportajelor"}},{"word":"fotoreporter","pos":"noun","definitions":["photojournalist"],"forms":{"plural":"fotoreporteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fotoreporter","accusative-definite-nominative-singular":"fotoreporterul","accusative-indefinite-nominative-plural":"fotoreporteri","accusative-definite-nominative-plural":"fotoreporterii","dative-genitive-indefinite-singular":"fotoreporter","dative-definite-genitive-singular":"fotoreporterului","dative-genitive-indefinite-plural":"fotoreporteri","dative-definite-genitive-plural":"fotoreporterilor","singular-vocative":"fotoreporterule","plural-vocative":"fotoreporterilor"}},{"word":"fotoreporteră","pos":"noun","definitions":["female equivalent of fotoreporter"],"forms":{"plural":"fotoreportere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotoreporteră","accusative-definite-nominative-singular":"fotoreportera","accusative-indefinite-nominative-plural":"fotoreportere","accusative-definite-nominative-plural":"fotoreporterele","dative-genitive-indefinite-singular":"fotoreportere","dative-definite-genitive-singular":"fotoreporterei","dative-genitive-indefinite-plural":"fotoreportere","dative-definite-genitive-plural":"fotoreporterelor","singular-vocative":"fotoreporteră","plural-vocative":"fotoreporterelor"}},{"word":"fotoreproducere","pos":"noun","definitions":["photoreproduction"],"forms":{"plural":"fotoreproduceri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotoreproducere","accusative-definite-nominative-singular":"fotoreproducerea","accusative-indefinite-nominative-plural":"fotoreproduceri","accusative-definite-nominative-plural":"fotoreproducerile","dative-genitive-indefinite-singular":"fotoreproduceri","dative-definite-genitive-singular":"fotoreproducerii","dative-genitive-indefinite-plural":"fotoreproduceri","dative-definite-genitive-plural":"fotoreproducerilor","singular-vocative":"fotoreproducere","plural-vocative":"fotoreproducerilor"}},{"word":"fotorezistiv","pos":"adj","definitions":["photoresistive"],"forms":{"feminine-singular":"fotorezistivă","masculine-plural":"fotorezistivi","feminine-neuter-plural":"fotorezistive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotorezistiv","error-unrecognized-form-feminine-indefinite-singular":"fotorezistivă","error-unrecognized-form-indefinite-masculine-plural":"fotorezistivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotorezistive","definite-error-unrecognized-form-masculine-neuter-singular":"fotorezistivul","definite-error-unrecognized-form-feminine-singular":"fotorezistiva","definite-error-unrecognized-form-masculine-plural":"fotorezistivii","definite-error-unrecognized-form-feminine-neuter-plural":"fotorezistivele"}},{"word":"fotorezistor","pos":"noun","definitions":["photoresistor"],"forms":{"plural":"fotorezistoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotorezistor","accusative-definite-nominative-singular":"fotorezistorul","accusative-indefinite-nominative-plural":"fotorezistoare","accusative-definite-nominative-plural":"fotorezistoarele","dative-genitive-indefinite-singular":"fotorezistor","dative-definite-genitive-singular":"fotorezistorului","dative-genitive-indefinite-plural":"fotorezistoare","dative-definite-genitive-plural":"fotorezistoarelor","singular-vocative":"fotorezistorule","plural-vocative":"fotorezistoarelor"}},{"word":"Fotoș","pos":"name","definitions":["a village in Ghidfalău, Covasna County, Romania"],"gender":"m"},{"word":"fotosculptură","pos":"noun","definitions":["photosculpture"],"forms":{"plural":"fotosculpturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotosculptură","accusative-definite-nominative-singular":"fotosculptura","accusative-indefinite-nominative-plural":"fotosculpture","accusative-definite-nominative-plural":"fotosculpturele","dative-genitive-indefinite-singular":"fotosculpture","dative-definite-genitive-singular":"fotosculpturei","dative-genitive-indefinite-plural":"fotosculpture","dative-definite-genitive-plural":"fotosculpturelor","singular-vocative":"fotosculptură","plural-vocative":"fotosculpturelor"}},{"word":"fotosensibil","pos":"adj","definitions":["photosensitive"],"forms":{"feminine-singular":"fotosensibilă","masculine-plural":"fotosensibili","feminine-neuter-plural":"fotosensibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotosensibil","error-unrecognized-form-feminine-indefinite-singular":"fotosensibilă","error-unrecognized-form-indefinite-masculine-plural":"fotosensibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotosensibile","definite-error-unrecognized-form-masculine-neuter-singular":"fotosensibilul","definite-error-unrecognized-form-feminine-singular":"fotosensibila","definite-error-unrecognized-form-masculine-plural":"fotosensibilii","definite-error-unrecognized-form-feminine-neuter-plural":"fotosensibilele"}},{"word":"fotosensibilitate","pos":"noun","definitions":["photosensitivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotosensibilitate","accusative-definite-nominative-singular":"fotosensibilitatea","accusative-indefinite-nominative-plural":"fotosensibilități","accusative-definite-nominative-plural":"fotosensibilitățile","dative-genitive-indefinite-singular":"fotosensibilități","dative-definite-genitive-singular":"fotosensibilității","dative-genitive-indefinite-plural":"fotosensibilități","dative-definite-genitive-plural":"fotosensibilităților","singular-vocative":"fotosensibilitate","plural-vocative":"fotosensibilităților"}},{"word":"fotosensibilizare","pos":"noun","definitions":["photosensitization"],"forms":{"plural":"fotosensibilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fotosensibilizare","accusative-definite-nominative-singular":"fotosensibilizarea","accusative-indefinite-nominative-plural":"fotosensibilizări","accusative-definite-nominative-plural":"fotosensibilizările","dative-genitive-indefinite-singular":"fotosensibilizări","dative-definite-genitive-singular":"fotosensibilizării","dative-genitive-indefinite-plural":"fotosensibilizări","dative-definite-genitive-plural":"fotosensibilizărilor","singular-vocative":"fotosensibilizare","plural-vocative":"fotosensibilizărilor"}},{"word":"fotosferă","pos":"noun","definitions":["photosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotosferă","accusative-definite-nominative-singular":"fotosfera","accusative-indefinite-nominative-plural":"fotosfere","accusative-definite-nominative-plural":"fotosferele","dative-genitive-indefinite-singular":"fotosfere","dative-definite-genitive-singular":"fotosferei","dative-genitive-indefinite-plural":"fotosfere","dative-definite-genitive-plural":"fotosferelor","singular-vocative":"fotosferă","plural-vocative":"fotosferelor"}},{"word":"fotosferic","pos":"adj","definitions":["photospheric"],"forms":{"feminine-singular":"fotosferică","masculine-plural":"fotosferici","feminine-neuter-plural":"fotosferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotosferic","error-unrecognized-form-feminine-indefinite-singular":"fotosferică","error-unrecognized-form-indefinite-masculine-plural":"fotosferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotosferice","definite-error-unrecognized-form-masculine-neuter-singular":"fotosfericul","definite-error-unrecognized-form-feminine-singular":"fotosferica","definite-error-unrecognized-form-masculine-plural":"fotosfericii","definite-error-unrecognized-form-feminine-neuter-plural":"fotosfericele"}},{"word":"fotosintetic","pos":"adj","definitions":["photosynthetic"],"forms":{"feminine-singular":"fotosintetică","masculine-plural":"fotosintetici","feminine-neuter-plural":"fotosintetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotosintetic","error-unrecognized-form-feminine-indefinite-singular":"fotosintetică","error-unrecognized-form-indefinite-masculine-plural":"fotosintetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotosintetice","definite-error-unrecognized-form-masculine-neuter-singular":"fotosinteticul","definite-error-unrecognized-form-feminine-singular":"fotosintetica","definite-error-unrecognized-form-masculine-plural":"fotosinteticii","definite-error-unrecognized-form-feminine-neuter-plural":"fotosinteticele"}},{"word":"fotosintetizant","pos":"adj","definitions":["photosynthesizing"],"forms":{"feminine-singular":"fotosintetizantă","masculine-plural":"fotosintetizanți","feminine-neuter-plural":"fotosintetizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotosintetizant","error-unrecognized-form-feminine-indefinite-singular":"fotosintetizantă","error-unrecognized-form-indefinite-masculine-plural":"fotosintetizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotosintetizante","definite-error-unrecognized-form-masculine-neuter-singular":"fotosintetizantul","definite-error-unrecognized-form-feminine-singular":"fotosintetizanta","definite-error-unrecognized-form-masculine-plural":"fotosintetizanții","definite-error-unrecognized-form-feminine-neuter-plural":"fotosintetizantele"}},{"word":"fotosintetizant","pos":"noun","definitions":["photosynthesizer"],"forms":{"plural":"fotosintetizanți"}},{"word":"fotosintetizator","pos":"adj","definitions":["photosynthesizer"],"forms":{"feminine-singular":"fotosintetizatoare","masculine-plural":"fotosintetizatori","feminine-neuter-plural":"fotosintetizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotosintetizator","error-unrecognized-form-feminine-indefinite-singular":"fotosintetizatoare","error-unrecognized-form-indefinite-masculine-plural":"fotosintetizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotosintetizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"fotosintetizatorul","definite-error-unrecognized-form-feminine-singular":"fotosintetizatoarea","definite-error-unrecognized-form-masculine-plural":"fotosintetizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"fotosintetizatoarele"}},{"word":"fotosinteză","pos":"noun","definitions":["photosynthesis"],"forms":{"plural":"fotosinteze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fotosinteză","accusative-definite-nominative-singular":"fotosinteza","accusative-indefinite-nominative-plural":"fotosinteze","accusative-definite-nominative-plural":"fotosintezele","dative-genitive-indefinite-singular":"fotosinteze","dative-definite-genitive-singular":"fotosintezei","dative-genitive-indefinite-plural":"fotosinteze","dative-definite-genitive-plural":"fotosintezelor","singular-vocative":"fotosinteză","plural-vocative":"fotosintezelor"}},{"word":"fotostat","pos":"noun","definitions":["photostat"],"forms":{"plural":"fotostate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fotostat","accusative-definite-nominative-singular":"fotostatul","accusative-indefinite-nominative-plural":"fotostate","accusative-definite-nominative-plural":"fotostatele","dative-genitive-indefinite-singular":"fotostat","dative-definite-genitive-singular":"fotostatului","dative-genitive-indefinite-plural":"fotostate","dative-definite-genitive-plural":"fotostatelor","singular-vocative":"fotostatule","plural-vocative":"fotostatelor"}},{"word":"fototactism","pos":"noun","definitions":["phototaxis"],"forms":{"plural":"fototactisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototactism","accusative-definite-nominative-singular":"fototactismul","accusative-indefinite-nominative-plural":"fototactisme","accusative-definite-nominative-plural":"fototactismele","dative-genitive-indefinite-singular":"fototactism","dative-definite-genitive-singular":"fototactismului","dative-genitive-indefinite-plural":"fototactisme","dative-definite-genitive-plural":"fototactismelor","singular-vocative":"fototactismule","plural-vocative":"fototactismelor"}},{"word":"fototaxie","pos":"noun","definitions":["phototaxis, phototaxy"],"forms":{"plural":"fototaxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fototaxie","accusative-definite-nominative-singular":"fototaxia","accusative-indefinite-nominative-plural":"fototaxii","accusative-definite-nominative-plural":"fototaxiile","dative-genitive-indefinite-singular":"fototaxii","dative-definite-genitive-singular":"fototaxiei","dative-genitive-indefinite-plural":"fototaxii","dative-definite-genitive-plural":"fototaxiilor","singular-vocative":"fototaxie","plural-vocative":"fototaxiilor"}},{"word":"fototecă","pos":"noun","definitions":["photo library"],"forms":{"plural":"fototeci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fototecă","accusative-definite-nominative-singular":"fototeca","accusative-indefinite-nominative-plural":"fototeci","accusative-definite-nominative-plural":"fototecile","dative-genitive-indefinite-singular":"fototeci","dative-definite-genitive-singular":"fototecii","dative-genitive-indefinite-plural":"fototeci","dative-definite-genitive-plural":"fototecilor","singular-vocative":"fototecă","plural-vocative":"fototecilor"}},{"word":"fototelegraf","pos":"noun","definitions":["phototelegraph"],"forms":{"plural":"fototelegrafe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototelegraf","accusative-definite-nominative-singular":"fototelegraful","accusative-indefinite-nominative-plural":"fototelegrafe","accusative-definite-nominative-plural":"fototelegrafele","dative-genitive-indefinite-singular":"fototelegraf","dative-definite-genitive-singular":"fototelegrafului","dative-genitive-indefinite-plural":"fototelegrafe","dative-definite-genitive-plural":"fototelegrafelor","singular-vocative":"fototelegrafule","plural-vocative":"fototelegrafelor"}},{"word":"fototelegrafic","pos":"adj","definitions":["phototelegraph"],"forms":{"feminine-singular":"fototelegrafică","masculine-plural":"fototelegrafici","feminine-neuter-plural":"fototelegrafice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fototelegrafic","error-unrecognized-form-feminine-indefinite-singular":"fototelegrafică","error-unrecognized-form-indefinite-masculine-plural":"fototelegrafici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fototelegrafice","definite-error-unrecognized-form-masculine-neuter-singular":"fototelegraficul","definite-error-unrecognized-form-feminine-singular":"fototelegrafica","definite-error-unrecognized-form-masculine-plural":"fototelegraficii","definite-error-unrecognized-form-feminine-neuter-plural":"fototelegraficele"}},{"word":"fototelegrafie","pos":"noun","definitions":["phototelegraphy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fototelegrafie","accusative-definite-nominative":"fototelegrafia","dative-genitive-indefinite":"fototelegrafii","dative-definite-genitive":"fototelegrafiei","vocative":"fototelegrafie"}},{"word":"fototelegramă","pos":"noun","definitions":["phototelegram"],"forms":{"plural":"fototelegrame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fototelegramă","accusative-definite-nominative-singular":"fototelegrama","accusative-indefinite-nominative-plural":"fototelegrame","accusative-definite-nominative-plural":"fototelegramele","dative-genitive-indefinite-singular":"fototelegrame","dative-definite-genitive-singular":"fototelegramei","dative-genitive-indefinite-plural":"fototelegrame","dative-definite-genitive-plural":"fototelegramelor","singular-vocative":"fototelegramă","plural-vocative":"fototelegramelor"}},{"word":"fototeodolit","pos":"noun","definitions":["phototheodolite"],"forms":{"plural":"fototeodolite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototeodolit","accusative-definite-nominative-singular":"fototeodolitul","accusative-indefinite-nominative-plural":"fototeodolite","accusative-definite-nominative-plural":"fototeodolitele","dative-genitive-indefinite-singular":"fototeodolit","dative-definite-genitive-singular":"fototeodolitului","dative-genitive-indefinite-plural":"fototeodolite","dative-definite-genitive-plural":"fototeodolitelor","singular-vocative":"fototeodolitule","plural-vocative":"fototeodolitelor"}},{"word":"fototerapic","pos":"adj","definitions":["phototherapic"],"forms":{"feminine-singular":"fototerapică","masculine-plural":"fototerapici","feminine-neuter-plural":"fototerapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fototerapic","error-unrecognized-form-feminine-indefinite-singular":"fototerapică","error-unrecognized-form-indefinite-masculine-plural":"fototerapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fototerapice","definite-error-unrecognized-form-masculine-neuter-singular":"fototerapicul","definite-error-unrecognized-form-feminine-singular":"fototerapica","definite-error-unrecognized-form-masculine-plural":"fototerapicii","definite-error-unrecognized-form-feminine-neuter-plural":"fototerapicele"}},{"word":"fototerapie","pos":"noun","definitions":["phototherapy"],"forms":{"plural":"fototerapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fototerapie","accusative-definite-nominative-singular":"fototerapia","accusative-indefinite-nominative-plural":"fototerapii","accusative-definite-nominative-plural":"fototerapiile","dative-genitive-indefinite-singular":"fototerapii","dative-definite-genitive-singular":"fototerapiei","dative-genitive-indefinite-plural":"fototerapii","dative-definite-genitive-plural":"fototerapiilor","singular-vocative":"fototerapie","plural-vocative":"fototerapiilor"}},{"word":"fototipie","pos":"noun","definitions":["phototype"],"forms":{"plural":"fototipii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fototipie","accusative-definite-nominative-singular":"fototipia","accusative-indefinite-nominative-plural":"fototipii","accusative-definite-nominative-plural":"fototipiile","dative-genitive-indefinite-singular":"fototipii","dative-definite-genitive-singular":"fototipiei","dative-genitive-indefinite-plural":"fototipii","dative-definite-genitive-plural":"fototipiilor","singular-vocative":"fototipie","plural-vocative":"fototipiilor"}},{"word":"fototiristor","pos":"noun","definitions":["photothyristor"],"forms":{"plural":"fototiristoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototiristor","accusative-definite-nominative-singular":"fototiristorul","accusative-indefinite-nominative-plural":"fototiristoare","accusative-definite-nominative-plural":"fototiristoarele","dative-genitive-indefinite-singular":"fototiristor","dative-definite-genitive-singular":"fototiristorului","dative-genitive-indefinite-plural":"fototiristoare","dative-definite-genitive-plural":"fototiristoarelor","singular-vocative":"fototiristorule","plural-vocative":"fototiristoarelor"}},{"word":"fototopografie","pos":"noun","definitions":["phototopography"],"forms":{"plural":"fototopografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fototopografie","accusative-definite-nominative-singular":"fototopografia","accusative-indefinite-nominative-plural":"fototopografii","accusative-definite-nominative-plural":"fototopografiile","dative-genitive-indefinite-singular":"fototopografii","dative-definite-genitive-singular":"fototopografiei","dative-genitive-indefinite-plural":"fototopografii","dative-definite-genitive-plural":"fototopografiilor","singular-vocative":"fototopografie","plural-vocative":"fototopografiilor"}},{"word":"fototranzistor","pos":"noun","definitions":["phototransistor"],"forms":{"plural":"fototranzistoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototranzistor","accusative-definite-nominative-singular":"fototranzistorul","accusative-indefinite-nominative-plural":"fototranzistoare","accusative-definite-nominative-plural":"fototranzistoarele","dative-genitive-indefinite-singular":"fototranzistor","dative-definite-genitive-singular":"fototranzistorului","dative-genitive-indefinite-plural":"fototranzistoare","dative-definite-genitive-plural":"fototranzistoarelor","singular-vocative":"fototranzistorule","plural-vocative":"fototranzistoarelor"}},{"word":"fototriangulație","pos":"noun","definitions":["phototriangulation"],"forms":{"plural":"fototriangulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fototriangulație","accusative-definite-nominative-singular":"fototriangulația","accusative-indefinite-nominative-plural":"fototriangulații","accusative-definite-nominative-plural":"fototriangulațiile","dative-genitive-indefinite-singular":"fototriangulații","dative-definite-genitive-singular":"fototriangulației","dative-genitive-indefinite-plural":"fototriangulații","dative-definite-genitive-plural":"fototriangulațiilor","singular-vocative":"fototriangulație","plural-vocative":"fototriangulațiilor"}},{"word":"fototropic","pos":"adj","definitions":["phototropic"],"forms":{"feminine-singular":"fototropică","masculine-plural":"fototropici","feminine-neuter-plural":"fototropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fototropic","error-unrecognized-form-feminine-indefinite-singular":"fototropică","error-unrecognized-form-indefinite-masculine-plural":"fototropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fototropice","definite-error-unrecognized-form-masculine-neuter-singular":"fototropicul","definite-error-unrecognized-form-feminine-singular":"fototropica","definite-error-unrecognized-form-masculine-plural":"fototropicii","definite-error-unrecognized-form-feminine-neuter-plural":"fototropicele"}},{"word":"fototropie","pos":"noun","definitions":["phototrophy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fototropie","accusative-definite-nominative":"fototropia","dative-genitive-indefinite":"fototropii","dative-definite-genitive":"fototropiei","vocative":"fototropie"}},{"word":"fototropism","pos":"noun","definitions":["phototropism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fototropism","accusative-definite-nominative-singular":"fototropismul","accusative-indefinite-nominative-plural":"fototropisme","accusative-definite-nominative-plural":"fototropismele","dative-genitive-indefinite-singular":"fototropism","dative-definite-genitive-singular":"fototropismului","dative-genitive-indefinite-plural":"fototropisme","dative-definite-genitive-plural":"fototropismelor","singular-vocative":"fototropismule","plural-vocative":"fototropismelor"}},{"word":"fotovoltaic","pos":"adj","definitions":["photovoltaic"],"forms":{"feminine-singular":"fotovoltaică","masculine-plural":"fotovoltaici","feminine-neuter-plural":"fotovoltaice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fotovoltaic","error-unrecognized-form-feminine-indefinite-singular":"fotovoltaică","error-unrecognized-form-indefinite-masculine-plural":"fotovoltaici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fotovoltaice","definite-error-unrecognized-form-masculine-neuter-singular":"fotovoltaicul","definite-error-unrecognized-form-feminine-singular":"fotovoltaica","definite-error-unrecognized-form-masculine-plural":"fotovoltaicii","definite-error-unrecognized-form-feminine-neuter-plural":"fotovoltaicele"}},{"word":"fotovoltaică","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of fotovoltaic"]},{"word":"fotozincografie","pos":"noun","definitions":["photozincography"],"forms":{"plural":"fotozincografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fotozincografie","accusative-definite-nominative-singular":"fotozincografia","accusative-indefinite-nominative-plural":"fotozincografii","accusative-definite-nominative-plural":"fotozincografiile","dative-genitive-indefinite-singular":"fotozincografii","dative-definite-genitive-singular":"fotozincografiei","dative-genitive-indefinite-plural":"fotozincografii","dative-definite-genitive-plural":"fotozincografiilor","singular-vocative":"fotozincografie","plural-vocative":"fotozincografiilor"}},{"word":"Fotu","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Fotu"}},{"word":"fou","pos":"intj","definitions":["obsolete form of fă"]},{"word":"fourierism","pos":"noun","definitions":["Fourierism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fourierism","accusative-definite-nominative-singular":"fourierismul","accusative-indefinite-nominative-plural":"fourierisme","accusative-definite-nominative-plural":"fourierismele","dative-genitive-indefinite-singular":"fourierism","dative-definite-genitive-singular":"fourierismului","dative-genitive-indefinite-plural":"fourierisme","dative-definite-genitive-plural":"fourierismelor","singular-vocative":"fourierismule","plural-vocative":"fourierismelor"}},{"word":"fourierist","pos":"adj","definitions":["Fourierist"],"forms":{"feminine-singular":"fourieristă","masculine-plural":"fourieriști","feminine-neuter-plural":"fourieriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fourierist","error-unrecognized-form-feminine-indefinite-singular":"fourieristă","error-unrecognized-form-indefinite-masculine-plural":"fourieriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fourieriste","definite-error-unrecognized-form-masculine-neuter-singular":"fourieristul","definite-error-unrecognized-form-feminine-singular":"fourierista","definite-error-unrecognized-form-masculine-plural":"fourieriștii","definite-error-unrecognized-form-feminine-neuter-plural":"fourieristele"}},{"word":"fov","pos":"noun","definitions":["fauvist"],"forms":{"plural":"fovi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fov","accusative-definite-nominative-singular":"fovul","accusative-indefinite-nominative-plural":"fovi","accusative-definite-nominative-plural":"fovii","dative-genitive-indefinite-singular":"fov","dative-definite-genitive-singular":"fovului","dative-genitive-indefinite-plural":"fovi","dative-definite-genitive-plural":"fovilor","singular-vocative":"fovule","plural-vocative":"fovilor"}},{"word":"fovism","pos":"noun","definitions":["fauvism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fovism","accusative-definite-nominative-singular":"fovismul","accusative-indefinite-nominative-plural":"fovisme","accusative-definite-nominative-plural":"fovismele","dative-genitive-indefinite-singular":"fovism","dative-definite-genitive-singular":"fovismului","dative-genitive-indefinite-plural":"fovisme","dative-definite-genitive-plural":"fovismelor","singular-vocative":"fovismule","plural-vocative":"fovismelor"}},{"word":"fovist","pos":"noun","definitions":["fauvist"],"forms":{"plural":"foviști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fovist","accusative-definite-nominative-singular":"fovistul","accusative-indefinite-nominative-plural":"foviști","accusative-definite-nominative-plural":"foviștii","dative-genitive-indefinite-singular":"fovist","dative-definite-genitive-singular":"fovistului","dative-genitive-indefinite-plural":"foviști","dative-definite-genitive-plural":"foviștilor","singular-vocative":"fovistule","plural-vocative":"foviștilor"}},{"word":"fox","pos":"noun","definitions":["fox terrier"],"forms":{"plural":"focși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fox","accusative-definite-nominative-singular":"foxul","accusative-indefinite-nominative-plural":"focși","accusative-definite-nominative-plural":"focșii","dative-genitive-indefinite-singular":"fox","dative-definite-genitive-singular":"foxului","dative-genitive-indefinite-plural":"focși","dative-definite-genitive-plural":"focșilor","singular-vocative":"foxule","plural-vocative":"focșilor"}},{"word":"fox sârmos","pos":"noun","definitions":["wire fox terrier"],"forms":{"plural":"fox sârmoși"}},{"word":"foxterier","pos":"noun","definitions":["fox terrier"],"forms":{"plural":"foxterieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"foxterier","accusative-definite-nominative-singular":"foxterierul","accusative-indefinite-nominative-plural":"foxterieri","accusative-definite-nominative-plural":"foxterierii","dative-genitive-indefinite-singular":"foxterier","dative-definite-genitive-singular":"foxterierului","dative-genitive-indefinite-plural":"foxterieri","dative-definite-genitive-plural":"foxterierilor","singular-vocative":"foxterierule","plural-vocative":"foxterierilor"}},{"word":"foxtrot","pos":"noun","definitions":["foxtrot"],"forms":{"plural":"foxtroturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"foxtrot","accusative-definite-nominative-singular":"foxtrotul","accusative-indefinite-nominative-plural":"foxtroturi","accusative-definite-nominative-plural":"foxtroturile","dative-genitive-indefinite-singular":"foxtrot","dative-definite-genitive-singular":"foxtrotului","dative-genitive-indefinite-plural":"foxtroturi","dative-definite-genitive-plural":"foxtroturilor","singular-vocative":"foxtrotule","plural-vocative":"foxtroturilor"}},{"word":"foxtroturi","pos":"noun","definitions":["plural of foxtrot"]},{"word":"frac","pos":"noun","definitions":["white tie and tails"],"forms":{"plural":"fracuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frac","accusative-definite-nominative-singular":"fracul","accusative-indefinite-nominative-plural":"fracuri","accusative-definite-nominative-plural":"fracurile","dative-genitive-indefinite-singular":"frac","dative-definite-genitive-singular":"fracului","dative-genitive-indefinite-plural":"fracuri","dative-definite-genitive-plural":"fracurilor","singular-vocative":"fracule","plural-vocative":"fracurilor"}},{"word":"fracție","pos":"noun","definitions":["fraction"],"forms":{"plural":"fracții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fracție","accusative-definite-nominative-singular":"fracția","accusative-indefinite-nominative-plural":"fracții","accusative-definite-nominative-plural":"fracțiile","dative-genitive-indefinite-singular":"fracții","dative-definite-genitive-singular":"fracției","dative-genitive-indefinite-plural":"fracții","dative-definite-genitive-plural":"fracțiilor","singular-vocative":"fracție","plural-vocative":"fracțiilor"}},{"word":"fracție zecimală","pos":"noun","definitions":["decimal fraction"],"forms":{"plural":"fracții zecimale"}},{"word":"fracționa","pos":"verb","definitions":["to fractionate"],"forms":{"canonical":"a fracționa 1st conjugation","present-singular-third-person":"fracționează","participle-past":"fracționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fracționa","gerund":"fracționând","first-person-indicative-present-singular":"fracționez","indicative-present-second-person-singular":"fracționezi","indicative-present-singular-third-person":"fracționează","first-person-indicative-plural-present":"fracționăm","indicative-plural-present-second-person":"fracționați","indicative-plural-present-third-person":"fracționează","first-person-imperfect-indicative-singular":"fracționam","imperfect-indicative-second-person-singular":"fracționai","imperfect-indicative-singular-third-person":"fracționa","first-person-imperfect-indicative-plural":"fracționam","imperfect-indicative-plural-second-person":"fracționați","imperfect-indicative-plural-third-person":"fracționau","first-person-indicative-perfect-singular":"fracționai","indicative-perfect-second-person-singular":"fracționași","indicative-perfect-singular-third-person":"fracționă","first-person-indicative-perfect-plural":"fracționarăm","indicative-perfect-plural-second-person":"fracționarăți","indicative-perfect-plural-third-person":"fracționară","first-person-indicative-pluperfect-singular":"fracționasem","indicative-pluperfect-second-person-singular":"fracționaseși","indicative-pluperfect-singular-third-person":"fracționase","first-person-indicative-pluperfect-plural":"fracționaserăm","indicative-pluperfect-plural-second-person":"fracționaserăți","indicative-pluperfect-plural-third-person":"fracționaseră","first-person-present-singular-subjunctive":"să fracționez","present-second-person-singular-subjunctive":"să fracționezi","present-singular-subjunctive-third-person":"să fracționeze","first-person-plural-present-subjunctive":"să fracționăm","plural-present-second-person-subjunctive":"să fracționați","plural-present-subjunctive-third-person":"să fracționeze","imperative-second-person-singular":"fracționează","imperative-plural-second-person":"fracționați","imperative-negative-second-person-singular":"nu fracționa","imperative-negative-plural-second-person":"nu fracționați"}},{"word":"fracțional","pos":"adj","definitions":["fractional"],"forms":{"feminine-singular":"fracțională","masculine-plural":"fracționali","feminine-neuter-plural":"fracționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fracțional","error-unrecognized-form-feminine-indefinite-singular":"fracțională","error-unrecognized-form-indefinite-masculine-plural":"fracționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fracționale","definite-error-unrecognized-form-masculine-neuter-singular":"fracționalul","definite-error-unrecognized-form-feminine-singular":"fracționala","definite-error-unrecognized-form-masculine-plural":"fracționalii","definite-error-unrecognized-form-feminine-neuter-plural":"fracționalele"}},{"word":"fracționar","pos":"adj","definitions":["fractional"],"forms":{"feminine-singular":"fracționară","masculine-plural":"fracționari","feminine-neuter-plural":"fracționare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fracționar","error-unrecognized-form-feminine-indefinite-singular":"fracționară","error-unrecognized-form-indefinite-masculine-plural":"fracționari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fracționare","definite-error-unrecognized-form-masculine-neuter-singular":"fracționarul","definite-error-unrecognized-form-feminine-singular":"fracționara","definite-error-unrecognized-form-masculine-plural":"fracționarii","definite-error-unrecognized-form-feminine-neuter-plural":"fracționarele"}},{"word":"fracționare","pos":"noun","definitions":["fractionation"],"forms":{"plural":"fracționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fracționare","accusative-definite-nominative-singular":"fracționarea","accusative-indefinite-nominative-plural":"fracționări","accusative-definite-nominative-plural":"fracționările","dative-genitive-indefinite-singular":"fracționări","dative-definite-genitive-singular":"fracționării","dative-genitive-indefinite-plural":"fracționări","dative-definite-genitive-plural":"fracționărilor","singular-vocative":"fracționare","plural-vocative":"fracționărilor"}},{"word":"fracționat","pos":"adj","definitions":["fractionated"],"forms":{"feminine-singular":"fracționată","masculine-plural":"fracționați","feminine-neuter-plural":"fracționate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fracționat","error-unrecognized-form-feminine-indefinite-singular":"fracționată","error-unrecognized-form-indefinite-masculine-plural":"fracționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fracționate","definite-error-unrecognized-form-masculine-neuter-singular":"fracționatul","definite-error-unrecognized-form-feminine-singular":"fracționata","definite-error-unrecognized-form-masculine-plural":"fracționații","definite-error-unrecognized-form-feminine-neuter-plural":"fracționatele"}},{"word":"fracționism","pos":"noun","definitions":["factionalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fracționism","accusative-definite-nominative-singular":"fracționismul","accusative-indefinite-nominative-plural":"fracționisme","accusative-definite-nominative-plural":"fracționismele","dative-genitive-indefinite-singular":"fracționism","dative-definite-genitive-singular":"fracționismului","dative-genitive-indefinite-plural":"fracționisme","dative-definite-genitive-plural":"fracționismelor","singular-vocative":"fracționismule","plural-vocative":"fracționismelor"}},{"word":"fracționist","pos":"adj","definitions":["factious"],"forms":{"feminine-singular":"fracționistă","masculine-plural":"fracționiști","feminine-neuter-plural":"fracționiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fracționist","error-unrecognized-form-feminine-indefinite-singular":"fracționistă","error-unrecognized-form-indefinite-masculine-plural":"fracționiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fracționiste","definite-error-unrecognized-form-masculine-neuter-singular":"fracționistul","definite-error-unrecognized-form-feminine-singular":"fracționista","definite-error-unrecognized-form-masculine-plural":"fracționiștii","definite-error-unrecognized-form-feminine-neuter-plural":"fracționistele"}},{"word":"fracționistă","pos":"noun","definitions":["female equivalent of fracționist"],"forms":{"plural":"fracționiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fracționistă","accusative-definite-nominative-singular":"fracționista","accusative-indefinite-nominative-plural":"fracționiste","accusative-definite-nominative-plural":"fracționistele","dative-genitive-indefinite-singular":"fracționiste","dative-definite-genitive-singular":"fracționistei","dative-genitive-indefinite-plural":"fracționiste","dative-definite-genitive-plural":"fracționistelor","singular-vocative":"fracționistă","plural-vocative":"fracționistelor"}},{"word":"fracțiune","pos":"noun","definitions":["fraction"],"forms":{"plural":"fracțiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fracțiune","accusative-definite-nominative-singular":"fracțiunea","accusative-indefinite-nominative-plural":"fracțiuni","accusative-definite-nominative-plural":"fracțiunile","dative-genitive-indefinite-singular":"fracțiuni","dative-definite-genitive-singular":"fracțiunii","dative-genitive-indefinite-plural":"fracțiuni","dative-definite-genitive-plural":"fracțiunilor","singular-vocative":"fracțiune","plural-vocative":"fracțiunilor"}},{"word":"fractocumulus","pos":"noun","definitions":["fractus"],"forms":{"plural":"fractocumulusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fractocumulus","accusative-definite-nominative-singular":"fractocumulusul","accusative-indefinite-nominative-plural":"fractocumulusuri","accusative-definite-nominative-plural":"fractocumulusurile","dative-genitive-indefinite-singular":"fractocumulus","dative-definite-genitive-singular":"fractocumulusului","dative-genitive-indefinite-plural":"fractocumulusuri","dative-definite-genitive-plural":"fractocumulusurilor","singular-vocative":"fractocumulusule","plural-vocative":"fractocumulusurilor"}},{"word":"fractur","pos":"noun","definitions":["fraktur"],"forms":{"plural":"fractururi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fractur","accusative-definite-nominative-singular":"fracturul","accusative-indefinite-nominative-plural":"fractururi","accusative-definite-nominative-plural":"fractururile","dative-genitive-indefinite-singular":"fractur","dative-definite-genitive-singular":"fracturului","dative-genitive-indefinite-plural":"fractururi","dative-definite-genitive-plural":"fractururilor","singular-vocative":"fracturule","plural-vocative":"fractururilor"}},{"word":"fractura","pos":"verb","definitions":["to fracture"],"forms":{"canonical":"a fractura 1st conjugation","present-singular-third-person":"fracturează","participle-past":"fracturat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fractura","gerund":"fracturând","first-person-indicative-present-singular":"fracturez","indicative-present-second-person-singular":"fracturezi","indicative-present-singular-third-person":"fracturează","first-person-indicative-plural-present":"fracturăm","indicative-plural-present-second-person":"fracturați","indicative-plural-present-third-person":"fracturează","first-person-imperfect-indicative-singular":"fracturam","imperfect-indicative-second-person-singular":"fracturai","imperfect-indicative-singular-third-person":"fractura","first-person-imperfect-indicative-plural":"fracturam","imperfect-indicative-plural-second-person":"fracturați","imperfect-indicative-plural-third-person":"fracturau","first-person-indicative-perfect-singular":"fracturai","indicative-perfect-second-person-singular":"fracturași","indicative-perfect-singular-third-person":"fractură","first-person-indicative-perfect-plural":"fracturarăm","indicative-perfect-plural-second-person":"fracturarăți","indicative-perfect-plural-third-person":"fracturară","first-person-indicative-pluperfect-singular":"fracturasem","indicative-pluperfect-second-person-singular":"fracturaseși","indicative-pluperfect-singular-third-person":"fracturase","first-person-indicative-pluperfect-plural":"fracturaserăm","indicative-pluperfect-plural-second-person":"fracturaserăți","indicative-pluperfect-plural-third-person":"fracturaseră","first-person-present-singular-subjunctive":"să fracturez","present-second-person-singular-subjunctive":"să fracturezi","present-singular-subjunctive-third-person":"să fractureze","first-person-plural-present-subjunctive":"să fracturăm","plural-present-second-person-subjunctive":"să fracturați","plural-present-subjunctive-third-person":"să fractureze","imperative-second-person-singular":"fracturează","imperative-plural-second-person":"fracturați","imperative-negative-second-person-singular":"nu fractura","imperative-negative-plural-second-person":"nu fracturați"}},{"word":"fractură","pos":"noun","definitions":["fracture (breaking of a bone or cartillage)","rough surface caused by the breaking of an object","fault (a fracture in a rock formation causing a discontinuity)"],"forms":{"plural":"fracturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fractură","accusative-definite-nominative-singular":"fractura","accusative-indefinite-nominative-plural":"fracturi","accusative-definite-nominative-plural":"fracturile","dative-genitive-indefinite-singular":"fracturi","dative-definite-genitive-singular":"fracturii","dative-genitive-indefinite-plural":"fracturi","dative-definite-genitive-plural":"fracturilor","singular-vocative":"fractură","plural-vocative":"fracturilor"}},{"word":"fracturai","pos":"verb","definitions":["inflection of fractura:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fraktuˈraj]"},{"word":"fracturam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fractura"],"pronunciation":"[fraktuˈram]"},{"word":"fracturare","pos":"noun","definitions":["fracture"],"forms":{"plural":"fracturări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fracturare","accusative-definite-nominative-singular":"fracturarea","accusative-indefinite-nominative-plural":"fracturări","accusative-definite-nominative-plural":"fracturările","dative-genitive-indefinite-singular":"fracturări","dative-definite-genitive-singular":"fracturării","dative-genitive-indefinite-plural":"fracturări","dative-definite-genitive-plural":"fracturărilor","singular-vocative":"fracturare","plural-vocative":"fracturărilor"}},{"word":"fracturase","pos":"verb","definitions":["third-person singular pluperfect indicative of fractura"],"pronunciation":"[fraktuˈrase]"},{"word":"fracturat","pos":"adj","definitions":["fractured"],"pronunciation":"[fraktuˈrat]","forms":{"feminine-singular":"fracturată","masculine-plural":"fracturați","feminine-neuter-plural":"fracturate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fracturat","error-unrecognized-form-feminine-indefinite-singular":"fracturată","error-unrecognized-form-indefinite-masculine-plural":"fracturați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fracturate","definite-error-unrecognized-form-masculine-neuter-singular":"fracturatul","definite-error-unrecognized-form-feminine-singular":"fracturata","definite-error-unrecognized-form-masculine-plural":"fracturații","definite-error-unrecognized-form-feminine-neuter-plural":"fracturatele"}},{"word":"fracturat","pos":"verb","definitions":["past participle of fractura"],"pronunciation":"[fraktuˈrat]","forms":{"participle-past":"of fractura"}},{"word":"fracturez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fractura"],"pronunciation":"[fraktuˈrez]"},{"word":"fracturi","pos":"noun","definitions":["plural of fractură"],"gender":"f-p"},{"word":"frag","pos":"noun","definitions":["woodland strawberry plant, Fragaria vesca"],"forms":{"plural":"fragi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frag","accusative-definite-nominative-singular":"fragul","accusative-indefinite-nominative-plural":"fragi","accusative-definite-nominative-plural":"fragii","dative-genitive-indefinite-singular":"frag","dative-definite-genitive-singular":"fragului","dative-genitive-indefinite-plural":"fragi","dative-definite-genitive-plural":"fragilor","singular-vocative":"fragule","plural-vocative":"fragilor"}},{"word":"fraga","pos":"noun","definitions":["definite nominative/accusative singular of fragă"],"pronunciation":"[ˈfraɡa]","gender":"f"},{"word":"Fragă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fragă"}},{"word":"fragă","pos":"noun","definitions":["the strawberry of the woodland strawberry or wild strawberry, Fragaria vesca (the fruit)","mulberry"],"pronunciation":"/ˈfra.ɡə/","forms":{"plural":"fragi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fragă","accusative-definite-nominative-singular":"fraga","accusative-indefinite-nominative-plural":"fragi","accusative-definite-nominative-plural":"fragile","dative-genitive-indefinite-singular":"fragi","dative-definite-genitive-singular":"fragii","dative-genitive-indefinite-plural":"fragi","dative-definite-genitive-plural":"fragilor","singular-vocative":"fragă","plural-vocative":"fragilor"}},{"word":"frăgar","pos":"noun","definitions":["mulberry (tree)"],"forms":{"plural":"frăgari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frăgar","accusative-definite-nominative-singular":"frăgarul","accusative-indefinite-nominative-plural":"frăgari","accusative-definite-nominative-plural":"frăgarii","dative-genitive-indefinite-singular":"frăgar","dative-definite-genitive-singular":"frăgarului","dative-genitive-indefinite-plural":"frăgari","dative-definite-genitive-plural":"frăgarilor","singular-vocative":"frăgarule","plural-vocative":"frăgarilor"}},{"word":"fraged","pos":"adj","definitions":["tender, delicate, frail, fragile, soft","unripe, green"],"pronunciation":"/ˈfra.d͡ʒed/","forms":{"feminine-singular":"fragedă","masculine-plural":"fragezi","feminine-neuter-plural":"fragede","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fraged","error-unrecognized-form-feminine-indefinite-singular":"fragedă","error-unrecognized-form-indefinite-masculine-plural":"fragezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fragede","definite-error-unrecognized-form-masculine-neuter-singular":"fragedul","definite-error-unrecognized-form-feminine-singular":"frageda","definite-error-unrecognized-form-masculine-plural":"fragezii","definite-error-unrecognized-form-feminine-neuter-plural":"fragedele"}},{"word":"frăgezi","pos":"verb","definitions":["to become tender, frail, fragile, soft"],"pronunciation":"/frə.d͡ʒeˈzi/","forms":{"canonical":"a frăgezi 4th conjugation","present-singular-third-person":"frăgezește","participle-past":"frăgezit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a frăgezi","gerund":"frăgezind","first-person-indicative-present-singular":"frăgezesc","indicative-present-second-person-singular":"frăgezești","indicative-present-singular-third-person":"frăgezește","first-person-indicative-plural-present":"frăgezim","indicative-plural-present-second-person":"frăgeziți","indicative-plural-present-third-person":"frăgezesc","first-person-imperfect-indicative-singular":"frăgezeam","imperfect-indicative-second-person-singular":"frăgezeai","imperfect-indicative-singular-third-person":"frăgezea","first-person-imperfect-indicative-plural":"frăgezeam","imperfect-indicative-plural-second-person":"frăgezeați","imperfect-indicative-plural-third-person":"frăgezeau","first-person-indicative-perfect-singular":"frăgezii","indicative-perfect-second-person-singular":"frăgeziși","indicative-perfect-singular-third-person":"frăgezi","first-person-indicative-perfect-plural":"frăgezirăm","indicative-perfect-plural-second-person":"frăgezirăți","indicative-perfect-plural-third-person":"frăgeziră","first-person-indicative-pluperfect-singular":"frăgezisem","indicative-pluperfect-second-person-singular":"frăgeziseși","indicative-pluperfect-singular-third-person":"frăgezise","first-person-indicative-pluperfect-plural":"frăgeziserăm","indicative-pluperfect-plural-second-person":"frăgeziserăți","indicative-pluperfect-plural-third-person":"frăgeziseră","first-person-present-singular-subjunctive":"să frăgezesc","present-second-person-singular-subjunctive":"să frăgezești","present-singular-subjunctive-third-person":"să frăgezească","first-person-plural-present-subjunctive":"să frăgezim","plural-present-second-person-subjunctive":"să frăgeziți","plural-present-subjunctive-third-person":"să frăgezească","imperative-second-person-singular":"frăgezește","imperative-plural-second-person":"frăgeziți","imperative-negative-second-person-singular":"nu frăgezi","imperative-negative-plural-second-person":"nu frăgeziți"}},{"word":"frăgezie","pos":"noun","definitions":["tenderness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"frăgezie","accusative-definite-nominative":"frăgezia","dative-genitive-indefinite":"frăgezii","dative-definite-genitive":"frăgeziei","vocative":"frăgezie"}},{"word":"frăgezime","pos":"noun","definitions":["tenderness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"frăgezime","accusative-definite-nominative":"frăgezimea","dative-genitive-indefinite":"frăgezimi","dative-definite-genitive":"frăgezimii","vocative":"frăgezime"}},{"word":"frăgezire","pos":"noun","definitions":["shortening"],"forms":{"plural":"frăgeziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frăgezire","accusative-definite-nominative-singular":"frăgezirea","accusative-indefinite-nominative-plural":"frăgeziri","accusative-definite-nominative-plural":"frăgezirile","dative-genitive-indefinite-singular":"frăgeziri","dative-definite-genitive-singular":"frăgezirii","dative-genitive-indefinite-plural":"frăgeziri","dative-definite-genitive-plural":"frăgezirilor","singular-vocative":"frăgezire","plural-vocative":"frăgezirilor"}},{"word":"frăgezit","pos":"adj","definitions":["tenderized"],"forms":{"feminine-singular":"frăgezită","masculine-plural":"frăgeziți","feminine-neuter-plural":"frăgezite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frăgezit","error-unrecognized-form-feminine-indefinite-singular":"frăgezită","error-unrecognized-form-indefinite-masculine-plural":"frăgeziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frăgezite","definite-error-unrecognized-form-masculine-neuter-singular":"frăgezitul","definite-error-unrecognized-form-feminine-singular":"frăgezita","definite-error-unrecognized-form-masculine-plural":"frăgeziții","definite-error-unrecognized-form-feminine-neuter-plural":"frăgezitele"}},{"word":"frăgezit","pos":"verb","definitions":["past participle of frăgezi"],"forms":{"participle-past":"of frăgezi"}},{"word":"fragi","pos":"noun","definitions":["plural of fragă (“strawberries”)"],"gender":"f-p"},{"word":"fragil","pos":"adj","definitions":["fragile"],"pronunciation":"/fraˈd͡ʒil/","forms":{"feminine-singular":"fragilă","masculine-plural":"fragili","feminine-neuter-plural":"fragile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fragil","error-unrecognized-form-feminine-indefinite-singular":"fragilă","error-unrecognized-form-indefinite-masculine-plural":"fragili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fragile","definite-error-unrecognized-form-masculine-neuter-singular":"fragilul","definite-error-unrecognized-form-feminine-singular":"fragila","definite-error-unrecognized-form-masculine-plural":"fragilii","definite-error-unrecognized-form-feminine-neuter-plural":"fragilele"}},{"word":"fragilitate","pos":"noun","definitions":["fragility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fragilitate","accusative-definite-nominative":"fragilitatea","dative-genitive-indefinite":"fragilități","dative-definite-genitive":"fragilității","vocative":"fragilitate"}},{"word":"fragilizare","pos":"noun","definitions":["fragilization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fragilizare","accusative-definite-nominative":"fragilizarea","dative-genitive-indefinite":"fragilizări","dative-definite-genitive":"fragilizării","vocative":"fragilizare"}},{"word":"fragment","pos":"noun","definitions":["fragment"],"pronunciation":"/fraɡˈment/","forms":{"plural":"fragmente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fragment","accusative-definite-nominative-singular":"fragmentul","accusative-indefinite-nominative-plural":"fragmente","accusative-definite-nominative-plural":"fragmentele","dative-genitive-indefinite-singular":"fragment","dative-definite-genitive-singular":"fragmentului","dative-genitive-indefinite-plural":"fragmente","dative-definite-genitive-plural":"fragmentelor","singular-vocative":"fragmentule","plural-vocative":"fragmentelor"}},{"word":"fragmenta","pos":"verb","definitions":["to fragment"],"pronunciation":"/fraɡ.menˈta/","forms":{"canonical":"a fragmenta 1st conjugation","present-singular-third-person":"fragmentează","participle-past":"fragmentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fragmenta","gerund":"fragmentând","first-person-indicative-present-singular":"fragmentez","indicative-present-second-person-singular":"fragmentezi","indicative-present-singular-third-person":"fragmentează","first-person-indicative-plural-present":"fragmentăm","indicative-plural-present-second-person":"fragmentați","indicative-plural-present-third-person":"fragmentează","first-person-imperfect-indicative-singular":"fragmentam","imperfect-indicative-second-person-singular":"fragmentai","imperfect-indicative-singular-third-person":"fragmenta","first-person-imperfect-indicative-plural":"fragmentam","imperfect-indicative-plural-second-person":"fragmentați","imperfect-indicative-plural-third-person":"fragmentau","first-person-indicative-perfect-singular":"fragmentai","indicative-perfect-second-person-singular":"fragmentași","indicative-perfect-singular-third-person":"fragmentă","first-person-indicative-perfect-plural":"fragmentarăm","indicative-perfect-plural-second-person":"fragmentarăți","indicative-perfect-plural-third-person":"fragmentară","first-person-indicative-pluperfect-singular":"fragmentasem","indicative-pluperfect-second-person-singular":"fragmentaseși","indicative-pluperfect-singular-third-person":"fragmentase","first-person-indicative-pluperfect-plural":"fragmentaserăm","indicative-pluperfect-plural-second-person":"fragmentaserăți","indicative-pluperfect-plural-third-person":"fragmentaseră","first-person-present-singular-subjunctive":"să fragmentez","present-second-person-singular-subjunctive":"să fragmentezi","present-singular-subjunctive-third-person":"să fragmenteze","first-person-plural-present-subjunctive":"să fragmentăm","plural-present-second-person-subjunctive":"să fragmentați","plural-present-subjunctive-third-person":"să fragmenteze","imperative-second-person-singular":"fragmentează","imperative-plural-second-person":"fragmentați","imperative-negative-second-person-singular":"nu fragmenta","imperative-negative-plural-second-person":"nu fragmentați"}},{"word":"fragmentar","pos":"adj","definitions":["fragmentary"],"forms":{"feminine-singular":"fragmentară","masculine-plural":"fragmentari","feminine-neuter-plural":"fragmentare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fragmentar","error-unrecognized-form-feminine-indefinite-singular":"fragmentară","error-unrecognized-form-indefinite-masculine-plural":"fragmentari","error-unrecognized-form-feminine-indefinite-neuter-plural":"fragmentare","definite-error-unrecognized-form-masculine-neuter-singular":"fragmentarul","definite-error-unrecognized-form-feminine-singular":"fragmentara","definite-error-unrecognized-form-masculine-plural":"fragmentarii","definite-error-unrecognized-form-feminine-neuter-plural":"fragmentarele"}},{"word":"fragmentare","pos":"noun","definitions":["fragmentation"],"forms":{"plural":"fragmentări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fragmentare","accusative-definite-nominative-singular":"fragmentarea","accusative-indefinite-nominative-plural":"fragmentări","accusative-definite-nominative-plural":"fragmentările","dative-genitive-indefinite-singular":"fragmentări","dative-definite-genitive-singular":"fragmentării","dative-genitive-indefinite-plural":"fragmentări","dative-definite-genitive-plural":"fragmentărilor","singular-vocative":"fragmentare","plural-vocative":"fragmentărilor"}},{"word":"fragmentat","pos":"adj","definitions":["fragmented"],"forms":{"feminine-singular":"fragmentată","masculine-plural":"fragmentați","feminine-neuter-plural":"fragmentate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fragmentat","error-unrecognized-form-feminine-indefinite-singular":"fragmentată","error-unrecognized-form-indefinite-masculine-plural":"fragmentați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fragmentate","definite-error-unrecognized-form-masculine-neuter-singular":"fragmentatul","definite-error-unrecognized-form-feminine-singular":"fragmentata","definite-error-unrecognized-form-masculine-plural":"fragmentații","definite-error-unrecognized-form-feminine-neuter-plural":"fragmentatele"}},{"word":"fragmentat","pos":"verb","definitions":["past participle of fragmenta"],"forms":{"participle-past":"of fragmenta"}},{"word":"fragmentație","pos":"noun","definitions":["fragmentation"],"forms":{"plural":"fragmentații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fragmentație","accusative-definite-nominative-singular":"fragmentația","accusative-indefinite-nominative-plural":"fragmentații","accusative-definite-nominative-plural":"fragmentațiile","dative-genitive-indefinite-singular":"fragmentații","dative-definite-genitive-singular":"fragmentației","dative-genitive-indefinite-plural":"fragmentații","dative-definite-genitive-plural":"fragmentațiilor","singular-vocative":"fragmentație","plural-vocative":"fragmentațiilor"}},{"word":"fragmentațiune","pos":"noun","definitions":["alternative form of fragmentație"],"forms":{"plural":"fragmentațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fragmentațiune","accusative-definite-nominative-singular":"fragmentațiunea","accusative-indefinite-nominative-plural":"fragmentațiuni","accusative-definite-nominative-plural":"fragmentațiunile","dative-genitive-indefinite-singular":"fragmentațiuni","dative-definite-genitive-singular":"fragmentațiunii","dative-genitive-indefinite-plural":"fragmentațiuni","dative-definite-genitive-plural":"fragmentațiunilor","singular-vocative":"fragmentațiune","plural-vocative":"fragmentațiunilor"}},{"word":"frago","pos":"noun","definitions":["vocative singular of fragă"],"pronunciation":"[ˈfraɡo]","gender":"f"},{"word":"fragrant","pos":"adj","definitions":["fragrant"],"forms":{"feminine-singular":"fragrantă","masculine-plural":"fragranți","feminine-neuter-plural":"fragrante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fragrant","error-unrecognized-form-feminine-indefinite-singular":"fragrantă","error-unrecognized-form-indefinite-masculine-plural":"fragranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fragrante","definite-error-unrecognized-form-masculine-neuter-singular":"fragrantul","definite-error-unrecognized-form-feminine-singular":"fragranta","definite-error-unrecognized-form-masculine-plural":"fragranții","definite-error-unrecognized-form-feminine-neuter-plural":"fragrantele"}},{"word":"fragranță","pos":"noun","definitions":["fragrance"],"forms":{"plural":"fragranțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fragranță","accusative-definite-nominative-singular":"fragranța","accusative-indefinite-nominative-plural":"fragranțe","accusative-definite-nominative-plural":"fragranțele","dative-genitive-indefinite-singular":"fragranțe","dative-definite-genitive-singular":"fragranței","dative-genitive-indefinite-plural":"fragranțe","dative-definite-genitive-plural":"fragranțelor","singular-vocative":"fragranță","plural-vocative":"fragranțelor"}},{"word":"frăguliță","pos":"noun","definitions":["diminutive of fragă; small wild strawberry"],"forms":{"plural":"frăgulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frăguliță","accusative-definite-nominative-singular":"frăgulița","accusative-indefinite-nominative-plural":"frăgulițe","accusative-definite-nominative-plural":"frăgulițele","dative-genitive-indefinite-singular":"frăgulițe","dative-definite-genitive-singular":"frăguliței","dative-genitive-indefinite-plural":"frăgulițe","dative-definite-genitive-plural":"frăgulițelor","singular-vocative":"frăguliță","plural-vocative":"frăgulițelor"}},{"word":"frăgușoară","pos":"noun","definitions":["diminutive of fragă; small wild strawberry"],"forms":{"plural":"frăgușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frăgușoară","accusative-definite-nominative-singular":"frăgușoara","accusative-indefinite-nominative-plural":"frăgușoare","accusative-definite-nominative-plural":"frăgușoarele","dative-genitive-indefinite-singular":"frăgușoare","dative-definite-genitive-singular":"frăgușoarei","dative-genitive-indefinite-plural":"frăgușoare","dative-definite-genitive-plural":"frăgușoarelor","singular-vocative":"frăgușoară","plural-vocative":"frăgușoarelor"}},{"word":"frăgușor","pos":"noun","definitions":["diminutive of frag"],"forms":{"plural":"frăgușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frăgușor","accusative-definite-nominative-singular":"frăgușorul","accusative-indefinite-nominative-plural":"frăgușori","accusative-definite-nominative-plural":"frăgușorii","dative-genitive-indefinite-singular":"frăgușor","dative-definite-genitive-singular":"frăgușorului","dative-genitive-indefinite-plural":"frăgușori","dative-definite-genitive-plural":"frăgușorilor","singular-vocative":"frăgușorule","plural-vocative":"frăgușorilor"}},{"word":"fraguță","pos":"noun","definitions":["diminutive of fragă; small wild strawberry"],"forms":{"plural":"frăguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frăguță","accusative-definite-nominative-singular":"frăguța","accusative-indefinite-nominative-plural":"frăguțe","accusative-definite-nominative-plural":"frăguțele","dative-genitive-indefinite-singular":"frăguțe","dative-definite-genitive-singular":"frăguței","dative-genitive-indefinite-plural":"frăguțe","dative-definite-genitive-plural":"frăguțelor","singular-vocative":"frăguță","plural-vocative":"frăguțelor"}},{"word":"frăguță","pos":"noun","definitions":["diminutive of fragă; small wild strawberry"],"forms":{"plural":"frăguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frăguță","accusative-definite-nominative-singular":"frăguța","accusative-indefinite-nominative-plural":"frăguțe","accusative-definite-nominative-plural":"frăguțele","dative-genitive-indefinite-singular":"frăguțe","dative-definite-genitive-singular":"frăguței","dative-genitive-indefinite-plural":"frăguțe","dative-definite-genitive-plural":"frăguțelor","singular-vocative":"frăguță","plural-vocative":"frăguțelor"}},{"word":"fraht","pos":"noun","definitions":["freight document"],"forms":{"plural":"frahturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fraht","accusative-definite-nominative-singular":"frahtul","accusative-indefinite-nominative-plural":"frahturi","accusative-definite-nominative-plural":"frahturile","dative-genitive-indefinite-singular":"fraht","dative-definite-genitive-singular":"frahtului","dative-genitive-indefinite-plural":"frahturi","dative-definite-genitive-plural":"frahturilor","singular-vocative":"frahtule","plural-vocative":"frahturilor"}},{"word":"frai","pos":"adv","definitions":["free"]},{"word":"fraier","pos":"noun","definitions":["stupid person","sucker, mug"],"pronunciation":"/ˈfrajer/","forms":{"plural":"fraieri","feminine":"equivalent fraieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fraier","accusative-definite-nominative-singular":"fraierul","accusative-indefinite-nominative-plural":"fraieri","accusative-definite-nominative-plural":"fraierii","dative-genitive-indefinite-singular":"fraier","dative-definite-genitive-singular":"fraierului","dative-genitive-indefinite-plural":"fraieri","dative-definite-genitive-plural":"fraierilor","singular-vocative":"fraierule","plural-vocative":"fraierilor"}},{"word":"fraieră","pos":"noun","definitions":["female equivalent of fraier"],"forms":{"plural":"fraiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fraieră","accusative-definite-nominative-singular":"fraiera","accusative-indefinite-nominative-plural":"fraiere","accusative-definite-nominative-plural":"fraierele","dative-genitive-indefinite-singular":"fraiere","dative-definite-genitive-singular":"fraierei","dative-genitive-indefinite-plural":"fraiere","dative-definite-genitive-plural":"fraierelor","singular-vocative":"fraieră","plural-vocative":"fraierelor"}},{"word":"fraiereală","pos":"noun","definitions":["farce","fraud"],"forms":{"plural":"fraiereli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fraiereală","accusative-definite-nominative-singular":"fraiereala","accusative-indefinite-nominative-plural":"fraierele","accusative-definite-nominative-plural":"fraierelele","dative-genitive-indefinite-singular":"fraierele","dative-definite-genitive-singular":"fraierelei","dative-genitive-indefinite-plural":"fraierele","dative-definite-genitive-plural":"fraierelelor","singular-vocative":"fraiereală","plural-vocative":"fraierelelor"}},{"word":"fraieri","pos":"verb","definitions":["to cheat, to trick, to deceive"],"forms":{"canonical":"a fraieri 4th conjugation","present-singular-third-person":"fraierește","participle-past":"fraierit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fraieri","gerund":"fraierind","first-person-indicative-present-singular":"fraieresc","indicative-present-second-person-singular":"fraierești","indicative-present-singular-third-person":"fraierește","first-person-indicative-plural-present":"fraierim","indicative-plural-present-second-person":"fraieriți","indicative-plural-present-third-person":"fraieresc","first-person-imperfect-indicative-singular":"fraieream","imperfect-indicative-second-person-singular":"fraiereai","imperfect-indicative-singular-third-person":"fraierea","first-person-imperfect-indicative-plural":"fraieream","imperfect-indicative-plural-second-person":"fraiereați","imperfect-indicative-plural-third-person":"fraiereau","first-person-indicative-perfect-singular":"fraierii","indicative-perfect-second-person-singular":"fraieriși","indicative-perfect-singular-third-person":"fraieri","first-person-indicative-perfect-plural":"fraierirăm","indicative-perfect-plural-second-person":"fraierirăți","indicative-perfect-plural-third-person":"fraieriră","first-person-indicative-pluperfect-singular":"fraierisem","indicative-pluperfect-second-person-singular":"fraieriseși","indicative-pluperfect-singular-third-person":"fraierise","first-person-indicative-pluperfect-plural":"fraieriserăm","indicative-pluperfect-plural-second-person":"fraieriserăți","indicative-pluperfect-plural-third-person":"fraieriseră","first-person-present-singular-subjunctive":"să fraieresc","present-second-person-singular-subjunctive":"să fraierești","present-singular-subjunctive-third-person":"să fraierească","first-person-plural-present-subjunctive":"să fraierim","plural-present-second-person-subjunctive":"să fraieriți","plural-present-subjunctive-third-person":"să fraierească","imperative-second-person-singular":"fraierește","imperative-plural-second-person":"fraieriți","imperative-negative-second-person-singular":"nu fraieri","imperative-negative-plural-second-person":"nu fraieriți"}},{"word":"frâișor","pos":"noun","definitions":["diminutive of frâu"],"forms":{"plural":"frâișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frâișor","accusative-definite-nominative-singular":"frâișorul","accusative-indefinite-nominative-plural":"frâișoare","accusative-definite-nominative-plural":"frâișoarele","dative-genitive-indefinite-singular":"frâișor","dative-definite-genitive-singular":"frâișorului","dative-genitive-indefinite-plural":"frâișoare","dative-definite-genitive-plural":"frâișoarelor","singular-vocative":"frâișorule","plural-vocative":"frâișoarelor"}},{"word":"frământ","pos":"noun","definitions":["disquietude"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frământ","accusative-definite-nominative":"frământul","dative-genitive-indefinite":"frământ","dative-definite-genitive":"frământului","vocative":"frământule"}},{"word":"frământ","pos":"verb","definitions":["first-person singular present indicative/subjunctive of frământa"]},{"word":"frământa","pos":"verb","definitions":["to knead","to work, temper","to stir, churn, agitate","to fret, fuss"],"pronunciation":"/frə.mɨnˈta/","forms":{"canonical":"a frământa 1st conjugation","present-singular-third-person":"frământă","participle-past":"frământat","subjunctive-third-person":"frământe","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a frământa","gerund":"frământând","first-person-indicative-present-singular":"frământ","indicative-present-second-person-singular":"frămânți","indicative-present-singular-third-person":"frământă","first-person-indicative-plural-present":"frământăm","indicative-plural-present-second-person":"frământați","indicative-plural-present-third-person":"frământă","first-person-imperfect-indicative-singular":"frământam","imperfect-indicative-second-person-singular":"frământai","imperfect-indicative-singular-third-person":"frământa","first-person-imperfect-indicative-plural":"frământam","imperfect-indicative-plural-second-person":"frământați","imperfect-indicative-plural-third-person":"frământau","first-person-indicative-perfect-singular":"frământai","indicative-perfect-second-person-singular":"frământași","indicative-perfect-singular-third-person":"frământă","first-person-indicative-perfect-plural":"frământarăm","indicative-perfect-plural-second-person":"frământarăți","indicative-perfect-plural-third-person":"frământară","first-person-indicative-pluperfect-singular":"frământasem","indicative-pluperfect-second-person-singular":"frământaseși","indicative-pluperfect-singular-third-person":"frământase","first-person-indicative-pluperfect-plural":"frământaserăm","indicative-pluperfect-plural-second-person":"frământaserăți","indicative-pluperfect-plural-third-person":"frământaseră","first-person-present-singular-subjunctive":"să frământ","present-second-person-singular-subjunctive":"să frămânți","present-singular-subjunctive-third-person":"să frământe","first-person-plural-present-subjunctive":"să frământăm","plural-present-second-person-subjunctive":"să frământați","plural-present-subjunctive-third-person":"să frământe","imperative-second-person-singular":"frământă","imperative-plural-second-person":"frământați","imperative-negative-second-person-singular":"nu frământa","imperative-negative-plural-second-person":"nu frământați","alternative":"frămînta"}},{"word":"frământare","pos":"noun","definitions":["disquietude (a state of disquiet, uneasiness, or anxiety)"],"forms":{"plural":"frământări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frământare","accusative-definite-nominative-singular":"frământarea","accusative-indefinite-nominative-plural":"frământări","accusative-definite-nominative-plural":"frământările","dative-genitive-indefinite-singular":"frământări","dative-definite-genitive-singular":"frământării","dative-genitive-indefinite-plural":"frământări","dative-definite-genitive-plural":"frământărilor","singular-vocative":"frământare","plural-vocative":"frământărilor"}},{"word":"frământat","pos":"adj","definitions":["tumultuous"],"forms":{"feminine-singular":"frământată","masculine-plural":"frământați","feminine-neuter-plural":"frământate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frământat","error-unrecognized-form-feminine-indefinite-singular":"frământată","error-unrecognized-form-indefinite-masculine-plural":"frământați","error-unrecognized-form-feminine-indefinite-neuter-plural":"frământate","definite-error-unrecognized-form-masculine-neuter-singular":"frământatul","definite-error-unrecognized-form-feminine-singular":"frământata","definite-error-unrecognized-form-masculine-plural":"frământații","definite-error-unrecognized-form-feminine-neuter-plural":"frământatele"}},{"word":"frământat","pos":"verb","definitions":["past participle of frământa"],"forms":{"participle-past":"of frământa"}},{"word":"frământător","pos":"noun","definitions":["kneader"],"forms":{"plural":"frământătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frământător","accusative-definite-nominative-singular":"frământătorul","accusative-indefinite-nominative-plural":"frământătoare","accusative-definite-nominative-plural":"frământătoarele","dative-genitive-indefinite-singular":"frământător","dative-definite-genitive-singular":"frământătorului","dative-genitive-indefinite-plural":"frământătoare","dative-definite-genitive-plural":"frământătoarelor","singular-vocative":"frământătorule","plural-vocative":"frământătoarelor"}},{"word":"frământătură","pos":"noun","definitions":["kneading"],"forms":{"plural":"frământături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frământătură","accusative-definite-nominative-singular":"frământătura","accusative-indefinite-nominative-plural":"frământături","accusative-definite-nominative-plural":"frământăturile","dative-genitive-indefinite-singular":"frământături","dative-definite-genitive-singular":"frământăturii","dative-genitive-indefinite-plural":"frământături","dative-definite-genitive-plural":"frământăturilor","singular-vocative":"frământătură","plural-vocative":"frământăturilor"}},{"word":"frâmbiat","pos":"adj","definitions":["having curly wool"],"pronunciation":"/frɨm.biˈat/","forms":{"feminine-singular":"frâmbiată","masculine-plural":"frâmbiați","feminine-neuter-plural":"frâmbiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frâmbiat","error-unrecognized-form-feminine-indefinite-singular":"frâmbiată","error-unrecognized-form-indefinite-masculine-plural":"frâmbiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"frâmbiate","definite-error-unrecognized-form-masculine-neuter-singular":"frâmbiatul","definite-error-unrecognized-form-feminine-singular":"frâmbiata","definite-error-unrecognized-form-masculine-plural":"frâmbiații","definite-error-unrecognized-form-feminine-neuter-plural":"frâmbiatele"}},{"word":"frâmbie","pos":"noun","definitions":["obsolete form of frânghie"],"forms":{"plural":"frâmbii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frâmbie","accusative-definite-nominative-singular":"frâmbia","accusative-indefinite-nominative-plural":"frâmbii","accusative-definite-nominative-plural":"frâmbiile","dative-genitive-indefinite-singular":"frâmbii","dative-definite-genitive-singular":"frâmbiei","dative-genitive-indefinite-plural":"frâmbii","dative-definite-genitive-plural":"frâmbiilor","singular-vocative":"frâmbie","plural-vocative":"frâmbiilor"}},{"word":"frâna","pos":"verb","definitions":["to brake (to operate brakes)"],"pronunciation":"/frɨˈna/","forms":{"canonical":"a frâna 1st conjugation","present-singular-third-person":"frânează","participle-past":"frânat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frâna","gerund":"frânând","first-person-indicative-present-singular":"frânez","indicative-present-second-person-singular":"frânezi","indicative-present-singular-third-person":"frânează","first-person-indicative-plural-present":"frânăm","indicative-plural-present-second-person":"frânați","indicative-plural-present-third-person":"frânează","first-person-imperfect-indicative-singular":"frânam","imperfect-indicative-second-person-singular":"frânai","imperfect-indicative-singular-third-person":"frâna","first-person-imperfect-indicative-plural":"frânam","imperfect-indicative-plural-second-person":"frânați","imperfect-indicative-plural-third-person":"frânau","first-person-indicative-perfect-singular":"frânai","indicative-perfect-second-person-singular":"frânași","indicative-perfect-singular-third-person":"frână","first-person-indicative-perfect-plural":"frânarăm","indicative-perfect-plural-second-person":"frânarăți","indicative-perfect-plural-third-person":"frânară","first-person-indicative-pluperfect-singular":"frânasem","indicative-pluperfect-second-person-singular":"frânaseși","indicative-pluperfect-singular-third-person":"frânase","first-person-indicative-pluperfect-plural":"frânaserăm","indicative-pluperfect-plural-second-person":"frânaserăți","indicative-pluperfect-plural-third-person":"frânaseră","first-person-present-singular-subjunctive":"să frânez","present-second-person-singular-subjunctive":"să frânezi","present-singular-subjunctive-third-person":"să frâneze","first-person-plural-present-subjunctive":"să frânăm","plural-present-second-person-subjunctive":"să frânați","plural-present-subjunctive-third-person":"să frâneze","imperative-second-person-singular":"frânează","imperative-plural-second-person":"frânați","imperative-negative-second-person-singular":"nu frâna","imperative-negative-plural-second-person":"nu frânați"}},{"word":"frână","pos":"noun","definitions":["brake"],"pronunciation":"/ˈfrɨ.nə/","forms":{"plural":"frâne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frână","accusative-definite-nominative-singular":"frâna","accusative-indefinite-nominative-plural":"frâne","accusative-definite-nominative-plural":"frânele","dative-genitive-indefinite-singular":"frâne","dative-definite-genitive-singular":"frânei","dative-genitive-indefinite-plural":"frâne","dative-definite-genitive-plural":"frânelor","singular-vocative":"frână","plural-vocative":"frânelor"}},{"word":"frânaj","pos":"noun","definitions":["breaking, deceleration"],"forms":{"plural":"frânaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frânaj","accusative-definite-nominative-singular":"frânajul","accusative-indefinite-nominative-plural":"frânaje","accusative-definite-nominative-plural":"frânajele","dative-genitive-indefinite-singular":"frânaj","dative-definite-genitive-singular":"frânajului","dative-genitive-indefinite-plural":"frânaje","dative-definite-genitive-plural":"frânajelor","singular-vocative":"frânajule","plural-vocative":"frânajelor"}},{"word":"frânar","pos":"noun","definitions":["brakeman"],"forms":{"plural":"frânari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frânar","accusative-definite-nominative-singular":"frânarul","accusative-indefinite-nominative-plural":"frânari","accusative-definite-nominative-plural":"frânarii","dative-genitive-indefinite-singular":"frânar","dative-definite-genitive-singular":"frânarului","dative-genitive-indefinite-plural":"frânari","dative-definite-genitive-plural":"frânarilor","singular-vocative":"frânarule","plural-vocative":"frânarilor"}},{"word":"frânare","pos":"noun","definitions":["braking"],"forms":{"plural":"frânări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frânare","accusative-definite-nominative-singular":"frânarea","accusative-indefinite-nominative-plural":"frânări","accusative-definite-nominative-plural":"frânările","dative-genitive-indefinite-singular":"frânări","dative-definite-genitive-singular":"frânării","dative-genitive-indefinite-plural":"frânări","dative-definite-genitive-plural":"frânărilor","singular-vocative":"frânare","plural-vocative":"frânărilor"}},{"word":"frânat","pos":"noun","definitions":["brake"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frânat","accusative-definite-nominative":"frânatul","dative-genitive-indefinite":"frânat","dative-definite-genitive":"frânatului","vocative":"frânatule"}},{"word":"franc","pos":"noun","definitions":["a Frank (Germanic tribe)"],"pronunciation":"/fraŋk/","forms":{"plural":"franci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franc","accusative-definite-nominative-singular":"francul","accusative-indefinite-nominative-plural":"franci","accusative-definite-nominative-plural":"francii","dative-genitive-indefinite-singular":"franc","dative-definite-genitive-singular":"francului","dative-genitive-indefinite-plural":"franci","dative-definite-genitive-plural":"francilor","singular-vocative":"francule","plural-vocative":"francilor"}},{"word":"franc","pos":"adj","definitions":["of a Frank, Frankish"],"pronunciation":"/fraŋk/","forms":{"feminine-singular":"francă","masculine-plural":"franci","feminine-neuter-plural":"france","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franc","error-unrecognized-form-feminine-indefinite-singular":"francă","error-unrecognized-form-indefinite-masculine-plural":"franci","error-unrecognized-form-feminine-indefinite-neuter-plural":"france","definite-error-unrecognized-form-masculine-neuter-singular":"francul","definite-error-unrecognized-form-feminine-singular":"franca","definite-error-unrecognized-form-masculine-plural":"francii","definite-error-unrecognized-form-feminine-neuter-plural":"francele"}},{"word":"franc","pos":"noun","definitions":["a franc (currency)"],"pronunciation":"/fraŋk/","forms":{"plural":"franci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franc","accusative-definite-nominative-singular":"francul","accusative-indefinite-nominative-plural":"franci","accusative-definite-nominative-plural":"francii","dative-genitive-indefinite-singular":"franc","dative-definite-genitive-singular":"francului","dative-genitive-indefinite-plural":"franci","dative-definite-genitive-plural":"francilor","singular-vocative":"francule","plural-vocative":"francilor"}},{"word":"franc","pos":"adj","definitions":["frank, sincere, honest"],"pronunciation":"/fraŋk/","forms":{"feminine-singular":"francă","masculine-plural":"franci","feminine-neuter-plural":"france","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franc","error-unrecognized-form-feminine-indefinite-singular":"francă","error-unrecognized-form-indefinite-masculine-plural":"franci","error-unrecognized-form-feminine-indefinite-neuter-plural":"france","definite-error-unrecognized-form-masculine-neuter-singular":"francul","definite-error-unrecognized-form-feminine-singular":"franca","definite-error-unrecognized-form-masculine-plural":"francii","definite-error-unrecognized-form-feminine-neuter-plural":"francele"}},{"word":"Frânc","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Frânc"}},{"word":"frânc","pos":"noun","definitions":["name given in the past to a person from a western European country of Latin origin, especially from France"],"forms":{"plural":"frânci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frânc","accusative-definite-nominative-singular":"frâncul","accusative-indefinite-nominative-plural":"frânci","accusative-definite-nominative-plural":"frâncii","dative-genitive-indefinite-singular":"frânc","dative-definite-genitive-singular":"frâncului","dative-genitive-indefinite-plural":"frânci","dative-definite-genitive-plural":"frâncilor","singular-vocative":"frâncule","plural-vocative":"frâncilor"}},{"word":"franca","pos":"verb","definitions":["to stamp a letter"],"forms":{"canonical":"a franca 1st conjugation","present-singular-third-person":"franchează","participle-past":"francat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a franca","gerund":"francând","first-person-indicative-present-singular":"franchez","indicative-present-second-person-singular":"franchezi","indicative-present-singular-third-person":"franchează","first-person-indicative-plural-present":"francăm","indicative-plural-present-second-person":"francați","indicative-plural-present-third-person":"franchează","first-person-imperfect-indicative-singular":"francam","imperfect-indicative-second-person-singular":"francai","imperfect-indicative-singular-third-person":"franca","first-person-imperfect-indicative-plural":"francam","imperfect-indicative-plural-second-person":"francați","imperfect-indicative-plural-third-person":"francau","first-person-indicative-perfect-singular":"francai","indicative-perfect-second-person-singular":"francași","indicative-perfect-singular-third-person":"francă","first-person-indicative-perfect-plural":"francarăm","indicative-perfect-plural-second-person":"francarăți","indicative-perfect-plural-third-person":"francară","first-person-indicative-pluperfect-singular":"francasem","indicative-pluperfect-second-person-singular":"francaseși","indicative-pluperfect-singular-third-person":"francase","first-person-indicative-pluperfect-plural":"francaserăm","indicative-pluperfect-plural-second-person":"francaserăți","indicative-pluperfect-plural-third-person":"francaseră","first-person-present-singular-subjunctive":"să franchez","present-second-person-singular-subjunctive":"să franchezi","present-singular-subjunctive-third-person":"să francheze","first-person-plural-present-subjunctive":"să francăm","plural-present-second-person-subjunctive":"să francați","plural-present-subjunctive-third-person":"să francheze","imperative-second-person-singular":"franchează","imperative-plural-second-person":"francați","imperative-negative-second-person-singular":"nu franca","imperative-negative-plural-second-person":"nu francați"}},{"word":"Frânca","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Orjogoaia"],"gender":"f"},{"word":"frâncă","pos":"noun","definitions":["female equivalent of frânc"],"forms":{"plural":"frânce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frâncă","accusative-definite-nominative-singular":"frânca","accusative-indefinite-nominative-plural":"frânce","accusative-definite-nominative-plural":"frâncele","dative-genitive-indefinite-singular":"frânce","dative-definite-genitive-singular":"frâncei","dative-genitive-indefinite-plural":"frânce","dative-definite-genitive-plural":"frâncelor","singular-vocative":"frâncă","plural-vocative":"frâncelor"}},{"word":"francare","pos":"noun","definitions":["stamping"],"forms":{"plural":"francări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"francare","accusative-definite-nominative-singular":"francarea","accusative-indefinite-nominative-plural":"francări","accusative-definite-nominative-plural":"francările","dative-genitive-indefinite-singular":"francări","dative-definite-genitive-singular":"francării","dative-genitive-indefinite-plural":"francări","dative-definite-genitive-plural":"francărilor","singular-vocative":"francare","plural-vocative":"francărilor"}},{"word":"francat","pos":"adj","definitions":["stamped (applied a stamp)"],"forms":{"feminine-singular":"francată","masculine-plural":"francați","feminine-neuter-plural":"francate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"francat","error-unrecognized-form-feminine-indefinite-singular":"francată","error-unrecognized-form-indefinite-masculine-plural":"francați","error-unrecognized-form-feminine-indefinite-neuter-plural":"francate","definite-error-unrecognized-form-masculine-neuter-singular":"francatul","definite-error-unrecognized-form-feminine-singular":"francata","definite-error-unrecognized-form-masculine-plural":"francații","definite-error-unrecognized-form-feminine-neuter-plural":"francatele"}},{"word":"francatură","pos":"noun","definitions":["franking"],"forms":{"plural":"francaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"francatură","accusative-definite-nominative-singular":"francatura","accusative-indefinite-nominative-plural":"francature","accusative-definite-nominative-plural":"francaturele","dative-genitive-indefinite-singular":"francature","dative-definite-genitive-singular":"francaturei","dative-genitive-indefinite-plural":"francature","dative-definite-genitive-plural":"francaturelor","singular-vocative":"francatură","plural-vocative":"francaturelor"}},{"word":"Frâncenii Boiului","pos":"name","definitions":["a village in Boiu Mare, Maramureș County, Romania"],"gender":"m"},{"word":"Frâncenii de Piatră","pos":"name","definitions":["a village in Gâlgău, Sălaj County, Romania"],"gender":"m"},{"word":"frâncesc","pos":"adj","definitions":["Frankish","Western European"],"forms":{"feminine-singular":"frâncească","plural":"frâncești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frâncesc","error-unrecognized-form-feminine-indefinite-singular":"frâncească","error-unrecognized-form-indefinite-masculine-plural":"frâncești","error-unrecognized-form-feminine-indefinite-neuter-plural":"frâncești","definite-error-unrecognized-form-masculine-neuter-singular":"frâncescul","definite-error-unrecognized-form-feminine-singular":"frânceasca","definite-error-unrecognized-form-masculine-plural":"frânceștii","definite-error-unrecognized-form-feminine-neuter-plural":"frânceștile"}},{"word":"Frâncești","pos":"name","definitions":["a village in Peștișani, Gorj County, Romania","a commune of Vâlcea County, Romania","a village in Frâncești, Vâlcea County, Romania"],"gender":"m"},{"word":"Frâncești-Coasta","pos":"name","definitions":["a village in Muereasca, Vâlcea County, Romania"],"gender":"f"},{"word":"francez","pos":"adj","definitions":["French"],"pronunciation":"[franˈt͡ʃez]","forms":{"feminine-singular":"franceză","masculine-plural":"francezi","feminine-neuter-plural":"franceze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"francez","error-unrecognized-form-feminine-indefinite-singular":"franceză","error-unrecognized-form-indefinite-masculine-plural":"francezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"franceze","definite-error-unrecognized-form-masculine-neuter-singular":"francezul","definite-error-unrecognized-form-feminine-singular":"franceza","definite-error-unrecognized-form-masculine-plural":"francezii","definite-error-unrecognized-form-feminine-neuter-plural":"francezele"}},{"word":"francez","pos":"noun","definitions":["a French man; Frenchman"],"pronunciation":"[franˈt͡ʃez]","forms":{"plural":"francezi","feminine":"equivalent franțuzoaică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"francez","accusative-definite-nominative-singular":"francezul","accusative-indefinite-nominative-plural":"francezi","accusative-definite-nominative-plural":"francezii","dative-genitive-indefinite-singular":"francez","dative-definite-genitive-singular":"francezului","dative-genitive-indefinite-plural":"francezi","dative-definite-genitive-plural":"francezilor","singular-vocative":"francezule","plural-vocative":"francezilor"}},{"word":"franceză","pos":"adj","definitions":["nominative/accusative feminine singular of francez"],"pronunciation":"/franˈt͡ʃe.zə/"},{"word":"franceză","pos":"noun","definitions":["a French woman"],"pronunciation":"/franˈt͡ʃe.zə/","forms":{"plural":"franceze","masculine":"equivalent francez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franceză","accusative-definite-nominative-singular":"franceza","accusative-indefinite-nominative-plural":"franceze","accusative-definite-nominative-plural":"francezele","dative-genitive-indefinite-singular":"franceze","dative-definite-genitive-singular":"francezei","dative-genitive-indefinite-plural":"franceze","dative-definite-genitive-plural":"francezelor","singular-vocative":"franceză","plural-vocative":"francezelor"}},{"word":"franceză","pos":"noun","definitions":["French (language)"],"pronunciation":"/franˈt͡ʃe.zə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"franceză","accusative-definite-nominative":"franceza","dative-genitive-indefinite":"franceze","dative-definite-genitive":"francezei","vocative":"franceză"}},{"word":"franceze","pos":"adj","definitions":["feminine/neuter plural of francez"],"pronunciation":"/franˈt͡ʃeze/","gender":"f-p"},{"word":"francezi","pos":"adj","definitions":["nominative/accusative masculine plural of francez"],"pronunciation":"[franˈt͡ʃezʲ]"},{"word":"francezi","pos":"noun","definitions":["plural of francez"],"pronunciation":"[franˈt͡ʃezʲ]","gender":"m-p"},{"word":"Franche","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Franche"}},{"word":"francheță","pos":"noun","definitions":["alternative form of franchețe"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"francheță","accusative-definite-nominative":"francheța","dative-genitive-indefinite":"franchețe","dative-definite-genitive":"francheței","vocative":"francheță"}},{"word":"franchețe","pos":"noun","definitions":["frankness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"franchețe","accusative-definite-nominative":"franchețea","dative-genitive-indefinite":"franchețe","dative-definite-genitive":"francheței","vocative":"franchețe"}},{"word":"franchism","pos":"noun","definitions":["Francoism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"franchism","accusative-definite-nominative":"franchismul","dative-genitive-indefinite":"franchism","dative-definite-genitive":"franchismului","vocative":"franchismule"}},{"word":"franchist","pos":"adj","definitions":["Francoist"],"forms":{"feminine-singular":"franchistă","masculine-plural":"franchiști","feminine-neuter-plural":"franchiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franchist","error-unrecognized-form-feminine-indefinite-singular":"franchistă","error-unrecognized-form-indefinite-masculine-plural":"franchiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"franchiste","definite-error-unrecognized-form-masculine-neuter-singular":"franchistul","definite-error-unrecognized-form-feminine-singular":"franchista","definite-error-unrecognized-form-masculine-plural":"franchiștii","definite-error-unrecognized-form-feminine-neuter-plural":"franchistele"}},{"word":"franci","pos":"noun","definitions":["indefinite plural of franc"],"pronunciation":"[frant͡ʃʲ]","gender":"m"},{"word":"frânci","pos":"noun","definitions":["plural of frânc"],"gender":"m-p"},{"word":"frâncie","pos":"noun","definitions":["French language"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"frâncie","accusative-definite-nominative":"frância","dative-genitive-indefinite":"frâncii","dative-definite-genitive":"frânciei","vocative":"frâncie"}},{"word":"Francisc","pos":"name","definitions":["a male given name from Latin, equivalent to English Francis"],"gender":"m","forms":{"dative-genitive":"lui Francisc"}},{"word":"franciscă","pos":"noun","definitions":["a type of throwing axe"],"forms":{"plural":"franciște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franciscă","accusative-definite-nominative-singular":"francisca","accusative-indefinite-nominative-plural":"franciște","accusative-definite-nominative-plural":"franciștele","dative-genitive-indefinite-singular":"franciște","dative-definite-genitive-singular":"franciștei","dative-genitive-indefinite-plural":"franciște","dative-definite-genitive-plural":"franciștelor","singular-vocative":"franciscă","plural-vocative":"franciștelor"}},{"word":"franciscan","pos":"noun","definitions":["Franciscan"],"forms":{"plural":"franciscani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franciscan","accusative-definite-nominative-singular":"franciscanul","accusative-indefinite-nominative-plural":"franciscani","accusative-definite-nominative-plural":"franciscanii","dative-genitive-indefinite-singular":"franciscan","dative-definite-genitive-singular":"franciscanului","dative-genitive-indefinite-plural":"franciscani","dative-definite-genitive-plural":"franciscanilor","singular-vocative":"franciscanule","plural-vocative":"franciscanilor"}},{"word":"franciscană","pos":"noun","definitions":["female equivalent of franciscan"],"forms":{"plural":"franciscane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franciscană","accusative-definite-nominative-singular":"franciscana","accusative-indefinite-nominative-plural":"franciscane","accusative-definite-nominative-plural":"franciscanele","dative-genitive-indefinite-singular":"franciscane","dative-definite-genitive-singular":"franciscanei","dative-genitive-indefinite-plural":"franciscane","dative-definite-genitive-plural":"franciscanelor","singular-vocative":"franciscană","plural-vocative":"franciscanelor"}},{"word":"franciscani","pos":"noun","definitions":["plural of franciscan"]},{"word":"franciscanism","pos":"noun","definitions":["Franciscanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"franciscanism","accusative-definite-nominative":"franciscanismul","dative-genitive-indefinite":"franciscanism","dative-definite-genitive":"franciscanismului","vocative":"franciscanismule"}},{"word":"franciu","pos":"noun","definitions":["francium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"franciu","accusative-definite-nominative":"franciul","dative-genitive-indefinite":"franciu","dative-definite-genitive":"franciului","vocative":"franciule"}},{"word":"Franciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Franciuc"}},{"word":"franciza","pos":"verb","definitions":["to Frenchify"],"forms":{"canonical":"a franciza 1st conjugation","present-singular-third-person":"francizează","participle-past":"francizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a franciza","gerund":"francizând","first-person-indicative-present-singular":"francizez","indicative-present-second-person-singular":"francizezi","indicative-present-singular-third-person":"francizează","first-person-indicative-plural-present":"francizăm","indicative-plural-present-second-person":"francizați","indicative-plural-present-third-person":"francizează","first-person-imperfect-indicative-singular":"francizam","imperfect-indicative-second-person-singular":"francizai","imperfect-indicative-singular-third-person":"franciza","first-person-imperfect-indicative-plural":"francizam","imperfect-indicative-plural-second-person":"francizați","imperfect-indicative-plural-third-person":"francizau","first-person-indicative-perfect-singular":"francizai","indicative-perfect-second-person-singular":"francizași","indicative-perfect-singular-third-person":"franciză","first-person-indicative-perfect-plural":"francizarăm","indicative-perfect-plural-second-person":"francizarăți","indicative-perfect-plural-third-person":"francizară","first-person-indicative-pluperfect-singular":"francizasem","indicative-pluperfect-second-person-singular":"francizaseși","indicative-pluperfect-singular-third-person":"francizase","first-person-indicative-pluperfect-plural":"francizaserăm","indicative-pluperfect-plural-second-person":"francizaserăți","indicative-pluperfect-plural-third-person":"francizaseră","first-person-present-singular-subjunctive":"să francizez","present-second-person-singular-subjunctive":"să francizezi","present-singular-subjunctive-third-person":"să francizeze","first-person-plural-present-subjunctive":"să francizăm","plural-present-second-person-subjunctive":"să francizați","plural-present-subjunctive-third-person":"să francizeze","imperative-second-person-singular":"francizează","imperative-plural-second-person":"francizați","imperative-negative-second-person-singular":"nu franciza","imperative-negative-plural-second-person":"nu francizați"}},{"word":"franciză","pos":"noun","definitions":["franchise"],"forms":{"plural":"francíze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franciză","accusative-definite-nominative-singular":"franciza","accusative-indefinite-nominative-plural":"francíze","accusative-definite-nominative-plural":"francízele","dative-genitive-indefinite-singular":"francíze","dative-definite-genitive-singular":"francízei","dative-genitive-indefinite-plural":"francíze","dative-definite-genitive-plural":"francízelor","singular-vocative":"franciză","plural-vocative":"francízelor"}},{"word":"francizare","pos":"noun","definitions":["franchising"],"forms":{"plural":"francizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"francizare","accusative-definite-nominative-singular":"francizarea","accusative-indefinite-nominative-plural":"francizări","accusative-definite-nominative-plural":"francizările","dative-genitive-indefinite-singular":"francizări","dative-definite-genitive-singular":"francizării","dative-genitive-indefinite-plural":"francizări","dative-definite-genitive-plural":"francizărilor","singular-vocative":"francizare","plural-vocative":"francizărilor"}},{"word":"francizat","pos":"adj","definitions":["Frenchified"],"forms":{"feminine-singular":"francizată","masculine-plural":"francizați","feminine-neuter-plural":"francizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"francizat","error-unrecognized-form-feminine-indefinite-singular":"francizată","error-unrecognized-form-indefinite-masculine-plural":"francizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"francizate","definite-error-unrecognized-form-masculine-neuter-singular":"francizatul","definite-error-unrecognized-form-feminine-singular":"francizata","definite-error-unrecognized-form-masculine-plural":"francizații","definite-error-unrecognized-form-feminine-neuter-plural":"francizatele"}},{"word":"francizat","pos":"verb","definitions":["past participle of franciza"],"forms":{"participle-past":"of franciza"}},{"word":"francizor","pos":"noun","definitions":["franchisor"],"forms":{"plural":"francizóri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"francizor","accusative-definite-nominative-singular":"francizorul","accusative-indefinite-nominative-plural":"francizóri","accusative-definite-nominative-plural":"francizórii","dative-genitive-indefinite-singular":"francizor","dative-definite-genitive-singular":"francizorului","dative-genitive-indefinite-plural":"francizóri","dative-definite-genitive-plural":"francizórilor","singular-vocative":"francizorule","plural-vocative":"francizórilor"}},{"word":"francmason","pos":"noun","definitions":["freemason"],"forms":{"plural":"francmasoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"francmason","accusative-definite-nominative-singular":"francmasonul","accusative-indefinite-nominative-plural":"francmasoni","accusative-definite-nominative-plural":"francmasonii","dative-genitive-indefinite-singular":"francmason","dative-definite-genitive-singular":"francmasonului","dative-genitive-indefinite-plural":"francmasoni","dative-definite-genitive-plural":"francmasonilor","singular-vocative":"francmasonule","plural-vocative":"francmasonilor"}},{"word":"francmasonerie","pos":"noun","definitions":["freemasonry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"francmasonerie","accusative-definite-nominative-singular":"francmasoneria","accusative-indefinite-nominative-plural":"francmasonerii","accusative-definite-nominative-plural":"francmasoneriile","dative-genitive-indefinite-singular":"francmasonerii","dative-definite-genitive-singular":"francmasoneriei","dative-genitive-indefinite-plural":"francmasonerii","dative-definite-genitive-plural":"francmasoneriilor","singular-vocative":"francmasonerie","plural-vocative":"francmasoneriilor"}},{"word":"francmasonic","pos":"adj","definitions":["masonic"],"forms":{"feminine-singular":"francmasonică","masculine-plural":"francmasonici","feminine-neuter-plural":"francmasonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"francmasonic","error-unrecognized-form-feminine-indefinite-singular":"francmasonică","error-unrecognized-form-indefinite-masculine-plural":"francmasonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"francmasonice","definite-error-unrecognized-form-masculine-neuter-singular":"francmasonicul","definite-error-unrecognized-form-feminine-singular":"francmasonica","definite-error-unrecognized-form-masculine-plural":"francmasonicii","definite-error-unrecognized-form-feminine-neuter-plural":"francmasonicele"}},{"word":"francmasonie","pos":"noun","definitions":["freemasonry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"francmasonie","accusative-definite-nominative":"francmasonia","dative-genitive-indefinite":"francmasonii","dative-definite-genitive":"francmasoniei","vocative":"francmasonie"}},{"word":"franco-","pos":"prefix","definitions":["Franco-"]},{"word":"francofil","pos":"noun","definitions":["Francophile"],"forms":{"plural":"francofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"francofil","accusative-definite-nominative-singular":"francofilul","accusative-indefinite-nominative-plural":"francofili","accusative-definite-nominative-plural":"francofilii","dative-genitive-indefinite-singular":"francofil","dative-definite-genitive-singular":"francofilului","dative-genitive-indefinite-plural":"francofili","dative-definite-genitive-plural":"francofililor","singular-vocative":"francofilule","plural-vocative":"francofililor"}},{"word":"francofilă","pos":"noun","definitions":["female equivalent of francofil"],"forms":{"plural":"francofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"francofilă","accusative-definite-nominative-singular":"francofila","accusative-indefinite-nominative-plural":"francofile","accusative-definite-nominative-plural":"francofilele","dative-genitive-indefinite-singular":"francofile","dative-definite-genitive-singular":"francofilei","dative-genitive-indefinite-plural":"francofile","dative-definite-genitive-plural":"francofilelor","singular-vocative":"francofilă","plural-vocative":"francofilelor"}},{"word":"francofilie","pos":"noun","definitions":["Francophilia"],"forms":{"plural":"francofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"francofilie","accusative-definite-nominative-singular":"francofilia","accusative-indefinite-nominative-plural":"francofilii","accusative-definite-nominative-plural":"francofiliile","dative-genitive-indefinite-singular":"francofilii","dative-definite-genitive-singular":"francofiliei","dative-genitive-indefinite-plural":"francofilii","dative-definite-genitive-plural":"francofiliilor","singular-vocative":"francofilie","plural-vocative":"francofiliilor"}},{"word":"francofoană","pos":"noun","definitions":["female equivalent of francofon"],"forms":{"plural":"francofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"francofoană","accusative-definite-nominative-singular":"francofoana","accusative-indefinite-nominative-plural":"francofoane","accusative-definite-nominative-plural":"francofoanele","dative-genitive-indefinite-singular":"francofoane","dative-definite-genitive-singular":"francofoanei","dative-genitive-indefinite-plural":"francofoane","dative-definite-genitive-plural":"francofoanelor","singular-vocative":"francofoană","plural-vocative":"francofoanelor"}},{"word":"francofobie","pos":"noun","definitions":["Francophobia"],"forms":{"plural":"francofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"francofobie","accusative-definite-nominative-singular":"francofobia","accusative-indefinite-nominative-plural":"francofobii","accusative-definite-nominative-plural":"francofobiile","dative-genitive-indefinite-singular":"francofobii","dative-definite-genitive-singular":"francofobiei","dative-genitive-indefinite-plural":"francofobii","dative-definite-genitive-plural":"francofobiilor","singular-vocative":"francofobie","plural-vocative":"francofobiilor"}},{"word":"francofon","pos":"noun","definitions":["Francophone"],"forms":{"plural":"francofoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"francofon","accusative-definite-nominative-singular":"francofonul","accusative-indefinite-nominative-plural":"francofoni","accusative-definite-nominative-plural":"francofonii","dative-genitive-indefinite-singular":"francofon","dative-definite-genitive-singular":"francofonului","dative-genitive-indefinite-plural":"francofoni","dative-definite-genitive-plural":"francofonilor","singular-vocative":"francofonule","plural-vocative":"francofonilor"}},{"word":"francofonă","pos":"noun","definitions":["female equivalent of francofon"],"forms":{"plural":"francofone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"francofonă","accusative-definite-nominative-singular":"francofona","accusative-indefinite-nominative-plural":"francofone","accusative-definite-nominative-plural":"francofonele","dative-genitive-indefinite-singular":"francofone","dative-definite-genitive-singular":"francofonei","dative-genitive-indefinite-plural":"francofone","dative-definite-genitive-plural":"francofonelor","singular-vocative":"francofonă","plural-vocative":"francofonelor"}},{"word":"francofonie","pos":"noun","definitions":["Francophonie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"francofonie","accusative-definite-nominative":"francofonia","dative-genitive-indefinite":"francofonii","dative-definite-genitive":"francofoniei","vocative":"francofonie"}},{"word":"franctiror","pos":"noun","definitions":["sniper"],"forms":{"plural":"franctirori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franctiror","accusative-definite-nominative-singular":"franctirorul","accusative-indefinite-nominative-plural":"franctirori","accusative-definite-nominative-plural":"franctirorii","dative-genitive-indefinite-singular":"franctiror","dative-definite-genitive-singular":"franctirorului","dative-genitive-indefinite-plural":"franctirori","dative-definite-genitive-plural":"franctirorilor","singular-vocative":"franctirorule","plural-vocative":"franctirorilor"}},{"word":"Frâncu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Frâncu"}},{"word":"frăncuială","pos":"noun","definitions":["bribe"],"forms":{"plural":"frăncuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frăncuială","accusative-definite-nominative-singular":"frăncuiala","accusative-indefinite-nominative-plural":"frăncuiele","accusative-definite-nominative-plural":"frăncuielele","dative-genitive-indefinite-singular":"frăncuiele","dative-definite-genitive-singular":"frăncuielei","dative-genitive-indefinite-plural":"frăncuiele","dative-definite-genitive-plural":"frăncuielelor","singular-vocative":"frăncuială","plural-vocative":"frăncuielelor"}},{"word":"Frânculea","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frânculea"}},{"word":"Frânculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frânculescu"}},{"word":"frâncușă","pos":"noun","definitions":["grape variety"],"forms":{"plural":"frăncușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frâncușă","accusative-definite-nominative-singular":"frâncușa","accusative-indefinite-nominative-plural":"frăncușe","accusative-definite-nominative-plural":"frăncușele","dative-genitive-indefinite-singular":"frăncușe","dative-definite-genitive-singular":"frăncușei","dative-genitive-indefinite-plural":"frăncușe","dative-definite-genitive-plural":"frăncușelor","singular-vocative":"frâncușă","plural-vocative":"frăncușelor"}},{"word":"frăncușor","pos":"noun","definitions":["diminutive of franc"],"forms":{"plural":"frăncușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frăncușor","accusative-definite-nominative-singular":"frăncușorul","accusative-indefinite-nominative-plural":"frăncușori","accusative-definite-nominative-plural":"frăncușorii","dative-genitive-indefinite-singular":"frăncușor","dative-definite-genitive-singular":"frăncușorului","dative-genitive-indefinite-plural":"frăncușori","dative-definite-genitive-plural":"frăncușorilor","singular-vocative":"frăncușorule","plural-vocative":"frăncușorilor"}},{"word":"frăncuț","pos":"noun","definitions":["diminutive of franc"],"forms":{"plural":"frăncuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frăncuț","accusative-definite-nominative-singular":"frăncuțul","accusative-indefinite-nominative-plural":"frăncuți","accusative-definite-nominative-plural":"frăncuții","dative-genitive-indefinite-singular":"frăncuț","dative-definite-genitive-singular":"frăncuțului","dative-genitive-indefinite-plural":"frăncuți","dative-definite-genitive-plural":"frăncuților","singular-vocative":"frăncuțule","plural-vocative":"frăncuților"}},{"word":"frâne","pos":"noun","definitions":["plural of frână"]},{"word":"frâneț","pos":"noun","definitions":["diminutive of frâu"],"forms":{"plural":"frânețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frâneț","accusative-definite-nominative-singular":"frânețul","accusative-indefinite-nominative-plural":"frânețe","accusative-definite-nominative-plural":"frânețele","dative-genitive-indefinite-singular":"frâneț","dative-definite-genitive-singular":"frânețului","dative-genitive-indefinite-plural":"frânețe","dative-definite-genitive-plural":"frânețelor","singular-vocative":"frânețule","plural-vocative":"frânețelor"}},{"word":"frânez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of frâna"]},{"word":"frâng","pos":"verb","definitions":["inflection of frânge:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"frânge","pos":"verb","definitions":["to break, smash, fracture","to defeat"],"pronunciation":"/ˈfrɨn.d͡ʒe/","forms":{"canonical":"a frânge 3rd conjugation","present-singular-third-person":"frânge","participle-past":"frânt","subjunctive-third-person":"frângă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-t","infinitive":"a frânge","gerund":"frângând","first-person-indicative-present-singular":"frâng","indicative-present-second-person-singular":"frângi","indicative-present-singular-third-person":"frânge","first-person-indicative-plural-present":"frângem","indicative-plural-present-second-person":"frângeți","indicative-plural-present-third-person":"frâng","first-person-imperfect-indicative-singular":"frângeam","imperfect-indicative-second-person-singular":"frângeai","imperfect-indicative-singular-third-person":"frângea","first-person-imperfect-indicative-plural":"frângeam","imperfect-indicative-plural-second-person":"frângeați","imperfect-indicative-plural-third-person":"frângeau","first-person-indicative-perfect-singular":"frânsei","indicative-perfect-second-person-singular":"frânseși","indicative-perfect-singular-third-person":"frânse","first-person-indicative-perfect-plural":"frânserăm","indicative-perfect-plural-second-person":"frânserăți","indicative-perfect-plural-third-person":"frânseră","first-person-indicative-pluperfect-singular":"frânsesem","indicative-pluperfect-second-person-singular":"frânseseși","indicative-pluperfect-singular-third-person":"frânsese","first-person-indicative-pluperfect-plural":"frânseserăm","indicative-pluperfect-plural-second-person":"frânseserăți","indicative-pluperfect-plural-third-person":"frânseseră","first-person-present-singular-subjunctive":"să frâng","present-second-person-singular-subjunctive":"să frângi","present-singular-subjunctive-third-person":"să frângă","first-person-plural-present-subjunctive":"să frângem","plural-present-second-person-subjunctive":"să frângeți","plural-present-subjunctive-third-person":"să frângă","imperative-second-person-singular":"frânge","imperative-plural-second-person":"frângeți","imperative-negative-second-person-singular":"nu frânge","imperative-negative-plural-second-person":"nu frângeți"}},{"word":"frângere","pos":"noun","definitions":["breaking"],"forms":{"plural":"frângeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frângere","accusative-definite-nominative-singular":"frângerea","accusative-indefinite-nominative-plural":"frângeri","accusative-definite-nominative-plural":"frângerile","dative-genitive-indefinite-singular":"frângeri","dative-definite-genitive-singular":"frângerii","dative-genitive-indefinite-plural":"frângeri","dative-definite-genitive-plural":"frângerilor","singular-vocative":"frângere","plural-vocative":"frângerilor"}},{"word":"frânghie","pos":"noun","definitions":["rope","belt","hank of wool"],"pronunciation":"[frɨnˈɡi.e]","forms":{"plural":"frânghii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frânghie","accusative-definite-nominative-singular":"frânghia","accusative-indefinite-nominative-plural":"frânghii","accusative-definite-nominative-plural":"frânghiile","dative-genitive-indefinite-singular":"frânghii","dative-definite-genitive-singular":"frânghiei","dative-genitive-indefinite-plural":"frânghii","dative-definite-genitive-plural":"frânghiilor","singular-vocative":"frânghie","plural-vocative":"frânghiilor","alternative-archaic":"frînghie","alternative-archaic-dialectal":"frâmbie"}},{"word":"frânghier","pos":"noun","definitions":["ropemaker, rope-spinner"],"forms":{"plural":"frânghieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frânghier","accusative-definite-nominative-singular":"frânghierul","accusative-indefinite-nominative-plural":"frânghieri","accusative-definite-nominative-plural":"frânghierii","dative-genitive-indefinite-singular":"frânghier","dative-definite-genitive-singular":"frânghierului","dative-genitive-indefinite-plural":"frânghieri","dative-definite-genitive-plural":"frânghierilor","singular-vocative":"frânghierule","plural-vocative":"frânghierilor"}},{"word":"frânghierie","pos":"noun","definitions":["ropemaker's shop"],"forms":{"plural":"frânghierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frânghierie","accusative-definite-nominative-singular":"frânghieria","accusative-indefinite-nominative-plural":"frânghierii","accusative-definite-nominative-plural":"frânghieriile","dative-genitive-indefinite-singular":"frânghierii","dative-definite-genitive-singular":"frânghieriei","dative-genitive-indefinite-plural":"frânghierii","dative-definite-genitive-plural":"frânghieriilor","singular-vocative":"frânghierie","plural-vocative":"frânghieriilor"}},{"word":"frânghierit","pos":"noun","definitions":["ropemaking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frânghierit","accusative-definite-nominative":"frânghieritul","dative-genitive-indefinite":"frânghierit","dative-definite-genitive":"frânghieritului","vocative":"frânghieritule"}},{"word":"Frânghieru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Frânghieru"}},{"word":"frânghii","pos":"noun","definitions":["plural of frânghie"]},{"word":"frânghioară","pos":"noun","definitions":["diminutive of frânghie; small rope"],"forms":{"plural":"frânghioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frânghioară","accusative-definite-nominative-singular":"frânghioara","accusative-indefinite-nominative-plural":"frânghioare","accusative-definite-nominative-plural":"frânghioarele","dative-genitive-indefinite-singular":"frânghioare","dative-definite-genitive-singular":"frânghioarei","dative-genitive-indefinite-plural":"frânghioare","dative-definite-genitive-plural":"frânghioarelor","singular-vocative":"frânghioară","plural-vocative":"frânghioarelor"}},{"word":"frânghiuță","pos":"noun","definitions":["diminutive of frânghie; small rope"],"forms":{"plural":"frânghiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frânghiuță","accusative-definite-nominative-singular":"frânghiuța","accusative-indefinite-nominative-plural":"frânghiuțe","accusative-definite-nominative-plural":"frânghiuțele","dative-genitive-indefinite-singular":"frânghiuțe","dative-definite-genitive-singular":"frânghiuței","dative-genitive-indefinite-plural":"frânghiuțe","dative-definite-genitive-plural":"frânghiuțelor","singular-vocative":"frânghiuță","plural-vocative":"frânghiuțelor"}},{"word":"frângi","pos":"verb","definitions":["obsolete form of frânge"],"forms":{"canonical":"a frângi 4th conjugation","present-singular-third-person":"frângie","participle-past":"frângit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a frângi","gerund":"frângind","first-person-indicative-present-singular":"frâng","indicative-present-second-person-singular":"frângi","indicative-present-singular-third-person":"frânge","first-person-indicative-plural-present":"frângim","indicative-plural-present-second-person":"frângiți","indicative-plural-present-third-person":"frâng","first-person-imperfect-indicative-singular":"frângeam","imperfect-indicative-second-person-singular":"frângeai","imperfect-indicative-singular-third-person":"frângea","first-person-imperfect-indicative-plural":"frângeam","imperfect-indicative-plural-second-person":"frângeați","imperfect-indicative-plural-third-person":"frângeau","first-person-indicative-perfect-singular":"frângii","indicative-perfect-second-person-singular":"frângiși","indicative-perfect-singular-third-person":"frângi","first-person-indicative-perfect-plural":"frângirăm","indicative-perfect-plural-second-person":"frângirăți","indicative-perfect-plural-third-person":"frângiră","first-person-indicative-pluperfect-singular":"frângisem","indicative-pluperfect-second-person-singular":"frângiseși","indicative-pluperfect-singular-third-person":"frângise","first-person-indicative-pluperfect-plural":"frângiserăm","indicative-pluperfect-plural-second-person":"frângiserăți","indicative-pluperfect-plural-third-person":"frângiseră","first-person-present-singular-subjunctive":"să frâng","present-second-person-singular-subjunctive":"să frângi","present-singular-subjunctive-third-person":"să frângă","first-person-plural-present-subjunctive":"să frângim","plural-present-second-person-subjunctive":"să frângiți","plural-present-subjunctive-third-person":"să frângă","imperative-second-person-singular":"frânge","imperative-plural-second-person":"frângiți","imperative-negative-second-person-singular":"nu frângi","imperative-negative-plural-second-person":"nu frângiți"}},{"word":"Frângulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frângulescu"}},{"word":"frangulie","pos":"noun","definitions":["a grape variety"],"forms":{"plural":"frangulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frangulie","accusative-definite-nominative-singular":"frangulia","accusative-indefinite-nominative-plural":"frangulii","accusative-definite-nominative-plural":"franguliile","dative-genitive-indefinite-singular":"frangulii","dative-definite-genitive-singular":"franguliei","dative-genitive-indefinite-plural":"frangulii","dative-definite-genitive-plural":"franguliilor","singular-vocative":"frangulie","plural-vocative":"franguliilor"}},{"word":"Frânguloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frânguloiu"}},{"word":"frănitic","pos":"adj","definitions":["obsolete form of frenetic"],"forms":{"feminine-singular":"frănitică","masculine-plural":"frănitici","feminine-neuter-plural":"frănitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frănitic","error-unrecognized-form-feminine-indefinite-singular":"frănitică","error-unrecognized-form-indefinite-masculine-plural":"frănitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frănitice","definite-error-unrecognized-form-masculine-neuter-singular":"frăniticul","definite-error-unrecognized-form-feminine-singular":"frănitica","definite-error-unrecognized-form-masculine-plural":"frăniticii","definite-error-unrecognized-form-feminine-neuter-plural":"frăniticele"}},{"word":"franj","pos":"noun","definitions":["fringe"],"forms":{"plural":"franjuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"franj","accusative-definite-nominative-singular":"franjul","accusative-indefinite-nominative-plural":"franjuri","accusative-definite-nominative-plural":"franjurile","dative-genitive-indefinite-singular":"franj","dative-definite-genitive-singular":"franjului","dative-genitive-indefinite-plural":"franjuri","dative-definite-genitive-plural":"franjurilor","singular-vocative":"franjule","plural-vocative":"franjurilor"}},{"word":"franjă","pos":"noun","definitions":["alternative form of franj"],"forms":{"plural":"franje","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franjă","accusative-definite-nominative-singular":"franja","accusative-indefinite-nominative-plural":"franje","accusative-definite-nominative-plural":"franjele","dative-genitive-indefinite-singular":"franje","dative-definite-genitive-singular":"franjei","dative-genitive-indefinite-plural":"franje","dative-definite-genitive-plural":"franjelor","singular-vocative":"franjă","plural-vocative":"franjelor"}},{"word":"franjura","pos":"verb","definitions":["to fringe"],"forms":{"canonical":"a franjura 1st conjugation","present-singular-third-person":"franjurează","participle-past":"franjurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a franjura","gerund":"franjurând","first-person-indicative-present-singular":"franjurez","indicative-present-second-person-singular":"franjurezi","indicative-present-singular-third-person":"franjurează","first-person-indicative-plural-present":"franjurăm","indicative-plural-present-second-person":"franjurați","indicative-plural-present-third-person":"franjurează","first-person-imperfect-indicative-singular":"franjuram","imperfect-indicative-second-person-singular":"franjurai","imperfect-indicative-singular-third-person":"franjura","first-person-imperfect-indicative-plural":"franjuram","imperfect-indicative-plural-second-person":"franjurați","imperfect-indicative-plural-third-person":"franjurau","first-person-indicative-perfect-singular":"franjurai","indicative-perfect-second-person-singular":"franjurași","indicative-perfect-singular-third-person":"franjură","first-person-indicative-perfect-plural":"franjurarăm","indicative-perfect-plural-second-person":"franjurarăți","indicative-perfect-plural-third-person":"franjurară","first-person-indicative-pluperfect-singular":"franjurasem","indicative-pluperfect-second-person-singular":"franjuraseși","indicative-pluperfect-singular-third-person":"franjurase","first-person-indicative-pluperfect-plural":"franjuraserăm","indicative-pluperfect-plural-second-person":"franjuraserăți","indicative-pluperfect-plural-third-person":"franjuraseră","first-person-present-singular-subjunctive":"să franjurez","present-second-person-singular-subjunctive":"să franjurezi","present-singular-subjunctive-third-person":"să franjureze","first-person-plural-present-subjunctive":"să franjurăm","plural-present-second-person-subjunctive":"să franjurați","plural-present-subjunctive-third-person":"să franjureze","imperative-second-person-singular":"franjurează","imperative-plural-second-person":"franjurați","imperative-negative-second-person-singular":"nu franjura","imperative-negative-plural-second-person":"nu franjurați"}},{"word":"franjurat","pos":"adj","definitions":["containing fringes (decorative border)"],"forms":{"feminine-singular":"franjurată","masculine-plural":"franjurați","feminine-neuter-plural":"franjurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franjurat","error-unrecognized-form-feminine-indefinite-singular":"franjurată","error-unrecognized-form-indefinite-masculine-plural":"franjurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"franjurate","definite-error-unrecognized-form-masculine-neuter-singular":"franjuratul","definite-error-unrecognized-form-feminine-singular":"franjurata","definite-error-unrecognized-form-masculine-plural":"franjurații","definite-error-unrecognized-form-feminine-neuter-plural":"franjuratele"}},{"word":"franș","pos":"adj","definitions":["alternative form of franc"],"forms":{"feminine-singular":"franșă","masculine-plural":"franși","feminine-neuter-plural":"franșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franș","error-unrecognized-form-feminine-indefinite-singular":"franșă","error-unrecognized-form-indefinite-masculine-plural":"franși","error-unrecognized-form-feminine-indefinite-neuter-plural":"franșe","definite-error-unrecognized-form-masculine-neuter-singular":"franșul","definite-error-unrecognized-form-feminine-singular":"franșa","definite-error-unrecognized-form-masculine-plural":"franșii","definite-error-unrecognized-form-feminine-neuter-plural":"franșele"}},{"word":"franșiză","pos":"noun","definitions":["deductible"],"forms":{"plural":"franșize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franșiză","accusative-definite-nominative-singular":"franșiza","accusative-indefinite-nominative-plural":"franșize","accusative-definite-nominative-plural":"franșizele","dative-genitive-indefinite-singular":"franșize","dative-definite-genitive-singular":"franșizei","dative-genitive-indefinite-plural":"franșize","dative-definite-genitive-plural":"franșizelor","singular-vocative":"franșiză","plural-vocative":"franșizelor"}},{"word":"Franț","pos":"name","definitions":["a surname from German"],"gender":"m","forms":{"dative-genitive":"lui Franț"}},{"word":"frânt","pos":"verb","definitions":["past participle of frânge"],"pronunciation":"/frɨnt/"},{"word":"frânt","pos":"adj","definitions":["broken, fractured","extremely tired, weakened"],"pronunciation":"/frɨnt/","forms":{"feminine-singular":"frântă","masculine-plural":"frânți","feminine-neuter-plural":"frânte","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"frânt","error-unrecognized-form-feminine-indefinite-singular":"frântă","error-unrecognized-form-indefinite-masculine-plural":"frânți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frânte","definite-error-unrecognized-form-masculine-neuter-singular":"frântul","definite-error-unrecognized-form-feminine-singular":"frânta","definite-error-unrecognized-form-masculine-plural":"frânții","definite-error-unrecognized-form-feminine-neuter-plural":"frântele"}},{"word":"Franța","pos":"name","definitions":["France (a country located primarily in Western Europe)"],"pronunciation":"/ˈfran.t͡sa/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"Franță","accusative-definite-nominative":"Franța","dative-genitive-indefinite":"Franțe","dative-definite-genitive":"Franței","vocative":"Franță","alternative":"Франца"}},{"word":"Franțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Franțescu"}},{"word":"Frânțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frânțescu"}},{"word":"franțez","pos":"adj","definitions":["French"],"forms":{"feminine-singular":"franțeză","masculine-plural":"franțezi","feminine-neuter-plural":"franțeze","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"franțez","error-unrecognized-form-feminine-indefinite-singular":"franțeză","error-unrecognized-form-indefinite-masculine-plural":"franțezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"franțeze","definite-error-unrecognized-form-masculine-neuter-singular":"franțezul","definite-error-unrecognized-form-feminine-singular":"franțeza","definite-error-unrecognized-form-masculine-plural":"franțezii","definite-error-unrecognized-form-feminine-neuter-plural":"franțezele"}},{"word":"franțez","pos":"noun","definitions":["a French man; Frenchman"],"forms":{"plural":"franțezi","feminine":"equivalent franțeză","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franțez","accusative-definite-nominative-singular":"franțezul","accusative-indefinite-nominative-plural":"franțezi","accusative-definite-nominative-plural":"franțezii","dative-genitive-indefinite-singular":"franțez","dative-definite-genitive-singular":"franțezului","dative-genitive-indefinite-plural":"franțezi","dative-definite-genitive-plural":"franțezilor","singular-vocative":"franțezule","plural-vocative":"franțezilor"}},{"word":"frântoare","pos":"noun","definitions":["work, labor"],"forms":{"plural":"frântori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frântoare","accusative-definite-nominative-singular":"frântoarea","accusative-indefinite-nominative-plural":"frântori","accusative-definite-nominative-plural":"frântorile","dative-genitive-indefinite-singular":"frântori","dative-definite-genitive-singular":"frântorii","dative-genitive-indefinite-plural":"frântori","dative-definite-genitive-plural":"frântorilor","singular-vocative":"frântoare","plural-vocative":"frântorilor"}},{"word":"franțoz","pos":"noun","definitions":["Frenchman"],"forms":{"plural":"franțozi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franțoz","accusative-definite-nominative-singular":"franțozul","accusative-indefinite-nominative-plural":"franțozi","accusative-definite-nominative-plural":"franțozii","dative-genitive-indefinite-singular":"franțoz","dative-definite-genitive-singular":"franțozului","dative-genitive-indefinite-plural":"franțozi","dative-definite-genitive-plural":"franțozilor","singular-vocative":"franțozule","plural-vocative":"franțozilor"}},{"word":"franțozit","pos":"adj","definitions":["obsolete form of franțuzit"],"forms":{"feminine-singular":"franțozită","masculine-plural":"franțoziți","feminine-neuter-plural":"franțozite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franțozit","error-unrecognized-form-feminine-indefinite-singular":"franțozită","error-unrecognized-form-indefinite-masculine-plural":"franțoziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"franțozite","definite-error-unrecognized-form-masculine-neuter-singular":"franțozitul","definite-error-unrecognized-form-feminine-singular":"franțozita","definite-error-unrecognized-form-masculine-plural":"franțoziții","definite-error-unrecognized-form-feminine-neuter-plural":"franțozitele"}},{"word":"Frântu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frântu"}},{"word":"frântură","pos":"noun","definitions":["bit, piece, fragment"],"pronunciation":"/frɨnˈtu.rə/","forms":{"plural":"frânturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frântură","accusative-definite-nominative-singular":"frântura","accusative-indefinite-nominative-plural":"frânturi","accusative-definite-nominative-plural":"frânturile","dative-genitive-indefinite-singular":"frânturi","dative-definite-genitive-singular":"frânturii","dative-genitive-indefinite-plural":"frânturi","dative-definite-genitive-plural":"frânturilor","singular-vocative":"frântură","plural-vocative":"frânturilor"}},{"word":"Frânturi","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bistra"],"gender":"m"},{"word":"frânturi","pos":"noun","definitions":["plural of frântură"],"gender":"f-p"},{"word":"Franțușca","pos":"name","definitions":["a river in Maramureș County, Romania, tributary to the Firiza"],"gender":"f"},{"word":"franțușcă","pos":"noun","definitions":["Frenchwoman"],"forms":{"plural":"franțuște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franțușcă","accusative-definite-nominative-singular":"franțușca","accusative-indefinite-nominative-plural":"franțuște","accusative-definite-nominative-plural":"franțuștele","dative-genitive-indefinite-singular":"franțuște","dative-definite-genitive-singular":"franțuștei","dative-genitive-indefinite-plural":"franțuște","dative-definite-genitive-plural":"franțuștelor","singular-vocative":"franțușcă","plural-vocative":"franțuștelor"}},{"word":"franțuz","pos":"noun","definitions":["French, Frenchman"],"pronunciation":"/franˈt͡suz/","forms":{"plural":"franțuji","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franțuz","accusative-definite-nominative-singular":"franțuzul","accusative-indefinite-nominative-plural":"franțuji","accusative-definite-nominative-plural":"franțujii","dative-genitive-indefinite-singular":"franțuz","dative-definite-genitive-singular":"franțuzului","dative-genitive-indefinite-plural":"franțuji","dative-definite-genitive-plural":"franțujilor","singular-vocative":"franțuzule","plural-vocative":"franțujilor"}},{"word":"franțuzească","pos":"adj","definitions":["feminine singular of franțuzesc"],"pronunciation":"/fran.t͡suˈze̯as.kə/"},{"word":"franțuzesc","pos":"adj","definitions":["French"],"pronunciation":"/fran.t͡suˈzesk/","forms":{"feminine-singular":"franțuzească","plural":"franțuzești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franțuzesc","error-unrecognized-form-feminine-indefinite-singular":"franțuzească","error-unrecognized-form-indefinite-masculine-plural":"franțuzești","error-unrecognized-form-feminine-indefinite-neuter-plural":"franțuzești","definite-error-unrecognized-form-masculine-neuter-singular":"franțuzescul","definite-error-unrecognized-form-feminine-singular":"franțuzeasca","definite-error-unrecognized-form-masculine-plural":"franțuzeștii","definite-error-unrecognized-form-feminine-neuter-plural":"franțuzeștile"}},{"word":"franțuzește","pos":"adv","definitions":["like the French","French"],"pronunciation":"[fran.t͡suˈze.ʃte]","examples":[{"ro":"se comportă franțuzește","en":"He behaves like a Frenchman"},{"ro":"nu înțeleg foarte bine franțuzește","en":"I don't understand French very well"}]},{"word":"franțuzești","pos":"adj","definitions":["masculine plural of franțuzesc"],"pronunciation":"/ˌfrant͡suˈzeʃtʲ/","gender":"m-p"},{"word":"franțuzi","pos":"verb","definitions":["to Frenchify"],"forms":{"canonical":"a franțuzi 4th conjugation","present-singular-third-person":"franțuzește","participle-past":"franțuzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a franțuzi","gerund":"franțuzind","first-person-indicative-present-singular":"franțuzesc","indicative-present-second-person-singular":"franțuzești","indicative-present-singular-third-person":"franțuzește","first-person-indicative-plural-present":"franțuzim","indicative-plural-present-second-person":"franțuziți","indicative-plural-present-third-person":"franțuzesc","first-person-imperfect-indicative-singular":"franțuzeam","imperfect-indicative-second-person-singular":"franțuzeai","imperfect-indicative-singular-third-person":"franțuzea","first-person-imperfect-indicative-plural":"franțuzeam","imperfect-indicative-plural-second-person":"franțuzeați","imperfect-indicative-plural-third-person":"franțuzeau","first-person-indicative-perfect-singular":"franțuzii","indicative-perfect-second-person-singular":"franțuziși","indicative-perfect-singular-third-person":"franțuzi","first-person-indicative-perfect-plural":"franțuzirăm","indicative-perfect-plural-second-person":"franțuzirăți","indicative-perfect-plural-third-person":"franțuziră","first-person-indicative-pluperfect-singular":"franțuzisem","indicative-pluperfect-second-person-singular":"franțuziseși","indicative-pluperfect-singular-third-person":"franțuzise","first-person-indicative-pluperfect-plural":"franțuziserăm","indicative-pluperfect-plural-second-person":"franțuziserăți","indicative-pluperfect-plural-third-person":"franțuziseră","first-person-present-singular-subjunctive":"să franțuzesc","present-second-person-singular-subjunctive":"să franțuzești","present-singular-subjunctive-third-person":"să franțuzească","first-person-plural-present-subjunctive":"să franțuzim","plural-present-second-person-subjunctive":"să franțuziți","plural-present-subjunctive-third-person":"să franțuzească","imperative-second-person-singular":"franțuzește","imperative-plural-second-person":"franțuziți","imperative-negative-second-person-singular":"nu franțuzi","imperative-negative-plural-second-person":"nu franțuziți"}},{"word":"franțuzire","pos":"noun","definitions":["Frenchification"],"forms":{"plural":"franțuziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"franțuzire","accusative-definite-nominative-singular":"franțuzirea","accusative-indefinite-nominative-plural":"franțuziri","accusative-definite-nominative-plural":"franțuzirile","dative-genitive-indefinite-singular":"franțuziri","dative-definite-genitive-singular":"franțuzirii","dative-genitive-indefinite-plural":"franțuziri","dative-definite-genitive-plural":"franțuzirilor","singular-vocative":"franțuzire","plural-vocative":"franțuzirilor"}},{"word":"franțuzism","pos":"noun","definitions":["Frenchism"],"forms":{"plural":"franțuzisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"franțuzism","accusative-definite-nominative-singular":"franțuzismul","accusative-indefinite-nominative-plural":"franțuzisme","accusative-definite-nominative-plural":"franțuzismele","dative-genitive-indefinite-singular":"franțuzism","dative-definite-genitive-singular":"franțuzismului","dative-genitive-indefinite-plural":"franțuzisme","dative-definite-genitive-plural":"franțuzismelor","singular-vocative":"franțuzismule","plural-vocative":"franțuzismelor"}},{"word":"franțuzist","pos":"adj","definitions":["person who uses French borrowings without a need."],"forms":{"feminine-singular":"franțuzistă","masculine-plural":"franțuziști","feminine-neuter-plural":"franțuziste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franțuzist","error-unrecognized-form-feminine-indefinite-singular":"franțuzistă","error-unrecognized-form-indefinite-masculine-plural":"franțuziști","error-unrecognized-form-feminine-indefinite-neuter-plural":"franțuziste","definite-error-unrecognized-form-masculine-neuter-singular":"franțuzistul","definite-error-unrecognized-form-feminine-singular":"franțuzista","definite-error-unrecognized-form-masculine-plural":"franțuziștii","definite-error-unrecognized-form-feminine-neuter-plural":"franțuzistele"}},{"word":"franțuzit","pos":"adj","definitions":["Frenchified"],"forms":{"feminine-singular":"franțuzită","masculine-plural":"franțuziți","feminine-neuter-plural":"franțuzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"franțuzit","error-unrecognized-form-feminine-indefinite-singular":"franțuzită","error-unrecognized-form-indefinite-masculine-plural":"franțuziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"franțuzite","definite-error-unrecognized-form-masculine-neuter-singular":"franțuzitul","definite-error-unrecognized-form-feminine-singular":"franțuzita","definite-error-unrecognized-form-masculine-plural":"franțuziții","definite-error-unrecognized-form-feminine-neuter-plural":"franțuzitele"}},{"word":"franțuzoaică","pos":"noun","definitions":["Frenchwoman","girlfriend, lover, mistress"],"forms":{"plural":"franțuzoaice","masculine":"equivalent francez","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franțuzoaică","accusative-definite-nominative-singular":"franțuzoaica","accusative-indefinite-nominative-plural":"franțuzoaice","accusative-definite-nominative-plural":"franțuzoaicele","dative-genitive-indefinite-singular":"franțuzoaice","dative-definite-genitive-singular":"franțuzoaicei","dative-genitive-indefinite-plural":"franțuzoaice","dative-definite-genitive-plural":"franțuzoaicelor","singular-vocative":"franțuzoaică","plural-vocative":"franțuzoaicelor"}},{"word":"Franțuzu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Franțuzu"}},{"word":"franzelă","pos":"noun","definitions":["oblong loaf (of bread)"],"forms":{"plural":"franzele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franzelă","accusative-definite-nominative-singular":"franzela","accusative-indefinite-nominative-plural":"franzele","accusative-definite-nominative-plural":"franzelele","dative-genitive-indefinite-singular":"franzele","dative-definite-genitive-singular":"franzelei","dative-genitive-indefinite-plural":"franzele","dative-definite-genitive-plural":"franzelelor","singular-vocative":"franzelă","plural-vocative":"franzelelor"}},{"word":"franzelar","pos":"noun","definitions":["baker"],"forms":{"plural":"franzelari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"franzelar","accusative-definite-nominative-singular":"franzelarul","accusative-indefinite-nominative-plural":"franzelari","accusative-definite-nominative-plural":"franzelarii","dative-genitive-indefinite-singular":"franzelar","dative-definite-genitive-singular":"franzelarului","dative-genitive-indefinite-plural":"franzelari","dative-definite-genitive-plural":"franzelarilor","singular-vocative":"franzelarule","plural-vocative":"franzelarilor"}},{"word":"franzelăreasă","pos":"noun","definitions":["female equivalent of franzelar"],"forms":{"plural":"franzelărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franzelăreasă","accusative-definite-nominative-singular":"franzelăreasa","accusative-indefinite-nominative-plural":"franzelărese","accusative-definite-nominative-plural":"franzelăresele","dative-genitive-indefinite-singular":"franzelărese","dative-definite-genitive-singular":"franzelăresei","dative-genitive-indefinite-plural":"franzelărese","dative-definite-genitive-plural":"franzelăreselor","singular-vocative":"franzelăreasă","plural-vocative":"franzelăreselor"}},{"word":"franzelărie","pos":"noun","definitions":["bakery"],"forms":{"plural":"franzelării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"franzelărie","accusative-definite-nominative-singular":"franzelăria","accusative-indefinite-nominative-plural":"franzelării","accusative-definite-nominative-plural":"franzelăriile","dative-genitive-indefinite-singular":"franzelării","dative-definite-genitive-singular":"franzelăriei","dative-genitive-indefinite-plural":"franzelării","dative-definite-genitive-plural":"franzelăriilor","singular-vocative":"franzelărie","plural-vocative":"franzelăriilor"}},{"word":"franzeluță","pos":"noun","definitions":["diminutive of franzelă; small loaf of bread"],"forms":{"plural":"franzeluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"franzeluță","accusative-definite-nominative-singular":"franzeluța","accusative-indefinite-nominative-plural":"franzeluțe","accusative-definite-nominative-plural":"franzeluțele","dative-genitive-indefinite-singular":"franzeluțe","dative-definite-genitive-singular":"franzeluței","dative-genitive-indefinite-plural":"franzeluțe","dative-definite-genitive-plural":"franzeluțelor","singular-vocative":"franzeluță","plural-vocative":"franzeluțelor"}},{"word":"frapa","pos":"verb","definitions":["to hit, to strike, to bash"],"forms":{"canonical":"a frapa 1st conjugation","present-singular-third-person":"frapează","participle-past":"frapat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frapa","gerund":"frapând","first-person-indicative-present-singular":"frapez","indicative-present-second-person-singular":"frapezi","indicative-present-singular-third-person":"frapează","first-person-indicative-plural-present":"frapăm","indicative-plural-present-second-person":"frapați","indicative-plural-present-third-person":"frapează","first-person-imperfect-indicative-singular":"frapam","imperfect-indicative-second-person-singular":"frapai","imperfect-indicative-singular-third-person":"frapa","first-person-imperfect-indicative-plural":"frapam","imperfect-indicative-plural-second-person":"frapați","imperfect-indicative-plural-third-person":"frapau","first-person-indicative-perfect-singular":"frapai","indicative-perfect-second-person-singular":"frapași","indicative-perfect-singular-third-person":"frapă","first-person-indicative-perfect-plural":"fraparăm","indicative-perfect-plural-second-person":"fraparăți","indicative-perfect-plural-third-person":"frapară","first-person-indicative-pluperfect-singular":"frapasem","indicative-pluperfect-second-person-singular":"frapaseși","indicative-pluperfect-singular-third-person":"frapase","first-person-indicative-pluperfect-plural":"frapaserăm","indicative-pluperfect-plural-second-person":"frapaserăți","indicative-pluperfect-plural-third-person":"frapaseră","first-person-present-singular-subjunctive":"să frapez","present-second-person-singular-subjunctive":"să frapezi","present-singular-subjunctive-third-person":"să frapeze","first-person-plural-present-subjunctive":"să frapăm","plural-present-second-person-subjunctive":"să frapați","plural-present-subjunctive-third-person":"să frapeze","imperative-second-person-singular":"frapează","imperative-plural-second-person":"frapați","imperative-negative-second-person-singular":"nu frapa","imperative-negative-plural-second-person":"nu frapați"}},{"word":"frapant","pos":"adj","definitions":["striking"],"forms":{"feminine-singular":"frapantă","masculine-plural":"frapanți","feminine-neuter-plural":"frapante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frapant","error-unrecognized-form-feminine-indefinite-singular":"frapantă","error-unrecognized-form-indefinite-masculine-plural":"frapanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frapante","definite-error-unrecognized-form-masculine-neuter-singular":"frapantul","definite-error-unrecognized-form-feminine-singular":"frapanta","definite-error-unrecognized-form-masculine-plural":"frapanții","definite-error-unrecognized-form-feminine-neuter-plural":"frapantele"}},{"word":"frapat","pos":"adj","definitions":["iced"],"forms":{"feminine-singular":"frapată","masculine-plural":"frapați","feminine-neuter-plural":"frapate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frapat","error-unrecognized-form-feminine-indefinite-singular":"frapată","error-unrecognized-form-indefinite-masculine-plural":"frapați","error-unrecognized-form-feminine-indefinite-neuter-plural":"frapate","definite-error-unrecognized-form-masculine-neuter-singular":"frapatul","definite-error-unrecognized-form-feminine-singular":"frapata","definite-error-unrecognized-form-masculine-plural":"frapații","definite-error-unrecognized-form-feminine-neuter-plural":"frapatele"}},{"word":"frapat","pos":"verb","definitions":["past participle of frapa"],"forms":{"participle-past":"of frapa"}},{"word":"frapieră","pos":"noun","definitions":["ice-pail"],"forms":{"plural":"frapiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frapieră","accusative-definite-nominative-singular":"frapiera","accusative-indefinite-nominative-plural":"frapiere","accusative-definite-nominative-plural":"frapierele","dative-genitive-indefinite-singular":"frapiere","dative-definite-genitive-singular":"frapierei","dative-genitive-indefinite-plural":"frapiere","dative-definite-genitive-plural":"frapierelor","singular-vocative":"frapieră","plural-vocative":"frapierelor"}},{"word":"frașcă","pos":"noun","definitions":["magpie"],"forms":{"plural":"frăști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frașcă","accusative-definite-nominative-singular":"frașca","accusative-indefinite-nominative-plural":"frăște","accusative-definite-nominative-plural":"frăștele","dative-genitive-indefinite-singular":"frăște","dative-definite-genitive-singular":"frăștei","dative-genitive-indefinite-plural":"frăște","dative-definite-genitive-plural":"frăștelor","singular-vocative":"frașcă","plural-vocative":"frăștelor"}},{"word":"frășcău","pos":"noun","definitions":["lad, youth"],"forms":{"plural":"frășcăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frășcău","accusative-definite-nominative-singular":"frășcăuul","accusative-indefinite-nominative-plural":"frășcăi","accusative-definite-nominative-plural":"frășcăii","dative-genitive-indefinite-singular":"frășcău","dative-definite-genitive-singular":"frășcăuului","dative-genitive-indefinite-plural":"frășcăi","dative-definite-genitive-plural":"frășcăilor","singular-vocative":"frășcăuule","plural-vocative":"frășcăilor"}},{"word":"Frasin","pos":"name","definitions":["a village in Pleșoi, Dolj County, Romania","a village in Vladimir, Gorj County, Romania","a village in Broșteni, Suceava County, Romania","a city in Suceava County, Romania"],"gender":"m"},{"word":"frasin","pos":"noun","definitions":["ash (tree)"],"pronunciation":"/ˈfra.sin/","forms":{"plural":"frasini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frasin","accusative-definite-nominative-singular":"frasinul","accusative-indefinite-nominative-plural":"frasini","accusative-definite-nominative-plural":"frasinii","dative-genitive-indefinite-singular":"frasin","dative-definite-genitive-singular":"frasinului","dative-genitive-indefinite-plural":"frasini","dative-definite-genitive-plural":"frasinilor","singular-vocative":"frasinule","plural-vocative":"frasinilor","alternative":"frapsăn"}},{"word":"Frasin Deal","pos":"name","definitions":["a village in Cobia, Dâmbovița County, Romania"],"gender":"m"},{"word":"Frasin Vale","pos":"name","definitions":["a village in Cobia, Dâmbovița County, Romania"],"gender":"m"},{"word":"Frăsina","pos":"name","definitions":["a village in Roești, Vâlcea County, Romania"],"gender":"f"},{"word":"frăsinărie","pos":"noun","definitions":["ash grove"],"forms":{"plural":"frăsinării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frăsinărie","accusative-definite-nominative-singular":"frăsinăria","accusative-indefinite-nominative-plural":"frăsinării","accusative-definite-nominative-plural":"frăsinăriile","dative-genitive-indefinite-singular":"frăsinării","dative-definite-genitive-singular":"frăsinăriei","dative-genitive-indefinite-plural":"frăsinării","dative-definite-genitive-plural":"frăsinăriilor","singular-vocative":"frăsinărie","plural-vocative":"frăsinăriilor"}},{"word":"Frăsineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Frăsineanu"}},{"word":"Frăsineasa","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Sighiștel"],"gender":"f"},{"word":"Frăsinel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frăsinel"}},{"word":"frăsinel","pos":"noun","definitions":["diminutive of frasin; small ash tree"],"forms":{"plural":"frăsinei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frăsinel","accusative-definite-nominative-singular":"frăsinelul","accusative-indefinite-nominative-plural":"frăsineli","accusative-definite-nominative-plural":"frăsinelii","dative-genitive-indefinite-singular":"frăsinel","dative-definite-genitive-singular":"frăsinelului","dative-genitive-indefinite-plural":"frăsineli","dative-definite-genitive-plural":"frăsinelilor","singular-vocative":"frăsinelule","plural-vocative":"frăsinelilor"}},{"word":"Frăsinelu","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Crivadia"],"gender":"m"},{"word":"Frăsinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frăsinescu"}},{"word":"Frăsinești","pos":"name","definitions":["a village in Măcărești, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Frăsinet","pos":"name","definitions":["a village in Calvini, Buzău County, Romania","a commune of Călărași County, Romania","a village in Frăsinet, Călărași County, Romania","a village in Băișoara, Cluj County, Romania","a locality in Breaza, Prahova County, Romania"],"gender":"m"},{"word":"frăsinet","pos":"noun","definitions":["ash grove, forest of ash trees"],"forms":{"plural":"frăsineturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frăsinet","accusative-definite-nominative-singular":"frăsinetul","accusative-indefinite-nominative-plural":"frăsineturi","accusative-definite-nominative-plural":"frăsineturile","dative-genitive-indefinite-singular":"frăsinet","dative-definite-genitive-singular":"frăsinetului","dative-genitive-indefinite-plural":"frăsineturi","dative-definite-genitive-plural":"frăsineturilor","singular-vocative":"frăsinetule","plural-vocative":"frăsineturilor"}},{"word":"Frăsinet Gară","pos":"name","definitions":["a village in Vlădila, Olt County, Romania"],"gender":"m"},{"word":"Frăsinetu","pos":"name","definitions":["a village in Dobrosloveni, Olt County, Romania"],"gender":"m"},{"word":"Frăsinetu de Jos","pos":"name","definitions":["a village in Frăsinet, Călărași County, Romania"],"gender":"m"},{"word":"frăsinetul","pos":"noun","definitions":["definite nominative/accusative singular of frăsinet"]},{"word":"frăsinică","pos":"noun","definitions":["narrow-leafed ash (Fraxinus angustifolia)"],"forms":{"plural":"frăsinici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frăsinică","accusative-definite-nominative-singular":"frăsinica","accusative-indefinite-nominative-plural":"frăsinici","accusative-definite-nominative-plural":"frăsinicile","dative-genitive-indefinite-singular":"frăsinici","dative-definite-genitive-singular":"frăsinicii","dative-genitive-indefinite-plural":"frăsinici","dative-definite-genitive-plural":"frăsinicilor","singular-vocative":"frăsinică","plural-vocative":"frăsinicilor"}},{"word":"Frasinilor","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Lăpuș"],"gender":"m"},{"word":"Frăsiniș","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"frăsiniș","pos":"noun","definitions":["ash grove"],"forms":{"plural":"frăsinișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frăsiniș","accusative-definite-nominative-singular":"frăsinișul","accusative-indefinite-nominative-plural":"frăsinișuri","accusative-definite-nominative-plural":"frăsinișurile","dative-genitive-indefinite-singular":"frăsiniș","dative-definite-genitive-singular":"frăsinișului","dative-genitive-indefinite-plural":"frăsinișuri","dative-definite-genitive-plural":"frăsinișurilor","singular-vocative":"frăsinișule","plural-vocative":"frăsinișurilor"}},{"word":"frăsiniște","pos":"noun","definitions":["ash grove"],"forms":{"plural":"frăsiniști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frăsiniște","accusative-definite-nominative-singular":"frăsiniștea","accusative-indefinite-nominative-plural":"frăsiniști","accusative-definite-nominative-plural":"frăsiniștile","dative-genitive-indefinite-singular":"frăsiniști","dative-definite-genitive-singular":"frăsiniștii","dative-genitive-indefinite-plural":"frăsiniști","dative-definite-genitive-plural":"frăsiniștilor","singular-vocative":"frăsiniște","plural-vocative":"frăsiniștilor"}},{"word":"Frăsinișu","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Căpățâna"],"gender":"m"},{"word":"Frasinu","pos":"name","definitions":["a village in Cornești, Dâmbovița County, Romania","a village in Băneasa, Giurgiu County, Romania","a village in Poienești, Vaslui County, Romania"],"gender":"m"},{"word":"frasinul","pos":"noun","definitions":["definite nominative/accusative singular of frasin"]},{"word":"frăsire","pos":"noun","definitions":["bustle"],"forms":{"plural":"frăsiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frăsire","accusative-definite-nominative-singular":"frăsirea","accusative-indefinite-nominative-plural":"frăsiri","accusative-definite-nominative-plural":"frăsirile","dative-genitive-indefinite-singular":"frăsiri","dative-definite-genitive-singular":"frăsirii","dative-genitive-indefinite-plural":"frăsiri","dative-definite-genitive-plural":"frăsirilor","singular-vocative":"frăsire","plural-vocative":"frăsirilor"}},{"word":"frasis","pos":"noun","definitions":["phrase"]},{"word":"Frăsuleni","pos":"name","definitions":["a village in Victoria, Iași County, Romania"],"gender":"m"},{"word":"frățân","pos":"noun","definitions":["alternative form of frățâne"],"forms":{"plural":"frățâni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frățân","accusative-definite-nominative-singular":"frățânul","accusative-indefinite-nominative-plural":"frățâni","accusative-definite-nominative-plural":"frățânii","dative-genitive-indefinite-singular":"frățân","dative-definite-genitive-singular":"frățânului","dative-genitive-indefinite-plural":"frățâni","dative-definite-genitive-plural":"frățânilor","singular-vocative":"frățânule","plural-vocative":"frățânilor"}},{"word":"frățânătate","pos":"noun","definitions":["brotherhood"],"forms":{"plural":"frățânătatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frățânătate","accusative-definite-nominative-singular":"frățânătatea","accusative-indefinite-nominative-plural":"frățânătatăți","accusative-definite-nominative-plural":"frățânătatățile","dative-genitive-indefinite-singular":"frățânătatăți","dative-definite-genitive-singular":"frățânătatății","dative-genitive-indefinite-plural":"frățânătatăți","dative-definite-genitive-plural":"frățânătatăților","singular-vocative":"frățânătate","plural-vocative":"frățânătatăților"}},{"word":"frățâne","pos":"noun","definitions":["brother"],"forms":{"plural":"frățâni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frățâne","accusative-definite-nominative-singular":"frățâneul","accusative-indefinite-nominative-plural":"frățâni","accusative-definite-nominative-plural":"frățânii","dative-genitive-indefinite-singular":"frățâne","dative-definite-genitive-singular":"frățâneului","dative-genitive-indefinite-plural":"frățâni","dative-definite-genitive-plural":"frățânilor","singular-vocative":"frățâneule","plural-vocative":"frățânilor"}},{"word":"Frătăuții Noi","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Frătăuții Noi, Suceava County, Romania"],"gender":"m"},{"word":"Frătăuții Vechi","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Frătăuții Vechi, Suceava County, Romania"],"gender":"m"},{"word":"Frate","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frate"}},{"word":"frate","pos":"noun","definitions":["brother","dude"],"pronunciation":"[ˈfra.te]","examples":[{"ro":"Frate, e bună!","en":"Dude, she's hot!"}],"forms":{"plural":"frați","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"frate","accusative-definite-nominative-singular":"fratele","accusative-indefinite-nominative-plural":"frați","accusative-definite-nominative-plural":"frații","dative-genitive-indefinite-singular":"frate","dative-definite-genitive-singular":"fratelui","dative-genitive-indefinite-plural":"frați","dative-definite-genitive-plural":"fraților","singular-vocative":"frate","plural-vocative":"fraților"}},{"word":"frate de lapte","pos":"noun","definitions":["milk brother"],"forms":{"plural":"frați de lapte"}},{"word":"frate de sânge","pos":"noun","definitions":["blood brother"],"forms":{"plural":"frați de sânge"}},{"word":"frate pe jumătate","pos":"noun","definitions":["half brother"],"forms":{"plural":"frați pe jumătate"}},{"word":"frate vitreg","pos":"noun","definitions":["half brother"],"forms":{"plural":"frați vitregi"}},{"word":"Frăteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frăteanu"}},{"word":"frățească","pos":"adj","definitions":["feminine singular of frățesc"],"pronunciation":"[frəˈt͡se̯as.kə]","gender":"f"},{"word":"fratele","pos":"noun","definitions":["definite nominative/accusative singular of frate"]},{"word":"Fratelia","pos":"name","definitions":["A neighbourhood of Timișoara and former commune of Timiș County, Romania"],"pronunciation":"/fraˈte.li.a/","gender":"f"},{"word":"fratelui","pos":"noun","definitions":["definite dative/genitive singular of frate"]},{"word":"frățenie","pos":"noun","definitions":["brotherhood"],"forms":{"plural":"frățenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frățenie","accusative-definite-nominative-singular":"frățenia","accusative-indefinite-nominative-plural":"frățenii","accusative-definite-nominative-plural":"frățeniile","dative-genitive-indefinite-singular":"frățenii","dative-definite-genitive-singular":"frățeniei","dative-genitive-indefinite-plural":"frățenii","dative-definite-genitive-plural":"frățeniilor","singular-vocative":"frățenie","plural-vocative":"frățeniilor"}},{"word":"fratern","pos":"adj","definitions":["brotherly, fraternal"],"forms":{"feminine-singular":"fraternă","masculine-plural":"fraterni","feminine-neuter-plural":"fraterne","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fratern","error-unrecognized-form-feminine-indefinite-singular":"fraternă","error-unrecognized-form-indefinite-masculine-plural":"fraterni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fraterne","definite-error-unrecognized-form-masculine-neuter-singular":"fraternul","definite-error-unrecognized-form-feminine-singular":"fraterna","definite-error-unrecognized-form-masculine-plural":"fraternii","definite-error-unrecognized-form-feminine-neuter-plural":"fraternele"}},{"word":"fraternel","pos":"adj","definitions":["fraternal"],"forms":{"feminine-singular":"fraternelă","masculine-plural":"fraterneli","feminine-neuter-plural":"fraternele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fraternel","error-unrecognized-form-feminine-indefinite-singular":"fraternelă","error-unrecognized-form-indefinite-masculine-plural":"fraterneli","error-unrecognized-form-feminine-indefinite-neuter-plural":"fraternele","definite-error-unrecognized-form-masculine-neuter-singular":"fraternelul","definite-error-unrecognized-form-feminine-singular":"fraternela","definite-error-unrecognized-form-masculine-plural":"fraternelii","definite-error-unrecognized-form-feminine-neuter-plural":"fraternelele"}},{"word":"fraternitate","pos":"noun","definitions":["fraternity; brotherhood"],"pronunciation":"/fra.ter.niˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"fraternitate","accusative-definite-nominative":"fraternitatea","dative-genitive-indefinite":"fraternități","dative-definite-genitive":"fraternității","vocative":"fraternitate","alternative":"фратернитате"}},{"word":"fraternității","pos":"noun","definitions":["definite genitive/dative singular of fraternitate"],"pronunciation":"[fra.ter.niˈtə.t͡siʲ]","gender":"f","examples":[{"ro":"în spiritul fraternității","en":"in the spirit of brotherhood"}]},{"word":"fraterniza","pos":"verb","definitions":["to fraternize"],"pronunciation":"/fra.ter.niˈza/","forms":{"canonical":"a fraterniza 1st conjugation","present-singular-third-person":"fraternizează","participle-past":"fraternizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fraterniza","gerund":"fraternizând","first-person-indicative-present-singular":"fraternizez","indicative-present-second-person-singular":"fraternizezi","indicative-present-singular-third-person":"fraternizează","first-person-indicative-plural-present":"fraternizăm","indicative-plural-present-second-person":"fraternizați","indicative-plural-present-third-person":"fraternizează","first-person-imperfect-indicative-singular":"fraternizam","imperfect-indicative-second-person-singular":"fraternizai","imperfect-indicative-singular-third-person":"fraterniza","first-person-imperfect-indicative-plural":"fraternizam","imperfect-indicative-plural-second-person":"fraternizați","imperfect-indicative-plural-third-person":"fraternizau","first-person-indicative-perfect-singular":"fraternizai","indicative-perfect-second-person-singular":"fraternizași","indicative-perfect-singular-third-person":"fraterniză","first-person-indicative-perfect-plural":"fraternizarăm","indicative-perfect-plural-second-person":"fraternizarăți","indicative-perfect-plural-third-person":"fraternizară","first-person-indicative-pluperfect-singular":"fraternizasem","indicative-pluperfect-second-person-singular":"fraternizaseși","indicative-pluperfect-singular-third-person":"fraternizase","first-person-indicative-pluperfect-plural":"fraternizaserăm","indicative-pluperfect-plural-second-person":"fraternizaserăți","indicative-pluperfect-plural-third-person":"fraternizaseră","first-person-present-singular-subjunctive":"să fraternizez","present-second-person-singular-subjunctive":"să fraternizezi","present-singular-subjunctive-third-person":"să fraternizeze","first-person-plural-present-subjunctive":"să fraternizăm","plural-present-second-person-subjunctive":"să fraternizați","plural-present-subjunctive-third-person":"să fraternizeze","imperative-second-person-singular":"fraternizează","imperative-plural-second-person":"fraternizați","imperative-negative-second-person-singular":"nu fraterniza","imperative-negative-plural-second-person":"nu fraternizați"}},{"word":"fraternizare","pos":"noun","definitions":["fraternization"],"forms":{"plural":"fraternizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fraternizare","accusative-definite-nominative-singular":"fraternizarea","accusative-indefinite-nominative-plural":"fraternizări","accusative-definite-nominative-plural":"fraternizările","dative-genitive-indefinite-singular":"fraternizări","dative-definite-genitive-singular":"fraternizării","dative-genitive-indefinite-plural":"fraternizări","dative-definite-genitive-plural":"fraternizărilor","singular-vocative":"fraternizare","plural-vocative":"fraternizărilor"}},{"word":"frățesc","pos":"adj","definitions":["brotherly, fraternal"],"pronunciation":"[frəˈt͡sesk]","forms":{"feminine-singular":"frățească","plural":"frățești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frățesc","error-unrecognized-form-feminine-indefinite-singular":"frățească","error-unrecognized-form-indefinite-masculine-plural":"frățești","error-unrecognized-form-feminine-indefinite-neuter-plural":"frățești","definite-error-unrecognized-form-masculine-neuter-singular":"frățescul","definite-error-unrecognized-form-feminine-singular":"frățeasca","definite-error-unrecognized-form-masculine-plural":"frățeștii","definite-error-unrecognized-form-feminine-neuter-plural":"frățeștile"}},{"word":"frățește","pos":"adv","definitions":["in a brotherly way, fraternally, like a brother"],"pronunciation":"[frəˈt͡seʃ.te]"},{"word":"Frătești","pos":"name","definitions":["a village in Albota, Argeș County, Romania","a commune of Giurgiu County, Romania","a village in Frătești, Giurgiu County, Romania","a village in Lelești, Gorj County, Romania"],"gender":"m"},{"word":"frățești","pos":"adj","definitions":["plural of frățesc"],"pronunciation":"[frəˈt͡seʃtʲ]"},{"word":"frați","pos":"noun","definitions":["plural of frate"],"pronunciation":"[frat͡sʲ]","forms":{"alternative":"фраць"}},{"word":"Frățian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Frățian"}},{"word":"frătic","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frătici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frătic","accusative-definite-nominative-singular":"frăticul","accusative-indefinite-nominative-plural":"frătici","accusative-definite-nominative-plural":"frăticii","dative-genitive-indefinite-singular":"frătic","dative-definite-genitive-singular":"frăticului","dative-genitive-indefinite-plural":"frătici","dative-definite-genitive-plural":"frăticilor","singular-vocative":"frăticule","plural-vocative":"frăticilor"}},{"word":"Frățică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frățică"}},{"word":"frățică","pos":"noun","definitions":["diminutive of frate"]},{"word":"Frătici","pos":"name","definitions":["a village in Vedea, Argeș County, Romania"],"gender":"m"},{"word":"frăție","pos":"noun","definitions":["brotherliness","brotherhood, fraternity"],"forms":{"plural":"frății"}},{"word":"frățietate","pos":"noun","definitions":["brotherhood"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"frățietate","accusative-definite-nominative":"frățietatea","dative-genitive-indefinite":"frățietate","dative-definite-genitive":"frățietatei","vocative":"frățietate"}},{"word":"frații","pos":"noun","definitions":["definite nominative/accusative plural of frate"]},{"word":"Frățila","pos":"name","definitions":["a village in Bulzești, Dolj County, Romania"],"gender":"f"},{"word":"Frățilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frățilă"}},{"word":"Frățilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frățilescu"}},{"word":"Frățilești","pos":"name","definitions":["a village in Săveni, Ialomița County, Romania"],"gender":"m"},{"word":"Frățiloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frățiloiu"}},{"word":"fraților","pos":"noun","definitions":["inflection of frate:","definite genitive/dative plural","vocative plural"]},{"word":"frățior","pos":"noun","definitions":["diminutive of frate; small brother"],"forms":{"plural":"frățiori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frățior","accusative-definite-nominative-singular":"frățiorul","accusative-indefinite-nominative-plural":"frățiori","accusative-definite-nominative-plural":"frățiorii","dative-genitive-indefinite-singular":"frățior","dative-definite-genitive-singular":"frățiorului","dative-genitive-indefinite-plural":"frățiori","dative-definite-genitive-plural":"frățiorilor","singular-vocative":"frățiorule","plural-vocative":"frățiorilor"}},{"word":"frățișor","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frățișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frățișor","accusative-definite-nominative-singular":"frățișorul","accusative-indefinite-nominative-plural":"frățișori","accusative-definite-nominative-plural":"frățișorii","dative-genitive-indefinite-singular":"frățișor","dative-definite-genitive-singular":"frățișorului","dative-genitive-indefinite-plural":"frățișori","dative-definite-genitive-plural":"frățișorilor","singular-vocative":"frățișorule","plural-vocative":"frățișorilor"}},{"word":"Frătiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frătiță"}},{"word":"frătiuc","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frătiuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frătiuc","accusative-definite-nominative-singular":"frătiucul","accusative-indefinite-nominative-plural":"frătiuci","accusative-definite-nominative-plural":"frătiucii","dative-genitive-indefinite-singular":"frătiuc","dative-definite-genitive-singular":"frătiucului","dative-genitive-indefinite-plural":"frătiuci","dative-definite-genitive-plural":"frătiucilor","singular-vocative":"frătiucule","plural-vocative":"frătiucilor"}},{"word":"frățiuc","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frățiuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frățiuc","accusative-definite-nominative-singular":"frățiucul","accusative-indefinite-nominative-plural":"frățiuci","accusative-definite-nominative-plural":"frățiucii","dative-genitive-indefinite-singular":"frățiuc","dative-definite-genitive-singular":"frățiucului","dative-genitive-indefinite-plural":"frățiuci","dative-definite-genitive-plural":"frățiucilor","singular-vocative":"frățiucule","plural-vocative":"frățiucilor"}},{"word":"frătiuluc","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frătiuluci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frătiuluc","accusative-definite-nominative-singular":"frătiulucul","accusative-indefinite-nominative-plural":"frătiuluci","accusative-definite-nominative-plural":"frătiulucii","dative-genitive-indefinite-singular":"frătiuluc","dative-definite-genitive-singular":"frătiulucului","dative-genitive-indefinite-plural":"frătiuluci","dative-definite-genitive-plural":"frătiulucilor","singular-vocative":"frătiulucule","plural-vocative":"frătiulucilor"}},{"word":"frătiuluț","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frătiuluți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frătiuluț","accusative-definite-nominative-singular":"frătiuluțul","accusative-indefinite-nominative-plural":"frătiuluți","accusative-definite-nominative-plural":"frătiuluții","dative-genitive-indefinite-singular":"frătiuluț","dative-definite-genitive-singular":"frătiuluțului","dative-genitive-indefinite-plural":"frătiuluți","dative-definite-genitive-plural":"frătiuluților","singular-vocative":"frătiuluțule","plural-vocative":"frătiuluților"}},{"word":"frătiuț","pos":"noun","definitions":["diminutive of frate"],"forms":{"plural":"frătiuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frătiuț","accusative-definite-nominative-singular":"frătiuțul","accusative-indefinite-nominative-plural":"frătiuți","accusative-definite-nominative-plural":"frătiuții","dative-genitive-indefinite-singular":"frătiuț","dative-definite-genitive-singular":"frătiuțului","dative-genitive-indefinite-plural":"frătiuți","dative-definite-genitive-plural":"frătiuților","singular-vocative":"frătiuțule","plural-vocative":"frătiuților"}},{"word":"Fratoștițeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fratoștițeanu"}},{"word":"fratricid","pos":"adj","definitions":["fratricidal"],"forms":{"feminine-singular":"fratricidă","masculine-plural":"fratricizi","feminine-neuter-plural":"fratricide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fratricid","error-unrecognized-form-feminine-indefinite-singular":"fratricidă","error-unrecognized-form-indefinite-masculine-plural":"fratricizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fratricide","definite-error-unrecognized-form-masculine-neuter-singular":"fratricidul","definite-error-unrecognized-form-feminine-singular":"fratricida","definite-error-unrecognized-form-masculine-plural":"fratricizii","definite-error-unrecognized-form-feminine-neuter-plural":"fratricidele"}},{"word":"fratricidă","pos":"noun","definitions":["female equivalent of fratricid"],"forms":{"plural":"fratricide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fratricidă","accusative-definite-nominative-singular":"fratricida","accusative-indefinite-nominative-plural":"fratricide","accusative-definite-nominative-plural":"fratricidele","dative-genitive-indefinite-singular":"fratricide","dative-definite-genitive-singular":"fratricidei","dative-genitive-indefinite-plural":"fratricide","dative-definite-genitive-plural":"fratricidelor","singular-vocative":"fratricidă","plural-vocative":"fratricidelor"}},{"word":"fratrie","pos":"noun","definitions":["phratry"],"forms":{"plural":"fratrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fratrie","accusative-definite-nominative-singular":"fratria","accusative-indefinite-nominative-plural":"fratrii","accusative-definite-nominative-plural":"fratriile","dative-genitive-indefinite-singular":"fratrii","dative-definite-genitive-singular":"fratriei","dative-genitive-indefinite-plural":"fratrii","dative-definite-genitive-plural":"fratriilor","singular-vocative":"fratrie","plural-vocative":"fratriilor"}},{"word":"Frătuțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frătuțescu"}},{"word":"Frâu","pos":"name","definitions":["a river in Bistrița-Năsăud County, Romania, tributary to the Someșul Mare"],"gender":"m"},{"word":"frâu","pos":"noun","definitions":["bridle, curb, check","reins","restraint"],"pronunciation":"/frɨw/","forms":{"plural":"frâie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frâu","accusative-definite-nominative-singular":"frâul","accusative-indefinite-nominative-plural":"frâie","accusative-definite-nominative-plural":"frâiele","dative-genitive-indefinite-singular":"frâu","dative-definite-genitive-singular":"frâului","dative-genitive-indefinite-plural":"frâie","dative-definite-genitive-plural":"frâielor","singular-vocative":"frâule","plural-vocative":"frâielor"}}];
@@ -0,0 +1 @@
+export default [{"word":"frauda","pos":"verb","definitions":["to defraud"],"forms":{"canonical":"a frauda 1st conjugation","present-singular-third-person":"fraudează","participle-past":"fraudat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frauda","gerund":"fraudând","first-person-indicative-present-singular":"fraudez","indicative-present-second-person-singular":"fraudezi","indicative-present-singular-third-person":"fraudează","first-person-indicative-plural-present":"fraudăm","indicative-plural-present-second-person":"fraudați","indicative-plural-present-third-person":"fraudează","first-person-imperfect-indicative-singular":"fraudam","imperfect-indicative-second-person-singular":"fraudai","imperfect-indicative-singular-third-person":"frauda","first-person-imperfect-indicative-plural":"fraudam","imperfect-indicative-plural-second-person":"fraudați","imperfect-indicative-plural-third-person":"fraudau","first-person-indicative-perfect-singular":"fraudai","indicative-perfect-second-person-singular":"fraudași","indicative-perfect-singular-third-person":"fraudă","first-person-indicative-perfect-plural":"fraudarăm","indicative-perfect-plural-second-person":"fraudarăți","indicative-perfect-plural-third-person":"fraudară","first-person-indicative-pluperfect-singular":"fraudasem","indicative-pluperfect-second-person-singular":"fraudaseși","indicative-pluperfect-singular-third-person":"fraudase","first-person-indicative-pluperfect-plural":"fraudaserăm","indicative-pluperfect-plural-second-person":"fraudaserăți","indicative-pluperfect-plural-third-person":"fraudaseră","first-person-present-singular-subjunctive":"să fraudez","present-second-person-singular-subjunctive":"să fraudezi","present-singular-subjunctive-third-person":"să fraudeze","first-person-plural-present-subjunctive":"să fraudăm","plural-present-second-person-subjunctive":"să fraudați","plural-present-subjunctive-third-person":"să fraudeze","imperative-second-person-singular":"fraudează","imperative-plural-second-person":"fraudați","imperative-negative-second-person-singular":"nu frauda","imperative-negative-plural-second-person":"nu fraudați"}},{"word":"fraudă","pos":"noun","definitions":["fraud"],"forms":{"plural":"fraude","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fraudă","accusative-definite-nominative-singular":"frauda","accusative-indefinite-nominative-plural":"fraude","accusative-definite-nominative-plural":"fraudele","dative-genitive-indefinite-singular":"fraude","dative-definite-genitive-singular":"fraudei","dative-genitive-indefinite-plural":"fraude","dative-definite-genitive-plural":"fraudelor","singular-vocative":"fraudă","plural-vocative":"fraudelor"}},{"word":"fraudă fiscală","pos":"noun","definitions":["tax evasion"],"forms":{"plural":"fraude fiscale"}},{"word":"fraudai","pos":"verb","definitions":["inflection of frauda:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fra.uˈdaj]"},{"word":"fraudam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of frauda"],"pronunciation":"[fra.uˈdam]"},{"word":"fraudare","pos":"noun","definitions":["fraud"],"forms":{"plural":"fraudări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fraudare","accusative-definite-nominative-singular":"fraudarea","accusative-indefinite-nominative-plural":"fraudări","accusative-definite-nominative-plural":"fraudările","dative-genitive-indefinite-singular":"fraudări","dative-definite-genitive-singular":"fraudării","dative-genitive-indefinite-plural":"fraudări","dative-definite-genitive-plural":"fraudărilor","singular-vocative":"fraudare","plural-vocative":"fraudărilor"}},{"word":"fraudat","pos":"verb","definitions":["past participle of frauda"],"pronunciation":"[fra.uˈdat]"},{"word":"fraudator","pos":"noun","definitions":["fraudster"],"forms":{"plural":"fraudatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fraudator","accusative-definite-nominative-singular":"fraudatorul","accusative-indefinite-nominative-plural":"fraudatori","accusative-definite-nominative-plural":"fraudatorii","dative-genitive-indefinite-singular":"fraudator","dative-definite-genitive-singular":"fraudatorului","dative-genitive-indefinite-plural":"fraudatori","dative-definite-genitive-plural":"fraudatorilor","singular-vocative":"fraudatorule","plural-vocative":"fraudatorilor"}},{"word":"fraudez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of frauda"],"pronunciation":"[fra.uˈdez]"},{"word":"fraudulos","pos":"adj","definitions":["fraudulent"],"forms":{"feminine-singular":"frauduloasă","masculine-plural":"frauduloși","feminine-neuter-plural":"frauduloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fraudulos","error-unrecognized-form-feminine-indefinite-singular":"frauduloasă","error-unrecognized-form-indefinite-masculine-plural":"frauduloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"frauduloase","definite-error-unrecognized-form-masculine-neuter-singular":"fraudulosul","definite-error-unrecognized-form-feminine-singular":"frauduloasa","definite-error-unrecognized-form-masculine-plural":"frauduloșii","definite-error-unrecognized-form-feminine-neuter-plural":"frauduloasele"}},{"word":"frâuleț","pos":"noun","definitions":["diminutive of frâu; small rein"],"forms":{"plural":"frâulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frâuleț","accusative-definite-nominative-singular":"frâulețul","accusative-indefinite-nominative-plural":"frâulețe","accusative-definite-nominative-plural":"frâulețele","dative-genitive-indefinite-singular":"frâuleț","dative-definite-genitive-singular":"frâulețului","dative-genitive-indefinite-plural":"frâulețe","dative-definite-genitive-plural":"frâulețelor","singular-vocative":"frâulețule","plural-vocative":"frâulețelor"}},{"word":"frâușoare","pos":"noun","definitions":["plural of frâușor"]},{"word":"frâușor","pos":"noun","definitions":["diminutive of frâu"],"forms":{"plural":"frâușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frâușor","accusative-definite-nominative-singular":"frâușorul","accusative-indefinite-nominative-plural":"frâușoare","accusative-definite-nominative-plural":"frâușoarei","dative-genitive-indefinite-singular":"frâușor","dative-definite-genitive-singular":"frâușorului","dative-genitive-indefinite-plural":"frâușoare","dative-definite-genitive-plural":"frâușoarelor","singular-vocative":"frâușorule","plural-vocative":"frâușoarelor"}},{"word":"frâuț","pos":"noun","definitions":["diminutive of frâu"],"forms":{"plural":"frâuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frâuț","accusative-definite-nominative-singular":"frâuțul","accusative-indefinite-nominative-plural":"frâuțe","accusative-definite-nominative-plural":"frâuței","dative-genitive-indefinite-singular":"frâuț","dative-definite-genitive-singular":"frâuțului","dative-genitive-indefinite-plural":"frâuțe","dative-definite-genitive-plural":"frâuțelor","singular-vocative":"frâuțule","plural-vocative":"frâuțelor"}},{"word":"frâuțe","pos":"noun","definitions":["plural of frâuț"]},{"word":"fraza","pos":"verb","definitions":["to phrase"],"pronunciation":"[fraˈza]","forms":{"canonical":"a fraza 1st conjugation","present-singular-third-person":"frazează","participle-past":"frazat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fraza","gerund":"frazând","first-person-indicative-present-singular":"frazez","indicative-present-second-person-singular":"frazezi","indicative-present-singular-third-person":"frazează","first-person-indicative-plural-present":"frazăm","indicative-plural-present-second-person":"frazați","indicative-plural-present-third-person":"frazează","first-person-imperfect-indicative-singular":"frazam","imperfect-indicative-second-person-singular":"frazai","imperfect-indicative-singular-third-person":"fraza","first-person-imperfect-indicative-plural":"frazam","imperfect-indicative-plural-second-person":"frazați","imperfect-indicative-plural-third-person":"frazau","first-person-indicative-perfect-singular":"frazai","indicative-perfect-second-person-singular":"frazași","indicative-perfect-singular-third-person":"frază","first-person-indicative-perfect-plural":"frazarăm","indicative-perfect-plural-second-person":"frazarăți","indicative-perfect-plural-third-person":"frazară","first-person-indicative-pluperfect-singular":"frazasem","indicative-pluperfect-second-person-singular":"frazaseși","indicative-pluperfect-singular-third-person":"frazase","first-person-indicative-pluperfect-plural":"frazaserăm","indicative-pluperfect-plural-second-person":"frazaserăți","indicative-pluperfect-plural-third-person":"frazaseră","first-person-present-singular-subjunctive":"să frazez","present-second-person-singular-subjunctive":"să frazezi","present-singular-subjunctive-third-person":"să frazeze","first-person-plural-present-subjunctive":"să frazăm","plural-present-second-person-subjunctive":"să frazați","plural-present-subjunctive-third-person":"să frazeze","imperative-second-person-singular":"frazează","imperative-plural-second-person":"frazați","imperative-negative-second-person-singular":"nu fraza","imperative-negative-plural-second-person":"nu frazați"}},{"word":"fraza","pos":"noun","definitions":["definite nominative/accusative singular of frază"],"pronunciation":"[ˈfraza]","gender":"f"},{"word":"frază","pos":"noun","definitions":["sentence made up of at least two clauses","phrase"],"forms":{"plural":"fraze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frază","accusative-definite-nominative-singular":"fraza","accusative-indefinite-nominative-plural":"fraze","accusative-definite-nominative-plural":"frazele","dative-genitive-indefinite-singular":"fraze","dative-definite-genitive-singular":"frazei","dative-genitive-indefinite-plural":"fraze","dative-definite-genitive-plural":"frazelor","singular-vocative":"frază","plural-vocative":"frazelor"}},{"word":"frazare","pos":"noun","definitions":["phrasing"],"forms":{"plural":"frazări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frazare","accusative-definite-nominative-singular":"frazarea","accusative-indefinite-nominative-plural":"frazări","accusative-definite-nominative-plural":"frazările","dative-genitive-indefinite-singular":"frazări","dative-definite-genitive-singular":"frazării","dative-genitive-indefinite-plural":"frazări","dative-definite-genitive-plural":"frazărilor","singular-vocative":"frazare","plural-vocative":"frazărilor"}},{"word":"frazeolog","pos":"noun","definitions":["phraseologist"],"forms":{"plural":"frazeologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frazeolog","accusative-definite-nominative-singular":"frazeologul","accusative-indefinite-nominative-plural":"frazeologi","accusative-definite-nominative-plural":"frazeologii","dative-genitive-indefinite-singular":"frazeolog","dative-definite-genitive-singular":"frazeologului","dative-genitive-indefinite-plural":"frazeologi","dative-definite-genitive-plural":"frazeologilor","singular-vocative":"frazeologule","plural-vocative":"frazeologilor"}},{"word":"frazeologă","pos":"noun","definitions":["female equivalent of frazeolog"],"forms":{"plural":"frazeologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frazeologă","accusative-definite-nominative-singular":"frazeologa","accusative-indefinite-nominative-plural":"frazeologe","accusative-definite-nominative-plural":"frazeologele","dative-genitive-indefinite-singular":"frazeologe","dative-definite-genitive-singular":"frazeologei","dative-genitive-indefinite-plural":"frazeologe","dative-definite-genitive-plural":"frazeologelor","singular-vocative":"frazeologă","plural-vocative":"frazeologelor"}},{"word":"frazeologic","pos":"adj","definitions":["phraseological"],"forms":{"feminine-singular":"frazeologică","masculine-plural":"frazeologici","feminine-neuter-plural":"frazeologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frazeologic","error-unrecognized-form-feminine-indefinite-singular":"frazeologică","error-unrecognized-form-indefinite-masculine-plural":"frazeologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frazeologice","definite-error-unrecognized-form-masculine-neuter-singular":"frazeologicul","definite-error-unrecognized-form-feminine-singular":"frazeologica","definite-error-unrecognized-form-masculine-plural":"frazeologicii","definite-error-unrecognized-form-feminine-neuter-plural":"frazeologicele"}},{"word":"frazeologie","pos":"noun","definitions":["phraseology"],"forms":{"plural":"frazeologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frazeologie","accusative-definite-nominative-singular":"frazeologia","accusative-indefinite-nominative-plural":"frazeologii","accusative-definite-nominative-plural":"frazeologiile","dative-genitive-indefinite-singular":"frazeologii","dative-definite-genitive-singular":"frazeologiei","dative-genitive-indefinite-plural":"frazeologii","dative-definite-genitive-plural":"frazeologiilor","singular-vocative":"frazeologie","plural-vocative":"frazeologiilor"}},{"word":"freacă","pos":"verb","definitions":["inflection of freca:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[ˈfre̯akə]"},{"word":"freamăt","pos":"noun","definitions":["rustling, rustle","flurry, bustle","commotion, uproar, tumult","murmur"],"forms":{"plural":"freamăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"freamăt","accusative-definite-nominative-singular":"freamătul","accusative-indefinite-nominative-plural":"freamăte","accusative-definite-nominative-plural":"freamătele","dative-genitive-indefinite-singular":"freamăt","dative-definite-genitive-singular":"freamătului","dative-genitive-indefinite-plural":"freamăte","dative-definite-genitive-plural":"freamătelor","singular-vocative":"freamătule","plural-vocative":"freamătelor"}},{"word":"freatic","pos":"adj","definitions":["phreatic"],"forms":{"feminine-singular":"freatică","masculine-plural":"freatici","feminine-neuter-plural":"freatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"freatic","error-unrecognized-form-feminine-indefinite-singular":"freatică","error-unrecognized-form-indefinite-masculine-plural":"freatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"freatice","definite-error-unrecognized-form-masculine-neuter-singular":"freaticul","definite-error-unrecognized-form-feminine-singular":"freatica","definite-error-unrecognized-form-masculine-plural":"freaticii","definite-error-unrecognized-form-feminine-neuter-plural":"freaticele"}},{"word":"frec","pos":"verb","definitions":["first-person singular present indicative/subjunctive of freca"],"pronunciation":"[frek]"},{"word":"freca","pos":"verb","definitions":["to rub","to rub against","to beat","to give a beating","short for freca la cap (“to bother”)"],"pronunciation":"/freˈka/","examples":[{"ro":"a își freca mâinile","en":"to rub one’s hands"},{"ro":"se freca la ochi","en":"to rub one’s eyes"},{"ro":"Hainele îmi sunt pătate cu var fiindcă m-am frecat de zid.","en":"My clothes are stained with whitewash because I rubbed against the wall."}],"forms":{"canonical":"a freca 1st conjugation","present-singular-third-person":"freacă","participle-past":"frecat","subjunctive-third-person":"frece","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a freca","gerund":"frecând","first-person-indicative-present-singular":"frec","indicative-present-second-person-singular":"freci","indicative-present-singular-third-person":"freacă","first-person-indicative-plural-present":"frecăm","indicative-plural-present-second-person":"frecați","indicative-plural-present-third-person":"freacă","first-person-imperfect-indicative-singular":"frecam","imperfect-indicative-second-person-singular":"frecai","imperfect-indicative-singular-third-person":"freca","first-person-imperfect-indicative-plural":"frecam","imperfect-indicative-plural-second-person":"frecați","imperfect-indicative-plural-third-person":"frecau","first-person-indicative-perfect-singular":"frecai","indicative-perfect-second-person-singular":"frecași","indicative-perfect-singular-third-person":"frecă","first-person-indicative-perfect-plural":"frecarăm","indicative-perfect-plural-second-person":"frecarăți","indicative-perfect-plural-third-person":"frecară","first-person-indicative-pluperfect-singular":"frecasem","indicative-pluperfect-second-person-singular":"frecaseși","indicative-pluperfect-singular-third-person":"frecase","first-person-indicative-pluperfect-plural":"frecaserăm","indicative-pluperfect-plural-second-person":"frecaserăți","indicative-pluperfect-plural-third-person":"frecaseră","first-person-present-singular-subjunctive":"să frec","present-second-person-singular-subjunctive":"să freci","present-singular-subjunctive-third-person":"să frece","first-person-plural-present-subjunctive":"să frecăm","plural-present-second-person-subjunctive":"să frecați","plural-present-subjunctive-third-person":"să frece","imperative-second-person-singular":"freacă","imperative-plural-second-person":"frecați","imperative-negative-second-person-singular":"nu freca","imperative-negative-plural-second-person":"nu frecați"}},{"word":"frecă","pos":"verb","definitions":["third-person singular simple perfect indicative of freca"],"pronunciation":"[freˈkə]"},{"word":"freca menta","pos":"verb","definitions":["to waste time"],"forms":{"canonical":"a freca menta 1st conjugation","present-singular-third-person":"freacă mentă","participle-past":"frecat mentă"}},{"word":"frecai","pos":"verb","definitions":["inflection of freca:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[freˈkaj]"},{"word":"frecălău","pos":"noun","definitions":["rolling pin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frecălău","accusative-definite-nominative":"frecălăuul","dative-genitive-indefinite":"frecălău","dative-definite-genitive":"frecălăuului","vocative":"frecălăuule"}},{"word":"frecam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of freca"],"pronunciation":"[freˈkam]"},{"word":"frecăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of freca"],"pronunciation":"[freˈkəm]"},{"word":"frecangiu","pos":"noun","definitions":["a lazy person"],"forms":{"plural":"frecangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frecangiu","accusative-definite-nominative-singular":"frecangiuul","accusative-indefinite-nominative-plural":"frecangii","accusative-definite-nominative-plural":"frecangiii","dative-genitive-indefinite-singular":"frecangiu","dative-definite-genitive-singular":"frecangiuului","dative-genitive-indefinite-plural":"frecangii","dative-definite-genitive-plural":"frecangiilor","singular-vocative":"frecangiuule","plural-vocative":"frecangiilor"}},{"word":"frecară","pos":"verb","definitions":["third-person plural simple perfect indicative of freca"],"pronunciation":"[freˈkarə]"},{"word":"frecarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of freca"],"pronunciation":"[freˈkarəm]"},{"word":"frecarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of freca"],"pronunciation":"[freˈkarət͡sʲ]"},{"word":"frecare","pos":"noun","definitions":["friction"],"forms":{"plural":"frecări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frecare","accusative-definite-nominative-singular":"frecarea","accusative-indefinite-nominative-plural":"frecări","accusative-definite-nominative-plural":"frecările","dative-genitive-indefinite-singular":"frecări","dative-definite-genitive-singular":"frecării","dative-genitive-indefinite-plural":"frecări","dative-definite-genitive-plural":"frecărilor","singular-vocative":"frecare","plural-vocative":"frecărilor"}},{"word":"frecase","pos":"verb","definitions":["third-person singular pluperfect indicative of freca"],"pronunciation":"[freˈkase]"},{"word":"frecasem","pos":"verb","definitions":["first-person singular pluperfect indicative of freca"],"pronunciation":"[freˈkasem]"},{"word":"frecaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of freca"],"pronunciation":"[freˈkaserə]"},{"word":"frecaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of freca"],"pronunciation":"[freˈkaserəm]"},{"word":"frecaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of freca"],"pronunciation":"[freˈkaserət͡sʲ]"},{"word":"frecaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of freca"],"pronunciation":"[freˈkaseʃʲ]"},{"word":"frecași","pos":"verb","definitions":["second-person singular simple perfect indicative of freca"],"pronunciation":"[freˈkaʃʲ]"},{"word":"frecat","pos":"noun","definitions":["scrub"],"pronunciation":"[freˈkat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frecat","accusative-definite-nominative":"frecatul","dative-genitive-indefinite":"frecat","dative-definite-genitive":"frecatului","vocative":"frecatule"}},{"word":"frecat","pos":"verb","definitions":["past participle of freca"],"pronunciation":"[freˈkat]","forms":{"participle-past":"of freca"}},{"word":"Frecățeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Frecățeanu"}},{"word":"Frecăței","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Frecăței, Brăila County, Romania","a commune of Tulcea County, Romania","a village in Frecăței, Tulcea County, Romania","a village in Movilița, Vrancea County, Romania"],"gender":"m"},{"word":"frecați","pos":"adj","definitions":["masculine plural of frecat"],"pronunciation":"[freˈkat͡sʲ]"},{"word":"frecați","pos":"verb","definitions":["inflection of freca:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[freˈkat͡sʲ]"},{"word":"frecătură","pos":"noun","definitions":["rub"],"forms":{"plural":"frecături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frecătură","accusative-definite-nominative-singular":"frecătura","accusative-indefinite-nominative-plural":"frecături","accusative-definite-nominative-plural":"frecăturile","dative-genitive-indefinite-singular":"frecături","dative-definite-genitive-singular":"frecăturii","dative-genitive-indefinite-plural":"frecături","dative-definite-genitive-plural":"frecăturilor","singular-vocative":"frecătură","plural-vocative":"frecăturilor"}},{"word":"frecau","pos":"verb","definitions":["third-person plural imperfect indicative of freca"],"pronunciation":"[freˈkaw]"},{"word":"frece","pos":"verb","definitions":["third-person singular/plural present subjunctive of freca"],"pronunciation":"[ˈfret͡ʃe]"},{"word":"freci","pos":"verb","definitions":["second-person singular present indicative/subjunctive of freca"],"pronunciation":"[fret͡ʃʲ]"},{"word":"frecție","pos":"noun","definitions":["alternative form of fricțiune"],"forms":{"plural":"frecții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frecție","accusative-definite-nominative-singular":"frecția","accusative-indefinite-nominative-plural":"frecții","accusative-definite-nominative-plural":"frecțiile","dative-genitive-indefinite-singular":"frecții","dative-definite-genitive-singular":"frecției","dative-genitive-indefinite-plural":"frecții","dative-definite-genitive-plural":"frecțiilor","singular-vocative":"frecție","plural-vocative":"frecțiilor"}},{"word":"frecționa","pos":"verb","definitions":["to rub"],"forms":{"canonical":"a frecționa 1st conjugation","present-singular-third-person":"frecționează","participle-past":"frecționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frecționa","gerund":"frecționând","first-person-indicative-present-singular":"frecționez","indicative-present-second-person-singular":"frecționezi","indicative-present-singular-third-person":"frecționează","first-person-indicative-plural-present":"frecționăm","indicative-plural-present-second-person":"frecționați","indicative-plural-present-third-person":"frecționează","first-person-imperfect-indicative-singular":"frecționam","imperfect-indicative-second-person-singular":"frecționai","imperfect-indicative-singular-third-person":"frecționa","first-person-imperfect-indicative-plural":"frecționam","imperfect-indicative-plural-second-person":"frecționați","imperfect-indicative-plural-third-person":"frecționau","first-person-indicative-perfect-singular":"frecționai","indicative-perfect-second-person-singular":"frecționași","indicative-perfect-singular-third-person":"frecționă","first-person-indicative-perfect-plural":"frecționarăm","indicative-perfect-plural-second-person":"frecționarăți","indicative-perfect-plural-third-person":"frecționară","first-person-indicative-pluperfect-singular":"frecționasem","indicative-pluperfect-second-person-singular":"frecționaseși","indicative-pluperfect-singular-third-person":"frecționase","first-person-indicative-pluperfect-plural":"frecționaserăm","indicative-pluperfect-plural-second-person":"frecționaserăți","indicative-pluperfect-plural-third-person":"frecționaseră","first-person-present-singular-subjunctive":"să frecționez","present-second-person-singular-subjunctive":"să frecționezi","present-singular-subjunctive-third-person":"să frecționeze","first-person-plural-present-subjunctive":"să frecționăm","plural-present-second-person-subjunctive":"să frecționați","plural-present-subjunctive-third-person":"să frecționeze","imperative-second-person-singular":"frecționează","imperative-plural-second-person":"frecționați","imperative-negative-second-person-singular":"nu frecționa","imperative-negative-plural-second-person":"nu frecționați"}},{"word":"Frecuș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frecuș"}},{"word":"frecuș","pos":"noun","definitions":["rubdown"],"forms":{"plural":"frecușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frecuș","accusative-definite-nominative-singular":"frecușul","accusative-indefinite-nominative-plural":"frecușuri","accusative-definite-nominative-plural":"frecușurile","dative-genitive-indefinite-singular":"frecuș","dative-definite-genitive-singular":"frecușului","dative-genitive-indefinite-plural":"frecușuri","dative-definite-genitive-plural":"frecușurilor","singular-vocative":"frecușule","plural-vocative":"frecușurilor"}},{"word":"frecvent","pos":"adj","definitions":["frequent"],"pronunciation":"/frekˈvent/","forms":{"feminine-singular":"frecventă","masculine-plural":"frecvenți","feminine-neuter-plural":"frecvente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frecvent","error-unrecognized-form-feminine-indefinite-singular":"frecventă","error-unrecognized-form-indefinite-masculine-plural":"frecvenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frecvente","definite-error-unrecognized-form-masculine-neuter-singular":"frecventul","definite-error-unrecognized-form-feminine-singular":"frecventa","definite-error-unrecognized-form-masculine-plural":"frecvenții","definite-error-unrecognized-form-feminine-neuter-plural":"frecventele","alternative":"frecuent"}},{"word":"frecventa","pos":"verb","definitions":["to frequent, to go to (a place)"],"forms":{"canonical":"a frecventa 1st conjugation","present-singular-third-person":"frecventează","participle-past":"frecventat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frecventa","gerund":"frecventând","first-person-indicative-present-singular":"frecventez","indicative-present-second-person-singular":"frecventezi","indicative-present-singular-third-person":"frecventează","first-person-indicative-plural-present":"frecventăm","indicative-plural-present-second-person":"frecventați","indicative-plural-present-third-person":"frecventează","first-person-imperfect-indicative-singular":"frecventam","imperfect-indicative-second-person-singular":"frecventai","imperfect-indicative-singular-third-person":"frecventa","first-person-imperfect-indicative-plural":"frecventam","imperfect-indicative-plural-second-person":"frecventați","imperfect-indicative-plural-third-person":"frecventau","first-person-indicative-perfect-singular":"frecventai","indicative-perfect-second-person-singular":"frecventași","indicative-perfect-singular-third-person":"frecventă","first-person-indicative-perfect-plural":"frecventarăm","indicative-perfect-plural-second-person":"frecventarăți","indicative-perfect-plural-third-person":"frecventară","first-person-indicative-pluperfect-singular":"frecventasem","indicative-pluperfect-second-person-singular":"frecventaseși","indicative-pluperfect-singular-third-person":"frecventase","first-person-indicative-pluperfect-plural":"frecventaserăm","indicative-pluperfect-plural-second-person":"frecventaserăți","indicative-pluperfect-plural-third-person":"frecventaseră","first-person-present-singular-subjunctive":"să frecventez","present-second-person-singular-subjunctive":"să frecventezi","present-singular-subjunctive-third-person":"să frecventeze","first-person-plural-present-subjunctive":"să frecventăm","plural-present-second-person-subjunctive":"să frecventați","plural-present-subjunctive-third-person":"să frecventeze","imperative-second-person-singular":"frecventează","imperative-plural-second-person":"frecventați","imperative-negative-second-person-singular":"nu frecventa","imperative-negative-plural-second-person":"nu frecventați"}},{"word":"frecvență","pos":"noun","definitions":["frequency"],"pronunciation":"/frekˈvent͡sə/","forms":{"plural":"frecvențe"}},{"word":"frecvență fundamentală","pos":"noun","definitions":["fundamental frequency"],"forms":{"plural":"frecvențe fundamentale"}},{"word":"frecvență radio","pos":"noun","definitions":["radio frequency"],"forms":{"plural":"frecvențe radio"}},{"word":"frecventabil","pos":"adj","definitions":["respectable"],"forms":{"feminine-singular":"frecventabilă","masculine-plural":"frecventabili","feminine-neuter-plural":"frecventabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frecventabil","error-unrecognized-form-feminine-indefinite-singular":"frecventabilă","error-unrecognized-form-indefinite-masculine-plural":"frecventabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"frecventabile","definite-error-unrecognized-form-masculine-neuter-singular":"frecventabilul","definite-error-unrecognized-form-feminine-singular":"frecventabila","definite-error-unrecognized-form-masculine-plural":"frecventabilii","definite-error-unrecognized-form-feminine-neuter-plural":"frecventabilele"}},{"word":"frecventare","pos":"noun","definitions":["attendance"],"forms":{"plural":"frecventări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frecventare","accusative-definite-nominative-singular":"frecventarea","accusative-indefinite-nominative-plural":"frecventări","accusative-definite-nominative-plural":"frecventările","dative-genitive-indefinite-singular":"frecventări","dative-definite-genitive-singular":"frecventării","dative-genitive-indefinite-plural":"frecventări","dative-definite-genitive-plural":"frecventărilor","singular-vocative":"frecventare","plural-vocative":"frecventărilor"}},{"word":"frecventativ","pos":"adj","definitions":["frequentative"],"pronunciation":"/frekventaˈtiv/","forms":{"feminine-singular":"frecventativă","masculine-plural":"frecventativi","feminine-neuter-plural":"frecventative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frecventativ","error-unrecognized-form-feminine-indefinite-singular":"frecventativă","error-unrecognized-form-indefinite-masculine-plural":"frecventativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"frecventative","definite-error-unrecognized-form-masculine-neuter-singular":"frecventativul","definite-error-unrecognized-form-feminine-singular":"frecventativa","definite-error-unrecognized-form-masculine-plural":"frecventativii","definite-error-unrecognized-form-feminine-neuter-plural":"frecventativele"}},{"word":"frecventatoare","pos":"noun","definitions":["female equivalent of frecventator"],"forms":{"plural":"frecventatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"frecventatoare","accusative-definite-nominative-singular":"frecventatoarea","accusative-indefinite-nominative-plural":"frecventatoare","accusative-definite-nominative-plural":"frecventatoarele","dative-genitive-indefinite-singular":"frecventatoare","dative-definite-genitive-singular":"frecventatoarei","dative-genitive-indefinite-plural":"frecventatoare","dative-definite-genitive-plural":"frecventatoarelor","singular-vocative":"frecventatoare","plural-vocative":"frecventatoarelor"}},{"word":"frecventator","pos":"adj","definitions":["frequenting"],"forms":{"feminine-singular":"frecventatoare","masculine-plural":"frecventatori","feminine-neuter-plural":"frecventatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frecventator","error-unrecognized-form-feminine-indefinite-singular":"frecventatoare","error-unrecognized-form-indefinite-masculine-plural":"frecventatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"frecventatoare","definite-error-unrecognized-form-masculine-neuter-singular":"frecventatorul","definite-error-unrecognized-form-feminine-singular":"frecventatoarea","definite-error-unrecognized-form-masculine-plural":"frecventatorii","definite-error-unrecognized-form-feminine-neuter-plural":"frecventatoarele"}},{"word":"frecventator","pos":"noun","definitions":["frequenter"],"forms":{"plural":"frecventatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frecventator","accusative-definite-nominative-singular":"frecventatorul","accusative-indefinite-nominative-plural":"frecventatori","accusative-definite-nominative-plural":"frecventatorii","dative-genitive-indefinite-singular":"frecventator","dative-definite-genitive-singular":"frecventatorului","dative-genitive-indefinite-plural":"frecventatori","dative-definite-genitive-plural":"frecventatorilor","singular-vocative":"frecventatorule","plural-vocative":"frecventatorilor"}},{"word":"frecvențmetru","pos":"noun","definitions":["frequency meter"],"forms":{"plural":"frecvențmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frecvențmetru","accusative-definite-nominative-singular":"frecvențmetruul","accusative-indefinite-nominative-plural":"frecvențmetre","accusative-definite-nominative-plural":"frecvențmetrele","dative-genitive-indefinite-singular":"frecvențmetru","dative-definite-genitive-singular":"frecvențmetruului","dative-genitive-indefinite-plural":"frecvențmetre","dative-definite-genitive-plural":"frecvențmetrelor","singular-vocative":"frecvențmetruule","plural-vocative":"frecvențmetrelor"}},{"word":"fredona","pos":"verb","definitions":["to hum"],"forms":{"canonical":"a fredona 1st conjugation","present-singular-third-person":"fredonează","participle-past":"fredonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fredona","gerund":"fredonând","first-person-indicative-present-singular":"fredonez","indicative-present-second-person-singular":"fredonezi","indicative-present-singular-third-person":"fredonează","first-person-indicative-plural-present":"fredonăm","indicative-plural-present-second-person":"fredonați","indicative-plural-present-third-person":"fredonează","first-person-imperfect-indicative-singular":"fredonam","imperfect-indicative-second-person-singular":"fredonai","imperfect-indicative-singular-third-person":"fredona","first-person-imperfect-indicative-plural":"fredonam","imperfect-indicative-plural-second-person":"fredonați","imperfect-indicative-plural-third-person":"fredonau","first-person-indicative-perfect-singular":"fredonai","indicative-perfect-second-person-singular":"fredonași","indicative-perfect-singular-third-person":"fredonă","first-person-indicative-perfect-plural":"fredonarăm","indicative-perfect-plural-second-person":"fredonarăți","indicative-perfect-plural-third-person":"fredonară","first-person-indicative-pluperfect-singular":"fredonasem","indicative-pluperfect-second-person-singular":"fredonaseși","indicative-pluperfect-singular-third-person":"fredonase","first-person-indicative-pluperfect-plural":"fredonaserăm","indicative-pluperfect-plural-second-person":"fredonaserăți","indicative-pluperfect-plural-third-person":"fredonaseră","first-person-present-singular-subjunctive":"să fredonez","present-second-person-singular-subjunctive":"să fredonezi","present-singular-subjunctive-third-person":"să fredoneze","first-person-plural-present-subjunctive":"să fredonăm","plural-present-second-person-subjunctive":"să fredonați","plural-present-subjunctive-third-person":"să fredoneze","imperative-second-person-singular":"fredonează","imperative-plural-second-person":"fredonați","imperative-negative-second-person-singular":"nu fredona","imperative-negative-plural-second-person":"nu fredonați"}},{"word":"fredonare","pos":"noun","definitions":["humming"],"forms":{"plural":"fredonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fredonare","accusative-definite-nominative-singular":"fredonarea","accusative-indefinite-nominative-plural":"fredonări","accusative-definite-nominative-plural":"fredonările","dative-genitive-indefinite-singular":"fredonări","dative-definite-genitive-singular":"fredonării","dative-genitive-indefinite-plural":"fredonări","dative-definite-genitive-plural":"fredonărilor","singular-vocative":"fredonare","plural-vocative":"fredonărilor"}},{"word":"fredonat","pos":"adj","definitions":["hummed"],"forms":{"feminine-singular":"fredonată","masculine-plural":"fredonați","feminine-neuter-plural":"fredonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fredonat","error-unrecognized-form-feminine-indefinite-singular":"fredonată","error-unrecognized-form-indefinite-masculine-plural":"fredonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fredonate","definite-error-unrecognized-form-masculine-neuter-singular":"fredonatul","definite-error-unrecognized-form-feminine-singular":"fredonata","definite-error-unrecognized-form-masculine-plural":"fredonații","definite-error-unrecognized-form-feminine-neuter-plural":"fredonatele"}},{"word":"fregată","pos":"noun","definitions":["frigate"],"forms":{"plural":"fregate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fregată","accusative-definite-nominative-singular":"fregata","accusative-indefinite-nominative-plural":"fregate","accusative-definite-nominative-plural":"fregatele","dative-genitive-indefinite-singular":"fregate","dative-definite-genitive-singular":"fregatei","dative-genitive-indefinite-plural":"fregate","dative-definite-genitive-plural":"fregatelor","singular-vocative":"fregată","plural-vocative":"fregatelor"}},{"word":"Freidorf","pos":"name","definitions":["A neighbourhood of Timișoara and former commune of Timiș County, Romania."],"pronunciation":"/ˈfraj.dorf/","gender":"n","forms":{"alternative-pronunciation-spelling":"Fraidorf"}},{"word":"fremăta","pos":"verb","definitions":["to rustle","to murmur","to be seized by emotion; also to shiver, shudder, shake, tremble"],"forms":{"canonical":"a fremăta 1st conjugation","present-singular-third-person":"freamătă","participle-past":"fremătat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fremăta","gerund":"fremătând","first-person-indicative-present-singular":"fremăt","indicative-present-second-person-singular":"fremeți","indicative-present-singular-third-person":"freamătă","first-person-indicative-plural-present":"fremătăm","indicative-plural-present-second-person":"fremătați","indicative-plural-present-third-person":"freamătă","first-person-imperfect-indicative-singular":"fremătam","imperfect-indicative-second-person-singular":"fremătai","imperfect-indicative-singular-third-person":"fremăta","first-person-imperfect-indicative-plural":"fremătam","imperfect-indicative-plural-second-person":"fremătați","imperfect-indicative-plural-third-person":"fremătau","first-person-indicative-perfect-singular":"fremătai","indicative-perfect-second-person-singular":"fremătași","indicative-perfect-singular-third-person":"fremătă","first-person-indicative-perfect-plural":"fremătarăm","indicative-perfect-plural-second-person":"fremătarăți","indicative-perfect-plural-third-person":"fremătară","first-person-indicative-pluperfect-singular":"fremătasem","indicative-pluperfect-second-person-singular":"fremătaseși","indicative-pluperfect-singular-third-person":"fremătase","first-person-indicative-pluperfect-plural":"fremătaserăm","indicative-pluperfect-plural-second-person":"fremătaserăți","indicative-pluperfect-plural-third-person":"fremătaseră","first-person-present-singular-subjunctive":"să fremăt","present-second-person-singular-subjunctive":"să fremeți","present-singular-subjunctive-third-person":"să fremete","first-person-plural-present-subjunctive":"să fremătăm","plural-present-second-person-subjunctive":"să fremătați","plural-present-subjunctive-third-person":"să fremete","imperative-second-person-singular":"freamătă","imperative-plural-second-person":"fremătați","imperative-negative-second-person-singular":"nu fremăta","imperative-negative-plural-second-person":"nu fremătați"}},{"word":"fremătând","pos":"adj","definitions":["rustling"],"forms":{"feminine-singular":"fremătândă","masculine-plural":"fremătânzi","feminine-neuter-plural":"fremătânde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fremătând","error-unrecognized-form-feminine-indefinite-singular":"fremătândă","error-unrecognized-form-indefinite-masculine-plural":"fremătânzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fremătânde","definite-error-unrecognized-form-masculine-neuter-singular":"fremătândul","definite-error-unrecognized-form-feminine-singular":"fremătânda","definite-error-unrecognized-form-masculine-plural":"fremătânzii","definite-error-unrecognized-form-feminine-neuter-plural":"fremătândele"}},{"word":"fremătare","pos":"noun","definitions":["rustle"],"forms":{"plural":"fremătări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fremătare","accusative-definite-nominative-singular":"fremătarea","accusative-indefinite-nominative-plural":"fremătări","accusative-definite-nominative-plural":"fremătările","dative-genitive-indefinite-singular":"fremătări","dative-definite-genitive-singular":"fremătării","dative-genitive-indefinite-plural":"fremătări","dative-definite-genitive-plural":"fremătărilor","singular-vocative":"fremătare","plural-vocative":"fremătărilor"}},{"word":"fremătător","pos":"adj","definitions":["rustling"],"forms":{"feminine-singular":"fremătătoare","masculine-plural":"fremătători","feminine-neuter-plural":"fremătătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fremătător","error-unrecognized-form-feminine-indefinite-singular":"fremătătoare","error-unrecognized-form-indefinite-masculine-plural":"fremătători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fremătătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fremătătorul","definite-error-unrecognized-form-feminine-singular":"fremătătoarea","definite-error-unrecognized-form-masculine-plural":"fremătătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fremătătoarele"}},{"word":"fremete","pos":"verb","definitions":["third-person singular/plural present subjunctive of fremăta"],"pronunciation":"[ˈfremete]"},{"word":"fremisment","pos":"noun","definitions":["quiver, shiver (light shaking movement)"],"forms":{"plural":"fremismente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fremisment","accusative-definite-nominative-singular":"fremismentul","accusative-indefinite-nominative-plural":"fremismente","accusative-definite-nominative-plural":"fremismentele","dative-genitive-indefinite-singular":"fremisment","dative-definite-genitive-singular":"fremismentului","dative-genitive-indefinite-plural":"fremismente","dative-definite-genitive-plural":"fremismentelor","singular-vocative":"fremismentule","plural-vocative":"fremismentelor"}},{"word":"Frenciugi","pos":"name","definitions":["a village in Drăgușeni, Iași County, Romania"],"gender":"m"},{"word":"frenetic","pos":"adj","definitions":["frenetic"],"forms":{"feminine-singular":"frenetică","masculine-plural":"frenetici","feminine-neuter-plural":"frenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frenetic","error-unrecognized-form-feminine-indefinite-singular":"frenetică","error-unrecognized-form-indefinite-masculine-plural":"frenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frenetice","definite-error-unrecognized-form-masculine-neuter-singular":"freneticul","definite-error-unrecognized-form-feminine-singular":"frenetica","definite-error-unrecognized-form-masculine-plural":"freneticii","definite-error-unrecognized-form-feminine-neuter-plural":"freneticele"}},{"word":"frenezie","pos":"noun","definitions":["frenzy"],"forms":{"plural":"frenezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frenezie","accusative-definite-nominative-singular":"frenezia","accusative-indefinite-nominative-plural":"frenezii","accusative-definite-nominative-plural":"freneziile","dative-genitive-indefinite-singular":"frenezii","dative-definite-genitive-singular":"freneziei","dative-genitive-indefinite-plural":"frenezii","dative-definite-genitive-plural":"freneziilor","singular-vocative":"frenezie","plural-vocative":"freneziilor"}},{"word":"frenghie","pos":"noun","definitions":["brocade"],"forms":{"plural":"frenghii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frenghie","accusative-definite-nominative-singular":"frenghia","accusative-indefinite-nominative-plural":"frenghii","accusative-definite-nominative-plural":"frenghiile","dative-genitive-indefinite-singular":"frenghii","dative-definite-genitive-singular":"frenghiei","dative-genitive-indefinite-plural":"frenghii","dative-definite-genitive-plural":"frenghiilor","singular-vocative":"frenghie","plural-vocative":"frenghiilor"}},{"word":"frenic","pos":"adj","definitions":["phrenic"],"forms":{"feminine-singular":"frenică","masculine-plural":"frenici","feminine-neuter-plural":"frenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frenic","error-unrecognized-form-feminine-indefinite-singular":"frenică","error-unrecognized-form-indefinite-masculine-plural":"frenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frenice","definite-error-unrecognized-form-masculine-neuter-singular":"frenicul","definite-error-unrecognized-form-feminine-singular":"frenica","definite-error-unrecognized-form-masculine-plural":"frenicii","definite-error-unrecognized-form-feminine-neuter-plural":"frenicele"}},{"word":"frenicotomie","pos":"noun","definitions":["phrenectomy"],"forms":{"plural":"frenicotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frenicotomie","accusative-definite-nominative-singular":"frenicotomia","accusative-indefinite-nominative-plural":"frenicotomii","accusative-definite-nominative-plural":"frenicotomiile","dative-genitive-indefinite-singular":"frenicotomii","dative-definite-genitive-singular":"frenicotomiei","dative-genitive-indefinite-plural":"frenicotomii","dative-definite-genitive-plural":"frenicotomiilor","singular-vocative":"frenicotomie","plural-vocative":"frenicotomiilor"}},{"word":"frenită","pos":"noun","definitions":["phrenitis"],"forms":{"plural":"frenite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frenită","accusative-definite-nominative-singular":"frenita","accusative-indefinite-nominative-plural":"frenite","accusative-definite-nominative-plural":"frenitele","dative-genitive-indefinite-singular":"frenite","dative-definite-genitive-singular":"frenitei","dative-genitive-indefinite-plural":"frenite","dative-definite-genitive-plural":"frenitelor","singular-vocative":"frenită","plural-vocative":"frenitelor"}},{"word":"frenolog","pos":"noun","definitions":["phrenologist"],"forms":{"plural":"frenologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frenolog","accusative-definite-nominative-singular":"frenologul","accusative-indefinite-nominative-plural":"frenologi","accusative-definite-nominative-plural":"frenologii","dative-genitive-indefinite-singular":"frenolog","dative-definite-genitive-singular":"frenologului","dative-genitive-indefinite-plural":"frenologi","dative-definite-genitive-plural":"frenologilor","singular-vocative":"frenologule","plural-vocative":"frenologilor"}},{"word":"frenologic","pos":"adj","definitions":["phrenological"],"forms":{"feminine-singular":"frenologică","masculine-plural":"frenologici","feminine-neuter-plural":"frenologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frenologic","error-unrecognized-form-feminine-indefinite-singular":"frenologică","error-unrecognized-form-indefinite-masculine-plural":"frenologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frenologice","definite-error-unrecognized-form-masculine-neuter-singular":"frenologicul","definite-error-unrecognized-form-feminine-singular":"frenologica","definite-error-unrecognized-form-masculine-plural":"frenologicii","definite-error-unrecognized-form-feminine-neuter-plural":"frenologicele"}},{"word":"frenologie","pos":"noun","definitions":["phrenology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"frenologie","accusative-definite-nominative":"frenologia","dative-genitive-indefinite":"frenologii","dative-definite-genitive":"frenologiei","vocative":"frenologie"}},{"word":"frenopatie","pos":"noun","definitions":["phrenopathy"],"forms":{"plural":"frenopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frenopatie","accusative-definite-nominative-singular":"frenopatia","accusative-indefinite-nominative-plural":"frenopatii","accusative-definite-nominative-plural":"frenopatiile","dative-genitive-indefinite-singular":"frenopatii","dative-definite-genitive-singular":"frenopatiei","dative-genitive-indefinite-plural":"frenopatii","dative-definite-genitive-plural":"frenopatiilor","singular-vocative":"frenopatie","plural-vocative":"frenopatiilor"}},{"word":"frenoptoză","pos":"noun","definitions":["diaphragmatic depression"],"forms":{"plural":"frenoptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frenoptoză","accusative-definite-nominative-singular":"frenoptoza","accusative-indefinite-nominative-plural":"frenoptoze","accusative-definite-nominative-plural":"frenoptozele","dative-genitive-indefinite-singular":"frenoptoze","dative-definite-genitive-singular":"frenoptozei","dative-genitive-indefinite-plural":"frenoptoze","dative-definite-genitive-plural":"frenoptozelor","singular-vocative":"frenoptoză","plural-vocative":"frenoptozelor"}},{"word":"frenotomie","pos":"noun","definitions":["frenotomy"],"forms":{"plural":"frenotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frenotomie","accusative-definite-nominative-singular":"frenotomia","accusative-indefinite-nominative-plural":"frenotomii","accusative-definite-nominative-plural":"frenotomiile","dative-genitive-indefinite-singular":"frenotomii","dative-definite-genitive-singular":"frenotomiei","dative-genitive-indefinite-plural":"frenotomii","dative-definite-genitive-plural":"frenotomiilor","singular-vocative":"frenotomie","plural-vocative":"frenotomiilor"}},{"word":"frențe","pos":"noun","definitions":["syphilis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"frențe","accusative-definite-nominative":"frențele","dative-genitive-indefinite":"frențe","dative-definite-genitive":"frențelor","vocative":"-"}},{"word":"Frențescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frențescu"}},{"word":"frențit","pos":"adj","definitions":["syphilitic"],"forms":{"feminine-singular":"frențită","masculine-plural":"frențiți","feminine-neuter-plural":"frențite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frențit","error-unrecognized-form-feminine-indefinite-singular":"frențită","error-unrecognized-form-indefinite-masculine-plural":"frențiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frențite","definite-error-unrecognized-form-masculine-neuter-singular":"frențitul","definite-error-unrecognized-form-feminine-singular":"frențita","definite-error-unrecognized-form-masculine-plural":"frențiții","definite-error-unrecognized-form-feminine-neuter-plural":"frențitele"}},{"word":"Frențiu","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Frențiu"}},{"word":"frențuș","pos":"noun","definitions":["syphilis"],"forms":{"plural":"frențușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frențuș","accusative-definite-nominative-singular":"frențușul","accusative-indefinite-nominative-plural":"frențușuri","accusative-definite-nominative-plural":"frențușurile","dative-genitive-indefinite-singular":"frențuș","dative-definite-genitive-singular":"frențușului","dative-genitive-indefinite-plural":"frențușuri","dative-definite-genitive-plural":"frențușurilor","singular-vocative":"frențușule","plural-vocative":"frențușurilor"}},{"word":"frențușit","pos":"adj","definitions":["syphilitic"],"forms":{"feminine-singular":"frențușită","masculine-plural":"frențușiți","feminine-neuter-plural":"frențușite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frențușit","error-unrecognized-form-feminine-indefinite-singular":"frențușită","error-unrecognized-form-indefinite-masculine-plural":"frențușiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frențușite","definite-error-unrecognized-form-masculine-neuter-singular":"frențușitul","definite-error-unrecognized-form-feminine-singular":"frențușita","definite-error-unrecognized-form-masculine-plural":"frențușiții","definite-error-unrecognized-form-feminine-neuter-plural":"frențușitele"}},{"word":"frențușit","pos":"verb","definitions":["past participle of frențuși"],"forms":{"participle-past":"of frențuși"}},{"word":"freon","pos":"noun","definitions":["freon"],"forms":{"plural":"freoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"freon","accusative-definite-nominative-singular":"freonul","accusative-indefinite-nominative-plural":"freoni","accusative-definite-nominative-plural":"freonii","dative-genitive-indefinite-singular":"freon","dative-definite-genitive-singular":"freonului","dative-genitive-indefinite-plural":"freoni","dative-definite-genitive-plural":"freonilor","singular-vocative":"freonule","plural-vocative":"freonilor"}},{"word":"freș","pos":"adj","definitions":["fresh, not tired, rested (about people)"],"forms":{"feminine-singular":"freșă","masculine-plural":"freși","feminine-neuter-plural":"freșe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"freș","error-unrecognized-form-feminine-indefinite-singular":"freșă","error-unrecognized-form-indefinite-masculine-plural":"freși","error-unrecognized-form-feminine-indefinite-neuter-plural":"freșe","definite-error-unrecognized-form-masculine-neuter-singular":"freșul","definite-error-unrecognized-form-feminine-singular":"freșa","definite-error-unrecognized-form-masculine-plural":"freșii","definite-error-unrecognized-form-feminine-neuter-plural":"freșele"}},{"word":"fresc","pos":"noun","definitions":["obsolete form of frescă"],"forms":{"plural":"fresce","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fresc","accusative-definite-nominative-singular":"frescul","accusative-indefinite-nominative-plural":"fresce","accusative-definite-nominative-plural":"frescele","dative-genitive-indefinite-singular":"fresc","dative-definite-genitive-singular":"frescului","dative-genitive-indefinite-plural":"fresce","dative-definite-genitive-plural":"frescelor","singular-vocative":"frescule","plural-vocative":"frescelor"}},{"word":"frescă","pos":"noun","definitions":["fresco"],"forms":{"plural":"fresce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frescă","accusative-definite-nominative-singular":"fresca","accusative-indefinite-nominative-plural":"fresce","accusative-definite-nominative-plural":"frescele","dative-genitive-indefinite-singular":"fresce","dative-definite-genitive-singular":"frescei","dative-genitive-indefinite-plural":"fresce","dative-definite-genitive-plural":"frescelor","singular-vocative":"frescă","plural-vocative":"frescelor"}},{"word":"fretă","pos":"noun","definitions":["fret"],"forms":{"plural":"frete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fretă","accusative-definite-nominative-singular":"freta","accusative-indefinite-nominative-plural":"frete","accusative-definite-nominative-plural":"fretele","dative-genitive-indefinite-singular":"frete","dative-definite-genitive-singular":"fretei","dative-genitive-indefinite-plural":"frete","dative-definite-genitive-plural":"fretelor","singular-vocative":"fretă","plural-vocative":"fretelor"}},{"word":"freudian","pos":"adj","definitions":["Freudian"],"forms":{"feminine-singular":"freudiană","masculine-plural":"freudieni","feminine-neuter-plural":"freudiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"freudian","error-unrecognized-form-feminine-indefinite-singular":"freudiană","error-unrecognized-form-indefinite-masculine-plural":"freudieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"freudiene","definite-error-unrecognized-form-masculine-neuter-singular":"freudianul","definite-error-unrecognized-form-feminine-singular":"freudiana","definite-error-unrecognized-form-masculine-plural":"freudienii","definite-error-unrecognized-form-feminine-neuter-plural":"freudienele"}},{"word":"freudism","pos":"noun","definitions":["Freudianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"freudism","accusative-definite-nominative-singular":"freudismul","accusative-indefinite-nominative-plural":"freudisme","accusative-definite-nominative-plural":"freudismele","dative-genitive-indefinite-singular":"freudism","dative-definite-genitive-singular":"freudismului","dative-genitive-indefinite-plural":"freudisme","dative-definite-genitive-plural":"freudismelor","singular-vocative":"freudismule","plural-vocative":"freudismelor"}},{"word":"frez","pos":"adj","definitions":["strawberry (color)"],"forms":{"feminine-singular":"freză","masculine-plural":"frezi","feminine-neuter-plural":"freze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frez","error-unrecognized-form-feminine-indefinite-singular":"freză","error-unrecognized-form-indefinite-masculine-plural":"frezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"freze","definite-error-unrecognized-form-masculine-neuter-singular":"frezul","definite-error-unrecognized-form-feminine-singular":"freza","definite-error-unrecognized-form-masculine-plural":"frezii","definite-error-unrecognized-form-feminine-neuter-plural":"frezele"}},{"word":"freza","pos":"noun","definitions":["definite nominative/accusative singular of freză"],"pronunciation":"[ˈfreza]","gender":"f"},{"word":"freza","pos":"verb","definitions":["to sheer (with a cutting tool)"],"pronunciation":"[freˈza]","forms":{"canonical":"a freza 1st conjugation","present-singular-third-person":"frezează","participle-past":"frezat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a freza","gerund":"frezând","first-person-indicative-present-singular":"frezez","indicative-present-second-person-singular":"frezezi","indicative-present-singular-third-person":"frezează","first-person-indicative-plural-present":"frezăm","indicative-plural-present-second-person":"frezați","indicative-plural-present-third-person":"frezează","first-person-imperfect-indicative-singular":"frezam","imperfect-indicative-second-person-singular":"frezai","imperfect-indicative-singular-third-person":"freza","first-person-imperfect-indicative-plural":"frezam","imperfect-indicative-plural-second-person":"frezați","imperfect-indicative-plural-third-person":"frezau","first-person-indicative-perfect-singular":"frezai","indicative-perfect-second-person-singular":"frezași","indicative-perfect-singular-third-person":"freză","first-person-indicative-perfect-plural":"frezarăm","indicative-perfect-plural-second-person":"frezarăți","indicative-perfect-plural-third-person":"frezară","first-person-indicative-pluperfect-singular":"frezasem","indicative-pluperfect-second-person-singular":"frezaseși","indicative-pluperfect-singular-third-person":"frezase","first-person-indicative-pluperfect-plural":"frezaserăm","indicative-pluperfect-plural-second-person":"frezaserăți","indicative-pluperfect-plural-third-person":"frezaseră","first-person-present-singular-subjunctive":"să frezez","present-second-person-singular-subjunctive":"să frezezi","present-singular-subjunctive-third-person":"să frezeze","first-person-plural-present-subjunctive":"să frezăm","plural-present-second-person-subjunctive":"să frezați","plural-present-subjunctive-third-person":"să frezeze","imperative-second-person-singular":"frezează","imperative-plural-second-person":"frezați","imperative-negative-second-person-singular":"nu freza","imperative-negative-plural-second-person":"nu frezați"}},{"word":"freză","pos":"noun","definitions":["haircut (for men)"],"forms":{"plural":"freze","alternative-dated-rare":"friză"}},{"word":"freză","pos":"noun","definitions":["bur"],"forms":{"plural":"freze","alternative-dated-rare":"friză"}},{"word":"frezare","pos":"noun","definitions":["alternative form of frizare"],"forms":{"plural":"frezări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frezare","accusative-definite-nominative-singular":"frezarea","accusative-indefinite-nominative-plural":"frezari","accusative-definite-nominative-plural":"frezarile","dative-genitive-indefinite-singular":"frezari","dative-definite-genitive-singular":"frezarii","dative-genitive-indefinite-plural":"frezari","dative-definite-genitive-plural":"frezarilor","singular-vocative":"frezare","plural-vocative":"frezarilor"}},{"word":"freze","pos":"noun","definitions":["inflection of freză:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfreze]","gender":"f"},{"word":"frezie","pos":"noun","definitions":["freesia"],"forms":{"plural":"frezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frezie","accusative-definite-nominative-singular":"frezia","accusative-indefinite-nominative-plural":"frezii","accusative-definite-nominative-plural":"freziile","dative-genitive-indefinite-singular":"frezii","dative-definite-genitive-singular":"freziei","dative-genitive-indefinite-plural":"frezii","dative-definite-genitive-plural":"freziilor","singular-vocative":"frezie","plural-vocative":"freziilor"}},{"word":"frezil","pos":"noun","definitions":["coal dust"],"forms":{"plural":"freziluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frezil","accusative-definite-nominative-singular":"frezilul","accusative-indefinite-nominative-plural":"freziluri","accusative-definite-nominative-plural":"frezilurile","dative-genitive-indefinite-singular":"frezil","dative-definite-genitive-singular":"frezilului","dative-genitive-indefinite-plural":"freziluri","dative-definite-genitive-plural":"frezilurilor","singular-vocative":"frezilule","plural-vocative":"frezilurilor"}},{"word":"frezmașină","pos":"noun","definitions":["milling machine"],"forms":{"plural":"frezmașini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frezmașină","accusative-definite-nominative-singular":"frezmașina","accusative-indefinite-nominative-plural":"frezmașini","accusative-definite-nominative-plural":"frezmașinile","dative-genitive-indefinite-singular":"frezmașini","dative-definite-genitive-singular":"frezmașinii","dative-genitive-indefinite-plural":"frezmașini","dative-definite-genitive-plural":"frezmașinilor","singular-vocative":"frezmașină","plural-vocative":"frezmașinilor"}},{"word":"frezoare","pos":"noun","definitions":["female equivalent of frezor"],"forms":{"plural":"frezoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"frezoare","accusative-definite-nominative-singular":"frezoarea","accusative-indefinite-nominative-plural":"frezoare","accusative-definite-nominative-plural":"frezoarele","dative-genitive-indefinite-singular":"frezoare","dative-definite-genitive-singular":"frezoarei","dative-genitive-indefinite-plural":"frezoare","dative-definite-genitive-plural":"frezoarelor","singular-vocative":"frezoare","plural-vocative":"frezoarelor"}},{"word":"frezor","pos":"noun","definitions":["milling machine"],"forms":{"plural":"frezoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frezor","accusative-definite-nominative-singular":"frezorul","accusative-indefinite-nominative-plural":"frezoare","accusative-definite-nominative-plural":"frezoarele","dative-genitive-indefinite-singular":"frezor","dative-definite-genitive-singular":"frezorului","dative-genitive-indefinite-plural":"frezoare","dative-definite-genitive-plural":"frezoarelor","singular-vocative":"frezorule","plural-vocative":"frezoarelor"}},{"word":"FRF","pos":"name","definitions":["initialism of Federația Română de Fotbal (“Romanian Football Federation”)"]},{"word":"friabil","pos":"adj","definitions":["friable"],"forms":{"feminine-singular":"friabilă","masculine-plural":"friabili","feminine-neuter-plural":"friabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"friabil","error-unrecognized-form-feminine-indefinite-singular":"friabilă","error-unrecognized-form-indefinite-masculine-plural":"friabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"friabile","definite-error-unrecognized-form-masculine-neuter-singular":"friabilul","definite-error-unrecognized-form-feminine-singular":"friabila","definite-error-unrecognized-form-masculine-plural":"friabilii","definite-error-unrecognized-form-feminine-neuter-plural":"friabilele"}},{"word":"friabilitate","pos":"noun","definitions":["friability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"friabilitate","accusative-definite-nominative-singular":"friabilitatea","accusative-indefinite-nominative-plural":"friabilități","accusative-definite-nominative-plural":"friabilitățile","dative-genitive-indefinite-singular":"friabilități","dative-definite-genitive-singular":"friabilității","dative-genitive-indefinite-plural":"friabilități","dative-definite-genitive-plural":"friabilităților","singular-vocative":"friabilitate","plural-vocative":"friabilităților"}},{"word":"frica","pos":"noun","definitions":["definite nominative/accusative singular of frică"],"pronunciation":"[ˈfrika]"},{"word":"frică","pos":"noun","definitions":["fear"],"pronunciation":"/ˈfrikə/","forms":{"plural":"frici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frică","accusative-definite-nominative-singular":"frica","accusative-indefinite-nominative-plural":"frici","accusative-definite-nominative-plural":"fricile","dative-genitive-indefinite-singular":"frici","dative-definite-genitive-singular":"fricii","dative-genitive-indefinite-plural":"frici","dative-definite-genitive-plural":"fricilor","singular-vocative":"frică","plural-vocative":"fricilor"}},{"word":"fricativ","pos":"adj","definitions":["fricative"],"forms":{"feminine-singular":"fricativă","masculine-plural":"fricativi","feminine-neuter-plural":"fricative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fricativ","error-unrecognized-form-feminine-indefinite-singular":"fricativă","error-unrecognized-form-indefinite-masculine-plural":"fricativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fricative","definite-error-unrecognized-form-masculine-neuter-singular":"fricativul","definite-error-unrecognized-form-feminine-singular":"fricativa","definite-error-unrecognized-form-masculine-plural":"fricativii","definite-error-unrecognized-form-feminine-neuter-plural":"fricativele"}},{"word":"fricativă","pos":"noun","definitions":["fricative"],"forms":{"plural":"fricative","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fricativă","accusative-definite-nominative-singular":"fricativa","accusative-indefinite-nominative-plural":"fricative","accusative-definite-nominative-plural":"fricativele","dative-genitive-indefinite-singular":"fricative","dative-definite-genitive-singular":"fricativei","dative-genitive-indefinite-plural":"fricative","dative-definite-genitive-plural":"fricativelor","singular-vocative":"fricativă","plural-vocative":"fricativelor"}},{"word":"frichini","pos":"verb","definitions":["to fuss"],"forms":{"canonical":"a frichini 4th conjugation","present-singular-third-person":"frichinește","participle-past":"frichinit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a frichini","gerund":"frichinind","first-person-indicative-present-singular":"frichinesc","indicative-present-second-person-singular":"frichinești","indicative-present-singular-third-person":"frichinește","first-person-indicative-plural-present":"frichinim","indicative-plural-present-second-person":"frichiniți","indicative-plural-present-third-person":"frichinesc","first-person-imperfect-indicative-singular":"frichineam","imperfect-indicative-second-person-singular":"frichineai","imperfect-indicative-singular-third-person":"frichinea","first-person-imperfect-indicative-plural":"frichineam","imperfect-indicative-plural-second-person":"frichineați","imperfect-indicative-plural-third-person":"frichineau","first-person-indicative-perfect-singular":"frichinii","indicative-perfect-second-person-singular":"frichiniși","indicative-perfect-singular-third-person":"frichini","first-person-indicative-perfect-plural":"frichinirăm","indicative-perfect-plural-second-person":"frichinirăți","indicative-perfect-plural-third-person":"frichiniră","first-person-indicative-pluperfect-singular":"frichinisem","indicative-pluperfect-second-person-singular":"frichiniseși","indicative-pluperfect-singular-third-person":"frichinise","first-person-indicative-pluperfect-plural":"frichiniserăm","indicative-pluperfect-plural-second-person":"frichiniserăți","indicative-pluperfect-plural-third-person":"frichiniseră","first-person-present-singular-subjunctive":"să frichinesc","present-second-person-singular-subjunctive":"să frichinești","present-singular-subjunctive-third-person":"să frichinească","first-person-plural-present-subjunctive":"să frichinim","plural-present-second-person-subjunctive":"să frichiniți","plural-present-subjunctive-third-person":"să frichinească","imperative-second-person-singular":"frichinește","imperative-plural-second-person":"frichiniți","imperative-negative-second-person-singular":"nu frichini","imperative-negative-plural-second-person":"nu frichiniți"}},{"word":"frichinire","pos":"noun","definitions":["fussing"],"forms":{"plural":"frichiniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frichinire","accusative-definite-nominative-singular":"frichinirea","accusative-indefinite-nominative-plural":"frichiniri","accusative-definite-nominative-plural":"frichinirile","dative-genitive-indefinite-singular":"frichiniri","dative-definite-genitive-singular":"frichinirii","dative-genitive-indefinite-plural":"frichiniri","dative-definite-genitive-plural":"frichinirilor","singular-vocative":"frichinire","plural-vocative":"frichinirilor"}},{"word":"frichinit","pos":"adj","definitions":["rubbed"],"forms":{"feminine-singular":"frichinită","masculine-plural":"frichiniți","feminine-neuter-plural":"frichinite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frichinit","error-unrecognized-form-feminine-indefinite-singular":"frichinită","error-unrecognized-form-indefinite-masculine-plural":"frichiniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frichinite","definite-error-unrecognized-form-masculine-neuter-singular":"frichinitul","definite-error-unrecognized-form-feminine-singular":"frichinita","definite-error-unrecognized-form-masculine-plural":"frichiniții","definite-error-unrecognized-form-feminine-neuter-plural":"frichinitele"}},{"word":"frichinit","pos":"verb","definitions":["past participle of frichini"],"forms":{"participle-past":"of frichini"}},{"word":"frici","pos":"noun","definitions":["inflection of frică:","plural","genitive/dative singular"]},{"word":"fricii","pos":"noun","definitions":["definite dative/genitive singular of frică"]},{"word":"fricile","pos":"noun","definitions":["definite nominative/accusative plural of frică"]},{"word":"fricilor","pos":"noun","definitions":["inflection of frică:","definite genitive/dative plural","vocative plural"]},{"word":"frico","pos":"noun","definitions":["vocative singular of frică"],"pronunciation":"[ˈfriko]","gender":"f"},{"word":"fricos","pos":"adj","definitions":["cowardly, fearful, timid"],"pronunciation":"/friˈkos/","forms":{"feminine-singular":"fricoasă","masculine-plural":"fricoși","feminine-neuter-plural":"fricoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fricos","error-unrecognized-form-feminine-indefinite-singular":"fricoasă","error-unrecognized-form-indefinite-masculine-plural":"fricoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fricoase","definite-error-unrecognized-form-masculine-neuter-singular":"fricosul","definite-error-unrecognized-form-feminine-singular":"fricoasa","definite-error-unrecognized-form-masculine-plural":"fricoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fricoasele"}},{"word":"fricoșa","pos":"verb","definitions":["to scare"],"forms":{"canonical":"a fricoșa 1st conjugation","present-singular-third-person":"fricoșează","participle-past":"fricoșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fricoșa","gerund":"fricoșând","first-person-indicative-present-singular":"fricoșez","indicative-present-second-person-singular":"fricoșezi","indicative-present-singular-third-person":"fricoșează","first-person-indicative-plural-present":"fricoșăm","indicative-plural-present-second-person":"fricoșați","indicative-plural-present-third-person":"fricoșează","first-person-imperfect-indicative-singular":"fricoșam","imperfect-indicative-second-person-singular":"fricoșai","imperfect-indicative-singular-third-person":"fricoșa","first-person-imperfect-indicative-plural":"fricoșam","imperfect-indicative-plural-second-person":"fricoșați","imperfect-indicative-plural-third-person":"fricoșau","first-person-indicative-perfect-singular":"fricoșai","indicative-perfect-second-person-singular":"fricoșași","indicative-perfect-singular-third-person":"fricoșă","first-person-indicative-perfect-plural":"fricoșarăm","indicative-perfect-plural-second-person":"fricoșarăți","indicative-perfect-plural-third-person":"fricoșară","first-person-indicative-pluperfect-singular":"fricoșasem","indicative-pluperfect-second-person-singular":"fricoșaseși","indicative-pluperfect-singular-third-person":"fricoșase","first-person-indicative-pluperfect-plural":"fricoșaserăm","indicative-pluperfect-plural-second-person":"fricoșaserăți","indicative-pluperfect-plural-third-person":"fricoșaseră","first-person-present-singular-subjunctive":"să fricoșez","present-second-person-singular-subjunctive":"să fricoșezi","present-singular-subjunctive-third-person":"să fricoșeze","first-person-plural-present-subjunctive":"să fricoșăm","plural-present-second-person-subjunctive":"să fricoșați","plural-present-subjunctive-third-person":"să fricoșeze","imperative-second-person-singular":"fricoșează","imperative-plural-second-person":"fricoșați","imperative-negative-second-person-singular":"nu fricoșa","imperative-negative-plural-second-person":"nu fricoșați"}},{"word":"fricoșat","pos":"adj","definitions":["scared"],"forms":{"feminine-singular":"fricoșată","masculine-plural":"fricoșați","feminine-neuter-plural":"fricoșate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fricoșat","error-unrecognized-form-feminine-indefinite-singular":"fricoșată","error-unrecognized-form-indefinite-masculine-plural":"fricoșați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fricoșate","definite-error-unrecognized-form-masculine-neuter-singular":"fricoșatul","definite-error-unrecognized-form-feminine-singular":"fricoșata","definite-error-unrecognized-form-masculine-plural":"fricoșații","definite-error-unrecognized-form-feminine-neuter-plural":"fricoșatele"}},{"word":"fricoșat","pos":"verb","definitions":["past participle of fricoșa"],"forms":{"participle-past":"of fricoșa"}},{"word":"Fricosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fricosu"}},{"word":"fricție","pos":"noun","definitions":["alternative form of fricțiune"],"forms":{"plural":"fricții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fricție","accusative-definite-nominative-singular":"fricția","accusative-indefinite-nominative-plural":"fricții","accusative-definite-nominative-plural":"fricțiile","dative-genitive-indefinite-singular":"fricții","dative-definite-genitive-singular":"fricției","dative-genitive-indefinite-plural":"fricții","dative-definite-genitive-plural":"fricțiilor","singular-vocative":"fricție","plural-vocative":"fricțiilor"}},{"word":"fricționa","pos":"verb","definitions":["to rub"],"forms":{"canonical":"a fricționa 1st conjugation","present-singular-third-person":"fricționează","participle-past":"fricționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fricționa","gerund":"fricționând","first-person-indicative-present-singular":"fricționez","indicative-present-second-person-singular":"fricționezi","indicative-present-singular-third-person":"fricționează","first-person-indicative-plural-present":"fricționăm","indicative-plural-present-second-person":"fricționați","indicative-plural-present-third-person":"fricționează","first-person-imperfect-indicative-singular":"fricționam","imperfect-indicative-second-person-singular":"fricționai","imperfect-indicative-singular-third-person":"fricționa","first-person-imperfect-indicative-plural":"fricționam","imperfect-indicative-plural-second-person":"fricționați","imperfect-indicative-plural-third-person":"fricționau","first-person-indicative-perfect-singular":"fricționai","indicative-perfect-second-person-singular":"fricționași","indicative-perfect-singular-third-person":"fricționă","first-person-indicative-perfect-plural":"fricționarăm","indicative-perfect-plural-second-person":"fricționarăți","indicative-perfect-plural-third-person":"fricționară","first-person-indicative-pluperfect-singular":"fricționasem","indicative-pluperfect-second-person-singular":"fricționaseși","indicative-pluperfect-singular-third-person":"fricționase","first-person-indicative-pluperfect-plural":"fricționaserăm","indicative-pluperfect-plural-second-person":"fricționaserăți","indicative-pluperfect-plural-third-person":"fricționaseră","first-person-present-singular-subjunctive":"să fricționez","present-second-person-singular-subjunctive":"să fricționezi","present-singular-subjunctive-third-person":"să fricționeze","first-person-plural-present-subjunctive":"să fricționăm","plural-present-second-person-subjunctive":"să fricționați","plural-present-subjunctive-third-person":"să fricționeze","imperative-second-person-singular":"fricționează","imperative-plural-second-person":"fricționați","imperative-negative-second-person-singular":"nu fricționa","imperative-negative-plural-second-person":"nu fricționați"}},{"word":"fricționare","pos":"noun","definitions":["embrocation"],"forms":{"plural":"fricționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fricționare","accusative-definite-nominative-singular":"fricționarea","accusative-indefinite-nominative-plural":"fricționări","accusative-definite-nominative-plural":"fricționările","dative-genitive-indefinite-singular":"fricționări","dative-definite-genitive-singular":"fricționării","dative-genitive-indefinite-plural":"fricționări","dative-definite-genitive-plural":"fricționărilor","singular-vocative":"fricționare","plural-vocative":"fricționărilor"}},{"word":"fricțiune","pos":"noun","definitions":["friction"],"forms":{"plural":"fricțiuni"}},{"word":"friculiță","pos":"noun","definitions":["diminutive of frică"],"forms":{"plural":"friculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"friculiță","accusative-definite-nominative-singular":"friculița","accusative-indefinite-nominative-plural":"friculițe","accusative-definite-nominative-plural":"friculițele","dative-genitive-indefinite-singular":"friculițe","dative-definite-genitive-singular":"friculiței","dative-genitive-indefinite-plural":"friculițe","dative-definite-genitive-plural":"friculițelor","singular-vocative":"friculiță","plural-vocative":"friculițelor"}},{"word":"frideric","pos":"noun","definitions":["Friedrich d'or, a Prussian gold coin"],"forms":{"plural":"friderici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frideric","accusative-definite-nominative-singular":"fridericul","accusative-indefinite-nominative-plural":"friderici","accusative-definite-nominative-plural":"fridericii","dative-genitive-indefinite-singular":"frideric","dative-definite-genitive-singular":"fridericului","dative-genitive-indefinite-plural":"friderici","dative-definite-genitive-plural":"fridericilor","singular-vocative":"fridericule","plural-vocative":"fridericilor"}},{"word":"frig","pos":"noun","definitions":["cold, frigidity","fever, chill"],"forms":{"plural":"friguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frig","accusative-definite-nominative-singular":"frigul","accusative-indefinite-nominative-plural":"friguri","accusative-definite-nominative-plural":"frigurile","dative-genitive-indefinite-singular":"frig","dative-definite-genitive-singular":"frigului","dative-genitive-indefinite-plural":"friguri","dative-definite-genitive-plural":"frigurilor","singular-vocative":"frigule","plural-vocative":"frigurilor"}},{"word":"frig","pos":"verb","definitions":["inflection of frige:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"friganea","pos":"noun","definitions":["fried bread with milk and eggs"],"forms":{"plural":"friganele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"friganea","accusative-definite-nominative-singular":"friganeaua","accusative-indefinite-nominative-plural":"friganele","accusative-definite-nominative-plural":"friganelele","dative-genitive-indefinite-singular":"friganele","dative-definite-genitive-singular":"friganelei","dative-genitive-indefinite-plural":"friganele","dative-definite-genitive-plural":"friganelelor","singular-vocative":"friganea","plural-vocative":"friganelelor"}},{"word":"frigănea","pos":"noun","definitions":["alternative form of friganea"],"forms":{"plural":"frigănele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"frigănea","accusative-definite-nominative-singular":"frigăneaua","accusative-indefinite-nominative-plural":"frigănele","accusative-definite-nominative-plural":"frigănelele","dative-genitive-indefinite-singular":"frigănele","dative-definite-genitive-singular":"frigănelei","dative-genitive-indefinite-plural":"frigănele","dative-definite-genitive-plural":"frigănelelor","singular-vocative":"frigănea","plural-vocative":"frigănelelor"}},{"word":"frigare","pos":"noun","definitions":["a metal or wooden rod on which meat is stuck when roasted; skewer, spit"],"forms":{"plural":"frigări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frigare","accusative-definite-nominative-singular":"frigarea","accusative-indefinite-nominative-plural":"frigări","accusative-definite-nominative-plural":"frigările","dative-genitive-indefinite-singular":"frigări","dative-definite-genitive-singular":"frigării","dative-genitive-indefinite-plural":"frigări","dative-definite-genitive-plural":"frigărilor","singular-vocative":"frigare","plural-vocative":"frigărilor"}},{"word":"frigăriță","pos":"noun","definitions":["diminutive of frigare"],"forms":{"plural":"frigărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frigăriță","accusative-definite-nominative-singular":"frigărița","accusative-indefinite-nominative-plural":"frigărițe","accusative-definite-nominative-plural":"frigărițele","dative-genitive-indefinite-singular":"frigărițe","dative-definite-genitive-singular":"frigăriței","dative-genitive-indefinite-plural":"frigărițe","dative-definite-genitive-plural":"frigărițelor","singular-vocative":"frigăriță","plural-vocative":"frigărițelor"}},{"word":"frigăruică","pos":"noun","definitions":["meat on skewer"],"forms":{"plural":"frigăruici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frigăruică","accusative-definite-nominative-singular":"frigăruica","accusative-indefinite-nominative-plural":"frigăruici","accusative-definite-nominative-plural":"frigăruicile","dative-genitive-indefinite-singular":"frigăruici","dative-definite-genitive-singular":"frigăruicii","dative-genitive-indefinite-plural":"frigăruici","dative-definite-genitive-plural":"frigăruicilor","singular-vocative":"frigăruică","plural-vocative":"frigăruicilor"}},{"word":"frigăruie","pos":"noun","definitions":["skewer meat"],"forms":{"plural":"frigărui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frigăruie","accusative-definite-nominative-singular":"frigăruia","accusative-indefinite-nominative-plural":"frigăruii","accusative-definite-nominative-plural":"frigăruiile","dative-genitive-indefinite-singular":"frigăruii","dative-definite-genitive-singular":"frigăruiei","dative-genitive-indefinite-plural":"frigăruii","dative-definite-genitive-plural":"frigăruiilor","singular-vocative":"frigăruie","plural-vocative":"frigăruiilor"}},{"word":"frigăruță","pos":"noun","definitions":["diminutive of frigare"],"forms":{"plural":"frigăruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frigăruță","accusative-definite-nominative-singular":"frigăruța","accusative-indefinite-nominative-plural":"frigăruțe","accusative-definite-nominative-plural":"frigăruțele","dative-genitive-indefinite-singular":"frigăruțe","dative-definite-genitive-singular":"frigăruței","dative-genitive-indefinite-plural":"frigăruțe","dative-definite-genitive-plural":"frigăruțelor","singular-vocative":"frigăruță","plural-vocative":"frigăruțelor"}},{"word":"frige","pos":"verb","definitions":["to roast","to fry","to bake","to grill","to be burning hot"],"forms":{"canonical":"a frige 3rd conjugation","present-singular-third-person":"frige","participle-past":"fript","subjunctive-third-person":"frigă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-pt","infinitive":"a frige","gerund":"frigând","first-person-indicative-present-singular":"frig","indicative-present-second-person-singular":"frigi","indicative-present-singular-third-person":"frige","first-person-indicative-plural-present":"frigem","indicative-plural-present-second-person":"frigeți","indicative-plural-present-third-person":"frig","first-person-imperfect-indicative-singular":"frigeam","imperfect-indicative-second-person-singular":"frigeai","imperfect-indicative-singular-third-person":"frigea","first-person-imperfect-indicative-plural":"frigeam","imperfect-indicative-plural-second-person":"frigeați","imperfect-indicative-plural-third-person":"frigeau","first-person-indicative-perfect-singular":"fripsei","indicative-perfect-second-person-singular":"fripseși","indicative-perfect-singular-third-person":"fripse","first-person-indicative-perfect-plural":"fripserăm","indicative-perfect-plural-second-person":"fripserăți","indicative-perfect-plural-third-person":"fripseră","first-person-indicative-pluperfect-singular":"fripsesem","indicative-pluperfect-second-person-singular":"fripseseși","indicative-pluperfect-singular-third-person":"fripsese","first-person-indicative-pluperfect-plural":"fripseserăm","indicative-pluperfect-plural-second-person":"fripseserăți","indicative-pluperfect-plural-third-person":"fripseseră","first-person-present-singular-subjunctive":"să frig","present-second-person-singular-subjunctive":"să frigi","present-singular-subjunctive-third-person":"să frigă","first-person-plural-present-subjunctive":"să frigem","plural-present-second-person-subjunctive":"să frigeți","plural-present-subjunctive-third-person":"să frigă","imperative-second-person-singular":"frige","imperative-plural-second-person":"frigeți","imperative-negative-second-person-singular":"nu frige","imperative-negative-plural-second-person":"nu frigeți"}},{"word":"frigere","pos":"noun","definitions":["roasting"],"forms":{"plural":"frigeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frigere","accusative-definite-nominative-singular":"frigerea","accusative-indefinite-nominative-plural":"frigeri","accusative-definite-nominative-plural":"frigerile","dative-genitive-indefinite-singular":"frigeri","dative-definite-genitive-singular":"frigerii","dative-genitive-indefinite-plural":"frigeri","dative-definite-genitive-plural":"frigerilor","singular-vocative":"frigere","plural-vocative":"frigerilor"}},{"word":"Frigescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frigescu"}},{"word":"frigi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of frige"],"pronunciation":"[frid͡ʒʲ]"},{"word":"frigian","pos":"noun","definitions":["Phrygian"],"forms":{"plural":"frigieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frigian","accusative-definite-nominative-singular":"frigianul","accusative-indefinite-nominative-plural":"frigieni","accusative-definite-nominative-plural":"frigienii","dative-genitive-indefinite-singular":"frigian","dative-definite-genitive-singular":"frigianului","dative-genitive-indefinite-plural":"frigieni","dative-definite-genitive-plural":"frigienilor","singular-vocative":"frigianule","plural-vocative":"frigienilor"}},{"word":"frigiană","pos":"noun","definitions":["female equivalent of frigian"],"forms":{"plural":"frigiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frigiană","accusative-definite-nominative-singular":"frigiana","accusative-indefinite-nominative-plural":"frigiene","accusative-definite-nominative-plural":"frigienele","dative-genitive-indefinite-singular":"frigiene","dative-definite-genitive-singular":"frigienei","dative-genitive-indefinite-plural":"frigiene","dative-definite-genitive-plural":"frigienelor","singular-vocative":"frigiană","plural-vocative":"frigienelor"}},{"word":"frigid","pos":"adj","definitions":["frigid"],"forms":{"feminine-singular":"frigidă","masculine-plural":"frigizi","feminine-neuter-plural":"frigide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frigid","error-unrecognized-form-feminine-indefinite-singular":"frigidă","error-unrecognized-form-indefinite-masculine-plural":"frigizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"frigide","definite-error-unrecognized-form-masculine-neuter-singular":"frigidul","definite-error-unrecognized-form-feminine-singular":"frigida","definite-error-unrecognized-form-masculine-plural":"frigizii","definite-error-unrecognized-form-feminine-neuter-plural":"frigidele"}},{"word":"frigider","pos":"noun","definitions":["refrigerator"],"forms":{"plural":"frigidere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frigider","accusative-definite-nominative-singular":"frigiderul","accusative-indefinite-nominative-plural":"frigidere","accusative-definite-nominative-plural":"frigiderele","dative-genitive-indefinite-singular":"frigider","dative-definite-genitive-singular":"frigiderului","dative-genitive-indefinite-plural":"frigidere","dative-definite-genitive-plural":"frigiderelor","singular-vocative":"frigiderule","plural-vocative":"frigiderelor"}},{"word":"frigiditate","pos":"noun","definitions":["frigidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frigiditate","accusative-definite-nominative-singular":"frigiditatea","accusative-indefinite-nominative-plural":"frigidități","accusative-definite-nominative-plural":"frigiditățile","dative-genitive-indefinite-singular":"frigidități","dative-definite-genitive-singular":"frigidității","dative-genitive-indefinite-plural":"frigidități","dative-definite-genitive-plural":"frigidităților","singular-vocative":"frigiditate","plural-vocative":"frigidităților"}},{"word":"frigorie","pos":"noun","definitions":["frigorie"],"forms":{"plural":"frigorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frigorie","accusative-definite-nominative-singular":"frigoria","accusative-indefinite-nominative-plural":"frigorii","accusative-definite-nominative-plural":"frigoriile","dative-genitive-indefinite-singular":"frigorii","dative-definite-genitive-singular":"frigoriei","dative-genitive-indefinite-plural":"frigorii","dative-definite-genitive-plural":"frigoriilor","singular-vocative":"frigorie","plural-vocative":"frigoriilor"}},{"word":"frigorifer","pos":"adj","definitions":["frigorific"],"forms":{"feminine-singular":"frigoriferă","masculine-plural":"frigoriferi","feminine-neuter-plural":"frigorifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frigorifer","error-unrecognized-form-feminine-indefinite-singular":"frigoriferă","error-unrecognized-form-indefinite-masculine-plural":"frigoriferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"frigorifere","definite-error-unrecognized-form-masculine-neuter-singular":"frigoriferul","definite-error-unrecognized-form-feminine-singular":"frigorifera","definite-error-unrecognized-form-masculine-plural":"frigoriferii","definite-error-unrecognized-form-feminine-neuter-plural":"frigoriferele"}},{"word":"frigorific","pos":"adj","definitions":["refrigerating"],"forms":{"feminine-singular":"frigorifică","masculine-plural":"frigorifici","feminine-neuter-plural":"frigorifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frigorific","error-unrecognized-form-feminine-indefinite-singular":"frigorifică","error-unrecognized-form-indefinite-masculine-plural":"frigorifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"frigorifice","definite-error-unrecognized-form-masculine-neuter-singular":"frigorificul","definite-error-unrecognized-form-feminine-singular":"frigorifica","definite-error-unrecognized-form-masculine-plural":"frigorificii","definite-error-unrecognized-form-feminine-neuter-plural":"frigorificele"}},{"word":"frigorigen","pos":"adj","definitions":["refrigerant"],"forms":{"feminine-singular":"frigorigenă","masculine-plural":"frigorigeni","feminine-neuter-plural":"frigorigene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frigorigen","error-unrecognized-form-feminine-indefinite-singular":"frigorigenă","error-unrecognized-form-indefinite-masculine-plural":"frigorigeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"frigorigene","definite-error-unrecognized-form-masculine-neuter-singular":"frigorigenul","definite-error-unrecognized-form-feminine-singular":"frigorigena","definite-error-unrecognized-form-masculine-plural":"frigorigenii","definite-error-unrecognized-form-feminine-neuter-plural":"frigorigenele"}},{"word":"frigotehnică","pos":"noun","definitions":["refrigeration"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"frigotehnică","accusative-definite-nominative":"frigotehnica","dative-genitive-indefinite":"frigotehnice","dative-definite-genitive":"frigotehnicei","vocative":"frigotehnică"}},{"word":"frigotehnist","pos":"noun","definitions":["refrigeration technician"],"forms":{"plural":"frigotehniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frigotehnist","accusative-definite-nominative-singular":"frigotehnistul","accusative-indefinite-nominative-plural":"frigotehniști","accusative-definite-nominative-plural":"frigotehniștii","dative-genitive-indefinite-singular":"frigotehnist","dative-definite-genitive-singular":"frigotehnistului","dative-genitive-indefinite-plural":"frigotehniști","dative-definite-genitive-plural":"frigotehniștilor","singular-vocative":"frigotehnistule","plural-vocative":"frigotehniștilor"}},{"word":"frigoterapie","pos":"noun","definitions":["cryotherapy"],"forms":{"plural":"frigoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frigoterapie","accusative-definite-nominative-singular":"frigoterapia","accusative-indefinite-nominative-plural":"frigoterapii","accusative-definite-nominative-plural":"frigoterapiile","dative-genitive-indefinite-singular":"frigoterapii","dative-definite-genitive-singular":"frigoterapiei","dative-genitive-indefinite-plural":"frigoterapii","dative-definite-genitive-plural":"frigoterapiilor","singular-vocative":"frigoterapie","plural-vocative":"frigoterapiilor"}},{"word":"friguleț","pos":"noun","definitions":["diminutive of frig; weather that is slightly cold"],"forms":{"plural":"frigulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"friguleț","accusative-definite-nominative-singular":"frigulețul","accusative-indefinite-nominative-plural":"frigulețe","accusative-definite-nominative-plural":"frigulețele","dative-genitive-indefinite-singular":"friguleț","dative-definite-genitive-singular":"frigulețului","dative-genitive-indefinite-plural":"frigulețe","dative-definite-genitive-plural":"frigulețelor","singular-vocative":"frigulețule","plural-vocative":"frigulețelor"}},{"word":"frigură","pos":"noun","definitions":["alternative form of frig"],"forms":{"plural":"friguri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frigură","accusative-definite-nominative-singular":"frigura","accusative-indefinite-nominative-plural":"friguri","accusative-definite-nominative-plural":"frigurile","dative-genitive-indefinite-singular":"friguri","dative-definite-genitive-singular":"frigurii","dative-genitive-indefinite-plural":"friguri","dative-definite-genitive-plural":"frigurilor","singular-vocative":"frigură","plural-vocative":"frigurilor"}},{"word":"friguri","pos":"noun","definitions":["plural of frig","inflection of frig:","indefinite nominative/accusative plural","indefinite genitive/dative plural"]},{"word":"friguri de baltă","pos":"noun","definitions":["malaria"]},{"word":"friguri galbene","pos":"noun","definitions":["yellow fever"]},{"word":"friguroasă","pos":"adj","definitions":["nominative/accusative feminine singular of friguros"],"pronunciation":"/friɡuˈro̯asə/"},{"word":"friguros","pos":"adj","definitions":["cool, chilly","not easily warmed or heated; not protecting against cold","susceptible to cold, not resistant to cold, chilly"],"pronunciation":"/fri.ɡuˈros/","forms":{"feminine-singular":"friguroasă","masculine-plural":"friguroși","feminine-neuter-plural":"friguroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"friguros","error-unrecognized-form-feminine-indefinite-singular":"friguroasă","error-unrecognized-form-indefinite-masculine-plural":"friguroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"friguroase","definite-error-unrecognized-form-masculine-neuter-singular":"frigurosul","definite-error-unrecognized-form-feminine-singular":"friguroasa","definite-error-unrecognized-form-masculine-plural":"friguroșii","definite-error-unrecognized-form-feminine-neuter-plural":"friguroasele"}},{"word":"frigușor","pos":"noun","definitions":["diminutive of frig"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"frigușor","accusative-definite-nominative":"frigușorul","dative-genitive-indefinite":"frigușor","dative-definite-genitive":"frigușorului","vocative":"frigușorule"}},{"word":"friguț","pos":"noun","definitions":["diminutive of frig; weather that is slightly cold"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"friguț","accusative-definite-nominative":"friguțul","dative-genitive-indefinite":"friguț","dative-definite-genitive":"friguțului","vocative":"friguțule"}},{"word":"frimitură","pos":"noun","definitions":["obsolete form of fărâmătură"],"forms":{"plural":"frimituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frimitură","accusative-definite-nominative-singular":"frimitura","accusative-indefinite-nominative-plural":"frimituri","accusative-definite-nominative-plural":"frimiturile","dative-genitive-indefinite-singular":"frimituri","dative-definite-genitive-singular":"frimiturii","dative-genitive-indefinite-plural":"frimituri","dative-definite-genitive-plural":"frimiturilor","singular-vocative":"frimitură","plural-vocative":"frimiturilor"}},{"word":"Frînc","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Frînc"}},{"word":"Frîncu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Frîncu"}},{"word":"Frînculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frînculescu"}},{"word":"Frînghie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frînghie"}},{"word":"fringilid","pos":"noun","definitions":["finch"],"forms":{"plural":"fringilide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fringilid","accusative-definite-nominative-singular":"fringilidul","accusative-indefinite-nominative-plural":"fringilide","accusative-definite-nominative-plural":"fringilidele","dative-genitive-indefinite-singular":"fringilid","dative-definite-genitive-singular":"fringilidului","dative-genitive-indefinite-plural":"fringilide","dative-definite-genitive-plural":"fringilidelor","singular-vocative":"fringilidule","plural-vocative":"fringilidelor"}},{"word":"Frîntu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frîntu"}},{"word":"fripon","pos":"noun","definitions":["rascal, rogue"],"forms":{"plural":"friponi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fripon","accusative-definite-nominative-singular":"friponul","accusative-indefinite-nominative-plural":"friponi","accusative-definite-nominative-plural":"friponii","dative-genitive-indefinite-singular":"fripon","dative-definite-genitive-singular":"friponului","dative-genitive-indefinite-plural":"friponi","dative-definite-genitive-plural":"friponilor","singular-vocative":"friponule","plural-vocative":"friponilor"}},{"word":"fript","pos":"verb","definitions":["past participle of frige"],"pronunciation":"/fript/"},{"word":"fript","pos":"adj","definitions":["roasted; fried"],"pronunciation":"/fript/","forms":{"feminine-singular":"friptă","masculine-plural":"fripți","feminine-neuter-plural":"fripte","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"fript","error-unrecognized-form-feminine-indefinite-singular":"friptă","error-unrecognized-form-indefinite-masculine-plural":"fripți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fripte","definite-error-unrecognized-form-masculine-neuter-singular":"friptul","definite-error-unrecognized-form-feminine-singular":"fripta","definite-error-unrecognized-form-masculine-plural":"fripții","definite-error-unrecognized-form-feminine-neuter-plural":"friptele"}},{"word":"friptană","pos":"noun","definitions":["steak"],"forms":{"plural":"friptane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"friptană","accusative-definite-nominative-singular":"friptana","accusative-indefinite-nominative-plural":"friptane","accusative-definite-nominative-plural":"friptanele","dative-genitive-indefinite-singular":"friptane","dative-definite-genitive-singular":"friptanei","dative-genitive-indefinite-plural":"friptane","dative-definite-genitive-plural":"friptanelor","singular-vocative":"friptană","plural-vocative":"friptanelor"}},{"word":"Friptu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Friptu"}},{"word":"friptură","pos":"noun","definitions":["roast (a cut of meat suited to roasting)","steak"],"pronunciation":"/fripˈtu.rə/","forms":{"plural":"fripturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"friptură","accusative-definite-nominative-singular":"friptura","accusative-indefinite-nominative-plural":"fripturi","accusative-definite-nominative-plural":"fripturile","dative-genitive-indefinite-singular":"fripturi","dative-definite-genitive-singular":"fripturii","dative-genitive-indefinite-plural":"fripturi","dative-definite-genitive-plural":"fripturilor","singular-vocative":"friptură","plural-vocative":"fripturilor"}},{"word":"fripturică","pos":"noun","definitions":["diminutive of friptură; small steak"],"forms":{"plural":"fripturici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fripturică","accusative-definite-nominative-singular":"fripturica","accusative-indefinite-nominative-plural":"fripturice","accusative-definite-nominative-plural":"fripturicele","dative-genitive-indefinite-singular":"fripturice","dative-definite-genitive-singular":"fripturicei","dative-genitive-indefinite-plural":"fripturice","dative-definite-genitive-plural":"fripturicelor","singular-vocative":"fripturică","plural-vocative":"fripturicelor"}},{"word":"fripturism","pos":"noun","definitions":["profiteering"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fripturism","accusative-definite-nominative":"fripturismul","dative-genitive-indefinite":"fripturism","dative-definite-genitive":"fripturismului","vocative":"fripturismule"}},{"word":"fripturist","pos":"noun","definitions":["political opportunist"],"pronunciation":"/frip.tuˈrist/","forms":{"plural":"fripturiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fripturist","accusative-definite-nominative-singular":"fripturistul","accusative-indefinite-nominative-plural":"fripturiști","accusative-definite-nominative-plural":"fripturiștii","dative-genitive-indefinite-singular":"fripturist","dative-definite-genitive-singular":"fripturistului","dative-genitive-indefinite-plural":"fripturiști","dative-definite-genitive-plural":"fripturiștilor","singular-vocative":"fripturistule","plural-vocative":"fripturiștilor"}},{"word":"Friș","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Lunca."],"gender":"m"},{"word":"frișcă","pos":"noun","definitions":["whipped cream"],"forms":{"plural":"friști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frișcă","accusative-definite-nominative-singular":"frișca","accusative-indefinite-nominative-plural":"friști","accusative-definite-nominative-plural":"friștile","dative-genitive-indefinite-singular":"friști","dative-definite-genitive-singular":"friștii","dative-genitive-indefinite-plural":"friști","dative-definite-genitive-plural":"friștilor","singular-vocative":"frișcă","plural-vocative":"friștilor"}},{"word":"frison","pos":"noun","definitions":["shiver, thrill"],"forms":{"plural":"frisoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frison","accusative-definite-nominative-singular":"frisonul","accusative-indefinite-nominative-plural":"frisoane","accusative-definite-nominative-plural":"frisoanele","dative-genitive-indefinite-singular":"frison","dative-definite-genitive-singular":"frisonului","dative-genitive-indefinite-plural":"frisoane","dative-definite-genitive-plural":"frisoanelor","singular-vocative":"frisonule","plural-vocative":"frisoanelor"}},{"word":"friști","pos":"noun","definitions":["plural of frișcă"]},{"word":"fritaj","pos":"noun","definitions":["sintering"],"forms":{"plural":"fritaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fritaj","accusative-definite-nominative-singular":"fritajul","accusative-indefinite-nominative-plural":"fritaje","accusative-definite-nominative-plural":"fritajele","dative-genitive-indefinite-singular":"fritaj","dative-definite-genitive-singular":"fritajului","dative-genitive-indefinite-plural":"fritaje","dative-definite-genitive-plural":"fritajelor","singular-vocative":"fritajule","plural-vocative":"fritajelor"}},{"word":"friteuză","pos":"noun","definitions":["fryer; deep-fat fryer"],"pronunciation":"/friˈtø.zə/","forms":{"plural":"friteuze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"friteuză","accusative-definite-nominative-singular":"friteuza","accusative-indefinite-nominative-plural":"friteuze","accusative-definite-nominative-plural":"friteuzele","dative-genitive-indefinite-singular":"friteuze","dative-definite-genitive-singular":"friteuzei","dative-genitive-indefinite-plural":"friteuze","dative-definite-genitive-plural":"friteuzelor","singular-vocative":"friteuză","plural-vocative":"friteuzelor"}},{"word":"friulană","pos":"noun","definitions":["Friulian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"friulană","accusative-definite-nominative":"friulana","dative-genitive-indefinite":"friulane","dative-definite-genitive":"friulanei","vocative":"friulană"}},{"word":"Friuli-Veneția Giulia","pos":"name","definitions":["Friuli-Venezia Giulia"],"gender":"f"},{"word":"frivol","pos":"adj","definitions":["frivolous"],"forms":{"feminine-singular":"frivolă","masculine-plural":"frivoli","feminine-neuter-plural":"frivole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frivol","error-unrecognized-form-feminine-indefinite-singular":"frivolă","error-unrecognized-form-indefinite-masculine-plural":"frivoli","error-unrecognized-form-feminine-indefinite-neuter-plural":"frivole","definite-error-unrecognized-form-masculine-neuter-singular":"frivolul","definite-error-unrecognized-form-feminine-singular":"frivola","definite-error-unrecognized-form-masculine-plural":"frivolii","definite-error-unrecognized-form-feminine-neuter-plural":"frivolele"}},{"word":"frivolitate","pos":"noun","definitions":["frivolity"],"forms":{"plural":"frivolități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frivolitate","accusative-definite-nominative-singular":"frivolitatea","accusative-indefinite-nominative-plural":"frivolități","accusative-definite-nominative-plural":"frivolitățile","dative-genitive-indefinite-singular":"frivolități","dative-definite-genitive-singular":"frivolității","dative-genitive-indefinite-plural":"frivolități","dative-definite-genitive-plural":"frivolităților","singular-vocative":"frivolitate","plural-vocative":"frivolităților"}},{"word":"friz","pos":"noun","definitions":["alternative form of friză"],"forms":{"plural":"frizuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"friz","accusative-definite-nominative-singular":"frizul","accusative-indefinite-nominative-plural":"frizuri","accusative-definite-nominative-plural":"frizurile","dative-genitive-indefinite-singular":"friz","dative-definite-genitive-singular":"frizului","dative-genitive-indefinite-plural":"frizuri","dative-definite-genitive-plural":"frizurilor","singular-vocative":"frizule","plural-vocative":"frizurilor"}},{"word":"friza","pos":"verb","definitions":["to curl"],"forms":{"canonical":"a friza 1st conjugation","present-singular-third-person":"frizează","participle-past":"frizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a friza","gerund":"frizând","first-person-indicative-present-singular":"frizez","indicative-present-second-person-singular":"frizezi","indicative-present-singular-third-person":"frizează","first-person-indicative-plural-present":"frizăm","indicative-plural-present-second-person":"frizați","indicative-plural-present-third-person":"frizează","first-person-imperfect-indicative-singular":"frizam","imperfect-indicative-second-person-singular":"frizai","imperfect-indicative-singular-third-person":"friza","first-person-imperfect-indicative-plural":"frizam","imperfect-indicative-plural-second-person":"frizați","imperfect-indicative-plural-third-person":"frizau","first-person-indicative-perfect-singular":"frizai","indicative-perfect-second-person-singular":"frizași","indicative-perfect-singular-third-person":"friză","first-person-indicative-perfect-plural":"frizarăm","indicative-perfect-plural-second-person":"frizarăți","indicative-perfect-plural-third-person":"frizară","first-person-indicative-pluperfect-singular":"frizasem","indicative-pluperfect-second-person-singular":"frizaseși","indicative-pluperfect-singular-third-person":"frizase","first-person-indicative-pluperfect-plural":"frizaserăm","indicative-pluperfect-plural-second-person":"frizaserăți","indicative-pluperfect-plural-third-person":"frizaseră","first-person-present-singular-subjunctive":"să frizez","present-second-person-singular-subjunctive":"să frizezi","present-singular-subjunctive-third-person":"să frizeze","first-person-plural-present-subjunctive":"să frizăm","plural-present-second-person-subjunctive":"să frizați","plural-present-subjunctive-third-person":"să frizeze","imperative-second-person-singular":"frizează","imperative-plural-second-person":"frizați","imperative-negative-second-person-singular":"nu friza","imperative-negative-plural-second-person":"nu frizați"}},{"word":"friză","pos":"noun","definitions":["frieze"],"forms":{"plural":"frize","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"friză","accusative-definite-nominative-singular":"frizăul","accusative-indefinite-nominative-plural":"frize","accusative-definite-nominative-plural":"frizele","dative-genitive-indefinite-singular":"friză","dative-definite-genitive-singular":"frizăului","dative-genitive-indefinite-plural":"frize","dative-definite-genitive-plural":"frizelor","singular-vocative":"frizăule","plural-vocative":"frizelor"}},{"word":"frizer","pos":"noun","definitions":["barber, hairdresser, hairstylist"],"forms":{"plural":"frizeri","feminine":"equivalent frizeriță","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frizer","accusative-definite-nominative-singular":"frizerul","accusative-indefinite-nominative-plural":"frizeri","accusative-definite-nominative-plural":"frizerii","dative-genitive-indefinite-singular":"frizer","dative-definite-genitive-singular":"frizerului","dative-genitive-indefinite-plural":"frizeri","dative-definite-genitive-plural":"frizerilor","singular-vocative":"frizerule","plural-vocative":"frizerilor"}},{"word":"frizeri","pos":"noun","definitions":["plural of frizer"],"gender":"m"},{"word":"frizerie","pos":"noun","definitions":["barber's"],"forms":{"plural":"frizerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frizerie","accusative-definite-nominative-singular":"frizeria","accusative-indefinite-nominative-plural":"frizerii","accusative-definite-nominative-plural":"frizeriile","dative-genitive-indefinite-singular":"frizerii","dative-definite-genitive-singular":"frizeriei","dative-genitive-indefinite-plural":"frizerii","dative-definite-genitive-plural":"frizeriilor","singular-vocative":"frizerie","plural-vocative":"frizeriilor"}},{"word":"frizeriță","pos":"noun","definitions":["female equivalent of frizer: (female) hairdresser"],"pronunciation":"/fri.zeˈri.t͡sə/","forms":{"plural":"frizerițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"frizeriță","accusative-definite-nominative-singular":"frizerița","accusative-indefinite-nominative-plural":"frizerițe","accusative-definite-nominative-plural":"frizerițele","dative-genitive-indefinite-singular":"frizerițe","dative-definite-genitive-singular":"frizeriței","dative-genitive-indefinite-plural":"frizerițe","dative-definite-genitive-plural":"frizerițelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"frizerițe","pos":"noun","definitions":["plural of frizeriță"],"gender":"f"},{"word":"frizon","pos":"noun","definitions":["silk fibre from the outer part of the cocoon"],"forms":{"plural":"frizoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frizon","accusative-definite-nominative-singular":"frizonul","accusative-indefinite-nominative-plural":"frizoane","accusative-definite-nominative-plural":"frizoanele","dative-genitive-indefinite-singular":"frizon","dative-definite-genitive-singular":"frizonului","dative-genitive-indefinite-plural":"frizoane","dative-definite-genitive-plural":"frizoanelor","singular-vocative":"frizonule","plural-vocative":"frizoanelor"}},{"word":"frizura","pos":"noun","definitions":["definite nominative/accusative singular of frizură"],"pronunciation":"[friˈzura]","gender":"f"},{"word":"frizură","pos":"noun","definitions":["hairstyle","haircut"],"forms":{"plural":"frizuri"}},{"word":"frondă","pos":"noun","definitions":["rebelliousness"],"forms":{"plural":"fronde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frondă","accusative-definite-nominative-singular":"fronda","accusative-indefinite-nominative-plural":"fronde","accusative-definite-nominative-plural":"frondele","dative-genitive-indefinite-singular":"fronde","dative-definite-genitive-singular":"frondei","dative-genitive-indefinite-plural":"fronde","dative-definite-genitive-plural":"frondelor","singular-vocative":"frondă","plural-vocative":"frondelor"}},{"word":"frondeur","pos":"noun","definitions":["obsolete form of frondor"],"forms":{"plural":"frondeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frondeur","accusative-definite-nominative-singular":"frondeurul","accusative-indefinite-nominative-plural":"frondeuri","accusative-definite-nominative-plural":"frondeurii","dative-genitive-indefinite-singular":"frondeur","dative-definite-genitive-singular":"frondeurului","dative-genitive-indefinite-plural":"frondeuri","dative-definite-genitive-plural":"frondeurilor","singular-vocative":"frondeurule","plural-vocative":"frondeurilor"}},{"word":"frondor","pos":"noun","definitions":["alternative form of frondeur"],"forms":{"plural":"frondori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frondor","accusative-definite-nominative-singular":"frondorul","accusative-indefinite-nominative-plural":"frondori","accusative-definite-nominative-plural":"frondorii","dative-genitive-indefinite-singular":"frondor","dative-definite-genitive-singular":"frondorului","dative-genitive-indefinite-plural":"frondori","dative-definite-genitive-plural":"frondorilor","singular-vocative":"frondorule","plural-vocative":"frondorilor"}},{"word":"Fronescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fronescu"}},{"word":"Fronoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fronoiu"}},{"word":"front","pos":"noun","definitions":["front, front line"],"forms":{"plural":"fronturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"front","accusative-definite-nominative-singular":"frontul","accusative-indefinite-nominative-plural":"fronturi","accusative-definite-nominative-plural":"fronturile","dative-genitive-indefinite-singular":"front","dative-definite-genitive-singular":"frontului","dative-genitive-indefinite-plural":"fronturi","dative-definite-genitive-plural":"fronturilor","singular-vocative":"frontule","plural-vocative":"fronturilor"}},{"word":"front arctic","pos":"noun","definitions":["arctic front"],"forms":{"plural":"fronturi arctice"}},{"word":"front de lucru","pos":"noun","definitions":["work front"],"forms":{"plural":"fronturi de lucru"}},{"word":"front de undă","pos":"noun","definitions":["wavefront"],"forms":{"plural":"fronturi de undă"}},{"word":"front staționar","pos":"noun","definitions":["stationary front"],"forms":{"plural":"fronturi staționare"}},{"word":"frontal","pos":"adj","definitions":["frontal"],"forms":{"feminine-singular":"frontală","masculine-plural":"frontali","feminine-neuter-plural":"frontale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frontal","error-unrecognized-form-feminine-indefinite-singular":"frontală","error-unrecognized-form-indefinite-masculine-plural":"frontali","error-unrecognized-form-feminine-indefinite-neuter-plural":"frontale","definite-error-unrecognized-form-masculine-neuter-singular":"frontalul","definite-error-unrecognized-form-feminine-singular":"frontala","definite-error-unrecognized-form-masculine-plural":"frontalii","definite-error-unrecognized-form-feminine-neuter-plural":"frontalele"}},{"word":"frontalier","pos":"adj","definitions":["border"],"forms":{"feminine-singular":"frontalieră","masculine-plural":"frontalieri","feminine-neuter-plural":"frontaliere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frontalier","error-unrecognized-form-feminine-indefinite-singular":"frontalieră","error-unrecognized-form-indefinite-masculine-plural":"frontalieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"frontaliere","definite-error-unrecognized-form-masculine-neuter-singular":"frontalierul","definite-error-unrecognized-form-feminine-singular":"frontaliera","definite-error-unrecognized-form-masculine-plural":"frontalierii","definite-error-unrecognized-form-feminine-neuter-plural":"frontalierele"}},{"word":"frontalitate","pos":"noun","definitions":["frontality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frontalitate","accusative-definite-nominative-singular":"frontalitatea","accusative-indefinite-nominative-plural":"frontalități","accusative-definite-nominative-plural":"frontalitățile","dative-genitive-indefinite-singular":"frontalități","dative-definite-genitive-singular":"frontalității","dative-genitive-indefinite-plural":"frontalități","dative-definite-genitive-plural":"frontalităților","singular-vocative":"frontalitate","plural-vocative":"frontalităților"}},{"word":"frontiera","pos":"noun","definitions":["definite nominative/accusative singular of frontieră"],"pronunciation":"[frontiˈera]","gender":"f"},{"word":"frontieră","pos":"noun","definitions":["frontier"],"pronunciation":"[fron.tiˈe.rə]","forms":{"plural":"frontiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frontieră","accusative-definite-nominative-singular":"frontiera","accusative-indefinite-nominative-plural":"frontiere","accusative-definite-nominative-plural":"frontierele","dative-genitive-indefinite-singular":"frontiere","dative-definite-genitive-singular":"frontierei","dative-genitive-indefinite-plural":"frontiere","dative-definite-genitive-plural":"frontierelor","singular-vocative":"frontieră","plural-vocative":"frontierelor"}},{"word":"frontiere","pos":"noun","definitions":["inflection of frontieră:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[frontiˈere]","gender":"f"},{"word":"frontiero","pos":"noun","definitions":["vocative singular of frontieră"],"pronunciation":"[frontiˈero]","gender":"f"},{"word":"frontispiciu","pos":"noun","definitions":["frontispiece"],"forms":{"plural":"frontispicii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frontispiciu","accusative-definite-nominative-singular":"frontispiciul","accusative-indefinite-nominative-plural":"frontispicii","accusative-definite-nominative-plural":"frontispiciile","dative-genitive-indefinite-singular":"frontispiciu","dative-definite-genitive-singular":"frontispiciului","dative-genitive-indefinite-plural":"frontispicii","dative-definite-genitive-plural":"frontispiciilor","singular-vocative":"frontispiciule","plural-vocative":"frontispiciilor"}},{"word":"frontogeneză","pos":"noun","definitions":["frontogenesis"],"forms":{"plural":"frontogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frontogeneză","accusative-definite-nominative-singular":"frontogeneza","accusative-indefinite-nominative-plural":"frontogeneze","accusative-definite-nominative-plural":"frontogenezele","dative-genitive-indefinite-singular":"frontogeneze","dative-definite-genitive-singular":"frontogenezei","dative-genitive-indefinite-plural":"frontogeneze","dative-definite-genitive-plural":"frontogenezelor","singular-vocative":"frontogeneză","plural-vocative":"frontogenezelor"}},{"word":"frontoliză","pos":"noun","definitions":["frontolysis"],"forms":{"plural":"frontolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frontoliză","accusative-definite-nominative-singular":"frontoliza","accusative-indefinite-nominative-plural":"frontolize","accusative-definite-nominative-plural":"frontolizele","dative-genitive-indefinite-singular":"frontolize","dative-definite-genitive-singular":"frontolizei","dative-genitive-indefinite-plural":"frontolize","dative-definite-genitive-plural":"frontolizelor","singular-vocative":"frontoliză","plural-vocative":"frontolizelor"}},{"word":"fronton","pos":"noun","definitions":["pediment"],"forms":{"plural":"frontoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fronton","accusative-definite-nominative-singular":"frontonul","accusative-indefinite-nominative-plural":"frontoane","accusative-definite-nominative-plural":"frontoanele","dative-genitive-indefinite-singular":"fronton","dative-definite-genitive-singular":"frontonului","dative-genitive-indefinite-plural":"frontoane","dative-definite-genitive-plural":"frontoanelor","singular-vocative":"frontonule","plural-vocative":"frontoanelor"}},{"word":"frotiu","pos":"noun","definitions":["smear"],"forms":{"plural":"frotiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frotiu","accusative-definite-nominative-singular":"frotiul","accusative-indefinite-nominative-plural":"frotiuri","accusative-definite-nominative-plural":"frotiurile","dative-genitive-indefinite-singular":"frotiu","dative-definite-genitive-singular":"frotiului","dative-genitive-indefinite-plural":"frotiuri","dative-definite-genitive-plural":"frotiurilor","singular-vocative":"frotiule","plural-vocative":"frotiurilor"}},{"word":"fruct","pos":"noun","definitions":["fruit (part of plant)"],"forms":{"plural":"fructe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fruct","accusative-definite-nominative-singular":"fructul","accusative-indefinite-nominative-plural":"fructe","accusative-definite-nominative-plural":"fructele","dative-genitive-indefinite-singular":"fruct","dative-definite-genitive-singular":"fructului","dative-genitive-indefinite-plural":"fructe","dative-definite-genitive-plural":"fructelor","singular-vocative":"fructule","plural-vocative":"fructelor"}},{"word":"fruct compus","pos":"noun","definitions":["collective fruit"],"forms":{"plural":"fructe compuse"}},{"word":"fructă","pos":"noun","definitions":["alternative form of fruct"],"forms":{"plural":"fructe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fructă","accusative-definite-nominative-singular":"fructa","accusative-indefinite-nominative-plural":"fructe","accusative-definite-nominative-plural":"fructele","dative-genitive-indefinite-singular":"fructe","dative-definite-genitive-singular":"fructei","dative-genitive-indefinite-plural":"fructe","dative-definite-genitive-plural":"fructelor","singular-vocative":"fructă","plural-vocative":"fructelor"}},{"word":"fructar","pos":"noun","definitions":["greengrocer"],"forms":{"plural":"fructari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fructar","accusative-definite-nominative-singular":"fructarul","accusative-indefinite-nominative-plural":"fructari","accusative-definite-nominative-plural":"fructarii","dative-genitive-indefinite-singular":"fructar","dative-definite-genitive-singular":"fructarului","dative-genitive-indefinite-plural":"fructari","dative-definite-genitive-plural":"fructarilor","singular-vocative":"fructarule","plural-vocative":"fructarilor"}},{"word":"fructărie","pos":"noun","definitions":["fruit shop"],"forms":{"plural":"fructării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fructărie","accusative-definite-nominative-singular":"fructăria","accusative-indefinite-nominative-plural":"fructării","accusative-definite-nominative-plural":"fructăriile","dative-genitive-indefinite-singular":"fructării","dative-definite-genitive-singular":"fructăriei","dative-genitive-indefinite-plural":"fructării","dative-definite-genitive-plural":"fructăriilor","singular-vocative":"fructărie","plural-vocative":"fructăriilor"}},{"word":"fructat","pos":"adj","definitions":["fruity"],"forms":{"feminine-singular":"fructată","masculine-plural":"fructați","feminine-neuter-plural":"fructate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fructat","error-unrecognized-form-feminine-indefinite-singular":"fructată","error-unrecognized-form-indefinite-masculine-plural":"fructați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fructate","definite-error-unrecognized-form-masculine-neuter-singular":"fructatul","definite-error-unrecognized-form-feminine-singular":"fructata","definite-error-unrecognized-form-masculine-plural":"fructații","definite-error-unrecognized-form-feminine-neuter-plural":"fructatele"}},{"word":"fructe","pos":"noun","definitions":["plural of fruct"]},{"word":"fructe de mare","pos":"noun","definitions":["seafood"]},{"word":"fructele","pos":"noun","definitions":["definite nominative/accusative plural of fruct"]},{"word":"fructidor","pos":"noun","definitions":["Fructidor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"fructidor","accusative-definite-nominative":"fructidorul","dative-genitive-indefinite":"fructidor","dative-definite-genitive":"fructidorului","vocative":"fructidorule"}},{"word":"fructieră","pos":"noun","definitions":["fruit bowl"],"forms":{"plural":"fructiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fructieră","accusative-definite-nominative-singular":"fructiera","accusative-indefinite-nominative-plural":"fructiere","accusative-definite-nominative-plural":"fructierele","dative-genitive-indefinite-singular":"fructiere","dative-definite-genitive-singular":"fructierei","dative-genitive-indefinite-plural":"fructiere","dative-definite-genitive-plural":"fructierelor","singular-vocative":"fructieră","plural-vocative":"fructierelor"}},{"word":"fructifer","pos":"adj","definitions":["fructiferous"],"forms":{"feminine-singular":"fructiferă","masculine-plural":"fructiferi","feminine-neuter-plural":"fructifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fructifer","error-unrecognized-form-feminine-indefinite-singular":"fructiferă","error-unrecognized-form-indefinite-masculine-plural":"fructiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fructifere","definite-error-unrecognized-form-masculine-neuter-singular":"fructiferul","definite-error-unrecognized-form-feminine-singular":"fructifera","definite-error-unrecognized-form-masculine-plural":"fructiferii","definite-error-unrecognized-form-feminine-neuter-plural":"fructiferele"}},{"word":"fructifica","pos":"verb","definitions":["to fructify"],"forms":{"canonical":"a fructifica 1st conjugation","present-singular-third-person":"fructifică","participle-past":"fructificat","subjunctive-third-person":"fructifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fructifica","gerund":"fructificând","first-person-indicative-present-singular":"fructific","indicative-present-second-person-singular":"fructifici","indicative-present-singular-third-person":"fructifică","first-person-indicative-plural-present":"fructificăm","indicative-plural-present-second-person":"fructificați","indicative-plural-present-third-person":"fructifică","first-person-imperfect-indicative-singular":"fructificam","imperfect-indicative-second-person-singular":"fructificai","imperfect-indicative-singular-third-person":"fructifica","first-person-imperfect-indicative-plural":"fructificam","imperfect-indicative-plural-second-person":"fructificați","imperfect-indicative-plural-third-person":"fructificau","first-person-indicative-perfect-singular":"fructificai","indicative-perfect-second-person-singular":"fructificași","indicative-perfect-singular-third-person":"fructifică","first-person-indicative-perfect-plural":"fructificarăm","indicative-perfect-plural-second-person":"fructificarăți","indicative-perfect-plural-third-person":"fructificară","first-person-indicative-pluperfect-singular":"fructificasem","indicative-pluperfect-second-person-singular":"fructificaseși","indicative-pluperfect-singular-third-person":"fructificase","first-person-indicative-pluperfect-plural":"fructificaserăm","indicative-pluperfect-plural-second-person":"fructificaserăți","indicative-pluperfect-plural-third-person":"fructificaseră","first-person-present-singular-subjunctive":"să fructific","present-second-person-singular-subjunctive":"să fructifici","present-singular-subjunctive-third-person":"să fructifice","first-person-plural-present-subjunctive":"să fructificăm","plural-present-second-person-subjunctive":"să fructificați","plural-present-subjunctive-third-person":"să fructifice","imperative-second-person-singular":"fructifică","imperative-plural-second-person":"fructificați","imperative-negative-second-person-singular":"nu fructifica","imperative-negative-plural-second-person":"nu fructificați"}},{"word":"fructificare","pos":"noun","definitions":["fructification"],"forms":{"plural":"fructificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fructificare","accusative-definite-nominative-singular":"fructificarea","accusative-indefinite-nominative-plural":"fructificări","accusative-definite-nominative-plural":"fructificările","dative-genitive-indefinite-singular":"fructificări","dative-definite-genitive-singular":"fructificării","dative-genitive-indefinite-plural":"fructificări","dative-definite-genitive-plural":"fructificărilor","singular-vocative":"fructificare","plural-vocative":"fructificărilor"}},{"word":"fructificat","pos":"adj","definitions":["fructified"],"forms":{"feminine-singular":"fructificată","masculine-plural":"fructificați","feminine-neuter-plural":"fructificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fructificat","error-unrecognized-form-feminine-indefinite-singular":"fructificată","error-unrecognized-form-indefinite-masculine-plural":"fructificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fructificate","definite-error-unrecognized-form-masculine-neuter-singular":"fructificatul","definite-error-unrecognized-form-feminine-singular":"fructificata","definite-error-unrecognized-form-masculine-plural":"fructificații","definite-error-unrecognized-form-feminine-neuter-plural":"fructificatele"}},{"word":"fructificat","pos":"verb","definitions":["past participle of fructifica"],"forms":{"participle-past":"of fructifica"}},{"word":"fructificație","pos":"noun","definitions":["fructification"],"forms":{"plural":"fructificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fructificație","accusative-definite-nominative-singular":"fructificația","accusative-indefinite-nominative-plural":"fructificații","accusative-definite-nominative-plural":"fructificațiile","dative-genitive-indefinite-singular":"fructificații","dative-definite-genitive-singular":"fructificației","dative-genitive-indefinite-plural":"fructificații","dative-definite-genitive-plural":"fructificațiilor","singular-vocative":"fructificație","plural-vocative":"fructificațiilor"}},{"word":"fructoare","pos":"noun","definitions":["vegetable"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fructoare","accusative-definite-nominative":"fructoarea","dative-genitive-indefinite":"fructoări","dative-definite-genitive":"fructoării","vocative":"fructoare"}},{"word":"fructoză","pos":"noun","definitions":["fructose"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fructoză","accusative-definite-nominative-singular":"fructoza","accusative-indefinite-nominative-plural":"fructoze","accusative-definite-nominative-plural":"fructozele","dative-genitive-indefinite-singular":"fructoze","dative-definite-genitive-singular":"fructozei","dative-genitive-indefinite-plural":"fructoze","dative-definite-genitive-plural":"fructozelor","singular-vocative":"fructoză","plural-vocative":"fructozelor"}},{"word":"fructozemie","pos":"noun","definitions":["fructosemia"],"forms":{"plural":"fructozemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fructozemie","accusative-definite-nominative-singular":"fructozemia","accusative-indefinite-nominative-plural":"fructozemii","accusative-definite-nominative-plural":"fructozemiile","dative-genitive-indefinite-singular":"fructozemii","dative-definite-genitive-singular":"fructozemiei","dative-genitive-indefinite-plural":"fructozemii","dative-definite-genitive-plural":"fructozemiilor","singular-vocative":"fructozemie","plural-vocative":"fructozemiilor"}},{"word":"fructozurie","pos":"noun","definitions":["fructosuria"],"forms":{"plural":"fructozurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fructozurie","accusative-definite-nominative-singular":"fructozuria","accusative-indefinite-nominative-plural":"fructozurii","accusative-definite-nominative-plural":"fructozuriile","dative-genitive-indefinite-singular":"fructozurii","dative-definite-genitive-singular":"fructozuriei","dative-genitive-indefinite-plural":"fructozurii","dative-definite-genitive-plural":"fructozuriilor","singular-vocative":"fructozurie","plural-vocative":"fructozuriilor"}},{"word":"fructul pasiunii","pos":"noun","definitions":["passion fruit (Passiflora edulis)"]},{"word":"fructuos","pos":"adj","definitions":["fruitful"],"forms":{"feminine-singular":"fructuoasă","masculine-plural":"fructuoși","feminine-neuter-plural":"fructuoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fructuos","error-unrecognized-form-feminine-indefinite-singular":"fructuoasă","error-unrecognized-form-indefinite-masculine-plural":"fructuoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fructuoase","definite-error-unrecognized-form-masculine-neuter-singular":"fructuosul","definite-error-unrecognized-form-feminine-singular":"fructuoasa","definite-error-unrecognized-form-masculine-plural":"fructuoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fructuoasele"}},{"word":"frugal","pos":"adj","definitions":["frugal"],"pronunciation":"/fruˈɡal/","forms":{"feminine-singular":"frugală","masculine-plural":"frugali","feminine-neuter-plural":"frugale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frugal","error-unrecognized-form-feminine-indefinite-singular":"frugală","error-unrecognized-form-indefinite-masculine-plural":"frugali","error-unrecognized-form-feminine-indefinite-neuter-plural":"frugale","definite-error-unrecognized-form-masculine-neuter-singular":"frugalul","definite-error-unrecognized-form-feminine-singular":"frugala","definite-error-unrecognized-form-masculine-plural":"frugalii","definite-error-unrecognized-form-feminine-neuter-plural":"frugalele","alternative":"фругал"}},{"word":"frugalitate","pos":"noun","definitions":["frugality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"frugalitate","accusative-definite-nominative":"frugalitatea","dative-genitive-indefinite":"frugalități","dative-definite-genitive":"frugalității","vocative":"frugalitate"}},{"word":"frugifer","pos":"adj","definitions":["frugiferous"],"forms":{"feminine-singular":"frugiferă","masculine-plural":"frugiferi","feminine-neuter-plural":"frugifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frugifer","error-unrecognized-form-feminine-indefinite-singular":"frugiferă","error-unrecognized-form-indefinite-masculine-plural":"frugiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"frugifere","definite-error-unrecognized-form-masculine-neuter-singular":"frugiferul","definite-error-unrecognized-form-feminine-singular":"frugifera","definite-error-unrecognized-form-masculine-plural":"frugiferii","definite-error-unrecognized-form-feminine-neuter-plural":"frugiferele"}},{"word":"frugivor","pos":"adj","definitions":["frugivorous"],"forms":{"feminine-singular":"frugivoră","masculine-plural":"frugivori","feminine-neuter-plural":"frugivore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frugivor","error-unrecognized-form-feminine-indefinite-singular":"frugivoră","error-unrecognized-form-indefinite-masculine-plural":"frugivori","error-unrecognized-form-feminine-indefinite-neuter-plural":"frugivore","definite-error-unrecognized-form-masculine-neuter-singular":"frugivorul","definite-error-unrecognized-form-feminine-singular":"frugivora","definite-error-unrecognized-form-masculine-plural":"frugivorii","definite-error-unrecognized-form-feminine-neuter-plural":"frugivorele"}},{"word":"frugivoră","pos":"noun","definitions":["female equivalent of frugivor"],"forms":{"plural":"frugivore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frugivoră","accusative-definite-nominative-singular":"frugivora","accusative-indefinite-nominative-plural":"frugivore","accusative-definite-nominative-plural":"frugivorele","dative-genitive-indefinite-singular":"frugivore","dative-definite-genitive-singular":"frugivorei","dative-genitive-indefinite-plural":"frugivore","dative-definite-genitive-plural":"frugivorelor","singular-vocative":"frugivoră","plural-vocative":"frugivorelor"}},{"word":"Frumoasa","pos":"name","definitions":["a village in Balcani, Bacău County, Romania","a commune of Harghita County, Romania","a village in Frumoasa, Harghita County, Romania","a village in Moara, Suceava County, Romania","a commune of Teleorman County, Romania"],"gender":"f"},{"word":"frumoasa","pos":"adj","definitions":["definite nominative/accusative feminine singular of frumos"],"pronunciation":"[fruˈmo̯a.sa]"},{"word":"frumoasă","pos":"adj","definitions":["nominative/accusative feminine singular of frumos"],"pronunciation":"[fruˈmo̯asə]"},{"word":"frumoasă","pos":"noun","definitions":["female equivalent of frumos"],"pronunciation":"[fruˈmo̯asə]","forms":{"plural":"frumoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frumoasă","accusative-definite-nominative-singular":"frumoasa","accusative-indefinite-nominative-plural":"frumoase","accusative-definite-nominative-plural":"frumoasele","dative-genitive-indefinite-singular":"frumoase","dative-definite-genitive-singular":"frumoasei","dative-genitive-indefinite-plural":"frumoase","dative-definite-genitive-plural":"frumoaselor","singular-vocative":"frumoasă","plural-vocative":"frumoaselor"}},{"word":"frumoase","pos":"adj","definitions":["inflection of frumos:","feminine/neuter plural","genitive/dative feminine singular"],"pronunciation":"[fruˈmo̯ase]"},{"word":"frumoasei","pos":"adj","definitions":["definite genitive/dative feminine singular of frumos"],"pronunciation":"[fruˈmo̯a.sej]"},{"word":"frumoasele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of frumos"],"pronunciation":"[fruˈmo̯a.se.le]"},{"word":"frumoaselor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of frumos"],"pronunciation":"[fruˈmo̯a.se.lor]"},{"word":"Frumos","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frumos"}},{"word":"frumos","pos":"adj","definitions":["beautiful","handsome"],"pronunciation":"/fruˈmos/","forms":{"feminine-singular":"frumoasă","masculine-plural":"frumoși","feminine-neuter-plural":"frumoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frumos","error-unrecognized-form-feminine-indefinite-singular":"frumoasă","error-unrecognized-form-indefinite-masculine-plural":"frumoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"frumoase","definite-error-unrecognized-form-masculine-neuter-singular":"frumosul","definite-error-unrecognized-form-feminine-singular":"frumoasa","definite-error-unrecognized-form-masculine-plural":"frumoșii","definite-error-unrecognized-form-feminine-neuter-plural":"frumoasele"}},{"word":"frumos","pos":"adv","definitions":["beautifully, nicely"],"pronunciation":"/fruˈmos/"},{"word":"frumoși","pos":"adj","definitions":["masculine plural of frumos"],"pronunciation":"[fruˈmoʃʲ]"},{"word":"frumoșii","pos":"adj","definitions":["definite nominative/accusative masculine plural of frumos"],"pronunciation":"[fruˈmo.ʃij]"},{"word":"frumoșilor","pos":"adj","definitions":["definite genitive/dative masculine plural of frumos"],"pronunciation":"[fruˈmo.ʃi.lor]"},{"word":"Frumosu","pos":"name","definitions":["a village in Farcașa, Neamț County, Romania","a commune of Suceava County, Romania","a village in Frumosu, Suceava County, Romania"],"gender":"m"},{"word":"frumosul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of frumos"],"pronunciation":"[fruˈmo.sul]"},{"word":"frumosului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of frumos"],"pronunciation":"[fruˈmo.su.luj]"},{"word":"frumsețe","pos":"noun","definitions":["alternative form of frumusețe"],"forms":{"plural":"frumseți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frumsețe","accusative-definite-nominative-singular":"frumsețea","accusative-indefinite-nominative-plural":"frumseți","accusative-definite-nominative-plural":"frumsețile","dative-genitive-indefinite-singular":"frumseți","dative-definite-genitive-singular":"frumseții","dative-genitive-indefinite-plural":"frumseți","dative-definite-genitive-plural":"frumseților","singular-vocative":"frumsețe","plural-vocative":"frumseților"}},{"word":"Frumușani","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Frumușani, Călărași County, Romania"],"gender":"m"},{"word":"Frumușeaua","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Vișeu"],"gender":"f"},{"word":"Frumușei","pos":"name","definitions":["a village in Licurici, Gorj County, Romania"],"gender":"m"},{"word":"frumușel","pos":"adj","definitions":["diminutive of frumos"],"forms":{"feminine-singular":"frumușelă","masculine-plural":"frumușeli","feminine-neuter-plural":"frumușele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frumușel","error-unrecognized-form-feminine-indefinite-singular":"frumușelă","error-unrecognized-form-indefinite-masculine-plural":"frumușeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"frumușele","definite-error-unrecognized-form-masculine-neuter-singular":"frumușelul","definite-error-unrecognized-form-feminine-singular":"frumușela","definite-error-unrecognized-form-masculine-plural":"frumușelii","definite-error-unrecognized-form-feminine-neuter-plural":"frumușelele"}},{"word":"Frumușelu","pos":"name","definitions":["a village in Glăvănești, Bacău County, Romania"],"gender":"m"},{"word":"frumușelul","pos":"noun","definitions":["definite nominative/accusative singular of frumușel"]},{"word":"Frumușeni","pos":"name","definitions":["a commune of Arad County, Romania","a village in Frumușeni, Arad County, Romania"],"gender":"m"},{"word":"frumuseța","pos":"verb","definitions":["to beautify"],"forms":{"canonical":"a frumuseța 1st conjugation","present-singular-third-person":"frumusețează","participle-past":"frumusețat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frumuseța","gerund":"frumusețând","first-person-indicative-present-singular":"frumusețez","indicative-present-second-person-singular":"frumusețezi","indicative-present-singular-third-person":"frumusețează","first-person-indicative-plural-present":"frumusețăm","indicative-plural-present-second-person":"frumusețați","indicative-plural-present-third-person":"frumusețează","first-person-imperfect-indicative-singular":"frumusețam","imperfect-indicative-second-person-singular":"frumusețai","imperfect-indicative-singular-third-person":"frumuseța","first-person-imperfect-indicative-plural":"frumusețam","imperfect-indicative-plural-second-person":"frumusețați","imperfect-indicative-plural-third-person":"frumusețau","first-person-indicative-perfect-singular":"frumusețai","indicative-perfect-second-person-singular":"frumusețași","indicative-perfect-singular-third-person":"frumuseță","first-person-indicative-perfect-plural":"frumusețarăm","indicative-perfect-plural-second-person":"frumusețarăți","indicative-perfect-plural-third-person":"frumusețară","first-person-indicative-pluperfect-singular":"frumusețasem","indicative-pluperfect-second-person-singular":"frumusețaseși","indicative-pluperfect-singular-third-person":"frumusețase","first-person-indicative-pluperfect-plural":"frumusețaserăm","indicative-pluperfect-plural-second-person":"frumusețaserăți","indicative-pluperfect-plural-third-person":"frumusețaseră","first-person-present-singular-subjunctive":"să frumusețez","present-second-person-singular-subjunctive":"să frumusețezi","present-singular-subjunctive-third-person":"să frumusețeze","first-person-plural-present-subjunctive":"să frumusețăm","plural-present-second-person-subjunctive":"să frumusețați","plural-present-subjunctive-third-person":"să frumusețeze","imperative-second-person-singular":"frumusețează","imperative-plural-second-person":"frumusețați","imperative-negative-second-person-singular":"nu frumuseța","imperative-negative-plural-second-person":"nu frumusețați"}},{"word":"frumuseță","pos":"noun","definitions":["obsolete form of frumusețe"],"forms":{"plural":"frumuseți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frumuseță","accusative-definite-nominative-singular":"frumuseța","accusative-indefinite-nominative-plural":"frumuseți","accusative-definite-nominative-plural":"frumusețile","dative-genitive-indefinite-singular":"frumuseți","dative-definite-genitive-singular":"frumuseții","dative-genitive-indefinite-plural":"frumuseți","dative-definite-genitive-plural":"frumuseților","singular-vocative":"frumuseță","plural-vocative":"frumuseților"}},{"word":"frumusețe","pos":"noun","definitions":["beauty (the quality of being beautiful)","beauty (a thing or person that is beautiful)"],"pronunciation":"[frumuˈsetse]","forms":{"plural":"frumuseți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frumusețe","accusative-definite-nominative-singular":"frumusețea","accusative-indefinite-nominative-plural":"frumuseți","accusative-definite-nominative-plural":"frumusețile","dative-genitive-indefinite-singular":"frumuseți","dative-definite-genitive-singular":"frumuseții","dative-genitive-indefinite-plural":"frumuseți","dative-definite-genitive-plural":"frumuseților","singular-vocative":"frumusețe","plural-vocative":"frumuseților"}},{"word":"frumusețea","pos":"noun","definitions":["definite nominative/accusative singular of frumusețe"],"pronunciation":"/fru.muˈse.t͡se̯a/","gender":"f"},{"word":"frumuseți","pos":"noun","definitions":["plural of frumusețe"],"pronunciation":"[frumuˈsetsʲ]","gender":"f-p"},{"word":"frumuseții","pos":"noun","definitions":["definite genitive/dative singular of frumusețe"],"pronunciation":"[frumuˈsetsiː]","gender":"f"},{"word":"frumusețile","pos":"noun","definitions":["definite nominative/accusative plural of frumusețe"],"pronunciation":"[frumuˈsetsile]","gender":"f-p"},{"word":"frumuseților","pos":"noun","definitions":["definite genitive/dative plural of frumusețe"],"pronunciation":"[frumuˈsetsilor]","gender":"f-p"},{"word":"Frumușica","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Frumușica, Botoșani County, Romania","a village in Mădârjac, Iași County, Romania"],"gender":"f"},{"word":"Frumușica Nouă","pos":"name","definitions":["a village in Frumușica, Florești Raion, Moldova"],"gender":"f"},{"word":"Frumușița","pos":"name","definitions":["a commune of Galați County, Romania","a village in Frumușița, Galați County, Romania"],"gender":"f"},{"word":"fruntar","pos":"noun","definitions":["headpiece of a bridle"],"forms":{"plural":"fruntare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fruntar","accusative-definite-nominative-singular":"fruntarul","accusative-indefinite-nominative-plural":"fruntare","accusative-definite-nominative-plural":"fruntarele","dative-genitive-indefinite-singular":"fruntar","dative-definite-genitive-singular":"fruntarului","dative-genitive-indefinite-plural":"fruntare","dative-definite-genitive-plural":"fruntarelor","singular-vocative":"fruntarule","plural-vocative":"fruntarelor"}},{"word":"fruntarie","pos":"noun","definitions":["alternative form of frontieră"],"forms":{"plural":"fruntarii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fruntarie","accusative-definite-nominative-singular":"fruntaria","accusative-indefinite-nominative-plural":"fruntarii","accusative-definite-nominative-plural":"fruntariile","dative-genitive-indefinite-singular":"fruntarii","dative-definite-genitive-singular":"fruntariei","dative-genitive-indefinite-plural":"fruntarii","dative-definite-genitive-plural":"fruntariilor","singular-vocative":"fruntarie","plural-vocative":"fruntariilor"}},{"word":"Fruntaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fruntaș"}},{"word":"fruntaș","pos":"noun","definitions":["udarnik"],"forms":{"plural":"fruntași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fruntaș","accusative-definite-nominative-singular":"fruntașul","accusative-indefinite-nominative-plural":"fruntași","accusative-definite-nominative-plural":"fruntașii","dative-genitive-indefinite-singular":"fruntaș","dative-definite-genitive-singular":"fruntașului","dative-genitive-indefinite-plural":"fruntași","dative-definite-genitive-plural":"fruntașilor","singular-vocative":"fruntașule","plural-vocative":"fruntașilor"}},{"word":"fruntașă","pos":"noun","definitions":["female equivalent of fruntaș"],"forms":{"plural":"fruntașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fruntașă","accusative-definite-nominative-singular":"fruntașa","accusative-indefinite-nominative-plural":"fruntașe","accusative-definite-nominative-plural":"fruntașele","dative-genitive-indefinite-singular":"fruntașe","dative-definite-genitive-singular":"fruntașei","dative-genitive-indefinite-plural":"fruntașe","dative-definite-genitive-plural":"fruntașelor","singular-vocative":"fruntașă","plural-vocative":"fruntașelor"}},{"word":"fruntășime","pos":"noun","definitions":["elite"],"forms":{"plural":"fruntășimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fruntășime","accusative-definite-nominative-singular":"fruntășimea","accusative-indefinite-nominative-plural":"fruntășimi","accusative-definite-nominative-plural":"fruntășimile","dative-genitive-indefinite-singular":"fruntășimi","dative-definite-genitive-singular":"fruntășimii","dative-genitive-indefinite-plural":"fruntășimi","dative-definite-genitive-plural":"fruntășimilor","singular-vocative":"fruntășime","plural-vocative":"fruntășimilor"}},{"word":"frunte","pos":"noun","definitions":["forehead, brow","the most important or superior part of something","forefront"],"forms":{"plural":"frunți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frunte","accusative-definite-nominative-singular":"fruntea","accusative-indefinite-nominative-plural":"frunți","accusative-definite-nominative-plural":"frunțile","dative-genitive-indefinite-singular":"frunți","dative-definite-genitive-singular":"frunții","dative-genitive-indefinite-plural":"frunți","dative-definite-genitive-plural":"frunților","singular-vocative":"frunte","plural-vocative":"frunților"}},{"word":"Fruntești","pos":"name","definitions":["a village in Filipeni, Bacău County, Romania"],"gender":"m"},{"word":"frunticică","pos":"noun","definitions":["diminutive of frunte"],"forms":{"plural":"frunticicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunticică","accusative-definite-nominative-singular":"frunticica","accusative-indefinite-nominative-plural":"frunticicele","accusative-definite-nominative-plural":"frunticicelele","dative-genitive-indefinite-singular":"frunticicele","dative-definite-genitive-singular":"frunticicelei","dative-genitive-indefinite-plural":"frunticicele","dative-definite-genitive-plural":"frunticicelelor","singular-vocative":"frunticică","plural-vocative":"frunticicelelor"}},{"word":"Frunții","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Dămuc"],"gender":"m"},{"word":"Fruntișeni","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Fruntișeni, Vaslui County, Romania"],"gender":"m"},{"word":"fruntișoară","pos":"noun","definitions":["diminutive of frunte"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"fruntișoară","accusative-definite-nominative":"fruntișoara","dative-genitive-indefinite":"fruntișoare","dative-definite-genitive":"fruntișoarei","vocative":"fruntișoară"}},{"word":"fruntiță","pos":"noun","definitions":["diminutive of frunte"],"forms":{"plural":"fruntițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fruntiță","accusative-definite-nominative-singular":"fruntița","accusative-indefinite-nominative-plural":"fruntițe","accusative-definite-nominative-plural":"fruntițele","dative-genitive-indefinite-singular":"fruntițe","dative-definite-genitive-singular":"fruntiței","dative-genitive-indefinite-plural":"fruntițe","dative-definite-genitive-plural":"fruntițelor","singular-vocative":"fruntiță","plural-vocative":"fruntițelor"}},{"word":"fruntos","pos":"adj","definitions":["having a big forehead"],"forms":{"feminine-singular":"fruntoasă","masculine-plural":"fruntoși","feminine-neuter-plural":"fruntoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fruntos","error-unrecognized-form-feminine-indefinite-singular":"fruntoasă","error-unrecognized-form-indefinite-masculine-plural":"fruntoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fruntoase","definite-error-unrecognized-form-masculine-neuter-singular":"fruntosul","definite-error-unrecognized-form-feminine-singular":"fruntoasa","definite-error-unrecognized-form-masculine-plural":"fruntoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fruntoasele"}},{"word":"fruntos","pos":"noun","definitions":["a person having a big forehead"],"forms":{"plural":"fruntoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fruntos","accusative-definite-nominative-singular":"fruntosul","accusative-indefinite-nominative-plural":"fruntoși","accusative-definite-nominative-plural":"fruntoșii","dative-genitive-indefinite-singular":"fruntos","dative-definite-genitive-singular":"fruntosului","dative-genitive-indefinite-plural":"fruntoși","dative-definite-genitive-plural":"fruntoșilor","singular-vocative":"fruntosule","plural-vocative":"fruntoșilor"}},{"word":"Frunza","pos":"name","definitions":["a village in Logrești, Gorj County, Romania"],"gender":"f"},{"word":"frunza","pos":"noun","definitions":["definite nominative/accusative singular of frunză"],"pronunciation":"[ˈfrunza]","gender":"f"},{"word":"Frunză","pos":"name","definitions":["a town in Ocnița Raion, Moldova","a surname"],"pronunciation":"/ˈfrun.zə/","gender":"m","forms":{"alternative":"Фрунзэ"}},{"word":"frunză","pos":"noun","definitions":["leaf"],"pronunciation":"/ˈfrun.zə/","forms":{"plural":"frunze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunză","accusative-definite-nominative-singular":"frunza","accusative-indefinite-nominative-plural":"frunze","accusative-definite-nominative-plural":"frunzele","dative-genitive-indefinite-singular":"frunze","dative-definite-genitive-singular":"frunzei","dative-genitive-indefinite-plural":"frunze","dative-definite-genitive-plural":"frunzelor","singular-vocative":"frunză","plural-vocative":"frunzelor","alternative-obsolete":"frund̦ă","alternative":"фрунзэ"}},{"word":"frunză compusă","pos":"noun","definitions":["compound leaf"],"forms":{"plural":"frunze compuse"}},{"word":"frunză simplă","pos":"noun","definitions":["simple leaf"],"forms":{"plural":"frunze simple"}},{"word":"Frunzar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Frunzar"}},{"word":"frunzar","pos":"noun","definitions":["leafage, foliage"],"forms":{"plural":"frunzare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frunzar","accusative-definite-nominative-singular":"frunzarul","accusative-indefinite-nominative-plural":"frunzare","accusative-definite-nominative-plural":"frunzarei","dative-genitive-indefinite-singular":"frunzar","dative-definite-genitive-singular":"frunzarului","dative-genitive-indefinite-plural":"frunzare","dative-definite-genitive-plural":"frunzarelor","singular-vocative":"frunzarule","plural-vocative":"frunzarelor"}},{"word":"frunzăreală","pos":"noun","definitions":["leafing (of a book)"],"forms":{"plural":"frunzăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzăreală","accusative-definite-nominative-singular":"frunzăreala","accusative-indefinite-nominative-plural":"frunzărele","accusative-definite-nominative-plural":"frunzărelele","dative-genitive-indefinite-singular":"frunzărele","dative-definite-genitive-singular":"frunzărelei","dative-genitive-indefinite-plural":"frunzărele","dative-definite-genitive-plural":"frunzărelelor","singular-vocative":"frunzăreală","plural-vocative":"frunzărelelor"}},{"word":"Frunzăreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Frunzăreanu"}},{"word":"frunzărel","pos":"noun","definitions":["diminutive of frunzar"],"forms":{"plural":"frunzărei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"frunzărel","accusative-definite-nominative-singular":"frunzărelul","accusative-indefinite-nominative-plural":"frunzărei","accusative-definite-nominative-plural":"frunzăreii","dative-genitive-indefinite-singular":"frunzărel","dative-definite-genitive-singular":"frunzărelului","dative-genitive-indefinite-plural":"frunzărei","dative-definite-genitive-plural":"frunzăreilor","singular-vocative":"frunzărelule","plural-vocative":"frunzăreilor"}},{"word":"frunzăret","pos":"noun","definitions":["leafage, foliage"],"forms":{"plural":"frunzăreturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frunzăret","accusative-definite-nominative-singular":"frunzăretul","accusative-indefinite-nominative-plural":"frunzăreturi","accusative-definite-nominative-plural":"frunzăreturile","dative-genitive-indefinite-singular":"frunzăret","dative-definite-genitive-singular":"frunzăretului","dative-genitive-indefinite-plural":"frunzăreturi","dative-definite-genitive-plural":"frunzăreturilor","singular-vocative":"frunzăretule","plural-vocative":"frunzăreturilor"}},{"word":"frunzări","pos":"verb","definitions":["to skim, to leaf through"],"forms":{"canonical":"a frunzări 4th conjugation","present-singular-third-person":"frunzărește","participle-past":"frunzărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a frunzări","gerund":"frunzărind","first-person-indicative-present-singular":"frunzăresc","indicative-present-second-person-singular":"frunzărești","indicative-present-singular-third-person":"frunzărește","first-person-indicative-plural-present":"frunzărim","indicative-plural-present-second-person":"frunzăriți","indicative-plural-present-third-person":"frunzăresc","first-person-imperfect-indicative-singular":"frunzăream","imperfect-indicative-second-person-singular":"frunzăreai","imperfect-indicative-singular-third-person":"frunzărea","first-person-imperfect-indicative-plural":"frunzăream","imperfect-indicative-plural-second-person":"frunzăreați","imperfect-indicative-plural-third-person":"frunzăreau","first-person-indicative-perfect-singular":"frunzării","indicative-perfect-second-person-singular":"frunzăriși","indicative-perfect-singular-third-person":"frunzări","first-person-indicative-perfect-plural":"frunzărirăm","indicative-perfect-plural-second-person":"frunzărirăți","indicative-perfect-plural-third-person":"frunzăriră","first-person-indicative-pluperfect-singular":"frunzărisem","indicative-pluperfect-second-person-singular":"frunzăriseși","indicative-pluperfect-singular-third-person":"frunzărise","first-person-indicative-pluperfect-plural":"frunzăriserăm","indicative-pluperfect-plural-second-person":"frunzăriserăți","indicative-pluperfect-plural-third-person":"frunzăriseră","first-person-present-singular-subjunctive":"să frunzăresc","present-second-person-singular-subjunctive":"să frunzărești","present-singular-subjunctive-third-person":"să frunzărească","first-person-plural-present-subjunctive":"să frunzărim","plural-present-second-person-subjunctive":"să frunzăriți","plural-present-subjunctive-third-person":"să frunzărească","imperative-second-person-singular":"frunzărește","imperative-plural-second-person":"frunzăriți","imperative-negative-second-person-singular":"nu frunzări","imperative-negative-plural-second-person":"nu frunzăriți"}},{"word":"frunzărie","pos":"noun","definitions":["foliage, leafage"],"forms":{"plural":"frunzării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frunzărie","accusative-definite-nominative-singular":"frunzăria","accusative-indefinite-nominative-plural":"frunzării","accusative-definite-nominative-plural":"frunzăriile","dative-genitive-indefinite-singular":"frunzării","dative-definite-genitive-singular":"frunzăriei","dative-genitive-indefinite-plural":"frunzării","dative-definite-genitive-plural":"frunzăriilor","singular-vocative":"frunzărie","plural-vocative":"frunzăriilor"}},{"word":"frunzărime","pos":"noun","definitions":["foliage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frunzărime","accusative-definite-nominative-singular":"frunzărimea","accusative-indefinite-nominative-plural":"frunzărimi","accusative-definite-nominative-plural":"frunzărimile","dative-genitive-indefinite-singular":"frunzărimi","dative-definite-genitive-singular":"frunzărimii","dative-genitive-indefinite-plural":"frunzărimi","dative-definite-genitive-plural":"frunzărimilor","singular-vocative":"frunzărime","plural-vocative":"frunzărimilor"}},{"word":"frunzărire","pos":"noun","definitions":["skimming (of a book)"],"forms":{"plural":"frunzăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frunzărire","accusative-definite-nominative-singular":"frunzărirea","accusative-indefinite-nominative-plural":"frunzăriri","accusative-definite-nominative-plural":"frunzăririle","dative-genitive-indefinite-singular":"frunzăriri","dative-definite-genitive-singular":"frunzăririi","dative-genitive-indefinite-plural":"frunzăriri","dative-definite-genitive-plural":"frunzăririlor","singular-vocative":"frunzărire","plural-vocative":"frunzăririlor"}},{"word":"frunzărit","pos":"adj","definitions":["skimmed (about a book)"],"forms":{"feminine-singular":"frunzărită","masculine-plural":"frunzăriți","feminine-neuter-plural":"frunzărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frunzărit","error-unrecognized-form-feminine-indefinite-singular":"frunzărită","error-unrecognized-form-indefinite-masculine-plural":"frunzăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frunzărite","definite-error-unrecognized-form-masculine-neuter-singular":"frunzăritul","definite-error-unrecognized-form-feminine-singular":"frunzărita","definite-error-unrecognized-form-masculine-plural":"frunzăriții","definite-error-unrecognized-form-feminine-neuter-plural":"frunzăritele"}},{"word":"frunzărit","pos":"verb","definitions":["past participle of frunzări"],"forms":{"participle-past":"of frunzări"}},{"word":"frunzăriță cenușie","pos":"noun","definitions":["eastern olivaceous warbler (Iduna pallida)"],"forms":{"plural":"frunzărițe cenușii"}},{"word":"frunzăriță galbenă","pos":"noun","definitions":["icterine warbler (Hippolais icterina)"],"forms":{"plural":"frunzărițe galbene"}},{"word":"Frunzaru","pos":"name","definitions":["a village in Sprâncenata, Olt County, Romania"],"gender":"m"},{"word":"frunzătură","pos":"noun","definitions":["foliage, leafage"],"forms":{"plural":"frunzături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frunzătură","accusative-definite-nominative-singular":"frunzătura","accusative-indefinite-nominative-plural":"frunzături","accusative-definite-nominative-plural":"frunzăturile","dative-genitive-indefinite-singular":"frunzături","dative-definite-genitive-singular":"frunzăturii","dative-genitive-indefinite-plural":"frunzături","dative-definite-genitive-plural":"frunzăturilor","singular-vocative":"frunzătură","plural-vocative":"frunzăturilor"}},{"word":"frunzături","pos":"noun","definitions":["plural of frunzătură"]},{"word":"Frunzăuca","pos":"name","definitions":["a village in Hrușca, Transnistria, Moldova"],"gender":"f"},{"word":"Frunzăverde","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frunzăverde"}},{"word":"frunze","pos":"noun","definitions":["plural of frunză"]},{"word":"Frunzeasca","pos":"name","definitions":["a village in Munteni, Galați County, Romania"],"gender":"f"},{"word":"Frunzeni","pos":"name","definitions":["a village in Lunca, Mureș County, Romania","a village in Costișa, Neamț County, Romania"],"gender":"m"},{"word":"Frunzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frunzescu"}},{"word":"Frunzești","pos":"name","definitions":["a village in Prajila, Florești Raion, Moldova"],"gender":"m"},{"word":"frunzet","pos":"noun","definitions":["foliage, leafage"],"forms":{"plural":"frunzeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frunzet","accusative-definite-nominative-singular":"frunzetul","accusative-indefinite-nominative-plural":"frunzeturi","accusative-definite-nominative-plural":"frunzeturile","dative-genitive-indefinite-singular":"frunzet","dative-definite-genitive-singular":"frunzetului","dative-genitive-indefinite-plural":"frunzeturi","dative-definite-genitive-plural":"frunzeturilor","singular-vocative":"frunzetule","plural-vocative":"frunzeturilor"}},{"word":"Frunzete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frunzete"}},{"word":"frunzi","pos":"verb","definitions":["to leaf, produce leaves, cover with leaves or foliage"],"forms":{"canonical":"a frunzi 4th conjugation","present-singular-third-person":"frunzește","participle-past":"frunzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a frunzi","gerund":"frunzind","first-person-indicative-present-singular":"frunzesc","indicative-present-second-person-singular":"frunzești","indicative-present-singular-third-person":"frunzește","first-person-indicative-plural-present":"frunzim","indicative-plural-present-second-person":"frunziți","indicative-plural-present-third-person":"frunzesc","first-person-imperfect-indicative-singular":"frunzeam","imperfect-indicative-second-person-singular":"frunzeai","imperfect-indicative-singular-third-person":"frunzea","first-person-imperfect-indicative-plural":"frunzeam","imperfect-indicative-plural-second-person":"frunzeați","imperfect-indicative-plural-third-person":"frunzeau","first-person-indicative-perfect-singular":"frunzii","indicative-perfect-second-person-singular":"frunziși","indicative-perfect-singular-third-person":"frunzi","first-person-indicative-perfect-plural":"frunzirăm","indicative-perfect-plural-second-person":"frunzirăți","indicative-perfect-plural-third-person":"frunziră","first-person-indicative-pluperfect-singular":"frunzisem","indicative-pluperfect-second-person-singular":"frunziseși","indicative-pluperfect-singular-third-person":"frunzise","first-person-indicative-pluperfect-plural":"frunziserăm","indicative-pluperfect-plural-second-person":"frunziserăți","indicative-pluperfect-plural-third-person":"frunziseră","first-person-present-singular-subjunctive":"să frunzesc","present-second-person-singular-subjunctive":"să frunzești","present-singular-subjunctive-third-person":"să frunzească","first-person-plural-present-subjunctive":"să frunzim","plural-present-second-person-subjunctive":"să frunziți","plural-present-subjunctive-third-person":"să frunzească","imperative-second-person-singular":"frunzește","imperative-plural-second-person":"frunziți","imperative-negative-second-person-singular":"nu frunzi","imperative-negative-plural-second-person":"nu frunziți"}},{"word":"Frunzică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frunzică"}},{"word":"frunzică","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzică","accusative-definite-nominative-singular":"frunzica","accusative-indefinite-nominative-plural":"frunzice","accusative-definite-nominative-plural":"frunzicele","dative-genitive-indefinite-singular":"frunzice","dative-definite-genitive-singular":"frunzicei","dative-genitive-indefinite-plural":"frunzice","dative-definite-genitive-plural":"frunzicelor","singular-vocative":"frunzică","plural-vocative":"frunzicelor"}},{"word":"frunzicea","pos":"noun","definitions":["diminutive of frunză"],"forms":{"plural":"frunzicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"frunzicea","accusative-definite-nominative-singular":"frunziceaua","accusative-indefinite-nominative-plural":"frunzicele","accusative-definite-nominative-plural":"frunzicelele","dative-genitive-indefinite-singular":"frunzicele","dative-definite-genitive-singular":"frunzicelei","dative-genitive-indefinite-plural":"frunzicele","dative-definite-genitive-plural":"frunzicelelor","singular-vocative":"frunzicea","plural-vocative":"frunzicelelor"}},{"word":"frunzioară","pos":"noun","definitions":["diminutive of frunză"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"frunzioară","accusative-definite-nominative":"frunzioara","dative-genitive-indefinite":"frunzioare","dative-definite-genitive":"frunzioarei","vocative":"frunzioară"}},{"word":"frunziș","pos":"noun","definitions":["foliage, leafage"],"pronunciation":"/frunˈziʃ/","forms":{"plural":"frunzișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"frunziș","accusative-definite-nominative-singular":"frunzișul","accusative-indefinite-nominative-plural":"frunzișuri","accusative-definite-nominative-plural":"frunzișurile","dative-genitive-indefinite-singular":"frunziș","dative-definite-genitive-singular":"frunzișului","dative-genitive-indefinite-plural":"frunzișuri","dative-definite-genitive-plural":"frunzișurilor","singular-vocative":"frunzișule","plural-vocative":"frunzișurilor"}},{"word":"frunzișoară","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzișoară","accusative-definite-nominative-singular":"frunzișoara","accusative-indefinite-nominative-plural":"frunzișoare","accusative-definite-nominative-plural":"frunzișoarele","dative-genitive-indefinite-singular":"frunzișoare","dative-definite-genitive-singular":"frunzișoarei","dative-genitive-indefinite-plural":"frunzișoare","dative-definite-genitive-plural":"frunzișoarelor","singular-vocative":"frunzișoară","plural-vocative":"frunzișoarelor"}},{"word":"frunzișuri","pos":"noun","definitions":["plural of frunziș"]},{"word":"frunziță","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunziță","accusative-definite-nominative-singular":"frunzița","accusative-indefinite-nominative-plural":"frunzițe","accusative-definite-nominative-plural":"frunzițele","dative-genitive-indefinite-singular":"frunzițe","dative-definite-genitive-singular":"frunziței","dative-genitive-indefinite-plural":"frunzițe","dative-definite-genitive-plural":"frunzițelor","singular-vocative":"frunziță","plural-vocative":"frunzițelor"}},{"word":"frunzo","pos":"noun","definitions":["vocative singular of frunză"],"pronunciation":"[ˈfrunzo]","gender":"f"},{"word":"frunzos","pos":"adj","definitions":["leafy"],"pronunciation":"/frunˈzos/","forms":{"feminine-singular":"frunzoasă","masculine-plural":"frunzoși","feminine-neuter-plural":"frunzoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frunzos","error-unrecognized-form-feminine-indefinite-singular":"frunzoasă","error-unrecognized-form-indefinite-masculine-plural":"frunzoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"frunzoase","definite-error-unrecognized-form-masculine-neuter-singular":"frunzosul","definite-error-unrecognized-form-feminine-singular":"frunzoasa","definite-error-unrecognized-form-masculine-plural":"frunzoșii","definite-error-unrecognized-form-feminine-neuter-plural":"frunzoasele"}},{"word":"Frunzucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frunzucă"}},{"word":"frunzucă","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzuci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzucă","accusative-definite-nominative-singular":"frunzuca","accusative-indefinite-nominative-plural":"frunzuce","accusative-definite-nominative-plural":"frunzucele","dative-genitive-indefinite-singular":"frunzuce","dative-definite-genitive-singular":"frunzucei","dative-genitive-indefinite-plural":"frunzuce","dative-definite-genitive-plural":"frunzucelor","singular-vocative":"frunzucă","plural-vocative":"frunzucelor"}},{"word":"frunzuleană","pos":"noun","definitions":["diminutive of frunză"],"forms":{"plural":"frunzulene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzuleană","accusative-definite-nominative-singular":"frunzuleana","accusative-indefinite-nominative-plural":"frunzulene","accusative-definite-nominative-plural":"frunzulenele","dative-genitive-indefinite-singular":"frunzulene","dative-definite-genitive-singular":"frunzulenei","dative-genitive-indefinite-plural":"frunzulene","dative-definite-genitive-plural":"frunzulenelor","singular-vocative":"frunzuleană","plural-vocative":"frunzulenelor"}},{"word":"Frunzulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frunzulică"}},{"word":"frunzulică","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzulici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"frunzulică","accusative-definite-nominative-singular":"frunzulica","accusative-indefinite-nominative-plural":"frunzulici","accusative-definite-nominative-plural":"frunzulicile","dative-genitive-indefinite-singular":"frunzulici","dative-definite-genitive-singular":"frunzulicii","dative-genitive-indefinite-plural":"frunzulici","dative-definite-genitive-plural":"frunzulicilor","singular-vocative":"frunzulică","plural-vocative":"frunzulicilor"}},{"word":"frunzulină","pos":"noun","definitions":["diminutive of frunză"],"forms":{"plural":"frunzuline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzulină","accusative-definite-nominative-singular":"frunzulina","accusative-indefinite-nominative-plural":"frunzuline","accusative-definite-nominative-plural":"frunzulinele","dative-genitive-indefinite-singular":"frunzuline","dative-definite-genitive-singular":"frunzulinei","dative-genitive-indefinite-plural":"frunzuline","dative-definite-genitive-plural":"frunzulinelor","singular-vocative":"frunzulină","plural-vocative":"frunzulinelor"}},{"word":"Frunzuliță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Frunzuliță"}},{"word":"frunzuliță","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzuliță","accusative-definite-nominative-singular":"frunzulița","accusative-indefinite-nominative-plural":"frunzulițe","accusative-definite-nominative-plural":"frunzulițele","dative-genitive-indefinite-singular":"frunzulițe","dative-definite-genitive-singular":"frunzuliței","dative-genitive-indefinite-plural":"frunzulițe","dative-definite-genitive-plural":"frunzulițelor","singular-vocative":"frunzuliță","plural-vocative":"frunzulițelor"}},{"word":"frunzușoară","pos":"noun","definitions":["diminutive of frunză"],"forms":{"plural":"frunzușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzușoară","accusative-definite-nominative-singular":"frunzușoara","accusative-indefinite-nominative-plural":"frunzușoare","accusative-definite-nominative-plural":"frunzușoarele","dative-genitive-indefinite-singular":"frunzușoare","dative-definite-genitive-singular":"frunzușoarei","dative-genitive-indefinite-plural":"frunzușoare","dative-definite-genitive-plural":"frunzușoarelor","singular-vocative":"frunzușoară","plural-vocative":"frunzușoarelor"}},{"word":"frunzuță","pos":"noun","definitions":["diminutive of frunză; small leaf"],"forms":{"plural":"frunzuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frunzuță","accusative-definite-nominative-singular":"frunzuța","accusative-indefinite-nominative-plural":"frunzuțe","accusative-definite-nominative-plural":"frunzuțele","dative-genitive-indefinite-singular":"frunzuțe","dative-definite-genitive-singular":"frunzuței","dative-genitive-indefinite-plural":"frunzuțe","dative-definite-genitive-plural":"frunzuțelor","singular-vocative":"frunzuță","plural-vocative":"frunzuțelor"}},{"word":"frupt","pos":"noun","definitions":["food products deriving from animal's milk, dairy","food such as milk, meat, eggs, etc., that are not eaten during Lent","manna"],"forms":{"plural":"frupturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"frupt","accusative-definite-nominative-singular":"fruptul","accusative-indefinite-nominative-plural":"frupturi","accusative-definite-nominative-plural":"frupturile","dative-genitive-indefinite-singular":"frupt","dative-definite-genitive-singular":"fruptului","dative-genitive-indefinite-plural":"frupturi","dative-definite-genitive-plural":"frupturilor","singular-vocative":"fruptule","plural-vocative":"frupturilor"}},{"word":"Frusinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Frusinoiu"}},{"word":"frușiță","pos":"noun","definitions":["common daisy (Bellis perennis)"],"forms":{"plural":"frușițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"frușiță","accusative-definite-nominative-singular":"frușița","accusative-indefinite-nominative-plural":"frușițe","accusative-definite-nominative-plural":"frușițele","dative-genitive-indefinite-singular":"frușițe","dative-definite-genitive-singular":"frușiței","dative-genitive-indefinite-plural":"frușițe","dative-definite-genitive-plural":"frușițelor","singular-vocative":"frușiță","plural-vocative":"frușițelor"}},{"word":"frust","pos":"adj","definitions":["worn","unrefined, unchiseled"],"pronunciation":"/ˈfrust/","forms":{"feminine-singular":"frustă","masculine-plural":"fruști","feminine-neuter-plural":"fruste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frust","error-unrecognized-form-feminine-indefinite-singular":"frustă","error-unrecognized-form-indefinite-masculine-plural":"fruști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fruste","definite-error-unrecognized-form-masculine-neuter-singular":"frustul","definite-error-unrecognized-form-feminine-singular":"frusta","definite-error-unrecognized-form-masculine-plural":"fruștii","definite-error-unrecognized-form-feminine-neuter-plural":"frustele"}},{"word":"frustra","pos":"verb","definitions":["to frustrate"],"forms":{"canonical":"a frustra 1st conjugation","present-singular-third-person":"frustrează","participle-past":"frustrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a frustra","gerund":"frustrând","first-person-indicative-present-singular":"frustrez","indicative-present-second-person-singular":"frustrezi","indicative-present-singular-third-person":"frustrează","first-person-indicative-plural-present":"frustrăm","indicative-plural-present-second-person":"frustrați","indicative-plural-present-third-person":"frustrează","first-person-imperfect-indicative-singular":"frustram","imperfect-indicative-second-person-singular":"frustrai","imperfect-indicative-singular-third-person":"frustra","first-person-imperfect-indicative-plural":"frustram","imperfect-indicative-plural-second-person":"frustrați","imperfect-indicative-plural-third-person":"frustrau","first-person-indicative-perfect-singular":"frustrai","indicative-perfect-second-person-singular":"frustrași","indicative-perfect-singular-third-person":"frustră","first-person-indicative-perfect-plural":"frustrarăm","indicative-perfect-plural-second-person":"frustrarăți","indicative-perfect-plural-third-person":"frustrară","first-person-indicative-pluperfect-singular":"frustrasem","indicative-pluperfect-second-person-singular":"frustraseși","indicative-pluperfect-singular-third-person":"frustrase","first-person-indicative-pluperfect-plural":"frustraserăm","indicative-pluperfect-plural-second-person":"frustraserăți","indicative-pluperfect-plural-third-person":"frustraseră","first-person-present-singular-subjunctive":"să frustrez","present-second-person-singular-subjunctive":"să frustrezi","present-singular-subjunctive-third-person":"să frustreze","first-person-plural-present-subjunctive":"să frustrăm","plural-present-second-person-subjunctive":"să frustrați","plural-present-subjunctive-third-person":"să frustreze","imperative-second-person-singular":"frustrează","imperative-plural-second-person":"frustrați","imperative-negative-second-person-singular":"nu frustra","imperative-negative-plural-second-person":"nu frustrați"}},{"word":"frustrare","pos":"noun","definitions":["frustration"],"forms":{"plural":"frustrări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"frustrare","accusative-definite-nominative-singular":"frustrarea","accusative-indefinite-nominative-plural":"frustrări","accusative-definite-nominative-plural":"frustrările","dative-genitive-indefinite-singular":"frustrări","dative-definite-genitive-singular":"frustrării","dative-genitive-indefinite-plural":"frustrări","dative-definite-genitive-plural":"frustrărilor","singular-vocative":"frustrare","plural-vocative":"frustrărilor"}},{"word":"frustrat","pos":"adj","definitions":["frustrated"],"forms":{"feminine-singular":"frustrată","masculine-plural":"frustrați","feminine-neuter-plural":"frustrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frustrat","error-unrecognized-form-feminine-indefinite-singular":"frustrată","error-unrecognized-form-indefinite-masculine-plural":"frustrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"frustrate","definite-error-unrecognized-form-masculine-neuter-singular":"frustratul","definite-error-unrecognized-form-feminine-singular":"frustrata","definite-error-unrecognized-form-masculine-plural":"frustrații","definite-error-unrecognized-form-feminine-neuter-plural":"frustratele"}},{"word":"frustrat","pos":"verb","definitions":["past participle of frustra"],"forms":{"participle-past":"of frustra"}},{"word":"frustrație","pos":"noun","definitions":["frustration"],"forms":{"plural":"frustrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"frustrație","accusative-definite-nominative-singular":"frustrația","accusative-indefinite-nominative-plural":"frustrații","accusative-definite-nominative-plural":"frustrațiile","dative-genitive-indefinite-singular":"frustrații","dative-definite-genitive-singular":"frustrației","dative-genitive-indefinite-plural":"frustrații","dative-definite-genitive-plural":"frustrațiilor","singular-vocative":"frustrație","plural-vocative":"frustrațiilor"}},{"word":"frustratoare","pos":"noun","definitions":["female equivalent of frustrator"],"forms":{"plural":"frustratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"frustratoare","accusative-definite-nominative-singular":"frustratoarea","accusative-indefinite-nominative-plural":"frustratoare","accusative-definite-nominative-plural":"frustratoarele","dative-genitive-indefinite-singular":"frustratoare","dative-definite-genitive-singular":"frustratoarei","dative-genitive-indefinite-plural":"frustratoare","dative-definite-genitive-plural":"frustratoarelor","singular-vocative":"frustratoare","plural-vocative":"frustratoarelor"}},{"word":"fruștuc","pos":"noun","definitions":["breakfast"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fruștuc","accusative-definite-nominative":"fruștucul","dative-genitive-indefinite":"fruștuc","dative-definite-genitive":"fruștucului","vocative":"fruștucule"}},{"word":"frutescent","pos":"adj","definitions":["frutescent"],"forms":{"feminine-singular":"frutescentă","masculine-plural":"frutescenți","feminine-neuter-plural":"frutescente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"frutescent","error-unrecognized-form-feminine-indefinite-singular":"frutescentă","error-unrecognized-form-indefinite-masculine-plural":"frutescenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"frutescente","definite-error-unrecognized-form-masculine-neuter-singular":"frutescentul","definite-error-unrecognized-form-feminine-singular":"frutescenta","definite-error-unrecognized-form-masculine-plural":"frutescenții","definite-error-unrecognized-form-feminine-neuter-plural":"frutescentele"}},{"word":"ft","pos":"adv","definitions":["abbreviation of foarte (“very, a lot”)"],"forms":{"alternative":"f"}},{"word":"ftalat","pos":"noun","definitions":["phthalate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ftalat","accusative-definite-nominative-singular":"ftalatul","accusative-indefinite-nominative-plural":"ftalati","accusative-definite-nominative-plural":"ftalatii","dative-genitive-indefinite-singular":"ftalat","dative-definite-genitive-singular":"ftalatului","dative-genitive-indefinite-plural":"ftalati","dative-definite-genitive-plural":"ftalatilor","singular-vocative":"ftalatule","plural-vocative":"ftalatilor"}},{"word":"ftaleină","pos":"noun","definitions":["phthalein"],"forms":{"plural":"ftaleine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ftaleină","accusative-definite-nominative-singular":"ftaleina","accusative-indefinite-nominative-plural":"ftaleine","accusative-definite-nominative-plural":"ftaleinele","dative-genitive-indefinite-singular":"ftaleine","dative-definite-genitive-singular":"ftaleinei","dative-genitive-indefinite-plural":"ftaleine","dative-definite-genitive-plural":"ftaleinelor","singular-vocative":"ftaleină","plural-vocative":"ftaleinelor"}},{"word":"ftalic","pos":"adj","definitions":["phthalic"],"forms":{"feminine-singular":"ftalică","masculine-plural":"ftalici","feminine-neuter-plural":"ftalice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ftalic","error-unrecognized-form-feminine-indefinite-singular":"ftalică","error-unrecognized-form-indefinite-masculine-plural":"ftalici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ftalice","definite-error-unrecognized-form-masculine-neuter-singular":"ftalicul","definite-error-unrecognized-form-feminine-singular":"ftalica","definite-error-unrecognized-form-masculine-plural":"ftalicii","definite-error-unrecognized-form-feminine-neuter-plural":"ftalicele"}},{"word":"ftiriază","pos":"noun","definitions":["phthiriasis"],"forms":{"plural":"ftiriaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ftiriază","accusative-definite-nominative-singular":"ftiriaza","accusative-indefinite-nominative-plural":"ftiriaze","accusative-definite-nominative-plural":"ftiriazele","dative-genitive-indefinite-singular":"ftiriaze","dative-definite-genitive-singular":"ftiriazei","dative-genitive-indefinite-plural":"ftiriaze","dative-definite-genitive-plural":"ftiriazelor","singular-vocative":"ftiriază","plural-vocative":"ftiriazelor"}},{"word":"ftizic","pos":"noun","definitions":["phthisic"],"forms":{"plural":"ftizici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ftizic","accusative-definite-nominative-singular":"ftizicul","accusative-indefinite-nominative-plural":"ftizici","accusative-definite-nominative-plural":"ftizicii","dative-genitive-indefinite-singular":"ftizic","dative-definite-genitive-singular":"ftizicului","dative-genitive-indefinite-plural":"ftizici","dative-definite-genitive-plural":"ftizicilor","singular-vocative":"ftizicule","plural-vocative":"ftizicilor"}},{"word":"ftizică","pos":"noun","definitions":["female equivalent of ftizic"],"forms":{"plural":"ftizice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ftizică","accusative-definite-nominative-singular":"ftizica","accusative-indefinite-nominative-plural":"ftizice","accusative-definite-nominative-plural":"ftizicele","dative-genitive-indefinite-singular":"ftizice","dative-definite-genitive-singular":"ftizicei","dative-genitive-indefinite-plural":"ftizice","dative-definite-genitive-plural":"ftizicelor","singular-vocative":"ftizică","plural-vocative":"ftizicelor"}},{"word":"ftizie","pos":"noun","definitions":["pulmonary tuberculosis"],"forms":{"plural":"ftizii"}},{"word":"ftiziolog","pos":"noun","definitions":["phthisiologist"],"forms":{"plural":"ftiziologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ftiziolog","accusative-definite-nominative-singular":"ftiziologul","accusative-indefinite-nominative-plural":"ftiziologi","accusative-definite-nominative-plural":"ftiziologii","dative-genitive-indefinite-singular":"ftiziolog","dative-definite-genitive-singular":"ftiziologului","dative-genitive-indefinite-plural":"ftiziologi","dative-definite-genitive-plural":"ftiziologilor","singular-vocative":"ftiziologule","plural-vocative":"ftiziologilor"}},{"word":"ftiziologă","pos":"noun","definitions":["female equivalent of ftiziolog"],"forms":{"plural":"ftiziologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ftiziologă","accusative-definite-nominative-singular":"ftiziologa","accusative-indefinite-nominative-plural":"ftiziologe","accusative-definite-nominative-plural":"ftiziologele","dative-genitive-indefinite-singular":"ftiziologe","dative-definite-genitive-singular":"ftiziologei","dative-genitive-indefinite-plural":"ftiziologe","dative-definite-genitive-plural":"ftiziologelor","singular-vocative":"ftiziologă","plural-vocative":"ftiziologelor"}},{"word":"ftiziologic","pos":"adj","definitions":["phthisiology"],"forms":{"feminine-singular":"ftiziologică","masculine-plural":"ftiziologici","feminine-neuter-plural":"ftiziologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ftiziologic","error-unrecognized-form-feminine-indefinite-singular":"ftiziologică","error-unrecognized-form-indefinite-masculine-plural":"ftiziologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ftiziologice","definite-error-unrecognized-form-masculine-neuter-singular":"ftiziologicul","definite-error-unrecognized-form-feminine-singular":"ftiziologica","definite-error-unrecognized-form-masculine-plural":"ftiziologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ftiziologicele"}},{"word":"ftiziologie","pos":"noun","definitions":["phthisiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ftiziologie","accusative-definite-nominative-singular":"ftiziologia","accusative-indefinite-nominative-plural":"ftiziologii","accusative-definite-nominative-plural":"ftiziologiile","dative-genitive-indefinite-singular":"ftiziologii","dative-definite-genitive-singular":"ftiziologiei","dative-genitive-indefinite-plural":"ftiziologii","dative-definite-genitive-plural":"ftiziologiilor","singular-vocative":"ftiziologie","plural-vocative":"ftiziologiilor"}},{"word":"ftizioterapie","pos":"noun","definitions":["phthisiotherapy"],"forms":{"plural":"ftizioterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ftizioterapie","accusative-definite-nominative-singular":"ftizioterapia","accusative-indefinite-nominative-plural":"ftizioterapii","accusative-definite-nominative-plural":"ftizioterapiile","dative-genitive-indefinite-singular":"ftizioterapii","dative-definite-genitive-singular":"ftizioterapiei","dative-genitive-indefinite-plural":"ftizioterapii","dative-definite-genitive-plural":"ftizioterapiilor","singular-vocative":"ftizioterapie","plural-vocative":"ftizioterapiilor"}},{"word":"fu","pos":"verb","definitions":["third-person singular simple perfect indicative of fi"],"pronunciation":"[fu]"},{"word":"fuck","pos":"intj","definitions":["fuck!"],"pronunciation":"/fak/"},{"word":"fucking","pos":"adj","definitions":["fucking"],"examples":[{"ro":"Îs prea frustrat cu acest fucking puzzle pe care încerc să-l rezolv că lucrez la el de ore întregi și nu mai reușesc!","en":"I'm too frustrated with this fucking puzzle I'm trying to solve, I've been working on it for hours and I just can't seem to figure it out!"}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fucking","error-unrecognized-form-feminine-indefinite-singular":"fucking","error-unrecognized-form-indefinite-masculine-plural":"fucking","error-unrecognized-form-feminine-indefinite-neuter-plural":"fucking","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"fucking","pos":"adv","definitions":["fucking"],"examples":[{"ro":"îi fucking obosit după o săptămână de muncă.","en":"He's fucking tired after a week of work."},{"ro":"A vrut să se fucking drogheze dar a fost prins și după pedepsit.","en":"He wanted to take fucking drugs but he got caught and later punished."}]},{"word":"fucoidă","pos":"noun","definitions":["fucoid (seaweed)"],"forms":{"plural":"fucoide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fucoidă","accusative-definite-nominative-singular":"fucoida","accusative-indefinite-nominative-plural":"fucoide","accusative-definite-nominative-plural":"fucoidele","dative-genitive-indefinite-singular":"fucoide","dative-definite-genitive-singular":"fucoidei","dative-genitive-indefinite-plural":"fucoide","dative-definite-genitive-plural":"fucoidelor","singular-vocative":"fucoidă","plural-vocative":"fucoidelor"}},{"word":"fucoxantină","pos":"noun","definitions":["fucoxanthin"],"forms":{"plural":"fucoxantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fucoxantină","accusative-definite-nominative-singular":"fucoxantina","accusative-indefinite-nominative-plural":"fucoxantine","accusative-definite-nominative-plural":"fucoxantinele","dative-genitive-indefinite-singular":"fucoxantine","dative-definite-genitive-singular":"fucoxantinei","dative-genitive-indefinite-plural":"fucoxantine","dative-definite-genitive-plural":"fucoxantinelor","singular-vocative":"fucoxantină","plural-vocative":"fucoxantinelor"}},{"word":"fucsia","pos":"adj","definitions":["alternative form of fucsie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fucsia","error-unrecognized-form-feminine-indefinite-singular":"fucsia","error-unrecognized-form-indefinite-masculine-plural":"fucsia","error-unrecognized-form-feminine-indefinite-neuter-plural":"fucsia","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"fucsie","pos":"noun","definitions":["fuchsia"],"forms":{"plural":"fucsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fucsie","accusative-definite-nominative-singular":"fucsia","accusative-indefinite-nominative-plural":"fucsii","accusative-definite-nominative-plural":"fucsiile","dative-genitive-indefinite-singular":"fucsii","dative-definite-genitive-singular":"fucsiei","dative-genitive-indefinite-plural":"fucsii","dative-definite-genitive-plural":"fucsiilor","singular-vocative":"fucsie","plural-vocative":"fucsiilor"}},{"word":"fucsină","pos":"noun","definitions":["fuchsin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fucsină","accusative-definite-nominative-singular":"fucsina","accusative-indefinite-nominative-plural":"fucsine","accusative-definite-nominative-plural":"fucsinele","dative-genitive-indefinite-singular":"fucsine","dative-definite-genitive-singular":"fucsinei","dative-genitive-indefinite-plural":"fucsine","dative-definite-genitive-plural":"fucsinelor","singular-vocative":"fucsină","plural-vocative":"fucsinelor"}},{"word":"fudul","pos":"adj","definitions":["proud, haughty, arrogant, conceited, smug"],"pronunciation":"/fuˈdul/","forms":{"feminine-singular":"fudulă","masculine-plural":"fuduli","feminine-neuter-plural":"fudule","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fudul","error-unrecognized-form-feminine-indefinite-singular":"fudulă","error-unrecognized-form-indefinite-masculine-plural":"fuduli","error-unrecognized-form-feminine-indefinite-neuter-plural":"fudule","definite-error-unrecognized-form-masculine-neuter-singular":"fudulul","definite-error-unrecognized-form-feminine-singular":"fudula","definite-error-unrecognized-form-masculine-plural":"fudulii","definite-error-unrecognized-form-feminine-neuter-plural":"fudulele"}},{"word":"Fudulache","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fudulache"}},{"word":"fudulaș","pos":"adj","definitions":["diminutive of fudul"],"forms":{"feminine-singular":"fudulașă","masculine-plural":"fudulași","feminine-neuter-plural":"fudulașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fudulaș","error-unrecognized-form-feminine-indefinite-singular":"fudulașă","error-unrecognized-form-indefinite-masculine-plural":"fudulași","error-unrecognized-form-feminine-indefinite-neuter-plural":"fudulașe","definite-error-unrecognized-form-masculine-neuter-singular":"fudulașul","definite-error-unrecognized-form-feminine-singular":"fudulașa","definite-error-unrecognized-form-masculine-plural":"fudulașii","definite-error-unrecognized-form-feminine-neuter-plural":"fudulașele"}},{"word":"fuduli","pos":"verb","definitions":["to boast, to be proud"],"forms":{"canonical":"a fuduli 4th conjugation","present-singular-third-person":"fudulește","participle-past":"fudulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fuduli","gerund":"fudulind","first-person-indicative-present-singular":"fudulesc","indicative-present-second-person-singular":"fudulești","indicative-present-singular-third-person":"fudulește","first-person-indicative-plural-present":"fudulim","indicative-plural-present-second-person":"fuduliți","indicative-plural-present-third-person":"fudulesc","first-person-imperfect-indicative-singular":"fuduleam","imperfect-indicative-second-person-singular":"fuduleai","imperfect-indicative-singular-third-person":"fudulea","first-person-imperfect-indicative-plural":"fuduleam","imperfect-indicative-plural-second-person":"fuduleați","imperfect-indicative-plural-third-person":"fuduleau","first-person-indicative-perfect-singular":"fudulii","indicative-perfect-second-person-singular":"fuduliși","indicative-perfect-singular-third-person":"fuduli","first-person-indicative-perfect-plural":"fudulirăm","indicative-perfect-plural-second-person":"fudulirăți","indicative-perfect-plural-third-person":"fuduliră","first-person-indicative-pluperfect-singular":"fudulisem","indicative-pluperfect-second-person-singular":"fuduliseși","indicative-pluperfect-singular-third-person":"fudulise","first-person-indicative-pluperfect-plural":"fuduliserăm","indicative-pluperfect-plural-second-person":"fuduliserăți","indicative-pluperfect-plural-third-person":"fuduliseră","first-person-present-singular-subjunctive":"să fudulesc","present-second-person-singular-subjunctive":"să fudulești","present-singular-subjunctive-third-person":"să fudulească","first-person-plural-present-subjunctive":"să fudulim","plural-present-second-person-subjunctive":"să fuduliți","plural-present-subjunctive-third-person":"să fudulească","imperative-second-person-singular":"fudulește","imperative-plural-second-person":"fuduliți","imperative-negative-second-person-singular":"nu fuduli","imperative-negative-plural-second-person":"nu fuduliți"}},{"word":"fudulie","pos":"noun","definitions":["swagger","animal testicles as food (in plural)"],"forms":{"plural":"fudulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fudulie","accusative-definite-nominative-singular":"fudulia","accusative-indefinite-nominative-plural":"fudulii","accusative-definite-nominative-plural":"fuduliile","dative-genitive-indefinite-singular":"fudulii","dative-definite-genitive-singular":"fuduliei","dative-genitive-indefinite-plural":"fudulii","dative-definite-genitive-plural":"fuduliilor","singular-vocative":"fudulie","plural-vocative":"fuduliilor"}},{"word":"fudulire","pos":"noun","definitions":["boasting"],"forms":{"plural":"fuduliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fudulire","accusative-definite-nominative-singular":"fudulirea","accusative-indefinite-nominative-plural":"fuduliri","accusative-definite-nominative-plural":"fudulirile","dative-genitive-indefinite-singular":"fuduliri","dative-definite-genitive-singular":"fudulirii","dative-genitive-indefinite-plural":"fuduliri","dative-definite-genitive-plural":"fudulirilor","singular-vocative":"fudulire","plural-vocative":"fudulirilor"}},{"word":"Fudulu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fudulu"}},{"word":"fufă","pos":"noun","definitions":["minnow","bimbo"],"forms":{"plural":"fufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fufă","accusative-definite-nominative-singular":"fufa","accusative-indefinite-nominative-plural":"fufe","accusative-definite-nominative-plural":"fufele","dative-genitive-indefinite-singular":"fufe","dative-definite-genitive-singular":"fufei","dative-genitive-indefinite-plural":"fufe","dative-definite-genitive-plural":"fufelor","singular-vocative":"fufă","plural-vocative":"fufelor"}},{"word":"Fufez","pos":"name","definitions":["a village in Halmășd, Sălaj County, Romania"],"gender":"m"},{"word":"Fufezan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fufezan"}},{"word":"fug","pos":"verb","definitions":["inflection of fugi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[fuɡ]"},{"word":"fuga","pos":"verb","definitions":["to banish, expel, drive away, chase off"],"forms":{"canonical":"a fuga 1st conjugation","present-singular-third-person":"fugă","participle-past":"fugat","subjunctive-third-person":"fuge","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fuga","gerund":"fugând","first-person-indicative-present-singular":"fug","indicative-present-second-person-singular":"fugi","indicative-present-singular-third-person":"fugă","first-person-indicative-plural-present":"fugăm","indicative-plural-present-second-person":"fugați","indicative-plural-present-third-person":"fugă","first-person-imperfect-indicative-singular":"fugam","imperfect-indicative-second-person-singular":"fugai","imperfect-indicative-singular-third-person":"fuga","first-person-imperfect-indicative-plural":"fugam","imperfect-indicative-plural-second-person":"fugați","imperfect-indicative-plural-third-person":"fugau","first-person-indicative-perfect-singular":"fugai","indicative-perfect-second-person-singular":"fugași","indicative-perfect-singular-third-person":"fugă","first-person-indicative-perfect-plural":"fugarăm","indicative-perfect-plural-second-person":"fugarăți","indicative-perfect-plural-third-person":"fugară","first-person-indicative-pluperfect-singular":"fugasem","indicative-pluperfect-second-person-singular":"fugaseși","indicative-pluperfect-singular-third-person":"fugase","first-person-indicative-pluperfect-plural":"fugaserăm","indicative-pluperfect-plural-second-person":"fugaserăți","indicative-pluperfect-plural-third-person":"fugaseră","first-person-present-singular-subjunctive":"să fug","present-second-person-singular-subjunctive":"să fugi","present-singular-subjunctive-third-person":"să fuge","first-person-plural-present-subjunctive":"să fugăm","plural-present-second-person-subjunctive":"să fugați","plural-present-subjunctive-third-person":"să fuge","imperative-second-person-singular":"fugă","imperative-plural-second-person":"fugați","imperative-negative-second-person-singular":"nu fuga","imperative-negative-plural-second-person":"nu fugați"}},{"word":"fugă","pos":"noun","definitions":["run (the act of running)","escape, flight"],"pronunciation":"[ˈfuɡə]","forms":{"plural":"fugi"}},{"word":"fugă","pos":"noun","definitions":["fugue"],"pronunciation":"[ˈfuɡə]","forms":{"plural":"fugi"}},{"word":"fugă","pos":"verb","definitions":["third-person singular/plural present subjunctive of fugi"],"pronunciation":"[ˈfuɡə]"},{"word":"fugace","pos":"adj","definitions":["fugacious"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugace","error-unrecognized-form-feminine-indefinite-singular":"fugace","error-unrecognized-form-indefinite-masculine-plural":"fugace","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugace","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"fugaci","pos":"adj","definitions":["swift-footed","fleeting, fugitive"],"pronunciation":"/fuˈɡat͡ʃʲ/","forms":{"feminine-singular":"fugace","masculine-plural":"fugaci","feminine-neuter-plural":"fugace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugaci","error-unrecognized-form-feminine-indefinite-singular":"fugace","error-unrecognized-form-indefinite-masculine-plural":"fugaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugace","definite-error-unrecognized-form-masculine-neuter-singular":"fugaciul","definite-error-unrecognized-form-feminine-singular":"fugacea","definite-error-unrecognized-form-masculine-plural":"fugacii","definite-error-unrecognized-form-feminine-neuter-plural":"fugacele"}},{"word":"fugaci","pos":"noun","definitions":["a horse","stint (bird)"],"pronunciation":"/fuˈɡat͡ʃʲ/","forms":{"plural":"fugaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fugaci","accusative-definite-nominative-singular":"fugaciul","accusative-indefinite-nominative-plural":"fugaci","accusative-definite-nominative-plural":"fugacii","dative-genitive-indefinite-singular":"fugaci","dative-definite-genitive-singular":"fugaciului","dative-genitive-indefinite-plural":"fugaci","dative-definite-genitive-plural":"fugacilor","singular-vocative":"fugaciule","plural-vocative":"fugacilor"}},{"word":"fugaci de țărm","pos":"noun","definitions":["dunlin (Calidris alpina)"],"forms":{"plural":"fugaci de țărm"}},{"word":"fugaci mare","pos":"noun","definitions":["red knot (Calidris canutus)"],"forms":{"plural":"fugaci mari"}},{"word":"fugaci mic","pos":"noun","definitions":["little stint (Calidris minuta)"],"forms":{"plural":"fugaci mici"}},{"word":"fugaci pătat","pos":"noun","definitions":["pectoral sandpiper (Calidris melanotos)"],"forms":{"plural":"fugaci pătați"}},{"word":"fugaci pitic","pos":"noun","definitions":["Temminck's stint (Calidris temminckii)"],"forms":{"plural":"fugaci pitici"}},{"word":"fugaci roșcat","pos":"noun","definitions":["curlew sandpiper (Calidris ferruginea)"],"forms":{"plural":"fugaci roșcați"}},{"word":"fugacitate","pos":"noun","definitions":["fugacity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"fugacitate","accusative-definite-nominative":"fugacitatea","dative-genitive-indefinite":"fugacități","dative-definite-genitive":"fugacității","vocative":"fugacitate"}},{"word":"fugar","pos":"noun","definitions":["fugitive, runaway"],"forms":{"plural":"fugari"}},{"word":"fugară","pos":"noun","definitions":["female equivalent of fugar"],"forms":{"plural":"fugare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fugară","accusative-definite-nominative-singular":"fugara","accusative-indefinite-nominative-plural":"fugare","accusative-definite-nominative-plural":"fugarele","dative-genitive-indefinite-singular":"fugare","dative-definite-genitive-singular":"fugarei","dative-genitive-indefinite-plural":"fugare","dative-definite-genitive-plural":"fugarelor","singular-vocative":"fugară","plural-vocative":"fugarelor"}},{"word":"fugăreală","pos":"noun","definitions":["a chase"],"forms":{"plural":"fugăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fugăreală","accusative-definite-nominative-singular":"fugăreala","accusative-indefinite-nominative-plural":"fugărele","accusative-definite-nominative-plural":"fugărelele","dative-genitive-indefinite-singular":"fugărele","dative-definite-genitive-singular":"fugărelei","dative-genitive-indefinite-plural":"fugărele","dative-definite-genitive-plural":"fugărelelor","singular-vocative":"fugăreală","plural-vocative":"fugărelelor"}},{"word":"fugareț","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"fugareață","masculine-plural":"fugareți","feminine-neuter-plural":"fugarețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugareț","error-unrecognized-form-feminine-indefinite-singular":"fugareață","error-unrecognized-form-indefinite-masculine-plural":"fugareți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugarețe","definite-error-unrecognized-form-masculine-neuter-singular":"fugarețul","definite-error-unrecognized-form-feminine-singular":"fugareața","definite-error-unrecognized-form-masculine-plural":"fugareții","definite-error-unrecognized-form-feminine-neuter-plural":"fugarețele"}},{"word":"fugări","pos":"verb","definitions":["to chase off, drive away","to chase, pursue"],"pronunciation":"/fu.ɡəˈri/","forms":{"canonical":"a fugări 4th conjugation","present-singular-third-person":"fugărește","participle-past":"fugărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fugări","gerund":"fugărind","first-person-indicative-present-singular":"fugăresc","indicative-present-second-person-singular":"fugărești","indicative-present-singular-third-person":"fugărește","first-person-indicative-plural-present":"fugărim","indicative-plural-present-second-person":"fugăriți","indicative-plural-present-third-person":"fugăresc","first-person-imperfect-indicative-singular":"fugăream","imperfect-indicative-second-person-singular":"fugăreai","imperfect-indicative-singular-third-person":"fugărea","first-person-imperfect-indicative-plural":"fugăream","imperfect-indicative-plural-second-person":"fugăreați","imperfect-indicative-plural-third-person":"fugăreau","first-person-indicative-perfect-singular":"fugării","indicative-perfect-second-person-singular":"fugăriși","indicative-perfect-singular-third-person":"fugări","first-person-indicative-perfect-plural":"fugărirăm","indicative-perfect-plural-second-person":"fugărirăți","indicative-perfect-plural-third-person":"fugăriră","first-person-indicative-pluperfect-singular":"fugărisem","indicative-pluperfect-second-person-singular":"fugăriseși","indicative-pluperfect-singular-third-person":"fugărise","first-person-indicative-pluperfect-plural":"fugăriserăm","indicative-pluperfect-plural-second-person":"fugăriserăți","indicative-pluperfect-plural-third-person":"fugăriseră","first-person-present-singular-subjunctive":"să fugăresc","present-second-person-singular-subjunctive":"să fugărești","present-singular-subjunctive-third-person":"să fugărească","first-person-plural-present-subjunctive":"să fugărim","plural-present-second-person-subjunctive":"să fugăriți","plural-present-subjunctive-third-person":"să fugărească","imperative-second-person-singular":"fugărește","imperative-plural-second-person":"fugăriți","imperative-negative-second-person-singular":"nu fugări","imperative-negative-plural-second-person":"nu fugăriți"}},{"word":"fugărire","pos":"noun","definitions":["a chase"],"forms":{"plural":"fugăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fugărire","accusative-definite-nominative-singular":"fugărirea","accusative-indefinite-nominative-plural":"fugăriri","accusative-definite-nominative-plural":"fugăririle","dative-genitive-indefinite-singular":"fugăriri","dative-definite-genitive-singular":"fugăririi","dative-genitive-indefinite-plural":"fugăriri","dative-definite-genitive-plural":"fugăririlor","singular-vocative":"fugărire","plural-vocative":"fugăririlor"}},{"word":"fugărit","pos":"adj","definitions":["chased"],"forms":{"feminine-singular":"fugărită","masculine-plural":"fugăriți","feminine-neuter-plural":"fugărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugărit","error-unrecognized-form-feminine-indefinite-singular":"fugărită","error-unrecognized-form-indefinite-masculine-plural":"fugăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugărite","definite-error-unrecognized-form-masculine-neuter-singular":"fugăritul","definite-error-unrecognized-form-feminine-singular":"fugărita","definite-error-unrecognized-form-masculine-plural":"fugăriții","definite-error-unrecognized-form-feminine-neuter-plural":"fugăritele"}},{"word":"fugărit","pos":"verb","definitions":["past participle of fugări"],"forms":{"participle-past":"of fugări"}},{"word":"fugarnic","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"fugarnică","masculine-plural":"fugarnici","feminine-neuter-plural":"fugarnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugarnic","error-unrecognized-form-feminine-indefinite-singular":"fugarnică","error-unrecognized-form-indefinite-masculine-plural":"fugarnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugarnice","definite-error-unrecognized-form-masculine-neuter-singular":"fugarnicul","definite-error-unrecognized-form-feminine-singular":"fugarnica","definite-error-unrecognized-form-masculine-plural":"fugarnicii","definite-error-unrecognized-form-feminine-neuter-plural":"fugarnicele"}},{"word":"Fugaru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fugaru"}},{"word":"fugaș","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"fugașă","masculine-plural":"fugași","feminine-neuter-plural":"fugașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugaș","error-unrecognized-form-feminine-indefinite-singular":"fugașă","error-unrecognized-form-indefinite-masculine-plural":"fugași","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugașe","definite-error-unrecognized-form-masculine-neuter-singular":"fugașul","definite-error-unrecognized-form-feminine-singular":"fugașa","definite-error-unrecognized-form-masculine-plural":"fugașii","definite-error-unrecognized-form-feminine-neuter-plural":"fugașele"}},{"word":"fugaș","pos":"noun","definitions":["fugitive, deserter"],"forms":{"plural":"fugași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fugaș","accusative-definite-nominative-singular":"fugașul","accusative-indefinite-nominative-plural":"fugași","accusative-definite-nominative-plural":"fugașii","dative-genitive-indefinite-singular":"fugaș","dative-definite-genitive-singular":"fugașului","dative-genitive-indefinite-plural":"fugași","dative-definite-genitive-plural":"fugașilor","singular-vocative":"fugașule","plural-vocative":"fugașilor"}},{"word":"fugasă","pos":"noun","definitions":["fougasse (land-mine)"],"forms":{"plural":"fugase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fugasă","accusative-definite-nominative-singular":"fugasa","accusative-indefinite-nominative-plural":"fugase","accusative-definite-nominative-plural":"fugasele","dative-genitive-indefinite-singular":"fugase","dative-definite-genitive-singular":"fugasei","dative-genitive-indefinite-plural":"fugase","dative-definite-genitive-plural":"fugaselor","singular-vocative":"fugasă","plural-vocative":"fugaselor"}},{"word":"fugato","pos":"noun","definitions":["fugato"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fugato","accusative-definite-nominative":"fugatoul","dative-genitive-indefinite":"fugato","dative-definite-genitive":"fugatoului","vocative":"fugatoule"}},{"word":"fugător","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"fugătoare","masculine-plural":"fugători","feminine-neuter-plural":"fugătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugător","error-unrecognized-form-feminine-indefinite-singular":"fugătoare","error-unrecognized-form-indefinite-masculine-plural":"fugători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fugătorul","definite-error-unrecognized-form-feminine-singular":"fugătoarea","definite-error-unrecognized-form-masculine-plural":"fugătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fugătoarele"}},{"word":"fugău","pos":"noun","definitions":["willow ptarmigan (Lagopus lagopus)"],"pronunciation":"/fuˈɡəw/","forms":{"plural":"fugăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fugău","accusative-definite-nominative-singular":"fugăul","accusative-indefinite-nominative-plural":"fugăi","accusative-definite-nominative-plural":"fugăii","dative-genitive-indefinite-singular":"fugău","dative-definite-genitive-singular":"fugăului","dative-genitive-indefinite-plural":"fugăi","dative-definite-genitive-plural":"fugăilor","singular-vocative":"fugăule","plural-vocative":"fugăilor"}},{"word":"fuge","pos":"verb","definitions":["third-person singular present indicative of fugi"],"pronunciation":"[ˈfud͡ʒe]"},{"word":"fuget","pos":"noun","definitions":["a run"],"forms":{"plural":"fugete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fuget","accusative-definite-nominative-singular":"fugetul","accusative-indefinite-nominative-plural":"fugete","accusative-definite-nominative-plural":"fugetele","dative-genitive-indefinite-singular":"fuget","dative-definite-genitive-singular":"fugetului","dative-genitive-indefinite-plural":"fugete","dative-definite-genitive-plural":"fugetelor","singular-vocative":"fugetule","plural-vocative":"fugetelor"}},{"word":"fughetă","pos":"noun","definitions":["fughetta"],"forms":{"plural":"fughete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fughetă","accusative-definite-nominative-singular":"fugheta","accusative-indefinite-nominative-plural":"fughete","accusative-definite-nominative-plural":"fughetele","dative-genitive-indefinite-singular":"fughete","dative-definite-genitive-singular":"fughetei","dative-genitive-indefinite-plural":"fughete","dative-definite-genitive-plural":"fughetelor","singular-vocative":"fughetă","plural-vocative":"fughetelor"}},{"word":"fugi","pos":"verb","definitions":["to run","to flee, run away, escape"],"pronunciation":"/fuˈd͡ʒi/","forms":{"canonical":"a fugi 4th conjugation","present-singular-third-person":"fuge","participle-past":"fugit","subjunctive-third-person":"fugă","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a fugi","gerund":"fugind","first-person-indicative-present-singular":"fug","indicative-present-second-person-singular":"fugi","indicative-present-singular-third-person":"fuge","first-person-indicative-plural-present":"fugim","indicative-plural-present-second-person":"fugiți","indicative-plural-present-third-person":"fug","first-person-imperfect-indicative-singular":"fugeam","imperfect-indicative-second-person-singular":"fugeai","imperfect-indicative-singular-third-person":"fugea","first-person-imperfect-indicative-plural":"fugeam","imperfect-indicative-plural-second-person":"fugeați","imperfect-indicative-plural-third-person":"fugeau","first-person-indicative-perfect-singular":"fugii","indicative-perfect-second-person-singular":"fugiși","indicative-perfect-singular-third-person":"fugi","first-person-indicative-perfect-plural":"fugirăm","indicative-perfect-plural-second-person":"fugirăți","indicative-perfect-plural-third-person":"fugiră","first-person-indicative-pluperfect-singular":"fugisem","indicative-pluperfect-second-person-singular":"fugiseși","indicative-pluperfect-singular-third-person":"fugise","first-person-indicative-pluperfect-plural":"fugiserăm","indicative-pluperfect-plural-second-person":"fugiserăți","indicative-pluperfect-plural-third-person":"fugiseră","first-person-present-singular-subjunctive":"să fug","present-second-person-singular-subjunctive":"să fugi","present-singular-subjunctive-third-person":"să fugă","first-person-plural-present-subjunctive":"să fugim","plural-present-second-person-subjunctive":"să fugiți","plural-present-subjunctive-third-person":"să fugă","imperative-second-person-singular":"fugi","imperative-plural-second-person":"fugiți","imperative-negative-second-person-singular":"nu fugi","imperative-negative-plural-second-person":"nu fugiți"}},{"word":"fugi ca dracul de tămâie","pos":"verb","definitions":["running like hell"],"forms":{"canonical":"a fugi ca dracul de tămâie 4th conjugation","present-singular-third-person":"fuge ca dracul de tămâie","participle-past":"fugit ca dracul de tămâie"}},{"word":"fugii","pos":"verb","definitions":["first-person singular simple perfect indicative of fugi"],"pronunciation":"[fuˈd͡ʒiː]"},{"word":"fugim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of fugi"],"pronunciation":"[fuˈd͡ʒim]"},{"word":"fugire","pos":"noun","definitions":["a run"],"forms":{"plural":"fugiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fugire","accusative-definite-nominative-singular":"fugirea","accusative-indefinite-nominative-plural":"fugiri","accusative-definite-nominative-plural":"fugirile","dative-genitive-indefinite-singular":"fugiri","dative-definite-genitive-singular":"fugirii","dative-genitive-indefinite-plural":"fugiri","dative-definite-genitive-plural":"fugirilor","singular-vocative":"fugire","plural-vocative":"fugirilor"}},{"word":"fugit","pos":"adj","definitions":["fleeing"],"pronunciation":"/fu.ˈd͡ʒit/","forms":{"feminine-singular":"fugită","masculine-plural":"fugiți","feminine-neuter-plural":"fugite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugit","error-unrecognized-form-feminine-indefinite-singular":"fugită","error-unrecognized-form-indefinite-masculine-plural":"fugiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugite","definite-error-unrecognized-form-masculine-neuter-singular":"fugitul","definite-error-unrecognized-form-feminine-singular":"fugita","definite-error-unrecognized-form-masculine-plural":"fugiții","definite-error-unrecognized-form-feminine-neuter-plural":"fugitele"}},{"word":"fugit","pos":"verb","definitions":["past participle of fugi"],"pronunciation":"/fu.ˈd͡ʒit/","forms":{"participle-past":"of fugi"}},{"word":"fugitiv","pos":"adj","definitions":["fugitive"],"forms":{"feminine-singular":"fugitivă","masculine-plural":"fugitivi","feminine-neuter-plural":"fugitive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugitiv","error-unrecognized-form-feminine-indefinite-singular":"fugitivă","error-unrecognized-form-indefinite-masculine-plural":"fugitivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugitive","definite-error-unrecognized-form-masculine-neuter-singular":"fugitivul","definite-error-unrecognized-form-feminine-singular":"fugitiva","definite-error-unrecognized-form-masculine-plural":"fugitivii","definite-error-unrecognized-form-feminine-neuter-plural":"fugitivele"}},{"word":"fuglu","pos":"noun","definitions":["prisoner"],"forms":{"plural":"fugli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuglu","accusative-definite-nominative-singular":"fugluul","accusative-indefinite-nominative-plural":"fugli","accusative-definite-nominative-plural":"fuglii","dative-genitive-indefinite-singular":"fuglu","dative-definite-genitive-singular":"fugluului","dative-genitive-indefinite-plural":"fugli","dative-definite-genitive-plural":"fuglilor","singular-vocative":"fugluule","plural-vocative":"fuglilor"}},{"word":"fugos","pos":"adj","definitions":["spirited, lively"],"forms":{"feminine-singular":"fugoasă","masculine-plural":"fugoși","feminine-neuter-plural":"fugoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fugos","error-unrecognized-form-feminine-indefinite-singular":"fugoasă","error-unrecognized-form-indefinite-masculine-plural":"fugoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fugoase","definite-error-unrecognized-form-masculine-neuter-singular":"fugosul","definite-error-unrecognized-form-feminine-singular":"fugoasa","definite-error-unrecognized-form-masculine-plural":"fugoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fugoasele"}},{"word":"fugozitate","pos":"noun","definitions":["impetuosity"],"forms":{"plural":"fugozitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fugozitate","accusative-definite-nominative-singular":"fugozitatea","accusative-indefinite-nominative-plural":"fugozitatăți","accusative-definite-nominative-plural":"fugozitatățile","dative-genitive-indefinite-singular":"fugozitatăți","dative-definite-genitive-singular":"fugozitatății","dative-genitive-indefinite-plural":"fugozitatăți","dative-definite-genitive-plural":"fugozitatăților","singular-vocative":"fugozitate","plural-vocative":"fugozitatăților"}},{"word":"fuguliță","pos":"noun","definitions":["diminutive of fugă"],"forms":{"plural":"fugulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fuguliță","accusative-definite-nominative-singular":"fugulița","accusative-indefinite-nominative-plural":"fugulițe","accusative-definite-nominative-plural":"fugulițele","dative-genitive-indefinite-singular":"fugulițe","dative-definite-genitive-singular":"fuguliței","dative-genitive-indefinite-plural":"fugulițe","dative-definite-genitive-plural":"fugulițelor","singular-vocative":"fuguliță","plural-vocative":"fugulițelor"}},{"word":"fugușoară","pos":"noun","definitions":["diminutive of fugă"],"forms":{"plural":"fugușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fugușoară","accusative-definite-nominative-singular":"fugușoara","accusative-indefinite-nominative-plural":"fugușoare","accusative-definite-nominative-plural":"fugușoarele","dative-genitive-indefinite-singular":"fugușoare","dative-definite-genitive-singular":"fugușoarei","dative-genitive-indefinite-plural":"fugușoare","dative-definite-genitive-plural":"fugușoarelor","singular-vocative":"fugușoară","plural-vocative":"fugușoarelor"}},{"word":"fuguță","pos":"noun","definitions":["diminutive of fugă; small run"],"forms":{"plural":"fuguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fuguță","accusative-definite-nominative-singular":"fuguța","accusative-indefinite-nominative-plural":"fuguțe","accusative-definite-nominative-plural":"fuguțele","dative-genitive-indefinite-singular":"fuguțe","dative-definite-genitive-singular":"fuguței","dative-genitive-indefinite-plural":"fuguțe","dative-definite-genitive-plural":"fuguțelor","singular-vocative":"fuguță","plural-vocative":"fuguțelor"}},{"word":"führer","pos":"noun","definitions":["führer"],"forms":{"plural":"führeri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"führer","accusative-definite-nominative-singular":"führerul","accusative-indefinite-nominative-plural":"führeri","accusative-definite-nominative-plural":"führerii","dative-genitive-indefinite-singular":"führer","dative-definite-genitive-singular":"führerului","dative-genitive-indefinite-plural":"führeri","dative-definite-genitive-plural":"führerilor","singular-vocative":"führerule","plural-vocative":"führerilor"}},{"word":"fui","pos":"verb","definitions":["first-person singular simple perfect indicative of fi"],"pronunciation":"/fuj/","forms":{"alternative":"фуй"}},{"word":"fuiag","pos":"noun","definitions":["adobe"],"forms":{"plural":"fuiagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuiag","accusative-definite-nominative-singular":"fuiagul","accusative-indefinite-nominative-plural":"fuiagi","accusative-definite-nominative-plural":"fuiagii","dative-genitive-indefinite-singular":"fuiag","dative-definite-genitive-singular":"fuiagului","dative-genitive-indefinite-plural":"fuiagi","dative-definite-genitive-plural":"fuiagilor","singular-vocative":"fuiagule","plural-vocative":"fuiagilor"}},{"word":"fuicaș","pos":"noun","definitions":["a frisky person"],"forms":{"plural":"fuicași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuicaș","accusative-definite-nominative-singular":"fuicașul","accusative-indefinite-nominative-plural":"fuicași","accusative-definite-nominative-plural":"fuicașii","dative-genitive-indefinite-singular":"fuicaș","dative-definite-genitive-singular":"fuicașului","dative-genitive-indefinite-plural":"fuicași","dative-definite-genitive-plural":"fuicașilor","singular-vocative":"fuicașule","plural-vocative":"fuicașilor"}},{"word":"fuior","pos":"noun","definitions":["hemp or flax bundle","tow (untwisted bundle of fibers)"],"forms":{"plural":"fuioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fuior","accusative-definite-nominative-singular":"fuiorul","accusative-indefinite-nominative-plural":"fuioare","accusative-definite-nominative-plural":"fuioarele","dative-genitive-indefinite-singular":"fuior","dative-definite-genitive-singular":"fuiorului","dative-genitive-indefinite-plural":"fuioare","dative-definite-genitive-plural":"fuioarelor","singular-vocative":"fuiorule","plural-vocative":"fuioarelor","alternative":"fuioară"}},{"word":"fuioraș","pos":"noun","definitions":["diminutive of fuior; small tow"],"forms":{"plural":"fuiorașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fuioraș","accusative-definite-nominative-singular":"fuiorașul","accusative-indefinite-nominative-plural":"fuiorașe","accusative-definite-nominative-plural":"fuiorașele","dative-genitive-indefinite-singular":"fuioraș","dative-definite-genitive-singular":"fuiorașului","dative-genitive-indefinite-plural":"fuiorașe","dative-definite-genitive-plural":"fuiorașelor","singular-vocative":"fuiorașule","plural-vocative":"fuiorașelor"}},{"word":"ful","pos":"noun","definitions":["full house"],"forms":{"plural":"fuluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ful","accusative-definite-nominative-singular":"fulul","accusative-indefinite-nominative-plural":"fuluri","accusative-definite-nominative-plural":"fulurile","dative-genitive-indefinite-singular":"ful","dative-definite-genitive-singular":"fulului","dative-genitive-indefinite-plural":"fuluri","dative-definite-genitive-plural":"fulurilor","singular-vocative":"fulule","plural-vocative":"fulurilor"}},{"word":"fular","pos":"noun","definitions":["foulard","scarf, muffler, comforter"],"forms":{"plural":"fulare"}},{"word":"fulg","pos":"noun","definitions":["feather","flake (of snow)"],"pronunciation":"/fulɡ/","forms":{"plural":"fulgi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fulg","accusative-definite-nominative-singular":"fulgul","accusative-indefinite-nominative-plural":"fulgi","accusative-definite-nominative-plural":"fulgii","dative-genitive-indefinite-singular":"fulg","dative-definite-genitive-singular":"fulgului","dative-genitive-indefinite-plural":"fulgi","dative-definite-genitive-plural":"fulgilor","singular-vocative":"fulgule","plural-vocative":"fulgilor"}},{"word":"fulg de nea","pos":"noun","definitions":["snowflake"],"forms":{"plural":"fulgi de nea"}},{"word":"fulg de zăpadă","pos":"noun","definitions":["snowflake"],"forms":{"plural":"fulgi de zăpadă"}},{"word":"Fulga","pos":"name","definitions":["a village in Cernătești, Buzău County, Romania","a commune of Prahova County, Romania"],"gender":"f"},{"word":"Fulga de Jos","pos":"name","definitions":["a village in Fulga, Prahova County, Romania"],"gender":"f"},{"word":"Fulga de Sus","pos":"name","definitions":["a village in Fulga, Prahova County, Romania"],"gender":"f"},{"word":"Fulgeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fulgeanu"}},{"word":"Fulger","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fulger"}},{"word":"fulger","pos":"noun","definitions":["lightning (flash of light)"],"forms":{"plural":"fulgere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fulger","accusative-definite-nominative-singular":"fulgerul","accusative-indefinite-nominative-plural":"fulgere","accusative-definite-nominative-plural":"fulgerele","dative-genitive-indefinite-singular":"fulger","dative-definite-genitive-singular":"fulgerului","dative-genitive-indefinite-plural":"fulgere","dative-definite-genitive-plural":"fulgerelor","singular-vocative":"fulgerule","plural-vocative":"fulgerelor"}},{"word":"fulger","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fulgera"]},{"word":"fulger globular","pos":"noun","definitions":["ball lightning"],"forms":{"plural":"fulgere globulare"}},{"word":"fulgera","pos":"verb","definitions":["to strike","to thunder","to flash, sparkle, gleam, lighten","to fulminate","to dumbfound"],"forms":{"canonical":"a fulgera 1st conjugation","present-singular-third-person":"fulgeră","participle-past":"fulgerat","subjunctive-third-person":"fulgere","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fulgera","gerund":"fulgerând","first-person-indicative-present-singular":"fulger","indicative-present-second-person-singular":"fulgeri","indicative-present-singular-third-person":"fulgeră","first-person-indicative-plural-present":"fulgerăm","indicative-plural-present-second-person":"fulgerați","indicative-plural-present-third-person":"fulgeră","first-person-imperfect-indicative-singular":"fulgeram","imperfect-indicative-second-person-singular":"fulgerai","imperfect-indicative-singular-third-person":"fulgera","first-person-imperfect-indicative-plural":"fulgeram","imperfect-indicative-plural-second-person":"fulgerați","imperfect-indicative-plural-third-person":"fulgerau","first-person-indicative-perfect-singular":"fulgerai","indicative-perfect-second-person-singular":"fulgerași","indicative-perfect-singular-third-person":"fulgeră","first-person-indicative-perfect-plural":"fulgerarăm","indicative-perfect-plural-second-person":"fulgerarăți","indicative-perfect-plural-third-person":"fulgerară","first-person-indicative-pluperfect-singular":"fulgerasem","indicative-pluperfect-second-person-singular":"fulgeraseși","indicative-pluperfect-singular-third-person":"fulgerase","first-person-indicative-pluperfect-plural":"fulgeraserăm","indicative-pluperfect-plural-second-person":"fulgeraserăți","indicative-pluperfect-plural-third-person":"fulgeraseră","first-person-present-singular-subjunctive":"să fulger","present-second-person-singular-subjunctive":"să fulgeri","present-singular-subjunctive-third-person":"să fulgere","first-person-plural-present-subjunctive":"să fulgerăm","plural-present-second-person-subjunctive":"să fulgerați","plural-present-subjunctive-third-person":"să fulgere","imperative-second-person-singular":"fulgeră","imperative-plural-second-person":"fulgerați","imperative-negative-second-person-singular":"nu fulgera","imperative-negative-plural-second-person":"nu fulgerați"}},{"word":"fulgerai","pos":"verb","definitions":["inflection of fulgera:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fuld͡ʒeˈraj]"},{"word":"fulgerare","pos":"noun","definitions":["flash"],"forms":{"plural":"fulgerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fulgerare","accusative-definite-nominative-singular":"fulgerarea","accusative-indefinite-nominative-plural":"fulgerări","accusative-definite-nominative-plural":"fulgerările","dative-genitive-indefinite-singular":"fulgerări","dative-definite-genitive-singular":"fulgerării","dative-genitive-indefinite-plural":"fulgerări","dative-definite-genitive-plural":"fulgerărilor","singular-vocative":"fulgerare","plural-vocative":"fulgerărilor"}},{"word":"fulgerat","pos":"adj","definitions":["flashed","hit by lighting"],"forms":{"feminine-singular":"fulgerată","masculine-plural":"fulgerați","feminine-neuter-plural":"fulgerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fulgerat","error-unrecognized-form-feminine-indefinite-singular":"fulgerată","error-unrecognized-form-indefinite-masculine-plural":"fulgerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fulgerate","definite-error-unrecognized-form-masculine-neuter-singular":"fulgeratul","definite-error-unrecognized-form-feminine-singular":"fulgerata","definite-error-unrecognized-form-masculine-plural":"fulgerații","definite-error-unrecognized-form-feminine-neuter-plural":"fulgeratele"}},{"word":"fulgerător","pos":"adj","definitions":["instantaneous, with lightning speed"],"pronunciation":"/ˌful.d͡ʒe.rəˈtor/","forms":{"feminine-singular":"fulgerătoare","masculine-plural":"fulgerători","feminine-neuter-plural":"fulgerătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fulgerător","error-unrecognized-form-feminine-indefinite-singular":"fulgerătoare","error-unrecognized-form-indefinite-masculine-plural":"fulgerători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fulgerătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fulgerătorul","definite-error-unrecognized-form-feminine-singular":"fulgerătoarea","definite-error-unrecognized-form-masculine-plural":"fulgerătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fulgerătoarele"}},{"word":"fulgerătură","pos":"noun","definitions":["lightning"],"forms":{"plural":"fulgerături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fulgerătură","accusative-definite-nominative-singular":"fulgerătura","accusative-indefinite-nominative-plural":"fulgerături","accusative-definite-nominative-plural":"fulgerăturile","dative-genitive-indefinite-singular":"fulgerături","dative-definite-genitive-singular":"fulgerăturii","dative-genitive-indefinite-plural":"fulgerături","dative-definite-genitive-plural":"fulgerăturilor","singular-vocative":"fulgerătură","plural-vocative":"fulgerăturilor"}},{"word":"fulgere","pos":"verb","definitions":["third-person singular/plural present subjunctive of fulgera"],"pronunciation":"[ˈfuld͡ʒere]"},{"word":"fulgerel","pos":"noun","definitions":["diminutive of fulger"],"forms":{"plural":"fulgerei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fulgerel","accusative-definite-nominative-singular":"fulgerelul","accusative-indefinite-nominative-plural":"fulgerei","accusative-definite-nominative-plural":"fulgereii","dative-genitive-indefinite-singular":"fulgerel","dative-definite-genitive-singular":"fulgerelului","dative-genitive-indefinite-plural":"fulgerei","dative-definite-genitive-plural":"fulgereilor","singular-vocative":"fulgerelule","plural-vocative":"fulgereilor"}},{"word":"fulgerește","pos":"adv","definitions":["like a flash"]},{"word":"Fulgeriș","pos":"name","definitions":["a village in Pâncești, Bacău County, Romania"],"gender":"m"},{"word":"Fulgescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Fulgescu"}}];
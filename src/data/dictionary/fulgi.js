@@ -0,0 +1 @@
+export default [{"word":"fulgi","pos":"noun","definitions":["indefinite plural of fulg"],"pronunciation":"[fuld͡ʒʲ]","gender":"m"},{"word":"Fulgu","pos":"name","definitions":["a village in Puiești, Vaslui County, Romania"],"gender":"m"},{"word":"fulgui","pos":"verb","definitions":["to snow lightly"],"pronunciation":"/ful.ɡuˈi/","forms":{"canonical":"a fulgui 4th conjugation","present-singular-third-person":"fulguiește","participle-past":"fulguit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fulgui","gerund":"fulguind","first-person-indicative-present-singular":"-","indicative-present-second-person-singular":"-","indicative-present-singular-third-person":"fulguiește","first-person-indicative-plural-present":"-","indicative-plural-present-second-person":"-","indicative-plural-present-third-person":"-","first-person-imperfect-indicative-singular":"-","imperfect-indicative-second-person-singular":"-","imperfect-indicative-singular-third-person":"fulguia","first-person-imperfect-indicative-plural":"-","imperfect-indicative-plural-second-person":"-","imperfect-indicative-plural-third-person":"-","first-person-indicative-perfect-singular":"-","indicative-perfect-second-person-singular":"-","indicative-perfect-singular-third-person":"fulgui","first-person-indicative-perfect-plural":"-","indicative-perfect-plural-second-person":"-","indicative-perfect-plural-third-person":"-","first-person-indicative-pluperfect-singular":"-","indicative-pluperfect-second-person-singular":"-","indicative-pluperfect-singular-third-person":"fulguise","first-person-indicative-pluperfect-plural":"-","indicative-pluperfect-plural-second-person":"-","indicative-pluperfect-plural-third-person":"-","first-person-present-singular-subjunctive":"-","present-second-person-singular-subjunctive":"-","present-singular-subjunctive-third-person":"să fulguiască","first-person-plural-present-subjunctive":"-","plural-present-second-person-subjunctive":"-","plural-present-subjunctive-third-person":"-","imperative-second-person-singular":"-","imperative-plural-second-person":"-","imperative-negative-second-person-singular":"-","imperative-negative-plural-second-person":"-"}},{"word":"fulguială","pos":"noun","definitions":["light snow"],"forms":{"plural":"fulguieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fulguială","accusative-definite-nominative-singular":"fulguiala","accusative-indefinite-nominative-plural":"fulguieli","accusative-definite-nominative-plural":"fulguielile","dative-genitive-indefinite-singular":"fulguieli","dative-definite-genitive-singular":"fulguielii","dative-genitive-indefinite-plural":"fulguieli","dative-definite-genitive-plural":"fulguielilor","singular-vocative":"fulguială","plural-vocative":"fulguielilor"}},{"word":"fulguire","pos":"noun","definitions":["snowing"],"forms":{"plural":"fulguiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fulguire","accusative-definite-nominative-singular":"fulguirea","accusative-indefinite-nominative-plural":"fulguiri","accusative-definite-nominative-plural":"fulguirile","dative-genitive-indefinite-singular":"fulguiri","dative-definite-genitive-singular":"fulguirii","dative-genitive-indefinite-plural":"fulguiri","dative-definite-genitive-plural":"fulguirilor","singular-vocative":"fulguire","plural-vocative":"fulguirilor"}},{"word":"fulguit","pos":"noun","definitions":["light snow"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fulguit","accusative-definite-nominative":"fulguitul","dative-genitive-indefinite":"fulguit","dative-definite-genitive":"fulguitului","vocative":"fulguitule"}},{"word":"fulguit","pos":"verb","definitions":["past participle of fulgui"],"forms":{"participle-past":"of fulgui"}},{"word":"fulguitură","pos":"noun","definitions":["light snow"],"forms":{"plural":"fulguituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fulguitură","accusative-definite-nominative-singular":"fulguitura","accusative-indefinite-nominative-plural":"fulguituri","accusative-definite-nominative-plural":"fulguiturile","dative-genitive-indefinite-singular":"fulguituri","dative-definite-genitive-singular":"fulguiturii","dative-genitive-indefinite-plural":"fulguituri","dative-definite-genitive-plural":"fulguiturilor","singular-vocative":"fulguitură","plural-vocative":"fulguiturilor"}},{"word":"fulgul","pos":"noun","definitions":["definite nominative/accusative singular of fulg"]},{"word":"Fulguleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Fulguleț"}},{"word":"fulguleț","pos":"noun","definitions":["diminutive of fulg; small snowflake"],"forms":{"plural":"fulguleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fulguleț","accusative-definite-nominative-singular":"fulgulețul","accusative-indefinite-nominative-plural":"fulguleți","accusative-definite-nominative-plural":"fulguleții","dative-genitive-indefinite-singular":"fulguleț","dative-definite-genitive-singular":"fulgulețului","dative-genitive-indefinite-plural":"fulguleți","dative-definite-genitive-plural":"fulguleților","singular-vocative":"fulgulețule","plural-vocative":"fulguleților"}},{"word":"fulgura","pos":"verb","definitions":["to fulgurate"],"forms":{"canonical":"a fulgura 1st conjugation","present-singular-third-person":"fulgurează","participle-past":"fulgurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fulgura","gerund":"fulgurând","first-person-indicative-present-singular":"fulgurez","indicative-present-second-person-singular":"fulgurezi","indicative-present-singular-third-person":"fulgurează","first-person-indicative-plural-present":"fulgurăm","indicative-plural-present-second-person":"fulgurați","indicative-plural-present-third-person":"fulgurează","first-person-imperfect-indicative-singular":"fulguram","imperfect-indicative-second-person-singular":"fulgurai","imperfect-indicative-singular-third-person":"fulgura","first-person-imperfect-indicative-plural":"fulguram","imperfect-indicative-plural-second-person":"fulgurați","imperfect-indicative-plural-third-person":"fulgurau","first-person-indicative-perfect-singular":"fulgurai","indicative-perfect-second-person-singular":"fulgurași","indicative-perfect-singular-third-person":"fulgură","first-person-indicative-perfect-plural":"fulgurarăm","indicative-perfect-plural-second-person":"fulgurarăți","indicative-perfect-plural-third-person":"fulgurară","first-person-indicative-pluperfect-singular":"fulgurasem","indicative-pluperfect-second-person-singular":"fulguraseși","indicative-pluperfect-singular-third-person":"fulgurase","first-person-indicative-pluperfect-plural":"fulguraserăm","indicative-pluperfect-plural-second-person":"fulguraserăți","indicative-pluperfect-plural-third-person":"fulguraseră","first-person-present-singular-subjunctive":"să fulgurez","present-second-person-singular-subjunctive":"să fulgurezi","present-singular-subjunctive-third-person":"să fulgureze","first-person-plural-present-subjunctive":"să fulgurăm","plural-present-second-person-subjunctive":"să fulgurați","plural-present-subjunctive-third-person":"să fulgureze","imperative-second-person-singular":"fulgurează","imperative-plural-second-person":"fulgurați","imperative-negative-second-person-singular":"nu fulgura","imperative-negative-plural-second-person":"nu fulgurați"}},{"word":"fulgurant","pos":"adj","definitions":["fulgurant"],"forms":{"feminine-singular":"fulgurantă","masculine-plural":"fulguranți","feminine-neuter-plural":"fulgurante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fulgurant","error-unrecognized-form-feminine-indefinite-singular":"fulgurantă","error-unrecognized-form-indefinite-masculine-plural":"fulguranți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fulgurante","definite-error-unrecognized-form-masculine-neuter-singular":"fulgurantul","definite-error-unrecognized-form-feminine-singular":"fulguranta","definite-error-unrecognized-form-masculine-plural":"fulguranții","definite-error-unrecognized-form-feminine-neuter-plural":"fulgurantele"}},{"word":"fulgurație","pos":"noun","definitions":["fulguration"],"forms":{"plural":"fulgurații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fulgurație","accusative-definite-nominative-singular":"fulgurația","accusative-indefinite-nominative-plural":"fulgurații","accusative-definite-nominative-plural":"fulgurațiile","dative-genitive-indefinite-singular":"fulgurații","dative-definite-genitive-singular":"fulgurației","dative-genitive-indefinite-plural":"fulgurații","dative-definite-genitive-plural":"fulgurațiilor","singular-vocative":"fulgurație","plural-vocative":"fulgurațiilor"}},{"word":"fulgurațiune","pos":"noun","definitions":["alternative form of fulgurație"],"forms":{"plural":"fulgurațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fulgurațiune","accusative-definite-nominative-singular":"fulgurațiunea","accusative-indefinite-nominative-plural":"fulgurațiuni","accusative-definite-nominative-plural":"fulgurațiunile","dative-genitive-indefinite-singular":"fulgurațiuni","dative-definite-genitive-singular":"fulgurațiunii","dative-genitive-indefinite-plural":"fulgurațiuni","dative-definite-genitive-plural":"fulgurațiunilor","singular-vocative":"fulgurațiune","plural-vocative":"fulgurațiunilor"}},{"word":"fulgurit","pos":"noun","definitions":["fulgurite"],"forms":{"plural":"fulgurite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fulgurit","accusative-definite-nominative-singular":"fulguritul","accusative-indefinite-nominative-plural":"fulgurite","accusative-definite-nominative-plural":"fulguritele","dative-genitive-indefinite-singular":"fulgurit","dative-definite-genitive-singular":"fulguritului","dative-genitive-indefinite-plural":"fulgurite","dative-definite-genitive-plural":"fulguritelor","singular-vocative":"fulguritule","plural-vocative":"fulguritelor"}},{"word":"fulgușor","pos":"noun","definitions":["diminutive of fulg"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"fulgușor","accusative-definite-nominative":"fulgușorul","dative-genitive-indefinite":"fulgușor","dative-definite-genitive":"fulgușorului","vocative":"fulgușorule"}},{"word":"fulie","pos":"noun","definitions":["daffodil"],"forms":{"plural":"fulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fulie","accusative-definite-nominative-singular":"fulia","accusative-indefinite-nominative-plural":"fulii","accusative-definite-nominative-plural":"fuliile","dative-genitive-indefinite-singular":"fulii","dative-definite-genitive-singular":"fuliei","dative-genitive-indefinite-plural":"fulii","dative-definite-genitive-plural":"fuliilor","singular-vocative":"fulie","plural-vocative":"fuliilor"}},{"word":"full-time","pos":"adj","definitions":["full-time"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"full-time","error-unrecognized-form-feminine-indefinite-singular":"full-time","error-unrecognized-form-indefinite-masculine-plural":"full-time","error-unrecognized-form-feminine-indefinite-neuter-plural":"full-time","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"full-time","pos":"adv","definitions":["full-time"]},{"word":"fulmicoton","pos":"noun","definitions":["nitrocellulose"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fulmicoton","accusative-definite-nominative":"fulmicotonul","dative-genitive-indefinite":"fulmicoton","dative-definite-genitive":"fulmicotonului","vocative":"fulmicotonule"}},{"word":"fulminant","pos":"adj","definitions":["fulminant"],"forms":{"feminine-singular":"fulminantă","masculine-plural":"fulminanți","feminine-neuter-plural":"fulminante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fulminant","error-unrecognized-form-feminine-indefinite-singular":"fulminantă","error-unrecognized-form-indefinite-masculine-plural":"fulminanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fulminante","definite-error-unrecognized-form-masculine-neuter-singular":"fulminantul","definite-error-unrecognized-form-feminine-singular":"fulminanta","definite-error-unrecognized-form-masculine-plural":"fulminanții","definite-error-unrecognized-form-feminine-neuter-plural":"fulminantele"}},{"word":"fulminat","pos":"noun","definitions":["fulminate"],"forms":{"plural":"fulminați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fulminat","accusative-definite-nominative-singular":"fulminatul","accusative-indefinite-nominative-plural":"fulminați","accusative-definite-nominative-plural":"fulminații","dative-genitive-indefinite-singular":"fulminat","dative-definite-genitive-singular":"fulminatului","dative-genitive-indefinite-plural":"fulminați","dative-definite-genitive-plural":"fulminaților","singular-vocative":"fulminatule","plural-vocative":"fulminaților"}},{"word":"fulminație","pos":"noun","definitions":["fulmination"],"forms":{"plural":"fulminații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fulminație","accusative-definite-nominative-singular":"fulminația","accusative-indefinite-nominative-plural":"fulminații","accusative-definite-nominative-plural":"fulminațiile","dative-genitive-indefinite-singular":"fulminații","dative-definite-genitive-singular":"fulminației","dative-genitive-indefinite-plural":"fulminații","dative-definite-genitive-plural":"fulminațiilor","singular-vocative":"fulminație","plural-vocative":"fulminațiilor"}},{"word":"fulminațiune","pos":"noun","definitions":["obsolete form of fulminație"],"forms":{"plural":"fulminațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fulminațiune","accusative-definite-nominative-singular":"fulminațiunea","accusative-indefinite-nominative-plural":"fulminațiuni","accusative-definite-nominative-plural":"fulminațiunile","dative-genitive-indefinite-singular":"fulminațiuni","dative-definite-genitive-singular":"fulminațiunii","dative-genitive-indefinite-plural":"fulminațiuni","dative-definite-genitive-plural":"fulminațiunilor","singular-vocative":"fulminațiune","plural-vocative":"fulminațiunilor"}},{"word":"fulminic","pos":"adj","definitions":["fulminic"],"forms":{"feminine-singular":"fulminică","masculine-plural":"fulminici","feminine-neuter-plural":"fulminice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fulminic","error-unrecognized-form-feminine-indefinite-singular":"fulminică","error-unrecognized-form-indefinite-masculine-plural":"fulminici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fulminice","definite-error-unrecognized-form-masculine-neuter-singular":"fulminicul","definite-error-unrecognized-form-feminine-singular":"fulminica","definite-error-unrecognized-form-masculine-plural":"fulminicii","definite-error-unrecognized-form-feminine-neuter-plural":"fulminicele"}},{"word":"fultuială","pos":"noun","definitions":["alternative form of fuituială"],"forms":{"plural":"fultuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fultuială","accusative-definite-nominative-singular":"fultuiala","accusative-indefinite-nominative-plural":"fultuiele","accusative-definite-nominative-plural":"fultuielele","dative-genitive-indefinite-singular":"fultuiele","dative-definite-genitive-singular":"fultuielei","dative-genitive-indefinite-plural":"fultuiele","dative-definite-genitive-plural":"fultuielelor","singular-vocative":"fultuială","plural-vocative":"fultuielelor"}},{"word":"fultuitor","pos":"noun","definitions":["alternative form of fuituitor"],"forms":{"plural":"fultuitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fultuitor","accusative-definite-nominative-singular":"fultuitorul","accusative-indefinite-nominative-plural":"fultuitoare","accusative-definite-nominative-plural":"fultuitoarele","dative-genitive-indefinite-singular":"fultuitor","dative-definite-genitive-singular":"fultuitorului","dative-genitive-indefinite-plural":"fultuitoare","dative-definite-genitive-plural":"fultuitoarelor","singular-vocative":"fultuitorule","plural-vocative":"fultuitoarelor"}},{"word":"fum","pos":"noun","definitions":["smoke"],"forms":{"plural":"fumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fum","accusative-definite-nominative-singular":"fumul","accusative-indefinite-nominative-plural":"fumuri","accusative-definite-nominative-plural":"fumurile","dative-genitive-indefinite-singular":"fum","dative-definite-genitive-singular":"fumului","dative-genitive-indefinite-plural":"fumuri","dative-definite-genitive-plural":"fumurilor","singular-vocative":"fumule","plural-vocative":"fumurilor"}},{"word":"fuma","pos":"verb","definitions":["to smoke (a cigarette, a pipe, etc)","to (give off) smoke"],"pronunciation":"/fuˈma/","forms":{"canonical":"a fuma 1st conjugation","present-singular-third-person":"fumează","participle-past":"fumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fuma","gerund":"fumând","first-person-indicative-present-singular":"fumez","indicative-present-second-person-singular":"fumezi","indicative-present-singular-third-person":"fumează","first-person-indicative-plural-present":"fumăm","indicative-plural-present-second-person":"fumați","indicative-plural-present-third-person":"fumează","first-person-imperfect-indicative-singular":"fumam","imperfect-indicative-second-person-singular":"fumai","imperfect-indicative-singular-third-person":"fuma","first-person-imperfect-indicative-plural":"fumam","imperfect-indicative-plural-second-person":"fumați","imperfect-indicative-plural-third-person":"fumau","first-person-indicative-perfect-singular":"fumai","indicative-perfect-second-person-singular":"fumași","indicative-perfect-singular-third-person":"fumă","first-person-indicative-perfect-plural":"fumarăm","indicative-perfect-plural-second-person":"fumarăți","indicative-perfect-plural-third-person":"fumară","first-person-indicative-pluperfect-singular":"fumasem","indicative-pluperfect-second-person-singular":"fumaseși","indicative-pluperfect-singular-third-person":"fumase","first-person-indicative-pluperfect-plural":"fumaserăm","indicative-pluperfect-plural-second-person":"fumaserăți","indicative-pluperfect-plural-third-person":"fumaseră","first-person-present-singular-subjunctive":"să fumez","present-second-person-singular-subjunctive":"să fumezi","present-singular-subjunctive-third-person":"să fumeze","first-person-plural-present-subjunctive":"să fumăm","plural-present-second-person-subjunctive":"să fumați","plural-present-subjunctive-third-person":"să fumeze","imperative-second-person-singular":"fumează","imperative-plural-second-person":"fumați","imperative-negative-second-person-singular":"nu fuma","imperative-negative-plural-second-person":"nu fumați"}},{"word":"fumă","pos":"verb","definitions":["third-person singular simple perfect indicative of fuma"],"pronunciation":"[fuˈmə]"},{"word":"fumăgău","pos":"noun","definitions":["large quantity of smoke"],"forms":{"plural":"fumăgaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fumăgău","accusative-definite-nominative-singular":"fumăgăuul","accusative-indefinite-nominative-plural":"fumăgaie","accusative-definite-nominative-plural":"fumăgaiele","dative-genitive-indefinite-singular":"fumăgău","dative-definite-genitive-singular":"fumăgăuului","dative-genitive-indefinite-plural":"fumăgaie","dative-definite-genitive-plural":"fumăgaielor","singular-vocative":"fumăgăuule","plural-vocative":"fumăgaielor"}},{"word":"fumagină","pos":"noun","definitions":["fumagine"],"forms":{"plural":"fumagine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fumagină","accusative-definite-nominative-singular":"fumagina","accusative-indefinite-nominative-plural":"fumagine","accusative-definite-nominative-plural":"fumaginele","dative-genitive-indefinite-singular":"fumagine","dative-definite-genitive-singular":"fumaginei","dative-genitive-indefinite-plural":"fumagine","dative-definite-genitive-plural":"fumaginelor","singular-vocative":"fumagină","plural-vocative":"fumaginelor"}},{"word":"fumai","pos":"verb","definitions":["inflection of fuma:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fuˈmaj]"},{"word":"fumam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fuma"],"pronunciation":"[fuˈmam]"},{"word":"fumăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of fuma"],"pronunciation":"[fuˈməm]"},{"word":"fumând","pos":"verb","definitions":["gerund of fuma"],"pronunciation":"[fuˈmɨnd]"},{"word":"fumar","pos":"noun","definitions":["chimney"],"pronunciation":"/fuˈmar/","forms":{"plural":"fumare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fumar","accusative-definite-nominative-singular":"fumarul","accusative-indefinite-nominative-plural":"fumare","accusative-definite-nominative-plural":"fumarele","dative-genitive-indefinite-singular":"fumar","dative-definite-genitive-singular":"fumarului","dative-genitive-indefinite-plural":"fumare","dative-definite-genitive-plural":"fumarelor","singular-vocative":"fumarule","plural-vocative":"fumarelor"}},{"word":"fumară","pos":"verb","definitions":["third-person plural simple perfect indicative of fuma"],"pronunciation":"[fuˈmarə]"},{"word":"fumăraie","pos":"noun","definitions":["large quantity of smoke"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fumăraie","accusative-definite-nominative":"fumăraia","dative-genitive-indefinite":"fumăraii","dative-definite-genitive":"fumăraiei","vocative":"fumăraie"}},{"word":"fumarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of fuma"],"pronunciation":"[fuˈmarəm]"},{"word":"fumărar","pos":"noun","definitions":["tax collector who collected the tax on chimneys"],"forms":{"plural":"fumărari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fumărar","accusative-definite-nominative-singular":"fumărarul","accusative-indefinite-nominative-plural":"fumărari","accusative-definite-nominative-plural":"fumărarii","dative-genitive-indefinite-singular":"fumărar","dative-definite-genitive-singular":"fumărarului","dative-genitive-indefinite-plural":"fumărari","dative-definite-genitive-plural":"fumărarilor","singular-vocative":"fumărarule","plural-vocative":"fumărarilor"}},{"word":"fumarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of fuma"],"pronunciation":"[fuˈmarətsʲ]"},{"word":"fumare","pos":"noun","definitions":["indefinite plural of fumar"],"pronunciation":"[fuˈmare]","gender":"n"},{"word":"fumare","pos":"noun","definitions":["smoking"],"pronunciation":"[fuˈmare]","forms":{"plural":"fumări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fumare","accusative-definite-nominative-singular":"fumarea","accusative-indefinite-nominative-plural":"fumări","accusative-definite-nominative-plural":"fumările","dative-genitive-indefinite-singular":"fumări","dative-definite-genitive-singular":"fumării","dative-genitive-indefinite-plural":"fumări","dative-definite-genitive-plural":"fumărilor","singular-vocative":"fumare","plural-vocative":"fumărilor"}},{"word":"fumaric","pos":"adj","definitions":["fumaric"],"forms":{"feminine-singular":"fumarică","masculine-plural":"fumarici","feminine-neuter-plural":"fumarice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumaric","error-unrecognized-form-feminine-indefinite-singular":"fumarică","error-unrecognized-form-indefinite-masculine-plural":"fumarici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumarice","definite-error-unrecognized-form-masculine-neuter-singular":"fumaricul","definite-error-unrecognized-form-feminine-singular":"fumarica","definite-error-unrecognized-form-masculine-plural":"fumaricii","definite-error-unrecognized-form-feminine-neuter-plural":"fumaricele"}},{"word":"fumărică","pos":"noun","definitions":["fumitory"],"forms":{"plural":"fumărici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fumărică","accusative-definite-nominative-singular":"fumărica","accusative-indefinite-nominative-plural":"fumărici","accusative-definite-nominative-plural":"fumăricile","dative-genitive-indefinite-singular":"fumărici","dative-definite-genitive-singular":"fumăricii","dative-genitive-indefinite-plural":"fumărici","dative-definite-genitive-plural":"fumăricilor","singular-vocative":"fumărică","plural-vocative":"fumăricilor"}},{"word":"fumărie","pos":"noun","definitions":["large quantity of smoke"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fumărie","accusative-definite-nominative":"fumăria","dative-genitive-indefinite":"fumării","dative-definite-genitive":"fumăriei","vocative":"fumărie"}},{"word":"fumărit","pos":"noun","definitions":["chimney tax (in medieval Romania)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fumărit","accusative-definite-nominative":"fumăritul","dative-genitive-indefinite":"fumărit","dative-definite-genitive":"fumăritului","vocative":"fumăritule"}},{"word":"fumăriță","pos":"noun","definitions":["common fumitory (Fumaria officinalis)"],"forms":{"plural":"fumărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fumăriță","accusative-definite-nominative-singular":"fumărița","accusative-indefinite-nominative-plural":"fumărițe","accusative-definite-nominative-plural":"fumărițele","dative-genitive-indefinite-singular":"fumărițe","dative-definite-genitive-singular":"fumăriței","dative-genitive-indefinite-plural":"fumărițe","dative-definite-genitive-plural":"fumărițelor","singular-vocative":"fumăriță","plural-vocative":"fumărițelor"}},{"word":"fumarolă","pos":"noun","definitions":["fumarole"],"forms":{"plural":"fumarole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fumarolă","accusative-definite-nominative-singular":"fumarola","accusative-indefinite-nominative-plural":"fumarole","accusative-definite-nominative-plural":"fumarolele","dative-genitive-indefinite-singular":"fumarole","dative-definite-genitive-singular":"fumarolei","dative-genitive-indefinite-plural":"fumarole","dative-definite-genitive-plural":"fumarolelor","singular-vocative":"fumarolă","plural-vocative":"fumarolelor"}},{"word":"fumase","pos":"verb","definitions":["third-person singular pluperfect indicative of fuma"],"pronunciation":"[fuˈmase]"},{"word":"fumasem","pos":"verb","definitions":["first-person singular pluperfect indicative of fuma"],"pronunciation":"[fuˈmasem]"},{"word":"fumaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of fuma"],"pronunciation":"[fuˈmaserə]"},{"word":"fumaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of fuma"],"pronunciation":"[fuˈmaserəm]"},{"word":"fumaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of fuma"],"pronunciation":"[fuˈmaserətsʲ]"},{"word":"fumaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of fuma"],"pronunciation":"[fuˈmaseʃʲ]"},{"word":"fumași","pos":"verb","definitions":["second-person singular simple perfect indicative of fuma"],"pronunciation":"[fuˈmaʃʲ]"},{"word":"fumat","pos":"verb","definitions":["past participle of fuma"],"pronunciation":"[fuˈmat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumat","error-unrecognized-form-feminine-indefinite-singular":"fumată","error-unrecognized-form-indefinite-masculine-plural":"fumați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumate","definite-error-unrecognized-form-masculine-neuter-singular":"fumatul","definite-error-unrecognized-form-feminine-singular":"fumata","definite-error-unrecognized-form-masculine-plural":"fumații","definite-error-unrecognized-form-feminine-neuter-plural":"fumatele"}},{"word":"fumat","pos":"noun","definitions":["smoking"],"pronunciation":"[fuˈmat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fumat","accusative-definite-nominative":"fumatul","dative-genitive-indefinite":"fumat","dative-definite-genitive":"fumatului","vocative":"fumatule"}},{"word":"fumat pasiv","pos":"noun","definitions":["passive smoking"]},{"word":"fumați","pos":"adj","definitions":["masculine plural of fumat"],"pronunciation":"[fuˈmat͡sʲ]"},{"word":"fumați","pos":"verb","definitions":["inflection of fuma:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[fuˈmat͡sʲ]"},{"word":"fumătoare","pos":"noun","definitions":["female equivalent of fumător"],"forms":{"plural":"fumătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fumătoare","accusative-definite-nominative-singular":"fumătoarea","accusative-indefinite-nominative-plural":"fumătoare","accusative-definite-nominative-plural":"fumătoarele","dative-genitive-indefinite-singular":"fumătoare","dative-definite-genitive-singular":"fumătoarei","dative-genitive-indefinite-plural":"fumătoare","dative-definite-genitive-plural":"fumătoarelor","singular-vocative":"fumătoare","plural-vocative":"fumătoarelor"}},{"word":"fumător","pos":"noun","definitions":["smoker"],"pronunciation":"/fu.məˈtor/","forms":{"plural":"fumători","feminine":"equivalent fumătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fumător","accusative-definite-nominative-singular":"fumătorul","accusative-indefinite-nominative-plural":"fumători","accusative-definite-nominative-plural":"fumătorii","dative-genitive-indefinite-singular":"fumător","dative-definite-genitive-singular":"fumătorului","dative-genitive-indefinite-plural":"fumători","dative-definite-genitive-plural":"fumătorilor","singular-vocative":"fumătorule","plural-vocative":"fumătorilor"}},{"word":"fumător","pos":"adj","definitions":["smoking (producing smoke)"],"forms":{"feminine-singular":"fumătoare","masculine-plural":"fumători","feminine-neuter-plural":"fumătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumător","error-unrecognized-form-feminine-indefinite-singular":"fumătoare","error-unrecognized-form-indefinite-masculine-plural":"fumători","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumătoare","definite-error-unrecognized-form-masculine-neuter-singular":"fumătorul","definite-error-unrecognized-form-feminine-singular":"fumătoarea","definite-error-unrecognized-form-masculine-plural":"fumătorii","definite-error-unrecognized-form-feminine-neuter-plural":"fumătoarele"}},{"word":"fumător înrăit","pos":"noun","definitions":["chain smoker"],"forms":{"plural":"fumători înrăiți"}},{"word":"fumau","pos":"verb","definitions":["third-person plural imperfect indicative of fuma"],"pronunciation":"[fuˈmaw]"},{"word":"fumează","pos":"verb","definitions":["inflection of fuma:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[fuˈme̯azə]"},{"word":"fumega","pos":"verb","definitions":["to smoke (give off smoke when burning)","to fume","to reek","to steam"],"forms":{"canonical":"a fumega 1st conjugation","present-singular-third-person":"fumegă","participle-past":"fumegat","subjunctive-third-person":"fumege","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fumega","gerund":"fumegând","first-person-indicative-present-singular":"fumeg","indicative-present-second-person-singular":"fumegi","indicative-present-singular-third-person":"fumegă","first-person-indicative-plural-present":"fumegăm","indicative-plural-present-second-person":"fumegați","indicative-plural-present-third-person":"fumegă","first-person-imperfect-indicative-singular":"fumegam","imperfect-indicative-second-person-singular":"fumegai","imperfect-indicative-singular-third-person":"fumega","first-person-imperfect-indicative-plural":"fumegam","imperfect-indicative-plural-second-person":"fumegați","imperfect-indicative-plural-third-person":"fumegau","first-person-indicative-perfect-singular":"fumegai","indicative-perfect-second-person-singular":"fumegași","indicative-perfect-singular-third-person":"fumegă","first-person-indicative-perfect-plural":"fumegarăm","indicative-perfect-plural-second-person":"fumegarăți","indicative-perfect-plural-third-person":"fumegară","first-person-indicative-pluperfect-singular":"fumegasem","indicative-pluperfect-second-person-singular":"fumegaseși","indicative-pluperfect-singular-third-person":"fumegase","first-person-indicative-pluperfect-plural":"fumegaserăm","indicative-pluperfect-plural-second-person":"fumegaserăți","indicative-pluperfect-plural-third-person":"fumegaseră","first-person-present-singular-subjunctive":"să fumeg","present-second-person-singular-subjunctive":"să fumegi","present-singular-subjunctive-third-person":"să fumege","first-person-plural-present-subjunctive":"să fumegăm","plural-present-second-person-subjunctive":"să fumegați","plural-present-subjunctive-third-person":"să fumege","imperative-second-person-singular":"fumegă","imperative-plural-second-person":"fumegați","imperative-negative-second-person-singular":"nu fumega","imperative-negative-plural-second-person":"nu fumegați"}},{"word":"fumegai","pos":"noun","definitions":["large quantity of smoke"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fumegai","accusative-definite-nominative":"fumegaiul","dative-genitive-indefinite":"fumegai","dative-definite-genitive":"fumegaiului","vocative":"fumegaiule"}},{"word":"fumegai","pos":"verb","definitions":["inflection of fumega:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fumeˈɡaj]"},{"word":"fumegam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fumega"],"pronunciation":"[fumeˈɡam]"},{"word":"fumegare","pos":"noun","definitions":["smolder"],"forms":{"plural":"fumegări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fumegare","accusative-definite-nominative-singular":"fumegarea","accusative-indefinite-nominative-plural":"fumegări","accusative-definite-nominative-plural":"fumegările","dative-genitive-indefinite-singular":"fumegări","dative-definite-genitive-singular":"fumegării","dative-genitive-indefinite-plural":"fumegări","dative-definite-genitive-plural":"fumegărilor","singular-vocative":"fumegare","plural-vocative":"fumegărilor"}},{"word":"fumegărie","pos":"noun","definitions":["smolder"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"fumegărie","accusative-definite-nominative":"fumegăria","dative-genitive-indefinite":"fumegării","dative-definite-genitive":"fumegăriei","vocative":"fumegărie"}},{"word":"fumegat","pos":"adj","definitions":["smoky"],"forms":{"feminine-singular":"fumegată","masculine-plural":"fumegați","feminine-neuter-plural":"fumegate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumegat","error-unrecognized-form-feminine-indefinite-singular":"fumegată","error-unrecognized-form-indefinite-masculine-plural":"fumegați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumegate","definite-error-unrecognized-form-masculine-neuter-singular":"fumegatul","definite-error-unrecognized-form-feminine-singular":"fumegata","definite-error-unrecognized-form-masculine-plural":"fumegații","definite-error-unrecognized-form-feminine-neuter-plural":"fumegatele"}},{"word":"fumegat","pos":"verb","definitions":["past participle of fumega"],"forms":{"participle-past":"of fumega"}},{"word":"fumegos","pos":"adj","definitions":["steaming"],"forms":{"feminine-singular":"fumegoasă","masculine-plural":"fumegoși","feminine-neuter-plural":"fumegoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumegos","error-unrecognized-form-feminine-indefinite-singular":"fumegoasă","error-unrecognized-form-indefinite-masculine-plural":"fumegoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumegoase","definite-error-unrecognized-form-masculine-neuter-singular":"fumegosul","definite-error-unrecognized-form-feminine-singular":"fumegoasa","definite-error-unrecognized-form-masculine-plural":"fumegoșii","definite-error-unrecognized-form-feminine-neuter-plural":"fumegoasele"}},{"word":"fumez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fuma"],"pronunciation":"[fuˈmez]"},{"word":"fumeze","pos":"verb","definitions":["third-person singular/plural present subjunctive of fuma"],"pronunciation":"[fuˈmeze]"},{"word":"fumezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of fuma"],"pronunciation":"[fuˈmezʲ]"},{"word":"fumigant","pos":"noun","definitions":["fumigant"],"forms":{"plural":"fumiganți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fumigant","accusative-definite-nominative-singular":"fumigantul","accusative-indefinite-nominative-plural":"fumiganți","accusative-definite-nominative-plural":"fumiganții","dative-genitive-indefinite-singular":"fumigant","dative-definite-genitive-singular":"fumigantului","dative-genitive-indefinite-plural":"fumiganți","dative-definite-genitive-plural":"fumiganților","singular-vocative":"fumigantule","plural-vocative":"fumiganților"}},{"word":"fumigație","pos":"noun","definitions":["fumigation"],"forms":{"plural":"fumigații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fumigație","accusative-definite-nominative-singular":"fumigația","accusative-indefinite-nominative-plural":"fumigații","accusative-definite-nominative-plural":"fumigațiile","dative-genitive-indefinite-singular":"fumigații","dative-definite-genitive-singular":"fumigației","dative-genitive-indefinite-plural":"fumigații","dative-definite-genitive-plural":"fumigațiilor","singular-vocative":"fumigație","plural-vocative":"fumigațiilor"}},{"word":"fumigațiune","pos":"noun","definitions":["obsolete form of fumigație"],"forms":{"plural":"fumigațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fumigațiune","accusative-definite-nominative-singular":"fumigațiunea","accusative-indefinite-nominative-plural":"fumigațiuni","accusative-definite-nominative-plural":"fumigațiunile","dative-genitive-indefinite-singular":"fumigațiuni","dative-definite-genitive-singular":"fumigațiunii","dative-genitive-indefinite-plural":"fumigațiuni","dative-definite-genitive-plural":"fumigațiunilor","singular-vocative":"fumigațiune","plural-vocative":"fumigațiunilor"}},{"word":"fumigen","pos":"adj","definitions":["which produces smoke"],"forms":{"feminine-singular":"fumigenă","masculine-plural":"fumigeni","feminine-neuter-plural":"fumigene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumigen","error-unrecognized-form-feminine-indefinite-singular":"fumigenă","error-unrecognized-form-indefinite-masculine-plural":"fumigeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumigene","definite-error-unrecognized-form-masculine-neuter-singular":"fumigenul","definite-error-unrecognized-form-feminine-singular":"fumigena","definite-error-unrecognized-form-masculine-plural":"fumigenii","definite-error-unrecognized-form-feminine-neuter-plural":"fumigenele"}},{"word":"fumigenă","pos":"noun","definitions":["smoke grenade","a piece of fake news"],"forms":{"plural":"fumigene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fumigenă","accusative-definite-nominative-singular":"fumigena","accusative-indefinite-nominative-plural":"fumigene","accusative-definite-nominative-plural":"fumigenele","dative-genitive-indefinite-singular":"fumigene","dative-definite-genitive-singular":"fumigenei","dative-genitive-indefinite-plural":"fumigene","dative-definite-genitive-plural":"fumigenelor","singular-vocative":"fumigenă","plural-vocative":"fumigenelor"}},{"word":"fumisterie","pos":"noun","definitions":["quackery"],"forms":{"plural":"fumisterii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fumisterie","accusative-definite-nominative-singular":"fumisteria","accusative-indefinite-nominative-plural":"fumisterii","accusative-definite-nominative-plural":"fumisteriile","dative-genitive-indefinite-singular":"fumisterii","dative-definite-genitive-singular":"fumisteriei","dative-genitive-indefinite-plural":"fumisterii","dative-definite-genitive-plural":"fumisteriilor","singular-vocative":"fumisterie","plural-vocative":"fumisteriilor"}},{"word":"fumivor","pos":"adj","definitions":["smoke eating"],"forms":{"feminine-singular":"fumivoră","masculine-plural":"fumivori","feminine-neuter-plural":"fumivore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumivor","error-unrecognized-form-feminine-indefinite-singular":"fumivoră","error-unrecognized-form-indefinite-masculine-plural":"fumivori","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumivore","definite-error-unrecognized-form-masculine-neuter-singular":"fumivorul","definite-error-unrecognized-form-feminine-singular":"fumivora","definite-error-unrecognized-form-masculine-plural":"fumivorii","definite-error-unrecognized-form-feminine-neuter-plural":"fumivorele"}},{"word":"fumiza","pos":"verb","definitions":["to fumigate"],"forms":{"canonical":"a fumiza 1st conjugation","present-singular-third-person":"fumizează","participle-past":"fumizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fumiza","gerund":"fumizând","first-person-indicative-present-singular":"fumizez","indicative-present-second-person-singular":"fumizezi","indicative-present-singular-third-person":"fumizează","first-person-indicative-plural-present":"fumizăm","indicative-plural-present-second-person":"fumizați","indicative-plural-present-third-person":"fumizează","first-person-imperfect-indicative-singular":"fumizam","imperfect-indicative-second-person-singular":"fumizai","imperfect-indicative-singular-third-person":"fumiza","first-person-imperfect-indicative-plural":"fumizam","imperfect-indicative-plural-second-person":"fumizați","imperfect-indicative-plural-third-person":"fumizau","first-person-indicative-perfect-singular":"fumizai","indicative-perfect-second-person-singular":"fumizași","indicative-perfect-singular-third-person":"fumiză","first-person-indicative-perfect-plural":"fumizarăm","indicative-perfect-plural-second-person":"fumizarăți","indicative-perfect-plural-third-person":"fumizară","first-person-indicative-pluperfect-singular":"fumizasem","indicative-pluperfect-second-person-singular":"fumizaseși","indicative-pluperfect-singular-third-person":"fumizase","first-person-indicative-pluperfect-plural":"fumizaserăm","indicative-pluperfect-plural-second-person":"fumizaserăți","indicative-pluperfect-plural-third-person":"fumizaseră","first-person-present-singular-subjunctive":"să fumizez","present-second-person-singular-subjunctive":"să fumizezi","present-singular-subjunctive-third-person":"să fumizeze","first-person-plural-present-subjunctive":"să fumizăm","plural-present-second-person-subjunctive":"să fumizați","plural-present-subjunctive-third-person":"să fumizeze","imperative-second-person-singular":"fumizează","imperative-plural-second-person":"fumizați","imperative-negative-second-person-singular":"nu fumiza","imperative-negative-plural-second-person":"nu fumizați"}},{"word":"fumizare","pos":"noun","definitions":["fumigation"],"forms":{"plural":"fumizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fumizare","accusative-definite-nominative-singular":"fumizarea","accusative-indefinite-nominative-plural":"fumizări","accusative-definite-nominative-plural":"fumizările","dative-genitive-indefinite-singular":"fumizări","dative-definite-genitive-singular":"fumizării","dative-genitive-indefinite-plural":"fumizări","dative-definite-genitive-plural":"fumizărilor","singular-vocative":"fumizare","plural-vocative":"fumizărilor"}},{"word":"fumoar","pos":"noun","definitions":["smoking room"],"pronunciation":"/fuˈmo̯ar/","forms":{"plural":"fumoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fumoar","accusative-definite-nominative-singular":"fumoarul","accusative-indefinite-nominative-plural":"fumoare","accusative-definite-nominative-plural":"fumoarele","dative-genitive-indefinite-singular":"fumoar","dative-definite-genitive-singular":"fumoarului","dative-genitive-indefinite-plural":"fumoare","dative-definite-genitive-plural":"fumoarelor","singular-vocative":"fumoarule","plural-vocative":"fumoarelor"}},{"word":"fumuar","pos":"noun","definitions":["alternative form of fumoar"],"forms":{"plural":"fumuare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fumuar","accusative-definite-nominative-singular":"fumuarul","accusative-indefinite-nominative-plural":"fumuare","accusative-definite-nominative-plural":"fumuarele","dative-genitive-indefinite-singular":"fumuar","dative-definite-genitive-singular":"fumuarului","dative-genitive-indefinite-plural":"fumuare","dative-definite-genitive-plural":"fumuarelor","singular-vocative":"fumuarule","plural-vocative":"fumuarelor"}},{"word":"fumur","pos":"adj","definitions":["gray, grayish, smoke-colored"],"forms":{"feminine-singular":"fumură","masculine-plural":"fumuri","feminine-neuter-plural":"fumure","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumur","error-unrecognized-form-feminine-indefinite-singular":"fumură","error-unrecognized-form-indefinite-masculine-plural":"fumuri","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumure","definite-error-unrecognized-form-masculine-neuter-singular":"fumurul","definite-error-unrecognized-form-feminine-singular":"fumura","definite-error-unrecognized-form-masculine-plural":"fumurii","definite-error-unrecognized-form-feminine-neuter-plural":"fumurele"}},{"word":"Fumureni","pos":"name","definitions":["a village in Lungești, Vâlcea County, Romania"],"gender":"m"},{"word":"Fumuri","pos":"name","definitions":["a river in Arad County, Romania, tributary to the Crețu"],"gender":"m"},{"word":"fumuriu","pos":"adj","definitions":["smoke (color), smoke-colored, dun, grayish","cloaked in smoke or haze"],"pronunciation":"/fu.muˈriw/","forms":{"feminine-singular":"fumurie","plural":"fumurii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumuriu","error-unrecognized-form-feminine-indefinite-singular":"fumurie","error-unrecognized-form-indefinite-masculine-plural":"fumurii","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumurii","definite-error-unrecognized-form-masculine-neuter-singular":"fumuriul","definite-error-unrecognized-form-feminine-singular":"fumuria","definite-error-unrecognized-form-masculine-plural":"fumuriii","definite-error-unrecognized-form-feminine-neuter-plural":"fumuriile"}},{"word":"fumuros","pos":"adj","definitions":["smoky"],"forms":{"feminine-singular":"fumuroasă","masculine-plural":"fumuroși","feminine-neuter-plural":"fumuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fumuros","error-unrecognized-form-feminine-indefinite-singular":"fumuroasă","error-unrecognized-form-indefinite-masculine-plural":"fumuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"fumuroase","definite-error-unrecognized-form-masculine-neuter-singular":"fumurosul","definite-error-unrecognized-form-feminine-singular":"fumuroasa","definite-error-unrecognized-form-masculine-plural":"fumuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"fumuroasele"}},{"word":"funambul","pos":"noun","definitions":["tightrope walker"],"forms":{"plural":"funambuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funambul","accusative-definite-nominative-singular":"funambulul","accusative-indefinite-nominative-plural":"funambuli","accusative-definite-nominative-plural":"funambulii","dative-genitive-indefinite-singular":"funambul","dative-definite-genitive-singular":"funambulului","dative-genitive-indefinite-plural":"funambuli","dative-definite-genitive-plural":"funambulilor","singular-vocative":"funambulule","plural-vocative":"funambulilor"}},{"word":"funambulă","pos":"noun","definitions":["female equivalent of funambul"],"forms":{"plural":"funambule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funambulă","accusative-definite-nominative-singular":"funambula","accusative-indefinite-nominative-plural":"funambule","accusative-definite-nominative-plural":"funambulele","dative-genitive-indefinite-singular":"funambule","dative-definite-genitive-singular":"funambulei","dative-genitive-indefinite-plural":"funambule","dative-definite-genitive-plural":"funambulelor","singular-vocative":"funambulă","plural-vocative":"funambulelor"}},{"word":"funambulesc","pos":"adj","definitions":["funambulesque"],"forms":{"feminine-singular":"funambulească","plural":"funambulești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funambulesc","error-unrecognized-form-feminine-indefinite-singular":"funambulească","error-unrecognized-form-indefinite-masculine-plural":"funambulești","error-unrecognized-form-feminine-indefinite-neuter-plural":"funambulești","definite-error-unrecognized-form-masculine-neuter-singular":"funambulescul","definite-error-unrecognized-form-feminine-singular":"funambuleasca","definite-error-unrecognized-form-masculine-plural":"funambuleștii","definite-error-unrecognized-form-feminine-neuter-plural":"funambuleștile"}},{"word":"Funar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Funar"}},{"word":"funar","pos":"noun","definitions":["ropemaker"],"forms":{"plural":"funari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funar","accusative-definite-nominative-singular":"funarul","accusative-indefinite-nominative-plural":"funari","accusative-definite-nominative-plural":"funarii","dative-genitive-indefinite-singular":"funar","dative-definite-genitive-singular":"funarului","dative-genitive-indefinite-plural":"funari","dative-definite-genitive-plural":"funarilor","singular-vocative":"funarule","plural-vocative":"funarilor","alternative":"funier"}},{"word":"funari","pos":"noun","definitions":["plural of funar"]},{"word":"Funariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Funariu"}},{"word":"Funaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Funaru"}},{"word":"funceu","pos":"noun","definitions":["rope, cord"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"funceu","accusative-definite-nominative":"funceuul","dative-genitive-indefinite":"funceu","dative-definite-genitive":"funceuului","vocative":"funceuule"}},{"word":"funciar","pos":"adj","definitions":["land, property","fundamental, basic"],"pronunciation":"/fun.t͡ʃiˈar/","forms":{"feminine-singular":"funciară","masculine-plural":"funciari","feminine-neuter-plural":"funciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funciar","error-unrecognized-form-feminine-indefinite-singular":"funciară","error-unrecognized-form-indefinite-masculine-plural":"funciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"funciare","definite-error-unrecognized-form-masculine-neuter-singular":"funciarul","definite-error-unrecognized-form-feminine-singular":"funciara","definite-error-unrecognized-form-masculine-plural":"funciarii","definite-error-unrecognized-form-feminine-neuter-plural":"funciarele","alternative":"фунчиар"}},{"word":"funciarmente","pos":"adv","definitions":["fundamentally"]},{"word":"funcție","pos":"noun","definitions":["function, use","function"],"pronunciation":"[ˈfunk.t͡si.e]","forms":{"plural":"funcții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"funcție","accusative-definite-nominative-singular":"funcția","accusative-indefinite-nominative-plural":"funcții","accusative-definite-nominative-plural":"funcțiile","dative-genitive-indefinite-singular":"funcții","dative-definite-genitive-singular":"funcției","dative-genitive-indefinite-plural":"funcții","dative-definite-genitive-plural":"funcțiilor","singular-vocative":"funcție","plural-vocative":"funcțiilor","alternative":"funcțiune"}},{"word":"funcție bijectivă","pos":"noun","definitions":["bijection"],"forms":{"plural":"funcții bijective"}},{"word":"funcție continuă","pos":"noun","definitions":["continuous function"],"forms":{"plural":"funcții continue"}},{"word":"funcție de undă","pos":"noun","definitions":["wavefunction"],"forms":{"plural":"funcții de undă"}},{"word":"funcție generică","pos":"noun","definitions":["generic function"],"forms":{"plural":"funcții generice"}},{"word":"funcție injectivă","pos":"noun","definitions":["injection"],"forms":{"plural":"funcții injective"}},{"word":"funcție integrabilă","pos":"noun","definitions":["integrable function"],"forms":{"plural":"funcții integrabile"}},{"word":"funcție măsurabilă","pos":"noun","definitions":["measurable function"],"forms":{"plural":"funcții măsurabile"}},{"word":"funcție obiectiv","pos":"noun","definitions":["objective function"],"forms":{"plural":"funcții obiectiv"}},{"word":"funcție periodică","pos":"noun","definitions":["periodic function"],"forms":{"plural":"funcții periodice"}},{"word":"funcție simetrică","pos":"noun","definitions":["symmetric function"],"forms":{"plural":"funcții simetrice"}},{"word":"funcție surjectivă","pos":"noun","definitions":["surjection"],"forms":{"plural":"funcții surjective"}},{"word":"funcție trigonometrică","pos":"noun","definitions":["trigonometric function"],"forms":{"plural":"funcții trigonometrice"}},{"word":"funcții","pos":"noun","definitions":["plural of funcție"]},{"word":"funcționa","pos":"verb","definitions":["to function"],"pronunciation":"[funk.t͡si.oˈna]","forms":{"canonical":"a funcționa 1st conjugation","present-singular-third-person":"funcționează","participle-past":"funcționat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a funcționa","gerund":"funcționând","first-person-indicative-present-singular":"funcționez","indicative-present-second-person-singular":"funcționezi","indicative-present-singular-third-person":"funcționează","first-person-indicative-plural-present":"funcționăm","indicative-plural-present-second-person":"funcționați","indicative-plural-present-third-person":"funcționează","first-person-imperfect-indicative-singular":"funcționam","imperfect-indicative-second-person-singular":"funcționai","imperfect-indicative-singular-third-person":"funcționa","first-person-imperfect-indicative-plural":"funcționam","imperfect-indicative-plural-second-person":"funcționați","imperfect-indicative-plural-third-person":"funcționau","first-person-indicative-perfect-singular":"funcționai","indicative-perfect-second-person-singular":"funcționași","indicative-perfect-singular-third-person":"funcționă","first-person-indicative-perfect-plural":"funcționarăm","indicative-perfect-plural-second-person":"funcționarăți","indicative-perfect-plural-third-person":"funcționară","first-person-indicative-pluperfect-singular":"funcționasem","indicative-pluperfect-second-person-singular":"funcționaseși","indicative-pluperfect-singular-third-person":"funcționase","first-person-indicative-pluperfect-plural":"funcționaserăm","indicative-pluperfect-plural-second-person":"funcționaserăți","indicative-pluperfect-plural-third-person":"funcționaseră","first-person-present-singular-subjunctive":"să funcționez","present-second-person-singular-subjunctive":"să funcționezi","present-singular-subjunctive-third-person":"să funcționeze","first-person-plural-present-subjunctive":"să funcționăm","plural-present-second-person-subjunctive":"să funcționați","plural-present-subjunctive-third-person":"să funcționeze","imperative-second-person-singular":"funcționează","imperative-plural-second-person":"funcționați","imperative-negative-second-person-singular":"nu funcționa","imperative-negative-plural-second-person":"nu funcționați"}},{"word":"funcționă","pos":"verb","definitions":["third-person singular simple perfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnə]"},{"word":"funcționai","pos":"verb","definitions":["inflection of funcționa:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[funk.t͡si.oˈnaj]"},{"word":"funcțional","pos":"adj","definitions":["functional"],"forms":{"feminine-singular":"funcțională","masculine-plural":"funcționali","feminine-neuter-plural":"funcționale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funcțional","error-unrecognized-form-feminine-indefinite-singular":"funcțională","error-unrecognized-form-indefinite-masculine-plural":"funcționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"funcționale","definite-error-unrecognized-form-masculine-neuter-singular":"funcționalul","definite-error-unrecognized-form-feminine-singular":"funcționala","definite-error-unrecognized-form-masculine-plural":"funcționalii","definite-error-unrecognized-form-feminine-neuter-plural":"funcționalele"}},{"word":"funcționalism","pos":"noun","definitions":["functionalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"funcționalism","accusative-definite-nominative-singular":"funcționalismul","accusative-indefinite-nominative-plural":"funcționalisme","accusative-definite-nominative-plural":"funcționalismele","dative-genitive-indefinite-singular":"funcționalism","dative-definite-genitive-singular":"funcționalismului","dative-genitive-indefinite-plural":"funcționalisme","dative-definite-genitive-plural":"funcționalismelor","singular-vocative":"funcționalismule","plural-vocative":"funcționalismelor"}},{"word":"funcționalist","pos":"noun","definitions":["functionalist"],"forms":{"plural":"funcționaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funcționalist","accusative-definite-nominative-singular":"funcționalistul","accusative-indefinite-nominative-plural":"funcționaliști","accusative-definite-nominative-plural":"funcționaliștii","dative-genitive-indefinite-singular":"funcționalist","dative-definite-genitive-singular":"funcționalistului","dative-genitive-indefinite-plural":"funcționaliști","dative-definite-genitive-plural":"funcționaliștilor","singular-vocative":"funcționalistule","plural-vocative":"funcționaliștilor"}},{"word":"funcționalitate","pos":"noun","definitions":["functionality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"funcționalitate","accusative-definite-nominative-singular":"funcționalitatea","accusative-indefinite-nominative-plural":"funcționalități","accusative-definite-nominative-plural":"funcționalitățile","dative-genitive-indefinite-singular":"funcționalități","dative-definite-genitive-singular":"funcționalității","dative-genitive-indefinite-plural":"funcționalități","dative-definite-genitive-plural":"funcționalităților","singular-vocative":"funcționalitate","plural-vocative":"funcționalităților"}},{"word":"funcționam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnam]"},{"word":"funcționăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of funcționa"],"pronunciation":"[funk.t͡si.oˈnəm]"},{"word":"funcționând","pos":"verb","definitions":["gerund of funcționa"],"pronunciation":"[funk.t͡si.oˈnɨnd]"},{"word":"funcționar","pos":"noun","definitions":["office clerk"],"forms":{"plural":"funcționari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funcționar","accusative-definite-nominative-singular":"funcționarul","accusative-indefinite-nominative-plural":"funcționari","accusative-definite-nominative-plural":"funcționarii","dative-genitive-indefinite-singular":"funcționar","dative-definite-genitive-singular":"funcționarului","dative-genitive-indefinite-plural":"funcționari","dative-definite-genitive-plural":"funcționarilor","singular-vocative":"funcționarule","plural-vocative":"funcționarilor"}},{"word":"funcționar public","pos":"noun","definitions":["civil servant"],"forms":{"plural":"funcționari publici"}},{"word":"funcționară","pos":"verb","definitions":["third-person plural simple perfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnarə]"},{"word":"funcționară","pos":"noun","definitions":["female equivalent of funcționar"],"pronunciation":"[funk.t͡si.oˈnarə]","forms":{"plural":"funcționare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funcționară","accusative-definite-nominative-singular":"funcționara","accusative-indefinite-nominative-plural":"funcționare","accusative-definite-nominative-plural":"funcționarele","dative-genitive-indefinite-singular":"funcționare","dative-definite-genitive-singular":"funcționarei","dative-genitive-indefinite-plural":"funcționare","dative-definite-genitive-plural":"funcționarelor","singular-vocative":"funcționară","plural-vocative":"funcționarelor"}},{"word":"funcționarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnarəm]"},{"word":"funcționăraș","pos":"noun","definitions":["diminutive of funcționar; small clerk"],"forms":{"plural":"funcționărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funcționăraș","accusative-definite-nominative-singular":"funcționărașul","accusative-indefinite-nominative-plural":"funcționărași","accusative-definite-nominative-plural":"funcționărașii","dative-genitive-indefinite-singular":"funcționăraș","dative-definite-genitive-singular":"funcționărașului","dative-genitive-indefinite-plural":"funcționărași","dative-definite-genitive-plural":"funcționărașilor","singular-vocative":"funcționărașule","plural-vocative":"funcționărașilor"}},{"word":"funcționarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnarətsʲ]"},{"word":"funcționare","pos":"noun","definitions":["operation, operating, functioning"],"forms":{"plural":"funcționări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"funcționare","accusative-definite-nominative-singular":"funcționarea","accusative-indefinite-nominative-plural":"funcționări","accusative-definite-nominative-plural":"funcționările","dative-genitive-indefinite-singular":"funcționări","dative-definite-genitive-singular":"funcționării","dative-genitive-indefinite-plural":"funcționări","dative-definite-genitive-plural":"funcționărilor","singular-vocative":"funcționare","plural-vocative":"funcționărilor"}},{"word":"funcționăresc","pos":"adj","definitions":["clerkly"],"forms":{"feminine-singular":"funcționărească","plural":"funcționărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funcționăresc","error-unrecognized-form-feminine-indefinite-singular":"funcționărească","error-unrecognized-form-indefinite-masculine-plural":"funcționărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"funcționărești","definite-error-unrecognized-form-masculine-neuter-singular":"funcționărescul","definite-error-unrecognized-form-feminine-singular":"funcționăreasca","definite-error-unrecognized-form-masculine-plural":"funcționăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"funcționăreștile"}},{"word":"funcționărime","pos":"noun","definitions":["officialdom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"funcționărime","accusative-definite-nominative-singular":"funcționărimea","accusative-indefinite-nominative-plural":"funcționărimi","accusative-definite-nominative-plural":"funcționărimile","dative-genitive-indefinite-singular":"funcționărimi","dative-definite-genitive-singular":"funcționărimii","dative-genitive-indefinite-plural":"funcționărimi","dative-definite-genitive-plural":"funcționărimilor","singular-vocative":"funcționărime","plural-vocative":"funcționărimilor"}},{"word":"funcționarism","pos":"noun","definitions":["officialdom"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"funcționarism","accusative-definite-nominative-singular":"funcționarismul","accusative-indefinite-nominative-plural":"funcționarisme","accusative-definite-nominative-plural":"funcționarismele","dative-genitive-indefinite-singular":"funcționarism","dative-definite-genitive-singular":"funcționarismului","dative-genitive-indefinite-plural":"funcționarisme","dative-definite-genitive-plural":"funcționarismelor","singular-vocative":"funcționarismule","plural-vocative":"funcționarismelor"}},{"word":"funcționase","pos":"verb","definitions":["third-person singular pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnase]"},{"word":"funcționasem","pos":"verb","definitions":["first-person singular pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnasem]"},{"word":"funcționaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaserə]"},{"word":"funcționaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaserəm]"},{"word":"funcționaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaserətsʲ]"},{"word":"funcționaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaseʃʲ]"},{"word":"funcționași","pos":"verb","definitions":["second-person singular simple perfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaʃʲ]"},{"word":"funcționat","pos":"verb","definitions":["past participle of funcționa"],"pronunciation":"[funk.t͡si.oˈnat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"funcționat","error-unrecognized-form-feminine-indefinite-singular":"funcționată","error-unrecognized-form-indefinite-masculine-plural":"funcționați","error-unrecognized-form-feminine-indefinite-neuter-plural":"funcționate","definite-error-unrecognized-form-masculine-neuter-singular":"funcționatul","definite-error-unrecognized-form-feminine-singular":"funcționata","definite-error-unrecognized-form-masculine-plural":"funcționații","definite-error-unrecognized-form-feminine-neuter-plural":"funcționatele"}},{"word":"funcționați","pos":"adj","definitions":["masculine plural of funcționat"],"pronunciation":"[funk.t͡si.oˈnat͡sʲ]"},{"word":"funcționați","pos":"verb","definitions":["inflection of funcționa:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[funk.t͡si.oˈnat͡sʲ]"},{"word":"funcționau","pos":"verb","definitions":["third-person plural imperfect indicative of funcționa"],"pronunciation":"[funk.t͡si.oˈnaw]"},{"word":"funcționează","pos":"verb","definitions":["inflection of funcționa:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[funk.t͡si.oˈne̯azə]"},{"word":"funcționez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of funcționa"],"pronunciation":"[funk.t͡si.oˈnez]"},{"word":"funcționeze","pos":"verb","definitions":["third-person singular/plural present subjunctive of funcționa"],"pronunciation":"[funk.t͡si.oˈneze]"},{"word":"funcționezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of funcționa"],"pronunciation":"[funk.t͡si.oˈnezʲ]"},{"word":"funcțiune","pos":"noun","definitions":["alternative form of funcție"],"forms":{"plural":"funcțiuni"}},{"word":"functor","pos":"noun","definitions":["functor"],"forms":{"plural":"functori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"functor","accusative-definite-nominative-singular":"functorul","accusative-indefinite-nominative-plural":"functori","accusative-definite-nominative-plural":"functorii","dative-genitive-indefinite-singular":"functor","dative-definite-genitive-singular":"functorului","dative-genitive-indefinite-plural":"functori","dative-definite-genitive-plural":"functorilor","singular-vocative":"functorule","plural-vocative":"functorilor"}},{"word":"fund","pos":"noun","definitions":["bottom","backside; buttocks","chopping board"],"pronunciation":"[fund]","forms":{"plural":"funduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fund","accusative-definite-nominative-singular":"fundul","accusative-indefinite-nominative-plural":"funduri","accusative-definite-nominative-plural":"fundurile","dative-genitive-indefinite-singular":"fund","dative-definite-genitive-singular":"fundului","dative-genitive-indefinite-plural":"funduri","dative-definite-genitive-plural":"fundurilor","singular-vocative":"fundule","plural-vocative":"fundurilor"}},{"word":"funda","pos":"verb","definitions":["to found, set a foundation"],"forms":{"canonical":"a funda 1st conjugation","present-singular-third-person":"fundează","participle-past":"fundat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a funda","gerund":"fundând","first-person-indicative-present-singular":"fundez","indicative-present-second-person-singular":"fundezi","indicative-present-singular-third-person":"fundează","first-person-indicative-plural-present":"fundăm","indicative-plural-present-second-person":"fundați","indicative-plural-present-third-person":"fundează","first-person-imperfect-indicative-singular":"fundam","imperfect-indicative-second-person-singular":"fundai","imperfect-indicative-singular-third-person":"funda","first-person-imperfect-indicative-plural":"fundam","imperfect-indicative-plural-second-person":"fundați","imperfect-indicative-plural-third-person":"fundau","first-person-indicative-perfect-singular":"fundai","indicative-perfect-second-person-singular":"fundași","indicative-perfect-singular-third-person":"fundă","first-person-indicative-perfect-plural":"fundarăm","indicative-perfect-plural-second-person":"fundarăți","indicative-perfect-plural-third-person":"fundară","first-person-indicative-pluperfect-singular":"fundasem","indicative-pluperfect-second-person-singular":"fundaseși","indicative-pluperfect-singular-third-person":"fundase","first-person-indicative-pluperfect-plural":"fundaserăm","indicative-pluperfect-plural-second-person":"fundaserăți","indicative-pluperfect-plural-third-person":"fundaseră","first-person-present-singular-subjunctive":"să fundez","present-second-person-singular-subjunctive":"să fundezi","present-singular-subjunctive-third-person":"să fundeze","first-person-plural-present-subjunctive":"să fundăm","plural-present-second-person-subjunctive":"să fundați","plural-present-subjunctive-third-person":"să fundeze","imperative-second-person-singular":"fundează","imperative-plural-second-person":"fundați","imperative-negative-second-person-singular":"nu funda","imperative-negative-plural-second-person":"nu fundați"}},{"word":"fundă","pos":"noun","definitions":["bow (knot with two loops)"],"pronunciation":"/ˈfun.də/","forms":{"plural":"funde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fundă","accusative-definite-nominative-singular":"funda","accusative-indefinite-nominative-plural":"funde","accusative-definite-nominative-plural":"fundele","dative-genitive-indefinite-singular":"funde","dative-definite-genitive-singular":"fundei","dative-genitive-indefinite-plural":"funde","dative-definite-genitive-plural":"fundelor","singular-vocative":"fundă","plural-vocative":"fundelor","alternative":"funtă"}},{"word":"fundac","pos":"noun","definitions":["diver"],"forms":{"plural":"fundaci","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fundac","accusative-definite-nominative-singular":"fundacul","accusative-indefinite-nominative-plural":"fundaci","accusative-definite-nominative-plural":"fundacile","dative-genitive-indefinite-singular":"fundac","dative-definite-genitive-singular":"fundacului","dative-genitive-indefinite-plural":"fundaci","dative-definite-genitive-plural":"fundacilor","singular-vocative":"fundacule","plural-vocative":"fundacilor"}},{"word":"fundai","pos":"verb","definitions":["inflection of funda:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[funˈdaj]"},{"word":"fundal","pos":"noun","definitions":["background"],"pronunciation":"/funˈdal/","forms":{"plural":"fundale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fundal","accusative-definite-nominative-singular":"fundalul","accusative-indefinite-nominative-plural":"fundale","accusative-definite-nominative-plural":"fundalele","dative-genitive-indefinite-singular":"fundal","dative-definite-genitive-singular":"fundalului","dative-genitive-indefinite-plural":"fundale","dative-definite-genitive-plural":"fundalelor","singular-vocative":"fundalule","plural-vocative":"fundalelor"}},{"word":"fundam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of funda"],"pronunciation":"[funˈdam]"},{"word":"fundamec","pos":"noun","definitions":["foundation"],"forms":{"plural":"fundamecuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fundamec","accusative-definite-nominative-singular":"fundamecul","accusative-indefinite-nominative-plural":"fundamecuri","accusative-definite-nominative-plural":"fundamecurile","dative-genitive-indefinite-singular":"fundamec","dative-definite-genitive-singular":"fundamecului","dative-genitive-indefinite-plural":"fundamecuri","dative-definite-genitive-plural":"fundamecurilor","singular-vocative":"fundamecule","plural-vocative":"fundamecurilor"}},{"word":"fundament","pos":"noun","definitions":["foundation"],"forms":{"plural":"fundamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fundament","accusative-definite-nominative-singular":"fundamentul","accusative-indefinite-nominative-plural":"fundamente","accusative-definite-nominative-plural":"fundamentele","dative-genitive-indefinite-singular":"fundament","dative-definite-genitive-singular":"fundamentului","dative-genitive-indefinite-plural":"fundamente","dative-definite-genitive-plural":"fundamentelor","singular-vocative":"fundamentule","plural-vocative":"fundamentelor"}},{"word":"fundamenta","pos":"verb","definitions":["to substantiate"],"forms":{"canonical":"a fundamenta 1st conjugation","present-singular-third-person":"fundamentează","participle-past":"fundamentat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fundamenta","gerund":"fundamentând","first-person-indicative-present-singular":"fundamentez","indicative-present-second-person-singular":"fundamentezi","indicative-present-singular-third-person":"fundamentează","first-person-indicative-plural-present":"fundamentăm","indicative-plural-present-second-person":"fundamentați","indicative-plural-present-third-person":"fundamentează","first-person-imperfect-indicative-singular":"fundamentam","imperfect-indicative-second-person-singular":"fundamentai","imperfect-indicative-singular-third-person":"fundamenta","first-person-imperfect-indicative-plural":"fundamentam","imperfect-indicative-plural-second-person":"fundamentați","imperfect-indicative-plural-third-person":"fundamentau","first-person-indicative-perfect-singular":"fundamentai","indicative-perfect-second-person-singular":"fundamentași","indicative-perfect-singular-third-person":"fundamentă","first-person-indicative-perfect-plural":"fundamentarăm","indicative-perfect-plural-second-person":"fundamentarăți","indicative-perfect-plural-third-person":"fundamentară","first-person-indicative-pluperfect-singular":"fundamentasem","indicative-pluperfect-second-person-singular":"fundamentaseși","indicative-pluperfect-singular-third-person":"fundamentase","first-person-indicative-pluperfect-plural":"fundamentaserăm","indicative-pluperfect-plural-second-person":"fundamentaserăți","indicative-pluperfect-plural-third-person":"fundamentaseră","first-person-present-singular-subjunctive":"să fundamentez","present-second-person-singular-subjunctive":"să fundamentezi","present-singular-subjunctive-third-person":"să fundamenteze","first-person-plural-present-subjunctive":"să fundamentăm","plural-present-second-person-subjunctive":"să fundamentați","plural-present-subjunctive-third-person":"să fundamenteze","imperative-second-person-singular":"fundamentează","imperative-plural-second-person":"fundamentați","imperative-negative-second-person-singular":"nu fundamenta","imperative-negative-plural-second-person":"nu fundamentați"}},{"word":"fundamental","pos":"adj","definitions":["fundamental"],"pronunciation":"/ˌfun.da.menˈtal/","forms":{"feminine-singular":"fundamentală","masculine-plural":"fundamentali","feminine-neuter-plural":"fundamentale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"fundamental","error-unrecognized-form-feminine-indefinite-singular":"fundamentală","error-unrecognized-form-indefinite-masculine-plural":"fundamentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"fundamentale","definite-error-unrecognized-form-masculine-neuter-singular":"fundamentalul","definite-error-unrecognized-form-feminine-singular":"fundamentala","definite-error-unrecognized-form-masculine-plural":"fundamentalii","definite-error-unrecognized-form-feminine-neuter-plural":"fundamentalele"}},{"word":"fundamentală","pos":"adj","definitions":["nominative/accusative feminine singular of fundamental"],"pronunciation":"[fundamenˈtalə]"},{"word":"fundamentale","pos":"adj","definitions":["inflection of fundamental:","genitive/dative feminine singular","nominative/accusative feminine/neuter plural"],"pronunciation":"[fundamenˈtale]"},{"word":"fundamentali","pos":"adj","definitions":["nominative/accusative masculine plural of fundamental"],"pronunciation":"[fundamenˈtalʲ]"},{"word":"fundamentalism","pos":"noun","definitions":["fundamentalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"fundamentalism","accusative-definite-nominative":"fundamentalismul","dative-genitive-indefinite":"fundamentalism","dative-definite-genitive":"fundamentalismului","vocative":"fundamentalismule"}},{"word":"fundamentalist","pos":"adj","definitions":["fundamentalist"],"forms":{"feminine-singular":"fundamentalistă","masculine-plural":"fundamentaliști","feminine-neuter-plural":"fundamentaliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fundamentalist","error-unrecognized-form-feminine-indefinite-singular":"fundamentalistă","error-unrecognized-form-indefinite-masculine-plural":"fundamentaliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"fundamentaliste","definite-error-unrecognized-form-masculine-neuter-singular":"fundamentalistul","definite-error-unrecognized-form-feminine-singular":"fundamentalista","definite-error-unrecognized-form-masculine-plural":"fundamentaliștii","definite-error-unrecognized-form-feminine-neuter-plural":"fundamentalistele"}},{"word":"fundamentalist","pos":"noun","definitions":["fundamentalist"],"forms":{"plural":"fundamentaliști","feminine":"equivalent fundamentalistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fundamentalist","accusative-definite-nominative-singular":"fundamentalistul","accusative-indefinite-nominative-plural":"fundamentaliști","accusative-definite-nominative-plural":"fundamentaliștii","dative-genitive-indefinite-singular":"fundamentalist","dative-definite-genitive-singular":"fundamentalistului","dative-genitive-indefinite-plural":"fundamentaliști","dative-definite-genitive-plural":"fundamentaliștilor","singular-vocative":"fundamentalistule","plural-vocative":"fundamentaliștilor"}},{"word":"fundamentalistă","pos":"noun","definitions":["female equivalent of fundamentalist"],"forms":{"plural":"fundamentaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fundamentalistă","accusative-definite-nominative-singular":"fundamentalista","accusative-indefinite-nominative-plural":"fundamentaliste","accusative-definite-nominative-plural":"fundamentalistele","dative-genitive-indefinite-singular":"fundamentaliste","dative-definite-genitive-singular":"fundamentalistei","dative-genitive-indefinite-plural":"fundamentaliste","dative-definite-genitive-plural":"fundamentalistelor","singular-vocative":"fundamentalistă","plural-vocative":"fundamentalistelor"}},{"word":"fundamentare","pos":"noun","definitions":["substantiation"],"forms":{"plural":"fundamentări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fundamentare","accusative-definite-nominative-singular":"fundamentarea","accusative-indefinite-nominative-plural":"fundamentări","accusative-definite-nominative-plural":"fundamentările","dative-genitive-indefinite-singular":"fundamentări","dative-definite-genitive-singular":"fundamentării","dative-genitive-indefinite-plural":"fundamentări","dative-definite-genitive-plural":"fundamentărilor","singular-vocative":"fundamentare","plural-vocative":"fundamentărilor"}},{"word":"fundare","pos":"noun","definitions":["alternative form of fondare"],"forms":{"plural":"fundări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fundare","accusative-definite-nominative-singular":"fundarea","accusative-indefinite-nominative-plural":"fundări","accusative-definite-nominative-plural":"fundările","dative-genitive-indefinite-singular":"fundări","dative-definite-genitive-singular":"fundării","dative-genitive-indefinite-plural":"fundări","dative-definite-genitive-plural":"fundărilor","singular-vocative":"fundare","plural-vocative":"fundărilor"}},{"word":"fundarisi","pos":"verb","definitions":["to throw the anchor"],"forms":{"canonical":"a fundarisi 4th conjugation","present-singular-third-person":"fundarisește","participle-past":"fundarisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a fundarisi","gerund":"fundarisind","first-person-indicative-present-singular":"fundarisesc","indicative-present-second-person-singular":"fundarisești","indicative-present-singular-third-person":"fundarisește","first-person-indicative-plural-present":"fundarisim","indicative-plural-present-second-person":"fundarisiți","indicative-plural-present-third-person":"fundarisesc","first-person-imperfect-indicative-singular":"fundariseam","imperfect-indicative-second-person-singular":"fundariseai","imperfect-indicative-singular-third-person":"fundarisea","first-person-imperfect-indicative-plural":"fundariseam","imperfect-indicative-plural-second-person":"fundariseați","imperfect-indicative-plural-third-person":"fundariseau","first-person-indicative-perfect-singular":"fundarisii","indicative-perfect-second-person-singular":"fundarisiși","indicative-perfect-singular-third-person":"fundarisi","first-person-indicative-perfect-plural":"fundarisirăm","indicative-perfect-plural-second-person":"fundarisirăți","indicative-perfect-plural-third-person":"fundarisiră","first-person-indicative-pluperfect-singular":"fundarisisem","indicative-pluperfect-second-person-singular":"fundarisiseși","indicative-pluperfect-singular-third-person":"fundarisise","first-person-indicative-pluperfect-plural":"fundarisiserăm","indicative-pluperfect-plural-second-person":"fundarisiserăți","indicative-pluperfect-plural-third-person":"fundarisiseră","first-person-present-singular-subjunctive":"să fundarisesc","present-second-person-singular-subjunctive":"să fundarisești","present-singular-subjunctive-third-person":"să fundarisească","first-person-plural-present-subjunctive":"să fundarisim","plural-present-second-person-subjunctive":"să fundarisiți","plural-present-subjunctive-third-person":"să fundarisească","imperative-second-person-singular":"fundarisește","imperative-plural-second-person":"fundarisiți","imperative-negative-second-person-singular":"nu fundarisi","imperative-negative-plural-second-person":"nu fundarisiți"}},{"word":"fundarisire","pos":"noun","definitions":["anchorage"],"forms":{"plural":"fundarisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fundarisire","accusative-definite-nominative-singular":"fundarisirea","accusative-indefinite-nominative-plural":"fundarisiri","accusative-definite-nominative-plural":"fundarisirile","dative-genitive-indefinite-singular":"fundarisiri","dative-definite-genitive-singular":"fundarisirii","dative-genitive-indefinite-plural":"fundarisiri","dative-definite-genitive-plural":"fundarisirilor","singular-vocative":"fundarisire","plural-vocative":"fundarisirilor"}},{"word":"fundaș","pos":"noun","definitions":["a player in defense (i.e. in football)","faggot"],"pronunciation":"/funˈdaʃ/","forms":{"plural":"fundași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fundaș","accusative-definite-nominative-singular":"fundașul","accusative-indefinite-nominative-plural":"fundași","accusative-definite-nominative-plural":"fundașii","dative-genitive-indefinite-singular":"fundaș","dative-definite-genitive-singular":"fundașului","dative-genitive-indefinite-plural":"fundași","dative-definite-genitive-plural":"fundașilor","singular-vocative":"fundașule","plural-vocative":"fundașilor"}},{"word":"fundase","pos":"verb","definitions":["third-person singular pluperfect indicative of funda"],"pronunciation":"[funˈdase]"},{"word":"fundași","pos":"noun","definitions":["plural of fundaș"],"pronunciation":"[funˈdaʃʲ]"},{"word":"fundași","pos":"verb","definitions":["second-person singular simple perfect indicative of funda"],"pronunciation":"[funˈdaʃʲ]"},{"word":"fundat","pos":"verb","definitions":["past participle of funda"],"pronunciation":"[funˈdat]"},{"word":"fundat","pos":"adj","definitions":["alternative form of fondat"],"pronunciation":"[funˈdat]","forms":{"feminine-singular":"fundată","masculine-plural":"fundați","feminine-neuter-plural":"fundate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fundat","error-unrecognized-form-feminine-indefinite-singular":"fundată","error-unrecognized-form-indefinite-masculine-plural":"fundați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fundate","definite-error-unrecognized-form-masculine-neuter-singular":"fundatul","definite-error-unrecognized-form-feminine-singular":"fundata","definite-error-unrecognized-form-masculine-plural":"fundații","definite-error-unrecognized-form-feminine-neuter-plural":"fundatele"}},{"word":"Fundata","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Fundata, Brașov County, Romania","a village in Lopătari, Buzău County, Romania","a village in Perieți, Ialomița County, Romania"],"gender":"f"},{"word":"Fundățeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fundățeanu"}},{"word":"Fundățica","pos":"name","definitions":["a village in Fundata, Brașov County, Romania"],"gender":"f"},{"word":"fundație","pos":"noun","definitions":["foundation"],"pronunciation":"/funˈdat͡si.e/","forms":{"plural":"fundații"}},{"word":"fundațiune","pos":"noun","definitions":["alternative form of fundație"],"forms":{"plural":"fundațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fundațiune","accusative-definite-nominative-singular":"fundațiunea","accusative-indefinite-nominative-plural":"fundațiuni","accusative-definite-nominative-plural":"fundațiunile","dative-genitive-indefinite-singular":"fundațiuni","dative-definite-genitive-singular":"fundațiunii","dative-genitive-indefinite-plural":"fundațiuni","dative-definite-genitive-plural":"fundațiunilor","singular-vocative":"fundațiune","plural-vocative":"fundațiunilor"}},{"word":"fundatoare","pos":"noun","definitions":["female equivalent of fundator"],"forms":{"plural":"fundatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fundatoare","accusative-definite-nominative-singular":"fundatoarea","accusative-indefinite-nominative-plural":"fundatoare","accusative-definite-nominative-plural":"fundatoarele","dative-genitive-indefinite-singular":"fundatoare","dative-definite-genitive-singular":"fundatoarei","dative-genitive-indefinite-plural":"fundatoare","dative-definite-genitive-plural":"fundatoarelor","singular-vocative":"fundatoare","plural-vocative":"fundatoarelor"}},{"word":"fundator","pos":"noun","definitions":["alternative form of fondator"],"forms":{"plural":"fundatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fundator","accusative-definite-nominative-singular":"fundatorul","accusative-indefinite-nominative-plural":"fundatori","accusative-definite-nominative-plural":"fundatorii","dative-genitive-indefinite-singular":"fundator","dative-definite-genitive-singular":"fundatorului","dative-genitive-indefinite-plural":"fundatori","dative-definite-genitive-plural":"fundatorilor","singular-vocative":"fundatorule","plural-vocative":"fundatorilor"}},{"word":"Fundătura","pos":"name","definitions":["a village in Motoșeni, Bacău County, Romania","a village in Iclod, Cluj County, Romania","a locality in Luduș, Mureș County, Romania","a village in Arsura, Vaslui County, Romania","a village in Delești, Vaslui County, Romania"],"gender":"f"},{"word":"fundătura","pos":"noun","definitions":["definite nominative/accusative singular of fundătură"]},{"word":"fundătură","pos":"noun","definitions":["blind alley"],"forms":{"plural":"fundături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"fundătură","accusative-definite-nominative-singular":"fundătura","accusative-indefinite-nominative-plural":"fundături","accusative-definite-nominative-plural":"fundăturile","dative-genitive-indefinite-singular":"fundături","dative-definite-genitive-singular":"fundăturii","dative-genitive-indefinite-plural":"fundături","dative-definite-genitive-plural":"fundăturilor","singular-vocative":"fundătură","plural-vocative":"fundăturilor"}},{"word":"Fundătura Mare","pos":"name","definitions":["a village in Ivănești, Vaslui County, Romania"],"gender":"f"},{"word":"Fundătura Mică","pos":"name","definitions":["a village in Ivănești, Vaslui County, Romania"],"gender":"f"},{"word":"Fundătura Răchitoasa","pos":"name","definitions":["a village in Răchitoasa, Bacău County, Romania"],"gender":"f"},{"word":"Fundătureanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Fundătureanu"}},{"word":"Fundăturile","pos":"name","definitions":["a village in Pătârlagele, Buzău County, Romania"],"gender":"f"},{"word":"Fundeanu","pos":"name","definitions":["a village in Drăgușeni, Galați County, Romania"],"gender":"m"},{"word":"Fundeni","pos":"name","definitions":["a village in Secuieni, Bacău County, Romania","a village in Zărnești, Buzău County, Romania","a commune of Călărași County, Romania","a village in Fundeni, Călărași County, Romania","a commune of Galați County, Romania"],"gender":"m"},{"word":"Fundenii Noi","pos":"name","definitions":["a village in Fundeni, Galați County, Romania"],"gender":"m"},{"word":"fundici","pos":"noun","definitions":["synonym of alun, hazel (tree Corylus avellana)"],"forms":{"plural":"fundici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fundici","accusative-definite-nominative-singular":"fundiciul","accusative-indefinite-nominative-plural":"fundici","accusative-definite-nominative-plural":"fundicii","dative-genitive-indefinite-singular":"fundici","dative-definite-genitive-singular":"fundiciului","dative-genitive-indefinite-plural":"fundici","dative-definite-genitive-plural":"fundicilor","singular-vocative":"fundiciule","plural-vocative":"fundicilor"}},{"word":"fundiță","pos":"noun","definitions":["diminutive of fundă"],"forms":{"plural":"fundițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fundiță","accusative-definite-nominative-singular":"fundița","accusative-indefinite-nominative-plural":"fundițe","accusative-definite-nominative-plural":"fundițele","dative-genitive-indefinite-singular":"fundițe","dative-definite-genitive-singular":"fundiței","dative-genitive-indefinite-plural":"fundițe","dative-definite-genitive-plural":"fundițelor","singular-vocative":"fundiță","plural-vocative":"fundițelor"}},{"word":"Fundoaia","pos":"name","definitions":["a village in Huruiești, Bacău County, Romania","a village in Sărmaș, Harghita County, Romania","a village in Gurghiu, Mureș County, Romania"],"gender":"f"},{"word":"Fundu Herții","pos":"name","definitions":["a village in Cristinești, Botoșani County, Romania"],"gender":"m"},{"word":"Fundu Moldovei","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Fundu Moldovei, Suceava County, Romania"],"gender":"m"},{"word":"Fundu Răcăciuni","pos":"name","definitions":["a village in Răcăciuni, Bacău County, Romania"],"gender":"m"},{"word":"Fundu Tutovei","pos":"name","definitions":["a village in Plopana, Bacău County, Romania"],"gender":"m"},{"word":"Fundu Văii","pos":"name","definitions":["a village in Pâncești, Bacău County, Romania","a village in Lipovăț, Vaslui County, Romania","a village in Poienești, Vaslui County, Romania"],"gender":"m"},{"word":"Funduc","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Funduc"}},{"word":"funduc","pos":"noun","definitions":["Ottoman gold coin"],"forms":{"plural":"funduci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funduc","accusative-definite-nominative-singular":"funducul","accusative-indefinite-nominative-plural":"funduci","accusative-definite-nominative-plural":"funducii","dative-genitive-indefinite-singular":"funduc","dative-definite-genitive-singular":"funducului","dative-genitive-indefinite-plural":"funduci","dative-definite-genitive-plural":"funducilor","singular-vocative":"funducule","plural-vocative":"funducilor"}},{"word":"funducliu","pos":"noun","definitions":["an Ottoman coin"],"forms":{"plural":"funduclii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funducliu","accusative-definite-nominative-singular":"funducliuul","accusative-indefinite-nominative-plural":"funduclii","accusative-definite-nominative-plural":"funducliii","dative-genitive-indefinite-singular":"funducliu","dative-definite-genitive-singular":"funducliuului","dative-genitive-indefinite-plural":"funduclii","dative-definite-genitive-plural":"funducliilor","singular-vocative":"funducliuule","plural-vocative":"funducliilor"}},{"word":"Fundul Galbenei","pos":"name","definitions":["a village in Fundul Galbenei, Hîncești Raion, Moldova","a commune of Hîncești Raion, Moldova"],"gender":"m"},{"word":"Fundul Pârâului","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Negru"],"gender":"m"},{"word":"Fundulea","pos":"name","definitions":["a town in Călărași County, Romania"],"gender":"f"},{"word":"funduleț","pos":"noun","definitions":["diminutive of fund"],"forms":{"plural":"fundulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"funduleț","accusative-definite-nominative-singular":"fundulețul","accusative-indefinite-nominative-plural":"fundulețe","accusative-definite-nominative-plural":"fundulețele","dative-genitive-indefinite-singular":"funduleț","dative-definite-genitive-singular":"fundulețului","dative-genitive-indefinite-plural":"fundulețe","dative-definite-genitive-plural":"fundulețelor","singular-vocative":"fundulețule","plural-vocative":"fundulețelor"}},{"word":"Funduri","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Grebănu"],"gender":"m"},{"word":"funduri","pos":"noun","definitions":["plural of fund"],"gender":"n"},{"word":"Fundurii Noi","pos":"name","definitions":["a village in Fundurii Noi, Glodeni Raion, Moldova","a commune of Glodeni Raion, Moldova"],"gender":"m"},{"word":"Fundurii Vechi","pos":"name","definitions":["a village in Fundurii Vechi, Glodeni Raion, Moldova","a commune of Glodeni Raion, Moldova"],"gender":"m"},{"word":"fundurilor","pos":"noun","definitions":["definite genitive/dative plural of fund"]},{"word":"funduț","pos":"noun","definitions":["diminutive of fund"],"forms":{"plural":"funduțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"funduț","accusative-definite-nominative-singular":"funduțul","accusative-indefinite-nominative-plural":"funduțuri","accusative-definite-nominative-plural":"funduțurile","dative-genitive-indefinite-singular":"funduț","dative-definite-genitive-singular":"funduțului","dative-genitive-indefinite-plural":"funduțuri","dative-definite-genitive-plural":"funduțurilor","singular-vocative":"funduțule","plural-vocative":"funduțurilor"}},{"word":"funea","pos":"noun","definitions":["diminutive of fune"],"forms":{"plural":"funele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"funea","accusative-definite-nominative-singular":"funeaua","accusative-indefinite-nominative-plural":"funele","accusative-definite-nominative-plural":"funelele","dative-genitive-indefinite-singular":"funele","dative-definite-genitive-singular":"funelei","dative-genitive-indefinite-plural":"funele","dative-definite-genitive-plural":"funelelor","singular-vocative":"funea","plural-vocative":"funelelor"}},{"word":"funebru","pos":"adj","definitions":["funeral, funerary","funereal, mournful","gloomy"],"forms":{"feminine-singular":"funebră","masculine-plural":"funebri","feminine-neuter-plural":"funebre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funebru","error-unrecognized-form-feminine-indefinite-singular":"funebră","error-unrecognized-form-indefinite-masculine-plural":"funebri","error-unrecognized-form-feminine-indefinite-neuter-plural":"funebre","definite-error-unrecognized-form-masculine-neuter-singular":"funebrul","definite-error-unrecognized-form-feminine-singular":"funebra","definite-error-unrecognized-form-masculine-plural":"funebrii","definite-error-unrecognized-form-feminine-neuter-plural":"funebrele"}},{"word":"funeralii","pos":"noun","definitions":["funeral"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"funeralii","accusative-definite-nominative":"funeraliiul","dative-genitive-indefinite":"funeralii","dative-definite-genitive":"funeraliiului","vocative":"funeraliiule"}},{"word":"funerar","pos":"adj","definitions":["funerary, funeral"],"forms":{"feminine-singular":"funerară","masculine-plural":"funerari","feminine-neuter-plural":"funerare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funerar","error-unrecognized-form-feminine-indefinite-singular":"funerară","error-unrecognized-form-indefinite-masculine-plural":"funerari","error-unrecognized-form-feminine-indefinite-neuter-plural":"funerare","definite-error-unrecognized-form-masculine-neuter-singular":"funerarul","definite-error-unrecognized-form-feminine-singular":"funerara","definite-error-unrecognized-form-masculine-plural":"funerarii","definite-error-unrecognized-form-feminine-neuter-plural":"funerarele"}},{"word":"Funeriu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Funeriu"}},{"word":"funest","pos":"adj","definitions":["fatal, deadly"],"forms":{"feminine-singular":"funestă","masculine-plural":"funești","feminine-neuter-plural":"funeste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funest","error-unrecognized-form-feminine-indefinite-singular":"funestă","error-unrecognized-form-indefinite-masculine-plural":"funești","error-unrecognized-form-feminine-indefinite-neuter-plural":"funeste","definite-error-unrecognized-form-masculine-neuter-singular":"funestul","definite-error-unrecognized-form-feminine-singular":"funesta","definite-error-unrecognized-form-masculine-plural":"funeștii","definite-error-unrecognized-form-feminine-neuter-plural":"funestele"}},{"word":"fungi","pos":"noun","definitions":["fungus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"fungi","accusative-definite-nominative":"fungii","dative-genitive-indefinite":"fungi","dative-definite-genitive":"fungilor","vocative":"fungilor"}},{"word":"fungibil","pos":"adj","definitions":["fungible"],"forms":{"feminine-singular":"fungibilă","masculine-plural":"fungibili","feminine-neuter-plural":"fungibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fungibil","error-unrecognized-form-feminine-indefinite-singular":"fungibilă","error-unrecognized-form-indefinite-masculine-plural":"fungibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fungibile","definite-error-unrecognized-form-masculine-neuter-singular":"fungibilul","definite-error-unrecognized-form-feminine-singular":"fungibila","definite-error-unrecognized-form-masculine-plural":"fungibilii","definite-error-unrecognized-form-feminine-neuter-plural":"fungibilele"}},{"word":"fungic","pos":"adj","definitions":["fungal"],"forms":{"feminine-singular":"fungică","masculine-plural":"fungici","feminine-neuter-plural":"fungice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fungic","error-unrecognized-form-feminine-indefinite-singular":"fungică","error-unrecognized-form-indefinite-masculine-plural":"fungici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fungice","definite-error-unrecognized-form-masculine-neuter-singular":"fungicul","definite-error-unrecognized-form-feminine-singular":"fungica","definite-error-unrecognized-form-masculine-plural":"fungicii","definite-error-unrecognized-form-feminine-neuter-plural":"fungicele"}},{"word":"fungicid","pos":"noun","definitions":["fungicide"],"forms":{"plural":"fungicide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fungicid","accusative-definite-nominative-singular":"fungicidul","accusative-indefinite-nominative-plural":"fungicide","accusative-definite-nominative-plural":"fungicidele","dative-genitive-indefinite-singular":"fungicid","dative-definite-genitive-singular":"fungicidului","dative-genitive-indefinite-plural":"fungicide","dative-definite-genitive-plural":"fungicidelor","singular-vocative":"fungicidule","plural-vocative":"fungicidelor"}},{"word":"fungiform","pos":"adj","definitions":["fungiform"],"forms":{"feminine-singular":"fungiformă","masculine-plural":"fungiformi","feminine-neuter-plural":"fungiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fungiform","error-unrecognized-form-feminine-indefinite-singular":"fungiformă","error-unrecognized-form-indefinite-masculine-plural":"fungiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fungiforme","definite-error-unrecognized-form-masculine-neuter-singular":"fungiformul","definite-error-unrecognized-form-feminine-singular":"fungiforma","definite-error-unrecognized-form-masculine-plural":"fungiformii","definite-error-unrecognized-form-feminine-neuter-plural":"fungiformele"}},{"word":"fungistatic","pos":"adj","definitions":["fungistatic"],"forms":{"feminine-singular":"fungistatică","masculine-plural":"fungistatici","feminine-neuter-plural":"fungistatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fungistatic","error-unrecognized-form-feminine-indefinite-singular":"fungistatică","error-unrecognized-form-indefinite-masculine-plural":"fungistatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"fungistatice","definite-error-unrecognized-form-masculine-neuter-singular":"fungistaticul","definite-error-unrecognized-form-feminine-singular":"fungistatica","definite-error-unrecognized-form-masculine-plural":"fungistaticii","definite-error-unrecognized-form-feminine-neuter-plural":"fungistaticele"}},{"word":"fungistatic","pos":"noun","definitions":["fungistatic material"],"forms":{"plural":"fungistatici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fungistatic","accusative-definite-nominative-singular":"fungistaticul","accusative-indefinite-nominative-plural":"fungistatici","accusative-definite-nominative-plural":"fungistaticile","dative-genitive-indefinite-singular":"fungistatic","dative-definite-genitive-singular":"fungistaticului","dative-genitive-indefinite-plural":"fungistatici","dative-definite-genitive-plural":"fungistaticilor","singular-vocative":"fungistaticule","plural-vocative":"fungistaticilor"}},{"word":"fungoid","pos":"adj","definitions":["fungoid, fungiform"],"forms":{"feminine-singular":"fungoidă","masculine-plural":"fungoizi","feminine-neuter-plural":"fungoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fungoid","error-unrecognized-form-feminine-indefinite-singular":"fungoidă","error-unrecognized-form-indefinite-masculine-plural":"fungoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fungoide","definite-error-unrecognized-form-masculine-neuter-singular":"fungoidul","definite-error-unrecognized-form-feminine-singular":"fungoida","definite-error-unrecognized-form-masculine-plural":"fungoizii","definite-error-unrecognized-form-feminine-neuter-plural":"fungoidele"}},{"word":"fungozitate","pos":"noun","definitions":["fungosity"],"forms":{"plural":"fungozitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fungozitate","accusative-definite-nominative-singular":"fungozitatea","accusative-indefinite-nominative-plural":"fungozitatăți","accusative-definite-nominative-plural":"fungozitatățile","dative-genitive-indefinite-singular":"fungozitatăți","dative-definite-genitive-singular":"fungozitatății","dative-genitive-indefinite-plural":"fungozitatăți","dative-definite-genitive-plural":"fungozitatăților","singular-vocative":"fungozitate","plural-vocative":"fungozitatăților"}},{"word":"funicea","pos":"noun","definitions":["diminutive of funie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative":"funicea","accusative-definite-nominative":"funiceaua","dative-genitive-indefinite":"funicele","dative-definite-genitive":"funicelei","vocative":"funicea"}},{"word":"funicică","pos":"noun","definitions":["diminutive of funie"],"forms":{"plural":"funicicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funicică","accusative-definite-nominative-singular":"funicica","accusative-indefinite-nominative-plural":"funicicele","accusative-definite-nominative-plural":"funicicelele","dative-genitive-indefinite-singular":"funicicele","dative-definite-genitive-singular":"funicicelei","dative-genitive-indefinite-plural":"funicicele","dative-definite-genitive-plural":"funicicelelor","singular-vocative":"funicică","plural-vocative":"funicicelelor"}},{"word":"funicul","pos":"noun","definitions":["funiculus"],"forms":{"plural":"funiculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funicul","accusative-definite-nominative-singular":"funiculul","accusative-indefinite-nominative-plural":"funiculi","accusative-definite-nominative-plural":"funiculii","dative-genitive-indefinite-singular":"funicul","dative-definite-genitive-singular":"funiculului","dative-genitive-indefinite-plural":"funiculi","dative-definite-genitive-plural":"funiculilor","singular-vocative":"funiculule","plural-vocative":"funiculilor"}},{"word":"funicular","pos":"noun","definitions":["rope railway"],"pronunciation":"[fu.ni.kuˈlaʳ]","gender":"n"},{"word":"funicularist","pos":"noun","definitions":["funicular railway operator"],"forms":{"plural":"funiculariști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funicularist","accusative-definite-nominative-singular":"funicularistul","accusative-indefinite-nominative-plural":"funiculariști","accusative-definite-nominative-plural":"funiculariștii","dative-genitive-indefinite-singular":"funicularist","dative-definite-genitive-singular":"funicularistului","dative-genitive-indefinite-plural":"funiculariști","dative-definite-genitive-plural":"funiculariștilor","singular-vocative":"funicularistule","plural-vocative":"funiculariștilor"}},{"word":"funicularistă","pos":"noun","definitions":["female equivalent of funicularist"],"forms":{"plural":"funiculariste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funicularistă","accusative-definite-nominative-singular":"funicularista","accusative-indefinite-nominative-plural":"funiculariste","accusative-definite-nominative-plural":"funicularistele","dative-genitive-indefinite-singular":"funiculariste","dative-definite-genitive-singular":"funicularistei","dative-genitive-indefinite-plural":"funiculariste","dative-definite-genitive-plural":"funicularistelor","singular-vocative":"funicularistă","plural-vocative":"funicularistelor"}},{"word":"funiculită","pos":"noun","definitions":["funiculitis"],"forms":{"plural":"funiculite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funiculită","accusative-definite-nominative-singular":"funiculita","accusative-indefinite-nominative-plural":"funiculite","accusative-definite-nominative-plural":"funiculitele","dative-genitive-indefinite-singular":"funiculite","dative-definite-genitive-singular":"funiculitei","dative-genitive-indefinite-plural":"funiculite","dative-definite-genitive-plural":"funiculitelor","singular-vocative":"funiculită","plural-vocative":"funiculitelor"}},{"word":"Funie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Funie"}},{"word":"funie","pos":"noun","definitions":["rope, cord"],"forms":{"plural":"funii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"funie","accusative-definite-nominative-singular":"funia","accusative-indefinite-nominative-plural":"funii","accusative-definite-nominative-plural":"funiile","dative-genitive-indefinite-singular":"funii","dative-definite-genitive-singular":"funiei","dative-genitive-indefinite-plural":"funii","dative-definite-genitive-plural":"funiilor","singular-vocative":"funie","plural-vocative":"funiilor"}},{"word":"funier","pos":"noun","definitions":["ropemaker"],"forms":{"plural":"funieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funier","accusative-definite-nominative-singular":"funierul","accusative-indefinite-nominative-plural":"funieri","accusative-definite-nominative-plural":"funierii","dative-genitive-indefinite-singular":"funier","dative-definite-genitive-singular":"funierului","dative-genitive-indefinite-plural":"funieri","dative-definite-genitive-plural":"funierilor","singular-vocative":"funierule","plural-vocative":"funierilor"}},{"word":"Funieru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Funieru"}},{"word":"funigel","pos":"noun","definitions":["gossamer (strand of cobweb floating in the air)"],"forms":{"plural":"funigei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funigel","accusative-definite-nominative-singular":"funigelul","accusative-indefinite-nominative-plural":"funigei","accusative-definite-nominative-plural":"funigeii","dative-genitive-indefinite-singular":"funigel","dative-definite-genitive-singular":"funigelului","dative-genitive-indefinite-plural":"funigei","dative-definite-genitive-plural":"funigeilor","singular-vocative":"funigelule","plural-vocative":"funigeilor"}},{"word":"funinginat","pos":"adj","definitions":["sooty"],"forms":{"feminine-singular":"funinginată","masculine-plural":"funinginați","feminine-neuter-plural":"funinginate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funinginat","error-unrecognized-form-feminine-indefinite-singular":"funinginată","error-unrecognized-form-indefinite-masculine-plural":"funinginați","error-unrecognized-form-feminine-indefinite-neuter-plural":"funinginate","definite-error-unrecognized-form-masculine-neuter-singular":"funinginatul","definite-error-unrecognized-form-feminine-singular":"funinginata","definite-error-unrecognized-form-masculine-plural":"funinginații","definite-error-unrecognized-form-feminine-neuter-plural":"funinginatele"}},{"word":"funingine","pos":"noun","definitions":["soot, lampblack, smut"],"forms":{"plural":"funingini"}},{"word":"funinginos","pos":"adj","definitions":["sooty"],"forms":{"feminine-singular":"funinginoasă","masculine-plural":"funinginoși","feminine-neuter-plural":"funinginoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"funinginos","error-unrecognized-form-feminine-indefinite-singular":"funinginoasă","error-unrecognized-form-indefinite-masculine-plural":"funinginoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"funinginoase","definite-error-unrecognized-form-masculine-neuter-singular":"funinginosul","definite-error-unrecognized-form-feminine-singular":"funinginoasa","definite-error-unrecognized-form-masculine-plural":"funinginoșii","definite-error-unrecognized-form-feminine-neuter-plural":"funinginoasele"}},{"word":"funioară","pos":"noun","definitions":["diminutive of funie; small rope"],"forms":{"plural":"funioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funioară","accusative-definite-nominative-singular":"funioara","accusative-indefinite-nominative-plural":"funioare","accusative-definite-nominative-plural":"funioarele","dative-genitive-indefinite-singular":"funioare","dative-definite-genitive-singular":"funioarei","dative-genitive-indefinite-plural":"funioare","dative-definite-genitive-plural":"funioarelor","singular-vocative":"funioară","plural-vocative":"funioarelor"}},{"word":"funișoară","pos":"noun","definitions":["diminutive of funie"],"forms":{"plural":"funișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funișoară","accusative-definite-nominative-singular":"funișoara","accusative-indefinite-nominative-plural":"funișoare","accusative-definite-nominative-plural":"funișoarele","dative-genitive-indefinite-singular":"funișoare","dative-definite-genitive-singular":"funișoarei","dative-genitive-indefinite-plural":"funișoare","dative-definite-genitive-plural":"funișoarelor","singular-vocative":"funișoară","plural-vocative":"funișoarelor"}},{"word":"funiuță","pos":"noun","definitions":["diminutive of funie"],"forms":{"plural":"funiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"funiuță","accusative-definite-nominative-singular":"funiuța","accusative-indefinite-nominative-plural":"funiuțe","accusative-definite-nominative-plural":"funiuțele","dative-genitive-indefinite-singular":"funiuțe","dative-definite-genitive-singular":"funiuței","dative-genitive-indefinite-plural":"funiuțe","dative-definite-genitive-plural":"funiuțelor","singular-vocative":"funiuță","plural-vocative":"funiuțelor"}},{"word":"funt","pos":"noun","definitions":["alternative form of pfund"],"forms":{"plural":"funți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"funt","accusative-definite-nominative-singular":"funtul","accusative-indefinite-nominative-plural":"funți","accusative-definite-nominative-plural":"funții","dative-genitive-indefinite-singular":"funt","dative-definite-genitive-singular":"funtului","dative-genitive-indefinite-plural":"funți","dative-definite-genitive-plural":"funților","singular-vocative":"funtule","plural-vocative":"funților"}},{"word":"fur","pos":"verb","definitions":["first-person singular present indicative/subjunctive of fura"],"pronunciation":"[fur]"},{"word":"fur","pos":"noun","definitions":["thief"],"pronunciation":"[fur]","forms":{"plural":"furi"}},{"word":"fura","pos":"verb","definitions":["to steal","to defraud, to steal from someone","synonym of furișa (“to sneak”)"],"pronunciation":"/fuˈra/","forms":{"canonical":"a fura 1st conjugation","present-singular-third-person":"fură","participle-past":"furat","subjunctive-third-person":"fure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a fura","gerund":"furând","first-person-indicative-present-singular":"fur","indicative-present-second-person-singular":"furi","indicative-present-singular-third-person":"fură","first-person-indicative-plural-present":"furăm","indicative-plural-present-second-person":"furați","indicative-plural-present-third-person":"fură","first-person-imperfect-indicative-singular":"furam","imperfect-indicative-second-person-singular":"furai","imperfect-indicative-singular-third-person":"fura","first-person-imperfect-indicative-plural":"furam","imperfect-indicative-plural-second-person":"furați","imperfect-indicative-plural-third-person":"furau","first-person-indicative-perfect-singular":"furai","indicative-perfect-second-person-singular":"furași","indicative-perfect-singular-third-person":"fură","first-person-indicative-perfect-plural":"furarăm","indicative-perfect-plural-second-person":"furarăți","indicative-perfect-plural-third-person":"furară","first-person-indicative-pluperfect-singular":"furasem","indicative-pluperfect-second-person-singular":"furaseși","indicative-pluperfect-singular-third-person":"furase","first-person-indicative-pluperfect-plural":"furaserăm","indicative-pluperfect-plural-second-person":"furaserăți","indicative-pluperfect-plural-third-person":"furaseră","first-person-present-singular-subjunctive":"să fur","present-second-person-singular-subjunctive":"să furi","present-singular-subjunctive-third-person":"să fure","first-person-plural-present-subjunctive":"să furăm","plural-present-second-person-subjunctive":"să furați","plural-present-subjunctive-third-person":"să fure","imperative-second-person-singular":"fură","imperative-plural-second-person":"furați","imperative-negative-second-person-singular":"nu fura","imperative-negative-plural-second-person":"nu furați"}},{"word":"fură","pos":"verb","definitions":["inflection of fura:","third-person singular/plural present indicative","third-person singular simple perfect indicative","second-person singular imperative"],"pronunciation":"[ˈfurə]"},{"word":"fură","pos":"verb","definitions":["third-person plural simple perfect indicative of fi"],"pronunciation":"[ˈfurə]"},{"word":"fura inima","pos":"verb","definitions":["to steal someone's heart"],"forms":{"canonical":"a fura inima 1st conjugation","present-singular-third-person":"fură inima","participle-past":"furat inima","subjunctive-third-person":"fure inima"}},{"word":"furăciune","pos":"noun","definitions":["theft"],"forms":{"plural":"furăciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furăciune","accusative-definite-nominative-singular":"furăciunea","accusative-indefinite-nominative-plural":"furăciuni","accusative-definite-nominative-plural":"furăciunile","dative-genitive-indefinite-singular":"furăciuni","dative-definite-genitive-singular":"furăciunii","dative-genitive-indefinite-plural":"furăciuni","dative-definite-genitive-plural":"furăciunilor","singular-vocative":"furăciune","plural-vocative":"furăciunilor"}},{"word":"furai","pos":"verb","definitions":["inflection of fura:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[fuˈraj]"},{"word":"furaj","pos":"noun","definitions":["fodder"],"forms":{"plural":"furaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furaj","accusative-definite-nominative-singular":"furajul","accusative-indefinite-nominative-plural":"furaje","accusative-definite-nominative-plural":"furajele","dative-genitive-indefinite-singular":"furaj","dative-definite-genitive-singular":"furajului","dative-genitive-indefinite-plural":"furaje","dative-definite-genitive-plural":"furajelor","singular-vocative":"furajule","plural-vocative":"furajelor"}},{"word":"furaja","pos":"verb","definitions":["to fodder, to feed animals"],"forms":{"canonical":"a furaja 1st conjugation","present-singular-third-person":"furajează","participle-past":"furajat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a furaja","gerund":"furajând","first-person-indicative-present-singular":"furajez","indicative-present-second-person-singular":"furajezi","indicative-present-singular-third-person":"furajează","first-person-indicative-plural-present":"furajăm","indicative-plural-present-second-person":"furajați","indicative-plural-present-third-person":"furajează","first-person-imperfect-indicative-singular":"furajam","imperfect-indicative-second-person-singular":"furajai","imperfect-indicative-singular-third-person":"furaja","first-person-imperfect-indicative-plural":"furajam","imperfect-indicative-plural-second-person":"furajați","imperfect-indicative-plural-third-person":"furajau","first-person-indicative-perfect-singular":"furajai","indicative-perfect-second-person-singular":"furajași","indicative-perfect-singular-third-person":"furajă","first-person-indicative-perfect-plural":"furajarăm","indicative-perfect-plural-second-person":"furajarăți","indicative-perfect-plural-third-person":"furajară","first-person-indicative-pluperfect-singular":"furajasem","indicative-pluperfect-second-person-singular":"furajaseși","indicative-pluperfect-singular-third-person":"furajase","first-person-indicative-pluperfect-plural":"furajaserăm","indicative-pluperfect-plural-second-person":"furajaserăți","indicative-pluperfect-plural-third-person":"furajaseră","first-person-present-singular-subjunctive":"să furajez","present-second-person-singular-subjunctive":"să furajezi","present-singular-subjunctive-third-person":"să furajeze","first-person-plural-present-subjunctive":"să furajăm","plural-present-second-person-subjunctive":"să furajați","plural-present-subjunctive-third-person":"să furajeze","imperative-second-person-singular":"furajează","imperative-plural-second-person":"furajați","imperative-negative-second-person-singular":"nu furaja","imperative-negative-plural-second-person":"nu furajați"}},{"word":"furajare","pos":"noun","definitions":["feeding (an animal)"],"forms":{"plural":"furajări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furajare","accusative-definite-nominative-singular":"furajarea","accusative-indefinite-nominative-plural":"furajări","accusative-definite-nominative-plural":"furajările","dative-genitive-indefinite-singular":"furajări","dative-definite-genitive-singular":"furajării","dative-genitive-indefinite-plural":"furajări","dative-definite-genitive-plural":"furajărilor","singular-vocative":"furajare","plural-vocative":"furajărilor"}},{"word":"furajat","pos":"adj","definitions":["fed (about animals)"],"forms":{"feminine-singular":"furajată","masculine-plural":"furajați","feminine-neuter-plural":"furajate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furajat","error-unrecognized-form-feminine-indefinite-singular":"furajată","error-unrecognized-form-indefinite-masculine-plural":"furajați","error-unrecognized-form-feminine-indefinite-neuter-plural":"furajate","definite-error-unrecognized-form-masculine-neuter-singular":"furajatul","definite-error-unrecognized-form-feminine-singular":"furajata","definite-error-unrecognized-form-masculine-plural":"furajații","definite-error-unrecognized-form-feminine-neuter-plural":"furajatele"}},{"word":"furajer","pos":"adj","definitions":["fodder"],"forms":{"feminine-singular":"furajeră","masculine-plural":"furajeri","feminine-neuter-plural":"furajere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furajer","error-unrecognized-form-feminine-indefinite-singular":"furajeră","error-unrecognized-form-indefinite-masculine-plural":"furajeri","error-unrecognized-form-feminine-indefinite-neuter-plural":"furajere","definite-error-unrecognized-form-masculine-neuter-singular":"furajerul","definite-error-unrecognized-form-feminine-singular":"furajera","definite-error-unrecognized-form-masculine-plural":"furajerii","definite-error-unrecognized-form-feminine-neuter-plural":"furajerele"}},{"word":"furajieră","pos":"noun","definitions":["hay wagon"],"forms":{"plural":"furajiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furajieră","accusative-definite-nominative-singular":"furajiera","accusative-indefinite-nominative-plural":"furajiere","accusative-definite-nominative-plural":"furajierele","dative-genitive-indefinite-singular":"furajiere","dative-definite-genitive-singular":"furajierei","dative-genitive-indefinite-plural":"furajiere","dative-definite-genitive-plural":"furajierelor","singular-vocative":"furajieră","plural-vocative":"furajierelor"}},{"word":"furajor","pos":"noun","definitions":["forager"],"forms":{"plural":"furajori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furajor","accusative-definite-nominative-singular":"furajorul","accusative-indefinite-nominative-plural":"furajori","accusative-definite-nominative-plural":"furajorii","dative-genitive-indefinite-singular":"furajor","dative-definite-genitive-singular":"furajorului","dative-genitive-indefinite-plural":"furajori","dative-definite-genitive-plural":"furajorilor","singular-vocative":"furajorule","plural-vocative":"furajorilor"}},{"word":"furam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of fura"],"pronunciation":"[fuˈram]"},{"word":"furăm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of fura"],"pronunciation":"[fuˈrəm]"},{"word":"furăm","pos":"verb","definitions":["first-person plural simple perfect indicative of fi"],"pronunciation":"[fuˈrəm]"},{"word":"furan","pos":"noun","definitions":["furan"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"furan","accusative-definite-nominative":"furanul","dative-genitive-indefinite":"furan","dative-definite-genitive":"furanului","vocative":"furanule"}},{"word":"furând","pos":"verb","definitions":["gerund of fura"]},{"word":"furat","pos":"noun","definitions":["stealing"],"pronunciation":"[fuˈrat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"furat","accusative-definite-nominative":"furatul","dative-genitive-indefinite":"furat","dative-definite-genitive":"furatului","vocative":"furatule"}},{"word":"furat","pos":"verb","definitions":["past participle of fura"],"pronunciation":"[fuˈrat]","forms":{"participle-past":"of fura"}},{"word":"furăți","pos":"verb","definitions":["second-person plural simple perfect indicative of fi"],"pronunciation":"[ˈfu.rət͡sʲ]"},{"word":"furătoare","pos":"noun","definitions":["female equivalent of furător"],"forms":{"plural":"furătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"furătoare","accusative-definite-nominative-singular":"furătoarea","accusative-indefinite-nominative-plural":"furătoare","accusative-definite-nominative-plural":"furătoarele","dative-genitive-indefinite-singular":"furătoare","dative-definite-genitive-singular":"furătoarei","dative-genitive-indefinite-plural":"furătoare","dative-definite-genitive-plural":"furătoarelor","singular-vocative":"furătoare","plural-vocative":"furătoarelor"}},{"word":"furător","pos":"adj","definitions":["thieving"],"forms":{"feminine-singular":"furătoare","masculine-plural":"furători","feminine-neuter-plural":"furătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furător","error-unrecognized-form-feminine-indefinite-singular":"furătoare","error-unrecognized-form-indefinite-masculine-plural":"furători","error-unrecognized-form-feminine-indefinite-neuter-plural":"furătoare","definite-error-unrecognized-form-masculine-neuter-singular":"furătorul","definite-error-unrecognized-form-feminine-singular":"furătoarea","definite-error-unrecognized-form-masculine-plural":"furătorii","definite-error-unrecognized-form-feminine-neuter-plural":"furătoarele"}},{"word":"furătură","pos":"noun","definitions":["theft"],"forms":{"plural":"furături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furătură","accusative-definite-nominative-singular":"furătura","accusative-indefinite-nominative-plural":"furături","accusative-definite-nominative-plural":"furăturile","dative-genitive-indefinite-singular":"furături","dative-definite-genitive-singular":"furăturii","dative-genitive-indefinite-plural":"furături","dative-definite-genitive-plural":"furăturilor","singular-vocative":"furătură","plural-vocative":"furăturilor"}},{"word":"furbisa","pos":"verb","definitions":["to furbish"],"forms":{"canonical":"a furbisa 1st conjugation","present-singular-third-person":"furbisează","participle-past":"furbisat"}},{"word":"Furcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Furcă"}},{"word":"furcă","pos":"noun","definitions":["fork","pitchfork","distaff"],"forms":{"plural":"furci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furcă","accusative-definite-nominative-singular":"furca","accusative-indefinite-nominative-plural":"furci","accusative-definite-nominative-plural":"furcile","dative-genitive-indefinite-singular":"furci","dative-definite-genitive-singular":"furcii","dative-genitive-indefinite-plural":"furci","dative-definite-genitive-plural":"furcilor","singular-vocative":"furcă","plural-vocative":"furcilor"}},{"word":"furcat","pos":"adj","definitions":["furcated, forked"],"forms":{"feminine-singular":"furcată","masculine-plural":"furcați","feminine-neuter-plural":"furcate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furcat","error-unrecognized-form-feminine-indefinite-singular":"furcată","error-unrecognized-form-indefinite-masculine-plural":"furcați","error-unrecognized-form-feminine-indefinite-neuter-plural":"furcate","definite-error-unrecognized-form-masculine-neuter-singular":"furcatul","definite-error-unrecognized-form-feminine-singular":"furcata","definite-error-unrecognized-form-masculine-plural":"furcații","definite-error-unrecognized-form-feminine-neuter-plural":"furcatele"}},{"word":"furcătură","pos":"noun","definitions":["a bifurcation, branching, split, division (especially of a mountain chain)"],"forms":{"plural":"furcături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furcătură","accusative-definite-nominative-singular":"furcătura","accusative-indefinite-nominative-plural":"furcături","accusative-definite-nominative-plural":"furcăturile","dative-genitive-indefinite-singular":"furcături","dative-definite-genitive-singular":"furcăturii","dative-genitive-indefinite-plural":"furcături","dative-definite-genitive-plural":"furcăturilor","singular-vocative":"furcătură","plural-vocative":"furcăturilor"}},{"word":"furcea","pos":"noun","definitions":["little pitchfork"],"forms":{"plural":"furcele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"furcea","accusative-definite-nominative-singular":"furceaua","accusative-indefinite-nominative-plural":"furcele","accusative-definite-nominative-plural":"furcelele","dative-genitive-indefinite-singular":"furcele","dative-definite-genitive-singular":"furcelei","dative-genitive-indefinite-plural":"furcele","dative-definite-genitive-plural":"furcelelor","singular-vocative":"furcea","plural-vocative":"furcelelor"}},{"word":"furceluș","pos":"noun","definitions":["diminutive of furcel"],"forms":{"plural":"furceluși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furceluș","accusative-definite-nominative-singular":"furcelușul","accusative-indefinite-nominative-plural":"furceluși","accusative-definite-nominative-plural":"furcelușii","dative-genitive-indefinite-singular":"furceluș","dative-definite-genitive-singular":"furcelușului","dative-genitive-indefinite-plural":"furceluși","dative-definite-genitive-plural":"furcelușilor","singular-vocative":"furcelușule","plural-vocative":"furcelușilor"}},{"word":"Furceni","pos":"name","definitions":["a village in Ivancea, Orhei Raion, Moldova"],"gender":"m"},{"word":"Furcenii Noi","pos":"name","definitions":["a village in Cosmești, Galați County, Romania"],"gender":"m"},{"word":"Furcenii Vechi","pos":"name","definitions":["a village in Cosmești, Galați County, Romania"],"gender":"m"},{"word":"furchet","pos":"noun","definitions":["rowlock, oarlock"],"forms":{"plural":"furcheți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furchet","accusative-definite-nominative-singular":"furchetul","accusative-indefinite-nominative-plural":"furcheți","accusative-definite-nominative-plural":"furcheții","dative-genitive-indefinite-singular":"furchet","dative-definite-genitive-singular":"furchetului","dative-genitive-indefinite-plural":"furcheți","dative-definite-genitive-plural":"furcheților","singular-vocative":"furchetule","plural-vocative":"furcheților"}},{"word":"furchiță","pos":"noun","definitions":["diminutive of furcă"],"forms":{"plural":"furchițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furchiță","accusative-definite-nominative-singular":"furchița","accusative-indefinite-nominative-plural":"furchițe","accusative-definite-nominative-plural":"furchițele","dative-genitive-indefinite-singular":"furchițe","dative-definite-genitive-singular":"furchiței","dative-genitive-indefinite-plural":"furchițe","dative-definite-genitive-plural":"furchițelor","singular-vocative":"furchiță","plural-vocative":"furchițelor"}},{"word":"furcoi","pos":"noun","definitions":["augmentative of furcă"],"forms":{"plural":"furcoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furcoi","accusative-definite-nominative-singular":"furcoiul","accusative-indefinite-nominative-plural":"furcoaie","accusative-definite-nominative-plural":"furcoaiele","dative-genitive-indefinite-singular":"furcoi","dative-definite-genitive-singular":"furcoiului","dative-genitive-indefinite-plural":"furcoaie","dative-definite-genitive-plural":"furcoaielor","singular-vocative":"furcoiule","plural-vocative":"furcoaielor"}},{"word":"Furcșoara","pos":"name","definitions":["a village in Brănișca, Hunedoara County, Romania"],"gender":"f"},{"word":"Furculeșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Furculeșteanu"}},{"word":"furculița","pos":"noun","definitions":["definite nominative/accusative singular of furculiță"]},{"word":"Furculiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Furculiță"}},{"word":"furculiță","pos":"noun","definitions":["fork (table utensil)"],"pronunciation":"[fur.kuˈli.t͡sə]","forms":{"plural":"furculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furculiță","accusative-definite-nominative-singular":"furculița","accusative-indefinite-nominative-plural":"furculițe","accusative-definite-nominative-plural":"furculițele","dative-genitive-indefinite-singular":"furculițe","dative-definite-genitive-singular":"furculiței","dative-genitive-indefinite-plural":"furculițe","dative-definite-genitive-plural":"furculițelor","singular-vocative":"furculiță","plural-vocative":"furculițelor"}},{"word":"furcușoară","pos":"noun","definitions":["diminutive of furcă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"furcușoară","accusative-definite-nominative":"furcușoara","dative-genitive-indefinite":"furcușoare","dative-definite-genitive":"furcușoarei","vocative":"furcușoară"}},{"word":"furcuță","pos":"noun","definitions":["diminutive of furcă; small fork"],"forms":{"plural":"furcuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furcuță","accusative-definite-nominative-singular":"furcuța","accusative-indefinite-nominative-plural":"furcuțe","accusative-definite-nominative-plural":"furcuțele","dative-genitive-indefinite-singular":"furcuțe","dative-definite-genitive-singular":"furcuței","dative-genitive-indefinite-plural":"furcuțe","dative-definite-genitive-plural":"furcuțelor","singular-vocative":"furcuță","plural-vocative":"furcuțelor"}},{"word":"furda","pos":"noun","definitions":["scrap"],"forms":{"plural":"furdale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"furda","accusative-definite-nominative-singular":"furdaua","accusative-indefinite-nominative-plural":"furdale","accusative-definite-nominative-plural":"furdalele","dative-genitive-indefinite-singular":"furdale","dative-definite-genitive-singular":"furdalei","dative-genitive-indefinite-plural":"furdale","dative-definite-genitive-plural":"furdalelor","singular-vocative":"furda","plural-vocative":"furdalelor"}},{"word":"furdoană","pos":"noun","definitions":["drill"],"forms":{"plural":"furdoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furdoană","accusative-definite-nominative-singular":"furdoana","accusative-indefinite-nominative-plural":"furdoane","accusative-definite-nominative-plural":"furdoanele","dative-genitive-indefinite-singular":"furdoane","dative-definite-genitive-singular":"furdoanei","dative-genitive-indefinite-plural":"furdoane","dative-definite-genitive-plural":"furdoanelor","singular-vocative":"furdoană","plural-vocative":"furdoanelor"}},{"word":"Furduești","pos":"name","definitions":["a village in Rătești, Argeș County, Romania"],"gender":"m"},{"word":"Furduiești","pos":"name","definitions":["a locality in Câmpeni, Alba County, Romania","a village in Sohodol, Alba County, Romania"],"gender":"m"},{"word":"fure","pos":"verb","definitions":["third-person singular/plural present subjunctive of fura"],"pronunciation":"[ˈfure]"},{"word":"Furești","pos":"name","definitions":["a village in Dobrești, Argeș County, Romania"],"gender":"m"},{"word":"furfurol","pos":"noun","definitions":["furfural"],"forms":{"plural":"furfuroli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furfurol","accusative-definite-nominative-singular":"furfurolul","accusative-indefinite-nominative-plural":"furfuroli","accusative-definite-nominative-plural":"furfurolii","dative-genitive-indefinite-singular":"furfurol","dative-definite-genitive-singular":"furfurolului","dative-genitive-indefinite-plural":"furfuroli","dative-definite-genitive-plural":"furfurolilor","singular-vocative":"furfurolule","plural-vocative":"furfurolilor"}},{"word":"furgăseală","pos":"noun","definitions":["stealing"],"forms":{"plural":"furgăseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furgăseală","accusative-definite-nominative-singular":"furgăseala","accusative-indefinite-nominative-plural":"furgăsele","accusative-definite-nominative-plural":"furgăselele","dative-genitive-indefinite-singular":"furgăsele","dative-definite-genitive-singular":"furgăselei","dative-genitive-indefinite-plural":"furgăsele","dative-definite-genitive-plural":"furgăselelor","singular-vocative":"furgăseală","plural-vocative":"furgăselelor"}},{"word":"furgăsi","pos":"verb","definitions":["to steal"],"forms":{"canonical":"a furgăsi 4th conjugation","present-singular-third-person":"furgăsește","participle-past":"furgăsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a furgăsi","gerund":"furgăsind","first-person-indicative-present-singular":"furgăsesc","indicative-present-second-person-singular":"furgăsești","indicative-present-singular-third-person":"furgăsește","first-person-indicative-plural-present":"furgăsim","indicative-plural-present-second-person":"furgăsiți","indicative-plural-present-third-person":"furgăsesc","first-person-imperfect-indicative-singular":"furgăseam","imperfect-indicative-second-person-singular":"furgăseai","imperfect-indicative-singular-third-person":"furgăsea","first-person-imperfect-indicative-plural":"furgăseam","imperfect-indicative-plural-second-person":"furgăseați","imperfect-indicative-plural-third-person":"furgăseau","first-person-indicative-perfect-singular":"furgăsii","indicative-perfect-second-person-singular":"furgăsiși","indicative-perfect-singular-third-person":"furgăsi","first-person-indicative-perfect-plural":"furgăsirăm","indicative-perfect-plural-second-person":"furgăsirăți","indicative-perfect-plural-third-person":"furgăsiră","first-person-indicative-pluperfect-singular":"furgăsisem","indicative-pluperfect-second-person-singular":"furgăsiseși","indicative-pluperfect-singular-third-person":"furgăsise","first-person-indicative-pluperfect-plural":"furgăsiserăm","indicative-pluperfect-plural-second-person":"furgăsiserăți","indicative-pluperfect-plural-third-person":"furgăsiseră","first-person-present-singular-subjunctive":"să furgăsesc","present-second-person-singular-subjunctive":"să furgăsești","present-singular-subjunctive-third-person":"să furgăsească","first-person-plural-present-subjunctive":"să furgăsim","plural-present-second-person-subjunctive":"să furgăsiți","plural-present-subjunctive-third-person":"să furgăsească","imperative-second-person-singular":"furgăsește","imperative-plural-second-person":"furgăsiți","imperative-negative-second-person-singular":"nu furgăsi","imperative-negative-plural-second-person":"nu furgăsiți"}},{"word":"furgăsit","pos":"adj","definitions":["stolen"],"forms":{"feminine-singular":"furgăsită","masculine-plural":"furgăsiți","feminine-neuter-plural":"furgăsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furgăsit","error-unrecognized-form-feminine-indefinite-singular":"furgăsită","error-unrecognized-form-indefinite-masculine-plural":"furgăsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"furgăsite","definite-error-unrecognized-form-masculine-neuter-singular":"furgăsitul","definite-error-unrecognized-form-feminine-singular":"furgăsita","definite-error-unrecognized-form-masculine-plural":"furgăsiții","definite-error-unrecognized-form-feminine-neuter-plural":"furgăsitele"}},{"word":"furgăsit","pos":"verb","definitions":["past participle of furgăsi"],"forms":{"participle-past":"of furgăsi"}},{"word":"furgon","pos":"noun","definitions":["van"],"forms":{"plural":"furgoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furgon","accusative-definite-nominative-singular":"furgonul","accusative-indefinite-nominative-plural":"furgoane","accusative-definite-nominative-plural":"furgoanele","dative-genitive-indefinite-singular":"furgon","dative-definite-genitive-singular":"furgonului","dative-genitive-indefinite-plural":"furgoane","dative-definite-genitive-plural":"furgoanelor","singular-vocative":"furgonule","plural-vocative":"furgoanelor"}},{"word":"furgonar","pos":"noun","definitions":["van driver"],"forms":{"plural":"furgonari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furgonar","accusative-definite-nominative-singular":"furgonarul","accusative-indefinite-nominative-plural":"furgonari","accusative-definite-nominative-plural":"furgonarii","dative-genitive-indefinite-singular":"furgonar","dative-definite-genitive-singular":"furgonarului","dative-genitive-indefinite-plural":"furgonari","dative-definite-genitive-plural":"furgonarilor","singular-vocative":"furgonarule","plural-vocative":"furgonarilor"}},{"word":"furgonetă","pos":"noun","definitions":["van"],"forms":{"plural":"furgonete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furgonetă","accusative-definite-nominative-singular":"furgoneta","accusative-indefinite-nominative-plural":"furgonete","accusative-definite-nominative-plural":"furgonetele","dative-genitive-indefinite-singular":"furgonete","dative-definite-genitive-singular":"furgonetei","dative-genitive-indefinite-plural":"furgonete","dative-definite-genitive-plural":"furgonetelor","singular-vocative":"furgonetă","plural-vocative":"furgonetelor"}},{"word":"furi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of fura"],"pronunciation":"[furʲ]"},{"word":"furia","pos":"noun","definitions":["definite nominative/accusative singular of furie"],"pronunciation":"[ˈfuri.a]","gender":"f"},{"word":"furibund","pos":"adj","definitions":["furious"],"forms":{"feminine-singular":"furibundă","masculine-plural":"furibunzi","feminine-neuter-plural":"furibunde","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furibund","error-unrecognized-form-feminine-indefinite-singular":"furibundă","error-unrecognized-form-indefinite-masculine-plural":"furibunzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"furibunde","definite-error-unrecognized-form-masculine-neuter-singular":"furibundul","definite-error-unrecognized-form-feminine-singular":"furibunda","definite-error-unrecognized-form-masculine-plural":"furibunzii","definite-error-unrecognized-form-feminine-neuter-plural":"furibundele"}},{"word":"furie","pos":"noun","definitions":["wrath (great anger)","fury"],"forms":{"plural":"furii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"furie","accusative-definite-nominative-singular":"furia","accusative-indefinite-nominative-plural":"furii","accusative-definite-nominative-plural":"furiile","dative-genitive-indefinite-singular":"furii","dative-definite-genitive-singular":"furiei","dative-genitive-indefinite-plural":"furii","dative-definite-genitive-plural":"furiilor","singular-vocative":"furie","plural-vocative":"furiilor"}},{"word":"furier","pos":"noun","definitions":["fourrier"],"forms":{"plural":"furieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furier","accusative-definite-nominative-singular":"furierul","accusative-indefinite-nominative-plural":"furieri","accusative-definite-nominative-plural":"furierii","dative-genitive-indefinite-singular":"furier","dative-definite-genitive-singular":"furierului","dative-genitive-indefinite-plural":"furieri","dative-definite-genitive-plural":"furierilor","singular-vocative":"furierule","plural-vocative":"furierilor"}},{"word":"furio","pos":"noun","definitions":["vocative singular of furie"],"pronunciation":"[ˈfuri.o]","gender":"f"},{"word":"furios","pos":"adj","definitions":["furious"],"pronunciation":"/fu.riˈos/","forms":{"feminine-singular":"furioasă","masculine-plural":"furioși","feminine-neuter-plural":"furioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furios","error-unrecognized-form-feminine-indefinite-singular":"furioasă","error-unrecognized-form-indefinite-masculine-plural":"furioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"furioase","definite-error-unrecognized-form-masculine-neuter-singular":"furiosul","definite-error-unrecognized-form-feminine-singular":"furioasa","definite-error-unrecognized-form-masculine-plural":"furioșii","definite-error-unrecognized-form-feminine-neuter-plural":"furioasele"}},{"word":"furioso","pos":"adv","definitions":["furioso"]},{"word":"furioso","pos":"noun","definitions":["furioso"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"furioso","accusative-definite-nominative":"furiosoul","dative-genitive-indefinite":"furioso","dative-definite-genitive":"furiosoului","vocative":"furiosoule"}},{"word":"furiș","pos":"adj","definitions":["secret, hidden"],"forms":{"feminine-singular":"furișă","masculine-plural":"furiși","feminine-neuter-plural":"furișe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furiș","error-unrecognized-form-feminine-indefinite-singular":"furișă","error-unrecognized-form-indefinite-masculine-plural":"furiși","error-unrecognized-form-feminine-indefinite-neuter-plural":"furișe","definite-error-unrecognized-form-masculine-neuter-singular":"furișul","definite-error-unrecognized-form-feminine-singular":"furișa","definite-error-unrecognized-form-masculine-plural":"furișii","definite-error-unrecognized-form-feminine-neuter-plural":"furișele"}},{"word":"furișa","pos":"verb","definitions":["to sneak"],"forms":{"canonical":"a furișa 1st conjugation","present-singular-third-person":"furișează","participle-past":"furișat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a furișa","gerund":"furișând","first-person-indicative-present-singular":"furișez","indicative-present-second-person-singular":"furișezi","indicative-present-singular-third-person":"furișează","first-person-indicative-plural-present":"furișăm","indicative-plural-present-second-person":"furișați","indicative-plural-present-third-person":"furișează","first-person-imperfect-indicative-singular":"furișam","imperfect-indicative-second-person-singular":"furișai","imperfect-indicative-singular-third-person":"furișa","first-person-imperfect-indicative-plural":"furișam","imperfect-indicative-plural-second-person":"furișați","imperfect-indicative-plural-third-person":"furișau","first-person-indicative-perfect-singular":"furișai","indicative-perfect-second-person-singular":"furișași","indicative-perfect-singular-third-person":"furișă","first-person-indicative-perfect-plural":"furișarăm","indicative-perfect-plural-second-person":"furișarăți","indicative-perfect-plural-third-person":"furișară","first-person-indicative-pluperfect-singular":"furișasem","indicative-pluperfect-second-person-singular":"furișaseși","indicative-pluperfect-singular-third-person":"furișase","first-person-indicative-pluperfect-plural":"furișaserăm","indicative-pluperfect-plural-second-person":"furișaserăți","indicative-pluperfect-plural-third-person":"furișaseră","first-person-present-singular-subjunctive":"să furișez","present-second-person-singular-subjunctive":"să furișezi","present-singular-subjunctive-third-person":"să furișeze","first-person-plural-present-subjunctive":"să furișăm","plural-present-second-person-subjunctive":"să furișați","plural-present-subjunctive-third-person":"să furișeze","imperative-second-person-singular":"furișează","imperative-plural-second-person":"furișați","imperative-negative-second-person-singular":"nu furișa","imperative-negative-plural-second-person":"nu furișați"}},{"word":"furișare","pos":"noun","definitions":["creep, sneak"],"forms":{"plural":"furișări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furișare","accusative-definite-nominative-singular":"furișarea","accusative-indefinite-nominative-plural":"furișări","accusative-definite-nominative-plural":"furișările","dative-genitive-indefinite-singular":"furișări","dative-definite-genitive-singular":"furișării","dative-genitive-indefinite-plural":"furișări","dative-definite-genitive-plural":"furișărilor","singular-vocative":"furișare","plural-vocative":"furișărilor"}},{"word":"furișat","pos":"adj","definitions":["crept"],"forms":{"feminine-singular":"furișată","masculine-plural":"furișați","feminine-neuter-plural":"furișate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furișat","error-unrecognized-form-feminine-indefinite-singular":"furișată","error-unrecognized-form-indefinite-masculine-plural":"furișați","error-unrecognized-form-feminine-indefinite-neuter-plural":"furișate","definite-error-unrecognized-form-masculine-neuter-singular":"furișatul","definite-error-unrecognized-form-feminine-singular":"furișata","definite-error-unrecognized-form-masculine-plural":"furișații","definite-error-unrecognized-form-feminine-neuter-plural":"furișatele"}},{"word":"furișor","pos":"noun","definitions":["a wasp"],"forms":{"plural":"furișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furișor","accusative-definite-nominative-singular":"furișorul","accusative-indefinite-nominative-plural":"furișori","accusative-definite-nominative-plural":"furișorii","dative-genitive-indefinite-singular":"furișor","dative-definite-genitive-singular":"furișorului","dative-genitive-indefinite-plural":"furișori","dative-definite-genitive-plural":"furișorilor","singular-vocative":"furișorule","plural-vocative":"furișorilor"}},{"word":"furlandisi","pos":"verb","definitions":["to brag"],"forms":{"canonical":"a furlandisi 4th conjugation","present-singular-third-person":"furlandisește","participle-past":"furlandisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a furlandisi","gerund":"furlandisind","first-person-indicative-present-singular":"furlandisesc","indicative-present-second-person-singular":"furlandisești","indicative-present-singular-third-person":"furlandisește","first-person-indicative-plural-present":"furlandisim","indicative-plural-present-second-person":"furlandisiți","indicative-plural-present-third-person":"furlandisesc","first-person-imperfect-indicative-singular":"furlandiseam","imperfect-indicative-second-person-singular":"furlandiseai","imperfect-indicative-singular-third-person":"furlandisea","first-person-imperfect-indicative-plural":"furlandiseam","imperfect-indicative-plural-second-person":"furlandiseați","imperfect-indicative-plural-third-person":"furlandiseau","first-person-indicative-perfect-singular":"furlandisii","indicative-perfect-second-person-singular":"furlandisiși","indicative-perfect-singular-third-person":"furlandisi","first-person-indicative-perfect-plural":"furlandisirăm","indicative-perfect-plural-second-person":"furlandisirăți","indicative-perfect-plural-third-person":"furlandisiră","first-person-indicative-pluperfect-singular":"furlandisisem","indicative-pluperfect-second-person-singular":"furlandisiseși","indicative-pluperfect-singular-third-person":"furlandisise","first-person-indicative-pluperfect-plural":"furlandisiserăm","indicative-pluperfect-plural-second-person":"furlandisiserăți","indicative-pluperfect-plural-third-person":"furlandisiseră","first-person-present-singular-subjunctive":"să furlandisesc","present-second-person-singular-subjunctive":"să furlandisești","present-singular-subjunctive-third-person":"să furlandisească","first-person-plural-present-subjunctive":"să furlandisim","plural-present-second-person-subjunctive":"să furlandisiți","plural-present-subjunctive-third-person":"să furlandisească","imperative-second-person-singular":"furlandisește","imperative-plural-second-person":"furlandisiți","imperative-negative-second-person-singular":"nu furlandisi","imperative-negative-plural-second-person":"nu furlandisiți"}},{"word":"furlua","pos":"verb","definitions":["to steal"],"forms":{"canonical":"a furlua 1st conjugation","present-singular-third-person":"furia","participle-past":"furluat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a furlua","gerund":"furluând","first-person-indicative-present-singular":"furlu","indicative-present-second-person-singular":"furlui","indicative-present-singular-third-person":"furluă","first-person-indicative-plural-present":"furluăm","indicative-plural-present-second-person":"furluați","indicative-plural-present-third-person":"furluă","first-person-imperfect-indicative-singular":"furluam","imperfect-indicative-second-person-singular":"furluai","imperfect-indicative-singular-third-person":"furlua","first-person-imperfect-indicative-plural":"furluam","imperfect-indicative-plural-second-person":"furluați","imperfect-indicative-plural-third-person":"furluau","first-person-indicative-perfect-singular":"furluai","indicative-perfect-second-person-singular":"furluași","indicative-perfect-singular-third-person":"furluă","first-person-indicative-perfect-plural":"furluarăm","indicative-perfect-plural-second-person":"furluarăți","indicative-perfect-plural-third-person":"furluară","first-person-indicative-pluperfect-singular":"furluasem","indicative-pluperfect-second-person-singular":"furluaseși","indicative-pluperfect-singular-third-person":"furluase","first-person-indicative-pluperfect-plural":"furluaserăm","indicative-pluperfect-plural-second-person":"furluaserăți","indicative-pluperfect-plural-third-person":"furluaseră","first-person-present-singular-subjunctive":"să furlu","present-second-person-singular-subjunctive":"să furlui","present-singular-subjunctive-third-person":"să furlue","first-person-plural-present-subjunctive":"să furluăm","plural-present-second-person-subjunctive":"să furluați","plural-present-subjunctive-third-person":"să furlue","imperative-second-person-singular":"furluă","imperative-plural-second-person":"furluați","imperative-negative-second-person-singular":"nu furlua","imperative-negative-plural-second-person":"nu furluați"}},{"word":"furmint","pos":"noun","definitions":["furmint"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"furmint","accusative-definite-nominative":"furmintul","dative-genitive-indefinite":"furmint","dative-definite-genitive":"furmintului","vocative":"furmintule"}},{"word":"furnal","pos":"noun","definitions":["furnace"],"forms":{"plural":"furnaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"furnal","accusative-definite-nominative-singular":"furnalul","accusative-indefinite-nominative-plural":"furnaluri","accusative-definite-nominative-plural":"furnalurile","dative-genitive-indefinite-singular":"furnal","dative-definite-genitive-singular":"furnalului","dative-genitive-indefinite-plural":"furnaluri","dative-definite-genitive-plural":"furnalurilor","singular-vocative":"furnalule","plural-vocative":"furnalurilor"}},{"word":"furnalist","pos":"noun","definitions":["steelworker"],"forms":{"plural":"furnaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furnalist","accusative-definite-nominative-singular":"furnalistul","accusative-indefinite-nominative-plural":"furnaliști","accusative-definite-nominative-plural":"furnaliștii","dative-genitive-indefinite-singular":"furnalist","dative-definite-genitive-singular":"furnalistului","dative-genitive-indefinite-plural":"furnaliști","dative-definite-genitive-plural":"furnaliștilor","singular-vocative":"furnalistule","plural-vocative":"furnaliștilor"}},{"word":"furnecai","pos":"noun","definitions":["European bee-eater (Merops apiaster)"],"forms":{"plural":"furnecaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furnecai","accusative-definite-nominative-singular":"furnecaiul","accusative-indefinite-nominative-plural":"furnecaie","accusative-definite-nominative-plural":"furnecaiele","dative-genitive-indefinite-singular":"furnecai","dative-definite-genitive-singular":"furnecaiului","dative-genitive-indefinite-plural":"furnecaie","dative-definite-genitive-plural":"furnecaielor","singular-vocative":"furnecaiule","plural-vocative":"furnecaielor"}},{"word":"furnic","pos":"verb","definitions":["first-person singular present indicative/subjunctive of furnica"],"pronunciation":"[furˈnik]"},{"word":"Furnica","pos":"name","definitions":["a village in Dumbrăveni, Constanța County, Romania"],"gender":"f"},{"word":"furnica","pos":"verb","definitions":["to tingle, feel pins and needles","to swarm, bustle"],"pronunciation":"/fur.niˈka/","forms":{"canonical":"a furnica 1st conjugation","present-singular-third-person":"furnică","participle-past":"furnicat","subjunctive-third-person":"furnice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a furnica","gerund":"furnicând","first-person-indicative-present-singular":"furnic","indicative-present-second-person-singular":"furnici","indicative-present-singular-third-person":"furnică","first-person-indicative-plural-present":"furnicăm","indicative-plural-present-second-person":"furnicați","indicative-plural-present-third-person":"furnică","first-person-imperfect-indicative-singular":"furnicam","imperfect-indicative-second-person-singular":"furnicai","imperfect-indicative-singular-third-person":"furnica","first-person-imperfect-indicative-plural":"furnicam","imperfect-indicative-plural-second-person":"furnicați","imperfect-indicative-plural-third-person":"furnicau","first-person-indicative-perfect-singular":"furnicai","indicative-perfect-second-person-singular":"furnicași","indicative-perfect-singular-third-person":"furnică","first-person-indicative-perfect-plural":"furnicarăm","indicative-perfect-plural-second-person":"furnicarăți","indicative-perfect-plural-third-person":"furnicară","first-person-indicative-pluperfect-singular":"furnicasem","indicative-pluperfect-second-person-singular":"furnicaseși","indicative-pluperfect-singular-third-person":"furnicase","first-person-indicative-pluperfect-plural":"furnicaserăm","indicative-pluperfect-plural-second-person":"furnicaserăți","indicative-pluperfect-plural-third-person":"furnicaseră","first-person-present-singular-subjunctive":"să furnic","present-second-person-singular-subjunctive":"să furnici","present-singular-subjunctive-third-person":"să furnice","first-person-plural-present-subjunctive":"să furnicăm","plural-present-second-person-subjunctive":"să furnicați","plural-present-subjunctive-third-person":"să furnice","imperative-second-person-singular":"furnică","imperative-plural-second-person":"furnicați","imperative-negative-second-person-singular":"nu furnica","imperative-negative-plural-second-person":"nu furnicați","alternative":"фурника"}},{"word":"furnica","pos":"noun","definitions":["definite nominative/accusative singular of furnică (“ant”)"],"pronunciation":"/furˈni.ka/","forms":{"alternative":"фурника"}},{"word":"Furnică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Furnică"}},{"word":"furnică","pos":"noun","definitions":["ant"],"pronunciation":"/furˈni.kə/","forms":{"plural":"furnici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furnică","accusative-definite-nominative-singular":"furnica","accusative-indefinite-nominative-plural":"furnici","accusative-definite-nominative-plural":"furnicile","dative-genitive-indefinite-singular":"furnici","dative-definite-genitive-singular":"furnicii","dative-genitive-indefinite-plural":"furnici","dative-definite-genitive-plural":"furnicilor","singular-vocative":"furnică","plural-vocative":"furnicilor","alternative":"фурникэ"}},{"word":"furnică albă","pos":"noun","definitions":["white ant"]},{"word":"Furnica Mare","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Lotru"],"gender":"f"},{"word":"furnicar","pos":"noun","definitions":["anthill, formicary","swarm","multitude, crowd, throng"],"pronunciation":"/fur.niˈkar/","forms":{"plural":"furnicare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furnicar","accusative-definite-nominative-singular":"furnicarul","accusative-indefinite-nominative-plural":"furnicare","accusative-definite-nominative-plural":"furnicarele","dative-genitive-indefinite-singular":"furnicar","dative-definite-genitive-singular":"furnicarului","dative-genitive-indefinite-plural":"furnicare","dative-definite-genitive-plural":"furnicarelor","singular-vocative":"furnicarule","plural-vocative":"furnicarelor"}},{"word":"furnicar","pos":"noun","definitions":["woodpecker (bird)","anteater (mammal)"],"pronunciation":"/fur.niˈkar/","forms":{"plural":"furnicari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furnicar","accusative-definite-nominative-singular":"furnicarul","accusative-indefinite-nominative-plural":"furnicari","accusative-definite-nominative-plural":"furnicarii","dative-genitive-indefinite-singular":"furnicar","dative-definite-genitive-singular":"furnicarului","dative-genitive-indefinite-plural":"furnicari","dative-definite-genitive-plural":"furnicarilor","singular-vocative":"furnicarule","plural-vocative":"furnicarilor"}},{"word":"furnicare","pos":"noun","definitions":["tingling"],"forms":{"plural":"furnicări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furnicare","accusative-definite-nominative-singular":"furnicarea","accusative-indefinite-nominative-plural":"furnicări","accusative-definite-nominative-plural":"furnicările","dative-genitive-indefinite-singular":"furnicări","dative-definite-genitive-singular":"furnicării","dative-genitive-indefinite-plural":"furnicări","dative-definite-genitive-plural":"furnicărilor","singular-vocative":"furnicare","plural-vocative":"furnicărilor"}},{"word":"furnicare","pos":"noun","definitions":["plural of furnicar"],"gender":"n"},{"word":"furnicăreală","pos":"noun","definitions":["an itch"],"forms":{"plural":"furnicăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furnicăreală","accusative-definite-nominative-singular":"furnicăreala","accusative-indefinite-nominative-plural":"furnicărele","accusative-definite-nominative-plural":"furnicărelele","dative-genitive-indefinite-singular":"furnicărele","dative-definite-genitive-singular":"furnicărelei","dative-genitive-indefinite-plural":"furnicărele","dative-definite-genitive-plural":"furnicărelelor","singular-vocative":"furnicăreală","plural-vocative":"furnicărelelor"}},{"word":"Furnicari","pos":"name","definitions":["a village in Tamași, Bacău County, Romania"],"gender":"m"},{"word":"furnicari","pos":"noun","definitions":["plural of furnicar"],"gender":"m"},{"word":"furnicătură","pos":"noun","definitions":["itch"],"forms":{"plural":"furnicături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furnicătură","accusative-definite-nominative-singular":"furnicătura","accusative-indefinite-nominative-plural":"furnicături","accusative-definite-nominative-plural":"furnicăturile","dative-genitive-indefinite-singular":"furnicături","dative-definite-genitive-singular":"furnicăturii","dative-genitive-indefinite-plural":"furnicături","dative-definite-genitive-plural":"furnicăturilor","singular-vocative":"furnicătură","plural-vocative":"furnicăturilor"}},{"word":"furnicel","pos":"noun","definitions":["boil, furuncle"],"forms":{"plural":"furnicei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furnicel","accusative-definite-nominative-singular":"furnicelul","accusative-indefinite-nominative-plural":"furnicei","accusative-definite-nominative-plural":"furniceii","dative-genitive-indefinite-singular":"furnicel","dative-definite-genitive-singular":"furnicelului","dative-genitive-indefinite-plural":"furnicei","dative-definite-genitive-plural":"furniceilor","singular-vocative":"furnicelule","plural-vocative":"furniceilor","alternative":"funecel"}},{"word":"furnici","pos":"noun","definitions":["plural of furnică"]},{"word":"furnicilor","pos":"noun","definitions":["definite genitive/dative plural of furnică"]},{"word":"furnicos","pos":"adj","definitions":["full of ants"],"forms":{"feminine-singular":"furnicoasă","masculine-plural":"furnicoși","feminine-neuter-plural":"furnicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furnicos","error-unrecognized-form-feminine-indefinite-singular":"furnicoasă","error-unrecognized-form-indefinite-masculine-plural":"furnicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"furnicoase","definite-error-unrecognized-form-masculine-neuter-singular":"furnicosul","definite-error-unrecognized-form-feminine-singular":"furnicoasa","definite-error-unrecognized-form-masculine-plural":"furnicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"furnicoasele"}},{"word":"Furnicoși","pos":"name","definitions":["a village in Mihăești, Argeș County, Romania"],"gender":"m"},{"word":"furnicuță","pos":"noun","definitions":["diminutive of furnică"],"forms":{"plural":"furnicuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furnicuță","accusative-definite-nominative-singular":"furnicuța","accusative-indefinite-nominative-plural":"furnicuțe","accusative-definite-nominative-plural":"furnicuțele","dative-genitive-indefinite-singular":"furnicuțe","dative-definite-genitive-singular":"furnicuței","dative-genitive-indefinite-plural":"furnicuțe","dative-definite-genitive-plural":"furnicuțelor","singular-vocative":"furnicuță","plural-vocative":"furnicuțelor"}},{"word":"furnir","pos":"noun","definitions":["veneer"],"forms":{"plural":"furnire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furnir","accusative-definite-nominative-singular":"furnirul","accusative-indefinite-nominative-plural":"furnire","accusative-definite-nominative-plural":"furnirele","dative-genitive-indefinite-singular":"furnir","dative-definite-genitive-singular":"furnirului","dative-genitive-indefinite-plural":"furnire","dative-definite-genitive-plural":"furnirelor","singular-vocative":"furnirule","plural-vocative":"furnirelor"}},{"word":"furnirui","pos":"verb","definitions":["to veneer"],"forms":{"canonical":"a furnirui 4th conjugation","present-singular-third-person":"furniruiește","participle-past":"furniruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a furnirui","gerund":"furniruind","first-person-indicative-present-singular":"furniruiesc","indicative-present-second-person-singular":"furniruiești","indicative-present-singular-third-person":"furniruiește","first-person-indicative-plural-present":"furniruim","indicative-plural-present-second-person":"furniruiți","indicative-plural-present-third-person":"furniruiesc","first-person-imperfect-indicative-singular":"furniruiam","imperfect-indicative-second-person-singular":"furniruiai","imperfect-indicative-singular-third-person":"furniruia","first-person-imperfect-indicative-plural":"furniruiam","imperfect-indicative-plural-second-person":"furniruiați","imperfect-indicative-plural-third-person":"furniruiau","first-person-indicative-perfect-singular":"furniruii","indicative-perfect-second-person-singular":"furniruiși","indicative-perfect-singular-third-person":"furnirui","first-person-indicative-perfect-plural":"furniruirăm","indicative-perfect-plural-second-person":"furniruirăți","indicative-perfect-plural-third-person":"furniruiră","first-person-indicative-pluperfect-singular":"furniruisem","indicative-pluperfect-second-person-singular":"furniruiseși","indicative-pluperfect-singular-third-person":"furniruise","first-person-indicative-pluperfect-plural":"furniruiserăm","indicative-pluperfect-plural-second-person":"furniruiserăți","indicative-pluperfect-plural-third-person":"furniruiseră","first-person-present-singular-subjunctive":"să furniruiesc","present-second-person-singular-subjunctive":"să furniruiești","present-singular-subjunctive-third-person":"să furniruiască","first-person-plural-present-subjunctive":"să furniruim","plural-present-second-person-subjunctive":"să furniruiți","plural-present-subjunctive-third-person":"să furniruiască","imperative-second-person-singular":"furniruiește","imperative-plural-second-person":"furniruiți","imperative-negative-second-person-singular":"nu furnirui","imperative-negative-plural-second-person":"nu furniruiți"}},{"word":"furniruit","pos":"adj","definitions":["veneered"],"forms":{"feminine-singular":"furniruită","masculine-plural":"furniruiți","feminine-neuter-plural":"furniruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furniruit","error-unrecognized-form-feminine-indefinite-singular":"furniruită","error-unrecognized-form-indefinite-masculine-plural":"furniruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"furniruite","definite-error-unrecognized-form-masculine-neuter-singular":"furniruitul","definite-error-unrecognized-form-feminine-singular":"furniruita","definite-error-unrecognized-form-masculine-plural":"furniruiții","definite-error-unrecognized-form-feminine-neuter-plural":"furniruitele"}},{"word":"furniruit","pos":"verb","definitions":["past participle of furnirui"],"forms":{"participle-past":"of furnirui"}},{"word":"furnitură","pos":"noun","definitions":["supply"],"forms":{"plural":"furnituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furnitură","accusative-definite-nominative-singular":"furnitura","accusative-indefinite-nominative-plural":"furnituri","accusative-definite-nominative-plural":"furniturile","dative-genitive-indefinite-singular":"furnituri","dative-definite-genitive-singular":"furniturii","dative-genitive-indefinite-plural":"furnituri","dative-definite-genitive-plural":"furniturilor","singular-vocative":"furnitură","plural-vocative":"furniturilor"}},{"word":"furniza","pos":"verb","definitions":["to provide"],"forms":{"canonical":"a furniza 1st conjugation","present-singular-third-person":"furnizează","participle-past":"furnizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a furniza","gerund":"furnizând","first-person-indicative-present-singular":"furnizez","indicative-present-second-person-singular":"furnizezi","indicative-present-singular-third-person":"furnizează","first-person-indicative-plural-present":"furnizăm","indicative-plural-present-second-person":"furnizați","indicative-plural-present-third-person":"furnizează","first-person-imperfect-indicative-singular":"furnizam","imperfect-indicative-second-person-singular":"furnizai","imperfect-indicative-singular-third-person":"furniza","first-person-imperfect-indicative-plural":"furnizam","imperfect-indicative-plural-second-person":"furnizați","imperfect-indicative-plural-third-person":"furnizau","first-person-indicative-perfect-singular":"furnizai","indicative-perfect-second-person-singular":"furnizași","indicative-perfect-singular-third-person":"furniză","first-person-indicative-perfect-plural":"furnizarăm","indicative-perfect-plural-second-person":"furnizarăți","indicative-perfect-plural-third-person":"furnizară","first-person-indicative-pluperfect-singular":"furnizasem","indicative-pluperfect-second-person-singular":"furnizaseși","indicative-pluperfect-singular-third-person":"furnizase","first-person-indicative-pluperfect-plural":"furnizaserăm","indicative-pluperfect-plural-second-person":"furnizaserăți","indicative-pluperfect-plural-third-person":"furnizaseră","first-person-present-singular-subjunctive":"să furnizez","present-second-person-singular-subjunctive":"să furnizezi","present-singular-subjunctive-third-person":"să furnizeze","first-person-plural-present-subjunctive":"să furnizăm","plural-present-second-person-subjunctive":"să furnizați","plural-present-subjunctive-third-person":"să furnizeze","imperative-second-person-singular":"furnizează","imperative-plural-second-person":"furnizați","imperative-negative-second-person-singular":"nu furniza","imperative-negative-plural-second-person":"nu furnizați"}},{"word":"furnizare","pos":"noun","definitions":["supply"],"forms":{"plural":"furnizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furnizare","accusative-definite-nominative-singular":"furnizarea","accusative-indefinite-nominative-plural":"furnizări","accusative-definite-nominative-plural":"furnizările","dative-genitive-indefinite-singular":"furnizări","dative-definite-genitive-singular":"furnizării","dative-genitive-indefinite-plural":"furnizări","dative-definite-genitive-plural":"furnizărilor","singular-vocative":"furnizare","plural-vocative":"furnizărilor"}},{"word":"furnizat","pos":"adj","definitions":["provided"],"forms":{"feminine-singular":"furnizată","masculine-plural":"furnizați","feminine-neuter-plural":"furnizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furnizat","error-unrecognized-form-feminine-indefinite-singular":"furnizată","error-unrecognized-form-indefinite-masculine-plural":"furnizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"furnizate","definite-error-unrecognized-form-masculine-neuter-singular":"furnizatul","definite-error-unrecognized-form-feminine-singular":"furnizata","definite-error-unrecognized-form-masculine-plural":"furnizații","definite-error-unrecognized-form-feminine-neuter-plural":"furnizatele"}},{"word":"furnizat","pos":"verb","definitions":["past participle of furniza"],"forms":{"participle-past":"of furniza"}},{"word":"furnizoare","pos":"noun","definitions":["female equivalent of furnizor"],"forms":{"plural":"furnizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"furnizoare","accusative-definite-nominative-singular":"furnizoarea","accusative-indefinite-nominative-plural":"furnizoare","accusative-definite-nominative-plural":"furnizoarele","dative-genitive-indefinite-singular":"furnizoare","dative-definite-genitive-singular":"furnizoarei","dative-genitive-indefinite-plural":"furnizoare","dative-definite-genitive-plural":"furnizoarelor","singular-vocative":"furnizoare","plural-vocative":"furnizoarelor"}},{"word":"furnizor","pos":"noun","definitions":["provider"],"forms":{"plural":"furnizori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furnizor","accusative-definite-nominative-singular":"furnizorul","accusative-indefinite-nominative-plural":"furnizori","accusative-definite-nominative-plural":"furnizorii","dative-genitive-indefinite-singular":"furnizor","dative-definite-genitive-singular":"furnizorului","dative-genitive-indefinite-plural":"furnizori","dative-definite-genitive-plural":"furnizorilor","singular-vocative":"furnizorule","plural-vocative":"furnizorilor"}},{"word":"furoare","pos":"noun","definitions":["fury"],"forms":{"plural":"furori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"furoare","accusative-definite-nominative-singular":"furoarea","accusative-indefinite-nominative-plural":"furori","accusative-definite-nominative-plural":"furorile","dative-genitive-indefinite-singular":"furori","dative-definite-genitive-singular":"furorii","dative-genitive-indefinite-plural":"furori","dative-definite-genitive-plural":"furorilor","singular-vocative":"furoare","plural-vocative":"furorilor"}},{"word":"furou","pos":"noun","definitions":["chemise"],"forms":{"plural":"furouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furou","accusative-definite-nominative-singular":"furouul","accusative-indefinite-nominative-plural":"furouri","accusative-definite-nominative-plural":"furourile","dative-genitive-indefinite-singular":"furou","dative-definite-genitive-singular":"furouului","dative-genitive-indefinite-plural":"furouri","dative-definite-genitive-plural":"furourilor","singular-vocative":"furouule","plural-vocative":"furourilor"}},{"word":"fursec","pos":"noun","definitions":["cookie"],"forms":{"plural":"fursecuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"fursec","accusative-definite-nominative-singular":"fursecul","accusative-indefinite-nominative-plural":"fursecuri","accusative-definite-nominative-plural":"fursecurile","dative-genitive-indefinite-singular":"fursec","dative-definite-genitive-singular":"fursecului","dative-genitive-indefinite-plural":"fursecuri","dative-definite-genitive-plural":"fursecurilor","singular-vocative":"fursecule","plural-vocative":"fursecurilor"}},{"word":"furt","pos":"noun","definitions":["theft","robbery"],"forms":{"plural":"furturi"}},{"word":"furtișag","pos":"noun","definitions":["pilferage"],"forms":{"plural":"furtișaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"furtișag","accusative-definite-nominative-singular":"furtișagul","accusative-indefinite-nominative-plural":"furtișaguri","accusative-definite-nominative-plural":"furtișagurile","dative-genitive-indefinite-singular":"furtișag","dative-definite-genitive-singular":"furtișagului","dative-genitive-indefinite-plural":"furtișaguri","dative-definite-genitive-plural":"furtișagurilor","singular-vocative":"furtișagule","plural-vocative":"furtișagurilor"}},{"word":"furtiv","pos":"adj","definitions":["stealthy"],"forms":{"feminine-singular":"furtivă","masculine-plural":"furtivi","feminine-neuter-plural":"furtive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furtiv","error-unrecognized-form-feminine-indefinite-singular":"furtivă","error-unrecognized-form-indefinite-masculine-plural":"furtivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"furtive","definite-error-unrecognized-form-masculine-neuter-singular":"furtivul","definite-error-unrecognized-form-feminine-singular":"furtiva","definite-error-unrecognized-form-masculine-plural":"furtivii","definite-error-unrecognized-form-feminine-neuter-plural":"furtivele"}},{"word":"furtun","pos":"noun","definitions":["hose (flexible tube)"],"forms":{"plural":"furtunuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"furtun","accusative-definite-nominative-singular":"furtunul","accusative-indefinite-nominative-plural":"furtunuri","accusative-definite-nominative-plural":"furtunurile","dative-genitive-indefinite-singular":"furtun","dative-definite-genitive-singular":"furtunului","dative-genitive-indefinite-plural":"furtunuri","dative-definite-genitive-plural":"furtunurilor","singular-vocative":"furtunule","plural-vocative":"furtunurilor","alternative":"фуртун"}},{"word":"furtuna","pos":"noun","definitions":["definite nominative/accusative singular of furtună"],"pronunciation":"[furˈtuna]","gender":"f"},{"word":"Furtună","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Furtună","alternative":"Фуртунэ"}},{"word":"furtună","pos":"noun","definitions":["storm, tempest, squall","revolt","bad luck, mishap, trouble, affliction, predicament"],"pronunciation":"[furˈtunə]","forms":{"plural":"furtuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"furtună","accusative-definite-nominative-singular":"furtuna","accusative-indefinite-nominative-plural":"furtuni","accusative-definite-nominative-plural":"furtunile","dative-genitive-indefinite-singular":"furtuni","dative-definite-genitive-singular":"furtunii","dative-genitive-indefinite-plural":"furtuni","dative-definite-genitive-plural":"furtunilor","singular-vocative":"furtună","plural-vocative":"furtunilor","alternative":"фуртунэ"}},{"word":"furtună de zăpadă","pos":"noun","definitions":["snowstorm"],"forms":{"plural":"furtuni de zăpadă"}},{"word":"furtună-n pahar de apă","pos":"phrase","definitions":["storm in a tea kettle"],"pronunciation":"/furˈtu.nəm‿paˌhar de ˈa.pə/"},{"word":"furtunar","pos":"noun","definitions":["Manx shearwater (Puffinus puffinus)"],"forms":{"plural":"furtunari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"furtunar","accusative-definite-nominative-singular":"furtunarul","accusative-indefinite-nominative-plural":"furtunari","accusative-definite-nominative-plural":"furtunarii","dative-genitive-indefinite-singular":"furtunar","dative-definite-genitive-singular":"furtunarului","dative-genitive-indefinite-plural":"furtunari","dative-definite-genitive-plural":"furtunarilor","singular-vocative":"furtunarule","plural-vocative":"furtunarilor"}},{"word":"furtunat","pos":"adj","definitions":["shipwrecked"],"forms":{"feminine-singular":"furtunată","masculine-plural":"furtunați","feminine-neuter-plural":"furtunate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furtunat","error-unrecognized-form-feminine-indefinite-singular":"furtunată","error-unrecognized-form-indefinite-masculine-plural":"furtunați","error-unrecognized-form-feminine-indefinite-neuter-plural":"furtunate","definite-error-unrecognized-form-masculine-neuter-singular":"furtunatul","definite-error-unrecognized-form-feminine-singular":"furtunata","definite-error-unrecognized-form-masculine-plural":"furtunații","definite-error-unrecognized-form-feminine-neuter-plural":"furtunatele"}},{"word":"furtunatec","pos":"adj","definitions":["alternative form of furtunatic"],"forms":{"feminine-singular":"furtunatecă","masculine-plural":"furtunateci","feminine-neuter-plural":"furtunatece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furtunatec","error-unrecognized-form-feminine-indefinite-singular":"furtunatecă","error-unrecognized-form-indefinite-masculine-plural":"furtunateci","error-unrecognized-form-feminine-indefinite-neuter-plural":"furtunatece","definite-error-unrecognized-form-masculine-neuter-singular":"furtunatecul","definite-error-unrecognized-form-feminine-singular":"furtunateca","definite-error-unrecognized-form-masculine-plural":"furtunatecii","definite-error-unrecognized-form-feminine-neuter-plural":"furtunatecele"}},{"word":"furtunatic","pos":"adj","definitions":["stormy"],"forms":{"feminine-singular":"furtunatică","masculine-plural":"furtunatici","feminine-neuter-plural":"furtunatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furtunatic","error-unrecognized-form-feminine-indefinite-singular":"furtunatică","error-unrecognized-form-indefinite-masculine-plural":"furtunatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"furtunatice","definite-error-unrecognized-form-masculine-neuter-singular":"furtunaticul","definite-error-unrecognized-form-feminine-singular":"furtunatica","definite-error-unrecognized-form-masculine-plural":"furtunaticii","definite-error-unrecognized-form-feminine-neuter-plural":"furtunaticele"}},{"word":"Furtuneasca","pos":"name","definitions":["a river in Vrancea County, Romania, tributary to the Șușița"],"gender":"f"},{"word":"Furtunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Furtunescu"}},{"word":"Furtunești","pos":"name","definitions":["a village in Gura Teghii, Buzău County, Romania"],"gender":"m"},{"word":"furtunos","pos":"adj","definitions":["stormy, tempestuous, gusty","agitated, impetuous"],"pronunciation":"/fur.tuˈnos/","forms":{"feminine-singular":"furtunoasă","masculine-plural":"furtunoși","feminine-neuter-plural":"furtunoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furtunos","error-unrecognized-form-feminine-indefinite-singular":"furtunoasă","error-unrecognized-form-indefinite-masculine-plural":"furtunoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"furtunoase","definite-error-unrecognized-form-masculine-neuter-singular":"furtunosul","definite-error-unrecognized-form-feminine-singular":"furtunoasa","definite-error-unrecognized-form-masculine-plural":"furtunoșii","definite-error-unrecognized-form-feminine-neuter-plural":"furtunoasele"}},{"word":"Furu","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Jiul de Vest","a river in Vrancea County, Romania, tributary to the Sărățel"],"gender":"m"},{"word":"furuncul","pos":"noun","definitions":["furuncle, boil, abscess"],"forms":{"plural":"furuncule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"furuncul","accusative-definite-nominative-singular":"furunculul","accusative-indefinite-nominative-plural":"furuncule","accusative-definite-nominative-plural":"furunculele","dative-genitive-indefinite-singular":"furuncul","dative-definite-genitive-singular":"furunculului","dative-genitive-indefinite-plural":"furuncule","dative-definite-genitive-plural":"furunculelor","singular-vocative":"furunculule","plural-vocative":"furunculelor"}},{"word":"furunculos","pos":"adj","definitions":["furuncular"],"forms":{"feminine-singular":"furunculoasă","masculine-plural":"furunculoși","feminine-neuter-plural":"furunculoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"furunculos","error-unrecognized-form-feminine-indefinite-singular":"furunculoasă","error-unrecognized-form-indefinite-masculine-plural":"furunculoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"furunculoase","definite-error-unrecognized-form-masculine-neuter-singular":"furunculosul","definite-error-unrecognized-form-feminine-singular":"furunculoasa","definite-error-unrecognized-form-masculine-plural":"furunculoșii","definite-error-unrecognized-form-feminine-neuter-plural":"furunculoasele"}},{"word":"furunculoză","pos":"noun","definitions":["furunculosis"],"forms":{"plural":"furunculoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"furunculoză","accusative-definite-nominative-singular":"furunculoza","accusative-indefinite-nominative-plural":"furunculoze","accusative-definite-nominative-plural":"furunculozele","dative-genitive-indefinite-singular":"furunculoze","dative-definite-genitive-singular":"furunculozei","dative-genitive-indefinite-plural":"furunculoze","dative-definite-genitive-plural":"furunculozelor","singular-vocative":"furunculoză","plural-vocative":"furunculozelor"}},{"word":"fus","pos":"noun","definitions":["spindle","journal (part of an axle)","shaft of a column","shaft (tree trunk)","shank of an anchor (the straight vertical part)"],"pronunciation":"/ˈfus/","forms":{"plural":"fuse","error-unknown-tag-plural":"fusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fus","accusative-definite-nominative-singular":"fusul","accusative-indefinite-nominative-plural":"fuse","accusative-definite-nominative-plural":"fusele","dative-genitive-indefinite-singular":"fus","dative-definite-genitive-singular":"fusului","dative-genitive-indefinite-plural":"fuse","dative-definite-genitive-plural":"fuselor","singular-vocative":"fusule","plural-vocative":"fuselor","alternative":"фус"}},{"word":"fus","pos":"noun","definitions":["square foot"],"pronunciation":"/ˈfus/","forms":{"plural":"fuse","alternative":"фус"}},{"word":"fus orar","pos":"noun","definitions":["time zone"],"forms":{"plural":"fusuri orare"}},{"word":"fus sferic","pos":"noun","definitions":["spherical lune"],"forms":{"plural":"fusuri sferice"}},{"word":"fusar","pos":"noun","definitions":["person who makes or sells spindles","eel"],"forms":{"plural":"fusari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fusar","accusative-definite-nominative-singular":"fusarul","accusative-indefinite-nominative-plural":"fusari","accusative-definite-nominative-plural":"fusarii","dative-genitive-indefinite-singular":"fusar","dative-definite-genitive-singular":"fusarului","dative-genitive-indefinite-plural":"fusari","dative-definite-genitive-plural":"fusarilor","singular-vocative":"fusarule","plural-vocative":"fusarilor","alternative":"fusariu"}},{"word":"Fusariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fusariu"}},{"word":"fusariu","pos":"noun","definitions":["alternative form of fusar"],"forms":{"plural":"fusarii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fusariu","accusative-definite-nominative-singular":"fusariul","accusative-indefinite-nominative-plural":"fusarii","accusative-definite-nominative-plural":"fusariii","dative-genitive-indefinite-singular":"fusariu","dative-definite-genitive-singular":"fusariului","dative-genitive-indefinite-plural":"fusarii","dative-definite-genitive-plural":"fusariilor","singular-vocative":"fusariule","plural-vocative":"fusariilor"}},{"word":"fusarolă","pos":"noun","definitions":["fusarole"],"forms":{"plural":"fusarole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fusarolă","accusative-definite-nominative-singular":"fusarola","accusative-indefinite-nominative-plural":"fusarole","accusative-definite-nominative-plural":"fusarolele","dative-genitive-indefinite-singular":"fusarole","dative-definite-genitive-singular":"fusarolei","dative-genitive-indefinite-plural":"fusarole","dative-definite-genitive-plural":"fusarolelor","singular-vocative":"fusarolă","plural-vocative":"fusarolelor"}},{"word":"Fusaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Fusaru"}},{"word":"fuscel","pos":"noun","definitions":["rod, pole","step, stair (of a staircase)"],"forms":{"plural":"fuscei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuscel","accusative-definite-nominative-singular":"fuscelul","accusative-indefinite-nominative-plural":"fuscei","accusative-definite-nominative-plural":"fusceii","dative-genitive-indefinite-singular":"fuscel","dative-definite-genitive-singular":"fuscelului","dative-genitive-indefinite-plural":"fuscei","dative-definite-genitive-plural":"fusceilor","singular-vocative":"fuscelule","plural-vocative":"fusceilor","alternative":"fușcel"}},{"word":"fușcel","pos":"noun","definitions":["alternative form of fuscel"],"forms":{"plural":"fușcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fușcel","accusative-definite-nominative-singular":"fușcelul","accusative-indefinite-nominative-plural":"fușceli","accusative-definite-nominative-plural":"fușcelii","dative-genitive-indefinite-singular":"fușcel","dative-definite-genitive-singular":"fușcelului","dative-genitive-indefinite-plural":"fușceli","dative-definite-genitive-plural":"fușcelilor","singular-vocative":"fușcelule","plural-vocative":"fușcelilor"}},{"word":"fuscior","pos":"noun","definitions":["diminutive of fus"],"forms":{"plural":"fuscioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fuscior","accusative-definite-nominative-singular":"fusciorul","accusative-indefinite-nominative-plural":"fuscioare","accusative-definite-nominative-plural":"fuscioarele","dative-genitive-indefinite-singular":"fuscior","dative-definite-genitive-singular":"fusciorului","dative-genitive-indefinite-plural":"fuscioare","dative-definite-genitive-plural":"fuscioarelor","singular-vocative":"fusciorule","plural-vocative":"fuscioarelor"}},{"word":"fuse","pos":"verb","definitions":["third-person singular simple perfect indicative of fi: he/she has been"],"pronunciation":"[ˈfu.se]"},{"word":"fuse","pos":"noun","definitions":["indefinite plural of fus"],"pronunciation":"[ˈfu.se]","gender":"n"},{"word":"Fusea","pos":"name","definitions":["a village in Titu, Dâmbovița County, Romania"],"gender":"f"},{"word":"fusei","pos":"verb","definitions":["first-person singular simple perfect indicative of fi: I have been"],"pronunciation":"[fuˈsej]"},{"word":"fuseră","pos":"verb","definitions":["third-person plural simple perfect indicative of fi: they have been"],"pronunciation":"[fuˈse.rə]"},{"word":"fuserăm","pos":"verb","definitions":["first-person plural simple perfect indicative of fi: we have been"],"pronunciation":"[fuˈse.rəm]"},{"word":"fuserăți","pos":"verb","definitions":["second-person plural simple perfect indicative of fi: you have been"],"pronunciation":"[fuˈse.rət͡sʲ]"},{"word":"fusese","pos":"verb","definitions":["third-person singular pluperfect indicative of fi: he/she had been"],"pronunciation":"[fuˈse.se]"},{"word":"fusesem","pos":"verb","definitions":["first-person singular pluperfect indicative of fi: I had been"],"pronunciation":"[fuˈse.sem]"},{"word":"fuseseră","pos":"verb","definitions":["third-person plural pluperfect indicative of fi: they had been"],"pronunciation":"[fuˈse.se.rə]"},{"word":"fuseserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of fi: we had been"],"pronunciation":"[fuˈse.se.rəm]"},{"word":"fuseserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of fi: you had been"],"pronunciation":"[fuˈse.se.rət͡sʲ]"},{"word":"fuseseși","pos":"verb","definitions":["second-person singular pluperfect indicative of fi: you had been"],"pronunciation":"[fuˈse.seʃʲ]"},{"word":"fuseși","pos":"verb","definitions":["second-person singular simple perfect indicative of fi: you have been"],"pronunciation":"[fuˈseʃʲ]"},{"word":"fuși","pos":"verb","definitions":["second-person singular simple perfect indicative of fi"],"pronunciation":"[fuʃʲ]"},{"word":"fusiform","pos":"adj","definitions":["fusiform"],"forms":{"feminine-singular":"fusiformă","masculine-plural":"fusiformi","feminine-neuter-plural":"fusiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fusiform","error-unrecognized-form-feminine-indefinite-singular":"fusiformă","error-unrecognized-form-indefinite-masculine-plural":"fusiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fusiforme","definite-error-unrecognized-form-masculine-neuter-singular":"fusiformul","definite-error-unrecognized-form-feminine-singular":"fusiforma","definite-error-unrecognized-form-masculine-plural":"fusiformii","definite-error-unrecognized-form-feminine-neuter-plural":"fusiformele"}},{"word":"fusta","pos":"noun","definitions":["definite nominative/accusative singular of fustă"],"pronunciation":"[ˈfusta]","gender":"f"},{"word":"fustă","pos":"noun","definitions":["skirt"],"pronunciation":"/ˈfus.tə/","forms":{"plural":"fuste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"fustă","accusative-definite-nominative-singular":"fusta","accusative-indefinite-nominative-plural":"fuste","accusative-definite-nominative-plural":"fustele","dative-genitive-indefinite-singular":"fuste","dative-definite-genitive-singular":"fustei","dative-genitive-indefinite-plural":"fuste","dative-definite-genitive-plural":"fustelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"fustanelă","pos":"noun","definitions":["fustanella"],"forms":{"plural":"fustanele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fustanelă","accusative-definite-nominative-singular":"fustanela","accusative-indefinite-nominative-plural":"fustanele","accusative-definite-nominative-plural":"fustanelele","dative-genitive-indefinite-singular":"fustanele","dative-definite-genitive-singular":"fustanelei","dative-genitive-indefinite-plural":"fustanele","dative-definite-genitive-plural":"fustanelelor","singular-vocative":"fustanelă","plural-vocative":"fustanelelor"}},{"word":"fustangiu","pos":"noun","definitions":["womanizer"],"forms":{"plural":"fustangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fustangiu","accusative-definite-nominative-singular":"fustangiul","accusative-indefinite-nominative-plural":"fustangii","accusative-definite-nominative-plural":"fustangiii","dative-genitive-indefinite-singular":"fustangiu","dative-definite-genitive-singular":"fustangiului","dative-genitive-indefinite-plural":"fustangii","dative-definite-genitive-plural":"fustangiilor","singular-vocative":"fustangiule","plural-vocative":"fustangiilor"}},{"word":"fustaș","pos":"noun","definitions":["obsolete form of fuștaș"],"forms":{"plural":"fustași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fustaș","accusative-definite-nominative-singular":"fustașul","accusative-indefinite-nominative-plural":"fustași","accusative-definite-nominative-plural":"fustașii","dative-genitive-indefinite-singular":"fustaș","dative-definite-genitive-singular":"fustașului","dative-genitive-indefinite-plural":"fustași","dative-definite-genitive-plural":"fustașilor","singular-vocative":"fustașule","plural-vocative":"fustașilor"}},{"word":"fuștaș","pos":"noun","definitions":["lancer"],"forms":{"plural":"fuștași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuștaș","accusative-definite-nominative-singular":"fuștașul","accusative-indefinite-nominative-plural":"fuștași","accusative-definite-nominative-plural":"fuștașii","dative-genitive-indefinite-singular":"fuștaș","dative-definite-genitive-singular":"fuștașului","dative-genitive-indefinite-plural":"fuștași","dative-definite-genitive-plural":"fuștașilor","singular-vocative":"fuștașule","plural-vocative":"fuștașilor"}},{"word":"fuste","pos":"noun","definitions":["inflection of fustă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈfuste]","gender":"f"},{"word":"fuște","pos":"noun","definitions":["lance, wooden spear with an iron tip"],"forms":{"plural":"fuști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fuște","accusative-definite-nominative-singular":"fuștea","accusative-indefinite-nominative-plural":"fuști","accusative-definite-nominative-plural":"fuștile","dative-genitive-indefinite-singular":"fuști","dative-definite-genitive-singular":"fuștii","dative-genitive-indefinite-plural":"fuști","dative-definite-genitive-plural":"fuștilor","singular-vocative":"fuște","plural-vocative":"fuștilor"}},{"word":"fuștel","pos":"noun","definitions":["alternative form of fuscel"],"forms":{"plural":"fuștei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuștel","accusative-definite-nominative-singular":"fuștelul","accusative-indefinite-nominative-plural":"fușteli","accusative-definite-nominative-plural":"fuștelii","dative-genitive-indefinite-singular":"fuștel","dative-definite-genitive-singular":"fuștelului","dative-genitive-indefinite-plural":"fușteli","dative-definite-genitive-plural":"fuștelilor","singular-vocative":"fuștelule","plural-vocative":"fuștelilor"}},{"word":"fustigație","pos":"noun","definitions":["fustigation"],"forms":{"plural":"fustigații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"fustigație","accusative-definite-nominative-singular":"fustigația","accusative-indefinite-nominative-plural":"fustigații","accusative-definite-nominative-plural":"fustigațiile","dative-genitive-indefinite-singular":"fustigații","dative-definite-genitive-singular":"fustigației","dative-genitive-indefinite-plural":"fustigații","dative-definite-genitive-plural":"fustigațiilor","singular-vocative":"fustigație","plural-vocative":"fustigațiilor"}},{"word":"fustișoară","pos":"noun","definitions":["diminutive of fustă; small skirt"],"forms":{"plural":"fustișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fustișoară","accusative-definite-nominative-singular":"fustișoara","accusative-indefinite-nominative-plural":"fustișoare","accusative-definite-nominative-plural":"fustișoarele","dative-genitive-indefinite-singular":"fustișoare","dative-definite-genitive-singular":"fustișoarei","dative-genitive-indefinite-plural":"fustișoare","dative-definite-genitive-plural":"fustișoarelor","singular-vocative":"fustișoară","plural-vocative":"fustișoarelor"}},{"word":"fustiță","pos":"noun","definitions":["diminutive of fustă; small skirt"],"forms":{"plural":"fustițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fustiță","accusative-definite-nominative-singular":"fustița","accusative-indefinite-nominative-plural":"fustițe","accusative-definite-nominative-plural":"fustițele","dative-genitive-indefinite-singular":"fustițe","dative-definite-genitive-singular":"fustiței","dative-genitive-indefinite-plural":"fustițe","dative-definite-genitive-plural":"fustițelor","singular-vocative":"fustiță","plural-vocative":"fustițelor"}},{"word":"fusule","pos":"noun","definitions":["vocative singular of fus (“spindle”)"],"pronunciation":"/ˈfu.su.le/"},{"word":"fut","pos":"verb","definitions":["first-person singular present indicative of fute: I fuck","first-person singular present subjunctive of fute","third-person plural present indicative of fute: they fuck"],"pronunciation":"[fut]","examples":[{"ro":"îl fut pe Radu foarte des","en":"I fuck Radu a lot"},{"ro":"vreau s-o fut tandru","en":"I want to fuck her gently"},{"ro":"vreau să-l fut tare","en":"I want to fuck him hard"}]},{"word":"fută","pos":"verb","definitions":["third-person singular/plural present subjunctive of fute"],"pronunciation":"[ˈfu.tə]"},{"word":"futabil","pos":"adj","definitions":["fuckable"],"pronunciation":"/fuˈta.bil/","forms":{"feminine-singular":"futabilă","masculine-plural":"futabili","feminine-neuter-plural":"futabile","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"futabil","error-unrecognized-form-feminine-indefinite-singular":"futabilă","error-unrecognized-form-indefinite-masculine-plural":"futabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"futabile","definite-error-unrecognized-form-masculine-neuter-singular":"futabilul","definite-error-unrecognized-form-feminine-singular":"futabila","definite-error-unrecognized-form-masculine-plural":"futabilii","definite-error-unrecognized-form-feminine-neuter-plural":"futabilele"}},{"word":"futăcios","pos":"noun","definitions":["fuck boy"],"forms":{"plural":"futăcioși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"futăcios","accusative-definite-nominative-singular":"futăciosul","accusative-indefinite-nominative-plural":"futăcioși","accusative-definite-nominative-plural":"futăcioșii","dative-genitive-indefinite-singular":"futăcios","dative-definite-genitive-singular":"futăciosului","dative-genitive-indefinite-plural":"futăcioși","dative-definite-genitive-plural":"futăcioșilor","singular-vocative":"futăciosule","plural-vocative":"futăcioșilor"}},{"word":"futai","pos":"noun","definitions":["a fuck, sexual intercourse"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"futai","accusative-definite-nominative":"futaiul","dative-genitive-indefinite":"futai","dative-definite-genitive":"futaiului","vocative":"futaiule"}},{"word":"futălău","pos":"noun","definitions":["fuck boy"],"forms":{"plural":"futălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"futălău","accusative-definite-nominative-singular":"futălăuul","accusative-indefinite-nominative-plural":"futălăi","accusative-definite-nominative-plural":"futălăii","dative-genitive-indefinite-singular":"futălău","dative-definite-genitive-singular":"futălăuului","dative-genitive-indefinite-plural":"futălăi","dative-definite-genitive-plural":"futălăilor","singular-vocative":"futălăuule","plural-vocative":"futălăilor"}},{"word":"futând","pos":"verb","definitions":["gerund of fute"],"pronunciation":"/fuˈtɨnd/","examples":[{"ro":"Îi văzui futându-se și leșinai.","en":"I saw them fucking and fainted."}]},{"word":"futangiu","pos":"noun","definitions":["fucker"],"pronunciation":"/fu.tanˈd͡ʒiw/","forms":{"plural":"futangii","table-tags":"no-table-tags","inflection-template":"ro-noun-m-u","accusative-indefinite-nominative-singular":"futangiu","accusative-definite-nominative-singular":"futangiul","accusative-indefinite-nominative-plural":"futangii","accusative-definite-nominative-plural":"futangiii","dative-genitive-indefinite-singular":"futangiu","dative-definite-genitive-singular":"futangiului","dative-genitive-indefinite-plural":"futangii","dative-definite-genitive-plural":"futangiilor","singular-vocative":"futangiule","plural-vocative":"futangiilor"}},{"word":"fute","pos":"verb","definitions":["to fuck (to engage in sexual intercourse, crudely)","to annoy, bug, bother","Indicates an intensive or forceful action, physical or metaphorical, sometimes aggressive.","Used to express complete indifference or contempt: to disregard aggressively, to not give a fuck about","to destroy, to wreck, to fuck up (to damage something badly, physically or metaphorically)"],"pronunciation":"/ˈfu.te/","examples":[{"ro":"Nu vreau să te fut. Mă fut numai cu muieri.","en":"I don't wanna fuck you. I only fuck women."},{"ro":"Ne-am întâlnit doar de două ori și deja vrea să ne futem? Hai să fim serioși.","en":"We’ve only met twice and she already wants to fuck? Come on, let’s be serious."},{"ro":"Mă fute la cap cu întrebările lui stupide de când am intrat în birou.","en":"He’s been bugging the shit out of me with his dumb questions since I walked into the office."}],"forms":{"canonical":"a fute 3rd conjugation","present-singular-third-person":"fute","participle-past":"futut","subjunctive-third-person":"fută","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a fute","gerund":"futând","first-person-indicative-present-singular":"fut","indicative-present-second-person-singular":"fuți","indicative-present-singular-third-person":"fute","first-person-indicative-plural-present":"futem","indicative-plural-present-second-person":"futeți","indicative-plural-present-third-person":"fut","first-person-imperfect-indicative-singular":"futeam","imperfect-indicative-second-person-singular":"futeai","imperfect-indicative-singular-third-person":"futea","first-person-imperfect-indicative-plural":"futeam","imperfect-indicative-plural-second-person":"futeați","imperfect-indicative-plural-third-person":"futeau","first-person-indicative-perfect-singular":"futui","indicative-perfect-second-person-singular":"futuși","indicative-perfect-singular-third-person":"futu","first-person-indicative-perfect-plural":"futurăm","indicative-perfect-plural-second-person":"futurăți","indicative-perfect-plural-third-person":"futură","first-person-indicative-pluperfect-singular":"futusem","indicative-pluperfect-second-person-singular":"futuseși","indicative-pluperfect-singular-third-person":"futuse","first-person-indicative-pluperfect-plural":"futuserăm","indicative-pluperfect-plural-second-person":"futuserăți","indicative-pluperfect-plural-third-person":"futuseră","first-person-present-singular-subjunctive":"să fut","present-second-person-singular-subjunctive":"să fuți","present-singular-subjunctive-third-person":"să fută","first-person-plural-present-subjunctive":"să futem","plural-present-second-person-subjunctive":"să futeți","plural-present-subjunctive-third-person":"să fută","imperative-second-person-singular":"fute","imperative-plural-second-person":"futeți","imperative-negative-second-person-singular":"nu fute","imperative-negative-plural-second-person":"nu futeți"}},{"word":"futea","pos":"verb","definitions":["third-person singular imperfect indicative of fute: he/she was fucking"],"pronunciation":"[ˈfu.te̯a]"},{"word":"futeai","pos":"verb","definitions":["second-person singular imperfect indicative of fute: you were fucking"],"pronunciation":"[ˈfu.te̯aj]"},{"word":"futeam","pos":"verb","definitions":["first-person singular imperfect indicative of fute: I was fucking","first-person plural imperfect indicative of fute:we were fucking"],"pronunciation":"[ˈfu.te̯am]"},{"word":"futeați","pos":"verb","definitions":["second-person plural imperfect indicative of fute: you were fucking"],"pronunciation":"[ˈfu.te̯at͡sʲ]"},{"word":"futeau","pos":"verb","definitions":["third-person plural imperfect indicative of fute: they were fucking"],"pronunciation":"[ˈfu.te̯aw]"},{"word":"futelniță","pos":"noun","definitions":["bed"],"forms":{"plural":"futelnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"futelniță","accusative-definite-nominative-singular":"futelnița","accusative-indefinite-nominative-plural":"futelnițe","accusative-definite-nominative-plural":"futelnițele","dative-genitive-indefinite-singular":"futelnițe","dative-definite-genitive-singular":"futelniței","dative-genitive-indefinite-plural":"futelnițe","dative-definite-genitive-plural":"futelnițelor","singular-vocative":"futelniță","plural-vocative":"futelnițelor"}},{"word":"futem","pos":"verb","definitions":["first-person plural present indicative of fute: we fuck","first-person plural present subjunctive of fute"],"pronunciation":"[ˈfutem]"},{"word":"futere","pos":"noun","definitions":["fucking"],"pronunciation":"[ˈfutere]","forms":{"plural":"futeri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"futere","accusative-definite-nominative-singular":"futerea","accusative-indefinite-nominative-plural":"futeri","accusative-definite-nominative-plural":"futerile","dative-genitive-indefinite-singular":"futeri","dative-definite-genitive-singular":"futerii","dative-genitive-indefinite-plural":"futeri","dative-definite-genitive-plural":"futerilor","singular-vocative":"futere","plural-vocative":"futerilor"}},{"word":"futere","pos":"adv","definitions":["the fuck (used as an intensifier after interrogative pronouns)"],"pronunciation":"[ˈfutere]","examples":[{"ro":"Ce futere e în neregulă cu tine?","en":"What the fuck is wrong with you?"}]},{"word":"futeți","pos":"verb","definitions":["second-person plural present indicative of fute: you fuck","second-person plural present subjunctive of fute","second-person plural imperative of fute: fuck!"],"pronunciation":"[ˈfu.tet͡sʲ]","examples":[{"ro":"futeți-vă!","en":"fuck yourselves!"}]},{"word":"fuți","pos":"verb","definitions":["second-person singular present indicative of fute: you fuck","second-person singular present subjunctive of fute"],"pronunciation":"[fut͡sʲ]"},{"word":"futil","pos":"adj","definitions":["futile"],"pronunciation":"/fuˈtil/","forms":{"feminine-singular":"futilă","masculine-plural":"futili","feminine-neuter-plural":"futile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"futil","error-unrecognized-form-feminine-indefinite-singular":"futilă","error-unrecognized-form-indefinite-masculine-plural":"futili","error-unrecognized-form-feminine-indefinite-neuter-plural":"futile","definite-error-unrecognized-form-masculine-neuter-singular":"futilul","definite-error-unrecognized-form-feminine-singular":"futila","definite-error-unrecognized-form-masculine-plural":"futilii","definite-error-unrecognized-form-feminine-neuter-plural":"futilele"}},{"word":"futilitate","pos":"noun","definitions":["futility"],"forms":{"plural":"futilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"futilitate","accusative-definite-nominative-singular":"futilitatea","accusative-indefinite-nominative-plural":"futilități","accusative-definite-nominative-plural":"futilitățile","dative-genitive-indefinite-singular":"futilități","dative-definite-genitive-singular":"futilității","dative-genitive-indefinite-plural":"futilități","dative-definite-genitive-plural":"futilităților","singular-vocative":"futilitate","plural-vocative":"futilităților"}},{"word":"futu","pos":"verb","definitions":["third-person singular simple perfect indicative of fute: he/she fucked"],"pronunciation":"[ˈfutu]"},{"word":"futu-i","pos":"intj","definitions":["fuck!"],"pronunciation":"[ˈfu.tuj]","examples":[{"ro":"Futu-i. Nu-mi vine să cred că iar s-a stricat imprimanta exact când aveam nevoie de ea!","en":"Fuck. I can’t believe the printer broke again right when I needed it!"}]},{"word":"futu-i dumnezeii mă-sii","pos":"intj","definitions":["Used as an exclamation of extreme frustration, anger, or disbelief. Comparable to English Jesus fucking Christ, God fucking damn it, for fucking God's sake, oh my fucking God, Jesus fuck.","Can also refer to someone in a derogatory way."],"pronunciation":"/ˈfu.tuj ˌdum.neˈze.ij ˈmə.sij/","examples":[{"ro":"Futu-i dumnezeii mă-sii, s-a ars mâncarea!","en":"God fucking damn it, the food’s burnt!"},{"ro":"Futu-i dumnezeii mă-sii, chiar acum trebuia să se întâmple?","en":"Oh my fucking God, did this really have to happen now?"},{"ro":"Futu-i dumnezeii mă-sii de mincinos! L-a lovit cu mașina și a fugit.","en":"That lying motherfucker! He hit him with the car and ran."}]},{"word":"futu-i hristoșii mă-sii","pos":"intj","definitions":["A vulgar, highly offensive exclamation used to express rage, disbelief, or pain. Equivalent to English Jesus fucking Christ, God fucking damn it, for fucking God's sake, oh my fucking God, Jesus fuck.","Also used to refer to someone in a pejorative, insulting way."],"pronunciation":"/ˈfu.tuj ˈhris.to.ʃij ˈmə.sij/","examples":[{"ro":"Futu-i hristoșii mă-sii, iar am uitat cheia în casă!","en":"Jesus fucking Christ, I left my keys inside again!"},{"ro":"Futu-i hristoșii mă-sii, cât de proastă poate fi aplicația asta?!","en":"Goddamn it, how broken can this app be?!"},{"ro":"A scăpat basma curată după tot ce-a făcut. Futu-i hristoșii mă-sii.","en":"He got away with everything. What a goddamn cunt."}]},{"word":"futu-ți","pos":"phrase","definitions":["fuck you"],"pronunciation":"/ˈfu.tut͡sʲ/"},{"word":"futu-ți dumnezeii mă-tii","pos":"intj","definitions":["A very strong insult roughly equivalent to English motherfucker or son of a bitch, used to express hatred or rage toward someone.","Used as an emotional intensifier to express pain, shock, anger, or frustration, not always aimed at someone specific."],"pronunciation":"/ˈfu.tut͡sʲ ˌdum.neˈze.ij ˈmə.tij/","examples":[{"ro":"Nu te mai suport, futu-ți dumnezeii mă-tii, pleacă de aici!","en":"I can't stand you anymore, motherfucker, get out of here!"},{"ro":"Ce-ai zis despre mine, futu-ți dumnezeii mă-tii?","en":"What did you just say about me, you goddamn bastard?"},{"ro":"Mi-a căzut telefonul în toaletă, futu-ți dumnezeii mă-tii...","en":"My phone fell in the toilet, goddamn it..."}]},{"word":"futu-ți morții mă-tii","pos":"intj","definitions":["A harsh insult equivalent to English motherfucker or son of a bitch, used to verbally attack someone with strong contempt or anger.","Used as an intensifier to express frustration, pain, or annoyance, not necessarily directed at someone."],"pronunciation":"/ˈfu.tut͡sʲ ˈmor.t͡sij ˈmə.tij/","examples":[{"ro":"Cine te crezi tu, futu-ți morții mă-tii?","en":"Who do you think you are, motherfucker?"},{"ro":"Te uiți urât la mine, futu-ți morții mă-tii, ai vreo problemă?","en":"You’re looking at me funny, motherfucker, you got a problem?"},{"ro":"Mi-am prins degetul la ușă, futu-ți morții mă-tii!","en":"I slammed my finger in the door, son of a bitch!"}]},{"word":"futui","pos":"verb","definitions":["first-person singular simple perfect indicative of fute: I fucked"],"pronunciation":"[ˈfu.tuj]"},{"word":"futură","pos":"verb","definitions":["third-person plural simple perfect indicative of fute: they fucked"],"pronunciation":"[fuˈtu.rə]"},{"word":"futurăm","pos":"verb","definitions":["first-person plural simple perfect indicative of fute: we fucked"],"pronunciation":"[fuˈtu.rəm]"},{"word":"futurăți","pos":"verb","definitions":["second-person plural simple perfect indicative of fute: you fucked"],"pronunciation":"[fuˈtu.rət͡sʲ]"},{"word":"futurism","pos":"noun","definitions":["futurism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"futurism","accusative-definite-nominative":"futurismul","dative-genitive-indefinite":"futurism","dative-definite-genitive":"futurismului","vocative":"futurismule"}},{"word":"futurist","pos":"noun","definitions":["futurist"],"forms":{"plural":"futuriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"futurist","accusative-definite-nominative-singular":"futuristul","accusative-indefinite-nominative-plural":"futuriști","accusative-definite-nominative-plural":"futuriștii","dative-genitive-indefinite-singular":"futurist","dative-definite-genitive-singular":"futuristului","dative-genitive-indefinite-plural":"futuriști","dative-definite-genitive-plural":"futuriștilor","singular-vocative":"futuristule","plural-vocative":"futuriștilor"}},{"word":"futuristă","pos":"noun","definitions":["female equivalent of futurist"],"forms":{"plural":"futuriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"futuristă","accusative-definite-nominative-singular":"futurista","accusative-indefinite-nominative-plural":"futuriste","accusative-definite-nominative-plural":"futuristele","dative-genitive-indefinite-singular":"futuriste","dative-definite-genitive-singular":"futuristei","dative-genitive-indefinite-plural":"futuriste","dative-definite-genitive-plural":"futuristelor","singular-vocative":"futuristă","plural-vocative":"futuristelor"}},{"word":"futurolog","pos":"noun","definitions":["futurologist"],"forms":{"plural":"futurologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"futurolog","accusative-definite-nominative-singular":"futurologul","accusative-indefinite-nominative-plural":"futurologi","accusative-definite-nominative-plural":"futurologii","dative-genitive-indefinite-singular":"futurolog","dative-definite-genitive-singular":"futurologului","dative-genitive-indefinite-plural":"futurologi","dative-definite-genitive-plural":"futurologilor","singular-vocative":"futurologule","plural-vocative":"futurologilor"}},{"word":"futurologă","pos":"noun","definitions":["female equivalent of futurolog"],"forms":{"plural":"futurologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"futurologă","accusative-definite-nominative-singular":"futurologa","accusative-indefinite-nominative-plural":"futurologe","accusative-definite-nominative-plural":"futurologele","dative-genitive-indefinite-singular":"futurologe","dative-definite-genitive-singular":"futurologei","dative-genitive-indefinite-plural":"futurologe","dative-definite-genitive-plural":"futurologelor","singular-vocative":"futurologă","plural-vocative":"futurologelor"}},{"word":"futurologie","pos":"noun","definitions":["futurology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"futurologie","accusative-definite-nominative":"futurologia","dative-genitive-indefinite":"futurologii","dative-definite-genitive":"futurologiei","vocative":"futurologie"}},{"word":"futuse","pos":"verb","definitions":["third-person singular pluperfect indicative of fute: he/she had fucked"],"pronunciation":"[fuˈtu.se]"},{"word":"futusem","pos":"verb","definitions":["first-person singular pluperfect indicative of fute: I had fucked"],"pronunciation":"[fuˈtu.sem]"},{"word":"futuseră","pos":"verb","definitions":["third-person plural pluperfect indicative of fute: they had fucked"],"pronunciation":"[fuˈtu.se.rə]"},{"word":"futuserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of fute: we had fucked"],"pronunciation":"[fuˈtu.se.rəm]"},{"word":"futuserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of fute: you had fucked"],"pronunciation":"[fuˈtu.se.rət͡sʲ]"},{"word":"futuseși","pos":"verb","definitions":["second-person singular pluperfect indicative of fute: you had fucked"],"pronunciation":"[ˈfu.tu.seʃʲ]"},{"word":"futuși","pos":"verb","definitions":["second-person singular simple perfect indicative of fute: you fucked"],"pronunciation":"[fuˈtuʃʲ]"},{"word":"futut","pos":"adj","definitions":["fucked"],"pronunciation":"[fuˈtut]","forms":{"feminine-singular":"futută","masculine-plural":"futuți","feminine-neuter-plural":"futute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"futut","error-unrecognized-form-feminine-indefinite-singular":"futută","error-unrecognized-form-indefinite-masculine-plural":"futuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"futute","definite-error-unrecognized-form-masculine-neuter-singular":"fututul","definite-error-unrecognized-form-feminine-singular":"fututa","definite-error-unrecognized-form-masculine-plural":"futuții","definite-error-unrecognized-form-feminine-neuter-plural":"fututele"}},{"word":"futut","pos":"verb","definitions":["past participle of fute (“fucked, screwed”)"],"pronunciation":"[fuˈtut]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"futut","error-unrecognized-form-feminine-indefinite-singular":"futută","error-unrecognized-form-indefinite-masculine-plural":"futuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"futute","definite-error-unrecognized-form-masculine-neuter-singular":"fututul","definite-error-unrecognized-form-feminine-singular":"fututa","definite-error-unrecognized-form-masculine-plural":"futuții","definite-error-unrecognized-form-feminine-neuter-plural":"fututele"}},{"word":"fututa","pos":"adj","definitions":["definite nominative/accusative feminine singular of futut"],"pronunciation":"[fuˈtuta]"},{"word":"futută","pos":"adj","definitions":["feminine singular of futut"],"pronunciation":"[fuˈtutə]"},{"word":"futute","pos":"adj","definitions":["feminine/neuter plural of futut"],"pronunciation":"[fuˈtute]","gender":"f-p"},{"word":"fututei","pos":"adj","definitions":["definite genitive/dative feminine singular of futut"],"pronunciation":"[fuˈtutej]"},{"word":"fututele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of futut"],"pronunciation":"[fuˈtutele]"},{"word":"fututelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of futut"],"pronunciation":"[fuˈtutelor]"},{"word":"futuți","pos":"adj","definitions":["masculine plural of futut"],"pronunciation":"[fuˈtut͡sʲ]","gender":"m-p"},{"word":"futuții","pos":"adj","definitions":["definite nominative/accusative masculine plural of futut"],"pronunciation":"[fuˈtut͡siː]"},{"word":"futuților","pos":"adj","definitions":["definite genitive/dative masculine plural of futut"],"pronunciation":"[fuˈtut͡silor]"},{"word":"fututul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of futut"],"pronunciation":"/fuˈtutul/"},{"word":"fututului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of futut"],"pronunciation":"[fuˈtutuluj]"},{"word":"fuzant","pos":"adj","definitions":["mixing"],"forms":{"feminine-singular":"fuzantă","masculine-plural":"fuzanți","feminine-neuter-plural":"fuzante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fuzant","error-unrecognized-form-feminine-indefinite-singular":"fuzantă","error-unrecognized-form-indefinite-masculine-plural":"fuzanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"fuzante","definite-error-unrecognized-form-masculine-neuter-singular":"fuzantul","definite-error-unrecognized-form-feminine-singular":"fuzanta","definite-error-unrecognized-form-masculine-plural":"fuzanții","definite-error-unrecognized-form-feminine-neuter-plural":"fuzantele"}},{"word":"fuzarioză","pos":"noun","definitions":["fusariosis"],"forms":{"plural":"fuzarioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fuzarioză","accusative-definite-nominative-singular":"fuzarioza","accusative-indefinite-nominative-plural":"fuzarioze","accusative-definite-nominative-plural":"fuzariozele","dative-genitive-indefinite-singular":"fuzarioze","dative-definite-genitive-singular":"fuzariozei","dative-genitive-indefinite-plural":"fuzarioze","dative-definite-genitive-plural":"fuzariozelor","singular-vocative":"fuzarioză","plural-vocative":"fuzariozelor"}},{"word":"fuzee","pos":"noun","definitions":["rocket"],"forms":{"plural":"fuzee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"fuzee","accusative-definite-nominative-singular":"fuzeea","accusative-indefinite-nominative-plural":"fuzee","accusative-definite-nominative-plural":"fuzeele","dative-genitive-indefinite-singular":"fuzee","dative-definite-genitive-singular":"fuzeei","dative-genitive-indefinite-plural":"fuzee","dative-definite-genitive-plural":"fuzeelor","singular-vocative":"fuzee","plural-vocative":"fuzeelor"}},{"word":"fuzelaj","pos":"noun","definitions":["hull"],"forms":{"plural":"fuzelaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"fuzelaj","accusative-definite-nominative-singular":"fuzelajul","accusative-indefinite-nominative-plural":"fuzelaje","accusative-definite-nominative-plural":"fuzelajele","dative-genitive-indefinite-singular":"fuzelaj","dative-definite-genitive-singular":"fuzelajului","dative-genitive-indefinite-plural":"fuzelaje","dative-definite-genitive-plural":"fuzelajelor","singular-vocative":"fuzelajule","plural-vocative":"fuzelajelor"}},{"word":"fuzibil","pos":"adj","definitions":["fusible"],"forms":{"feminine-singular":"fuzibilă","masculine-plural":"fuzibili","feminine-neuter-plural":"fuzibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fuzibil","error-unrecognized-form-feminine-indefinite-singular":"fuzibilă","error-unrecognized-form-indefinite-masculine-plural":"fuzibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"fuzibile","definite-error-unrecognized-form-masculine-neuter-singular":"fuzibilul","definite-error-unrecognized-form-feminine-singular":"fuzibila","definite-error-unrecognized-form-masculine-plural":"fuzibilii","definite-error-unrecognized-form-feminine-neuter-plural":"fuzibilele"}},{"word":"fuzibilitate","pos":"noun","definitions":["fusibility"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fuzibilitate","accusative-definite-nominative-singular":"fuzibilitatea","accusative-indefinite-nominative-plural":"fuzibilități","accusative-definite-nominative-plural":"fuzibilitățile","dative-genitive-indefinite-singular":"fuzibilități","dative-definite-genitive-singular":"fuzibilității","dative-genitive-indefinite-plural":"fuzibilități","dative-definite-genitive-plural":"fuzibilităților","singular-vocative":"fuzibilitate","plural-vocative":"fuzibilităților"}},{"word":"fuziform","pos":"adj","definitions":["alternative form of fusiform"],"forms":{"feminine-singular":"fuziformă","masculine-plural":"fuziformi","feminine-neuter-plural":"fuziforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fuziform","error-unrecognized-form-feminine-indefinite-singular":"fuziformă","error-unrecognized-form-indefinite-masculine-plural":"fuziformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"fuziforme","definite-error-unrecognized-form-masculine-neuter-singular":"fuziformul","definite-error-unrecognized-form-feminine-singular":"fuziforma","definite-error-unrecognized-form-masculine-plural":"fuziformii","definite-error-unrecognized-form-feminine-neuter-plural":"fuziformele"}},{"word":"fuziona","pos":"verb","definitions":["to coalesce"],"forms":{"canonical":"a fuziona 1st conjugation","present-singular-third-person":"fuzionează","participle-past":"fuzionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a fuziona","gerund":"fuzionând","first-person-indicative-present-singular":"fuzionez","indicative-present-second-person-singular":"fuzionezi","indicative-present-singular-third-person":"fuzionează","first-person-indicative-plural-present":"fuzionăm","indicative-plural-present-second-person":"fuzionați","indicative-plural-present-third-person":"fuzionează","first-person-imperfect-indicative-singular":"fuzionam","imperfect-indicative-second-person-singular":"fuzionai","imperfect-indicative-singular-third-person":"fuziona","first-person-imperfect-indicative-plural":"fuzionam","imperfect-indicative-plural-second-person":"fuzionați","imperfect-indicative-plural-third-person":"fuzionau","first-person-indicative-perfect-singular":"fuzionai","indicative-perfect-second-person-singular":"fuzionași","indicative-perfect-singular-third-person":"fuzionă","first-person-indicative-perfect-plural":"fuzionarăm","indicative-perfect-plural-second-person":"fuzionarăți","indicative-perfect-plural-third-person":"fuzionară","first-person-indicative-pluperfect-singular":"fuzionasem","indicative-pluperfect-second-person-singular":"fuzionaseși","indicative-pluperfect-singular-third-person":"fuzionase","first-person-indicative-pluperfect-plural":"fuzionaserăm","indicative-pluperfect-plural-second-person":"fuzionaserăți","indicative-pluperfect-plural-third-person":"fuzionaseră","first-person-present-singular-subjunctive":"să fuzionez","present-second-person-singular-subjunctive":"să fuzionezi","present-singular-subjunctive-third-person":"să fuzioneze","first-person-plural-present-subjunctive":"să fuzionăm","plural-present-second-person-subjunctive":"să fuzionați","plural-present-subjunctive-third-person":"să fuzioneze","imperative-second-person-singular":"fuzionează","imperative-plural-second-person":"fuzionați","imperative-negative-second-person-singular":"nu fuziona","imperative-negative-plural-second-person":"nu fuzionați"}},{"word":"fuzionare","pos":"noun","definitions":["fusion, merger"],"forms":{"plural":"fuzionări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"fuzionare","accusative-definite-nominative-singular":"fuzionarea","accusative-indefinite-nominative-plural":"fuzionări","accusative-definite-nominative-plural":"fuzionările","dative-genitive-indefinite-singular":"fuzionări","dative-definite-genitive-singular":"fuzionării","dative-genitive-indefinite-plural":"fuzionări","dative-definite-genitive-plural":"fuzionărilor","singular-vocative":"fuzionare","plural-vocative":"fuzionărilor"}},{"word":"fuzionat","pos":"adj","definitions":["amalgamated"],"forms":{"feminine-singular":"fuzionată","masculine-plural":"fuzionați","feminine-neuter-plural":"fuzionate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"fuzionat","error-unrecognized-form-feminine-indefinite-singular":"fuzionată","error-unrecognized-form-indefinite-masculine-plural":"fuzionați","error-unrecognized-form-feminine-indefinite-neuter-plural":"fuzionate","definite-error-unrecognized-form-masculine-neuter-singular":"fuzionatul","definite-error-unrecognized-form-feminine-singular":"fuzionata","definite-error-unrecognized-form-masculine-plural":"fuzionații","definite-error-unrecognized-form-feminine-neuter-plural":"fuzionatele"}},{"word":"fuzionat","pos":"verb","definitions":["past participle of fuziona"],"forms":{"participle-past":"of fuziona"}},{"word":"fuzionist","pos":"noun","definitions":["fusionist"],"forms":{"plural":"fuzioniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"fuzionist","accusative-definite-nominative-singular":"fuzionistul","accusative-indefinite-nominative-plural":"fuzioniști","accusative-definite-nominative-plural":"fuzioniștii","dative-genitive-indefinite-singular":"fuzionist","dative-definite-genitive-singular":"fuzionistului","dative-genitive-indefinite-plural":"fuzioniști","dative-definite-genitive-plural":"fuzioniștilor","singular-vocative":"fuzionistule","plural-vocative":"fuzioniștilor"}},{"word":"fuzionistă","pos":"noun","definitions":["female equivalent of fuzionist"],"forms":{"plural":"fuzioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"fuzionistă","accusative-definite-nominative-singular":"fuzionista","accusative-indefinite-nominative-plural":"fuzioniste","accusative-definite-nominative-plural":"fuzionistele","dative-genitive-indefinite-singular":"fuzioniste","dative-definite-genitive-singular":"fuzionistei","dative-genitive-indefinite-plural":"fuzioniste","dative-definite-genitive-plural":"fuzionistelor","singular-vocative":"fuzionistă","plural-vocative":"fuzionistelor"}},{"word":"fuziune","pos":"noun","definitions":["fusion"],"forms":{"plural":"fuziuni"}},{"word":"fuziune nucleară","pos":"noun","definitions":["nuclear fusion"],"forms":{"plural":"fuziuni nucleare"}}];
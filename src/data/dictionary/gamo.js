@@ -0,0 +1 @@
+export default [{"word":"gamofob","pos":"adj","definitions":["gamophobe"],"forms":{"feminine-singular":"gamofobă","masculine-plural":"gamofobi","feminine-neuter-plural":"gamofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gamofob","error-unrecognized-form-feminine-indefinite-singular":"gamofobă","error-unrecognized-form-indefinite-masculine-plural":"gamofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gamofobe","definite-error-unrecognized-form-masculine-neuter-singular":"gamofobul","definite-error-unrecognized-form-feminine-singular":"gamofoba","definite-error-unrecognized-form-masculine-plural":"gamofobii","definite-error-unrecognized-form-feminine-neuter-plural":"gamofobele"}},{"word":"gamofob","pos":"noun","definitions":["gamophobe"],"forms":{"plural":"gamofobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gamofob","accusative-definite-nominative-singular":"gamofobul","accusative-indefinite-nominative-plural":"gamofobi","accusative-definite-nominative-plural":"gamofobii","dative-genitive-indefinite-singular":"gamofob","dative-definite-genitive-singular":"gamofobului","dative-genitive-indefinite-plural":"gamofobi","dative-definite-genitive-plural":"gamofobilor","singular-vocative":"gamofobule","plural-vocative":"gamofobilor"}},{"word":"gamofobie","pos":"noun","definitions":["gamophobia"],"forms":{"plural":"gamofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gamofobie","accusative-definite-nominative-singular":"gamofobia","accusative-indefinite-nominative-plural":"gamofobii","accusative-definite-nominative-plural":"gamofobiile","dative-genitive-indefinite-singular":"gamofobii","dative-definite-genitive-singular":"gamofobiei","dative-genitive-indefinite-plural":"gamofobii","dative-definite-genitive-plural":"gamofobiilor","singular-vocative":"gamofobie","plural-vocative":"gamofobiilor"}},{"word":"gamogeneză","pos":"noun","definitions":["gamogenesis"],"forms":{"plural":"gamogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gamogeneză","accusative-definite-nominative-singular":"gamogeneza","accusative-indefinite-nominative-plural":"gamogeneze","accusative-definite-nominative-plural":"gamogenezele","dative-genitive-indefinite-singular":"gamogeneze","dative-definite-genitive-singular":"gamogenezei","dative-genitive-indefinite-plural":"gamogeneze","dative-definite-genitive-plural":"gamogenezelor","singular-vocative":"gamogeneză","plural-vocative":"gamogenezelor"}},{"word":"gamoman","pos":"adj","definitions":["gamomaniac"],"forms":{"feminine-singular":"gamomană","masculine-plural":"gamomani","feminine-neuter-plural":"gamomane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gamoman","error-unrecognized-form-feminine-indefinite-singular":"gamomană","error-unrecognized-form-indefinite-masculine-plural":"gamomani","error-unrecognized-form-feminine-indefinite-neuter-plural":"gamomane","definite-error-unrecognized-form-masculine-neuter-singular":"gamomanul","definite-error-unrecognized-form-feminine-singular":"gamomana","definite-error-unrecognized-form-masculine-plural":"gamomanii","definite-error-unrecognized-form-feminine-neuter-plural":"gamomanele"}},{"word":"gamoman","pos":"noun","definitions":["gamomaniac"],"forms":{"plural":"gamomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gamoman","accusative-definite-nominative-singular":"gamomanul","accusative-indefinite-nominative-plural":"gamomani","accusative-definite-nominative-plural":"gamomanii","dative-genitive-indefinite-singular":"gamoman","dative-definite-genitive-singular":"gamomanului","dative-genitive-indefinite-plural":"gamomani","dative-definite-genitive-plural":"gamomanilor","singular-vocative":"gamomanule","plural-vocative":"gamomanilor"}},{"word":"gamomanie","pos":"noun","definitions":["gamomania"],"forms":{"plural":"gamomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gamomanie","accusative-definite-nominative-singular":"gamomania","accusative-indefinite-nominative-plural":"gamomanii","accusative-definite-nominative-plural":"gamomaniile","dative-genitive-indefinite-singular":"gamomanii","dative-definite-genitive-singular":"gamomaniei","dative-genitive-indefinite-plural":"gamomanii","dative-definite-genitive-plural":"gamomaniilor","singular-vocative":"gamomanie","plural-vocative":"gamomaniilor"}},{"word":"gamosepal","pos":"adj","definitions":["gamosepalous"],"forms":{"feminine-singular":"gamosepală","masculine-plural":"gamosepali","feminine-neuter-plural":"gamosepale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gamosepal","error-unrecognized-form-feminine-indefinite-singular":"gamosepală","error-unrecognized-form-indefinite-masculine-plural":"gamosepali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gamosepale","definite-error-unrecognized-form-masculine-neuter-singular":"gamosepalul","definite-error-unrecognized-form-feminine-singular":"gamosepala","definite-error-unrecognized-form-masculine-plural":"gamosepalii","definite-error-unrecognized-form-feminine-neuter-plural":"gamosepalele"}},{"word":"Gană","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Gană"}},{"word":"ganaș","pos":"noun","definitions":["alternative form of ganașă"],"forms":{"plural":"ganașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ganaș","accusative-definite-nominative-singular":"ganașul","accusative-indefinite-nominative-plural":"ganașe","accusative-definite-nominative-plural":"ganașele","dative-genitive-indefinite-singular":"ganaș","dative-definite-genitive-singular":"ganașului","dative-genitive-indefinite-plural":"ganașe","dative-definite-genitive-plural":"ganașelor","singular-vocative":"ganașule","plural-vocative":"ganașelor"}},{"word":"ganașă","pos":"noun","definitions":["jawbone"],"forms":{"plural":"ganașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ganașă","accusative-definite-nominative-singular":"ganașăul","accusative-indefinite-nominative-plural":"ganașe","accusative-definite-nominative-plural":"ganașele","dative-genitive-indefinite-singular":"ganașă","dative-definite-genitive-singular":"ganașăului","dative-genitive-indefinite-plural":"ganașe","dative-definite-genitive-plural":"ganașelor","singular-vocative":"ganașăule","plural-vocative":"ganașelor"}},{"word":"gănceluit","pos":"adj","definitions":["syphilitic"],"forms":{"feminine-singular":"gănceluită","masculine-plural":"gănceluiți","feminine-neuter-plural":"gănceluite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gănceluit","error-unrecognized-form-feminine-indefinite-singular":"gănceluită","error-unrecognized-form-indefinite-masculine-plural":"gănceluiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gănceluite","definite-error-unrecognized-form-masculine-neuter-singular":"gănceluitul","definite-error-unrecognized-form-feminine-singular":"gănceluita","definite-error-unrecognized-form-masculine-plural":"gănceluiții","definite-error-unrecognized-form-feminine-neuter-plural":"gănceluitele"}},{"word":"Gănciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gănciulescu"}},{"word":"gând","pos":"noun","definitions":["thought","care"],"pronunciation":"/ɡɨnd/","forms":{"plural":"gânduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gând","accusative-definite-nominative-singular":"gândul","accusative-indefinite-nominative-plural":"gânduri","accusative-definite-nominative-plural":"gândurile","dative-genitive-indefinite-singular":"gând","dative-definite-genitive-singular":"gândului","dative-genitive-indefinite-plural":"gânduri","dative-definite-genitive-plural":"gândurilor","singular-vocative":"gândule","plural-vocative":"gândurilor"}},{"word":"Gândac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gândac"}},{"word":"gândac","pos":"noun","definitions":["beetle","cockroach"],"pronunciation":"/ɡɨnˈdak/","forms":{"plural":"gândaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gândac","accusative-definite-nominative-singular":"gândacul","accusative-indefinite-nominative-plural":"gândaci","accusative-definite-nominative-plural":"gândacii","dative-genitive-indefinite-singular":"gândac","dative-definite-genitive-singular":"gândacului","dative-genitive-indefinite-plural":"gândaci","dative-definite-genitive-plural":"gândacilor","singular-vocative":"gândacule","plural-vocative":"gândacilor"}},{"word":"gândăcel","pos":"noun","definitions":["diminutive of gândac; small beetle"],"forms":{"plural":"gândăcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gândăcel","accusative-definite-nominative-singular":"gândăcelul","accusative-indefinite-nominative-plural":"gândăceli","accusative-definite-nominative-plural":"gândăcelii","dative-genitive-indefinite-singular":"gândăcel","dative-definite-genitive-singular":"gândăcelului","dative-genitive-indefinite-plural":"gândăceli","dative-definite-genitive-plural":"gândăcelilor","singular-vocative":"gândăcelule","plural-vocative":"gândăcelilor"}},{"word":"gândaci","pos":"noun","definitions":["plural of gândac"]},{"word":"gândea","pos":"verb","definitions":["third-person singular imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯a]"},{"word":"gândeai","pos":"verb","definitions":["second-person singular imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯aj]"},{"word":"gândeam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯am]"},{"word":"gândească","pos":"verb","definitions":["third-person singular/plural present subjunctive of gândi"],"pronunciation":"[ɡɨnˈde̯askə]"},{"word":"gândeați","pos":"verb","definitions":["second-person plural imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯atsʲ]"},{"word":"gândeau","pos":"verb","definitions":["third-person plural imperfect indicative of gândi"],"pronunciation":"[ɡɨnˈde̯aw]"},{"word":"gândesc","pos":"verb","definitions":["inflection of gândi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"/ɡɨnˈdesk/"},{"word":"Gândescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gândescu"}},{"word":"gândește","pos":"verb","definitions":["inflection of gândi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[ɡɨnˈdeʃte]"},{"word":"gândești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of gândi"],"pronunciation":"[ɡɨnˈdeʃtʲ]"},{"word":"gândi","pos":"verb","definitions":["to think (use one’s faculty of thought)","to think (be in thought)","to think about","to think of doing something (to intend)","to think up, invent"],"pronunciation":"/ɡɨnˈdi/","examples":[{"ro":"Mă gândesc să mănânc ceva.","en":"I’m thinking of eating something."}],"forms":{"canonical":"a gândi 4th conjugation","present-singular-third-person":"gândește","participle-past":"gândit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gândi","gerund":"gândind","first-person-indicative-present-singular":"gândesc","indicative-present-second-person-singular":"gândești","indicative-present-singular-third-person":"gândește","first-person-indicative-plural-present":"gândim","indicative-plural-present-second-person":"gândiți","indicative-plural-present-third-person":"gândesc","first-person-imperfect-indicative-singular":"gândeam","imperfect-indicative-second-person-singular":"gândeai","imperfect-indicative-singular-third-person":"gândea","first-person-imperfect-indicative-plural":"gândeam","imperfect-indicative-plural-second-person":"gândeați","imperfect-indicative-plural-third-person":"gândeau","first-person-indicative-perfect-singular":"gândii","indicative-perfect-second-person-singular":"gândiși","indicative-perfect-singular-third-person":"gândi","first-person-indicative-perfect-plural":"gândirăm","indicative-perfect-plural-second-person":"gândirăți","indicative-perfect-plural-third-person":"gândiră","first-person-indicative-pluperfect-singular":"gândisem","indicative-pluperfect-second-person-singular":"gândiseși","indicative-pluperfect-singular-third-person":"gândise","first-person-indicative-pluperfect-plural":"gândiserăm","indicative-pluperfect-plural-second-person":"gândiserăți","indicative-pluperfect-plural-third-person":"gândiseră","first-person-present-singular-subjunctive":"să gândesc","present-second-person-singular-subjunctive":"să gândești","present-singular-subjunctive-third-person":"să gândească","first-person-plural-present-subjunctive":"să gândim","plural-present-second-person-subjunctive":"să gândiți","plural-present-subjunctive-third-person":"să gândească","imperative-second-person-singular":"gândește","imperative-plural-second-person":"gândiți","imperative-negative-second-person-singular":"nu gândi","imperative-negative-plural-second-person":"nu gândiți"}},{"word":"gândii","pos":"verb","definitions":["first-person singular simple perfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiː]","forms":{"canonical":"gândíi"}},{"word":"gândim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of gândi"],"pronunciation":"[ɡɨnˈdim]","forms":{"canonical":"gândím"}},{"word":"gândind","pos":"verb","definitions":["gerund of gândi"],"pronunciation":"[ɡɨnˈdind]"},{"word":"gândiră","pos":"verb","definitions":["third-person plural simple perfect indicative of gândi"],"pronunciation":"[ɡɨnˈdirə]","forms":{"canonical":"gândíră"}},{"word":"gândirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of gândi"],"pronunciation":"[ɡɨnˈdirəm]","forms":{"canonical":"gândírăm"}},{"word":"gândirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of gândi"],"pronunciation":"[ɡɨnˈdirətsʲ]","forms":{"canonical":"gândírăți"}},{"word":"gândire","pos":"noun","definitions":["thinking","thought, idea","consideration"],"forms":{"plural":"gândiri"}},{"word":"gândire laterală","pos":"noun","definitions":["lateral thinking"]},{"word":"gândirist","pos":"adj","definitions":["related to the ideology of the Gândirea journal"],"forms":{"feminine-singular":"gândiristă","masculine-plural":"gândiriști","feminine-neuter-plural":"gândiriste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gândirist","error-unrecognized-form-feminine-indefinite-singular":"gândiristă","error-unrecognized-form-indefinite-masculine-plural":"gândiriști","error-unrecognized-form-feminine-indefinite-neuter-plural":"gândiriste","definite-error-unrecognized-form-masculine-neuter-singular":"gândiristul","definite-error-unrecognized-form-feminine-singular":"gândirista","definite-error-unrecognized-form-masculine-plural":"gândiriștii","definite-error-unrecognized-form-feminine-neuter-plural":"gândiristele"}},{"word":"gândiristă","pos":"noun","definitions":["female equivalent of gândirist"],"forms":{"plural":"gândiriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gândiristă","accusative-definite-nominative-singular":"gândirista","accusative-indefinite-nominative-plural":"gândiriste","accusative-definite-nominative-plural":"gândiristele","dative-genitive-indefinite-singular":"gândiriste","dative-definite-genitive-singular":"gândiristei","dative-genitive-indefinite-plural":"gândiriste","dative-definite-genitive-plural":"gândiristelor","singular-vocative":"gândiristă","plural-vocative":"gândiristelor"}},{"word":"gândise","pos":"verb","definitions":["third-person singular pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdise]","forms":{"canonical":"gândíse"}},{"word":"gândisem","pos":"verb","definitions":["first-person singular pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdisem]","forms":{"canonical":"gândísem"}},{"word":"gândiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiserə]","forms":{"canonical":"gândíseră"}},{"word":"gândiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiserəm]","forms":{"canonical":"gândíserăm"}},{"word":"gândiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiserətsʲ]","forms":{"canonical":"gândíserăți"}},{"word":"gândiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiseʃʲ]","forms":{"canonical":"gândíseși"}},{"word":"gândiși","pos":"verb","definitions":["second-person singular simple perfect indicative of gândi"],"pronunciation":"[ɡɨnˈdiʃʲ]","forms":{"canonical":"gândíși"}},{"word":"gândit","pos":"noun","definitions":["thinking"],"pronunciation":"[ɡɨnˈdit]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gândit","accusative-definite-nominative":"gânditul","dative-genitive-indefinite":"gândit","dative-definite-genitive":"gânditului","vocative":"gânditule"}},{"word":"gândit","pos":"verb","definitions":["past participle of gândi"],"pronunciation":"[ɡɨnˈdit]","forms":{"participle-past":"of gândi"}},{"word":"gândita","pos":"adj","definitions":["definite nominative/accusative feminine singular of gândit"],"pronunciation":"[ɡɨnˈdita]"},{"word":"gândită","pos":"adj","definitions":["feminine singular of gândit"],"pronunciation":"[ɡɨnˈditə]"},{"word":"gândite","pos":"adj","definitions":["feminine/neuter plural of gândit"],"pronunciation":"[ɡɨnˈdite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"gândíte"}},{"word":"gânditei","pos":"adj","definitions":["definite genitive/dative feminine singular of gândit"],"pronunciation":"[ɡɨnˈditej]"},{"word":"gânditele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of gândit"],"pronunciation":"[ɡɨnˈditele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"gândítele"}},{"word":"gânditelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of gândit"],"pronunciation":"[ɡɨnˈditelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"gândítelor"}},{"word":"gândiți","pos":"adj","definitions":["masculine plural of gândit"],"pronunciation":"[ɡɨnˈdit͡sʲ]","forms":{"canonical":"gândíți"}},{"word":"gândiți","pos":"verb","definitions":["inflection of gândi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[ɡɨnˈdit͡sʲ]","forms":{"canonical":"gândíți"}},{"word":"gândiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of gândit"],"pronunciation":"[ɡɨnˈdit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"gândíții"}},{"word":"gândiților","pos":"adj","definitions":["definite genitive/dative masculine plural of gândit"],"pronunciation":"[ɡɨnˈdit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"gândíților"}},{"word":"gânditoare","pos":"noun","definitions":["female equivalent of gânditor"],"forms":{"plural":"gânditoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"gânditoare","accusative-definite-nominative-singular":"gânditoarea","accusative-indefinite-nominative-plural":"gânditoare","accusative-definite-nominative-plural":"gânditoarele","dative-genitive-indefinite-singular":"gânditoare","dative-definite-genitive-singular":"gânditoarei","dative-genitive-indefinite-plural":"gânditoare","dative-definite-genitive-plural":"gânditoarelor","singular-vocative":"gânditoare","plural-vocative":"gânditoarelor"}},{"word":"gânditor","pos":"noun","definitions":["thinker"],"forms":{"plural":"gânditori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gânditor","accusative-definite-nominative-singular":"gânditorul","accusative-indefinite-nominative-plural":"gânditori","accusative-definite-nominative-plural":"gânditorii","dative-genitive-indefinite-singular":"gânditor","dative-definite-genitive-singular":"gânditorului","dative-genitive-indefinite-plural":"gânditori","dative-definite-genitive-plural":"gânditorilor","singular-vocative":"gânditorule","plural-vocative":"gânditorilor"}},{"word":"gânditul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of gândit"],"pronunciation":"[ɡɨnˈditul]","gender":"m","forms":{"canonical-masculine-neuter":"gândítul"}},{"word":"gânditului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of gândit"],"pronunciation":"[ɡɨnˈdituluj]","gender":"m","forms":{"canonical-masculine-neuter":"gândítului"}},{"word":"gândul","pos":"noun","definitions":["definite nominative/accusative singular of gând"]},{"word":"gândului","pos":"noun","definitions":["definite dative/genitive singular of gând"]},{"word":"gândurel","pos":"noun","definitions":["diminutive of gând"],"forms":{"plural":"gândurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gândurel","accusative-definite-nominative-singular":"gândurelul","accusative-indefinite-nominative-plural":"gândurele","accusative-definite-nominative-plural":"gândurelele","dative-genitive-indefinite-singular":"gândurel","dative-definite-genitive-singular":"gândurelului","dative-genitive-indefinite-plural":"gândurele","dative-definite-genitive-plural":"gândurelelor","singular-vocative":"gândurelule","plural-vocative":"gândurelelor"}},{"word":"gânduri","pos":"noun","definitions":["plural of gând: thoughts"],"pronunciation":"[ˈɡɨn.durʲ]"},{"word":"gândurile","pos":"noun","definitions":["definite nominative/accusative plural of gând"]},{"word":"gândurilor","pos":"noun","definitions":["inflection of gând:","definite genitive/dative plural","vocative plural"]},{"word":"Gane","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Gane"}},{"word":"Ganea","pos":"name","definitions":["a surname from Bulgarian"],"gender":"f"},{"word":"Găneasa","pos":"name","definitions":["a commune of Ilfov County, Romania","a village in Găneasa, Ilfov County, Romania","a commune of Olt County, Romania","a village in Găneasa, Olt County, Romania"],"gender":"f"},{"word":"Gănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gănescu"}},{"word":"Gănești","pos":"name","definitions":["a village in Bistra, Alba County, Romania","a village in Pietroșani, Argeș County, Romania","a village in Cavadinești, Galați County, Romania","a village in Ion Neculce, Iași County, Romania","a commune of Mureș County, Romania"],"gender":"m"},{"word":"gang","pos":"noun","definitions":["passageway"],"forms":{"plural":"ganguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gang","accusative-definite-nominative-singular":"gangul","accusative-indefinite-nominative-plural":"ganguri","accusative-definite-nominative-plural":"gangurile","dative-genitive-indefinite-singular":"gang","dative-definite-genitive-singular":"gangului","dative-genitive-indefinite-plural":"ganguri","dative-definite-genitive-plural":"gangurilor","singular-vocative":"gangule","plural-vocative":"gangurilor"}},{"word":"gangă","pos":"noun","definitions":["gangue"],"forms":{"plural":"gange","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gangă","accusative-definite-nominative-singular":"ganga","accusative-indefinite-nominative-plural":"gange","accusative-definite-nominative-plural":"gangele","dative-genitive-indefinite-singular":"gange","dative-definite-genitive-singular":"gangei","dative-genitive-indefinite-plural":"gange","dative-definite-genitive-plural":"gangelor","singular-vocative":"gangă","plural-vocative":"gangelor"}},{"word":"gângăios","pos":"adj","definitions":["stuttering"],"forms":{"feminine-singular":"gângăioasă","masculine-plural":"gângăioși","feminine-neuter-plural":"gângăioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gângăios","error-unrecognized-form-feminine-indefinite-singular":"gângăioasă","error-unrecognized-form-indefinite-masculine-plural":"gângăioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gângăioase","definite-error-unrecognized-form-masculine-neuter-singular":"gângăiosul","definite-error-unrecognized-form-feminine-singular":"gângăioasa","definite-error-unrecognized-form-masculine-plural":"gângăioșii","definite-error-unrecognized-form-feminine-neuter-plural":"gângăioasele"}},{"word":"gânganie","pos":"noun","definitions":["insect, critter"],"forms":{"plural":"gângănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gânganie","accusative-definite-nominative-singular":"gângania","accusative-indefinite-nominative-plural":"gânganii","accusative-definite-nominative-plural":"gânganiile","dative-genitive-indefinite-singular":"gânganii","dative-definite-genitive-singular":"gânganiei","dative-genitive-indefinite-plural":"gânganii","dative-definite-genitive-plural":"gânganiilor","singular-vocative":"gânganie","plural-vocative":"gânganiilor"}},{"word":"gângav","pos":"adj","definitions":["stuttering, mumbling"],"forms":{"feminine-singular":"gângavă","masculine-plural":"gângavi","feminine-neuter-plural":"gângave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gângav","error-unrecognized-form-feminine-indefinite-singular":"gângavă","error-unrecognized-form-indefinite-masculine-plural":"gângavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gângave","definite-error-unrecognized-form-masculine-neuter-singular":"gângavul","definite-error-unrecognized-form-feminine-singular":"gângava","definite-error-unrecognized-form-masculine-plural":"gângavii","definite-error-unrecognized-form-feminine-neuter-plural":"gângavele"}},{"word":"gângavă","pos":"noun","definitions":["female equivalent of gângav"],"forms":{"plural":"gângave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gângavă","accusative-definite-nominative-singular":"gângava","accusative-indefinite-nominative-plural":"gângave","accusative-definite-nominative-plural":"gângavele","dative-genitive-indefinite-singular":"gângave","dative-definite-genitive-singular":"gângavei","dative-genitive-indefinite-plural":"gângave","dative-definite-genitive-plural":"gângavelor","singular-vocative":"gângavă","plural-vocative":"gângavelor"}},{"word":"gângăveală","pos":"noun","definitions":["stuttering"],"forms":{"plural":"gângăveli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gângăveală","accusative-definite-nominative-singular":"gângăveala","accusative-indefinite-nominative-plural":"gângăvele","accusative-definite-nominative-plural":"gângăvelele","dative-genitive-indefinite-singular":"gângăvele","dative-definite-genitive-singular":"gângăvelei","dative-genitive-indefinite-plural":"gângăvele","dative-definite-genitive-plural":"gângăvelelor","singular-vocative":"gângăveală","plural-vocative":"gângăvelelor"}},{"word":"gângăvie","pos":"noun","definitions":["stuttering"],"forms":{"plural":"gângăvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gângăvie","accusative-definite-nominative-singular":"gângăvia","accusative-indefinite-nominative-plural":"gângăvii","accusative-definite-nominative-plural":"gângăviile","dative-genitive-indefinite-singular":"gângăvii","dative-definite-genitive-singular":"gângăviei","dative-genitive-indefinite-plural":"gângăvii","dative-definite-genitive-plural":"gângăviilor","singular-vocative":"gângăvie","plural-vocative":"gângăviilor"}},{"word":"gângăvire","pos":"noun","definitions":["stammer"],"forms":{"plural":"gângăviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gângăvire","accusative-definite-nominative-singular":"gângăvirea","accusative-indefinite-nominative-plural":"gângăviri","accusative-definite-nominative-plural":"gângăvirile","dative-genitive-indefinite-singular":"gângăviri","dative-definite-genitive-singular":"gângăvirii","dative-genitive-indefinite-plural":"gângăviri","dative-definite-genitive-plural":"gângăvirilor","singular-vocative":"gângăvire","plural-vocative":"gângăvirilor"}},{"word":"gângăvit","pos":"adj","definitions":["stuttering"],"forms":{"feminine-singular":"gângăvită","masculine-plural":"gângăviți","feminine-neuter-plural":"gângăvite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gângăvit","error-unrecognized-form-feminine-indefinite-singular":"gângăvită","error-unrecognized-form-indefinite-masculine-plural":"gângăviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gângăvite","definite-error-unrecognized-form-masculine-neuter-singular":"gângăvitul","definite-error-unrecognized-form-feminine-singular":"gângăvita","definite-error-unrecognized-form-masculine-plural":"gângăviții","definite-error-unrecognized-form-feminine-neuter-plural":"gângăvitele"}},{"word":"gângăvit","pos":"verb","definitions":["past participle of gângăvi"],"forms":{"participle-past":"of gângăvi"}},{"word":"Gângiova","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Gângiova, Dolj County, Romania"],"gender":"f"},{"word":"gangliectomie","pos":"noun","definitions":["gangliectomy"],"forms":{"plural":"gangliectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gangliectomie","accusative-definite-nominative-singular":"gangliectomia","accusative-indefinite-nominative-plural":"gangliectomii","accusative-definite-nominative-plural":"gangliectomiile","dative-genitive-indefinite-singular":"gangliectomii","dative-definite-genitive-singular":"gangliectomiei","dative-genitive-indefinite-plural":"gangliectomii","dative-definite-genitive-plural":"gangliectomiilor","singular-vocative":"gangliectomie","plural-vocative":"gangliectomiilor"}},{"word":"ganglion","pos":"noun","definitions":["ganglion"],"forms":{"plural":"ganglioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ganglion","accusative-definite-nominative-singular":"ganglionul","accusative-indefinite-nominative-plural":"ganglioni","accusative-definite-nominative-plural":"ganglionii","dative-genitive-indefinite-singular":"ganglion","dative-definite-genitive-singular":"ganglionului","dative-genitive-indefinite-plural":"ganglioni","dative-definite-genitive-plural":"ganglionilor","singular-vocative":"ganglionule","plural-vocative":"ganglionilor"}},{"word":"ganglionar","pos":"adj","definitions":["ganglial"],"forms":{"feminine-singular":"ganglionară","masculine-plural":"ganglionari","feminine-neuter-plural":"ganglionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ganglionar","error-unrecognized-form-feminine-indefinite-singular":"ganglionară","error-unrecognized-form-indefinite-masculine-plural":"ganglionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"ganglionare","definite-error-unrecognized-form-masculine-neuter-singular":"ganglionarul","definite-error-unrecognized-form-feminine-singular":"ganglionara","definite-error-unrecognized-form-masculine-plural":"ganglionarii","definite-error-unrecognized-form-feminine-neuter-plural":"ganglionarele"}},{"word":"ganglioplegic","pos":"adj","definitions":["ganglioplegic"],"forms":{"feminine-singular":"ganglioplegică","masculine-plural":"ganglioplegici","feminine-neuter-plural":"ganglioplegice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ganglioplegic","error-unrecognized-form-feminine-indefinite-singular":"ganglioplegică","error-unrecognized-form-indefinite-masculine-plural":"ganglioplegici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ganglioplegice","definite-error-unrecognized-form-masculine-neuter-singular":"ganglioplegicul","definite-error-unrecognized-form-feminine-singular":"ganglioplegica","definite-error-unrecognized-form-masculine-plural":"ganglioplegicii","definite-error-unrecognized-form-feminine-neuter-plural":"ganglioplegicele"}},{"word":"ganglioplegic","pos":"noun","definitions":["ganglioplegic"],"forms":{"plural":"ganglioplegici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ganglioplegic","accusative-definite-nominative-singular":"ganglioplegicul","accusative-indefinite-nominative-plural":"ganglioplegici","accusative-definite-nominative-plural":"ganglioplegicile","dative-genitive-indefinite-singular":"ganglioplegic","dative-definite-genitive-singular":"ganglioplegicului","dative-genitive-indefinite-plural":"ganglioplegici","dative-definite-genitive-plural":"ganglioplegicilor","singular-vocative":"ganglioplegicule","plural-vocative":"ganglioplegicilor"}},{"word":"gangrena","pos":"verb","definitions":["alternative form of cangrena"],"forms":{"canonical":"a gangrena 1st conjugation","present-singular-third-person":"gangrenează","participle-past":"gangrenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gangrena","gerund":"gangrenând","first-person-indicative-present-singular":"gangrenez","indicative-present-second-person-singular":"gangrenezi","indicative-present-singular-third-person":"gangrenează","first-person-indicative-plural-present":"gangrenăm","indicative-plural-present-second-person":"gangrenați","indicative-plural-present-third-person":"gangrenează","first-person-imperfect-indicative-singular":"gangrenam","imperfect-indicative-second-person-singular":"gangrenai","imperfect-indicative-singular-third-person":"gangrena","first-person-imperfect-indicative-plural":"gangrenam","imperfect-indicative-plural-second-person":"gangrenați","imperfect-indicative-plural-third-person":"gangrenau","first-person-indicative-perfect-singular":"gangrenai","indicative-perfect-second-person-singular":"gangrenași","indicative-perfect-singular-third-person":"gangrenă","first-person-indicative-perfect-plural":"gangrenarăm","indicative-perfect-plural-second-person":"gangrenarăți","indicative-perfect-plural-third-person":"gangrenară","first-person-indicative-pluperfect-singular":"gangrenasem","indicative-pluperfect-second-person-singular":"gangrenaseși","indicative-pluperfect-singular-third-person":"gangrenase","first-person-indicative-pluperfect-plural":"gangrenaserăm","indicative-pluperfect-plural-second-person":"gangrenaserăți","indicative-pluperfect-plural-third-person":"gangrenaseră","first-person-present-singular-subjunctive":"să gangrenez","present-second-person-singular-subjunctive":"să gangrenezi","present-singular-subjunctive-third-person":"să gangreneze","first-person-plural-present-subjunctive":"să gangrenăm","plural-present-second-person-subjunctive":"să gangrenați","plural-present-subjunctive-third-person":"să gangreneze","imperative-second-person-singular":"gangrenează","imperative-plural-second-person":"gangrenați","imperative-negative-second-person-singular":"nu gangrena","imperative-negative-plural-second-person":"nu gangrenați"}},{"word":"gangrenă","pos":"noun","definitions":["alternative form of cangrenă"],"forms":{"plural":"gangrene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gangrenă","accusative-definite-nominative-singular":"gangrena","accusative-indefinite-nominative-plural":"gangrene","accusative-definite-nominative-plural":"gangrenele","dative-genitive-indefinite-singular":"gangrene","dative-definite-genitive-singular":"gangrenei","dative-genitive-indefinite-plural":"gangrene","dative-definite-genitive-plural":"gangrenelor","singular-vocative":"gangrenă","plural-vocative":"gangrenelor"}},{"word":"gangrenare","pos":"noun","definitions":["alternative form of cangrenare"],"forms":{"plural":"gangrenări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gangrenare","accusative-definite-nominative-singular":"gangrenarea","accusative-indefinite-nominative-plural":"gangrenări","accusative-definite-nominative-plural":"gangrenările","dative-genitive-indefinite-singular":"gangrenări","dative-definite-genitive-singular":"gangrenării","dative-genitive-indefinite-plural":"gangrenări","dative-definite-genitive-plural":"gangrenărilor","singular-vocative":"gangrenare","plural-vocative":"gangrenărilor"}},{"word":"gangrenat","pos":"adj","definitions":["alternative form of cangrenat"],"forms":{"feminine-singular":"gangrenată","masculine-plural":"gangrenați","feminine-neuter-plural":"gangrenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gangrenat","error-unrecognized-form-feminine-indefinite-singular":"gangrenată","error-unrecognized-form-indefinite-masculine-plural":"gangrenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gangrenate","definite-error-unrecognized-form-masculine-neuter-singular":"gangrenatul","definite-error-unrecognized-form-feminine-singular":"gangrenata","definite-error-unrecognized-form-masculine-plural":"gangrenații","definite-error-unrecognized-form-feminine-neuter-plural":"gangrenatele"}},{"word":"gangrenos","pos":"adj","definitions":["alternative form of cangrenos"],"forms":{"feminine-singular":"gangrenoasă","masculine-plural":"gangrenoși","feminine-neuter-plural":"gangrenoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gangrenos","error-unrecognized-form-feminine-indefinite-singular":"gangrenoasă","error-unrecognized-form-indefinite-masculine-plural":"gangrenoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gangrenoase","definite-error-unrecognized-form-masculine-neuter-singular":"gangrenosul","definite-error-unrecognized-form-feminine-singular":"gangrenoasa","definite-error-unrecognized-form-masculine-plural":"gangrenoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gangrenoasele"}},{"word":"gangster","pos":"noun","definitions":["gangster"],"forms":{"plural":"gangsteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gangster","accusative-definite-nominative-singular":"gangsterul","accusative-indefinite-nominative-plural":"gangsteri","accusative-definite-nominative-plural":"gangsterii","dative-genitive-indefinite-singular":"gangster","dative-definite-genitive-singular":"gangsterului","dative-genitive-indefinite-plural":"gangsteri","dative-definite-genitive-plural":"gangsterilor","singular-vocative":"gangsterule","plural-vocative":"gangsterilor"}},{"word":"gangsteresc","pos":"adj","definitions":["gangster's"],"forms":{"feminine-singular":"gangsterească","plural":"gangsterești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gangsteresc","error-unrecognized-form-feminine-indefinite-singular":"gangsterească","error-unrecognized-form-indefinite-masculine-plural":"gangsterești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gangsterești","definite-error-unrecognized-form-masculine-neuter-singular":"gangsterescul","definite-error-unrecognized-form-feminine-singular":"gangstereasca","definite-error-unrecognized-form-masculine-plural":"gangstereștii","definite-error-unrecognized-form-feminine-neuter-plural":"gangstereștile"}},{"word":"gangsterism","pos":"noun","definitions":["gangsterism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gangsterism","accusative-definite-nominative":"gangsterismul","dative-genitive-indefinite":"gangsterism","dative-definite-genitive":"gangsterismului","vocative":"gangsterismule"}},{"word":"gangur","pos":"noun","definitions":["alternative form of grangur"],"forms":{"plural":"ganguri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gangur","accusative-definite-nominative-singular":"gangurul","accusative-indefinite-nominative-plural":"ganguri","accusative-definite-nominative-plural":"gangurii","dative-genitive-indefinite-singular":"gangur","dative-definite-genitive-singular":"gangurului","dative-genitive-indefinite-plural":"ganguri","dative-definite-genitive-plural":"gangurilor","singular-vocative":"gangurule","plural-vocative":"gangurilor"}},{"word":"Gangura","pos":"name","definitions":["a village in Gangura, Ialoveni Raion, Moldova","a commune of Ialoveni Raion, Moldova"],"gender":"f"},{"word":"gânguri","pos":"verb","definitions":["to babble"],"forms":{"canonical":"a gânguri 4th conjugation","present-singular-third-person":"gângurește","participle-past":"gângurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gânguri","gerund":"gângurind","first-person-indicative-present-singular":"gânguresc","indicative-present-second-person-singular":"gângurești","indicative-present-singular-third-person":"gângurește","first-person-indicative-plural-present":"gângurim","indicative-plural-present-second-person":"gânguriți","indicative-plural-present-third-person":"gânguresc","first-person-imperfect-indicative-singular":"gânguream","imperfect-indicative-second-person-singular":"gângureai","imperfect-indicative-singular-third-person":"gângurea","first-person-imperfect-indicative-plural":"gânguream","imperfect-indicative-plural-second-person":"gângureați","imperfect-indicative-plural-third-person":"gângureau","first-person-indicative-perfect-singular":"gângurii","indicative-perfect-second-person-singular":"gânguriși","indicative-perfect-singular-third-person":"gânguri","first-person-indicative-perfect-plural":"gângurirăm","indicative-perfect-plural-second-person":"gângurirăți","indicative-perfect-plural-third-person":"gânguriră","first-person-indicative-pluperfect-singular":"gângurisem","indicative-pluperfect-second-person-singular":"gânguriseși","indicative-pluperfect-singular-third-person":"gângurise","first-person-indicative-pluperfect-plural":"gânguriserăm","indicative-pluperfect-plural-second-person":"gânguriserăți","indicative-pluperfect-plural-third-person":"gânguriseră","first-person-present-singular-subjunctive":"să gânguresc","present-second-person-singular-subjunctive":"să gângurești","present-singular-subjunctive-third-person":"să gângurească","first-person-plural-present-subjunctive":"să gângurim","plural-present-second-person-subjunctive":"să gânguriți","plural-present-subjunctive-third-person":"să gângurească","imperative-second-person-singular":"gângurește","imperative-plural-second-person":"gânguriți","imperative-negative-second-person-singular":"nu gânguri","imperative-negative-plural-second-person":"nu gânguriți"}},{"word":"gângurire","pos":"noun","definitions":["babbling"],"forms":{"plural":"gânguriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gângurire","accusative-definite-nominative-singular":"gângurirea","accusative-indefinite-nominative-plural":"gânguriri","accusative-definite-nominative-plural":"gânguririle","dative-genitive-indefinite-singular":"gânguriri","dative-definite-genitive-singular":"gânguririi","dative-genitive-indefinite-plural":"gânguriri","dative-definite-genitive-plural":"gânguririlor","singular-vocative":"gângurire","plural-vocative":"gânguririlor"}},{"word":"gângurit","pos":"noun","definitions":["cooing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gângurit","accusative-definite-nominative":"gânguritul","dative-genitive-indefinite":"gângurit","dative-definite-genitive":"gânguritului","vocative":"gânguritule"}},{"word":"gângurit","pos":"verb","definitions":["past participle of gânguri"],"forms":{"participle-past":"of gânguri"}},{"word":"ganoid","pos":"noun","definitions":["ganoid"],"forms":{"plural":"ganoizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ganoid","accusative-definite-nominative-singular":"ganoidul","accusative-indefinite-nominative-plural":"ganoizi","accusative-definite-nominative-plural":"ganoizii","dative-genitive-indefinite-singular":"ganoid","dative-definite-genitive-singular":"ganoidului","dative-genitive-indefinite-plural":"ganoizi","dative-definite-genitive-plural":"ganoizilor","singular-vocative":"ganoidule","plural-vocative":"ganoizilor"}},{"word":"Gânsac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gânsac"}},{"word":"gânsac","pos":"noun","definitions":["gander (male goose)"],"forms":{"plural":"gânsaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gânsac","accusative-definite-nominative-singular":"gânsacul","accusative-indefinite-nominative-plural":"gânsaci","accusative-definite-nominative-plural":"gânsacii","dative-genitive-indefinite-singular":"gânsac","dative-definite-genitive-singular":"gânsacului","dative-genitive-indefinite-plural":"gânsaci","dative-definite-genitive-plural":"gânsacilor","singular-vocative":"gânsacule","plural-vocative":"gânsacilor"}},{"word":"gânsăcel","pos":"noun","definitions":["diminutive of gânsac"],"forms":{"plural":"gânsăcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gânsăcel","accusative-definite-nominative-singular":"gânsăcelul","accusative-indefinite-nominative-plural":"gânsăcei","accusative-definite-nominative-plural":"gânsăceii","dative-genitive-indefinite-singular":"gânsăcel","dative-definite-genitive-singular":"gânsăcelului","dative-genitive-indefinite-plural":"gânsăcei","dative-definite-genitive-plural":"gânsăceilor","singular-vocative":"gânsăcelule","plural-vocative":"gânsăceilor"}},{"word":"Gânțaga","pos":"name","definitions":["a village in Bretea Română, Hunedoara County, Romania"],"gender":"f"},{"word":"Gănțulei","pos":"name","definitions":["a village in Lungești, Vâlcea County, Romania"],"gender":"m"},{"word":"Gănuț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gănuț"}},{"word":"găoace","pos":"noun","definitions":["crust, bark, peel","shell of an egg","cavity, hole, empty space"],"pronunciation":"/ɡəˈo̯at͡ʃe/","forms":{"plural":"găoci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"găoace","accusative-definite-nominative-singular":"găoacea","accusative-indefinite-nominative-plural":"găoci","accusative-definite-nominative-plural":"găocile","dative-genitive-indefinite-singular":"găoci","dative-definite-genitive-singular":"găocii","dative-genitive-indefinite-plural":"găoci","dative-definite-genitive-plural":"găocilor","singular-vocative":"găoace","plural-vocative":"găocilor","alternative":"găoc","alternative-obsolete":"găóce"}},{"word":"găoază","pos":"noun","definitions":["asshole","pussy, twat (female genitalia)"],"pronunciation":"[ɡəˈo̯a.zə]","forms":{"plural":"găoaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găoază","accusative-definite-nominative-singular":"găoaza","accusative-indefinite-nominative-plural":"găoaze","accusative-definite-nominative-plural":"găoazele","dative-genitive-indefinite-singular":"găoaze","dative-definite-genitive-singular":"găoazei","dative-genitive-indefinite-plural":"găoaze","dative-definite-genitive-plural":"găoazelor","singular-vocative":"găoază","plural-vocative":"găoazelor"}},{"word":"găoci","pos":"noun","definitions":["plural of găoace"],"pronunciation":"/ɡəˈot͡ʃʲ/"},{"word":"găozar","pos":"noun","definitions":["faggot, homosexual, queer","asshole (US), arsehole (UK)"],"pronunciation":"/ɡə.oˈzar/","forms":{"plural":"găozari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găozar","accusative-definite-nominative-singular":"găozarul","accusative-indefinite-nominative-plural":"găozari","accusative-definite-nominative-plural":"găozarii","dative-genitive-indefinite-singular":"găozar","dative-definite-genitive-singular":"găozarului","dative-genitive-indefinite-plural":"găozari","dative-definite-genitive-plural":"găozarilor","singular-vocative":"găozarule","plural-vocative":"găozarilor","alternative":"гэозар"}},{"word":"găozari","pos":"noun","definitions":["plural of găozar"],"gender":"m-p"},{"word":"Gara","pos":"name","definitions":["a village in Milișăuți, Suceava County, Romania"],"gender":"f"},{"word":"gara","pos":"verb","definitions":["to garage"],"pronunciation":"/ɡaˈra/","forms":{"canonical":"a gara 1st conjugation","present-singular-third-person":"garează","participle-past":"garat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gara","gerund":"garând","first-person-indicative-present-singular":"garez","indicative-present-second-person-singular":"garezi","indicative-present-singular-third-person":"garează","first-person-indicative-plural-present":"garăm","indicative-plural-present-second-person":"garați","indicative-plural-present-third-person":"garează","first-person-imperfect-indicative-singular":"garam","imperfect-indicative-second-person-singular":"garai","imperfect-indicative-singular-third-person":"gara","first-person-imperfect-indicative-plural":"garam","imperfect-indicative-plural-second-person":"garați","imperfect-indicative-plural-third-person":"garau","first-person-indicative-perfect-singular":"garai","indicative-perfect-second-person-singular":"garași","indicative-perfect-singular-third-person":"gară","first-person-indicative-perfect-plural":"gararăm","indicative-perfect-plural-second-person":"gararăți","indicative-perfect-plural-third-person":"garară","first-person-indicative-pluperfect-singular":"garasem","indicative-pluperfect-second-person-singular":"garaseși","indicative-pluperfect-singular-third-person":"garase","first-person-indicative-pluperfect-plural":"garaserăm","indicative-pluperfect-plural-second-person":"garaserăți","indicative-pluperfect-plural-third-person":"garaseră","first-person-present-singular-subjunctive":"să garez","present-second-person-singular-subjunctive":"să garezi","present-singular-subjunctive-third-person":"să gareze","first-person-plural-present-subjunctive":"să garăm","plural-present-second-person-subjunctive":"să garați","plural-present-subjunctive-third-person":"să gareze","imperative-second-person-singular":"garează","imperative-plural-second-person":"garați","imperative-negative-second-person-singular":"nu gara","imperative-negative-plural-second-person":"nu garați"}},{"word":"gara","pos":"noun","definitions":["definite nominative/accusative singular of gară (“train station”)"],"pronunciation":"/ˈɡa.ra/"},{"word":"gară","pos":"noun","definitions":["terminal, station, railway station"],"forms":{"plural":"gări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gară","accusative-definite-nominative-singular":"gara","accusative-indefinite-nominative-plural":"gări","accusative-definite-nominative-plural":"gările","dative-genitive-indefinite-singular":"gări","dative-definite-genitive-singular":"gării","dative-genitive-indefinite-plural":"gări","dative-definite-genitive-plural":"gărilor","singular-vocative":"gară","plural-vocative":"gărilor"}},{"word":"Gara Berheci","pos":"name","definitions":["a village in Gohor, Galați County, Romania"],"gender":"f"},{"word":"Gara Bobocu","pos":"name","definitions":["a village in Cochirleanca, Buzău County, Romania"],"gender":"f"},{"word":"Gara Cilibia","pos":"name","definitions":["a village in Cilibia, Buzău County, Romania"],"gender":"f"},{"word":"Gara Docăneasa","pos":"name","definitions":["a village in Vinderei, Vaslui County, Romania"],"gender":"f"},{"word":"gară feroviară","pos":"noun","definitions":["railway station, train station"],"forms":{"plural":"gări feroviare"}},{"word":"Gara Ghidigeni","pos":"name","definitions":["a village in Ghidigeni, Galați County, Romania"],"gender":"f"},{"word":"Gara Ianca","pos":"name","definitions":["a village in Ianca, Brăila County, Romania"],"gender":"f"},{"word":"Gara Leu","pos":"name","definitions":["a village in Drăgușeni, Suceava County, Romania"],"gender":"f"},{"word":"Gara Roșiești","pos":"name","definitions":["a village in Roșiești, Vaslui County, Romania"],"gender":"f"},{"word":"Gara Tălășman","pos":"name","definitions":["a village in Vinderei, Vaslui County, Romania"],"gender":"f"},{"word":"Garabet","pos":"name","definitions":["a surname from Armenian"],"gender":"m","forms":{"dative-genitive":"lui Garabet"}},{"word":"garafă","pos":"noun","definitions":["alternative form of carafă"],"forms":{"plural":"garafe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garafă","accusative-definite-nominative-singular":"garafa","accusative-indefinite-nominative-plural":"garafe","accusative-definite-nominative-plural":"garafele","dative-genitive-indefinite-singular":"garafe","dative-definite-genitive-singular":"garafei","dative-genitive-indefinite-plural":"garafe","dative-definite-genitive-plural":"garafelor","singular-vocative":"garafă","plural-vocative":"garafelor"}},{"word":"gărăfioară","pos":"noun","definitions":["diminutive of garafă; small flagon"],"forms":{"plural":"gărăfioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gărăfioară","accusative-definite-nominative-singular":"gărăfioara","accusative-indefinite-nominative-plural":"gărăfioare","accusative-definite-nominative-plural":"gărăfioarele","dative-genitive-indefinite-singular":"gărăfioare","dative-definite-genitive-singular":"gărăfioarei","dative-genitive-indefinite-plural":"gărăfioare","dative-definite-genitive-plural":"gărăfioarelor","singular-vocative":"gărăfioară","plural-vocative":"gărăfioarelor"}},{"word":"garagață","pos":"noun","definitions":["alternative form of caragață"],"forms":{"plural":"garagațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garagață","accusative-definite-nominative-singular":"garagața","accusative-indefinite-nominative-plural":"garagațe","accusative-definite-nominative-plural":"garagațele","dative-genitive-indefinite-singular":"garagațe","dative-definite-genitive-singular":"garagaței","dative-genitive-indefinite-plural":"garagațe","dative-definite-genitive-plural":"garagațelor","singular-vocative":"garagață","plural-vocative":"garagațelor"}},{"word":"garaj","pos":"noun","definitions":["garage"],"pronunciation":"/ɡaˈraʒ/","forms":{"plural":"garaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"garaj","accusative-definite-nominative-singular":"garajul","accusative-indefinite-nominative-plural":"garaje","accusative-definite-nominative-plural":"garajele","dative-genitive-indefinite-singular":"garaj","dative-definite-genitive-singular":"garajului","dative-genitive-indefinite-plural":"garaje","dative-definite-genitive-plural":"garajelor","singular-vocative":"garajule","plural-vocative":"garajelor"}},{"word":"garaje","pos":"noun","definitions":["indefinite plural of garaj"],"pronunciation":"[ɡaˈra.ʒe]","gender":"n"},{"word":"garajist","pos":"noun","definitions":["worker in a garage, car mechanic"],"forms":{"plural":"garajiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"garajist","accusative-definite-nominative-singular":"garajistul","accusative-indefinite-nominative-plural":"garajiști","accusative-definite-nominative-plural":"garajiștii","dative-genitive-indefinite-singular":"garajist","dative-definite-genitive-singular":"garajistului","dative-genitive-indefinite-plural":"garajiști","dative-definite-genitive-plural":"garajiștilor","singular-vocative":"garajistule","plural-vocative":"garajiștilor"}},{"word":"Gărâna","pos":"name","definitions":["a village in Brebu Nou, Caraș-Severin County, Romania"],"gender":"f"},{"word":"garant","pos":"noun","definitions":["guarantor"],"forms":{"plural":"garanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"garant","accusative-definite-nominative-singular":"garantul","accusative-indefinite-nominative-plural":"garanți","accusative-definite-nominative-plural":"garanții","dative-genitive-indefinite-singular":"garant","dative-definite-genitive-singular":"garantului","dative-genitive-indefinite-plural":"garanți","dative-definite-genitive-plural":"garanților","singular-vocative":"garantule","plural-vocative":"garanților"}},{"word":"garanta","pos":"verb","definitions":["to guarantee"],"forms":{"canonical":"a garanta 1st conjugation","present-singular-third-person":"garantează","participle-past":"garantat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a garanta","gerund":"garantând","first-person-indicative-present-singular":"garantez","indicative-present-second-person-singular":"garantezi","indicative-present-singular-third-person":"garantează","first-person-indicative-plural-present":"garantăm","indicative-plural-present-second-person":"garantați","indicative-plural-present-third-person":"garantează","first-person-imperfect-indicative-singular":"garantam","imperfect-indicative-second-person-singular":"garantai","imperfect-indicative-singular-third-person":"garanta","first-person-imperfect-indicative-plural":"garantam","imperfect-indicative-plural-second-person":"garantați","imperfect-indicative-plural-third-person":"garantau","first-person-indicative-perfect-singular":"garantai","indicative-perfect-second-person-singular":"garantași","indicative-perfect-singular-third-person":"garantă","first-person-indicative-perfect-plural":"garantarăm","indicative-perfect-plural-second-person":"garantarăți","indicative-perfect-plural-third-person":"garantară","first-person-indicative-pluperfect-singular":"garantasem","indicative-pluperfect-second-person-singular":"garantaseși","indicative-pluperfect-singular-third-person":"garantase","first-person-indicative-pluperfect-plural":"garantaserăm","indicative-pluperfect-plural-second-person":"garantaserăți","indicative-pluperfect-plural-third-person":"garantaseră","first-person-present-singular-subjunctive":"să garantez","present-second-person-singular-subjunctive":"să garantezi","present-singular-subjunctive-third-person":"să garanteze","first-person-plural-present-subjunctive":"să garantăm","plural-present-second-person-subjunctive":"să garantați","plural-present-subjunctive-third-person":"să garanteze","imperative-second-person-singular":"garantează","imperative-plural-second-person":"garantați","imperative-negative-second-person-singular":"nu garanta","imperative-negative-plural-second-person":"nu garantați"}},{"word":"garantă","pos":"noun","definitions":["female equivalent of garant"],"forms":{"plural":"garante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garantă","accusative-definite-nominative-singular":"garanta","accusative-indefinite-nominative-plural":"garante","accusative-definite-nominative-plural":"garantele","dative-genitive-indefinite-singular":"garante","dative-definite-genitive-singular":"garantei","dative-genitive-indefinite-plural":"garante","dative-definite-genitive-plural":"garantelor","singular-vocative":"garantă","plural-vocative":"garantelor"}},{"word":"garanță","pos":"noun","definitions":["guarantee"],"forms":{"plural":"garanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garanță","accusative-definite-nominative-singular":"garanța","accusative-indefinite-nominative-plural":"garanțe","accusative-definite-nominative-plural":"garanțele","dative-genitive-indefinite-singular":"garanțe","dative-definite-genitive-singular":"garanței","dative-genitive-indefinite-plural":"garanțe","dative-definite-genitive-plural":"garanțelor","singular-vocative":"garanță","plural-vocative":"garanțelor"}},{"word":"garantare","pos":"noun","definitions":["guaranty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"garantare","accusative-definite-nominative":"garantarea","dative-genitive-indefinite":"garantări","dative-definite-genitive":"garantării","vocative":"garantare"}},{"word":"garantat","pos":"adj","definitions":["guaranteed"],"forms":{"feminine-singular":"garantată","masculine-plural":"garantați","feminine-neuter-plural":"garantate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"garantat","error-unrecognized-form-feminine-indefinite-singular":"garantată","error-unrecognized-form-indefinite-masculine-plural":"garantați","error-unrecognized-form-feminine-indefinite-neuter-plural":"garantate","definite-error-unrecognized-form-masculine-neuter-singular":"garantatul","definite-error-unrecognized-form-feminine-singular":"garantata","definite-error-unrecognized-form-masculine-plural":"garantații","definite-error-unrecognized-form-feminine-neuter-plural":"garantatele"}},{"word":"garanție","pos":"noun","definitions":["guarantee"],"forms":{"plural":"garanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"garanție","accusative-definite-nominative-singular":"garanția","accusative-indefinite-nominative-plural":"garanții","accusative-definite-nominative-plural":"garanțiile","dative-genitive-indefinite-singular":"garanții","dative-definite-genitive-singular":"garanției","dative-genitive-indefinite-plural":"garanții","dative-definite-genitive-plural":"garanțiilor","singular-vocative":"garanție","plural-vocative":"garanțiilor"}},{"word":"garanțină","pos":"noun","definitions":["garancine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garanțină","accusative-definite-nominative-singular":"garanțina","accusative-indefinite-nominative-plural":"garanține","accusative-definite-nominative-plural":"garanținele","dative-genitive-indefinite-singular":"garanține","dative-definite-genitive-singular":"garanținei","dative-genitive-indefinite-plural":"garanține","dative-definite-genitive-plural":"garanținelor","singular-vocative":"garanțină","plural-vocative":"garanținelor"}},{"word":"garare","pos":"noun","definitions":["garaging"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"garare","accusative-definite-nominative":"gararea","dative-genitive-indefinite":"garare","dative-definite-genitive":"gararei","vocative":"garare"}},{"word":"gărășiță","pos":"noun","definitions":["crucian carp"],"forms":{"plural":"gărășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gărășiță","accusative-definite-nominative-singular":"gărășița","accusative-indefinite-nominative-plural":"gărășițe","accusative-definite-nominative-plural":"gărășițele","dative-genitive-indefinite-singular":"gărășițe","dative-definite-genitive-singular":"gărășiței","dative-genitive-indefinite-plural":"gărășițe","dative-definite-genitive-plural":"gărășițelor","singular-vocative":"gărășiță","plural-vocative":"gărășițelor"}},{"word":"garat","pos":"adj","definitions":["parked"],"forms":{"feminine-singular":"garată","masculine-plural":"garați","feminine-neuter-plural":"garate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"garat","error-unrecognized-form-feminine-indefinite-singular":"garată","error-unrecognized-form-indefinite-masculine-plural":"garați","error-unrecognized-form-feminine-indefinite-neuter-plural":"garate","definite-error-unrecognized-form-masculine-neuter-singular":"garatul","definite-error-unrecognized-form-feminine-singular":"garata","definite-error-unrecognized-form-masculine-plural":"garații","definite-error-unrecognized-form-feminine-neuter-plural":"garatele"}},{"word":"garat","pos":"verb","definitions":["past participle of gara"],"forms":{"participle-past":"of gara"}},{"word":"gârbă","pos":"noun","definitions":["backside"],"forms":{"plural":"gârbe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gârbă","accusative-definite-nominative-singular":"gârbăul","accusative-indefinite-nominative-plural":"gârbe","accusative-definite-nominative-plural":"gârbele","dative-genitive-indefinite-singular":"gârbă","dative-definite-genitive-singular":"gârbăului","dative-genitive-indefinite-plural":"gârbe","dative-definite-genitive-plural":"gârbelor","singular-vocative":"gârbăule","plural-vocative":"gârbelor"}},{"word":"Gârbău","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Durbav","a river in Alba, Romania, tributary to the Secaș","a commune of Cluj County, Romania","a village in Gârbău, Cluj County, Romania"],"gender":"m"},{"word":"Gârbău Dejului","pos":"name","definitions":["a village in Cășeiu, Cluj County, Romania"],"gender":"m"},{"word":"Gârbăul Mare","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Gârbău"],"gender":"m"},{"word":"Gârbăul Mic","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Gârbău"],"gender":"m"},{"word":"Gârbele","pos":"name","definitions":["a river in Romania, tributary to the Botuș"],"gender":"m"},{"word":"gârbelor","pos":"noun","definitions":["definite genitive/dative plural of gârbă"]},{"word":"Gârbeni","pos":"name","definitions":["a village in Havârna, Botoșani County, Romania"],"gender":"m"},{"word":"Gârbești","pos":"name","definitions":["a village in Todireni, Botoșani County, Romania","a village in Țibana, Iași County, Romania"],"gender":"m"},{"word":"gârbiță","pos":"noun","definitions":["obsolete form of gârliță"],"forms":{"plural":"gârbițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârbiță","accusative-definite-nominative-singular":"gârbița","accusative-indefinite-nominative-plural":"gârbițe","accusative-definite-nominative-plural":"gârbițele","dative-genitive-indefinite-singular":"gârbițe","dative-definite-genitive-singular":"gârbiței","dative-genitive-indefinite-plural":"gârbițe","dative-definite-genitive-plural":"gârbițelor","singular-vocative":"gârbiță","plural-vocative":"gârbițelor"}},{"word":"Gârbou","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Gârbou, Sălaj County, Romania"],"gender":"m"},{"word":"gârbov","pos":"adj","definitions":["humpbacked from old age"],"pronunciation":"/ˈɡɨr.bov/","forms":{"feminine-singular":"gârbovă","masculine-plural":"gârbovi","feminine-neuter-plural":"gârbove","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gârbov","error-unrecognized-form-feminine-indefinite-singular":"gârbovă","error-unrecognized-form-indefinite-masculine-plural":"gârbovi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gârbove","definite-error-unrecognized-form-masculine-neuter-singular":"gârbovul","definite-error-unrecognized-form-feminine-singular":"gârbova","definite-error-unrecognized-form-masculine-plural":"gârbovii","definite-error-unrecognized-form-feminine-neuter-plural":"gârbovele"}},{"word":"Gârbova","pos":"name","definitions":["a commune of Alba County, Romania","a village in Gârbova, Alba County, Romania"],"gender":"f"},{"word":"Gârbova de Jos","pos":"name","definitions":["a village in Aiud, Alba County, Romania"],"gender":"f"},{"word":"Gârbova de Sus","pos":"name","definitions":["a village in Aiud, Alba County, Romania"],"gender":"f"},{"word":"Gârbova Mare","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Iza"],"gender":"f"},{"word":"Gârbovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gârbovan"}},{"word":"Gârbovăț","pos":"name","definitions":["a village in Bănia, Caraș-Severin County, Romania","a village in Ghidigeni, Galați County, Romania"],"gender":"m"},{"word":"Gârbovățu de Jos","pos":"name","definitions":["a village in Corcova, Mehedinți County, Romania"],"gender":"m"},{"word":"Gârbovățu de Sus","pos":"name","definitions":["a village in Căzănești, Mehedinți County, Romania"],"gender":"m"},{"word":"Gârbovean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gârbovean"}},{"word":"Gârbovi","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Gârbovi, Ialomița County, Romania"],"gender":"m"},{"word":"gârbovire","pos":"noun","definitions":["old age"],"forms":{"plural":"gârboviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gârbovire","accusative-definite-nominative-singular":"gârbovirea","accusative-indefinite-nominative-plural":"gârboviri","accusative-definite-nominative-plural":"gârbovirile","dative-genitive-indefinite-singular":"gârboviri","dative-definite-genitive-singular":"gârbovirii","dative-genitive-indefinite-plural":"gârboviri","dative-definite-genitive-plural":"gârbovirilor","singular-vocative":"gârbovire","plural-vocative":"gârbovirilor"}},{"word":"gârbovit","pos":"adj","definitions":["with the back bent"],"forms":{"feminine-singular":"gârbovită","masculine-plural":"gârboviți","feminine-neuter-plural":"gârbovite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gârbovit","error-unrecognized-form-feminine-indefinite-singular":"gârbovită","error-unrecognized-form-indefinite-masculine-plural":"gârboviți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gârbovite","definite-error-unrecognized-form-masculine-neuter-singular":"gârbovitul","definite-error-unrecognized-form-feminine-singular":"gârbovita","definite-error-unrecognized-form-masculine-plural":"gârboviții","definite-error-unrecognized-form-feminine-neuter-plural":"gârbovitele"}},{"word":"Gârbovița","pos":"name","definitions":["a village in Aiud, Alba County, Romania"],"gender":"f"},{"word":"Gârbovu","pos":"name","definitions":["a village in Turceni, Gorj County, Romania"],"gender":"m"},{"word":"gârbovul","pos":"noun","definitions":["definite nominative/accusative singular of gârbov"]},{"word":"Gârceiu","pos":"name","definitions":["a village in Crișeni, Sălaj County, Romania"],"gender":"m"},{"word":"Gârceni","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Gârceni, Vaslui County, Romania"],"gender":"m"},{"word":"Gârcin","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Tărlung"],"gender":"m"},{"word":"Gârcina","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Gârcina, Neamț County, Romania"],"gender":"f"},{"word":"Gârcinul Mare","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Gârcin"],"gender":"m"},{"word":"Gârcinul Mic","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Gârcin"],"gender":"m"},{"word":"Gârcov","pos":"name","definitions":["a commune of Olt County, Romania","a village in Gârcov, Olt County, Romania"],"gender":"m"},{"word":"Gârcu","pos":"name","definitions":["a river in Sibiu County, Romania, tributary to the Lotrioara"],"gender":"m"},{"word":"Gârcu Mare","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Gârcu"],"gender":"m"},{"word":"Gârcu Mic","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Gârcu"],"gender":"m"},{"word":"Gârculețul","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Gârcu"],"gender":"m"},{"word":"Gard","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gard"}},{"word":"gard","pos":"noun","definitions":["fence"],"pronunciation":"[ɡard]","forms":{"plural":"garduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gard","accusative-definite-nominative-singular":"gardul","accusative-indefinite-nominative-plural":"garduri","accusative-definite-nominative-plural":"gardurile","dative-genitive-indefinite-singular":"gard","dative-definite-genitive-singular":"gardului","dative-genitive-indefinite-plural":"garduri","dative-definite-genitive-plural":"gardurilor","singular-vocative":"gardule","plural-vocative":"gardurilor"}},{"word":"gard viu","pos":"noun","definitions":["hedge"],"forms":{"plural":"garduri vii"}},{"word":"garda","pos":"noun","definitions":["definite nominative/accusative singular of gardă"],"pronunciation":"[ˈɡarda]","gender":"f"},{"word":"gardă","pos":"noun","definitions":["guard, watch, guardsmen","police"],"forms":{"plural":"gărzi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gardă","accusative-definite-nominative-singular":"garda","accusative-indefinite-nominative-plural":"gărzi","accusative-definite-nominative-plural":"gărzile","dative-genitive-indefinite-singular":"gărzi","dative-definite-genitive-singular":"gărzii","dative-genitive-indefinite-plural":"gărzi","dative-definite-genitive-plural":"gărzilor","singular-vocative":"gardă","plural-vocative":"gărzilor"}},{"word":"Garda de Fier","pos":"name","definitions":["Iron Guard"],"gender":"f"},{"word":"gardă de onoare","pos":"noun","definitions":["guard of honor"],"forms":{"plural":"gărzi de onoare"}},{"word":"Gârda de Sus","pos":"name","definitions":["a commune of Alba County, Romania","a village in Gârda de Sus, Alba County, Romania"],"gender":"f"},{"word":"gardă personală","pos":"noun","definitions":["bodyguard"],"forms":{"plural":"gărzi personale"}},{"word":"Gârda Seacă","pos":"name","definitions":["a village in Gârda de Sus, Alba County, Romania"],"gender":"f"},{"word":"garda trăgaciului","pos":"noun","definitions":["trigger guard"]},{"word":"Gârda-Bărbulești","pos":"name","definitions":["a village in Roșia Montană, Alba County, Romania"],"gender":"f"},{"word":"Gărdăneasa","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"f"},{"word":"Gârdani","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Gârdani, Maramureș County, Romania"],"gender":"m"},{"word":"gărdaș","pos":"noun","definitions":["weir fisherman"],"forms":{"plural":"gărdași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gărdaș","accusative-definite-nominative-singular":"gărdașul","accusative-indefinite-nominative-plural":"gărdași","accusative-definite-nominative-plural":"gărdașii","dative-genitive-indefinite-singular":"gărdaș","dative-definite-genitive-singular":"gărdașului","dative-genitive-indefinite-plural":"gărdași","dative-definite-genitive-plural":"gărdașilor","singular-vocative":"gărdașule","plural-vocative":"gărdașilor"}},{"word":"Gârde","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"m"},{"word":"gardenie","pos":"noun","definitions":["gardenia"],"forms":{"plural":"gardenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gardenie","accusative-definite-nominative-singular":"gardenia","accusative-indefinite-nominative-plural":"gardenii","accusative-definite-nominative-plural":"gardeniile","dative-genitive-indefinite-singular":"gardenii","dative-definite-genitive-singular":"gardeniei","dative-genitive-indefinite-plural":"gardenii","dative-definite-genitive-plural":"gardeniilor","singular-vocative":"gardenie","plural-vocative":"gardeniilor"}},{"word":"garderob","pos":"noun","definitions":["wardrobe"],"forms":{"plural":"garderoburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"garderob","accusative-definite-nominative-singular":"garderobul","accusative-indefinite-nominative-plural":"garderoburi","accusative-definite-nominative-plural":"garderoburile","dative-genitive-indefinite-singular":"garderob","dative-definite-genitive-singular":"garderobului","dative-genitive-indefinite-plural":"garderoburi","dative-definite-genitive-plural":"garderoburilor","singular-vocative":"garderobule","plural-vocative":"garderoburilor"}},{"word":"garderobă","pos":"noun","definitions":["wardrobe"],"forms":{"plural":"garderobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garderobă","accusative-definite-nominative-singular":"garderoba","accusative-indefinite-nominative-plural":"garderobe","accusative-definite-nominative-plural":"garderobele","dative-genitive-indefinite-singular":"garderobe","dative-definite-genitive-singular":"garderobei","dative-genitive-indefinite-plural":"garderobe","dative-definite-genitive-plural":"garderobelor","singular-vocative":"garderobă","plural-vocative":"garderobelor"}},{"word":"garderobier","pos":"noun","definitions":["cloakroom attendant"],"forms":{"plural":"garderobieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"garderobier","accusative-definite-nominative-singular":"garderobierul","accusative-indefinite-nominative-plural":"garderobieri","accusative-definite-nominative-plural":"garderobierii","dative-genitive-indefinite-singular":"garderobier","dative-definite-genitive-singular":"garderobierului","dative-genitive-indefinite-plural":"garderobieri","dative-definite-genitive-plural":"garderobierilor","singular-vocative":"garderobierule","plural-vocative":"garderobierilor"}},{"word":"garderobieră","pos":"noun","definitions":["female equivalent of garderobier"],"forms":{"plural":"garderobiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garderobieră","accusative-definite-nominative-singular":"garderobiera","accusative-indefinite-nominative-plural":"garderobiere","accusative-definite-nominative-plural":"garderobierele","dative-genitive-indefinite-singular":"garderobiere","dative-definite-genitive-singular":"garderobierei","dative-genitive-indefinite-plural":"garderobiere","dative-definite-genitive-plural":"garderobierelor","singular-vocative":"garderobieră","plural-vocative":"garderobierelor"}},{"word":"Gărdescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gărdescu"}},{"word":"Gârdești","pos":"name","definitions":["a village in Necșești, Teleorman County, Romania","a village in Voinești, Vaslui County, Romania"],"gender":"m"},{"word":"gardian","pos":"noun","definitions":["guardian, guard, ward"],"forms":{"plural":"gardieni"}},{"word":"gardie","pos":"noun","definitions":["obsolete form of gardă"],"forms":{"plural":"gardii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gardie","accusative-definite-nominative-singular":"gardia","accusative-indefinite-nominative-plural":"gardii","accusative-definite-nominative-plural":"gardiile","dative-genitive-indefinite-singular":"gardii","dative-definite-genitive-singular":"gardiei","dative-genitive-indefinite-plural":"gardii","dative-definite-genitive-plural":"gardiilor","singular-vocative":"gardie","plural-vocative":"gardiilor"}},{"word":"Gărdinești","pos":"name","definitions":["a village in Poiana Lacului, Argeș County, Romania"],"gender":"m"},{"word":"gardist","pos":"noun","definitions":["policeman","member of the Iron Guard"],"forms":{"plural":"gardiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gardist","accusative-definite-nominative-singular":"gardistul","accusative-indefinite-nominative-plural":"gardiști","accusative-definite-nominative-plural":"gardiștii","dative-genitive-indefinite-singular":"gardist","dative-definite-genitive-singular":"gardistului","dative-genitive-indefinite-plural":"gardiști","dative-definite-genitive-plural":"gardiștilor","singular-vocative":"gardistule","plural-vocative":"gardiștilor"}},{"word":"Gârdoaia","pos":"name","definitions":["a village in Florești, Mehedinți County, Romania"],"gender":"f"},{"word":"Gardu","pos":"name","definitions":["a river in Dolj County, Romania, tributary to the Geamărtălui","a river in Dolj County, Romania, tributary to the Gruița","a river in Sibiu County, Romania, tributary to the Sebeș"],"gender":"m"},{"word":"gărducean","pos":"noun","definitions":["diminutive of gard"],"forms":{"plural":"gărducene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gărducean","accusative-definite-nominative-singular":"gărduceanul","accusative-indefinite-nominative-plural":"gărducene","accusative-definite-nominative-plural":"gărducenele","dative-genitive-indefinite-singular":"gărducean","dative-definite-genitive-singular":"gărduceanului","dative-genitive-indefinite-plural":"gărducene","dative-definite-genitive-plural":"gărducenelor","singular-vocative":"gărduceanule","plural-vocative":"gărducenelor"}},{"word":"gărdui","pos":"verb","definitions":["to fence"],"forms":{"canonical":"a gărdui 4th conjugation","present-singular-third-person":"gărduiește","participle-past":"gărduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gărdui","gerund":"gărduind","first-person-indicative-present-singular":"gărduiesc","indicative-present-second-person-singular":"gărduiești","indicative-present-singular-third-person":"gărduiește","first-person-indicative-plural-present":"gărduim","indicative-plural-present-second-person":"gărduiți","indicative-plural-present-third-person":"gărduiesc","first-person-imperfect-indicative-singular":"gărduiam","imperfect-indicative-second-person-singular":"gărduiai","imperfect-indicative-singular-third-person":"gărduia","first-person-imperfect-indicative-plural":"gărduiam","imperfect-indicative-plural-second-person":"gărduiați","imperfect-indicative-plural-third-person":"gărduiau","first-person-indicative-perfect-singular":"gărduii","indicative-perfect-second-person-singular":"gărduiși","indicative-perfect-singular-third-person":"gărdui","first-person-indicative-perfect-plural":"gărduirăm","indicative-perfect-plural-second-person":"gărduirăți","indicative-perfect-plural-third-person":"gărduiră","first-person-indicative-pluperfect-singular":"gărduisem","indicative-pluperfect-second-person-singular":"gărduiseși","indicative-pluperfect-singular-third-person":"gărduise","first-person-indicative-pluperfect-plural":"gărduiserăm","indicative-pluperfect-plural-second-person":"gărduiserăți","indicative-pluperfect-plural-third-person":"gărduiseră","first-person-present-singular-subjunctive":"să gărduiesc","present-second-person-singular-subjunctive":"să gărduiești","present-singular-subjunctive-third-person":"să gărduiască","first-person-plural-present-subjunctive":"să gărduim","plural-present-second-person-subjunctive":"să gărduiți","plural-present-subjunctive-third-person":"să gărduiască","imperative-second-person-singular":"gărduiește","imperative-plural-second-person":"gărduiți","imperative-negative-second-person-singular":"nu gărdui","imperative-negative-plural-second-person":"nu gărduiți"}},{"word":"gărduit","pos":"adj","definitions":["fenced, enclosed"],"forms":{"feminine-singular":"gărduită","masculine-plural":"gărduiți","feminine-neuter-plural":"gărduite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gărduit","error-unrecognized-form-feminine-indefinite-singular":"gărduită","error-unrecognized-form-indefinite-masculine-plural":"gărduiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gărduite","definite-error-unrecognized-form-masculine-neuter-singular":"gărduitul","definite-error-unrecognized-form-feminine-singular":"gărduita","definite-error-unrecognized-form-masculine-plural":"gărduiții","definite-error-unrecognized-form-feminine-neuter-plural":"gărduitele"}},{"word":"gărduit","pos":"verb","definitions":["past participle of gărdui"],"forms":{"participle-past":"of gărdui"}},{"word":"gărduleț","pos":"noun","definitions":["diminutive of gard; small fence"],"forms":{"plural":"gărdulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gărduleț","accusative-definite-nominative-singular":"gărdulețul","accusative-indefinite-nominative-plural":"gărdulețe","accusative-definite-nominative-plural":"gărdulețele","dative-genitive-indefinite-singular":"gărduleț","dative-definite-genitive-singular":"gărdulețului","dative-genitive-indefinite-plural":"gărdulețe","dative-definite-genitive-plural":"gărdulețelor","singular-vocative":"gărdulețule","plural-vocative":"gărdulețelor"}},{"word":"gardului","pos":"noun","definitions":["definite genitive/dative singular of gard"]},{"word":"gărdurel","pos":"noun","definitions":["diminutive of gard"],"forms":{"plural":"gărdurele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gărdurel","accusative-definite-nominative-singular":"gărdurelul","accusative-indefinite-nominative-plural":"gărdurele","accusative-definite-nominative-plural":"gărdurelele","dative-genitive-indefinite-singular":"gărdurel","dative-definite-genitive-singular":"gărdurelului","dative-genitive-indefinite-plural":"gărdurele","dative-definite-genitive-plural":"gărdurelelor","singular-vocative":"gărdurelule","plural-vocative":"gărdurelelor"}},{"word":"garduri","pos":"noun","definitions":["plural of gard"]},{"word":"gărduș","pos":"noun","definitions":["diminutive of gard"],"forms":{"plural":"gărduși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gărduș","accusative-definite-nominative-singular":"gărdușul","accusative-indefinite-nominative-plural":"gărduși","accusative-definite-nominative-plural":"gărdușii","dative-genitive-indefinite-singular":"gărduș","dative-definite-genitive-singular":"gărdușului","dative-genitive-indefinite-plural":"gărduși","dative-definite-genitive-plural":"gărdușilor","singular-vocative":"gărdușule","plural-vocative":"gărdușilor"}},{"word":"gărduț","pos":"noun","definitions":["diminutive of gard"],"forms":{"plural":"gărduțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gărduț","accusative-definite-nominative-singular":"gărduțul","accusative-indefinite-nominative-plural":"gărduțuri","accusative-definite-nominative-plural":"gărduțurile","dative-genitive-indefinite-singular":"gărduț","dative-definite-genitive-singular":"gărduțului","dative-genitive-indefinite-plural":"gărduțuri","dative-definite-genitive-plural":"gărduțurilor","singular-vocative":"gărduțule","plural-vocative":"gărduțurilor"}},{"word":"Gargalâcul-Mare","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Corbu de Sus."],"gender":"m"},{"word":"Gargalâcul-Mic","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Corbu de Jos."],"gender":"m"},{"word":"gărgălan","pos":"noun","definitions":["throat, larynx"],"forms":{"plural":"gărgălane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gărgălan","accusative-definite-nominative-singular":"gărgălanul","accusative-indefinite-nominative-plural":"gărgălane","accusative-definite-nominative-plural":"gărgălanele","dative-genitive-indefinite-singular":"gărgălan","dative-definite-genitive-singular":"gărgălanului","dative-genitive-indefinite-plural":"gărgălane","dative-definite-genitive-plural":"gărgălanelor","singular-vocative":"gărgălanule","plural-vocative":"gărgălanelor"}},{"word":"gârgăloț","pos":"noun","definitions":["synonym of gâtlej (“throat”)"],"examples":[{"ro":"În ḑiua de Sânțĭ, cine-șĭ lasă albinele să ésă din coșniță pe gârgăloțiŭ de lup, le dă putere, în cât că bat albinele altor ómenĭ și le fură mierea.","en":"On the day of the Saints, he who lets his bees out the hive through the throat of a wolf gives them strength such that they fight other people’s bees and steal their honey."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gârgăloț","accusative-definite-nominative":"gârgăloțul","dative-genitive-indefinite":"gârgăloț","dative-definite-genitive":"gârgăloțului","vocative":"gârgăloțule","alternative":"gârgoloț"}},{"word":"gargantuesc","pos":"adj","definitions":["gargantuan"],"forms":{"feminine-singular":"gargantuească","plural":"gargantuești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gargantuesc","error-unrecognized-form-feminine-indefinite-singular":"gargantuească","error-unrecognized-form-indefinite-masculine-plural":"gargantuești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gargantuești","definite-error-unrecognized-form-masculine-neuter-singular":"gargantuescul","definite-error-unrecognized-form-feminine-singular":"gargantueasca","definite-error-unrecognized-form-masculine-plural":"gargantueștii","definite-error-unrecognized-form-feminine-neuter-plural":"gargantueștile"}},{"word":"gargară","pos":"noun","definitions":["gargle","nonsense"],"forms":{"plural":"gargare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gargară","accusative-definite-nominative-singular":"gargara","accusative-indefinite-nominative-plural":"gargare","accusative-definite-nominative-plural":"gargarele","dative-genitive-indefinite-singular":"gargare","dative-definite-genitive-singular":"gargarei","dative-genitive-indefinite-plural":"gargare","dative-definite-genitive-plural":"gargarelor","singular-vocative":"gargară","plural-vocative":"gargarelor"}},{"word":"gârgără","pos":"noun","definitions":["ladybird"],"forms":{"plural":"gârgăre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârgără","accusative-definite-nominative-singular":"gârgăra","accusative-indefinite-nominative-plural":"gârgăre","accusative-definite-nominative-plural":"gârgărele","dative-genitive-indefinite-singular":"gârgăre","dative-definite-genitive-singular":"gârgărei","dative-genitive-indefinite-plural":"gârgăre","dative-definite-genitive-plural":"gârgărelor","singular-vocative":"gârgără","plural-vocative":"gârgărelor"}},{"word":"gargaragiu","pos":"noun","definitions":["chatterbox, windbag, a garrulous person"],"forms":{"plural":"gargaragii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gargaragiu","accusative-definite-nominative-singular":"gargaragiuul","accusative-indefinite-nominative-plural":"gargaragii","accusative-definite-nominative-plural":"gargaragiii","dative-genitive-indefinite-singular":"gargaragiu","dative-definite-genitive-singular":"gargaragiuului","dative-genitive-indefinite-plural":"gargaragii","dative-definite-genitive-plural":"gargaragiilor","singular-vocative":"gargaragiuule","plural-vocative":"gargaragiilor"}},{"word":"gargariseală","pos":"noun","definitions":["gargle"],"forms":{"plural":"gargariseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gargariseală","accusative-definite-nominative-singular":"gargariseala","accusative-indefinite-nominative-plural":"gargarisele","accusative-definite-nominative-plural":"gargariselele","dative-genitive-indefinite-singular":"gargarisele","dative-definite-genitive-singular":"gargariselei","dative-genitive-indefinite-plural":"gargarisele","dative-definite-genitive-plural":"gargariselelor","singular-vocative":"gargariseală","plural-vocative":"gargariselelor"}},{"word":"gargarisi","pos":"verb","definitions":["to ramble, to babble"],"forms":{"canonical":"a gargarisi 4th conjugation","present-singular-third-person":"gargarisește","participle-past":"gargarisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gargarisi","gerund":"gargarisind","first-person-indicative-present-singular":"gargarisesc","indicative-present-second-person-singular":"gargarisești","indicative-present-singular-third-person":"gargarisește","first-person-indicative-plural-present":"gargarisim","indicative-plural-present-second-person":"gargarisiți","indicative-plural-present-third-person":"gargarisesc","first-person-imperfect-indicative-singular":"gargariseam","imperfect-indicative-second-person-singular":"gargariseai","imperfect-indicative-singular-third-person":"gargarisea","first-person-imperfect-indicative-plural":"gargariseam","imperfect-indicative-plural-second-person":"gargariseați","imperfect-indicative-plural-third-person":"gargariseau","first-person-indicative-perfect-singular":"gargarisii","indicative-perfect-second-person-singular":"gargarisiși","indicative-perfect-singular-third-person":"gargarisi","first-person-indicative-perfect-plural":"gargarisirăm","indicative-perfect-plural-second-person":"gargarisirăți","indicative-perfect-plural-third-person":"gargarisiră","first-person-indicative-pluperfect-singular":"gargarisisem","indicative-pluperfect-second-person-singular":"gargarisiseși","indicative-pluperfect-singular-third-person":"gargarisise","first-person-indicative-pluperfect-plural":"gargarisiserăm","indicative-pluperfect-plural-second-person":"gargarisiserăți","indicative-pluperfect-plural-third-person":"gargarisiseră","first-person-present-singular-subjunctive":"să gargarisesc","present-second-person-singular-subjunctive":"să gargarisești","present-singular-subjunctive-third-person":"să gargarisească","first-person-plural-present-subjunctive":"să gargarisim","plural-present-second-person-subjunctive":"să gargarisiți","plural-present-subjunctive-third-person":"să gargarisească","imperative-second-person-singular":"gargarisește","imperative-plural-second-person":"gargarisiți","imperative-negative-second-person-singular":"nu gargarisi","imperative-negative-plural-second-person":"nu gargarisiți"}},{"word":"gargarisire","pos":"noun","definitions":["gargle"],"forms":{"plural":"gargarisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gargarisire","accusative-definite-nominative-singular":"gargarisirea","accusative-indefinite-nominative-plural":"gargarisiri","accusative-definite-nominative-plural":"gargarisirile","dative-genitive-indefinite-singular":"gargarisiri","dative-definite-genitive-singular":"gargarisirii","dative-genitive-indefinite-plural":"gargarisiri","dative-definite-genitive-plural":"gargarisirilor","singular-vocative":"gargarisire","plural-vocative":"gargarisirilor"}},{"word":"gargarism","pos":"noun","definitions":["medicine intended to be gargled"],"forms":{"plural":"gargarisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gargarism","accusative-definite-nominative-singular":"gargarismul","accusative-indefinite-nominative-plural":"gargarisme","accusative-definite-nominative-plural":"gargarismele","dative-genitive-indefinite-singular":"gargarism","dative-definite-genitive-singular":"gargarismului","dative-genitive-indefinite-plural":"gargarisme","dative-definite-genitive-plural":"gargarismelor","singular-vocative":"gargarismule","plural-vocative":"gargarismelor"}},{"word":"Gărgăriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gărgăriță"}},{"word":"gărgăriță","pos":"noun","definitions":["ladybird"],"forms":{"plural":"gărgărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gărgăriță","accusative-definite-nominative-singular":"gărgărița","accusative-indefinite-nominative-plural":"gărgărițe","accusative-definite-nominative-plural":"gărgărițele","dative-genitive-indefinite-singular":"gărgărițe","dative-definite-genitive-singular":"gărgăriței","dative-genitive-indefinite-plural":"gărgărițe","dative-definite-genitive-plural":"gărgărițelor","singular-vocative":"gărgăriță","plural-vocative":"gărgărițelor"}},{"word":"gargariza","pos":"verb","definitions":["to gargle"],"forms":{"canonical":"a gargariza 1st conjugation","present-singular-third-person":"gargarizează","participle-past":"gargarizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gargariza","gerund":"gargarizând","first-person-indicative-present-singular":"gargarizez","indicative-present-second-person-singular":"gargarizezi","indicative-present-singular-third-person":"gargarizează","first-person-indicative-plural-present":"gargarizăm","indicative-plural-present-second-person":"gargarizați","indicative-plural-present-third-person":"gargarizează","first-person-imperfect-indicative-singular":"gargarizam","imperfect-indicative-second-person-singular":"gargarizai","imperfect-indicative-singular-third-person":"gargariza","first-person-imperfect-indicative-plural":"gargarizam","imperfect-indicative-plural-second-person":"gargarizați","imperfect-indicative-plural-third-person":"gargarizau","first-person-indicative-perfect-singular":"gargarizai","indicative-perfect-second-person-singular":"gargarizași","indicative-perfect-singular-third-person":"gargariză","first-person-indicative-perfect-plural":"gargarizarăm","indicative-perfect-plural-second-person":"gargarizarăți","indicative-perfect-plural-third-person":"gargarizară","first-person-indicative-pluperfect-singular":"gargarizasem","indicative-pluperfect-second-person-singular":"gargarizaseși","indicative-pluperfect-singular-third-person":"gargarizase","first-person-indicative-pluperfect-plural":"gargarizaserăm","indicative-pluperfect-plural-second-person":"gargarizaserăți","indicative-pluperfect-plural-third-person":"gargarizaseră","first-person-present-singular-subjunctive":"să gargarizez","present-second-person-singular-subjunctive":"să gargarizezi","present-singular-subjunctive-third-person":"să gargarizeze","first-person-plural-present-subjunctive":"să gargarizăm","plural-present-second-person-subjunctive":"să gargarizați","plural-present-subjunctive-third-person":"să gargarizeze","imperative-second-person-singular":"gargarizează","imperative-plural-second-person":"gargarizați","imperative-negative-second-person-singular":"nu gargariza","imperative-negative-plural-second-person":"nu gargarizați"}},{"word":"Gărgăun","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gărgăun"}},{"word":"gărgăun","pos":"noun","definitions":["hornet (a large wasp, of the genus Vespa, with a brown and yellow striped body)"],"forms":{"plural":"gărgăuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gărgăun","accusative-definite-nominative-singular":"gărgăunul","accusative-indefinite-nominative-plural":"gărgăuni","accusative-definite-nominative-plural":"gărgăunii","dative-genitive-indefinite-singular":"gărgăun","dative-definite-genitive-singular":"gărgăunului","dative-genitive-indefinite-plural":"gărgăuni","dative-definite-genitive-plural":"gărgăunilor","singular-vocative":"gărgăunule","plural-vocative":"gărgăunilor","alternative":"gărgăune"}},{"word":"Gărgăune","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gărgăune"}},{"word":"gărgăune","pos":"noun","definitions":["alternative form of gărgăun"],"forms":{"plural":"gărgăuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gărgăune","accusative-definite-nominative-singular":"gărgăuneul","accusative-indefinite-nominative-plural":"gărgăuni","accusative-definite-nominative-plural":"gărgăunii","dative-genitive-indefinite-singular":"gărgăune","dative-definite-genitive-singular":"gărgăuneului","dative-genitive-indefinite-plural":"gărgăuni","dative-definite-genitive-plural":"gărgăunilor","singular-vocative":"gărgăuneule","plural-vocative":"gărgăunilor"}},{"word":"gârghiță","pos":"noun","definitions":["throat, larynx"],"forms":{"plural":"gârghițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârghiță","accusative-definite-nominative-singular":"gârghița","accusative-indefinite-nominative-plural":"gârghițe","accusative-definite-nominative-plural":"gârghițele","dative-genitive-indefinite-singular":"gârghițe","dative-definite-genitive-singular":"gârghiței","dative-genitive-indefinite-plural":"gârghițe","dative-definite-genitive-plural":"gârghițelor","singular-vocative":"gârghiță","plural-vocative":"gârghițelor"}},{"word":"gârgoloț","pos":"noun","definitions":["alternative form of gârgăloț"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gârgoloț","accusative-definite-nominative":"gârgoloțul","dative-genitive-indefinite":"gârgoloț","dative-definite-genitive":"gârgoloțului","vocative":"gârgoloțule"}},{"word":"gargui","pos":"noun","definitions":["gargoyle"],"forms":{"plural":"garguie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gargui","accusative-definite-nominative-singular":"garguiul","accusative-indefinite-nominative-plural":"garguie","accusative-definite-nominative-plural":"garguiele","dative-genitive-indefinite-singular":"gargui","dative-definite-genitive-singular":"garguiului","dative-genitive-indefinite-plural":"garguie","dative-definite-genitive-plural":"garguielor","singular-vocative":"garguiule","plural-vocative":"garguielor"}},{"word":"gări","pos":"noun","definitions":["plural of gară"]},{"word":"gâri-mâr","pos":"intj","definitions":["obsolete form of câr"]},{"word":"gariște","pos":"noun","definitions":["floodplain, water-meadow"],"forms":{"plural":"gariști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gariște","accusative-definite-nominative-singular":"gariștea","accusative-indefinite-nominative-plural":"gariști","accusative-definite-nominative-plural":"gariștile","dative-genitive-indefinite-singular":"gariști","dative-definite-genitive-singular":"gariștii","dative-genitive-indefinite-plural":"gariști","dative-definite-genitive-plural":"gariștilor","singular-vocative":"gariște","plural-vocative":"gariștilor"}},{"word":"gariști","pos":"noun","definitions":["plural of gariște"]},{"word":"Gârlă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gârlă"}},{"word":"gârlă","pos":"noun","definitions":["brook, stream"],"forms":{"plural":"gârle"}},{"word":"Gârla Anei","pos":"name","definitions":["a village in Ungureni, Bacău County, Romania"],"gender":"f"},{"word":"Gârla Arămii","pos":"name","definitions":["a river in Iași, Romania, tributary to the Sacovăț"],"gender":"f"},{"word":"Gârla Huțanilor","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Siret"],"gender":"f"},{"word":"Gârla Mare","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Gârla Mare, Mehedinți County, Romania"],"gender":"f"},{"word":"Gârla Pinului","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Bălăneasa"],"gender":"f"},{"word":"Gârla Sirețel","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Siret"],"gender":"f"},{"word":"gârlan","pos":"adj","definitions":["throat"],"forms":{"feminine-singular":"gârlană","masculine-plural":"gârlani","feminine-neuter-plural":"gârlane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gârlan","error-unrecognized-form-feminine-indefinite-singular":"gârlană","error-unrecognized-form-indefinite-masculine-plural":"gârlani","error-unrecognized-form-feminine-indefinite-neuter-plural":"gârlane","definite-error-unrecognized-form-masculine-neuter-singular":"gârlanul","definite-error-unrecognized-form-feminine-singular":"gârlana","definite-error-unrecognized-form-masculine-plural":"gârlanii","definite-error-unrecognized-form-feminine-neuter-plural":"gârlanele"}},{"word":"Gârleni","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Gârleni, Bacău County, Romania","a village in Valea Mare, Dâmbovița County, Romania"],"gender":"m"},{"word":"Gârlenii de Sus","pos":"name","definitions":["a village in Gârleni, Bacău County, Romania"],"gender":"m"},{"word":"Gârlescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gârlescu"}},{"word":"Gârlești","pos":"name","definitions":["a village in Ghercești, Dolj County, Romania"],"gender":"m"},{"word":"gârlici","pos":"noun","definitions":["narrow entrance in a cellar"],"forms":{"plural":"gârliciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gârlici","accusative-definite-nominative-singular":"gârliciul","accusative-indefinite-nominative-plural":"gârliciuri","accusative-definite-nominative-plural":"gârliciurile","dative-genitive-indefinite-singular":"gârlici","dative-definite-genitive-singular":"gârliciului","dative-genitive-indefinite-plural":"gârliciuri","dative-definite-genitive-plural":"gârliciurilor","singular-vocative":"gârliciule","plural-vocative":"gârliciurilor"}},{"word":"gârlicior","pos":"noun","definitions":["diminutive of gârlici"],"forms":{"plural":"gârlicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gârlicior","accusative-definite-nominative-singular":"gârliciorul","accusative-indefinite-nominative-plural":"gârlicioare","accusative-definite-nominative-plural":"gârlicioarele","dative-genitive-indefinite-singular":"gârlicior","dative-definite-genitive-singular":"gârliciorului","dative-genitive-indefinite-plural":"gârlicioare","dative-definite-genitive-plural":"gârlicioarelor","singular-vocative":"gârliciorule","plural-vocative":"gârlicioarelor"}},{"word":"Gârliciu","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Gârliciu, Constanța County, Romania"],"gender":"m"},{"word":"gârlișoară","pos":"noun","definitions":["diminutive of gârlă"],"forms":{"plural":"gârlișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârlișoară","accusative-definite-nominative-singular":"gârlișoara","accusative-indefinite-nominative-plural":"gârlișoare","accusative-definite-nominative-plural":"gârlișoarele","dative-genitive-indefinite-singular":"gârlișoare","dative-definite-genitive-singular":"gârlișoarei","dative-genitive-indefinite-plural":"gârlișoare","dative-definite-genitive-plural":"gârlișoarelor","singular-vocative":"gârlișoară","plural-vocative":"gârlișoarelor"}},{"word":"Gârliște","pos":"name","definitions":["a village in Goruia, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Gârlița","pos":"name","definitions":["a village in Ostrov, Constanța County, Romania"],"gender":"f"},{"word":"gârlița","pos":"noun","definitions":["definite nominative/accusative singular of gârliță"]},{"word":"gârliță","pos":"noun","definitions":["diminutive of gârlă; small ford"],"forms":{"plural":"gârlițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârliță","accusative-definite-nominative-singular":"gârlița","accusative-indefinite-nominative-plural":"gârlițe","accusative-definite-nominative-plural":"gârlițele","dative-genitive-indefinite-singular":"gârlițe","dative-definite-genitive-singular":"gârliței","dative-genitive-indefinite-plural":"gârlițe","dative-definite-genitive-plural":"gârlițelor","singular-vocative":"gârliță","plural-vocative":"gârlițelor"}},{"word":"gârliță mare","pos":"noun","definitions":["greater white-fronted goose (Anser albifrons)"],"forms":{"plural":"gârlițe mari"}},{"word":"gârliță mică","pos":"noun","definitions":["lesser white-fronted goose (Anser erythropus)"],"forms":{"plural":"gârlițe mici"}},{"word":"gârloi","pos":"noun","definitions":["augmentative of gârlă"],"forms":{"plural":"gârloaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gârloi","accusative-definite-nominative-singular":"gârloiul","accusative-indefinite-nominative-plural":"gârloaie","accusative-definite-nominative-plural":"gârloaiele","dative-genitive-indefinite-singular":"gârloi","dative-definite-genitive-singular":"gârloiului","dative-genitive-indefinite-plural":"gârloaie","dative-definite-genitive-plural":"gârloaielor","singular-vocative":"gârloiule","plural-vocative":"gârloaielor"}},{"word":"gârn","pos":"noun","definitions":["koliva"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gârn","accusative-definite-nominative":"gârnul","dative-genitive-indefinite":"gârn","dative-definite-genitive":"gârnului","vocative":"gârnule"}},{"word":"gârneață","pos":"noun","definitions":["alternative form of gârniță"],"forms":{"plural":"gârnețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârneață","accusative-definite-nominative-singular":"gârneața","accusative-indefinite-nominative-plural":"gârnețe","accusative-definite-nominative-plural":"gârnețele","dative-genitive-indefinite-singular":"gârnețe","dative-definite-genitive-singular":"gârneței","dative-genitive-indefinite-plural":"gârnețe","dative-definite-genitive-plural":"gârnețelor","singular-vocative":"gârneață","plural-vocative":"gârnețelor"}},{"word":"garnetă","pos":"noun","definitions":["garnett"],"forms":{"plural":"garnete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garnetă","accusative-definite-nominative-singular":"garneta","accusative-indefinite-nominative-plural":"garnete","accusative-definite-nominative-plural":"garnetele","dative-genitive-indefinite-singular":"garnete","dative-definite-genitive-singular":"garnetei","dative-genitive-indefinite-plural":"garnete","dative-definite-genitive-plural":"garnetelor","singular-vocative":"garnetă","plural-vocative":"garnetelor"}},{"word":"Gârnicet","pos":"name","definitions":["a village in Fârtățești, Vâlcea County, Romania"],"gender":"m"},{"word":"Gârnicetu","pos":"name","definitions":["a village in Stănești, Vâlcea County, Romania"],"gender":"m"},{"word":"gărnicioară","pos":"noun","definitions":["diminutive of garniță"],"forms":{"plural":"gărnicioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gărnicioară","accusative-definite-nominative-singular":"gărnicioara","accusative-indefinite-nominative-plural":"gărnicioare","accusative-definite-nominative-plural":"gărnicioarele","dative-genitive-indefinite-singular":"gărnicioare","dative-definite-genitive-singular":"gărnicioarei","dative-genitive-indefinite-plural":"gărnicioare","dative-definite-genitive-plural":"gărnicioarelor","singular-vocative":"gărnicioară","plural-vocative":"gărnicioarelor"}},{"word":"garnierit","pos":"noun","definitions":["garnierite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"garnierit","accusative-definite-nominative-singular":"garnieritul","accusative-indefinite-nominative-plural":"garnierite","accusative-definite-nominative-plural":"garnieritele","dative-genitive-indefinite-singular":"garnierit","dative-definite-genitive-singular":"garnieritului","dative-genitive-indefinite-plural":"garnierite","dative-definite-genitive-plural":"garnieritelor","singular-vocative":"garnieritule","plural-vocative":"garnieritelor"}},{"word":"garnisi","pos":"verb","definitions":["to garnish, to decorate"],"forms":{"canonical":"a garnisi 4th conjugation","present-singular-third-person":"garnisește","participle-past":"garnisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a garnisi","gerund":"garnisind","first-person-indicative-present-singular":"garnisesc","indicative-present-second-person-singular":"garnisești","indicative-present-singular-third-person":"garnisește","first-person-indicative-plural-present":"garnisim","indicative-plural-present-second-person":"garnisiți","indicative-plural-present-third-person":"garnisesc","first-person-imperfect-indicative-singular":"garniseam","imperfect-indicative-second-person-singular":"garniseai","imperfect-indicative-singular-third-person":"garnisea","first-person-imperfect-indicative-plural":"garniseam","imperfect-indicative-plural-second-person":"garniseați","imperfect-indicative-plural-third-person":"garniseau","first-person-indicative-perfect-singular":"garnisii","indicative-perfect-second-person-singular":"garnisiși","indicative-perfect-singular-third-person":"garnisi","first-person-indicative-perfect-plural":"garnisirăm","indicative-perfect-plural-second-person":"garnisirăți","indicative-perfect-plural-third-person":"garnisiră","first-person-indicative-pluperfect-singular":"garnisisem","indicative-pluperfect-second-person-singular":"garnisiseși","indicative-pluperfect-singular-third-person":"garnisise","first-person-indicative-pluperfect-plural":"garnisiserăm","indicative-pluperfect-plural-second-person":"garnisiserăți","indicative-pluperfect-plural-third-person":"garnisiseră","first-person-present-singular-subjunctive":"să garnisesc","present-second-person-singular-subjunctive":"să garnisești","present-singular-subjunctive-third-person":"să garnisească","first-person-plural-present-subjunctive":"să garnisim","plural-present-second-person-subjunctive":"să garnisiți","plural-present-subjunctive-third-person":"să garnisească","imperative-second-person-singular":"garnisește","imperative-plural-second-person":"garnisiți","imperative-negative-second-person-singular":"nu garnisi","imperative-negative-plural-second-person":"nu garnisiți"}},{"word":"garnisire","pos":"noun","definitions":["garnishing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"garnisire","accusative-definite-nominative":"garnisirea","dative-genitive-indefinite":"garnisire","dative-definite-genitive":"garnisirei","vocative":"garnisire"}},{"word":"garnisit","pos":"adj","definitions":["garnished"],"forms":{"feminine-singular":"garnisită","masculine-plural":"garnisiți","feminine-neuter-plural":"garnisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"garnisit","error-unrecognized-form-feminine-indefinite-singular":"garnisită","error-unrecognized-form-indefinite-masculine-plural":"garnisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"garnisite","definite-error-unrecognized-form-masculine-neuter-singular":"garnisitul","definite-error-unrecognized-form-feminine-singular":"garnisita","definite-error-unrecognized-form-masculine-plural":"garnisiții","definite-error-unrecognized-form-feminine-neuter-plural":"garnisitele"}},{"word":"garnisit","pos":"verb","definitions":["past participle of garnisi"],"forms":{"participle-past":"of garnisi"}},{"word":"garniță","pos":"noun","definitions":["large metal vessel"],"forms":{"plural":"garnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garniță","accusative-definite-nominative-singular":"garnița","accusative-indefinite-nominative-plural":"garnițe","accusative-definite-nominative-plural":"garnițele","dative-genitive-indefinite-singular":"garnițe","dative-definite-genitive-singular":"garniței","dative-genitive-indefinite-plural":"garnițe","dative-definite-genitive-plural":"garnițelor","singular-vocative":"garniță","plural-vocative":"garnițelor"}},{"word":"Gârnița","pos":"name","definitions":["a village in Prunișor, Mehedinți County, Romania"],"gender":"f"},{"word":"gârnița","pos":"noun","definitions":["definite nominative/accusative singular of gârniță"]},{"word":"Gârniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gârniță"}},{"word":"gârniță","pos":"noun","definitions":["Italian oak (Quercus frainetto)"],"forms":{"plural":"gârnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gârniță","accusative-definite-nominative-singular":"gârnița","accusative-indefinite-nominative-plural":"gârnițe","accusative-definite-nominative-plural":"gârnițele","dative-genitive-indefinite-singular":"gârnițe","dative-definite-genitive-singular":"gârniței","dative-genitive-indefinite-plural":"gârnițe","dative-definite-genitive-plural":"gârnițelor","singular-vocative":"gârniță","plural-vocative":"gârnițelor"}},{"word":"gârnițet","pos":"noun","definitions":["Italian oak grove"],"forms":{"plural":"gârnițeturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gârnițet","accusative-definite-nominative-singular":"gârnițetul","accusative-indefinite-nominative-plural":"gârnițeturi","accusative-definite-nominative-plural":"gârnițeturile","dative-genitive-indefinite-singular":"gârnițet","dative-definite-genitive-singular":"gârnițetului","dative-genitive-indefinite-plural":"gârnițeturi","dative-definite-genitive-plural":"gârnițeturilor","singular-vocative":"gârnițetule","plural-vocative":"gârnițeturilor"}},{"word":"garnitură","pos":"noun","definitions":["gasket"],"forms":{"plural":"garnituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garnitură","accusative-definite-nominative-singular":"garnitura","accusative-indefinite-nominative-plural":"garniture","accusative-definite-nominative-plural":"garniturele","dative-genitive-indefinite-singular":"garniture","dative-definite-genitive-singular":"garniturei","dative-genitive-indefinite-plural":"garniture","dative-definite-genitive-plural":"garniturelor","singular-vocative":"garnitură","plural-vocative":"garniturelor"}},{"word":"garnizoană","pos":"noun","definitions":["garrison"],"pronunciation":"/ɡar.niˈzo̯a.nə/","forms":{"plural":"garnizoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garnizoană","accusative-definite-nominative-singular":"garnizoana","accusative-indefinite-nominative-plural":"garnizoane","accusative-definite-nominative-plural":"garnizoanele","dative-genitive-indefinite-singular":"garnizoane","dative-definite-genitive-singular":"garnizoanei","dative-genitive-indefinite-plural":"garnizoane","dative-definite-genitive-plural":"garnizoanelor","singular-vocative":"garnizoană","plural-vocative":"garnizoanelor"}},{"word":"Garoafa","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Garoafa, Vrancea County, Romania"],"gender":"f"},{"word":"garoafa","pos":"noun","definitions":["definite nominative/accusative singular of garoafă"]},{"word":"Garoafă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Garoafă"}},{"word":"garoafă","pos":"noun","definitions":["pink, carnation (Dianthus caryophyllus)"],"pronunciation":"/ɡaˈro̯a.fə/","forms":{"plural":"garoafe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garoafă","accusative-definite-nominative-singular":"garoafa","accusative-indefinite-nominative-plural":"garoafe","accusative-definite-nominative-plural":"garoafele","dative-genitive-indefinite-singular":"garoafe","dative-definite-genitive-singular":"garoafei","dative-genitive-indefinite-plural":"garoafe","dative-definite-genitive-plural":"garoafelor","singular-vocative":"garoafă","plural-vocative":"garoafelor"}},{"word":"Garofeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Garofeanu"}},{"word":"garofioară","pos":"noun","definitions":["diminutive of garoafă"],"forms":{"plural":"garofioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garofioară","accusative-definite-nominative-singular":"garofioara","accusative-indefinite-nominative-plural":"garofioare","accusative-definite-nominative-plural":"garofioarele","dative-genitive-indefinite-singular":"garofioare","dative-definite-genitive-singular":"garofioarei","dative-genitive-indefinite-plural":"garofioare","dative-definite-genitive-plural":"garofioarelor","singular-vocative":"garofioară","plural-vocative":"garofioarelor"}},{"word":"garofiță","pos":"noun","definitions":["diminutive of garoafă; small carnation","Dianthus carthusianorum"],"forms":{"plural":"garofițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garofiță","accusative-definite-nominative-singular":"garofița","accusative-indefinite-nominative-plural":"garofițe","accusative-definite-nominative-plural":"garofițele","dative-genitive-indefinite-singular":"garofițe","dative-definite-genitive-singular":"garofiței","dative-genitive-indefinite-plural":"garofițe","dative-definite-genitive-plural":"garofițelor","singular-vocative":"garofiță","plural-vocative":"garofițelor"}},{"word":"garofiță de munte","pos":"noun","definitions":["Carthusian pink (Dianthus carthusianorum)"]},{"word":"Garoflid","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Garoflid"}},{"word":"garoi","pos":"noun","definitions":["Roma person"],"forms":{"plural":"garoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"garoi","accusative-definite-nominative-singular":"garoiul","accusative-indefinite-nominative-plural":"garoi","accusative-definite-nominative-plural":"garoii","dative-genitive-indefinite-singular":"garoi","dative-definite-genitive-singular":"garoiului","dative-genitive-indefinite-plural":"garoi","dative-definite-genitive-plural":"garoilor","singular-vocative":"garoiule","plural-vocative":"garoilor"}},{"word":"garou","pos":"noun","definitions":["garrot"],"forms":{"plural":"garouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"garou","accusative-definite-nominative-singular":"garoul","accusative-indefinite-nominative-plural":"garouri","accusative-definite-nominative-plural":"garourile","dative-genitive-indefinite-singular":"garou","dative-definite-genitive-singular":"garoului","dative-genitive-indefinite-plural":"garouri","dative-definite-genitive-plural":"garourilor","singular-vocative":"garoule","plural-vocative":"garourilor"}},{"word":"garson","pos":"noun","definitions":["garçon, waiter"],"pronunciation":"/ɡarˈson/","forms":{"plural":"garsoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"garson","accusative-definite-nominative-singular":"garsonul","accusative-indefinite-nominative-plural":"garsoni","accusative-definite-nominative-plural":"garsonii","dative-genitive-indefinite-singular":"garson","dative-definite-genitive-singular":"garsonului","dative-genitive-indefinite-plural":"garsoni","dative-definite-genitive-plural":"garsonilor","singular-vocative":"garsonule","plural-vocative":"garsonilor"}},{"word":"garsoni","pos":"noun","definitions":["plural of garson"],"gender":"m"},{"word":"garsonieră","pos":"noun","definitions":["bachelor pad"],"forms":{"plural":"garsoniere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"garsonieră","accusative-definite-nominative-singular":"garsoniera","accusative-indefinite-nominative-plural":"garsoniere","accusative-definite-nominative-plural":"garsonierele","dative-genitive-indefinite-singular":"garsoniere","dative-definite-genitive-singular":"garsonierei","dative-genitive-indefinite-plural":"garsoniere","dative-definite-genitive-plural":"garsonierelor","singular-vocative":"garsonieră","plural-vocative":"garsonierelor"}},{"word":"gârtan","pos":"noun","definitions":["throat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gârtan","accusative-definite-nominative":"gârtanul","dative-genitive-indefinite":"gârtan","dative-definite-genitive":"gârtanului","vocative":"gârtanule"}},{"word":"Garvăn","pos":"name","definitions":["a village in Jijila, Tulcea County, Romania"],"gender":"m"},{"word":"Gârzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gârzescu"}},{"word":"gașca","pos":"noun","definitions":["definite nominative/accusative singular of gașcă"]},{"word":"gașcă","pos":"noun","definitions":["gang"],"forms":{"plural":"găști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gașcă","accusative-definite-nominative-singular":"gașca","accusative-indefinite-nominative-plural":"găște","accusative-definite-nominative-plural":"găștele","dative-genitive-indefinite-singular":"găște","dative-definite-genitive-singular":"găștei","dative-genitive-indefinite-plural":"găște","dative-definite-genitive-plural":"găștelor","singular-vocative":"gașcă","plural-vocative":"găștelor"}},{"word":"Gâsca","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Șușița"],"gender":"f"},{"word":"gâsca","pos":"noun","definitions":["definite nominative/accusative singular of gâscă"]},{"word":"Gâscă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gâscă"}},{"word":"gâscă","pos":"noun","definitions":["goose (a grazing waterfowl of the family Anatidae)","female goose","goose (stupid person, especially a woman)"],"pronunciation":"/ˈɡɨs.kə/","forms":{"plural":"gâște","masculine":"equivalent gâscan","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâscă","accusative-definite-nominative-singular":"gâsca","accusative-indefinite-nominative-plural":"gâște","accusative-definite-nominative-plural":"gâștele","dative-genitive-indefinite-singular":"gâște","dative-definite-genitive-singular":"gâștei","dative-genitive-indefinite-plural":"gâște","dative-definite-genitive-plural":"gâștelor","singular-vocative":"gâscă","plural-vocative":"gâștelor","alternative":"gîscă"}},{"word":"gâscă călugăriță","pos":"noun","definitions":["barnacle goose (Branta leucopsis)"],"forms":{"plural":"gâște călugăriță"}},{"word":"gâscă canadiană","pos":"noun","definitions":["Canada goose (Branta canadensis)"],"forms":{"plural":"gâște canadiene"}},{"word":"gâscă cu cioc scurt","pos":"noun","definitions":["pink-footed goose (Anser brachyrhynchus)"],"forms":{"plural":"gâște cu cioc scurt"}},{"word":"gâscă cu gât roșu","pos":"noun","definitions":["red-breasted goose (Branta ruficollis)"],"forms":{"plural":"gâște cu gât roșu"}},{"word":"gâscă cu ouă de aur","pos":"noun","definitions":["golden goose"],"forms":{"plural":"gâște cu ouă de aur"}},{"word":"gâscă de India","pos":"noun","definitions":["bar-headed goose (Anser indicus)"],"forms":{"plural":"gâște de India"}},{"word":"gâscă de semănătură","pos":"noun","definitions":["bean goose (Anser fabalis)"],"forms":{"plural":"gâște de semănătură"}},{"word":"gâscă de vară","pos":"noun","definitions":["greylag goose (Anser anser)"],"forms":{"plural":"gâște de vară"}},{"word":"gâscă de zăpadă","pos":"noun","definitions":["snow goose (Anser caerulescens)"],"forms":{"plural":"gâște de zăpadă"}},{"word":"gâscă egipteană","pos":"noun","definitions":["Egyptian goose (Alopochen aegyptiaca)"],"forms":{"plural":"gâște egiptene"}},{"word":"gâscă neagră","pos":"noun","definitions":["brent goose (Branta bernicla)"],"forms":{"plural":"gâște negre"}},{"word":"gâscă sălbatică","pos":"noun","definitions":["wild goose"],"forms":{"plural":"gâște sălbatice"}},{"word":"gâscan","pos":"noun","definitions":["gander (male goose)"],"pronunciation":"/ɡɨsˈkan/","forms":{"plural":"gâscani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gâscan","accusative-definite-nominative-singular":"gâscanul","accusative-indefinite-nominative-plural":"gâscani","accusative-definite-nominative-plural":"gâscanii","dative-genitive-indefinite-singular":"gâscan","dative-definite-genitive-singular":"gâscanului","dative-genitive-indefinite-plural":"gâscani","dative-definite-genitive-plural":"gâscanilor","singular-vocative":"gâscanule","plural-vocative":"gâscanilor","alternative":"gîscan"}},{"word":"gâscănie","pos":"noun","definitions":["goose farm"],"forms":{"plural":"gâscănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gâscănie","accusative-definite-nominative-singular":"gâscănia","accusative-indefinite-nominative-plural":"gâscănii","accusative-definite-nominative-plural":"gâscăniile","dative-genitive-indefinite-singular":"gâscănii","dative-definite-genitive-singular":"gâscăniei","dative-genitive-indefinite-plural":"gâscănii","dative-definite-genitive-plural":"gâscăniilor","singular-vocative":"gâscănie","plural-vocative":"gâscăniilor"}},{"word":"gâscar","pos":"noun","definitions":["gooseherd"],"forms":{"plural":"gâscari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gâscar","accusative-definite-nominative-singular":"gâscarul","accusative-indefinite-nominative-plural":"gâscari","accusative-definite-nominative-plural":"gâscarii","dative-genitive-indefinite-singular":"gâscar","dative-definite-genitive-singular":"gâscarului","dative-genitive-indefinite-plural":"gâscari","dative-definite-genitive-plural":"gâscarilor","singular-vocative":"gâscarule","plural-vocative":"gâscarilor"}},{"word":"gâscăriță","pos":"noun","definitions":["female gosherd"],"forms":{"plural":"gâscărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâscăriță","accusative-definite-nominative-singular":"gâscărița","accusative-indefinite-nominative-plural":"gâscărițe","accusative-definite-nominative-plural":"gâscărițele","dative-genitive-indefinite-singular":"gâscărițe","dative-definite-genitive-singular":"gâscăriței","dative-genitive-indefinite-plural":"gâscărițe","dative-definite-genitive-plural":"gâscărițelor","singular-vocative":"gâscăriță","plural-vocative":"gâscărițelor"}},{"word":"gâscoi","pos":"noun","definitions":["gander (male goose)"],"forms":{"plural":"gâscoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gâscoi","accusative-definite-nominative-singular":"gâscoiul","accusative-indefinite-nominative-plural":"gâscoi","accusative-definite-nominative-plural":"gâscoii","dative-genitive-indefinite-singular":"gâscoi","dative-definite-genitive-singular":"gâscoiului","dative-genitive-indefinite-plural":"gâscoi","dative-definite-genitive-plural":"gâscoilor","singular-vocative":"gâscoiule","plural-vocative":"gâscoilor"}},{"word":"gasconadă","pos":"noun","definitions":["swagger"],"forms":{"plural":"gasconade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gasconadă","accusative-definite-nominative-singular":"gasconada","accusative-indefinite-nominative-plural":"gasconade","accusative-definite-nominative-plural":"gasconadele","dative-genitive-indefinite-singular":"gasconade","dative-definite-genitive-singular":"gasconadei","dative-genitive-indefinite-plural":"gasconade","dative-definite-genitive-plural":"gasconadelor","singular-vocative":"gasconadă","plural-vocative":"gasconadelor"}},{"word":"gasconerie","pos":"noun","definitions":["gasconade"],"forms":{"plural":"gasconerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gasconerie","accusative-definite-nominative-singular":"gasconeria","accusative-indefinite-nominative-plural":"gasconerii","accusative-definite-nominative-plural":"gasconeriile","dative-genitive-indefinite-singular":"gasconerii","dative-definite-genitive-singular":"gasconeriei","dative-genitive-indefinite-plural":"gasconerii","dative-definite-genitive-plural":"gasconeriilor","singular-vocative":"gasconerie","plural-vocative":"gasconeriilor"}},{"word":"gasconism","pos":"noun","definitions":["swagger"],"forms":{"plural":"gasconisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gasconism","accusative-definite-nominative-singular":"gasconismul","accusative-indefinite-nominative-plural":"gasconisme","accusative-definite-nominative-plural":"gasconismele","dative-genitive-indefinite-singular":"gasconism","dative-definite-genitive-singular":"gasconismului","dative-genitive-indefinite-plural":"gasconisme","dative-definite-genitive-plural":"gasconismelor","singular-vocative":"gasconismule","plural-vocative":"gasconismelor"}},{"word":"gâsculiță","pos":"noun","definitions":["diminutive of gâscă; small goose","stupid or simple-minded woman"],"forms":{"plural":"gâsculițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâsculiță","accusative-definite-nominative-singular":"gâsculița","accusative-indefinite-nominative-plural":"gâsculițe","accusative-definite-nominative-plural":"gâsculițele","dative-genitive-indefinite-singular":"gâsculițe","dative-definite-genitive-singular":"gâsculiței","dative-genitive-indefinite-plural":"gâsculițe","dative-definite-genitive-plural":"gâsculițelor","singular-vocative":"gâsculiță","plural-vocative":"gâsculițelor"}},{"word":"gâscușoară","pos":"noun","definitions":["diminutive of gâscă"],"forms":{"plural":"gâscușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâscușoară","accusative-definite-nominative-singular":"gâscușoara","accusative-indefinite-nominative-plural":"gâscușoare","accusative-definite-nominative-plural":"gâscușoarele","dative-genitive-indefinite-singular":"gâscușoare","dative-definite-genitive-singular":"gâscușoarei","dative-genitive-indefinite-plural":"gâscușoare","dative-definite-genitive-plural":"gâscușoarelor","singular-vocative":"gâscușoară","plural-vocative":"gâscușoarelor"}},{"word":"gâscuță","pos":"noun","definitions":["diminutive of gâscă; small goose"],"forms":{"plural":"gâscuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâscuță","accusative-definite-nominative-singular":"gâscuța","accusative-indefinite-nominative-plural":"gâscuțe","accusative-definite-nominative-plural":"gâscuțele","dative-genitive-indefinite-singular":"gâscuțe","dative-definite-genitive-singular":"gâscuței","dative-genitive-indefinite-plural":"gâscuțe","dative-definite-genitive-plural":"gâscuțelor","singular-vocative":"gâscuță","plural-vocative":"gâscuțelor"}},{"word":"găsea","pos":"verb","definitions":["third-person singular imperfect indicative of găsi"],"pronunciation":"[ɡəˈse̯a]","forms":{"canonical":"găseá"}},{"word":"găseai","pos":"verb","definitions":["second-person singular imperfect indicative of găsi"],"pronunciation":"[ɡəˈse̯aj]"},{"word":"găseam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of găsi"],"pronunciation":"[ɡəˈse̯am]"},{"word":"găsească","pos":"verb","definitions":["third-person singular/plural present subjunctive of găsi"],"pronunciation":"[ɡəˈse̯askə]"},{"word":"găseați","pos":"verb","definitions":["second-person plural imperfect indicative of găsi"],"pronunciation":"[ɡəˈse̯atsʲ]"},{"word":"găseau","pos":"verb","definitions":["third-person plural imperfect indicative of găsi"],"pronunciation":"[ɡəˈse̯aw]"},{"word":"găselniță","pos":"noun","definitions":["a gimmick"],"forms":{"plural":"găselnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găselniță","accusative-definite-nominative-singular":"găselnița","accusative-indefinite-nominative-plural":"găselnițe","accusative-definite-nominative-plural":"găselnițele","dative-genitive-indefinite-singular":"găselnițe","dative-definite-genitive-singular":"găselniței","dative-genitive-indefinite-plural":"găselnițe","dative-definite-genitive-plural":"găselnițelor","singular-vocative":"găselniță","plural-vocative":"găselnițelor"}},{"word":"găsesc","pos":"verb","definitions":["inflection of găsi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[ɡəˈsesk]"},{"word":"găsește","pos":"verb","definitions":["inflection of găsi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[ɡəˈseʃte]"},{"word":"găsești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of găsi"],"pronunciation":"[ɡəˈseʃtʲ]"},{"word":"găsi","pos":"verb","definitions":["to find (locate)","to be situated","to find (consider)"],"pronunciation":"/ɡəˈsi/","examples":[{"ro":"Nu-mi găsesc cheile.","en":"I can't find my keys."}],"forms":{"canonical":"a găsi 4th conjugation","present-singular-third-person":"găsește","participle-past":"găsit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găsi","gerund":"găsind","first-person-indicative-present-singular":"găsesc","indicative-present-second-person-singular":"găsești","indicative-present-singular-third-person":"găsește","first-person-indicative-plural-present":"găsim","indicative-plural-present-second-person":"găsiți","indicative-plural-present-third-person":"găsesc","first-person-imperfect-indicative-singular":"găseam","imperfect-indicative-second-person-singular":"găseai","imperfect-indicative-singular-third-person":"găsea","first-person-imperfect-indicative-plural":"găseam","imperfect-indicative-plural-second-person":"găseați","imperfect-indicative-plural-third-person":"găseau","first-person-indicative-perfect-singular":"găsii","indicative-perfect-second-person-singular":"găsiși","indicative-perfect-singular-third-person":"găsi","first-person-indicative-perfect-plural":"găsirăm","indicative-perfect-plural-second-person":"găsirăți","indicative-perfect-plural-third-person":"găsiră","first-person-indicative-pluperfect-singular":"găsisem","indicative-pluperfect-second-person-singular":"găsiseși","indicative-pluperfect-singular-third-person":"găsise","first-person-indicative-pluperfect-plural":"găsiserăm","indicative-pluperfect-plural-second-person":"găsiserăți","indicative-pluperfect-plural-third-person":"găsiseră","first-person-present-singular-subjunctive":"să găsesc","present-second-person-singular-subjunctive":"să găsești","present-singular-subjunctive-third-person":"să găsească","first-person-plural-present-subjunctive":"să găsim","plural-present-second-person-subjunctive":"să găsiți","plural-present-subjunctive-third-person":"să găsească","imperative-second-person-singular":"găsește","imperative-plural-second-person":"găsiți","imperative-negative-second-person-singular":"nu găsi","imperative-negative-plural-second-person":"nu găsiți","alternative":"гэси"}},{"word":"găsi de cuviință","pos":"verb","definitions":["see fit"],"forms":{"canonical":"a găsi de cuviință 4th conjugation","present-singular-third-person":"găsește de cuviință","participle-past":"găsit de cuviință"}},{"word":"găsii","pos":"verb","definitions":["first-person singular simple perfect indicative of găsi"],"pronunciation":"[ɡəˈsiː]","forms":{"canonical":"găsíi"}},{"word":"găsim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of găsi"],"pronunciation":"[ɡəˈsim]","forms":{"canonical":"găsím"}},{"word":"găsind","pos":"verb","definitions":["gerund of găsi"],"pronunciation":"[ɡəˈsind]"},{"word":"găsiră","pos":"verb","definitions":["third-person plural simple perfect indicative of găsi"],"pronunciation":"[ɡəˈsirə]","forms":{"canonical":"găsíră"}},{"word":"găsirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of găsi"],"pronunciation":"[ɡəˈsirəm]","forms":{"canonical":"găsírăm"}},{"word":"găsirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of găsi"],"pronunciation":"[ɡəˈsirətsʲ]","forms":{"canonical":"găsírăți"}},{"word":"găsire","pos":"noun","definitions":["finding"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"găsire","accusative-definite-nominative":"găsirea","dative-genitive-indefinite":"găsire","dative-definite-genitive":"găsirei","vocative":"găsire"}},{"word":"găsise","pos":"verb","definitions":["third-person singular pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsise]","forms":{"canonical":"găsíse"}},{"word":"găsisem","pos":"verb","definitions":["first-person singular pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsisem]","forms":{"canonical":"găsísem"}},{"word":"găsiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsiserə]","forms":{"canonical":"găsíseră"}},{"word":"găsiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsiserəm]","forms":{"canonical":"găsíserăm"}},{"word":"găsiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsiserətsʲ]","forms":{"canonical":"găsíserăți"}},{"word":"găsiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of găsi"],"pronunciation":"[ɡəˈsiseʃʲ]","forms":{"canonical":"găsíseși"}},{"word":"găsiși","pos":"verb","definitions":["second-person singular simple perfect indicative of găsi"],"pronunciation":"[ɡəˈsiʃʲ]","forms":{"canonical":"găsíși"}},{"word":"găsit","pos":"noun","definitions":["finding"],"pronunciation":"/ɡəˈsit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"găsit","accusative-definite-nominative":"găsitul","dative-genitive-indefinite":"găsit","dative-definite-genitive":"găsitului","vocative":"găsitule","alternative":"гэсит"}},{"word":"găsit","pos":"verb","definitions":["past participle of găsi"],"pronunciation":"/ɡəˈsit/","forms":{"participle-past":"of găsi","alternative":"гэсит"}},{"word":"găsita","pos":"adj","definitions":["definite nominative/accusative feminine singular of găsit"],"pronunciation":"[ɡəˈsita]"},{"word":"găsită","pos":"adj","definitions":["feminine singular of găsit"],"pronunciation":"[ɡəˈsitə]"},{"word":"găsite","pos":"adj","definitions":["feminine/neuter plural of găsit"],"pronunciation":"[ɡəˈsite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"găsíte"}},{"word":"găsitei","pos":"adj","definitions":["definite genitive/dative feminine singular of găsit"],"pronunciation":"[ɡəˈsitej]"},{"word":"găsitele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of găsit"],"pronunciation":"[ɡəˈsitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"găsítele"}},{"word":"găsitelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of găsit"],"pronunciation":"[ɡəˈsitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"găsítelor"}},{"word":"găsiți","pos":"adj","definitions":["masculine plural of găsit"],"pronunciation":"[ɡəˈsit͡sʲ]","forms":{"canonical":"găsíți"}},{"word":"găsiți","pos":"verb","definitions":["inflection of găsi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[ɡəˈsit͡sʲ]","forms":{"canonical":"găsíți"}},{"word":"găsiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of găsit"],"pronunciation":"[ɡəˈsit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"găsíții"}},{"word":"găsiților","pos":"adj","definitions":["definite genitive/dative masculine plural of găsit"],"pronunciation":"[ɡəˈsit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"găsíților"}},{"word":"găsitoare","pos":"noun","definitions":["female equivalent of găsitor"],"forms":{"plural":"găsitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"găsitoare","accusative-definite-nominative-singular":"găsitoarea","accusative-indefinite-nominative-plural":"găsitoare","accusative-definite-nominative-plural":"găsitoarele","dative-genitive-indefinite-singular":"găsitoare","dative-definite-genitive-singular":"găsitoarei","dative-genitive-indefinite-plural":"găsitoare","dative-definite-genitive-plural":"găsitoarelor","singular-vocative":"găsitoare","plural-vocative":"găsitoarelor"}},{"word":"găsitor","pos":"noun","definitions":["finder"],"forms":{"plural":"găsitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găsitor","accusative-definite-nominative-singular":"găsitorul","accusative-indefinite-nominative-plural":"găsitori","accusative-definite-nominative-plural":"găsitorii","dative-genitive-indefinite-singular":"găsitor","dative-definite-genitive-singular":"găsitorului","dative-genitive-indefinite-plural":"găsitori","dative-definite-genitive-plural":"găsitorilor","singular-vocative":"găsitorule","plural-vocative":"găsitorilor"}},{"word":"găsitul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of găsit"],"pronunciation":"[ɡəˈsitul]","gender":"m","forms":{"canonical-masculine-neuter":"găsítul"}},{"word":"găsitului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of găsit"],"pronunciation":"[ɡəˈsituluj]","gender":"m","forms":{"canonical-masculine-neuter":"găsítului"}},{"word":"Gașpar","pos":"name","definitions":["a village in Gașpar, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Gășpărel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gășpărel"}},{"word":"gașper","pos":"noun","definitions":["Roma, Gypsy"],"forms":{"plural":"gașperi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gașper","accusative-definite-nominative-singular":"gașperul","accusative-indefinite-nominative-plural":"gașperi","accusative-definite-nominative-plural":"gașperii","dative-genitive-indefinite-singular":"gașper","dative-definite-genitive-singular":"gașperului","dative-genitive-indefinite-plural":"gașperi","dative-definite-genitive-plural":"gașperilor","singular-vocative":"gașperule","plural-vocative":"gașperilor"}},{"word":"gașperiță","pos":"noun","definitions":["Gypsy"],"forms":{"plural":"gașperițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gașperiță","accusative-definite-nominative-singular":"gașperița","accusative-indefinite-nominative-plural":"gașperițe","accusative-definite-nominative-plural":"gașperițele","dative-genitive-indefinite-singular":"gașperițe","dative-definite-genitive-singular":"gașperiței","dative-genitive-indefinite-plural":"gașperițe","dative-definite-genitive-plural":"gașperițelor","singular-vocative":"gașperiță","plural-vocative":"gașperițelor"}},{"word":"gâște","pos":"noun","definitions":["plural of gâscă"],"gender":"f-p"},{"word":"gâște cu ouă de aur","pos":"noun","definitions":["plural of gâscă cu ouă de aur"]},{"word":"gâștei","pos":"noun","definitions":["definite genitive/dative singular of gâscă"]},{"word":"Gâșteni","pos":"name","definitions":["a village in Răcăciuni, Bacău County, Romania"],"gender":"m"},{"word":"gasteropod","pos":"noun","definitions":["gastropod"],"forms":{"plural":"gasteropode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gasteropod","accusative-definite-nominative-singular":"gasteropodul","accusative-indefinite-nominative-plural":"gasteropode","accusative-definite-nominative-plural":"gasteropodele","dative-genitive-indefinite-singular":"gasteropod","dative-definite-genitive-singular":"gasteropodului","dative-genitive-indefinite-plural":"gasteropode","dative-definite-genitive-plural":"gasteropodelor","singular-vocative":"gasteropodule","plural-vocative":"gasteropodelor"}},{"word":"Gâștești","pos":"name","definitions":["a locality in Pașcani, Iași County, Romania"],"gender":"m"},{"word":"gastralgic","pos":"adj","definitions":["gastralgic"],"forms":{"feminine-singular":"gastralgică","masculine-plural":"gastralgici","feminine-neuter-plural":"gastralgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gastralgic","error-unrecognized-form-feminine-indefinite-singular":"gastralgică","error-unrecognized-form-indefinite-masculine-plural":"gastralgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gastralgice","definite-error-unrecognized-form-masculine-neuter-singular":"gastralgicul","definite-error-unrecognized-form-feminine-singular":"gastralgica","definite-error-unrecognized-form-masculine-plural":"gastralgicii","definite-error-unrecognized-form-feminine-neuter-plural":"gastralgicele"}},{"word":"gastralgie","pos":"noun","definitions":["gastralgia"],"forms":{"plural":"gastralgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastralgie","accusative-definite-nominative-singular":"gastralgia","accusative-indefinite-nominative-plural":"gastralgii","accusative-definite-nominative-plural":"gastralgiile","dative-genitive-indefinite-singular":"gastralgii","dative-definite-genitive-singular":"gastralgiei","dative-genitive-indefinite-plural":"gastralgii","dative-definite-genitive-plural":"gastralgiilor","singular-vocative":"gastralgie","plural-vocative":"gastralgiilor"}},{"word":"gastrectazie","pos":"noun","definitions":["gastrectasia"],"forms":{"plural":"gastrectazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrectazie","accusative-definite-nominative-singular":"gastrectazia","accusative-indefinite-nominative-plural":"gastrectazii","accusative-definite-nominative-plural":"gastrectaziile","dative-genitive-indefinite-singular":"gastrectazii","dative-definite-genitive-singular":"gastrectaziei","dative-genitive-indefinite-plural":"gastrectazii","dative-definite-genitive-plural":"gastrectaziilor","singular-vocative":"gastrectazie","plural-vocative":"gastrectaziilor"}},{"word":"gastrectomie","pos":"noun","definitions":["gastrectomy"],"forms":{"plural":"gastrectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrectomie","accusative-definite-nominative-singular":"gastrectomia","accusative-indefinite-nominative-plural":"gastrectomii","accusative-definite-nominative-plural":"gastrectomiile","dative-genitive-indefinite-singular":"gastrectomii","dative-definite-genitive-singular":"gastrectomiei","dative-genitive-indefinite-plural":"gastrectomii","dative-definite-genitive-plural":"gastrectomiilor","singular-vocative":"gastrectomie","plural-vocative":"gastrectomiilor"}},{"word":"gastric","pos":"adj","definitions":["gastric"],"pronunciation":"/ˈɡas.trik/","forms":{"feminine-singular":"gastrică","masculine-plural":"gastrici","feminine-neuter-plural":"gastrice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gastric","error-unrecognized-form-feminine-indefinite-singular":"gastrică","error-unrecognized-form-indefinite-masculine-plural":"gastrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gastrice","definite-error-unrecognized-form-masculine-neuter-singular":"gastricul","definite-error-unrecognized-form-feminine-singular":"gastrica","definite-error-unrecognized-form-masculine-plural":"gastricii","definite-error-unrecognized-form-feminine-neuter-plural":"gastricele"}},{"word":"gastrină","pos":"noun","definitions":["gastrin"],"forms":{"plural":"gastrine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastrină","accusative-definite-nominative-singular":"gastrina","accusative-indefinite-nominative-plural":"gastrine","accusative-definite-nominative-plural":"gastrinele","dative-genitive-indefinite-singular":"gastrine","dative-definite-genitive-singular":"gastrinei","dative-genitive-indefinite-plural":"gastrine","dative-definite-genitive-plural":"gastrinelor","singular-vocative":"gastrină","plural-vocative":"gastrinelor"}},{"word":"gastrită","pos":"noun","definitions":["gastritis"],"forms":{"plural":"gastrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastrită","accusative-definite-nominative-singular":"gastrita","accusative-indefinite-nominative-plural":"gastrite","accusative-definite-nominative-plural":"gastritele","dative-genitive-indefinite-singular":"gastrite","dative-definite-genitive-singular":"gastritei","dative-genitive-indefinite-plural":"gastrite","dative-definite-genitive-plural":"gastritelor","singular-vocative":"gastrită","plural-vocative":"gastritelor"}},{"word":"gastro-","pos":"prefix","definitions":["gastro-"]},{"word":"gastrocel","pos":"noun","definitions":["gastrocele"],"forms":{"plural":"gastrocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gastrocel","accusative-definite-nominative-singular":"gastrocelul","accusative-indefinite-nominative-plural":"gastrocele","accusative-definite-nominative-plural":"gastrocelele","dative-genitive-indefinite-singular":"gastrocel","dative-definite-genitive-singular":"gastrocelului","dative-genitive-indefinite-plural":"gastrocele","dative-definite-genitive-plural":"gastrocelelor","singular-vocative":"gastrocelule","plural-vocative":"gastrocelelor"}},{"word":"gastrodinie","pos":"noun","definitions":["gastrodynia"],"forms":{"plural":"gastrodinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrodinie","accusative-definite-nominative-singular":"gastrodinia","accusative-indefinite-nominative-plural":"gastrodinii","accusative-definite-nominative-plural":"gastrodiniile","dative-genitive-indefinite-singular":"gastrodinii","dative-definite-genitive-singular":"gastrodiniei","dative-genitive-indefinite-plural":"gastrodinii","dative-definite-genitive-plural":"gastrodiniilor","singular-vocative":"gastrodinie","plural-vocative":"gastrodiniilor"}},{"word":"gastroduodenită","pos":"noun","definitions":["gastroduodenitis"],"forms":{"plural":"gastroduodenite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastroduodenită","accusative-definite-nominative-singular":"gastroduodenita","accusative-indefinite-nominative-plural":"gastroduodenite","accusative-definite-nominative-plural":"gastroduodenitele","dative-genitive-indefinite-singular":"gastroduodenite","dative-definite-genitive-singular":"gastroduodenitei","dative-genitive-indefinite-plural":"gastroduodenite","dative-definite-genitive-plural":"gastroduodenitelor","singular-vocative":"gastroduodenită","plural-vocative":"gastroduodenitelor"}},{"word":"gastroenterită","pos":"noun","definitions":["gastroenteritis"],"forms":{"plural":"gastroenterite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastroenterită","accusative-definite-nominative-singular":"gastroenterita","accusative-indefinite-nominative-plural":"gastroenterite","accusative-definite-nominative-plural":"gastroenteritele","dative-genitive-indefinite-singular":"gastroenterite","dative-definite-genitive-singular":"gastroenteritei","dative-genitive-indefinite-plural":"gastroenterite","dative-definite-genitive-plural":"gastroenteritelor","singular-vocative":"gastroenterită","plural-vocative":"gastroenteritelor"}},{"word":"gastroenterocolită","pos":"noun","definitions":["gastroenterocolitis"],"forms":{"plural":"gastroenterocolite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastroenterocolită","accusative-definite-nominative-singular":"gastroenterocolita","accusative-indefinite-nominative-plural":"gastroenterocolite","accusative-definite-nominative-plural":"gastroenterocolitele","dative-genitive-indefinite-singular":"gastroenterocolite","dative-definite-genitive-singular":"gastroenterocolitei","dative-genitive-indefinite-plural":"gastroenterocolite","dative-definite-genitive-plural":"gastroenterocolitelor","singular-vocative":"gastroenterocolită","plural-vocative":"gastroenterocolitelor"}},{"word":"gastroenterolog","pos":"noun","definitions":["gastroenterologist"],"forms":{"plural":"gastroenterologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gastroenterolog","accusative-definite-nominative-singular":"gastroenterologul","accusative-indefinite-nominative-plural":"gastroenterologi","accusative-definite-nominative-plural":"gastroenterologii","dative-genitive-indefinite-singular":"gastroenterolog","dative-definite-genitive-singular":"gastroenterologului","dative-genitive-indefinite-plural":"gastroenterologi","dative-definite-genitive-plural":"gastroenterologilor","singular-vocative":"gastroenterologule","plural-vocative":"gastroenterologilor"}},{"word":"gastroenterologă","pos":"noun","definitions":["female equivalent of gastroenterolog"],"forms":{"plural":"gastroenterologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastroenterologă","accusative-definite-nominative-singular":"gastroenterologa","accusative-indefinite-nominative-plural":"gastroenterologe","accusative-definite-nominative-plural":"gastroenterologele","dative-genitive-indefinite-singular":"gastroenterologe","dative-definite-genitive-singular":"gastroenterologei","dative-genitive-indefinite-plural":"gastroenterologe","dative-definite-genitive-plural":"gastroenterologelor","singular-vocative":"gastroenterologă","plural-vocative":"gastroenterologelor"}},{"word":"gastroenterologie","pos":"noun","definitions":["gastroenterology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gastroenterologie","accusative-definite-nominative":"gastroenterologia","dative-genitive-indefinite":"gastroenterologii","dative-definite-genitive":"gastroenterologiei","vocative":"gastroenterologie"}},{"word":"gastroenterostomie","pos":"noun","definitions":["gastroenterostomy"],"forms":{"plural":"gastroenterostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastroenterostomie","accusative-definite-nominative-singular":"gastroenterostomia","accusative-indefinite-nominative-plural":"gastroenterostomii","accusative-definite-nominative-plural":"gastroenterostomiile","dative-genitive-indefinite-singular":"gastroenterostomii","dative-definite-genitive-singular":"gastroenterostomiei","dative-genitive-indefinite-plural":"gastroenterostomii","dative-definite-genitive-plural":"gastroenterostomiilor","singular-vocative":"gastroenterostomie","plural-vocative":"gastroenterostomiilor"}},{"word":"gastrograf","pos":"noun","definitions":["gastrograph"],"forms":{"plural":"gastrografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gastrograf","accusative-definite-nominative-singular":"gastrograful","accusative-indefinite-nominative-plural":"gastrografe","accusative-definite-nominative-plural":"gastrografele","dative-genitive-indefinite-singular":"gastrograf","dative-definite-genitive-singular":"gastrografului","dative-genitive-indefinite-plural":"gastrografe","dative-definite-genitive-plural":"gastrografelor","singular-vocative":"gastrografule","plural-vocative":"gastrografelor"}},{"word":"gastrointestinal","pos":"adj","definitions":["gastrointestinal"],"forms":{"feminine-singular":"gastrointestinală","masculine-plural":"gastrointestinali","feminine-neuter-plural":"gastrointestinale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gastrointestinal","error-unrecognized-form-feminine-indefinite-singular":"gastrointestinală","error-unrecognized-form-indefinite-masculine-plural":"gastrointestinali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gastrointestinale","definite-error-unrecognized-form-masculine-neuter-singular":"gastrointestinalul","definite-error-unrecognized-form-feminine-singular":"gastrointestinala","definite-error-unrecognized-form-masculine-plural":"gastrointestinalii","definite-error-unrecognized-form-feminine-neuter-plural":"gastrointestinalele"}},{"word":"gastrolatru","pos":"noun","definitions":["gastrolater"],"forms":{"plural":"gastrolatri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gastrolatru","accusative-definite-nominative-singular":"gastrolatruul","accusative-indefinite-nominative-plural":"gastrolatri","accusative-definite-nominative-plural":"gastrolatrii","dative-genitive-indefinite-singular":"gastrolatru","dative-definite-genitive-singular":"gastrolatruului","dative-genitive-indefinite-plural":"gastrolatri","dative-definite-genitive-plural":"gastrolatrilor","singular-vocative":"gastrolatruule","plural-vocative":"gastrolatrilor"}},{"word":"gastrolit","pos":"noun","definitions":["gastrolith"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gastrolit","accusative-definite-nominative":"gastrolitul","dative-genitive-indefinite":"gastrolit","dative-definite-genitive":"gastrolitului","vocative":"gastrolitule"}},{"word":"gastrologic","pos":"adj","definitions":["gastrological"],"forms":{"feminine-singular":"gastrologică","masculine-plural":"gastrologici","feminine-neuter-plural":"gastrologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gastrologic","error-unrecognized-form-feminine-indefinite-singular":"gastrologică","error-unrecognized-form-indefinite-masculine-plural":"gastrologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gastrologice","definite-error-unrecognized-form-masculine-neuter-singular":"gastrologicul","definite-error-unrecognized-form-feminine-singular":"gastrologica","definite-error-unrecognized-form-masculine-plural":"gastrologicii","definite-error-unrecognized-form-feminine-neuter-plural":"gastrologicele"}},{"word":"gastrologie","pos":"noun","definitions":["gastrology"],"forms":{"plural":"gastrologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrologie","accusative-definite-nominative-singular":"gastrologia","accusative-indefinite-nominative-plural":"gastrologii","accusative-definite-nominative-plural":"gastrologiile","dative-genitive-indefinite-singular":"gastrologii","dative-definite-genitive-singular":"gastrologiei","dative-genitive-indefinite-plural":"gastrologii","dative-definite-genitive-plural":"gastrologiilor","singular-vocative":"gastrologie","plural-vocative":"gastrologiilor"}},{"word":"gastromalacie","pos":"noun","definitions":["gastromalacia"],"forms":{"plural":"gastromalacii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastromalacie","accusative-definite-nominative-singular":"gastromalacia","accusative-indefinite-nominative-plural":"gastromalacii","accusative-definite-nominative-plural":"gastromalaciile","dative-genitive-indefinite-singular":"gastromalacii","dative-definite-genitive-singular":"gastromalaciei","dative-genitive-indefinite-plural":"gastromalacii","dative-definite-genitive-plural":"gastromalaciilor","singular-vocative":"gastromalacie","plural-vocative":"gastromalaciilor"}},{"word":"gastronoamă","pos":"noun","definitions":["female equivalent of gastronom"],"forms":{"plural":"gastronoame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastronoamă","accusative-definite-nominative-singular":"gastronoama","accusative-indefinite-nominative-plural":"gastronoame","accusative-definite-nominative-plural":"gastronoamele","dative-genitive-indefinite-singular":"gastronoame","dative-definite-genitive-singular":"gastronoamei","dative-genitive-indefinite-plural":"gastronoame","dative-definite-genitive-plural":"gastronoamelor","singular-vocative":"gastronoamă","plural-vocative":"gastronoamelor"}},{"word":"gastronom","pos":"noun","definitions":["gastronomist"],"forms":{"plural":"gastronomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gastronom","accusative-definite-nominative-singular":"gastronomul","accusative-indefinite-nominative-plural":"gastronomi","accusative-definite-nominative-plural":"gastronomii","dative-genitive-indefinite-singular":"gastronom","dative-definite-genitive-singular":"gastronomului","dative-genitive-indefinite-plural":"gastronomi","dative-definite-genitive-plural":"gastronomilor","singular-vocative":"gastronomule","plural-vocative":"gastronomilor"}},{"word":"gastronomă","pos":"noun","definitions":["female equivalent of gastronom"],"forms":{"plural":"gastronome","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gastronomă","accusative-definite-nominative-singular":"gastronoma","accusative-indefinite-nominative-plural":"gastronome","accusative-definite-nominative-plural":"gastronomele","dative-genitive-indefinite-singular":"gastronome","dative-definite-genitive-singular":"gastronomei","dative-genitive-indefinite-plural":"gastronome","dative-definite-genitive-plural":"gastronomelor","singular-vocative":"gastronomă","plural-vocative":"gastronomelor"}},{"word":"gastronomic","pos":"adj","definitions":["gastronomic"],"forms":{"feminine-singular":"gastronomică","masculine-plural":"gastronomici","feminine-neuter-plural":"gastronomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gastronomic","error-unrecognized-form-feminine-indefinite-singular":"gastronomică","error-unrecognized-form-indefinite-masculine-plural":"gastronomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gastronomice","definite-error-unrecognized-form-masculine-neuter-singular":"gastronomicul","definite-error-unrecognized-form-feminine-singular":"gastronomica","definite-error-unrecognized-form-masculine-plural":"gastronomicii","definite-error-unrecognized-form-feminine-neuter-plural":"gastronomicele"}},{"word":"gastronomie","pos":"noun","definitions":["gastronomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gastronomie","accusative-definite-nominative":"gastronomia","dative-genitive-indefinite":"gastronomii","dative-definite-genitive":"gastronomiei","vocative":"gastronomie"}},{"word":"gastropatie","pos":"noun","definitions":["gastropathy"],"forms":{"plural":"gastropatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastropatie","accusative-definite-nominative-singular":"gastropatia","accusative-indefinite-nominative-plural":"gastropatii","accusative-definite-nominative-plural":"gastropatiile","dative-genitive-indefinite-singular":"gastropatii","dative-definite-genitive-singular":"gastropatiei","dative-genitive-indefinite-plural":"gastropatii","dative-definite-genitive-plural":"gastropatiilor","singular-vocative":"gastropatie","plural-vocative":"gastropatiilor"}},{"word":"gastropexie","pos":"noun","definitions":["gastropexy"],"forms":{"plural":"gastropexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastropexie","accusative-definite-nominative-singular":"gastropexia","accusative-indefinite-nominative-plural":"gastropexii","accusative-definite-nominative-plural":"gastropexiile","dative-genitive-indefinite-singular":"gastropexii","dative-definite-genitive-singular":"gastropexiei","dative-genitive-indefinite-plural":"gastropexii","dative-definite-genitive-plural":"gastropexiilor","singular-vocative":"gastropexie","plural-vocative":"gastropexiilor"}},{"word":"gastroplegie","pos":"noun","definitions":["gastroplegia"],"forms":{"plural":"gastroplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastroplegie","accusative-definite-nominative-singular":"gastroplegia","accusative-indefinite-nominative-plural":"gastroplegii","accusative-definite-nominative-plural":"gastroplegiile","dative-genitive-indefinite-singular":"gastroplegii","dative-definite-genitive-singular":"gastroplegiei","dative-genitive-indefinite-plural":"gastroplegii","dative-definite-genitive-plural":"gastroplegiilor","singular-vocative":"gastroplegie","plural-vocative":"gastroplegiilor"}},{"word":"gastropod","pos":"noun","definitions":["alternative form of gasteropod"],"forms":{"plural":"gastropode","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gastropod","accusative-definite-nominative-singular":"gastropodul","accusative-indefinite-nominative-plural":"gastropode","accusative-definite-nominative-plural":"gastropodele","dative-genitive-indefinite-singular":"gastropod","dative-definite-genitive-singular":"gastropodului","dative-genitive-indefinite-plural":"gastropode","dative-definite-genitive-plural":"gastropodelor","singular-vocative":"gastropodule","plural-vocative":"gastropodelor"}},{"word":"gastroragie","pos":"noun","definitions":["gastrorrhagia"],"forms":{"plural":"gastroragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastroragie","accusative-definite-nominative-singular":"gastroragia","accusative-indefinite-nominative-plural":"gastroragii","accusative-definite-nominative-plural":"gastroragiile","dative-genitive-indefinite-singular":"gastroragii","dative-definite-genitive-singular":"gastroragiei","dative-genitive-indefinite-plural":"gastroragii","dative-definite-genitive-plural":"gastroragiilor","singular-vocative":"gastroragie","plural-vocative":"gastroragiilor"}},{"word":"gastroscop","pos":"noun","definitions":["gastroscope"],"forms":{"plural":"gastroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gastroscop","accusative-definite-nominative-singular":"gastroscopul","accusative-indefinite-nominative-plural":"gastroscoape","accusative-definite-nominative-plural":"gastroscoapele","dative-genitive-indefinite-singular":"gastroscop","dative-definite-genitive-singular":"gastroscopului","dative-genitive-indefinite-plural":"gastroscoape","dative-definite-genitive-plural":"gastroscoapelor","singular-vocative":"gastroscopule","plural-vocative":"gastroscoapelor"}},{"word":"gastroscopie","pos":"noun","definitions":["gastroscopy"],"forms":{"plural":"gastroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastroscopie","accusative-definite-nominative-singular":"gastroscopia","accusative-indefinite-nominative-plural":"gastroscopii","accusative-definite-nominative-plural":"gastroscopiile","dative-genitive-indefinite-singular":"gastroscopii","dative-definite-genitive-singular":"gastroscopiei","dative-genitive-indefinite-plural":"gastroscopii","dative-definite-genitive-plural":"gastroscopiilor","singular-vocative":"gastroscopie","plural-vocative":"gastroscopiilor"}},{"word":"gastrospasm","pos":"noun","definitions":["gastrospasm"],"forms":{"plural":"gastrospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gastrospasm","accusative-definite-nominative-singular":"gastrospasmul","accusative-indefinite-nominative-plural":"gastrospasme","accusative-definite-nominative-plural":"gastrospasmele","dative-genitive-indefinite-singular":"gastrospasm","dative-definite-genitive-singular":"gastrospasmului","dative-genitive-indefinite-plural":"gastrospasme","dative-definite-genitive-plural":"gastrospasmelor","singular-vocative":"gastrospasmule","plural-vocative":"gastrospasmelor"}},{"word":"gastrostomie","pos":"noun","definitions":["gastrostomy"],"forms":{"plural":"gastrostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrostomie","accusative-definite-nominative-singular":"gastrostomia","accusative-indefinite-nominative-plural":"gastrostomii","accusative-definite-nominative-plural":"gastrostomiile","dative-genitive-indefinite-singular":"gastrostomii","dative-definite-genitive-singular":"gastrostomiei","dative-genitive-indefinite-plural":"gastrostomii","dative-definite-genitive-plural":"gastrostomiilor","singular-vocative":"gastrostomie","plural-vocative":"gastrostomiilor"}},{"word":"gastrotomie","pos":"noun","definitions":["gastrotomy"],"forms":{"plural":"gastrotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrotomie","accusative-definite-nominative-singular":"gastrotomia","accusative-indefinite-nominative-plural":"gastrotomii","accusative-definite-nominative-plural":"gastrotomiile","dative-genitive-indefinite-singular":"gastrotomii","dative-definite-genitive-singular":"gastrotomiei","dative-genitive-indefinite-plural":"gastrotomii","dative-definite-genitive-plural":"gastrotomiilor","singular-vocative":"gastrotomie","plural-vocative":"gastrotomiilor"}},{"word":"gastrulă","pos":"noun","definitions":["gastrula"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gastrulă","accusative-definite-nominative":"gastrula","dative-genitive-indefinite":"gastrule","dative-definite-genitive":"gastrulei","vocative":"gastrulă"}},{"word":"gastrulație","pos":"noun","definitions":["gastrulation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gastrulație","accusative-definite-nominative-singular":"gastrulația","accusative-indefinite-nominative-plural":"gastrulații","accusative-definite-nominative-plural":"gastrulațiile","dative-genitive-indefinite-singular":"gastrulații","dative-definite-genitive-singular":"gastrulației","dative-genitive-indefinite-plural":"gastrulații","dative-definite-genitive-plural":"gastrulațiilor","singular-vocative":"gastrulație","plural-vocative":"gastrulațiilor"}},{"word":"gat","pos":"noun","definitions":["dam"],"forms":{"plural":"gaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gat","accusative-definite-nominative-singular":"gatul","accusative-indefinite-nominative-plural":"gaturi","accusative-definite-nominative-plural":"gaturile","dative-genitive-indefinite-singular":"gat","dative-definite-genitive-singular":"gatului","dative-genitive-indefinite-plural":"gaturi","dative-definite-genitive-plural":"gaturilor","singular-vocative":"gatule","plural-vocative":"gaturilor"}},{"word":"gât","pos":"noun","definitions":["throat","neck"],"pronunciation":"/ɡɨt/","forms":{"plural":"gâturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gât","accusative-definite-nominative-singular":"gâtul","accusative-indefinite-nominative-plural":"gâturi","accusative-definite-nominative-plural":"gâturile","dative-genitive-indefinite-singular":"gât","dative-definite-genitive-singular":"gâtului","dative-genitive-indefinite-plural":"gâturi","dative-definite-genitive-plural":"gâturilor","singular-vocative":"gâtule","plural-vocative":"gâturilor"}},{"word":"gata","pos":"adj","definitions":["ready, willing","done"],"pronunciation":"/ˈɡa.ta/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gata","error-unrecognized-form-feminine-indefinite-singular":"gata","error-unrecognized-form-indefinite-masculine-plural":"gata","error-unrecognized-form-feminine-indefinite-neuter-plural":"gata","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"gata","pos":"adv","definitions":["readily, willingly"],"pronunciation":"/ˈɡa.ta/"},{"word":"găta","pos":"verb","definitions":["alternative form of găti"],"forms":{"canonical":"a găta 1st conjugation","present-singular-third-person":"gată","participle-past":"gătat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a găta","gerund":"gătând","first-person-indicative-present-singular":"găt","indicative-present-second-person-singular":"găți","indicative-present-singular-third-person":"gătă","first-person-indicative-plural-present":"gătăm","indicative-plural-present-second-person":"gătați","indicative-plural-present-third-person":"gătă","first-person-imperfect-indicative-singular":"gătam","imperfect-indicative-second-person-singular":"gătai","imperfect-indicative-singular-third-person":"găta","first-person-imperfect-indicative-plural":"gătam","imperfect-indicative-plural-second-person":"gătați","imperfect-indicative-plural-third-person":"gătau","first-person-indicative-perfect-singular":"gătai","indicative-perfect-second-person-singular":"gătași","indicative-perfect-singular-third-person":"gătă","first-person-indicative-perfect-plural":"gătarăm","indicative-perfect-plural-second-person":"gătarăți","indicative-perfect-plural-third-person":"gătară","first-person-indicative-pluperfect-singular":"gătasem","indicative-pluperfect-second-person-singular":"gătaseși","indicative-pluperfect-singular-third-person":"gătase","first-person-indicative-pluperfect-plural":"gătaserăm","indicative-pluperfect-plural-second-person":"gătaserăți","indicative-pluperfect-plural-third-person":"gătaseră","first-person-present-singular-subjunctive":"să găt","present-second-person-singular-subjunctive":"să găți","present-singular-subjunctive-third-person":"să găte","first-person-plural-present-subjunctive":"să gătăm","plural-present-second-person-subjunctive":"să gătați","plural-present-subjunctive-third-person":"să găte","imperative-second-person-singular":"gătă","imperative-plural-second-person":"gătați","imperative-negative-second-person-singular":"nu găta","imperative-negative-plural-second-person":"nu gătați"}},{"word":"gâtar","pos":"noun","definitions":["neck collar for horses"],"forms":{"plural":"gâtare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gâtar","accusative-definite-nominative-singular":"gâtarul","accusative-indefinite-nominative-plural":"gâtare","accusative-definite-nominative-plural":"gâtarele","dative-genitive-indefinite-singular":"gâtar","dative-definite-genitive-singular":"gâtarului","dative-genitive-indefinite-plural":"gâtare","dative-definite-genitive-plural":"gâtarelor","singular-vocative":"gâtarule","plural-vocative":"gâtarelor"}},{"word":"gătat","pos":"adj","definitions":["alternative form of gătit"],"forms":{"feminine-singular":"gătată","masculine-plural":"gătați","feminine-neuter-plural":"gătate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gătat","error-unrecognized-form-feminine-indefinite-singular":"gătată","error-unrecognized-form-indefinite-masculine-plural":"gătați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gătate","definite-error-unrecognized-form-masculine-neuter-singular":"gătatul","definite-error-unrecognized-form-feminine-singular":"gătata","definite-error-unrecognized-form-masculine-plural":"gătații","definite-error-unrecognized-form-feminine-neuter-plural":"gătatele"}},{"word":"găteală","pos":"noun","definitions":["dressing up"],"pronunciation":"/ɡəˈte̯a.lə/","forms":{"plural":"găteli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"găteală","accusative-definite-nominative-singular":"găteala","accusative-indefinite-nominative-plural":"găteli","accusative-definite-nominative-plural":"gătelile","dative-genitive-indefinite-singular":"găteli","dative-definite-genitive-singular":"gătelii","dative-genitive-indefinite-plural":"găteli","dative-definite-genitive-plural":"gătelilor","singular-vocative":"găteală","plural-vocative":"gătelilor"}},{"word":"Gătej","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gătej"}},{"word":"gătej","pos":"noun","definitions":["brushwood"],"pronunciation":"/ɡəˈteʒ/","forms":{"plural":"găteje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gătej","accusative-definite-nominative-singular":"gătejul","accusative-indefinite-nominative-plural":"găteje","accusative-definite-nominative-plural":"gătejele","dative-genitive-indefinite-singular":"gătej","dative-definite-genitive-singular":"gătejului","dative-genitive-indefinite-plural":"găteje","dative-definite-genitive-plural":"gătejelor","singular-vocative":"gătejule","plural-vocative":"gătejelor"}},{"word":"gătejel","pos":"noun","definitions":["diminutive of gătej"],"forms":{"plural":"gătejele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gătejel","accusative-definite-nominative-singular":"gătejelul","accusative-indefinite-nominative-plural":"gătejele","accusative-definite-nominative-plural":"gătejelele","dative-genitive-indefinite-singular":"gătejel","dative-definite-genitive-singular":"gătejelului","dative-genitive-indefinite-plural":"gătejele","dative-definite-genitive-plural":"gătejelelor","singular-vocative":"gătejelule","plural-vocative":"gătejelelor"}},{"word":"Gătejești","pos":"name","definitions":["a locality in Băile Govora, Vâlcea County, Romania"],"gender":"m"},{"word":"gătejișor","pos":"noun","definitions":["diminutive of gătej"],"forms":{"plural":"gătejișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gătejișor","accusative-definite-nominative-singular":"gătejișorul","accusative-indefinite-nominative-plural":"gătejișoare","accusative-definite-nominative-plural":"gătejișoarele","dative-genitive-indefinite-singular":"gătejișor","dative-definite-genitive-singular":"gătejișorului","dative-genitive-indefinite-plural":"gătejișoare","dative-definite-genitive-plural":"gătejișoarelor","singular-vocative":"gătejișorule","plural-vocative":"gătejișoarelor"}},{"word":"gater","pos":"noun","definitions":["sawmill"],"forms":{"plural":"gatere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gater","accusative-definite-nominative-singular":"gaterul","accusative-indefinite-nominative-plural":"gatere","accusative-definite-nominative-plural":"gaterele","dative-genitive-indefinite-singular":"gater","dative-definite-genitive-singular":"gaterului","dative-genitive-indefinite-plural":"gatere","dative-definite-genitive-plural":"gaterelor","singular-vocative":"gaterule","plural-vocative":"gaterelor"}},{"word":"gaterist","pos":"noun","definitions":["saw mill worker"],"forms":{"plural":"gateriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gaterist","accusative-definite-nominative-singular":"gateristul","accusative-indefinite-nominative-plural":"gateristi","accusative-definite-nominative-plural":"gateristii","dative-genitive-indefinite-singular":"gaterist","dative-definite-genitive-singular":"gateristului","dative-genitive-indefinite-plural":"gateristi","dative-definite-genitive-plural":"gateristilor","singular-vocative":"gateristule","plural-vocative":"gateristilor"}},{"word":"Gateru","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Hoteagu"],"gender":"m"},{"word":"găti","pos":"verb","definitions":["to prepare (oneself or something else)","to cook","to dress up, get ready, adorn oneself","to finish"],"pronunciation":"/ɡəˈti/","forms":{"canonical":"a găti 4th conjugation","present-singular-third-person":"gătește","participle-past":"gătit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găti","gerund":"gătind","first-person-indicative-present-singular":"gătesc","indicative-present-second-person-singular":"gătești","indicative-present-singular-third-person":"gătește","first-person-indicative-plural-present":"gătim","indicative-plural-present-second-person":"gătiți","indicative-plural-present-third-person":"gătesc","first-person-imperfect-indicative-singular":"găteam","imperfect-indicative-second-person-singular":"găteai","imperfect-indicative-singular-third-person":"gătea","first-person-imperfect-indicative-plural":"găteam","imperfect-indicative-plural-second-person":"găteați","imperfect-indicative-plural-third-person":"găteau","first-person-indicative-perfect-singular":"gătii","indicative-perfect-second-person-singular":"gătiși","indicative-perfect-singular-third-person":"găti","first-person-indicative-perfect-plural":"gătirăm","indicative-perfect-plural-second-person":"gătirăți","indicative-perfect-plural-third-person":"gătiră","first-person-indicative-pluperfect-singular":"gătisem","indicative-pluperfect-second-person-singular":"gătiseși","indicative-pluperfect-singular-third-person":"gătise","first-person-indicative-pluperfect-plural":"gătiserăm","indicative-pluperfect-plural-second-person":"gătiserăți","indicative-pluperfect-plural-third-person":"gătiseră","first-person-present-singular-subjunctive":"să gătesc","present-second-person-singular-subjunctive":"să gătești","present-singular-subjunctive-third-person":"să gătească","first-person-plural-present-subjunctive":"să gătim","plural-present-second-person-subjunctive":"să gătiți","plural-present-subjunctive-third-person":"să gătească","imperative-second-person-singular":"gătește","imperative-plural-second-person":"gătiți","imperative-negative-second-person-singular":"nu găti","imperative-negative-plural-second-person":"nu gătiți","alternative":"găta"}},{"word":"gatii","pos":"noun","definitions":["baggy peasant knickerbockers"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"gatii","accusative-definite-nominative":"gatiile","dative-genitive-indefinite":"gatii","dative-definite-genitive":"gatiilor","vocative":"-"}},{"word":"gătim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of găti"]},{"word":"gătin","pos":"noun","definitions":["chain"],"forms":{"plural":"gătine","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gătin","accusative-definite-nominative-singular":"gătinul","accusative-indefinite-nominative-plural":"gătine","accusative-definite-nominative-plural":"gătinele","dative-genitive-indefinite-singular":"gătin","dative-definite-genitive-singular":"gătinului","dative-genitive-indefinite-plural":"gătine","dative-definite-genitive-plural":"gătinelor","singular-vocative":"gătinule","plural-vocative":"gătinelor"}},{"word":"gătire","pos":"noun","definitions":["cooking"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"gătire","accusative-definite-nominative":"gătirea","dative-genitive-indefinite":"gătire","dative-definite-genitive":"gătirei","vocative":"gătire"}},{"word":"gatism","pos":"noun","definitions":["decrepitude"],"forms":{"plural":"gatisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gatism","accusative-definite-nominative-singular":"gatismul","accusative-indefinite-nominative-plural":"gatisme","accusative-definite-nominative-plural":"gatismele","dative-genitive-indefinite-singular":"gatism","dative-definite-genitive-singular":"gatismului","dative-genitive-indefinite-plural":"gatisme","dative-definite-genitive-plural":"gatismelor","singular-vocative":"gatismule","plural-vocative":"gatismelor"}},{"word":"gâțișoară","pos":"noun","definitions":["diminutive of gâță"],"forms":{"plural":"gâțișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâțișoară","accusative-definite-nominative-singular":"gâțișoara","accusative-indefinite-nominative-plural":"gâțișoare","accusative-definite-nominative-plural":"gâțișoarele","dative-genitive-indefinite-singular":"gâțișoare","dative-definite-genitive-singular":"gâțișoarei","dative-genitive-indefinite-plural":"gâțișoare","dative-definite-genitive-plural":"gâțișoarelor","singular-vocative":"gâțișoară","plural-vocative":"gâțișoarelor"}},{"word":"gâtișor","pos":"noun","definitions":["diminutive of gât; small neck"],"forms":{"plural":"gâtișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gâtișor","accusative-definite-nominative-singular":"gâtișorul","accusative-indefinite-nominative-plural":"gâtișore","accusative-definite-nominative-plural":"gâtișorele","dative-genitive-indefinite-singular":"gâtișor","dative-definite-genitive-singular":"gâtișorului","dative-genitive-indefinite-plural":"gâtișore","dative-definite-genitive-plural":"gâtișorelor","singular-vocative":"gâtișorule","plural-vocative":"gâtișorelor"}},{"word":"gătit","pos":"adj","definitions":["cooked, prepared","well-dressed"],"forms":{"feminine-singular":"gătită","masculine-plural":"gătiți","feminine-neuter-plural":"gătite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gătit","error-unrecognized-form-feminine-indefinite-singular":"gătită","error-unrecognized-form-indefinite-masculine-plural":"gătiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gătite","definite-error-unrecognized-form-masculine-neuter-singular":"gătitul","definite-error-unrecognized-form-feminine-singular":"gătita","definite-error-unrecognized-form-masculine-plural":"gătiții","definite-error-unrecognized-form-feminine-neuter-plural":"gătitele"}},{"word":"gâtiță","pos":"noun","definitions":["throat"],"forms":{"plural":"gâtițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâtiță","accusative-definite-nominative-singular":"gâtița","accusative-indefinite-nominative-plural":"gâtițe","accusative-definite-nominative-plural":"gâtițele","dative-genitive-indefinite-singular":"gâtițe","dative-definite-genitive-singular":"gâtiței","dative-genitive-indefinite-plural":"gâtițe","dative-definite-genitive-plural":"gâtițelor","singular-vocative":"gâtiță","plural-vocative":"gâtițelor"}},{"word":"gătițel","pos":"adj","definitions":["diminutive of gătit"],"forms":{"feminine-singular":"gătițelă","masculine-plural":"gătițeli","feminine-neuter-plural":"gătițele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gătițel","error-unrecognized-form-feminine-indefinite-singular":"gătițelă","error-unrecognized-form-indefinite-masculine-plural":"gătițeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"gătițele","definite-error-unrecognized-form-masculine-neuter-singular":"gătițelul","definite-error-unrecognized-form-feminine-singular":"gătițela","definite-error-unrecognized-form-masculine-plural":"gătițelii","definite-error-unrecognized-form-feminine-neuter-plural":"gătițelele"}},{"word":"Gâtlan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gâtlan"}},{"word":"gâtlan","pos":"noun","definitions":["throat"],"forms":{"plural":"gâtlane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gâtlan","accusative-definite-nominative-singular":"gâtlanul","accusative-indefinite-nominative-plural":"gâtlane","accusative-definite-nominative-plural":"gâtlanele","dative-genitive-indefinite-singular":"gâtlan","dative-definite-genitive-singular":"gâtlanului","dative-genitive-indefinite-plural":"gâtlane","dative-definite-genitive-plural":"gâtlanelor","singular-vocative":"gâtlanule","plural-vocative":"gâtlanelor"}},{"word":"gâtlan","pos":"adj","definitions":["long, elongated (of fruits)"],"forms":{"feminine-singular":"gâtlană","masculine-plural":"gâtlani","feminine-neuter-plural":"gâtlane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gâtlan","error-unrecognized-form-feminine-indefinite-singular":"gâtlană","error-unrecognized-form-indefinite-masculine-plural":"gâtlani","error-unrecognized-form-feminine-indefinite-neuter-plural":"gâtlane","definite-error-unrecognized-form-masculine-neuter-singular":"gâtlanul","definite-error-unrecognized-form-feminine-singular":"gâtlana","definite-error-unrecognized-form-masculine-plural":"gâtlanii","definite-error-unrecognized-form-feminine-neuter-plural":"gâtlanele"}},{"word":"gâtlegău","pos":"noun","definitions":["necktie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gâtlegău","accusative-definite-nominative":"gâtlegăul","dative-genitive-indefinite":"gâtlegău","dative-definite-genitive":"gâtlegăului","vocative":"gâtlegăule"}},{"word":"gâtlej","pos":"noun","definitions":["throat"],"forms":{"plural":"gâtlejuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gâtlej","accusative-definite-nominative-singular":"gâtlejul","accusative-indefinite-nominative-plural":"gâtlejuri","accusative-definite-nominative-plural":"gâtlejurile","dative-genitive-indefinite-singular":"gâtlej","dative-definite-genitive-singular":"gâtlejului","dative-genitive-indefinite-plural":"gâtlejuri","dative-definite-genitive-plural":"gâtlejurilor","singular-vocative":"gâtlejule","plural-vocative":"gâtlejurilor"}},{"word":"gâtos","pos":"adj","definitions":["long-necked"],"forms":{"feminine-singular":"gâtoasă","masculine-plural":"gâtoși","feminine-neuter-plural":"gâtoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gâtos","error-unrecognized-form-feminine-indefinite-singular":"gâtoasă","error-unrecognized-form-indefinite-masculine-plural":"gâtoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gâtoase","definite-error-unrecognized-form-masculine-neuter-singular":"gâtosul","definite-error-unrecognized-form-feminine-singular":"gâtoasa","definite-error-unrecognized-form-masculine-plural":"gâtoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gâtoasele"}},{"word":"Gațu","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Gațu"}},{"word":"gâtui","pos":"verb","definitions":["to strangle, throttle, choke, garrotte"],"forms":{"canonical":"a gâtui 4th conjugation","present-singular-third-person":"gâtuie","participle-past":"gâtuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gâtui","gerund":"gâtuind","first-person-indicative-present-singular":"gâtui","indicative-present-second-person-singular":"gâtui","indicative-present-singular-third-person":"gâtuie","first-person-indicative-plural-present":"gâtuim","indicative-plural-present-second-person":"gâtuiți","indicative-plural-present-third-person":"gâtuie","first-person-imperfect-indicative-singular":"gâtuiam","imperfect-indicative-second-person-singular":"gâtuiai","imperfect-indicative-singular-third-person":"gâtuia","first-person-imperfect-indicative-plural":"gâtuiam","imperfect-indicative-plural-second-person":"gâtuiați","imperfect-indicative-plural-third-person":"gâtuiau","first-person-indicative-perfect-singular":"gâtuii","indicative-perfect-second-person-singular":"gâtuiși","indicative-perfect-singular-third-person":"gâtui","first-person-indicative-perfect-plural":"gâtuirăm","indicative-perfect-plural-second-person":"gâtuirăți","indicative-perfect-plural-third-person":"gâtuiră","first-person-indicative-pluperfect-singular":"gâtuisem","indicative-pluperfect-second-person-singular":"gâtuiseși","indicative-pluperfect-singular-third-person":"gâtuise","first-person-indicative-pluperfect-plural":"gâtuiserăm","indicative-pluperfect-plural-second-person":"gâtuiserăți","indicative-pluperfect-plural-third-person":"gâtuiseră","first-person-present-singular-subjunctive":"să gâtui","present-second-person-singular-subjunctive":"să gâtui","present-singular-subjunctive-third-person":"să gâtuie","first-person-plural-present-subjunctive":"să gâtuim","plural-present-second-person-subjunctive":"să gâtuiți","plural-present-subjunctive-third-person":"să gâtuie","imperative-second-person-singular":"gâtuie","imperative-plural-second-person":"gâtuiți","imperative-negative-second-person-singular":"nu gâtui","imperative-negative-plural-second-person":"nu gâtuiți"}},{"word":"gâtuială","pos":"noun","definitions":["strangulation"],"forms":{"plural":"gâtuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâtuială","accusative-definite-nominative-singular":"gâtuiala","accusative-indefinite-nominative-plural":"gâtuiele","accusative-definite-nominative-plural":"gâtuielele","dative-genitive-indefinite-singular":"gâtuiele","dative-definite-genitive-singular":"gâtuielei","dative-genitive-indefinite-plural":"gâtuiele","dative-definite-genitive-plural":"gâtuielelor","singular-vocative":"gâtuială","plural-vocative":"gâtuielelor"}},{"word":"gâtuire","pos":"noun","definitions":["strangulation"],"forms":{"plural":"gâtuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gâtuire","accusative-definite-nominative-singular":"gâtuirea","accusative-indefinite-nominative-plural":"gâtuiri","accusative-definite-nominative-plural":"gâtuirile","dative-genitive-indefinite-singular":"gâtuiri","dative-definite-genitive-singular":"gâtuirii","dative-genitive-indefinite-plural":"gâtuiri","dative-definite-genitive-plural":"gâtuirilor","singular-vocative":"gâtuire","plural-vocative":"gâtuirilor"}},{"word":"gâtuit","pos":"adj","definitions":["choked"],"forms":{"feminine-singular":"gâtuită","masculine-plural":"gâtuiți","feminine-neuter-plural":"gâtuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gâtuit","error-unrecognized-form-feminine-indefinite-singular":"gâtuită","error-unrecognized-form-indefinite-masculine-plural":"gâtuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gâtuite","definite-error-unrecognized-form-masculine-neuter-singular":"gâtuitul","definite-error-unrecognized-form-feminine-singular":"gâtuita","definite-error-unrecognized-form-masculine-plural":"gâtuiții","definite-error-unrecognized-form-feminine-neuter-plural":"gâtuitele"}},{"word":"gâtuit","pos":"verb","definitions":["past participle of gâtui"],"forms":{"participle-past":"of gâtui"}},{"word":"gâturi","pos":"noun","definitions":["plural of gât"]},{"word":"gaucho","pos":"noun","definitions":["gaucho"],"forms":{"plural":"gaucho","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gaucho","accusative-definite-nominative-singular":"gauchoul","accusative-indefinite-nominative-plural":"gaucho","accusative-definite-nominative-plural":"gauchoi","dative-genitive-indefinite-singular":"gaucho","dative-definite-genitive-singular":"gauchoului","dative-genitive-indefinite-plural":"gaucho","dative-definite-genitive-plural":"gaucholor","singular-vocative":"gauchoule","plural-vocative":"gaucholor"}},{"word":"Găujani","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Boișoara","a village in Ungheni, Argeș County, Romania","a commune of Giurgiu County, Romania","a village in Găujani, Giurgiu County, Romania","a village in Boișoara, Vâlcea County, Romania"],"gender":"m"},{"word":"gauleiter","pos":"noun","definitions":["gauleiter"],"forms":{"plural":"gauleiteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gauleiter","accusative-definite-nominative-singular":"gauleiterul","accusative-indefinite-nominative-plural":"gauleiteri","accusative-definite-nominative-plural":"gauleiterii","dative-genitive-indefinite-singular":"gauleiter","dative-definite-genitive-singular":"gauleiterului","dative-genitive-indefinite-plural":"gauleiteri","dative-definite-genitive-plural":"gauleiterilor","singular-vocative":"gauleiterule","plural-vocative":"gauleiterilor"}},{"word":"gaullism","pos":"noun","definitions":["Gaullism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gaullism","accusative-definite-nominative":"gaullismul","dative-genitive-indefinite":"gaullism","dative-definite-genitive":"gaullismului","vocative":"gaullismule"}},{"word":"gaullist","pos":"adj","definitions":["Gaullist"],"forms":{"feminine-singular":"gaullistă","masculine-plural":"gaulliști","feminine-neuter-plural":"gaulliste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gaullist","error-unrecognized-form-feminine-indefinite-singular":"gaullistă","error-unrecognized-form-indefinite-masculine-plural":"gaulliști","error-unrecognized-form-feminine-indefinite-neuter-plural":"gaulliste","definite-error-unrecognized-form-masculine-neuter-singular":"gaullistul","definite-error-unrecognized-form-feminine-singular":"gaullista","definite-error-unrecognized-form-masculine-plural":"gaulliștii","definite-error-unrecognized-form-feminine-neuter-plural":"gaullistele"}},{"word":"gaullist","pos":"noun","definitions":["Gaullist"],"forms":{"plural":"gaulliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gaullist","accusative-definite-nominative-singular":"gaullistul","accusative-indefinite-nominative-plural":"gaulliști","accusative-definite-nominative-plural":"gaulliștii","dative-genitive-indefinite-singular":"gaullist","dative-definite-genitive-singular":"gaullistului","dative-genitive-indefinite-plural":"gaulliști","dative-definite-genitive-plural":"gaulliștilor","singular-vocative":"gaullistule","plural-vocative":"gaulliștilor"}},{"word":"gaullistă","pos":"noun","definitions":["female equivalent of gaullist"],"forms":{"plural":"gaulliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gaullistă","accusative-definite-nominative-singular":"gaullista","accusative-indefinite-nominative-plural":"gaulliste","accusative-definite-nominative-plural":"gaullistele","dative-genitive-indefinite-singular":"gaulliste","dative-definite-genitive-singular":"gaullistei","dative-genitive-indefinite-plural":"gaulliste","dative-definite-genitive-plural":"gaullistelor","singular-vocative":"gaullistă","plural-vocative":"gaullistelor"}},{"word":"găun","pos":"noun","definitions":["hollow, hole, cavity"],"forms":{"plural":"găune","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găun","accusative-definite-nominative-singular":"găunul","accusative-indefinite-nominative-plural":"găune","accusative-definite-nominative-plural":"găunele","dative-genitive-indefinite-singular":"găun","dative-definite-genitive-singular":"găunului","dative-genitive-indefinite-plural":"găune","dative-definite-genitive-plural":"găunelor","singular-vocative":"găunule","plural-vocative":"găunelor","alternative-Bukovina-regional":"găună"}},{"word":"găun","pos":"noun","definitions":["synonym of gărgăun"],"forms":{"plural":"găune","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găun","accusative-definite-nominative-singular":"găunul","accusative-indefinite-nominative-plural":"găune","accusative-definite-nominative-plural":"găunele","dative-genitive-indefinite-singular":"găun","dative-definite-genitive-singular":"găunului","dative-genitive-indefinite-plural":"găune","dative-definite-genitive-plural":"găunelor","singular-vocative":"găunule","plural-vocative":"găunelor","alternative-Bukovina-regional":"găună"}},{"word":"găună","pos":"noun","definitions":["alternative form of găun"],"forms":{"plural":"găuni"}},{"word":"găunaș","pos":"noun","definitions":["diminutive of găun"],"forms":{"plural":"găunași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găunaș","accusative-definite-nominative-singular":"găunașul","accusative-indefinite-nominative-plural":"găunași","accusative-definite-nominative-plural":"găunașii","dative-genitive-indefinite-singular":"găunaș","dative-definite-genitive-singular":"găunașului","dative-genitive-indefinite-plural":"găunași","dative-definite-genitive-plural":"găunașilor","singular-vocative":"găunașule","plural-vocative":"găunașilor"}},{"word":"găunășită","pos":"noun","definitions":["diminutive of găunaș"],"forms":{"plural":"găunășițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găunășită","accusative-definite-nominative-singular":"găunășita","accusative-indefinite-nominative-plural":"găunășițe","accusative-definite-nominative-plural":"găunășițele","dative-genitive-indefinite-singular":"găunășițe","dative-definite-genitive-singular":"găunășiței","dative-genitive-indefinite-plural":"găunășițe","dative-definite-genitive-plural":"găunășițelor","singular-vocative":"găunășită","plural-vocative":"găunășițelor"}},{"word":"găunei","pos":"noun","definitions":["horsefly, gadfly"],"forms":{"plural":"găunei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găunei","accusative-definite-nominative-singular":"găuneiul","accusative-indefinite-nominative-plural":"găunei","accusative-definite-nominative-plural":"găuneii","dative-genitive-indefinite-singular":"găunei","dative-definite-genitive-singular":"găuneiului","dative-genitive-indefinite-plural":"găunei","dative-definite-genitive-plural":"găuneilor","singular-vocative":"găuneiule","plural-vocative":"găuneilor"}},{"word":"Găunoasa","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Bistrița","a river in Brașov, Romania, tributary to the Holbav"],"gender":"f"},{"word":"găunoi","pos":"noun","definitions":["augmentative of găun"],"forms":{"plural":"găunoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găunoi","accusative-definite-nominative-singular":"găunoiul","accusative-indefinite-nominative-plural":"găunoaie","accusative-definite-nominative-plural":"găunoaiele","dative-genitive-indefinite-singular":"găunoi","dative-definite-genitive-singular":"găunoiului","dative-genitive-indefinite-plural":"găunoaie","dative-definite-genitive-plural":"găunoaielor","singular-vocative":"găunoiule","plural-vocative":"găunoaielor"}},{"word":"găunos","pos":"adj","definitions":["shallow","inane","hollow, empty","sunken"],"pronunciation":"/ɡə.uˈnos/","forms":{"feminine-singular":"găunoasă","masculine-plural":"găunoși","feminine-neuter-plural":"găunoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găunos","error-unrecognized-form-feminine-indefinite-singular":"găunoasă","error-unrecognized-form-indefinite-masculine-plural":"găunoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"găunoase","definite-error-unrecognized-form-masculine-neuter-singular":"găunosul","definite-error-unrecognized-form-feminine-singular":"găunoasa","definite-error-unrecognized-form-masculine-plural":"găunoșii","definite-error-unrecognized-form-feminine-neuter-plural":"găunoasele"}},{"word":"găunoșătură","pos":"noun","definitions":["alternative form of găunoșitură"],"forms":{"plural":"găunoșături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"găunoșătură","accusative-definite-nominative-singular":"găunoșătura","accusative-indefinite-nominative-plural":"găunoșături","accusative-definite-nominative-plural":"găunoșăturile","dative-genitive-indefinite-singular":"găunoșături","dative-definite-genitive-singular":"găunoșăturii","dative-genitive-indefinite-plural":"găunoșături","dative-definite-genitive-plural":"găunoșăturilor","singular-vocative":"găunoșătură","plural-vocative":"găunoșăturilor"}},{"word":"găunoși","pos":"verb","definitions":["to become hollow"],"forms":{"canonical":"a găunoși 4th conjugation","present-singular-third-person":"găunoșește","participle-past":"găunoșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găunoși","gerund":"găunoșind","first-person-indicative-present-singular":"găunoșesc","indicative-present-second-person-singular":"găunoșești","indicative-present-singular-third-person":"găunoșește","first-person-indicative-plural-present":"găunoșim","indicative-plural-present-second-person":"găunoșiți","indicative-plural-present-third-person":"găunoșesc","first-person-imperfect-indicative-singular":"găunoșeam","imperfect-indicative-second-person-singular":"găunoșeai","imperfect-indicative-singular-third-person":"găunoșea","first-person-imperfect-indicative-plural":"găunoșeam","imperfect-indicative-plural-second-person":"găunoșeați","imperfect-indicative-plural-third-person":"găunoșeau","first-person-indicative-perfect-singular":"găunoșii","indicative-perfect-second-person-singular":"găunoșiși","indicative-perfect-singular-third-person":"găunoși","first-person-indicative-perfect-plural":"găunoșirăm","indicative-perfect-plural-second-person":"găunoșirăți","indicative-perfect-plural-third-person":"găunoșiră","first-person-indicative-pluperfect-singular":"găunoșisem","indicative-pluperfect-second-person-singular":"găunoșiseși","indicative-pluperfect-singular-third-person":"găunoșise","first-person-indicative-pluperfect-plural":"găunoșiserăm","indicative-pluperfect-plural-second-person":"găunoșiserăți","indicative-pluperfect-plural-third-person":"găunoșiseră","first-person-present-singular-subjunctive":"să găunoșesc","present-second-person-singular-subjunctive":"să găunoșești","present-singular-subjunctive-third-person":"să găunoșească","first-person-plural-present-subjunctive":"să găunoșim","plural-present-second-person-subjunctive":"să găunoșiți","plural-present-subjunctive-third-person":"să găunoșească","imperative-second-person-singular":"găunoșește","imperative-plural-second-person":"găunoșiți","imperative-negative-second-person-singular":"nu găunoși","imperative-negative-plural-second-person":"nu găunoșiți"}},{"word":"Găunoșița","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Găunoasa"],"gender":"f"},{"word":"găunoșitură","pos":"noun","definitions":["cavity"],"forms":{"plural":"găunoșituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"găunoșitură","accusative-definite-nominative-singular":"găunoșitura","accusative-indefinite-nominative-plural":"găunoșituri","accusative-definite-nominative-plural":"găunoșiturile","dative-genitive-indefinite-singular":"găunoșituri","dative-definite-genitive-singular":"găunoșiturii","dative-genitive-indefinite-plural":"găunoșituri","dative-definite-genitive-plural":"găunoșiturilor","singular-vocative":"găunoșitură","plural-vocative":"găunoșiturilor"}},{"word":"gaur","pos":"noun","definitions":["gaur"],"forms":{"plural":"gauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gaur","accusative-definite-nominative-singular":"gaurul","accusative-indefinite-nominative-plural":"gauri","accusative-definite-nominative-plural":"gaurii","dative-genitive-indefinite-singular":"gaur","dative-definite-genitive-singular":"gaurului","dative-genitive-indefinite-plural":"gauri","dative-definite-genitive-plural":"gaurilor","singular-vocative":"gaurule","plural-vocative":"gaurilor"}},{"word":"Gaura","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Șimon"],"gender":"f"},{"word":"gaura","pos":"noun","definitions":["definite nominative/accusative singular of gaură"],"pronunciation":"[ˈɡa.ura]","gender":"f"},{"word":"Gaură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gaură"}},{"word":"gaură","pos":"noun","definitions":["hole"],"forms":{"plural":"găuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gaură","accusative-definite-nominative-singular":"gaura","accusative-indefinite-nominative-plural":"găuri","accusative-definite-nominative-plural":"găurile","dative-genitive-indefinite-singular":"găuri","dative-definite-genitive-singular":"găurii","dative-genitive-indefinite-plural":"găuri","dative-definite-genitive-plural":"găurilor","singular-vocative":"gaură","plural-vocative":"găurilor"}},{"word":"gaura cheii","pos":"noun","definitions":["keyhole"]},{"word":"Gaura Dracului","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Olt"],"gender":"f"},{"word":"gaură neagră","pos":"noun","definitions":["black hole"],"pronunciation":"/ˈɡa.urəˈne̯aɡrə/","forms":{"plural":"găuri negre"}},{"word":"Gaura Sângerului","pos":"name","definitions":["a village in Zau de Câmpie, Mureș County, Romania"],"gender":"f"},{"word":"găurea","pos":"noun","definitions":["diminutive of gaură; small hole"],"forms":{"plural":"găurele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"găurea","accusative-definite-nominative-singular":"găureaua","accusative-indefinite-nominative-plural":"găurele","accusative-definite-nominative-plural":"găurelele","dative-genitive-indefinite-singular":"găurele","dative-definite-genitive-singular":"găurelei","dative-genitive-indefinite-plural":"găurele","dative-definite-genitive-plural":"găurelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"Găureana","pos":"name","definitions":["a river in Bacău County, Romania, tributary to the Trotuș"],"gender":"f"},{"word":"Găureni","pos":"name","definitions":["a village in Miroslava, Iași County, Romania"],"gender":"m"},{"word":"Găuri","pos":"name","definitions":["a river in Vâlcea County, Romania, tributary to the Lotru"],"gender":"m"},{"word":"găuri","pos":"verb","definitions":["to drill, bore, perforate, pierce make a hole"],"forms":{"canonical":"a găuri 4th conjugation","present-singular-third-person":"găurește","participle-past":"găurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găuri","gerund":"găurind","first-person-indicative-present-singular":"găuresc","indicative-present-second-person-singular":"găurești","indicative-present-singular-third-person":"găurește","first-person-indicative-plural-present":"găurim","indicative-plural-present-second-person":"găuriți","indicative-plural-present-third-person":"găuresc","first-person-imperfect-indicative-singular":"găuream","imperfect-indicative-second-person-singular":"găureai","imperfect-indicative-singular-third-person":"găurea","first-person-imperfect-indicative-plural":"găuream","imperfect-indicative-plural-second-person":"găureați","imperfect-indicative-plural-third-person":"găureau","first-person-indicative-perfect-singular":"găurii","indicative-perfect-second-person-singular":"găuriși","indicative-perfect-singular-third-person":"găuri","first-person-indicative-perfect-plural":"găurirăm","indicative-perfect-plural-second-person":"găurirăți","indicative-perfect-plural-third-person":"găuriră","first-person-indicative-pluperfect-singular":"găurisem","indicative-pluperfect-second-person-singular":"găuriseși","indicative-pluperfect-singular-third-person":"găurise","first-person-indicative-pluperfect-plural":"găuriserăm","indicative-pluperfect-plural-second-person":"găuriserăți","indicative-pluperfect-plural-third-person":"găuriseră","first-person-present-singular-subjunctive":"să găuresc","present-second-person-singular-subjunctive":"să găurești","present-singular-subjunctive-third-person":"să găurească","first-person-plural-present-subjunctive":"să găurim","plural-present-second-person-subjunctive":"să găuriți","plural-present-subjunctive-third-person":"să găurească","imperative-second-person-singular":"găurește","imperative-plural-second-person":"găuriți","imperative-negative-second-person-singular":"nu găuri","imperative-negative-plural-second-person":"nu găuriți"}},{"word":"găurică","pos":"noun","definitions":["diminutive of gaură; small hole"],"forms":{"plural":"găurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găurică","accusative-definite-nominative-singular":"găurica","accusative-indefinite-nominative-plural":"găurice","accusative-definite-nominative-plural":"găuricele","dative-genitive-indefinite-singular":"găurice","dative-definite-genitive-singular":"găuricei","dative-genitive-indefinite-plural":"găurice","dative-definite-genitive-plural":"găuricelor","singular-vocative":"găurică","plural-vocative":"găuricelor"}},{"word":"găurice","pos":"noun","definitions":["diminutive of gaură; small hole"],"forms":{"plural":"găurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"găurice","accusative-definite-nominative-singular":"găuricea","accusative-indefinite-nominative-plural":"găurici","accusative-definite-nominative-plural":"găuricile","dative-genitive-indefinite-singular":"găurici","dative-definite-genitive-singular":"găuricii","dative-genitive-indefinite-plural":"găurici","dative-definite-genitive-plural":"găuricilor","singular-vocative":"găurice","plural-vocative":"găuricilor"}},{"word":"găurire","pos":"noun","definitions":["piercing"],"forms":{"plural":"găuriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"găurire","accusative-definite-nominative-singular":"găurirea","accusative-indefinite-nominative-plural":"găuriri","accusative-definite-nominative-plural":"găuririle","dative-genitive-indefinite-singular":"găuriri","dative-definite-genitive-singular":"găuririi","dative-genitive-indefinite-plural":"găuriri","dative-definite-genitive-plural":"găuririlor","singular-vocative":"găurire","plural-vocative":"găuririlor"}},{"word":"găurit","pos":"adj","definitions":["pierced"],"forms":{"feminine-singular":"găurită","masculine-plural":"găuriți","feminine-neuter-plural":"găurite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găurit","error-unrecognized-form-feminine-indefinite-singular":"găurită","error-unrecognized-form-indefinite-masculine-plural":"găuriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"găurite","definite-error-unrecognized-form-masculine-neuter-singular":"găuritul","definite-error-unrecognized-form-feminine-singular":"găurita","definite-error-unrecognized-form-masculine-plural":"găuriții","definite-error-unrecognized-form-feminine-neuter-plural":"găuritele"}},{"word":"găuritoare","pos":"noun","definitions":["female equivalent of găuritor"],"forms":{"plural":"găuritoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"găuritoare","accusative-definite-nominative-singular":"găuritoarea","accusative-indefinite-nominative-plural":"găuritoare","accusative-definite-nominative-plural":"găuritoarele","dative-genitive-indefinite-singular":"găuritoare","dative-definite-genitive-singular":"găuritoarei","dative-genitive-indefinite-plural":"găuritoare","dative-definite-genitive-plural":"găuritoarelor","singular-vocative":"găuritoare","plural-vocative":"găuritoarelor"}},{"word":"găuritor","pos":"noun","definitions":["driller"],"forms":{"plural":"găuritori"}},{"word":"găuritură","pos":"noun","definitions":["perforation, hole, opening"],"forms":{"plural":"găurituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"găuritură","accusative-definite-nominative-singular":"găuritura","accusative-indefinite-nominative-plural":"găurituri","accusative-definite-nominative-plural":"găuriturile","dative-genitive-indefinite-singular":"găurituri","dative-definite-genitive-singular":"găuriturii","dative-genitive-indefinite-plural":"găurituri","dative-definite-genitive-plural":"găuriturilor","singular-vocative":"găuritură","plural-vocative":"găuriturilor"}},{"word":"găuroi","pos":"noun","definitions":["augmentative of gaură"],"forms":{"plural":"găuroaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găuroi","accusative-definite-nominative-singular":"găuroiul","accusative-indefinite-nominative-plural":"găuroaie","accusative-definite-nominative-plural":"găuroaiele","dative-genitive-indefinite-singular":"găuroi","dative-definite-genitive-singular":"găuroiului","dative-genitive-indefinite-plural":"găuroaie","dative-definite-genitive-plural":"găuroaielor","singular-vocative":"găuroiule","plural-vocative":"găuroaielor"}},{"word":"găuros","pos":"adj","definitions":["holey"],"forms":{"feminine-singular":"găuroasă","masculine-plural":"găuroși","feminine-neuter-plural":"găuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găuros","error-unrecognized-form-feminine-indefinite-singular":"găuroasă","error-unrecognized-form-indefinite-masculine-plural":"găuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"găuroase","definite-error-unrecognized-form-masculine-neuter-singular":"găurosul","definite-error-unrecognized-form-feminine-singular":"găuroasa","definite-error-unrecognized-form-masculine-plural":"găuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"găuroasele"}},{"word":"găuruță","pos":"noun","definitions":["diminutive of gaură"],"forms":{"plural":"găuruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găuruță","accusative-definite-nominative-singular":"găuruța","accusative-indefinite-nominative-plural":"găuruțe","accusative-definite-nominative-plural":"găuruțele","dative-genitive-indefinite-singular":"găuruțe","dative-definite-genitive-singular":"găuruței","dative-genitive-indefinite-plural":"găuruțe","dative-definite-genitive-plural":"găuruțelor","singular-vocative":"găuruță","plural-vocative":"găuruțelor"}},{"word":"gauss","pos":"noun","definitions":["gauss"],"forms":{"plural":"gauși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gauss","accusative-definite-nominative-singular":"gaussul","accusative-indefinite-nominative-plural":"gauși","accusative-definite-nominative-plural":"gaușii","dative-genitive-indefinite-singular":"gauss","dative-definite-genitive-singular":"gaussului","dative-genitive-indefinite-plural":"gauși","dative-definite-genitive-plural":"gaușilor","singular-vocative":"gaussule","plural-vocative":"gaușilor"}},{"word":"gaussmetru","pos":"noun","definitions":["gaussmeter"],"forms":{"plural":"gaussmetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gaussmetru","accusative-definite-nominative-singular":"gaussmetruul","accusative-indefinite-nominative-plural":"gaussmetre","accusative-definite-nominative-plural":"gaussmetrele","dative-genitive-indefinite-singular":"gaussmetru","dative-definite-genitive-singular":"gaussmetruului","dative-genitive-indefinite-plural":"gaussmetre","dative-definite-genitive-plural":"gaussmetrelor","singular-vocative":"gaussmetruule","plural-vocative":"gaussmetrelor"}},{"word":"Găuzeni","pos":"name","definitions":["a village in Găuzeni, Șoldănești Raion, Moldova","a commune of Șoldănești Raion, Moldova"],"gender":"m"},{"word":"gavaj","pos":"noun","definitions":["gavage"],"forms":{"plural":"gavaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gavaj","accusative-definite-nominative-singular":"gavajul","accusative-indefinite-nominative-plural":"gavaje","accusative-definite-nominative-plural":"gavajele","dative-genitive-indefinite-singular":"gavaj","dative-definite-genitive-singular":"gavajului","dative-genitive-indefinite-plural":"gavaje","dative-definite-genitive-plural":"gavajelor","singular-vocative":"gavajule","plural-vocative":"gavajelor"}},{"word":"găvălie","pos":"noun","definitions":["the inside of a hat"],"forms":{"plural":"găvălii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"găvălie","accusative-definite-nominative-singular":"găvălia","accusative-indefinite-nominative-plural":"găvălii","accusative-definite-nominative-plural":"găvăliile","dative-genitive-indefinite-singular":"găvălii","dative-definite-genitive-singular":"găvăliei","dative-genitive-indefinite-plural":"găvălii","dative-definite-genitive-plural":"găvăliilor","singular-vocative":"găvălie","plural-vocative":"găvăliilor"}},{"word":"Găvan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Găvan"}},{"word":"găvan","pos":"noun","definitions":["eye socket","cavity","wooden bowl"],"forms":{"plural":"găvane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găvan","accusative-definite-nominative-singular":"găvanul","accusative-indefinite-nominative-plural":"găvane","accusative-definite-nominative-plural":"găvanele","dative-genitive-indefinite-singular":"găvan","dative-definite-genitive-singular":"găvanului","dative-genitive-indefinite-plural":"găvane","dative-definite-genitive-plural":"găvanelor","singular-vocative":"găvanule","plural-vocative":"găvanelor"}},{"word":"găvănat","pos":"adj","definitions":["hollowed"],"forms":{"feminine-singular":"găvănată","masculine-plural":"găvănați","feminine-neuter-plural":"găvănate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găvănat","error-unrecognized-form-feminine-indefinite-singular":"găvănată","error-unrecognized-form-indefinite-masculine-plural":"găvănați","error-unrecognized-form-feminine-indefinite-neuter-plural":"găvănate","definite-error-unrecognized-form-masculine-neuter-singular":"găvănatul","definite-error-unrecognized-form-feminine-singular":"găvănata","definite-error-unrecognized-form-masculine-plural":"găvănații","definite-error-unrecognized-form-feminine-neuter-plural":"găvănatele"}},{"word":"găvănat","pos":"verb","definitions":["past participle of găvăna"],"forms":{"participle-past":"of găvăna"}},{"word":"găvănătură","pos":"noun","definitions":["cavity"],"forms":{"plural":"găvănături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"găvănătură","accusative-definite-nominative-singular":"găvănătura","accusative-indefinite-nominative-plural":"găvănături","accusative-definite-nominative-plural":"găvănăturile","dative-genitive-indefinite-singular":"găvănături","dative-definite-genitive-singular":"găvănăturii","dative-genitive-indefinite-plural":"găvănături","dative-definite-genitive-plural":"găvănăturilor","singular-vocative":"găvănătură","plural-vocative":"găvănăturilor"}},{"word":"Găvănel","pos":"name","definitions":["a village in Dumbrăvești, Prahova County, Romania"],"gender":"m"},{"word":"Găvanele","pos":"name","definitions":["a village in Bozioru, Buzău County, Romania"],"gender":"m"},{"word":"Găvănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Găvănescu"}},{"word":"Găvăneșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Găvăneșteanu"}},{"word":"Găvănești","pos":"name","definitions":["a village in Săgeata, Buzău County, Romania","a village in Bălești, Gorj County, Romania","a commune of Olt County, Romania","a village in Găvănești, Olt County, Romania","a village in Muereasca, Vâlcea County, Romania"],"gender":"m"},{"word":"Găvani","pos":"name","definitions":["a village in Gemenele, Brăila County, Romania"],"gender":"m"},{"word":"Găvănoasa","pos":"name","definitions":["a village in Găvănoasa, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"f"},{"word":"gavanos","pos":"noun","definitions":["jar"],"forms":{"plural":"gavanoase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gavanos","accusative-definite-nominative-singular":"gavanosul","accusative-indefinite-nominative-plural":"gavanoase","accusative-definite-nominative-plural":"gavanoasele","dative-genitive-indefinite-singular":"gavanos","dative-definite-genitive-singular":"gavanosului","dative-genitive-indefinite-plural":"gavanoase","dative-definite-genitive-plural":"gavanoaselor","singular-vocative":"gavanosule","plural-vocative":"gavanoaselor"}},{"word":"gavanoșel","pos":"noun","definitions":["alternative form of găvănoșel"],"forms":{"plural":"gavanoșele"}},{"word":"găvănoșel","pos":"noun","definitions":["diminutive of gavanos"],"forms":{"plural":"găvănoșele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găvănoșel","accusative-definite-nominative-singular":"găvănoșelul","accusative-indefinite-nominative-plural":"găvănoșele","accusative-definite-nominative-plural":"găvănoșelele","dative-genitive-indefinite-singular":"găvănoșel","dative-definite-genitive-singular":"găvănoșelului","dative-genitive-indefinite-plural":"găvănoșele","dative-definite-genitive-plural":"găvănoșelelor","singular-vocative":"găvănoșelule","plural-vocative":"găvănoșelelor"}},{"word":"găvănoșit","pos":"adj","definitions":["hollowed"],"forms":{"feminine-singular":"găvănoșită","masculine-plural":"găvănoșiți","feminine-neuter-plural":"găvănoșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găvănoșit","error-unrecognized-form-feminine-indefinite-singular":"găvănoșită","error-unrecognized-form-indefinite-masculine-plural":"găvănoșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"găvănoșite","definite-error-unrecognized-form-masculine-neuter-singular":"găvănoșitul","definite-error-unrecognized-form-feminine-singular":"găvănoșita","definite-error-unrecognized-form-masculine-plural":"găvănoșiții","definite-error-unrecognized-form-feminine-neuter-plural":"găvănoșitele"}},{"word":"găvănoșit","pos":"verb","definitions":["past participle of găvănoși"],"forms":{"participle-past":"of găvănoși"}},{"word":"Găvanu","pos":"name","definitions":["a village in Bogdana, Vaslui County, Romania"],"gender":"m"},{"word":"găvanul","pos":"noun","definitions":["definite nominative/accusative singular of găvan"]},{"word":"gavial","pos":"noun","definitions":["gavial"],"pronunciation":"/ɡaviˈal/","forms":{"plural":"gaviali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gavial","accusative-definite-nominative-singular":"gavialul","accusative-indefinite-nominative-plural":"gaviali","accusative-definite-nominative-plural":"gavialii","dative-genitive-indefinite-singular":"gavial","dative-definite-genitive-singular":"gavialului","dative-genitive-indefinite-plural":"gaviali","dative-definite-genitive-plural":"gavialilor","singular-vocative":"gavialule","plural-vocative":"gavialilor"}},{"word":"gaviali","pos":"noun","definitions":["indefinite plural of gavial"],"pronunciation":"[ɡaviˈalʲ]","gender":"m"},{"word":"Gavojdia","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Gavojdia, Timiș County, Romania"],"gender":"f"},{"word":"Găvojdia","pos":"name","definitions":["a river in Timiș County, Romania, tributary to the Timiș"],"gender":"f"},{"word":"Găvojdian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Găvojdian"}},{"word":"gavotă","pos":"noun","definitions":["gavotte"],"forms":{"plural":"gavote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gavotă","accusative-definite-nominative-singular":"gavota","accusative-indefinite-nominative-plural":"gavote","accusative-definite-nominative-plural":"gavotele","dative-genitive-indefinite-singular":"gavote","dative-definite-genitive-singular":"gavotei","dative-genitive-indefinite-plural":"gavote","dative-definite-genitive-plural":"gavotelor","singular-vocative":"gavotă","plural-vocative":"gavotelor"}},{"word":"găvozd","pos":"noun","definitions":["iron nail"],"forms":{"plural":"găvoazde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"găvozd","accusative-definite-nominative-singular":"găvozdul","accusative-indefinite-nominative-plural":"găvoazde","accusative-definite-nominative-plural":"găvoazdele","dative-genitive-indefinite-singular":"găvozd","dative-definite-genitive-singular":"găvozdului","dative-genitive-indefinite-plural":"găvoazde","dative-definite-genitive-plural":"găvoazdelor","singular-vocative":"găvozdule","plural-vocative":"găvoazdelor"}},{"word":"găvozdi","pos":"verb","definitions":["to hide","to cram","to nail down"],"forms":{"canonical":"a găvozdi 4th conjugation","present-singular-third-person":"găvozdește","participle-past":"găvozdit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găvozdi","gerund":"găvozdind","first-person-indicative-present-singular":"găvozdesc","indicative-present-second-person-singular":"găvozdești","indicative-present-singular-third-person":"găvozdește","first-person-indicative-plural-present":"găvozdim","indicative-plural-present-second-person":"găvozdiți","indicative-plural-present-third-person":"găvozdesc","first-person-imperfect-indicative-singular":"găvozdeam","imperfect-indicative-second-person-singular":"găvozdeai","imperfect-indicative-singular-third-person":"găvozdea","first-person-imperfect-indicative-plural":"găvozdeam","imperfect-indicative-plural-second-person":"găvozdeați","imperfect-indicative-plural-third-person":"găvozdeau","first-person-indicative-perfect-singular":"găvozdii","indicative-perfect-second-person-singular":"găvozdiși","indicative-perfect-singular-third-person":"găvozdi","first-person-indicative-perfect-plural":"găvozdirăm","indicative-perfect-plural-second-person":"găvozdirăți","indicative-perfect-plural-third-person":"găvozdiră","first-person-indicative-pluperfect-singular":"găvozdisem","indicative-pluperfect-second-person-singular":"găvozdiseși","indicative-pluperfect-singular-third-person":"găvozdise","first-person-indicative-pluperfect-plural":"găvozdiserăm","indicative-pluperfect-plural-second-person":"găvozdiserăți","indicative-pluperfect-plural-third-person":"găvozdiseră","first-person-present-singular-subjunctive":"să găvozdesc","present-second-person-singular-subjunctive":"să găvozdești","present-singular-subjunctive-third-person":"să găvozdească","first-person-plural-present-subjunctive":"să găvozdim","plural-present-second-person-subjunctive":"să găvozdiți","plural-present-subjunctive-third-person":"să găvozdească","imperative-second-person-singular":"găvozdește","imperative-plural-second-person":"găvozdiți","imperative-negative-second-person-singular":"nu găvozdi","imperative-negative-plural-second-person":"nu găvozdiți"}},{"word":"găvozdit","pos":"adj","definitions":["crammed"],"forms":{"feminine-singular":"găvozdită","masculine-plural":"găvozdiți","feminine-neuter-plural":"găvozdite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găvozdit","error-unrecognized-form-feminine-indefinite-singular":"găvozdită","error-unrecognized-form-indefinite-masculine-plural":"găvozdiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"găvozdite","definite-error-unrecognized-form-masculine-neuter-singular":"găvozditul","definite-error-unrecognized-form-feminine-singular":"găvozdita","definite-error-unrecognized-form-masculine-plural":"găvozdiții","definite-error-unrecognized-form-feminine-neuter-plural":"găvozditele"}},{"word":"găvozdit","pos":"verb","definitions":["past participle of găvozdi"],"forms":{"participle-past":"of găvozdi"}},{"word":"găvozit","pos":"adj","definitions":["yawning"],"forms":{"feminine-singular":"găvozită","masculine-plural":"găvoziți","feminine-neuter-plural":"găvozite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găvozit","error-unrecognized-form-feminine-indefinite-singular":"găvozită","error-unrecognized-form-indefinite-masculine-plural":"găvoziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"găvozite","definite-error-unrecognized-form-masculine-neuter-singular":"găvozitul","definite-error-unrecognized-form-feminine-singular":"găvozita","definite-error-unrecognized-form-masculine-plural":"găvoziții","definite-error-unrecognized-form-feminine-neuter-plural":"găvozitele"}},{"word":"Gavril","pos":"name","definitions":["a male given name","a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavril"}},{"word":"Gavrilaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavrilaș"}},{"word":"Gavrilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gavrilescu"}},{"word":"Gavrileț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavrileț"}},{"word":"Gavrilică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavrilică"}},{"word":"Gavriliță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavriliță"}},{"word":"Gavriliuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Gavriliuc"}},{"word":"Gavriloae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Gavriloae"}},{"word":"Gavriloaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Gavriloaia"}},{"word":"Gavriloi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gavriloi"}},{"word":"Gavriloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gavriloiu"}},{"word":"Gavrilovca","pos":"name","definitions":["a village in Copăceni, Sîngerei Raion, Moldova"],"gender":"f"},{"word":"Gavriluș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavriluș"}},{"word":"Gavriluț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavriluț"}},{"word":"Găvriluț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Găvriluț"}},{"word":"Gavriluță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gavriluță"}},{"word":"Gavriș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Gavriș"}},{"word":"Gavrișiu","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Gavrișiu"}},{"word":"gay","pos":"adj","definitions":["gay"],"pronunciation":"[ɡej]","examples":[{"ro":"Homomasculinitatea este un termen care se referă la o subcultură de bărbați gay care se auto-identifică cu rolul de gen și cultura stereotipului masculinității tradiționale.","en":"Homomasculinity is a term that refers to a subculture of gay men who self-identify with the gender roles and culture of the stereotype of traditional masculinity."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gay","error-unrecognized-form-feminine-indefinite-singular":"gay","error-unrecognized-form-indefinite-masculine-plural":"gay","error-unrecognized-form-feminine-indefinite-neuter-plural":"gay","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"gaz","pos":"noun","definitions":["gas (state of matter)"],"forms":{"plural":"gaze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gaz","accusative-definite-nominative-singular":"gazul","accusative-indefinite-nominative-plural":"gaze","accusative-definite-nominative-plural":"gazele","dative-genitive-indefinite-singular":"gaz","dative-definite-genitive-singular":"gazului","dative-genitive-indefinite-plural":"gaze","dative-definite-genitive-plural":"gazelor","singular-vocative":"gazule","plural-vocative":"gazelor"}},{"word":"gaz aerian","pos":"noun","definitions":["air gas"]},{"word":"gaz cu efect de seră","pos":"noun","definitions":["greenhouse gas"],"forms":{"plural":"gaze cu efect de seră"}},{"word":"gaz ideal","pos":"noun","definitions":["ideal gas"],"forms":{"plural":"gaze ideale"}},{"word":"gaz ilariant","pos":"noun","definitions":["laughing gas"]},{"word":"gaz muștar","pos":"noun","definitions":["mustard gas"]},{"word":"gaz natural","pos":"noun","definitions":["natural gas"],"forms":{"plural":"gaze naturale"}},{"word":"gaz nobil","pos":"noun","definitions":["noble gas"],"forms":{"plural":"gaze nobile"}},{"word":"gaza","pos":"verb","definitions":["to gas"],"forms":{"canonical":"a gaza 1st conjugation","present-singular-third-person":"gazează","participle-past":"gazat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gaza","gerund":"gazând","first-person-indicative-present-singular":"gazez","indicative-present-second-person-singular":"gazezi","indicative-present-singular-third-person":"gazează","first-person-indicative-plural-present":"gazăm","indicative-plural-present-second-person":"gazați","indicative-plural-present-third-person":"gazează","first-person-imperfect-indicative-singular":"gazam","imperfect-indicative-second-person-singular":"gazai","imperfect-indicative-singular-third-person":"gaza","first-person-imperfect-indicative-plural":"gazam","imperfect-indicative-plural-second-person":"gazați","imperfect-indicative-plural-third-person":"gazau","first-person-indicative-perfect-singular":"gazai","indicative-perfect-second-person-singular":"gazași","indicative-perfect-singular-third-person":"gază","first-person-indicative-perfect-plural":"gazarăm","indicative-perfect-plural-second-person":"gazarăți","indicative-perfect-plural-third-person":"gazară","first-person-indicative-pluperfect-singular":"gazasem","indicative-pluperfect-second-person-singular":"gazaseși","indicative-pluperfect-singular-third-person":"gazase","first-person-indicative-pluperfect-plural":"gazaserăm","indicative-pluperfect-plural-second-person":"gazaserăți","indicative-pluperfect-plural-third-person":"gazaseră","first-person-present-singular-subjunctive":"să gazez","present-second-person-singular-subjunctive":"să gazezi","present-singular-subjunctive-third-person":"să gazeze","first-person-plural-present-subjunctive":"să gazăm","plural-present-second-person-subjunctive":"să gazați","plural-present-subjunctive-third-person":"să gazeze","imperative-second-person-singular":"gazează","imperative-plural-second-person":"gazați","imperative-negative-second-person-singular":"nu gaza","imperative-negative-plural-second-person":"nu gazați"}},{"word":"Gâză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gâză"}},{"word":"gâză","pos":"noun","definitions":["insect"],"forms":{"plural":"gâze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâză","accusative-definite-nominative-singular":"gâza","accusative-indefinite-nominative-plural":"gâze","accusative-definite-nominative-plural":"gâzele","dative-genitive-indefinite-singular":"gâze","dative-definite-genitive-singular":"gâzei","dative-genitive-indefinite-plural":"gâze","dative-definite-genitive-plural":"gâzelor","singular-vocative":"gâză","plural-vocative":"gâzelor"}},{"word":"gazai","pos":"verb","definitions":["inflection of gaza:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ɡaˈzaj]"},{"word":"gazam","pos":"verb","definitions":["first-person singular and first-person plural imperfect indicative of gaza"],"pronunciation":"[ɡaˈzam]"},{"word":"găzar","pos":"noun","definitions":["seller of lampante olive oil"],"forms":{"plural":"găzari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzar","accusative-definite-nominative-singular":"găzarul","accusative-indefinite-nominative-plural":"găzari","accusative-definite-nominative-plural":"găzarii","dative-genitive-indefinite-singular":"găzar","dative-definite-genitive-singular":"găzarului","dative-genitive-indefinite-plural":"găzari","dative-definite-genitive-plural":"găzarilor","singular-vocative":"găzarule","plural-vocative":"găzarilor"}},{"word":"gazare","pos":"noun","definitions":["gassing (action of gassing)"],"examples":[{"ro":"Dacă își amintește dl Mihai Antonescu că a venit de la Cartierul General german un colonel specialist în materie de gazare.","en":null}],"forms":{"plural":"gazări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gazare","accusative-definite-nominative-singular":"gazarea","accusative-indefinite-nominative-plural":"gazări","accusative-definite-nominative-plural":"gazările","dative-genitive-indefinite-singular":"gazări","dative-definite-genitive-singular":"gazării","dative-genitive-indefinite-plural":"gazări","dative-definite-genitive-plural":"gazărilor","singular-vocative":"gazare","plural-vocative":"gazărilor"}},{"word":"Găzărie","pos":"name","definitions":["a locality in Moinești, Bacău County, Romania"],"gender":"m"},{"word":"găzărie","pos":"noun","definitions":["kerosene shop"],"forms":{"plural":"găzării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"găzărie","accusative-definite-nominative-singular":"găzăria","accusative-indefinite-nominative-plural":"găzării","accusative-definite-nominative-plural":"găzăriile","dative-genitive-indefinite-singular":"găzării","dative-definite-genitive-singular":"găzăriei","dative-genitive-indefinite-plural":"găzării","dative-definite-genitive-plural":"găzăriilor","singular-vocative":"găzărie","plural-vocative":"găzăriilor"}},{"word":"gazat","pos":"adj","definitions":["gased"],"forms":{"feminine-singular":"gazată","masculine-plural":"gazați","feminine-neuter-plural":"gazate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazat","error-unrecognized-form-feminine-indefinite-singular":"gazată","error-unrecognized-form-indefinite-masculine-plural":"gazați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazate","definite-error-unrecognized-form-masculine-neuter-singular":"gazatul","definite-error-unrecognized-form-feminine-singular":"gazata","definite-error-unrecognized-form-masculine-plural":"gazații","definite-error-unrecognized-form-feminine-neuter-plural":"gazatele"}},{"word":"gazbeton","pos":"noun","definitions":["aerated concrete"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gazbeton","accusative-definite-nominative":"gazbetonul","dative-genitive-indefinite":"gazbeton","dative-definite-genitive":"gazbetonului","vocative":"gazbetonule"}},{"word":"Gazdă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gazdă"}},{"word":"gazdă","pos":"noun","definitions":["host"],"forms":{"plural":"gazde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazdă","accusative-definite-nominative-singular":"gazda","accusative-indefinite-nominative-plural":"gazde","accusative-definite-nominative-plural":"gazdele","dative-genitive-indefinite-singular":"gazde","dative-definite-genitive-singular":"gazdei","dative-genitive-indefinite-plural":"gazde","dative-definite-genitive-plural":"gazdelor","singular-vocative":"gazdă","plural-vocative":"gazdelor"}},{"word":"Găzdac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Găzdac"}},{"word":"găzdac","pos":"noun","definitions":["host"],"forms":{"plural":"găzdaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzdac","accusative-definite-nominative-singular":"găzdacul","accusative-indefinite-nominative-plural":"găzdaci","accusative-definite-nominative-plural":"găzdacii","dative-genitive-indefinite-singular":"găzdac","dative-definite-genitive-singular":"găzdacului","dative-genitive-indefinite-plural":"găzdaci","dative-definite-genitive-plural":"găzdacilor","singular-vocative":"găzdacule","plural-vocative":"găzdacilor"}},{"word":"găzdăcie","pos":"noun","definitions":["wealth, richness"],"forms":{"plural":"găzdăcii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"găzdăcie","accusative-definite-nominative-singular":"găzdăcia","accusative-indefinite-nominative-plural":"găzdăcii","accusative-definite-nominative-plural":"găzdăciile","dative-genitive-indefinite-singular":"găzdăcii","dative-definite-genitive-singular":"găzdăciei","dative-genitive-indefinite-plural":"găzdăcii","dative-definite-genitive-plural":"găzdăciilor","singular-vocative":"găzdăcie","plural-vocative":"găzdăciilor"}},{"word":"găzdăcoi","pos":"noun","definitions":["rich man"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"găzdăcoi","accusative-definite-nominative":"găzdăcoiul","dative-genitive-indefinite":"găzdăcoi","dative-definite-genitive":"găzdăcoiului","vocative":"găzdăcoiule"}},{"word":"găzdan","pos":"noun","definitions":["rich man"],"forms":{"plural":"găzdani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzdan","accusative-definite-nominative-singular":"găzdanul","accusative-indefinite-nominative-plural":"găzdani","accusative-definite-nominative-plural":"găzdanii","dative-genitive-indefinite-singular":"găzdan","dative-definite-genitive-singular":"găzdanului","dative-genitive-indefinite-plural":"găzdani","dative-definite-genitive-plural":"găzdanilor","singular-vocative":"găzdanule","plural-vocative":"găzdanilor"}},{"word":"găzdaș","pos":"noun","definitions":["host"],"forms":{"plural":"găzdași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzdaș","accusative-definite-nominative-singular":"găzdașul","accusative-indefinite-nominative-plural":"găzdași","accusative-definite-nominative-plural":"găzdașii","dative-genitive-indefinite-singular":"găzdaș","dative-definite-genitive-singular":"găzdașului","dative-genitive-indefinite-plural":"găzdași","dative-definite-genitive-plural":"găzdașilor","singular-vocative":"găzdașule","plural-vocative":"găzdașilor"}},{"word":"găzdășag","pos":"noun","definitions":["wealth (riches; valuable material possessions)"],"forms":{"plural":"găzdășaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"găzdășag","accusative-definite-nominative-singular":"găzdășagul","accusative-indefinite-nominative-plural":"găzdășaguri","accusative-definite-nominative-plural":"găzdășagurile","dative-genitive-indefinite-singular":"găzdășag","dative-definite-genitive-singular":"găzdășagului","dative-genitive-indefinite-plural":"găzdășaguri","dative-definite-genitive-plural":"găzdășagurilor","singular-vocative":"găzdășagule","plural-vocative":"găzdășagurilor"}},{"word":"găzdășie","pos":"noun","definitions":["wealth"],"forms":{"plural":"găzdășii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"găzdășie","accusative-definite-nominative-singular":"găzdășia","accusative-indefinite-nominative-plural":"găzdășii","accusative-definite-nominative-plural":"găzdășiile","dative-genitive-indefinite-singular":"găzdășii","dative-definite-genitive-singular":"găzdășiei","dative-genitive-indefinite-plural":"găzdășii","dative-definite-genitive-plural":"găzdășiilor","singular-vocative":"găzdășie","plural-vocative":"găzdășiilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"găzdișoară","pos":"noun","definitions":["diminutive of gazdă"],"forms":{"plural":"găzdișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găzdișoară","accusative-definite-nominative-singular":"găzdișoara","accusative-indefinite-nominative-plural":"găzdișoare","accusative-definite-nominative-plural":"găzdișoarele","dative-genitive-indefinite-singular":"găzdișoare","dative-definite-genitive-singular":"găzdișoarei","dative-genitive-indefinite-plural":"găzdișoare","dative-definite-genitive-plural":"găzdișoarelor","singular-vocative":"găzdișoară","plural-vocative":"găzdișoarelor"}},{"word":"găzdiță","pos":"noun","definitions":["diminutive of gazdă"],"forms":{"plural":"găzdițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găzdiță","accusative-definite-nominative-singular":"găzdița","accusative-indefinite-nominative-plural":"găzdițe","accusative-definite-nominative-plural":"găzdițele","dative-genitive-indefinite-singular":"găzdițe","dative-definite-genitive-singular":"găzdiței","dative-genitive-indefinite-plural":"găzdițe","dative-definite-genitive-plural":"găzdițelor","singular-vocative":"găzdiță","plural-vocative":"găzdițelor"}},{"word":"găzdoaică","pos":"noun","definitions":["female equivalent of gazdă"],"forms":{"plural":"găzdoaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"găzdoaică","accusative-definite-nominative-singular":"găzdoaica","accusative-indefinite-nominative-plural":"găzdoaice","accusative-definite-nominative-plural":"găzdoaicele","dative-genitive-indefinite-singular":"găzdoaice","dative-definite-genitive-singular":"găzdoaicei","dative-genitive-indefinite-plural":"găzdoaice","dative-definite-genitive-plural":"găzdoaicelor","singular-vocative":"găzdoaică","plural-vocative":"găzdoaicelor"}},{"word":"Găzdoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Găzdoi"}},{"word":"găzdoi","pos":"noun","definitions":["augmentative of gazdă"],"forms":{"plural":"găzdoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzdoi","accusative-definite-nominative-singular":"găzdoiul","accusative-indefinite-nominative-plural":"găzdoi","accusative-definite-nominative-plural":"găzdoii","dative-genitive-indefinite-singular":"găzdoi","dative-definite-genitive-singular":"găzdoiului","dative-genitive-indefinite-plural":"găzdoi","dative-definite-genitive-plural":"găzdoilor","singular-vocative":"găzdoiule","plural-vocative":"găzdoilor"}},{"word":"găzdui","pos":"verb","definitions":["to accommodate, to host"],"forms":{"canonical":"a găzdui 4th conjugation","present-singular-third-person":"găzduiește","participle-past":"găzduit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a găzdui","gerund":"găzduind","first-person-indicative-present-singular":"găzduiesc","indicative-present-second-person-singular":"găzduiești","indicative-present-singular-third-person":"găzduiește","first-person-indicative-plural-present":"găzduim","indicative-plural-present-second-person":"găzduiți","indicative-plural-present-third-person":"găzduiesc","first-person-imperfect-indicative-singular":"găzduiam","imperfect-indicative-second-person-singular":"găzduiai","imperfect-indicative-singular-third-person":"găzduia","first-person-imperfect-indicative-plural":"găzduiam","imperfect-indicative-plural-second-person":"găzduiați","imperfect-indicative-plural-third-person":"găzduiau","first-person-indicative-perfect-singular":"găzduii","indicative-perfect-second-person-singular":"găzduiși","indicative-perfect-singular-third-person":"găzdui","first-person-indicative-perfect-plural":"găzduirăm","indicative-perfect-plural-second-person":"găzduirăți","indicative-perfect-plural-third-person":"găzduiră","first-person-indicative-pluperfect-singular":"găzduisem","indicative-pluperfect-second-person-singular":"găzduiseși","indicative-pluperfect-singular-third-person":"găzduise","first-person-indicative-pluperfect-plural":"găzduiserăm","indicative-pluperfect-plural-second-person":"găzduiserăți","indicative-pluperfect-plural-third-person":"găzduiseră","first-person-present-singular-subjunctive":"să găzduiesc","present-second-person-singular-subjunctive":"să găzduiești","present-singular-subjunctive-third-person":"să găzduiască","first-person-plural-present-subjunctive":"să găzduim","plural-present-second-person-subjunctive":"să găzduiți","plural-present-subjunctive-third-person":"să găzduiască","imperative-second-person-singular":"găzduiește","imperative-plural-second-person":"găzduiți","imperative-negative-second-person-singular":"nu găzdui","imperative-negative-plural-second-person":"nu găzduiți"}},{"word":"găzduire","pos":"noun","definitions":["accommodation"],"forms":{"plural":"găzduiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"găzduire","accusative-definite-nominative-singular":"găzduirea","accusative-indefinite-nominative-plural":"găzduiri","accusative-definite-nominative-plural":"găzduirile","dative-genitive-indefinite-singular":"găzduiri","dative-definite-genitive-singular":"găzduirii","dative-genitive-indefinite-plural":"găzduiri","dative-definite-genitive-plural":"găzduirilor","singular-vocative":"găzduire","plural-vocative":"găzduirilor"}},{"word":"găzduitor","pos":"noun","definitions":["host"],"forms":{"plural":"găzduitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"găzduitor","accusative-definite-nominative-singular":"găzduitorul","accusative-indefinite-nominative-plural":"găzduitori","accusative-definite-nominative-plural":"găzduitorii","dative-genitive-indefinite-singular":"găzduitor","dative-definite-genitive-singular":"găzduitorului","dative-genitive-indefinite-plural":"găzduitori","dative-definite-genitive-plural":"găzduitorilor","singular-vocative":"găzduitorule","plural-vocative":"găzduitorilor"}},{"word":"găzduț","pos":"adj","definitions":["diminutive of gazdă"],"forms":{"feminine-singular":"găzduță","masculine-plural":"găzduți","feminine-neuter-plural":"găzduțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"găzduț","error-unrecognized-form-feminine-indefinite-singular":"găzduță","error-unrecognized-form-indefinite-masculine-plural":"găzduți","error-unrecognized-form-feminine-indefinite-neuter-plural":"găzduțe","definite-error-unrecognized-form-masculine-neuter-singular":"găzduțul","definite-error-unrecognized-form-feminine-singular":"găzduța","definite-error-unrecognized-form-masculine-plural":"găzduții","definite-error-unrecognized-form-feminine-neuter-plural":"găzduțele"}},{"word":"gaze","pos":"noun","definitions":["indefinite plural of gaz"],"pronunciation":"[ˈɡaze]","gender":"n"},{"word":"gazeifica","pos":"verb","definitions":["alternative form of gazifica"],"forms":{"canonical":"a gazeifica 1st conjugation","present-singular-third-person":"gazeifică","participle-past":"gazeificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gazeifica","gerund":"gazeificând","first-person-indicative-present-singular":"gazeific","indicative-present-second-person-singular":"gazeifici","indicative-present-singular-third-person":"gazeifică","first-person-indicative-plural-present":"gazeificăm","indicative-plural-present-second-person":"gazeificați","indicative-plural-present-third-person":"gazeifică","first-person-imperfect-indicative-singular":"gazeificam","imperfect-indicative-second-person-singular":"gazeificai","imperfect-indicative-singular-third-person":"gazeifica","first-person-imperfect-indicative-plural":"gazeificam","imperfect-indicative-plural-second-person":"gazeificați","imperfect-indicative-plural-third-person":"gazeificau","first-person-indicative-perfect-singular":"gazeificai","indicative-perfect-second-person-singular":"gazeificași","indicative-perfect-singular-third-person":"gazeifică","first-person-indicative-perfect-plural":"gazeificarăm","indicative-perfect-plural-second-person":"gazeificarăți","indicative-perfect-plural-third-person":"gazeificară","first-person-indicative-pluperfect-singular":"gazeificasem","indicative-pluperfect-second-person-singular":"gazeificaseși","indicative-pluperfect-singular-third-person":"gazeificase","first-person-indicative-pluperfect-plural":"gazeificaserăm","indicative-pluperfect-plural-second-person":"gazeificaserăți","indicative-pluperfect-plural-third-person":"gazeificaseră","first-person-present-singular-subjunctive":"să gazeific","present-second-person-singular-subjunctive":"să gazeifici","present-singular-subjunctive-third-person":"să gazeifice","first-person-plural-present-subjunctive":"să gazeificăm","plural-present-second-person-subjunctive":"să gazeificați","plural-present-subjunctive-third-person":"să gazeifice","imperative-second-person-singular":"gazeifică","imperative-plural-second-person":"gazeificați","imperative-negative-second-person-singular":"nu gazeifica","imperative-negative-plural-second-person":"nu gazeificați"}},{"word":"gazeificare","pos":"noun","definitions":["alternative form of gazificare"],"forms":{"plural":"gazeificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gazeificare","accusative-definite-nominative-singular":"gazeificarea","accusative-indefinite-nominative-plural":"gazeificări","accusative-definite-nominative-plural":"gazeificările","dative-genitive-indefinite-singular":"gazeificări","dative-definite-genitive-singular":"gazeificării","dative-genitive-indefinite-plural":"gazeificări","dative-definite-genitive-plural":"gazeificărilor","singular-vocative":"gazeificare","plural-vocative":"gazeificărilor"}},{"word":"gazel","pos":"noun","definitions":["ghazal (a poetic form mostly used for love poetry in Middle Eastern, South, and Central Asian poetry)"],"forms":{"plural":"gazele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazel","accusative-definite-nominative-singular":"gazelul","accusative-indefinite-nominative-plural":"gazele","accusative-definite-nominative-plural":"gazelele","dative-genitive-indefinite-singular":"gazel","dative-definite-genitive-singular":"gazelului","dative-genitive-indefinite-plural":"gazele","dative-definite-genitive-plural":"gazelelor","singular-vocative":"gazelule","plural-vocative":"gazelelor"}},{"word":"gazela","pos":"noun","definitions":["definite nominative/accusative singular of gazelă"],"pronunciation":"[ɡaˈzela]","gender":"f"},{"word":"gazelă","pos":"noun","definitions":["gazelle"],"pronunciation":"/ɡaˈze.lə/","forms":{"plural":"gazele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazelă","accusative-definite-nominative-singular":"gazela","accusative-indefinite-nominative-plural":"gazele","accusative-definite-nominative-plural":"gazelele","dative-genitive-indefinite-singular":"gazele","dative-definite-genitive-singular":"gazelei","dative-genitive-indefinite-plural":"gazele","dative-definite-genitive-plural":"gazelelor","singular-vocative":"gazelă","plural-vocative":"gazelelor"}},{"word":"gazelo","pos":"noun","definitions":["vocative singular of gazelă"],"pronunciation":"[ɡaˈzelo]","gender":"f"},{"word":"gazetă","pos":"noun","definitions":["newspaper"],"forms":{"plural":"gazete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazetă","accusative-definite-nominative-singular":"gazeta","accusative-indefinite-nominative-plural":"gazete","accusative-definite-nominative-plural":"gazetele","dative-genitive-indefinite-singular":"gazete","dative-definite-genitive-singular":"gazetei","dative-genitive-indefinite-plural":"gazete","dative-definite-genitive-plural":"gazetelor","singular-vocative":"gazetă","plural-vocative":"gazetelor"}},{"word":"gazetă de perete","pos":"noun","definitions":["wall newspaper"],"forms":{"plural":"gazete de perete"}},{"word":"gazetar","pos":"noun","definitions":["journalist"],"forms":{"plural":"gazetari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gazetar","accusative-definite-nominative-singular":"gazetarul","accusative-indefinite-nominative-plural":"gazetari","accusative-definite-nominative-plural":"gazetarii","dative-genitive-indefinite-singular":"gazetar","dative-definite-genitive-singular":"gazetarului","dative-genitive-indefinite-plural":"gazetari","dative-definite-genitive-plural":"gazetarilor","singular-vocative":"gazetarule","plural-vocative":"gazetarilor"}},{"word":"gazetară","pos":"noun","definitions":["female equivalent of gazetar"],"forms":{"plural":"gazetare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazetară","accusative-definite-nominative-singular":"gazetara","accusative-indefinite-nominative-plural":"gazetare","accusative-definite-nominative-plural":"gazetarele","dative-genitive-indefinite-singular":"gazetare","dative-definite-genitive-singular":"gazetarei","dative-genitive-indefinite-plural":"gazetare","dative-definite-genitive-plural":"gazetarelor","singular-vocative":"gazetară","plural-vocative":"gazetarelor"}},{"word":"gazetăraș","pos":"noun","definitions":["diminutive of gazetar; small journalist"],"forms":{"plural":"gazetărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gazetăraș","accusative-definite-nominative-singular":"gazetărașul","accusative-indefinite-nominative-plural":"gazetărași","accusative-definite-nominative-plural":"gazetărașii","dative-genitive-indefinite-singular":"gazetăraș","dative-definite-genitive-singular":"gazetărașului","dative-genitive-indefinite-plural":"gazetărași","dative-definite-genitive-plural":"gazetărașilor","singular-vocative":"gazetărașule","plural-vocative":"gazetărașilor"}},{"word":"gazetăresc","pos":"adj","definitions":["journalistic"],"forms":{"feminine-singular":"gazetărească","plural":"gazetărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazetăresc","error-unrecognized-form-feminine-indefinite-singular":"gazetărească","error-unrecognized-form-indefinite-masculine-plural":"gazetărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazetărești","definite-error-unrecognized-form-masculine-neuter-singular":"gazetărescul","definite-error-unrecognized-form-feminine-singular":"gazetăreasca","definite-error-unrecognized-form-masculine-plural":"gazetăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"gazetăreștile"}},{"word":"gazetărie","pos":"noun","definitions":["journalism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gazetărie","accusative-definite-nominative":"gazetăria","dative-genitive-indefinite":"gazetării","dative-definite-genitive":"gazetăriei","vocative":"gazetărie"}},{"word":"gazeu","pos":"noun","definitions":["gauze"],"forms":{"plural":"gazeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazeu","accusative-definite-nominative-singular":"gazeuul","accusative-indefinite-nominative-plural":"gazeuri","accusative-definite-nominative-plural":"gazeurile","dative-genitive-indefinite-singular":"gazeu","dative-definite-genitive-singular":"gazeuului","dative-genitive-indefinite-plural":"gazeuri","dative-definite-genitive-plural":"gazeurilor","singular-vocative":"gazeuule","plural-vocative":"gazeurilor"}},{"word":"gazez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of gaza"],"pronunciation":"[ɡaˈzez]"},{"word":"gazifer","pos":"adj","definitions":["gasiferous"],"forms":{"feminine-singular":"gaziferă","masculine-plural":"gaziferi","feminine-neuter-plural":"gazifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazifer","error-unrecognized-form-feminine-indefinite-singular":"gaziferă","error-unrecognized-form-indefinite-masculine-plural":"gaziferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazifere","definite-error-unrecognized-form-masculine-neuter-singular":"gaziferul","definite-error-unrecognized-form-feminine-singular":"gazifera","definite-error-unrecognized-form-masculine-plural":"gaziferii","definite-error-unrecognized-form-feminine-neuter-plural":"gaziferele"}},{"word":"gazifica","pos":"verb","definitions":["to gasify"],"forms":{"canonical":"a gazifica 1st conjugation","present-singular-third-person":"gazifică","participle-past":"gazificat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gazifica","gerund":"gazificând","first-person-indicative-present-singular":"gazific","indicative-present-second-person-singular":"gazifici","indicative-present-singular-third-person":"gazifică","first-person-indicative-plural-present":"gazificăm","indicative-plural-present-second-person":"gazificați","indicative-plural-present-third-person":"gazifică","first-person-imperfect-indicative-singular":"gazificam","imperfect-indicative-second-person-singular":"gazificai","imperfect-indicative-singular-third-person":"gazifica","first-person-imperfect-indicative-plural":"gazificam","imperfect-indicative-plural-second-person":"gazificați","imperfect-indicative-plural-third-person":"gazificau","first-person-indicative-perfect-singular":"gazificai","indicative-perfect-second-person-singular":"gazificași","indicative-perfect-singular-third-person":"gazifică","first-person-indicative-perfect-plural":"gazificarăm","indicative-perfect-plural-second-person":"gazificarăți","indicative-perfect-plural-third-person":"gazificară","first-person-indicative-pluperfect-singular":"gazificasem","indicative-pluperfect-second-person-singular":"gazificaseși","indicative-pluperfect-singular-third-person":"gazificase","first-person-indicative-pluperfect-plural":"gazificaserăm","indicative-pluperfect-plural-second-person":"gazificaserăți","indicative-pluperfect-plural-third-person":"gazificaseră","first-person-present-singular-subjunctive":"să gazific","present-second-person-singular-subjunctive":"să gazifici","present-singular-subjunctive-third-person":"să gazifice","first-person-plural-present-subjunctive":"să gazificăm","plural-present-second-person-subjunctive":"să gazificați","plural-present-subjunctive-third-person":"să gazifice","imperative-second-person-singular":"gazifică","imperative-plural-second-person":"gazificați","imperative-negative-second-person-singular":"nu gazifica","imperative-negative-plural-second-person":"nu gazificați"}},{"word":"gazificare","pos":"noun","definitions":["gasification"],"forms":{"plural":"gazificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gazificare","accusative-definite-nominative-singular":"gazificarea","accusative-indefinite-nominative-plural":"gazificări","accusative-definite-nominative-plural":"gazificările","dative-genitive-indefinite-singular":"gazificări","dative-definite-genitive-singular":"gazificării","dative-genitive-indefinite-plural":"gazificări","dative-definite-genitive-plural":"gazificărilor","singular-vocative":"gazificare","plural-vocative":"gazificărilor"}},{"word":"gazificator","pos":"noun","definitions":["gasifier"],"forms":{"plural":"gazificatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazificator","accusative-definite-nominative-singular":"gazificatorul","accusative-indefinite-nominative-plural":"gazificatoare","accusative-definite-nominative-plural":"gazificatoarele","dative-genitive-indefinite-singular":"gazificator","dative-definite-genitive-singular":"gazificatorului","dative-genitive-indefinite-plural":"gazificatoare","dative-definite-genitive-plural":"gazificatoarelor","singular-vocative":"gazificatorule","plural-vocative":"gazificatoarelor"}},{"word":"gazoanalizator","pos":"noun","definitions":["gas analyzer"],"forms":{"plural":"gazoanalizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazoanalizator","accusative-definite-nominative-singular":"gazoanalizatorul","accusative-indefinite-nominative-plural":"gazoanalizatoare","accusative-definite-nominative-plural":"gazoanalizatoarele","dative-genitive-indefinite-singular":"gazoanalizator","dative-definite-genitive-singular":"gazoanalizatorului","dative-genitive-indefinite-plural":"gazoanalizatoare","dative-definite-genitive-plural":"gazoanalizatoarelor","singular-vocative":"gazoanalizatorule","plural-vocative":"gazoanalizatoarelor"}},{"word":"gâzobuță","pos":"noun","definitions":["diminutive of gâzoabă"],"forms":{"plural":"gâzobuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâzobuță","accusative-definite-nominative-singular":"gâzobuța","accusative-indefinite-nominative-plural":"gâzobuțe","accusative-definite-nominative-plural":"gâzobuțele","dative-genitive-indefinite-singular":"gâzobuțe","dative-definite-genitive-singular":"gâzobuței","dative-genitive-indefinite-plural":"gâzobuțe","dative-definite-genitive-plural":"gâzobuțelor","singular-vocative":"gâzobuță","plural-vocative":"gâzobuțelor"}},{"word":"gazoduct","pos":"noun","definitions":["gas pipeline"],"forms":{"plural":"gazoducte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazoduct","accusative-definite-nominative-singular":"gazoductul","accusative-indefinite-nominative-plural":"gazoducte","accusative-definite-nominative-plural":"gazoductele","dative-genitive-indefinite-singular":"gazoduct","dative-definite-genitive-singular":"gazoductului","dative-genitive-indefinite-plural":"gazoducte","dative-definite-genitive-plural":"gazoductelor","singular-vocative":"gazoductule","plural-vocative":"gazoductelor"}},{"word":"gazofilachie","pos":"noun","definitions":["a place where a treasure is kept"],"forms":{"plural":"gazofilachii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gazofilachie","accusative-definite-nominative-singular":"gazofilachia","accusative-indefinite-nominative-plural":"gazofilachii","accusative-definite-nominative-plural":"gazofilachiile","dative-genitive-indefinite-singular":"gazofilachii","dative-definite-genitive-singular":"gazofilachiei","dative-genitive-indefinite-plural":"gazofilachii","dative-definite-genitive-plural":"gazofilachiilor","singular-vocative":"gazofilachie","plural-vocative":"gazofilachiilor"}},{"word":"gazogen","pos":"noun","definitions":["gasifier"],"forms":{"plural":"gazogene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazogen","accusative-definite-nominative-singular":"gazogenul","accusative-indefinite-nominative-plural":"gazogene","accusative-definite-nominative-plural":"gazogenele","dative-genitive-indefinite-singular":"gazogen","dative-definite-genitive-singular":"gazogenului","dative-genitive-indefinite-plural":"gazogene","dative-definite-genitive-plural":"gazogenelor","singular-vocative":"gazogenule","plural-vocative":"gazogenelor"}},{"word":"gazolină","pos":"noun","definitions":["gasoline"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazolină","accusative-definite-nominative-singular":"gazolina","accusative-indefinite-nominative-plural":"gazoline","accusative-definite-nominative-plural":"gazolinele","dative-genitive-indefinite-singular":"gazoline","dative-definite-genitive-singular":"gazolinei","dative-genitive-indefinite-plural":"gazoline","dative-definite-genitive-plural":"gazolinelor","singular-vocative":"gazolină","plural-vocative":"gazolinelor"}},{"word":"gazometric","pos":"adj","definitions":["gazometric"],"forms":{"feminine-singular":"gazometrică","masculine-plural":"gazometrici","feminine-neuter-plural":"gazometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazometric","error-unrecognized-form-feminine-indefinite-singular":"gazometrică","error-unrecognized-form-indefinite-masculine-plural":"gazometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazometrice","definite-error-unrecognized-form-masculine-neuter-singular":"gazometricul","definite-error-unrecognized-form-feminine-singular":"gazometrica","definite-error-unrecognized-form-masculine-plural":"gazometricii","definite-error-unrecognized-form-feminine-neuter-plural":"gazometricele"}},{"word":"gazometrie","pos":"noun","definitions":["gasometry"],"forms":{"plural":"gazometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gazometrie","accusative-definite-nominative-singular":"gazometria","accusative-indefinite-nominative-plural":"gazometrii","accusative-definite-nominative-plural":"gazometriile","dative-genitive-indefinite-singular":"gazometrii","dative-definite-genitive-singular":"gazometriei","dative-genitive-indefinite-plural":"gazometrii","dative-definite-genitive-plural":"gazometriilor","singular-vocative":"gazometrie","plural-vocative":"gazometriilor"}},{"word":"gazometru","pos":"noun","definitions":["gasholder"],"forms":{"plural":"gazometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazometru","accusative-definite-nominative-singular":"gazometrul","accusative-indefinite-nominative-plural":"gazometre","accusative-definite-nominative-plural":"gazometrele","dative-genitive-indefinite-singular":"gazometru","dative-definite-genitive-singular":"gazometrului","dative-genitive-indefinite-plural":"gazometre","dative-definite-genitive-plural":"gazometrelor","singular-vocative":"gazometrule","plural-vocative":"gazometrelor"}},{"word":"gazon","pos":"noun","definitions":["grass"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gazon","accusative-definite-nominative":"gazonul","dative-genitive-indefinite":"gazon","dative-definite-genitive":"gazonului","vocative":"gazonule"}},{"word":"gazon artificial","pos":"noun","definitions":["artificial turf"],"forms":{"plural":"gazonuri artificiale"}},{"word":"gazon sintetic","pos":"noun","definitions":["artificial turf"],"forms":{"plural":"gazonuri sintetice"}},{"word":"gazona","pos":"verb","definitions":["to turf"],"forms":{"canonical":"a gazona 1st conjugation","present-singular-third-person":"gazonează","participle-past":"gazonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gazona","gerund":"gazonând","first-person-indicative-present-singular":"gazonez","indicative-present-second-person-singular":"gazonezi","indicative-present-singular-third-person":"gazonează","first-person-indicative-plural-present":"gazonăm","indicative-plural-present-second-person":"gazonați","indicative-plural-present-third-person":"gazonează","first-person-imperfect-indicative-singular":"gazonam","imperfect-indicative-second-person-singular":"gazonai","imperfect-indicative-singular-third-person":"gazona","first-person-imperfect-indicative-plural":"gazonam","imperfect-indicative-plural-second-person":"gazonați","imperfect-indicative-plural-third-person":"gazonau","first-person-indicative-perfect-singular":"gazonai","indicative-perfect-second-person-singular":"gazonași","indicative-perfect-singular-third-person":"gazonă","first-person-indicative-perfect-plural":"gazonarăm","indicative-perfect-plural-second-person":"gazonarăți","indicative-perfect-plural-third-person":"gazonară","first-person-indicative-pluperfect-singular":"gazonasem","indicative-pluperfect-second-person-singular":"gazonaseși","indicative-pluperfect-singular-third-person":"gazonase","first-person-indicative-pluperfect-plural":"gazonaserăm","indicative-pluperfect-plural-second-person":"gazonaserăți","indicative-pluperfect-plural-third-person":"gazonaseră","first-person-present-singular-subjunctive":"să gazonez","present-second-person-singular-subjunctive":"să gazonezi","present-singular-subjunctive-third-person":"să gazoneze","first-person-plural-present-subjunctive":"să gazonăm","plural-present-second-person-subjunctive":"să gazonați","plural-present-subjunctive-third-person":"să gazoneze","imperative-second-person-singular":"gazonează","imperative-plural-second-person":"gazonați","imperative-negative-second-person-singular":"nu gazona","imperative-negative-plural-second-person":"nu gazonați"}},{"word":"gazonare","pos":"noun","definitions":["turfing, covering with grass"],"forms":{"plural":"gazonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gazonare","accusative-definite-nominative-singular":"gazonarea","accusative-indefinite-nominative-plural":"gazonări","accusative-definite-nominative-plural":"gazonările","dative-genitive-indefinite-singular":"gazonări","dative-definite-genitive-singular":"gazonării","dative-genitive-indefinite-plural":"gazonări","dative-definite-genitive-plural":"gazonărilor","singular-vocative":"gazonare","plural-vocative":"gazonărilor"}},{"word":"gazonat","pos":"adj","definitions":["put a lawn on something"],"forms":{"feminine-singular":"gazonată","masculine-plural":"gazonați","feminine-neuter-plural":"gazonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazonat","error-unrecognized-form-feminine-indefinite-singular":"gazonată","error-unrecognized-form-indefinite-masculine-plural":"gazonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazonate","definite-error-unrecognized-form-masculine-neuter-singular":"gazonatul","definite-error-unrecognized-form-feminine-singular":"gazonata","definite-error-unrecognized-form-masculine-plural":"gazonații","definite-error-unrecognized-form-feminine-neuter-plural":"gazonatele"}},{"word":"gazorniță","pos":"noun","definitions":["petrol lamp"],"forms":{"plural":"gazornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gazorniță","accusative-definite-nominative-singular":"gazornița","accusative-indefinite-nominative-plural":"gazornițe","accusative-definite-nominative-plural":"gazornițele","dative-genitive-indefinite-singular":"gazornițe","dative-definite-genitive-singular":"gazorniței","dative-genitive-indefinite-plural":"gazornițe","dative-definite-genitive-plural":"gazornițelor","singular-vocative":"gazorniță","plural-vocative":"gazornițelor"}},{"word":"gazos","pos":"adj","definitions":["gaseous"],"pronunciation":"/ɡaˈzos/","forms":{"feminine-singular":"gazoasă","masculine-plural":"gazoși","feminine-neuter-plural":"gazoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gazos","error-unrecognized-form-feminine-indefinite-singular":"gazoasă","error-unrecognized-form-indefinite-masculine-plural":"gazoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gazoase","definite-error-unrecognized-form-masculine-neuter-singular":"gazosul","definite-error-unrecognized-form-feminine-singular":"gazoasa","definite-error-unrecognized-form-masculine-plural":"gazoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gazoasele","alternative":"газос"}},{"word":"gazoscop","pos":"noun","definitions":["gasoscope"],"forms":{"plural":"gazoscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gazoscop","accusative-definite-nominative-singular":"gazoscopul","accusative-indefinite-nominative-plural":"gazoscoape","accusative-definite-nominative-plural":"gazoscoapele","dative-genitive-indefinite-singular":"gazoscop","dative-definite-genitive-singular":"gazoscopului","dative-genitive-indefinite-plural":"gazoscoape","dative-definite-genitive-plural":"gazoscoapelor","singular-vocative":"gazoscopule","plural-vocative":"gazoscoapelor"}},{"word":"gâzulie","pos":"noun","definitions":["diminutive of gâză; small insect"],"forms":{"plural":"gâzulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gâzulie","accusative-definite-nominative-singular":"gâzulia","accusative-indefinite-nominative-plural":"gâzulii","accusative-definite-nominative-plural":"gâzuliile","dative-genitive-indefinite-singular":"gâzulii","dative-definite-genitive-singular":"gâzuliei","dative-genitive-indefinite-plural":"gâzulii","dative-definite-genitive-plural":"gâzuliilor","singular-vocative":"gâzulie","plural-vocative":"gâzuliilor"}},{"word":"gâzuliță","pos":"noun","definitions":["diminutive of gâză; small insect"],"forms":{"plural":"gâzulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâzuliță","accusative-definite-nominative-singular":"gâzulița","accusative-indefinite-nominative-plural":"gâzulițe","accusative-definite-nominative-plural":"gâzulițele","dative-genitive-indefinite-singular":"gâzulițe","dative-definite-genitive-singular":"gâzuliței","dative-genitive-indefinite-plural":"gâzulițe","dative-definite-genitive-plural":"gâzulițelor","singular-vocative":"gâzuliță","plural-vocative":"gâzulițelor"}},{"word":"gâzuță","pos":"noun","definitions":["diminutive of gâză; small insect"],"forms":{"plural":"gâzuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gâzuță","accusative-definite-nominative-singular":"gâzuța","accusative-indefinite-nominative-plural":"gâzuțe","accusative-definite-nominative-plural":"gâzuțele","dative-genitive-indefinite-singular":"gâzuțe","dative-definite-genitive-singular":"gâzuței","dative-genitive-indefinite-plural":"gâzuțe","dative-definite-genitive-plural":"gâzuțelor","singular-vocative":"gâzuță","plural-vocative":"gâzuțelor"}},{"word":"geaba","pos":"adv","definitions":["uselessly"]},{"word":"Geabacu","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Țibrinu."],"gender":"m"},{"word":"geac","pos":"noun","definitions":["jack (small national flag)"],"forms":{"plural":"geacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"geac","accusative-definite-nominative-singular":"geacul","accusative-indefinite-nominative-plural":"geacuri","accusative-definite-nominative-plural":"geacurile","dative-genitive-indefinite-singular":"geac","dative-definite-genitive-singular":"geacului","dative-genitive-indefinite-plural":"geacuri","dative-definite-genitive-plural":"geacurilor","singular-vocative":"geacule","plural-vocative":"geacurilor"}},{"word":"geacă","pos":"noun","definitions":["jacket"],"pronunciation":"/ˈd͡ʒe̯a.kə/","forms":{"plural":"geci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geacă","accusative-definite-nominative-singular":"geaca","accusative-indefinite-nominative-plural":"geci","accusative-definite-nominative-plural":"gecile","dative-genitive-indefinite-singular":"geci","dative-definite-genitive-singular":"gecii","dative-genitive-indefinite-plural":"geci","dative-definite-genitive-plural":"gecilor","singular-vocative":"geacă","plural-vocative":"gecilor","alternative":"giacă"}},{"word":"geacuri","pos":"noun","definitions":["plural of geac"]},{"word":"Geaferca Rusă","pos":"name","definitions":["a village in Tulcea County, in eastern Romania. Renamed to Căprioara."],"gender":"f"},{"word":"gealat","pos":"noun","definitions":["executioner","violent sturdy man, bully"],"forms":{"plural":"gealați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gealat","accusative-definite-nominative-singular":"gealatul","accusative-indefinite-nominative-plural":"gealați","accusative-definite-nominative-plural":"gealații","dative-genitive-indefinite-singular":"gealat","dative-definite-genitive-singular":"gealatului","dative-genitive-indefinite-plural":"gealați","dative-definite-genitive-plural":"gealaților","singular-vocative":"gealatule","plural-vocative":"gealaților"}},{"word":"Gealatu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Gealatu"}},{"word":"gealău","pos":"noun","definitions":["plane (tool)"],"forms":{"plural":"gealăie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gealău","accusative-definite-nominative-singular":"gealăuul","accusative-indefinite-nominative-plural":"gealăie","accusative-definite-nominative-plural":"gealăiele","dative-genitive-indefinite-singular":"gealău","dative-definite-genitive-singular":"gealăuului","dative-genitive-indefinite-plural":"gealăie","dative-definite-genitive-plural":"gealăielor","singular-vocative":"gealăuule","plural-vocative":"gealăielor"}},{"word":"geam","pos":"noun","definitions":["pane (individual sheet of glass)","window"],"pronunciation":"/ˈd͡ʒe̯am/","forms":{"plural":"geamuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"geam","accusative-definite-nominative-singular":"geamul","accusative-indefinite-nominative-plural":"geamuri","accusative-definite-nominative-plural":"geamurile","dative-genitive-indefinite-singular":"geam","dative-definite-genitive-singular":"geamului","dative-genitive-indefinite-plural":"geamuri","dative-definite-genitive-plural":"geamurilor","singular-vocative":"geamule","plural-vocative":"geamurilor"}},{"word":"geamală","pos":"noun","definitions":["a doll representing a woman used in fair shows"],"forms":{"plural":"geamale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geamală","accusative-definite-nominative-singular":"geamala","accusative-indefinite-nominative-plural":"geamale","accusative-definite-nominative-plural":"geamalele","dative-genitive-indefinite-singular":"geamale","dative-definite-genitive-singular":"geamalei","dative-genitive-indefinite-plural":"geamale","dative-definite-genitive-plural":"geamalelor","singular-vocative":"geamală","plural-vocative":"geamalelor"}},{"word":"Geamăn","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Geamăn"}},{"word":"geamăn","pos":"adj","definitions":["twin"],"pronunciation":"/ˈd͡ʒe̯a.mən/","examples":[{"ro":"Adrian și Cristian sunt gemeni.","en":"Adrian and Cristian are twins."},{"ro":"Natalia și Măria sunt gemene.","en":"Natalia and Maria are twins."}],"forms":{"feminine-singular":"geamănă","masculine-plural":"gemeni","feminine-neuter-plural":"gemene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geamăn","error-unrecognized-form-feminine-indefinite-singular":"geamănă","error-unrecognized-form-indefinite-masculine-plural":"gemeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemene","definite-error-unrecognized-form-masculine-neuter-singular":"geamănul","definite-error-unrecognized-form-feminine-singular":"geamăna","definite-error-unrecognized-form-masculine-plural":"gemenii","definite-error-unrecognized-form-feminine-neuter-plural":"gemenele","alternative-rare":"gemen"}},{"word":"geamăn siamez","pos":"noun","definitions":["conjoined twin, Siamese twin"],"forms":{"plural":"gemeni siamezi"}},{"word":"Geamăna","pos":"name","definitions":["a village in Lupșa, Alba County, Romania","a village in Bradu, Argeș County, Romania","a village in Drăgoești, Vâlcea County, Romania","a village in Stoilești, Vâlcea County, Romania"],"gender":"f"},{"word":"geamăna","pos":"noun","definitions":["definite nominative/accusative singular of geamănă"]},{"word":"geamănă","pos":"noun","definitions":["female equivalent of geamăn"],"forms":{"plural":"geamăne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geamănă","accusative-definite-nominative-singular":"geamăna","accusative-indefinite-nominative-plural":"geamăne","accusative-definite-nominative-plural":"geamănele","dative-genitive-indefinite-singular":"geamăne","dative-definite-genitive-singular":"geamănei","dative-genitive-indefinite-plural":"geamăne","dative-definite-genitive-plural":"geamănelor","singular-vocative":"geamănă","plural-vocative":"geamănelor"}},{"word":"geamănă siameză","pos":"noun","definitions":["conjoined twin, Siamese twin"],"forms":{"plural":"gemene siameze"}},{"word":"geamandan","pos":"noun","definitions":["alternative form of geamantan"],"forms":{"plural":"geamandane"}},{"word":"geamandură","pos":"noun","definitions":["buoy"],"forms":{"plural":"geamanduri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geamandură","accusative-definite-nominative-singular":"geamandura","accusative-indefinite-nominative-plural":"geamanduri","accusative-definite-nominative-plural":"geamandurile","dative-genitive-indefinite-singular":"geamanduri","dative-definite-genitive-singular":"geamandurii","dative-genitive-indefinite-plural":"geamanduri","dative-definite-genitive-plural":"geamandurilor","singular-vocative":"geamandură","plural-vocative":"geamandurilor"}},{"word":"geamantan","pos":"noun","definitions":["suitcase, valise"],"forms":{"plural":"geamantane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geamantan","accusative-definite-nominative-singular":"geamantanul","accusative-indefinite-nominative-plural":"geamantane","accusative-definite-nominative-plural":"geamantanele","dative-genitive-indefinite-singular":"geamantan","dative-definite-genitive-singular":"geamantanului","dative-genitive-indefinite-plural":"geamantane","dative-definite-genitive-plural":"geamantanelor","singular-vocative":"geamantanule","plural-vocative":"geamantanelor"}},{"word":"geamantanaș","pos":"noun","definitions":["obsolete form of geamantănaș"],"forms":{"plural":"geamantanașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geamantanaș","accusative-definite-nominative-singular":"geamantanașul","accusative-indefinite-nominative-plural":"geamantanașe","accusative-definite-nominative-plural":"geamantanașele","dative-genitive-indefinite-singular":"geamantanaș","dative-definite-genitive-singular":"geamantanașului","dative-genitive-indefinite-plural":"geamantanașe","dative-definite-genitive-plural":"geamantanașelor","singular-vocative":"geamantanașule","plural-vocative":"geamantanașelor"}},{"word":"geamantănaș","pos":"noun","definitions":["diminutive of geamantan; small suitcase"],"forms":{"plural":"geamantănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geamantănaș","accusative-definite-nominative-singular":"geamantănașul","accusative-indefinite-nominative-plural":"geamantănașe","accusative-definite-nominative-plural":"geamantănașele","dative-genitive-indefinite-singular":"geamantănaș","dative-definite-genitive-singular":"geamantănașului","dative-genitive-indefinite-plural":"geamantănașe","dative-definite-genitive-plural":"geamantănașelor","singular-vocative":"geamantănașule","plural-vocative":"geamantănașelor"}},{"word":"Geamănu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Geamănu"}},{"word":"Geamărtălui","pos":"name","definitions":["a river in Romania, tributary to the Olteț"],"gender":"m"},{"word":"geamăt","pos":"noun","definitions":["groan, moan"],"forms":{"plural":"gemete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geamăt","accusative-definite-nominative-singular":"geamătul","accusative-indefinite-nominative-plural":"gemete","accusative-definite-nominative-plural":"gemetele","dative-genitive-indefinite-singular":"geamăt","dative-definite-genitive-singular":"geamătului","dative-genitive-indefinite-plural":"gemete","dative-definite-genitive-plural":"gemetelor","singular-vocative":"geamătule","plural-vocative":"gemetelor","alternative":"gemăt"}},{"word":"geambarale","pos":"noun","definitions":["alternative form of geamparale"],"forms":{"plural":"geambarale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"geambarale","accusative-definite-nominative-singular":"geambaralea","accusative-indefinite-nominative-plural":"geambarale","accusative-definite-nominative-plural":"geambaralele","dative-genitive-indefinite-singular":"geambarale","dative-definite-genitive-singular":"geambaralei","dative-genitive-indefinite-plural":"geambarale","dative-definite-genitive-plural":"geambaralelor","singular-vocative":"geambarale","plural-vocative":"geambaralelor"}},{"word":"geambaș","pos":"noun","definitions":["a seller or dealer of horses"],"forms":{"plural":"geambași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geambaș","accusative-definite-nominative-singular":"geambașul","accusative-indefinite-nominative-plural":"geambași","accusative-definite-nominative-plural":"geambașii","dative-genitive-indefinite-singular":"geambaș","dative-definite-genitive-singular":"geambașului","dative-genitive-indefinite-plural":"geambași","dative-definite-genitive-plural":"geambașilor","singular-vocative":"geambașule","plural-vocative":"geambașilor"}},{"word":"geambașie","pos":"noun","definitions":["horse dealing"],"forms":{"plural":"geambașii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geambașie","accusative-definite-nominative-singular":"geambașia","accusative-indefinite-nominative-plural":"geambașii","accusative-definite-nominative-plural":"geambașiile","dative-genitive-indefinite-singular":"geambașii","dative-definite-genitive-singular":"geambașiei","dative-genitive-indefinite-plural":"geambașii","dative-definite-genitive-plural":"geambașiilor","singular-vocative":"geambașie","plural-vocative":"geambașiilor"}},{"word":"geambașlâc","pos":"noun","definitions":["horse dealing"],"forms":{"plural":"geambașlâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"geambașlâc","accusative-definite-nominative-singular":"geambașlâcul","accusative-indefinite-nominative-plural":"geambașlâcuri","accusative-definite-nominative-plural":"geambașlâcurile","dative-genitive-indefinite-singular":"geambașlâc","dative-definite-genitive-singular":"geambașlâcului","dative-genitive-indefinite-plural":"geambașlâcuri","dative-definite-genitive-plural":"geambașlâcurilor","singular-vocative":"geambașlâcule","plural-vocative":"geambașlâcurilor"}},{"word":"Geambașu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Geambașu"}},{"word":"geamgiu","pos":"noun","definitions":["glazier"],"forms":{"plural":"geamgii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geamgiu","accusative-definite-nominative-singular":"geamgiul","accusative-indefinite-nominative-plural":"geamgii","accusative-definite-nominative-plural":"geamgiii","dative-genitive-indefinite-singular":"geamgiu","dative-definite-genitive-singular":"geamgiului","dative-genitive-indefinite-plural":"geamgii","dative-definite-genitive-plural":"geamgiilor","singular-vocative":"geamgiule","plural-vocative":"geamgiilor"}},{"word":"geamie","pos":"noun","definitions":["mosque"],"forms":{"plural":"geamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geamie","accusative-definite-nominative-singular":"geamia","accusative-indefinite-nominative-plural":"geamii","accusative-definite-nominative-plural":"geamiile","dative-genitive-indefinite-singular":"geamii","dative-definite-genitive-singular":"geamiei","dative-genitive-indefinite-plural":"geamii","dative-definite-genitive-plural":"geamiilor","singular-vocative":"geamie","plural-vocative":"geamiilor"}},{"word":"geamlâc","pos":"noun","definitions":["French window"],"forms":{"plural":"geamlâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"geamlâc","accusative-definite-nominative-singular":"geamlâcul","accusative-indefinite-nominative-plural":"geamlâcuri","accusative-definite-nominative-plural":"geamlâcurile","dative-genitive-indefinite-singular":"geamlâc","dative-definite-genitive-singular":"geamlâcului","dative-genitive-indefinite-plural":"geamlâcuri","dative-definite-genitive-plural":"geamlâcurilor","singular-vocative":"geamlâcule","plural-vocative":"geamlâcurilor"}},{"word":"geamparale","pos":"noun","definitions":["a Romanian folk dance","a musical instrument"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"geamparale","accusative-definite-nominative":"geamparalele","dative-genitive-indefinite":"geamparale","dative-definite-genitive":"geamparalelor","vocative":"-"}},{"word":"geană","pos":"noun","definitions":["eyelash","eyelid"],"pronunciation":"[ˈd͡ʒe̯anə]","forms":{"plural":"gene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geană","accusative-definite-nominative-singular":"geana","accusative-indefinite-nominative-plural":"gene","accusative-definite-nominative-plural":"genele","dative-genitive-indefinite-singular":"gene","dative-definite-genitive-singular":"genei","dative-genitive-indefinite-plural":"gene","dative-definite-genitive-plural":"genelor","singular-vocative":"geană","plural-vocative":"genelor"}},{"word":"geanabet","pos":"noun","definitions":["scoundrel"],"forms":{"plural":"geanabeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geanabet","accusative-definite-nominative-singular":"geanabetul","accusative-indefinite-nominative-plural":"geanabeți","accusative-definite-nominative-plural":"geanabeții","dative-genitive-indefinite-singular":"geanabet","dative-definite-genitive-singular":"geanabetului","dative-genitive-indefinite-plural":"geanabeți","dative-definite-genitive-plural":"geanabeților","singular-vocative":"geanabetule","plural-vocative":"geanabeților"}},{"word":"Geangoești","pos":"name","definitions":["a village in Dragomirești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Geantă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Geantă"}},{"word":"geantă","pos":"noun","definitions":["bag","handbag, purse","satchel"],"pronunciation":"[ˈd͡ʒe̯an.tə]","forms":{"plural":"genți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geantă","accusative-definite-nominative-singular":"geanta","accusative-indefinite-nominative-plural":"genți","accusative-definite-nominative-plural":"gențile","dative-genitive-indefinite-singular":"genți","dative-definite-genitive-singular":"genții","dative-genitive-indefinite-plural":"genți","dative-definite-genitive-plural":"genților","singular-vocative":"geantă","plural-vocative":"genților"}},{"word":"gebegiu","pos":"noun","definitions":["cuirassier"],"forms":{"plural":"gebegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gebegiu","accusative-definite-nominative-singular":"gebegiuul","accusative-indefinite-nominative-plural":"gebegii","accusative-definite-nominative-plural":"gebegiii","dative-genitive-indefinite-singular":"gebegiu","dative-definite-genitive-singular":"gebegiuului","dative-genitive-indefinite-plural":"gebegii","dative-definite-genitive-plural":"gebegiilor","singular-vocative":"gebegiuule","plural-vocative":"gebegiilor"}},{"word":"gebhanea","pos":"noun","definitions":["magazine, arsenal"],"forms":{"plural":"gebhanele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gebhanea","accusative-definite-nominative-singular":"gebhaneaua","accusative-indefinite-nominative-plural":"gebhanele","accusative-definite-nominative-plural":"gebhanelele","dative-genitive-indefinite-singular":"gebhanele","dative-definite-genitive-singular":"gebhanelei","dative-genitive-indefinite-plural":"gebhanele","dative-definite-genitive-plural":"gebhanelelor","singular-vocative":"gebhanea","plural-vocative":"gebhanelelor"}},{"word":"Geblești","pos":"name","definitions":["a village in Carpen, Dolj County, Romania"],"gender":"m"},{"word":"geci","pos":"noun","definitions":["inflection of geacă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[d͡ʒet͡ʃʲ]","gender":"f"},{"word":"gecko","pos":"noun","definitions":["gecko"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gecko","accusative-definite-nominative":"geckoul","dative-genitive-indefinite":"gecko","dative-definite-genitive":"geckoului","vocative":"geckoule"}},{"word":"gel","pos":"noun","definitions":["gel"],"forms":{"plural":"geluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gel","accusative-definite-nominative-singular":"gelul","accusative-indefinite-nominative-plural":"geluri","accusative-definite-nominative-plural":"gelurile","dative-genitive-indefinite-singular":"gel","dative-definite-genitive-singular":"gelului","dative-genitive-indefinite-plural":"geluri","dative-definite-genitive-plural":"gelurilor","singular-vocative":"gelule","plural-vocative":"gelurilor"}},{"word":"gelăpi","pos":"verb","definitions":["to gobble up"],"forms":{"canonical":"a gelăpi 4th conjugation","present-singular-third-person":"gelăpie","participle-past":"gelăpit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gelăpi","gerund":"gelăpind","first-person-indicative-present-singular":"gelăp","indicative-present-second-person-singular":"gelăpi","indicative-present-singular-third-person":"gelăpe","first-person-indicative-plural-present":"gelăpim","indicative-plural-present-second-person":"gelăpiți","indicative-plural-present-third-person":"gelăp","first-person-imperfect-indicative-singular":"gelăpeam","imperfect-indicative-second-person-singular":"gelăpeai","imperfect-indicative-singular-third-person":"gelăpea","first-person-imperfect-indicative-plural":"gelăpeam","imperfect-indicative-plural-second-person":"gelăpeați","imperfect-indicative-plural-third-person":"gelăpeau","first-person-indicative-perfect-singular":"gelăpii","indicative-perfect-second-person-singular":"gelăpiși","indicative-perfect-singular-third-person":"gelăpi","first-person-indicative-perfect-plural":"gelăpirăm","indicative-perfect-plural-second-person":"gelăpirăți","indicative-perfect-plural-third-person":"gelăpiră","first-person-indicative-pluperfect-singular":"gelăpisem","indicative-pluperfect-second-person-singular":"gelăpiseși","indicative-pluperfect-singular-third-person":"gelăpise","first-person-indicative-pluperfect-plural":"gelăpiserăm","indicative-pluperfect-plural-second-person":"gelăpiserăți","indicative-pluperfect-plural-third-person":"gelăpiseră","first-person-present-singular-subjunctive":"să gelăp","present-second-person-singular-subjunctive":"să gelăpi","present-singular-subjunctive-third-person":"să gelăpă","first-person-plural-present-subjunctive":"să gelăpim","plural-present-second-person-subjunctive":"să gelăpiți","plural-present-subjunctive-third-person":"să gelăpă","imperative-second-person-singular":"gelăpe","imperative-plural-second-person":"gelăpiți","imperative-negative-second-person-singular":"nu gelăpi","imperative-negative-plural-second-person":"nu gelăpiți"}},{"word":"gelat","pos":"noun","definitions":["obsolete form of gealat"],"forms":{"plural":"gelați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gelat","accusative-definite-nominative-singular":"gelatul","accusative-indefinite-nominative-plural":"gelați","accusative-definite-nominative-plural":"gelații","dative-genitive-indefinite-singular":"gelat","dative-definite-genitive-singular":"gelatului","dative-genitive-indefinite-plural":"gelați","dative-definite-genitive-plural":"gelaților","singular-vocative":"gelatule","plural-vocative":"gelaților"}},{"word":"gelație","pos":"noun","definitions":["gelation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gelație","accusative-definite-nominative-singular":"gelația","accusative-indefinite-nominative-plural":"gelații","accusative-definite-nominative-plural":"gelațiile","dative-genitive-indefinite-singular":"gelații","dative-definite-genitive-singular":"gelației","dative-genitive-indefinite-plural":"gelații","dative-definite-genitive-plural":"gelațiilor","singular-vocative":"gelație","plural-vocative":"gelațiilor"}},{"word":"gelatină","pos":"noun","definitions":["gelatine"],"forms":{"plural":"gelatine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gelatină","accusative-definite-nominative-singular":"gelatina","accusative-indefinite-nominative-plural":"gelatine","accusative-definite-nominative-plural":"gelatinele","dative-genitive-indefinite-singular":"gelatine","dative-definite-genitive-singular":"gelatinei","dative-genitive-indefinite-plural":"gelatine","dative-definite-genitive-plural":"gelatinelor","singular-vocative":"gelatină","plural-vocative":"gelatinelor"}},{"word":"gelatiniza","pos":"verb","definitions":["to gelatinize"],"forms":{"canonical":"a gelatiniza 1st conjugation","present-singular-third-person":"gelatinizează","participle-past":"gelatinizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gelatiniza","gerund":"gelatinizând","first-person-indicative-present-singular":"gelatinizez","indicative-present-second-person-singular":"gelatinizezi","indicative-present-singular-third-person":"gelatinizează","first-person-indicative-plural-present":"gelatinizăm","indicative-plural-present-second-person":"gelatinizați","indicative-plural-present-third-person":"gelatinizează","first-person-imperfect-indicative-singular":"gelatinizam","imperfect-indicative-second-person-singular":"gelatinizai","imperfect-indicative-singular-third-person":"gelatiniza","first-person-imperfect-indicative-plural":"gelatinizam","imperfect-indicative-plural-second-person":"gelatinizați","imperfect-indicative-plural-third-person":"gelatinizau","first-person-indicative-perfect-singular":"gelatinizai","indicative-perfect-second-person-singular":"gelatinizași","indicative-perfect-singular-third-person":"gelatiniză","first-person-indicative-perfect-plural":"gelatinizarăm","indicative-perfect-plural-second-person":"gelatinizarăți","indicative-perfect-plural-third-person":"gelatinizară","first-person-indicative-pluperfect-singular":"gelatinizasem","indicative-pluperfect-second-person-singular":"gelatinizaseși","indicative-pluperfect-singular-third-person":"gelatinizase","first-person-indicative-pluperfect-plural":"gelatinizaserăm","indicative-pluperfect-plural-second-person":"gelatinizaserăți","indicative-pluperfect-plural-third-person":"gelatinizaseră","first-person-present-singular-subjunctive":"să gelatinizez","present-second-person-singular-subjunctive":"să gelatinizezi","present-singular-subjunctive-third-person":"să gelatinizeze","first-person-plural-present-subjunctive":"să gelatinizăm","plural-present-second-person-subjunctive":"să gelatinizați","plural-present-subjunctive-third-person":"să gelatinizeze","imperative-second-person-singular":"gelatinizează","imperative-plural-second-person":"gelatinizați","imperative-negative-second-person-singular":"nu gelatiniza","imperative-negative-plural-second-person":"nu gelatinizați"}},{"word":"gelatinizare","pos":"noun","definitions":["gelatinization"],"forms":{"plural":"gelatinizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gelatinizare","accusative-definite-nominative-singular":"gelatinizarea","accusative-indefinite-nominative-plural":"gelatinizări","accusative-definite-nominative-plural":"gelatinizările","dative-genitive-indefinite-singular":"gelatinizări","dative-definite-genitive-singular":"gelatinizării","dative-genitive-indefinite-plural":"gelatinizări","dative-definite-genitive-plural":"gelatinizărilor","singular-vocative":"gelatinizare","plural-vocative":"gelatinizărilor"}},{"word":"gelatinos","pos":"adj","definitions":["gelatinous"],"forms":{"feminine-singular":"gelatinoasă","masculine-plural":"gelatinoși","feminine-neuter-plural":"gelatinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gelatinos","error-unrecognized-form-feminine-indefinite-singular":"gelatinoasă","error-unrecognized-form-indefinite-masculine-plural":"gelatinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gelatinoase","definite-error-unrecognized-form-masculine-neuter-singular":"gelatinosul","definite-error-unrecognized-form-feminine-singular":"gelatinoasa","definite-error-unrecognized-form-masculine-plural":"gelatinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gelatinoasele"}},{"word":"gelău","pos":"noun","definitions":["obsolete form of gealău"],"forms":{"plural":"gelăie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gelău","accusative-definite-nominative-singular":"gelăuul","accusative-indefinite-nominative-plural":"gelăie","accusative-definite-nominative-plural":"gelăiele","dative-genitive-indefinite-singular":"gelău","dative-definite-genitive-singular":"gelăuului","dative-genitive-indefinite-plural":"gelăie","dative-definite-genitive-plural":"gelăielor","singular-vocative":"gelăuule","plural-vocative":"gelăielor"}},{"word":"gelepciu","pos":"noun","definitions":["merchant"],"forms":{"plural":"gelepcii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gelepciu","accusative-definite-nominative-singular":"gelepciuul","accusative-indefinite-nominative-plural":"gelepcii","accusative-definite-nominative-plural":"gelepciii","dative-genitive-indefinite-singular":"gelepciu","dative-definite-genitive-singular":"gelepciuului","dative-genitive-indefinite-plural":"gelepcii","dative-definite-genitive-plural":"gelepciilor","singular-vocative":"gelepciuule","plural-vocative":"gelepciilor"}},{"word":"gelifica","pos":"verb","definitions":["to jellify"],"forms":{"canonical":"a gelifica 1st conjugation","present-singular-third-person":"gelifică","participle-past":"gelificat","subjunctive-third-person":"gelifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gelifica","gerund":"gelificând","first-person-indicative-present-singular":"gelific","indicative-present-second-person-singular":"gelifici","indicative-present-singular-third-person":"gelifică","first-person-indicative-plural-present":"gelificăm","indicative-plural-present-second-person":"gelificați","indicative-plural-present-third-person":"gelifică","first-person-imperfect-indicative-singular":"gelificam","imperfect-indicative-second-person-singular":"gelificai","imperfect-indicative-singular-third-person":"gelifica","first-person-imperfect-indicative-plural":"gelificam","imperfect-indicative-plural-second-person":"gelificați","imperfect-indicative-plural-third-person":"gelificau","first-person-indicative-perfect-singular":"gelificai","indicative-perfect-second-person-singular":"gelificași","indicative-perfect-singular-third-person":"gelifică","first-person-indicative-perfect-plural":"gelificarăm","indicative-perfect-plural-second-person":"gelificarăți","indicative-perfect-plural-third-person":"gelificară","first-person-indicative-pluperfect-singular":"gelificasem","indicative-pluperfect-second-person-singular":"gelificaseși","indicative-pluperfect-singular-third-person":"gelificase","first-person-indicative-pluperfect-plural":"gelificaserăm","indicative-pluperfect-plural-second-person":"gelificaserăți","indicative-pluperfect-plural-third-person":"gelificaseră","first-person-present-singular-subjunctive":"să gelific","present-second-person-singular-subjunctive":"să gelifici","present-singular-subjunctive-third-person":"să gelifice","first-person-plural-present-subjunctive":"să gelificăm","plural-present-second-person-subjunctive":"să gelificați","plural-present-subjunctive-third-person":"să gelifice","imperative-second-person-singular":"gelifică","imperative-plural-second-person":"gelificați","imperative-negative-second-person-singular":"nu gelifica","imperative-negative-plural-second-person":"nu gelificați"}},{"word":"gelificare","pos":"noun","definitions":["gelatinization"],"forms":{"plural":"gelificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gelificare","accusative-definite-nominative-singular":"gelificarea","accusative-indefinite-nominative-plural":"gelificări","accusative-definite-nominative-plural":"gelificările","dative-genitive-indefinite-singular":"gelificări","dative-definite-genitive-singular":"gelificării","dative-genitive-indefinite-plural":"gelificări","dative-definite-genitive-plural":"gelificărilor","singular-vocative":"gelificare","plural-vocative":"gelificărilor"}},{"word":"gelifracție","pos":"noun","definitions":["gelifraction"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gelifracție","accusative-definite-nominative":"gelifracția","dative-genitive-indefinite":"gelifracții","dative-definite-genitive":"gelifracției","vocative":"gelifracție"}},{"word":"gelivație","pos":"noun","definitions":["gelation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gelivație","accusative-definite-nominative-singular":"gelivația","accusative-indefinite-nominative-plural":"gelivații","accusative-definite-nominative-plural":"gelivațiile","dative-genitive-indefinite-singular":"gelivații","dative-definite-genitive-singular":"gelivației","dative-genitive-indefinite-plural":"gelivații","dative-definite-genitive-plural":"gelivațiilor","singular-vocative":"gelivație","plural-vocative":"gelivațiilor"}},{"word":"gelivitate","pos":"noun","definitions":["frostiness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gelivitate","accusative-definite-nominative-singular":"gelivitatea","accusative-indefinite-nominative-plural":"gelivități","accusative-definite-nominative-plural":"gelivitățile","dative-genitive-indefinite-singular":"gelivități","dative-definite-genitive-singular":"gelivității","dative-genitive-indefinite-plural":"gelivități","dative-definite-genitive-plural":"gelivităților","singular-vocative":"gelivitate","plural-vocative":"gelivităților"}},{"word":"Gelmar","pos":"name","definitions":["a village in Geoagiu, Hunedoara County, Romania"],"gender":"m"},{"word":"gelos","pos":"adj","definitions":["jealous"],"pronunciation":"/d͡ʒeˈlos/","forms":{"feminine-singular":"geloasă","masculine-plural":"geloși","feminine-neuter-plural":"geloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gelos","error-unrecognized-form-feminine-indefinite-singular":"geloasă","error-unrecognized-form-indefinite-masculine-plural":"geloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"geloase","definite-error-unrecognized-form-masculine-neuter-singular":"gelosul","definite-error-unrecognized-form-feminine-singular":"geloasa","definite-error-unrecognized-form-masculine-plural":"geloșii","definite-error-unrecognized-form-feminine-neuter-plural":"geloasele"}},{"word":"geloză","pos":"noun","definitions":["gelose"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geloză","accusative-definite-nominative-singular":"geloza","accusative-indefinite-nominative-plural":"geloze","accusative-definite-nominative-plural":"gelozele","dative-genitive-indefinite-singular":"geloze","dative-definite-genitive-singular":"gelozei","dative-genitive-indefinite-plural":"geloze","dative-definite-genitive-plural":"gelozelor","singular-vocative":"geloză","plural-vocative":"gelozelor"}},{"word":"gelozie","pos":"noun","definitions":["jealousy (jealous attitude, e.g. fear of infidelity)"],"forms":{"plural":"gelozii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gelozie","accusative-definite-nominative-singular":"gelozia","accusative-indefinite-nominative-plural":"gelozii","accusative-definite-nominative-plural":"geloziile","dative-genitive-indefinite-singular":"gelozii","dative-definite-genitive-singular":"geloziei","dative-genitive-indefinite-plural":"gelozii","dative-definite-genitive-plural":"geloziilor","singular-vocative":"gelozie","plural-vocative":"geloziilor"}},{"word":"gem","pos":"noun","definitions":["jam (sweet mixture of fruit boiled with sugar)"],"forms":{"plural":"gemuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gem","accusative-definite-nominative-singular":"gemul","accusative-indefinite-nominative-plural":"gemuri","accusative-definite-nominative-plural":"gemurile","dative-genitive-indefinite-singular":"gem","dative-definite-genitive-singular":"gemului","dative-genitive-indefinite-plural":"gemuri","dative-definite-genitive-plural":"gemurilor","singular-vocative":"gemule","plural-vocative":"gemurilor"}},{"word":"gem","pos":"verb","definitions":["inflection of geme:","first-person singular present indicative/subjunctive","third-person plural present indicative"]},{"word":"gemă","pos":"noun","definitions":["gem"],"forms":{"plural":"geme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gemă","accusative-definite-nominative-singular":"gema","accusative-indefinite-nominative-plural":"geme","accusative-definite-nominative-plural":"gemele","dative-genitive-indefinite-singular":"geme","dative-definite-genitive-singular":"gemei","dative-genitive-indefinite-plural":"geme","dative-definite-genitive-plural":"gemelor","singular-vocative":"gemă","plural-vocative":"gemelor"}},{"word":"gemănar","pos":"adj","definitions":["twin"],"forms":{"feminine-singular":"gemănară","masculine-plural":"gemănari","feminine-neuter-plural":"gemănare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemănar","error-unrecognized-form-feminine-indefinite-singular":"gemănară","error-unrecognized-form-indefinite-masculine-plural":"gemănari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemănare","definite-error-unrecognized-form-masculine-neuter-singular":"gemănarul","definite-error-unrecognized-form-feminine-singular":"gemănara","definite-error-unrecognized-form-masculine-plural":"gemănarii","definite-error-unrecognized-form-feminine-neuter-plural":"gemănarele"}},{"word":"gemănar","pos":"noun","definitions":["twin"],"forms":{"plural":"gemănari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gemănar","accusative-definite-nominative-singular":"gemănarul","accusative-indefinite-nominative-plural":"gemănari","accusative-definite-nominative-plural":"gemănarii","dative-genitive-indefinite-singular":"gemănar","dative-definite-genitive-singular":"gemănarului","dative-genitive-indefinite-plural":"gemănari","dative-definite-genitive-plural":"gemănarilor","singular-vocative":"gemănarule","plural-vocative":"gemănarilor"}},{"word":"gemănare","pos":"noun","definitions":["fork (table utensil)"],"forms":{"plural":"gemănări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gemănare","accusative-definite-nominative-singular":"gemănarea","accusative-indefinite-nominative-plural":"gemănări","accusative-definite-nominative-plural":"gemănările","dative-genitive-indefinite-singular":"gemănări","dative-definite-genitive-singular":"gemănării","dative-genitive-indefinite-plural":"gemănări","dative-definite-genitive-plural":"gemănărilor","singular-vocative":"gemănare","plural-vocative":"gemănărilor"}},{"word":"gemănaș","pos":"noun","definitions":["twin"],"forms":{"plural":"gemănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gemănaș","accusative-definite-nominative-singular":"gemănașul","accusative-indefinite-nominative-plural":"gemănași","accusative-definite-nominative-plural":"gemănașii","dative-genitive-indefinite-singular":"gemănaș","dative-definite-genitive-singular":"gemănașului","dative-genitive-indefinite-plural":"gemănași","dative-definite-genitive-plural":"gemănașilor","singular-vocative":"gemănașule","plural-vocative":"gemănașilor"}},{"word":"gemăt","pos":"noun","definitions":["alternative form of geamăt"],"forms":{"plural":"gemete"}},{"word":"gemător","pos":"adj","definitions":["moaning"],"forms":{"feminine-singular":"gemătoare","masculine-plural":"gemători","feminine-neuter-plural":"gemătoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemător","error-unrecognized-form-feminine-indefinite-singular":"gemătoare","error-unrecognized-form-indefinite-masculine-plural":"gemători","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemătoare","definite-error-unrecognized-form-masculine-neuter-singular":"gemătorul","definite-error-unrecognized-form-feminine-singular":"gemătoarea","definite-error-unrecognized-form-masculine-plural":"gemătorii","definite-error-unrecognized-form-feminine-neuter-plural":"gemătoarele"}},{"word":"gemătură","pos":"noun","definitions":["groan, moan"],"forms":{"plural":"gemături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gemătură","accusative-definite-nominative-singular":"gemătura","accusative-indefinite-nominative-plural":"gemături","accusative-definite-nominative-plural":"gemăturile","dative-genitive-indefinite-singular":"gemături","dative-definite-genitive-singular":"gemăturii","dative-genitive-indefinite-plural":"gemături","dative-definite-genitive-plural":"gemăturilor","singular-vocative":"gemătură","plural-vocative":"gemăturilor"}},{"word":"geme","pos":"verb","definitions":["to groan"],"forms":{"canonical":"a geme 3rd conjugation","present-singular-third-person":"geme","participle-past":"gemut","subjunctive-third-person":"geamă","table-tags":"conjugation-3","inflection-template":"ro-conj-e-ut","infinitive":"a geme","gerund":"gemând","first-person-indicative-present-singular":"gem","indicative-present-second-person-singular":"gemi","indicative-present-singular-third-person":"geme","first-person-indicative-plural-present":"gemem","indicative-plural-present-second-person":"gemeți","indicative-plural-present-third-person":"gem","first-person-imperfect-indicative-singular":"gemeam","imperfect-indicative-second-person-singular":"gemeai","imperfect-indicative-singular-third-person":"gemea","first-person-imperfect-indicative-plural":"gemeam","imperfect-indicative-plural-second-person":"gemeați","imperfect-indicative-plural-third-person":"gemeau","first-person-indicative-perfect-singular":"gemui","indicative-perfect-second-person-singular":"gemuși","indicative-perfect-singular-third-person":"gemu","first-person-indicative-perfect-plural":"gemurăm","indicative-perfect-plural-second-person":"gemurăți","indicative-perfect-plural-third-person":"gemură","first-person-indicative-pluperfect-singular":"gemusem","indicative-pluperfect-second-person-singular":"gemuseși","indicative-pluperfect-singular-third-person":"gemuse","first-person-indicative-pluperfect-plural":"gemuserăm","indicative-pluperfect-plural-second-person":"gemuserăți","indicative-pluperfect-plural-third-person":"gemuseră","first-person-present-singular-subjunctive":"să gem","present-second-person-singular-subjunctive":"să gemi","present-singular-subjunctive-third-person":"să geamă","first-person-plural-present-subjunctive":"să gemem","plural-present-second-person-subjunctive":"să gemeți","plural-present-subjunctive-third-person":"să geamă","imperative-second-person-singular":"geme","imperative-plural-second-person":"gemeți","imperative-negative-second-person-singular":"nu geme","imperative-negative-plural-second-person":"nu gemeți"}},{"word":"gemelar","pos":"adj","definitions":["twin"],"forms":{"feminine-singular":"gemelară","masculine-plural":"gemelari","feminine-neuter-plural":"gemelare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemelar","error-unrecognized-form-feminine-indefinite-singular":"gemelară","error-unrecognized-form-indefinite-masculine-plural":"gemelari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemelare","definite-error-unrecognized-form-masculine-neuter-singular":"gemelarul","definite-error-unrecognized-form-feminine-singular":"gemelara","definite-error-unrecognized-form-masculine-plural":"gemelarii","definite-error-unrecognized-form-feminine-neuter-plural":"gemelarele"}},{"word":"gemelipară","pos":"noun","definitions":["mother of twins"],"forms":{"plural":"gemelipare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gemelipară","accusative-definite-nominative-singular":"gemelipara","accusative-indefinite-nominative-plural":"gemelipare","accusative-definite-nominative-plural":"gemeliparele","dative-genitive-indefinite-singular":"gemelipare","dative-definite-genitive-singular":"gemeliparei","dative-genitive-indefinite-plural":"gemelipare","dative-definite-genitive-plural":"gemeliparelor","singular-vocative":"gemelipară","plural-vocative":"gemeliparelor"}},{"word":"gemelitate","pos":"noun","definitions":["twinness"],"forms":{"plural":"gemelitatăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gemelitate","accusative-definite-nominative-singular":"gemelitatea","accusative-indefinite-nominative-plural":"gemelitatăți","accusative-definite-nominative-plural":"gemelitatățile","dative-genitive-indefinite-singular":"gemelitatăți","dative-definite-genitive-singular":"gemelitatății","dative-genitive-indefinite-plural":"gemelitatăți","dative-definite-genitive-plural":"gemelitatăților","singular-vocative":"gemelitate","plural-vocative":"gemelitatăților"}},{"word":"gemem","pos":"verb","definitions":["first-person plural present indicative/subjunctive of geme"],"pronunciation":"[ˈd͡ʒemem]"},{"word":"gemen","pos":"adj","definitions":["alternative form of geamăn"],"forms":{"feminine-singular":"gemenă","masculine-plural":"gemeni","feminine-neuter-plural":"gemene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemen","error-unrecognized-form-feminine-indefinite-singular":"gemenă","error-unrecognized-form-indefinite-masculine-plural":"gemeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemene","definite-error-unrecognized-form-masculine-neuter-singular":"gemenul","definite-error-unrecognized-form-feminine-singular":"gemena","definite-error-unrecognized-form-masculine-plural":"gemenii","definite-error-unrecognized-form-feminine-neuter-plural":"gemenele"}},{"word":"gemene","pos":"adj","definitions":["feminine/neuter plural of geamăn"]},{"word":"Gemenea","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Suha","a village in Stulpicani, Suceava County, Romania"],"gender":"f"},{"word":"Gemenea Brătulești","pos":"name","definitions":["a village in Voinești, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gemenele","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Gemenele, Brăila County, Romania"],"gender":"m"},{"word":"Gemeni","pos":"name","definitions":["a village in Dârvari, Mehedinți County, Romania"],"gender":"m"},{"word":"gemeni","pos":"noun","definitions":["plural of geamăn"]},{"word":"gemet","pos":"noun","definitions":["alternative form of geamăt"],"forms":{"plural":"gemete"}},{"word":"gemete","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of geamăt"]},{"word":"gemi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of geme"],"pronunciation":"[d͡ʒemʲ]"},{"word":"gemin","pos":"adj","definitions":["obsolete form of geamăn"],"forms":{"feminine-singular":"gemină","masculine-plural":"gemini","feminine-neuter-plural":"gemine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemin","error-unrecognized-form-feminine-indefinite-singular":"gemină","error-unrecognized-form-indefinite-masculine-plural":"gemini","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemine","definite-error-unrecognized-form-masculine-neuter-singular":"geminul","definite-error-unrecognized-form-feminine-singular":"gemina","definite-error-unrecognized-form-masculine-plural":"geminii","definite-error-unrecognized-form-feminine-neuter-plural":"geminele"}},{"word":"geminat","pos":"adj","definitions":["geminate"],"forms":{"feminine-singular":"geminată","masculine-plural":"geminați","feminine-neuter-plural":"geminate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geminat","error-unrecognized-form-feminine-indefinite-singular":"geminată","error-unrecognized-form-indefinite-masculine-plural":"geminați","error-unrecognized-form-feminine-indefinite-neuter-plural":"geminate","definite-error-unrecognized-form-masculine-neuter-singular":"geminatul","definite-error-unrecognized-form-feminine-singular":"geminata","definite-error-unrecognized-form-masculine-plural":"geminații","definite-error-unrecognized-form-feminine-neuter-plural":"geminatele"}},{"word":"geminație","pos":"noun","definitions":["gemination"],"forms":{"plural":"geminații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geminație","accusative-definite-nominative-singular":"geminația","accusative-indefinite-nominative-plural":"geminații","accusative-definite-nominative-plural":"geminațiile","dative-genitive-indefinite-singular":"geminații","dative-definite-genitive-singular":"geminației","dative-genitive-indefinite-plural":"geminații","dative-definite-genitive-plural":"geminațiilor","singular-vocative":"geminație","plural-vocative":"geminațiilor"}},{"word":"geminațiune","pos":"noun","definitions":["obsolete form of geminație"],"forms":{"plural":"geminațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"geminațiune","accusative-definite-nominative-singular":"geminațiunea","accusative-indefinite-nominative-plural":"geminațiuni","accusative-definite-nominative-plural":"geminațiunile","dative-genitive-indefinite-singular":"geminațiuni","dative-definite-genitive-singular":"geminațiunii","dative-genitive-indefinite-plural":"geminațiuni","dative-definite-genitive-plural":"geminațiunilor","singular-vocative":"geminațiune","plural-vocative":"geminațiunilor"}},{"word":"gemipar","pos":"adj","definitions":["gemmiparous"],"forms":{"feminine-singular":"gemipară","masculine-plural":"gemipari","feminine-neuter-plural":"gemipare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gemipar","error-unrecognized-form-feminine-indefinite-singular":"gemipară","error-unrecognized-form-indefinite-masculine-plural":"gemipari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gemipare","definite-error-unrecognized-form-masculine-neuter-singular":"gemiparul","definite-error-unrecognized-form-feminine-singular":"gemipara","definite-error-unrecognized-form-masculine-plural":"gemiparii","definite-error-unrecognized-form-feminine-neuter-plural":"gemiparele"}},{"word":"gemu","pos":"verb","definitions":["third-person singular simple perfect indicative of geme"],"pronunciation":"[d͡ʒeˈmu]"},{"word":"gemui","pos":"verb","definitions":["first-person singular simple perfect indicative of geme"],"pronunciation":"[d͡ʒeˈmuj]"},{"word":"gemulă","pos":"noun","definitions":["gemula"],"forms":{"plural":"gemule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gemulă","accusative-definite-nominative-singular":"gemula","accusative-indefinite-nominative-plural":"gemule","accusative-definite-nominative-plural":"gemulele","dative-genitive-indefinite-singular":"gemule","dative-definite-genitive-singular":"gemulei","dative-genitive-indefinite-plural":"gemule","dative-definite-genitive-plural":"gemulelor","singular-vocative":"gemulă","plural-vocative":"gemulelor"}},{"word":"gemuleț","pos":"noun","definitions":["diminutive of geam; small window"],"forms":{"plural":"gemulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gemuleț","accusative-definite-nominative-singular":"gemulețul","accusative-indefinite-nominative-plural":"gemulețe","accusative-definite-nominative-plural":"gemulețele","dative-genitive-indefinite-singular":"gemuleț","dative-definite-genitive-singular":"gemulețului","dative-genitive-indefinite-plural":"gemulețe","dative-definite-genitive-plural":"gemulețelor","singular-vocative":"gemulețule","plural-vocative":"gemulețelor"}},{"word":"gemut","pos":"noun","definitions":["groan, moan"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gemut","accusative-definite-nominative":"gemutul","dative-genitive-indefinite":"gemut","dative-definite-genitive":"gemutului","vocative":"gemutule"}},{"word":"gemut","pos":"verb","definitions":["past participle of geme"],"forms":{"participle-past":"of geme"}},{"word":"gen","pos":"noun","definitions":["type, sort, kind","way of being, manner, attitude","genre","gender","genus"],"pronunciation":"/d͡ʒen/","examples":[{"ro":"ceva de genul","en":"something of the sort"}],"forms":{"plural":"genuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gen","accusative-definite-nominative-singular":"genul","accusative-indefinite-nominative-plural":"genuri","accusative-definite-nominative-plural":"genurile","dative-genitive-indefinite-singular":"gen","dative-definite-genitive-singular":"genului","dative-genitive-indefinite-plural":"genuri","dative-definite-genitive-plural":"genurilor","singular-vocative":"genule","plural-vocative":"genurilor"}},{"word":"gen","pos":"particle","definitions":["Filler word: like.","Precedes a quotation or description: like."],"pronunciation":"/d͡ʒen/"},{"word":"gena","pos":"noun","definitions":["definite nominative/accusative singular of genă"],"pronunciation":"[ˈd͡ʒena]","gender":"f"},{"word":"genă","pos":"noun","definitions":["gene"],"pronunciation":"[ˈd͡ʒe.nə]","forms":{"plural":"gene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"genă","accusative-definite-nominative-singular":"gena","accusative-indefinite-nominative-plural":"gene","accusative-definite-nominative-plural":"genele","dative-genitive-indefinite-singular":"gene","dative-definite-genitive-singular":"genei","dative-genitive-indefinite-plural":"gene","dative-definite-genitive-plural":"genelor","singular-vocative":"genă","plural-vocative":"genelor"}},{"word":"genat","pos":"adj","definitions":["having long eyelids"],"forms":{"feminine-singular":"genată","masculine-plural":"genați","feminine-neuter-plural":"genate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genat","error-unrecognized-form-feminine-indefinite-singular":"genată","error-unrecognized-form-indefinite-masculine-plural":"genați","error-unrecognized-form-feminine-indefinite-neuter-plural":"genate","definite-error-unrecognized-form-masculine-neuter-singular":"genatul","definite-error-unrecognized-form-feminine-singular":"genata","definite-error-unrecognized-form-masculine-plural":"genații","definite-error-unrecognized-form-feminine-neuter-plural":"genatele"}},{"word":"gendarm","pos":"noun","definitions":["obsolete form of jandarm"],"forms":{"plural":"gendarmi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gendarm","accusative-definite-nominative-singular":"gendarmul","accusative-indefinite-nominative-plural":"gendarmi","accusative-definite-nominative-plural":"gendarmii","dative-genitive-indefinite-singular":"gendarm","dative-definite-genitive-singular":"gendarmului","dative-genitive-indefinite-plural":"gendarmi","dative-definite-genitive-plural":"gendarmilor","singular-vocative":"gendarmule","plural-vocative":"gendarmilor"}},{"word":"gene","pos":"noun","definitions":["inflection of genă (“gene”):","indefinite nominative/accusative plural","indefinite genitive/dative singular"],"pronunciation":"/ˈd͡ʒe.ne/","gender":"f"},{"word":"gene","pos":"noun","definitions":["inflection of geană (“eyelash”):","indefinite nominative/accusative plural","indefinite genitive/dative singular"],"pronunciation":"/ˈd͡ʒe.ne/","gender":"f"},{"word":"genealog","pos":"noun","definitions":["genealogist"],"forms":{"plural":"genealogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genealog","accusative-definite-nominative-singular":"genealogul","accusative-indefinite-nominative-plural":"genealogi","accusative-definite-nominative-plural":"genealogii","dative-genitive-indefinite-singular":"genealog","dative-definite-genitive-singular":"genealogului","dative-genitive-indefinite-plural":"genealogi","dative-definite-genitive-plural":"genealogilor","singular-vocative":"genealogule","plural-vocative":"genealogilor"}},{"word":"genealogă","pos":"noun","definitions":["female equivalent of genealog"],"forms":{"plural":"genealoge","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"genealogă","accusative-definite-nominative-singular":"genealoga","accusative-indefinite-nominative-plural":"genealoge","accusative-definite-nominative-plural":"genealogele","dative-genitive-indefinite-singular":"genealoge","dative-definite-genitive-singular":"genealogei","dative-genitive-indefinite-plural":"genealoge","dative-definite-genitive-plural":"genealogelor","singular-vocative":"genealogă","plural-vocative":"genealogelor"}},{"word":"genealogic","pos":"adj","definitions":["genealogical"],"pronunciation":"/ˌd͡ʒe.ne.aˈlo.d͡ʒik/","forms":{"feminine-singular":"genealogică","masculine-plural":"genealogici","feminine-neuter-plural":"genealogice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genealogic","error-unrecognized-form-feminine-indefinite-singular":"genealogică","error-unrecognized-form-indefinite-masculine-plural":"genealogici","error-unrecognized-form-feminine-indefinite-neuter-plural":"genealogice","definite-error-unrecognized-form-masculine-neuter-singular":"genealogicul","definite-error-unrecognized-form-feminine-singular":"genealogica","definite-error-unrecognized-form-masculine-plural":"genealogicii","definite-error-unrecognized-form-feminine-neuter-plural":"genealogicele"}},{"word":"genealogicesc","pos":"adj","definitions":["genealogical"],"forms":{"feminine-singular":"genealogicească","plural":"genealogicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genealogicesc","error-unrecognized-form-feminine-indefinite-singular":"genealogicească","error-unrecognized-form-indefinite-masculine-plural":"genealogicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"genealogicești","definite-error-unrecognized-form-masculine-neuter-singular":"genealogicescul","definite-error-unrecognized-form-feminine-singular":"genealogiceasca","definite-error-unrecognized-form-masculine-plural":"genealogiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"genealogiceștile"}},{"word":"genealogie","pos":"noun","definitions":["genealogy"],"forms":{"plural":"genealogii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"genealogie","accusative-definite-nominative-singular":"genealogia","accusative-indefinite-nominative-plural":"genealogii","accusative-definite-nominative-plural":"genealogiile","dative-genitive-indefinite-singular":"genealogii","dative-definite-genitive-singular":"genealogiei","dative-genitive-indefinite-plural":"genealogii","dative-definite-genitive-plural":"genealogiilor","singular-vocative":"genealogie","plural-vocative":"genealogiilor"}},{"word":"genealogist","pos":"noun","definitions":["genealogist"],"pronunciation":"/d͡ʒe.ne.a.loˈd͡ʒist/","forms":{"plural":"genealogiști","feminine":"equivalent genealogistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genealogist","accusative-definite-nominative-singular":"genealogistul","accusative-indefinite-nominative-plural":"genealogiști","accusative-definite-nominative-plural":"genealogiștii","dative-genitive-indefinite-singular":"genealogist","dative-definite-genitive-singular":"genealogistului","dative-genitive-indefinite-plural":"genealogiști","dative-definite-genitive-plural":"genealogiștilor","singular-vocative":"genealogistule","plural-vocative":"genealogiștilor"}},{"word":"genealogista","pos":"noun","definitions":["definite nominative/accusative singular of genealogistă"]},{"word":"genealogistă","pos":"noun","definitions":["female equivalent of genealogist"],"pronunciation":"/d͡ʒe.ne.a.loˈd͡ʒis.tə/","forms":{"plural":"genealogiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"genealogistă","accusative-definite-nominative-singular":"genealogista","accusative-indefinite-nominative-plural":"genealogiste","accusative-definite-nominative-plural":"genealogistele","dative-genitive-indefinite-singular":"genealogiste","dative-definite-genitive-singular":"genealogistei","dative-genitive-indefinite-plural":"genealogiste","dative-definite-genitive-plural":"genealogistelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"genealogiste","pos":"noun","definitions":["plural of genealogistă"],"gender":"f"},{"word":"genealogiști","pos":"noun","definitions":["plural of genealogist"],"gender":"m"},{"word":"genera","pos":"verb","definitions":["to generate"],"forms":{"canonical":"a genera 1st conjugation","present-singular-third-person":"generează","participle-past":"generat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a genera","gerund":"generând","first-person-indicative-present-singular":"generez","indicative-present-second-person-singular":"generezi","indicative-present-singular-third-person":"generează","first-person-indicative-plural-present":"generăm","indicative-plural-present-second-person":"generați","indicative-plural-present-third-person":"generează","first-person-imperfect-indicative-singular":"generam","imperfect-indicative-second-person-singular":"generai","imperfect-indicative-singular-third-person":"genera","first-person-imperfect-indicative-plural":"generam","imperfect-indicative-plural-second-person":"generați","imperfect-indicative-plural-third-person":"generau","first-person-indicative-perfect-singular":"generai","indicative-perfect-second-person-singular":"generași","indicative-perfect-singular-third-person":"generă","first-person-indicative-perfect-plural":"generarăm","indicative-perfect-plural-second-person":"generarăți","indicative-perfect-plural-third-person":"generară","first-person-indicative-pluperfect-singular":"generasem","indicative-pluperfect-second-person-singular":"generaseși","indicative-pluperfect-singular-third-person":"generase","first-person-indicative-pluperfect-plural":"generaserăm","indicative-pluperfect-plural-second-person":"generaserăți","indicative-pluperfect-plural-third-person":"generaseră","first-person-present-singular-subjunctive":"să generez","present-second-person-singular-subjunctive":"să generezi","present-singular-subjunctive-third-person":"să genereze","first-person-plural-present-subjunctive":"să generăm","plural-present-second-person-subjunctive":"să generați","plural-present-subjunctive-third-person":"să genereze","imperative-second-person-singular":"generează","imperative-plural-second-person":"generați","imperative-negative-second-person-singular":"nu genera","imperative-negative-plural-second-person":"nu generați"}},{"word":"general","pos":"noun","definitions":["general"],"pronunciation":"/d͡ʒe.neˈral/","forms":{"plural":"generali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"general","accusative-definite-nominative-singular":"generalul","accusative-indefinite-nominative-plural":"generali","accusative-definite-nominative-plural":"generalii","dative-genitive-indefinite-singular":"general","dative-definite-genitive-singular":"generalului","dative-genitive-indefinite-plural":"generali","dative-definite-genitive-plural":"generalilor","singular-vocative":"generalule","plural-vocative":"generalilor"}},{"word":"general","pos":"adj","definitions":["general"],"pronunciation":"/d͡ʒe.neˈral/","forms":{"feminine-singular":"generală","masculine-plural":"generali","feminine-neuter-plural":"generale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"general","error-unrecognized-form-feminine-indefinite-singular":"generală","error-unrecognized-form-indefinite-masculine-plural":"generali","error-unrecognized-form-feminine-indefinite-neuter-plural":"generale","definite-error-unrecognized-form-masculine-neuter-singular":"generalul","definite-error-unrecognized-form-feminine-singular":"generala","definite-error-unrecognized-form-masculine-plural":"generalii","definite-error-unrecognized-form-feminine-neuter-plural":"generalele"}},{"word":"General Berthelot","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in General Berthelot, Hunedoara County, Romania"],"gender":"m"},{"word":"general de brigadă","pos":"noun","definitions":["brigadier general"],"forms":{"plural":"generali de brigadă"}},{"word":"General Praporgescu","pos":"name","definitions":["a village in Cerna, Tulcea County, Romania"],"gender":"m"},{"word":"General Scărișoreanu","pos":"name","definitions":["a village in Amzacea, Constanța County, Romania"],"gender":"m"},{"word":"generală","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of general"]},{"word":"generăleasă","pos":"noun","definitions":["a general's wife"],"forms":{"plural":"generălese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"generăleasă","accusative-definite-nominative-singular":"generăleasa","accusative-indefinite-nominative-plural":"generălese","accusative-definite-nominative-plural":"generălesele","dative-genitive-indefinite-singular":"generălese","dative-definite-genitive-singular":"generălesei","dative-genitive-indefinite-plural":"generălese","dative-definite-genitive-plural":"generăleselor","singular-vocative":"generăleasă","plural-vocative":"generăleselor"}},{"word":"generali","pos":"noun","definitions":["indefinite plural of general"],"pronunciation":"[d͡ʒeneˈralʲ]","gender":"m"},{"word":"generalisim","pos":"noun","definitions":["generalissimo"],"forms":{"plural":"generalisimi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"generalisim","accusative-definite-nominative-singular":"generalisimul","accusative-indefinite-nominative-plural":"generalisimi","accusative-definite-nominative-plural":"generalisimii","dative-genitive-indefinite-singular":"generalisim","dative-definite-genitive-singular":"generalisimului","dative-genitive-indefinite-plural":"generalisimi","dative-definite-genitive-plural":"generalisimilor","singular-vocative":"generalisimule","plural-vocative":"generalisimilor"}},{"word":"generalist","pos":"noun","definitions":["generalist"],"forms":{"plural":"generaliști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"generalist","accusative-definite-nominative-singular":"generalistul","accusative-indefinite-nominative-plural":"generaliști","accusative-definite-nominative-plural":"generaliștii","dative-genitive-indefinite-singular":"generalist","dative-definite-genitive-singular":"generalistului","dative-genitive-indefinite-plural":"generaliști","dative-definite-genitive-plural":"generaliștilor","singular-vocative":"generalistule","plural-vocative":"generaliștilor"}},{"word":"generalistă","pos":"noun","definitions":["female equivalent of generalist"],"forms":{"plural":"generaliste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"generalistă","accusative-definite-nominative-singular":"generalista","accusative-indefinite-nominative-plural":"generaliste","accusative-definite-nominative-plural":"generalistele","dative-genitive-indefinite-singular":"generaliste","dative-definite-genitive-singular":"generalistei","dative-genitive-indefinite-plural":"generaliste","dative-definite-genitive-plural":"generalistelor","singular-vocative":"generalistă","plural-vocative":"generalistelor"}},{"word":"generalitate","pos":"noun","definitions":["generality"],"forms":{"plural":"generalități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"generalitate","accusative-definite-nominative-singular":"generalitatea","accusative-indefinite-nominative-plural":"generalități","accusative-definite-nominative-plural":"generalitățile","dative-genitive-indefinite-singular":"generalități","dative-definite-genitive-singular":"generalității","dative-genitive-indefinite-plural":"generalități","dative-definite-genitive-plural":"generalităților","singular-vocative":"generalitate","plural-vocative":"generalităților"}},{"word":"generaliza","pos":"verb","definitions":["to generalize"],"pronunciation":"/d͡ʒe.ne.ra.liˈza/","forms":{"canonical":"a generaliza 1st conjugation","present-singular-third-person":"generalizează","participle-past":"generalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a generaliza","gerund":"generalizând","first-person-indicative-present-singular":"generalizez","indicative-present-second-person-singular":"generalizezi","indicative-present-singular-third-person":"generalizează","first-person-indicative-plural-present":"generalizăm","indicative-plural-present-second-person":"generalizați","indicative-plural-present-third-person":"generalizează","first-person-imperfect-indicative-singular":"generalizam","imperfect-indicative-second-person-singular":"generalizai","imperfect-indicative-singular-third-person":"generaliza","first-person-imperfect-indicative-plural":"generalizam","imperfect-indicative-plural-second-person":"generalizați","imperfect-indicative-plural-third-person":"generalizau","first-person-indicative-perfect-singular":"generalizai","indicative-perfect-second-person-singular":"generalizași","indicative-perfect-singular-third-person":"generaliză","first-person-indicative-perfect-plural":"generalizarăm","indicative-perfect-plural-second-person":"generalizarăți","indicative-perfect-plural-third-person":"generalizară","first-person-indicative-pluperfect-singular":"generalizasem","indicative-pluperfect-second-person-singular":"generalizaseși","indicative-pluperfect-singular-third-person":"generalizase","first-person-indicative-pluperfect-plural":"generalizaserăm","indicative-pluperfect-plural-second-person":"generalizaserăți","indicative-pluperfect-plural-third-person":"generalizaseră","first-person-present-singular-subjunctive":"să generalizez","present-second-person-singular-subjunctive":"să generalizezi","present-singular-subjunctive-third-person":"să generalizeze","first-person-plural-present-subjunctive":"să generalizăm","plural-present-second-person-subjunctive":"să generalizați","plural-present-subjunctive-third-person":"să generalizeze","imperative-second-person-singular":"generalizează","imperative-plural-second-person":"generalizați","imperative-negative-second-person-singular":"nu generaliza","imperative-negative-plural-second-person":"nu generalizați"}},{"word":"generalizabil","pos":"adj","definitions":["generalizable (generally applicable)"],"forms":{"feminine-singular":"generalizabilă","masculine-plural":"generalizabili","feminine-neuter-plural":"generalizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generalizabil","error-unrecognized-form-feminine-indefinite-singular":"generalizabilă","error-unrecognized-form-indefinite-masculine-plural":"generalizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"generalizabile","definite-error-unrecognized-form-masculine-neuter-singular":"generalizabilul","definite-error-unrecognized-form-feminine-singular":"generalizabila","definite-error-unrecognized-form-masculine-plural":"generalizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"generalizabilele"}},{"word":"generalizare","pos":"noun","definitions":["generalization"],"forms":{"plural":"generalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"generalizare","accusative-definite-nominative-singular":"generalizarea","accusative-indefinite-nominative-plural":"generalizări","accusative-definite-nominative-plural":"generalizările","dative-genitive-indefinite-singular":"generalizări","dative-definite-genitive-singular":"generalizării","dative-genitive-indefinite-plural":"generalizări","dative-definite-genitive-plural":"generalizărilor","singular-vocative":"generalizare","plural-vocative":"generalizărilor"}},{"word":"generalizat","pos":"adj","definitions":["generalized"],"forms":{"feminine-singular":"generalizată","masculine-plural":"generalizați","feminine-neuter-plural":"generalizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generalizat","error-unrecognized-form-feminine-indefinite-singular":"generalizată","error-unrecognized-form-indefinite-masculine-plural":"generalizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"generalizate","definite-error-unrecognized-form-masculine-neuter-singular":"generalizatul","definite-error-unrecognized-form-feminine-singular":"generalizata","definite-error-unrecognized-form-masculine-plural":"generalizații","definite-error-unrecognized-form-feminine-neuter-plural":"generalizatele"}},{"word":"generalizator","pos":"adj","definitions":["generalizing"],"forms":{"feminine-singular":"generalizatoare","masculine-plural":"generalizatori","feminine-neuter-plural":"generalizatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generalizator","error-unrecognized-form-feminine-indefinite-singular":"generalizatoare","error-unrecognized-form-indefinite-masculine-plural":"generalizatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"generalizatoare","definite-error-unrecognized-form-masculine-neuter-singular":"generalizatorul","definite-error-unrecognized-form-feminine-singular":"generalizatoarea","definite-error-unrecognized-form-masculine-plural":"generalizatorii","definite-error-unrecognized-form-feminine-neuter-plural":"generalizatoarele"}},{"word":"generalmente","pos":"adv","definitions":["generally"]},{"word":"generare","pos":"noun","definitions":["generation, creation"],"forms":{"plural":"generări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"generare","accusative-definite-nominative-singular":"generarea","accusative-indefinite-nominative-plural":"generări","accusative-definite-nominative-plural":"generările","dative-genitive-indefinite-singular":"generări","dative-definite-genitive-singular":"generării","dative-genitive-indefinite-plural":"generări","dative-definite-genitive-plural":"generărilor","singular-vocative":"generare","plural-vocative":"generărilor"}},{"word":"generat","pos":"adj","definitions":["generated"],"forms":{"feminine-singular":"generată","masculine-plural":"generați","feminine-neuter-plural":"generate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generat","error-unrecognized-form-feminine-indefinite-singular":"generată","error-unrecognized-form-indefinite-masculine-plural":"generați","error-unrecognized-form-feminine-indefinite-neuter-plural":"generate","definite-error-unrecognized-form-masculine-neuter-singular":"generatul","definite-error-unrecognized-form-feminine-singular":"generata","definite-error-unrecognized-form-masculine-plural":"generații","definite-error-unrecognized-form-feminine-neuter-plural":"generatele"}},{"word":"generat","pos":"verb","definitions":["past participle of genera"],"forms":{"participle-past":"of genera"}},{"word":"Generația X","pos":"name","definitions":["Generation X"],"gender":"f"},{"word":"generație","pos":"noun","definitions":["age, generation","lifetime"],"pronunciation":"[d͡ʒe.neˈra.t͡si.e]","forms":{"plural":"generații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"generație","accusative-definite-nominative-singular":"generația","accusative-indefinite-nominative-plural":"generații","accusative-definite-nominative-plural":"generațiile","dative-genitive-indefinite-singular":"generații","dative-definite-genitive-singular":"generației","dative-genitive-indefinite-plural":"generații","dative-definite-genitive-plural":"generațiilor","singular-vocative":"generație","plural-vocative":"generațiilor"}},{"word":"generațiune","pos":"noun","definitions":["obsolete form of generație"],"forms":{"plural":"generațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"generațiune","accusative-definite-nominative-singular":"generațiunea","accusative-indefinite-nominative-plural":"generațiuni","accusative-definite-nominative-plural":"generațiunile","dative-genitive-indefinite-singular":"generațiuni","dative-definite-genitive-singular":"generațiunii","dative-genitive-indefinite-plural":"generațiuni","dative-definite-genitive-plural":"generațiunilor","singular-vocative":"generațiune","plural-vocative":"generațiunilor"}},{"word":"generativ","pos":"adj","definitions":["generative"],"forms":{"feminine-singular":"generativă","masculine-plural":"generativi","feminine-neuter-plural":"generative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generativ","error-unrecognized-form-feminine-indefinite-singular":"generativă","error-unrecognized-form-indefinite-masculine-plural":"generativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"generative","definite-error-unrecognized-form-masculine-neuter-singular":"generativul","definite-error-unrecognized-form-feminine-singular":"generativa","definite-error-unrecognized-form-masculine-plural":"generativii","definite-error-unrecognized-form-feminine-neuter-plural":"generativele"}},{"word":"generativism","pos":"noun","definitions":["generativism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"generativism","accusative-definite-nominative":"generativismul","dative-genitive-indefinite":"generativism","dative-definite-genitive":"generativismului","vocative":"generativismule"}},{"word":"generativist","pos":"adj","definitions":["generativist"],"forms":{"feminine-singular":"generativistă","masculine-plural":"generativiști","feminine-neuter-plural":"generativiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generativist","error-unrecognized-form-feminine-indefinite-singular":"generativistă","error-unrecognized-form-indefinite-masculine-plural":"generativiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"generativiste","definite-error-unrecognized-form-masculine-neuter-singular":"generativistul","definite-error-unrecognized-form-feminine-singular":"generativista","definite-error-unrecognized-form-masculine-plural":"generativiștii","definite-error-unrecognized-form-feminine-neuter-plural":"generativistele"}},{"word":"generativistă","pos":"noun","definitions":["female equivalent of generativist"],"forms":{"plural":"generativiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"generativistă","accusative-definite-nominative-singular":"generativista","accusative-indefinite-nominative-plural":"generativiste","accusative-definite-nominative-plural":"generativistele","dative-genitive-indefinite-singular":"generativiste","dative-definite-genitive-singular":"generativistei","dative-genitive-indefinite-plural":"generativiste","dative-definite-genitive-plural":"generativistelor","singular-vocative":"generativistă","plural-vocative":"generativistelor"}},{"word":"generator","pos":"adj","definitions":["generator"],"forms":{"feminine-singular":"generatoare","masculine-plural":"generatori","feminine-neuter-plural":"generatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generator","error-unrecognized-form-feminine-indefinite-singular":"generatoare","error-unrecognized-form-indefinite-masculine-plural":"generatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"generatoare","definite-error-unrecognized-form-masculine-neuter-singular":"generatorul","definite-error-unrecognized-form-feminine-singular":"generatoarea","definite-error-unrecognized-form-masculine-plural":"generatorii","definite-error-unrecognized-form-feminine-neuter-plural":"generatoarele"}},{"word":"generator","pos":"noun","definitions":["generator"],"forms":{"plural":"generatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"generator","accusative-definite-nominative-singular":"generatorul","accusative-indefinite-nominative-plural":"generatoare","accusative-definite-nominative-plural":"generatoarele","dative-genitive-indefinite-singular":"generator","dative-definite-genitive-singular":"generatorului","dative-genitive-indefinite-plural":"generatoare","dative-definite-genitive-plural":"generatoarelor","singular-vocative":"generatorule","plural-vocative":"generatoarelor"}},{"word":"generatrice","pos":"noun","definitions":["generatrix"],"forms":{"plural":"generatrice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"generatrice","accusative-definite-nominative-singular":"generatricea","accusative-indefinite-nominative-plural":"generatrice","accusative-definite-nominative-plural":"generatricele","dative-genitive-indefinite-singular":"generatrice","dative-definite-genitive-singular":"generatricei","dative-genitive-indefinite-plural":"generatrice","dative-definite-genitive-plural":"generatricelor","singular-vocative":"generatrice","plural-vocative":"generatricelor"}},{"word":"genere","pos":"noun","definitions":["generally"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"genere","accusative-definite-nominative":"genereul","dative-genitive-indefinite":"genere","dative-definite-genitive":"genereului","vocative":"genereule"}},{"word":"generic","pos":"adj","definitions":["generic"],"pronunciation":"/dʒeˈne.rik/","forms":{"feminine-singular":"generică","masculine-plural":"generici","feminine-neuter-plural":"generice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"generic","error-unrecognized-form-feminine-indefinite-singular":"generică","error-unrecognized-form-indefinite-masculine-plural":"generici","error-unrecognized-form-feminine-indefinite-neuter-plural":"generice","definite-error-unrecognized-form-masculine-neuter-singular":"genericul","definite-error-unrecognized-form-feminine-singular":"generica","definite-error-unrecognized-form-masculine-plural":"genericii","definite-error-unrecognized-form-feminine-neuter-plural":"genericele"}},{"word":"generic","pos":"noun","definitions":["credits, titles"],"pronunciation":"/dʒeˈne.rik/","forms":{"plural":"generice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"generic","accusative-definite-nominative-singular":"genericul","accusative-indefinite-nominative-plural":"generice","accusative-definite-nominative-plural":"genericele","dative-genitive-indefinite-singular":"generic","dative-definite-genitive-singular":"genericului","dative-genitive-indefinite-plural":"generice","dative-definite-genitive-plural":"genericelor","singular-vocative":"genericule","plural-vocative":"genericelor"}},{"word":"generos","pos":"adj","definitions":["generous"],"forms":{"feminine-singular":"generoasă","masculine-plural":"generoși","feminine-neuter-plural":"generoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"generos","error-unrecognized-form-feminine-indefinite-singular":"generoasă","error-unrecognized-form-indefinite-masculine-plural":"generoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"generoase","definite-error-unrecognized-form-masculine-neuter-singular":"generosul","definite-error-unrecognized-form-feminine-singular":"generoasa","definite-error-unrecognized-form-masculine-plural":"generoșii","definite-error-unrecognized-form-feminine-neuter-plural":"generoasele"}},{"word":"generozitate","pos":"noun","definitions":["generosity","magnanimity"],"forms":{"plural":"generozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"generozitate","accusative-definite-nominative":"generozitatea","dative-genitive-indefinite":"generozități","dative-definite-genitive":"generozității","vocative":"generozitate"}},{"word":"genetic","pos":"adj","definitions":["genetic"],"pronunciation":"[d͡ʒeˈne.tik]","forms":{"feminine-singular":"genetică","masculine-plural":"genetici","feminine-neuter-plural":"genetice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"genetic","error-unrecognized-form-feminine-indefinite-singular":"genetică","error-unrecognized-form-indefinite-masculine-plural":"genetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"genetice","definite-error-unrecognized-form-masculine-neuter-singular":"geneticul","definite-error-unrecognized-form-feminine-singular":"genetica","definite-error-unrecognized-form-masculine-plural":"geneticii","definite-error-unrecognized-form-feminine-neuter-plural":"geneticele"}},{"word":"genetica","pos":"noun","definitions":["definite nominative/accusative singular of genetică"],"pronunciation":"[d͡ʒeˈnetika]","gender":"f"},{"word":"genetică","pos":"adj","definitions":["nominative/accusative feminine singular of genetic"],"pronunciation":"[d͡ʒeˈne.ti.kə]"},{"word":"genetică","pos":"noun","definitions":["genetics"],"pronunciation":"[d͡ʒeˈne.ti.kə]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"genetică","accusative-definite-nominative":"genetica","dative-genitive-indefinite":"genetici","dative-definite-genitive":"geneticii","vocative":"genetică"}},{"word":"genetici","pos":"adj","definitions":["nominative/accusative masculine plural of genetic"],"pronunciation":"[d͡ʒeˈnetit͡ʃʲ]","gender":"m-p"},{"word":"genetici","pos":"noun","definitions":["indefinite genitive/dative singular of genetică"],"pronunciation":"[d͡ʒeˈnetit͡ʃʲ]","gender":"f"},{"word":"genetician","pos":"noun","definitions":["geneticist"],"pronunciation":"/d͡ʒe.ne.ti.t͡ʃiˈan/","forms":{"plural":"geneticieni","feminine":"equivalent geneticiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genetician","accusative-definite-nominative-singular":"geneticianul","accusative-indefinite-nominative-plural":"geneticieni","accusative-definite-nominative-plural":"geneticienii","dative-genitive-indefinite-singular":"genetician","dative-definite-genitive-singular":"geneticianului","dative-genitive-indefinite-plural":"geneticieni","dative-definite-genitive-plural":"geneticienilor","singular-vocative":"geneticianule","plural-vocative":"geneticienilor"}},{"word":"geneticiană","pos":"noun","definitions":["female equivalent of genetician"],"pronunciation":"/d͡ʒe.ne.ti.t͡ʃiˈa.nə/","forms":{"plural":"geneticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"geneticiană","accusative-definite-nominative-singular":"geneticiana","accusative-indefinite-nominative-plural":"geneticiene","accusative-definite-nominative-plural":"geneticienele","dative-genitive-indefinite-singular":"geneticiene","dative-definite-genitive-singular":"geneticienei","dative-genitive-indefinite-plural":"geneticiene","dative-definite-genitive-plural":"geneticienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"geneticiene","pos":"noun","definitions":["plural of geneticiană"],"gender":"f"},{"word":"geneticieni","pos":"noun","definitions":["plural of genetician"],"gender":"m"},{"word":"genetico","pos":"noun","definitions":["vocative singular of genetică"],"pronunciation":"[d͡ʒeˈnetiko]","gender":"f"},{"word":"genetist","pos":"adj","definitions":["genetician"],"forms":{"feminine-singular":"genetistă","masculine-plural":"genetiști","feminine-neuter-plural":"genetiste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genetist","error-unrecognized-form-feminine-indefinite-singular":"genetistă","error-unrecognized-form-indefinite-masculine-plural":"genetiști","error-unrecognized-form-feminine-indefinite-neuter-plural":"genetiste","definite-error-unrecognized-form-masculine-neuter-singular":"genetistul","definite-error-unrecognized-form-feminine-singular":"genetista","definite-error-unrecognized-form-masculine-plural":"genetiștii","definite-error-unrecognized-form-feminine-neuter-plural":"genetistele"}},{"word":"genetista","pos":"noun","definitions":["definite nominative/accusative singular of genetistă"]},{"word":"genetistă","pos":"noun","definitions":["female equivalent of genetist"],"forms":{"plural":"genetiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"genetistă","accusative-definite-nominative-singular":"genetista","accusative-indefinite-nominative-plural":"genetiste","accusative-definite-nominative-plural":"genetistele","dative-genitive-indefinite-singular":"genetiste","dative-definite-genitive-singular":"genetistei","dative-genitive-indefinite-plural":"genetiste","dative-definite-genitive-plural":"genetistelor","singular-vocative":"genetistă","plural-vocative":"genetistelor"}},{"word":"genetiv","pos":"noun","definitions":["obsolete form of genitiv"],"forms":{"plural":"genetive","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"genetiv","accusative-definite-nominative-singular":"genetivul","accusative-indefinite-nominative-plural":"genetive","accusative-definite-nominative-plural":"genetivele","dative-genitive-indefinite-singular":"genetiv","dative-definite-genitive-singular":"genetivului","dative-genitive-indefinite-plural":"genetive","dative-definite-genitive-plural":"genetivelor","singular-vocative":"genetivule","plural-vocative":"genetivelor"}},{"word":"geneza","pos":"noun","definitions":["nominative/accusative definite singular of geneză"],"gender":"f"},{"word":"geneză","pos":"noun","definitions":["genesis"],"forms":{"plural":"geneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geneză","accusative-definite-nominative-singular":"geneza","accusative-indefinite-nominative-plural":"geneze","accusative-definite-nominative-plural":"genezele","dative-genitive-indefinite-singular":"geneze","dative-definite-genitive-singular":"genezei","dative-genitive-indefinite-plural":"geneze","dative-definite-genitive-plural":"genezelor","singular-vocative":"geneză","plural-vocative":"genezelor"}},{"word":"geneze","pos":"noun","definitions":["inflection of geneză:","genitive/dative indefinite singular","nominative/accusative/genitive/dative indefinite plural"],"gender":"f"},{"word":"genezei","pos":"noun","definitions":["genitive/dative definite singular of geneză"],"gender":"f"},{"word":"genezele","pos":"noun","definitions":["nominative/accusative definite plural of geneză"],"gender":"f"},{"word":"genezelor","pos":"noun","definitions":["inflection of geneză:","genitive/dative definite plural","vocative plural"],"gender":"f"},{"word":"genezic","pos":"adj","definitions":["reproductive","genetic"],"forms":{"feminine-singular":"genezică","masculine-plural":"genezici","feminine-neuter-plural":"genezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genezic","error-unrecognized-form-feminine-indefinite-singular":"genezică","error-unrecognized-form-indefinite-masculine-plural":"genezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"genezice","definite-error-unrecognized-form-masculine-neuter-singular":"genezicul","definite-error-unrecognized-form-feminine-singular":"genezica","definite-error-unrecognized-form-masculine-plural":"genezicii","definite-error-unrecognized-form-feminine-neuter-plural":"genezicele"}},{"word":"geneziologie","pos":"noun","definitions":["genesiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geneziologie","accusative-definite-nominative":"geneziologia","dative-genitive-indefinite":"geneziologii","dative-definite-genitive":"geneziologiei","vocative":"geneziologie"}},{"word":"genezo","pos":"noun","definitions":["vocative singular of geneză"],"gender":"f"},{"word":"genial","pos":"adj","definitions":["ingenious, characteristic of a genius","great, fantastic, awesome"],"forms":{"feminine-singular":"genială","masculine-plural":"geniali","feminine-neuter-plural":"geniale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genial","error-unrecognized-form-feminine-indefinite-singular":"genială","error-unrecognized-form-indefinite-masculine-plural":"geniali","error-unrecognized-form-feminine-indefinite-neuter-plural":"geniale","definite-error-unrecognized-form-masculine-neuter-singular":"genialul","definite-error-unrecognized-form-feminine-singular":"geniala","definite-error-unrecognized-form-masculine-plural":"genialii","definite-error-unrecognized-form-feminine-neuter-plural":"genialele"}},{"word":"genialitate","pos":"noun","definitions":["giftedness","genius (mental capacity), ingenuity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"genialitate","accusative-definite-nominative":"genialitatea","dative-genitive-indefinite":"genialități","dative-definite-genitive":"genialității","vocative":"genialitate"}},{"word":"geniculat","pos":"adj","definitions":["geniculate"],"forms":{"feminine-singular":"geniculată","masculine-plural":"geniculați","feminine-neuter-plural":"geniculate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geniculat","error-unrecognized-form-feminine-indefinite-singular":"geniculată","error-unrecognized-form-indefinite-masculine-plural":"geniculați","error-unrecognized-form-feminine-indefinite-neuter-plural":"geniculate","definite-error-unrecognized-form-masculine-neuter-singular":"geniculatul","definite-error-unrecognized-form-feminine-singular":"geniculata","definite-error-unrecognized-form-masculine-plural":"geniculații","definite-error-unrecognized-form-feminine-neuter-plural":"geniculatele"}},{"word":"genist","pos":"noun","definitions":["engineer"],"forms":{"plural":"geniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genist","accusative-definite-nominative-singular":"genistul","accusative-indefinite-nominative-plural":"genisti","accusative-definite-nominative-plural":"genistii","dative-genitive-indefinite-singular":"genist","dative-definite-genitive-singular":"genistului","dative-genitive-indefinite-plural":"genisti","dative-definite-genitive-plural":"genistilor","singular-vocative":"genistule","plural-vocative":"genistilor"}},{"word":"geniță","pos":"noun","definitions":["diminutive of geană"],"forms":{"plural":"genițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geniță","accusative-definite-nominative-singular":"genița","accusative-indefinite-nominative-plural":"genițe","accusative-definite-nominative-plural":"genițele","dative-genitive-indefinite-singular":"genițe","dative-definite-genitive-singular":"geniței","dative-genitive-indefinite-plural":"genițe","dative-definite-genitive-plural":"genițelor","singular-vocative":"geniță","plural-vocative":"genițelor"}},{"word":"genital","pos":"adj","definitions":["genital"],"pronunciation":"/d͡ʒe.niˈtal/","forms":{"feminine-singular":"genitală","masculine-plural":"genitali","feminine-neuter-plural":"genitale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genital","error-unrecognized-form-feminine-indefinite-singular":"genitală","error-unrecognized-form-indefinite-masculine-plural":"genitali","error-unrecognized-form-feminine-indefinite-neuter-plural":"genitale","definite-error-unrecognized-form-masculine-neuter-singular":"genitalul","definite-error-unrecognized-form-feminine-singular":"genitala","definite-error-unrecognized-form-masculine-plural":"genitalii","definite-error-unrecognized-form-feminine-neuter-plural":"genitalele"}},{"word":"genitiv","pos":"noun","definitions":["the genitive case"],"forms":{"plural":"genitive","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"genitiv","accusative-definite-nominative-singular":"genitivul","accusative-indefinite-nominative-plural":"genitive","accusative-definite-nominative-plural":"genitivele","dative-genitive-indefinite-singular":"genitiv","dative-definite-genitive-singular":"genitivului","dative-genitive-indefinite-plural":"genitive","dative-definite-genitive-plural":"genitivelor","singular-vocative":"genitivule","plural-vocative":"genitivelor"}},{"word":"genitival","pos":"adj","definitions":["genitival"],"forms":{"feminine-singular":"genitivală","masculine-plural":"genitivali","feminine-neuter-plural":"genitivale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genitival","error-unrecognized-form-feminine-indefinite-singular":"genitivală","error-unrecognized-form-indefinite-masculine-plural":"genitivali","error-unrecognized-form-feminine-indefinite-neuter-plural":"genitivale","definite-error-unrecognized-form-masculine-neuter-singular":"genitivalul","definite-error-unrecognized-form-feminine-singular":"genitivala","definite-error-unrecognized-form-masculine-plural":"genitivalii","definite-error-unrecognized-form-feminine-neuter-plural":"genitivalele"}},{"word":"genitive","pos":"noun","definitions":["plural of genitiv"]},{"word":"genito-urinar","pos":"adj","definitions":["genitourinary"],"forms":{"feminine-singular":"genito-urinară","masculine-plural":"genito-urinari","feminine-neuter-plural":"genito-urinare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genito-urinar","error-unrecognized-form-feminine-indefinite-singular":"genito-urinară","error-unrecognized-form-indefinite-masculine-plural":"genito-urinari","error-unrecognized-form-feminine-indefinite-neuter-plural":"genito-urinare","definite-error-unrecognized-form-masculine-neuter-singular":"genito-urinarul","definite-error-unrecognized-form-feminine-singular":"genito-urinara","definite-error-unrecognized-form-masculine-plural":"genito-urinarii","definite-error-unrecognized-form-feminine-neuter-plural":"genito-urinarele"}},{"word":"genitor","pos":"noun","definitions":["genitor (biological parent)"],"forms":{"plural":"genitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genitor","accusative-definite-nominative-singular":"genitorul","accusative-indefinite-nominative-plural":"genitori","accusative-definite-nominative-plural":"genitorii","dative-genitive-indefinite-singular":"genitor","dative-definite-genitive-singular":"genitorului","dative-genitive-indefinite-plural":"genitori","dative-definite-genitive-plural":"genitorilor","singular-vocative":"genitorule","plural-vocative":"genitorilor"}},{"word":"geniu","pos":"noun","definitions":["genius","spirit, genie"],"pronunciation":"/ˈdʒe.nju/","forms":{"plural":"genii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geniu","accusative-definite-nominative-singular":"geniul","accusative-indefinite-nominative-plural":"genii","accusative-definite-nominative-plural":"geniile","dative-genitive-indefinite-singular":"geniu","dative-definite-genitive-singular":"geniului","dative-genitive-indefinite-plural":"genii","dative-definite-genitive-plural":"geniilor","singular-vocative":"geniule","plural-vocative":"geniilor"}},{"word":"geno","pos":"noun","definitions":["vocative singular of genă"],"pronunciation":"[ˈd͡ʒeno]","gender":"f"},{"word":"genocid","pos":"noun","definitions":["genocide"],"forms":{"plural":"genociduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"genocid","accusative-definite-nominative-singular":"genocidul","accusative-indefinite-nominative-plural":"genociduri","accusative-definite-nominative-plural":"genocidurile","dative-genitive-indefinite-singular":"genocid","dative-definite-genitive-singular":"genocidului","dative-genitive-indefinite-plural":"genociduri","dative-definite-genitive-plural":"genocidurilor","singular-vocative":"genocidule","plural-vocative":"genocidurilor"}},{"word":"genofond","pos":"noun","definitions":["gene pool"],"forms":{"plural":"genofonduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"genofond","accusative-definite-nominative-singular":"genofondul","accusative-indefinite-nominative-plural":"genofonduri","accusative-definite-nominative-plural":"genofondurile","dative-genitive-indefinite-singular":"genofond","dative-definite-genitive-singular":"genofondului","dative-genitive-indefinite-plural":"genofonduri","dative-definite-genitive-plural":"genofondurilor","singular-vocative":"genofondule","plural-vocative":"genofondurilor"}},{"word":"Genoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Genoiu"}},{"word":"genom","pos":"noun","definitions":["genome"],"forms":{"plural":"genoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"genom","accusative-definite-nominative-singular":"genomul","accusative-indefinite-nominative-plural":"genoame","accusative-definite-nominative-plural":"genoamele","dative-genitive-indefinite-singular":"genom","dative-definite-genitive-singular":"genomului","dative-genitive-indefinite-plural":"genoame","dative-definite-genitive-plural":"genoamelor","singular-vocative":"genomule","plural-vocative":"genoamelor"}},{"word":"genos","pos":"adj","definitions":["having big eyelashes"],"forms":{"feminine-singular":"genoasă","masculine-plural":"genoși","feminine-neuter-plural":"genoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genos","error-unrecognized-form-feminine-indefinite-singular":"genoasă","error-unrecognized-form-indefinite-masculine-plural":"genoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"genoase","definite-error-unrecognized-form-masculine-neuter-singular":"genosul","definite-error-unrecognized-form-feminine-singular":"genoasa","definite-error-unrecognized-form-masculine-plural":"genoșii","definite-error-unrecognized-form-feminine-neuter-plural":"genoasele"}},{"word":"genotip","pos":"noun","definitions":["genotype"],"forms":{"plural":"genotipuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"genotip","accusative-definite-nominative-singular":"genotipul","accusative-indefinite-nominative-plural":"genotipuri","accusative-definite-nominative-plural":"genotipurile","dative-genitive-indefinite-singular":"genotip","dative-definite-genitive-singular":"genotipului","dative-genitive-indefinite-plural":"genotipuri","dative-definite-genitive-plural":"genotipurilor","singular-vocative":"genotipule","plural-vocative":"genotipurilor"}},{"word":"genotipic","pos":"adj","definitions":["genotypic"],"forms":{"feminine-singular":"genotipică","masculine-plural":"genotipici","feminine-neuter-plural":"genotipice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genotipic","error-unrecognized-form-feminine-indefinite-singular":"genotipică","error-unrecognized-form-indefinite-masculine-plural":"genotipici","error-unrecognized-form-feminine-indefinite-neuter-plural":"genotipice","definite-error-unrecognized-form-masculine-neuter-singular":"genotipicul","definite-error-unrecognized-form-feminine-singular":"genotipica","definite-error-unrecognized-form-masculine-plural":"genotipicii","definite-error-unrecognized-form-feminine-neuter-plural":"genotipicele"}},{"word":"genovez","pos":"adj","definitions":["Genoese, Genovese"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genovez","error-unrecognized-form-feminine-indefinite-singular":"genoveză","error-unrecognized-form-indefinite-masculine-plural":"genovezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"genoveze","definite-error-unrecognized-form-masculine-neuter-singular":"genovezul","definite-error-unrecognized-form-feminine-singular":"genoveza","definite-error-unrecognized-form-masculine-plural":"genovezii","definite-error-unrecognized-form-feminine-neuter-plural":"genovezele"}},{"word":"genți","pos":"noun","definitions":["plural of geantă"],"gender":"f-p"},{"word":"gențiană","pos":"noun","definitions":["gentian"],"forms":{"plural":"gențiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gențiană","accusative-definite-nominative-singular":"gențiana","accusative-indefinite-nominative-plural":"gențiane","accusative-definite-nominative-plural":"gențianele","dative-genitive-indefinite-singular":"gențiane","dative-definite-genitive-singular":"gențianei","dative-genitive-indefinite-plural":"gențiane","dative-definite-genitive-plural":"gențianelor","singular-vocative":"gențiană","plural-vocative":"gențianelor"}},{"word":"gentil","pos":"adj","definitions":["gentile"],"forms":{"feminine-singular":"gentilă","masculine-plural":"gentili","feminine-neuter-plural":"gentile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gentil","error-unrecognized-form-feminine-indefinite-singular":"gentilă","error-unrecognized-form-indefinite-masculine-plural":"gentili","error-unrecognized-form-feminine-indefinite-neuter-plural":"gentile","definite-error-unrecognized-form-masculine-neuter-singular":"gentilul","definite-error-unrecognized-form-feminine-singular":"gentila","definite-error-unrecognized-form-masculine-plural":"gentilii","definite-error-unrecognized-form-feminine-neuter-plural":"gentilele"}},{"word":"gentilețe","pos":"noun","definitions":["kindness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"gentilețe","accusative-definite-nominative":"gentilețea","dative-genitive-indefinite":"gentilețe","dative-definite-genitive":"gentileței","vocative":"gentilețe"}},{"word":"gentilic","pos":"adj","definitions":["gentilicial"],"forms":{"feminine-singular":"gentilică","masculine-plural":"gentilici","feminine-neuter-plural":"gentilice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gentilic","error-unrecognized-form-feminine-indefinite-singular":"gentilică","error-unrecognized-form-indefinite-masculine-plural":"gentilici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gentilice","definite-error-unrecognized-form-masculine-neuter-singular":"gentilicul","definite-error-unrecognized-form-feminine-singular":"gentilica","definite-error-unrecognized-form-masculine-plural":"gentilicii","definite-error-unrecognized-form-feminine-neuter-plural":"gentilicele"}},{"word":"gentilom","pos":"noun","definitions":["gentleman"],"forms":{"plural":"gentilomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gentilom","accusative-definite-nominative-singular":"gentilomul","accusative-indefinite-nominative-plural":"gentilomi","accusative-definite-nominative-plural":"gentilomii","dative-genitive-indefinite-singular":"gentilom","dative-definite-genitive-singular":"gentilomului","dative-genitive-indefinite-plural":"gentilomi","dative-definite-genitive-plural":"gentilomilor","singular-vocative":"gentilomule","plural-vocative":"gentilomilor"}},{"word":"gentleman","pos":"noun","definitions":["gentleman"],"forms":{"plural":"gentlemeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gentleman","accusative-definite-nominative-singular":"gentlemanul","accusative-indefinite-nominative-plural":"gentlemeni","accusative-definite-nominative-plural":"gentlemenii","dative-genitive-indefinite-singular":"gentleman","dative-definite-genitive-singular":"gentlemanului","dative-genitive-indefinite-plural":"gentlemeni","dative-definite-genitive-plural":"gentlemenilor","singular-vocative":"gentlemanule","plural-vocative":"gentlemenilor"}},{"word":"gentuliță","pos":"noun","definitions":["diminutive of geantă; small bag"],"forms":{"plural":"gentulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gentuliță","accusative-definite-nominative-singular":"gentulița","accusative-indefinite-nominative-plural":"gentulițe","accusative-definite-nominative-plural":"gentulițele","dative-genitive-indefinite-singular":"gentulițe","dative-definite-genitive-singular":"gentuliței","dative-genitive-indefinite-plural":"gentulițe","dative-definite-genitive-plural":"gentulițelor","singular-vocative":"gentuliță","plural-vocative":"gentulițelor"}},{"word":"gentuță","pos":"noun","definitions":["diminutive of geantă; small bag"],"forms":{"plural":"gentuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gentuță","accusative-definite-nominative-singular":"gentuța","accusative-indefinite-nominative-plural":"gentuțe","accusative-definite-nominative-plural":"gentuțele","dative-genitive-indefinite-singular":"gentuțe","dative-definite-genitive-singular":"gentuței","dative-genitive-indefinite-plural":"gentuțe","dative-definite-genitive-plural":"gentuțelor","singular-vocative":"gentuță","plural-vocative":"gentuțelor"}},{"word":"genuche","pos":"noun","definitions":["alternative form of genunchi"],"forms":{"plural":"genuchi"}},{"word":"genuchi","pos":"noun","definitions":["alternative form of genunchi"],"forms":{"plural":"genuchi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genuchi","accusative-definite-nominative-singular":"genuchiul","accusative-indefinite-nominative-plural":"genuchi","accusative-definite-nominative-plural":"genuchii","dative-genitive-indefinite-singular":"genuchi","dative-definite-genitive-singular":"genuchiului","dative-genitive-indefinite-plural":"genuchi","dative-definite-genitive-plural":"genuchilor","singular-vocative":"genuchiule","plural-vocative":"genuchilor"}},{"word":"genuflexiune","pos":"noun","definitions":["genuflexion"],"forms":{"plural":"genuflexiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"genuflexiune","accusative-definite-nominative-singular":"genuflexiunea","accusative-indefinite-nominative-plural":"genuflexiune","accusative-definite-nominative-plural":"genuflexiunele","dative-genitive-indefinite-singular":"genuflexiune","dative-definite-genitive-singular":"genuflexiunei","dative-genitive-indefinite-plural":"genuflexiune","dative-definite-genitive-plural":"genuflexiunelor","singular-vocative":"genuflexiune","plural-vocative":"genuflexiunelor"}},{"word":"genuin","pos":"adj","definitions":["innate, native, natural"],"forms":{"feminine-singular":"genuină","masculine-plural":"genuini","feminine-neuter-plural":"genuine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"genuin","error-unrecognized-form-feminine-indefinite-singular":"genuină","error-unrecognized-form-indefinite-masculine-plural":"genuini","error-unrecognized-form-feminine-indefinite-neuter-plural":"genuine","definite-error-unrecognized-form-masculine-neuter-singular":"genuinul","definite-error-unrecognized-form-feminine-singular":"genuina","definite-error-unrecognized-form-masculine-plural":"genuinii","definite-error-unrecognized-form-feminine-neuter-plural":"genuinele"}},{"word":"genuinitate","pos":"noun","definitions":["genuinity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"genuinitate","accusative-definite-nominative":"genuinitatea","dative-genitive-indefinite":"genuinități","dative-definite-genitive":"genuinității","vocative":"genuinitate"}},{"word":"genul","pos":"noun","definitions":["definite nominative/accusative singular of gen"]},{"word":"genule","pos":"noun","definitions":["vocative singular of gen"]},{"word":"genulieră","pos":"noun","definitions":["knee pad"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"genulieră","accusative-definite-nominative":"genuliera","dative-genitive-indefinite":"genuliere","dative-definite-genitive":"genulierei","vocative":"genulieră"}},{"word":"genului","pos":"noun","definitions":["definite dative/genitive singular of gen"]},{"word":"genună","pos":"noun","definitions":["obsolete form of genune"],"forms":{"plural":"genuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"genună","accusative-definite-nominative-singular":"genuna","accusative-indefinite-nominative-plural":"genuni","accusative-definite-nominative-plural":"genunile","dative-genitive-indefinite-singular":"genuni","dative-definite-genitive-singular":"genunii","dative-genitive-indefinite-plural":"genuni","dative-definite-genitive-plural":"genunilor","singular-vocative":"genună","plural-vocative":"genunilor"}},{"word":"genunche","pos":"noun","definitions":["alternative form of genunchi"],"forms":{"plural":"genunchi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"genunche","accusative-definite-nominative-singular":"genunchele","accusative-indefinite-nominative-plural":"genunchi","accusative-definite-nominative-plural":"genunchii","dative-genitive-indefinite-singular":"genunche","dative-definite-genitive-singular":"genunchelui","dative-genitive-indefinite-plural":"genunchi","dative-definite-genitive-plural":"genunchilor","singular-vocative":"genunche","plural-vocative":"genunchilor"}},{"word":"genuncher","pos":"noun","definitions":["knee-long peasant's coat"],"forms":{"plural":"genunchere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"genuncher","accusative-definite-nominative-singular":"genuncherul","accusative-indefinite-nominative-plural":"genunchere","accusative-definite-nominative-plural":"genuncherele","dative-genitive-indefinite-singular":"genuncher","dative-definite-genitive-singular":"genuncherului","dative-genitive-indefinite-plural":"genunchere","dative-definite-genitive-plural":"genuncherelor","singular-vocative":"genuncherule","plural-vocative":"genuncherelor"}},{"word":"Genunchi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Genunchi"}},{"word":"genunchi","pos":"noun","definitions":["knee"],"pronunciation":"[dʒeˈnunkʲ]","forms":{"plural":"genunchi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"genunchi","accusative-definite-nominative-singular":"genunchiul","accusative-indefinite-nominative-plural":"genunchi","accusative-definite-nominative-plural":"genunchii","dative-genitive-indefinite-singular":"genunchi","dative-definite-genitive-singular":"genunchiului","dative-genitive-indefinite-plural":"genunchi","dative-definite-genitive-plural":"genunchilor","singular-vocative":"genunchiule","plural-vocative":"genunchilor","alternative":"genuchi"}},{"word":"genunchieră","pos":"noun","definitions":["knee pad (woollen or cotton braid, special bandage, etc. used to cover the knee to protect it, for sports or certain types of work)"],"pronunciation":"/d͡ʒe.nun.kiˈe.rə/","forms":{"plural":"genunchiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"genunchieră","accusative-definite-nominative-singular":"genunchiera","accusative-indefinite-nominative-plural":"genunchiere","accusative-definite-nominative-plural":"genunchierele","dative-genitive-indefinite-singular":"genunchiere","dative-definite-genitive-singular":"genunchierei","dative-genitive-indefinite-plural":"genunchiere","dative-definite-genitive-plural":"genunchierelor","singular-vocative":"genunchieră","plural-vocative":"genunchierelor"}},{"word":"genune","pos":"noun","definitions":["chasm, abyss, precipice","sea"],"forms":{"plural":"genuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"genune","accusative-definite-nominative-singular":"genunea","accusative-indefinite-nominative-plural":"genuni","accusative-definite-nominative-plural":"genunile","dative-genitive-indefinite-singular":"genuni","dative-definite-genitive-singular":"genunii","dative-genitive-indefinite-plural":"genuni","dative-definite-genitive-plural":"genunilor","singular-vocative":"genune","plural-vocative":"genunilor","alternative":"genună","alternative-Transylvania-regional":"gerune","alternative-archaic":"gerure"}},{"word":"Genuneni","pos":"name","definitions":["a village in Frâncești, Vâlcea County, Romania"],"gender":"m"},{"word":"genuri","pos":"noun","definitions":["plural of gen"]},{"word":"genurile","pos":"noun","definitions":["definite nominative/accusative plural of gen"]},{"word":"genurilor","pos":"noun","definitions":["inflection of gen:","definite genitive/dative plural","vocative plural"]},{"word":"Geoagiu","pos":"name","definitions":["a city in Hunedoara County, Romania"],"gender":"m"},{"word":"Geoagiu de Sus","pos":"name","definitions":["a village in Stremț, Alba County, Romania"],"gender":"m"},{"word":"Geoagiu-Băi","pos":"name","definitions":["a village in Geoagiu, Hunedoara County, Romania"],"gender":"m"},{"word":"geobiologie","pos":"noun","definitions":["geobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geobiologie","accusative-definite-nominative":"geobiologia","dative-genitive-indefinite":"geobiologii","dative-definite-genitive":"geobiologiei","vocative":"geobiologie"}},{"word":"geobotanic","pos":"adj","definitions":["geobotanical"],"forms":{"feminine-singular":"geobotanică","masculine-plural":"geobotanici","feminine-neuter-plural":"geobotanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geobotanic","error-unrecognized-form-feminine-indefinite-singular":"geobotanică","error-unrecognized-form-indefinite-masculine-plural":"geobotanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geobotanice","definite-error-unrecognized-form-masculine-neuter-singular":"geobotanicul","definite-error-unrecognized-form-feminine-singular":"geobotanica","definite-error-unrecognized-form-masculine-plural":"geobotanicii","definite-error-unrecognized-form-feminine-neuter-plural":"geobotanicele"}},{"word":"geobotanică","pos":"noun","definitions":["geobotany"],"forms":{"plural":"geobotanici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geobotanică","accusative-definite-nominative-singular":"geobotanica","accusative-indefinite-nominative-plural":"geobotanici","accusative-definite-nominative-plural":"geobotanicile","dative-genitive-indefinite-singular":"geobotanici","dative-definite-genitive-singular":"geobotanicii","dative-genitive-indefinite-plural":"geobotanici","dative-definite-genitive-plural":"geobotanicilor","singular-vocative":"geobotanică","plural-vocative":"geobotanicilor"}},{"word":"geobotanist","pos":"noun","definitions":["geobotanist"],"forms":{"plural":"geobotaniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geobotanist","accusative-definite-nominative-singular":"geobotanistul","accusative-indefinite-nominative-plural":"geobotaniști","accusative-definite-nominative-plural":"geobotaniștii","dative-genitive-indefinite-singular":"geobotanist","dative-definite-genitive-singular":"geobotanistului","dative-genitive-indefinite-plural":"geobotaniști","dative-definite-genitive-plural":"geobotaniștilor","singular-vocative":"geobotanistule","plural-vocative":"geobotaniștilor"}},{"word":"geobotanistă","pos":"noun","definitions":["female equivalent of geobotanist"],"forms":{"plural":"geobotaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geobotanistă","accusative-definite-nominative-singular":"geobotanista","accusative-indefinite-nominative-plural":"geobotaniste","accusative-definite-nominative-plural":"geobotanistele","dative-genitive-indefinite-singular":"geobotaniste","dative-definite-genitive-singular":"geobotanistei","dative-genitive-indefinite-plural":"geobotaniste","dative-definite-genitive-plural":"geobotanistelor","singular-vocative":"geobotanistă","plural-vocative":"geobotanistelor"}},{"word":"geocancerologie","pos":"noun","definitions":["geocancerology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geocancerologie","accusative-definite-nominative-singular":"geocancerologia","accusative-indefinite-nominative-plural":"geocancerologii","accusative-definite-nominative-plural":"geocancerologiile","dative-genitive-indefinite-singular":"geocancerologii","dative-definite-genitive-singular":"geocancerologiei","dative-genitive-indefinite-plural":"geocancerologii","dative-definite-genitive-plural":"geocancerologiilor","singular-vocative":"geocancerologie","plural-vocative":"geocancerologiilor"}},{"word":"geocentric","pos":"adj","definitions":["geocentric"],"pronunciation":"/d͡ʒe.oˈt͡ʃen.trik/","forms":{"feminine-singular":"geocentrică","masculine-plural":"geocentrici","feminine-neuter-plural":"geocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geocentric","error-unrecognized-form-feminine-indefinite-singular":"geocentrică","error-unrecognized-form-indefinite-masculine-plural":"geocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"geocentricul","definite-error-unrecognized-form-feminine-singular":"geocentrica","definite-error-unrecognized-form-masculine-plural":"geocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"geocentricele"}},{"word":"geocentrism","pos":"noun","definitions":["geocentrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geocentrism","accusative-definite-nominative":"geocentrismul","dative-genitive-indefinite":"geocentrism","dative-definite-genitive":"geocentrismului","vocative":"geocentrismule"}},{"word":"geochimic","pos":"adj","definitions":["geochemical"],"forms":{"feminine-singular":"geochimică","masculine-plural":"geochimici","feminine-neuter-plural":"geochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geochimic","error-unrecognized-form-feminine-indefinite-singular":"geochimică","error-unrecognized-form-indefinite-masculine-plural":"geochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geochimice","definite-error-unrecognized-form-masculine-neuter-singular":"geochimicul","definite-error-unrecognized-form-feminine-singular":"geochimica","definite-error-unrecognized-form-masculine-plural":"geochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"geochimicele"}},{"word":"geochimie","pos":"noun","definitions":["geochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geochimie","accusative-definite-nominative-singular":"geochimia","accusative-indefinite-nominative-plural":"geochimii","accusative-definite-nominative-plural":"geochimiile","dative-genitive-indefinite-singular":"geochimii","dative-definite-genitive-singular":"geochimiei","dative-genitive-indefinite-plural":"geochimii","dative-definite-genitive-plural":"geochimiilor","singular-vocative":"geochimie","plural-vocative":"geochimiilor"}},{"word":"geochimist","pos":"noun","definitions":["geochemist"],"forms":{"plural":"geochimiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geochimist","accusative-definite-nominative-singular":"geochimistul","accusative-indefinite-nominative-plural":"geochimiști","accusative-definite-nominative-plural":"geochimiștii","dative-genitive-indefinite-singular":"geochimist","dative-definite-genitive-singular":"geochimistului","dative-genitive-indefinite-plural":"geochimiști","dative-definite-genitive-plural":"geochimiștilor","singular-vocative":"geochimistule","plural-vocative":"geochimiștilor"}},{"word":"geochimistă","pos":"noun","definitions":["female equivalent of geochimist"],"forms":{"plural":"geochimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geochimistă","accusative-definite-nominative-singular":"geochimista","accusative-indefinite-nominative-plural":"geochimiste","accusative-definite-nominative-plural":"geochimistele","dative-genitive-indefinite-singular":"geochimiste","dative-definite-genitive-singular":"geochimistei","dative-genitive-indefinite-plural":"geochimiste","dative-definite-genitive-plural":"geochimistelor","singular-vocative":"geochimistă","plural-vocative":"geochimistelor"}},{"word":"geocriologie","pos":"noun","definitions":["geocryology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geocriologie","accusative-definite-nominative-singular":"geocriologia","accusative-indefinite-nominative-plural":"geocriologii","accusative-definite-nominative-plural":"geocriologiile","dative-genitive-indefinite-singular":"geocriologii","dative-definite-genitive-singular":"geocriologiei","dative-genitive-indefinite-plural":"geocriologii","dative-definite-genitive-plural":"geocriologiilor","singular-vocative":"geocriologie","plural-vocative":"geocriologiilor"}},{"word":"geocronologie","pos":"noun","definitions":["geochronology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geocronologie","accusative-definite-nominative":"geocronologia","dative-genitive-indefinite":"geocronologii","dative-definite-genitive":"geocronologiei","vocative":"geocronologie"}},{"word":"geodă","pos":"noun","definitions":["geode"],"forms":{"plural":"geode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geodă","accusative-definite-nominative-singular":"geoda","accusative-indefinite-nominative-plural":"geode","accusative-definite-nominative-plural":"geodele","dative-genitive-indefinite-singular":"geode","dative-definite-genitive-singular":"geodei","dative-genitive-indefinite-plural":"geode","dative-definite-genitive-plural":"geodelor","singular-vocative":"geodă","plural-vocative":"geodelor"}},{"word":"geodez","pos":"noun","definitions":["geodesist"],"forms":{"plural":"geodezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geodez","accusative-definite-nominative-singular":"geodezul","accusative-indefinite-nominative-plural":"geodezi","accusative-definite-nominative-plural":"geodezii","dative-genitive-indefinite-singular":"geodez","dative-definite-genitive-singular":"geodezului","dative-genitive-indefinite-plural":"geodezi","dative-definite-genitive-plural":"geodezilor","singular-vocative":"geodezule","plural-vocative":"geodezilor"}},{"word":"geodeză","pos":"noun","definitions":["female equivalent of geodez"],"forms":{"plural":"geodeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geodeză","accusative-definite-nominative-singular":"geodeza","accusative-indefinite-nominative-plural":"geodeze","accusative-definite-nominative-plural":"geodezele","dative-genitive-indefinite-singular":"geodeze","dative-definite-genitive-singular":"geodezei","dative-genitive-indefinite-plural":"geodeze","dative-definite-genitive-plural":"geodezelor","singular-vocative":"geodeză","plural-vocative":"geodezelor"}},{"word":"geodezic","pos":"adj","definitions":["geodetic"],"forms":{"feminine-singular":"geodezică","masculine-plural":"geodezici","feminine-neuter-plural":"geodezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geodezic","error-unrecognized-form-feminine-indefinite-singular":"geodezică","error-unrecognized-form-indefinite-masculine-plural":"geodezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geodezice","definite-error-unrecognized-form-masculine-neuter-singular":"geodezicul","definite-error-unrecognized-form-feminine-singular":"geodezica","definite-error-unrecognized-form-masculine-plural":"geodezicii","definite-error-unrecognized-form-feminine-neuter-plural":"geodezicele"}},{"word":"geodezie","pos":"noun","definitions":["geodesy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geodezie","accusative-definite-nominative-singular":"geodezia","accusative-indefinite-nominative-plural":"geodezii","accusative-definite-nominative-plural":"geodeziile","dative-genitive-indefinite-singular":"geodezii","dative-definite-genitive-singular":"geodeziei","dative-genitive-indefinite-plural":"geodezii","dative-definite-genitive-plural":"geodeziilor","singular-vocative":"geodezie","plural-vocative":"geodeziilor"}},{"word":"geodimetru","pos":"noun","definitions":["geodimeter"],"forms":{"plural":"geodimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geodimetru","accusative-definite-nominative-singular":"geodimetrul","accusative-indefinite-nominative-plural":"geodimetre","accusative-definite-nominative-plural":"geodimetrele","dative-genitive-indefinite-singular":"geodimetru","dative-definite-genitive-singular":"geodimetrului","dative-genitive-indefinite-plural":"geodimetre","dative-definite-genitive-plural":"geodimetrelor","singular-vocative":"geodimetrule","plural-vocative":"geodimetrelor"}},{"word":"geodinamic","pos":"adj","definitions":["geodynamic"],"forms":{"feminine-singular":"geodinamică","masculine-plural":"geodinamici","feminine-neuter-plural":"geodinamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geodinamic","error-unrecognized-form-feminine-indefinite-singular":"geodinamică","error-unrecognized-form-indefinite-masculine-plural":"geodinamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geodinamice","definite-error-unrecognized-form-masculine-neuter-singular":"geodinamicul","definite-error-unrecognized-form-feminine-singular":"geodinamica","definite-error-unrecognized-form-masculine-plural":"geodinamicii","definite-error-unrecognized-form-feminine-neuter-plural":"geodinamicele"}},{"word":"geodinamică","pos":"noun","definitions":["geodynamics"],"forms":{"plural":"geodinamici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geodinamică","accusative-definite-nominative-singular":"geodinamica","accusative-indefinite-nominative-plural":"geodinamici","accusative-definite-nominative-plural":"geodinamicile","dative-genitive-indefinite-singular":"geodinamici","dative-definite-genitive-singular":"geodinamicii","dative-genitive-indefinite-plural":"geodinamici","dative-definite-genitive-plural":"geodinamicilor","singular-vocative":"geodinamică","plural-vocative":"geodinamicilor"}},{"word":"geofagie","pos":"noun","definitions":["geophagy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geofagie","accusative-definite-nominative":"geofagia","dative-genitive-indefinite":"geofagii","dative-definite-genitive":"geofagiei","vocative":"geofagie"}},{"word":"geofită","pos":"noun","definitions":["geophyte"],"forms":{"plural":"geofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geofită","accusative-definite-nominative-singular":"geofita","accusative-indefinite-nominative-plural":"geofite","accusative-definite-nominative-plural":"geofitele","dative-genitive-indefinite-singular":"geofite","dative-definite-genitive-singular":"geofitei","dative-genitive-indefinite-plural":"geofite","dative-definite-genitive-plural":"geofitelor","singular-vocative":"geofită","plural-vocative":"geofitelor"}},{"word":"geofizic","pos":"adj","definitions":["geophysical"],"forms":{"feminine-singular":"geofizică","masculine-plural":"geofizici","feminine-neuter-plural":"geofizice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geofizic","error-unrecognized-form-feminine-indefinite-singular":"geofizică","error-unrecognized-form-indefinite-masculine-plural":"geofizici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geofizice","definite-error-unrecognized-form-masculine-neuter-singular":"geofizicul","definite-error-unrecognized-form-feminine-singular":"geofizica","definite-error-unrecognized-form-masculine-plural":"geofizicii","definite-error-unrecognized-form-feminine-neuter-plural":"geofizicele"}},{"word":"geofizică","pos":"noun","definitions":["geophysics"],"forms":{"plural":"geofizici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geofizică","accusative-definite-nominative-singular":"geofizica","accusative-indefinite-nominative-plural":"geofizici","accusative-definite-nominative-plural":"geofizicile","dative-genitive-indefinite-singular":"geofizici","dative-definite-genitive-singular":"geofizicii","dative-genitive-indefinite-plural":"geofizici","dative-definite-genitive-plural":"geofizicilor","singular-vocative":"geofizică","plural-vocative":"geofizicilor"}},{"word":"geofizician","pos":"noun","definitions":["geophysicist"],"pronunciation":"/d͡ʒe.o.fi.zi.t͡ʃiˈan/","forms":{"plural":"geofizicieni","feminine":"equivalent geofiziciană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geofizician","accusative-definite-nominative-singular":"geofizicianul","accusative-indefinite-nominative-plural":"geofizicieni","accusative-definite-nominative-plural":"geofizicienii","dative-genitive-indefinite-singular":"geofizician","dative-definite-genitive-singular":"geofizicianului","dative-genitive-indefinite-plural":"geofizicieni","dative-definite-genitive-plural":"geofizicienilor","singular-vocative":"geofizicianule","plural-vocative":"geofizicienilor"}},{"word":"geofiziciană","pos":"noun","definitions":["female equivalent of geofizician"],"pronunciation":"/d͡ʒe.o.fi.zi.t͡ʃiˈa.nə/","forms":{"plural":"geofiziciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"geofiziciană","accusative-definite-nominative-singular":"geofiziciana","accusative-indefinite-nominative-plural":"geofiziciene","accusative-definite-nominative-plural":"geofizicienele","dative-genitive-indefinite-singular":"geofiziciene","dative-definite-genitive-singular":"geofizicienei","dative-genitive-indefinite-plural":"geofiziciene","dative-definite-genitive-plural":"geofizicienelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"geofiziciene","pos":"noun","definitions":["plural of geofiziciană"],"gender":"f"},{"word":"geofizicieni","pos":"noun","definitions":["plural of geofizician"],"gender":"m"},{"word":"geofon","pos":"noun","definitions":["geophone"],"forms":{"plural":"geofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geofon","accusative-definite-nominative-singular":"geofonul","accusative-indefinite-nominative-plural":"geofoane","accusative-definite-nominative-plural":"geofoanele","dative-genitive-indefinite-singular":"geofon","dative-definite-genitive-singular":"geofonului","dative-genitive-indefinite-plural":"geofoane","dative-definite-genitive-plural":"geofoanelor","singular-vocative":"geofonule","plural-vocative":"geofoanelor"}},{"word":"geofotogrammetrie","pos":"noun","definitions":["geophotogrammetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geofotogrammetrie","accusative-definite-nominative-singular":"geofotogrammetria","accusative-indefinite-nominative-plural":"geofotogrammetrii","accusative-definite-nominative-plural":"geofotogrammetriile","dative-genitive-indefinite-singular":"geofotogrammetrii","dative-definite-genitive-singular":"geofotogrammetriei","dative-genitive-indefinite-plural":"geofotogrammetrii","dative-definite-genitive-plural":"geofotogrammetriilor","singular-vocative":"geofotogrammetrie","plural-vocative":"geofotogrammetriilor"}},{"word":"Geogel","pos":"name","definitions":["a river in Alba County, Romania, tributary to the Valea Cheii","a village in Ponor, Alba County, Romania"],"gender":"m"},{"word":"geogenic","pos":"adj","definitions":["geogenic"],"forms":{"feminine-singular":"geogenică","masculine-plural":"geogenici","feminine-neuter-plural":"geogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geogenic","error-unrecognized-form-feminine-indefinite-singular":"geogenică","error-unrecognized-form-indefinite-masculine-plural":"geogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geogenice","definite-error-unrecognized-form-masculine-neuter-singular":"geogenicul","definite-error-unrecognized-form-feminine-singular":"geogenica","definite-error-unrecognized-form-masculine-plural":"geogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"geogenicele"}},{"word":"geogenie","pos":"noun","definitions":["geogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geogenie","accusative-definite-nominative-singular":"geogenia","accusative-indefinite-nominative-plural":"geogenii","accusative-definite-nominative-plural":"geogeniile","dative-genitive-indefinite-singular":"geogenii","dative-definite-genitive-singular":"geogeniei","dative-genitive-indefinite-plural":"geogenii","dative-definite-genitive-plural":"geogeniilor","singular-vocative":"geogenie","plural-vocative":"geogeniilor"}},{"word":"geognost","pos":"noun","definitions":["geognost"],"forms":{"plural":"geognoști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geognost","accusative-definite-nominative-singular":"geognostul","accusative-indefinite-nominative-plural":"geognoști","accusative-definite-nominative-plural":"geognoștii","dative-genitive-indefinite-singular":"geognost","dative-definite-genitive-singular":"geognostului","dative-genitive-indefinite-plural":"geognoști","dative-definite-genitive-plural":"geognoștilor","singular-vocative":"geognostule","plural-vocative":"geognoștilor"}},{"word":"geognostic","pos":"adj","definitions":["geognostic"],"forms":{"feminine-singular":"geognostică","masculine-plural":"geognostici","feminine-neuter-plural":"geognostice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geognostic","error-unrecognized-form-feminine-indefinite-singular":"geognostică","error-unrecognized-form-indefinite-masculine-plural":"geognostici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geognostice","definite-error-unrecognized-form-masculine-neuter-singular":"geognosticul","definite-error-unrecognized-form-feminine-singular":"geognostica","definite-error-unrecognized-form-masculine-plural":"geognosticii","definite-error-unrecognized-form-feminine-neuter-plural":"geognosticele"}},{"word":"geognozic","pos":"adj","definitions":["geognostic"],"forms":{"feminine-singular":"geognozică","masculine-plural":"geognozici","feminine-neuter-plural":"geognozice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geognozic","error-unrecognized-form-feminine-indefinite-singular":"geognozică","error-unrecognized-form-indefinite-masculine-plural":"geognozici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geognozice","definite-error-unrecognized-form-masculine-neuter-singular":"geognozicul","definite-error-unrecognized-form-feminine-singular":"geognozica","definite-error-unrecognized-form-masculine-plural":"geognozicii","definite-error-unrecognized-form-feminine-neuter-plural":"geognozicele"}},{"word":"geognozie","pos":"noun","definitions":["geognosy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geognozie","accusative-definite-nominative":"geognozia","dative-genitive-indefinite":"geognozii","dative-definite-genitive":"geognoziei","vocative":"geognozie"}},{"word":"geograf","pos":"noun","definitions":["geographer"],"pronunciation":"/d͡ʒe.oˈɡraf/","forms":{"plural":"geografi","feminine":"equivalent geografă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geograf","accusative-definite-nominative-singular":"geograful","accusative-indefinite-nominative-plural":"geografi","accusative-definite-nominative-plural":"geografii","dative-genitive-indefinite-singular":"geograf","dative-definite-genitive-singular":"geografului","dative-genitive-indefinite-plural":"geografi","dative-definite-genitive-plural":"geografilor","singular-vocative":"geografule","plural-vocative":"geografilor"}},{"word":"geografa","pos":"noun","definitions":["definite nominative/accusative singular of geografă"]},{"word":"geografă","pos":"noun","definitions":["female equivalent of geograf"],"pronunciation":"/d͡ʒe.oˈɡra.fə/","forms":{"plural":"geografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"geografă","accusative-definite-nominative-singular":"geografa","accusative-indefinite-nominative-plural":"geografe","accusative-definite-nominative-plural":"geografele","dative-genitive-indefinite-singular":"geografe","dative-definite-genitive-singular":"geografei","dative-genitive-indefinite-plural":"geografe","dative-definite-genitive-plural":"geografelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"geografe","pos":"noun","definitions":["plural of geografă"],"gender":"f"},{"word":"geografi","pos":"noun","definitions":["plural of geograf"],"gender":"m"},{"word":"geografia","pos":"noun","definitions":["definite nominative/accusative feminine singular of geografie"],"gender":"f","forms":{"alternative":"ӂеография"}},{"word":"geografic","pos":"adj","definitions":["geographic"],"pronunciation":"/ˌd͡ʒe.oˈɡra.fik/","forms":{"feminine-singular":"geografică","masculine-plural":"geografici","feminine-neuter-plural":"geografice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"geografic","error-unrecognized-form-feminine-indefinite-singular":"geografică","error-unrecognized-form-indefinite-masculine-plural":"geografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geografice","definite-error-unrecognized-form-masculine-neuter-singular":"geograficul","definite-error-unrecognized-form-feminine-singular":"geografica","definite-error-unrecognized-form-masculine-plural":"geograficii","definite-error-unrecognized-form-feminine-neuter-plural":"geograficele"}},{"word":"geografica","pos":"adj","definitions":["definite nominative/accusative feminine singular of geografic"],"pronunciation":"/d͡ʒe.oˈɡra.fi.ka/","gender":"f-s","forms":{"alternative":"ӂеографика"}},{"word":"geografică","pos":"adj","definitions":["nominative/accusative feminine singular of geografic"],"pronunciation":"/d͡ʒe.oˈɡra.fi.kə/","gender":"f-s","forms":{"alternative":"ӂеографикэ"}},{"word":"geograficește","pos":"adv","definitions":["geographically"]},{"word":"geografici","pos":"adj","definitions":["nominative/accusative masculine plural of geografic"],"gender":"m-p"},{"word":"geografie","pos":"noun","definitions":["geography"],"pronunciation":"/d͡ʒe.o.ɡraˈfi.e/","forms":{"plural":"geografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geografie","accusative-definite-nominative-singular":"geografia","accusative-indefinite-nominative-plural":"geografii","accusative-definite-nominative-plural":"geografiile","dative-genitive-indefinite-singular":"geografii","dative-definite-genitive-singular":"geografiei","dative-genitive-indefinite-plural":"geografii","dative-definite-genitive-plural":"geografiilor","singular-vocative":"geografie","plural-vocative":"geografiilor","alternative":"ӂеографие"}},{"word":"geografie fizică","pos":"noun","definitions":["physical geography"]},{"word":"geografie umană","pos":"noun","definitions":["human geography"]},{"word":"geografii","pos":"noun","definitions":["definite nominative/accusative plural of geograf"],"gender":"m"},{"word":"geografii","pos":"noun","definitions":["inflection of geografie:","indefinite genitive/dative singular","indefinite nominative/accusative/genitive/dative plural"],"gender":"f"},{"word":"geoid","pos":"noun","definitions":["geoid"],"pronunciation":"/d͡ʒe.oˈid/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geoid","accusative-definite-nominative":"geoidul","dative-genitive-indefinite":"geoid","dative-definite-genitive":"geoidului","vocative":"geoidule"}},{"word":"geoizotermă","pos":"noun","definitions":["geoisotherm"],"forms":{"plural":"geoizoterme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geoizotermă","accusative-definite-nominative-singular":"geoizoterma","accusative-indefinite-nominative-plural":"geoizoterme","accusative-definite-nominative-plural":"geoizotermele","dative-genitive-indefinite-singular":"geoizoterme","dative-definite-genitive-singular":"geoizotermei","dative-genitive-indefinite-plural":"geoizoterme","dative-definite-genitive-plural":"geoizotermelor","singular-vocative":"geoizotermă","plural-vocative":"geoizotermelor"}},{"word":"geolog","pos":"noun","definitions":["geologist"],"pronunciation":"/d͡ʒe.oˈloɡ/","forms":{"plural":"geologi","feminine":"equivalent geologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geolog","accusative-definite-nominative-singular":"geologul","accusative-indefinite-nominative-plural":"geologi","accusative-definite-nominative-plural":"geologii","dative-genitive-indefinite-singular":"geolog","dative-definite-genitive-singular":"geologului","dative-genitive-indefinite-plural":"geologi","dative-definite-genitive-plural":"geologilor","singular-vocative":"geologule","plural-vocative":"geologilor"}},{"word":"geologa","pos":"noun","definitions":["definite nominative/accusative singular of geologă"]},{"word":"geologă","pos":"noun","definitions":["female equivalent of geolog"],"pronunciation":"/d͡ʒe.oˈlo.ɡə/","forms":{"plural":"geologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"geologă","accusative-definite-nominative-singular":"geologa","accusative-indefinite-nominative-plural":"geologe","accusative-definite-nominative-plural":"geologele","dative-genitive-indefinite-singular":"geologe","dative-definite-genitive-singular":"geologei","dative-genitive-indefinite-plural":"geologe","dative-definite-genitive-plural":"geologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"geologe","pos":"noun","definitions":["plural of geologă"],"gender":"f"},{"word":"geologi","pos":"noun","definitions":["plural of geolog"],"gender":"m"},{"word":"geologia","pos":"noun","definitions":["definite nominative/accusative singular of geologie"],"gender":"f","forms":{"alternative":"ӂеолоӂия"}},{"word":"geologic","pos":"adj","definitions":["geologic"],"forms":{"feminine-singular":"geologică","masculine-plural":"geologici","feminine-neuter-plural":"geologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geologic","error-unrecognized-form-feminine-indefinite-singular":"geologică","error-unrecognized-form-indefinite-masculine-plural":"geologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geologice","definite-error-unrecognized-form-masculine-neuter-singular":"geologicul","definite-error-unrecognized-form-feminine-singular":"geologica","definite-error-unrecognized-form-masculine-plural":"geologicii","definite-error-unrecognized-form-feminine-neuter-plural":"geologicele"}},{"word":"geologicesc","pos":"adj","definitions":["geologic, geological"],"forms":{"feminine-singular":"geologicească","plural":"geologicești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geologicesc","error-unrecognized-form-feminine-indefinite-singular":"geologicească","error-unrecognized-form-indefinite-masculine-plural":"geologicești","error-unrecognized-form-feminine-indefinite-neuter-plural":"geologicești","definite-error-unrecognized-form-masculine-neuter-singular":"geologicescul","definite-error-unrecognized-form-feminine-singular":"geologiceasca","definite-error-unrecognized-form-masculine-plural":"geologiceștii","definite-error-unrecognized-form-feminine-neuter-plural":"geologiceștile"}},{"word":"geologicește","pos":"adv","definitions":["geologically"]},{"word":"geologie","pos":"noun","definitions":["geology"],"pronunciation":"/ˌd͡ʒe.o.loˈd͡ʒi.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geologie","accusative-definite-nominative":"geologia","dative-genitive-indefinite":"geologii","dative-definite-genitive":"geologiei","vocative":"geologie"}},{"word":"geomagnetic","pos":"adj","definitions":["geomagnetic"],"forms":{"feminine-singular":"geomagnetică","masculine-plural":"geomagnetici","feminine-neuter-plural":"geomagnetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geomagnetic","error-unrecognized-form-feminine-indefinite-singular":"geomagnetică","error-unrecognized-form-indefinite-masculine-plural":"geomagnetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geomagnetice","definite-error-unrecognized-form-masculine-neuter-singular":"geomagneticul","definite-error-unrecognized-form-feminine-singular":"geomagnetica","definite-error-unrecognized-form-masculine-plural":"geomagneticii","definite-error-unrecognized-form-feminine-neuter-plural":"geomagneticele"}},{"word":"geomagnetism","pos":"noun","definitions":["geomagnetism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geomagnetism","accusative-definite-nominative":"geomagnetismul","dative-genitive-indefinite":"geomagnetism","dative-definite-genitive":"geomagnetismului","vocative":"geomagnetismule"}},{"word":"Geomal","pos":"name","definitions":["a village in Stremț, Alba County, Romania"],"gender":"f"},{"word":"geomantic","pos":"adj","definitions":["geomantic"],"forms":{"feminine-singular":"geomantică","masculine-plural":"geomantici","feminine-neuter-plural":"geomantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geomantic","error-unrecognized-form-feminine-indefinite-singular":"geomantică","error-unrecognized-form-indefinite-masculine-plural":"geomantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geomantice","definite-error-unrecognized-form-masculine-neuter-singular":"geomanticul","definite-error-unrecognized-form-feminine-singular":"geomantica","definite-error-unrecognized-form-masculine-plural":"geomanticii","definite-error-unrecognized-form-feminine-neuter-plural":"geomanticele"}},{"word":"geomanție","pos":"noun","definitions":["geomancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geomanție","accusative-definite-nominative":"geomanția","dative-genitive-indefinite":"geomanții","dative-definite-genitive":"geomanției","vocative":"geomanție"}},{"word":"geomecanică","pos":"noun","definitions":["geomechanics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geomecanică","accusative-definite-nominative-singular":"geomecanica","accusative-indefinite-nominative-plural":"geomecanice","accusative-definite-nominative-plural":"geomecanicele","dative-genitive-indefinite-singular":"geomecanice","dative-definite-genitive-singular":"geomecanicei","dative-genitive-indefinite-plural":"geomecanice","dative-definite-genitive-plural":"geomecanicelor","singular-vocative":"geomecanică","plural-vocative":"geomecanicelor"}},{"word":"geomedicină","pos":"noun","definitions":["geomedicine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"geomedicină","accusative-definite-nominative":"geomedicina","dative-genitive-indefinite":"geomedicine","dative-definite-genitive":"geomedicinei","vocative":"geomedicină"}},{"word":"geometră","pos":"noun","definitions":["female equivalent of geometru"],"forms":{"plural":"geometre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geometră","accusative-definite-nominative-singular":"geometra","accusative-indefinite-nominative-plural":"geometre","accusative-definite-nominative-plural":"geometrele","dative-genitive-indefinite-singular":"geometre","dative-definite-genitive-singular":"geometrei","dative-genitive-indefinite-plural":"geometre","dative-definite-genitive-plural":"geometrelor","singular-vocative":"geometră","plural-vocative":"geometrelor"}},{"word":"geometric","pos":"adj","definitions":["geometric"],"pronunciation":"/ˌd͡ʒe.oˈme.trik/","forms":{"feminine-singular":"geometrică","masculine-plural":"geometrici","feminine-neuter-plural":"geometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geometric","error-unrecognized-form-feminine-indefinite-singular":"geometrică","error-unrecognized-form-indefinite-masculine-plural":"geometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geometrice","definite-error-unrecognized-form-masculine-neuter-singular":"geometricul","definite-error-unrecognized-form-feminine-singular":"geometrica","definite-error-unrecognized-form-masculine-plural":"geometricii","definite-error-unrecognized-form-feminine-neuter-plural":"geometricele"}},{"word":"geometricește","pos":"adv","definitions":["geometrically"]},{"word":"geometrie","pos":"noun","definitions":["geometry"],"pronunciation":"/d͡ʒe.o.meˈtri.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geometrie","accusative-definite-nominative":"geometria","dative-genitive-indefinite":"geometrii","dative-definite-genitive":"geometriei","vocative":"geometrie","alternative":"ӂеометрие"}},{"word":"geometrie descriptivă","pos":"noun","definitions":["descriptive geometry"]},{"word":"geometrie diferențială","pos":"noun","definitions":["differential geometry"]},{"word":"geometrie euclidiană","pos":"noun","definitions":["Euclidean geometry"]},{"word":"geometrie neeuclidiană","pos":"noun","definitions":["non-Euclidean geometry"]},{"word":"geometrie plană","pos":"noun","definitions":["plane geometry"]},{"word":"geometrism","pos":"noun","definitions":["geometrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geometrism","accusative-definite-nominative":"geometrismul","dative-genitive-indefinite":"geometrism","dative-definite-genitive":"geometrismului","vocative":"geometrismule"}},{"word":"geometriza","pos":"verb","definitions":["to geometrize"],"forms":{"canonical":"a geometriza 1st conjugation","present-singular-third-person":"geometrizează","participle-past":"geometrizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a geometriza","gerund":"geometrizând","first-person-indicative-present-singular":"geometrizez","indicative-present-second-person-singular":"geometrizezi","indicative-present-singular-third-person":"geometrizează","first-person-indicative-plural-present":"geometrizăm","indicative-plural-present-second-person":"geometrizați","indicative-plural-present-third-person":"geometrizează","first-person-imperfect-indicative-singular":"geometrizam","imperfect-indicative-second-person-singular":"geometrizai","imperfect-indicative-singular-third-person":"geometriza","first-person-imperfect-indicative-plural":"geometrizam","imperfect-indicative-plural-second-person":"geometrizați","imperfect-indicative-plural-third-person":"geometrizau","first-person-indicative-perfect-singular":"geometrizai","indicative-perfect-second-person-singular":"geometrizași","indicative-perfect-singular-third-person":"geometriză","first-person-indicative-perfect-plural":"geometrizarăm","indicative-perfect-plural-second-person":"geometrizarăți","indicative-perfect-plural-third-person":"geometrizară","first-person-indicative-pluperfect-singular":"geometrizasem","indicative-pluperfect-second-person-singular":"geometrizaseși","indicative-pluperfect-singular-third-person":"geometrizase","first-person-indicative-pluperfect-plural":"geometrizaserăm","indicative-pluperfect-plural-second-person":"geometrizaserăți","indicative-pluperfect-plural-third-person":"geometrizaseră","first-person-present-singular-subjunctive":"să geometrizez","present-second-person-singular-subjunctive":"să geometrizezi","present-singular-subjunctive-third-person":"să geometrizeze","first-person-plural-present-subjunctive":"să geometrizăm","plural-present-second-person-subjunctive":"să geometrizați","plural-present-subjunctive-third-person":"să geometrizeze","imperative-second-person-singular":"geometrizează","imperative-plural-second-person":"geometrizați","imperative-negative-second-person-singular":"nu geometriza","imperative-negative-plural-second-person":"nu geometrizați"}},{"word":"geometrizare","pos":"noun","definitions":["geometrization"],"forms":{"plural":"geometrizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"geometrizare","accusative-definite-nominative-singular":"geometrizarea","accusative-indefinite-nominative-plural":"geometrizări","accusative-definite-nominative-plural":"geometrizările","dative-genitive-indefinite-singular":"geometrizări","dative-definite-genitive-singular":"geometrizării","dative-genitive-indefinite-plural":"geometrizări","dative-definite-genitive-plural":"geometrizărilor","singular-vocative":"geometrizare","plural-vocative":"geometrizărilor"}},{"word":"geometrizat","pos":"adj","definitions":["geometrized"],"forms":{"feminine-singular":"geometrizată","masculine-plural":"geometrizați","feminine-neuter-plural":"geometrizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geometrizat","error-unrecognized-form-feminine-indefinite-singular":"geometrizată","error-unrecognized-form-indefinite-masculine-plural":"geometrizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"geometrizate","definite-error-unrecognized-form-masculine-neuter-singular":"geometrizatul","definite-error-unrecognized-form-feminine-singular":"geometrizata","definite-error-unrecognized-form-masculine-plural":"geometrizații","definite-error-unrecognized-form-feminine-neuter-plural":"geometrizatele"}},{"word":"geometrografie","pos":"noun","definitions":["geometrography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geometrografie","accusative-definite-nominative-singular":"geometrografia","accusative-indefinite-nominative-plural":"geometrografii","accusative-definite-nominative-plural":"geometrografiile","dative-genitive-indefinite-singular":"geometrografii","dative-definite-genitive-singular":"geometrografiei","dative-genitive-indefinite-plural":"geometrografii","dative-definite-genitive-plural":"geometrografiilor","singular-vocative":"geometrografie","plural-vocative":"geometrografiilor"}},{"word":"geometru","pos":"noun","definitions":["geometer"],"forms":{"plural":"geometri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geometru","accusative-definite-nominative-singular":"geometrul","accusative-indefinite-nominative-plural":"geometri","accusative-definite-nominative-plural":"geometrii","dative-genitive-indefinite-singular":"geometru","dative-definite-genitive-singular":"geometrului","dative-genitive-indefinite-plural":"geometri","dative-definite-genitive-plural":"geometrilor","singular-vocative":"geometrule","plural-vocative":"geometrilor"}},{"word":"geomorfic","pos":"adj","definitions":["geomorphic"],"forms":{"feminine-singular":"geomorfică","masculine-plural":"geomorfici","feminine-neuter-plural":"geomorfice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geomorfic","error-unrecognized-form-feminine-indefinite-singular":"geomorfică","error-unrecognized-form-indefinite-masculine-plural":"geomorfici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geomorfice","definite-error-unrecognized-form-masculine-neuter-singular":"geomorficul","definite-error-unrecognized-form-feminine-singular":"geomorfica","definite-error-unrecognized-form-masculine-plural":"geomorficii","definite-error-unrecognized-form-feminine-neuter-plural":"geomorficele"}},{"word":"geomorfie","pos":"noun","definitions":["geomorphy"],"forms":{"plural":"geomorfii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geomorfie","accusative-definite-nominative-singular":"geomorfia","accusative-indefinite-nominative-plural":"geomorfii","accusative-definite-nominative-plural":"geomorfiile","dative-genitive-indefinite-singular":"geomorfii","dative-definite-genitive-singular":"geomorfiei","dative-genitive-indefinite-plural":"geomorfii","dative-definite-genitive-plural":"geomorfiilor","singular-vocative":"geomorfie","plural-vocative":"geomorfiilor"}},{"word":"geomorfogenie","pos":"noun","definitions":["geomorphogeny"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geomorfogenie","accusative-definite-nominative-singular":"geomorfogenia","accusative-indefinite-nominative-plural":"geomorfogenii","accusative-definite-nominative-plural":"geomorfogeniile","dative-genitive-indefinite-singular":"geomorfogenii","dative-definite-genitive-singular":"geomorfogeniei","dative-genitive-indefinite-plural":"geomorfogenii","dative-definite-genitive-plural":"geomorfogeniilor","singular-vocative":"geomorfogenie","plural-vocative":"geomorfogeniilor"}},{"word":"geomorfolog","pos":"noun","definitions":["geomorphologist"],"forms":{"plural":"geomorfologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geomorfolog","accusative-definite-nominative-singular":"geomorfologul","accusative-indefinite-nominative-plural":"geomorfologi","accusative-definite-nominative-plural":"geomorfologii","dative-genitive-indefinite-singular":"geomorfolog","dative-definite-genitive-singular":"geomorfologului","dative-genitive-indefinite-plural":"geomorfologi","dative-definite-genitive-plural":"geomorfologilor","singular-vocative":"geomorfologule","plural-vocative":"geomorfologilor"}},{"word":"geomorfologă","pos":"noun","definitions":["female equivalent of geomorfolog"],"forms":{"plural":"geomorfologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geomorfologă","accusative-definite-nominative-singular":"geomorfologa","accusative-indefinite-nominative-plural":"geomorfologe","accusative-definite-nominative-plural":"geomorfologele","dative-genitive-indefinite-singular":"geomorfologe","dative-definite-genitive-singular":"geomorfologei","dative-genitive-indefinite-plural":"geomorfologe","dative-definite-genitive-plural":"geomorfologelor","singular-vocative":"geomorfologă","plural-vocative":"geomorfologelor"}},{"word":"geomorfologic","pos":"adj","definitions":["geomorphological"],"forms":{"feminine-singular":"geomorfologică","masculine-plural":"geomorfologici","feminine-neuter-plural":"geomorfologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geomorfologic","error-unrecognized-form-feminine-indefinite-singular":"geomorfologică","error-unrecognized-form-indefinite-masculine-plural":"geomorfologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geomorfologice","definite-error-unrecognized-form-masculine-neuter-singular":"geomorfologicul","definite-error-unrecognized-form-feminine-singular":"geomorfologica","definite-error-unrecognized-form-masculine-plural":"geomorfologicii","definite-error-unrecognized-form-feminine-neuter-plural":"geomorfologicele"}},{"word":"geomorfologie","pos":"noun","definitions":["geomorphology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geomorfologie","accusative-definite-nominative":"geomorfologia","dative-genitive-indefinite":"geomorfologii","dative-definite-genitive":"geomorfologiei","vocative":"geomorfologie"}},{"word":"geonim","pos":"noun","definitions":["geonym"],"forms":{"plural":"geonime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geonim","accusative-definite-nominative-singular":"geonimul","accusative-indefinite-nominative-plural":"geonime","accusative-definite-nominative-plural":"geonimele","dative-genitive-indefinite-singular":"geonim","dative-definite-genitive-singular":"geonimului","dative-genitive-indefinite-plural":"geonime","dative-definite-genitive-plural":"geonimelor","singular-vocative":"geonimule","plural-vocative":"geonimelor"}},{"word":"geonomic","pos":"adj","definitions":["geomonic"],"forms":{"feminine-singular":"geonomică","masculine-plural":"geonomici","feminine-neuter-plural":"geonomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geonomic","error-unrecognized-form-feminine-indefinite-singular":"geonomică","error-unrecognized-form-indefinite-masculine-plural":"geonomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geonomice","definite-error-unrecognized-form-masculine-neuter-singular":"geonomicul","definite-error-unrecognized-form-feminine-singular":"geonomica","definite-error-unrecognized-form-masculine-plural":"geonomicii","definite-error-unrecognized-form-feminine-neuter-plural":"geonomicele"}},{"word":"geonomie","pos":"noun","definitions":["geonomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geonomie","accusative-definite-nominative-singular":"geonomia","accusative-indefinite-nominative-plural":"geonomii","accusative-definite-nominative-plural":"geonomiile","dative-genitive-indefinite-singular":"geonomii","dative-definite-genitive-singular":"geonomiei","dative-genitive-indefinite-plural":"geonomii","dative-definite-genitive-plural":"geonomiilor","singular-vocative":"geonomie","plural-vocative":"geonomiilor"}},{"word":"geopolitic","pos":"adj","definitions":["geopolitical"],"forms":{"feminine-singular":"geopolitică","masculine-plural":"geopolitici","feminine-neuter-plural":"geopolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geopolitic","error-unrecognized-form-feminine-indefinite-singular":"geopolitică","error-unrecognized-form-indefinite-masculine-plural":"geopolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geopolitice","definite-error-unrecognized-form-masculine-neuter-singular":"geopoliticul","definite-error-unrecognized-form-feminine-singular":"geopolitica","definite-error-unrecognized-form-masculine-plural":"geopoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"geopoliticele"}},{"word":"geopolitică","pos":"noun","definitions":["geopolitics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"geopolitică","accusative-definite-nominative":"geopolitica","dative-genitive-indefinite":"geopolitici","dative-definite-genitive":"geopoliticii","vocative":"geopolitică"}},{"word":"geopotențial","pos":"noun","definitions":["geopotential"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geopotențial","accusative-definite-nominative":"geopotențialul","dative-genitive-indefinite":"geopotențial","dative-definite-genitive":"geopotențialului","vocative":"geopotențialule"}},{"word":"georamă","pos":"noun","definitions":["georama"],"forms":{"plural":"georame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"georamă","accusative-definite-nominative-singular":"georama","accusative-indefinite-nominative-plural":"georame","accusative-definite-nominative-plural":"georamele","dative-genitive-indefinite-singular":"georame","dative-definite-genitive-singular":"georamei","dative-genitive-indefinite-plural":"georame","dative-definite-genitive-plural":"georamelor","singular-vocative":"georamă","plural-vocative":"georamelor"}},{"word":"George","pos":"name","definitions":["a male given name; variant form Gheorghe"],"pronunciation":"/ˈdʒe̯ordʒe/","gender":"m"},{"word":"George Coșbuc","pos":"name","definitions":["a village in Gorbănești, Botoșani County, Romania"],"gender":"m"},{"word":"George Enescu","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in George Enescu, Botoșani County, Romania"],"gender":"m"},{"word":"Georgescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Georgescu"}},{"word":"Georgeta","pos":"name","definitions":["a female given name"],"gender":"f"},{"word":"Georgia","pos":"name","definitions":["Georgia (a transcontinental country in the Caucasus region of Europe and Asia, on the coast of the Black Sea, often considered to belong politically to Europe)","Georgia (a state in the Southern United States)"],"gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Georgie","accusative-definite-nominative":"Georgia","dative-genitive-indefinite":"Georgii","dative-definite-genitive":"Georgiei","vocative":"Georgie"}},{"word":"georgian","pos":"adj","definitions":["Georgian"],"pronunciation":"/d͡ʒe̯or.d͡ʒiˈan/","forms":{"feminine-singular":"georgiană","masculine-plural":"georgieni","feminine-neuter-plural":"georgiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"georgian","error-unrecognized-form-feminine-indefinite-singular":"georgiană","error-unrecognized-form-indefinite-masculine-plural":"georgieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"georgiene","definite-error-unrecognized-form-masculine-neuter-singular":"georgianul","definite-error-unrecognized-form-feminine-singular":"georgiana","definite-error-unrecognized-form-masculine-plural":"georgienii","definite-error-unrecognized-form-feminine-neuter-plural":"georgienele"}},{"word":"georgian","pos":"noun","definitions":["Georgian"],"pronunciation":"/d͡ʒe̯or.d͡ʒiˈan/","forms":{"plural":"georgieni","feminine":"equivalent georgiană","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"georgian","accusative-definite-nominative-singular":"georgianul","accusative-indefinite-nominative-plural":"georgieni","accusative-definite-nominative-plural":"georgienii","dative-genitive-indefinite-singular":"georgian","dative-definite-genitive-singular":"georgianului","dative-genitive-indefinite-plural":"georgieni","dative-definite-genitive-plural":"georgienilor","singular-vocative":"georgianule","plural-vocative":"georgienilor"}},{"word":"georgiană","pos":"noun","definitions":["female equivalent of georgian"],"forms":{"plural":"georgiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"georgiană","accusative-definite-nominative-singular":"georgiana","accusative-indefinite-nominative-plural":"georgiene","accusative-definite-nominative-plural":"georgienele","dative-genitive-indefinite-singular":"georgiene","dative-definite-genitive-singular":"georgienei","dative-genitive-indefinite-plural":"georgiene","dative-definite-genitive-plural":"georgienelor","singular-vocative":"georgiană","plural-vocative":"georgienelor"}},{"word":"georgic","pos":"adj","definitions":["georgic"],"forms":{"feminine-singular":"georgică","masculine-plural":"georgici","feminine-neuter-plural":"georgice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"georgic","error-unrecognized-form-feminine-indefinite-singular":"georgică","error-unrecognized-form-indefinite-masculine-plural":"georgici","error-unrecognized-form-feminine-indefinite-neuter-plural":"georgice","definite-error-unrecognized-form-masculine-neuter-singular":"georgicul","definite-error-unrecognized-form-feminine-singular":"georgica","definite-error-unrecognized-form-masculine-plural":"georgicii","definite-error-unrecognized-form-feminine-neuter-plural":"georgicele"}},{"word":"Georgică","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Georgică"}},{"word":"georgieni","pos":"noun","definitions":["plural of georgian"]},{"word":"Georoceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Georoceanu"}},{"word":"Georocel","pos":"name","definitions":["a village in Dobrești, Dolj County, Romania"],"gender":"m"},{"word":"Georocu Mare","pos":"name","definitions":["a village in Bratovoești, Dolj County, Romania"],"gender":"m"},{"word":"geoscopie","pos":"noun","definitions":["geoscopy"],"forms":{"plural":"geoscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geoscopie","accusative-definite-nominative-singular":"geoscopia","accusative-indefinite-nominative-plural":"geoscopii","accusative-definite-nominative-plural":"geoscopiile","dative-genitive-indefinite-singular":"geoscopii","dative-definite-genitive-singular":"geoscopiei","dative-genitive-indefinite-plural":"geoscopii","dative-definite-genitive-plural":"geoscopiilor","singular-vocative":"geoscopie","plural-vocative":"geoscopiilor"}},{"word":"geosferă","pos":"noun","definitions":["geosphere"],"forms":{"plural":"geosfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"geosferă","accusative-definite-nominative-singular":"geosfera","accusative-indefinite-nominative-plural":"geosfere","accusative-definite-nominative-plural":"geosferele","dative-genitive-indefinite-singular":"geosfere","dative-definite-genitive-singular":"geosferei","dative-genitive-indefinite-plural":"geosfere","dative-definite-genitive-plural":"geosferelor","singular-vocative":"geosferă","plural-vocative":"geosferelor"}},{"word":"geosferic","pos":"adj","definitions":["geospheric"],"forms":{"feminine-singular":"geosferică","masculine-plural":"geosferici","feminine-neuter-plural":"geosferice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geosferic","error-unrecognized-form-feminine-indefinite-singular":"geosferică","error-unrecognized-form-indefinite-masculine-plural":"geosferici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geosferice","definite-error-unrecognized-form-masculine-neuter-singular":"geosfericul","definite-error-unrecognized-form-feminine-singular":"geosferica","definite-error-unrecognized-form-masculine-plural":"geosfericii","definite-error-unrecognized-form-feminine-neuter-plural":"geosfericele"}},{"word":"geosinclinal","pos":"noun","definitions":["geosyncline"],"forms":{"plural":"geosinclinale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geosinclinal","accusative-definite-nominative-singular":"geosinclinalul","accusative-indefinite-nominative-plural":"geosinclinale","accusative-definite-nominative-plural":"geosinclinalele","dative-genitive-indefinite-singular":"geosinclinal","dative-definite-genitive-singular":"geosinclinalului","dative-genitive-indefinite-plural":"geosinclinale","dative-definite-genitive-plural":"geosinclinalelor","singular-vocative":"geosinclinalule","plural-vocative":"geosinclinalelor"}},{"word":"geostatică","pos":"noun","definitions":["geostatics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"geostatică","accusative-definite-nominative":"geostatica","dative-genitive-indefinite":"geostatice","dative-definite-genitive":"geostaticei","vocative":"geostatică"}},{"word":"geostaționar","pos":"adj","definitions":["geostationary"],"forms":{"feminine-singular":"geostaționară","masculine-plural":"geostaționari","feminine-neuter-plural":"geostaționare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geostaționar","error-unrecognized-form-feminine-indefinite-singular":"geostaționară","error-unrecognized-form-indefinite-masculine-plural":"geostaționari","error-unrecognized-form-feminine-indefinite-neuter-plural":"geostaționare","definite-error-unrecognized-form-masculine-neuter-singular":"geostaționarul","definite-error-unrecognized-form-feminine-singular":"geostaționara","definite-error-unrecognized-form-masculine-plural":"geostaționarii","definite-error-unrecognized-form-feminine-neuter-plural":"geostaționarele"}},{"word":"geostrofic","pos":"adj","definitions":["geostrophic"],"forms":{"feminine-singular":"geostrofică","masculine-plural":"geostrofici","feminine-neuter-plural":"geostrofice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geostrofic","error-unrecognized-form-feminine-indefinite-singular":"geostrofică","error-unrecognized-form-indefinite-masculine-plural":"geostrofici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geostrofice","definite-error-unrecognized-form-masculine-neuter-singular":"geostroficul","definite-error-unrecognized-form-feminine-singular":"geostrofica","definite-error-unrecognized-form-masculine-plural":"geostroficii","definite-error-unrecognized-form-feminine-neuter-plural":"geostroficele"}},{"word":"geotactism","pos":"noun","definitions":["geotaxis"],"forms":{"plural":"geotactisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geotactism","accusative-definite-nominative-singular":"geotactismul","accusative-indefinite-nominative-plural":"geotactisme","accusative-definite-nominative-plural":"geotactismele","dative-genitive-indefinite-singular":"geotactism","dative-definite-genitive-singular":"geotactismului","dative-genitive-indefinite-plural":"geotactisme","dative-definite-genitive-plural":"geotactismelor","singular-vocative":"geotactismule","plural-vocative":"geotactismelor"}},{"word":"geotaxie","pos":"noun","definitions":["geotaxis"],"forms":{"plural":"geotaxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"geotaxie","accusative-definite-nominative-singular":"geotaxia","accusative-indefinite-nominative-plural":"geotaxii","accusative-definite-nominative-plural":"geotaxiile","dative-genitive-indefinite-singular":"geotaxii","dative-definite-genitive-singular":"geotaxiei","dative-genitive-indefinite-plural":"geotaxii","dative-definite-genitive-plural":"geotaxiilor","singular-vocative":"geotaxie","plural-vocative":"geotaxiilor"}},{"word":"geotectonic","pos":"adj","definitions":["geotectonic"],"forms":{"feminine-singular":"geotectonică","masculine-plural":"geotectonici","feminine-neuter-plural":"geotectonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geotectonic","error-unrecognized-form-feminine-indefinite-singular":"geotectonică","error-unrecognized-form-indefinite-masculine-plural":"geotectonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geotectonice","definite-error-unrecognized-form-masculine-neuter-singular":"geotectonicul","definite-error-unrecognized-form-feminine-singular":"geotectonica","definite-error-unrecognized-form-masculine-plural":"geotectonicii","definite-error-unrecognized-form-feminine-neuter-plural":"geotectonicele"}},{"word":"geotectonică","pos":"noun","definitions":["geotectonics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"geotectonică","accusative-definite-nominative":"geotectonica","dative-genitive-indefinite":"geotectonice","dative-definite-genitive":"geotectonicei","vocative":"geotectonică"}},{"word":"geotehnic","pos":"adj","definitions":["geotechnical"],"forms":{"feminine-singular":"geotehnică","masculine-plural":"geotehnici","feminine-neuter-plural":"geotehnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geotehnic","error-unrecognized-form-feminine-indefinite-singular":"geotehnică","error-unrecognized-form-indefinite-masculine-plural":"geotehnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geotehnice","definite-error-unrecognized-form-masculine-neuter-singular":"geotehnicul","definite-error-unrecognized-form-feminine-singular":"geotehnica","definite-error-unrecognized-form-masculine-plural":"geotehnicii","definite-error-unrecognized-form-feminine-neuter-plural":"geotehnicele"}},{"word":"geotehnică","pos":"noun","definitions":["geotechnics"],"forms":{"plural":"geotehnici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geotehnică","accusative-definite-nominative-singular":"geotehnica","accusative-indefinite-nominative-plural":"geotehnici","accusative-definite-nominative-plural":"geotehnicile","dative-genitive-indefinite-singular":"geotehnici","dative-definite-genitive-singular":"geotehnicii","dative-genitive-indefinite-plural":"geotehnici","dative-definite-genitive-plural":"geotehnicilor","singular-vocative":"geotehnică","plural-vocative":"geotehnicilor"}},{"word":"geotermal","pos":"adj","definitions":["geothermal"],"forms":{"feminine-singular":"geotermală","masculine-plural":"geotermali","feminine-neuter-plural":"geotermale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geotermal","error-unrecognized-form-feminine-indefinite-singular":"geotermală","error-unrecognized-form-indefinite-masculine-plural":"geotermali","error-unrecognized-form-feminine-indefinite-neuter-plural":"geotermale","definite-error-unrecognized-form-masculine-neuter-singular":"geotermalul","definite-error-unrecognized-form-feminine-singular":"geotermala","definite-error-unrecognized-form-masculine-plural":"geotermalii","definite-error-unrecognized-form-feminine-neuter-plural":"geotermalele"}},{"word":"geotermic","pos":"adj","definitions":["geothermal"],"forms":{"feminine-singular":"geotermică","masculine-plural":"geotermici","feminine-neuter-plural":"geotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geotermic","error-unrecognized-form-feminine-indefinite-singular":"geotermică","error-unrecognized-form-indefinite-masculine-plural":"geotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geotermice","definite-error-unrecognized-form-masculine-neuter-singular":"geotermicul","definite-error-unrecognized-form-feminine-singular":"geotermica","definite-error-unrecognized-form-masculine-plural":"geotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"geotermicele"}},{"word":"geotermie","pos":"noun","definitions":["geothermal energy or science"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geotermie","accusative-definite-nominative":"geotermia","dative-genitive-indefinite":"geotermii","dative-definite-genitive":"geotermiei","vocative":"geotermie"}},{"word":"geotermometru","pos":"noun","definitions":["geothermometer"],"forms":{"plural":"geotermometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geotermometru","accusative-definite-nominative-singular":"geotermometrul","accusative-indefinite-nominative-plural":"geotermometre","accusative-definite-nominative-plural":"geotermometrele","dative-genitive-indefinite-singular":"geotermometru","dative-definite-genitive-singular":"geotermometrului","dative-genitive-indefinite-plural":"geotermometre","dative-definite-genitive-plural":"geotermometrelor","singular-vocative":"geotermometrule","plural-vocative":"geotermometrelor"}},{"word":"geotropic","pos":"adj","definitions":["geotropic"],"forms":{"feminine-singular":"geotropică","masculine-plural":"geotropici","feminine-neuter-plural":"geotropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geotropic","error-unrecognized-form-feminine-indefinite-singular":"geotropică","error-unrecognized-form-indefinite-masculine-plural":"geotropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"geotropice","definite-error-unrecognized-form-masculine-neuter-singular":"geotropicul","definite-error-unrecognized-form-feminine-singular":"geotropica","definite-error-unrecognized-form-masculine-plural":"geotropicii","definite-error-unrecognized-form-feminine-neuter-plural":"geotropicele"}},{"word":"geotropism","pos":"noun","definitions":["geotropism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geotropism","accusative-definite-nominative":"geotropismul","dative-genitive-indefinite":"geotropism","dative-definite-genitive":"geotropismului","vocative":"geotropismule"}},{"word":"gepid","pos":"noun","definitions":["Gepid"],"forms":{"plural":"gepizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gepid","accusative-definite-nominative-singular":"gepidul","accusative-indefinite-nominative-plural":"gepizi","accusative-definite-nominative-plural":"gepizii","dative-genitive-indefinite-singular":"gepid","dative-definite-genitive-singular":"gepidului","dative-genitive-indefinite-plural":"gepizi","dative-definite-genitive-plural":"gepizilor","singular-vocative":"gepidule","plural-vocative":"gepizilor"}},{"word":"gepidă","pos":"noun","definitions":["female equivalent of gepid"],"forms":{"plural":"gepide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gepidă","accusative-definite-nominative-singular":"gepida","accusative-indefinite-nominative-plural":"gepide","accusative-definite-nominative-plural":"gepidele","dative-genitive-indefinite-singular":"gepide","dative-definite-genitive-singular":"gepidei","dative-genitive-indefinite-plural":"gepide","dative-definite-genitive-plural":"gepidelor","singular-vocative":"gepidă","plural-vocative":"gepidelor"}},{"word":"Gepiș","pos":"name","definitions":["a village in Lăzăreni, Bihor County, Romania"],"gender":"m"},{"word":"Gepiu","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Gepiu, Bihor County, Romania"],"gender":"m"},{"word":"ger","pos":"noun","definitions":["frost (cold weather that causes frost to form)","frigidness, frosty weather"],"pronunciation":"[d͡ʒer]","forms":{"plural":"geruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ger","accusative-definite-nominative-singular":"gerul","accusative-indefinite-nominative-plural":"geruri","accusative-definite-nominative-plural":"gerurile","dative-genitive-indefinite-singular":"ger","dative-definite-genitive-singular":"gerului","dative-genitive-indefinite-plural":"geruri","dative-definite-genitive-plural":"gerurilor","singular-vocative":"gerule","plural-vocative":"gerurilor"}},{"word":"gera","pos":"verb","definitions":["to manage"],"forms":{"canonical":"a gera 1st conjugation","present-singular-third-person":"gerează","participle-past":"gerat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gera","gerund":"gerând","first-person-indicative-present-singular":"gerez","indicative-present-second-person-singular":"gerezi","indicative-present-singular-third-person":"gerează","first-person-indicative-plural-present":"gerăm","indicative-plural-present-second-person":"gerați","indicative-plural-present-third-person":"gerează","first-person-imperfect-indicative-singular":"geram","imperfect-indicative-second-person-singular":"gerai","imperfect-indicative-singular-third-person":"gera","first-person-imperfect-indicative-plural":"geram","imperfect-indicative-plural-second-person":"gerați","imperfect-indicative-plural-third-person":"gerau","first-person-indicative-perfect-singular":"gerai","indicative-perfect-second-person-singular":"gerași","indicative-perfect-singular-third-person":"geră","first-person-indicative-perfect-plural":"gerarăm","indicative-perfect-plural-second-person":"gerarăți","indicative-perfect-plural-third-person":"gerară","first-person-indicative-pluperfect-singular":"gerasem","indicative-pluperfect-second-person-singular":"geraseși","indicative-pluperfect-singular-third-person":"gerase","first-person-indicative-pluperfect-plural":"geraserăm","indicative-pluperfect-plural-second-person":"geraserăți","indicative-pluperfect-plural-third-person":"geraseră","first-person-present-singular-subjunctive":"să gerez","present-second-person-singular-subjunctive":"să gerezi","present-singular-subjunctive-third-person":"să gereze","first-person-plural-present-subjunctive":"să gerăm","plural-present-second-person-subjunctive":"să gerați","plural-present-subjunctive-third-person":"să gereze","imperative-second-person-singular":"gerează","imperative-plural-second-person":"gerați","imperative-negative-second-person-singular":"nu gera","imperative-negative-plural-second-person":"nu gerați"}},{"word":"gerah","pos":"noun","definitions":["surgeon"],"forms":{"plural":"gerahi"}},{"word":"geraniacee","pos":"noun","definitions":["Geraniaceae"],"forms":{"plural":"geraniacee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"geraniacee","accusative-definite-nominative-singular":"geraniaceea","accusative-indefinite-nominative-plural":"geraniacee","accusative-definite-nominative-plural":"geraniaceele","dative-genitive-indefinite-singular":"geraniacee","dative-definite-genitive-singular":"geraniaceei","dative-genitive-indefinite-plural":"geraniacee","dative-definite-genitive-plural":"geraniaceelor","singular-vocative":"geraniacee","plural-vocative":"geraniaceelor"}},{"word":"geraniol","pos":"noun","definitions":["geraniol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geraniol","accusative-definite-nominative":"geraniolul","dative-genitive-indefinite":"geraniol","dative-definite-genitive":"geraniolului","vocative":"geraniolule"}},{"word":"geraniu","pos":"noun","definitions":["alternative form of geranium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geraniu","accusative-definite-nominative":"geraniul","dative-genitive-indefinite":"geraniu","dative-definite-genitive":"geraniului","vocative":"geraniule"}},{"word":"geranium","pos":"noun","definitions":["geranium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"geranium","accusative-definite-nominative":"geraniumul","dative-genitive-indefinite":"geranium","dative-definite-genitive":"geraniumului","vocative":"geraniumule"}},{"word":"gerant","pos":"noun","definitions":["manager"],"forms":{"plural":"geranți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gerant","accusative-definite-nominative-singular":"gerantul","accusative-indefinite-nominative-plural":"geranți","accusative-definite-nominative-plural":"geranții","dative-genitive-indefinite-singular":"gerant","dative-definite-genitive-singular":"gerantului","dative-genitive-indefinite-plural":"geranți","dative-definite-genitive-plural":"geranților","singular-vocative":"gerantule","plural-vocative":"geranților"}},{"word":"gerantă","pos":"noun","definitions":["female equivalent of gerant"],"forms":{"plural":"gerante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gerantă","accusative-definite-nominative-singular":"geranta","accusative-indefinite-nominative-plural":"gerante","accusative-definite-nominative-plural":"gerantele","dative-genitive-indefinite-singular":"gerante","dative-definite-genitive-singular":"gerantei","dative-genitive-indefinite-plural":"gerante","dative-definite-genitive-plural":"gerantelor","singular-vocative":"gerantă","plural-vocative":"gerantelor"}},{"word":"gerar","pos":"noun","definitions":["January (first month of the Gregorian calendar)"],"pronunciation":"/d͡ʒeˈrar/"},{"word":"gerare","pos":"noun","definitions":["management"],"forms":{"plural":"gerări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gerare","accusative-definite-nominative-singular":"gerarea","accusative-indefinite-nominative-plural":"gerări","accusative-definite-nominative-plural":"gerările","dative-genitive-indefinite-singular":"gerări","dative-definite-genitive-singular":"gerării","dative-genitive-indefinite-plural":"gerări","dative-definite-genitive-plural":"gerărilor","singular-vocative":"gerare","plural-vocative":"gerărilor"}},{"word":"gerat","pos":"adj","definitions":["managed by another party"],"forms":{"feminine-singular":"gerată","masculine-plural":"gerați","feminine-neuter-plural":"gerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerat","error-unrecognized-form-feminine-indefinite-singular":"gerată","error-unrecognized-form-indefinite-masculine-plural":"gerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerate","definite-error-unrecognized-form-masculine-neuter-singular":"geratul","definite-error-unrecognized-form-feminine-singular":"gerata","definite-error-unrecognized-form-masculine-plural":"gerații","definite-error-unrecognized-form-feminine-neuter-plural":"geratele"}},{"word":"gerat","pos":"verb","definitions":["past participle of gera"],"forms":{"participle-past":"of gera"}},{"word":"gerbil","pos":"noun","definitions":["gerbil"],"forms":{"plural":"gerbili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gerbil","accusative-definite-nominative-singular":"gerbilul","accusative-indefinite-nominative-plural":"gerbili","accusative-definite-nominative-plural":"gerbilii","dative-genitive-indefinite-singular":"gerbil","dative-definite-genitive-singular":"gerbilului","dative-genitive-indefinite-plural":"gerbili","dative-definite-genitive-plural":"gerbililor","singular-vocative":"gerbilule","plural-vocative":"gerbililor"}},{"word":"geremea","pos":"noun","definitions":["fine, penality"],"forms":{"plural":"geremele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"geremea","accusative-definite-nominative-singular":"geremeaua","accusative-indefinite-nominative-plural":"geremele","accusative-definite-nominative-plural":"geremelele","dative-genitive-indefinite-singular":"geremele","dative-definite-genitive-singular":"geremelei","dative-genitive-indefinite-plural":"geremele","dative-definite-genitive-plural":"geremelelor","singular-vocative":"geremea","plural-vocative":"geremelelor"}},{"word":"geret","pos":"noun","definitions":["alternative form of gerid"],"forms":{"plural":"gereturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"geret","accusative-definite-nominative-singular":"geretul","accusative-indefinite-nominative-plural":"gereturi","accusative-definite-nominative-plural":"gereturile","dative-genitive-indefinite-singular":"geret","dative-definite-genitive-singular":"geretului","dative-genitive-indefinite-plural":"gereturi","dative-definite-genitive-plural":"gereturilor","singular-vocative":"geretule","plural-vocative":"gereturilor"}},{"word":"gerg","pos":"noun","definitions":["slang, jargon"],"forms":{"plural":"gerguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gerg","accusative-definite-nominative-singular":"gergul","accusative-indefinite-nominative-plural":"gerguri","accusative-definite-nominative-plural":"gergurile","dative-genitive-indefinite-singular":"gerg","dative-definite-genitive-singular":"gergului","dative-genitive-indefinite-plural":"gerguri","dative-definite-genitive-plural":"gergurilor","singular-vocative":"gergule","plural-vocative":"gergurilor"}},{"word":"gergevea","pos":"noun","definitions":["alternative form of cercevea"],"forms":{"plural":"gergevele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gergevea","accusative-definite-nominative-singular":"gergeveaua","accusative-indefinite-nominative-plural":"gergevele","accusative-definite-nominative-plural":"gergevelele","dative-genitive-indefinite-singular":"gergevele","dative-definite-genitive-singular":"gergevelei","dative-genitive-indefinite-plural":"gergevele","dative-definite-genitive-plural":"gergevelelor","singular-vocative":"gergevea","plural-vocative":"gergevelelor"}},{"word":"geriatră","pos":"noun","definitions":["female equivalent of geriatru"],"pronunciation":"/d͡ʒe.riˈa.trə/","forms":{"plural":"geriatre","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"geriatră","accusative-definite-nominative-singular":"geriatra","accusative-indefinite-nominative-plural":"geriatre","accusative-definite-nominative-plural":"geriatrele","dative-genitive-indefinite-singular":"geriatre","dative-definite-genitive-singular":"geriatrei","dative-genitive-indefinite-plural":"geriatre","dative-definite-genitive-plural":"geriatrelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"geriatre","pos":"noun","definitions":["plural of geriatră"],"gender":"f"},{"word":"geriatrie","pos":"noun","definitions":["geriatrics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"geriatrie","accusative-definite-nominative":"geriatria","dative-genitive-indefinite":"geriatrii","dative-definite-genitive":"geriatriei","vocative":"geriatrie"}},{"word":"geriatru","pos":"noun","definitions":["geriatrician"],"pronunciation":"/d͡ʒe.riˈa.tru/","forms":{"plural":"geriatri","feminine":"equivalent geriatră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"geriatru","accusative-definite-nominative-singular":"geriatrul","accusative-indefinite-nominative-plural":"geriatri","accusative-definite-nominative-plural":"geriatrii","dative-genitive-indefinite-singular":"geriatru","dative-definite-genitive-singular":"geriatrului","dative-genitive-indefinite-plural":"geriatri","dative-definite-genitive-plural":"geriatrilor","singular-vocative":"geriatrule","plural-vocative":"geriatrilor"}},{"word":"gerid","pos":"noun","definitions":["jereed"],"forms":{"plural":"geriduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gerid","accusative-definite-nominative-singular":"geridul","accusative-indefinite-nominative-plural":"geriduri","accusative-definite-nominative-plural":"geridurile","dative-genitive-indefinite-singular":"gerid","dative-definite-genitive-singular":"geridului","dative-genitive-indefinite-plural":"geriduri","dative-definite-genitive-plural":"geridurilor","singular-vocative":"geridule","plural-vocative":"geridurilor"}},{"word":"gerișor","pos":"noun","definitions":["diminutive of ger"],"forms":{"plural":"gerișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gerișor","accusative-definite-nominative-singular":"gerișorul","accusative-indefinite-nominative-plural":"gerișoare","accusative-definite-nominative-plural":"gerișoarele","dative-genitive-indefinite-singular":"gerișor","dative-definite-genitive-singular":"gerișorului","dative-genitive-indefinite-plural":"gerișoare","dative-definite-genitive-plural":"gerișoarelor","singular-vocative":"gerișorule","plural-vocative":"gerișoarelor"}},{"word":"german","pos":"adj","definitions":["German"],"pronunciation":"/d͡ʒerˈman/","forms":{"feminine-singular":"germană","masculine-plural":"germani","feminine-neuter-plural":"germane","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"german","error-unrecognized-form-feminine-indefinite-singular":"germană","error-unrecognized-form-indefinite-masculine-plural":"germani","error-unrecognized-form-feminine-indefinite-neuter-plural":"germane","definite-error-unrecognized-form-masculine-neuter-singular":"germanul","definite-error-unrecognized-form-feminine-singular":"germana","definite-error-unrecognized-form-masculine-plural":"germanii","definite-error-unrecognized-form-feminine-neuter-plural":"germanele"}},{"word":"german","pos":"noun","definitions":["a German person"],"pronunciation":"/d͡ʒerˈman/","forms":{"plural":"germani","feminine":"equivalent germană"}},{"word":"germană","pos":"noun","definitions":["German (language)"],"pronunciation":"/d͡ʒerˈma.nə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"germană","accusative-definite-nominative":"germana","dative-genitive-indefinite":"germane","dative-definite-genitive":"germanei","vocative":"germană"}},{"word":"germană","pos":"adj","definitions":["nominative/accusative feminine singular of german"],"pronunciation":"/d͡ʒerˈma.nə/"},{"word":"germană standard","pos":"noun","definitions":["High German"]},{"word":"germănar","pos":"noun","definitions":["March"],"pronunciation":"/d͡ʒerməˈnar/","forms":{"alternative":"Germănar"}},{"word":"germancă","pos":"noun","definitions":["female equivalent of german"],"forms":{"plural":"germance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"germancă","accusative-definite-nominative-singular":"germanca","accusative-indefinite-nominative-plural":"germance","accusative-definite-nominative-plural":"germancele","dative-genitive-indefinite-singular":"germance","dative-definite-genitive-singular":"germancei","dative-genitive-indefinite-plural":"germance","dative-definite-genitive-plural":"germancelor","singular-vocative":"germancă","plural-vocative":"germancelor"}},{"word":"Germania","pos":"name","definitions":["Germany (a country in Central Europe, formed in 1949 as West Germany, with its provisional capital Bonn until 1990, when it incorporated East Germany)"],"pronunciation":"/d͡ʒerˈma.ni.a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Germanie","accusative-definite-nominative":"Germania","dative-genitive-indefinite":"Germanii","dative-definite-genitive":"Germaniei","vocative":"Germanie","alternative":"Ӂермания"}},{"word":"Germania de Est","pos":"name","definitions":["East Germany (a former Communist country of Central Europe, existing between 1949 and 1990)"],"gender":"f"},{"word":"Germania de Vest","pos":"name","definitions":["West Germany (a former country in Central Europe, distinguished from the German Democratic Republic, commonly known as East Germany)"],"gender":"f"},{"word":"Germania Occidentală","pos":"name","definitions":["West Germany (a former country in Central Europe, distinguished from the German Democratic Republic, commonly known as East Germany)"],"gender":"f"},{"word":"germanic","pos":"adj","definitions":["Germanic"],"pronunciation":"/d͡ʒerˈma.nik/","forms":{"feminine-singular":"germanică","masculine-plural":"germanici","feminine-neuter-plural":"germanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"germanic","error-unrecognized-form-feminine-indefinite-singular":"germanică","error-unrecognized-form-indefinite-masculine-plural":"germanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"germanice","definite-error-unrecognized-form-masculine-neuter-singular":"germanicul","definite-error-unrecognized-form-feminine-singular":"germanica","definite-error-unrecognized-form-masculine-plural":"germanicii","definite-error-unrecognized-form-feminine-neuter-plural":"germanicele"}},{"word":"germanism","pos":"noun","definitions":["Germanism"],"forms":{"plural":"germanisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"germanism","accusative-definite-nominative-singular":"germanismul","accusative-indefinite-nominative-plural":"germanisme","accusative-definite-nominative-plural":"germanismele","dative-genitive-indefinite-singular":"germanism","dative-definite-genitive-singular":"germanismului","dative-genitive-indefinite-plural":"germanisme","dative-definite-genitive-plural":"germanismelor","singular-vocative":"germanismule","plural-vocative":"germanismelor"}},{"word":"germanist","pos":"noun","definitions":["Germanist"],"forms":{"plural":"germaniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"germanist","accusative-definite-nominative-singular":"germanistul","accusative-indefinite-nominative-plural":"germaniști","accusative-definite-nominative-plural":"germaniștii","dative-genitive-indefinite-singular":"germanist","dative-definite-genitive-singular":"germanistului","dative-genitive-indefinite-plural":"germaniști","dative-definite-genitive-plural":"germaniștilor","singular-vocative":"germanistule","plural-vocative":"germaniștilor"}},{"word":"germanistă","pos":"noun","definitions":["female equivalent of germanist"],"forms":{"plural":"germaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"germanistă","accusative-definite-nominative-singular":"germanista","accusative-indefinite-nominative-plural":"germaniste","accusative-definite-nominative-plural":"germanistele","dative-genitive-indefinite-singular":"germaniste","dative-definite-genitive-singular":"germanistei","dative-genitive-indefinite-plural":"germaniste","dative-definite-genitive-plural":"germanistelor","singular-vocative":"germanistă","plural-vocative":"germanistelor"}},{"word":"germanistică","pos":"noun","definitions":["German studies (German language, literature, and culture)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"germanistică","accusative-definite-nominative":"germanistica","dative-genitive-indefinite":"germanistici","dative-definite-genitive":"germanisticii","vocative":"germanistică"}},{"word":"germaniu","pos":"noun","definitions":["germanium"],"pronunciation":"/d͡ʒerˈmanju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"germaniu","accusative-definite-nominative":"germaniul","dative-genitive-indefinite":"germaniu","dative-definite-genitive":"germaniului","vocative":"germaniule"}},{"word":"germaniza","pos":"verb","definitions":["to Germanize"],"pronunciation":"/d͡ʒer.ma.niˈza/","forms":{"canonical":"a germaniza 1st conjugation","present-singular-third-person":"germanizează","participle-past":"germanizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a germaniza","gerund":"germanizând","first-person-indicative-present-singular":"germanizez","indicative-present-second-person-singular":"germanizezi","indicative-present-singular-third-person":"germanizează","first-person-indicative-plural-present":"germanizăm","indicative-plural-present-second-person":"germanizați","indicative-plural-present-third-person":"germanizează","first-person-imperfect-indicative-singular":"germanizam","imperfect-indicative-second-person-singular":"germanizai","imperfect-indicative-singular-third-person":"germaniza","first-person-imperfect-indicative-plural":"germanizam","imperfect-indicative-plural-second-person":"germanizați","imperfect-indicative-plural-third-person":"germanizau","first-person-indicative-perfect-singular":"germanizai","indicative-perfect-second-person-singular":"germanizași","indicative-perfect-singular-third-person":"germaniză","first-person-indicative-perfect-plural":"germanizarăm","indicative-perfect-plural-second-person":"germanizarăți","indicative-perfect-plural-third-person":"germanizară","first-person-indicative-pluperfect-singular":"germanizasem","indicative-pluperfect-second-person-singular":"germanizaseși","indicative-pluperfect-singular-third-person":"germanizase","first-person-indicative-pluperfect-plural":"germanizaserăm","indicative-pluperfect-plural-second-person":"germanizaserăți","indicative-pluperfect-plural-third-person":"germanizaseră","first-person-present-singular-subjunctive":"să germanizez","present-second-person-singular-subjunctive":"să germanizezi","present-singular-subjunctive-third-person":"să germanizeze","first-person-plural-present-subjunctive":"să germanizăm","plural-present-second-person-subjunctive":"să germanizați","plural-present-subjunctive-third-person":"să germanizeze","imperative-second-person-singular":"germanizează","imperative-plural-second-person":"germanizați","imperative-negative-second-person-singular":"nu germaniza","imperative-negative-plural-second-person":"nu germanizați"}},{"word":"germanizare","pos":"noun","definitions":["Germanization"],"forms":{"plural":"germanizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"germanizare","accusative-definite-nominative-singular":"germanizarea","accusative-indefinite-nominative-plural":"germanizări","accusative-definite-nominative-plural":"germanizările","dative-genitive-indefinite-singular":"germanizări","dative-definite-genitive-singular":"germanizării","dative-genitive-indefinite-plural":"germanizări","dative-definite-genitive-plural":"germanizărilor","singular-vocative":"germanizare","plural-vocative":"germanizărilor"}},{"word":"germanizat","pos":"adj","definitions":["Germanized"],"forms":{"feminine-singular":"germanizată","masculine-plural":"germanizați","feminine-neuter-plural":"germanizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"germanizat","error-unrecognized-form-feminine-indefinite-singular":"germanizată","error-unrecognized-form-indefinite-masculine-plural":"germanizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"germanizate","definite-error-unrecognized-form-masculine-neuter-singular":"germanizatul","definite-error-unrecognized-form-feminine-singular":"germanizata","definite-error-unrecognized-form-masculine-plural":"germanizații","definite-error-unrecognized-form-feminine-neuter-plural":"germanizatele"}},{"word":"germanizat","pos":"verb","definitions":["past participle of germaniza"],"forms":{"participle-past":"of germaniza"}},{"word":"germano-","pos":"prefix","definitions":["Germano-"]},{"word":"germanofil","pos":"noun","definitions":["Germanophile"],"forms":{"plural":"germanofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"germanofil","accusative-definite-nominative-singular":"germanofilul","accusative-indefinite-nominative-plural":"germanofili","accusative-definite-nominative-plural":"germanofilii","dative-genitive-indefinite-singular":"germanofil","dative-definite-genitive-singular":"germanofilului","dative-genitive-indefinite-plural":"germanofili","dative-definite-genitive-plural":"germanofililor","singular-vocative":"germanofilule","plural-vocative":"germanofililor"}},{"word":"germanofilă","pos":"noun","definitions":["female equivalent of germanofil"],"forms":{"plural":"germanofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"germanofilă","accusative-definite-nominative-singular":"germanofila","accusative-indefinite-nominative-plural":"germanofile","accusative-definite-nominative-plural":"germanofilele","dative-genitive-indefinite-singular":"germanofile","dative-definite-genitive-singular":"germanofilei","dative-genitive-indefinite-plural":"germanofile","dative-definite-genitive-plural":"germanofilelor","singular-vocative":"germanofilă","plural-vocative":"germanofilelor"}},{"word":"germanofilie","pos":"noun","definitions":["germanophilia"],"forms":{"plural":"germanofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"germanofilie","accusative-definite-nominative-singular":"germanofilia","accusative-indefinite-nominative-plural":"germanofilii","accusative-definite-nominative-plural":"germanofiliile","dative-genitive-indefinite-singular":"germanofilii","dative-definite-genitive-singular":"germanofiliei","dative-genitive-indefinite-plural":"germanofilii","dative-definite-genitive-plural":"germanofiliilor","singular-vocative":"germanofilie","plural-vocative":"germanofiliilor"}},{"word":"germanofob","pos":"noun","definitions":["Germanophobe"],"forms":{"plural":"germanofobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"germanofob","accusative-definite-nominative-singular":"germanofobul","accusative-indefinite-nominative-plural":"germanofobi","accusative-definite-nominative-plural":"germanofobii","dative-genitive-indefinite-singular":"germanofob","dative-definite-genitive-singular":"germanofobului","dative-genitive-indefinite-plural":"germanofobi","dative-definite-genitive-plural":"germanofobilor","singular-vocative":"germanofobule","plural-vocative":"germanofobilor"}},{"word":"germanofobă","pos":"noun","definitions":["female equivalent of germanofob"],"forms":{"plural":"germanofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"germanofobă","accusative-definite-nominative-singular":"germanofoba","accusative-indefinite-nominative-plural":"germanofobe","accusative-definite-nominative-plural":"germanofobele","dative-genitive-indefinite-singular":"germanofobe","dative-definite-genitive-singular":"germanofobei","dative-genitive-indefinite-plural":"germanofobe","dative-definite-genitive-plural":"germanofobelor","singular-vocative":"germanofobă","plural-vocative":"germanofobelor"}},{"word":"germanofobie","pos":"noun","definitions":["Germanophobia"],"forms":{"plural":"germanofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"germanofobie","accusative-definite-nominative-singular":"germanofobia","accusative-indefinite-nominative-plural":"germanofobii","accusative-definite-nominative-plural":"germanofobiile","dative-genitive-indefinite-singular":"germanofobii","dative-definite-genitive-singular":"germanofobiei","dative-genitive-indefinite-plural":"germanofobii","dative-definite-genitive-plural":"germanofobiilor","singular-vocative":"germanofobie","plural-vocative":"germanofobiilor"}},{"word":"germanomanie","pos":"noun","definitions":["germanophilia"],"forms":{"plural":"germanomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"germanomanie","accusative-definite-nominative-singular":"germanomania","accusative-indefinite-nominative-plural":"germanomanii","accusative-definite-nominative-plural":"germanomaniile","dative-genitive-indefinite-singular":"germanomanii","dative-definite-genitive-singular":"germanomaniei","dative-genitive-indefinite-plural":"germanomanii","dative-definite-genitive-plural":"germanomaniilor","singular-vocative":"germanomanie","plural-vocative":"germanomaniilor"}},{"word":"germanomanii","pos":"noun","definitions":["plural of germanomanie"]},{"word":"germen","pos":"noun","definitions":["embryo","seed, germ (small mass of cells from which an organism grows)","germ","principle, element, component"],"forms":{"plural":"germeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"germen","accusative-definite-nominative-singular":"germenul","accusative-indefinite-nominative-plural":"germeni","accusative-definite-nominative-plural":"germenii","dative-genitive-indefinite-singular":"germen","dative-definite-genitive-singular":"germenului","dative-genitive-indefinite-plural":"germeni","dative-definite-genitive-plural":"germenilor","singular-vocative":"germenule","plural-vocative":"germenilor","alternative":"germene"}},{"word":"germene","pos":"noun","definitions":["alternative form of germen"],"forms":{"plural":"germeni"}},{"word":"germicid","pos":"noun","definitions":["germicide"],"forms":{"plural":"germicide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"germicid","accusative-definite-nominative-singular":"germicidul","accusative-indefinite-nominative-plural":"germicide","accusative-definite-nominative-plural":"germicidele","dative-genitive-indefinite-singular":"germicid","dative-definite-genitive-singular":"germicidului","dative-genitive-indefinite-plural":"germicide","dative-definite-genitive-plural":"germicidelor","singular-vocative":"germicidule","plural-vocative":"germicidelor"}},{"word":"germina","pos":"verb","definitions":["to germinate"],"forms":{"canonical":"a germina 1st conjugation","present-singular-third-person":"germinează","participle-past":"germinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a germina","gerund":"germinând","first-person-indicative-present-singular":"germinez","indicative-present-second-person-singular":"germinezi","indicative-present-singular-third-person":"germinează","first-person-indicative-plural-present":"germinăm","indicative-plural-present-second-person":"germinați","indicative-plural-present-third-person":"germinează","first-person-imperfect-indicative-singular":"germinam","imperfect-indicative-second-person-singular":"germinai","imperfect-indicative-singular-third-person":"germina","first-person-imperfect-indicative-plural":"germinam","imperfect-indicative-plural-second-person":"germinați","imperfect-indicative-plural-third-person":"germinau","first-person-indicative-perfect-singular":"germinai","indicative-perfect-second-person-singular":"germinași","indicative-perfect-singular-third-person":"germină","first-person-indicative-perfect-plural":"germinarăm","indicative-perfect-plural-second-person":"germinarăți","indicative-perfect-plural-third-person":"germinară","first-person-indicative-pluperfect-singular":"germinasem","indicative-pluperfect-second-person-singular":"germinaseși","indicative-pluperfect-singular-third-person":"germinase","first-person-indicative-pluperfect-plural":"germinaserăm","indicative-pluperfect-plural-second-person":"germinaserăți","indicative-pluperfect-plural-third-person":"germinaseră","first-person-present-singular-subjunctive":"să germinez","present-second-person-singular-subjunctive":"să germinezi","present-singular-subjunctive-third-person":"să germineze","first-person-plural-present-subjunctive":"să germinăm","plural-present-second-person-subjunctive":"să germinați","plural-present-subjunctive-third-person":"să germineze","imperative-second-person-singular":"germinează","imperative-plural-second-person":"germinați","imperative-negative-second-person-singular":"nu germina","imperative-negative-plural-second-person":"nu germinați"}},{"word":"germinal","pos":"noun","definitions":["Germinal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"germinal","accusative-definite-nominative":"germinalul","dative-genitive-indefinite":"germinal","dative-definite-genitive":"germinalului","vocative":"germinalule"}}];
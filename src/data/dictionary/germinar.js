@@ -0,0 +1 @@
+export default [{"word":"germinare","pos":"noun","definitions":["germination"],"forms":{"plural":"germinări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"germinare","accusative-definite-nominative-singular":"germinarea","accusative-indefinite-nominative-plural":"germinări","accusative-definite-nominative-plural":"germinările","dative-genitive-indefinite-singular":"germinări","dative-definite-genitive-singular":"germinării","dative-genitive-indefinite-plural":"germinări","dative-definite-genitive-plural":"germinărilor","singular-vocative":"germinare","plural-vocative":"germinărilor"}},{"word":"germinație","pos":"noun","definitions":["germination"],"forms":{"plural":"germinații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"germinație","accusative-definite-nominative-singular":"germinația","accusative-indefinite-nominative-plural":"germinații","accusative-definite-nominative-plural":"germinațiile","dative-genitive-indefinite-singular":"germinații","dative-definite-genitive-singular":"germinației","dative-genitive-indefinite-plural":"germinații","dative-definite-genitive-plural":"germinațiilor","singular-vocative":"germinație","plural-vocative":"germinațiilor"}},{"word":"germinațiune","pos":"noun","definitions":["obsolete form of germinație"],"forms":{"plural":"germinațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"germinațiune","accusative-definite-nominative-singular":"germinațiunea","accusative-indefinite-nominative-plural":"germinațiuni","accusative-definite-nominative-plural":"germinațiunile","dative-genitive-indefinite-singular":"germinațiuni","dative-definite-genitive-singular":"germinațiunii","dative-genitive-indefinite-plural":"germinațiuni","dative-definite-genitive-plural":"germinațiunilor","singular-vocative":"germinațiune","plural-vocative":"germinațiunilor"}},{"word":"germinativ","pos":"adj","definitions":["germinating"],"forms":{"feminine-singular":"germinativă","masculine-plural":"germinativi","feminine-neuter-plural":"germinative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"germinativ","error-unrecognized-form-feminine-indefinite-singular":"germinativă","error-unrecognized-form-indefinite-masculine-plural":"germinativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"germinative","definite-error-unrecognized-form-masculine-neuter-singular":"germinativul","definite-error-unrecognized-form-feminine-singular":"germinativa","definite-error-unrecognized-form-masculine-plural":"germinativii","definite-error-unrecognized-form-feminine-neuter-plural":"germinativele"}},{"word":"germinator","pos":"noun","definitions":["germinator"],"forms":{"plural":"germinatori","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"germinator","accusative-definite-nominative-singular":"germinatorul","accusative-indefinite-nominative-plural":"germinatori","accusative-definite-nominative-plural":"germinatorile","dative-genitive-indefinite-singular":"germinator","dative-definite-genitive-singular":"germinatorului","dative-genitive-indefinite-plural":"germinatori","dative-definite-genitive-plural":"germinatorilor","singular-vocative":"germinatorule","plural-vocative":"germinatorilor"}},{"word":"germine","pos":"noun","definitions":["obsolete form of germene"],"forms":{"plural":"germini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"germine","accusative-definite-nominative-singular":"germineul","accusative-indefinite-nominative-plural":"germini","accusative-definite-nominative-plural":"germinii","dative-genitive-indefinite-singular":"germine","dative-definite-genitive-singular":"germineului","dative-genitive-indefinite-plural":"germini","dative-definite-genitive-plural":"germinilor","singular-vocative":"germineule","plural-vocative":"germinilor"}},{"word":"gerocrație","pos":"noun","definitions":["hierocracy"],"forms":{"plural":"gerocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gerocrație","accusative-definite-nominative-singular":"gerocrația","accusative-indefinite-nominative-plural":"gerocrații","accusative-definite-nominative-plural":"gerocrațiile","dative-genitive-indefinite-singular":"gerocrații","dative-definite-genitive-singular":"gerocrației","dative-genitive-indefinite-plural":"gerocrații","dative-definite-genitive-plural":"gerocrațiilor","singular-vocative":"gerocrație","plural-vocative":"gerocrațiilor"}},{"word":"gerontocratic","pos":"adj","definitions":["gerontocratic"],"forms":{"feminine-singular":"gerontocratică","masculine-plural":"gerontocratici","feminine-neuter-plural":"gerontocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerontocratic","error-unrecognized-form-feminine-indefinite-singular":"gerontocratică","error-unrecognized-form-indefinite-masculine-plural":"gerontocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerontocratice","definite-error-unrecognized-form-masculine-neuter-singular":"gerontocraticul","definite-error-unrecognized-form-feminine-singular":"gerontocratica","definite-error-unrecognized-form-masculine-plural":"gerontocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"gerontocraticele"}},{"word":"gerontocrație","pos":"noun","definitions":["gerontocracy"],"forms":{"plural":"gerontocrații"}},{"word":"gerontofil","pos":"adj","definitions":["gerontophilic"],"forms":{"feminine-singular":"gerontofilă","masculine-plural":"gerontofili","feminine-neuter-plural":"gerontofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerontofil","error-unrecognized-form-feminine-indefinite-singular":"gerontofilă","error-unrecognized-form-indefinite-masculine-plural":"gerontofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerontofile","definite-error-unrecognized-form-masculine-neuter-singular":"gerontofilul","definite-error-unrecognized-form-feminine-singular":"gerontofila","definite-error-unrecognized-form-masculine-plural":"gerontofilii","definite-error-unrecognized-form-feminine-neuter-plural":"gerontofilele"}},{"word":"gerontofilie","pos":"noun","definitions":["gerontophilia"],"forms":{"plural":"gerontofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gerontofilie","accusative-definite-nominative-singular":"gerontofilia","accusative-indefinite-nominative-plural":"gerontofilii","accusative-definite-nominative-plural":"gerontofiliile","dative-genitive-indefinite-singular":"gerontofilii","dative-definite-genitive-singular":"gerontofiliei","dative-genitive-indefinite-plural":"gerontofilii","dative-definite-genitive-plural":"gerontofiliilor","singular-vocative":"gerontofilie","plural-vocative":"gerontofiliilor"}},{"word":"gerontolog","pos":"noun","definitions":["gerontologist"],"forms":{"plural":"gerontologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gerontolog","accusative-definite-nominative-singular":"gerontologul","accusative-indefinite-nominative-plural":"gerontologi","accusative-definite-nominative-plural":"gerontologii","dative-genitive-indefinite-singular":"gerontolog","dative-definite-genitive-singular":"gerontologului","dative-genitive-indefinite-plural":"gerontologi","dative-definite-genitive-plural":"gerontologilor","singular-vocative":"gerontologule","plural-vocative":"gerontologilor"}},{"word":"gerontologă","pos":"noun","definitions":["female equivalent of gerontolog"],"forms":{"plural":"gerontologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gerontologă","accusative-definite-nominative-singular":"gerontologa","accusative-indefinite-nominative-plural":"gerontologe","accusative-definite-nominative-plural":"gerontologele","dative-genitive-indefinite-singular":"gerontologe","dative-definite-genitive-singular":"gerontologei","dative-genitive-indefinite-plural":"gerontologe","dative-definite-genitive-plural":"gerontologelor","singular-vocative":"gerontologă","plural-vocative":"gerontologelor"}},{"word":"gerontologic","pos":"adj","definitions":["gerontological"],"forms":{"feminine-singular":"gerontologică","masculine-plural":"gerontologici","feminine-neuter-plural":"gerontologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerontologic","error-unrecognized-form-feminine-indefinite-singular":"gerontologică","error-unrecognized-form-indefinite-masculine-plural":"gerontologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerontologice","definite-error-unrecognized-form-masculine-neuter-singular":"gerontologicul","definite-error-unrecognized-form-feminine-singular":"gerontologica","definite-error-unrecognized-form-masculine-plural":"gerontologicii","definite-error-unrecognized-form-feminine-neuter-plural":"gerontologicele"}},{"word":"gerontologie","pos":"noun","definitions":["gerontology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gerontologie","accusative-definite-nominative":"gerontologia","dative-genitive-indefinite":"gerontologii","dative-definite-genitive":"gerontologiei","vocative":"gerontologie"}},{"word":"geros","pos":"adj","definitions":["frosty"],"forms":{"feminine-singular":"geroasă","masculine-plural":"geroși","feminine-neuter-plural":"geroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geros","error-unrecognized-form-feminine-indefinite-singular":"geroasă","error-unrecognized-form-indefinite-masculine-plural":"geroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"geroase","definite-error-unrecognized-form-masculine-neuter-singular":"gerosul","definite-error-unrecognized-form-feminine-singular":"geroasa","definite-error-unrecognized-form-masculine-plural":"geroșii","definite-error-unrecognized-form-feminine-neuter-plural":"geroasele"}},{"word":"gerui","pos":"verb","definitions":["to get cold (about weather)"],"forms":{"canonical":"a gerui 4th conjugation","present-singular-third-person":"geruie","participle-past":"geruit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gerui","gerund":"geruind","first-person-indicative-present-singular":"gerui","indicative-present-second-person-singular":"gerui","indicative-present-singular-third-person":"geruie","first-person-indicative-plural-present":"geruim","indicative-plural-present-second-person":"geruiți","indicative-plural-present-third-person":"geruie","first-person-imperfect-indicative-singular":"geruiam","imperfect-indicative-second-person-singular":"geruiai","imperfect-indicative-singular-third-person":"geruia","first-person-imperfect-indicative-plural":"geruiam","imperfect-indicative-plural-second-person":"geruiați","imperfect-indicative-plural-third-person":"geruiau","first-person-indicative-perfect-singular":"geruii","indicative-perfect-second-person-singular":"geruiși","indicative-perfect-singular-third-person":"gerui","first-person-indicative-perfect-plural":"geruirăm","indicative-perfect-plural-second-person":"geruirăți","indicative-perfect-plural-third-person":"geruiră","first-person-indicative-pluperfect-singular":"geruisem","indicative-pluperfect-second-person-singular":"geruiseși","indicative-pluperfect-singular-third-person":"geruise","first-person-indicative-pluperfect-plural":"geruiserăm","indicative-pluperfect-plural-second-person":"geruiserăți","indicative-pluperfect-plural-third-person":"geruiseră","first-person-present-singular-subjunctive":"să gerui","present-second-person-singular-subjunctive":"să gerui","present-singular-subjunctive-third-person":"să geruie","first-person-plural-present-subjunctive":"să geruim","plural-present-second-person-subjunctive":"să geruiți","plural-present-subjunctive-third-person":"să geruie","imperative-second-person-singular":"geruie","imperative-plural-second-person":"geruiți","imperative-negative-second-person-singular":"nu gerui","imperative-negative-plural-second-person":"nu geruiți"}},{"word":"geruială","pos":"noun","definitions":["frosty weather"],"forms":{"plural":"geruieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"geruială","accusative-definite-nominative-singular":"geruiala","accusative-indefinite-nominative-plural":"geruieli","accusative-definite-nominative-plural":"geruielile","dative-genitive-indefinite-singular":"geruieli","dative-definite-genitive-singular":"geruielii","dative-genitive-indefinite-plural":"geruieli","dative-definite-genitive-plural":"geruielilor","singular-vocative":"geruială","plural-vocative":"geruielilor"}},{"word":"geruire","pos":"noun","definitions":["frosty weather"],"forms":{"plural":"geruiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"geruire","accusative-definite-nominative-singular":"geruirea","accusative-indefinite-nominative-plural":"geruiri","accusative-definite-nominative-plural":"geruirile","dative-genitive-indefinite-singular":"geruiri","dative-definite-genitive-singular":"geruirii","dative-genitive-indefinite-plural":"geruiri","dative-definite-genitive-plural":"geruirilor","singular-vocative":"geruire","plural-vocative":"geruirilor"}},{"word":"geruit","pos":"adj","definitions":["having frosty weather"],"forms":{"feminine-singular":"geruită","masculine-plural":"geruiți","feminine-neuter-plural":"geruite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"geruit","error-unrecognized-form-feminine-indefinite-singular":"geruită","error-unrecognized-form-indefinite-masculine-plural":"geruiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"geruite","definite-error-unrecognized-form-masculine-neuter-singular":"geruitul","definite-error-unrecognized-form-feminine-singular":"geruita","definite-error-unrecognized-form-masculine-plural":"geruiții","definite-error-unrecognized-form-feminine-neuter-plural":"geruitele"}},{"word":"geruit","pos":"verb","definitions":["past participle of gerui"],"forms":{"participle-past":"of gerui"}},{"word":"gerul Bobotezei","pos":"noun","definitions":["the cold during the Epiphany, considered to be the coldest period of the year in Romania"]},{"word":"gerule","pos":"noun","definitions":["vocative singular of ger"],"pronunciation":"[ˈd͡ʒerule]","gender":"n"},{"word":"geruleț","pos":"noun","definitions":["diminutive of ger; small frost"],"forms":{"plural":"gerulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"geruleț","accusative-definite-nominative-singular":"gerulețul","accusative-indefinite-nominative-plural":"gerulețe","accusative-definite-nominative-plural":"gerulețele","dative-genitive-indefinite-singular":"geruleț","dative-definite-genitive-singular":"gerulețului","dative-genitive-indefinite-plural":"gerulețe","dative-definite-genitive-plural":"gerulețelor","singular-vocative":"gerulețule","plural-vocative":"gerulețelor"}},{"word":"Gerului","pos":"name","definitions":["a river in Galați County, Romania, tributary to the Siret"],"gender":"m"},{"word":"gerundiv","pos":"noun","definitions":["gerundive"],"forms":{"plural":"gerundive","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gerundiv","accusative-definite-nominative-singular":"gerundivul","accusative-indefinite-nominative-plural":"gerundive","accusative-definite-nominative-plural":"gerundivele","dative-genitive-indefinite-singular":"gerundiv","dative-definite-genitive-singular":"gerundivului","dative-genitive-indefinite-plural":"gerundive","dative-definite-genitive-plural":"gerundivelor","singular-vocative":"gerundivule","plural-vocative":"gerundivelor"}},{"word":"gerundival","pos":"adj","definitions":["gerundival"],"forms":{"feminine-singular":"gerundivală","masculine-plural":"gerundivali","feminine-neuter-plural":"gerundivale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerundival","error-unrecognized-form-feminine-indefinite-singular":"gerundivală","error-unrecognized-form-indefinite-masculine-plural":"gerundivali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerundivale","definite-error-unrecognized-form-masculine-neuter-singular":"gerundivalul","definite-error-unrecognized-form-feminine-singular":"gerundivala","definite-error-unrecognized-form-masculine-plural":"gerundivalii","definite-error-unrecognized-form-feminine-neuter-plural":"gerundivalele"}},{"word":"gerunzial","pos":"adj","definitions":["gerundial"],"forms":{"feminine-singular":"gerunzială","masculine-plural":"gerunziali","feminine-neuter-plural":"gerunziale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gerunzial","error-unrecognized-form-feminine-indefinite-singular":"gerunzială","error-unrecognized-form-indefinite-masculine-plural":"gerunziali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gerunziale","definite-error-unrecognized-form-masculine-neuter-singular":"gerunzialul","definite-error-unrecognized-form-feminine-singular":"gerunziala","definite-error-unrecognized-form-masculine-plural":"gerunzialii","definite-error-unrecognized-form-feminine-neuter-plural":"gerunzialele"}},{"word":"gerunziu","pos":"noun","definitions":["gerund, a verbal form that functions as a verbal noun."],"forms":{"plural":"gerunzii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gerunziu","accusative-definite-nominative-singular":"gerunziul","accusative-indefinite-nominative-plural":"gerunzii","accusative-definite-nominative-plural":"gerunziile","dative-genitive-indefinite-singular":"gerunziu","dative-definite-genitive-singular":"gerunziului","dative-genitive-indefinite-plural":"gerunzii","dative-definite-genitive-plural":"gerunziilor","singular-vocative":"gerunziule","plural-vocative":"gerunziilor"}},{"word":"Gerușița","pos":"name","definitions":["a river in Galați County, Romania, tributary to the Siret"],"gender":"f"},{"word":"gest","pos":"noun","definitions":["gesture"],"forms":{"plural":"gesturi"}},{"word":"gestă","pos":"noun","definitions":["memorable deed","act of bravery","epic from the Middle Ages which evokes heroic acts of bravery"],"pronunciation":"[ˈd͡ʒes.tə]","forms":{"plural":"geste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gestă","accusative-definite-nominative-singular":"gesta","accusative-indefinite-nominative-plural":"geste","accusative-definite-nominative-plural":"gestele","dative-genitive-indefinite-singular":"geste","dative-definite-genitive-singular":"gestei","dative-genitive-indefinite-plural":"geste","dative-definite-genitive-plural":"gestelor","singular-vocative":"gestă","plural-vocative":"gestelor"}},{"word":"gestaltism","pos":"noun","definitions":["gestaltism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gestaltism","accusative-definite-nominative":"gestaltismul","dative-genitive-indefinite":"gestaltism","dative-definite-genitive":"gestaltismului","vocative":"gestaltismule"}},{"word":"gestaltist","pos":"noun","definitions":["gestaltist"],"forms":{"plural":"gestaltiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gestaltist","accusative-definite-nominative-singular":"gestaltistul","accusative-indefinite-nominative-plural":"gestaltiști","accusative-definite-nominative-plural":"gestaltiștii","dative-genitive-indefinite-singular":"gestaltist","dative-definite-genitive-singular":"gestaltistului","dative-genitive-indefinite-plural":"gestaltiști","dative-definite-genitive-plural":"gestaltiștilor","singular-vocative":"gestaltistule","plural-vocative":"gestaltiștilor"}},{"word":"gestaltistă","pos":"noun","definitions":["female equivalent of gestaltist"],"forms":{"plural":"gestaltiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gestaltistă","accusative-definite-nominative-singular":"gestaltista","accusative-indefinite-nominative-plural":"gestaltiste","accusative-definite-nominative-plural":"gestaltistele","dative-genitive-indefinite-singular":"gestaltiste","dative-definite-genitive-singular":"gestaltistei","dative-genitive-indefinite-plural":"gestaltiste","dative-definite-genitive-plural":"gestaltistelor","singular-vocative":"gestaltistă","plural-vocative":"gestaltistelor"}},{"word":"gestație","pos":"noun","definitions":["gestation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gestație","accusative-definite-nominative-singular":"gestația","accusative-indefinite-nominative-plural":"gestații","accusative-definite-nominative-plural":"gestațiile","dative-genitive-indefinite-singular":"gestații","dative-definite-genitive-singular":"gestației","dative-genitive-indefinite-plural":"gestații","dative-definite-genitive-plural":"gestațiilor","singular-vocative":"gestație","plural-vocative":"gestațiilor"}},{"word":"gestațiune","pos":"noun","definitions":["obsolete form of gestație"],"forms":{"plural":"gestațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gestațiune","accusative-definite-nominative-singular":"gestațiunea","accusative-indefinite-nominative-plural":"gestațiuni","accusative-definite-nominative-plural":"gestațiunile","dative-genitive-indefinite-singular":"gestațiuni","dative-definite-genitive-singular":"gestațiunii","dative-genitive-indefinite-plural":"gestațiuni","dative-definite-genitive-plural":"gestațiunilor","singular-vocative":"gestațiune","plural-vocative":"gestațiunilor"}},{"word":"gesticula","pos":"verb","definitions":["to gesticulate"],"forms":{"canonical":"a gesticula 1st conjugation","present-singular-third-person":"gesticulează","participle-past":"gesticulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gesticula","gerund":"gesticulând","first-person-indicative-present-singular":"gesticulez","indicative-present-second-person-singular":"gesticulezi","indicative-present-singular-third-person":"gesticulează","first-person-indicative-plural-present":"gesticulăm","indicative-plural-present-second-person":"gesticulați","indicative-plural-present-third-person":"gesticulează","first-person-imperfect-indicative-singular":"gesticulam","imperfect-indicative-second-person-singular":"gesticulai","imperfect-indicative-singular-third-person":"gesticula","first-person-imperfect-indicative-plural":"gesticulam","imperfect-indicative-plural-second-person":"gesticulați","imperfect-indicative-plural-third-person":"gesticulau","first-person-indicative-perfect-singular":"gesticulai","indicative-perfect-second-person-singular":"gesticulași","indicative-perfect-singular-third-person":"gesticulă","first-person-indicative-perfect-plural":"gesticularăm","indicative-perfect-plural-second-person":"gesticularăți","indicative-perfect-plural-third-person":"gesticulară","first-person-indicative-pluperfect-singular":"gesticulasem","indicative-pluperfect-second-person-singular":"gesticulaseși","indicative-pluperfect-singular-third-person":"gesticulase","first-person-indicative-pluperfect-plural":"gesticulaserăm","indicative-pluperfect-plural-second-person":"gesticulaserăți","indicative-pluperfect-plural-third-person":"gesticulaseră","first-person-present-singular-subjunctive":"să gesticulez","present-second-person-singular-subjunctive":"să gesticulezi","present-singular-subjunctive-third-person":"să gesticuleze","first-person-plural-present-subjunctive":"să gesticulăm","plural-present-second-person-subjunctive":"să gesticulați","plural-present-subjunctive-third-person":"să gesticuleze","imperative-second-person-singular":"gesticulează","imperative-plural-second-person":"gesticulați","imperative-negative-second-person-singular":"nu gesticula","imperative-negative-plural-second-person":"nu gesticulați"}},{"word":"gesticulant","pos":"adj","definitions":["gesticulating"],"forms":{"feminine-singular":"gesticulantă","masculine-plural":"gesticulanți","feminine-neuter-plural":"gesticulante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gesticulant","error-unrecognized-form-feminine-indefinite-singular":"gesticulantă","error-unrecognized-form-indefinite-masculine-plural":"gesticulanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gesticulante","definite-error-unrecognized-form-masculine-neuter-singular":"gesticulantul","definite-error-unrecognized-form-feminine-singular":"gesticulanta","definite-error-unrecognized-form-masculine-plural":"gesticulanții","definite-error-unrecognized-form-feminine-neuter-plural":"gesticulantele"}},{"word":"gesticulare","pos":"noun","definitions":["gesticulation"],"forms":{"plural":"gesticulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gesticulare","accusative-definite-nominative-singular":"gesticularea","accusative-indefinite-nominative-plural":"gesticulări","accusative-definite-nominative-plural":"gesticulările","dative-genitive-indefinite-singular":"gesticulări","dative-definite-genitive-singular":"gesticulării","dative-genitive-indefinite-plural":"gesticulări","dative-definite-genitive-plural":"gesticulărilor","singular-vocative":"gesticulare","plural-vocative":"gesticulărilor"}},{"word":"gesticulație","pos":"noun","definitions":["gesticulation"],"forms":{"plural":"gesticulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gesticulație","accusative-definite-nominative-singular":"gesticulația","accusative-indefinite-nominative-plural":"gesticulații","accusative-definite-nominative-plural":"gesticulațiile","dative-genitive-indefinite-singular":"gesticulații","dative-definite-genitive-singular":"gesticulației","dative-genitive-indefinite-plural":"gesticulații","dative-definite-genitive-plural":"gesticulațiilor","singular-vocative":"gesticulație","plural-vocative":"gesticulațiilor"}},{"word":"gesticulațiune","pos":"noun","definitions":["obsolete form of gesticulație"],"forms":{"plural":"gesticulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gesticulațiune","accusative-definite-nominative-singular":"gesticulațiunea","accusative-indefinite-nominative-plural":"gesticulațiuni","accusative-definite-nominative-plural":"gesticulațiunile","dative-genitive-indefinite-singular":"gesticulațiuni","dative-definite-genitive-singular":"gesticulațiunii","dative-genitive-indefinite-plural":"gesticulațiuni","dative-definite-genitive-plural":"gesticulațiunilor","singular-vocative":"gesticulațiune","plural-vocative":"gesticulațiunilor"}},{"word":"gestiona","pos":"verb","definitions":["to manage, to run, to administer"],"pronunciation":"/d͡ʒes.ti.oˈna/","forms":{"canonical":"a gestiona 1st conjugation","present-singular-third-person":"gestionează","participle-past":"gestionat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gestiona","gerund":"gestionând","first-person-indicative-present-singular":"gestionez","indicative-present-second-person-singular":"gestionezi","indicative-present-singular-third-person":"gestionează","first-person-indicative-plural-present":"gestionăm","indicative-plural-present-second-person":"gestionați","indicative-plural-present-third-person":"gestionează","first-person-imperfect-indicative-singular":"gestionam","imperfect-indicative-second-person-singular":"gestionai","imperfect-indicative-singular-third-person":"gestiona","first-person-imperfect-indicative-plural":"gestionam","imperfect-indicative-plural-second-person":"gestionați","imperfect-indicative-plural-third-person":"gestionau","first-person-indicative-perfect-singular":"gestionai","indicative-perfect-second-person-singular":"gestionași","indicative-perfect-singular-third-person":"gestionă","first-person-indicative-perfect-plural":"gestionarăm","indicative-perfect-plural-second-person":"gestionarăți","indicative-perfect-plural-third-person":"gestionară","first-person-indicative-pluperfect-singular":"gestionasem","indicative-pluperfect-second-person-singular":"gestionaseși","indicative-pluperfect-singular-third-person":"gestionase","first-person-indicative-pluperfect-plural":"gestionaserăm","indicative-pluperfect-plural-second-person":"gestionaserăți","indicative-pluperfect-plural-third-person":"gestionaseră","first-person-present-singular-subjunctive":"să gestionez","present-second-person-singular-subjunctive":"să gestionezi","present-singular-subjunctive-third-person":"să gestioneze","first-person-plural-present-subjunctive":"să gestionăm","plural-present-second-person-subjunctive":"să gestionați","plural-present-subjunctive-third-person":"să gestioneze","imperative-second-person-singular":"gestionează","imperative-plural-second-person":"gestionați","imperative-negative-second-person-singular":"nu gestiona","imperative-negative-plural-second-person":"nu gestionați"}},{"word":"gestionar","pos":"adj","definitions":["administrative"],"pronunciation":"/d͡ʒes.ti.oˈnar/","forms":{"feminine-singular":"gestionară","masculine-plural":"gestionari","feminine-neuter-plural":"gestionare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gestionar","error-unrecognized-form-feminine-indefinite-singular":"gestionară","error-unrecognized-form-indefinite-masculine-plural":"gestionari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gestionare","definite-error-unrecognized-form-masculine-neuter-singular":"gestionarul","definite-error-unrecognized-form-feminine-singular":"gestionara","definite-error-unrecognized-form-masculine-plural":"gestionarii","definite-error-unrecognized-form-feminine-neuter-plural":"gestionarele"}},{"word":"gestionar","pos":"noun","definitions":["administrator"],"pronunciation":"/d͡ʒes.ti.oˈnar/","forms":{"plural":"gestionari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gestionar","accusative-definite-nominative-singular":"gestionarul","accusative-indefinite-nominative-plural":"gestionari","accusative-definite-nominative-plural":"gestionarii","dative-genitive-indefinite-singular":"gestionar","dative-definite-genitive-singular":"gestionarului","dative-genitive-indefinite-plural":"gestionari","dative-definite-genitive-plural":"gestionarilor","singular-vocative":"gestionarule","plural-vocative":"gestionarilor"}},{"word":"gestionară","pos":"noun","definitions":["female equivalent of gestionar"],"forms":{"plural":"gestionare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gestionară","accusative-definite-nominative-singular":"gestionara","accusative-indefinite-nominative-plural":"gestionare","accusative-definite-nominative-plural":"gestionarele","dative-genitive-indefinite-singular":"gestionare","dative-definite-genitive-singular":"gestionarei","dative-genitive-indefinite-plural":"gestionare","dative-definite-genitive-plural":"gestionarelor","singular-vocative":"gestionară","plural-vocative":"gestionarelor"}},{"word":"gestionare","pos":"noun","definitions":["management"],"forms":{"plural":"gestionări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gestionare","accusative-definite-nominative-singular":"gestionarea","accusative-indefinite-nominative-plural":"gestionări","accusative-definite-nominative-plural":"gestionările","dative-genitive-indefinite-singular":"gestionări","dative-definite-genitive-singular":"gestionării","dative-genitive-indefinite-plural":"gestionări","dative-definite-genitive-plural":"gestionărilor","singular-vocative":"gestionare","plural-vocative":"gestionărilor"}},{"word":"gestionari","pos":"noun","definitions":["plural of gestionar"],"pronunciation":"/d͡ʒes.ti.oˈnarʲ/"},{"word":"gestionari","pos":"adj","definitions":["masculine plural of gestionar"],"pronunciation":"/d͡ʒes.ti.oˈnarʲ/"},{"word":"gestionase","pos":"verb","definitions":["third-person singular pluperfect indicative of gestiona"],"pronunciation":"[d͡ʒestioˈnase]"},{"word":"gestionat","pos":"verb","definitions":["past participle of gestiona"],"pronunciation":"[d͡ʒestioˈnat]"},{"word":"gestiune","pos":"noun","definitions":["management, administration"],"pronunciation":"/d͡ʒes.tiˈu.ne/","forms":{"plural":"gestiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gestiune","accusative-definite-nominative-singular":"gestiunea","accusative-indefinite-nominative-plural":"gestiuni","accusative-definite-nominative-plural":"gestiunile","dative-genitive-indefinite-singular":"gestiuni","dative-definite-genitive-singular":"gestiunii","dative-genitive-indefinite-plural":"gestiuni","dative-definite-genitive-plural":"gestiunilor","singular-vocative":"gestiune","plural-vocative":"gestiunilor"}},{"word":"gestiuni","pos":"noun","definitions":["plural of gestiune"],"pronunciation":"/d͡ʒes.tiˈunʲ/"},{"word":"gestoză","pos":"noun","definitions":["hyperemesis gravidarum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gestoză","accusative-definite-nominative":"gestoza","dative-genitive-indefinite":"gestoze","dative-definite-genitive":"gestozei","vocative":"gestoză"}},{"word":"gestual","pos":"adj","definitions":["gestural"],"forms":{"feminine-singular":"gestuală","masculine-plural":"gestuali","feminine-neuter-plural":"gestuale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gestual","error-unrecognized-form-feminine-indefinite-singular":"gestuală","error-unrecognized-form-indefinite-masculine-plural":"gestuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gestuale","definite-error-unrecognized-form-masculine-neuter-singular":"gestualul","definite-error-unrecognized-form-feminine-singular":"gestuala","definite-error-unrecognized-form-masculine-plural":"gestualii","definite-error-unrecognized-form-feminine-neuter-plural":"gestualele"}},{"word":"gesturi","pos":"noun","definitions":["neuter plural of gest"]},{"word":"get","pos":"noun","definitions":["Get, one of the Getae, Greek name for the Dacian people"],"pronunciation":"/d͡ʒet/","forms":{"plural":"geți","feminine":"equivalent getă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"get","accusative-definite-nominative-singular":"getul","accusative-indefinite-nominative-plural":"geti","accusative-definite-nominative-plural":"getii","dative-genitive-indefinite-singular":"get","dative-definite-genitive-singular":"getului","dative-genitive-indefinite-plural":"geti","dative-definite-genitive-plural":"getilor","singular-vocative":"getule","plural-vocative":"getilor"}},{"word":"get-beget","pos":"adj","definitions":["trueborn"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"get-beget","error-unrecognized-form-feminine-indefinite-singular":"get-beget","error-unrecognized-form-indefinite-masculine-plural":"get-beget","error-unrecognized-form-feminine-indefinite-neuter-plural":"get-beget","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"getă","pos":"noun","definitions":["female equivalent of get"],"forms":{"plural":"gete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"getă","accusative-definite-nominative-singular":"geta","accusative-indefinite-nominative-plural":"gete","accusative-definite-nominative-plural":"getele","dative-genitive-indefinite-singular":"gete","dative-definite-genitive-singular":"getei","dative-genitive-indefinite-plural":"gete","dative-definite-genitive-plural":"getelor","singular-vocative":"getă","plural-vocative":"getelor"}},{"word":"getic","pos":"adj","definitions":["Getic"],"forms":{"feminine-singular":"getică","masculine-plural":"getici","feminine-neuter-plural":"getice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"getic","error-unrecognized-form-feminine-indefinite-singular":"getică","error-unrecognized-form-indefinite-masculine-plural":"getici","error-unrecognized-form-feminine-indefinite-neuter-plural":"getice","definite-error-unrecognized-form-masculine-neuter-singular":"geticul","definite-error-unrecognized-form-feminine-singular":"getica","definite-error-unrecognized-form-masculine-plural":"geticii","definite-error-unrecognized-form-feminine-neuter-plural":"geticele"}},{"word":"getter","pos":"noun","definitions":["getter (material)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"getter","accusative-definite-nominative":"getterul","dative-genitive-indefinite":"getter","dative-definite-genitive":"getterului","vocative":"getterule"}},{"word":"gevrea","pos":"noun","definitions":["a handkerchief"],"forms":{"plural":"gevrele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gevrea","accusative-definite-nominative-singular":"gevreaua","accusative-indefinite-nominative-plural":"gevrele","accusative-definite-nominative-plural":"gevrelele","dative-genitive-indefinite-singular":"gevrele","dative-definite-genitive-singular":"gevrelei","dative-genitive-indefinite-plural":"gevrele","dative-definite-genitive-plural":"gevrelelor","singular-vocative":"gevrea","plural-vocative":"gevrelelor"}},{"word":"ghanez","pos":"noun","definitions":["Ghanaian"],"forms":{"plural":"ghanezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghanez","accusative-definite-nominative-singular":"ghanezul","accusative-indefinite-nominative-plural":"ghanezi","accusative-definite-nominative-plural":"ghanezii","dative-genitive-indefinite-singular":"ghanez","dative-definite-genitive-singular":"ghanezului","dative-genitive-indefinite-plural":"ghanezi","dative-definite-genitive-plural":"ghanezilor","singular-vocative":"ghanezule","plural-vocative":"ghanezilor"}},{"word":"ghaneză","pos":"noun","definitions":["female equivalent of ghanez"],"forms":{"plural":"ghaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghaneză","accusative-definite-nominative-singular":"ghaneza","accusative-indefinite-nominative-plural":"ghaneze","accusative-definite-nominative-plural":"ghanezele","dative-genitive-indefinite-singular":"ghaneze","dative-definite-genitive-singular":"ghanezei","dative-genitive-indefinite-plural":"ghaneze","dative-definite-genitive-plural":"ghanezelor","singular-vocative":"ghaneză","plural-vocative":"ghanezelor"}},{"word":"Gheaba","pos":"name","definitions":["a village in Măneciu, Prahova County, Romania"],"gender":"f"},{"word":"gheabă","pos":"noun","definitions":["alternative form of gheb"],"forms":{"plural":"ghebe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheabă","accusative-definite-nominative-singular":"gheaba","accusative-indefinite-nominative-plural":"ghebe","accusative-definite-nominative-plural":"ghebele","dative-genitive-indefinite-singular":"ghebe","dative-definite-genitive-singular":"ghebei","dative-genitive-indefinite-plural":"ghebe","dative-definite-genitive-plural":"ghebelor","singular-vocative":"gheabă","plural-vocative":"ghebelor"}},{"word":"Gheară","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheară"}},{"word":"gheară","pos":"noun","definitions":["claw"],"forms":{"plural":"gheare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheară","accusative-definite-nominative-singular":"gheara","accusative-indefinite-nominative-plural":"gheare","accusative-definite-nominative-plural":"ghearele","dative-genitive-indefinite-singular":"gheare","dative-definite-genitive-singular":"ghearei","dative-genitive-indefinite-plural":"gheare","dative-definite-genitive-plural":"ghearelor","singular-vocative":"gheară","plural-vocative":"ghearelor","alternative":"ghiară"}},{"word":"gheare","pos":"noun","definitions":["plural of gheară"]},{"word":"gheată","pos":"noun","definitions":["gaiter, spat","boot","brogue"],"forms":{"plural":"ghete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheată","accusative-definite-nominative-singular":"gheata","accusative-indefinite-nominative-plural":"ghete","accusative-definite-nominative-plural":"ghetele","dative-genitive-indefinite-singular":"ghete","dative-definite-genitive-singular":"ghetei","dative-genitive-indefinite-plural":"ghete","dative-definite-genitive-plural":"ghetelor","singular-vocative":"gheată","plural-vocative":"ghetelor"}},{"word":"Gheață","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheață"}},{"word":"gheață","pos":"noun","definitions":["ice"],"pronunciation":"/ˈɡe̯at͡sə/","forms":{"plural":"ghețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"gheață","accusative-definite-nominative-singular":"gheața","accusative-indefinite-nominative-plural":"ghețuri","accusative-definite-nominative-plural":"ghețurile","dative-genitive-indefinite-singular":"gheți","dative-definite-genitive-singular":"gheții","dative-genitive-indefinite-plural":"ghețuri","dative-definite-genitive-plural":"ghețurilor","singular-vocative":"gheață","plural-vocative":"ghețurilor","alternative":"ghiață"}},{"word":"Gheauș","pos":"name","definitions":["a surname","Anca Gheauș (born c. 1976), Romanian philosopher","Daniela Florina Gheauș (born 1999), Romanian bobsledder"],"pronunciation":"/ɡe̯aˈuʃ/","gender":"m","forms":{"dative-genitive":"lui Gheauș"}},{"word":"gheb","pos":"noun","definitions":["hump, hunch","mound, knoll, hillock"],"forms":{"plural":"gheburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gheb","accusative-definite-nominative-singular":"ghebul","accusative-indefinite-nominative-plural":"gheburi","accusative-definite-nominative-plural":"gheburile","dative-genitive-indefinite-singular":"gheb","dative-definite-genitive-singular":"ghebului","dative-genitive-indefinite-plural":"gheburi","dative-definite-genitive-plural":"gheburilor","singular-vocative":"ghebule","plural-vocative":"gheburilor","alternative":"gheabă"}},{"word":"Ghebari","pos":"name","definitions":["a village in Paltin, Vrancea County, Romania"],"gender":"m"},{"word":"ghebea","pos":"noun","definitions":["alternative form of ghebă"],"forms":{"plural":"ghebele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"ghebea","accusative-definite-nominative-singular":"ghebeaua","accusative-indefinite-nominative-plural":"ghebele","accusative-definite-nominative-plural":"ghebelele","dative-genitive-indefinite-singular":"ghebele","dative-definite-genitive-singular":"ghebelei","dative-genitive-indefinite-plural":"ghebele","dative-definite-genitive-plural":"ghebelelor","singular-vocative":"ghebea","plural-vocative":"ghebelelor"}},{"word":"Gheboaia","pos":"name","definitions":["a village in Finta, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gheboasa","pos":"name","definitions":["a river in Galați, Romania, tributary to the Mălina"],"gender":"f"},{"word":"gheboasă","pos":"noun","definitions":["female equivalent of ghebos"],"forms":{"plural":"gheboase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheboasă","accusative-definite-nominative-singular":"gheboasa","accusative-indefinite-nominative-plural":"gheboase","accusative-definite-nominative-plural":"gheboasele","dative-genitive-indefinite-singular":"gheboase","dative-definite-genitive-singular":"gheboasei","dative-genitive-indefinite-plural":"gheboase","dative-definite-genitive-plural":"gheboaselor","singular-vocative":"gheboasă","plural-vocative":"gheboaselor"}},{"word":"Gheboieni","pos":"name","definitions":["a village in Tătărani, Dâmbovița County, Romania"],"gender":"m"},{"word":"ghebos","pos":"noun","definitions":["humpbacked"],"forms":{"plural":"gheboși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghebos","accusative-definite-nominative-singular":"ghebosul","accusative-indefinite-nominative-plural":"gheboși","accusative-definite-nominative-plural":"gheboșii","dative-genitive-indefinite-singular":"ghebos","dative-definite-genitive-singular":"ghebosului","dative-genitive-indefinite-plural":"gheboși","dative-definite-genitive-plural":"gheboșilor","singular-vocative":"ghebosule","plural-vocative":"gheboșilor"}},{"word":"gheboșare","pos":"noun","definitions":["crookedness"],"forms":{"plural":"gheboșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gheboșare","accusative-definite-nominative-singular":"gheboșarea","accusative-indefinite-nominative-plural":"gheboșări","accusative-definite-nominative-plural":"gheboșările","dative-genitive-indefinite-singular":"gheboșări","dative-definite-genitive-singular":"gheboșării","dative-genitive-indefinite-plural":"gheboșări","dative-definite-genitive-plural":"gheboșărilor","singular-vocative":"gheboșare","plural-vocative":"gheboșărilor"}},{"word":"gheboși","pos":"verb","definitions":["to alternative form of gheboșa"],"forms":{"canonical":"a gheboși 4th conjugation","present-singular-third-person":"gheboșește","participle-past":"gheboșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gheboși","gerund":"gheboșind","first-person-indicative-present-singular":"gheboșesc","indicative-present-second-person-singular":"gheboșești","indicative-present-singular-third-person":"gheboșește","first-person-indicative-plural-present":"gheboșim","indicative-plural-present-second-person":"gheboșiți","indicative-plural-present-third-person":"gheboșesc","first-person-imperfect-indicative-singular":"gheboșeam","imperfect-indicative-second-person-singular":"gheboșeai","imperfect-indicative-singular-third-person":"gheboșea","first-person-imperfect-indicative-plural":"gheboșeam","imperfect-indicative-plural-second-person":"gheboșeați","imperfect-indicative-plural-third-person":"gheboșeau","first-person-indicative-perfect-singular":"gheboșii","indicative-perfect-second-person-singular":"gheboșiși","indicative-perfect-singular-third-person":"gheboși","first-person-indicative-perfect-plural":"gheboșirăm","indicative-perfect-plural-second-person":"gheboșirăți","indicative-perfect-plural-third-person":"gheboșiră","first-person-indicative-pluperfect-singular":"gheboșisem","indicative-pluperfect-second-person-singular":"gheboșiseși","indicative-pluperfect-singular-third-person":"gheboșise","first-person-indicative-pluperfect-plural":"gheboșiserăm","indicative-pluperfect-plural-second-person":"gheboșiserăți","indicative-pluperfect-plural-third-person":"gheboșiseră","first-person-present-singular-subjunctive":"să gheboșesc","present-second-person-singular-subjunctive":"să gheboșești","present-singular-subjunctive-third-person":"să gheboșească","first-person-plural-present-subjunctive":"să gheboșim","plural-present-second-person-subjunctive":"să gheboșiți","plural-present-subjunctive-third-person":"să gheboșească","imperative-second-person-singular":"gheboșește","imperative-plural-second-person":"gheboșiți","imperative-negative-second-person-singular":"nu gheboși","imperative-negative-plural-second-person":"nu gheboșiți"}},{"word":"gheboșit","pos":"adj","definitions":["alternative form of gheboșat"],"forms":{"feminine-singular":"gheboșită","masculine-plural":"gheboșiți","feminine-neuter-plural":"gheboșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gheboșit","error-unrecognized-form-feminine-indefinite-singular":"gheboșită","error-unrecognized-form-indefinite-masculine-plural":"gheboșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gheboșite","definite-error-unrecognized-form-masculine-neuter-singular":"gheboșitul","definite-error-unrecognized-form-feminine-singular":"gheboșita","definite-error-unrecognized-form-masculine-plural":"gheboșiții","definite-error-unrecognized-form-feminine-neuter-plural":"gheboșitele"}},{"word":"Ghebosu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghebosu"}},{"word":"Ghecet","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Smârdan."],"gender":"m"},{"word":"Ghedulești","pos":"name","definitions":["a village in Ciuruleasa, Alba County, Romania"],"gender":"m"},{"word":"gheenă","pos":"noun","definitions":["Gehenna"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gheenă","accusative-definite-nominative":"gheena","dative-genitive-indefinite":"gheene","dative-definite-genitive":"gheenei","vocative":"gheenă"}},{"word":"gheișă","pos":"noun","definitions":["geisha"],"forms":{"plural":"gheișe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheișă","accusative-definite-nominative-singular":"gheișa","accusative-indefinite-nominative-plural":"gheișe","accusative-definite-nominative-plural":"gheișele","dative-genitive-indefinite-singular":"gheișe","dative-definite-genitive-singular":"gheișei","dative-genitive-indefinite-plural":"gheișe","dative-definite-genitive-plural":"gheișelor","singular-vocative":"gheișă","plural-vocative":"gheișelor"}},{"word":"gheizer","pos":"noun","definitions":["geyser"],"forms":{"plural":"gheizere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gheizer","accusative-definite-nominative-singular":"gheizerul","accusative-indefinite-nominative-plural":"gheizere","accusative-definite-nominative-plural":"gheizerele","dative-genitive-indefinite-singular":"gheizer","dative-definite-genitive-singular":"gheizerului","dative-genitive-indefinite-plural":"gheizere","dative-definite-genitive-plural":"gheizerelor","singular-vocative":"gheizerule","plural-vocative":"gheizerelor"}},{"word":"gheizerit","pos":"noun","definitions":["geyserite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gheizerit","accusative-definite-nominative-singular":"gheizeritul","accusative-indefinite-nominative-plural":"gheizerite","accusative-definite-nominative-plural":"gheizeritele","dative-genitive-indefinite-singular":"gheizerit","dative-definite-genitive-singular":"gheizeritului","dative-genitive-indefinite-plural":"gheizerite","dative-definite-genitive-plural":"gheizeritelor","singular-vocative":"gheizeritule","plural-vocative":"gheizeritelor"}},{"word":"Gheja","pos":"name","definitions":["a locality in Luduș, Mureș County, Romania"],"gender":"f"},{"word":"Ghejan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghejan"}},{"word":"ghelă","pos":"noun","definitions":["obsolete form of gherlă"],"forms":{"plural":"ghele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghelă","accusative-definite-nominative-singular":"ghela","accusative-indefinite-nominative-plural":"ghele","accusative-definite-nominative-plural":"ghelele","dative-genitive-indefinite-singular":"ghele","dative-definite-genitive-singular":"ghelei","dative-genitive-indefinite-plural":"ghele","dative-definite-genitive-plural":"ghelelor","singular-vocative":"ghelă","plural-vocative":"ghelelor"}},{"word":"Ghelari","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Ghelari, Hunedoara County, Romania"],"gender":"m"},{"word":"Ghelasie","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Ghelasie"}},{"word":"ghelcușor","pos":"noun","definitions":["diminutive of ghelc"],"forms":{"plural":"ghelcușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghelcușor","accusative-definite-nominative-singular":"ghelcușorul","accusative-indefinite-nominative-plural":"ghelcușori","accusative-definite-nominative-plural":"ghelcușorii","dative-genitive-indefinite-singular":"ghelcușor","dative-definite-genitive-singular":"ghelcușorului","dative-genitive-indefinite-plural":"ghelcușori","dative-definite-genitive-plural":"ghelcușorilor","singular-vocative":"ghelcușorule","plural-vocative":"ghelcușorilor"}},{"word":"Ghelengic","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Mireasa."],"gender":"m"},{"word":"ghelir","pos":"noun","definitions":["windfall, passive income, unearned income"],"forms":{"plural":"gheliruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghelir","accusative-definite-nominative-singular":"ghelirul","accusative-indefinite-nominative-plural":"gheliruri","accusative-definite-nominative-plural":"ghelirurile","dative-genitive-indefinite-singular":"ghelir","dative-definite-genitive-singular":"ghelirului","dative-genitive-indefinite-plural":"gheliruri","dative-definite-genitive-plural":"ghelirurilor","singular-vocative":"ghelirule","plural-vocative":"ghelirurilor"}},{"word":"Ghelmegioaia","pos":"name","definitions":["a village in Prunișor, Mehedinți County, Romania"],"gender":"f"},{"word":"Ghelmez","pos":"name","definitions":["a surname from Ottoman Turkish"],"gender":"m","forms":{"dative-genitive":"lui Ghelmez"}},{"word":"ghem","pos":"noun","definitions":["ball of thread or yarn","the third compartment of a ruminant's stomach"],"forms":{"plural":"gheme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghem","accusative-definite-nominative-singular":"ghemul","accusative-indefinite-nominative-plural":"gheme","accusative-definite-nominative-plural":"ghemele","dative-genitive-indefinite-singular":"ghem","dative-definite-genitive-singular":"ghemului","dative-genitive-indefinite-plural":"gheme","dative-definite-genitive-plural":"ghemelor","singular-vocative":"ghemule","plural-vocative":"ghemelor"}},{"word":"Ghemeș","pos":"name","definitions":["a village in Milaș, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"ghemotoc","pos":"noun","definitions":["a ball made out of crumpled paper or other material"],"forms":{"plural":"ghemotoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghemotoc","accusative-definite-nominative-singular":"ghemotocul","accusative-indefinite-nominative-plural":"ghemotoace","accusative-definite-nominative-plural":"ghemotoacele","dative-genitive-indefinite-singular":"ghemotoc","dative-definite-genitive-singular":"ghemotocului","dative-genitive-indefinite-plural":"ghemotoace","dative-definite-genitive-plural":"ghemotoacelor","singular-vocative":"ghemotocule","plural-vocative":"ghemotoacelor"}},{"word":"ghemui","pos":"verb","definitions":["to huddle"],"forms":{"canonical":"a ghemui 4th conjugation","present-singular-third-person":"ghemuiește","participle-past":"ghemuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ghemui","gerund":"ghemuind","first-person-indicative-present-singular":"ghemuiesc","indicative-present-second-person-singular":"ghemuiești","indicative-present-singular-third-person":"ghemuiește","first-person-indicative-plural-present":"ghemuim","indicative-plural-present-second-person":"ghemuiți","indicative-plural-present-third-person":"ghemuiesc","first-person-imperfect-indicative-singular":"ghemuiam","imperfect-indicative-second-person-singular":"ghemuiai","imperfect-indicative-singular-third-person":"ghemuia","first-person-imperfect-indicative-plural":"ghemuiam","imperfect-indicative-plural-second-person":"ghemuiați","imperfect-indicative-plural-third-person":"ghemuiau","first-person-indicative-perfect-singular":"ghemuii","indicative-perfect-second-person-singular":"ghemuiși","indicative-perfect-singular-third-person":"ghemui","first-person-indicative-perfect-plural":"ghemuirăm","indicative-perfect-plural-second-person":"ghemuirăți","indicative-perfect-plural-third-person":"ghemuiră","first-person-indicative-pluperfect-singular":"ghemuisem","indicative-pluperfect-second-person-singular":"ghemuiseși","indicative-pluperfect-singular-third-person":"ghemuise","first-person-indicative-pluperfect-plural":"ghemuiserăm","indicative-pluperfect-plural-second-person":"ghemuiserăți","indicative-pluperfect-plural-third-person":"ghemuiseră","first-person-present-singular-subjunctive":"să ghemuiesc","present-second-person-singular-subjunctive":"să ghemuiești","present-singular-subjunctive-third-person":"să ghemuiască","first-person-plural-present-subjunctive":"să ghemuim","plural-present-second-person-subjunctive":"să ghemuiți","plural-present-subjunctive-third-person":"să ghemuiască","imperative-second-person-singular":"ghemuiește","imperative-plural-second-person":"ghemuiți","imperative-negative-second-person-singular":"nu ghemui","imperative-negative-plural-second-person":"nu ghemuiți"}},{"word":"ghemuit","pos":"noun","definitions":["to huddle, to crouch"],"forms":{"plural":"ghemuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghemuit","accusative-definite-nominative-singular":"ghemuitul","accusative-indefinite-nominative-plural":"ghemuituri","accusative-definite-nominative-plural":"ghemuiturile","dative-genitive-indefinite-singular":"ghemuit","dative-definite-genitive-singular":"ghemuitului","dative-genitive-indefinite-plural":"ghemuituri","dative-definite-genitive-plural":"ghemuiturilor","singular-vocative":"ghemuitule","plural-vocative":"ghemuiturilor"}},{"word":"ghemuit","pos":"verb","definitions":["past participle of ghemui"],"forms":{"participle-past":"of ghemui"}},{"word":"Ghemuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghemuleț"}},{"word":"ghemuleț","pos":"noun","definitions":["diminutive of ghem; small ball of yarn"],"forms":{"plural":"ghemulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghemuleț","accusative-definite-nominative-singular":"ghemulețul","accusative-indefinite-nominative-plural":"ghemulețe","accusative-definite-nominative-plural":"ghemulețele","dative-genitive-indefinite-singular":"ghemuleț","dative-definite-genitive-singular":"ghemulețului","dative-genitive-indefinite-plural":"ghemulețe","dative-definite-genitive-plural":"ghemulețelor","singular-vocative":"ghemulețule","plural-vocative":"ghemulețelor"}},{"word":"ghemușor","pos":"noun","definitions":["diminutive of ghem; small ball of yarn"],"forms":{"plural":"ghemușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghemușor","accusative-definite-nominative-singular":"ghemușorul","accusative-indefinite-nominative-plural":"ghemușore","accusative-definite-nominative-plural":"ghemușorele","dative-genitive-indefinite-singular":"ghemușor","dative-definite-genitive-singular":"ghemușorului","dative-genitive-indefinite-plural":"ghemușore","dative-definite-genitive-plural":"ghemușorelor","singular-vocative":"ghemușorule","plural-vocative":"ghemușorelor"}},{"word":"ghemuț","pos":"noun","definitions":["diminutive of ghem"],"forms":{"plural":"ghemuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghemuț","accusative-definite-nominative-singular":"ghemuțul","accusative-indefinite-nominative-plural":"ghemuțe","accusative-definite-nominative-plural":"ghemuțele","dative-genitive-indefinite-singular":"ghemuț","dative-definite-genitive-singular":"ghemuțului","dative-genitive-indefinite-plural":"ghemuțe","dative-definite-genitive-plural":"ghemuțelor","singular-vocative":"ghemuțule","plural-vocative":"ghemuțelor"}},{"word":"Ghenadie","pos":"name","definitions":["a male given name"],"gender":"m","forms":{"dative-genitive":"lui Ghenadie"}},{"word":"ghenarie","pos":"noun","definitions":["January"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ghenarie","accusative-definite-nominative":"ghenarieul","dative-genitive-indefinite":"ghenarie","dative-definite-genitive":"ghenarieului","vocative":"ghenarieule"}},{"word":"Ghencea","pos":"name","definitions":["a surname from Bulgarian","a neighbourhood of Bucharest, Romania"],"gender":"m","forms":{"dative-genitive":"lui Ghencea"}},{"word":"Ghenciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghenciulescu"}},{"word":"Ghenea","pos":"name","definitions":["a river in Alba County, Romania, tributary to the Pianu"],"gender":"f"},{"word":"ghenerar","pos":"noun","definitions":["alternative form of general"],"forms":{"plural":"ghenerari"}},{"word":"Ghenescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghenescu"}},{"word":"Ghenoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghenoiu"}},{"word":"Ghențulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghențulescu"}},{"word":"ghenunchi","pos":"noun","definitions":["obsolete form of genunchi"],"forms":{"plural":"ghenunchi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghenunchi","accusative-definite-nominative-singular":"ghenunchiul","accusative-indefinite-nominative-plural":"ghenunchi","accusative-definite-nominative-plural":"ghenunchii","dative-genitive-indefinite-singular":"ghenunchi","dative-definite-genitive-singular":"ghenunchiului","dative-genitive-indefinite-plural":"ghenunchi","dative-definite-genitive-plural":"ghenunchilor","singular-vocative":"ghenunchiule","plural-vocative":"ghenunchilor"}},{"word":"gheomotoc","pos":"noun","definitions":["alternative form of ghemotoc"],"forms":{"plural":"gheomotoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gheomotoc","accusative-definite-nominative-singular":"gheomotocul","accusative-indefinite-nominative-plural":"gheomotoace","accusative-definite-nominative-plural":"gheomotoacele","dative-genitive-indefinite-singular":"gheomotoc","dative-definite-genitive-singular":"gheomotocului","dative-genitive-indefinite-plural":"gheomotoace","dative-definite-genitive-plural":"gheomotoacelor","singular-vocative":"gheomotocule","plural-vocative":"gheomotoacelor"}},{"word":"gheonoaie","pos":"noun","definitions":["alternative form of ghionoaie"],"forms":{"plural":"gheonoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"gheonoaie","accusative-definite-nominative-singular":"gheonoaia","accusative-indefinite-nominative-plural":"gheonoi","accusative-definite-nominative-plural":"gheonoile","dative-genitive-indefinite-singular":"gheonoi","dative-definite-genitive-singular":"gheonoii","dative-genitive-indefinite-plural":"gheonoi","dative-definite-genitive-plural":"gheonoilor","singular-vocative":"gheonoaie","plural-vocative":"gheonoilor"}},{"word":"Gheordunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheordunescu"}},{"word":"Gheorghe","pos":"name","definitions":["a male given name from Ancient Greek, equivalent to English George"],"gender":"m","forms":{"dative-genitive":"lui Gheorghe","alternative":"Iorgu"}},{"word":"Gheorghe Doja","pos":"name","definitions":["a village in Răcăciuni, Bacău County, Romania","a commune of Ialomița County, Romania","a village in Gheorghe Doja, Ialomița County, Romania","a commune of Mureș County, Romania","a village in Gheorghe Doja, Mureș County, Romania"],"gender":"m"},{"word":"Gheorghe Lazăr","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Gheorghe Lazăr, Ialomița County, Romania"],"gender":"m"},{"word":"Gheorghe Matei","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Sadocuțu"],"gender":"m"},{"word":"Gheorgheasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Gheorghel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghel"}},{"word":"Gheorghelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghelescu"}},{"word":"Gheorgheni","pos":"name","definitions":["a city in Harghita County, Romania"],"gender":"m"},{"word":"Gheorgheoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorgheoiu"}},{"word":"Gheorghescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghescu"}},{"word":"Gheorgheșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gheorgheșteanu"}},{"word":"Gheorghești","pos":"name","definitions":["a village in Ponoarele, Mehedinți County, Romania"],"gender":"m"},{"word":"Gheorghiade","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiade"}},{"word":"Gheorghiaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiaș"}},{"word":"Gheorghică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghică"}},{"word":"Gheorghicescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghicescu"}},{"word":"Gheorghiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiciuc"}},{"word":"Gheorghieni","pos":"name","definitions":["a village in Feleacu, Cluj County, Romania"],"gender":"m"},{"word":"Gheorghiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiescu"}},{"word":"Gheorghiev","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiev"}},{"word":"Gheorghinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghinoiu"}},{"word":"Gheorghioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghioiu"}},{"word":"Gheorghișor","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghișor"}},{"word":"Gheorghița","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Gheorghiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiță"}},{"word":"Gheorghițanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițanu"}},{"word":"Gheorghițeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițeanu"}},{"word":"Gheorghițeni","pos":"name","definitions":["a village in Dorna-Arini, Suceava County, Romania"],"gender":"m"},{"word":"Gheorghițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițescu"}},{"word":"Gheorghițoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițoaia"}},{"word":"Gheorghițoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițoi"}},{"word":"Gheorghițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghițoiu"}},{"word":"Gheorghiulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheorghiulescu"}},{"word":"Gheorgiță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gheorgiță"}},{"word":"Gheormescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gheormescu"}},{"word":"gheoș","pos":"noun","definitions":["shrike"],"forms":{"plural":"gheoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gheoș","accusative-definite-nominative-singular":"gheoșul","accusative-indefinite-nominative-plural":"gheoși","accusative-definite-nominative-plural":"gheoșii","dative-genitive-indefinite-singular":"gheoș","dative-definite-genitive-singular":"gheoșului","dative-genitive-indefinite-plural":"gheoși","dative-definite-genitive-plural":"gheoșilor","singular-vocative":"gheoșule","plural-vocative":"gheoșilor"}},{"word":"ghepard","pos":"noun","definitions":["cheetah"],"pronunciation":"/ɡeˈpard/","forms":{"plural":"gheparzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghepard","accusative-definite-nominative-singular":"ghepardul","accusative-indefinite-nominative-plural":"gheparzi","accusative-definite-nominative-plural":"gheparzii","dative-genitive-indefinite-singular":"ghepard","dative-definite-genitive-singular":"ghepardului","dative-genitive-indefinite-plural":"gheparzi","dative-definite-genitive-plural":"gheparzilor","singular-vocative":"ghepardule","plural-vocative":"gheparzilor"}},{"word":"gheparzi","pos":"noun","definitions":["plural of ghepard"],"gender":"m-p"},{"word":"ghera","pos":"verb","definitions":["to scratch"],"forms":{"canonical":"a ghera 1st conjugation","present-singular-third-person":"gherează","participle-past":"gherat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ghera","gerund":"gherând","first-person-indicative-present-singular":"gherez","indicative-present-second-person-singular":"gherezi","indicative-present-singular-third-person":"gherează","first-person-indicative-plural-present":"gherăm","indicative-plural-present-second-person":"gherați","indicative-plural-present-third-person":"gherează","first-person-imperfect-indicative-singular":"gheram","imperfect-indicative-second-person-singular":"gherai","imperfect-indicative-singular-third-person":"ghera","first-person-imperfect-indicative-plural":"gheram","imperfect-indicative-plural-second-person":"gherați","imperfect-indicative-plural-third-person":"gherau","first-person-indicative-perfect-singular":"gherai","indicative-perfect-second-person-singular":"gherași","indicative-perfect-singular-third-person":"gheră","first-person-indicative-perfect-plural":"gherarăm","indicative-perfect-plural-second-person":"gherarăți","indicative-perfect-plural-third-person":"gherară","first-person-indicative-pluperfect-singular":"gherasem","indicative-pluperfect-second-person-singular":"gheraseși","indicative-pluperfect-singular-third-person":"gherase","first-person-indicative-pluperfect-plural":"gheraserăm","indicative-pluperfect-plural-second-person":"gheraserăți","indicative-pluperfect-plural-third-person":"gheraseră","first-person-present-singular-subjunctive":"să gherez","present-second-person-singular-subjunctive":"să gherezi","present-singular-subjunctive-third-person":"să ghereze","first-person-plural-present-subjunctive":"să gherăm","plural-present-second-person-subjunctive":"să gherați","plural-present-subjunctive-third-person":"să ghereze","imperative-second-person-singular":"gherează","imperative-plural-second-person":"gherați","imperative-negative-second-person-singular":"nu ghera","imperative-negative-plural-second-person":"nu gherați"}},{"word":"Gherăescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherăescu"}},{"word":"Gherăești","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Gherăești, Neamț County, Romania"],"gender":"m"},{"word":"Gherăeștii Noi","pos":"name","definitions":["a village in Gherăești, Neamț County, Romania"],"gender":"m"},{"word":"Gherăseni","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Gherăseni, Buzău County, Romania"],"gender":"m"},{"word":"Gherăsescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherăsescu"}},{"word":"Gherasim","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Gherasim"}},{"word":"Gherasimescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherasimescu"}},{"word":"Gherasimoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherasimoaia"}},{"word":"gherbevaș","pos":"noun","definitions":["poker (metal rod for poking)"],"forms":{"plural":"gherbevașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gherbevaș","accusative-definite-nominative-singular":"gherbevașul","accusative-indefinite-nominative-plural":"gherbevașe","accusative-definite-nominative-plural":"gherbevașele","dative-genitive-indefinite-singular":"gherbevaș","dative-definite-genitive-singular":"gherbevașului","dative-genitive-indefinite-plural":"gherbevașe","dative-definite-genitive-plural":"gherbevașelor","singular-vocative":"gherbevașule","plural-vocative":"gherbevașelor"}},{"word":"Ghercești","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Ghercești, Dolj County, Romania"],"gender":"m"},{"word":"Ghercioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghercioiu"}},{"word":"gherdan","pos":"noun","definitions":["necklace"],"forms":{"plural":"gherdane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gherdan","accusative-definite-nominative-singular":"gherdanul","accusative-indefinite-nominative-plural":"gherdane","accusative-definite-nominative-plural":"gherdanele","dative-genitive-indefinite-singular":"gherdan","dative-definite-genitive-singular":"gherdanului","dative-genitive-indefinite-plural":"gherdane","dative-definite-genitive-plural":"gherdanelor","singular-vocative":"gherdanule","plural-vocative":"gherdanelor"}},{"word":"Gherdana","pos":"name","definitions":["a village in Tătărăști, Bacău County, Romania"],"gender":"f"},{"word":"Gherdeal","pos":"name","definitions":["a village in Bruiu, Sibiu County, Romania"],"gender":"m"},{"word":"Gherengic","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Pecineaga in 1923."],"gender":"m"},{"word":"Gherescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherescu"}},{"word":"gheretă","pos":"noun","definitions":["booth"],"forms":{"plural":"gherete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheretă","accusative-definite-nominative-singular":"ghereta","accusative-indefinite-nominative-plural":"gherete","accusative-definite-nominative-plural":"gheretele","dative-genitive-indefinite-singular":"gherete","dative-definite-genitive-singular":"gheretei","dative-genitive-indefinite-plural":"gherete","dative-definite-genitive-plural":"gheretelor","singular-vocative":"gheretă","plural-vocative":"gheretelor"}},{"word":"Ghergănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghergănescu"}},{"word":"Ghergani","pos":"name","definitions":["a locality in Răcari, Dâmbovița County, Romania"],"gender":"m"},{"word":"Ghergheasa","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Ghergheasa, Buzău County, Romania"],"gender":"f"},{"word":"gherghef","pos":"noun","definitions":["tambour, embroidery hoop","loom"],"forms":{"plural":"gherghefuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gherghef","accusative-definite-nominative-singular":"ghergheful","accusative-indefinite-nominative-plural":"gherghefuri","accusative-definite-nominative-plural":"gherghefurile","dative-genitive-indefinite-singular":"gherghef","dative-definite-genitive-singular":"gherghefului","dative-genitive-indefinite-plural":"gherghefuri","dative-definite-genitive-plural":"gherghefurilor","singular-vocative":"gherghefule","plural-vocative":"gherghefurilor"}},{"word":"Gherghelaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gherghelaș"}},{"word":"Gherghelescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherghelescu"}},{"word":"Ghergheleu","pos":"name","definitions":["a village in Codăești, Vaslui County, Romania"],"gender":"m"},{"word":"Gherghely","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Gherghely"}},{"word":"Gherghescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherghescu"}},{"word":"Gherghești","pos":"name","definitions":["a village in Petrești, Dâmbovița County, Romania","a commune of Vaslui County, Romania","a village in Gherghești, Vaslui County, Romania"],"gender":"m"},{"word":"Gherghiceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gherghiceanu"}},{"word":"gherghin","pos":"noun","definitions":["hawthorn"],"forms":{"plural":"gherghini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gherghin","accusative-definite-nominative-singular":"gherghinul","accusative-indefinite-nominative-plural":"gherghini","accusative-definite-nominative-plural":"gherghinii","dative-genitive-indefinite-singular":"gherghin","dative-definite-genitive-singular":"gherghinului","dative-genitive-indefinite-plural":"gherghini","dative-definite-genitive-plural":"gherghinilor","singular-vocative":"gherghinule","plural-vocative":"gherghinilor"}},{"word":"Gherghina","pos":"name","definitions":["a village in Mircea Vodă, Constanța County, Romania"],"gender":"f"},{"word":"gherghină","pos":"noun","definitions":["dahlia"],"pronunciation":"/ɡerˈɡi.nə/","forms":{"plural":"gherghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gherghină","accusative-definite-nominative-singular":"gherghina","accusative-indefinite-nominative-plural":"gherghine","accusative-definite-nominative-plural":"gherghinele","dative-genitive-indefinite-singular":"gherghine","dative-definite-genitive-singular":"gherghinei","dative-genitive-indefinite-plural":"gherghine","dative-definite-genitive-plural":"gherghinelor","singular-vocative":"gherghină","plural-vocative":"gherghinelor"}},{"word":"Gherghinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherghinescu"}},{"word":"Gherghinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gherghinoiu"}},{"word":"gherghir","pos":"noun","definitions":["cellar"],"forms":{"plural":"gherghire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gherghir","accusative-definite-nominative-singular":"gherghirul","accusative-indefinite-nominative-plural":"gherghire","accusative-definite-nominative-plural":"gherghirele","dative-genitive-indefinite-singular":"gherghir","dative-definite-genitive-singular":"gherghirului","dative-genitive-indefinite-plural":"gherghire","dative-definite-genitive-plural":"gherghirelor","singular-vocative":"gherghirule","plural-vocative":"gherghirelor"}},{"word":"Gherghița","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Gherghița, Prahova County, Romania"],"gender":"f"},{"word":"Gherghițești","pos":"name","definitions":["a village in Cobia, Dâmbovița County, Romania"],"gender":"m"},{"word":"Ghergulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghergulescu"}},{"word":"gheridon","pos":"noun","definitions":["guerdon"],"forms":{"plural":"gheridoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gheridon","accusative-definite-nominative-singular":"gheridonul","accusative-indefinite-nominative-plural":"gheridoane","accusative-definite-nominative-plural":"gheridoanele","dative-genitive-indefinite-singular":"gheridon","dative-definite-genitive-singular":"gheridonului","dative-genitive-indefinite-plural":"gheridoane","dative-definite-genitive-plural":"gheridoanelor","singular-vocative":"gheridonule","plural-vocative":"gheridoanelor"}},{"word":"gherilă","pos":"noun","definitions":["guerrilla"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gherilă","accusative-definite-nominative-singular":"gherila","accusative-indefinite-nominative-plural":"gherile","accusative-definite-nominative-plural":"gherilele","dative-genitive-indefinite-singular":"gherile","dative-definite-genitive-singular":"gherilei","dative-genitive-indefinite-plural":"gherile","dative-definite-genitive-plural":"gherilelor","singular-vocative":"gherilă","plural-vocative":"gherilelor"}},{"word":"gherișoară","pos":"noun","definitions":["diminutive of gheară"],"forms":{"plural":"gherișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gherișoară","accusative-definite-nominative-singular":"gherișoara","accusative-indefinite-nominative-plural":"gherișoare","accusative-definite-nominative-plural":"gherișoarele","dative-genitive-indefinite-singular":"gherișoare","dative-definite-genitive-singular":"gherișoarei","dative-genitive-indefinite-plural":"gherișoare","dative-definite-genitive-plural":"gherișoarelor","singular-vocative":"gherișoară","plural-vocative":"gherișoarelor"}},{"word":"Gherla","pos":"name","definitions":["a city in Cluj County, Romania"],"gender":"f"},{"word":"gherlă","pos":"noun","definitions":["prison"],"forms":{"plural":"gherle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gherlă","accusative-definite-nominative-singular":"gherla","accusative-indefinite-nominative-plural":"gherle","accusative-definite-nominative-plural":"gherlele","dative-genitive-indefinite-singular":"gherle","dative-definite-genitive-singular":"gherlei","dative-genitive-indefinite-plural":"gherle","dative-definite-genitive-plural":"gherlelor","singular-vocative":"gherlă","plural-vocative":"gherlelor"}},{"word":"Gherlan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gherlan"}},{"word":"Gherman","pos":"name","definitions":["a village in Sculeni, Ungheni Raion, Moldova","a village in Bicaz-Chei, Neamț County, Romania","a village in Jamu Mare, Timiș County, Romania","a surname"],"gender":"m"},{"word":"gherman","pos":"adj","definitions":["obsolete form of german"],"forms":{"feminine-singular":"ghermană","masculine-plural":"ghermani","feminine-neuter-plural":"ghermane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gherman","error-unrecognized-form-feminine-indefinite-singular":"ghermană","error-unrecognized-form-indefinite-masculine-plural":"ghermani","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghermane","definite-error-unrecognized-form-masculine-neuter-singular":"ghermanul","definite-error-unrecognized-form-feminine-singular":"ghermana","definite-error-unrecognized-form-masculine-plural":"ghermanii","definite-error-unrecognized-form-feminine-neuter-plural":"ghermanele"}},{"word":"Ghermăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghermăneanu"}},{"word":"Ghermănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghermănescu"}},{"word":"Ghermănești","pos":"name","definitions":["a village in Snagov, Ilfov County, Romania","a village in Banca, Vaslui County, Romania","a village in Drânceni, Vaslui County, Romania"],"gender":"m"},{"word":"ghermeșit","pos":"noun","definitions":["alternative form of ghermesut"],"forms":{"plural":"ghermeșituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghermeșit","accusative-definite-nominative-singular":"ghermeșitul","accusative-indefinite-nominative-plural":"ghermeșituri","accusative-definite-nominative-plural":"ghermeșiturile","dative-genitive-indefinite-singular":"ghermeșit","dative-definite-genitive-singular":"ghermeșitului","dative-genitive-indefinite-plural":"ghermeșituri","dative-definite-genitive-plural":"ghermeșiturilor","singular-vocative":"ghermeșitule","plural-vocative":"ghermeșiturilor"}},{"word":"ghermesut","pos":"noun","definitions":["silk cloth"],"forms":{"plural":"ghermesuturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghermesut","accusative-definite-nominative-singular":"ghermesutul","accusative-indefinite-nominative-plural":"ghermesuturi","accusative-definite-nominative-plural":"ghermesuturile","dative-genitive-indefinite-singular":"ghermesut","dative-definite-genitive-singular":"ghermesutului","dative-genitive-indefinite-plural":"ghermesuturi","dative-definite-genitive-plural":"ghermesuturilor","singular-vocative":"ghermesutule","plural-vocative":"ghermesuturilor"}},{"word":"gheroc","pos":"noun","definitions":["frock coat"],"forms":{"plural":"gherocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gheroc","accusative-definite-nominative-singular":"gherocul","accusative-indefinite-nominative-plural":"gherocuri","accusative-definite-nominative-plural":"gherocurile","dative-genitive-indefinite-singular":"gheroc","dative-definite-genitive-singular":"gherocului","dative-genitive-indefinite-plural":"gherocuri","dative-definite-genitive-plural":"gherocurilor","singular-vocative":"gherocule","plural-vocative":"gherocurilor"}},{"word":"Gherșunovca","pos":"name","definitions":["a village in Vărăncău, Transnistria, Moldova"],"gender":"f"},{"word":"Gherța Mare","pos":"name","definitions":["a village in Turț, Satu Mare County, Romania"],"gender":"f"},{"word":"Gherța Mică","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Gherța Mică, Satu Mare County, Romania"],"gender":"f"},{"word":"Gherteamoș","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"m"},{"word":"Gherteniș","pos":"name","definitions":["a village in Berzovia, Caraș-Severin County, Romania"],"gender":"m"},{"word":"Ghertenișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghertenișan"}},{"word":"gherțoi","pos":"noun","definitions":["churl, boor"],"forms":{"plural":"gherțoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gherțoi","accusative-definite-nominative-singular":"gherțoiul","accusative-indefinite-nominative-plural":"gherțoi","accusative-definite-nominative-plural":"gherțoii","dative-genitive-indefinite-singular":"gherțoi","dative-definite-genitive-singular":"gherțoiului","dative-genitive-indefinite-plural":"gherțoi","dative-definite-genitive-plural":"gherțoilor","singular-vocative":"gherțoiule","plural-vocative":"gherțoilor"}},{"word":"gheruliță","pos":"noun","definitions":["diminutive of gheară"],"forms":{"plural":"gherulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheruliță","accusative-definite-nominative-singular":"gherulița","accusative-indefinite-nominative-plural":"gherulițe","accusative-definite-nominative-plural":"gherulițele","dative-genitive-indefinite-singular":"gherulițe","dative-definite-genitive-singular":"gheruliței","dative-genitive-indefinite-plural":"gherulițe","dative-definite-genitive-plural":"gherulițelor","singular-vocative":"gheruliță","plural-vocative":"gherulițelor"}},{"word":"gheruță","pos":"noun","definitions":["diminutive of gheară"],"forms":{"plural":"gheruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gheruță","accusative-definite-nominative-singular":"gheruța","accusative-indefinite-nominative-plural":"gheruțe","accusative-definite-nominative-plural":"gheruțele","dative-genitive-indefinite-singular":"gheruțe","dative-definite-genitive-singular":"gheruței","dative-genitive-indefinite-plural":"gheruțe","dative-definite-genitive-plural":"gheruțelor","singular-vocative":"gheruță","plural-vocative":"gheruțelor"}},{"word":"gheșeft","pos":"noun","definitions":["illegal business, swindle, racketeering"],"forms":{"plural":"gheșefturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gheșeft","accusative-definite-nominative-singular":"gheșeftul","accusative-indefinite-nominative-plural":"gheșefturi","accusative-definite-nominative-plural":"gheșefturile","dative-genitive-indefinite-singular":"gheșeft","dative-definite-genitive-singular":"gheșeftului","dative-genitive-indefinite-plural":"gheșefturi","dative-definite-genitive-plural":"gheșefturilor","singular-vocative":"gheșeftule","plural-vocative":"gheșefturilor"}},{"word":"gheșeftar","pos":"noun","definitions":["businessman"],"forms":{"plural":"gheșeftari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gheșeftar","accusative-definite-nominative-singular":"gheșeftarul","accusative-indefinite-nominative-plural":"gheșeftari","accusative-definite-nominative-plural":"gheșeftarii","dative-genitive-indefinite-singular":"gheșeftar","dative-definite-genitive-singular":"gheșeftarului","dative-genitive-indefinite-plural":"gheșeftari","dative-definite-genitive-plural":"gheșeftarilor","singular-vocative":"gheșeftarule","plural-vocative":"gheșeftarilor"}},{"word":"gheșeftărie","pos":"noun","definitions":["illegal business, swindle, racketeering"],"forms":{"plural":"gheșeftării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gheșeftărie","accusative-definite-nominative-singular":"gheșeftăria","accusative-indefinite-nominative-plural":"gheșeftării","accusative-definite-nominative-plural":"gheșeftăriile","dative-genitive-indefinite-singular":"gheșeftării","dative-definite-genitive-singular":"gheșeftăriei","dative-genitive-indefinite-plural":"gheșeftării","dative-definite-genitive-plural":"gheșeftăriilor","singular-vocative":"gheșeftărie","plural-vocative":"gheșeftăriilor"}},{"word":"ghetar","pos":"noun","definitions":["shoemaker"],"forms":{"plural":"ghetari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghetar","accusative-definite-nominative-singular":"ghetarul","accusative-indefinite-nominative-plural":"ghetari","accusative-definite-nominative-plural":"ghetarii","dative-genitive-indefinite-singular":"ghetar","dative-definite-genitive-singular":"ghetarului","dative-genitive-indefinite-plural":"ghetari","dative-definite-genitive-plural":"ghetarilor","singular-vocative":"ghetarule","plural-vocative":"ghetarilor"}},{"word":"ghețar","pos":"noun","definitions":["glacier"],"forms":{"plural":"ghețari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghețar","accusative-definite-nominative-singular":"ghețarul","accusative-indefinite-nominative-plural":"ghețari","accusative-definite-nominative-plural":"ghețarii","dative-genitive-indefinite-singular":"ghețar","dative-definite-genitive-singular":"ghețarului","dative-genitive-indefinite-plural":"ghețari","dative-definite-genitive-plural":"ghețarilor","singular-vocative":"ghețarule","plural-vocative":"ghețarilor"}},{"word":"Ghețari","pos":"name","definitions":["a village in Gârda de Sus, Alba County, Romania"],"gender":"m"},{"word":"ghețari","pos":"noun","definitions":["plural of ghețar"]},{"word":"ghețărie","pos":"noun","definitions":["ice house"],"forms":{"plural":"ghețării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghețărie","accusative-definite-nominative-singular":"ghețăria","accusative-indefinite-nominative-plural":"ghețării","accusative-definite-nominative-plural":"ghețăriile","dative-genitive-indefinite-singular":"ghețării","dative-definite-genitive-singular":"ghețăriei","dative-genitive-indefinite-plural":"ghețării","dative-definite-genitive-plural":"ghețăriilor","singular-vocative":"ghețărie","plural-vocative":"ghețăriilor"}},{"word":"ghețișoară","pos":"noun","definitions":["ice plant (Mesembrianthemum crystallium)"],"forms":{"plural":"ghețișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghețișoară","accusative-definite-nominative-singular":"ghețișoara","accusative-indefinite-nominative-plural":"ghețișoare","accusative-definite-nominative-plural":"ghețișoarele","dative-genitive-indefinite-singular":"ghețișoare","dative-definite-genitive-singular":"ghețișoarei","dative-genitive-indefinite-plural":"ghețișoare","dative-definite-genitive-plural":"ghețișoarelor","singular-vocative":"ghețișoară","plural-vocative":"ghețișoarelor"}},{"word":"gheto","pos":"noun","definitions":["alternative form of ghetou"],"forms":{"plural":"ghetouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gheto","accusative-definite-nominative-singular":"ghetoul","accusative-indefinite-nominative-plural":"ghetouri","accusative-definite-nominative-plural":"ghetourile","dative-genitive-indefinite-singular":"gheto","dative-definite-genitive-singular":"ghetoului","dative-genitive-indefinite-plural":"ghetouri","dative-definite-genitive-plural":"ghetourilor","singular-vocative":"ghetoule","plural-vocative":"ghetourilor"}},{"word":"ghețoi","pos":"noun","definitions":["icicle"],"forms":{"plural":"ghețoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghețoi","accusative-definite-nominative-singular":"ghețoiul","accusative-indefinite-nominative-plural":"ghețoaie","accusative-definite-nominative-plural":"ghețoaiele","dative-genitive-indefinite-singular":"ghețoi","dative-definite-genitive-singular":"ghețoiului","dative-genitive-indefinite-plural":"ghețoaie","dative-definite-genitive-plural":"ghețoaielor","singular-vocative":"ghețoiule","plural-vocative":"ghețoaielor"}},{"word":"Ghețoiu","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghețoiu"}},{"word":"ghețos","pos":"adj","definitions":["icy"],"forms":{"feminine-singular":"ghețoasă","masculine-plural":"ghețoși","feminine-neuter-plural":"ghețoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghețos","error-unrecognized-form-feminine-indefinite-singular":"ghețoasă","error-unrecognized-form-indefinite-masculine-plural":"ghețoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghețoase","definite-error-unrecognized-form-masculine-neuter-singular":"ghețosul","definite-error-unrecognized-form-feminine-singular":"ghețoasa","definite-error-unrecognized-form-masculine-plural":"ghețoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ghețoasele"}},{"word":"ghetou","pos":"noun","definitions":["ghetto"],"forms":{"plural":"ghetouri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghetou","accusative-definite-nominative-singular":"ghetoul","accusative-indefinite-nominative-plural":"ghetouri","accusative-definite-nominative-plural":"ghetourile","dative-genitive-indefinite-singular":"ghetou","dative-definite-genitive-singular":"ghetoului","dative-genitive-indefinite-plural":"ghetouri","dative-definite-genitive-plural":"ghetourilor","singular-vocative":"ghetoule","plural-vocative":"ghetourilor"}},{"word":"ghetră","pos":"noun","definitions":["gaiter"],"forms":{"plural":"ghetre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghetră","accusative-definite-nominative-singular":"ghetra","accusative-indefinite-nominative-plural":"ghetre","accusative-definite-nominative-plural":"ghetrele","dative-genitive-indefinite-singular":"ghetre","dative-definite-genitive-singular":"ghetrei","dative-genitive-indefinite-plural":"ghetre","dative-definite-genitive-plural":"ghetrelor","singular-vocative":"ghetră","plural-vocative":"ghetrelor"}},{"word":"ghețuri","pos":"noun","definitions":["plural of gheață"],"gender":"f-p"},{"word":"ghețuș","pos":"noun","definitions":["black ice"],"forms":{"plural":"ghețușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghețuș","accusative-definite-nominative-singular":"ghețușul","accusative-indefinite-nominative-plural":"ghețușuri","accusative-definite-nominative-plural":"ghețușurile","dative-genitive-indefinite-singular":"ghețuș","dative-definite-genitive-singular":"ghețușului","dative-genitive-indefinite-plural":"ghețușuri","dative-definite-genitive-plural":"ghețușurilor","singular-vocative":"ghețușule","plural-vocative":"ghețușurilor"}},{"word":"ghetuță","pos":"noun","definitions":["diminutive of gheată; small boot"],"forms":{"plural":"ghetuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghetuță","accusative-definite-nominative-singular":"ghetuța","accusative-indefinite-nominative-plural":"ghetuțe","accusative-definite-nominative-plural":"ghetuțele","dative-genitive-indefinite-singular":"ghetuțe","dative-definite-genitive-singular":"ghetuței","dative-genitive-indefinite-plural":"ghetuțe","dative-definite-genitive-plural":"ghetuțelor","singular-vocative":"ghetuță","plural-vocative":"ghetuțelor"}},{"word":"gheunoaie","pos":"noun","definitions":["alternative form of ghionoaie"],"forms":{"plural":"gheunoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"gheunoaie","accusative-definite-nominative-singular":"gheunoaia","accusative-indefinite-nominative-plural":"gheunoi","accusative-definite-nominative-plural":"gheunoile","dative-genitive-indefinite-singular":"gheunoi","dative-definite-genitive-singular":"gheunoii","dative-genitive-indefinite-plural":"gheunoi","dative-definite-genitive-plural":"gheunoilor","singular-vocative":"gheunoaie","plural-vocative":"gheunoilor"}},{"word":"gheura","pos":"verb","definitions":["to shell, pod; to remove grains from corn/maize, to shuck"],"forms":{"canonical":"a gheura 1st conjugation","present-singular-third-person":"gheurează","participle-past":"gheurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gheura","gerund":"gheurând","first-person-indicative-present-singular":"gheurez","indicative-present-second-person-singular":"gheurezi","indicative-present-singular-third-person":"gheurează","first-person-indicative-plural-present":"gheurăm","indicative-plural-present-second-person":"gheurați","indicative-plural-present-third-person":"gheurează","first-person-imperfect-indicative-singular":"gheuram","imperfect-indicative-second-person-singular":"gheurai","imperfect-indicative-singular-third-person":"gheura","first-person-imperfect-indicative-plural":"gheuram","imperfect-indicative-plural-second-person":"gheurați","imperfect-indicative-plural-third-person":"gheurau","first-person-indicative-perfect-singular":"gheurai","indicative-perfect-second-person-singular":"gheurași","indicative-perfect-singular-third-person":"gheură","first-person-indicative-perfect-plural":"gheurarăm","indicative-perfect-plural-second-person":"gheurarăți","indicative-perfect-plural-third-person":"gheurară","first-person-indicative-pluperfect-singular":"gheurasem","indicative-pluperfect-second-person-singular":"gheuraseși","indicative-pluperfect-singular-third-person":"gheurase","first-person-indicative-pluperfect-plural":"gheuraserăm","indicative-pluperfect-plural-second-person":"gheuraserăți","indicative-pluperfect-plural-third-person":"gheuraseră","first-person-present-singular-subjunctive":"să gheurez","present-second-person-singular-subjunctive":"să gheurezi","present-singular-subjunctive-third-person":"să gheureze","first-person-plural-present-subjunctive":"să gheurăm","plural-present-second-person-subjunctive":"să gheurați","plural-present-subjunctive-third-person":"să gheureze","imperative-second-person-singular":"gheurează","imperative-plural-second-person":"gheurați","imperative-negative-second-person-singular":"nu gheura","imperative-negative-plural-second-person":"nu gheurați","alternative":"gheora"}},{"word":"ghezăș","pos":"noun","definitions":["train"],"forms":{"plural":"ghezășe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghezăș","accusative-definite-nominative-singular":"ghezășul","accusative-indefinite-nominative-plural":"ghezășe","accusative-definite-nominative-plural":"ghezășele","dative-genitive-indefinite-singular":"ghezăș","dative-definite-genitive-singular":"ghezășului","dative-genitive-indefinite-plural":"ghezășe","dative-definite-genitive-plural":"ghezășelor","singular-vocative":"ghezășule","plural-vocative":"ghezășelor"}},{"word":"ghialog","pos":"adv","definitions":["by foot"]},{"word":"ghiară","pos":"noun","definitions":["obsolete form of gheară"],"forms":{"plural":"ghiare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiară","accusative-definite-nominative-singular":"ghiara","accusative-indefinite-nominative-plural":"ghiare","accusative-definite-nominative-plural":"ghiarele","dative-genitive-indefinite-singular":"ghiare","dative-definite-genitive-singular":"ghiarei","dative-genitive-indefinite-plural":"ghiare","dative-definite-genitive-plural":"ghiarelor","singular-vocative":"ghiară","plural-vocative":"ghiarelor"}},{"word":"ghiarghilă","pos":"noun","definitions":["dahlia"],"forms":{"plural":"ghiarghile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiarghilă","accusative-definite-nominative-singular":"ghiarghila","accusative-indefinite-nominative-plural":"ghiarghile","accusative-definite-nominative-plural":"ghiarghilele","dative-genitive-indefinite-singular":"ghiarghile","dative-definite-genitive-singular":"ghiarghilei","dative-genitive-indefinite-plural":"ghiarghile","dative-definite-genitive-plural":"ghiarghilelor","singular-vocative":"ghiarghilă","plural-vocative":"ghiarghilelor"}},{"word":"Ghiață","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiață"}},{"word":"Ghiaur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiaur"}},{"word":"ghiaur","pos":"noun","definitions":["a giaour; a non-Muslim, especially a Christian, an infidel"],"forms":{"plural":"ghiauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiaur","accusative-definite-nominative-singular":"ghiaurul","accusative-indefinite-nominative-plural":"ghiauri","accusative-definite-nominative-plural":"ghiaurii","dative-genitive-indefinite-singular":"ghiaur","dative-definite-genitive-singular":"ghiaurului","dative-genitive-indefinite-plural":"ghiauri","dative-definite-genitive-plural":"ghiaurilor","singular-vocative":"ghiaurule","plural-vocative":"ghiaurilor"}},{"word":"Ghiauru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiauru"}},{"word":"ghibănaș","pos":"noun","definitions":["diminutive of ghiban"],"forms":{"plural":"ghibănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghibănaș","accusative-definite-nominative-singular":"ghibănașul","accusative-indefinite-nominative-plural":"ghibănași","accusative-definite-nominative-plural":"ghibănașii","dative-genitive-indefinite-singular":"ghibănaș","dative-definite-genitive-singular":"ghibănașului","dative-genitive-indefinite-plural":"ghibănași","dative-definite-genitive-plural":"ghibănașilor","singular-vocative":"ghibănașule","plural-vocative":"ghibănașilor"}},{"word":"Ghibănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghibănescu"}},{"word":"ghibelin","pos":"noun","definitions":["Ghibelline"],"forms":{"plural":"ghibelini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghibelin","accusative-definite-nominative-singular":"ghibelinul","accusative-indefinite-nominative-plural":"ghibelini","accusative-definite-nominative-plural":"ghibelinii","dative-genitive-indefinite-singular":"ghibelin","dative-definite-genitive-singular":"ghibelinului","dative-genitive-indefinite-plural":"ghibelini","dative-definite-genitive-plural":"ghibelinilor","singular-vocative":"ghibelinule","plural-vocative":"ghibelinilor"}},{"word":"ghibirdic","pos":"noun","definitions":["short person"],"forms":{"plural":"ghibirdici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghibirdic","accusative-definite-nominative-singular":"ghibirdicul","accusative-indefinite-nominative-plural":"ghibirdici","accusative-definite-nominative-plural":"ghibirdicii","dative-genitive-indefinite-singular":"ghibirdic","dative-definite-genitive-singular":"ghibirdicului","dative-genitive-indefinite-plural":"ghibirdici","dative-definite-genitive-plural":"ghibirdicilor","singular-vocative":"ghibirdicule","plural-vocative":"ghibirdicilor"}},{"word":"ghibiroancă","pos":"noun","definitions":["potato"],"forms":{"plural":"ghibiroance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghibiroancă","accusative-definite-nominative-singular":"ghibiroanca","accusative-indefinite-nominative-plural":"ghibiroance","accusative-definite-nominative-plural":"ghibiroancele","dative-genitive-indefinite-singular":"ghibiroance","dative-definite-genitive-singular":"ghibiroancei","dative-genitive-indefinite-plural":"ghibiroance","dative-definite-genitive-plural":"ghibiroancelor","singular-vocative":"ghibiroancă","plural-vocative":"ghibiroancelor"}},{"word":"ghiborț","pos":"noun","definitions":["ruff (Gymnocephalus cernua syn. Acerina cernua)"],"forms":{"plural":"ghiborți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiborț","accusative-definite-nominative-singular":"ghiborțul","accusative-indefinite-nominative-plural":"ghiborți","accusative-definite-nominative-plural":"ghiborții","dative-genitive-indefinite-singular":"ghiborț","dative-definite-genitive-singular":"ghiborțului","dative-genitive-indefinite-plural":"ghiborți","dative-definite-genitive-plural":"ghiborților","singular-vocative":"ghiborțule","plural-vocative":"ghiborților"}},{"word":"ghiborțaș","pos":"noun","definitions":["diminutive of ghiborț"],"forms":{"plural":"ghiborțași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiborțaș","accusative-definite-nominative-singular":"ghiborțașul","accusative-indefinite-nominative-plural":"ghiborțași","accusative-definite-nominative-plural":"ghiborțașii","dative-genitive-indefinite-singular":"ghiborțaș","dative-definite-genitive-singular":"ghiborțașului","dative-genitive-indefinite-plural":"ghiborțași","dative-definite-genitive-plural":"ghiborțașilor","singular-vocative":"ghiborțașule","plural-vocative":"ghiborțașilor"}},{"word":"ghibos","pos":"adj","definitions":["obsolete form of ghebos"],"forms":{"feminine-singular":"ghiboasă","masculine-plural":"ghiboși","feminine-neuter-plural":"ghiboase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghibos","error-unrecognized-form-feminine-indefinite-singular":"ghiboasă","error-unrecognized-form-indefinite-masculine-plural":"ghiboși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghiboase","definite-error-unrecognized-form-masculine-neuter-singular":"ghibosul","definite-error-unrecognized-form-feminine-singular":"ghiboasa","definite-error-unrecognized-form-masculine-plural":"ghiboșii","definite-error-unrecognized-form-feminine-neuter-plural":"ghiboasele"}},{"word":"Ghibu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghibu"}},{"word":"Ghiburoșu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiburoșu"}},{"word":"Ghica","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghica"}},{"word":"Ghican","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghican"}},{"word":"Ghicani","pos":"name","definitions":["a village in Alexandru Vlahuță, Vaslui County, Romania"],"gender":"m"},{"word":"ghicelic","pos":"noun","definitions":["alternative form of ghigilic"],"forms":{"plural":"ghicelice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghicelic","accusative-definite-nominative-singular":"ghicelicul","accusative-indefinite-nominative-plural":"ghicelice","accusative-definite-nominative-plural":"ghicelicele","dative-genitive-indefinite-singular":"ghicelic","dative-definite-genitive-singular":"ghicelicului","dative-genitive-indefinite-plural":"ghicelice","dative-definite-genitive-plural":"ghicelicelor","singular-vocative":"ghicelicule","plural-vocative":"ghicelicelor"}},{"word":"ghici","pos":"verb","definitions":["to guess","to predict, foresee, divine","to find out, discover"],"pronunciation":"/ɡiˈt͡ʃi/","forms":{"canonical":"a ghici 4th conjugation","present-singular-third-person":"ghicește","participle-past":"ghicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ghici","gerund":"ghicind","first-person-indicative-present-singular":"ghicesc","indicative-present-second-person-singular":"ghicești","indicative-present-singular-third-person":"ghicește","first-person-indicative-plural-present":"ghicim","indicative-plural-present-second-person":"ghiciți","indicative-plural-present-third-person":"ghicesc","first-person-imperfect-indicative-singular":"ghiceam","imperfect-indicative-second-person-singular":"ghiceai","imperfect-indicative-singular-third-person":"ghicea","first-person-imperfect-indicative-plural":"ghiceam","imperfect-indicative-plural-second-person":"ghiceați","imperfect-indicative-plural-third-person":"ghiceau","first-person-indicative-perfect-singular":"ghicii","indicative-perfect-second-person-singular":"ghiciși","indicative-perfect-singular-third-person":"ghici","first-person-indicative-perfect-plural":"ghicirăm","indicative-perfect-plural-second-person":"ghicirăți","indicative-perfect-plural-third-person":"ghiciră","first-person-indicative-pluperfect-singular":"ghicisem","indicative-pluperfect-second-person-singular":"ghiciseși","indicative-pluperfect-singular-third-person":"ghicise","first-person-indicative-pluperfect-plural":"ghiciserăm","indicative-pluperfect-plural-second-person":"ghiciserăți","indicative-pluperfect-plural-third-person":"ghiciseră","first-person-present-singular-subjunctive":"să ghicesc","present-second-person-singular-subjunctive":"să ghicești","present-singular-subjunctive-third-person":"să ghicească","first-person-plural-present-subjunctive":"să ghicim","plural-present-second-person-subjunctive":"să ghiciți","plural-present-subjunctive-third-person":"să ghicească","imperative-second-person-singular":"ghicește","imperative-plural-second-person":"ghiciți","imperative-negative-second-person-singular":"nu ghici","imperative-negative-plural-second-person":"nu ghiciți"}},{"word":"ghicire","pos":"noun","definitions":["guess"],"forms":{"plural":"ghiciri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghicire","accusative-definite-nominative-singular":"ghicirea","accusative-indefinite-nominative-plural":"ghiciri","accusative-definite-nominative-plural":"ghicirile","dative-genitive-indefinite-singular":"ghiciri","dative-definite-genitive-singular":"ghicirii","dative-genitive-indefinite-plural":"ghiciri","dative-definite-genitive-plural":"ghicirilor","singular-vocative":"ghicire","plural-vocative":"ghicirilor"}},{"word":"ghicit","pos":"verb","definitions":["past participle of ghici"],"pronunciation":"/ɡiˈt͡ʃit/","forms":{"participle-past":"of ghici","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghicit","error-unrecognized-form-feminine-indefinite-singular":"ghicită","error-unrecognized-form-indefinite-masculine-plural":"ghiciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghicite","definite-error-unrecognized-form-masculine-neuter-singular":"ghicitul","definite-error-unrecognized-form-feminine-singular":"ghicita","definite-error-unrecognized-form-masculine-plural":"ghiciții","definite-error-unrecognized-form-feminine-neuter-plural":"ghicitele"}},{"word":"ghicit","pos":"noun","definitions":["guesswork"],"pronunciation":"/ɡiˈt͡ʃit/","forms":{"plural":"ghicite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghicit","accusative-definite-nominative-singular":"ghicitul","accusative-indefinite-nominative-plural":"ghicite","accusative-definite-nominative-plural":"ghicitele","dative-genitive-indefinite-singular":"ghicit","dative-definite-genitive-singular":"ghicitului","dative-genitive-indefinite-plural":"ghicite","dative-definite-genitive-plural":"ghicitelor","singular-vocative":"ghicitule","plural-vocative":"ghicitelor"}},{"word":"ghicitoare","pos":"noun","definitions":["riddle"],"pronunciation":"/ɡi.t͡ʃiˈto̯a.re/","forms":{"plural":"ghicitori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghicitoare","accusative-definite-nominative-singular":"ghicitoarea","accusative-indefinite-nominative-plural":"ghicitori","accusative-definite-nominative-plural":"ghicitorile","dative-genitive-indefinite-singular":"ghicitori","dative-definite-genitive-singular":"ghicitorii","dative-genitive-indefinite-plural":"ghicitori","dative-definite-genitive-plural":"ghicitorilor","singular-vocative":"ghicitoare","plural-vocative":"ghicitorilor"}},{"word":"ghicitoare","pos":"noun","definitions":["female equivalent of ghicitor: female fortune-teller"],"pronunciation":"/ɡi.t͡ʃiˈto̯a.re/","forms":{"plural":"ghicitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ghicitoare","accusative-definite-nominative-singular":"ghicitoarea","accusative-indefinite-nominative-plural":"ghicitoare","accusative-definite-nominative-plural":"ghicitoarele","dative-genitive-indefinite-singular":"ghicitoare","dative-definite-genitive-singular":"ghicitoarei","dative-genitive-indefinite-plural":"ghicitoare","dative-definite-genitive-plural":"ghicitoarelor","singular-vocative":"ghicitoare","plural-vocative":"ghicitoarelor"}},{"word":"ghicitor","pos":"noun","definitions":["seer"],"forms":{"plural":"ghicitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghicitor","accusative-definite-nominative-singular":"ghicitorul","accusative-indefinite-nominative-plural":"ghicitori","accusative-definite-nominative-plural":"ghicitorii","dative-genitive-indefinite-singular":"ghicitor","dative-definite-genitive-singular":"ghicitorului","dative-genitive-indefinite-plural":"ghicitori","dative-definite-genitive-plural":"ghicitorilor","singular-vocative":"ghicitorule","plural-vocative":"ghicitorilor"}},{"word":"ghicitoreasă","pos":"noun","definitions":["female equivalent of ghicitor"],"forms":{"plural":"ghicitorese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghicitoreasă","accusative-definite-nominative-singular":"ghicitoreasa","accusative-indefinite-nominative-plural":"ghicitorese","accusative-definite-nominative-plural":"ghicitoresele","dative-genitive-indefinite-singular":"ghicitorese","dative-definite-genitive-singular":"ghicitoresei","dative-genitive-indefinite-plural":"ghicitorese","dative-definite-genitive-plural":"ghicitoreselor","singular-vocative":"ghicitoreasă","plural-vocative":"ghicitoreselor"}},{"word":"ghicitură","pos":"noun","definitions":["riddle"],"forms":{"plural":"ghicituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghicitură","accusative-definite-nominative-singular":"ghicitura","accusative-indefinite-nominative-plural":"ghicituri","accusative-definite-nominative-plural":"ghiciturile","dative-genitive-indefinite-singular":"ghicituri","dative-definite-genitive-singular":"ghiciturii","dative-genitive-indefinite-plural":"ghicituri","dative-definite-genitive-plural":"ghiciturilor","singular-vocative":"ghicitură","plural-vocative":"ghiciturilor"}},{"word":"Ghiciulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghiciulescu"}},{"word":"Ghiculeasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Ghiculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghiculescu"}},{"word":"Ghicuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghicuță"}},{"word":"ghid","pos":"noun","definitions":["guide"],"pronunciation":"/ɡid/","forms":{"plural":"ghizi","feminine":"equivalent ghidă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghid","accusative-definite-nominative-singular":"ghidul","accusative-indefinite-nominative-plural":"ghizi","accusative-definite-nominative-plural":"ghizii","dative-genitive-indefinite-singular":"ghid","dative-definite-genitive-singular":"ghidului","dative-genitive-indefinite-plural":"ghizi","dative-definite-genitive-plural":"ghizilor","singular-vocative":"ghidule","plural-vocative":"ghizilor"}},{"word":"ghid","pos":"noun","definitions":["guidebook"],"pronunciation":"/ɡid/","forms":{"plural":"ghiduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghid","accusative-definite-nominative-singular":"ghidul","accusative-indefinite-nominative-plural":"ghiduri","accusative-definite-nominative-plural":"ghidurile","dative-genitive-indefinite-singular":"ghid","dative-definite-genitive-singular":"ghidului","dative-genitive-indefinite-plural":"ghiduri","dative-definite-genitive-plural":"ghidurilor","singular-vocative":"ghidule","plural-vocative":"ghidurilor"}},{"word":"ghid de călătorie","pos":"noun","definitions":["travel guide (book)"],"forms":{"plural":"ghiduri de călătorie"}},{"word":"ghid turistic","pos":"noun","definitions":["travel guide (book)"],"forms":{"plural":"ghiduri turistice"}},{"word":"ghid turistic","pos":"noun","definitions":["tour guide (person)"],"forms":{"plural":"ghizi turistici"}},{"word":"Ghida","pos":"name","definitions":["a village in Balc, Bihor County, Romania"],"gender":"f"},{"word":"ghida","pos":"verb","definitions":["to guide"],"forms":{"canonical":"a ghida 1st conjugation","present-singular-third-person":"ghidează","participle-past":"ghidat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ghida","gerund":"ghidând","first-person-indicative-present-singular":"ghidez","indicative-present-second-person-singular":"ghidezi","indicative-present-singular-third-person":"ghidează","first-person-indicative-plural-present":"ghidăm","indicative-plural-present-second-person":"ghidați","indicative-plural-present-third-person":"ghidează","first-person-imperfect-indicative-singular":"ghidam","imperfect-indicative-second-person-singular":"ghidai","imperfect-indicative-singular-third-person":"ghida","first-person-imperfect-indicative-plural":"ghidam","imperfect-indicative-plural-second-person":"ghidați","imperfect-indicative-plural-third-person":"ghidau","first-person-indicative-perfect-singular":"ghidai","indicative-perfect-second-person-singular":"ghidași","indicative-perfect-singular-third-person":"ghidă","first-person-indicative-perfect-plural":"ghidarăm","indicative-perfect-plural-second-person":"ghidarăți","indicative-perfect-plural-third-person":"ghidară","first-person-indicative-pluperfect-singular":"ghidasem","indicative-pluperfect-second-person-singular":"ghidaseși","indicative-pluperfect-singular-third-person":"ghidase","first-person-indicative-pluperfect-plural":"ghidaserăm","indicative-pluperfect-plural-second-person":"ghidaserăți","indicative-pluperfect-plural-third-person":"ghidaseră","first-person-present-singular-subjunctive":"să ghidez","present-second-person-singular-subjunctive":"să ghidezi","present-singular-subjunctive-third-person":"să ghideze","first-person-plural-present-subjunctive":"să ghidăm","plural-present-second-person-subjunctive":"să ghidați","plural-present-subjunctive-third-person":"să ghideze","imperative-second-person-singular":"ghidează","imperative-plural-second-person":"ghidați","imperative-negative-second-person-singular":"nu ghida","imperative-negative-plural-second-person":"nu ghidați"}},{"word":"ghidă","pos":"noun","definitions":["female equivalent of ghid: female guide"],"pronunciation":"/ˈɡi.də/","forms":{"plural":"ghide","masculine":"equivalent ghid","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghidă","accusative-definite-nominative-singular":"ghida","accusative-indefinite-nominative-plural":"ghide","accusative-definite-nominative-plural":"ghidele","dative-genitive-indefinite-singular":"ghide","dative-definite-genitive-singular":"ghidei","dative-genitive-indefinite-plural":"ghide","dative-definite-genitive-plural":"ghidelor","singular-vocative":"ghidă","plural-vocative":"ghidelor"}},{"word":"ghidaj","pos":"noun","definitions":["guidance"],"forms":{"plural":"ghidaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghidaj","accusative-definite-nominative-singular":"ghidajul","accusative-indefinite-nominative-plural":"ghidaje","accusative-definite-nominative-plural":"ghidajele","dative-genitive-indefinite-singular":"ghidaj","dative-definite-genitive-singular":"ghidajului","dative-genitive-indefinite-plural":"ghidaje","dative-definite-genitive-plural":"ghidajelor","singular-vocative":"ghidajule","plural-vocative":"ghidajelor"}},{"word":"ghidare","pos":"noun","definitions":["guidance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"ghidare","accusative-definite-nominative":"ghidarea","dative-genitive-indefinite":"ghidare","dative-definite-genitive":"ghidarei","vocative":"ghidare"}},{"word":"Ghidașteu","pos":"name","definitions":["a village in Iclănzel, Mureș County, Romania"],"gender":"m"},{"word":"ghidat","pos":"adj","definitions":["guided"],"forms":{"feminine-singular":"ghidată","masculine-plural":"ghidați","feminine-neuter-plural":"ghidate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghidat","error-unrecognized-form-feminine-indefinite-singular":"ghidată","error-unrecognized-form-indefinite-masculine-plural":"ghidați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghidate","definite-error-unrecognized-form-masculine-neuter-singular":"ghidatul","definite-error-unrecognized-form-feminine-singular":"ghidata","definite-error-unrecognized-form-masculine-plural":"ghidații","definite-error-unrecognized-form-feminine-neuter-plural":"ghidatele"}},{"word":"ghidat","pos":"verb","definitions":["past participle of ghida"],"forms":{"participle-past":"of ghida"}},{"word":"Ghideanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghideanu"}},{"word":"Ghidescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghidescu"}},{"word":"Ghidfalău","pos":"name","definitions":["a commune of Covasna County, Romania","a village in Ghidfalău, Covasna County, Romania"],"gender":"m"},{"word":"ghidi","pos":"intj","definitions":["look; listen up"]},{"word":"Ghidion","pos":"name","definitions":["a village in Stănița, Neamț County, Romania","a surname"],"gender":"m"},{"word":"Ghidionul","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Căpățâna"],"gender":"m"},{"word":"ghidoane","pos":"noun","definitions":["plural of ghidon"]},{"word":"ghidon","pos":"noun","definitions":["handlebar","guidon"],"pronunciation":"/ɡiˈdon/","forms":{"plural":"ghidoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghidon","accusative-definite-nominative-singular":"ghidonul","accusative-indefinite-nominative-plural":"ghidoane","accusative-definite-nominative-plural":"ghidoanele","dative-genitive-indefinite-singular":"ghidon","dative-definite-genitive-singular":"ghidonului","dative-genitive-indefinite-plural":"ghidoane","dative-definite-genitive-plural":"ghidoanelor","singular-vocative":"ghidonule","plural-vocative":"ghidoanelor","alternative":"гидон"}},{"word":"ghidrin","pos":"noun","definitions":["three-spined stickleback, Gasterosteus aculeatus"],"forms":{"plural":"ghidrini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghidrin","accusative-definite-nominative-singular":"ghidrinul","accusative-indefinite-nominative-plural":"ghidrini","accusative-definite-nominative-plural":"ghidrinii","dative-genitive-indefinite-singular":"ghidrin","dative-definite-genitive-singular":"ghidrinului","dative-genitive-indefinite-plural":"ghidrini","dative-definite-genitive-plural":"ghidrinilor","singular-vocative":"ghidrinule","plural-vocative":"ghidrinilor"}},{"word":"Ghiduleni","pos":"name","definitions":["a village in Ghiduleni, Rezina Raion, Moldova","a commune of Rezina Raion, Moldova"],"gender":"m"},{"word":"ghiduri","pos":"noun","definitions":["plural of ghid (“guidebooks”)"],"pronunciation":"[ˈɡi.durʲ]","gender":"n-p"},{"word":"ghiduș","pos":"adj","definitions":["tricksy, witty"],"forms":{"feminine-singular":"ghidușă","masculine-plural":"ghiduși","feminine-neuter-plural":"ghidușe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiduș","error-unrecognized-form-feminine-indefinite-singular":"ghidușă","error-unrecognized-form-indefinite-masculine-plural":"ghiduși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghidușe","definite-error-unrecognized-form-masculine-neuter-singular":"ghidușul","definite-error-unrecognized-form-feminine-singular":"ghidușa","definite-error-unrecognized-form-masculine-plural":"ghidușii","definite-error-unrecognized-form-feminine-neuter-plural":"ghidușele"}},{"word":"ghidușar","pos":"noun","definitions":["a joker"],"forms":{"plural":"ghidușari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghidușar","accusative-definite-nominative-singular":"ghidușarul","accusative-indefinite-nominative-plural":"ghidușari","accusative-definite-nominative-plural":"ghidușarii","dative-genitive-indefinite-singular":"ghidușar","dative-definite-genitive-singular":"ghidușarului","dative-genitive-indefinite-plural":"ghidușari","dative-definite-genitive-plural":"ghidușarilor","singular-vocative":"ghidușarule","plural-vocative":"ghidușarilor"}},{"word":"ghidușărie","pos":"noun","definitions":["joke, trick"],"forms":{"plural":"ghidușării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghidușărie","accusative-definite-nominative-singular":"ghidușăria","accusative-indefinite-nominative-plural":"ghidușării","accusative-definite-nominative-plural":"ghidușăriile","dative-genitive-indefinite-singular":"ghidușării","dative-definite-genitive-singular":"ghidușăriei","dative-genitive-indefinite-plural":"ghidușării","dative-definite-genitive-plural":"ghidușăriilor","singular-vocative":"ghidușărie","plural-vocative":"ghidușăriilor"}},{"word":"ghidușie","pos":"noun","definitions":["joke, trick, buffoonery, drollery"],"forms":{"plural":"ghidușii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghidușie","accusative-definite-nominative-singular":"ghidușia","accusative-indefinite-nominative-plural":"ghidușii","accusative-definite-nominative-plural":"ghidușiile","dative-genitive-indefinite-singular":"ghidușii","dative-definite-genitive-singular":"ghidușiei","dative-genitive-indefinite-plural":"ghidușii","dative-definite-genitive-plural":"ghidușiilor","singular-vocative":"ghidușie","plural-vocative":"ghidușiilor"}},{"word":"ghidușlâc","pos":"noun","definitions":["joke, trick, buffoonery, drollery"],"forms":{"plural":"ghidușlâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghidușlâc","accusative-definite-nominative-singular":"ghidușlâcul","accusative-indefinite-nominative-plural":"ghidușlâcuri","accusative-definite-nominative-plural":"ghidușlâcurile","dative-genitive-indefinite-singular":"ghidușlâc","dative-definite-genitive-singular":"ghidușlâcului","dative-genitive-indefinite-plural":"ghidușlâcuri","dative-definite-genitive-plural":"ghidușlâcurilor","singular-vocative":"ghidușlâcule","plural-vocative":"ghidușlâcurilor"}},{"word":"Ghiduț","pos":"name","definitions":["a village in Lăzarea, Harghita County, Romania"],"gender":"m"},{"word":"ghiemăli","pos":"verb","definitions":["to lift using a lever"],"forms":{"canonical":"a ghiemăli 4th conjugation","present-singular-third-person":"ghiemălie","participle-past":"ghiemălit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ghiemăli","gerund":"ghiemălind","first-person-indicative-present-singular":"ghiemăl","indicative-present-second-person-singular":"ghiemăli","indicative-present-singular-third-person":"ghiemăle","first-person-indicative-plural-present":"ghiemălim","indicative-plural-present-second-person":"ghiemăliți","indicative-plural-present-third-person":"ghiemăl","first-person-imperfect-indicative-singular":"ghiemăleam","imperfect-indicative-second-person-singular":"ghiemăleai","imperfect-indicative-singular-third-person":"ghiemălea","first-person-imperfect-indicative-plural":"ghiemăleam","imperfect-indicative-plural-second-person":"ghiemăleați","imperfect-indicative-plural-third-person":"ghiemăleau","first-person-indicative-perfect-singular":"ghiemălii","indicative-perfect-second-person-singular":"ghiemăliși","indicative-perfect-singular-third-person":"ghiemăli","first-person-indicative-perfect-plural":"ghiemălirăm","indicative-perfect-plural-second-person":"ghiemălirăți","indicative-perfect-plural-third-person":"ghiemăliră","first-person-indicative-pluperfect-singular":"ghiemălisem","indicative-pluperfect-second-person-singular":"ghiemăliseși","indicative-pluperfect-singular-third-person":"ghiemălise","first-person-indicative-pluperfect-plural":"ghiemăliserăm","indicative-pluperfect-plural-second-person":"ghiemăliserăți","indicative-pluperfect-plural-third-person":"ghiemăliseră","first-person-present-singular-subjunctive":"să ghiemăl","present-second-person-singular-subjunctive":"să ghiemăli","present-singular-subjunctive-third-person":"să ghiemălă","first-person-plural-present-subjunctive":"să ghiemălim","plural-present-second-person-subjunctive":"să ghiemăliți","plural-present-subjunctive-third-person":"să ghiemălă","imperative-second-person-singular":"ghiemăle","imperative-plural-second-person":"ghiemăliți","imperative-negative-second-person-singular":"nu ghiemăli","imperative-negative-plural-second-person":"nu ghiemăliți"}},{"word":"ghiers","pos":"noun","definitions":["alternative form of viers"],"forms":{"plural":"ghiersuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiers","accusative-definite-nominative-singular":"ghiersul","accusative-indefinite-nominative-plural":"ghiersuri","accusative-definite-nominative-plural":"ghiersurile","dative-genitive-indefinite-singular":"ghiers","dative-definite-genitive-singular":"ghiersului","dative-genitive-indefinite-plural":"ghiersuri","dative-definite-genitive-plural":"ghiersurilor","singular-vocative":"ghiersule","plural-vocative":"ghiersurilor"}},{"word":"ghiftui","pos":"verb","definitions":["to cram, to stuff, to eat too much"],"forms":{"canonical":"a ghiftui 4th conjugation","present-singular-third-person":"ghiftuiește","participle-past":"ghiftuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ghiftui","gerund":"ghiftuind","first-person-indicative-present-singular":"ghiftuiesc","indicative-present-second-person-singular":"ghiftuiești","indicative-present-singular-third-person":"ghiftuiește","first-person-indicative-plural-present":"ghiftuim","indicative-plural-present-second-person":"ghiftuiți","indicative-plural-present-third-person":"ghiftuiesc","first-person-imperfect-indicative-singular":"ghiftuiam","imperfect-indicative-second-person-singular":"ghiftuiai","imperfect-indicative-singular-third-person":"ghiftuia","first-person-imperfect-indicative-plural":"ghiftuiam","imperfect-indicative-plural-second-person":"ghiftuiați","imperfect-indicative-plural-third-person":"ghiftuiau","first-person-indicative-perfect-singular":"ghiftuii","indicative-perfect-second-person-singular":"ghiftuiși","indicative-perfect-singular-third-person":"ghiftui","first-person-indicative-perfect-plural":"ghiftuirăm","indicative-perfect-plural-second-person":"ghiftuirăți","indicative-perfect-plural-third-person":"ghiftuiră","first-person-indicative-pluperfect-singular":"ghiftuisem","indicative-pluperfect-second-person-singular":"ghiftuiseși","indicative-pluperfect-singular-third-person":"ghiftuise","first-person-indicative-pluperfect-plural":"ghiftuiserăm","indicative-pluperfect-plural-second-person":"ghiftuiserăți","indicative-pluperfect-plural-third-person":"ghiftuiseră","first-person-present-singular-subjunctive":"să ghiftuiesc","present-second-person-singular-subjunctive":"să ghiftuiești","present-singular-subjunctive-third-person":"să ghiftuiască","first-person-plural-present-subjunctive":"să ghiftuim","plural-present-second-person-subjunctive":"să ghiftuiți","plural-present-subjunctive-third-person":"să ghiftuiască","imperative-second-person-singular":"ghiftuiește","imperative-plural-second-person":"ghiftuiți","imperative-negative-second-person-singular":"nu ghiftui","imperative-negative-plural-second-person":"nu ghiftuiți"}},{"word":"ghiftuire","pos":"noun","definitions":["cramming, stuffing, eating too much"],"forms":{"plural":"ghiftuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghiftuire","accusative-definite-nominative-singular":"ghiftuirea","accusative-indefinite-nominative-plural":"ghiftuiri","accusative-definite-nominative-plural":"ghiftuirile","dative-genitive-indefinite-singular":"ghiftuiri","dative-definite-genitive-singular":"ghiftuirii","dative-genitive-indefinite-plural":"ghiftuiri","dative-definite-genitive-plural":"ghiftuirilor","singular-vocative":"ghiftuire","plural-vocative":"ghiftuirilor"}},{"word":"ghiftuit","pos":"adj","definitions":["crammed, stuffed, having eaten too much"],"forms":{"feminine-singular":"ghiftuită","masculine-plural":"ghiftuiți","feminine-neuter-plural":"ghiftuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiftuit","error-unrecognized-form-feminine-indefinite-singular":"ghiftuită","error-unrecognized-form-indefinite-masculine-plural":"ghiftuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghiftuite","definite-error-unrecognized-form-masculine-neuter-singular":"ghiftuitul","definite-error-unrecognized-form-feminine-singular":"ghiftuita","definite-error-unrecognized-form-masculine-plural":"ghiftuiții","definite-error-unrecognized-form-feminine-neuter-plural":"ghiftuitele"}},{"word":"ghiftuit","pos":"verb","definitions":["past participle of ghiftui"],"forms":{"participle-past":"of ghiftui"}},{"word":"ghig","pos":"noun","definitions":["knee"],"forms":{"plural":"ghiguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghig","accusative-definite-nominative-singular":"ghigul","accusative-indefinite-nominative-plural":"ghiguri","accusative-definite-nominative-plural":"ghigurile","dative-genitive-indefinite-singular":"ghig","dative-definite-genitive-singular":"ghigului","dative-genitive-indefinite-plural":"ghiguri","dative-definite-genitive-plural":"ghigurilor","singular-vocative":"ghigule","plural-vocative":"ghigurilor"}},{"word":"ghigă","pos":"noun","definitions":["club, cudgel, bludgeon, cosh"],"forms":{"plural":"ghige","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghigă","accusative-definite-nominative-singular":"ghiga","accusative-indefinite-nominative-plural":"ghige","accusative-definite-nominative-plural":"ghigele","dative-genitive-indefinite-singular":"ghige","dative-definite-genitive-singular":"ghigei","dative-genitive-indefinite-plural":"ghige","dative-definite-genitive-plural":"ghigelor","singular-vocative":"ghigă","plural-vocative":"ghigelor"}},{"word":"ghigant","pos":"adj","definitions":["obsolete form of gigant"],"forms":{"feminine-singular":"ghigantă","masculine-plural":"ghiganți","feminine-neuter-plural":"ghigante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghigant","error-unrecognized-form-feminine-indefinite-singular":"ghigantă","error-unrecognized-form-indefinite-masculine-plural":"ghiganți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghigante","definite-error-unrecognized-form-masculine-neuter-singular":"ghigantul","definite-error-unrecognized-form-feminine-singular":"ghiganta","definite-error-unrecognized-form-masculine-plural":"ghiganții","definite-error-unrecognized-form-feminine-neuter-plural":"ghigantele"}},{"word":"ghigar","pos":"noun","definitions":["swineherd"],"forms":{"plural":"ghigari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghigar","accusative-definite-nominative-singular":"ghigarul","accusative-indefinite-nominative-plural":"ghigari","accusative-definite-nominative-plural":"ghigarii","dative-genitive-indefinite-singular":"ghigar","dative-definite-genitive-singular":"ghigarului","dative-genitive-indefinite-plural":"ghigari","dative-definite-genitive-plural":"ghigarilor","singular-vocative":"ghigarule","plural-vocative":"ghigarilor"}},{"word":"Ghigeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghigeanu"}},{"word":"ghigilic","pos":"noun","definitions":["nightcap"],"forms":{"plural":"ghigilice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghigilic","accusative-definite-nominative-singular":"ghigilicul","accusative-indefinite-nominative-plural":"ghigilice","accusative-definite-nominative-plural":"ghigilicele","dative-genitive-indefinite-singular":"ghigilic","dative-definite-genitive-singular":"ghigilicului","dative-genitive-indefinite-plural":"ghigilice","dative-definite-genitive-plural":"ghigilicelor","singular-vocative":"ghigilicule","plural-vocative":"ghigilicelor"}},{"word":"Ghigoiești","pos":"name","definitions":["a village in Ștefan cel Mare, Neamț County, Romania"],"gender":"m"},{"word":"ghigorț","pos":"noun","definitions":["alternative form of ghiborț"],"forms":{"plural":"ghigorți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghigorț","accusative-definite-nominative-singular":"ghigorțul","accusative-indefinite-nominative-plural":"ghigorți","accusative-definite-nominative-plural":"ghigorții","dative-genitive-indefinite-singular":"ghigorț","dative-definite-genitive-singular":"ghigorțului","dative-genitive-indefinite-plural":"ghigorți","dative-definite-genitive-plural":"ghigorților","singular-vocative":"ghigorțule","plural-vocative":"ghigorților"}},{"word":"ghigorțel","pos":"noun","definitions":["diminutive of ghigorț"],"forms":{"plural":"ghigorței","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghigorțel","accusative-definite-nominative-singular":"ghigorțelul","accusative-indefinite-nominative-plural":"ghigorței","accusative-definite-nominative-plural":"ghigorțeii","dative-genitive-indefinite-singular":"ghigorțel","dative-definite-genitive-singular":"ghigorțelului","dative-genitive-indefinite-plural":"ghigorței","dative-definite-genitive-plural":"ghigorțeilor","singular-vocative":"ghigorțelule","plural-vocative":"ghigorțeilor"}},{"word":"Ghijasa de Jos","pos":"name","definitions":["a village in Nocrich, Sibiu County, Romania"],"gender":"f"},{"word":"Ghijasa de Sus","pos":"name","definitions":["a village in Alțina, Sibiu County, Romania"],"gender":"f"},{"word":"ghijoagă","pos":"noun","definitions":["jade (horse)"],"forms":{"plural":"ghijoage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghijoagă","accusative-definite-nominative-singular":"ghijoaga","accusative-indefinite-nominative-plural":"ghijoage","accusative-definite-nominative-plural":"ghijoagele","dative-genitive-indefinite-singular":"ghijoage","dative-definite-genitive-singular":"ghijoagei","dative-genitive-indefinite-plural":"ghijoage","dative-definite-genitive-plural":"ghijoagelor","singular-vocative":"ghijoagă","plural-vocative":"ghijoagelor"}},{"word":"Ghilad","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Ghilad, Timiș County, Romania"],"gender":"m"},{"word":"ghilant","pos":"adj","definitions":["paralysed","weak, feeble, ill"],"forms":{"feminine-singular":"ghilantă","masculine-plural":"ghilanți","feminine-neuter-plural":"ghilante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghilant","error-unrecognized-form-feminine-indefinite-singular":"ghilantă","error-unrecognized-form-indefinite-masculine-plural":"ghilanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghilante","definite-error-unrecognized-form-masculine-neuter-singular":"ghilantul","definite-error-unrecognized-form-feminine-singular":"ghilanta","definite-error-unrecognized-form-masculine-plural":"ghilanții","definite-error-unrecognized-form-feminine-neuter-plural":"ghilantele"}},{"word":"ghildă","pos":"noun","definitions":["guild"],"forms":{"plural":"ghilde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghildă","accusative-definite-nominative-singular":"ghilda","accusative-indefinite-nominative-plural":"ghilde","accusative-definite-nominative-plural":"ghildele","dative-genitive-indefinite-singular":"ghilde","dative-definite-genitive-singular":"ghildei","dative-genitive-indefinite-plural":"ghilde","dative-definite-genitive-plural":"ghildelor","singular-vocative":"ghildă","plural-vocative":"ghildelor"}},{"word":"ghilemele","pos":"noun","definitions":["alternative form of ghilimele"],"forms":{"plural":"ghilemele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghilemele","accusative-definite-nominative-singular":"ghilemelea","accusative-indefinite-nominative-plural":"ghilemele","accusative-definite-nominative-plural":"ghilemelele","dative-genitive-indefinite-singular":"ghilemele","dative-definite-genitive-singular":"ghilemelei","dative-genitive-indefinite-plural":"ghilemele","dative-definite-genitive-plural":"ghilemelelor","singular-vocative":"ghilemele","plural-vocative":"ghilemelelor"}},{"word":"Ghilești","pos":"name","definitions":["a village in Căuaș, Satu Mare County, Romania"],"gender":"m"},{"word":"Ghilgameș","pos":"name","definitions":["Gilgamesh"],"gender":"m"},{"word":"ghilicel","pos":"noun","definitions":["snowdrop"],"forms":{"plural":"ghilicei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghilicel","accusative-definite-nominative-singular":"ghilicelul","accusative-indefinite-nominative-plural":"ghilicei","accusative-definite-nominative-plural":"ghiliceii","dative-genitive-indefinite-singular":"ghilicel","dative-definite-genitive-singular":"ghilicelului","dative-genitive-indefinite-plural":"ghilicei","dative-definite-genitive-plural":"ghiliceilor","singular-vocative":"ghilicelule","plural-vocative":"ghiliceilor"}},{"word":"Ghiliceni","pos":"name","definitions":["a village in Ghiliceni, Telenești Raion, Moldova","a commune of Telenești Raion, Moldova"],"gender":"m"},{"word":"ghilimele","pos":"noun","definitions":["quotation marks"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"ghilimeli","accusative-definite-nominative":"ghilimelile","dative-genitive-indefinite":"ghilimeli","dative-definite-genitive":"ghilimelilor","vocative":"ghilimelilor"}},{"word":"ghilimete","pos":"noun","definitions":["alternative form of ghilimele"],"forms":{"plural":"ghilimete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"ghilimete","accusative-definite-nominative-singular":"ghilimetea","accusative-indefinite-nominative-plural":"ghilimete","accusative-definite-nominative-plural":"ghilimetele","dative-genitive-indefinite-singular":"ghilimete","dative-definite-genitive-singular":"ghilimetei","dative-genitive-indefinite-plural":"ghilimete","dative-definite-genitive-plural":"ghilimetelor","singular-vocative":"ghilimete","plural-vocative":"ghilimetelor"}},{"word":"ghiloș","pos":"noun","definitions":["alternative form of ghioș"],"forms":{"plural":"ghiloșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiloș","accusative-definite-nominative-singular":"ghiloșul","accusative-indefinite-nominative-plural":"ghiloșuri","accusative-definite-nominative-plural":"ghiloșurile","dative-genitive-indefinite-singular":"ghiloș","dative-definite-genitive-singular":"ghiloșului","dative-genitive-indefinite-plural":"ghiloșuri","dative-definite-genitive-plural":"ghiloșurilor","singular-vocative":"ghiloșule","plural-vocative":"ghiloșurilor"}},{"word":"ghiloșa","pos":"verb","definitions":["to alternative form of ghioșa"],"forms":{"canonical":"a ghiloșa 1st conjugation","present-singular-third-person":"ghiloșează","participle-past":"ghiloșat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ghiloșa","gerund":"ghiloșând","first-person-indicative-present-singular":"ghiloșez","indicative-present-second-person-singular":"ghiloșezi","indicative-present-singular-third-person":"ghiloșează","first-person-indicative-plural-present":"ghiloșăm","indicative-plural-present-second-person":"ghiloșați","indicative-plural-present-third-person":"ghiloșează","first-person-imperfect-indicative-singular":"ghiloșam","imperfect-indicative-second-person-singular":"ghiloșai","imperfect-indicative-singular-third-person":"ghiloșa","first-person-imperfect-indicative-plural":"ghiloșam","imperfect-indicative-plural-second-person":"ghiloșați","imperfect-indicative-plural-third-person":"ghiloșau","first-person-indicative-perfect-singular":"ghiloșai","indicative-perfect-second-person-singular":"ghiloșași","indicative-perfect-singular-third-person":"ghiloșă","first-person-indicative-perfect-plural":"ghiloșarăm","indicative-perfect-plural-second-person":"ghiloșarăți","indicative-perfect-plural-third-person":"ghiloșară","first-person-indicative-pluperfect-singular":"ghiloșasem","indicative-pluperfect-second-person-singular":"ghiloșaseși","indicative-pluperfect-singular-third-person":"ghiloșase","first-person-indicative-pluperfect-plural":"ghiloșaserăm","indicative-pluperfect-plural-second-person":"ghiloșaserăți","indicative-pluperfect-plural-third-person":"ghiloșaseră","first-person-present-singular-subjunctive":"să ghiloșez","present-second-person-singular-subjunctive":"să ghiloșezi","present-singular-subjunctive-third-person":"să ghiloșeze","first-person-plural-present-subjunctive":"să ghiloșăm","plural-present-second-person-subjunctive":"să ghiloșați","plural-present-subjunctive-third-person":"să ghiloșeze","imperative-second-person-singular":"ghiloșează","imperative-plural-second-person":"ghiloșați","imperative-negative-second-person-singular":"nu ghiloșa","imperative-negative-plural-second-person":"nu ghiloșați"}},{"word":"ghiloșare","pos":"noun","definitions":["alternative form of ghioșare"],"forms":{"plural":"ghiloșări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghiloșare","accusative-definite-nominative-singular":"ghiloșarea","accusative-indefinite-nominative-plural":"ghiloșări","accusative-definite-nominative-plural":"ghiloșările","dative-genitive-indefinite-singular":"ghiloșări","dative-definite-genitive-singular":"ghiloșării","dative-genitive-indefinite-plural":"ghiloșări","dative-definite-genitive-plural":"ghiloșărilor","singular-vocative":"ghiloșare","plural-vocative":"ghiloșărilor"}},{"word":"ghilotina","pos":"verb","definitions":["to guillotine"],"forms":{"canonical":"a ghilotina 1st conjugation","present-singular-third-person":"ghilotinează","participle-past":"ghilotinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a ghilotina","gerund":"ghilotinând","first-person-indicative-present-singular":"ghilotinez","indicative-present-second-person-singular":"ghilotinezi","indicative-present-singular-third-person":"ghilotinează","first-person-indicative-plural-present":"ghilotinăm","indicative-plural-present-second-person":"ghilotinați","indicative-plural-present-third-person":"ghilotinează","first-person-imperfect-indicative-singular":"ghilotinam","imperfect-indicative-second-person-singular":"ghilotinai","imperfect-indicative-singular-third-person":"ghilotina","first-person-imperfect-indicative-plural":"ghilotinam","imperfect-indicative-plural-second-person":"ghilotinați","imperfect-indicative-plural-third-person":"ghilotinau","first-person-indicative-perfect-singular":"ghilotinai","indicative-perfect-second-person-singular":"ghilotinași","indicative-perfect-singular-third-person":"ghilotină","first-person-indicative-perfect-plural":"ghilotinarăm","indicative-perfect-plural-second-person":"ghilotinarăți","indicative-perfect-plural-third-person":"ghilotinară","first-person-indicative-pluperfect-singular":"ghilotinasem","indicative-pluperfect-second-person-singular":"ghilotinaseși","indicative-pluperfect-singular-third-person":"ghilotinase","first-person-indicative-pluperfect-plural":"ghilotinaserăm","indicative-pluperfect-plural-second-person":"ghilotinaserăți","indicative-pluperfect-plural-third-person":"ghilotinaseră","first-person-present-singular-subjunctive":"să ghilotinez","present-second-person-singular-subjunctive":"să ghilotinezi","present-singular-subjunctive-third-person":"să ghilotineze","first-person-plural-present-subjunctive":"să ghilotinăm","plural-present-second-person-subjunctive":"să ghilotinați","plural-present-subjunctive-third-person":"să ghilotineze","imperative-second-person-singular":"ghilotinează","imperative-plural-second-person":"ghilotinați","imperative-negative-second-person-singular":"nu ghilotina","imperative-negative-plural-second-person":"nu ghilotinați"}},{"word":"ghilotină","pos":"noun","definitions":["guillotine"],"forms":{"plural":"ghilotine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghilotină","accusative-definite-nominative-singular":"ghilotina","accusative-indefinite-nominative-plural":"ghilotine","accusative-definite-nominative-plural":"ghilotinele","dative-genitive-indefinite-singular":"ghilotine","dative-definite-genitive-singular":"ghilotinei","dative-genitive-indefinite-plural":"ghilotine","dative-definite-genitive-plural":"ghilotinelor","singular-vocative":"ghilotină","plural-vocative":"ghilotinelor"}},{"word":"ghilotinare","pos":"noun","definitions":["guillotining"],"forms":{"plural":"ghilotinări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghilotinare","accusative-definite-nominative-singular":"ghilotinarea","accusative-indefinite-nominative-plural":"ghilotinări","accusative-definite-nominative-plural":"ghilotinările","dative-genitive-indefinite-singular":"ghilotinări","dative-definite-genitive-singular":"ghilotinării","dative-genitive-indefinite-plural":"ghilotinări","dative-definite-genitive-plural":"ghilotinărilor","singular-vocative":"ghilotinare","plural-vocative":"ghilotinărilor"}},{"word":"ghilotinat","pos":"adj","definitions":["guillotined"],"forms":{"feminine-singular":"ghilotinată","masculine-plural":"ghilotinați","feminine-neuter-plural":"ghilotinate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghilotinat","error-unrecognized-form-feminine-indefinite-singular":"ghilotinată","error-unrecognized-form-indefinite-masculine-plural":"ghilotinați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghilotinate","definite-error-unrecognized-form-masculine-neuter-singular":"ghilotinatul","definite-error-unrecognized-form-feminine-singular":"ghilotinata","definite-error-unrecognized-form-masculine-plural":"ghilotinații","definite-error-unrecognized-form-feminine-neuter-plural":"ghilotinatele"}},{"word":"ghilotinat","pos":"verb","definitions":["past participle of ghilotina"],"forms":{"participle-past":"of ghilotina"}},{"word":"ghilț","pos":"noun","definitions":["felt"],"forms":{"plural":"ghilți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghilț","accusative-definite-nominative-singular":"ghilțul","accusative-indefinite-nominative-plural":"ghilți","accusative-definite-nominative-plural":"ghilții","dative-genitive-indefinite-singular":"ghilț","dative-definite-genitive-singular":"ghilțului","dative-genitive-indefinite-plural":"ghilți","dative-definite-genitive-plural":"ghilților","singular-vocative":"ghilțule","plural-vocative":"ghilților"}},{"word":"Ghilvaci","pos":"name","definitions":["a village in Moftin, Satu Mare County, Romania"],"gender":"m"},{"word":"Ghimbășel","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Bârsa"],"gender":"m"},{"word":"Ghimbav","pos":"name","definitions":["a town in Brașov County, Romania"],"gender":"m"},{"word":"ghimber","pos":"noun","definitions":["ginger"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ghimber","accusative-definite-nominative":"ghimberul","dative-genitive-indefinite":"ghimber","dative-definite-genitive":"ghimberului","vocative":"ghimberule","alternative":"ghimbir"}},{"word":"ghimbir","pos":"noun","definitions":["alternative form of ghimber"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ghimbir","accusative-definite-nominative":"ghimbirul","dative-genitive-indefinite":"ghimbir","dative-definite-genitive":"ghimbirului","vocative":"ghimbirule"}},{"word":"ghimerlie","pos":"noun","definitions":["alternative form of ghimirlie"],"forms":{"plural":"ghimerlii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghimerlie","accusative-definite-nominative-singular":"ghimerlia","accusative-indefinite-nominative-plural":"ghimerlii","accusative-definite-nominative-plural":"ghimerliile","dative-genitive-indefinite-singular":"ghimerlii","dative-definite-genitive-singular":"ghimerliei","dative-genitive-indefinite-plural":"ghimerlii","dative-definite-genitive-plural":"ghimerliilor","singular-vocative":"ghimerlie","plural-vocative":"ghimerliilor"}},{"word":"Ghimeș","pos":"name","definitions":["a village in Ghimeș-Făget, Bacău County, Romania"],"gender":"m"},{"word":"Ghimeș-Făget","pos":"name","definitions":["a commune of Bacău County, Romania"],"gender":"m"},{"word":"Ghimicești","pos":"name","definitions":["a village in Fitionești, Vrancea County, Romania"],"gender":"m"},{"word":"ghimie","pos":"noun","definitions":["small ship"],"forms":{"plural":"ghimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghimie","accusative-definite-nominative-singular":"ghimia","accusative-indefinite-nominative-plural":"ghimii","accusative-definite-nominative-plural":"ghimiile","dative-genitive-indefinite-singular":"ghimii","dative-definite-genitive-singular":"ghimiei","dative-genitive-indefinite-plural":"ghimii","dative-definite-genitive-plural":"ghimiilor","singular-vocative":"ghimie","plural-vocative":"ghimiilor"}},{"word":"ghimigiu","pos":"noun","definitions":["sailor"],"forms":{"plural":"ghimigii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghimigiu","accusative-definite-nominative-singular":"ghimigiuul","accusative-indefinite-nominative-plural":"ghimigii","accusative-definite-nominative-plural":"ghimigiii","dative-genitive-indefinite-singular":"ghimigiu","dative-definite-genitive-singular":"ghimigiuului","dative-genitive-indefinite-plural":"ghimigii","dative-definite-genitive-plural":"ghimigiilor","singular-vocative":"ghimigiuule","plural-vocative":"ghimigiilor"}},{"word":"ghimirlie","pos":"noun","definitions":["hut, shanty, hovel"],"forms":{"plural":"ghimirlii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghimirlie","accusative-definite-nominative-singular":"ghimirlia","accusative-indefinite-nominative-plural":"ghimirlii","accusative-definite-nominative-plural":"ghimirliile","dative-genitive-indefinite-singular":"ghimirlii","dative-definite-genitive-singular":"ghimirliei","dative-genitive-indefinite-plural":"ghimirlii","dative-definite-genitive-plural":"ghimirliilor","singular-vocative":"ghimirlie","plural-vocative":"ghimirliilor"}},{"word":"ghimpariță","pos":"noun","definitions":["Crypsis aculeata"],"forms":{"plural":"ghimparițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghimpariță","accusative-definite-nominative-singular":"ghimparița","accusative-indefinite-nominative-plural":"ghimparițe","accusative-definite-nominative-plural":"ghimparițele","dative-genitive-indefinite-singular":"ghimparițe","dative-definite-genitive-singular":"ghimpariței","dative-genitive-indefinite-plural":"ghimparițe","dative-definite-genitive-plural":"ghimparițelor","singular-vocative":"ghimpariță","plural-vocative":"ghimparițelor"}},{"word":"ghimpat","pos":"adj","definitions":["spiked"],"forms":{"feminine-singular":"ghimpată","masculine-plural":"ghimpați","feminine-neuter-plural":"ghimpate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghimpat","error-unrecognized-form-feminine-indefinite-singular":"ghimpată","error-unrecognized-form-indefinite-masculine-plural":"ghimpați","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghimpate","definite-error-unrecognized-form-masculine-neuter-singular":"ghimpatul","definite-error-unrecognized-form-feminine-singular":"ghimpata","definite-error-unrecognized-form-masculine-plural":"ghimpații","definite-error-unrecognized-form-feminine-neuter-plural":"ghimpatele"}},{"word":"Ghimpați","pos":"name","definitions":["a locality in Răcari, Dâmbovița County, Romania","a commune of Giurgiu County, Romania","a village in Ghimpați, Giurgiu County, Romania","a village in Fărcașele, Olt County, Romania"],"gender":"m"},{"word":"Ghimpe","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghimpe"}},{"word":"ghimpe","pos":"noun","definitions":["thorn","needle (of pine tree)","eyesore"],"pronunciation":"/ˈɡimpe/","forms":{"plural":"ghimpi","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"ghimpe","accusative-definite-nominative-singular":"ghimpele","accusative-indefinite-nominative-plural":"ghimpi","accusative-definite-nominative-plural":"ghimpii","dative-genitive-indefinite-singular":"ghimpe","dative-definite-genitive-singular":"ghimpelui","dative-genitive-indefinite-plural":"ghimpi","dative-definite-genitive-plural":"ghimpilor","singular-vocative":"ghimpe","plural-vocative":"ghimpilor","alternative":"ghimp"}},{"word":"Ghimpețeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghimpețeanu"}},{"word":"Ghimpețeni","pos":"name","definitions":["a commune of Olt County, Romania","a village in Ghimpețeni, Olt County, Romania"],"gender":"m"},{"word":"Ghimpețenii Noi","pos":"name","definitions":["a village in Ghimpețeni, Olt County, Romania"],"gender":"m"},{"word":"ghimpos","pos":"adj","definitions":["spiny"],"forms":{"feminine-singular":"ghimpoasă","masculine-plural":"ghimpoși","feminine-neuter-plural":"ghimpoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghimpos","error-unrecognized-form-feminine-indefinite-singular":"ghimpoasă","error-unrecognized-form-indefinite-masculine-plural":"ghimpoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghimpoase","definite-error-unrecognized-form-masculine-neuter-singular":"ghimposul","definite-error-unrecognized-form-feminine-singular":"ghimpoasa","definite-error-unrecognized-form-masculine-plural":"ghimpoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ghimpoasele"}},{"word":"ghimpuruș","pos":"noun","definitions":["diminutive of ghimpe"],"forms":{"plural":"ghimpuruși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghimpuruș","accusative-definite-nominative-singular":"ghimpurușul","accusative-indefinite-nominative-plural":"ghimpuruși","accusative-definite-nominative-plural":"ghimpurușii","dative-genitive-indefinite-singular":"ghimpuruș","dative-definite-genitive-singular":"ghimpurușului","dative-genitive-indefinite-plural":"ghimpuruși","dative-definite-genitive-plural":"ghimpurușilor","singular-vocative":"ghimpurușule","plural-vocative":"ghimpurușilor"}},{"word":"ghină","pos":"noun","definitions":["bad luck"],"forms":{"plural":"ghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghină","accusative-definite-nominative-singular":"ghina","accusative-indefinite-nominative-plural":"ghine","accusative-definite-nominative-plural":"ghinele","dative-genitive-indefinite-singular":"ghine","dative-definite-genitive-singular":"ghinei","dative-genitive-indefinite-plural":"ghine","dative-definite-genitive-plural":"ghinelor","singular-vocative":"ghină","plural-vocative":"ghinelor"}},{"word":"ghinărar","pos":"noun","definitions":["alternative form of general"],"forms":{"plural":"ghinărari"}},{"word":"ghincar","pos":"noun","definitions":["thistle"],"forms":{"plural":"ghincari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghincar","accusative-definite-nominative-singular":"ghincarul","accusative-indefinite-nominative-plural":"ghincari","accusative-definite-nominative-plural":"ghincarii","dative-genitive-indefinite-singular":"ghincar","dative-definite-genitive-singular":"ghincarului","dative-genitive-indefinite-plural":"ghincari","dative-definite-genitive-plural":"ghincarilor","singular-vocative":"ghincarule","plural-vocative":"ghincarilor"}},{"word":"Ghinda","pos":"name","definitions":["a locality in Bistrița, Bistrița-Năsăud County, Romania"],"gender":"f"},{"word":"Ghindă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghindă"}},{"word":"ghindă","pos":"noun","definitions":["acorn","clubs"],"pronunciation":"/ˈɡin.də/","forms":{"plural":"ghinde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghindă","accusative-definite-nominative-singular":"ghinda","accusative-indefinite-nominative-plural":"ghinde","accusative-definite-nominative-plural":"ghindele","dative-genitive-indefinite-singular":"ghinde","dative-definite-genitive-singular":"ghindei","dative-genitive-indefinite-plural":"ghinde","dative-definite-genitive-plural":"ghindelor","singular-vocative":"ghindă","plural-vocative":"ghindelor","alternative-archaic-regional":"ghinde"}},{"word":"Ghindăoani","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Ghindăoani, Neamț County, Romania"],"gender":"m"},{"word":"Ghindar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ghindar"}},{"word":"ghindar","pos":"noun","definitions":["oak tree"],"forms":{"plural":"ghindari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghindar","accusative-definite-nominative-singular":"ghindarul","accusative-indefinite-nominative-plural":"ghindari","accusative-definite-nominative-plural":"ghindarii","dative-genitive-indefinite-singular":"ghindar","dative-definite-genitive-singular":"ghindarului","dative-genitive-indefinite-plural":"ghindari","dative-definite-genitive-plural":"ghindarilor","singular-vocative":"ghindarule","plural-vocative":"ghindarilor"}},{"word":"Ghindărești","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Ghindărești, Constanța County, Romania"],"gender":"m"},{"word":"Ghindari","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Ghindari, Mureș County, Romania","a village in Laloșu, Vâlcea County, Romania"],"gender":"m"},{"word":"ghindari","pos":"noun","definitions":["plural of ghindar"]},{"word":"Ghindaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Ghindaru"}},{"word":"Ghindeni","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Ghindeni, Dolj County, Romania"],"gender":"m"},{"word":"Ghindescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghindescu"}},{"word":"Ghindești","pos":"name","definitions":["a town in Florești Raion, Moldova","a village in Ghindești, Florești Raion, Moldova","a commune of Florești Raion, Moldova"],"gender":"m"},{"word":"ghindișor","pos":"noun","definitions":["diminutive of ghindă"],"forms":{"plural":"ghindișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghindișor","accusative-definite-nominative-singular":"ghindișorul","accusative-indefinite-nominative-plural":"ghindișori","accusative-definite-nominative-plural":"ghindișorii","dative-genitive-indefinite-singular":"ghindișor","dative-definite-genitive-singular":"ghindișorului","dative-genitive-indefinite-plural":"ghindișori","dative-definite-genitive-plural":"ghindișorilor","singular-vocative":"ghindișorule","plural-vocative":"ghindișorilor"}},{"word":"ghindoc","pos":"noun","definitions":["diminutive of ghindă"],"forms":{"plural":"ghindoci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghindoc","accusative-definite-nominative-singular":"ghindocul","accusative-indefinite-nominative-plural":"ghindoci","accusative-definite-nominative-plural":"ghindocii","dative-genitive-indefinite-singular":"ghindoc","dative-definite-genitive-singular":"ghindocului","dative-genitive-indefinite-plural":"ghindoci","dative-definite-genitive-plural":"ghindocilor","singular-vocative":"ghindocule","plural-vocative":"ghindocilor"}},{"word":"ghindură","pos":"noun","definitions":["a small swelling (of tissue), ganglion","tonsil"],"forms":{"plural":"ghinduri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghindură","accusative-definite-nominative-singular":"ghindura","accusative-indefinite-nominative-plural":"ghinduri","accusative-definite-nominative-plural":"ghindurile","dative-genitive-indefinite-singular":"ghinduri","dative-definite-genitive-singular":"ghindurii","dative-genitive-indefinite-plural":"ghinduri","dative-definite-genitive-plural":"ghindurilor","singular-vocative":"ghindură","plural-vocative":"ghindurilor"}},{"word":"ghindurare","pos":"noun","definitions":["angina"],"forms":{"plural":"ghindurarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghindurare","accusative-definite-nominative-singular":"ghindurarea","accusative-indefinite-nominative-plural":"ghindurarări","accusative-definite-nominative-plural":"ghindurarările","dative-genitive-indefinite-singular":"ghindurarări","dative-definite-genitive-singular":"ghindurarării","dative-genitive-indefinite-plural":"ghindurarări","dative-definite-genitive-plural":"ghindurarărilor","singular-vocative":"ghindurare","plural-vocative":"ghindurarărilor"}},{"word":"ghindurea","pos":"noun","definitions":["diminutive of ghindură"],"forms":{"plural":"ghindurele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"ghindurea","accusative-definite-nominative-singular":"ghindureaua","accusative-indefinite-nominative-plural":"ghindurele","accusative-definite-nominative-plural":"ghindurelele","dative-genitive-indefinite-singular":"ghindurele","dative-definite-genitive-singular":"ghindurelei","dative-genitive-indefinite-plural":"ghindurele","dative-definite-genitive-plural":"ghindurelelor","singular-vocative":"ghindurea","plural-vocative":"ghindurelelor"}},{"word":"ghindurică","pos":"noun","definitions":["diminutive of ghindură"],"forms":{"plural":"ghindurici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghindurică","accusative-definite-nominative-singular":"ghindurica","accusative-indefinite-nominative-plural":"ghindurici","accusative-definite-nominative-plural":"ghinduricile","dative-genitive-indefinite-singular":"ghindurici","dative-definite-genitive-singular":"ghinduricii","dative-genitive-indefinite-plural":"ghindurici","dative-definite-genitive-plural":"ghinduricilor","singular-vocative":"ghindurică","plural-vocative":"ghinduricilor"}},{"word":"ghinduros","pos":"adj","definitions":["swollen, full of ganglions"],"pronunciation":"/ɡin.duˈros/","forms":{"feminine-singular":"ghinduroasă","masculine-plural":"ghinduroși","feminine-neuter-plural":"ghinduroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghinduros","error-unrecognized-form-feminine-indefinite-singular":"ghinduroasă","error-unrecognized-form-indefinite-masculine-plural":"ghinduroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghinduroase","definite-error-unrecognized-form-masculine-neuter-singular":"ghindurosul","definite-error-unrecognized-form-feminine-singular":"ghinduroasa","definite-error-unrecognized-form-masculine-plural":"ghinduroșii","definite-error-unrecognized-form-feminine-neuter-plural":"ghinduroasele"}},{"word":"Ghinea","pos":"name","definitions":["a surname from Bulgarian"],"gender":"m","forms":{"dative-genitive":"lui Ghinea"}},{"word":"Ghinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghinescu"}},{"word":"Ghinești","pos":"name","definitions":["a village in Sălcioara, Dâmbovița County, Romania","a village in Neaua, Mureș County, Romania"],"gender":"m"},{"word":"Ghinghești","pos":"name","definitions":["a village in Drăgușeni, Galați County, Romania"],"gender":"m"},{"word":"ghinion","pos":"noun","definitions":["bad luck","jinx"],"forms":{"plural":"ghinoane"}},{"word":"ghinionist","pos":"noun","definitions":["unlucky person"],"forms":{"plural":"ghinioniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghinionist","accusative-definite-nominative-singular":"ghinionistul","accusative-indefinite-nominative-plural":"ghinionisti","accusative-definite-nominative-plural":"ghinionistii","dative-genitive-indefinite-singular":"ghinionist","dative-definite-genitive-singular":"ghinionistului","dative-genitive-indefinite-plural":"ghinionisti","dative-definite-genitive-plural":"ghinionistilor","singular-vocative":"ghinionistule","plural-vocative":"ghinionistilor"}},{"word":"ghinionistă","pos":"noun","definitions":["female equivalent of ghinionist"],"forms":{"plural":"ghinioniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghinionistă","accusative-definite-nominative-singular":"ghinionista","accusative-indefinite-nominative-plural":"ghinioniste","accusative-definite-nominative-plural":"ghinionistele","dative-genitive-indefinite-singular":"ghinioniste","dative-definite-genitive-singular":"ghinionistei","dative-genitive-indefinite-plural":"ghinioniste","dative-definite-genitive-plural":"ghinionistelor","singular-vocative":"ghinionistă","plural-vocative":"ghinionistelor"}},{"word":"Ghiniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiniță"}},{"word":"Ghinoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghinoaia"}},{"word":"Ghinoaica","pos":"name","definitions":["a village in Vadu Săpat, Prahova County, Romania"],"gender":"f"},{"word":"Ghinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghinoiu"}},{"word":"ghințiană","pos":"noun","definitions":["alternative form of gențiană"],"forms":{"plural":"ghințiane"}},{"word":"ghintuire","pos":"noun","definitions":["nudging"],"forms":{"plural":"ghintuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghintuire","accusative-definite-nominative-singular":"ghintuirea","accusative-indefinite-nominative-plural":"ghintuiri","accusative-definite-nominative-plural":"ghintuirile","dative-genitive-indefinite-singular":"ghintuiri","dative-definite-genitive-singular":"ghintuirii","dative-genitive-indefinite-plural":"ghintuiri","dative-definite-genitive-plural":"ghintuirilor","singular-vocative":"ghintuire","plural-vocative":"ghintuirilor"}},{"word":"ghintuleț","pos":"noun","definitions":["diminutive of ghint"],"forms":{"plural":"ghintulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghintuleț","accusative-definite-nominative-singular":"ghintulețul","accusative-indefinite-nominative-plural":"ghintulețe","accusative-definite-nominative-plural":"ghintulețele","dative-genitive-indefinite-singular":"ghintuleț","dative-definite-genitive-singular":"ghintulețului","dative-genitive-indefinite-plural":"ghintulețe","dative-definite-genitive-plural":"ghintulețelor","singular-vocative":"ghintulețule","plural-vocative":"ghintulețelor"}},{"word":"ghințură","pos":"noun","definitions":["gentian"],"forms":{"plural":"ghințure","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghințură","accusative-definite-nominative-singular":"ghințura","accusative-indefinite-nominative-plural":"ghințure","accusative-definite-nominative-plural":"ghințurele","dative-genitive-indefinite-singular":"ghințure","dative-definite-genitive-singular":"ghințurei","dative-genitive-indefinite-plural":"ghințure","dative-definite-genitive-plural":"ghințurelor","singular-vocative":"ghințură","plural-vocative":"ghințurelor"}},{"word":"ghințurea","pos":"noun","definitions":["diminutive of ghințură"],"forms":{"plural":"ghințurele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"ghințurea","accusative-definite-nominative-singular":"ghințureaua","accusative-indefinite-nominative-plural":"ghințurele","accusative-definite-nominative-plural":"ghințurelele","dative-genitive-indefinite-singular":"ghințurele","dative-definite-genitive-singular":"ghințurelei","dative-genitive-indefinite-plural":"ghințurele","dative-definite-genitive-plural":"ghințurelelor","singular-vocative":"ghințurea","plural-vocative":"ghințurelelor"}},{"word":"ghioagă","pos":"noun","definitions":["club, cudgel, bludgeon, cosh"],"forms":{"plural":"ghioage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghioagă","accusative-definite-nominative-singular":"ghioaga","accusative-indefinite-nominative-plural":"ghioage","accusative-definite-nominative-plural":"ghioagele","dative-genitive-indefinite-singular":"ghioage","dative-definite-genitive-singular":"ghioagei","dative-genitive-indefinite-plural":"ghioage","dative-definite-genitive-plural":"ghioagelor","singular-vocative":"ghioagă","plural-vocative":"ghioagelor"}},{"word":"ghioambă","pos":"noun","definitions":["arm"],"forms":{"plural":"ghioambe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghioambă","accusative-definite-nominative-singular":"ghioamba","accusative-indefinite-nominative-plural":"ghioambe","accusative-definite-nominative-plural":"ghioambele","dative-genitive-indefinite-singular":"ghioambe","dative-definite-genitive-singular":"ghioambei","dative-genitive-indefinite-plural":"ghioambe","dative-definite-genitive-plural":"ghioambelor","singular-vocative":"ghioambă","plural-vocative":"ghioambelor"}},{"word":"ghiob","pos":"noun","definitions":["barrel used for storing cheese"],"forms":{"plural":"ghioburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiob","accusative-definite-nominative-singular":"ghiobul","accusative-indefinite-nominative-plural":"ghioburi","accusative-definite-nominative-plural":"ghioburile","dative-genitive-indefinite-singular":"ghiob","dative-definite-genitive-singular":"ghiobului","dative-genitive-indefinite-plural":"ghioburi","dative-definite-genitive-plural":"ghioburilor","singular-vocative":"ghiobule","plural-vocative":"ghioburilor"}},{"word":"Ghiobești","pos":"name","definitions":["a village in Stoilești, Vâlcea County, Romania"],"gender":"m"},{"word":"ghiobuleț","pos":"noun","definitions":["diminutive of ghiob"],"forms":{"plural":"ghiobulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiobuleț","accusative-definite-nominative-singular":"ghiobulețul","accusative-indefinite-nominative-plural":"ghiobulețe","accusative-definite-nominative-plural":"ghiobulețele","dative-genitive-indefinite-singular":"ghiobuleț","dative-definite-genitive-singular":"ghiobulețului","dative-genitive-indefinite-plural":"ghiobulețe","dative-definite-genitive-plural":"ghiobulețelor","singular-vocative":"ghiobulețule","plural-vocative":"ghiobulețelor"}},{"word":"ghioc","pos":"noun","definitions":["cowrie (marine mollusc), or its shell"],"forms":{"plural":"ghiocuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghioc","accusative-definite-nominative-singular":"ghiocul","accusative-indefinite-nominative-plural":"ghiocuri","accusative-definite-nominative-plural":"ghiocurile","dative-genitive-indefinite-singular":"ghioc","dative-definite-genitive-singular":"ghiocului","dative-genitive-indefinite-plural":"ghiocuri","dative-definite-genitive-plural":"ghiocurilor","singular-vocative":"ghiocule","plural-vocative":"ghiocurilor","alternative":"ghioacă"}},{"word":"ghioc","pos":"noun","definitions":["cornflower (Centaurea cyanus)"],"forms":{"plural":"ghioci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghioc","accusative-definite-nominative-singular":"ghiocul","accusative-indefinite-nominative-plural":"ghioci","accusative-definite-nominative-plural":"ghiocii","dative-genitive-indefinite-singular":"ghioc","dative-definite-genitive-singular":"ghiocului","dative-genitive-indefinite-plural":"ghioci","dative-definite-genitive-plural":"ghiocilor","singular-vocative":"ghiocule","plural-vocative":"ghiocilor","alternative":"ghioacă"}},{"word":"Ghiocari","pos":"name","definitions":["a village in Chiliile, Buzău County, Romania"],"gender":"m"},{"word":"Ghiocel","pos":"name","definitions":["a village in Podenii Noi, Prahova County, Romania"],"gender":"m"},{"word":"ghiocel","pos":"noun","definitions":["snowdrop"],"forms":{"plural":"ghiocei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiocel","accusative-definite-nominative-singular":"ghiocelul","accusative-indefinite-nominative-plural":"ghiocei","accusative-definite-nominative-plural":"ghioceii","dative-genitive-indefinite-singular":"ghiocel","dative-definite-genitive-singular":"ghiocelului","dative-genitive-indefinite-plural":"ghiocei","dative-definite-genitive-plural":"ghioceilor","singular-vocative":"ghiocelule","plural-vocative":"ghioceilor"}},{"word":"ghioci","pos":"noun","definitions":["plural of ghioc"]},{"word":"ghiocuri","pos":"noun","definitions":["plural of ghioc"]},{"word":"ghiojgorea","pos":"adv","definitions":["seeing with one's own eyes"]},{"word":"ghiol","pos":"noun","definitions":["lake"],"forms":{"plural":"ghioluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiol","accusative-definite-nominative-singular":"ghiolul","accusative-indefinite-nominative-plural":"ghioluri","accusative-definite-nominative-plural":"ghiolurile","dative-genitive-indefinite-singular":"ghiol","dative-definite-genitive-singular":"ghiolului","dative-genitive-indefinite-plural":"ghioluri","dative-definite-genitive-plural":"ghiolurilor","singular-vocative":"ghiolule","plural-vocative":"ghiolurilor"}},{"word":"ghiold","pos":"noun","definitions":["nudge"],"forms":{"plural":"ghiolduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiold","accusative-definite-nominative-singular":"ghioldul","accusative-indefinite-nominative-plural":"ghiolduri","accusative-definite-nominative-plural":"ghioldurile","dative-genitive-indefinite-singular":"ghiold","dative-definite-genitive-singular":"ghioldului","dative-genitive-indefinite-plural":"ghiolduri","dative-definite-genitive-plural":"ghioldurilor","singular-vocative":"ghioldule","plural-vocative":"ghioldurilor"}},{"word":"ghioldaș","pos":"noun","definitions":["comrade"],"forms":{"plural":"ghioldași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghioldaș","accusative-definite-nominative-singular":"ghioldașul","accusative-indefinite-nominative-plural":"ghioldași","accusative-definite-nominative-plural":"ghioldașii","dative-genitive-indefinite-singular":"ghioldaș","dative-definite-genitive-singular":"ghioldașului","dative-genitive-indefinite-plural":"ghioldași","dative-definite-genitive-plural":"ghioldașilor","singular-vocative":"ghioldașule","plural-vocative":"ghioldașilor"}},{"word":"Ghioldum","pos":"name","definitions":["a village in Cocorăștii Colț, Prahova County, Romania"],"gender":"m"},{"word":"ghioldum","pos":"noun","definitions":["nudge"],"forms":{"plural":"ghioldumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghioldum","accusative-definite-nominative-singular":"ghioldumul","accusative-indefinite-nominative-plural":"ghioldumuri","accusative-definite-nominative-plural":"ghioldumurile","dative-genitive-indefinite-singular":"ghioldum","dative-definite-genitive-singular":"ghioldumului","dative-genitive-indefinite-plural":"ghioldumuri","dative-definite-genitive-plural":"ghioldumurilor","singular-vocative":"ghioldumule","plural-vocative":"ghioldumurilor"}},{"word":"Ghiolpunar","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Șipotele."],"gender":"m"},{"word":"ghiomotoc","pos":"noun","definitions":["obsolete form of ghemotoc"],"forms":{"plural":"ghiomotoace","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiomotoc","accusative-definite-nominative-singular":"ghiomotocul","accusative-indefinite-nominative-plural":"ghiomotoace","accusative-definite-nominative-plural":"ghiomotoacele","dative-genitive-indefinite-singular":"ghiomotoc","dative-definite-genitive-singular":"ghiomotocului","dative-genitive-indefinite-plural":"ghiomotoace","dative-definite-genitive-plural":"ghiomotoacelor","singular-vocative":"ghiomotocule","plural-vocative":"ghiomotoacelor"}},{"word":"Ghionea","pos":"name","definitions":["a village in Ulmi, Giurgiu County, Romania"],"gender":"f"},{"word":"Ghionoaia","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania"],"gender":"f"},{"word":"ghionoaie","pos":"noun","definitions":["woodpecker","a shrew, scold"],"pronunciation":"/ɡi.oˈno̯a.je/","forms":{"plural":"ghionoi","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ghionoaie","accusative-definite-nominative-singular":"ghionoaiea","accusative-indefinite-nominative-plural":"ghionoi","accusative-definite-nominative-plural":"ghionoile","dative-genitive-indefinite-singular":"ghionoi","dative-definite-genitive-singular":"ghionoii","dative-genitive-indefinite-plural":"ghionoi","dative-definite-genitive-plural":"ghionoilor","singular-vocative":"-","plural-vocative":"-","alternative":"gheonoaie"}},{"word":"ghionoaie sură","pos":"noun","definitions":["grey-headed woodpecker (Picus canus)"],"forms":{"plural":"ghionoaie sure"}},{"word":"ghionoaie verde","pos":"noun","definitions":["green woodpecker (Picus viridis)"],"forms":{"plural":"ghionoaie verzi"}},{"word":"ghionoi","pos":"noun","definitions":["plural of ghionoaie"]},{"word":"ghiont","pos":"noun","definitions":["nudge"],"pronunciation":"/ɡjont/","forms":{"plural":"ghionturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiont","accusative-definite-nominative-singular":"ghiontul","accusative-indefinite-nominative-plural":"ghionturi","accusative-definite-nominative-plural":"ghionturile","dative-genitive-indefinite-singular":"ghiont","dative-definite-genitive-singular":"ghiontului","dative-genitive-indefinite-plural":"ghionturi","dative-definite-genitive-plural":"ghionturilor","singular-vocative":"ghiontule","plural-vocative":"ghionturilor"}},{"word":"ghionti","pos":"verb","definitions":["to shove, to push"],"forms":{"canonical":"a ghionti 4th conjugation","present-singular-third-person":"ghiontește","participle-past":"ghiontit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ghionti","gerund":"ghiontind","first-person-indicative-present-singular":"ghiontesc","indicative-present-second-person-singular":"ghiontești","indicative-present-singular-third-person":"ghiontește","first-person-indicative-plural-present":"ghiontim","indicative-plural-present-second-person":"ghiontiți","indicative-plural-present-third-person":"ghiontesc","first-person-imperfect-indicative-singular":"ghionteam","imperfect-indicative-second-person-singular":"ghionteai","imperfect-indicative-singular-third-person":"ghiontea","first-person-imperfect-indicative-plural":"ghionteam","imperfect-indicative-plural-second-person":"ghionteați","imperfect-indicative-plural-third-person":"ghionteau","first-person-indicative-perfect-singular":"ghiontii","indicative-perfect-second-person-singular":"ghiontiși","indicative-perfect-singular-third-person":"ghionti","first-person-indicative-perfect-plural":"ghiontirăm","indicative-perfect-plural-second-person":"ghiontirăți","indicative-perfect-plural-third-person":"ghiontiră","first-person-indicative-pluperfect-singular":"ghiontisem","indicative-pluperfect-second-person-singular":"ghiontiseși","indicative-pluperfect-singular-third-person":"ghiontise","first-person-indicative-pluperfect-plural":"ghiontiserăm","indicative-pluperfect-plural-second-person":"ghiontiserăți","indicative-pluperfect-plural-third-person":"ghiontiseră","first-person-present-singular-subjunctive":"să ghiontesc","present-second-person-singular-subjunctive":"să ghiontești","present-singular-subjunctive-third-person":"să ghiontească","first-person-plural-present-subjunctive":"să ghiontim","plural-present-second-person-subjunctive":"să ghiontiți","plural-present-subjunctive-third-person":"să ghiontească","imperative-second-person-singular":"ghiontește","imperative-plural-second-person":"ghiontiți","imperative-negative-second-person-singular":"nu ghionti","imperative-negative-plural-second-person":"nu ghiontiți"}},{"word":"ghiontire","pos":"noun","definitions":["shove, push"],"forms":{"plural":"ghiontiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ghiontire","accusative-definite-nominative-singular":"ghiontirea","accusative-indefinite-nominative-plural":"ghiontiri","accusative-definite-nominative-plural":"ghiontirile","dative-genitive-indefinite-singular":"ghiontiri","dative-definite-genitive-singular":"ghiontirii","dative-genitive-indefinite-plural":"ghiontiri","dative-definite-genitive-plural":"ghiontirilor","singular-vocative":"ghiontire","plural-vocative":"ghiontirilor"}},{"word":"ghiontit","pos":"noun","definitions":["shoved, pushed"],"forms":{"plural":"ghiontituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiontit","accusative-definite-nominative-singular":"ghiontitul","accusative-indefinite-nominative-plural":"ghiontituri","accusative-definite-nominative-plural":"ghiontiturile","dative-genitive-indefinite-singular":"ghiontit","dative-definite-genitive-singular":"ghiontitului","dative-genitive-indefinite-plural":"ghiontituri","dative-definite-genitive-plural":"ghiontiturilor","singular-vocative":"ghiontitule","plural-vocative":"ghiontiturilor"}},{"word":"ghiontit","pos":"verb","definitions":["past participle of ghionti"],"forms":{"participle-past":"of ghionti"}},{"word":"ghiontui","pos":"verb","definitions":["to nudge, to shove"],"forms":{"canonical":"a ghiontui 4th conjugation","present-singular-third-person":"ghiontuește","participle-past":"ghiontuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a ghiontui","gerund":"ghiontuind","first-person-indicative-present-singular":"ghiontuiesc","indicative-present-second-person-singular":"ghiontuiești","indicative-present-singular-third-person":"ghiontuiește","first-person-indicative-plural-present":"ghiontuim","indicative-plural-present-second-person":"ghiontuiți","indicative-plural-present-third-person":"ghiontuiesc","first-person-imperfect-indicative-singular":"ghiontuiam","imperfect-indicative-second-person-singular":"ghiontuiai","imperfect-indicative-singular-third-person":"ghiontuia","first-person-imperfect-indicative-plural":"ghiontuiam","imperfect-indicative-plural-second-person":"ghiontuiați","imperfect-indicative-plural-third-person":"ghiontuiau","first-person-indicative-perfect-singular":"ghiontuii","indicative-perfect-second-person-singular":"ghiontuiși","indicative-perfect-singular-third-person":"ghiontui","first-person-indicative-perfect-plural":"ghiontuirăm","indicative-perfect-plural-second-person":"ghiontuirăți","indicative-perfect-plural-third-person":"ghiontuiră","first-person-indicative-pluperfect-singular":"ghiontuisem","indicative-pluperfect-second-person-singular":"ghiontuiseși","indicative-pluperfect-singular-third-person":"ghiontuise","first-person-indicative-pluperfect-plural":"ghiontuiserăm","indicative-pluperfect-plural-second-person":"ghiontuiserăți","indicative-pluperfect-plural-third-person":"ghiontuiseră","first-person-present-singular-subjunctive":"să ghiontuiesc","present-second-person-singular-subjunctive":"să ghiontuiești","present-singular-subjunctive-third-person":"să ghiontuiască","first-person-plural-present-subjunctive":"să ghiontuim","plural-present-second-person-subjunctive":"să ghiontuiți","plural-present-subjunctive-third-person":"să ghiontuiască","imperative-second-person-singular":"ghiontuiește","imperative-plural-second-person":"ghiontuiți","imperative-negative-second-person-singular":"nu ghiontui","imperative-negative-plural-second-person":"nu ghiontuiți"}},{"word":"ghiontuială","pos":"noun","definitions":["a fight, scuffle"],"forms":{"plural":"ghiontuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiontuială","accusative-definite-nominative-singular":"ghiontuiala","accusative-indefinite-nominative-plural":"ghiontuiele","accusative-definite-nominative-plural":"ghiontuielele","dative-genitive-indefinite-singular":"ghiontuiele","dative-definite-genitive-singular":"ghiontuielei","dative-genitive-indefinite-plural":"ghiontuiele","dative-definite-genitive-plural":"ghiontuielelor","singular-vocative":"ghiontuială","plural-vocative":"ghiontuielelor"}},{"word":"Ghiorac","pos":"name","definitions":["a village in Ciumeghiu, Bihor County, Romania"],"gender":"m"},{"word":"ghiorăi","pos":"verb","definitions":["to alternative form of chiorăi"],"forms":{"canonical":"a ghiorăi 4th conjugation","present-singular-third-person":"ghiorăie","participle-past":"ghiorăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ghiorăi","gerund":"ghiorăind","first-person-indicative-present-singular":"ghiorăi","indicative-present-second-person-singular":"ghiorăi","indicative-present-singular-third-person":"ghiorăie","first-person-indicative-plural-present":"ghiorăim","indicative-plural-present-second-person":"ghiorăiți","indicative-plural-present-third-person":"ghiorăie","first-person-imperfect-indicative-singular":"ghiorăiam","imperfect-indicative-second-person-singular":"ghiorăiai","imperfect-indicative-singular-third-person":"ghiorăia","first-person-imperfect-indicative-plural":"ghiorăiam","imperfect-indicative-plural-second-person":"ghiorăiați","imperfect-indicative-plural-third-person":"ghiorăiau","first-person-indicative-perfect-singular":"ghiorăii","indicative-perfect-second-person-singular":"ghiorăiși","indicative-perfect-singular-third-person":"ghiorăi","first-person-indicative-perfect-plural":"ghiorăirăm","indicative-perfect-plural-second-person":"ghiorăirăți","indicative-perfect-plural-third-person":"ghiorăiră","first-person-indicative-pluperfect-singular":"ghiorăisem","indicative-pluperfect-second-person-singular":"ghiorăiseși","indicative-pluperfect-singular-third-person":"ghiorăise","first-person-indicative-pluperfect-plural":"ghiorăiserăm","indicative-pluperfect-plural-second-person":"ghiorăiserăți","indicative-pluperfect-plural-third-person":"ghiorăiseră","first-person-present-singular-subjunctive":"să ghiorăi","present-second-person-singular-subjunctive":"să ghiorăi","present-singular-subjunctive-third-person":"să ghiorăie","first-person-plural-present-subjunctive":"să ghiorăim","plural-present-second-person-subjunctive":"să ghiorăiți","plural-present-subjunctive-third-person":"să ghiorăie","imperative-second-person-singular":"ghiorăie","imperative-plural-second-person":"ghiorăiți","imperative-negative-second-person-singular":"nu ghiorăi","imperative-negative-plural-second-person":"nu ghiorăiți"}},{"word":"ghiorăială","pos":"noun","definitions":["alternative form of chiorăială"],"forms":{"plural":"ghiorăieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiorăială","accusative-definite-nominative-singular":"ghiorăiala","accusative-indefinite-nominative-plural":"ghiorăiele","accusative-definite-nominative-plural":"ghiorăielele","dative-genitive-indefinite-singular":"ghiorăiele","dative-definite-genitive-singular":"ghiorăielei","dative-genitive-indefinite-plural":"ghiorăiele","dative-definite-genitive-plural":"ghiorăielelor","singular-vocative":"ghiorăială","plural-vocative":"ghiorăielelor"}},{"word":"ghiorăit","pos":"noun","definitions":["alternative form of chiorăit"],"forms":{"plural":"ghiorăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiorăit","accusative-definite-nominative-singular":"ghiorăitul","accusative-indefinite-nominative-plural":"ghiorăituri","accusative-definite-nominative-plural":"ghiorăiturile","dative-genitive-indefinite-singular":"ghiorăit","dative-definite-genitive-singular":"ghiorăitului","dative-genitive-indefinite-plural":"ghiorăituri","dative-definite-genitive-plural":"ghiorăiturilor","singular-vocative":"ghiorăitule","plural-vocative":"ghiorăiturilor"}},{"word":"ghiorăitură","pos":"noun","definitions":["alternative form of chiorăitură"],"forms":{"plural":"ghiorăituri"}},{"word":"ghiordan","pos":"noun","definitions":["alternative form of gherdan"],"forms":{"plural":"ghiordane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiordan","accusative-definite-nominative-singular":"ghiordanul","accusative-indefinite-nominative-plural":"ghiordane","accusative-definite-nominative-plural":"ghiordanele","dative-genitive-indefinite-singular":"ghiordan","dative-definite-genitive-singular":"ghiordanului","dative-genitive-indefinite-plural":"ghiordane","dative-definite-genitive-plural":"ghiordanelor","singular-vocative":"ghiordanule","plural-vocative":"ghiordanelor"}},{"word":"ghiordeică","pos":"noun","definitions":["diminutive of ghiordie"],"forms":{"plural":"ghiordeici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghiordeică","accusative-definite-nominative-singular":"ghiordeica","accusative-indefinite-nominative-plural":"ghiordeici","accusative-definite-nominative-plural":"ghiordeicile","dative-genitive-indefinite-singular":"ghiordeici","dative-definite-genitive-singular":"ghiordeicii","dative-genitive-indefinite-plural":"ghiordeici","dative-definite-genitive-plural":"ghiordeicilor","singular-vocative":"ghiordeică","plural-vocative":"ghiordeicilor"}},{"word":"ghiordum","pos":"noun","definitions":["a card game"],"forms":{"plural":"ghiordumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiordum","accusative-definite-nominative-singular":"ghiordumul","accusative-indefinite-nominative-plural":"ghiordumuri","accusative-definite-nominative-plural":"ghiordumurile","dative-genitive-indefinite-singular":"ghiordum","dative-definite-genitive-singular":"ghiordumului","dative-genitive-indefinite-plural":"ghiordumuri","dative-definite-genitive-plural":"ghiordumurilor","singular-vocative":"ghiordumule","plural-vocative":"ghiordumurilor"}},{"word":"Ghiorghică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiorghică"}},{"word":"Ghiorghioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghiorghioiu"}},{"word":"Ghiorghițaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiorghițaș"}},{"word":"ghiorlan","pos":"noun","definitions":["churl, boor"],"forms":{"plural":"ghiorlani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiorlan","accusative-definite-nominative-singular":"ghiorlanul","accusative-indefinite-nominative-plural":"ghiorlani","accusative-definite-nominative-plural":"ghiorlanii","dative-genitive-indefinite-singular":"ghiorlan","dative-definite-genitive-singular":"ghiorlanului","dative-genitive-indefinite-plural":"ghiorlani","dative-definite-genitive-plural":"ghiorlanilor","singular-vocative":"ghiorlanule","plural-vocative":"ghiorlanilor"}},{"word":"Ghioroc","pos":"name","definitions":["a commune of Arad County, Romania","a village in Ghioroc, Arad County, Romania"],"gender":"m"},{"word":"Ghioroiu","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Ghioroiu, Vâlcea County, Romania"],"gender":"m"},{"word":"ghiorș","pos":"noun","definitions":["an express train"],"forms":{"plural":"ghiorși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiorș","accusative-definite-nominative-singular":"ghiorșul","accusative-indefinite-nominative-plural":"ghiorși","accusative-definite-nominative-plural":"ghiorșii","dative-genitive-indefinite-singular":"ghiorș","dative-definite-genitive-singular":"ghiorșului","dative-genitive-indefinite-plural":"ghiorși","dative-definite-genitive-plural":"ghiorșilor","singular-vocative":"ghiorșule","plural-vocative":"ghiorșilor"}},{"word":"ghiorț","pos":"intj","definitions":["grumble (sound made by a hungry stomach)"]},{"word":"ghiorțăi","pos":"verb","definitions":["to grumble (sound made by a hungry stomach)"],"forms":{"canonical":"a ghiorțăi 4th conjugation","present-singular-third-person":"ghiorțăie","participle-past":"ghiorțăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a ghiorțăi","gerund":"ghiorțăind","first-person-indicative-present-singular":"ghiorțăi","indicative-present-second-person-singular":"ghiorțăi","indicative-present-singular-third-person":"ghiorțăie","first-person-indicative-plural-present":"ghiorțăim","indicative-plural-present-second-person":"ghiorțăiți","indicative-plural-present-third-person":"ghiorțăie","first-person-imperfect-indicative-singular":"ghiorțăiam","imperfect-indicative-second-person-singular":"ghiorțăiai","imperfect-indicative-singular-third-person":"ghiorțăia","first-person-imperfect-indicative-plural":"ghiorțăiam","imperfect-indicative-plural-second-person":"ghiorțăiați","imperfect-indicative-plural-third-person":"ghiorțăiau","first-person-indicative-perfect-singular":"ghiorțăii","indicative-perfect-second-person-singular":"ghiorțăiși","indicative-perfect-singular-third-person":"ghiorțăi","first-person-indicative-perfect-plural":"ghiorțăirăm","indicative-perfect-plural-second-person":"ghiorțăirăți","indicative-perfect-plural-third-person":"ghiorțăiră","first-person-indicative-pluperfect-singular":"ghiorțăisem","indicative-pluperfect-second-person-singular":"ghiorțăiseși","indicative-pluperfect-singular-third-person":"ghiorțăise","first-person-indicative-pluperfect-plural":"ghiorțăiserăm","indicative-pluperfect-plural-second-person":"ghiorțăiserăți","indicative-pluperfect-plural-third-person":"ghiorțăiseră","first-person-present-singular-subjunctive":"să ghiorțăi","present-second-person-singular-subjunctive":"să ghiorțăi","present-singular-subjunctive-third-person":"să ghiorțăie","first-person-plural-present-subjunctive":"să ghiorțăim","plural-present-second-person-subjunctive":"să ghiorțăiți","plural-present-subjunctive-third-person":"să ghiorțăie","imperative-second-person-singular":"ghiorțăie","imperative-plural-second-person":"ghiorțăiți","imperative-negative-second-person-singular":"nu ghiorțăi","imperative-negative-plural-second-person":"nu ghiorțăiți"}},{"word":"ghioșă","pos":"noun","definitions":["guilloche"],"forms":{"plural":"ghioșe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghioșă","accusative-definite-nominative-singular":"ghioșa","accusative-indefinite-nominative-plural":"ghioșe","accusative-definite-nominative-plural":"ghioșele","dative-genitive-indefinite-singular":"ghioșe","dative-definite-genitive-singular":"ghioșei","dative-genitive-indefinite-plural":"ghioșe","dative-definite-genitive-plural":"ghioșelor","singular-vocative":"ghioșă","plural-vocative":"ghioșelor"}},{"word":"Ghioșani","pos":"name","definitions":["a village in Morunglav, Olt County, Romania"],"gender":"m"},{"word":"Ghioșești","pos":"name","definitions":["a locality in Comarnic, Prahova County, Romania"],"gender":"m"},{"word":"ghioslomea","pos":"noun","definitions":["a type of fried cake"],"forms":{"plural":"ghioslomele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"ghioslomea","accusative-definite-nominative-singular":"ghioslomeaua","accusative-indefinite-nominative-plural":"ghioslomele","accusative-definite-nominative-plural":"ghioslomelele","dative-genitive-indefinite-singular":"ghioslomele","dative-definite-genitive-singular":"ghioslomelei","dative-genitive-indefinite-plural":"ghioslomele","dative-definite-genitive-plural":"ghioslomelelor","singular-vocative":"ghioslomea","plural-vocative":"ghioslomelelor"}},{"word":"ghiot","pos":"adj","definitions":["frisky"],"forms":{"feminine-singular":"ghiotă","masculine-plural":"ghioți","feminine-neuter-plural":"ghiote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiot","error-unrecognized-form-feminine-indefinite-singular":"ghiotă","error-unrecognized-form-indefinite-masculine-plural":"ghioți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghiote","definite-error-unrecognized-form-masculine-neuter-singular":"ghiotul","definite-error-unrecognized-form-feminine-singular":"ghiota","definite-error-unrecognized-form-masculine-plural":"ghioții","definite-error-unrecognized-form-feminine-neuter-plural":"ghiotele"}},{"word":"ghiotură","pos":"noun","definitions":["a large quantity"],"forms":{"plural":"ghioture","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiotură","accusative-definite-nominative-singular":"ghiotura","accusative-indefinite-nominative-plural":"ghioture","accusative-definite-nominative-plural":"ghioturele","dative-genitive-indefinite-singular":"ghioture","dative-definite-genitive-singular":"ghioturei","dative-genitive-indefinite-plural":"ghioture","dative-definite-genitive-plural":"ghioturelor","singular-vocative":"ghiotură","plural-vocative":"ghioturelor"}},{"word":"ghiozdan","pos":"noun","definitions":["schoolbag"],"forms":{"plural":"ghiozdane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiozdan","accusative-definite-nominative-singular":"ghiozdanul","accusative-indefinite-nominative-plural":"ghiozdane","accusative-definite-nominative-plural":"ghiozdanele","dative-genitive-indefinite-singular":"ghiozdan","dative-definite-genitive-singular":"ghiozdanului","dative-genitive-indefinite-plural":"ghiozdane","dative-definite-genitive-plural":"ghiozdanelor","singular-vocative":"ghiozdanule","plural-vocative":"ghiozdanelor"}},{"word":"ghiozdănaș","pos":"noun","definitions":["diminutive of ghiozdan; small satchel"],"forms":{"plural":"ghiozdănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiozdănaș","accusative-definite-nominative-singular":"ghiozdănașul","accusative-indefinite-nominative-plural":"ghiozdănașe","accusative-definite-nominative-plural":"ghiozdănașele","dative-genitive-indefinite-singular":"ghiozdănaș","dative-definite-genitive-singular":"ghiozdănașului","dative-genitive-indefinite-plural":"ghiozdănașe","dative-definite-genitive-plural":"ghiozdănașelor","singular-vocative":"ghiozdănașule","plural-vocative":"ghiozdănașelor"}},{"word":"ghiozdănel","pos":"noun","definitions":["diminutive of ghiozdan; small satchel"],"forms":{"plural":"ghiozdănele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiozdănel","accusative-definite-nominative-singular":"ghiozdănelul","accusative-indefinite-nominative-plural":"ghiozdănele","accusative-definite-nominative-plural":"ghiozdănelele","dative-genitive-indefinite-singular":"ghiozdănel","dative-definite-genitive-singular":"ghiozdănelului","dative-genitive-indefinite-plural":"ghiozdănele","dative-definite-genitive-plural":"ghiozdănelelor","singular-vocative":"ghiozdănelule","plural-vocative":"ghiozdănelelor"}},{"word":"ghipcan","pos":"noun","definitions":["jade (horse)"],"forms":{"plural":"ghipcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghipcan","accusative-definite-nominative-singular":"ghipcanul","accusative-indefinite-nominative-plural":"ghipcani","accusative-definite-nominative-plural":"ghipcanii","dative-genitive-indefinite-singular":"ghipcan","dative-definite-genitive-singular":"ghipcanului","dative-genitive-indefinite-plural":"ghipcani","dative-definite-genitive-plural":"ghipcanilor","singular-vocative":"ghipcanule","plural-vocative":"ghipcanilor"}},{"word":"Ghipeș","pos":"name","definitions":["a village in Mărtiniș, Harghita County, Romania"],"gender":"m"},{"word":"ghipiură","pos":"noun","definitions":["guipure"],"forms":{"plural":"ghipiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghipiură","accusative-definite-nominative-singular":"ghipiura","accusative-indefinite-nominative-plural":"ghipiuri","accusative-definite-nominative-plural":"ghipiurile","dative-genitive-indefinite-singular":"ghipiuri","dative-definite-genitive-singular":"ghipiurii","dative-genitive-indefinite-plural":"ghipiuri","dative-definite-genitive-plural":"ghipiurilor","singular-vocative":"ghipiură","plural-vocative":"ghipiurilor"}},{"word":"ghips","pos":"noun","definitions":["gypsum"],"forms":{"plural":"ghipsuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghips","accusative-definite-nominative-singular":"ghipsul","accusative-indefinite-nominative-plural":"ghipsuri","accusative-definite-nominative-plural":"ghipsurile","dative-genitive-indefinite-singular":"ghips","dative-definite-genitive-singular":"ghipsului","dative-genitive-indefinite-plural":"ghipsuri","dative-definite-genitive-plural":"ghipsurilor","singular-vocative":"ghipsule","plural-vocative":"ghipsurilor"}},{"word":"ghipsotecă","pos":"noun","definitions":["plaster cast gallery"],"forms":{"plural":"ghipsoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"ghipsotecă","accusative-definite-nominative-singular":"ghipsoteca","accusative-indefinite-nominative-plural":"ghipsoteci","accusative-definite-nominative-plural":"ghipsotecile","dative-genitive-indefinite-singular":"ghipsoteci","dative-definite-genitive-singular":"ghipsotecii","dative-genitive-indefinite-plural":"ghipsoteci","dative-definite-genitive-plural":"ghipsotecilor","singular-vocative":"ghipsotecă","plural-vocative":"ghipsotecilor"}},{"word":"ghiră","pos":"noun","definitions":["dirt, filth, grime"],"forms":{"plural":"ghire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiră","accusative-definite-nominative-singular":"ghira","accusative-indefinite-nominative-plural":"ghire","accusative-definite-nominative-plural":"ghirele","dative-genitive-indefinite-singular":"ghire","dative-definite-genitive-singular":"ghirei","dative-genitive-indefinite-plural":"ghire","dative-definite-genitive-plural":"ghirelor","singular-vocative":"ghiră","plural-vocative":"ghirelor"}},{"word":"Ghirasimescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghirasimescu"}},{"word":"Ghirbom","pos":"name","definitions":["a village in Berghin, Alba County, Romania"],"gender":"m"},{"word":"ghirdan","pos":"noun","definitions":["obsolete form of gherdan"],"forms":{"plural":"ghirdane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghirdan","accusative-definite-nominative-singular":"ghirdanul","accusative-indefinite-nominative-plural":"ghirdane","accusative-definite-nominative-plural":"ghirdanele","dative-genitive-indefinite-singular":"ghirdan","dative-definite-genitive-singular":"ghirdanului","dative-genitive-indefinite-plural":"ghirdane","dative-definite-genitive-plural":"ghirdanelor","singular-vocative":"ghirdanule","plural-vocative":"ghirdanelor"}},{"word":"Ghirdoveni","pos":"name","definitions":["a village in I. L. Caragiale, Dâmbovița County, Romania"],"gender":"m"},{"word":"Ghireasca","pos":"name","definitions":["a village in Mălușteni, Vaslui County, Romania"],"gender":"f"},{"word":"ghireată","pos":"noun","definitions":["niche, recess (in a wall), alcove"],"forms":{"plural":"ghirete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghireată","accusative-definite-nominative-singular":"ghireata","accusative-indefinite-nominative-plural":"ghirete","accusative-definite-nominative-plural":"ghiretele","dative-genitive-indefinite-singular":"ghirete","dative-definite-genitive-singular":"ghiretei","dative-genitive-indefinite-plural":"ghirete","dative-definite-genitive-plural":"ghiretelor","singular-vocative":"ghireată","plural-vocative":"ghiretelor"}},{"word":"Ghireni","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Prut","a village in Coțușca, Botoșani County, Romania"],"gender":"m"},{"word":"Ghirișa","pos":"name","definitions":["a village in Beltiug, Satu Mare County, Romania"],"gender":"f"},{"word":"Ghirișu Român","pos":"name","definitions":["a village in Mociu, Cluj County, Romania"],"gender":"m"},{"word":"ghirlandă","pos":"noun","definitions":["garland"],"forms":{"plural":"ghirlande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghirlandă","accusative-definite-nominative-singular":"ghirlanda","accusative-indefinite-nominative-plural":"ghirlande","accusative-definite-nominative-plural":"ghirlandele","dative-genitive-indefinite-singular":"ghirlande","dative-definite-genitive-singular":"ghirlandei","dative-genitive-indefinite-plural":"ghirlande","dative-definite-genitive-plural":"ghirlandelor","singular-vocative":"ghirlandă","plural-vocative":"ghirlandelor"}},{"word":"ghirlantă","pos":"noun","definitions":["alternative form of ghirlandă"],"forms":{"plural":"ghirlante"}},{"word":"Ghiroda","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Ghiroda, Timiș County, Romania"],"pronunciation":"/ɡiˈro.da/","gender":"f"},{"word":"Ghiroda Nouă","pos":"name","definitions":["A neighbourhood of Timișoara and a former commune of Timiș County, Romania"],"gender":"f"},{"word":"Ghirolt","pos":"name","definitions":["a village in Aluniș, Cluj County, Romania","a village in Moftin, Satu Mare County, Romania"],"gender":"m"},{"word":"Ghiroltean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghiroltean"}},{"word":"Ghirolteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Ghirolteanu"}},{"word":"ghișet","pos":"noun","definitions":["alternative form of ghișeu"],"forms":{"plural":"ghișete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghișet","accusative-definite-nominative-singular":"ghișetul","accusative-indefinite-nominative-plural":"ghișete","accusative-definite-nominative-plural":"ghișetele","dative-genitive-indefinite-singular":"ghișet","dative-definite-genitive-singular":"ghișetului","dative-genitive-indefinite-plural":"ghișete","dative-definite-genitive-plural":"ghișetelor","singular-vocative":"ghișetule","plural-vocative":"ghișetelor"}},{"word":"ghișeu","pos":"noun","definitions":["ticket office, box office, ticket booth","counter (at post office, bank etc.)"],"forms":{"plural":"ghișee","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghișeu","accusative-definite-nominative-singular":"ghișeul","accusative-indefinite-nominative-plural":"ghișee","accusative-definite-nominative-plural":"ghișeele","dative-genitive-indefinite-singular":"ghișeu","dative-definite-genitive-singular":"ghișeului","dative-genitive-indefinite-plural":"ghișee","dative-definite-genitive-plural":"ghișeelor","singular-vocative":"ghișeule","plural-vocative":"ghișeelor"}},{"word":"Ghiță","pos":"name","definitions":["a male given name from Romania","a surname"],"gender":"m"},{"word":"Ghițălăria","pos":"name","definitions":["a river in Botoșani County, Romania, tributary to the Jijia"],"gender":"f"},{"word":"ghitănel","pos":"noun","definitions":["diminutive of ghitan"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ghitănel","accusative-definite-nominative":"ghitănelul","dative-genitive-indefinite":"ghitănel","dative-definite-genitive":"ghitănelului","vocative":"ghitănelule"}},{"word":"ghitară","pos":"noun","definitions":["dated form of chitară"],"forms":{"plural":"ghitare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghitară","accusative-definite-nominative-singular":"ghitara","accusative-indefinite-nominative-plural":"ghitare","accusative-definite-nominative-plural":"ghitarele","dative-genitive-indefinite-singular":"ghitare","dative-definite-genitive-singular":"ghitarei","dative-genitive-indefinite-plural":"ghitare","dative-definite-genitive-plural":"ghitarelor","singular-vocative":"ghitară","plural-vocative":"ghitarelor"}},{"word":"ghitarist","pos":"noun","definitions":["alternative form of chitarist"],"forms":{"plural":"ghitariști"}},{"word":"ghitaristă","pos":"noun","definitions":["female equivalent of ghitarist"],"forms":{"plural":"ghitariste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghitaristă","accusative-definite-nominative-singular":"ghitarista","accusative-indefinite-nominative-plural":"ghitariste","accusative-definite-nominative-plural":"ghitaristele","dative-genitive-indefinite-singular":"ghitariste","dative-definite-genitive-singular":"ghitaristei","dative-genitive-indefinite-plural":"ghitariste","dative-definite-genitive-plural":"ghitaristelor","singular-vocative":"ghitaristă","plural-vocative":"ghitaristelor"}},{"word":"Ghițeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghițeanu"}},{"word":"Ghițescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghițescu"}},{"word":"Ghițică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghițică"}},{"word":"Ghițoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghițoiu"}},{"word":"ghițos","pos":"adj","definitions":["shaggy"],"forms":{"feminine-singular":"ghițoasă","masculine-plural":"ghițoși","feminine-neuter-plural":"ghițoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghițos","error-unrecognized-form-feminine-indefinite-singular":"ghițoasă","error-unrecognized-form-indefinite-masculine-plural":"ghițoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghițoase","definite-error-unrecognized-form-masculine-neuter-singular":"ghițosul","definite-error-unrecognized-form-feminine-singular":"ghițoasa","definite-error-unrecognized-form-masculine-plural":"ghițoșii","definite-error-unrecognized-form-feminine-neuter-plural":"ghițoasele"}},{"word":"Ghițuică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghițuică"}},{"word":"Ghițuleasa","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"f"},{"word":"Ghițulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghițulescu"}},{"word":"Ghițulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghițulică"}},{"word":"ghiudem","pos":"noun","definitions":["alternative form of ghiuden"],"forms":{"plural":"ghiudemuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiudem","accusative-definite-nominative-singular":"ghiudemul","accusative-indefinite-nominative-plural":"ghiudemuri","accusative-definite-nominative-plural":"ghiudemurile","dative-genitive-indefinite-singular":"ghiudem","dative-definite-genitive-singular":"ghiudemului","dative-genitive-indefinite-plural":"ghiudemuri","dative-definite-genitive-plural":"ghiudemurilor","singular-vocative":"ghiudemule","plural-vocative":"ghiudemurilor"}},{"word":"ghiuden","pos":"noun","definitions":["a kind of dry sausage"],"forms":{"plural":"ghiudenuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiuden","accusative-definite-nominative-singular":"ghiudenul","accusative-indefinite-nominative-plural":"ghiudenuri","accusative-definite-nominative-plural":"ghiudenurile","dative-genitive-indefinite-singular":"ghiuden","dative-definite-genitive-singular":"ghiudenului","dative-genitive-indefinite-plural":"ghiudenuri","dative-definite-genitive-plural":"ghiudenurilor","singular-vocative":"ghiudenule","plural-vocative":"ghiudenurilor"}},{"word":"ghiufă","pos":"noun","definitions":["match (device to make fire)"],"forms":{"plural":"ghiufe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ghiufă","accusative-definite-nominative-singular":"ghiufa","accusative-indefinite-nominative-plural":"ghiufe","accusative-definite-nominative-plural":"ghiufele","dative-genitive-indefinite-singular":"ghiufe","dative-definite-genitive-singular":"ghiufei","dative-genitive-indefinite-plural":"ghiufe","dative-definite-genitive-plural":"ghiufelor","singular-vocative":"ghiufă","plural-vocative":"ghiufelor"}},{"word":"ghiuitău","pos":"noun","definitions":["lighter"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ghiuitău","accusative-definite-nominative":"ghiuităuul","dative-genitive-indefinite":"ghiuitău","dative-definite-genitive":"ghiuităuului","vocative":"ghiuităuule"}},{"word":"ghiuj","pos":"noun","definitions":["old man, gaffer, old fogey, buzzard"],"pronunciation":"[ɡjuʒ]","forms":{"plural":"ghiuji","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiuj","accusative-definite-nominative-singular":"ghiujul","accusative-indefinite-nominative-plural":"ghiuji","accusative-definite-nominative-plural":"ghiujii","dative-genitive-indefinite-singular":"ghiuj","dative-definite-genitive-singular":"ghiujului","dative-genitive-indefinite-plural":"ghiuji","dative-definite-genitive-plural":"ghiujilor","singular-vocative":"ghiujule","plural-vocative":"ghiujilor"}},{"word":"ghiul","pos":"noun","definitions":["men's ring","gemstone rosette on a ring"],"forms":{"plural":"ghiuluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiul","accusative-definite-nominative-singular":"ghiulul","accusative-indefinite-nominative-plural":"ghiuluri","accusative-definite-nominative-plural":"ghiulurile","dative-genitive-indefinite-singular":"ghiul","dative-definite-genitive-singular":"ghiulului","dative-genitive-indefinite-plural":"ghiuluri","dative-definite-genitive-plural":"ghiulurilor","singular-vocative":"ghiulule","plural-vocative":"ghiulurilor"}},{"word":"Ghiula","pos":"name","definitions":["a surname","a river in Covasna, Romania, tributary to the Bâsca Mare"],"gender":"m","forms":{"dative-genitive":"lui Ghiula"}},{"word":"ghiulea","pos":"noun","definitions":["cannonball"],"forms":{"plural":"ghiulele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ghiulea","accusative-definite-nominative-singular":"ghiuleaua","accusative-indefinite-nominative-plural":"ghiulele","accusative-definite-nominative-plural":"ghiulelele","dative-genitive-indefinite-singular":"ghiulele","dative-definite-genitive-singular":"ghiulelei","dative-genitive-indefinite-plural":"ghiulele","dative-definite-genitive-plural":"ghiulelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ghiuluș","pos":"noun","definitions":["a large gathering, assembly"],"forms":{"plural":"ghiulușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiuluș","accusative-definite-nominative-singular":"ghiulușul","accusative-indefinite-nominative-plural":"ghiulușuri","accusative-definite-nominative-plural":"ghiulușurile","dative-genitive-indefinite-singular":"ghiuluș","dative-definite-genitive-singular":"ghiulușului","dative-genitive-indefinite-plural":"ghiulușuri","dative-definite-genitive-plural":"ghiulușurilor","singular-vocative":"ghiulușule","plural-vocative":"ghiulușurilor"}},{"word":"ghium","pos":"noun","definitions":["copper kettle"],"forms":{"plural":"ghiumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghium","accusative-definite-nominative-singular":"ghiumul","accusative-indefinite-nominative-plural":"ghiumuri","accusative-definite-nominative-plural":"ghiumurile","dative-genitive-indefinite-singular":"ghium","dative-definite-genitive-singular":"ghiumului","dative-genitive-indefinite-plural":"ghiumuri","dative-definite-genitive-plural":"ghiumurilor","singular-vocative":"ghiumule","plural-vocative":"ghiumurilor"}},{"word":"ghiumbruc","pos":"noun","definitions":["customs"],"forms":{"plural":"ghiumbrucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiumbruc","accusative-definite-nominative-singular":"ghiumbrucul","accusative-indefinite-nominative-plural":"ghiumbrucuri","accusative-definite-nominative-plural":"ghiumbrucurile","dative-genitive-indefinite-singular":"ghiumbruc","dative-definite-genitive-singular":"ghiumbrucului","dative-genitive-indefinite-plural":"ghiumbrucuri","dative-definite-genitive-plural":"ghiumbrucurilor","singular-vocative":"ghiumbrucule","plural-vocative":"ghiumbrucurilor"}},{"word":"ghiumbrucciu","pos":"noun","definitions":["customs officer"],"forms":{"plural":"ghiumbruccii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghiumbrucciu","accusative-definite-nominative-singular":"ghiumbrucciuul","accusative-indefinite-nominative-plural":"ghiumbruccii","accusative-definite-nominative-plural":"ghiumbrucciii","dative-genitive-indefinite-singular":"ghiumbrucciu","dative-definite-genitive-singular":"ghiumbrucciuului","dative-genitive-indefinite-plural":"ghiumbruccii","dative-definite-genitive-plural":"ghiumbrucciilor","singular-vocative":"ghiumbrucciuule","plural-vocative":"ghiumbrucciilor"}},{"word":"ghiundelic","pos":"noun","definitions":["salary"],"forms":{"plural":"ghiundelicuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ghiundelic","accusative-definite-nominative-singular":"ghiundelicul","accusative-indefinite-nominative-plural":"ghiundelicuri","accusative-definite-nominative-plural":"ghiundelicurile","dative-genitive-indefinite-singular":"ghiundelic","dative-definite-genitive-singular":"ghiundelicului","dative-genitive-indefinite-plural":"ghiundelicuri","dative-definite-genitive-plural":"ghiundelicurilor","singular-vocative":"ghiundelicule","plural-vocative":"ghiundelicurilor"}},{"word":"ghiunie","pos":"noun","definitions":["carpenter's square, set square, angle measure"],"forms":{"plural":"ghiunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ghiunie","accusative-definite-nominative-singular":"ghiunia","accusative-indefinite-nominative-plural":"ghiunii","accusative-definite-nominative-plural":"ghiuniile","dative-genitive-indefinite-singular":"ghiunii","dative-definite-genitive-singular":"ghiuniei","dative-genitive-indefinite-plural":"ghiunii","dative-definite-genitive-plural":"ghiuniilor","singular-vocative":"ghiunie","plural-vocative":"ghiuniilor"}},{"word":"Ghiurcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiurcă"}},{"word":"Ghiurca Mare","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Bâsca Mare","a river in Buzău, Romania, tributary to the Ghiurca"],"gender":"f"},{"word":"Ghiurca Mică","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Ghiurca"],"gender":"f"},{"word":"Ghiurcănaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiurcănaș"}},{"word":"Ghiurche","pos":"name","definitions":["a village in Ciucsângeorgiu, Harghita County, Romania"],"gender":"m"},{"word":"ghiurghiuliu","pos":"adj","definitions":["rose-colored"],"forms":{"feminine-singular":"ghiurghiulie","plural":"ghiurghiulii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiurghiuliu","error-unrecognized-form-feminine-indefinite-singular":"ghiurghiulie","error-unrecognized-form-indefinite-masculine-plural":"ghiurghiulii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghiurghiulii","definite-error-unrecognized-form-masculine-neuter-singular":"ghiurghiuliul","definite-error-unrecognized-form-feminine-singular":"ghiurghiulia","definite-error-unrecognized-form-masculine-plural":"ghiurghiuliii","definite-error-unrecognized-form-feminine-neuter-plural":"ghiurghiuliile"}},{"word":"ghiurt","pos":"noun","definitions":["belt, girdle"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"ghiurt","accusative-definite-nominative":"ghiurtul","dative-genitive-indefinite":"ghiurt","dative-definite-genitive":"ghiurtului","vocative":"ghiurtule"}},{"word":"Ghiuvegea","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Cărpiniș, later merged with Băneasa in 1968."],"gender":"f"},{"word":"Ghiuvenlia","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Chirnogeni."],"gender":"m"},{"word":"ghiuvergilea","pos":"noun","definitions":["saltpetre"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative":"ghiuvergilea","accusative-definite-nominative":"ghiuvergileaua","dative-genitive-indefinite":"ghiuvergilele","dative-definite-genitive":"ghiuvergilelei","vocative":"ghiuvergilea"}},{"word":"ghiuzit","pos":"adj","definitions":["wrinkled"],"forms":{"feminine-singular":"ghiuzită","masculine-plural":"ghiuziți","feminine-neuter-plural":"ghiuzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiuzit","error-unrecognized-form-feminine-indefinite-singular":"ghiuzită","error-unrecognized-form-indefinite-masculine-plural":"ghiuziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghiuzite","definite-error-unrecognized-form-masculine-neuter-singular":"ghiuzitul","definite-error-unrecognized-form-feminine-singular":"ghiuzita","definite-error-unrecognized-form-masculine-plural":"ghiuziții","definite-error-unrecognized-form-feminine-neuter-plural":"ghiuzitele"}},{"word":"Ghiveci","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiveci"}},{"word":"ghiveci","pos":"noun","definitions":["flowerpot (a container in which plants are grown)","a Romanian dish, a kind of vegetable stew"],"pronunciation":"/ɡiˈvet͡ʃʲ/","forms":{"plural":"ghivece","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghiveci","accusative-definite-nominative-singular":"ghiveciul","accusative-indefinite-nominative-plural":"ghivece","accusative-definite-nominative-plural":"ghivecele","dative-genitive-indefinite-singular":"ghiveci","dative-definite-genitive-singular":"ghiveciului","dative-genitive-indefinite-plural":"ghivece","dative-definite-genitive-plural":"ghivecelor","singular-vocative":"ghiveciule","plural-vocative":"ghivecelor"}},{"word":"Ghiveciu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghiveciu"}},{"word":"ghiviziu","pos":"adj","definitions":["dark red or purple"],"forms":{"feminine-singular":"ghivizie","plural":"ghivizii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghiviziu","error-unrecognized-form-feminine-indefinite-singular":"ghivizie","error-unrecognized-form-indefinite-masculine-plural":"ghivizii","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghivizii","definite-error-unrecognized-form-masculine-neuter-singular":"ghiviziul","definite-error-unrecognized-form-feminine-singular":"ghivizia","definite-error-unrecognized-form-masculine-plural":"ghiviziii","definite-error-unrecognized-form-feminine-neuter-plural":"ghiviziile"}},{"word":"ghizd","pos":"noun","definitions":["curb (a raised margin along the edge of a well, as a strengthening.)"],"forms":{"plural":"ghizde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghizd","accusative-definite-nominative-singular":"ghizdul","accusative-indefinite-nominative-plural":"ghizde","accusative-definite-nominative-plural":"ghizdele","dative-genitive-indefinite-singular":"ghizd","dative-definite-genitive-singular":"ghizdului","dative-genitive-indefinite-plural":"ghizde","dative-definite-genitive-plural":"ghizdelor","singular-vocative":"ghizdule","plural-vocative":"ghizdelor"}},{"word":"ghizdan","pos":"noun","definitions":["alternative form of ghiozdan"],"forms":{"plural":"ghizdane"}},{"word":"Ghizdaru","pos":"name","definitions":["a village in Stănești, Giurgiu County, Romania"],"gender":"m"},{"word":"Ghizdav","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghizdav"}},{"word":"ghizdav","pos":"adj","definitions":["pretty, pleasant"],"forms":{"feminine-singular":"ghizdavă","masculine-plural":"ghizdavi","feminine-neuter-plural":"ghizdave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ghizdav","error-unrecognized-form-feminine-indefinite-singular":"ghizdavă","error-unrecognized-form-indefinite-masculine-plural":"ghizdavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"ghizdave","definite-error-unrecognized-form-masculine-neuter-singular":"ghizdavul","definite-error-unrecognized-form-feminine-singular":"ghizdava","definite-error-unrecognized-form-masculine-plural":"ghizdavii","definite-error-unrecognized-form-feminine-neuter-plural":"ghizdavele"}},{"word":"Ghizdăvescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Ghizdăvescu"}},{"word":"Ghizdăvești","pos":"name","definitions":["a village in Celaru, Dolj County, Romania"],"gender":"m"},{"word":"Ghizdavu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Ghizdavu"}},{"word":"ghizdea","pos":"noun","definitions":["diminutive of ghizd"],"forms":{"plural":"ghizdele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ghizdea","accusative-definite-nominative-singular":"ghizdeaua","accusative-indefinite-nominative-plural":"ghizdele","accusative-definite-nominative-plural":"ghizdelele","dative-genitive-indefinite-singular":"ghizdele","dative-definite-genitive-singular":"ghizdelei","dative-genitive-indefinite-plural":"ghizdele","dative-definite-genitive-plural":"ghizdelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ghizdei","pos":"noun","definitions":["birdsfoot trefoil (Lotus corniculatus)"],"forms":{"plural":"ghizdei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ghizdei","accusative-definite-nominative-singular":"ghizdeiul","accusative-indefinite-nominative-plural":"ghizdei","accusative-definite-nominative-plural":"ghizdeii","dative-genitive-indefinite-singular":"ghizdei","dative-definite-genitive-singular":"ghizdeiului","dative-genitive-indefinite-plural":"ghizdei","dative-definite-genitive-plural":"ghizdeilor","singular-vocative":"ghizdeiule","plural-vocative":"ghizdeilor"}},{"word":"Ghizdita","pos":"name","definitions":["a village in Fîntînița, Drochia Raion, Moldova","a village in Mânzălești, Buzău County, Romania"],"gender":"f"},{"word":"Ghizela","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Ghizela, Timiș County, Romania"],"gender":"f"},{"word":"ghizi","pos":"noun","definitions":["plural of ghid (“guides”)"],"pronunciation":"[ɡizʲ]","gender":"m-p"},{"word":"ghizie","pos":"noun","definitions":["taffeta"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ghizie","accusative-definite-nominative":"ghizia","dative-genitive-indefinite":"ghizii","dative-definite-genitive":"ghiziei","vocative":"ghizie"}},{"word":"ghizlucel","pos":"noun","definitions":["diminutive of ghizluc"],"forms":{"plural":"ghizlucele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ghizlucel","accusative-definite-nominative-singular":"ghizlucelul","accusative-indefinite-nominative-plural":"ghizlucele","accusative-definite-nominative-plural":"ghizlucelele","dative-genitive-indefinite-singular":"ghizlucel","dative-definite-genitive-singular":"ghizlucelului","dative-genitive-indefinite-plural":"ghizlucele","dative-definite-genitive-plural":"ghizlucelelor","singular-vocative":"ghizlucelule","plural-vocative":"ghizlucelelor"}},{"word":"giaca","pos":"noun","definitions":["definite nominative/accusative singular of giacă"],"pronunciation":"[ˈd͡ʒjaka]","gender":"f"},{"word":"giacă","pos":"noun","definitions":["alternative form of geacă"],"pronunciation":"[ˈdʒjakə]","forms":{"plural":"giace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giacă","accusative-definite-nominative-singular":"giaca","accusative-indefinite-nominative-plural":"giace","accusative-definite-nominative-plural":"giacele","dative-genitive-indefinite-singular":"giace","dative-definite-genitive-singular":"giacei","dative-genitive-indefinite-plural":"giace","dative-definite-genitive-plural":"giacelor","singular-vocative":"giacă","plural-vocative":"giacelor"}},{"word":"Giacăș","pos":"name","definitions":["a village in Alma, Sibiu County, Romania"],"gender":"m"},{"word":"giace","pos":"noun","definitions":["inflection of giacă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈd͡ʒjat͡ʃe]","gender":"f"},{"word":"giaco","pos":"noun","definitions":["vocative singular of giacă"],"pronunciation":"[ˈd͡ʒjako]","gender":"f"},{"word":"Gialacuta","pos":"name","definitions":["a village in Brănișca, Hunedoara County, Romania"],"gender":"f"},{"word":"giardia","pos":"noun","definitions":["giardia"]},{"word":"giardiază","pos":"noun","definitions":["giardiasis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giardiază","accusative-definite-nominative-singular":"giardiaza","accusative-indefinite-nominative-plural":"giardiaze","accusative-definite-nominative-plural":"giardiazele","dative-genitive-indefinite-singular":"giardiaze","dative-definite-genitive-singular":"giardiazei","dative-genitive-indefinite-plural":"giardiaze","dative-definite-genitive-plural":"giardiazelor","singular-vocative":"giardiază","plural-vocative":"giardiazelor"}},{"word":"Giarmata","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Giarmata, Timiș County, Romania"],"gender":"f"},{"word":"Giarmata-Vii","pos":"name","definitions":["a village in Ghiroda, Timiș County, Romania"],"gender":"m"},{"word":"giberelină","pos":"noun","definitions":["gibberellin"],"forms":{"plural":"gibereline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giberelină","accusative-definite-nominative-singular":"giberelina","accusative-indefinite-nominative-plural":"gibereline","accusative-definite-nominative-plural":"giberelinele","dative-genitive-indefinite-singular":"gibereline","dative-definite-genitive-singular":"giberelinei","dative-genitive-indefinite-plural":"gibereline","dative-definite-genitive-plural":"giberelinelor","singular-vocative":"giberelină","plural-vocative":"giberelinelor"}},{"word":"gibernă","pos":"noun","definitions":["bandolier, cartridge belt"],"forms":{"plural":"giberne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gibernă","accusative-definite-nominative-singular":"giberna","accusative-indefinite-nominative-plural":"giberne","accusative-definite-nominative-plural":"gibernele","dative-genitive-indefinite-singular":"giberne","dative-definite-genitive-singular":"gibernei","dative-genitive-indefinite-plural":"giberne","dative-definite-genitive-plural":"gibernelor","singular-vocative":"gibernă","plural-vocative":"gibernelor"}},{"word":"Gibești","pos":"name","definitions":["a village in Golești, Vâlcea County, Romania"],"gender":"m"},{"word":"gibon","pos":"noun","definitions":["gibbon"],"forms":{"plural":"giboni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gibon","accusative-definite-nominative-singular":"gibonul","accusative-indefinite-nominative-plural":"giboni","accusative-definite-nominative-plural":"gibonii","dative-genitive-indefinite-singular":"gibon","dative-definite-genitive-singular":"gibonului","dative-genitive-indefinite-plural":"giboni","dative-definite-genitive-plural":"gibonilor","singular-vocative":"gibonule","plural-vocative":"gibonilor"}},{"word":"gibozitate","pos":"noun","definitions":["gibbosity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gibozitate","accusative-definite-nominative-singular":"gibozitatea","accusative-indefinite-nominative-plural":"gibozități","accusative-definite-nominative-plural":"gibozitățile","dative-genitive-indefinite-singular":"gibozități","dative-definite-genitive-singular":"gibozității","dative-genitive-indefinite-plural":"gibozități","dative-definite-genitive-plural":"gibozităților","singular-vocative":"gibozitate","plural-vocative":"gibozităților"}},{"word":"Gică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gică"}},{"word":"Gîdescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gîdescu"}},{"word":"gidogină","pos":"noun","definitions":["narrow valley"],"forms":{"plural":"gidogini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gidogină","accusative-definite-nominative-singular":"gidogina","accusative-indefinite-nominative-plural":"gidogini","accusative-definite-nominative-plural":"gidoginile","dative-genitive-indefinite-singular":"gidogini","dative-definite-genitive-singular":"gidoginii","dative-genitive-indefinite-plural":"gidogini","dative-definite-genitive-plural":"gidoginilor","singular-vocative":"gidogină","plural-vocative":"gidoginilor"}},{"word":"Gîdoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gîdoiu"}},{"word":"gidunie","pos":"noun","definitions":["precipice, chasm, ravine, abyss"],"forms":{"plural":"gidunii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gidunie","accusative-definite-nominative-singular":"gidunia","accusative-indefinite-nominative-plural":"gidunii","accusative-definite-nominative-plural":"giduniile","dative-genitive-indefinite-singular":"gidunii","dative-definite-genitive-singular":"giduniei","dative-genitive-indefinite-plural":"gidunii","dative-definite-genitive-plural":"giduniilor","singular-vocative":"gidunie","plural-vocative":"giduniilor"}},{"word":"gigă","pos":"noun","definitions":["jig (dance)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gigă","accusative-definite-nominative":"giga","dative-genitive-indefinite":"gige","dative-definite-genitive":"gigei","vocative":"gigă"}},{"word":"gigacalorie","pos":"noun","definitions":["gigacalorie"],"forms":{"plural":"gigacalorii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gigacalorie","accusative-definite-nominative-singular":"gigacaloria","accusative-indefinite-nominative-plural":"gigacalorii","accusative-definite-nominative-plural":"gigacaloriile","dative-genitive-indefinite-singular":"gigacalorii","dative-definite-genitive-singular":"gigacaloriei","dative-genitive-indefinite-plural":"gigacalorii","dative-definite-genitive-plural":"gigacaloriilor","singular-vocative":"gigacalorie","plural-vocative":"gigacaloriilor"}},{"word":"gigahertz","pos":"noun","definitions":["gigahertz"],"forms":{"plural":"gigahertzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gigahertz","accusative-definite-nominative-singular":"gigahertzul","accusative-indefinite-nominative-plural":"gigahertzi","accusative-definite-nominative-plural":"gigahertzii","dative-genitive-indefinite-singular":"gigahertz","dative-definite-genitive-singular":"gigahertzului","dative-genitive-indefinite-plural":"gigahertzi","dative-definite-genitive-plural":"gigahertzilor","singular-vocative":"gigahertzule","plural-vocative":"gigahertzilor"}},{"word":"gigant","pos":"noun","definitions":["giant"],"forms":{"plural":"giganți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gigant","accusative-definite-nominative-singular":"gigantul","accusative-indefinite-nominative-plural":"giganți","accusative-definite-nominative-plural":"giganții","dative-genitive-indefinite-singular":"gigant","dative-definite-genitive-singular":"gigantului","dative-genitive-indefinite-plural":"giganți","dative-definite-genitive-plural":"giganților","singular-vocative":"gigantule","plural-vocative":"giganților"}},{"word":"gigantă","pos":"noun","definitions":["female equivalent of gigant"],"forms":{"plural":"gigante","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gigantă","accusative-definite-nominative-singular":"giganta","accusative-indefinite-nominative-plural":"gigante","accusative-definite-nominative-plural":"gigantele","dative-genitive-indefinite-singular":"gigante","dative-definite-genitive-singular":"gigantei","dative-genitive-indefinite-plural":"gigante","dative-definite-genitive-plural":"gigantelor","singular-vocative":"gigantă","plural-vocative":"gigantelor"}},{"word":"gigantesc","pos":"adj","definitions":["gigantic"],"forms":{"feminine-singular":"gigantească","plural":"gigantești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gigantesc","error-unrecognized-form-feminine-indefinite-singular":"gigantească","error-unrecognized-form-indefinite-masculine-plural":"gigantești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gigantești","definite-error-unrecognized-form-masculine-neuter-singular":"gigantescul","definite-error-unrecognized-form-feminine-singular":"giganteasca","definite-error-unrecognized-form-masculine-plural":"giganteștii","definite-error-unrecognized-form-feminine-neuter-plural":"giganteștile"}},{"word":"gigantic","pos":"adj","definitions":["giant"],"forms":{"feminine-singular":"gigantică","masculine-plural":"gigantici","feminine-neuter-plural":"gigantice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gigantic","error-unrecognized-form-feminine-indefinite-singular":"gigantică","error-unrecognized-form-indefinite-masculine-plural":"gigantici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gigantice","definite-error-unrecognized-form-masculine-neuter-singular":"giganticul","definite-error-unrecognized-form-feminine-singular":"gigantica","definite-error-unrecognized-form-masculine-plural":"giganticii","definite-error-unrecognized-form-feminine-neuter-plural":"giganticele"}},{"word":"gigantism","pos":"noun","definitions":["gigantism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gigantism","accusative-definite-nominative":"gigantismul","dative-genitive-indefinite":"gigantism","dative-definite-genitive":"gigantismului","vocative":"gigantismule"}},{"word":"gigantiza","pos":"verb","definitions":["to giantize"],"forms":{"canonical":"a gigantiza 1st conjugation","present-singular-third-person":"gigantizează","participle-past":"gigantizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gigantiza","gerund":"gigantizând","first-person-indicative-present-singular":"gigantizez","indicative-present-second-person-singular":"gigantizezi","indicative-present-singular-third-person":"gigantizează","first-person-indicative-plural-present":"gigantizăm","indicative-plural-present-second-person":"gigantizați","indicative-plural-present-third-person":"gigantizează","first-person-imperfect-indicative-singular":"gigantizam","imperfect-indicative-second-person-singular":"gigantizai","imperfect-indicative-singular-third-person":"gigantiza","first-person-imperfect-indicative-plural":"gigantizam","imperfect-indicative-plural-second-person":"gigantizați","imperfect-indicative-plural-third-person":"gigantizau","first-person-indicative-perfect-singular":"gigantizai","indicative-perfect-second-person-singular":"gigantizași","indicative-perfect-singular-third-person":"gigantiză","first-person-indicative-perfect-plural":"gigantizarăm","indicative-perfect-plural-second-person":"gigantizarăți","indicative-perfect-plural-third-person":"gigantizară","first-person-indicative-pluperfect-singular":"gigantizasem","indicative-pluperfect-second-person-singular":"gigantizaseși","indicative-pluperfect-singular-third-person":"gigantizase","first-person-indicative-pluperfect-plural":"gigantizaserăm","indicative-pluperfect-plural-second-person":"gigantizaserăți","indicative-pluperfect-plural-third-person":"gigantizaseră","first-person-present-singular-subjunctive":"să gigantizez","present-second-person-singular-subjunctive":"să gigantizezi","present-singular-subjunctive-third-person":"să gigantizeze","first-person-plural-present-subjunctive":"să gigantizăm","plural-present-second-person-subjunctive":"să gigantizați","plural-present-subjunctive-third-person":"să gigantizeze","imperative-second-person-singular":"gigantizează","imperative-plural-second-person":"gigantizați","imperative-negative-second-person-singular":"nu gigantiza","imperative-negative-plural-second-person":"nu gigantizați"}},{"word":"gigantizare","pos":"noun","definitions":["the act of making something giant"],"forms":{"plural":"gigantizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gigantizare","accusative-definite-nominative-singular":"gigantizarea","accusative-indefinite-nominative-plural":"gigantizări","accusative-definite-nominative-plural":"gigantizările","dative-genitive-indefinite-singular":"gigantizări","dative-definite-genitive-singular":"gigantizării","dative-genitive-indefinite-plural":"gigantizări","dative-definite-genitive-plural":"gigantizărilor","singular-vocative":"gigantizare","plural-vocative":"gigantizărilor"}},{"word":"gigantomahie","pos":"noun","definitions":["gigantomachy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gigantomahie","accusative-definite-nominative":"gigantomahia","dative-genitive-indefinite":"gigantomahii","dative-definite-genitive":"gigantomahiei","vocative":"gigantomahie"}},{"word":"gigea","pos":"adj","definitions":["nice, cute, pretty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gigea","error-unrecognized-form-feminine-indefinite-singular":"gigea","error-unrecognized-form-indefinite-masculine-plural":"gigea","error-unrecognized-form-feminine-indefinite-neuter-plural":"gigea","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Gigică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gigică"}},{"word":"gigică","pos":"adj","definitions":["diminutive of gigea"],"forms":{"plural":"gigice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"gigică","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"gigice","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"gigica","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"gigicele"}},{"word":"gigoletă","pos":"noun","definitions":["prostitute"],"forms":{"plural":"gigolete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gigoletă","accusative-definite-nominative-singular":"gigoleta","accusative-indefinite-nominative-plural":"gigolete","accusative-definite-nominative-plural":"gigoletele","dative-genitive-indefinite-singular":"gigolete","dative-definite-genitive-singular":"gigoletei","dative-genitive-indefinite-plural":"gigolete","dative-definite-genitive-plural":"gigoletelor","singular-vocative":"gigoletă","plural-vocative":"gigoletelor"}}];
@@ -0,0 +1 @@
+export default [{"word":"gigolo","pos":"noun","definitions":["gigolo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gigolo","accusative-definite-nominative":"gigoloul","dative-genitive-indefinite":"gigolo","dative-definite-genitive":"gigoloului","vocative":"gigoloule"}},{"word":"gilălui","pos":"verb","definitions":["to hate"],"forms":{"canonical":"a gilălui 4th conjugation","present-singular-third-person":"gilăluiește","participle-past":"gilăluit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gilălui","gerund":"gilăluind","first-person-indicative-present-singular":"gilăluiesc","indicative-present-second-person-singular":"gilăluiești","indicative-present-singular-third-person":"gilăluiește","first-person-indicative-plural-present":"gilăluim","indicative-plural-present-second-person":"gilăluiți","indicative-plural-present-third-person":"gilăluiesc","first-person-imperfect-indicative-singular":"gilăluiam","imperfect-indicative-second-person-singular":"gilăluiai","imperfect-indicative-singular-third-person":"gilăluia","first-person-imperfect-indicative-plural":"gilăluiam","imperfect-indicative-plural-second-person":"gilăluiați","imperfect-indicative-plural-third-person":"gilăluiau","first-person-indicative-perfect-singular":"gilăluii","indicative-perfect-second-person-singular":"gilăluiși","indicative-perfect-singular-third-person":"gilălui","first-person-indicative-perfect-plural":"gilăluirăm","indicative-perfect-plural-second-person":"gilăluirăți","indicative-perfect-plural-third-person":"gilăluiră","first-person-indicative-pluperfect-singular":"gilăluisem","indicative-pluperfect-second-person-singular":"gilăluiseși","indicative-pluperfect-singular-third-person":"gilăluise","first-person-indicative-pluperfect-plural":"gilăluiserăm","indicative-pluperfect-plural-second-person":"gilăluiserăți","indicative-pluperfect-plural-third-person":"gilăluiseră","first-person-present-singular-subjunctive":"să gilăluiesc","present-second-person-singular-subjunctive":"să gilăluiești","present-singular-subjunctive-third-person":"să gilăluiască","first-person-plural-present-subjunctive":"să gilăluim","plural-present-second-person-subjunctive":"să gilăluiți","plural-present-subjunctive-third-person":"să gilăluiască","imperative-second-person-singular":"gilăluiește","imperative-plural-second-person":"gilăluiți","imperative-negative-second-person-singular":"nu gilălui","imperative-negative-plural-second-person":"nu gilăluiți"}},{"word":"Gilău","pos":"name","definitions":["a commune of Cluj County, Romania","a village in Gilău, Cluj County, Romania"],"gender":"m"},{"word":"Gîlceavă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîlceavă"}},{"word":"Gîlcescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gîlcescu"}},{"word":"Gilescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gilescu"}},{"word":"giletcă","pos":"noun","definitions":["obsolete form of jiletcă"],"forms":{"plural":"giletci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"giletcă","accusative-definite-nominative-singular":"giletca","accusative-indefinite-nominative-plural":"giletci","accusative-definite-nominative-plural":"giletcile","dative-genitive-indefinite-singular":"giletci","dative-definite-genitive-singular":"giletcii","dative-genitive-indefinite-plural":"giletci","dative-definite-genitive-plural":"giletcilor","singular-vocative":"giletcă","plural-vocative":"giletcilor"}},{"word":"Gilorteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gilorteanu"}},{"word":"Gilorțel","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Gilort"],"gender":"m"},{"word":"Gilorțelul Mare","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Gilorțel"],"gender":"m"},{"word":"Gilorțelul Mic","pos":"name","definitions":["a river in Gorj, Romania, tributary to the Gilorțel"],"gender":"m"},{"word":"Gilortu","pos":"name","definitions":["a village in Brănești, Gorj County, Romania"],"gender":"m"},{"word":"giloșag","pos":"noun","definitions":["hate"],"forms":{"plural":"giloșaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giloșag","accusative-definite-nominative-singular":"giloșagul","accusative-indefinite-nominative-plural":"giloșaguri","accusative-definite-nominative-plural":"giloșagurile","dative-genitive-indefinite-singular":"giloșag","dative-definite-genitive-singular":"giloșagului","dative-genitive-indefinite-plural":"giloșaguri","dative-definite-genitive-plural":"giloșagurilor","singular-vocative":"giloșagule","plural-vocative":"giloșagurilor"}},{"word":"gilotaj","pos":"noun","definitions":["gillotage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gilotaj","accusative-definite-nominative":"gilotajul","dative-genitive-indefinite":"gilotaj","dative-definite-genitive":"gilotajului","vocative":"gilotajule"}},{"word":"Gimbășani","pos":"name","definitions":["a village in Cosâmbești, Ialomița County, Romania"],"gender":"m"},{"word":"gimnast","pos":"noun","definitions":["gymnast"],"pronunciation":"/d͡ʒimˈnast/","forms":{"plural":"gimnaști","feminine":"equivalent gimnastă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnast","accusative-definite-nominative-singular":"gimnastul","accusative-indefinite-nominative-plural":"gimnaști","accusative-definite-nominative-plural":"gimnaștii","dative-genitive-indefinite-singular":"gimnast","dative-definite-genitive-singular":"gimnastului","dative-genitive-indefinite-plural":"gimnaști","dative-definite-genitive-plural":"gimnaștilor","singular-vocative":"gimnastule","plural-vocative":"gimnaștilor"}},{"word":"gimnasta","pos":"noun","definitions":["definite nominative/accusative singular of gimnastă"],"gender":"f"},{"word":"gimnastă","pos":"noun","definitions":["female equivalent of gimnast"],"pronunciation":"/d͡ʒimˈnas.tə/","forms":{"plural":"gimnaste","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"gimnastă","accusative-definite-nominative-singular":"gimnasta","accusative-indefinite-nominative-plural":"gimnaste","accusative-definite-nominative-plural":"gimnastele","dative-genitive-indefinite-singular":"gimnaste","dative-definite-genitive-singular":"gimnastei","dative-genitive-indefinite-plural":"gimnaste","dative-definite-genitive-plural":"gimnastelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"gimnaste","pos":"noun","definitions":["plural of gimnastă"],"gender":"f"},{"word":"gimnaști","pos":"noun","definitions":["plural of gimnast"],"gender":"m"},{"word":"gimnastic","pos":"adj","definitions":["gymnastic"],"forms":{"feminine-singular":"gimnastică","masculine-plural":"gimnastici","feminine-neuter-plural":"gimnastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gimnastic","error-unrecognized-form-feminine-indefinite-singular":"gimnastică","error-unrecognized-form-indefinite-masculine-plural":"gimnastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gimnastice","definite-error-unrecognized-form-masculine-neuter-singular":"gimnasticul","definite-error-unrecognized-form-feminine-singular":"gimnastica","definite-error-unrecognized-form-masculine-plural":"gimnasticii","definite-error-unrecognized-form-feminine-neuter-plural":"gimnasticele"}},{"word":"gimnastică","pos":"noun","definitions":["gymnastics"],"forms":{"plural":"gimnastici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gimnastică","accusative-definite-nominative-singular":"gimnastica","accusative-indefinite-nominative-plural":"gimnastici","accusative-definite-nominative-plural":"gimnasticile","dative-genitive-indefinite-singular":"gimnastici","dative-definite-genitive-singular":"gimnasticii","dative-genitive-indefinite-plural":"gimnastici","dative-definite-genitive-plural":"gimnasticilor","singular-vocative":"gimnastică","plural-vocative":"gimnasticilor"}},{"word":"gimnastică aerobică","pos":"noun","definitions":["aerobics"]},{"word":"gimnastică ritmică","pos":"noun","definitions":["rhythmic gymnastics"]},{"word":"gimnazial","pos":"adj","definitions":["gymnasial"],"forms":{"feminine-singular":"gimnazială","masculine-plural":"gimnaziali","feminine-neuter-plural":"gimnaziale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gimnazial","error-unrecognized-form-feminine-indefinite-singular":"gimnazială","error-unrecognized-form-indefinite-masculine-plural":"gimnaziali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gimnaziale","definite-error-unrecognized-form-masculine-neuter-singular":"gimnazialul","definite-error-unrecognized-form-feminine-singular":"gimnaziala","definite-error-unrecognized-form-masculine-plural":"gimnazialii","definite-error-unrecognized-form-feminine-neuter-plural":"gimnazialele"}},{"word":"gimnaziarh","pos":"noun","definitions":["gymnasiarch; master of a gymnasium"],"forms":{"plural":"gimnaziarhi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnaziarh","accusative-definite-nominative-singular":"gimnaziarhul","accusative-indefinite-nominative-plural":"gimnaziarhi","accusative-definite-nominative-plural":"gimnaziarhii","dative-genitive-indefinite-singular":"gimnaziarh","dative-definite-genitive-singular":"gimnaziarhului","dative-genitive-indefinite-plural":"gimnaziarhi","dative-definite-genitive-plural":"gimnaziarhilor","singular-vocative":"gimnaziarhule","plural-vocative":"gimnaziarhilor"}},{"word":"gimnaziast","pos":"noun","definitions":["middle school student"],"forms":{"plural":"gimnaziaști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnaziast","accusative-definite-nominative-singular":"gimnaziastul","accusative-indefinite-nominative-plural":"gimnaziaști","accusative-definite-nominative-plural":"gimnaziaștii","dative-genitive-indefinite-singular":"gimnaziast","dative-definite-genitive-singular":"gimnaziastului","dative-genitive-indefinite-plural":"gimnaziaști","dative-definite-genitive-plural":"gimnaziaștilor","singular-vocative":"gimnaziastule","plural-vocative":"gimnaziaștilor"}},{"word":"gimnazier","pos":"noun","definitions":["middle school student"],"forms":{"plural":"gimnazieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnazier","accusative-definite-nominative-singular":"gimnazierul","accusative-indefinite-nominative-plural":"gimnazieri","accusative-definite-nominative-plural":"gimnazierii","dative-genitive-indefinite-singular":"gimnazier","dative-definite-genitive-singular":"gimnazierului","dative-genitive-indefinite-plural":"gimnazieri","dative-definite-genitive-plural":"gimnazierilor","singular-vocative":"gimnazierule","plural-vocative":"gimnazierilor"}},{"word":"gimnazist","pos":"noun","definitions":["middle school student"],"forms":{"plural":"gimnaziști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnazist","accusative-definite-nominative-singular":"gimnazistul","accusative-indefinite-nominative-plural":"gimnaziști","accusative-definite-nominative-plural":"gimnaziștii","dative-genitive-indefinite-singular":"gimnazist","dative-definite-genitive-singular":"gimnazistului","dative-genitive-indefinite-plural":"gimnaziști","dative-definite-genitive-plural":"gimnaziștilor","singular-vocative":"gimnazistule","plural-vocative":"gimnaziștilor"}},{"word":"gimnazistă","pos":"noun","definitions":["female equivalent of gimnazist"],"forms":{"plural":"gimnaziste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gimnazistă","accusative-definite-nominative-singular":"gimnazista","accusative-indefinite-nominative-plural":"gimnaziste","accusative-definite-nominative-plural":"gimnazistele","dative-genitive-indefinite-singular":"gimnaziste","dative-definite-genitive-singular":"gimnazistei","dative-genitive-indefinite-plural":"gimnaziste","dative-definite-genitive-plural":"gimnazistelor","singular-vocative":"gimnazistă","plural-vocative":"gimnazistelor"}},{"word":"gimnaziu","pos":"noun","definitions":["gymnasium"],"forms":{"plural":"gimnazii"}},{"word":"gimnic","pos":"adj","definitions":["gymnastic"],"pronunciation":"/ˈd͡ʒim.nik/","forms":{"feminine-singular":"gimnică","masculine-plural":"gimnici","feminine-neuter-plural":"gimnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gimnic","error-unrecognized-form-feminine-indefinite-singular":"gimnică","error-unrecognized-form-indefinite-masculine-plural":"gimnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gimnice","definite-error-unrecognized-form-masculine-neuter-singular":"gimnicul","definite-error-unrecognized-form-feminine-singular":"gimnica","definite-error-unrecognized-form-masculine-plural":"gimnicii","definite-error-unrecognized-form-feminine-neuter-plural":"gimnicele"}},{"word":"gimnofobie","pos":"noun","definitions":["gymnophobia"],"forms":{"plural":"gimnofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gimnofobie","accusative-definite-nominative-singular":"gimnofobia","accusative-indefinite-nominative-plural":"gimnofobii","accusative-definite-nominative-plural":"gimnofobiile","dative-genitive-indefinite-singular":"gimnofobii","dative-definite-genitive-singular":"gimnofobiei","dative-genitive-indefinite-plural":"gimnofobii","dative-definite-genitive-plural":"gimnofobiilor","singular-vocative":"gimnofobie","plural-vocative":"gimnofobiilor"}},{"word":"gimnospermă","pos":"noun","definitions":["gymnosperm"],"forms":{"plural":"gimnosperme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gimnospermă","accusative-definite-nominative-singular":"gimnosperma","accusative-indefinite-nominative-plural":"gimnosperme","accusative-definite-nominative-plural":"gimnospermele","dative-genitive-indefinite-singular":"gimnosperme","dative-definite-genitive-singular":"gimnospermei","dative-genitive-indefinite-plural":"gimnosperme","dative-definite-genitive-plural":"gimnospermelor","singular-vocative":"gimnospermă","plural-vocative":"gimnospermelor"}},{"word":"gimnospor","pos":"noun","definitions":["gymnospore"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gimnospor","accusative-definite-nominative":"gimnosporul","dative-genitive-indefinite":"gimnospor","dative-definite-genitive":"gimnosporului","vocative":"gimnosporule"}},{"word":"gimnot","pos":"noun","definitions":["gymnote"],"forms":{"plural":"gimnoți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnot","accusative-definite-nominative-singular":"gimnotul","accusative-indefinite-nominative-plural":"gimnoți","accusative-definite-nominative-plural":"gimnoții","dative-genitive-indefinite-singular":"gimnot","dative-definite-genitive-singular":"gimnotului","dative-genitive-indefinite-plural":"gimnoți","dative-definite-genitive-plural":"gimnoților","singular-vocative":"gimnotule","plural-vocative":"gimnoților"}},{"word":"gimnozofie","pos":"noun","definitions":["gymnosophy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gimnozofie","accusative-definite-nominative":"gimnozofia","dative-genitive-indefinite":"gimnozofii","dative-definite-genitive":"gimnozofiei","vocative":"gimnozofie"}},{"word":"gimnozofist","pos":"noun","definitions":["gymnosophist"],"forms":{"plural":"gimnozofiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gimnozofist","accusative-definite-nominative-singular":"gimnozofistul","accusative-indefinite-nominative-plural":"gimnozofiști","accusative-definite-nominative-plural":"gimnozofiștii","dative-genitive-indefinite-singular":"gimnozofist","dative-definite-genitive-singular":"gimnozofistului","dative-genitive-indefinite-plural":"gimnozofiști","dative-definite-genitive-plural":"gimnozofiștilor","singular-vocative":"gimnozofistule","plural-vocative":"gimnozofiștilor"}},{"word":"gin","pos":"noun","definitions":["gin"],"forms":{"plural":"ginuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gin","accusative-definite-nominative-singular":"ginul","accusative-indefinite-nominative-plural":"ginuri","accusative-definite-nominative-plural":"ginurile","dative-genitive-indefinite-singular":"gin","dative-definite-genitive-singular":"ginului","dative-genitive-indefinite-plural":"ginuri","dative-definite-genitive-plural":"ginurilor","singular-vocative":"ginule","plural-vocative":"ginurilor"}},{"word":"ginandrie","pos":"noun","definitions":["gynandry"],"forms":{"plural":"ginandrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ginandrie","accusative-definite-nominative-singular":"ginandria","accusative-indefinite-nominative-plural":"ginandrii","accusative-definite-nominative-plural":"ginandriile","dative-genitive-indefinite-singular":"ginandrii","dative-definite-genitive-singular":"ginandriei","dative-genitive-indefinite-plural":"ginandrii","dative-definite-genitive-plural":"ginandriilor","singular-vocative":"ginandrie","plural-vocative":"ginandriilor"}},{"word":"ginandru","pos":"adj","definitions":["gynandrous"],"forms":{"feminine-singular":"ginandră","masculine-plural":"ginandri","feminine-neuter-plural":"ginandre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ginandru","error-unrecognized-form-feminine-indefinite-singular":"ginandră","error-unrecognized-form-indefinite-masculine-plural":"ginandri","error-unrecognized-form-feminine-indefinite-neuter-plural":"ginandre","definite-error-unrecognized-form-masculine-neuter-singular":"ginandrul","definite-error-unrecognized-form-feminine-singular":"ginandra","definite-error-unrecognized-form-masculine-plural":"ginandrii","definite-error-unrecognized-form-feminine-neuter-plural":"ginandrele"}},{"word":"Gîndac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîndac"}},{"word":"Gîndăcel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîndăcel"}},{"word":"Gîndilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîndilă"}},{"word":"Gîndu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîndu"}},{"word":"gineceu","pos":"noun","definitions":["gynoecium (pistils of a flower)"],"forms":{"plural":"ginecee"}},{"word":"ginecocrație","pos":"noun","definitions":["gynecocracy"],"forms":{"plural":"ginecocrații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ginecocrație","accusative-definite-nominative-singular":"ginecocrația","accusative-indefinite-nominative-plural":"ginecocrații","accusative-definite-nominative-plural":"ginecocrațiile","dative-genitive-indefinite-singular":"ginecocrații","dative-definite-genitive-singular":"ginecocrației","dative-genitive-indefinite-plural":"ginecocrații","dative-definite-genitive-plural":"ginecocrațiilor","singular-vocative":"ginecocrație","plural-vocative":"ginecocrațiilor"}},{"word":"ginecofobie","pos":"noun","definitions":["gynecophobia"],"forms":{"plural":"ginecofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ginecofobie","accusative-definite-nominative-singular":"ginecofobia","accusative-indefinite-nominative-plural":"ginecofobii","accusative-definite-nominative-plural":"ginecofobiile","dative-genitive-indefinite-singular":"ginecofobii","dative-definite-genitive-singular":"ginecofobiei","dative-genitive-indefinite-plural":"ginecofobii","dative-definite-genitive-plural":"ginecofobiilor","singular-vocative":"ginecofobie","plural-vocative":"ginecofobiilor"}},{"word":"ginecolog","pos":"noun","definitions":["gynecologist, gynaecologist"],"pronunciation":"/d͡ʒi.ne.koˈloɡ/","forms":{"plural":"ginecologi","feminine":"equivalent ginecologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ginecolog","accusative-definite-nominative-singular":"ginecologul","accusative-indefinite-nominative-plural":"ginecologi","accusative-definite-nominative-plural":"ginecologii","dative-genitive-indefinite-singular":"ginecolog","dative-definite-genitive-singular":"ginecologului","dative-genitive-indefinite-plural":"ginecologi","dative-definite-genitive-plural":"ginecologilor","singular-vocative":"ginecologule","plural-vocative":"ginecologilor"}},{"word":"ginecologa","pos":"noun","definitions":["definite nominative/accusative singular of ginecologă"],"gender":"f"},{"word":"ginecologă","pos":"noun","definitions":["female equivalent of ginecolog"],"pronunciation":"/d͡ʒi.ne.koˈlo.ɡə/","forms":{"plural":"ginecologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"ginecologă","accusative-definite-nominative-singular":"ginecologa","accusative-indefinite-nominative-plural":"ginecologe","accusative-definite-nominative-plural":"ginecologele","dative-genitive-indefinite-singular":"ginecologe","dative-definite-genitive-singular":"ginecologei","dative-genitive-indefinite-plural":"ginecologe","dative-definite-genitive-plural":"ginecologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"ginecologe","pos":"noun","definitions":["plural of ginecologă"],"gender":"f"},{"word":"ginecologi","pos":"noun","definitions":["plural of ginecolog"],"gender":"m"},{"word":"ginecologic","pos":"adj","definitions":["gynaecological"],"forms":{"feminine-singular":"ginecologică","masculine-plural":"ginecologici","feminine-neuter-plural":"ginecologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"ginecologic","error-unrecognized-form-feminine-indefinite-singular":"ginecologică","error-unrecognized-form-indefinite-masculine-plural":"ginecologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"ginecologice","definite-error-unrecognized-form-masculine-neuter-singular":"ginecologicul","definite-error-unrecognized-form-feminine-singular":"ginecologica","definite-error-unrecognized-form-masculine-plural":"ginecologicii","definite-error-unrecognized-form-feminine-neuter-plural":"ginecologicele"}},{"word":"ginecologie","pos":"noun","definitions":["gynecology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ginecologie","accusative-definite-nominative":"ginecologia","dative-genitive-indefinite":"ginecologii","dative-definite-genitive":"ginecologiei","vocative":"ginecologie"}},{"word":"ginecomanie","pos":"noun","definitions":["gynecomania"],"forms":{"plural":"ginecomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ginecomanie","accusative-definite-nominative-singular":"ginecomania","accusative-indefinite-nominative-plural":"ginecomanii","accusative-definite-nominative-plural":"ginecomaniile","dative-genitive-indefinite-singular":"ginecomanii","dative-definite-genitive-singular":"ginecomaniei","dative-genitive-indefinite-plural":"ginecomanii","dative-definite-genitive-plural":"ginecomaniilor","singular-vocative":"ginecomanie","plural-vocative":"ginecomaniilor"}},{"word":"ginecomastie","pos":"noun","definitions":["gynecomasty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ginecomastie","accusative-definite-nominative":"ginecomastia","dative-genitive-indefinite":"ginecomastii","dative-definite-genitive":"ginecomastiei","vocative":"ginecomastie"}},{"word":"ginecopatie","pos":"noun","definitions":["gynecopathy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"ginecopatie","accusative-definite-nominative":"ginecopatia","dative-genitive-indefinite":"ginecopatii","dative-definite-genitive":"ginecopatiei","vocative":"ginecopatie"}},{"word":"gineraș","pos":"noun","definitions":["diminutive of ginere"],"forms":{"plural":"ginerași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gineraș","accusative-definite-nominative-singular":"ginerașul","accusative-indefinite-nominative-plural":"ginerași","accusative-definite-nominative-plural":"ginerașii","dative-genitive-indefinite-singular":"gineraș","dative-definite-genitive-singular":"ginerașului","dative-genitive-indefinite-plural":"ginerași","dative-definite-genitive-plural":"ginerașilor","singular-vocative":"ginerașule","plural-vocative":"ginerașilor"}},{"word":"ginere","pos":"noun","definitions":["son-in-law","bridegroom"],"pronunciation":"/ˈd͡ʒinere/","forms":{"plural":"gineri","feminine":"equivalent noră","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"ginere","accusative-definite-nominative-singular":"ginerele","accusative-indefinite-nominative-plural":"gineri","accusative-definite-nominative-plural":"ginerii","dative-genitive-indefinite-singular":"ginere","dative-definite-genitive-singular":"ginerelui","dative-genitive-indefinite-plural":"gineri","dative-definite-genitive-plural":"ginerilor","singular-vocative":"ginere","plural-vocative":"ginerilor"}},{"word":"ginerel","pos":"noun","definitions":["diminutive of ginere"],"forms":{"plural":"ginerei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ginerel","accusative-definite-nominative-singular":"ginerelul","accusative-indefinite-nominative-plural":"ginerei","accusative-definite-nominative-plural":"ginereii","dative-genitive-indefinite-singular":"ginerel","dative-definite-genitive-singular":"ginerelului","dative-genitive-indefinite-plural":"ginerei","dative-definite-genitive-plural":"ginereilor","singular-vocative":"ginerelule","plural-vocative":"ginereilor"}},{"word":"Ginerica","pos":"name","definitions":["a village in Nicolae Bălcescu, Vâlcea County, Romania"],"gender":"f"},{"word":"ginerică","pos":"noun","definitions":["diminutive of ginere; small bridegroom"],"forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"ginerică","accusative-definite-nominative":"ginerica","dative-genitive-indefinite":"ginerică","dative-definite-genitive":"lui ginerică","vocative":"ginerică"}},{"word":"ginerie","pos":"noun","definitions":["being a son-in-law"],"forms":{"plural":"ginerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"ginerie","accusative-definite-nominative-singular":"gineria","accusative-indefinite-nominative-plural":"ginerii","accusative-definite-nominative-plural":"gineriile","dative-genitive-indefinite-singular":"ginerii","dative-definite-genitive-singular":"gineriei","dative-genitive-indefinite-plural":"ginerii","dative-definite-genitive-plural":"gineriilor","singular-vocative":"ginerie","plural-vocative":"gineriilor"}},{"word":"gineroaică","pos":"noun","definitions":["bride"],"forms":{"plural":"gineroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gineroaică","accusative-definite-nominative-singular":"gineroaica","accusative-indefinite-nominative-plural":"gineroaice","accusative-definite-nominative-plural":"gineroaicele","dative-genitive-indefinite-singular":"gineroaice","dative-definite-genitive-singular":"gineroaicei","dative-genitive-indefinite-plural":"gineroaice","dative-definite-genitive-plural":"gineroaicelor","singular-vocative":"gineroaică","plural-vocative":"gineroaicelor"}},{"word":"ginestră","pos":"noun","definitions":["Genista ovata"],"forms":{"plural":"ginestre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"ginestră","accusative-definite-nominative-singular":"ginestra","accusative-indefinite-nominative-plural":"ginestre","accusative-definite-nominative-plural":"ginestrele","dative-genitive-indefinite-singular":"ginestre","dative-definite-genitive-singular":"ginestrei","dative-genitive-indefinite-plural":"ginestre","dative-definite-genitive-plural":"ginestrelor","singular-vocative":"ginestră","plural-vocative":"ginestrelor"}},{"word":"Gîngă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîngă"}},{"word":"gingaș","pos":"adj","definitions":["tender, delicate, ginger, soft, gentle"],"pronunciation":"/ˈd͡ʒiŋ.ɡaʃ/","forms":{"feminine-singular":"gingașă","masculine-plural":"gingași","feminine-neuter-plural":"gingașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gingaș","error-unrecognized-form-feminine-indefinite-singular":"gingașă","error-unrecognized-form-indefinite-masculine-plural":"gingași","error-unrecognized-form-feminine-indefinite-neuter-plural":"gingașe","definite-error-unrecognized-form-masculine-neuter-singular":"gingașul","definite-error-unrecognized-form-feminine-singular":"gingașa","definite-error-unrecognized-form-masculine-plural":"gingașii","definite-error-unrecognized-form-feminine-neuter-plural":"gingașele"}},{"word":"gingășel","pos":"adj","definitions":["diminutive of gingaș"],"forms":{"feminine-singular":"gingășelă","masculine-plural":"gingășeli","feminine-neuter-plural":"gingășele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gingășel","error-unrecognized-form-feminine-indefinite-singular":"gingășelă","error-unrecognized-form-indefinite-masculine-plural":"gingășeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"gingășele","definite-error-unrecognized-form-masculine-neuter-singular":"gingășelul","definite-error-unrecognized-form-feminine-singular":"gingășela","definite-error-unrecognized-form-masculine-plural":"gingășelii","definite-error-unrecognized-form-feminine-neuter-plural":"gingășelele"}},{"word":"gingășie","pos":"noun","definitions":["tenderness"],"forms":{"plural":"gingășii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gingășie","accusative-definite-nominative-singular":"gingășia","accusative-indefinite-nominative-plural":"gingășii","accusative-definite-nominative-plural":"gingășiile","dative-genitive-indefinite-singular":"gingășii","dative-definite-genitive-singular":"gingășiei","dative-genitive-indefinite-plural":"gingășii","dative-definite-genitive-plural":"gingășiilor","singular-vocative":"gingășie","plural-vocative":"gingășiilor"}},{"word":"gingășime","pos":"noun","definitions":["tenderness"],"forms":{"plural":"gingășimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gingășime","accusative-definite-nominative-singular":"gingășimea","accusative-indefinite-nominative-plural":"gingășimi","accusative-definite-nominative-plural":"gingășimile","dative-genitive-indefinite-singular":"gingășimi","dative-definite-genitive-singular":"gingășimii","dative-genitive-indefinite-plural":"gingășimi","dative-definite-genitive-plural":"gingășimilor","singular-vocative":"gingășime","plural-vocative":"gingășimilor"}},{"word":"gingășitură","pos":"noun","definitions":["pampering"],"forms":{"plural":"gingășituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gingășitură","accusative-definite-nominative-singular":"gingășitura","accusative-indefinite-nominative-plural":"gingășituri","accusative-definite-nominative-plural":"gingășiturile","dative-genitive-indefinite-singular":"gingășituri","dative-definite-genitive-singular":"gingășiturii","dative-genitive-indefinite-plural":"gingășituri","dative-definite-genitive-plural":"gingășiturilor","singular-vocative":"gingășitură","plural-vocative":"gingășiturilor"}},{"word":"Gingașu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gingașu"}},{"word":"gingenă","pos":"noun","definitions":["alternative form of gingie"],"forms":{"plural":"gingeni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gingenă","accusative-definite-nominative-singular":"gingena","accusative-indefinite-nominative-plural":"gingeni","accusative-definite-nominative-plural":"gingenile","dative-genitive-indefinite-singular":"gingeni","dative-definite-genitive-singular":"gingenii","dative-genitive-indefinite-plural":"gingeni","dative-definite-genitive-plural":"gingenilor","singular-vocative":"gingenă","plural-vocative":"gingenilor"}},{"word":"Ginghis Han","pos":"name","definitions":["Genghis Khan"],"gender":"m"},{"word":"gingie","pos":"noun","definitions":["gum (flesh around teeth)"],"forms":{"plural":"gingii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gingie","accusative-definite-nominative-singular":"gingia","accusative-indefinite-nominative-plural":"gingii","accusative-definite-nominative-plural":"gingiile","dative-genitive-indefinite-singular":"gingii","dative-definite-genitive-singular":"gingiei","dative-genitive-indefinite-plural":"gingii","dative-definite-genitive-plural":"gingiilor","singular-vocative":"gingie","plural-vocative":"gingiilor"}},{"word":"gingiea","pos":"noun","definitions":["diminutive of gingie"],"forms":{"plural":"gingiele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gingiea","accusative-definite-nominative-singular":"gingieaua","accusative-indefinite-nominative-plural":"gingiele","accusative-definite-nominative-plural":"gingielele","dative-genitive-indefinite-singular":"gingiele","dative-definite-genitive-singular":"gingielei","dative-genitive-indefinite-plural":"gingiele","dative-definite-genitive-plural":"gingielelor","singular-vocative":"gingiea","plural-vocative":"gingielelor"}},{"word":"gingină","pos":"noun","definitions":["alternative form of gingie"],"forms":{"plural":"gingini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gingină","accusative-definite-nominative-singular":"gingina","accusative-indefinite-nominative-plural":"gingini","accusative-definite-nominative-plural":"ginginile","dative-genitive-indefinite-singular":"gingini","dative-definite-genitive-singular":"ginginii","dative-genitive-indefinite-plural":"gingini","dative-definite-genitive-plural":"ginginilor","singular-vocative":"gingină","plural-vocative":"ginginilor"}},{"word":"gingioară","pos":"noun","definitions":["diminutive of gingie"],"forms":{"plural":"gingioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gingioară","accusative-definite-nominative-singular":"gingioara","accusative-indefinite-nominative-plural":"gingioare","accusative-definite-nominative-plural":"gingioarele","dative-genitive-indefinite-singular":"gingioare","dative-definite-genitive-singular":"gingioarei","dative-genitive-indefinite-plural":"gingioare","dative-definite-genitive-plural":"gingioarelor","singular-vocative":"gingioară","plural-vocative":"gingioarelor"}},{"word":"gingirică","pos":"noun","definitions":["Black Sea sprat (Clupeonella cultriventris)"],"forms":{"plural":"gingirici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gingirică","accusative-definite-nominative-singular":"gingirica","accusative-indefinite-nominative-plural":"gingirici","accusative-definite-nominative-plural":"gingiricile","dative-genitive-indefinite-singular":"gingirici","dative-definite-genitive-singular":"gingiricii","dative-genitive-indefinite-plural":"gingirici","dative-definite-genitive-plural":"gingiricilor","singular-vocative":"gingirică","plural-vocative":"gingiricilor"}},{"word":"gingival","pos":"adj","definitions":["gingival"],"forms":{"feminine-singular":"gingivală","masculine-plural":"gingivali","feminine-neuter-plural":"gingivale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gingival","error-unrecognized-form-feminine-indefinite-singular":"gingivală","error-unrecognized-form-indefinite-masculine-plural":"gingivali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gingivale","definite-error-unrecognized-form-masculine-neuter-singular":"gingivalul","definite-error-unrecognized-form-feminine-singular":"gingivala","definite-error-unrecognized-form-masculine-plural":"gingivalii","definite-error-unrecognized-form-feminine-neuter-plural":"gingivalele"}},{"word":"gingivectomie","pos":"noun","definitions":["gingivectomy"],"forms":{"plural":"gingivectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gingivectomie","accusative-definite-nominative-singular":"gingivectomia","accusative-indefinite-nominative-plural":"gingivectomii","accusative-definite-nominative-plural":"gingivectomiile","dative-genitive-indefinite-singular":"gingivectomii","dative-definite-genitive-singular":"gingivectomiei","dative-genitive-indefinite-plural":"gingivectomii","dative-definite-genitive-plural":"gingivectomiilor","singular-vocative":"gingivectomie","plural-vocative":"gingivectomiilor"}},{"word":"gingivită","pos":"noun","definitions":["gingivitis"],"forms":{"plural":"gingivite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gingivită","accusative-definite-nominative-singular":"gingivita","accusative-indefinite-nominative-plural":"gingivite","accusative-definite-nominative-plural":"gingivitele","dative-genitive-indefinite-singular":"gingivite","dative-definite-genitive-singular":"gingivitei","dative-genitive-indefinite-plural":"gingivite","dative-definite-genitive-plural":"gingivitelor","singular-vocative":"gingivită","plural-vocative":"gingivitelor"}},{"word":"gingivoragie","pos":"noun","definitions":["gingivorrhagia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gingivoragie","accusative-definite-nominative":"gingivoragia","dative-genitive-indefinite":"gingivoragii","dative-definite-genitive":"gingivoragiei","vocative":"gingivoragie"}},{"word":"ginglim","pos":"noun","definitions":["ginglymus"],"forms":{"plural":"ginglimuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"ginglim","accusative-definite-nominative-singular":"ginglimul","accusative-indefinite-nominative-plural":"ginglimuri","accusative-definite-nominative-plural":"ginglimurile","dative-genitive-indefinite-singular":"ginglim","dative-definite-genitive-singular":"ginglimului","dative-genitive-indefinite-plural":"ginglimuri","dative-definite-genitive-plural":"ginglimurilor","singular-vocative":"ginglimule","plural-vocative":"ginglimurilor"}},{"word":"gini","pos":"verb","definitions":["to notice, to glimpse"],"forms":{"canonical":"a gini 4th conjugation","present-singular-third-person":"ginește","participle-past":"ginit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gini","gerund":"ginind","first-person-indicative-present-singular":"ginesc","indicative-present-second-person-singular":"ginești","indicative-present-singular-third-person":"ginește","first-person-indicative-plural-present":"ginim","indicative-plural-present-second-person":"giniți","indicative-plural-present-third-person":"ginesc","first-person-imperfect-indicative-singular":"gineam","imperfect-indicative-second-person-singular":"gineai","imperfect-indicative-singular-third-person":"ginea","first-person-imperfect-indicative-plural":"gineam","imperfect-indicative-plural-second-person":"gineați","imperfect-indicative-plural-third-person":"gineau","first-person-indicative-perfect-singular":"ginii","indicative-perfect-second-person-singular":"giniși","indicative-perfect-singular-third-person":"gini","first-person-indicative-perfect-plural":"ginirăm","indicative-perfect-plural-second-person":"ginirăți","indicative-perfect-plural-third-person":"giniră","first-person-indicative-pluperfect-singular":"ginisem","indicative-pluperfect-second-person-singular":"giniseși","indicative-pluperfect-singular-third-person":"ginise","first-person-indicative-pluperfect-plural":"giniserăm","indicative-pluperfect-plural-second-person":"giniserăți","indicative-pluperfect-plural-third-person":"giniseră","first-person-present-singular-subjunctive":"să ginesc","present-second-person-singular-subjunctive":"să ginești","present-singular-subjunctive-third-person":"să ginească","first-person-plural-present-subjunctive":"să ginim","plural-present-second-person-subjunctive":"să giniți","plural-present-subjunctive-third-person":"să ginească","imperative-second-person-singular":"ginește","imperative-plural-second-person":"giniți","imperative-negative-second-person-singular":"nu gini","imperative-negative-plural-second-person":"nu giniți"}},{"word":"ginire","pos":"noun","definitions":["glimpse"],"forms":{"plural":"giniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"ginire","accusative-definite-nominative-singular":"ginirea","accusative-indefinite-nominative-plural":"giniri","accusative-definite-nominative-plural":"ginirile","dative-genitive-indefinite-singular":"giniri","dative-definite-genitive-singular":"ginirii","dative-genitive-indefinite-plural":"giniri","dative-definite-genitive-plural":"ginirilor","singular-vocative":"ginire","plural-vocative":"ginirilor"}},{"word":"ginkgo","pos":"noun","definitions":["ginkgo"],"forms":{"plural":"ginkgo","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"ginkgo","accusative-definite-nominative-singular":"ginkgoul","accusative-indefinite-nominative-plural":"ginkgo","accusative-definite-nominative-plural":"ginkgoi","dative-genitive-indefinite-singular":"ginkgo","dative-definite-genitive-singular":"ginkgoului","dative-genitive-indefinite-plural":"ginkgo","dative-definite-genitive-plural":"ginkgolor","singular-vocative":"ginkgoule","plural-vocative":"ginkgolor"}},{"word":"ginofor","pos":"noun","definitions":["gynophore"],"forms":{"plural":"ginofore","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"ginofor","accusative-definite-nominative-singular":"ginoforul","accusative-indefinite-nominative-plural":"ginofore","accusative-definite-nominative-plural":"ginoforele","dative-genitive-indefinite-singular":"ginofor","dative-definite-genitive-singular":"ginoforului","dative-genitive-indefinite-plural":"ginofore","dative-definite-genitive-plural":"ginoforelor","singular-vocative":"ginoforule","plural-vocative":"ginoforelor"}},{"word":"Gînsac","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gînsac"}},{"word":"ginseng","pos":"noun","definitions":["ginseng"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"ginseng","accusative-definite-nominative":"ginsengul","dative-genitive-indefinite":"ginseng","dative-definite-genitive":"ginsengului","vocative":"ginsengule"}},{"word":"gint","pos":"noun","definitions":["people, folk, nation"],"examples":[{"ro":"ꙟ҆мпъръ́цїѧта̀,ꙟ҆пъръцїѧта̀,ꙟ҆нᲅоа҆тевѣкᲂуре́ле,шивлъдъчїѧта̀.ꙟ҆нᲅоа҆теџинᲅꙋре́лешиџи́нᲅᲂуре","en":"Thy kingdom, thy kingdom is for all eternity, and your reign is in all nations and nations."}],"forms":{"plural":"ginturi"}},{"word":"Ginta","pos":"name","definitions":["a village in Căpâlna, Bihor County, Romania"],"gender":"f"},{"word":"ginta","pos":"noun","definitions":["definite nominative/accusative singular of gintă"],"pronunciation":"[ˈɡinta]","gender":"f"},{"word":"gintă","pos":"noun","definitions":["kindred, kin, tribe","race","origin","people"],"forms":{"plural":"ginți"}},{"word":"gioavlă","pos":"noun","definitions":["mud"],"forms":{"plural":"gioavle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gioavlă","accusative-definite-nominative-singular":"gioavla","accusative-indefinite-nominative-plural":"gioavle","accusative-definite-nominative-plural":"gioavlele","dative-genitive-indefinite-singular":"gioavle","dative-definite-genitive-singular":"gioavlei","dative-genitive-indefinite-plural":"gioavle","dative-definite-genitive-plural":"gioavlelor","singular-vocative":"gioavlă","plural-vocative":"gioavlelor"}},{"word":"giobertit","pos":"noun","definitions":["giobertite"],"forms":{"plural":"giobertite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giobertit","accusative-definite-nominative-singular":"giobertitul","accusative-indefinite-nominative-plural":"giobertite","accusative-definite-nominative-plural":"giobertitele","dative-genitive-indefinite-singular":"giobertit","dative-definite-genitive-singular":"giobertitului","dative-genitive-indefinite-plural":"giobertite","dative-definite-genitive-plural":"giobertitelor","singular-vocative":"giobertitule","plural-vocative":"giobertitelor"}},{"word":"giocoso","pos":"adv","definitions":["giocoso"]},{"word":"giolar","pos":"noun","definitions":["knucklebones player"],"forms":{"plural":"giolari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giolar","accusative-definite-nominative-singular":"giolarul","accusative-indefinite-nominative-plural":"giolari","accusative-definite-nominative-plural":"giolarii","dative-genitive-indefinite-singular":"giolar","dative-definite-genitive-singular":"giolarului","dative-genitive-indefinite-plural":"giolari","dative-definite-genitive-plural":"giolarilor","singular-vocative":"giolarule","plural-vocative":"giolarilor"}},{"word":"gionat","pos":"noun","definitions":["human leg"],"forms":{"plural":"gionate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gionat","accusative-definite-nominative-singular":"gionatul","accusative-indefinite-nominative-plural":"gionate","accusative-definite-nominative-plural":"gionatele","dative-genitive-indefinite-singular":"gionat","dative-definite-genitive-singular":"gionatului","dative-genitive-indefinite-plural":"gionate","dative-definite-genitive-plural":"gionatelor","singular-vocative":"gionatule","plural-vocative":"gionatelor"}},{"word":"Giorocianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giorocianu"}},{"word":"Giorocuta","pos":"name","definitions":["a village in Supur, Satu Mare County, Romania"],"gender":"f"},{"word":"Gioseni","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Gioseni, Bacău County, Romania"],"gender":"m"},{"word":"gipaet","pos":"noun","definitions":["lammergeier"],"forms":{"plural":"gipaeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gipaet","accusative-definite-nominative-singular":"gipaetul","accusative-indefinite-nominative-plural":"gipaeți","accusative-definite-nominative-plural":"gipaeții","dative-genitive-indefinite-singular":"gipaet","dative-definite-genitive-singular":"gipaetului","dative-genitive-indefinite-plural":"gipaeți","dative-definite-genitive-plural":"gipaeților","singular-vocative":"gipaetule","plural-vocative":"gipaeților"}},{"word":"gips","pos":"noun","definitions":["gypsum"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gips","accusative-definite-nominative":"gipsul","dative-genitive-indefinite":"gips","dative-definite-genitive":"gipsului","vocative":"gipsule","alternative":"ghips"}},{"word":"gipsofilă","pos":"noun","definitions":["gypsophile"],"forms":{"plural":"gipsofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gipsofilă","accusative-definite-nominative-singular":"gipsofila","accusative-indefinite-nominative-plural":"gipsofile","accusative-definite-nominative-plural":"gipsofilele","dative-genitive-indefinite-singular":"gipsofile","dative-definite-genitive-singular":"gipsofilei","dative-genitive-indefinite-plural":"gipsofile","dative-definite-genitive-plural":"gipsofilelor","singular-vocative":"gipsofilă","plural-vocative":"gipsofilelor"}},{"word":"gipsotecă","pos":"noun","definitions":["alternative form of ghipsotecă"],"forms":{"plural":"gipsoteci"}},{"word":"gira","pos":"verb","definitions":["alternative form of gera"],"forms":{"canonical":"a gira 1st conjugation","present-singular-third-person":"girează","participle-past":"girat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gira","gerund":"girând","first-person-indicative-present-singular":"girez","indicative-present-second-person-singular":"girezi","indicative-present-singular-third-person":"girează","first-person-indicative-plural-present":"girăm","indicative-plural-present-second-person":"girați","indicative-plural-present-third-person":"girează","first-person-imperfect-indicative-singular":"giram","imperfect-indicative-second-person-singular":"girai","imperfect-indicative-singular-third-person":"gira","first-person-imperfect-indicative-plural":"giram","imperfect-indicative-plural-second-person":"girați","imperfect-indicative-plural-third-person":"girau","first-person-indicative-perfect-singular":"girai","indicative-perfect-second-person-singular":"girași","indicative-perfect-singular-third-person":"giră","first-person-indicative-perfect-plural":"girarăm","indicative-perfect-plural-second-person":"girarăți","indicative-perfect-plural-third-person":"girară","first-person-indicative-pluperfect-singular":"girasem","indicative-pluperfect-second-person-singular":"giraseși","indicative-pluperfect-singular-third-person":"girase","first-person-indicative-pluperfect-plural":"giraserăm","indicative-pluperfect-plural-second-person":"giraserăți","indicative-pluperfect-plural-third-person":"giraseră","first-person-present-singular-subjunctive":"să girez","present-second-person-singular-subjunctive":"să girezi","present-singular-subjunctive-third-person":"să gireze","first-person-plural-present-subjunctive":"să girăm","plural-present-second-person-subjunctive":"să girați","plural-present-subjunctive-third-person":"să gireze","imperative-second-person-singular":"girează","imperative-plural-second-person":"girați","imperative-negative-second-person-singular":"nu gira","imperative-negative-plural-second-person":"nu girați"}},{"word":"girafa","pos":"noun","definitions":["definite nominative singular of girafă"],"pronunciation":"/d͡ʒiˈrafa/","gender":"f"},{"word":"girafă","pos":"noun","definitions":["giraffe"],"pronunciation":"/d͡ʒiˈra.fə/","forms":{"plural":"girafe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"girafă","accusative-definite-nominative-singular":"girafa","accusative-indefinite-nominative-plural":"girafe","accusative-definite-nominative-plural":"girafele","dative-genitive-indefinite-singular":"girafe","dative-definite-genitive-singular":"girafei","dative-genitive-indefinite-plural":"girafe","dative-definite-genitive-plural":"girafelor","singular-vocative":"girafă","plural-vocative":"girafelor"}},{"word":"girafe","pos":"noun","definitions":["inflection of girafă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"/d͡ʒiˈra.fe/"},{"word":"girandolă","pos":"noun","definitions":["girandole"],"forms":{"plural":"girandole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"girandolă","accusative-definite-nominative-singular":"girandola","accusative-indefinite-nominative-plural":"girandole","accusative-definite-nominative-plural":"girandolele","dative-genitive-indefinite-singular":"girandole","dative-definite-genitive-singular":"girandolei","dative-genitive-indefinite-plural":"girandole","dative-definite-genitive-plural":"girandolelor","singular-vocative":"girandolă","plural-vocative":"girandolelor"}},{"word":"girant","pos":"noun","definitions":["alternative form of gerant"],"forms":{"plural":"giranți"}},{"word":"girație","pos":"noun","definitions":["gyration"],"forms":{"plural":"girații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"girație","accusative-definite-nominative-singular":"girația","accusative-indefinite-nominative-plural":"girații","accusative-definite-nominative-plural":"girațiile","dative-genitive-indefinite-singular":"girații","dative-definite-genitive-singular":"girației","dative-genitive-indefinite-plural":"girații","dative-definite-genitive-plural":"girațiilor","singular-vocative":"girație","plural-vocative":"girațiilor"}},{"word":"giratoriu","pos":"adj","definitions":["gyratory"],"forms":{"feminine-singular":"giratorie","plural":"giratorii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"giratoriu","error-unrecognized-form-feminine-indefinite-singular":"giratorie","error-unrecognized-form-indefinite-masculine-plural":"giratorii","error-unrecognized-form-feminine-indefinite-neuter-plural":"giratorii","definite-error-unrecognized-form-masculine-neuter-singular":"giratoriul","definite-error-unrecognized-form-feminine-singular":"giratoria","definite-error-unrecognized-form-masculine-plural":"giratoriii","definite-error-unrecognized-form-feminine-neuter-plural":"giratoriile"}},{"word":"Gîrbov","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrbov"}},{"word":"Gîrbova","pos":"name","definitions":["a village in Gîrbova, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"f"},{"word":"Gîrbovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gîrbovan"}},{"word":"Gîrboveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gîrboveanu"}},{"word":"Gîrbu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrbu"}},{"word":"Gîrbuleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrbuleț"}},{"word":"Gireadă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gireadă"}},{"word":"girez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of gira"]},{"word":"Girgiuveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Girgiuveanu"}},{"word":"Girișu de Criș","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Girișu de Criș, Bihor County, Romania"],"gender":"m"},{"word":"Girișu Negru","pos":"name","definitions":["a village in Tinca, Bihor County, Romania"],"gender":"m"},{"word":"Gîrlă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrlă"}},{"word":"Gîrleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gîrleanu"}},{"word":"Gîrleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gîrleșteanu"}},{"word":"Gîrliță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrliță"}},{"word":"Gîrloiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gîrloiu"}},{"word":"Gîrneață","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrneață"}},{"word":"Gîrneț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrneț"}},{"word":"Gîrniță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîrniță"}},{"word":"girobusolă","pos":"noun","definitions":["gyrocompass"],"forms":{"plural":"girobusole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"girobusolă","accusative-definite-nominative-singular":"girobusola","accusative-indefinite-nominative-plural":"girobusole","accusative-definite-nominative-plural":"girobusolele","dative-genitive-indefinite-singular":"girobusole","dative-definite-genitive-singular":"girobusolei","dative-genitive-indefinite-plural":"girobusole","dative-definite-genitive-plural":"girobusolelor","singular-vocative":"girobusolă","plural-vocative":"girobusolelor"}},{"word":"Giroc","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Giroc, Timiș County, Romania"],"gender":"m"},{"word":"giroclinometru","pos":"noun","definitions":["gyroclinometer"],"forms":{"plural":"giroclinometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giroclinometru","accusative-definite-nominative-singular":"giroclinometrul","accusative-indefinite-nominative-plural":"giroclinometre","accusative-definite-nominative-plural":"giroclinometrele","dative-genitive-indefinite-singular":"giroclinometru","dative-definite-genitive-singular":"giroclinometrului","dative-genitive-indefinite-plural":"giroclinometre","dative-definite-genitive-plural":"giroclinometrelor","singular-vocative":"giroclinometrule","plural-vocative":"giroclinometrelor"}},{"word":"girocompas","pos":"noun","definitions":["gyrocompass"],"forms":{"plural":"girocompase","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"girocompas","accusative-definite-nominative-singular":"girocompasul","accusative-indefinite-nominative-plural":"girocompase","accusative-definite-nominative-plural":"girocompasele","dative-genitive-indefinite-singular":"girocompas","dative-definite-genitive-singular":"girocompasului","dative-genitive-indefinite-plural":"girocompase","dative-definite-genitive-plural":"girocompaselor","singular-vocative":"girocompasule","plural-vocative":"girocompaselor"}},{"word":"girodină","pos":"noun","definitions":["girodine"],"forms":{"plural":"girodine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"girodină","accusative-definite-nominative-singular":"girodina","accusative-indefinite-nominative-plural":"girodine","accusative-definite-nominative-plural":"girodinele","dative-genitive-indefinite-singular":"girodine","dative-definite-genitive-singular":"girodinei","dative-genitive-indefinite-plural":"girodine","dative-definite-genitive-plural":"girodinelor","singular-vocative":"girodină","plural-vocative":"girodinelor"}},{"word":"girodirecțional","pos":"noun","definitions":["directional gyro"],"forms":{"plural":"girodirecționale","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"girodirecțional","accusative-definite-nominative-singular":"girodirecționalul","accusative-indefinite-nominative-plural":"girodirecționale","accusative-definite-nominative-plural":"girodirecționalele","dative-genitive-indefinite-singular":"girodirecțional","dative-definite-genitive-singular":"girodirecționalului","dative-genitive-indefinite-plural":"girodirecționale","dative-definite-genitive-plural":"girodirecționalelor","singular-vocative":"girodirecționalule","plural-vocative":"girodirecționalelor"}},{"word":"giromanție","pos":"noun","definitions":["gyromancy"],"forms":{"plural":"giromanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"giromanție","accusative-definite-nominative-singular":"giromanția","accusative-indefinite-nominative-plural":"giromanții","accusative-definite-nominative-plural":"giromanțiile","dative-genitive-indefinite-singular":"giromanții","dative-definite-genitive-singular":"giromanției","dative-genitive-indefinite-plural":"giromanții","dative-definite-genitive-plural":"giromanțiilor","singular-vocative":"giromanție","plural-vocative":"giromanțiilor"}},{"word":"girometru","pos":"noun","definitions":["gyrometer"],"forms":{"plural":"girometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"girometru","accusative-definite-nominative-singular":"girometrul","accusative-indefinite-nominative-plural":"girometre","accusative-definite-nominative-plural":"girometrele","dative-genitive-indefinite-singular":"girometru","dative-definite-genitive-singular":"girometrului","dative-genitive-indefinite-plural":"girometre","dative-definite-genitive-plural":"girometrelor","singular-vocative":"girometrule","plural-vocative":"girometrelor"}},{"word":"girondin","pos":"noun","definitions":["Girondin"],"forms":{"plural":"girondini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"girondin","accusative-definite-nominative-singular":"girondinul","accusative-indefinite-nominative-plural":"girondini","accusative-definite-nominative-plural":"girondinii","dative-genitive-indefinite-singular":"girondin","dative-definite-genitive-singular":"girondinului","dative-genitive-indefinite-plural":"girondini","dative-definite-genitive-plural":"girondinilor","singular-vocative":"girondinule","plural-vocative":"girondinilor"}},{"word":"giroorizont","pos":"noun","definitions":["gyro horizon"],"forms":{"plural":"giroorizonturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giroorizont","accusative-definite-nominative-singular":"giroorizontul","accusative-indefinite-nominative-plural":"giroorizonturi","accusative-definite-nominative-plural":"giroorizonturile","dative-genitive-indefinite-singular":"giroorizont","dative-definite-genitive-singular":"giroorizontului","dative-genitive-indefinite-plural":"giroorizonturi","dative-definite-genitive-plural":"giroorizonturilor","singular-vocative":"giroorizontule","plural-vocative":"giroorizonturilor"}},{"word":"giropilot","pos":"noun","definitions":["autopilot"],"forms":{"plural":"giropiloți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giropilot","accusative-definite-nominative-singular":"giropilotul","accusative-indefinite-nominative-plural":"giropiloți","accusative-definite-nominative-plural":"giropiloții","dative-genitive-indefinite-singular":"giropilot","dative-definite-genitive-singular":"giropilotului","dative-genitive-indefinite-plural":"giropiloți","dative-definite-genitive-plural":"giropiloților","singular-vocative":"giropilotule","plural-vocative":"giropiloților"}},{"word":"giroplan","pos":"noun","definitions":["gyroplane"],"forms":{"plural":"giroplane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giroplan","accusative-definite-nominative-singular":"giroplanul","accusative-indefinite-nominative-plural":"giroplane","accusative-definite-nominative-plural":"giroplanele","dative-genitive-indefinite-singular":"giroplan","dative-definite-genitive-singular":"giroplanului","dative-genitive-indefinite-plural":"giroplane","dative-definite-genitive-plural":"giroplanelor","singular-vocative":"giroplanule","plural-vocative":"giroplanelor"}},{"word":"giroscop","pos":"noun","definitions":["gyroscope"],"forms":{"plural":"giroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giroscop","accusative-definite-nominative-singular":"giroscopul","accusative-indefinite-nominative-plural":"giroscoape","accusative-definite-nominative-plural":"giroscoapele","dative-genitive-indefinite-singular":"giroscop","dative-definite-genitive-singular":"giroscopului","dative-genitive-indefinite-plural":"giroscoape","dative-definite-genitive-plural":"giroscoapelor","singular-vocative":"giroscopule","plural-vocative":"giroscoapelor"}},{"word":"giroscopic","pos":"adj","definitions":["gyroscopic"],"forms":{"feminine-singular":"giroscopică","masculine-plural":"giroscopici","feminine-neuter-plural":"giroscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"giroscopic","error-unrecognized-form-feminine-indefinite-singular":"giroscopică","error-unrecognized-form-indefinite-masculine-plural":"giroscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"giroscopice","definite-error-unrecognized-form-masculine-neuter-singular":"giroscopicul","definite-error-unrecognized-form-feminine-singular":"giroscopica","definite-error-unrecognized-form-masculine-plural":"giroscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"giroscopicele"}},{"word":"girostat","pos":"noun","definitions":["gyrostat"],"forms":{"plural":"girostaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"girostat","accusative-definite-nominative-singular":"girostatul","accusative-indefinite-nominative-plural":"girostaturi","accusative-definite-nominative-plural":"girostaturile","dative-genitive-indefinite-singular":"girostat","dative-definite-genitive-singular":"girostatului","dative-genitive-indefinite-plural":"girostaturi","dative-definite-genitive-plural":"girostaturilor","singular-vocative":"girostatule","plural-vocative":"girostaturilor"}},{"word":"girostatic","pos":"adj","definitions":["gyrostatic"],"forms":{"feminine-singular":"girostatică","masculine-plural":"girostatici","feminine-neuter-plural":"girostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"girostatic","error-unrecognized-form-feminine-indefinite-singular":"girostatică","error-unrecognized-form-indefinite-masculine-plural":"girostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"girostatice","definite-error-unrecognized-form-masculine-neuter-singular":"girostaticul","definite-error-unrecognized-form-feminine-singular":"girostatica","definite-error-unrecognized-form-masculine-plural":"girostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"girostaticele"}},{"word":"giruetă","pos":"noun","definitions":["weather vane, weathercock"],"pronunciation":"/d͡ʒi.ruˈe.tə/","forms":{"plural":"giruete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giruetă","accusative-definite-nominative-singular":"girueta","accusative-indefinite-nominative-plural":"giruete","accusative-definite-nominative-plural":"giruetele","dative-genitive-indefinite-singular":"giruete","dative-definite-genitive-singular":"giruetei","dative-genitive-indefinite-plural":"giruete","dative-definite-genitive-plural":"giruetelor","singular-vocative":"giruetă","plural-vocative":"giruetelor"}},{"word":"girus","pos":"noun","definitions":["gyrus"],"forms":{"plural":"girusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"girus","accusative-definite-nominative-singular":"girusul","accusative-indefinite-nominative-plural":"girusuri","accusative-definite-nominative-plural":"girusurile","dative-genitive-indefinite-singular":"girus","dative-definite-genitive-singular":"girusului","dative-genitive-indefinite-plural":"girusuri","dative-definite-genitive-plural":"girusurilor","singular-vocative":"girusule","plural-vocative":"girusurilor"}},{"word":"Gîsca","pos":"name","definitions":["a village in Gîsca, Căușeni Raion, Moldova","a commune of Căușeni Raion, Moldova"],"gender":"f"},{"word":"Gîscă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîscă"}},{"word":"Gîscan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîscan"}},{"word":"Gîștescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gîștescu"}},{"word":"gitană","pos":"noun","definitions":["gypsy"],"forms":{"plural":"gitane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gitană","accusative-definite-nominative-singular":"gitana","accusative-indefinite-nominative-plural":"gitane","accusative-definite-nominative-plural":"gitanele","dative-genitive-indefinite-singular":"gitane","dative-definite-genitive-singular":"gitanei","dative-genitive-indefinite-plural":"gitane","dative-definite-genitive-plural":"gitanelor","singular-vocative":"gitană","plural-vocative":"gitanelor"}},{"word":"Gîtlan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîtlan"}},{"word":"Gîtu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîtu"}},{"word":"giubea","pos":"noun","definitions":["robe"],"forms":{"plural":"giubele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"giubea","accusative-definite-nominative-singular":"giubeaua","accusative-indefinite-nominative-plural":"giubele","accusative-definite-nominative-plural":"giubelele","dative-genitive-indefinite-singular":"giubele","dative-definite-genitive-singular":"giubelei","dative-genitive-indefinite-plural":"giubele","dative-definite-genitive-plural":"giubelelor","singular-vocative":"giubea","plural-vocative":"giubelelor"}},{"word":"Giubegeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giubegeanu"}},{"word":"giubeliu","pos":"noun","definitions":["robe-wearing boyar","an old-fashioned, retrograde, conservative person"],"forms":{"plural":"giubelii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giubeliu","accusative-definite-nominative-singular":"giubeliuul","accusative-indefinite-nominative-plural":"giubelii","accusative-definite-nominative-plural":"giubeliii","dative-genitive-indefinite-singular":"giubeliu","dative-definite-genitive-singular":"giubeliuului","dative-genitive-indefinite-plural":"giubelii","dative-definite-genitive-plural":"giubeliilor","singular-vocative":"giubeliuule","plural-vocative":"giubeliilor"}},{"word":"giubelușă","pos":"noun","definitions":["diminutive of giubea"],"forms":{"plural":"giubelușe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giubelușă","accusative-definite-nominative-singular":"giubelușa","accusative-indefinite-nominative-plural":"giubelușe","accusative-definite-nominative-plural":"giubelușele","dative-genitive-indefinite-singular":"giubelușe","dative-definite-genitive-singular":"giubelușei","dative-genitive-indefinite-plural":"giubelușe","dative-definite-genitive-plural":"giubelușelor","singular-vocative":"giubelușă","plural-vocative":"giubelușelor"}},{"word":"giubeluță","pos":"noun","definitions":["diminutive of giubea"],"forms":{"plural":"giubeluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giubeluță","accusative-definite-nominative-singular":"giubeluța","accusative-indefinite-nominative-plural":"giubeluțe","accusative-definite-nominative-plural":"giubeluțele","dative-genitive-indefinite-singular":"giubeluțe","dative-definite-genitive-singular":"giubeluței","dative-genitive-indefinite-plural":"giubeluțe","dative-definite-genitive-plural":"giubeluțelor","singular-vocative":"giubeluță","plural-vocative":"giubeluțelor"}},{"word":"giuben","pos":"noun","definitions":["obsolete form of joben"],"forms":{"plural":"giubene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giuben","accusative-definite-nominative-singular":"giubenul","accusative-indefinite-nominative-plural":"giubene","accusative-definite-nominative-plural":"giubenele","dative-genitive-indefinite-singular":"giuben","dative-definite-genitive-singular":"giubenului","dative-genitive-indefinite-plural":"giubene","dative-definite-genitive-plural":"giubenelor","singular-vocative":"giubenule","plural-vocative":"giubenelor"}},{"word":"Giuchici","pos":"name","definitions":["a surname from Serbo-Croatian"],"gender":"m","forms":{"dative-genitive":"lui Giuchici"}},{"word":"Giuclani","pos":"name","definitions":["a village in Ciomăgești, Argeș County, Romania"],"gender":"m"},{"word":"giudea","pos":"noun","definitions":["spear"],"forms":{"plural":"giudele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"giudea","accusative-definite-nominative-singular":"giudeaua","accusative-indefinite-nominative-plural":"giudele","accusative-definite-nominative-plural":"giudelele","dative-genitive-indefinite-singular":"giudele","dative-definite-genitive-singular":"giudelei","dative-genitive-indefinite-plural":"giudele","dative-definite-genitive-plural":"giudelelor","singular-vocative":"giudea","plural-vocative":"giudelelor"}},{"word":"giudecată","pos":"noun","definitions":["obsolete form of judecată"],"forms":{"plural":"giudecăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giudecată","accusative-definite-nominative-singular":"giudecata","accusative-indefinite-nominative-plural":"giudecățe","accusative-definite-nominative-plural":"giudecățele","dative-genitive-indefinite-singular":"giudecățe","dative-definite-genitive-singular":"giudecăței","dative-genitive-indefinite-plural":"giudecățe","dative-definite-genitive-plural":"giudecățelor","singular-vocative":"giudecată","plural-vocative":"giudecățelor"}},{"word":"giudecătoare","pos":"noun","definitions":["obsolete form of judecătoare"],"forms":{"plural":"giudecătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"giudecătoare","accusative-definite-nominative-singular":"giudecătoarea","accusative-indefinite-nominative-plural":"giudecătoare","accusative-definite-nominative-plural":"giudecătoarele","dative-genitive-indefinite-singular":"giudecătoare","dative-definite-genitive-singular":"giudecătoarei","dative-genitive-indefinite-plural":"giudecătoare","dative-definite-genitive-plural":"giudecătoarelor","singular-vocative":"giudecătoare","plural-vocative":"giudecătoarelor"}},{"word":"giudecca","pos":"noun","definitions":["a Jewish ghetto"],"forms":{"plural":"giudecca"}},{"word":"giugea","pos":"noun","definitions":["dwarf"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"giugea","accusative-definite-nominative":"giugeaul","dative-genitive-indefinite":"giugea","dative-definite-genitive":"giugeaului","vocative":"giugeaule"}},{"word":"Giugioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giugioiu"}},{"word":"giugiuc","pos":"adj","definitions":["pretty"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"giugiuc","error-unrecognized-form-feminine-indefinite-singular":"giugiuc","error-unrecognized-form-indefinite-masculine-plural":"giugiuc","error-unrecognized-form-feminine-indefinite-neuter-plural":"giugiuc","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"giugiuc","pos":"adv","definitions":["excellently"]},{"word":"giugiuleală","pos":"noun","definitions":["cuddling"],"forms":{"plural":"giugiuleli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"giugiuleală","accusative-definite-nominative-singular":"giugiuleala","accusative-indefinite-nominative-plural":"giugiuleli","accusative-definite-nominative-plural":"giugiulelile","dative-genitive-indefinite-singular":"giugiuleli","dative-definite-genitive-singular":"giugiulelii","dative-genitive-indefinite-plural":"giugiuleli","dative-definite-genitive-plural":"giugiulelilor","singular-vocative":"giugiuleală","plural-vocative":"giugiulelilor"}},{"word":"giugiuli","pos":"verb","definitions":["to cuddle"],"forms":{"canonical":"a giugiuli 4th conjugation","present-singular-third-person":"giugiulește","participle-past":"giugiulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a giugiuli","gerund":"giugiulind","first-person-indicative-present-singular":"giugiulesc","indicative-present-second-person-singular":"giugiulești","indicative-present-singular-third-person":"giugiulește","first-person-indicative-plural-present":"giugiulim","indicative-plural-present-second-person":"giugiuliți","indicative-plural-present-third-person":"giugiulesc","first-person-imperfect-indicative-singular":"giugiuleam","imperfect-indicative-second-person-singular":"giugiuleai","imperfect-indicative-singular-third-person":"giugiulea","first-person-imperfect-indicative-plural":"giugiuleam","imperfect-indicative-plural-second-person":"giugiuleați","imperfect-indicative-plural-third-person":"giugiuleau","first-person-indicative-perfect-singular":"giugiulii","indicative-perfect-second-person-singular":"giugiuliși","indicative-perfect-singular-third-person":"giugiuli","first-person-indicative-perfect-plural":"giugiulirăm","indicative-perfect-plural-second-person":"giugiulirăți","indicative-perfect-plural-third-person":"giugiuliră","first-person-indicative-pluperfect-singular":"giugiulisem","indicative-pluperfect-second-person-singular":"giugiuliseși","indicative-pluperfect-singular-third-person":"giugiulise","first-person-indicative-pluperfect-plural":"giugiuliserăm","indicative-pluperfect-plural-second-person":"giugiuliserăți","indicative-pluperfect-plural-third-person":"giugiuliseră","first-person-present-singular-subjunctive":"să giugiulesc","present-second-person-singular-subjunctive":"să giugiulești","present-singular-subjunctive-third-person":"să giugiulească","first-person-plural-present-subjunctive":"să giugiulim","plural-present-second-person-subjunctive":"să giugiuliți","plural-present-subjunctive-third-person":"să giugiulească","imperative-second-person-singular":"giugiulește","imperative-plural-second-person":"giugiuliți","imperative-negative-second-person-singular":"nu giugiuli","imperative-negative-plural-second-person":"nu giugiuliți"}},{"word":"giugiulire","pos":"noun","definitions":["cuddling"],"forms":{"plural":"giugiuliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"giugiulire","accusative-definite-nominative-singular":"giugiulirea","accusative-indefinite-nominative-plural":"giugiuliri","accusative-definite-nominative-plural":"giugiulirile","dative-genitive-indefinite-singular":"giugiuliri","dative-definite-genitive-singular":"giugiulirii","dative-genitive-indefinite-plural":"giugiuliri","dative-definite-genitive-plural":"giugiulirilor","singular-vocative":"giugiulire","plural-vocative":"giugiulirilor"}},{"word":"giugiulit","pos":"adj","definitions":["cuddled"],"forms":{"feminine-singular":"giugiulită","masculine-plural":"giugiuliți","feminine-neuter-plural":"giugiulite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"giugiulit","error-unrecognized-form-feminine-indefinite-singular":"giugiulită","error-unrecognized-form-indefinite-masculine-plural":"giugiuliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"giugiulite","definite-error-unrecognized-form-masculine-neuter-singular":"giugiulitul","definite-error-unrecognized-form-feminine-singular":"giugiulita","definite-error-unrecognized-form-masculine-plural":"giugiuliții","definite-error-unrecognized-form-feminine-neuter-plural":"giugiulitele"}},{"word":"giugiulit","pos":"verb","definitions":["past participle of giugiuli"],"forms":{"participle-past":"of giugiuli"}},{"word":"giugiulitură","pos":"noun","definitions":["cuddling"],"forms":{"plural":"giugiulituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"giugiulitură","accusative-definite-nominative-singular":"giugiulitura","accusative-indefinite-nominative-plural":"giugiulituri","accusative-definite-nominative-plural":"giugiuliturile","dative-genitive-indefinite-singular":"giugiulituri","dative-definite-genitive-singular":"giugiuliturii","dative-genitive-indefinite-plural":"giugiulituri","dative-definite-genitive-plural":"giugiuliturilor","singular-vocative":"giugiulitură","plural-vocative":"giugiuliturilor"}},{"word":"Giuglescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giuglescu"}},{"word":"Giula","pos":"name","definitions":["a village in Borșa, Cluj County, Romania"],"gender":"f"},{"word":"Giulatelec","pos":"name","definitions":["a village in Cluj County, Romania. Renamed to Coasta in 1925."],"gender":"m"},{"word":"Giuleanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giuleanu"}},{"word":"Giulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giulescu"}},{"word":"giuleșteană","pos":"noun","definitions":["female equivalent of giuleștean"],"forms":{"plural":"giuleșteane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giuleșteană","accusative-definite-nominative-singular":"giuleșteana","accusative-indefinite-nominative-plural":"giuleșteane","accusative-definite-nominative-plural":"giuleșteanele","dative-genitive-indefinite-singular":"giuleșteane","dative-definite-genitive-singular":"giuleșteanei","dative-genitive-indefinite-plural":"giuleșteane","dative-definite-genitive-plural":"giuleșteanelor","singular-vocative":"giuleșteană","plural-vocative":"giuleșteanelor"}},{"word":"Giulești","pos":"name","definitions":["a village in Pietroasa, Bihor County, Romania","a commune of Maramureș County, Romania","a village in Giulești, Maramureș County, Romania","a village in Secuieni, Neamț County, Romania","a village in Boroaia, Suceava County, Romania"],"gender":"m"},{"word":"Giuleștii de Sus","pos":"name","definitions":["a village in Fârtățești, Vâlcea County, Romania"],"gender":"m"},{"word":"giulgi","pos":"noun","definitions":["alternative form of giulgiu"],"forms":{"plural":"giulgiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giulgi","accusative-definite-nominative-singular":"giulgiul","accusative-indefinite-nominative-plural":"giulgiuri","accusative-definite-nominative-plural":"giulgiurile","dative-genitive-indefinite-singular":"giulgi","dative-definite-genitive-singular":"giulgiului","dative-genitive-indefinite-plural":"giulgiuri","dative-definite-genitive-plural":"giulgiurilor","singular-vocative":"giulgiule","plural-vocative":"giulgiurilor"}},{"word":"giulgiu","pos":"noun","definitions":["shroud"],"forms":{"plural":"giulgiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giulgiu","accusative-definite-nominative-singular":"giulgiul","accusative-indefinite-nominative-plural":"giulgiuri","accusative-definite-nominative-plural":"giulgiurile","dative-genitive-indefinite-singular":"giulgiu","dative-definite-genitive-singular":"giulgiului","dative-genitive-indefinite-plural":"giulgiuri","dative-definite-genitive-plural":"giulgiurilor","singular-vocative":"giulgiule","plural-vocative":"giulgiurilor"}},{"word":"giulgiui","pos":"verb","definitions":["to cover with a shroud"],"forms":{"canonical":"a giulgiui 4th conjugation","present-singular-third-person":"giulgiuie","participle-past":"giulgiuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a giulgiui","gerund":"giulgiuind","first-person-indicative-present-singular":"giulgiui","indicative-present-second-person-singular":"giulgiui","indicative-present-singular-third-person":"giulgiuie","first-person-indicative-plural-present":"giulgiuim","indicative-plural-present-second-person":"giulgiuiți","indicative-plural-present-third-person":"giulgiuie","first-person-imperfect-indicative-singular":"giulgiuiam","imperfect-indicative-second-person-singular":"giulgiuiai","imperfect-indicative-singular-third-person":"giulgiuia","first-person-imperfect-indicative-plural":"giulgiuiam","imperfect-indicative-plural-second-person":"giulgiuiați","imperfect-indicative-plural-third-person":"giulgiuiau","first-person-indicative-perfect-singular":"giulgiuii","indicative-perfect-second-person-singular":"giulgiuiși","indicative-perfect-singular-third-person":"giulgiui","first-person-indicative-perfect-plural":"giulgiuirăm","indicative-perfect-plural-second-person":"giulgiuirăți","indicative-perfect-plural-third-person":"giulgiuiră","first-person-indicative-pluperfect-singular":"giulgiuisem","indicative-pluperfect-second-person-singular":"giulgiuiseși","indicative-pluperfect-singular-third-person":"giulgiuise","first-person-indicative-pluperfect-plural":"giulgiuiserăm","indicative-pluperfect-plural-second-person":"giulgiuiserăți","indicative-pluperfect-plural-third-person":"giulgiuiseră","first-person-present-singular-subjunctive":"să giulgiui","present-second-person-singular-subjunctive":"să giulgiui","present-singular-subjunctive-third-person":"să giulgiuie","first-person-plural-present-subjunctive":"să giulgiuim","plural-present-second-person-subjunctive":"să giulgiuiți","plural-present-subjunctive-third-person":"să giulgiuie","imperative-second-person-singular":"giulgiuie","imperative-plural-second-person":"giulgiuiți","imperative-negative-second-person-singular":"nu giulgiui","imperative-negative-plural-second-person":"nu giulgiuiți"}},{"word":"Giuluș","pos":"name","definitions":["a village in Ogra, Mureș County, Romania"],"gender":"m"},{"word":"giuluș","pos":"noun","definitions":["accession to the throne"],"forms":{"plural":"giulușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giuluș","accusative-definite-nominative-singular":"giulușul","accusative-indefinite-nominative-plural":"giulușuri","accusative-definite-nominative-plural":"giulușurile","dative-genitive-indefinite-singular":"giuluș","dative-definite-genitive-singular":"giulușului","dative-genitive-indefinite-plural":"giulușuri","dative-definite-genitive-plural":"giulușurilor","singular-vocative":"giulușule","plural-vocative":"giulușurilor"}},{"word":"Giulvăz","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Giulvăz, Timiș County, Romania"],"gender":"m"},{"word":"giumbuș","pos":"noun","definitions":["tomfoolery"],"forms":{"plural":"giumbușuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giumbuș","accusative-definite-nominative-singular":"giumbușul","accusative-indefinite-nominative-plural":"giumbușuri","accusative-definite-nominative-plural":"giumbușurile","dative-genitive-indefinite-singular":"giumbuș","dative-definite-genitive-singular":"giumbușului","dative-genitive-indefinite-plural":"giumbușuri","dative-definite-genitive-plural":"giumbușurilor","singular-vocative":"giumbușule","plural-vocative":"giumbușurilor"}},{"word":"giumbușluc","pos":"noun","definitions":["trick, buffoonery, farce"],"forms":{"plural":"giumbușlucuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"giumbușluc","accusative-definite-nominative-singular":"giumbușlucul","accusative-indefinite-nominative-plural":"giumbușlucuri","accusative-definite-nominative-plural":"giumbușlucurile","dative-genitive-indefinite-singular":"giumbușluc","dative-definite-genitive-singular":"giumbușlucului","dative-genitive-indefinite-plural":"giumbușlucuri","dative-definite-genitive-plural":"giumbușlucurilor","singular-vocative":"giumbușlucule","plural-vocative":"giumbușlucurilor"}},{"word":"Giumelciș","pos":"name","definitions":["a village in Sălaj County, Romania. Renamed to Plopiș."],"gender":"m"},{"word":"giumert","pos":"adj","definitions":["generous"],"forms":{"feminine-singular":"giumertă","masculine-plural":"giumerți","feminine-neuter-plural":"giumerte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"giumert","error-unrecognized-form-feminine-indefinite-singular":"giumertă","error-unrecognized-form-indefinite-masculine-plural":"giumerți","error-unrecognized-form-feminine-indefinite-neuter-plural":"giumerte","definite-error-unrecognized-form-masculine-neuter-singular":"giumertul","definite-error-unrecognized-form-feminine-singular":"giumerta","definite-error-unrecognized-form-masculine-plural":"giumerții","definite-error-unrecognized-form-feminine-neuter-plural":"giumertele"}},{"word":"giuncă","pos":"noun","definitions":["obsolete form of juncă"],"forms":{"plural":"giunci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"giuncă","accusative-definite-nominative-singular":"giunca","accusative-indefinite-nominative-plural":"giunci","accusative-definite-nominative-plural":"giuncile","dative-genitive-indefinite-singular":"giunci","dative-definite-genitive-singular":"giuncii","dative-genitive-indefinite-plural":"giunci","dative-definite-genitive-plural":"giuncilor","singular-vocative":"giuncă","plural-vocative":"giuncilor"}},{"word":"Giungi","pos":"name","definitions":["a village in Beltiug, Satu Mare County, Romania"],"gender":"m"},{"word":"giupân","pos":"noun","definitions":["obsolete form of jupân"],"forms":{"plural":"giupâni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giupân","accusative-definite-nominative-singular":"giupânul","accusative-indefinite-nominative-plural":"giupâni","accusative-definite-nominative-plural":"giupânii","dative-genitive-indefinite-singular":"giupân","dative-definite-genitive-singular":"giupânului","dative-genitive-indefinite-plural":"giupâni","dative-definite-genitive-plural":"giupânilor","singular-vocative":"giupânule","plural-vocative":"giupânilor"}},{"word":"Giura","pos":"name","definitions":["a village in Bâcleș, Mehedinți County, Romania"],"gender":"f"},{"word":"giurământ","pos":"noun","definitions":["obsolete form of jurământ"],"forms":{"plural":"giurăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giurământ","accusative-definite-nominative-singular":"giurământul","accusative-indefinite-nominative-plural":"giurăminte","accusative-definite-nominative-plural":"giurămintele","dative-genitive-indefinite-singular":"giurământ","dative-definite-genitive-singular":"giurământului","dative-genitive-indefinite-plural":"giurăminte","dative-definite-genitive-plural":"giurămintelor","singular-vocative":"giurământule","plural-vocative":"giurămintelor"}},{"word":"Giurcăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giurcăneanu"}},{"word":"Giurcani","pos":"name","definitions":["a village in Găgești, Vaslui County, Romania"],"gender":"m"},{"word":"Giurchescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurchescu"}},{"word":"Giurcoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurcoiu"}},{"word":"Giurculete","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurculete"}},{"word":"Giurcuța de Jos","pos":"name","definitions":["a village in Beliș, Cluj County, Romania"],"gender":"f"},{"word":"Giurcuța de Sus","pos":"name","definitions":["a village in Beliș, Cluj County, Romania"],"gender":"f"},{"word":"Giurescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurescu"}},{"word":"Giurfalău","pos":"name","definitions":["a village in Cluj County, Romania. Renamed to Gheorghieni in 1925."],"gender":"m"},{"word":"Giurgea","pos":"name","definitions":["a river in Vrancea County, Romania, tributary to the Șușița"],"gender":"f"},{"word":"Giurgeni","pos":"name","definitions":["a village in Tătărăști, Bacău County, Romania","a commune of Ialomița County, Romania","a village in Giurgeni, Ialomița County, Romania","a village in Valea Ursului, Neamț County, Romania"],"gender":"m"},{"word":"Giurgescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurgescu"}},{"word":"Giurgești","pos":"name","definitions":["a village in Bulzeștii de Sus, Hunedoara County, Romania","a village in Costești, Iași County, Romania","a village in Vulturești, Suceava County, Romania","a village in Tătărăni, Vaslui County, Romania"],"gender":"m"},{"word":"Giurgiani","pos":"name","definitions":["a village in Isverna, Mehedinți County, Romania"],"gender":"m"},{"word":"Giurgică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Giurgică"}},{"word":"Giurgilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Giurgilă"}},{"word":"giurgină","pos":"noun","definitions":["a folk dance"],"forms":{"plural":"giurgine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giurgină","accusative-definite-nominative-singular":"giurgina","accusative-indefinite-nominative-plural":"giurgine","accusative-definite-nominative-plural":"giurginele","dative-genitive-indefinite-singular":"giurgine","dative-definite-genitive-singular":"giurginei","dative-genitive-indefinite-plural":"giurgine","dative-definite-genitive-plural":"giurginelor","singular-vocative":"giurgină","plural-vocative":"giurginelor"}},{"word":"Giurgioana","pos":"name","definitions":["a village in Podu Turcului, Bacău County, Romania"],"gender":"f"},{"word":"Giurgioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurgioiu"}},{"word":"Giurgiova","pos":"name","definitions":["a village in Goruia, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Giurgița","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Giurgița, Dolj County, Romania"],"gender":"f"},{"word":"Giurgițeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giurgițeanu"}},{"word":"Giurgiu","pos":"name","definitions":["a male given name from Ancient Greek, equivalent to English George","a city in Giurgiu County, Romania","a county of Romania"],"pronunciation":"/ˈdʒjurdʒju/","gender":"m"},{"word":"Giurgiulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giurgiulescu"}},{"word":"Giurgiulești","pos":"name","definitions":["a village in Giurgiulești, Cahul Raion, Moldova","a commune of Cahul Raion, Moldova"],"gender":"m"},{"word":"Giurgiulețul","pos":"name","definitions":["a river in Olt, Romania, tributary to the Vedița"],"gender":"m"},{"word":"Giurgiuț","pos":"name","definitions":["a village in Horea, Alba County, Romania","a surname"],"gender":"m","forms":{"dative-genitive":"lui Giurgiuț"}},{"word":"Giurgiuvanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giurgiuvanu"}},{"word":"giurgiuvea","pos":"noun","definitions":["alternative form of cercevea"],"forms":{"plural":"giurgiuvele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"giurgiuvea","accusative-definite-nominative-singular":"giurgiuveaua","accusative-indefinite-nominative-plural":"giurgiuvele","accusative-definite-nominative-plural":"giurgiuvelele","dative-genitive-indefinite-singular":"giurgiuvele","dative-definite-genitive-singular":"giurgiuvelei","dative-genitive-indefinite-plural":"giurgiuvele","dative-definite-genitive-plural":"giurgiuvelelor","singular-vocative":"giurgiuvea","plural-vocative":"giurgiuvelelor"}},{"word":"giurgiuvean","pos":"noun","definitions":["native or inhabitant of the city of Giurgiu or surrounding Giurgiu County, Romania (usually male)"],"forms":{"plural":"giurgiuveni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giurgiuvean","accusative-definite-nominative-singular":"giurgiuveanul","accusative-indefinite-nominative-plural":"giurgiuveni","accusative-definite-nominative-plural":"giurgiuvenii","dative-genitive-indefinite-singular":"giurgiuvean","dative-definite-genitive-singular":"giurgiuveanului","dative-genitive-indefinite-plural":"giurgiuveni","dative-definite-genitive-plural":"giurgiuvenilor","singular-vocative":"giurgiuveanule","plural-vocative":"giurgiuvenilor"}},{"word":"giurgiuveană","pos":"noun","definitions":["female equivalent of giurgiuvean"],"forms":{"plural":"giurgiuvene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giurgiuveană","accusative-definite-nominative-singular":"giurgiuveana","accusative-indefinite-nominative-plural":"giurgiuvene","accusative-definite-nominative-plural":"giurgiuvenele","dative-genitive-indefinite-singular":"giurgiuvene","dative-definite-genitive-singular":"giurgiuvenei","dative-genitive-indefinite-plural":"giurgiuvene","dative-definite-genitive-plural":"giurgiuvenelor","singular-vocative":"giurgiuveană","plural-vocative":"giurgiuvenelor"}},{"word":"giurgiuveancă","pos":"noun","definitions":["female equivalent of giurgiuvean"],"forms":{"plural":"giurgiuvence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giurgiuveancă","accusative-definite-nominative-singular":"giurgiuveanca","accusative-indefinite-nominative-plural":"giurgiuvence","accusative-definite-nominative-plural":"giurgiuvencele","dative-genitive-indefinite-singular":"giurgiuvence","dative-definite-genitive-singular":"giurgiuvencei","dative-genitive-indefinite-plural":"giurgiuvence","dative-definite-genitive-plural":"giurgiuvencelor","singular-vocative":"giurgiuveancă","plural-vocative":"giurgiuvencelor"}},{"word":"Giurgiuveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Giurgiuveanu"}},{"word":"Giurgiuveni","pos":"name","definitions":["a village in Golești, Vâlcea County, Romania"],"gender":"m"},{"word":"Giuroiu","pos":"name","definitions":["a village in Stoilești, Vâlcea County, Romania","a surname"],"gender":"m"},{"word":"Giurtelecu Hododului","pos":"name","definitions":["a village in Hodod, Satu Mare County, Romania"],"gender":"m"},{"word":"Giurtelecu Șimleului","pos":"name","definitions":["a village in Măeriște, Sălaj County, Romania"],"gender":"m"},{"word":"Giușcă","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Giușcă"}},{"word":"giușcă","pos":"noun","definitions":["black-headed gull (Chroicocephalus ridibundus)"],"forms":{"plural":"giuște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giușcă","accusative-definite-nominative-singular":"giușca","accusative-indefinite-nominative-plural":"giuște","accusative-definite-nominative-plural":"giuștele","dative-genitive-indefinite-singular":"giuște","dative-definite-genitive-singular":"giuștei","dative-genitive-indefinite-plural":"giuște","dative-definite-genitive-plural":"giuștelor","singular-vocative":"giușcă","plural-vocative":"giuștelor"}},{"word":"giuvaier","pos":"noun","definitions":["jewel, gem"],"pronunciation":"[d͡ʒju.vaˈjer]","forms":{"plural":"giuvaiere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"giuvaier","accusative-definite-nominative-singular":"giuvaierul","accusative-indefinite-nominative-plural":"giuvaiere","accusative-definite-nominative-plural":"giuvaierele","dative-genitive-indefinite-singular":"giuvaier","dative-definite-genitive-singular":"giuvaierului","dative-genitive-indefinite-plural":"giuvaiere","dative-definite-genitive-plural":"giuvaierelor","singular-vocative":"giuvaierule","plural-vocative":"giuvaierelor","alternative":"juvaer"}},{"word":"giuvaiergereasă","pos":"noun","definitions":["female jeweler"],"forms":{"plural":"giuvaiergerese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"giuvaiergereasă","accusative-definite-nominative-singular":"giuvaiergereasa","accusative-indefinite-nominative-plural":"giuvaiergerese","accusative-definite-nominative-plural":"giuvaiergeresele","dative-genitive-indefinite-singular":"giuvaiergerese","dative-definite-genitive-singular":"giuvaiergeresei","dative-genitive-indefinite-plural":"giuvaiergerese","dative-definite-genitive-plural":"giuvaiergereselor","singular-vocative":"giuvaiergereasă","plural-vocative":"giuvaiergereselor"}},{"word":"giuvaiergerie","pos":"noun","definitions":["jewelry shop"],"forms":{"plural":"giuvaiergerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"giuvaiergerie","accusative-definite-nominative-singular":"giuvaiergeria","accusative-indefinite-nominative-plural":"giuvaiergerii","accusative-definite-nominative-plural":"giuvaiergeriile","dative-genitive-indefinite-singular":"giuvaiergerii","dative-definite-genitive-singular":"giuvaiergeriei","dative-genitive-indefinite-plural":"giuvaiergerii","dative-definite-genitive-plural":"giuvaiergeriilor","singular-vocative":"giuvaiergerie","plural-vocative":"giuvaiergeriilor"}},{"word":"giuvaiergiu","pos":"noun","definitions":["goldsmith"],"forms":{"plural":"giuvaiergii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"giuvaiergiu","accusative-definite-nominative-singular":"giuvaiergiul","accusative-indefinite-nominative-plural":"giuvaiergii","accusative-definite-nominative-plural":"giuvaiergiii","dative-genitive-indefinite-singular":"giuvaiergiu","dative-definite-genitive-singular":"giuvaiergiului","dative-genitive-indefinite-plural":"giuvaiergii","dative-definite-genitive-plural":"giuvaiergiilor","singular-vocative":"giuvaiergiule","plural-vocative":"giuvaiergiilor"}},{"word":"giuvaiericale","pos":"noun","definitions":["jewels"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"giuvaiericale","accusative-definite-nominative":"giuvaiericalele","dative-genitive-indefinite":"giuvaiericale","dative-definite-genitive":"giuvaiericalelor","vocative":"-"}},{"word":"Giuvărăști","pos":"name","definitions":["a commune of Olt County, Romania","a village in Giuvărăști, Olt County, Romania"],"gender":"m"},{"word":"givorniță","pos":"noun","definitions":["obsolete form of viforniță"],"forms":{"plural":"givornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"givorniță","accusative-definite-nominative-singular":"givornița","accusative-indefinite-nominative-plural":"givornițe","accusative-definite-nominative-plural":"givornițele","dative-genitive-indefinite-singular":"givornițe","dative-definite-genitive-singular":"givorniței","dative-genitive-indefinite-plural":"givornițe","dative-definite-genitive-plural":"givornițelor","singular-vocative":"givorniță","plural-vocative":"givornițelor"}},{"word":"givraj","pos":"noun","definitions":["alternative form of jivraj"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"givraj","accusative-definite-nominative":"givrajul","dative-genitive-indefinite":"givraj","dative-definite-genitive":"givrajului","vocative":"givrajule"}},{"word":"givrat","pos":"adj","definitions":["alternative form of jivrat"],"forms":{"feminine-singular":"givrată","masculine-plural":"givrați","feminine-neuter-plural":"givrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"givrat","error-unrecognized-form-feminine-indefinite-singular":"givrată","error-unrecognized-form-indefinite-masculine-plural":"givrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"givrate","definite-error-unrecognized-form-masculine-neuter-singular":"givratul","definite-error-unrecognized-form-feminine-singular":"givrata","definite-error-unrecognized-form-masculine-plural":"givrații","definite-error-unrecognized-form-feminine-neuter-plural":"givratele"}},{"word":"Gîza","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîza"}},{"word":"Gîză","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gîză"}},{"word":"GJ","pos":"name","definitions":["abbreviation of Gorj: a county of Romania"]},{"word":"GL","pos":"name","definitions":["abbreviation of Galați: a county of Romania"]},{"word":"glabelă","pos":"noun","definitions":["glabella"],"forms":{"plural":"glabele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glabelă","accusative-definite-nominative-singular":"glabela","accusative-indefinite-nominative-plural":"glabele","accusative-definite-nominative-plural":"glabelele","dative-genitive-indefinite-singular":"glabele","dative-definite-genitive-singular":"glabelei","dative-genitive-indefinite-plural":"glabele","dative-definite-genitive-plural":"glabelelor","singular-vocative":"glabelă","plural-vocative":"glabelelor"}},{"word":"glabru","pos":"adj","definitions":["glabrous"],"forms":{"feminine-singular":"glabră","masculine-plural":"glabri","feminine-neuter-plural":"glabre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glabru","error-unrecognized-form-feminine-indefinite-singular":"glabră","error-unrecognized-form-indefinite-masculine-plural":"glabri","error-unrecognized-form-feminine-indefinite-neuter-plural":"glabre","definite-error-unrecognized-form-masculine-neuter-singular":"glabrul","definite-error-unrecognized-form-feminine-singular":"glabra","definite-error-unrecognized-form-masculine-plural":"glabrii","definite-error-unrecognized-form-feminine-neuter-plural":"glabrele"}},{"word":"glacial","pos":"adj","definitions":["glacial"],"pronunciation":"/ɡla.t͡ʃiˈal/","forms":{"feminine-singular":"glacială","masculine-plural":"glaciali","feminine-neuter-plural":"glaciale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glacial","error-unrecognized-form-feminine-indefinite-singular":"glacială","error-unrecognized-form-indefinite-masculine-plural":"glaciali","error-unrecognized-form-feminine-indefinite-neuter-plural":"glaciale","definite-error-unrecognized-form-masculine-neuter-singular":"glacialul","definite-error-unrecognized-form-feminine-singular":"glaciala","definite-error-unrecognized-form-masculine-plural":"glacialii","definite-error-unrecognized-form-feminine-neuter-plural":"glacialele"}},{"word":"glaciar","pos":"adj","definitions":["glacial"],"forms":{"feminine-singular":"glaciară","masculine-plural":"glaciari","feminine-neuter-plural":"glaciare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glaciar","error-unrecognized-form-feminine-indefinite-singular":"glaciară","error-unrecognized-form-indefinite-masculine-plural":"glaciari","error-unrecognized-form-feminine-indefinite-neuter-plural":"glaciare","definite-error-unrecognized-form-masculine-neuter-singular":"glaciarul","definite-error-unrecognized-form-feminine-singular":"glaciara","definite-error-unrecognized-form-masculine-plural":"glaciarii","definite-error-unrecognized-form-feminine-neuter-plural":"glaciarele"}},{"word":"glaciară","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of glaciar"]},{"word":"glaciarizație","pos":"noun","definitions":["glaciation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"glaciarizație","accusative-definite-nominative":"glaciarizația","dative-genitive-indefinite":"glaciarizații","dative-definite-genitive":"glaciarizației","vocative":"glaciarizație"}},{"word":"glaciație","pos":"noun","definitions":["glaciation"],"forms":{"plural":"glaciații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glaciație","accusative-definite-nominative-singular":"glaciația","accusative-indefinite-nominative-plural":"glaciații","accusative-definite-nominative-plural":"glaciațiile","dative-genitive-indefinite-singular":"glaciații","dative-definite-genitive-singular":"glaciației","dative-genitive-indefinite-plural":"glaciații","dative-definite-genitive-plural":"glaciațiilor","singular-vocative":"glaciație","plural-vocative":"glaciațiilor"}},{"word":"glaciațiune","pos":"noun","definitions":["alternative form of glaciație"],"forms":{"plural":"glaciațiuni"}},{"word":"glaciolog","pos":"noun","definitions":["glaciologist"],"pronunciation":"/ɡla.t͡ʃi.oˈloɡ/","forms":{"plural":"glaciologi","feminine":"equivalent glaciologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glaciolog","accusative-definite-nominative-singular":"glaciologul","accusative-indefinite-nominative-plural":"glaciologi","accusative-definite-nominative-plural":"glaciologii","dative-genitive-indefinite-singular":"glaciolog","dative-definite-genitive-singular":"glaciologului","dative-genitive-indefinite-plural":"glaciologi","dative-definite-genitive-plural":"glaciologilor","singular-vocative":"glaciologule","plural-vocative":"glaciologilor"}},{"word":"glaciologa","pos":"noun","definitions":["definite nominative/accusative singular of glaciologă"]},{"word":"glaciologă","pos":"noun","definitions":["female equivalent of glaciolog"],"pronunciation":"/ɡla.t͡ʃi.oˈlo.ɡə/","forms":{"plural":"glaciologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"glaciologă","accusative-definite-nominative-singular":"glaciologa","accusative-indefinite-nominative-plural":"glaciologe","accusative-definite-nominative-plural":"glaciologele","dative-genitive-indefinite-singular":"glaciologe","dative-definite-genitive-singular":"glaciologei","dative-genitive-indefinite-plural":"glaciologe","dative-definite-genitive-plural":"glaciologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"glaciologe","pos":"noun","definitions":["plural of glaciologă"],"gender":"f"},{"word":"glaciologi","pos":"noun","definitions":["plural of glaciolog"],"gender":"m"},{"word":"glaciologic","pos":"adj","definitions":["glaciological"],"forms":{"feminine-singular":"glaciologică","masculine-plural":"glaciologici","feminine-neuter-plural":"glaciologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glaciologic","error-unrecognized-form-feminine-indefinite-singular":"glaciologică","error-unrecognized-form-indefinite-masculine-plural":"glaciologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glaciologice","definite-error-unrecognized-form-masculine-neuter-singular":"glaciologicul","definite-error-unrecognized-form-feminine-singular":"glaciologica","definite-error-unrecognized-form-masculine-plural":"glaciologicii","definite-error-unrecognized-form-feminine-neuter-plural":"glaciologicele"}},{"word":"glaciologie","pos":"noun","definitions":["glaciology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"glaciologie","accusative-definite-nominative":"glaciologia","dative-genitive-indefinite":"glaciologii","dative-definite-genitive":"glaciologiei","vocative":"glaciologie"}},{"word":"glaciotectonică","pos":"noun","definitions":["glaciotectonics"],"forms":{"plural":"glaciotectonici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"glaciotectonică","accusative-definite-nominative-singular":"glaciotectonica","accusative-indefinite-nominative-plural":"glaciotectonici","accusative-definite-nominative-plural":"glaciotectonicile","dative-genitive-indefinite-singular":"glaciotectonici","dative-definite-genitive-singular":"glaciotectonicii","dative-genitive-indefinite-plural":"glaciotectonici","dative-definite-genitive-plural":"glaciotectonicilor","singular-vocative":"glaciotectonică","plural-vocative":"glaciotectonicilor"}},{"word":"glacis","pos":"noun","definitions":["glacis"],"forms":{"plural":"glacisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glacis","accusative-definite-nominative-singular":"glacisul","accusative-indefinite-nominative-plural":"glacisuri","accusative-definite-nominative-plural":"glacisurile","dative-genitive-indefinite-singular":"glacis","dative-definite-genitive-singular":"glacisului","dative-genitive-indefinite-plural":"glacisuri","dative-definite-genitive-plural":"glacisurilor","singular-vocative":"glacisule","plural-vocative":"glacisurilor"}},{"word":"gladiator","pos":"noun","definitions":["gladiator"],"forms":{"plural":"gladiatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gladiator","accusative-definite-nominative-singular":"gladiatorul","accusative-indefinite-nominative-plural":"gladiatori","accusative-definite-nominative-plural":"gladiatorii","dative-genitive-indefinite-singular":"gladiator","dative-definite-genitive-singular":"gladiatorului","dative-genitive-indefinite-plural":"gladiatori","dative-definite-genitive-plural":"gladiatorilor","singular-vocative":"gladiatorule","plural-vocative":"gladiatorilor"}},{"word":"gladiatoric","pos":"adj","definitions":["gladiatorial"],"forms":{"feminine-singular":"gladiatorică","masculine-plural":"gladiatorici","feminine-neuter-plural":"gladiatorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gladiatoric","error-unrecognized-form-feminine-indefinite-singular":"gladiatorică","error-unrecognized-form-indefinite-masculine-plural":"gladiatorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gladiatorice","definite-error-unrecognized-form-masculine-neuter-singular":"gladiatoricul","definite-error-unrecognized-form-feminine-singular":"gladiatorica","definite-error-unrecognized-form-masculine-plural":"gladiatoricii","definite-error-unrecognized-form-feminine-neuter-plural":"gladiatoricele"}},{"word":"glădici","pos":"noun","definitions":["alternative form of gladiș"],"forms":{"plural":"glădici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glădici","accusative-definite-nominative-singular":"glădiciul","accusative-indefinite-nominative-plural":"glădici","accusative-definite-nominative-plural":"glădicii","dative-genitive-indefinite-singular":"glădici","dative-definite-genitive-singular":"glădiciului","dative-genitive-indefinite-plural":"glădici","dative-definite-genitive-plural":"glădicilor","singular-vocative":"glădiciule","plural-vocative":"glădicilor"}},{"word":"gladie","pos":"noun","definitions":["sword"],"forms":{"plural":"gladii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gladie","accusative-definite-nominative-singular":"gladia","accusative-indefinite-nominative-plural":"gladii","accusative-definite-nominative-plural":"gladiile","dative-genitive-indefinite-singular":"gladii","dative-definite-genitive-singular":"gladiei","dative-genitive-indefinite-plural":"gladii","dative-definite-genitive-plural":"gladiilor","singular-vocative":"gladie","plural-vocative":"gladiilor"}},{"word":"gladiola","pos":"noun","definitions":["definite nominative/accusative singular of gladiolă"],"pronunciation":"[ɡladiˈola]","gender":"f"},{"word":"gladiolă","pos":"noun","definitions":["gladiolus (plant)"],"pronunciation":"/ɡla.diˈo.lə/","forms":{"plural":"gladiole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gladiolă","accusative-definite-nominative-singular":"gladiola","accusative-indefinite-nominative-plural":"gladiole","accusative-definite-nominative-plural":"gladiolele","dative-genitive-indefinite-singular":"gladiole","dative-definite-genitive-singular":"gladiolei","dative-genitive-indefinite-plural":"gladiole","dative-definite-genitive-plural":"gladiolelor","singular-vocative":"gladiolă","plural-vocative":"gladiolelor"}},{"word":"gladiole","pos":"noun","definitions":["inflection of gladiolă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ɡladiˈole]","gender":"f"},{"word":"gladiolo","pos":"noun","definitions":["vocative singular of gladiolă"],"pronunciation":"[ɡladiˈolo]","gender":"f"},{"word":"glădiță","pos":"noun","definitions":["honey locust tree (Gleditsia triacanthos)"],"forms":{"plural":"glădițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glădiță","accusative-definite-nominative-singular":"glădița","accusative-indefinite-nominative-plural":"glădițe","accusative-definite-nominative-plural":"glădițele","dative-genitive-indefinite-singular":"glădițe","dative-definite-genitive-singular":"glădiței","dative-genitive-indefinite-plural":"glădițe","dative-definite-genitive-plural":"glădițelor","singular-vocative":"glădiță","plural-vocative":"glădițelor"}},{"word":"gladium","pos":"noun","definitions":["gladius"],"forms":{"plural":"gladiumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gladium","accusative-definite-nominative-singular":"gladiumul","accusative-indefinite-nominative-plural":"gladiumuri","accusative-definite-nominative-plural":"gladiumurile","dative-genitive-indefinite-singular":"gladium","dative-definite-genitive-singular":"gladiumului","dative-genitive-indefinite-plural":"gladiumuri","dative-definite-genitive-plural":"gladiumurilor","singular-vocative":"gladiumule","plural-vocative":"gladiumurilor"}},{"word":"Gladna","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Bega"],"gender":"f"},{"word":"Gladna Montană","pos":"name","definitions":["a village in Fârdea, Timiș County, Romania"],"gender":"f"},{"word":"Gladna Română","pos":"name","definitions":["a village in Fârdea, Timiș County, Romania"],"gender":"f"},{"word":"glagolitic","pos":"adj","definitions":["Glagolitic"],"forms":{"feminine-singular":"glagolitică","masculine-plural":"glagolitici","feminine-neuter-plural":"glagolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glagolitic","error-unrecognized-form-feminine-indefinite-singular":"glagolitică","error-unrecognized-form-indefinite-masculine-plural":"glagolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glagolitice","definite-error-unrecognized-form-masculine-neuter-singular":"glagoliticul","definite-error-unrecognized-form-feminine-singular":"glagolitica","definite-error-unrecognized-form-masculine-plural":"glagoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"glagoliticele"}},{"word":"glagore","pos":"noun","definitions":["reason"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glagore","accusative-definite-nominative":"glagoreul","dative-genitive-indefinite":"glagore","dative-definite-genitive":"glagoreului","vocative":"glagoreule"}},{"word":"glajă","pos":"noun","definitions":["bottle"],"forms":{"plural":"glăji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glajă","accusative-definite-nominative-singular":"glaja","accusative-indefinite-nominative-plural":"glăje","accusative-definite-nominative-plural":"glăjele","dative-genitive-indefinite-singular":"glăje","dative-definite-genitive-singular":"glăjei","dative-genitive-indefinite-plural":"glăje","dative-definite-genitive-plural":"glăjelor","singular-vocative":"glajă","plural-vocative":"glăjelor"}},{"word":"glăjar","pos":"noun","definitions":["glazier"],"forms":{"plural":"glăjari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glăjar","accusative-definite-nominative-singular":"glăjarul","accusative-indefinite-nominative-plural":"glăjari","accusative-definite-nominative-plural":"glăjarii","dative-genitive-indefinite-singular":"glăjar","dative-definite-genitive-singular":"glăjarului","dative-genitive-indefinite-plural":"glăjari","dative-definite-genitive-plural":"glăjarilor","singular-vocative":"glăjarule","plural-vocative":"glăjarilor"}},{"word":"Glăjărie","pos":"name","definitions":["a village in Gurghiu, Mureș County, Romania"],"gender":"m"},{"word":"glăjerie","pos":"noun","definitions":["glassmaker's shop"],"forms":{"plural":"glăjerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glăjerie","accusative-definite-nominative-singular":"glăjeria","accusative-indefinite-nominative-plural":"glăjerii","accusative-definite-nominative-plural":"glăjeriile","dative-genitive-indefinite-singular":"glăjerii","dative-definite-genitive-singular":"glăjeriei","dative-genitive-indefinite-plural":"glăjerii","dative-definite-genitive-plural":"glăjeriilor","singular-vocative":"glăjerie","plural-vocative":"glăjeriilor"}},{"word":"glăjiță","pos":"noun","definitions":["diminutive of glajă"],"forms":{"plural":"glăjițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glăjiță","accusative-definite-nominative-singular":"glăjița","accusative-indefinite-nominative-plural":"glăjițe","accusative-definite-nominative-plural":"glăjițele","dative-genitive-indefinite-singular":"glăjițe","dative-definite-genitive-singular":"glăjiței","dative-genitive-indefinite-plural":"glăjițe","dative-definite-genitive-plural":"glăjițelor","singular-vocative":"glăjiță","plural-vocative":"glăjițelor"}},{"word":"glăjuță","pos":"noun","definitions":["diminutive of glajă"],"forms":{"plural":"glăjuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glăjuță","accusative-definite-nominative-singular":"glăjuța","accusative-indefinite-nominative-plural":"glăjuțe","accusative-definite-nominative-plural":"glăjuțele","dative-genitive-indefinite-singular":"glăjuțe","dative-definite-genitive-singular":"glăjuței","dative-genitive-indefinite-plural":"glăjuțe","dative-definite-genitive-plural":"glăjuțelor","singular-vocative":"glăjuță","plural-vocative":"glăjuțelor"}},{"word":"Glâmboaca","pos":"name","definitions":["a village in Avrig, Sibiu County, Romania"],"gender":"f"},{"word":"Glâmbocata","pos":"name","definitions":["a village in Leordeni, Argeș County, Romania"],"gender":"f"},{"word":"Glâmbocata-Deal","pos":"name","definitions":["a village in Leordeni, Argeș County, Romania"],"gender":"m"},{"word":"Glâmbocel","pos":"name","definitions":["a village in Bogați, Argeș County, Romania"],"gender":"m"},{"word":"Glâmbocelu","pos":"name","definitions":["a village in Bogați, Argeș County, Romania"],"gender":"m"},{"word":"Glâmbocu","pos":"name","definitions":["a village in Bascov, Argeș County, Romania"],"gender":"m"},{"word":"gland","pos":"noun","definitions":["glans","ellipsis of glandul penisului (“glans penis”)","ellipsis of glandul clitorisului (“glans clitoridis”)"],"examples":[{"ro":"a decalota glandul","en":"to uncover the glans penis or glans clitoridis by pulling back the foreskin or clitoral hood"},{"ro":"a recalota glandul","en":"to cover again the glans penis or glans clitoridis by pulling forward the foreskin or clitoral hood"}],"forms":{"plural":"glanduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gland","accusative-definite-nominative-singular":"glandul","accusative-indefinite-nominative-plural":"glanduri","accusative-definite-nominative-plural":"glandurile","dative-genitive-indefinite-singular":"gland","dative-definite-genitive-singular":"glandului","dative-genitive-indefinite-plural":"glanduri","dative-definite-genitive-plural":"glandurilor","singular-vocative":"glandule","plural-vocative":"glandurilor"}},{"word":"glanda","pos":"noun","definitions":["definite nominative/accusative singular of glandă"],"pronunciation":"[ˈɡlanda]","gender":"f"},{"word":"glandă","pos":"noun","definitions":["gland"],"forms":{"plural":"glande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glandă","accusative-definite-nominative-singular":"glanda","accusative-indefinite-nominative-plural":"glande","accusative-definite-nominative-plural":"glandele","dative-genitive-indefinite-singular":"glande","dative-definite-genitive-singular":"glandei","dative-genitive-indefinite-plural":"glande","dative-definite-genitive-plural":"glandelor","singular-vocative":"glandă","plural-vocative":"glandelor"}},{"word":"glandă endocrină","pos":"noun","definitions":["endocrine gland"],"forms":{"plural":"glande endocrine"}},{"word":"glandă exocrină","pos":"noun","definitions":["exocrine gland"],"forms":{"plural":"glande exocrine"}},{"word":"glandă lacrimală","pos":"noun","definitions":["tear gland"],"forms":{"plural":"glande lacrimale"}},{"word":"glandă mamară","pos":"noun","definitions":["mammary gland"],"forms":{"plural":"glande mamare"}},{"word":"glandă paratiroidă","pos":"noun","definitions":["parathyroid gland"],"forms":{"plural":"glande paratiroide"}},{"word":"glandă parotidă","pos":"noun","definitions":["parotid gland"],"forms":{"plural":"glande parotide"}},{"word":"glandă pineală","pos":"noun","definitions":["pineal gland"],"forms":{"plural":"glande pineale"}},{"word":"glandă salivară","pos":"noun","definitions":["salivary gland"],"forms":{"plural":"glande salivare"}},{"word":"glandă sebacee","pos":"noun","definitions":["sebaceous gland"],"forms":{"plural":"glande sebacee"}},{"word":"glandă sudoripară","pos":"noun","definitions":["sweat gland"],"forms":{"plural":"glande sudoripare"}},{"word":"glandă tiroidă","pos":"noun","definitions":["thyroid gland"]},{"word":"glande","pos":"noun","definitions":["inflection of glandă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡlande]","gender":"f"},{"word":"glande exocrine","pos":"noun","definitions":["plural of glandă exocrină"]},{"word":"glandul clitorisului","pos":"noun","definitions":["the glans clitoridis"]},{"word":"glandul penisului","pos":"noun","definitions":["the glans penis"]},{"word":"glandulă","pos":"noun","definitions":["glandule"],"forms":{"plural":"glandule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glandulă","accusative-definite-nominative-singular":"glandula","accusative-indefinite-nominative-plural":"glandule","accusative-definite-nominative-plural":"glandulele","dative-genitive-indefinite-singular":"glandule","dative-definite-genitive-singular":"glandulei","dative-genitive-indefinite-plural":"glandule","dative-definite-genitive-plural":"glandulelor","singular-vocative":"glandulă","plural-vocative":"glandulelor"}},{"word":"glandular","pos":"adj","definitions":["glandular"],"forms":{"feminine-singular":"glandulară","masculine-plural":"glandulari","feminine-neuter-plural":"glandulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glandular","error-unrecognized-form-feminine-indefinite-singular":"glandulară","error-unrecognized-form-indefinite-masculine-plural":"glandulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"glandulare","definite-error-unrecognized-form-masculine-neuter-singular":"glandularul","definite-error-unrecognized-form-feminine-singular":"glandulara","definite-error-unrecognized-form-masculine-plural":"glandularii","definite-error-unrecognized-form-feminine-neuter-plural":"glandularele"}},{"word":"glandulos","pos":"adj","definitions":["glandulous"],"pronunciation":"/ɡlan.duˈlos/","forms":{"feminine-singular":"glanduloasă","masculine-plural":"glanduloși","feminine-neuter-plural":"glanduloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glandulos","error-unrecognized-form-feminine-indefinite-singular":"glanduloasă","error-unrecognized-form-indefinite-masculine-plural":"glanduloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glanduloase","definite-error-unrecognized-form-masculine-neuter-singular":"glandulosul","definite-error-unrecognized-form-feminine-singular":"glanduloasa","definite-error-unrecognized-form-masculine-plural":"glanduloșii","definite-error-unrecognized-form-feminine-neuter-plural":"glanduloasele"}},{"word":"glanț","pos":"noun","definitions":["gleam"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glanț","accusative-definite-nominative":"glanțul","dative-genitive-indefinite":"glanț","dative-definite-genitive":"glanțului","vocative":"glanțule"}},{"word":"glănțui","pos":"verb","definitions":["to shine"],"forms":{"canonical":"a glănțui 4th conjugation","present-singular-third-person":"glănțuiește","participle-past":"glănțuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a glănțui","gerund":"glănțuind","first-person-indicative-present-singular":"glănțuiesc","indicative-present-second-person-singular":"glănțuiești","indicative-present-singular-third-person":"glănțuiește","first-person-indicative-plural-present":"glănțuim","indicative-plural-present-second-person":"glănțuiți","indicative-plural-present-third-person":"glănțuiesc","first-person-imperfect-indicative-singular":"glănțuiam","imperfect-indicative-second-person-singular":"glănțuiai","imperfect-indicative-singular-third-person":"glănțuia","first-person-imperfect-indicative-plural":"glănțuiam","imperfect-indicative-plural-second-person":"glănțuiați","imperfect-indicative-plural-third-person":"glănțuiau","first-person-indicative-perfect-singular":"glănțuii","indicative-perfect-second-person-singular":"glănțuiși","indicative-perfect-singular-third-person":"glănțui","first-person-indicative-perfect-plural":"glănțuirăm","indicative-perfect-plural-second-person":"glănțuirăți","indicative-perfect-plural-third-person":"glănțuiră","first-person-indicative-pluperfect-singular":"glănțuisem","indicative-pluperfect-second-person-singular":"glănțuiseși","indicative-pluperfect-singular-third-person":"glănțuise","first-person-indicative-pluperfect-plural":"glănțuiserăm","indicative-pluperfect-plural-second-person":"glănțuiserăți","indicative-pluperfect-plural-third-person":"glănțuiseră","first-person-present-singular-subjunctive":"să glănțuiesc","present-second-person-singular-subjunctive":"să glănțuiești","present-singular-subjunctive-third-person":"să glănțuiască","first-person-plural-present-subjunctive":"să glănțuim","plural-present-second-person-subjunctive":"să glănțuiți","plural-present-subjunctive-third-person":"să glănțuiască","imperative-second-person-singular":"glănțuiește","imperative-plural-second-person":"glănțuiți","imperative-negative-second-person-singular":"nu glănțui","imperative-negative-plural-second-person":"nu glănțuiți"}},{"word":"glas","pos":"noun","definitions":["voice","mode of Orthodox chant, of which there are eight","words, speech","news"],"pronunciation":"/ɡlas/","forms":{"plural":"glasuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glas","accusative-definite-nominative-singular":"glasul","accusative-indefinite-nominative-plural":"glasuri","accusative-definite-nominative-plural":"glasurile","dative-genitive-indefinite-singular":"glas","dative-definite-genitive-singular":"glasului","dative-genitive-indefinite-plural":"glasuri","dative-definite-genitive-plural":"glasurilor","singular-vocative":"glasule","plural-vocative":"glasurilor"}},{"word":"glasa","pos":"verb","definitions":["to cover a cake with icing"],"forms":{"canonical":"a glasa 1st conjugation","present-singular-third-person":"glasează","participle-past":"glasat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a glasa","gerund":"glasând","first-person-indicative-present-singular":"glasez","indicative-present-second-person-singular":"glasezi","indicative-present-singular-third-person":"glasează","first-person-indicative-plural-present":"glasăm","indicative-plural-present-second-person":"glasați","indicative-plural-present-third-person":"glasează","first-person-imperfect-indicative-singular":"glasam","imperfect-indicative-second-person-singular":"glasai","imperfect-indicative-singular-third-person":"glasa","first-person-imperfect-indicative-plural":"glasam","imperfect-indicative-plural-second-person":"glasați","imperfect-indicative-plural-third-person":"glasau","first-person-indicative-perfect-singular":"glasai","indicative-perfect-second-person-singular":"glasași","indicative-perfect-singular-third-person":"glasă","first-person-indicative-perfect-plural":"glasarăm","indicative-perfect-plural-second-person":"glasarăți","indicative-perfect-plural-third-person":"glasară","first-person-indicative-pluperfect-singular":"glasasem","indicative-pluperfect-second-person-singular":"glasaseși","indicative-pluperfect-singular-third-person":"glasase","first-person-indicative-pluperfect-plural":"glasaserăm","indicative-pluperfect-plural-second-person":"glasaserăți","indicative-pluperfect-plural-third-person":"glasaseră","first-person-present-singular-subjunctive":"să glasez","present-second-person-singular-subjunctive":"să glasezi","present-singular-subjunctive-third-person":"să glaseze","first-person-plural-present-subjunctive":"să glasăm","plural-present-second-person-subjunctive":"să glasați","plural-present-subjunctive-third-person":"să glaseze","imperative-second-person-singular":"glasează","imperative-plural-second-person":"glasați","imperative-negative-second-person-singular":"nu glasa","imperative-negative-plural-second-person":"nu glasați"}},{"word":"glasat","pos":"adj","definitions":["candied"],"forms":{"feminine-singular":"glasată","masculine-plural":"glasați","feminine-neuter-plural":"glasate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glasat","error-unrecognized-form-feminine-indefinite-singular":"glasată","error-unrecognized-form-indefinite-masculine-plural":"glasați","error-unrecognized-form-feminine-indefinite-neuter-plural":"glasate","definite-error-unrecognized-form-masculine-neuter-singular":"glasatul","definite-error-unrecognized-form-feminine-singular":"glasata","definite-error-unrecognized-form-masculine-plural":"glasații","definite-error-unrecognized-form-feminine-neuter-plural":"glasatele"}},{"word":"glăscior","pos":"noun","definitions":["diminutive of glas; small voice"],"pronunciation":"/ɡləsˈt͡ʃjor/","forms":{"plural":"glăscioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glăscior","accusative-definite-nominative-singular":"glăsciorul","accusative-indefinite-nominative-plural":"glăscioare","accusative-definite-nominative-plural":"glăscioarele","dative-genitive-indefinite-singular":"glăscior","dative-definite-genitive-singular":"glăsciorului","dative-genitive-indefinite-plural":"glăscioare","dative-definite-genitive-plural":"glăscioarelor","singular-vocative":"glăsciorule","plural-vocative":"glăscioarelor"}},{"word":"glasnică","pos":"noun","definitions":["vowel"],"forms":{"plural":"glasnice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glasnică","accusative-definite-nominative-singular":"glasnica","accusative-indefinite-nominative-plural":"glasnice","accusative-definite-nominative-plural":"glasnicele","dative-genitive-indefinite-singular":"glasnice","dative-definite-genitive-singular":"glasnicei","dative-genitive-indefinite-plural":"glasnice","dative-definite-genitive-plural":"glasnicelor","singular-vocative":"glasnică","plural-vocative":"glasnicelor"}},{"word":"glasnost","pos":"noun","definitions":["glasnost"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glasnost","accusative-definite-nominative":"glasnostul","dative-genitive-indefinite":"glasnost","dative-definite-genitive":"glasnostului","vocative":"glasnostule"}},{"word":"glaspapir","pos":"noun","definitions":["sandpaper"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glaspapir","accusative-definite-nominative":"glaspapirul","dative-genitive-indefinite":"glaspapir","dative-definite-genitive":"glaspapirului","vocative":"glaspapirule"}},{"word":"glastră","pos":"noun","definitions":["flowerpot","vase"],"forms":{"plural":"glastre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glastră","accusative-definite-nominative-singular":"glastra","accusative-indefinite-nominative-plural":"glastre","accusative-definite-nominative-plural":"glastrele","dative-genitive-indefinite-singular":"glastre","dative-definite-genitive-singular":"glastrei","dative-genitive-indefinite-plural":"glastre","dative-definite-genitive-plural":"glastrelor","singular-vocative":"glastră","plural-vocative":"glastrelor"}},{"word":"glăsui","pos":"verb","definitions":["to speak"],"forms":{"canonical":"a glăsui 4th conjugation","present-singular-third-person":"glăsuiește","participle-past":"glăsuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a glăsui","gerund":"glăsuind","first-person-indicative-present-singular":"glăsuiesc","indicative-present-second-person-singular":"glăsuiești","indicative-present-singular-third-person":"glăsuiește","first-person-indicative-plural-present":"glăsuim","indicative-plural-present-second-person":"glăsuiți","indicative-plural-present-third-person":"glăsuiesc","first-person-imperfect-indicative-singular":"glăsuiam","imperfect-indicative-second-person-singular":"glăsuiai","imperfect-indicative-singular-third-person":"glăsuia","first-person-imperfect-indicative-plural":"glăsuiam","imperfect-indicative-plural-second-person":"glăsuiați","imperfect-indicative-plural-third-person":"glăsuiau","first-person-indicative-perfect-singular":"glăsuii","indicative-perfect-second-person-singular":"glăsuiși","indicative-perfect-singular-third-person":"glăsui","first-person-indicative-perfect-plural":"glăsuirăm","indicative-perfect-plural-second-person":"glăsuirăți","indicative-perfect-plural-third-person":"glăsuiră","first-person-indicative-pluperfect-singular":"glăsuisem","indicative-pluperfect-second-person-singular":"glăsuiseși","indicative-pluperfect-singular-third-person":"glăsuise","first-person-indicative-pluperfect-plural":"glăsuiserăm","indicative-pluperfect-plural-second-person":"glăsuiserăți","indicative-pluperfect-plural-third-person":"glăsuiseră","first-person-present-singular-subjunctive":"să glăsuiesc","present-second-person-singular-subjunctive":"să glăsuiești","present-singular-subjunctive-third-person":"să glăsuiască","first-person-plural-present-subjunctive":"să glăsuim","plural-present-second-person-subjunctive":"să glăsuiți","plural-present-subjunctive-third-person":"să glăsuiască","imperative-second-person-singular":"glăsuiește","imperative-plural-second-person":"glăsuiți","imperative-negative-second-person-singular":"nu glăsui","imperative-negative-plural-second-person":"nu glăsuiți"}},{"word":"glăsuire","pos":"noun","definitions":["voicing"],"forms":{"plural":"glăsuiri"}},{"word":"glăsuit","pos":"adj","definitions":["wailing"],"forms":{"feminine-singular":"glăsuită","masculine-plural":"glăsuiți","feminine-neuter-plural":"glăsuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glăsuit","error-unrecognized-form-feminine-indefinite-singular":"glăsuită","error-unrecognized-form-indefinite-masculine-plural":"glăsuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"glăsuite","definite-error-unrecognized-form-masculine-neuter-singular":"glăsuitul","definite-error-unrecognized-form-feminine-singular":"glăsuita","definite-error-unrecognized-form-masculine-plural":"glăsuiții","definite-error-unrecognized-form-feminine-neuter-plural":"glăsuitele"}},{"word":"glăsuit","pos":"verb","definitions":["past participle of glăsui"],"forms":{"participle-past":"of glăsui"}},{"word":"glăsuitor","pos":"adj","definitions":["singing bird"],"forms":{"feminine-singular":"glăsuitoare","masculine-plural":"glăsuitori","feminine-neuter-plural":"glăsuitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glăsuitor","error-unrecognized-form-feminine-indefinite-singular":"glăsuitoare","error-unrecognized-form-indefinite-masculine-plural":"glăsuitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"glăsuitoare","definite-error-unrecognized-form-masculine-neuter-singular":"glăsuitorul","definite-error-unrecognized-form-feminine-singular":"glăsuitoarea","definite-error-unrecognized-form-masculine-plural":"glăsuitorii","definite-error-unrecognized-form-feminine-neuter-plural":"glăsuitoarele"}},{"word":"glasul","pos":"noun","definitions":["nominative definite singular articulation of glas"]},{"word":"glăsuleț","pos":"noun","definitions":["diminutive of glas"],"forms":{"plural":"glăsulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glăsuleț","accusative-definite-nominative-singular":"glăsulețul","accusative-indefinite-nominative-plural":"glăsulețe","accusative-definite-nominative-plural":"glăsulețele","dative-genitive-indefinite-singular":"glăsuleț","dative-definite-genitive-singular":"glăsulețului","dative-genitive-indefinite-plural":"glăsulețe","dative-definite-genitive-plural":"glăsulețelor","singular-vocative":"glăsulețule","plural-vocative":"glăsulețelor"}},{"word":"glasuri","pos":"noun","definitions":["plural of glas"],"gender":"n-p"},{"word":"glăsușor","pos":"noun","definitions":["diminutive of glas"],"forms":{"plural":"glăsușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glăsușor","accusative-definite-nominative-singular":"glăsușorul","accusative-indefinite-nominative-plural":"glăsușoare","accusative-definite-nominative-plural":"glăsușoarele","dative-genitive-indefinite-singular":"glăsușor","dative-definite-genitive-singular":"glăsușorului","dative-genitive-indefinite-plural":"glăsușoare","dative-definite-genitive-plural":"glăsușoarelor","singular-vocative":"glăsușorule","plural-vocative":"glăsușoarelor"}},{"word":"glăsuț","pos":"noun","definitions":["diminutive of glas; voice of a child"],"forms":{"plural":"glăsuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glăsuț","accusative-definite-nominative-singular":"glăsuțul","accusative-indefinite-nominative-plural":"glăsuțe","accusative-definite-nominative-plural":"glăsuțele","dative-genitive-indefinite-singular":"glăsuț","dative-definite-genitive-singular":"glăsuțului","dative-genitive-indefinite-plural":"glăsuțe","dative-definite-genitive-plural":"glăsuțelor","singular-vocative":"glăsuțule","plural-vocative":"glăsuțelor"}},{"word":"glasvand","pos":"noun","definitions":["French door"],"forms":{"plural":"glasvanduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glasvand","accusative-definite-nominative-singular":"glasvandul","accusative-indefinite-nominative-plural":"glasvanduri","accusative-definite-nominative-plural":"glasvandurile","dative-genitive-indefinite-singular":"glasvand","dative-definite-genitive-singular":"glasvandului","dative-genitive-indefinite-plural":"glasvanduri","dative-definite-genitive-plural":"glasvandurilor","singular-vocative":"glasvandule","plural-vocative":"glasvandurilor"}},{"word":"glauc","pos":"adj","definitions":["glaucous"],"forms":{"feminine-singular":"glaucă","masculine-plural":"glauci","feminine-neuter-plural":"glauce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glauc","error-unrecognized-form-feminine-indefinite-singular":"glaucă","error-unrecognized-form-indefinite-masculine-plural":"glauci","error-unrecognized-form-feminine-indefinite-neuter-plural":"glauce","definite-error-unrecognized-form-masculine-neuter-singular":"glaucul","definite-error-unrecognized-form-feminine-singular":"glauca","definite-error-unrecognized-form-masculine-plural":"glaucii","definite-error-unrecognized-form-feminine-neuter-plural":"glaucele"}},{"word":"glaucom","pos":"noun","definitions":["glaucoma"],"forms":{"plural":"glaucomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glaucom","accusative-definite-nominative-singular":"glaucomul","accusative-indefinite-nominative-plural":"glaucomuri","accusative-definite-nominative-plural":"glaucomurile","dative-genitive-indefinite-singular":"glaucom","dative-definite-genitive-singular":"glaucomului","dative-genitive-indefinite-plural":"glaucomuri","dative-definite-genitive-plural":"glaucomurilor","singular-vocative":"glaucomule","plural-vocative":"glaucomurilor"}},{"word":"glaucomatos","pos":"adj","definitions":["glaucomatous"],"forms":{"feminine-singular":"glaucomatoasă","masculine-plural":"glaucomatoși","feminine-neuter-plural":"glaucomatoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glaucomatos","error-unrecognized-form-feminine-indefinite-singular":"glaucomatoasă","error-unrecognized-form-indefinite-masculine-plural":"glaucomatoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glaucomatoase","definite-error-unrecognized-form-masculine-neuter-singular":"glaucomatosul","definite-error-unrecognized-form-feminine-singular":"glaucomatoasa","definite-error-unrecognized-form-masculine-plural":"glaucomatoșii","definite-error-unrecognized-form-feminine-neuter-plural":"glaucomatoasele"}},{"word":"glauconit","pos":"noun","definitions":["glauconite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glauconit","accusative-definite-nominative-singular":"glauconitul","accusative-indefinite-nominative-plural":"glauconite","accusative-definite-nominative-plural":"glauconitele","dative-genitive-indefinite-singular":"glauconit","dative-definite-genitive-singular":"glauconitului","dative-genitive-indefinite-plural":"glauconite","dative-definite-genitive-plural":"glauconitelor","singular-vocative":"glauconitule","plural-vocative":"glauconitelor"}},{"word":"Glava","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Glava"}},{"word":"Glavă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Glavă"}},{"word":"glavă","pos":"noun","definitions":["head"],"forms":{"plural":"glave","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glavă","accusative-definite-nominative-singular":"glava","accusative-indefinite-nominative-plural":"glave","accusative-definite-nominative-plural":"glavele","dative-genitive-indefinite-singular":"glave","dative-definite-genitive-singular":"glavei","dative-genitive-indefinite-plural":"glave","dative-definite-genitive-plural":"glavelor","singular-vocative":"glavă","plural-vocative":"glavelor"}},{"word":"Glavacioc","pos":"name","definitions":["a river in Romania, tributary to the Câlniștea","a village in Ștefan cel Mare, Argeș County, Romania"],"gender":"m"},{"word":"Glavaciocul Mare","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Glavacioc"],"gender":"m"},{"word":"Glavaciocul Mic","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Glavacioc"],"gender":"m"},{"word":"Glăvan","pos":"name","definitions":["a surname","a river in Caraș-Severin County, Romania, tributary to the Buhui","a river in Caraș-Severin County, Romania, tributary to the Lozna"],"gender":"m"},{"word":"Glăvănești","pos":"name","definitions":["a commune of Bacău County, Romania","a village in Glăvănești, Bacău County, Romania","a village in Andrieșeni, Iași County, Romania"],"gender":"m"},{"word":"Glăvile","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Glăvile, Vâlcea County, Romania"],"gender":"m"},{"word":"Glavița","pos":"name","definitions":["a river in Timiș, Romania, tributary to the Canalul Coșteiu-Chizătău"],"gender":"f"},{"word":"glaviznă","pos":"noun","definitions":["chapter"],"forms":{"plural":"glavizne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glaviznă","accusative-definite-nominative-singular":"glavizna","accusative-indefinite-nominative-plural":"glavizne","accusative-definite-nominative-plural":"glaviznele","dative-genitive-indefinite-singular":"glavizne","dative-definite-genitive-singular":"glaviznei","dative-genitive-indefinite-plural":"glavizne","dative-definite-genitive-plural":"glaviznelor","singular-vocative":"glaviznă","plural-vocative":"glaviznelor"}},{"word":"glăvoacă","pos":"noun","definitions":["alternative form of zglăvoc"],"forms":{"plural":"glăvoace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glăvoacă","accusative-definite-nominative-singular":"glăvoaca","accusative-indefinite-nominative-plural":"glăvoace","accusative-definite-nominative-plural":"glăvoacele","dative-genitive-indefinite-singular":"glăvoace","dative-definite-genitive-singular":"glăvoacei","dative-genitive-indefinite-plural":"glăvoace","dative-definite-genitive-plural":"glăvoacelor","singular-vocative":"glăvoacă","plural-vocative":"glăvoacelor"}},{"word":"Glăznescu","pos":"name","definitions":["a river in Vrancea, Romania, tributary to the Șușița"],"gender":"m"},{"word":"glazura","pos":"verb","definitions":["to glaze"],"forms":{"canonical":"a glazura 1st conjugation","present-singular-third-person":"glazurează","participle-past":"glazurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a glazura","gerund":"glazurând","first-person-indicative-present-singular":"glazurez","indicative-present-second-person-singular":"glazurezi","indicative-present-singular-third-person":"glazurează","first-person-indicative-plural-present":"glazurăm","indicative-plural-present-second-person":"glazurați","indicative-plural-present-third-person":"glazurează","first-person-imperfect-indicative-singular":"glazuram","imperfect-indicative-second-person-singular":"glazurai","imperfect-indicative-singular-third-person":"glazura","first-person-imperfect-indicative-plural":"glazuram","imperfect-indicative-plural-second-person":"glazurați","imperfect-indicative-plural-third-person":"glazurau","first-person-indicative-perfect-singular":"glazurai","indicative-perfect-second-person-singular":"glazurași","indicative-perfect-singular-third-person":"glazură","first-person-indicative-perfect-plural":"glazurarăm","indicative-perfect-plural-second-person":"glazurarăți","indicative-perfect-plural-third-person":"glazurară","first-person-indicative-pluperfect-singular":"glazurasem","indicative-pluperfect-second-person-singular":"glazuraseși","indicative-pluperfect-singular-third-person":"glazurase","first-person-indicative-pluperfect-plural":"glazuraserăm","indicative-pluperfect-plural-second-person":"glazuraserăți","indicative-pluperfect-plural-third-person":"glazuraseră","first-person-present-singular-subjunctive":"să glazurez","present-second-person-singular-subjunctive":"să glazurezi","present-singular-subjunctive-third-person":"să glazureze","first-person-plural-present-subjunctive":"să glazurăm","plural-present-second-person-subjunctive":"să glazurați","plural-present-subjunctive-third-person":"să glazureze","imperative-second-person-singular":"glazurează","imperative-plural-second-person":"glazurați","imperative-negative-second-person-singular":"nu glazura","imperative-negative-plural-second-person":"nu glazurați"}},{"word":"glazură","pos":"noun","definitions":["glazing (on food)"],"forms":{"plural":"glazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"glazură","accusative-definite-nominative-singular":"glazura","accusative-indefinite-nominative-plural":"glazuri","accusative-definite-nominative-plural":"glazurile","dative-genitive-indefinite-singular":"glazuri","dative-definite-genitive-singular":"glazurii","dative-genitive-indefinite-plural":"glazuri","dative-definite-genitive-plural":"glazurilor","singular-vocative":"glazură","plural-vocative":"glazurilor"}},{"word":"glazurare","pos":"noun","definitions":["frosting"],"forms":{"plural":"glazurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"glazurare","accusative-definite-nominative-singular":"glazurarea","accusative-indefinite-nominative-plural":"glazurări","accusative-definite-nominative-plural":"glazurările","dative-genitive-indefinite-singular":"glazurări","dative-definite-genitive-singular":"glazurării","dative-genitive-indefinite-plural":"glazurări","dative-definite-genitive-plural":"glazurărilor","singular-vocative":"glazurare","plural-vocative":"glazurărilor"}},{"word":"glazurat","pos":"adj","definitions":["glazed"],"forms":{"feminine-singular":"glazurată","masculine-plural":"glazurați","feminine-neuter-plural":"glazurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glazurat","error-unrecognized-form-feminine-indefinite-singular":"glazurată","error-unrecognized-form-indefinite-masculine-plural":"glazurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"glazurate","definite-error-unrecognized-form-masculine-neuter-singular":"glazuratul","definite-error-unrecognized-form-feminine-singular":"glazurata","definite-error-unrecognized-form-masculine-plural":"glazurații","definite-error-unrecognized-form-feminine-neuter-plural":"glazuratele"}},{"word":"glazurat","pos":"verb","definitions":["past participle of glazura"],"forms":{"participle-past":"of glazura"}},{"word":"gledicie","pos":"noun","definitions":["carp bream (Abramis brama)"],"forms":{"plural":"gledicicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gledicie","accusative-definite-nominative-singular":"glediciea","accusative-indefinite-nominative-plural":"gledicicii","accusative-definite-nominative-plural":"glediciciile","dative-genitive-indefinite-singular":"gledicicii","dative-definite-genitive-singular":"glediciciii","dative-genitive-indefinite-plural":"gledicicii","dative-definite-genitive-plural":"glediciciilor","singular-vocative":"gledicie","plural-vocative":"glediciciilor"}},{"word":"gleic","pos":"adj","definitions":["clayey"],"forms":{"feminine-singular":"gleică","masculine-plural":"gleici","feminine-neuter-plural":"gleice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gleic","error-unrecognized-form-feminine-indefinite-singular":"gleică","error-unrecognized-form-indefinite-masculine-plural":"gleici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gleice","definite-error-unrecognized-form-masculine-neuter-singular":"gleicul","definite-error-unrecognized-form-feminine-singular":"gleica","definite-error-unrecognized-form-masculine-plural":"gleicii","definite-error-unrecognized-form-feminine-neuter-plural":"gleicele"}},{"word":"glenă","pos":"noun","definitions":["glenoid"],"forms":{"plural":"glene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glenă","accusative-definite-nominative-singular":"glena","accusative-indefinite-nominative-plural":"glene","accusative-definite-nominative-plural":"glenele","dative-genitive-indefinite-singular":"glene","dative-definite-genitive-singular":"glenei","dative-genitive-indefinite-plural":"glene","dative-definite-genitive-plural":"glenelor","singular-vocative":"glenă","plural-vocative":"glenelor"}},{"word":"glenoid","pos":"adj","definitions":["glenoid"],"forms":{"feminine-singular":"glenoidă","masculine-plural":"glenoizi","feminine-neuter-plural":"glenoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glenoid","error-unrecognized-form-feminine-indefinite-singular":"glenoidă","error-unrecognized-form-indefinite-masculine-plural":"glenoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"glenoide","definite-error-unrecognized-form-masculine-neuter-singular":"glenoidul","definite-error-unrecognized-form-feminine-singular":"glenoida","definite-error-unrecognized-form-masculine-plural":"glenoizii","definite-error-unrecognized-form-feminine-neuter-plural":"glenoidele"}},{"word":"glet","pos":"noun","definitions":["plaster"],"forms":{"plural":"gleturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glet","accusative-definite-nominative-singular":"gletul","accusative-indefinite-nominative-plural":"gleturi","accusative-definite-nominative-plural":"gleturile","dative-genitive-indefinite-singular":"glet","dative-definite-genitive-singular":"gletului","dative-genitive-indefinite-plural":"gleturi","dative-definite-genitive-plural":"gleturilor","singular-vocative":"gletule","plural-vocative":"gleturilor"}},{"word":"glezna","pos":"noun","definitions":["definite nominative/accusative singular of gleznă"],"pronunciation":"[ˈɡlezna]","gender":"f"},{"word":"gleznă","pos":"noun","definitions":["ankle"],"forms":{"plural":"glezne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gleznă","accusative-definite-nominative-singular":"glezna","accusative-indefinite-nominative-plural":"glezne","accusative-definite-nominative-plural":"gleznele","dative-genitive-indefinite-singular":"glezne","dative-definite-genitive-singular":"gleznei","dative-genitive-indefinite-plural":"glezne","dative-definite-genitive-plural":"gleznelor","singular-vocative":"gleznă","plural-vocative":"gleznelor"}},{"word":"glezne","pos":"noun","definitions":["plural of gleznă"]},{"word":"gleznișoară","pos":"noun","definitions":["diminutive of gleznă; small ankle"],"forms":{"plural":"gleznișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gleznișoară","accusative-definite-nominative-singular":"gleznișoara","accusative-indefinite-nominative-plural":"gleznișoare","accusative-definite-nominative-plural":"gleznișoarele","dative-genitive-indefinite-singular":"gleznișoare","dative-definite-genitive-singular":"gleznișoarei","dative-genitive-indefinite-plural":"gleznișoare","dative-definite-genitive-plural":"gleznișoarelor","singular-vocative":"gleznișoară","plural-vocative":"gleznișoarelor"}},{"word":"gliadină","pos":"noun","definitions":["gliadin"],"forms":{"plural":"gliadine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gliadină","accusative-definite-nominative-singular":"gliadina","accusative-indefinite-nominative-plural":"gliadine","accusative-definite-nominative-plural":"gliadinele","dative-genitive-indefinite-singular":"gliadine","dative-definite-genitive-singular":"gliadinei","dative-genitive-indefinite-plural":"gliadine","dative-definite-genitive-plural":"gliadinelor","singular-vocative":"gliadină","plural-vocative":"gliadinelor"}},{"word":"glial","pos":"adj","definitions":["glial"],"forms":{"feminine-singular":"glială","masculine-plural":"gliali","feminine-neuter-plural":"gliale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glial","error-unrecognized-form-feminine-indefinite-singular":"glială","error-unrecognized-form-indefinite-masculine-plural":"gliali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gliale","definite-error-unrecognized-form-masculine-neuter-singular":"glialul","definite-error-unrecognized-form-feminine-singular":"gliala","definite-error-unrecognized-form-masculine-plural":"glialii","definite-error-unrecognized-form-feminine-neuter-plural":"glialele"}},{"word":"glicemie","pos":"noun","definitions":["glycemia"],"forms":{"plural":"glicemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glicemie","accusative-definite-nominative-singular":"glicemia","accusative-indefinite-nominative-plural":"glicemii","accusative-definite-nominative-plural":"glicemiile","dative-genitive-indefinite-singular":"glicemii","dative-definite-genitive-singular":"glicemiei","dative-genitive-indefinite-plural":"glicemii","dative-definite-genitive-plural":"glicemiilor","singular-vocative":"glicemie","plural-vocative":"glicemiilor"}},{"word":"gliceridă","pos":"noun","definitions":["glyceride"],"forms":{"plural":"gliceride","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gliceridă","accusative-definite-nominative-singular":"glicerida","accusative-indefinite-nominative-plural":"gliceride","accusative-definite-nominative-plural":"gliceridele","dative-genitive-indefinite-singular":"gliceride","dative-definite-genitive-singular":"gliceridei","dative-genitive-indefinite-plural":"gliceride","dative-definite-genitive-plural":"gliceridelor","singular-vocative":"gliceridă","plural-vocative":"gliceridelor"}},{"word":"glicerină","pos":"noun","definitions":["glycerin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicerină","accusative-definite-nominative-singular":"glicerina","accusative-indefinite-nominative-plural":"glicerine","accusative-definite-nominative-plural":"glicerinele","dative-genitive-indefinite-singular":"glicerine","dative-definite-genitive-singular":"glicerinei","dative-genitive-indefinite-plural":"glicerine","dative-definite-genitive-plural":"glicerinelor","singular-vocative":"glicerină","plural-vocative":"glicerinelor"}},{"word":"glicerofosfat","pos":"noun","definitions":["glycerophosphate"],"forms":{"plural":"glicerofosfați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glicerofosfat","accusative-definite-nominative-singular":"glicerofosfatul","accusative-indefinite-nominative-plural":"glicerofosfați","accusative-definite-nominative-plural":"glicerofosfații","dative-genitive-indefinite-singular":"glicerofosfat","dative-definite-genitive-singular":"glicerofosfatului","dative-genitive-indefinite-plural":"glicerofosfați","dative-definite-genitive-plural":"glicerofosfaților","singular-vocative":"glicerofosfatule","plural-vocative":"glicerofosfaților"}},{"word":"glicerofosforic","pos":"adj","definitions":["glycerophosphoric"],"forms":{"feminine-singular":"glicerofosforică","masculine-plural":"glicerofosforici","feminine-neuter-plural":"glicerofosforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glicerofosforic","error-unrecognized-form-feminine-indefinite-singular":"glicerofosforică","error-unrecognized-form-indefinite-masculine-plural":"glicerofosforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glicerofosforice","definite-error-unrecognized-form-masculine-neuter-singular":"glicerofosforicul","definite-error-unrecognized-form-feminine-singular":"glicerofosforica","definite-error-unrecognized-form-masculine-plural":"glicerofosforicii","definite-error-unrecognized-form-feminine-neuter-plural":"glicerofosforicele"}},{"word":"glicerol","pos":"noun","definitions":["glycerol"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glicerol","accusative-definite-nominative":"glicerolul","dative-genitive-indefinite":"glicerol","dative-definite-genitive":"glicerolului","vocative":"glicerolule"}},{"word":"glicina","pos":"noun","definitions":["definite nominative/accusative singular of glicină"],"pronunciation":"[ɡliˈt͡ʃina]","gender":"f"},{"word":"glicină","pos":"noun","definitions":["wisteria","glycine"],"forms":{"plural":"glicine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicină","accusative-definite-nominative-singular":"glicina","accusative-indefinite-nominative-plural":"glicine","accusative-definite-nominative-plural":"glicinele","dative-genitive-indefinite-singular":"glicine","dative-definite-genitive-singular":"glicinei","dative-genitive-indefinite-plural":"glicine","dative-definite-genitive-plural":"glicinelor","singular-vocative":"glicină","plural-vocative":"glicinelor"}},{"word":"glicine","pos":"noun","definitions":["inflection of glicină:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ɡliˈt͡ʃine]","gender":"f"},{"word":"glicocol","pos":"noun","definitions":["glycocolle"],"forms":{"plural":"glicocoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glicocol","accusative-definite-nominative-singular":"glicocolul","accusative-indefinite-nominative-plural":"glicocoli","accusative-definite-nominative-plural":"glicocolii","dative-genitive-indefinite-singular":"glicocol","dative-definite-genitive-singular":"glicocolului","dative-genitive-indefinite-plural":"glicocoli","dative-definite-genitive-plural":"glicocolilor","singular-vocative":"glicocolule","plural-vocative":"glicocolilor"}},{"word":"glicogen","pos":"noun","definitions":["glycogen"],"forms":{"plural":"glicogeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glicogen","accusative-definite-nominative-singular":"glicogenul","accusative-indefinite-nominative-plural":"glicogeni","accusative-definite-nominative-plural":"glicogenii","dative-genitive-indefinite-singular":"glicogen","dative-definite-genitive-singular":"glicogenului","dative-genitive-indefinite-plural":"glicogeni","dative-definite-genitive-plural":"glicogenilor","singular-vocative":"glicogenule","plural-vocative":"glicogenilor"}},{"word":"glicogenetic","pos":"adj","definitions":["glycogenetic"],"forms":{"feminine-singular":"glicogenetică","masculine-plural":"glicogenetici","feminine-neuter-plural":"glicogenetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glicogenetic","error-unrecognized-form-feminine-indefinite-singular":"glicogenetică","error-unrecognized-form-indefinite-masculine-plural":"glicogenetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glicogenetice","definite-error-unrecognized-form-masculine-neuter-singular":"glicogeneticul","definite-error-unrecognized-form-feminine-singular":"glicogenetica","definite-error-unrecognized-form-masculine-plural":"glicogeneticii","definite-error-unrecognized-form-feminine-neuter-plural":"glicogeneticele"}},{"word":"glicogeneză","pos":"noun","definitions":["glycogenesis"],"forms":{"plural":"glicogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicogeneză","accusative-definite-nominative-singular":"glicogeneza","accusative-indefinite-nominative-plural":"glicogeneze","accusative-definite-nominative-plural":"glicogenezele","dative-genitive-indefinite-singular":"glicogeneze","dative-definite-genitive-singular":"glicogenezei","dative-genitive-indefinite-plural":"glicogeneze","dative-definite-genitive-plural":"glicogenezelor","singular-vocative":"glicogeneză","plural-vocative":"glicogenezelor"}},{"word":"glicogenic","pos":"adj","definitions":["glycogenic"],"forms":{"feminine-singular":"glicogenică","masculine-plural":"glicogenici","feminine-neuter-plural":"glicogenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glicogenic","error-unrecognized-form-feminine-indefinite-singular":"glicogenică","error-unrecognized-form-indefinite-masculine-plural":"glicogenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glicogenice","definite-error-unrecognized-form-masculine-neuter-singular":"glicogenicul","definite-error-unrecognized-form-feminine-singular":"glicogenica","definite-error-unrecognized-form-masculine-plural":"glicogenicii","definite-error-unrecognized-form-feminine-neuter-plural":"glicogenicele"}},{"word":"glicogenogeneză","pos":"noun","definitions":["glycogenesis"],"forms":{"plural":"glicogenogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicogenogeneză","accusative-definite-nominative-singular":"glicogenogeneza","accusative-indefinite-nominative-plural":"glicogenogeneze","accusative-definite-nominative-plural":"glicogenogenezele","dative-genitive-indefinite-singular":"glicogenogeneze","dative-definite-genitive-singular":"glicogenogenezei","dative-genitive-indefinite-plural":"glicogenogeneze","dative-definite-genitive-plural":"glicogenogenezelor","singular-vocative":"glicogenogeneză","plural-vocative":"glicogenogenezelor"}},{"word":"glicogenoliză","pos":"noun","definitions":["glycogenolysis"],"forms":{"plural":"glicogenolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicogenoliză","accusative-definite-nominative-singular":"glicogenoliza","accusative-indefinite-nominative-plural":"glicogenolize","accusative-definite-nominative-plural":"glicogenolizele","dative-genitive-indefinite-singular":"glicogenolize","dative-definite-genitive-singular":"glicogenolizei","dative-genitive-indefinite-plural":"glicogenolize","dative-definite-genitive-plural":"glicogenolizelor","singular-vocative":"glicogenoliză","plural-vocative":"glicogenolizelor"}},{"word":"glicol","pos":"noun","definitions":["glycol"],"forms":{"plural":"glicoli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glicol","accusative-definite-nominative-singular":"glicolul","accusative-indefinite-nominative-plural":"glicoli","accusative-definite-nominative-plural":"glicolii","dative-genitive-indefinite-singular":"glicol","dative-definite-genitive-singular":"glicolului","dative-genitive-indefinite-plural":"glicoli","dative-definite-genitive-plural":"glicolilor","singular-vocative":"glicolule","plural-vocative":"glicolilor"}},{"word":"glicoliză","pos":"noun","definitions":["glycolysis"],"forms":{"plural":"glicolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicoliză","accusative-definite-nominative-singular":"glicoliza","accusative-indefinite-nominative-plural":"glicolize","accusative-definite-nominative-plural":"glicolizele","dative-genitive-indefinite-singular":"glicolize","dative-definite-genitive-singular":"glicolizei","dative-genitive-indefinite-plural":"glicolize","dative-definite-genitive-plural":"glicolizelor","singular-vocative":"glicoliză","plural-vocative":"glicolizelor"}},{"word":"glicometru","pos":"noun","definitions":["glucometer"],"forms":{"plural":"glicometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glicometru","accusative-definite-nominative-singular":"glicometrul","accusative-indefinite-nominative-plural":"glicometre","accusative-definite-nominative-plural":"glicometrele","dative-genitive-indefinite-singular":"glicometru","dative-definite-genitive-singular":"glicometrului","dative-genitive-indefinite-plural":"glicometre","dative-definite-genitive-plural":"glicometrelor","singular-vocative":"glicometrule","plural-vocative":"glicometrelor"}},{"word":"gliconic","pos":"adj","definitions":["glyconic"],"forms":{"feminine-singular":"gliconică","masculine-plural":"gliconici","feminine-neuter-plural":"gliconice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gliconic","error-unrecognized-form-feminine-indefinite-singular":"gliconică","error-unrecognized-form-indefinite-masculine-plural":"gliconici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gliconice","definite-error-unrecognized-form-masculine-neuter-singular":"gliconicul","definite-error-unrecognized-form-feminine-singular":"gliconica","definite-error-unrecognized-form-masculine-plural":"gliconicii","definite-error-unrecognized-form-feminine-neuter-plural":"gliconicele"}},{"word":"glicopenie","pos":"noun","definitions":["hypoglycemia"],"forms":{"plural":"glicopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glicopenie","accusative-definite-nominative-singular":"glicopenia","accusative-indefinite-nominative-plural":"glicopenii","accusative-definite-nominative-plural":"glicopeniile","dative-genitive-indefinite-singular":"glicopenii","dative-definite-genitive-singular":"glicopeniei","dative-genitive-indefinite-plural":"glicopenii","dative-definite-genitive-plural":"glicopeniilor","singular-vocative":"glicopenie","plural-vocative":"glicopeniilor"}},{"word":"glicoproteidă","pos":"noun","definitions":["glycoprotein"],"forms":{"plural":"glicoproteide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicoproteidă","accusative-definite-nominative-singular":"glicoproteida","accusative-indefinite-nominative-plural":"glicoproteide","accusative-definite-nominative-plural":"glicoproteidele","dative-genitive-indefinite-singular":"glicoproteide","dative-definite-genitive-singular":"glicoproteidei","dative-genitive-indefinite-plural":"glicoproteide","dative-definite-genitive-plural":"glicoproteidelor","singular-vocative":"glicoproteidă","plural-vocative":"glicoproteidelor"}},{"word":"glicozidă","pos":"noun","definitions":["glycoside"],"forms":{"plural":"glicozide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glicozidă","accusative-definite-nominative-singular":"glicozida","accusative-indefinite-nominative-plural":"glicozide","accusative-definite-nominative-plural":"glicozidele","dative-genitive-indefinite-singular":"glicozide","dative-definite-genitive-singular":"glicozidei","dative-genitive-indefinite-plural":"glicozide","dative-definite-genitive-plural":"glicozidelor","singular-vocative":"glicozidă","plural-vocative":"glicozidelor"}},{"word":"glicozuric","pos":"adj","definitions":["glycosuric"],"forms":{"feminine-singular":"glicozurică","masculine-plural":"glicozurici","feminine-neuter-plural":"glicozurice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glicozuric","error-unrecognized-form-feminine-indefinite-singular":"glicozurică","error-unrecognized-form-indefinite-masculine-plural":"glicozurici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glicozurice","definite-error-unrecognized-form-masculine-neuter-singular":"glicozuricul","definite-error-unrecognized-form-feminine-singular":"glicozurica","definite-error-unrecognized-form-masculine-plural":"glicozuricii","definite-error-unrecognized-form-feminine-neuter-plural":"glicozuricele"}},{"word":"glicozurie","pos":"noun","definitions":["glycosuria"],"forms":{"plural":"glicozurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glicozurie","accusative-definite-nominative-singular":"glicozuria","accusative-indefinite-nominative-plural":"glicozurii","accusative-definite-nominative-plural":"glicozuriile","dative-genitive-indefinite-singular":"glicozurii","dative-definite-genitive-singular":"glicozuriei","dative-genitive-indefinite-plural":"glicozurii","dative-definite-genitive-plural":"glicozuriilor","singular-vocative":"glicozurie","plural-vocative":"glicozuriilor"}},{"word":"glie","pos":"noun","definitions":["soil, land"],"forms":{"plural":"glii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glie","accusative-definite-nominative-singular":"glia","accusative-indefinite-nominative-plural":"glii","accusative-definite-nominative-plural":"gliile","dative-genitive-indefinite-singular":"glii","dative-definite-genitive-singular":"gliei","dative-genitive-indefinite-plural":"glii","dative-definite-genitive-plural":"gliilor","singular-vocative":"glie","plural-vocative":"gliilor"}},{"word":"gligan","pos":"noun","definitions":["wild boar","tall person"],"forms":{"plural":"gligani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gligan","accusative-definite-nominative-singular":"gliganul","accusative-indefinite-nominative-plural":"gligani","accusative-definite-nominative-plural":"gliganii","dative-genitive-indefinite-singular":"gligan","dative-definite-genitive-singular":"gliganului","dative-genitive-indefinite-plural":"gligani","dative-definite-genitive-plural":"gliganilor","singular-vocative":"gliganule","plural-vocative":"gliganilor"}},{"word":"Gliganu de Jos","pos":"name","definitions":["a village in Rociu, Argeș County, Romania"],"gender":"m"},{"word":"Gliganu de Sus","pos":"name","definitions":["a village in Rociu, Argeș County, Romania"],"gender":"m"},{"word":"Gligoraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gligoraș"}},{"word":"Gligorescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gligorescu"}},{"word":"Gligorești","pos":"name","definitions":["a village in Vidra, Alba County, Romania","a village in Luna, Cluj County, Romania"],"gender":"m"},{"word":"Gligoriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gligoriță"}},{"word":"Gliguța","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Doamna"],"gender":"f"},{"word":"Glimboca","pos":"name","definitions":["a commune of Caraș-Severin County, Romania","a village in Glimboca, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Glîmboceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glîmboceanu"}},{"word":"Glina","pos":"name","definitions":["Glina (a commune of Ilfov County, Romania)"]},{"word":"gliom","pos":"noun","definitions":["glioma"],"forms":{"plural":"gliomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gliom","accusative-definite-nominative-singular":"gliomul","accusative-indefinite-nominative-plural":"gliomuri","accusative-definite-nominative-plural":"gliomurile","dative-genitive-indefinite-singular":"gliom","dative-definite-genitive-singular":"gliomului","dative-genitive-indefinite-plural":"gliomuri","dative-definite-genitive-plural":"gliomurilor","singular-vocative":"gliomule","plural-vocative":"gliomurilor"}},{"word":"gliosarcom","pos":"noun","definitions":["gliosarcoma"],"forms":{"plural":"gliosarcoame","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gliosarcom","accusative-definite-nominative-singular":"gliosarcomul","accusative-indefinite-nominative-plural":"gliosarcoame","accusative-definite-nominative-plural":"gliosarcoamei","dative-genitive-indefinite-singular":"gliosarcom","dative-definite-genitive-singular":"gliosarcomului","dative-genitive-indefinite-plural":"gliosarcoame","dative-definite-genitive-plural":"gliosarcoamelor","singular-vocative":"gliosarcomule","plural-vocative":"gliosarcoamelor"}},{"word":"glioză","pos":"noun","definitions":["gliosis"],"forms":{"plural":"glioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glioză","accusative-definite-nominative-singular":"glioza","accusative-indefinite-nominative-plural":"glioze","accusative-definite-nominative-plural":"gliozele","dative-genitive-indefinite-singular":"glioze","dative-definite-genitive-singular":"gliozei","dative-genitive-indefinite-plural":"glioze","dative-definite-genitive-plural":"gliozelor","singular-vocative":"glioză","plural-vocative":"gliozelor"}},{"word":"gliptal","pos":"noun","definitions":["glyptal"],"forms":{"plural":"gliptaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gliptal","accusative-definite-nominative-singular":"gliptalul","accusative-indefinite-nominative-plural":"gliptaluri","accusative-definite-nominative-plural":"gliptalurile","dative-genitive-indefinite-singular":"gliptal","dative-definite-genitive-singular":"gliptalului","dative-genitive-indefinite-plural":"gliptaluri","dative-definite-genitive-plural":"gliptalurilor","singular-vocative":"gliptalule","plural-vocative":"gliptalurilor"}},{"word":"gliptic","pos":"adj","definitions":["glyptic"],"forms":{"feminine-singular":"gliptică","masculine-plural":"gliptici","feminine-neuter-plural":"gliptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gliptic","error-unrecognized-form-feminine-indefinite-singular":"gliptică","error-unrecognized-form-indefinite-masculine-plural":"gliptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gliptice","definite-error-unrecognized-form-masculine-neuter-singular":"glipticul","definite-error-unrecognized-form-feminine-singular":"gliptica","definite-error-unrecognized-form-masculine-plural":"glipticii","definite-error-unrecognized-form-feminine-neuter-plural":"glipticele"}},{"word":"gliptică","pos":"noun","definitions":["glyptics"],"forms":{"plural":"gliptici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gliptică","accusative-definite-nominative-singular":"gliptica","accusative-indefinite-nominative-plural":"gliptici","accusative-definite-nominative-plural":"glipticile","dative-genitive-indefinite-singular":"gliptici","dative-definite-genitive-singular":"glipticii","dative-genitive-indefinite-plural":"gliptici","dative-definite-genitive-plural":"glipticilor","singular-vocative":"gliptică","plural-vocative":"glipticilor"}},{"word":"gliptodon","pos":"noun","definitions":["glyptodon"],"forms":{"plural":"gliptodoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gliptodon","accusative-definite-nominative-singular":"gliptodonul","accusative-indefinite-nominative-plural":"gliptodoni","accusative-definite-nominative-plural":"gliptodonii","dative-genitive-indefinite-singular":"gliptodon","dative-definite-genitive-singular":"gliptodonului","dative-genitive-indefinite-plural":"gliptodoni","dative-definite-genitive-plural":"gliptodonilor","singular-vocative":"gliptodonule","plural-vocative":"gliptodonilor"}},{"word":"gliptogeneză","pos":"noun","definitions":["glyptogenesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gliptogeneză","accusative-definite-nominative-singular":"gliptogeneza","accusative-indefinite-nominative-plural":"gliptogeneze","accusative-definite-nominative-plural":"gliptogenezele","dative-genitive-indefinite-singular":"gliptogeneze","dative-definite-genitive-singular":"gliptogenezei","dative-genitive-indefinite-plural":"gliptogeneze","dative-definite-genitive-plural":"gliptogenezelor","singular-vocative":"gliptogeneză","plural-vocative":"gliptogenezelor"}},{"word":"gliptografie","pos":"noun","definitions":["glyptography"],"forms":{"plural":"gliptografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gliptografie","accusative-definite-nominative-singular":"gliptografia","accusative-indefinite-nominative-plural":"gliptografii","accusative-definite-nominative-plural":"gliptografiile","dative-genitive-indefinite-singular":"gliptografii","dative-definite-genitive-singular":"gliptografiei","dative-genitive-indefinite-plural":"gliptografii","dative-definite-genitive-plural":"gliptografiilor","singular-vocative":"gliptografie","plural-vocative":"gliptografiilor"}},{"word":"gliptologie","pos":"noun","definitions":["glyptology"],"forms":{"plural":"gliptologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gliptologie","accusative-definite-nominative-singular":"gliptologia","accusative-indefinite-nominative-plural":"gliptologii","accusative-definite-nominative-plural":"gliptologiile","dative-genitive-indefinite-singular":"gliptologii","dative-definite-genitive-singular":"gliptologiei","dative-genitive-indefinite-plural":"gliptologii","dative-definite-genitive-plural":"gliptologiilor","singular-vocative":"gliptologie","plural-vocative":"gliptologiilor"}},{"word":"gliptotecă","pos":"noun","definitions":["a glyptotheque (A collection of sculptures)"],"forms":{"plural":"gliptoteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gliptotecă","accusative-definite-nominative-singular":"gliptoteca","accusative-indefinite-nominative-plural":"gliptoteci","accusative-definite-nominative-plural":"gliptotecile","dative-genitive-indefinite-singular":"gliptoteci","dative-definite-genitive-singular":"gliptotecii","dative-genitive-indefinite-plural":"gliptoteci","dative-definite-genitive-plural":"gliptotecilor","singular-vocative":"gliptotecă","plural-vocative":"gliptotecilor"}},{"word":"glisa","pos":"verb","definitions":["to glide","to glissando"],"pronunciation":"/ɡliˈsa/","forms":{"canonical":"a glisa 1st conjugation","present-singular-third-person":"glisează","participle-past":"glisat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a glisa","gerund":"glisând","first-person-indicative-present-singular":"glisez","indicative-present-second-person-singular":"glisezi","indicative-present-singular-third-person":"glisează","first-person-indicative-plural-present":"glisăm","indicative-plural-present-second-person":"glisați","indicative-plural-present-third-person":"glisează","first-person-imperfect-indicative-singular":"glisam","imperfect-indicative-second-person-singular":"glisai","imperfect-indicative-singular-third-person":"glisa","first-person-imperfect-indicative-plural":"glisam","imperfect-indicative-plural-second-person":"glisați","imperfect-indicative-plural-third-person":"glisau","first-person-indicative-perfect-singular":"glisai","indicative-perfect-second-person-singular":"glisași","indicative-perfect-singular-third-person":"glisă","first-person-indicative-perfect-plural":"glisarăm","indicative-perfect-plural-second-person":"glisarăți","indicative-perfect-plural-third-person":"glisară","first-person-indicative-pluperfect-singular":"glisasem","indicative-pluperfect-second-person-singular":"glisaseși","indicative-pluperfect-singular-third-person":"glisase","first-person-indicative-pluperfect-plural":"glisaserăm","indicative-pluperfect-plural-second-person":"glisaserăți","indicative-pluperfect-plural-third-person":"glisaseră","first-person-present-singular-subjunctive":"să glisez","present-second-person-singular-subjunctive":"să glisezi","present-singular-subjunctive-third-person":"să gliseze","first-person-plural-present-subjunctive":"să glisăm","plural-present-second-person-subjunctive":"să glisați","plural-present-subjunctive-third-person":"să gliseze","imperative-second-person-singular":"glisează","imperative-plural-second-person":"glisați","imperative-negative-second-person-singular":"nu glisa","imperative-negative-plural-second-person":"nu glisați"}},{"word":"glisadă","pos":"noun","definitions":["glissade"],"forms":{"plural":"glisade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glisadă","accusative-definite-nominative-singular":"glisada","accusative-indefinite-nominative-plural":"glisade","accusative-definite-nominative-plural":"glisadele","dative-genitive-indefinite-singular":"glisade","dative-definite-genitive-singular":"glisadei","dative-genitive-indefinite-plural":"glisade","dative-definite-genitive-plural":"glisadelor","singular-vocative":"glisadă","plural-vocative":"glisadelor"}},{"word":"glisant","pos":"adj","definitions":["sliding"],"forms":{"feminine-singular":"glisantă","masculine-plural":"glisanți","feminine-neuter-plural":"glisante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glisant","error-unrecognized-form-feminine-indefinite-singular":"glisantă","error-unrecognized-form-indefinite-masculine-plural":"glisanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"glisante","definite-error-unrecognized-form-masculine-neuter-singular":"glisantul","definite-error-unrecognized-form-feminine-singular":"glisanta","definite-error-unrecognized-form-masculine-plural":"glisanții","definite-error-unrecognized-form-feminine-neuter-plural":"glisantele"}},{"word":"glisare","pos":"noun","definitions":["glide"],"forms":{"plural":"glisări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"glisare","accusative-definite-nominative-singular":"glisarea","accusative-indefinite-nominative-plural":"glisări","accusative-definite-nominative-plural":"glisările","dative-genitive-indefinite-singular":"glisări","dative-definite-genitive-singular":"glisării","dative-genitive-indefinite-plural":"glisări","dative-definite-genitive-plural":"glisărilor","singular-vocative":"glisare","plural-vocative":"glisărilor"}},{"word":"glisieră","pos":"noun","definitions":["slide"],"forms":{"plural":"glisiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glisieră","accusative-definite-nominative-singular":"glisiera","accusative-indefinite-nominative-plural":"glisiere","accusative-definite-nominative-plural":"glisierele","dative-genitive-indefinite-singular":"glisiere","dative-definite-genitive-singular":"glisierei","dative-genitive-indefinite-plural":"glisiere","dative-definite-genitive-plural":"glisierelor","singular-vocative":"glisieră","plural-vocative":"glisierelor"}},{"word":"glisor","pos":"noun","definitions":["skimmer"],"forms":{"plural":"glisoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glisor","accusative-definite-nominative-singular":"glisorul","accusative-indefinite-nominative-plural":"glisoare","accusative-definite-nominative-plural":"glisoarele","dative-genitive-indefinite-singular":"glisor","dative-definite-genitive-singular":"glisorului","dative-genitive-indefinite-plural":"glisoare","dative-definite-genitive-plural":"glisoarelor","singular-vocative":"glisorule","plural-vocative":"glisoarelor"}},{"word":"gliuță","pos":"noun","definitions":["diminutive of glie"],"forms":{"plural":"gliuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gliuță","accusative-definite-nominative-singular":"gliuța","accusative-indefinite-nominative-plural":"gliuțe","accusative-definite-nominative-plural":"gliuțele","dative-genitive-indefinite-singular":"gliuțe","dative-definite-genitive-singular":"gliuței","dative-genitive-indefinite-plural":"gliuțe","dative-definite-genitive-plural":"gliuțelor","singular-vocative":"gliuță","plural-vocative":"gliuțelor"}},{"word":"gloabă","pos":"noun","definitions":["jade, weak horse"],"forms":{"plural":"gloabe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gloabă","accusative-definite-nominative-singular":"gloaba","accusative-indefinite-nominative-plural":"gloabe","accusative-definite-nominative-plural":"gloabele","dative-genitive-indefinite-singular":"gloabe","dative-definite-genitive-singular":"gloabei","dative-genitive-indefinite-plural":"gloabe","dative-definite-genitive-plural":"gloabelor","singular-vocative":"gloabă","plural-vocative":"gloabelor"}},{"word":"gloanță","pos":"noun","definitions":["obsolete form of glonț"],"forms":{"plural":"gloanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gloanță","accusative-definite-nominative-singular":"gloanța","accusative-indefinite-nominative-plural":"gloanțe","accusative-definite-nominative-plural":"gloanțele","dative-genitive-indefinite-singular":"gloanțe","dative-definite-genitive-singular":"gloanței","dative-genitive-indefinite-plural":"gloanțe","dative-definite-genitive-plural":"gloanțelor","singular-vocative":"gloanță","plural-vocative":"gloanțelor"}},{"word":"gloata","pos":"noun","definitions":["definite nominative/accusative singular of gloată"],"gender":"f"},{"word":"gloată","pos":"noun","definitions":["a crowd, mass, mob, herd, multitude (sometimes with a pejorative sense, as in rabble, commoners, simple people)","armed band, troop"],"forms":{"plural":"gloate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gloată","accusative-definite-nominative-singular":"gloata","accusative-indefinite-nominative-plural":"gloate","accusative-definite-nominative-plural":"gloatele","dative-genitive-indefinite-singular":"gloate","dative-definite-genitive-singular":"gloatei","dative-genitive-indefinite-plural":"gloate","dative-definite-genitive-plural":"gloatelor","singular-vocative":"gloată","plural-vocative":"gloatelor"}},{"word":"glob","pos":"noun","definitions":["globe (all senses)"],"forms":{"plural":"globuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glob","accusative-definite-nominative-singular":"globul","accusative-indefinite-nominative-plural":"globuri","accusative-definite-nominative-plural":"globurile","dative-genitive-indefinite-singular":"glob","dative-definite-genitive-singular":"globului","dative-genitive-indefinite-plural":"globuri","dative-definite-genitive-plural":"globurilor","singular-vocative":"globule","plural-vocative":"globurilor"}},{"word":"glob de cristal","pos":"noun","definitions":["crystal ball"],"forms":{"plural":"globuri de cristal"}},{"word":"glob de zăpadă","pos":"noun","definitions":["snow globe"],"forms":{"plural":"globuri de zăpadă"}},{"word":"glob luminos","pos":"noun","definitions":["light globe"],"forms":{"plural":"globuri luminoase"}},{"word":"glob ocular","pos":"noun","definitions":["eyeball"],"forms":{"plural":"globuri oculare"}},{"word":"global","pos":"adj","definitions":["global"],"forms":{"feminine-singular":"globală","masculine-plural":"globali","feminine-neuter-plural":"globale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"global","error-unrecognized-form-feminine-indefinite-singular":"globală","error-unrecognized-form-indefinite-masculine-plural":"globali","error-unrecognized-form-feminine-indefinite-neuter-plural":"globale","definite-error-unrecognized-form-masculine-neuter-singular":"globalul","definite-error-unrecognized-form-feminine-singular":"globala","definite-error-unrecognized-form-masculine-plural":"globalii","definite-error-unrecognized-form-feminine-neuter-plural":"globalele"}},{"word":"globalism","pos":"noun","definitions":["globalism"],"forms":{"plural":"globalisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"globalism","accusative-definite-nominative-singular":"globalismul","accusative-indefinite-nominative-plural":"globalisme","accusative-definite-nominative-plural":"globalismele","dative-genitive-indefinite-singular":"globalism","dative-definite-genitive-singular":"globalismului","dative-genitive-indefinite-plural":"globalisme","dative-definite-genitive-plural":"globalismelor","singular-vocative":"globalismule","plural-vocative":"globalismelor"}},{"word":"globalitate","pos":"noun","definitions":["globality"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"globalitate","accusative-definite-nominative":"globalitatea","dative-genitive-indefinite":"globalități","dative-definite-genitive":"globalității","vocative":"globalitate"}},{"word":"globaliza","pos":"verb","definitions":["to globalise, to globalize"],"pronunciation":"/ɡlo.ba.liˈza/","forms":{"canonical":"a globaliza 1st conjugation","present-singular-third-person":"globalizează","participle-past":"globalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a globaliza","gerund":"globalizând","first-person-indicative-present-singular":"globalizez","indicative-present-second-person-singular":"globalizezi","indicative-present-singular-third-person":"globalizează","first-person-indicative-plural-present":"globalizăm","indicative-plural-present-second-person":"globalizați","indicative-plural-present-third-person":"globalizează","first-person-imperfect-indicative-singular":"globalizam","imperfect-indicative-second-person-singular":"globalizai","imperfect-indicative-singular-third-person":"globaliza","first-person-imperfect-indicative-plural":"globalizam","imperfect-indicative-plural-second-person":"globalizați","imperfect-indicative-plural-third-person":"globalizau","first-person-indicative-perfect-singular":"globalizai","indicative-perfect-second-person-singular":"globalizași","indicative-perfect-singular-third-person":"globaliză","first-person-indicative-perfect-plural":"globalizarăm","indicative-perfect-plural-second-person":"globalizarăți","indicative-perfect-plural-third-person":"globalizară","first-person-indicative-pluperfect-singular":"globalizasem","indicative-pluperfect-second-person-singular":"globalizaseși","indicative-pluperfect-singular-third-person":"globalizase","first-person-indicative-pluperfect-plural":"globalizaserăm","indicative-pluperfect-plural-second-person":"globalizaserăți","indicative-pluperfect-plural-third-person":"globalizaseră","first-person-present-singular-subjunctive":"să globalizez","present-second-person-singular-subjunctive":"să globalizezi","present-singular-subjunctive-third-person":"să globalizeze","first-person-plural-present-subjunctive":"să globalizăm","plural-present-second-person-subjunctive":"să globalizați","plural-present-subjunctive-third-person":"să globalizeze","imperative-second-person-singular":"globalizează","imperative-plural-second-person":"globalizați","imperative-negative-second-person-singular":"nu globaliza","imperative-negative-plural-second-person":"nu globalizați"}},{"word":"globalizare","pos":"noun","definitions":["globalization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"globalizare","accusative-definite-nominative":"globalizarea","dative-genitive-indefinite":"globalizări","dative-definite-genitive":"globalizării","vocative":"globalizare"}},{"word":"globigerină","pos":"noun","definitions":["globigerine"],"forms":{"plural":"globigerine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"globigerină","accusative-definite-nominative-singular":"globigerina","accusative-indefinite-nominative-plural":"globigerine","accusative-definite-nominative-plural":"globigerinele","dative-genitive-indefinite-singular":"globigerine","dative-definite-genitive-singular":"globigerinei","dative-genitive-indefinite-plural":"globigerine","dative-definite-genitive-plural":"globigerinelor","singular-vocative":"globigerină","plural-vocative":"globigerinelor"}},{"word":"globină","pos":"noun","definitions":["globin"],"forms":{"plural":"globine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"globină","accusative-definite-nominative-singular":"globina","accusative-indefinite-nominative-plural":"globine","accusative-definite-nominative-plural":"globinele","dative-genitive-indefinite-singular":"globine","dative-definite-genitive-singular":"globinei","dative-genitive-indefinite-plural":"globine","dative-definite-genitive-plural":"globinelor","singular-vocative":"globină","plural-vocative":"globinelor"}},{"word":"globnic","pos":"noun","definitions":["clerk in charge with cashing fines"],"forms":{"plural":"globnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"globnic","accusative-definite-nominative-singular":"globnicul","accusative-indefinite-nominative-plural":"globnici","accusative-definite-nominative-plural":"globnicii","dative-genitive-indefinite-singular":"globnic","dative-definite-genitive-singular":"globnicului","dative-genitive-indefinite-plural":"globnici","dative-definite-genitive-plural":"globnicilor","singular-vocative":"globnicule","plural-vocative":"globnicilor"}},{"word":"globoid","pos":"noun","definitions":["globoid"],"forms":{"plural":"globoizi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"globoid","accusative-definite-nominative-singular":"globoidul","accusative-indefinite-nominative-plural":"globoizi","accusative-definite-nominative-plural":"globoizile","dative-genitive-indefinite-singular":"globoid","dative-definite-genitive-singular":"globoidului","dative-genitive-indefinite-plural":"globoizi","dative-definite-genitive-plural":"globoizilor","singular-vocative":"globoidule","plural-vocative":"globoizilor"}},{"word":"Globu Craiovei","pos":"name","definitions":["a village in Iablanița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"globul","pos":"noun","definitions":["obsolete form of globulă"],"forms":{"plural":"globuli","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"globul","accusative-definite-nominative-singular":"globulul","accusative-indefinite-nominative-plural":"globuli","accusative-definite-nominative-plural":"globulii","dative-genitive-indefinite-singular":"globul","dative-definite-genitive-singular":"globulului","dative-genitive-indefinite-plural":"globuli","dative-definite-genitive-plural":"globulilor","singular-vocative":"globulule","plural-vocative":"globulilor"}},{"word":"globul ochiului","pos":"noun","definitions":["eyeball"]},{"word":"globulă","pos":"noun","definitions":["globule"],"forms":{"plural":"globule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"globulă","accusative-definite-nominative-singular":"globula","accusative-indefinite-nominative-plural":"globule","accusative-definite-nominative-plural":"globulele","dative-genitive-indefinite-singular":"globule","dative-definite-genitive-singular":"globulei","dative-genitive-indefinite-plural":"globule","dative-definite-genitive-plural":"globulelor","singular-vocative":"globulă","plural-vocative":"globulelor"}},{"word":"globulă albă","pos":"noun","definitions":["white blood cell"],"forms":{"plural":"globule albe"}},{"word":"globulă roșie","pos":"noun","definitions":["red blood cell"],"forms":{"plural":"globule roșii"}},{"word":"globular","pos":"adj","definitions":["globular"],"forms":{"feminine-singular":"globulară","masculine-plural":"globulari","feminine-neuter-plural":"globulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"globular","error-unrecognized-form-feminine-indefinite-singular":"globulară","error-unrecognized-form-indefinite-masculine-plural":"globulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"globulare","definite-error-unrecognized-form-masculine-neuter-singular":"globularul","definite-error-unrecognized-form-feminine-singular":"globulara","definite-error-unrecognized-form-masculine-plural":"globularii","definite-error-unrecognized-form-feminine-neuter-plural":"globularele"}},{"word":"globule","pos":"noun","definitions":["vocative singular of glob"],"pronunciation":"[ˈɡlobule]","gender":"n"},{"word":"globuleț","pos":"noun","definitions":["diminutive of glob","a bauble (small shiny spherical decoration, commonly put on Christmas trees.)"],"forms":{"plural":"globulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"globuleț","accusative-definite-nominative-singular":"globulețul","accusative-indefinite-nominative-plural":"globulețe","accusative-definite-nominative-plural":"globulețele","dative-genitive-indefinite-singular":"globuleț","dative-definite-genitive-singular":"globulețului","dative-genitive-indefinite-plural":"globulețe","dative-definite-genitive-plural":"globulețelor","singular-vocative":"globulețule","plural-vocative":"globulețelor"}},{"word":"globulină","pos":"noun","definitions":["globulin"],"forms":{"plural":"globuline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"globulină","accusative-definite-nominative-singular":"globulina","accusative-indefinite-nominative-plural":"globuline","accusative-definite-nominative-plural":"globulinele","dative-genitive-indefinite-singular":"globuline","dative-definite-genitive-singular":"globulinei","dative-genitive-indefinite-plural":"globuline","dative-definite-genitive-plural":"globulinelor","singular-vocative":"globulină","plural-vocative":"globulinelor"}},{"word":"globulinemie","pos":"noun","definitions":["globulinemia"],"forms":{"plural":"globulinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"globulinemie","accusative-definite-nominative-singular":"globulinemia","accusative-indefinite-nominative-plural":"globulinemii","accusative-definite-nominative-plural":"globulinemiile","dative-genitive-indefinite-singular":"globulinemii","dative-definite-genitive-singular":"globulinemiei","dative-genitive-indefinite-plural":"globulinemii","dative-definite-genitive-plural":"globulinemiilor","singular-vocative":"globulinemie","plural-vocative":"globulinemiilor"}},{"word":"globulinurie","pos":"noun","definitions":["globulinuria"],"forms":{"plural":"globulinurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"globulinurie","accusative-definite-nominative-singular":"globulinuria","accusative-indefinite-nominative-plural":"globulinurii","accusative-definite-nominative-plural":"globulinuriile","dative-genitive-indefinite-singular":"globulinurii","dative-definite-genitive-singular":"globulinuriei","dative-genitive-indefinite-plural":"globulinurii","dative-definite-genitive-plural":"globulinuriilor","singular-vocative":"globulinurie","plural-vocative":"globulinuriilor"}},{"word":"globulizare","pos":"noun","definitions":["spheroidization"],"forms":{"plural":"globulizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"globulizare","accusative-definite-nominative-singular":"globulizarea","accusative-indefinite-nominative-plural":"globulizări","accusative-definite-nominative-plural":"globulizările","dative-genitive-indefinite-singular":"globulizări","dative-definite-genitive-singular":"globulizării","dative-genitive-indefinite-plural":"globulizări","dative-definite-genitive-plural":"globulizărilor","singular-vocative":"globulizare","plural-vocative":"globulizărilor"}},{"word":"globulos","pos":"adj","definitions":["globular"],"forms":{"feminine-singular":"globuloasă","masculine-plural":"globuloși","feminine-neuter-plural":"globuloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"globulos","error-unrecognized-form-feminine-indefinite-singular":"globuloasă","error-unrecognized-form-indefinite-masculine-plural":"globuloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"globuloase","definite-error-unrecognized-form-masculine-neuter-singular":"globulosul","definite-error-unrecognized-form-feminine-singular":"globuloasa","definite-error-unrecognized-form-masculine-plural":"globuloșii","definite-error-unrecognized-form-feminine-neuter-plural":"globuloasele"}},{"word":"globușor","pos":"noun","definitions":["diminutive of glob; small globe"],"forms":{"plural":"globușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"globușor","accusative-definite-nominative-singular":"globușorul","accusative-indefinite-nominative-plural":"globușore","accusative-definite-nominative-plural":"globușorele","dative-genitive-indefinite-singular":"globușor","dative-definite-genitive-singular":"globușorului","dative-genitive-indefinite-plural":"globușore","dative-definite-genitive-plural":"globușorelor","singular-vocative":"globușorule","plural-vocative":"globușorelor"}},{"word":"glockenspiel","pos":"noun","definitions":["glockenspiel"],"forms":{"plural":"glockenspieluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"glockenspiel","accusative-definite-nominative-singular":"glockenspielul","accusative-indefinite-nominative-plural":"glockenspieluri","accusative-definite-nominative-plural":"glockenspielurile","dative-genitive-indefinite-singular":"glockenspiel","dative-definite-genitive-singular":"glockenspielului","dative-genitive-indefinite-plural":"glockenspieluri","dative-definite-genitive-plural":"glockenspielurilor","singular-vocative":"glockenspielule","plural-vocative":"glockenspielurilor"}},{"word":"Glod","pos":"name","definitions":["a village in Almașu Mare, Alba County, Romania","a village in Moroeni, Dâmbovița County, Romania","a village in Strâmtura, Maramureș County, Romania","a village in Lapoș, Prahova County, Romania","a village in Gâlgău, Sălaj County, Romania"],"gender":"m"},{"word":"glod","pos":"noun","definitions":["mud, earth"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"glod","accusative-definite-nominative":"glodul","dative-genitive-indefinite":"glod","dative-definite-genitive":"glodului","vocative":"glodule"}},{"word":"Glodan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glodan"}},{"word":"glodăraie","pos":"noun","definitions":["a muddy place"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"glodăraie","accusative-definite-nominative":"glodăraia","dative-genitive-indefinite":"glodăraii","dative-definite-genitive":"glodăraiei","vocative":"glodăraie"}},{"word":"Glodariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Glodariu"}},{"word":"Glodean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glodean"}},{"word":"Glodeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glodeanu"}},{"word":"Glodeanu Sărat","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Glodeanu Sărat, Buzău County, Romania"],"gender":"f"},{"word":"Glodeanu-Siliștea","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Glodeanu-Siliștea, Buzău County, Romania"],"gender":"f"},{"word":"Glodeni","pos":"name","definitions":["a city and district of Moldova","a locality in Pucioasa, Dâmbovița County, Romania","a commune of Dâmbovița County, Romania","a village in Glodeni, Dâmbovița County, Romania","a village in Bălănești, Gorj County, Romania"],"pronunciation":"/ɡloˈdenʲ/","gender":"m"},{"word":"Glodenii Gândului","pos":"name","definitions":["a village in Țibănești, Iași County, Romania"],"gender":"m"},{"word":"Glodghilești","pos":"name","definitions":["a village in Burjuc, Hunedoara County, Romania"],"gender":"m"},{"word":"Glodian","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glodian"}},{"word":"Glodișoarele","pos":"name","definitions":["a village in Secuieni, Bacău County, Romania"],"gender":"m"},{"word":"Glodișor","pos":"name","definitions":["a river in Maramureș, Romania, tributary to the Jidovoaia"],"gender":"m"},{"word":"glodiște","pos":"noun","definitions":["muddy area"],"forms":{"plural":"glodiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"glodiște","accusative-definite-nominative-singular":"glodiștea","accusative-indefinite-nominative-plural":"glodiști","accusative-definite-nominative-plural":"glodiștile","dative-genitive-indefinite-singular":"glodiști","dative-definite-genitive-singular":"glodiștii","dative-genitive-indefinite-plural":"glodiști","dative-definite-genitive-plural":"glodiștilor","singular-vocative":"glodiște","plural-vocative":"glodiștilor"}},{"word":"Glodoasa","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Doftana"],"gender":"f"},{"word":"glodoros","pos":"adj","definitions":["alternative form of gloduros"],"forms":{"feminine-singular":"glodoroasă","masculine-plural":"glodoroși","feminine-neuter-plural":"glodoroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glodoros","error-unrecognized-form-feminine-indefinite-singular":"glodoroasă","error-unrecognized-form-indefinite-masculine-plural":"glodoroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glodoroase","definite-error-unrecognized-form-masculine-neuter-singular":"glodorosul","definite-error-unrecognized-form-feminine-singular":"glodoroasa","definite-error-unrecognized-form-masculine-plural":"glodoroșii","definite-error-unrecognized-form-feminine-neuter-plural":"glodoroasele"}},{"word":"glodos","pos":"adj","definitions":["alternative form of gloduros"],"forms":{"feminine-singular":"glodoasă","masculine-plural":"glodoși","feminine-neuter-plural":"glodoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glodos","error-unrecognized-form-feminine-indefinite-singular":"glodoasă","error-unrecognized-form-indefinite-masculine-plural":"glodoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glodoase","definite-error-unrecognized-form-masculine-neuter-singular":"glodosul","definite-error-unrecognized-form-feminine-singular":"glodoasa","definite-error-unrecognized-form-masculine-plural":"glodoșii","definite-error-unrecognized-form-feminine-neuter-plural":"glodoasele"}},{"word":"Glodu","pos":"name","definitions":["a village in Călinești, Argeș County, Romania","a village in Leordeni, Argeș County, Romania","a village in Panaci, Suceava County, Romania","a village in Dănicei, Vâlcea County, Romania"],"gender":"m"},{"word":"Glodu-Petcari","pos":"name","definitions":["a village in Chiliile, Buzău County, Romania"],"gender":"m"},{"word":"glodul","pos":"noun","definitions":["definite nominative/accusative singular of glod"]},{"word":"Glodul Alb","pos":"name","definitions":["a river in Botoșani, Romania, tributary to the Bașeu"],"gender":"m"},{"word":"Glodul Mare","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Secu"],"gender":"m"},{"word":"glodului","pos":"noun","definitions":["definite genitive/dative singular of glod"]},{"word":"Glodurile","pos":"name","definitions":["a village in Cozieni, Buzău County, Romania"],"gender":"n"},{"word":"gloduros","pos":"adj","definitions":["muddy"],"forms":{"feminine-singular":"gloduroasă","masculine-plural":"gloduroși","feminine-neuter-plural":"gloduroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gloduros","error-unrecognized-form-feminine-indefinite-singular":"gloduroasă","error-unrecognized-form-indefinite-masculine-plural":"gloduroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gloduroase","definite-error-unrecognized-form-masculine-neuter-singular":"glodurosul","definite-error-unrecognized-form-feminine-singular":"gloduroasa","definite-error-unrecognized-form-masculine-plural":"gloduroșii","definite-error-unrecognized-form-feminine-neuter-plural":"gloduroasele"}},{"word":"Glogova","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Glogova, Gorj County, Romania"],"gender":"f"},{"word":"Glogovăț","pos":"name","definitions":["a village in Arad County, Romania. Renamed to Vladimirescu in 1925."],"gender":"m"},{"word":"Glogoveanu","pos":"name","definitions":["a village in Șelaru, Dâmbovița County, Romania"],"gender":"m"},{"word":"Glogoveț","pos":"name","definitions":["a village in Valea Lungă, Alba County, Romania"],"gender":"m"},{"word":"Glogovețan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glogovețan"}},{"word":"Glogovețean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Glogovețean"}},{"word":"glomerul","pos":"noun","definitions":["alternative form of glomerulă"],"forms":{"plural":"glomerule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glomerul","accusative-definite-nominative-singular":"glomerulul","accusative-indefinite-nominative-plural":"glomerule","accusative-definite-nominative-plural":"glomerulele","dative-genitive-indefinite-singular":"glomerul","dative-definite-genitive-singular":"glomerulului","dative-genitive-indefinite-plural":"glomerule","dative-definite-genitive-plural":"glomerulelor","singular-vocative":"glomerulule","plural-vocative":"glomerulelor"}},{"word":"glomerulă","pos":"noun","definitions":["glomerule","glomerulus"],"forms":{"plural":"glomerule","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glomerulă","accusative-definite-nominative-singular":"glomerulăul","accusative-indefinite-nominative-plural":"glomerule","accusative-definite-nominative-plural":"glomerulele","dative-genitive-indefinite-singular":"glomerulă","dative-definite-genitive-singular":"glomerulăului","dative-genitive-indefinite-plural":"glomerule","dative-definite-genitive-plural":"glomerulelor","singular-vocative":"glomerulăule","plural-vocative":"glomerulelor"}},{"word":"glomerular","pos":"adj","definitions":["glomerate"],"forms":{"feminine-singular":"glomerulară","masculine-plural":"glomerulari","feminine-neuter-plural":"glomerulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glomerular","error-unrecognized-form-feminine-indefinite-singular":"glomerulară","error-unrecognized-form-indefinite-masculine-plural":"glomerulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"glomerulare","definite-error-unrecognized-form-masculine-neuter-singular":"glomerularul","definite-error-unrecognized-form-feminine-singular":"glomerulara","definite-error-unrecognized-form-masculine-plural":"glomerularii","definite-error-unrecognized-form-feminine-neuter-plural":"glomerularele"}},{"word":"glomerulită","pos":"noun","definitions":["glomerulitis"],"forms":{"plural":"glomerulite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glomerulită","accusative-definite-nominative-singular":"glomerulita","accusative-indefinite-nominative-plural":"glomerulite","accusative-definite-nominative-plural":"glomerulitele","dative-genitive-indefinite-singular":"glomerulite","dative-definite-genitive-singular":"glomerulitei","dative-genitive-indefinite-plural":"glomerulite","dative-definite-genitive-plural":"glomerulitelor","singular-vocative":"glomerulită","plural-vocative":"glomerulitelor"}},{"word":"glomerulonefrită","pos":"noun","definitions":["glomerulonephritis"],"forms":{"plural":"glomerulonefrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glomerulonefrită","accusative-definite-nominative-singular":"glomerulonefrita","accusative-indefinite-nominative-plural":"glomerulonefrite","accusative-definite-nominative-plural":"glomerulonefritele","dative-genitive-indefinite-singular":"glomerulonefrite","dative-definite-genitive-singular":"glomerulonefritei","dative-genitive-indefinite-plural":"glomerulonefrite","dative-definite-genitive-plural":"glomerulonefritelor","singular-vocative":"glomerulonefrită","plural-vocative":"glomerulonefritelor"}},{"word":"glomeruloscleroză","pos":"noun","definitions":["glomerulosclerosis"],"forms":{"plural":"glomeruloscleroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glomeruloscleroză","accusative-definite-nominative-singular":"glomeruloscleroza","accusative-indefinite-nominative-plural":"glomeruloscleroze","accusative-definite-nominative-plural":"glomerulosclerozele","dative-genitive-indefinite-singular":"glomeruloscleroze","dative-definite-genitive-singular":"glomerulosclerozei","dative-genitive-indefinite-plural":"glomeruloscleroze","dative-definite-genitive-plural":"glomerulosclerozelor","singular-vocative":"glomeruloscleroză","plural-vocative":"glomerulosclerozelor"}},{"word":"Glonț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Glonț"}},{"word":"glonț","pos":"noun","definitions":["bullet"],"pronunciation":"/ɡlont͡s/","forms":{"plural":"gloanțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glonț","accusative-definite-nominative-singular":"glonțul","accusative-indefinite-nominative-plural":"gloanțe","accusative-definite-nominative-plural":"gloanțele","dative-genitive-indefinite-singular":"glonț","dative-definite-genitive-singular":"glonțului","dative-genitive-indefinite-plural":"gloanțe","dative-definite-genitive-plural":"gloanțelor","singular-vocative":"glonțule","plural-vocative":"gloanțelor","alternative":"glonte"}},{"word":"glonte","pos":"noun","definitions":["bullet"],"pronunciation":"[ˈɡlon.te]","forms":{"plural":"glonte","table-tags":"no-table-tags","inflection-template":"ro-noun-n-e","accusative-indefinite-nominative-singular":"glonte","accusative-definite-nominative-singular":"glontele","accusative-indefinite-nominative-plural":"glonte","accusative-definite-nominative-plural":"glontele","dative-genitive-indefinite-singular":"glonte","dative-definite-genitive-singular":"glontelui","dative-genitive-indefinite-plural":"glonte","dative-definite-genitive-plural":"glontelor","singular-vocative":"glonte","plural-vocative":"glontelor"}},{"word":"glonțișor","pos":"noun","definitions":["diminutive of glonț"],"forms":{"plural":"glonțișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glonțișor","accusative-definite-nominative-singular":"glonțișorul","accusative-indefinite-nominative-plural":"glonțișoare","accusative-definite-nominative-plural":"glonțișoarei","dative-genitive-indefinite-singular":"glonțișor","dative-definite-genitive-singular":"glonțișorului","dative-genitive-indefinite-plural":"glonțișoare","dative-definite-genitive-plural":"glonțișoarelor","singular-vocative":"glonțișorule","plural-vocative":"glonțișoarelor"}},{"word":"glonțuleț","pos":"noun","definitions":["diminutive of glonț"],"forms":{"plural":"glonțulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glonțuleț","accusative-definite-nominative-singular":"glonțulețul","accusative-indefinite-nominative-plural":"glonțulețe","accusative-definite-nominative-plural":"glonțulețele","dative-genitive-indefinite-singular":"glonțuleț","dative-definite-genitive-singular":"glonțulețului","dative-genitive-indefinite-plural":"glonțulețe","dative-definite-genitive-plural":"glonțulețelor","singular-vocative":"glonțulețule","plural-vocative":"glonțulețelor"}},{"word":"glorie","pos":"noun","definitions":["glory"],"forms":{"plural":"glorii"}},{"word":"glorifica","pos":"verb","definitions":["to glorify"],"forms":{"canonical":"a glorifica 1st conjugation","present-singular-third-person":"glorifică","participle-past":"glorificat","subjunctive-third-person":"glorifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a glorifica","gerund":"glorificând","first-person-indicative-present-singular":"glorific","indicative-present-second-person-singular":"glorifici","indicative-present-singular-third-person":"glorifică","first-person-indicative-plural-present":"glorificăm","indicative-plural-present-second-person":"glorificați","indicative-plural-present-third-person":"glorifică","first-person-imperfect-indicative-singular":"glorificam","imperfect-indicative-second-person-singular":"glorificai","imperfect-indicative-singular-third-person":"glorifica","first-person-imperfect-indicative-plural":"glorificam","imperfect-indicative-plural-second-person":"glorificați","imperfect-indicative-plural-third-person":"glorificau","first-person-indicative-perfect-singular":"glorificai","indicative-perfect-second-person-singular":"glorificași","indicative-perfect-singular-third-person":"glorifică","first-person-indicative-perfect-plural":"glorificarăm","indicative-perfect-plural-second-person":"glorificarăți","indicative-perfect-plural-third-person":"glorificară","first-person-indicative-pluperfect-singular":"glorificasem","indicative-pluperfect-second-person-singular":"glorificaseși","indicative-pluperfect-singular-third-person":"glorificase","first-person-indicative-pluperfect-plural":"glorificaserăm","indicative-pluperfect-plural-second-person":"glorificaserăți","indicative-pluperfect-plural-third-person":"glorificaseră","first-person-present-singular-subjunctive":"să glorific","present-second-person-singular-subjunctive":"să glorifici","present-singular-subjunctive-third-person":"să glorifice","first-person-plural-present-subjunctive":"să glorificăm","plural-present-second-person-subjunctive":"să glorificați","plural-present-subjunctive-third-person":"să glorifice","imperative-second-person-singular":"glorifică","imperative-plural-second-person":"glorificați","imperative-negative-second-person-singular":"nu glorifica","imperative-negative-plural-second-person":"nu glorificați"}},{"word":"glorificare","pos":"noun","definitions":["glorification"],"forms":{"plural":"glorificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"glorificare","accusative-definite-nominative-singular":"glorificarea","accusative-indefinite-nominative-plural":"glorificări","accusative-definite-nominative-plural":"glorificările","dative-genitive-indefinite-singular":"glorificări","dative-definite-genitive-singular":"glorificării","dative-genitive-indefinite-plural":"glorificări","dative-definite-genitive-plural":"glorificărilor","singular-vocative":"glorificare","plural-vocative":"glorificărilor"}},{"word":"glorificator","pos":"adj","definitions":["glorifying"],"pronunciation":"/ˌɡlo.ri.fi.kaˈtor/","forms":{"feminine-singular":"glorificatoare","masculine-plural":"glorificatori","feminine-neuter-plural":"glorificatoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glorificator","error-unrecognized-form-feminine-indefinite-singular":"glorificatoare","error-unrecognized-form-indefinite-masculine-plural":"glorificatori","error-unrecognized-form-feminine-indefinite-neuter-plural":"glorificatoare","definite-error-unrecognized-form-masculine-neuter-singular":"glorificatorul","definite-error-unrecognized-form-feminine-singular":"glorificatoarea","definite-error-unrecognized-form-masculine-plural":"glorificatorii","definite-error-unrecognized-form-feminine-neuter-plural":"glorificatoarele"}},{"word":"gloriolă","pos":"noun","definitions":["vainglory derived from small things"],"forms":{"plural":"gloriole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gloriolă","accusative-definite-nominative-singular":"gloriola","accusative-indefinite-nominative-plural":"gloriole","accusative-definite-nominative-plural":"gloriolele","dative-genitive-indefinite-singular":"gloriole","dative-definite-genitive-singular":"gloriolei","dative-genitive-indefinite-plural":"gloriole","dative-definite-genitive-plural":"gloriolelor","singular-vocative":"gloriolă","plural-vocative":"gloriolelor"}},{"word":"glorios","pos":"adj","definitions":["glorious"],"forms":{"feminine-singular":"glorioasă","masculine-plural":"glorioși","feminine-neuter-plural":"glorioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glorios","error-unrecognized-form-feminine-indefinite-singular":"glorioasă","error-unrecognized-form-indefinite-masculine-plural":"glorioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glorioase","definite-error-unrecognized-form-masculine-neuter-singular":"gloriosul","definite-error-unrecognized-form-feminine-singular":"glorioasa","definite-error-unrecognized-form-masculine-plural":"glorioșii","definite-error-unrecognized-form-feminine-neuter-plural":"glorioasele"}},{"word":"glosă","pos":"noun","definitions":["gloss"],"forms":{"plural":"glose","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glosă","accusative-definite-nominative-singular":"glosa","accusative-indefinite-nominative-plural":"glose","accusative-definite-nominative-plural":"glosele","dative-genitive-indefinite-singular":"glose","dative-definite-genitive-singular":"glosei","dative-genitive-indefinite-plural":"glose","dative-definite-genitive-plural":"gloselor","singular-vocative":"glosă","plural-vocative":"gloselor"}},{"word":"glosalgie","pos":"noun","definitions":["glossalgia"],"forms":{"plural":"glosalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosalgie","accusative-definite-nominative-singular":"glosalgia","accusative-indefinite-nominative-plural":"glosalgii","accusative-definite-nominative-plural":"glosalgiile","dative-genitive-indefinite-singular":"glosalgii","dative-definite-genitive-singular":"glosalgiei","dative-genitive-indefinite-plural":"glosalgii","dative-definite-genitive-plural":"glosalgiilor","singular-vocative":"glosalgie","plural-vocative":"glosalgiilor"}},{"word":"glosar","pos":"noun","definitions":["glossary"],"forms":{"plural":"glosare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glosar","accusative-definite-nominative-singular":"glosarul","accusative-indefinite-nominative-plural":"glosare","accusative-definite-nominative-plural":"glosarele","dative-genitive-indefinite-singular":"glosar","dative-definite-genitive-singular":"glosarului","dative-genitive-indefinite-plural":"glosare","dative-definite-genitive-plural":"glosarelor","singular-vocative":"glosarule","plural-vocative":"glosarelor"}},{"word":"glosatoare","pos":"noun","definitions":["female equivalent of glosator"],"forms":{"plural":"glosatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"glosatoare","accusative-definite-nominative-singular":"glosatoarea","accusative-indefinite-nominative-plural":"glosatoare","accusative-definite-nominative-plural":"glosatoarele","dative-genitive-indefinite-singular":"glosatoare","dative-definite-genitive-singular":"glosatoarei","dative-genitive-indefinite-plural":"glosatoare","dative-definite-genitive-plural":"glosatoarelor","singular-vocative":"glosatoare","plural-vocative":"glosatoarelor"}},{"word":"glosator","pos":"noun","definitions":["glosser"],"forms":{"plural":"glosatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glosator","accusative-definite-nominative-singular":"glosatorul","accusative-indefinite-nominative-plural":"glosatori","accusative-definite-nominative-plural":"glosatorii","dative-genitive-indefinite-singular":"glosator","dative-definite-genitive-singular":"glosatorului","dative-genitive-indefinite-plural":"glosatori","dative-definite-genitive-plural":"glosatorilor","singular-vocative":"glosatorule","plural-vocative":"glosatorilor"}},{"word":"glosematică","pos":"noun","definitions":["glossematics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"glosematică","accusative-definite-nominative":"glosematica","dative-genitive-indefinite":"glosematice","dative-definite-genitive":"glosematicei","vocative":"glosematică"}},{"word":"glosie","pos":"noun","definitions":["language"],"forms":{"plural":"glosii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosie","accusative-definite-nominative-singular":"glosia","accusative-indefinite-nominative-plural":"glosii","accusative-definite-nominative-plural":"glosiile","dative-genitive-indefinite-singular":"glosii","dative-definite-genitive-singular":"glosiei","dative-genitive-indefinite-plural":"glosii","dative-definite-genitive-plural":"glosiilor","singular-vocative":"glosie","plural-vocative":"glosiilor"}},{"word":"glosită","pos":"noun","definitions":["glossitis"],"forms":{"plural":"glosite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glosită","accusative-definite-nominative-singular":"glosita","accusative-indefinite-nominative-plural":"glosite","accusative-definite-nominative-plural":"glositele","dative-genitive-indefinite-singular":"glosite","dative-definite-genitive-singular":"glositei","dative-genitive-indefinite-plural":"glosite","dative-definite-genitive-plural":"glositelor","singular-vocative":"glosită","plural-vocative":"glositelor"}},{"word":"glosodinie","pos":"noun","definitions":["glossodynia"],"forms":{"plural":"glosodinii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosodinie","accusative-definite-nominative-singular":"glosodinia","accusative-indefinite-nominative-plural":"glosodinii","accusative-definite-nominative-plural":"glosodiniile","dative-genitive-indefinite-singular":"glosodinii","dative-definite-genitive-singular":"glosodiniei","dative-genitive-indefinite-plural":"glosodinii","dative-definite-genitive-plural":"glosodiniilor","singular-vocative":"glosodinie","plural-vocative":"glosodiniilor"}},{"word":"glosofaringian","pos":"adj","definitions":["glossopharyngeal"],"forms":{"feminine-singular":"glosofaringiană","masculine-plural":"glosofaringieni","feminine-neuter-plural":"glosofaringiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glosofaringian","error-unrecognized-form-feminine-indefinite-singular":"glosofaringiană","error-unrecognized-form-indefinite-masculine-plural":"glosofaringieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"glosofaringiene","definite-error-unrecognized-form-masculine-neuter-singular":"glosofaringianul","definite-error-unrecognized-form-feminine-singular":"glosofaringiana","definite-error-unrecognized-form-masculine-plural":"glosofaringienii","definite-error-unrecognized-form-feminine-neuter-plural":"glosofaringienele"}},{"word":"glosografie","pos":"noun","definitions":["glossography"],"forms":{"plural":"glosografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosografie","accusative-definite-nominative-singular":"glosografia","accusative-indefinite-nominative-plural":"glosografii","accusative-definite-nominative-plural":"glosografiile","dative-genitive-indefinite-singular":"glosografii","dative-definite-genitive-singular":"glosografiei","dative-genitive-indefinite-plural":"glosografii","dative-definite-genitive-plural":"glosografiilor","singular-vocative":"glosografie","plural-vocative":"glosografiilor"}},{"word":"glosolalie","pos":"noun","definitions":["glossolalia"],"forms":{"plural":"glosolalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosolalie","accusative-definite-nominative-singular":"glosolalia","accusative-indefinite-nominative-plural":"glosolalii","accusative-definite-nominative-plural":"glosolaliile","dative-genitive-indefinite-singular":"glosolalii","dative-definite-genitive-singular":"glosolaliei","dative-genitive-indefinite-plural":"glosolalii","dative-definite-genitive-plural":"glosolaliilor","singular-vocative":"glosolalie","plural-vocative":"glosolaliilor"}},{"word":"glosologie","pos":"noun","definitions":["glossology"],"forms":{"plural":"glosologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosologie","accusative-definite-nominative-singular":"glosologia","accusative-indefinite-nominative-plural":"glosologii","accusative-definite-nominative-plural":"glosologiile","dative-genitive-indefinite-singular":"glosologii","dative-definite-genitive-singular":"glosologiei","dative-genitive-indefinite-plural":"glosologii","dative-definite-genitive-plural":"glosologiilor","singular-vocative":"glosologie","plural-vocative":"glosologiilor"}},{"word":"glosoplegie","pos":"noun","definitions":["glossoplegia"],"forms":{"plural":"glosoplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosoplegie","accusative-definite-nominative-singular":"glosoplegia","accusative-indefinite-nominative-plural":"glosoplegii","accusative-definite-nominative-plural":"glosoplegiile","dative-genitive-indefinite-singular":"glosoplegii","dative-definite-genitive-singular":"glosoplegiei","dative-genitive-indefinite-plural":"glosoplegii","dative-definite-genitive-plural":"glosoplegiilor","singular-vocative":"glosoplegie","plural-vocative":"glosoplegiilor"}},{"word":"glosoptoză","pos":"noun","definitions":["glossoptosis"],"forms":{"plural":"glosoptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glosoptoză","accusative-definite-nominative-singular":"glosoptoza","accusative-indefinite-nominative-plural":"glosoptoze","accusative-definite-nominative-plural":"glosoptozele","dative-genitive-indefinite-singular":"glosoptoze","dative-definite-genitive-singular":"glosoptozei","dative-genitive-indefinite-plural":"glosoptoze","dative-definite-genitive-plural":"glosoptozelor","singular-vocative":"glosoptoză","plural-vocative":"glosoptozelor"}},{"word":"glosotomie","pos":"noun","definitions":["glossotomy"],"forms":{"plural":"glosotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glosotomie","accusative-definite-nominative-singular":"glosotomia","accusative-indefinite-nominative-plural":"glosotomii","accusative-definite-nominative-plural":"glosotomiile","dative-genitive-indefinite-singular":"glosotomii","dative-definite-genitive-singular":"glosotomiei","dative-genitive-indefinite-plural":"glosotomii","dative-definite-genitive-plural":"glosotomiilor","singular-vocative":"glosotomie","plural-vocative":"glosotomiilor"}},{"word":"glotă","pos":"noun","definitions":["glottis"],"forms":{"plural":"glote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glotă","accusative-definite-nominative-singular":"glota","accusative-indefinite-nominative-plural":"glote","accusative-definite-nominative-plural":"glotele","dative-genitive-indefinite-singular":"glote","dative-definite-genitive-singular":"glotei","dative-genitive-indefinite-plural":"glote","dative-definite-genitive-plural":"glotelor","singular-vocative":"glotă","plural-vocative":"glotelor"}},{"word":"glotal","pos":"adj","definitions":["glottal"],"forms":{"feminine-singular":"glotală","masculine-plural":"glotali","feminine-neuter-plural":"glotale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glotal","error-unrecognized-form-feminine-indefinite-singular":"glotală","error-unrecognized-form-indefinite-masculine-plural":"glotali","error-unrecognized-form-feminine-indefinite-neuter-plural":"glotale","definite-error-unrecognized-form-masculine-neuter-singular":"glotalul","definite-error-unrecognized-form-feminine-singular":"glotala","definite-error-unrecognized-form-masculine-plural":"glotalii","definite-error-unrecognized-form-feminine-neuter-plural":"glotalele"}},{"word":"glotaș","pos":"noun","definitions":["infantry man"],"forms":{"plural":"glotași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glotaș","accusative-definite-nominative-singular":"glotașul","accusative-indefinite-nominative-plural":"glotași","accusative-definite-nominative-plural":"glotașii","dative-genitive-indefinite-singular":"glotaș","dative-definite-genitive-singular":"glotașului","dative-genitive-indefinite-plural":"glotași","dative-definite-genitive-plural":"glotașilor","singular-vocative":"glotașule","plural-vocative":"glotașilor"}},{"word":"glotită","pos":"noun","definitions":["glottitis"],"forms":{"plural":"glotite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glotită","accusative-definite-nominative-singular":"glotita","accusative-indefinite-nominative-plural":"glotite","accusative-definite-nominative-plural":"glotitele","dative-genitive-indefinite-singular":"glotite","dative-definite-genitive-singular":"glotitei","dative-genitive-indefinite-plural":"glotite","dative-definite-genitive-plural":"glotitelor","singular-vocative":"glotită","plural-vocative":"glotitelor"}},{"word":"glotologă","pos":"noun","definitions":["female equivalent of glotolog"],"forms":{"plural":"glotologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glotologă","accusative-definite-nominative-singular":"glotologa","accusative-indefinite-nominative-plural":"glotologe","accusative-definite-nominative-plural":"glotologele","dative-genitive-indefinite-singular":"glotologe","dative-definite-genitive-singular":"glotologei","dative-genitive-indefinite-plural":"glotologe","dative-definite-genitive-plural":"glotologelor","singular-vocative":"glotologă","plural-vocative":"glotologelor"}},{"word":"glotologie","pos":"noun","definitions":["glottology"],"forms":{"plural":"glotologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glotologie","accusative-definite-nominative-singular":"glotologia","accusative-indefinite-nominative-plural":"glotologii","accusative-definite-nominative-plural":"glotologiile","dative-genitive-indefinite-singular":"glotologii","dative-definite-genitive-singular":"glotologiei","dative-genitive-indefinite-plural":"glotologii","dative-definite-genitive-plural":"glotologiilor","singular-vocative":"glotologie","plural-vocative":"glotologiilor"}},{"word":"glu-glu-glu","pos":"intj","definitions":["Gobble: the cry of a turkey."]},{"word":"glucidă","pos":"noun","definitions":["carbohydrate"],"forms":{"plural":"glucide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glucidă","accusative-definite-nominative-singular":"glucida","accusative-indefinite-nominative-plural":"glucide","accusative-definite-nominative-plural":"glucidele","dative-genitive-indefinite-singular":"glucide","dative-definite-genitive-singular":"glucidei","dative-genitive-indefinite-plural":"glucide","dative-definite-genitive-plural":"glucidelor","singular-vocative":"glucidă","plural-vocative":"glucidelor"}},{"word":"glucidic","pos":"adj","definitions":["saccharidic; carbohydrate (attributive)"],"forms":{"feminine-singular":"glucidică","masculine-plural":"glucidici","feminine-neuter-plural":"glucidice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glucidic","error-unrecognized-form-feminine-indefinite-singular":"glucidică","error-unrecognized-form-indefinite-masculine-plural":"glucidici","error-unrecognized-form-feminine-indefinite-neuter-plural":"glucidice","definite-error-unrecognized-form-masculine-neuter-singular":"glucidicul","definite-error-unrecognized-form-feminine-singular":"glucidica","definite-error-unrecognized-form-masculine-plural":"glucidicii","definite-error-unrecognized-form-feminine-neuter-plural":"glucidicele"}},{"word":"gluciniu","pos":"noun","definitions":["glucinium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gluciniu","accusative-definite-nominative":"gluciniul","dative-genitive-indefinite":"gluciniu","dative-definite-genitive":"gluciniului","vocative":"gluciniule"}},{"word":"glucocorticoid","pos":"noun","definitions":["glucocorticoid"],"forms":{"plural":"glucocorticoizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"glucocorticoid","accusative-definite-nominative-singular":"glucocorticoidul","accusative-indefinite-nominative-plural":"glucocorticoizi","accusative-definite-nominative-plural":"glucocorticoizii","dative-genitive-indefinite-singular":"glucocorticoid","dative-definite-genitive-singular":"glucocorticoidului","dative-genitive-indefinite-plural":"glucocorticoizi","dative-definite-genitive-plural":"glucocorticoizilor","singular-vocative":"glucocorticoidule","plural-vocative":"glucocorticoizilor"}},{"word":"glucometrie","pos":"noun","definitions":["glucometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"glucometrie","accusative-definite-nominative":"glucometria","dative-genitive-indefinite":"glucometrii","dative-definite-genitive":"glucometriei","vocative":"glucometrie"}},{"word":"glucometru","pos":"noun","definitions":["glucometer"],"forms":{"plural":"glucometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"glucometru","accusative-definite-nominative-singular":"glucometrul","accusative-indefinite-nominative-plural":"glucometre","accusative-definite-nominative-plural":"glucometrele","dative-genitive-indefinite-singular":"glucometru","dative-definite-genitive-singular":"glucometrului","dative-genitive-indefinite-plural":"glucometre","dative-definite-genitive-plural":"glucometrelor","singular-vocative":"glucometrule","plural-vocative":"glucometrelor"}},{"word":"gluconat","pos":"noun","definitions":["gluconate"],"forms":{"plural":"gluconați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gluconat","accusative-definite-nominative-singular":"gluconatul","accusative-indefinite-nominative-plural":"gluconați","accusative-definite-nominative-plural":"gluconații","dative-genitive-indefinite-singular":"gluconat","dative-definite-genitive-singular":"gluconatului","dative-genitive-indefinite-plural":"gluconați","dative-definite-genitive-plural":"gluconaților","singular-vocative":"gluconatule","plural-vocative":"gluconaților"}},{"word":"gluconic","pos":"adj","definitions":["gluconic"],"forms":{"feminine-singular":"gluconică","masculine-plural":"gluconici","feminine-neuter-plural":"gluconice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gluconic","error-unrecognized-form-feminine-indefinite-singular":"gluconică","error-unrecognized-form-indefinite-masculine-plural":"gluconici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gluconice","definite-error-unrecognized-form-masculine-neuter-singular":"gluconicul","definite-error-unrecognized-form-feminine-singular":"gluconica","definite-error-unrecognized-form-masculine-plural":"gluconicii","definite-error-unrecognized-form-feminine-neuter-plural":"gluconicele"}},{"word":"glucoză","pos":"noun","definitions":["glucose"],"pronunciation":"/ɡluˈko.zə/","forms":{"plural":"glucoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glucoză","accusative-definite-nominative-singular":"glucoza","accusative-indefinite-nominative-plural":"glucoze","accusative-definite-nominative-plural":"glucozele","dative-genitive-indefinite-singular":"glucoze","dative-definite-genitive-singular":"glucozei","dative-genitive-indefinite-plural":"glucoze","dative-definite-genitive-plural":"glucozelor","singular-vocative":"glucoză","plural-vocative":"glucozelor"}},{"word":"glucozamină","pos":"noun","definitions":["glucosamine"],"forms":{"plural":"glucozamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glucozamină","accusative-definite-nominative-singular":"glucozamina","accusative-indefinite-nominative-plural":"glucozamine","accusative-definite-nominative-plural":"glucozaminele","dative-genitive-indefinite-singular":"glucozamine","dative-definite-genitive-singular":"glucozaminei","dative-genitive-indefinite-plural":"glucozamine","dative-definite-genitive-plural":"glucozaminelor","singular-vocative":"glucozamină","plural-vocative":"glucozaminelor"}},{"word":"glucoze","pos":"noun","definitions":["plural of glucoză"],"pronunciation":"/ɡluˈko.ze/"},{"word":"glucozidă","pos":"noun","definitions":["glucoside"],"forms":{"plural":"glucozide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glucozidă","accusative-definite-nominative-singular":"glucozida","accusative-indefinite-nominative-plural":"glucozide","accusative-definite-nominative-plural":"glucozidele","dative-genitive-indefinite-singular":"glucozide","dative-definite-genitive-singular":"glucozidei","dative-genitive-indefinite-plural":"glucozide","dative-definite-genitive-plural":"glucozidelor","singular-vocative":"glucozidă","plural-vocative":"glucozidelor"}},{"word":"Glugă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Glugă"}},{"word":"glugă","pos":"noun","definitions":["hood, covering"],"forms":{"plural":"glugi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"glugă","accusative-definite-nominative-singular":"gluga","accusative-indefinite-nominative-plural":"glugi","accusative-definite-nominative-plural":"glugile","dative-genitive-indefinite-singular":"glugi","dative-definite-genitive-singular":"glugii","dative-genitive-indefinite-plural":"glugi","dative-definite-genitive-plural":"glugilor","singular-vocative":"glugă","plural-vocative":"glugilor"}},{"word":"gluguță","pos":"noun","definitions":["diminutive of glugă"],"forms":{"plural":"gluguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gluguță","accusative-definite-nominative-singular":"gluguța","accusative-indefinite-nominative-plural":"gluguțe","accusative-definite-nominative-plural":"gluguțele","dative-genitive-indefinite-singular":"gluguțe","dative-definite-genitive-singular":"gluguței","dative-genitive-indefinite-plural":"gluguțe","dative-definite-genitive-plural":"gluguțelor","singular-vocative":"gluguță","plural-vocative":"gluguțelor"}},{"word":"gluma","pos":"noun","definitions":["definite nominative/accusative singular of glumă"],"gender":"f"},{"word":"glumă","pos":"noun","definitions":["joke, jest","prank"],"pronunciation":"/ˈɡlu.mə/","forms":{"plural":"glume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glumă","accusative-definite-nominative-singular":"gluma","accusative-indefinite-nominative-plural":"glume","accusative-definite-nominative-plural":"glumele","dative-genitive-indefinite-singular":"glume","dative-definite-genitive-singular":"glumei","dative-genitive-indefinite-plural":"glume","dative-definite-genitive-plural":"glumelor","singular-vocative":"glumă","plural-vocative":"glumelor"}},{"word":"glumă","pos":"noun","definitions":["glume"],"pronunciation":"/ˈɡlu.mə/","forms":{"plural":"glume","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glumă","accusative-definite-nominative-singular":"gluma","accusative-indefinite-nominative-plural":"glume","accusative-definite-nominative-plural":"glumele","dative-genitive-indefinite-singular":"glume","dative-definite-genitive-singular":"glumei","dative-genitive-indefinite-plural":"glume","dative-definite-genitive-plural":"glumelor","singular-vocative":"glumă","plural-vocative":"glumelor"}},{"word":"glumaș","pos":"adj","definitions":["funny person, witty"],"forms":{"feminine-singular":"glumașă","masculine-plural":"glumași","feminine-neuter-plural":"glumașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glumaș","error-unrecognized-form-feminine-indefinite-singular":"glumașă","error-unrecognized-form-indefinite-masculine-plural":"glumași","error-unrecognized-form-feminine-indefinite-neuter-plural":"glumașe","definite-error-unrecognized-form-masculine-neuter-singular":"glumașul","definite-error-unrecognized-form-feminine-singular":"glumașa","definite-error-unrecognized-form-masculine-plural":"glumașii","definite-error-unrecognized-form-feminine-neuter-plural":"glumașele"}},{"word":"glume","pos":"noun","definitions":["inflection of glumă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡlume]","gender":"f"},{"word":"glumelă","pos":"noun","definitions":["glumelle"],"forms":{"plural":"glumele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glumelă","accusative-definite-nominative-singular":"glumela","accusative-indefinite-nominative-plural":"glumele","accusative-definite-nominative-plural":"glumelele","dative-genitive-indefinite-singular":"glumele","dative-definite-genitive-singular":"glumelei","dative-genitive-indefinite-plural":"glumele","dative-definite-genitive-plural":"glumelelor","singular-vocative":"glumelă","plural-vocative":"glumelelor"}}];
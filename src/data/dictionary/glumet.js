@@ -0,0 +1 @@
+export default [{"word":"glumeț","pos":"adj","definitions":["funny person, witty"],"forms":{"feminine-singular":"glumeață","masculine-plural":"glumeți","feminine-neuter-plural":"glumețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glumeț","error-unrecognized-form-feminine-indefinite-singular":"glumeață","error-unrecognized-form-indefinite-masculine-plural":"glumeți","error-unrecognized-form-feminine-indefinite-neuter-plural":"glumețe","definite-error-unrecognized-form-masculine-neuter-singular":"glumețul","definite-error-unrecognized-form-feminine-singular":"glumeața","definite-error-unrecognized-form-masculine-plural":"glumeții","definite-error-unrecognized-form-feminine-neuter-plural":"glumețele"}},{"word":"glumi","pos":"verb","definitions":["to joke, jest"],"forms":{"canonical":"a glumi 4th conjugation","present-singular-third-person":"glumește","participle-past":"glumit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a glumi","gerund":"glumind","first-person-indicative-present-singular":"glumesc","indicative-present-second-person-singular":"glumești","indicative-present-singular-third-person":"glumește","first-person-indicative-plural-present":"glumim","indicative-plural-present-second-person":"glumiți","indicative-plural-present-third-person":"glumesc","first-person-imperfect-indicative-singular":"glumeam","imperfect-indicative-second-person-singular":"glumeai","imperfect-indicative-singular-third-person":"glumea","first-person-imperfect-indicative-plural":"glumeam","imperfect-indicative-plural-second-person":"glumeați","imperfect-indicative-plural-third-person":"glumeau","first-person-indicative-perfect-singular":"glumii","indicative-perfect-second-person-singular":"glumiși","indicative-perfect-singular-third-person":"glumi","first-person-indicative-perfect-plural":"glumirăm","indicative-perfect-plural-second-person":"glumirăți","indicative-perfect-plural-third-person":"glumiră","first-person-indicative-pluperfect-singular":"glumisem","indicative-pluperfect-second-person-singular":"glumiseși","indicative-pluperfect-singular-third-person":"glumise","first-person-indicative-pluperfect-plural":"glumiserăm","indicative-pluperfect-plural-second-person":"glumiserăți","indicative-pluperfect-plural-third-person":"glumiseră","first-person-present-singular-subjunctive":"să glumesc","present-second-person-singular-subjunctive":"să glumești","present-singular-subjunctive-third-person":"să glumească","first-person-plural-present-subjunctive":"să glumim","plural-present-second-person-subjunctive":"să glumiți","plural-present-subjunctive-third-person":"să glumească","imperative-second-person-singular":"glumește","imperative-plural-second-person":"glumiți","imperative-negative-second-person-singular":"nu glumi","imperative-negative-plural-second-person":"nu glumiți"}},{"word":"glumie","pos":"noun","definitions":["joke"],"forms":{"plural":"glumii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glumie","accusative-definite-nominative-singular":"glumia","accusative-indefinite-nominative-plural":"glumii","accusative-definite-nominative-plural":"glumiile","dative-genitive-indefinite-singular":"glumii","dative-definite-genitive-singular":"glumiei","dative-genitive-indefinite-plural":"glumii","dative-definite-genitive-plural":"glumiilor","singular-vocative":"glumie","plural-vocative":"glumiilor"}},{"word":"glupav","pos":"adj","definitions":["stupid, silly"],"forms":{"feminine-singular":"glupavă","masculine-plural":"glupavi","feminine-neuter-plural":"glupave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glupav","error-unrecognized-form-feminine-indefinite-singular":"glupavă","error-unrecognized-form-indefinite-masculine-plural":"glupavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"glupave","definite-error-unrecognized-form-masculine-neuter-singular":"glupavul","definite-error-unrecognized-form-feminine-singular":"glupava","definite-error-unrecognized-form-masculine-plural":"glupavii","definite-error-unrecognized-form-feminine-neuter-plural":"glupavele"}},{"word":"glutamină","pos":"noun","definitions":["glutamine"],"forms":{"plural":"glutamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glutamină","accusative-definite-nominative-singular":"glutamina","accusative-indefinite-nominative-plural":"glutamine","accusative-definite-nominative-plural":"glutaminele","dative-genitive-indefinite-singular":"glutamine","dative-definite-genitive-singular":"glutaminei","dative-genitive-indefinite-plural":"glutamine","dative-definite-genitive-plural":"glutaminelor","singular-vocative":"glutamină","plural-vocative":"glutaminelor"}},{"word":"gluteină","pos":"noun","definitions":["glutenin"],"forms":{"plural":"gluteine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gluteină","accusative-definite-nominative-singular":"gluteina","accusative-indefinite-nominative-plural":"gluteine","accusative-definite-nominative-plural":"gluteinele","dative-genitive-indefinite-singular":"gluteine","dative-definite-genitive-singular":"gluteinei","dative-genitive-indefinite-plural":"gluteine","dative-definite-genitive-plural":"gluteinelor","singular-vocative":"gluteină","plural-vocative":"gluteinelor"}},{"word":"gluten","pos":"noun","definitions":["gluten"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gluten","accusative-definite-nominative":"glutenul","dative-genitive-indefinite":"gluten","dative-definite-genitive":"glutenului","vocative":"glutenule"}},{"word":"glutenină","pos":"noun","definitions":["glutenin"],"forms":{"plural":"glutenine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"glutenină","accusative-definite-nominative-singular":"glutenina","accusative-indefinite-nominative-plural":"glutenine","accusative-definite-nominative-plural":"gluteninele","dative-genitive-indefinite-singular":"glutenine","dative-definite-genitive-singular":"gluteninei","dative-genitive-indefinite-plural":"glutenine","dative-definite-genitive-plural":"gluteninelor","singular-vocative":"glutenină","plural-vocative":"gluteninelor"}},{"word":"glutinație","pos":"noun","definitions":["glutination"],"forms":{"plural":"glutinații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"glutinație","accusative-definite-nominative-singular":"glutinația","accusative-indefinite-nominative-plural":"glutinații","accusative-definite-nominative-plural":"glutinațiile","dative-genitive-indefinite-singular":"glutinații","dative-definite-genitive-singular":"glutinației","dative-genitive-indefinite-plural":"glutinații","dative-definite-genitive-plural":"glutinațiilor","singular-vocative":"glutinație","plural-vocative":"glutinațiilor"}},{"word":"glutinos","pos":"adj","definitions":["glutinous"],"forms":{"feminine-singular":"glutinoasă","masculine-plural":"glutinoși","feminine-neuter-plural":"glutinoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"glutinos","error-unrecognized-form-feminine-indefinite-singular":"glutinoasă","error-unrecognized-form-indefinite-masculine-plural":"glutinoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"glutinoase","definite-error-unrecognized-form-masculine-neuter-singular":"glutinosul","definite-error-unrecognized-form-feminine-singular":"glutinoasa","definite-error-unrecognized-form-masculine-plural":"glutinoșii","definite-error-unrecognized-form-feminine-neuter-plural":"glutinoasele"}},{"word":"gluton","pos":"noun","definitions":["wolverine (Gulo gulo)"],"pronunciation":"/ɡluˈton/","forms":{"plural":"glutoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gluton","accusative-definite-nominative-singular":"glutonul","accusative-indefinite-nominative-plural":"glutoni","accusative-definite-nominative-plural":"glutonii","dative-genitive-indefinite-singular":"gluton","dative-definite-genitive-singular":"glutonului","dative-genitive-indefinite-plural":"glutoni","dative-definite-genitive-plural":"glutonilor","singular-vocative":"glutonule","plural-vocative":"glutonilor"}},{"word":"glutoni","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of gluton"],"pronunciation":"/ɡluˈtonʲ/"},{"word":"glutonii","pos":"noun","definitions":["definite nominative/accusative plural of gluton"]},{"word":"glutonilor","pos":"noun","definitions":["definite genitive/dative plural of gluton"]},{"word":"glutonul","pos":"noun","definitions":["definite nominative/accusative singular of gluton"]},{"word":"glutonului","pos":"noun","definitions":["definite genitive/dative singular of gluton"]},{"word":"gnais","pos":"noun","definitions":["gneiss"],"forms":{"plural":"gnaisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gnais","accusative-definite-nominative-singular":"gnaisul","accusative-indefinite-nominative-plural":"gnaisuri","accusative-definite-nominative-plural":"gnaisurile","dative-genitive-indefinite-singular":"gnais","dative-definite-genitive-singular":"gnaisului","dative-genitive-indefinite-plural":"gnaisuri","dative-definite-genitive-plural":"gnaisurilor","singular-vocative":"gnaisule","plural-vocative":"gnaisurilor"}},{"word":"gnochi","pos":"noun","definitions":["gnocchi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gnochi","accusative-definite-nominative":"gnochile","dative-genitive-indefinite":"gnochi","dative-definite-genitive":"gnochilor","vocative":"gnochilor"}},{"word":"gnom","pos":"noun","definitions":["gnome"],"forms":{"plural":"gnomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gnom","accusative-definite-nominative-singular":"gnomul","accusative-indefinite-nominative-plural":"gnomi","accusative-definite-nominative-plural":"gnomii","dative-genitive-indefinite-singular":"gnom","dative-definite-genitive-singular":"gnomului","dative-genitive-indefinite-plural":"gnomi","dative-definite-genitive-plural":"gnomilor","singular-vocative":"gnomule","plural-vocative":"gnomilor"}},{"word":"gnomic","pos":"adj","definitions":["gnomic"],"forms":{"feminine-singular":"gnomică","masculine-plural":"gnomici","feminine-neuter-plural":"gnomice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gnomic","error-unrecognized-form-feminine-indefinite-singular":"gnomică","error-unrecognized-form-indefinite-masculine-plural":"gnomici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gnomice","definite-error-unrecognized-form-masculine-neuter-singular":"gnomicul","definite-error-unrecognized-form-feminine-singular":"gnomica","definite-error-unrecognized-form-masculine-plural":"gnomicii","definite-error-unrecognized-form-feminine-neuter-plural":"gnomicele"}},{"word":"gnomism","pos":"noun","definitions":["gnomism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gnomism","accusative-definite-nominative":"gnomismul","dative-genitive-indefinite":"gnomism","dative-definite-genitive":"gnomismului","vocative":"gnomismule"}},{"word":"gnomologic","pos":"adj","definitions":["gnomological"],"forms":{"feminine-singular":"gnomologică","masculine-plural":"gnomologici","feminine-neuter-plural":"gnomologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gnomologic","error-unrecognized-form-feminine-indefinite-singular":"gnomologică","error-unrecognized-form-indefinite-masculine-plural":"gnomologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gnomologice","definite-error-unrecognized-form-masculine-neuter-singular":"gnomologicul","definite-error-unrecognized-form-feminine-singular":"gnomologica","definite-error-unrecognized-form-masculine-plural":"gnomologicii","definite-error-unrecognized-form-feminine-neuter-plural":"gnomologicele"}},{"word":"gnomologie","pos":"noun","definitions":["gnomology"],"forms":{"plural":"gnomologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gnomologie","accusative-definite-nominative-singular":"gnomologia","accusative-indefinite-nominative-plural":"gnomologii","accusative-definite-nominative-plural":"gnomologiile","dative-genitive-indefinite-singular":"gnomologii","dative-definite-genitive-singular":"gnomologiei","dative-genitive-indefinite-plural":"gnomologii","dative-definite-genitive-plural":"gnomologiilor","singular-vocative":"gnomologie","plural-vocative":"gnomologiilor"}},{"word":"gnomon","pos":"noun","definitions":["gnomon"],"pronunciation":"/ɡnoˈmon/","forms":{"plural":"gnomoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gnomon","accusative-definite-nominative-singular":"gnomonul","accusative-indefinite-nominative-plural":"gnomoane","accusative-definite-nominative-plural":"gnomoanele","dative-genitive-indefinite-singular":"gnomon","dative-definite-genitive-singular":"gnomonului","dative-genitive-indefinite-plural":"gnomoane","dative-definite-genitive-plural":"gnomoanelor","singular-vocative":"gnomonule","plural-vocative":"gnomoanelor"}},{"word":"gnomonică","pos":"noun","definitions":["gnomonics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gnomonică","accusative-definite-nominative":"gnomonica","dative-genitive-indefinite":"gnomonice","dative-definite-genitive":"gnomonicei","vocative":"gnomonică"}},{"word":"gnoseologic","pos":"adj","definitions":["gnosiological"],"forms":{"feminine-singular":"gnoseologică","masculine-plural":"gnoseologici","feminine-neuter-plural":"gnoseologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gnoseologic","error-unrecognized-form-feminine-indefinite-singular":"gnoseologică","error-unrecognized-form-indefinite-masculine-plural":"gnoseologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gnoseologice","definite-error-unrecognized-form-masculine-neuter-singular":"gnoseologicul","definite-error-unrecognized-form-feminine-singular":"gnoseologica","definite-error-unrecognized-form-masculine-plural":"gnoseologicii","definite-error-unrecognized-form-feminine-neuter-plural":"gnoseologicele"}},{"word":"gnoseologie","pos":"noun","definitions":["epistemology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gnoseologie","accusative-definite-nominative":"gnoseologia","dative-genitive-indefinite":"gnoseologii","dative-definite-genitive":"gnoseologiei","vocative":"gnoseologie"}},{"word":"gnostic","pos":"adj","definitions":["Gnostic; of or pertaining to Gnosticism"],"pronunciation":"/ˈɡnos.tik/","forms":{"feminine-singular":"gnostică","masculine-plural":"gnostici","feminine-neuter-plural":"gnostice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gnostic","error-unrecognized-form-feminine-indefinite-singular":"gnostică","error-unrecognized-form-indefinite-masculine-plural":"gnostici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gnostice","definite-error-unrecognized-form-masculine-neuter-singular":"gnosticul","definite-error-unrecognized-form-feminine-singular":"gnostica","definite-error-unrecognized-form-masculine-plural":"gnosticii","definite-error-unrecognized-form-feminine-neuter-plural":"gnosticele"}},{"word":"gnostic","pos":"noun","definitions":["a Gnostic; an adherent of Gnosticism"],"pronunciation":"/ˈɡnos.tik/","forms":{"plural":"gnostici","feminine":"equivalent gnostică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gnostic","accusative-definite-nominative-singular":"gnosticul","accusative-indefinite-nominative-plural":"gnostici","accusative-definite-nominative-plural":"gnosticii","dative-genitive-indefinite-singular":"gnostic","dative-definite-genitive-singular":"gnosticului","dative-genitive-indefinite-plural":"gnostici","dative-definite-genitive-plural":"gnosticilor","singular-vocative":"gnosticule","plural-vocative":"gnosticilor"}},{"word":"gnostică","pos":"noun","definitions":["female equivalent of gnostic"],"forms":{"plural":"gnostice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gnostică","accusative-definite-nominative-singular":"gnostica","accusative-indefinite-nominative-plural":"gnostice","accusative-definite-nominative-plural":"gnosticele","dative-genitive-indefinite-singular":"gnostice","dative-definite-genitive-singular":"gnosticei","dative-genitive-indefinite-plural":"gnostice","dative-definite-genitive-plural":"gnosticelor","singular-vocative":"gnostică","plural-vocative":"gnosticelor"}},{"word":"gnostici","pos":"noun","definitions":["indefinite plural of gnostic"],"pronunciation":"[ˈɡnostit͡ʃʲ]","gender":"m"},{"word":"gnosticism","pos":"noun","definitions":["Gnosticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gnosticism","accusative-definite-nominative":"gnosticismul","dative-genitive-indefinite":"gnosticism","dative-definite-genitive":"gnosticismului","vocative":"gnosticismule"}},{"word":"gnoză","pos":"noun","definitions":["gnosis"],"forms":{"plural":"gnoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gnoză","accusative-definite-nominative-singular":"gnoza","accusative-indefinite-nominative-plural":"gnoze","accusative-definite-nominative-plural":"gnozele","dative-genitive-indefinite-singular":"gnoze","dative-definite-genitive-singular":"gnozei","dative-genitive-indefinite-plural":"gnoze","dative-definite-genitive-plural":"gnozelor","singular-vocative":"gnoză","plural-vocative":"gnozelor"}},{"word":"gnozie","pos":"noun","definitions":["gnosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gnozie","accusative-definite-nominative":"gnozia","dative-genitive-indefinite":"gnozii","dative-definite-genitive":"gnoziei","vocative":"gnozie"}},{"word":"gnu","pos":"noun","definitions":["gnu, wildebeest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gnu","accusative-definite-nominative":"gnul","dative-genitive-indefinite":"gnu","dative-definite-genitive":"gnului","vocative":"gnule"}},{"word":"goană","pos":"noun","definitions":["race"],"forms":{"plural":"goane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goană","accusative-definite-nominative-singular":"goana","accusative-indefinite-nominative-plural":"goane","accusative-definite-nominative-plural":"goanele","dative-genitive-indefinite-singular":"goane","dative-definite-genitive-singular":"goanei","dative-genitive-indefinite-plural":"goane","dative-definite-genitive-plural":"goanelor","singular-vocative":"goană","plural-vocative":"goanelor"}},{"word":"Goangă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goangă"}},{"word":"goangă","pos":"noun","definitions":["insect, critter"],"forms":{"plural":"goange","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goangă","accusative-definite-nominative-singular":"goanga","accusative-indefinite-nominative-plural":"goange","accusative-definite-nominative-plural":"goangele","dative-genitive-indefinite-singular":"goange","dative-definite-genitive-singular":"goangei","dative-genitive-indefinite-plural":"goange","dative-definite-genitive-plural":"goangelor","singular-vocative":"goangă","plural-vocative":"goangelor"}},{"word":"Goanța","pos":"name","definitions":["a village in Braniștea, Mehedinți County, Romania"],"gender":"f"},{"word":"Goarnă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goarnă"}},{"word":"goarnă","pos":"noun","definitions":["bugle"],"forms":{"plural":"goarne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goarnă","accusative-definite-nominative-singular":"goarna","accusative-indefinite-nominative-plural":"goarne","accusative-definite-nominative-plural":"goarnele","dative-genitive-indefinite-singular":"goarne","dative-definite-genitive-singular":"goarnei","dative-genitive-indefinite-plural":"goarne","dative-definite-genitive-plural":"goarnelor","singular-vocative":"goarnă","plural-vocative":"goarnelor"}},{"word":"Goașele","pos":"name","definitions":["a locality in Cugir, Alba County, Romania"],"gender":"m"},{"word":"goață","pos":"noun","definitions":["potato (Solanum tuberosum)"],"forms":{"plural":"goațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goață","accusative-definite-nominative-singular":"goața","accusative-indefinite-nominative-plural":"goațe","accusative-definite-nominative-plural":"goațele","dative-genitive-indefinite-singular":"goațe","dative-definite-genitive-singular":"goaței","dative-genitive-indefinite-plural":"goațe","dative-definite-genitive-plural":"goațelor","singular-vocative":"goață","plural-vocative":"goațelor"}},{"word":"gobelet","pos":"noun","definitions":["goblet, cup"],"forms":{"plural":"gobeleturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gobelet","accusative-definite-nominative-singular":"gobeletul","accusative-indefinite-nominative-plural":"gobeleturi","accusative-definite-nominative-plural":"gobeleturile","dative-genitive-indefinite-singular":"gobelet","dative-definite-genitive-singular":"gobeletului","dative-genitive-indefinite-plural":"gobeleturi","dative-definite-genitive-plural":"gobeleturilor","singular-vocative":"gobeletule","plural-vocative":"gobeleturilor"}},{"word":"goblen","pos":"noun","definitions":["arras, tapestry"],"forms":{"plural":"goblenuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"goblen","accusative-definite-nominative-singular":"goblenul","accusative-indefinite-nominative-plural":"goblenuri","accusative-definite-nominative-plural":"goblenurile","dative-genitive-indefinite-singular":"goblen","dative-definite-genitive-singular":"goblenului","dative-genitive-indefinite-plural":"goblenuri","dative-definite-genitive-plural":"goblenurilor","singular-vocative":"goblenule","plural-vocative":"goblenurilor"}},{"word":"goblizan","pos":"noun","definitions":["alternative form of coblizan"],"forms":{"plural":"goblizani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"goblizan","accusative-definite-nominative-singular":"goblizanul","accusative-indefinite-nominative-plural":"goblizani","accusative-definite-nominative-plural":"goblizanii","dative-genitive-indefinite-singular":"goblizan","dative-definite-genitive-singular":"goblizanului","dative-genitive-indefinite-plural":"goblizani","dative-definite-genitive-plural":"goblizanilor","singular-vocative":"goblizanule","plural-vocative":"goblizanilor"}},{"word":"gociman","pos":"noun","definitions":["church trustee, churchwarden"],"forms":{"plural":"gocimani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gociman","accusative-definite-nominative-singular":"gocimanul","accusative-indefinite-nominative-plural":"gocimani","accusative-definite-nominative-plural":"gocimanii","dative-genitive-indefinite-singular":"gociman","dative-definite-genitive-singular":"gocimanului","dative-genitive-indefinite-plural":"gocimani","dative-definite-genitive-plural":"gocimanilor","singular-vocative":"gocimanule","plural-vocative":"gocimanilor"}},{"word":"godac","pos":"noun","definitions":["piglet"],"forms":{"plural":"godaci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"godac","accusative-definite-nominative-singular":"godacul","accusative-indefinite-nominative-plural":"godaci","accusative-definite-nominative-plural":"godacii","dative-genitive-indefinite-singular":"godac","dative-definite-genitive-singular":"godacului","dative-genitive-indefinite-plural":"godaci","dative-definite-genitive-plural":"godacilor","singular-vocative":"godacule","plural-vocative":"godacilor"}},{"word":"godăcel","pos":"noun","definitions":["diminutive of godac"],"forms":{"plural":"godăcei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"godăcel","accusative-definite-nominative-singular":"godăcelul","accusative-indefinite-nominative-plural":"godăcei","accusative-definite-nominative-plural":"godăceii","dative-genitive-indefinite-singular":"godăcel","dative-definite-genitive-singular":"godăcelului","dative-genitive-indefinite-plural":"godăcei","dative-definite-genitive-plural":"godăceilor","singular-vocative":"godăcelule","plural-vocative":"godăceilor"}},{"word":"godavil","pos":"noun","definitions":["alternative form of godevil"],"forms":{"plural":"godaviluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"godavil","accusative-definite-nominative-singular":"godavilul","accusative-indefinite-nominative-plural":"godaviluri","accusative-definite-nominative-plural":"godavilurile","dative-genitive-indefinite-singular":"godavil","dative-definite-genitive-singular":"godavilului","dative-genitive-indefinite-plural":"godaviluri","dative-definite-genitive-plural":"godavilurilor","singular-vocative":"godavilule","plural-vocative":"godavilurilor"}},{"word":"Godeanu","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Godeanu, Mehedinți County, Romania","a village in Obârșia-Cloșani, Mehedinți County, Romania","a surname"],"gender":"m"},{"word":"godelui","pos":"adv","definitions":["as though, as if"]},{"word":"goden","pos":"noun","definitions":["alternative form of godin"],"forms":{"plural":"godenuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"goden","accusative-definite-nominative-singular":"godenul","accusative-indefinite-nominative-plural":"godenuri","accusative-definite-nominative-plural":"godenurile","dative-genitive-indefinite-singular":"goden","dative-definite-genitive-singular":"godenului","dative-genitive-indefinite-plural":"godenuri","dative-definite-genitive-plural":"godenurilor","singular-vocative":"godenule","plural-vocative":"godenurilor"}},{"word":"Godeni","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Godeni, Argeș County, Romania","a village in Melinești, Dolj County, Romania"],"gender":"m"},{"word":"godeu","pos":"noun","definitions":["godet"],"forms":{"plural":"godeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"godeu","accusative-definite-nominative-singular":"godeuul","accusative-indefinite-nominative-plural":"godeuri","accusative-definite-nominative-plural":"godeurile","dative-genitive-indefinite-singular":"godeu","dative-definite-genitive-singular":"godeuului","dative-genitive-indefinite-plural":"godeuri","dative-definite-genitive-plural":"godeurilor","singular-vocative":"godeuule","plural-vocative":"godeurilor"}},{"word":"godie","pos":"noun","definitions":["sculling oar"],"forms":{"plural":"godii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"godie","accusative-definite-nominative-singular":"godia","accusative-indefinite-nominative-plural":"godii","accusative-definite-nominative-plural":"godiile","dative-genitive-indefinite-singular":"godii","dative-definite-genitive-singular":"godiei","dative-genitive-indefinite-plural":"godii","dative-definite-genitive-plural":"godiilor","singular-vocative":"godie","plural-vocative":"godiilor"}},{"word":"godina","pos":"noun","definitions":["definite nominative/accusative singular of godină"]},{"word":"godină","pos":"noun","definitions":["cantaloupe"],"forms":{"plural":"godine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"godină","accusative-definite-nominative-singular":"godina","accusative-indefinite-nominative-plural":"godine","accusative-definite-nominative-plural":"godinele","dative-genitive-indefinite-singular":"godine","dative-definite-genitive-singular":"godinei","dative-genitive-indefinite-plural":"godine","dative-definite-genitive-plural":"godinelor","singular-vocative":"godină","plural-vocative":"godinelor"}},{"word":"godinaș","pos":"noun","definitions":["diminutive of godin"],"forms":{"plural":"godinași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"godinaș","accusative-definite-nominative-singular":"godinașul","accusative-indefinite-nominative-plural":"godinași","accusative-definite-nominative-plural":"godinașii","dative-genitive-indefinite-singular":"godinaș","dative-definite-genitive-singular":"godinașului","dative-genitive-indefinite-plural":"godinași","dative-definite-genitive-plural":"godinașilor","singular-vocative":"godinașule","plural-vocative":"godinașilor"}},{"word":"Godinești","pos":"name","definitions":["a commune of Gorj County, Romania","a village in Godinești, Gorj County, Romania","a village in Zam, Hunedoara County, Romania"],"gender":"m"},{"word":"Godineștii de Jos","pos":"name","definitions":["a village in Vultureni, Bacău County, Romania"],"gender":"m"},{"word":"Godineștii de Sus","pos":"name","definitions":["a village in Vultureni, Bacău County, Romania"],"gender":"m"},{"word":"Godinoasa","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Sohodol"],"gender":"f"},{"word":"godron","pos":"noun","definitions":["gadroon"],"forms":{"plural":"godroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"godron","accusative-definite-nominative-singular":"godronul","accusative-indefinite-nominative-plural":"godroane","accusative-definite-nominative-plural":"godroanele","dative-genitive-indefinite-singular":"godron","dative-definite-genitive-singular":"godronului","dative-genitive-indefinite-plural":"godroane","dative-definite-genitive-plural":"godroanelor","singular-vocative":"godronule","plural-vocative":"godroanelor"}},{"word":"godronat","pos":"adj","definitions":["gadrooned"],"forms":{"feminine-singular":"godronată","masculine-plural":"godronați","feminine-neuter-plural":"godronate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"godronat","error-unrecognized-form-feminine-indefinite-singular":"godronată","error-unrecognized-form-indefinite-masculine-plural":"godronați","error-unrecognized-form-feminine-indefinite-neuter-plural":"godronate","definite-error-unrecognized-form-masculine-neuter-singular":"godronatul","definite-error-unrecognized-form-feminine-singular":"godronata","definite-error-unrecognized-form-masculine-plural":"godronații","definite-error-unrecognized-form-feminine-neuter-plural":"godronatele"}},{"word":"goeland","pos":"noun","definitions":["gull"],"forms":{"plural":"goelanzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"goeland","accusative-definite-nominative-singular":"goelandul","accusative-indefinite-nominative-plural":"goelanzi","accusative-definite-nominative-plural":"goelanzii","dative-genitive-indefinite-singular":"goeland","dative-definite-genitive-singular":"goelandului","dative-genitive-indefinite-plural":"goelanzi","dative-definite-genitive-plural":"goelanzilor","singular-vocative":"goelandule","plural-vocative":"goelanzilor"}},{"word":"goeletă","pos":"noun","definitions":["schooner"],"forms":{"plural":"goelete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goeletă","accusative-definite-nominative-singular":"goeleta","accusative-indefinite-nominative-plural":"goelete","accusative-definite-nominative-plural":"goeletele","dative-genitive-indefinite-singular":"goelete","dative-definite-genitive-singular":"goeletei","dative-genitive-indefinite-plural":"goelete","dative-definite-genitive-plural":"goeletelor","singular-vocative":"goeletă","plural-vocative":"goeletelor"}},{"word":"Goești","pos":"name","definitions":["a village in Lungani, Iași County, Romania"],"gender":"m"},{"word":"goethean","pos":"adj","definitions":["Goethean"],"forms":{"feminine-singular":"goetheană","masculine-plural":"goetheni","feminine-neuter-plural":"goethene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"goethean","error-unrecognized-form-feminine-indefinite-singular":"goetheană","error-unrecognized-form-indefinite-masculine-plural":"goetheni","error-unrecognized-form-feminine-indefinite-neuter-plural":"goethene","definite-error-unrecognized-form-masculine-neuter-singular":"goetheanul","definite-error-unrecognized-form-feminine-singular":"goetheana","definite-error-unrecognized-form-masculine-plural":"goethenii","definite-error-unrecognized-form-feminine-neuter-plural":"goethenele"}},{"word":"gofra","pos":"verb","definitions":["to goffer"],"forms":{"canonical":"a gofra 1st conjugation","present-singular-third-person":"gofrează","participle-past":"gofrat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gofra","gerund":"gofrând","first-person-indicative-present-singular":"gofrez","indicative-present-second-person-singular":"gofrezi","indicative-present-singular-third-person":"gofrează","first-person-indicative-plural-present":"gofrăm","indicative-plural-present-second-person":"gofrați","indicative-plural-present-third-person":"gofrează","first-person-imperfect-indicative-singular":"gofram","imperfect-indicative-second-person-singular":"gofrai","imperfect-indicative-singular-third-person":"gofra","first-person-imperfect-indicative-plural":"gofram","imperfect-indicative-plural-second-person":"gofrați","imperfect-indicative-plural-third-person":"gofrau","first-person-indicative-perfect-singular":"gofrai","indicative-perfect-second-person-singular":"gofrași","indicative-perfect-singular-third-person":"gofră","first-person-indicative-perfect-plural":"gofrarăm","indicative-perfect-plural-second-person":"gofrarăți","indicative-perfect-plural-third-person":"gofrară","first-person-indicative-pluperfect-singular":"gofrasem","indicative-pluperfect-second-person-singular":"gofraseși","indicative-pluperfect-singular-third-person":"gofrase","first-person-indicative-pluperfect-plural":"gofraserăm","indicative-pluperfect-plural-second-person":"gofraserăți","indicative-pluperfect-plural-third-person":"gofraseră","first-person-present-singular-subjunctive":"să gofrez","present-second-person-singular-subjunctive":"să gofrezi","present-singular-subjunctive-third-person":"să gofreze","first-person-plural-present-subjunctive":"să gofrăm","plural-present-second-person-subjunctive":"să gofrați","plural-present-subjunctive-third-person":"să gofreze","imperative-second-person-singular":"gofrează","imperative-plural-second-person":"gofrați","imperative-negative-second-person-singular":"nu gofra","imperative-negative-plural-second-person":"nu gofrați"}},{"word":"gofrat","pos":"adj","definitions":["corrugated"],"forms":{"feminine-singular":"gofrată","masculine-plural":"gofrați","feminine-neuter-plural":"gofrate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gofrat","error-unrecognized-form-feminine-indefinite-singular":"gofrată","error-unrecognized-form-indefinite-masculine-plural":"gofrați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gofrate","definite-error-unrecognized-form-masculine-neuter-singular":"gofratul","definite-error-unrecognized-form-feminine-singular":"gofrata","definite-error-unrecognized-form-masculine-plural":"gofrații","definite-error-unrecognized-form-feminine-neuter-plural":"gofratele"}},{"word":"gog","pos":"noun","definitions":["a stupid boy or man"],"forms":{"plural":"gogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gog","accusative-definite-nominative-singular":"gogul","accusative-indefinite-nominative-plural":"gogi","accusative-definite-nominative-plural":"gogii","dative-genitive-indefinite-singular":"gog","dative-definite-genitive-singular":"gogului","dative-genitive-indefinite-plural":"gogi","dative-definite-genitive-plural":"gogilor","singular-vocative":"gogule","plural-vocative":"gogilor"}},{"word":"Goga","pos":"name","definitions":["a village in Râfov, Prahova County, Romania"],"gender":"f"},{"word":"gogă","pos":"noun","definitions":["an unripe walnut kernel"],"pronunciation":"/ˈɡo.ɡə/","forms":{"plural":"gogi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gogă","accusative-definite-nominative-singular":"goga","accusative-indefinite-nominative-plural":"gogi","accusative-definite-nominative-plural":"gogile","dative-genitive-indefinite-singular":"gogi","dative-definite-genitive-singular":"gogii","dative-genitive-indefinite-plural":"gogi","dative-definite-genitive-plural":"gogilor","singular-vocative":"gogă","plural-vocative":"gogilor","alternative":"goagă"}},{"word":"Gogălniceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gogălniceanu"}},{"word":"gogâlț","pos":"intj","definitions":["gulp (sound)"]},{"word":"gogeamite","pos":"adj","definitions":["alternative form of cogeamite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gogeamite","error-unrecognized-form-feminine-indefinite-singular":"gogeamite","error-unrecognized-form-indefinite-masculine-plural":"gogeamite","error-unrecognized-form-feminine-indefinite-neuter-plural":"gogeamite","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"Gogeasca","pos":"name","definitions":["a village in Cărbunești, Prahova County, Romania"],"gender":"f"},{"word":"Gogescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gogescu"}},{"word":"Gogioiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gogioiu"}},{"word":"Gogoașă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gogoașă"}},{"word":"gogoașă","pos":"noun","definitions":["doughnut"],"pronunciation":"/ɡoˈɡo̯a.ʃə/","forms":{"plural":"gogoși","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gogoașă","accusative-definite-nominative-singular":"gogoașa","accusative-indefinite-nominative-plural":"gogoși","accusative-definite-nominative-plural":"gogoșile","dative-genitive-indefinite-singular":"gogoși","dative-definite-genitive-singular":"gogoșii","dative-genitive-indefinite-plural":"gogoși","dative-definite-genitive-plural":"gogoșilor","singular-vocative":"gogoașă","plural-vocative":"gogoșilor"}},{"word":"gogoașă de mătase","pos":"noun","definitions":["silk cocoon"],"forms":{"plural":"gogoși de mătase"}},{"word":"Gogoiu","pos":"name","definitions":["a village in Răcoasa, Vrancea County, Romania","a surname"],"gender":"m"},{"word":"gogoli","pos":"verb","definitions":["obsolete form of cocoli"],"forms":{"canonical":"a gogoli 4th conjugation","present-singular-third-person":"gogolește","participle-past":"gogolit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gogoli","gerund":"gogolind","first-person-indicative-present-singular":"gogolesc","indicative-present-second-person-singular":"gogolești","indicative-present-singular-third-person":"gogolește","first-person-indicative-plural-present":"gogolim","indicative-plural-present-second-person":"gogoliți","indicative-plural-present-third-person":"gogolesc","first-person-imperfect-indicative-singular":"gogoleam","imperfect-indicative-second-person-singular":"gogoleai","imperfect-indicative-singular-third-person":"gogolea","first-person-imperfect-indicative-plural":"gogoleam","imperfect-indicative-plural-second-person":"gogoleați","imperfect-indicative-plural-third-person":"gogoleau","first-person-indicative-perfect-singular":"gogolii","indicative-perfect-second-person-singular":"gogoliși","indicative-perfect-singular-third-person":"gogoli","first-person-indicative-perfect-plural":"gogolirăm","indicative-perfect-plural-second-person":"gogolirăți","indicative-perfect-plural-third-person":"gogoliră","first-person-indicative-pluperfect-singular":"gogolisem","indicative-pluperfect-second-person-singular":"gogoliseși","indicative-pluperfect-singular-third-person":"gogolise","first-person-indicative-pluperfect-plural":"gogoliserăm","indicative-pluperfect-plural-second-person":"gogoliserăți","indicative-pluperfect-plural-third-person":"gogoliseră","first-person-present-singular-subjunctive":"să gogolesc","present-second-person-singular-subjunctive":"să gogolești","present-singular-subjunctive-third-person":"să gogolească","first-person-plural-present-subjunctive":"să gogolim","plural-present-second-person-subjunctive":"să gogoliți","plural-present-subjunctive-third-person":"să gogolească","imperative-second-person-singular":"gogolește","imperative-plural-second-person":"gogoliți","imperative-negative-second-person-singular":"nu gogoli","imperative-negative-plural-second-person":"nu gogoliți"}},{"word":"gogoliu","pos":"noun","definitions":["clod, lump, ball"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gogoliu","accusative-definite-nominative":"gogoliuul","dative-genitive-indefinite":"gogoliu","dative-definite-genitive":"gogoliuului","vocative":"gogoliuule"}},{"word":"Gogoloi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gogoloi"}},{"word":"gogoloi","pos":"noun","definitions":["spherical object"],"forms":{"plural":"gogoloaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gogoloi","accusative-definite-nominative-singular":"gogoloiul","accusative-indefinite-nominative-plural":"gogoloaie","accusative-definite-nominative-plural":"gogoloaiele","dative-genitive-indefinite-singular":"gogoloi","dative-definite-genitive-singular":"gogoloiului","dative-genitive-indefinite-plural":"gogoloaie","dative-definite-genitive-plural":"gogoloaielor","singular-vocative":"gogoloiule","plural-vocative":"gogoloaielor"}},{"word":"gogoman","pos":"adj","definitions":["stupid"],"forms":{"feminine-singular":"gogomană","masculine-plural":"gogomani","feminine-neuter-plural":"gogomane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gogoman","error-unrecognized-form-feminine-indefinite-singular":"gogomană","error-unrecognized-form-indefinite-masculine-plural":"gogomani","error-unrecognized-form-feminine-indefinite-neuter-plural":"gogomane","definite-error-unrecognized-form-masculine-neuter-singular":"gogomanul","definite-error-unrecognized-form-feminine-singular":"gogomana","definite-error-unrecognized-form-masculine-plural":"gogomanii","definite-error-unrecognized-form-feminine-neuter-plural":"gogomanele"}},{"word":"gogoman","pos":"noun","definitions":["a stupid person"],"forms":{"plural":"gogomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gogoman","accusative-definite-nominative-singular":"gogomanul","accusative-indefinite-nominative-plural":"gogomani","accusative-definite-nominative-plural":"gogomanii","dative-genitive-indefinite-singular":"gogoman","dative-definite-genitive-singular":"gogomanului","dative-genitive-indefinite-plural":"gogomani","dative-definite-genitive-plural":"gogomanilor","singular-vocative":"gogomanule","plural-vocative":"gogomanilor"}},{"word":"gogomănel","pos":"noun","definitions":["diminutive of gogoman"],"forms":{"plural":"gogomănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gogomănel","accusative-definite-nominative-singular":"gogomănelul","accusative-indefinite-nominative-plural":"gogomănei","accusative-definite-nominative-plural":"gogomăneii","dative-genitive-indefinite-singular":"gogomănel","dative-definite-genitive-singular":"gogomănelului","dative-genitive-indefinite-plural":"gogomănei","dative-definite-genitive-plural":"gogomăneilor","singular-vocative":"gogomănelule","plural-vocative":"gogomăneilor"}},{"word":"gogomănie","pos":"noun","definitions":["stupidity"],"forms":{"plural":"gogomănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gogomănie","accusative-definite-nominative-singular":"gogomănia","accusative-indefinite-nominative-plural":"gogomănii","accusative-definite-nominative-plural":"gogomăniile","dative-genitive-indefinite-singular":"gogomănii","dative-definite-genitive-singular":"gogomăniei","dative-genitive-indefinite-plural":"gogomănii","dative-definite-genitive-plural":"gogomăniilor","singular-vocative":"gogomănie","plural-vocative":"gogomăniilor"}},{"word":"gogon","pos":"noun","definitions":["small round hard object, especially precious stones"],"forms":{"plural":"gogoni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gogon","accusative-definite-nominative-singular":"gogonul","accusative-indefinite-nominative-plural":"gogoni","accusative-definite-nominative-plural":"gogonile","dative-genitive-indefinite-singular":"gogon","dative-definite-genitive-singular":"gogonului","dative-genitive-indefinite-plural":"gogoni","dative-definite-genitive-plural":"gogonilor","singular-vocative":"gogonule","plural-vocative":"gogonilor"}},{"word":"gogonat","pos":"adj","definitions":["spherical, inflated (of objects)","big, exaggerated (mostly of lies, gaffes)"],"pronunciation":"/ɡo.ɡoˈnat/","forms":{"feminine-singular":"gogonată","masculine-plural":"gogonați","feminine-neuter-plural":"gogonate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gogonat","error-unrecognized-form-feminine-indefinite-singular":"gogonată","error-unrecognized-form-indefinite-masculine-plural":"gogonați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gogonate","definite-error-unrecognized-form-masculine-neuter-singular":"gogonatul","definite-error-unrecognized-form-feminine-singular":"gogonata","definite-error-unrecognized-form-masculine-plural":"gogonații","definite-error-unrecognized-form-feminine-neuter-plural":"gogonatele"}},{"word":"Gogonea","pos":"name","definitions":["a surname"],"gender":"f"},{"word":"gogonea","pos":"noun","definitions":["green tomato, used for pickling"],"forms":{"plural":"gogonele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gogonea","accusative-definite-nominative-singular":"gogoneaua","accusative-indefinite-nominative-plural":"gogonele","accusative-definite-nominative-plural":"gogonelele","dative-genitive-indefinite-singular":"gogonele","dative-definite-genitive-singular":"gogonelei","dative-genitive-indefinite-plural":"gogonele","dative-definite-genitive-plural":"gogonelelor","singular-vocative":"gogonea","plural-vocative":"gogonelelor"}},{"word":"Gogoneț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gogoneț"}},{"word":"gogoneț","pos":"adj","definitions":["spherical"],"forms":{"feminine-singular":"gogoneață","masculine-plural":"gogoneți","feminine-neuter-plural":"gogonețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gogoneț","error-unrecognized-form-feminine-indefinite-singular":"gogoneață","error-unrecognized-form-indefinite-masculine-plural":"gogoneți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gogonețe","definite-error-unrecognized-form-masculine-neuter-singular":"gogonețul","definite-error-unrecognized-form-feminine-singular":"gogoneața","definite-error-unrecognized-form-masculine-plural":"gogoneții","definite-error-unrecognized-form-feminine-neuter-plural":"gogonețele"}},{"word":"Gogoriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gogoriță"}},{"word":"gogoriță","pos":"noun","definitions":["bogeyman"],"forms":{"plural":"gogorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gogoriță","accusative-definite-nominative-singular":"gogorița","accusative-indefinite-nominative-plural":"gogorițe","accusative-definite-nominative-plural":"gogorițele","dative-genitive-indefinite-singular":"gogorițe","dative-definite-genitive-singular":"gogoriței","dative-genitive-indefinite-plural":"gogorițe","dative-definite-genitive-plural":"gogorițelor","singular-vocative":"gogoriță","plural-vocative":"gogorițelor"}},{"word":"Gogoșanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gogoșanu"}},{"word":"gogoșar","pos":"noun","definitions":["bell pepper"],"forms":{"plural":"gogoșari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gogoșar","accusative-definite-nominative-singular":"gogoșarul","accusative-indefinite-nominative-plural":"gogoșari","accusative-definite-nominative-plural":"gogoșarii","dative-genitive-indefinite-singular":"gogoșar","dative-definite-genitive-singular":"gogoșarului","dative-genitive-indefinite-plural":"gogoșari","dative-definite-genitive-plural":"gogoșarilor","singular-vocative":"gogoșarule","plural-vocative":"gogoșarilor"}},{"word":"Gogoșari","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Gogoșari, Giurgiu County, Romania"],"gender":"m"},{"word":"gogoșari","pos":"noun","definitions":["plural of gogoșar"]},{"word":"gogoșea","pos":"noun","definitions":["diminutive of gogoașă; small donut"],"forms":{"plural":"gogoșele","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"gogoșea","accusative-definite-nominative-singular":"gogoșeaua","accusative-indefinite-nominative-plural":"gogoșele","accusative-definite-nominative-plural":"gogoșelele","dative-genitive-indefinite-singular":"gogoșele","dative-definite-genitive-singular":"gogoșelei","dative-genitive-indefinite-plural":"gogoșele","dative-definite-genitive-plural":"gogoșelelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"gogoșerie","pos":"noun","definitions":["donut shop"],"forms":{"plural":"gogoșerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gogoșerie","accusative-definite-nominative-singular":"gogoșeria","accusative-indefinite-nominative-plural":"gogoșerii","accusative-definite-nominative-plural":"gogoșeriile","dative-genitive-indefinite-singular":"gogoșerii","dative-definite-genitive-singular":"gogoșeriei","dative-genitive-indefinite-plural":"gogoșerii","dative-definite-genitive-plural":"gogoșeriilor","singular-vocative":"gogoșerie","plural-vocative":"gogoșeriilor"}},{"word":"Gogoșești","pos":"name","definitions":["a village in Mischii, Dolj County, Romania"],"gender":"m"},{"word":"gogoși","pos":"noun","definitions":["plural of gogoașă"],"pronunciation":"/ɡoˈɡoʃʲ/"},{"word":"Gogoșița","pos":"name","definitions":["a village in Gogoșu, Dolj County, Romania"],"gender":"f"},{"word":"Gogoșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gogoșoiu"}},{"word":"Gogoșu","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Gogoșu, Dolj County, Romania","a commune of Mehedinți County, Romania","a village in Gogoșu, Mehedinți County, Romania"],"gender":"m"},{"word":"gogren","pos":"noun","definitions":["alternative form of grogrenă"],"forms":{"plural":"gogrene"}},{"word":"gogrenă","pos":"noun","definitions":["alternative form of grogrenă"],"forms":{"plural":"gogrene"}},{"word":"Gogu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gogu"}},{"word":"Gogulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gogulescu"}},{"word":"Goguleț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goguleț"}},{"word":"Goguț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goguț"}},{"word":"Goia","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Goia"}},{"word":"Goian","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goian"}},{"word":"Goianul Nou","pos":"name","definitions":["a village in Dubău, Transnistria, Moldova"],"gender":"m"},{"word":"Goicea","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Goicea, Dolj County, Romania"],"gender":"f"},{"word":"Goicelu","pos":"name","definitions":["a village in Sărulești, Buzău County, Romania"],"gender":"m"},{"word":"Goidești","pos":"name","definitions":["a village in Brăești, Buzău County, Romania"],"gender":"m"},{"word":"Goiești","pos":"name","definitions":["a village in Vidra, Alba County, Romania","a commune of Dolj County, Romania","a village in Goiești, Dolj County, Romania"],"gender":"m"},{"word":"Goila","pos":"name","definitions":["a village in Căbești, Bihor County, Romania"],"gender":"f"},{"word":"Goioasa","pos":"name","definitions":["a village in Agăș, Bacău County, Romania"],"gender":"f"},{"word":"Gojeiești","pos":"name","definitions":["a village in Avram Iancu, Alba County, Romania"],"gender":"m"},{"word":"gol","pos":"adj","definitions":["empty","naked","hollow","by itself, without any modification or garnish"],"pronunciation":"/ˈɡol/","examples":[{"ro":"pâine goală","en":"plain bread"}],"forms":{"feminine-singular":"goală","masculine-plural":"goi","feminine-neuter-plural":"goale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gol","error-unrecognized-form-feminine-indefinite-singular":"goală","error-unrecognized-form-indefinite-masculine-plural":"goi","error-unrecognized-form-feminine-indefinite-neuter-plural":"goale","definite-error-unrecognized-form-masculine-neuter-singular":"golul","definite-error-unrecognized-form-feminine-singular":"goala","definite-error-unrecognized-form-masculine-plural":"goii","definite-error-unrecognized-form-feminine-neuter-plural":"goalele"}},{"word":"gol","pos":"noun","definitions":["cavity"],"pronunciation":"/ˈɡol/","forms":{"plural":"goluri"}},{"word":"gol","pos":"noun","definitions":["goal"],"pronunciation":"/ˈɡol/","forms":{"plural":"goluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gol","accusative-definite-nominative-singular":"golul","accusative-indefinite-nominative-plural":"goluri","accusative-definite-nominative-plural":"golurile","dative-genitive-indefinite-singular":"gol","dative-definite-genitive-singular":"golului","dative-genitive-indefinite-plural":"goluri","dative-definite-genitive-plural":"golurilor","singular-vocative":"golule","plural-vocative":"golurilor","alternative-dated":"goal"}},{"word":"gol de aur","pos":"noun","definitions":["golden goal"],"forms":{"plural":"goluri de aur"}},{"word":"Golăiești","pos":"name","definitions":["a commune of Iași County, Romania","a village in Golăiești, Iași County, Romania"],"gender":"m"},{"word":"golan","pos":"noun","definitions":["a (usually young) person without a job, hooligan, rascal, knave, tramp, loafer, vagabond"],"forms":{"plural":"golani"}},{"word":"golană","pos":"noun","definitions":["female equivalent of golan"],"forms":{"plural":"golane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"golană","accusative-definite-nominative-singular":"golana","accusative-indefinite-nominative-plural":"golane","accusative-definite-nominative-plural":"golanele","dative-genitive-indefinite-singular":"golane","dative-definite-genitive-singular":"golanei","dative-genitive-indefinite-plural":"golane","dative-definite-genitive-plural":"golanelor","singular-vocative":"golană","plural-vocative":"golanelor"}},{"word":"golănaș","pos":"noun","definitions":["diminutive of golan"],"forms":{"plural":"golănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golănaș","accusative-definite-nominative-singular":"golănașul","accusative-indefinite-nominative-plural":"golănași","accusative-definite-nominative-plural":"golănașii","dative-genitive-indefinite-singular":"golănaș","dative-definite-genitive-singular":"golănașului","dative-genitive-indefinite-plural":"golănași","dative-definite-genitive-plural":"golănașilor","singular-vocative":"golănașule","plural-vocative":"golănașilor"}},{"word":"golancă","pos":"noun","definitions":["female equivalent of golan"],"forms":{"plural":"golance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"golancă","accusative-definite-nominative-singular":"golanca","accusative-indefinite-nominative-plural":"golance","accusative-definite-nominative-plural":"golancele","dative-genitive-indefinite-singular":"golance","dative-definite-genitive-singular":"golancei","dative-genitive-indefinite-plural":"golance","dative-definite-genitive-plural":"golancelor","singular-vocative":"golancă","plural-vocative":"golancelor"}},{"word":"golănel","pos":"noun","definitions":["diminutive of golan; small hooligan"],"forms":{"plural":"golănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golănel","accusative-definite-nominative-singular":"golănelul","accusative-indefinite-nominative-plural":"golăneli","accusative-definite-nominative-plural":"golănelii","dative-genitive-indefinite-singular":"golănel","dative-definite-genitive-singular":"golănelului","dative-genitive-indefinite-plural":"golăneli","dative-definite-genitive-plural":"golănelilor","singular-vocative":"golănelule","plural-vocative":"golănelilor"}},{"word":"golănesc","pos":"adj","definitions":["ruffian"],"forms":{"feminine-singular":"golănească","plural":"golănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"golănesc","error-unrecognized-form-feminine-indefinite-singular":"golănească","error-unrecognized-form-indefinite-masculine-plural":"golănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"golănești","definite-error-unrecognized-form-masculine-neuter-singular":"golănescul","definite-error-unrecognized-form-feminine-singular":"golăneasca","definite-error-unrecognized-form-masculine-plural":"golăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"golăneștile"}},{"word":"golăneț","pos":"adj","definitions":["shabby"],"forms":{"feminine-singular":"golăneață","masculine-plural":"golăneți","feminine-neuter-plural":"golănețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"golăneț","error-unrecognized-form-feminine-indefinite-singular":"golăneață","error-unrecognized-form-indefinite-masculine-plural":"golăneți","error-unrecognized-form-feminine-indefinite-neuter-plural":"golănețe","definite-error-unrecognized-form-masculine-neuter-singular":"golănețul","definite-error-unrecognized-form-feminine-singular":"golăneața","definite-error-unrecognized-form-masculine-plural":"golăneții","definite-error-unrecognized-form-feminine-neuter-plural":"golănețele"}},{"word":"golănie","pos":"noun","definitions":["hooliganism"],"forms":{"plural":"golănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"golănie","accusative-definite-nominative-singular":"golănia","accusative-indefinite-nominative-plural":"golănii","accusative-definite-nominative-plural":"golăniile","dative-genitive-indefinite-singular":"golănii","dative-definite-genitive-singular":"golăniei","dative-genitive-indefinite-plural":"golănii","dative-definite-genitive-plural":"golăniilor","singular-vocative":"golănie","plural-vocative":"golăniilor"}},{"word":"golănime","pos":"noun","definitions":["collective noun for ruffians"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"golănime","accusative-definite-nominative":"golănimea","dative-genitive-indefinite":"golănime","dative-definite-genitive":"golănimei","vocative":"golănime"}},{"word":"golaș","pos":"adj","definitions":["naked"],"forms":{"feminine-singular":"golașă","masculine-plural":"golași","feminine-neuter-plural":"golașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"golaș","error-unrecognized-form-feminine-indefinite-singular":"golașă","error-unrecognized-form-indefinite-masculine-plural":"golași","error-unrecognized-form-feminine-indefinite-neuter-plural":"golașe","definite-error-unrecognized-form-masculine-neuter-singular":"golașul","definite-error-unrecognized-form-feminine-singular":"golașa","definite-error-unrecognized-form-masculine-plural":"golașii","definite-error-unrecognized-form-feminine-neuter-plural":"golașele"}},{"word":"golășel","pos":"adj","definitions":["diminutive of golaș"],"forms":{"feminine-singular":"golășelă","masculine-plural":"golășeli","feminine-neuter-plural":"golășele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"golășel","error-unrecognized-form-feminine-indefinite-singular":"golășelă","error-unrecognized-form-indefinite-masculine-plural":"golășeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"golășele","definite-error-unrecognized-form-masculine-neuter-singular":"golășelul","definite-error-unrecognized-form-feminine-singular":"golășela","definite-error-unrecognized-form-masculine-plural":"golășelii","definite-error-unrecognized-form-feminine-neuter-plural":"golășelele"}},{"word":"golătate","pos":"noun","definitions":["nakedness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"golătate","accusative-definite-nominative":"golătatea","dative-genitive-indefinite":"golătăți","dative-definite-genitive":"golătății","vocative":"-"}},{"word":"golaveraj","pos":"noun","definitions":["goal difference"],"forms":{"plural":"golaveraje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"golaveraj","accusative-definite-nominative-singular":"golaverajul","accusative-indefinite-nominative-plural":"golaveraje","accusative-definite-nominative-plural":"golaverajele","dative-genitive-indefinite-singular":"golaveraj","dative-definite-genitive-singular":"golaverajului","dative-genitive-indefinite-plural":"golaveraje","dative-definite-genitive-plural":"golaverajelor","singular-vocative":"golaverajule","plural-vocative":"golaverajelor"}},{"word":"Goldan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goldan"}},{"word":"goldan","pos":"noun","definitions":["damson plum"],"forms":{"plural":"goldani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"goldan","accusative-definite-nominative-singular":"goldanul","accusative-indefinite-nominative-plural":"goldani","accusative-definite-nominative-plural":"goldanii","dative-genitive-indefinite-singular":"goldan","dative-definite-genitive-singular":"goldanului","dative-genitive-indefinite-plural":"goldani","dative-definite-genitive-plural":"goldanilor","singular-vocative":"goldanule","plural-vocative":"goldanilor"}},{"word":"goldană","pos":"noun","definitions":["damson"],"forms":{"plural":"goldane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goldană","accusative-definite-nominative-singular":"goldana","accusative-indefinite-nominative-plural":"goldane","accusative-definite-nominative-plural":"goldanele","dative-genitive-indefinite-singular":"goldane","dative-definite-genitive-singular":"goldanei","dative-genitive-indefinite-plural":"goldane","dative-definite-genitive-plural":"goldanelor","singular-vocative":"goldană","plural-vocative":"goldanelor"}},{"word":"golea","pos":"verb","definitions":["third-person singular imperfect indicative of goli"],"pronunciation":"[ɡoˈle̯a]"},{"word":"Goleasca","pos":"name","definitions":["a village in Recea, Argeș County, Romania","a village in Bucșani, Giurgiu County, Romania"],"gender":"f"},{"word":"Goleni","pos":"name","definitions":["a village in Goleni, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Golescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Golescu"}},{"word":"Goleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Goleșteanu"}},{"word":"Golești","pos":"name","definitions":["a village in Bălilești, Argeș County, Romania","a village in Ștefănești, Argeș County, Romania","a commune of Vâlcea County, Romania","a commune of Vrancea County, Romania","a village in Golești, Vrancea County, Romania"],"gender":"m"},{"word":"Goleștii de Sus","pos":"name","definitions":["a village in Cotești, Vrancea County, Romania"],"gender":"m"},{"word":"Goleț","pos":"name","definitions":["a village in Bucoșnița, Caraș-Severin County, Romania"],"gender":"m"},{"word":"golf","pos":"noun","definitions":["gulf"],"forms":{"plural":"golfuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"golf","accusative-definite-nominative-singular":"golful","accusative-indefinite-nominative-plural":"golfuri","accusative-definite-nominative-plural":"golfurile","dative-genitive-indefinite-singular":"golf","dative-definite-genitive-singular":"golfului","dative-genitive-indefinite-plural":"golfuri","dative-definite-genitive-plural":"golfurilor","singular-vocative":"golfule","plural-vocative":"golfurilor"}},{"word":"golf","pos":"noun","definitions":["golf"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"golf","accusative-definite-nominative":"golful","dative-genitive-indefinite":"golf","dative-definite-genitive":"golfului","vocative":"golfule"}},{"word":"golful","pos":"noun","definitions":["definite nominative/accusative singular of golf"]},{"word":"Golful Aden","pos":"name","definitions":["Gulf of Aden"]},{"word":"Golful Alaska","pos":"name","definitions":["Gulf of Alaska"],"gender":"n"},{"word":"Golful Bengal","pos":"name","definitions":["Bay of Bengal"],"gender":"n"},{"word":"Golful Finic","pos":"name","definitions":["Gulf of Finland"],"gender":"n"},{"word":"Golful Finlandei","pos":"name","definitions":["Gulf of Finland"],"gender":"n"},{"word":"Golful Guineei","pos":"name","definitions":["Gulf of Guinea"],"gender":"n"},{"word":"Golful Mexic","pos":"name","definitions":["Gulf of Mexico"],"gender":"n"},{"word":"Golful Napoli","pos":"name","definitions":["Gulf of Naples"],"gender":"n"},{"word":"Golful Persic","pos":"name","definitions":["Persian Gulf"],"gender":"n"},{"word":"golgheter","pos":"noun","definitions":["scorer, player who scores many times."],"forms":{"plural":"golgheteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golgheter","accusative-definite-nominative-singular":"golgheterul","accusative-indefinite-nominative-plural":"golgheteri","accusative-definite-nominative-plural":"golgheterii","dative-genitive-indefinite-singular":"golgheter","dative-definite-genitive-singular":"golgheterului","dative-genitive-indefinite-plural":"golgheteri","dative-definite-genitive-plural":"golgheterilor","singular-vocative":"golgheterule","plural-vocative":"golgheterilor"}},{"word":"golgojină","pos":"noun","definitions":["goiter"],"forms":{"plural":"golgojine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"golgojină","accusative-definite-nominative-singular":"golgojina","accusative-indefinite-nominative-plural":"golgojine","accusative-definite-nominative-plural":"golgojinele","dative-genitive-indefinite-singular":"golgojine","dative-definite-genitive-singular":"golgojinei","dative-genitive-indefinite-plural":"golgojine","dative-definite-genitive-plural":"golgojinelor","singular-vocative":"golgojină","plural-vocative":"golgojinelor"}},{"word":"goli","pos":"verb","definitions":["to empty (to make empty)"],"forms":{"canonical":"a goli 4th conjugation","present-singular-third-person":"golește","participle-past":"golit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a goli","gerund":"golind","first-person-indicative-present-singular":"golesc","indicative-present-second-person-singular":"golești","indicative-present-singular-third-person":"golește","first-person-indicative-plural-present":"golim","indicative-plural-present-second-person":"goliți","indicative-plural-present-third-person":"golesc","first-person-imperfect-indicative-singular":"goleam","imperfect-indicative-second-person-singular":"goleai","imperfect-indicative-singular-third-person":"golea","first-person-imperfect-indicative-plural":"goleam","imperfect-indicative-plural-second-person":"goleați","imperfect-indicative-plural-third-person":"goleau","first-person-indicative-perfect-singular":"golii","indicative-perfect-second-person-singular":"goliși","indicative-perfect-singular-third-person":"goli","first-person-indicative-perfect-plural":"golirăm","indicative-perfect-plural-second-person":"golirăți","indicative-perfect-plural-third-person":"goliră","first-person-indicative-pluperfect-singular":"golisem","indicative-pluperfect-second-person-singular":"goliseși","indicative-pluperfect-singular-third-person":"golise","first-person-indicative-pluperfect-plural":"goliserăm","indicative-pluperfect-plural-second-person":"goliserăți","indicative-pluperfect-plural-third-person":"goliseră","first-person-present-singular-subjunctive":"să golesc","present-second-person-singular-subjunctive":"să golești","present-singular-subjunctive-third-person":"să golească","first-person-plural-present-subjunctive":"să golim","plural-present-second-person-subjunctive":"să goliți","plural-present-subjunctive-third-person":"să golească","imperative-second-person-singular":"golește","imperative-plural-second-person":"goliți","imperative-negative-second-person-singular":"nu goli","imperative-negative-plural-second-person":"nu goliți"}},{"word":"Golianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Golianu"}},{"word":"goliard","pos":"noun","definitions":["Goliard"],"forms":{"plural":"goliarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"goliard","accusative-definite-nominative-singular":"goliardul","accusative-indefinite-nominative-plural":"goliarzi","accusative-definite-nominative-plural":"goliarzii","dative-genitive-indefinite-singular":"goliard","dative-definite-genitive-singular":"goliardului","dative-genitive-indefinite-plural":"goliarzi","dative-definite-genitive-plural":"goliarzilor","singular-vocative":"goliardule","plural-vocative":"goliarzilor"}},{"word":"golicică","pos":"noun","definitions":["Myagrum perfoliatum"],"forms":{"plural":"golicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"golicică","accusative-definite-nominative-singular":"golicica","accusative-indefinite-nominative-plural":"golicele","accusative-definite-nominative-plural":"golicelele","dative-genitive-indefinite-singular":"golicele","dative-definite-genitive-singular":"golicelei","dative-genitive-indefinite-plural":"golicele","dative-definite-genitive-plural":"golicelelor","singular-vocative":"golicică","plural-vocative":"golicelelor"}},{"word":"goliciune","pos":"noun","definitions":["nakedness, nudity","desertedness, lifelessness"],"forms":{"plural":"goliciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"goliciune","accusative-definite-nominative-singular":"goliciunea","accusative-indefinite-nominative-plural":"goliciuni","accusative-definite-nominative-plural":"goliciunile","dative-genitive-indefinite-singular":"goliciuni","dative-definite-genitive-singular":"goliciunii","dative-genitive-indefinite-plural":"goliciuni","dative-definite-genitive-plural":"goliciunilor","singular-vocative":"goliciune","plural-vocative":"goliciunilor"}},{"word":"golie","pos":"noun","definitions":["stork (large wading bird)"],"forms":{"plural":"golii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"golie","accusative-definite-nominative-singular":"golia","accusative-indefinite-nominative-plural":"golii","accusative-definite-nominative-plural":"goliile","dative-genitive-indefinite-singular":"golii","dative-definite-genitive-singular":"goliei","dative-genitive-indefinite-plural":"golii","dative-definite-genitive-plural":"goliilor","singular-vocative":"golie","plural-vocative":"goliilor"}},{"word":"golire","pos":"noun","definitions":["emptying"],"forms":{"plural":"goliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"golire","accusative-definite-nominative-singular":"golirea","accusative-indefinite-nominative-plural":"goliri","accusative-definite-nominative-plural":"golirile","dative-genitive-indefinite-singular":"goliri","dative-definite-genitive-singular":"golirii","dative-genitive-indefinite-plural":"goliri","dative-definite-genitive-plural":"golirilor","singular-vocative":"golire","plural-vocative":"golirilor"}},{"word":"Golișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Golișteanu"}},{"word":"golit","pos":"adj","definitions":["devoid, empty"],"forms":{"feminine-singular":"golită","masculine-plural":"goliți","feminine-neuter-plural":"golite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"golit","error-unrecognized-form-feminine-indefinite-singular":"golită","error-unrecognized-form-indefinite-masculine-plural":"goliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"golite","definite-error-unrecognized-form-masculine-neuter-singular":"golitul","definite-error-unrecognized-form-feminine-singular":"golita","definite-error-unrecognized-form-masculine-plural":"goliții","definite-error-unrecognized-form-feminine-neuter-plural":"golitele"}},{"word":"golit","pos":"verb","definitions":["past participle of goli"],"forms":{"participle-past":"of goli"}},{"word":"Gologan","pos":"name","definitions":["a river in Olt, Romania, tributary to the Olt","a surname"],"gender":"m"},{"word":"gologan","pos":"noun","definitions":["copper coin"],"forms":{"plural":"gologani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gologan","accusative-definite-nominative-singular":"gologanul","accusative-indefinite-nominative-plural":"gologani","accusative-definite-nominative-plural":"gologanii","dative-genitive-indefinite-singular":"gologan","dative-definite-genitive-singular":"gologanului","dative-genitive-indefinite-plural":"gologani","dative-definite-genitive-plural":"gologanilor","singular-vocative":"gologanule","plural-vocative":"gologanilor"}},{"word":"gologănel","pos":"noun","definitions":["diminutive of gologan"],"forms":{"plural":"gologănei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gologănel","accusative-definite-nominative-singular":"gologănelul","accusative-indefinite-nominative-plural":"gologănei","accusative-definite-nominative-plural":"gologăneii","dative-genitive-indefinite-singular":"gologănel","dative-definite-genitive-singular":"gologănelului","dative-genitive-indefinite-plural":"gologănei","dative-definite-genitive-plural":"gologăneilor","singular-vocative":"gologănelule","plural-vocative":"gologăneilor"}},{"word":"gologăni","pos":"verb","definitions":["to cheat"],"forms":{"canonical":"a gologăni 4th conjugation","present-singular-third-person":"gologănește","participle-past":"gologănit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gologăni","gerund":"gologănind","first-person-indicative-present-singular":"gologănesc","indicative-present-second-person-singular":"gologănești","indicative-present-singular-third-person":"gologănește","first-person-indicative-plural-present":"gologănim","indicative-plural-present-second-person":"gologăniți","indicative-plural-present-third-person":"gologănesc","first-person-imperfect-indicative-singular":"gologăneam","imperfect-indicative-second-person-singular":"gologăneai","imperfect-indicative-singular-third-person":"gologănea","first-person-imperfect-indicative-plural":"gologăneam","imperfect-indicative-plural-second-person":"gologăneați","imperfect-indicative-plural-third-person":"gologăneau","first-person-indicative-perfect-singular":"gologănii","indicative-perfect-second-person-singular":"gologăniși","indicative-perfect-singular-third-person":"gologăni","first-person-indicative-perfect-plural":"gologănirăm","indicative-perfect-plural-second-person":"gologănirăți","indicative-perfect-plural-third-person":"gologăniră","first-person-indicative-pluperfect-singular":"gologănisem","indicative-pluperfect-second-person-singular":"gologăniseși","indicative-pluperfect-singular-third-person":"gologănise","first-person-indicative-pluperfect-plural":"gologăniserăm","indicative-pluperfect-plural-second-person":"gologăniserăți","indicative-pluperfect-plural-third-person":"gologăniseră","first-person-present-singular-subjunctive":"să gologănesc","present-second-person-singular-subjunctive":"să gologănești","present-singular-subjunctive-third-person":"să gologănească","first-person-plural-present-subjunctive":"să gologănim","plural-present-second-person-subjunctive":"să gologăniți","plural-present-subjunctive-third-person":"să gologănească","imperative-second-person-singular":"gologănește","imperative-plural-second-person":"gologăniți","imperative-negative-second-person-singular":"nu gologăni","imperative-negative-plural-second-person":"nu gologăniți"}},{"word":"Gologanu","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Gologanu, Vrancea County, Romania","a surname"],"gender":"m"},{"word":"gologanul","pos":"noun","definitions":["definite nominative/accusative singular of gologan"]},{"word":"golomăț","pos":"noun","definitions":["alternative form of golomoz"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"golomăț","accusative-definite-nominative":"golomățul","dative-genitive-indefinite":"golomăț","dative-definite-genitive":"golomățului","vocative":"golomățule"}},{"word":"golomoz","pos":"noun","definitions":["cocksfoot (Dactylis glomerata)"],"forms":{"plural":"golomozi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golomoz","accusative-definite-nominative-singular":"golomozul","accusative-indefinite-nominative-plural":"golomozi","accusative-definite-nominative-plural":"golomozii","dative-genitive-indefinite-singular":"golomoz","dative-definite-genitive-singular":"golomozului","dative-genitive-indefinite-plural":"golomozi","dative-definite-genitive-plural":"golomozilor","singular-vocative":"golomozule","plural-vocative":"golomozilor"}},{"word":"Goloșoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Goloșoiu"}},{"word":"Golovatiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Golovatiuc"}},{"word":"Golovcencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Golovcencu"}},{"word":"Golu Grabicina","pos":"name","definitions":["a village in Scorțoasa, Buzău County, Romania"],"gender":"f"},{"word":"golumb","pos":"noun","definitions":["pigeon"],"pronunciation":"/ɡoˈlumb/","forms":{"plural":"golumbi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golumb","accusative-definite-nominative-singular":"golumbul","accusative-indefinite-nominative-plural":"golumbi","accusative-definite-nominative-plural":"golumbii","dative-genitive-indefinite-singular":"golumb","dative-definite-genitive-singular":"golumbului","dative-genitive-indefinite-plural":"golumbi","dative-definite-genitive-plural":"golumbilor","singular-vocative":"golumbule","plural-vocative":"golumbilor"}},{"word":"golumbărie","pos":"noun","definitions":["pigeon coop"],"forms":{"plural":"golumbării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"golumbărie","accusative-definite-nominative-singular":"golumbăria","accusative-indefinite-nominative-plural":"golumbării","accusative-definite-nominative-plural":"golumbăriile","dative-genitive-indefinite-singular":"golumbării","dative-definite-genitive-singular":"golumbăriei","dative-genitive-indefinite-plural":"golumbării","dative-definite-genitive-plural":"golumbăriilor","singular-vocative":"golumbărie","plural-vocative":"golumbăriilor"}},{"word":"golumbel","pos":"noun","definitions":["diminutive of golumb"],"forms":{"plural":"golumbei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"golumbel","accusative-definite-nominative-singular":"golumbelul","accusative-indefinite-nominative-plural":"golumbei","accusative-definite-nominative-plural":"golumbeii","dative-genitive-indefinite-singular":"golumbel","dative-definite-genitive-singular":"golumbelului","dative-genitive-indefinite-plural":"golumbei","dative-definite-genitive-plural":"golumbeilor","singular-vocative":"golumbelule","plural-vocative":"golumbeilor"}},{"word":"Golumbelu","pos":"name","definitions":["a village in Fărcaș, Dolj County, Romania"],"gender":"m"},{"word":"golumbiță","pos":"noun","definitions":["female dove"],"forms":{"plural":"golumbițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"golumbiță","accusative-definite-nominative-singular":"golumbița","accusative-indefinite-nominative-plural":"golumbițe","accusative-definite-nominative-plural":"golumbițele","dative-genitive-indefinite-singular":"golumbițe","dative-definite-genitive-singular":"golumbiței","dative-genitive-indefinite-plural":"golumbițe","dative-definite-genitive-plural":"golumbițelor","singular-vocative":"golumbiță","plural-vocative":"golumbițelor"}},{"word":"Golumbu","pos":"name","definitions":["a village in Fărcaș, Dolj County, Romania"],"gender":"m"},{"word":"goluri","pos":"noun","definitions":["plural of gol"],"gender":"n-p"},{"word":"goluț","pos":"adj","definitions":["diminutive of gol"],"forms":{"feminine-singular":"goluță","masculine-plural":"goluți","feminine-neuter-plural":"goluțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"goluț","error-unrecognized-form-feminine-indefinite-singular":"goluță","error-unrecognized-form-indefinite-masculine-plural":"goluți","error-unrecognized-form-feminine-indefinite-neuter-plural":"goluțe","definite-error-unrecognized-form-masculine-neuter-singular":"goluțul","definite-error-unrecognized-form-feminine-singular":"goluța","definite-error-unrecognized-form-masculine-plural":"goluții","definite-error-unrecognized-form-feminine-neuter-plural":"goluțele"}},{"word":"gomă","pos":"noun","definitions":["gumma"],"forms":{"plural":"gome","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gomă","accusative-definite-nominative-singular":"goma","accusative-indefinite-nominative-plural":"gome","accusative-definite-nominative-plural":"gomele","dative-genitive-indefinite-singular":"gome","dative-definite-genitive-singular":"gomei","dative-genitive-indefinite-plural":"gome","dative-definite-genitive-plural":"gomelor","singular-vocative":"gomă","plural-vocative":"gomelor"}},{"word":"Gomboș","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Gomboș"}},{"word":"gomboș","pos":"noun","definitions":["pin"],"forms":{"plural":"gomboșe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gomboș","accusative-definite-nominative-singular":"gomboșul","accusative-indefinite-nominative-plural":"gomboșe","accusative-definite-nominative-plural":"gomboșele","dative-genitive-indefinite-singular":"gomboș","dative-definite-genitive-singular":"gomboșului","dative-genitive-indefinite-plural":"gomboșe","dative-definite-genitive-plural":"gomboșelor","singular-vocative":"gomboșule","plural-vocative":"gomboșelor"}},{"word":"Gomboșiu","pos":"name","definitions":["a surname from Hungarian"],"gender":"m","forms":{"dative-genitive":"lui Gomboșiu"}},{"word":"gomilă","pos":"noun","definitions":["a heap of soil or stones used as a marker to delineate a borders"],"forms":{"plural":"gomile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gomilă","accusative-definite-nominative-singular":"gomila","accusative-indefinite-nominative-plural":"gomile","accusative-definite-nominative-plural":"gomilele","dative-genitive-indefinite-singular":"gomile","dative-definite-genitive-singular":"gomilei","dative-genitive-indefinite-plural":"gomile","dative-definite-genitive-plural":"gomilelor","singular-vocative":"gomilă","plural-vocative":"gomilelor"}},{"word":"gomoasă","pos":"noun","definitions":["female equivalent of gomos"],"forms":{"plural":"gomoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gomoasă","accusative-definite-nominative-singular":"gomoasa","accusative-indefinite-nominative-plural":"gomoase","accusative-definite-nominative-plural":"gomoasele","dative-genitive-indefinite-singular":"gomoase","dative-definite-genitive-singular":"gomoasei","dative-genitive-indefinite-plural":"gomoase","dative-definite-genitive-plural":"gomoaselor","singular-vocative":"gomoasă","plural-vocative":"gomoaselor"}},{"word":"Gomoescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gomoescu"}},{"word":"Gomoești","pos":"name","definitions":["a village in Costești, Buzău County, Romania"],"gender":"m"},{"word":"Gomoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gomoi"}},{"word":"Gomoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gomoiu"}},{"word":"gomon","pos":"noun","definitions":["hubbub, noise, uproar"],"forms":{"plural":"gomonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gomon","accusative-definite-nominative-singular":"gomonul","accusative-indefinite-nominative-plural":"gomonuri","accusative-definite-nominative-plural":"gomonurile","dative-genitive-indefinite-singular":"gomon","dative-definite-genitive-singular":"gomonului","dative-genitive-indefinite-plural":"gomonuri","dative-definite-genitive-plural":"gomonurilor","singular-vocative":"gomonule","plural-vocative":"gomonurilor"}},{"word":"gomos","pos":"adj","definitions":["gummy"],"forms":{"feminine-singular":"gomoasă","masculine-plural":"gomoși","feminine-neuter-plural":"gomoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gomos","error-unrecognized-form-feminine-indefinite-singular":"gomoasă","error-unrecognized-form-indefinite-masculine-plural":"gomoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gomoase","definite-error-unrecognized-form-masculine-neuter-singular":"gomosul","definite-error-unrecognized-form-feminine-singular":"gomoasa","definite-error-unrecognized-form-masculine-plural":"gomoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gomoasele"}},{"word":"gomoză","pos":"noun","definitions":["gummosis"],"forms":{"plural":"gomoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gomoză","accusative-definite-nominative-singular":"gomoza","accusative-indefinite-nominative-plural":"gomoze","accusative-definite-nominative-plural":"gomozele","dative-genitive-indefinite-singular":"gomoze","dative-definite-genitive-singular":"gomozei","dative-genitive-indefinite-plural":"gomoze","dative-definite-genitive-plural":"gomozelor","singular-vocative":"gomoză","plural-vocative":"gomozelor"}},{"word":"gonadă","pos":"noun","definitions":["gonad"],"forms":{"plural":"gonade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gonadă","accusative-definite-nominative-singular":"gonada","accusative-indefinite-nominative-plural":"gonade","accusative-definite-nominative-plural":"gonadele","dative-genitive-indefinite-singular":"gonade","dative-definite-genitive-singular":"gonadei","dative-genitive-indefinite-plural":"gonade","dative-definite-genitive-plural":"gonadelor","singular-vocative":"gonadă","plural-vocative":"gonadelor"}},{"word":"gonadotrop","pos":"noun","definitions":["gonadotrope"],"forms":{"plural":"gonadotropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gonadotrop","accusative-definite-nominative-singular":"gonadotropul","accusative-indefinite-nominative-plural":"gonadotropi","accusative-definite-nominative-plural":"gonadotropii","dative-genitive-indefinite-singular":"gonadotrop","dative-definite-genitive-singular":"gonadotropului","dative-genitive-indefinite-plural":"gonadotropi","dative-definite-genitive-plural":"gonadotropilor","singular-vocative":"gonadotropule","plural-vocative":"gonadotropilor"}},{"word":"gonalgie","pos":"noun","definitions":["gonalgia"],"forms":{"plural":"gonalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gonalgie","accusative-definite-nominative-singular":"gonalgia","accusative-indefinite-nominative-plural":"gonalgii","accusative-definite-nominative-plural":"gonalgiile","dative-genitive-indefinite-singular":"gonalgii","dative-definite-genitive-singular":"gonalgiei","dative-genitive-indefinite-plural":"gonalgii","dative-definite-genitive-plural":"gonalgiilor","singular-vocative":"gonalgie","plural-vocative":"gonalgiilor"}},{"word":"gonartrită","pos":"noun","definitions":["gonarthritis"],"forms":{"plural":"gonartrite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gonartrită","accusative-definite-nominative-singular":"gonartrita","accusative-indefinite-nominative-plural":"gonartrite","accusative-definite-nominative-plural":"gonartritele","dative-genitive-indefinite-singular":"gonartrite","dative-definite-genitive-singular":"gonartritei","dative-genitive-indefinite-plural":"gonartrite","dative-definite-genitive-plural":"gonartritelor","singular-vocative":"gonartrită","plural-vocative":"gonartritelor"}},{"word":"gonartroză","pos":"noun","definitions":["gonarthrosis"],"forms":{"plural":"gonartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gonartroză","accusative-definite-nominative-singular":"gonartroza","accusative-indefinite-nominative-plural":"gonartroze","accusative-definite-nominative-plural":"gonartrozele","dative-genitive-indefinite-singular":"gonartroze","dative-definite-genitive-singular":"gonartrozei","dative-genitive-indefinite-plural":"gonartroze","dative-definite-genitive-plural":"gonartrozelor","singular-vocative":"gonartroză","plural-vocative":"gonartrozelor"}},{"word":"gondolă","pos":"noun","definitions":["gondola"],"forms":{"plural":"gondole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gondolă","accusative-definite-nominative-singular":"gondola","accusative-indefinite-nominative-plural":"gondole","accusative-definite-nominative-plural":"gondolele","dative-genitive-indefinite-singular":"gondole","dative-definite-genitive-singular":"gondolei","dative-genitive-indefinite-plural":"gondole","dative-definite-genitive-plural":"gondolelor","singular-vocative":"gondolă","plural-vocative":"gondolelor"}},{"word":"gondoletă","pos":"noun","definitions":["a small gondola"],"forms":{"plural":"gondolete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gondoletă","accusative-definite-nominative-singular":"gondoleta","accusative-indefinite-nominative-plural":"gondolete","accusative-definite-nominative-plural":"gondoletele","dative-genitive-indefinite-singular":"gondolete","dative-definite-genitive-singular":"gondoletei","dative-genitive-indefinite-plural":"gondolete","dative-definite-genitive-plural":"gondoletelor","singular-vocative":"gondoletă","plural-vocative":"gondoletelor"}},{"word":"gondolier","pos":"noun","definitions":["gondolier (Venetian boatman)"],"forms":{"plural":"gondolieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gondolier","accusative-definite-nominative-singular":"gondolierul","accusative-indefinite-nominative-plural":"gondolieri","accusative-definite-nominative-plural":"gondolierii","dative-genitive-indefinite-singular":"gondolier","dative-definite-genitive-singular":"gondolierului","dative-genitive-indefinite-plural":"gondolieri","dative-definite-genitive-plural":"gondolierilor","singular-vocative":"gondolierule","plural-vocative":"gondolierilor"}},{"word":"gondolieră","pos":"noun","definitions":["song of the gondoliers"],"forms":{"plural":"gondoliere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gondolieră","accusative-definite-nominative-singular":"gondoliera","accusative-indefinite-nominative-plural":"gondoliere","accusative-definite-nominative-plural":"gondolierele","dative-genitive-indefinite-singular":"gondoliere","dative-definite-genitive-singular":"gondolierei","dative-genitive-indefinite-plural":"gondoliere","dative-definite-genitive-plural":"gondolierelor","singular-vocative":"gondolieră","plural-vocative":"gondolierelor"}},{"word":"gonfalon","pos":"noun","definitions":["gonfalon"],"forms":{"plural":"gonfaloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gonfalon","accusative-definite-nominative-singular":"gonfalonul","accusative-indefinite-nominative-plural":"gonfaloane","accusative-definite-nominative-plural":"gonfaloanele","dative-genitive-indefinite-singular":"gonfalon","dative-definite-genitive-singular":"gonfalonului","dative-genitive-indefinite-plural":"gonfaloane","dative-definite-genitive-plural":"gonfaloanelor","singular-vocative":"gonfalonule","plural-vocative":"gonfaloanelor"}},{"word":"gonfalonier","pos":"noun","definitions":["gonfalonier"],"forms":{"plural":"gonfalonieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gonfalonier","accusative-definite-nominative-singular":"gonfalonierul","accusative-indefinite-nominative-plural":"gonfalonieri","accusative-definite-nominative-plural":"gonfalonierii","dative-genitive-indefinite-singular":"gonfalonier","dative-definite-genitive-singular":"gonfalonierului","dative-genitive-indefinite-plural":"gonfalonieri","dative-definite-genitive-plural":"gonfalonierilor","singular-vocative":"gonfalonierule","plural-vocative":"gonfalonierilor"}},{"word":"gonfla","pos":"verb","definitions":["to inflate"],"forms":{"canonical":"a gonfla 1st conjugation","present-singular-third-person":"gonflează","participle-past":"gonflat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gonfla","gerund":"gonflând","first-person-indicative-present-singular":"gonflez","indicative-present-second-person-singular":"gonflezi","indicative-present-singular-third-person":"gonflează","first-person-indicative-plural-present":"gonflăm","indicative-plural-present-second-person":"gonflați","indicative-plural-present-third-person":"gonflează","first-person-imperfect-indicative-singular":"gonflam","imperfect-indicative-second-person-singular":"gonflai","imperfect-indicative-singular-third-person":"gonfla","first-person-imperfect-indicative-plural":"gonflam","imperfect-indicative-plural-second-person":"gonflați","imperfect-indicative-plural-third-person":"gonflau","first-person-indicative-perfect-singular":"gonflai","indicative-perfect-second-person-singular":"gonflași","indicative-perfect-singular-third-person":"gonflă","first-person-indicative-perfect-plural":"gonflarăm","indicative-perfect-plural-second-person":"gonflarăți","indicative-perfect-plural-third-person":"gonflară","first-person-indicative-pluperfect-singular":"gonflasem","indicative-pluperfect-second-person-singular":"gonflaseși","indicative-pluperfect-singular-third-person":"gonflase","first-person-indicative-pluperfect-plural":"gonflaserăm","indicative-pluperfect-plural-second-person":"gonflaserăți","indicative-pluperfect-plural-third-person":"gonflaseră","first-person-present-singular-subjunctive":"să gonflez","present-second-person-singular-subjunctive":"să gonflezi","present-singular-subjunctive-third-person":"să gonfleze","first-person-plural-present-subjunctive":"să gonflăm","plural-present-second-person-subjunctive":"să gonflați","plural-present-subjunctive-third-person":"să gonfleze","imperative-second-person-singular":"gonflează","imperative-plural-second-person":"gonflați","imperative-negative-second-person-singular":"nu gonfla","imperative-negative-plural-second-person":"nu gonflați"}},{"word":"gonflabil","pos":"adj","definitions":["inflatable"],"forms":{"feminine-singular":"gonflabilă","masculine-plural":"gonflabili","feminine-neuter-plural":"gonflabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gonflabil","error-unrecognized-form-feminine-indefinite-singular":"gonflabilă","error-unrecognized-form-indefinite-masculine-plural":"gonflabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"gonflabile","definite-error-unrecognized-form-masculine-neuter-singular":"gonflabilul","definite-error-unrecognized-form-feminine-singular":"gonflabila","definite-error-unrecognized-form-masculine-plural":"gonflabilii","definite-error-unrecognized-form-feminine-neuter-plural":"gonflabilele"}},{"word":"gonflare","pos":"noun","definitions":["swelling"],"forms":{"plural":"gonflări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gonflare","accusative-definite-nominative-singular":"gonflarea","accusative-indefinite-nominative-plural":"gonflări","accusative-definite-nominative-plural":"gonflările","dative-genitive-indefinite-singular":"gonflări","dative-definite-genitive-singular":"gonflării","dative-genitive-indefinite-plural":"gonflări","dative-definite-genitive-plural":"gonflărilor","singular-vocative":"gonflare","plural-vocative":"gonflărilor"}},{"word":"gonflat","pos":"adj","definitions":["inflated"],"forms":{"feminine-singular":"gonflată","masculine-plural":"gonflați","feminine-neuter-plural":"gonflate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gonflat","error-unrecognized-form-feminine-indefinite-singular":"gonflată","error-unrecognized-form-indefinite-masculine-plural":"gonflați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gonflate","definite-error-unrecognized-form-masculine-neuter-singular":"gonflatul","definite-error-unrecognized-form-feminine-singular":"gonflata","definite-error-unrecognized-form-masculine-plural":"gonflații","definite-error-unrecognized-form-feminine-neuter-plural":"gonflatele"}},{"word":"gong","pos":"noun","definitions":["gong"],"forms":{"plural":"gonguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gong","accusative-definite-nominative-singular":"gongul","accusative-indefinite-nominative-plural":"gonguri","accusative-definite-nominative-plural":"gongurile","dative-genitive-indefinite-singular":"gong","dative-definite-genitive-singular":"gongului","dative-genitive-indefinite-plural":"gonguri","dative-definite-genitive-plural":"gongurilor","singular-vocative":"gongule","plural-vocative":"gongurilor"}},{"word":"gongălie","pos":"noun","definitions":["insect, critter"],"forms":{"plural":"gongălii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gongălie","accusative-definite-nominative-singular":"gongălia","accusative-indefinite-nominative-plural":"gongălii","accusative-definite-nominative-plural":"gongăliile","dative-genitive-indefinite-singular":"gongălii","dative-definite-genitive-singular":"gongăliei","dative-genitive-indefinite-plural":"gongălii","dative-definite-genitive-plural":"gongăliilor","singular-vocative":"gongălie","plural-vocative":"gongăliilor"}},{"word":"gonghicioare","pos":"noun","definitions":["red currant (Ribes rubrum)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"gonghicioare","accusative-definite-nominative":"gonghicioarele","dative-genitive-indefinite":"gonghicioare","dative-definite-genitive":"gonghicioarelor","vocative":"-"}},{"word":"gongoric","pos":"adj","definitions":["Gongoristic"],"forms":{"feminine-singular":"gongorică","masculine-plural":"gongorici","feminine-neuter-plural":"gongorice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gongoric","error-unrecognized-form-feminine-indefinite-singular":"gongorică","error-unrecognized-form-indefinite-masculine-plural":"gongorici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gongorice","definite-error-unrecognized-form-masculine-neuter-singular":"gongoricul","definite-error-unrecognized-form-feminine-singular":"gongorica","definite-error-unrecognized-form-masculine-plural":"gongoricii","definite-error-unrecognized-form-feminine-neuter-plural":"gongoricele"}},{"word":"gongorism","pos":"noun","definitions":["Gongorism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gongorism","accusative-definite-nominative-singular":"gongorismul","accusative-indefinite-nominative-plural":"gongorisme","accusative-definite-nominative-plural":"gongorismele","dative-genitive-indefinite-singular":"gongorism","dative-definite-genitive-singular":"gongorismului","dative-genitive-indefinite-plural":"gongorisme","dative-definite-genitive-plural":"gongorismelor","singular-vocative":"gongorismule","plural-vocative":"gongorismelor"}},{"word":"gongoriță","pos":"noun","definitions":["wheat weevil (Sitophilus granarius)"],"forms":{"plural":"gongorițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gongoriță","accusative-definite-nominative-singular":"gongorița","accusative-indefinite-nominative-plural":"gongorițe","accusative-definite-nominative-plural":"gongorițele","dative-genitive-indefinite-singular":"gongorițe","dative-definite-genitive-singular":"gongoriței","dative-genitive-indefinite-plural":"gongorițe","dative-definite-genitive-plural":"gongorițelor","singular-vocative":"gongoriță","plural-vocative":"gongorițelor"}},{"word":"gonguri","pos":"verb","definitions":["obsolete form of gânguri"],"forms":{"canonical":"a gonguri 4th conjugation","present-singular-third-person":"gongurește","participle-past":"gongurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gonguri","gerund":"gongurind","first-person-indicative-present-singular":"gonguresc","indicative-present-second-person-singular":"gongurești","indicative-present-singular-third-person":"gongurește","first-person-indicative-plural-present":"gongurim","indicative-plural-present-second-person":"gonguriți","indicative-plural-present-third-person":"gonguresc","first-person-imperfect-indicative-singular":"gonguream","imperfect-indicative-second-person-singular":"gongureai","imperfect-indicative-singular-third-person":"gongurea","first-person-imperfect-indicative-plural":"gonguream","imperfect-indicative-plural-second-person":"gongureați","imperfect-indicative-plural-third-person":"gongureau","first-person-indicative-perfect-singular":"gongurii","indicative-perfect-second-person-singular":"gonguriși","indicative-perfect-singular-third-person":"gonguri","first-person-indicative-perfect-plural":"gongurirăm","indicative-perfect-plural-second-person":"gongurirăți","indicative-perfect-plural-third-person":"gonguriră","first-person-indicative-pluperfect-singular":"gongurisem","indicative-pluperfect-second-person-singular":"gonguriseși","indicative-pluperfect-singular-third-person":"gongurise","first-person-indicative-pluperfect-plural":"gonguriserăm","indicative-pluperfect-plural-second-person":"gonguriserăți","indicative-pluperfect-plural-third-person":"gonguriseră","first-person-present-singular-subjunctive":"să gonguresc","present-second-person-singular-subjunctive":"să gongurești","present-singular-subjunctive-third-person":"să gongurească","first-person-plural-present-subjunctive":"să gongurim","plural-present-second-person-subjunctive":"să gonguriți","plural-present-subjunctive-third-person":"să gongurească","imperative-second-person-singular":"gongurește","imperative-plural-second-person":"gonguriți","imperative-negative-second-person-singular":"nu gonguri","imperative-negative-plural-second-person":"nu gonguriți"}},{"word":"gonguță","pos":"noun","definitions":["diminutive of goangă"],"forms":{"plural":"gonguțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gonguță","accusative-definite-nominative-singular":"gonguța","accusative-indefinite-nominative-plural":"gonguțe","accusative-definite-nominative-plural":"gonguțele","dative-genitive-indefinite-singular":"gonguțe","dative-definite-genitive-singular":"gonguței","dative-genitive-indefinite-plural":"gonguțe","dative-definite-genitive-plural":"gonguțelor","singular-vocative":"gonguță","plural-vocative":"gonguțelor"}},{"word":"goni","pos":"verb","definitions":["to chase away, cast out, banish, drive away, drive out, hound out","to chase after, follow, chase down, hunt down."],"pronunciation":"/ɡoˈni/","forms":{"canonical":"a goni 4th conjugation","present-singular-third-person":"gonește","participle-past":"gonit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a goni","gerund":"gonind","first-person-indicative-present-singular":"gonesc","indicative-present-second-person-singular":"gonești","indicative-present-singular-third-person":"gonește","first-person-indicative-plural-present":"gonim","indicative-plural-present-second-person":"goniți","indicative-plural-present-third-person":"gonesc","first-person-imperfect-indicative-singular":"goneam","imperfect-indicative-second-person-singular":"goneai","imperfect-indicative-singular-third-person":"gonea","first-person-imperfect-indicative-plural":"goneam","imperfect-indicative-plural-second-person":"goneați","imperfect-indicative-plural-third-person":"goneau","first-person-indicative-perfect-singular":"gonii","indicative-perfect-second-person-singular":"goniși","indicative-perfect-singular-third-person":"goni","first-person-indicative-perfect-plural":"gonirăm","indicative-perfect-plural-second-person":"gonirăți","indicative-perfect-plural-third-person":"goniră","first-person-indicative-pluperfect-singular":"gonisem","indicative-pluperfect-second-person-singular":"goniseși","indicative-pluperfect-singular-third-person":"gonise","first-person-indicative-pluperfect-plural":"goniserăm","indicative-pluperfect-plural-second-person":"goniserăți","indicative-pluperfect-plural-third-person":"goniseră","first-person-present-singular-subjunctive":"să gonesc","present-second-person-singular-subjunctive":"să gonești","present-singular-subjunctive-third-person":"să gonească","first-person-plural-present-subjunctive":"să gonim","plural-present-second-person-subjunctive":"să goniți","plural-present-subjunctive-third-person":"să gonească","imperative-second-person-singular":"gonește","imperative-plural-second-person":"goniți","imperative-negative-second-person-singular":"nu goni","imperative-negative-plural-second-person":"nu goniți"}},{"word":"goniciune","pos":"noun","definitions":["persecution"],"forms":{"plural":"goniciuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"goniciune","accusative-definite-nominative-singular":"goniciunea","accusative-indefinite-nominative-plural":"goniciuni","accusative-definite-nominative-plural":"goniciunile","dative-genitive-indefinite-singular":"goniciuni","dative-definite-genitive-singular":"goniciunii","dative-genitive-indefinite-plural":"goniciuni","dative-definite-genitive-plural":"goniciunilor","singular-vocative":"goniciune","plural-vocative":"goniciunilor"}},{"word":"gonidie","pos":"noun","definitions":["gonidia"],"forms":{"plural":"gonidii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gonidie","accusative-definite-nominative-singular":"gonidia","accusative-indefinite-nominative-plural":"gonidii","accusative-definite-nominative-plural":"gonidiile","dative-genitive-indefinite-singular":"gonidii","dative-definite-genitive-singular":"gonidiei","dative-genitive-indefinite-plural":"gonidii","dative-definite-genitive-plural":"gonidiilor","singular-vocative":"gonidie","plural-vocative":"gonidiilor"}},{"word":"goniometric","pos":"adj","definitions":["goniometric"],"forms":{"feminine-singular":"goniometrică","masculine-plural":"goniometrici","feminine-neuter-plural":"goniometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"goniometric","error-unrecognized-form-feminine-indefinite-singular":"goniometrică","error-unrecognized-form-indefinite-masculine-plural":"goniometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"goniometrice","definite-error-unrecognized-form-masculine-neuter-singular":"goniometricul","definite-error-unrecognized-form-feminine-singular":"goniometrica","definite-error-unrecognized-form-masculine-plural":"goniometricii","definite-error-unrecognized-form-feminine-neuter-plural":"goniometricele"}},{"word":"goniometrie","pos":"noun","definitions":["goniometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"goniometrie","accusative-definite-nominative":"goniometria","dative-genitive-indefinite":"goniometrii","dative-definite-genitive":"goniometriei","vocative":"goniometrie"}},{"word":"goniometru","pos":"noun","definitions":["goniometer"],"forms":{"plural":"goniometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"goniometru","accusative-definite-nominative-singular":"goniometrul","accusative-indefinite-nominative-plural":"goniometre","accusative-definite-nominative-plural":"goniometrele","dative-genitive-indefinite-singular":"goniometru","dative-definite-genitive-singular":"goniometrului","dative-genitive-indefinite-plural":"goniometre","dative-definite-genitive-plural":"goniometrelor","singular-vocative":"goniometrule","plural-vocative":"goniometrelor"}},{"word":"gonire","pos":"noun","definitions":["chasing away"],"forms":{"plural":"goniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gonire","accusative-definite-nominative-singular":"gonirea","accusative-indefinite-nominative-plural":"goniri","accusative-definite-nominative-plural":"gonirile","dative-genitive-indefinite-singular":"goniri","dative-definite-genitive-singular":"gonirii","dative-genitive-indefinite-plural":"goniri","dative-definite-genitive-plural":"gonirilor","singular-vocative":"gonire","plural-vocative":"gonirilor"}},{"word":"goniță","pos":"noun","definitions":["common whirligig beetle (Gyrinus natator)"],"forms":{"plural":"gonițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goniță","accusative-definite-nominative-singular":"gonița","accusative-indefinite-nominative-plural":"gonițe","accusative-definite-nominative-plural":"gonițele","dative-genitive-indefinite-singular":"gonițe","dative-definite-genitive-singular":"goniței","dative-genitive-indefinite-plural":"gonițe","dative-definite-genitive-plural":"gonițelor","singular-vocative":"goniță","plural-vocative":"gonițelor"}},{"word":"gonitoare","pos":"noun","definitions":["female equivalent of gonitor"],"forms":{"plural":"gonitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"gonitoare","accusative-definite-nominative-singular":"gonitoarea","accusative-indefinite-nominative-plural":"gonitoare","accusative-definite-nominative-plural":"gonitoarele","dative-genitive-indefinite-singular":"gonitoare","dative-definite-genitive-singular":"gonitoarei","dative-genitive-indefinite-plural":"gonitoare","dative-definite-genitive-plural":"gonitoarelor","singular-vocative":"gonitoare","plural-vocative":"gonitoarelor"}},{"word":"gonitură","pos":"noun","definitions":["persecution"],"forms":{"plural":"gonituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gonitură","accusative-definite-nominative-singular":"gonitura","accusative-indefinite-nominative-plural":"gonituri","accusative-definite-nominative-plural":"goniturile","dative-genitive-indefinite-singular":"gonituri","dative-definite-genitive-singular":"goniturii","dative-genitive-indefinite-plural":"gonituri","dative-definite-genitive-plural":"goniturilor","singular-vocative":"gonitură","plural-vocative":"goniturilor"}},{"word":"gonocit","pos":"noun","definitions":["gonocyte"],"forms":{"plural":"gonocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gonocit","accusative-definite-nominative-singular":"gonocitul","accusative-indefinite-nominative-plural":"gonocite","accusative-definite-nominative-plural":"gonocitele","dative-genitive-indefinite-singular":"gonocit","dative-definite-genitive-singular":"gonocitului","dative-genitive-indefinite-plural":"gonocite","dative-definite-genitive-plural":"gonocitelor","singular-vocative":"gonocitule","plural-vocative":"gonocitelor"}},{"word":"gonococ","pos":"noun","definitions":["gonococcus"],"forms":{"plural":"gonococi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gonococ","accusative-definite-nominative-singular":"gonococul","accusative-indefinite-nominative-plural":"gonococi","accusative-definite-nominative-plural":"gonococii","dative-genitive-indefinite-singular":"gonococ","dative-definite-genitive-singular":"gonococului","dative-genitive-indefinite-plural":"gonococi","dative-definite-genitive-plural":"gonococilor","singular-vocative":"gonococule","plural-vocative":"gonococilor"}},{"word":"gonococie","pos":"noun","definitions":["gonorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gonococie","accusative-definite-nominative":"gonococia","dative-genitive-indefinite":"gonococii","dative-definite-genitive":"gonocociei","vocative":"gonococie"}},{"word":"gonocorism","pos":"noun","definitions":["gonochorism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gonocorism","accusative-definite-nominative":"gonocorismul","dative-genitive-indefinite":"gonocorism","dative-definite-genitive":"gonocorismului","vocative":"gonocorismule"}},{"word":"gonoi","pos":"noun","definitions":["pus"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gonoi","accusative-definite-nominative":"gonoiul","dative-genitive-indefinite":"gonoi","dative-definite-genitive":"gonoiului","vocative":"gonoiule"}},{"word":"gonoree","pos":"noun","definitions":["gonorrhea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"gonoree","accusative-definite-nominative-singular":"gonoreea","accusative-indefinite-nominative-plural":"gonoree","accusative-definite-nominative-plural":"gonoreele","dative-genitive-indefinite-singular":"gonoree","dative-definite-genitive-singular":"gonoreei","dative-genitive-indefinite-plural":"gonoree","dative-definite-genitive-plural":"gonoreelor","singular-vocative":"gonoree","plural-vocative":"gonoreelor"}},{"word":"Gonțești","pos":"name","definitions":["a village in Cănești, Buzău County, Romania"],"gender":"m"},{"word":"Gorănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gorănescu"}},{"word":"Gorănești","pos":"name","definitions":["a village in Topoloveni, Argeș County, Romania"],"gender":"m"},{"word":"Gorani","pos":"name","definitions":["a village in Uda, Argeș County, Romania"],"gender":"m"},{"word":"Gorâni","pos":"name","definitions":["a village in Odăile, Buzău County, Romania"],"gender":"m"},{"word":"Goranu","pos":"name","definitions":["a village in Râmnicu Vâlcea, Vâlcea County, Romania"],"gender":"m"},{"word":"Goraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Goraș"}},{"word":"Gorbănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gorbănescu"}},{"word":"Gorbănești","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Gorbănești, Botoșani County, Romania"],"gender":"m"},{"word":"gordian","pos":"adj","definitions":["Gordian"],"forms":{"feminine-singular":"gordiană","masculine-plural":"gordieni","feminine-neuter-plural":"gordiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gordian","error-unrecognized-form-feminine-indefinite-singular":"gordiană","error-unrecognized-form-indefinite-masculine-plural":"gordieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"gordiene","definite-error-unrecognized-form-masculine-neuter-singular":"gordianul","definite-error-unrecognized-form-feminine-singular":"gordiana","definite-error-unrecognized-form-masculine-plural":"gordienii","definite-error-unrecognized-form-feminine-neuter-plural":"gordienele"}},{"word":"Gordinești","pos":"name","definitions":["a commune of Edineț Raion, Moldova","a village in Gordinești, Edineț Raion, Moldova","a commune of Rezina Raion, Moldova","a village in Gordinești, Rezina Raion, Moldova"],"gender":"m"},{"word":"Gordineștii Noi","pos":"name","definitions":["a village in Edineț, Edineț Raion, Moldova"],"gender":"m"},{"word":"gordunaș","pos":"noun","definitions":["double bassist"],"forms":{"plural":"gordunași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gordunaș","accusative-definite-nominative-singular":"gordunașul","accusative-indefinite-nominative-plural":"gordunași","accusative-definite-nominative-plural":"gordunașii","dative-genitive-indefinite-singular":"gordunaș","dative-definite-genitive-singular":"gordunașului","dative-genitive-indefinite-plural":"gordunași","dative-definite-genitive-plural":"gordunașilor","singular-vocative":"gordunașule","plural-vocative":"gordunașilor"}},{"word":"Gore","pos":"name","definitions":["a male given name","a surname"],"gender":"m"},{"word":"Gorencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Gorencu"}},{"word":"Goreni","pos":"name","definitions":["a village in Batoș, Mureș County, Romania"],"gender":"m"},{"word":"Gorgan","pos":"name","definitions":["a village in Cenade, Alba County, Romania","a river in Alba, Romania, tributary to the Hopârta","a surname"],"gender":"m","forms":{"dative-genitive":"lui Gorgan"}},{"word":"gorgan","pos":"noun","definitions":["kurgan"],"forms":{"plural":"gorgane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gorgan","accusative-definite-nominative-singular":"gorganul","accusative-indefinite-nominative-plural":"gorgane","accusative-definite-nominative-plural":"gorganele","dative-genitive-indefinite-singular":"gorgan","dative-definite-genitive-singular":"gorganului","dative-genitive-indefinite-plural":"gorgane","dative-definite-genitive-plural":"gorganelor","singular-vocative":"gorganule","plural-vocative":"gorganelor"}},{"word":"Gorgăneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorgăneanu"}},{"word":"Gorganu","pos":"name","definitions":["a village in Călinești, Argeș County, Romania"],"gender":"m"},{"word":"gorganului","pos":"noun","definitions":["definite genitive/dative singular of gorgan"]},{"word":"Gorghești","pos":"name","definitions":["a village in Stănișești, Bacău County, Romania"],"gender":"m"},{"word":"gorgonă","pos":"noun","definitions":["gorgon"],"pronunciation":"/ɡorˈɡo.nə/","forms":{"plural":"gorgone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gorgonă","accusative-definite-nominative-singular":"gorgona","accusative-indefinite-nominative-plural":"gorgone","accusative-definite-nominative-plural":"gorgonele","dative-genitive-indefinite-singular":"gorgone","dative-definite-genitive-singular":"gorgonei","dative-genitive-indefinite-plural":"gorgone","dative-definite-genitive-plural":"gorgonelor","singular-vocative":"gorgonă","plural-vocative":"gorgonelor"}},{"word":"Gorgota","pos":"name","definitions":["a village in Răzvad, Dâmbovița County, Romania","a commune of Prahova County, Romania","a village in Gorgota, Prahova County, Romania"],"gender":"f"},{"word":"Gorgoțeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorgoțeanu"}},{"word":"Gorgovan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorgovan"}},{"word":"Gorgoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorgoveanu"}},{"word":"gorila","pos":"noun","definitions":["definite nominative/accusative singular of gorilă"],"pronunciation":"[ɡoˈrila]","gender":"f"},{"word":"Gorilă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gorilă"}},{"word":"gorilă","pos":"noun","definitions":["gorilla (ape)"],"pronunciation":"/ɡoˈri.lə/","forms":{"plural":"gorile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gorilă","accusative-definite-nominative-singular":"gorila","accusative-indefinite-nominative-plural":"gorile","accusative-definite-nominative-plural":"gorilele","dative-genitive-indefinite-singular":"gorile","dative-definite-genitive-singular":"gorilei","dative-genitive-indefinite-plural":"gorile","dative-definite-genitive-plural":"gorilelor","singular-vocative":"gorilă","plural-vocative":"gorilelor"}},{"word":"gorilo","pos":"noun","definitions":["vocative singular of gorilă"],"pronunciation":"[ɡoˈrilo]","gender":"f"},{"word":"Gorj","pos":"name","definitions":["Gorj (a county of Romania)"],"pronunciation":"/ɡorʒ/"},{"word":"Gorjan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorjan"}},{"word":"Gorjanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gorjanu"}},{"word":"gorjean","pos":"adj","definitions":["from or pertaining to Gorj"],"forms":{"feminine-singular":"gorjeană","masculine-plural":"gorjeni","feminine-neuter-plural":"gorjene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gorjean","error-unrecognized-form-feminine-indefinite-singular":"gorjeană","error-unrecognized-form-indefinite-masculine-plural":"gorjeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"gorjene","definite-error-unrecognized-form-masculine-neuter-singular":"gorjeanul","definite-error-unrecognized-form-feminine-singular":"gorjeana","definite-error-unrecognized-form-masculine-plural":"gorjenii","definite-error-unrecognized-form-feminine-neuter-plural":"gorjenele"}},{"word":"gorjean","pos":"noun","definitions":["a male inhabitant of Gorj"],"forms":{"plural":"gorjeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gorjean","accusative-definite-nominative-singular":"gorjeanul","accusative-indefinite-nominative-plural":"gorjeni","accusative-definite-nominative-plural":"gorjenii","dative-genitive-indefinite-singular":"gorjean","dative-definite-genitive-singular":"gorjeanului","dative-genitive-indefinite-plural":"gorjeni","dative-definite-genitive-plural":"gorjenilor","singular-vocative":"gorjeanule","plural-vocative":"gorjenilor"}},{"word":"gorjeancă","pos":"noun","definitions":["female equivalent of gorjean"],"forms":{"plural":"gorjence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gorjeancă","accusative-definite-nominative-singular":"gorjeanca","accusative-indefinite-nominative-plural":"gorjence","accusative-definite-nominative-plural":"gorjencele","dative-genitive-indefinite-singular":"gorjence","dative-definite-genitive-singular":"gorjencei","dative-genitive-indefinite-plural":"gorjence","dative-definite-genitive-plural":"gorjencelor","singular-vocative":"gorjeancă","plural-vocative":"gorjencelor"}},{"word":"Gornăcel","pos":"name","definitions":["a village in Schela, Gorj County, Romania"],"gender":"m"},{"word":"Gornea","pos":"name","definitions":["a village in Sichevița, Caraș-Severin County, Romania"],"gender":"f"},{"word":"Gorneni","pos":"name","definitions":["a village in Iepurești, Giurgiu County, Romania"],"gender":"m"},{"word":"Gornenți","pos":"name","definitions":["a village in Podeni, Mehedinți County, Romania"],"gender":"m"},{"word":"Gornescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gornescu"}},{"word":"Gornești","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Gornești, Mureș County, Romania"],"gender":"m"},{"word":"Gornet","pos":"name","definitions":["a village in Pătârlagele, Buzău County, Romania","a commune of Prahova County, Romania","a village in Gornet, Prahova County, Romania"],"gender":"m"},{"word":"Gornet-Cricov","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Gornet-Cricov, Prahova County, Romania"],"gender":"m"},{"word":"gornic","pos":"noun","definitions":["forester"],"forms":{"plural":"gornici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gornic","accusative-definite-nominative-singular":"gornicul","accusative-indefinite-nominative-plural":"gornici","accusative-definite-nominative-plural":"gornicii","dative-genitive-indefinite-singular":"gornic","dative-definite-genitive-singular":"gornicului","dative-genitive-indefinite-plural":"gornici","dative-definite-genitive-plural":"gornicilor","singular-vocative":"gornicule","plural-vocative":"gornicilor"}},{"word":"gorniceasă","pos":"noun","definitions":["female equivalent of gornic"],"forms":{"plural":"gornicese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gorniceasă","accusative-definite-nominative-singular":"gorniceasa","accusative-indefinite-nominative-plural":"gornicese","accusative-definite-nominative-plural":"gornicesele","dative-genitive-indefinite-singular":"gornicese","dative-definite-genitive-singular":"gornicesei","dative-genitive-indefinite-plural":"gornicese","dative-definite-genitive-plural":"gorniceselor","singular-vocative":"gorniceasă","plural-vocative":"gorniceselor"}},{"word":"gornicie","pos":"noun","definitions":["watchmanship"],"forms":{"plural":"gornicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gornicie","accusative-definite-nominative-singular":"gornicia","accusative-indefinite-nominative-plural":"gornicii","accusative-definite-nominative-plural":"gorniciile","dative-genitive-indefinite-singular":"gornicii","dative-definite-genitive-singular":"gorniciei","dative-genitive-indefinite-plural":"gornicii","dative-definite-genitive-plural":"gorniciilor","singular-vocative":"gornicie","plural-vocative":"gorniciilor"}},{"word":"gornist","pos":"noun","definitions":["bugler"],"forms":{"plural":"gorniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gornist","accusative-definite-nominative-singular":"gornistul","accusative-indefinite-nominative-plural":"gorniști","accusative-definite-nominative-plural":"gorniștii","dative-genitive-indefinite-singular":"gornist","dative-definite-genitive-singular":"gornistului","dative-genitive-indefinite-plural":"gorniști","dative-definite-genitive-plural":"gorniștilor","singular-vocative":"gornistule","plural-vocative":"gorniștilor"}},{"word":"Gornistu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Gornistu"}},{"word":"gorniță","pos":"noun","definitions":["veranda"],"forms":{"plural":"gornițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gorniță","accusative-definite-nominative-singular":"gornița","accusative-indefinite-nominative-plural":"gornițe","accusative-definite-nominative-plural":"gornițele","dative-genitive-indefinite-singular":"gornițe","dative-definite-genitive-singular":"gorniței","dative-genitive-indefinite-plural":"gornițe","dative-definite-genitive-plural":"gornițelor","singular-vocative":"gorniță","plural-vocative":"gornițelor"}},{"word":"Gornoe","pos":"name","definitions":["a village in Micăuți, Strășeni Raion, Moldova"],"gender":"m"},{"word":"Gornovița","pos":"name","definitions":["a village in Tismana, Gorj County, Romania","a village in Balta, Mehedinți County, Romania"],"gender":"f"},{"word":"goroncuță","pos":"noun","definitions":["hyacinth (Hyacinthus orientalis)"],"forms":{"plural":"goroncuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"goroncuță","accusative-definite-nominative-singular":"goroncuța","accusative-indefinite-nominative-plural":"goroncuțe","accusative-definite-nominative-plural":"goroncuțele","dative-genitive-indefinite-singular":"goroncuțe","dative-definite-genitive-singular":"goroncuței","dative-genitive-indefinite-plural":"goroncuțe","dative-definite-genitive-plural":"goroncuțelor","singular-vocative":"goroncuță","plural-vocative":"goroncuțelor"}},{"word":"goronet","pos":"noun","definitions":["sessile oak grove"],"forms":{"plural":"goroneturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"goronet","accusative-definite-nominative-singular":"goronetul","accusative-indefinite-nominative-plural":"goroneturi","accusative-definite-nominative-plural":"goroneturile","dative-genitive-indefinite-singular":"goronet","dative-definite-genitive-singular":"goronetului","dative-genitive-indefinite-plural":"goroneturi","dative-definite-genitive-plural":"goroneturilor","singular-vocative":"goronetule","plural-vocative":"goroneturilor"}},{"word":"Gorovei","pos":"name","definitions":["a village in Văculești, Botoșani County, Romania"],"gender":"m"},{"word":"Gorschi","pos":"name","definitions":["a surname from Polish"],"gender":"m","forms":{"dative-genitive":"lui Gorschi"}},{"word":"Gorun","pos":"name","definitions":["a village in Oniceni, Neamț County, Romania"],"gender":"m"},{"word":"gorun","pos":"noun","definitions":["sessile oak (Quercus petraea)."],"forms":{"plural":"goruni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gorun","accusative-definite-nominative-singular":"gorunul","accusative-indefinite-nominative-plural":"goruni","accusative-definite-nominative-plural":"gorunii","dative-genitive-indefinite-singular":"gorun","dative-definite-genitive-singular":"gorunului","dative-genitive-indefinite-plural":"goruni","dative-definite-genitive-plural":"gorunilor","singular-vocative":"gorunule","plural-vocative":"gorunilor"}},{"word":"Goruna","pos":"name","definitions":["a village in Cocorăștii Mislii, Prahova County, Romania"],"gender":"f"},{"word":"gorunel","pos":"noun","definitions":["diminutive of gorun"],"forms":{"plural":"gorunei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gorunel","accusative-definite-nominative-singular":"gorunelul","accusative-indefinite-nominative-plural":"gorunei","accusative-definite-nominative-plural":"goruneii","dative-genitive-indefinite-singular":"gorunel","dative-definite-genitive-singular":"gorunelului","dative-genitive-indefinite-plural":"gorunei","dative-definite-genitive-plural":"goruneilor","singular-vocative":"gorunelule","plural-vocative":"goruneilor"}},{"word":"Gorunescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gorunescu"}},{"word":"Gorunești","pos":"name","definitions":["a village in Bălcești, Vâlcea County, Romania","a village in Slătioara, Vâlcea County, Romania"],"gender":"m"},{"word":"gorunet","pos":"noun","definitions":["sessile oak grove"],"forms":{"plural":"goruneturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gorunet","accusative-definite-nominative-singular":"gorunetul","accusative-indefinite-nominative-plural":"goruneturi","accusative-definite-nominative-plural":"goruneturile","dative-genitive-indefinite-singular":"gorunet","dative-definite-genitive-singular":"gorunetului","dative-genitive-indefinite-plural":"goruneturi","dative-definite-genitive-plural":"goruneturilor","singular-vocative":"gorunetule","plural-vocative":"goruneturilor"}},{"word":"Goruni","pos":"name","definitions":["a village in Lipnița, Constanța County, Romania","a village in Tomești, Iași County, Romania"],"gender":"m"},{"word":"goruni","pos":"noun","definitions":["plural of gorun"]},{"word":"goruniș","pos":"noun","definitions":["sessile oak grove"],"forms":{"plural":"gorunișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"goruniș","accusative-definite-nominative-singular":"gorunișul","accusative-indefinite-nominative-plural":"gorunișuri","accusative-definite-nominative-plural":"gorunișurile","dative-genitive-indefinite-singular":"goruniș","dative-definite-genitive-singular":"gorunișului","dative-genitive-indefinite-plural":"gorunișuri","dative-definite-genitive-plural":"gorunișurilor","singular-vocative":"gorunișule","plural-vocative":"gorunișurilor"}},{"word":"goruniște","pos":"noun","definitions":["oak forest"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"goruniște","accusative-definite-nominative-singular":"goruniștea","accusative-indefinite-nominative-plural":"goruniște","accusative-definite-nominative-plural":"goruniștele","dative-genitive-indefinite-singular":"goruniște","dative-definite-genitive-singular":"goruniștei","dative-genitive-indefinite-plural":"goruniște","dative-definite-genitive-plural":"goruniștelor","singular-vocative":"goruniște","plural-vocative":"goruniștelor"}},{"word":"gosipol","pos":"noun","definitions":["gossypol"],"forms":{"plural":"gosipoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gosipol","accusative-definite-nominative-singular":"gosipolul","accusative-indefinite-nominative-plural":"gosipoluri","accusative-definite-nominative-plural":"gosipolurile","dative-genitive-indefinite-singular":"gosipol","dative-definite-genitive-singular":"gosipolului","dative-genitive-indefinite-plural":"gosipoluri","dative-definite-genitive-plural":"gosipolurilor","singular-vocative":"gosipolule","plural-vocative":"gosipolurilor"}},{"word":"Goșmani","pos":"name","definitions":["a village in Români, Neamț County, Romania"],"gender":"m"},{"word":"gospod","pos":"adj","definitions":["princely"],"forms":{"feminine-singular":"gospodă","masculine-plural":"gospozi","feminine-neuter-plural":"gospode","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gospod","error-unrecognized-form-feminine-indefinite-singular":"gospodă","error-unrecognized-form-indefinite-masculine-plural":"gospozi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gospode","definite-error-unrecognized-form-masculine-neuter-singular":"gospodul","definite-error-unrecognized-form-feminine-singular":"gospoda","definite-error-unrecognized-form-masculine-plural":"gospozii","definite-error-unrecognized-form-feminine-neuter-plural":"gospodele"}},{"word":"gospodar","pos":"noun","definitions":["householder; master of the house or head of a household","a good manager or someone who is in charge"],"pronunciation":"/ɡos.poˈdar/","forms":{"plural":"gospodari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gospodar","accusative-definite-nominative-singular":"gospodarul","accusative-indefinite-nominative-plural":"gospodari","accusative-definite-nominative-plural":"gospodarii","dative-genitive-indefinite-singular":"gospodar","dative-definite-genitive-singular":"gospodarului","dative-genitive-indefinite-plural":"gospodari","dative-definite-genitive-plural":"gospodarilor","singular-vocative":"gospodarule","plural-vocative":"gospodarilor"}},{"word":"gospodar","pos":"adj","definitions":["skilled, competent, wise, thrifty, as in a good manager"],"pronunciation":"/ɡos.poˈdar/","forms":{"feminine-singular":"gospodară","masculine-plural":"gospodari","feminine-neuter-plural":"gospodare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gospodar","error-unrecognized-form-feminine-indefinite-singular":"gospodară","error-unrecognized-form-indefinite-masculine-plural":"gospodari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gospodare","definite-error-unrecognized-form-masculine-neuter-singular":"gospodarul","definite-error-unrecognized-form-feminine-singular":"gospodara","definite-error-unrecognized-form-masculine-plural":"gospodarii","definite-error-unrecognized-form-feminine-neuter-plural":"gospodarele"}},{"word":"gospodăraș","pos":"noun","definitions":["diminutive of gospodar"],"forms":{"plural":"gospodărași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gospodăraș","accusative-definite-nominative-singular":"gospodărașul","accusative-indefinite-nominative-plural":"gospodărași","accusative-definite-nominative-plural":"gospodărașii","dative-genitive-indefinite-singular":"gospodăraș","dative-definite-genitive-singular":"gospodărașului","dative-genitive-indefinite-plural":"gospodărași","dative-definite-genitive-plural":"gospodărașilor","singular-vocative":"gospodărașule","plural-vocative":"gospodărașilor"}},{"word":"gospodărească","pos":"adj","definitions":["feminine singular of gospodăresc"],"pronunciation":"/ɡos.po.dəˈre̯as.kə/"},{"word":"gospodăresc","pos":"adj","definitions":["thrifty, economical, frugal, well-managed, wisely-managed","rich, wealthy","household, of or relating to the house","steady, steady-going, orderly, moderated"],"pronunciation":"/ɡos.po.dəˈresk/","forms":{"feminine-singular":"gospodărească","plural":"gospodărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gospodăresc","error-unrecognized-form-feminine-indefinite-singular":"gospodărească","error-unrecognized-form-indefinite-masculine-plural":"gospodărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gospodărești","definite-error-unrecognized-form-masculine-neuter-singular":"gospodărescul","definite-error-unrecognized-form-feminine-singular":"gospodăreasca","definite-error-unrecognized-form-masculine-plural":"gospodăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"gospodăreștile"}},{"word":"gospodărește","pos":"adv","definitions":["thriftily"]},{"word":"gospodărești","pos":"adj","definitions":["plural of gospodăresc"],"pronunciation":"/ɡos.po.dəˈreʃtʲ/"},{"word":"gospodări","pos":"verb","definitions":["to administer the affairs of a household","to administer an organization","to establish a household by marriage"],"forms":{"canonical":"a gospodări 4th conjugation","present-singular-third-person":"gospodărește","participle-past":"gospodărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gospodări","gerund":"gospodărind","first-person-indicative-present-singular":"gospodăresc","indicative-present-second-person-singular":"gospodărești","indicative-present-singular-third-person":"gospodărește","first-person-indicative-plural-present":"gospodărim","indicative-plural-present-second-person":"gospodăriți","indicative-plural-present-third-person":"gospodăresc","first-person-imperfect-indicative-singular":"gospodăream","imperfect-indicative-second-person-singular":"gospodăreai","imperfect-indicative-singular-third-person":"gospodărea","first-person-imperfect-indicative-plural":"gospodăream","imperfect-indicative-plural-second-person":"gospodăreați","imperfect-indicative-plural-third-person":"gospodăreau","first-person-indicative-perfect-singular":"gospodării","indicative-perfect-second-person-singular":"gospodăriși","indicative-perfect-singular-third-person":"gospodări","first-person-indicative-perfect-plural":"gospodărirăm","indicative-perfect-plural-second-person":"gospodărirăți","indicative-perfect-plural-third-person":"gospodăriră","first-person-indicative-pluperfect-singular":"gospodărisem","indicative-pluperfect-second-person-singular":"gospodăriseși","indicative-pluperfect-singular-third-person":"gospodărise","first-person-indicative-pluperfect-plural":"gospodăriserăm","indicative-pluperfect-plural-second-person":"gospodăriserăți","indicative-pluperfect-plural-third-person":"gospodăriseră","first-person-present-singular-subjunctive":"să gospodăresc","present-second-person-singular-subjunctive":"să gospodărești","present-singular-subjunctive-third-person":"să gospodărească","first-person-plural-present-subjunctive":"să gospodărim","plural-present-second-person-subjunctive":"să gospodăriți","plural-present-subjunctive-third-person":"să gospodărească","imperative-second-person-singular":"gospodărește","imperative-plural-second-person":"gospodăriți","imperative-negative-second-person-singular":"nu gospodări","imperative-negative-plural-second-person":"nu gospodăriți"}},{"word":"gospodărie","pos":"noun","definitions":["house, household, ménage","farm","economy, housewifery, husbandary"],"pronunciation":"/ɡos.po.dəˈri.e/","forms":{"plural":"gospodării","alternative":"господэрие"}},{"word":"gospodărioară","pos":"noun","definitions":["diminutive of gospodărie; small household"],"forms":{"plural":"gospodărioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gospodărioară","accusative-definite-nominative-singular":"gospodărioara","accusative-indefinite-nominative-plural":"gospodărioare","accusative-definite-nominative-plural":"gospodărioarele","dative-genitive-indefinite-singular":"gospodărioare","dative-definite-genitive-singular":"gospodărioarei","dative-genitive-indefinite-plural":"gospodărioare","dative-definite-genitive-plural":"gospodărioarelor","singular-vocative":"gospodărioară","plural-vocative":"gospodărioarelor"}},{"word":"gospodărire","pos":"noun","definitions":["management"],"forms":{"plural":"gospodăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gospodărire","accusative-definite-nominative-singular":"gospodărirea","accusative-indefinite-nominative-plural":"gospodăriri","accusative-definite-nominative-plural":"gospodăririle","dative-genitive-indefinite-singular":"gospodăriri","dative-definite-genitive-singular":"gospodăririi","dative-genitive-indefinite-plural":"gospodăriri","dative-definite-genitive-plural":"gospodăririlor","singular-vocative":"gospodărire","plural-vocative":"gospodăririlor"}},{"word":"gospodărit","pos":"adj","definitions":["administered"],"forms":{"feminine-singular":"gospodărită","masculine-plural":"gospodăriți","feminine-neuter-plural":"gospodărite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gospodărit","error-unrecognized-form-feminine-indefinite-singular":"gospodărită","error-unrecognized-form-indefinite-masculine-plural":"gospodăriți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gospodărite","definite-error-unrecognized-form-masculine-neuter-singular":"gospodăritul","definite-error-unrecognized-form-feminine-singular":"gospodărita","definite-error-unrecognized-form-masculine-plural":"gospodăriții","definite-error-unrecognized-form-feminine-neuter-plural":"gospodăritele"}},{"word":"gospodărit","pos":"verb","definitions":["past participle of gospodări"],"forms":{"participle-past":"of gospodări"}},{"word":"gospodăriță","pos":"noun","definitions":["female equivalent of gospodar"],"forms":{"plural":"gospodărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gospodăriță","accusative-definite-nominative-singular":"gospodărița","accusative-indefinite-nominative-plural":"gospodărițe","accusative-definite-nominative-plural":"gospodărițele","dative-genitive-indefinite-singular":"gospodărițe","dative-definite-genitive-singular":"gospodăriței","dative-genitive-indefinite-plural":"gospodărițe","dative-definite-genitive-plural":"gospodărițelor","singular-vocative":"gospodăriță","plural-vocative":"gospodărițelor"}},{"word":"Gospodariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Gospodariu"}},{"word":"Gospodaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Gospodaru"}},{"word":"gospodin","pos":"noun","definitions":["God","master"],"forms":{"plural":"gospodini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gospodin","accusative-definite-nominative-singular":"gospodinul","accusative-indefinite-nominative-plural":"gospodini","accusative-definite-nominative-plural":"gospodinii","dative-genitive-indefinite-singular":"gospodin","dative-definite-genitive-singular":"gospodinului","dative-genitive-indefinite-plural":"gospodini","dative-definite-genitive-plural":"gospodinilor","singular-vocative":"gospodinule","plural-vocative":"gospodinilor"}},{"word":"gospodina","pos":"noun","definitions":["definite nominative/accusative singular of gospodină"]},{"word":"gospodină","pos":"noun","definitions":["housewife"],"pronunciation":"/ɡo.spoˈdi.nə/","forms":{"plural":"gospodine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gospodină","accusative-definite-nominative-singular":"gospodina","accusative-indefinite-nominative-plural":"gospodine","accusative-definite-nominative-plural":"gospodinele","dative-genitive-indefinite-singular":"gospodine","dative-definite-genitive-singular":"gospodinei","dative-genitive-indefinite-plural":"gospodine","dative-definite-genitive-plural":"gospodinelor","singular-vocative":"gospodină","plural-vocative":"gospodinelor"}},{"word":"gospodine","pos":"noun","definitions":["inflection of gospodină:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"gospodinei","pos":"noun","definitions":["definite genitive/dative singular of gospodină"]},{"word":"gospodinele","pos":"noun","definitions":["definite nominative/accusative plural of gospodină"]},{"word":"gospodinelor","pos":"noun","definitions":["definite genitive/dative plural of gospodină"]},{"word":"gospojdă","pos":"noun","definitions":["lady"],"forms":{"plural":"gospojde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gospojdă","accusative-definite-nominative-singular":"gospojda","accusative-indefinite-nominative-plural":"gospojde","accusative-definite-nominative-plural":"gospojdele","dative-genitive-indefinite-singular":"gospojde","dative-definite-genitive-singular":"gospojdei","dative-genitive-indefinite-plural":"gospojde","dative-definite-genitive-plural":"gospojdelor","singular-vocative":"gospojdă","plural-vocative":"gospojdelor"}},{"word":"Gostavățu","pos":"name","definitions":["a commune of Olt County, Romania","a village in Gostavățu, Olt County, Romania"],"gender":"m"},{"word":"Gostila","pos":"name","definitions":["a village in Poiana Blenchii, Sălaj County, Romania"],"gender":"f"},{"word":"Gostilele","pos":"name","definitions":["a village in Fundulea, Călărași County, Romania"],"gender":"m"},{"word":"goștină","pos":"noun","definitions":["a tax on sheep, pigs and cows"],"forms":{"plural":"goștini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"goștină","accusative-definite-nominative-singular":"goștina","accusative-indefinite-nominative-plural":"goștini","accusative-definite-nominative-plural":"goștinile","dative-genitive-indefinite-singular":"goștini","dative-definite-genitive-singular":"goștinii","dative-genitive-indefinite-plural":"goștini","dative-definite-genitive-plural":"goștinilor","singular-vocative":"goștină","plural-vocative":"goștinilor"}},{"word":"Gostinari","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Gostinari, Giurgiu County, Romania"],"gender":"m"},{"word":"Gostinu","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Gostinu, Giurgiu County, Romania"],"gender":"m"},{"word":"got","pos":"noun","definitions":["Goth"],"forms":{"plural":"goți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"got","accusative-definite-nominative-singular":"gotul","accusative-indefinite-nominative-plural":"goți","accusative-definite-nominative-plural":"goții","dative-genitive-indefinite-singular":"got","dative-definite-genitive-singular":"gotului","dative-genitive-indefinite-plural":"goți","dative-definite-genitive-plural":"goților","singular-vocative":"gotule","plural-vocative":"goților"}},{"word":"gotcă","pos":"noun","definitions":["female western capercaillie (Tetrao urogallus)"],"forms":{"plural":"gotci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gotcă","accusative-definite-nominative-singular":"gotca","accusative-indefinite-nominative-plural":"gotci","accusative-definite-nominative-plural":"gotcile","dative-genitive-indefinite-singular":"gotci","dative-definite-genitive-singular":"gotcii","dative-genitive-indefinite-plural":"gotci","dative-definite-genitive-plural":"gotcilor","singular-vocative":"gotcă","plural-vocative":"gotcilor"}},{"word":"gotcan","pos":"noun","definitions":["western capercaillie (Tetrao urogallus)"],"forms":{"plural":"gotcani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gotcan","accusative-definite-nominative-singular":"gotcanul","accusative-indefinite-nominative-plural":"gotcani","accusative-definite-nominative-plural":"gotcanii","dative-genitive-indefinite-singular":"gotcan","dative-definite-genitive-singular":"gotcanului","dative-genitive-indefinite-plural":"gotcani","dative-definite-genitive-plural":"gotcanilor","singular-vocative":"gotcanule","plural-vocative":"gotcanilor"}},{"word":"Gotcoaia","pos":"name","definitions":["a river in Iași, Romania, tributary to the Glăvănești"],"gender":"f"},{"word":"Gotești","pos":"name","definitions":["a village in Răchitova, Hunedoara County, Romania"],"gender":"m"},{"word":"Gothatea","pos":"name","definitions":["a village in Gurasada, Hunedoara County, Romania"],"gender":"f"},{"word":"gotic","pos":"adj","definitions":["Gothic"],"forms":{"feminine-singular":"gotică","masculine-plural":"gotici","feminine-neuter-plural":"gotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gotic","error-unrecognized-form-feminine-indefinite-singular":"gotică","error-unrecognized-form-indefinite-masculine-plural":"gotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gotice","definite-error-unrecognized-form-masculine-neuter-singular":"goticul","definite-error-unrecognized-form-feminine-singular":"gotica","definite-error-unrecognized-form-masculine-plural":"goticii","definite-error-unrecognized-form-feminine-neuter-plural":"goticele"}},{"word":"gotică","pos":"noun","definitions":["female equivalent of gotic"],"forms":{"plural":"gotice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gotică","accusative-definite-nominative-singular":"gotica","accusative-indefinite-nominative-plural":"gotice","accusative-definite-nominative-plural":"goticele","dative-genitive-indefinite-singular":"gotice","dative-definite-genitive-singular":"goticei","dative-genitive-indefinite-plural":"gotice","dative-definite-genitive-plural":"goticelor","singular-vocative":"gotică","plural-vocative":"goticelor"}},{"word":"gotovi","pos":"verb","definitions":["to prepare"],"forms":{"canonical":"a gotovi 4th conjugation","present-singular-third-person":"gotovește","participle-past":"gotovit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gotovi","gerund":"gotovind","first-person-indicative-present-singular":"gotovesc","indicative-present-second-person-singular":"gotovești","indicative-present-singular-third-person":"gotovește","first-person-indicative-plural-present":"gotovim","indicative-plural-present-second-person":"gotoviți","indicative-plural-present-third-person":"gotovesc","first-person-imperfect-indicative-singular":"gotoveam","imperfect-indicative-second-person-singular":"gotoveai","imperfect-indicative-singular-third-person":"gotovea","first-person-imperfect-indicative-plural":"gotoveam","imperfect-indicative-plural-second-person":"gotoveați","imperfect-indicative-plural-third-person":"gotoveau","first-person-indicative-perfect-singular":"gotovii","indicative-perfect-second-person-singular":"gotoviși","indicative-perfect-singular-third-person":"gotovi","first-person-indicative-perfect-plural":"gotovirăm","indicative-perfect-plural-second-person":"gotovirăți","indicative-perfect-plural-third-person":"gotoviră","first-person-indicative-pluperfect-singular":"gotovisem","indicative-pluperfect-second-person-singular":"gotoviseși","indicative-pluperfect-singular-third-person":"gotovise","first-person-indicative-pluperfect-plural":"gotoviserăm","indicative-pluperfect-plural-second-person":"gotoviserăți","indicative-pluperfect-plural-third-person":"gotoviseră","first-person-present-singular-subjunctive":"să gotovesc","present-second-person-singular-subjunctive":"să gotovești","present-singular-subjunctive-third-person":"să gotovească","first-person-plural-present-subjunctive":"să gotovim","plural-present-second-person-subjunctive":"să gotoviți","plural-present-subjunctive-third-person":"să gotovească","imperative-second-person-singular":"gotovește","imperative-plural-second-person":"gotoviți","imperative-negative-second-person-singular":"nu gotovi","imperative-negative-plural-second-person":"nu gotoviți"}},{"word":"gotovire","pos":"noun","definitions":["preparing"],"forms":{"plural":"gotoviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gotovire","accusative-definite-nominative-singular":"gotovirea","accusative-indefinite-nominative-plural":"gotoviri","accusative-definite-nominative-plural":"gotovirile","dative-genitive-indefinite-singular":"gotoviri","dative-definite-genitive-singular":"gotovirii","dative-genitive-indefinite-plural":"gotoviri","dative-definite-genitive-plural":"gotovirilor","singular-vocative":"gotovire","plural-vocative":"gotovirilor"}},{"word":"Gottlob","pos":"name","definitions":["a commune of Timiș County, Romania","a village in Gottlob, Timiș County, Romania"],"gender":"m"},{"word":"Govăjdia","pos":"name","definitions":["a village in Ghelari, Hunedoara County, Romania"],"gender":"f"},{"word":"govioară","pos":"noun","definitions":["diminutive of govie"],"forms":{"plural":"govioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"govioară","accusative-definite-nominative-singular":"govioara","accusative-indefinite-nominative-plural":"govioare","accusative-definite-nominative-plural":"govioarele","dative-genitive-indefinite-singular":"govioare","dative-definite-genitive-singular":"govioarei","dative-genitive-indefinite-plural":"govioare","dative-definite-genitive-plural":"govioarelor","singular-vocative":"govioară","plural-vocative":"govioarelor"}},{"word":"Govodarva","pos":"name","definitions":["a village in Căzănești, Mehedinți County, Romania"],"gender":"f"},{"word":"Govojdean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Govojdean"}},{"word":"Govora","pos":"name","definitions":["a village in Bobicești, Olt County, Romania","a village in Mihăești, Vâlcea County, Romania"],"gender":"f"},{"word":"Govoșdia","pos":"name","definitions":["a village in Arad County, Romania. Renamed to Mocioni in 1925, later to Nicolae Bălcescu in 1950."],"gender":"m"},{"word":"goz","pos":"noun","definitions":["dung, manure"],"pronunciation":"[ɡoz]","forms":{"plural":"gozuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"goz","accusative-definite-nominative-singular":"gozul","accusative-indefinite-nominative-plural":"gozuri","accusative-definite-nominative-plural":"gozurile","dative-genitive-indefinite-singular":"goz","dative-definite-genitive-singular":"gozului","dative-genitive-indefinite-plural":"gozuri","dative-definite-genitive-plural":"gozurilor","singular-vocative":"gozule","plural-vocative":"gozurilor"}},{"word":"gozar","pos":"noun","definitions":["garbage collector"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gozar","accusative-definite-nominative":"gozarul","dative-genitive-indefinite":"gozar","dative-definite-genitive":"gozarului","vocative":"gozarule"}},{"word":"Goznița","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Gozna"],"gender":"f"},{"word":"gozomete","pos":"noun","definitions":["garbage, trash, rubbish, litter"],"forms":{"plural":"gozomeți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gozomete","accusative-definite-nominative-singular":"gozometeul","accusative-indefinite-nominative-plural":"gozomeți","accusative-definite-nominative-plural":"gozomeții","dative-genitive-indefinite-singular":"gozomete","dative-definite-genitive-singular":"gozometeului","dative-genitive-indefinite-plural":"gozomeți","dative-definite-genitive-plural":"gozomeților","singular-vocative":"gozometeule","plural-vocative":"gozomeților"}},{"word":"gozură","pos":"noun","definitions":["alternative form of goz"],"forms":{"plural":"gozuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gozură","accusative-definite-nominative-singular":"gozura","accusative-indefinite-nominative-plural":"gozuri","accusative-definite-nominative-plural":"gozurile","dative-genitive-indefinite-singular":"gozuri","dative-definite-genitive-singular":"gozurii","dative-genitive-indefinite-plural":"gozuri","dative-definite-genitive-plural":"gozurilor","singular-vocative":"gozură","plural-vocative":"gozurilor"}},{"word":"GR","pos":"name","definitions":["abbreviation of Giurgiu: a county of Romania"]},{"word":"graba","pos":"noun","definitions":["definite nominative/accusative singular of grabă"],"pronunciation":"[ˈɡraba]","gender":"f"},{"word":"grabă","pos":"noun","definitions":["haste"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"grabă","accusative-definite-nominative":"graba","dative-genitive-indefinite":"grabe","dative-definite-genitive":"grabei","vocative":"grabă"}},{"word":"graba strică treaba","pos":"proverb","definitions":["haste makes waste"]},{"word":"grăbar","pos":"noun","definitions":["Oriental hornbeam (Carpinus orientalis)"],"forms":{"plural":"grăbari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăbar","accusative-definite-nominative-singular":"grăbarul","accusative-indefinite-nominative-plural":"grăbari","accusative-definite-nominative-plural":"grăbarii","dative-genitive-indefinite-singular":"grăbar","dative-definite-genitive-singular":"grăbarului","dative-genitive-indefinite-plural":"grăbari","dative-definite-genitive-plural":"grăbarilor","singular-vocative":"grăbarule","plural-vocative":"grăbarilor"}},{"word":"Grabaț","pos":"name","definitions":["a village in Lenauheim, Timiș County, Romania"],"gender":"m"},{"word":"grabe","pos":"noun","definitions":["inflection of grabă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡrabe]","gender":"f"},{"word":"grăbea","pos":"verb","definitions":["third-person singular imperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbe̯a]"},{"word":"grăbeai","pos":"verb","definitions":["second-person singular imperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbe̯aj]"},{"word":"grăbeam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbe̯am]"},{"word":"grăbească","pos":"verb","definitions":["third-person singular/plural present subjunctive of grăbi"],"pronunciation":"[ɡrəˈbe̯askə]"},{"word":"grăbeați","pos":"verb","definitions":["second-person plural imperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbe̯atsʲ]"},{"word":"grăbeau","pos":"verb","definitions":["third-person plural imperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbe̯aw]"},{"word":"graben","pos":"noun","definitions":["graben"],"forms":{"plural":"grabene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"graben","accusative-definite-nominative-singular":"grabenul","accusative-indefinite-nominative-plural":"grabene","accusative-definite-nominative-plural":"grabenele","dative-genitive-indefinite-singular":"graben","dative-definite-genitive-singular":"grabenului","dative-genitive-indefinite-plural":"grabene","dative-definite-genitive-plural":"grabenelor","singular-vocative":"grabenule","plural-vocative":"grabenelor"}},{"word":"grăbesc","pos":"verb","definitions":["inflection of grăbi:","first-person singular present indicative/subjunctive","third-person plural present indicative"],"pronunciation":"[ɡrəˈbesk]"},{"word":"grăbește","pos":"verb","definitions":["inflection of grăbi:","third-person singular present indicative","second-person singular imperative"],"pronunciation":"[ɡrəˈbeʃte]"},{"word":"grăbești","pos":"verb","definitions":["second-person singular present indicative/subjunctive of grăbi"],"pronunciation":"[ɡrəˈbeʃtʲ]"},{"word":"grăbi","pos":"verb","definitions":["to hurry, be in a rush, make haste","to hasten, bring someone to a hurry"],"pronunciation":"/ɡrəˈbi/","examples":[{"ro":"a grăbi pasul","en":"to hasten one’s steps"}],"forms":{"canonical":"a grăbi 4th conjugation","present-singular-third-person":"grăbește","participle-past":"grăbit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a grăbi","gerund":"grăbind","first-person-indicative-present-singular":"grăbesc","indicative-present-second-person-singular":"grăbești","indicative-present-singular-third-person":"grăbește","first-person-indicative-plural-present":"grăbim","indicative-plural-present-second-person":"grăbiți","indicative-plural-present-third-person":"grăbesc","first-person-imperfect-indicative-singular":"grăbeam","imperfect-indicative-second-person-singular":"grăbeai","imperfect-indicative-singular-third-person":"grăbea","first-person-imperfect-indicative-plural":"grăbeam","imperfect-indicative-plural-second-person":"grăbeați","imperfect-indicative-plural-third-person":"grăbeau","first-person-indicative-perfect-singular":"grăbii","indicative-perfect-second-person-singular":"grăbiși","indicative-perfect-singular-third-person":"grăbi","first-person-indicative-perfect-plural":"grăbirăm","indicative-perfect-plural-second-person":"grăbirăți","indicative-perfect-plural-third-person":"grăbiră","first-person-indicative-pluperfect-singular":"grăbisem","indicative-pluperfect-second-person-singular":"grăbiseși","indicative-pluperfect-singular-third-person":"grăbise","first-person-indicative-pluperfect-plural":"grăbiserăm","indicative-pluperfect-plural-second-person":"grăbiserăți","indicative-pluperfect-plural-third-person":"grăbiseră","first-person-present-singular-subjunctive":"să grăbesc","present-second-person-singular-subjunctive":"să grăbești","present-singular-subjunctive-third-person":"să grăbească","first-person-plural-present-subjunctive":"să grăbim","plural-present-second-person-subjunctive":"să grăbiți","plural-present-subjunctive-third-person":"să grăbească","imperative-second-person-singular":"grăbește","imperative-plural-second-person":"grăbiți","imperative-negative-second-person-singular":"nu grăbi","imperative-negative-plural-second-person":"nu grăbiți"}},{"word":"Grabicina de Jos","pos":"name","definitions":["a village in Scorțoasa, Buzău County, Romania"],"gender":"f"},{"word":"Grabicina de Sus","pos":"name","definitions":["a village in Scorțoasa, Buzău County, Romania"],"gender":"f"},{"word":"grăbii","pos":"verb","definitions":["first-person singular simple perfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiː]","forms":{"canonical":"grăbíi"}},{"word":"grăbim","pos":"verb","definitions":["first-person plural present indicative/subjunctive of grăbi"],"pronunciation":"[ɡrəˈbim]","forms":{"canonical":"grăbím"}},{"word":"grăbind","pos":"verb","definitions":["gerund of grăbi"],"pronunciation":"[ɡrəˈbind]","forms":{"canonical":"grăbínd"}},{"word":"grabior","pos":"adv","definitions":["diminutive of grabă"]},{"word":"grăbiră","pos":"verb","definitions":["third-person plural simple perfect indicative of grăbi"],"pronunciation":"[ɡrəˈbirə]","forms":{"canonical":"grăbíră"}},{"word":"grăbirăm","pos":"verb","definitions":["first-person plural simple perfect indicative of grăbi"],"pronunciation":"[ɡrəˈbirəm]","forms":{"canonical":"grăbírăm"}},{"word":"grăbirăți","pos":"verb","definitions":["second-person plural simple perfect indicative of grăbi"],"pronunciation":"[ɡrəˈbirətsʲ]","forms":{"canonical":"grăbírăți"}},{"word":"grăbire","pos":"noun","definitions":["quickening"],"forms":{"plural":"grăbiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grăbire","accusative-definite-nominative-singular":"grăbirea","accusative-indefinite-nominative-plural":"grăbiri","accusative-definite-nominative-plural":"grăbirile","dative-genitive-indefinite-singular":"grăbiri","dative-definite-genitive-singular":"grăbirii","dative-genitive-indefinite-plural":"grăbiri","dative-definite-genitive-plural":"grăbirilor","singular-vocative":"grăbire","plural-vocative":"grăbirilor"}},{"word":"grăbise","pos":"verb","definitions":["third-person singular pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbise]","forms":{"canonical":"grăbíse"}},{"word":"grăbisem","pos":"verb","definitions":["first-person singular pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbisem]","forms":{"canonical":"grăbísem"}},{"word":"grăbiseră","pos":"verb","definitions":["third-person plural pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiserə]","forms":{"canonical":"grăbíseră"}},{"word":"grăbiserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiserəm]","forms":{"canonical":"grăbíserăm"}},{"word":"grăbiserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiserətsʲ]","forms":{"canonical":"grăbíserăți"}},{"word":"grăbiseși","pos":"verb","definitions":["second-person singular pluperfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiseʃʲ]","forms":{"canonical":"grăbíseși"}},{"word":"grăbiși","pos":"verb","definitions":["second-person singular simple perfect indicative of grăbi"],"pronunciation":"[ɡrəˈbiʃʲ]","forms":{"canonical":"grăbíși"}},{"word":"grăbit","pos":"verb","definitions":["past participle of grăbi"],"pronunciation":"[ɡrəˈbit]"},{"word":"grăbit","pos":"adj","definitions":["hurried, hasty"],"pronunciation":"[ɡrəˈbit]","forms":{"feminine-singular":"grăbită","masculine-plural":"grăbiți","feminine-neuter-plural":"grăbite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăbit","error-unrecognized-form-feminine-indefinite-singular":"grăbită","error-unrecognized-form-indefinite-masculine-plural":"grăbiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăbite","definite-error-unrecognized-form-masculine-neuter-singular":"grăbitul","definite-error-unrecognized-form-feminine-singular":"grăbita","definite-error-unrecognized-form-masculine-plural":"grăbiții","definite-error-unrecognized-form-feminine-neuter-plural":"grăbitele"}},{"word":"grăbita","pos":"adj","definitions":["definite nominative/accusative feminine singular of grăbit"],"pronunciation":"[ɡrəˈbita]","forms":{"canonical":"grăbíta"}},{"word":"grăbită","pos":"adj","definitions":["feminine singular of grăbit"],"pronunciation":"[ɡrəˈbitə]","forms":{"canonical":"grăbítă"}},{"word":"grăbite","pos":"adj","definitions":["feminine/neuter plural of grăbit"],"pronunciation":"[ɡrəˈbite]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"grăbíte"}},{"word":"grăbitei","pos":"adj","definitions":["definite genitive/dative feminine singular of grăbit"],"pronunciation":"[ɡrəˈbitej]","forms":{"canonical":"grăbítei"}},{"word":"grăbitele","pos":"adj","definitions":["definite nominative/accusative feminine/neuter plural of grăbit"],"pronunciation":"[ɡrəˈbitele]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"grăbítele"}},{"word":"grăbitelor","pos":"adj","definitions":["definite genitive/dative feminine/neuter plural of grăbit"],"pronunciation":"[ɡrəˈbitelor]","gender":"f-p","forms":{"canonical-feminine-neuter-plural":"grăbítelor"}},{"word":"grăbiți","pos":"adj","definitions":["masculine plural of grăbit"],"pronunciation":"[ɡrəˈbit͡sʲ]","forms":{"canonical":"grăbíți"}},{"word":"grăbiți","pos":"verb","definitions":["inflection of grăbi:","second-person plural present indicative/subjunctive","second-person plural imperative"],"pronunciation":"[ɡrəˈbit͡sʲ]","forms":{"canonical":"grăbíți"}},{"word":"grăbiții","pos":"adj","definitions":["definite nominative/accusative masculine plural of grăbit"],"pronunciation":"[ɡrəˈbit͡siː]","gender":"m-p","forms":{"canonical-masculine-plural":"grăbíții"}},{"word":"grăbiților","pos":"adj","definitions":["definite genitive/dative masculine plural of grăbit"],"pronunciation":"[ɡrəˈbit͡silor]","gender":"m-p","forms":{"canonical-masculine-plural":"grăbíților"}},{"word":"grăbitul","pos":"adj","definitions":["definite nominative/accusative masculine/neuter singular of grăbit"],"pronunciation":"[ɡrəˈbitul]","gender":"m","forms":{"canonical-masculine-neuter":"grăbítul"}},{"word":"grăbitului","pos":"adj","definitions":["definite genitive/dative masculine/neuter singular of grăbit"],"pronunciation":"[ɡrəˈbituluj]","gender":"m","forms":{"canonical-masculine-neuter":"grăbítului"}},{"word":"grabnic","pos":"adj","definitions":["urgent"],"forms":{"feminine-singular":"grabnică","masculine-plural":"grabnici","feminine-neuter-plural":"grabnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grabnic","error-unrecognized-form-feminine-indefinite-singular":"grabnică","error-unrecognized-form-indefinite-masculine-plural":"grabnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grabnice","definite-error-unrecognized-form-masculine-neuter-singular":"grabnicul","definite-error-unrecognized-form-feminine-singular":"grabnica","definite-error-unrecognized-form-masculine-plural":"grabnicii","definite-error-unrecognized-form-feminine-neuter-plural":"grabnicele"}},{"word":"grăbnicie","pos":"noun","definitions":["haste"],"forms":{"plural":"grăbnicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grăbnicie","accusative-definite-nominative-singular":"grăbnicia","accusative-indefinite-nominative-plural":"grăbnicii","accusative-definite-nominative-plural":"grăbniciile","dative-genitive-indefinite-singular":"grăbnicii","dative-definite-genitive-singular":"grăbniciei","dative-genitive-indefinite-plural":"grăbnicii","dative-definite-genitive-plural":"grăbniciilor","singular-vocative":"grăbnicie","plural-vocative":"grăbniciilor"}},{"word":"grabo","pos":"noun","definitions":["vocative singular of grabă"],"pronunciation":"[ˈɡrabo]","gender":"f"},{"word":"gracilitate","pos":"noun","definitions":["gracileness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"gracilitate","accusative-definite-nominative":"gracilitatea","dative-genitive-indefinite":"gracilități","dative-definite-genitive":"gracilității","vocative":"-"}},{"word":"grad","pos":"noun","definitions":["degree (unit of measurement for temperature)"],"forms":{"plural":"grade"}},{"word":"grad Celsius","pos":"noun","definitions":["degree Celsius"],"forms":{"plural":"grade Celsius"}},{"word":"grad comparativ","pos":"noun","definitions":["comparative degree"]},{"word":"grad de comparație","pos":"noun","definitions":["degree of comparison"],"forms":{"plural":"grade de comparație"}},{"word":"grad de libertate","pos":"noun","definitions":["degree of freedom"],"forms":{"plural":"grade de libertate"}},{"word":"grada","pos":"verb","definitions":["to grade"],"forms":{"canonical":"a grada 1st conjugation","present-singular-third-person":"gradează","participle-past":"gradat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grada","gerund":"gradând","first-person-indicative-present-singular":"gradez","indicative-present-second-person-singular":"gradezi","indicative-present-singular-third-person":"gradează","first-person-indicative-plural-present":"gradăm","indicative-plural-present-second-person":"gradați","indicative-plural-present-third-person":"gradează","first-person-imperfect-indicative-singular":"gradam","imperfect-indicative-second-person-singular":"gradai","imperfect-indicative-singular-third-person":"grada","first-person-imperfect-indicative-plural":"gradam","imperfect-indicative-plural-second-person":"gradați","imperfect-indicative-plural-third-person":"gradau","first-person-indicative-perfect-singular":"gradai","indicative-perfect-second-person-singular":"gradași","indicative-perfect-singular-third-person":"gradă","first-person-indicative-perfect-plural":"gradarăm","indicative-perfect-plural-second-person":"gradarăți","indicative-perfect-plural-third-person":"gradară","first-person-indicative-pluperfect-singular":"gradasem","indicative-pluperfect-second-person-singular":"gradaseși","indicative-pluperfect-singular-third-person":"gradase","first-person-indicative-pluperfect-plural":"gradaserăm","indicative-pluperfect-plural-second-person":"gradaserăți","indicative-pluperfect-plural-third-person":"gradaseră","first-person-present-singular-subjunctive":"să gradez","present-second-person-singular-subjunctive":"să gradezi","present-singular-subjunctive-third-person":"să gradeze","first-person-plural-present-subjunctive":"să gradăm","plural-present-second-person-subjunctive":"să gradați","plural-present-subjunctive-third-person":"să gradeze","imperative-second-person-singular":"gradează","imperative-plural-second-person":"gradați","imperative-negative-second-person-singular":"nu grada","imperative-negative-plural-second-person":"nu gradați"}},{"word":"gradare","pos":"noun","definitions":["gradation"],"forms":{"plural":"gradări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gradare","accusative-definite-nominative-singular":"gradarea","accusative-indefinite-nominative-plural":"gradări","accusative-definite-nominative-plural":"gradările","dative-genitive-indefinite-singular":"gradări","dative-definite-genitive-singular":"gradării","dative-genitive-indefinite-plural":"gradări","dative-definite-genitive-plural":"gradărilor","singular-vocative":"gradare","plural-vocative":"gradărilor"}},{"word":"gradat","pos":"noun","definitions":["soldier with a rank lower than an officer"],"forms":{"plural":"gradați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gradat","accusative-definite-nominative-singular":"gradatul","accusative-indefinite-nominative-plural":"gradați","accusative-definite-nominative-plural":"gradații","dative-genitive-indefinite-singular":"gradat","dative-definite-genitive-singular":"gradatului","dative-genitive-indefinite-plural":"gradați","dative-definite-genitive-plural":"gradaților","singular-vocative":"gradatule","plural-vocative":"gradaților"}},{"word":"gradație","pos":"noun","definitions":["gradation"],"forms":{"plural":"gradații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gradație","accusative-definite-nominative-singular":"gradația","accusative-indefinite-nominative-plural":"gradații","accusative-definite-nominative-plural":"gradațiile","dative-genitive-indefinite-singular":"gradații","dative-definite-genitive-singular":"gradației","dative-genitive-indefinite-plural":"gradații","dative-definite-genitive-plural":"gradațiilor","singular-vocative":"gradație","plural-vocative":"gradațiilor"}},{"word":"gradațiune","pos":"noun","definitions":["obsolete form of gradație"],"forms":{"plural":"gradațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gradațiune","accusative-definite-nominative-singular":"gradațiunea","accusative-indefinite-nominative-plural":"gradațiuni","accusative-definite-nominative-plural":"gradațiunile","dative-genitive-indefinite-singular":"gradațiuni","dative-definite-genitive-singular":"gradațiunii","dative-genitive-indefinite-plural":"gradațiuni","dative-definite-genitive-plural":"gradațiunilor","singular-vocative":"gradațiune","plural-vocative":"gradațiunilor"}},{"word":"grade","pos":"noun","definitions":["indefinite plural of grad"],"pronunciation":"[ˈɡrade]","gender":"n"},{"word":"grade de comparație","pos":"noun","definitions":["degrees of comparison"],"pronunciation":"/ˌɡrade de kompaˈrat͡si.e/"},{"word":"Grădeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grădeanu"}},{"word":"grădelă","pos":"noun","definitions":["alternative form of grădea"],"forms":{"plural":"grădele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grădelă","accusative-definite-nominative-singular":"grădela","accusative-indefinite-nominative-plural":"grădele","accusative-definite-nominative-plural":"grădelele","dative-genitive-indefinite-singular":"grădele","dative-definite-genitive-singular":"grădelei","dative-genitive-indefinite-plural":"grădele","dative-definite-genitive-plural":"grădelelor","singular-vocative":"grădelă","plural-vocative":"grădelelor"}},{"word":"Grădescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grădescu"}},{"word":"Grădești","pos":"name","definitions":["a village in Dealu Morii, Bacău County, Romania"],"gender":"m"},{"word":"grădi","pos":"noun","definitions":["kindergarten"]},{"word":"gradient","pos":"noun","definitions":["gradient"],"forms":{"plural":"gradienți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gradient","accusative-definite-nominative-singular":"gradientul","accusative-indefinite-nominative-plural":"gradienți","accusative-definite-nominative-plural":"gradienții","dative-genitive-indefinite-singular":"gradient","dative-definite-genitive-singular":"gradientului","dative-genitive-indefinite-plural":"gradienți","dative-definite-genitive-plural":"gradienților","singular-vocative":"gradientule","plural-vocative":"gradienților"}},{"word":"Grădina","pos":"name","definitions":["a commune of Constanța County, Romania","a village in Grădina, Constanța County, Romania"],"gender":"f"},{"word":"grădina","pos":"noun","definitions":["definite nominative/accusative singular of grădină"]},{"word":"Grădină","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grădină"}},{"word":"grădină","pos":"noun","definitions":["garden"],"pronunciation":"[ɡɾəˈdi.nə]","forms":{"plural":"grădini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grădină","accusative-definite-nominative-singular":"grădina","accusative-indefinite-nominative-plural":"grădini","accusative-definite-nominative-plural":"grădinile","dative-genitive-indefinite-singular":"grădini","dative-definite-genitive-singular":"grădinii","dative-genitive-indefinite-plural":"grădini","dative-definite-genitive-plural":"grădinilor","singular-vocative":"grădină","plural-vocative":"grădinilor"}},{"word":"grădină botanică","pos":"noun","definitions":["botanical garden (a place where a variety of plants are grown for scientific reasons)"],"forms":{"plural":"grădini botanice"}},{"word":"grădină de copii","pos":"noun","definitions":["kindergarten"],"forms":{"plural":"grădini de copii"}},{"word":"grădină de legume","pos":"noun","definitions":["vegetable garden"],"forms":{"plural":"grădini de legume"}},{"word":"Grădina Edenului","pos":"name","definitions":["Garden of Eden"],"gender":"f"},{"word":"grădină publică","pos":"noun","definitions":["park, public garden"],"forms":{"plural":"grădini publice"}},{"word":"grădină zoologică","pos":"noun","definitions":["zoo (park where live animals are exhibited)"],"forms":{"plural":"grădini zoologice"}},{"word":"Grădinar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grădinar"}},{"word":"grădinar","pos":"noun","definitions":["gardener"],"pronunciation":"/ɡrə.diˈnar/","forms":{"plural":"grădinari","feminine":"equivalent grădinăreasă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grădinar","accusative-definite-nominative-singular":"grădinarul","accusative-indefinite-nominative-plural":"grădinari","accusative-definite-nominative-plural":"grădinarii","dative-genitive-indefinite-singular":"grădinar","dative-definite-genitive-singular":"grădinarului","dative-genitive-indefinite-plural":"grădinari","dative-definite-genitive-plural":"grădinarilor","singular-vocative":"grădinarule","plural-vocative":"grădinarilor"}},{"word":"grădinăreasă","pos":"noun","definitions":["female equivalent of grădinar: (female) gardener"],"pronunciation":"/ɡrə.di.nəˈre̯a.sə/","forms":{"plural":"grădinărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"grădinăreasă","accusative-definite-nominative-singular":"grădinăreasa","accusative-indefinite-nominative-plural":"grădinărese","accusative-definite-nominative-plural":"grădinăresele","dative-genitive-indefinite-singular":"grădinărese","dative-definite-genitive-singular":"grădinăresei","dative-genitive-indefinite-plural":"grădinărese","dative-definite-genitive-plural":"grădinăreselor","singular-vocative":"-","plural-vocative":"-"}},{"word":"grădinăresc","pos":"adj","definitions":["gardener"],"forms":{"feminine-singular":"grădinărească","plural":"grădinărești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grădinăresc","error-unrecognized-form-feminine-indefinite-singular":"grădinărească","error-unrecognized-form-indefinite-masculine-plural":"grădinărești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grădinărești","definite-error-unrecognized-form-masculine-neuter-singular":"grădinărescul","definite-error-unrecognized-form-feminine-singular":"grădinăreasca","definite-error-unrecognized-form-masculine-plural":"grădinăreștii","definite-error-unrecognized-form-feminine-neuter-plural":"grădinăreștile"}},{"word":"grădinărese","pos":"noun","definitions":["plural of grădinăreasă"],"gender":"f"},{"word":"Grădinari","pos":"name","definitions":["a village in Drăgănești, Bihor County, Romania","a commune of Caraș-Severin County, Romania","a village in Grădinari, Caraș-Severin County, Romania","a commune of Giurgiu County, Romania","a village in Grădinari, Giurgiu County, Romania"],"gender":"m"},{"word":"grădinari","pos":"noun","definitions":["plural of grădinar"],"gender":"m"},{"word":"grădinări","pos":"verb","definitions":["to garden"],"pronunciation":"/ɡrə.di.nəˈri/","forms":{"canonical":"a grădinări 4th conjugation","present-singular-third-person":"grădinărește","participle-past":"grădinării","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a grădinări","gerund":"grădinărind","first-person-indicative-present-singular":"grădinăresc","indicative-present-second-person-singular":"grădinărești","indicative-present-singular-third-person":"grădinărește","first-person-indicative-plural-present":"grădinărim","indicative-plural-present-second-person":"grădinăriți","indicative-plural-present-third-person":"grădinăresc","first-person-imperfect-indicative-singular":"grădinăream","imperfect-indicative-second-person-singular":"grădinăreai","imperfect-indicative-singular-third-person":"grădinărea","first-person-imperfect-indicative-plural":"grădinăream","imperfect-indicative-plural-second-person":"grădinăreați","imperfect-indicative-plural-third-person":"grădinăreau","first-person-indicative-perfect-singular":"grădinării","indicative-perfect-second-person-singular":"grădinăriși","indicative-perfect-singular-third-person":"grădinări","first-person-indicative-perfect-plural":"grădinărirăm","indicative-perfect-plural-second-person":"grădinărirăți","indicative-perfect-plural-third-person":"grădinăriră","first-person-indicative-pluperfect-singular":"grădinărisem","indicative-pluperfect-second-person-singular":"grădinăriseși","indicative-pluperfect-singular-third-person":"grădinărise","first-person-indicative-pluperfect-plural":"grădinăriserăm","indicative-pluperfect-plural-second-person":"grădinăriserăți","indicative-pluperfect-plural-third-person":"grădinăriseră","first-person-present-singular-subjunctive":"să grădinăresc","present-second-person-singular-subjunctive":"să grădinărești","present-singular-subjunctive-third-person":"să grădinărească","first-person-plural-present-subjunctive":"să grădinărim","plural-present-second-person-subjunctive":"să grădinăriți","plural-present-subjunctive-third-person":"să grădinărească","imperative-second-person-singular":"grădinărește","imperative-plural-second-person":"grădinăriți","imperative-negative-second-person-singular":"nu grădinări","imperative-negative-plural-second-person":"nu grădinăriți"}},{"word":"grădinărie","pos":"noun","definitions":["gardening"],"forms":{"plural":"grădinării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grădinărie","accusative-definite-nominative-singular":"grădinăria","accusative-indefinite-nominative-plural":"grădinării","accusative-definite-nominative-plural":"grădinăriile","dative-genitive-indefinite-singular":"grădinării","dative-definite-genitive-singular":"grădinăriei","dative-genitive-indefinite-plural":"grădinării","dative-definite-genitive-plural":"grădinăriilor","singular-vocative":"grădinărie","plural-vocative":"grădinăriilor"}},{"word":"grădinărit","pos":"noun","definitions":["gardening"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"grădinărit","accusative-definite-nominative":"grădinăritul","dative-genitive-indefinite":"grădinărit","dative-definite-genitive":"grădinăritului","vocative":"grădinăritule"}},{"word":"grădinărit","pos":"verb","definitions":["past participle of grădinări"],"forms":{"participle-past":"of grădinări"}},{"word":"grădinăriță","pos":"noun","definitions":["female gardener"],"forms":{"plural":"grădinărițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grădinăriță","accusative-definite-nominative-singular":"grădinărița","accusative-indefinite-nominative-plural":"grădinărițe","accusative-definite-nominative-plural":"grădinărițele","dative-genitive-indefinite-singular":"grădinărițe","dative-definite-genitive-singular":"grădinăriței","dative-genitive-indefinite-plural":"grădinărițe","dative-definite-genitive-plural":"grădinărițelor","singular-vocative":"grădinăriță","plural-vocative":"grădinărițelor"}},{"word":"Grădinariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grădinariu"}},{"word":"Grădinaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grădinaru"}},{"word":"Grădinescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grădinescu"}},{"word":"Grădini","pos":"name","definitions":["a village in Valea Largă, Mureș County, Romania"],"gender":"f"},{"word":"grădini","pos":"noun","definitions":["plural of grădină"],"pronunciation":"/ɡrəˈdinʲ/"},{"word":"grădinică","pos":"noun","definitions":["diminutive of grădină"],"forms":{"plural":"grădinici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grădinică","accusative-definite-nominative-singular":"grădinica","accusative-indefinite-nominative-plural":"grădinici","accusative-definite-nominative-plural":"grădinicile","dative-genitive-indefinite-singular":"grădinici","dative-definite-genitive-singular":"grădinicii","dative-genitive-indefinite-plural":"grădinici","dative-definite-genitive-plural":"grădinicilor","singular-vocative":"grădinică","plural-vocative":"grădinicilor"}},{"word":"Grădinii","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Bistrița"],"gender":"m"},{"word":"Grădinile","pos":"name","definitions":["a commune of Olt County, Romania","a village in Grădinile, Olt County, Romania"],"gender":"f"},{"word":"grădinile","pos":"noun","definitions":["definite nominative/accusative plural of grădină"]},{"word":"grădinilor","pos":"noun","definitions":["definite genitive/dative plural of grădină"]},{"word":"Grădinița","pos":"name","definitions":["a village in Grădinița, Căușeni Raion, Moldova","a commune of Căușeni Raion, Moldova"],"gender":"f"},{"word":"grădinița","pos":"noun","definitions":["definite nominative/accusative singular of grădiniță"]},{"word":"grădiniță","pos":"noun","definitions":["kindergarten"],"pronunciation":"/ɡrədiˈnit͡sə/","forms":{"plural":"grădinițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grădiniță","accusative-definite-nominative-singular":"grădinița","accusative-indefinite-nominative-plural":"grădinițe","accusative-definite-nominative-plural":"grădinițele","dative-genitive-indefinite-singular":"grădinițe","dative-definite-genitive-singular":"grădiniței","dative-genitive-indefinite-plural":"grădinițe","dative-definite-genitive-plural":"grădinițelor","singular-vocative":"grădiniță","plural-vocative":"grădinițelor"}},{"word":"grădiniță de copii","pos":"noun","definitions":["kindergarten"],"forms":{"plural":"grădinițe de copii"}},{"word":"grădinuță","pos":"noun","definitions":["diminutive of grădină; small garden"],"forms":{"plural":"grădinuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grădinuță","accusative-definite-nominative-singular":"grădinuța","accusative-indefinite-nominative-plural":"grădinuțe","accusative-definite-nominative-plural":"grădinuțele","dative-genitive-indefinite-singular":"grădinuțe","dative-definite-genitive-singular":"grădinuței","dative-genitive-indefinite-plural":"grădinuțe","dative-definite-genitive-plural":"grădinuțelor","singular-vocative":"grădinuță","plural-vocative":"grădinuțelor"}},{"word":"grădioară","pos":"noun","definitions":["diminutive of grădină"],"forms":{"plural":"grădioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grădioară","accusative-definite-nominative-singular":"grădioara","accusative-indefinite-nominative-plural":"grădioare","accusative-definite-nominative-plural":"grădioarele","dative-genitive-indefinite-singular":"grădioare","dative-definite-genitive-singular":"grădioarei","dative-genitive-indefinite-plural":"grădioare","dative-definite-genitive-plural":"grădioarelor","singular-vocative":"grădioară","plural-vocative":"grădioarelor"}},{"word":"Gradiște","pos":"name","definitions":["a village in Gradiște, Cimișlia Raion, Moldova","a commune of Cimișlia Raion, Moldova"],"gender":"m"},{"word":"Grădiște","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Timiș"],"gender":"m"},{"word":"grădiște","pos":"noun","definitions":["hillock created by the changing meanders of a river","ruins of a fort"],"forms":{"plural":"grădiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grădiște","accusative-definite-nominative-singular":"grădiștea","accusative-indefinite-nominative-plural":"grădiști","accusative-definite-nominative-plural":"grădiștile","dative-genitive-indefinite-singular":"grădiști","dative-definite-genitive-singular":"grădiștii","dative-genitive-indefinite-plural":"grădiști","dative-definite-genitive-plural":"grădiștilor","singular-vocative":"grădiște","plural-vocative":"grădiștilor"}},{"word":"Gradiștea","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Gradiștea, Brăila County, Romania","a village in Boldești-Gradiștea, Prahova County, Romania"],"gender":"f"},{"word":"Grădiștea","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Grădiștea, Călărași County, Romania","a village in Grecești, Dolj County, Romania","a village in Comana, Giurgiu County, Romania","a commune of Ilfov County, Romania"],"gender":"f"},{"word":"Grădiștea de Munte","pos":"name","definitions":["a village in Orăștioara de Sus, Hunedoara County, Romania"],"gender":"f"},{"word":"Grădișteanca","pos":"name","definitions":["a village in Gălăteni, Teleorman County, Romania"],"gender":"f"},{"word":"Grădișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Grădișteanu"}},{"word":"gradua","pos":"verb","definitions":["to change gradually"],"forms":{"canonical":"a gradua 1st conjugation","present-singular-third-person":"graduează","participle-past":"graduat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gradua","gerund":"graduând","first-person-indicative-present-singular":"graduez","indicative-present-second-person-singular":"graduezi","indicative-present-singular-third-person":"graduează","first-person-indicative-plural-present":"graduăm","indicative-plural-present-second-person":"graduați","indicative-plural-present-third-person":"graduează","first-person-imperfect-indicative-singular":"graduam","imperfect-indicative-second-person-singular":"graduai","imperfect-indicative-singular-third-person":"gradua","first-person-imperfect-indicative-plural":"graduam","imperfect-indicative-plural-second-person":"graduați","imperfect-indicative-plural-third-person":"graduau","first-person-indicative-perfect-singular":"graduai","indicative-perfect-second-person-singular":"graduași","indicative-perfect-singular-third-person":"graduă","first-person-indicative-perfect-plural":"graduarăm","indicative-perfect-plural-second-person":"graduarăți","indicative-perfect-plural-third-person":"graduară","first-person-indicative-pluperfect-singular":"graduasem","indicative-pluperfect-second-person-singular":"graduaseși","indicative-pluperfect-singular-third-person":"graduase","first-person-indicative-pluperfect-plural":"graduaserăm","indicative-pluperfect-plural-second-person":"graduaserăți","indicative-pluperfect-plural-third-person":"graduaseră","first-person-present-singular-subjunctive":"să graduez","present-second-person-singular-subjunctive":"să graduezi","present-singular-subjunctive-third-person":"să gradueze","first-person-plural-present-subjunctive":"să graduăm","plural-present-second-person-subjunctive":"să graduați","plural-present-subjunctive-third-person":"să gradueze","imperative-second-person-singular":"graduează","imperative-plural-second-person":"graduați","imperative-negative-second-person-singular":"nu gradua","imperative-negative-plural-second-person":"nu graduați"}},{"word":"graduat","pos":"adj","definitions":["gradual"],"forms":{"feminine-singular":"graduată","masculine-plural":"graduați","feminine-neuter-plural":"graduate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"graduat","error-unrecognized-form-feminine-indefinite-singular":"graduată","error-unrecognized-form-indefinite-masculine-plural":"graduați","error-unrecognized-form-feminine-indefinite-neuter-plural":"graduate","definite-error-unrecognized-form-masculine-neuter-singular":"graduatul","definite-error-unrecognized-form-feminine-singular":"graduata","definite-error-unrecognized-form-masculine-plural":"graduații","definite-error-unrecognized-form-feminine-neuter-plural":"graduatele"}},{"word":"graduat","pos":"adv","definitions":["gradually"]},{"word":"graduat","pos":"verb","definitions":["past participle of gradua"],"forms":{"participle-past":"of gradua"}},{"word":"graf","pos":"noun","definitions":["graph"],"forms":{"plural":"grafuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"graf","accusative-definite-nominative-singular":"graful","accusative-indefinite-nominative-plural":"grafuri","accusative-definite-nominative-plural":"grafurile","dative-genitive-indefinite-singular":"graf","dative-definite-genitive-singular":"grafului","dative-genitive-indefinite-plural":"grafuri","dative-definite-genitive-plural":"grafurilor","singular-vocative":"grafule","plural-vocative":"grafurilor"}},{"word":"graf","pos":"noun","definitions":["count"],"forms":{"plural":"grafi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"graf","accusative-definite-nominative-singular":"graful","accusative-indefinite-nominative-plural":"grafi","accusative-definite-nominative-plural":"grafii","dative-genitive-indefinite-singular":"graf","dative-definite-genitive-singular":"grafului","dative-genitive-indefinite-plural":"grafi","dative-definite-genitive-plural":"grafilor","singular-vocative":"grafule","plural-vocative":"grafilor"}},{"word":"grafem","pos":"noun","definitions":["grapheme"],"pronunciation":"/ɡraˈfem/","forms":{"plural":"grafeme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafem","accusative-definite-nominative-singular":"grafemul","accusative-indefinite-nominative-plural":"grafeme","accusative-definite-nominative-plural":"grafemele","dative-genitive-indefinite-singular":"grafem","dative-definite-genitive-singular":"grafemului","dative-genitive-indefinite-plural":"grafeme","dative-definite-genitive-plural":"grafemelor","singular-vocative":"grafemule","plural-vocative":"grafemelor"}},{"word":"graffiti","pos":"noun","definitions":["graffiti (drawings on a public surface)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"graffiti","accusative-definite-nominative":"graffitiul","dative-genitive-indefinite":"graffiti","dative-definite-genitive":"graffitiului","vocative":"graffitiule"}},{"word":"graffitistă","pos":"noun","definitions":["female equivalent of graffitist"],"forms":{"plural":"graffitiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"graffitistă","accusative-definite-nominative-singular":"graffitista","accusative-indefinite-nominative-plural":"graffitiste","accusative-definite-nominative-plural":"graffitistele","dative-genitive-indefinite-singular":"graffitiste","dative-definite-genitive-singular":"graffitistei","dative-genitive-indefinite-plural":"graffitiste","dative-definite-genitive-plural":"graffitistelor","singular-vocative":"graffitistă","plural-vocative":"graffitistelor"}},{"word":"grafic","pos":"adj","definitions":["graphic"],"pronunciation":"/ˈɡra.fik/","forms":{"feminine-singular":"grafică","masculine-plural":"grafici","feminine-neuter-plural":"grafice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grafic","error-unrecognized-form-feminine-indefinite-singular":"grafică","error-unrecognized-form-indefinite-masculine-plural":"grafici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grafice","definite-error-unrecognized-form-masculine-neuter-singular":"graficul","definite-error-unrecognized-form-feminine-singular":"grafica","definite-error-unrecognized-form-masculine-plural":"graficii","definite-error-unrecognized-form-feminine-neuter-plural":"graficele"}},{"word":"grafic","pos":"noun","definitions":["graph"],"pronunciation":"/ˈɡra.fik/","forms":{"plural":"grafice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafic","accusative-definite-nominative-singular":"graficul","accusative-indefinite-nominative-plural":"grafice","accusative-definite-nominative-plural":"graficele","dative-genitive-indefinite-singular":"grafic","dative-definite-genitive-singular":"graficului","dative-genitive-indefinite-plural":"grafice","dative-definite-genitive-plural":"graficelor","singular-vocative":"graficule","plural-vocative":"graficelor"}},{"word":"grafică","pos":"noun","definitions":["graphics"],"forms":{"plural":"grafici","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafică","accusative-definite-nominative-singular":"graficăul","accusative-indefinite-nominative-plural":"grafici","accusative-definite-nominative-plural":"graficile","dative-genitive-indefinite-singular":"grafică","dative-definite-genitive-singular":"graficăului","dative-genitive-indefinite-plural":"grafici","dative-definite-genitive-plural":"graficilor","singular-vocative":"graficăule","plural-vocative":"graficilor"}},{"word":"grafician","pos":"noun","definitions":["illustrator"],"forms":{"plural":"graficieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grafician","accusative-definite-nominative-singular":"graficianul","accusative-indefinite-nominative-plural":"graficieni","accusative-definite-nominative-plural":"graficienii","dative-genitive-indefinite-singular":"grafician","dative-definite-genitive-singular":"graficianului","dative-genitive-indefinite-plural":"graficieni","dative-definite-genitive-plural":"graficienilor","singular-vocative":"graficianule","plural-vocative":"graficienilor"}},{"word":"graficiana","pos":"noun","definitions":["definite nominative/accusative singular of graficiană"]},{"word":"graficiană","pos":"noun","definitions":["female equivalent of grafician"],"forms":{"plural":"graficiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"graficiană","accusative-definite-nominative-singular":"graficiana","accusative-indefinite-nominative-plural":"graficiene","accusative-definite-nominative-plural":"graficienele","dative-genitive-indefinite-singular":"graficiene","dative-definite-genitive-singular":"graficienei","dative-genitive-indefinite-plural":"graficiene","dative-definite-genitive-plural":"graficienelor","singular-vocative":"graficiană","plural-vocative":"graficienelor"}},{"word":"graficiano","pos":"noun","definitions":["vocative singular of graficiană"]},{"word":"graficianul","pos":"noun","definitions":["definite nominative/accusative singular of grafician"]},{"word":"graficianule","pos":"noun","definitions":["vocative singular of grafician"]},{"word":"graficianului","pos":"noun","definitions":["definite genitive/dative singular of grafician"]},{"word":"graficiene","pos":"noun","definitions":["inflection of graficiană:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"graficienei","pos":"noun","definitions":["definite genitive/dative singular of graficiană"]},{"word":"graficienele","pos":"noun","definitions":["definite nominative/accusative plural of graficiană"]},{"word":"graficienelor","pos":"noun","definitions":["definite genitive/dative plural of graficiană","vocative plural of graficiană"]},{"word":"graficieni","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of grafician"]},{"word":"graficienii","pos":"noun","definitions":["definite nominative/accusative plural of grafician"]},{"word":"graficienilor","pos":"noun","definitions":["definite genitive/dative plural of grafician","vocative plural of grafician"]},{"word":"grafie","pos":"noun","definitions":["script"],"forms":{"plural":"grafii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grafie","accusative-definite-nominative-singular":"grafia","accusative-indefinite-nominative-plural":"grafii","accusative-definite-nominative-plural":"grafiile","dative-genitive-indefinite-singular":"grafii","dative-definite-genitive-singular":"grafiei","dative-genitive-indefinite-plural":"grafii","dative-definite-genitive-plural":"grafiilor","singular-vocative":"grafie","plural-vocative":"grafiilor"}},{"word":"grafină","pos":"noun","definitions":["countess"],"forms":{"plural":"grafine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grafină","accusative-definite-nominative-singular":"grafina","accusative-indefinite-nominative-plural":"grafine","accusative-definite-nominative-plural":"grafinele","dative-genitive-indefinite-singular":"grafine","dative-definite-genitive-singular":"grafinei","dative-genitive-indefinite-plural":"grafine","dative-definite-genitive-plural":"grafinelor","singular-vocative":"grafină","plural-vocative":"grafinelor"}},{"word":"grafit","pos":"noun","definitions":["graphite"],"pronunciation":"/ɡraˈfit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"grafit","accusative-definite-nominative":"grafitul","dative-genitive-indefinite":"grafit","dative-definite-genitive":"grafitului","vocative":"grafitule"}},{"word":"grafitic","pos":"adj","definitions":["graphitic"],"forms":{"feminine-singular":"grafitică","masculine-plural":"grafitici","feminine-neuter-plural":"grafitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grafitic","error-unrecognized-form-feminine-indefinite-singular":"grafitică","error-unrecognized-form-indefinite-masculine-plural":"grafitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grafitice","definite-error-unrecognized-form-masculine-neuter-singular":"grafiticul","definite-error-unrecognized-form-feminine-singular":"grafitica","definite-error-unrecognized-form-masculine-plural":"grafiticii","definite-error-unrecognized-form-feminine-neuter-plural":"grafiticele"}},{"word":"grafitiza","pos":"verb","definitions":["to graffiti"],"forms":{"canonical":"a grafitiza 1st conjugation","present-singular-third-person":"grafitizează","participle-past":"grafitizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grafitiza","gerund":"grafitizând","first-person-indicative-present-singular":"grafitizez","indicative-present-second-person-singular":"grafitizezi","indicative-present-singular-third-person":"grafitizează","first-person-indicative-plural-present":"grafitizăm","indicative-plural-present-second-person":"grafitizați","indicative-plural-present-third-person":"grafitizează","first-person-imperfect-indicative-singular":"grafitizam","imperfect-indicative-second-person-singular":"grafitizai","imperfect-indicative-singular-third-person":"grafitiza","first-person-imperfect-indicative-plural":"grafitizam","imperfect-indicative-plural-second-person":"grafitizați","imperfect-indicative-plural-third-person":"grafitizau","first-person-indicative-perfect-singular":"grafitizai","indicative-perfect-second-person-singular":"grafitizași","indicative-perfect-singular-third-person":"grafitiză","first-person-indicative-perfect-plural":"grafitizarăm","indicative-perfect-plural-second-person":"grafitizarăți","indicative-perfect-plural-third-person":"grafitizară","first-person-indicative-pluperfect-singular":"grafitizasem","indicative-pluperfect-second-person-singular":"grafitizaseși","indicative-pluperfect-singular-third-person":"grafitizase","first-person-indicative-pluperfect-plural":"grafitizaserăm","indicative-pluperfect-plural-second-person":"grafitizaserăți","indicative-pluperfect-plural-third-person":"grafitizaseră","first-person-present-singular-subjunctive":"să grafitizez","present-second-person-singular-subjunctive":"să grafitizezi","present-singular-subjunctive-third-person":"să grafitizeze","first-person-plural-present-subjunctive":"să grafitizăm","plural-present-second-person-subjunctive":"să grafitizați","plural-present-subjunctive-third-person":"să grafitizeze","imperative-second-person-singular":"grafitizează","imperative-plural-second-person":"grafitizați","imperative-negative-second-person-singular":"nu grafitiza","imperative-negative-plural-second-person":"nu grafitizați"}},{"word":"grafitizare","pos":"noun","definitions":["graphitization"],"forms":{"plural":"grafitizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grafitizare","accusative-definite-nominative-singular":"grafitizarea","accusative-indefinite-nominative-plural":"grafitizări","accusative-definite-nominative-plural":"grafitizările","dative-genitive-indefinite-singular":"grafitizări","dative-definite-genitive-singular":"grafitizării","dative-genitive-indefinite-plural":"grafitizări","dative-definite-genitive-plural":"grafitizărilor","singular-vocative":"grafitizare","plural-vocative":"grafitizărilor"}},{"word":"grafitos","pos":"adj","definitions":["graphitic"],"forms":{"feminine-singular":"grafitoasă","masculine-plural":"grafitoși","feminine-neuter-plural":"grafitoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grafitos","error-unrecognized-form-feminine-indefinite-singular":"grafitoasă","error-unrecognized-form-indefinite-masculine-plural":"grafitoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grafitoase","definite-error-unrecognized-form-masculine-neuter-singular":"grafitosul","definite-error-unrecognized-form-feminine-singular":"grafitoasa","definite-error-unrecognized-form-masculine-plural":"grafitoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grafitoasele"}},{"word":"grafiu","pos":"noun","definitions":["stylus (for writing)"],"forms":{"plural":"grafii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafiu","accusative-definite-nominative-singular":"grafiuul","accusative-indefinite-nominative-plural":"grafii","accusative-definite-nominative-plural":"grafiile","dative-genitive-indefinite-singular":"grafiu","dative-definite-genitive-singular":"grafiuului","dative-genitive-indefinite-plural":"grafii","dative-definite-genitive-plural":"grafiilor","singular-vocative":"grafiuule","plural-vocative":"grafiilor"}},{"word":"grafofobie","pos":"noun","definitions":["graphophobia"],"forms":{"plural":"grafofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grafofobie","accusative-definite-nominative-singular":"grafofobia","accusative-indefinite-nominative-plural":"grafofobii","accusative-definite-nominative-plural":"grafofobiile","dative-genitive-indefinite-singular":"grafofobii","dative-definite-genitive-singular":"grafofobiei","dative-genitive-indefinite-plural":"grafofobii","dative-definite-genitive-plural":"grafofobiilor","singular-vocative":"grafofobie","plural-vocative":"grafofobiilor"}},{"word":"grafofon","pos":"noun","definitions":["graphophone"],"forms":{"plural":"grafofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafofon","accusative-definite-nominative-singular":"grafofonul","accusative-indefinite-nominative-plural":"grafofoane","accusative-definite-nominative-plural":"grafofoanele","dative-genitive-indefinite-singular":"grafofon","dative-definite-genitive-singular":"grafofonului","dative-genitive-indefinite-plural":"grafofoane","dative-definite-genitive-plural":"grafofoanelor","singular-vocative":"grafofonule","plural-vocative":"grafofoanelor"}},{"word":"grafolog","pos":"noun","definitions":["graphologist"],"forms":{"plural":"grafologi"}},{"word":"grafologă","pos":"noun","definitions":["female equivalent of grafolog"],"forms":{"plural":"grafologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grafologă","accusative-definite-nominative-singular":"grafologa","accusative-indefinite-nominative-plural":"grafologe","accusative-definite-nominative-plural":"grafologele","dative-genitive-indefinite-singular":"grafologe","dative-definite-genitive-singular":"grafologei","dative-genitive-indefinite-plural":"grafologe","dative-definite-genitive-plural":"grafologelor","singular-vocative":"grafologă","plural-vocative":"grafologelor"}},{"word":"grafologic","pos":"adj","definitions":["graphological"],"forms":{"feminine-singular":"grafologică","masculine-plural":"grafologici","feminine-neuter-plural":"grafologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grafologic","error-unrecognized-form-feminine-indefinite-singular":"grafologică","error-unrecognized-form-indefinite-masculine-plural":"grafologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grafologice","definite-error-unrecognized-form-masculine-neuter-singular":"grafologicul","definite-error-unrecognized-form-feminine-singular":"grafologica","definite-error-unrecognized-form-masculine-plural":"grafologicii","definite-error-unrecognized-form-feminine-neuter-plural":"grafologicele"}},{"word":"grafologie","pos":"noun","definitions":["graphology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"grafologie","accusative-definite-nominative":"grafologia","dative-genitive-indefinite":"grafologii","dative-definite-genitive":"grafologiei","vocative":"grafologie"}},{"word":"grafoman","pos":"noun","definitions":["graphomaniac"],"pronunciation":"/ɡra.foˈman/","forms":{"plural":"grafomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grafoman","accusative-definite-nominative-singular":"grafomanul","accusative-indefinite-nominative-plural":"grafomani","accusative-definite-nominative-plural":"grafomanii","dative-genitive-indefinite-singular":"grafoman","dative-definite-genitive-singular":"grafomanului","dative-genitive-indefinite-plural":"grafomani","dative-definite-genitive-plural":"grafomanilor","singular-vocative":"grafomanule","plural-vocative":"grafomanilor"}},{"word":"grafomană","pos":"noun","definitions":["female equivalent of grafoman"],"forms":{"plural":"grafomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grafomană","accusative-definite-nominative-singular":"grafomana","accusative-indefinite-nominative-plural":"grafomane","accusative-definite-nominative-plural":"grafomanele","dative-genitive-indefinite-singular":"grafomane","dative-definite-genitive-singular":"grafomanei","dative-genitive-indefinite-plural":"grafomane","dative-definite-genitive-plural":"grafomanelor","singular-vocative":"grafomană","plural-vocative":"grafomanelor"}},{"word":"grafomanie","pos":"noun","definitions":["graphomania"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"grafomanie","accusative-definite-nominative":"grafomania","dative-genitive-indefinite":"grafomanii","dative-definite-genitive":"grafomaniei","vocative":"grafomanie"}},{"word":"grafometric","pos":"adj","definitions":["graphometric"],"forms":{"feminine-singular":"grafometrică","masculine-plural":"grafometrici","feminine-neuter-plural":"grafometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grafometric","error-unrecognized-form-feminine-indefinite-singular":"grafometrică","error-unrecognized-form-indefinite-masculine-plural":"grafometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grafometrice","definite-error-unrecognized-form-masculine-neuter-singular":"grafometricul","definite-error-unrecognized-form-feminine-singular":"grafometrica","definite-error-unrecognized-form-masculine-plural":"grafometricii","definite-error-unrecognized-form-feminine-neuter-plural":"grafometricele"}},{"word":"grafometrie","pos":"noun","definitions":["graphometry"],"forms":{"plural":"grafometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grafometrie","accusative-definite-nominative-singular":"grafometria","accusative-indefinite-nominative-plural":"grafometrii","accusative-definite-nominative-plural":"grafometriile","dative-genitive-indefinite-singular":"grafometrii","dative-definite-genitive-singular":"grafometriei","dative-genitive-indefinite-plural":"grafometrii","dative-definite-genitive-plural":"grafometriilor","singular-vocative":"grafometrie","plural-vocative":"grafometriilor"}},{"word":"grafometru","pos":"noun","definitions":["angulometer"],"forms":{"plural":"grafometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafometru","accusative-definite-nominative-singular":"grafometrul","accusative-indefinite-nominative-plural":"grafometre","accusative-definite-nominative-plural":"grafometrele","dative-genitive-indefinite-singular":"grafometru","dative-definite-genitive-singular":"grafometrului","dative-genitive-indefinite-plural":"grafometre","dative-definite-genitive-plural":"grafometrelor","singular-vocative":"grafometrule","plural-vocative":"grafometrelor"}},{"word":"graforee","pos":"noun","definitions":["graphorrhoea"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"graforee","accusative-definite-nominative":"graforeea","dative-genitive-indefinite":"graforee","dative-definite-genitive":"graforeei","vocative":"graforee"}},{"word":"grafospasm","pos":"noun","definitions":["graphospasm"],"forms":{"plural":"grafospasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grafospasm","accusative-definite-nominative-singular":"grafospasmul","accusative-indefinite-nominative-plural":"grafospasme","accusative-definite-nominative-plural":"grafospasmele","dative-genitive-indefinite-singular":"grafospasm","dative-definite-genitive-singular":"grafospasmului","dative-genitive-indefinite-plural":"grafospasme","dative-definite-genitive-plural":"grafospasmelor","singular-vocative":"grafospasmule","plural-vocative":"grafospasmelor"}},{"word":"graham","pos":"noun","definitions":["graham bread"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"graham","accusative-definite-nominative":"grahamul","dative-genitive-indefinite":"graham","dative-definite-genitive":"grahamului","vocative":"grahamule"}},{"word":"grai","pos":"noun","definitions":["dialect","speech, speaking, faculty of speech","manner of speech","language, idiom","word"],"forms":{"plural":"graiuri"}},{"word":"grăi","pos":"verb","definitions":["to talk, speak","to say"],"forms":{"canonical":"a grăi 4th conjugation","present-singular-third-person":"grăiește","participle-past":"grăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a grăi","gerund":"grăind","first-person-indicative-present-singular":"grăiesc","indicative-present-second-person-singular":"grăiești","indicative-present-singular-third-person":"grăiește","first-person-indicative-plural-present":"grăim","indicative-plural-present-second-person":"grăiți","indicative-plural-present-third-person":"grăiesc","first-person-imperfect-indicative-singular":"grăiam","imperfect-indicative-second-person-singular":"grăiai","imperfect-indicative-singular-third-person":"grăia","first-person-imperfect-indicative-plural":"grăiam","imperfect-indicative-plural-second-person":"grăiați","imperfect-indicative-plural-third-person":"grăiau","first-person-indicative-perfect-singular":"grăii","indicative-perfect-second-person-singular":"grăiși","indicative-perfect-singular-third-person":"grăi","first-person-indicative-perfect-plural":"grăirăm","indicative-perfect-plural-second-person":"grăirăți","indicative-perfect-plural-third-person":"grăiră","first-person-indicative-pluperfect-singular":"grăisem","indicative-pluperfect-second-person-singular":"grăiseși","indicative-pluperfect-singular-third-person":"grăise","first-person-indicative-pluperfect-plural":"grăiserăm","indicative-pluperfect-plural-second-person":"grăiserăți","indicative-pluperfect-plural-third-person":"grăiseră","first-person-present-singular-subjunctive":"să grăiesc","present-second-person-singular-subjunctive":"să grăiești","present-singular-subjunctive-third-person":"să grăiască","first-person-plural-present-subjunctive":"să grăim","plural-present-second-person-subjunctive":"să grăiți","plural-present-subjunctive-third-person":"să grăiască","imperative-second-person-singular":"grăiește","imperative-plural-second-person":"grăiți","imperative-negative-second-person-singular":"nu grăi","imperative-negative-plural-second-person":"nu grăiți"}},{"word":"grâie","pos":"noun","definitions":["plural of grâu"]},{"word":"graifăr","pos":"noun","definitions":["alternative form of graifer"],"forms":{"plural":"graifăre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"graifăr","accusative-definite-nominative-singular":"graifărul","accusative-indefinite-nominative-plural":"graifăre","accusative-definite-nominative-plural":"graifărele","dative-genitive-indefinite-singular":"graifăr","dative-definite-genitive-singular":"graifărului","dative-genitive-indefinite-plural":"graifăre","dative-definite-genitive-plural":"graifărelor","singular-vocative":"graifărule","plural-vocative":"graifărelor"}},{"word":"grăire","pos":"noun","definitions":["speech"],"forms":{"plural":"grăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grăire","accusative-definite-nominative-singular":"grăirea","accusative-indefinite-nominative-plural":"grăiri","accusative-definite-nominative-plural":"grăirile","dative-genitive-indefinite-singular":"grăiri","dative-definite-genitive-singular":"grăirii","dative-genitive-indefinite-plural":"grăiri","dative-definite-genitive-plural":"grăirilor","singular-vocative":"grăire","plural-vocative":"grăirilor"}},{"word":"grăit","pos":"noun","definitions":["word"],"forms":{"plural":"grăiți"}},{"word":"grăit","pos":"verb","definitions":["past participle of grăi"],"forms":{"participle-past":"of grăi"}},{"word":"grăitor","pos":"adj","definitions":["that which speaks","telling, eloquent (revealing)"],"pronunciation":"/ɡrə.iˈtor/","examples":[{"ro":"Sunt nepractic, sunt peste voia mea grăitor de adevăr, mulți mă urăsc și nimeni nu mă iubește afară de tine.\nI’m impractical, I’m truth‐telling against my will, many hate me and nobody loves me but you.","en":null},{"ro":"Buzele care spun adevărul vor dăinui totdeauna, iar limba grăitoare de minciună numai pentru o clipă.\nThe lip of truth shall be established for ever: but a lying (literally, ‘lie‐telling’) tongue is but for a moment.","en":null},{"ro":"Amănuntul cel mai grăitor despre valoarea perenă a instituției de învățământ: reputații săi dascăli sunt, la rândul lor, absolvenți ai liceului.","en":"The most telling detail concerning the perennial value of the educational institution: its honoured teachers are, in turn, alumni of the high school."}],"forms":{"feminine-singular":"grăitoare","masculine-plural":"grăitori","feminine-neuter-plural":"grăitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăitor","error-unrecognized-form-feminine-indefinite-singular":"grăitoare","error-unrecognized-form-indefinite-masculine-plural":"grăitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăitoare","definite-error-unrecognized-form-masculine-neuter-singular":"grăitorul","definite-error-unrecognized-form-feminine-singular":"grăitoarea","definite-error-unrecognized-form-masculine-plural":"grăitorii","definite-error-unrecognized-form-feminine-neuter-plural":"grăitoarele"}},{"word":"graiul","pos":"noun","definitions":["definite nominative/accusative singular of grai"]},{"word":"graiuri","pos":"noun","definitions":["plural of grai"],"gender":"m-p"},{"word":"grăiuț","pos":"noun","definitions":["diminutive of grai"],"forms":{"plural":"grăiuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grăiuț","accusative-definite-nominative-singular":"grăiuțul","accusative-indefinite-nominative-plural":"grăiuțuri","accusative-definite-nominative-plural":"grăiuțurile","dative-genitive-indefinite-singular":"grăiuț","dative-definite-genitive-singular":"grăiuțului","dative-genitive-indefinite-plural":"grăiuțuri","dative-definite-genitive-plural":"grăiuțurilor","singular-vocative":"grăiuțule","plural-vocative":"grăiuțurilor"}},{"word":"grajd","pos":"noun","definitions":["stable, cowshed"],"pronunciation":"/ˈɡraʒd/","forms":{"plural":"grajduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grajd","accusative-definite-nominative-singular":"grajdul","accusative-indefinite-nominative-plural":"grajduri","accusative-definite-nominative-plural":"grajdurile","dative-genitive-indefinite-singular":"grajd","dative-definite-genitive-singular":"grajdului","dative-genitive-indefinite-plural":"grajduri","dative-definite-genitive-plural":"grajdurilor","singular-vocative":"grajdule","plural-vocative":"grajdurilor"}},{"word":"Grăjdan","pos":"name","definitions":["a surname from Russian"],"gender":"m","forms":{"dative-genitive":"lui Grăjdan"}},{"word":"Grăjdana","pos":"name","definitions":["a village in Tisău, Buzău County, Romania"],"gender":"f"},{"word":"Grăjdănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grăjdănescu"}},{"word":"grăjdar","pos":"noun","definitions":["stableman"],"pronunciation":"/ɡrəʒˈdar/","forms":{"plural":"grăjdari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăjdar","accusative-definite-nominative-singular":"grăjdarul","accusative-indefinite-nominative-plural":"grăjdari","accusative-definite-nominative-plural":"grăjdarii","dative-genitive-indefinite-singular":"grăjdar","dative-definite-genitive-singular":"grăjdarului","dative-genitive-indefinite-plural":"grăjdari","dative-definite-genitive-plural":"grăjdarilor","singular-vocative":"grăjdarule","plural-vocative":"grăjdarilor"}},{"word":"grăjdari","pos":"noun","definitions":["plural of grăjdar"],"pronunciation":"/ɡrəʒˈdarʲ/","gender":"m-p"},{"word":"Grăjdaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grăjdaru"}},{"word":"Grăjdeni","pos":"name","definitions":["a village in Fruntișeni, Vaslui County, Romania"],"gender":"m"},{"word":"grăjdișor","pos":"noun","definitions":["diminutive of grajd"],"forms":{"plural":"grăjdișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grăjdișor","accusative-definite-nominative-singular":"grăjdișorul","accusative-indefinite-nominative-plural":"grăjdișoare","accusative-definite-nominative-plural":"grăjdișoarele","dative-genitive-indefinite-singular":"grăjdișor","dative-definite-genitive-singular":"grăjdișorului","dative-genitive-indefinite-plural":"grăjdișoare","dative-definite-genitive-plural":"grăjdișoarelor","singular-vocative":"grăjdișorule","plural-vocative":"grăjdișoarelor"}},{"word":"Grajdu","pos":"name","definitions":["a river in Galați, Romania, tributary to the Suhurlui"],"gender":"m"},{"word":"grăjduleț","pos":"noun","definitions":["diminutive of grajd"],"forms":{"plural":"grăjdulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grăjduleț","accusative-definite-nominative-singular":"grăjdulețul","accusative-indefinite-nominative-plural":"grăjdulețe","accusative-definite-nominative-plural":"grăjdulețele","dative-genitive-indefinite-singular":"grăjduleț","dative-definite-genitive-singular":"grăjdulețului","dative-genitive-indefinite-plural":"grăjdulețe","dative-definite-genitive-plural":"grăjdulețelor","singular-vocative":"grăjdulețule","plural-vocative":"grăjdulețelor"}},{"word":"grajdului","pos":"noun","definitions":["definite genitive/dative singular of grajd"]},{"word":"Grajduri","pos":"name","definitions":["a commune of Iași County, Romania","a village in Grajduri, Iași County, Romania"],"gender":"m"},{"word":"grajduri","pos":"noun","definitions":["nominative/accusative indefinite plural of grajd","genitive/dative indefinite plural of grajd"],"pronunciation":"/ˈɡraʒ.durʲ/","gender":"n-p"},{"word":"grăjduț","pos":"noun","definitions":["diminutive of grajd"],"forms":{"plural":"grăjduțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grăjduț","accusative-definite-nominative-singular":"grăjduțul","accusative-indefinite-nominative-plural":"grăjduțuri","accusative-definite-nominative-plural":"grăjduțurile","dative-genitive-indefinite-singular":"grăjduț","dative-definite-genitive-singular":"grăjduțului","dative-genitive-indefinite-plural":"grăjduțuri","dative-definite-genitive-plural":"grăjduțurilor","singular-vocative":"grăjduțule","plural-vocative":"grăjduțurilor"}},{"word":"gram","pos":"noun","definitions":["gram (unit of mass)"],"pronunciation":"/ˈɡram/","forms":{"plural":"grame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gram","accusative-definite-nominative-singular":"gramul","accusative-indefinite-nominative-plural":"grame","accusative-definite-nominative-plural":"gramele","dative-genitive-indefinite-singular":"gram","dative-definite-genitive-singular":"gramului","dative-genitive-indefinite-plural":"grame","dative-definite-genitive-plural":"gramelor","singular-vocative":"gramule","plural-vocative":"gramelor"}},{"word":"Grămadă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grămadă"}},{"word":"grămadă","pos":"noun","definitions":["a mass, heap, pile, multitude, lot of something"],"pronunciation":"/ɡrəˈma.də/","forms":{"plural":"grămezi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grămadă","accusative-definite-nominative-singular":"grămada","accusative-indefinite-nominative-plural":"grămezi","accusative-definite-nominative-plural":"grămezile","dative-genitive-indefinite-singular":"grămezi","dative-definite-genitive-singular":"grămezii","dative-genitive-indefinite-plural":"grămezi","dative-definite-genitive-plural":"grămezilor","singular-vocative":"grămadă","plural-vocative":"grămezilor","alternative":"грэмадэ"}},{"word":"grămădeală","pos":"noun","definitions":["pile"],"forms":{"plural":"grămădeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grămădeală","accusative-definite-nominative-singular":"grămădeala","accusative-indefinite-nominative-plural":"grămădeli","accusative-definite-nominative-plural":"grămădelile","dative-genitive-indefinite-singular":"grămădeli","dative-definite-genitive-singular":"grămădelii","dative-genitive-indefinite-plural":"grămădeli","dative-definite-genitive-plural":"grămădelilor","singular-vocative":"grămădeală","plural-vocative":"grămădelilor"}},{"word":"grămădire","pos":"noun","definitions":["piling"],"forms":{"plural":"grămădiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grămădire","accusative-definite-nominative-singular":"grămădirea","accusative-indefinite-nominative-plural":"grămădiri","accusative-definite-nominative-plural":"grămădirile","dative-genitive-indefinite-singular":"grămădiri","dative-definite-genitive-singular":"grămădirii","dative-genitive-indefinite-plural":"grămădiri","dative-definite-genitive-plural":"grămădirilor","singular-vocative":"grămădire","plural-vocative":"grămădirilor"}},{"word":"gramaj","pos":"noun","definitions":["weight"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gramaj","accusative-definite-nominative":"gramajul","dative-genitive-indefinite":"gramaj","dative-definite-genitive":"gramajului","vocative":"gramajule"}},{"word":"grămăjea","pos":"noun","definitions":["diminutive of grămadă"],"forms":{"plural":"grămăjele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"grămăjea","accusative-definite-nominative-singular":"grămăjeaua","accusative-indefinite-nominative-plural":"grămăjele","accusative-definite-nominative-plural":"grămăjelele","dative-genitive-indefinite-singular":"grămăjele","dative-definite-genitive-singular":"grămăjelei","dative-genitive-indefinite-plural":"grămăjele","dative-definite-genitive-plural":"grămăjelelor","singular-vocative":"grămăjea","plural-vocative":"grămăjelelor"}},{"word":"grămăjoară","pos":"noun","definitions":["diminutive of grămadă; small heap, pile"],"pronunciation":"/ɡrə.məˈʒo̯a.rə/","forms":{"plural":"grămăjoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grămăjoară","accusative-definite-nominative-singular":"grămăjoara","accusative-indefinite-nominative-plural":"grămăjoare","accusative-definite-nominative-plural":"grămăjoarele","dative-genitive-indefinite-singular":"grămăjoare","dative-definite-genitive-singular":"grămăjoarei","dative-genitive-indefinite-plural":"grămăjoare","dative-definite-genitive-plural":"grămăjoarelor","singular-vocative":"grămăjoară","plural-vocative":"grămăjoarelor"}},{"word":"grămăjuie","pos":"noun","definitions":["diminutive of grămadă; small heap"],"forms":{"plural":"grămăjui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grămăjuie","accusative-definite-nominative-singular":"grămăjuia","accusative-indefinite-nominative-plural":"grămăjuii","accusative-definite-nominative-plural":"grămăjuiile","dative-genitive-indefinite-singular":"grămăjuii","dative-definite-genitive-singular":"grămăjuiei","dative-genitive-indefinite-plural":"grămăjuii","dative-definite-genitive-plural":"grămăjuiilor","singular-vocative":"grămăjuie","plural-vocative":"grămăjuiilor"}},{"word":"gramatic","pos":"noun","definitions":["obsolete form of grămătic"],"forms":{"plural":"gramatici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gramatic","accusative-definite-nominative-singular":"gramaticul","accusative-indefinite-nominative-plural":"gramatici","accusative-definite-nominative-plural":"gramaticii","dative-genitive-indefinite-singular":"gramatic","dative-definite-genitive-singular":"gramaticului","dative-genitive-indefinite-plural":"gramatici","dative-definite-genitive-plural":"gramaticilor","singular-vocative":"gramaticule","plural-vocative":"gramaticilor"}},{"word":"grămătic","pos":"noun","definitions":["scribe"],"forms":{"plural":"grămătici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grămătic","accusative-definite-nominative-singular":"grămăticul","accusative-indefinite-nominative-plural":"grămătici","accusative-definite-nominative-plural":"grămăticii","dative-genitive-indefinite-singular":"grămătic","dative-definite-genitive-singular":"grămăticului","dative-genitive-indefinite-plural":"grămătici","dative-definite-genitive-plural":"grămăticilor","singular-vocative":"grămăticule","plural-vocative":"grămăticilor"}},{"word":"gramatica","pos":"noun","definitions":["definite nominative/accusative singular of gramatică"],"pronunciation":"[ɡraˈmatika]","gender":"f"},{"word":"gramatică","pos":"noun","definitions":["grammar"],"pronunciation":"/ɡraˈma.ti.kə/","forms":{"plural":"gramatici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gramatică","accusative-definite-nominative-singular":"gramatica","accusative-indefinite-nominative-plural":"gramatici","accusative-definite-nominative-plural":"gramaticile","dative-genitive-indefinite-singular":"gramatici","dative-definite-genitive-singular":"gramaticii","dative-genitive-indefinite-plural":"gramatici","dative-definite-genitive-plural":"gramaticilor","singular-vocative":"gramatică","plural-vocative":"gramaticilor"}},{"word":"gramatică generativă","pos":"noun","definitions":["generative grammar"]},{"word":"gramatică transformațională","pos":"noun","definitions":["transformational grammar"]},{"word":"gramatical","pos":"adj","definitions":["grammatical"],"forms":{"feminine-singular":"gramaticală","masculine-plural":"gramaticali","feminine-neuter-plural":"gramaticale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gramatical","error-unrecognized-form-feminine-indefinite-singular":"gramaticală","error-unrecognized-form-indefinite-masculine-plural":"gramaticali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gramaticale","definite-error-unrecognized-form-masculine-neuter-singular":"gramaticalul","definite-error-unrecognized-form-feminine-singular":"gramaticala","definite-error-unrecognized-form-masculine-plural":"gramaticalii","definite-error-unrecognized-form-feminine-neuter-plural":"gramaticalele"}},{"word":"gramaticalitate","pos":"noun","definitions":["grammaticalness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"gramaticalitate","accusative-definite-nominative":"gramaticalitatea","dative-genitive-indefinite":"gramaticalități","dative-definite-genitive":"gramaticalității","vocative":"-"}},{"word":"gramaticaliza","pos":"verb","definitions":["to grammaticalize"],"forms":{"canonical":"a gramaticaliza 1st conjugation","present-singular-third-person":"gramaticalizează","participle-past":"gramaticalizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gramaticaliza","gerund":"gramaticalizând","first-person-indicative-present-singular":"gramaticalizez","indicative-present-second-person-singular":"gramaticalizezi","indicative-present-singular-third-person":"gramaticalizează","first-person-indicative-plural-present":"gramaticalizăm","indicative-plural-present-second-person":"gramaticalizați","indicative-plural-present-third-person":"gramaticalizează","first-person-imperfect-indicative-singular":"gramaticalizam","imperfect-indicative-second-person-singular":"gramaticalizai","imperfect-indicative-singular-third-person":"gramaticaliza","first-person-imperfect-indicative-plural":"gramaticalizam","imperfect-indicative-plural-second-person":"gramaticalizați","imperfect-indicative-plural-third-person":"gramaticalizau","first-person-indicative-perfect-singular":"gramaticalizai","indicative-perfect-second-person-singular":"gramaticalizași","indicative-perfect-singular-third-person":"gramaticaliză","first-person-indicative-perfect-plural":"gramaticalizarăm","indicative-perfect-plural-second-person":"gramaticalizarăți","indicative-perfect-plural-third-person":"gramaticalizară","first-person-indicative-pluperfect-singular":"gramaticalizasem","indicative-pluperfect-second-person-singular":"gramaticalizaseși","indicative-pluperfect-singular-third-person":"gramaticalizase","first-person-indicative-pluperfect-plural":"gramaticalizaserăm","indicative-pluperfect-plural-second-person":"gramaticalizaserăți","indicative-pluperfect-plural-third-person":"gramaticalizaseră","first-person-present-singular-subjunctive":"să gramaticalizez","present-second-person-singular-subjunctive":"să gramaticalizezi","present-singular-subjunctive-third-person":"să gramaticalizeze","first-person-plural-present-subjunctive":"să gramaticalizăm","plural-present-second-person-subjunctive":"să gramaticalizați","plural-present-subjunctive-third-person":"să gramaticalizeze","imperative-second-person-singular":"gramaticalizează","imperative-plural-second-person":"gramaticalizați","imperative-negative-second-person-singular":"nu gramaticaliza","imperative-negative-plural-second-person":"nu gramaticalizați"}},{"word":"gramaticalizare","pos":"noun","definitions":["grammaticalization"],"forms":{"plural":"gramaticalizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gramaticalizare","accusative-definite-nominative-singular":"gramaticalizarea","accusative-indefinite-nominative-plural":"gramaticalizări","accusative-definite-nominative-plural":"gramaticalizările","dative-genitive-indefinite-singular":"gramaticalizări","dative-definite-genitive-singular":"gramaticalizării","dative-genitive-indefinite-plural":"gramaticalizări","dative-definite-genitive-plural":"gramaticalizărilor","singular-vocative":"gramaticalizare","plural-vocative":"gramaticalizărilor"}},{"word":"gramaticesc","pos":"adj","definitions":["grammatical"],"forms":{"feminine-singular":"gramaticească","plural":"gramaticești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gramaticesc","error-unrecognized-form-feminine-indefinite-singular":"gramaticească","error-unrecognized-form-indefinite-masculine-plural":"gramaticești","error-unrecognized-form-feminine-indefinite-neuter-plural":"gramaticești","definite-error-unrecognized-form-masculine-neuter-singular":"gramaticescul","definite-error-unrecognized-form-feminine-singular":"gramaticeasca","definite-error-unrecognized-form-masculine-plural":"gramaticeștii","definite-error-unrecognized-form-feminine-neuter-plural":"gramaticeștile"}},{"word":"gramaticește","pos":"adv","definitions":["grammatically"]},{"word":"gramatician","pos":"noun","definitions":["grammarian"],"forms":{"plural":"gramaticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gramatician","accusative-definite-nominative-singular":"gramaticianul","accusative-indefinite-nominative-plural":"gramaticieni","accusative-definite-nominative-plural":"gramaticienii","dative-genitive-indefinite-singular":"gramatician","dative-definite-genitive-singular":"gramaticianului","dative-genitive-indefinite-plural":"gramaticieni","dative-definite-genitive-plural":"gramaticienilor","singular-vocative":"gramaticianule","plural-vocative":"gramaticienilor"}},{"word":"gramaticiană","pos":"noun","definitions":["female equivalent of gramatician"],"forms":{"plural":"gramaticiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gramaticiană","accusative-definite-nominative-singular":"gramaticiana","accusative-indefinite-nominative-plural":"gramaticiene","accusative-definite-nominative-plural":"gramaticienele","dative-genitive-indefinite-singular":"gramaticiene","dative-definite-genitive-singular":"gramaticienei","dative-genitive-indefinite-plural":"gramaticiene","dative-definite-genitive-plural":"gramaticienelor","singular-vocative":"gramaticiană","plural-vocative":"gramaticienelor"}},{"word":"grămăticie","pos":"noun","definitions":["chancellery"],"forms":{"plural":"grămăticii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grămăticie","accusative-definite-nominative-singular":"grămăticia","accusative-indefinite-nominative-plural":"grămăticii","accusative-definite-nominative-plural":"grămăticiile","dative-genitive-indefinite-singular":"grămăticii","dative-definite-genitive-singular":"grămăticiei","dative-genitive-indefinite-plural":"grămăticii","dative-definite-genitive-plural":"grămăticiilor","singular-vocative":"grămăticie","plural-vocative":"grămăticiilor"}},{"word":"Grămăticu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grămăticu"}},{"word":"gramatie","pos":"noun","definitions":["learning"],"forms":{"plural":"gramatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gramatie","accusative-definite-nominative-singular":"gramatia","accusative-indefinite-nominative-plural":"gramatii","accusative-definite-nominative-plural":"gramatiile","dative-genitive-indefinite-singular":"gramatii","dative-definite-genitive-singular":"gramatiei","dative-genitive-indefinite-plural":"gramatii","dative-definite-genitive-plural":"gramatiilor","singular-vocative":"gramatie","plural-vocative":"gramatiilor"}},{"word":"gramatist","pos":"noun","definitions":["grammarian"],"forms":{"plural":"gramatiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gramatist","accusative-definite-nominative-singular":"gramatistul","accusative-indefinite-nominative-plural":"gramatiști","accusative-definite-nominative-plural":"gramatiștii","dative-genitive-indefinite-singular":"gramatist","dative-definite-genitive-singular":"gramatistului","dative-genitive-indefinite-plural":"gramatiști","dative-definite-genitive-plural":"gramatiștilor","singular-vocative":"gramatistule","plural-vocative":"gramatiștilor"}},{"word":"Gramatopol","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Gramatopol"}},{"word":"Grămescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grămescu"}},{"word":"Grămești","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Grămești, Suceava County, Romania"],"gender":"m"},{"word":"graminee","pos":"noun","definitions":["grasses"],"forms":{"plural":"graminee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"graminee","accusative-definite-nominative-singular":"gramineea","accusative-indefinite-nominative-plural":"graminee","accusative-definite-nominative-plural":"gramineele","dative-genitive-indefinite-singular":"graminee","dative-definite-genitive-singular":"gramineei","dative-genitive-indefinite-plural":"graminee","dative-definite-genitive-plural":"gramineelor","singular-vocative":"graminee","plural-vocative":"gramineelor"}},{"word":"Grămișteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Grămișteanu"}},{"word":"gramnegativ","pos":"adj","definitions":["gram-negative"],"forms":{"feminine-singular":"gramnegativă","masculine-plural":"gramnegativi","feminine-neuter-plural":"gramnegative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gramnegativ","error-unrecognized-form-feminine-indefinite-singular":"gramnegativă","error-unrecognized-form-indefinite-masculine-plural":"gramnegativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gramnegative","definite-error-unrecognized-form-masculine-neuter-singular":"gramnegativul","definite-error-unrecognized-form-feminine-singular":"gramnegativa","definite-error-unrecognized-form-masculine-plural":"gramnegativii","definite-error-unrecognized-form-feminine-neuter-plural":"gramnegativele"}},{"word":"gramofon","pos":"noun","definitions":["gramophone"],"forms":{"plural":"gramofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gramofon","accusative-definite-nominative-singular":"gramofonul","accusative-indefinite-nominative-plural":"gramofoane","accusative-definite-nominative-plural":"gramofoanele","dative-genitive-indefinite-singular":"gramofon","dative-definite-genitive-singular":"gramofonului","dative-genitive-indefinite-plural":"gramofoane","dative-definite-genitive-plural":"gramofoanelor","singular-vocative":"gramofonule","plural-vocative":"gramofoanelor"}},{"word":"gramolă","pos":"noun","definitions":["kneading machine"],"forms":{"plural":"gramole","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gramolă","accusative-definite-nominative-singular":"gramola","accusative-indefinite-nominative-plural":"gramole","accusative-definite-nominative-plural":"gramolele","dative-genitive-indefinite-singular":"gramole","dative-definite-genitive-singular":"gramolei","dative-genitive-indefinite-plural":"gramole","dative-definite-genitive-plural":"gramolelor","singular-vocative":"gramolă","plural-vocative":"gramolelor"}},{"word":"grampir","pos":"noun","definitions":["potato"],"forms":{"plural":"grampiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grampir","accusative-definite-nominative-singular":"grampirul","accusative-indefinite-nominative-plural":"grampiri","accusative-definite-nominative-plural":"grampirii","dative-genitive-indefinite-singular":"grampir","dative-definite-genitive-singular":"grampirului","dative-genitive-indefinite-plural":"grampiri","dative-definite-genitive-plural":"grampirilor","singular-vocative":"grampirule","plural-vocative":"grampirilor"}},{"word":"grampozitiv","pos":"adj","definitions":["gram-positive"],"forms":{"feminine-singular":"grampozitivă","masculine-plural":"grampozitivi","feminine-neuter-plural":"grampozitive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grampozitiv","error-unrecognized-form-feminine-indefinite-singular":"grampozitivă","error-unrecognized-form-indefinite-masculine-plural":"grampozitivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grampozitive","definite-error-unrecognized-form-masculine-neuter-singular":"grampozitivul","definite-error-unrecognized-form-feminine-singular":"grampozitiva","definite-error-unrecognized-form-masculine-plural":"grampozitivii","definite-error-unrecognized-form-feminine-neuter-plural":"grampozitivele"}},{"word":"gran","pos":"noun","definitions":["grain (unit of weight)"],"forms":{"plural":"grane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gran","accusative-definite-nominative-singular":"granul","accusative-indefinite-nominative-plural":"grane","accusative-definite-nominative-plural":"granele","dative-genitive-indefinite-singular":"gran","dative-definite-genitive-singular":"granului","dative-genitive-indefinite-plural":"grane","dative-definite-genitive-plural":"granelor","singular-vocative":"granule","plural-vocative":"granelor"}},{"word":"granadir","pos":"noun","definitions":["obsolete form of grenadier"],"forms":{"plural":"granadiri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"granadir","accusative-definite-nominative-singular":"granadirul","accusative-indefinite-nominative-plural":"granadiri","accusative-definite-nominative-plural":"granadirii","dative-genitive-indefinite-singular":"granadir","dative-definite-genitive-singular":"granadirului","dative-genitive-indefinite-plural":"granadiri","dative-definite-genitive-plural":"granadirilor","singular-vocative":"granadirule","plural-vocative":"granadirilor"}}];
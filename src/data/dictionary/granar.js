@@ -0,0 +1 @@
+export default [{"word":"grânar","pos":"noun","definitions":["granary"],"forms":{"plural":"grânare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grânar","accusative-definite-nominative-singular":"grânarul","accusative-indefinite-nominative-plural":"grânare","accusative-definite-nominative-plural":"grânarele","dative-genitive-indefinite-singular":"grânar","dative-definite-genitive-singular":"grânarului","dative-genitive-indefinite-plural":"grânare","dative-definite-genitive-plural":"grânarelor","singular-vocative":"grânarule","plural-vocative":"grânarelor"}},{"word":"grânare","pos":"noun","definitions":["plural of grânar"]},{"word":"Grânari","pos":"name","definitions":["a village in Jibert, Brașov County, Romania"],"gender":"m"},{"word":"granat","pos":"noun","definitions":["garnet"],"pronunciation":"/ɡraˈnat/","forms":{"plural":"granate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granat","accusative-definite-nominative-singular":"granatul","accusative-indefinite-nominative-plural":"granate","accusative-definite-nominative-plural":"granatele","dative-genitive-indefinite-singular":"granat","dative-definite-genitive-singular":"granatului","dative-genitive-indefinite-plural":"granate","dative-definite-genitive-plural":"granatelor","singular-vocative":"granatule","plural-vocative":"granatelor"}},{"word":"granata","pos":"noun","definitions":["definite nominative/accusative singular of granată"],"pronunciation":"[ɡraˈnata]","gender":"f"},{"word":"granată","pos":"noun","definitions":["pomegranate","grenade"],"pronunciation":"/ɡraˈna.tə/","forms":{"plural":"granate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"granată","accusative-definite-nominative-singular":"granata","accusative-indefinite-nominative-plural":"granate","accusative-definite-nominative-plural":"granatele","dative-genitive-indefinite-singular":"granate","dative-definite-genitive-singular":"granatei","dative-genitive-indefinite-plural":"granate","dative-definite-genitive-plural":"granatelor","singular-vocative":"granată","plural-vocative":"granatelor","alternative":"granat"}},{"word":"granate","pos":"noun","definitions":["inflection of granată:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ɡraˈnate]","gender":"f"},{"word":"grandangular","pos":"noun","definitions":["grand-angle, wide-angle lens"],"forms":{"plural":"grandangulare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grandangular","accusative-definite-nominative-singular":"grandangularul","accusative-indefinite-nominative-plural":"grandangulare","accusative-definite-nominative-plural":"grandangularele","dative-genitive-indefinite-singular":"grandangular","dative-definite-genitive-singular":"grandangularului","dative-genitive-indefinite-plural":"grandangulare","dative-definite-genitive-plural":"grandangularelor","singular-vocative":"grandangularule","plural-vocative":"grandangularelor"}},{"word":"grandilocvent","pos":"adj","definitions":["grandiloquent"],"forms":{"feminine-singular":"grandilocventă","masculine-plural":"grandilocvenți","feminine-neuter-plural":"grandilocvente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grandilocvent","error-unrecognized-form-feminine-indefinite-singular":"grandilocventă","error-unrecognized-form-indefinite-masculine-plural":"grandilocvenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grandilocvente","definite-error-unrecognized-form-masculine-neuter-singular":"grandilocventul","definite-error-unrecognized-form-feminine-singular":"grandilocventa","definite-error-unrecognized-form-masculine-plural":"grandilocvenții","definite-error-unrecognized-form-feminine-neuter-plural":"grandilocventele"}},{"word":"grandilocvență","pos":"noun","definitions":["grandiloquence"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grandilocvență","accusative-definite-nominative-singular":"grandilocvența","accusative-indefinite-nominative-plural":"grandilocvențe","accusative-definite-nominative-plural":"grandilocvențele","dative-genitive-indefinite-singular":"grandilocvențe","dative-definite-genitive-singular":"grandilocvenței","dative-genitive-indefinite-plural":"grandilocvențe","dative-definite-genitive-plural":"grandilocvențelor","singular-vocative":"grandilocvență","plural-vocative":"grandilocvențelor"}},{"word":"grandios","pos":"adj","definitions":["grandiose"],"forms":{"feminine-singular":"grandioasă","masculine-plural":"grandioși","feminine-neuter-plural":"grandioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grandios","error-unrecognized-form-feminine-indefinite-singular":"grandioasă","error-unrecognized-form-indefinite-masculine-plural":"grandioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grandioase","definite-error-unrecognized-form-masculine-neuter-singular":"grandiosul","definite-error-unrecognized-form-feminine-singular":"grandioasa","definite-error-unrecognized-form-masculine-plural":"grandioșii","definite-error-unrecognized-form-feminine-neuter-plural":"grandioasele"}},{"word":"grandioz","pos":"adj","definitions":["obsolete form of grandios"],"forms":{"feminine-singular":"grandioză","masculine-plural":"grandiozi","feminine-neuter-plural":"grandioze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grandioz","error-unrecognized-form-feminine-indefinite-singular":"grandioză","error-unrecognized-form-indefinite-masculine-plural":"grandiozi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grandioze","definite-error-unrecognized-form-masculine-neuter-singular":"grandiozul","definite-error-unrecognized-form-feminine-singular":"grandioza","definite-error-unrecognized-form-masculine-plural":"grandiozii","definite-error-unrecognized-form-feminine-neuter-plural":"grandiozele"}},{"word":"grandiozitate","pos":"noun","definitions":["grandiosity"],"forms":{"plural":"grandiozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grandiozitate","accusative-definite-nominative-singular":"grandiozitatea","accusative-indefinite-nominative-plural":"grandiozități","accusative-definite-nominative-plural":"grandiozitățile","dative-genitive-indefinite-singular":"grandiozități","dative-definite-genitive-singular":"grandiozității","dative-genitive-indefinite-plural":"grandiozități","dative-definite-genitive-plural":"grandiozităților","singular-vocative":"grandiozitate","plural-vocative":"grandiozităților"}},{"word":"grandoare","pos":"noun","definitions":["brilliance, greatness"],"forms":{"plural":"grandori","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grandoare","accusative-definite-nominative-singular":"grandoarea","accusative-indefinite-nominative-plural":"grandoari","accusative-definite-nominative-plural":"grandoarile","dative-genitive-indefinite-singular":"grandoari","dative-definite-genitive-singular":"grandoarii","dative-genitive-indefinite-plural":"grandoari","dative-definite-genitive-plural":"grandoarilor","singular-vocative":"grandoare","plural-vocative":"grandoarilor"}},{"word":"grandoman","pos":"noun","definitions":["megalomaniac"],"forms":{"plural":"grandomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grandoman","accusative-definite-nominative-singular":"grandomanul","accusative-indefinite-nominative-plural":"grandomani","accusative-definite-nominative-plural":"grandomanii","dative-genitive-indefinite-singular":"grandoman","dative-definite-genitive-singular":"grandomanului","dative-genitive-indefinite-plural":"grandomani","dative-definite-genitive-plural":"grandomanilor","singular-vocative":"grandomanule","plural-vocative":"grandomanilor"}},{"word":"grandomană","pos":"noun","definitions":["female equivalent of grandoman"],"forms":{"plural":"grandomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grandomană","accusative-definite-nominative-singular":"grandomana","accusative-indefinite-nominative-plural":"grandomane","accusative-definite-nominative-plural":"grandomanele","dative-genitive-indefinite-singular":"grandomane","dative-definite-genitive-singular":"grandomanei","dative-genitive-indefinite-plural":"grandomane","dative-definite-genitive-plural":"grandomanelor","singular-vocative":"grandomană","plural-vocative":"grandomanelor"}},{"word":"grandomanie","pos":"noun","definitions":["delusion of grandeur, megalomania (false belief that one is important or powerful)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"grandomanie","accusative-definite-nominative":"grandomania","dative-genitive-indefinite":"grandomanii","dative-definite-genitive":"grandomaniei","vocative":"grandomanie"}},{"word":"granducă","pos":"noun","definitions":["grand duke"],"forms":{"plural":"granduci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"granducă","accusative-definite-nominative-singular":"granducăul","accusative-indefinite-nominative-plural":"granduci","accusative-definite-nominative-plural":"granducii","dative-genitive-indefinite-singular":"granducă","dative-definite-genitive-singular":"granducăului","dative-genitive-indefinite-plural":"granduci","dative-definite-genitive-plural":"granducilor","singular-vocative":"granducăule","plural-vocative":"granducilor"}},{"word":"grâne","pos":"noun","definitions":["plural of grâu"]},{"word":"Grănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grănescu"}},{"word":"grângoașă","pos":"noun","definitions":["dung-rolling beetle (Gymnopleurus mopsus)"],"forms":{"plural":"grângoașe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grângoașă","accusative-definite-nominative-singular":"grângoașa","accusative-indefinite-nominative-plural":"grângoașe","accusative-definite-nominative-plural":"grângoașele","dative-genitive-indefinite-singular":"grângoașe","dative-definite-genitive-singular":"grângoașei","dative-genitive-indefinite-plural":"grângoașe","dative-definite-genitive-plural":"grângoașelor","singular-vocative":"grângoașă","plural-vocative":"grângoașelor"}},{"word":"grangor","pos":"noun","definitions":["alternative form of grangur"],"forms":{"plural":"grangori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grangor","accusative-definite-nominative-singular":"grangorul","accusative-indefinite-nominative-plural":"grangori","accusative-definite-nominative-plural":"grangorii","dative-genitive-indefinite-singular":"grangor","dative-definite-genitive-singular":"grangorului","dative-genitive-indefinite-plural":"grangori","dative-definite-genitive-plural":"grangorilor","singular-vocative":"grangorule","plural-vocative":"grangorilor"}},{"word":"grangur","pos":"noun","definitions":["oriole (bird)","hotshot, big gun, bigwig"],"pronunciation":"/ˈɡran.ɡur/","forms":{"plural":"granguri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grangur","accusative-definite-nominative-singular":"grangurul","accusative-indefinite-nominative-plural":"granguri","accusative-definite-nominative-plural":"grangurii","dative-genitive-indefinite-singular":"grangur","dative-definite-genitive-singular":"grangurului","dative-genitive-indefinite-plural":"granguri","dative-definite-genitive-plural":"grangurilor","singular-vocative":"grangurule","plural-vocative":"grangurilor","alternative-common":"gangur"}},{"word":"grânguraș","pos":"noun","definitions":["diminutive of grangure"],"forms":{"plural":"grângurași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grânguraș","accusative-definite-nominative-singular":"grângurașul","accusative-indefinite-nominative-plural":"grângurași","accusative-definite-nominative-plural":"grângurașii","dative-genitive-indefinite-singular":"grânguraș","dative-definite-genitive-singular":"grângurașului","dative-genitive-indefinite-plural":"grângurași","dative-definite-genitive-plural":"grângurașilor","singular-vocative":"grângurașule","plural-vocative":"grângurașilor"}},{"word":"Grangure","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grangure"}},{"word":"grangure","pos":"noun","definitions":["alternative form of grangur"],"forms":{"plural":"granguri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grangure","accusative-definite-nominative-singular":"grangureul","accusative-indefinite-nominative-plural":"granguri","accusative-definite-nominative-plural":"grangurii","dative-genitive-indefinite-singular":"grangure","dative-definite-genitive-singular":"grangureului","dative-genitive-indefinite-plural":"granguri","dative-definite-genitive-plural":"grangurilor","singular-vocative":"grangureule","plural-vocative":"grangurilor"}},{"word":"grăngurel","pos":"noun","definitions":["diminutive of grangur"],"forms":{"plural":"grăngurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăngurel","accusative-definite-nominative-singular":"grăngurelul","accusative-indefinite-nominative-plural":"grăngurei","accusative-definite-nominative-plural":"grăngureii","dative-genitive-indefinite-singular":"grăngurel","dative-definite-genitive-singular":"grăngurelului","dative-genitive-indefinite-plural":"grăngurei","dative-definite-genitive-plural":"grăngureilor","singular-vocative":"grăngurelule","plural-vocative":"grăngureilor"}},{"word":"granguri","pos":"noun","definitions":["plural of grangur"],"gender":"m"},{"word":"grănicer","pos":"noun","definitions":["border guard (soldier who watches the border)"],"pronunciation":"/ɡrə.niˈt͡ʃer/","forms":{"plural":"grăniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grănicer","accusative-definite-nominative-singular":"grănicerul","accusative-indefinite-nominative-plural":"grăniceri","accusative-definite-nominative-plural":"grănicerii","dative-genitive-indefinite-singular":"grănicer","dative-definite-genitive-singular":"grănicerului","dative-genitive-indefinite-plural":"grăniceri","dative-definite-genitive-plural":"grănicerilor","singular-vocative":"grănicerule","plural-vocative":"grănicerilor"}},{"word":"grăniceresc","pos":"adj","definitions":["border guard"],"forms":{"feminine-singular":"grănicerească","plural":"grănicerești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăniceresc","error-unrecognized-form-feminine-indefinite-singular":"grănicerească","error-unrecognized-form-indefinite-masculine-plural":"grănicerești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grănicerești","definite-error-unrecognized-form-masculine-neuter-singular":"grănicerescul","definite-error-unrecognized-form-feminine-singular":"grănicereasca","definite-error-unrecognized-form-masculine-plural":"grănicereștii","definite-error-unrecognized-form-feminine-neuter-plural":"grănicereștile"}},{"word":"Grăniceri","pos":"name","definitions":["a commune of Arad County, Romania","a village in Grăniceri, Arad County, Romania"],"gender":"m"},{"word":"Grănicerii","pos":"name","definitions":["a village in Giera, Timiș County, Romania"],"gender":"m"},{"word":"Grăniceru","pos":"name","definitions":["a village in Negru Vodă, Constanța County, Romania"],"gender":"m"},{"word":"grănicerul","pos":"noun","definitions":["definite nominative/accusative singular of grănicer"]},{"word":"Grănicești","pos":"name","definitions":["a commune of Suceava County, Romania","a village in Grănicești, Suceava County, Romania"],"gender":"m"},{"word":"granifer","pos":"adj","definitions":["graniferous"],"forms":{"feminine-singular":"graniferă","masculine-plural":"graniferi","feminine-neuter-plural":"granifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granifer","error-unrecognized-form-feminine-indefinite-singular":"graniferă","error-unrecognized-form-indefinite-masculine-plural":"graniferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"granifere","definite-error-unrecognized-form-masculine-neuter-singular":"graniferul","definite-error-unrecognized-form-feminine-singular":"granifera","definite-error-unrecognized-form-masculine-plural":"graniferii","definite-error-unrecognized-form-feminine-neuter-plural":"graniferele"}},{"word":"Grănișteanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grănișteanu"}},{"word":"granit","pos":"noun","definitions":["granite"],"forms":{"plural":"granituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"granit","accusative-definite-nominative-singular":"granitul","accusative-indefinite-nominative-plural":"granituri","accusative-definite-nominative-plural":"graniturile","dative-genitive-indefinite-singular":"granit","dative-definite-genitive-singular":"granitului","dative-genitive-indefinite-plural":"granituri","dative-definite-genitive-plural":"graniturilor","singular-vocative":"granitule","plural-vocative":"graniturilor"}},{"word":"Granița","pos":"name","definitions":["a river in Suceava County, Romania, tributary to the Neagra Șarului"],"gender":"f"},{"word":"graniță","pos":"noun","definitions":["boundary, border"],"pronunciation":"[ˈɡra.ni.t͡sə]","forms":{"plural":"granițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"graniță","accusative-definite-nominative-singular":"granița","accusative-indefinite-nominative-plural":"granițe","accusative-definite-nominative-plural":"granițele","dative-genitive-indefinite-singular":"granițe","dative-definite-genitive-singular":"graniței","dative-genitive-indefinite-plural":"granițe","dative-definite-genitive-plural":"granițelor","singular-vocative":"graniță","plural-vocative":"granițelor"}},{"word":"grănițare","pos":"noun","definitions":["establishing a border"],"forms":{"plural":"grănițări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grănițare","accusative-definite-nominative-singular":"grănițarea","accusative-indefinite-nominative-plural":"grănițări","accusative-definite-nominative-plural":"grănițările","dative-genitive-indefinite-singular":"grănițări","dative-definite-genitive-singular":"grănițării","dative-genitive-indefinite-plural":"grănițări","dative-definite-genitive-plural":"grănițărilor","singular-vocative":"grănițare","plural-vocative":"grănițărilor"}},{"word":"grănițat","pos":"adj","definitions":["which has set borders"],"forms":{"feminine-singular":"grănițată","masculine-plural":"grănițați","feminine-neuter-plural":"grănițate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grănițat","error-unrecognized-form-feminine-indefinite-singular":"grănițată","error-unrecognized-form-indefinite-masculine-plural":"grănițați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grănițate","definite-error-unrecognized-form-masculine-neuter-singular":"grănițatul","definite-error-unrecognized-form-feminine-singular":"grănițata","definite-error-unrecognized-form-masculine-plural":"grănițații","definite-error-unrecognized-form-feminine-neuter-plural":"grănițatele"}},{"word":"grănițat","pos":"verb","definitions":["past participle of grănița"],"forms":{"participle-past":"of grănița"}},{"word":"granitic","pos":"adj","definitions":["granitic"],"forms":{"feminine-singular":"granitică","masculine-plural":"granitici","feminine-neuter-plural":"granitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granitic","error-unrecognized-form-feminine-indefinite-singular":"granitică","error-unrecognized-form-indefinite-masculine-plural":"granitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"granitice","definite-error-unrecognized-form-masculine-neuter-singular":"graniticul","definite-error-unrecognized-form-feminine-singular":"granitica","definite-error-unrecognized-form-masculine-plural":"graniticii","definite-error-unrecognized-form-feminine-neuter-plural":"graniticele"}},{"word":"granitizare","pos":"noun","definitions":["granitization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"granitizare","accusative-definite-nominative":"granitizarea","dative-genitive-indefinite":"granitizări","dative-definite-genitive":"granitizării","vocative":"granitizare"}},{"word":"granivor","pos":"noun","definitions":["granivorous"],"forms":{"plural":"granivori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"granivor","accusative-definite-nominative-singular":"granivorul","accusative-indefinite-nominative-plural":"granivori","accusative-definite-nominative-plural":"granivorii","dative-genitive-indefinite-singular":"granivor","dative-definite-genitive-singular":"granivorului","dative-genitive-indefinite-plural":"granivori","dative-definite-genitive-plural":"granivorilor","singular-vocative":"granivorule","plural-vocative":"granivorilor"}},{"word":"granodiorit","pos":"noun","definitions":["granodiorite"],"forms":{"plural":"granodiorite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granodiorit","accusative-definite-nominative-singular":"granodioritul","accusative-indefinite-nominative-plural":"granodiorite","accusative-definite-nominative-plural":"granodioritele","dative-genitive-indefinite-singular":"granodiorit","dative-definite-genitive-singular":"granodioritului","dative-genitive-indefinite-plural":"granodiorite","dative-definite-genitive-plural":"granodioritelor","singular-vocative":"granodioritule","plural-vocative":"granodioritelor"}},{"word":"grăntaș","pos":"noun","definitions":["thief"],"forms":{"plural":"grăntași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăntaș","accusative-definite-nominative-singular":"grăntașul","accusative-indefinite-nominative-plural":"grăntași","accusative-definite-nominative-plural":"grăntașii","dative-genitive-indefinite-singular":"grăntaș","dative-definite-genitive-singular":"grăntașului","dative-genitive-indefinite-plural":"grăntași","dative-definite-genitive-plural":"grăntașilor","singular-vocative":"grăntașule","plural-vocative":"grăntașilor"}},{"word":"granula","pos":"verb","definitions":["to granulate"],"forms":{"canonical":"a granula 1st conjugation","present-singular-third-person":"granulează","participle-past":"granulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a granula","gerund":"granulând","first-person-indicative-present-singular":"granulez","indicative-present-second-person-singular":"granulezi","indicative-present-singular-third-person":"granulează","first-person-indicative-plural-present":"granulăm","indicative-plural-present-second-person":"granulați","indicative-plural-present-third-person":"granulează","first-person-imperfect-indicative-singular":"granulam","imperfect-indicative-second-person-singular":"granulai","imperfect-indicative-singular-third-person":"granula","first-person-imperfect-indicative-plural":"granulam","imperfect-indicative-plural-second-person":"granulați","imperfect-indicative-plural-third-person":"granulau","first-person-indicative-perfect-singular":"granulai","indicative-perfect-second-person-singular":"granulași","indicative-perfect-singular-third-person":"granulă","first-person-indicative-perfect-plural":"granularăm","indicative-perfect-plural-second-person":"granularăți","indicative-perfect-plural-third-person":"granulară","first-person-indicative-pluperfect-singular":"granulasem","indicative-pluperfect-second-person-singular":"granulaseși","indicative-pluperfect-singular-third-person":"granulase","first-person-indicative-pluperfect-plural":"granulaserăm","indicative-pluperfect-plural-second-person":"granulaserăți","indicative-pluperfect-plural-third-person":"granulaseră","first-person-present-singular-subjunctive":"să granulez","present-second-person-singular-subjunctive":"să granulezi","present-singular-subjunctive-third-person":"să granuleze","first-person-plural-present-subjunctive":"să granulăm","plural-present-second-person-subjunctive":"să granulați","plural-present-subjunctive-third-person":"să granuleze","imperative-second-person-singular":"granulează","imperative-plural-second-person":"granulați","imperative-negative-second-person-singular":"nu granula","imperative-negative-plural-second-person":"nu granulați"}},{"word":"granulă","pos":"noun","definitions":["granule"],"forms":{"plural":"granule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"granulă","accusative-definite-nominative-singular":"granula","accusative-indefinite-nominative-plural":"granule","accusative-definite-nominative-plural":"granulele","dative-genitive-indefinite-singular":"granule","dative-definite-genitive-singular":"granulei","dative-genitive-indefinite-plural":"granule","dative-definite-genitive-plural":"granulelor","singular-vocative":"granulă","plural-vocative":"granulelor"}},{"word":"granular","pos":"adj","definitions":["granular"],"forms":{"feminine-singular":"granulară","masculine-plural":"granulari","feminine-neuter-plural":"granulare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granular","error-unrecognized-form-feminine-indefinite-singular":"granulară","error-unrecognized-form-indefinite-masculine-plural":"granulari","error-unrecognized-form-feminine-indefinite-neuter-plural":"granulare","definite-error-unrecognized-form-masculine-neuter-singular":"granularul","definite-error-unrecognized-form-feminine-singular":"granulara","definite-error-unrecognized-form-masculine-plural":"granularii","definite-error-unrecognized-form-feminine-neuter-plural":"granularele"}},{"word":"granulare","pos":"noun","definitions":["granulation"],"forms":{"plural":"granulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"granulare","accusative-definite-nominative-singular":"granularea","accusative-indefinite-nominative-plural":"granulări","accusative-definite-nominative-plural":"granulările","dative-genitive-indefinite-singular":"granulări","dative-definite-genitive-singular":"granulării","dative-genitive-indefinite-plural":"granulări","dative-definite-genitive-plural":"granulărilor","singular-vocative":"granulare","plural-vocative":"granulărilor"}},{"word":"granulat","pos":"adj","definitions":["granulated"],"forms":{"feminine-singular":"granulată","masculine-plural":"granulați","feminine-neuter-plural":"granulate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granulat","error-unrecognized-form-feminine-indefinite-singular":"granulată","error-unrecognized-form-indefinite-masculine-plural":"granulați","error-unrecognized-form-feminine-indefinite-neuter-plural":"granulate","definite-error-unrecognized-form-masculine-neuter-singular":"granulatul","definite-error-unrecognized-form-feminine-singular":"granulata","definite-error-unrecognized-form-masculine-plural":"granulații","definite-error-unrecognized-form-feminine-neuter-plural":"granulatele"}},{"word":"granulație","pos":"noun","definitions":["granulation"],"forms":{"plural":"granulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"granulație","accusative-definite-nominative-singular":"granulația","accusative-indefinite-nominative-plural":"granulații","accusative-definite-nominative-plural":"granulațiile","dative-genitive-indefinite-singular":"granulații","dative-definite-genitive-singular":"granulației","dative-genitive-indefinite-plural":"granulații","dative-definite-genitive-plural":"granulațiilor","singular-vocative":"granulație","plural-vocative":"granulațiilor"}},{"word":"granulațiune","pos":"noun","definitions":["obsolete form of granulație"],"forms":{"plural":"granulațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"granulațiune","accusative-definite-nominative-singular":"granulațiunea","accusative-indefinite-nominative-plural":"granulațiuni","accusative-definite-nominative-plural":"granulațiunile","dative-genitive-indefinite-singular":"granulațiuni","dative-definite-genitive-singular":"granulațiunii","dative-genitive-indefinite-plural":"granulațiuni","dative-definite-genitive-plural":"granulațiunilor","singular-vocative":"granulațiune","plural-vocative":"granulațiunilor"}},{"word":"granulator","pos":"noun","definitions":["granulator"],"forms":{"plural":"granulatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granulator","accusative-definite-nominative-singular":"granulatorul","accusative-indefinite-nominative-plural":"granulatoare","accusative-definite-nominative-plural":"granulatoarele","dative-genitive-indefinite-singular":"granulator","dative-definite-genitive-singular":"granulatorului","dative-genitive-indefinite-plural":"granulatoare","dative-definite-genitive-plural":"granulatoarelor","singular-vocative":"granulatorule","plural-vocative":"granulatoarelor"}},{"word":"granulie","pos":"noun","definitions":["granulitis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"granulie","accusative-definite-nominative":"granulia","dative-genitive-indefinite":"granulii","dative-definite-genitive":"granuliei","vocative":"granulie"}},{"word":"granulit","pos":"noun","definitions":["granulite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granulit","accusative-definite-nominative-singular":"granulitul","accusative-indefinite-nominative-plural":"granulite","accusative-definite-nominative-plural":"granulitele","dative-genitive-indefinite-singular":"granulit","dative-definite-genitive-singular":"granulitului","dative-genitive-indefinite-plural":"granulite","dative-definite-genitive-plural":"granulitelor","singular-vocative":"granulitule","plural-vocative":"granulitelor"}},{"word":"granulocit","pos":"noun","definitions":["granulocyte"],"forms":{"plural":"granulocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granulocit","accusative-definite-nominative-singular":"granulocitul","accusative-indefinite-nominative-plural":"granulocite","accusative-definite-nominative-plural":"granulocitele","dative-genitive-indefinite-singular":"granulocit","dative-definite-genitive-singular":"granulocitului","dative-genitive-indefinite-plural":"granulocite","dative-definite-genitive-plural":"granulocitelor","singular-vocative":"granulocitule","plural-vocative":"granulocitelor"}},{"word":"granulocitopenie","pos":"noun","definitions":["granulocytopenia"],"forms":{"plural":"granulocitopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"granulocitopenie","accusative-definite-nominative-singular":"granulocitopenia","accusative-indefinite-nominative-plural":"granulocitopenii","accusative-definite-nominative-plural":"granulocitopeniile","dative-genitive-indefinite-singular":"granulocitopenii","dative-definite-genitive-singular":"granulocitopeniei","dative-genitive-indefinite-plural":"granulocitopenii","dative-definite-genitive-plural":"granulocitopeniilor","singular-vocative":"granulocitopenie","plural-vocative":"granulocitopeniilor"}},{"word":"granulocitoză","pos":"noun","definitions":["granulocytosis"],"forms":{"plural":"granulocitoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"granulocitoză","accusative-definite-nominative-singular":"granulocitoza","accusative-indefinite-nominative-plural":"granulocitoze","accusative-definite-nominative-plural":"granulocitozele","dative-genitive-indefinite-singular":"granulocitoze","dative-definite-genitive-singular":"granulocitozei","dative-genitive-indefinite-plural":"granulocitoze","dative-definite-genitive-plural":"granulocitozelor","singular-vocative":"granulocitoză","plural-vocative":"granulocitozelor"}},{"word":"granulom","pos":"noun","definitions":["granuloma"],"forms":{"plural":"granuloame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"granulom","accusative-definite-nominative-singular":"granulomul","accusative-indefinite-nominative-plural":"granuloame","accusative-definite-nominative-plural":"granuloamele","dative-genitive-indefinite-singular":"granulom","dative-definite-genitive-singular":"granulomului","dative-genitive-indefinite-plural":"granuloame","dative-definite-genitive-plural":"granuloamelor","singular-vocative":"granulomule","plural-vocative":"granuloamelor"}},{"word":"granulomatos","pos":"adj","definitions":["granulomatous"],"forms":{"feminine-singular":"granulomatoasă","masculine-plural":"granulomatoși","feminine-neuter-plural":"granulomatoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granulomatos","error-unrecognized-form-feminine-indefinite-singular":"granulomatoasă","error-unrecognized-form-indefinite-masculine-plural":"granulomatoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"granulomatoase","definite-error-unrecognized-form-masculine-neuter-singular":"granulomatosul","definite-error-unrecognized-form-feminine-singular":"granulomatoasa","definite-error-unrecognized-form-masculine-plural":"granulomatoșii","definite-error-unrecognized-form-feminine-neuter-plural":"granulomatoasele"}},{"word":"granulometric","pos":"adj","definitions":["granulometric"],"forms":{"feminine-singular":"granulometrică","masculine-plural":"granulometrici","feminine-neuter-plural":"granulometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granulometric","error-unrecognized-form-feminine-indefinite-singular":"granulometrică","error-unrecognized-form-indefinite-masculine-plural":"granulometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"granulometrice","definite-error-unrecognized-form-masculine-neuter-singular":"granulometricul","definite-error-unrecognized-form-feminine-singular":"granulometrica","definite-error-unrecognized-form-masculine-plural":"granulometricii","definite-error-unrecognized-form-feminine-neuter-plural":"granulometricele"}},{"word":"granulometrie","pos":"noun","definitions":["granulometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"granulometrie","accusative-definite-nominative":"granulometria","dative-genitive-indefinite":"granulometrii","dative-definite-genitive":"granulometriei","vocative":"granulometrie"}},{"word":"granulopenie","pos":"noun","definitions":["granulopenia"],"forms":{"plural":"granulopenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"granulopenie","accusative-definite-nominative-singular":"granulopenia","accusative-indefinite-nominative-plural":"granulopenii","accusative-definite-nominative-plural":"granulopeniile","dative-genitive-indefinite-singular":"granulopenii","dative-definite-genitive-singular":"granulopeniei","dative-genitive-indefinite-plural":"granulopenii","dative-definite-genitive-plural":"granulopeniilor","singular-vocative":"granulopenie","plural-vocative":"granulopeniilor"}},{"word":"granulos","pos":"adj","definitions":["granulous"],"forms":{"feminine-singular":"granuloasă","masculine-plural":"granuloși","feminine-neuter-plural":"granuloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"granulos","error-unrecognized-form-feminine-indefinite-singular":"granuloasă","error-unrecognized-form-indefinite-masculine-plural":"granuloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"granuloase","definite-error-unrecognized-form-masculine-neuter-singular":"granulosul","definite-error-unrecognized-form-feminine-singular":"granuloasa","definite-error-unrecognized-form-masculine-plural":"granuloșii","definite-error-unrecognized-form-feminine-neuter-plural":"granuloasele"}},{"word":"granulozitate","pos":"noun","definitions":["granulosity"],"forms":{"plural":"granulozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"granulozitate","accusative-definite-nominative-singular":"granulozitatea","accusative-indefinite-nominative-plural":"granulozități","accusative-definite-nominative-plural":"granulozitățile","dative-genitive-indefinite-singular":"granulozități","dative-definite-genitive-singular":"granulozității","dative-genitive-indefinite-plural":"granulozități","dative-definite-genitive-plural":"granulozităților","singular-vocative":"granulozitate","plural-vocative":"granulozităților"}},{"word":"grapa","pos":"noun","definitions":["definite nominative/accusative singular of grapă"],"pronunciation":"[ˈɡrapa]","gender":"f"},{"word":"Grapă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grapă"}},{"word":"grapă","pos":"noun","definitions":["harrow"],"forms":{"plural":"grape","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grapă","accusative-definite-nominative-singular":"grapa","accusative-indefinite-nominative-plural":"grape","accusative-definite-nominative-plural":"grapele","dative-genitive-indefinite-singular":"grape","dative-definite-genitive-singular":"grapei","dative-genitive-indefinite-plural":"grape","dative-definite-genitive-plural":"grapelor","singular-vocative":"grapă","plural-vocative":"grapelor"}},{"word":"grăpa","pos":"verb","definitions":["to harrow"],"forms":{"canonical":"a grăpa 1st conjugation","present-singular-third-person":"grăpează","participle-past":"grăpat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grăpa","gerund":"grăpând","first-person-indicative-present-singular":"grăpez","indicative-present-second-person-singular":"grăpezi","indicative-present-singular-third-person":"grăpează","first-person-indicative-plural-present":"grăpăm","indicative-plural-present-second-person":"grăpați","indicative-plural-present-third-person":"grăpează","first-person-imperfect-indicative-singular":"grăpam","imperfect-indicative-second-person-singular":"grăpai","imperfect-indicative-singular-third-person":"grăpa","first-person-imperfect-indicative-plural":"grăpam","imperfect-indicative-plural-second-person":"grăpați","imperfect-indicative-plural-third-person":"grăpau","first-person-indicative-perfect-singular":"grăpai","indicative-perfect-second-person-singular":"grăpași","indicative-perfect-singular-third-person":"grăpă","first-person-indicative-perfect-plural":"grăparăm","indicative-perfect-plural-second-person":"grăparăți","indicative-perfect-plural-third-person":"grăpară","first-person-indicative-pluperfect-singular":"grăpasem","indicative-pluperfect-second-person-singular":"grăpaseși","indicative-pluperfect-singular-third-person":"grăpase","first-person-indicative-pluperfect-plural":"grăpaserăm","indicative-pluperfect-plural-second-person":"grăpaserăți","indicative-pluperfect-plural-third-person":"grăpaseră","first-person-present-singular-subjunctive":"să grăpez","present-second-person-singular-subjunctive":"să grăpezi","present-singular-subjunctive-third-person":"să grăpeze","first-person-plural-present-subjunctive":"să grăpăm","plural-present-second-person-subjunctive":"să grăpați","plural-present-subjunctive-third-person":"să grăpeze","imperative-second-person-singular":"grăpează","imperative-plural-second-person":"grăpați","imperative-negative-second-person-singular":"nu grăpa","imperative-negative-plural-second-person":"nu grăpați"}},{"word":"grăpat","pos":"adj","definitions":["harrowed"],"forms":{"feminine-singular":"grăpată","masculine-plural":"grăpați","feminine-neuter-plural":"grăpate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăpat","error-unrecognized-form-feminine-indefinite-singular":"grăpată","error-unrecognized-form-indefinite-masculine-plural":"grăpați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăpate","definite-error-unrecognized-form-masculine-neuter-singular":"grăpatul","definite-error-unrecognized-form-feminine-singular":"grăpata","definite-error-unrecognized-form-masculine-plural":"grăpații","definite-error-unrecognized-form-feminine-neuter-plural":"grăpatele"}},{"word":"grăpat","pos":"verb","definitions":["past participle of grăpa"],"forms":{"participle-past":"of grăpa"}},{"word":"grăpătoare","pos":"noun","definitions":["cemetery"],"forms":{"plural":"grăpători","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grăpătoare","accusative-definite-nominative-singular":"grăpătoarea","accusative-indefinite-nominative-plural":"grăpători","accusative-definite-nominative-plural":"grăpătorile","dative-genitive-indefinite-singular":"grăpători","dative-definite-genitive-singular":"grăpătorii","dative-genitive-indefinite-plural":"grăpători","dative-definite-genitive-plural":"grăpătorilor","singular-vocative":"grăpătoare","plural-vocative":"grăpătorilor"}},{"word":"grape","pos":"noun","definitions":["inflection of grapă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡrape]","gender":"f-p"},{"word":"grapină","pos":"noun","definitions":["grappling hook"],"forms":{"plural":"grapine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grapină","accusative-definite-nominative-singular":"grapina","accusative-indefinite-nominative-plural":"grapine","accusative-definite-nominative-plural":"grapinele","dative-genitive-indefinite-singular":"grapine","dative-definite-genitive-singular":"grapinei","dative-genitive-indefinite-plural":"grapine","dative-definite-genitive-plural":"grapinelor","singular-vocative":"grapină","plural-vocative":"grapinelor"}},{"word":"Grapini","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grapini"}},{"word":"Grăpinoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grăpinoiu"}},{"word":"grăpiș","pos":"adv","definitions":["difficultly"]},{"word":"grapo","pos":"noun","definitions":["vocative singular of grapă"],"pronunciation":"[ˈɡrapo]","gender":"f"},{"word":"graptolit","pos":"noun","definitions":["graptolite"],"forms":{"plural":"graptoliți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"graptolit","accusative-definite-nominative-singular":"graptolitul","accusative-indefinite-nominative-plural":"graptoliți","accusative-definite-nominative-plural":"graptoliții","dative-genitive-indefinite-singular":"graptolit","dative-definite-genitive-singular":"graptolitului","dative-genitive-indefinite-plural":"graptoliți","dative-definite-genitive-plural":"graptoliților","singular-vocative":"graptolitule","plural-vocative":"graptoliților"}},{"word":"gras","pos":"adj","definitions":["fat"],"pronunciation":"/ˈɡras/","forms":{"feminine-singular":"grasă","masculine-plural":"grași","feminine-neuter-plural":"grase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gras","error-unrecognized-form-feminine-indefinite-singular":"grasă","error-unrecognized-form-indefinite-masculine-plural":"grași","error-unrecognized-form-feminine-indefinite-neuter-plural":"grase","definite-error-unrecognized-form-masculine-neuter-singular":"grasul","definite-error-unrecognized-form-feminine-singular":"grasa","definite-error-unrecognized-form-masculine-plural":"grașii","definite-error-unrecognized-form-feminine-neuter-plural":"grasele"}},{"word":"grasă","pos":"noun","definitions":["female equivalent of gras"],"forms":{"plural":"grase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grasă","accusative-definite-nominative-singular":"grasa","accusative-indefinite-nominative-plural":"grase","accusative-definite-nominative-plural":"grasele","dative-genitive-indefinite-singular":"grase","dative-definite-genitive-singular":"grasei","dative-genitive-indefinite-plural":"grase","dative-definite-genitive-plural":"graselor","singular-vocative":"grasă","plural-vocative":"graselor"}},{"word":"grăsan","pos":"noun","definitions":["augmentative of gras"],"forms":{"plural":"grăsani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăsan","accusative-definite-nominative-singular":"grăsanul","accusative-indefinite-nominative-plural":"grăsani","accusative-definite-nominative-plural":"grăsanii","dative-genitive-indefinite-singular":"grăsan","dative-definite-genitive-singular":"grăsanului","dative-genitive-indefinite-plural":"grăsani","dative-definite-genitive-plural":"grăsanilor","singular-vocative":"grăsanule","plural-vocative":"grăsanilor"}},{"word":"grăscean","pos":"noun","definitions":["diminutive of gras"],"forms":{"plural":"grăsceni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăscean","accusative-definite-nominative-singular":"grăsceanul","accusative-indefinite-nominative-plural":"grăsceni","accusative-definite-nominative-plural":"grăscenii","dative-genitive-indefinite-singular":"grăscean","dative-definite-genitive-singular":"grăsceanului","dative-genitive-indefinite-plural":"grăsceni","dative-definite-genitive-plural":"grăscenilor","singular-vocative":"grăsceanule","plural-vocative":"grăscenilor"}},{"word":"grăscior","pos":"adj","definitions":["diminutive of gras"],"forms":{"feminine-singular":"grăscioră","masculine-plural":"grăsciori","feminine-neuter-plural":"grăsciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăscior","error-unrecognized-form-feminine-indefinite-singular":"grăscioră","error-unrecognized-form-indefinite-masculine-plural":"grăsciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsciore","definite-error-unrecognized-form-masculine-neuter-singular":"grăsciorul","definite-error-unrecognized-form-feminine-singular":"grăsciora","definite-error-unrecognized-form-masculine-plural":"grăsciorii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsciorele"}},{"word":"graseia","pos":"verb","definitions":["to pronounce uvularly"],"forms":{"canonical":"a graseia 1st conjugation","present-singular-third-person":"graseiează","participle-past":"graseiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a graseia","gerund":"graseind","first-person-indicative-present-singular":"graseiez","indicative-present-second-person-singular":"graseiezi","indicative-present-singular-third-person":"graseiază","first-person-indicative-plural-present":"graseiem","indicative-plural-present-second-person":"graseiați","indicative-plural-present-third-person":"graseiază","first-person-imperfect-indicative-singular":"graseiam","imperfect-indicative-second-person-singular":"graseiai","imperfect-indicative-singular-third-person":"graseia","first-person-imperfect-indicative-plural":"graseiam","imperfect-indicative-plural-second-person":"graseiați","imperfect-indicative-plural-third-person":"graseiau","first-person-indicative-perfect-singular":"graseiai","indicative-perfect-second-person-singular":"graseiași","indicative-perfect-singular-third-person":"graseie","first-person-indicative-perfect-plural":"graseiarăm","indicative-perfect-plural-second-person":"graseiarăți","indicative-perfect-plural-third-person":"graseiară","first-person-indicative-pluperfect-singular":"graseiasem","indicative-pluperfect-second-person-singular":"graseiaseși","indicative-pluperfect-singular-third-person":"graseiase","first-person-indicative-pluperfect-plural":"graseiaserăm","indicative-pluperfect-plural-second-person":"graseiaserăți","indicative-pluperfect-plural-third-person":"graseiaseră","first-person-present-singular-subjunctive":"să graseiez","present-second-person-singular-subjunctive":"să graseiezi","present-singular-subjunctive-third-person":"să graseieze","first-person-plural-present-subjunctive":"să graseiem","plural-present-second-person-subjunctive":"să graseiați","plural-present-subjunctive-third-person":"să graseieze","imperative-second-person-singular":"graseiază","imperative-plural-second-person":"graseiați","imperative-negative-second-person-singular":"nu graseia","imperative-negative-plural-second-person":"nu graseiați"}},{"word":"Grăseni","pos":"name","definitions":["a village in Todirești, Ungheni Raion, Moldova"],"gender":"m"},{"word":"Grași","pos":"name","definitions":["a village in Neamț County, Romania. Renamed to Dumbrava in 1964."],"gender":"m"},{"word":"grăsime","pos":"noun","definitions":["fat","grease","fatness"],"pronunciation":"/ɡrəˈsi.me/","forms":{"plural":"grăsimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grăsime","accusative-definite-nominative-singular":"grăsimea","accusative-indefinite-nominative-plural":"grăsimi","accusative-definite-nominative-plural":"grăsimile","dative-genitive-indefinite-singular":"grăsimi","dative-definite-genitive-singular":"grăsimii","dative-genitive-indefinite-plural":"grăsimi","dative-definite-genitive-plural":"grăsimilor","singular-vocative":"grăsime","plural-vocative":"grăsimilor"}},{"word":"grăsos","pos":"adj","definitions":["adipose, fatty"],"forms":{"feminine-singular":"grăsoasă","masculine-plural":"grăsoși","feminine-neuter-plural":"grăsoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsos","error-unrecognized-form-feminine-indefinite-singular":"grăsoasă","error-unrecognized-form-indefinite-masculine-plural":"grăsoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsoase","definite-error-unrecognized-form-masculine-neuter-singular":"grăsosul","definite-error-unrecognized-form-feminine-singular":"grăsoasa","definite-error-unrecognized-form-masculine-plural":"grăsoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsoasele"}},{"word":"Grasu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grasu"}},{"word":"grăsuc","pos":"adj","definitions":["diminutive of gras"],"forms":{"feminine-singular":"grăsucă","masculine-plural":"grăsuci","feminine-neuter-plural":"grăsuce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsuc","error-unrecognized-form-feminine-indefinite-singular":"grăsucă","error-unrecognized-form-indefinite-masculine-plural":"grăsuci","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsuce","definite-error-unrecognized-form-masculine-neuter-singular":"grăsucul","definite-error-unrecognized-form-feminine-singular":"grăsuca","definite-error-unrecognized-form-masculine-plural":"grăsucii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsucele"}},{"word":"grăsulean","pos":"adj","definitions":["diminutive of gras"],"forms":{"feminine-singular":"grăsuleană","masculine-plural":"grăsuleni","feminine-neuter-plural":"grăsulene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsulean","error-unrecognized-form-feminine-indefinite-singular":"grăsuleană","error-unrecognized-form-indefinite-masculine-plural":"grăsuleni","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsulene","definite-error-unrecognized-form-masculine-neuter-singular":"grăsuleanul","definite-error-unrecognized-form-feminine-singular":"grăsuleana","definite-error-unrecognized-form-masculine-plural":"grăsulenii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsulenele"}},{"word":"grăsuleț","pos":"adj","definitions":["diminutive of gras"],"forms":{"feminine-singular":"grăsuleață","masculine-plural":"grăsuleți","feminine-neuter-plural":"grăsulețe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsuleț","error-unrecognized-form-feminine-indefinite-singular":"grăsuleață","error-unrecognized-form-indefinite-masculine-plural":"grăsuleți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsulețe","definite-error-unrecognized-form-masculine-neuter-singular":"grăsulețul","definite-error-unrecognized-form-feminine-singular":"grăsuleața","definite-error-unrecognized-form-masculine-plural":"grăsuleții","definite-error-unrecognized-form-feminine-neuter-plural":"grăsulețele"}},{"word":"grăsuliu","pos":"adj","definitions":["fatty"],"forms":{"feminine-singular":"grăsulie","plural":"grăsulii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsuliu","error-unrecognized-form-feminine-indefinite-singular":"grăsulie","error-unrecognized-form-indefinite-masculine-plural":"grăsulii","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsulii","definite-error-unrecognized-form-masculine-neuter-singular":"grăsuliul","definite-error-unrecognized-form-feminine-singular":"grăsulia","definite-error-unrecognized-form-masculine-plural":"grăsuliii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsuliile"}},{"word":"Grăsun","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grăsun"}},{"word":"grăsun","pos":"adj","definitions":["chubby"],"pronunciation":"/ɡrəˈsun/","forms":{"feminine-singular":"grăsună","masculine-plural":"grăsuni","feminine-neuter-plural":"grăsune","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsun","error-unrecognized-form-feminine-indefinite-singular":"grăsună","error-unrecognized-form-indefinite-masculine-plural":"grăsuni","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsune","definite-error-unrecognized-form-masculine-neuter-singular":"grăsunul","definite-error-unrecognized-form-feminine-singular":"grăsuna","definite-error-unrecognized-form-masculine-plural":"grăsunii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsunele"}},{"word":"grăsun","pos":"noun","definitions":["piglet, gruntling, young pig (especially one still suckling)"],"pronunciation":"/ɡrəˈsun/","forms":{"plural":"grăsuni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăsun","accusative-definite-nominative-singular":"grăsunul","accusative-indefinite-nominative-plural":"grăsuni","accusative-definite-nominative-plural":"grăsunii","dative-genitive-indefinite-singular":"grăsun","dative-definite-genitive-singular":"grăsunului","dative-genitive-indefinite-plural":"grăsuni","dative-definite-genitive-plural":"grăsunilor","singular-vocative":"grăsunule","plural-vocative":"grăsunilor"}},{"word":"grăsună","pos":"noun","definitions":["female equivalent of grăsun"],"forms":{"plural":"grăsune","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grăsună","accusative-definite-nominative-singular":"grăsuna","accusative-indefinite-nominative-plural":"grăsune","accusative-definite-nominative-plural":"grăsunele","dative-genitive-indefinite-singular":"grăsune","dative-definite-genitive-singular":"grăsunei","dative-genitive-indefinite-plural":"grăsune","dative-definite-genitive-plural":"grăsunelor","singular-vocative":"grăsună","plural-vocative":"grăsunelor"}},{"word":"grăsunel","pos":"adj","definitions":["diminutive of grăsun"],"forms":{"feminine-singular":"grăsunelă","masculine-plural":"grăsuneli","feminine-neuter-plural":"grăsunele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsunel","error-unrecognized-form-feminine-indefinite-singular":"grăsunelă","error-unrecognized-form-indefinite-masculine-plural":"grăsuneli","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsunele","definite-error-unrecognized-form-masculine-neuter-singular":"grăsunelul","definite-error-unrecognized-form-feminine-singular":"grăsunela","definite-error-unrecognized-form-masculine-plural":"grăsunelii","definite-error-unrecognized-form-feminine-neuter-plural":"grăsunelele"}},{"word":"grăsuț","pos":"adj","definitions":["doughy, chubby"],"pronunciation":"/ɡrəˈsut͡s/","forms":{"feminine-singular":"grăsuță","masculine-plural":"grăsuți","feminine-neuter-plural":"grăsuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăsuț","error-unrecognized-form-feminine-indefinite-singular":"grăsuță","error-unrecognized-form-indefinite-masculine-plural":"grăsuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăsuțe","definite-error-unrecognized-form-masculine-neuter-singular":"grăsuțul","definite-error-unrecognized-form-feminine-singular":"grăsuța","definite-error-unrecognized-form-masculine-plural":"grăsuții","definite-error-unrecognized-form-feminine-neuter-plural":"grăsuțele"}},{"word":"Grăsuțu","pos":"name","definitions":["a river in Neamț, Romania, tributary to the Grasu"],"gender":"m"},{"word":"Grătar","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Grătar"}},{"word":"grătar","pos":"noun","definitions":["grill, barbecue, gridiron","grating, grate"],"forms":{"plural":"grătare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grătar","accusative-definite-nominative-singular":"grătarul","accusative-indefinite-nominative-plural":"grătare","accusative-definite-nominative-plural":"grătarele","dative-genitive-indefinite-singular":"grătar","dative-definite-genitive-singular":"grătarului","dative-genitive-indefinite-plural":"grătare","dative-definite-genitive-plural":"grătarelor","singular-vocative":"grătarule","plural-vocative":"grătarelor"}},{"word":"grătăraș","pos":"noun","definitions":["diminutive of grătar"],"forms":{"plural":"grătărașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grătăraș","accusative-definite-nominative-singular":"grătărașul","accusative-indefinite-nominative-plural":"grătărașe","accusative-definite-nominative-plural":"grătărașele","dative-genitive-indefinite-singular":"grătăraș","dative-definite-genitive-singular":"grătărașului","dative-genitive-indefinite-plural":"grătărașe","dative-definite-genitive-plural":"grătărașelor","singular-vocative":"grătărașule","plural-vocative":"grătărașelor"}},{"word":"gratargiu","pos":"noun","definitions":["griller, barbecuer (person)"],"forms":{"plural":"gratargii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gratargiu","accusative-definite-nominative-singular":"gratargiuul","accusative-indefinite-nominative-plural":"gratargii","accusative-definite-nominative-plural":"gratargiile","dative-genitive-indefinite-singular":"gratargiu","dative-definite-genitive-singular":"gratargiuului","dative-genitive-indefinite-plural":"gratargii","dative-definite-genitive-plural":"gratargiilor","singular-vocative":"gratargiuule","plural-vocative":"gratargiilor"}},{"word":"Grăteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Grăteanu"}},{"word":"graten","pos":"noun","definitions":["gratin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"graten","accusative-definite-nominative":"gratenul","dative-genitive-indefinite":"graten","dative-definite-genitive":"gratenului","vocative":"gratenule"}},{"word":"Gratia","pos":"name","definitions":["a commune of Teleorman County, Romania","a village in Gratia, Teleorman County, Romania"],"gender":"f"},{"word":"gratia","pos":"noun","definitions":["definite nominative/accusative singular of gratie"]},{"word":"grația","pos":"verb","definitions":["to pardon"],"forms":{"canonical":"a grația 1st conjugation","present-singular-third-person":"grațiează","participle-past":"grațiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grația","gerund":"grațiind","first-person-indicative-present-singular":"grațiez","indicative-present-second-person-singular":"grațiezi","indicative-present-singular-third-person":"grațiază","first-person-indicative-plural-present":"grațiem","indicative-plural-present-second-person":"grațiați","indicative-plural-present-third-person":"grațiază","first-person-imperfect-indicative-singular":"grațiam","imperfect-indicative-second-person-singular":"grațiai","imperfect-indicative-singular-third-person":"grația","first-person-imperfect-indicative-plural":"grațiam","imperfect-indicative-plural-second-person":"grațiați","imperfect-indicative-plural-third-person":"grațiau","first-person-indicative-perfect-singular":"grațiai","indicative-perfect-second-person-singular":"grațiași","indicative-perfect-singular-third-person":"grație","first-person-indicative-perfect-plural":"grațiarăm","indicative-perfect-plural-second-person":"grațiarăți","indicative-perfect-plural-third-person":"grațiară","first-person-indicative-pluperfect-singular":"grațiasem","indicative-pluperfect-second-person-singular":"grațiaseși","indicative-pluperfect-singular-third-person":"grațiase","first-person-indicative-pluperfect-plural":"grațiaserăm","indicative-pluperfect-plural-second-person":"grațiaserăți","indicative-pluperfect-plural-third-person":"grațiaseră","first-person-present-singular-subjunctive":"să grațiez","present-second-person-singular-subjunctive":"să grațiezi","present-singular-subjunctive-third-person":"să grațieze","first-person-plural-present-subjunctive":"să grațiem","plural-present-second-person-subjunctive":"să grațiați","plural-present-subjunctive-third-person":"să grațieze","imperative-second-person-singular":"grațiază","imperative-plural-second-person":"grațiați","imperative-negative-second-person-singular":"nu grația","imperative-negative-plural-second-person":"nu grațiați"}},{"word":"grațiat","pos":"adj","definitions":["pardoned"],"forms":{"feminine-singular":"grațiată","masculine-plural":"grațiați","feminine-neuter-plural":"grațiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grațiat","error-unrecognized-form-feminine-indefinite-singular":"grațiată","error-unrecognized-form-indefinite-masculine-plural":"grațiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grațiate","definite-error-unrecognized-form-masculine-neuter-singular":"grațiatul","definite-error-unrecognized-form-feminine-singular":"grațiata","definite-error-unrecognized-form-masculine-plural":"grațiații","definite-error-unrecognized-form-feminine-neuter-plural":"grațiatele"}},{"word":"grațiat","pos":"verb","definitions":["past participle of grația"],"forms":{"participle-past":"of grația"}},{"word":"gratie","pos":"noun","definitions":["bar on a window or doorway that forms part of a screen, grill or grating when aligned horizontally and vertically","gridiron (instrument of torture)"],"pronunciation":"/ˈɡra.ti.e/","forms":{"plural":"gratii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gratie","accusative-definite-nominative-singular":"gratia","accusative-indefinite-nominative-plural":"gratii","accusative-definite-nominative-plural":"gratiile","dative-genitive-indefinite-singular":"gratii","dative-definite-genitive-singular":"gratiei","dative-genitive-indefinite-plural":"gratii","dative-definite-genitive-plural":"gratiilor","singular-vocative":"gratie","plural-vocative":"gratiilor"}},{"word":"grație","pos":"noun","definitions":["grace (elegance)","grace (favour)","synonym of grațiere (“pardon”)","synonym of har (“grace”)"],"pronunciation":"/ˈɡra.t͡si.e/","examples":[{"ro":"în grațiile cuiva","en":"in someone’s graces"}],"forms":{"plural":"grații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grație","accusative-definite-nominative-singular":"grația","accusative-indefinite-nominative-plural":"grații","accusative-definite-nominative-plural":"grațiile","dative-genitive-indefinite-singular":"grații","dative-definite-genitive-singular":"grației","dative-genitive-indefinite-plural":"grații","dative-definite-genitive-plural":"grațiilor","singular-vocative":"grație","plural-vocative":"grațiilor"}},{"word":"grație","pos":"prep","definitions":["thanks to, because of"],"pronunciation":"/ˈɡra.t͡si.e/","examples":[{"ro":"Grație prietenului tău, putem să stăm până mâine.","en":"Thanks to your friend, we can stay until tomorrow."}]},{"word":"grațiere","pos":"noun","definitions":["pardon"],"forms":{"plural":"grațieri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grațiere","accusative-definite-nominative-singular":"grațierea","accusative-indefinite-nominative-plural":"grațieri","accusative-definite-nominative-plural":"grațierile","dative-genitive-indefinite-singular":"grațieri","dative-definite-genitive-singular":"grațierii","dative-genitive-indefinite-plural":"grațieri","dative-definite-genitive-plural":"grațierilor","singular-vocative":"grațiere","plural-vocative":"grațierilor"}},{"word":"gratifica","pos":"verb","definitions":["to gratify"],"pronunciation":"/ɡra.ti.fiˈka/","forms":{"canonical":"a gratifica 1st conjugation","present-singular-third-person":"gratifică","participle-past":"gratificat","subjunctive-third-person":"gratifice","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gratifica","gerund":"gratificând","first-person-indicative-present-singular":"gratific","indicative-present-second-person-singular":"gratifici","indicative-present-singular-third-person":"gratifică","first-person-indicative-plural-present":"gratificăm","indicative-plural-present-second-person":"gratificați","indicative-plural-present-third-person":"gratifică","first-person-imperfect-indicative-singular":"gratificam","imperfect-indicative-second-person-singular":"gratificai","imperfect-indicative-singular-third-person":"gratifica","first-person-imperfect-indicative-plural":"gratificam","imperfect-indicative-plural-second-person":"gratificați","imperfect-indicative-plural-third-person":"gratificau","first-person-indicative-perfect-singular":"gratificai","indicative-perfect-second-person-singular":"gratificași","indicative-perfect-singular-third-person":"gratifică","first-person-indicative-perfect-plural":"gratificarăm","indicative-perfect-plural-second-person":"gratificarăți","indicative-perfect-plural-third-person":"gratificară","first-person-indicative-pluperfect-singular":"gratificasem","indicative-pluperfect-second-person-singular":"gratificaseși","indicative-pluperfect-singular-third-person":"gratificase","first-person-indicative-pluperfect-plural":"gratificaserăm","indicative-pluperfect-plural-second-person":"gratificaserăți","indicative-pluperfect-plural-third-person":"gratificaseră","first-person-present-singular-subjunctive":"să gratific","present-second-person-singular-subjunctive":"să gratifici","present-singular-subjunctive-third-person":"să gratifice","first-person-plural-present-subjunctive":"să gratificăm","plural-present-second-person-subjunctive":"să gratificați","plural-present-subjunctive-third-person":"să gratifice","imperative-second-person-singular":"gratifică","imperative-plural-second-person":"gratificați","imperative-negative-second-person-singular":"nu gratifica","imperative-negative-plural-second-person":"nu gratificați"}},{"word":"gratificare","pos":"noun","definitions":["gratification"],"forms":{"plural":"gratificări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gratificare","accusative-definite-nominative-singular":"gratificarea","accusative-indefinite-nominative-plural":"gratificări","accusative-definite-nominative-plural":"gratificările","dative-genitive-indefinite-singular":"gratificări","dative-definite-genitive-singular":"gratificării","dative-genitive-indefinite-plural":"gratificări","dative-definite-genitive-plural":"gratificărilor","singular-vocative":"gratificare","plural-vocative":"gratificărilor"}},{"word":"gratificat","pos":"adj","definitions":["gratified"],"forms":{"feminine-singular":"gratificată","masculine-plural":"gratificați","feminine-neuter-plural":"gratificate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gratificat","error-unrecognized-form-feminine-indefinite-singular":"gratificată","error-unrecognized-form-indefinite-masculine-plural":"gratificați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gratificate","definite-error-unrecognized-form-masculine-neuter-singular":"gratificatul","definite-error-unrecognized-form-feminine-singular":"gratificata","definite-error-unrecognized-form-masculine-plural":"gratificații","definite-error-unrecognized-form-feminine-neuter-plural":"gratificatele"}},{"word":"gratificat","pos":"verb","definitions":["past participle of gratifica"],"forms":{"participle-past":"of gratifica"}},{"word":"gratificație","pos":"noun","definitions":["gratuity"],"forms":{"plural":"gratificații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gratificație","accusative-definite-nominative-singular":"gratificația","accusative-indefinite-nominative-plural":"gratificații","accusative-definite-nominative-plural":"gratificațiile","dative-genitive-indefinite-singular":"gratificații","dative-definite-genitive-singular":"gratificației","dative-genitive-indefinite-plural":"gratificații","dative-definite-genitive-plural":"gratificațiilor","singular-vocative":"gratificație","plural-vocative":"gratificațiilor"}},{"word":"gratificațiune","pos":"noun","definitions":["obsolete form of gratificație"],"forms":{"plural":"gratificațiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gratificațiune","accusative-definite-nominative-singular":"gratificațiunea","accusative-indefinite-nominative-plural":"gratificațiuni","accusative-definite-nominative-plural":"gratificațiunile","dative-genitive-indefinite-singular":"gratificațiuni","dative-definite-genitive-singular":"gratificațiunii","dative-genitive-indefinite-plural":"gratificațiuni","dative-definite-genitive-plural":"gratificațiunilor","singular-vocative":"gratificațiune","plural-vocative":"gratificațiunilor"}},{"word":"gratina","pos":"verb","definitions":["to grill; to brown"],"forms":{"canonical":"a gratina 1st conjugation","present-singular-third-person":"gratinează","participle-past":"gratinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gratina","gerund":"gratinând","first-person-indicative-present-singular":"gratinez","indicative-present-second-person-singular":"gratinezi","indicative-present-singular-third-person":"gratinează","first-person-indicative-plural-present":"gratinăm","indicative-plural-present-second-person":"gratinați","indicative-plural-present-third-person":"gratinează","first-person-imperfect-indicative-singular":"gratinam","imperfect-indicative-second-person-singular":"gratinai","imperfect-indicative-singular-third-person":"gratina","first-person-imperfect-indicative-plural":"gratinam","imperfect-indicative-plural-second-person":"gratinați","imperfect-indicative-plural-third-person":"gratinau","first-person-indicative-perfect-singular":"gratinai","indicative-perfect-second-person-singular":"gratinași","indicative-perfect-singular-third-person":"gratină","first-person-indicative-perfect-plural":"gratinarăm","indicative-perfect-plural-second-person":"gratinarăți","indicative-perfect-plural-third-person":"gratinară","first-person-indicative-pluperfect-singular":"gratinasem","indicative-pluperfect-second-person-singular":"gratinaseși","indicative-pluperfect-singular-third-person":"gratinase","first-person-indicative-pluperfect-plural":"gratinaserăm","indicative-pluperfect-plural-second-person":"gratinaserăți","indicative-pluperfect-plural-third-person":"gratinaseră","first-person-present-singular-subjunctive":"să gratinez","present-second-person-singular-subjunctive":"să gratinezi","present-singular-subjunctive-third-person":"să gratineze","first-person-plural-present-subjunctive":"să gratinăm","plural-present-second-person-subjunctive":"să gratinați","plural-present-subjunctive-third-person":"să gratineze","imperative-second-person-singular":"gratinează","imperative-plural-second-person":"gratinați","imperative-negative-second-person-singular":"nu gratina","imperative-negative-plural-second-person":"nu gratinați"}},{"word":"grătioară","pos":"noun","definitions":["diminutive of gratie"],"forms":{"plural":"grătioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grătioară","accusative-definite-nominative-singular":"grătioara","accusative-indefinite-nominative-plural":"grătioare","accusative-definite-nominative-plural":"grătioarele","dative-genitive-indefinite-singular":"grătioare","dative-definite-genitive-singular":"grătioarei","dative-genitive-indefinite-plural":"grătioare","dative-definite-genitive-plural":"grătioarelor","singular-vocative":"grătioară","plural-vocative":"grătioarelor"}},{"word":"grațios","pos":"adj","definitions":["graceful"],"forms":{"feminine-singular":"grațioasă","masculine-plural":"grațioși","feminine-neuter-plural":"grațioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grațios","error-unrecognized-form-feminine-indefinite-singular":"grațioasă","error-unrecognized-form-indefinite-masculine-plural":"grațioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grațioase","definite-error-unrecognized-form-masculine-neuter-singular":"grațiosul","definite-error-unrecognized-form-feminine-singular":"grațioasa","definite-error-unrecognized-form-masculine-plural":"grațioșii","definite-error-unrecognized-form-feminine-neuter-plural":"grațioasele"}},{"word":"grațiozitate","pos":"noun","definitions":["graciousness"],"forms":{"plural":"grațiozități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grațiozitate","accusative-definite-nominative-singular":"grațiozitatea","accusative-indefinite-nominative-plural":"grațiozități","accusative-definite-nominative-plural":"grațiozitățile","dative-genitive-indefinite-singular":"grațiozități","dative-definite-genitive-singular":"grațiozității","dative-genitive-indefinite-plural":"grațiozități","dative-definite-genitive-plural":"grațiozităților","singular-vocative":"grațiozitate","plural-vocative":"grațiozităților"}},{"word":"gratis","pos":"adv","definitions":["free of charge, for free"],"pronunciation":"/ˈɡra.tis/","forms":{"alternative":"гратис"}},{"word":"gratis","pos":"adj","definitions":["free of charge, for free"],"pronunciation":"/ˈɡra.tis/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gratis","error-unrecognized-form-feminine-indefinite-singular":"gratis","error-unrecognized-form-indefinite-masculine-plural":"gratis","error-unrecognized-form-feminine-indefinite-neuter-plural":"gratis","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-","alternative":"гратис"}},{"word":"gratitudine","pos":"noun","definitions":["gratitude, gratefulness"],"forms":{"plural":"gratitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gratitudine","accusative-definite-nominative-singular":"gratitudinea","accusative-indefinite-nominative-plural":"gratitudini","accusative-definite-nominative-plural":"gratitudinile","dative-genitive-indefinite-singular":"gratitudini","dative-definite-genitive-singular":"gratitudinii","dative-genitive-indefinite-plural":"gratitudini","dative-definite-genitive-plural":"gratitudinilor","singular-vocative":"gratitudine","plural-vocative":"gratitudinilor"}},{"word":"gratuit","pos":"adj","definitions":["free, without payment (which costs nothing, which is given or received without any payment)","useless (which proves unnecessary)","baseless, unfounded (unsupported by evidence or facts)"],"pronunciation":"/ɡra.tuˈit/","forms":{"feminine-singular":"gratuită","masculine-plural":"gratuiți","feminine-neuter-plural":"gratuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gratuit","error-unrecognized-form-feminine-indefinite-singular":"gratuită","error-unrecognized-form-indefinite-masculine-plural":"gratuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gratuite","definite-error-unrecognized-form-masculine-neuter-singular":"gratuitul","definite-error-unrecognized-form-feminine-singular":"gratuita","definite-error-unrecognized-form-masculine-plural":"gratuiții","definite-error-unrecognized-form-feminine-neuter-plural":"gratuitele","alternative":"гратуит"}},{"word":"gratuitate","pos":"noun","definitions":["gratuity, freebie"],"forms":{"plural":"gratuități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gratuitate","accusative-definite-nominative-singular":"gratuitatea","accusative-indefinite-nominative-plural":"gratuități","accusative-definite-nominative-plural":"gratuitățile","dative-genitive-indefinite-singular":"gratuități","dative-definite-genitive-singular":"gratuității","dative-genitive-indefinite-plural":"gratuități","dative-definite-genitive-plural":"gratuităților","singular-vocative":"gratuitate","plural-vocative":"gratuităților"}},{"word":"gratula","pos":"verb","definitions":["to congratulate"],"forms":{"canonical":"a gratula 1st conjugation","present-singular-third-person":"gratulează","participle-past":"gratulat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gratula","gerund":"gratulând","first-person-indicative-present-singular":"gratulez","indicative-present-second-person-singular":"gratulezi","indicative-present-singular-third-person":"gratulează","first-person-indicative-plural-present":"gratulăm","indicative-plural-present-second-person":"gratulați","indicative-plural-present-third-person":"gratulează","first-person-imperfect-indicative-singular":"gratulam","imperfect-indicative-second-person-singular":"gratulai","imperfect-indicative-singular-third-person":"gratula","first-person-imperfect-indicative-plural":"gratulam","imperfect-indicative-plural-second-person":"gratulați","imperfect-indicative-plural-third-person":"gratulau","first-person-indicative-perfect-singular":"gratulai","indicative-perfect-second-person-singular":"gratulași","indicative-perfect-singular-third-person":"gratulă","first-person-indicative-perfect-plural":"gratularăm","indicative-perfect-plural-second-person":"gratularăți","indicative-perfect-plural-third-person":"gratulară","first-person-indicative-pluperfect-singular":"gratulasem","indicative-pluperfect-second-person-singular":"gratulaseși","indicative-pluperfect-singular-third-person":"gratulase","first-person-indicative-pluperfect-plural":"gratulaserăm","indicative-pluperfect-plural-second-person":"gratulaserăți","indicative-pluperfect-plural-third-person":"gratulaseră","first-person-present-singular-subjunctive":"să gratulez","present-second-person-singular-subjunctive":"să gratulezi","present-singular-subjunctive-third-person":"să gratuleze","first-person-plural-present-subjunctive":"să gratulăm","plural-present-second-person-subjunctive":"să gratulați","plural-present-subjunctive-third-person":"să gratuleze","imperative-second-person-singular":"gratulează","imperative-plural-second-person":"gratulați","imperative-negative-second-person-singular":"nu gratula","imperative-negative-plural-second-person":"nu gratulați"}},{"word":"gratulare","pos":"noun","definitions":["congratulation"],"forms":{"plural":"gratulări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gratulare","accusative-definite-nominative-singular":"gratularea","accusative-indefinite-nominative-plural":"gratulări","accusative-definite-nominative-plural":"gratulările","dative-genitive-indefinite-singular":"gratulări","dative-definite-genitive-singular":"gratulării","dative-genitive-indefinite-plural":"gratulări","dative-definite-genitive-plural":"gratulărilor","singular-vocative":"gratulare","plural-vocative":"gratulărilor"}},{"word":"gratulație","pos":"noun","definitions":["congratulations"],"forms":{"plural":"gratulații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gratulație","accusative-definite-nominative-singular":"gratulația","accusative-indefinite-nominative-plural":"gratulații","accusative-definite-nominative-plural":"gratulațiile","dative-genitive-indefinite-singular":"gratulații","dative-definite-genitive-singular":"gratulației","dative-genitive-indefinite-plural":"gratulații","dative-definite-genitive-plural":"gratulațiilor","singular-vocative":"gratulație","plural-vocative":"gratulațiilor"}},{"word":"Grâu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grâu"}},{"word":"grâu","pos":"noun","definitions":["wheat","grain, cereal, corn"],"pronunciation":"/ɡrɨw/","forms":{"plural":"grâne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grâu","accusative-definite-nominative-singular":"grâul","accusative-indefinite-nominative-plural":"grâne","accusative-definite-nominative-plural":"grânele","dative-genitive-indefinite-singular":"grâu","dative-definite-genitive-singular":"grâului","dative-genitive-indefinite-plural":"grâne","dative-definite-genitive-plural":"grânelor","singular-vocative":"grâule","plural-vocative":"grânelor"}},{"word":"grâuleț","pos":"noun","definitions":["diminutive of grâu; small wheat"],"forms":{"plural":"grâuleți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grâuleț","accusative-definite-nominative-singular":"grâulețul","accusative-indefinite-nominative-plural":"grâuleți","accusative-definite-nominative-plural":"grâuleții","dative-genitive-indefinite-singular":"grâuleț","dative-definite-genitive-singular":"grâulețului","dative-genitive-indefinite-plural":"grâuleți","dative-definite-genitive-plural":"grâuleților","singular-vocative":"grâulețule","plural-vocative":"grâuleților"}},{"word":"grăuncior","pos":"noun","definitions":["diminutive of grăunte; small grain"],"forms":{"plural":"grăuncioare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grăuncior","accusative-definite-nominative-singular":"grăunciorul","accusative-indefinite-nominative-plural":"grăuncioare","accusative-definite-nominative-plural":"grăuncioarele","dative-genitive-indefinite-singular":"grăuncior","dative-definite-genitive-singular":"grăunciorului","dative-genitive-indefinite-plural":"grăuncioare","dative-definite-genitive-plural":"grăuncioarelor","singular-vocative":"grăunciorule","plural-vocative":"grăuncioarelor"}},{"word":"grăunț","pos":"noun","definitions":["alternative form of grăunte"],"forms":{"plural":"grăunțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grăunț","accusative-definite-nominative-singular":"grăunțul","accusative-indefinite-nominative-plural":"grăunțe","accusative-definite-nominative-plural":"grăunțele","dative-genitive-indefinite-singular":"grăunț","dative-definite-genitive-singular":"grăunțului","dative-genitive-indefinite-plural":"grăunțe","dative-definite-genitive-plural":"grăunțelor","singular-vocative":"grăunțule","plural-vocative":"grăunțelor"}},{"word":"grăunță","pos":"noun","definitions":["alternative form of grăunte"],"forms":{"plural":"grăunțe"}},{"word":"grăunțat","pos":"adj","definitions":["grainlike"],"forms":{"feminine-singular":"grăunțată","masculine-plural":"grăunțați","feminine-neuter-plural":"grăunțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăunțat","error-unrecognized-form-feminine-indefinite-singular":"grăunțată","error-unrecognized-form-indefinite-masculine-plural":"grăunțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăunțate","definite-error-unrecognized-form-masculine-neuter-singular":"grăunțatul","definite-error-unrecognized-form-feminine-singular":"grăunțata","definite-error-unrecognized-form-masculine-plural":"grăunțații","definite-error-unrecognized-form-feminine-neuter-plural":"grăunțatele"}},{"word":"Grăunte","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grăunte"}},{"word":"grăunte","pos":"noun","definitions":["grain (harvested seeds of various grass-related food crops), corn","seed"],"forms":{"plural":"grăunți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăunte","accusative-definite-nominative-singular":"grăunteul","accusative-indefinite-nominative-plural":"grăunți","accusative-definite-nominative-plural":"grăunții","dative-genitive-indefinite-singular":"grăunte","dative-definite-genitive-singular":"grăunteului","dative-genitive-indefinite-plural":"grăunți","dative-definite-genitive-plural":"grăunților","singular-vocative":"grăunteule","plural-vocative":"grăunților","alternative":"grăunț"}},{"word":"grăunțel","pos":"noun","definitions":["diminutive of grăunte; small grain"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"grăunțel","accusative-definite-nominative":"grăunțelul","dative-genitive-indefinite":"grăunțel","dative-definite-genitive":"grăunțelului","vocative":"grăunțelule"}},{"word":"grăunțos","pos":"adj","definitions":["granular"],"forms":{"feminine-singular":"grăunțoasă","masculine-plural":"grăunțoși","feminine-neuter-plural":"grăunțoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grăunțos","error-unrecognized-form-feminine-indefinite-singular":"grăunțoasă","error-unrecognized-form-indefinite-masculine-plural":"grăunțoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grăunțoase","definite-error-unrecognized-form-masculine-neuter-singular":"grăunțosul","definite-error-unrecognized-form-feminine-singular":"grăunțoasa","definite-error-unrecognized-form-masculine-plural":"grăunțoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grăunțoasele"}},{"word":"Graur","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Graur"}},{"word":"graur","pos":"noun","definitions":["starling (bird)","grey-spotted, gray-spotted (mainly about horses)"],"pronunciation":"/ˈɡra.ur/","forms":{"plural":"grauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"graur","accusative-definite-nominative-singular":"graurul","accusative-indefinite-nominative-plural":"grauri","accusative-definite-nominative-plural":"graurii","dative-genitive-indefinite-singular":"graur","dative-definite-genitive-singular":"graurului","dative-genitive-indefinite-plural":"grauri","dative-definite-genitive-plural":"graurilor","singular-vocative":"graurule","plural-vocative":"graurilor","alternative-common":"graure"}},{"word":"grăuraș","pos":"noun","definitions":["diminutive of graur"],"forms":{"plural":"grăurași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăuraș","accusative-definite-nominative-singular":"grăurașul","accusative-indefinite-nominative-plural":"grăurași","accusative-definite-nominative-plural":"grăurașii","dative-genitive-indefinite-singular":"grăuraș","dative-definite-genitive-singular":"grăurașului","dative-genitive-indefinite-plural":"grăurași","dative-definite-genitive-plural":"grăurașilor","singular-vocative":"grăurașule","plural-vocative":"grăurașilor"}},{"word":"Graure","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Graure"}},{"word":"graure","pos":"noun","definitions":["alternative form of graur"],"forms":{"plural":"grauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m-e","accusative-indefinite-nominative-singular":"graure","accusative-definite-nominative-singular":"graurele","accusative-indefinite-nominative-plural":"grauri","accusative-definite-nominative-plural":"graurii","dative-genitive-indefinite-singular":"graure","dative-definite-genitive-singular":"graurelui","dative-genitive-indefinite-plural":"grauri","dative-definite-genitive-plural":"graurilor","singular-vocative":"graure","plural-vocative":"graurilor"}},{"word":"grăurel","pos":"noun","definitions":["diminutive of graur"],"forms":{"plural":"grăurei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grăurel","accusative-definite-nominative-singular":"grăurelul","accusative-indefinite-nominative-plural":"grăurei","accusative-definite-nominative-plural":"grăureii","dative-genitive-indefinite-singular":"grăurel","dative-definite-genitive-singular":"grăurelului","dative-genitive-indefinite-plural":"grăurei","dative-definite-genitive-plural":"grăureilor","singular-vocative":"grăurelule","plural-vocative":"grăureilor"}},{"word":"grauri","pos":"noun","definitions":["plural of graur"],"gender":"m"},{"word":"grăuriță","pos":"noun","definitions":["diminutive of graur"],"forms":{"plural":"grăurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grăuriță","accusative-definite-nominative-singular":"grăurița","accusative-indefinite-nominative-plural":"grăurițe","accusative-definite-nominative-plural":"grăurițele","dative-genitive-indefinite-singular":"grăurițe","dative-definite-genitive-singular":"grăuriței","dative-genitive-indefinite-plural":"grăurițe","dative-definite-genitive-plural":"grăurițelor","singular-vocative":"grăuriță","plural-vocative":"grăurițelor"}},{"word":"grâușor","pos":"noun","definitions":["diminutive of grâu; small wheat"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grâușor","accusative-definite-nominative-singular":"grâușorul","accusative-indefinite-nominative-plural":"-","accusative-definite-nominative-plural":"-i","dative-genitive-indefinite-singular":"grâușor","dative-definite-genitive-singular":"grâușorului","dative-genitive-indefinite-plural":"-","dative-definite-genitive-plural":"-lor","singular-vocative":"grâușorule","plural-vocative":"-lor"}},{"word":"Grâușorul","pos":"name","definitions":["a village in Vărgata, Mureș County, Romania"],"gender":"m"},{"word":"grâușorul","pos":"noun","definitions":["definite nominative/accusative singular of grâușor"]},{"word":"grâuț","pos":"noun","definitions":["diminutive of grâu"],"forms":{"plural":"grâuțuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grâuț","accusative-definite-nominative-singular":"grâuțul","accusative-indefinite-nominative-plural":"grâuțuri","accusative-definite-nominative-plural":"grâuțurile","dative-genitive-indefinite-singular":"grâuț","dative-definite-genitive-singular":"grâuțului","dative-genitive-indefinite-plural":"grâuțuri","dative-definite-genitive-plural":"grâuțurilor","singular-vocative":"grâuțule","plural-vocative":"grâuțurilor"}},{"word":"grav","pos":"adj","definitions":["grave, serious","critical, important, weighty","severe, stern","earnest","baritone, low in pitch, tone"],"pronunciation":"/ɡrav/","forms":{"feminine-singular":"gravă","masculine-plural":"gravi","feminine-neuter-plural":"grave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grav","error-unrecognized-form-feminine-indefinite-singular":"gravă","error-unrecognized-form-indefinite-masculine-plural":"gravi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grave","definite-error-unrecognized-form-masculine-neuter-singular":"gravul","definite-error-unrecognized-form-feminine-singular":"grava","definite-error-unrecognized-form-masculine-plural":"gravii","definite-error-unrecognized-form-feminine-neuter-plural":"gravele"}},{"word":"grav","pos":"adv","definitions":["gravely"],"pronunciation":"/ɡrav/"},{"word":"grava","pos":"verb","definitions":["to engrave"],"forms":{"canonical":"a grava 1st conjugation","present-singular-third-person":"gravează","participle-past":"gravat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grava","gerund":"gravând","first-person-indicative-present-singular":"gravez","indicative-present-second-person-singular":"gravezi","indicative-present-singular-third-person":"gravează","first-person-indicative-plural-present":"gravăm","indicative-plural-present-second-person":"gravați","indicative-plural-present-third-person":"gravează","first-person-imperfect-indicative-singular":"gravam","imperfect-indicative-second-person-singular":"gravai","imperfect-indicative-singular-third-person":"grava","first-person-imperfect-indicative-plural":"gravam","imperfect-indicative-plural-second-person":"gravați","imperfect-indicative-plural-third-person":"gravau","first-person-indicative-perfect-singular":"gravai","indicative-perfect-second-person-singular":"gravași","indicative-perfect-singular-third-person":"gravă","first-person-indicative-perfect-plural":"gravarăm","indicative-perfect-plural-second-person":"gravarăți","indicative-perfect-plural-third-person":"gravară","first-person-indicative-pluperfect-singular":"gravasem","indicative-pluperfect-second-person-singular":"gravaseși","indicative-pluperfect-singular-third-person":"gravase","first-person-indicative-pluperfect-plural":"gravaserăm","indicative-pluperfect-plural-second-person":"gravaserăți","indicative-pluperfect-plural-third-person":"gravaseră","first-person-present-singular-subjunctive":"să gravez","present-second-person-singular-subjunctive":"să gravezi","present-singular-subjunctive-third-person":"să graveze","first-person-plural-present-subjunctive":"să gravăm","plural-present-second-person-subjunctive":"să gravați","plural-present-subjunctive-third-person":"să graveze","imperative-second-person-singular":"gravează","imperative-plural-second-person":"gravați","imperative-negative-second-person-singular":"nu grava","imperative-negative-plural-second-person":"nu gravați"}},{"word":"gravai","pos":"verb","definitions":["inflection of grava:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ɡraˈvaj]"},{"word":"gravam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of grava"],"pronunciation":"[ɡraˈvam]"},{"word":"gravare","pos":"noun","definitions":["engraving"],"forms":{"plural":"gravări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gravare","accusative-definite-nominative-singular":"gravarea","accusative-indefinite-nominative-plural":"gravări","accusative-definite-nominative-plural":"gravările","dative-genitive-indefinite-singular":"gravări","dative-definite-genitive-singular":"gravării","dative-genitive-indefinite-plural":"gravări","dative-definite-genitive-plural":"gravărilor","singular-vocative":"gravare","plural-vocative":"gravărilor"}},{"word":"gravase","pos":"verb","definitions":["third-person singular pluperfect indicative of grava"],"pronunciation":"[ɡraˈvase]"},{"word":"gravat","pos":"adj","definitions":["engraved"],"pronunciation":"/ɡraˈvat/","forms":{"feminine-singular":"gravată","masculine-plural":"gravați","feminine-neuter-plural":"gravate","table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravat","error-unrecognized-form-feminine-indefinite-singular":"gravată","error-unrecognized-form-indefinite-masculine-plural":"gravați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravate","definite-error-unrecognized-form-masculine-neuter-singular":"gravatul","definite-error-unrecognized-form-feminine-singular":"gravata","definite-error-unrecognized-form-masculine-plural":"gravații","definite-error-unrecognized-form-feminine-neuter-plural":"gravatele"}},{"word":"gravat","pos":"verb","definitions":["past participle of grava"],"pronunciation":"/ɡraˈvat/"},{"word":"grave","pos":"adj","definitions":["inflection of grav:","genitive/dative feminine singular/plural","nominative/accusative neuter plural"]},{"word":"grave","pos":"adv","definitions":["grave"]},{"word":"gravelă","pos":"noun","definitions":["urinary calculus"],"forms":{"plural":"gravele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gravelă","accusative-definite-nominative-singular":"gravela","accusative-indefinite-nominative-plural":"gravele","accusative-definite-nominative-plural":"gravelele","dative-genitive-indefinite-singular":"gravele","dative-definite-genitive-singular":"gravelei","dative-genitive-indefinite-plural":"gravele","dative-definite-genitive-plural":"gravelelor","singular-vocative":"gravelă","plural-vocative":"gravelelor"}},{"word":"gravez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of grava"],"pronunciation":"[ɡraˈvez]"},{"word":"gravid","pos":"adj","definitions":["pregnant (carrying an unborn child)"],"pronunciation":"/ɡraˈvid/","forms":{"feminine-singular":"gravidă","masculine-plural":"gravizi","feminine-neuter-plural":"gravide","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravid","error-unrecognized-form-feminine-indefinite-singular":"gravidă","error-unrecognized-form-indefinite-masculine-plural":"gravizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravide","definite-error-unrecognized-form-masculine-neuter-singular":"gravidul","definite-error-unrecognized-form-feminine-singular":"gravida","definite-error-unrecognized-form-masculine-plural":"gravizii","definite-error-unrecognized-form-feminine-neuter-plural":"gravidele"}},{"word":"gravidă","pos":"adj","definitions":["nominative/accusative feminine singular of gravid"],"pronunciation":"/ɡraˈvi.də/"},{"word":"gravidă","pos":"noun","definitions":["pregnant woman"],"pronunciation":"/ɡraˈvi.də/","forms":{"plural":"gravide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gravidă","accusative-definite-nominative-singular":"gravida","accusative-indefinite-nominative-plural":"gravide","accusative-definite-nominative-plural":"gravidele","dative-genitive-indefinite-singular":"gravide","dative-definite-genitive-singular":"gravidei","dative-genitive-indefinite-plural":"gravide","dative-definite-genitive-plural":"gravidelor","singular-vocative":"gravidă","plural-vocative":"gravidelor"}},{"word":"gravidie","pos":"noun","definitions":["pregnancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gravidie","accusative-definite-nominative":"gravidia","dative-genitive-indefinite":"gravidii","dative-definite-genitive":"gravidiei","vocative":"gravidie"}},{"word":"graviditate","pos":"noun","definitions":["pregnancy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"graviditate","accusative-definite-nominative-singular":"graviditatea","accusative-indefinite-nominative-plural":"gravidități","accusative-definite-nominative-plural":"graviditățile","dative-genitive-indefinite-singular":"gravidități","dative-definite-genitive-singular":"gravidității","dative-genitive-indefinite-plural":"gravidități","dative-definite-genitive-plural":"gravidităților","singular-vocative":"graviditate","plural-vocative":"gravidităților"}},{"word":"gravific","pos":"adj","definitions":["gravitic, gravitational"],"forms":{"feminine-singular":"gravifică","masculine-plural":"gravifici","feminine-neuter-plural":"gravifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravific","error-unrecognized-form-feminine-indefinite-singular":"gravifică","error-unrecognized-form-indefinite-masculine-plural":"gravifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravifice","definite-error-unrecognized-form-masculine-neuter-singular":"gravificul","definite-error-unrecognized-form-feminine-singular":"gravifica","definite-error-unrecognized-form-masculine-plural":"gravificii","definite-error-unrecognized-form-feminine-neuter-plural":"gravificele"}},{"word":"gravimetric","pos":"adj","definitions":["gravimetric"],"forms":{"feminine-singular":"gravimetrică","masculine-plural":"gravimetrici","feminine-neuter-plural":"gravimetrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravimetric","error-unrecognized-form-feminine-indefinite-singular":"gravimetrică","error-unrecognized-form-indefinite-masculine-plural":"gravimetrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravimetrice","definite-error-unrecognized-form-masculine-neuter-singular":"gravimetricul","definite-error-unrecognized-form-feminine-singular":"gravimetrica","definite-error-unrecognized-form-masculine-plural":"gravimetricii","definite-error-unrecognized-form-feminine-neuter-plural":"gravimetricele"}},{"word":"gravimetrie","pos":"noun","definitions":["gravimetry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gravimetrie","accusative-definite-nominative":"gravimetria","dative-genitive-indefinite":"gravimetrii","dative-definite-genitive":"gravimetriei","vocative":"gravimetrie"}},{"word":"gravimetru","pos":"noun","definitions":["gravimeter"],"forms":{"plural":"gravimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gravimetru","accusative-definite-nominative-singular":"gravimetrul","accusative-indefinite-nominative-plural":"gravimetre","accusative-definite-nominative-plural":"gravimetrele","dative-genitive-indefinite-singular":"gravimetru","dative-definite-genitive-singular":"gravimetrului","dative-genitive-indefinite-plural":"gravimetre","dative-definite-genitive-plural":"gravimetrelor","singular-vocative":"gravimetrule","plural-vocative":"gravimetrelor"}},{"word":"gravita","pos":"verb","definitions":["to gravitate"],"pronunciation":"[ɡra.viˈta]","examples":[{"ro":"Gravitează către tine.","en":"It's gravitating towards you."}],"forms":{"canonical":"a gravita 1st conjugation","present-singular-third-person":"gravitează","participle-past":"gravitat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gravita","gerund":"gravitând","first-person-indicative-present-singular":"gravitez","indicative-present-second-person-singular":"gravitezi","indicative-present-singular-third-person":"gravitează","first-person-indicative-plural-present":"gravităm","indicative-plural-present-second-person":"gravitați","indicative-plural-present-third-person":"gravitează","first-person-imperfect-indicative-singular":"gravitam","imperfect-indicative-second-person-singular":"gravitai","imperfect-indicative-singular-third-person":"gravita","first-person-imperfect-indicative-plural":"gravitam","imperfect-indicative-plural-second-person":"gravitați","imperfect-indicative-plural-third-person":"gravitau","first-person-indicative-perfect-singular":"gravitai","indicative-perfect-second-person-singular":"gravitași","indicative-perfect-singular-third-person":"gravită","first-person-indicative-perfect-plural":"gravitarăm","indicative-perfect-plural-second-person":"gravitarăți","indicative-perfect-plural-third-person":"gravitară","first-person-indicative-pluperfect-singular":"gravitasem","indicative-pluperfect-second-person-singular":"gravitaseși","indicative-pluperfect-singular-third-person":"gravitase","first-person-indicative-pluperfect-plural":"gravitaserăm","indicative-pluperfect-plural-second-person":"gravitaserăți","indicative-pluperfect-plural-third-person":"gravitaseră","first-person-present-singular-subjunctive":"să gravitez","present-second-person-singular-subjunctive":"să gravitezi","present-singular-subjunctive-third-person":"să graviteze","first-person-plural-present-subjunctive":"să gravităm","plural-present-second-person-subjunctive":"să gravitați","plural-present-subjunctive-third-person":"să graviteze","imperative-second-person-singular":"gravitează","imperative-plural-second-person":"gravitați","imperative-negative-second-person-singular":"nu gravita","imperative-negative-plural-second-person":"nu gravitați"}},{"word":"gravită","pos":"verb","definitions":["third-person singular simple perfect indicative of gravita"],"pronunciation":"[ɡra.viˈtə]"},{"word":"gravitai","pos":"verb","definitions":["inflection of gravita:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ɡra.viˈtaj]"},{"word":"gravitam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtam]"},{"word":"gravităm","pos":"verb","definitions":["first-person plural present indicative/subjunctive of gravita"],"pronunciation":"[ɡra.viˈtəm]"},{"word":"gravitând","pos":"verb","definitions":["gerund of gravita"],"pronunciation":"[ɡra.viˈtɨnd]"},{"word":"gravitară","pos":"verb","definitions":["third-person plural simple perfect indicative of gravita"],"pronunciation":"[ɡra.viˈtarə]"},{"word":"gravitarăm","pos":"verb","definitions":["first-person plural simple perfect indicative of gravita"],"pronunciation":"[ɡra.viˈtarəm]"},{"word":"gravitarăți","pos":"verb","definitions":["second-person plural simple perfect indicative of gravita"],"pronunciation":"[ɡra.viˈtarətsʲ]"},{"word":"gravitase","pos":"verb","definitions":["third-person singular pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtase]"},{"word":"gravitasem","pos":"verb","definitions":["first-person singular pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtasem]"},{"word":"gravitaseră","pos":"verb","definitions":["third-person plural pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaserə]"},{"word":"gravitaserăm","pos":"verb","definitions":["first-person plural pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaserəm]"},{"word":"gravitaserăți","pos":"verb","definitions":["second-person plural pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaserətsʲ]"},{"word":"gravitaseși","pos":"verb","definitions":["second-person singular pluperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaseʃʲ]"},{"word":"gravitași","pos":"verb","definitions":["second-person singular simple perfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaʃʲ]"},{"word":"gravitat","pos":"verb","definitions":["past participle of gravita"],"pronunciation":"[ɡra.viˈtat]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-pp","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravitat","error-unrecognized-form-feminine-indefinite-singular":"gravitată","error-unrecognized-form-indefinite-masculine-plural":"gravitați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravitate","definite-error-unrecognized-form-masculine-neuter-singular":"gravitatul","definite-error-unrecognized-form-feminine-singular":"gravitata","definite-error-unrecognized-form-masculine-plural":"gravitații","definite-error-unrecognized-form-feminine-neuter-plural":"gravitatele"}},{"word":"gravitate","pos":"noun","definitions":["gravity (seriousness, graveness)","synonym of gravitație (“force of gravity”)"],"pronunciation":"/ɡra.viˈta.te/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"gravitate","accusative-definite-nominative":"gravitatea","dative-genitive-indefinite":"gravități","dative-definite-genitive":"gravității","vocative":"gravitate"}},{"word":"gravitați","pos":"adj","definitions":["masculine plural of gravitat"],"pronunciation":"[ɡra.viˈtat͡sʲ]"},{"word":"gravitați","pos":"verb","definitions":["inflection of gravita:","second-person plural present/imperfect indicative","second-person plural present subjunctive","second-person plural imperative"],"pronunciation":"[ɡra.viˈtat͡sʲ]"},{"word":"gravitație","pos":"noun","definitions":["gravity, gravitation"],"pronunciation":"/ɡra.viˈta.t͡si.e/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"gravitație","accusative-definite-nominative":"gravitația","dative-genitive-indefinite":"gravitații","dative-definite-genitive":"gravitației","vocative":"gravitație"}},{"word":"gravitațional","pos":"adj","definitions":["gravitational"],"pronunciation":"/ˌɡra.vi.ta.t͡si.oˈnal/","forms":{"canonical-masculine-neuter":"gravitaționál","feminine-singular":"gravitațională","masculine-plural":"gravitaționali","feminine-neuter-plural":"gravitaționale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gravitațional","error-unrecognized-form-feminine-indefinite-singular":"gravitațională","error-unrecognized-form-indefinite-masculine-plural":"gravitaționali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gravitaționale","definite-error-unrecognized-form-masculine-neuter-singular":"gravitaționalul","definite-error-unrecognized-form-feminine-singular":"gravitaționala","definite-error-unrecognized-form-masculine-plural":"gravitaționalii","definite-error-unrecognized-form-feminine-neuter-plural":"gravitaționalele"}},{"word":"gravitațională","pos":"adj","definitions":["indefinite feminine nominative/accusative singular of gravitațional"]},{"word":"gravitațiune","pos":"noun","definitions":["obsolete form of gravitație"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"gravitațiune","accusative-definite-nominative":"gravitațiunea","dative-genitive-indefinite":"gravitațiuni","dative-definite-genitive":"gravitațiunii","vocative":"gravitațiune"}},{"word":"gravitau","pos":"verb","definitions":["third-person plural imperfect indicative of gravita"],"pronunciation":"[ɡra.viˈtaw]"},{"word":"gravitează","pos":"verb","definitions":["inflection of gravita:","third-person singular/plural present indicative","second-person singular imperative"],"pronunciation":"[ɡra.viˈte̯azə]"},{"word":"gravitez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of gravita"],"pronunciation":"[ɡra.viˈtez]"},{"word":"graviteze","pos":"verb","definitions":["third-person singular/plural present subjunctive of gravita"],"pronunciation":"[ɡra.viˈteze]"},{"word":"gravitezi","pos":"verb","definitions":["second-person singular present indicative/subjunctive of gravita"],"pronunciation":"[ɡra.viˈtezʲ]"},{"word":"graviton","pos":"noun","definitions":["graviton"],"forms":{"plural":"gravitoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"graviton","accusative-definite-nominative-singular":"gravitonul","accusative-indefinite-nominative-plural":"gravitoni","accusative-definite-nominative-plural":"gravitonii","dative-genitive-indefinite-singular":"graviton","dative-definite-genitive-singular":"gravitonului","dative-genitive-indefinite-plural":"gravitoni","dative-definite-genitive-plural":"gravitonilor","singular-vocative":"gravitonule","plural-vocative":"gravitonilor"}},{"word":"gravor","pos":"noun","definitions":["engraver"],"forms":{"plural":"gravori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gravor","accusative-definite-nominative-singular":"gravorul","accusative-indefinite-nominative-plural":"gravori","accusative-definite-nominative-plural":"gravorii","dative-genitive-indefinite-singular":"gravor","dative-definite-genitive-singular":"gravorului","dative-genitive-indefinite-plural":"gravori","dative-definite-genitive-plural":"gravorilor","singular-vocative":"gravorule","plural-vocative":"gravorilor"}},{"word":"gravură","pos":"noun","definitions":["engraving"],"forms":{"plural":"gravuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gravură","accusative-definite-nominative-singular":"gravura","accusative-indefinite-nominative-plural":"gravuri","accusative-definite-nominative-plural":"gravurile","dative-genitive-indefinite-singular":"gravuri","dative-definite-genitive-singular":"gravurii","dative-genitive-indefinite-plural":"gravuri","dative-definite-genitive-plural":"gravurilor","singular-vocative":"gravură","plural-vocative":"gravurilor"}},{"word":"grazdă","pos":"noun","definitions":["libertinage"],"forms":{"plural":"grazde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grazdă","accusative-definite-nominative-singular":"grazda","accusative-indefinite-nominative-plural":"grazde","accusative-definite-nominative-plural":"grazdele","dative-genitive-indefinite-singular":"grazde","dative-definite-genitive-singular":"grazdei","dative-genitive-indefinite-plural":"grazde","dative-definite-genitive-plural":"grazdelor","singular-vocative":"grazdă","plural-vocative":"grazdelor"}},{"word":"grazioso","pos":"adv","definitions":["grazioso"]},{"word":"grea","pos":"adj","definitions":["indefinite nominative/accusative feminine singular of greu (“heavy; hard”)"],"pronunciation":"/ˈɡre̯a/"},{"word":"grea","pos":"verb","definitions":["to rig"],"pronunciation":"/ɡreˈa/","forms":{"canonical":"a grea 1st conjugation","present-singular-third-person":"greează","participle-past":"great","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grea","gerund":"greând","first-person-indicative-present-singular":"greez","indicative-present-second-person-singular":"greezi","indicative-present-singular-third-person":"greează","first-person-indicative-plural-present":"greăm","indicative-plural-present-second-person":"greați","indicative-plural-present-third-person":"greează","first-person-imperfect-indicative-singular":"gream","imperfect-indicative-second-person-singular":"greai","imperfect-indicative-singular-third-person":"grea","first-person-imperfect-indicative-plural":"gream","imperfect-indicative-plural-second-person":"greați","imperfect-indicative-plural-third-person":"greau","first-person-indicative-perfect-singular":"greai","indicative-perfect-second-person-singular":"greași","indicative-perfect-singular-third-person":"greă","first-person-indicative-perfect-plural":"grearăm","indicative-perfect-plural-second-person":"grearăți","indicative-perfect-plural-third-person":"greară","first-person-indicative-pluperfect-singular":"greasem","indicative-pluperfect-second-person-singular":"greaseși","indicative-pluperfect-singular-third-person":"grease","first-person-indicative-pluperfect-plural":"greaserăm","indicative-pluperfect-plural-second-person":"greaserăți","indicative-pluperfect-plural-third-person":"greaseră","first-person-present-singular-subjunctive":"să greez","present-second-person-singular-subjunctive":"să greezi","present-singular-subjunctive-third-person":"să greeze","first-person-plural-present-subjunctive":"să greăm","plural-present-second-person-subjunctive":"să greați","plural-present-subjunctive-third-person":"să greeze","imperative-second-person-singular":"greează","imperative-plural-second-person":"greați","imperative-negative-second-person-singular":"nu grea","imperative-negative-plural-second-person":"nu greați"}},{"word":"Greabăn","pos":"name","definitions":["a village in Uda, Argeș County, Romania"],"gender":"m"},{"word":"greabăn","pos":"noun","definitions":["withers"],"forms":{"plural":"grebene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"greabăn","accusative-definite-nominative-singular":"greabănul","accusative-indefinite-nominative-plural":"grebene","accusative-definite-nominative-plural":"grebenele","dative-genitive-indefinite-singular":"greabăn","dative-definite-genitive-singular":"greabănului","dative-genitive-indefinite-plural":"grebene","dative-definite-genitive-plural":"grebenelor","singular-vocative":"greabănule","plural-vocative":"grebenelor"}},{"word":"Greabănu","pos":"name","definitions":["a village in Cocu, Argeș County, Romania"],"gender":"m"},{"word":"Greaca","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Greaca, Giurgiu County, Romania"],"gender":"f"},{"word":"greaca","pos":"noun","definitions":["definite nominative/accusative singular of greacă"]},{"word":"greacă","pos":"adj","definitions":["nominative/accusative feminine singular of grec"],"pronunciation":"/ˈɡre̯a.kə/"},{"word":"greacă","pos":"noun","definitions":["Greek woman"],"pronunciation":"/ˈɡre̯a.kə/","forms":{"plural":"grece","masculine":"equivalent grec","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greacă","accusative-definite-nominative-singular":"greaca","accusative-indefinite-nominative-plural":"grece","accusative-definite-nominative-plural":"grecele","dative-genitive-indefinite-singular":"grece","dative-definite-genitive-singular":"grecei","dative-genitive-indefinite-plural":"grece","dative-definite-genitive-plural":"grecelor","singular-vocative":"greacă","plural-vocative":"grecelor"}},{"word":"greacă","pos":"noun","definitions":["Greek (language)"],"pronunciation":"/ˈɡre̯a.kə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"greacă","accusative-definite-nominative":"greaca","dative-genitive-indefinite":"greci","dative-definite-genitive":"grecii","vocative":"greacă"}},{"word":"greașnic","pos":"noun","definitions":["sinner"],"forms":{"plural":"greașnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greașnic","accusative-definite-nominative-singular":"greașnicul","accusative-indefinite-nominative-plural":"greașnici","accusative-definite-nominative-plural":"greașnicii","dative-genitive-indefinite-singular":"greașnic","dative-definite-genitive-singular":"greașnicului","dative-genitive-indefinite-plural":"greașnici","dative-definite-genitive-plural":"greașnicilor","singular-vocative":"greașnicule","plural-vocative":"greașnicilor"}},{"word":"greață","pos":"noun","definitions":["nausea (feeling of physical unwellness, usually with the desire to vomit)"],"forms":{"plural":"grețuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-uri","accusative-indefinite-nominative-singular":"greață","accusative-definite-nominative-singular":"greața","accusative-indefinite-nominative-plural":"grețuri","accusative-definite-nominative-plural":"grețurile","dative-genitive-indefinite-singular":"greți","dative-definite-genitive-singular":"greții","dative-genitive-indefinite-plural":"grețuri","dative-definite-genitive-plural":"grețurilor","singular-vocative":"greață","plural-vocative":"grețurilor"}},{"word":"grebăluță","pos":"noun","definitions":["diminutive of greblă"],"forms":{"plural":"grebăluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grebăluță","accusative-definite-nominative-singular":"grebăluța","accusative-indefinite-nominative-plural":"grebăluțe","accusative-definite-nominative-plural":"grebăluțele","dative-genitive-indefinite-singular":"grebăluțe","dative-definite-genitive-singular":"grebăluței","dative-genitive-indefinite-plural":"grebăluțe","dative-definite-genitive-plural":"grebăluțelor","singular-vocative":"grebăluță","plural-vocative":"grebăluțelor"}},{"word":"grebănoșel","pos":"adj","definitions":["diminutive of grebănos"],"forms":{"feminine-singular":"grebănoșelă","masculine-plural":"grebănoșeli","feminine-neuter-plural":"grebănoșele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grebănoșel","error-unrecognized-form-feminine-indefinite-singular":"grebănoșelă","error-unrecognized-form-indefinite-masculine-plural":"grebănoșeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"grebănoșele","definite-error-unrecognized-form-masculine-neuter-singular":"grebănoșelul","definite-error-unrecognized-form-feminine-singular":"grebănoșela","definite-error-unrecognized-form-masculine-plural":"grebănoșelii","definite-error-unrecognized-form-feminine-neuter-plural":"grebănoșelele"}},{"word":"grebănoșică","pos":"noun","definitions":["diminutive of grebănos"],"forms":{"plural":"grebănoșici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grebănoșică","accusative-definite-nominative-singular":"grebănoșica","accusative-indefinite-nominative-plural":"grebănoșici","accusative-definite-nominative-plural":"grebănoșicile","dative-genitive-indefinite-singular":"grebănoșici","dative-definite-genitive-singular":"grebănoșicii","dative-genitive-indefinite-plural":"grebănoșici","dative-definite-genitive-plural":"grebănoșicilor","singular-vocative":"grebănoșică","plural-vocative":"grebănoșicilor"}},{"word":"Grebănu","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Grebănu, Buzău County, Romania"],"gender":"m"},{"word":"Grebenișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Grebenișan"}},{"word":"Grebenișu de Câmpie","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Grebenișu de Câmpie, Mureș County, Romania"],"gender":"m"},{"word":"Grebla","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Băiașu","a river in Suceava, Romania, tributary to the Dornișoara"],"gender":"f"},{"word":"grebla","pos":"verb","definitions":["to rake"],"pronunciation":"/ɡreˈbla/","forms":{"canonical":"a grebla 1st conjugation","present-singular-third-person":"greblează","participle-past":"greblat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grebla","gerund":"greblând","first-person-indicative-present-singular":"greblez","indicative-present-second-person-singular":"greblezi","indicative-present-singular-third-person":"greblează","first-person-indicative-plural-present":"greblăm","indicative-plural-present-second-person":"greblați","indicative-plural-present-third-person":"greblează","first-person-imperfect-indicative-singular":"greblam","imperfect-indicative-second-person-singular":"greblai","imperfect-indicative-singular-third-person":"grebla","first-person-imperfect-indicative-plural":"greblam","imperfect-indicative-plural-second-person":"greblați","imperfect-indicative-plural-third-person":"greblau","first-person-indicative-perfect-singular":"greblai","indicative-perfect-second-person-singular":"greblași","indicative-perfect-singular-third-person":"greblă","first-person-indicative-perfect-plural":"greblarăm","indicative-perfect-plural-second-person":"greblarăți","indicative-perfect-plural-third-person":"greblară","first-person-indicative-pluperfect-singular":"greblasem","indicative-pluperfect-second-person-singular":"greblaseși","indicative-pluperfect-singular-third-person":"greblase","first-person-indicative-pluperfect-plural":"greblaserăm","indicative-pluperfect-plural-second-person":"greblaserăți","indicative-pluperfect-plural-third-person":"greblaseră","first-person-present-singular-subjunctive":"să greblez","present-second-person-singular-subjunctive":"să greblezi","present-singular-subjunctive-third-person":"să grebleze","first-person-plural-present-subjunctive":"să greblăm","plural-present-second-person-subjunctive":"să greblați","plural-present-subjunctive-third-person":"să grebleze","imperative-second-person-singular":"greblează","imperative-plural-second-person":"greblați","imperative-negative-second-person-singular":"nu grebla","imperative-negative-plural-second-person":"nu greblați"}},{"word":"grebla","pos":"noun","definitions":["definite nominative/accusative singular of greblă"],"pronunciation":"/ɡreˈbla/"},{"word":"greblă","pos":"noun","definitions":["rake"],"forms":{"plural":"greble","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greblă","accusative-definite-nominative-singular":"grebla","accusative-indefinite-nominative-plural":"greble","accusative-definite-nominative-plural":"greblele","dative-genitive-indefinite-singular":"greble","dative-definite-genitive-singular":"greblei","dative-genitive-indefinite-plural":"greble","dative-definite-genitive-plural":"greblelor","singular-vocative":"greblă","plural-vocative":"greblelor"}},{"word":"greblare","pos":"noun","definitions":["raking"],"forms":{"plural":"greblări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"greblare","accusative-definite-nominative-singular":"greblarea","accusative-indefinite-nominative-plural":"greblări","accusative-definite-nominative-plural":"greblările","dative-genitive-indefinite-singular":"greblări","dative-definite-genitive-singular":"greblării","dative-genitive-indefinite-plural":"greblări","dative-definite-genitive-plural":"greblărilor","singular-vocative":"greblare","plural-vocative":"greblărilor"}},{"word":"greblaș","pos":"noun","definitions":["raker"],"forms":{"plural":"greblași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greblaș","accusative-definite-nominative-singular":"greblașul","accusative-indefinite-nominative-plural":"greblași","accusative-definite-nominative-plural":"greblașii","dative-genitive-indefinite-singular":"greblaș","dative-definite-genitive-singular":"greblașului","dative-genitive-indefinite-plural":"greblași","dative-definite-genitive-plural":"greblașilor","singular-vocative":"greblașule","plural-vocative":"greblașilor"}},{"word":"greblat","pos":"noun","definitions":["raking"],"forms":{"plural":"greblaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"greblat","accusative-definite-nominative-singular":"greblatul","accusative-indefinite-nominative-plural":"greblaturi","accusative-definite-nominative-plural":"greblaturile","dative-genitive-indefinite-singular":"greblat","dative-definite-genitive-singular":"greblatului","dative-genitive-indefinite-plural":"greblaturi","dative-definite-genitive-plural":"greblaturilor","singular-vocative":"greblatule","plural-vocative":"greblaturilor"}},{"word":"Grebleș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grebleș"}},{"word":"Greblești","pos":"name","definitions":["a village in Câineni, Vâlcea County, Romania"],"gender":"m"},{"word":"grebliță","pos":"noun","definitions":["diminutive of greblă"],"forms":{"plural":"greblițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grebliță","accusative-definite-nominative-singular":"greblița","accusative-indefinite-nominative-plural":"greblițe","accusative-definite-nominative-plural":"greblițele","dative-genitive-indefinite-singular":"greblițe","dative-definite-genitive-singular":"grebliței","dative-genitive-indefinite-plural":"greblițe","dative-definite-genitive-plural":"greblițelor","singular-vocative":"grebliță","plural-vocative":"greblițelor"}},{"word":"grebluță","pos":"noun","definitions":["diminutive of greblă"],"forms":{"plural":"grebluțăe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grebluță","accusative-definite-nominative-singular":"grebluța","accusative-indefinite-nominative-plural":"grebluțăe","accusative-definite-nominative-plural":"grebluțăele","dative-genitive-indefinite-singular":"grebluțăe","dative-definite-genitive-singular":"grebluțăei","dative-genitive-indefinite-plural":"grebluțăe","dative-definite-genitive-plural":"grebluțăelor","singular-vocative":"grebluță","plural-vocative":"grebluțăelor"}},{"word":"grebuliță","pos":"noun","definitions":["diminutive of greblă"],"forms":{"plural":"grebulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grebuliță","accusative-definite-nominative-singular":"grebulița","accusative-indefinite-nominative-plural":"grebulițe","accusative-definite-nominative-plural":"grebulițele","dative-genitive-indefinite-singular":"grebulițe","dative-definite-genitive-singular":"grebuliței","dative-genitive-indefinite-plural":"grebulițe","dative-definite-genitive-plural":"grebulițelor","singular-vocative":"grebuliță","plural-vocative":"grebulițelor"}},{"word":"Grec","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Grec"}},{"word":"grec","pos":"adj","definitions":["Greek (of or pertaining to Greeks, the Greek language or the Greek culture)"],"pronunciation":"/ɡrek/","forms":{"feminine-singular":"greacă","masculine-plural":"greci","feminine-neuter-plural":"grece","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grec","error-unrecognized-form-feminine-indefinite-singular":"greacă","error-unrecognized-form-indefinite-masculine-plural":"greci","error-unrecognized-form-feminine-indefinite-neuter-plural":"grece","definite-error-unrecognized-form-masculine-neuter-singular":"grecul","definite-error-unrecognized-form-feminine-singular":"greaca","definite-error-unrecognized-form-masculine-plural":"grecii","definite-error-unrecognized-form-feminine-neuter-plural":"grecele"}},{"word":"grec","pos":"noun","definitions":["Greek man (a person of Greek descent)"],"pronunciation":"/ɡrek/","forms":{"plural":"greci","feminine":"equivalent grecoaică","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grec","accusative-definite-nominative-singular":"grecul","accusative-indefinite-nominative-plural":"greci","accusative-definite-nominative-plural":"grecii","dative-genitive-indefinite-singular":"grec","dative-definite-genitive-singular":"grecului","dative-genitive-indefinite-plural":"greci","dative-definite-genitive-plural":"grecilor","singular-vocative":"grecule","plural-vocative":"grecilor"}},{"word":"grece","pos":"noun","definitions":["inflection of greacă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡret͡ʃe]","gender":"f-p"},{"word":"Greceanca","pos":"name","definitions":["a village in Breaza, Buzău County, Romania"],"gender":"f"},{"word":"grecească","pos":"adj","definitions":["feminine singular of grecesc"],"pronunciation":"/ɡreˈt͡ʃe̯as.kə/","gender":"f"},{"word":"Greceni","pos":"name","definitions":["a village in Burlăceni, Cahul Raion, Moldova"],"gender":"m"},{"word":"grecesc","pos":"adj","definitions":["Greek"],"pronunciation":"/ɡreˈt͡ʃesk/","examples":[{"ro":"alfabetul grecesc","en":"the Greek alphabet"}],"forms":{"feminine-singular":"grecească","plural":"grecești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grecesc","error-unrecognized-form-feminine-indefinite-singular":"grecească","error-unrecognized-form-indefinite-masculine-plural":"grecești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grecești","definite-error-unrecognized-form-masculine-neuter-singular":"grecescul","definite-error-unrecognized-form-feminine-singular":"greceasca","definite-error-unrecognized-form-masculine-plural":"greceștii","definite-error-unrecognized-form-feminine-neuter-plural":"greceștile"}},{"word":"Grecescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grecescu"}},{"word":"grecește","pos":"adv","definitions":["in a Greek manner","in Greek language"]},{"word":"Grecești","pos":"name","definitions":["a commune of Dolj County, Romania","a village in Grecești, Dolj County, Romania"],"gender":"m"},{"word":"grecești","pos":"adj","definitions":["plural of grecesc"],"pronunciation":"/ɡreˈt͡ʃeʃtʲ/"},{"word":"Greci","pos":"name","definitions":["a village in Petrești, Dâmbovița County, Romania","a commune of Mehedinți County, Romania","a village in Greci, Mehedinți County, Romania","a village in Osica de Sus, Olt County, Romania","a village in Schitu, Olt County, Romania"],"gender":"m"},{"word":"greci","pos":"noun","definitions":["indefinite plural of grec"],"pronunciation":"[ɡret͡ʃʲ]","gender":"m-p"},{"word":"Grecia","pos":"name","definitions":["Greece (a country in Southeast Europe)"],"pronunciation":"/ˈɡre.t͡ʃi.a/","gender":"f","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Grecie","accusative-definite-nominative":"Grecia","dative-genitive-indefinite":"Grecii","dative-definite-genitive":"Greciei","vocative":"Grecie","alternative":"Гречия"}},{"word":"Grecia Antică","pos":"name","definitions":["Ancient Greece"],"gender":"f"},{"word":"grecie","pos":"noun","definitions":["Greek language"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"grecie","accusative-definite-nominative":"grecia","dative-genitive-indefinite":"grecii","dative-definite-genitive":"greciei","vocative":"grecie"}},{"word":"Grecii de Jos","pos":"name","definitions":["a village in Fierbinți-Târg, Ialomița County, Romania"],"gender":"m"},{"word":"Grecilor","pos":"name","definitions":["a river in Argeș, Romania, tributary to the Cârcinov"],"gender":"m"},{"word":"grecism","pos":"noun","definitions":["Greek word"],"forms":{"plural":"grecisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grecism","accusative-definite-nominative-singular":"grecismul","accusative-indefinite-nominative-plural":"grecisme","accusative-definite-nominative-plural":"grecismele","dative-genitive-indefinite-singular":"grecism","dative-definite-genitive-singular":"grecismului","dative-genitive-indefinite-plural":"grecisme","dative-definite-genitive-plural":"grecismelor","singular-vocative":"grecismule","plural-vocative":"grecismelor"}},{"word":"grecit","pos":"adj","definitions":["Greeked, assimilated by the Greeks"],"forms":{"feminine-singular":"grecită","masculine-plural":"greciți","feminine-neuter-plural":"grecite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grecit","error-unrecognized-form-feminine-indefinite-singular":"grecită","error-unrecognized-form-indefinite-masculine-plural":"greciți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grecite","definite-error-unrecognized-form-masculine-neuter-singular":"grecitul","definite-error-unrecognized-form-feminine-singular":"grecita","definite-error-unrecognized-form-masculine-plural":"greciții","definite-error-unrecognized-form-feminine-neuter-plural":"grecitele"}},{"word":"grecit","pos":"verb","definitions":["past participle of greci"],"forms":{"participle-past":"of greci"}},{"word":"grecitate","pos":"noun","definitions":["Graecity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"grecitate","accusative-definite-nominative":"grecitatea","dative-genitive-indefinite":"grecități","dative-definite-genitive":"grecității","vocative":"-"}},{"word":"greciza","pos":"verb","definitions":["to Hellenize"],"forms":{"canonical":"a greciza 1st conjugation","present-singular-third-person":"grecizează","participle-past":"grecizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a greciza","gerund":"grecizând","first-person-indicative-present-singular":"grecizez","indicative-present-second-person-singular":"grecizezi","indicative-present-singular-third-person":"grecizează","first-person-indicative-plural-present":"grecizăm","indicative-plural-present-second-person":"grecizați","indicative-plural-present-third-person":"grecizează","first-person-imperfect-indicative-singular":"grecizam","imperfect-indicative-second-person-singular":"grecizai","imperfect-indicative-singular-third-person":"greciza","first-person-imperfect-indicative-plural":"grecizam","imperfect-indicative-plural-second-person":"grecizați","imperfect-indicative-plural-third-person":"grecizau","first-person-indicative-perfect-singular":"grecizai","indicative-perfect-second-person-singular":"grecizași","indicative-perfect-singular-third-person":"greciză","first-person-indicative-perfect-plural":"grecizarăm","indicative-perfect-plural-second-person":"grecizarăți","indicative-perfect-plural-third-person":"grecizară","first-person-indicative-pluperfect-singular":"grecizasem","indicative-pluperfect-second-person-singular":"grecizaseși","indicative-pluperfect-singular-third-person":"grecizase","first-person-indicative-pluperfect-plural":"grecizaserăm","indicative-pluperfect-plural-second-person":"grecizaserăți","indicative-pluperfect-plural-third-person":"grecizaseră","first-person-present-singular-subjunctive":"să grecizez","present-second-person-singular-subjunctive":"să grecizezi","present-singular-subjunctive-third-person":"să grecizeze","first-person-plural-present-subjunctive":"să grecizăm","plural-present-second-person-subjunctive":"să grecizați","plural-present-subjunctive-third-person":"să grecizeze","imperative-second-person-singular":"grecizează","imperative-plural-second-person":"grecizați","imperative-negative-second-person-singular":"nu greciza","imperative-negative-plural-second-person":"nu grecizați"}},{"word":"grecizare","pos":"noun","definitions":["Hellenisation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"grecizare","accusative-definite-nominative":"grecizarea","dative-genitive-indefinite":"grecizare","dative-definite-genitive":"grecizarei","vocative":"grecizare"}},{"word":"grecizat","pos":"adj","definitions":["Hellenized"],"forms":{"feminine-singular":"grecizată","masculine-plural":"grecizați","feminine-neuter-plural":"grecizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grecizat","error-unrecognized-form-feminine-indefinite-singular":"grecizată","error-unrecognized-form-indefinite-masculine-plural":"grecizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grecizate","definite-error-unrecognized-form-masculine-neuter-singular":"grecizatul","definite-error-unrecognized-form-feminine-singular":"grecizata","definite-error-unrecognized-form-masculine-plural":"grecizații","definite-error-unrecognized-form-feminine-neuter-plural":"grecizatele"}},{"word":"grecizat","pos":"verb","definitions":["past participle of greciza"],"forms":{"participle-past":"of greciza"}},{"word":"greco-","pos":"prefix","definitions":["Greco-"]},{"word":"greco-catolic","pos":"adj","definitions":["Greek Catholic, Uniate"],"forms":{"feminine-singular":"greco-catolică","masculine-plural":"greco-catolici","feminine-neuter-plural":"greco-catolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greco-catolic","error-unrecognized-form-feminine-indefinite-singular":"greco-catolică","error-unrecognized-form-indefinite-masculine-plural":"greco-catolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"greco-catolice","definite-error-unrecognized-form-masculine-neuter-singular":"greco-catolicul","definite-error-unrecognized-form-feminine-singular":"greco-catolica","definite-error-unrecognized-form-masculine-plural":"greco-catolicii","definite-error-unrecognized-form-feminine-neuter-plural":"greco-catolicele"}},{"word":"greco-catolic","pos":"noun","definitions":["Greek Catholic, Uniate"],"forms":{"plural":"greco-catolici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greco-catolic","accusative-definite-nominative-singular":"greco-catolicul","accusative-indefinite-nominative-plural":"greco-catolici","accusative-definite-nominative-plural":"greco-catolicii","dative-genitive-indefinite-singular":"greco-catolic","dative-definite-genitive-singular":"greco-catolicului","dative-genitive-indefinite-plural":"greco-catolici","dative-definite-genitive-plural":"greco-catolicilor","singular-vocative":"greco-catolicule","plural-vocative":"greco-catolicilor"}},{"word":"greco-catolică","pos":"noun","definitions":["female equivalent of greco-catolic"],"forms":{"plural":"greco-catolice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greco-catolică","accusative-definite-nominative-singular":"greco-catolica","accusative-indefinite-nominative-plural":"greco-catolice","accusative-definite-nominative-plural":"greco-catolicele","dative-genitive-indefinite-singular":"greco-catolice","dative-definite-genitive-singular":"greco-catolicei","dative-genitive-indefinite-plural":"greco-catolice","dative-definite-genitive-plural":"greco-catolicelor","singular-vocative":"greco-catolică","plural-vocative":"greco-catolicelor"}},{"word":"greco-oriental","pos":"noun","definitions":["Eastern Orthodox"],"forms":{"plural":"greco-orientali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greco-oriental","accusative-definite-nominative-singular":"greco-orientalul","accusative-indefinite-nominative-plural":"greco-orientali","accusative-definite-nominative-plural":"greco-orientalii","dative-genitive-indefinite-singular":"greco-oriental","dative-definite-genitive-singular":"greco-orientalului","dative-genitive-indefinite-plural":"greco-orientali","dative-definite-genitive-plural":"greco-orientalilor","singular-vocative":"greco-orientalule","plural-vocative":"greco-orientalilor"}},{"word":"greco-orientală","pos":"noun","definitions":["female equivalent of greco-oriental"],"forms":{"plural":"greco-orientale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greco-orientală","accusative-definite-nominative-singular":"greco-orientala","accusative-indefinite-nominative-plural":"greco-orientale","accusative-definite-nominative-plural":"greco-orientalele","dative-genitive-indefinite-singular":"greco-orientale","dative-definite-genitive-singular":"greco-orientalei","dative-genitive-indefinite-plural":"greco-orientale","dative-definite-genitive-plural":"greco-orientalelor","singular-vocative":"greco-orientală","plural-vocative":"greco-orientalelor"}},{"word":"greco-răsăritean","pos":"noun","definitions":["Eastern Orthodox"],"forms":{"plural":"greco-răsăriteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greco-răsăritean","accusative-definite-nominative-singular":"greco-răsăriteanul","accusative-indefinite-nominative-plural":"greco-răsăriteni","accusative-definite-nominative-plural":"greco-răsăritenii","dative-genitive-indefinite-singular":"greco-răsăritean","dative-definite-genitive-singular":"greco-răsăriteanului","dative-genitive-indefinite-plural":"greco-răsăriteni","dative-definite-genitive-plural":"greco-răsăritenilor","singular-vocative":"greco-răsăriteanule","plural-vocative":"greco-răsăritenilor"}},{"word":"greco-răsăriteană","pos":"noun","definitions":["female equivalent of greco-răsăritean"],"forms":{"plural":"greco-răsăritene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greco-răsăriteană","accusative-definite-nominative-singular":"greco-răsăriteana","accusative-indefinite-nominative-plural":"greco-răsăritene","accusative-definite-nominative-plural":"greco-răsăritenele","dative-genitive-indefinite-singular":"greco-răsăritene","dative-definite-genitive-singular":"greco-răsăritenei","dative-genitive-indefinite-plural":"greco-răsăritene","dative-definite-genitive-plural":"greco-răsăritenelor","singular-vocative":"greco-răsăriteană","plural-vocative":"greco-răsăritenelor"}},{"word":"greco-roman","pos":"adj","definitions":["Greco-Roman"],"forms":{"feminine-singular":"greco-romană","masculine-plural":"greco-romani","feminine-neuter-plural":"greco-romane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greco-roman","error-unrecognized-form-feminine-indefinite-singular":"greco-romană","error-unrecognized-form-indefinite-masculine-plural":"greco-romani","error-unrecognized-form-feminine-indefinite-neuter-plural":"greco-romane","definite-error-unrecognized-form-masculine-neuter-singular":"greco-romanul","definite-error-unrecognized-form-feminine-singular":"greco-romana","definite-error-unrecognized-form-masculine-plural":"greco-romanii","definite-error-unrecognized-form-feminine-neuter-plural":"greco-romanele"}},{"word":"greco-român","pos":"adj","definitions":["Greek-Romanian"],"forms":{"feminine-singular":"greco-română","masculine-plural":"greco-români","feminine-neuter-plural":"greco-române","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greco-român","error-unrecognized-form-feminine-indefinite-singular":"greco-română","error-unrecognized-form-indefinite-masculine-plural":"greco-români","error-unrecognized-form-feminine-indefinite-neuter-plural":"greco-române","definite-error-unrecognized-form-masculine-neuter-singular":"greco-românul","definite-error-unrecognized-form-feminine-singular":"greco-româna","definite-error-unrecognized-form-masculine-plural":"greco-românii","definite-error-unrecognized-form-feminine-neuter-plural":"greco-românele"}},{"word":"grecoaică","pos":"noun","definitions":["Greek woman"],"forms":{"plural":"grecoaice","masculine":"equivalent grec","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grecoaică","accusative-definite-nominative-singular":"grecoaica","accusative-indefinite-nominative-plural":"grecoaice","accusative-definite-nominative-plural":"grecoaicele","dative-genitive-indefinite-singular":"grecoaice","dative-definite-genitive-singular":"grecoaicei","dative-genitive-indefinite-plural":"grecoaice","dative-definite-genitive-plural":"grecoaicelor","singular-vocative":"grecoaică","plural-vocative":"grecoaicelor"}},{"word":"grecoiță","pos":"noun","definitions":["Greek woman"],"forms":{"plural":"grecoițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grecoiță","accusative-definite-nominative-singular":"grecoița","accusative-indefinite-nominative-plural":"grecoițe","accusative-definite-nominative-plural":"grecoițele","dative-genitive-indefinite-singular":"grecoițe","dative-definite-genitive-singular":"grecoiței","dative-genitive-indefinite-plural":"grecoițe","dative-definite-genitive-plural":"grecoițelor","singular-vocative":"grecoiță","plural-vocative":"grecoițelor"}},{"word":"grecoman","pos":"noun","definitions":["admirer of Greece and Greek culture"],"forms":{"plural":"grecomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grecoman","accusative-definite-nominative-singular":"grecomanul","accusative-indefinite-nominative-plural":"grecomani","accusative-definite-nominative-plural":"grecomanii","dative-genitive-indefinite-singular":"grecoman","dative-definite-genitive-singular":"grecomanului","dative-genitive-indefinite-plural":"grecomani","dative-definite-genitive-plural":"grecomanilor","singular-vocative":"grecomanule","plural-vocative":"grecomanilor"}},{"word":"grecomanie","pos":"noun","definitions":["Grecomania"],"forms":{"plural":"grecomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grecomanie","accusative-definite-nominative-singular":"grecomania","accusative-indefinite-nominative-plural":"grecomanii","accusative-definite-nominative-plural":"grecomaniile","dative-genitive-indefinite-singular":"grecomanii","dative-definite-genitive-singular":"grecomaniei","dative-genitive-indefinite-plural":"grecomanii","dative-definite-genitive-plural":"grecomaniilor","singular-vocative":"grecomanie","plural-vocative":"grecomaniilor"}},{"word":"grecotei","pos":"noun","definitions":["Greek"],"pronunciation":"/ɡre.ko.ˈtej/","forms":{"plural":"grecotei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grecotei","accusative-definite-nominative-singular":"grecoteiul","accusative-indefinite-nominative-plural":"grecotei","accusative-definite-nominative-plural":"grecoteii","dative-genitive-indefinite-singular":"grecotei","dative-definite-genitive-singular":"grecoteiului","dative-genitive-indefinite-plural":"grecotei","dative-definite-genitive-plural":"grecoteilor","singular-vocative":"grecoteiule","plural-vocative":"grecoteilor"}},{"word":"grecoteiesc","pos":"adj","definitions":["Greek"],"forms":{"feminine-singular":"grecoteiască","plural":"grecoteiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grecoteiesc","error-unrecognized-form-feminine-indefinite-singular":"grecoteiască","error-unrecognized-form-indefinite-masculine-plural":"grecoteiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grecoteiești","definite-error-unrecognized-form-masculine-neuter-singular":"grecoteiescul","definite-error-unrecognized-form-feminine-singular":"grecoteiasca","definite-error-unrecognized-form-masculine-plural":"grecoteieștii","definite-error-unrecognized-form-feminine-neuter-plural":"grecoteieștile"}},{"word":"Grecu","pos":"name","definitions":["a surname originating as an ethnonym"],"gender":"m","forms":{"dative-genitive":"lui Grecu"}},{"word":"Greculescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Greculescu"}},{"word":"grecului","pos":"noun","definitions":["definite genitive/dative singular of grec"]},{"word":"grecușor","pos":"noun","definitions":["diminutive of grec; small Greek"],"forms":{"plural":"grecușori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grecușor","accusative-definite-nominative-singular":"grecușorul","accusative-indefinite-nominative-plural":"grecușori","accusative-definite-nominative-plural":"grecușorii","dative-genitive-indefinite-singular":"grecușor","dative-definite-genitive-singular":"grecușorului","dative-genitive-indefinite-plural":"grecușori","dative-definite-genitive-plural":"grecușorilor","singular-vocative":"grecușorule","plural-vocative":"grecușorilor"}},{"word":"greement","pos":"noun","definitions":["rigging"],"forms":{"plural":"greemente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"greement","accusative-definite-nominative-singular":"greementul","accusative-indefinite-nominative-plural":"greemente","accusative-definite-nominative-plural":"greementele","dative-genitive-indefinite-singular":"greement","dative-definite-genitive-singular":"greementului","dative-genitive-indefinite-plural":"greemente","dative-definite-genitive-plural":"greementelor","singular-vocative":"greementule","plural-vocative":"greementelor"}},{"word":"green","pos":"noun","definitions":["putting green"],"forms":{"plural":"greenuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"green","accusative-definite-nominative-singular":"greenul","accusative-indefinite-nominative-plural":"greenuri","accusative-definite-nominative-plural":"greenurile","dative-genitive-indefinite-singular":"green","dative-definite-genitive-singular":"greenului","dative-genitive-indefinite-plural":"greenuri","dative-definite-genitive-plural":"greenurilor","singular-vocative":"greenule","plural-vocative":"greenurilor"}},{"word":"Greerești","pos":"name","definitions":["a village in Leleasca, Olt County, Romania"],"gender":"m"},{"word":"Greeruș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Greeruș"}},{"word":"gref","pos":"noun","definitions":["a unit of length, one sixteenth of a cot"],"forms":{"plural":"grefuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gref","accusative-definite-nominative-singular":"greful","accusative-indefinite-nominative-plural":"grefuri","accusative-definite-nominative-plural":"grefurile","dative-genitive-indefinite-singular":"gref","dative-definite-genitive-singular":"grefului","dative-genitive-indefinite-plural":"grefuri","dative-definite-genitive-plural":"grefurilor","singular-vocative":"grefule","plural-vocative":"grefurilor"}},{"word":"grefa","pos":"verb","definitions":["to engraft"],"forms":{"canonical":"a grefa 1st conjugation","present-singular-third-person":"grefează","participle-past":"grefat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grefa","gerund":"grefând","first-person-indicative-present-singular":"grefez","indicative-present-second-person-singular":"grefezi","indicative-present-singular-third-person":"grefează","first-person-indicative-plural-present":"grefăm","indicative-plural-present-second-person":"grefați","indicative-plural-present-third-person":"grefează","first-person-imperfect-indicative-singular":"grefam","imperfect-indicative-second-person-singular":"grefai","imperfect-indicative-singular-third-person":"grefa","first-person-imperfect-indicative-plural":"grefam","imperfect-indicative-plural-second-person":"grefați","imperfect-indicative-plural-third-person":"grefau","first-person-indicative-perfect-singular":"grefai","indicative-perfect-second-person-singular":"grefași","indicative-perfect-singular-third-person":"grefă","first-person-indicative-perfect-plural":"grefarăm","indicative-perfect-plural-second-person":"grefarăți","indicative-perfect-plural-third-person":"grefară","first-person-indicative-pluperfect-singular":"grefasem","indicative-pluperfect-second-person-singular":"grefaseși","indicative-pluperfect-singular-third-person":"grefase","first-person-indicative-pluperfect-plural":"grefaserăm","indicative-pluperfect-plural-second-person":"grefaserăți","indicative-pluperfect-plural-third-person":"grefaseră","first-person-present-singular-subjunctive":"să grefez","present-second-person-singular-subjunctive":"să grefezi","present-singular-subjunctive-third-person":"să grefeze","first-person-plural-present-subjunctive":"să grefăm","plural-present-second-person-subjunctive":"să grefați","plural-present-subjunctive-third-person":"să grefeze","imperative-second-person-singular":"grefează","imperative-plural-second-person":"grefați","imperative-negative-second-person-singular":"nu grefa","imperative-negative-plural-second-person":"nu grefați"}},{"word":"grefă","pos":"noun","definitions":["graft"],"forms":{"plural":"grefe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grefă","accusative-definite-nominative-singular":"grefa","accusative-indefinite-nominative-plural":"grefe","accusative-definite-nominative-plural":"grefele","dative-genitive-indefinite-singular":"grefe","dative-definite-genitive-singular":"grefei","dative-genitive-indefinite-plural":"grefe","dative-definite-genitive-plural":"grefelor","singular-vocative":"grefă","plural-vocative":"grefelor"}},{"word":"grefare","pos":"noun","definitions":["grafting"],"forms":{"plural":"grefări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grefare","accusative-definite-nominative-singular":"grefarea","accusative-indefinite-nominative-plural":"grefări","accusative-definite-nominative-plural":"grefările","dative-genitive-indefinite-singular":"grefări","dative-definite-genitive-singular":"grefării","dative-genitive-indefinite-plural":"grefări","dative-definite-genitive-plural":"grefărilor","singular-vocative":"grefare","plural-vocative":"grefărilor"}},{"word":"grefat","pos":"adj","definitions":["engrafted"],"forms":{"feminine-singular":"grefată","masculine-plural":"grefați","feminine-neuter-plural":"grefate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grefat","error-unrecognized-form-feminine-indefinite-singular":"grefată","error-unrecognized-form-indefinite-masculine-plural":"grefați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grefate","definite-error-unrecognized-form-masculine-neuter-singular":"grefatul","definite-error-unrecognized-form-feminine-singular":"grefata","definite-error-unrecognized-form-masculine-plural":"grefații","definite-error-unrecognized-form-feminine-neuter-plural":"grefatele"}},{"word":"grefat","pos":"verb","definitions":["past participle of grefa"],"forms":{"participle-past":"of grefa"}},{"word":"grefier","pos":"noun","definitions":["registrar"],"forms":{"plural":"grefieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grefier","accusative-definite-nominative-singular":"grefierul","accusative-indefinite-nominative-plural":"grefieri","accusative-definite-nominative-plural":"grefierii","dative-genitive-indefinite-singular":"grefier","dative-definite-genitive-singular":"grefierului","dative-genitive-indefinite-plural":"grefieri","dative-definite-genitive-plural":"grefierilor","singular-vocative":"grefierule","plural-vocative":"grefierilor"}},{"word":"grefieră","pos":"noun","definitions":["female equivalent of grefier"],"forms":{"plural":"grefiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grefieră","accusative-definite-nominative-singular":"grefiera","accusative-indefinite-nominative-plural":"grefiere","accusative-definite-nominative-plural":"grefierele","dative-genitive-indefinite-singular":"grefiere","dative-definite-genitive-singular":"grefierei","dative-genitive-indefinite-plural":"grefiere","dative-definite-genitive-plural":"grefierelor","singular-vocative":"grefieră","plural-vocative":"grefierelor"}},{"word":"grefieriță","pos":"noun","definitions":["female equivalent of grefier"],"forms":{"plural":"grefierițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grefieriță","accusative-definite-nominative-singular":"grefierița","accusative-indefinite-nominative-plural":"grefierițe","accusative-definite-nominative-plural":"grefierițele","dative-genitive-indefinite-singular":"grefierițe","dative-definite-genitive-singular":"grefieriței","dative-genitive-indefinite-plural":"grefierițe","dative-definite-genitive-plural":"grefierițelor","singular-vocative":"grefieriță","plural-vocative":"grefierițelor"}},{"word":"grefon","pos":"noun","definitions":["graft"],"forms":{"plural":"grefoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grefon","accusative-definite-nominative-singular":"grefonul","accusative-indefinite-nominative-plural":"grefoane","accusative-definite-nominative-plural":"grefoanele","dative-genitive-indefinite-singular":"grefon","dative-definite-genitive-singular":"grefonului","dative-genitive-indefinite-plural":"grefoane","dative-definite-genitive-plural":"grefoanelor","singular-vocative":"grefonule","plural-vocative":"grefoanelor"}},{"word":"gregar","pos":"adj","definitions":["gregarious"],"pronunciation":"/ɡreˈɡar/","forms":{"feminine-singular":"gregară","masculine-plural":"gregari","feminine-neuter-plural":"gregare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gregar","error-unrecognized-form-feminine-indefinite-singular":"gregară","error-unrecognized-form-indefinite-masculine-plural":"gregari","error-unrecognized-form-feminine-indefinite-neuter-plural":"gregare","definite-error-unrecognized-form-masculine-neuter-singular":"gregarul","definite-error-unrecognized-form-feminine-singular":"gregara","definite-error-unrecognized-form-masculine-plural":"gregarii","definite-error-unrecognized-form-feminine-neuter-plural":"gregarele"}},{"word":"gregarism","pos":"noun","definitions":["gregariousness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gregarism","accusative-definite-nominative":"gregarismul","dative-genitive-indefinite":"gregarism","dative-definite-genitive":"gregarismului","vocative":"gregarismule"}},{"word":"gregorian","pos":"adj","definitions":["Gregorian"],"pronunciation":"/ɡre.ɡo.riˈan/","forms":{"feminine-singular":"gregoriană","masculine-plural":"gregorieni","feminine-neuter-plural":"gregoriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gregorian","error-unrecognized-form-feminine-indefinite-singular":"gregoriană","error-unrecognized-form-indefinite-masculine-plural":"gregorieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"gregoriene","definite-error-unrecognized-form-masculine-neuter-singular":"gregorianul","definite-error-unrecognized-form-feminine-singular":"gregoriana","definite-error-unrecognized-form-masculine-plural":"gregorienii","definite-error-unrecognized-form-feminine-neuter-plural":"gregorienele"}},{"word":"grei","pos":"adj","definitions":["nominative/accusative/genitive/dative indefinite masculine plural of greu"]},{"word":"greier","pos":"noun","definitions":["cricket (insect)"],"pronunciation":"/ˈɡre.jer/","forms":{"plural":"greieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greier","accusative-definite-nominative-singular":"greierul","accusative-indefinite-nominative-plural":"greieri","accusative-definite-nominative-plural":"greierii","dative-genitive-indefinite-singular":"greier","dative-definite-genitive-singular":"greierului","dative-genitive-indefinite-plural":"greieri","dative-definite-genitive-plural":"greierilor","singular-vocative":"greierule","plural-vocative":"greierilor","alternative-regional":"greiere"}},{"word":"greieraș","pos":"noun","definitions":["diminutive of greier; small cricket"],"forms":{"plural":"greierași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greieraș","accusative-definite-nominative-singular":"greierașul","accusative-indefinite-nominative-plural":"greierași","accusative-definite-nominative-plural":"greierașii","dative-genitive-indefinite-singular":"greieraș","dative-definite-genitive-singular":"greierașului","dative-genitive-indefinite-plural":"greierași","dative-definite-genitive-plural":"greierașilor","singular-vocative":"greierașule","plural-vocative":"greierașilor"}},{"word":"greiere","pos":"noun","definitions":["alternative form of greier"],"forms":{"plural":"greieri"}},{"word":"greierel","pos":"noun","definitions":["diminutive of greier; small cricket"],"forms":{"plural":"greierei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greierel","accusative-definite-nominative-singular":"greierelul","accusative-indefinite-nominative-plural":"greiereli","accusative-definite-nominative-plural":"greierelii","dative-genitive-indefinite-singular":"greierel","dative-definite-genitive-singular":"greierelului","dative-genitive-indefinite-plural":"greiereli","dative-definite-genitive-plural":"greierelilor","singular-vocative":"greierelule","plural-vocative":"greierelilor"}},{"word":"greieri","pos":"noun","definitions":["plural of greier"]},{"word":"greieruș","pos":"noun","definitions":["diminutive of greier; small cricket"],"forms":{"plural":"greieruși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greieruș","accusative-definite-nominative-singular":"greierușul","accusative-indefinite-nominative-plural":"greieruși","accusative-definite-nominative-plural":"greierușii","dative-genitive-indefinite-singular":"greieruș","dative-definite-genitive-singular":"greierușului","dative-genitive-indefinite-plural":"greieruși","dative-definite-genitive-plural":"greierușilor","singular-vocative":"greierușule","plural-vocative":"greierușilor"}},{"word":"greii","pos":"adj","definitions":["nominative/accusative definite masculine plural of greu"]},{"word":"greime","pos":"noun","definitions":["weight"],"forms":{"plural":"greimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"greime","accusative-definite-nominative-singular":"greimea","accusative-indefinite-nominative-plural":"greimi","accusative-definite-nominative-plural":"greimile","dative-genitive-indefinite-singular":"greimi","dative-definite-genitive-singular":"greimii","dative-genitive-indefinite-plural":"greimi","dative-definite-genitive-plural":"greimilor","singular-vocative":"greime","plural-vocative":"greimilor"}},{"word":"grej","pos":"noun","definitions":["greige"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"grej","accusative-definite-nominative":"grejul","dative-genitive-indefinite":"grej","dative-definite-genitive":"grejului","vocative":"grejule"}},{"word":"Grejdănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grejdănescu"}},{"word":"grele","pos":"adj","definitions":["inflection of greu:","genitive/dative indefinite feminine singular","nominative/accusative indefinite neuter/feminine plural","genitive/dative indefinite neuter/feminine plural"]},{"word":"grelușel de stuf","pos":"noun","definitions":["Savi's warbler (Locustella luscinioides)"],"forms":{"plural":"grelușei de stuf"}},{"word":"grelușel de zăvoi","pos":"noun","definitions":["river warbler (Locustella fluviatilis)"],"forms":{"plural":"grelușei de zăvoi"}},{"word":"grelușel pătat","pos":"noun","definitions":["grasshopper warbler (Locustella naevia)"],"forms":{"plural":"grelușei pătați"}},{"word":"grena","pos":"adj","definitions":["garnet (color)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grena","error-unrecognized-form-feminine-indefinite-singular":"grena","error-unrecognized-form-indefinite-masculine-plural":"grena","error-unrecognized-form-feminine-indefinite-neuter-plural":"grena","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"grenada","pos":"noun","definitions":["definite nominative/accusative singular of grenadă"],"pronunciation":"[ɡreˈnada]","gender":"f"},{"word":"grenadă","pos":"noun","definitions":["grenade"],"forms":{"plural":"grenade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grenadă","accusative-definite-nominative-singular":"grenada","accusative-indefinite-nominative-plural":"grenade","accusative-definite-nominative-plural":"grenadele","dative-genitive-indefinite-singular":"grenade","dative-definite-genitive-singular":"grenadei","dative-genitive-indefinite-plural":"grenade","dative-definite-genitive-plural":"grenadelor","singular-vocative":"grenadă","plural-vocative":"grenadelor","alternative-common":"granată"}},{"word":"grenadă de mână","pos":"noun","definitions":["hand grenade"],"forms":{"plural":"grenade de mână"}},{"word":"grenade","pos":"noun","definitions":["inflection of grenadă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ɡreˈnade]","gender":"f-p"},{"word":"grenadian","pos":"adj","definitions":["from or pertaining to Grenada"],"forms":{"feminine-singular":"grenadiană","masculine-plural":"grenadieni","feminine-neuter-plural":"grenadiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grenadian","error-unrecognized-form-feminine-indefinite-singular":"grenadiană","error-unrecognized-form-indefinite-masculine-plural":"grenadieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"grenadiene","definite-error-unrecognized-form-masculine-neuter-singular":"grenadianul","definite-error-unrecognized-form-feminine-singular":"grenadiana","definite-error-unrecognized-form-masculine-plural":"grenadienii","definite-error-unrecognized-form-feminine-neuter-plural":"grenadienele"}},{"word":"grenadian","pos":"noun","definitions":["a male inhabitant of Grenada"],"forms":{"plural":"grenadieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grenadian","accusative-definite-nominative-singular":"grenadianul","accusative-indefinite-nominative-plural":"grenadieni","accusative-definite-nominative-plural":"grenadienii","dative-genitive-indefinite-singular":"grenadian","dative-definite-genitive-singular":"grenadianului","dative-genitive-indefinite-plural":"grenadieni","dative-definite-genitive-plural":"grenadienilor","singular-vocative":"grenadianule","plural-vocative":"grenadienilor"}},{"word":"grenadiană","pos":"noun","definitions":["female equivalent of grenadian"],"forms":{"plural":"grenadiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grenadiană","accusative-definite-nominative-singular":"grenadiana","accusative-indefinite-nominative-plural":"grenadiene","accusative-definite-nominative-plural":"grenadienele","dative-genitive-indefinite-singular":"grenadiene","dative-definite-genitive-singular":"grenadienei","dative-genitive-indefinite-plural":"grenadiene","dative-definite-genitive-plural":"grenadienelor","singular-vocative":"grenadiană","plural-vocative":"grenadienelor"}},{"word":"grenadier","pos":"noun","definitions":["grenadier"],"forms":{"plural":"grenadieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grenadier","accusative-definite-nominative-singular":"grenadierul","accusative-indefinite-nominative-plural":"grenadieri","accusative-definite-nominative-plural":"grenadierii","dative-genitive-indefinite-singular":"grenadier","dative-definite-genitive-singular":"grenadierului","dative-genitive-indefinite-plural":"grenadieri","dative-definite-genitive-plural":"grenadierilor","singular-vocative":"grenadierule","plural-vocative":"grenadierilor"}},{"word":"grenadină","pos":"noun","definitions":["grenadine"],"forms":{"plural":"grenadine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grenadină","accusative-definite-nominative-singular":"grenadina","accusative-indefinite-nominative-plural":"grenadine","accusative-definite-nominative-plural":"grenadinele","dative-genitive-indefinite-singular":"grenadine","dative-definite-genitive-singular":"grenadinei","dative-genitive-indefinite-plural":"grenadine","dative-definite-genitive-plural":"grenadinelor","singular-vocative":"grenadină","plural-vocative":"grenadinelor"}},{"word":"grenadir","pos":"noun","definitions":["alternative form of grenadier"],"forms":{"plural":"grenadiri"}},{"word":"grenată","pos":"noun","definitions":["obsolete form of grenadă"],"forms":{"plural":"grenate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grenată","accusative-definite-nominative-singular":"grenata","accusative-indefinite-nominative-plural":"grenate","accusative-definite-nominative-plural":"grenatele","dative-genitive-indefinite-singular":"grenate","dative-definite-genitive-singular":"grenatei","dative-genitive-indefinite-plural":"grenate","dative-definite-genitive-plural":"grenatelor","singular-vocative":"grenată","plural-vocative":"grenatelor"}},{"word":"greoi","pos":"adj","definitions":["cumbersome, clunky, slow, poky","stodgy, dull","cloddish"],"pronunciation":"/ɡreˈoj/","forms":{"feminine-singular":"greoaie","masculine-plural":"greoi","feminine-neuter-plural":"greoaie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greoi","error-unrecognized-form-feminine-indefinite-singular":"greoaie","error-unrecognized-form-indefinite-masculine-plural":"greoi","error-unrecognized-form-feminine-indefinite-neuter-plural":"greoaie","definite-error-unrecognized-form-masculine-neuter-singular":"greoiul","definite-error-unrecognized-form-feminine-singular":"greoaia","definite-error-unrecognized-form-masculine-plural":"greoii","definite-error-unrecognized-form-feminine-neuter-plural":"greoaiele"}},{"word":"Greoni","pos":"name","definitions":["a village in Grădinari, Caraș-Severin County, Romania"],"gender":"m"},{"word":"grep","pos":"noun","definitions":["grapefruit"],"forms":{"plural":"grepuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grep","accusative-definite-nominative-singular":"grepul","accusative-indefinite-nominative-plural":"grepuri","accusative-definite-nominative-plural":"grepurile","dative-genitive-indefinite-singular":"grep","dative-definite-genitive-singular":"grepului","dative-genitive-indefinite-plural":"grepuri","dative-definite-genitive-plural":"grepurilor","singular-vocative":"grepule","plural-vocative":"grepurilor"}},{"word":"grepfrut","pos":"noun","definitions":["grapefruit"],"pronunciation":"/ˈɡrep.frut/","forms":{"plural":"grepfruturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grepfrut","accusative-definite-nominative-singular":"grepfrutul","accusative-indefinite-nominative-plural":"grepfruturi","accusative-definite-nominative-plural":"grepfruturile","dative-genitive-indefinite-singular":"grepfrut","dative-definite-genitive-singular":"grepfrutului","dative-genitive-indefinite-plural":"grepfruturi","dative-definite-genitive-plural":"grepfruturilor","singular-vocative":"grepfrutule","plural-vocative":"grepfruturilor","alternative":"grape-fruit"}},{"word":"grepfruturi","pos":"noun","definitions":["plural of grepfrut"]},{"word":"gres","pos":"noun","definitions":["sandstone"],"forms":{"plural":"gresuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gres","accusative-definite-nominative-singular":"gresul","accusative-indefinite-nominative-plural":"gresuri","accusative-definite-nominative-plural":"gresurile","dative-genitive-indefinite-singular":"gres","dative-definite-genitive-singular":"gresului","dative-genitive-indefinite-plural":"gresuri","dative-definite-genitive-plural":"gresurilor","singular-vocative":"gresule","plural-vocative":"gresurilor"}},{"word":"greș","pos":"noun","definitions":["failure"],"forms":{"plural":"greșuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"greș","accusative-definite-nominative-singular":"greșul","accusative-indefinite-nominative-plural":"greșuri","accusative-definite-nominative-plural":"greșurile","dative-genitive-indefinite-singular":"greș","dative-definite-genitive-singular":"greșului","dative-genitive-indefinite-plural":"greșuri","dative-definite-genitive-plural":"greșurilor","singular-vocative":"greșule","plural-vocative":"greșurilor"}},{"word":"gresa","pos":"verb","definitions":["to grease, to lubricate"],"pronunciation":"/ɡreˈsa/","forms":{"canonical":"a gresa 1st conjugation","present-singular-third-person":"gresează","participle-past":"gresat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gresa","gerund":"gresând","first-person-indicative-present-singular":"gresez","indicative-present-second-person-singular":"gresezi","indicative-present-singular-third-person":"gresează","first-person-indicative-plural-present":"gresăm","indicative-plural-present-second-person":"gresați","indicative-plural-present-third-person":"gresează","first-person-imperfect-indicative-singular":"gresam","imperfect-indicative-second-person-singular":"gresai","imperfect-indicative-singular-third-person":"gresa","first-person-imperfect-indicative-plural":"gresam","imperfect-indicative-plural-second-person":"gresați","imperfect-indicative-plural-third-person":"gresau","first-person-indicative-perfect-singular":"gresai","indicative-perfect-second-person-singular":"gresași","indicative-perfect-singular-third-person":"gresă","first-person-indicative-perfect-plural":"gresarăm","indicative-perfect-plural-second-person":"gresarăți","indicative-perfect-plural-third-person":"gresară","first-person-indicative-pluperfect-singular":"gresasem","indicative-pluperfect-second-person-singular":"gresaseși","indicative-pluperfect-singular-third-person":"gresase","first-person-indicative-pluperfect-plural":"gresaserăm","indicative-pluperfect-plural-second-person":"gresaserăți","indicative-pluperfect-plural-third-person":"gresaseră","first-person-present-singular-subjunctive":"să gresez","present-second-person-singular-subjunctive":"să gresezi","present-singular-subjunctive-third-person":"să greseze","first-person-plural-present-subjunctive":"să gresăm","plural-present-second-person-subjunctive":"să gresați","plural-present-subjunctive-third-person":"să greseze","imperative-second-person-singular":"gresează","imperative-plural-second-person":"gresați","imperative-negative-second-person-singular":"nu gresa","imperative-negative-plural-second-person":"nu gresați"}},{"word":"gresaj","pos":"noun","definitions":["greasing"],"forms":{"plural":"gresaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gresaj","accusative-definite-nominative-singular":"gresajul","accusative-indefinite-nominative-plural":"gresaje","accusative-definite-nominative-plural":"gresajele","dative-genitive-indefinite-singular":"gresaj","dative-definite-genitive-singular":"gresajului","dative-genitive-indefinite-plural":"gresaje","dative-definite-genitive-plural":"gresajelor","singular-vocative":"gresajule","plural-vocative":"gresajelor"}},{"word":"greșală","pos":"noun","definitions":["obsolete form of greșeală"],"forms":{"plural":"greșeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greșală","accusative-definite-nominative-singular":"greșala","accusative-indefinite-nominative-plural":"greșele","accusative-definite-nominative-plural":"greșelele","dative-genitive-indefinite-singular":"greșele","dative-definite-genitive-singular":"greșelei","dative-genitive-indefinite-plural":"greșele","dative-definite-genitive-plural":"greșelelor","singular-vocative":"greșală","plural-vocative":"greșelelor"}},{"word":"gresare","pos":"noun","definitions":["greasing"],"forms":{"plural":"gresări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gresare","accusative-definite-nominative-singular":"gresarea","accusative-indefinite-nominative-plural":"gresări","accusative-definite-nominative-plural":"gresările","dative-genitive-indefinite-singular":"gresări","dative-definite-genitive-singular":"gresării","dative-genitive-indefinite-plural":"gresări","dative-definite-genitive-plural":"gresărilor","singular-vocative":"gresare","plural-vocative":"gresărilor"}},{"word":"gresat","pos":"adj","definitions":["greased"],"forms":{"feminine-singular":"gresată","masculine-plural":"gresați","feminine-neuter-plural":"gresate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gresat","error-unrecognized-form-feminine-indefinite-singular":"gresată","error-unrecognized-form-indefinite-masculine-plural":"gresați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gresate","definite-error-unrecognized-form-masculine-neuter-singular":"gresatul","definite-error-unrecognized-form-feminine-singular":"gresata","definite-error-unrecognized-form-masculine-plural":"gresații","definite-error-unrecognized-form-feminine-neuter-plural":"gresatele"}},{"word":"greșeală","pos":"noun","definitions":["mistake"],"pronunciation":"/ɡreˈʃe̯a.lə/","forms":{"plural":"greșeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"greșeală","accusative-definite-nominative-singular":"greșeala","accusative-indefinite-nominative-plural":"greșeli","accusative-definite-nominative-plural":"greșelile","dative-genitive-indefinite-singular":"greșeli","dative-definite-genitive-singular":"greșelii","dative-genitive-indefinite-plural":"greșeli","dative-definite-genitive-plural":"greșelilor","singular-vocative":"greșeală","plural-vocative":"greșelilor"}},{"word":"greșeli","pos":"noun","definitions":["plural of greșeală"]},{"word":"greșeluță","pos":"noun","definitions":["diminutive of greșeală"],"forms":{"plural":"greșeluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"greșeluță","accusative-definite-nominative-singular":"greșeluța","accusative-indefinite-nominative-plural":"greșeluțe","accusative-definite-nominative-plural":"greșeluțele","dative-genitive-indefinite-singular":"greșeluțe","dative-definite-genitive-singular":"greșeluței","dative-genitive-indefinite-plural":"greșeluțe","dative-definite-genitive-plural":"greșeluțelor","singular-vocative":"greșeluță","plural-vocative":"greșeluțelor"}},{"word":"greși","pos":"verb","definitions":["to err, to do wrong, to mistake","to transgress, trespass","to be at fault"],"pronunciation":"/ɡreˈʃi/","forms":{"canonical":"a greși 4th conjugation","present-singular-third-person":"greșește","participle-past":"greșit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a greși","gerund":"greșind","first-person-indicative-present-singular":"greșesc","indicative-present-second-person-singular":"greșești","indicative-present-singular-third-person":"greșește","first-person-indicative-plural-present":"greșim","indicative-plural-present-second-person":"greșiți","indicative-plural-present-third-person":"greșesc","first-person-imperfect-indicative-singular":"greșeam","imperfect-indicative-second-person-singular":"greșeai","imperfect-indicative-singular-third-person":"greșea","first-person-imperfect-indicative-plural":"greșeam","imperfect-indicative-plural-second-person":"greșeați","imperfect-indicative-plural-third-person":"greșeau","first-person-indicative-perfect-singular":"greșii","indicative-perfect-second-person-singular":"greșiși","indicative-perfect-singular-third-person":"greși","first-person-indicative-perfect-plural":"greșirăm","indicative-perfect-plural-second-person":"greșirăți","indicative-perfect-plural-third-person":"greșiră","first-person-indicative-pluperfect-singular":"greșisem","indicative-pluperfect-second-person-singular":"greșiseși","indicative-pluperfect-singular-third-person":"greșise","first-person-indicative-pluperfect-plural":"greșiserăm","indicative-pluperfect-plural-second-person":"greșiserăți","indicative-pluperfect-plural-third-person":"greșiseră","first-person-present-singular-subjunctive":"să greșesc","present-second-person-singular-subjunctive":"să greșești","present-singular-subjunctive-third-person":"să greșească","first-person-plural-present-subjunctive":"să greșim","plural-present-second-person-subjunctive":"să greșiți","plural-present-subjunctive-third-person":"să greșească","imperative-second-person-singular":"greșește","imperative-plural-second-person":"greșiți","imperative-negative-second-person-singular":"nu greși","imperative-negative-plural-second-person":"nu greșiți"}},{"word":"Gresia","pos":"name","definitions":["a village in Bozioru, Buzău County, Romania","a village in Starchiojd, Prahova County, Romania","a village in Stejaru, Teleorman County, Romania"],"gender":"f"},{"word":"gresie","pos":"noun","definitions":["whetstone"],"forms":{"plural":"gresii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gresie","accusative-definite-nominative-singular":"gresia","accusative-indefinite-nominative-plural":"gresii","accusative-definite-nominative-plural":"gresiile","dative-genitive-indefinite-singular":"gresii","dative-definite-genitive-singular":"gresiei","dative-genitive-indefinite-plural":"gresii","dative-definite-genitive-plural":"gresiilor","singular-vocative":"gresie","plural-vocative":"gresiilor"}},{"word":"greșit","pos":"adj","definitions":["wrong"],"forms":{"feminine-singular":"greșită","masculine-plural":"greșiți","feminine-neuter-plural":"greșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greșit","error-unrecognized-form-feminine-indefinite-singular":"greșită","error-unrecognized-form-indefinite-masculine-plural":"greșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"greșite","definite-error-unrecognized-form-masculine-neuter-singular":"greșitul","definite-error-unrecognized-form-feminine-singular":"greșita","definite-error-unrecognized-form-masculine-plural":"greșiții","definite-error-unrecognized-form-feminine-neuter-plural":"greșitele"}},{"word":"greșnic","pos":"noun","definitions":["sinner"],"forms":{"plural":"greșnici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"greșnic","accusative-definite-nominative-singular":"greșnicul","accusative-indefinite-nominative-plural":"greșnici","accusative-definite-nominative-plural":"greșnicii","dative-genitive-indefinite-singular":"greșnic","dative-definite-genitive-singular":"greșnicului","dative-genitive-indefinite-plural":"greșnici","dative-definite-genitive-plural":"greșnicilor","singular-vocative":"greșnicule","plural-vocative":"greșnicilor"}},{"word":"gresor","pos":"noun","definitions":["greaser"],"forms":{"plural":"gresoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gresor","accusative-definite-nominative-singular":"gresorul","accusative-indefinite-nominative-plural":"gresore","accusative-definite-nominative-plural":"gresorele","dative-genitive-indefinite-singular":"gresor","dative-definite-genitive-singular":"gresorului","dative-genitive-indefinite-plural":"gresore","dative-definite-genitive-plural":"gresorelor","singular-vocative":"gresorule","plural-vocative":"gresorelor"}},{"word":"grețos","pos":"adj","definitions":["nauseous, nauseated, queasy, sick"],"pronunciation":"/ɡreˈt͡sos/","forms":{"feminine-singular":"grețoasă","masculine-plural":"grețoși","feminine-neuter-plural":"grețoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grețos","error-unrecognized-form-feminine-indefinite-singular":"grețoasă","error-unrecognized-form-indefinite-masculine-plural":"grețoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grețoase","definite-error-unrecognized-form-masculine-neuter-singular":"grețosul","definite-error-unrecognized-form-feminine-singular":"grețoasa","definite-error-unrecognized-form-masculine-plural":"grețoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grețoasele"}},{"word":"greu","pos":"adj","definitions":["heavy","hard, difficult","pregnant"],"pronunciation":"/ɡrew/","examples":[{"ro":"a rămâne grea","en":"to get pregnant"}],"forms":{"feminine-singular":"grea","masculine-plural":"grei","feminine-neuter-plural":"grele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greu","error-unrecognized-form-feminine-indefinite-singular":"grea","error-unrecognized-form-indefinite-masculine-plural":"grei","error-unrecognized-form-feminine-indefinite-neuter-plural":"grele","definite-error-unrecognized-form-masculine-neuter-singular":"greul","definite-error-unrecognized-form-feminine-singular":"greaua","definite-error-unrecognized-form-masculine-plural":"greii","definite-error-unrecognized-form-feminine-neuter-plural":"grelele"}},{"word":"greu","pos":"noun","definitions":["difficulty or hardship"],"pronunciation":"/ɡrew/","examples":[{"ro":"cu greu","en":"with difficulty"},{"ro":"Greul abia acum începe.","en":"The hard part only begins now."}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"greu","accusative-definite-nominative":"greul","dative-genitive-indefinite":"greu","dative-definite-genitive":"greului","vocative":"greule"}},{"word":"greuință","pos":"noun","definitions":["synonym of greutate (“difficulty, burden”)"],"pronunciation":"/ɡre.uˈin.t͡sə/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"greuință","accusative-definite-nominative":"greuința","dative-genitive-indefinite":"greuințe","dative-definite-genitive":"greuinței","vocative":"greuință"}},{"word":"Greul","pos":"name","definitions":["a river in Sibiu County, Romania, tributary to the Pârâul Negru"],"gender":"m"},{"word":"greuleț","pos":"adv","definitions":["diminutive of greu"]},{"word":"greunatic","pos":"adj","definitions":["sluggish"],"forms":{"feminine-singular":"greunatică","masculine-plural":"greunatici","feminine-neuter-plural":"greunatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greunatic","error-unrecognized-form-feminine-indefinite-singular":"greunatică","error-unrecognized-form-indefinite-masculine-plural":"greunatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"greunatice","definite-error-unrecognized-form-masculine-neuter-singular":"greunaticul","definite-error-unrecognized-form-feminine-singular":"greunatica","definite-error-unrecognized-form-masculine-plural":"greunaticii","definite-error-unrecognized-form-feminine-neuter-plural":"greunaticele"}},{"word":"greușor","pos":"adj","definitions":["diminutive of greu"],"forms":{"feminine-singular":"greușoră","masculine-plural":"greușori","feminine-neuter-plural":"greușore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greușor","error-unrecognized-form-feminine-indefinite-singular":"greușoră","error-unrecognized-form-indefinite-masculine-plural":"greușori","error-unrecognized-form-feminine-indefinite-neuter-plural":"greușore","definite-error-unrecognized-form-masculine-neuter-singular":"greușorul","definite-error-unrecognized-form-feminine-singular":"greușora","definite-error-unrecognized-form-masculine-plural":"greușorii","definite-error-unrecognized-form-feminine-neuter-plural":"greușorele"}},{"word":"greuț","pos":"adj","definitions":["diminutive of greu"],"forms":{"feminine-singular":"greuță","masculine-plural":"greuți","feminine-neuter-plural":"greuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"greuț","error-unrecognized-form-feminine-indefinite-singular":"greuță","error-unrecognized-form-indefinite-masculine-plural":"greuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"greuțe","definite-error-unrecognized-form-masculine-neuter-singular":"greuțul","definite-error-unrecognized-form-feminine-singular":"greuța","definite-error-unrecognized-form-masculine-plural":"greuții","definite-error-unrecognized-form-feminine-neuter-plural":"greuțele"}},{"word":"greutate","pos":"noun","definitions":["weight","difficulty"],"pronunciation":"/ɡre.uˈta.te/","examples":[{"ro":"El are mari greutăți în a-și aminti nume.","en":"He has a hard time remembering names."}],"forms":{"plural":"greutăți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative-singular":"greutate","accusative-definite-nominative-singular":"greutatea","accusative-indefinite-nominative-plural":"greutăți","accusative-definite-nominative-plural":"greutățile","dative-genitive-indefinite-singular":"greutăți","dative-definite-genitive-singular":"greutății","dative-genitive-indefinite-plural":"greutăți","dative-definite-genitive-plural":"greutăților","singular-vocative":"greutate","plural-vocative":"greutăților","alternative":"греутате"}},{"word":"greutate atomică","pos":"noun","definitions":["atomic weight"],"forms":{"plural":"greutăți atomice"}},{"word":"greutate moleculară","pos":"noun","definitions":["molecular weight"],"forms":{"plural":"greutăți moleculare"}},{"word":"greutate specifică","pos":"noun","definitions":["specific gravity"]},{"word":"greva","pos":"noun","definitions":["definite nominative/accusative singular of grevă"],"pronunciation":"[ˈɡreva]","gender":"f"},{"word":"greva","pos":"verb","definitions":["to put a mortgage on a property"],"pronunciation":"[ɡreˈva]","forms":{"canonical":"a greva 1st conjugation","present-singular-third-person":"grevează","participle-past":"grevat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a greva","gerund":"grevând","first-person-indicative-present-singular":"grevez","indicative-present-second-person-singular":"grevezi","indicative-present-singular-third-person":"grevează","first-person-indicative-plural-present":"grevăm","indicative-plural-present-second-person":"grevați","indicative-plural-present-third-person":"grevează","first-person-imperfect-indicative-singular":"grevam","imperfect-indicative-second-person-singular":"grevai","imperfect-indicative-singular-third-person":"greva","first-person-imperfect-indicative-plural":"grevam","imperfect-indicative-plural-second-person":"grevați","imperfect-indicative-plural-third-person":"grevau","first-person-indicative-perfect-singular":"grevai","indicative-perfect-second-person-singular":"grevași","indicative-perfect-singular-third-person":"grevă","first-person-indicative-perfect-plural":"grevarăm","indicative-perfect-plural-second-person":"grevarăți","indicative-perfect-plural-third-person":"grevară","first-person-indicative-pluperfect-singular":"grevasem","indicative-pluperfect-second-person-singular":"grevaseși","indicative-pluperfect-singular-third-person":"grevase","first-person-indicative-pluperfect-plural":"grevaserăm","indicative-pluperfect-plural-second-person":"grevaserăți","indicative-pluperfect-plural-third-person":"grevaseră","first-person-present-singular-subjunctive":"să grevez","present-second-person-singular-subjunctive":"să grevezi","present-singular-subjunctive-third-person":"să greveze","first-person-plural-present-subjunctive":"să grevăm","plural-present-second-person-subjunctive":"să grevați","plural-present-subjunctive-third-person":"să greveze","imperative-second-person-singular":"grevează","imperative-plural-second-person":"grevați","imperative-negative-second-person-singular":"nu greva","imperative-negative-plural-second-person":"nu grevați"}},{"word":"grevă","pos":"noun","definitions":["strike (work stoppage)"],"forms":{"plural":"greve","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grevă","accusative-definite-nominative-singular":"greva","accusative-indefinite-nominative-plural":"greve","accusative-definite-nominative-plural":"grevele","dative-genitive-indefinite-singular":"greve","dative-definite-genitive-singular":"grevei","dative-genitive-indefinite-plural":"greve","dative-definite-genitive-plural":"grevelor","singular-vocative":"grevă","plural-vocative":"grevelor"}},{"word":"greva foamei","pos":"noun","definitions":["hunger strike"]},{"word":"grevat","pos":"adj","definitions":["mortgaged"],"forms":{"feminine-singular":"grevată","masculine-plural":"grevați","feminine-neuter-plural":"grevate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grevat","error-unrecognized-form-feminine-indefinite-singular":"grevată","error-unrecognized-form-indefinite-masculine-plural":"grevați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grevate","definite-error-unrecognized-form-masculine-neuter-singular":"grevatul","definite-error-unrecognized-form-feminine-singular":"grevata","definite-error-unrecognized-form-masculine-plural":"grevații","definite-error-unrecognized-form-feminine-neuter-plural":"grevatele"}},{"word":"grevat","pos":"verb","definitions":["past participle of greva"],"forms":{"participle-past":"of greva"}},{"word":"greve","pos":"noun","definitions":["inflection of grevă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡreve]","gender":"f-p"},{"word":"grevist","pos":"noun","definitions":["striker"],"forms":{"plural":"greviști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grevist","accusative-definite-nominative-singular":"grevistul","accusative-indefinite-nominative-plural":"greviști","accusative-definite-nominative-plural":"greviștii","dative-genitive-indefinite-singular":"grevist","dative-definite-genitive-singular":"grevistului","dative-genitive-indefinite-plural":"greviști","dative-definite-genitive-plural":"greviștilor","singular-vocative":"grevistule","plural-vocative":"greviștilor"}},{"word":"grevistă","pos":"noun","definitions":["female equivalent of grevist"],"forms":{"plural":"greviste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grevistă","accusative-definite-nominative-singular":"grevista","accusative-indefinite-nominative-plural":"greviste","accusative-definite-nominative-plural":"grevistele","dative-genitive-indefinite-singular":"greviste","dative-definite-genitive-singular":"grevistei","dative-genitive-indefinite-plural":"greviste","dative-definite-genitive-plural":"grevistelor","singular-vocative":"grevistă","plural-vocative":"grevistelor"}},{"word":"grezie","pos":"noun","definitions":["alternative form of gresie"],"forms":{"plural":"grezii"}},{"word":"grezos","pos":"adj","definitions":["arenose"],"forms":{"feminine-singular":"grezoasă","masculine-plural":"grezoși","feminine-neuter-plural":"grezoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grezos","error-unrecognized-form-feminine-indefinite-singular":"grezoasă","error-unrecognized-form-indefinite-masculine-plural":"grezoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grezoase","definite-error-unrecognized-form-masculine-neuter-singular":"grezosul","definite-error-unrecognized-form-feminine-singular":"grezoasa","definite-error-unrecognized-form-masculine-plural":"grezoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grezoasele"}},{"word":"gri","pos":"adj","definitions":["grey"],"pronunciation":"/ɡri/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gri","error-unrecognized-form-feminine-indefinite-singular":"gri","error-unrecognized-form-indefinite-masculine-plural":"gri","error-unrecognized-form-feminine-indefinite-neuter-plural":"gri","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"gri","pos":"noun","definitions":["grey (colour)"],"pronunciation":"/ɡri/","forms":{"plural":"griuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gri","accusative-definite-nominative-singular":"griul","accusative-indefinite-nominative-plural":"griuri","accusative-definite-nominative-plural":"griurile","dative-genitive-indefinite-singular":"gri","dative-definite-genitive-singular":"griului","dative-genitive-indefinite-plural":"griuri","dative-definite-genitive-plural":"griurilor","singular-vocative":"griule","plural-vocative":"griurilor"}},{"word":"Gridan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gridan"}},{"word":"grier","pos":"noun","definitions":["alternative form of greier"],"forms":{"plural":"grieri"}},{"word":"griere","pos":"noun","definitions":["obsolete form of greier"],"forms":{"plural":"grieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"griere","accusative-definite-nominative-singular":"griereul","accusative-indefinite-nominative-plural":"grieri","accusative-definite-nominative-plural":"grierii","dative-genitive-indefinite-singular":"griere","dative-definite-genitive-singular":"griereului","dative-genitive-indefinite-plural":"grieri","dative-definite-genitive-plural":"grierilor","singular-vocative":"griereule","plural-vocative":"grierilor"}},{"word":"grierel","pos":"noun","definitions":["alternative form of greierel"],"forms":{"plural":"grierei"}},{"word":"Griești","pos":"name","definitions":["a village in Țibănești, Iași County, Romania"],"gender":"m"},{"word":"grifon","pos":"noun","definitions":["griffin"],"forms":{"plural":"grifoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grifon","accusative-definite-nominative-singular":"grifonul","accusative-indefinite-nominative-plural":"grifoni","accusative-definite-nominative-plural":"grifonii","dative-genitive-indefinite-singular":"grifon","dative-definite-genitive-singular":"grifonului","dative-genitive-indefinite-plural":"grifoni","dative-definite-genitive-plural":"grifonilor","singular-vocative":"grifonule","plural-vocative":"grifonilor"}},{"word":"grifoni","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of grifon"],"pronunciation":"[ɡriˈfonʲ]","gender":"m-p"},{"word":"grifonii","pos":"noun","definitions":["definite nominative/accusative plural of grifon"]},{"word":"grifonilor","pos":"noun","definitions":["definite genitive/dative plural of grifon"]},{"word":"grifonul","pos":"noun","definitions":["definite nominative/accusative singular of grifon"]},{"word":"grifonului","pos":"noun","definitions":["definite genitive/dative singular of grifon"]},{"word":"Grigoraș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigoraș"}},{"word":"Grigorășel","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigorășel"}},{"word":"Grigorăuca","pos":"name","definitions":["a village in Bădiceni, Soroca Raion, Moldova","a village in Grigorăuca, Sîngerei Raion, Moldova","a commune of Sîngerei Raion, Moldova"],"gender":"f"},{"word":"Grigore","pos":"name","definitions":["a male given name from Ancient Greek, equivalent to English Gregory"],"gender":"m","forms":{"dative-genitive":"lui Grigore"}},{"word":"Grigoreni","pos":"name","definitions":["a village in Scorțeni, Bacău County, Romania"],"gender":"m"},{"word":"Grigorescu","pos":"name","definitions":["a surname"],"pronunciation":"/ɡri.ɡoˈres.ku/","gender":"m","forms":{"dative-genitive":"lui Grigorescu","alternative":"Григореску"}},{"word":"Grigorești","pos":"name","definitions":["a village in Siminicea, Suceava County, Romania"],"gender":"m"},{"word":"Grigorică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigorică"}},{"word":"Grigorievca","pos":"name","definitions":["a village in Grigorievca, Căușeni Raion, Moldova","a commune of Căușeni Raion, Moldova"],"gender":"f"},{"word":"Grigoriopol","pos":"name","definitions":["a town in Transnistria, Moldova"],"pronunciation":"/ɡriɡoriˈopol/","gender":"m"},{"word":"Grigoriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigoriță"}},{"word":"Grigoroaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Grigoroaia"}},{"word":"Grigoroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grigoroiu"}},{"word":"Grigoru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigoru"}},{"word":"Grigoruț","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigoruț"}},{"word":"Grigoruță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grigoruță"}},{"word":"grija","pos":"noun","definitions":["definite nominative/accusative singular of grijă"]},{"word":"grijă","pos":"noun","definitions":["worry","care (looking out for something)","carefulness, attentiveness, meticulousness","memorial service"],"pronunciation":"/ˈɡri.ʒə/","examples":[{"ro":"fără nicio grijă","en":"without a care"},{"ro":"îi avea/purta grija cuiva","en":"to be worried for someone"},{"ro":"în grija cuiva","en":"in someone’s care"}],"forms":{"plural":"griji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grijă","accusative-definite-nominative-singular":"grija","accusative-indefinite-nominative-plural":"griji","accusative-definite-nominative-plural":"grijile","dative-genitive-indefinite-singular":"griji","dative-definite-genitive-singular":"grijii","dative-genitive-indefinite-plural":"griji","dative-definite-genitive-plural":"grijilor","singular-vocative":"grijă","plural-vocative":"grijilor","alternative":"grije"}},{"word":"grijanie","pos":"noun","definitions":["Holy Communion (ritual)","Eucharist (the substance consumed)"],"pronunciation":"/ɡriˈʒa.ni.e/","forms":{"plural":"grijanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grijanie","accusative-definite-nominative-singular":"grijania","accusative-indefinite-nominative-plural":"grijanii","accusative-definite-nominative-plural":"grijaniile","dative-genitive-indefinite-singular":"grijanii","dative-definite-genitive-singular":"grijaniei","dative-genitive-indefinite-plural":"grijanii","dative-definite-genitive-plural":"grijaniilor","singular-vocative":"grijanie","plural-vocative":"grijaniilor"}},{"word":"grije","pos":"noun","definitions":["obsolete form of grijă"],"forms":{"plural":"griji","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grije","accusative-definite-nominative-singular":"grijea","accusative-indefinite-nominative-plural":"griji","accusative-definite-nominative-plural":"grijile","dative-genitive-indefinite-singular":"griji","dative-definite-genitive-singular":"grijii","dative-genitive-indefinite-plural":"griji","dative-definite-genitive-plural":"grijilor","singular-vocative":"grije","plural-vocative":"grijilor"}},{"word":"griji","pos":"verb","definitions":["to take care"],"forms":{"canonical":"a griji 4th conjugation","present-singular-third-person":"grijește","participle-past":"grijit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a griji","gerund":"grijind","first-person-indicative-present-singular":"grijesc","indicative-present-second-person-singular":"grijești","indicative-present-singular-third-person":"grijește","first-person-indicative-plural-present":"grijim","indicative-plural-present-second-person":"grijiți","indicative-plural-present-third-person":"grijesc","first-person-imperfect-indicative-singular":"grijeam","imperfect-indicative-second-person-singular":"grijeai","imperfect-indicative-singular-third-person":"grijea","first-person-imperfect-indicative-plural":"grijeam","imperfect-indicative-plural-second-person":"grijeați","imperfect-indicative-plural-third-person":"grijeau","first-person-indicative-perfect-singular":"grijii","indicative-perfect-second-person-singular":"grijiși","indicative-perfect-singular-third-person":"griji","first-person-indicative-perfect-plural":"grijirăm","indicative-perfect-plural-second-person":"grijirăți","indicative-perfect-plural-third-person":"grijiră","first-person-indicative-pluperfect-singular":"grijisem","indicative-pluperfect-second-person-singular":"grijiseși","indicative-pluperfect-singular-third-person":"grijise","first-person-indicative-pluperfect-plural":"grijiserăm","indicative-pluperfect-plural-second-person":"grijiserăți","indicative-pluperfect-plural-third-person":"grijiseră","first-person-present-singular-subjunctive":"să grijesc","present-second-person-singular-subjunctive":"să grijești","present-singular-subjunctive-third-person":"să grijească","first-person-plural-present-subjunctive":"să grijim","plural-present-second-person-subjunctive":"să grijiți","plural-present-subjunctive-third-person":"să grijească","imperative-second-person-singular":"grijește","imperative-plural-second-person":"grijiți","imperative-negative-second-person-singular":"nu griji","imperative-negative-plural-second-person":"nu grijiți"}},{"word":"griji","pos":"noun","definitions":["inflection of grijă:","plural","genitive/dative singular"]},{"word":"grijii","pos":"noun","definitions":["definite dative/genitive singular of grijă"]},{"word":"grijile","pos":"noun","definitions":["definite nominative/accusative plural of grijă"]},{"word":"grijilor","pos":"noun","definitions":["inflection of grijă:","definite genitive/dative plural","vocative plural"]},{"word":"grijință","pos":"noun","definitions":["care, protection"],"forms":{"plural":"grijințe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grijință","accusative-definite-nominative-singular":"grijința","accusative-indefinite-nominative-plural":"grijințe","accusative-definite-nominative-plural":"grijințele","dative-genitive-indefinite-singular":"grijințe","dative-definite-genitive-singular":"grijinței","dative-genitive-indefinite-plural":"grijințe","dative-definite-genitive-plural":"grijințelor","singular-vocative":"grijință","plural-vocative":"grijințelor"}},{"word":"grijire","pos":"noun","definitions":["Eucharist"],"forms":{"plural":"grijiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grijire","accusative-definite-nominative-singular":"grijirea","accusative-indefinite-nominative-plural":"grijiri","accusative-definite-nominative-plural":"grijirile","dative-genitive-indefinite-singular":"grijiri","dative-definite-genitive-singular":"grijirii","dative-genitive-indefinite-plural":"grijiri","dative-definite-genitive-plural":"grijirilor","singular-vocative":"grijire","plural-vocative":"grijirilor"}},{"word":"grijit","pos":"noun","definitions":["caring"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"grijit","accusative-definite-nominative":"grijitul","dative-genitive-indefinite":"grijit","dative-definite-genitive":"grijitului","vocative":"grijitule"}},{"word":"grijit","pos":"verb","definitions":["past participle of griji"],"forms":{"participle-past":"of griji"}},{"word":"grijitor","pos":"adj","definitions":["caring"],"forms":{"feminine-singular":"grijitoare","masculine-plural":"grijitori","feminine-neuter-plural":"grijitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grijitor","error-unrecognized-form-feminine-indefinite-singular":"grijitoare","error-unrecognized-form-indefinite-masculine-plural":"grijitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grijitoare","definite-error-unrecognized-form-masculine-neuter-singular":"grijitorul","definite-error-unrecognized-form-feminine-singular":"grijitoarea","definite-error-unrecognized-form-masculine-plural":"grijitorii","definite-error-unrecognized-form-feminine-neuter-plural":"grijitoarele"}},{"word":"grijitură","pos":"noun","definitions":["care"],"forms":{"plural":"grijituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grijitură","accusative-definite-nominative-singular":"grijitura","accusative-indefinite-nominative-plural":"grijituri","accusative-definite-nominative-plural":"grijiturile","dative-genitive-indefinite-singular":"grijituri","dative-definite-genitive-singular":"grijiturii","dative-genitive-indefinite-plural":"grijituri","dative-definite-genitive-plural":"grijiturilor","singular-vocative":"grijitură","plural-vocative":"grijiturilor"}},{"word":"grijliv","pos":"adj","definitions":["obsolete form of grijuliu"],"forms":{"feminine-singular":"grijlivă","masculine-plural":"grijlivi","feminine-neuter-plural":"grijlive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grijliv","error-unrecognized-form-feminine-indefinite-singular":"grijlivă","error-unrecognized-form-indefinite-masculine-plural":"grijlivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grijlive","definite-error-unrecognized-form-masculine-neuter-singular":"grijlivul","definite-error-unrecognized-form-feminine-singular":"grijliva","definite-error-unrecognized-form-masculine-plural":"grijlivii","definite-error-unrecognized-form-feminine-neuter-plural":"grijlivele"}},{"word":"grijuliu","pos":"adj","definitions":["careful, cautious, prudent","considerate","heedful, mindful, attentive"],"pronunciation":"/ɡri.ʒuˈliw/","forms":{"feminine-singular":"grijulie","plural":"grijulii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grijuliu","error-unrecognized-form-feminine-indefinite-singular":"grijulie","error-unrecognized-form-indefinite-masculine-plural":"grijulii","error-unrecognized-form-feminine-indefinite-neuter-plural":"grijulii","definite-error-unrecognized-form-masculine-neuter-singular":"grijuliul","definite-error-unrecognized-form-feminine-singular":"grijulia","definite-error-unrecognized-form-masculine-plural":"grijuliii","definite-error-unrecognized-form-feminine-neuter-plural":"grijuliile"}},{"word":"grijuliv","pos":"adj","definitions":["alternative form of grijuliu"],"forms":{"feminine-singular":"grijulivă","masculine-plural":"grijulivi","feminine-neuter-plural":"grijulive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grijuliv","error-unrecognized-form-feminine-indefinite-singular":"grijulivă","error-unrecognized-form-indefinite-masculine-plural":"grijulivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grijulive","definite-error-unrecognized-form-masculine-neuter-singular":"grijulivul","definite-error-unrecognized-form-feminine-singular":"grijuliva","definite-error-unrecognized-form-masculine-plural":"grijulivii","definite-error-unrecognized-form-feminine-neuter-plural":"grijulivele"}},{"word":"grilă","pos":"noun","definitions":["grille","multiple-choice exam"],"forms":{"plural":"grile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grilă","accusative-definite-nominative-singular":"grila","accusative-indefinite-nominative-plural":"grile","accusative-definite-nominative-plural":"grilele","dative-genitive-indefinite-singular":"grile","dative-definite-genitive-singular":"grilei","dative-genitive-indefinite-plural":"grile","dative-definite-genitive-plural":"grilelor","singular-vocative":"grilă","plural-vocative":"grilelor"}},{"word":"grilaj","pos":"noun","definitions":["grill"],"forms":{"plural":"grilaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grilaj","accusative-definite-nominative-singular":"grilajul","accusative-indefinite-nominative-plural":"grilaje","accusative-definite-nominative-plural":"grilajele","dative-genitive-indefinite-singular":"grilaj","dative-definite-genitive-singular":"grilajului","dative-genitive-indefinite-plural":"grilaje","dative-definite-genitive-plural":"grilajelor","singular-vocative":"grilajule","plural-vocative":"grilajelor"}},{"word":"grima","pos":"verb","definitions":["to make up (about actors)"],"forms":{"canonical":"a grima 1st conjugation","present-singular-third-person":"grimează","participle-past":"grimat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grima","gerund":"grimând","first-person-indicative-present-singular":"grimez","indicative-present-second-person-singular":"grimezi","indicative-present-singular-third-person":"grimează","first-person-indicative-plural-present":"grimăm","indicative-plural-present-second-person":"grimați","indicative-plural-present-third-person":"grimează","first-person-imperfect-indicative-singular":"grimam","imperfect-indicative-second-person-singular":"grimai","imperfect-indicative-singular-third-person":"grima","first-person-imperfect-indicative-plural":"grimam","imperfect-indicative-plural-second-person":"grimați","imperfect-indicative-plural-third-person":"grimau","first-person-indicative-perfect-singular":"grimai","indicative-perfect-second-person-singular":"grimași","indicative-perfect-singular-third-person":"grimă","first-person-indicative-perfect-plural":"grimarăm","indicative-perfect-plural-second-person":"grimarăți","indicative-perfect-plural-third-person":"grimară","first-person-indicative-pluperfect-singular":"grimasem","indicative-pluperfect-second-person-singular":"grimaseși","indicative-pluperfect-singular-third-person":"grimase","first-person-indicative-pluperfect-plural":"grimaserăm","indicative-pluperfect-plural-second-person":"grimaserăți","indicative-pluperfect-plural-third-person":"grimaseră","first-person-present-singular-subjunctive":"să grimez","present-second-person-singular-subjunctive":"să grimezi","present-singular-subjunctive-third-person":"să grimeze","first-person-plural-present-subjunctive":"să grimăm","plural-present-second-person-subjunctive":"să grimați","plural-present-subjunctive-third-person":"să grimeze","imperative-second-person-singular":"grimează","imperative-plural-second-person":"grimați","imperative-negative-second-person-singular":"nu grima","imperative-negative-plural-second-person":"nu grimați"}},{"word":"grimă","pos":"noun","definitions":["makeup"],"forms":{"plural":"grime","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grimă","accusative-definite-nominative-singular":"grima","accusative-indefinite-nominative-plural":"grime","accusative-definite-nominative-plural":"grimele","dative-genitive-indefinite-singular":"grime","dative-definite-genitive-singular":"grimei","dative-genitive-indefinite-plural":"grime","dative-definite-genitive-plural":"grimelor","singular-vocative":"grimă","plural-vocative":"grimelor"}},{"word":"Grimăncăuți","pos":"name","definitions":["a village in Grimăncăuți, Briceni Raion, Moldova","a commune of Briceni Raion, Moldova"],"gender":"m"},{"word":"grimare","pos":"noun","definitions":["makeup"],"forms":{"plural":"grimări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grimare","accusative-definite-nominative-singular":"grimarea","accusative-indefinite-nominative-plural":"grimări","accusative-definite-nominative-plural":"grimările","dative-genitive-indefinite-singular":"grimări","dative-definite-genitive-singular":"grimării","dative-genitive-indefinite-plural":"grimări","dative-definite-genitive-plural":"grimărilor","singular-vocative":"grimare","plural-vocative":"grimărilor"}},{"word":"grimasă","pos":"noun","definitions":["grimace"],"forms":{"plural":"grimase"}},{"word":"grimat","pos":"adj","definitions":["with makeup on"],"forms":{"feminine-singular":"grimată","masculine-plural":"grimați","feminine-neuter-plural":"grimate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grimat","error-unrecognized-form-feminine-indefinite-singular":"grimată","error-unrecognized-form-indefinite-masculine-plural":"grimați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grimate","definite-error-unrecognized-form-masculine-neuter-singular":"grimatul","definite-error-unrecognized-form-feminine-singular":"grimata","definite-error-unrecognized-form-masculine-plural":"grimații","definite-error-unrecognized-form-feminine-neuter-plural":"grimatele"}},{"word":"grimat","pos":"verb","definitions":["past participle of grima"],"forms":{"participle-past":"of grima"}},{"word":"grimea","pos":"noun","definitions":["kerchief"],"forms":{"plural":"grimele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"grimea","accusative-definite-nominative-singular":"grimeaua","accusative-indefinite-nominative-plural":"grimele","accusative-definite-nominative-plural":"grimelele","dative-genitive-indefinite-singular":"grimele","dative-definite-genitive-singular":"grimelei","dative-genitive-indefinite-plural":"grimele","dative-definite-genitive-plural":"grimelelor","singular-vocative":"grimea","plural-vocative":"grimelelor"}},{"word":"grimeluță","pos":"noun","definitions":["diminutive of grimea"],"forms":{"plural":"grimeluțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grimeluță","accusative-definite-nominative-singular":"grimeluța","accusative-indefinite-nominative-plural":"grimeluțe","accusative-definite-nominative-plural":"grimeluțele","dative-genitive-indefinite-singular":"grimeluțe","dative-definite-genitive-singular":"grimeluței","dative-genitive-indefinite-plural":"grimeluțe","dative-definite-genitive-plural":"grimeluțelor","singular-vocative":"grimeluță","plural-vocative":"grimeluțelor"}},{"word":"grimer","pos":"noun","definitions":["alternative form of grimeur"],"forms":{"plural":"grimeri"}},{"word":"grimeră","pos":"noun","definitions":["female equivalent of grimer"],"forms":{"plural":"grimere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grimeră","accusative-definite-nominative-singular":"grimera","accusative-indefinite-nominative-plural":"grimere","accusative-definite-nominative-plural":"grimerele","dative-genitive-indefinite-singular":"grimere","dative-definite-genitive-singular":"grimerei","dative-genitive-indefinite-plural":"grimere","dative-definite-genitive-plural":"grimerelor","singular-vocative":"grimeră","plural-vocative":"grimerelor"}},{"word":"grimeur","pos":"noun","definitions":["make-up artist"],"forms":{"plural":"grimeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grimeur","accusative-definite-nominative-singular":"grimeurul","accusative-indefinite-nominative-plural":"grimeuri","accusative-definite-nominative-plural":"grimeurii","dative-genitive-indefinite-singular":"grimeur","dative-definite-genitive-singular":"grimeurului","dative-genitive-indefinite-plural":"grimeuri","dative-definite-genitive-plural":"grimeurilor","singular-vocative":"grimeurule","plural-vocative":"grimeurilor"}},{"word":"grimeură","pos":"noun","definitions":["female equivalent of grimeur"],"forms":{"plural":"grimeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grimeură","accusative-definite-nominative-singular":"grimeura","accusative-indefinite-nominative-plural":"grimeuri","accusative-definite-nominative-plural":"grimeurile","dative-genitive-indefinite-singular":"grimeuri","dative-definite-genitive-singular":"grimeurii","dative-genitive-indefinite-plural":"grimeuri","dative-definite-genitive-plural":"grimeurilor","singular-vocative":"grimeură","plural-vocative":"grimeurilor"}},{"word":"grimoar","pos":"noun","definitions":["grimoire"],"forms":{"plural":"grimoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grimoar","accusative-definite-nominative-singular":"grimoarul","accusative-indefinite-nominative-plural":"grimoare","accusative-definite-nominative-plural":"grimoarele","dative-genitive-indefinite-singular":"grimoar","dative-definite-genitive-singular":"grimoarului","dative-genitive-indefinite-plural":"grimoare","dative-definite-genitive-plural":"grimoarelor","singular-vocative":"grimoarule","plural-vocative":"grimoarelor"}},{"word":"grimpant","pos":"adj","definitions":["climbing (about plants)"],"forms":{"feminine-singular":"grimpantă","masculine-plural":"grimpanți","feminine-neuter-plural":"grimpante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grimpant","error-unrecognized-form-feminine-indefinite-singular":"grimpantă","error-unrecognized-form-indefinite-masculine-plural":"grimpanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grimpante","definite-error-unrecognized-form-masculine-neuter-singular":"grimpantul","definite-error-unrecognized-form-feminine-singular":"grimpanta","definite-error-unrecognized-form-masculine-plural":"grimpanții","definite-error-unrecognized-form-feminine-neuter-plural":"grimpantele"}},{"word":"Grinăuți","pos":"name","definitions":["a village in Dîngeni, Ocnița Raion, Moldova","a village in Grinăuți, Rîșcani Raion, Moldova","a village in Mihălășeni, Ocnița Raion, Moldova","a commune of Rîșcani Raion, Moldova"],"gender":"m"},{"word":"Grinăuți-Moldova","pos":"name","definitions":["a village in Grinăuți-Moldova, Ocnița Raion, Moldova","a commune of Ocnița Raion, Moldova"],"gender":"f"},{"word":"Grinăuți-Raia","pos":"name","definitions":["a village in Grinăuți-Moldova, Ocnița Raion, Moldova"],"gender":"f"},{"word":"Grind","pos":"name","definitions":["a village in Lăpugiu de Jos, Hunedoara County, Romania"],"gender":"m"},{"word":"grinda","pos":"noun","definitions":["definite nominative/accusative singular of grindă"],"pronunciation":"[ˈɡrinda]","gender":"f"},{"word":"grindă","pos":"noun","definitions":["beam","rafter","girder"],"forms":{"plural":"grinde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grindă","accusative-definite-nominative-singular":"grinda","accusative-indefinite-nominative-plural":"grinde","accusative-definite-nominative-plural":"grindele","dative-genitive-indefinite-singular":"grinde","dative-definite-genitive-singular":"grindei","dative-genitive-indefinite-plural":"grinde","dative-definite-genitive-plural":"grindelor","singular-vocative":"grindă","plural-vocative":"grindelor"}},{"word":"Grindași","pos":"name","definitions":["a village in Valea Măcrișului, Ialomița County, Romania"],"gender":"m"},{"word":"grinde","pos":"noun","definitions":["inflection of grindă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡrinde]","gender":"f-p"},{"word":"Grindeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Grindeanu"}},{"word":"grindei","pos":"noun","definitions":["beam, shaft","axle"],"forms":{"plural":"grindeie"}},{"word":"grindenă","pos":"noun","definitions":["obsolete form of grindină"],"forms":{"plural":"grindeni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grindenă","accusative-definite-nominative-singular":"grindena","accusative-indefinite-nominative-plural":"grindeni","accusative-definite-nominative-plural":"grindenile","dative-genitive-indefinite-singular":"grindeni","dative-definite-genitive-singular":"grindenii","dative-genitive-indefinite-plural":"grindeni","dative-definite-genitive-plural":"grindenilor","singular-vocative":"grindenă","plural-vocative":"grindenilor"}},{"word":"Grindeni","pos":"name","definitions":["a village in Chețani, Mureș County, Romania"],"gender":"m"},{"word":"grindina","pos":"verb","definitions":["to hail (down)"],"forms":{"canonical":"a grindina 1st conjugation","present-singular-third-person":"grindină","participle-past":"grindinat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a grindina","gerund":"grindinând","first-person-indicative-present-singular":"-","indicative-present-second-person-singular":"-","indicative-present-singular-third-person":"grindină","first-person-indicative-plural-present":"-","indicative-plural-present-second-person":"-","indicative-plural-present-third-person":"-","first-person-imperfect-indicative-singular":"-","imperfect-indicative-second-person-singular":"-","imperfect-indicative-singular-third-person":"grindina","first-person-imperfect-indicative-plural":"-","imperfect-indicative-plural-second-person":"-","imperfect-indicative-plural-third-person":"-","first-person-indicative-perfect-singular":"-","indicative-perfect-second-person-singular":"-","indicative-perfect-singular-third-person":"grindină","first-person-indicative-perfect-plural":"-","indicative-perfect-plural-second-person":"-","indicative-perfect-plural-third-person":"-","first-person-indicative-pluperfect-singular":"-","indicative-pluperfect-second-person-singular":"-","indicative-pluperfect-singular-third-person":"grindinase","first-person-indicative-pluperfect-plural":"-","indicative-pluperfect-plural-second-person":"-","indicative-pluperfect-plural-third-person":"-","first-person-present-singular-subjunctive":"-","present-second-person-singular-subjunctive":"-","present-singular-subjunctive-third-person":"să grindine","first-person-plural-present-subjunctive":"-","plural-present-second-person-subjunctive":"-","plural-present-subjunctive-third-person":"-","imperative-second-person-singular":"-","imperative-plural-second-person":"-","imperative-negative-second-person-singular":"-","imperative-negative-plural-second-person":"-"}},{"word":"grindină","pos":"noun","definitions":["hail (precipitation)"],"pronunciation":"/ˈɡrin.di.nə/","forms":{"plural":"grindini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"grindină","accusative-definite-nominative-singular":"grindina","accusative-indefinite-nominative-plural":"grindini","accusative-definite-nominative-plural":"grindinile","dative-genitive-indefinite-singular":"grindini","dative-definite-genitive-singular":"grindinii","dative-genitive-indefinite-plural":"grindini","dative-definite-genitive-plural":"grindinilor","singular-vocative":"grindină","plural-vocative":"grindinilor"}},{"word":"grindiș","pos":"noun","definitions":["all the beams of a house"],"forms":{"plural":"grindișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grindiș","accusative-definite-nominative-singular":"grindișul","accusative-indefinite-nominative-plural":"grindișuri","accusative-definite-nominative-plural":"grindișurile","dative-genitive-indefinite-singular":"grindiș","dative-definite-genitive-singular":"grindișului","dative-genitive-indefinite-plural":"grindișuri","dative-definite-genitive-plural":"grindișurilor","singular-vocative":"grindișule","plural-vocative":"grindișurilor"}},{"word":"grindișoară","pos":"noun","definitions":["diminutive of grindă"],"forms":{"plural":"grindișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grindișoară","accusative-definite-nominative-singular":"grindișoara","accusative-indefinite-nominative-plural":"grindișoare","accusative-definite-nominative-plural":"grindișoarele","dative-genitive-indefinite-singular":"grindișoare","dative-definite-genitive-singular":"grindișoarei","dative-genitive-indefinite-plural":"grindișoare","dative-definite-genitive-plural":"grindișoarelor","singular-vocative":"grindișoară","plural-vocative":"grindișoarelor"}},{"word":"Grindu","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Grindu, Ialomița County, Romania","a commune of Tulcea County, Romania","a village in Grindu, Tulcea County, Romania"],"gender":"m"},{"word":"grinduliță","pos":"noun","definitions":["diminutive of grindă; small beam"],"forms":{"plural":"grindulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grinduliță","accusative-definite-nominative-singular":"grindulița","accusative-indefinite-nominative-plural":"grindulițe","accusative-definite-nominative-plural":"grindulițele","dative-genitive-indefinite-singular":"grindulițe","dative-definite-genitive-singular":"grinduliței","dative-genitive-indefinite-plural":"grindulițe","dative-definite-genitive-plural":"grindulițelor","singular-vocative":"grinduliță","plural-vocative":"grindulițelor"}},{"word":"grinduță","pos":"noun","definitions":["diminutive of grindă; small beam"],"forms":{"plural":"grinduțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grinduță","accusative-definite-nominative-singular":"grinduța","accusative-indefinite-nominative-plural":"grinduțe","accusative-definite-nominative-plural":"grinduțele","dative-genitive-indefinite-singular":"grinduțe","dative-definite-genitive-singular":"grinduței","dative-genitive-indefinite-plural":"grinduțe","dative-definite-genitive-plural":"grinduțelor","singular-vocative":"grinduță","plural-vocative":"grinduțelor"}},{"word":"grinșpan","pos":"noun","definitions":["verdigris"],"forms":{"plural":"grinșpanuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grinșpan","accusative-definite-nominative-singular":"grinșpanul","accusative-indefinite-nominative-plural":"grinșpanuri","accusative-definite-nominative-plural":"grinșpanurile","dative-genitive-indefinite-singular":"grinșpan","dative-definite-genitive-singular":"grinșpanului","dative-genitive-indefinite-plural":"grinșpanuri","dative-definite-genitive-plural":"grinșpanurilor","singular-vocative":"grinșpanule","plural-vocative":"grinșpanurilor"}},{"word":"Grințieș","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Grințieș, Neamț County, Romania"],"gender":"m"},{"word":"gripa","pos":"noun","definitions":["definite nominative/accusative singular of gripă"],"pronunciation":"[ˈɡripa]","gender":"f"},{"word":"gripă","pos":"noun","definitions":["influenza","a cold"],"pronunciation":"[ˈɡri.pə]","forms":{"plural":"gripe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gripă","accusative-definite-nominative-singular":"gripa","accusative-indefinite-nominative-plural":"gripe","accusative-definite-nominative-plural":"gripele","dative-genitive-indefinite-singular":"gripe","dative-definite-genitive-singular":"gripei","dative-genitive-indefinite-plural":"gripe","dative-definite-genitive-plural":"gripelor","singular-vocative":"gripă","plural-vocative":"gripelor"}},{"word":"gripă aviară","pos":"noun","definitions":["avian influenza (strain of influenza)"]},{"word":"gripă porcină","pos":"noun","definitions":["swine flu"]},{"word":"gripal","pos":"adj","definitions":["influenzal"],"forms":{"feminine-singular":"gripală","masculine-plural":"gripali","feminine-neuter-plural":"gripale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gripal","error-unrecognized-form-feminine-indefinite-singular":"gripală","error-unrecognized-form-indefinite-masculine-plural":"gripali","error-unrecognized-form-feminine-indefinite-neuter-plural":"gripale","definite-error-unrecognized-form-masculine-neuter-singular":"gripalul","definite-error-unrecognized-form-feminine-singular":"gripala","definite-error-unrecognized-form-masculine-plural":"gripalii","definite-error-unrecognized-form-feminine-neuter-plural":"gripalele"}},{"word":"gripare","pos":"noun","definitions":["jamming"],"forms":{"plural":"gripări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gripare","accusative-definite-nominative-singular":"griparea","accusative-indefinite-nominative-plural":"gripări","accusative-definite-nominative-plural":"gripările","dative-genitive-indefinite-singular":"gripări","dative-definite-genitive-singular":"gripării","dative-genitive-indefinite-plural":"gripări","dative-definite-genitive-plural":"gripărilor","singular-vocative":"gripare","plural-vocative":"gripărilor"}},{"word":"gripat","pos":"adj","definitions":["stuck (about an engine)","sick of the flu"],"forms":{"feminine-singular":"gripată","masculine-plural":"gripați","feminine-neuter-plural":"gripate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gripat","error-unrecognized-form-feminine-indefinite-singular":"gripată","error-unrecognized-form-indefinite-masculine-plural":"gripați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gripate","definite-error-unrecognized-form-masculine-neuter-singular":"gripatul","definite-error-unrecognized-form-feminine-singular":"gripata","definite-error-unrecognized-form-masculine-plural":"gripații","definite-error-unrecognized-form-feminine-neuter-plural":"gripatele"}},{"word":"Gripcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gripcă"}},{"word":"gripe","pos":"noun","definitions":["inflection of gripă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡripe]","gender":"f-p"},{"word":"gripei","pos":"noun","definitions":["definite genitive/dative singular of gripă"],"pronunciation":"[ˈɡripej]","gender":"f"},{"word":"gripo","pos":"noun","definitions":["vocative singular of gripă"],"pronunciation":"[ˈɡripo]","gender":"f"},{"word":"gripsor","pos":"noun","definitions":["obsolete form of zgripsor"],"forms":{"plural":"gripsori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gripsor","accusative-definite-nominative-singular":"gripsorul","accusative-indefinite-nominative-plural":"gripsori","accusative-definite-nominative-plural":"gripsorii","dative-genitive-indefinite-singular":"gripsor","dative-definite-genitive-singular":"gripsorului","dative-genitive-indefinite-plural":"gripsori","dative-definite-genitive-plural":"gripsorilor","singular-vocative":"gripsorule","plural-vocative":"gripsorilor"}},{"word":"gris","pos":"noun","definitions":["alternative form of griș"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"gris","accusative-definite-nominative":"grisul","dative-genitive-indefinite":"gris","dative-definite-genitive":"grisului","vocative":"grisule"}},{"word":"griș","pos":"noun","definitions":["semolina"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"griș","accusative-definite-nominative":"grișul","dative-genitive-indefinite":"griș","dative-definite-genitive":"grișului","vocative":"grișule"}},{"word":"grisai","pos":"noun","definitions":["alternative form of grisaille"],"forms":{"plural":"grisaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grisai","accusative-definite-nominative-singular":"grisaiul","accusative-indefinite-nominative-plural":"grisaiuri","accusative-definite-nominative-plural":"grisaiurile","dative-genitive-indefinite-singular":"grisai","dative-definite-genitive-singular":"grisaiului","dative-genitive-indefinite-plural":"grisaiuri","dative-definite-genitive-plural":"grisaiurilor","singular-vocative":"grisaiule","plural-vocative":"grisaiurilor"}},{"word":"Grîu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grîu"}},{"word":"griv","pos":"adj","definitions":["spotted, black-and-white (about an animal)"],"forms":{"feminine-singular":"grivă","masculine-plural":"grivi","feminine-neuter-plural":"grive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"griv","error-unrecognized-form-feminine-indefinite-singular":"grivă","error-unrecognized-form-indefinite-masculine-plural":"grivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grive","definite-error-unrecognized-form-masculine-neuter-singular":"grivul","definite-error-unrecognized-form-feminine-singular":"griva","definite-error-unrecognized-form-masculine-plural":"grivii","definite-error-unrecognized-form-feminine-neuter-plural":"grivele"}},{"word":"Grivei","pos":"name","definitions":["a common dog's name"],"gender":"m","forms":{"dative-genitive":"lui Grivei"}},{"word":"grivei","pos":"adj","definitions":["spotted, black-and-white (about an animal)"],"forms":{"feminine-singular":"griveie","masculine-plural":"grivei","feminine-neuter-plural":"griveie","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grivei","error-unrecognized-form-feminine-indefinite-singular":"griveie","error-unrecognized-form-indefinite-masculine-plural":"grivei","error-unrecognized-form-feminine-indefinite-neuter-plural":"griveie","definite-error-unrecognized-form-masculine-neuter-singular":"griveiul","definite-error-unrecognized-form-feminine-singular":"griveia","definite-error-unrecognized-form-masculine-plural":"griveii","definite-error-unrecognized-form-feminine-neuter-plural":"griveiele"}},{"word":"Grivele","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Surpata","a river in Gorj County, Romania, tributary to the Straja"],"gender":"m"},{"word":"Grivița","pos":"name","definitions":["a village in Cordăreni, Botoșani County, Romania","a commune of Galați County, Romania","a village in Grivița, Galați County, Romania","a commune of Ialomița County, Romania","a village in Grivița, Ialomița County, Romania"],"gender":"f"},{"word":"grivnă","pos":"noun","definitions":["necklace","monetary unit"],"forms":{"plural":"grivne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grivnă","accusative-definite-nominative-singular":"grivna","accusative-indefinite-nominative-plural":"grivne","accusative-definite-nominative-plural":"grivnele","dative-genitive-indefinite-singular":"grivne","dative-definite-genitive-singular":"grivnei","dative-genitive-indefinite-plural":"grivne","dative-definite-genitive-plural":"grivnelor","singular-vocative":"grivnă","plural-vocative":"grivnelor"}},{"word":"Grivu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grivu"}},{"word":"griza","pos":"verb","definitions":["to get tipsy"],"forms":{"canonical":"a griza 1st conjugation","present-singular-third-person":"grizează","participle-past":"grizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a griza","gerund":"grizând","first-person-indicative-present-singular":"grizez","indicative-present-second-person-singular":"grizezi","indicative-present-singular-third-person":"grizează","first-person-indicative-plural-present":"grizăm","indicative-plural-present-second-person":"grizați","indicative-plural-present-third-person":"grizează","first-person-imperfect-indicative-singular":"grizam","imperfect-indicative-second-person-singular":"grizai","imperfect-indicative-singular-third-person":"griza","first-person-imperfect-indicative-plural":"grizam","imperfect-indicative-plural-second-person":"grizați","imperfect-indicative-plural-third-person":"grizau","first-person-indicative-perfect-singular":"grizai","indicative-perfect-second-person-singular":"grizași","indicative-perfect-singular-third-person":"griză","first-person-indicative-perfect-plural":"grizarăm","indicative-perfect-plural-second-person":"grizarăți","indicative-perfect-plural-third-person":"grizară","first-person-indicative-pluperfect-singular":"grizasem","indicative-pluperfect-second-person-singular":"grizaseși","indicative-pluperfect-singular-third-person":"grizase","first-person-indicative-pluperfect-plural":"grizaserăm","indicative-pluperfect-plural-second-person":"grizaserăți","indicative-pluperfect-plural-third-person":"grizaseră","first-person-present-singular-subjunctive":"să grizez","present-second-person-singular-subjunctive":"să grizezi","present-singular-subjunctive-third-person":"să grizeze","first-person-plural-present-subjunctive":"să grizăm","plural-present-second-person-subjunctive":"să grizați","plural-present-subjunctive-third-person":"să grizeze","imperative-second-person-singular":"grizează","imperative-plural-second-person":"grizați","imperative-negative-second-person-singular":"nu griza","imperative-negative-plural-second-person":"nu grizați"}},{"word":"grizare","pos":"noun","definitions":["graying"],"forms":{"plural":"grizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grizare","accusative-definite-nominative-singular":"grizarea","accusative-indefinite-nominative-plural":"grizări","accusative-definite-nominative-plural":"grizările","dative-genitive-indefinite-singular":"grizări","dative-definite-genitive-singular":"grizării","dative-genitive-indefinite-plural":"grizări","dative-definite-genitive-plural":"grizărilor","singular-vocative":"grizare","plural-vocative":"grizărilor"}},{"word":"grizat","pos":"adj","definitions":["gray"],"forms":{"feminine-singular":"grizată","masculine-plural":"grizați","feminine-neuter-plural":"grizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grizat","error-unrecognized-form-feminine-indefinite-singular":"grizată","error-unrecognized-form-indefinite-masculine-plural":"grizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grizate","definite-error-unrecognized-form-masculine-neuter-singular":"grizatul","definite-error-unrecognized-form-feminine-singular":"grizata","definite-error-unrecognized-form-masculine-plural":"grizații","definite-error-unrecognized-form-feminine-neuter-plural":"grizatele"}},{"word":"grizetă","pos":"noun","definitions":["grisette"],"forms":{"plural":"grizete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grizetă","accusative-definite-nominative-singular":"grizeta","accusative-indefinite-nominative-plural":"grizete","accusative-definite-nominative-plural":"grizetele","dative-genitive-indefinite-singular":"grizete","dative-definite-genitive-singular":"grizetei","dative-genitive-indefinite-plural":"grizete","dative-definite-genitive-plural":"grizetelor","singular-vocative":"grizetă","plural-vocative":"grizetelor"}},{"word":"grizona","pos":"verb","definitions":["to become gray (about hair)"],"forms":{"canonical":"a grizona 1st conjugation","present-singular-third-person":"grizonează","participle-past":"grizonat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grizona","gerund":"grizonând","first-person-indicative-present-singular":"grizonez","indicative-present-second-person-singular":"grizonezi","indicative-present-singular-third-person":"grizonează","first-person-indicative-plural-present":"grizonăm","indicative-plural-present-second-person":"grizonați","indicative-plural-present-third-person":"grizonează","first-person-imperfect-indicative-singular":"grizonam","imperfect-indicative-second-person-singular":"grizonai","imperfect-indicative-singular-third-person":"grizona","first-person-imperfect-indicative-plural":"grizonam","imperfect-indicative-plural-second-person":"grizonați","imperfect-indicative-plural-third-person":"grizonau","first-person-indicative-perfect-singular":"grizonai","indicative-perfect-second-person-singular":"grizonași","indicative-perfect-singular-third-person":"grizonă","first-person-indicative-perfect-plural":"grizonarăm","indicative-perfect-plural-second-person":"grizonarăți","indicative-perfect-plural-third-person":"grizonară","first-person-indicative-pluperfect-singular":"grizonasem","indicative-pluperfect-second-person-singular":"grizonaseși","indicative-pluperfect-singular-third-person":"grizonase","first-person-indicative-pluperfect-plural":"grizonaserăm","indicative-pluperfect-plural-second-person":"grizonaserăți","indicative-pluperfect-plural-third-person":"grizonaseră","first-person-present-singular-subjunctive":"să grizonez","present-second-person-singular-subjunctive":"să grizonezi","present-singular-subjunctive-third-person":"să grizoneze","first-person-plural-present-subjunctive":"să grizonăm","plural-present-second-person-subjunctive":"să grizonați","plural-present-subjunctive-third-person":"să grizoneze","imperative-second-person-singular":"grizonează","imperative-plural-second-person":"grizonați","imperative-negative-second-person-singular":"nu grizona","imperative-negative-plural-second-person":"nu grizonați"}},{"word":"grizonant","pos":"adj","definitions":["greyish"],"forms":{"feminine-singular":"grizonantă","masculine-plural":"grizonanți","feminine-neuter-plural":"grizonante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grizonant","error-unrecognized-form-feminine-indefinite-singular":"grizonantă","error-unrecognized-form-indefinite-masculine-plural":"grizonanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grizonante","definite-error-unrecognized-form-masculine-neuter-singular":"grizonantul","definite-error-unrecognized-form-feminine-singular":"grizonanta","definite-error-unrecognized-form-masculine-plural":"grizonanții","definite-error-unrecognized-form-feminine-neuter-plural":"grizonantele"}},{"word":"grizonare","pos":"noun","definitions":["graying of the hair"],"forms":{"plural":"grizonări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grizonare","accusative-definite-nominative-singular":"grizonarea","accusative-indefinite-nominative-plural":"grizonări","accusative-definite-nominative-plural":"grizonările","dative-genitive-indefinite-singular":"grizonări","dative-definite-genitive-singular":"grizonării","dative-genitive-indefinite-plural":"grizonări","dative-definite-genitive-plural":"grizonărilor","singular-vocative":"grizonare","plural-vocative":"grizonărilor"}},{"word":"grizu","pos":"noun","definitions":["firedamp"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"grizu","accusative-definite-nominative":"grizul","dative-genitive-indefinite":"grizu","dative-definite-genitive":"grizului","vocative":"grizule"}},{"word":"grizumetru","pos":"noun","definitions":["methanometer"],"forms":{"plural":"grizumetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grizumetru","accusative-definite-nominative-singular":"grizumetrul","accusative-indefinite-nominative-plural":"grizumetre","accusative-definite-nominative-plural":"grizumetrele","dative-genitive-indefinite-singular":"grizumetru","dative-definite-genitive-singular":"grizumetrului","dative-genitive-indefinite-plural":"grizumetre","dative-definite-genitive-plural":"grizumetrelor","singular-vocative":"grizumetrule","plural-vocative":"grizumetrelor"}},{"word":"grizutină","pos":"noun","definitions":["grisoutine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grizutină","accusative-definite-nominative-singular":"grizutina","accusative-indefinite-nominative-plural":"grizutine","accusative-definite-nominative-plural":"grizutinele","dative-genitive-indefinite-singular":"grizutine","dative-definite-genitive-singular":"grizutinei","dative-genitive-indefinite-plural":"grizutine","dative-definite-genitive-plural":"grizutinelor","singular-vocative":"grizutină","plural-vocative":"grizutinelor"}},{"word":"grizutos","pos":"adj","definitions":["containing firedamp"],"forms":{"feminine-singular":"grizutoasă","masculine-plural":"grizutoși","feminine-neuter-plural":"grizutoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grizutos","error-unrecognized-form-feminine-indefinite-singular":"grizutoasă","error-unrecognized-form-indefinite-masculine-plural":"grizutoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grizutoase","definite-error-unrecognized-form-masculine-neuter-singular":"grizutosul","definite-error-unrecognized-form-feminine-singular":"grizutoasa","definite-error-unrecognized-form-masculine-plural":"grizutoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grizutoasele"}},{"word":"grizzly","pos":"noun","definitions":["grizzly bear (A North American subspecies, Ursus arctos horribilis, of the brown bear)"],"forms":{"plural":"grizzly","table-tags":"no-table-tags","inflection-template":"ro-noun-manual","accusative-indefinite-nominative-singular":"grizzly","accusative-definite-nominative-singular":"grizzly-ul","accusative-indefinite-nominative-plural":"grizzly","accusative-definite-nominative-plural":"grizzly-i","dative-genitive-indefinite-singular":"grizzly","dative-definite-genitive-singular":"grizzly-ului","dative-genitive-indefinite-plural":"grizzly","dative-definite-genitive-plural":"grizzly-lor","singular-vocative":"-","plural-vocative":"-"}}];
@@ -0,0 +1 @@
+export default [{"word":"Groapa","pos":"name","definitions":["a river in Sălaj, Romania, tributary to the Barcău","a river in Gorj, Romania, tributary to the Pleșcoaia","a river in Vâlcea, Romania, tributary to the Repedea","a surname"],"gender":"m","forms":{"dative-genitive":"lui Groapa"}},{"word":"groapa","pos":"noun","definitions":["definite nominative/accusative singular of groapă"]},{"word":"Groapă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Groapă"}},{"word":"groapă","pos":"noun","definitions":["hole (in the ground), pit, grave"],"forms":{"plural":"gropi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"groapă","accusative-definite-nominative-singular":"groapa","accusative-indefinite-nominative-plural":"gropi","accusative-definite-nominative-plural":"gropile","dative-genitive-indefinite-singular":"gropi","dative-definite-genitive-singular":"gropii","dative-genitive-indefinite-plural":"gropi","dative-definite-genitive-plural":"gropilor","singular-vocative":"groapă","plural-vocative":"gropilor"}},{"word":"Groapa Apei","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Olt"],"gender":"f"},{"word":"groapă comună","pos":"noun","definitions":["mass grave"],"forms":{"plural":"gropi comune"}},{"word":"Groapa Copacului","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Timiș"],"gender":"f"},{"word":"Groapa cu Var","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Răcădău"],"gender":"f"},{"word":"Groapa de Aur","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea Poienii"],"gender":"f"},{"word":"Groapa Largă","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Drăgan"],"gender":"f"},{"word":"Groapa lui Simion","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Valea cu Apă"],"gender":"f"},{"word":"Groapa Mare","pos":"name","definitions":["a river in Brașov, Romania, tributary to the Olt"],"gender":"f"},{"word":"Groapa Marianelor","pos":"name","definitions":["Mariana Trench"],"gender":"f"},{"word":"Groapa Nedeuța","pos":"name","definitions":["a river in Hunedoara County, Romania, tributary to the Valea Boului"],"gender":"f"},{"word":"Groapa Podului","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Vâlcelul Podului"],"gender":"f"},{"word":"Groapa Rădăii","pos":"name","definitions":["a village in Miheșu de Câmpie, Mureș County, Romania"],"gender":"f"},{"word":"Groapa Seacă","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Jieț","a river in Vâlcea, Romania, tributary to the Lotru"],"gender":"f"},{"word":"Groapa Secuilor","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Araci"],"gender":"f"},{"word":"Groapa Tufei","pos":"name","definitions":["a village in Gura Caliței, Vrancea County, Romania"],"gender":"f"},{"word":"Groapa Văii","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Valea Mare"],"gender":"f"},{"word":"Groapa Vlădichii","pos":"name","definitions":["a village in Moara, Suceava County, Romania"],"gender":"f"},{"word":"Groape","pos":"name","definitions":["a village in Târgu Lăpuș, Maramureș County, Romania"],"gender":"m"},{"word":"Groapele","pos":"name","definitions":["a river in Gorj County, Romania, tributary to the Bistrița","a river in Brașov County, Romania, tributary to the Sebeș","a river in Argeș County, Romania, tributary to the Văsălatu"],"gender":"m"},{"word":"groasă","pos":"adj","definitions":["nominative/accusative feminine singular of gros"]},{"word":"groază","pos":"noun","definitions":["terror, horror, right, dismay","blue funk"],"forms":{"plural":"groaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"groază","accusative-definite-nominative-singular":"groaza","accusative-indefinite-nominative-plural":"groaze","accusative-definite-nominative-plural":"groazele","dative-genitive-indefinite-singular":"groaze","dative-definite-genitive-singular":"groazei","dative-genitive-indefinite-plural":"groaze","dative-definite-genitive-plural":"groazelor","singular-vocative":"groază","plural-vocative":"groazelor"}},{"word":"groaznic","pos":"adj","definitions":["dreadful, terrible, horrible, awful, hateful","shocking"],"pronunciation":"/ˈɡro̯az.nik/","forms":{"feminine-singular":"groaznică","masculine-plural":"groaznici","feminine-neuter-plural":"groaznice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"groaznic","error-unrecognized-form-feminine-indefinite-singular":"groaznică","error-unrecognized-form-indefinite-masculine-plural":"groaznici","error-unrecognized-form-feminine-indefinite-neuter-plural":"groaznice","definite-error-unrecognized-form-masculine-neuter-singular":"groaznicul","definite-error-unrecognized-form-feminine-singular":"groaznica","definite-error-unrecognized-form-masculine-plural":"groaznicii","definite-error-unrecognized-form-feminine-neuter-plural":"groaznicele"}},{"word":"Groaznicu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Groaznicu"}},{"word":"grob","pos":"adj","definitions":["coarse, rough"],"forms":{"feminine-singular":"grobă","masculine-plural":"grobi","feminine-neuter-plural":"grobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grob","error-unrecognized-form-feminine-indefinite-singular":"grobă","error-unrecognized-form-indefinite-masculine-plural":"grobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grobe","definite-error-unrecognized-form-masculine-neuter-singular":"grobul","definite-error-unrecognized-form-feminine-singular":"groba","definite-error-unrecognized-form-masculine-plural":"grobii","definite-error-unrecognized-form-feminine-neuter-plural":"grobele"}},{"word":"grobian","pos":"adj","definitions":["coarse (about people)"],"forms":{"feminine-singular":"grobiană","masculine-plural":"grobieni","feminine-neuter-plural":"grobiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grobian","error-unrecognized-form-feminine-indefinite-singular":"grobiană","error-unrecognized-form-indefinite-masculine-plural":"grobieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"grobiene","definite-error-unrecognized-form-masculine-neuter-singular":"grobianul","definite-error-unrecognized-form-feminine-singular":"grobiana","definite-error-unrecognized-form-masculine-plural":"grobienii","definite-error-unrecognized-form-feminine-neuter-plural":"grobienele"}},{"word":"grobienie","pos":"noun","definitions":["rudeness"],"forms":{"plural":"grobienii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grobienie","accusative-definite-nominative-singular":"grobienia","accusative-indefinite-nominative-plural":"grobienii","accusative-definite-nominative-plural":"grobieniile","dative-genitive-indefinite-singular":"grobienii","dative-definite-genitive-singular":"grobieniei","dative-genitive-indefinite-plural":"grobienii","dative-definite-genitive-plural":"grobieniilor","singular-vocative":"grobienie","plural-vocative":"grobieniilor"}},{"word":"grobiște","pos":"noun","definitions":["cemetery"],"forms":{"plural":"grobiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grobiște","accusative-definite-nominative-singular":"grobiștea","accusative-indefinite-nominative-plural":"grobiști","accusative-definite-nominative-plural":"grobiștile","dative-genitive-indefinite-singular":"grobiști","dative-definite-genitive-singular":"grobiștii","dative-genitive-indefinite-plural":"grobiști","dative-definite-genitive-plural":"grobiștilor","singular-vocative":"grobiște","plural-vocative":"grobiștilor"}},{"word":"grobnic","pos":"noun","definitions":["shroud","tomb, crypt"],"forms":{"plural":"grobnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grobnic","accusative-definite-nominative-singular":"grobnicul","accusative-indefinite-nominative-plural":"grobnice","accusative-definite-nominative-plural":"grobnicele","dative-genitive-indefinite-singular":"grobnic","dative-definite-genitive-singular":"grobnicului","dative-genitive-indefinite-plural":"grobnice","dative-definite-genitive-plural":"grobnicelor","singular-vocative":"grobnicule","plural-vocative":"grobnicelor"}},{"word":"Groenlanda","pos":"name","definitions":["Greenland (a large self-governing island and dependent territory of Denmark, in North America)"]},{"word":"groenlandeză","pos":"noun","definitions":["female equivalent of groenlandez"],"forms":{"plural":"groenlandeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"groenlandeză","accusative-definite-nominative-singular":"groenlandeza","accusative-indefinite-nominative-plural":"groenlandeze","accusative-definite-nominative-plural":"groenlandezele","dative-genitive-indefinite-singular":"groenlandeze","dative-definite-genitive-singular":"groenlandezei","dative-genitive-indefinite-plural":"groenlandeze","dative-definite-genitive-plural":"groenlandezelor","singular-vocative":"groenlandeză","plural-vocative":"groenlandezelor"}},{"word":"grof","pos":"noun","definitions":["count"],"forms":{"plural":"grofi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grof","accusative-definite-nominative-singular":"groful","accusative-indefinite-nominative-plural":"grofi","accusative-definite-nominative-plural":"grofii","dative-genitive-indefinite-singular":"grof","dative-definite-genitive-singular":"grofului","dative-genitive-indefinite-plural":"grofi","dative-definite-genitive-plural":"grofilor","singular-vocative":"grofule","plural-vocative":"grofilor"}},{"word":"grofesc","pos":"adj","definitions":["count, earl"],"forms":{"feminine-singular":"grofească","plural":"grofești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grofesc","error-unrecognized-form-feminine-indefinite-singular":"grofească","error-unrecognized-form-indefinite-masculine-plural":"grofești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grofești","definite-error-unrecognized-form-masculine-neuter-singular":"grofescul","definite-error-unrecognized-form-feminine-singular":"grofeasca","definite-error-unrecognized-form-masculine-plural":"grofeștii","definite-error-unrecognized-form-feminine-neuter-plural":"grofeștile"}},{"word":"grofoaie","pos":"noun","definitions":["female equivalent of grof"],"forms":{"plural":"grofoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"grofoaie","accusative-definite-nominative-singular":"grofoaiea","accusative-indefinite-nominative-plural":"grofoaie","accusative-definite-nominative-plural":"grofoaiele","dative-genitive-indefinite-singular":"grofoaie","dative-definite-genitive-singular":"grofoaiei","dative-genitive-indefinite-plural":"grofoaie","dative-definite-genitive-plural":"grofoaielor","singular-vocative":"grofoaie","plural-vocative":"grofoaielor"}},{"word":"grog","pos":"noun","definitions":["grog"],"forms":{"plural":"groguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grog","accusative-definite-nominative-singular":"grogul","accusative-indefinite-nominative-plural":"groguri","accusative-definite-nominative-plural":"grogurile","dative-genitive-indefinite-singular":"grog","dative-definite-genitive-singular":"grogului","dative-genitive-indefinite-plural":"groguri","dative-definite-genitive-plural":"grogurilor","singular-vocative":"grogule","plural-vocative":"grogurilor"}},{"word":"grogrenă","pos":"noun","definitions":["large grain"],"forms":{"plural":"grogrene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grogrenă","accusative-definite-nominative-singular":"grogrenăul","accusative-indefinite-nominative-plural":"grogrene","accusative-definite-nominative-plural":"grogrenele","dative-genitive-indefinite-singular":"grogrenă","dative-definite-genitive-singular":"grogrenăului","dative-genitive-indefinite-plural":"grogrene","dative-definite-genitive-plural":"grogrenelor","singular-vocative":"grogrenăule","plural-vocative":"grogrenelor"}},{"word":"groh","pos":"intj","definitions":["imitates the sound of a grunt (like a pig)"],"pronunciation":"/ɡrox/"},{"word":"grohăi","pos":"verb","definitions":["to grunt"],"forms":{"canonical":"a grohăi 4th conjugation","present-singular-third-person":"grohăie","participle-past":"grohăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a grohăi","gerund":"grohăind","first-person-indicative-present-singular":"grohăi","indicative-present-second-person-singular":"grohăi","indicative-present-singular-third-person":"grohăie","first-person-indicative-plural-present":"grohăim","indicative-plural-present-second-person":"grohăiți","indicative-plural-present-third-person":"grohăie","first-person-imperfect-indicative-singular":"grohăiam","imperfect-indicative-second-person-singular":"grohăiai","imperfect-indicative-singular-third-person":"grohăia","first-person-imperfect-indicative-plural":"grohăiam","imperfect-indicative-plural-second-person":"grohăiați","imperfect-indicative-plural-third-person":"grohăiau","first-person-indicative-perfect-singular":"grohăii","indicative-perfect-second-person-singular":"grohăiși","indicative-perfect-singular-third-person":"grohăi","first-person-indicative-perfect-plural":"grohăirăm","indicative-perfect-plural-second-person":"grohăirăți","indicative-perfect-plural-third-person":"grohăiră","first-person-indicative-pluperfect-singular":"grohăisem","indicative-pluperfect-second-person-singular":"grohăiseși","indicative-pluperfect-singular-third-person":"grohăise","first-person-indicative-pluperfect-plural":"grohăiserăm","indicative-pluperfect-plural-second-person":"grohăiserăți","indicative-pluperfect-plural-third-person":"grohăiseră","first-person-present-singular-subjunctive":"să grohăi","present-second-person-singular-subjunctive":"să grohăi","present-singular-subjunctive-third-person":"să grohăie","first-person-plural-present-subjunctive":"să grohăim","plural-present-second-person-subjunctive":"să grohăiți","plural-present-subjunctive-third-person":"să grohăie","imperative-second-person-singular":"grohăie","imperative-plural-second-person":"grohăiți","imperative-negative-second-person-singular":"nu grohăi","imperative-negative-plural-second-person":"nu grohăiți"}},{"word":"grohăire","pos":"noun","definitions":["growling"],"forms":{"plural":"grohăiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grohăire","accusative-definite-nominative-singular":"grohăirea","accusative-indefinite-nominative-plural":"grohăiri","accusative-definite-nominative-plural":"grohăirile","dative-genitive-indefinite-singular":"grohăiri","dative-definite-genitive-singular":"grohăirii","dative-genitive-indefinite-plural":"grohăiri","dative-definite-genitive-plural":"grohăirilor","singular-vocative":"grohăire","plural-vocative":"grohăirilor"}},{"word":"grohăit","pos":"noun","definitions":["grunt (of a pig)"],"forms":{"plural":"grohăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grohăit","accusative-definite-nominative-singular":"grohăitul","accusative-indefinite-nominative-plural":"grohăituri","accusative-definite-nominative-plural":"grohăiturile","dative-genitive-indefinite-singular":"grohăit","dative-definite-genitive-singular":"grohăitului","dative-genitive-indefinite-plural":"grohăituri","dative-definite-genitive-plural":"grohăiturilor","singular-vocative":"grohăitule","plural-vocative":"grohăiturilor"}},{"word":"grohăit","pos":"verb","definitions":["past participle of grohăi"],"forms":{"participle-past":"of grohăi"}},{"word":"grohăitor","pos":"adj","definitions":["growling"],"forms":{"feminine-singular":"grohăitoare","masculine-plural":"grohăitori","feminine-neuter-plural":"grohăitoare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grohăitor","error-unrecognized-form-feminine-indefinite-singular":"grohăitoare","error-unrecognized-form-indefinite-masculine-plural":"grohăitori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grohăitoare","definite-error-unrecognized-form-masculine-neuter-singular":"grohăitorul","definite-error-unrecognized-form-feminine-singular":"grohăitoarea","definite-error-unrecognized-form-masculine-plural":"grohăitorii","definite-error-unrecognized-form-feminine-neuter-plural":"grohăitoarele"}},{"word":"grohăitură","pos":"noun","definitions":["growling"],"forms":{"plural":"grohăituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grohăitură","accusative-definite-nominative-singular":"grohăitura","accusative-indefinite-nominative-plural":"grohăiture","accusative-definite-nominative-plural":"grohăiturele","dative-genitive-indefinite-singular":"grohăiture","dative-definite-genitive-singular":"grohăiturei","dative-genitive-indefinite-plural":"grohăiture","dative-definite-genitive-plural":"grohăiturelor","singular-vocative":"grohăitură","plural-vocative":"grohăiturelor"}},{"word":"Grohot","pos":"name","definitions":["a village in Bulzeștii de Sus, Hunedoara County, Romania"],"gender":"m"},{"word":"Grohoțele","pos":"name","definitions":["a village in Buceș, Hunedoara County, Romania"],"gender":"m"},{"word":"grohotic","pos":"noun","definitions":["pig, hog, swine"],"forms":{"plural":"grohotici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grohotic","accusative-definite-nominative-singular":"grohoticul","accusative-indefinite-nominative-plural":"grohotici","accusative-definite-nominative-plural":"grohoticii","dative-genitive-indefinite-singular":"grohotic","dative-definite-genitive-singular":"grohoticului","dative-genitive-indefinite-plural":"grohotici","dative-definite-genitive-plural":"grohoticilor","singular-vocative":"grohoticule","plural-vocative":"grohoticilor"}},{"word":"Grohotiș","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Trotuș"],"gender":"m"},{"word":"grohotiș","pos":"noun","definitions":["detritus"],"forms":{"plural":"grohotișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grohotiș","accusative-definite-nominative-singular":"grohotișul","accusative-indefinite-nominative-plural":"grohotișuri","accusative-definite-nominative-plural":"grohotișurile","dative-genitive-indefinite-singular":"grohotiș","dative-definite-genitive-singular":"grohotișului","dative-genitive-indefinite-plural":"grohotișuri","dative-definite-genitive-plural":"grohotișurilor","singular-vocative":"grohotișule","plural-vocative":"grohotișurilor"}},{"word":"Grohotișul","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Boia Mare","a river in Brașov, Romania, tributary to the Bângăleasa"],"gender":"m"},{"word":"grohotișului","pos":"noun","definitions":["definite genitive/dative singular of grohotiș"]},{"word":"grohotit","pos":"noun","definitions":["growling of a pig"],"forms":{"plural":"grohotituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grohotit","accusative-definite-nominative-singular":"grohotitul","accusative-indefinite-nominative-plural":"grohotituri","accusative-definite-nominative-plural":"grohotiturile","dative-genitive-indefinite-singular":"grohotit","dative-definite-genitive-singular":"grohotitului","dative-genitive-indefinite-plural":"grohotituri","dative-definite-genitive-plural":"grohotiturilor","singular-vocative":"grohotitule","plural-vocative":"grohotiturilor"}},{"word":"grohotit","pos":"verb","definitions":["past participle of grohoti"],"forms":{"participle-past":"of grohoti"}},{"word":"Grojdibodu","pos":"name","definitions":["a commune of Olt County, Romania","a village in Grojdibodu, Olt County, Romania"],"gender":"m"},{"word":"grom","pos":"noun","definitions":["alternative form of groom"],"forms":{"plural":"gromi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grom","accusative-definite-nominative-singular":"gromul","accusative-indefinite-nominative-plural":"gromi","accusative-definite-nominative-plural":"gromii","dative-genitive-indefinite-singular":"grom","dative-definite-genitive-singular":"gromului","dative-genitive-indefinite-plural":"gromi","dative-definite-genitive-plural":"gromilor","singular-vocative":"gromule","plural-vocative":"gromilor"}},{"word":"gromovnic","pos":"noun","definitions":["divinatory book"],"forms":{"plural":"gromovnice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gromovnic","accusative-definite-nominative-singular":"gromovnicul","accusative-indefinite-nominative-plural":"gromovnice","accusative-definite-nominative-plural":"gromovnicele","dative-genitive-indefinite-singular":"gromovnic","dative-definite-genitive-singular":"gromovnicului","dative-genitive-indefinite-plural":"gromovnice","dative-definite-genitive-plural":"gromovnicelor","singular-vocative":"gromovnicule","plural-vocative":"gromovnicelor"}},{"word":"gropan","pos":"noun","definitions":["augmentative of groapă"],"forms":{"plural":"gropane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gropan","accusative-definite-nominative-singular":"gropanul","accusative-indefinite-nominative-plural":"gropane","accusative-definite-nominative-plural":"gropanele","dative-genitive-indefinite-singular":"gropan","dative-definite-genitive-singular":"gropanului","dative-genitive-indefinite-plural":"gropane","dative-definite-genitive-plural":"gropanelor","singular-vocative":"gropanule","plural-vocative":"gropanelor"}},{"word":"gropană","pos":"noun","definitions":["a big hole"],"forms":{"plural":"gropane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gropană","accusative-definite-nominative-singular":"gropanăul","accusative-indefinite-nominative-plural":"gropane","accusative-definite-nominative-plural":"gropanele","dative-genitive-indefinite-singular":"gropană","dative-definite-genitive-singular":"gropanăului","dative-genitive-indefinite-plural":"gropane","dative-definite-genitive-plural":"gropanelor","singular-vocative":"gropanăule","plural-vocative":"gropanelor"}},{"word":"Gropanele","pos":"name","definitions":["a village in Grecești, Dolj County, Romania"],"gender":"m"},{"word":"gropar","pos":"noun","definitions":["gravedigger, sexton"],"forms":{"plural":"gropari"}},{"word":"gropăreasă","pos":"noun","definitions":["female equivalent of gropar"],"forms":{"plural":"gropărese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropăreasă","accusative-definite-nominative-singular":"gropăreasa","accusative-indefinite-nominative-plural":"gropărese","accusative-definite-nominative-plural":"gropăresele","dative-genitive-indefinite-singular":"gropărese","dative-definite-genitive-singular":"gropăresei","dative-genitive-indefinite-plural":"gropărese","dative-definite-genitive-plural":"gropăreselor","singular-vocative":"gropăreasă","plural-vocative":"gropăreselor"}},{"word":"Gropăria","pos":"name","definitions":["a river in Suceava County, Romania, tributary to the Bistrița Aurie"],"gender":"f"},{"word":"Groparu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Groparu"}},{"word":"gropaș","pos":"noun","definitions":["gravedigger"],"forms":{"plural":"gropași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gropaș","accusative-definite-nominative-singular":"gropașul","accusative-indefinite-nominative-plural":"gropași","accusative-definite-nominative-plural":"gropașii","dative-genitive-indefinite-singular":"gropaș","dative-definite-genitive-singular":"gropașului","dative-genitive-indefinite-plural":"gropași","dative-definite-genitive-plural":"gropașilor","singular-vocative":"gropașule","plural-vocative":"gropașilor"}},{"word":"Gropeni","pos":"name","definitions":["a commune of Brăila County, Romania","a village in Gropeni, Brăila County, Romania","a village in Bălcăuți, Suceava County, Romania","a village in Runcu, Vâlcea County, Romania"],"gender":"m"},{"word":"Gropi","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Hidișel"],"gender":"m"},{"word":"gropi","pos":"noun","definitions":["plural of groapă"]},{"word":"gropi comune","pos":"noun","definitions":["plural of groapă comună"]},{"word":"gropii","pos":"noun","definitions":["definite genitive/dative singular of groapă"]},{"word":"gropilă","pos":"noun","definitions":["a small hole in the ground"],"forms":{"plural":"gropile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropilă","accusative-definite-nominative-singular":"gropila","accusative-indefinite-nominative-plural":"gropile","accusative-definite-nominative-plural":"gropilele","dative-genitive-indefinite-singular":"gropile","dative-definite-genitive-singular":"gropilei","dative-genitive-indefinite-plural":"gropile","dative-definite-genitive-plural":"gropilelor","singular-vocative":"gropilă","plural-vocative":"gropilelor"}},{"word":"Gropile","pos":"name","definitions":["a village in Bacău County, Romania. Renamed to Dumbrava in 1964."],"gender":"f-p"},{"word":"gropiliță","pos":"noun","definitions":["diminutive of gropilă"],"forms":{"plural":"gropilițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropiliță","accusative-definite-nominative-singular":"gropilița","accusative-indefinite-nominative-plural":"gropilițe","accusative-definite-nominative-plural":"gropilițele","dative-genitive-indefinite-singular":"gropilițe","dative-definite-genitive-singular":"gropiliței","dative-genitive-indefinite-plural":"gropilițe","dative-definite-genitive-plural":"gropilițelor","singular-vocative":"gropiliță","plural-vocative":"gropilițelor"}},{"word":"gropilor","pos":"noun","definitions":["definite genitive/dative plural of groapă"]},{"word":"Gropineanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gropineanu"}},{"word":"gropit","pos":"adj","definitions":["full of holes in the ground"],"forms":{"feminine-singular":"gropită","masculine-plural":"gropiți","feminine-neuter-plural":"gropite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gropit","error-unrecognized-form-feminine-indefinite-singular":"gropită","error-unrecognized-form-indefinite-masculine-plural":"gropiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gropite","definite-error-unrecognized-form-masculine-neuter-singular":"gropitul","definite-error-unrecognized-form-feminine-singular":"gropita","definite-error-unrecognized-form-masculine-plural":"gropiții","definite-error-unrecognized-form-feminine-neuter-plural":"gropitele"}},{"word":"Gropița","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Pârâul Morii","a river in Hunedoara, Romania, tributary to the Zeicu"],"gender":"f"},{"word":"gropiță","pos":"noun","definitions":["diminutive of groapă (“hole”)","dimple"],"forms":{"plural":"gropițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropiță","accusative-definite-nominative-singular":"gropița","accusative-indefinite-nominative-plural":"gropițe","accusative-definite-nominative-plural":"gropițele","dative-genitive-indefinite-singular":"gropițe","dative-definite-genitive-singular":"gropiței","dative-genitive-indefinite-plural":"gropițe","dative-definite-genitive-plural":"gropițelor","singular-vocative":"gropiță","plural-vocative":"gropițelor"}},{"word":"gropițaș","pos":"noun","definitions":["gravedigger"],"forms":{"plural":"gropițași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gropițaș","accusative-definite-nominative-singular":"gropițașul","accusative-indefinite-nominative-plural":"gropițași","accusative-definite-nominative-plural":"gropițașii","dative-genitive-indefinite-singular":"gropițaș","dative-definite-genitive-singular":"gropițașului","dative-genitive-indefinite-plural":"gropițași","dative-definite-genitive-plural":"gropițașilor","singular-vocative":"gropițașule","plural-vocative":"gropițașilor"}},{"word":"gropnicer","pos":"noun","definitions":["gravedigger, sexton"],"forms":{"plural":"gropniceri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gropnicer","accusative-definite-nominative-singular":"gropnicerul","accusative-indefinite-nominative-plural":"gropniceri","accusative-definite-nominative-plural":"gropnicerii","dative-genitive-indefinite-singular":"gropnicer","dative-definite-genitive-singular":"gropnicerului","dative-genitive-indefinite-plural":"gropniceri","dative-definite-genitive-plural":"gropnicerilor","singular-vocative":"gropnicerule","plural-vocative":"gropnicerilor"}},{"word":"Gropnița","pos":"name","definitions":["a commune of Iași County, Romania","a village in Gropnița, Iași County, Romania"],"gender":"f"},{"word":"gropnița","pos":"noun","definitions":["definite nominative/accusative singular of gropniță"]},{"word":"gropniță","pos":"noun","definitions":["tomb, crypt"],"forms":{"plural":"gropnițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropniță","accusative-definite-nominative-singular":"gropnița","accusative-indefinite-nominative-plural":"gropnițe","accusative-definite-nominative-plural":"gropnițele","dative-genitive-indefinite-singular":"gropnițe","dative-definite-genitive-singular":"gropniței","dative-genitive-indefinite-plural":"gropnițe","dative-definite-genitive-plural":"gropnițelor","singular-vocative":"gropniță","plural-vocative":"gropnițelor"}},{"word":"Gropoi","pos":"name","definitions":["a river in Arad, Romania, tributary to the Teuz"],"gender":"m"},{"word":"Gropșoara","pos":"name","definitions":["a river in Alba, Romania, tributary to the Boșorogu"],"gender":"f"},{"word":"Gropșoarele","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Tâmpa"],"gender":"m"},{"word":"Gropșoarele Stână","pos":"name","definitions":["a river in Prahova, Romania, tributary to the Gropșoarele"],"gender":"m"},{"word":"Gropșorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gropșorean"}},{"word":"gropușoară","pos":"noun","definitions":["diminutive of groapă; small hole"],"forms":{"plural":"gropușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropușoară","accusative-definite-nominative-singular":"gropușoara","accusative-indefinite-nominative-plural":"gropușoare","accusative-definite-nominative-plural":"gropușoarele","dative-genitive-indefinite-singular":"gropușoare","dative-definite-genitive-singular":"gropușoarei","dative-genitive-indefinite-plural":"gropușoare","dative-definite-genitive-plural":"gropușoarelor","singular-vocative":"gropușoară","plural-vocative":"gropușoarelor"}},{"word":"gropuță","pos":"noun","definitions":["diminutive of groapă"],"forms":{"plural":"gropuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gropuță","accusative-definite-nominative-singular":"gropuța","accusative-indefinite-nominative-plural":"gropuțe","accusative-definite-nominative-plural":"gropuțele","dative-genitive-indefinite-singular":"gropuțe","dative-definite-genitive-singular":"gropuței","dative-genitive-indefinite-plural":"gropuțe","dative-definite-genitive-plural":"gropuțelor","singular-vocative":"gropuță","plural-vocative":"gropuțelor"}},{"word":"gros","pos":"adj","definitions":["thick"],"pronunciation":"/ɡros/","forms":{"feminine-singular":"groasă","masculine-plural":"groși","feminine-neuter-plural":"groase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gros","error-unrecognized-form-feminine-indefinite-singular":"groasă","error-unrecognized-form-indefinite-masculine-plural":"groși","error-unrecognized-form-feminine-indefinite-neuter-plural":"groase","definite-error-unrecognized-form-masculine-neuter-singular":"grosul","definite-error-unrecognized-form-feminine-singular":"groasa","definite-error-unrecognized-form-masculine-plural":"groșii","definite-error-unrecognized-form-feminine-neuter-plural":"groasele"}},{"word":"groș","pos":"noun","definitions":["groschen"],"forms":{"plural":"groși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"groș","accusative-definite-nominative-singular":"groșul","accusative-indefinite-nominative-plural":"groși","accusative-definite-nominative-plural":"groșii","dative-genitive-indefinite-singular":"groș","dative-definite-genitive-singular":"groșului","dative-genitive-indefinite-plural":"groși","dative-definite-genitive-plural":"groșilor","singular-vocative":"groșule","plural-vocative":"groșilor"}},{"word":"Groșani","pos":"name","definitions":["a village in Poienarii de Muscel, Argeș County, Romania","a village in Costești, Buzău County, Romania","a locality in Slănic, Prahova County, Romania"],"gender":"m"},{"word":"Groșanu","pos":"name","definitions":["a surname from placenames"],"gender":"m","forms":{"dative-genitive":"lui Groșanu"}},{"word":"groșar","pos":"noun","definitions":["jailer, prison guard"],"forms":{"plural":"groșari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"groșar","accusative-definite-nominative-singular":"groșarul","accusative-indefinite-nominative-plural":"groșari","accusative-definite-nominative-plural":"groșarii","dative-genitive-indefinite-singular":"groșar","dative-definite-genitive-singular":"groșarului","dative-genitive-indefinite-plural":"groșari","dative-definite-genitive-plural":"groșarilor","singular-vocative":"groșarule","plural-vocative":"groșarilor"}},{"word":"groscior","pos":"adj","definitions":["diminutive of gros"],"forms":{"feminine-singular":"groscioră","masculine-plural":"grosciori","feminine-neuter-plural":"grosciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"groscior","error-unrecognized-form-feminine-indefinite-singular":"groscioră","error-unrecognized-form-indefinite-masculine-plural":"grosciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grosciore","definite-error-unrecognized-form-masculine-neuter-singular":"grosciorul","definite-error-unrecognized-form-feminine-singular":"grosciora","definite-error-unrecognized-form-masculine-plural":"grosciorii","definite-error-unrecognized-form-feminine-neuter-plural":"grosciorele"}},{"word":"groșcior","pos":"adj","definitions":["alternative form of groscior"],"forms":{"feminine-singular":"groșcioră","masculine-plural":"groșciori","feminine-neuter-plural":"groșciore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"groșcior","error-unrecognized-form-feminine-indefinite-singular":"groșcioră","error-unrecognized-form-indefinite-masculine-plural":"groșciori","error-unrecognized-form-feminine-indefinite-neuter-plural":"groșciore","definite-error-unrecognized-form-masculine-neuter-singular":"groșciorul","definite-error-unrecognized-form-feminine-singular":"groșciora","definite-error-unrecognized-form-masculine-plural":"groșciorii","definite-error-unrecognized-form-feminine-neuter-plural":"groșciorele"}},{"word":"Groseanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Groseanu"}},{"word":"Groșeni","pos":"name","definitions":["a river in Arad, Romania, tributary to the Teuz","a village in Archiș, Arad County, Romania"],"gender":"m"},{"word":"Grosescu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grosescu"}},{"word":"Groși","pos":"name","definitions":["a village in Ceru-Băcăinți, Alba County, Romania","a village in Vârfurile, Arad County, Romania","a village in Băbana, Argeș County, Romania","a village in Aușeu, Bihor County, Romania","a commune of Maramureș County, Romania"],"gender":"m"},{"word":"grosier","pos":"adj","definitions":["coarse"],"forms":{"feminine-singular":"grosieră","masculine-plural":"grosieri","feminine-neuter-plural":"grosiere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grosier","error-unrecognized-form-feminine-indefinite-singular":"grosieră","error-unrecognized-form-indefinite-masculine-plural":"grosieri","error-unrecognized-form-feminine-indefinite-neuter-plural":"grosiere","definite-error-unrecognized-form-masculine-neuter-singular":"grosierul","definite-error-unrecognized-form-feminine-singular":"grosiera","definite-error-unrecognized-form-masculine-plural":"grosierii","definite-error-unrecognized-form-feminine-neuter-plural":"grosierele"}},{"word":"Groșii Noi","pos":"name","definitions":["a village in Bârzava, Arad County, Romania"],"gender":"m"},{"word":"Groșii Țibleșului","pos":"name","definitions":["a commune of Maramureș County, Romania","a village in Groșii Țibleșului, Maramureș County, Romania"],"gender":"m"},{"word":"grosime","pos":"noun","definitions":["thickness","bulk, bulkiness","bigness","corpulency, plumpness","breadth, width"],"pronunciation":"/ɡroˈsi.me/","forms":{"plural":"grosimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grosime","accusative-definite-nominative-singular":"grosimea","accusative-indefinite-nominative-plural":"grosimi","accusative-definite-nominative-plural":"grosimile","dative-genitive-indefinite-singular":"grosimi","dative-definite-genitive-singular":"grosimii","dative-genitive-indefinite-plural":"grosimi","dative-definite-genitive-plural":"grosimilor","singular-vocative":"grosime","plural-vocative":"grosimilor"}},{"word":"grosisment","pos":"noun","definitions":["magnification"],"forms":{"plural":"grosismente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grosisment","accusative-definite-nominative-singular":"grosismentul","accusative-indefinite-nominative-plural":"grosismente","accusative-definite-nominative-plural":"grosismentele","dative-genitive-indefinite-singular":"grosisment","dative-definite-genitive-singular":"grosismentului","dative-genitive-indefinite-plural":"grosismente","dative-definite-genitive-plural":"grosismentelor","singular-vocative":"grosismentule","plural-vocative":"grosismentelor"}},{"word":"grosișor","pos":"adj","definitions":["diminutive of gros"],"forms":{"feminine-singular":"grosișoră","masculine-plural":"grosișori","feminine-neuter-plural":"grosișore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grosișor","error-unrecognized-form-feminine-indefinite-singular":"grosișoră","error-unrecognized-form-indefinite-masculine-plural":"grosișori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grosișore","definite-error-unrecognized-form-masculine-neuter-singular":"grosișorul","definite-error-unrecognized-form-feminine-singular":"grosișora","definite-error-unrecognized-form-masculine-plural":"grosișorii","definite-error-unrecognized-form-feminine-neuter-plural":"grosișorele"}},{"word":"groșiță","pos":"noun","definitions":["groschen"],"forms":{"plural":"groșițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"groșiță","accusative-definite-nominative-singular":"groșița","accusative-indefinite-nominative-plural":"groșițe","accusative-definite-nominative-plural":"groșițele","dative-genitive-indefinite-singular":"groșițe","dative-definite-genitive-singular":"groșiței","dative-genitive-indefinite-plural":"groșițe","dative-definite-genitive-plural":"groșițelor","singular-vocative":"groșiță","plural-vocative":"groșițelor"}},{"word":"Grosoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Grosoaia"}},{"word":"grosolan","pos":"adj","definitions":["rough; coarse; gross; graceless; crude; rustic; bearish; agrestic; unpolished; unrefined; oafish; boorish"],"forms":{"feminine-singular":"grosolană","masculine-plural":"grosolani","feminine-neuter-plural":"grosolane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grosolan","error-unrecognized-form-feminine-indefinite-singular":"grosolană","error-unrecognized-form-indefinite-masculine-plural":"grosolani","error-unrecognized-form-feminine-indefinite-neuter-plural":"grosolane","definite-error-unrecognized-form-masculine-neuter-singular":"grosolanul","definite-error-unrecognized-form-feminine-singular":"grosolana","definite-error-unrecognized-form-masculine-plural":"grosolanii","definite-error-unrecognized-form-feminine-neuter-plural":"grosolanele"}},{"word":"grosolan","pos":"adv","definitions":["roughly; coarsely; in an unrefined manner"]},{"word":"grosolănie","pos":"noun","definitions":["rudeness"],"forms":{"plural":"grosolănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grosolănie","accusative-definite-nominative-singular":"grosolănia","accusative-indefinite-nominative-plural":"grosolănii","accusative-definite-nominative-plural":"grosolăniile","dative-genitive-indefinite-singular":"grosolănii","dative-definite-genitive-singular":"grosolăniei","dative-genitive-indefinite-plural":"grosolănii","dative-definite-genitive-plural":"grosolăniilor","singular-vocative":"grosolănie","plural-vocative":"grosolăniilor"}},{"word":"grosoman","pos":"noun","definitions":["sluggish person"],"forms":{"plural":"grosomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grosoman","accusative-definite-nominative-singular":"grosomanul","accusative-indefinite-nominative-plural":"grosomani","accusative-definite-nominative-plural":"grosomanii","dative-genitive-indefinite-singular":"grosoman","dative-definite-genitive-singular":"grosomanului","dative-genitive-indefinite-plural":"grosomani","dative-definite-genitive-plural":"grosomanilor","singular-vocative":"grosomanule","plural-vocative":"grosomanilor"}},{"word":"groștei","pos":"noun","definitions":["a piglet of about one year of age"],"forms":{"plural":"groștei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"groștei","accusative-definite-nominative-singular":"groșteiul","accusative-indefinite-nominative-plural":"groștei","accusative-definite-nominative-plural":"groșteii","dative-genitive-indefinite-singular":"groștei","dative-definite-genitive-singular":"groșteiului","dative-genitive-indefinite-plural":"groștei","dative-definite-genitive-plural":"groșteilor","singular-vocative":"groșteiule","plural-vocative":"groșteilor"}},{"word":"groster","pos":"noun","definitions":["a piglet of about one year of age"],"forms":{"plural":"grosteri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"groster","accusative-definite-nominative-singular":"grosterul","accusative-indefinite-nominative-plural":"grosteri","accusative-definite-nominative-plural":"grosterii","dative-genitive-indefinite-singular":"groster","dative-definite-genitive-singular":"grosterului","dative-genitive-indefinite-plural":"grosteri","dative-definite-genitive-plural":"grosterilor","singular-vocative":"grosterule","plural-vocative":"grosterilor"}},{"word":"groșteu","pos":"noun","definitions":["a piglet of about one year of age"],"forms":{"plural":"groștei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"groșteu","accusative-definite-nominative-singular":"groșteuul","accusative-indefinite-nominative-plural":"groștei","accusative-definite-nominative-plural":"groșteii","dative-genitive-indefinite-singular":"groșteu","dative-definite-genitive-singular":"groșteuului","dative-genitive-indefinite-plural":"groștei","dative-definite-genitive-plural":"groșteilor","singular-vocative":"groșteuule","plural-vocative":"groșteilor"}},{"word":"Grosu","pos":"name","definitions":["a surname","a village in Vitănești, Ialomița County, Romania. Renamed to Siliștea in 1964."],"gender":"m"},{"word":"Grosul","pos":"name","definitions":["a river in Arad, Romania, tributary to the Mureș"],"gender":"m"},{"word":"grosul","pos":"noun","definitions":["definite nominative/accusative singular of gros"]},{"word":"grosular","pos":"noun","definitions":["grossular"],"forms":{"plural":"grosulare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grosular","accusative-definite-nominative-singular":"grosularul","accusative-indefinite-nominative-plural":"grosulare","accusative-definite-nominative-plural":"grosularele","dative-genitive-indefinite-singular":"grosular","dative-definite-genitive-singular":"grosularului","dative-genitive-indefinite-plural":"grosulare","dative-definite-genitive-plural":"grosularelor","singular-vocative":"grosularule","plural-vocative":"grosularelor"}},{"word":"Grosulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grosulescu"}},{"word":"Groșuri","pos":"name","definitions":["a village in Blăjeni, Hunedoara County, Romania"],"gender":"m"},{"word":"grosuț","pos":"adj","definitions":["diminutive of gros"],"forms":{"feminine-singular":"grosuță","masculine-plural":"grosuți","feminine-neuter-plural":"grosuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grosuț","error-unrecognized-form-feminine-indefinite-singular":"grosuță","error-unrecognized-form-indefinite-masculine-plural":"grosuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"grosuțe","definite-error-unrecognized-form-masculine-neuter-singular":"grosuțul","definite-error-unrecognized-form-feminine-singular":"grosuța","definite-error-unrecognized-form-masculine-plural":"grosuții","definite-error-unrecognized-form-feminine-neuter-plural":"grosuțele"}},{"word":"grota","pos":"noun","definitions":["definite nominative/accusative singular of grotă"],"pronunciation":"[ˈɡrota]","gender":"f"},{"word":"grotă","pos":"noun","definitions":["grotto"],"pronunciation":"/ˈɡro.tə/","forms":{"plural":"grote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grotă","accusative-definite-nominative-singular":"grota","accusative-indefinite-nominative-plural":"grote","accusative-definite-nominative-plural":"grotele","dative-genitive-indefinite-singular":"grote","dative-definite-genitive-singular":"grotei","dative-genitive-indefinite-plural":"grote","dative-definite-genitive-plural":"grotelor","singular-vocative":"grotă","plural-vocative":"grotelor"}},{"word":"grote","pos":"noun","definitions":["inflection of grotă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡrote]","gender":"f-p"},{"word":"grotesc","pos":"adj","definitions":["grotesque"],"forms":{"feminine-singular":"grotească","plural":"grotești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grotesc","error-unrecognized-form-feminine-indefinite-singular":"grotească","error-unrecognized-form-indefinite-masculine-plural":"grotești","error-unrecognized-form-feminine-indefinite-neuter-plural":"grotești","definite-error-unrecognized-form-masculine-neuter-singular":"grotescul","definite-error-unrecognized-form-feminine-singular":"groteasca","definite-error-unrecognized-form-masculine-plural":"groteștii","definite-error-unrecognized-form-feminine-neuter-plural":"groteștile"}},{"word":"groto","pos":"noun","definitions":["vocative singular of grotă"],"pronunciation":"[ˈɡroto]","gender":"f"},{"word":"grozamă","pos":"noun","definitions":["arrow-jointed broom (Genista sagittalis)"],"forms":{"plural":"grozame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grozamă","accusative-definite-nominative-singular":"grozama","accusative-indefinite-nominative-plural":"grozame","accusative-definite-nominative-plural":"grozamele","dative-genitive-indefinite-singular":"grozame","dative-definite-genitive-singular":"grozamei","dative-genitive-indefinite-plural":"grozame","dative-definite-genitive-plural":"grozamelor","singular-vocative":"grozamă","plural-vocative":"grozamelor"}},{"word":"Grozasca","pos":"name","definitions":["a village in Florițoaia Veche, Ungheni Raion, Moldova"],"gender":"f"},{"word":"Grozav","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grozav"}},{"word":"grozav","pos":"adj","definitions":["terrific, great, exceptional, tremendous, scrumptious, awesome, lush, copacetic","terrible, awful, dreadful, atrocious, horrible"],"forms":{"feminine-singular":"grozavă","masculine-plural":"grozavi","feminine-neuter-plural":"grozave"}},{"word":"grozav","pos":"adv","definitions":["very, bloody, extremely"]},{"word":"grozăvenie","pos":"noun","definitions":["awful thing or being"],"forms":{"plural":"grozăvenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grozăvenie","accusative-definite-nominative-singular":"grozăvenia","accusative-indefinite-nominative-plural":"grozăvenii","accusative-definite-nominative-plural":"grozăveniile","dative-genitive-indefinite-singular":"grozăvenii","dative-definite-genitive-singular":"grozăveniei","dative-genitive-indefinite-plural":"grozăvenii","dative-definite-genitive-plural":"grozăveniilor","singular-vocative":"grozăvenie","plural-vocative":"grozăveniilor"}},{"word":"Grozăvescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grozăvescu"}},{"word":"Grozăvești","pos":"name","definitions":["a village in Corbii Mari, Dâmbovița County, Romania","a village in Nicorești, Galați County, Romania","a village in Hangu, Neamț County, Romania","a village in Drăghiceni, Olt County, Romania","a neighbourhood of Bucharest, Romania"],"gender":"m"},{"word":"grozăvi","pos":"verb","definitions":["to brag"],"forms":{"canonical":"a grozăvi 4th conjugation","present-singular-third-person":"grozăvește","participle-past":"grozăvit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a grozăvi","gerund":"grozăvind","first-person-indicative-present-singular":"grozăvesc","indicative-present-second-person-singular":"grozăvești","indicative-present-singular-third-person":"grozăvește","first-person-indicative-plural-present":"grozăvim","indicative-plural-present-second-person":"grozăviți","indicative-plural-present-third-person":"grozăvesc","first-person-imperfect-indicative-singular":"grozăveam","imperfect-indicative-second-person-singular":"grozăveai","imperfect-indicative-singular-third-person":"grozăvea","first-person-imperfect-indicative-plural":"grozăveam","imperfect-indicative-plural-second-person":"grozăveați","imperfect-indicative-plural-third-person":"grozăveau","first-person-indicative-perfect-singular":"grozăvii","indicative-perfect-second-person-singular":"grozăviși","indicative-perfect-singular-third-person":"grozăvi","first-person-indicative-perfect-plural":"grozăvirăm","indicative-perfect-plural-second-person":"grozăvirăți","indicative-perfect-plural-third-person":"grozăviră","first-person-indicative-pluperfect-singular":"grozăvisem","indicative-pluperfect-second-person-singular":"grozăviseși","indicative-pluperfect-singular-third-person":"grozăvise","first-person-indicative-pluperfect-plural":"grozăviserăm","indicative-pluperfect-plural-second-person":"grozăviserăți","indicative-pluperfect-plural-third-person":"grozăviseră","first-person-present-singular-subjunctive":"să grozăvesc","present-second-person-singular-subjunctive":"să grozăvești","present-singular-subjunctive-third-person":"să grozăvească","first-person-plural-present-subjunctive":"să grozăvim","plural-present-second-person-subjunctive":"să grozăviți","plural-present-subjunctive-third-person":"să grozăvească","imperative-second-person-singular":"grozăvește","imperative-plural-second-person":"grozăviți","imperative-negative-second-person-singular":"nu grozăvi","imperative-negative-plural-second-person":"nu grozăviți"}},{"word":"grozăvie","pos":"noun","definitions":["terror"],"forms":{"plural":"grozăvii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"grozăvie","accusative-definite-nominative-singular":"grozăvia","accusative-indefinite-nominative-plural":"grozăvii","accusative-definite-nominative-plural":"grozăviile","dative-genitive-indefinite-singular":"grozăvii","dative-definite-genitive-singular":"grozăviei","dative-genitive-indefinite-plural":"grozăvii","dative-definite-genitive-plural":"grozăviilor","singular-vocative":"grozăvie","plural-vocative":"grozăviilor"}},{"word":"grozăvior","pos":"adj","definitions":["diminutive of grozav"],"forms":{"feminine-singular":"grozăvioră","masculine-plural":"grozăviori","feminine-neuter-plural":"grozăviore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grozăvior","error-unrecognized-form-feminine-indefinite-singular":"grozăvioră","error-unrecognized-form-indefinite-masculine-plural":"grozăviori","error-unrecognized-form-feminine-indefinite-neuter-plural":"grozăviore","definite-error-unrecognized-form-masculine-neuter-singular":"grozăviorul","definite-error-unrecognized-form-feminine-singular":"grozăviora","definite-error-unrecognized-form-masculine-plural":"grozăviorii","definite-error-unrecognized-form-feminine-neuter-plural":"grozăviorele"}},{"word":"grozăvire","pos":"noun","definitions":["horror, terror"],"forms":{"plural":"grozăviri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grozăvire","accusative-definite-nominative-singular":"grozăvirea","accusative-indefinite-nominative-plural":"grozăviri","accusative-definite-nominative-plural":"grozăvirile","dative-genitive-indefinite-singular":"grozăviri","dative-definite-genitive-singular":"grozăvirii","dative-genitive-indefinite-plural":"grozăviri","dative-definite-genitive-plural":"grozăvirilor","singular-vocative":"grozăvire","plural-vocative":"grozăvirilor"}},{"word":"grozavnic","pos":"adj","definitions":["horrible"],"forms":{"feminine-singular":"grozavnică","masculine-plural":"grozavnici","feminine-neuter-plural":"grozavnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grozavnic","error-unrecognized-form-feminine-indefinite-singular":"grozavnică","error-unrecognized-form-indefinite-masculine-plural":"grozavnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"grozavnice","definite-error-unrecognized-form-masculine-neuter-singular":"grozavnicul","definite-error-unrecognized-form-feminine-singular":"grozavnica","definite-error-unrecognized-form-masculine-plural":"grozavnicii","definite-error-unrecognized-form-feminine-neuter-plural":"grozavnicele"}},{"word":"Grozavu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grozavu"}},{"word":"Grozea","pos":"name","definitions":["a river in Argeș County, Romania, tributary to the Râușorul"],"gender":"f"},{"word":"Grozescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grozescu"}},{"word":"Grozești","pos":"name","definitions":["a commune of Iași County, Romania","a village in Grozești, Iași County, Romania","a commune of Mehedinți County, Romania","a village in Grozești, Mehedinți County, Romania"],"gender":"m"},{"word":"grozliv","pos":"adj","definitions":["terrible"],"forms":{"feminine-singular":"grozlivă","masculine-plural":"grozlivi","feminine-neuter-plural":"grozlive","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grozliv","error-unrecognized-form-feminine-indefinite-singular":"grozlivă","error-unrecognized-form-indefinite-masculine-plural":"grozlivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grozlive","definite-error-unrecognized-form-masculine-neuter-singular":"grozlivul","definite-error-unrecognized-form-feminine-singular":"grozliva","definite-error-unrecognized-form-masculine-plural":"grozlivii","definite-error-unrecognized-form-feminine-neuter-plural":"grozlivele"}},{"word":"groznic","pos":"adj","definitions":["obsolete form of groaznic"],"forms":{"feminine-singular":"groznică","masculine-plural":"groznici","feminine-neuter-plural":"groznice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"groznic","error-unrecognized-form-feminine-indefinite-singular":"groznică","error-unrecognized-form-indefinite-masculine-plural":"groznici","error-unrecognized-form-feminine-indefinite-neuter-plural":"groznice","definite-error-unrecognized-form-masculine-neuter-singular":"groznicul","definite-error-unrecognized-form-feminine-singular":"groznica","definite-error-unrecognized-form-masculine-plural":"groznicii","definite-error-unrecognized-form-feminine-neuter-plural":"groznicele"}},{"word":"groznicește","pos":"adv","definitions":["terribly"]},{"word":"groznicie","pos":"noun","definitions":["mercilessness"],"forms":{"plural":"groznicii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"groznicie","accusative-definite-nominative-singular":"groznicia","accusative-indefinite-nominative-plural":"groznicii","accusative-definite-nominative-plural":"grozniciile","dative-genitive-indefinite-singular":"groznicii","dative-definite-genitive-singular":"grozniciei","dative-genitive-indefinite-plural":"groznicii","dative-definite-genitive-plural":"grozniciilor","singular-vocative":"groznicie","plural-vocative":"grozniciilor"}},{"word":"Groznița","pos":"name","definitions":["a village in Mihăileni, Briceni Raion, Moldova"],"gender":"f"},{"word":"Grozuță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grozuță"}},{"word":"Grui","pos":"name","definitions":["a village in Mușetești, Gorj County, Romania"],"gender":"m"},{"word":"grui","pos":"noun","definitions":["hill slope","hillock"],"forms":{"plural":"gruiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grui","accusative-definite-nominative-singular":"gruiul","accusative-indefinite-nominative-plural":"gruiuri","accusative-definite-nominative-plural":"gruiurile","dative-genitive-indefinite-singular":"grui","dative-definite-genitive-singular":"gruiului","dative-genitive-indefinite-plural":"gruiuri","dative-definite-genitive-plural":"gruiurilor","singular-vocative":"gruiule","plural-vocative":"gruiurilor"}},{"word":"grui","pos":"noun","definitions":["crane (bird)"],"forms":{"plural":"grui","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grui","accusative-definite-nominative-singular":"gruiul","accusative-indefinite-nominative-plural":"grui","accusative-definite-nominative-plural":"gruii","dative-genitive-indefinite-singular":"grui","dative-definite-genitive-singular":"gruiului","dative-genitive-indefinite-plural":"grui","dative-definite-genitive-plural":"gruilor","singular-vocative":"gruiule","plural-vocative":"gruilor","alternative-rare":"grue"}},{"word":"Gruia","pos":"name","definitions":["a commune of Mehedinți County, Romania","a village in Gruia, Mehedinți County, Romania"],"gender":"f"},{"word":"gruie","pos":"noun","definitions":["crane (machine)","a davit"],"pronunciation":"/ˈɡru.je/","forms":{"plural":"gruie","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"gruie","accusative-definite-nominative-singular":"gruia","accusative-indefinite-nominative-plural":"gruie","accusative-definite-nominative-plural":"gruiele","dative-genitive-indefinite-singular":"gruie","dative-definite-genitive-singular":"gruiei","dative-genitive-indefinite-plural":"gruie","dative-definite-genitive-plural":"gruielor","singular-vocative":"-","plural-vocative":"-"}},{"word":"gruie","pos":"noun","definitions":["rare form of grui"],"pronunciation":"/ˈɡru.je/","forms":{"plural":"gruie","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"gruie","accusative-definite-nominative-singular":"gruia","accusative-indefinite-nominative-plural":"gruie","accusative-definite-nominative-plural":"gruiele","dative-genitive-indefinite-singular":"gruie","dative-definite-genitive-singular":"gruiei","dative-genitive-indefinite-plural":"gruie","dative-definite-genitive-plural":"gruielor","singular-vocative":"-","plural-vocative":"-"}},{"word":"gruie","pos":"noun","definitions":["plural of grui"],"pronunciation":"/ˈɡru.je/","gender":"n"},{"word":"Gruieri","pos":"name","definitions":["a village in Stoenești, Vâlcea County, Romania"],"gender":"m"},{"word":"Gruiescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gruiescu"}},{"word":"gruieț","pos":"noun","definitions":["diminutive of grui; small hillock"],"forms":{"plural":"gruiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gruieț","accusative-definite-nominative-singular":"gruiețul","accusative-indefinite-nominative-plural":"gruiețe","accusative-definite-nominative-plural":"gruiețele","dative-genitive-indefinite-singular":"gruieț","dative-definite-genitive-singular":"gruiețului","dative-genitive-indefinite-plural":"gruiețe","dative-definite-genitive-plural":"gruiețelor","singular-vocative":"gruiețule","plural-vocative":"gruiețelor"}},{"word":"Gruilung","pos":"name","definitions":["a village in Lăzăreni, Bihor County, Romania"],"gender":"m"},{"word":"gruios","pos":"adj","definitions":["slanting, aslant"],"forms":{"feminine-singular":"gruioasă","masculine-plural":"gruioși","feminine-neuter-plural":"gruioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gruios","error-unrecognized-form-feminine-indefinite-singular":"gruioasă","error-unrecognized-form-indefinite-masculine-plural":"gruioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gruioase","definite-error-unrecognized-form-masculine-neuter-singular":"gruiosul","definite-error-unrecognized-form-feminine-singular":"gruioasa","definite-error-unrecognized-form-masculine-plural":"gruioșii","definite-error-unrecognized-form-feminine-neuter-plural":"gruioasele"}},{"word":"Gruișoara","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Strei"],"gender":"f"},{"word":"Gruișor","pos":"name","definitions":["a village in Acățari, Mureș County, Romania"],"gender":"m"},{"word":"gruișor","pos":"noun","definitions":["diminutive of grui"],"forms":{"plural":"gruișori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gruișor","accusative-definite-nominative-singular":"gruișorul","accusative-indefinite-nominative-plural":"gruișori","accusative-definite-nominative-plural":"gruișorii","dative-genitive-indefinite-singular":"gruișor","dative-definite-genitive-singular":"gruișorului","dative-genitive-indefinite-plural":"gruișori","dative-definite-genitive-plural":"gruișorilor","singular-vocative":"gruișorule","plural-vocative":"gruișorilor"}},{"word":"Gruișoru","pos":"name","definitions":["a mountain in Romania"],"gender":"m"},{"word":"Gruița","pos":"name","definitions":["a village in Goiești, Dolj County, Romania"],"gender":"f"},{"word":"Gruiu","pos":"name","definitions":["a village in Căteasca, Argeș County, Romania","a village in Nucșoara, Argeș County, Romania","a village in Budești, Călărași County, Romania","a commune of Ilfov County, Romania","a village in Gruiu, Ilfov County, Romania"],"gender":"m"},{"word":"Gruiu Lung","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Murgușa"],"gender":"m"},{"word":"Gruiu Lupului","pos":"name","definitions":["a village in Racovița, Vâlcea County, Romania"],"gender":"m"},{"word":"Gruiu Scurt","pos":"name","definitions":["a river in Sibiu, Romania, tributary to the Lotrioara"],"gender":"m"},{"word":"Gruiu Ursului","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Cârligate"],"gender":"m"},{"word":"gruiul","pos":"noun","definitions":["definite nominative/accusative singular of grui"]},{"word":"Gruiul Negru","pos":"name","definitions":["a river in Vâlcea, Romania, tributary to the Rudăreasa"],"gender":"m"},{"word":"gruiului","pos":"noun","definitions":["definite genitive/dative singular of grui"]},{"word":"gruiuri","pos":"noun","definitions":["plural of grui"],"gender":"n"},{"word":"grum","pos":"noun","definitions":["pile, bundle, heap"],"forms":{"plural":"grumuri"}},{"word":"grumăjel","pos":"noun","definitions":["diminutive of grumaz"],"forms":{"plural":"grumăjei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grumăjel","accusative-definite-nominative-singular":"grumăjelul","accusative-indefinite-nominative-plural":"grumăjei","accusative-definite-nominative-plural":"grumăjeii","dative-genitive-indefinite-singular":"grumăjel","dative-definite-genitive-singular":"grumăjelului","dative-genitive-indefinite-plural":"grumăjei","dative-definite-genitive-plural":"grumăjeilor","singular-vocative":"grumăjelule","plural-vocative":"grumăjeilor"}},{"word":"grumăjer","pos":"noun","definitions":["the neck part of an armor"],"forms":{"plural":"grumăjere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grumăjer","accusative-definite-nominative-singular":"grumăjerul","accusative-indefinite-nominative-plural":"grumăjere","accusative-definite-nominative-plural":"grumăjerele","dative-genitive-indefinite-singular":"grumăjer","dative-definite-genitive-singular":"grumăjerului","dative-genitive-indefinite-plural":"grumăjere","dative-definite-genitive-plural":"grumăjerelor","singular-vocative":"grumăjerule","plural-vocative":"grumăjerelor"}},{"word":"grumăjor","pos":"noun","definitions":["diminutive of grumaz"],"pronunciation":"/ɡru.məˈʒor/","forms":{"plural":"grumăjori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grumăjor","accusative-definite-nominative-singular":"grumăjorul","accusative-indefinite-nominative-plural":"grumăjori","accusative-definite-nominative-plural":"grumăjorii","dative-genitive-indefinite-singular":"grumăjor","dative-definite-genitive-singular":"grumăjorului","dative-genitive-indefinite-plural":"grumăjori","dative-definite-genitive-plural":"grumăjorilor","singular-vocative":"grumăjorule","plural-vocative":"grumăjorilor"}},{"word":"Grumaz","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grumaz"}},{"word":"grumaz","pos":"noun","definitions":["neck","nape","Adam's apple","small hill"],"forms":{"plural":"grumazuri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grumaz","accusative-definite-nominative-singular":"grumazul","accusative-indefinite-nominative-plural":"grumazuri","accusative-definite-nominative-plural":"grumazurii","dative-genitive-indefinite-singular":"grumaz","dative-definite-genitive-singular":"grumazului","dative-genitive-indefinite-plural":"grumazuri","dative-definite-genitive-plural":"grumazurilor","singular-vocative":"grumazule","plural-vocative":"grumazurilor"}},{"word":"Grumăzescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Grumăzescu"}},{"word":"Grumăzești","pos":"name","definitions":["a commune of Neamț County, Romania","a village in Grumăzești, Neamț County, Romania"],"gender":"m"},{"word":"grumăzuț","pos":"noun","definitions":["diminutive of grumaz"],"forms":{"plural":"grumăzuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grumăzuț","accusative-definite-nominative-singular":"grumăzuțul","accusative-indefinite-nominative-plural":"grumăzuți","accusative-definite-nominative-plural":"grumăzuții","dative-genitive-indefinite-singular":"grumăzuț","dative-definite-genitive-singular":"grumăzuțului","dative-genitive-indefinite-plural":"grumăzuți","dative-definite-genitive-plural":"grumăzuților","singular-vocative":"grumăzuțule","plural-vocative":"grumăzuților"}},{"word":"grumb","pos":"adj","definitions":["rough, coarse"],"forms":{"feminine-singular":"grumbă","masculine-plural":"grumbi","feminine-neuter-plural":"grumbe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grumb","error-unrecognized-form-feminine-indefinite-singular":"grumbă","error-unrecognized-form-indefinite-masculine-plural":"grumbi","error-unrecognized-form-feminine-indefinite-neuter-plural":"grumbe","definite-error-unrecognized-form-masculine-neuter-singular":"grumbul","definite-error-unrecognized-form-feminine-singular":"grumba","definite-error-unrecognized-form-masculine-plural":"grumbii","definite-error-unrecognized-form-feminine-neuter-plural":"grumbele"}},{"word":"grumbiște","pos":"noun","definitions":["potato field"],"forms":{"plural":"grumbiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grumbiște","accusative-definite-nominative-singular":"grumbiștea","accusative-indefinite-nominative-plural":"grumbiști","accusative-definite-nominative-plural":"grumbiștile","dative-genitive-indefinite-singular":"grumbiști","dative-definite-genitive-singular":"grumbiștii","dative-genitive-indefinite-plural":"grumbiști","dative-definite-genitive-plural":"grumbiștilor","singular-vocative":"grumbiște","plural-vocative":"grumbiștilor"}},{"word":"grumbuh","pos":"noun","definitions":["cadastre"],"forms":{"plural":"grumbuhuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grumbuh","accusative-definite-nominative-singular":"grumbuhul","accusative-indefinite-nominative-plural":"grumbuhuri","accusative-definite-nominative-plural":"grumbuhurile","dative-genitive-indefinite-singular":"grumbuh","dative-definite-genitive-singular":"grumbuhului","dative-genitive-indefinite-plural":"grumbuhuri","dative-definite-genitive-plural":"grumbuhurilor","singular-vocative":"grumbuhule","plural-vocative":"grumbuhurilor"}},{"word":"Grumezoaia","pos":"name","definitions":["a village in Dimitrie Cantemir, Vaslui County, Romania"],"gender":"f"},{"word":"grumuleu","pos":"noun","definitions":["peak, summit"],"forms":{"plural":"grumuleie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grumuleu","accusative-definite-nominative-singular":"grumuleuul","accusative-indefinite-nominative-plural":"grumuleie","accusative-definite-nominative-plural":"grumuleiele","dative-genitive-indefinite-singular":"grumuleu","dative-definite-genitive-singular":"grumuleuului","dative-genitive-indefinite-plural":"grumuleie","dative-definite-genitive-plural":"grumuleielor","singular-vocative":"grumuleuule","plural-vocative":"grumuleielor"}},{"word":"grumura","pos":"verb","definitions":["to load"],"forms":{"canonical":"a grumura 1st conjugation","participle-past":"grumurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a grumura","gerund":"grumurând","first-person-indicative-present-singular":"grumur","indicative-present-second-person-singular":"grumuri","indicative-present-singular-third-person":"grumură","first-person-indicative-plural-present":"grumurăm","indicative-plural-present-second-person":"grumurați","indicative-plural-present-third-person":"grumură","first-person-imperfect-indicative-singular":"grumuram","imperfect-indicative-second-person-singular":"grumurai","imperfect-indicative-singular-third-person":"grumura","first-person-imperfect-indicative-plural":"grumuram","imperfect-indicative-plural-second-person":"grumurați","imperfect-indicative-plural-third-person":"grumurau","first-person-indicative-perfect-singular":"grumurai","indicative-perfect-second-person-singular":"grumurași","indicative-perfect-singular-third-person":"grumură","first-person-indicative-perfect-plural":"grumurarăm","indicative-perfect-plural-second-person":"grumurarăți","indicative-perfect-plural-third-person":"grumurară","first-person-indicative-pluperfect-singular":"grumurasem","indicative-pluperfect-second-person-singular":"grumuraseși","indicative-pluperfect-singular-third-person":"grumurase","first-person-indicative-pluperfect-plural":"grumuraserăm","indicative-pluperfect-plural-second-person":"grumuraserăți","indicative-pluperfect-plural-third-person":"grumuraseră","first-person-present-singular-subjunctive":"să grumur","present-second-person-singular-subjunctive":"să grumuri","present-singular-subjunctive-third-person":"să grumure","first-person-plural-present-subjunctive":"să grumurăm","plural-present-second-person-subjunctive":"să grumurați","plural-present-subjunctive-third-person":"să grumure","imperative-second-person-singular":"grumură","imperative-plural-second-person":"grumurați","imperative-negative-second-person-singular":"nu grumura","imperative-negative-plural-second-person":"nu grumurați"}},{"word":"Gruni","pos":"name","definitions":["a village in Cornereva, Caraș-Severin County, Romania","a village in Belinț, Timiș County, Romania"],"gender":"m"},{"word":"grunjos","pos":"adj","definitions":["coarse, lumpy"],"forms":{"feminine-singular":"grunjoasă","masculine-plural":"grunjoși","feminine-neuter-plural":"grunjoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grunjos","error-unrecognized-form-feminine-indefinite-singular":"grunjoasă","error-unrecognized-form-indefinite-masculine-plural":"grunjoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grunjoase","definite-error-unrecognized-form-masculine-neuter-singular":"grunjosul","definite-error-unrecognized-form-feminine-singular":"grunjoasa","definite-error-unrecognized-form-masculine-plural":"grunjoșii","definite-error-unrecognized-form-feminine-neuter-plural":"grunjoasele"}},{"word":"grunțuială","pos":"noun","definitions":["plaster"],"forms":{"plural":"grunțuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grunțuială","accusative-definite-nominative-singular":"grunțuiala","accusative-indefinite-nominative-plural":"grunțuiele","accusative-definite-nominative-plural":"grunțuielele","dative-genitive-indefinite-singular":"grunțuiele","dative-definite-genitive-singular":"grunțuielei","dative-genitive-indefinite-plural":"grunțuiele","dative-definite-genitive-plural":"grunțuielelor","singular-vocative":"grunțuială","plural-vocative":"grunțuielelor"}},{"word":"grunțuros","pos":"adj","definitions":["alternative form of grunzuros"],"forms":{"feminine-singular":"grunțuroasă","masculine-plural":"grunțuroși","feminine-neuter-plural":"grunțuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grunțuros","error-unrecognized-form-feminine-indefinite-singular":"grunțuroasă","error-unrecognized-form-indefinite-masculine-plural":"grunțuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grunțuroase","definite-error-unrecognized-form-masculine-neuter-singular":"grunțurosul","definite-error-unrecognized-form-feminine-singular":"grunțuroasa","definite-error-unrecognized-form-masculine-plural":"grunțuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"grunțuroasele"}},{"word":"grunz","pos":"noun","definitions":["lump","clod"],"forms":{"plural":"grunji","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grunz","accusative-definite-nominative-singular":"grunzul","accusative-indefinite-nominative-plural":"grunji","accusative-definite-nominative-plural":"grunjii","dative-genitive-indefinite-singular":"grunz","dative-definite-genitive-singular":"grunzului","dative-genitive-indefinite-plural":"grunji","dative-definite-genitive-plural":"grunjilor","singular-vocative":"grunzule","plural-vocative":"grunjilor","alternative":"grunț"}},{"word":"Grunzu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Grunzu"}},{"word":"grunzuraș","pos":"noun","definitions":["diminutive of grunz"],"forms":{"plural":"grunzurași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"grunzuraș","accusative-definite-nominative-singular":"grunzurașul","accusative-indefinite-nominative-plural":"grunzurași","accusative-definite-nominative-plural":"grunzurașii","dative-genitive-indefinite-singular":"grunzuraș","dative-definite-genitive-singular":"grunzurașului","dative-genitive-indefinite-plural":"grunzurași","dative-definite-genitive-plural":"grunzurașilor","singular-vocative":"grunzurașule","plural-vocative":"grunzurașilor"}},{"word":"grunzuros","pos":"adj","definitions":["coarse, lumpy"],"forms":{"feminine-singular":"grunzuroasă","masculine-plural":"grunzuroși","feminine-neuter-plural":"grunzuroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grunzuros","error-unrecognized-form-feminine-indefinite-singular":"grunzuroasă","error-unrecognized-form-indefinite-masculine-plural":"grunzuroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"grunzuroase","definite-error-unrecognized-form-masculine-neuter-singular":"grunzurosul","definite-error-unrecognized-form-feminine-singular":"grunzuroasa","definite-error-unrecognized-form-masculine-plural":"grunzuroșii","definite-error-unrecognized-form-feminine-neuter-plural":"grunzuroasele"}},{"word":"grup","pos":"noun","definitions":["a group"],"forms":{"plural":"grupuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"grup","accusative-definite-nominative-singular":"grupul","accusative-indefinite-nominative-plural":"grupuri","accusative-definite-nominative-plural":"grupurile","dative-genitive-indefinite-singular":"grup","dative-definite-genitive-singular":"grupului","dative-genitive-indefinite-plural":"grupuri","dative-definite-genitive-plural":"grupurilor","singular-vocative":"grupule","plural-vocative":"grupurilor"}},{"word":"grup abelian","pos":"noun","definitions":["abelian group"],"forms":{"plural":"grupuri abeliene"}},{"word":"grup comutativ","pos":"noun","definitions":["abelian group"],"forms":{"plural":"grupuri comutative"}},{"word":"grup de control","pos":"noun","definitions":["control group"],"forms":{"plural":"grupuri de control"}},{"word":"grup de influență","pos":"noun","definitions":["advocacy group"],"forms":{"plural":"grupuri de influență"}},{"word":"grup de presiune","pos":"noun","definitions":["advocacy group"],"forms":{"plural":"grupuri de presiune"}},{"word":"grup de sprijin","pos":"noun","definitions":["support group"],"forms":{"plural":"grupuri de sprijin"}},{"word":"grup etnic","pos":"noun","definitions":["ethnic group"],"forms":{"plural":"grupuri etnice"}},{"word":"grup sanitar","pos":"noun","definitions":["toilet"],"forms":{"plural":"grupuri sanitare"}},{"word":"grupa","pos":"verb","definitions":["to group"],"pronunciation":"/ɡruˈpa/","forms":{"canonical":"a grupa 1st conjugation","present-singular-third-person":"grupează","participle-past":"grupat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a grupa","gerund":"grupând","first-person-indicative-present-singular":"grupez","indicative-present-second-person-singular":"grupezi","indicative-present-singular-third-person":"grupează","first-person-indicative-plural-present":"grupăm","indicative-plural-present-second-person":"grupați","indicative-plural-present-third-person":"grupează","first-person-imperfect-indicative-singular":"grupam","imperfect-indicative-second-person-singular":"grupai","imperfect-indicative-singular-third-person":"grupa","first-person-imperfect-indicative-plural":"grupam","imperfect-indicative-plural-second-person":"grupați","imperfect-indicative-plural-third-person":"grupau","first-person-indicative-perfect-singular":"grupai","indicative-perfect-second-person-singular":"grupași","indicative-perfect-singular-third-person":"grupă","first-person-indicative-perfect-plural":"gruparăm","indicative-perfect-plural-second-person":"gruparăți","indicative-perfect-plural-third-person":"grupară","first-person-indicative-pluperfect-singular":"grupasem","indicative-pluperfect-second-person-singular":"grupaseși","indicative-pluperfect-singular-third-person":"grupase","first-person-indicative-pluperfect-plural":"grupaserăm","indicative-pluperfect-plural-second-person":"grupaserăți","indicative-pluperfect-plural-third-person":"grupaseră","first-person-present-singular-subjunctive":"să grupez","present-second-person-singular-subjunctive":"să grupezi","present-singular-subjunctive-third-person":"să grupeze","first-person-plural-present-subjunctive":"să grupăm","plural-present-second-person-subjunctive":"să grupați","plural-present-subjunctive-third-person":"să grupeze","imperative-second-person-singular":"grupează","imperative-plural-second-person":"grupați","imperative-negative-second-person-singular":"nu grupa","imperative-negative-plural-second-person":"nu grupați","alternative":"група"}},{"word":"grupa","pos":"noun","definitions":["definite nominative/accusative singular of grupă"],"pronunciation":"/ˈɡru.pa/","forms":{"alternative":"група"}},{"word":"grupă","pos":"noun","definitions":["group"],"pronunciation":"/ˈɡru.pə/","forms":{"plural":"grupe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"grupă","accusative-definite-nominative-singular":"grupa","accusative-indefinite-nominative-plural":"grupe","accusative-definite-nominative-plural":"grupele","dative-genitive-indefinite-singular":"grupe","dative-definite-genitive-singular":"grupei","dative-genitive-indefinite-plural":"grupe","dative-definite-genitive-plural":"grupelor","singular-vocative":"grupă","plural-vocative":"grupelor","alternative":"групэ"}},{"word":"grupă sangvină","pos":"noun","definitions":["blood type"],"forms":{"plural":"grupe sangvine"}},{"word":"grupaj","pos":"noun","definitions":["grouping"],"forms":{"plural":"grupaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grupaj","accusative-definite-nominative-singular":"grupajul","accusative-indefinite-nominative-plural":"grupaje","accusative-definite-nominative-plural":"grupajele","dative-genitive-indefinite-singular":"grupaj","dative-definite-genitive-singular":"grupajului","dative-genitive-indefinite-plural":"grupaje","dative-definite-genitive-plural":"grupajelor","singular-vocative":"grupajule","plural-vocative":"grupajelor"}},{"word":"grupare","pos":"noun","definitions":["grouping"],"forms":{"plural":"grupări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"grupare","accusative-definite-nominative-singular":"gruparea","accusative-indefinite-nominative-plural":"grupări","accusative-definite-nominative-plural":"grupările","dative-genitive-indefinite-singular":"grupări","dative-definite-genitive-singular":"grupării","dative-genitive-indefinite-plural":"grupări","dative-definite-genitive-plural":"grupărilor","singular-vocative":"grupare","plural-vocative":"grupărilor"}},{"word":"grupat","pos":"adj","definitions":["grouped"],"forms":{"feminine-singular":"grupată","masculine-plural":"grupați","feminine-neuter-plural":"grupate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"grupat","error-unrecognized-form-feminine-indefinite-singular":"grupată","error-unrecognized-form-indefinite-masculine-plural":"grupați","error-unrecognized-form-feminine-indefinite-neuter-plural":"grupate","definite-error-unrecognized-form-masculine-neuter-singular":"grupatul","definite-error-unrecognized-form-feminine-singular":"grupata","definite-error-unrecognized-form-masculine-plural":"grupații","definite-error-unrecognized-form-feminine-neuter-plural":"grupatele"}},{"word":"grupuleț","pos":"noun","definitions":["diminutive of grup; small group"],"forms":{"plural":"grupulețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grupuleț","accusative-definite-nominative-singular":"grupulețul","accusative-indefinite-nominative-plural":"grupulețe","accusative-definite-nominative-plural":"grupulețele","dative-genitive-indefinite-singular":"grupuleț","dative-definite-genitive-singular":"grupulețului","dative-genitive-indefinite-plural":"grupulețe","dative-definite-genitive-plural":"grupulețelor","singular-vocative":"grupulețule","plural-vocative":"grupulețelor"}},{"word":"grupușor","pos":"noun","definitions":["diminutive of grup; small group"],"forms":{"plural":"grupușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"grupușor","accusative-definite-nominative-singular":"grupușorul","accusative-indefinite-nominative-plural":"grupușore","accusative-definite-nominative-plural":"grupușorele","dative-genitive-indefinite-singular":"grupușor","dative-definite-genitive-singular":"grupușorului","dative-genitive-indefinite-plural":"grupușore","dative-definite-genitive-plural":"grupușorelor","singular-vocative":"grupușorule","plural-vocative":"grupușorelor"}},{"word":"Gruzia","pos":"name","definitions":["Georgia (a transcontinental country in the Caucasus region of Europe and Asia, on the coast of the Black Sea, often considered to belong politically to Europe)"],"pronunciation":"/ˈɡru.zi.a/","gender":"f","forms":{"dative-genitive":"Gruziei","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"Gruzie","accusative-definite-nominative":"Gruzia","dative-genitive-indefinite":"Gruzii","dative-definite-genitive":"Gruziei","vocative":"Gruzie","alternative":"Грузия"}},{"word":"gruzin","pos":"noun","definitions":["Georgian"],"forms":{"plural":"gruzini","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gruzin","accusative-definite-nominative-singular":"gruzinul","accusative-indefinite-nominative-plural":"gruzini","accusative-definite-nominative-plural":"gruzinii","dative-genitive-indefinite-singular":"gruzin","dative-definite-genitive-singular":"gruzinului","dative-genitive-indefinite-plural":"gruzini","dative-definite-genitive-plural":"gruzinilor","singular-vocative":"gruzinule","plural-vocative":"gruzinilor"}},{"word":"gruzină","pos":"noun","definitions":["female equivalent of gruzin"],"forms":{"plural":"gruzine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gruzină","accusative-definite-nominative-singular":"gruzina","accusative-indefinite-nominative-plural":"gruzine","accusative-definite-nominative-plural":"gruzinele","dative-genitive-indefinite-singular":"gruzine","dative-definite-genitive-singular":"gruzinei","dative-genitive-indefinite-plural":"gruzine","dative-definite-genitive-plural":"gruzinelor","singular-vocative":"gruzină","plural-vocative":"gruzinelor"}},{"word":"guanidină","pos":"noun","definitions":["guanidine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guanidină","accusative-definite-nominative-singular":"guanidina","accusative-indefinite-nominative-plural":"guanidine","accusative-definite-nominative-plural":"guanidinele","dative-genitive-indefinite-singular":"guanidine","dative-definite-genitive-singular":"guanidinei","dative-genitive-indefinite-plural":"guanidine","dative-definite-genitive-plural":"guanidinelor","singular-vocative":"guanidină","plural-vocative":"guanidinelor"}},{"word":"guanină","pos":"noun","definitions":["guanine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guanină","accusative-definite-nominative-singular":"guanina","accusative-indefinite-nominative-plural":"guanine","accusative-definite-nominative-plural":"guaninele","dative-genitive-indefinite-singular":"guanine","dative-definite-genitive-singular":"guaninei","dative-genitive-indefinite-plural":"guanine","dative-definite-genitive-plural":"guaninelor","singular-vocative":"guanină","plural-vocative":"guaninelor"}},{"word":"guano","pos":"noun","definitions":["guano"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"guano","accusative-definite-nominative":"guanoul","dative-genitive-indefinite":"guano","dative-definite-genitive":"guanoului","vocative":"guanoule"}},{"word":"guarana","pos":"noun","definitions":["guarana"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"guarana","accusative-definite-nominative":"guaranaua","dative-genitive-indefinite":"-","dative-definite-genitive":"-i","vocative":"-"}},{"word":"guarani","pos":"noun","definitions":["Guaraní"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"guarani","accusative-definite-nominative":"guaraniul","dative-genitive-indefinite":"guarani","dative-definite-genitive":"guaraniului","vocative":"guaraniule"}},{"word":"guard","pos":"noun","definitions":["guard"],"forms":{"plural":"guarzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guard","accusative-definite-nominative-singular":"guardul","accusative-indefinite-nominative-plural":"guarzi","accusative-definite-nominative-plural":"guarzii","dative-genitive-indefinite-singular":"guard","dative-definite-genitive-singular":"guardului","dative-genitive-indefinite-plural":"guarzi","dative-definite-genitive-plural":"guarzilor","singular-vocative":"guardule","plural-vocative":"guarzilor"}},{"word":"guardaman","pos":"noun","definitions":["glove (protective)"],"forms":{"plural":"guardamane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guardaman","accusative-definite-nominative-singular":"guardamanul","accusative-indefinite-nominative-plural":"guardamane","accusative-definite-nominative-plural":"guardamanele","dative-genitive-indefinite-singular":"guardaman","dative-definite-genitive-singular":"guardamanului","dative-genitive-indefinite-plural":"guardamane","dative-definite-genitive-plural":"guardamanelor","singular-vocative":"guardamanule","plural-vocative":"guardamanelor"}},{"word":"guardie","pos":"noun","definitions":["obsolete form of gardă"],"forms":{"plural":"guardii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"guardie","accusative-definite-nominative-singular":"guardia","accusative-indefinite-nominative-plural":"guardii","accusative-definite-nominative-plural":"guardiile","dative-genitive-indefinite-singular":"guardii","dative-definite-genitive-singular":"guardiei","dative-genitive-indefinite-plural":"guardii","dative-definite-genitive-plural":"guardiilor","singular-vocative":"guardie","plural-vocative":"guardiilor"}},{"word":"guaș","pos":"noun","definitions":["alternative form of guașă"],"forms":{"plural":"guașe"}},{"word":"guașă","pos":"noun","definitions":["gouache; gouache paint.","gouache; a work of art done in gouache."],"forms":{"plural":"guașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guașă","accusative-definite-nominative-singular":"guașăul","accusative-indefinite-nominative-plural":"guașe","accusative-definite-nominative-plural":"guașele","dative-genitive-indefinite-singular":"guașă","dative-definite-genitive-singular":"guașăului","dative-genitive-indefinite-plural":"guașe","dative-definite-genitive-plural":"guașelor","singular-vocative":"guașăule","plural-vocative":"guașelor","alternative":"guaș"}},{"word":"Guatemala","pos":"name","definitions":["Guatemala (a country in northern Central America)"],"pronunciation":"/ɡwa.teˈma.la/","gender":"f"},{"word":"guatemalez","pos":"noun","definitions":["Guatemalan"],"forms":{"plural":"guatemalezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guatemalez","accusative-definite-nominative-singular":"guatemalezul","accusative-indefinite-nominative-plural":"guatemalezi","accusative-definite-nominative-plural":"guatemalezii","dative-genitive-indefinite-singular":"guatemalez","dative-definite-genitive-singular":"guatemalezului","dative-genitive-indefinite-plural":"guatemalezi","dative-definite-genitive-plural":"guatemalezilor","singular-vocative":"guatemalezule","plural-vocative":"guatemalezilor"}},{"word":"guatemaleză","pos":"noun","definitions":["female equivalent of guatemalez"],"forms":{"plural":"guatemaleze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guatemaleză","accusative-definite-nominative-singular":"guatemaleza","accusative-indefinite-nominative-plural":"guatemaleze","accusative-definite-nominative-plural":"guatemalezele","dative-genitive-indefinite-singular":"guatemaleze","dative-definite-genitive-singular":"guatemalezei","dative-genitive-indefinite-plural":"guatemaleze","dative-definite-genitive-plural":"guatemalezelor","singular-vocative":"guatemaleză","plural-vocative":"guatemalezelor"}},{"word":"gubă","pos":"noun","definitions":["woolen mantle"],"forms":{"plural":"gube","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gubă","accusative-definite-nominative-singular":"guba","accusative-indefinite-nominative-plural":"gube","accusative-definite-nominative-plural":"gubele","dative-genitive-indefinite-singular":"gube","dative-definite-genitive-singular":"gubei","dative-genitive-indefinite-plural":"gube","dative-definite-genitive-plural":"gubelor","singular-vocative":"gubă","plural-vocative":"gubelor"}},{"word":"gubănaș","pos":"noun","definitions":["upright bugle, blue bugle (Ajuga genevensis)"],"forms":{"plural":"gubănași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gubănaș","accusative-definite-nominative-singular":"gubănașul","accusative-indefinite-nominative-plural":"gubănași","accusative-definite-nominative-plural":"gubănașii","dative-genitive-indefinite-singular":"gubănaș","dative-definite-genitive-singular":"gubănașului","dative-genitive-indefinite-plural":"gubănași","dative-definite-genitive-plural":"gubănașilor","singular-vocative":"gubănașule","plural-vocative":"gubănașilor"}},{"word":"gubăvenie","pos":"noun","definitions":["leprosy"],"forms":{"plural":"gubăvenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gubăvenie","accusative-definite-nominative-singular":"gubăvenia","accusative-indefinite-nominative-plural":"gubăvenii","accusative-definite-nominative-plural":"gubăveniile","dative-genitive-indefinite-singular":"gubăvenii","dative-definite-genitive-singular":"gubăveniei","dative-genitive-indefinite-plural":"gubăvenii","dative-definite-genitive-plural":"gubăveniilor","singular-vocative":"gubăvenie","plural-vocative":"gubăveniilor"}},{"word":"gubernat","pos":"noun","definitions":["governor"],"forms":{"plural":"gubernați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gubernat","accusative-definite-nominative-singular":"gubernatul","accusative-indefinite-nominative-plural":"gubernați","accusative-definite-nominative-plural":"gubernații","dative-genitive-indefinite-singular":"gubernat","dative-definite-genitive-singular":"gubernatului","dative-genitive-indefinite-plural":"gubernați","dative-definite-genitive-plural":"gubernaților","singular-vocative":"gubernatule","plural-vocative":"gubernaților"}},{"word":"gubernie","pos":"noun","definitions":["province"],"forms":{"plural":"gubernii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gubernie","accusative-definite-nominative-singular":"gubernia","accusative-indefinite-nominative-plural":"gubernii","accusative-definite-nominative-plural":"guberniile","dative-genitive-indefinite-singular":"gubernii","dative-definite-genitive-singular":"guberniei","dative-genitive-indefinite-plural":"gubernii","dative-definite-genitive-plural":"guberniilor","singular-vocative":"gubernie","plural-vocative":"guberniilor"}},{"word":"guberniță","pos":"noun","definitions":["common cold"],"forms":{"plural":"gubernițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guberniță","accusative-definite-nominative-singular":"gubernița","accusative-indefinite-nominative-plural":"gubernițe","accusative-definite-nominative-plural":"gubernițele","dative-genitive-indefinite-singular":"gubernițe","dative-definite-genitive-singular":"guberniței","dative-genitive-indefinite-plural":"gubernițe","dative-definite-genitive-plural":"gubernițelor","singular-vocative":"guberniță","plural-vocative":"gubernițelor"}},{"word":"Gudănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gudănescu"}},{"word":"gudărie","pos":"noun","definitions":["flattery, fawning, blarney"],"forms":{"plural":"gudării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gudărie","accusative-definite-nominative-singular":"gudăria","accusative-indefinite-nominative-plural":"gudării","accusative-definite-nominative-plural":"gudăriile","dative-genitive-indefinite-singular":"gudării","dative-definite-genitive-singular":"gudăriei","dative-genitive-indefinite-plural":"gudării","dative-definite-genitive-plural":"gudăriilor","singular-vocative":"gudărie","plural-vocative":"gudăriilor"}},{"word":"gudron","pos":"noun","definitions":["tar"],"forms":{"plural":"gudroane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gudron","accusative-definite-nominative-singular":"gudronul","accusative-indefinite-nominative-plural":"gudroane","accusative-definite-nominative-plural":"gudroanele","dative-genitive-indefinite-singular":"gudron","dative-definite-genitive-singular":"gudronului","dative-genitive-indefinite-plural":"gudroane","dative-definite-genitive-plural":"gudroanelor","singular-vocative":"gudronule","plural-vocative":"gudroanelor"}},{"word":"gudrona","pos":"verb","definitions":["to tar"],"forms":{"canonical":"a gudrona 1st conjugation","present-singular-third-person":"gudronează","participle-past":"gudronat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a gudrona","gerund":"gudronând","first-person-indicative-present-singular":"gudronez","indicative-present-second-person-singular":"gudronezi","indicative-present-singular-third-person":"gudronează","first-person-indicative-plural-present":"gudronăm","indicative-plural-present-second-person":"gudronați","indicative-plural-present-third-person":"gudronează","first-person-imperfect-indicative-singular":"gudronam","imperfect-indicative-second-person-singular":"gudronai","imperfect-indicative-singular-third-person":"gudrona","first-person-imperfect-indicative-plural":"gudronam","imperfect-indicative-plural-second-person":"gudronați","imperfect-indicative-plural-third-person":"gudronau","first-person-indicative-perfect-singular":"gudronai","indicative-perfect-second-person-singular":"gudronași","indicative-perfect-singular-third-person":"gudronă","first-person-indicative-perfect-plural":"gudronarăm","indicative-perfect-plural-second-person":"gudronarăți","indicative-perfect-plural-third-person":"gudronară","first-person-indicative-pluperfect-singular":"gudronasem","indicative-pluperfect-second-person-singular":"gudronaseși","indicative-pluperfect-singular-third-person":"gudronase","first-person-indicative-pluperfect-plural":"gudronaserăm","indicative-pluperfect-plural-second-person":"gudronaserăți","indicative-pluperfect-plural-third-person":"gudronaseră","first-person-present-singular-subjunctive":"să gudronez","present-second-person-singular-subjunctive":"să gudronezi","present-singular-subjunctive-third-person":"să gudroneze","first-person-plural-present-subjunctive":"să gudronăm","plural-present-second-person-subjunctive":"să gudronați","plural-present-subjunctive-third-person":"să gudroneze","imperative-second-person-singular":"gudronează","imperative-plural-second-person":"gudronați","imperative-negative-second-person-singular":"nu gudrona","imperative-negative-plural-second-person":"nu gudronați"}},{"word":"gudronaj","pos":"noun","definitions":["tarring"],"forms":{"plural":"gudronaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gudronaj","accusative-definite-nominative-singular":"gudronajul","accusative-indefinite-nominative-plural":"gudronaje","accusative-definite-nominative-plural":"gudronajele","dative-genitive-indefinite-singular":"gudronaj","dative-definite-genitive-singular":"gudronajului","dative-genitive-indefinite-plural":"gudronaje","dative-definite-genitive-plural":"gudronajelor","singular-vocative":"gudronajule","plural-vocative":"gudronajelor"}},{"word":"gudronare","pos":"noun","definitions":["tarring"],"forms":{"plural":"gudronări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gudronare","accusative-definite-nominative-singular":"gudronarea","accusative-indefinite-nominative-plural":"gudronări","accusative-definite-nominative-plural":"gudronările","dative-genitive-indefinite-singular":"gudronări","dative-definite-genitive-singular":"gudronării","dative-genitive-indefinite-plural":"gudronări","dative-definite-genitive-plural":"gudronărilor","singular-vocative":"gudronare","plural-vocative":"gudronărilor"}},{"word":"gudronat","pos":"adj","definitions":["tarry"],"forms":{"feminine-singular":"gudronată","masculine-plural":"gudronați","feminine-neuter-plural":"gudronate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gudronat","error-unrecognized-form-feminine-indefinite-singular":"gudronată","error-unrecognized-form-indefinite-masculine-plural":"gudronați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gudronate","definite-error-unrecognized-form-masculine-neuter-singular":"gudronatul","definite-error-unrecognized-form-feminine-singular":"gudronata","definite-error-unrecognized-form-masculine-plural":"gudronații","definite-error-unrecognized-form-feminine-neuter-plural":"gudronatele"}},{"word":"gudura","pos":"verb","definitions":["to fawn (wag its tail to show devotion)","to fawn (seek favour by flattery and obsequious behaviour)"],"pronunciation":"/ɡu.duˈra/","forms":{"canonical":"a gudura 1st conjugation","present-singular-third-person":"gudură","participle-past":"gudurat","subjunctive-third-person":"gudure","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gudura","gerund":"gudurând","first-person-indicative-present-singular":"gudur","indicative-present-second-person-singular":"guduri","indicative-present-singular-third-person":"gudură","first-person-indicative-plural-present":"gudurăm","indicative-plural-present-second-person":"gudurați","indicative-plural-present-third-person":"gudură","first-person-imperfect-indicative-singular":"guduram","imperfect-indicative-second-person-singular":"gudurai","imperfect-indicative-singular-third-person":"gudura","first-person-imperfect-indicative-plural":"guduram","imperfect-indicative-plural-second-person":"gudurați","imperfect-indicative-plural-third-person":"gudurau","first-person-indicative-perfect-singular":"gudurai","indicative-perfect-second-person-singular":"gudurași","indicative-perfect-singular-third-person":"gudură","first-person-indicative-perfect-plural":"gudurarăm","indicative-perfect-plural-second-person":"gudurarăți","indicative-perfect-plural-third-person":"gudurară","first-person-indicative-pluperfect-singular":"gudurasem","indicative-pluperfect-second-person-singular":"guduraseși","indicative-pluperfect-singular-third-person":"gudurase","first-person-indicative-pluperfect-plural":"guduraserăm","indicative-pluperfect-plural-second-person":"guduraserăți","indicative-pluperfect-plural-third-person":"guduraseră","first-person-present-singular-subjunctive":"să gudur","present-second-person-singular-subjunctive":"să guduri","present-singular-subjunctive-third-person":"să gudure","first-person-plural-present-subjunctive":"să gudurăm","plural-present-second-person-subjunctive":"să gudurați","plural-present-subjunctive-third-person":"să gudure","imperative-second-person-singular":"gudură","imperative-plural-second-person":"gudurați","imperative-negative-second-person-singular":"nu gudura","imperative-negative-plural-second-person":"nu gudurați"}},{"word":"gudurare","pos":"noun","definitions":["fawning"],"forms":{"plural":"gudurarări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gudurare","accusative-definite-nominative-singular":"gudurarea","accusative-indefinite-nominative-plural":"gudurarări","accusative-definite-nominative-plural":"gudurarările","dative-genitive-indefinite-singular":"gudurarări","dative-definite-genitive-singular":"gudurarării","dative-genitive-indefinite-plural":"gudurarări","dative-definite-genitive-plural":"gudurarărilor","singular-vocative":"gudurare","plural-vocative":"gudurarărilor"}},{"word":"guelf","pos":"noun","definitions":["Guelph"],"forms":{"plural":"guelfi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guelf","accusative-definite-nominative-singular":"guelful","accusative-indefinite-nominative-plural":"guelfi","accusative-definite-nominative-plural":"guelfii","dative-genitive-indefinite-singular":"guelf","dative-definite-genitive-singular":"guelfului","dative-genitive-indefinite-plural":"guelfi","dative-definite-genitive-plural":"guelfilor","singular-vocative":"guelfule","plural-vocative":"guelfilor"}},{"word":"guelfism","pos":"noun","definitions":["Guelphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"guelfism","accusative-definite-nominative":"guelfismul","dative-genitive-indefinite":"guelfism","dative-definite-genitive":"guelfismului","vocative":"guelfismule"}},{"word":"guerilă","pos":"noun","definitions":["alternative form of gherilă"],"forms":{"plural":"guerile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guerilă","accusative-definite-nominative-singular":"guerila","accusative-indefinite-nominative-plural":"guerile","accusative-definite-nominative-plural":"guerilele","dative-genitive-indefinite-singular":"guerile","dative-definite-genitive-singular":"guerilei","dative-genitive-indefinite-plural":"guerile","dative-definite-genitive-plural":"guerilelor","singular-vocative":"guerilă","plural-vocative":"guerilelor"}},{"word":"guet","pos":"noun","definitions":["pig squeal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"guet","accusative-definite-nominative":"guetul","dative-genitive-indefinite":"guet","dative-definite-genitive":"guetului","vocative":"guetule"}},{"word":"Gugești","pos":"name","definitions":["a village in Boțești, Vaslui County, Romania","a commune of Vrancea County, Romania","a village in Gugești, Vrancea County, Romania"],"gender":"m"},{"word":"gugiuli","pos":"verb","definitions":["to alternative form of giugiuli"],"forms":{"canonical":"a gugiuli 4th conjugation","present-singular-third-person":"gugiulește","participle-past":"gugiulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a gugiuli","gerund":"gugiulind","first-person-indicative-present-singular":"gugiulesc","indicative-present-second-person-singular":"gugiulești","indicative-present-singular-third-person":"gugiulește","first-person-indicative-plural-present":"gugiulim","indicative-plural-present-second-person":"gugiuliți","indicative-plural-present-third-person":"gugiulesc","first-person-imperfect-indicative-singular":"gugiuleam","imperfect-indicative-second-person-singular":"gugiuleai","imperfect-indicative-singular-third-person":"gugiulea","first-person-imperfect-indicative-plural":"gugiuleam","imperfect-indicative-plural-second-person":"gugiuleați","imperfect-indicative-plural-third-person":"gugiuleau","first-person-indicative-perfect-singular":"gugiulii","indicative-perfect-second-person-singular":"gugiuliși","indicative-perfect-singular-third-person":"gugiuli","first-person-indicative-perfect-plural":"gugiulirăm","indicative-perfect-plural-second-person":"gugiulirăți","indicative-perfect-plural-third-person":"gugiuliră","first-person-indicative-pluperfect-singular":"gugiulisem","indicative-pluperfect-second-person-singular":"gugiuliseși","indicative-pluperfect-singular-third-person":"gugiulise","first-person-indicative-pluperfect-plural":"gugiuliserăm","indicative-pluperfect-plural-second-person":"gugiuliserăți","indicative-pluperfect-plural-third-person":"gugiuliseră","first-person-present-singular-subjunctive":"să gugiulesc","present-second-person-singular-subjunctive":"să gugiulești","present-singular-subjunctive-third-person":"să gugiulească","first-person-plural-present-subjunctive":"să gugiulim","plural-present-second-person-subjunctive":"să gugiuliți","plural-present-subjunctive-third-person":"să gugiulească","imperative-second-person-singular":"gugiulește","imperative-plural-second-person":"gugiuliți","imperative-negative-second-person-singular":"nu gugiuli","imperative-negative-plural-second-person":"nu gugiuliți"}},{"word":"Gugiuman","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gugiuman"}},{"word":"gugiuman","pos":"noun","definitions":["a kind of sable fur turban worn by princes (in white) and great-boyars (in red)"],"pronunciation":"[ɡu.d͡ʒʲuˈman]","forms":{"plural":"gugiumane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gugiuman","accusative-definite-nominative-singular":"gugiumanul","accusative-indefinite-nominative-plural":"gugiumane","accusative-definite-nominative-plural":"gugiumanele","dative-genitive-indefinite-singular":"gugiuman","dative-definite-genitive-singular":"gugiumanului","dative-genitive-indefinite-plural":"gugiumane","dative-definite-genitive-plural":"gugiumanelor","singular-vocative":"gugiumanule","plural-vocative":"gugiumanelor"}},{"word":"Gugoașă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gugoașă"}},{"word":"gugoașă","pos":"noun","definitions":["alternative form of gogoașă"],"forms":{"plural":"gugoși"}},{"word":"gugoșea","pos":"noun","definitions":["alternative form of gogoșea"],"forms":{"plural":"gugoșele"}},{"word":"Guguianca","pos":"name","definitions":["a village in Ionești, Vâlcea County, Romania"],"gender":"f"},{"word":"Gugulică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gugulică"}},{"word":"gugulice","pos":"noun","definitions":["alternative form of gâgâlice"],"forms":{"plural":"gugulici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gugulice","accusative-definite-nominative-singular":"gugulicea","accusative-indefinite-nominative-plural":"gugulici","accusative-definite-nominative-plural":"gugulicile","dative-genitive-indefinite-singular":"gugulici","dative-definite-genitive-singular":"gugulicii","dative-genitive-indefinite-plural":"gugulici","dative-definite-genitive-plural":"gugulicilor","singular-vocative":"gugulice","plural-vocative":"gugulicilor"}},{"word":"guguman","pos":"adj","definitions":["alternative form of gogoman"],"forms":{"feminine-singular":"gugumană","masculine-plural":"gugumani","feminine-neuter-plural":"gugumane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guguman","error-unrecognized-form-feminine-indefinite-singular":"gugumană","error-unrecognized-form-indefinite-masculine-plural":"gugumani","error-unrecognized-form-feminine-indefinite-neuter-plural":"gugumane","definite-error-unrecognized-form-masculine-neuter-singular":"gugumanul","definite-error-unrecognized-form-feminine-singular":"gugumana","definite-error-unrecognized-form-masculine-plural":"gugumanii","definite-error-unrecognized-form-feminine-neuter-plural":"gugumanele"}},{"word":"gugumănie","pos":"noun","definitions":["alternative form of gogomănie"],"forms":{"plural":"gugumănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gugumănie","accusative-definite-nominative-singular":"gugumănia","accusative-indefinite-nominative-plural":"gugumănii","accusative-definite-nominative-plural":"gugumăniile","dative-genitive-indefinite-singular":"gugumănii","dative-definite-genitive-singular":"gugumăniei","dative-genitive-indefinite-plural":"gugumănii","dative-definite-genitive-plural":"gugumăniilor","singular-vocative":"gugumănie","plural-vocative":"gugumăniilor"}},{"word":"guguș","pos":"noun","definitions":["dove"],"forms":{"plural":"guguși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guguș","accusative-definite-nominative-singular":"gugușul","accusative-indefinite-nominative-plural":"guguși","accusative-definite-nominative-plural":"gugușii","dative-genitive-indefinite-singular":"guguș","dative-definite-genitive-singular":"gugușului","dative-genitive-indefinite-plural":"guguși","dative-definite-genitive-plural":"gugușilor","singular-vocative":"gugușule","plural-vocative":"gugușilor"}},{"word":"guguștiuc","pos":"noun","definitions":["collared dove (bird)","a sucker, pigeon, mug","a rookie burglar","smitten, enamoured, in love"],"pronunciation":"/ɡu.ɡuʃˈtjuk/","forms":{"plural":"guguștiuci","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guguștiuc","accusative-definite-nominative-singular":"guguștiucul","accusative-indefinite-nominative-plural":"guguștiuci","accusative-definite-nominative-plural":"guguștiucii","dative-genitive-indefinite-singular":"guguștiuc","dative-definite-genitive-singular":"guguștiucului","dative-genitive-indefinite-plural":"guguștiuci","dative-definite-genitive-plural":"guguștiucilor","singular-vocative":"guguștiucule","plural-vocative":"guguștiucilor"}},{"word":"guguștiucă","pos":"noun","definitions":["female collared dove"],"forms":{"plural":"guguștiuce","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guguștiucă","accusative-definite-nominative-singular":"guguștiuca","accusative-indefinite-nominative-plural":"guguștiuce","accusative-definite-nominative-plural":"guguștiucele","dative-genitive-indefinite-singular":"guguștiuce","dative-definite-genitive-singular":"guguștiucei","dative-genitive-indefinite-plural":"guguștiuce","dative-definite-genitive-plural":"guguștiucelor","singular-vocative":"guguștiucă","plural-vocative":"guguștiucelor"}},{"word":"guguștiuci","pos":"noun","definitions":["plural of guguștiuc"],"gender":"m"},{"word":"guilemotă","pos":"noun","definitions":["guillemot"],"forms":{"plural":"guilemote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guilemotă","accusative-definite-nominative-singular":"guilemota","accusative-indefinite-nominative-plural":"guilemote","accusative-definite-nominative-plural":"guilemotele","dative-genitive-indefinite-singular":"guilemote","dative-definite-genitive-singular":"guilemotei","dative-genitive-indefinite-plural":"guilemote","dative-definite-genitive-plural":"guilemotelor","singular-vocative":"guilemotă","plural-vocative":"guilemotelor"}},{"word":"guinee","pos":"noun","definitions":["guinea (coin)"],"forms":{"plural":"guinee","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"guinee","accusative-definite-nominative-singular":"guineea","accusative-indefinite-nominative-plural":"guinee","accusative-definite-nominative-plural":"guineele","dative-genitive-indefinite-singular":"guinee","dative-definite-genitive-singular":"guineei","dative-genitive-indefinite-plural":"guinee","dative-definite-genitive-plural":"guineelor","singular-vocative":"guinee","plural-vocative":"guineelor"}},{"word":"Guineea Ecuatorială","pos":"name","definitions":["Equatorial Guinea (a country in Central Africa)"],"gender":"f"},{"word":"Guineea-Bissau","pos":"name","definitions":["Guinea-Bissau (a country in West Africa)"],"gender":"f"},{"word":"guineean","pos":"adj","definitions":["Guinean"],"forms":{"feminine-singular":"guineeană","masculine-plural":"guineeni","feminine-neuter-plural":"guineene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guineean","error-unrecognized-form-feminine-indefinite-singular":"guineeană","error-unrecognized-form-indefinite-masculine-plural":"guineeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"guineene","definite-error-unrecognized-form-masculine-neuter-singular":"guineeanul","definite-error-unrecognized-form-feminine-singular":"guineeana","definite-error-unrecognized-form-masculine-plural":"guineenii","definite-error-unrecognized-form-feminine-neuter-plural":"guineenele"}},{"word":"guineean","pos":"noun","definitions":["Guinean"],"forms":{"plural":"guineeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guineean","accusative-definite-nominative-singular":"guineeanul","accusative-indefinite-nominative-plural":"guineeni","accusative-definite-nominative-plural":"guineenii","dative-genitive-indefinite-singular":"guineean","dative-definite-genitive-singular":"guineeanului","dative-genitive-indefinite-plural":"guineeni","dative-definite-genitive-plural":"guineenilor","singular-vocative":"guineeanule","plural-vocative":"guineenilor"}},{"word":"guineeană","pos":"noun","definitions":["female equivalent of guineean"],"forms":{"plural":"guineeane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guineeană","accusative-definite-nominative-singular":"guineeana","accusative-indefinite-nominative-plural":"guineeane","accusative-definite-nominative-plural":"guineeanele","dative-genitive-indefinite-singular":"guineeane","dative-definite-genitive-singular":"guineeanei","dative-genitive-indefinite-plural":"guineeane","dative-definite-genitive-plural":"guineeanelor","singular-vocative":"guineeană","plural-vocative":"guineeanelor"}},{"word":"guineeză","pos":"noun","definitions":["female equivalent of guineez"],"forms":{"plural":"guineeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guineeză","accusative-definite-nominative-singular":"guineeza","accusative-indefinite-nominative-plural":"guineeze","accusative-definite-nominative-plural":"guineezele","dative-genitive-indefinite-singular":"guineeze","dative-definite-genitive-singular":"guineezei","dative-genitive-indefinite-plural":"guineeze","dative-definite-genitive-plural":"guineezelor","singular-vocative":"guineeză","plural-vocative":"guineezelor"}},{"word":"guineobissauan","pos":"adj","definitions":["Bissau-Guinean"],"pronunciation":"/ɡu.i.ˌne.o.bi.sa.ˈwan/","forms":{"feminine-singular":"guineobissauană","masculine-plural":"guineobissauani","feminine-neuter-plural":"guineobissauane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guineobissauan","error-unrecognized-form-feminine-indefinite-singular":"guineobissauană","error-unrecognized-form-indefinite-masculine-plural":"guineobissauani","error-unrecognized-form-feminine-indefinite-neuter-plural":"guineobissauane","definite-error-unrecognized-form-masculine-neuter-singular":"guineobissauanul","definite-error-unrecognized-form-feminine-singular":"guineobissauana","definite-error-unrecognized-form-masculine-plural":"guineobissauanii","definite-error-unrecognized-form-feminine-neuter-plural":"guineobissauanele"}},{"word":"guineobissauan","pos":"noun","definitions":["Bissau-Guinean"],"pronunciation":"/ɡu.i.ˌne.o.bi.sa.ˈwan/","forms":{"plural":"guineobissauani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guineobissauan","accusative-definite-nominative-singular":"guineobissauanul","accusative-indefinite-nominative-plural":"guineobissauani","accusative-definite-nominative-plural":"guineobissauanii","dative-genitive-indefinite-singular":"guineobissauan","dative-definite-genitive-singular":"guineobissauanului","dative-genitive-indefinite-plural":"guineobissauani","dative-definite-genitive-plural":"guineobissauanilor","singular-vocative":"guineobissauanule","plural-vocative":"guineobissauanilor"}},{"word":"guineobissauană","pos":"noun","definitions":["female equivalent of guineobissauan"],"pronunciation":"/ɡu.i.ˌne.o.bi.sa.ˈwa.nə/","forms":{"plural":"guineobissauane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guineobissauană","accusative-definite-nominative-singular":"guineobissauana","accusative-indefinite-nominative-plural":"guineobissauane","accusative-definite-nominative-plural":"guineobissauanele","dative-genitive-indefinite-singular":"guineobissauane","dative-definite-genitive-singular":"guineobissauanei","dative-genitive-indefinite-plural":"guineobissauane","dative-definite-genitive-plural":"guineobissauanelor","singular-vocative":"guineobissauană","plural-vocative":"guineobissauanelor"}},{"word":"guineoecuatorian","pos":"adj","definitions":["Equatoguinean"],"forms":{"feminine-singular":"guineoecuatoriană","masculine-plural":"guineoecuatorieni","feminine-neuter-plural":"guineoecuatoriene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guineoecuatorian","error-unrecognized-form-feminine-indefinite-singular":"guineoecuatoriană","error-unrecognized-form-indefinite-masculine-plural":"guineoecuatorieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"guineoecuatoriene","definite-error-unrecognized-form-masculine-neuter-singular":"guineoecuatorianul","definite-error-unrecognized-form-feminine-singular":"guineoecuatoriana","definite-error-unrecognized-form-masculine-plural":"guineoecuatorienii","definite-error-unrecognized-form-feminine-neuter-plural":"guineoecuatorienele"}},{"word":"guineoecuatorian","pos":"noun","definitions":["Equatoguinean"],"forms":{"plural":"guineoecuatorieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guineoecuatorian","accusative-definite-nominative-singular":"guineoecuatorianul","accusative-indefinite-nominative-plural":"guineoecuatorieni","accusative-definite-nominative-plural":"guineoecuatorienii","dative-genitive-indefinite-singular":"guineoecuatorian","dative-definite-genitive-singular":"guineoecuatorianului","dative-genitive-indefinite-plural":"guineoecuatorieni","dative-definite-genitive-plural":"guineoecuatorienilor","singular-vocative":"guineoecuatorianule","plural-vocative":"guineoecuatorienilor"}},{"word":"guineoecuatoriană","pos":"noun","definitions":["female equivalent of guineoecuatorian"],"forms":{"plural":"guineoecuatoriane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guineoecuatoriană","accusative-definite-nominative-singular":"guineoecuatoriana","accusative-indefinite-nominative-plural":"guineoecuatoriane","accusative-definite-nominative-plural":"guineoecuatorianele","dative-genitive-indefinite-singular":"guineoecuatoriane","dative-definite-genitive-singular":"guineoecuatorianei","dative-genitive-indefinite-plural":"guineoecuatoriane","dative-definite-genitive-plural":"guineoecuatorianelor","singular-vocative":"guineoecuatoriană","plural-vocative":"guineoecuatorianelor"}},{"word":"guiț","pos":"intj","definitions":["squeak (sound made by a young pig)"]},{"word":"guița","pos":"verb","definitions":["to squeal"],"forms":{"canonical":"a guița 1st conjugation","present-singular-third-person":"guiță","participle-past":"guițat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a guița","gerund":"guițând","first-person-indicative-present-singular":"guiț","indicative-present-second-person-singular":"guiți","indicative-present-singular-third-person":"guiță","first-person-indicative-plural-present":"guițăm","indicative-plural-present-second-person":"guițați","indicative-plural-present-third-person":"guiță","first-person-imperfect-indicative-singular":"guițam","imperfect-indicative-second-person-singular":"guițai","imperfect-indicative-singular-third-person":"guița","first-person-imperfect-indicative-plural":"guițam","imperfect-indicative-plural-second-person":"guițați","imperfect-indicative-plural-third-person":"guițau","first-person-indicative-perfect-singular":"guițai","indicative-perfect-second-person-singular":"guițași","indicative-perfect-singular-third-person":"guiță","first-person-indicative-perfect-plural":"guițarăm","indicative-perfect-plural-second-person":"guițarăți","indicative-perfect-plural-third-person":"guițară","first-person-indicative-pluperfect-singular":"guițasem","indicative-pluperfect-second-person-singular":"guițaseși","indicative-pluperfect-singular-third-person":"guițase","first-person-indicative-pluperfect-plural":"guițaserăm","indicative-pluperfect-plural-second-person":"guițaserăți","indicative-pluperfect-plural-third-person":"guițaseră","first-person-present-singular-subjunctive":"să guiț","present-second-person-singular-subjunctive":"să guiți","present-singular-subjunctive-third-person":"să guițe","first-person-plural-present-subjunctive":"să guițăm","plural-present-second-person-subjunctive":"să guițați","plural-present-subjunctive-third-person":"să guițe","imperative-second-person-singular":"guiță","imperative-plural-second-person":"guițați","imperative-negative-second-person-singular":"nu guița","imperative-negative-plural-second-person":"nu guițați"}},{"word":"guițare","pos":"noun","definitions":["squeaking (sound of a pig)"],"forms":{"plural":"guițări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"guițare","accusative-definite-nominative-singular":"guițarea","accusative-indefinite-nominative-plural":"guițări","accusative-definite-nominative-plural":"guițările","dative-genitive-indefinite-singular":"guițări","dative-definite-genitive-singular":"guițării","dative-genitive-indefinite-plural":"guițări","dative-definite-genitive-plural":"guițărilor","singular-vocative":"guițare","plural-vocative":"guițărilor"}},{"word":"guițat","pos":"noun","definitions":["pig squeal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"guițat","accusative-definite-nominative":"guițatul","dative-genitive-indefinite":"guițat","dative-definite-genitive":"guițatului","vocative":"guițatule"}},{"word":"guițătură","pos":"noun","definitions":["pig squeaking"],"forms":{"plural":"guițături","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"guițătură","accusative-definite-nominative-singular":"guițătura","accusative-indefinite-nominative-plural":"guițături","accusative-definite-nominative-plural":"guițăturile","dative-genitive-indefinite-singular":"guițături","dative-definite-genitive-singular":"guițăturii","dative-genitive-indefinite-plural":"guițături","dative-definite-genitive-plural":"guițăturilor","singular-vocative":"guițătură","plural-vocative":"guițăturilor"}},{"word":"gulag","pos":"noun","definitions":["gulag"],"forms":{"plural":"gulaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gulag","accusative-definite-nominative-singular":"gulagul","accusative-indefinite-nominative-plural":"gulaguri","accusative-definite-nominative-plural":"gulagurile","dative-genitive-indefinite-singular":"gulag","dative-definite-genitive-singular":"gulagului","dative-genitive-indefinite-plural":"gulaguri","dative-definite-genitive-plural":"gulagurilor","singular-vocative":"gulagule","plural-vocative":"gulagurilor"}},{"word":"gulaș","pos":"noun","definitions":["goulash"],"forms":{"plural":"gulașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gulaș","accusative-definite-nominative-singular":"gulașul","accusative-indefinite-nominative-plural":"gulașuri","accusative-definite-nominative-plural":"gulașurile","dative-genitive-indefinite-singular":"gulaș","dative-definite-genitive-singular":"gulașului","dative-genitive-indefinite-plural":"gulașuri","dative-definite-genitive-plural":"gulașurilor","singular-vocative":"gulașule","plural-vocative":"gulașurilor"}},{"word":"gulden","pos":"noun","definitions":["gulden, guilder"],"forms":{"plural":"guldeni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gulden","accusative-definite-nominative-singular":"guldenul","accusative-indefinite-nominative-plural":"guldeni","accusative-definite-nominative-plural":"guldenii","dative-genitive-indefinite-singular":"gulden","dative-definite-genitive-singular":"guldenului","dative-genitive-indefinite-plural":"guldeni","dative-definite-genitive-plural":"guldenilor","singular-vocative":"guldenule","plural-vocative":"guldenilor"}},{"word":"Guler","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guler"}},{"word":"guler","pos":"noun","definitions":["collar"],"forms":{"plural":"gulere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guler","accusative-definite-nominative-singular":"gulerul","accusative-indefinite-nominative-plural":"gulere","accusative-definite-nominative-plural":"gulerele","dative-genitive-indefinite-singular":"guler","dative-definite-genitive-singular":"gulerului","dative-genitive-indefinite-plural":"gulere","dative-definite-genitive-plural":"gulerelor","singular-vocative":"gulerule","plural-vocative":"gulerelor"}},{"word":"guleraș","pos":"noun","definitions":["diminutive of guler; small collar"],"forms":{"plural":"gulerașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guleraș","accusative-definite-nominative-singular":"gulerașul","accusative-indefinite-nominative-plural":"gulerașe","accusative-definite-nominative-plural":"gulerașele","dative-genitive-indefinite-singular":"guleraș","dative-definite-genitive-singular":"gulerașului","dative-genitive-indefinite-plural":"gulerașe","dative-definite-genitive-plural":"gulerașelor","singular-vocative":"gulerașule","plural-vocative":"gulerașelor"}},{"word":"gulerat","pos":"adj","definitions":["collared"],"forms":{"feminine-singular":"gulerată","masculine-plural":"gulerați","feminine-neuter-plural":"gulerate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gulerat","error-unrecognized-form-feminine-indefinite-singular":"gulerată","error-unrecognized-form-indefinite-masculine-plural":"gulerați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gulerate","definite-error-unrecognized-form-masculine-neuter-singular":"guleratul","definite-error-unrecognized-form-feminine-singular":"gulerata","definite-error-unrecognized-form-masculine-plural":"gulerații","definite-error-unrecognized-form-feminine-neuter-plural":"guleratele"}},{"word":"gulerat","pos":"noun","definitions":["person wearing a uniform"],"forms":{"plural":"gulerați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gulerat","accusative-definite-nominative-singular":"guleratul","accusative-indefinite-nominative-plural":"gulerați","accusative-definite-nominative-plural":"gulerații","dative-genitive-indefinite-singular":"gulerat","dative-definite-genitive-singular":"guleratului","dative-genitive-indefinite-plural":"gulerați","dative-definite-genitive-plural":"guleraților","singular-vocative":"guleratule","plural-vocative":"guleraților"}},{"word":"gulerată","pos":"noun","definitions":["female equivalent of gulerat"],"forms":{"plural":"gulerate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gulerată","accusative-definite-nominative-singular":"gulerata","accusative-indefinite-nominative-plural":"gulerate","accusative-definite-nominative-plural":"guleratele","dative-genitive-indefinite-singular":"gulerate","dative-definite-genitive-singular":"guleratei","dative-genitive-indefinite-plural":"gulerate","dative-definite-genitive-plural":"guleratelor","singular-vocative":"gulerată","plural-vocative":"guleratelor"}},{"word":"gulerel","pos":"noun","definitions":["diminutive of guler"],"forms":{"plural":"gulerele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gulerel","accusative-definite-nominative-singular":"gulerelul","accusative-indefinite-nominative-plural":"gulerele","accusative-definite-nominative-plural":"gulerelele","dative-genitive-indefinite-singular":"gulerel","dative-definite-genitive-singular":"gulerelului","dative-genitive-indefinite-plural":"gulerele","dative-definite-genitive-plural":"gulerelelor","singular-vocative":"gulerelule","plural-vocative":"gulerelelor"}},{"word":"gulgulea","pos":"noun","definitions":["revolt, disorder"],"forms":{"plural":"gulgulele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"gulgulea","accusative-definite-nominative-singular":"gulguleaua","accusative-indefinite-nominative-plural":"gulgulele","accusative-definite-nominative-plural":"gulgulelele","dative-genitive-indefinite-singular":"gulgulele","dative-definite-genitive-singular":"gulgulelei","dative-genitive-indefinite-plural":"gulgulele","dative-definite-genitive-plural":"gulgulelelor","singular-vocative":"gulgulea","plural-vocative":"gulgulelelor"}},{"word":"Gulia","pos":"name","definitions":["a village in Tărtășești, Dâmbovița County, Romania","a village in Dolhasca, Suceava County, Romania"],"gender":"f"},{"word":"Gulianca","pos":"name","definitions":["a village in Salcia Tudor, Brăila County, Romania"],"gender":"f"},{"word":"Gulie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gulie"}},{"word":"gulie","pos":"noun","definitions":["kohlrabi"],"pronunciation":"/ɡuˈli.e/","forms":{"plural":"gulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gulie","accusative-definite-nominative-singular":"gulia","accusative-indefinite-nominative-plural":"gulii","accusative-definite-nominative-plural":"guliile","dative-genitive-indefinite-singular":"gulii","dative-definite-genitive-singular":"guliei","dative-genitive-indefinite-plural":"gulii","dative-definite-genitive-plural":"guliilor","singular-vocative":"gulie","plural-vocative":"guliilor"}},{"word":"gulimos","pos":"noun","definitions":["plaster"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"gulimos","accusative-definite-nominative":"gulimosul","dative-genitive-indefinite":"gulimos","dative-definite-genitive":"gulimosului","vocative":"gulimosule"}},{"word":"guliubaie","pos":"noun","definitions":["wild beast"],"forms":{"plural":"guliubai","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"guliubaie","accusative-definite-nominative-singular":"guliubaia","accusative-indefinite-nominative-plural":"guliubai","accusative-definite-nominative-plural":"guliubaile","dative-genitive-indefinite-singular":"guliubai","dative-definite-genitive-singular":"guliubaii","dative-genitive-indefinite-plural":"guliubai","dative-definite-genitive-plural":"guliubailor","singular-vocative":"guliubaie","plural-vocative":"guliubailor"}},{"word":"guma","pos":"verb","definitions":["to gum"],"pronunciation":"[ɡuˈma]","forms":{"canonical":"a guma 1st conjugation","present-singular-third-person":"gumează","participle-past":"gumat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a guma","gerund":"gumând","first-person-indicative-present-singular":"gumez","indicative-present-second-person-singular":"gumezi","indicative-present-singular-third-person":"gumează","first-person-indicative-plural-present":"gumăm","indicative-plural-present-second-person":"gumați","indicative-plural-present-third-person":"gumează","first-person-imperfect-indicative-singular":"gumam","imperfect-indicative-second-person-singular":"gumai","imperfect-indicative-singular-third-person":"guma","first-person-imperfect-indicative-plural":"gumam","imperfect-indicative-plural-second-person":"gumați","imperfect-indicative-plural-third-person":"gumau","first-person-indicative-perfect-singular":"gumai","indicative-perfect-second-person-singular":"gumași","indicative-perfect-singular-third-person":"gumă","first-person-indicative-perfect-plural":"gumarăm","indicative-perfect-plural-second-person":"gumarăți","indicative-perfect-plural-third-person":"gumară","first-person-indicative-pluperfect-singular":"gumasem","indicative-pluperfect-second-person-singular":"gumaseși","indicative-pluperfect-singular-third-person":"gumase","first-person-indicative-pluperfect-plural":"gumaserăm","indicative-pluperfect-plural-second-person":"gumaserăți","indicative-pluperfect-plural-third-person":"gumaseră","first-person-present-singular-subjunctive":"să gumez","present-second-person-singular-subjunctive":"să gumezi","present-singular-subjunctive-third-person":"să gumeze","first-person-plural-present-subjunctive":"să gumăm","plural-present-second-person-subjunctive":"să gumați","plural-present-subjunctive-third-person":"să gumeze","imperative-second-person-singular":"gumează","imperative-plural-second-person":"gumați","imperative-negative-second-person-singular":"nu guma","imperative-negative-plural-second-person":"nu gumați"}},{"word":"guma","pos":"noun","definitions":["definite nominative/accusative singular of gumă"],"pronunciation":"[ˈɡuma]","gender":"f"},{"word":"gumă","pos":"noun","definitions":["(chewing) gum","eraser, rubber","indian rubber","rosin, gum"],"forms":{"plural":"gume"}},{"word":"gumă arabică","pos":"noun","definitions":["gum arabic"]},{"word":"gumă de mestecat","pos":"noun","definitions":["chewing gum"],"forms":{"plural":"gume de mestecat"}},{"word":"gumă de șters","pos":"noun","definitions":["eraser"],"forms":{"plural":"gume de șters"}},{"word":"gumat","pos":"adj","definitions":["covered with or made out of rubber"],"forms":{"feminine-singular":"gumată","masculine-plural":"gumați","feminine-neuter-plural":"gumate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gumat","error-unrecognized-form-feminine-indefinite-singular":"gumată","error-unrecognized-form-indefinite-masculine-plural":"gumați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gumate","definite-error-unrecognized-form-masculine-neuter-singular":"gumatul","definite-error-unrecognized-form-feminine-singular":"gumata","definite-error-unrecognized-form-masculine-plural":"gumații","definite-error-unrecognized-form-feminine-neuter-plural":"gumatele"}},{"word":"gumat","pos":"verb","definitions":["past participle of guma"],"forms":{"participle-past":"of guma"}},{"word":"gume","pos":"noun","definitions":["inflection of gumă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡume]","gender":"f-p"},{"word":"gumei","pos":"noun","definitions":["definite genitive/dative singular of gumă"],"pronunciation":"[ˈɡumej]","gender":"f"},{"word":"gumifer","pos":"adj","definitions":["gummiferous"],"forms":{"feminine-singular":"gumiferă","masculine-plural":"gumiferi","feminine-neuter-plural":"gumifere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gumifer","error-unrecognized-form-feminine-indefinite-singular":"gumiferă","error-unrecognized-form-indefinite-masculine-plural":"gumiferi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gumifere","definite-error-unrecognized-form-masculine-neuter-singular":"gumiferul","definite-error-unrecognized-form-feminine-singular":"gumifera","definite-error-unrecognized-form-masculine-plural":"gumiferii","definite-error-unrecognized-form-feminine-neuter-plural":"gumiferele"}},{"word":"gumilastic","pos":"noun","definitions":["rubber"],"forms":{"plural":"gumilastice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gumilastic","accusative-definite-nominative-singular":"gumilasticul","accusative-indefinite-nominative-plural":"gumilastice","accusative-definite-nominative-plural":"gumilasticele","dative-genitive-indefinite-singular":"gumilastic","dative-definite-genitive-singular":"gumilasticului","dative-genitive-indefinite-plural":"gumilastice","dative-definite-genitive-plural":"gumilasticelor","singular-vocative":"gumilasticule","plural-vocative":"gumilasticelor"}},{"word":"guneaț","pos":"noun","definitions":["mantle, cloak, wrap"],"forms":{"plural":"gunețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guneaț","accusative-definite-nominative-singular":"guneațul","accusative-indefinite-nominative-plural":"gunețe","accusative-definite-nominative-plural":"gunețele","dative-genitive-indefinite-singular":"guneaț","dative-definite-genitive-singular":"guneațului","dative-genitive-indefinite-plural":"gunețe","dative-definite-genitive-plural":"gunețelor","singular-vocative":"guneațule","plural-vocative":"gunețelor"}},{"word":"gunguni","pos":"verb","definitions":["to alternative form of gânguri"],"forms":{"canonical":"a gunguni 4th conjugation","present-singular-third-person":"gungunește","participle-past":"gungunit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gunguni","gerund":"gungunind","first-person-indicative-present-singular":"gungun","indicative-present-second-person-singular":"gunguni","indicative-present-singular-third-person":"gungune","first-person-indicative-plural-present":"gungunim","indicative-plural-present-second-person":"gunguniți","indicative-plural-present-third-person":"gungun","first-person-imperfect-indicative-singular":"gunguneam","imperfect-indicative-second-person-singular":"gunguneai","imperfect-indicative-singular-third-person":"gungunea","first-person-imperfect-indicative-plural":"gunguneam","imperfect-indicative-plural-second-person":"gunguneați","imperfect-indicative-plural-third-person":"gunguneau","first-person-indicative-perfect-singular":"gungunii","indicative-perfect-second-person-singular":"gunguniși","indicative-perfect-singular-third-person":"gunguni","first-person-indicative-perfect-plural":"gungunirăm","indicative-perfect-plural-second-person":"gungunirăți","indicative-perfect-plural-third-person":"gunguniră","first-person-indicative-pluperfect-singular":"gungunisem","indicative-pluperfect-second-person-singular":"gunguniseși","indicative-pluperfect-singular-third-person":"gungunise","first-person-indicative-pluperfect-plural":"gunguniserăm","indicative-pluperfect-plural-second-person":"gunguniserăți","indicative-pluperfect-plural-third-person":"gunguniseră","first-person-present-singular-subjunctive":"să gungun","present-second-person-singular-subjunctive":"să gunguni","present-singular-subjunctive-third-person":"să gungună","first-person-plural-present-subjunctive":"să gungunim","plural-present-second-person-subjunctive":"să gunguniți","plural-present-subjunctive-third-person":"să gungună","imperative-second-person-singular":"gungune","imperative-plural-second-person":"gunguniți","imperative-negative-second-person-singular":"nu gunguni","imperative-negative-plural-second-person":"nu gunguniți"}},{"word":"gunguri","pos":"verb","definitions":["to alternative form of gânguri"],"forms":{"canonical":"a gunguri 4th conjugation","present-singular-third-person":"gungurește","participle-past":"gungurit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gunguri","gerund":"gungurind","first-person-indicative-present-singular":"gungur","indicative-present-second-person-singular":"gunguri","indicative-present-singular-third-person":"gungure","first-person-indicative-plural-present":"gungurim","indicative-plural-present-second-person":"gunguriți","indicative-plural-present-third-person":"gungur","first-person-imperfect-indicative-singular":"gunguream","imperfect-indicative-second-person-singular":"gungureai","imperfect-indicative-singular-third-person":"gungurea","first-person-imperfect-indicative-plural":"gunguream","imperfect-indicative-plural-second-person":"gungureați","imperfect-indicative-plural-third-person":"gungureau","first-person-indicative-perfect-singular":"gungurii","indicative-perfect-second-person-singular":"gunguriși","indicative-perfect-singular-third-person":"gunguri","first-person-indicative-perfect-plural":"gungurirăm","indicative-perfect-plural-second-person":"gungurirăți","indicative-perfect-plural-third-person":"gunguriră","first-person-indicative-pluperfect-singular":"gungurisem","indicative-pluperfect-second-person-singular":"gunguriseși","indicative-pluperfect-singular-third-person":"gungurise","first-person-indicative-pluperfect-plural":"gunguriserăm","indicative-pluperfect-plural-second-person":"gunguriserăți","indicative-pluperfect-plural-third-person":"gunguriseră","first-person-present-singular-subjunctive":"să gungur","present-second-person-singular-subjunctive":"să gunguri","present-singular-subjunctive-third-person":"să gungură","first-person-plural-present-subjunctive":"să gungurim","plural-present-second-person-subjunctive":"să gunguriți","plural-present-subjunctive-third-person":"să gungură","imperative-second-person-singular":"gungure","imperative-plural-second-person":"gunguriți","imperative-negative-second-person-singular":"nu gunguri","imperative-negative-plural-second-person":"nu gunguriți"}},{"word":"Gunoaia","pos":"name","definitions":["a river in Bacău, Romania, tributary to the Zeletin"],"gender":"f"},{"word":"gunoaie","pos":"noun","definitions":["plural of gunoi"]},{"word":"Gunoi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gunoi"}},{"word":"gunoi","pos":"noun","definitions":["garbage, trash, rubbish, litter","manure"],"forms":{"plural":"gunoaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gunoi","accusative-definite-nominative-singular":"gunoiul","accusative-indefinite-nominative-plural":"gunoaie","accusative-definite-nominative-plural":"gunoaiele","dative-genitive-indefinite-singular":"gunoi","dative-definite-genitive-singular":"gunoiului","dative-genitive-indefinite-plural":"gunoaie","dative-definite-genitive-plural":"gunoaielor","singular-vocative":"gunoiule","plural-vocative":"gunoaielor"}},{"word":"gunoia","pos":"verb","definitions":["obsolete form of gunoi"],"forms":{"canonical":"a gunoia 1st conjugation","present-singular-third-person":"gunoiază","participle-past":"gunoiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gunoia","gerund":"gunoind","first-person-indicative-present-singular":"gunoi","indicative-present-second-person-singular":"gunoi","indicative-present-singular-third-person":"gunoie","first-person-indicative-plural-present":"gunoiem","indicative-plural-present-second-person":"gunoiați","indicative-plural-present-third-person":"gunoie","first-person-imperfect-indicative-singular":"gunoiam","imperfect-indicative-second-person-singular":"gunoiai","imperfect-indicative-singular-third-person":"gunoia","first-person-imperfect-indicative-plural":"gunoiam","imperfect-indicative-plural-second-person":"gunoiați","imperfect-indicative-plural-third-person":"gunoiau","first-person-indicative-perfect-singular":"gunoiai","indicative-perfect-second-person-singular":"gunoiași","indicative-perfect-singular-third-person":"gunoie","first-person-indicative-perfect-plural":"gunoiarăm","indicative-perfect-plural-second-person":"gunoiarăți","indicative-perfect-plural-third-person":"gunoiară","first-person-indicative-pluperfect-singular":"gunoiasem","indicative-pluperfect-second-person-singular":"gunoiaseși","indicative-pluperfect-singular-third-person":"gunoiase","first-person-indicative-pluperfect-plural":"gunoiaserăm","indicative-pluperfect-plural-second-person":"gunoiaserăți","indicative-pluperfect-plural-third-person":"gunoiaseră","first-person-present-singular-subjunctive":"să gunoi","present-second-person-singular-subjunctive":"să gunoi","present-singular-subjunctive-third-person":"să gunoie","first-person-plural-present-subjunctive":"să gunoiem","plural-present-second-person-subjunctive":"să gunoiați","plural-present-subjunctive-third-person":"să gunoie","imperative-second-person-singular":"gunoie","imperative-plural-second-person":"gunoiați","imperative-negative-second-person-singular":"nu gunoia","imperative-negative-plural-second-person":"nu gunoiați"}},{"word":"gunoiaș","pos":"noun","definitions":["diminutive of gunoi"],"forms":{"plural":"gunoiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gunoiaș","accusative-definite-nominative-singular":"gunoiașul","accusative-indefinite-nominative-plural":"gunoiașe","accusative-definite-nominative-plural":"gunoiașele","dative-genitive-indefinite-singular":"gunoiaș","dative-definite-genitive-singular":"gunoiașului","dative-genitive-indefinite-plural":"gunoiașe","dative-definite-genitive-plural":"gunoiașelor","singular-vocative":"gunoiașule","plural-vocative":"gunoiașelor"}},{"word":"gunoiață","pos":"noun","definitions":["diminutive of gunoi"],"forms":{"plural":"gunoiețe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gunoiață","accusative-definite-nominative-singular":"gunoiața","accusative-indefinite-nominative-plural":"gunoiețe","accusative-definite-nominative-plural":"gunoiețele","dative-genitive-indefinite-singular":"gunoiețe","dative-definite-genitive-singular":"gunoieței","dative-genitive-indefinite-plural":"gunoiețe","dative-definite-genitive-plural":"gunoiețelor","singular-vocative":"gunoiață","plural-vocative":"gunoiețelor"}},{"word":"gunoier","pos":"noun","definitions":["garbage collector"],"pronunciation":"/ɡu.noˈjer/","forms":{"plural":"gunoieri","feminine":"equivalent gunoieră","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gunoier","accusative-definite-nominative-singular":"gunoierul","accusative-indefinite-nominative-plural":"gunoieri","accusative-definite-nominative-plural":"gunoierii","dative-genitive-indefinite-singular":"gunoier","dative-definite-genitive-singular":"gunoierului","dative-genitive-indefinite-plural":"gunoieri","dative-definite-genitive-plural":"gunoierilor","singular-vocative":"gunoierule","plural-vocative":"gunoierilor"}},{"word":"gunoieră","pos":"noun","definitions":["female equivalent of gunoier: female garbage collector","garbage truck"],"pronunciation":"/ɡu.noˈje.rə/","forms":{"plural":"gunoiere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gunoieră","accusative-definite-nominative-singular":"gunoiera","accusative-indefinite-nominative-plural":"gunoiere","accusative-definite-nominative-plural":"gunoierele","dative-genitive-indefinite-singular":"gunoiere","dative-definite-genitive-singular":"gunoierei","dative-genitive-indefinite-plural":"gunoiere","dative-definite-genitive-plural":"gunoierelor","singular-vocative":"gunoieră","plural-vocative":"gunoierelor"}},{"word":"gunoios","pos":"adj","definitions":["trashy"],"forms":{"feminine-singular":"gunoioasă","masculine-plural":"gunoioși","feminine-neuter-plural":"gunoioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gunoios","error-unrecognized-form-feminine-indefinite-singular":"gunoioasă","error-unrecognized-form-indefinite-masculine-plural":"gunoioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gunoioase","definite-error-unrecognized-form-masculine-neuter-singular":"gunoiosul","definite-error-unrecognized-form-feminine-singular":"gunoioasa","definite-error-unrecognized-form-masculine-plural":"gunoioșii","definite-error-unrecognized-form-feminine-neuter-plural":"gunoioasele"}},{"word":"gunoire","pos":"noun","definitions":["manuring"],"forms":{"plural":"gunoiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gunoire","accusative-definite-nominative-singular":"gunoirea","accusative-indefinite-nominative-plural":"gunoiri","accusative-definite-nominative-plural":"gunoirile","dative-genitive-indefinite-singular":"gunoiri","dative-definite-genitive-singular":"gunoirii","dative-genitive-indefinite-plural":"gunoiri","dative-definite-genitive-plural":"gunoirilor","singular-vocative":"gunoire","plural-vocative":"gunoirilor"}},{"word":"gunoiște","pos":"noun","definitions":["garbage dump, garbage heap"],"forms":{"plural":"gunoiști","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gunoiște","accusative-definite-nominative-singular":"gunoiștea","accusative-indefinite-nominative-plural":"gunoiști","accusative-definite-nominative-plural":"gunoiștile","dative-genitive-indefinite-singular":"gunoiști","dative-definite-genitive-singular":"gunoiștii","dative-genitive-indefinite-plural":"gunoiști","dative-definite-genitive-plural":"gunoiștilor","singular-vocative":"gunoiște","plural-vocative":"gunoiștilor"}},{"word":"gunoiștină","pos":"noun","definitions":["garbage dump, garbage heap"],"forms":{"plural":"gunoiștine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gunoiștină","accusative-definite-nominative-singular":"gunoiștina","accusative-indefinite-nominative-plural":"gunoiștine","accusative-definite-nominative-plural":"gunoiștinele","dative-genitive-indefinite-singular":"gunoiștine","dative-definite-genitive-singular":"gunoiștinei","dative-genitive-indefinite-plural":"gunoiștine","dative-definite-genitive-plural":"gunoiștinelor","singular-vocative":"gunoiștină","plural-vocative":"gunoiștinelor"}},{"word":"gunoit","pos":"adj","definitions":["manured"],"forms":{"feminine-singular":"gunoită","masculine-plural":"gunoiți","feminine-neuter-plural":"gunoite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gunoit","error-unrecognized-form-feminine-indefinite-singular":"gunoită","error-unrecognized-form-indefinite-masculine-plural":"gunoiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"gunoite","definite-error-unrecognized-form-masculine-neuter-singular":"gunoitul","definite-error-unrecognized-form-feminine-singular":"gunoita","definite-error-unrecognized-form-masculine-plural":"gunoiții","definite-error-unrecognized-form-feminine-neuter-plural":"gunoitele"}},{"word":"gura","pos":"noun","definitions":["definite nominative/accusative singular of gură"],"pronunciation":"/ˈɡu.ra/"},{"word":"gura","pos":"intj","definitions":["zip it!"],"pronunciation":"/ˈɡu.ra/"},{"word":"gură","pos":"noun","definitions":["mouth","mouthful"],"pronunciation":"/ˈɡu.rə/","forms":{"plural":"guri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gură","accusative-definite-nominative-singular":"gura","accusative-indefinite-nominative-plural":"guri","accusative-definite-nominative-plural":"gurile","dative-genitive-indefinite-singular":"guri","dative-definite-genitive-singular":"gurii","dative-genitive-indefinite-plural":"guri","dative-definite-genitive-plural":"gurilor","singular-vocative":"gură","plural-vocative":"gurilor"}},{"word":"Gura Albești","pos":"name","definitions":["a village in Albești, Vaslui County, Romania"],"gender":"f"},{"word":"Gura Arieșului","pos":"name","definitions":["a village in Lunca Mureșului, Alba County, Romania"],"gender":"f"},{"word":"Gura Bădicului","pos":"name","definitions":["a village in Mânzălești, Buzău County, Romania"],"gender":"f"},{"word":"Gura Bâdiliței","pos":"name","definitions":["a village in Vânători, Iași County, Romania"],"gender":"f"},{"word":"Gura Bărbulețului","pos":"name","definitions":["a village in Bărbulețu, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gura Bâscei","pos":"name","definitions":["a village in Cislău, Buzău County, Romania"],"gender":"f"},{"word":"gura bate curul","pos":"proverb","definitions":["a closed mouth gathers no feet"]},{"word":"Gura Beliei","pos":"name","definitions":["a locality in Breaza, Prahova County, Romania"],"gender":"f"},{"word":"Gura Bîcului","pos":"name","definitions":["a village in Gura Bîcului, Anenii Noi Raion, Moldova","a commune of Anenii Noi Raion, Moldova"],"gender":"f"},{"word":"Gura Bohotin","pos":"name","definitions":["a village in Gorban, Iași County, Romania"],"gender":"f"},{"word":"Gura Bordului","pos":"name","definitions":["a village in Lunca Cernii de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"Gura Căinarului","pos":"name","definitions":["a village in Gura Căinarului, Florești Raion, Moldova","a commune of Florești Raion, Moldova"],"gender":"f"},{"word":"Gura Caliței","pos":"name","definitions":["a commune of Vrancea County, Romania","a village in Gura Caliței, Vrancea County, Romania"],"gender":"f"},{"word":"Gura Călmățui","pos":"name","definitions":["a village in Berteștii de Jos, Brăila County, Romania"],"gender":"f"},{"word":"Gura Câlnăului","pos":"name","definitions":["a village in Vadu Pașii, Buzău County, Romania"],"gender":"f"},{"word":"Gura Căluiu","pos":"name","definitions":["a village in Călui, Olt County, Romania"],"gender":"f"},{"word":"Gura Camencii","pos":"name","definitions":["a village in Gura Camencii, Florești Raion, Moldova","a commune of Florești Raion, Moldova"],"gender":"f"},{"word":"Gura Cornei","pos":"name","definitions":["a locality in Abrud, Alba County, Romania"],"gender":"f"},{"word":"Gura Crăiești","pos":"name","definitions":["a village in Motoșeni, Bacău County, Romania"],"gender":"f"},{"word":"Gura Crivățului","pos":"name","definitions":["a village in Mănești, Prahova County, Romania"],"gender":"f"},{"word":"Gura Crucilor","pos":"name","definitions":["a village in Dănicei, Vâlcea County, Romania"],"gender":"f","forms":{"canonical-feminine":"Gura crucilor"}},{"word":"Gura Cuțului","pos":"name","definitions":["a village in Vințu de Jos, Alba County, Romania"],"gender":"f"},{"word":"gură de incendiu","pos":"noun","definitions":["fire hydrant"],"forms":{"plural":"guri de incendiu"}},{"word":"Gura Dimienii","pos":"name","definitions":["a village in Beceni, Buzău County, Romania"],"gender":"f"},{"word":"Gura Dobrogei","pos":"name","definitions":["a village in Cogealac, Constanța County, Romania"],"gender":"f"},{"word":"Gura Făgetului","pos":"name","definitions":["a village in Topliceni, Buzău County, Romania"],"gender":"f"},{"word":"Gura Foii","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Gura Foii, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gura Galbenei","pos":"name","definitions":["a village in Gura Galbenei, Cimișlia Raion, Moldova","a commune of Cimișlia Raion, Moldova"],"gender":"f"},{"word":"Gura Gârbovățului","pos":"name","definitions":["a village in Ghidigeni, Galați County, Romania"],"gender":"f"},{"word":"Gura Gârluței","pos":"name","definitions":["a village in Berteștii de Jos, Brăila County, Romania"],"gender":"f"},{"word":"Gura Haitii","pos":"name","definitions":["a village in Șaru Dornei, Suceava County, Romania"],"gender":"f"},{"word":"Gura Humorului","pos":"name","definitions":["a city in Suceava County, Romania"],"gender":"f"},{"word":"Gura Ialomiței","pos":"name","definitions":["a commune of Ialomița County, Romania","a village in Gura Ialomiței, Ialomița County, Romania"],"gender":"f"},{"word":"Gura Idrici","pos":"name","definitions":["a village in Roșiești, Vaslui County, Romania"],"gender":"f"},{"word":"Gura Izbitei","pos":"name","definitions":["a village in Bucium, Alba County, Romania"],"gender":"f"},{"word":"gura leului","pos":"noun","definitions":["snapdragon (Antirrhinum)"]},{"word":"gură mare","pos":"noun","definitions":["loudmouth"],"forms":{"plural":"guri mari"}},{"word":"Gura Motrului","pos":"name","definitions":["a village in Butoiești, Mehedinți County, Romania"],"gender":"f"},{"word":"Gura Ocniței","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Gura Ocniței, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gura Padinii","pos":"name","definitions":["a commune of Olt County, Romania","a village in Gura Padinii, Olt County, Romania"],"gender":"f"},{"word":"Gura Pravăț","pos":"name","definitions":["a village in Valea Mare Pravăț, Argeș County, Romania"],"gender":"f"},{"word":"Gura Putnei","pos":"name","definitions":["a village in Putna, Suceava County, Romania"],"gender":"f"},{"word":"Gura Racului","pos":"name","definitions":["a village in Bulzești, Dolj County, Romania"],"gender":"f"},{"word":"Gura Râului","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Gura Râului, Sibiu County, Romania"],"gender":"f"},{"word":"Gura Roșiei","pos":"name","definitions":["a village in Roșia Montană, Alba County, Romania"],"gender":"f"},{"word":"Gura Sărății","pos":"name","definitions":["a village in Merei, Buzău County, Romania"],"gender":"f"},{"word":"Gura Siriului","pos":"name","definitions":["a village in Siriu, Buzău County, Romania"],"gender":"f"},{"word":"Gura Sohodol","pos":"name","definitions":["a village in Sohodol, Alba County, Romania"],"gender":"f"},{"word":"Gura Solcii","pos":"name","definitions":["a village in Grănicești, Suceava County, Romania"],"gender":"f"},{"word":"gură spartă","pos":"noun","definitions":["indiscreet person, who says things that should have stayed a secret"],"forms":{"plural":"guri sparte"}},{"word":"Gura Șușiței","pos":"name","definitions":["a village in Ionești, Gorj County, Romania"],"gender":"f"},{"word":"Gura Șuții","pos":"name","definitions":["a commune of Dâmbovița County, Romania","a village in Gura Șuții, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gura Teghii","pos":"name","definitions":["a commune of Buzău County, Romania","a village in Gura Teghii, Buzău County, Romania"],"gender":"f"},{"word":"Gura Vadului","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Gura Vadului, Prahova County, Romania"],"gender":"f"},{"word":"Gura Văii","pos":"name","definitions":["a village in Pleșcuța, Arad County, Romania","a village in Albota, Argeș County, Romania","a commune of Bacău County, Romania","a village in Gura Văii, Bacău County, Romania","a village in Racova, Bacău County, Romania"],"gender":"f"},{"word":"Gura Vitioarei","pos":"name","definitions":["a commune of Prahova County, Romania","a village in Gura Vitioarei, Prahova County, Romania"],"gender":"f"},{"word":"Gura Vlădesei","pos":"name","definitions":["a village in Gâlgău, Sălaj County, Romania"],"gender":"f"},{"word":"Gura Vulcanei","pos":"name","definitions":["a village in Vulcana-Pandele, Dâmbovița County, Romania"],"gender":"f"},{"word":"Gura-Oituz","pos":"name","definitions":["a village in Cotiujenii Mici, Sîngerei Raion, Moldova"],"gender":"f"},{"word":"Gurahonț","pos":"name","definitions":["a commune of Arad County, Romania","a village in Gurahonț, Arad County, Romania"],"gender":"m"},{"word":"gurăi","pos":"verb","definitions":["to cry (about birds)"],"forms":{"canonical":"a gurăi 4th conjugation","present-singular-third-person":"gurăie","participle-past":"gurăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a gurăi","gerund":"gurăind","first-person-indicative-present-singular":"gurăi","indicative-present-second-person-singular":"gurăi","indicative-present-singular-third-person":"gurăie","first-person-indicative-plural-present":"gurăim","indicative-plural-present-second-person":"gurăiți","indicative-plural-present-third-person":"gurăie","first-person-imperfect-indicative-singular":"gurăiam","imperfect-indicative-second-person-singular":"gurăiai","imperfect-indicative-singular-third-person":"gurăia","first-person-imperfect-indicative-plural":"gurăiam","imperfect-indicative-plural-second-person":"gurăiați","imperfect-indicative-plural-third-person":"gurăiau","first-person-indicative-perfect-singular":"gurăii","indicative-perfect-second-person-singular":"gurăiși","indicative-perfect-singular-third-person":"gurăi","first-person-indicative-perfect-plural":"gurăirăm","indicative-perfect-plural-second-person":"gurăirăți","indicative-perfect-plural-third-person":"gurăiră","first-person-indicative-pluperfect-singular":"gurăisem","indicative-pluperfect-second-person-singular":"gurăiseși","indicative-pluperfect-singular-third-person":"gurăise","first-person-indicative-pluperfect-plural":"gurăiserăm","indicative-pluperfect-plural-second-person":"gurăiserăți","indicative-pluperfect-plural-third-person":"gurăiseră","first-person-present-singular-subjunctive":"să gurăi","present-second-person-singular-subjunctive":"să gurăi","present-singular-subjunctive-third-person":"să gurăie","first-person-plural-present-subjunctive":"să gurăim","plural-present-second-person-subjunctive":"să gurăiți","plural-present-subjunctive-third-person":"să gurăie","imperative-second-person-singular":"gurăie","imperative-plural-second-person":"gurăiți","imperative-negative-second-person-singular":"nu gurăi","imperative-negative-plural-second-person":"nu gurăiți"}},{"word":"guraliu","pos":"adj","definitions":["alternative form of guraliv"],"forms":{"feminine-singular":"guralie","plural":"guralii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guraliu","error-unrecognized-form-feminine-indefinite-singular":"guralie","error-unrecognized-form-indefinite-masculine-plural":"guralii","error-unrecognized-form-feminine-indefinite-neuter-plural":"guralii","definite-error-unrecognized-form-masculine-neuter-singular":"guraliul","definite-error-unrecognized-form-feminine-singular":"guralia","definite-error-unrecognized-form-masculine-plural":"guraliii","definite-error-unrecognized-form-feminine-neuter-plural":"guraliile"}},{"word":"guraliv","pos":"adj","definitions":["talkative, garrulous, chatty"],"pronunciation":"/ɡu.raˈliv/","forms":{"feminine-singular":"guralivă","masculine-plural":"guralivi","feminine-neuter-plural":"guralive","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"guraliv","error-unrecognized-form-feminine-indefinite-singular":"guralivă","error-unrecognized-form-indefinite-masculine-plural":"guralivi","error-unrecognized-form-feminine-indefinite-neuter-plural":"guralive","definite-error-unrecognized-form-masculine-neuter-singular":"guralivul","definite-error-unrecognized-form-feminine-singular":"guraliva","definite-error-unrecognized-form-masculine-plural":"guralivii","definite-error-unrecognized-form-feminine-neuter-plural":"guralivele","alternative":"guraliu"}},{"word":"guralivă","pos":"noun","definitions":["female equivalent of guraliv"],"forms":{"plural":"guralive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guralivă","accusative-definite-nominative-singular":"guraliva","accusative-indefinite-nominative-plural":"guralive","accusative-definite-nominative-plural":"guralivele","dative-genitive-indefinite-singular":"guralive","dative-definite-genitive-singular":"guralivei","dative-genitive-indefinite-plural":"guralive","dative-definite-genitive-plural":"guralivelor","singular-vocative":"guralivă","plural-vocative":"guralivelor"}},{"word":"Guralivu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guralivu"}},{"word":"Gurani","pos":"name","definitions":["a village in Pietroasa, Bihor County, Romania"],"gender":"m"},{"word":"Gurasada","pos":"name","definitions":["a commune of Hunedoara County, Romania","a village in Gurasada, Hunedoara County, Romania"],"gender":"f"},{"word":"guratic","pos":"adj","definitions":["talkative, garrulous, chatty"],"forms":{"feminine-singular":"guratică","masculine-plural":"guratici","feminine-neuter-plural":"guratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guratic","error-unrecognized-form-feminine-indefinite-singular":"guratică","error-unrecognized-form-indefinite-masculine-plural":"guratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"guratice","definite-error-unrecognized-form-masculine-neuter-singular":"guraticul","definite-error-unrecognized-form-feminine-singular":"guratica","definite-error-unrecognized-form-masculine-plural":"guraticii","definite-error-unrecognized-form-feminine-neuter-plural":"guraticele"}},{"word":"Gurău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gurău"}},{"word":"Gurbăneșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gurbăneșteanu"}},{"word":"Gurbănești","pos":"name","definitions":["a commune of Călărași County, Romania","a village in Gurbănești, Călărași County, Romania"],"gender":"m"},{"word":"Gurbediu","pos":"name","definitions":["a village in Tinca, Bihor County, Romania"],"gender":"m"},{"word":"Gurbești","pos":"name","definitions":["a village in Căbești, Bihor County, Romania","a village in Spinuș, Bihor County, Romania"],"gender":"m"},{"word":"Gureni","pos":"name","definitions":["a village in Peștișani, Gorj County, Romania"],"gender":"m"},{"word":"gureș","pos":"adj","definitions":["talkative, loquacious, garrulous, chatty"],"pronunciation":"/ˈɡu.reʃ/","forms":{"feminine-singular":"gureșă","masculine-plural":"gureși","feminine-neuter-plural":"gureșe","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"gureș","error-unrecognized-form-feminine-indefinite-singular":"gureșă","error-unrecognized-form-indefinite-masculine-plural":"gureși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gureșe","definite-error-unrecognized-form-masculine-neuter-singular":"gureșul","definite-error-unrecognized-form-feminine-singular":"gureșa","definite-error-unrecognized-form-masculine-plural":"gureșii","definite-error-unrecognized-form-feminine-neuter-plural":"gureșele"}},{"word":"Gureșoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Gureșoaia"}},{"word":"Gurghiu","pos":"name","definitions":["a commune of Mureș County, Romania","a village in Gurghiu, Mureș County, Romania"],"gender":"m"},{"word":"Gurgui","pos":"name","definitions":["a river in Vâlcea, Romania"],"gender":"m"},{"word":"gurgui","pos":"noun","definitions":["spout","nipple, teat, pap"],"forms":{"plural":"gurguie"}},{"word":"gurguială","pos":"noun","definitions":["swelling"],"forms":{"plural":"gurguieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gurguială","accusative-definite-nominative-singular":"gurguiala","accusative-indefinite-nominative-plural":"gurguiele","accusative-definite-nominative-plural":"gurguielele","dative-genitive-indefinite-singular":"gurguiele","dative-definite-genitive-singular":"gurguielei","dative-genitive-indefinite-plural":"gurguiele","dative-definite-genitive-plural":"gurguielelor","singular-vocative":"gurguială","plural-vocative":"gurguielelor"}},{"word":"gurguiat","pos":"adj","definitions":["pointy"],"forms":{"feminine-singular":"gurguiată","masculine-plural":"gurguiați","feminine-neuter-plural":"gurguiate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gurguiat","error-unrecognized-form-feminine-indefinite-singular":"gurguiată","error-unrecognized-form-indefinite-masculine-plural":"gurguiați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gurguiate","definite-error-unrecognized-form-masculine-neuter-singular":"gurguiatul","definite-error-unrecognized-form-feminine-singular":"gurguiata","definite-error-unrecognized-form-masculine-plural":"gurguiații","definite-error-unrecognized-form-feminine-neuter-plural":"gurguiatele"}},{"word":"gurguiat","pos":"verb","definitions":["past participle of gurguia"],"forms":{"participle-past":"of gurguia"}},{"word":"Gurguiata","pos":"name","definitions":["a locality in Băile Olănești, Vâlcea County, Romania"],"gender":"f"},{"word":"Gurguieți","pos":"name","definitions":["a village in Scorțaru Nou, Brăila County, Romania"],"gender":"m"},{"word":"gurguțat","pos":"adj","definitions":["tall, heightened"],"forms":{"feminine-singular":"gurguțată","masculine-plural":"gurguțați","feminine-neuter-plural":"gurguțate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gurguțat","error-unrecognized-form-feminine-indefinite-singular":"gurguțată","error-unrecognized-form-indefinite-masculine-plural":"gurguțați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gurguțate","definite-error-unrecognized-form-masculine-neuter-singular":"gurguțatul","definite-error-unrecognized-form-feminine-singular":"gurguțata","definite-error-unrecognized-form-masculine-plural":"gurguțații","definite-error-unrecognized-form-feminine-neuter-plural":"gurguțatele"}},{"word":"gurguțat","pos":"verb","definitions":["past participle of gurguța"],"forms":{"participle-past":"of gurguța"}},{"word":"guri","pos":"noun","definitions":["inflection of gură:","plural","genitive/dative singular"]},{"word":"guricică","pos":"noun","definitions":["diminutive of gură"],"forms":{"plural":"guricicele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guricică","accusative-definite-nominative-singular":"guricica","accusative-indefinite-nominative-plural":"guricicele","accusative-definite-nominative-plural":"guricicelele","dative-genitive-indefinite-singular":"guricicele","dative-definite-genitive-singular":"guricicelei","dative-genitive-indefinite-plural":"guricicele","dative-definite-genitive-plural":"guricicelelor","singular-vocative":"guricică","plural-vocative":"guricicelelor"}},{"word":"guricioară","pos":"noun","definitions":["diminutive of guriță"],"forms":{"plural":"guricioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guricioară","accusative-definite-nominative-singular":"guricioara","accusative-indefinite-nominative-plural":"guricioare","accusative-definite-nominative-plural":"guricioarele","dative-genitive-indefinite-singular":"guricioare","dative-definite-genitive-singular":"guricioarei","dative-genitive-indefinite-plural":"guricioare","dative-definite-genitive-plural":"guricioarelor","singular-vocative":"guricioară","plural-vocative":"guricioarelor"}},{"word":"gurii","pos":"noun","definitions":["definite dative/genitive singular of gură"]},{"word":"gurilățel","pos":"adj","definitions":["bigmouthed"],"forms":{"feminine-singular":"gurilățelă","masculine-plural":"gurilățeli","feminine-neuter-plural":"gurilățele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gurilățel","error-unrecognized-form-feminine-indefinite-singular":"gurilățelă","error-unrecognized-form-indefinite-masculine-plural":"gurilățeli","error-unrecognized-form-feminine-indefinite-neuter-plural":"gurilățele","definite-error-unrecognized-form-masculine-neuter-singular":"gurilățelul","definite-error-unrecognized-form-feminine-singular":"gurilățela","definite-error-unrecognized-form-masculine-plural":"gurilățelii","definite-error-unrecognized-form-feminine-neuter-plural":"gurilățelele"}},{"word":"gurile","pos":"noun","definitions":["definite nominative/accusative plural of gură"]},{"word":"gurilor","pos":"noun","definitions":["inflection of gură:","definite genitive/dative plural","vocative plural"]},{"word":"gurioară","pos":"noun","definitions":["diminutive of gură"],"forms":{"plural":"gurioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gurioară","accusative-definite-nominative-singular":"gurioara","accusative-indefinite-nominative-plural":"gurioare","accusative-definite-nominative-plural":"gurioarele","dative-genitive-indefinite-singular":"gurioare","dative-definite-genitive-singular":"gurioarei","dative-genitive-indefinite-plural":"gurioare","dative-definite-genitive-plural":"gurioarelor","singular-vocative":"gurioară","plural-vocative":"gurioarelor"}},{"word":"Gurișoara","pos":"name","definitions":["a village in Mihăești, Vâlcea County, Romania"],"gender":"f"},{"word":"gurișoară","pos":"noun","definitions":["diminutive of gură"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gurișoară","accusative-definite-nominative":"gurișoara","dative-genitive-indefinite":"gurișoare","dative-definite-genitive":"gurișoarei","vocative":"gurișoară"}},{"word":"guristă","pos":"noun","definitions":["female equivalent of gurist"],"forms":{"plural":"guriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guristă","accusative-definite-nominative-singular":"gurista","accusative-indefinite-nominative-plural":"guriste","accusative-definite-nominative-plural":"guristele","dative-genitive-indefinite-singular":"guriste","dative-definite-genitive-singular":"guristei","dative-genitive-indefinite-plural":"guriste","dative-definite-genitive-plural":"guristelor","singular-vocative":"guristă","plural-vocative":"guristelor"}},{"word":"Guriță","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guriță"}},{"word":"guriță","pos":"noun","definitions":["diminutive of gură: little mouth","a kiss"],"forms":{"plural":"gurițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guriță","accusative-definite-nominative-singular":"gurița","accusative-indefinite-nominative-plural":"gurițe","accusative-definite-nominative-plural":"gurițele","dative-genitive-indefinite-singular":"gurițe","dative-definite-genitive-singular":"guriței","dative-genitive-indefinite-plural":"gurițe","dative-definite-genitive-plural":"gurițelor","singular-vocative":"guriță","plural-vocative":"gurițelor"}},{"word":"Gurițanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gurițanu"}},{"word":"gurlui","pos":"noun","definitions":["the cry of a dove"],"forms":{"plural":"gurluie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gurlui","accusative-definite-nominative-singular":"gurluiul","accusative-indefinite-nominative-plural":"gurluie","accusative-definite-nominative-plural":"gurluiele","dative-genitive-indefinite-singular":"gurlui","dative-definite-genitive-singular":"gurluiului","dative-genitive-indefinite-plural":"gurluie","dative-definite-genitive-plural":"gurluielor","singular-vocative":"gurluiule","plural-vocative":"gurluielor"}},{"word":"gurmă","pos":"noun","definitions":["strangles, equine distemper (disease of horses caused by an infection by the bacterium Streptococcus equi)"],"forms":{"plural":"gurme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gurmă","accusative-definite-nominative-singular":"gurma","accusative-indefinite-nominative-plural":"gurme","accusative-definite-nominative-plural":"gurmele","dative-genitive-indefinite-singular":"gurme","dative-definite-genitive-singular":"gurmei","dative-genitive-indefinite-plural":"gurme","dative-definite-genitive-plural":"gurmelor","singular-vocative":"gurmă","plural-vocative":"gurmelor"}},{"word":"gurmand","pos":"adj","definitions":["eater"],"forms":{"feminine-singular":"gurmandă","masculine-plural":"gurmanzi","feminine-neuter-plural":"gurmande","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gurmand","error-unrecognized-form-feminine-indefinite-singular":"gurmandă","error-unrecognized-form-indefinite-masculine-plural":"gurmanzi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gurmande","definite-error-unrecognized-form-masculine-neuter-singular":"gurmandul","definite-error-unrecognized-form-feminine-singular":"gurmanda","definite-error-unrecognized-form-masculine-plural":"gurmanzii","definite-error-unrecognized-form-feminine-neuter-plural":"gurmandele"}},{"word":"gurmandă","pos":"noun","definitions":["female equivalent of gurmand"],"forms":{"plural":"gurmande","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gurmandă","accusative-definite-nominative-singular":"gurmanda","accusative-indefinite-nominative-plural":"gurmande","accusative-definite-nominative-plural":"gurmandele","dative-genitive-indefinite-singular":"gurmande","dative-definite-genitive-singular":"gurmandei","dative-genitive-indefinite-plural":"gurmande","dative-definite-genitive-plural":"gurmandelor","singular-vocative":"gurmandă","plural-vocative":"gurmandelor"}},{"word":"gurmir","pos":"noun","definitions":["plateau, tableland"],"forms":{"plural":"gurmire","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gurmir","accusative-definite-nominative-singular":"gurmirul","accusative-indefinite-nominative-plural":"gurmire","accusative-definite-nominative-plural":"gurmirele","dative-genitive-indefinite-singular":"gurmir","dative-definite-genitive-singular":"gurmirului","dative-genitive-indefinite-plural":"gurmire","dative-definite-genitive-plural":"gurmirelor","singular-vocative":"gurmirule","plural-vocative":"gurmirelor"}},{"word":"gurnie","pos":"noun","definitions":["drainpipe"],"forms":{"plural":"gurnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gurnie","accusative-definite-nominative-singular":"gurnia","accusative-indefinite-nominative-plural":"gurnii","accusative-definite-nominative-plural":"gurniile","dative-genitive-indefinite-singular":"gurnii","dative-definite-genitive-singular":"gurniei","dative-genitive-indefinite-plural":"gurnii","dative-definite-genitive-plural":"gurniilor","singular-vocative":"gurnie","plural-vocative":"gurniilor"}},{"word":"guro","pos":"noun","definitions":["vocative singular of gură"],"pronunciation":"[ˈɡuro]","gender":"f"},{"word":"guru","pos":"noun","definitions":["guru"],"forms":{"plural":"guru","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guru","accusative-definite-nominative-singular":"guruul","accusative-indefinite-nominative-plural":"guru","accusative-definite-nominative-plural":"gurui","dative-genitive-indefinite-singular":"guru","dative-definite-genitive-singular":"guruului","dative-genitive-indefinite-plural":"guru","dative-definite-genitive-plural":"gurulor","singular-vocative":"guruule","plural-vocative":"gurulor"}},{"word":"gurucă","pos":"noun","definitions":["diminutive of gură: little mouth"],"forms":{"plural":"guruci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gurucă","accusative-definite-nominative-singular":"guruca","accusative-indefinite-nominative-plural":"guruci","accusative-definite-nominative-plural":"gurucile","dative-genitive-indefinite-singular":"guruci","dative-definite-genitive-singular":"gurucii","dative-genitive-indefinite-plural":"guruci","dative-definite-genitive-plural":"gurucilor","singular-vocative":"gurucă","plural-vocative":"gurucilor"}},{"word":"Guruianu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guruianu"}},{"word":"gurușel","pos":"noun","definitions":["crucian carp (Carassius carassius)"],"forms":{"plural":"gurușei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gurușel","accusative-definite-nominative-singular":"gurușelul","accusative-indefinite-nominative-plural":"gurușei","accusative-definite-nominative-plural":"gurușeii","dative-genitive-indefinite-singular":"gurușel","dative-definite-genitive-singular":"gurușelului","dative-genitive-indefinite-plural":"gurușei","dative-definite-genitive-plural":"gurușeilor","singular-vocative":"gurușelule","plural-vocative":"gurușeilor"}},{"word":"Guruslău","pos":"name","definitions":["a village in Hereclean, Sălaj County, Romania"],"gender":"m"},{"word":"guruță","pos":"noun","definitions":["diminutive of gură: little mouth"],"forms":{"plural":"guruțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guruță","accusative-definite-nominative-singular":"guruța","accusative-indefinite-nominative-plural":"guruțe","accusative-definite-nominative-plural":"guruțele","dative-genitive-indefinite-singular":"guruțe","dative-definite-genitive-singular":"guruței","dative-genitive-indefinite-plural":"guruțe","dative-definite-genitive-plural":"guruțelor","singular-vocative":"guruță","plural-vocative":"guruțelor"}},{"word":"Gușa","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gușa"}},{"word":"Gușă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gușă"}},{"word":"gușă","pos":"noun","definitions":["goiter","crop, maw, gizzard","dewlap, double chin","neck, throat"],"forms":{"plural":"guși","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"gușă","accusative-definite-nominative-singular":"gușa","accusative-indefinite-nominative-plural":"guși","accusative-definite-nominative-plural":"gușile","dative-genitive-indefinite-singular":"guși","dative-definite-genitive-singular":"gușii","dative-genitive-indefinite-plural":"guși","dative-definite-genitive-plural":"gușilor","singular-vocative":"gușă","plural-vocative":"gușilor"}},{"word":"gușă albastră","pos":"noun","definitions":["bluethroat (Luscinia svecica)"],"forms":{"plural":"gușe albastră"}},{"word":"gușa porumbelului","pos":"noun","definitions":["bladder campion (Silene vulgaris)"]},{"word":"gușă vânătă","pos":"noun","definitions":["bluethroat (Luscinia svecica)"],"forms":{"plural":"gușe vinete"}},{"word":"gușă-roșie","pos":"noun","definitions":["European robin, robin redbreast (bird)"],"pronunciation":"/ˈɡu.ʃə ˈro.ʃje/","forms":{"plural":"gușe-roșii"}},{"word":"Gușat","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gușat"}},{"word":"gușat","pos":"noun","definitions":["goitrous"],"forms":{"plural":"gușați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gușat","accusative-definite-nominative-singular":"gușatul","accusative-indefinite-nominative-plural":"gușați","accusative-definite-nominative-plural":"gușații","dative-genitive-indefinite-singular":"gușat","dative-definite-genitive-singular":"gușatului","dative-genitive-indefinite-plural":"gușați","dative-definite-genitive-plural":"gușaților","singular-vocative":"gușatule","plural-vocative":"gușaților"}},{"word":"gușată","pos":"noun","definitions":["female equivalent of gușat"],"forms":{"plural":"gușate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gușată","accusative-definite-nominative-singular":"gușata","accusative-indefinite-nominative-plural":"gușate","accusative-definite-nominative-plural":"gușatele","dative-genitive-indefinite-singular":"gușate","dative-definite-genitive-singular":"gușatei","dative-genitive-indefinite-plural":"gușate","dative-definite-genitive-plural":"gușatelor","singular-vocative":"gușată","plural-vocative":"gușatelor"}},{"word":"Gușați","pos":"name","definitions":["a village in Dâmbovița County, Romania. Renamed to Sălcioara in 1964."],"gender":"m"},{"word":"Gușatu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Gușatu"}},{"word":"gușe-roșii","pos":"noun","definitions":["plural of gușă-roșie"],"gender":"f"},{"word":"guseu","pos":"noun","definitions":["gusset"],"forms":{"plural":"guseuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guseu","accusative-definite-nominative-singular":"guseul","accusative-indefinite-nominative-plural":"guseuri","accusative-definite-nominative-plural":"guseurile","dative-genitive-indefinite-singular":"guseu","dative-definite-genitive-singular":"guseului","dative-genitive-indefinite-plural":"guseuri","dative-definite-genitive-plural":"guseurilor","singular-vocative":"guseule","plural-vocative":"guseurilor"}},{"word":"gușiță","pos":"noun","definitions":["diminutive of gușă"],"forms":{"plural":"gușițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gușiță","accusative-definite-nominative-singular":"gușița","accusative-indefinite-nominative-plural":"gușițe","accusative-definite-nominative-plural":"gușițele","dative-genitive-indefinite-singular":"gușițe","dative-definite-genitive-singular":"gușiței","dative-genitive-indefinite-plural":"gușițe","dative-definite-genitive-plural":"gușițelor","singular-vocative":"gușiță","plural-vocative":"gușițelor"}},{"word":"Gușiței","pos":"name","definitions":["a village in Dimitrie Cantemir, Vaslui County, Romania"],"gender":"m"},{"word":"Gușoeni","pos":"name","definitions":["a commune of Vâlcea County, Romania","a village in Gușoeni, Vâlcea County, Romania"],"gender":"m"},{"word":"Gușoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Gușoi"}},{"word":"Gușoianca","pos":"name","definitions":["a village in Gușoeni, Vâlcea County, Romania"],"gender":"f"},{"word":"Gușoiu","pos":"name","definitions":["a village in Glodeni, Dâmbovița County, Romania"],"gender":"m"},{"word":"gust","pos":"noun","definitions":["taste"],"pronunciation":"/ˈɡust/","forms":{"plural":"gusturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gust","accusative-definite-nominative-singular":"gustul","accusative-indefinite-nominative-plural":"gusturi","accusative-definite-nominative-plural":"gusturile","dative-genitive-indefinite-singular":"gust","dative-definite-genitive-singular":"gustului","dative-genitive-indefinite-plural":"gusturi","dative-definite-genitive-plural":"gusturilor","singular-vocative":"gustule","plural-vocative":"gusturilor"}},{"word":"gust","pos":"noun","definitions":["August"],"pronunciation":"/ˈɡust/","forms":{"alternative":"agust"}},{"word":"gusta","pos":"verb","definitions":["to taste","to enjoy","to try","to experience"],"forms":{"canonical":"a gusta 1st conjugation","present-singular-third-person":"gustă","participle-past":"gustat","subjunctive-third-person":"guste","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a gusta","gerund":"gustând","first-person-indicative-present-singular":"gust","indicative-present-second-person-singular":"guști","indicative-present-singular-third-person":"gustă","first-person-indicative-plural-present":"gustăm","indicative-plural-present-second-person":"gustați","indicative-plural-present-third-person":"gustă","first-person-imperfect-indicative-singular":"gustam","imperfect-indicative-second-person-singular":"gustai","imperfect-indicative-singular-third-person":"gusta","first-person-imperfect-indicative-plural":"gustam","imperfect-indicative-plural-second-person":"gustați","imperfect-indicative-plural-third-person":"gustau","first-person-indicative-perfect-singular":"gustai","indicative-perfect-second-person-singular":"gustași","indicative-perfect-singular-third-person":"gustă","first-person-indicative-perfect-plural":"gustarăm","indicative-perfect-plural-second-person":"gustarăți","indicative-perfect-plural-third-person":"gustară","first-person-indicative-pluperfect-singular":"gustasem","indicative-pluperfect-second-person-singular":"gustaseși","indicative-pluperfect-singular-third-person":"gustase","first-person-indicative-pluperfect-plural":"gustaserăm","indicative-pluperfect-plural-second-person":"gustaserăți","indicative-pluperfect-plural-third-person":"gustaseră","first-person-present-singular-subjunctive":"să gust","present-second-person-singular-subjunctive":"să guști","present-singular-subjunctive-third-person":"să guste","first-person-plural-present-subjunctive":"să gustăm","plural-present-second-person-subjunctive":"să gustați","plural-present-subjunctive-third-person":"să guste","imperative-second-person-singular":"gustă","imperative-plural-second-person":"gustați","imperative-negative-second-person-singular":"nu gusta","imperative-negative-plural-second-person":"nu gustați"}},{"word":"gustai","pos":"verb","definitions":["inflection of gusta:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[ɡuˈstaj]"},{"word":"gustar","pos":"noun","definitions":["August (eighth month of the Gregorian calendar)"],"pronunciation":"/ɡuˈstar/","forms":{"alternative":"gust"}},{"word":"gustare","pos":"noun","definitions":["tasting","gustation","snack, light meal, (such as brunch)"],"pronunciation":"/ɡusˈta.re/","forms":{"plural":"gustări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"gustare","accusative-definite-nominative-singular":"gustarea","accusative-indefinite-nominative-plural":"gustări","accusative-definite-nominative-plural":"gustările","dative-genitive-indefinite-singular":"gustări","dative-definite-genitive-singular":"gustării","dative-genitive-indefinite-plural":"gustări","dative-definite-genitive-plural":"gustărilor","singular-vocative":"gustare","plural-vocative":"gustărilor"}},{"word":"gustăreală","pos":"noun","definitions":["tasting"],"forms":{"plural":"gustăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gustăreală","accusative-definite-nominative-singular":"gustăreala","accusative-indefinite-nominative-plural":"gustărele","accusative-definite-nominative-plural":"gustărelele","dative-genitive-indefinite-singular":"gustărele","dative-definite-genitive-singular":"gustărelei","dative-genitive-indefinite-plural":"gustărele","dative-definite-genitive-plural":"gustărelelor","singular-vocative":"gustăreală","plural-vocative":"gustărelelor"}},{"word":"gustărică","pos":"noun","definitions":["diminutive of gustare; small snack"],"forms":{"plural":"gustarici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gustărică","accusative-definite-nominative-singular":"gustărica","accusative-indefinite-nominative-plural":"gustărice","accusative-definite-nominative-plural":"gustăricele","dative-genitive-indefinite-singular":"gustărice","dative-definite-genitive-singular":"gustăricei","dative-genitive-indefinite-plural":"gustărice","dative-definite-genitive-plural":"gustăricelor","singular-vocative":"gustărică","plural-vocative":"gustăricelor"}},{"word":"gustărit","pos":"noun","definitions":["tasting"],"forms":{"plural":"gustărituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gustărit","accusative-definite-nominative-singular":"gustăritul","accusative-indefinite-nominative-plural":"gustărituri","accusative-definite-nominative-plural":"gustăriturile","dative-genitive-indefinite-singular":"gustărit","dative-definite-genitive-singular":"gustăritului","dative-genitive-indefinite-plural":"gustărituri","dative-definite-genitive-plural":"gustăriturilor","singular-vocative":"gustăritule","plural-vocative":"gustăriturilor"}},{"word":"gustărit","pos":"verb","definitions":["past participle of gustări"],"forms":{"participle-past":"of gustări"}},{"word":"gustase","pos":"verb","definitions":["third-person singular pluperfect indicative of gusta"],"pronunciation":"[ɡuˈstase]"},{"word":"gustat","pos":"adj","definitions":["tasty, appreciated"],"pronunciation":"[ɡuˈstat]","forms":{"feminine-singular":"gustată","masculine-plural":"gustați","feminine-neuter-plural":"gustate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gustat","error-unrecognized-form-feminine-indefinite-singular":"gustată","error-unrecognized-form-indefinite-masculine-plural":"gustați","error-unrecognized-form-feminine-indefinite-neuter-plural":"gustate","definite-error-unrecognized-form-masculine-neuter-singular":"gustatul","definite-error-unrecognized-form-feminine-singular":"gustata","definite-error-unrecognized-form-masculine-plural":"gustații","definite-error-unrecognized-form-feminine-neuter-plural":"gustatele"}},{"word":"gustat","pos":"verb","definitions":["past participle of gusta"],"pronunciation":"[ɡuˈstat]","forms":{"participle-past":"of gusta"}},{"word":"gustativ","pos":"adj","definitions":["gustatory"],"forms":{"feminine-singular":"gustativă","masculine-plural":"gustativi","feminine-neuter-plural":"gustative","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gustativ","error-unrecognized-form-feminine-indefinite-singular":"gustativă","error-unrecognized-form-indefinite-masculine-plural":"gustativi","error-unrecognized-form-feminine-indefinite-neuter-plural":"gustative","definite-error-unrecognized-form-masculine-neuter-singular":"gustativul","definite-error-unrecognized-form-feminine-singular":"gustativa","definite-error-unrecognized-form-masculine-plural":"gustativii","definite-error-unrecognized-form-feminine-neuter-plural":"gustativele"}},{"word":"gustativitate","pos":"noun","definitions":["gustativeness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"gustativitate","accusative-definite-nominative":"gustativitatea","dative-genitive-indefinite":"gustativități","dative-definite-genitive":"gustativității","vocative":"-"}},{"word":"gustătoare","pos":"noun","definitions":["female equivalent of gustător"],"forms":{"plural":"gustătoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"gustătoare","accusative-definite-nominative-singular":"gustătoarea","accusative-indefinite-nominative-plural":"gustătoare","accusative-definite-nominative-plural":"gustătoarele","dative-genitive-indefinite-singular":"gustătoare","dative-definite-genitive-singular":"gustătoarei","dative-genitive-indefinite-plural":"gustătoare","dative-definite-genitive-plural":"gustătoarelor","singular-vocative":"gustătoare","plural-vocative":"gustătoarelor"}},{"word":"gustător","pos":"noun","definitions":["taster"],"forms":{"plural":"gustători","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gustător","accusative-definite-nominative-singular":"gustătorul","accusative-indefinite-nominative-plural":"gustători","accusative-definite-nominative-plural":"gustătorii","dative-genitive-indefinite-singular":"gustător","dative-definite-genitive-singular":"gustătorului","dative-genitive-indefinite-plural":"gustători","dative-definite-genitive-plural":"gustătorilor","singular-vocative":"gustătorule","plural-vocative":"gustătorilor"}},{"word":"guste","pos":"verb","definitions":["third-person singular/plural present subjunctive of gusta"],"pronunciation":"[ˈɡuste]"},{"word":"gușter","pos":"noun","definitions":["European green lizard (Lacerta viridis)"],"forms":{"plural":"gușteri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gușter","accusative-definite-nominative-singular":"gușterul","accusative-indefinite-nominative-plural":"gușteri","accusative-definite-nominative-plural":"gușterile","dative-genitive-indefinite-singular":"gușter","dative-definite-genitive-singular":"gușterului","dative-genitive-indefinite-plural":"gușteri","dative-definite-genitive-plural":"gușterilor","singular-vocative":"gușterule","plural-vocative":"gușterilor"}},{"word":"Gușterița","pos":"name","definitions":["a neighbourhood of Sibiu, Sibiu County, Romania"],"gender":"f"},{"word":"Gușterițan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Gușterițan"}},{"word":"gușteroaică","pos":"noun","definitions":["female European green lizard"],"forms":{"plural":"gușteroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gușteroaică","accusative-definite-nominative-singular":"gușteroaica","accusative-indefinite-nominative-plural":"gușteroaice","accusative-definite-nominative-plural":"gușteroaicele","dative-genitive-indefinite-singular":"gușteroaice","dative-definite-genitive-singular":"gușteroaicei","dative-genitive-indefinite-plural":"gușteroaice","dative-definite-genitive-plural":"gușteroaicelor","singular-vocative":"gușteroaică","plural-vocative":"gușteroaicelor"}},{"word":"Gusti","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Gusti"}},{"word":"gustos","pos":"adj","definitions":["tasty"],"pronunciation":"/ɡusˈtos/","forms":{"feminine-singular":"gustoasă","masculine-plural":"gustoși","feminine-neuter-plural":"gustoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gustos","error-unrecognized-form-feminine-indefinite-singular":"gustoasă","error-unrecognized-form-indefinite-masculine-plural":"gustoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gustoase","definite-error-unrecognized-form-masculine-neuter-singular":"gustosul","definite-error-unrecognized-form-feminine-singular":"gustoasa","definite-error-unrecognized-form-masculine-plural":"gustoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gustoasele"}},{"word":"gustul","pos":"noun","definitions":["definite nominative/accusative singular of gust"],"pronunciation":"/ˈɡus.tul/","gender":"n"},{"word":"Gusu","pos":"name","definitions":["a village in Ludoș, Sibiu County, Romania"],"gender":"m"},{"word":"gușuliță","pos":"noun","definitions":["diminutive of gușă"],"forms":{"plural":"gușulițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gușuliță","accusative-definite-nominative-singular":"gușulița","accusative-indefinite-nominative-plural":"gușulițe","accusative-definite-nominative-plural":"gușulițele","dative-genitive-indefinite-singular":"gușulițe","dative-definite-genitive-singular":"gușuliței","dative-genitive-indefinite-plural":"gușulițe","dative-definite-genitive-plural":"gușulițelor","singular-vocative":"gușuliță","plural-vocative":"gușulițelor"}},{"word":"guta","pos":"noun","definitions":["definite nominative/accusative singular of gută"],"pronunciation":"[ˈɡuta]","gender":"f"},{"word":"gută","pos":"noun","definitions":["drop, small quantity","paralysis"],"forms":{"plural":"gute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gută","accusative-definite-nominative-singular":"guta","accusative-indefinite-nominative-plural":"gute","accusative-definite-nominative-plural":"gutele","dative-genitive-indefinite-singular":"gute","dative-definite-genitive-singular":"gutei","dative-genitive-indefinite-plural":"gute","dative-definite-genitive-plural":"gutelor","singular-vocative":"gută","plural-vocative":"gutelor"}},{"word":"gută","pos":"noun","definitions":["gout"],"forms":{"plural":"gute","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gută","accusative-definite-nominative-singular":"guta","accusative-indefinite-nominative-plural":"gute","accusative-definite-nominative-plural":"gutele","dative-genitive-indefinite-singular":"gute","dative-definite-genitive-singular":"gutei","dative-genitive-indefinite-plural":"gute","dative-definite-genitive-plural":"gutelor","singular-vocative":"gută","plural-vocative":"gutelor"}},{"word":"Guță","pos":"name","definitions":["a surname"],"gender":"m"},{"word":"gutăie","pos":"noun","definitions":["obsolete form of gutuie"],"forms":{"plural":"gutăi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"gutăie","accusative-definite-nominative-singular":"gutăia","accusative-indefinite-nominative-plural":"gutăi","accusative-definite-nominative-plural":"gutăile","dative-genitive-indefinite-singular":"gutăi","dative-definite-genitive-singular":"gutăii","dative-genitive-indefinite-plural":"gutăi","dative-definite-genitive-plural":"gutăilor","singular-vocative":"gutăie","plural-vocative":"gutăilor"}},{"word":"gutapercă","pos":"noun","definitions":["gutta-percha"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"gutapercă","accusative-definite-nominative":"gutaperca","dative-genitive-indefinite":"gutaperce","dative-definite-genitive":"gutapercei","vocative":"gutapercă"}},{"word":"gutație","pos":"noun","definitions":["guttation"],"forms":{"plural":"gutații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gutație","accusative-definite-nominative-singular":"gutația","accusative-indefinite-nominative-plural":"gutații","accusative-definite-nominative-plural":"gutațiile","dative-genitive-indefinite-singular":"gutații","dative-definite-genitive-singular":"gutației","dative-genitive-indefinite-plural":"gutații","dative-definite-genitive-plural":"gutațiilor","singular-vocative":"gutație","plural-vocative":"gutațiilor"}},{"word":"gute","pos":"noun","definitions":["inflection of gută:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈɡute]","gender":"f-p"},{"word":"Guteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Guteanu"}},{"word":"Guțescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțescu"}},{"word":"Guțică","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guțică"}},{"word":"Gutinaș","pos":"name","definitions":["a village in Ștefan cel Mare, Bacău County, Romania"],"gender":"m"},{"word":"guto","pos":"noun","definitions":["vocative singular of gută"],"pronunciation":"[ˈɡuto]","gender":"f"},{"word":"Guțoae","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțoae"}},{"word":"Guțoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțoaia"}},{"word":"gutoasă","pos":"noun","definitions":["female equivalent of gutos"],"forms":{"plural":"gutoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"gutoasă","accusative-definite-nominative-singular":"gutoasa","accusative-indefinite-nominative-plural":"gutoase","accusative-definite-nominative-plural":"gutoasele","dative-genitive-indefinite-singular":"gutoase","dative-definite-genitive-singular":"gutoasei","dative-genitive-indefinite-plural":"gutoase","dative-definite-genitive-plural":"gutoaselor","singular-vocative":"gutoasă","plural-vocative":"gutoaselor"}},{"word":"Guțoi","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțoi"}},{"word":"Guțoiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțoiu"}},{"word":"gutos","pos":"adj","definitions":["gouty"],"forms":{"feminine-singular":"gutoasă","masculine-plural":"gutoși","feminine-neuter-plural":"gutoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gutos","error-unrecognized-form-feminine-indefinite-singular":"gutoasă","error-unrecognized-form-indefinite-masculine-plural":"gutoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"gutoase","definite-error-unrecognized-form-masculine-neuter-singular":"gutosul","definite-error-unrecognized-form-feminine-singular":"gutoasa","definite-error-unrecognized-form-masculine-plural":"gutoșii","definite-error-unrecognized-form-feminine-neuter-plural":"gutoasele"}},{"word":"gutos","pos":"noun","definitions":["a person suffering from gout"],"forms":{"plural":"gutoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gutos","accusative-definite-nominative-singular":"gutosul","accusative-indefinite-nominative-plural":"gutoși","accusative-definite-nominative-plural":"gutoșii","dative-genitive-indefinite-singular":"gutos","dative-definite-genitive-singular":"gutosului","dative-genitive-indefinite-plural":"gutoși","dative-definite-genitive-plural":"gutoșilor","singular-vocative":"gutosule","plural-vocative":"gutoșilor"}},{"word":"gutui","pos":"noun","definitions":["quince (tree)"],"forms":{"plural":"gutui","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"gutui","accusative-definite-nominative-singular":"gutuiul","accusative-indefinite-nominative-plural":"gutui","accusative-definite-nominative-plural":"gutuii","dative-genitive-indefinite-singular":"gutui","dative-definite-genitive-singular":"gutuiului","dative-genitive-indefinite-plural":"gutui","dative-definite-genitive-plural":"gutuilor","singular-vocative":"gutuiule","plural-vocative":"gutuilor"}},{"word":"gutui japonez","pos":"noun","definitions":["Japanese quince (Chaenomeles japonica)"],"forms":{"plural":"gutui japonezi"}},{"word":"gutuie","pos":"noun","definitions":["quince (fruit)"],"pronunciation":"/ɡuˈtu.je/","forms":{"plural":"gutui","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie-i","accusative-indefinite-nominative-singular":"gutuie","accusative-definite-nominative-singular":"gutuia","accusative-indefinite-nominative-plural":"gutui","accusative-definite-nominative-plural":"gutuile","dative-genitive-indefinite-singular":"gutui","dative-definite-genitive-singular":"gutuii","dative-genitive-indefinite-plural":"gutui","dative-definite-genitive-plural":"gutuilor","singular-vocative":"gutuie","plural-vocative":"gutuilor"}},{"word":"Guțulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Guțulescu"}},{"word":"gutunar","pos":"noun","definitions":["alternative form of guturai"],"forms":{"plural":"gutunare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"gutunar","accusative-definite-nominative-singular":"gutunarul","accusative-indefinite-nominative-plural":"gutunare","accusative-definite-nominative-plural":"gutunarele","dative-genitive-indefinite-singular":"gutunar","dative-definite-genitive-singular":"gutunarului","dative-genitive-indefinite-plural":"gutunare","dative-definite-genitive-plural":"gutunarelor","singular-vocative":"gutunarule","plural-vocative":"gutunarelor"}},{"word":"guturai","pos":"noun","definitions":["a cold","coryza","rheum"],"forms":{"plural":"guturaiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"guturai","accusative-definite-nominative-singular":"guturaiul","accusative-indefinite-nominative-plural":"guturaiuri","accusative-definite-nominative-plural":"guturaiurile","dative-genitive-indefinite-singular":"guturai","dative-definite-genitive-singular":"guturaiului","dative-genitive-indefinite-plural":"guturaiuri","dative-definite-genitive-plural":"guturaiurilor","singular-vocative":"guturaiule","plural-vocative":"guturaiurilor","alternative":"gutunar"}},{"word":"gutural","pos":"adj","definitions":["guttural"],"forms":{"feminine-singular":"guturală","masculine-plural":"guturali","feminine-neuter-plural":"guturale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"gutural","error-unrecognized-form-feminine-indefinite-singular":"guturală","error-unrecognized-form-indefinite-masculine-plural":"guturali","error-unrecognized-form-feminine-indefinite-neuter-plural":"guturale","definite-error-unrecognized-form-masculine-neuter-singular":"guturalul","definite-error-unrecognized-form-feminine-singular":"guturala","definite-error-unrecognized-form-masculine-plural":"guturalii","definite-error-unrecognized-form-feminine-neuter-plural":"guturalele"}},{"word":"guturală","pos":"noun","definitions":["guttural sound"],"forms":{"plural":"guturale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guturală","accusative-definite-nominative-singular":"guturala","accusative-indefinite-nominative-plural":"guturale","accusative-definite-nominative-plural":"guturalele","dative-genitive-indefinite-singular":"guturale","dative-definite-genitive-singular":"guturalei","dative-genitive-indefinite-plural":"guturale","dative-definite-genitive-plural":"guturalelor","singular-vocative":"guturală","plural-vocative":"guturalelor"}},{"word":"guvă","pos":"noun","definitions":["nostril"],"forms":{"plural":"guve"}},{"word":"guvern","pos":"noun","definitions":["government"],"pronunciation":"/ɡuˈvern/","forms":{"plural":"guverne","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guvern","accusative-definite-nominative-singular":"guvernul","accusative-indefinite-nominative-plural":"guverne","accusative-definite-nominative-plural":"guvernele","dative-genitive-indefinite-singular":"guvern","dative-definite-genitive-singular":"guvernului","dative-genitive-indefinite-plural":"guverne","dative-definite-genitive-plural":"guvernelor","singular-vocative":"guvernule","plural-vocative":"guvernelor"}},{"word":"guvern federal","pos":"noun","definitions":["federal government"],"forms":{"plural":"guverne federale"}},{"word":"guverna","pos":"verb","definitions":["to govern"],"forms":{"canonical":"a guverna 1st conjugation","present-singular-third-person":"guvernează","participle-past":"guvernat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a guverna","gerund":"guvernând","first-person-indicative-present-singular":"guvernez","indicative-present-second-person-singular":"guvernezi","indicative-present-singular-third-person":"guvernează","first-person-indicative-plural-present":"guvernăm","indicative-plural-present-second-person":"guvernați","indicative-plural-present-third-person":"guvernează","first-person-imperfect-indicative-singular":"guvernam","imperfect-indicative-second-person-singular":"guvernai","imperfect-indicative-singular-third-person":"guverna","first-person-imperfect-indicative-plural":"guvernam","imperfect-indicative-plural-second-person":"guvernați","imperfect-indicative-plural-third-person":"guvernau","first-person-indicative-perfect-singular":"guvernai","indicative-perfect-second-person-singular":"guvernași","indicative-perfect-singular-third-person":"guvernă","first-person-indicative-perfect-plural":"guvernarăm","indicative-perfect-plural-second-person":"guvernarăți","indicative-perfect-plural-third-person":"guvernară","first-person-indicative-pluperfect-singular":"guvernasem","indicative-pluperfect-second-person-singular":"guvernaseși","indicative-pluperfect-singular-third-person":"guvernase","first-person-indicative-pluperfect-plural":"guvernaserăm","indicative-pluperfect-plural-second-person":"guvernaserăți","indicative-pluperfect-plural-third-person":"guvernaseră","first-person-present-singular-subjunctive":"să guvernez","present-second-person-singular-subjunctive":"să guvernezi","present-singular-subjunctive-third-person":"să guverneze","first-person-plural-present-subjunctive":"să guvernăm","plural-present-second-person-subjunctive":"să guvernați","plural-present-subjunctive-third-person":"să guverneze","imperative-second-person-singular":"guvernează","imperative-plural-second-person":"guvernați","imperative-negative-second-person-singular":"nu guverna","imperative-negative-plural-second-person":"nu guvernați"}},{"word":"guvernabil","pos":"adj","definitions":["governable"],"forms":{"feminine-singular":"guvernabilă","masculine-plural":"guvernabili","feminine-neuter-plural":"guvernabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guvernabil","error-unrecognized-form-feminine-indefinite-singular":"guvernabilă","error-unrecognized-form-indefinite-masculine-plural":"guvernabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"guvernabile","definite-error-unrecognized-form-masculine-neuter-singular":"guvernabilul","definite-error-unrecognized-form-feminine-singular":"guvernabila","definite-error-unrecognized-form-masculine-plural":"guvernabilii","definite-error-unrecognized-form-feminine-neuter-plural":"guvernabilele"}},{"word":"guvernabilitate","pos":"noun","definitions":["governability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"guvernabilitate","accusative-definite-nominative":"guvernabilitatea","dative-genitive-indefinite":"guvernabilități","dative-definite-genitive":"guvernabilității","vocative":"guvernabilitate"}},{"word":"guvernământ","pos":"noun","definitions":["government"],"forms":{"plural":"guvernăminte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guvernământ","accusative-definite-nominative-singular":"guvernământul","accusative-indefinite-nominative-plural":"guvernăminte","accusative-definite-nominative-plural":"guvernămintele","dative-genitive-indefinite-singular":"guvernământ","dative-definite-genitive-singular":"guvernământului","dative-genitive-indefinite-plural":"guvernăminte","dative-definite-genitive-plural":"guvernămintelor","singular-vocative":"guvernământule","plural-vocative":"guvernămintelor"}},{"word":"guvernamental","pos":"adj","definitions":["governmental"],"pronunciation":"/ˌɡu.ver.na.menˈtal/","forms":{"feminine-singular":"guvernamentală","masculine-plural":"guvernamentali","feminine-neuter-plural":"guvernamentale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"guvernamental","error-unrecognized-form-feminine-indefinite-singular":"guvernamentală","error-unrecognized-form-indefinite-masculine-plural":"guvernamentali","error-unrecognized-form-feminine-indefinite-neuter-plural":"guvernamentale","definite-error-unrecognized-form-masculine-neuter-singular":"guvernamentalul","definite-error-unrecognized-form-feminine-singular":"guvernamentala","definite-error-unrecognized-form-masculine-plural":"guvernamentalii","definite-error-unrecognized-form-feminine-neuter-plural":"guvernamentalele"}},{"word":"guvernamentalism","pos":"noun","definitions":["governmentalism"],"forms":{"plural":"guvernamentalisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guvernamentalism","accusative-definite-nominative-singular":"guvernamentalismul","accusative-indefinite-nominative-plural":"guvernamentalisme","accusative-definite-nominative-plural":"guvernamentalismele","dative-genitive-indefinite-singular":"guvernamentalism","dative-definite-genitive-singular":"guvernamentalismului","dative-genitive-indefinite-plural":"guvernamentalisme","dative-definite-genitive-plural":"guvernamentalismelor","singular-vocative":"guvernamentalismule","plural-vocative":"guvernamentalismelor"}},{"word":"guvernant","pos":"adj","definitions":["governing"],"pronunciation":"/ɡu.verˈnant/","forms":{"feminine-singular":"guvernantă","masculine-plural":"guvernanți","feminine-neuter-plural":"guvernante","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"guvernant","error-unrecognized-form-feminine-indefinite-singular":"guvernantă","error-unrecognized-form-indefinite-masculine-plural":"guvernanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"guvernante","definite-error-unrecognized-form-masculine-neuter-singular":"guvernantul","definite-error-unrecognized-form-feminine-singular":"guvernanta","definite-error-unrecognized-form-masculine-plural":"guvernanții","definite-error-unrecognized-form-feminine-neuter-plural":"guvernantele"}},{"word":"guvernant","pos":"noun","definitions":["governor"],"pronunciation":"/ɡu.verˈnant/","forms":{"plural":"guvernanți","feminine":"equivalent guvernantă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guvernant","accusative-definite-nominative-singular":"guvernantul","accusative-indefinite-nominative-plural":"guvernanți","accusative-definite-nominative-plural":"guvernanții","dative-genitive-indefinite-singular":"guvernant","dative-definite-genitive-singular":"guvernantului","dative-genitive-indefinite-plural":"guvernanți","dative-definite-genitive-plural":"guvernanților","singular-vocative":"guvernantule","plural-vocative":"guvernanților"}},{"word":"guvernantă","pos":"noun","definitions":["governess (woman paid to educate children in their own home)"],"pronunciation":"/ɡu.verˈnan.tə/","forms":{"plural":"guvernante","masculine":"equivalent guvernor","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"guvernantă","accusative-definite-nominative-singular":"guvernanta","accusative-indefinite-nominative-plural":"guvernante","accusative-definite-nominative-plural":"guvernantele","dative-genitive-indefinite-singular":"guvernante","dative-definite-genitive-singular":"guvernantei","dative-genitive-indefinite-plural":"guvernante","dative-definite-genitive-plural":"guvernantelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"guvernantă","pos":"adj","definitions":["nominative/accusative feminine singular of guvernant"],"pronunciation":"/ɡu.verˈnan.tə/"},{"word":"guvernanță","pos":"noun","definitions":["governance"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"guvernanță","accusative-definite-nominative":"guvernanța","dative-genitive-indefinite":"guvernanțe","dative-definite-genitive":"guvernanței","vocative":"guvernanță"}},{"word":"guvernante","pos":"noun","definitions":["plural of guvernantă"],"pronunciation":"/ˌɡuverˈnante/","gender":"f"},{"word":"guvernante","pos":"adj","definitions":["nominative/accusative feminine/neuter plural of guvernant"],"pronunciation":"/ˌɡuverˈnante/"},{"word":"guvernanți","pos":"noun","definitions":["plural of guvernant"],"pronunciation":"/ˌɡuverˈnant͡sʲ/","gender":"m"},{"word":"guvernanți","pos":"adj","definitions":["nominative/accusative masculine plural of guvernant"],"pronunciation":"/ˌɡuverˈnant͡sʲ/"},{"word":"guvernare","pos":"noun","definitions":["governance"],"forms":{"plural":"guvernări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"guvernare","accusative-definite-nominative-singular":"guvernarea","accusative-indefinite-nominative-plural":"guvernări","accusative-definite-nominative-plural":"guvernările","dative-genitive-indefinite-singular":"guvernări","dative-definite-genitive-singular":"guvernării","dative-genitive-indefinite-plural":"guvernări","dative-definite-genitive-plural":"guvernărilor","singular-vocative":"guvernare","plural-vocative":"guvernărilor"}},{"word":"guvernat","pos":"adj","definitions":["governed"],"forms":{"feminine-singular":"guvernată","masculine-plural":"guvernați","feminine-neuter-plural":"guvernate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guvernat","error-unrecognized-form-feminine-indefinite-singular":"guvernată","error-unrecognized-form-indefinite-masculine-plural":"guvernați","error-unrecognized-form-feminine-indefinite-neuter-plural":"guvernate","definite-error-unrecognized-form-masculine-neuter-singular":"guvernatul","definite-error-unrecognized-form-feminine-singular":"guvernata","definite-error-unrecognized-form-masculine-plural":"guvernații","definite-error-unrecognized-form-feminine-neuter-plural":"guvernatele"}},{"word":"guvernat","pos":"verb","definitions":["past participle of guverna"],"forms":{"participle-past":"of guverna"}},{"word":"guvernator","pos":"noun","definitions":["governor"],"forms":{"plural":"guvernatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guvernator","accusative-definite-nominative-singular":"guvernatorul","accusative-indefinite-nominative-plural":"guvernatori","accusative-definite-nominative-plural":"guvernatorii","dative-genitive-indefinite-singular":"guvernator","dative-definite-genitive-singular":"guvernatorului","dative-genitive-indefinite-plural":"guvernatori","dative-definite-genitive-plural":"guvernatorilor","singular-vocative":"guvernatorule","plural-vocative":"guvernatorilor"}},{"word":"guvernator general","pos":"noun","definitions":["governor general, governor-general"],"forms":{"plural":"guvernatori-generali"}},{"word":"guvernatorat","pos":"noun","definitions":["governorate"],"forms":{"plural":"guvernatorate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"guvernatorat","accusative-definite-nominative-singular":"guvernatoratul","accusative-indefinite-nominative-plural":"guvernatorate","accusative-definite-nominative-plural":"guvernatoratele","dative-genitive-indefinite-singular":"guvernatorat","dative-definite-genitive-singular":"guvernatoratului","dative-genitive-indefinite-plural":"guvernatorate","dative-definite-genitive-plural":"guvernatoratelor","singular-vocative":"guvernatoratule","plural-vocative":"guvernatoratelor"}},{"word":"guverne","pos":"noun","definitions":["plural of guvern"],"gender":"n-p"},{"word":"guvernial","pos":"adj","definitions":["governmental"],"forms":{"feminine-singular":"guvernială","masculine-plural":"guverniali","feminine-neuter-plural":"guverniale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guvernial","error-unrecognized-form-feminine-indefinite-singular":"guvernială","error-unrecognized-form-indefinite-masculine-plural":"guverniali","error-unrecognized-form-feminine-indefinite-neuter-plural":"guverniale","definite-error-unrecognized-form-masculine-neuter-singular":"guvernialul","definite-error-unrecognized-form-feminine-singular":"guverniala","definite-error-unrecognized-form-masculine-plural":"guvernialii","definite-error-unrecognized-form-feminine-neuter-plural":"guvernialele"}},{"word":"guvernor","pos":"noun","definitions":["governor"],"forms":{"plural":"guvernori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guvernor","accusative-definite-nominative-singular":"guvernorul","accusative-indefinite-nominative-plural":"guvernori","accusative-definite-nominative-plural":"guvernorii","dative-genitive-indefinite-singular":"guvernor","dative-definite-genitive-singular":"guvernorului","dative-genitive-indefinite-plural":"guvernori","dative-definite-genitive-plural":"guvernorilor","singular-vocative":"guvernorule","plural-vocative":"guvernorilor"}},{"word":"guvid","pos":"noun","definitions":["goby"],"forms":{"plural":"guvizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guvid","accusative-definite-nominative-singular":"guvidul","accusative-indefinite-nominative-plural":"guvizi","accusative-definite-nominative-plural":"guvizii","dative-genitive-indefinite-singular":"guvid","dative-definite-genitive-singular":"guvidului","dative-genitive-indefinite-plural":"guvizi","dative-definite-genitive-plural":"guvizilor","singular-vocative":"guvidule","plural-vocative":"guvizilor"}},{"word":"guvizi","pos":"noun","definitions":["plural of guvid"]},{"word":"guyanez","pos":"adj","definitions":["Guyanese"],"forms":{"feminine-singular":"guyaneză","masculine-plural":"guyanezi","feminine-neuter-plural":"guyaneze","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"guyanez","error-unrecognized-form-feminine-indefinite-singular":"guyaneză","error-unrecognized-form-indefinite-masculine-plural":"guyanezi","error-unrecognized-form-feminine-indefinite-neuter-plural":"guyaneze","definite-error-unrecognized-form-masculine-neuter-singular":"guyanezul","definite-error-unrecognized-form-feminine-singular":"guyaneza","definite-error-unrecognized-form-masculine-plural":"guyanezii","definite-error-unrecognized-form-feminine-neuter-plural":"guyanezele"}},{"word":"guyanez","pos":"noun","definitions":["Guyanese"],"forms":{"plural":"guyanezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guyanez","accusative-definite-nominative-singular":"guyanezul","accusative-indefinite-nominative-plural":"guyanezi","accusative-definite-nominative-plural":"guyanezii","dative-genitive-indefinite-singular":"guyanez","dative-definite-genitive-singular":"guyanezului","dative-genitive-indefinite-plural":"guyanezi","dative-definite-genitive-plural":"guyanezilor","singular-vocative":"guyanezule","plural-vocative":"guyanezilor"}},{"word":"guyaneză","pos":"noun","definitions":["female equivalent of guyanez"],"forms":{"plural":"guyaneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guyaneză","accusative-definite-nominative-singular":"guyaneza","accusative-indefinite-nominative-plural":"guyaneze","accusative-definite-nominative-plural":"guyanezele","dative-genitive-indefinite-singular":"guyaneze","dative-definite-genitive-singular":"guyanezei","dative-genitive-indefinite-plural":"guyaneze","dative-definite-genitive-plural":"guyanezelor","singular-vocative":"guyaneză","plural-vocative":"guyanezelor"}},{"word":"guză","pos":"noun","definitions":["wound"],"forms":{"plural":"guze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guză","accusative-definite-nominative-singular":"guza","accusative-indefinite-nominative-plural":"guze","accusative-definite-nominative-plural":"guzele","dative-genitive-indefinite-singular":"guze","dative-definite-genitive-singular":"guzei","dative-genitive-indefinite-plural":"guze","dative-definite-genitive-plural":"guzelor","singular-vocative":"guză","plural-vocative":"guzelor"}},{"word":"Guzgan","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guzgan"}},{"word":"guzgan","pos":"noun","definitions":["rat"],"forms":{"plural":"guzgani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guzgan","accusative-definite-nominative-singular":"guzganul","accusative-indefinite-nominative-plural":"guzgani","accusative-definite-nominative-plural":"guzganii","dative-genitive-indefinite-singular":"guzgan","dative-definite-genitive-singular":"guzganului","dative-genitive-indefinite-plural":"guzgani","dative-definite-genitive-plural":"guzganilor","singular-vocative":"guzganule","plural-vocative":"guzganilor"}},{"word":"Guzganu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Guzganu"}},{"word":"guzlă","pos":"noun","definitions":["gusle"],"forms":{"plural":"guzle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"guzlă","accusative-definite-nominative-singular":"guzla","accusative-indefinite-nominative-plural":"guzle","accusative-definite-nominative-plural":"guzlele","dative-genitive-indefinite-singular":"guzle","dative-definite-genitive-singular":"guzlei","dative-genitive-indefinite-plural":"guzle","dative-definite-genitive-plural":"guzlelor","singular-vocative":"guzlă","plural-vocative":"guzlelor"}},{"word":"guzuroi","pos":"noun","definitions":["mole"],"forms":{"plural":"guruzoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"guzuroi","accusative-definite-nominative-singular":"guzuroiul","accusative-indefinite-nominative-plural":"guruzoi","accusative-definite-nominative-plural":"guruzoii","dative-genitive-indefinite-singular":"guzuroi","dative-definite-genitive-singular":"guzuroiului","dative-genitive-indefinite-plural":"guruzoi","dative-definite-genitive-plural":"guruzoilor","singular-vocative":"guzuroiule","plural-vocative":"guruzoilor"}},{"word":"gvalt","pos":"noun","definitions":["violence, force"],"forms":{"plural":"gvalturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"gvalt","accusative-definite-nominative-singular":"gvaltul","accusative-indefinite-nominative-plural":"gvalturi","accusative-definite-nominative-plural":"gvalturile","dative-genitive-indefinite-singular":"gvalt","dative-definite-genitive-singular":"gvaltului","dative-genitive-indefinite-plural":"gvalturi","dative-definite-genitive-plural":"gvalturilor","singular-vocative":"gvaltule","plural-vocative":"gvalturilor"}},{"word":"gvardie","pos":"noun","definitions":["obsolete form of gardă"],"forms":{"plural":"gvardii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"gvardie","accusative-definite-nominative-singular":"gvardia","accusative-indefinite-nominative-plural":"gvardii","accusative-definite-nominative-plural":"gvardiile","dative-genitive-indefinite-singular":"gvardii","dative-definite-genitive-singular":"gvardiei","dative-genitive-indefinite-plural":"gvardii","dative-definite-genitive-plural":"gvardiilor","singular-vocative":"gvardie","plural-vocative":"gvardiilor"}},{"word":"Gvozdova","pos":"name","definitions":["a village in Gura Camencii, Florești Raion, Moldova"],"gender":"f"}];
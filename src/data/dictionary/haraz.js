@@ -0,0 +1 @@
+export default [{"word":"hărăzeală","pos":"noun","definitions":["donation"],"forms":{"plural":"hărăzeli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hărăzeală","accusative-definite-nominative-singular":"hărăzeala","accusative-indefinite-nominative-plural":"hărăzele","accusative-definite-nominative-plural":"hărăzelele","dative-genitive-indefinite-singular":"hărăzele","dative-definite-genitive-singular":"hărăzelei","dative-genitive-indefinite-plural":"hărăzele","dative-definite-genitive-plural":"hărăzelelor","singular-vocative":"hărăzeală","plural-vocative":"hărăzelelor"}},{"word":"hărăzi","pos":"verb","definitions":["to intend, to decide in advance","to preordain by divine will or fate"],"forms":{"canonical":"a hărăzi 4th conjugation","present-singular-third-person":"hărăzește","participle-past":"hărăzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hărăzi","gerund":"hărăzind","first-person-indicative-present-singular":"hărăzesc","indicative-present-second-person-singular":"hărăzești","indicative-present-singular-third-person":"hărăzește","first-person-indicative-plural-present":"hărăzim","indicative-plural-present-second-person":"hărăziți","indicative-plural-present-third-person":"hărăzesc","first-person-imperfect-indicative-singular":"hărăzeam","imperfect-indicative-second-person-singular":"hărăzeai","imperfect-indicative-singular-third-person":"hărăzea","first-person-imperfect-indicative-plural":"hărăzeam","imperfect-indicative-plural-second-person":"hărăzeați","imperfect-indicative-plural-third-person":"hărăzeau","first-person-indicative-perfect-singular":"hărăzii","indicative-perfect-second-person-singular":"hărăziși","indicative-perfect-singular-third-person":"hărăzi","first-person-indicative-perfect-plural":"hărăzirăm","indicative-perfect-plural-second-person":"hărăzirăți","indicative-perfect-plural-third-person":"hărăziră","first-person-indicative-pluperfect-singular":"hărăzisem","indicative-pluperfect-second-person-singular":"hărăziseși","indicative-pluperfect-singular-third-person":"hărăzise","first-person-indicative-pluperfect-plural":"hărăziserăm","indicative-pluperfect-plural-second-person":"hărăziserăți","indicative-pluperfect-plural-third-person":"hărăziseră","first-person-present-singular-subjunctive":"să hărăzesc","present-second-person-singular-subjunctive":"să hărăzești","present-singular-subjunctive-third-person":"să hărăzească","first-person-plural-present-subjunctive":"să hărăzim","plural-present-second-person-subjunctive":"să hărăziți","plural-present-subjunctive-third-person":"să hărăzească","imperative-second-person-singular":"hărăzește","imperative-plural-second-person":"hărăziți","imperative-negative-second-person-singular":"nu hărăzi","imperative-negative-plural-second-person":"nu hărăziți"}},{"word":"hărăzire","pos":"noun","definitions":["fate"],"forms":{"plural":"hărăziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hărăzire","accusative-definite-nominative-singular":"hărăzirea","accusative-indefinite-nominative-plural":"hărăziri","accusative-definite-nominative-plural":"hărăzirile","dative-genitive-indefinite-singular":"hărăziri","dative-definite-genitive-singular":"hărăzirii","dative-genitive-indefinite-plural":"hărăziri","dative-definite-genitive-plural":"hărăzirilor","singular-vocative":"hărăzire","plural-vocative":"hărăzirilor"}},{"word":"hărăzit","pos":"adj","definitions":["destined"],"forms":{"feminine-singular":"hărăzită","masculine-plural":"hărăziți","feminine-neuter-plural":"hărăzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărăzit","error-unrecognized-form-feminine-indefinite-singular":"hărăzită","error-unrecognized-form-indefinite-masculine-plural":"hărăziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărăzite","definite-error-unrecognized-form-masculine-neuter-singular":"hărăzitul","definite-error-unrecognized-form-feminine-singular":"hărăzita","definite-error-unrecognized-form-masculine-plural":"hărăziții","definite-error-unrecognized-form-feminine-neuter-plural":"hărăzitele"}},{"word":"hârb","pos":"noun","definitions":["a shard, broken pottery","a worthless thing, such as an old car"],"forms":{"plural":"hârburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hârb","accusative-definite-nominative-singular":"hârbul","accusative-indefinite-nominative-plural":"hârburi","accusative-definite-nominative-plural":"hârburile","dative-genitive-indefinite-singular":"hârb","dative-definite-genitive-singular":"hârbului","dative-genitive-indefinite-plural":"hârburi","dative-definite-genitive-plural":"hârburilor","singular-vocative":"hârbule","plural-vocative":"hârburilor"}},{"word":"hârbar","pos":"adj","definitions":["stray (about dogs)"],"forms":{"feminine-singular":"hârbară","masculine-plural":"hârbari","feminine-neuter-plural":"hârbare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârbar","error-unrecognized-form-feminine-indefinite-singular":"hârbară","error-unrecognized-form-indefinite-masculine-plural":"hârbari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârbare","definite-error-unrecognized-form-masculine-neuter-singular":"hârbarul","definite-error-unrecognized-form-feminine-singular":"hârbara","definite-error-unrecognized-form-masculine-plural":"hârbarii","definite-error-unrecognized-form-feminine-neuter-plural":"hârbarele"}},{"word":"Hârboca","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Câlnău"],"gender":"f"},{"word":"hârboi","pos":"noun","definitions":["augmentative of hârb"],"forms":{"plural":"hârboaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârboi","accusative-definite-nominative-singular":"hârboiul","accusative-indefinite-nominative-plural":"hârboaie","accusative-definite-nominative-plural":"hârboaiele","dative-genitive-indefinite-singular":"hârboi","dative-definite-genitive-singular":"hârboiului","dative-genitive-indefinite-plural":"hârboaie","dative-definite-genitive-plural":"hârboaielor","singular-vocative":"hârboiule","plural-vocative":"hârboaielor"}},{"word":"hârbui","pos":"verb","definitions":["to wreak, destroy"],"pronunciation":"/hɨr.buˈi/","forms":{"canonical":"a hârbui 4th conjugation","present-singular-third-person":"hârbuiește","participle-past":"hârbuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hârbui","gerund":"hârbuind","first-person-indicative-present-singular":"hârbuiesc","indicative-present-second-person-singular":"hârbuiești","indicative-present-singular-third-person":"hârbuiește","first-person-indicative-plural-present":"hârbuim","indicative-plural-present-second-person":"hârbuiți","indicative-plural-present-third-person":"hârbuiesc","first-person-imperfect-indicative-singular":"hârbuiam","imperfect-indicative-second-person-singular":"hârbuiai","imperfect-indicative-singular-third-person":"hârbuia","first-person-imperfect-indicative-plural":"hârbuiam","imperfect-indicative-plural-second-person":"hârbuiați","imperfect-indicative-plural-third-person":"hârbuiau","first-person-indicative-perfect-singular":"hârbuii","indicative-perfect-second-person-singular":"hârbuiși","indicative-perfect-singular-third-person":"hârbui","first-person-indicative-perfect-plural":"hârbuirăm","indicative-perfect-plural-second-person":"hârbuirăți","indicative-perfect-plural-third-person":"hârbuiră","first-person-indicative-pluperfect-singular":"hârbuisem","indicative-pluperfect-second-person-singular":"hârbuiseși","indicative-pluperfect-singular-third-person":"hârbuise","first-person-indicative-pluperfect-plural":"hârbuiserăm","indicative-pluperfect-plural-second-person":"hârbuiserăți","indicative-pluperfect-plural-third-person":"hârbuiseră","first-person-present-singular-subjunctive":"să hârbuiesc","present-second-person-singular-subjunctive":"să hârbuiești","present-singular-subjunctive-third-person":"să hârbuiască","first-person-plural-present-subjunctive":"să hârbuim","plural-present-second-person-subjunctive":"să hârbuiți","plural-present-subjunctive-third-person":"să hârbuiască","imperative-second-person-singular":"hârbuiește","imperative-plural-second-person":"hârbuiți","imperative-negative-second-person-singular":"nu hârbui","imperative-negative-plural-second-person":"nu hârbuiți"}},{"word":"hârbuire","pos":"noun","definitions":["degradation"],"forms":{"plural":"hârbuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hârbuire","accusative-definite-nominative-singular":"hârbuirea","accusative-indefinite-nominative-plural":"hârbuiri","accusative-definite-nominative-plural":"hârbuirile","dative-genitive-indefinite-singular":"hârbuiri","dative-definite-genitive-singular":"hârbuirii","dative-genitive-indefinite-plural":"hârbuiri","dative-definite-genitive-plural":"hârbuirilor","singular-vocative":"hârbuire","plural-vocative":"hârbuirilor"}},{"word":"harbujel","pos":"noun","definitions":["diminutive of harbuz"],"forms":{"plural":"harbujei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harbujel","accusative-definite-nominative-singular":"harbujelul","accusative-indefinite-nominative-plural":"harbujei","accusative-definite-nominative-plural":"harbujeii","dative-genitive-indefinite-singular":"harbujel","dative-definite-genitive-singular":"harbujelului","dative-genitive-indefinite-plural":"harbujei","dative-definite-genitive-plural":"harbujeilor","singular-vocative":"harbujelule","plural-vocative":"harbujeilor"}},{"word":"harbuji","pos":"noun","definitions":["plural of harbuz"]},{"word":"hârbușor","pos":"noun","definitions":["diminutive of hârb"],"forms":{"plural":"hârbușoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârbușor","accusative-definite-nominative-singular":"hârbușorul","accusative-indefinite-nominative-plural":"hârbușoare","accusative-definite-nominative-plural":"hârbușoarele","dative-genitive-indefinite-singular":"hârbușor","dative-definite-genitive-singular":"hârbușorului","dative-genitive-indefinite-plural":"hârbușoare","dative-definite-genitive-plural":"hârbușoarelor","singular-vocative":"hârbușorule","plural-vocative":"hârbușoarelor"}},{"word":"hârbuț","pos":"noun","definitions":["diminutive of hârb"],"forms":{"plural":"hârbuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârbuț","accusative-definite-nominative-singular":"hârbuțul","accusative-indefinite-nominative-plural":"hârbuțe","accusative-definite-nominative-plural":"hârbuțele","dative-genitive-indefinite-singular":"hârbuț","dative-definite-genitive-singular":"hârbuțului","dative-genitive-indefinite-plural":"hârbuțe","dative-definite-genitive-plural":"hârbuțelor","singular-vocative":"hârbuțule","plural-vocative":"hârbuțelor"}},{"word":"Harbuz","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Harbuz"}},{"word":"harbuz","pos":"noun","definitions":["watermelon"],"pronunciation":"/harˈbuz/","forms":{"plural":"harbuji","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harbuz","accusative-definite-nominative-singular":"harbuzul","accusative-indefinite-nominative-plural":"harbuji","accusative-definite-nominative-plural":"harbujii","dative-genitive-indefinite-singular":"harbuz","dative-definite-genitive-singular":"harbuzului","dative-genitive-indefinite-plural":"harbuji","dative-definite-genitive-plural":"harbujilor","singular-vocative":"harbuzule","plural-vocative":"harbujilor","alternative":"arbuz"}},{"word":"harbuzărie","pos":"noun","definitions":["melon field"],"forms":{"plural":"harbuzării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"harbuzărie","accusative-definite-nominative-singular":"harbuzăria","accusative-indefinite-nominative-plural":"harbuzării","accusative-definite-nominative-plural":"harbuzăriile","dative-genitive-indefinite-singular":"harbuzării","dative-definite-genitive-singular":"harbuzăriei","dative-genitive-indefinite-plural":"harbuzării","dative-definite-genitive-plural":"harbuzăriilor","singular-vocative":"harbuzărie","plural-vocative":"harbuzăriilor"}},{"word":"Harbuzariu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Harbuzariu"}},{"word":"Harbuzaru","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Harbuzaru"}},{"word":"hârcă","pos":"noun","definitions":["skull","old woman, hag"],"forms":{"plural":"hârci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hârcă","accusative-definite-nominative-singular":"hârca","accusative-indefinite-nominative-plural":"hârci","accusative-definite-nominative-plural":"hârcile","dative-genitive-indefinite-singular":"hârci","dative-definite-genitive-singular":"hârcii","dative-genitive-indefinite-plural":"hârci","dative-definite-genitive-plural":"hârcilor","singular-vocative":"hârcă","plural-vocative":"hârcilor"}},{"word":"hârcăi","pos":"verb","definitions":["to alternative form of hârcâi"],"forms":{"canonical":"a hârcăi 4th conjugation","present-singular-third-person":"hârcăie","participle-past":"hârcăit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hârcăi","gerund":"hârcăind","first-person-indicative-present-singular":"hârcăi","indicative-present-second-person-singular":"hârcăi","indicative-present-singular-third-person":"hârcăie","first-person-indicative-plural-present":"hârcăim","indicative-plural-present-second-person":"hârcăiți","indicative-plural-present-third-person":"hârcăie","first-person-imperfect-indicative-singular":"hârcăiam","imperfect-indicative-second-person-singular":"hârcăiai","imperfect-indicative-singular-third-person":"hârcăia","first-person-imperfect-indicative-plural":"hârcăiam","imperfect-indicative-plural-second-person":"hârcăiați","imperfect-indicative-plural-third-person":"hârcăiau","first-person-indicative-perfect-singular":"hârcăii","indicative-perfect-second-person-singular":"hârcăiși","indicative-perfect-singular-third-person":"hârcăi","first-person-indicative-perfect-plural":"hârcăirăm","indicative-perfect-plural-second-person":"hârcăirăți","indicative-perfect-plural-third-person":"hârcăiră","first-person-indicative-pluperfect-singular":"hârcăisem","indicative-pluperfect-second-person-singular":"hârcăiseși","indicative-pluperfect-singular-third-person":"hârcăise","first-person-indicative-pluperfect-plural":"hârcăiserăm","indicative-pluperfect-plural-second-person":"hârcăiserăți","indicative-pluperfect-plural-third-person":"hârcăiseră","first-person-present-singular-subjunctive":"să hârcăi","present-second-person-singular-subjunctive":"să hârcăi","present-singular-subjunctive-third-person":"să hârcăie","first-person-plural-present-subjunctive":"să hârcăim","plural-present-second-person-subjunctive":"să hârcăiți","plural-present-subjunctive-third-person":"să hârcăie","imperative-second-person-singular":"hârcăie","imperative-plural-second-person":"hârcăiți","imperative-negative-second-person-singular":"nu hârcăi","imperative-negative-plural-second-person":"nu hârcăiți"}},{"word":"hărcăit","pos":"noun","definitions":["alternative form of hârcâit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hărcăit","accusative-definite-nominative":"hărcăitul","dative-genitive-indefinite":"hărcăit","dative-definite-genitive":"hărcăitului","vocative":"hărcăitule"}},{"word":"hărcăti","pos":"verb","definitions":["to alternative form of hărhăti"],"forms":{"canonical":"a hărcăti 4th conjugation","present-singular-third-person":"hărcătește","participle-past":"hărcătit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hărcăti","gerund":"hărcătind","first-person-indicative-present-singular":"hărcătesc","indicative-present-second-person-singular":"hărcătești","indicative-present-singular-third-person":"hărcătește","first-person-indicative-plural-present":"hărcătim","indicative-plural-present-second-person":"hărcătiți","indicative-plural-present-third-person":"hărcătesc","first-person-imperfect-indicative-singular":"hărcăteam","imperfect-indicative-second-person-singular":"hărcăteai","imperfect-indicative-singular-third-person":"hărcătea","first-person-imperfect-indicative-plural":"hărcăteam","imperfect-indicative-plural-second-person":"hărcăteați","imperfect-indicative-plural-third-person":"hărcăteau","first-person-indicative-perfect-singular":"hărcătii","indicative-perfect-second-person-singular":"hărcătiși","indicative-perfect-singular-third-person":"hărcăti","first-person-indicative-perfect-plural":"hărcătirăm","indicative-perfect-plural-second-person":"hărcătirăți","indicative-perfect-plural-third-person":"hărcătiră","first-person-indicative-pluperfect-singular":"hărcătisem","indicative-pluperfect-second-person-singular":"hărcătiseși","indicative-pluperfect-singular-third-person":"hărcătise","first-person-indicative-pluperfect-plural":"hărcătiserăm","indicative-pluperfect-plural-second-person":"hărcătiserăți","indicative-pluperfect-plural-third-person":"hărcătiseră","first-person-present-singular-subjunctive":"să hărcătesc","present-second-person-singular-subjunctive":"să hărcătești","present-singular-subjunctive-third-person":"să hărcătească","first-person-plural-present-subjunctive":"să hărcătim","plural-present-second-person-subjunctive":"să hărcătiți","plural-present-subjunctive-third-person":"să hărcătească","imperative-second-person-singular":"hărcătește","imperative-plural-second-person":"hărcătiți","imperative-negative-second-person-singular":"nu hărcăti","imperative-negative-plural-second-person":"nu hărcătiți"}},{"word":"hârcav","pos":"adj","definitions":["stuttering"],"forms":{"feminine-singular":"hârcavă","masculine-plural":"hârcavi","feminine-neuter-plural":"hârcave","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârcav","error-unrecognized-form-feminine-indefinite-singular":"hârcavă","error-unrecognized-form-indefinite-masculine-plural":"hârcavi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârcave","definite-error-unrecognized-form-masculine-neuter-singular":"hârcavul","definite-error-unrecognized-form-feminine-singular":"hârcava","definite-error-unrecognized-form-masculine-plural":"hârcavii","definite-error-unrecognized-form-feminine-neuter-plural":"hârcavele"}},{"word":"Hârciog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hârciog"}},{"word":"hârciog","pos":"noun","definitions":["European hamster (Cricetus cricetus)","any hamster"],"pronunciation":"/hɨrˈt͡ʃʲoɡ/","forms":{"plural":"hârciogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârciog","accusative-definite-nominative-singular":"hârciogul","accusative-indefinite-nominative-plural":"hârciogi","accusative-definite-nominative-plural":"hârciogii","dative-genitive-indefinite-singular":"hârciog","dative-definite-genitive-singular":"hârciogului","dative-genitive-indefinite-plural":"hârciogi","dative-definite-genitive-plural":"hârciogilor","singular-vocative":"hârciogule","plural-vocative":"hârciogilor"}},{"word":"hard disk","pos":"noun","definitions":["hard disk, hard drive"],"forms":{"plural":"hard discuri"}},{"word":"hârdăiaș","pos":"noun","definitions":["diminutive of hârdău; small bucket"],"forms":{"plural":"hârdăiașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârdăiaș","accusative-definite-nominative-singular":"hârdăiașul","accusative-indefinite-nominative-plural":"hârdăiașe","accusative-definite-nominative-plural":"hârdăiașele","dative-genitive-indefinite-singular":"hârdăiaș","dative-definite-genitive-singular":"hârdăiașului","dative-genitive-indefinite-plural":"hârdăiașe","dative-definite-genitive-plural":"hârdăiașelor","singular-vocative":"hârdăiașule","plural-vocative":"hârdăiașelor"}},{"word":"hârdăior","pos":"noun","definitions":["diminutive of hârdău"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârdăior","accusative-definite-nominative":"hârdăiorul","dative-genitive-indefinite":"hârdăior","dative-definite-genitive":"hârdăiorului","vocative":"hârdăiorule"}},{"word":"hârdău","pos":"noun","definitions":["large bucket, cask"],"forms":{"plural":"hârdaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârdău","accusative-definite-nominative-singular":"hârdăul","accusative-indefinite-nominative-plural":"hârdaie","accusative-definite-nominative-plural":"hârdaiele","dative-genitive-indefinite-singular":"hârdău","dative-definite-genitive-singular":"hârdăului","dative-genitive-indefinite-plural":"hârdaie","dative-definite-genitive-plural":"hârdaielor","singular-vocative":"hârdăule","plural-vocative":"hârdaielor"}},{"word":"hârdăuț","pos":"noun","definitions":["diminutive of hărdău"],"forms":{"plural":"hârdăuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârdăuț","accusative-definite-nominative-singular":"hârdăuțul","accusative-indefinite-nominative-plural":"hârdăuțe","accusative-definite-nominative-plural":"hârdăuțele","dative-genitive-indefinite-singular":"hârdăuț","dative-definite-genitive-singular":"hârdăuțului","dative-genitive-indefinite-plural":"hârdăuțe","dative-definite-genitive-plural":"hârdăuțelor","singular-vocative":"hârdăuțule","plural-vocative":"hârdăuțelor"}},{"word":"hardware","pos":"noun","definitions":["hardware"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hardware","accusative-definite-nominative":"hardwareul","dative-genitive-indefinite":"hardware","dative-definite-genitive":"hardwareului","vocative":"hardwareule"}},{"word":"harem","pos":"noun","definitions":["harem"],"forms":{"plural":"haremuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"harem","accusative-definite-nominative-singular":"haremul","accusative-indefinite-nominative-plural":"haremuri","accusative-definite-nominative-plural":"haremurile","dative-genitive-indefinite-singular":"harem","dative-definite-genitive-singular":"haremului","dative-genitive-indefinite-plural":"haremuri","dative-definite-genitive-plural":"haremurilor","singular-vocative":"haremule","plural-vocative":"haremurilor","alternative":"харем"}},{"word":"harfa","pos":"noun","definitions":["definite nominative/accusative singular of harfă"],"pronunciation":"[ˈharfa]","gender":"f"},{"word":"harfă","pos":"noun","definitions":["alternative form of harpă"],"pronunciation":"/ˈhar.fə/","forms":{"plural":"harfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harfă","accusative-definite-nominative-singular":"harfa","accusative-indefinite-nominative-plural":"harfe","accusative-definite-nominative-plural":"harfele","dative-genitive-indefinite-singular":"harfe","dative-definite-genitive-singular":"harfei","dative-genitive-indefinite-plural":"harfe","dative-definite-genitive-plural":"harfelor","singular-vocative":"harfă","plural-vocative":"harfelor"}},{"word":"harfe","pos":"noun","definitions":["inflection of harfă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈharfe]","gender":"f-p"},{"word":"harfonistă","pos":"noun","definitions":["variety show actress."],"forms":{"plural":"harfoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harfonistă","accusative-definite-nominative-singular":"harfonista","accusative-indefinite-nominative-plural":"harfoniste","accusative-definite-nominative-plural":"harfonistele","dative-genitive-indefinite-singular":"harfoniste","dative-definite-genitive-singular":"harfonistei","dative-genitive-indefinite-plural":"harfoniste","dative-definite-genitive-plural":"harfonistelor","singular-vocative":"harfonistă","plural-vocative":"harfonistelor"}},{"word":"hârgan","pos":"noun","definitions":["watermelon"],"forms":{"plural":"hârgani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârgan","accusative-definite-nominative-singular":"hârganul","accusative-indefinite-nominative-plural":"hârgani","accusative-definite-nominative-plural":"hârganii","dative-genitive-indefinite-singular":"hârgan","dative-definite-genitive-singular":"hârganului","dative-genitive-indefinite-plural":"hârgani","dative-definite-genitive-plural":"hârganilor","singular-vocative":"hârganule","plural-vocative":"hârganilor"}},{"word":"hârgău","pos":"noun","definitions":["a kind of cauldron"],"forms":{"plural":"hârgaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârgău","accusative-definite-nominative-singular":"hârgăuul","accusative-indefinite-nominative-plural":"hârgaie","accusative-definite-nominative-plural":"hârgaiele","dative-genitive-indefinite-singular":"hârgău","dative-definite-genitive-singular":"hârgăuului","dative-genitive-indefinite-plural":"hârgaie","dative-definite-genitive-plural":"hârgaielor","singular-vocative":"hârgăuule","plural-vocative":"hârgaielor"}},{"word":"hârgăuță","pos":"noun","definitions":["diminutive of hârgău"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hârgăuță","accusative-definite-nominative":"hârgăuța","dative-genitive-indefinite":"hârgăuțe","dative-definite-genitive":"hârgăuței","vocative":"hârgăuță"}},{"word":"Harghita","pos":"name","definitions":["Harghita (a county of Romania)"],"pronunciation":"/harˈɡita/"},{"word":"Harghita-Băi","pos":"name","definitions":["a locality in Miercurea Ciuc, Harghita County, Romania"],"gender":"m"},{"word":"harghitean","pos":"noun","definitions":["native or inhabitant of the Harghita County, Romania (usually male)"],"forms":{"plural":"harghiteni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harghitean","accusative-definite-nominative-singular":"harghiteanul","accusative-indefinite-nominative-plural":"harghiteni","accusative-definite-nominative-plural":"harghitenii","dative-genitive-indefinite-singular":"harghitean","dative-definite-genitive-singular":"harghiteanului","dative-genitive-indefinite-plural":"harghiteni","dative-definite-genitive-plural":"harghitenilor","singular-vocative":"harghiteanule","plural-vocative":"harghitenilor"}},{"word":"harghiteană","pos":"noun","definitions":["female equivalent of harghitean"],"forms":{"plural":"harghitene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harghiteană","accusative-definite-nominative-singular":"harghiteana","accusative-indefinite-nominative-plural":"harghitene","accusative-definite-nominative-plural":"harghitenele","dative-genitive-indefinite-singular":"harghitene","dative-definite-genitive-singular":"harghitenei","dative-genitive-indefinite-plural":"harghitene","dative-definite-genitive-plural":"harghitenelor","singular-vocative":"harghiteană","plural-vocative":"harghitenelor"}},{"word":"harghiteancă","pos":"noun","definitions":["female equivalent of harghitean"],"forms":{"plural":"harghitence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harghiteancă","accusative-definite-nominative-singular":"harghiteanca","accusative-indefinite-nominative-plural":"harghitence","accusative-definite-nominative-plural":"harghitencele","dative-genitive-indefinite-singular":"harghitence","dative-definite-genitive-singular":"harghitencei","dative-genitive-indefinite-plural":"harghitence","dative-definite-genitive-plural":"harghitencelor","singular-vocative":"harghiteancă","plural-vocative":"harghitencelor"}},{"word":"hargilâc","pos":"noun","definitions":["expense"],"forms":{"plural":"hargilâcuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hargilâc","accusative-definite-nominative-singular":"hargilâcul","accusative-indefinite-nominative-plural":"hargilâcuri","accusative-definite-nominative-plural":"hargilâcurile","dative-genitive-indefinite-singular":"hargilâc","dative-definite-genitive-singular":"hargilâcului","dative-genitive-indefinite-plural":"hargilâcuri","dative-definite-genitive-plural":"hargilâcurilor","singular-vocative":"hargilâcule","plural-vocative":"hargilâcurilor"}},{"word":"hărgolaș","pos":"noun","definitions":["salaried"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hărgolaș","accusative-definite-nominative":"hărgolașul","dative-genitive-indefinite":"hărgolaș","dative-definite-genitive":"hărgolașului","vocative":"hărgolașule"}},{"word":"harhal","pos":"noun","definitions":["necklace"],"forms":{"plural":"harhaluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"harhal","accusative-definite-nominative-singular":"harhalul","accusative-indefinite-nominative-plural":"harhaluri","accusative-definite-nominative-plural":"harhalurile","dative-genitive-indefinite-singular":"harhal","dative-definite-genitive-singular":"harhalului","dative-genitive-indefinite-plural":"harhaluri","dative-definite-genitive-plural":"harhalurilor","singular-vocative":"harhalule","plural-vocative":"harhalurilor"}},{"word":"hărhălaie","pos":"noun","definitions":["noise, clamor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hărhălaie","accusative-definite-nominative":"hărhălaia","dative-genitive-indefinite":"hărhălaii","dative-definite-genitive":"hărhălaiei","vocative":"hărhălaie"}},{"word":"harhalău","pos":"noun","definitions":["a common cold"],"forms":{"plural":"harhalăie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"harhalău","accusative-definite-nominative-singular":"harhalăuul","accusative-indefinite-nominative-plural":"harhalăie","accusative-definite-nominative-plural":"harhalăiele","dative-genitive-indefinite-singular":"harhalău","dative-definite-genitive-singular":"harhalăuului","dative-genitive-indefinite-plural":"harhalăie","dative-definite-genitive-plural":"harhalăielor","singular-vocative":"harhalăuule","plural-vocative":"harhalăielor"}},{"word":"harhăr","pos":"noun","definitions":["a Jew, Hebrew"],"forms":{"plural":"harhări","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harhăr","accusative-definite-nominative-singular":"harhărul","accusative-indefinite-nominative-plural":"harhări","accusative-definite-nominative-plural":"harhării","dative-genitive-indefinite-singular":"harhăr","dative-definite-genitive-singular":"harhărului","dative-genitive-indefinite-plural":"harhări","dative-definite-genitive-plural":"harhărilor","singular-vocative":"harhărule","plural-vocative":"harhărilor"}},{"word":"harhăt","pos":"noun","definitions":["noise, clamor"],"forms":{"plural":"harhăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"harhăt","accusative-definite-nominative-singular":"harhătul","accusative-indefinite-nominative-plural":"harhăte","accusative-definite-nominative-plural":"harhătele","dative-genitive-indefinite-singular":"harhăt","dative-definite-genitive-singular":"harhătului","dative-genitive-indefinite-plural":"harhăte","dative-definite-genitive-plural":"harhătelor","singular-vocative":"harhătule","plural-vocative":"harhătelor"}},{"word":"Hariclea","pos":"name","definitions":["a female given name, equivalent to English Chariclea"],"gender":"f"},{"word":"hârjâi","pos":"verb","definitions":["alternative form of hârșâi"],"forms":{"canonical":"a hârjâi 4th conjugation","present-singular-third-person":"hârjâie","participle-past":"hârjâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hârjâi","gerund":"hârjâind","first-person-indicative-present-singular":"hârjâi","indicative-present-second-person-singular":"hârjâi","indicative-present-singular-third-person":"hârjâie","first-person-indicative-plural-present":"hârjâim","indicative-plural-present-second-person":"hârjâiți","indicative-plural-present-third-person":"hârjâie","first-person-imperfect-indicative-singular":"hârjâiam","imperfect-indicative-second-person-singular":"hârjâiai","imperfect-indicative-singular-third-person":"hârjâia","first-person-imperfect-indicative-plural":"hârjâiam","imperfect-indicative-plural-second-person":"hârjâiați","imperfect-indicative-plural-third-person":"hârjâiau","first-person-indicative-perfect-singular":"hârjâii","indicative-perfect-second-person-singular":"hârjâiși","indicative-perfect-singular-third-person":"hârjâi","first-person-indicative-perfect-plural":"hârjâirăm","indicative-perfect-plural-second-person":"hârjâirăți","indicative-perfect-plural-third-person":"hârjâiră","first-person-indicative-pluperfect-singular":"hârjâisem","indicative-pluperfect-second-person-singular":"hârjâiseși","indicative-pluperfect-singular-third-person":"hârjâise","first-person-indicative-pluperfect-plural":"hârjâiserăm","indicative-pluperfect-plural-second-person":"hârjâiserăți","indicative-pluperfect-plural-third-person":"hârjâiseră","first-person-present-singular-subjunctive":"să hârjâi","present-second-person-singular-subjunctive":"să hârjâi","present-singular-subjunctive-third-person":"să hârjâie","first-person-plural-present-subjunctive":"să hârjâim","plural-present-second-person-subjunctive":"să hârjâiți","plural-present-subjunctive-third-person":"să hârjâie","imperative-second-person-singular":"hârjâie","imperative-plural-second-person":"hârjâiți","imperative-negative-second-person-singular":"nu hârjâi","imperative-negative-plural-second-person":"nu hârjâiți"}},{"word":"hârjâit","pos":"noun","definitions":["alternative form of hârșâit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârjâit","accusative-definite-nominative":"hârjâitul","dative-genitive-indefinite":"hârjâit","dative-definite-genitive":"hârjâitului","vocative":"hârjâitule"}},{"word":"hârjâitură","pos":"noun","definitions":["alternative form of hârșâitură"],"forms":{"plural":"hârjâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hârjâitură","accusative-definite-nominative-singular":"hârjâitura","accusative-indefinite-nominative-plural":"hârjâituri","accusative-definite-nominative-plural":"hârjâiturile","dative-genitive-indefinite-singular":"hârjâituri","dative-definite-genitive-singular":"hârjâiturii","dative-genitive-indefinite-plural":"hârjâituri","dative-definite-genitive-plural":"hârjâiturilor","singular-vocative":"hârjâitură","plural-vocative":"hârjâiturilor"}},{"word":"hârjetar","pos":"noun","definitions":["gamester, gambler"],"forms":{"plural":"hârjetari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârjetar","accusative-definite-nominative-singular":"hârjetarul","accusative-indefinite-nominative-plural":"hârjetari","accusative-definite-nominative-plural":"hârjetarii","dative-genitive-indefinite-singular":"hârjetar","dative-definite-genitive-singular":"hârjetarului","dative-genitive-indefinite-plural":"hârjetari","dative-definite-genitive-plural":"hârjetarilor","singular-vocative":"hârjetarule","plural-vocative":"hârjetarilor"}},{"word":"hârjoană","pos":"noun","definitions":["gambol"],"forms":{"plural":"hârjoane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârjoană","accusative-definite-nominative-singular":"hârjoana","accusative-indefinite-nominative-plural":"hârjoane","accusative-definite-nominative-plural":"hârjoanele","dative-genitive-indefinite-singular":"hârjoane","dative-definite-genitive-singular":"hârjoanei","dative-genitive-indefinite-plural":"hârjoane","dative-definite-genitive-plural":"hârjoanelor","singular-vocative":"hârjoană","plural-vocative":"hârjoanelor"}},{"word":"hârjoneală","pos":"noun","definitions":["gamboling"],"forms":{"plural":"hârjoneli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hârjoneală","accusative-definite-nominative-singular":"hârjoneala","accusative-indefinite-nominative-plural":"hârjoneli","accusative-definite-nominative-plural":"hârjonelile","dative-genitive-indefinite-singular":"hârjoneli","dative-definite-genitive-singular":"hârjonelii","dative-genitive-indefinite-plural":"hârjoneli","dative-definite-genitive-plural":"hârjonelilor","singular-vocative":"hârjoneală","plural-vocative":"hârjonelilor"}},{"word":"hârjoni","pos":"verb","definitions":["to playfully fight, to frolic"],"forms":{"canonical":"a hârjoni 4th conjugation","present-singular-third-person":"hârjonește","participle-past":"hârjonit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hârjoni","gerund":"hârjonind","first-person-indicative-present-singular":"hârjonesc","indicative-present-second-person-singular":"hârjonești","indicative-present-singular-third-person":"hârjonește","first-person-indicative-plural-present":"hârjonim","indicative-plural-present-second-person":"hârjoniți","indicative-plural-present-third-person":"hârjonesc","first-person-imperfect-indicative-singular":"hârjoneam","imperfect-indicative-second-person-singular":"hârjoneai","imperfect-indicative-singular-third-person":"hârjonea","first-person-imperfect-indicative-plural":"hârjoneam","imperfect-indicative-plural-second-person":"hârjoneați","imperfect-indicative-plural-third-person":"hârjoneau","first-person-indicative-perfect-singular":"hârjonii","indicative-perfect-second-person-singular":"hârjoniși","indicative-perfect-singular-third-person":"hârjoni","first-person-indicative-perfect-plural":"hârjonirăm","indicative-perfect-plural-second-person":"hârjonirăți","indicative-perfect-plural-third-person":"hârjoniră","first-person-indicative-pluperfect-singular":"hârjonisem","indicative-pluperfect-second-person-singular":"hârjoniseși","indicative-pluperfect-singular-third-person":"hârjonise","first-person-indicative-pluperfect-plural":"hârjoniserăm","indicative-pluperfect-plural-second-person":"hârjoniserăți","indicative-pluperfect-plural-third-person":"hârjoniseră","first-person-present-singular-subjunctive":"să hârjonesc","present-second-person-singular-subjunctive":"să hârjonești","present-singular-subjunctive-third-person":"să hârjonească","first-person-plural-present-subjunctive":"să hârjonim","plural-present-second-person-subjunctive":"să hârjoniți","plural-present-subjunctive-third-person":"să hârjonească","imperative-second-person-singular":"hârjonește","imperative-plural-second-person":"hârjoniți","imperative-negative-second-person-singular":"nu hârjoni","imperative-negative-plural-second-person":"nu hârjoniți"}},{"word":"Hârlău","pos":"name","definitions":["a town in Iași County, Romania"],"gender":"m"},{"word":"hârlăuan","pos":"adj","definitions":["related to Hârlău"],"forms":{"feminine-singular":"hârlăuană","masculine-plural":"hârlăuani","feminine-neuter-plural":"hârlăuane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârlăuan","error-unrecognized-form-feminine-indefinite-singular":"hârlăuană","error-unrecognized-form-indefinite-masculine-plural":"hârlăuani","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârlăuane","definite-error-unrecognized-form-masculine-neuter-singular":"hârlăuanul","definite-error-unrecognized-form-feminine-singular":"hârlăuana","definite-error-unrecognized-form-masculine-plural":"hârlăuanii","definite-error-unrecognized-form-feminine-neuter-plural":"hârlăuanele"}},{"word":"hârlăuan","pos":"noun","definitions":["native or inhabitant of Hârlău (usually male)"],"forms":{"plural":"hârlăuani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârlăuan","accusative-definite-nominative-singular":"hârlăuanul","accusative-indefinite-nominative-plural":"hârlăuani","accusative-definite-nominative-plural":"hârlăuanii","dative-genitive-indefinite-singular":"hârlăuan","dative-definite-genitive-singular":"hârlăuanului","dative-genitive-indefinite-plural":"hârlăuani","dative-definite-genitive-plural":"hârlăuanilor","singular-vocative":"hârlăuanule","plural-vocative":"hârlăuanilor"}},{"word":"hârlăuancă","pos":"noun","definitions":["female equivalent of hârlăuan"],"forms":{"plural":"hârlăuance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârlăuancă","accusative-definite-nominative-singular":"hârlăuanca","accusative-indefinite-nominative-plural":"hârlăuance","accusative-definite-nominative-plural":"hârlăuancele","dative-genitive-indefinite-singular":"hârlăuance","dative-definite-genitive-singular":"hârlăuancei","dative-genitive-indefinite-plural":"hârlăuance","dative-definite-genitive-plural":"hârlăuancelor","singular-vocative":"hârlăuancă","plural-vocative":"hârlăuancelor"}},{"word":"Hârleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hârleșteanu"}},{"word":"Hârlești","pos":"name","definitions":["a village in Filipești, Bacău County, Romania"],"gender":"m"},{"word":"hârleț","pos":"noun","definitions":["spade (garden tool used for digging)"],"forms":{"plural":"hârlețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârleț","accusative-definite-nominative-singular":"hârlețul","accusative-indefinite-nominative-plural":"hârlețe","accusative-definite-nominative-plural":"hârlețele","dative-genitive-indefinite-singular":"hârleț","dative-definite-genitive-singular":"hârlețului","dative-genitive-indefinite-plural":"hârlețe","dative-definite-genitive-plural":"hârlețelor","singular-vocative":"hârlețule","plural-vocative":"hârlețelor"}},{"word":"hârlețel","pos":"noun","definitions":["diminutive of hârleț"],"forms":{"plural":"hârlețele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârlețel","accusative-definite-nominative-singular":"hârlețelul","accusative-indefinite-nominative-plural":"hârlețele","accusative-definite-nominative-plural":"hârlețelele","dative-genitive-indefinite-singular":"hârlețel","dative-definite-genitive-singular":"hârlețelului","dative-genitive-indefinite-plural":"hârlețele","dative-definite-genitive-plural":"hârlețelelor","singular-vocative":"hârlețelule","plural-vocative":"hârlețelelor"}},{"word":"harmalaie","pos":"noun","definitions":["alternative form of hărmălaie"],"forms":{"plural":"harmalaie","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"harmalaie","accusative-definite-nominative-singular":"harmalaiea","accusative-indefinite-nominative-plural":"harmalaie","accusative-definite-nominative-plural":"harmalaiele","dative-genitive-indefinite-singular":"harmalaie","dative-definite-genitive-singular":"harmalaiei","dative-genitive-indefinite-plural":"harmalaie","dative-definite-genitive-plural":"harmalaielor","singular-vocative":"harmalaie","plural-vocative":"harmalaielor"}},{"word":"hărmălaie","pos":"noun","definitions":["noise, clamor"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hărmălaie","accusative-definite-nominative":"hărmălaia","dative-genitive-indefinite":"hărmălaii","dative-definite-genitive":"hărmălaiei","vocative":"hărmălaie"}},{"word":"hărmălioacă","pos":"noun","definitions":["trouble, distress"],"forms":{"plural":"hărmălioace","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hărmălioacă","accusative-definite-nominative-singular":"hărmălioaca","accusative-indefinite-nominative-plural":"hărmălioace","accusative-definite-nominative-plural":"hărmălioacele","dative-genitive-indefinite-singular":"hărmălioace","dative-definite-genitive-singular":"hărmălioacei","dative-genitive-indefinite-plural":"hărmălioace","dative-definite-genitive-plural":"hărmălioacelor","singular-vocative":"hărmălioacă","plural-vocative":"hărmălioacelor"}},{"word":"Hărman","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Hărman, Brașov County, Romania"],"gender":"f"},{"word":"Hărmănaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hărmănaș"}},{"word":"Hărmăneasa","pos":"name","definitions":["a village in Heleșteni, Iași County, Romania"],"gender":"f"},{"word":"Hărmănescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hărmănescu"}},{"word":"Hărmănești","pos":"name","definitions":["a commune of Iași County, Romania"],"gender":"m"},{"word":"Hărmăneștii Noi","pos":"name","definitions":["a village in Hărmănești, Iași County, Romania"],"gender":"m"},{"word":"Hărmăneștii Vechi","pos":"name","definitions":["a village in Hărmănești, Iași County, Romania"],"gender":"m"},{"word":"harmăsar","pos":"noun","definitions":["alternative form of armăsar"],"forms":{"plural":"harmăsari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harmăsar","accusative-definite-nominative-singular":"harmăsarul","accusative-indefinite-nominative-plural":"harmăsari","accusative-definite-nominative-plural":"harmăsarii","dative-genitive-indefinite-singular":"harmăsar","dative-definite-genitive-singular":"harmăsarului","dative-genitive-indefinite-plural":"harmăsari","dative-definite-genitive-plural":"harmăsarilor","singular-vocative":"harmăsarule","plural-vocative":"harmăsarilor"}},{"word":"hărminție","pos":"noun","definitions":["a tax on traders"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hărminție","accusative-definite-nominative":"hărminția","dative-genitive-indefinite":"hărminții","dative-definite-genitive":"hărminției","vocative":"hărminție"}},{"word":"harnașa","pos":"verb","definitions":["to harness"],"forms":{"canonical":"a harnașa 1st conjugation","present-singular-third-person":"harnașează","participle-past":"harnașat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a harnașa","gerund":"harnașând","first-person-indicative-present-singular":"harnașez","indicative-present-second-person-singular":"harnașezi","indicative-present-singular-third-person":"harnașează","first-person-indicative-plural-present":"harnașăm","indicative-plural-present-second-person":"harnașați","indicative-plural-present-third-person":"harnașează","first-person-imperfect-indicative-singular":"harnașam","imperfect-indicative-second-person-singular":"harnașai","imperfect-indicative-singular-third-person":"harnașa","first-person-imperfect-indicative-plural":"harnașam","imperfect-indicative-plural-second-person":"harnașați","imperfect-indicative-plural-third-person":"harnașau","first-person-indicative-perfect-singular":"harnașai","indicative-perfect-second-person-singular":"harnașași","indicative-perfect-singular-third-person":"harnașă","first-person-indicative-perfect-plural":"harnașarăm","indicative-perfect-plural-second-person":"harnașarăți","indicative-perfect-plural-third-person":"harnașară","first-person-indicative-pluperfect-singular":"harnașasem","indicative-pluperfect-second-person-singular":"harnașaseși","indicative-pluperfect-singular-third-person":"harnașase","first-person-indicative-pluperfect-plural":"harnașaserăm","indicative-pluperfect-plural-second-person":"harnașaserăți","indicative-pluperfect-plural-third-person":"harnașaseră","first-person-present-singular-subjunctive":"să harnașez","present-second-person-singular-subjunctive":"să harnașezi","present-singular-subjunctive-third-person":"să harnașeze","first-person-plural-present-subjunctive":"să harnașăm","plural-present-second-person-subjunctive":"să harnașați","plural-present-subjunctive-third-person":"să harnașeze","imperative-second-person-singular":"harnașează","imperative-plural-second-person":"harnașați","imperative-negative-second-person-singular":"nu harnașa","imperative-negative-plural-second-person":"nu harnașați"}},{"word":"harnașament","pos":"noun","definitions":["harness"],"forms":{"plural":"harnașamente","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"harnașament","accusative-definite-nominative-singular":"harnașamentul","accusative-indefinite-nominative-plural":"harnașamente","accusative-definite-nominative-plural":"harnașamentele","dative-genitive-indefinite-singular":"harnașament","dative-definite-genitive-singular":"harnașamentului","dative-genitive-indefinite-plural":"harnașamente","dative-definite-genitive-plural":"harnașamentelor","singular-vocative":"harnașamentule","plural-vocative":"harnașamentelor"}},{"word":"harnașare","pos":"noun","definitions":["harness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"harnașare","accusative-definite-nominative":"harnașarea","dative-genitive-indefinite":"harnașare","dative-definite-genitive":"harnașarei","vocative":"harnașare"}},{"word":"harnic","pos":"adj","definitions":["hardworking, industrious, diligent, busy"],"pronunciation":"/ˈhar.nik/","forms":{"feminine-singular":"harnică","masculine-plural":"harnici","feminine-neuter-plural":"harnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"harnic","error-unrecognized-form-feminine-indefinite-singular":"harnică","error-unrecognized-form-indefinite-masculine-plural":"harnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"harnice","definite-error-unrecognized-form-masculine-neuter-singular":"harnicul","definite-error-unrecognized-form-feminine-singular":"harnica","definite-error-unrecognized-form-masculine-plural":"harnicii","definite-error-unrecognized-form-feminine-neuter-plural":"harnicele"}},{"word":"hărnicel","pos":"adj","definitions":["hardworking"],"forms":{"feminine-singular":"hărnicelă","masculine-plural":"hărniceli","feminine-neuter-plural":"hărnicele","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărnicel","error-unrecognized-form-feminine-indefinite-singular":"hărnicelă","error-unrecognized-form-indefinite-masculine-plural":"hărniceli","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărnicele","definite-error-unrecognized-form-masculine-neuter-singular":"hărnicelul","definite-error-unrecognized-form-feminine-singular":"hărnicela","definite-error-unrecognized-form-masculine-plural":"hărnicelii","definite-error-unrecognized-form-feminine-neuter-plural":"hărnicelele"}},{"word":"Hărnicești","pos":"name","definitions":["a village in Desești, Maramureș County, Romania"],"gender":"m"},{"word":"hărnici","pos":"verb","definitions":["to become diligent"],"forms":{"canonical":"a hărnici 4th conjugation","present-singular-third-person":"hărnicește","participle-past":"hărnicit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hărnici","gerund":"hărnicind","first-person-indicative-present-singular":"hărnicesc","indicative-present-second-person-singular":"hărnicești","indicative-present-singular-third-person":"hărnicește","first-person-indicative-plural-present":"hărnicim","indicative-plural-present-second-person":"hărniciți","indicative-plural-present-third-person":"hărnicesc","first-person-imperfect-indicative-singular":"hărniceam","imperfect-indicative-second-person-singular":"hărniceai","imperfect-indicative-singular-third-person":"hărnicea","first-person-imperfect-indicative-plural":"hărniceam","imperfect-indicative-plural-second-person":"hărniceați","imperfect-indicative-plural-third-person":"hărniceau","first-person-indicative-perfect-singular":"hărnicii","indicative-perfect-second-person-singular":"hărniciși","indicative-perfect-singular-third-person":"hărnici","first-person-indicative-perfect-plural":"hărnicirăm","indicative-perfect-plural-second-person":"hărnicirăți","indicative-perfect-plural-third-person":"hărniciră","first-person-indicative-pluperfect-singular":"hărnicisem","indicative-pluperfect-second-person-singular":"hărniciseși","indicative-pluperfect-singular-third-person":"hărnicise","first-person-indicative-pluperfect-plural":"hărniciserăm","indicative-pluperfect-plural-second-person":"hărniciserăți","indicative-pluperfect-plural-third-person":"hărniciseră","first-person-present-singular-subjunctive":"să hărnicesc","present-second-person-singular-subjunctive":"să hărnicești","present-singular-subjunctive-third-person":"să hărnicească","first-person-plural-present-subjunctive":"să hărnicim","plural-present-second-person-subjunctive":"să hărniciți","plural-present-subjunctive-third-person":"să hărnicească","imperative-second-person-singular":"hărnicește","imperative-plural-second-person":"hărniciți","imperative-negative-second-person-singular":"nu hărnici","imperative-negative-plural-second-person":"nu hărniciți"}},{"word":"hărnicie","pos":"noun","definitions":["industry, zeal in work","diligence"]},{"word":"Harnicu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Harnicu"}},{"word":"hărnicuț","pos":"adj","definitions":["diminutive of harnic"],"forms":{"feminine-singular":"hărnicuță","masculine-plural":"hărnicuți","feminine-neuter-plural":"hărnicuțe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărnicuț","error-unrecognized-form-feminine-indefinite-singular":"hărnicuță","error-unrecognized-form-indefinite-masculine-plural":"hărnicuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărnicuțe","definite-error-unrecognized-form-masculine-neuter-singular":"hărnicuțul","definite-error-unrecognized-form-feminine-singular":"hărnicuța","definite-error-unrecognized-form-masculine-plural":"hărnicuții","definite-error-unrecognized-form-feminine-neuter-plural":"hărnicuțele"}},{"word":"harpa","pos":"noun","definitions":["definite nominative/accusative singular of harpă"],"pronunciation":"[ˈharpa]","gender":"f"},{"word":"harpă","pos":"noun","definitions":["harp"],"pronunciation":"[ˈhar.pə]","forms":{"plural":"harpe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harpă","accusative-definite-nominative-singular":"harpa","accusative-indefinite-nominative-plural":"harpe","accusative-definite-nominative-plural":"harpele","dative-genitive-indefinite-singular":"harpe","dative-definite-genitive-singular":"harpei","dative-genitive-indefinite-plural":"harpe","dative-definite-genitive-plural":"harpelor","singular-vocative":"harpă","plural-vocative":"harpelor","alternative":"arfă"}},{"word":"harpagon","pos":"noun","definitions":["miser, a selfish person"],"forms":{"plural":"harpagoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harpagon","accusative-definite-nominative-singular":"harpagonul","accusative-indefinite-nominative-plural":"harpagoni","accusative-definite-nominative-plural":"harpagonii","dative-genitive-indefinite-singular":"harpagon","dative-definite-genitive-singular":"harpagonului","dative-genitive-indefinite-plural":"harpagoni","dative-definite-genitive-plural":"harpagonilor","singular-vocative":"harpagonule","plural-vocative":"harpagonilor","alternative":"arpagon"}},{"word":"Hărpășești","pos":"name","definitions":["a village in Popești, Iași County, Romania"],"gender":"m"},{"word":"harpe","pos":"noun","definitions":["plural of harpă"],"pronunciation":"[ˈhar.pe]","gender":"f-p"},{"word":"harpie","pos":"noun","definitions":["harpy"],"forms":{"plural":"harpii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"harpie","accusative-definite-nominative-singular":"harpia","accusative-indefinite-nominative-plural":"harpii","accusative-definite-nominative-plural":"harpiile","dative-genitive-indefinite-singular":"harpii","dative-definite-genitive-singular":"harpiei","dative-genitive-indefinite-plural":"harpii","dative-definite-genitive-plural":"harpiilor","singular-vocative":"harpie","plural-vocative":"harpiilor"}},{"word":"harpist","pos":"noun","definitions":["harpist"],"pronunciation":"[harˈpist]","forms":{"plural":"harpiști","feminine":"equivalent harpistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harpist","accusative-definite-nominative-singular":"harpistul","accusative-indefinite-nominative-plural":"harpiști","accusative-definite-nominative-plural":"harpiștii","dative-genitive-indefinite-singular":"harpist","dative-definite-genitive-singular":"harpistului","dative-genitive-indefinite-plural":"harpiști","dative-definite-genitive-plural":"harpiștilor","singular-vocative":"harpistule","plural-vocative":"harpiștilor"}},{"word":"harpistă","pos":"noun","definitions":["female equivalent of harpist"],"forms":{"plural":"harpiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harpistă","accusative-definite-nominative-singular":"harpista","accusative-indefinite-nominative-plural":"harpiste","accusative-definite-nominative-plural":"harpistele","dative-genitive-indefinite-singular":"harpiste","dative-definite-genitive-singular":"harpistei","dative-genitive-indefinite-plural":"harpiste","dative-definite-genitive-plural":"harpistelor","singular-vocative":"harpistă","plural-vocative":"harpistelor"}},{"word":"harpo","pos":"noun","definitions":["vocative singular of harpă"],"pronunciation":"[ˈharpo]","gender":"f"},{"word":"harpon","pos":"noun","definitions":["harpoon"],"forms":{"plural":"harpoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"harpon","accusative-definite-nominative-singular":"harponul","accusative-indefinite-nominative-plural":"harpoane","accusative-definite-nominative-plural":"harpoanele","dative-genitive-indefinite-singular":"harpon","dative-definite-genitive-singular":"harponului","dative-genitive-indefinite-plural":"harpoane","dative-definite-genitive-plural":"harpoanelor","singular-vocative":"harponule","plural-vocative":"harpoanelor"}},{"word":"harponier","pos":"noun","definitions":["harpooner"],"forms":{"plural":"harponieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"harponier","accusative-definite-nominative-singular":"harponierul","accusative-indefinite-nominative-plural":"harponieri","accusative-definite-nominative-plural":"harponierii","dative-genitive-indefinite-singular":"harponier","dative-definite-genitive-singular":"harponierului","dative-genitive-indefinite-plural":"harponieri","dative-definite-genitive-plural":"harponierilor","singular-vocative":"harponierule","plural-vocative":"harponierilor"}},{"word":"harpsicord","pos":"noun","definitions":["harpsichord"],"forms":{"plural":"harpsicorduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"harpsicord","accusative-definite-nominative-singular":"harpsicordul","accusative-indefinite-nominative-plural":"harpsicorduri","accusative-definite-nominative-plural":"harpsicordurile","dative-genitive-indefinite-singular":"harpsicord","dative-definite-genitive-singular":"harpsicordului","dative-genitive-indefinite-plural":"harpsicorduri","dative-definite-genitive-plural":"harpsicordurilor","singular-vocative":"harpsicordule","plural-vocative":"harpsicordurilor","alternative":"harpsichord"}},{"word":"harș","pos":"intj","definitions":["alternative form of hârști"]},{"word":"hârș","pos":"intj","definitions":["alternative form of hârști"]},{"word":"Hârsa","pos":"name","definitions":["a village in Plopu, Prahova County, Romania"],"gender":"f"},{"word":"hârșâi","pos":"verb","definitions":["to scrape"],"forms":{"canonical":"a hârșâi 4th conjugation","present-singular-third-person":"hârșâie","participle-past":"hârșâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hârșâi","gerund":"hârșâind","first-person-indicative-present-singular":"hârșâi","indicative-present-second-person-singular":"hârșâi","indicative-present-singular-third-person":"hârșâie","first-person-indicative-plural-present":"hârșâim","indicative-plural-present-second-person":"hârșâiți","indicative-plural-present-third-person":"hârșâie","first-person-imperfect-indicative-singular":"hârșâiam","imperfect-indicative-second-person-singular":"hârșâiai","imperfect-indicative-singular-third-person":"hârșâia","first-person-imperfect-indicative-plural":"hârșâiam","imperfect-indicative-plural-second-person":"hârșâiați","imperfect-indicative-plural-third-person":"hârșâiau","first-person-indicative-perfect-singular":"hârșâii","indicative-perfect-second-person-singular":"hârșâiși","indicative-perfect-singular-third-person":"hârșâi","first-person-indicative-perfect-plural":"hârșâirăm","indicative-perfect-plural-second-person":"hârșâirăți","indicative-perfect-plural-third-person":"hârșâiră","first-person-indicative-pluperfect-singular":"hârșâisem","indicative-pluperfect-second-person-singular":"hârșâiseși","indicative-pluperfect-singular-third-person":"hârșâise","first-person-indicative-pluperfect-plural":"hârșâiserăm","indicative-pluperfect-plural-second-person":"hârșâiserăți","indicative-pluperfect-plural-third-person":"hârșâiseră","first-person-present-singular-subjunctive":"să hârșâi","present-second-person-singular-subjunctive":"să hârșâi","present-singular-subjunctive-third-person":"să hârșâie","first-person-plural-present-subjunctive":"să hârșâim","plural-present-second-person-subjunctive":"să hârșâiți","plural-present-subjunctive-third-person":"să hârșâie","imperative-second-person-singular":"hârșâie","imperative-plural-second-person":"hârșâiți","imperative-negative-second-person-singular":"nu hârșâi","imperative-negative-plural-second-person":"nu hârșâiți"}},{"word":"hârșâire","pos":"noun","definitions":["sound of a scraping"],"forms":{"plural":"hârșâiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hârșâire","accusative-definite-nominative-singular":"hârșâirea","accusative-indefinite-nominative-plural":"hârșâiri","accusative-definite-nominative-plural":"hârșâirile","dative-genitive-indefinite-singular":"hârșâiri","dative-definite-genitive-singular":"hârșâirii","dative-genitive-indefinite-plural":"hârșâiri","dative-definite-genitive-plural":"hârșâirilor","singular-vocative":"hârșâire","plural-vocative":"hârșâirilor"}},{"word":"hârșâit","pos":"noun","definitions":["scraping"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârșâit","accusative-definite-nominative":"hârșâitul","dative-genitive-indefinite":"hârșâit","dative-definite-genitive":"hârșâitului","vocative":"hârșâitule"}},{"word":"hârșâit","pos":"verb","definitions":["past participle of hârșâi"],"forms":{"participle-past":"of hârșâi"}},{"word":"hârșâitură","pos":"noun","definitions":["sound of a scraping"],"forms":{"plural":"hârșâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hârșâitură","accusative-definite-nominative-singular":"hârșâitura","accusative-indefinite-nominative-plural":"hârșâituri","accusative-definite-nominative-plural":"hârșâiturile","dative-genitive-indefinite-singular":"hârșâituri","dative-definite-genitive-singular":"hârșâiturii","dative-genitive-indefinite-plural":"hârșâituri","dative-definite-genitive-plural":"hârșâiturilor","singular-vocative":"hârșâitură","plural-vocative":"hârșâiturilor"}},{"word":"hârșcâi","pos":"verb","definitions":["alternative form of hârșâi"],"forms":{"canonical":"a hârșcâi 4th conjugation","present-singular-third-person":"hârșcâie","participle-past":"hârșcâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hârșcâi","gerund":"hârșcâind","first-person-indicative-present-singular":"hârșcâi","indicative-present-second-person-singular":"hârșcâi","indicative-present-singular-third-person":"hârșcâie","first-person-indicative-plural-present":"hârșcâim","indicative-plural-present-second-person":"hârșcâiți","indicative-plural-present-third-person":"hârșcâie","first-person-imperfect-indicative-singular":"hârșcâiam","imperfect-indicative-second-person-singular":"hârșcâiai","imperfect-indicative-singular-third-person":"hârșcâia","first-person-imperfect-indicative-plural":"hârșcâiam","imperfect-indicative-plural-second-person":"hârșcâiați","imperfect-indicative-plural-third-person":"hârșcâiau","first-person-indicative-perfect-singular":"hârșcâii","indicative-perfect-second-person-singular":"hârșcâiși","indicative-perfect-singular-third-person":"hârșcâi","first-person-indicative-perfect-plural":"hârșcâirăm","indicative-perfect-plural-second-person":"hârșcâirăți","indicative-perfect-plural-third-person":"hârșcâiră","first-person-indicative-pluperfect-singular":"hârșcâisem","indicative-pluperfect-second-person-singular":"hârșcâiseși","indicative-pluperfect-singular-third-person":"hârșcâise","first-person-indicative-pluperfect-plural":"hârșcâiserăm","indicative-pluperfect-plural-second-person":"hârșcâiserăți","indicative-pluperfect-plural-third-person":"hârșcâiseră","first-person-present-singular-subjunctive":"să hârșcâi","present-second-person-singular-subjunctive":"să hârșcâi","present-singular-subjunctive-third-person":"să hârșcâie","first-person-plural-present-subjunctive":"să hârșcâim","plural-present-second-person-subjunctive":"să hârșcâiți","plural-present-subjunctive-third-person":"să hârșcâie","imperative-second-person-singular":"hârșcâie","imperative-plural-second-person":"hârșcâiți","imperative-negative-second-person-singular":"nu hârșcâi","imperative-negative-plural-second-person":"nu hârșcâiți"}},{"word":"hârșcâit","pos":"noun","definitions":["alternative form of hârșâit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârșcâit","accusative-definite-nominative":"hârșcâitul","dative-genitive-indefinite":"hârșcâit","dative-definite-genitive":"hârșcâitului","vocative":"hârșcâitule"}},{"word":"hârșcâitură","pos":"noun","definitions":["alternative form of hârșâitură"],"forms":{"plural":"hârșcâituri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hârșcâitură","accusative-definite-nominative-singular":"hârșcâitura","accusative-indefinite-nominative-plural":"hârșcâituri","accusative-definite-nominative-plural":"hârșcâiturile","dative-genitive-indefinite-singular":"hârșcâituri","dative-definite-genitive-singular":"hârșcâiturii","dative-genitive-indefinite-plural":"hârșcâituri","dative-definite-genitive-plural":"hârșcâiturilor","singular-vocative":"hârșcâitură","plural-vocative":"hârșcâiturilor"}},{"word":"harșchină","pos":"noun","definitions":["alternative form of harchină"],"forms":{"plural":"harșchine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"harșchină","accusative-definite-nominative-singular":"harșchina","accusative-indefinite-nominative-plural":"harșchine","accusative-definite-nominative-plural":"harșchinele","dative-genitive-indefinite-singular":"harșchine","dative-definite-genitive-singular":"harșchinei","dative-genitive-indefinite-plural":"harșchine","dative-definite-genitive-plural":"harșchinelor","singular-vocative":"harșchină","plural-vocative":"harșchinelor"}},{"word":"Hârseni","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Hârseni, Brașov County, Romania"],"gender":"m"},{"word":"hârsenie","pos":"noun","definitions":["avarice"],"forms":{"plural":"hârsenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hârsenie","accusative-definite-nominative-singular":"hârsenia","accusative-indefinite-nominative-plural":"hârsenii","accusative-definite-nominative-plural":"hârseniile","dative-genitive-indefinite-singular":"hârsenii","dative-definite-genitive-singular":"hârseniei","dative-genitive-indefinite-plural":"hârsenii","dative-definite-genitive-plural":"hârseniilor","singular-vocative":"hârsenie","plural-vocative":"hârseniilor"}},{"word":"Hârsești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Hârsești, Argeș County, Romania","a village in Câmpani, Bihor County, Romania"],"gender":"m"},{"word":"hărșie","pos":"noun","definitions":["alternative form of hârșie"],"forms":{"plural":"hărșii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hărșie","accusative-definite-nominative-singular":"hărșia","accusative-indefinite-nominative-plural":"hărșii","accusative-definite-nominative-plural":"hărșiile","dative-genitive-indefinite-singular":"hărșii","dative-definite-genitive-singular":"hărșiei","dative-genitive-indefinite-plural":"hărșii","dative-definite-genitive-plural":"hărșiilor","singular-vocative":"hărșie","plural-vocative":"hărșiilor"}},{"word":"hârșii","pos":"verb","definitions":["alternative form of hârșâi"],"forms":{"canonical":"a hârșii 4th conjugation","present-singular-third-person":"hârșiește","participle-past":"hârșiit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hârșii","gerund":"hârșiind","first-person-indicative-present-singular":"hârșiesc","indicative-present-second-person-singular":"hârșiești","indicative-present-singular-third-person":"hârșiește","first-person-indicative-plural-present":"hârșiim","indicative-plural-present-second-person":"hârșiiți","indicative-plural-present-third-person":"hârșiesc","first-person-imperfect-indicative-singular":"hârșiam","imperfect-indicative-second-person-singular":"hârșiai","imperfect-indicative-singular-third-person":"hârșia","first-person-imperfect-indicative-plural":"hârșiam","imperfect-indicative-plural-second-person":"hârșiați","imperfect-indicative-plural-third-person":"hârșiau","first-person-indicative-perfect-singular":"hârșiii","indicative-perfect-second-person-singular":"hârșiiși","indicative-perfect-singular-third-person":"hârșii","first-person-indicative-perfect-plural":"hârșiirăm","indicative-perfect-plural-second-person":"hârșiirăți","indicative-perfect-plural-third-person":"hârșiiră","first-person-indicative-pluperfect-singular":"hârșiisem","indicative-pluperfect-second-person-singular":"hârșiiseși","indicative-pluperfect-singular-third-person":"hârșiise","first-person-indicative-pluperfect-plural":"hârșiiserăm","indicative-pluperfect-plural-second-person":"hârșiiserăți","indicative-pluperfect-plural-third-person":"hârșiiseră","first-person-present-singular-subjunctive":"să hârșiesc","present-second-person-singular-subjunctive":"să hârșiești","present-singular-subjunctive-third-person":"să hârșiască","first-person-plural-present-subjunctive":"să hârșiim","plural-present-second-person-subjunctive":"să hârșiiți","plural-present-subjunctive-third-person":"să hârșiască","imperative-second-person-singular":"hârșiește","imperative-plural-second-person":"hârșiiți","imperative-negative-second-person-singular":"nu hârșii","imperative-negative-plural-second-person":"nu hârșiiți"}},{"word":"hârșiire","pos":"noun","definitions":["alternative form of hârșâire"],"forms":{"plural":"hârșiiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hârșiire","accusative-definite-nominative-singular":"hârșiirea","accusative-indefinite-nominative-plural":"hârșiiri","accusative-definite-nominative-plural":"hârșiirile","dative-genitive-indefinite-singular":"hârșiiri","dative-definite-genitive-singular":"hârșiirii","dative-genitive-indefinite-plural":"hârșiiri","dative-definite-genitive-plural":"hârșiirilor","singular-vocative":"hârșiire","plural-vocative":"hârșiirilor"}},{"word":"hârșiit","pos":"noun","definitions":["alternative form of hârșâit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârșiit","accusative-definite-nominative":"hârșiitul","dative-genitive-indefinite":"hârșiit","dative-definite-genitive":"hârșiitului","vocative":"hârșiitule"}},{"word":"hârsit","pos":"adj","definitions":["greedy"],"forms":{"feminine-singular":"hârsită","masculine-plural":"hârsiți","feminine-neuter-plural":"hârsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârsit","error-unrecognized-form-feminine-indefinite-singular":"hârsită","error-unrecognized-form-indefinite-masculine-plural":"hârsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârsite","definite-error-unrecognized-form-masculine-neuter-singular":"hârsitul","definite-error-unrecognized-form-feminine-singular":"hârsita","definite-error-unrecognized-form-masculine-plural":"hârsiții","definite-error-unrecognized-form-feminine-neuter-plural":"hârsitele"}},{"word":"hârsit","pos":"verb","definitions":["past participle of hârsi"],"forms":{"participle-past":"of hârsi"}},{"word":"hârșit","pos":"adj","definitions":["obsolete form of hârșâit"],"forms":{"feminine-singular":"hârșită","masculine-plural":"hârșiți","feminine-neuter-plural":"hârșite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârșit","error-unrecognized-form-feminine-indefinite-singular":"hârșită","error-unrecognized-form-indefinite-masculine-plural":"hârșiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârșite","definite-error-unrecognized-form-masculine-neuter-singular":"hârșitul","definite-error-unrecognized-form-feminine-singular":"hârșita","definite-error-unrecognized-form-masculine-plural":"hârșiții","definite-error-unrecognized-form-feminine-neuter-plural":"hârșitele"}},{"word":"hărsit","pos":"adj","definitions":["alternative form of hârsit"],"forms":{"feminine-singular":"hărsită","masculine-plural":"hărsiți","feminine-neuter-plural":"hărsite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărsit","error-unrecognized-form-feminine-indefinite-singular":"hărsită","error-unrecognized-form-indefinite-masculine-plural":"hărsiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărsite","definite-error-unrecognized-form-masculine-neuter-singular":"hărsitul","definite-error-unrecognized-form-feminine-singular":"hărsita","definite-error-unrecognized-form-masculine-plural":"hărsiții","definite-error-unrecognized-form-feminine-neuter-plural":"hărsitele"}},{"word":"hârșni","pos":"verb","definitions":["to alternative form of hărșni"],"forms":{"canonical":"a hârșni 4th conjugation","present-singular-third-person":"hârșnește","participle-past":"hârșnit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hârșni","gerund":"hârșnind","first-person-indicative-present-singular":"hârșnesc","indicative-present-second-person-singular":"hârșnești","indicative-present-singular-third-person":"hârșnește","first-person-indicative-plural-present":"hârșnim","indicative-plural-present-second-person":"hârșniți","indicative-plural-present-third-person":"hârșnesc","first-person-imperfect-indicative-singular":"hârșneam","imperfect-indicative-second-person-singular":"hârșneai","imperfect-indicative-singular-third-person":"hârșnea","first-person-imperfect-indicative-plural":"hârșneam","imperfect-indicative-plural-second-person":"hârșneați","imperfect-indicative-plural-third-person":"hârșneau","first-person-indicative-perfect-singular":"hârșnii","indicative-perfect-second-person-singular":"hârșniși","indicative-perfect-singular-third-person":"hârșni","first-person-indicative-perfect-plural":"hârșnirăm","indicative-perfect-plural-second-person":"hârșnirăți","indicative-perfect-plural-third-person":"hârșniră","first-person-indicative-pluperfect-singular":"hârșnisem","indicative-pluperfect-second-person-singular":"hârșniseși","indicative-pluperfect-singular-third-person":"hârșnise","first-person-indicative-pluperfect-plural":"hârșniserăm","indicative-pluperfect-plural-second-person":"hârșniserăți","indicative-pluperfect-plural-third-person":"hârșniseră","first-person-present-singular-subjunctive":"să hârșnesc","present-second-person-singular-subjunctive":"să hârșnești","present-singular-subjunctive-third-person":"să hârșnească","first-person-plural-present-subjunctive":"să hârșnim","plural-present-second-person-subjunctive":"să hârșniți","plural-present-subjunctive-third-person":"să hârșnească","imperative-second-person-singular":"hârșnește","imperative-plural-second-person":"hârșniți","imperative-negative-second-person-singular":"nu hârșni","imperative-negative-plural-second-person":"nu hârșniți"}},{"word":"Hârsova","pos":"name","definitions":["a village in Delești, Vaslui County, Romania"],"gender":"f"},{"word":"hârșovean","pos":"adj","definitions":["of, from or relating to Hârșova"],"forms":{"feminine-singular":"hârșoveană","masculine-plural":"hârșoveni","feminine-neuter-plural":"hârșovene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârșovean","error-unrecognized-form-feminine-indefinite-singular":"hârșoveană","error-unrecognized-form-indefinite-masculine-plural":"hârșoveni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârșovene","definite-error-unrecognized-form-masculine-neuter-singular":"hârșoveanul","definite-error-unrecognized-form-feminine-singular":"hârșoveana","definite-error-unrecognized-form-masculine-plural":"hârșovenii","definite-error-unrecognized-form-feminine-neuter-plural":"hârșovenele"}},{"word":"hârșovean","pos":"noun","definitions":["native or inhabitant of Hârșova (usually male)"],"forms":{"plural":"hârșoveni","feminine":"equivalent hârșoveancă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârșovean","accusative-definite-nominative-singular":"hârșoveanul","accusative-indefinite-nominative-plural":"hârșoveni","accusative-definite-nominative-plural":"hârșovenii","dative-genitive-indefinite-singular":"hârșovean","dative-definite-genitive-singular":"hârșoveanului","dative-genitive-indefinite-plural":"hârșoveni","dative-definite-genitive-plural":"hârșovenilor","singular-vocative":"hârșoveanule","plural-vocative":"hârșovenilor"}},{"word":"hârșoveancă","pos":"noun","definitions":["female equivalent of hârșovean"],"forms":{"plural":"hârșovence","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârșoveancă","accusative-definite-nominative-singular":"hârșoveanca","accusative-indefinite-nominative-plural":"hârșovence","accusative-definite-nominative-plural":"hârșovencele","dative-genitive-indefinite-singular":"hârșovence","dative-definite-genitive-singular":"hârșovencei","dative-genitive-indefinite-plural":"hârșovence","dative-definite-genitive-plural":"hârșovencelor","singular-vocative":"hârșoveancă","plural-vocative":"hârșovencelor"}},{"word":"Hârșoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hârșoveanu"}},{"word":"Hârșoveni","pos":"name","definitions":["a village in Ivănești, Vaslui County, Romania"],"gender":"m"},{"word":"Hârșovescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hârșovescu"}},{"word":"hărști","pos":"verb","definitions":["to alternative form of hărșni"],"forms":{"canonical":"a hărști 4th conjugation","present-singular-third-person":"hărștește","participle-past":"hărștit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hărști","gerund":"hărștind","first-person-indicative-present-singular":"hărștesc","indicative-present-second-person-singular":"hărștești","indicative-present-singular-third-person":"hărștește","first-person-indicative-plural-present":"hărștim","indicative-plural-present-second-person":"hărștiți","indicative-plural-present-third-person":"hărștesc","first-person-imperfect-indicative-singular":"hărșteam","imperfect-indicative-second-person-singular":"hărșteai","imperfect-indicative-singular-third-person":"hărștea","first-person-imperfect-indicative-plural":"hărșteam","imperfect-indicative-plural-second-person":"hărșteați","imperfect-indicative-plural-third-person":"hărșteau","first-person-indicative-perfect-singular":"hărștii","indicative-perfect-second-person-singular":"hărștiși","indicative-perfect-singular-third-person":"hărști","first-person-indicative-perfect-plural":"hărștirăm","indicative-perfect-plural-second-person":"hărștirăți","indicative-perfect-plural-third-person":"hărștiră","first-person-indicative-pluperfect-singular":"hărștisem","indicative-pluperfect-second-person-singular":"hărștiseși","indicative-pluperfect-singular-third-person":"hărștise","first-person-indicative-pluperfect-plural":"hărștiserăm","indicative-pluperfect-plural-second-person":"hărștiserăți","indicative-pluperfect-plural-third-person":"hărștiseră","first-person-present-singular-subjunctive":"să hărștesc","present-second-person-singular-subjunctive":"să hărștești","present-singular-subjunctive-third-person":"să hărștească","first-person-plural-present-subjunctive":"să hărștim","plural-present-second-person-subjunctive":"să hărștiți","plural-present-subjunctive-third-person":"să hărștească","imperative-second-person-singular":"hărștește","imperative-plural-second-person":"hărștiți","imperative-negative-second-person-singular":"nu hărști","imperative-negative-plural-second-person":"nu hărștiți"}},{"word":"harț","pos":"noun","definitions":["alternative form of harță"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"harț","accusative-definite-nominative":"harțul","dative-genitive-indefinite":"harț","dative-definite-genitive":"harțului","vocative":"harțule"}},{"word":"harta","pos":"noun","definitions":["definite nominative/accusative singular of hartă"],"pronunciation":"[ˈharta]","gender":"f"},{"word":"hartă","pos":"noun","definitions":["map"],"forms":{"plural":"hărți","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hartă","accusative-definite-nominative-singular":"harta","accusative-indefinite-nominative-plural":"hărți","accusative-definite-nominative-plural":"hărțile","dative-genitive-indefinite-singular":"hărți","dative-definite-genitive-singular":"hărții","dative-genitive-indefinite-plural":"hărți","dative-definite-genitive-plural":"hărților","singular-vocative":"hartă","plural-vocative":"hărților"}},{"word":"harță","pos":"noun","definitions":["argument, fight"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"harță","accusative-definite-nominative":"harțăul","dative-genitive-indefinite":"harță","dative-definite-genitive":"harțăului","vocative":"harțăule"}},{"word":"hârță","pos":"noun","definitions":["alternative form of harți"],"forms":{"plural":"hârțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârță","accusative-definite-nominative-singular":"hârța","accusative-indefinite-nominative-plural":"hârțe","accusative-definite-nominative-plural":"hârțele","dative-genitive-indefinite-singular":"hârțe","dative-definite-genitive-singular":"hârței","dative-genitive-indefinite-plural":"hârțe","dative-definite-genitive-plural":"hârțelor","singular-vocative":"hârță","plural-vocative":"hârțelor"}},{"word":"hartă meteorologică","pos":"noun","definitions":["weather map"],"forms":{"plural":"hărți meteorologice"}},{"word":"hartă rutieră","pos":"noun","definitions":["road map"],"forms":{"plural":"hărți rutiere"}},{"word":"hartă stelară","pos":"noun","definitions":["star chart"],"forms":{"plural":"hărți stelare"}},{"word":"Harțag","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Buzău"],"gender":"m"},{"word":"harțag","pos":"noun","definitions":["alternative form of arțag"],"forms":{"plural":"harțaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"harțag","accusative-definite-nominative-singular":"harțagul","accusative-indefinite-nominative-plural":"harțaguri","accusative-definite-nominative-plural":"harțagurile","dative-genitive-indefinite-singular":"harțag","dative-definite-genitive-singular":"harțagului","dative-genitive-indefinite-plural":"harțaguri","dative-definite-genitive-plural":"harțagurilor","singular-vocative":"harțagule","plural-vocative":"harțagurilor"}},{"word":"Hărțăgani","pos":"name","definitions":["a village in Băița, Hunedoara County, Romania"],"gender":"m"},{"word":"harțăgos","pos":"adj","definitions":["alternative form of arțăgos"],"forms":{"feminine-singular":"harțăgoasă","masculine-plural":"harțăgoși","feminine-neuter-plural":"harțăgoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"harțăgos","error-unrecognized-form-feminine-indefinite-singular":"harțăgoasă","error-unrecognized-form-indefinite-masculine-plural":"harțăgoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"harțăgoase","definite-error-unrecognized-form-masculine-neuter-singular":"harțăgosul","definite-error-unrecognized-form-feminine-singular":"harțăgoasa","definite-error-unrecognized-form-masculine-plural":"harțăgoșii","definite-error-unrecognized-form-feminine-neuter-plural":"harțăgoasele"}},{"word":"hărțăgos","pos":"adj","definitions":["alternative form of arțăgos"],"forms":{"feminine-singular":"hărțăgoasă","masculine-plural":"hărțăgoși","feminine-neuter-plural":"hărțăgoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărțăgos","error-unrecognized-form-feminine-indefinite-singular":"hărțăgoasă","error-unrecognized-form-indefinite-masculine-plural":"hărțăgoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărțăgoase","definite-error-unrecognized-form-masculine-neuter-singular":"hărțăgosul","definite-error-unrecognized-form-feminine-singular":"hărțăgoasa","definite-error-unrecognized-form-masculine-plural":"hărțăgoșii","definite-error-unrecognized-form-feminine-neuter-plural":"hărțăgoasele"}},{"word":"hărtan","pos":"noun","definitions":["alternative form of hartan"],"forms":{"plural":"hărtane"}},{"word":"hărtănaș","pos":"noun","definitions":["diminutive of hartan"],"forms":{"plural":"hărtănașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hărtănaș","accusative-definite-nominative-singular":"hărtănașul","accusative-indefinite-nominative-plural":"hărtănașe","accusative-definite-nominative-plural":"hărtănașele","dative-genitive-indefinite-singular":"hărtănaș","dative-definite-genitive-singular":"hărtănașului","dative-genitive-indefinite-plural":"hărtănașe","dative-definite-genitive-plural":"hărtănașelor","singular-vocative":"hărtănașule","plural-vocative":"hărtănașelor"}},{"word":"hârtărărie","pos":"noun","definitions":["red tape, many documents"],"forms":{"plural":"hârtărării","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hârtărărie","accusative-definite-nominative-singular":"hârtărăria","accusative-indefinite-nominative-plural":"hârtărării","accusative-definite-nominative-plural":"hârtărăriile","dative-genitive-indefinite-singular":"hârtărării","dative-definite-genitive-singular":"hârtărăriei","dative-genitive-indefinite-plural":"hârtărării","dative-definite-genitive-plural":"hârtărăriilor","singular-vocative":"hârtărărie","plural-vocative":"hârtărăriilor"}},{"word":"hârtău","pos":"noun","definitions":["a long piece of land"],"pronunciation":"/hɨrˈtəw/","forms":{"plural":"hârtaie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârtău","accusative-definite-nominative-singular":"hârtăul","accusative-indefinite-nominative-plural":"hârtaie","accusative-definite-nominative-plural":"hârtaiele","dative-genitive-indefinite-singular":"hârtău","dative-definite-genitive-singular":"hârtăului","dative-genitive-indefinite-plural":"hârtaie","dative-definite-genitive-plural":"hârtaielor","singular-vocative":"hârtăule","plural-vocative":"hârtaielor"}},{"word":"Hărțău","pos":"name","definitions":["a village in Pănet, Mureș County, Romania"],"gender":"m"},{"word":"hărțeșel","pos":"noun","definitions":["diminutive of hărțaș"],"forms":{"plural":"hărțeșei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hărțeșel","accusative-definite-nominative-singular":"hărțeșelul","accusative-indefinite-nominative-plural":"hărțeșei","accusative-definite-nominative-plural":"hărțeșeii","dative-genitive-indefinite-singular":"hărțeșel","dative-definite-genitive-singular":"hărțeșelului","dative-genitive-indefinite-plural":"hărțeșei","dative-definite-genitive-plural":"hărțeșeilor","singular-vocative":"hărțeșelule","plural-vocative":"hărțeșeilor"}},{"word":"Hârțești","pos":"name","definitions":["a village in Mărgineni, Neamț County, Romania"],"gender":"m"},{"word":"hărți","pos":"noun","definitions":["plural of hartă"]},{"word":"Hârtibaciu","pos":"name","definitions":["a river in Romania, tributary to the Cibin"],"gender":"m"},{"word":"hârtică","pos":"noun","definitions":["tuberculosis"],"forms":{"plural":"hârtici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hârtică","accusative-definite-nominative":"hârtica","dative-genitive-indefinite":"hârtice","dative-definite-genitive":"hârticei","vocative":"hârtică"}},{"word":"hărticea","pos":"noun","definitions":["diminutive of hârtie"],"forms":{"plural":"hărticele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ea","accusative-indefinite-nominative-singular":"hărticea","accusative-definite-nominative-singular":"hărticeaua","accusative-indefinite-nominative-plural":"hărticele","accusative-definite-nominative-plural":"hărticelele","dative-genitive-indefinite-singular":"hărticele","dative-definite-genitive-singular":"hărticelei","dative-genitive-indefinite-plural":"hărticele","dative-definite-genitive-plural":"hărticelelor","singular-vocative":"hărticea","plural-vocative":"hărticelelor"}},{"word":"hârtie","pos":"noun","definitions":["paper"],"pronunciation":"/hɨrˈti.je/","examples":[{"ro":"coală de hârtie","en":"sheet of paper"},{"ro":"foaie de hârtie","en":"sheet of paper"}],"forms":{"plural":"hârtii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hârtie","accusative-definite-nominative-singular":"hârtia","accusative-indefinite-nominative-plural":"hârtii","accusative-definite-nominative-plural":"hârtiile","dative-genitive-indefinite-singular":"hârtii","dative-definite-genitive-singular":"hârtiei","dative-genitive-indefinite-plural":"hârtii","dative-definite-genitive-plural":"hârtiilor","singular-vocative":"hârtie","plural-vocative":"hârtiilor","alternative":"hîrtie"}},{"word":"hărtie","pos":"noun","definitions":["obsolete form of hârtie"],"forms":{"plural":"hărtii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hărtie","accusative-definite-nominative-singular":"hărtia","accusative-indefinite-nominative-plural":"hărtii","accusative-definite-nominative-plural":"hărtiile","dative-genitive-indefinite-singular":"hărtii","dative-definite-genitive-singular":"hărtiei","dative-genitive-indefinite-plural":"hărtii","dative-definite-genitive-plural":"hărtiilor","singular-vocative":"hărtie","plural-vocative":"hărtiilor"}},{"word":"hârtie albă","pos":"noun","definitions":["white paper"],"forms":{"plural":"hârtii albe"}},{"word":"hârtie alfa","pos":"noun","definitions":["alpha paper"],"forms":{"plural":"hârtii alfa"}},{"word":"hârtie cerată","pos":"noun","definitions":["waxed paper"],"forms":{"plural":"hârtii cerate"}},{"word":"hârtie de bancă","pos":"noun","definitions":["banknote"],"forms":{"plural":"hârtii de bancă"}},{"word":"hârtie de calc","pos":"noun","definitions":["tracing paper"],"forms":{"plural":"hârtii de calc"}},{"word":"hârtie de filtru","pos":"noun","definitions":["filter paper"],"forms":{"plural":"hârtii de filtru"}},{"word":"hârtie filtru","pos":"noun","definitions":["filter paper"],"forms":{"plural":"hârtii filtru"}},{"word":"hârtie fotografică","pos":"noun","definitions":["photo paper"],"forms":{"plural":"hârtii fotografice"}},{"word":"hârtie igienică","pos":"noun","definitions":["toilet paper"],"forms":{"plural":"hârtii igienice"}},{"word":"hârtie indigo","pos":"noun","definitions":["carbon paper"],"forms":{"plural":"hârtii indigo"}},{"word":"hârtie milimetrică","pos":"noun","definitions":["graph paper"],"forms":{"plural":"hârtii milimetrice"}},{"word":"hârtie velină","pos":"noun","definitions":["a high-quality blank sheet of paper"]},{"word":"hârtie-carbon","pos":"noun","definitions":["carbon paper"],"forms":{"plural":"hârtii-carbon"}},{"word":"hârtier","pos":"noun","definitions":["papermaker"],"forms":{"plural":"hârtieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârtier","accusative-definite-nominative-singular":"hârtierul","accusative-indefinite-nominative-plural":"hârtieri","accusative-definite-nominative-plural":"hârtierii","dative-genitive-indefinite-singular":"hârtier","dative-definite-genitive-singular":"hârtierului","dative-genitive-indefinite-plural":"hârtieri","dative-definite-genitive-plural":"hârtierilor","singular-vocative":"hârtierule","plural-vocative":"hârtierilor"}},{"word":"hârtierie","pos":"noun","definitions":["paper mill"],"forms":{"plural":"hârtierii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hârtierie","accusative-definite-nominative-singular":"hârtieria","accusative-indefinite-nominative-plural":"hârtierii","accusative-definite-nominative-plural":"hârtieriile","dative-genitive-indefinite-singular":"hârtierii","dative-definite-genitive-singular":"hârtieriei","dative-genitive-indefinite-plural":"hârtierii","dative-definite-genitive-plural":"hârtieriilor","singular-vocative":"hârtierie","plural-vocative":"hârtieriilor"}},{"word":"Hârtiești","pos":"name","definitions":["a commune of Argeș County, Romania","a village in Hârtiești, Argeș County, Romania"],"gender":"m"},{"word":"hârtioară","pos":"noun","definitions":["diminutive of hârtie; small piece of paper"],"forms":{"plural":"hârtioare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârtioară","accusative-definite-nominative-singular":"hârtioara","accusative-indefinite-nominative-plural":"hârtioare","accusative-definite-nominative-plural":"hârtioarele","dative-genitive-indefinite-singular":"hârtioare","dative-definite-genitive-singular":"hârtioarei","dative-genitive-indefinite-plural":"hârtioare","dative-definite-genitive-plural":"hârtioarelor","singular-vocative":"hârtioară","plural-vocative":"hârtioarelor"}},{"word":"hârțișor","pos":"noun","definitions":["diminutive of hârți"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hârțișor","accusative-definite-nominative":"hârțișorul","dative-genitive-indefinite":"hârțișor","dative-definite-genitive":"hârțișorului","vocative":"hârțișorule"}},{"word":"hârtiuță","pos":"noun","definitions":["diminutive of hârtie; small piece of paper"],"forms":{"plural":"hârtiuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârtiuță","accusative-definite-nominative-singular":"hârtiuța","accusative-indefinite-nominative-plural":"hârtiuțe","accusative-definite-nominative-plural":"hârtiuțele","dative-genitive-indefinite-singular":"hârtiuțe","dative-definite-genitive-singular":"hârtiuței","dative-genitive-indefinite-plural":"hârtiuțe","dative-definite-genitive-plural":"hârtiuțelor","singular-vocative":"hârtiuță","plural-vocative":"hârtiuțelor"}},{"word":"harto","pos":"noun","definitions":["vocative singular of hartă"],"pronunciation":"[ˈharto]","gender":"f"},{"word":"Hârțoagă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hârțoagă"}},{"word":"hârțoagă","pos":"noun","definitions":["bumf / bumph (useless or worthless old papers; now especially official documents, standardized forms, sales and marketing print material, etc.)"],"forms":{"plural":"hârțoage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârțoagă","accusative-definite-nominative-singular":"hârțoaga","accusative-indefinite-nominative-plural":"hârțoage","accusative-definite-nominative-plural":"hârțoagele","dative-genitive-indefinite-singular":"hârțoage","dative-definite-genitive-singular":"hârțoagei","dative-genitive-indefinite-plural":"hârțoage","dative-definite-genitive-plural":"hârțoagelor","singular-vocative":"hârțoagă","plural-vocative":"hârțoagelor"}},{"word":"hârțoală","pos":"noun","definitions":["scuffle"],"forms":{"plural":"hârțoale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hârțoală","accusative-definite-nominative-singular":"hârțoala","accusative-indefinite-nominative-plural":"hârțoale","accusative-definite-nominative-plural":"hârțoalele","dative-genitive-indefinite-singular":"hârțoale","dative-definite-genitive-singular":"hârțoalei","dative-genitive-indefinite-plural":"hârțoale","dative-definite-genitive-plural":"hârțoalelor","singular-vocative":"hârțoală","plural-vocative":"hârțoalelor"}},{"word":"hârtoapă","pos":"noun","definitions":["alternative form of hârtop"],"forms":{"plural":"hârtoape"}},{"word":"Hârtoape","pos":"name","definitions":["a village in Vânători, Iași County, Romania"],"gender":"f"},{"word":"hârtoape","pos":"noun","definitions":["inflection of hârtop:","indefinite nominative/accusative plural","indefinite genitive/dative plural"]},{"word":"hârțog","pos":"noun","definitions":["alternative form of hârțoagă"],"forms":{"plural":"hârțoage"}},{"word":"hârțoi","pos":"noun","definitions":["augmentative of hârț"],"forms":{"plural":"hârțoi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hârțoi","accusative-definite-nominative-singular":"hârțoiul","accusative-indefinite-nominative-plural":"hârțoi","accusative-definite-nominative-plural":"hârțoii","dative-genitive-indefinite-singular":"hârțoi","dative-definite-genitive-singular":"hârțoiului","dative-genitive-indefinite-plural":"hârțoi","dative-definite-genitive-plural":"hârțoilor","singular-vocative":"hârțoiule","plural-vocative":"hârțoilor"}},{"word":"Hârtop","pos":"name","definitions":["a village in Bârgăuani, Neamț County, Romania","a commune of Suceava County, Romania","a village in Hârtop, Suceava County, Romania"],"gender":"m"},{"word":"hârtop","pos":"noun","definitions":["pothole; hole in the road"],"forms":{"plural":"hârtoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârtop","accusative-definite-nominative-singular":"hârtopul","accusative-indefinite-nominative-plural":"hârtoape","accusative-definite-nominative-plural":"hârtoapele","dative-genitive-indefinite-singular":"hârtop","dative-definite-genitive-singular":"hârtopului","dative-genitive-indefinite-plural":"hârtoape","dative-definite-genitive-plural":"hârtoapelor","singular-vocative":"hârtopule","plural-vocative":"hârtoapelor","alternative":"hârtoapă"}},{"word":"hartui","pos":"verb","definitions":["alternative form of hartoi"],"forms":{"canonical":"a hartui 4th conjugation","present-singular-third-person":"hartuiește","participle-past":"hartuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hartui","gerund":"hartuind","first-person-indicative-present-singular":"hartuiesc","indicative-present-second-person-singular":"hartuiești","indicative-present-singular-third-person":"hartuiește","first-person-indicative-plural-present":"hartuim","indicative-plural-present-second-person":"hartuiți","indicative-plural-present-third-person":"hartuiesc","first-person-imperfect-indicative-singular":"hartuiam","imperfect-indicative-second-person-singular":"hartuiai","imperfect-indicative-singular-third-person":"hartuia","first-person-imperfect-indicative-plural":"hartuiam","imperfect-indicative-plural-second-person":"hartuiați","imperfect-indicative-plural-third-person":"hartuiau","first-person-indicative-perfect-singular":"hartuii","indicative-perfect-second-person-singular":"hartuiși","indicative-perfect-singular-third-person":"hartui","first-person-indicative-perfect-plural":"hartuirăm","indicative-perfect-plural-second-person":"hartuirăți","indicative-perfect-plural-third-person":"hartuiră","first-person-indicative-pluperfect-singular":"hartuisem","indicative-pluperfect-second-person-singular":"hartuiseși","indicative-pluperfect-singular-third-person":"hartuise","first-person-indicative-pluperfect-plural":"hartuiserăm","indicative-pluperfect-plural-second-person":"hartuiserăți","indicative-pluperfect-plural-third-person":"hartuiseră","first-person-present-singular-subjunctive":"să hartuiesc","present-second-person-singular-subjunctive":"să hartuiești","present-singular-subjunctive-third-person":"să hartuiască","first-person-plural-present-subjunctive":"să hartuim","plural-present-second-person-subjunctive":"să hartuiți","plural-present-subjunctive-third-person":"să hartuiască","imperative-second-person-singular":"hartuiește","imperative-plural-second-person":"hartuiți","imperative-negative-second-person-singular":"nu hartui","imperative-negative-plural-second-person":"nu hartuiți"}},{"word":"hârțui","pos":"verb","definitions":["alternative form of hărțui"],"forms":{"canonical":"a hârțui 4th conjugation","present-singular-third-person":"hârțuiește","participle-past":"hârțuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hârțui","gerund":"hârțuind","first-person-indicative-present-singular":"hârțuiesc","indicative-present-second-person-singular":"hârțuiești","indicative-present-singular-third-person":"hârțuiește","first-person-indicative-plural-present":"hârțuim","indicative-plural-present-second-person":"hârțuiți","indicative-plural-present-third-person":"hârțuiesc","first-person-imperfect-indicative-singular":"hârțuiam","imperfect-indicative-second-person-singular":"hârțuiai","imperfect-indicative-singular-third-person":"hârțuia","first-person-imperfect-indicative-plural":"hârțuiam","imperfect-indicative-plural-second-person":"hârțuiați","imperfect-indicative-plural-third-person":"hârțuiau","first-person-indicative-perfect-singular":"hârțuii","indicative-perfect-second-person-singular":"hârțuiși","indicative-perfect-singular-third-person":"hârțui","first-person-indicative-perfect-plural":"hârțuirăm","indicative-perfect-plural-second-person":"hârțuirăți","indicative-perfect-plural-third-person":"hârțuiră","first-person-indicative-pluperfect-singular":"hârțuisem","indicative-pluperfect-second-person-singular":"hârțuiseși","indicative-pluperfect-singular-third-person":"hârțuise","first-person-indicative-pluperfect-plural":"hârțuiserăm","indicative-pluperfect-plural-second-person":"hârțuiserăți","indicative-pluperfect-plural-third-person":"hârțuiseră","first-person-present-singular-subjunctive":"să hârțuiesc","present-second-person-singular-subjunctive":"să hârțuiești","present-singular-subjunctive-third-person":"să hârțuiască","first-person-plural-present-subjunctive":"să hârțuim","plural-present-second-person-subjunctive":"să hârțuiți","plural-present-subjunctive-third-person":"să hârțuiască","imperative-second-person-singular":"hârțuiește","imperative-plural-second-person":"hârțuiți","imperative-negative-second-person-singular":"nu hârțui","imperative-negative-plural-second-person":"nu hârțuiți"}},{"word":"hărțui","pos":"verb","definitions":["to harass"],"forms":{"canonical":"a hărțui 4th conjugation","present-singular-third-person":"hărțuiește","participle-past":"hărțuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hărțui","gerund":"hărțuind","first-person-indicative-present-singular":"hărțuiesc","indicative-present-second-person-singular":"hărțuiești","indicative-present-singular-third-person":"hărțuiește","first-person-indicative-plural-present":"hărțuim","indicative-plural-present-second-person":"hărțuiți","indicative-plural-present-third-person":"hărțuiesc","first-person-imperfect-indicative-singular":"hărțuiam","imperfect-indicative-second-person-singular":"hărțuiai","imperfect-indicative-singular-third-person":"hărțuia","first-person-imperfect-indicative-plural":"hărțuiam","imperfect-indicative-plural-second-person":"hărțuiați","imperfect-indicative-plural-third-person":"hărțuiau","first-person-indicative-perfect-singular":"hărțuii","indicative-perfect-second-person-singular":"hărțuiși","indicative-perfect-singular-third-person":"hărțui","first-person-indicative-perfect-plural":"hărțuirăm","indicative-perfect-plural-second-person":"hărțuirăți","indicative-perfect-plural-third-person":"hărțuiră","first-person-indicative-pluperfect-singular":"hărțuisem","indicative-pluperfect-second-person-singular":"hărțuiseși","indicative-pluperfect-singular-third-person":"hărțuise","first-person-indicative-pluperfect-plural":"hărțuiserăm","indicative-pluperfect-plural-second-person":"hărțuiserăți","indicative-pluperfect-plural-third-person":"hărțuiseră","first-person-present-singular-subjunctive":"să hărțuiesc","present-second-person-singular-subjunctive":"să hărțuiești","present-singular-subjunctive-third-person":"să hărțuiască","first-person-plural-present-subjunctive":"să hărțuim","plural-present-second-person-subjunctive":"să hărțuiți","plural-present-subjunctive-third-person":"să hărțuiască","imperative-second-person-singular":"hărțuiește","imperative-plural-second-person":"hărțuiți","imperative-negative-second-person-singular":"nu hărțui","imperative-negative-plural-second-person":"nu hărțuiți"}},{"word":"hărțuială","pos":"noun","definitions":["harassment"],"forms":{"plural":"hărțuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hărțuială","accusative-definite-nominative-singular":"hărțuiala","accusative-indefinite-nominative-plural":"hărțuieli","accusative-definite-nominative-plural":"hărțuielile","dative-genitive-indefinite-singular":"hărțuieli","dative-definite-genitive-singular":"hărțuielii","dative-genitive-indefinite-plural":"hărțuieli","dative-definite-genitive-plural":"hărțuielilor","singular-vocative":"hărțuială","plural-vocative":"hărțuielilor"}},{"word":"hărțuire","pos":"noun","definitions":["harassment"],"forms":{"plural":"hărțuiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hărțuire","accusative-definite-nominative-singular":"hărțuirea","accusative-indefinite-nominative-plural":"hărțuiri","accusative-definite-nominative-plural":"hărțuirile","dative-genitive-indefinite-singular":"hărțuiri","dative-definite-genitive-singular":"hărțuirii","dative-genitive-indefinite-plural":"hărțuiri","dative-definite-genitive-plural":"hărțuirilor","singular-vocative":"hărțuire","plural-vocative":"hărțuirilor"}},{"word":"hărțuire sexuală","pos":"noun","definitions":["sexual harassment"],"forms":{"plural":"hărțuiri sexuale"}},{"word":"hârțuit","pos":"adj","definitions":["alternative form of hărțuit"],"forms":{"feminine-singular":"hârțuită","masculine-plural":"hârțuiți","feminine-neuter-plural":"hârțuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hârțuit","error-unrecognized-form-feminine-indefinite-singular":"hârțuită","error-unrecognized-form-indefinite-masculine-plural":"hârțuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hârțuite","definite-error-unrecognized-form-masculine-neuter-singular":"hârțuitul","definite-error-unrecognized-form-feminine-singular":"hârțuita","definite-error-unrecognized-form-masculine-plural":"hârțuiții","definite-error-unrecognized-form-feminine-neuter-plural":"hârțuitele"}},{"word":"hărțuit","pos":"adj","definitions":["harassed"],"forms":{"feminine-singular":"hărțuită","masculine-plural":"hărțuiți","feminine-neuter-plural":"hărțuite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hărțuit","error-unrecognized-form-feminine-indefinite-singular":"hărțuită","error-unrecognized-form-indefinite-masculine-plural":"hărțuiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hărțuite","definite-error-unrecognized-form-masculine-neuter-singular":"hărțuitul","definite-error-unrecognized-form-feminine-singular":"hărțuita","definite-error-unrecognized-form-masculine-plural":"hărțuiții","definite-error-unrecognized-form-feminine-neuter-plural":"hărțuitele"}},{"word":"hărțuitor","pos":"noun","definitions":["harasser"],"forms":{"plural":"hărțuitori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hărțuitor","accusative-definite-nominative-singular":"hărțuitorul","accusative-indefinite-nominative-plural":"hărțuitori","accusative-definite-nominative-plural":"hărțuitorii","dative-genitive-indefinite-singular":"hărțuitor","dative-definite-genitive-singular":"hărțuitorului","dative-genitive-indefinite-plural":"hărțuitori","dative-definite-genitive-plural":"hărțuitorilor","singular-vocative":"hărțuitorule","plural-vocative":"hărțuitorilor"}},{"word":"hărțulie","pos":"noun","definitions":["diminutive of hârtie"],"forms":{"plural":"hărțulii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hărțulie","accusative-definite-nominative":"hărțulia","dative-genitive-indefinite":"hărțulii","dative-definite-genitive":"hărțuliei","vocative":"hărțulie"}},{"word":"haruspiciu","pos":"noun","definitions":["Haruspice"],"forms":{"plural":"haruspicii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"haruspiciu","accusative-definite-nominative-singular":"haruspiciul","accusative-indefinite-nominative-plural":"haruspicii","accusative-definite-nominative-plural":"haruspiciii","dative-genitive-indefinite-singular":"haruspiciu","dative-definite-genitive-singular":"haruspiciului","dative-genitive-indefinite-plural":"haruspicii","dative-definite-genitive-plural":"haruspiciilor","singular-vocative":"haruspiciule","plural-vocative":"haruspiciilor"}},{"word":"hârzobaș","pos":"noun","definitions":["diminutive of hârzob"],"forms":{"plural":"hârzobașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hârzobaș","accusative-definite-nominative-singular":"hârzobașul","accusative-indefinite-nominative-plural":"hârzobașe","accusative-definite-nominative-plural":"hârzobașele","dative-genitive-indefinite-singular":"hârzobaș","dative-definite-genitive-singular":"hârzobașului","dative-genitive-indefinite-plural":"hârzobașe","dative-definite-genitive-plural":"hârzobașelor","singular-vocative":"hârzobașule","plural-vocative":"hârzobașelor"}},{"word":"Hașag","pos":"name","definitions":["a village in Loamneș, Sibiu County, Romania"],"gender":"m"},{"word":"Hasancea","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed as Valu lui Traian."],"gender":"f"},{"word":"Hasanlar","pos":"name","definitions":["a village in Dobruja, in eastern Romania. Renamed to Ardealu."],"gender":"m"},{"word":"hașchie","pos":"noun","definitions":["obsolete form of așchie"],"forms":{"plural":"hașchii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hașchie","accusative-definite-nominative-singular":"hașchia","accusative-indefinite-nominative-plural":"hașchii","accusative-definite-nominative-plural":"hașchiile","dative-genitive-indefinite-singular":"hașchii","dative-definite-genitive-singular":"hașchiei","dative-genitive-indefinite-plural":"hașchii","dative-definite-genitive-plural":"hașchiilor","singular-vocative":"hașchie","plural-vocative":"hașchiilor"}},{"word":"Hășcuța","pos":"name","definitions":["a river in Neamț County, Romania, tributary to the Hașca"],"gender":"f"},{"word":"Hășdat","pos":"name","definitions":["a village in Hunedoara, Hunedoara County, Romania"],"gender":"m"},{"word":"Hășdățan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hășdățan"}},{"word":"Hășdate","pos":"name","definitions":["a locality in Gherla, Cluj County, Romania","a village in Săvădisla, Cluj County, Romania"],"gender":"m"},{"word":"Hășdău","pos":"name","definitions":["a village in Toplița, Hunedoara County, Romania"],"gender":"m"},{"word":"hașeu","pos":"noun","definitions":["alternative form of hașe"],"forms":{"plural":"hașeuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hașeu","accusative-definite-nominative-singular":"hașeuul","accusative-indefinite-nominative-plural":"hașeuri","accusative-definite-nominative-plural":"hașeurile","dative-genitive-indefinite-singular":"hașeu","dative-definite-genitive-singular":"hașeuului","dative-genitive-indefinite-plural":"hașeuri","dative-definite-genitive-plural":"hașeurilor","singular-vocative":"hașeuule","plural-vocative":"hașeurilor"}},{"word":"Hașfălău","pos":"name","definitions":["a village in Mureș County, Romania. Renamed to Vânători in 1925."],"gender":"m"},{"word":"hasidism","pos":"noun","definitions":["Hassidism"]},{"word":"Hașiduluc","pos":"name","definitions":["a village in Constanța County, in eastern Romania. Renamed to Cumpăna."],"gender":"m"},{"word":"hașiș","pos":"noun","definitions":["hashish"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hașiș","accusative-definite-nominative":"hașișul","dative-genitive-indefinite":"hașiș","dative-definite-genitive":"hașișului","vocative":"hașișule"}},{"word":"hașișism","pos":"noun","definitions":["hashish dependency"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hașișism","accusative-definite-nominative":"hașișismul","dative-genitive-indefinite":"hașișism","dative-definite-genitive":"hașișismului","vocative":"hașișismule"}},{"word":"hașleiță","pos":"noun","definitions":["match (device to make fire)"],"forms":{"plural":"hașleițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hașleiță","accusative-definite-nominative-singular":"hașleița","accusative-indefinite-nominative-plural":"hașleițe","accusative-definite-nominative-plural":"hașleițele","dative-genitive-indefinite-singular":"hașleițe","dative-definite-genitive-singular":"hașleiței","dative-genitive-indefinite-plural":"hașleițe","dative-definite-genitive-plural":"hașleițelor","singular-vocative":"hașleiță","plural-vocative":"hașleițelor"}},{"word":"hașmă","pos":"noun","definitions":["shallot"],"forms":{"plural":"hașme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hașmă","accusative-definite-nominative-singular":"hașma","accusative-indefinite-nominative-plural":"hașme","accusative-definite-nominative-plural":"hașmele","dative-genitive-indefinite-singular":"hașme","dative-definite-genitive-singular":"hașmei","dative-genitive-indefinite-plural":"hașme","dative-definite-genitive-plural":"hașmelor","singular-vocative":"hașmă","plural-vocative":"hașmelor"}},{"word":"hașmaciucă","pos":"noun","definitions":["alternative form of hasmațuchi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hașmaciucă","accusative-definite-nominative":"hașmaciuca","dative-genitive-indefinite":"hașmaciuce","dative-definite-genitive":"hașmaciucei","vocative":"hașmaciucă"}},{"word":"Hășmaș","pos":"name","definitions":["a commune of Arad County, Romania","a village in Hășmaș, Arad County, Romania","a village in Șimișna, Sălaj County, Romania"],"gender":"m"},{"word":"Hăsmășan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hăsmășan"}},{"word":"Hășmășan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hășmășan"}},{"word":"Hășmașu Ciceului","pos":"name","definitions":["a village in Uriu, Bistrița-Năsăud County, Romania"],"gender":"m"},{"word":"Hasmațuchi","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hasmațuchi"}},{"word":"hasmațuchi","pos":"noun","definitions":["chervil (spice)"],"pronunciation":"/has.maˈt͡sukʲ/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hasmațuchi","accusative-definite-nominative":"hasmațuchiul","dative-genitive-indefinite":"hasmațuchi","dative-definite-genitive":"hasmațuchiului","vocative":"hasmațuchiule"}},{"word":"hașme","pos":"noun","definitions":["plural of hașmă"]},{"word":"hasnă","pos":"noun","definitions":["use"],"forms":{"plural":"hasne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hasnă","accusative-definite-nominative-singular":"hasna","accusative-indefinite-nominative-plural":"hasne","accusative-definite-nominative-plural":"hasnele","dative-genitive-indefinite-singular":"hasne","dative-definite-genitive-singular":"hasnei","dative-genitive-indefinite-plural":"hasne","dative-definite-genitive-plural":"hasnelor","singular-vocative":"hasnă","plural-vocative":"hasnelor"}},{"word":"hăsnar","pos":"noun","definitions":["fruitmonger"],"forms":{"plural":"hăsnari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hăsnar","accusative-definite-nominative-singular":"hăsnarul","accusative-indefinite-nominative-plural":"hăsnari","accusative-definite-nominative-plural":"hăsnarii","dative-genitive-indefinite-singular":"hăsnar","dative-definite-genitive-singular":"hăsnarului","dative-genitive-indefinite-plural":"hăsnari","dative-definite-genitive-plural":"hăsnarilor","singular-vocative":"hăsnarule","plural-vocative":"hăsnarilor"}},{"word":"hăsnaș","pos":"adj","definitions":["useful"],"forms":{"feminine-singular":"hăsnașă","masculine-plural":"hăsnași","feminine-neuter-plural":"hăsnașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hăsnaș","error-unrecognized-form-feminine-indefinite-singular":"hăsnașă","error-unrecognized-form-indefinite-masculine-plural":"hăsnași","error-unrecognized-form-feminine-indefinite-neuter-plural":"hăsnașe","definite-error-unrecognized-form-masculine-neuter-singular":"hăsnașul","definite-error-unrecognized-form-feminine-singular":"hăsnașa","definite-error-unrecognized-form-masculine-plural":"hăsnașii","definite-error-unrecognized-form-feminine-neuter-plural":"hăsnașele"}},{"word":"Hăsnășenii Mari","pos":"name","definitions":["a village in Hăsnășenii Mari, Drochia Raion, Moldova","a commune of Drochia Raion, Moldova"],"gender":"m"},{"word":"Hăsnășenii Noi","pos":"name","definitions":["a village in Hăsnășenii Noi, Drochia Raion, Moldova","a commune of Drochia Raion, Moldova"],"gender":"m"},{"word":"hăsnuială","pos":"noun","definitions":["use"],"forms":{"plural":"hăsnuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hăsnuială","accusative-definite-nominative-singular":"hăsnuiala","accusative-indefinite-nominative-plural":"hăsnuiele","accusative-definite-nominative-plural":"hăsnuielele","dative-genitive-indefinite-singular":"hăsnuiele","dative-definite-genitive-singular":"hăsnuielei","dative-genitive-indefinite-plural":"hăsnuiele","dative-definite-genitive-plural":"hăsnuielelor","singular-vocative":"hăsnuială","plural-vocative":"hăsnuielelor"}},{"word":"hassiu","pos":"noun","definitions":["hassium (chemical element with atomic number 108)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hassiu","accusative-definite-nominative":"hassiul","dative-genitive-indefinite":"hassiu","dative-definite-genitive":"hassiului","vocative":"hassiule"}},{"word":"hașura","pos":"verb","definitions":["to shade"],"forms":{"canonical":"a hașura 1st conjugation","present-singular-third-person":"hașurează","participle-past":"hașurat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hașura","gerund":"hașurând","first-person-indicative-present-singular":"hașurez","indicative-present-second-person-singular":"hașurezi","indicative-present-singular-third-person":"hașurează","first-person-indicative-plural-present":"hașurăm","indicative-plural-present-second-person":"hașurați","indicative-plural-present-third-person":"hașurează","first-person-imperfect-indicative-singular":"hașuram","imperfect-indicative-second-person-singular":"hașurai","imperfect-indicative-singular-third-person":"hașura","first-person-imperfect-indicative-plural":"hașuram","imperfect-indicative-plural-second-person":"hașurați","imperfect-indicative-plural-third-person":"hașurau","first-person-indicative-perfect-singular":"hașurai","indicative-perfect-second-person-singular":"hașurași","indicative-perfect-singular-third-person":"hașură","first-person-indicative-perfect-plural":"hașurarăm","indicative-perfect-plural-second-person":"hașurarăți","indicative-perfect-plural-third-person":"hașurară","first-person-indicative-pluperfect-singular":"hașurasem","indicative-pluperfect-second-person-singular":"hașuraseși","indicative-pluperfect-singular-third-person":"hașurase","first-person-indicative-pluperfect-plural":"hașuraserăm","indicative-pluperfect-plural-second-person":"hașuraserăți","indicative-pluperfect-plural-third-person":"hașuraseră","first-person-present-singular-subjunctive":"să hașurez","present-second-person-singular-subjunctive":"să hașurezi","present-singular-subjunctive-third-person":"să hașureze","first-person-plural-present-subjunctive":"să hașurăm","plural-present-second-person-subjunctive":"să hașurați","plural-present-subjunctive-third-person":"să hașureze","imperative-second-person-singular":"hașurează","imperative-plural-second-person":"hașurați","imperative-negative-second-person-singular":"nu hașura","imperative-negative-plural-second-person":"nu hașurați"}},{"word":"hașură","pos":"noun","definitions":["hatch"],"forms":{"plural":"hașuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hașură","accusative-definite-nominative-singular":"hașura","accusative-indefinite-nominative-plural":"hașuri","accusative-definite-nominative-plural":"hașurile","dative-genitive-indefinite-singular":"hașuri","dative-definite-genitive-singular":"hașurii","dative-genitive-indefinite-plural":"hașuri","dative-definite-genitive-plural":"hașurilor","singular-vocative":"hașură","plural-vocative":"hașurilor"}},{"word":"hașurare","pos":"noun","definitions":["shading"],"forms":{"plural":"hașurări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hașurare","accusative-definite-nominative-singular":"hașurarea","accusative-indefinite-nominative-plural":"hașurări","accusative-definite-nominative-plural":"hașurările","dative-genitive-indefinite-singular":"hașurări","dative-definite-genitive-singular":"hașurării","dative-genitive-indefinite-plural":"hașurări","dative-definite-genitive-plural":"hașurărilor","singular-vocative":"hașurare","plural-vocative":"hașurărilor"}},{"word":"hașurat","pos":"adj","definitions":["hatched"],"forms":{"feminine-singular":"hașurată","masculine-plural":"hașurați","feminine-neuter-plural":"hașurate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hașurat","error-unrecognized-form-feminine-indefinite-singular":"hașurată","error-unrecognized-form-indefinite-masculine-plural":"hașurați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hașurate","definite-error-unrecognized-form-masculine-neuter-singular":"hașuratul","definite-error-unrecognized-form-feminine-singular":"hașurata","definite-error-unrecognized-form-masculine-plural":"hașurații","definite-error-unrecognized-form-feminine-neuter-plural":"hașuratele"}},{"word":"hașurator","pos":"noun","definitions":["hatcher"],"forms":{"plural":"hașuratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hașurator","accusative-definite-nominative-singular":"hașuratorul","accusative-indefinite-nominative-plural":"hașuratoare","accusative-definite-nominative-plural":"hașuratoarele","dative-genitive-indefinite-singular":"hașurator","dative-definite-genitive-singular":"hașuratorului","dative-genitive-indefinite-plural":"hașuratoare","dative-definite-genitive-plural":"hașuratoarelor","singular-vocative":"hașuratorule","plural-vocative":"hașuratoarelor"}},{"word":"haț","pos":"intj","definitions":["used to express or imitate the sound of a quick motion, such as when taking something by surprise; snap!"],"pronunciation":"/hat͡s/"},{"word":"hăt","pos":"adv","definitions":["very"]},{"word":"hăț","pos":"noun","definitions":["bridle","noose"],"forms":{"plural":"hățuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hăț","accusative-definite-nominative-singular":"hățul","accusative-indefinite-nominative-plural":"hățuri","accusative-definite-nominative-plural":"hățurile","dative-genitive-indefinite-singular":"hăț","dative-definite-genitive-singular":"hățului","dative-genitive-indefinite-plural":"hățuri","dative-definite-genitive-plural":"hățurilor","singular-vocative":"hățule","plural-vocative":"hățurilor"}},{"word":"hata","pos":"noun","definitions":["damage, disaster"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hata","accusative-definite-nominative":"{{{def}}}","dative-genitive-indefinite":"hatale","dative-definite-genitive":"hatalei","vocative":"-"}},{"word":"Hațăgan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hațăgan"}},{"word":"Hățăgan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hățăgan"}},{"word":"Hățăgel","pos":"name","definitions":["a village in Densuș, Hunedoara County, Romania"],"gender":"m"},{"word":"hâțâi","pos":"verb","definitions":["to jiggle"],"forms":{"canonical":"a hâțâi 4th conjugation","present-singular-third-person":"hâțâie","participle-past":"hâțâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hâțâi","gerund":"hâțâind","first-person-indicative-present-singular":"hâțâi","indicative-present-second-person-singular":"hâțâi","indicative-present-singular-third-person":"hâțâie","first-person-indicative-plural-present":"hâțâim","indicative-plural-present-second-person":"hâțâiți","indicative-plural-present-third-person":"hâțâie","first-person-imperfect-indicative-singular":"hâțâiam","imperfect-indicative-second-person-singular":"hâțâiai","imperfect-indicative-singular-third-person":"hâțâia","first-person-imperfect-indicative-plural":"hâțâiam","imperfect-indicative-plural-second-person":"hâțâiați","imperfect-indicative-plural-third-person":"hâțâiau","first-person-indicative-perfect-singular":"hâțâii","indicative-perfect-second-person-singular":"hâțâiși","indicative-perfect-singular-third-person":"hâțâi","first-person-indicative-perfect-plural":"hâțâirăm","indicative-perfect-plural-second-person":"hâțâirăți","indicative-perfect-plural-third-person":"hâțâiră","first-person-indicative-pluperfect-singular":"hâțâisem","indicative-pluperfect-second-person-singular":"hâțâiseși","indicative-pluperfect-singular-third-person":"hâțâise","first-person-indicative-pluperfect-plural":"hâțâiserăm","indicative-pluperfect-plural-second-person":"hâțâiserăți","indicative-pluperfect-plural-third-person":"hâțâiseră","first-person-present-singular-subjunctive":"să hâțâi","present-second-person-singular-subjunctive":"să hâțâi","present-singular-subjunctive-third-person":"să hâțâie","first-person-plural-present-subjunctive":"să hâțâim","plural-present-second-person-subjunctive":"să hâțâiți","plural-present-subjunctive-third-person":"să hâțâie","imperative-second-person-singular":"hâțâie","imperative-plural-second-person":"hâțâiți","imperative-negative-second-person-singular":"nu hâțâi","imperative-negative-plural-second-person":"nu hâțâiți"}},{"word":"hataia","pos":"noun","definitions":["a silk fabric"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hataia","accusative-definite-nominative":"hataiaua","dative-genitive-indefinite":"hataiele","dative-definite-genitive":"hataielei","vocative":"-"}},{"word":"hătălic","pos":"noun","definitions":["boy"],"forms":{"plural":"hătălici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hătălic","accusative-definite-nominative-singular":"hătălicul","accusative-indefinite-nominative-plural":"hătălici","accusative-definite-nominative-plural":"hătălicii","dative-genitive-indefinite-singular":"hătălic","dative-definite-genitive-singular":"hătălicului","dative-genitive-indefinite-plural":"hătălici","dative-definite-genitive-plural":"hătălicilor","singular-vocative":"hătălicule","plural-vocative":"hătălicilor"}},{"word":"hâțâna","pos":"verb","definitions":["to shake"],"forms":{"canonical":"a hâțâna 1st conjugation","present-singular-third-person":"hâțână","participle-past":"hâțânat","table-tags":"conjugation-1","inflection-template":"ro-conj-a","infinitive":"a hâțâna","gerund":"hâțânând","first-person-indicative-present-singular":"hâțân","indicative-present-second-person-singular":"hâțâni","indicative-present-singular-third-person":"hâțână","first-person-indicative-plural-present":"hâțânăm","indicative-plural-present-second-person":"hâțânați","indicative-plural-present-third-person":"hâțână","first-person-imperfect-indicative-singular":"hâțânam","imperfect-indicative-second-person-singular":"hâțânai","imperfect-indicative-singular-third-person":"hâțâna","first-person-imperfect-indicative-plural":"hâțânam","imperfect-indicative-plural-second-person":"hâțânați","imperfect-indicative-plural-third-person":"hâțânau","first-person-indicative-perfect-singular":"hâțânai","indicative-perfect-second-person-singular":"hâțânași","indicative-perfect-singular-third-person":"hâțână","first-person-indicative-perfect-plural":"hâțânarăm","indicative-perfect-plural-second-person":"hâțânarăți","indicative-perfect-plural-third-person":"hâțânară","first-person-indicative-pluperfect-singular":"hâțânasem","indicative-pluperfect-second-person-singular":"hâțânaseși","indicative-pluperfect-singular-third-person":"hâțânase","first-person-indicative-pluperfect-plural":"hâțânaserăm","indicative-pluperfect-plural-second-person":"hâțânaserăți","indicative-pluperfect-plural-third-person":"hâțânaseră","first-person-present-singular-subjunctive":"să hâțân","present-second-person-singular-subjunctive":"să hâțâni","present-singular-subjunctive-third-person":"să hâțâne","first-person-plural-present-subjunctive":"să hâțânăm","plural-present-second-person-subjunctive":"să hâțânați","plural-present-subjunctive-third-person":"să hâțâne","imperative-second-person-singular":"hâțână","imperative-plural-second-person":"hâțânați","imperative-negative-second-person-singular":"nu hâțâna","imperative-negative-plural-second-person":"nu hâțânați"}},{"word":"hatâr","pos":"noun","definitions":["pleasure"],"forms":{"plural":"hatâruri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hatâr","accusative-definite-nominative-singular":"hatârul","accusative-indefinite-nominative-plural":"hatâruri","accusative-definite-nominative-plural":"hatârurile","dative-genitive-indefinite-singular":"hatâr","dative-definite-genitive-singular":"hatârului","dative-genitive-indefinite-plural":"hatâruri","dative-definite-genitive-plural":"hatârurilor","singular-vocative":"hatârule","plural-vocative":"hatârurilor"}},{"word":"hâtcâi","pos":"verb","definitions":["to alternative form of hătcăi"],"forms":{"canonical":"a hâtcâi 4th conjugation","present-singular-third-person":"hâtcâiește","participle-past":"hâtcâit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hâtcâi","gerund":"hâtcâind","first-person-indicative-present-singular":"hâtcâiesc","indicative-present-second-person-singular":"hâtcâiești","indicative-present-singular-third-person":"hâtcâiește","first-person-indicative-plural-present":"hâtcâim","indicative-plural-present-second-person":"hâtcâiți","indicative-plural-present-third-person":"hâtcâiesc","first-person-imperfect-indicative-singular":"hâtcâiam","imperfect-indicative-second-person-singular":"hâtcâiai","imperfect-indicative-singular-third-person":"hâtcâia","first-person-imperfect-indicative-plural":"hâtcâiam","imperfect-indicative-plural-second-person":"hâtcâiați","imperfect-indicative-plural-third-person":"hâtcâiau","first-person-indicative-perfect-singular":"hâtcâii","indicative-perfect-second-person-singular":"hâtcâiși","indicative-perfect-singular-third-person":"hâtcâi","first-person-indicative-perfect-plural":"hâtcâirăm","indicative-perfect-plural-second-person":"hâtcâirăți","indicative-perfect-plural-third-person":"hâtcâiră","first-person-indicative-pluperfect-singular":"hâtcâisem","indicative-pluperfect-second-person-singular":"hâtcâiseși","indicative-pluperfect-singular-third-person":"hâtcâise","first-person-indicative-pluperfect-plural":"hâtcâiserăm","indicative-pluperfect-plural-second-person":"hâtcâiserăți","indicative-pluperfect-plural-third-person":"hâtcâiseră","first-person-present-singular-subjunctive":"să hâtcâiesc","present-second-person-singular-subjunctive":"să hâtcâiești","present-singular-subjunctive-third-person":"să hâtcâiască","first-person-plural-present-subjunctive":"să hâtcâim","plural-present-second-person-subjunctive":"să hâtcâiți","plural-present-subjunctive-third-person":"să hâtcâiască","imperative-second-person-singular":"hâtcâiește","imperative-plural-second-person":"hâtcâiți","imperative-negative-second-person-singular":"nu hâtcâi","imperative-negative-plural-second-person":"nu hâtcâiți"}},{"word":"hate","pos":"noun","definitions":["hate (hateful or spiteful comments, especially online)"],"pronunciation":"/hejt/","forms":{"table-tags":"no-table-tags","accusative-indefinite-nominative":"hate","accusative-definite-nominative":"hate-ul","dative-genitive-indefinite":"hate","dative-definite-genitive":"hate-ului","vocative":"-"}},{"word":"Hațeg","pos":"name","definitions":["a village in Adamclisi, Constanța County, Romania","a town in Hunedoara County, Romania"],"gender":"m"},{"word":"Hațegan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hațegan"}},{"word":"hațegan","pos":"noun","definitions":["native or inhabitant of the town of Haţeg, Hunedoara County, Romania (usually male)"],"forms":{"plural":"hațegani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hațegan","accusative-definite-nominative-singular":"hațeganul","accusative-indefinite-nominative-plural":"hațegani","accusative-definite-nominative-plural":"hațeganii","dative-genitive-indefinite-singular":"hațegan","dative-definite-genitive-singular":"hațeganului","dative-genitive-indefinite-plural":"hațegani","dative-definite-genitive-plural":"hațeganilor","singular-vocative":"hațeganule","plural-vocative":"hațeganilor"}},{"word":"Hațegana","pos":"name","definitions":["a village in Vințu de Jos, Alba County, Romania"],"gender":"f"},{"word":"hațegana","pos":"noun","definitions":["definite nominative/accusative singular of hațegană"]},{"word":"hațegană","pos":"noun","definitions":["female equivalent of hațegan"],"forms":{"plural":"hațegane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hațegană","accusative-definite-nominative-singular":"hațegana","accusative-indefinite-nominative-plural":"hațegane","accusative-definite-nominative-plural":"hațeganele","dative-genitive-indefinite-singular":"hațegane","dative-definite-genitive-singular":"hațeganei","dative-genitive-indefinite-plural":"hațegane","dative-definite-genitive-plural":"hațeganelor","singular-vocative":"hațegană","plural-vocative":"hațeganelor"}},{"word":"hațegancă","pos":"noun","definitions":["female equivalent of hațegan"],"forms":{"plural":"hațegance","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hațegancă","accusative-definite-nominative-singular":"hațeganca","accusative-indefinite-nominative-plural":"hațegance","accusative-definite-nominative-plural":"hațegancele","dative-genitive-indefinite-singular":"hațegance","dative-definite-genitive-singular":"hațegancei","dative-genitive-indefinite-plural":"hațegance","dative-definite-genitive-plural":"hațegancelor","singular-vocative":"hațegancă","plural-vocative":"hațegancelor"}},{"word":"hăței","pos":"noun","definitions":["diminutive of hățaș"],"forms":{"plural":"hățeie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hăței","accusative-definite-nominative-singular":"hățeiul","accusative-indefinite-nominative-plural":"hățeie","accusative-definite-nominative-plural":"hățeiele","dative-genitive-indefinite-singular":"hăței","dative-definite-genitive-singular":"hățeiului","dative-genitive-indefinite-plural":"hățeie","dative-definite-genitive-plural":"hățeielor","singular-vocative":"hățeiule","plural-vocative":"hățeielor"}},{"word":"hater","pos":"noun","definitions":["hater"],"pronunciation":"/ˈhej.ter/","forms":{"plural":"hateri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hater","accusative-definite-nominative-singular":"haterul","accusative-indefinite-nominative-plural":"hateri","accusative-definite-nominative-plural":"haterii","dative-genitive-indefinite-singular":"hater","dative-definite-genitive-singular":"haterului","dative-genitive-indefinite-plural":"hateri","dative-definite-genitive-plural":"haterilor","singular-vocative":"haterule","plural-vocative":"haterilor"}},{"word":"hateș","pos":"noun","definitions":["neighboring"],"forms":{"plural":"hateși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hateș","accusative-definite-nominative-singular":"hateșul","accusative-indefinite-nominative-plural":"hateși","accusative-definite-nominative-plural":"hateșii","dative-genitive-indefinite-singular":"hateș","dative-definite-genitive-singular":"hateșului","dative-genitive-indefinite-plural":"hateși","dative-definite-genitive-plural":"hateșilor","singular-vocative":"hateșule","plural-vocative":"hateșilor"}},{"word":"Hațiegan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hațiegan"}},{"word":"Hațieganu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hațieganu"}},{"word":"Hațigan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hațigan"}},{"word":"hatihumaium","pos":"noun","definitions":["hatti-sherif"],"forms":{"plural":"hatihumaiumuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hatihumaium","accusative-definite-nominative-singular":"hatihumaiumul","accusative-indefinite-nominative-plural":"hatihumaiumuri","accusative-definite-nominative-plural":"hatihumaiumurile","dative-genitive-indefinite-singular":"hatihumaium","dative-definite-genitive-singular":"hatihumaiumului","dative-genitive-indefinite-plural":"hatihumaiumuri","dative-definite-genitive-plural":"hatihumaiumurilor","singular-vocative":"hatihumaiumule","plural-vocative":"hatihumaiumurilor"}},{"word":"hățiș","pos":"noun","definitions":["thicket"],"forms":{"plural":"hățișuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hățiș","accusative-definite-nominative-singular":"hățișul","accusative-indefinite-nominative-plural":"hățișuri","accusative-definite-nominative-plural":"hățișurile","dative-genitive-indefinite-singular":"hățiș","dative-definite-genitive-singular":"hățișului","dative-genitive-indefinite-plural":"hățișuri","dative-definite-genitive-plural":"hățișurilor","singular-vocative":"hățișule","plural-vocative":"hățișurilor"}},{"word":"hatișerif","pos":"noun","definitions":["hatti-sherif"],"forms":{"plural":"hatișerifuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hatișerif","accusative-definite-nominative-singular":"hatișeriful","accusative-indefinite-nominative-plural":"hatișerifuri","accusative-definite-nominative-plural":"hatișerifurile","dative-genitive-indefinite-singular":"hatișerif","dative-definite-genitive-singular":"hatișerifului","dative-genitive-indefinite-plural":"hatișerifuri","dative-definite-genitive-plural":"hatișerifurilor","singular-vocative":"hatișerifule","plural-vocative":"hatișerifurilor"}},{"word":"hatiță","pos":"noun","definitions":["loose woman"],"forms":{"plural":"hatițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hatiță","accusative-definite-nominative-singular":"hatița","accusative-indefinite-nominative-plural":"hatițe","accusative-definite-nominative-plural":"hatițele","dative-genitive-indefinite-singular":"hatițe","dative-definite-genitive-singular":"hatiței","dative-genitive-indefinite-plural":"hatițe","dative-definite-genitive-plural":"hatițelor","singular-vocative":"hatiță","plural-vocative":"hatițelor"}},{"word":"Hatman","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hatman"}},{"word":"hatman","pos":"noun","definitions":["hetman"],"forms":{"plural":"hatmani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hatman","accusative-definite-nominative-singular":"hatmanul","accusative-indefinite-nominative-plural":"hatmani","accusative-definite-nominative-plural":"hatmanii","dative-genitive-indefinite-singular":"hatman","dative-definite-genitive-singular":"hatmanului","dative-genitive-indefinite-plural":"hatmani","dative-definite-genitive-plural":"hatmanilor","singular-vocative":"hatmanule","plural-vocative":"hatmanilor"}},{"word":"hătmăneasă","pos":"noun","definitions":["female equivalent of hatman"],"forms":{"plural":"hătmănese","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hătmăneasă","accusative-definite-nominative-singular":"hătmăneasa","accusative-indefinite-nominative-plural":"hătmănese","accusative-definite-nominative-plural":"hătmănesele","dative-genitive-indefinite-singular":"hătmănese","dative-definite-genitive-singular":"hătmănesei","dative-genitive-indefinite-plural":"hătmănese","dative-definite-genitive-plural":"hătmăneselor","singular-vocative":"hătmăneasă","plural-vocative":"hătmăneselor"}},{"word":"hătmănesc","pos":"adj","definitions":["hetman"],"forms":{"feminine-singular":"hătmănească","plural":"hătmănești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hătmănesc","error-unrecognized-form-feminine-indefinite-singular":"hătmănească","error-unrecognized-form-indefinite-masculine-plural":"hătmănești","error-unrecognized-form-feminine-indefinite-neuter-plural":"hătmănești","definite-error-unrecognized-form-masculine-neuter-singular":"hătmănescul","definite-error-unrecognized-form-feminine-singular":"hătmăneasca","definite-error-unrecognized-form-masculine-plural":"hătmăneștii","definite-error-unrecognized-form-feminine-neuter-plural":"hătmăneștile"}},{"word":"hatmanie","pos":"noun","definitions":["alternative form of hătmănie"],"forms":{"plural":"hatmanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hatmanie","accusative-definite-nominative-singular":"hatmania","accusative-indefinite-nominative-plural":"hatmanii","accusative-definite-nominative-plural":"hatmaniile","dative-genitive-indefinite-singular":"hatmanii","dative-definite-genitive-singular":"hatmaniei","dative-genitive-indefinite-plural":"hatmanii","dative-definite-genitive-plural":"hatmaniilor","singular-vocative":"hatmanie","plural-vocative":"hatmaniilor"}},{"word":"hătmănie","pos":"noun","definitions":["hetmanship"],"forms":{"plural":"hătmănii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hătmănie","accusative-definite-nominative-singular":"hătmănia","accusative-indefinite-nominative-plural":"hătmănii","accusative-definite-nominative-plural":"hătmăniile","dative-genitive-indefinite-singular":"hătmănii","dative-definite-genitive-singular":"hătmăniei","dative-genitive-indefinite-plural":"hătmănii","dative-definite-genitive-plural":"hătmăniilor","singular-vocative":"hătmănie","plural-vocative":"hătmăniilor"}},{"word":"Hatmanu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hatmanu"}},{"word":"Hatnuța","pos":"name","definitions":["a river in Suceava, Romania, tributary to the Suceava"],"gender":"f"},{"word":"hâtră","pos":"noun","definitions":["female equivalent of hâtru"],"forms":{"plural":"hâtre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hâtră","accusative-definite-nominative-singular":"hâtra","accusative-indefinite-nominative-plural":"hâtre","accusative-definite-nominative-plural":"hâtrele","dative-genitive-indefinite-singular":"hâtre","dative-definite-genitive-singular":"hâtrei","dative-genitive-indefinite-plural":"hâtre","dative-definite-genitive-plural":"hâtrelor","singular-vocative":"hâtră","plural-vocative":"hâtrelor"}},{"word":"hâtrie","pos":"noun","definitions":["deception","pride"],"forms":{"plural":"hâtrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hâtrie","accusative-definite-nominative-singular":"hâtria","accusative-indefinite-nominative-plural":"hâtrii","accusative-definite-nominative-plural":"hâtriile","dative-genitive-indefinite-singular":"hâtrii","dative-definite-genitive-singular":"hâtriei","dative-genitive-indefinite-plural":"hâtrii","dative-definite-genitive-plural":"hâtriilor","singular-vocative":"hâtrie","plural-vocative":"hâtriilor"}},{"word":"Hâtru","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hâtru"}},{"word":"hâtru","pos":"adj","definitions":["waggish, witty, jocular"],"forms":{"feminine-singular":"hâtră","masculine-plural":"hâtri","feminine-neuter-plural":"hâtre","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hâtru","error-unrecognized-form-feminine-indefinite-singular":"hâtră","error-unrecognized-form-indefinite-masculine-plural":"hâtri","error-unrecognized-form-feminine-indefinite-neuter-plural":"hâtre","definite-error-unrecognized-form-masculine-neuter-singular":"hâtrul","definite-error-unrecognized-form-feminine-singular":"hâtra","definite-error-unrecognized-form-masculine-plural":"hâtrii","definite-error-unrecognized-form-feminine-neuter-plural":"hâtrele"}},{"word":"hățui","pos":"verb","definitions":["to bridle"],"forms":{"canonical":"a hățui 4th conjugation","present-singular-third-person":"hățuiește","participle-past":"hățuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hățui","gerund":"hățuind","first-person-indicative-present-singular":"hățuiesc","indicative-present-second-person-singular":"hățuiești","indicative-present-singular-third-person":"hățuiește","first-person-indicative-plural-present":"hățuim","indicative-plural-present-second-person":"hățuiți","indicative-plural-present-third-person":"hățuiesc","first-person-imperfect-indicative-singular":"hățuiam","imperfect-indicative-second-person-singular":"hățuiai","imperfect-indicative-singular-third-person":"hățuia","first-person-imperfect-indicative-plural":"hățuiam","imperfect-indicative-plural-second-person":"hățuiați","imperfect-indicative-plural-third-person":"hățuiau","first-person-indicative-perfect-singular":"hățuii","indicative-perfect-second-person-singular":"hățuiși","indicative-perfect-singular-third-person":"hățui","first-person-indicative-perfect-plural":"hățuirăm","indicative-perfect-plural-second-person":"hățuirăți","indicative-perfect-plural-third-person":"hățuiră","first-person-indicative-pluperfect-singular":"hățuisem","indicative-pluperfect-second-person-singular":"hățuiseși","indicative-pluperfect-singular-third-person":"hățuise","first-person-indicative-pluperfect-plural":"hățuiserăm","indicative-pluperfect-plural-second-person":"hățuiserăți","indicative-pluperfect-plural-third-person":"hățuiseră","first-person-present-singular-subjunctive":"să hățuiesc","present-second-person-singular-subjunctive":"să hățuiești","present-singular-subjunctive-third-person":"să hățuiască","first-person-plural-present-subjunctive":"să hățuim","plural-present-second-person-subjunctive":"să hățuiți","plural-present-subjunctive-third-person":"să hățuiască","imperative-second-person-singular":"hățuiește","imperative-plural-second-person":"hățuiți","imperative-negative-second-person-singular":"nu hățui","imperative-negative-plural-second-person":"nu hățuiți"}},{"word":"hau","pos":"intj","definitions":["woof (the sound a barking dog makes)"],"pronunciation":"/haw/","forms":{"canonical":"hau!"}},{"word":"hău","pos":"noun","definitions":["abyss"],"forms":{"plural":"hăuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hău","accusative-definite-nominative-singular":"hăuul","accusative-indefinite-nominative-plural":"hăuri","accusative-definite-nominative-plural":"hăurile","dative-genitive-indefinite-singular":"hău","dative-definite-genitive-singular":"hăuului","dative-genitive-indefinite-plural":"hăuri","dative-definite-genitive-plural":"hăurilor","singular-vocative":"hăuule","plural-vocative":"hăurilor"}},{"word":"Hăucă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hăucă"}},{"word":"Hăucești","pos":"name","definitions":["a village in Chișlaz, Bihor County, Romania"],"gender":"m"},{"word":"hăugaș","pos":"noun","definitions":["alternative form of făgaș"],"forms":{"plural":"hăugașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hăugaș","accusative-definite-nominative-singular":"hăugașul","accusative-indefinite-nominative-plural":"hăugașe","accusative-definite-nominative-plural":"hăugașele","dative-genitive-indefinite-singular":"hăugaș","dative-definite-genitive-singular":"hăugașului","dative-genitive-indefinite-plural":"hăugașe","dative-definite-genitive-plural":"hăugașelor","singular-vocative":"hăugașule","plural-vocative":"hăugașelor"}},{"word":"hăui","pos":"verb","definitions":["to alternative form of aui"],"forms":{"canonical":"a hăui 4th conjugation","present-singular-third-person":"hăuiește","participle-past":"hăuit","table-tags":"conjugation-4","inflection-template":"ro-conj-i","infinitive":"a hăui","gerund":"hăuind","first-person-indicative-present-singular":"hăui","indicative-present-second-person-singular":"hăui","indicative-present-singular-third-person":"hăuie","first-person-indicative-plural-present":"hăuim","indicative-plural-present-second-person":"hăuiți","indicative-plural-present-third-person":"hăuie","first-person-imperfect-indicative-singular":"hăuiam","imperfect-indicative-second-person-singular":"hăuiai","imperfect-indicative-singular-third-person":"hăuia","first-person-imperfect-indicative-plural":"hăuiam","imperfect-indicative-plural-second-person":"hăuiați","imperfect-indicative-plural-third-person":"hăuiau","first-person-indicative-perfect-singular":"hăuii","indicative-perfect-second-person-singular":"hăuiși","indicative-perfect-singular-third-person":"hăui","first-person-indicative-perfect-plural":"hăuirăm","indicative-perfect-plural-second-person":"hăuirăți","indicative-perfect-plural-third-person":"hăuiră","first-person-indicative-pluperfect-singular":"hăuisem","indicative-pluperfect-second-person-singular":"hăuiseși","indicative-pluperfect-singular-third-person":"hăuise","first-person-indicative-pluperfect-plural":"hăuiserăm","indicative-pluperfect-plural-second-person":"hăuiserăți","indicative-pluperfect-plural-third-person":"hăuiseră","first-person-present-singular-subjunctive":"să hăui","present-second-person-singular-subjunctive":"să hăui","present-singular-subjunctive-third-person":"să hăuie","first-person-plural-present-subjunctive":"să hăuim","plural-present-second-person-subjunctive":"să hăuiți","plural-present-subjunctive-third-person":"să hăuie","imperative-second-person-singular":"hăuie","imperative-plural-second-person":"hăuiți","imperative-negative-second-person-singular":"nu hăui","imperative-negative-plural-second-person":"nu hăuiți"}},{"word":"hăuială","pos":"noun","definitions":["alternative form of auială"],"forms":{"plural":"hăuieli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hăuială","accusative-definite-nominative-singular":"hăuiala","accusative-indefinite-nominative-plural":"hăuiele","accusative-definite-nominative-plural":"hăuielele","dative-genitive-indefinite-singular":"hăuiele","dative-definite-genitive-singular":"hăuielei","dative-genitive-indefinite-plural":"hăuiele","dative-definite-genitive-plural":"hăuielelor","singular-vocative":"hăuială","plural-vocative":"hăuielelor"}},{"word":"hăuit","pos":"noun","definitions":["alternative form of auit"],"forms":{"plural":"hăuituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hăuit","accusative-definite-nominative-singular":"hăuitul","accusative-indefinite-nominative-plural":"hăuituri","accusative-definite-nominative-plural":"hăuiturile","dative-genitive-indefinite-singular":"hăuit","dative-definite-genitive-singular":"hăuitului","dative-genitive-indefinite-plural":"hăuituri","dative-definite-genitive-plural":"hăuiturilor","singular-vocative":"hăuitule","plural-vocative":"hăuiturilor"}},{"word":"hăuli","pos":"verb","definitions":["to shout (of joy)"],"forms":{"canonical":"a hăuli 4th conjugation","present-singular-third-person":"hăulește","participle-past":"hăulit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hăuli","gerund":"hăulind","first-person-indicative-present-singular":"hăulesc","indicative-present-second-person-singular":"hăulești","indicative-present-singular-third-person":"hăulește","first-person-indicative-plural-present":"hăulim","indicative-plural-present-second-person":"hăuliți","indicative-plural-present-third-person":"hăulesc","first-person-imperfect-indicative-singular":"hăuleam","imperfect-indicative-second-person-singular":"hăuleai","imperfect-indicative-singular-third-person":"hăulea","first-person-imperfect-indicative-plural":"hăuleam","imperfect-indicative-plural-second-person":"hăuleați","imperfect-indicative-plural-third-person":"hăuleau","first-person-indicative-perfect-singular":"hăulii","indicative-perfect-second-person-singular":"hăuliși","indicative-perfect-singular-third-person":"hăuli","first-person-indicative-perfect-plural":"hăulirăm","indicative-perfect-plural-second-person":"hăulirăți","indicative-perfect-plural-third-person":"hăuliră","first-person-indicative-pluperfect-singular":"hăulisem","indicative-pluperfect-second-person-singular":"hăuliseși","indicative-pluperfect-singular-third-person":"hăulise","first-person-indicative-pluperfect-plural":"hăuliserăm","indicative-pluperfect-plural-second-person":"hăuliserăți","indicative-pluperfect-plural-third-person":"hăuliseră","first-person-present-singular-subjunctive":"să hăulesc","present-second-person-singular-subjunctive":"să hăulești","present-singular-subjunctive-third-person":"să hăulească","first-person-plural-present-subjunctive":"să hăulim","plural-present-second-person-subjunctive":"să hăuliți","plural-present-subjunctive-third-person":"să hăulească","imperative-second-person-singular":"hăulește","imperative-plural-second-person":"hăuliți","imperative-negative-second-person-singular":"nu hăuli","imperative-negative-plural-second-person":"nu hăuliți"}},{"word":"hăulire","pos":"noun","definitions":["shouting"],"forms":{"plural":"hăuliri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hăulire","accusative-definite-nominative-singular":"hăulirea","accusative-indefinite-nominative-plural":"hăuliri","accusative-definite-nominative-plural":"hăulirile","dative-genitive-indefinite-singular":"hăuliri","dative-definite-genitive-singular":"hăulirii","dative-genitive-indefinite-plural":"hăuliri","dative-definite-genitive-plural":"hăulirilor","singular-vocative":"hăulire","plural-vocative":"hăulirilor"}},{"word":"hăulit","pos":"noun","definitions":["shout"],"forms":{"plural":"hăulituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hăulit","accusative-definite-nominative-singular":"hăulitul","accusative-indefinite-nominative-plural":"hăulituri","accusative-definite-nominative-plural":"hăuliturile","dative-genitive-indefinite-singular":"hăulit","dative-definite-genitive-singular":"hăulitului","dative-genitive-indefinite-plural":"hăulituri","dative-definite-genitive-plural":"hăuliturilor","singular-vocative":"hăulitule","plural-vocative":"hăuliturilor"}},{"word":"hăulit","pos":"verb","definitions":["past participle of hăuli"],"forms":{"participle-past":"of hăuli"}},{"word":"havadis","pos":"noun","definitions":["news"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"havadis","accusative-definite-nominative":"havadisul","dative-genitive-indefinite":"havadis","dative-definite-genitive":"havadisului","vocative":"havadisule"}},{"word":"havaian","pos":"adj","definitions":["Hawaiian"],"forms":{"feminine-singular":"havaiană","masculine-plural":"havaieni","feminine-neuter-plural":"havaiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"havaian","error-unrecognized-form-feminine-indefinite-singular":"havaiană","error-unrecognized-form-indefinite-masculine-plural":"havaieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"havaiene","definite-error-unrecognized-form-masculine-neuter-singular":"havaianul","definite-error-unrecognized-form-feminine-singular":"havaiana","definite-error-unrecognized-form-masculine-plural":"havaienii","definite-error-unrecognized-form-feminine-neuter-plural":"havaienele"}},{"word":"havaiu","pos":"adj","definitions":["azure"],"forms":{"feminine-singular":"havaie","plural":"havaii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"havaiu","error-unrecognized-form-feminine-indefinite-singular":"havaie","error-unrecognized-form-indefinite-masculine-plural":"havaii","error-unrecognized-form-feminine-indefinite-neuter-plural":"havaii","definite-error-unrecognized-form-masculine-neuter-singular":"havaiul","definite-error-unrecognized-form-feminine-singular":"havaia","definite-error-unrecognized-form-masculine-plural":"havaiii","definite-error-unrecognized-form-feminine-neuter-plural":"havaiile"}},{"word":"havan","pos":"adj","definitions":["cigar-colored"],"pronunciation":"/haˈvan/","forms":{"feminine-singular":"havană","masculine-plural":"havani","feminine-neuter-plural":"havane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"havan","error-unrecognized-form-feminine-indefinite-singular":"havană","error-unrecognized-form-indefinite-masculine-plural":"havani","error-unrecognized-form-feminine-indefinite-neuter-plural":"havane","definite-error-unrecognized-form-masculine-neuter-singular":"havanul","definite-error-unrecognized-form-feminine-singular":"havana","definite-error-unrecognized-form-masculine-plural":"havanii","definite-error-unrecognized-form-feminine-neuter-plural":"havanele"}},{"word":"havană","pos":"noun","definitions":["Havana (cigar)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"havană","accusative-definite-nominative-singular":"havana","accusative-indefinite-nominative-plural":"havane","accusative-definite-nominative-plural":"havanele","dative-genitive-indefinite-singular":"havane","dative-definite-genitive-singular":"havanei","dative-genitive-indefinite-plural":"havane","dative-definite-genitive-plural":"havanelor","singular-vocative":"havană","plural-vocative":"havanelor"}},{"word":"Havârna","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Havârna, Botoșani County, Romania"],"gender":"f"},{"word":"Havârneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Havârneanu"}},{"word":"Hăvârneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hăvârneanu"}},{"word":"Hăvărneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hăvărneanu"}},{"word":"haveză","pos":"noun","definitions":["coalcutter"],"forms":{"plural":"haveze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"haveză","accusative-definite-nominative-singular":"haveza","accusative-indefinite-nominative-plural":"haveze","accusative-definite-nominative-plural":"havezele","dative-genitive-indefinite-singular":"haveze","dative-definite-genitive-singular":"havezei","dative-genitive-indefinite-plural":"haveze","dative-definite-genitive-plural":"havezelor","singular-vocative":"haveză","plural-vocative":"havezelor"}},{"word":"Hăvîrneanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hăvîrneanu"}},{"word":"havră","pos":"noun","definitions":["synagogue"],"forms":{"plural":"havre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"havră","accusative-definite-nominative-singular":"havra","accusative-indefinite-nominative-plural":"havre","accusative-definite-nominative-plural":"havrele","dative-genitive-indefinite-singular":"havre","dative-definite-genitive-singular":"havrei","dative-genitive-indefinite-plural":"havre","dative-definite-genitive-plural":"havrelor","singular-vocative":"havră","plural-vocative":"havrelor"}},{"word":"Havriciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Havriciuc"}},{"word":"Havriliuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Havriliuc"}},{"word":"havuz","pos":"noun","definitions":["fountain, pool"],"pronunciation":"/haˈvuz/","forms":{"plural":"havuzuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"havuz","accusative-definite-nominative-singular":"havuzul","accusative-indefinite-nominative-plural":"havuzuri","accusative-definite-nominative-plural":"havuzurile","dative-genitive-indefinite-singular":"havuz","dative-definite-genitive-singular":"havuzului","dative-genitive-indefinite-plural":"havuzuri","dative-definite-genitive-plural":"havuzurilor","singular-vocative":"havuzule","plural-vocative":"havuzurilor"}},{"word":"hawaiian","pos":"adj","definitions":["Hawaiian"],"forms":{"feminine-singular":"hawaiiană","masculine-plural":"hawaiieni","feminine-neuter-plural":"hawaiiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hawaiian","error-unrecognized-form-feminine-indefinite-singular":"hawaiiană","error-unrecognized-form-indefinite-masculine-plural":"hawaiieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hawaiiene","definite-error-unrecognized-form-masculine-neuter-singular":"hawaiianul","definite-error-unrecognized-form-feminine-singular":"hawaiiana","definite-error-unrecognized-form-masculine-plural":"hawaiienii","definite-error-unrecognized-form-feminine-neuter-plural":"hawaiienele"}},{"word":"hawaiian","pos":"noun","definitions":["Hawaiian"],"forms":{"plural":"hawaiieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hawaiian","accusative-definite-nominative-singular":"hawaiianul","accusative-indefinite-nominative-plural":"hawaiieni","accusative-definite-nominative-plural":"hawaiienii","dative-genitive-indefinite-singular":"hawaiian","dative-definite-genitive-singular":"hawaiianului","dative-genitive-indefinite-plural":"hawaiieni","dative-definite-genitive-plural":"hawaiienilor","singular-vocative":"hawaiianule","plural-vocative":"hawaiienilor"}},{"word":"hawaiiană","pos":"noun","definitions":["female equivalent of hawaiian"],"forms":{"plural":"hawaiiane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hawaiiană","accusative-definite-nominative-singular":"hawaiiana","accusative-indefinite-nominative-plural":"hawaiiane","accusative-definite-nominative-plural":"hawaiianele","dative-genitive-indefinite-singular":"hawaiiane","dative-definite-genitive-singular":"hawaiianei","dative-genitive-indefinite-plural":"hawaiiane","dative-definite-genitive-plural":"hawaiianelor","singular-vocative":"hawaiiană","plural-vocative":"hawaiianelor"}},{"word":"haz","pos":"noun","definitions":["humor","fun","wit"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"haz","accusative-definite-nominative":"hazul","dative-genitive-indefinite":"haz","dative-definite-genitive":"hazului","vocative":"hazule"}},{"word":"hazard","pos":"noun","definitions":["hazard"],"forms":{"plural":"hazarduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hazard","accusative-definite-nominative-singular":"hazardul","accusative-indefinite-nominative-plural":"hazarduri","accusative-definite-nominative-plural":"hazardurile","dative-genitive-indefinite-singular":"hazard","dative-definite-genitive-singular":"hazardului","dative-genitive-indefinite-plural":"hazarduri","dative-definite-genitive-plural":"hazardurilor","singular-vocative":"hazardule","plural-vocative":"hazardurilor"}},{"word":"hazarda","pos":"verb","definitions":["to hazard, to gamble (about an action), to take a chance"],"forms":{"canonical":"a hazarda 1st conjugation","present-singular-third-person":"hazardează","participle-past":"hazardat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hazarda","gerund":"hazardând","first-person-indicative-present-singular":"hazardez","indicative-present-second-person-singular":"hazardezi","indicative-present-singular-third-person":"hazardează","first-person-indicative-plural-present":"hazardăm","indicative-plural-present-second-person":"hazardați","indicative-plural-present-third-person":"hazardează","first-person-imperfect-indicative-singular":"hazardam","imperfect-indicative-second-person-singular":"hazardai","imperfect-indicative-singular-third-person":"hazarda","first-person-imperfect-indicative-plural":"hazardam","imperfect-indicative-plural-second-person":"hazardați","imperfect-indicative-plural-third-person":"hazardau","first-person-indicative-perfect-singular":"hazardai","indicative-perfect-second-person-singular":"hazardași","indicative-perfect-singular-third-person":"hazardă","first-person-indicative-perfect-plural":"hazardarăm","indicative-perfect-plural-second-person":"hazardarăți","indicative-perfect-plural-third-person":"hazardară","first-person-indicative-pluperfect-singular":"hazardasem","indicative-pluperfect-second-person-singular":"hazardaseși","indicative-pluperfect-singular-third-person":"hazardase","first-person-indicative-pluperfect-plural":"hazardaserăm","indicative-pluperfect-plural-second-person":"hazardaserăți","indicative-pluperfect-plural-third-person":"hazardaseră","first-person-present-singular-subjunctive":"să hazardez","present-second-person-singular-subjunctive":"să hazardezi","present-singular-subjunctive-third-person":"să hazardeze","first-person-plural-present-subjunctive":"să hazardăm","plural-present-second-person-subjunctive":"să hazardați","plural-present-subjunctive-third-person":"să hazardeze","imperative-second-person-singular":"hazardează","imperative-plural-second-person":"hazardați","imperative-negative-second-person-singular":"nu hazarda","imperative-negative-plural-second-person":"nu hazardați"}},{"word":"hazardare","pos":"noun","definitions":["gambling (about an action), taking a chance"],"forms":{"plural":"hazardări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hazardare","accusative-definite-nominative-singular":"hazardarea","accusative-indefinite-nominative-plural":"hazardări","accusative-definite-nominative-plural":"hazardările","dative-genitive-indefinite-singular":"hazardări","dative-definite-genitive-singular":"hazardării","dative-genitive-indefinite-plural":"hazardări","dative-definite-genitive-plural":"hazardărilor","singular-vocative":"hazardare","plural-vocative":"hazardărilor"}},{"word":"hazardat","pos":"adj","definitions":["hazarded"],"pronunciation":"/ha.zarˈdat/","forms":{"feminine-singular":"hazardată","masculine-plural":"hazardați","feminine-neuter-plural":"hazardate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hazardat","error-unrecognized-form-feminine-indefinite-singular":"hazardată","error-unrecognized-form-indefinite-masculine-plural":"hazardați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hazardate","definite-error-unrecognized-form-masculine-neuter-singular":"hazardatul","definite-error-unrecognized-form-feminine-singular":"hazardata","definite-error-unrecognized-form-masculine-plural":"hazardații","definite-error-unrecognized-form-feminine-neuter-plural":"hazardatele"}},{"word":"hâzenie","pos":"noun","definitions":["ugliness"],"forms":{"plural":"hâzenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hâzenie","accusative-definite-nominative-singular":"hâzenia","accusative-indefinite-nominative-plural":"hâzenii","accusative-definite-nominative-plural":"hâzeniile","dative-genitive-indefinite-singular":"hâzenii","dative-definite-genitive-singular":"hâzeniei","dative-genitive-indefinite-plural":"hâzenii","dative-definite-genitive-plural":"hâzeniilor","singular-vocative":"hâzenie","plural-vocative":"hâzeniilor"}},{"word":"hâzi","pos":"verb","definitions":["to uglify"],"forms":{"canonical":"a hâzi 4th conjugation","present-singular-third-person":"hâzește","participle-past":"hâzit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hâzi","gerund":"hâzind","first-person-indicative-present-singular":"hâzesc","indicative-present-second-person-singular":"hâzești","indicative-present-singular-third-person":"hâzește","first-person-indicative-plural-present":"hâzim","indicative-plural-present-second-person":"hâziți","indicative-plural-present-third-person":"hâzesc","first-person-imperfect-indicative-singular":"hâzeam","imperfect-indicative-second-person-singular":"hâzeai","imperfect-indicative-singular-third-person":"hâzea","first-person-imperfect-indicative-plural":"hâzeam","imperfect-indicative-plural-second-person":"hâzeați","imperfect-indicative-plural-third-person":"hâzeau","first-person-indicative-perfect-singular":"hâzii","indicative-perfect-second-person-singular":"hâziși","indicative-perfect-singular-third-person":"hâzi","first-person-indicative-perfect-plural":"hâzirăm","indicative-perfect-plural-second-person":"hâzirăți","indicative-perfect-plural-third-person":"hâziră","first-person-indicative-pluperfect-singular":"hâzisem","indicative-pluperfect-second-person-singular":"hâziseși","indicative-pluperfect-singular-third-person":"hâzise","first-person-indicative-pluperfect-plural":"hâziserăm","indicative-pluperfect-plural-second-person":"hâziserăți","indicative-pluperfect-plural-third-person":"hâziseră","first-person-present-singular-subjunctive":"să hâzesc","present-second-person-singular-subjunctive":"să hâzești","present-singular-subjunctive-third-person":"să hâzească","first-person-plural-present-subjunctive":"să hâzim","plural-present-second-person-subjunctive":"să hâziți","plural-present-subjunctive-third-person":"să hâzească","imperative-second-person-singular":"hâzește","imperative-plural-second-person":"hâziți","imperative-negative-second-person-singular":"nu hâzi","imperative-negative-plural-second-person":"nu hâziți"}},{"word":"hâzime","pos":"noun","definitions":["ugliness"],"forms":{"plural":"hâzimi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hâzime","accusative-definite-nominative-singular":"hâzimea","accusative-indefinite-nominative-plural":"hâzimi","accusative-definite-nominative-plural":"hâzimile","dative-genitive-indefinite-singular":"hâzimi","dative-definite-genitive-singular":"hâzimii","dative-genitive-indefinite-plural":"hâzimi","dative-definite-genitive-plural":"hâzimilor","singular-vocative":"hâzime","plural-vocative":"hâzimilor"}},{"word":"hâzire","pos":"noun","definitions":["uglification"],"forms":{"plural":"hâziri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hâzire","accusative-definite-nominative-singular":"hâzirea","accusative-indefinite-nominative-plural":"hâziri","accusative-definite-nominative-plural":"hâzirile","dative-genitive-indefinite-singular":"hâziri","dative-definite-genitive-singular":"hâzirii","dative-genitive-indefinite-plural":"hâziri","dative-definite-genitive-plural":"hâzirilor","singular-vocative":"hâzire","plural-vocative":"hâzirilor"}},{"word":"hâzit","pos":"adj","definitions":["uglified"],"forms":{"feminine-singular":"hâzită","masculine-plural":"hâziți","feminine-neuter-plural":"hâzite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hâzit","error-unrecognized-form-feminine-indefinite-singular":"hâzită","error-unrecognized-form-indefinite-masculine-plural":"hâziți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hâzite","definite-error-unrecognized-form-masculine-neuter-singular":"hâzitul","definite-error-unrecognized-form-feminine-singular":"hâzita","definite-error-unrecognized-form-masculine-plural":"hâziții","definite-error-unrecognized-form-feminine-neuter-plural":"hâzitele"}},{"word":"hâzit","pos":"verb","definitions":["past participle of hâzi"],"forms":{"participle-past":"of hâzi"}},{"word":"hazlâu","pos":"adj","definitions":["alternative form of hazliu"],"forms":{"feminine-singular":"hazlâe","masculine-plural":"hazlâi","feminine-neuter-plural":"hazlâe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hazlâu","error-unrecognized-form-feminine-indefinite-singular":"hazlâe","error-unrecognized-form-indefinite-masculine-plural":"hazlâi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hazlâe","definite-error-unrecognized-form-masculine-neuter-singular":"hazlâul","definite-error-unrecognized-form-feminine-singular":"hazlâea","definite-error-unrecognized-form-masculine-plural":"hazlâii","definite-error-unrecognized-form-feminine-neuter-plural":"hazlâele"}},{"word":"Hazliu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hazliu"}},{"word":"hazliu","pos":"adj","definitions":["merry, jocular, funny, comical, amusing, droll, entertaining"],"pronunciation":"/hazˈliw/","forms":{"feminine-singular":"hazlie","plural":"hazlii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hazliu","error-unrecognized-form-feminine-indefinite-singular":"hazlie","error-unrecognized-form-indefinite-masculine-plural":"hazlii","error-unrecognized-form-feminine-indefinite-neuter-plural":"hazlii","definite-error-unrecognized-form-masculine-neuter-singular":"hazliul","definite-error-unrecognized-form-feminine-singular":"hazlia","definite-error-unrecognized-form-masculine-plural":"hazliii","definite-error-unrecognized-form-feminine-neuter-plural":"hazliile"}},{"word":"hazmodie","pos":"noun","definitions":["scandal"],"forms":{"plural":"hazmodii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hazmodie","accusative-definite-nominative-singular":"hazmodia","accusative-indefinite-nominative-plural":"hazmodii","accusative-definite-nominative-plural":"hazmodiile","dative-genitive-indefinite-singular":"hazmodii","dative-definite-genitive-singular":"hazmodiei","dative-genitive-indefinite-plural":"hazmodii","dative-definite-genitive-plural":"hazmodiilor","singular-vocative":"hazmodie","plural-vocative":"hazmodiilor"}},{"word":"hazna","pos":"noun","definitions":["cesspool","treasury","cistern","drinking fountain, water pump"],"pronunciation":"/hazˈna/","examples":[{"ro":"Haznalele umplute se golesc și conținutul lor se usucă.[…]Este bine ca amestecul de fecale și materie organică, după ce se scoate din hazna, să se ducă în locuri depărtate de locuințe[…]","en":"The full cesspools are emptied and their contents are dried. […] It is preferable that the mixture of feces and organic matter, after being taken out of the cesspool, be taken to places far away from any dwellings […]"}],"forms":{"plural":"haznale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-a","accusative-indefinite-nominative-singular":"hazna","accusative-definite-nominative-singular":"haznaua","accusative-indefinite-nominative-plural":"haznale","accusative-definite-nominative-plural":"haznalele","dative-genitive-indefinite-singular":"haznale","dative-definite-genitive-singular":"haznalei","dative-genitive-indefinite-plural":"haznale","dative-definite-genitive-plural":"haznalelor","singular-vocative":"hazna","plural-vocative":"haznalelor","alternative-dated":"hasna"}},{"word":"haznă","pos":"noun","definitions":["use, benefit"],"forms":{"plural":"hazne","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"haznă","accusative-definite-nominative-singular":"hazna","accusative-indefinite-nominative-plural":"hazne","accusative-definite-nominative-plural":"haznele","dative-genitive-indefinite-singular":"hazne","dative-definite-genitive-singular":"haznei","dative-genitive-indefinite-plural":"hazne","dative-definite-genitive-plural":"haznelor","singular-vocative":"haznă","plural-vocative":"haznelor"}},{"word":"haznatar","pos":"noun","definitions":["treasurer"],"pronunciation":"/haz.naˈtar/","forms":{"plural":"haznatari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"haznatar","accusative-definite-nominative-singular":"haznatarul","accusative-indefinite-nominative-plural":"haznatari","accusative-definite-nominative-plural":"haznatarii","dative-genitive-indefinite-singular":"haznatar","dative-definite-genitive-singular":"haznatarului","dative-genitive-indefinite-plural":"haznatari","dative-definite-genitive-plural":"haznatarilor","singular-vocative":"haznatarule","plural-vocative":"haznatarilor","alternative":"haznadar"}},{"word":"hazran","pos":"noun","definitions":["walking stick"],"forms":{"plural":"hazrane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hazran","accusative-definite-nominative-singular":"hazranul","accusative-indefinite-nominative-plural":"hazrane","accusative-definite-nominative-plural":"hazranele","dative-genitive-indefinite-singular":"hazran","dative-definite-genitive-singular":"hazranului","dative-genitive-indefinite-plural":"hazrane","dative-definite-genitive-plural":"hazranelor","singular-vocative":"hazranule","plural-vocative":"hazranelor"}},{"word":"hazuliu","pos":"adj","definitions":["alternative form of hazliu"],"forms":{"feminine-singular":"hazulie","plural":"hazulii","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hazuliu","error-unrecognized-form-feminine-indefinite-singular":"hazulie","error-unrecognized-form-indefinite-masculine-plural":"hazulii","error-unrecognized-form-feminine-indefinite-neuter-plural":"hazulii","definite-error-unrecognized-form-masculine-neuter-singular":"hazuliul","definite-error-unrecognized-form-feminine-singular":"hazulia","definite-error-unrecognized-form-masculine-plural":"hazuliii","definite-error-unrecognized-form-feminine-neuter-plural":"hazuliile"}},{"word":"HD","pos":"name","definitions":["abbreviation of Hunedoara: a county of Romania"]},{"word":"he","pos":"intj","definitions":["alternative form of hei"]},{"word":"heavy metal","pos":"noun","definitions":["heavy metal"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heavy metal","accusative-definite-nominative":"heavy metalul","dative-genitive-indefinite":"heavy metal","dative-definite-genitive":"heavy metalului","vocative":"heavy metalule"}},{"word":"hebdomadar","pos":"adj","definitions":["weekly"],"forms":{"feminine-singular":"hebdomadară","masculine-plural":"hebdomadari","feminine-neuter-plural":"hebdomadare","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"hebdomadar","error-unrecognized-form-feminine-indefinite-singular":"hebdomadară","error-unrecognized-form-indefinite-masculine-plural":"hebdomadari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hebdomadare","definite-error-unrecognized-form-masculine-neuter-singular":"hebdomadarul","definite-error-unrecognized-form-feminine-singular":"hebdomadara","definite-error-unrecognized-form-masculine-plural":"hebdomadarii","definite-error-unrecognized-form-feminine-neuter-plural":"hebdomadarele"}},{"word":"hebdomadar","pos":"noun","definitions":["weekly magazine"],"forms":{"plural":"hebdomadari","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hebdomadar","accusative-definite-nominative-singular":"hebdomadarul","accusative-indefinite-nominative-plural":"hebdomadari","accusative-definite-nominative-plural":"hebdomadarile","dative-genitive-indefinite-singular":"hebdomadar","dative-definite-genitive-singular":"hebdomadarului","dative-genitive-indefinite-plural":"hebdomadari","dative-definite-genitive-plural":"hebdomadarilor","singular-vocative":"hebdomadarule","plural-vocative":"hebdomadarilor"}},{"word":"hebefrenic","pos":"adj","definitions":["hebephrenic"],"forms":{"feminine-singular":"hebefrenică","masculine-plural":"hebefrenici","feminine-neuter-plural":"hebefrenice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hebefrenic","error-unrecognized-form-feminine-indefinite-singular":"hebefrenică","error-unrecognized-form-indefinite-masculine-plural":"hebefrenici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hebefrenice","definite-error-unrecognized-form-masculine-neuter-singular":"hebefrenicul","definite-error-unrecognized-form-feminine-singular":"hebefrenica","definite-error-unrecognized-form-masculine-plural":"hebefrenicii","definite-error-unrecognized-form-feminine-neuter-plural":"hebefrenicele"}},{"word":"hebefrenică","pos":"noun","definitions":["female equivalent of hebefrenic"],"forms":{"plural":"hebefrenice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hebefrenică","accusative-definite-nominative-singular":"hebefrenica","accusative-indefinite-nominative-plural":"hebefrenice","accusative-definite-nominative-plural":"hebefrenicele","dative-genitive-indefinite-singular":"hebefrenice","dative-definite-genitive-singular":"hebefrenicei","dative-genitive-indefinite-plural":"hebefrenice","dative-definite-genitive-plural":"hebefrenicelor","singular-vocative":"hebefrenică","plural-vocative":"hebefrenicelor"}},{"word":"hebefrenie","pos":"noun","definitions":["hebephrenia"],"forms":{"plural":"hebefrenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hebefrenie","accusative-definite-nominative-singular":"hebefrenia","accusative-indefinite-nominative-plural":"hebefrenii","accusative-definite-nominative-plural":"hebefreniile","dative-genitive-indefinite-singular":"hebefrenii","dative-definite-genitive-singular":"hebefreniei","dative-genitive-indefinite-plural":"hebefrenii","dative-definite-genitive-plural":"hebefreniilor","singular-vocative":"hebefrenie","plural-vocative":"hebefreniilor"}},{"word":"hebelogie","pos":"noun","definitions":["hebelogy, study of the adolescents"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hebelogie","accusative-definite-nominative-singular":"hebelogia","accusative-indefinite-nominative-plural":"hebelogii","accusative-definite-nominative-plural":"hebelogiile","dative-genitive-indefinite-singular":"hebelogii","dative-definite-genitive-singular":"hebelogiei","dative-genitive-indefinite-plural":"hebelogii","dative-definite-genitive-plural":"hebelogiilor","singular-vocative":"hebelogie","plural-vocative":"hebelogiilor"}},{"word":"hebetudine","pos":"noun","definitions":["hebetude"],"forms":{"plural":"hebetudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hebetudine","accusative-definite-nominative-singular":"hebetudinea","accusative-indefinite-nominative-plural":"hebetudini","accusative-definite-nominative-plural":"hebetudinile","dative-genitive-indefinite-singular":"hebetudini","dative-definite-genitive-singular":"hebetudinii","dative-genitive-indefinite-plural":"hebetudini","dative-definite-genitive-plural":"hebetudinilor","singular-vocative":"hebetudine","plural-vocative":"hebetudinilor"}},{"word":"hecatombă","pos":"noun","definitions":["hecatomb"],"forms":{"plural":"hecatombe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hecatombă","accusative-definite-nominative-singular":"hecatomba","accusative-indefinite-nominative-plural":"hecatombe","accusative-definite-nominative-plural":"hecatombele","dative-genitive-indefinite-singular":"hecatombe","dative-definite-genitive-singular":"hecatombei","dative-genitive-indefinite-plural":"hecatombe","dative-definite-genitive-plural":"hecatombelor","singular-vocative":"hecatombă","plural-vocative":"hecatombelor"}},{"word":"hecela","pos":"verb","definitions":["to comb, card (wool)"],"forms":{"canonical":"a hecela 1st conjugation","present-singular-third-person":"hecelează","participle-past":"hecelat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hecela","gerund":"hecelând","first-person-indicative-present-singular":"hecelez","indicative-present-second-person-singular":"hecelezi","indicative-present-singular-third-person":"hecelează","first-person-indicative-plural-present":"hecelăm","indicative-plural-present-second-person":"hecelați","indicative-plural-present-third-person":"hecelează","first-person-imperfect-indicative-singular":"hecelam","imperfect-indicative-second-person-singular":"hecelai","imperfect-indicative-singular-third-person":"hecela","first-person-imperfect-indicative-plural":"hecelam","imperfect-indicative-plural-second-person":"hecelați","imperfect-indicative-plural-third-person":"hecelau","first-person-indicative-perfect-singular":"hecelai","indicative-perfect-second-person-singular":"hecelași","indicative-perfect-singular-third-person":"hecelă","first-person-indicative-perfect-plural":"hecelarăm","indicative-perfect-plural-second-person":"hecelarăți","indicative-perfect-plural-third-person":"hecelară","first-person-indicative-pluperfect-singular":"hecelasem","indicative-pluperfect-second-person-singular":"hecelaseși","indicative-pluperfect-singular-third-person":"hecelase","first-person-indicative-pluperfect-plural":"hecelaserăm","indicative-pluperfect-plural-second-person":"hecelaserăți","indicative-pluperfect-plural-third-person":"hecelaseră","first-person-present-singular-subjunctive":"să hecelez","present-second-person-singular-subjunctive":"să hecelezi","present-singular-subjunctive-third-person":"să heceleze","first-person-plural-present-subjunctive":"să hecelăm","plural-present-second-person-subjunctive":"să hecelați","plural-present-subjunctive-third-person":"să heceleze","imperative-second-person-singular":"hecelează","imperative-plural-second-person":"hecelați","imperative-negative-second-person-singular":"nu hecela","imperative-negative-plural-second-person":"nu hecelați"}},{"word":"hecelă","pos":"noun","definitions":["card, carding tool, comb"],"forms":{"plural":"hecele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hecelă","accusative-definite-nominative-singular":"hecelăul","accusative-indefinite-nominative-plural":"hecele","accusative-definite-nominative-plural":"hecelele","dative-genitive-indefinite-singular":"hecelă","dative-definite-genitive-singular":"hecelăului","dative-genitive-indefinite-plural":"hecele","dative-definite-genitive-plural":"hecelelor","singular-vocative":"hecelăule","plural-vocative":"hecelelor"}},{"word":"hecimpeci","pos":"noun","definitions":["rosehip jam"],"pronunciation":"/he.t͡ʃimˈpet͡ʃʲ/","forms":{"plural":"hecimpeciuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hecimpeci","accusative-definite-nominative-singular":"hecimpeciul","accusative-indefinite-nominative-plural":"hecimpeciuri","accusative-definite-nominative-plural":"hecimpeciurile","dative-genitive-indefinite-singular":"hecimpeci","dative-definite-genitive-singular":"hecimpeciului","dative-genitive-indefinite-plural":"hecimpeciuri","dative-definite-genitive-plural":"hecimpeciurilor","singular-vocative":"hecimpeciule","plural-vocative":"hecimpeciurilor","alternative":"heciumpeci"}},{"word":"Heciul Nou","pos":"name","definitions":["a village in Heciul Nou, Sîngerei Raion, Moldova","a commune of Sîngerei Raion, Moldova"],"gender":"m"},{"word":"Heciul Vechi","pos":"name","definitions":["a village in Alexăndreni, Sîngerei Raion, Moldova"],"gender":"m"},{"word":"hectar","pos":"noun","definitions":["hectare"],"forms":{"plural":"hectare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hectar","accusative-definite-nominative-singular":"hectarul","accusative-indefinite-nominative-plural":"hectare","accusative-definite-nominative-plural":"hectarele","dative-genitive-indefinite-singular":"hectar","dative-definite-genitive-singular":"hectarului","dative-genitive-indefinite-plural":"hectare","dative-definite-genitive-plural":"hectarelor","singular-vocative":"hectarule","plural-vocative":"hectarelor"}},{"word":"hectare","pos":"noun","definitions":["indefinite plural of hectar"],"pronunciation":"[hekˈtare]","gender":"n"},{"word":"hectic","pos":"adj","definitions":["hectic"],"forms":{"feminine-singular":"hectică","masculine-plural":"hectici","feminine-neuter-plural":"hectice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hectic","error-unrecognized-form-feminine-indefinite-singular":"hectică","error-unrecognized-form-indefinite-masculine-plural":"hectici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hectice","definite-error-unrecognized-form-masculine-neuter-singular":"hecticul","definite-error-unrecognized-form-feminine-singular":"hectica","definite-error-unrecognized-form-masculine-plural":"hecticii","definite-error-unrecognized-form-feminine-neuter-plural":"hecticele"}},{"word":"hecto-","pos":"prefix","definitions":["hecto-"]},{"word":"hectograf","pos":"noun","definitions":["hectograph"],"forms":{"plural":"hectografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hectograf","accusative-definite-nominative-singular":"hectograful","accusative-indefinite-nominative-plural":"hectografe","accusative-definite-nominative-plural":"hectografele","dative-genitive-indefinite-singular":"hectograf","dative-definite-genitive-singular":"hectografului","dative-genitive-indefinite-plural":"hectografe","dative-definite-genitive-plural":"hectografelor","singular-vocative":"hectografule","plural-vocative":"hectografelor"}},{"word":"hectogram","pos":"noun","definitions":["hectogram"],"pronunciation":"/hek.toˈɡram/","forms":{"plural":"hectograme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hectogram","accusative-definite-nominative-singular":"hectogramul","accusative-indefinite-nominative-plural":"hectograme","accusative-definite-nominative-plural":"hectogramele","dative-genitive-indefinite-singular":"hectogram","dative-definite-genitive-singular":"hectogramului","dative-genitive-indefinite-plural":"hectograme","dative-definite-genitive-plural":"hectogramelor","singular-vocative":"hectogramule","plural-vocative":"hectogramelor"}},{"word":"hectolitric","pos":"adj","definitions":["hectolitre"],"forms":{"feminine-singular":"hectolitrică","masculine-plural":"hectolitrici","feminine-neuter-plural":"hectolitrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hectolitric","error-unrecognized-form-feminine-indefinite-singular":"hectolitrică","error-unrecognized-form-indefinite-masculine-plural":"hectolitrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hectolitrice","definite-error-unrecognized-form-masculine-neuter-singular":"hectolitricul","definite-error-unrecognized-form-feminine-singular":"hectolitrica","definite-error-unrecognized-form-masculine-plural":"hectolitricii","definite-error-unrecognized-form-feminine-neuter-plural":"hectolitricele"}},{"word":"hectolitru","pos":"noun","definitions":["hectoliter, hectolitre"],"forms":{"plural":"hectolitri"}},{"word":"hectometric","pos":"adj","definitions":["hectometric"],"forms":{"feminine-singular":"hectometrică","masculine-plural":"hectometrici","feminine-neuter-plural":"hectometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hectometric","error-unrecognized-form-feminine-indefinite-singular":"hectometrică","error-unrecognized-form-indefinite-masculine-plural":"hectometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hectometrice","definite-error-unrecognized-form-masculine-neuter-singular":"hectometricul","definite-error-unrecognized-form-feminine-singular":"hectometrica","definite-error-unrecognized-form-masculine-plural":"hectometricii","definite-error-unrecognized-form-feminine-neuter-plural":"hectometricele"}},{"word":"hectometru","pos":"noun","definitions":["hectometer, hectometre"]},{"word":"hectowatt","pos":"noun","definitions":["hectowatt"],"forms":{"plural":"hectowați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hectowatt","accusative-definite-nominative-singular":"hectowattul","accusative-indefinite-nominative-plural":"hectowați","accusative-definite-nominative-plural":"hectowații","dative-genitive-indefinite-singular":"hectowatt","dative-definite-genitive-singular":"hectowattului","dative-genitive-indefinite-plural":"hectowați","dative-definite-genitive-plural":"hectowaților","singular-vocative":"hectowattule","plural-vocative":"hectowaților"}},{"word":"hedonism","pos":"noun","definitions":["hedonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hedonism","accusative-definite-nominative":"hedonismul","dative-genitive-indefinite":"hedonism","dative-definite-genitive":"hedonismului","vocative":"hedonismule"}},{"word":"hedonist","pos":"noun","definitions":["hedonist"],"forms":{"plural":"hedoniști","feminine":"equivalent hedonistă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hedonist","accusative-definite-nominative-singular":"hedonistul","accusative-indefinite-nominative-plural":"hedoniști","accusative-definite-nominative-plural":"hedoniștii","dative-genitive-indefinite-singular":"hedonist","dative-definite-genitive-singular":"hedonistului","dative-genitive-indefinite-plural":"hedoniști","dative-definite-genitive-plural":"hedoniștilor","singular-vocative":"hedonistule","plural-vocative":"hedoniștilor"}},{"word":"hedonistă","pos":"noun","definitions":["female equivalent of hedonist"],"forms":{"plural":"hedoniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hedonistă","accusative-definite-nominative-singular":"hedonista","accusative-indefinite-nominative-plural":"hedoniste","accusative-definite-nominative-plural":"hedonistele","dative-genitive-indefinite-singular":"hedoniste","dative-definite-genitive-singular":"hedonistei","dative-genitive-indefinite-plural":"hedoniste","dative-definite-genitive-plural":"hedonistelor","singular-vocative":"hedonistă","plural-vocative":"hedonistelor"}},{"word":"hedonistic","pos":"adj","definitions":["hedonistic"],"forms":{"feminine-singular":"hedonistică","masculine-plural":"hedonistici","feminine-neuter-plural":"hedonistice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hedonistic","error-unrecognized-form-feminine-indefinite-singular":"hedonistică","error-unrecognized-form-indefinite-masculine-plural":"hedonistici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hedonistice","definite-error-unrecognized-form-masculine-neuter-singular":"hedonisticul","definite-error-unrecognized-form-feminine-singular":"hedonistica","definite-error-unrecognized-form-masculine-plural":"hedonisticii","definite-error-unrecognized-form-feminine-neuter-plural":"hedonisticele"}},{"word":"hegeduș","pos":"noun","definitions":["fiddler"],"forms":{"plural":"hegeduși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hegeduș","accusative-definite-nominative-singular":"hegedușul","accusative-indefinite-nominative-plural":"hegeduși","accusative-definite-nominative-plural":"hegedușii","dative-genitive-indefinite-singular":"hegeduș","dative-definite-genitive-singular":"hegedușului","dative-genitive-indefinite-plural":"hegeduși","dative-definite-genitive-plural":"hegedușilor","singular-vocative":"hegedușule","plural-vocative":"hegedușilor"}},{"word":"hegelian","pos":"noun","definitions":["Hegelian"],"forms":{"plural":"hegelieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hegelian","accusative-definite-nominative-singular":"hegelianul","accusative-indefinite-nominative-plural":"hegelieni","accusative-definite-nominative-plural":"hegelienii","dative-genitive-indefinite-singular":"hegelian","dative-definite-genitive-singular":"hegelianului","dative-genitive-indefinite-plural":"hegelieni","dative-definite-genitive-plural":"hegelienilor","singular-vocative":"hegelianule","plural-vocative":"hegelienilor"}},{"word":"hegeliană","pos":"noun","definitions":["female equivalent of hegelian"],"forms":{"plural":"hegeliene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hegeliană","accusative-definite-nominative-singular":"hegeliana","accusative-indefinite-nominative-plural":"hegeliene","accusative-definite-nominative-plural":"hegelienele","dative-genitive-indefinite-singular":"hegeliene","dative-definite-genitive-singular":"hegelienei","dative-genitive-indefinite-plural":"hegeliene","dative-definite-genitive-plural":"hegelienelor","singular-vocative":"hegeliană","plural-vocative":"hegelienelor"}},{"word":"hegelianism","pos":"noun","definitions":["Hegelianism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hegelianism","accusative-definite-nominative-singular":"hegelianismul","accusative-indefinite-nominative-plural":"hegelianisme","accusative-definite-nominative-plural":"hegelianismele","dative-genitive-indefinite-singular":"hegelianism","dative-definite-genitive-singular":"hegelianismului","dative-genitive-indefinite-plural":"hegelianisme","dative-definite-genitive-plural":"hegelianismelor","singular-vocative":"hegelianismule","plural-vocative":"hegelianismelor"}},{"word":"hegemon","pos":"noun","definitions":["hegemon"],"pronunciation":"/he.d͡ʒeˈmon/","forms":{"plural":"hegemoni","feminine":"equivalent hegemonă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hegemon","accusative-definite-nominative-singular":"hegemonul","accusative-indefinite-nominative-plural":"hegemoni","accusative-definite-nominative-plural":"hegemonii","dative-genitive-indefinite-singular":"hegemon","dative-definite-genitive-singular":"hegemonului","dative-genitive-indefinite-plural":"hegemoni","dative-definite-genitive-plural":"hegemonilor","singular-vocative":"hegemonule","plural-vocative":"hegemonilor","alternative":"heghemon"}},{"word":"hegemonă","pos":"noun","definitions":["female equivalent of hegemon"],"forms":{"plural":"hegemone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hegemonă","accusative-definite-nominative-singular":"hegemona","accusative-indefinite-nominative-plural":"hegemone","accusative-definite-nominative-plural":"hegemonele","dative-genitive-indefinite-singular":"hegemone","dative-definite-genitive-singular":"hegemonei","dative-genitive-indefinite-plural":"hegemone","dative-definite-genitive-plural":"hegemonelor","singular-vocative":"hegemonă","plural-vocative":"hegemonelor"}},{"word":"hegemonic","pos":"adj","definitions":["hegemonic"],"forms":{"feminine-singular":"hegemonică","masculine-plural":"hegemonici","feminine-neuter-plural":"hegemonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hegemonic","error-unrecognized-form-feminine-indefinite-singular":"hegemonică","error-unrecognized-form-indefinite-masculine-plural":"hegemonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hegemonice","definite-error-unrecognized-form-masculine-neuter-singular":"hegemonicul","definite-error-unrecognized-form-feminine-singular":"hegemonica","definite-error-unrecognized-form-masculine-plural":"hegemonicii","definite-error-unrecognized-form-feminine-neuter-plural":"hegemonicele"}},{"word":"hegemonie","pos":"noun","definitions":["hegemony"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hegemonie","accusative-definite-nominative":"hegemonia","dative-genitive-indefinite":"hegemonii","dative-definite-genitive":"hegemoniei","vocative":"hegemonie"}},{"word":"hegemonism","pos":"noun","definitions":["hegemonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hegemonism","accusative-definite-nominative":"hegemonismul","dative-genitive-indefinite":"hegemonism","dative-definite-genitive":"hegemonismului","vocative":"hegemonismule"}},{"word":"Hegheduș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hegheduș"}},{"word":"heghemon","pos":"noun","definitions":["alternative form of hegemon"],"forms":{"plural":"heghemoni"}},{"word":"heghemonă","pos":"noun","definitions":["female equivalent of heghemon"],"forms":{"plural":"heghemone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heghemonă","accusative-definite-nominative-singular":"heghemona","accusative-indefinite-nominative-plural":"heghemone","accusative-definite-nominative-plural":"heghemonele","dative-genitive-indefinite-singular":"heghemone","dative-definite-genitive-singular":"heghemonei","dative-genitive-indefinite-plural":"heghemone","dative-definite-genitive-plural":"heghemonelor","singular-vocative":"heghemonă","plural-vocative":"heghemonelor"}},{"word":"heghemonic","pos":"adj","definitions":["alternative form of hegemonic"],"forms":{"feminine-singular":"heghemonică","masculine-plural":"heghemonici","feminine-neuter-plural":"heghemonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heghemonic","error-unrecognized-form-feminine-indefinite-singular":"heghemonică","error-unrecognized-form-indefinite-masculine-plural":"heghemonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heghemonice","definite-error-unrecognized-form-masculine-neuter-singular":"heghemonicul","definite-error-unrecognized-form-feminine-singular":"heghemonica","definite-error-unrecognized-form-masculine-plural":"heghemonicii","definite-error-unrecognized-form-feminine-neuter-plural":"heghemonicele"}},{"word":"heghemonie","pos":"noun","definitions":["alternative form of hegemonie"],"forms":{"plural":"heghemonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heghemonie","accusative-definite-nominative-singular":"heghemonia","accusative-indefinite-nominative-plural":"heghemonii","accusative-definite-nominative-plural":"heghemoniile","dative-genitive-indefinite-singular":"heghemonii","dative-definite-genitive-singular":"heghemoniei","dative-genitive-indefinite-plural":"heghemonii","dative-definite-genitive-plural":"heghemoniilor","singular-vocative":"heghemonie","plural-vocative":"heghemoniilor"}},{"word":"heghemonism","pos":"noun","definitions":["alternative form of hegemonism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative":"heghemonism","accusative-definite-nominative":"heghemonismul","dative-genitive-indefinite":"heghemonism","dative-definite-genitive":"heghemonismului","vocative":"heghemonismule"}},{"word":"hegiră","pos":"noun","definitions":["hegira"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hegiră","accusative-definite-nominative":"hegira","dative-genitive-indefinite":"hegire","dative-definite-genitive":"hegirei","vocative":"hegiră"}},{"word":"hehe","pos":"intj","definitions":["alternative form of hei"]},{"word":"hehei","pos":"intj","definitions":["alternative form of ehei"]},{"word":"hei","pos":"intj","definitions":["hey"],"pronunciation":"/hej/"},{"word":"Heidendorf","pos":"name","definitions":["a village in Bistrița-Năsăud County, Romania. Renamed to Viișoara in 1950."],"gender":"m"},{"word":"heimatlos","pos":"noun","definitions":["stateless person"],"forms":{"plural":"heimatloși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heimatlos","accusative-definite-nominative-singular":"heimatlosul","accusative-indefinite-nominative-plural":"heimatloși","accusative-definite-nominative-plural":"heimatloșii","dative-genitive-indefinite-singular":"heimatlos","dative-definite-genitive-singular":"heimatlosului","dative-genitive-indefinite-plural":"heimatloși","dative-definite-genitive-plural":"heimatloșilor","singular-vocative":"heimatlosule","plural-vocative":"heimatloșilor"}},{"word":"helancă","pos":"noun","definitions":["a nylon stretch-fabric"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"helancă","accusative-definite-nominative":"helanca","dative-genitive-indefinite":"helance","dative-definite-genitive":"helancei","vocative":"helancă"}},{"word":"helbet","pos":"intj","definitions":["of course!"]},{"word":"helcologie","pos":"noun","definitions":["helcology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"helcologie","accusative-definite-nominative-singular":"helcologia","accusative-indefinite-nominative-plural":"helcologii","accusative-definite-nominative-plural":"helcologiile","dative-genitive-indefinite-singular":"helcologii","dative-definite-genitive-singular":"helcologiei","dative-genitive-indefinite-plural":"helcologii","dative-definite-genitive-plural":"helcologiilor","singular-vocative":"helcologie","plural-vocative":"helcologiilor"}},{"word":"helcometru","pos":"noun","definitions":["cable machine"],"forms":{"plural":"helcometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"helcometru","accusative-definite-nominative-singular":"helcometrul","accusative-indefinite-nominative-plural":"helcometre","accusative-definite-nominative-plural":"helcometrele","dative-genitive-indefinite-singular":"helcometru","dative-definite-genitive-singular":"helcometrului","dative-genitive-indefinite-plural":"helcometre","dative-definite-genitive-plural":"helcometrelor","singular-vocative":"helcometrule","plural-vocative":"helcometrelor"}},{"word":"helcoză","pos":"noun","definitions":["helcosis"],"forms":{"plural":"helcoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helcoză","accusative-definite-nominative-singular":"helcoza","accusative-indefinite-nominative-plural":"helcoze","accusative-definite-nominative-plural":"helcozele","dative-genitive-indefinite-singular":"helcoze","dative-definite-genitive-singular":"helcozei","dative-genitive-indefinite-plural":"helcoze","dative-definite-genitive-plural":"helcozelor","singular-vocative":"helcoză","plural-vocative":"helcozelor"}},{"word":"helenist","pos":"adj","definitions":["obsolete form of elenist"],"forms":{"feminine-singular":"helenistă","masculine-plural":"heleniști","feminine-neuter-plural":"heleniste","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helenist","error-unrecognized-form-feminine-indefinite-singular":"helenistă","error-unrecognized-form-indefinite-masculine-plural":"heleniști","error-unrecognized-form-feminine-indefinite-neuter-plural":"heleniste","definite-error-unrecognized-form-masculine-neuter-singular":"helenistul","definite-error-unrecognized-form-feminine-singular":"helenista","definite-error-unrecognized-form-masculine-plural":"heleniștii","definite-error-unrecognized-form-feminine-neuter-plural":"helenistele"}},{"word":"helepol","pos":"noun","definitions":["helepolis"],"forms":{"plural":"helepoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"helepol","accusative-definite-nominative-singular":"helepolul","accusative-indefinite-nominative-plural":"helepoluri","accusative-definite-nominative-plural":"helepolurile","dative-genitive-indefinite-singular":"helepol","dative-definite-genitive-singular":"helepolului","dative-genitive-indefinite-plural":"helepoluri","dative-definite-genitive-plural":"helepolurilor","singular-vocative":"helepolule","plural-vocative":"helepolurilor"}},{"word":"Helerești","pos":"name","definitions":["a village in Avram Iancu, Alba County, Romania"],"gender":"m"},{"word":"Heleșteni","pos":"name","definitions":["a village in Marinici, Nisporeni Raion, Moldova","a commune of Iași County, Romania","a village in Heleșteni, Iași County, Romania"],"gender":"m"},{"word":"Heleșteu","pos":"name","definitions":["a village in Conțești, Dâmbovița County, Romania"],"gender":"m"},{"word":"heleșteu","pos":"noun","definitions":["pond"],"forms":{"plural":"heleșteie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heleșteu","accusative-definite-nominative-singular":"heleșteul","accusative-indefinite-nominative-plural":"heleșteie","accusative-definite-nominative-plural":"heleșteiele","dative-genitive-indefinite-singular":"heleșteu","dative-definite-genitive-singular":"heleșteului","dative-genitive-indefinite-plural":"heleșteie","dative-definite-genitive-plural":"heleșteielor","singular-vocative":"heleșteule","plural-vocative":"heleșteielor"}},{"word":"helge","pos":"noun","definitions":["weasel"],"forms":{"plural":"helgi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"helge","accusative-definite-nominative-singular":"helgea","accusative-indefinite-nominative-plural":"helgi","accusative-definite-nominative-plural":"helgile","dative-genitive-indefinite-singular":"helgi","dative-definite-genitive-singular":"helgii","dative-genitive-indefinite-plural":"helgi","dative-definite-genitive-plural":"helgilor","singular-vocative":"helge","plural-vocative":"helgilor"}},{"word":"heliac","pos":"adj","definitions":["heliacal"],"forms":{"feminine-singular":"heliacă","masculine-plural":"heliaci","feminine-neuter-plural":"heliace","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliac","error-unrecognized-form-feminine-indefinite-singular":"heliacă","error-unrecognized-form-indefinite-masculine-plural":"heliaci","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliace","definite-error-unrecognized-form-masculine-neuter-singular":"heliacul","definite-error-unrecognized-form-feminine-singular":"heliaca","definite-error-unrecognized-form-masculine-plural":"heliacii","definite-error-unrecognized-form-feminine-neuter-plural":"heliacele"}},{"word":"Heliade","pos":"name","definitions":["a surname from Greek"],"gender":"m","forms":{"dative-genitive":"lui Heliade"}},{"word":"Heliade Rădulescu","pos":"name","definitions":["a village in Ziduri, Buzău County, Romania"],"gender":"m"},{"word":"heliant","pos":"noun","definitions":["helianthus"],"forms":{"plural":"helianți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heliant","accusative-definite-nominative-singular":"heliantul","accusative-indefinite-nominative-plural":"helianți","accusative-definite-nominative-plural":"helianții","dative-genitive-indefinite-singular":"heliant","dative-definite-genitive-singular":"heliantului","dative-genitive-indefinite-plural":"helianți","dative-definite-genitive-plural":"helianților","singular-vocative":"heliantule","plural-vocative":"helianților"}},{"word":"heliantină","pos":"noun","definitions":["helianthine"],"forms":{"plural":"heliantine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliantină","accusative-definite-nominative-singular":"heliantina","accusative-indefinite-nominative-plural":"heliantine","accusative-definite-nominative-plural":"heliantinele","dative-genitive-indefinite-singular":"heliantine","dative-definite-genitive-singular":"heliantinei","dative-genitive-indefinite-plural":"heliantine","dative-definite-genitive-plural":"heliantinelor","singular-vocative":"heliantină","plural-vocative":"heliantinelor"}},{"word":"heliast","pos":"noun","definitions":["heliast"],"forms":{"plural":"heliaști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heliast","accusative-definite-nominative-singular":"heliastul","accusative-indefinite-nominative-plural":"heliaști","accusative-definite-nominative-plural":"heliaștii","dative-genitive-indefinite-singular":"heliast","dative-definite-genitive-singular":"heliastului","dative-genitive-indefinite-plural":"heliaști","dative-definite-genitive-plural":"heliaștilor","singular-vocative":"heliastule","plural-vocative":"heliaștilor"}},{"word":"helice","pos":"noun","definitions":["alternative form of elice"],"forms":{"plural":"helice"}},{"word":"helicoidal","pos":"adj","definitions":["obsolete form of elicoidal"],"forms":{"feminine-singular":"helicoidală","masculine-plural":"helicoidali","feminine-neuter-plural":"helicoidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helicoidal","error-unrecognized-form-feminine-indefinite-singular":"helicoidală","error-unrecognized-form-indefinite-masculine-plural":"helicoidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"helicoidale","definite-error-unrecognized-form-masculine-neuter-singular":"helicoidalul","definite-error-unrecognized-form-feminine-singular":"helicoidala","definite-error-unrecognized-form-masculine-plural":"helicoidalii","definite-error-unrecognized-form-feminine-neuter-plural":"helicoidalele"}},{"word":"helicon","pos":"noun","definitions":["helicon"],"pronunciation":"/he.liˈkon/","forms":{"plural":"helicoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"helicon","accusative-definite-nominative-singular":"heliconul","accusative-indefinite-nominative-plural":"helicoane","accusative-definite-nominative-plural":"helicoanele","dative-genitive-indefinite-singular":"helicon","dative-definite-genitive-singular":"heliconului","dative-genitive-indefinite-plural":"helicoane","dative-definite-genitive-plural":"helicoanelor","singular-vocative":"heliconule","plural-vocative":"helicoanelor"}},{"word":"helicopter","pos":"noun","definitions":["alternative form of elicopter"],"forms":{"plural":"helicoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"helicopter","accusative-definite-nominative-singular":"helicopterul","accusative-indefinite-nominative-plural":"helicoptere","accusative-definite-nominative-plural":"helicopterele","dative-genitive-indefinite-singular":"helicopter","dative-definite-genitive-singular":"helicopterului","dative-genitive-indefinite-plural":"helicoptere","dative-definite-genitive-plural":"helicopterelor","singular-vocative":"helicopterule","plural-vocative":"helicopterelor"}},{"word":"helictită","pos":"noun","definitions":["helictite"],"forms":{"plural":"helictite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helictită","accusative-definite-nominative-singular":"helictita","accusative-indefinite-nominative-plural":"helictite","accusative-definite-nominative-plural":"helictitele","dative-genitive-indefinite-singular":"helictite","dative-definite-genitive-singular":"helictitei","dative-genitive-indefinite-plural":"helictite","dative-definite-genitive-plural":"helictitelor","singular-vocative":"helictită","plural-vocative":"helictitelor"}},{"word":"heliocentrală","pos":"noun","definitions":["solar power plant"],"forms":{"plural":"heliocentrale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliocentrală","accusative-definite-nominative-singular":"heliocentrala","accusative-indefinite-nominative-plural":"heliocentrale","accusative-definite-nominative-plural":"heliocentralele","dative-genitive-indefinite-singular":"heliocentrale","dative-definite-genitive-singular":"heliocentralei","dative-genitive-indefinite-plural":"heliocentrale","dative-definite-genitive-plural":"heliocentralelor","singular-vocative":"heliocentrală","plural-vocative":"heliocentralelor"}},{"word":"heliocentric","pos":"adj","definitions":["heliocentric"],"pronunciation":"/he.li.oˈt͡ʃen.trik/","forms":{"feminine-singular":"heliocentrică","masculine-plural":"heliocentrici","feminine-neuter-plural":"heliocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliocentric","error-unrecognized-form-feminine-indefinite-singular":"heliocentrică","error-unrecognized-form-indefinite-masculine-plural":"heliocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"heliocentricul","definite-error-unrecognized-form-feminine-singular":"heliocentrica","definite-error-unrecognized-form-masculine-plural":"heliocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"heliocentricele"}},{"word":"heliocentrism","pos":"noun","definitions":["heliocentrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heliocentrism","accusative-definite-nominative":"heliocentrismul","dative-genitive-indefinite":"heliocentrism","dative-definite-genitive":"heliocentrismului","vocative":"heliocentrismule"}},{"word":"heliocromie","pos":"noun","definitions":["heliochromy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heliocromie","accusative-definite-nominative-singular":"heliocromia","accusative-indefinite-nominative-plural":"heliocromii","accusative-definite-nominative-plural":"heliocromiile","dative-genitive-indefinite-singular":"heliocromii","dative-definite-genitive-singular":"heliocromiei","dative-genitive-indefinite-plural":"heliocromii","dative-definite-genitive-plural":"heliocromiilor","singular-vocative":"heliocromie","plural-vocative":"heliocromiilor"}},{"word":"heliodor","pos":"noun","definitions":["heliodor"],"pronunciation":"/he.li.oˈdor/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heliodor","accusative-definite-nominative":"heliodorul","dative-genitive-indefinite":"heliodor","dative-definite-genitive":"heliodorului","vocative":"heliodorule"}},{"word":"heliofil","pos":"adj","definitions":["heliophile"],"forms":{"feminine-singular":"heliofilă","masculine-plural":"heliofili","feminine-neuter-plural":"heliofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliofil","error-unrecognized-form-feminine-indefinite-singular":"heliofilă","error-unrecognized-form-indefinite-masculine-plural":"heliofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliofile","definite-error-unrecognized-form-masculine-neuter-singular":"heliofilul","definite-error-unrecognized-form-feminine-singular":"heliofila","definite-error-unrecognized-form-masculine-plural":"heliofilii","definite-error-unrecognized-form-feminine-neuter-plural":"heliofilele"}},{"word":"heliofilie","pos":"noun","definitions":["heliophilia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heliofilie","accusative-definite-nominative":"heliofilia","dative-genitive-indefinite":"heliofilii","dative-definite-genitive":"heliofiliei","vocative":"heliofilie"}},{"word":"heliofob","pos":"adj","definitions":["heliophobic"],"forms":{"feminine-singular":"heliofobă","masculine-plural":"heliofobi","feminine-neuter-plural":"heliofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliofob","error-unrecognized-form-feminine-indefinite-singular":"heliofobă","error-unrecognized-form-indefinite-masculine-plural":"heliofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliofobe","definite-error-unrecognized-form-masculine-neuter-singular":"heliofobul","definite-error-unrecognized-form-feminine-singular":"heliofoba","definite-error-unrecognized-form-masculine-plural":"heliofobii","definite-error-unrecognized-form-feminine-neuter-plural":"heliofobele"}},{"word":"heliofobă","pos":"noun","definitions":["female equivalent of heliofob"],"forms":{"plural":"heliofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliofobă","accusative-definite-nominative-singular":"heliofoba","accusative-indefinite-nominative-plural":"heliofobe","accusative-definite-nominative-plural":"heliofobele","dative-genitive-indefinite-singular":"heliofobe","dative-definite-genitive-singular":"heliofobei","dative-genitive-indefinite-plural":"heliofobe","dative-definite-genitive-plural":"heliofobelor","singular-vocative":"heliofobă","plural-vocative":"heliofobelor"}},{"word":"heliofobie","pos":"noun","definitions":["heliophobia"],"forms":{"plural":"heliofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heliofobie","accusative-definite-nominative-singular":"heliofobia","accusative-indefinite-nominative-plural":"heliofobii","accusative-definite-nominative-plural":"heliofobiile","dative-genitive-indefinite-singular":"heliofobii","dative-definite-genitive-singular":"heliofobiei","dative-genitive-indefinite-plural":"heliofobii","dative-definite-genitive-plural":"heliofobiilor","singular-vocative":"heliofobie","plural-vocative":"heliofobiilor"}},{"word":"heliograf","pos":"noun","definitions":["heliograph"],"forms":{"plural":"heliografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heliograf","accusative-definite-nominative-singular":"heliograful","accusative-indefinite-nominative-plural":"heliografe","accusative-definite-nominative-plural":"heliografele","dative-genitive-indefinite-singular":"heliograf","dative-definite-genitive-singular":"heliografului","dative-genitive-indefinite-plural":"heliografe","dative-definite-genitive-plural":"heliografelor","singular-vocative":"heliografule","plural-vocative":"heliografelor"}},{"word":"heliografic","pos":"adj","definitions":["heliographic"],"forms":{"feminine-singular":"heliografică","masculine-plural":"heliografici","feminine-neuter-plural":"heliografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliografic","error-unrecognized-form-feminine-indefinite-singular":"heliografică","error-unrecognized-form-indefinite-masculine-plural":"heliografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliografice","definite-error-unrecognized-form-masculine-neuter-singular":"heliograficul","definite-error-unrecognized-form-feminine-singular":"heliografica","definite-error-unrecognized-form-masculine-plural":"heliograficii","definite-error-unrecognized-form-feminine-neuter-plural":"heliograficele"}},{"word":"heliografie","pos":"noun","definitions":["heliography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heliografie","accusative-definite-nominative":"heliografia","dative-genitive-indefinite":"heliografii","dative-definite-genitive":"heliografiei","vocative":"heliografie"}},{"word":"heliogravor","pos":"noun","definitions":["heliographer"],"forms":{"plural":"heliogravori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heliogravor","accusative-definite-nominative-singular":"heliogravorul","accusative-indefinite-nominative-plural":"heliogravori","accusative-definite-nominative-plural":"heliogravorii","dative-genitive-indefinite-singular":"heliogravor","dative-definite-genitive-singular":"heliogravorului","dative-genitive-indefinite-plural":"heliogravori","dative-definite-genitive-plural":"heliogravorilor","singular-vocative":"heliogravorule","plural-vocative":"heliogravorilor"}},{"word":"heliogravură","pos":"noun","definitions":["heliogravure, rotogravure"],"forms":{"plural":"heliogravuri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"heliogravură","accusative-definite-nominative-singular":"heliogravura","accusative-indefinite-nominative-plural":"heliogravuri","accusative-definite-nominative-plural":"heliogravurile","dative-genitive-indefinite-singular":"heliogravuri","dative-definite-genitive-singular":"heliogravurii","dative-genitive-indefinite-plural":"heliogravuri","dative-definite-genitive-plural":"heliogravurilor","singular-vocative":"heliogravură","plural-vocative":"heliogravurilor"}},{"word":"heliomarin","pos":"adj","definitions":["sea and sun (therapy)"],"forms":{"feminine-singular":"heliomarină","masculine-plural":"heliomarini","feminine-neuter-plural":"heliomarine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliomarin","error-unrecognized-form-feminine-indefinite-singular":"heliomarină","error-unrecognized-form-indefinite-masculine-plural":"heliomarini","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliomarine","definite-error-unrecognized-form-masculine-neuter-singular":"heliomarinul","definite-error-unrecognized-form-feminine-singular":"heliomarina","definite-error-unrecognized-form-masculine-plural":"heliomarinii","definite-error-unrecognized-form-feminine-neuter-plural":"heliomarinele"}},{"word":"heliometric","pos":"adj","definitions":["heliometric"],"forms":{"feminine-singular":"heliometrică","masculine-plural":"heliometrici","feminine-neuter-plural":"heliometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliometric","error-unrecognized-form-feminine-indefinite-singular":"heliometrică","error-unrecognized-form-indefinite-masculine-plural":"heliometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliometrice","definite-error-unrecognized-form-masculine-neuter-singular":"heliometricul","definite-error-unrecognized-form-feminine-singular":"heliometrica","definite-error-unrecognized-form-masculine-plural":"heliometricii","definite-error-unrecognized-form-feminine-neuter-plural":"heliometricele"}},{"word":"heliometru","pos":"noun","definitions":["heliometer"],"forms":{"plural":"heliometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heliometru","accusative-definite-nominative-singular":"heliometrul","accusative-indefinite-nominative-plural":"heliometre","accusative-definite-nominative-plural":"heliometrele","dative-genitive-indefinite-singular":"heliometru","dative-definite-genitive-singular":"heliometrului","dative-genitive-indefinite-plural":"heliometre","dative-definite-genitive-plural":"heliometrelor","singular-vocative":"heliometrule","plural-vocative":"heliometrelor"}},{"word":"helion","pos":"noun","definitions":["helion"],"forms":{"plural":"helioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"helion","accusative-definite-nominative-singular":"helionul","accusative-indefinite-nominative-plural":"helioni","accusative-definite-nominative-plural":"helionii","dative-genitive-indefinite-singular":"helion","dative-definite-genitive-singular":"helionului","dative-genitive-indefinite-plural":"helioni","dative-definite-genitive-plural":"helionilor","singular-vocative":"helionule","plural-vocative":"helionilor"}},{"word":"helioscop","pos":"noun","definitions":["helioscope"],"forms":{"plural":"helioscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"helioscop","accusative-definite-nominative-singular":"helioscopul","accusative-indefinite-nominative-plural":"helioscoape","accusative-definite-nominative-plural":"helioscoapele","dative-genitive-indefinite-singular":"helioscop","dative-definite-genitive-singular":"helioscopului","dative-genitive-indefinite-plural":"helioscoape","dative-definite-genitive-plural":"helioscoapelor","singular-vocative":"helioscopule","plural-vocative":"helioscoapelor"}},{"word":"heliostat","pos":"noun","definitions":["heliostat"],"forms":{"plural":"heliostate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heliostat","accusative-definite-nominative-singular":"heliostatul","accusative-indefinite-nominative-plural":"heliostate","accusative-definite-nominative-plural":"heliostatele","dative-genitive-indefinite-singular":"heliostat","dative-definite-genitive-singular":"heliostatului","dative-genitive-indefinite-plural":"heliostate","dative-definite-genitive-plural":"heliostatelor","singular-vocative":"heliostatule","plural-vocative":"heliostatelor"}},{"word":"heliotactism","pos":"noun","definitions":["heliotaxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heliotactism","accusative-definite-nominative":"heliotactismul","dative-genitive-indefinite":"heliotactism","dative-definite-genitive":"heliotactismului","vocative":"heliotactismule"}},{"word":"heliotehnic","pos":"adj","definitions":["solar energy technology"],"forms":{"feminine-singular":"heliotehnică","masculine-plural":"heliotehnici","feminine-neuter-plural":"heliotehnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliotehnic","error-unrecognized-form-feminine-indefinite-singular":"heliotehnică","error-unrecognized-form-indefinite-masculine-plural":"heliotehnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliotehnice","definite-error-unrecognized-form-masculine-neuter-singular":"heliotehnicul","definite-error-unrecognized-form-feminine-singular":"heliotehnica","definite-error-unrecognized-form-masculine-plural":"heliotehnicii","definite-error-unrecognized-form-feminine-neuter-plural":"heliotehnicele"}},{"word":"heliotehnică","pos":"noun","definitions":["solar energy technology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliotehnică","accusative-definite-nominative-singular":"heliotehnica","accusative-indefinite-nominative-plural":"heliotehnice","accusative-definite-nominative-plural":"heliotehnicele","dative-genitive-indefinite-singular":"heliotehnice","dative-definite-genitive-singular":"heliotehnicei","dative-genitive-indefinite-plural":"heliotehnice","dative-definite-genitive-plural":"heliotehnicelor","singular-vocative":"heliotehnică","plural-vocative":"heliotehnicelor"}},{"word":"heliotehniciană","pos":"noun","definitions":["female equivalent of heliotehnician"],"forms":{"plural":"heliotehniciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliotehniciană","accusative-definite-nominative-singular":"heliotehniciana","accusative-indefinite-nominative-plural":"heliotehniciene","accusative-definite-nominative-plural":"heliotehnicienele","dative-genitive-indefinite-singular":"heliotehniciene","dative-definite-genitive-singular":"heliotehnicienei","dative-genitive-indefinite-plural":"heliotehniciene","dative-definite-genitive-plural":"heliotehnicienelor","singular-vocative":"heliotehniciană","plural-vocative":"heliotehnicienelor"}},{"word":"helioterapic","pos":"adj","definitions":["heliotherapeutic"],"forms":{"feminine-singular":"helioterapică","masculine-plural":"helioterapici","feminine-neuter-plural":"helioterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helioterapic","error-unrecognized-form-feminine-indefinite-singular":"helioterapică","error-unrecognized-form-indefinite-masculine-plural":"helioterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"helioterapice","definite-error-unrecognized-form-masculine-neuter-singular":"helioterapicul","definite-error-unrecognized-form-feminine-singular":"helioterapica","definite-error-unrecognized-form-masculine-plural":"helioterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"helioterapicele"}},{"word":"helioterapie","pos":"noun","definitions":["heliotherapy"],"forms":{"plural":"helioterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"helioterapie","accusative-definite-nominative-singular":"helioterapia","accusative-indefinite-nominative-plural":"helioterapii","accusative-definite-nominative-plural":"helioterapiile","dative-genitive-indefinite-singular":"helioterapii","dative-definite-genitive-singular":"helioterapiei","dative-genitive-indefinite-plural":"helioterapii","dative-definite-genitive-plural":"helioterapiilor","singular-vocative":"helioterapie","plural-vocative":"helioterapiilor"}},{"word":"helioterm","pos":"adj","definitions":["heliothermic"],"forms":{"feminine-singular":"heliotermă","masculine-plural":"heliotermi","feminine-neuter-plural":"helioterme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helioterm","error-unrecognized-form-feminine-indefinite-singular":"heliotermă","error-unrecognized-form-indefinite-masculine-plural":"heliotermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"helioterme","definite-error-unrecognized-form-masculine-neuter-singular":"heliotermul","definite-error-unrecognized-form-feminine-singular":"helioterma","definite-error-unrecognized-form-masculine-plural":"heliotermii","definite-error-unrecognized-form-feminine-neuter-plural":"heliotermele"}},{"word":"heliotermic","pos":"adj","definitions":["heliothermic"],"forms":{"feminine-singular":"heliotermică","masculine-plural":"heliotermici","feminine-neuter-plural":"heliotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliotermic","error-unrecognized-form-feminine-indefinite-singular":"heliotermică","error-unrecognized-form-indefinite-masculine-plural":"heliotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliotermice","definite-error-unrecognized-form-masculine-neuter-singular":"heliotermicul","definite-error-unrecognized-form-feminine-singular":"heliotermica","definite-error-unrecognized-form-masculine-plural":"heliotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"heliotermicele"}},{"word":"heliotermie","pos":"noun","definitions":["heliothermy"],"forms":{"plural":"heliotermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heliotermie","accusative-definite-nominative-singular":"heliotermia","accusative-indefinite-nominative-plural":"heliotermii","accusative-definite-nominative-plural":"heliotermiile","dative-genitive-indefinite-singular":"heliotermii","dative-definite-genitive-singular":"heliotermiei","dative-genitive-indefinite-plural":"heliotermii","dative-definite-genitive-plural":"heliotermiilor","singular-vocative":"heliotermie","plural-vocative":"heliotermiilor"}},{"word":"heliotipie","pos":"noun","definitions":["heliotype"],"forms":{"plural":"heliotipii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heliotipie","accusative-definite-nominative-singular":"heliotipia","accusative-indefinite-nominative-plural":"heliotipii","accusative-definite-nominative-plural":"heliotipiile","dative-genitive-indefinite-singular":"heliotipii","dative-definite-genitive-singular":"heliotipiei","dative-genitive-indefinite-plural":"heliotipii","dative-definite-genitive-plural":"heliotipiilor","singular-vocative":"heliotipie","plural-vocative":"heliotipiilor"}},{"word":"heliotrop","pos":"noun","definitions":["heliotrope"],"forms":{"plural":"heliotrope","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heliotrop","accusative-definite-nominative-singular":"heliotropul","accusative-indefinite-nominative-plural":"heliotrope","accusative-definite-nominative-plural":"heliotropele","dative-genitive-indefinite-singular":"heliotrop","dative-definite-genitive-singular":"heliotropului","dative-genitive-indefinite-plural":"heliotrope","dative-definite-genitive-plural":"heliotropelor","singular-vocative":"heliotropule","plural-vocative":"heliotropelor"}},{"word":"heliotropic","pos":"adj","definitions":["heliotropic"],"forms":{"feminine-singular":"heliotropică","masculine-plural":"heliotropici","feminine-neuter-plural":"heliotropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heliotropic","error-unrecognized-form-feminine-indefinite-singular":"heliotropică","error-unrecognized-form-indefinite-masculine-plural":"heliotropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heliotropice","definite-error-unrecognized-form-masculine-neuter-singular":"heliotropicul","definite-error-unrecognized-form-feminine-singular":"heliotropica","definite-error-unrecognized-form-masculine-plural":"heliotropicii","definite-error-unrecognized-form-feminine-neuter-plural":"heliotropicele"}},{"word":"heliotropină","pos":"noun","definitions":["heliotropin"],"forms":{"plural":"heliotropine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heliotropină","accusative-definite-nominative-singular":"heliotropina","accusative-indefinite-nominative-plural":"heliotropine","accusative-definite-nominative-plural":"heliotropinele","dative-genitive-indefinite-singular":"heliotropine","dative-definite-genitive-singular":"heliotropinei","dative-genitive-indefinite-plural":"heliotropine","dative-definite-genitive-plural":"heliotropinelor","singular-vocative":"heliotropină","plural-vocative":"heliotropinelor"}},{"word":"heliotropism","pos":"noun","definitions":["heliotropism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heliotropism","accusative-definite-nominative":"heliotropismul","dative-genitive-indefinite":"heliotropism","dative-definite-genitive":"heliotropismului","vocative":"heliotropismule"}},{"word":"helioză","pos":"noun","definitions":["heliosis"],"forms":{"plural":"helioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helioză","accusative-definite-nominative-singular":"helioza","accusative-indefinite-nominative-plural":"helioze","accusative-definite-nominative-plural":"heliozele","dative-genitive-indefinite-singular":"helioze","dative-definite-genitive-singular":"heliozei","dative-genitive-indefinite-plural":"helioze","dative-definite-genitive-plural":"heliozelor","singular-vocative":"helioză","plural-vocative":"heliozelor"}},{"word":"heliport","pos":"noun","definitions":["alternative form of eliport"],"forms":{"plural":"heliporturi"}},{"word":"heliu","pos":"noun","definitions":["helium (chemical element)"],"pronunciation":"/ˈhelju/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heliu","accusative-definite-nominative":"heliul","dative-genitive-indefinite":"heliu","dative-definite-genitive":"heliului","vocative":"heliule"}},{"word":"helix","pos":"noun","definitions":["helix"],"forms":{"plural":"helixuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"helix","accusative-definite-nominative-singular":"helixul","accusative-indefinite-nominative-plural":"helixuri","accusative-definite-nominative-plural":"helixurile","dative-genitive-indefinite-singular":"helix","dative-definite-genitive-singular":"helixului","dative-genitive-indefinite-plural":"helixuri","dative-definite-genitive-plural":"helixurilor","singular-vocative":"helixule","plural-vocative":"helixurilor"}},{"word":"helmint","pos":"noun","definitions":["helminth"],"forms":{"plural":"helminți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"helmint","accusative-definite-nominative-singular":"helmintul","accusative-indefinite-nominative-plural":"helminți","accusative-definite-nominative-plural":"helminții","dative-genitive-indefinite-singular":"helmint","dative-definite-genitive-singular":"helmintului","dative-genitive-indefinite-plural":"helminți","dative-definite-genitive-plural":"helminților","singular-vocative":"helmintule","plural-vocative":"helminților"}},{"word":"helmintiază","pos":"noun","definitions":["helminthiasis"],"forms":{"plural":"helmintiaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helmintiază","accusative-definite-nominative-singular":"helmintiaza","accusative-indefinite-nominative-plural":"helmintiaze","accusative-definite-nominative-plural":"helmintiazele","dative-genitive-indefinite-singular":"helmintiaze","dative-definite-genitive-singular":"helmintiazei","dative-genitive-indefinite-plural":"helmintiaze","dative-definite-genitive-plural":"helmintiazelor","singular-vocative":"helmintiază","plural-vocative":"helmintiazelor"}},{"word":"helmintic","pos":"adj","definitions":["helminthic"],"forms":{"feminine-singular":"helmintică","masculine-plural":"helmintici","feminine-neuter-plural":"helmintice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helmintic","error-unrecognized-form-feminine-indefinite-singular":"helmintică","error-unrecognized-form-indefinite-masculine-plural":"helmintici","error-unrecognized-form-feminine-indefinite-neuter-plural":"helmintice","definite-error-unrecognized-form-masculine-neuter-singular":"helminticul","definite-error-unrecognized-form-feminine-singular":"helmintica","definite-error-unrecognized-form-masculine-plural":"helminticii","definite-error-unrecognized-form-feminine-neuter-plural":"helminticele"}},{"word":"helmintologie","pos":"noun","definitions":["helminthology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"helmintologie","accusative-definite-nominative-singular":"helmintologia","accusative-indefinite-nominative-plural":"helmintologii","accusative-definite-nominative-plural":"helmintologiile","dative-genitive-indefinite-singular":"helmintologii","dative-definite-genitive-singular":"helmintologiei","dative-genitive-indefinite-plural":"helmintologii","dative-definite-genitive-plural":"helmintologiilor","singular-vocative":"helmintologie","plural-vocative":"helmintologiilor"}},{"word":"helmintosporioză","pos":"noun","definitions":["helminthosporiosis"],"forms":{"plural":"helmintosporioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helmintosporioză","accusative-definite-nominative-singular":"helmintosporioza","accusative-indefinite-nominative-plural":"helmintosporioze","accusative-definite-nominative-plural":"helmintosporiozele","dative-genitive-indefinite-singular":"helmintosporioze","dative-definite-genitive-singular":"helmintosporiozei","dative-genitive-indefinite-plural":"helmintosporioze","dative-definite-genitive-plural":"helmintosporiozelor","singular-vocative":"helmintosporioză","plural-vocative":"helmintosporiozelor"}},{"word":"helofită","pos":"noun","definitions":["helophyte"],"forms":{"plural":"helofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"helofită","accusative-definite-nominative-singular":"helofita","accusative-indefinite-nominative-plural":"helofite","accusative-definite-nominative-plural":"helofitele","dative-genitive-indefinite-singular":"helofite","dative-definite-genitive-singular":"helofitei","dative-genitive-indefinite-plural":"helofite","dative-definite-genitive-plural":"helofitelor","singular-vocative":"helofită","plural-vocative":"helofitelor"}},{"word":"helvet","pos":"noun","definitions":["Helvetii"],"forms":{"plural":"helveți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"helvet","accusative-definite-nominative-singular":"helvetul","accusative-indefinite-nominative-plural":"helveți","accusative-definite-nominative-plural":"helveții","dative-genitive-indefinite-singular":"helvet","dative-definite-genitive-singular":"helvetului","dative-genitive-indefinite-plural":"helveți","dative-definite-genitive-plural":"helveților","singular-vocative":"helvetule","plural-vocative":"helveților"}},{"word":"helvetic","pos":"adj","definitions":["Swiss"],"forms":{"feminine-singular":"helvetică","masculine-plural":"helvetici","feminine-neuter-plural":"helvetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"helvetic","error-unrecognized-form-feminine-indefinite-singular":"helvetică","error-unrecognized-form-indefinite-masculine-plural":"helvetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"helvetice","definite-error-unrecognized-form-masculine-neuter-singular":"helveticul","definite-error-unrecognized-form-feminine-singular":"helvetica","definite-error-unrecognized-form-masculine-plural":"helveticii","definite-error-unrecognized-form-feminine-neuter-plural":"helveticele"}},{"word":"hem","pos":"noun","definitions":["heme"],"forms":{"plural":"hemuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hem","accusative-definite-nominative-singular":"hemul","accusative-indefinite-nominative-plural":"hemuri","accusative-definite-nominative-plural":"hemurile","dative-genitive-indefinite-singular":"hem","dative-definite-genitive-singular":"hemului","dative-genitive-indefinite-plural":"hemuri","dative-definite-genitive-plural":"hemurilor","singular-vocative":"hemule","plural-vocative":"hemurilor"}},{"word":"hemangiom","pos":"noun","definitions":["hemangioma"],"forms":{"plural":"hemangioame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemangiom","accusative-definite-nominative-singular":"hemangiomul","accusative-indefinite-nominative-plural":"hemangioame","accusative-definite-nominative-plural":"hemangioamele","dative-genitive-indefinite-singular":"hemangiom","dative-definite-genitive-singular":"hemangiomului","dative-genitive-indefinite-plural":"hemangioame","dative-definite-genitive-plural":"hemangioamelor","singular-vocative":"hemangiomule","plural-vocative":"hemangioamelor"}},{"word":"hemartroză","pos":"noun","definitions":["haemarthrosis"],"forms":{"plural":"hemartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemartroză","accusative-definite-nominative-singular":"hemartroza","accusative-indefinite-nominative-plural":"hemartroze","accusative-definite-nominative-plural":"hemartrozele","dative-genitive-indefinite-singular":"hemartroze","dative-definite-genitive-singular":"hemartrozei","dative-genitive-indefinite-plural":"hemartroze","dative-definite-genitive-plural":"hemartrozelor","singular-vocative":"hemartroză","plural-vocative":"hemartrozelor"}},{"word":"hematemeză","pos":"noun","definitions":["haematemesis"],"forms":{"plural":"hematemeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematemeză","accusative-definite-nominative-singular":"hematemeza","accusative-indefinite-nominative-plural":"hematemeze","accusative-definite-nominative-plural":"hematemezele","dative-genitive-indefinite-singular":"hematemeze","dative-definite-genitive-singular":"hematemezei","dative-genitive-indefinite-plural":"hematemeze","dative-definite-genitive-plural":"hematemezelor","singular-vocative":"hematemeză","plural-vocative":"hematemezelor"}}];
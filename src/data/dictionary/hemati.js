@@ -0,0 +1 @@
+export default [{"word":"hematic","pos":"adj","definitions":["hematic"],"forms":{"feminine-singular":"hematică","masculine-plural":"hematici","feminine-neuter-plural":"hematice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hematic","error-unrecognized-form-feminine-indefinite-singular":"hematică","error-unrecognized-form-indefinite-masculine-plural":"hematici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hematice","definite-error-unrecognized-form-masculine-neuter-singular":"hematicul","definite-error-unrecognized-form-feminine-singular":"hematica","definite-error-unrecognized-form-masculine-plural":"hematicii","definite-error-unrecognized-form-feminine-neuter-plural":"hematicele"}},{"word":"hematie","pos":"noun","definitions":["red blood cell"],"forms":{"plural":"hematii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematie","accusative-definite-nominative-singular":"hematia","accusative-indefinite-nominative-plural":"hematii","accusative-definite-nominative-plural":"hematiile","dative-genitive-indefinite-singular":"hematii","dative-definite-genitive-singular":"hematiei","dative-genitive-indefinite-plural":"hematii","dative-definite-genitive-plural":"hematiilor","singular-vocative":"hematie","plural-vocative":"hematiilor"}},{"word":"hematimetru","pos":"noun","definitions":["hematimeter"],"forms":{"plural":"hematimetre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematimetru","accusative-definite-nominative-singular":"hematimetrul","accusative-indefinite-nominative-plural":"hematimetre","accusative-definite-nominative-plural":"hematimetrele","dative-genitive-indefinite-singular":"hematimetru","dative-definite-genitive-singular":"hematimetrului","dative-genitive-indefinite-plural":"hematimetre","dative-definite-genitive-plural":"hematimetrelor","singular-vocative":"hematimetrule","plural-vocative":"hematimetrelor"}},{"word":"hematină","pos":"noun","definitions":["haematin"],"forms":{"plural":"hematine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematină","accusative-definite-nominative-singular":"hematina","accusative-indefinite-nominative-plural":"hematine","accusative-definite-nominative-plural":"hematinele","dative-genitive-indefinite-singular":"hematine","dative-definite-genitive-singular":"hematinei","dative-genitive-indefinite-plural":"hematine","dative-definite-genitive-plural":"hematinelor","singular-vocative":"hematină","plural-vocative":"hematinelor"}},{"word":"hematit","pos":"noun","definitions":["hematite"],"pronunciation":"/he.maˈtit/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hematit","accusative-definite-nominative":"hematitul","dative-genitive-indefinite":"hematit","dative-definite-genitive":"hematitului","vocative":"hematitule"}},{"word":"hematoblast","pos":"noun","definitions":["haematoblast"],"forms":{"plural":"hematoblasturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hematoblast","accusative-definite-nominative-singular":"hematoblastul","accusative-indefinite-nominative-plural":"hematoblasturi","accusative-definite-nominative-plural":"hematoblasturile","dative-genitive-indefinite-singular":"hematoblast","dative-definite-genitive-singular":"hematoblastului","dative-genitive-indefinite-plural":"hematoblasturi","dative-definite-genitive-plural":"hematoblasturilor","singular-vocative":"hematoblastule","plural-vocative":"hematoblasturilor"}},{"word":"hematocel","pos":"noun","definitions":["hematocele"],"forms":{"plural":"hematocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematocel","accusative-definite-nominative-singular":"hematocelul","accusative-indefinite-nominative-plural":"hematocele","accusative-definite-nominative-plural":"hematocelele","dative-genitive-indefinite-singular":"hematocel","dative-definite-genitive-singular":"hematocelului","dative-genitive-indefinite-plural":"hematocele","dative-definite-genitive-plural":"hematocelelor","singular-vocative":"hematocelule","plural-vocative":"hematocelelor"}},{"word":"hematocheratoză","pos":"noun","definitions":["keratosis"],"forms":{"plural":"hematocheratoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematocheratoză","accusative-definite-nominative-singular":"hematocheratoza","accusative-indefinite-nominative-plural":"hematocheratoze","accusative-definite-nominative-plural":"hematocheratozele","dative-genitive-indefinite-singular":"hematocheratoze","dative-definite-genitive-singular":"hematocheratozei","dative-genitive-indefinite-plural":"hematocheratoze","dative-definite-genitive-plural":"hematocheratozelor","singular-vocative":"hematocheratoză","plural-vocative":"hematocheratozelor"}},{"word":"hematocolpos","pos":"noun","definitions":["hematocolpos"],"forms":{"plural":"hematocolposuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hematocolpos","accusative-definite-nominative-singular":"hematocolposul","accusative-indefinite-nominative-plural":"hematocolposuri","accusative-definite-nominative-plural":"hematocolposurile","dative-genitive-indefinite-singular":"hematocolpos","dative-definite-genitive-singular":"hematocolposului","dative-genitive-indefinite-plural":"hematocolposuri","dative-definite-genitive-plural":"hematocolposurilor","singular-vocative":"hematocolposule","plural-vocative":"hematocolposurilor"}},{"word":"hematocrit","pos":"noun","definitions":["hematocrit"],"forms":{"plural":"hematocrite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematocrit","accusative-definite-nominative-singular":"hematocritul","accusative-indefinite-nominative-plural":"hematocrite","accusative-definite-nominative-plural":"hematocritele","dative-genitive-indefinite-singular":"hematocrit","dative-definite-genitive-singular":"hematocritului","dative-genitive-indefinite-plural":"hematocrite","dative-definite-genitive-plural":"hematocritelor","singular-vocative":"hematocritule","plural-vocative":"hematocritelor"}},{"word":"hematocrom","pos":"noun","definitions":["hematochrome"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hematocrom","accusative-definite-nominative":"hematocromul","dative-genitive-indefinite":"hematocrom","dative-definite-genitive":"hematocromului","vocative":"hematocromule"}},{"word":"hematofag","pos":"noun","definitions":["hematophagous"],"forms":{"plural":"hematofagi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hematofag","accusative-definite-nominative-singular":"hematofagul","accusative-indefinite-nominative-plural":"hematofagi","accusative-definite-nominative-plural":"hematofagii","dative-genitive-indefinite-singular":"hematofag","dative-definite-genitive-singular":"hematofagului","dative-genitive-indefinite-plural":"hematofagi","dative-definite-genitive-plural":"hematofagilor","singular-vocative":"hematofagule","plural-vocative":"hematofagilor"}},{"word":"hematofagă","pos":"noun","definitions":["female equivalent of hematofag"],"forms":{"plural":"hematofage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematofagă","accusative-definite-nominative-singular":"hematofaga","accusative-indefinite-nominative-plural":"hematofage","accusative-definite-nominative-plural":"hematofagele","dative-genitive-indefinite-singular":"hematofage","dative-definite-genitive-singular":"hematofagei","dative-genitive-indefinite-plural":"hematofage","dative-definite-genitive-plural":"hematofagelor","singular-vocative":"hematofagă","plural-vocative":"hematofagelor"}},{"word":"hematofagie","pos":"noun","definitions":["hematophagy"],"forms":{"plural":"hematofagii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematofagie","accusative-definite-nominative-singular":"hematofagia","accusative-indefinite-nominative-plural":"hematofagii","accusative-definite-nominative-plural":"hematofagiile","dative-genitive-indefinite-singular":"hematofagii","dative-definite-genitive-singular":"hematofagiei","dative-genitive-indefinite-plural":"hematofagii","dative-definite-genitive-plural":"hematofagiilor","singular-vocative":"hematofagie","plural-vocative":"hematofagiilor"}},{"word":"hematofobie","pos":"noun","definitions":["hematophobia"],"forms":{"plural":"hematofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematofobie","accusative-definite-nominative-singular":"hematofobia","accusative-indefinite-nominative-plural":"hematofobii","accusative-definite-nominative-plural":"hematofobiile","dative-genitive-indefinite-singular":"hematofobii","dative-definite-genitive-singular":"hematofobiei","dative-genitive-indefinite-plural":"hematofobii","dative-definite-genitive-plural":"hematofobiilor","singular-vocative":"hematofobie","plural-vocative":"hematofobiilor"}},{"word":"hematogen","pos":"noun","definitions":["hematogenous"],"forms":{"plural":"hematogeni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematogen","accusative-definite-nominative-singular":"hematogenul","accusative-indefinite-nominative-plural":"hematogeni","accusative-definite-nominative-plural":"hematogenile","dative-genitive-indefinite-singular":"hematogen","dative-definite-genitive-singular":"hematogenului","dative-genitive-indefinite-plural":"hematogeni","dative-definite-genitive-plural":"hematogenilor","singular-vocative":"hematogenule","plural-vocative":"hematogenilor"}},{"word":"hematoglobinometru","pos":"noun","definitions":["hematoglobinometer"],"forms":{"plural":"hematoglobinometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematoglobinometru","accusative-definite-nominative-singular":"hematoglobinometrul","accusative-indefinite-nominative-plural":"hematoglobinometre","accusative-definite-nominative-plural":"hematoglobinometrele","dative-genitive-indefinite-singular":"hematoglobinometru","dative-definite-genitive-singular":"hematoglobinometrului","dative-genitive-indefinite-plural":"hematoglobinometre","dative-definite-genitive-plural":"hematoglobinometrelor","singular-vocative":"hematoglobinometrule","plural-vocative":"hematoglobinometrelor"}},{"word":"hematolog","pos":"noun","definitions":["hematologist"],"forms":{"plural":"hematologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hematolog","accusative-definite-nominative-singular":"hematologul","accusative-indefinite-nominative-plural":"hematologi","accusative-definite-nominative-plural":"hematologii","dative-genitive-indefinite-singular":"hematolog","dative-definite-genitive-singular":"hematologului","dative-genitive-indefinite-plural":"hematologi","dative-definite-genitive-plural":"hematologilor","singular-vocative":"hematologule","plural-vocative":"hematologilor"}},{"word":"hematologă","pos":"noun","definitions":["female equivalent of hematolog"],"forms":{"plural":"hematologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematologă","accusative-definite-nominative-singular":"hematologa","accusative-indefinite-nominative-plural":"hematologe","accusative-definite-nominative-plural":"hematologele","dative-genitive-indefinite-singular":"hematologe","dative-definite-genitive-singular":"hematologei","dative-genitive-indefinite-plural":"hematologe","dative-definite-genitive-plural":"hematologelor","singular-vocative":"hematologă","plural-vocative":"hematologelor"}},{"word":"hematologic","pos":"adj","definitions":["hematologic"],"forms":{"feminine-singular":"hematologică","masculine-plural":"hematologici","feminine-neuter-plural":"hematologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hematologic","error-unrecognized-form-feminine-indefinite-singular":"hematologică","error-unrecognized-form-indefinite-masculine-plural":"hematologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hematologice","definite-error-unrecognized-form-masculine-neuter-singular":"hematologicul","definite-error-unrecognized-form-feminine-singular":"hematologica","definite-error-unrecognized-form-masculine-plural":"hematologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hematologicele"}},{"word":"hematologie","pos":"noun","definitions":["haematology, hematology"],"pronunciation":"/he.ma.to.loˈd͡ʒi.e/"},{"word":"hematom","pos":"noun","definitions":["hematoma"],"forms":{"plural":"hematoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematom","accusative-definite-nominative-singular":"hematomul","accusative-indefinite-nominative-plural":"hematoame","accusative-definite-nominative-plural":"hematoamele","dative-genitive-indefinite-singular":"hematom","dative-definite-genitive-singular":"hematomului","dative-genitive-indefinite-plural":"hematoame","dative-definite-genitive-plural":"hematoamelor","singular-vocative":"hematomule","plural-vocative":"hematoamelor"}},{"word":"hematometru","pos":"noun","definitions":["haematometer"],"forms":{"plural":"hematometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematometru","accusative-definite-nominative-singular":"hematometruul","accusative-indefinite-nominative-plural":"hematometre","accusative-definite-nominative-plural":"hematometrele","dative-genitive-indefinite-singular":"hematometru","dative-definite-genitive-singular":"hematometruului","dative-genitive-indefinite-plural":"hematometre","dative-definite-genitive-plural":"hematometrelor","singular-vocative":"hematometruule","plural-vocative":"hematometrelor"}},{"word":"hematomielie","pos":"noun","definitions":["hematomyelia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hematomielie","accusative-definite-nominative":"hematomielia","dative-genitive-indefinite":"hematomielii","dative-definite-genitive":"hematomieliei","vocative":"hematomielie"}},{"word":"hematopoietic","pos":"adj","definitions":["hematopoietic"],"forms":{"feminine-singular":"hematopoietică","masculine-plural":"hematopoietici","feminine-neuter-plural":"hematopoietice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hematopoietic","error-unrecognized-form-feminine-indefinite-singular":"hematopoietică","error-unrecognized-form-indefinite-masculine-plural":"hematopoietici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hematopoietice","definite-error-unrecognized-form-masculine-neuter-singular":"hematopoieticul","definite-error-unrecognized-form-feminine-singular":"hematopoietica","definite-error-unrecognized-form-masculine-plural":"hematopoieticii","definite-error-unrecognized-form-feminine-neuter-plural":"hematopoieticele"}},{"word":"hematopoieză","pos":"noun","definitions":["hematopoiesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematopoieză","accusative-definite-nominative-singular":"hematopoieza","accusative-indefinite-nominative-plural":"hematopoieze","accusative-definite-nominative-plural":"hematopoiezele","dative-genitive-indefinite-singular":"hematopoieze","dative-definite-genitive-singular":"hematopoiezei","dative-genitive-indefinite-plural":"hematopoieze","dative-definite-genitive-plural":"hematopoiezelor","singular-vocative":"hematopoieză","plural-vocative":"hematopoiezelor"}},{"word":"hematoporfirină","pos":"noun","definitions":["hematoporphyrin"],"forms":{"plural":"hematoporfirine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematoporfirină","accusative-definite-nominative-singular":"hematoporfirina","accusative-indefinite-nominative-plural":"hematoporfirine","accusative-definite-nominative-plural":"hematoporfirinele","dative-genitive-indefinite-singular":"hematoporfirine","dative-definite-genitive-singular":"hematoporfirinei","dative-genitive-indefinite-plural":"hematoporfirine","dative-definite-genitive-plural":"hematoporfirinelor","singular-vocative":"hematoporfirină","plural-vocative":"hematoporfirinelor"}},{"word":"hematosalpinx","pos":"noun","definitions":["hematosalpinx"],"forms":{"plural":"hematosalpinxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hematosalpinx","accusative-definite-nominative-singular":"hematosalpinxul","accusative-indefinite-nominative-plural":"hematosalpinxuri","accusative-definite-nominative-plural":"hematosalpinxurile","dative-genitive-indefinite-singular":"hematosalpinx","dative-definite-genitive-singular":"hematosalpinxului","dative-genitive-indefinite-plural":"hematosalpinxuri","dative-definite-genitive-plural":"hematosalpinxurilor","singular-vocative":"hematosalpinxule","plural-vocative":"hematosalpinxurilor"}},{"word":"hematospermie","pos":"noun","definitions":["hematospermia"],"forms":{"plural":"hematospermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematospermie","accusative-definite-nominative-singular":"hematospermia","accusative-indefinite-nominative-plural":"hematospermii","accusative-definite-nominative-plural":"hematospermiile","dative-genitive-indefinite-singular":"hematospermii","dative-definite-genitive-singular":"hematospermiei","dative-genitive-indefinite-plural":"hematospermii","dative-definite-genitive-plural":"hematospermiilor","singular-vocative":"hematospermie","plural-vocative":"hematospermiilor"}},{"word":"hematoterapie","pos":"noun","definitions":["hemotherapy"],"forms":{"plural":"hematoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematoterapie","accusative-definite-nominative-singular":"hematoterapia","accusative-indefinite-nominative-plural":"hematoterapii","accusative-definite-nominative-plural":"hematoterapiile","dative-genitive-indefinite-singular":"hematoterapii","dative-definite-genitive-singular":"hematoterapiei","dative-genitive-indefinite-plural":"hematoterapii","dative-definite-genitive-plural":"hematoterapiilor","singular-vocative":"hematoterapie","plural-vocative":"hematoterapiilor"}},{"word":"hematoxilină","pos":"noun","definitions":["hematoxylin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematoxilină","accusative-definite-nominative-singular":"hematoxilina","accusative-indefinite-nominative-plural":"hematoxiline","accusative-definite-nominative-plural":"hematoxilinele","dative-genitive-indefinite-singular":"hematoxiline","dative-definite-genitive-singular":"hematoxilinei","dative-genitive-indefinite-plural":"hematoxiline","dative-definite-genitive-plural":"hematoxilinelor","singular-vocative":"hematoxilină","plural-vocative":"hematoxilinelor"}},{"word":"hematoză","pos":"noun","definitions":["hematosis"],"forms":{"plural":"hematoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hematoză","accusative-definite-nominative-singular":"hematoza","accusative-indefinite-nominative-plural":"hematoze","accusative-definite-nominative-plural":"hematozele","dative-genitive-indefinite-singular":"hematoze","dative-definite-genitive-singular":"hematozei","dative-genitive-indefinite-plural":"hematoze","dative-definite-genitive-plural":"hematozelor","singular-vocative":"hematoză","plural-vocative":"hematozelor"}},{"word":"hematozoar","pos":"noun","definitions":["haematozoa"],"forms":{"plural":"hematozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hematozoar","accusative-definite-nominative-singular":"hematozoarul","accusative-indefinite-nominative-plural":"hematozoare","accusative-definite-nominative-plural":"hematozoarele","dative-genitive-indefinite-singular":"hematozoar","dative-definite-genitive-singular":"hematozoarului","dative-genitive-indefinite-plural":"hematozoare","dative-definite-genitive-plural":"hematozoarelor","singular-vocative":"hematozoarule","plural-vocative":"hematozoarelor"}},{"word":"hematuric","pos":"adj","definitions":["hematuric"],"forms":{"feminine-singular":"hematurică","masculine-plural":"hematurici","feminine-neuter-plural":"hematurice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hematuric","error-unrecognized-form-feminine-indefinite-singular":"hematurică","error-unrecognized-form-indefinite-masculine-plural":"hematurici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hematurice","definite-error-unrecognized-form-masculine-neuter-singular":"hematuricul","definite-error-unrecognized-form-feminine-singular":"hematurica","definite-error-unrecognized-form-masculine-plural":"hematuricii","definite-error-unrecognized-form-feminine-neuter-plural":"hematuricele"}},{"word":"hematurie","pos":"noun","definitions":["hematuria"],"forms":{"plural":"hematurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hematurie","accusative-definite-nominative-singular":"hematuria","accusative-indefinite-nominative-plural":"hematurii","accusative-definite-nominative-plural":"hematuriile","dative-genitive-indefinite-singular":"hematurii","dative-definite-genitive-singular":"hematuriei","dative-genitive-indefinite-plural":"hematurii","dative-definite-genitive-plural":"hematuriilor","singular-vocative":"hematurie","plural-vocative":"hematuriilor"}},{"word":"hemeiugă","pos":"noun","definitions":["hops"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hemeiugă","accusative-definite-nominative":"hemeiuga","dative-genitive-indefinite":"hemeiuge","dative-definite-genitive":"hemeiugei","vocative":"hemeiugă"}},{"word":"hemeralopă","pos":"noun","definitions":["female equivalent of hemeralop"],"forms":{"plural":"hemeralope","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemeralopă","accusative-definite-nominative-singular":"hemeralopa","accusative-indefinite-nominative-plural":"hemeralope","accusative-definite-nominative-plural":"hemeralopele","dative-genitive-indefinite-singular":"hemeralope","dative-definite-genitive-singular":"hemeralopei","dative-genitive-indefinite-plural":"hemeralope","dative-definite-genitive-plural":"hemeralopelor","singular-vocative":"hemeralopă","plural-vocative":"hemeralopelor"}},{"word":"hemeralopie","pos":"noun","definitions":["night blindness"],"forms":{"plural":"hemeralopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemeralopie","accusative-definite-nominative-singular":"hemeralopia","accusative-indefinite-nominative-plural":"hemeralopii","accusative-definite-nominative-plural":"hemeralopiile","dative-genitive-indefinite-singular":"hemeralopii","dative-definite-genitive-singular":"hemeralopiei","dative-genitive-indefinite-plural":"hemeralopii","dative-definite-genitive-plural":"hemeralopiilor","singular-vocative":"hemeralopie","plural-vocative":"hemeralopiilor"}},{"word":"hemerocal","pos":"noun","definitions":["daylily"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hemerocal","accusative-definite-nominative":"hemerocalul","dative-genitive-indefinite":"hemerocal","dative-definite-genitive":"hemerocalului","vocative":"hemerocalule"}},{"word":"hemerolog","pos":"noun","definitions":["hemerologist"],"forms":{"plural":"hemerologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemerolog","accusative-definite-nominative-singular":"hemerologul","accusative-indefinite-nominative-plural":"hemerologi","accusative-definite-nominative-plural":"hemerologii","dative-genitive-indefinite-singular":"hemerolog","dative-definite-genitive-singular":"hemerologului","dative-genitive-indefinite-plural":"hemerologi","dative-definite-genitive-plural":"hemerologilor","singular-vocative":"hemerologule","plural-vocative":"hemerologilor"}},{"word":"hemerologă","pos":"noun","definitions":["female equivalent of hemerolog"],"forms":{"plural":"hemerologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemerologă","accusative-definite-nominative-singular":"hemerologa","accusative-indefinite-nominative-plural":"hemerologe","accusative-definite-nominative-plural":"hemerologele","dative-genitive-indefinite-singular":"hemerologe","dative-definite-genitive-singular":"hemerologei","dative-genitive-indefinite-plural":"hemerologe","dative-definite-genitive-plural":"hemerologelor","singular-vocative":"hemerologă","plural-vocative":"hemerologelor"}},{"word":"hemerologic","pos":"adj","definitions":["hemerological"],"forms":{"feminine-singular":"hemerologică","masculine-plural":"hemerologici","feminine-neuter-plural":"hemerologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemerologic","error-unrecognized-form-feminine-indefinite-singular":"hemerologică","error-unrecognized-form-indefinite-masculine-plural":"hemerologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemerologice","definite-error-unrecognized-form-masculine-neuter-singular":"hemerologicul","definite-error-unrecognized-form-feminine-singular":"hemerologica","definite-error-unrecognized-form-masculine-plural":"hemerologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hemerologicele"}},{"word":"hemerologie","pos":"noun","definitions":["hemerology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemerologie","accusative-definite-nominative-singular":"hemerologia","accusative-indefinite-nominative-plural":"hemerologii","accusative-definite-nominative-plural":"hemerologiile","dative-genitive-indefinite-singular":"hemerologii","dative-definite-genitive-singular":"hemerologiei","dative-genitive-indefinite-plural":"hemerologii","dative-definite-genitive-plural":"hemerologiilor","singular-vocative":"hemerologie","plural-vocative":"hemerologiilor"}},{"word":"hemerotecă","pos":"noun","definitions":["archive (a place, such a section of a library, where periodicals (newspapers, magazines, and so on) are archived for consultation)"],"forms":{"plural":"hemeroteci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hemerotecă","accusative-definite-nominative-singular":"hemeroteca","accusative-indefinite-nominative-plural":"hemeroteci","accusative-definite-nominative-plural":"hemerotecile","dative-genitive-indefinite-singular":"hemeroteci","dative-definite-genitive-singular":"hemerotecii","dative-genitive-indefinite-plural":"hemeroteci","dative-definite-genitive-plural":"hemerotecilor","singular-vocative":"hemerotecă","plural-vocative":"hemerotecilor"}},{"word":"hemesit","pos":"adj","definitions":["alternative form of hămesit"],"forms":{"feminine-singular":"hemesită","masculine-plural":"hemesiți","feminine-neuter-plural":"hemesite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemesit","error-unrecognized-form-feminine-indefinite-singular":"hemesită","error-unrecognized-form-indefinite-masculine-plural":"hemesiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemesite","definite-error-unrecognized-form-masculine-neuter-singular":"hemesitul","definite-error-unrecognized-form-feminine-singular":"hemesita","definite-error-unrecognized-form-masculine-plural":"hemesiții","definite-error-unrecognized-form-feminine-neuter-plural":"hemesitele"}},{"word":"hemialgie","pos":"noun","definitions":["hemialgia"],"forms":{"plural":"hemialgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemialgie","accusative-definite-nominative-singular":"hemialgia","accusative-indefinite-nominative-plural":"hemialgii","accusative-definite-nominative-plural":"hemialgiile","dative-genitive-indefinite-singular":"hemialgii","dative-definite-genitive-singular":"hemialgiei","dative-genitive-indefinite-plural":"hemialgii","dative-definite-genitive-plural":"hemialgiilor","singular-vocative":"hemialgie","plural-vocative":"hemialgiilor"}},{"word":"hemianestezie","pos":"noun","definitions":["hemianesthesia"],"forms":{"plural":"hemianestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemianestezie","accusative-definite-nominative-singular":"hemianestezia","accusative-indefinite-nominative-plural":"hemianestezii","accusative-definite-nominative-plural":"hemianesteziile","dative-genitive-indefinite-singular":"hemianestezii","dative-definite-genitive-singular":"hemianesteziei","dative-genitive-indefinite-plural":"hemianestezii","dative-definite-genitive-plural":"hemianesteziilor","singular-vocative":"hemianestezie","plural-vocative":"hemianesteziilor"}},{"word":"hemianopsie","pos":"noun","definitions":["hemianopia"],"forms":{"plural":"hemianopsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemianopsie","accusative-definite-nominative-singular":"hemianopsia","accusative-indefinite-nominative-plural":"hemianopsii","accusative-definite-nominative-plural":"hemianopsiile","dative-genitive-indefinite-singular":"hemianopsii","dative-definite-genitive-singular":"hemianopsiei","dative-genitive-indefinite-plural":"hemianopsii","dative-definite-genitive-plural":"hemianopsiilor","singular-vocative":"hemianopsie","plural-vocative":"hemianopsiilor"}},{"word":"hemiataxie","pos":"noun","definitions":["hemiataxia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hemiataxie","accusative-definite-nominative":"hemiataxia","dative-genitive-indefinite":"hemiataxii","dative-definite-genitive":"hemiataxiei","vocative":"hemiataxie"}},{"word":"hemiatrofie","pos":"noun","definitions":["hemiatrophy"],"forms":{"plural":"hemiatrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemiatrofie","accusative-definite-nominative-singular":"hemiatrofia","accusative-indefinite-nominative-plural":"hemiatrofii","accusative-definite-nominative-plural":"hemiatrofiile","dative-genitive-indefinite-singular":"hemiatrofii","dative-definite-genitive-singular":"hemiatrofiei","dative-genitive-indefinite-plural":"hemiatrofii","dative-definite-genitive-plural":"hemiatrofiilor","singular-vocative":"hemiatrofie","plural-vocative":"hemiatrofiilor"}},{"word":"hemiceluloză","pos":"noun","definitions":["hemicellulose"],"forms":{"plural":"hemiceluloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemiceluloză","accusative-definite-nominative-singular":"hemiceluloza","accusative-indefinite-nominative-plural":"hemiceluloze","accusative-definite-nominative-plural":"hemicelulozele","dative-genitive-indefinite-singular":"hemiceluloze","dative-definite-genitive-singular":"hemicelulozei","dative-genitive-indefinite-plural":"hemiceluloze","dative-definite-genitive-plural":"hemicelulozelor","singular-vocative":"hemiceluloză","plural-vocative":"hemicelulozelor"}},{"word":"hemiciclu","pos":"noun","definitions":["hemicycle"],"forms":{"plural":"hemicicluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemiciclu","accusative-definite-nominative-singular":"hemiciclul","accusative-indefinite-nominative-plural":"hemicicluri","accusative-definite-nominative-plural":"hemiciclurile","dative-genitive-indefinite-singular":"hemiciclu","dative-definite-genitive-singular":"hemiciclului","dative-genitive-indefinite-plural":"hemicicluri","dative-definite-genitive-plural":"hemiciclurilor","singular-vocative":"hemiciclule","plural-vocative":"hemiciclurilor"}},{"word":"hemicranie","pos":"noun","definitions":["hemicrania"],"forms":{"plural":"hemicranii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemicranie","accusative-definite-nominative-singular":"hemicrania","accusative-indefinite-nominative-plural":"hemicranii","accusative-definite-nominative-plural":"hemicraniile","dative-genitive-indefinite-singular":"hemicranii","dative-definite-genitive-singular":"hemicraniei","dative-genitive-indefinite-plural":"hemicranii","dative-definite-genitive-plural":"hemicraniilor","singular-vocative":"hemicranie","plural-vocative":"hemicraniilor"}},{"word":"hemicriptofită","pos":"noun","definitions":["hemicryptophyte"],"forms":{"plural":"hemicriptofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemicriptofită","accusative-definite-nominative-singular":"hemicriptofita","accusative-indefinite-nominative-plural":"hemicriptofite","accusative-definite-nominative-plural":"hemicriptofitele","dative-genitive-indefinite-singular":"hemicriptofite","dative-definite-genitive-singular":"hemicriptofitei","dative-genitive-indefinite-plural":"hemicriptofite","dative-definite-genitive-plural":"hemicriptofitelor","singular-vocative":"hemicriptofită","plural-vocative":"hemicriptofitelor"}},{"word":"hemicristalin","pos":"adj","definitions":["semicrystalline"],"forms":{"feminine-singular":"hemicristalină","masculine-plural":"hemicristalini","feminine-neuter-plural":"hemicristaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemicristalin","error-unrecognized-form-feminine-indefinite-singular":"hemicristalină","error-unrecognized-form-indefinite-masculine-plural":"hemicristalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemicristaline","definite-error-unrecognized-form-masculine-neuter-singular":"hemicristalinul","definite-error-unrecognized-form-feminine-singular":"hemicristalina","definite-error-unrecognized-form-masculine-plural":"hemicristalinii","definite-error-unrecognized-form-feminine-neuter-plural":"hemicristalinele"}},{"word":"hemiedric","pos":"adj","definitions":["hemihedral"],"forms":{"feminine-singular":"hemiedrică","masculine-plural":"hemiedrici","feminine-neuter-plural":"hemiedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemiedric","error-unrecognized-form-feminine-indefinite-singular":"hemiedrică","error-unrecognized-form-indefinite-masculine-plural":"hemiedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemiedrice","definite-error-unrecognized-form-masculine-neuter-singular":"hemiedricul","definite-error-unrecognized-form-feminine-singular":"hemiedrica","definite-error-unrecognized-form-masculine-plural":"hemiedricii","definite-error-unrecognized-form-feminine-neuter-plural":"hemiedricele"}},{"word":"hemiedrie","pos":"noun","definitions":["hemihedry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hemiedrie","accusative-definite-nominative":"hemiedria","dative-genitive-indefinite":"hemiedrii","dative-definite-genitive":"hemiedriei","vocative":"hemiedrie"}},{"word":"hemimelă","pos":"noun","definitions":["female equivalent of hemimel"],"forms":{"plural":"hemimele","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemimelă","accusative-definite-nominative-singular":"hemimela","accusative-indefinite-nominative-plural":"hemimele","accusative-definite-nominative-plural":"hemimelele","dative-genitive-indefinite-singular":"hemimele","dative-definite-genitive-singular":"hemimelei","dative-genitive-indefinite-plural":"hemimele","dative-definite-genitive-plural":"hemimelelor","singular-vocative":"hemimelă","plural-vocative":"hemimelelor"}},{"word":"hemimelie","pos":"noun","definitions":["hemimelia"],"forms":{"plural":"hemimelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemimelie","accusative-definite-nominative-singular":"hemimelia","accusative-indefinite-nominative-plural":"hemimelii","accusative-definite-nominative-plural":"hemimeliile","dative-genitive-indefinite-singular":"hemimelii","dative-definite-genitive-singular":"hemimeliei","dative-genitive-indefinite-plural":"hemimelii","dative-definite-genitive-plural":"hemimeliilor","singular-vocative":"hemimelie","plural-vocative":"hemimeliilor"}},{"word":"hemimetabol","pos":"adj","definitions":["hemimetabolous"],"forms":{"feminine-singular":"hemimetabolă","masculine-plural":"hemimetaboli","feminine-neuter-plural":"hemimetabole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemimetabol","error-unrecognized-form-feminine-indefinite-singular":"hemimetabolă","error-unrecognized-form-indefinite-masculine-plural":"hemimetaboli","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemimetabole","definite-error-unrecognized-form-masculine-neuter-singular":"hemimetabolul","definite-error-unrecognized-form-feminine-singular":"hemimetabola","definite-error-unrecognized-form-masculine-plural":"hemimetabolii","definite-error-unrecognized-form-feminine-neuter-plural":"hemimetabolele"}},{"word":"hemimetabolă","pos":"adj","definitions":["hemimetabolism"],"forms":{"plural":"hemimetabole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"hemimetabolă","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemimetabole","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"hemimetabola","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"hemimetabolele"}},{"word":"hemimorfit","pos":"noun","definitions":["hemimorphite"],"forms":{"plural":"hemimorfite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemimorfit","accusative-definite-nominative-singular":"hemimorfitul","accusative-indefinite-nominative-plural":"hemimorfite","accusative-definite-nominative-plural":"hemimorfitele","dative-genitive-indefinite-singular":"hemimorfit","dative-definite-genitive-singular":"hemimorfitului","dative-genitive-indefinite-plural":"hemimorfite","dative-definite-genitive-plural":"hemimorfitelor","singular-vocative":"hemimorfitule","plural-vocative":"hemimorfitelor"}},{"word":"hemină","pos":"noun","definitions":["hemin"],"forms":{"plural":"hemine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemină","accusative-definite-nominative-singular":"hemina","accusative-indefinite-nominative-plural":"hemine","accusative-definite-nominative-plural":"heminele","dative-genitive-indefinite-singular":"hemine","dative-definite-genitive-singular":"heminei","dative-genitive-indefinite-plural":"hemine","dative-definite-genitive-plural":"heminelor","singular-vocative":"hemină","plural-vocative":"heminelor"}},{"word":"hemion","pos":"noun","definitions":["hemione"],"forms":{"plural":"hemioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemion","accusative-definite-nominative-singular":"hemionul","accusative-indefinite-nominative-plural":"hemioni","accusative-definite-nominative-plural":"hemionii","dative-genitive-indefinite-singular":"hemion","dative-definite-genitive-singular":"hemionului","dative-genitive-indefinite-plural":"hemioni","dative-definite-genitive-plural":"hemionilor","singular-vocative":"hemionule","plural-vocative":"hemionilor"}},{"word":"hemiopie","pos":"noun","definitions":["hemiopia"],"forms":{"plural":"hemiopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemiopie","accusative-definite-nominative-singular":"hemiopia","accusative-indefinite-nominative-plural":"hemiopii","accusative-definite-nominative-plural":"hemiopiile","dative-genitive-indefinite-singular":"hemiopii","dative-definite-genitive-singular":"hemiopiei","dative-genitive-indefinite-plural":"hemiopii","dative-definite-genitive-plural":"hemiopiilor","singular-vocative":"hemiopie","plural-vocative":"hemiopiilor"}},{"word":"hemiparestezie","pos":"noun","definitions":["hemiparesthesia"],"forms":{"plural":"hemiparestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemiparestezie","accusative-definite-nominative-singular":"hemiparestezia","accusative-indefinite-nominative-plural":"hemiparestezii","accusative-definite-nominative-plural":"hemiparesteziile","dative-genitive-indefinite-singular":"hemiparestezii","dative-definite-genitive-singular":"hemiparesteziei","dative-genitive-indefinite-plural":"hemiparestezii","dative-definite-genitive-plural":"hemiparesteziilor","singular-vocative":"hemiparestezie","plural-vocative":"hemiparesteziilor"}},{"word":"hemipareză","pos":"noun","definitions":["hemiparesis"],"forms":{"plural":"hemipareze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemipareză","accusative-definite-nominative-singular":"hemipareza","accusative-indefinite-nominative-plural":"hemipareze","accusative-definite-nominative-plural":"hemiparezele","dative-genitive-indefinite-singular":"hemipareze","dative-definite-genitive-singular":"hemiparezei","dative-genitive-indefinite-plural":"hemipareze","dative-definite-genitive-plural":"hemiparezelor","singular-vocative":"hemipareză","plural-vocative":"hemiparezelor"}},{"word":"hemiplegic","pos":"noun","definitions":["hemiplegic"],"forms":{"plural":"hemiplegici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemiplegic","accusative-definite-nominative-singular":"hemiplegicul","accusative-indefinite-nominative-plural":"hemiplegici","accusative-definite-nominative-plural":"hemiplegicii","dative-genitive-indefinite-singular":"hemiplegic","dative-definite-genitive-singular":"hemiplegicului","dative-genitive-indefinite-plural":"hemiplegici","dative-definite-genitive-plural":"hemiplegicilor","singular-vocative":"hemiplegicule","plural-vocative":"hemiplegicilor"}},{"word":"hemiplegică","pos":"noun","definitions":["female equivalent of hemiplegic"],"forms":{"plural":"hemiplegice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemiplegică","accusative-definite-nominative-singular":"hemiplegica","accusative-indefinite-nominative-plural":"hemiplegice","accusative-definite-nominative-plural":"hemiplegicele","dative-genitive-indefinite-singular":"hemiplegice","dative-definite-genitive-singular":"hemiplegicei","dative-genitive-indefinite-plural":"hemiplegice","dative-definite-genitive-plural":"hemiplegicelor","singular-vocative":"hemiplegică","plural-vocative":"hemiplegicelor"}},{"word":"hemiplegie","pos":"noun","definitions":["hemiplegia"],"forms":{"plural":"hemiplegii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemiplegie","accusative-definite-nominative-singular":"hemiplegia","accusative-indefinite-nominative-plural":"hemiplegii","accusative-definite-nominative-plural":"hemiplegiile","dative-genitive-indefinite-singular":"hemiplegii","dative-definite-genitive-singular":"hemiplegiei","dative-genitive-indefinite-plural":"hemiplegii","dative-definite-genitive-plural":"hemiplegiilor","singular-vocative":"hemiplegie","plural-vocative":"hemiplegiilor"}},{"word":"hemiplexie","pos":"noun","definitions":["hemiplegia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hemiplexie","accusative-definite-nominative":"hemiplexia","dative-genitive-indefinite":"hemiplexii","dative-definite-genitive":"hemiplexiei","vocative":"hemiplexie"}},{"word":"hemipter","pos":"noun","definitions":["insect from the Hemiptera order"],"forms":{"plural":"hemiptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemipter","accusative-definite-nominative-singular":"hemipterul","accusative-indefinite-nominative-plural":"hemiptere","accusative-definite-nominative-plural":"hemipterele","dative-genitive-indefinite-singular":"hemipter","dative-definite-genitive-singular":"hemipterului","dative-genitive-indefinite-plural":"hemiptere","dative-definite-genitive-plural":"hemipterelor","singular-vocative":"hemipterule","plural-vocative":"hemipterelor"}},{"word":"hemisferă","pos":"noun","definitions":["obsolete form of emisferă"],"forms":{"plural":"hemisfere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemisferă","accusative-definite-nominative-singular":"hemisfera","accusative-indefinite-nominative-plural":"hemisfere","accusative-definite-nominative-plural":"hemisferele","dative-genitive-indefinite-singular":"hemisfere","dative-definite-genitive-singular":"hemisferei","dative-genitive-indefinite-plural":"hemisfere","dative-definite-genitive-plural":"hemisferelor","singular-vocative":"hemisferă","plural-vocative":"hemisferelor"}},{"word":"hemispasm","pos":"noun","definitions":["hemispasm"],"forms":{"plural":"hemispasme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemispasm","accusative-definite-nominative-singular":"hemispasmul","accusative-indefinite-nominative-plural":"hemispasme","accusative-definite-nominative-plural":"hemispasmele","dative-genitive-indefinite-singular":"hemispasm","dative-definite-genitive-singular":"hemispasmului","dative-genitive-indefinite-plural":"hemispasme","dative-definite-genitive-plural":"hemispasmelor","singular-vocative":"hemispasmule","plural-vocative":"hemispasmelor"}},{"word":"hemistih","pos":"noun","definitions":["alternative form of emistih"],"forms":{"plural":"hemistihuri"}},{"word":"hemocianină","pos":"noun","definitions":["hemocyanin"],"forms":{"plural":"hemocianine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemocianină","accusative-definite-nominative-singular":"hemocianina","accusative-indefinite-nominative-plural":"hemocianine","accusative-definite-nominative-plural":"hemocianinele","dative-genitive-indefinite-singular":"hemocianine","dative-definite-genitive-singular":"hemocianinei","dative-genitive-indefinite-plural":"hemocianine","dative-definite-genitive-plural":"hemocianinelor","singular-vocative":"hemocianină","plural-vocative":"hemocianinelor"}},{"word":"hemocit","pos":"noun","definitions":["hemocyte"],"forms":{"plural":"hemocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemocit","accusative-definite-nominative-singular":"hemocitul","accusative-indefinite-nominative-plural":"hemocite","accusative-definite-nominative-plural":"hemocitele","dative-genitive-indefinite-singular":"hemocit","dative-definite-genitive-singular":"hemocitului","dative-genitive-indefinite-plural":"hemocite","dative-definite-genitive-plural":"hemocitelor","singular-vocative":"hemocitule","plural-vocative":"hemocitelor"}},{"word":"hemocitometru","pos":"noun","definitions":["hemocytometer"],"forms":{"plural":"hemocitometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemocitometru","accusative-definite-nominative-singular":"hemocitometrul","accusative-indefinite-nominative-plural":"hemocitometre","accusative-definite-nominative-plural":"hemocitometrele","dative-genitive-indefinite-singular":"hemocitometru","dative-definite-genitive-singular":"hemocitometrului","dative-genitive-indefinite-plural":"hemocitometre","dative-definite-genitive-plural":"hemocitometrelor","singular-vocative":"hemocitometrule","plural-vocative":"hemocitometrelor"}},{"word":"hemocultură","pos":"noun","definitions":["blood culture"],"forms":{"plural":"hemoculturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemocultură","accusative-definite-nominative-singular":"hemocultura","accusative-indefinite-nominative-plural":"hemoculture","accusative-definite-nominative-plural":"hemoculturele","dative-genitive-indefinite-singular":"hemoculture","dative-definite-genitive-singular":"hemoculturei","dative-genitive-indefinite-plural":"hemoculture","dative-definite-genitive-plural":"hemoculturelor","singular-vocative":"hemocultură","plural-vocative":"hemoculturelor"}},{"word":"hemodializă","pos":"noun","definitions":["hemodialysis"],"forms":{"plural":"hemodialize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemodializă","accusative-definite-nominative-singular":"hemodializa","accusative-indefinite-nominative-plural":"hemodialize","accusative-definite-nominative-plural":"hemodializele","dative-genitive-indefinite-singular":"hemodialize","dative-definite-genitive-singular":"hemodializei","dative-genitive-indefinite-plural":"hemodialize","dative-definite-genitive-plural":"hemodializelor","singular-vocative":"hemodializă","plural-vocative":"hemodializelor"}},{"word":"hemodializor","pos":"noun","definitions":["haemodialyser"],"forms":{"plural":"hemodializori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemodializor","accusative-definite-nominative-singular":"hemodializorul","accusative-indefinite-nominative-plural":"hemodializori","accusative-definite-nominative-plural":"hemodializorii","dative-genitive-indefinite-singular":"hemodializor","dative-definite-genitive-singular":"hemodializorului","dative-genitive-indefinite-plural":"hemodializori","dative-definite-genitive-plural":"hemodializorilor","singular-vocative":"hemodializorule","plural-vocative":"hemodializorilor"}},{"word":"hemodinamică","pos":"noun","definitions":["hemodynamics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemodinamică","accusative-definite-nominative-singular":"hemodinamica","accusative-indefinite-nominative-plural":"hemodinamice","accusative-definite-nominative-plural":"hemodinamicele","dative-genitive-indefinite-singular":"hemodinamice","dative-definite-genitive-singular":"hemodinamicei","dative-genitive-indefinite-plural":"hemodinamice","dative-definite-genitive-plural":"hemodinamicelor","singular-vocative":"hemodinamică","plural-vocative":"hemodinamicelor"}},{"word":"hemodinamometru","pos":"noun","definitions":["hemadynamometer"],"forms":{"plural":"hemodinamometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemodinamometru","accusative-definite-nominative-singular":"hemodinamometrul","accusative-indefinite-nominative-plural":"hemodinamometre","accusative-definite-nominative-plural":"hemodinamometrele","dative-genitive-indefinite-singular":"hemodinamometru","dative-definite-genitive-singular":"hemodinamometrului","dative-genitive-indefinite-plural":"hemodinamometre","dative-definite-genitive-plural":"hemodinamometrelor","singular-vocative":"hemodinamometrule","plural-vocative":"hemodinamometrelor"}},{"word":"hemofag","pos":"adj","definitions":["hemophagous"],"forms":{"feminine-singular":"hemofagă","masculine-plural":"hemofagi","feminine-neuter-plural":"hemofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemofag","error-unrecognized-form-feminine-indefinite-singular":"hemofagă","error-unrecognized-form-indefinite-masculine-plural":"hemofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemofage","definite-error-unrecognized-form-masculine-neuter-singular":"hemofagul","definite-error-unrecognized-form-feminine-singular":"hemofaga","definite-error-unrecognized-form-masculine-plural":"hemofagii","definite-error-unrecognized-form-feminine-neuter-plural":"hemofagele"}},{"word":"hemofilic","pos":"adj","definitions":["hemophilic"],"forms":{"feminine-singular":"hemofilică","masculine-plural":"hemofilici","feminine-neuter-plural":"hemofilice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemofilic","error-unrecognized-form-feminine-indefinite-singular":"hemofilică","error-unrecognized-form-indefinite-masculine-plural":"hemofilici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemofilice","definite-error-unrecognized-form-masculine-neuter-singular":"hemofilicul","definite-error-unrecognized-form-feminine-singular":"hemofilica","definite-error-unrecognized-form-masculine-plural":"hemofilicii","definite-error-unrecognized-form-feminine-neuter-plural":"hemofilicele"}},{"word":"hemofilic","pos":"noun","definitions":["hemophilic"],"forms":{"plural":"hemofilici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemofilic","accusative-definite-nominative-singular":"hemofilicul","accusative-indefinite-nominative-plural":"hemofilici","accusative-definite-nominative-plural":"hemofilicii","dative-genitive-indefinite-singular":"hemofilic","dative-definite-genitive-singular":"hemofilicului","dative-genitive-indefinite-plural":"hemofilici","dative-definite-genitive-plural":"hemofilicilor","singular-vocative":"hemofilicule","plural-vocative":"hemofilicilor"}},{"word":"hemofilie","pos":"noun","definitions":["hemophilia"],"forms":{"plural":"hemofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemofilie","accusative-definite-nominative-singular":"hemofilia","accusative-indefinite-nominative-plural":"hemofilii","accusative-definite-nominative-plural":"hemofiliile","dative-genitive-indefinite-singular":"hemofilii","dative-definite-genitive-singular":"hemofiliei","dative-genitive-indefinite-plural":"hemofilii","dative-definite-genitive-plural":"hemofiliilor","singular-vocative":"hemofilie","plural-vocative":"hemofiliilor"}},{"word":"hemoftalmie","pos":"noun","definitions":["hemophthalmia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hemoftalmie","accusative-definite-nominative":"hemoftalmia","dative-genitive-indefinite":"hemoftalmii","dative-definite-genitive":"hemoftalmiei","vocative":"hemoftalmie"}},{"word":"hemogenic","pos":"noun","definitions":["hemogenic"],"forms":{"plural":"hemogenici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemogenic","accusative-definite-nominative-singular":"hemogenicul","accusative-indefinite-nominative-plural":"hemogenici","accusative-definite-nominative-plural":"hemogenicii","dative-genitive-indefinite-singular":"hemogenic","dative-definite-genitive-singular":"hemogenicului","dative-genitive-indefinite-plural":"hemogenici","dative-definite-genitive-plural":"hemogenicilor","singular-vocative":"hemogenicule","plural-vocative":"hemogenicilor"}},{"word":"hemogenică","pos":"noun","definitions":["female equivalent of hemogenic"],"forms":{"plural":"hemogenice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemogenică","accusative-definite-nominative-singular":"hemogenica","accusative-indefinite-nominative-plural":"hemogenice","accusative-definite-nominative-plural":"hemogenicele","dative-genitive-indefinite-singular":"hemogenice","dative-definite-genitive-singular":"hemogenicei","dative-genitive-indefinite-plural":"hemogenice","dative-definite-genitive-plural":"hemogenicelor","singular-vocative":"hemogenică","plural-vocative":"hemogenicelor"}},{"word":"hemogenie","pos":"noun","definitions":["haemogenesis"],"forms":{"plural":"hemogenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemogenie","accusative-definite-nominative-singular":"hemogenia","accusative-indefinite-nominative-plural":"hemogenii","accusative-definite-nominative-plural":"hemogeniile","dative-genitive-indefinite-singular":"hemogenii","dative-definite-genitive-singular":"hemogeniei","dative-genitive-indefinite-plural":"hemogenii","dative-definite-genitive-plural":"hemogeniilor","singular-vocative":"hemogenie","plural-vocative":"hemogeniilor"}},{"word":"hemoglobină","pos":"noun","definitions":["hemoglobin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemoglobină","accusative-definite-nominative-singular":"hemoglobina","accusative-indefinite-nominative-plural":"hemoglobine","accusative-definite-nominative-plural":"hemoglobinele","dative-genitive-indefinite-singular":"hemoglobine","dative-definite-genitive-singular":"hemoglobinei","dative-genitive-indefinite-plural":"hemoglobine","dative-definite-genitive-plural":"hemoglobinelor","singular-vocative":"hemoglobină","plural-vocative":"hemoglobinelor"}},{"word":"hemoglobinemie","pos":"noun","definitions":["hemoglobinemia"],"forms":{"plural":"hemoglobinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoglobinemie","accusative-definite-nominative-singular":"hemoglobinemia","accusative-indefinite-nominative-plural":"hemoglobinemii","accusative-definite-nominative-plural":"hemoglobinemiile","dative-genitive-indefinite-singular":"hemoglobinemii","dative-definite-genitive-singular":"hemoglobinemiei","dative-genitive-indefinite-plural":"hemoglobinemii","dative-definite-genitive-plural":"hemoglobinemiilor","singular-vocative":"hemoglobinemie","plural-vocative":"hemoglobinemiilor"}},{"word":"hemoglobinometrie","pos":"noun","definitions":["hemoglobinometry"],"forms":{"plural":"hemoglobinometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoglobinometrie","accusative-definite-nominative-singular":"hemoglobinometria","accusative-indefinite-nominative-plural":"hemoglobinometrii","accusative-definite-nominative-plural":"hemoglobinometriile","dative-genitive-indefinite-singular":"hemoglobinometrii","dative-definite-genitive-singular":"hemoglobinometriei","dative-genitive-indefinite-plural":"hemoglobinometrii","dative-definite-genitive-plural":"hemoglobinometriilor","singular-vocative":"hemoglobinometrie","plural-vocative":"hemoglobinometriilor"}},{"word":"hemoglobinometru","pos":"noun","definitions":["hemoglobinometer"],"forms":{"plural":"hemoglobinometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemoglobinometru","accusative-definite-nominative-singular":"hemoglobinometrul","accusative-indefinite-nominative-plural":"hemoglobinometre","accusative-definite-nominative-plural":"hemoglobinometrele","dative-genitive-indefinite-singular":"hemoglobinometru","dative-definite-genitive-singular":"hemoglobinometrului","dative-genitive-indefinite-plural":"hemoglobinometre","dative-definite-genitive-plural":"hemoglobinometrelor","singular-vocative":"hemoglobinometrule","plural-vocative":"hemoglobinometrelor"}},{"word":"hemoglobinopatie","pos":"noun","definitions":["hemoglobinopathy"],"forms":{"plural":"hemoglobinopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoglobinopatie","accusative-definite-nominative-singular":"hemoglobinopatia","accusative-indefinite-nominative-plural":"hemoglobinopatii","accusative-definite-nominative-plural":"hemoglobinopatiile","dative-genitive-indefinite-singular":"hemoglobinopatii","dative-definite-genitive-singular":"hemoglobinopatiei","dative-genitive-indefinite-plural":"hemoglobinopatii","dative-definite-genitive-plural":"hemoglobinopatiilor","singular-vocative":"hemoglobinopatie","plural-vocative":"hemoglobinopatiilor"}},{"word":"hemoglobinurie","pos":"noun","definitions":["hemoglobinuria"],"forms":{"plural":"hemoglobinurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoglobinurie","accusative-definite-nominative-singular":"hemoglobinuria","accusative-indefinite-nominative-plural":"hemoglobinurii","accusative-definite-nominative-plural":"hemoglobinuriile","dative-genitive-indefinite-singular":"hemoglobinurii","dative-definite-genitive-singular":"hemoglobinuriei","dative-genitive-indefinite-plural":"hemoglobinurii","dative-definite-genitive-plural":"hemoglobinuriilor","singular-vocative":"hemoglobinurie","plural-vocative":"hemoglobinuriilor"}},{"word":"hemogramă","pos":"noun","definitions":["blood count"],"forms":{"plural":"hemograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemogramă","accusative-definite-nominative-singular":"hemograma","accusative-indefinite-nominative-plural":"hemograme","accusative-definite-nominative-plural":"hemogramele","dative-genitive-indefinite-singular":"hemograme","dative-definite-genitive-singular":"hemogramei","dative-genitive-indefinite-plural":"hemograme","dative-definite-genitive-plural":"hemogramelor","singular-vocative":"hemogramă","plural-vocative":"hemogramelor"}},{"word":"hemoleucogramă","pos":"noun","definitions":["complete blood count"],"forms":{"plural":"hemoleucograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemoleucogramă","accusative-definite-nominative-singular":"hemoleucograma","accusative-indefinite-nominative-plural":"hemoleucograme","accusative-definite-nominative-plural":"hemoleucogramele","dative-genitive-indefinite-singular":"hemoleucograme","dative-definite-genitive-singular":"hemoleucogramei","dative-genitive-indefinite-plural":"hemoleucograme","dative-definite-genitive-plural":"hemoleucogramelor","singular-vocative":"hemoleucogramă","plural-vocative":"hemoleucogramelor"}},{"word":"hemolimfă","pos":"noun","definitions":["hemolymph"],"forms":{"plural":"hemolimfe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemolimfă","accusative-definite-nominative-singular":"hemolimfa","accusative-indefinite-nominative-plural":"hemolimfe","accusative-definite-nominative-plural":"hemolimfele","dative-genitive-indefinite-singular":"hemolimfe","dative-definite-genitive-singular":"hemolimfei","dative-genitive-indefinite-plural":"hemolimfe","dative-definite-genitive-plural":"hemolimfelor","singular-vocative":"hemolimfă","plural-vocative":"hemolimfelor"}},{"word":"hemolitic","pos":"adj","definitions":["hemolytic"],"forms":{"feminine-singular":"hemolitică","masculine-plural":"hemolitici","feminine-neuter-plural":"hemolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemolitic","error-unrecognized-form-feminine-indefinite-singular":"hemolitică","error-unrecognized-form-indefinite-masculine-plural":"hemolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemolitice","definite-error-unrecognized-form-masculine-neuter-singular":"hemoliticul","definite-error-unrecognized-form-feminine-singular":"hemolitica","definite-error-unrecognized-form-masculine-plural":"hemoliticii","definite-error-unrecognized-form-feminine-neuter-plural":"hemoliticele"}},{"word":"hemoliză","pos":"noun","definitions":["hemolysis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemoliză","accusative-definite-nominative-singular":"hemoliza","accusative-indefinite-nominative-plural":"hemolize","accusative-definite-nominative-plural":"hemolizele","dative-genitive-indefinite-singular":"hemolize","dative-definite-genitive-singular":"hemolizei","dative-genitive-indefinite-plural":"hemolize","dative-definite-genitive-plural":"hemolizelor","singular-vocative":"hemoliză","plural-vocative":"hemolizelor"}},{"word":"hemolizină","pos":"noun","definitions":["hemolysin"],"forms":{"plural":"hemolizine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemolizină","accusative-definite-nominative-singular":"hemolizina","accusative-indefinite-nominative-plural":"hemolizine","accusative-definite-nominative-plural":"hemolizinele","dative-genitive-indefinite-singular":"hemolizine","dative-definite-genitive-singular":"hemolizinei","dative-genitive-indefinite-plural":"hemolizine","dative-definite-genitive-plural":"hemolizinelor","singular-vocative":"hemolizină","plural-vocative":"hemolizinelor"}},{"word":"hemometru","pos":"noun","definitions":["haemometer"],"forms":{"plural":"hemometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hemometru","accusative-definite-nominative-singular":"hemometrul","accusative-indefinite-nominative-plural":"hemometre","accusative-definite-nominative-plural":"hemometrele","dative-genitive-indefinite-singular":"hemometru","dative-definite-genitive-singular":"hemometrului","dative-genitive-indefinite-plural":"hemometre","dative-definite-genitive-plural":"hemometrelor","singular-vocative":"hemometrule","plural-vocative":"hemometrelor"}},{"word":"hemopatic","pos":"adj","definitions":["hemopathic"],"forms":{"feminine-singular":"hemopatică","masculine-plural":"hemopatici","feminine-neuter-plural":"hemopatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemopatic","error-unrecognized-form-feminine-indefinite-singular":"hemopatică","error-unrecognized-form-indefinite-masculine-plural":"hemopatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemopatice","definite-error-unrecognized-form-masculine-neuter-singular":"hemopaticul","definite-error-unrecognized-form-feminine-singular":"hemopatica","definite-error-unrecognized-form-masculine-plural":"hemopaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hemopaticele"}},{"word":"hemopatie","pos":"noun","definitions":["hemopathy"],"forms":{"plural":"hemopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemopatie","accusative-definite-nominative-singular":"hemopatia","accusative-indefinite-nominative-plural":"hemopatii","accusative-definite-nominative-plural":"hemopatiile","dative-genitive-indefinite-singular":"hemopatii","dative-definite-genitive-singular":"hemopatiei","dative-genitive-indefinite-plural":"hemopatii","dative-definite-genitive-plural":"hemopatiilor","singular-vocative":"hemopatie","plural-vocative":"hemopatiilor"}},{"word":"hemopoieză","pos":"noun","definitions":["hemopoiesis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemopoieză","accusative-definite-nominative-singular":"hemopoieza","accusative-indefinite-nominative-plural":"hemopoieze","accusative-definite-nominative-plural":"hemopoiezele","dative-genitive-indefinite-singular":"hemopoieze","dative-definite-genitive-singular":"hemopoiezei","dative-genitive-indefinite-plural":"hemopoieze","dative-definite-genitive-plural":"hemopoiezelor","singular-vocative":"hemopoieză","plural-vocative":"hemopoiezelor"}},{"word":"hemoptizică","pos":"noun","definitions":["female equivalent of hemoptizic"],"forms":{"plural":"hemoptizice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemoptizică","accusative-definite-nominative-singular":"hemoptizica","accusative-indefinite-nominative-plural":"hemoptizice","accusative-definite-nominative-plural":"hemoptizicele","dative-genitive-indefinite-singular":"hemoptizice","dative-definite-genitive-singular":"hemoptizicei","dative-genitive-indefinite-plural":"hemoptizice","dative-definite-genitive-plural":"hemoptizicelor","singular-vocative":"hemoptizică","plural-vocative":"hemoptizicelor"}},{"word":"hemoptizie","pos":"noun","definitions":["hemoptysis"],"forms":{"plural":"hemoptizii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoptizie","accusative-definite-nominative-singular":"hemoptizia","accusative-indefinite-nominative-plural":"hemoptizii","accusative-definite-nominative-plural":"hemoptiziile","dative-genitive-indefinite-singular":"hemoptizii","dative-definite-genitive-singular":"hemoptiziei","dative-genitive-indefinite-plural":"hemoptizii","dative-definite-genitive-plural":"hemoptiziilor","singular-vocative":"hemoptizie","plural-vocative":"hemoptiziilor"}},{"word":"hemoragic","pos":"adj","definitions":["hemorrhagic"],"forms":{"feminine-singular":"hemoragică","masculine-plural":"hemoragici","feminine-neuter-plural":"hemoragice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemoragic","error-unrecognized-form-feminine-indefinite-singular":"hemoragică","error-unrecognized-form-indefinite-masculine-plural":"hemoragici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemoragice","definite-error-unrecognized-form-masculine-neuter-singular":"hemoragicul","definite-error-unrecognized-form-feminine-singular":"hemoragica","definite-error-unrecognized-form-masculine-plural":"hemoragicii","definite-error-unrecognized-form-feminine-neuter-plural":"hemoragicele"}},{"word":"hemoragie","pos":"noun","definitions":["hemorrhage, bleeding"],"forms":{"plural":"hemoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoragie","accusative-definite-nominative-singular":"hemoragia","accusative-indefinite-nominative-plural":"hemoragii","accusative-definite-nominative-plural":"hemoragiile","dative-genitive-indefinite-singular":"hemoragii","dative-definite-genitive-singular":"hemoragiei","dative-genitive-indefinite-plural":"hemoragii","dative-definite-genitive-plural":"hemoragiilor","singular-vocative":"hemoragie","plural-vocative":"hemoragiilor"}},{"word":"hemoragie nazală","pos":"noun","definitions":["nosebleed"],"forms":{"plural":"hemoragii nazale"}},{"word":"hemoree","pos":"noun","definitions":["hemorrhage"],"forms":{"plural":"hemoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hemoree","accusative-definite-nominative-singular":"hemoreea","accusative-indefinite-nominative-plural":"hemoree","accusative-definite-nominative-plural":"hemoreele","dative-genitive-indefinite-singular":"hemoree","dative-definite-genitive-singular":"hemoreei","dative-genitive-indefinite-plural":"hemoree","dative-definite-genitive-plural":"hemoreelor","singular-vocative":"hemoree","plural-vocative":"hemoreelor"}},{"word":"hemoroid","pos":"noun","definitions":["hemorrhoid"],"pronunciation":"[ˈhe.mo.rojd]","forms":{"plural":"hemoroizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hemoroid","accusative-definite-nominative-singular":"hemoroidul","accusative-indefinite-nominative-plural":"hemoroizi","accusative-definite-nominative-plural":"hemoroizii","dative-genitive-indefinite-singular":"hemoroid","dative-definite-genitive-singular":"hemoroidului","dative-genitive-indefinite-plural":"hemoroizi","dative-definite-genitive-plural":"hemoroizilor","singular-vocative":"hemoroidule","plural-vocative":"hemoroizilor"}},{"word":"hemoroidal","pos":"adj","definitions":["haemorrhoidal"],"forms":{"feminine-singular":"hemoroidală","masculine-plural":"hemoroidali","feminine-neuter-plural":"hemoroidale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemoroidal","error-unrecognized-form-feminine-indefinite-singular":"hemoroidală","error-unrecognized-form-indefinite-masculine-plural":"hemoroidali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemoroidale","definite-error-unrecognized-form-masculine-neuter-singular":"hemoroidalul","definite-error-unrecognized-form-feminine-singular":"hemoroidala","definite-error-unrecognized-form-masculine-plural":"hemoroidalii","definite-error-unrecognized-form-feminine-neuter-plural":"hemoroidalele"}},{"word":"hemoroidar","pos":"adj","definitions":["hemorrhoidal"],"forms":{"feminine-singular":"hemoroidară","masculine-plural":"hemoroidari","feminine-neuter-plural":"hemoroidare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemoroidar","error-unrecognized-form-feminine-indefinite-singular":"hemoroidară","error-unrecognized-form-indefinite-masculine-plural":"hemoroidari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemoroidare","definite-error-unrecognized-form-masculine-neuter-singular":"hemoroidarul","definite-error-unrecognized-form-feminine-singular":"hemoroidara","definite-error-unrecognized-form-masculine-plural":"hemoroidarii","definite-error-unrecognized-form-feminine-neuter-plural":"hemoroidarele"}},{"word":"hemoroidectomie","pos":"noun","definitions":["hemorrhoidectomy"],"forms":{"plural":"hemoroidectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoroidectomie","accusative-definite-nominative-singular":"hemoroidectomia","accusative-indefinite-nominative-plural":"hemoroidectomii","accusative-definite-nominative-plural":"hemoroidectomiile","dative-genitive-indefinite-singular":"hemoroidectomii","dative-definite-genitive-singular":"hemoroidectomiei","dative-genitive-indefinite-plural":"hemoroidectomii","dative-definite-genitive-plural":"hemoroidectomiilor","singular-vocative":"hemoroidectomie","plural-vocative":"hemoroidectomiilor"}},{"word":"hemoroizi","pos":"noun","definitions":["plural of hemoroid"],"gender":"m-p"},{"word":"hemosiderină","pos":"noun","definitions":["hemosiderin"],"forms":{"plural":"hemosiderine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemosiderină","accusative-definite-nominative-singular":"hemosiderina","accusative-indefinite-nominative-plural":"hemosiderine","accusative-definite-nominative-plural":"hemosiderinele","dative-genitive-indefinite-singular":"hemosiderine","dative-definite-genitive-singular":"hemosiderinei","dative-genitive-indefinite-plural":"hemosiderine","dative-definite-genitive-plural":"hemosiderinelor","singular-vocative":"hemosiderină","plural-vocative":"hemosiderinelor"}},{"word":"hemosideroză","pos":"noun","definitions":["hemosiderosis"],"forms":{"plural":"hemosideroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemosideroză","accusative-definite-nominative-singular":"hemosideroza","accusative-indefinite-nominative-plural":"hemosideroze","accusative-definite-nominative-plural":"hemosiderozele","dative-genitive-indefinite-singular":"hemosideroze","dative-definite-genitive-singular":"hemosiderozei","dative-genitive-indefinite-plural":"hemosideroze","dative-definite-genitive-plural":"hemosiderozelor","singular-vocative":"hemosideroză","plural-vocative":"hemosiderozelor"}},{"word":"hemospermie","pos":"noun","definitions":["hemospermia"],"forms":{"plural":"hemospermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemospermie","accusative-definite-nominative-singular":"hemospermia","accusative-indefinite-nominative-plural":"hemospermii","accusative-definite-nominative-plural":"hemospermiile","dative-genitive-indefinite-singular":"hemospermii","dative-definite-genitive-singular":"hemospermiei","dative-genitive-indefinite-plural":"hemospermii","dative-definite-genitive-plural":"hemospermiilor","singular-vocative":"hemospermie","plural-vocative":"hemospermiilor"}},{"word":"hemostatic","pos":"adj","definitions":["haemostatic"],"forms":{"feminine-singular":"hemostatică","masculine-plural":"hemostatici","feminine-neuter-plural":"hemostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemostatic","error-unrecognized-form-feminine-indefinite-singular":"hemostatică","error-unrecognized-form-indefinite-masculine-plural":"hemostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemostatice","definite-error-unrecognized-form-masculine-neuter-singular":"hemostaticul","definite-error-unrecognized-form-feminine-singular":"hemostatica","definite-error-unrecognized-form-masculine-plural":"hemostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hemostaticele"}},{"word":"hemostază","pos":"noun","definitions":["hemostasis"],"forms":{"plural":"hemostaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemostază","accusative-definite-nominative-singular":"hemostaza","accusative-indefinite-nominative-plural":"hemostaze","accusative-definite-nominative-plural":"hemostazele","dative-genitive-indefinite-singular":"hemostaze","dative-definite-genitive-singular":"hemostazei","dative-genitive-indefinite-plural":"hemostaze","dative-definite-genitive-plural":"hemostazelor","singular-vocative":"hemostază","plural-vocative":"hemostazelor"}},{"word":"hemoterapie","pos":"noun","definitions":["hemotherapy"],"forms":{"plural":"hemoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemoterapie","accusative-definite-nominative-singular":"hemoterapia","accusative-indefinite-nominative-plural":"hemoterapii","accusative-definite-nominative-plural":"hemoterapiile","dative-genitive-indefinite-singular":"hemoterapii","dative-definite-genitive-singular":"hemoterapiei","dative-genitive-indefinite-plural":"hemoterapii","dative-definite-genitive-plural":"hemoterapiilor","singular-vocative":"hemoterapie","plural-vocative":"hemoterapiilor"}},{"word":"hemotorax","pos":"noun","definitions":["hemothorax"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hemotorax","accusative-definite-nominative":"hemotoraxul","dative-genitive-indefinite":"hemotorax","dative-definite-genitive":"hemotoraxului","vocative":"hemotoraxule"}},{"word":"hemotoxie","pos":"noun","definitions":["hemotoxia"],"forms":{"plural":"hemotoxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hemotoxie","accusative-definite-nominative-singular":"hemotoxia","accusative-indefinite-nominative-plural":"hemotoxii","accusative-definite-nominative-plural":"hemotoxiile","dative-genitive-indefinite-singular":"hemotoxii","dative-definite-genitive-singular":"hemotoxiei","dative-genitive-indefinite-plural":"hemotoxii","dative-definite-genitive-plural":"hemotoxiilor","singular-vocative":"hemotoxie","plural-vocative":"hemotoxiilor"}},{"word":"hemotoxină","pos":"noun","definitions":["hemotoxin"],"forms":{"plural":"hemotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hemotoxină","accusative-definite-nominative-singular":"hemotoxina","accusative-indefinite-nominative-plural":"hemotoxine","accusative-definite-nominative-plural":"hemotoxinele","dative-genitive-indefinite-singular":"hemotoxine","dative-definite-genitive-singular":"hemotoxinei","dative-genitive-indefinite-plural":"hemotoxine","dative-definite-genitive-plural":"hemotoxinelor","singular-vocative":"hemotoxină","plural-vocative":"hemotoxinelor"}},{"word":"hemotrop","pos":"adj","definitions":["hemotropic"],"forms":{"feminine-singular":"hemotropă","masculine-plural":"hemotropi","feminine-neuter-plural":"hemotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hemotrop","error-unrecognized-form-feminine-indefinite-singular":"hemotropă","error-unrecognized-form-indefinite-masculine-plural":"hemotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hemotrope","definite-error-unrecognized-form-masculine-neuter-singular":"hemotropul","definite-error-unrecognized-form-feminine-singular":"hemotropa","definite-error-unrecognized-form-masculine-plural":"hemotropii","definite-error-unrecognized-form-feminine-neuter-plural":"hemotropele"}},{"word":"hemul","pos":"noun","definitions":["definite nominative/accusative singular of hem"]},{"word":"hemule","pos":"noun","definitions":["vocative singular of hem"],"gender":"n"},{"word":"hemului","pos":"noun","definitions":["definite genitive/dative singular of hem"]},{"word":"hemuri","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of hem"]},{"word":"hemurile","pos":"noun","definitions":["definite nominative/accusative plural of hem"]},{"word":"hemurilor","pos":"noun","definitions":["inflection of hem:","definite genitive/dative plural","vocative plural"]},{"word":"hendiadă","pos":"noun","definitions":["hendiadys"],"forms":{"plural":"hendiade","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hendiadă","accusative-definite-nominative-singular":"hendiada","accusative-indefinite-nominative-plural":"hendiade","accusative-definite-nominative-plural":"hendiadele","dative-genitive-indefinite-singular":"hendiade","dative-definite-genitive-singular":"hendiadei","dative-genitive-indefinite-plural":"hendiade","dative-definite-genitive-plural":"hendiadelor","singular-vocative":"hendiadă","plural-vocative":"hendiadelor"}},{"word":"hengher","pos":"noun","definitions":["alternative form of hingher"],"forms":{"plural":"hengheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hengher","accusative-definite-nominative-singular":"hengherul","accusative-indefinite-nominative-plural":"hengheri","accusative-definite-nominative-plural":"hengherii","dative-genitive-indefinite-singular":"hengher","dative-definite-genitive-singular":"hengherului","dative-genitive-indefinite-plural":"hengheri","dative-definite-genitive-plural":"hengherilor","singular-vocative":"hengherule","plural-vocative":"hengherilor"}},{"word":"Henig","pos":"name","definitions":["a village in Berghin, Alba County, Romania"],"gender":"m"},{"word":"henoteism","pos":"noun","definitions":["henotheism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"henoteism","accusative-definite-nominative":"henoteismul","dative-genitive-indefinite":"henoteism","dative-definite-genitive":"henoteismului","vocative":"henoteismule"}},{"word":"henri","pos":"noun","definitions":["henry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"henri","accusative-definite-nominative":"henriul","dative-genitive-indefinite":"henri","dative-definite-genitive":"henriului","vocative":"henriule"}},{"word":"henry","pos":"noun","definitions":["henry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"henry","accusative-definite-nominative":"henryul","dative-genitive-indefinite":"henry","dative-definite-genitive":"henryului","vocative":"henryule"}},{"word":"henț","pos":"noun","definitions":["handball"],"forms":{"plural":"hențuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"henț","accusative-definite-nominative-singular":"hențul","accusative-indefinite-nominative-plural":"hențuri","accusative-definite-nominative-plural":"hențurile","dative-genitive-indefinite-singular":"henț","dative-definite-genitive-singular":"hențului","dative-genitive-indefinite-plural":"hențuri","dative-definite-genitive-plural":"hențurilor","singular-vocative":"hențule","plural-vocative":"hențurilor"}},{"word":"hentiparestezie","pos":"noun","definitions":["hemiparesthesia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hentiparestezie","accusative-definite-nominative":"hentiparestezia","dative-genitive-indefinite":"hentiparestezii","dative-definite-genitive":"hentiparesteziei","vocative":"hentiparestezie"}},{"word":"heortologie","pos":"noun","definitions":["heortology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heortologie","accusative-definite-nominative":"heortologia","dative-genitive-indefinite":"heortologii","dative-definite-genitive":"heortologiei","vocative":"heortologie"}},{"word":"heparină","pos":"noun","definitions":["heparin"],"forms":{"plural":"heparine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heparină","accusative-definite-nominative-singular":"heparina","accusative-indefinite-nominative-plural":"heparine","accusative-definite-nominative-plural":"heparinele","dative-genitive-indefinite-singular":"heparine","dative-definite-genitive-singular":"heparinei","dative-genitive-indefinite-plural":"heparine","dative-definite-genitive-plural":"heparinelor","singular-vocative":"heparină","plural-vocative":"heparinelor"}},{"word":"heparinemie","pos":"noun","definitions":["heparinemia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heparinemie","accusative-definite-nominative":"heparinemia","dative-genitive-indefinite":"heparinemii","dative-definite-genitive":"heparinemiei","vocative":"heparinemie"}},{"word":"hepatalgie","pos":"noun","definitions":["hepatalgia"],"forms":{"plural":"hepatalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatalgie","accusative-definite-nominative-singular":"hepatalgia","accusative-indefinite-nominative-plural":"hepatalgii","accusative-definite-nominative-plural":"hepatalgiile","dative-genitive-indefinite-singular":"hepatalgii","dative-definite-genitive-singular":"hepatalgiei","dative-genitive-indefinite-plural":"hepatalgii","dative-definite-genitive-plural":"hepatalgiilor","singular-vocative":"hepatalgie","plural-vocative":"hepatalgiilor"}},{"word":"hepatectomie","pos":"noun","definitions":["hepatectomy"],"forms":{"plural":"hepatectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatectomie","accusative-definite-nominative-singular":"hepatectomia","accusative-indefinite-nominative-plural":"hepatectomii","accusative-definite-nominative-plural":"hepatectomiile","dative-genitive-indefinite-singular":"hepatectomii","dative-definite-genitive-singular":"hepatectomiei","dative-genitive-indefinite-plural":"hepatectomii","dative-definite-genitive-plural":"hepatectomiilor","singular-vocative":"hepatectomie","plural-vocative":"hepatectomiilor"}},{"word":"hepatic","pos":"adj","definitions":["hepatic"],"forms":{"feminine-singular":"hepatică","masculine-plural":"hepatici","feminine-neuter-plural":"hepatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hepatic","error-unrecognized-form-feminine-indefinite-singular":"hepatică","error-unrecognized-form-indefinite-masculine-plural":"hepatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hepatice","definite-error-unrecognized-form-masculine-neuter-singular":"hepaticul","definite-error-unrecognized-form-feminine-singular":"hepatica","definite-error-unrecognized-form-masculine-plural":"hepaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hepaticele"}},{"word":"hepaticotomie","pos":"noun","definitions":["hepatotomy"],"forms":{"plural":"hepaticotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepaticotomie","accusative-definite-nominative-singular":"hepaticotomia","accusative-indefinite-nominative-plural":"hepaticotomii","accusative-definite-nominative-plural":"hepaticotomiile","dative-genitive-indefinite-singular":"hepaticotomii","dative-definite-genitive-singular":"hepaticotomiei","dative-genitive-indefinite-plural":"hepaticotomii","dative-definite-genitive-plural":"hepaticotomiilor","singular-vocative":"hepaticotomie","plural-vocative":"hepaticotomiilor"}},{"word":"hepatită","pos":"noun","definitions":["hepatitis"],"forms":{"plural":"hepatite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hepatită","accusative-definite-nominative-singular":"hepatita","accusative-indefinite-nominative-plural":"hepatite","accusative-definite-nominative-plural":"hepatitele","dative-genitive-indefinite-singular":"hepatite","dative-definite-genitive-singular":"hepatitei","dative-genitive-indefinite-plural":"hepatite","dative-definite-genitive-plural":"hepatitelor","singular-vocative":"hepatită","plural-vocative":"hepatitelor"}},{"word":"hepatită A","pos":"noun","definitions":["hepatitis A"]},{"word":"hepatizație","pos":"noun","definitions":["hepatization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hepatizație","accusative-definite-nominative":"hepatizația","dative-genitive-indefinite":"hepatizații","dative-definite-genitive":"hepatizației","vocative":"hepatizație"}},{"word":"hepatocel","pos":"noun","definitions":["hepatocele"],"forms":{"plural":"hepatocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hepatocel","accusative-definite-nominative-singular":"hepatocelul","accusative-indefinite-nominative-plural":"hepatocele","accusative-definite-nominative-plural":"hepatocelele","dative-genitive-indefinite-singular":"hepatocel","dative-definite-genitive-singular":"hepatocelului","dative-genitive-indefinite-plural":"hepatocele","dative-definite-genitive-plural":"hepatocelelor","singular-vocative":"hepatocelule","plural-vocative":"hepatocelelor"}},{"word":"hepatocit","pos":"noun","definitions":["hepatocyte (liver cells)"],"forms":{"plural":"hepatocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hepatocit","accusative-definite-nominative-singular":"hepatocitul","accusative-indefinite-nominative-plural":"hepatocite","accusative-definite-nominative-plural":"hepatocitele","dative-genitive-indefinite-singular":"hepatocit","dative-definite-genitive-singular":"hepatocitului","dative-genitive-indefinite-plural":"hepatocite","dative-definite-genitive-plural":"hepatocitelor","singular-vocative":"hepatocitule","plural-vocative":"hepatocitelor"}},{"word":"hepatogen","pos":"adj","definitions":["hepatogenic"],"forms":{"feminine-singular":"hepatogenă","masculine-plural":"hepatogeni","feminine-neuter-plural":"hepatogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hepatogen","error-unrecognized-form-feminine-indefinite-singular":"hepatogenă","error-unrecognized-form-indefinite-masculine-plural":"hepatogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hepatogene","definite-error-unrecognized-form-masculine-neuter-singular":"hepatogenul","definite-error-unrecognized-form-feminine-singular":"hepatogena","definite-error-unrecognized-form-masculine-plural":"hepatogenii","definite-error-unrecognized-form-feminine-neuter-plural":"hepatogenele"}},{"word":"hepatografie","pos":"noun","definitions":["hepatography"],"forms":{"plural":"hepatografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatografie","accusative-definite-nominative-singular":"hepatografia","accusative-indefinite-nominative-plural":"hepatografii","accusative-definite-nominative-plural":"hepatografiile","dative-genitive-indefinite-singular":"hepatografii","dative-definite-genitive-singular":"hepatografiei","dative-genitive-indefinite-plural":"hepatografii","dative-definite-genitive-plural":"hepatografiilor","singular-vocative":"hepatografie","plural-vocative":"hepatografiilor"}},{"word":"hepatolog","pos":"noun","definitions":["hepatologist"],"forms":{"plural":"hepatologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hepatolog","accusative-definite-nominative-singular":"hepatologul","accusative-indefinite-nominative-plural":"hepatologi","accusative-definite-nominative-plural":"hepatologii","dative-genitive-indefinite-singular":"hepatolog","dative-definite-genitive-singular":"hepatologului","dative-genitive-indefinite-plural":"hepatologi","dative-definite-genitive-plural":"hepatologilor","singular-vocative":"hepatologule","plural-vocative":"hepatologilor"}},{"word":"hepatologă","pos":"noun","definitions":["female equivalent of hepatolog"],"forms":{"plural":"hepatologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hepatologă","accusative-definite-nominative-singular":"hepatologa","accusative-indefinite-nominative-plural":"hepatologe","accusative-definite-nominative-plural":"hepatologele","dative-genitive-indefinite-singular":"hepatologe","dative-definite-genitive-singular":"hepatologei","dative-genitive-indefinite-plural":"hepatologe","dative-definite-genitive-plural":"hepatologelor","singular-vocative":"hepatologă","plural-vocative":"hepatologelor"}},{"word":"hepatologic","pos":"adj","definitions":["hepatological"],"forms":{"feminine-singular":"hepatologică","masculine-plural":"hepatologici","feminine-neuter-plural":"hepatologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hepatologic","error-unrecognized-form-feminine-indefinite-singular":"hepatologică","error-unrecognized-form-indefinite-masculine-plural":"hepatologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hepatologice","definite-error-unrecognized-form-masculine-neuter-singular":"hepatologicul","definite-error-unrecognized-form-feminine-singular":"hepatologica","definite-error-unrecognized-form-masculine-plural":"hepatologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hepatologicele"}},{"word":"hepatologie","pos":"noun","definitions":["hepatology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hepatologie","accusative-definite-nominative":"hepatologia","dative-genitive-indefinite":"hepatologii","dative-definite-genitive":"hepatologiei","vocative":"hepatologie"}},{"word":"hepatom","pos":"noun","definitions":["hepatoma"],"forms":{"plural":"hepatoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hepatom","accusative-definite-nominative-singular":"hepatomul","accusative-indefinite-nominative-plural":"hepatoame","accusative-definite-nominative-plural":"hepatoamele","dative-genitive-indefinite-singular":"hepatom","dative-definite-genitive-singular":"hepatomului","dative-genitive-indefinite-plural":"hepatoame","dative-definite-genitive-plural":"hepatoamelor","singular-vocative":"hepatomule","plural-vocative":"hepatoamelor"}},{"word":"hepatomegalie","pos":"noun","definitions":["hepatomegaly"],"forms":{"plural":"hepatomegalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatomegalie","accusative-definite-nominative-singular":"hepatomegalia","accusative-indefinite-nominative-plural":"hepatomegalii","accusative-definite-nominative-plural":"hepatomegaliile","dative-genitive-indefinite-singular":"hepatomegalii","dative-definite-genitive-singular":"hepatomegaliei","dative-genitive-indefinite-plural":"hepatomegalii","dative-definite-genitive-plural":"hepatomegaliilor","singular-vocative":"hepatomegalie","plural-vocative":"hepatomegaliilor"}},{"word":"hepatopancreas","pos":"noun","definitions":["hepatopancreas"],"forms":{"plural":"hepatopancrease","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hepatopancreas","accusative-definite-nominative-singular":"hepatopancreasul","accusative-indefinite-nominative-plural":"hepatopancrease","accusative-definite-nominative-plural":"hepatopancreasele","dative-genitive-indefinite-singular":"hepatopancreas","dative-definite-genitive-singular":"hepatopancreasului","dative-genitive-indefinite-plural":"hepatopancrease","dative-definite-genitive-plural":"hepatopancreaselor","singular-vocative":"hepatopancreasule","plural-vocative":"hepatopancreaselor"}},{"word":"hepatopatie","pos":"noun","definitions":["hepatopathy"],"forms":{"plural":"hepatopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatopatie","accusative-definite-nominative-singular":"hepatopatia","accusative-indefinite-nominative-plural":"hepatopatii","accusative-definite-nominative-plural":"hepatopatiile","dative-genitive-indefinite-singular":"hepatopatii","dative-definite-genitive-singular":"hepatopatiei","dative-genitive-indefinite-plural":"hepatopatii","dative-definite-genitive-plural":"hepatopatiilor","singular-vocative":"hepatopatie","plural-vocative":"hepatopatiilor"}},{"word":"hepatopexie","pos":"noun","definitions":["hepatopexy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hepatopexie","accusative-definite-nominative":"hepatopexia","dative-genitive-indefinite":"hepatopexii","dative-definite-genitive":"hepatopexiei","vocative":"hepatopexie"}},{"word":"hepatoptoză","pos":"noun","definitions":["hepatoptosis"],"forms":{"plural":"hepatoptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hepatoptoză","accusative-definite-nominative-singular":"hepatoptoza","accusative-indefinite-nominative-plural":"hepatoptoze","accusative-definite-nominative-plural":"hepatoptozele","dative-genitive-indefinite-singular":"hepatoptoze","dative-definite-genitive-singular":"hepatoptozei","dative-genitive-indefinite-plural":"hepatoptoze","dative-definite-genitive-plural":"hepatoptozelor","singular-vocative":"hepatoptoză","plural-vocative":"hepatoptozelor"}},{"word":"hepatorafie","pos":"noun","definitions":["hepatorrhaphy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hepatorafie","accusative-definite-nominative":"hepatorafia","dative-genitive-indefinite":"hepatorafii","dative-definite-genitive":"hepatorafiei","vocative":"hepatorafie"}},{"word":"hepatoragie","pos":"noun","definitions":["hepatorrhagia"],"forms":{"plural":"hepatoragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatoragie","accusative-definite-nominative-singular":"hepatoragia","accusative-indefinite-nominative-plural":"hepatoragii","accusative-definite-nominative-plural":"hepatoragiile","dative-genitive-indefinite-singular":"hepatoragii","dative-definite-genitive-singular":"hepatoragiei","dative-genitive-indefinite-plural":"hepatoragii","dative-definite-genitive-plural":"hepatoragiilor","singular-vocative":"hepatoragie","plural-vocative":"hepatoragiilor"}},{"word":"hepatostomie","pos":"noun","definitions":["hepatostomy"],"forms":{"plural":"hepatostomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatostomie","accusative-definite-nominative-singular":"hepatostomia","accusative-indefinite-nominative-plural":"hepatostomii","accusative-definite-nominative-plural":"hepatostomiile","dative-genitive-indefinite-singular":"hepatostomii","dative-definite-genitive-singular":"hepatostomiei","dative-genitive-indefinite-plural":"hepatostomii","dative-definite-genitive-plural":"hepatostomiilor","singular-vocative":"hepatostomie","plural-vocative":"hepatostomiilor"}},{"word":"hepatotomie","pos":"noun","definitions":["hepatotomy"],"forms":{"plural":"hepatotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatotomie","accusative-definite-nominative-singular":"hepatotomia","accusative-indefinite-nominative-plural":"hepatotomii","accusative-definite-nominative-plural":"hepatotomiile","dative-genitive-indefinite-singular":"hepatotomii","dative-definite-genitive-singular":"hepatotomiei","dative-genitive-indefinite-plural":"hepatotomii","dative-definite-genitive-plural":"hepatotomiilor","singular-vocative":"hepatotomie","plural-vocative":"hepatotomiilor"}},{"word":"hepatotoxemie","pos":"noun","definitions":["hepatotoxemia"],"forms":{"plural":"hepatotoxemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hepatotoxemie","accusative-definite-nominative-singular":"hepatotoxemia","accusative-indefinite-nominative-plural":"hepatotoxemii","accusative-definite-nominative-plural":"hepatotoxemiile","dative-genitive-indefinite-singular":"hepatotoxemii","dative-definite-genitive-singular":"hepatotoxemiei","dative-genitive-indefinite-plural":"hepatotoxemii","dative-definite-genitive-plural":"hepatotoxemiilor","singular-vocative":"hepatotoxemie","plural-vocative":"hepatotoxemiilor"}},{"word":"hepatotoxină","pos":"noun","definitions":["hepatotoxin"],"forms":{"plural":"hepatotoxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hepatotoxină","accusative-definite-nominative-singular":"hepatotoxina","accusative-indefinite-nominative-plural":"hepatotoxine","accusative-definite-nominative-plural":"hepatotoxinele","dative-genitive-indefinite-singular":"hepatotoxine","dative-definite-genitive-singular":"hepatotoxinei","dative-genitive-indefinite-plural":"hepatotoxine","dative-definite-genitive-plural":"hepatotoxinelor","singular-vocative":"hepatotoxină","plural-vocative":"hepatotoxinelor"}},{"word":"hepatotrop","pos":"adj","definitions":["hepatotropic"],"forms":{"feminine-singular":"hepatotropă","masculine-plural":"hepatotropi","feminine-neuter-plural":"hepatotrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hepatotrop","error-unrecognized-form-feminine-indefinite-singular":"hepatotropă","error-unrecognized-form-indefinite-masculine-plural":"hepatotropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hepatotrope","definite-error-unrecognized-form-masculine-neuter-singular":"hepatotropul","definite-error-unrecognized-form-feminine-singular":"hepatotropa","definite-error-unrecognized-form-masculine-plural":"hepatotropii","definite-error-unrecognized-form-feminine-neuter-plural":"hepatotropele"}},{"word":"heptacord","pos":"noun","definitions":["heptachord"],"forms":{"plural":"heptacorduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"heptacord","accusative-definite-nominative-singular":"heptacordul","accusative-indefinite-nominative-plural":"heptacorduri","accusative-definite-nominative-plural":"heptacordurile","dative-genitive-indefinite-singular":"heptacord","dative-definite-genitive-singular":"heptacordului","dative-genitive-indefinite-plural":"heptacorduri","dative-definite-genitive-plural":"heptacordurilor","singular-vocative":"heptacordule","plural-vocative":"heptacordurilor"}},{"word":"heptaedric","pos":"adj","definitions":["heptahedral"],"forms":{"feminine-singular":"heptaedrică","masculine-plural":"heptaedrici","feminine-neuter-plural":"heptaedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heptaedric","error-unrecognized-form-feminine-indefinite-singular":"heptaedrică","error-unrecognized-form-indefinite-masculine-plural":"heptaedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heptaedrice","definite-error-unrecognized-form-masculine-neuter-singular":"heptaedricul","definite-error-unrecognized-form-feminine-singular":"heptaedrica","definite-error-unrecognized-form-masculine-plural":"heptaedricii","definite-error-unrecognized-form-feminine-neuter-plural":"heptaedricele"}},{"word":"heptaedru","pos":"noun","definitions":["heptahedron"],"forms":{"plural":"heptaedre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heptaedru","accusative-definite-nominative-singular":"heptaedrul","accusative-indefinite-nominative-plural":"heptaedre","accusative-definite-nominative-plural":"heptaedrele","dative-genitive-indefinite-singular":"heptaedru","dative-definite-genitive-singular":"heptaedrului","dative-genitive-indefinite-plural":"heptaedre","dative-definite-genitive-plural":"heptaedrelor","singular-vocative":"heptaedrule","plural-vocative":"heptaedrelor"}},{"word":"heptagoane","pos":"noun","definitions":["plural of heptagon"]},{"word":"heptagon","pos":"noun","definitions":["heptagon"],"forms":{"plural":"heptagoane"}},{"word":"heptagonal","pos":"adj","definitions":["heptagonal"],"forms":{"feminine-singular":"heptagonală","masculine-plural":"heptagonali","feminine-neuter-plural":"heptagonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heptagonal","error-unrecognized-form-feminine-indefinite-singular":"heptagonală","error-unrecognized-form-indefinite-masculine-plural":"heptagonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"heptagonale","definite-error-unrecognized-form-masculine-neuter-singular":"heptagonalul","definite-error-unrecognized-form-feminine-singular":"heptagonala","definite-error-unrecognized-form-masculine-plural":"heptagonalii","definite-error-unrecognized-form-feminine-neuter-plural":"heptagonalele"}},{"word":"heptametru","pos":"noun","definitions":["heptameter"],"pronunciation":"/hep.taˈme.tru/","forms":{"plural":"heptametre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heptametru","accusative-definite-nominative-singular":"heptametrul","accusative-indefinite-nominative-plural":"heptametre","accusative-definite-nominative-plural":"heptametrele","dative-genitive-indefinite-singular":"heptametru","dative-definite-genitive-singular":"heptametrului","dative-genitive-indefinite-plural":"heptametre","dative-definite-genitive-plural":"heptametrelor","singular-vocative":"heptametrule","plural-vocative":"heptametrelor"}},{"word":"heptan","pos":"noun","definitions":["heptane"],"forms":{"plural":"heptani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heptan","accusative-definite-nominative-singular":"heptanul","accusative-indefinite-nominative-plural":"heptani","accusative-definite-nominative-plural":"heptanii","dative-genitive-indefinite-singular":"heptan","dative-definite-genitive-singular":"heptanului","dative-genitive-indefinite-plural":"heptani","dative-definite-genitive-plural":"heptanilor","singular-vocative":"heptanule","plural-vocative":"heptanilor"}},{"word":"heptaoxid","pos":"noun","definitions":["heptoxide"],"forms":{"plural":"heptaoxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heptaoxid","accusative-definite-nominative-singular":"heptaoxidul","accusative-indefinite-nominative-plural":"heptaoxizi","accusative-definite-nominative-plural":"heptaoxizii","dative-genitive-indefinite-singular":"heptaoxid","dative-definite-genitive-singular":"heptaoxidului","dative-genitive-indefinite-plural":"heptaoxizi","dative-definite-genitive-plural":"heptaoxizilor","singular-vocative":"heptaoxidule","plural-vocative":"heptaoxizilor"}},{"word":"heptarhie","pos":"noun","definitions":["heptarchy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heptarhie","accusative-definite-nominative":"heptarhia","dative-genitive-indefinite":"heptarhii","dative-definite-genitive":"heptarhiei","vocative":"heptarhie"}},{"word":"heptatlon","pos":"noun","definitions":["heptathlon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heptatlon","accusative-definite-nominative":"heptatlonul","dative-genitive-indefinite":"heptatlon","dative-definite-genitive":"heptatlonului","vocative":"heptatlonule"}},{"word":"heptavalent","pos":"adj","definitions":["heptavalent"],"forms":{"feminine-singular":"heptavalentă","masculine-plural":"heptavalenți","feminine-neuter-plural":"heptavalente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heptavalent","error-unrecognized-form-feminine-indefinite-singular":"heptavalentă","error-unrecognized-form-indefinite-masculine-plural":"heptavalenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"heptavalente","definite-error-unrecognized-form-masculine-neuter-singular":"heptavalentul","definite-error-unrecognized-form-feminine-singular":"heptavalenta","definite-error-unrecognized-form-masculine-plural":"heptavalenții","definite-error-unrecognized-form-feminine-neuter-plural":"heptavalentele"}},{"word":"heptodă","pos":"noun","definitions":["heptode"],"forms":{"plural":"heptode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heptodă","accusative-definite-nominative-singular":"heptoda","accusative-indefinite-nominative-plural":"heptode","accusative-definite-nominative-plural":"heptodele","dative-genitive-indefinite-singular":"heptode","dative-definite-genitive-singular":"heptodei","dative-genitive-indefinite-plural":"heptode","dative-definite-genitive-plural":"heptodelor","singular-vocative":"heptodă","plural-vocative":"heptodelor"}},{"word":"Heracle","pos":"name","definitions":["Heracles"],"gender":"m"},{"word":"herald","pos":"noun","definitions":["deputy in charge of various tasks in medieval courts"],"forms":{"plural":"heralzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"herald","accusative-definite-nominative-singular":"heraldul","accusative-indefinite-nominative-plural":"heralzi","accusative-definite-nominative-plural":"heralzii","dative-genitive-indefinite-singular":"herald","dative-definite-genitive-singular":"heraldului","dative-genitive-indefinite-plural":"heralzi","dative-definite-genitive-plural":"heralzilor","singular-vocative":"heraldule","plural-vocative":"heralzilor","alternative-obsolete":"erold"}},{"word":"heraldic","pos":"adj","definitions":["heraldic"],"forms":{"feminine-singular":"heraldică","masculine-plural":"heraldici","feminine-neuter-plural":"heraldice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heraldic","error-unrecognized-form-feminine-indefinite-singular":"heraldică","error-unrecognized-form-indefinite-masculine-plural":"heraldici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heraldice","definite-error-unrecognized-form-masculine-neuter-singular":"heraldicul","definite-error-unrecognized-form-feminine-singular":"heraldica","definite-error-unrecognized-form-masculine-plural":"heraldicii","definite-error-unrecognized-form-feminine-neuter-plural":"heraldicele"}},{"word":"heraldică","pos":"noun","definitions":["armory"],"forms":{"plural":"heraldici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"heraldică","accusative-definite-nominative-singular":"heraldica","accusative-indefinite-nominative-plural":"heraldici","accusative-definite-nominative-plural":"heraldicile","dative-genitive-indefinite-singular":"heraldici","dative-definite-genitive-singular":"heraldicii","dative-genitive-indefinite-plural":"heraldici","dative-definite-genitive-plural":"heraldicilor","singular-vocative":"heraldică","plural-vocative":"heraldicilor"}},{"word":"heraldist","pos":"noun","definitions":["heraldist"],"forms":{"plural":"heraldiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heraldist","accusative-definite-nominative-singular":"heraldistul","accusative-indefinite-nominative-plural":"heraldiști","accusative-definite-nominative-plural":"heraldiștii","dative-genitive-indefinite-singular":"heraldist","dative-definite-genitive-singular":"heraldistului","dative-genitive-indefinite-plural":"heraldiști","dative-definite-genitive-plural":"heraldiștilor","singular-vocative":"heraldistule","plural-vocative":"heraldiștilor"}},{"word":"heralzi","pos":"noun","definitions":["plural of herald"]},{"word":"Herăști","pos":"name","definitions":["a commune of Giurgiu County, Romania","a village in Herăști, Giurgiu County, Romania","a village in Ghioroiu, Vâlcea County, Romania"],"gender":"m"},{"word":"Herăstrău","pos":"name","definitions":["a neighbourhood of Bucharest, Romania","a lake in Bucharest, Romania","a park in Bucharest, Romania"],"gender":"f"},{"word":"herăstrău","pos":"noun","definitions":["alternative form of fierăstrău"],"forms":{"plural":"herăstraie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"herăstrău","accusative-definite-nominative-singular":"herăstrăuul","accusative-indefinite-nominative-plural":"herăstraie","accusative-definite-nominative-plural":"herăstraiele","dative-genitive-indefinite-singular":"herăstrău","dative-definite-genitive-singular":"herăstrăuului","dative-genitive-indefinite-plural":"herăstraie","dative-definite-genitive-plural":"herăstraielor","singular-vocative":"herăstrăuule","plural-vocative":"herăstraielor"}},{"word":"herb","pos":"noun","definitions":["coat of arms"],"forms":{"plural":"herburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"herb","accusative-definite-nominative-singular":"herbul","accusative-indefinite-nominative-plural":"herburi","accusative-definite-nominative-plural":"herburile","dative-genitive-indefinite-singular":"herb","dative-definite-genitive-singular":"herbului","dative-genitive-indefinite-plural":"herburi","dative-definite-genitive-plural":"herburilor","singular-vocative":"herbule","plural-vocative":"herburilor"}},{"word":"herbar","pos":"noun","definitions":["alternative form of ierbar"],"forms":{"plural":"herbare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"herbar","accusative-definite-nominative-singular":"herbarul","accusative-indefinite-nominative-plural":"herbare","accusative-definite-nominative-plural":"herbarele","dative-genitive-indefinite-singular":"herbar","dative-definite-genitive-singular":"herbarului","dative-genitive-indefinite-plural":"herbare","dative-definite-genitive-plural":"herbarelor","singular-vocative":"herbarule","plural-vocative":"herbarelor"}},{"word":"herbologă","pos":"noun","definitions":["female equivalent of herbolog"],"forms":{"plural":"herbologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"herbologă","accusative-definite-nominative-singular":"herbologa","accusative-indefinite-nominative-plural":"herbologe","accusative-definite-nominative-plural":"herbologele","dative-genitive-indefinite-singular":"herbologe","dative-definite-genitive-singular":"herbologei","dative-genitive-indefinite-plural":"herbologe","dative-definite-genitive-plural":"herbologelor","singular-vocative":"herbologă","plural-vocative":"herbologelor"}},{"word":"hercinic","pos":"adj","definitions":["Hercynian"],"forms":{"feminine-singular":"hercinică","masculine-plural":"hercinici","feminine-neuter-plural":"hercinice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hercinic","error-unrecognized-form-feminine-indefinite-singular":"hercinică","error-unrecognized-form-indefinite-masculine-plural":"hercinici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hercinice","definite-error-unrecognized-form-masculine-neuter-singular":"hercinicul","definite-error-unrecognized-form-feminine-singular":"hercinica","definite-error-unrecognized-form-masculine-plural":"hercinicii","definite-error-unrecognized-form-feminine-neuter-plural":"hercinicele"}},{"word":"Hercule","pos":"name","definitions":["Hercules"],"gender":"m"},{"word":"hercule","pos":"noun","definitions":["hercules; Hercules"],"forms":{"plural":"herculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hercule","accusative-definite-nominative-singular":"herculeul","accusative-indefinite-nominative-plural":"herculi","accusative-definite-nominative-plural":"herculii","dative-genitive-indefinite-singular":"hercule","dative-definite-genitive-singular":"herculeului","dative-genitive-indefinite-plural":"herculi","dative-definite-genitive-plural":"herculilor","singular-vocative":"herculeule","plural-vocative":"herculilor"}},{"word":"herculean","pos":"adj","definitions":["Herculean"],"forms":{"feminine-singular":"herculeană","masculine-plural":"herculeni","feminine-neuter-plural":"herculene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herculean","error-unrecognized-form-feminine-indefinite-singular":"herculeană","error-unrecognized-form-indefinite-masculine-plural":"herculeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"herculene","definite-error-unrecognized-form-masculine-neuter-singular":"herculeanul","definite-error-unrecognized-form-feminine-singular":"herculeana","definite-error-unrecognized-form-masculine-plural":"herculenii","definite-error-unrecognized-form-feminine-neuter-plural":"herculenele"}},{"word":"herculeean","pos":"adj","definitions":["Herculean"],"forms":{"feminine-singular":"herculeeană","masculine-plural":"herculeeni","feminine-neuter-plural":"herculeene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herculeean","error-unrecognized-form-feminine-indefinite-singular":"herculeeană","error-unrecognized-form-indefinite-masculine-plural":"herculeeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"herculeene","definite-error-unrecognized-form-masculine-neuter-singular":"herculeeanul","definite-error-unrecognized-form-feminine-singular":"herculeeana","definite-error-unrecognized-form-masculine-plural":"herculeenii","definite-error-unrecognized-form-feminine-neuter-plural":"herculeenele"}},{"word":"Herculian","pos":"name","definitions":["a village in Bățani, Covasna County, Romania"],"gender":"m"},{"word":"Herdeanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Herdeanu"}},{"word":"Herebenciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Herebenciuc"}},{"word":"Hereclean","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Hereclean, Sălaj County, Romania"],"gender":"m"},{"word":"herede","pos":"noun","definitions":["obsolete form of erede"],"forms":{"plural":"herezi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"herede","accusative-definite-nominative-singular":"heredeul","accusative-indefinite-nominative-plural":"herezi","accusative-definite-nominative-plural":"herezii","dative-genitive-indefinite-singular":"herede","dative-definite-genitive-singular":"heredeului","dative-genitive-indefinite-plural":"herezi","dative-definite-genitive-plural":"herezilor","singular-vocative":"heredeule","plural-vocative":"herezilor"}},{"word":"hereghie","pos":"noun","definitions":["a coin mint"],"forms":{"plural":"hereghii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hereghie","accusative-definite-nominative-singular":"hereghia","accusative-indefinite-nominative-plural":"hereghii","accusative-definite-nominative-plural":"hereghiile","dative-genitive-indefinite-singular":"hereghii","dative-definite-genitive-singular":"hereghiei","dative-genitive-indefinite-plural":"hereghii","dative-definite-genitive-plural":"hereghiilor","singular-vocative":"hereghie","plural-vocative":"hereghiilor"}},{"word":"Herendești","pos":"name","definitions":["a village in Victor Vlad Delamarina, Timiș County, Romania"],"gender":"m"},{"word":"Herepea","pos":"name","definitions":["a village in Adămuș, Mureș County, Romania"],"gender":"f"},{"word":"Herescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Herescu"}},{"word":"herestrău","pos":"noun","definitions":["obsolete form of ferăstrău"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"herestrău","accusative-definite-nominative":"herestrăuul","dative-genitive-indefinite":"herestrău","dative-definite-genitive":"herestrăuului","vocative":"herestrăuule"}},{"word":"heretiseală","pos":"noun","definitions":["obsolete form of hiritiseală"],"forms":{"plural":"heretiseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heretiseală","accusative-definite-nominative-singular":"heretiseala","accusative-indefinite-nominative-plural":"heretisele","accusative-definite-nominative-plural":"heretiselele","dative-genitive-indefinite-singular":"heretisele","dative-definite-genitive-singular":"heretiselei","dative-genitive-indefinite-plural":"heretisele","dative-definite-genitive-plural":"heretiselelor","singular-vocative":"heretiseală","plural-vocative":"heretiselelor"}},{"word":"heretisi","pos":"verb","definitions":["to alternative form of hiritisi"],"forms":{"canonical":"a heretisi 4th conjugation","present-singular-third-person":"heretisește","participle-past":"heretisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a heretisi","gerund":"heretisind","first-person-indicative-present-singular":"heretisesc","indicative-present-second-person-singular":"heretisești","indicative-present-singular-third-person":"heretisește","first-person-indicative-plural-present":"heretisim","indicative-plural-present-second-person":"heretisiți","indicative-plural-present-third-person":"heretisesc","first-person-imperfect-indicative-singular":"heretiseam","imperfect-indicative-second-person-singular":"heretiseai","imperfect-indicative-singular-third-person":"heretisea","first-person-imperfect-indicative-plural":"heretiseam","imperfect-indicative-plural-second-person":"heretiseați","imperfect-indicative-plural-third-person":"heretiseau","first-person-indicative-perfect-singular":"heretisii","indicative-perfect-second-person-singular":"heretisiși","indicative-perfect-singular-third-person":"heretisi","first-person-indicative-perfect-plural":"heretisirăm","indicative-perfect-plural-second-person":"heretisirăți","indicative-perfect-plural-third-person":"heretisiră","first-person-indicative-pluperfect-singular":"heretisisem","indicative-pluperfect-second-person-singular":"heretisiseși","indicative-pluperfect-singular-third-person":"heretisise","first-person-indicative-pluperfect-plural":"heretisiserăm","indicative-pluperfect-plural-second-person":"heretisiserăți","indicative-pluperfect-plural-third-person":"heretisiseră","first-person-present-singular-subjunctive":"să heretisesc","present-second-person-singular-subjunctive":"să heretisești","present-singular-subjunctive-third-person":"să heretisească","first-person-plural-present-subjunctive":"să heretisim","plural-present-second-person-subjunctive":"să heretisiți","plural-present-subjunctive-third-person":"să heretisească","imperative-second-person-singular":"heretisește","imperative-plural-second-person":"heretisiți","imperative-negative-second-person-singular":"nu heretisi","imperative-negative-plural-second-person":"nu heretisiți"}},{"word":"heretisire","pos":"noun","definitions":["obsolete form of hiritisire"],"forms":{"plural":"heretisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"heretisire","accusative-definite-nominative-singular":"heretisirea","accusative-indefinite-nominative-plural":"heretisiri","accusative-definite-nominative-plural":"heretisirile","dative-genitive-indefinite-singular":"heretisiri","dative-definite-genitive-singular":"heretisirii","dative-genitive-indefinite-plural":"heretisiri","dative-definite-genitive-plural":"heretisirilor","singular-vocative":"heretisire","plural-vocative":"heretisirilor"}},{"word":"heretismos","pos":"noun","definitions":["congratulation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"heretismos","accusative-definite-nominative":"heretismosul","dative-genitive-indefinite":"heretismos","dative-definite-genitive":"heretismosului","vocative":"heretismosule"}},{"word":"Herghelegiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Herghelegiu"}},{"word":"herghelegiu","pos":"noun","definitions":["stud caretaker"],"forms":{"plural":"herghelegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"herghelegiu","accusative-definite-nominative-singular":"herghelegiuul","accusative-indefinite-nominative-plural":"herghelegii","accusative-definite-nominative-plural":"herghelegiii","dative-genitive-indefinite-singular":"herghelegiu","dative-definite-genitive-singular":"herghelegiuului","dative-genitive-indefinite-plural":"herghelegii","dative-definite-genitive-plural":"herghelegiilor","singular-vocative":"herghelegiuule","plural-vocative":"herghelegiilor"}},{"word":"Herghelia","pos":"name","definitions":["a village in Ceuașu de Câmpie, Mureș County, Romania"],"gender":"f"},{"word":"herghelie","pos":"noun","definitions":["stud (a ranch where horses are kept)"],"forms":{"plural":"herghelii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"herghelie","accusative-definite-nominative-singular":"herghelia","accusative-indefinite-nominative-plural":"herghelii","accusative-definite-nominative-plural":"hergheliile","dative-genitive-indefinite-singular":"herghelii","dative-definite-genitive-singular":"hergheliei","dative-genitive-indefinite-plural":"herghelii","dative-definite-genitive-plural":"hergheliilor","singular-vocative":"herghelie","plural-vocative":"hergheliilor"}},{"word":"Hergheligiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Hergheligiu"}},{"word":"hergheligiu","pos":"noun","definitions":["studmaster, stablemaster"],"forms":{"plural":"herghelegii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hergheligiu","accusative-definite-nominative-singular":"herghelegiul","accusative-indefinite-nominative-plural":"herghelegii","accusative-definite-nominative-plural":"herghelegiii","dative-genitive-indefinite-singular":"hergheligiu","dative-definite-genitive-singular":"herghelegiului","dative-genitive-indefinite-plural":"herghelegii","dative-definite-genitive-plural":"herghelegiilor","singular-vocative":"herghelegiule","plural-vocative":"herghelegiilor"}},{"word":"Herghiligiu","pos":"name","definitions":["a surname originating as an occupation"],"gender":"m","forms":{"dative-genitive":"lui Herghiligiu"}},{"word":"hering","pos":"noun","definitions":["Atlantic herring (Clupea harengus)"],"pronunciation":"/ˈheriŋɡ/","forms":{"plural":"heringi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hering","accusative-definite-nominative-singular":"heringul","accusative-indefinite-nominative-plural":"heringi","accusative-definite-nominative-plural":"heringii","dative-genitive-indefinite-singular":"hering","dative-definite-genitive-singular":"heringului","dative-genitive-indefinite-plural":"heringi","dative-definite-genitive-plural":"heringilor","singular-vocative":"heringule","plural-vocative":"heringilor"}},{"word":"Herla","pos":"name","definitions":["a village in Slatina, Suceava County, Romania"],"gender":"f"},{"word":"hermafrodism","pos":"noun","definitions":["hermaphrodism"],"forms":{"plural":"hermafrodisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hermafrodism","accusative-definite-nominative-singular":"hermafrodismul","accusative-indefinite-nominative-plural":"hermafrodisme","accusative-definite-nominative-plural":"hermafrodismele","dative-genitive-indefinite-singular":"hermafrodism","dative-definite-genitive-singular":"hermafrodismului","dative-genitive-indefinite-plural":"hermafrodisme","dative-definite-genitive-plural":"hermafrodismelor","singular-vocative":"hermafrodismule","plural-vocative":"hermafrodismelor"}},{"word":"hermafrodit","pos":"adj","definitions":["hermaphrodite"],"forms":{"feminine-singular":"hermafrodită","masculine-plural":"hermafrodiți","feminine-neuter-plural":"hermafrodite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hermafrodit","error-unrecognized-form-feminine-indefinite-singular":"hermafrodită","error-unrecognized-form-indefinite-masculine-plural":"hermafrodiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hermafrodite","definite-error-unrecognized-form-masculine-neuter-singular":"hermafroditul","definite-error-unrecognized-form-feminine-singular":"hermafrodita","definite-error-unrecognized-form-masculine-plural":"hermafrodiții","definite-error-unrecognized-form-feminine-neuter-plural":"hermafroditele"}},{"word":"hermafroditism","pos":"noun","definitions":["hermaphroditism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hermafroditism","accusative-definite-nominative-singular":"hermafroditismul","accusative-indefinite-nominative-plural":"hermafroditisme","accusative-definite-nominative-plural":"hermafroditismele","dative-genitive-indefinite-singular":"hermafroditism","dative-definite-genitive-singular":"hermafroditismului","dative-genitive-indefinite-plural":"hermafroditisme","dative-definite-genitive-plural":"hermafroditismelor","singular-vocative":"hermafroditismule","plural-vocative":"hermafroditismelor"}},{"word":"hermandad","pos":"noun","definitions":["hermandad"],"forms":{"plural":"hermandade","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hermandad","accusative-definite-nominative-singular":"hermandadul","accusative-indefinite-nominative-plural":"hermandade","accusative-definite-nominative-plural":"hermandadele","dative-genitive-indefinite-singular":"hermandad","dative-definite-genitive-singular":"hermandadului","dative-genitive-indefinite-plural":"hermandade","dative-definite-genitive-plural":"hermandadelor","singular-vocative":"hermandadule","plural-vocative":"hermandadelor"}},{"word":"hermelină","pos":"noun","definitions":["ermine"],"forms":{"plural":"hermeline","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hermelină","accusative-definite-nominative-singular":"hermelina","accusative-indefinite-nominative-plural":"hermeline","accusative-definite-nominative-plural":"hermelinele","dative-genitive-indefinite-singular":"hermeline","dative-definite-genitive-singular":"hermelinei","dative-genitive-indefinite-plural":"hermeline","dative-definite-genitive-plural":"hermelinelor","singular-vocative":"hermelină","plural-vocative":"hermelinelor"}},{"word":"hermeneut","pos":"noun","definitions":["hermeneut, hermeneutician, hermeneuticist, exegete"],"forms":{"plural":"hermeneuți"}},{"word":"hermeneuți","pos":"noun","definitions":["plural of hermeneut (hermeneut; hermeneuticist; hermeneutician)"]},{"word":"hermeneutic","pos":"adj","definitions":["hermeneutic, hermeneutical"],"forms":{"feminine-singular":"hermeneutică","masculine-plural":"hermeneutici","feminine-neuter-plural":"hermeneutice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hermeneutic","error-unrecognized-form-feminine-indefinite-singular":"hermeneutică","error-unrecognized-form-indefinite-masculine-plural":"hermeneutici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hermeneutice","definite-error-unrecognized-form-masculine-neuter-singular":"hermeneuticul","definite-error-unrecognized-form-feminine-singular":"hermeneutica","definite-error-unrecognized-form-masculine-plural":"hermeneuticii","definite-error-unrecognized-form-feminine-neuter-plural":"hermeneuticele","alternative":"ermeneutic"}},{"word":"hermeneutică","pos":"noun","definitions":["hermeneutics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"hermeneutică","accusative-definite-nominative":"hermeneutica","dative-genitive-indefinite":"hermeneutici","dative-definite-genitive":"hermeneuticii","vocative":"hermeneutică"}},{"word":"hermeneutică","pos":"adj","definitions":["feminine singular nominative/accusative of hermeneutic"],"gender":"f-s"},{"word":"hermeneutice","pos":"adj","definitions":["feminine/neuter plural nominative/accusative of hermeneutic"]},{"word":"hermeneutici","pos":"adj","definitions":["masculine plural nominative/accusative of hermeneutic"],"gender":"m-p"},{"word":"Hermeniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hermeniuc"}},{"word":"hermenție","pos":"noun","definitions":["devastation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hermenție","accusative-definite-nominative":"hermenția","dative-genitive-indefinite":"hermenții","dative-definite-genitive":"hermenției","vocative":"hermenție"}},{"word":"hermetic","pos":"adj","definitions":["obsolete form of ermetic"],"forms":{"feminine-singular":"hermetică","masculine-plural":"hermetici","feminine-neuter-plural":"hermetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hermetic","error-unrecognized-form-feminine-indefinite-singular":"hermetică","error-unrecognized-form-indefinite-masculine-plural":"hermetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hermetice","definite-error-unrecognized-form-masculine-neuter-singular":"hermeticul","definite-error-unrecognized-form-feminine-singular":"hermetica","definite-error-unrecognized-form-masculine-plural":"hermeticii","definite-error-unrecognized-form-feminine-neuter-plural":"hermeticele"}},{"word":"hermină","pos":"noun","definitions":["ermine"],"forms":{"plural":"hermine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hermină","accusative-definite-nominative-singular":"hermina","accusative-indefinite-nominative-plural":"hermine","accusative-definite-nominative-plural":"herminele","dative-genitive-indefinite-singular":"hermine","dative-definite-genitive-singular":"herminei","dative-genitive-indefinite-plural":"hermine","dative-definite-genitive-plural":"herminelor","singular-vocative":"hermină","plural-vocative":"herminelor"}},{"word":"Herneacova","pos":"name","definitions":["a village in Recaș, Timiș County, Romania"],"gender":"f"},{"word":"herniar","pos":"adj","definitions":["hernial"],"forms":{"feminine-singular":"herniară","masculine-plural":"herniari","feminine-neuter-plural":"herniare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herniar","error-unrecognized-form-feminine-indefinite-singular":"herniară","error-unrecognized-form-indefinite-masculine-plural":"herniari","error-unrecognized-form-feminine-indefinite-neuter-plural":"herniare","definite-error-unrecognized-form-masculine-neuter-singular":"herniarul","definite-error-unrecognized-form-feminine-singular":"herniara","definite-error-unrecognized-form-masculine-plural":"herniarii","definite-error-unrecognized-form-feminine-neuter-plural":"herniarele"}},{"word":"hernie","pos":"noun","definitions":["hernia"],"forms":{"plural":"hernii"}},{"word":"hernie de disc","pos":"noun","definitions":["spinal disc herniation"],"forms":{"plural":"hernii de disc"}},{"word":"hernie strangulată","pos":"noun","definitions":["umbilical hernia"],"forms":{"plural":"hernii strangulate"}},{"word":"herniotomie","pos":"noun","definitions":["herniotomy"],"forms":{"plural":"herniotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"herniotomie","accusative-definite-nominative-singular":"herniotomia","accusative-indefinite-nominative-plural":"herniotomii","accusative-definite-nominative-plural":"herniotomiile","dative-genitive-indefinite-singular":"herniotomii","dative-definite-genitive-singular":"herniotomiei","dative-genitive-indefinite-plural":"herniotomii","dative-definite-genitive-plural":"herniotomiilor","singular-vocative":"herniotomie","plural-vocative":"herniotomiilor"}},{"word":"Herodot","pos":"name","definitions":["Herodotus (famous Ancient Greek Historian)"],"gender":"m"},{"word":"heroină","pos":"noun","definitions":["heroin"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heroină","accusative-definite-nominative-singular":"heroina","accusative-indefinite-nominative-plural":"heroine","accusative-definite-nominative-plural":"heroinele","dative-genitive-indefinite-singular":"heroine","dative-definite-genitive-singular":"heroinei","dative-genitive-indefinite-plural":"heroine","dative-definite-genitive-plural":"heroinelor","singular-vocative":"heroină","plural-vocative":"heroinelor"}},{"word":"heroinoman","pos":"noun","definitions":["heroin addict"],"forms":{"plural":"heroinomani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heroinoman","accusative-definite-nominative-singular":"heroinomanul","accusative-indefinite-nominative-plural":"heroinomani","accusative-definite-nominative-plural":"heroinomanii","dative-genitive-indefinite-singular":"heroinoman","dative-definite-genitive-singular":"heroinomanului","dative-genitive-indefinite-plural":"heroinomani","dative-definite-genitive-plural":"heroinomanilor","singular-vocative":"heroinomanule","plural-vocative":"heroinomanilor"}},{"word":"heroinomană","pos":"noun","definitions":["female equivalent of heroinoman"],"forms":{"plural":"heroinomane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heroinomană","accusative-definite-nominative-singular":"heroinomana","accusative-indefinite-nominative-plural":"heroinomane","accusative-definite-nominative-plural":"heroinomanele","dative-genitive-indefinite-singular":"heroinomane","dative-definite-genitive-singular":"heroinomanei","dative-genitive-indefinite-plural":"heroinomane","dative-definite-genitive-plural":"heroinomanelor","singular-vocative":"heroinomană","plural-vocative":"heroinomanelor"}},{"word":"heroinomanie","pos":"noun","definitions":["heroin addiction"],"forms":{"plural":"heroinomanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heroinomanie","accusative-definite-nominative-singular":"heroinomania","accusative-indefinite-nominative-plural":"heroinomanii","accusative-definite-nominative-plural":"heroinomaniile","dative-genitive-indefinite-singular":"heroinomanii","dative-definite-genitive-singular":"heroinomaniei","dative-genitive-indefinite-plural":"heroinomanii","dative-definite-genitive-plural":"heroinomaniilor","singular-vocative":"heroinomanie","plural-vocative":"heroinomaniilor"}},{"word":"Heroiu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Heroiu"}},{"word":"Herostrat","pos":"name","definitions":["Herostratus"],"gender":"m"},{"word":"herostratic","pos":"adj","definitions":["herostratic"],"forms":{"feminine-singular":"herostratică","masculine-plural":"herostratici","feminine-neuter-plural":"herostratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herostratic","error-unrecognized-form-feminine-indefinite-singular":"herostratică","error-unrecognized-form-indefinite-masculine-plural":"herostratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"herostratice","definite-error-unrecognized-form-masculine-neuter-singular":"herostraticul","definite-error-unrecognized-form-feminine-singular":"herostratica","definite-error-unrecognized-form-masculine-plural":"herostraticii","definite-error-unrecognized-form-feminine-neuter-plural":"herostraticele"}},{"word":"herou","pos":"noun","definitions":["obsolete form of erou"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"herou","accusative-definite-nominative":"herouul","dative-genitive-indefinite":"herou","dative-definite-genitive":"herouului","vocative":"herouule"}},{"word":"herpes","pos":"noun","definitions":["herpes"],"forms":{"plural":"herpesuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"herpes","accusative-definite-nominative-singular":"herpesul","accusative-indefinite-nominative-plural":"herpesuri","accusative-definite-nominative-plural":"herpesurile","dative-genitive-indefinite-singular":"herpes","dative-definite-genitive-singular":"herpesului","dative-genitive-indefinite-plural":"herpesuri","dative-definite-genitive-plural":"herpesurilor","singular-vocative":"herpesule","plural-vocative":"herpesurilor"}},{"word":"herpetic","pos":"adj","definitions":["herpetic"],"forms":{"feminine-singular":"herpetică","masculine-plural":"herpetici","feminine-neuter-plural":"herpetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herpetic","error-unrecognized-form-feminine-indefinite-singular":"herpetică","error-unrecognized-form-indefinite-masculine-plural":"herpetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"herpetice","definite-error-unrecognized-form-masculine-neuter-singular":"herpeticul","definite-error-unrecognized-form-feminine-singular":"herpetica","definite-error-unrecognized-form-masculine-plural":"herpeticii","definite-error-unrecognized-form-feminine-neuter-plural":"herpeticele"}},{"word":"herpetiform","pos":"adj","definitions":["herpetiform"],"forms":{"feminine-singular":"herpetiformă","masculine-plural":"herpetiformi","feminine-neuter-plural":"herpetiforme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"herpetiform","error-unrecognized-form-feminine-indefinite-singular":"herpetiformă","error-unrecognized-form-indefinite-masculine-plural":"herpetiformi","error-unrecognized-form-feminine-indefinite-neuter-plural":"herpetiforme","definite-error-unrecognized-form-masculine-neuter-singular":"herpetiformul","definite-error-unrecognized-form-feminine-singular":"herpetiforma","definite-error-unrecognized-form-masculine-plural":"herpetiformii","definite-error-unrecognized-form-feminine-neuter-plural":"herpetiformele"}},{"word":"herpetologie","pos":"noun","definitions":["herpetology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"herpetologie","accusative-definite-nominative":"herpetologia","dative-genitive-indefinite":"herpetologii","dative-definite-genitive":"herpetologiei","vocative":"herpetologie"}},{"word":"hersă","pos":"noun","definitions":["portcullis"],"forms":{"plural":"herse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hersă","accusative-definite-nominative-singular":"hersa","accusative-indefinite-nominative-plural":"herse","accusative-definite-nominative-plural":"hersele","dative-genitive-indefinite-singular":"herse","dative-definite-genitive-singular":"hersei","dative-genitive-indefinite-plural":"herse","dative-definite-genitive-plural":"herselor","singular-vocative":"hersă","plural-vocative":"herselor"}},{"word":"herțeg","pos":"noun","definitions":["duke"],"pronunciation":"/ˈher.t͡seɡ/","forms":{"plural":"herțegi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"herțeg","accusative-definite-nominative-singular":"herțegul","accusative-indefinite-nominative-plural":"herțegi","accusative-definite-nominative-plural":"herțegii","dative-genitive-indefinite-singular":"herțeg","dative-definite-genitive-singular":"herțegului","dative-genitive-indefinite-plural":"herțegi","dative-definite-genitive-plural":"herțegilor","singular-vocative":"herțegule","plural-vocative":"herțegilor"}},{"word":"Hertioana de Jos","pos":"name","definitions":["a village in Traian, Bacău County, Romania"],"gender":"f"},{"word":"Hertioana-Răzeși","pos":"name","definitions":["a village in Traian, Bacău County, Romania"],"gender":"f"},{"word":"herțog","pos":"noun","definitions":["duke"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"herțog","accusative-definite-nominative":"herțogul","dative-genitive-indefinite":"herțog","dative-definite-genitive":"herțogului","vocative":"herțogule"}},{"word":"hertz","pos":"noun","definitions":["hertz"],"forms":{"plural":"hertzi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hertz","accusative-definite-nominative-singular":"hertzul","accusative-indefinite-nominative-plural":"hertzi","accusative-definite-nominative-plural":"hertzii","dative-genitive-indefinite-singular":"hertz","dative-definite-genitive-singular":"hertzului","dative-genitive-indefinite-plural":"hertzi","dative-definite-genitive-plural":"hertzilor","singular-vocative":"hertzule","plural-vocative":"hertzilor"}},{"word":"hertzian","pos":"adj","definitions":["Hertzian"],"forms":{"feminine-singular":"hertziană","masculine-plural":"hertzieni","feminine-neuter-plural":"hertziene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hertzian","error-unrecognized-form-feminine-indefinite-singular":"hertziană","error-unrecognized-form-indefinite-masculine-plural":"hertzieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hertziene","definite-error-unrecognized-form-masculine-neuter-singular":"hertzianul","definite-error-unrecognized-form-feminine-singular":"hertziana","definite-error-unrecognized-form-masculine-plural":"hertzienii","definite-error-unrecognized-form-feminine-neuter-plural":"hertzienele"}},{"word":"herulă","pos":"noun","definitions":["female equivalent of herul"],"forms":{"plural":"herule","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"herulă","accusative-definite-nominative-singular":"herula","accusative-indefinite-nominative-plural":"herule","accusative-definite-nominative-plural":"herulele","dative-genitive-indefinite-singular":"herule","dative-definite-genitive-singular":"herulei","dative-genitive-indefinite-plural":"herule","dative-definite-genitive-plural":"herulelor","singular-vocative":"herulă","plural-vocative":"herulelor"}},{"word":"heruvim","pos":"noun","definitions":["cherub"],"forms":{"plural":"heruvimi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heruvim","accusative-definite-nominative-singular":"heruvimul","accusative-indefinite-nominative-plural":"heruvimi","accusative-definite-nominative-plural":"heruvimii","dative-genitive-indefinite-singular":"heruvim","dative-definite-genitive-singular":"heruvimului","dative-genitive-indefinite-plural":"heruvimi","dative-definite-genitive-plural":"heruvimilor","singular-vocative":"heruvimule","plural-vocative":"heruvimilor"}},{"word":"hessian","pos":"noun","definitions":["hessian"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hessian","accusative-definite-nominative":"hessianul","dative-genitive-indefinite":"hessian","dative-definite-genitive":"hessianului","vocative":"hessianule"}},{"word":"hetairă","pos":"noun","definitions":["hetaira"],"forms":{"plural":"hetaire","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hetairă","accusative-definite-nominative-singular":"hetaira","accusative-indefinite-nominative-plural":"hetaire","accusative-definite-nominative-plural":"hetairele","dative-genitive-indefinite-singular":"hetaire","dative-definite-genitive-singular":"hetairei","dative-genitive-indefinite-plural":"hetaire","dative-definite-genitive-plural":"hetairelor","singular-vocative":"hetairă","plural-vocative":"hetairelor"}},{"word":"hetairism","pos":"noun","definitions":["hetairism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hetairism","accusative-definite-nominative":"hetairismul","dative-genitive-indefinite":"hetairism","dative-definite-genitive":"hetairismului","vocative":"hetairismule"}},{"word":"heteroauxină","pos":"noun","definitions":["heteroauxin"],"forms":{"plural":"heteroauxine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heteroauxină","accusative-definite-nominative-singular":"heteroauxina","accusative-indefinite-nominative-plural":"heteroauxine","accusative-definite-nominative-plural":"heteroauxinele","dative-genitive-indefinite-singular":"heteroauxine","dative-definite-genitive-singular":"heteroauxinei","dative-genitive-indefinite-plural":"heteroauxine","dative-definite-genitive-plural":"heteroauxinelor","singular-vocative":"heteroauxină","plural-vocative":"heteroauxinelor"}},{"word":"heterocarp","pos":"adj","definitions":["heterocarpous"],"forms":{"feminine-singular":"heterocarpă","masculine-plural":"heterocarpi","feminine-neuter-plural":"heterocarpe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterocarp","error-unrecognized-form-feminine-indefinite-singular":"heterocarpă","error-unrecognized-form-indefinite-masculine-plural":"heterocarpi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterocarpe","definite-error-unrecognized-form-masculine-neuter-singular":"heterocarpul","definite-error-unrecognized-form-feminine-singular":"heterocarpa","definite-error-unrecognized-form-masculine-plural":"heterocarpii","definite-error-unrecognized-form-feminine-neuter-plural":"heterocarpele"}},{"word":"heterocarpie","pos":"noun","definitions":["heterocarpy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heterocarpie","accusative-definite-nominative":"heterocarpia","dative-genitive-indefinite":"heterocarpii","dative-definite-genitive":"heterocarpiei","vocative":"heterocarpie"}},{"word":"heterocerc","pos":"adj","definitions":["heterocercal"],"forms":{"feminine-singular":"heterocercă","masculine-plural":"heterocerci","feminine-neuter-plural":"heterocerce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterocerc","error-unrecognized-form-feminine-indefinite-singular":"heterocercă","error-unrecognized-form-indefinite-masculine-plural":"heterocerci","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterocerce","definite-error-unrecognized-form-masculine-neuter-singular":"heterocercul","definite-error-unrecognized-form-feminine-singular":"heterocerca","definite-error-unrecognized-form-masculine-plural":"heterocercii","definite-error-unrecognized-form-feminine-neuter-plural":"heterocercele"}},{"word":"heterociclic","pos":"adj","definitions":["heterocyclic"],"forms":{"feminine-singular":"heterociclică","masculine-plural":"heterociclici","feminine-neuter-plural":"heterociclice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterociclic","error-unrecognized-form-feminine-indefinite-singular":"heterociclică","error-unrecognized-form-indefinite-masculine-plural":"heterociclici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterociclice","definite-error-unrecognized-form-masculine-neuter-singular":"heterociclicul","definite-error-unrecognized-form-feminine-singular":"heterociclica","definite-error-unrecognized-form-masculine-plural":"heterociclicii","definite-error-unrecognized-form-feminine-neuter-plural":"heterociclicele"}},{"word":"heterociclu","pos":"noun","definitions":["heterocycle"],"forms":{"plural":"heterocicluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heterociclu","accusative-definite-nominative-singular":"heterociclul","accusative-indefinite-nominative-plural":"heterocicluri","accusative-definite-nominative-plural":"heterociclurile","dative-genitive-indefinite-singular":"heterociclu","dative-definite-genitive-singular":"heterociclului","dative-genitive-indefinite-plural":"heterocicluri","dative-definite-genitive-plural":"heterociclurilor","singular-vocative":"heterociclule","plural-vocative":"heterociclurilor"}},{"word":"heteroclit","pos":"adj","definitions":["heteroclite"],"forms":{"feminine-singular":"heteroclită","masculine-plural":"heterocliți","feminine-neuter-plural":"heteroclite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteroclit","error-unrecognized-form-feminine-indefinite-singular":"heteroclită","error-unrecognized-form-indefinite-masculine-plural":"heterocliți","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteroclite","definite-error-unrecognized-form-masculine-neuter-singular":"heteroclitul","definite-error-unrecognized-form-feminine-singular":"heteroclita","definite-error-unrecognized-form-masculine-plural":"heterocliții","definite-error-unrecognized-form-feminine-neuter-plural":"heteroclitele"}},{"word":"heterocromie","pos":"noun","definitions":["heterochromia"],"forms":{"plural":"heterocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterocromie","accusative-definite-nominative-singular":"heterocromia","accusative-indefinite-nominative-plural":"heterocromii","accusative-definite-nominative-plural":"heterocromiile","dative-genitive-indefinite-singular":"heterocromii","dative-definite-genitive-singular":"heterocromiei","dative-genitive-indefinite-plural":"heterocromii","dative-definite-genitive-plural":"heterocromiilor","singular-vocative":"heterocromie","plural-vocative":"heterocromiilor"}},{"word":"heterocromozom","pos":"noun","definitions":["heterochromosome"],"forms":{"plural":"heterocromozomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heterocromozom","accusative-definite-nominative-singular":"heterocromozomul","accusative-indefinite-nominative-plural":"heterocromozomi","accusative-definite-nominative-plural":"heterocromozomii","dative-genitive-indefinite-singular":"heterocromozom","dative-definite-genitive-singular":"heterocromozomului","dative-genitive-indefinite-plural":"heterocromozomi","dative-definite-genitive-plural":"heterocromozomilor","singular-vocative":"heterocromozomule","plural-vocative":"heterocromozomilor"}},{"word":"heterodină","pos":"noun","definitions":["heterodyne"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heterodină","accusative-definite-nominative-singular":"heterodina","accusative-indefinite-nominative-plural":"heterodine","accusative-definite-nominative-plural":"heterodinele","dative-genitive-indefinite-singular":"heterodine","dative-definite-genitive-singular":"heterodinei","dative-genitive-indefinite-plural":"heterodine","dative-definite-genitive-plural":"heterodinelor","singular-vocative":"heterodină","plural-vocative":"heterodinelor"}},{"word":"heterodont","pos":"adj","definitions":["heterodont"],"forms":{"feminine-singular":"heterodontă","masculine-plural":"heterodonți","feminine-neuter-plural":"heterodonte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterodont","error-unrecognized-form-feminine-indefinite-singular":"heterodontă","error-unrecognized-form-indefinite-masculine-plural":"heterodonți","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterodonte","definite-error-unrecognized-form-masculine-neuter-singular":"heterodontul","definite-error-unrecognized-form-feminine-singular":"heterodonta","definite-error-unrecognized-form-masculine-plural":"heterodonții","definite-error-unrecognized-form-feminine-neuter-plural":"heterodontele"}},{"word":"heterodox","pos":"adj","definitions":["alternative form of eterodox"],"forms":{"feminine-singular":"heterodoxă","masculine-plural":"heterodocși","feminine-neuter-plural":"heterodoxe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterodox","error-unrecognized-form-feminine-indefinite-singular":"heterodoxă","error-unrecognized-form-indefinite-masculine-plural":"heterodocși","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterodoxe","definite-error-unrecognized-form-masculine-neuter-singular":"heterodoxul","definite-error-unrecognized-form-feminine-singular":"heterodoxa","definite-error-unrecognized-form-masculine-plural":"heterodocșii","definite-error-unrecognized-form-feminine-neuter-plural":"heterodoxele"}},{"word":"heterodoxie","pos":"noun","definitions":["alternative form of eterodoxie"],"forms":{"plural":"heterodoxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterodoxie","accusative-definite-nominative-singular":"heterodoxia","accusative-indefinite-nominative-plural":"heterodoxii","accusative-definite-nominative-plural":"heterodoxiile","dative-genitive-indefinite-singular":"heterodoxii","dative-definite-genitive-singular":"heterodoxiei","dative-genitive-indefinite-plural":"heterodoxii","dative-definite-genitive-plural":"heterodoxiilor","singular-vocative":"heterodoxie","plural-vocative":"heterodoxiilor"}},{"word":"heterofilie","pos":"noun","definitions":["heterophilia"],"forms":{"plural":"heterofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterofilie","accusative-definite-nominative-singular":"heterofilia","accusative-indefinite-nominative-plural":"heterofilii","accusative-definite-nominative-plural":"heterofiliile","dative-genitive-indefinite-singular":"heterofilii","dative-definite-genitive-singular":"heterofiliei","dative-genitive-indefinite-plural":"heterofilii","dative-definite-genitive-plural":"heterofiliilor","singular-vocative":"heterofilie","plural-vocative":"heterofiliilor"}},{"word":"heterofon","pos":"adj","definitions":["heterophone"],"forms":{"feminine-singular":"heterofonă","masculine-plural":"heterofoni","feminine-neuter-plural":"heterofone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterofon","error-unrecognized-form-feminine-indefinite-singular":"heterofonă","error-unrecognized-form-indefinite-masculine-plural":"heterofoni","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterofone","definite-error-unrecognized-form-masculine-neuter-singular":"heterofonul","definite-error-unrecognized-form-feminine-singular":"heterofona","definite-error-unrecognized-form-masculine-plural":"heterofonii","definite-error-unrecognized-form-feminine-neuter-plural":"heterofonele"}},{"word":"heterofonie","pos":"noun","definitions":["heterophony"],"forms":{"plural":"heterofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterofonie","accusative-definite-nominative-singular":"heterofonia","accusative-indefinite-nominative-plural":"heterofonii","accusative-definite-nominative-plural":"heterofoniile","dative-genitive-indefinite-singular":"heterofonii","dative-definite-genitive-singular":"heterofoniei","dative-genitive-indefinite-plural":"heterofonii","dative-definite-genitive-plural":"heterofoniilor","singular-vocative":"heterofonie","plural-vocative":"heterofoniilor"}},{"word":"heterogam","pos":"adj","definitions":["heterogamous"],"pronunciation":"/ˌhe.te.ro.ˈɡam/","forms":{"feminine-singular":"heterogamă","masculine-plural":"heterogami","feminine-neuter-plural":"heterogame","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterogam","error-unrecognized-form-feminine-indefinite-singular":"heterogamă","error-unrecognized-form-indefinite-masculine-plural":"heterogami","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterogame","definite-error-unrecognized-form-masculine-neuter-singular":"heterogamul","definite-error-unrecognized-form-feminine-singular":"heterogama","definite-error-unrecognized-form-masculine-plural":"heterogamii","definite-error-unrecognized-form-feminine-neuter-plural":"heterogamele"}},{"word":"heterogamie","pos":"noun","definitions":["heterogamy"],"forms":{"plural":"heterogamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterogamie","accusative-definite-nominative-singular":"heterogamia","accusative-indefinite-nominative-plural":"heterogamii","accusative-definite-nominative-plural":"heterogamiile","dative-genitive-indefinite-singular":"heterogamii","dative-definite-genitive-singular":"heterogamiei","dative-genitive-indefinite-plural":"heterogamii","dative-definite-genitive-plural":"heterogamiilor","singular-vocative":"heterogamie","plural-vocative":"heterogamiilor"}},{"word":"heterogen","pos":"adj","definitions":["obsolete form of eterogen"],"forms":{"feminine-singular":"heterogenă","masculine-plural":"heterogeni","feminine-neuter-plural":"heterogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterogen","error-unrecognized-form-feminine-indefinite-singular":"heterogenă","error-unrecognized-form-indefinite-masculine-plural":"heterogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterogene","definite-error-unrecognized-form-masculine-neuter-singular":"heterogenul","definite-error-unrecognized-form-feminine-singular":"heterogena","definite-error-unrecognized-form-masculine-plural":"heterogenii","definite-error-unrecognized-form-feminine-neuter-plural":"heterogenele"}},{"word":"heterogeneză","pos":"noun","definitions":["heterogenesis"],"forms":{"plural":"heterogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heterogeneză","accusative-definite-nominative-singular":"heterogeneza","accusative-indefinite-nominative-plural":"heterogeneze","accusative-definite-nominative-plural":"heterogenezele","dative-genitive-indefinite-singular":"heterogeneze","dative-definite-genitive-singular":"heterogenezei","dative-genitive-indefinite-plural":"heterogeneze","dative-definite-genitive-plural":"heterogenezelor","singular-vocative":"heterogeneză","plural-vocative":"heterogenezelor"}},{"word":"heterogonie","pos":"noun","definitions":["heterogony"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heterogonie","accusative-definite-nominative":"heterogonia","dative-genitive-indefinite":"heterogonii","dative-definite-genitive":"heterogoniei","vocative":"heterogonie"}},{"word":"heterogrefă","pos":"noun","definitions":["heterograft"],"forms":{"plural":"heterogrefe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heterogrefă","accusative-definite-nominative-singular":"heterogrefa","accusative-indefinite-nominative-plural":"heterogrefe","accusative-definite-nominative-plural":"heterogrefele","dative-genitive-indefinite-singular":"heterogrefe","dative-definite-genitive-singular":"heterogrefei","dative-genitive-indefinite-plural":"heterogrefe","dative-definite-genitive-plural":"heterogrefelor","singular-vocative":"heterogrefă","plural-vocative":"heterogrefelor"}},{"word":"heteromer","pos":"adj","definitions":["heteromeric"],"forms":{"feminine-singular":"heteromeră","masculine-plural":"heteromeri","feminine-neuter-plural":"heteromere","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteromer","error-unrecognized-form-feminine-indefinite-singular":"heteromeră","error-unrecognized-form-indefinite-masculine-plural":"heteromeri","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteromere","definite-error-unrecognized-form-masculine-neuter-singular":"heteromerul","definite-error-unrecognized-form-feminine-singular":"heteromera","definite-error-unrecognized-form-masculine-plural":"heteromerii","definite-error-unrecognized-form-feminine-neuter-plural":"heteromerele"}},{"word":"heterometabolă","pos":"adj","definitions":["heterometabolic"],"forms":{"plural":"heterometabole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"heterometabolă","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterometabole","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"heterometabola","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"heterometabolele"}},{"word":"heteromorf","pos":"adj","definitions":["heteromorphic"],"forms":{"feminine-singular":"heteromorfă","masculine-plural":"heteromorfi","feminine-neuter-plural":"heteromorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteromorf","error-unrecognized-form-feminine-indefinite-singular":"heteromorfă","error-unrecognized-form-indefinite-masculine-plural":"heteromorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteromorfe","definite-error-unrecognized-form-masculine-neuter-singular":"heteromorful","definite-error-unrecognized-form-feminine-singular":"heteromorfa","definite-error-unrecognized-form-masculine-plural":"heteromorfii","definite-error-unrecognized-form-feminine-neuter-plural":"heteromorfele"}},{"word":"heteromorfie","pos":"noun","definitions":["heteromorphy"],"forms":{"plural":"heteromorfii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heteromorfie","accusative-definite-nominative-singular":"heteromorfia","accusative-indefinite-nominative-plural":"heteromorfii","accusative-definite-nominative-plural":"heteromorfiile","dative-genitive-indefinite-singular":"heteromorfii","dative-definite-genitive-singular":"heteromorfiei","dative-genitive-indefinite-plural":"heteromorfii","dative-definite-genitive-plural":"heteromorfiilor","singular-vocative":"heteromorfie","plural-vocative":"heteromorfiilor"}},{"word":"heteromorfism","pos":"noun","definitions":["heteromorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heteromorfism","accusative-definite-nominative-singular":"heteromorfismul","accusative-indefinite-nominative-plural":"heteromorfisme","accusative-definite-nominative-plural":"heteromorfismele","dative-genitive-indefinite-singular":"heteromorfism","dative-definite-genitive-singular":"heteromorfismului","dative-genitive-indefinite-plural":"heteromorfisme","dative-definite-genitive-plural":"heteromorfismelor","singular-vocative":"heteromorfismule","plural-vocative":"heteromorfismelor"}},{"word":"heteromorfoză","pos":"noun","definitions":["heteromorphosis"],"forms":{"plural":"heteromorfoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heteromorfoză","accusative-definite-nominative-singular":"heteromorfoza","accusative-indefinite-nominative-plural":"heteromorfoze","accusative-definite-nominative-plural":"heteromorfozele","dative-genitive-indefinite-singular":"heteromorfoze","dative-definite-genitive-singular":"heteromorfozei","dative-genitive-indefinite-plural":"heteromorfoze","dative-definite-genitive-plural":"heteromorfozelor","singular-vocative":"heteromorfoză","plural-vocative":"heteromorfozelor"}},{"word":"heteronim","pos":"adj","definitions":["heteronymous"],"forms":{"feminine-singular":"heteronimă","masculine-plural":"heteronimi","feminine-neuter-plural":"heteronime","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteronim","error-unrecognized-form-feminine-indefinite-singular":"heteronimă","error-unrecognized-form-indefinite-masculine-plural":"heteronimi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteronime","definite-error-unrecognized-form-masculine-neuter-singular":"heteronimul","definite-error-unrecognized-form-feminine-singular":"heteronima","definite-error-unrecognized-form-masculine-plural":"heteronimii","definite-error-unrecognized-form-feminine-neuter-plural":"heteronimele"}},{"word":"heteronimie","pos":"noun","definitions":["heteronymy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heteronimie","accusative-definite-nominative":"heteronimia","dative-genitive-indefinite":"heteronimii","dative-definite-genitive":"heteronimiei","vocative":"heteronimie"}},{"word":"heteronom","pos":"adj","definitions":["heteronomous"],"forms":{"feminine-singular":"heteronomă","masculine-plural":"heteronomi","feminine-neuter-plural":"heteronome","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteronom","error-unrecognized-form-feminine-indefinite-singular":"heteronomă","error-unrecognized-form-indefinite-masculine-plural":"heteronomi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteronome","definite-error-unrecognized-form-masculine-neuter-singular":"heteronomul","definite-error-unrecognized-form-feminine-singular":"heteronoma","definite-error-unrecognized-form-masculine-plural":"heteronomii","definite-error-unrecognized-form-feminine-neuter-plural":"heteronomele"}},{"word":"heteronomie","pos":"noun","definitions":["heteronomy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heteronomie","accusative-definite-nominative-singular":"heteronomia","accusative-indefinite-nominative-plural":"heteronomii","accusative-definite-nominative-plural":"heteronomiile","dative-genitive-indefinite-singular":"heteronomii","dative-definite-genitive-singular":"heteronomiei","dative-genitive-indefinite-plural":"heteronomii","dative-definite-genitive-plural":"heteronomiilor","singular-vocative":"heteronomie","plural-vocative":"heteronomiilor"}},{"word":"heteroplastic","pos":"adj","definitions":["heteroplastic"],"forms":{"feminine-singular":"heteroplastică","masculine-plural":"heteroplastici","feminine-neuter-plural":"heteroplastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteroplastic","error-unrecognized-form-feminine-indefinite-singular":"heteroplastică","error-unrecognized-form-indefinite-masculine-plural":"heteroplastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteroplastice","definite-error-unrecognized-form-masculine-neuter-singular":"heteroplasticul","definite-error-unrecognized-form-feminine-singular":"heteroplastica","definite-error-unrecognized-form-masculine-plural":"heteroplasticii","definite-error-unrecognized-form-feminine-neuter-plural":"heteroplasticele"}},{"word":"heteroplastie","pos":"noun","definitions":["heteroplasty"],"forms":{"plural":"heteroplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heteroplastie","accusative-definite-nominative-singular":"heteroplastia","accusative-indefinite-nominative-plural":"heteroplastii","accusative-definite-nominative-plural":"heteroplastiile","dative-genitive-indefinite-singular":"heteroplastii","dative-definite-genitive-singular":"heteroplastiei","dative-genitive-indefinite-plural":"heteroplastii","dative-definite-genitive-plural":"heteroplastiilor","singular-vocative":"heteroplastie","plural-vocative":"heteroplastiilor"}},{"word":"heteroplazie","pos":"noun","definitions":["heteroplasia"],"forms":{"plural":"heteroplazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heteroplazie","accusative-definite-nominative-singular":"heteroplazia","accusative-indefinite-nominative-plural":"heteroplazii","accusative-definite-nominative-plural":"heteroplaziile","dative-genitive-indefinite-singular":"heteroplazii","dative-definite-genitive-singular":"heteroplaziei","dative-genitive-indefinite-plural":"heteroplazii","dative-definite-genitive-plural":"heteroplaziilor","singular-vocative":"heteroplazie","plural-vocative":"heteroplaziilor"}},{"word":"heteroproteidă","pos":"noun","definitions":["heteroprotein"],"forms":{"plural":"heteroproteide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heteroproteidă","accusative-definite-nominative-singular":"heteroproteida","accusative-indefinite-nominative-plural":"heteroproteide","accusative-definite-nominative-plural":"heteroproteidele","dative-genitive-indefinite-singular":"heteroproteide","dative-definite-genitive-singular":"heteroproteidei","dative-genitive-indefinite-plural":"heteroproteide","dative-definite-genitive-plural":"heteroproteidelor","singular-vocative":"heteroproteidă","plural-vocative":"heteroproteidelor"}},{"word":"heteropter","pos":"noun","definitions":["heteropteran"],"forms":{"plural":"heteroptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"heteropter","accusative-definite-nominative-singular":"heteropterul","accusative-indefinite-nominative-plural":"heteroptere","accusative-definite-nominative-plural":"heteropterele","dative-genitive-indefinite-singular":"heteropter","dative-definite-genitive-singular":"heteropterului","dative-genitive-indefinite-plural":"heteroptere","dative-definite-genitive-plural":"heteropterelor","singular-vocative":"heteropterule","plural-vocative":"heteropterelor"}},{"word":"heterosexual","pos":"adj","definitions":["heterosexual"],"pronunciation":"/ˌhe.te.ro.sek.suˈal/","forms":{"feminine-singular":"heterosexuală","masculine-plural":"heterosexuali","feminine-neuter-plural":"heterosexuale","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterosexual","error-unrecognized-form-feminine-indefinite-singular":"heterosexuală","error-unrecognized-form-indefinite-masculine-plural":"heterosexuali","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterosexuale","definite-error-unrecognized-form-masculine-neuter-singular":"heterosexualul","definite-error-unrecognized-form-feminine-singular":"heterosexuala","definite-error-unrecognized-form-masculine-plural":"heterosexualii","definite-error-unrecognized-form-feminine-neuter-plural":"heterosexualele"}},{"word":"heterosexual","pos":"noun","definitions":["a heterosexual"],"pronunciation":"/ˌhe.te.ro.sek.suˈal/","forms":{"plural":"heterosexuali","feminine":"equivalent heterosexuală","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heterosexual","accusative-definite-nominative-singular":"heterosexualul","accusative-indefinite-nominative-plural":"heterosexuali","accusative-definite-nominative-plural":"heterosexualii","dative-genitive-indefinite-singular":"heterosexual","dative-definite-genitive-singular":"heterosexualului","dative-genitive-indefinite-plural":"heterosexuali","dative-definite-genitive-plural":"heterosexualilor","singular-vocative":"heterosexualule","plural-vocative":"heterosexualilor"}},{"word":"heterosexuali","pos":"noun","definitions":["plural of heterosexual"],"gender":"m"},{"word":"heterosexualitate","pos":"noun","definitions":["heterosexuality"],"pronunciation":"[heteroseksualiˈtate]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-tate","accusative-indefinite-nominative":"heterosexualitate","accusative-definite-nominative":"heterosexualitatea","dative-genitive-indefinite":"heterosexualități","dative-definite-genitive":"heterosexualității","vocative":"heterosexualitate"}},{"word":"heterosexualitatea","pos":"noun","definitions":["definite nominative/accusative singular of heterosexualitate"],"pronunciation":"/heteroseksualiˈtate̯a/","gender":"f"},{"word":"heterosexualității","pos":"noun","definitions":["definite genitive/dative singular of heterosexualitate"],"pronunciation":"/heteroseksualiˈtətsi/","gender":"f"},{"word":"heterosferă","pos":"noun","definitions":["heterosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"heterosferă","accusative-definite-nominative-singular":"heterosfera","accusative-indefinite-nominative-plural":"heterosfere","accusative-definite-nominative-plural":"heterosferele","dative-genitive-indefinite-singular":"heterosfere","dative-definite-genitive-singular":"heterosferei","dative-genitive-indefinite-plural":"heterosfere","dative-definite-genitive-plural":"heterosferelor","singular-vocative":"heterosferă","plural-vocative":"heterosferelor"}},{"word":"heterotaxie","pos":"noun","definitions":["heterotaxia"],"forms":{"plural":"heterotaxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterotaxie","accusative-definite-nominative-singular":"heterotaxia","accusative-indefinite-nominative-plural":"heterotaxii","accusative-definite-nominative-plural":"heterotaxiile","dative-genitive-indefinite-singular":"heterotaxii","dative-definite-genitive-singular":"heterotaxiei","dative-genitive-indefinite-plural":"heterotaxii","dative-definite-genitive-plural":"heterotaxiilor","singular-vocative":"heterotaxie","plural-vocative":"heterotaxiilor"}},{"word":"heteroterapie","pos":"noun","definitions":["heterotherapy"],"forms":{"plural":"heteroterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heteroterapie","accusative-definite-nominative-singular":"heteroterapia","accusative-indefinite-nominative-plural":"heteroterapii","accusative-definite-nominative-plural":"heteroterapiile","dative-genitive-indefinite-singular":"heteroterapii","dative-definite-genitive-singular":"heteroterapiei","dative-genitive-indefinite-plural":"heteroterapii","dative-definite-genitive-plural":"heteroterapiilor","singular-vocative":"heteroterapie","plural-vocative":"heteroterapiilor"}},{"word":"heteroterm","pos":"adj","definitions":["heterothermic"],"forms":{"feminine-singular":"heterotermă","masculine-plural":"heterotermi","feminine-neuter-plural":"heteroterme","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heteroterm","error-unrecognized-form-feminine-indefinite-singular":"heterotermă","error-unrecognized-form-indefinite-masculine-plural":"heterotermi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heteroterme","definite-error-unrecognized-form-masculine-neuter-singular":"heterotermul","definite-error-unrecognized-form-feminine-singular":"heteroterma","definite-error-unrecognized-form-masculine-plural":"heterotermii","definite-error-unrecognized-form-feminine-neuter-plural":"heterotermele"}},{"word":"heterotermie","pos":"noun","definitions":["heterothermia"],"forms":{"plural":"heterotermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterotermie","accusative-definite-nominative-singular":"heterotermia","accusative-indefinite-nominative-plural":"heterotermii","accusative-definite-nominative-plural":"heterotermiile","dative-genitive-indefinite-singular":"heterotermii","dative-definite-genitive-singular":"heterotermiei","dative-genitive-indefinite-plural":"heterotermii","dative-definite-genitive-plural":"heterotermiilor","singular-vocative":"heterotermie","plural-vocative":"heterotermiilor"}},{"word":"heterotopic","pos":"adj","definitions":["heterotopic"],"forms":{"feminine-singular":"heterotopică","masculine-plural":"heterotopici","feminine-neuter-plural":"heterotopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterotopic","error-unrecognized-form-feminine-indefinite-singular":"heterotopică","error-unrecognized-form-indefinite-masculine-plural":"heterotopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterotopice","definite-error-unrecognized-form-masculine-neuter-singular":"heterotopicul","definite-error-unrecognized-form-feminine-singular":"heterotopica","definite-error-unrecognized-form-masculine-plural":"heterotopicii","definite-error-unrecognized-form-feminine-neuter-plural":"heterotopicele"}},{"word":"heterotopie","pos":"noun","definitions":["heterotopia"],"forms":{"plural":"heterotopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"heterotopie","accusative-definite-nominative-singular":"heterotopia","accusative-indefinite-nominative-plural":"heterotopii","accusative-definite-nominative-plural":"heterotopiile","dative-genitive-indefinite-singular":"heterotopii","dative-definite-genitive-singular":"heterotopiei","dative-genitive-indefinite-plural":"heterotopii","dative-definite-genitive-plural":"heterotopiilor","singular-vocative":"heterotopie","plural-vocative":"heterotopiilor"}},{"word":"heterotransplant","pos":"noun","definitions":["heterograft"],"forms":{"plural":"heterotransplanturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"heterotransplant","accusative-definite-nominative-singular":"heterotransplantul","accusative-indefinite-nominative-plural":"heterotransplanturi","accusative-definite-nominative-plural":"heterotransplanturile","dative-genitive-indefinite-singular":"heterotransplant","dative-definite-genitive-singular":"heterotransplantului","dative-genitive-indefinite-plural":"heterotransplanturi","dative-definite-genitive-plural":"heterotransplanturilor","singular-vocative":"heterotransplantule","plural-vocative":"heterotransplanturilor"}},{"word":"heterotrof","pos":"adj","definitions":["heterotrophic"],"forms":{"feminine-singular":"heterotrofă","masculine-plural":"heterotrofi","feminine-neuter-plural":"heterotrofe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterotrof","error-unrecognized-form-feminine-indefinite-singular":"heterotrofă","error-unrecognized-form-indefinite-masculine-plural":"heterotrofi","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterotrofe","definite-error-unrecognized-form-masculine-neuter-singular":"heterotroful","definite-error-unrecognized-form-feminine-singular":"heterotrofa","definite-error-unrecognized-form-masculine-plural":"heterotrofii","definite-error-unrecognized-form-feminine-neuter-plural":"heterotrofele"}},{"word":"heterotrofie","pos":"noun","definitions":["heterotrophy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"heterotrofie","accusative-definite-nominative":"heterotrofia","dative-genitive-indefinite":"heterotrofii","dative-definite-genitive":"heterotrofiei","vocative":"heterotrofie"}},{"word":"heterozigot","pos":"adj","definitions":["heterozygous"],"forms":{"feminine-singular":"heterozigotă","masculine-plural":"heterozigoți","feminine-neuter-plural":"heterozigote","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"heterozigot","error-unrecognized-form-feminine-indefinite-singular":"heterozigotă","error-unrecognized-form-indefinite-masculine-plural":"heterozigoți","error-unrecognized-form-feminine-indefinite-neuter-plural":"heterozigote","definite-error-unrecognized-form-masculine-neuter-singular":"heterozigotul","definite-error-unrecognized-form-feminine-singular":"heterozigota","definite-error-unrecognized-form-masculine-plural":"heterozigoții","definite-error-unrecognized-form-feminine-neuter-plural":"heterozigotele"}},{"word":"heterozis","pos":"noun","definitions":["heterosis"],"forms":{"plural":"heterozisuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"heterozis","accusative-definite-nominative-singular":"heterozisul","accusative-indefinite-nominative-plural":"heterozisuri","accusative-definite-nominative-plural":"heterozisurile","dative-genitive-indefinite-singular":"heterozis","dative-definite-genitive-singular":"heterozisului","dative-genitive-indefinite-plural":"heterozisuri","dative-definite-genitive-plural":"heterozisurilor","singular-vocative":"heterozisule","plural-vocative":"heterozisurilor"}},{"word":"heterozom","pos":"noun","definitions":["heterosome"],"forms":{"plural":"heterozomi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"heterozom","accusative-definite-nominative-singular":"heterozomul","accusative-indefinite-nominative-plural":"heterozomi","accusative-definite-nominative-plural":"heterozomii","dative-genitive-indefinite-singular":"heterozom","dative-definite-genitive-singular":"heterozomului","dative-genitive-indefinite-plural":"heterozomi","dative-definite-genitive-plural":"heterozomilor","singular-vocative":"heterozomule","plural-vocative":"heterozomilor"}},{"word":"Hetiur","pos":"name","definitions":["a village in Sighișoara, Mureș County, Romania"],"gender":"m"},{"word":"hettangian","pos":"noun","definitions":["Hettangian"],"forms":{"plural":"hettangieni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hettangian","accusative-definite-nominative-singular":"hettangianul","accusative-indefinite-nominative-plural":"hettangieni","accusative-definite-nominative-plural":"hettangienile","dative-genitive-indefinite-singular":"hettangian","dative-definite-genitive-singular":"hettangianului","dative-genitive-indefinite-plural":"hettangieni","dative-definite-genitive-plural":"hettangienilor","singular-vocative":"hettangianule","plural-vocative":"hettangienilor"}},{"word":"hevea","pos":"noun","definitions":["rubber tree"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hevea","accusative-definite-nominative":"heveaua","dative-genitive-indefinite":"-","dative-definite-genitive":"-i","vocative":"-"}},{"word":"Heveder","pos":"name","definitions":["a river in Harghita County, Romania, tributary to the Mureș"],"gender":"m"},{"word":"hexaclorbenzen","pos":"noun","definitions":["hexachlorobenzene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hexaclorbenzen","accusative-definite-nominative":"hexaclorbenzenul","dative-genitive-indefinite":"hexaclorbenzen","dative-definite-genitive":"hexaclorbenzenului","vocative":"hexaclorbenzenule"}},{"word":"hexaclorciclohexan","pos":"noun","definitions":["hexachlorocyclohexane"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hexaclorciclohexan","accusative-definite-nominative":"hexaclorciclohexanul","dative-genitive-indefinite":"hexaclorciclohexan","dative-definite-genitive":"hexaclorciclohexanului","vocative":"hexaclorciclohexanule"}},{"word":"hexacoralier","pos":"noun","definitions":["hexacoral"],"forms":{"plural":"hexacoralieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hexacoralier","accusative-definite-nominative-singular":"hexacoralierul","accusative-indefinite-nominative-plural":"hexacoralieri","accusative-definite-nominative-plural":"hexacoralierii","dative-genitive-indefinite-singular":"hexacoralier","dative-definite-genitive-singular":"hexacoralierului","dative-genitive-indefinite-plural":"hexacoralieri","dative-definite-genitive-plural":"hexacoralierilor","singular-vocative":"hexacoralierule","plural-vocative":"hexacoralierilor"}},{"word":"hexacord","pos":"noun","definitions":["hexachord"],"forms":{"plural":"hexacorduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hexacord","accusative-definite-nominative-singular":"hexacordul","accusative-indefinite-nominative-plural":"hexacorduri","accusative-definite-nominative-plural":"hexacordurile","dative-genitive-indefinite-singular":"hexacord","dative-definite-genitive-singular":"hexacordului","dative-genitive-indefinite-plural":"hexacorduri","dative-definite-genitive-plural":"hexacordurilor","singular-vocative":"hexacordule","plural-vocative":"hexacordurilor"}},{"word":"hexadecimal","pos":"adj","definitions":["hexadecimal"],"pronunciation":"/ˌhe.ksa.de.t͡ʃiˈmal/","forms":{"feminine-singular":"hexadecimală","masculine-plural":"hexadecimali","feminine-neuter-plural":"hexadecimale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexadecimal","error-unrecognized-form-feminine-indefinite-singular":"hexadecimală","error-unrecognized-form-indefinite-masculine-plural":"hexadecimali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexadecimale","definite-error-unrecognized-form-masculine-neuter-singular":"hexadecimalul","definite-error-unrecognized-form-feminine-singular":"hexadecimala","definite-error-unrecognized-form-masculine-plural":"hexadecimalii","definite-error-unrecognized-form-feminine-neuter-plural":"hexadecimalele"}},{"word":"hexaedric","pos":"adj","definitions":["hexahedral"],"forms":{"feminine-singular":"hexaedrică","masculine-plural":"hexaedrici","feminine-neuter-plural":"hexaedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexaedric","error-unrecognized-form-feminine-indefinite-singular":"hexaedrică","error-unrecognized-form-indefinite-masculine-plural":"hexaedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexaedrice","definite-error-unrecognized-form-masculine-neuter-singular":"hexaedricul","definite-error-unrecognized-form-feminine-singular":"hexaedrica","definite-error-unrecognized-form-masculine-plural":"hexaedricii","definite-error-unrecognized-form-feminine-neuter-plural":"hexaedricele"}},{"word":"hexaedru","pos":"noun","definitions":["hexahedron"],"forms":{"plural":"hexaedre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hexaedru","accusative-definite-nominative-singular":"hexaedrul","accusative-indefinite-nominative-plural":"hexaedre","accusative-definite-nominative-plural":"hexaedrele","dative-genitive-indefinite-singular":"hexaedru","dative-definite-genitive-singular":"hexaedrului","dative-genitive-indefinite-plural":"hexaedre","dative-definite-genitive-plural":"hexaedrelor","singular-vocative":"hexaedrule","plural-vocative":"hexaedrelor"}},{"word":"hexagon","pos":"noun","definitions":["hexagon"],"forms":{"plural":"hexagoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hexagon","accusative-definite-nominative-singular":"hexagonul","accusative-indefinite-nominative-plural":"hexagoane","accusative-definite-nominative-plural":"hexagoanele","dative-genitive-indefinite-singular":"hexagon","dative-definite-genitive-singular":"hexagonului","dative-genitive-indefinite-plural":"hexagoane","dative-definite-genitive-plural":"hexagoanelor","singular-vocative":"hexagonule","plural-vocative":"hexagoanelor"}},{"word":"hexagonal","pos":"adj","definitions":["hexagonal"],"pronunciation":"/ˌhek.sa.ɡoˈnal/","examples":[{"ro":"șah hexagonal","en":"hexagonal chess"}],"forms":{"feminine-singular":"hexagonală","masculine-plural":"hexagonali","feminine-neuter-plural":"hexagonale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexagonal","error-unrecognized-form-feminine-indefinite-singular":"hexagonală","error-unrecognized-form-indefinite-masculine-plural":"hexagonali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexagonale","definite-error-unrecognized-form-masculine-neuter-singular":"hexagonalul","definite-error-unrecognized-form-feminine-singular":"hexagonala","definite-error-unrecognized-form-masculine-plural":"hexagonalii","definite-error-unrecognized-form-feminine-neuter-plural":"hexagonalele"}},{"word":"hexametafosfat","pos":"noun","definitions":["hexametaphosphate"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hexametafosfat","accusative-definite-nominative-singular":"hexametafosfatul","accusative-indefinite-nominative-plural":"hexametafosfati","accusative-definite-nominative-plural":"hexametafosfatii","dative-genitive-indefinite-singular":"hexametafosfat","dative-definite-genitive-singular":"hexametafosfatului","dative-genitive-indefinite-plural":"hexametafosfati","dative-definite-genitive-plural":"hexametafosfatilor","singular-vocative":"hexametafosfatule","plural-vocative":"hexametafosfatilor"}},{"word":"hexametilentetramină","pos":"noun","definitions":["hexamethylenetetramine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hexametilentetramină","accusative-definite-nominative-singular":"hexametilentetramina","accusative-indefinite-nominative-plural":"hexametilentetramine","accusative-definite-nominative-plural":"hexametilentetraminele","dative-genitive-indefinite-singular":"hexametilentetramine","dative-definite-genitive-singular":"hexametilentetraminei","dative-genitive-indefinite-plural":"hexametilentetramine","dative-definite-genitive-plural":"hexametilentetraminelor","singular-vocative":"hexametilentetramină","plural-vocative":"hexametilentetraminelor"}},{"word":"hexametru","pos":"noun","definitions":["hexameter"],"pronunciation":"/hek.saˈme.tru/","forms":{"plural":"hexametri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hexametru","accusative-definite-nominative-singular":"hexametrul","accusative-indefinite-nominative-plural":"hexametri","accusative-definite-nominative-plural":"hexametrii","dative-genitive-indefinite-singular":"hexametru","dative-definite-genitive-singular":"hexametrului","dative-genitive-indefinite-plural":"hexametri","dative-definite-genitive-plural":"hexametrilor","singular-vocative":"hexametrule","plural-vocative":"hexametrilor","alternative":"exametru"}},{"word":"hexan","pos":"noun","definitions":["hexane"],"forms":{"plural":"hexani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hexan","accusative-definite-nominative-singular":"hexanul","accusative-indefinite-nominative-plural":"hexani","accusative-definite-nominative-plural":"hexanii","dative-genitive-indefinite-singular":"hexan","dative-definite-genitive-singular":"hexanului","dative-genitive-indefinite-plural":"hexani","dative-definite-genitive-plural":"hexanilor","singular-vocative":"hexanule","plural-vocative":"hexanilor"}},{"word":"hexapod","pos":"adj","definitions":["hexapodous"],"forms":{"feminine-singular":"hexapodă","masculine-plural":"hexapozi","feminine-neuter-plural":"hexapode","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexapod","error-unrecognized-form-feminine-indefinite-singular":"hexapodă","error-unrecognized-form-indefinite-masculine-plural":"hexapozi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexapode","definite-error-unrecognized-form-masculine-neuter-singular":"hexapodul","definite-error-unrecognized-form-feminine-singular":"hexapoda","definite-error-unrecognized-form-masculine-plural":"hexapozii","definite-error-unrecognized-form-feminine-neuter-plural":"hexapodele"}},{"word":"hexastic","pos":"adj","definitions":["hexastic"],"forms":{"feminine-singular":"hexastică","masculine-plural":"hexastici","feminine-neuter-plural":"hexastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexastic","error-unrecognized-form-feminine-indefinite-singular":"hexastică","error-unrecognized-form-indefinite-masculine-plural":"hexastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexastice","definite-error-unrecognized-form-masculine-neuter-singular":"hexasticul","definite-error-unrecognized-form-feminine-singular":"hexastica","definite-error-unrecognized-form-masculine-plural":"hexasticii","definite-error-unrecognized-form-feminine-neuter-plural":"hexasticele"}},{"word":"hexastih","pos":"noun","definitions":["hexastich"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hexastih","accusative-definite-nominative":"hexastihul","dative-genitive-indefinite":"hexastih","dative-definite-genitive":"hexastihului","vocative":"hexastihule"}},{"word":"hexastil","pos":"noun","definitions":["hexastyle"],"forms":{"plural":"hexastiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hexastil","accusative-definite-nominative-singular":"hexastilul","accusative-indefinite-nominative-plural":"hexastiluri","accusative-definite-nominative-plural":"hexastilurile","dative-genitive-indefinite-singular":"hexastil","dative-definite-genitive-singular":"hexastilului","dative-genitive-indefinite-plural":"hexastiluri","dative-definite-genitive-plural":"hexastilurilor","singular-vocative":"hexastilule","plural-vocative":"hexastilurilor"}},{"word":"hexavalent","pos":"adj","definitions":["hexavalent"],"forms":{"feminine-singular":"hexavalentă","masculine-plural":"hexavalenți","feminine-neuter-plural":"hexavalente","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexavalent","error-unrecognized-form-feminine-indefinite-singular":"hexavalentă","error-unrecognized-form-indefinite-masculine-plural":"hexavalenți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexavalente","definite-error-unrecognized-form-masculine-neuter-singular":"hexavalentul","definite-error-unrecognized-form-feminine-singular":"hexavalenta","definite-error-unrecognized-form-masculine-plural":"hexavalenții","definite-error-unrecognized-form-feminine-neuter-plural":"hexavalentele"}},{"word":"hexazecimal","pos":"adj","definitions":["alternative form of hexadecimal"],"forms":{"feminine-singular":"hexazecimală","masculine-plural":"hexazecimali","feminine-neuter-plural":"hexazecimale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hexazecimal","error-unrecognized-form-feminine-indefinite-singular":"hexazecimală","error-unrecognized-form-indefinite-masculine-plural":"hexazecimali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hexazecimale","definite-error-unrecognized-form-masculine-neuter-singular":"hexazecimalul","definite-error-unrecognized-form-feminine-singular":"hexazecimala","definite-error-unrecognized-form-masculine-plural":"hexazecimalii","definite-error-unrecognized-form-feminine-neuter-plural":"hexazecimalele"}},{"word":"hexodă","pos":"noun","definitions":["hexode"],"forms":{"plural":"hexode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hexodă","accusative-definite-nominative-singular":"hexoda","accusative-indefinite-nominative-plural":"hexode","accusative-definite-nominative-plural":"hexodele","dative-genitive-indefinite-singular":"hexode","dative-definite-genitive-singular":"hexodei","dative-genitive-indefinite-plural":"hexode","dative-definite-genitive-plural":"hexodelor","singular-vocative":"hexodă","plural-vocative":"hexodelor"}},{"word":"hexoză","pos":"noun","definitions":["hexose"],"forms":{"plural":"hexoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hexoză","accusative-definite-nominative-singular":"hexoza","accusative-indefinite-nominative-plural":"hexoze","accusative-definite-nominative-plural":"hexozele","dative-genitive-indefinite-singular":"hexoze","dative-definite-genitive-singular":"hexozei","dative-genitive-indefinite-plural":"hexoze","dative-definite-genitive-plural":"hexozelor","singular-vocative":"hexoză","plural-vocative":"hexozelor"}},{"word":"Hezeriș","pos":"name","definitions":["a village in Coșteiu, Timiș County, Romania"],"gender":"m"},{"word":"hî","pos":"intj","definitions":["alternative form of hă"]},{"word":"hi-fi","pos":"adj","definitions":["hi-fi"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hi-fi","error-unrecognized-form-feminine-indefinite-singular":"hi-fi","error-unrecognized-form-indefinite-masculine-plural":"hi-fi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hi-fi","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"hiacint","pos":"noun","definitions":["alternative form of iacint"],"forms":{"plural":"hiacinți"}},{"word":"hialin","pos":"adj","definitions":["hyaline"],"forms":{"feminine-singular":"hialină","masculine-plural":"hialini","feminine-neuter-plural":"hialine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hialin","error-unrecognized-form-feminine-indefinite-singular":"hialină","error-unrecognized-form-indefinite-masculine-plural":"hialini","error-unrecognized-form-feminine-indefinite-neuter-plural":"hialine","definite-error-unrecognized-form-masculine-neuter-singular":"hialinul","definite-error-unrecognized-form-feminine-singular":"hialina","definite-error-unrecognized-form-masculine-plural":"hialinii","definite-error-unrecognized-form-feminine-neuter-plural":"hialinele"}},{"word":"hialinoză","pos":"noun","definitions":["hyalinosis"],"forms":{"plural":"hialinoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hialinoză","accusative-definite-nominative-singular":"hialinoza","accusative-indefinite-nominative-plural":"hialinoze","accusative-definite-nominative-plural":"hialinozele","dative-genitive-indefinite-singular":"hialinoze","dative-definite-genitive-singular":"hialinozei","dative-genitive-indefinite-plural":"hialinoze","dative-definite-genitive-plural":"hialinozelor","singular-vocative":"hialinoză","plural-vocative":"hialinozelor"}},{"word":"hialit","pos":"noun","definitions":["hyalite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hialit","accusative-definite-nominative":"hialitul","dative-genitive-indefinite":"hialit","dative-definite-genitive":"hialitului","vocative":"hialitule"}},{"word":"hialită","pos":"noun","definitions":["hyalitis"],"forms":{"plural":"hialite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hialită","accusative-definite-nominative-singular":"hialita","accusative-indefinite-nominative-plural":"hialite","accusative-definite-nominative-plural":"hialitele","dative-genitive-indefinite-singular":"hialite","dative-definite-genitive-singular":"hialitei","dative-genitive-indefinite-plural":"hialite","dative-definite-genitive-plural":"hialitelor","singular-vocative":"hialită","plural-vocative":"hialitelor"}},{"word":"hialograf","pos":"noun","definitions":["hyalograph"],"forms":{"plural":"hialografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hialograf","accusative-definite-nominative-singular":"hialograful","accusative-indefinite-nominative-plural":"hialografe","accusative-definite-nominative-plural":"hialografele","dative-genitive-indefinite-singular":"hialograf","dative-definite-genitive-singular":"hialografului","dative-genitive-indefinite-plural":"hialografe","dative-definite-genitive-plural":"hialografelor","singular-vocative":"hialografule","plural-vocative":"hialografelor"}},{"word":"hialografie","pos":"noun","definitions":["hyalography"],"forms":{"plural":"hialografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hialografie","accusative-definite-nominative-singular":"hialografia","accusative-indefinite-nominative-plural":"hialografii","accusative-definite-nominative-plural":"hialografiile","dative-genitive-indefinite-singular":"hialografii","dative-definite-genitive-singular":"hialografiei","dative-genitive-indefinite-plural":"hialografii","dative-definite-genitive-plural":"hialografiilor","singular-vocative":"hialografie","plural-vocative":"hialografiilor"}},{"word":"hialoid","pos":"adj","definitions":["hyaloid"],"forms":{"feminine-singular":"hialoidă","masculine-plural":"hialoizi","feminine-neuter-plural":"hialoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hialoid","error-unrecognized-form-feminine-indefinite-singular":"hialoidă","error-unrecognized-form-indefinite-masculine-plural":"hialoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hialoide","definite-error-unrecognized-form-masculine-neuter-singular":"hialoidul","definite-error-unrecognized-form-feminine-singular":"hialoida","definite-error-unrecognized-form-masculine-plural":"hialoizii","definite-error-unrecognized-form-feminine-neuter-plural":"hialoidele"}},{"word":"hialoplasmă","pos":"noun","definitions":["hyaloplasm"],"forms":{"plural":"hialoplasme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hialoplasmă","accusative-definite-nominative-singular":"hialoplasma","accusative-indefinite-nominative-plural":"hialoplasme","accusative-definite-nominative-plural":"hialoplasmele","dative-genitive-indefinite-singular":"hialoplasme","dative-definite-genitive-singular":"hialoplasmei","dative-genitive-indefinite-plural":"hialoplasme","dative-definite-genitive-plural":"hialoplasmelor","singular-vocative":"hialoplasmă","plural-vocative":"hialoplasmelor"}},{"word":"hiat","pos":"noun","definitions":["hiatus"],"forms":{"plural":"hiaturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hiat","accusative-definite-nominative-singular":"hiatul","accusative-indefinite-nominative-plural":"hiaturi","accusative-definite-nominative-plural":"hiaturile","dative-genitive-indefinite-singular":"hiat","dative-definite-genitive-singular":"hiatului","dative-genitive-indefinite-plural":"hiaturi","dative-definite-genitive-plural":"hiaturilor","singular-vocative":"hiatule","plural-vocative":"hiaturilor"}},{"word":"hiatus","pos":"noun","definitions":["alternative form of hiat"],"forms":{"plural":"hiatusuri"}},{"word":"hiba","pos":"noun","definitions":["definite nominative/accusative singular of hibă"],"pronunciation":"[ˈhiba]","gender":"f"},{"word":"hibă","pos":"noun","definitions":["fault, flaw"],"forms":{"plural":"hibe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hibă","accusative-definite-nominative-singular":"hiba","accusative-indefinite-nominative-plural":"hibe","accusative-definite-nominative-plural":"hibele","dative-genitive-indefinite-singular":"hibe","dative-definite-genitive-singular":"hibei","dative-genitive-indefinite-plural":"hibe","dative-definite-genitive-plural":"hibelor","singular-vocative":"hibă","plural-vocative":"hibelor"}},{"word":"hibaș","pos":"adj","definitions":["faulty"],"forms":{"feminine-singular":"hibașă","masculine-plural":"hibași","feminine-neuter-plural":"hibașe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hibaș","error-unrecognized-form-feminine-indefinite-singular":"hibașă","error-unrecognized-form-indefinite-masculine-plural":"hibași","error-unrecognized-form-feminine-indefinite-neuter-plural":"hibașe","definite-error-unrecognized-form-masculine-neuter-singular":"hibașul","definite-error-unrecognized-form-feminine-singular":"hibașa","definite-error-unrecognized-form-masculine-plural":"hibașii","definite-error-unrecognized-form-feminine-neuter-plural":"hibașele"}},{"word":"hibe","pos":"noun","definitions":["inflection of hibă:","indefinite plural","indefinite genitive/dative singular"],"pronunciation":"[ˈhibe]","gender":"f"},{"word":"hiberna","pos":"verb","definitions":["to hibernate"],"pronunciation":"/hi.berˈna/","forms":{"canonical":"a hiberna 1st conjugation","present-singular-third-person":"hibernează","participle-past":"hibernat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hiberna","gerund":"hibernând","first-person-indicative-present-singular":"hibernez","indicative-present-second-person-singular":"hibernezi","indicative-present-singular-third-person":"hibernează","first-person-indicative-plural-present":"hibernăm","indicative-plural-present-second-person":"hibernați","indicative-plural-present-third-person":"hibernează","first-person-imperfect-indicative-singular":"hibernam","imperfect-indicative-second-person-singular":"hibernai","imperfect-indicative-singular-third-person":"hiberna","first-person-imperfect-indicative-plural":"hibernam","imperfect-indicative-plural-second-person":"hibernați","imperfect-indicative-plural-third-person":"hibernau","first-person-indicative-perfect-singular":"hibernai","indicative-perfect-second-person-singular":"hibernași","indicative-perfect-singular-third-person":"hibernă","first-person-indicative-perfect-plural":"hibernarăm","indicative-perfect-plural-second-person":"hibernarăți","indicative-perfect-plural-third-person":"hibernară","first-person-indicative-pluperfect-singular":"hibernasem","indicative-pluperfect-second-person-singular":"hibernaseși","indicative-pluperfect-singular-third-person":"hibernase","first-person-indicative-pluperfect-plural":"hibernaserăm","indicative-pluperfect-plural-second-person":"hibernaserăți","indicative-pluperfect-plural-third-person":"hibernaseră","first-person-present-singular-subjunctive":"să hibernez","present-second-person-singular-subjunctive":"să hibernezi","present-singular-subjunctive-third-person":"să hiberneze","first-person-plural-present-subjunctive":"să hibernăm","plural-present-second-person-subjunctive":"să hibernați","plural-present-subjunctive-third-person":"să hiberneze","imperative-second-person-singular":"hibernează","imperative-plural-second-person":"hibernați","imperative-negative-second-person-singular":"nu hiberna","imperative-negative-plural-second-person":"nu hibernați"}},{"word":"hibernacul","pos":"noun","definitions":["hibernaculum"],"forms":{"plural":"hibernaculi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hibernacul","accusative-definite-nominative-singular":"hibernaculul","accusative-indefinite-nominative-plural":"hibernaculi","accusative-definite-nominative-plural":"hibernaculii","dative-genitive-indefinite-singular":"hibernacul","dative-definite-genitive-singular":"hibernaculului","dative-genitive-indefinite-plural":"hibernaculi","dative-definite-genitive-plural":"hibernaculilor","singular-vocative":"hibernaculule","plural-vocative":"hibernaculilor"}},{"word":"hibernai","pos":"verb","definitions":["inflection of hiberna:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[hiberˈnaj]"},{"word":"hibernal","pos":"adj","definitions":["hibernal"],"forms":{"feminine-singular":"hibernală","masculine-plural":"hibernali","feminine-neuter-plural":"hibernale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hibernal","error-unrecognized-form-feminine-indefinite-singular":"hibernală","error-unrecognized-form-indefinite-masculine-plural":"hibernali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hibernale","definite-error-unrecognized-form-masculine-neuter-singular":"hibernalul","definite-error-unrecognized-form-feminine-singular":"hibernala","definite-error-unrecognized-form-masculine-plural":"hibernalii","definite-error-unrecognized-form-feminine-neuter-plural":"hibernalele"}},{"word":"hibernam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of hiberna"],"pronunciation":"[hiberˈnam]"},{"word":"hibernant","pos":"adj","definitions":["hibernating"],"forms":{"feminine-singular":"hibernantă","masculine-plural":"hibernanți","feminine-neuter-plural":"hibernante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hibernant","error-unrecognized-form-feminine-indefinite-singular":"hibernantă","error-unrecognized-form-indefinite-masculine-plural":"hibernanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hibernante","definite-error-unrecognized-form-masculine-neuter-singular":"hibernantul","definite-error-unrecognized-form-feminine-singular":"hibernanta","definite-error-unrecognized-form-masculine-plural":"hibernanții","definite-error-unrecognized-form-feminine-neuter-plural":"hibernantele"}},{"word":"hibernare","pos":"noun","definitions":["hibernation"],"forms":{"plural":"hibernări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hibernare","accusative-definite-nominative-singular":"hibernarea","accusative-indefinite-nominative-plural":"hibernări","accusative-definite-nominative-plural":"hibernările","dative-genitive-indefinite-singular":"hibernări","dative-definite-genitive-singular":"hibernării","dative-genitive-indefinite-plural":"hibernări","dative-definite-genitive-plural":"hibernărilor","singular-vocative":"hibernare","plural-vocative":"hibernărilor"}},{"word":"hibernase","pos":"verb","definitions":["third-person singular pluperfect indicative of hiberna"],"pronunciation":"[hiberˈnase]"},{"word":"hibernat","pos":"verb","definitions":["past participle of hiberna"],"pronunciation":"[hiberˈnat]"},{"word":"hibernație","pos":"noun","definitions":["hibernation"],"forms":{"plural":"hibernații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hibernație","accusative-definite-nominative-singular":"hibernația","accusative-indefinite-nominative-plural":"hibernații","accusative-definite-nominative-plural":"hibernațiile","dative-genitive-indefinite-singular":"hibernații","dative-definite-genitive-singular":"hibernației","dative-genitive-indefinite-plural":"hibernații","dative-definite-genitive-plural":"hibernațiilor","singular-vocative":"hibernație","plural-vocative":"hibernațiilor"}},{"word":"hibernez","pos":"verb","definitions":["first-person singular present indicative/subjunctive of hiberna"],"pronunciation":"[hiberˈnez]"},{"word":"hibernoterapie","pos":"noun","definitions":["hibernotherapy"],"forms":{"plural":"hibernoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hibernoterapie","accusative-definite-nominative-singular":"hibernoterapia","accusative-indefinite-nominative-plural":"hibernoterapii","accusative-definite-nominative-plural":"hibernoterapiile","dative-genitive-indefinite-singular":"hibernoterapii","dative-definite-genitive-singular":"hibernoterapiei","dative-genitive-indefinite-plural":"hibernoterapii","dative-definite-genitive-plural":"hibernoterapiilor","singular-vocative":"hibernoterapie","plural-vocative":"hibernoterapiilor"}},{"word":"hibiscus","pos":"noun","definitions":["hibiscus (flowering plant)"],"forms":{"plural":"hibiscuși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hibiscus","accusative-definite-nominative-singular":"hibiscusul","accusative-indefinite-nominative-plural":"hibiscuși","accusative-definite-nominative-plural":"hibiscușii","dative-genitive-indefinite-singular":"hibiscus","dative-definite-genitive-singular":"hibiscusului","dative-genitive-indefinite-plural":"hibiscuși","dative-definite-genitive-plural":"hibiscușilor","singular-vocative":"hibiscusule","plural-vocative":"hibiscușilor"}},{"word":"hibo","pos":"noun","definitions":["vocative singular of hibă"],"pronunciation":"[ˈhibo]","gender":"f"},{"word":"hibrid","pos":"adj","definitions":["hybrid"],"forms":{"feminine-singular":"hibridă","masculine-plural":"hibrizi","feminine-neuter-plural":"hibride","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hibrid","error-unrecognized-form-feminine-indefinite-singular":"hibridă","error-unrecognized-form-indefinite-masculine-plural":"hibrizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hibride","definite-error-unrecognized-form-masculine-neuter-singular":"hibridul","definite-error-unrecognized-form-feminine-singular":"hibrida","definite-error-unrecognized-form-masculine-plural":"hibrizii","definite-error-unrecognized-form-feminine-neuter-plural":"hibridele"}},{"word":"hibrida","pos":"verb","definitions":["to hybridize"],"pronunciation":"/hi.briˈda/","forms":{"canonical":"a hibrida 1st conjugation","present-singular-third-person":"hibridează","participle-past":"hibridat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hibrida","gerund":"hibridând","first-person-indicative-present-singular":"hibridez","indicative-present-second-person-singular":"hibridezi","indicative-present-singular-third-person":"hibridează","first-person-indicative-plural-present":"hibridăm","indicative-plural-present-second-person":"hibridați","indicative-plural-present-third-person":"hibridează","first-person-imperfect-indicative-singular":"hibridam","imperfect-indicative-second-person-singular":"hibridai","imperfect-indicative-singular-third-person":"hibrida","first-person-imperfect-indicative-plural":"hibridam","imperfect-indicative-plural-second-person":"hibridați","imperfect-indicative-plural-third-person":"hibridau","first-person-indicative-perfect-singular":"hibridai","indicative-perfect-second-person-singular":"hibridași","indicative-perfect-singular-third-person":"hibridă","first-person-indicative-perfect-plural":"hibridarăm","indicative-perfect-plural-second-person":"hibridarăți","indicative-perfect-plural-third-person":"hibridară","first-person-indicative-pluperfect-singular":"hibridasem","indicative-pluperfect-second-person-singular":"hibridaseși","indicative-pluperfect-singular-third-person":"hibridase","first-person-indicative-pluperfect-plural":"hibridaserăm","indicative-pluperfect-plural-second-person":"hibridaserăți","indicative-pluperfect-plural-third-person":"hibridaseră","first-person-present-singular-subjunctive":"să hibridez","present-second-person-singular-subjunctive":"să hibridezi","present-singular-subjunctive-third-person":"să hibrideze","first-person-plural-present-subjunctive":"să hibridăm","plural-present-second-person-subjunctive":"să hibridați","plural-present-subjunctive-third-person":"să hibrideze","imperative-second-person-singular":"hibridează","imperative-plural-second-person":"hibridați","imperative-negative-second-person-singular":"nu hibrida","imperative-negative-plural-second-person":"nu hibridați"}},{"word":"hibridare","pos":"noun","definitions":["hybridization"],"forms":{"plural":"hibridări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hibridare","accusative-definite-nominative-singular":"hibridarea","accusative-indefinite-nominative-plural":"hibridări","accusative-definite-nominative-plural":"hibridările","dative-genitive-indefinite-singular":"hibridări","dative-definite-genitive-singular":"hibridării","dative-genitive-indefinite-plural":"hibridări","dative-definite-genitive-plural":"hibridărilor","singular-vocative":"hibridare","plural-vocative":"hibridărilor"}},{"word":"hibridație","pos":"noun","definitions":["hybridization"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hibridație","accusative-definite-nominative-singular":"hibridația","accusative-indefinite-nominative-plural":"hibridații","accusative-definite-nominative-plural":"hibridațiile","dative-genitive-indefinite-singular":"hibridații","dative-definite-genitive-singular":"hibridației","dative-genitive-indefinite-plural":"hibridații","dative-definite-genitive-plural":"hibridațiilor","singular-vocative":"hibridație","plural-vocative":"hibridațiilor"}},{"word":"hibriditate","pos":"noun","definitions":["hybridity"],"forms":{"plural":"hibridități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hibriditate","accusative-definite-nominative-singular":"hibriditatea","accusative-indefinite-nominative-plural":"hibridități","accusative-definite-nominative-plural":"hibriditățile","dative-genitive-indefinite-singular":"hibridități","dative-definite-genitive-singular":"hibridității","dative-genitive-indefinite-plural":"hibridități","dative-definite-genitive-plural":"hibridităților","singular-vocative":"hibriditate","plural-vocative":"hibridităților"}},{"word":"hibridiza","pos":"verb","definitions":["to hybridize"],"pronunciation":"/hi.bri.diˈza/","forms":{"canonical":"a hibridiza 1st conjugation","present-singular-third-person":"hibridizează","participle-past":"hibridizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hibridiza","gerund":"hibridizând","first-person-indicative-present-singular":"hibridizez","indicative-present-second-person-singular":"hibridizezi","indicative-present-singular-third-person":"hibridizează","first-person-indicative-plural-present":"hibridizăm","indicative-plural-present-second-person":"hibridizați","indicative-plural-present-third-person":"hibridizează","first-person-imperfect-indicative-singular":"hibridizam","imperfect-indicative-second-person-singular":"hibridizai","imperfect-indicative-singular-third-person":"hibridiza","first-person-imperfect-indicative-plural":"hibridizam","imperfect-indicative-plural-second-person":"hibridizați","imperfect-indicative-plural-third-person":"hibridizau","first-person-indicative-perfect-singular":"hibridizai","indicative-perfect-second-person-singular":"hibridizași","indicative-perfect-singular-third-person":"hibridiză","first-person-indicative-perfect-plural":"hibridizarăm","indicative-perfect-plural-second-person":"hibridizarăți","indicative-perfect-plural-third-person":"hibridizară","first-person-indicative-pluperfect-singular":"hibridizasem","indicative-pluperfect-second-person-singular":"hibridizaseși","indicative-pluperfect-singular-third-person":"hibridizase","first-person-indicative-pluperfect-plural":"hibridizaserăm","indicative-pluperfect-plural-second-person":"hibridizaserăți","indicative-pluperfect-plural-third-person":"hibridizaseră","first-person-present-singular-subjunctive":"să hibridizez","present-second-person-singular-subjunctive":"să hibridizezi","present-singular-subjunctive-third-person":"să hibridizeze","first-person-plural-present-subjunctive":"să hibridizăm","plural-present-second-person-subjunctive":"să hibridizați","plural-present-subjunctive-third-person":"să hibridizeze","imperative-second-person-singular":"hibridizează","imperative-plural-second-person":"hibridizați","imperative-negative-second-person-singular":"nu hibridiza","imperative-negative-plural-second-person":"nu hibridizați"}},{"word":"hibridizare","pos":"noun","definitions":["hybridization"],"forms":{"plural":"hibridizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hibridizare","accusative-definite-nominative-singular":"hibridizarea","accusative-indefinite-nominative-plural":"hibridizări","accusative-definite-nominative-plural":"hibridizările","dative-genitive-indefinite-singular":"hibridizări","dative-definite-genitive-singular":"hibridizării","dative-genitive-indefinite-plural":"hibridizări","dative-definite-genitive-plural":"hibridizărilor","singular-vocative":"hibridizare","plural-vocative":"hibridizărilor"}},{"word":"hiclean","pos":"adj","definitions":["alternative form of viclean"],"forms":{"feminine-singular":"hicleană","masculine-plural":"hicleni","feminine-neuter-plural":"hiclene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiclean","error-unrecognized-form-feminine-indefinite-singular":"hicleană","error-unrecognized-form-indefinite-masculine-plural":"hicleni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiclene","definite-error-unrecognized-form-masculine-neuter-singular":"hicleanul","definite-error-unrecognized-form-feminine-singular":"hicleana","definite-error-unrecognized-form-masculine-plural":"hiclenii","definite-error-unrecognized-form-feminine-neuter-plural":"hiclenele"}},{"word":"hiclenie","pos":"noun","definitions":["slyness"],"forms":{"plural":"hiclenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiclenie","accusative-definite-nominative-singular":"hiclenia","accusative-indefinite-nominative-plural":"hiclenii","accusative-definite-nominative-plural":"hicleniile","dative-genitive-indefinite-singular":"hiclenii","dative-definite-genitive-singular":"hicleniei","dative-genitive-indefinite-plural":"hiclenii","dative-definite-genitive-plural":"hicleniilor","singular-vocative":"hiclenie","plural-vocative":"hicleniilor"}},{"word":"hicori","pos":"noun","definitions":["hickory"],"forms":{"plural":"hicori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hicori","accusative-definite-nominative-singular":"hicoriul","accusative-indefinite-nominative-plural":"hicori","accusative-definite-nominative-plural":"hicorii","dative-genitive-indefinite-singular":"hicori","dative-definite-genitive-singular":"hicoriului","dative-genitive-indefinite-plural":"hicori","dative-definite-genitive-plural":"hicorilor","singular-vocative":"hicoriule","plural-vocative":"hicorilor"}},{"word":"hicsos","pos":"noun","definitions":["Hyksos"],"forms":{"plural":"hicsoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hicsos","accusative-definite-nominative-singular":"hicsosul","accusative-indefinite-nominative-plural":"hicsoși","accusative-definite-nominative-plural":"hicsoșii","dative-genitive-indefinite-singular":"hicsos","dative-definite-genitive-singular":"hicsosului","dative-genitive-indefinite-plural":"hicsoși","dative-definite-genitive-plural":"hicsoșilor","singular-vocative":"hicsosule","plural-vocative":"hicsoșilor"}},{"word":"Hida","pos":"name","definitions":["a commune of Sălaj County, Romania","a village in Hida, Sălaj County, Romania"],"gender":"f"},{"word":"hidalgie","pos":"noun","definitions":["the state of being an hidalgo"],"forms":{"plural":"hidalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidalgie","accusative-definite-nominative-singular":"hidalgia","accusative-indefinite-nominative-plural":"hidalgii","accusative-definite-nominative-plural":"hidalgiile","dative-genitive-indefinite-singular":"hidalgii","dative-definite-genitive-singular":"hidalgiei","dative-genitive-indefinite-plural":"hidalgii","dative-definite-genitive-plural":"hidalgiilor","singular-vocative":"hidalgie","plural-vocative":"hidalgiilor"}},{"word":"hidalgo","pos":"noun","definitions":["hidalgo"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hidalgo","accusative-definite-nominative":"hidalgoul","dative-genitive-indefinite":"hidalgo","dative-definite-genitive":"hidalgoului","vocative":"hidalgoule"}},{"word":"hidartroză","pos":"noun","definitions":["hydrarthrosis"],"forms":{"plural":"hidartroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidartroză","accusative-definite-nominative-singular":"hidartroza","accusative-indefinite-nominative-plural":"hidartroze","accusative-definite-nominative-plural":"hidartrozele","dative-genitive-indefinite-singular":"hidartroze","dative-definite-genitive-singular":"hidartrozei","dative-genitive-indefinite-plural":"hidartroze","dative-definite-genitive-plural":"hidartrozelor","singular-vocative":"hidartroză","plural-vocative":"hidartrozelor"}},{"word":"hidatic","pos":"adj","definitions":["hydatic"],"forms":{"feminine-singular":"hidatică","masculine-plural":"hidatici","feminine-neuter-plural":"hidatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidatic","error-unrecognized-form-feminine-indefinite-singular":"hidatică","error-unrecognized-form-indefinite-masculine-plural":"hidatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidatice","definite-error-unrecognized-form-masculine-neuter-singular":"hidaticul","definite-error-unrecognized-form-feminine-singular":"hidatica","definite-error-unrecognized-form-masculine-plural":"hidaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidaticele"}},{"word":"hidatidă","pos":"noun","definitions":["hydatid"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidatidă","accusative-definite-nominative-singular":"hidatida","accusative-indefinite-nominative-plural":"hidatide","accusative-definite-nominative-plural":"hidatidele","dative-genitive-indefinite-singular":"hidatide","dative-definite-genitive-singular":"hidatidei","dative-genitive-indefinite-plural":"hidatide","dative-definite-genitive-plural":"hidatidelor","singular-vocative":"hidatidă","plural-vocative":"hidatidelor"}},{"word":"hidatidoză","pos":"noun","definitions":["hydatidosis"],"forms":{"plural":"hidatidoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidatidoză","accusative-definite-nominative-singular":"hidatidoza","accusative-indefinite-nominative-plural":"hidatidoze","accusative-definite-nominative-plural":"hidatidozele","dative-genitive-indefinite-singular":"hidatidoze","dative-definite-genitive-singular":"hidatidozei","dative-genitive-indefinite-plural":"hidatidoze","dative-definite-genitive-plural":"hidatidozelor","singular-vocative":"hidatidoză","plural-vocative":"hidatidozelor"}},{"word":"hidatioză","pos":"noun","definitions":["hydatidosis"],"forms":{"plural":"hidatioze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidatioză","accusative-definite-nominative-singular":"hidatioza","accusative-indefinite-nominative-plural":"hidatioze","accusative-definite-nominative-plural":"hidatiozele","dative-genitive-indefinite-singular":"hidatioze","dative-definite-genitive-singular":"hidatiozei","dative-genitive-indefinite-plural":"hidatioze","dative-definite-genitive-plural":"hidatiozelor","singular-vocative":"hidatioză","plural-vocative":"hidatiozelor"}},{"word":"hidatodă","pos":"noun","definitions":["hydatode"],"forms":{"plural":"hidatode","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidatodă","accusative-definite-nominative-singular":"hidatoda","accusative-indefinite-nominative-plural":"hidatode","accusative-definite-nominative-plural":"hidatodele","dative-genitive-indefinite-singular":"hidatode","dative-definite-genitive-singular":"hidatodei","dative-genitive-indefinite-plural":"hidatode","dative-definite-genitive-plural":"hidatodelor","singular-vocative":"hidatodă","plural-vocative":"hidatodelor"}},{"word":"Hideaga","pos":"name","definitions":["a village in Satulung, Maramureș County, Romania"],"gender":"f"},{"word":"Hideg","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Drăgan"],"gender":"m"},{"word":"Hidegviz","pos":"name","definitions":["a river in Harghita, Romania, tributary to the Olt"],"gender":"m"},{"word":"Hididel","pos":"name","definitions":["a river in Caraș-Severin, Romania, tributary to the Rece"],"gender":"m"},{"word":"Hidiș","pos":"name","definitions":["a village in Pomezeu, Bihor County, Romania"],"gender":"m"},{"word":"Hidișel","pos":"name","definitions":["a village in Dobrești, Bihor County, Romania"],"gender":"m"},{"word":"Hidișelu de Jos","pos":"name","definitions":["a village in Hidișelu de Sus, Bihor County, Romania"],"gender":"m"},{"word":"Hidișelu de Sus","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Hidișelu de Sus, Bihor County, Romania"],"gender":"m"},{"word":"hidos","pos":"adj","definitions":["hideous"],"forms":{"feminine-singular":"hidoasă","masculine-plural":"hidoși","feminine-neuter-plural":"hidoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidos","error-unrecognized-form-feminine-indefinite-singular":"hidoasă","error-unrecognized-form-indefinite-masculine-plural":"hidoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidoase","definite-error-unrecognized-form-masculine-neuter-singular":"hidosul","definite-error-unrecognized-form-feminine-singular":"hidoasa","definite-error-unrecognized-form-masculine-plural":"hidoșii","definite-error-unrecognized-form-feminine-neuter-plural":"hidoasele"}},{"word":"hidoșenie","pos":"noun","definitions":["ugliness"],"forms":{"plural":"hidoșenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidoșenie","accusative-definite-nominative-singular":"hidoșenia","accusative-indefinite-nominative-plural":"hidoșenii","accusative-definite-nominative-plural":"hidoșeniile","dative-genitive-indefinite-singular":"hidoșenii","dative-definite-genitive-singular":"hidoșeniei","dative-genitive-indefinite-plural":"hidoșenii","dative-definite-genitive-plural":"hidoșeniilor","singular-vocative":"hidoșenie","plural-vocative":"hidoșeniilor"}},{"word":"hidră","pos":"noun","definitions":["hydra"],"forms":{"plural":"hidre","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidră","accusative-definite-nominative-singular":"hidra","accusative-indefinite-nominative-plural":"hidre","accusative-definite-nominative-plural":"hidrele","dative-genitive-indefinite-singular":"hidre","dative-definite-genitive-singular":"hidrei","dative-genitive-indefinite-plural":"hidre","dative-definite-genitive-plural":"hidrelor","singular-vocative":"hidră","plural-vocative":"hidrelor"}},{"word":"hidracid","pos":"noun","definitions":["hydracid"],"forms":{"plural":"hidracizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidracid","accusative-definite-nominative-singular":"hidracidul","accusative-indefinite-nominative-plural":"hidracizi","accusative-definite-nominative-plural":"hidracizii","dative-genitive-indefinite-singular":"hidracid","dative-definite-genitive-singular":"hidracidului","dative-genitive-indefinite-plural":"hidracizi","dative-definite-genitive-plural":"hidracizilor","singular-vocative":"hidracidule","plural-vocative":"hidracizilor"}},{"word":"hidradenom","pos":"noun","definitions":["hidradenoma"],"forms":{"plural":"hidradenoame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidradenom","accusative-definite-nominative-singular":"hidradenomul","accusative-indefinite-nominative-plural":"hidradenoame","accusative-definite-nominative-plural":"hidradenoamele","dative-genitive-indefinite-singular":"hidradenom","dative-definite-genitive-singular":"hidradenomului","dative-genitive-indefinite-plural":"hidradenoame","dative-definite-genitive-plural":"hidradenoamelor","singular-vocative":"hidradenomule","plural-vocative":"hidradenoamelor"}},{"word":"hidragog","pos":"noun","definitions":["hydragogue"],"forms":{"plural":"hidragogi","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidragog","accusative-definite-nominative-singular":"hidragogul","accusative-indefinite-nominative-plural":"hidragogi","accusative-definite-nominative-plural":"hidragogile","dative-genitive-indefinite-singular":"hidragog","dative-definite-genitive-singular":"hidragogului","dative-genitive-indefinite-plural":"hidragogi","dative-definite-genitive-plural":"hidragogilor","singular-vocative":"hidragogule","plural-vocative":"hidragogilor"}},{"word":"hidramnios","pos":"noun","definitions":["hydramnios"],"forms":{"plural":"hidramniosuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidramnios","accusative-definite-nominative-singular":"hidramniosul","accusative-indefinite-nominative-plural":"hidramniosuri","accusative-definite-nominative-plural":"hidramniosurile","dative-genitive-indefinite-singular":"hidramnios","dative-definite-genitive-singular":"hidramniosului","dative-genitive-indefinite-plural":"hidramniosuri","dative-definite-genitive-plural":"hidramniosurilor","singular-vocative":"hidramniosule","plural-vocative":"hidramniosurilor"}},{"word":"hidrant","pos":"noun","definitions":["hydrant"],"forms":{"plural":"hidrante","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrant","accusative-definite-nominative-singular":"hidrantul","accusative-indefinite-nominative-plural":"hidrante","accusative-definite-nominative-plural":"hidrantele","dative-genitive-indefinite-singular":"hidrant","dative-definite-genitive-singular":"hidrantului","dative-genitive-indefinite-plural":"hidrante","dative-definite-genitive-plural":"hidrantelor","singular-vocative":"hidrantule","plural-vocative":"hidrantelor"}},{"word":"hidrargilit","pos":"noun","definitions":["hydrargyllite"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrargilit","accusative-definite-nominative-singular":"hidrargilitul","accusative-indefinite-nominative-plural":"hidrargiliti","accusative-definite-nominative-plural":"hidrargilitii","dative-genitive-indefinite-singular":"hidrargilit","dative-definite-genitive-singular":"hidrargilitului","dative-genitive-indefinite-plural":"hidrargiliti","dative-definite-genitive-plural":"hidrargilitilor","singular-vocative":"hidrargilitule","plural-vocative":"hidrargilitilor"}},{"word":"hidrargir","pos":"noun","definitions":["mercury"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hidrargir","accusative-definite-nominative":"hidrargirul","dative-genitive-indefinite":"hidrargir","dative-definite-genitive":"hidrargirului","vocative":"hidrargirule"}},{"word":"hidrargirism","pos":"noun","definitions":["hydrargyrism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrargirism","accusative-definite-nominative-singular":"hidrargirismul","accusative-indefinite-nominative-plural":"hidrargirisme","accusative-definite-nominative-plural":"hidrargirismele","dative-genitive-indefinite-singular":"hidrargirism","dative-definite-genitive-singular":"hidrargirismului","dative-genitive-indefinite-plural":"hidrargirisme","dative-definite-genitive-plural":"hidrargirismelor","singular-vocative":"hidrargirismule","plural-vocative":"hidrargirismelor"}},{"word":"hidrargiroză","pos":"noun","definitions":["hydrargyrosis"],"forms":{"plural":"hidrargiroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrargiroză","accusative-definite-nominative-singular":"hidrargiroza","accusative-indefinite-nominative-plural":"hidrargiroze","accusative-definite-nominative-plural":"hidrargirozele","dative-genitive-indefinite-singular":"hidrargiroze","dative-definite-genitive-singular":"hidrargirozei","dative-genitive-indefinite-plural":"hidrargiroze","dative-definite-genitive-plural":"hidrargirozelor","singular-vocative":"hidrargiroză","plural-vocative":"hidrargirozelor"}},{"word":"hidrat","pos":"noun","definitions":["hydrate"],"forms":{"plural":"hidrați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrat","accusative-definite-nominative-singular":"hidratul","accusative-indefinite-nominative-plural":"hidrați","accusative-definite-nominative-plural":"hidrații","dative-genitive-indefinite-singular":"hidrat","dative-definite-genitive-singular":"hidratului","dative-genitive-indefinite-plural":"hidrați","dative-definite-genitive-plural":"hidraților","singular-vocative":"hidratule","plural-vocative":"hidraților"}},{"word":"hidrat de carbon","pos":"noun","definitions":["carbohydrate"]},{"word":"hidrata","pos":"verb","definitions":["to moisturize, hydrate"],"forms":{"canonical":"a hidrata 1st conjugation","present-singular-third-person":"hidratează","participle-past":"hidratat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidrata","gerund":"hidratând","first-person-indicative-present-singular":"hidratez","indicative-present-second-person-singular":"hidratezi","indicative-present-singular-third-person":"hidratează","first-person-indicative-plural-present":"hidratăm","indicative-plural-present-second-person":"hidratați","indicative-plural-present-third-person":"hidratează","first-person-imperfect-indicative-singular":"hidratam","imperfect-indicative-second-person-singular":"hidratai","imperfect-indicative-singular-third-person":"hidrata","first-person-imperfect-indicative-plural":"hidratam","imperfect-indicative-plural-second-person":"hidratați","imperfect-indicative-plural-third-person":"hidratau","first-person-indicative-perfect-singular":"hidratai","indicative-perfect-second-person-singular":"hidratași","indicative-perfect-singular-third-person":"hidrată","first-person-indicative-perfect-plural":"hidratarăm","indicative-perfect-plural-second-person":"hidratarăți","indicative-perfect-plural-third-person":"hidratară","first-person-indicative-pluperfect-singular":"hidratasem","indicative-pluperfect-second-person-singular":"hidrataseși","indicative-pluperfect-singular-third-person":"hidratase","first-person-indicative-pluperfect-plural":"hidrataserăm","indicative-pluperfect-plural-second-person":"hidrataserăți","indicative-pluperfect-plural-third-person":"hidrataseră","first-person-present-singular-subjunctive":"să hidratez","present-second-person-singular-subjunctive":"să hidratezi","present-singular-subjunctive-third-person":"să hidrateze","first-person-plural-present-subjunctive":"să hidratăm","plural-present-second-person-subjunctive":"să hidratați","plural-present-subjunctive-third-person":"să hidrateze","imperative-second-person-singular":"hidratează","imperative-plural-second-person":"hidratați","imperative-negative-second-person-singular":"nu hidrata","imperative-negative-plural-second-person":"nu hidratați"}},{"word":"hidratabil","pos":"adj","definitions":["hydratable"],"forms":{"feminine-singular":"hidratabilă","masculine-plural":"hidratabili","feminine-neuter-plural":"hidratabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidratabil","error-unrecognized-form-feminine-indefinite-singular":"hidratabilă","error-unrecognized-form-indefinite-masculine-plural":"hidratabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidratabile","definite-error-unrecognized-form-masculine-neuter-singular":"hidratabilul","definite-error-unrecognized-form-feminine-singular":"hidratabila","definite-error-unrecognized-form-masculine-plural":"hidratabilii","definite-error-unrecognized-form-feminine-neuter-plural":"hidratabilele"}},{"word":"hidratant","pos":"adj","definitions":["moisturizing"],"forms":{"feminine-singular":"hidratantă","masculine-plural":"hidratanți","feminine-neuter-plural":"hidratante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidratant","error-unrecognized-form-feminine-indefinite-singular":"hidratantă","error-unrecognized-form-indefinite-masculine-plural":"hidratanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidratante","definite-error-unrecognized-form-masculine-neuter-singular":"hidratantul","definite-error-unrecognized-form-feminine-singular":"hidratanta","definite-error-unrecognized-form-masculine-plural":"hidratanții","definite-error-unrecognized-form-feminine-neuter-plural":"hidratantele"}},{"word":"hidratare","pos":"noun","definitions":["hydration"],"forms":{"plural":"hidratări"}},{"word":"hidratat","pos":"adj","definitions":["hydrated"],"forms":{"feminine-singular":"hidratată","masculine-plural":"hidratați","feminine-neuter-plural":"hidratate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidratat","error-unrecognized-form-feminine-indefinite-singular":"hidratată","error-unrecognized-form-indefinite-masculine-plural":"hidratați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidratate","definite-error-unrecognized-form-masculine-neuter-singular":"hidratatul","definite-error-unrecognized-form-feminine-singular":"hidratata","definite-error-unrecognized-form-masculine-plural":"hidratații","definite-error-unrecognized-form-feminine-neuter-plural":"hidratatele"}},{"word":"hidrați","pos":"noun","definitions":["plural of hidrat"],"pronunciation":"/hidˈratsʲ/","gender":"m-p"},{"word":"hidraulic","pos":"adj","definitions":["hydraulic"],"forms":{"feminine-singular":"hidraulică","masculine-plural":"hidraulici","feminine-neuter-plural":"hidraulice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidraulic","error-unrecognized-form-feminine-indefinite-singular":"hidraulică","error-unrecognized-form-indefinite-masculine-plural":"hidraulici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidraulice","definite-error-unrecognized-form-masculine-neuter-singular":"hidraulicul","definite-error-unrecognized-form-feminine-singular":"hidraulica","definite-error-unrecognized-form-masculine-plural":"hidraulicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidraulicele"}},{"word":"hidraulică","pos":"noun","definitions":["hydraulics"],"forms":{"plural":"hidraulici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidraulică","accusative-definite-nominative-singular":"hidraulica","accusative-indefinite-nominative-plural":"hidraulici","accusative-definite-nominative-plural":"hidraulicile","dative-genitive-indefinite-singular":"hidraulici","dative-definite-genitive-singular":"hidraulicii","dative-genitive-indefinite-plural":"hidraulici","dative-definite-genitive-plural":"hidraulicilor","singular-vocative":"hidraulică","plural-vocative":"hidraulicilor"}},{"word":"hidrazidă","pos":"noun","definitions":["hydrazide"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrazidă","accusative-definite-nominative-singular":"hidrazida","accusative-indefinite-nominative-plural":"hidrazide","accusative-definite-nominative-plural":"hidrazidele","dative-genitive-indefinite-singular":"hidrazide","dative-definite-genitive-singular":"hidrazidei","dative-genitive-indefinite-plural":"hidrazide","dative-definite-genitive-plural":"hidrazidelor","singular-vocative":"hidrazidă","plural-vocative":"hidrazidelor"}},{"word":"hidrazină","pos":"noun","definitions":["hydrazine"],"forms":{"plural":"hidrazine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrazină","accusative-definite-nominative-singular":"hidrazina","accusative-indefinite-nominative-plural":"hidrazine","accusative-definite-nominative-plural":"hidrazinele","dative-genitive-indefinite-singular":"hidrazine","dative-definite-genitive-singular":"hidrazinei","dative-genitive-indefinite-plural":"hidrazine","dative-definite-genitive-plural":"hidrazinelor","singular-vocative":"hidrazină","plural-vocative":"hidrazinelor"}},{"word":"hidrazobenzen","pos":"noun","definitions":["hydrazobenzene"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hidrazobenzen","accusative-definite-nominative":"hidrazobenzenul","dative-genitive-indefinite":"hidrazobenzen","dative-definite-genitive":"hidrazobenzenului","vocative":"hidrazobenzenule"}},{"word":"hidrazonă","pos":"noun","definitions":["hydrazone"],"forms":{"plural":"hidrazone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrazonă","accusative-definite-nominative-singular":"hidrazona","accusative-indefinite-nominative-plural":"hidrazone","accusative-definite-nominative-plural":"hidrazonele","dative-genitive-indefinite-singular":"hidrazone","dative-definite-genitive-singular":"hidrazonei","dative-genitive-indefinite-plural":"hidrazone","dative-definite-genitive-plural":"hidrazonelor","singular-vocative":"hidrazonă","plural-vocative":"hidrazonelor"}},{"word":"hidremie","pos":"noun","definitions":["hydremia"],"forms":{"plural":"hidremii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidremie","accusative-definite-nominative-singular":"hidremia","accusative-indefinite-nominative-plural":"hidremii","accusative-definite-nominative-plural":"hidremiile","dative-genitive-indefinite-singular":"hidremii","dative-definite-genitive-singular":"hidremiei","dative-genitive-indefinite-plural":"hidremii","dative-definite-genitive-plural":"hidremiilor","singular-vocative":"hidremie","plural-vocative":"hidremiilor"}},{"word":"hidriatrie","pos":"noun","definitions":["hydriatry, hydrotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hidriatrie","accusative-definite-nominative":"hidriatria","dative-genitive-indefinite":"hidriatrii","dative-definite-genitive":"hidriatriei","vocative":"hidriatrie"}},{"word":"hidric","pos":"adj","definitions":["hydric"],"forms":{"feminine-singular":"hidrică","masculine-plural":"hidrici","feminine-neuter-plural":"hidrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidric","error-unrecognized-form-feminine-indefinite-singular":"hidrică","error-unrecognized-form-indefinite-masculine-plural":"hidrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrice","definite-error-unrecognized-form-masculine-neuter-singular":"hidricul","definite-error-unrecognized-form-feminine-singular":"hidrica","definite-error-unrecognized-form-masculine-plural":"hidricii","definite-error-unrecognized-form-feminine-neuter-plural":"hidricele"}},{"word":"hidrie","pos":"noun","definitions":["hydria"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hidrie","accusative-definite-nominative":"hidria","dative-genitive-indefinite":"hidrii","dative-definite-genitive":"hidriei","vocative":"hidrie"}},{"word":"hidroacustic","pos":"adj","definitions":["hydroacoustic"],"forms":{"feminine-singular":"hidroacustică","masculine-plural":"hidroacustici","feminine-neuter-plural":"hidroacustice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroacustic","error-unrecognized-form-feminine-indefinite-singular":"hidroacustică","error-unrecognized-form-indefinite-masculine-plural":"hidroacustici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroacustice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroacusticul","definite-error-unrecognized-form-feminine-singular":"hidroacustica","definite-error-unrecognized-form-masculine-plural":"hidroacusticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroacusticele"}},{"word":"hidroacustică","pos":"noun","definitions":["hydroacoustics"],"forms":{"plural":"hidroacustici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidroacustică","accusative-definite-nominative-singular":"hidroacustica","accusative-indefinite-nominative-plural":"hidroacustici","accusative-definite-nominative-plural":"hidroacusticile","dative-genitive-indefinite-singular":"hidroacustici","dative-definite-genitive-singular":"hidroacusticii","dative-genitive-indefinite-plural":"hidroacustici","dative-definite-genitive-plural":"hidroacusticilor","singular-vocative":"hidroacustică","plural-vocative":"hidroacusticilor"}},{"word":"hidroamelioratoare","pos":"noun","definitions":["female equivalent of hidroameliorator"],"forms":{"plural":"hidroamelioratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hidroamelioratoare","accusative-definite-nominative-singular":"hidroamelioratoarea","accusative-indefinite-nominative-plural":"hidroamelioratoare","accusative-definite-nominative-plural":"hidroamelioratoarele","dative-genitive-indefinite-singular":"hidroamelioratoare","dative-definite-genitive-singular":"hidroamelioratoarei","dative-genitive-indefinite-plural":"hidroamelioratoare","dative-definite-genitive-plural":"hidroamelioratoarelor","singular-vocative":"hidroamelioratoare","plural-vocative":"hidroamelioratoarelor"}},{"word":"hidroameliorator","pos":"noun","definitions":["hydro-ameliorator"],"forms":{"plural":"hidroamelioratori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroameliorator","accusative-definite-nominative-singular":"hidroamelioratorul","accusative-indefinite-nominative-plural":"hidroamelioratori","accusative-definite-nominative-plural":"hidroamelioratorii","dative-genitive-indefinite-singular":"hidroameliorator","dative-definite-genitive-singular":"hidroamelioratorului","dative-genitive-indefinite-plural":"hidroamelioratori","dative-definite-genitive-plural":"hidroamelioratorilor","singular-vocative":"hidroamelioratorule","plural-vocative":"hidroamelioratorilor"}},{"word":"hidroaviație","pos":"noun","definitions":["hydroaviation"],"forms":{"plural":"hidroaviații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidroaviație","accusative-definite-nominative-singular":"hidroaviația","accusative-indefinite-nominative-plural":"hidroaviații","accusative-definite-nominative-plural":"hidroaviațiile","dative-genitive-indefinite-singular":"hidroaviații","dative-definite-genitive-singular":"hidroaviației","dative-genitive-indefinite-plural":"hidroaviații","dative-definite-genitive-plural":"hidroaviațiilor","singular-vocative":"hidroaviație","plural-vocative":"hidroaviațiilor"}}];
@@ -0,0 +1 @@
+export default [{"word":"hidroavion","pos":"noun","definitions":["hydroplane"],"forms":{"plural":"hidroavioane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidroavion","accusative-definite-nominative-singular":"hidroavionul","accusative-indefinite-nominative-plural":"hidroavioane","accusative-definite-nominative-plural":"hidroavioanele","dative-genitive-indefinite-singular":"hidroavion","dative-definite-genitive-singular":"hidroavionului","dative-genitive-indefinite-plural":"hidroavioane","dative-definite-genitive-plural":"hidroavioanelor","singular-vocative":"hidroavionule","plural-vocative":"hidroavioanelor"}},{"word":"hidrobază","pos":"noun","definitions":["hydrobase"],"forms":{"plural":"hidrobaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrobază","accusative-definite-nominative-singular":"hidrobaza","accusative-indefinite-nominative-plural":"hidrobaze","accusative-definite-nominative-plural":"hidrobazele","dative-genitive-indefinite-singular":"hidrobaze","dative-definite-genitive-singular":"hidrobazei","dative-genitive-indefinite-plural":"hidrobaze","dative-definite-genitive-plural":"hidrobazelor","singular-vocative":"hidrobază","plural-vocative":"hidrobazelor"}},{"word":"hidrobicicletă","pos":"noun","definitions":["pedalo"],"forms":{"plural":"hidrobiciclete","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrobicicletă","accusative-definite-nominative-singular":"hidrobicicleta","accusative-indefinite-nominative-plural":"hidrobiciclete","accusative-definite-nominative-plural":"hidrobicicletele","dative-genitive-indefinite-singular":"hidrobiciclete","dative-definite-genitive-singular":"hidrobicicletei","dative-genitive-indefinite-plural":"hidrobiciclete","dative-definite-genitive-plural":"hidrobicicletelor","singular-vocative":"hidrobicicletă","plural-vocative":"hidrobicicletelor"}},{"word":"hidrobiolog","pos":"noun","definitions":["hydrobiologist"],"forms":{"plural":"hidrobiologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrobiolog","accusative-definite-nominative-singular":"hidrobiologul","accusative-indefinite-nominative-plural":"hidrobiologi","accusative-definite-nominative-plural":"hidrobiologii","dative-genitive-indefinite-singular":"hidrobiolog","dative-definite-genitive-singular":"hidrobiologului","dative-genitive-indefinite-plural":"hidrobiologi","dative-definite-genitive-plural":"hidrobiologilor","singular-vocative":"hidrobiologule","plural-vocative":"hidrobiologilor"}},{"word":"hidrobiologă","pos":"noun","definitions":["female equivalent of hidrobiolog"],"forms":{"plural":"hidrobiologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrobiologă","accusative-definite-nominative-singular":"hidrobiologa","accusative-indefinite-nominative-plural":"hidrobiologe","accusative-definite-nominative-plural":"hidrobiologele","dative-genitive-indefinite-singular":"hidrobiologe","dative-definite-genitive-singular":"hidrobiologei","dative-genitive-indefinite-plural":"hidrobiologe","dative-definite-genitive-plural":"hidrobiologelor","singular-vocative":"hidrobiologă","plural-vocative":"hidrobiologelor"}},{"word":"hidrobiologic","pos":"adj","definitions":["hydrobiological"],"forms":{"feminine-singular":"hidrobiologică","masculine-plural":"hidrobiologici","feminine-neuter-plural":"hidrobiologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrobiologic","error-unrecognized-form-feminine-indefinite-singular":"hidrobiologică","error-unrecognized-form-indefinite-masculine-plural":"hidrobiologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrobiologice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrobiologicul","definite-error-unrecognized-form-feminine-singular":"hidrobiologica","definite-error-unrecognized-form-masculine-plural":"hidrobiologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrobiologicele"}},{"word":"hidrobiologie","pos":"noun","definitions":["hydrobiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrobiologie","accusative-definite-nominative-singular":"hidrobiologia","accusative-indefinite-nominative-plural":"hidrobiologii","accusative-definite-nominative-plural":"hidrobiologiile","dative-genitive-indefinite-singular":"hidrobiologii","dative-definite-genitive-singular":"hidrobiologiei","dative-genitive-indefinite-plural":"hidrobiologii","dative-definite-genitive-plural":"hidrobiologiilor","singular-vocative":"hidrobiologie","plural-vocative":"hidrobiologiilor"}},{"word":"hidrobuz","pos":"noun","definitions":["water bus"],"forms":{"plural":"hidrobuze","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrobuz","accusative-definite-nominative-singular":"hidrobuzul","accusative-indefinite-nominative-plural":"hidrobuze","accusative-definite-nominative-plural":"hidrobuzele","dative-genitive-indefinite-singular":"hidrobuz","dative-definite-genitive-singular":"hidrobuzului","dative-genitive-indefinite-plural":"hidrobuze","dative-definite-genitive-plural":"hidrobuzelor","singular-vocative":"hidrobuzule","plural-vocative":"hidrobuzelor"}},{"word":"hidrocarbonat","pos":"noun","definitions":["hydrocarbonate"],"forms":{"plural":"hidrocarbonați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrocarbonat","accusative-definite-nominative-singular":"hidrocarbonatul","accusative-indefinite-nominative-plural":"hidrocarbonați","accusative-definite-nominative-plural":"hidrocarbonații","dative-genitive-indefinite-singular":"hidrocarbonat","dative-definite-genitive-singular":"hidrocarbonatului","dative-genitive-indefinite-plural":"hidrocarbonați","dative-definite-genitive-plural":"hidrocarbonaților","singular-vocative":"hidrocarbonatule","plural-vocative":"hidrocarbonaților"}},{"word":"hidrocarbură","pos":"noun","definitions":["hydrocarbon"],"forms":{"plural":"hidrocarburi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrocarbură","accusative-definite-nominative-singular":"hidrocarbura","accusative-indefinite-nominative-plural":"hidrocarburi","accusative-definite-nominative-plural":"hidrocarburile","dative-genitive-indefinite-singular":"hidrocarburi","dative-definite-genitive-singular":"hidrocarburii","dative-genitive-indefinite-plural":"hidrocarburi","dative-definite-genitive-plural":"hidrocarburilor","singular-vocative":"hidrocarbură","plural-vocative":"hidrocarburilor"}},{"word":"hidrocefal","pos":"noun","definitions":["hydrocephalus"],"forms":{"plural":"hidrocefali","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrocefal","accusative-definite-nominative-singular":"hidrocefalul","accusative-indefinite-nominative-plural":"hidrocefali","accusative-definite-nominative-plural":"hidrocefalii","dative-genitive-indefinite-singular":"hidrocefal","dative-definite-genitive-singular":"hidrocefalului","dative-genitive-indefinite-plural":"hidrocefali","dative-definite-genitive-plural":"hidrocefalilor","singular-vocative":"hidrocefalule","plural-vocative":"hidrocefalilor"}},{"word":"hidrocefală","pos":"noun","definitions":["female equivalent of hidrocefal"],"forms":{"plural":"hidrocefale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrocefală","accusative-definite-nominative-singular":"hidrocefala","accusative-indefinite-nominative-plural":"hidrocefale","accusative-definite-nominative-plural":"hidrocefalele","dative-genitive-indefinite-singular":"hidrocefale","dative-definite-genitive-singular":"hidrocefalei","dative-genitive-indefinite-plural":"hidrocefale","dative-definite-genitive-plural":"hidrocefalelor","singular-vocative":"hidrocefală","plural-vocative":"hidrocefalelor"}},{"word":"hidrocefalie","pos":"noun","definitions":["hydrocephalus"],"forms":{"plural":"hidrocefalii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrocefalie","accusative-definite-nominative-singular":"hidrocefalia","accusative-indefinite-nominative-plural":"hidrocefalii","accusative-definite-nominative-plural":"hidrocefaliile","dative-genitive-indefinite-singular":"hidrocefalii","dative-definite-genitive-singular":"hidrocefaliei","dative-genitive-indefinite-plural":"hidrocefalii","dative-definite-genitive-plural":"hidrocefaliilor","singular-vocative":"hidrocefalie","plural-vocative":"hidrocefaliilor"}},{"word":"hidroceluloză","pos":"noun","definitions":["hydrocellulose"],"forms":{"plural":"hidroceluloze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroceluloză","accusative-definite-nominative-singular":"hidroceluloza","accusative-indefinite-nominative-plural":"hidroceluloze","accusative-definite-nominative-plural":"hidrocelulozele","dative-genitive-indefinite-singular":"hidroceluloze","dative-definite-genitive-singular":"hidrocelulozei","dative-genitive-indefinite-plural":"hidroceluloze","dative-definite-genitive-plural":"hidrocelulozelor","singular-vocative":"hidroceluloză","plural-vocative":"hidrocelulozelor"}},{"word":"hidrocentrală","pos":"noun","definitions":["hydro power plant"],"forms":{"plural":"hidrocentrale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrocentrală","accusative-definite-nominative-singular":"hidrocentrala","accusative-indefinite-nominative-plural":"hidrocentrale","accusative-definite-nominative-plural":"hidrocentralele","dative-genitive-indefinite-singular":"hidrocentrale","dative-definite-genitive-singular":"hidrocentralei","dative-genitive-indefinite-plural":"hidrocentrale","dative-definite-genitive-plural":"hidrocentralelor","singular-vocative":"hidrocentrală","plural-vocative":"hidrocentralelor"}},{"word":"hidrochimic","pos":"adj","definitions":["hydrochemical"],"forms":{"feminine-singular":"hidrochimică","masculine-plural":"hidrochimici","feminine-neuter-plural":"hidrochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrochimic","error-unrecognized-form-feminine-indefinite-singular":"hidrochimică","error-unrecognized-form-indefinite-masculine-plural":"hidrochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrochimice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrochimicul","definite-error-unrecognized-form-feminine-singular":"hidrochimica","definite-error-unrecognized-form-masculine-plural":"hidrochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrochimicele"}},{"word":"hidrochimie","pos":"noun","definitions":["hydrochemistry"],"forms":{"plural":"hidrochimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrochimie","accusative-definite-nominative-singular":"hidrochimia","accusative-indefinite-nominative-plural":"hidrochimii","accusative-definite-nominative-plural":"hidrochimiile","dative-genitive-indefinite-singular":"hidrochimii","dative-definite-genitive-singular":"hidrochimiei","dative-genitive-indefinite-plural":"hidrochimii","dative-definite-genitive-plural":"hidrochimiilor","singular-vocative":"hidrochimie","plural-vocative":"hidrochimiilor"}},{"word":"hidrochimist","pos":"noun","definitions":["hydrochemist"],"forms":{"plural":"hidrochimiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrochimist","accusative-definite-nominative-singular":"hidrochimistul","accusative-indefinite-nominative-plural":"hidrochimiști","accusative-definite-nominative-plural":"hidrochimiștii","dative-genitive-indefinite-singular":"hidrochimist","dative-definite-genitive-singular":"hidrochimistului","dative-genitive-indefinite-plural":"hidrochimiști","dative-definite-genitive-plural":"hidrochimiștilor","singular-vocative":"hidrochimistule","plural-vocative":"hidrochimiștilor"}},{"word":"hidrochimistă","pos":"noun","definitions":["female equivalent of hidrochimist"],"forms":{"plural":"hidrochimiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrochimistă","accusative-definite-nominative-singular":"hidrochimista","accusative-indefinite-nominative-plural":"hidrochimiste","accusative-definite-nominative-plural":"hidrochimistele","dative-genitive-indefinite-singular":"hidrochimiste","dative-definite-genitive-singular":"hidrochimistei","dative-genitive-indefinite-plural":"hidrochimiste","dative-definite-genitive-plural":"hidrochimistelor","singular-vocative":"hidrochimistă","plural-vocative":"hidrochimistelor"}},{"word":"hidrochinonă","pos":"noun","definitions":["hydroquinone"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrochinonă","accusative-definite-nominative-singular":"hidrochinona","accusative-indefinite-nominative-plural":"hidrochinone","accusative-definite-nominative-plural":"hidrochinonele","dative-genitive-indefinite-singular":"hidrochinone","dative-definite-genitive-singular":"hidrochinonei","dative-genitive-indefinite-plural":"hidrochinone","dative-definite-genitive-plural":"hidrochinonelor","singular-vocative":"hidrochinonă","plural-vocative":"hidrochinonelor"}},{"word":"hidrociclon","pos":"noun","definitions":["cyclone"],"forms":{"plural":"hidrocicloane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrociclon","accusative-definite-nominative-singular":"hidrociclonul","accusative-indefinite-nominative-plural":"hidrocicloane","accusative-definite-nominative-plural":"hidrocicloanele","dative-genitive-indefinite-singular":"hidrociclon","dative-definite-genitive-singular":"hidrociclonului","dative-genitive-indefinite-plural":"hidrocicloane","dative-definite-genitive-plural":"hidrocicloanelor","singular-vocative":"hidrociclonule","plural-vocative":"hidrocicloanelor"}},{"word":"hidrocoră","pos":"adj","definitions":["hydrochoric"],"forms":{"plural":"hidrocore","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"-","error-unrecognized-form-feminine-indefinite-singular":"hidrocoră","error-unrecognized-form-indefinite-masculine-plural":"-","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrocore","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"hidrocora","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"hidrocorele"}},{"word":"hidrocoră","pos":"noun","definitions":["hydrochore"],"forms":{"plural":"hidrocore","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrocoră","accusative-definite-nominative-singular":"hidrocora","accusative-indefinite-nominative-plural":"hidrocore","accusative-definite-nominative-plural":"hidrocorele","dative-genitive-indefinite-singular":"hidrocore","dative-definite-genitive-singular":"hidrocorei","dative-genitive-indefinite-plural":"hidrocore","dative-definite-genitive-plural":"hidrocorelor","singular-vocative":"hidrocoră","plural-vocative":"hidrocorelor"}},{"word":"hidrocorie","pos":"noun","definitions":["hydrochory"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrocorie","accusative-definite-nominative-singular":"hidrocoria","accusative-indefinite-nominative-plural":"hidrocorii","accusative-definite-nominative-plural":"hidrocoriile","dative-genitive-indefinite-singular":"hidrocorii","dative-definite-genitive-singular":"hidrocoriei","dative-genitive-indefinite-plural":"hidrocorii","dative-definite-genitive-plural":"hidrocoriilor","singular-vocative":"hidrocorie","plural-vocative":"hidrocoriilor"}},{"word":"hidrocortizon","pos":"noun","definitions":["hydrocortisone"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hidrocortizon","accusative-definite-nominative":"hidrocortizonul","dative-genitive-indefinite":"hidrocortizon","dative-definite-genitive":"hidrocortizonului","vocative":"hidrocortizonule"}},{"word":"hidrocosmetică","pos":"noun","definitions":["hydrocosmetics"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrocosmetică","accusative-definite-nominative-singular":"hidrocosmetica","accusative-indefinite-nominative-plural":"hidrocosmetice","accusative-definite-nominative-plural":"hidrocosmeticele","dative-genitive-indefinite-singular":"hidrocosmetice","dative-definite-genitive-singular":"hidrocosmeticei","dative-genitive-indefinite-plural":"hidrocosmetice","dative-definite-genitive-plural":"hidrocosmeticelor","singular-vocative":"hidrocosmetică","plural-vocative":"hidrocosmeticelor"}},{"word":"hidrocultură","pos":"noun","definitions":["hydroculture"],"forms":{"plural":"hidroculturi","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrocultură","accusative-definite-nominative-singular":"hidrocultura","accusative-indefinite-nominative-plural":"hidroculturi","accusative-definite-nominative-plural":"hidroculturile","dative-genitive-indefinite-singular":"hidroculturi","dative-definite-genitive-singular":"hidroculturii","dative-genitive-indefinite-plural":"hidroculturi","dative-definite-genitive-plural":"hidroculturilor","singular-vocative":"hidrocultură","plural-vocative":"hidroculturilor"}},{"word":"hidrocuție","pos":"noun","definitions":["hydrocution"],"forms":{"plural":"hidrocuții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrocuție","accusative-definite-nominative-singular":"hidrocuția","accusative-indefinite-nominative-plural":"hidrocuții","accusative-definite-nominative-plural":"hidrocuțiile","dative-genitive-indefinite-singular":"hidrocuții","dative-definite-genitive-singular":"hidrocuției","dative-genitive-indefinite-plural":"hidrocuții","dative-definite-genitive-plural":"hidrocuțiilor","singular-vocative":"hidrocuție","plural-vocative":"hidrocuțiilor"}},{"word":"hidrodinamic","pos":"adj","definitions":["hydrodynamic"],"forms":{"feminine-singular":"hidrodinamică","masculine-plural":"hidrodinamici","feminine-neuter-plural":"hidrodinamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrodinamic","error-unrecognized-form-feminine-indefinite-singular":"hidrodinamică","error-unrecognized-form-indefinite-masculine-plural":"hidrodinamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrodinamice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrodinamicul","definite-error-unrecognized-form-feminine-singular":"hidrodinamica","definite-error-unrecognized-form-masculine-plural":"hidrodinamicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrodinamicele"}},{"word":"hidrodinamică","pos":"noun","definitions":["hydrodynamics"],"forms":{"plural":"hidrodinamici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrodinamică","accusative-definite-nominative-singular":"hidrodinamica","accusative-indefinite-nominative-plural":"hidrodinamici","accusative-definite-nominative-plural":"hidrodinamicile","dative-genitive-indefinite-singular":"hidrodinamici","dative-definite-genitive-singular":"hidrodinamicii","dative-genitive-indefinite-plural":"hidrodinamici","dative-definite-genitive-plural":"hidrodinamicilor","singular-vocative":"hidrodinamică","plural-vocative":"hidrodinamicilor"}},{"word":"hidroelectric","pos":"adj","definitions":["hydroelectric"],"forms":{"feminine-singular":"hidroelectrică","masculine-plural":"hidroelectrici","feminine-neuter-plural":"hidroelectrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroelectric","error-unrecognized-form-feminine-indefinite-singular":"hidroelectrică","error-unrecognized-form-indefinite-masculine-plural":"hidroelectrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroelectrice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroelectricul","definite-error-unrecognized-form-feminine-singular":"hidroelectrica","definite-error-unrecognized-form-masculine-plural":"hidroelectricii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroelectricele"}},{"word":"hidroelevator","pos":"noun","definitions":["hydroelevator"],"forms":{"plural":"hidroelevatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidroelevator","accusative-definite-nominative-singular":"hidroelevatorul","accusative-indefinite-nominative-plural":"hidroelevatore","accusative-definite-nominative-plural":"hidroelevatorele","dative-genitive-indefinite-singular":"hidroelevator","dative-definite-genitive-singular":"hidroelevatorului","dative-genitive-indefinite-plural":"hidroelevatore","dative-definite-genitive-plural":"hidroelevatorelor","singular-vocative":"hidroelevatorule","plural-vocative":"hidroelevatorelor"}},{"word":"hidroenergetic","pos":"adj","definitions":["hydroelectric"],"forms":{"feminine-singular":"hidroenergetică","masculine-plural":"hidroenergetici","feminine-neuter-plural":"hidroenergetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroenergetic","error-unrecognized-form-feminine-indefinite-singular":"hidroenergetică","error-unrecognized-form-indefinite-masculine-plural":"hidroenergetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroenergetice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroenergeticul","definite-error-unrecognized-form-feminine-singular":"hidroenergetica","definite-error-unrecognized-form-masculine-plural":"hidroenergeticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroenergeticele"}},{"word":"hidroenergie","pos":"noun","definitions":["hydro power"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidroenergie","accusative-definite-nominative-singular":"hidroenergia","accusative-indefinite-nominative-plural":"hidroenergii","accusative-definite-nominative-plural":"hidroenergiile","dative-genitive-indefinite-singular":"hidroenergii","dative-definite-genitive-singular":"hidroenergiei","dative-genitive-indefinite-plural":"hidroenergii","dative-definite-genitive-plural":"hidroenergiilor","singular-vocative":"hidroenergie","plural-vocative":"hidroenergiilor"}},{"word":"hidrofil","pos":"noun","definitions":["hydrophilic"],"forms":{"plural":"hidrofili","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"hidrofil","accusative-definite-nominative-singular":"hidrofi","accusative-indefinite-nominative-plural":"hidrofili","accusative-definite-nominative-plural":"hidrofilile","dative-genitive-indefinite-singular":"hidrofili","dative-definite-genitive-singular":"hidrofilii","dative-genitive-indefinite-plural":"hidrofili","dative-definite-genitive-plural":"hidrofililor","singular-vocative":"-","plural-vocative":"-"}},{"word":"hidrofilă","pos":"noun","definitions":["alternative form of hidrofil"],"forms":{"plural":"hidrofile"}},{"word":"hidrofilie","pos":"noun","definitions":["hydrophilia"],"forms":{"plural":"hidrofilii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrofilie","accusative-definite-nominative-singular":"hidrofilia","accusative-indefinite-nominative-plural":"hidrofilii","accusative-definite-nominative-plural":"hidrofiliile","dative-genitive-indefinite-singular":"hidrofilii","dative-definite-genitive-singular":"hidrofiliei","dative-genitive-indefinite-plural":"hidrofilii","dative-definite-genitive-plural":"hidrofiliilor","singular-vocative":"hidrofilie","plural-vocative":"hidrofiliilor"}},{"word":"hidrofiliza","pos":"verb","definitions":["to hydrophilize"],"forms":{"canonical":"a hidrofiliza 1st conjugation","present-singular-third-person":"hidrofilizează","participle-past":"hidrofilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidrofiliza","gerund":"hidrofilizând","first-person-indicative-present-singular":"hidrofilizez","indicative-present-second-person-singular":"hidrofilizezi","indicative-present-singular-third-person":"hidrofilizează","first-person-indicative-plural-present":"hidrofilizăm","indicative-plural-present-second-person":"hidrofilizați","indicative-plural-present-third-person":"hidrofilizează","first-person-imperfect-indicative-singular":"hidrofilizam","imperfect-indicative-second-person-singular":"hidrofilizai","imperfect-indicative-singular-third-person":"hidrofiliza","first-person-imperfect-indicative-plural":"hidrofilizam","imperfect-indicative-plural-second-person":"hidrofilizați","imperfect-indicative-plural-third-person":"hidrofilizau","first-person-indicative-perfect-singular":"hidrofilizai","indicative-perfect-second-person-singular":"hidrofilizași","indicative-perfect-singular-third-person":"hidrofiliză","first-person-indicative-perfect-plural":"hidrofilizarăm","indicative-perfect-plural-second-person":"hidrofilizarăți","indicative-perfect-plural-third-person":"hidrofilizară","first-person-indicative-pluperfect-singular":"hidrofilizasem","indicative-pluperfect-second-person-singular":"hidrofilizaseși","indicative-pluperfect-singular-third-person":"hidrofilizase","first-person-indicative-pluperfect-plural":"hidrofilizaserăm","indicative-pluperfect-plural-second-person":"hidrofilizaserăți","indicative-pluperfect-plural-third-person":"hidrofilizaseră","first-person-present-singular-subjunctive":"să hidrofilizez","present-second-person-singular-subjunctive":"să hidrofilizezi","present-singular-subjunctive-third-person":"să hidrofilizeze","first-person-plural-present-subjunctive":"să hidrofilizăm","plural-present-second-person-subjunctive":"să hidrofilizați","plural-present-subjunctive-third-person":"să hidrofilizeze","imperative-second-person-singular":"hidrofilizează","imperative-plural-second-person":"hidrofilizați","imperative-negative-second-person-singular":"nu hidrofiliza","imperative-negative-plural-second-person":"nu hidrofilizați"}},{"word":"hidrofilizare","pos":"noun","definitions":["hydrophilizing"],"forms":{"plural":"hidrofilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hidrofilizare","accusative-definite-nominative-singular":"hidrofilizarea","accusative-indefinite-nominative-plural":"hidrofilizări","accusative-definite-nominative-plural":"hidrofilizările","dative-genitive-indefinite-singular":"hidrofilizări","dative-definite-genitive-singular":"hidrofilizării","dative-genitive-indefinite-plural":"hidrofilizări","dative-definite-genitive-plural":"hidrofilizărilor","singular-vocative":"hidrofilizare","plural-vocative":"hidrofilizărilor"}},{"word":"hidrofilizat","pos":"adj","definitions":["hydrophilized"],"forms":{"feminine-singular":"hidrofilizată","masculine-plural":"hidrofilizați","feminine-neuter-plural":"hidrofilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrofilizat","error-unrecognized-form-feminine-indefinite-singular":"hidrofilizată","error-unrecognized-form-indefinite-masculine-plural":"hidrofilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrofilizate","definite-error-unrecognized-form-masculine-neuter-singular":"hidrofilizatul","definite-error-unrecognized-form-feminine-singular":"hidrofilizata","definite-error-unrecognized-form-masculine-plural":"hidrofilizații","definite-error-unrecognized-form-feminine-neuter-plural":"hidrofilizatele"}},{"word":"hidrofit","pos":"adj","definitions":["hydrophytic"],"forms":{"feminine-singular":"hidrofită","masculine-plural":"hidrofiți","feminine-neuter-plural":"hidrofite"}},{"word":"hidrofită","pos":"noun","definitions":["hydrophyte"],"forms":{"plural":"hidrofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrofită","accusative-definite-nominative-singular":"hidrofita","accusative-indefinite-nominative-plural":"hidrofite","accusative-definite-nominative-plural":"hidrofitele","dative-genitive-indefinite-singular":"hidrofite","dative-definite-genitive-singular":"hidrofitei","dative-genitive-indefinite-plural":"hidrofite","dative-definite-genitive-plural":"hidrofitelor","singular-vocative":"hidrofită","plural-vocative":"hidrofitelor"}},{"word":"hidrofob","pos":"adj","definitions":["hydrophobic"],"forms":{"feminine-singular":"hidrofobă","masculine-plural":"hidrofobi","feminine-neuter-plural":"hidrofobe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrofob","error-unrecognized-form-feminine-indefinite-singular":"hidrofobă","error-unrecognized-form-indefinite-masculine-plural":"hidrofobi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrofobe","definite-error-unrecognized-form-masculine-neuter-singular":"hidrofobul","definite-error-unrecognized-form-feminine-singular":"hidrofoba","definite-error-unrecognized-form-masculine-plural":"hidrofobii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrofobele"}},{"word":"hidrofob","pos":"noun","definitions":["hydrophobe"],"forms":{"plural":"hidrofobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrofob","accusative-definite-nominative-singular":"hidrofobul","accusative-indefinite-nominative-plural":"hidrofobi","accusative-definite-nominative-plural":"hidrofobii","dative-genitive-indefinite-singular":"hidrofob","dative-definite-genitive-singular":"hidrofobului","dative-genitive-indefinite-plural":"hidrofobi","dative-definite-genitive-plural":"hidrofobilor","singular-vocative":"hidrofobule","plural-vocative":"hidrofobilor"}},{"word":"hidrofobă","pos":"noun","definitions":["female equivalent of hidrofob"],"forms":{"plural":"hidrofobe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrofobă","accusative-definite-nominative-singular":"hidrofoba","accusative-indefinite-nominative-plural":"hidrofobe","accusative-definite-nominative-plural":"hidrofobele","dative-genitive-indefinite-singular":"hidrofobe","dative-definite-genitive-singular":"hidrofobei","dative-genitive-indefinite-plural":"hidrofobe","dative-definite-genitive-plural":"hidrofobelor","singular-vocative":"hidrofobă","plural-vocative":"hidrofobelor"}},{"word":"hidrofobie","pos":"noun","definitions":["hydrophobia"],"forms":{"plural":"hidrofobii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrofobie","accusative-definite-nominative-singular":"hidrofobia","accusative-indefinite-nominative-plural":"hidrofobii","accusative-definite-nominative-plural":"hidrofobiile","dative-genitive-indefinite-singular":"hidrofobii","dative-definite-genitive-singular":"hidrofobiei","dative-genitive-indefinite-plural":"hidrofobii","dative-definite-genitive-plural":"hidrofobiilor","singular-vocative":"hidrofobie","plural-vocative":"hidrofobiilor"}},{"word":"hidrofobizat","pos":"adj","definitions":["hydrophobized"],"forms":{"feminine-singular":"hidrofobizată","masculine-plural":"hidrofobizați","feminine-neuter-plural":"hidrofobizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrofobizat","error-unrecognized-form-feminine-indefinite-singular":"hidrofobizată","error-unrecognized-form-indefinite-masculine-plural":"hidrofobizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrofobizate","definite-error-unrecognized-form-masculine-neuter-singular":"hidrofobizatul","definite-error-unrecognized-form-feminine-singular":"hidrofobizata","definite-error-unrecognized-form-masculine-plural":"hidrofobizații","definite-error-unrecognized-form-feminine-neuter-plural":"hidrofobizatele"}},{"word":"hidrofon","pos":"noun","definitions":["hydrophone"],"forms":{"plural":"hidrofoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrofon","accusative-definite-nominative-singular":"hidrofonul","accusative-indefinite-nominative-plural":"hidrofoane","accusative-definite-nominative-plural":"hidrofoanele","dative-genitive-indefinite-singular":"hidrofon","dative-definite-genitive-singular":"hidrofonului","dative-genitive-indefinite-plural":"hidrofoane","dative-definite-genitive-plural":"hidrofoanelor","singular-vocative":"hidrofonule","plural-vocative":"hidrofoanelor"}},{"word":"hidrofor","pos":"noun","definitions":["hydrophore"],"forms":{"plural":"hidrofoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrofor","accusative-definite-nominative-singular":"hidroforul","accusative-indefinite-nominative-plural":"hidrofore","accusative-definite-nominative-plural":"hidroforele","dative-genitive-indefinite-singular":"hidrofor","dative-definite-genitive-singular":"hidroforului","dative-genitive-indefinite-plural":"hidrofore","dative-definite-genitive-plural":"hidroforelor","singular-vocative":"hidroforule","plural-vocative":"hidroforelor"}},{"word":"hidroftalmic","pos":"adj","definitions":["having hydrophthalmos"],"forms":{"feminine-singular":"hidroftalmică","masculine-plural":"hidroftalmici","feminine-neuter-plural":"hidroftalmice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroftalmic","error-unrecognized-form-feminine-indefinite-singular":"hidroftalmică","error-unrecognized-form-indefinite-masculine-plural":"hidroftalmici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroftalmice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroftalmicul","definite-error-unrecognized-form-feminine-singular":"hidroftalmica","definite-error-unrecognized-form-masculine-plural":"hidroftalmicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroftalmicele"}},{"word":"hidroftalmic","pos":"noun","definitions":["person having hydrophthalmos"],"forms":{"plural":"hidroftalmici","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroftalmic","accusative-definite-nominative-singular":"hidroftalmicul","accusative-indefinite-nominative-plural":"hidroftalmici","accusative-definite-nominative-plural":"hidroftalmicii","dative-genitive-indefinite-singular":"hidroftalmic","dative-definite-genitive-singular":"hidroftalmicului","dative-genitive-indefinite-plural":"hidroftalmici","dative-definite-genitive-plural":"hidroftalmicilor","singular-vocative":"hidroftalmicule","plural-vocative":"hidroftalmicilor"}},{"word":"hidroftalmică","pos":"noun","definitions":["female equivalent of hidroftalmic"],"forms":{"plural":"hidroftalmice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroftalmică","accusative-definite-nominative-singular":"hidroftalmica","accusative-indefinite-nominative-plural":"hidroftalmice","accusative-definite-nominative-plural":"hidroftalmicele","dative-genitive-indefinite-singular":"hidroftalmice","dative-definite-genitive-singular":"hidroftalmicei","dative-genitive-indefinite-plural":"hidroftalmice","dative-definite-genitive-plural":"hidroftalmicelor","singular-vocative":"hidroftalmică","plural-vocative":"hidroftalmicelor"}},{"word":"hidroftalmie","pos":"noun","definitions":["hydrophthalmia"],"forms":{"plural":"hidroftalmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidroftalmie","accusative-definite-nominative-singular":"hidroftalmia","accusative-indefinite-nominative-plural":"hidroftalmii","accusative-definite-nominative-plural":"hidroftalmiile","dative-genitive-indefinite-singular":"hidroftalmii","dative-definite-genitive-singular":"hidroftalmiei","dative-genitive-indefinite-plural":"hidroftalmii","dative-definite-genitive-plural":"hidroftalmiilor","singular-vocative":"hidroftalmie","plural-vocative":"hidroftalmiilor"}},{"word":"hidrofug","pos":"adj","definitions":["water repellent"],"forms":{"feminine-singular":"hidrofugă","masculine-plural":"hidrofugi","feminine-neuter-plural":"hidrofuge","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrofug","error-unrecognized-form-feminine-indefinite-singular":"hidrofugă","error-unrecognized-form-indefinite-masculine-plural":"hidrofugi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrofuge","definite-error-unrecognized-form-masculine-neuter-singular":"hidrofugul","definite-error-unrecognized-form-feminine-singular":"hidrofuga","definite-error-unrecognized-form-masculine-plural":"hidrofugii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrofugele"}},{"word":"hidrogam","pos":"adj","definitions":["hydrogamous"],"forms":{"feminine-singular":"hidrogamă","masculine-plural":"hidrogami","feminine-neuter-plural":"hidrogame","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrogam","error-unrecognized-form-feminine-indefinite-singular":"hidrogamă","error-unrecognized-form-indefinite-masculine-plural":"hidrogami","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrogame","definite-error-unrecognized-form-masculine-neuter-singular":"hidrogamul","definite-error-unrecognized-form-feminine-singular":"hidrogama","definite-error-unrecognized-form-masculine-plural":"hidrogamii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrogamele"}},{"word":"hidrogamă","pos":"noun","definitions":["hydrophile"],"forms":{"plural":"hidrogame","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrogamă","accusative-definite-nominative-singular":"hidrogama","accusative-indefinite-nominative-plural":"hidrogame","accusative-definite-nominative-plural":"hidrogamele","dative-genitive-indefinite-singular":"hidrogame","dative-definite-genitive-singular":"hidrogamei","dative-genitive-indefinite-plural":"hidrogame","dative-definite-genitive-plural":"hidrogamelor","singular-vocative":"hidrogamă","plural-vocative":"hidrogamelor"}},{"word":"hidrogel","pos":"noun","definitions":["hydrogel"],"forms":{"plural":"hidrogeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidrogel","accusative-definite-nominative-singular":"hidrogelul","accusative-indefinite-nominative-plural":"hidrogeluri","accusative-definite-nominative-plural":"hidrogelurile","dative-genitive-indefinite-singular":"hidrogel","dative-definite-genitive-singular":"hidrogelului","dative-genitive-indefinite-plural":"hidrogeluri","dative-definite-genitive-plural":"hidrogelurilor","singular-vocative":"hidrogelule","plural-vocative":"hidrogelurilor"}},{"word":"hidrogen","pos":"noun","definitions":["hydrogen (the lightest chemical element (symbol H), with an atomic number of 1 and atomic weight of 1.008)"],"pronunciation":"/ˌhidroˈd͡ʒen/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hidrogen","accusative-definite-nominative":"hidrogenul","dative-genitive-indefinite":"hidrogen","dative-definite-genitive":"hidrogenului","vocative":"hidrogenule"}},{"word":"hidrogen greu","pos":"noun","definitions":["heavy hydrogen"]},{"word":"hidrogen sulfurat","pos":"noun","definitions":["hydrogen sulfide"]},{"word":"hidrogena","pos":"verb","definitions":["to hydrogenate"],"forms":{"canonical":"a hidrogena 1st conjugation","present-singular-third-person":"hidrogenează","participle-past":"hidrogenat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidrogena","gerund":"hidrogenând","first-person-indicative-present-singular":"hidrogenez","indicative-present-second-person-singular":"hidrogenezi","indicative-present-singular-third-person":"hidrogenează","first-person-indicative-plural-present":"hidrogenăm","indicative-plural-present-second-person":"hidrogenați","indicative-plural-present-third-person":"hidrogenează","first-person-imperfect-indicative-singular":"hidrogenam","imperfect-indicative-second-person-singular":"hidrogenai","imperfect-indicative-singular-third-person":"hidrogena","first-person-imperfect-indicative-plural":"hidrogenam","imperfect-indicative-plural-second-person":"hidrogenați","imperfect-indicative-plural-third-person":"hidrogenau","first-person-indicative-perfect-singular":"hidrogenai","indicative-perfect-second-person-singular":"hidrogenași","indicative-perfect-singular-third-person":"hidrogenă","first-person-indicative-perfect-plural":"hidrogenarăm","indicative-perfect-plural-second-person":"hidrogenarăți","indicative-perfect-plural-third-person":"hidrogenară","first-person-indicative-pluperfect-singular":"hidrogenasem","indicative-pluperfect-second-person-singular":"hidrogenaseși","indicative-pluperfect-singular-third-person":"hidrogenase","first-person-indicative-pluperfect-plural":"hidrogenaserăm","indicative-pluperfect-plural-second-person":"hidrogenaserăți","indicative-pluperfect-plural-third-person":"hidrogenaseră","first-person-present-singular-subjunctive":"să hidrogenez","present-second-person-singular-subjunctive":"să hidrogenezi","present-singular-subjunctive-third-person":"să hidrogeneze","first-person-plural-present-subjunctive":"să hidrogenăm","plural-present-second-person-subjunctive":"să hidrogenați","plural-present-subjunctive-third-person":"să hidrogeneze","imperative-second-person-singular":"hidrogenează","imperative-plural-second-person":"hidrogenați","imperative-negative-second-person-singular":"nu hidrogena","imperative-negative-plural-second-person":"nu hidrogenați"}},{"word":"hidrogenai","pos":"verb","definitions":["inflection of hidrogena:","first-person singular simple perfect indicative","second-person singular imperfect indicative"],"pronunciation":"[hidrod͡ʒeˈnaj]"},{"word":"hidrogenam","pos":"verb","definitions":["first-person singular/plural imperfect indicative of hidrogena"],"pronunciation":"[hidrod͡ʒeˈnam]"},{"word":"hidrogenare","pos":"noun","definitions":["hydrogenation"],"forms":{"plural":"hidrogenări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hidrogenare","accusative-definite-nominative-singular":"hidrogenarea","accusative-indefinite-nominative-plural":"hidrogenări","accusative-definite-nominative-plural":"hidrogenările","dative-genitive-indefinite-singular":"hidrogenări","dative-definite-genitive-singular":"hidrogenării","dative-genitive-indefinite-plural":"hidrogenări","dative-definite-genitive-plural":"hidrogenărilor","singular-vocative":"hidrogenare","plural-vocative":"hidrogenărilor"}},{"word":"hidrogenase","pos":"verb","definitions":["third-person singular pluperfect indicative of hidrogena"],"pronunciation":"[hidrod͡ʒeˈnase]"},{"word":"hidrogenat","pos":"adj","definitions":["hydrogenated"],"pronunciation":"[hidrod͡ʒeˈnat]","forms":{"feminine-singular":"hidrogenată","masculine-plural":"hidrogenați","feminine-neuter-plural":"hidrogenate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrogenat","error-unrecognized-form-feminine-indefinite-singular":"hidrogenată","error-unrecognized-form-indefinite-masculine-plural":"hidrogenați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrogenate","definite-error-unrecognized-form-masculine-neuter-singular":"hidrogenatul","definite-error-unrecognized-form-feminine-singular":"hidrogenata","definite-error-unrecognized-form-masculine-plural":"hidrogenații","definite-error-unrecognized-form-feminine-neuter-plural":"hidrogenatele"}},{"word":"hidrogenat","pos":"verb","definitions":["past participle of hidrogena"],"pronunciation":"[hidrod͡ʒeˈnat]"},{"word":"hidrogenerator","pos":"noun","definitions":["hydro generator"],"forms":{"plural":"hidrogeneratoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrogenerator","accusative-definite-nominative-singular":"hidrogeneratorul","accusative-indefinite-nominative-plural":"hidrogeneratoare","accusative-definite-nominative-plural":"hidrogeneratoarele","dative-genitive-indefinite-singular":"hidrogenerator","dative-definite-genitive-singular":"hidrogeneratorului","dative-genitive-indefinite-plural":"hidrogeneratoare","dative-definite-genitive-plural":"hidrogeneratoarelor","singular-vocative":"hidrogeneratorule","plural-vocative":"hidrogeneratoarelor"}},{"word":"hidrogenoliză","pos":"noun","definitions":["hydrogenolysis"],"forms":{"plural":"hidrogenolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrogenoliză","accusative-definite-nominative-singular":"hidrogenoliza","accusative-indefinite-nominative-plural":"hidrogenolize","accusative-definite-nominative-plural":"hidrogenolizele","dative-genitive-indefinite-singular":"hidrogenolize","dative-definite-genitive-singular":"hidrogenolizei","dative-genitive-indefinite-plural":"hidrogenolize","dative-definite-genitive-plural":"hidrogenolizelor","singular-vocative":"hidrogenoliză","plural-vocative":"hidrogenolizelor"}},{"word":"hidrogeolog","pos":"noun","definitions":["hydrogeologist"],"forms":{"plural":"hidrogeologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrogeolog","accusative-definite-nominative-singular":"hidrogeologul","accusative-indefinite-nominative-plural":"hidrogeologi","accusative-definite-nominative-plural":"hidrogeologii","dative-genitive-indefinite-singular":"hidrogeolog","dative-definite-genitive-singular":"hidrogeologului","dative-genitive-indefinite-plural":"hidrogeologi","dative-definite-genitive-plural":"hidrogeologilor","singular-vocative":"hidrogeologule","plural-vocative":"hidrogeologilor"}},{"word":"hidrogeologă","pos":"noun","definitions":["female equivalent of hidrogeolog"],"forms":{"plural":"hidrogeologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrogeologă","accusative-definite-nominative-singular":"hidrogeologa","accusative-indefinite-nominative-plural":"hidrogeologe","accusative-definite-nominative-plural":"hidrogeologele","dative-genitive-indefinite-singular":"hidrogeologe","dative-definite-genitive-singular":"hidrogeologei","dative-genitive-indefinite-plural":"hidrogeologe","dative-definite-genitive-plural":"hidrogeologelor","singular-vocative":"hidrogeologă","plural-vocative":"hidrogeologelor"}},{"word":"hidrogeologie","pos":"noun","definitions":["hydrogeology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrogeologie","accusative-definite-nominative-singular":"hidrogeologia","accusative-indefinite-nominative-plural":"hidrogeologii","accusative-definite-nominative-plural":"hidrogeologiile","dative-genitive-indefinite-singular":"hidrogeologii","dative-definite-genitive-singular":"hidrogeologiei","dative-genitive-indefinite-plural":"hidrogeologii","dative-definite-genitive-plural":"hidrogeologiilor","singular-vocative":"hidrogeologie","plural-vocative":"hidrogeologiilor"}},{"word":"hidroglisor","pos":"noun","definitions":["hydrofoil"],"forms":{"plural":"hidroglisoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidroglisor","accusative-definite-nominative-singular":"hidroglisorul","accusative-indefinite-nominative-plural":"hidroglisore","accusative-definite-nominative-plural":"hidroglisorele","dative-genitive-indefinite-singular":"hidroglisor","dative-definite-genitive-singular":"hidroglisorului","dative-genitive-indefinite-plural":"hidroglisore","dative-definite-genitive-plural":"hidroglisorelor","singular-vocative":"hidroglisorule","plural-vocative":"hidroglisorelor"}},{"word":"hidrograf","pos":"noun","definitions":["hydrographer"],"forms":{"plural":"hidrografi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrograf","accusative-definite-nominative-singular":"hidrograful","accusative-indefinite-nominative-plural":"hidrografi","accusative-definite-nominative-plural":"hidrografii","dative-genitive-indefinite-singular":"hidrograf","dative-definite-genitive-singular":"hidrografului","dative-genitive-indefinite-plural":"hidrografi","dative-definite-genitive-plural":"hidrografilor","singular-vocative":"hidrografule","plural-vocative":"hidrografilor"}},{"word":"hidrografă","pos":"noun","definitions":["female equivalent of hidrograf"],"forms":{"plural":"hidrografe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrografă","accusative-definite-nominative-singular":"hidrografa","accusative-indefinite-nominative-plural":"hidrografe","accusative-definite-nominative-plural":"hidrografele","dative-genitive-indefinite-singular":"hidrografe","dative-definite-genitive-singular":"hidrografei","dative-genitive-indefinite-plural":"hidrografe","dative-definite-genitive-plural":"hidrografelor","singular-vocative":"hidrografă","plural-vocative":"hidrografelor"}},{"word":"hidrografic","pos":"adj","definitions":["hydrographic"],"forms":{"feminine-singular":"hidrografică","masculine-plural":"hidrografici","feminine-neuter-plural":"hidrografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrografic","error-unrecognized-form-feminine-indefinite-singular":"hidrografică","error-unrecognized-form-indefinite-masculine-plural":"hidrografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrografice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrograficul","definite-error-unrecognized-form-feminine-singular":"hidrografica","definite-error-unrecognized-form-masculine-plural":"hidrograficii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrograficele"}},{"word":"hidrografie","pos":"noun","definitions":["hydrography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrografie","accusative-definite-nominative-singular":"hidrografia","accusative-indefinite-nominative-plural":"hidrografii","accusative-definite-nominative-plural":"hidrografiile","dative-genitive-indefinite-singular":"hidrografii","dative-definite-genitive-singular":"hidrografiei","dative-genitive-indefinite-plural":"hidrografii","dative-definite-genitive-plural":"hidrografiilor","singular-vocative":"hidrografie","plural-vocative":"hidrografiilor"}},{"word":"hidrogramă","pos":"noun","definitions":["hydrograph"],"forms":{"plural":"hidrograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrogramă","accusative-definite-nominative-singular":"hidrograma","accusative-indefinite-nominative-plural":"hidrograme","accusative-definite-nominative-plural":"hidrogramele","dative-genitive-indefinite-singular":"hidrograme","dative-definite-genitive-singular":"hidrogramei","dative-genitive-indefinite-plural":"hidrograme","dative-definite-genitive-plural":"hidrogramelor","singular-vocative":"hidrogramă","plural-vocative":"hidrogramelor"}},{"word":"hidroizola","pos":"verb","definitions":["to waterproof"],"forms":{"canonical":"a hidroizola 1st conjugation","present-singular-third-person":"hidroizolează","participle-past":"hidroizolat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidroizola","gerund":"hidroizolând","first-person-indicative-present-singular":"hidroizolez","indicative-present-second-person-singular":"hidroizolezi","indicative-present-singular-third-person":"hidroizolează","first-person-indicative-plural-present":"hidroizolăm","indicative-plural-present-second-person":"hidroizolați","indicative-plural-present-third-person":"hidroizolează","first-person-imperfect-indicative-singular":"hidroizolam","imperfect-indicative-second-person-singular":"hidroizolai","imperfect-indicative-singular-third-person":"hidroizola","first-person-imperfect-indicative-plural":"hidroizolam","imperfect-indicative-plural-second-person":"hidroizolați","imperfect-indicative-plural-third-person":"hidroizolau","first-person-indicative-perfect-singular":"hidroizolai","indicative-perfect-second-person-singular":"hidroizolași","indicative-perfect-singular-third-person":"hidroizolă","first-person-indicative-perfect-plural":"hidroizolarăm","indicative-perfect-plural-second-person":"hidroizolarăți","indicative-perfect-plural-third-person":"hidroizolară","first-person-indicative-pluperfect-singular":"hidroizolasem","indicative-pluperfect-second-person-singular":"hidroizolaseși","indicative-pluperfect-singular-third-person":"hidroizolase","first-person-indicative-pluperfect-plural":"hidroizolaserăm","indicative-pluperfect-plural-second-person":"hidroizolaserăți","indicative-pluperfect-plural-third-person":"hidroizolaseră","first-person-present-singular-subjunctive":"să hidroizolez","present-second-person-singular-subjunctive":"să hidroizolezi","present-singular-subjunctive-third-person":"să hidroizoleze","first-person-plural-present-subjunctive":"să hidroizolăm","plural-present-second-person-subjunctive":"să hidroizolați","plural-present-subjunctive-third-person":"să hidroizoleze","imperative-second-person-singular":"hidroizolează","imperative-plural-second-person":"hidroizolați","imperative-negative-second-person-singular":"nu hidroizola","imperative-negative-plural-second-person":"nu hidroizolați"}},{"word":"hidroizolare","pos":"noun","definitions":["waterproofing"],"forms":{"plural":"hidroizolări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hidroizolare","accusative-definite-nominative-singular":"hidroizolarea","accusative-indefinite-nominative-plural":"hidroizolări","accusative-definite-nominative-plural":"hidroizolările","dative-genitive-indefinite-singular":"hidroizolări","dative-definite-genitive-singular":"hidroizolării","dative-genitive-indefinite-plural":"hidroizolări","dative-definite-genitive-plural":"hidroizolărilor","singular-vocative":"hidroizolare","plural-vocative":"hidroizolărilor"}},{"word":"hidroizolat","pos":"adj","definitions":["waterproofed"],"forms":{"feminine-singular":"hidroizolată","masculine-plural":"hidroizolați","feminine-neuter-plural":"hidroizolate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroizolat","error-unrecognized-form-feminine-indefinite-singular":"hidroizolată","error-unrecognized-form-indefinite-masculine-plural":"hidroizolați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroizolate","definite-error-unrecognized-form-masculine-neuter-singular":"hidroizolatul","definite-error-unrecognized-form-feminine-singular":"hidroizolata","definite-error-unrecognized-form-masculine-plural":"hidroizolații","definite-error-unrecognized-form-feminine-neuter-plural":"hidroizolatele"}},{"word":"hidroizolație","pos":"noun","definitions":["waterproofing"],"forms":{"plural":"hidroizolații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidroizolație","accusative-definite-nominative-singular":"hidroizolația","accusative-indefinite-nominative-plural":"hidroizolații","accusative-definite-nominative-plural":"hidroizolațiile","dative-genitive-indefinite-singular":"hidroizolații","dative-definite-genitive-singular":"hidroizolației","dative-genitive-indefinite-plural":"hidroizolații","dative-definite-genitive-plural":"hidroizolațiilor","singular-vocative":"hidroizolație","plural-vocative":"hidroizolațiilor"}},{"word":"hidrolază","pos":"noun","definitions":["hydrolase"],"forms":{"plural":"hidrolaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrolază","accusative-definite-nominative-singular":"hidrolaza","accusative-indefinite-nominative-plural":"hidrolaze","accusative-definite-nominative-plural":"hidrolazele","dative-genitive-indefinite-singular":"hidrolaze","dative-definite-genitive-singular":"hidrolazei","dative-genitive-indefinite-plural":"hidrolaze","dative-definite-genitive-plural":"hidrolazelor","singular-vocative":"hidrolază","plural-vocative":"hidrolazelor"}},{"word":"hidrolitic","pos":"adj","definitions":["hydrolytic"],"forms":{"feminine-singular":"hidrolitică","masculine-plural":"hidrolitici","feminine-neuter-plural":"hidrolitice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrolitic","error-unrecognized-form-feminine-indefinite-singular":"hidrolitică","error-unrecognized-form-indefinite-masculine-plural":"hidrolitici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrolitice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroliticul","definite-error-unrecognized-form-feminine-singular":"hidrolitica","definite-error-unrecognized-form-masculine-plural":"hidroliticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroliticele"}},{"word":"hidroliza","pos":"verb","definitions":["to hydrolyze"],"forms":{"canonical":"a hidroliza 1st conjugation","present-singular-third-person":"hidrolizează","participle-past":"hidrolizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidroliza","gerund":"hidrolizând","first-person-indicative-present-singular":"hidrolizez","indicative-present-second-person-singular":"hidrolizezi","indicative-present-singular-third-person":"hidrolizează","first-person-indicative-plural-present":"hidrolizăm","indicative-plural-present-second-person":"hidrolizați","indicative-plural-present-third-person":"hidrolizează","first-person-imperfect-indicative-singular":"hidrolizam","imperfect-indicative-second-person-singular":"hidrolizai","imperfect-indicative-singular-third-person":"hidroliza","first-person-imperfect-indicative-plural":"hidrolizam","imperfect-indicative-plural-second-person":"hidrolizați","imperfect-indicative-plural-third-person":"hidrolizau","first-person-indicative-perfect-singular":"hidrolizai","indicative-perfect-second-person-singular":"hidrolizași","indicative-perfect-singular-third-person":"hidroliză","first-person-indicative-perfect-plural":"hidrolizarăm","indicative-perfect-plural-second-person":"hidrolizarăți","indicative-perfect-plural-third-person":"hidrolizară","first-person-indicative-pluperfect-singular":"hidrolizasem","indicative-pluperfect-second-person-singular":"hidrolizaseși","indicative-pluperfect-singular-third-person":"hidrolizase","first-person-indicative-pluperfect-plural":"hidrolizaserăm","indicative-pluperfect-plural-second-person":"hidrolizaserăți","indicative-pluperfect-plural-third-person":"hidrolizaseră","first-person-present-singular-subjunctive":"să hidrolizez","present-second-person-singular-subjunctive":"să hidrolizezi","present-singular-subjunctive-third-person":"să hidrolizeze","first-person-plural-present-subjunctive":"să hidrolizăm","plural-present-second-person-subjunctive":"să hidrolizați","plural-present-subjunctive-third-person":"să hidrolizeze","imperative-second-person-singular":"hidrolizează","imperative-plural-second-person":"hidrolizați","imperative-negative-second-person-singular":"nu hidroliza","imperative-negative-plural-second-person":"nu hidrolizați"}},{"word":"hidroliză","pos":"noun","definitions":["hydrolysis"],"forms":{"plural":"hidrolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroliză","accusative-definite-nominative-singular":"hidroliza","accusative-indefinite-nominative-plural":"hidrolize","accusative-definite-nominative-plural":"hidrolizele","dative-genitive-indefinite-singular":"hidrolize","dative-definite-genitive-singular":"hidrolizei","dative-genitive-indefinite-plural":"hidrolize","dative-definite-genitive-plural":"hidrolizelor","singular-vocative":"hidroliză","plural-vocative":"hidrolizelor"}},{"word":"hidrolizabil","pos":"adj","definitions":["hydrolyzable"],"forms":{"feminine-singular":"hidrolizabilă","masculine-plural":"hidrolizabili","feminine-neuter-plural":"hidrolizabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrolizabil","error-unrecognized-form-feminine-indefinite-singular":"hidrolizabilă","error-unrecognized-form-indefinite-masculine-plural":"hidrolizabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrolizabile","definite-error-unrecognized-form-masculine-neuter-singular":"hidrolizabilul","definite-error-unrecognized-form-feminine-singular":"hidrolizabila","definite-error-unrecognized-form-masculine-plural":"hidrolizabilii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrolizabilele"}},{"word":"hidrolizare","pos":"noun","definitions":["hydrolyzation"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"hidrolizare","accusative-definite-nominative":"hidrolizarea","dative-genitive-indefinite":"hidrolizări","dative-definite-genitive":"hidrolizării","vocative":"hidrolizare"}},{"word":"hidrolog","pos":"noun","definitions":["hydrologist"],"pronunciation":"/hi.droˈloɡ/","forms":{"plural":"hidrologi","feminine":"equivalent hidrologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrolog","accusative-definite-nominative-singular":"hidrologul","accusative-indefinite-nominative-plural":"hidrologi","accusative-definite-nominative-plural":"hidrologii","dative-genitive-indefinite-singular":"hidrolog","dative-definite-genitive-singular":"hidrologului","dative-genitive-indefinite-plural":"hidrologi","dative-definite-genitive-plural":"hidrologilor","singular-vocative":"hidrologule","plural-vocative":"hidrologilor"}},{"word":"hidrologă","pos":"noun","definitions":["female equivalent of hidrolog"],"pronunciation":"/hi.droˈlo.ɡə/","forms":{"plural":"hidrologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"hidrologă","accusative-definite-nominative-singular":"hidrologa","accusative-indefinite-nominative-plural":"hidrologe","accusative-definite-nominative-plural":"hidrologele","dative-genitive-indefinite-singular":"hidrologe","dative-definite-genitive-singular":"hidrologei","dative-genitive-indefinite-plural":"hidrologe","dative-definite-genitive-plural":"hidrologelor","singular-vocative":"-","plural-vocative":"-"}},{"word":"hidrologe","pos":"noun","definitions":["plural of hidrologă"],"gender":"f"},{"word":"hidrologi","pos":"noun","definitions":["plural of hidrolog"],"gender":"m"},{"word":"hidrologic","pos":"adj","definitions":["hydrological"],"forms":{"feminine-singular":"hidrologică","masculine-plural":"hidrologici","feminine-neuter-plural":"hidrologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrologic","error-unrecognized-form-feminine-indefinite-singular":"hidrologică","error-unrecognized-form-indefinite-masculine-plural":"hidrologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrologice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrologicul","definite-error-unrecognized-form-feminine-singular":"hidrologica","definite-error-unrecognized-form-masculine-plural":"hidrologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrologicele"}},{"word":"hidrologie","pos":"noun","definitions":["hydrology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrologie","accusative-definite-nominative-singular":"hidrologia","accusative-indefinite-nominative-plural":"hidrologii","accusative-definite-nominative-plural":"hidrologiile","dative-genitive-indefinite-singular":"hidrologii","dative-definite-genitive-singular":"hidrologiei","dative-genitive-indefinite-plural":"hidrologii","dative-definite-genitive-plural":"hidrologiilor","singular-vocative":"hidrologie","plural-vocative":"hidrologiilor"}},{"word":"hidrologii","pos":"noun","definitions":["definite nominative/accusative plural of hidrolog"],"gender":"m"},{"word":"hidromanie","pos":"noun","definitions":["hydromania"],"forms":{"plural":"hidromanii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidromanie","accusative-definite-nominative-singular":"hidromania","accusative-indefinite-nominative-plural":"hidromanii","accusative-definite-nominative-plural":"hidromaniile","dative-genitive-indefinite-singular":"hidromanii","dative-definite-genitive-singular":"hidromaniei","dative-genitive-indefinite-plural":"hidromanii","dative-definite-genitive-plural":"hidromaniilor","singular-vocative":"hidromanie","plural-vocative":"hidromaniilor"}},{"word":"hidromanție","pos":"noun","definitions":["hydromancy"],"forms":{"plural":"hidromanții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidromanție","accusative-definite-nominative-singular":"hidromanția","accusative-indefinite-nominative-plural":"hidromanții","accusative-definite-nominative-plural":"hidromanțiile","dative-genitive-indefinite-singular":"hidromanții","dative-definite-genitive-singular":"hidromanției","dative-genitive-indefinite-plural":"hidromanții","dative-definite-genitive-plural":"hidromanțiilor","singular-vocative":"hidromanție","plural-vocative":"hidromanțiilor"}},{"word":"hidromasaj","pos":"noun","definitions":["hydromassage"],"forms":{"plural":"hidromasaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidromasaj","accusative-definite-nominative-singular":"hidromasajul","accusative-indefinite-nominative-plural":"hidromasaje","accusative-definite-nominative-plural":"hidromasajele","dative-genitive-indefinite-singular":"hidromasaj","dative-definite-genitive-singular":"hidromasajului","dative-genitive-indefinite-plural":"hidromasaje","dative-definite-genitive-plural":"hidromasajelor","singular-vocative":"hidromasajule","plural-vocative":"hidromasajelor"}},{"word":"hidromecanic","pos":"adj","definitions":["hydromechanical"],"forms":{"feminine-singular":"hidromecanică","masculine-plural":"hidromecanici","feminine-neuter-plural":"hidromecanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidromecanic","error-unrecognized-form-feminine-indefinite-singular":"hidromecanică","error-unrecognized-form-indefinite-masculine-plural":"hidromecanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidromecanice","definite-error-unrecognized-form-masculine-neuter-singular":"hidromecanicul","definite-error-unrecognized-form-feminine-singular":"hidromecanica","definite-error-unrecognized-form-masculine-plural":"hidromecanicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidromecanicele"}},{"word":"hidromecanică","pos":"noun","definitions":["hydromechanics"],"forms":{"plural":"hidromecanici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidromecanică","accusative-definite-nominative-singular":"hidromecanica","accusative-indefinite-nominative-plural":"hidromecanici","accusative-definite-nominative-plural":"hidromecanicile","dative-genitive-indefinite-singular":"hidromecanici","dative-definite-genitive-singular":"hidromecanicii","dative-genitive-indefinite-plural":"hidromecanici","dative-definite-genitive-plural":"hidromecanicilor","singular-vocative":"hidromecanică","plural-vocative":"hidromecanicilor"}},{"word":"hidromel","pos":"noun","definitions":["mead"],"pronunciation":"/hi.droˈmel/","forms":{"plural":"hidromeluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidromel","accusative-definite-nominative-singular":"hidromelul","accusative-indefinite-nominative-plural":"hidromeluri","accusative-definite-nominative-plural":"hidromelurile","dative-genitive-indefinite-singular":"hidromel","dative-definite-genitive-singular":"hidromelului","dative-genitive-indefinite-plural":"hidromeluri","dative-definite-genitive-plural":"hidromelurilor","singular-vocative":"hidromelule","plural-vocative":"hidromelurilor"}},{"word":"hidrometalurgie","pos":"noun","definitions":["hydrometallurgy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hidrometalurgie","accusative-definite-nominative":"hidrometalurgia","dative-genitive-indefinite":"hidrometalurgii","dative-definite-genitive":"hidrometalurgiei","vocative":"hidrometalurgie"}},{"word":"hidrometeor","pos":"noun","definitions":["hydrometeor"],"forms":{"plural":"hidrometeori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrometeor","accusative-definite-nominative-singular":"hidrometeorul","accusative-indefinite-nominative-plural":"hidrometeori","accusative-definite-nominative-plural":"hidrometeorii","dative-genitive-indefinite-singular":"hidrometeor","dative-definite-genitive-singular":"hidrometeorului","dative-genitive-indefinite-plural":"hidrometeori","dative-definite-genitive-plural":"hidrometeorilor","singular-vocative":"hidrometeorule","plural-vocative":"hidrometeorilor"}},{"word":"hidrometeorologic","pos":"adj","definitions":["hydrometeorological"],"forms":{"feminine-singular":"hidrometeorologică","masculine-plural":"hidrometeorologici","feminine-neuter-plural":"hidrometeorologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrometeorologic","error-unrecognized-form-feminine-indefinite-singular":"hidrometeorologică","error-unrecognized-form-indefinite-masculine-plural":"hidrometeorologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrometeorologice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrometeorologicul","definite-error-unrecognized-form-feminine-singular":"hidrometeorologica","definite-error-unrecognized-form-masculine-plural":"hidrometeorologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrometeorologicele"}},{"word":"hidrometeorologie","pos":"noun","definitions":["hydrometeorology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hidrometeorologie","accusative-definite-nominative":"hidrometeorologia","dative-genitive-indefinite":"hidrometeorologii","dative-definite-genitive":"hidrometeorologiei","vocative":"hidrometeorologie"}},{"word":"hidrometric","pos":"adj","definitions":["hydrometric"],"forms":{"feminine-singular":"hidrometrică","masculine-plural":"hidrometrici","feminine-neuter-plural":"hidrometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrometric","error-unrecognized-form-feminine-indefinite-singular":"hidrometrică","error-unrecognized-form-indefinite-masculine-plural":"hidrometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrometrice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrometricul","definite-error-unrecognized-form-feminine-singular":"hidrometrica","definite-error-unrecognized-form-masculine-plural":"hidrometricii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrometricele"}},{"word":"hidrometrie","pos":"noun","definitions":["hydrometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrometrie","accusative-definite-nominative-singular":"hidrometria","accusative-indefinite-nominative-plural":"hidrometrii","accusative-definite-nominative-plural":"hidrometriile","dative-genitive-indefinite-singular":"hidrometrii","dative-definite-genitive-singular":"hidrometriei","dative-genitive-indefinite-plural":"hidrometrii","dative-definite-genitive-plural":"hidrometriilor","singular-vocative":"hidrometrie","plural-vocative":"hidrometriilor"}},{"word":"hidrometru","pos":"noun","definitions":["hydrometer"],"forms":{"plural":"hidrometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrometru","accusative-definite-nominative-singular":"hidrometrul","accusative-indefinite-nominative-plural":"hidrometre","accusative-definite-nominative-plural":"hidrometrele","dative-genitive-indefinite-singular":"hidrometru","dative-definite-genitive-singular":"hidrometrului","dative-genitive-indefinite-plural":"hidrometre","dative-definite-genitive-plural":"hidrometrelor","singular-vocative":"hidrometrule","plural-vocative":"hidrometrelor"}},{"word":"hidromineral","pos":"adj","definitions":["hydromineral"],"forms":{"feminine-singular":"hidrominerală","masculine-plural":"hidrominerali","feminine-neuter-plural":"hidrominerale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidromineral","error-unrecognized-form-feminine-indefinite-singular":"hidrominerală","error-unrecognized-form-indefinite-masculine-plural":"hidrominerali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrominerale","definite-error-unrecognized-form-masculine-neuter-singular":"hidromineralul","definite-error-unrecognized-form-feminine-singular":"hidrominerala","definite-error-unrecognized-form-masculine-plural":"hidromineralii","definite-error-unrecognized-form-feminine-neuter-plural":"hidromineralele"}},{"word":"hidromonitor","pos":"noun","definitions":["hydromonitor"],"forms":{"plural":"hidromonitoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidromonitor","accusative-definite-nominative-singular":"hidromonitorul","accusative-indefinite-nominative-plural":"hidromonitore","accusative-definite-nominative-plural":"hidromonitorele","dative-genitive-indefinite-singular":"hidromonitor","dative-definite-genitive-singular":"hidromonitorului","dative-genitive-indefinite-plural":"hidromonitore","dative-definite-genitive-plural":"hidromonitorelor","singular-vocative":"hidromonitorule","plural-vocative":"hidromonitorelor"}},{"word":"hidronefrotic","pos":"adj","definitions":["hydronephrotic"],"forms":{"feminine-singular":"hidronefrotică","masculine-plural":"hidronefrotici","feminine-neuter-plural":"hidronefrotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidronefrotic","error-unrecognized-form-feminine-indefinite-singular":"hidronefrotică","error-unrecognized-form-indefinite-masculine-plural":"hidronefrotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidronefrotice","definite-error-unrecognized-form-masculine-neuter-singular":"hidronefroticul","definite-error-unrecognized-form-feminine-singular":"hidronefrotica","definite-error-unrecognized-form-masculine-plural":"hidronefroticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidronefroticele"}},{"word":"hidronefroză","pos":"noun","definitions":["hydronephrosis"],"forms":{"plural":"hidronefroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidronefroză","accusative-definite-nominative-singular":"hidronefroza","accusative-indefinite-nominative-plural":"hidronefroze","accusative-definite-nominative-plural":"hidronefrozele","dative-genitive-indefinite-singular":"hidronefroze","dative-definite-genitive-singular":"hidronefrozei","dative-genitive-indefinite-plural":"hidronefroze","dative-definite-genitive-plural":"hidronefrozelor","singular-vocative":"hidronefroză","plural-vocative":"hidronefrozelor"}},{"word":"hidronim","pos":"noun","definitions":["hydronym"],"forms":{"plural":"hidronime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidronim","accusative-definite-nominative-singular":"hidronimul","accusative-indefinite-nominative-plural":"hidronime","accusative-definite-nominative-plural":"hidronimele","dative-genitive-indefinite-singular":"hidronim","dative-definite-genitive-singular":"hidronimului","dative-genitive-indefinite-plural":"hidronime","dative-definite-genitive-plural":"hidronimelor","singular-vocative":"hidronimule","plural-vocative":"hidronimelor"}},{"word":"hidronimie","pos":"noun","definitions":["hydronymy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidronimie","accusative-definite-nominative-singular":"hidronimia","accusative-indefinite-nominative-plural":"hidronimii","accusative-definite-nominative-plural":"hidronimiile","dative-genitive-indefinite-singular":"hidronimii","dative-definite-genitive-singular":"hidronimiei","dative-genitive-indefinite-plural":"hidronimii","dative-definite-genitive-plural":"hidronimiilor","singular-vocative":"hidronimie","plural-vocative":"hidronimiilor"}},{"word":"hidroniu","pos":"noun","definitions":["hydronium"],"forms":{"plural":"hidronii","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroniu","accusative-definite-nominative-singular":"hidroniul","accusative-indefinite-nominative-plural":"hidronii","accusative-definite-nominative-plural":"hidroniii","dative-genitive-indefinite-singular":"hidroniu","dative-definite-genitive-singular":"hidroniului","dative-genitive-indefinite-plural":"hidronii","dative-definite-genitive-plural":"hidroniilor","singular-vocative":"hidroniule","plural-vocative":"hidroniilor"}},{"word":"hidropat","pos":"adj","definitions":["hydropathic"],"forms":{"feminine-singular":"hidropată","masculine-plural":"hidropați","feminine-neuter-plural":"hidropate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidropat","error-unrecognized-form-feminine-indefinite-singular":"hidropată","error-unrecognized-form-indefinite-masculine-plural":"hidropați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidropate","definite-error-unrecognized-form-masculine-neuter-singular":"hidropatul","definite-error-unrecognized-form-feminine-singular":"hidropata","definite-error-unrecognized-form-masculine-plural":"hidropații","definite-error-unrecognized-form-feminine-neuter-plural":"hidropatele"}},{"word":"hidropatic","pos":"adj","definitions":["hydropathic"],"forms":{"feminine-singular":"hidropatică","masculine-plural":"hidropatici","feminine-neuter-plural":"hidropatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidropatic","error-unrecognized-form-feminine-indefinite-singular":"hidropatică","error-unrecognized-form-indefinite-masculine-plural":"hidropatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidropatice","definite-error-unrecognized-form-masculine-neuter-singular":"hidropaticul","definite-error-unrecognized-form-feminine-singular":"hidropatica","definite-error-unrecognized-form-masculine-plural":"hidropaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidropaticele"}},{"word":"hidropatie","pos":"noun","definitions":["hydropathy"],"forms":{"plural":"hidropatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidropatie","accusative-definite-nominative-singular":"hidropatia","accusative-indefinite-nominative-plural":"hidropatii","accusative-definite-nominative-plural":"hidropatiile","dative-genitive-indefinite-singular":"hidropatii","dative-definite-genitive-singular":"hidropatiei","dative-genitive-indefinite-plural":"hidropatii","dative-definite-genitive-plural":"hidropatiilor","singular-vocative":"hidropatie","plural-vocative":"hidropatiilor"}},{"word":"hidropedeză","pos":"noun","definitions":["hydropedesis, hyperhidrosis"],"forms":{"plural":"hidropedeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidropedeză","accusative-definite-nominative-singular":"hidropedeza","accusative-indefinite-nominative-plural":"hidropedeze","accusative-definite-nominative-plural":"hidropedezele","dative-genitive-indefinite-singular":"hidropedeze","dative-definite-genitive-singular":"hidropedezei","dative-genitive-indefinite-plural":"hidropedeze","dative-definite-genitive-plural":"hidropedezelor","singular-vocative":"hidropedeză","plural-vocative":"hidropedezelor"}},{"word":"hidropericard","pos":"noun","definitions":["hydropericardium"],"forms":{"plural":"hidropericarde","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidropericard","accusative-definite-nominative-singular":"hidropericardul","accusative-indefinite-nominative-plural":"hidropericarde","accusative-definite-nominative-plural":"hidropericardele","dative-genitive-indefinite-singular":"hidropericard","dative-definite-genitive-singular":"hidropericardului","dative-genitive-indefinite-plural":"hidropericarde","dative-definite-genitive-plural":"hidropericardelor","singular-vocative":"hidropericardule","plural-vocative":"hidropericardelor"}},{"word":"hidropic","pos":"adj","definitions":["dropsical"],"forms":{"feminine-singular":"hidropică","masculine-plural":"hidropici","feminine-neuter-plural":"hidropice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidropic","error-unrecognized-form-feminine-indefinite-singular":"hidropică","error-unrecognized-form-indefinite-masculine-plural":"hidropici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidropice","definite-error-unrecognized-form-masculine-neuter-singular":"hidropicul","definite-error-unrecognized-form-feminine-singular":"hidropica","definite-error-unrecognized-form-masculine-plural":"hidropicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidropicele"}},{"word":"hidropică","pos":"noun","definitions":["female equivalent of hidropic"],"forms":{"plural":"hidropice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidropică","accusative-definite-nominative-singular":"hidropica","accusative-indefinite-nominative-plural":"hidropice","accusative-definite-nominative-plural":"hidropicele","dative-genitive-indefinite-singular":"hidropice","dative-definite-genitive-singular":"hidropicei","dative-genitive-indefinite-plural":"hidropice","dative-definite-genitive-plural":"hidropicelor","singular-vocative":"hidropică","plural-vocative":"hidropicelor"}},{"word":"hidropicoasă","pos":"noun","definitions":["female equivalent of hidropicos"],"forms":{"plural":"hidropicoase","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidropicoasă","accusative-definite-nominative-singular":"hidropicoasa","accusative-indefinite-nominative-plural":"hidropicoase","accusative-definite-nominative-plural":"hidropicoasele","dative-genitive-indefinite-singular":"hidropicoase","dative-definite-genitive-singular":"hidropicoasei","dative-genitive-indefinite-plural":"hidropicoase","dative-definite-genitive-plural":"hidropicoaselor","singular-vocative":"hidropicoasă","plural-vocative":"hidropicoaselor"}},{"word":"hidropicos","pos":"adj","definitions":["dropsical"],"forms":{"feminine-singular":"hidropicoasă","masculine-plural":"hidropicoși","feminine-neuter-plural":"hidropicoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidropicos","error-unrecognized-form-feminine-indefinite-singular":"hidropicoasă","error-unrecognized-form-indefinite-masculine-plural":"hidropicoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidropicoase","definite-error-unrecognized-form-masculine-neuter-singular":"hidropicosul","definite-error-unrecognized-form-feminine-singular":"hidropicoasa","definite-error-unrecognized-form-masculine-plural":"hidropicoșii","definite-error-unrecognized-form-feminine-neuter-plural":"hidropicoasele"}},{"word":"hidropicos","pos":"noun","definitions":["a person suffering from dropsy"],"forms":{"plural":"hidropicoși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidropicos","accusative-definite-nominative-singular":"hidropicosul","accusative-indefinite-nominative-plural":"hidropicoși","accusative-definite-nominative-plural":"hidropicoșii","dative-genitive-indefinite-singular":"hidropicos","dative-definite-genitive-singular":"hidropicosului","dative-genitive-indefinite-plural":"hidropicoși","dative-definite-genitive-plural":"hidropicoșilor","singular-vocative":"hidropicosule","plural-vocative":"hidropicoșilor"}},{"word":"hidropizie","pos":"noun","definitions":["dropsy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hidropizie","accusative-definite-nominative":"hidropizia","dative-genitive-indefinite":"hidropizii","dative-definite-genitive":"hidropiziei","vocative":"hidropizie"}},{"word":"hidroplan","pos":"noun","definitions":["hydroplane"],"forms":{"plural":"hidroplane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidroplan","accusative-definite-nominative-singular":"hidroplanul","accusative-indefinite-nominative-plural":"hidroplane","accusative-definite-nominative-plural":"hidroplanele","dative-genitive-indefinite-singular":"hidroplan","dative-definite-genitive-singular":"hidroplanului","dative-genitive-indefinite-plural":"hidroplane","dative-definite-genitive-plural":"hidroplanelor","singular-vocative":"hidroplanule","plural-vocative":"hidroplanelor"}},{"word":"hidroplana","pos":"verb","definitions":["to hydroplane"],"forms":{"canonical":"a hidroplana 1st conjugation","present-singular-third-person":"hidroplanează","participle-past":"hidroplanat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hidroplana","gerund":"hidroplanând","first-person-indicative-present-singular":"hidroplanez","indicative-present-second-person-singular":"hidroplanezi","indicative-present-singular-third-person":"hidroplanează","first-person-indicative-plural-present":"hidroplanăm","indicative-plural-present-second-person":"hidroplanați","indicative-plural-present-third-person":"hidroplanează","first-person-imperfect-indicative-singular":"hidroplanam","imperfect-indicative-second-person-singular":"hidroplanai","imperfect-indicative-singular-third-person":"hidroplana","first-person-imperfect-indicative-plural":"hidroplanam","imperfect-indicative-plural-second-person":"hidroplanați","imperfect-indicative-plural-third-person":"hidroplanau","first-person-indicative-perfect-singular":"hidroplanai","indicative-perfect-second-person-singular":"hidroplanași","indicative-perfect-singular-third-person":"hidroplană","first-person-indicative-perfect-plural":"hidroplanarăm","indicative-perfect-plural-second-person":"hidroplanarăți","indicative-perfect-plural-third-person":"hidroplanară","first-person-indicative-pluperfect-singular":"hidroplanasem","indicative-pluperfect-second-person-singular":"hidroplanaseși","indicative-pluperfect-singular-third-person":"hidroplanase","first-person-indicative-pluperfect-plural":"hidroplanaserăm","indicative-pluperfect-plural-second-person":"hidroplanaserăți","indicative-pluperfect-plural-third-person":"hidroplanaseră","first-person-present-singular-subjunctive":"să hidroplanez","present-second-person-singular-subjunctive":"să hidroplanezi","present-singular-subjunctive-third-person":"să hidroplaneze","first-person-plural-present-subjunctive":"să hidroplanăm","plural-present-second-person-subjunctive":"să hidroplanați","plural-present-subjunctive-third-person":"să hidroplaneze","imperative-second-person-singular":"hidroplanează","imperative-plural-second-person":"hidroplanați","imperative-negative-second-person-singular":"nu hidroplana","imperative-negative-plural-second-person":"nu hidroplanați"}},{"word":"hidroplanaj","pos":"noun","definitions":["aquaplaning"],"forms":{"plural":"hidroplanaje","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidroplanaj","accusative-definite-nominative-singular":"hidroplanajul","accusative-indefinite-nominative-plural":"hidroplanaje","accusative-definite-nominative-plural":"hidroplanajele","dative-genitive-indefinite-singular":"hidroplanaj","dative-definite-genitive-singular":"hidroplanajului","dative-genitive-indefinite-plural":"hidroplanaje","dative-definite-genitive-plural":"hidroplanajelor","singular-vocative":"hidroplanajule","plural-vocative":"hidroplanajelor"}},{"word":"hidroplanare","pos":"noun","definitions":["aquaplaning"],"forms":{"plural":"hidroplanări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hidroplanare","accusative-definite-nominative-singular":"hidroplanarea","accusative-indefinite-nominative-plural":"hidroplanări","accusative-definite-nominative-plural":"hidroplanările","dative-genitive-indefinite-singular":"hidroplanări","dative-definite-genitive-singular":"hidroplanării","dative-genitive-indefinite-plural":"hidroplanări","dative-definite-genitive-plural":"hidroplanărilor","singular-vocative":"hidroplanare","plural-vocative":"hidroplanărilor"}},{"word":"hidroplasmă","pos":"noun","definitions":["hydroplasm"],"forms":{"plural":"hidroplasmăe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroplasmă","accusative-definite-nominative-singular":"hidroplasma","accusative-indefinite-nominative-plural":"hidroplasmăe","accusative-definite-nominative-plural":"hidroplasmăele","dative-genitive-indefinite-singular":"hidroplasmăe","dative-definite-genitive-singular":"hidroplasmăei","dative-genitive-indefinite-plural":"hidroplasmăe","dative-definite-genitive-plural":"hidroplasmăelor","singular-vocative":"hidroplasmă","plural-vocative":"hidroplasmăelor"}},{"word":"hidropneumatic","pos":"adj","definitions":["hydropneumatic"],"forms":{"feminine-singular":"hidropneumatică","masculine-plural":"hidropneumatici","feminine-neuter-plural":"hidropneumatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidropneumatic","error-unrecognized-form-feminine-indefinite-singular":"hidropneumatică","error-unrecognized-form-indefinite-masculine-plural":"hidropneumatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidropneumatice","definite-error-unrecognized-form-masculine-neuter-singular":"hidropneumaticul","definite-error-unrecognized-form-feminine-singular":"hidropneumatica","definite-error-unrecognized-form-masculine-plural":"hidropneumaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidropneumaticele"}},{"word":"hidropneumotorax","pos":"noun","definitions":["hydropneumothorax"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hidropneumotorax","accusative-definite-nominative":"hidropneumotoraxul","dative-genitive-indefinite":"hidropneumotorax","dative-definite-genitive":"hidropneumotoraxului","vocative":"hidropneumotoraxule"}},{"word":"hidroponic","pos":"adj","definitions":["hydroponic"],"forms":{"feminine-singular":"hidroponică","masculine-plural":"hidroponici","feminine-neuter-plural":"hidroponice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroponic","error-unrecognized-form-feminine-indefinite-singular":"hidroponică","error-unrecognized-form-indefinite-masculine-plural":"hidroponici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroponice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroponicul","definite-error-unrecognized-form-feminine-singular":"hidroponica","definite-error-unrecognized-form-masculine-plural":"hidroponicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroponicele"}},{"word":"hidroponică","pos":"noun","definitions":["hydroponics"],"forms":{"plural":"hidroponici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidroponică","accusative-definite-nominative-singular":"hidroponica","accusative-indefinite-nominative-plural":"hidroponici","accusative-definite-nominative-plural":"hidroponicile","dative-genitive-indefinite-singular":"hidroponici","dative-definite-genitive-singular":"hidroponicii","dative-genitive-indefinite-plural":"hidroponici","dative-definite-genitive-plural":"hidroponicilor","singular-vocative":"hidroponică","plural-vocative":"hidroponicilor"}},{"word":"hidrosadenită","pos":"noun","definitions":["hidradenitis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrosadenită","accusative-definite-nominative-singular":"hidrosadenita","accusative-indefinite-nominative-plural":"hidrosadenite","accusative-definite-nominative-plural":"hidrosadenitele","dative-genitive-indefinite-singular":"hidrosadenite","dative-definite-genitive-singular":"hidrosadenitei","dative-genitive-indefinite-plural":"hidrosadenite","dative-definite-genitive-plural":"hidrosadenitelor","singular-vocative":"hidrosadenită","plural-vocative":"hidrosadenitelor"}},{"word":"hidrosalpinx","pos":"noun","definitions":["hydrosalpinx"],"forms":{"plural":"hidrosalpinxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidrosalpinx","accusative-definite-nominative-singular":"hidrosalpinxul","accusative-indefinite-nominative-plural":"hidrosalpinxuri","accusative-definite-nominative-plural":"hidrosalpinxurile","dative-genitive-indefinite-singular":"hidrosalpinx","dative-definite-genitive-singular":"hidrosalpinxului","dative-genitive-indefinite-plural":"hidrosalpinxuri","dative-definite-genitive-plural":"hidrosalpinxurilor","singular-vocative":"hidrosalpinxule","plural-vocative":"hidrosalpinxurilor"}},{"word":"hidrosferă","pos":"noun","definitions":["hydrosphere"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrosferă","accusative-definite-nominative-singular":"hidrosfera","accusative-indefinite-nominative-plural":"hidrosfere","accusative-definite-nominative-plural":"hidrosferele","dative-genitive-indefinite-singular":"hidrosfere","dative-definite-genitive-singular":"hidrosferei","dative-genitive-indefinite-plural":"hidrosfere","dative-definite-genitive-plural":"hidrosferelor","singular-vocative":"hidrosferă","plural-vocative":"hidrosferelor"}},{"word":"hidrosol","pos":"noun","definitions":["hydrosol"],"forms":{"plural":"hidrosoluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidrosol","accusative-definite-nominative-singular":"hidrosolul","accusative-indefinite-nominative-plural":"hidrosoluri","accusative-definite-nominative-plural":"hidrosolurile","dative-genitive-indefinite-singular":"hidrosol","dative-definite-genitive-singular":"hidrosolului","dative-genitive-indefinite-plural":"hidrosoluri","dative-definite-genitive-plural":"hidrosolurilor","singular-vocative":"hidrosolule","plural-vocative":"hidrosolurilor"}},{"word":"hidrosolubil","pos":"adj","definitions":["hydrosoluble, water soluble"],"forms":{"feminine-singular":"hidrosolubilă","masculine-plural":"hidrosolubili","feminine-neuter-plural":"hidrosolubile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrosolubil","error-unrecognized-form-feminine-indefinite-singular":"hidrosolubilă","error-unrecognized-form-indefinite-masculine-plural":"hidrosolubili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrosolubile","definite-error-unrecognized-form-masculine-neuter-singular":"hidrosolubilul","definite-error-unrecognized-form-feminine-singular":"hidrosolubila","definite-error-unrecognized-form-masculine-plural":"hidrosolubilii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrosolubilele"}},{"word":"hidrostatic","pos":"adj","definitions":["hydrostatic"],"forms":{"feminine-singular":"hidrostatică","masculine-plural":"hidrostatici","feminine-neuter-plural":"hidrostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrostatic","error-unrecognized-form-feminine-indefinite-singular":"hidrostatică","error-unrecognized-form-indefinite-masculine-plural":"hidrostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrostatice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrostaticul","definite-error-unrecognized-form-feminine-singular":"hidrostatica","definite-error-unrecognized-form-masculine-plural":"hidrostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrostaticele"}},{"word":"hidrostatică","pos":"noun","definitions":["hydrostatics"],"forms":{"plural":"hidrostatici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrostatică","accusative-definite-nominative-singular":"hidrostatica","accusative-indefinite-nominative-plural":"hidrostatici","accusative-definite-nominative-plural":"hidrostaticile","dative-genitive-indefinite-singular":"hidrostatici","dative-definite-genitive-singular":"hidrostaticii","dative-genitive-indefinite-plural":"hidrostatici","dative-definite-genitive-plural":"hidrostaticilor","singular-vocative":"hidrostatică","plural-vocative":"hidrostaticilor"}},{"word":"hidrostatician","pos":"noun","definitions":["hydrostatician"],"forms":{"plural":"hidrostaticieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrostatician","accusative-definite-nominative-singular":"hidrostaticianul","accusative-indefinite-nominative-plural":"hidrostaticieni","accusative-definite-nominative-plural":"hidrostaticienii","dative-genitive-indefinite-singular":"hidrostatician","dative-definite-genitive-singular":"hidrostaticianului","dative-genitive-indefinite-plural":"hidrostaticieni","dative-definite-genitive-plural":"hidrostaticienilor","singular-vocative":"hidrostaticianule","plural-vocative":"hidrostaticienilor"}},{"word":"hidrotehnic","pos":"adj","definitions":["hydrotechnical"],"forms":{"feminine-singular":"hidrotehnică","masculine-plural":"hidrotehnici","feminine-neuter-plural":"hidrotehnice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrotehnic","error-unrecognized-form-feminine-indefinite-singular":"hidrotehnică","error-unrecognized-form-indefinite-masculine-plural":"hidrotehnici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrotehnice","definite-error-unrecognized-form-masculine-neuter-singular":"hidrotehnicul","definite-error-unrecognized-form-feminine-singular":"hidrotehnica","definite-error-unrecognized-form-masculine-plural":"hidrotehnicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrotehnicele"}},{"word":"hidrotehnică","pos":"noun","definitions":["hydrotechnology","hydraulic engineering"],"forms":{"plural":"hidrotehnici","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrotehnică","accusative-definite-nominative-singular":"hidrotehnica","accusative-indefinite-nominative-plural":"hidrotehnici","accusative-definite-nominative-plural":"hidrotehnicile","dative-genitive-indefinite-singular":"hidrotehnici","dative-definite-genitive-singular":"hidrotehnicii","dative-genitive-indefinite-plural":"hidrotehnici","dative-definite-genitive-plural":"hidrotehnicilor","singular-vocative":"hidrotehnică","plural-vocative":"hidrotehnicilor"}},{"word":"hidrotehnician","pos":"noun","definitions":["hydrotechnician"],"forms":{"plural":"hidrotehnicieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidrotehnician","accusative-definite-nominative-singular":"hidrotehnicianul","accusative-indefinite-nominative-plural":"hidrotehnicieni","accusative-definite-nominative-plural":"hidrotehnicienii","dative-genitive-indefinite-singular":"hidrotehnician","dative-definite-genitive-singular":"hidrotehnicianului","dative-genitive-indefinite-plural":"hidrotehnicieni","dative-definite-genitive-plural":"hidrotehnicienilor","singular-vocative":"hidrotehnicianule","plural-vocative":"hidrotehnicienilor"}},{"word":"hidrotehniciană","pos":"noun","definitions":["female equivalent of hidrotehnician"],"forms":{"plural":"hidrotehniciene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidrotehniciană","accusative-definite-nominative-singular":"hidrotehniciana","accusative-indefinite-nominative-plural":"hidrotehniciene","accusative-definite-nominative-plural":"hidrotehnicienele","dative-genitive-indefinite-singular":"hidrotehniciene","dative-definite-genitive-singular":"hidrotehnicienei","dative-genitive-indefinite-plural":"hidrotehniciene","dative-definite-genitive-plural":"hidrotehnicienelor","singular-vocative":"hidrotehniciană","plural-vocative":"hidrotehnicienelor"}},{"word":"hidroterapeut","pos":"noun","definitions":["hydrotherapist"],"forms":{"plural":"hidroterapeuți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroterapeut","accusative-definite-nominative-singular":"hidroterapeutul","accusative-indefinite-nominative-plural":"hidroterapeuți","accusative-definite-nominative-plural":"hidroterapeuții","dative-genitive-indefinite-singular":"hidroterapeut","dative-definite-genitive-singular":"hidroterapeutului","dative-genitive-indefinite-plural":"hidroterapeuți","dative-definite-genitive-plural":"hidroterapeuților","singular-vocative":"hidroterapeutule","plural-vocative":"hidroterapeuților"}},{"word":"hidroterapic","pos":"adj","definitions":["hydrotherapeutic"],"forms":{"feminine-singular":"hidroterapică","masculine-plural":"hidroterapici","feminine-neuter-plural":"hidroterapice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidroterapic","error-unrecognized-form-feminine-indefinite-singular":"hidroterapică","error-unrecognized-form-indefinite-masculine-plural":"hidroterapici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidroterapice","definite-error-unrecognized-form-masculine-neuter-singular":"hidroterapicul","definite-error-unrecognized-form-feminine-singular":"hidroterapica","definite-error-unrecognized-form-masculine-plural":"hidroterapicii","definite-error-unrecognized-form-feminine-neuter-plural":"hidroterapicele"}},{"word":"hidroterapie","pos":"noun","definitions":["hydrotherapy"],"forms":{"plural":"hidroterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidroterapie","accusative-definite-nominative-singular":"hidroterapia","accusative-indefinite-nominative-plural":"hidroterapii","accusative-definite-nominative-plural":"hidroterapiile","dative-genitive-indefinite-singular":"hidroterapii","dative-definite-genitive-singular":"hidroterapiei","dative-genitive-indefinite-plural":"hidroterapii","dative-definite-genitive-plural":"hidroterapiilor","singular-vocative":"hidroterapie","plural-vocative":"hidroterapiilor"}},{"word":"hidrotermal","pos":"adj","definitions":["hydrothermal"],"forms":{"feminine-singular":"hidrotermală","masculine-plural":"hidrotermali","feminine-neuter-plural":"hidrotermale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hidrotermal","error-unrecognized-form-feminine-indefinite-singular":"hidrotermală","error-unrecognized-form-indefinite-masculine-plural":"hidrotermali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hidrotermale","definite-error-unrecognized-form-masculine-neuter-singular":"hidrotermalul","definite-error-unrecognized-form-feminine-singular":"hidrotermala","definite-error-unrecognized-form-masculine-plural":"hidrotermalii","definite-error-unrecognized-form-feminine-neuter-plural":"hidrotermalele"}},{"word":"hidrotimetrie","pos":"noun","definitions":["hydrotimetry"],"forms":{"plural":"hidrotimetrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hidrotimetrie","accusative-definite-nominative-singular":"hidrotimetria","accusative-indefinite-nominative-plural":"hidrotimetrii","accusative-definite-nominative-plural":"hidrotimetriile","dative-genitive-indefinite-singular":"hidrotimetrii","dative-definite-genitive-singular":"hidrotimetriei","dative-genitive-indefinite-plural":"hidrotimetrii","dative-definite-genitive-plural":"hidrotimetriilor","singular-vocative":"hidrotimetrie","plural-vocative":"hidrotimetriilor"}},{"word":"hidrotorax","pos":"noun","definitions":["hydrothorax"],"forms":{"plural":"hidrotoraxuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hidrotorax","accusative-definite-nominative-singular":"hidrotoraxul","accusative-indefinite-nominative-plural":"hidrotoraxuri","accusative-definite-nominative-plural":"hidrotoraxurile","dative-genitive-indefinite-singular":"hidrotorax","dative-definite-genitive-singular":"hidrotoraxului","dative-genitive-indefinite-plural":"hidrotoraxuri","dative-definite-genitive-plural":"hidrotoraxurilor","singular-vocative":"hidrotoraxule","plural-vocative":"hidrotoraxurilor"}},{"word":"hidrotropism","pos":"noun","definitions":["hydrotropism"],"forms":{"plural":"hidrotropisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrotropism","accusative-definite-nominative-singular":"hidrotropismul","accusative-indefinite-nominative-plural":"hidrotropisme","accusative-definite-nominative-plural":"hidrotropismele","dative-genitive-indefinite-singular":"hidrotropism","dative-definite-genitive-singular":"hidrotropismului","dative-genitive-indefinite-plural":"hidrotropisme","dative-definite-genitive-plural":"hidrotropismelor","singular-vocative":"hidrotropismule","plural-vocative":"hidrotropismelor"}},{"word":"hidroxid","pos":"noun","definitions":["hydroxide"],"forms":{"plural":"hidroxizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroxid","accusative-definite-nominative-singular":"hidroxidul","accusative-indefinite-nominative-plural":"hidroxizi","accusative-definite-nominative-plural":"hidroxizii","dative-genitive-indefinite-singular":"hidroxid","dative-definite-genitive-singular":"hidroxidului","dative-genitive-indefinite-plural":"hidroxizi","dative-definite-genitive-plural":"hidroxizilor","singular-vocative":"hidroxidule","plural-vocative":"hidroxizilor"}},{"word":"hidroxid de litiu","pos":"noun","definitions":["lithium hydroxide"]},{"word":"hidroxid de magneziu","pos":"noun","definitions":["magnesium hydroxide"]},{"word":"hidroxid de sodiu","pos":"noun","definitions":["caustic soda"]},{"word":"hidroxil","pos":"noun","definitions":["hydroxyl"],"forms":{"plural":"hidroxili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hidroxil","accusative-definite-nominative-singular":"hidroxilul","accusative-indefinite-nominative-plural":"hidroxili","accusative-definite-nominative-plural":"hidroxilii","dative-genitive-indefinite-singular":"hidroxil","dative-definite-genitive-singular":"hidroxilului","dative-genitive-indefinite-plural":"hidroxili","dative-definite-genitive-plural":"hidroxililor","singular-vocative":"hidroxilule","plural-vocative":"hidroxililor"}},{"word":"hidroxilamină","pos":"noun","definitions":["hydroxylamine"],"forms":{"plural":"hidroxilamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroxilamină","accusative-definite-nominative-singular":"hidroxilamina","accusative-indefinite-nominative-plural":"hidroxilamine","accusative-definite-nominative-plural":"hidroxilaminele","dative-genitive-indefinite-singular":"hidroxilamine","dative-definite-genitive-singular":"hidroxilaminei","dative-genitive-indefinite-plural":"hidroxilamine","dative-definite-genitive-plural":"hidroxilaminelor","singular-vocative":"hidroxilamină","plural-vocative":"hidroxilaminelor"}},{"word":"hidroză","pos":"noun","definitions":["hydrosis"],"forms":{"plural":"hidroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hidroză","accusative-definite-nominative-singular":"hidroza","accusative-indefinite-nominative-plural":"hidroze","accusative-definite-nominative-plural":"hidrozele","dative-genitive-indefinite-singular":"hidroze","dative-definite-genitive-singular":"hidrozei","dative-genitive-indefinite-plural":"hidroze","dative-definite-genitive-plural":"hidrozelor","singular-vocative":"hidroză","plural-vocative":"hidrozelor"}},{"word":"hidrozoar","pos":"noun","definitions":["hydrozoan"],"forms":{"plural":"hidrozoare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hidrozoar","accusative-definite-nominative-singular":"hidrozoarul","accusative-indefinite-nominative-plural":"hidrozoare","accusative-definite-nominative-plural":"hidrozoarele","dative-genitive-indefinite-singular":"hidrozoar","dative-definite-genitive-singular":"hidrozoarului","dative-genitive-indefinite-plural":"hidrozoare","dative-definite-genitive-plural":"hidrozoarelor","singular-vocative":"hidrozoarule","plural-vocative":"hidrozoarelor"}},{"word":"hidrură","pos":"noun","definitions":["hydride"],"forms":{"plural":"hidruri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hidrură","accusative-definite-nominative-singular":"hidrura","accusative-indefinite-nominative-plural":"hidruri","accusative-definite-nominative-plural":"hidrurile","dative-genitive-indefinite-singular":"hidruri","dative-definite-genitive-singular":"hidrurii","dative-genitive-indefinite-plural":"hidruri","dative-definite-genitive-plural":"hidrurilor","singular-vocative":"hidrură","plural-vocative":"hidrurilor"}},{"word":"hiena","pos":"noun","definitions":["definite nominative/accusative singular of hienă"],"pronunciation":"[hiˈena]","gender":"f"},{"word":"hienă","pos":"noun","definitions":["hyena"],"forms":{"plural":"hiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hienă","accusative-definite-nominative-singular":"hiena","accusative-indefinite-nominative-plural":"hiene","accusative-definite-nominative-plural":"hienele","dative-genitive-indefinite-singular":"hiene","dative-definite-genitive-singular":"hienei","dative-genitive-indefinite-plural":"hiene","dative-definite-genitive-plural":"hienelor","singular-vocative":"hienă","plural-vocative":"hienelor"}},{"word":"hiene","pos":"noun","definitions":["inflection of hienă:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"hienidă","pos":"noun","definitions":["hyenid"],"forms":{"plural":"hienide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hienidă","accusative-definite-nominative-singular":"hienida","accusative-indefinite-nominative-plural":"hienide","accusative-definite-nominative-plural":"hienidele","dative-genitive-indefinite-singular":"hienide","dative-definite-genitive-singular":"hienidei","dative-genitive-indefinite-plural":"hienide","dative-definite-genitive-plural":"hienidelor","singular-vocative":"hienidă","plural-vocative":"hienidelor"}},{"word":"hieno","pos":"noun","definitions":["vocative singular of hienă"],"pronunciation":"[hiˈeno]","gender":"f"},{"word":"hier","pos":"noun","definitions":["the name of the \"h\" in the Cyrillic alphabet"],"forms":{"plural":"hieri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hier","accusative-definite-nominative-singular":"hierul","accusative-indefinite-nominative-plural":"hieri","accusative-definite-nominative-plural":"hierii","dative-genitive-indefinite-singular":"hier","dative-definite-genitive-singular":"hierului","dative-genitive-indefinite-plural":"hieri","dative-definite-genitive-plural":"hierilor","singular-vocative":"hierule","plural-vocative":"hierilor"}},{"word":"hieratic","pos":"adj","definitions":["hieratic"],"forms":{"feminine-singular":"hieratică","masculine-plural":"hieratici","feminine-neuter-plural":"hieratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hieratic","error-unrecognized-form-feminine-indefinite-singular":"hieratică","error-unrecognized-form-indefinite-masculine-plural":"hieratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hieratice","definite-error-unrecognized-form-masculine-neuter-singular":"hieraticul","definite-error-unrecognized-form-feminine-singular":"hieratica","definite-error-unrecognized-form-masculine-plural":"hieraticii","definite-error-unrecognized-form-feminine-neuter-plural":"hieraticele"}},{"word":"hieratism","pos":"noun","definitions":["hieraticism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hieratism","accusative-definite-nominative-singular":"hieratismul","accusative-indefinite-nominative-plural":"hieratisme","accusative-definite-nominative-plural":"hieratismele","dative-genitive-indefinite-singular":"hieratism","dative-definite-genitive-singular":"hieratismului","dative-genitive-indefinite-plural":"hieratisme","dative-definite-genitive-plural":"hieratismelor","singular-vocative":"hieratismule","plural-vocative":"hieratismelor"}},{"word":"hierb","pos":"noun","definitions":["alternative form of herb"],"forms":{"plural":"hierburi"}},{"word":"hierodiacon","pos":"noun","definitions":["hierodeacon"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hierodiacon","accusative-definite-nominative":"hierodiaconul","dative-genitive-indefinite":"hierodiacon","dative-definite-genitive":"hierodiaconului","vocative":"hierodiaconule"}},{"word":"hierofant","pos":"noun","definitions":["hierophant"],"forms":{"plural":"hierofanți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hierofant","accusative-definite-nominative-singular":"hierofantul","accusative-indefinite-nominative-plural":"hierofanți","accusative-definite-nominative-plural":"hierofanții","dative-genitive-indefinite-singular":"hierofant","dative-definite-genitive-singular":"hierofantului","dative-genitive-indefinite-plural":"hierofanți","dative-definite-genitive-plural":"hierofanților","singular-vocative":"hierofantule","plural-vocative":"hierofanților"}},{"word":"hieroglifă","pos":"noun","definitions":["hieroglyph"],"pronunciation":"/hi.e.roˈɡli.fə/","forms":{"plural":"hieroglife","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hieroglifă","accusative-definite-nominative-singular":"hieroglifa","accusative-indefinite-nominative-plural":"hieroglife","accusative-definite-nominative-plural":"hieroglifele","dative-genitive-indefinite-singular":"hieroglife","dative-definite-genitive-singular":"hieroglifei","dative-genitive-indefinite-plural":"hieroglife","dative-definite-genitive-plural":"hieroglifelor","singular-vocative":"hieroglifă","plural-vocative":"hieroglifelor","alternative":"ieroglifă"}},{"word":"hieroglific","pos":"adj","definitions":["hieroglyphic"],"pronunciation":"/hi.e.roˈɡli.fik/","forms":{"feminine-singular":"hieroglifică","masculine-plural":"hieroglifici","feminine-neuter-plural":"hieroglifice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hieroglific","error-unrecognized-form-feminine-indefinite-singular":"hieroglifică","error-unrecognized-form-indefinite-masculine-plural":"hieroglifici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hieroglifice","definite-error-unrecognized-form-masculine-neuter-singular":"hieroglificul","definite-error-unrecognized-form-feminine-singular":"hieroglifica","definite-error-unrecognized-form-masculine-plural":"hieroglificii","definite-error-unrecognized-form-feminine-neuter-plural":"hieroglificele","alternative":"ieroglific"}},{"word":"hifă","pos":"noun","definitions":["hypha"],"forms":{"plural":"hife","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hifă","accusative-definite-nominative-singular":"hifa","accusative-indefinite-nominative-plural":"hife","accusative-definite-nominative-plural":"hifele","dative-genitive-indefinite-singular":"hife","dative-definite-genitive-singular":"hifei","dative-genitive-indefinite-plural":"hife","dative-definite-genitive-plural":"hifelor","singular-vocative":"hifă","plural-vocative":"hifelor"}},{"word":"high","pos":"adj","definitions":["high (intoxicated)"],"examples":[{"ro":"Hai cu noi să fi high!","en":"Come with us to get high!"}],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"high","error-unrecognized-form-feminine-indefinite-singular":"high","error-unrecognized-form-indefinite-masculine-plural":"high","error-unrecognized-form-feminine-indefinite-neuter-plural":"high","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"high-life","pos":"noun","definitions":["high life"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"high-life","accusative-definite-nominative":"high-lifeul","dative-genitive-indefinite":"high-life","dative-definite-genitive":"high-lifeului","vocative":"high-lifeule"}},{"word":"higienă","pos":"noun","definitions":["alternative form of igienă"],"forms":{"plural":"higiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"higienă","accusative-definite-nominative-singular":"higiena","accusative-indefinite-nominative-plural":"higiene","accusative-definite-nominative-plural":"higienele","dative-genitive-indefinite-singular":"higiene","dative-definite-genitive-singular":"higienei","dative-genitive-indefinite-plural":"higiene","dative-definite-genitive-plural":"higienelor","singular-vocative":"higienă","plural-vocative":"higienelor"}},{"word":"higienic","pos":"adj","definitions":["alternative form of igienic"],"forms":{"feminine-singular":"higienică","masculine-plural":"higienici","feminine-neuter-plural":"higienice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"higienic","error-unrecognized-form-feminine-indefinite-singular":"higienică","error-unrecognized-form-indefinite-masculine-plural":"higienici","error-unrecognized-form-feminine-indefinite-neuter-plural":"higienice","definite-error-unrecognized-form-masculine-neuter-singular":"higienicul","definite-error-unrecognized-form-feminine-singular":"higienica","definite-error-unrecognized-form-masculine-plural":"higienicii","definite-error-unrecognized-form-feminine-neuter-plural":"higienicele"}},{"word":"higienist","pos":"noun","definitions":["alternative form of igienist"],"forms":{"plural":"higieniști"}},{"word":"higienistă","pos":"noun","definitions":["female equivalent of higienist"],"forms":{"plural":"higieniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"higienistă","accusative-definite-nominative-singular":"higienista","accusative-indefinite-nominative-plural":"higieniste","accusative-definite-nominative-plural":"higienistele","dative-genitive-indefinite-singular":"higieniste","dative-definite-genitive-singular":"higienistei","dative-genitive-indefinite-plural":"higieniste","dative-definite-genitive-plural":"higienistelor","singular-vocative":"higienistă","plural-vocative":"higienistelor"}},{"word":"higrofil","pos":"adj","definitions":["hygrophilous"],"forms":{"feminine-singular":"higrofilă","masculine-plural":"higrofili","feminine-neuter-plural":"higrofile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"higrofil","error-unrecognized-form-feminine-indefinite-singular":"higrofilă","error-unrecognized-form-indefinite-masculine-plural":"higrofili","error-unrecognized-form-feminine-indefinite-neuter-plural":"higrofile","definite-error-unrecognized-form-masculine-neuter-singular":"higrofilul","definite-error-unrecognized-form-feminine-singular":"higrofila","definite-error-unrecognized-form-masculine-plural":"higrofilii","definite-error-unrecognized-form-feminine-neuter-plural":"higrofilele"}},{"word":"higrofită","pos":"noun","definitions":["hygrophyte"],"forms":{"plural":"higrofite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"higrofită","accusative-definite-nominative-singular":"higrofita","accusative-indefinite-nominative-plural":"higrofite","accusative-definite-nominative-plural":"higrofitele","dative-genitive-indefinite-singular":"higrofite","dative-definite-genitive-singular":"higrofitei","dative-genitive-indefinite-plural":"higrofite","dative-definite-genitive-plural":"higrofitelor","singular-vocative":"higrofită","plural-vocative":"higrofitelor"}},{"word":"higrograf","pos":"noun","definitions":["hygrograph"],"forms":{"plural":"higrografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"higrograf","accusative-definite-nominative-singular":"higrograful","accusative-indefinite-nominative-plural":"higrografe","accusative-definite-nominative-plural":"higrografele","dative-genitive-indefinite-singular":"higrograf","dative-definite-genitive-singular":"higrografului","dative-genitive-indefinite-plural":"higrografe","dative-definite-genitive-plural":"higrografelor","singular-vocative":"higrografule","plural-vocative":"higrografelor"}},{"word":"higrogramă","pos":"noun","definitions":["hygrogram"],"forms":{"plural":"higrograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"higrogramă","accusative-definite-nominative-singular":"higrograma","accusative-indefinite-nominative-plural":"higrograme","accusative-definite-nominative-plural":"higrogramele","dative-genitive-indefinite-singular":"higrograme","dative-definite-genitive-singular":"higrogramei","dative-genitive-indefinite-plural":"higrograme","dative-definite-genitive-plural":"higrogramelor","singular-vocative":"higrogramă","plural-vocative":"higrogramelor"}},{"word":"higrologie","pos":"noun","definitions":["hygrology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"higrologie","accusative-definite-nominative-singular":"higrologia","accusative-indefinite-nominative-plural":"higrologii","accusative-definite-nominative-plural":"higrologiile","dative-genitive-indefinite-singular":"higrologii","dative-definite-genitive-singular":"higrologiei","dative-genitive-indefinite-plural":"higrologii","dative-definite-genitive-plural":"higrologiilor","singular-vocative":"higrologie","plural-vocative":"higrologiilor"}},{"word":"higromă","pos":"noun","definitions":["hygroma"],"forms":{"plural":"higrome","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"higromă","accusative-definite-nominative-singular":"higroma","accusative-indefinite-nominative-plural":"higrome","accusative-definite-nominative-plural":"higromele","dative-genitive-indefinite-singular":"higrome","dative-definite-genitive-singular":"higromei","dative-genitive-indefinite-plural":"higrome","dative-definite-genitive-plural":"higromelor","singular-vocative":"higromă","plural-vocative":"higromelor"}},{"word":"higrometric","pos":"adj","definitions":["hygrometric"],"forms":{"feminine-singular":"higrometrică","masculine-plural":"higrometrici","feminine-neuter-plural":"higrometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"higrometric","error-unrecognized-form-feminine-indefinite-singular":"higrometrică","error-unrecognized-form-indefinite-masculine-plural":"higrometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"higrometrice","definite-error-unrecognized-form-masculine-neuter-singular":"higrometricul","definite-error-unrecognized-form-feminine-singular":"higrometrica","definite-error-unrecognized-form-masculine-plural":"higrometricii","definite-error-unrecognized-form-feminine-neuter-plural":"higrometricele"}},{"word":"higrometrie","pos":"noun","definitions":["hygrometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"higrometrie","accusative-definite-nominative":"higrometria","dative-genitive-indefinite":"higrometrii","dative-definite-genitive":"higrometriei","vocative":"higrometrie"}},{"word":"higrometru","pos":"noun","definitions":["hygrometer"],"forms":{"plural":"higrometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"higrometru","accusative-definite-nominative-singular":"higrometrul","accusative-indefinite-nominative-plural":"higrometre","accusative-definite-nominative-plural":"higrometrele","dative-genitive-indefinite-singular":"higrometru","dative-definite-genitive-singular":"higrometrului","dative-genitive-indefinite-plural":"higrometre","dative-definite-genitive-plural":"higrometrelor","singular-vocative":"higrometrule","plural-vocative":"higrometrelor"}},{"word":"higroscop","pos":"noun","definitions":["hygroscope"],"forms":{"plural":"higroscoape","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"higroscop","accusative-definite-nominative-singular":"higroscopul","accusative-indefinite-nominative-plural":"higroscoape","accusative-definite-nominative-plural":"higroscoapele","dative-genitive-indefinite-singular":"higroscop","dative-definite-genitive-singular":"higroscopului","dative-genitive-indefinite-plural":"higroscoape","dative-definite-genitive-plural":"higroscoapelor","singular-vocative":"higroscopule","plural-vocative":"higroscoapelor"}},{"word":"higroscopic","pos":"adj","definitions":["hygroscopic"],"forms":{"feminine-singular":"higroscopică","masculine-plural":"higroscopici","feminine-neuter-plural":"higroscopice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"higroscopic","error-unrecognized-form-feminine-indefinite-singular":"higroscopică","error-unrecognized-form-indefinite-masculine-plural":"higroscopici","error-unrecognized-form-feminine-indefinite-neuter-plural":"higroscopice","definite-error-unrecognized-form-masculine-neuter-singular":"higroscopicul","definite-error-unrecognized-form-feminine-singular":"higroscopica","definite-error-unrecognized-form-masculine-plural":"higroscopicii","definite-error-unrecognized-form-feminine-neuter-plural":"higroscopicele"}},{"word":"higroscopicitate","pos":"noun","definitions":["hygroscopicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"higroscopicitate","accusative-definite-nominative-singular":"higroscopicitatea","accusative-indefinite-nominative-plural":"higroscopicități","accusative-definite-nominative-plural":"higroscopicitățile","dative-genitive-indefinite-singular":"higroscopicități","dative-definite-genitive-singular":"higroscopicității","dative-genitive-indefinite-plural":"higroscopicități","dative-definite-genitive-plural":"higroscopicităților","singular-vocative":"higroscopicitate","plural-vocative":"higroscopicităților"}},{"word":"higroscopie","pos":"noun","definitions":["hygroscopy"],"forms":{"plural":"higroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"higroscopie","accusative-definite-nominative-singular":"higroscopia","accusative-indefinite-nominative-plural":"higroscopii","accusative-definite-nominative-plural":"higroscopiile","dative-genitive-indefinite-singular":"higroscopii","dative-definite-genitive-singular":"higroscopiei","dative-genitive-indefinite-plural":"higroscopii","dative-definite-genitive-plural":"higroscopiilor","singular-vocative":"higroscopie","plural-vocative":"higroscopiilor"}},{"word":"higrostat","pos":"noun","definitions":["hygrostat"],"forms":{"plural":"higrostate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"higrostat","accusative-definite-nominative-singular":"higrostatul","accusative-indefinite-nominative-plural":"higrostate","accusative-definite-nominative-plural":"higrostatele","dative-genitive-indefinite-singular":"higrostat","dative-definite-genitive-singular":"higrostatului","dative-genitive-indefinite-plural":"higrostate","dative-definite-genitive-plural":"higrostatelor","singular-vocative":"higrostatule","plural-vocative":"higrostatelor"}},{"word":"hihoti","pos":"verb","definitions":["obsolete form of chicoti"],"forms":{"canonical":"a hihoti 4th conjugation","present-singular-third-person":"hihotește","participle-past":"hihotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hihoti","gerund":"hihotind","first-person-indicative-present-singular":"hihotesc","indicative-present-second-person-singular":"hihotești","indicative-present-singular-third-person":"hihotește","first-person-indicative-plural-present":"hihotim","indicative-plural-present-second-person":"hihotiți","indicative-plural-present-third-person":"hihotesc","first-person-imperfect-indicative-singular":"hihoteam","imperfect-indicative-second-person-singular":"hihoteai","imperfect-indicative-singular-third-person":"hihotea","first-person-imperfect-indicative-plural":"hihoteam","imperfect-indicative-plural-second-person":"hihoteați","imperfect-indicative-plural-third-person":"hihoteau","first-person-indicative-perfect-singular":"hihotii","indicative-perfect-second-person-singular":"hihotiși","indicative-perfect-singular-third-person":"hihoti","first-person-indicative-perfect-plural":"hihotirăm","indicative-perfect-plural-second-person":"hihotirăți","indicative-perfect-plural-third-person":"hihotiră","first-person-indicative-pluperfect-singular":"hihotisem","indicative-pluperfect-second-person-singular":"hihotiseși","indicative-pluperfect-singular-third-person":"hihotise","first-person-indicative-pluperfect-plural":"hihotiserăm","indicative-pluperfect-plural-second-person":"hihotiserăți","indicative-pluperfect-plural-third-person":"hihotiseră","first-person-present-singular-subjunctive":"să hihotesc","present-second-person-singular-subjunctive":"să hihotești","present-singular-subjunctive-third-person":"să hihotească","first-person-plural-present-subjunctive":"să hihotim","plural-present-second-person-subjunctive":"să hihotiți","plural-present-subjunctive-third-person":"să hihotească","imperative-second-person-singular":"hihotește","imperative-plural-second-person":"hihotiți","imperative-negative-second-person-singular":"nu hihoti","imperative-negative-plural-second-person":"nu hihotiți"}},{"word":"hil","pos":"noun","definitions":["hilum"],"forms":{"plural":"hiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hil","accusative-definite-nominative-singular":"hilul","accusative-indefinite-nominative-plural":"hiluri","accusative-definite-nominative-plural":"hilurile","dative-genitive-indefinite-singular":"hil","dative-definite-genitive-singular":"hilului","dative-genitive-indefinite-plural":"hiluri","dative-definite-genitive-plural":"hilurilor","singular-vocative":"hilule","plural-vocative":"hilurilor"}},{"word":"hilar","pos":"adj","definitions":["alternative form of ilar"],"forms":{"feminine-singular":"hilară","masculine-plural":"hilari","feminine-neuter-plural":"hilare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hilar","error-unrecognized-form-feminine-indefinite-singular":"hilară","error-unrecognized-form-indefinite-masculine-plural":"hilari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hilare","definite-error-unrecognized-form-masculine-neuter-singular":"hilarul","definite-error-unrecognized-form-feminine-singular":"hilara","definite-error-unrecognized-form-masculine-plural":"hilarii","definite-error-unrecognized-form-feminine-neuter-plural":"hilarele"}},{"word":"hilariant","pos":"adj","definitions":["alternative form of ilariant"],"forms":{"feminine-singular":"hilariantă","masculine-plural":"hilarianți","feminine-neuter-plural":"hilariante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hilariant","error-unrecognized-form-feminine-indefinite-singular":"hilariantă","error-unrecognized-form-indefinite-masculine-plural":"hilarianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hilariante","definite-error-unrecognized-form-masculine-neuter-singular":"hilariantul","definite-error-unrecognized-form-feminine-singular":"hilarianta","definite-error-unrecognized-form-masculine-plural":"hilarianții","definite-error-unrecognized-form-feminine-neuter-plural":"hilariantele"}},{"word":"hilaritate","pos":"noun","definitions":["alternative form of ilaritate"]},{"word":"Hilib","pos":"name","definitions":["a village in Ojdula, Covasna County, Romania"],"gender":"m"},{"word":"Hilișeu-Cloșca","pos":"name","definitions":["a village in Hilișeu-Horia, Botoșani County, Romania"],"gender":"f"},{"word":"Hilișeu-Crișan","pos":"name","definitions":["a village in Hilișeu-Horia, Botoșani County, Romania"],"gender":"f"},{"word":"Hilișeu-Horia","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Hilișeu-Horia, Botoșani County, Romania"],"gender":"f"},{"word":"Hilișoara","pos":"name","definitions":["a river in Hunedoara, Romania, tributary to the Nădrab"],"gender":"f"},{"word":"Hîlmu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîlmu"}},{"word":"hiloți","pos":"noun","definitions":["alternative form of chiloți"],"forms":{"plural":"hiloți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiloți","accusative-definite-nominative-singular":"hiloțiul","accusative-indefinite-nominative-plural":"hiloți","accusative-definite-nominative-plural":"hiloții","dative-genitive-indefinite-singular":"hiloți","dative-definite-genitive-singular":"hiloțiului","dative-genitive-indefinite-plural":"hiloți","dative-definite-genitive-plural":"hiloților","singular-vocative":"hiloțiule","plural-vocative":"hiloților"}},{"word":"hilozoism","pos":"noun","definitions":["hylozoism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hilozoism","accusative-definite-nominative-singular":"hilozoismul","accusative-indefinite-nominative-plural":"hilozoisme","accusative-definite-nominative-plural":"hilozoismele","dative-genitive-indefinite-singular":"hilozoism","dative-definite-genitive-singular":"hilozoismului","dative-genitive-indefinite-plural":"hilozoisme","dative-definite-genitive-plural":"hilozoismelor","singular-vocative":"hilozoismule","plural-vocative":"hilozoismelor"}},{"word":"hilozoist","pos":"noun","definitions":["hylozoist"],"forms":{"plural":"hilozoiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hilozoist","accusative-definite-nominative-singular":"hilozoistul","accusative-indefinite-nominative-plural":"hilozoiști","accusative-definite-nominative-plural":"hilozoiștii","dative-genitive-indefinite-singular":"hilozoist","dative-definite-genitive-singular":"hilozoistului","dative-genitive-indefinite-plural":"hilozoiști","dative-definite-genitive-plural":"hilozoiștilor","singular-vocative":"hilozoistule","plural-vocative":"hilozoiștilor"}},{"word":"hilozoistă","pos":"noun","definitions":["female equivalent of hilozoist"],"forms":{"plural":"hilozoiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hilozoistă","accusative-definite-nominative-singular":"hilozoista","accusative-indefinite-nominative-plural":"hilozoiste","accusative-definite-nominative-plural":"hilozoistele","dative-genitive-indefinite-singular":"hilozoiste","dative-definite-genitive-singular":"hilozoistei","dative-genitive-indefinite-plural":"hilozoiste","dative-definite-genitive-plural":"hilozoistelor","singular-vocative":"hilozoistă","plural-vocative":"hilozoistelor"}},{"word":"hiltă","pos":"noun","definitions":["wickedness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hiltă","accusative-definite-nominative":"hilta","dative-genitive-indefinite":"hilte","dative-definite-genitive":"hiltei","vocative":"hiltă"}},{"word":"himalaian","pos":"adj","definitions":["Himalayan"],"forms":{"feminine-singular":"himalaiană","masculine-plural":"himalaieni","feminine-neuter-plural":"himalaiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"himalaian","error-unrecognized-form-feminine-indefinite-singular":"himalaiană","error-unrecognized-form-indefinite-masculine-plural":"himalaieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"himalaiene","definite-error-unrecognized-form-masculine-neuter-singular":"himalaianul","definite-error-unrecognized-form-feminine-singular":"himalaiana","definite-error-unrecognized-form-masculine-plural":"himalaienii","definite-error-unrecognized-form-feminine-neuter-plural":"himalaienele"}},{"word":"himalaiană","pos":"noun","definitions":["female equivalent of himalaian"],"forms":{"plural":"himalaiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"himalaiană","accusative-definite-nominative-singular":"himalaiana","accusative-indefinite-nominative-plural":"himalaiene","accusative-definite-nominative-plural":"himalaienele","dative-genitive-indefinite-singular":"himalaiene","dative-definite-genitive-singular":"himalaienei","dative-genitive-indefinite-plural":"himalaiene","dative-definite-genitive-plural":"himalaienelor","singular-vocative":"himalaiană","plural-vocative":"himalaienelor"}},{"word":"himalayană","pos":"noun","definitions":["female equivalent of himalayan"],"forms":{"plural":"himalayane","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"himalayană","accusative-definite-nominative-singular":"himalayana","accusative-indefinite-nominative-plural":"himalayane","accusative-definite-nominative-plural":"himalayanele","dative-genitive-indefinite-singular":"himalayane","dative-definite-genitive-singular":"himalayanei","dative-genitive-indefinite-plural":"himalayane","dative-definite-genitive-plural":"himalayanelor","singular-vocative":"himalayană","plural-vocative":"himalayanelor"}},{"word":"himen","pos":"noun","definitions":["hymen"],"forms":{"plural":"himene","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"himen","accusative-definite-nominative-singular":"himenul","accusative-indefinite-nominative-plural":"himene","accusative-definite-nominative-plural":"himenele","dative-genitive-indefinite-singular":"himen","dative-definite-genitive-singular":"himenului","dative-genitive-indefinite-plural":"himene","dative-definite-genitive-plural":"himenelor","singular-vocative":"himenule","plural-vocative":"himenelor"}},{"word":"himenal","pos":"adj","definitions":["hymenal"],"forms":{"feminine-singular":"himenală","masculine-plural":"himenali","feminine-neuter-plural":"himenale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"himenal","error-unrecognized-form-feminine-indefinite-singular":"himenală","error-unrecognized-form-indefinite-masculine-plural":"himenali","error-unrecognized-form-feminine-indefinite-neuter-plural":"himenale","definite-error-unrecognized-form-masculine-neuter-singular":"himenalul","definite-error-unrecognized-form-feminine-singular":"himenala","definite-error-unrecognized-form-masculine-plural":"himenalii","definite-error-unrecognized-form-feminine-neuter-plural":"himenalele"}},{"word":"himeniu","pos":"noun","definitions":["hymenium"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"himeniu","accusative-definite-nominative":"himeniuul","dative-genitive-indefinite":"himeniu","dative-definite-genitive":"himeniuului","vocative":"himeniuule"}},{"word":"himenopter","pos":"noun","definitions":["hymenoptera"],"forms":{"plural":"himenoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"himenopter","accusative-definite-nominative-singular":"himenopterul","accusative-indefinite-nominative-plural":"himenoptere","accusative-definite-nominative-plural":"himenopterele","dative-genitive-indefinite-singular":"himenopter","dative-definite-genitive-singular":"himenopterului","dative-genitive-indefinite-plural":"himenoptere","dative-definite-genitive-plural":"himenopterelor","singular-vocative":"himenopterule","plural-vocative":"himenopterelor"}},{"word":"himenopterologie","pos":"noun","definitions":["hymenopterology"],"forms":{"plural":"himenopterologii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"himenopterologie","accusative-definite-nominative-singular":"himenopterologia","accusative-indefinite-nominative-plural":"himenopterologii","accusative-definite-nominative-plural":"himenopterologiile","dative-genitive-indefinite-singular":"himenopterologii","dative-definite-genitive-singular":"himenopterologiei","dative-genitive-indefinite-plural":"himenopterologii","dative-definite-genitive-plural":"himenopterologiilor","singular-vocative":"himenopterologie","plural-vocative":"himenopterologiilor"}},{"word":"himeră","pos":"noun","definitions":["chimera"],"forms":{"plural":"himere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"himeră","accusative-definite-nominative-singular":"himera","accusative-indefinite-nominative-plural":"himere","accusative-definite-nominative-plural":"himerele","dative-genitive-indefinite-singular":"himere","dative-definite-genitive-singular":"himerei","dative-genitive-indefinite-plural":"himere","dative-definite-genitive-plural":"himerelor","singular-vocative":"himeră","plural-vocative":"himerelor"}},{"word":"himeric","pos":"adj","definitions":["chimeric"],"forms":{"feminine-singular":"himerică","masculine-plural":"himerici","feminine-neuter-plural":"himerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"himeric","error-unrecognized-form-feminine-indefinite-singular":"himerică","error-unrecognized-form-indefinite-masculine-plural":"himerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"himerice","definite-error-unrecognized-form-masculine-neuter-singular":"himericul","definite-error-unrecognized-form-feminine-singular":"himerica","definite-error-unrecognized-form-masculine-plural":"himericii","definite-error-unrecognized-form-feminine-neuter-plural":"himericele"}},{"word":"hină","pos":"noun","definitions":["obsolete form of chinină"],"forms":{"plural":"hine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hină","accusative-definite-nominative-singular":"hina","accusative-indefinite-nominative-plural":"hine","accusative-definite-nominative-plural":"hinele","dative-genitive-indefinite-singular":"hine","dative-definite-genitive-singular":"hinei","dative-genitive-indefinite-plural":"hine","dative-definite-genitive-plural":"hinelor","singular-vocative":"hină","plural-vocative":"hinelor"}},{"word":"Hincăuți","pos":"name","definitions":["a village in Hincăuți, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"m"},{"word":"Hînceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hînceanu"}},{"word":"Hîncescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hîncescu"}},{"word":"Hîncești","pos":"name","definitions":["a city, municipality, and district of Moldova","a village in Hîncești, Fălești Raion, Moldova","a commune of Fălești Raion, Moldova"],"pronunciation":"/hɨnˈt͡ʃeʃtʲ/","gender":"m"},{"word":"Hinchiriș","pos":"name","definitions":["a village in Lazuri de Beiuș, Bihor County, Romania"],"gender":"m"},{"word":"hindi","pos":"noun","definitions":["Hindi"]},{"word":"hindichi","pos":"noun","definitions":["ditch"],"forms":{"plural":"hindichiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hindichi","accusative-definite-nominative-singular":"hindichiul","accusative-indefinite-nominative-plural":"hindichiuri","accusative-definite-nominative-plural":"hindichiurile","dative-genitive-indefinite-singular":"hindichi","dative-definite-genitive-singular":"hindichiului","dative-genitive-indefinite-plural":"hindichiuri","dative-definite-genitive-plural":"hindichiurilor","singular-vocative":"hindichiule","plural-vocative":"hindichiurilor"}},{"word":"hinduism","pos":"noun","definitions":["Hinduism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hinduism","accusative-definite-nominative":"hinduismul","dative-genitive-indefinite":"hinduism","dative-definite-genitive":"hinduismului","vocative":"hinduismule"}},{"word":"hinduist","pos":"noun","definitions":["Hindu"],"forms":{"plural":"hinduiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hinduist","accusative-definite-nominative-singular":"hinduistul","accusative-indefinite-nominative-plural":"hinduiști","accusative-definite-nominative-plural":"hinduiștii","dative-genitive-indefinite-singular":"hinduist","dative-definite-genitive-singular":"hinduistului","dative-genitive-indefinite-plural":"hinduiști","dative-definite-genitive-plural":"hinduiștilor","singular-vocative":"hinduistule","plural-vocative":"hinduiștilor"}},{"word":"hinduistă","pos":"noun","definitions":["female equivalent of hinduist"],"forms":{"plural":"hinduiste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hinduistă","accusative-definite-nominative-singular":"hinduista","accusative-indefinite-nominative-plural":"hinduiste","accusative-definite-nominative-plural":"hinduistele","dative-genitive-indefinite-singular":"hinduiste","dative-definite-genitive-singular":"hinduistei","dative-genitive-indefinite-plural":"hinduiste","dative-definite-genitive-plural":"hinduistelor","singular-vocative":"hinduistă","plural-vocative":"hinduistelor"}},{"word":"hindus","pos":"noun","definitions":["Hindu"],"forms":{"plural":"hinduși","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hindus","accusative-definite-nominative-singular":"hindusul","accusative-indefinite-nominative-plural":"hinduși","accusative-definite-nominative-plural":"hindușii","dative-genitive-indefinite-singular":"hindus","dative-definite-genitive-singular":"hindusului","dative-genitive-indefinite-plural":"hinduși","dative-definite-genitive-plural":"hindușilor","singular-vocative":"hindusule","plural-vocative":"hindușilor"}},{"word":"hindusă","pos":"noun","definitions":["female equivalent of hindus"],"forms":{"plural":"hinduse","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hindusă","accusative-definite-nominative-singular":"hindusa","accusative-indefinite-nominative-plural":"hinduse","accusative-definite-nominative-plural":"hindusele","dative-genitive-indefinite-singular":"hinduse","dative-definite-genitive-singular":"hindusei","dative-genitive-indefinite-plural":"hinduse","dative-definite-genitive-plural":"hinduselor","singular-vocative":"hindusă","plural-vocative":"hinduselor"}},{"word":"hindustan","pos":"adj","definitions":["Hindustani"],"forms":{"feminine-singular":"hindustană","masculine-plural":"hindustani","feminine-neuter-plural":"hindustane","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hindustan","error-unrecognized-form-feminine-indefinite-singular":"hindustană","error-unrecognized-form-indefinite-masculine-plural":"hindustani","error-unrecognized-form-feminine-indefinite-neuter-plural":"hindustane","definite-error-unrecognized-form-masculine-neuter-singular":"hindustanul","definite-error-unrecognized-form-feminine-singular":"hindustana","definite-error-unrecognized-form-masculine-plural":"hindustanii","definite-error-unrecognized-form-feminine-neuter-plural":"hindustanele"}},{"word":"hindustană","pos":"noun","definitions":["Hindustani language"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hindustană","accusative-definite-nominative":"hindustana","dative-genitive-indefinite":"hindustane","dative-definite-genitive":"hindustanei","vocative":"hindustană"}},{"word":"hindustani","pos":"adj","definitions":["Hindustani"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hindustani","error-unrecognized-form-feminine-indefinite-singular":"hindustani","error-unrecognized-form-indefinite-masculine-plural":"hindustani","error-unrecognized-form-feminine-indefinite-neuter-plural":"hindustani","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"hindustani","pos":"noun","definitions":["Hindustani"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hindustani","accusative-definite-nominative":"hindustaniul","dative-genitive-indefinite":"hindustani","dative-definite-genitive":"hindustaniului","vocative":"hindustaniule"}},{"word":"hingher","pos":"noun","definitions":["dogcatcher"],"forms":{"plural":"hingheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hingher","accusative-definite-nominative-singular":"hingherul","accusative-indefinite-nominative-plural":"hingheri","accusative-definite-nominative-plural":"hingherii","dative-genitive-indefinite-singular":"hingher","dative-definite-genitive-singular":"hingherului","dative-genitive-indefinite-plural":"hingheri","dative-definite-genitive-plural":"hingherilor","singular-vocative":"hingherule","plural-vocative":"hingherilor"}},{"word":"hinghereasă","pos":"noun","definitions":["female equivalent of hingher"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hinghereasă","accusative-definite-nominative":"hinghereasa","dative-genitive-indefinite":"hingherease","dative-definite-genitive":"hinghereasei","vocative":"hinghereasă"}},{"word":"hingherel","pos":"noun","definitions":["diminutive of hingher"],"forms":{"plural":"hingherei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hingherel","accusative-definite-nominative-singular":"hingherelul","accusative-indefinite-nominative-plural":"hingherei","accusative-definite-nominative-plural":"hinghereii","dative-genitive-indefinite-singular":"hingherel","dative-definite-genitive-singular":"hingherelului","dative-genitive-indefinite-plural":"hingherei","dative-definite-genitive-plural":"hinghereilor","singular-vocative":"hingherelule","plural-vocative":"hinghereilor"}},{"word":"hingheri","pos":"verb","definitions":["to catch stray dogs"],"forms":{"canonical":"a hingheri 4th conjugation","present-singular-third-person":"hingherește","participle-past":"hingherit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hingheri","gerund":"hingherind","first-person-indicative-present-singular":"hingheresc","indicative-present-second-person-singular":"hingherești","indicative-present-singular-third-person":"hingherește","first-person-indicative-plural-present":"hingherim","indicative-plural-present-second-person":"hingheriți","indicative-plural-present-third-person":"hingheresc","first-person-imperfect-indicative-singular":"hingheream","imperfect-indicative-second-person-singular":"hinghereai","imperfect-indicative-singular-third-person":"hingherea","first-person-imperfect-indicative-plural":"hingheream","imperfect-indicative-plural-second-person":"hinghereați","imperfect-indicative-plural-third-person":"hinghereau","first-person-indicative-perfect-singular":"hingherii","indicative-perfect-second-person-singular":"hingheriși","indicative-perfect-singular-third-person":"hingheri","first-person-indicative-perfect-plural":"hingherirăm","indicative-perfect-plural-second-person":"hingherirăți","indicative-perfect-plural-third-person":"hingheriră","first-person-indicative-pluperfect-singular":"hingherisem","indicative-pluperfect-second-person-singular":"hingheriseși","indicative-pluperfect-singular-third-person":"hingherise","first-person-indicative-pluperfect-plural":"hingheriserăm","indicative-pluperfect-plural-second-person":"hingheriserăți","indicative-pluperfect-plural-third-person":"hingheriseră","first-person-present-singular-subjunctive":"să hingheresc","present-second-person-singular-subjunctive":"să hingherești","present-singular-subjunctive-third-person":"să hingherească","first-person-plural-present-subjunctive":"să hingherim","plural-present-second-person-subjunctive":"să hingheriți","plural-present-subjunctive-third-person":"să hingherească","imperative-second-person-singular":"hingherește","imperative-plural-second-person":"hingheriți","imperative-negative-second-person-singular":"nu hingheri","imperative-negative-plural-second-person":"nu hingheriți"}},{"word":"hingheroaică","pos":"noun","definitions":["female equivalent of hingher"],"forms":{"plural":"hingheroaice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hingheroaică","accusative-definite-nominative-singular":"hingheroaica","accusative-indefinite-nominative-plural":"hingheroaice","accusative-definite-nominative-plural":"hingheroaicele","dative-genitive-indefinite-singular":"hingheroaice","dative-definite-genitive-singular":"hingheroaicei","dative-genitive-indefinite-plural":"hingheroaice","dative-definite-genitive-plural":"hingheroaicelor","singular-vocative":"hingheroaică","plural-vocative":"hingheroaicelor"}},{"word":"Hinoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hinoveanu"}},{"word":"hintă","pos":"noun","definitions":["swing"],"pronunciation":"/ˈhin.tə/","examples":[{"ro":"Şapte tone de lemn au fost folosite pentru parcul cu hintă, scăriţe pentru copii şi bănci, construit lângă podul Garibaldi, de pe malul Someşului Mic.","en":"Seven tons of wood were used for the park with a swing, ladders for children and benches, built near the Garibaldi Bridge on the bank of the Someșul Mic."},{"ro":"„Oare chiar doar asta va fi tot locul de joacă pentru copii? Deschidem o listă de programări pentru câte o tură pe hintă?”, a fost întrebarea clujencei nedumerite.","en":"“Is this really going to be the entire playground for children? Should we open a waiting list for a turn on the swing?” inquired the puzzled woman from Cluj."}],"forms":{"plural":"hinte"}},{"word":"hinterland","pos":"noun","definitions":["hinterland"],"forms":{"plural":"hinterlanduri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hinterland","accusative-definite-nominative-singular":"hinterlandul","accusative-indefinite-nominative-plural":"hinterlanduri","accusative-definite-nominative-plural":"hinterlandurile","dative-genitive-indefinite-singular":"hinterland","dative-definite-genitive-singular":"hinterlandului","dative-genitive-indefinite-plural":"hinterlanduri","dative-definite-genitive-plural":"hinterlandurilor","singular-vocative":"hinterlandule","plural-vocative":"hinterlandurilor"}},{"word":"Hințești","pos":"name","definitions":["a village in Moșoaia, Argeș County, Romania"],"gender":"m"},{"word":"hinteț","pos":"noun","definitions":["diminutive of hinteu"],"forms":{"plural":"hintețe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hinteț","accusative-definite-nominative-singular":"hintețul","accusative-indefinite-nominative-plural":"hintețe","accusative-definite-nominative-plural":"hintețele","dative-genitive-indefinite-singular":"hinteț","dative-definite-genitive-singular":"hintețului","dative-genitive-indefinite-plural":"hintețe","dative-definite-genitive-plural":"hintețelor","singular-vocative":"hintețule","plural-vocative":"hintețelor"}},{"word":"hinteu","pos":"noun","definitions":["chariot, coach"],"forms":{"plural":"hinteie","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hinteu","accusative-definite-nominative-singular":"hinteul","accusative-indefinite-nominative-plural":"hinteie","accusative-definite-nominative-plural":"hinteiele","dative-genitive-indefinite-singular":"hinteu","dative-definite-genitive-singular":"hinteului","dative-genitive-indefinite-plural":"hinteie","dative-definite-genitive-plural":"hinteielor","singular-vocative":"hinteule","plural-vocative":"hinteielor"}},{"word":"hinteuș","pos":"noun","definitions":["diminutive of hinteu"],"forms":{"plural":"hinteușe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hinteuș","accusative-definite-nominative-singular":"hinteușul","accusative-indefinite-nominative-plural":"hinteușe","accusative-definite-nominative-plural":"hinteușele","dative-genitive-indefinite-singular":"hinteuș","dative-definite-genitive-singular":"hinteușului","dative-genitive-indefinite-plural":"hinteușe","dative-definite-genitive-plural":"hinteușelor","singular-vocative":"hinteușule","plural-vocative":"hinteușelor"}},{"word":"hioid","pos":"adj","definitions":["hyoid"],"forms":{"feminine-singular":"hioidă","masculine-plural":"hioizi","feminine-neuter-plural":"hioide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hioid","error-unrecognized-form-feminine-indefinite-singular":"hioidă","error-unrecognized-form-indefinite-masculine-plural":"hioizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hioide","definite-error-unrecognized-form-masculine-neuter-singular":"hioidul","definite-error-unrecognized-form-feminine-singular":"hioida","definite-error-unrecognized-form-masculine-plural":"hioizii","definite-error-unrecognized-form-feminine-neuter-plural":"hioidele"}},{"word":"hiolă","pos":"noun","definitions":["part of expressions such as \"în hiolă\", which means dragging behind, being dragged or pulled closely behind, being pushed with, or \"fiula vântului\", meaning the powerful current or force of the wind, or \"a lua în fiulă\", meaning to take something by stabbing or digging into it, such as with a fork, spear, horn, claws, etc."],"forms":{"alternative":"fiolă"}},{"word":"hip-hop","pos":"noun","definitions":["hip-hop"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hip-hop","accusative-definite-nominative":"hip-hopul","dative-genitive-indefinite":"hip-hop","dative-definite-genitive":"hip-hopului","vocative":"hip-hopule"}},{"word":"hipalagă","pos":"noun","definitions":["hypallage"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hipalagă","accusative-definite-nominative":"hipalaga","dative-genitive-indefinite":"hipalage","dative-definite-genitive":"hipalagei","vocative":"hipalagă"}},{"word":"hipalgezie","pos":"noun","definitions":["hypalgesia"],"forms":{"plural":"hipalgezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipalgezie","accusative-definite-nominative-singular":"hipalgezia","accusative-indefinite-nominative-plural":"hipalgezii","accusative-definite-nominative-plural":"hipalgeziile","dative-genitive-indefinite-singular":"hipalgezii","dative-definite-genitive-singular":"hipalgeziei","dative-genitive-indefinite-plural":"hipalgezii","dative-definite-genitive-plural":"hipalgeziilor","singular-vocative":"hipalgezie","plural-vocative":"hipalgeziilor"}},{"word":"hipalgie","pos":"noun","definitions":["hypalgia"],"forms":{"plural":"hipalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipalgie","accusative-definite-nominative-singular":"hipalgia","accusative-indefinite-nominative-plural":"hipalgii","accusative-definite-nominative-plural":"hipalgiile","dative-genitive-indefinite-singular":"hipalgii","dative-definite-genitive-singular":"hipalgiei","dative-genitive-indefinite-plural":"hipalgii","dative-definite-genitive-plural":"hipalgiilor","singular-vocative":"hipalgie","plural-vocative":"hipalgiilor"}},{"word":"hiparion","pos":"noun","definitions":["hipparion"],"forms":{"plural":"hiparioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiparion","accusative-definite-nominative-singular":"hiparionul","accusative-indefinite-nominative-plural":"hiparioni","accusative-definite-nominative-plural":"hiparionii","dative-genitive-indefinite-singular":"hiparion","dative-definite-genitive-singular":"hiparionului","dative-genitive-indefinite-plural":"hiparioni","dative-definite-genitive-plural":"hiparionilor","singular-vocative":"hiparionule","plural-vocative":"hiparionilor"}},{"word":"hiper-","pos":"prefix","definitions":["hyper-"],"examples":[{"ro":"hiper- + excitabilitate (“excitability”) → hiperexcitabilitate (“hyperexcitability”)","en":null}]},{"word":"hiperaciditate","pos":"noun","definitions":["hyperacidity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hiperaciditate","accusative-definite-nominative":"hiperaciditatea","dative-genitive-indefinite":"hiperacidități","dative-definite-genitive":"hiperacidității","vocative":"-"}},{"word":"hiperacuzie","pos":"noun","definitions":["hyperacusis"],"forms":{"plural":"hiperacuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperacuzie","accusative-definite-nominative-singular":"hiperacuzia","accusative-indefinite-nominative-plural":"hiperacuzii","accusative-definite-nominative-plural":"hiperacuziile","dative-genitive-indefinite-singular":"hiperacuzii","dative-definite-genitive-singular":"hiperacuziei","dative-genitive-indefinite-plural":"hiperacuzii","dative-definite-genitive-plural":"hiperacuziilor","singular-vocative":"hiperacuzie","plural-vocative":"hiperacuziilor"}},{"word":"hiperalcalin","pos":"adj","definitions":["hyperalkaline"],"forms":{"feminine-singular":"hiperalcalină","masculine-plural":"hiperalcalini","feminine-neuter-plural":"hiperalcaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperalcalin","error-unrecognized-form-feminine-indefinite-singular":"hiperalcalină","error-unrecognized-form-indefinite-masculine-plural":"hiperalcalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperalcaline","definite-error-unrecognized-form-masculine-neuter-singular":"hiperalcalinul","definite-error-unrecognized-form-feminine-singular":"hiperalcalina","definite-error-unrecognized-form-masculine-plural":"hiperalcalinii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperalcalinele"}},{"word":"hiperalgezic","pos":"adj","definitions":["hyperalgesic"],"forms":{"feminine-singular":"hiperalgezică","masculine-plural":"hiperalgezici","feminine-neuter-plural":"hiperalgezice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperalgezic","error-unrecognized-form-feminine-indefinite-singular":"hiperalgezică","error-unrecognized-form-indefinite-masculine-plural":"hiperalgezici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperalgezice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperalgezicul","definite-error-unrecognized-form-feminine-singular":"hiperalgezica","definite-error-unrecognized-form-masculine-plural":"hiperalgezicii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperalgezicele"}},{"word":"hiperalgezică","pos":"noun","definitions":["female equivalent of hiperalgezic"],"forms":{"plural":"hiperalgezice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperalgezică","accusative-definite-nominative-singular":"hiperalgezica","accusative-indefinite-nominative-plural":"hiperalgezice","accusative-definite-nominative-plural":"hiperalgezicele","dative-genitive-indefinite-singular":"hiperalgezice","dative-definite-genitive-singular":"hiperalgezicei","dative-genitive-indefinite-plural":"hiperalgezice","dative-definite-genitive-plural":"hiperalgezicelor","singular-vocative":"hiperalgezică","plural-vocative":"hiperalgezicelor"}},{"word":"hiperalgezie","pos":"noun","definitions":["hyperalgesia"],"forms":{"plural":"hiperalgezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperalgezie","accusative-definite-nominative-singular":"hiperalgezia","accusative-indefinite-nominative-plural":"hiperalgezii","accusative-definite-nominative-plural":"hiperalgeziile","dative-genitive-indefinite-singular":"hiperalgezii","dative-definite-genitive-singular":"hiperalgeziei","dative-genitive-indefinite-plural":"hiperalgezii","dative-definite-genitive-plural":"hiperalgeziilor","singular-vocative":"hiperalgezie","plural-vocative":"hiperalgeziilor"}},{"word":"hiperalgie","pos":"noun","definitions":["hyperalgia"],"forms":{"plural":"hiperalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperalgie","accusative-definite-nominative-singular":"hiperalgia","accusative-indefinite-nominative-plural":"hiperalgii","accusative-definite-nominative-plural":"hiperalgiile","dative-genitive-indefinite-singular":"hiperalgii","dative-definite-genitive-singular":"hiperalgiei","dative-genitive-indefinite-plural":"hiperalgii","dative-definite-genitive-plural":"hiperalgiilor","singular-vocative":"hiperalgie","plural-vocative":"hiperalgiilor"}},{"word":"hiperbată","pos":"noun","definitions":["hyperbate"],"forms":{"plural":"hiperbate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperbată","accusative-definite-nominative-singular":"hiperbata","accusative-indefinite-nominative-plural":"hiperbate","accusative-definite-nominative-plural":"hiperbatele","dative-genitive-indefinite-singular":"hiperbate","dative-definite-genitive-singular":"hiperbatei","dative-genitive-indefinite-plural":"hiperbate","dative-definite-genitive-plural":"hiperbatelor","singular-vocative":"hiperbată","plural-vocative":"hiperbatelor"}},{"word":"hiperbola","pos":"noun","definitions":["definite nominative/accusative singular of hiperbolă"],"pronunciation":"[hiˈperbola]","gender":"f"},{"word":"hiperbolă","pos":"noun","definitions":["hyperbola","hyperbole"],"pronunciation":"/hiˈper.bo.lə/","forms":{"plural":"hiperbole","table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative-singular":"hiperbolă","accusative-definite-nominative-singular":"hiperbola","accusative-indefinite-nominative-plural":"hiperbole","accusative-definite-nominative-plural":"hiperbolele","dative-genitive-indefinite-singular":"hiperbole","dative-definite-genitive-singular":"hiperbolei","dative-genitive-indefinite-plural":"hiperbole","dative-definite-genitive-plural":"hiperbolelor","singular-vocative":"-","plural-vocative":"-","alternative":"iperbolă"}},{"word":"hiperbole","pos":"noun","definitions":["plural of hiperbolă"],"gender":"f"},{"word":"hiperbolic","pos":"adj","definitions":["hyperbolic"],"forms":{"feminine-singular":"hiperbolică","masculine-plural":"hiperbolici","feminine-neuter-plural":"hiperbolice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperbolic","error-unrecognized-form-feminine-indefinite-singular":"hiperbolică","error-unrecognized-form-indefinite-masculine-plural":"hiperbolici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperbolice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperbolicul","definite-error-unrecognized-form-feminine-singular":"hiperbolica","definite-error-unrecognized-form-masculine-plural":"hiperbolicii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperbolicele"}},{"word":"hiperbolism","pos":"noun","definitions":["hyperbolism"],"forms":{"plural":"hiperbolisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiperbolism","accusative-definite-nominative-singular":"hiperbolismul","accusative-indefinite-nominative-plural":"hiperbolisme","accusative-definite-nominative-plural":"hiperbolismele","dative-genitive-indefinite-singular":"hiperbolism","dative-definite-genitive-singular":"hiperbolismului","dative-genitive-indefinite-plural":"hiperbolisme","dative-definite-genitive-plural":"hiperbolismelor","singular-vocative":"hiperbolismule","plural-vocative":"hiperbolismelor"}},{"word":"hiperboliza","pos":"verb","definitions":["to hyperbolize"],"pronunciation":"/hi.per.bo.liˈza/","forms":{"canonical":"a hiperboliza 1st conjugation","present-singular-third-person":"hiperbolizează","participle-past":"hiperbolizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hiperboliza","gerund":"hiperbolizând","first-person-indicative-present-singular":"hiperbolizez","indicative-present-second-person-singular":"hiperbolizezi","indicative-present-singular-third-person":"hiperbolizează","first-person-indicative-plural-present":"hiperbolizăm","indicative-plural-present-second-person":"hiperbolizați","indicative-plural-present-third-person":"hiperbolizează","first-person-imperfect-indicative-singular":"hiperbolizam","imperfect-indicative-second-person-singular":"hiperbolizai","imperfect-indicative-singular-third-person":"hiperboliza","first-person-imperfect-indicative-plural":"hiperbolizam","imperfect-indicative-plural-second-person":"hiperbolizați","imperfect-indicative-plural-third-person":"hiperbolizau","first-person-indicative-perfect-singular":"hiperbolizai","indicative-perfect-second-person-singular":"hiperbolizași","indicative-perfect-singular-third-person":"hiperboliză","first-person-indicative-perfect-plural":"hiperbolizarăm","indicative-perfect-plural-second-person":"hiperbolizarăți","indicative-perfect-plural-third-person":"hiperbolizară","first-person-indicative-pluperfect-singular":"hiperbolizasem","indicative-pluperfect-second-person-singular":"hiperbolizaseși","indicative-pluperfect-singular-third-person":"hiperbolizase","first-person-indicative-pluperfect-plural":"hiperbolizaserăm","indicative-pluperfect-plural-second-person":"hiperbolizaserăți","indicative-pluperfect-plural-third-person":"hiperbolizaseră","first-person-present-singular-subjunctive":"să hiperbolizez","present-second-person-singular-subjunctive":"să hiperbolizezi","present-singular-subjunctive-third-person":"să hiperbolizeze","first-person-plural-present-subjunctive":"să hiperbolizăm","plural-present-second-person-subjunctive":"să hiperbolizați","plural-present-subjunctive-third-person":"să hiperbolizeze","imperative-second-person-singular":"hiperbolizează","imperative-plural-second-person":"hiperbolizați","imperative-negative-second-person-singular":"nu hiperboliza","imperative-negative-plural-second-person":"nu hiperbolizați"}},{"word":"hiperbolizant","pos":"adj","definitions":["hyperbolizing"],"forms":{"feminine-singular":"hiperbolizantă","masculine-plural":"hiperbolizanți","feminine-neuter-plural":"hiperbolizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperbolizant","error-unrecognized-form-feminine-indefinite-singular":"hiperbolizantă","error-unrecognized-form-indefinite-masculine-plural":"hiperbolizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperbolizante","definite-error-unrecognized-form-masculine-neuter-singular":"hiperbolizantul","definite-error-unrecognized-form-feminine-singular":"hiperbolizanta","definite-error-unrecognized-form-masculine-plural":"hiperbolizanții","definite-error-unrecognized-form-feminine-neuter-plural":"hiperbolizantele"}},{"word":"hiperbolizare","pos":"noun","definitions":["hyperbolizing"],"forms":{"plural":"hiperbolizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hiperbolizare","accusative-definite-nominative-singular":"hiperbolizarea","accusative-indefinite-nominative-plural":"hiperbolizări","accusative-definite-nominative-plural":"hiperbolizările","dative-genitive-indefinite-singular":"hiperbolizări","dative-definite-genitive-singular":"hiperbolizării","dative-genitive-indefinite-plural":"hiperbolizări","dative-definite-genitive-plural":"hiperbolizărilor","singular-vocative":"hiperbolizare","plural-vocative":"hiperbolizărilor"}},{"word":"hiperbolizase","pos":"verb","definitions":["third-person singular pluperfect indicative of hiperboliza"],"pronunciation":"[hiperboliˈzase]"},{"word":"hiperbolizat","pos":"adj","definitions":["hyperbolized"],"forms":{"feminine-singular":"hiperbolizată","masculine-plural":"hiperbolizați","feminine-neuter-plural":"hiperbolizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperbolizat","error-unrecognized-form-feminine-indefinite-singular":"hiperbolizată","error-unrecognized-form-indefinite-masculine-plural":"hiperbolizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperbolizate","definite-error-unrecognized-form-masculine-neuter-singular":"hiperbolizatul","definite-error-unrecognized-form-feminine-singular":"hiperbolizata","definite-error-unrecognized-form-masculine-plural":"hiperbolizații","definite-error-unrecognized-form-feminine-neuter-plural":"hiperbolizatele"}},{"word":"hiperboloid","pos":"noun","definitions":["hyperboloid"],"forms":{"plural":"hiperboloizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiperboloid","accusative-definite-nominative-singular":"hiperboloidul","accusative-indefinite-nominative-plural":"hiperboloizi","accusative-definite-nominative-plural":"hiperboloizii","dative-genitive-indefinite-singular":"hiperboloid","dative-definite-genitive-singular":"hiperboloidului","dative-genitive-indefinite-plural":"hiperboloizi","dative-definite-genitive-plural":"hiperboloizilor","singular-vocative":"hiperboloidule","plural-vocative":"hiperboloizilor"}},{"word":"hiperborean","pos":"adj","definitions":["hyperborean"],"forms":{"feminine-singular":"hiperboreană","masculine-plural":"hiperboreni","feminine-neuter-plural":"hiperborene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperborean","error-unrecognized-form-feminine-indefinite-singular":"hiperboreană","error-unrecognized-form-indefinite-masculine-plural":"hiperboreni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperborene","definite-error-unrecognized-form-masculine-neuter-singular":"hiperboreanul","definite-error-unrecognized-form-feminine-singular":"hiperboreana","definite-error-unrecognized-form-masculine-plural":"hiperborenii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperborenele"}},{"word":"hiperboreu","pos":"noun","definitions":["hyperborean"],"forms":{"plural":"hiperborei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiperboreu","accusative-definite-nominative-singular":"hiperboreul","accusative-indefinite-nominative-plural":"hiperborei","accusative-definite-nominative-plural":"hiperboreii","dative-genitive-indefinite-singular":"hiperboreu","dative-definite-genitive-singular":"hiperboreului","dative-genitive-indefinite-plural":"hiperborei","dative-definite-genitive-plural":"hiperboreilor","singular-vocative":"hiperboreule","plural-vocative":"hiperboreilor"}},{"word":"hipercalcemie","pos":"noun","definitions":["hypercalcemia"],"forms":{"plural":"hipercalcemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipercalcemie","accusative-definite-nominative-singular":"hipercalcemia","accusative-indefinite-nominative-plural":"hipercalcemii","accusative-definite-nominative-plural":"hipercalcemiile","dative-genitive-indefinite-singular":"hipercalcemii","dative-definite-genitive-singular":"hipercalcemiei","dative-genitive-indefinite-plural":"hipercalcemii","dative-definite-genitive-plural":"hipercalcemiilor","singular-vocative":"hipercalcemie","plural-vocative":"hipercalcemiilor"}},{"word":"hipercheratoză","pos":"noun","definitions":["hyperkeratosis"],"forms":{"plural":"hipercheratoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipercheratoză","accusative-definite-nominative-singular":"hipercheratoza","accusative-indefinite-nominative-plural":"hipercheratoze","accusative-definite-nominative-plural":"hipercheratozele","dative-genitive-indefinite-singular":"hipercheratoze","dative-definite-genitive-singular":"hipercheratozei","dative-genitive-indefinite-plural":"hipercheratoze","dative-definite-genitive-plural":"hipercheratozelor","singular-vocative":"hipercheratoză","plural-vocative":"hipercheratozelor"}},{"word":"hiperchinezie","pos":"noun","definitions":["hyperkinesia"],"forms":{"plural":"hiperchinezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperchinezie","accusative-definite-nominative-singular":"hiperchinezia","accusative-indefinite-nominative-plural":"hiperchinezii","accusative-definite-nominative-plural":"hiperchineziile","dative-genitive-indefinite-singular":"hiperchinezii","dative-definite-genitive-singular":"hiperchineziei","dative-genitive-indefinite-plural":"hiperchinezii","dative-definite-genitive-plural":"hiperchineziilor","singular-vocative":"hiperchinezie","plural-vocative":"hiperchineziilor"}},{"word":"hiperclorhidrie","pos":"noun","definitions":["hyperchlorhydria"],"forms":{"plural":"hiperclorhidrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperclorhidrie","accusative-definite-nominative-singular":"hiperclorhidria","accusative-indefinite-nominative-plural":"hiperclorhidrii","accusative-definite-nominative-plural":"hiperclorhidriile","dative-genitive-indefinite-singular":"hiperclorhidrii","dative-definite-genitive-singular":"hiperclorhidriei","dative-genitive-indefinite-plural":"hiperclorhidrii","dative-definite-genitive-plural":"hiperclorhidriilor","singular-vocative":"hiperclorhidrie","plural-vocative":"hiperclorhidriilor"}},{"word":"hipercorect","pos":"adj","definitions":["hypercorrect"],"forms":{"feminine-singular":"hipercorectă","masculine-plural":"hipercorecți","feminine-neuter-plural":"hipercorecte","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipercorect","error-unrecognized-form-feminine-indefinite-singular":"hipercorectă","error-unrecognized-form-indefinite-masculine-plural":"hipercorecți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipercorecte","definite-error-unrecognized-form-masculine-neuter-singular":"hipercorectul","definite-error-unrecognized-form-feminine-singular":"hipercorecta","definite-error-unrecognized-form-masculine-plural":"hipercorecții","definite-error-unrecognized-form-feminine-neuter-plural":"hipercorectele"}},{"word":"hipercorectitudine","pos":"noun","definitions":["hypercorrectness"],"forms":{"plural":"hipercorectitudini","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hipercorectitudine","accusative-definite-nominative-singular":"hipercorectitudinea","accusative-indefinite-nominative-plural":"hipercorectitudini","accusative-definite-nominative-plural":"hipercorectitudinile","dative-genitive-indefinite-singular":"hipercorectitudini","dative-definite-genitive-singular":"hipercorectitudinii","dative-genitive-indefinite-plural":"hipercorectitudini","dative-definite-genitive-plural":"hipercorectitudinilor","singular-vocative":"hipercorectitudine","plural-vocative":"hipercorectitudinilor"}},{"word":"hipercritic","pos":"adj","definitions":["hypercritical"],"forms":{"feminine-singular":"hipercritică","masculine-plural":"hipercritici","feminine-neuter-plural":"hipercritice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipercritic","error-unrecognized-form-feminine-indefinite-singular":"hipercritică","error-unrecognized-form-indefinite-masculine-plural":"hipercritici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipercritice","definite-error-unrecognized-form-masculine-neuter-singular":"hipercriticul","definite-error-unrecognized-form-feminine-singular":"hipercritica","definite-error-unrecognized-form-masculine-plural":"hipercriticii","definite-error-unrecognized-form-feminine-neuter-plural":"hipercriticele"}},{"word":"hipercromie","pos":"noun","definitions":["hyperchromia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipercromie","accusative-definite-nominative":"hipercromia","dative-genitive-indefinite":"hipercromii","dative-definite-genitive":"hipercromiei","vocative":"hipercromie"}},{"word":"hipercub","pos":"noun","definitions":["hypercube"],"forms":{"plural":"hipercuburi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hipercub","accusative-definite-nominative-singular":"hipercubul","accusative-indefinite-nominative-plural":"hipercuburi","accusative-definite-nominative-plural":"hipercuburile","dative-genitive-indefinite-singular":"hipercub","dative-definite-genitive-singular":"hipercubului","dative-genitive-indefinite-plural":"hipercuburi","dative-definite-genitive-plural":"hipercuburilor","singular-vocative":"hipercubule","plural-vocative":"hipercuburilor"}},{"word":"hiperemeză","pos":"noun","definitions":["hyperemesis"],"forms":{"plural":"hiperemeze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperemeză","accusative-definite-nominative-singular":"hiperemeza","accusative-indefinite-nominative-plural":"hiperemeze","accusative-definite-nominative-plural":"hiperemezele","dative-genitive-indefinite-singular":"hiperemeze","dative-definite-genitive-singular":"hiperemezei","dative-genitive-indefinite-plural":"hiperemeze","dative-definite-genitive-plural":"hiperemezelor","singular-vocative":"hiperemeză","plural-vocative":"hiperemezelor"}},{"word":"hiperemic","pos":"adj","definitions":["hyperemic"],"forms":{"feminine-singular":"hiperemică","masculine-plural":"hiperemici","feminine-neuter-plural":"hiperemice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperemic","error-unrecognized-form-feminine-indefinite-singular":"hiperemică","error-unrecognized-form-indefinite-masculine-plural":"hiperemici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperemice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperemicul","definite-error-unrecognized-form-feminine-singular":"hiperemica","definite-error-unrecognized-form-masculine-plural":"hiperemicii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperemicele"}},{"word":"hiperemie","pos":"noun","definitions":["hyperemia"],"forms":{"plural":"hiperemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperemie","accusative-definite-nominative-singular":"hiperemia","accusative-indefinite-nominative-plural":"hiperemii","accusative-definite-nominative-plural":"hiperemiile","dative-genitive-indefinite-singular":"hiperemii","dative-definite-genitive-singular":"hiperemiei","dative-genitive-indefinite-plural":"hiperemii","dative-definite-genitive-plural":"hiperemiilor","singular-vocative":"hiperemie","plural-vocative":"hiperemiilor"}},{"word":"hiperemotivitate","pos":"noun","definitions":["hyperemotivity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hiperemotivitate","accusative-definite-nominative-singular":"hiperemotivitatea","accusative-indefinite-nominative-plural":"hiperemotivități","accusative-definite-nominative-plural":"hiperemotivitățile","dative-genitive-indefinite-singular":"hiperemotivități","dative-definite-genitive-singular":"hiperemotivității","dative-genitive-indefinite-plural":"hiperemotivități","dative-definite-genitive-plural":"hiperemotivităților","singular-vocative":"hiperemotivitate","plural-vocative":"hiperemotivităților"}},{"word":"hiperestezie","pos":"noun","definitions":["hyperesthesia"],"forms":{"plural":"hiperestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperestezie","accusative-definite-nominative-singular":"hiperestezia","accusative-indefinite-nominative-plural":"hiperestezii","accusative-definite-nominative-plural":"hiperesteziile","dative-genitive-indefinite-singular":"hiperestezii","dative-definite-genitive-singular":"hiperesteziei","dative-genitive-indefinite-plural":"hiperestezii","dative-definite-genitive-plural":"hiperesteziilor","singular-vocative":"hiperestezie","plural-vocative":"hiperesteziilor"}},{"word":"hiperexcitabilitate","pos":"noun","definitions":["hyperexcitability"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hiperexcitabilitate","accusative-definite-nominative":"hiperexcitabilitatea","dative-genitive-indefinite":"hiperexcitabilități","dative-definite-genitive":"hiperexcitabilității","vocative":"-"}},{"word":"hiperfocal","pos":"adj","definitions":["hyperfocal"],"forms":{"feminine-singular":"hiperfocală","masculine-plural":"hiperfocali","feminine-neuter-plural":"hiperfocale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperfocal","error-unrecognized-form-feminine-indefinite-singular":"hiperfocală","error-unrecognized-form-indefinite-masculine-plural":"hiperfocali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperfocale","definite-error-unrecognized-form-masculine-neuter-singular":"hiperfocalul","definite-error-unrecognized-form-feminine-singular":"hiperfocala","definite-error-unrecognized-form-masculine-plural":"hiperfocalii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperfocalele"}},{"word":"hiperfoliculinie","pos":"noun","definitions":["hyperfoliculinia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperfoliculinie","accusative-definite-nominative-singular":"hiperfoliculinia","accusative-indefinite-nominative-plural":"hiperfoliculinii","accusative-definite-nominative-plural":"hiperfoliculiniile","dative-genitive-indefinite-singular":"hiperfoliculinii","dative-definite-genitive-singular":"hiperfoliculiniei","dative-genitive-indefinite-plural":"hiperfoliculinii","dative-definite-genitive-plural":"hiperfoliculiniilor","singular-vocative":"hiperfoliculinie","plural-vocative":"hiperfoliculiniilor"}},{"word":"hiperfrecvență","pos":"noun","definitions":["microwave / superhigh frequency"],"forms":{"plural":"hiperfrecvențe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperfrecvență","accusative-definite-nominative-singular":"hiperfrecvența","accusative-indefinite-nominative-plural":"hiperfrecvențe","accusative-definite-nominative-plural":"hiperfrecvențele","dative-genitive-indefinite-singular":"hiperfrecvențe","dative-definite-genitive-singular":"hiperfrecvenței","dative-genitive-indefinite-plural":"hiperfrecvențe","dative-definite-genitive-plural":"hiperfrecvențelor","singular-vocative":"hiperfrecvență","plural-vocative":"hiperfrecvențelor"}},{"word":"hiperfuncție","pos":"noun","definitions":["hyperfunction"],"forms":{"plural":"hiperfuncții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperfuncție","accusative-definite-nominative-singular":"hiperfuncția","accusative-indefinite-nominative-plural":"hiperfuncții","accusative-definite-nominative-plural":"hiperfuncțiile","dative-genitive-indefinite-singular":"hiperfuncții","dative-definite-genitive-singular":"hiperfuncției","dative-genitive-indefinite-plural":"hiperfuncții","dative-definite-genitive-plural":"hiperfuncțiilor","singular-vocative":"hiperfuncție","plural-vocative":"hiperfuncțiilor"}},{"word":"hiperfuncțiune","pos":"noun","definitions":["alternative form of hiperfuncție"],"forms":{"plural":"hiperfuncțiuni"}},{"word":"hipergeometric","pos":"adj","definitions":["hypergeometric"],"forms":{"feminine-singular":"hipergeometrică","masculine-plural":"hipergeometrici","feminine-neuter-plural":"hipergeometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipergeometric","error-unrecognized-form-feminine-indefinite-singular":"hipergeometrică","error-unrecognized-form-indefinite-masculine-plural":"hipergeometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipergeometrice","definite-error-unrecognized-form-masculine-neuter-singular":"hipergeometricul","definite-error-unrecognized-form-feminine-singular":"hipergeometrica","definite-error-unrecognized-form-masculine-plural":"hipergeometricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipergeometricele"}},{"word":"hipergeuzie","pos":"noun","definitions":["hypergeusia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipergeuzie","accusative-definite-nominative":"hipergeuzia","dative-genitive-indefinite":"hipergeuzii","dative-definite-genitive":"hipergeuziei","vocative":"hipergeuzie"}},{"word":"hiperglicemie","pos":"noun","definitions":["hyperglycemia"],"forms":{"plural":"hiperglicemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperglicemie","accusative-definite-nominative-singular":"hiperglicemia","accusative-indefinite-nominative-plural":"hiperglicemii","accusative-definite-nominative-plural":"hiperglicemiile","dative-genitive-indefinite-singular":"hiperglicemii","dative-definite-genitive-singular":"hiperglicemiei","dative-genitive-indefinite-plural":"hiperglicemii","dative-definite-genitive-plural":"hiperglicemiilor","singular-vocative":"hiperglicemie","plural-vocative":"hiperglicemiilor"}},{"word":"hiperhidroză","pos":"noun","definitions":["hyperhidrosis"],"forms":{"plural":"hiperhidroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperhidroză","accusative-definite-nominative-singular":"hiperhidroza","accusative-indefinite-nominative-plural":"hiperhidroze","accusative-definite-nominative-plural":"hiperhidrozele","dative-genitive-indefinite-singular":"hiperhidroze","dative-definite-genitive-singular":"hiperhidrozei","dative-genitive-indefinite-plural":"hiperhidroze","dative-definite-genitive-plural":"hiperhidrozelor","singular-vocative":"hiperhidroză","plural-vocative":"hiperhidrozelor"}},{"word":"hiperinflație","pos":"noun","definitions":["hyperinflation"],"forms":{"plural":"hiperinflații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperinflație","accusative-definite-nominative-singular":"hiperinflația","accusative-indefinite-nominative-plural":"hiperinflații","accusative-definite-nominative-plural":"hiperinflațiile","dative-genitive-indefinite-singular":"hiperinflații","dative-definite-genitive-singular":"hiperinflației","dative-genitive-indefinite-plural":"hiperinflații","dative-definite-genitive-plural":"hiperinflațiilor","singular-vocative":"hiperinflație","plural-vocative":"hiperinflațiilor"}},{"word":"hiperinsulinism","pos":"noun","definitions":["hyperinsulinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiperinsulinism","accusative-definite-nominative-singular":"hiperinsulinismul","accusative-indefinite-nominative-plural":"hiperinsulinisme","accusative-definite-nominative-plural":"hiperinsulinismele","dative-genitive-indefinite-singular":"hiperinsulinism","dative-definite-genitive-singular":"hiperinsulinismului","dative-genitive-indefinite-plural":"hiperinsulinisme","dative-definite-genitive-plural":"hiperinsulinismelor","singular-vocative":"hiperinsulinismule","plural-vocative":"hiperinsulinismelor"}},{"word":"hiperiritabil","pos":"adj","definitions":["hyperirritable"],"forms":{"feminine-singular":"hiperiritabilă","masculine-plural":"hiperiritabili","feminine-neuter-plural":"hiperiritabile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperiritabil","error-unrecognized-form-feminine-indefinite-singular":"hiperiritabilă","error-unrecognized-form-indefinite-masculine-plural":"hiperiritabili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperiritabile","definite-error-unrecognized-form-masculine-neuter-singular":"hiperiritabilul","definite-error-unrecognized-form-feminine-singular":"hiperiritabila","definite-error-unrecognized-form-masculine-plural":"hiperiritabilii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperiritabilele"}},{"word":"hiperită","pos":"noun","definitions":["alternative form of iperită"],"forms":{"plural":"hiperite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperită","accusative-definite-nominative-singular":"hiperita","accusative-indefinite-nominative-plural":"hiperite","accusative-definite-nominative-plural":"hiperitele","dative-genitive-indefinite-singular":"hiperite","dative-definite-genitive-singular":"hiperitei","dative-genitive-indefinite-plural":"hiperite","dative-definite-genitive-plural":"hiperitelor","singular-vocative":"hiperită","plural-vocative":"hiperitelor"}},{"word":"hipermarket","pos":"noun","definitions":["hypermarket"],"forms":{"plural":"hipermarketuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hipermarket","accusative-definite-nominative-singular":"hipermarketul","accusative-indefinite-nominative-plural":"hipermarketuri","accusative-definite-nominative-plural":"hipermarketurile","dative-genitive-indefinite-singular":"hipermarket","dative-definite-genitive-singular":"hipermarketului","dative-genitive-indefinite-plural":"hipermarketuri","dative-definite-genitive-plural":"hipermarketurilor","singular-vocative":"hipermarketule","plural-vocative":"hipermarketurilor"}},{"word":"hipermenoree","pos":"noun","definitions":["hypermenorrhea"],"forms":{"plural":"hipermenoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipermenoree","accusative-definite-nominative-singular":"hipermenoreea","accusative-indefinite-nominative-plural":"hipermenoree","accusative-definite-nominative-plural":"hipermenoreele","dative-genitive-indefinite-singular":"hipermenoree","dative-definite-genitive-singular":"hipermenoreei","dative-genitive-indefinite-plural":"hipermenoree","dative-definite-genitive-plural":"hipermenoreelor","singular-vocative":"hipermenoree","plural-vocative":"hipermenoreelor"}},{"word":"hipermetrop","pos":"adj","definitions":["hypermetropic"],"forms":{"feminine-singular":"hipermetropă","masculine-plural":"hipermetropi","feminine-neuter-plural":"hipermetrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipermetrop","error-unrecognized-form-feminine-indefinite-singular":"hipermetropă","error-unrecognized-form-indefinite-masculine-plural":"hipermetropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipermetrope","definite-error-unrecognized-form-masculine-neuter-singular":"hipermetropul","definite-error-unrecognized-form-feminine-singular":"hipermetropa","definite-error-unrecognized-form-masculine-plural":"hipermetropii","definite-error-unrecognized-form-feminine-neuter-plural":"hipermetropele"}},{"word":"hipermetropă","pos":"noun","definitions":["female equivalent of hipermetrop"],"forms":{"plural":"hipermetrope","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipermetropă","accusative-definite-nominative-singular":"hipermetropa","accusative-indefinite-nominative-plural":"hipermetrope","accusative-definite-nominative-plural":"hipermetropele","dative-genitive-indefinite-singular":"hipermetrope","dative-definite-genitive-singular":"hipermetropei","dative-genitive-indefinite-plural":"hipermetrope","dative-definite-genitive-plural":"hipermetropelor","singular-vocative":"hipermetropă","plural-vocative":"hipermetropelor"}},{"word":"hipermetropie","pos":"noun","definitions":["longsightedness"],"forms":{"plural":"hipermetropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipermetropie","accusative-definite-nominative-singular":"hipermetropia","accusative-indefinite-nominative-plural":"hipermetropii","accusative-definite-nominative-plural":"hipermetropiile","dative-genitive-indefinite-singular":"hipermetropii","dative-definite-genitive-singular":"hipermetropiei","dative-genitive-indefinite-plural":"hipermetropii","dative-definite-genitive-plural":"hipermetropiilor","singular-vocative":"hipermetropie","plural-vocative":"hipermetropiilor"}},{"word":"hipermetropism","pos":"noun","definitions":["longsightedness"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipermetropism","accusative-definite-nominative-singular":"hipermetropismul","accusative-indefinite-nominative-plural":"hipermetropisme","accusative-definite-nominative-plural":"hipermetropismele","dative-genitive-indefinite-singular":"hipermetropism","dative-definite-genitive-singular":"hipermetropismului","dative-genitive-indefinite-plural":"hipermetropisme","dative-definite-genitive-plural":"hipermetropismelor","singular-vocative":"hipermetropismule","plural-vocative":"hipermetropismelor"}},{"word":"hipermetru","pos":"noun","definitions":["hypermeter"],"forms":{"plural":"hipermetri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipermetru","accusative-definite-nominative-singular":"hipermetrul","accusative-indefinite-nominative-plural":"hipermetri","accusative-definite-nominative-plural":"hipermetrii","dative-genitive-indefinite-singular":"hipermetru","dative-definite-genitive-singular":"hipermetrului","dative-genitive-indefinite-plural":"hipermetri","dative-definite-genitive-plural":"hipermetrilor","singular-vocative":"hipermetrule","plural-vocative":"hipermetrilor"}},{"word":"hipermnezie","pos":"noun","definitions":["hypermnesia"],"forms":{"plural":"hipermnezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipermnezie","accusative-definite-nominative-singular":"hipermnezia","accusative-indefinite-nominative-plural":"hipermnezii","accusative-definite-nominative-plural":"hipermneziile","dative-genitive-indefinite-singular":"hipermnezii","dative-definite-genitive-singular":"hipermneziei","dative-genitive-indefinite-plural":"hipermnezii","dative-definite-genitive-plural":"hipermneziilor","singular-vocative":"hipermnezie","plural-vocative":"hipermneziilor"}},{"word":"hipernefrom","pos":"noun","definitions":["hypernephroma"],"forms":{"plural":"hipernefroame","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipernefrom","accusative-definite-nominative-singular":"hipernefromul","accusative-indefinite-nominative-plural":"hipernefroame","accusative-definite-nominative-plural":"hipernefroamele","dative-genitive-indefinite-singular":"hipernefrom","dative-definite-genitive-singular":"hipernefromului","dative-genitive-indefinite-plural":"hipernefroame","dative-definite-genitive-plural":"hipernefroamelor","singular-vocative":"hipernefromule","plural-vocative":"hipernefroamelor"}},{"word":"hiperon","pos":"noun","definitions":["hyperon (baryon with nonzero strangeness)"],"pronunciation":"/hi.peˈron/","forms":{"plural":"hiperoni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiperon","accusative-definite-nominative-singular":"hiperonul","accusative-indefinite-nominative-plural":"hiperoni","accusative-definite-nominative-plural":"hiperonii","dative-genitive-indefinite-singular":"hiperon","dative-definite-genitive-singular":"hiperonului","dative-genitive-indefinite-plural":"hiperoni","dative-definite-genitive-plural":"hiperonilor","singular-vocative":"hiperonule","plural-vocative":"hiperonilor"}},{"word":"hiperoni","pos":"noun","definitions":["indefinite nominative/accusative/genitive/dative plural of hiperon"],"pronunciation":"/hi.peˈronʲ/"},{"word":"hiperonic","pos":"adj","definitions":["hyperonic"],"forms":{"feminine-singular":"hiperonică","masculine-plural":"hiperonici","feminine-neuter-plural":"hiperonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperonic","error-unrecognized-form-feminine-indefinite-singular":"hiperonică","error-unrecognized-form-indefinite-masculine-plural":"hiperonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperonice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperonicul","definite-error-unrecognized-form-feminine-singular":"hiperonica","definite-error-unrecognized-form-masculine-plural":"hiperonicii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperonicele"}},{"word":"hiperorexie","pos":"noun","definitions":["bulimia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hiperorexie","accusative-definite-nominative":"hiperorexia","dative-genitive-indefinite":"hiperorexii","dative-definite-genitive":"hiperorexiei","vocative":"hiperorexie"}},{"word":"hiperosmie","pos":"noun","definitions":["hyperosmia"],"forms":{"plural":"hiperosmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperosmie","accusative-definite-nominative-singular":"hiperosmia","accusative-indefinite-nominative-plural":"hiperosmii","accusative-definite-nominative-plural":"hiperosmiile","dative-genitive-indefinite-singular":"hiperosmii","dative-definite-genitive-singular":"hiperosmiei","dative-genitive-indefinite-plural":"hiperosmii","dative-definite-genitive-plural":"hiperosmiilor","singular-vocative":"hiperosmie","plural-vocative":"hiperosmiilor"}},{"word":"hiperostoză","pos":"noun","definitions":["hyperostosis"],"forms":{"plural":"hiperostoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperostoză","accusative-definite-nominative-singular":"hiperostoza","accusative-indefinite-nominative-plural":"hiperostoze","accusative-definite-nominative-plural":"hiperostozele","dative-genitive-indefinite-singular":"hiperostoze","dative-definite-genitive-singular":"hiperostozei","dative-genitive-indefinite-plural":"hiperostoze","dative-definite-genitive-plural":"hiperostozelor","singular-vocative":"hiperostoză","plural-vocative":"hiperostozelor"}},{"word":"hiperparatiroidism","pos":"noun","definitions":["hyperparathyroidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiperparatiroidism","accusative-definite-nominative-singular":"hiperparatiroidismul","accusative-indefinite-nominative-plural":"hiperparatiroidisme","accusative-definite-nominative-plural":"hiperparatiroidismele","dative-genitive-indefinite-singular":"hiperparatiroidism","dative-definite-genitive-singular":"hiperparatiroidismului","dative-genitive-indefinite-plural":"hiperparatiroidisme","dative-definite-genitive-plural":"hiperparatiroidismelor","singular-vocative":"hiperparatiroidismule","plural-vocative":"hiperparatiroidismelor"}},{"word":"hiperparazit","pos":"noun","definitions":["hyperparasite"],"forms":{"plural":"hiperparaziți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiperparazit","accusative-definite-nominative-singular":"hiperparazitul","accusative-indefinite-nominative-plural":"hiperparaziți","accusative-definite-nominative-plural":"hiperparaziții","dative-genitive-indefinite-singular":"hiperparazit","dative-definite-genitive-singular":"hiperparazitului","dative-genitive-indefinite-plural":"hiperparaziți","dative-definite-genitive-plural":"hiperparaziților","singular-vocative":"hiperparazitule","plural-vocative":"hiperparaziților"}},{"word":"hiperparazită","pos":"noun","definitions":["female equivalent of hiperparazit"],"forms":{"plural":"hiperparazite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiperparazită","accusative-definite-nominative-singular":"hiperparazita","accusative-indefinite-nominative-plural":"hiperparazite","accusative-definite-nominative-plural":"hiperparazitele","dative-genitive-indefinite-singular":"hiperparazite","dative-definite-genitive-singular":"hiperparazitei","dative-genitive-indefinite-plural":"hiperparazite","dative-definite-genitive-plural":"hiperparazitelor","singular-vocative":"hiperparazită","plural-vocative":"hiperparazitelor"}},{"word":"hiperpirexie","pos":"noun","definitions":["hyperpyrexia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hiperpirexie","accusative-definite-nominative":"hiperpirexia","dative-genitive-indefinite":"hiperpirexii","dative-definite-genitive":"hiperpirexiei","vocative":"hiperpirexie"}},{"word":"hiperplazic","pos":"adj","definitions":["hyperplastic"],"forms":{"feminine-singular":"hiperplazică","masculine-plural":"hiperplazici","feminine-neuter-plural":"hiperplazice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hiperplazic","error-unrecognized-form-feminine-indefinite-singular":"hiperplazică","error-unrecognized-form-indefinite-masculine-plural":"hiperplazici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hiperplazice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperplazicul","definite-error-unrecognized-form-feminine-singular":"hiperplazica","definite-error-unrecognized-form-masculine-plural":"hiperplazicii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperplazicele"}},{"word":"hiperplazie","pos":"noun","definitions":["hyperplasia"],"forms":{"plural":"hiperplazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperplazie","accusative-definite-nominative-singular":"hiperplazia","accusative-indefinite-nominative-plural":"hiperplazii","accusative-definite-nominative-plural":"hiperplaziile","dative-genitive-indefinite-singular":"hiperplazii","dative-definite-genitive-singular":"hiperplaziei","dative-genitive-indefinite-plural":"hiperplazii","dative-definite-genitive-plural":"hiperplaziilor","singular-vocative":"hiperplazie","plural-vocative":"hiperplaziilor"}},{"word":"hiperprosexie","pos":"noun","definitions":["hyperprosexia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hiperprosexie","accusative-definite-nominative":"hiperprosexia","dative-genitive-indefinite":"hiperprosexii","dative-definite-genitive":"hiperprosexiei","vocative":"hiperprosexie"}},{"word":"hiperproteinemie","pos":"noun","definitions":["hyperproteinemia"],"forms":{"plural":"hiperproteinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiperproteinemie","accusative-definite-nominative-singular":"hiperproteinemia","accusative-indefinite-nominative-plural":"hiperproteinemii","accusative-definite-nominative-plural":"hiperproteinemiile","dative-genitive-indefinite-singular":"hiperproteinemii","dative-definite-genitive-singular":"hiperproteinemiei","dative-genitive-indefinite-plural":"hiperproteinemii","dative-definite-genitive-plural":"hiperproteinemiilor","singular-vocative":"hiperproteinemie","plural-vocative":"hiperproteinemiilor"}},{"word":"hipersceptic","pos":"adj","definitions":["very skeptical"],"forms":{"feminine-singular":"hipersceptică","masculine-plural":"hipersceptici","feminine-neuter-plural":"hipersceptice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipersceptic","error-unrecognized-form-feminine-indefinite-singular":"hipersceptică","error-unrecognized-form-indefinite-masculine-plural":"hipersceptici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipersceptice","definite-error-unrecognized-form-masculine-neuter-singular":"hiperscepticul","definite-error-unrecognized-form-feminine-singular":"hipersceptica","definite-error-unrecognized-form-masculine-plural":"hiperscepticii","definite-error-unrecognized-form-feminine-neuter-plural":"hiperscepticele"}},{"word":"hipersecreție","pos":"noun","definitions":["hypersecretion"],"forms":{"plural":"hipersecreții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipersecreție","accusative-definite-nominative-singular":"hipersecreția","accusative-indefinite-nominative-plural":"hipersecreții","accusative-definite-nominative-plural":"hipersecrețiile","dative-genitive-indefinite-singular":"hipersecreții","dative-definite-genitive-singular":"hipersecreției","dative-genitive-indefinite-plural":"hipersecreții","dative-definite-genitive-plural":"hipersecrețiilor","singular-vocative":"hipersecreție","plural-vocative":"hipersecrețiilor"}},{"word":"hipersensibil","pos":"adj","definitions":["hypersensitive"],"forms":{"feminine-singular":"hipersensibilă","masculine-plural":"hipersensibili","feminine-neuter-plural":"hipersensibile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipersensibil","error-unrecognized-form-feminine-indefinite-singular":"hipersensibilă","error-unrecognized-form-indefinite-masculine-plural":"hipersensibili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipersensibile","definite-error-unrecognized-form-masculine-neuter-singular":"hipersensibilul","definite-error-unrecognized-form-feminine-singular":"hipersensibila","definite-error-unrecognized-form-masculine-plural":"hipersensibilii","definite-error-unrecognized-form-feminine-neuter-plural":"hipersensibilele"}},{"word":"hipersensibilitate","pos":"noun","definitions":["hypersensitivity"],"forms":{"plural":"hipersensibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hipersensibilitate","accusative-definite-nominative-singular":"hipersensibilitatea","accusative-indefinite-nominative-plural":"hipersensibilități","accusative-definite-nominative-plural":"hipersensibilitățile","dative-genitive-indefinite-singular":"hipersensibilități","dative-definite-genitive-singular":"hipersensibilității","dative-genitive-indefinite-plural":"hipersensibilități","dative-definite-genitive-plural":"hipersensibilităților","singular-vocative":"hipersensibilitate","plural-vocative":"hipersensibilităților"}},{"word":"hipersensibiliza","pos":"verb","definitions":["to hypersensitize"],"forms":{"canonical":"a hipersensibiliza 1st conjugation","present-singular-third-person":"hipersensibilizează","participle-past":"hipersensibilizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hipersensibiliza","gerund":"hipersensibilizând","first-person-indicative-present-singular":"hipersensibilizez","indicative-present-second-person-singular":"hipersensibilizezi","indicative-present-singular-third-person":"hipersensibilizează","first-person-indicative-plural-present":"hipersensibilizăm","indicative-plural-present-second-person":"hipersensibilizați","indicative-plural-present-third-person":"hipersensibilizează","first-person-imperfect-indicative-singular":"hipersensibilizam","imperfect-indicative-second-person-singular":"hipersensibilizai","imperfect-indicative-singular-third-person":"hipersensibiliza","first-person-imperfect-indicative-plural":"hipersensibilizam","imperfect-indicative-plural-second-person":"hipersensibilizați","imperfect-indicative-plural-third-person":"hipersensibilizau","first-person-indicative-perfect-singular":"hipersensibilizai","indicative-perfect-second-person-singular":"hipersensibilizași","indicative-perfect-singular-third-person":"hipersensibiliză","first-person-indicative-perfect-plural":"hipersensibilizarăm","indicative-perfect-plural-second-person":"hipersensibilizarăți","indicative-perfect-plural-third-person":"hipersensibilizară","first-person-indicative-pluperfect-singular":"hipersensibilizasem","indicative-pluperfect-second-person-singular":"hipersensibilizaseși","indicative-pluperfect-singular-third-person":"hipersensibilizase","first-person-indicative-pluperfect-plural":"hipersensibilizaserăm","indicative-pluperfect-plural-second-person":"hipersensibilizaserăți","indicative-pluperfect-plural-third-person":"hipersensibilizaseră","first-person-present-singular-subjunctive":"să hipersensibilizez","present-second-person-singular-subjunctive":"să hipersensibilizezi","present-singular-subjunctive-third-person":"să hipersensibilizeze","first-person-plural-present-subjunctive":"să hipersensibilizăm","plural-present-second-person-subjunctive":"să hipersensibilizați","plural-present-subjunctive-third-person":"să hipersensibilizeze","imperative-second-person-singular":"hipersensibilizează","imperative-plural-second-person":"hipersensibilizați","imperative-negative-second-person-singular":"nu hipersensibiliza","imperative-negative-plural-second-person":"nu hipersensibilizați"}},{"word":"hipersensibilizare","pos":"noun","definitions":["hypersensitization"],"forms":{"plural":"hipersensibilizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hipersensibilizare","accusative-definite-nominative-singular":"hipersensibilizarea","accusative-indefinite-nominative-plural":"hipersensibilizări","accusative-definite-nominative-plural":"hipersensibilizările","dative-genitive-indefinite-singular":"hipersensibilizări","dative-definite-genitive-singular":"hipersensibilizării","dative-genitive-indefinite-plural":"hipersensibilizări","dative-definite-genitive-plural":"hipersensibilizărilor","singular-vocative":"hipersensibilizare","plural-vocative":"hipersensibilizărilor"}},{"word":"hipersensibilizat","pos":"adj","definitions":["hypersensitized"],"forms":{"feminine-singular":"hipersensibilizată","masculine-plural":"hipersensibilizați","feminine-neuter-plural":"hipersensibilizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipersensibilizat","error-unrecognized-form-feminine-indefinite-singular":"hipersensibilizată","error-unrecognized-form-indefinite-masculine-plural":"hipersensibilizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipersensibilizate","definite-error-unrecognized-form-masculine-neuter-singular":"hipersensibilizatul","definite-error-unrecognized-form-feminine-singular":"hipersensibilizata","definite-error-unrecognized-form-masculine-plural":"hipersensibilizații","definite-error-unrecognized-form-feminine-neuter-plural":"hipersensibilizatele"}},{"word":"hipersomnie","pos":"noun","definitions":["hypersomnia"],"forms":{"plural":"hipersomnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipersomnie","accusative-definite-nominative-singular":"hipersomnia","accusative-indefinite-nominative-plural":"hipersomnii","accusative-definite-nominative-plural":"hipersomniile","dative-genitive-indefinite-singular":"hipersomnii","dative-definite-genitive-singular":"hipersomniei","dative-genitive-indefinite-plural":"hipersomnii","dative-definite-genitive-plural":"hipersomniilor","singular-vocative":"hipersomnie","plural-vocative":"hipersomniilor"}},{"word":"hipersonic","pos":"adj","definitions":["hypersonic"],"forms":{"feminine-singular":"hipersonică","masculine-plural":"hipersonici","feminine-neuter-plural":"hipersonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipersonic","error-unrecognized-form-feminine-indefinite-singular":"hipersonică","error-unrecognized-form-indefinite-masculine-plural":"hipersonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipersonice","definite-error-unrecognized-form-masculine-neuter-singular":"hipersonicul","definite-error-unrecognized-form-feminine-singular":"hipersonica","definite-error-unrecognized-form-masculine-plural":"hipersonicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipersonicele"}},{"word":"hiperspațiu","pos":"noun","definitions":["hyperspace"],"forms":{"plural":"hiperspații","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiperspațiu","accusative-definite-nominative-singular":"hiperspațiuul","accusative-indefinite-nominative-plural":"hiperspații","accusative-definite-nominative-plural":"hiperspațiile","dative-genitive-indefinite-singular":"hiperspațiu","dative-definite-genitive-singular":"hiperspațiuului","dative-genitive-indefinite-plural":"hiperspații","dative-definite-genitive-plural":"hiperspațiilor","singular-vocative":"hiperspațiuule","plural-vocative":"hiperspațiilor"}},{"word":"hipersplenism","pos":"noun","definitions":["hypersplenism"],"forms":{"plural":"hipersplenisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipersplenism","accusative-definite-nominative-singular":"hipersplenismul","accusative-indefinite-nominative-plural":"hipersplenisme","accusative-definite-nominative-plural":"hipersplenismele","dative-genitive-indefinite-singular":"hipersplenism","dative-definite-genitive-singular":"hipersplenismului","dative-genitive-indefinite-plural":"hipersplenisme","dative-definite-genitive-plural":"hipersplenismelor","singular-vocative":"hipersplenismule","plural-vocative":"hipersplenismelor"}},{"word":"hipersunet","pos":"noun","definitions":["hypersound"],"forms":{"plural":"hipersunete","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipersunet","accusative-definite-nominative-singular":"hipersunetul","accusative-indefinite-nominative-plural":"hipersunete","accusative-definite-nominative-plural":"hipersunetele","dative-genitive-indefinite-singular":"hipersunet","dative-definite-genitive-singular":"hipersunetului","dative-genitive-indefinite-plural":"hipersunete","dative-definite-genitive-plural":"hipersunetelor","singular-vocative":"hipersunetule","plural-vocative":"hipersunetelor"}},{"word":"hipersustentație","pos":"noun","definitions":["The use of a high-lift device to increase the size of a wing"],"forms":{"plural":"hipersustentații","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipersustentație","accusative-definite-nominative-singular":"hipersustentația","accusative-indefinite-nominative-plural":"hipersustentații","accusative-definite-nominative-plural":"hipersustentațiile","dative-genitive-indefinite-singular":"hipersustentații","dative-definite-genitive-singular":"hipersustentației","dative-genitive-indefinite-plural":"hipersustentații","dative-definite-genitive-plural":"hipersustentațiilor","singular-vocative":"hipersustentație","plural-vocative":"hipersustentațiilor"}},{"word":"hipertensiune","pos":"noun","definitions":["hypertension"],"forms":{"plural":"hipertensiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipertensiune","accusative-definite-nominative-singular":"hipertensiunea","accusative-indefinite-nominative-plural":"hipertensiune","accusative-definite-nominative-plural":"hipertensiunele","dative-genitive-indefinite-singular":"hipertensiune","dative-definite-genitive-singular":"hipertensiunei","dative-genitive-indefinite-plural":"hipertensiune","dative-definite-genitive-plural":"hipertensiunelor","singular-vocative":"hipertensiune","plural-vocative":"hipertensiunelor"}},{"word":"hipertensiv","pos":"noun","definitions":["hypertensive"],"forms":{"plural":"hipertensivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipertensiv","accusative-definite-nominative-singular":"hipertensivul","accusative-indefinite-nominative-plural":"hipertensivi","accusative-definite-nominative-plural":"hipertensivii","dative-genitive-indefinite-singular":"hipertensiv","dative-definite-genitive-singular":"hipertensivului","dative-genitive-indefinite-plural":"hipertensivi","dative-definite-genitive-plural":"hipertensivilor","singular-vocative":"hipertensivule","plural-vocative":"hipertensivilor"}},{"word":"hipertensivă","pos":"noun","definitions":["female equivalent of hipertensiv"],"forms":{"plural":"hipertensive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipertensivă","accusative-definite-nominative-singular":"hipertensiva","accusative-indefinite-nominative-plural":"hipertensive","accusative-definite-nominative-plural":"hipertensivele","dative-genitive-indefinite-singular":"hipertensive","dative-definite-genitive-singular":"hipertensivei","dative-genitive-indefinite-plural":"hipertensive","dative-definite-genitive-plural":"hipertensivelor","singular-vocative":"hipertensivă","plural-vocative":"hipertensivelor"}},{"word":"hipertermal","pos":"adj","definitions":["hyperthermal"],"forms":{"feminine-singular":"hipertermală","masculine-plural":"hipertermali","feminine-neuter-plural":"hipertermale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipertermal","error-unrecognized-form-feminine-indefinite-singular":"hipertermală","error-unrecognized-form-indefinite-masculine-plural":"hipertermali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipertermale","definite-error-unrecognized-form-masculine-neuter-singular":"hipertermalul","definite-error-unrecognized-form-feminine-singular":"hipertermala","definite-error-unrecognized-form-masculine-plural":"hipertermalii","definite-error-unrecognized-form-feminine-neuter-plural":"hipertermalele"}},{"word":"hipertermie","pos":"noun","definitions":["hyperthermia"],"forms":{"plural":"hipertermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipertermie","accusative-definite-nominative-singular":"hipertermia","accusative-indefinite-nominative-plural":"hipertermii","accusative-definite-nominative-plural":"hipertermiile","dative-genitive-indefinite-singular":"hipertermii","dative-definite-genitive-singular":"hipertermiei","dative-genitive-indefinite-plural":"hipertermii","dative-definite-genitive-plural":"hipertermiilor","singular-vocative":"hipertermie","plural-vocative":"hipertermiilor"}},{"word":"hipertimie","pos":"noun","definitions":["hyperthymia"],"forms":{"plural":"hipertimii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipertimie","accusative-definite-nominative-singular":"hipertimia","accusative-indefinite-nominative-plural":"hipertimii","accusative-definite-nominative-plural":"hipertimiile","dative-genitive-indefinite-singular":"hipertimii","dative-definite-genitive-singular":"hipertimiei","dative-genitive-indefinite-plural":"hipertimii","dative-definite-genitive-plural":"hipertimiilor","singular-vocative":"hipertimie","plural-vocative":"hipertimiilor"}},{"word":"hipertiroidian","pos":"noun","definitions":["hyperthyroid"],"forms":{"plural":"hipertiroidieni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipertiroidian","accusative-definite-nominative-singular":"hipertiroidianul","accusative-indefinite-nominative-plural":"hipertiroidieni","accusative-definite-nominative-plural":"hipertiroidienii","dative-genitive-indefinite-singular":"hipertiroidian","dative-definite-genitive-singular":"hipertiroidianului","dative-genitive-indefinite-plural":"hipertiroidieni","dative-definite-genitive-plural":"hipertiroidienilor","singular-vocative":"hipertiroidianule","plural-vocative":"hipertiroidienilor"}},{"word":"hipertiroidiană","pos":"noun","definitions":["female equivalent of hipertiroidian"],"forms":{"plural":"hipertiroidiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipertiroidiană","accusative-definite-nominative-singular":"hipertiroidiana","accusative-indefinite-nominative-plural":"hipertiroidiene","accusative-definite-nominative-plural":"hipertiroidienele","dative-genitive-indefinite-singular":"hipertiroidiene","dative-definite-genitive-singular":"hipertiroidienei","dative-genitive-indefinite-plural":"hipertiroidiene","dative-definite-genitive-plural":"hipertiroidienelor","singular-vocative":"hipertiroidiană","plural-vocative":"hipertiroidienelor"}},{"word":"hipertiroidie","pos":"noun","definitions":["hyperthyroidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipertiroidie","accusative-definite-nominative-singular":"hipertiroidia","accusative-indefinite-nominative-plural":"hipertiroidii","accusative-definite-nominative-plural":"hipertiroidiile","dative-genitive-indefinite-singular":"hipertiroidii","dative-definite-genitive-singular":"hipertiroidiei","dative-genitive-indefinite-plural":"hipertiroidii","dative-definite-genitive-plural":"hipertiroidiilor","singular-vocative":"hipertiroidie","plural-vocative":"hipertiroidiilor"}},{"word":"hipertiroidism","pos":"noun","definitions":["hyperthyroidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipertiroidism","accusative-definite-nominative-singular":"hipertiroidismul","accusative-indefinite-nominative-plural":"hipertiroidisme","accusative-definite-nominative-plural":"hipertiroidismele","dative-genitive-indefinite-singular":"hipertiroidism","dative-definite-genitive-singular":"hipertiroidismului","dative-genitive-indefinite-plural":"hipertiroidisme","dative-definite-genitive-plural":"hipertiroidismelor","singular-vocative":"hipertiroidismule","plural-vocative":"hipertiroidismelor"}},{"word":"hipertonic","pos":"adj","definitions":["hypertonic"],"forms":{"feminine-singular":"hipertonică","masculine-plural":"hipertonici","feminine-neuter-plural":"hipertonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipertonic","error-unrecognized-form-feminine-indefinite-singular":"hipertonică","error-unrecognized-form-indefinite-masculine-plural":"hipertonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipertonice","definite-error-unrecognized-form-masculine-neuter-singular":"hipertonicul","definite-error-unrecognized-form-feminine-singular":"hipertonica","definite-error-unrecognized-form-masculine-plural":"hipertonicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipertonicele"}},{"word":"hipertonicitate","pos":"noun","definitions":["hypertonicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hipertonicitate","accusative-definite-nominative":"hipertonicitatea","dative-genitive-indefinite":"hipertonicități","dative-definite-genitive":"hipertonicității","vocative":"-"}},{"word":"hipertonie","pos":"noun","definitions":["hypertonia"],"forms":{"plural":"hipertonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipertonie","accusative-definite-nominative-singular":"hipertonia","accusative-indefinite-nominative-plural":"hipertonii","accusative-definite-nominative-plural":"hipertoniile","dative-genitive-indefinite-singular":"hipertonii","dative-definite-genitive-singular":"hipertoniei","dative-genitive-indefinite-plural":"hipertonii","dative-definite-genitive-plural":"hipertoniilor","singular-vocative":"hipertonie","plural-vocative":"hipertoniilor"}},{"word":"hipertricoză","pos":"noun","definitions":["hypertrichosis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipertricoză","accusative-definite-nominative-singular":"hipertricoza","accusative-indefinite-nominative-plural":"hipertricoze","accusative-definite-nominative-plural":"hipertricozele","dative-genitive-indefinite-singular":"hipertricoze","dative-definite-genitive-singular":"hipertricozei","dative-genitive-indefinite-plural":"hipertricoze","dative-definite-genitive-plural":"hipertricozelor","singular-vocative":"hipertricoză","plural-vocative":"hipertricozelor"}},{"word":"hipertrofia","pos":"verb","definitions":["to hypertrophy"],"pronunciation":"/hi.per.tro.fiˈa/","forms":{"canonical":"a hipertrofia 1st conjugation","present-singular-third-person":"hipertrofiază","participle-past":"hipertrofiat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hipertrofia","gerund":"hipertrofiind","first-person-indicative-present-singular":"hipertrofiez","indicative-present-second-person-singular":"hipertrofiezi","indicative-present-singular-third-person":"hipertrofiază","first-person-indicative-plural-present":"hipertrofiem","indicative-plural-present-second-person":"hipertrofiați","indicative-plural-present-third-person":"hipertrofiază","first-person-imperfect-indicative-singular":"hipertrofiam","imperfect-indicative-second-person-singular":"hipertrofiai","imperfect-indicative-singular-third-person":"hipertrofia","first-person-imperfect-indicative-plural":"hipertrofiam","imperfect-indicative-plural-second-person":"hipertrofiați","imperfect-indicative-plural-third-person":"hipertrofiau","first-person-indicative-perfect-singular":"hipertrofiai","indicative-perfect-second-person-singular":"hipertrofiași","indicative-perfect-singular-third-person":"hipertrofie","first-person-indicative-perfect-plural":"hipertrofiarăm","indicative-perfect-plural-second-person":"hipertrofiarăți","indicative-perfect-plural-third-person":"hipertrofiară","first-person-indicative-pluperfect-singular":"hipertrofiasem","indicative-pluperfect-second-person-singular":"hipertrofiaseși","indicative-pluperfect-singular-third-person":"hipertrofiase","first-person-indicative-pluperfect-plural":"hipertrofiaserăm","indicative-pluperfect-plural-second-person":"hipertrofiaserăți","indicative-pluperfect-plural-third-person":"hipertrofiaseră","first-person-present-singular-subjunctive":"să hipertrofiez","present-second-person-singular-subjunctive":"să hipertrofiezi","present-singular-subjunctive-third-person":"să hipertrofieze","first-person-plural-present-subjunctive":"să hipertrofiem","plural-present-second-person-subjunctive":"să hipertrofiați","plural-present-subjunctive-third-person":"să hipertrofieze","imperative-second-person-singular":"hipertrofiază","imperative-plural-second-person":"hipertrofiați","imperative-negative-second-person-singular":"nu hipertrofia","imperative-negative-plural-second-person":"nu hipertrofiați"}},{"word":"hipertrofic","pos":"adj","definitions":["hypertrophic"],"forms":{"feminine-singular":"hipertrofică","masculine-plural":"hipertrofici","feminine-neuter-plural":"hipertrofice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipertrofic","error-unrecognized-form-feminine-indefinite-singular":"hipertrofică","error-unrecognized-form-indefinite-masculine-plural":"hipertrofici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipertrofice","definite-error-unrecognized-form-masculine-neuter-singular":"hipertroficul","definite-error-unrecognized-form-feminine-singular":"hipertrofica","definite-error-unrecognized-form-masculine-plural":"hipertroficii","definite-error-unrecognized-form-feminine-neuter-plural":"hipertroficele"}},{"word":"hipertrofie","pos":"noun","definitions":["hypertrophic"],"forms":{"plural":"hipertrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipertrofie","accusative-definite-nominative-singular":"hipertrofia","accusative-indefinite-nominative-plural":"hipertrofii","accusative-definite-nominative-plural":"hipertrofiile","dative-genitive-indefinite-singular":"hipertrofii","dative-definite-genitive-singular":"hipertrofiei","dative-genitive-indefinite-plural":"hipertrofii","dative-definite-genitive-plural":"hipertrofiilor","singular-vocative":"hipertrofie","plural-vocative":"hipertrofiilor"}},{"word":"hipertrofiere","pos":"noun","definitions":["hypertrophying"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative":"hipertrofiere","accusative-definite-nominative":"hipertrofierea","dative-genitive-indefinite":"hipertrofiere","dative-definite-genitive":"hipertrofierei","vocative":"hipertrofiere"}},{"word":"hiperurbanism","pos":"noun","definitions":["hyperurbanism"],"forms":{"plural":"hiperurbanisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiperurbanism","accusative-definite-nominative-singular":"hiperurbanismul","accusative-indefinite-nominative-plural":"hiperurbanisme","accusative-definite-nominative-plural":"hiperurbanismele","dative-genitive-indefinite-singular":"hiperurbanism","dative-definite-genitive-singular":"hiperurbanismului","dative-genitive-indefinite-plural":"hiperurbanisme","dative-definite-genitive-plural":"hiperurbanismelor","singular-vocative":"hiperurbanismule","plural-vocative":"hiperurbanismelor"}},{"word":"hipervitaminoză","pos":"noun","definitions":["hypervitaminosis"],"forms":{"plural":"hipervitaminoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipervitaminoză","accusative-definite-nominative-singular":"hipervitaminoza","accusative-indefinite-nominative-plural":"hipervitaminoze","accusative-definite-nominative-plural":"hipervitaminozele","dative-genitive-indefinite-singular":"hipervitaminoze","dative-definite-genitive-singular":"hipervitaminozei","dative-genitive-indefinite-plural":"hipervitaminoze","dative-definite-genitive-plural":"hipervitaminozelor","singular-vocative":"hipervitaminoză","plural-vocative":"hipervitaminozelor"}},{"word":"hipiatric","pos":"adj","definitions":["hippiatric"],"forms":{"feminine-singular":"hipiatrică","masculine-plural":"hipiatrici","feminine-neuter-plural":"hipiatrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipiatric","error-unrecognized-form-feminine-indefinite-singular":"hipiatrică","error-unrecognized-form-indefinite-masculine-plural":"hipiatrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipiatrice","definite-error-unrecognized-form-masculine-neuter-singular":"hipiatricul","definite-error-unrecognized-form-feminine-singular":"hipiatrica","definite-error-unrecognized-form-masculine-plural":"hipiatricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipiatricele"}},{"word":"hipiatrie","pos":"noun","definitions":["hippiatry"],"forms":{"plural":"hipiatrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipiatrie","accusative-definite-nominative-singular":"hipiatria","accusative-indefinite-nominative-plural":"hipiatrii","accusative-definite-nominative-plural":"hipiatriile","dative-genitive-indefinite-singular":"hipiatrii","dative-definite-genitive-singular":"hipiatriei","dative-genitive-indefinite-plural":"hipiatrii","dative-definite-genitive-plural":"hipiatriilor","singular-vocative":"hipiatrie","plural-vocative":"hipiatriilor"}},{"word":"hipic","pos":"adj","definitions":["hippic"],"forms":{"feminine-singular":"hipică","masculine-plural":"hipici","feminine-neuter-plural":"hipice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipic","error-unrecognized-form-feminine-indefinite-singular":"hipică","error-unrecognized-form-indefinite-masculine-plural":"hipici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipice","definite-error-unrecognized-form-masculine-neuter-singular":"hipicul","definite-error-unrecognized-form-feminine-singular":"hipica","definite-error-unrecognized-form-masculine-plural":"hipicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipicele"}},{"word":"hipiot","pos":"noun","definitions":["hippie"],"forms":{"plural":"hipioți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipiot","accusative-definite-nominative-singular":"hipiotul","accusative-indefinite-nominative-plural":"hipioți","accusative-definite-nominative-plural":"hipioții","dative-genitive-indefinite-singular":"hipiot","dative-definite-genitive-singular":"hipiotului","dative-genitive-indefinite-plural":"hipioți","dative-definite-genitive-plural":"hipioților","singular-vocative":"hipiotule","plural-vocative":"hipioților"}},{"word":"hipiotă","pos":"noun","definitions":["female equivalent of hipiot"],"forms":{"plural":"hipiote","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipiotă","accusative-definite-nominative-singular":"hipiota","accusative-indefinite-nominative-plural":"hipiote","accusative-definite-nominative-plural":"hipiotele","dative-genitive-indefinite-singular":"hipiote","dative-definite-genitive-singular":"hipiotei","dative-genitive-indefinite-plural":"hipiote","dative-definite-genitive-plural":"hipiotelor","singular-vocative":"hipiotă","plural-vocative":"hipiotelor"}},{"word":"hipism","pos":"noun","definitions":["horse racing"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hipism","accusative-definite-nominative":"hipismul","dative-genitive-indefinite":"hipism","dative-definite-genitive":"hipismului","vocative":"hipismule"}},{"word":"hipnagogic","pos":"adj","definitions":["hypnagogic"],"forms":{"feminine-singular":"hipnagogică","masculine-plural":"hipnagogici","feminine-neuter-plural":"hipnagogice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipnagogic","error-unrecognized-form-feminine-indefinite-singular":"hipnagogică","error-unrecognized-form-indefinite-masculine-plural":"hipnagogici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipnagogice","definite-error-unrecognized-form-masculine-neuter-singular":"hipnagogicul","definite-error-unrecognized-form-feminine-singular":"hipnagogica","definite-error-unrecognized-form-masculine-plural":"hipnagogicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipnagogicele"}},{"word":"hipnalgie","pos":"noun","definitions":["hypnalgia"],"forms":{"plural":"hipnalgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipnalgie","accusative-definite-nominative-singular":"hipnalgia","accusative-indefinite-nominative-plural":"hipnalgii","accusative-definite-nominative-plural":"hipnalgiile","dative-genitive-indefinite-singular":"hipnalgii","dative-definite-genitive-singular":"hipnalgiei","dative-genitive-indefinite-plural":"hipnalgii","dative-definite-genitive-plural":"hipnalgiilor","singular-vocative":"hipnalgie","plural-vocative":"hipnalgiilor"}},{"word":"hipnogen","pos":"adj","definitions":["hypnogenic"],"forms":{"feminine-singular":"hipnogenă","masculine-plural":"hipnogeni","feminine-neuter-plural":"hipnogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipnogen","error-unrecognized-form-feminine-indefinite-singular":"hipnogenă","error-unrecognized-form-indefinite-masculine-plural":"hipnogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipnogene","definite-error-unrecognized-form-masculine-neuter-singular":"hipnogenul","definite-error-unrecognized-form-feminine-singular":"hipnogena","definite-error-unrecognized-form-masculine-plural":"hipnogenii","definite-error-unrecognized-form-feminine-neuter-plural":"hipnogenele"}},{"word":"hipnopedie","pos":"noun","definitions":["hypnopedia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipnopedie","accusative-definite-nominative-singular":"hipnopedia","accusative-indefinite-nominative-plural":"hipnopedii","accusative-definite-nominative-plural":"hipnopediile","dative-genitive-indefinite-singular":"hipnopedii","dative-definite-genitive-singular":"hipnopediei","dative-genitive-indefinite-plural":"hipnopedii","dative-definite-genitive-plural":"hipnopediilor","singular-vocative":"hipnopedie","plural-vocative":"hipnopediilor"}},{"word":"hipnoterapie","pos":"noun","definitions":["hypnotherapy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipnoterapie","accusative-definite-nominative":"hipnoterapia","dative-genitive-indefinite":"hipnoterapii","dative-definite-genitive":"hipnoterapiei","vocative":"hipnoterapie"}},{"word":"hipnotic","pos":"adj","definitions":["hypnotic"],"pronunciation":"/hipˈno.tik/","forms":{"feminine-singular":"hipnotică","masculine-plural":"hipnotici","feminine-neuter-plural":"hipnotice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipnotic","error-unrecognized-form-feminine-indefinite-singular":"hipnotică","error-unrecognized-form-indefinite-masculine-plural":"hipnotici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipnotice","definite-error-unrecognized-form-masculine-neuter-singular":"hipnoticul","definite-error-unrecognized-form-feminine-singular":"hipnotica","definite-error-unrecognized-form-masculine-plural":"hipnoticii","definite-error-unrecognized-form-feminine-neuter-plural":"hipnoticele","alternative":"хипнотик"}},{"word":"hipnotic","pos":"noun","definitions":["hypnotic"],"pronunciation":"/hipˈno.tik/","forms":{"plural":"hipnotice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipnotic","accusative-definite-nominative-singular":"hipnoticul","accusative-indefinite-nominative-plural":"hipnotice","accusative-definite-nominative-plural":"hipnoticele","dative-genitive-indefinite-singular":"hipnotic","dative-definite-genitive-singular":"hipnoticului","dative-genitive-indefinite-plural":"hipnotice","dative-definite-genitive-plural":"hipnoticelor","singular-vocative":"hipnoticule","plural-vocative":"hipnoticelor","alternative":"хипнотик"}},{"word":"hipnotism","pos":"noun","definitions":["hypnotism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipnotism","accusative-definite-nominative-singular":"hipnotismul","accusative-indefinite-nominative-plural":"hipnotisme","accusative-definite-nominative-plural":"hipnotismele","dative-genitive-indefinite-singular":"hipnotism","dative-definite-genitive-singular":"hipnotismului","dative-genitive-indefinite-plural":"hipnotisme","dative-definite-genitive-plural":"hipnotismelor","singular-vocative":"hipnotismule","plural-vocative":"hipnotismelor"}},{"word":"hipnotiza","pos":"verb","definitions":["to hypnotize"],"pronunciation":"/hip.no.tiˈza/","forms":{"canonical":"a hipnotiza 1st conjugation","present-singular-third-person":"hipnotizează","participle-past":"hipnotizat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a hipnotiza","gerund":"hipnotizând","first-person-indicative-present-singular":"hipnotizez","indicative-present-second-person-singular":"hipnotizezi","indicative-present-singular-third-person":"hipnotizează","first-person-indicative-plural-present":"hipnotizăm","indicative-plural-present-second-person":"hipnotizați","indicative-plural-present-third-person":"hipnotizează","first-person-imperfect-indicative-singular":"hipnotizam","imperfect-indicative-second-person-singular":"hipnotizai","imperfect-indicative-singular-third-person":"hipnotiza","first-person-imperfect-indicative-plural":"hipnotizam","imperfect-indicative-plural-second-person":"hipnotizați","imperfect-indicative-plural-third-person":"hipnotizau","first-person-indicative-perfect-singular":"hipnotizai","indicative-perfect-second-person-singular":"hipnotizași","indicative-perfect-singular-third-person":"hipnotiză","first-person-indicative-perfect-plural":"hipnotizarăm","indicative-perfect-plural-second-person":"hipnotizarăți","indicative-perfect-plural-third-person":"hipnotizară","first-person-indicative-pluperfect-singular":"hipnotizasem","indicative-pluperfect-second-person-singular":"hipnotizaseși","indicative-pluperfect-singular-third-person":"hipnotizase","first-person-indicative-pluperfect-plural":"hipnotizaserăm","indicative-pluperfect-plural-second-person":"hipnotizaserăți","indicative-pluperfect-plural-third-person":"hipnotizaseră","first-person-present-singular-subjunctive":"să hipnotizez","present-second-person-singular-subjunctive":"să hipnotizezi","present-singular-subjunctive-third-person":"să hipnotizeze","first-person-plural-present-subjunctive":"să hipnotizăm","plural-present-second-person-subjunctive":"să hipnotizați","plural-present-subjunctive-third-person":"să hipnotizeze","imperative-second-person-singular":"hipnotizează","imperative-plural-second-person":"hipnotizați","imperative-negative-second-person-singular":"nu hipnotiza","imperative-negative-plural-second-person":"nu hipnotizați"}},{"word":"hipnotizant","pos":"adj","definitions":["hypnotizing"],"forms":{"feminine-singular":"hipnotizantă","masculine-plural":"hipnotizanți","feminine-neuter-plural":"hipnotizante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipnotizant","error-unrecognized-form-feminine-indefinite-singular":"hipnotizantă","error-unrecognized-form-indefinite-masculine-plural":"hipnotizanți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipnotizante","definite-error-unrecognized-form-masculine-neuter-singular":"hipnotizantul","definite-error-unrecognized-form-feminine-singular":"hipnotizanta","definite-error-unrecognized-form-masculine-plural":"hipnotizanții","definite-error-unrecognized-form-feminine-neuter-plural":"hipnotizantele"}},{"word":"hipnotizare","pos":"noun","definitions":["hypnotization"],"forms":{"plural":"hipnotizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hipnotizare","accusative-definite-nominative-singular":"hipnotizarea","accusative-indefinite-nominative-plural":"hipnotizări","accusative-definite-nominative-plural":"hipnotizările","dative-genitive-indefinite-singular":"hipnotizări","dative-definite-genitive-singular":"hipnotizării","dative-genitive-indefinite-plural":"hipnotizări","dative-definite-genitive-plural":"hipnotizărilor","singular-vocative":"hipnotizare","plural-vocative":"hipnotizărilor"}},{"word":"hipnotizat","pos":"adj","definitions":["hypnotized"],"forms":{"feminine-singular":"hipnotizată","masculine-plural":"hipnotizați","feminine-neuter-plural":"hipnotizate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipnotizat","error-unrecognized-form-feminine-indefinite-singular":"hipnotizată","error-unrecognized-form-indefinite-masculine-plural":"hipnotizați","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipnotizate","definite-error-unrecognized-form-masculine-neuter-singular":"hipnotizatul","definite-error-unrecognized-form-feminine-singular":"hipnotizata","definite-error-unrecognized-form-masculine-plural":"hipnotizații","definite-error-unrecognized-form-feminine-neuter-plural":"hipnotizatele"}},{"word":"hipnotizatoare","pos":"noun","definitions":["female equivalent of hipnotizator"],"forms":{"plural":"hipnotizatoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipnotizatoare","accusative-definite-nominative-singular":"hipnotizatoarea","accusative-indefinite-nominative-plural":"hipnotizatoare","accusative-definite-nominative-plural":"hipnotizatoarele","dative-genitive-indefinite-singular":"hipnotizatoare","dative-definite-genitive-singular":"hipnotizatoarei","dative-genitive-indefinite-plural":"hipnotizatoare","dative-definite-genitive-plural":"hipnotizatoarelor","singular-vocative":"hipnotizatoare","plural-vocative":"hipnotizatoarelor"}},{"word":"hipnotizator","pos":"noun","definitions":["hypnotist"],"forms":{"plural":"hipnotizatori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipnotizator","accusative-definite-nominative-singular":"hipnotizatorul","accusative-indefinite-nominative-plural":"hipnotizatori","accusative-definite-nominative-plural":"hipnotizatorii","dative-genitive-indefinite-singular":"hipnotizator","dative-definite-genitive-singular":"hipnotizatorului","dative-genitive-indefinite-plural":"hipnotizatori","dative-definite-genitive-plural":"hipnotizatorilor","singular-vocative":"hipnotizatorule","plural-vocative":"hipnotizatorilor"}},{"word":"hipnotizoare","pos":"noun","definitions":["female equivalent of hipnotizor"],"forms":{"plural":"hipnotizoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipnotizoare","accusative-definite-nominative-singular":"hipnotizoarea","accusative-indefinite-nominative-plural":"hipnotizoare","accusative-definite-nominative-plural":"hipnotizoarele","dative-genitive-indefinite-singular":"hipnotizoare","dative-definite-genitive-singular":"hipnotizoarei","dative-genitive-indefinite-plural":"hipnotizoare","dative-definite-genitive-plural":"hipnotizoarelor","singular-vocative":"hipnotizoare","plural-vocative":"hipnotizoarelor"}},{"word":"hipnotizor","pos":"noun","definitions":["hypnotist"],"forms":{"plural":"hipnotizori","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipnotizor","accusative-definite-nominative-singular":"hipnotizorul","accusative-indefinite-nominative-plural":"hipnotizori","accusative-definite-nominative-plural":"hipnotizorii","dative-genitive-indefinite-singular":"hipnotizor","dative-definite-genitive-singular":"hipnotizorului","dative-genitive-indefinite-plural":"hipnotizori","dative-definite-genitive-plural":"hipnotizorilor","singular-vocative":"hipnotizorule","plural-vocative":"hipnotizorilor"}},{"word":"hipnoză","pos":"noun","definitions":["hypnosis"],"pronunciation":"/hipˈno.zə/","forms":{"plural":"hipnoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipnoză","accusative-definite-nominative-singular":"hipnoza","accusative-indefinite-nominative-plural":"hipnoze","accusative-definite-nominative-plural":"hipnozele","dative-genitive-indefinite-singular":"hipnoze","dative-definite-genitive-singular":"hipnozei","dative-genitive-indefinite-plural":"hipnoze","dative-definite-genitive-plural":"hipnozelor","singular-vocative":"hipnoză","plural-vocative":"hipnozelor","alternative":"хипнозэ"}},{"word":"hipoaciditate","pos":"noun","definitions":["hypoacidity"],"forms":{"plural":"hipoacidități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hipoaciditate","accusative-definite-nominative-singular":"hipoaciditatea","accusative-indefinite-nominative-plural":"hipoacidități","accusative-definite-nominative-plural":"hipoaciditățile","dative-genitive-indefinite-singular":"hipoacidități","dative-definite-genitive-singular":"hipoacidității","dative-genitive-indefinite-plural":"hipoacidități","dative-definite-genitive-plural":"hipoacidităților","singular-vocative":"hipoaciditate","plural-vocative":"hipoacidităților"}},{"word":"hipoacuzică","pos":"noun","definitions":["female equivalent of hipoacuzic"],"forms":{"plural":"hipoacuzice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipoacuzică","accusative-definite-nominative-singular":"hipoacuzica","accusative-indefinite-nominative-plural":"hipoacuzice","accusative-definite-nominative-plural":"hipoacuzicele","dative-genitive-indefinite-singular":"hipoacuzice","dative-definite-genitive-singular":"hipoacuzicei","dative-genitive-indefinite-plural":"hipoacuzice","dative-definite-genitive-plural":"hipoacuzicelor","singular-vocative":"hipoacuzică","plural-vocative":"hipoacuzicelor"}},{"word":"hipoacuzie","pos":"noun","definitions":["hypoacusis"],"forms":{"plural":"hipoacuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoacuzie","accusative-definite-nominative-singular":"hipoacuzia","accusative-indefinite-nominative-plural":"hipoacuzii","accusative-definite-nominative-plural":"hipoacuziile","dative-genitive-indefinite-singular":"hipoacuzii","dative-definite-genitive-singular":"hipoacuziei","dative-genitive-indefinite-plural":"hipoacuzii","dative-definite-genitive-plural":"hipoacuziilor","singular-vocative":"hipoacuzie","plural-vocative":"hipoacuziilor"}}];
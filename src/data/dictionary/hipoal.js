@@ -0,0 +1 @@
+export default [{"word":"hipoalgezie","pos":"noun","definitions":["hypoalgesia"],"forms":{"plural":"hipoalgezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoalgezie","accusative-definite-nominative-singular":"hipoalgezia","accusative-indefinite-nominative-plural":"hipoalgezii","accusative-definite-nominative-plural":"hipoalgeziile","dative-genitive-indefinite-singular":"hipoalgezii","dative-definite-genitive-singular":"hipoalgeziei","dative-genitive-indefinite-plural":"hipoalgezii","dative-definite-genitive-plural":"hipoalgeziilor","singular-vocative":"hipoalgezie","plural-vocative":"hipoalgeziilor"}},{"word":"hipoazotidă","pos":"noun","definitions":["nitrogen dioxide"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hipoazotidă","accusative-definite-nominative":"hipoazotida","dative-genitive-indefinite":"e","dative-definite-genitive":"ei","vocative":"hipoazotidă"}},{"word":"hipobaric","pos":"adj","definitions":["hypobaric"],"forms":{"feminine-singular":"hipobarică","masculine-plural":"hipobarici","feminine-neuter-plural":"hipobarice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipobaric","error-unrecognized-form-feminine-indefinite-singular":"hipobarică","error-unrecognized-form-indefinite-masculine-plural":"hipobarici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipobarice","definite-error-unrecognized-form-masculine-neuter-singular":"hipobaricul","definite-error-unrecognized-form-feminine-singular":"hipobarica","definite-error-unrecognized-form-masculine-plural":"hipobaricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipobaricele"}},{"word":"hipobromit","pos":"noun","definitions":["hypobromite"],"forms":{"plural":"hipobromiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipobromit","accusative-definite-nominative-singular":"hipobromitul","accusative-indefinite-nominative-plural":"hipobromiți","accusative-definite-nominative-plural":"hipobromiții","dative-genitive-indefinite-singular":"hipobromit","dative-definite-genitive-singular":"hipobromitului","dative-genitive-indefinite-plural":"hipobromiți","dative-definite-genitive-plural":"hipobromiților","singular-vocative":"hipobromitule","plural-vocative":"hipobromiților"}},{"word":"hipocalcemie","pos":"noun","definitions":["hypocalcemia"],"forms":{"plural":"hipocalcemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipocalcemie","accusative-definite-nominative-singular":"hipocalcemia","accusative-indefinite-nominative-plural":"hipocalcemii","accusative-definite-nominative-plural":"hipocalcemiile","dative-genitive-indefinite-singular":"hipocalcemii","dative-definite-genitive-singular":"hipocalcemiei","dative-genitive-indefinite-plural":"hipocalcemii","dative-definite-genitive-plural":"hipocalcemiilor","singular-vocative":"hipocalcemie","plural-vocative":"hipocalcemiilor"}},{"word":"hipocamp","pos":"noun","definitions":["hippocampus","sea horse"],"forms":{"plural":"hipocampi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipocamp","accusative-definite-nominative-singular":"hipocampul","accusative-indefinite-nominative-plural":"hipocampi","accusative-definite-nominative-plural":"hipocampii","dative-genitive-indefinite-singular":"hipocamp","dative-definite-genitive-singular":"hipocampului","dative-genitive-indefinite-plural":"hipocampi","dative-definite-genitive-plural":"hipocampilor","singular-vocative":"hipocampule","plural-vocative":"hipocampilor"}},{"word":"hipocapnie","pos":"noun","definitions":["hypocapnia"],"forms":{"plural":"hipocapnii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipocapnie","accusative-definite-nominative-singular":"hipocapnia","accusative-indefinite-nominative-plural":"hipocapnii","accusative-definite-nominative-plural":"hipocapniile","dative-genitive-indefinite-singular":"hipocapnii","dative-definite-genitive-singular":"hipocapniei","dative-genitive-indefinite-plural":"hipocapnii","dative-definite-genitive-plural":"hipocapniilor","singular-vocative":"hipocapnie","plural-vocative":"hipocapniilor"}},{"word":"hipocaust","pos":"noun","definitions":["hypocaust"],"forms":{"plural":"hipocauste","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipocaust","accusative-definite-nominative-singular":"hipocaustul","accusative-indefinite-nominative-plural":"hipocauste","accusative-definite-nominative-plural":"hipocaustele","dative-genitive-indefinite-singular":"hipocaust","dative-definite-genitive-singular":"hipocaustului","dative-genitive-indefinite-plural":"hipocauste","dative-definite-genitive-plural":"hipocaustelor","singular-vocative":"hipocaustule","plural-vocative":"hipocaustelor"}},{"word":"hipocentaur","pos":"noun","definitions":["hippocentaur"],"forms":{"plural":"hipocentauri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipocentaur","accusative-definite-nominative-singular":"hipocentaurul","accusative-indefinite-nominative-plural":"hipocentauri","accusative-definite-nominative-plural":"hipocentaurii","dative-genitive-indefinite-singular":"hipocentaur","dative-definite-genitive-singular":"hipocentaurului","dative-genitive-indefinite-plural":"hipocentauri","dative-definite-genitive-plural":"hipocentaurilor","singular-vocative":"hipocentaurule","plural-vocative":"hipocentaurilor"}},{"word":"hipocentru","pos":"noun","definitions":["hypocenter"],"forms":{"plural":"hipocentri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipocentru","accusative-definite-nominative-singular":"hipocentrul","accusative-indefinite-nominative-plural":"hipocentri","accusative-definite-nominative-plural":"hipocentrii","dative-genitive-indefinite-singular":"hipocentru","dative-definite-genitive-singular":"hipocentrului","dative-genitive-indefinite-plural":"hipocentri","dative-definite-genitive-plural":"hipocentrilor","singular-vocative":"hipocentrule","plural-vocative":"hipocentrilor"}},{"word":"hipocicloidă","pos":"noun","definitions":["hypocycloid"],"forms":{"plural":"hipocicloide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipocicloidă","accusative-definite-nominative-singular":"hipocicloida","accusative-indefinite-nominative-plural":"hipocicloide","accusative-definite-nominative-plural":"hipocicloidele","dative-genitive-indefinite-singular":"hipocicloide","dative-definite-genitive-singular":"hipocicloidei","dative-genitive-indefinite-plural":"hipocicloide","dative-definite-genitive-plural":"hipocicloidelor","singular-vocative":"hipocicloidă","plural-vocative":"hipocicloidelor"}},{"word":"hipociclu","pos":"noun","definitions":["hypocycloid"],"forms":{"plural":"hipocicluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipociclu","accusative-definite-nominative-singular":"hipocicluul","accusative-indefinite-nominative-plural":"hipocicluri","accusative-definite-nominative-plural":"hipociclurile","dative-genitive-indefinite-singular":"hipociclu","dative-definite-genitive-singular":"hipocicluului","dative-genitive-indefinite-plural":"hipocicluri","dative-definite-genitive-plural":"hipociclurilor","singular-vocative":"hipocicluule","plural-vocative":"hipociclurilor"}},{"word":"hipocloremie","pos":"noun","definitions":["hypochloraemia"],"forms":{"plural":"hipocloremii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipocloremie","accusative-definite-nominative-singular":"hipocloremia","accusative-indefinite-nominative-plural":"hipocloremii","accusative-definite-nominative-plural":"hipocloremiile","dative-genitive-indefinite-singular":"hipocloremii","dative-definite-genitive-singular":"hipocloremiei","dative-genitive-indefinite-plural":"hipocloremii","dative-definite-genitive-plural":"hipocloremiilor","singular-vocative":"hipocloremie","plural-vocative":"hipocloremiilor"}},{"word":"hipoclorhidrie","pos":"noun","definitions":["hypochlorhydria"],"forms":{"plural":"hipoclorhidrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoclorhidrie","accusative-definite-nominative-singular":"hipoclorhidria","accusative-indefinite-nominative-plural":"hipoclorhidrii","accusative-definite-nominative-plural":"hipoclorhidriile","dative-genitive-indefinite-singular":"hipoclorhidrii","dative-definite-genitive-singular":"hipoclorhidriei","dative-genitive-indefinite-plural":"hipoclorhidrii","dative-definite-genitive-plural":"hipoclorhidriilor","singular-vocative":"hipoclorhidrie","plural-vocative":"hipoclorhidriilor"}},{"word":"hipoclorit","pos":"noun","definitions":["hypochlorite"],"forms":{"plural":"hipocloriți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipoclorit","accusative-definite-nominative-singular":"hipocloritul","accusative-indefinite-nominative-plural":"hipocloriți","accusative-definite-nominative-plural":"hipocloriții","dative-genitive-indefinite-singular":"hipoclorit","dative-definite-genitive-singular":"hipocloritului","dative-genitive-indefinite-plural":"hipocloriți","dative-definite-genitive-plural":"hipocloriților","singular-vocative":"hipocloritule","plural-vocative":"hipocloriților"}},{"word":"hipoclorit de sodiu","pos":"noun","definitions":["sodium hypochlorite"]},{"word":"hipocloros","pos":"adj","definitions":["hypochlorous"],"forms":{"feminine-singular":"hipocloroasă","masculine-plural":"hipocloroși","feminine-neuter-plural":"hipocloroase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipocloros","error-unrecognized-form-feminine-indefinite-singular":"hipocloroasă","error-unrecognized-form-indefinite-masculine-plural":"hipocloroși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipocloroase","definite-error-unrecognized-form-masculine-neuter-singular":"hipoclorosul","definite-error-unrecognized-form-feminine-singular":"hipocloroasa","definite-error-unrecognized-form-masculine-plural":"hipocloroșii","definite-error-unrecognized-form-feminine-neuter-plural":"hipocloroasele"}},{"word":"hipocolie","pos":"noun","definitions":["hypocholia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipocolie","accusative-definite-nominative":"hipocolia","dative-genitive-indefinite":"hipocolii","dative-definite-genitive":"hipocoliei","vocative":"hipocolie"}},{"word":"hipocondrie","pos":"noun","definitions":["obsolete form of ipohondrie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipocondrie","accusative-definite-nominative":"hipocondria","dative-genitive-indefinite":"hipocondrii","dative-definite-genitive":"hipocondriei","vocative":"hipocondrie"}},{"word":"hipocondru","pos":"noun","definitions":["hypochondrium"],"forms":{"plural":"hipocondre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipocondru","accusative-definite-nominative-singular":"hipocondrul","accusative-indefinite-nominative-plural":"hipocondre","accusative-definite-nominative-plural":"hipocondrele","dative-genitive-indefinite-singular":"hipocondru","dative-definite-genitive-singular":"hipocondrului","dative-genitive-indefinite-plural":"hipocondre","dative-definite-genitive-plural":"hipocondrelor","singular-vocative":"hipocondrule","plural-vocative":"hipocondrelor"}},{"word":"hipocoristic","pos":"adj","definitions":["hypocoristic"],"forms":{"feminine-singular":"hipocoristică","masculine-plural":"hipocoristici","feminine-neuter-plural":"hipocoristice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipocoristic","error-unrecognized-form-feminine-indefinite-singular":"hipocoristică","error-unrecognized-form-indefinite-masculine-plural":"hipocoristici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipocoristice","definite-error-unrecognized-form-masculine-neuter-singular":"hipocoristicul","definite-error-unrecognized-form-feminine-singular":"hipocoristica","definite-error-unrecognized-form-masculine-plural":"hipocoristicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipocoristicele"}},{"word":"hipocotil","pos":"noun","definitions":["hypocotyl"],"forms":{"plural":"hipocotile","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipocotil","accusative-definite-nominative-singular":"hipocotilul","accusative-indefinite-nominative-plural":"hipocotile","accusative-definite-nominative-plural":"hipocotilele","dative-genitive-indefinite-singular":"hipocotil","dative-definite-genitive-singular":"hipocotilului","dative-genitive-indefinite-plural":"hipocotile","dative-definite-genitive-plural":"hipocotilelor","singular-vocative":"hipocotilule","plural-vocative":"hipocotilelor"}},{"word":"hipocratic","pos":"adj","definitions":["Hippocratic"],"forms":{"feminine-singular":"hipocratică","masculine-plural":"hipocratici","feminine-neuter-plural":"hipocratice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipocratic","error-unrecognized-form-feminine-indefinite-singular":"hipocratică","error-unrecognized-form-indefinite-masculine-plural":"hipocratici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipocratice","definite-error-unrecognized-form-masculine-neuter-singular":"hipocraticul","definite-error-unrecognized-form-feminine-singular":"hipocratica","definite-error-unrecognized-form-masculine-plural":"hipocraticii","definite-error-unrecognized-form-feminine-neuter-plural":"hipocraticele"}},{"word":"hipocratism","pos":"noun","definitions":["Hippocratism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipocratism","accusative-definite-nominative-singular":"hipocratismul","accusative-indefinite-nominative-plural":"hipocratisme","accusative-definite-nominative-plural":"hipocratismele","dative-genitive-indefinite-singular":"hipocratism","dative-definite-genitive-singular":"hipocratismului","dative-genitive-indefinite-plural":"hipocratisme","dative-definite-genitive-plural":"hipocratismelor","singular-vocative":"hipocratismule","plural-vocative":"hipocratismelor"}},{"word":"hipocristalin","pos":"adj","definitions":["hypocrystalline"],"forms":{"feminine-singular":"hipocristalină","masculine-plural":"hipocristalini","feminine-neuter-plural":"hipocristaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipocristalin","error-unrecognized-form-feminine-indefinite-singular":"hipocristalină","error-unrecognized-form-indefinite-masculine-plural":"hipocristalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipocristaline","definite-error-unrecognized-form-masculine-neuter-singular":"hipocristalinul","definite-error-unrecognized-form-feminine-singular":"hipocristalina","definite-error-unrecognized-form-masculine-plural":"hipocristalinii","definite-error-unrecognized-form-feminine-neuter-plural":"hipocristalinele"}},{"word":"hipocrizie","pos":"noun","definitions":["obsolete form of ipocrizie"],"forms":{"plural":"hipocrizii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipocrizie","accusative-definite-nominative-singular":"hipocrizia","accusative-indefinite-nominative-plural":"hipocrizii","accusative-definite-nominative-plural":"hipocriziile","dative-genitive-indefinite-singular":"hipocrizii","dative-definite-genitive-singular":"hipocriziei","dative-genitive-indefinite-plural":"hipocrizii","dative-definite-genitive-plural":"hipocriziilor","singular-vocative":"hipocrizie","plural-vocative":"hipocriziilor"}},{"word":"hipocromie","pos":"noun","definitions":["hypochromia"],"forms":{"plural":"hipocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipocromie","accusative-definite-nominative-singular":"hipocromia","accusative-indefinite-nominative-plural":"hipocromii","accusative-definite-nominative-plural":"hipocromiile","dative-genitive-indefinite-singular":"hipocromii","dative-definite-genitive-singular":"hipocromiei","dative-genitive-indefinite-plural":"hipocromii","dative-definite-genitive-plural":"hipocromiilor","singular-vocative":"hipocromie","plural-vocative":"hipocromiilor"}},{"word":"hipoderm","pos":"noun","definitions":["hypodermis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hipoderm","accusative-definite-nominative":"hipodermul","dative-genitive-indefinite":"hipoderm","dative-definite-genitive":"hipodermului","vocative":"hipodermule"}},{"word":"hipodermă","pos":"noun","definitions":["hypodermis"],"forms":{"plural":"hipoderme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipodermă","accusative-definite-nominative-singular":"hipoderma","accusative-indefinite-nominative-plural":"hipoderme","accusative-definite-nominative-plural":"hipodermele","dative-genitive-indefinite-singular":"hipoderme","dative-definite-genitive-singular":"hipodermei","dative-genitive-indefinite-plural":"hipoderme","dative-definite-genitive-plural":"hipodermelor","singular-vocative":"hipodermă","plural-vocative":"hipodermelor"}},{"word":"hipodermic","pos":"adj","definitions":["hypodermic"],"forms":{"feminine-singular":"hipodermică","masculine-plural":"hipodermici","feminine-neuter-plural":"hipodermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipodermic","error-unrecognized-form-feminine-indefinite-singular":"hipodermică","error-unrecognized-form-indefinite-masculine-plural":"hipodermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipodermice","definite-error-unrecognized-form-masculine-neuter-singular":"hipodermicul","definite-error-unrecognized-form-feminine-singular":"hipodermica","definite-error-unrecognized-form-masculine-plural":"hipodermicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipodermicele"}},{"word":"hipodermită","pos":"noun","definitions":["hypodermatitis"],"forms":{"plural":"hipodermite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipodermită","accusative-definite-nominative-singular":"hipodermita","accusative-indefinite-nominative-plural":"hipodermite","accusative-definite-nominative-plural":"hipodermitele","dative-genitive-indefinite-singular":"hipodermite","dative-definite-genitive-singular":"hipodermitei","dative-genitive-indefinite-plural":"hipodermite","dative-definite-genitive-plural":"hipodermitelor","singular-vocative":"hipodermită","plural-vocative":"hipodermitelor"}},{"word":"hipodermoză","pos":"noun","definitions":["hypodermosis"],"forms":{"plural":"hipodermoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipodermoză","accusative-definite-nominative-singular":"hipodermoza","accusative-indefinite-nominative-plural":"hipodermoze","accusative-definite-nominative-plural":"hipodermozele","dative-genitive-indefinite-singular":"hipodermoze","dative-definite-genitive-singular":"hipodermozei","dative-genitive-indefinite-plural":"hipodermoze","dative-definite-genitive-plural":"hipodermozelor","singular-vocative":"hipodermoză","plural-vocative":"hipodermozelor"}},{"word":"hipodrom","pos":"noun","definitions":["hippodrome"],"forms":{"plural":"hipodromuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hipodrom","accusative-definite-nominative-singular":"hipodromul","accusative-indefinite-nominative-plural":"hipodromuri","accusative-definite-nominative-plural":"hipodromurile","dative-genitive-indefinite-singular":"hipodrom","dative-definite-genitive-singular":"hipodromului","dative-genitive-indefinite-plural":"hipodromuri","dative-definite-genitive-plural":"hipodromurilor","singular-vocative":"hipodromule","plural-vocative":"hipodromurilor"}},{"word":"hipoergie","pos":"noun","definitions":["hypoergia"],"forms":{"plural":"hipoergii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoergie","accusative-definite-nominative-singular":"hipoergia","accusative-indefinite-nominative-plural":"hipoergii","accusative-definite-nominative-plural":"hipoergiile","dative-genitive-indefinite-singular":"hipoergii","dative-definite-genitive-singular":"hipoergiei","dative-genitive-indefinite-plural":"hipoergii","dative-definite-genitive-plural":"hipoergiilor","singular-vocative":"hipoergie","plural-vocative":"hipoergiilor"}},{"word":"hipoestezie","pos":"noun","definitions":["hypoesthesia"],"forms":{"plural":"hipoestezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoestezie","accusative-definite-nominative-singular":"hipoestezia","accusative-indefinite-nominative-plural":"hipoestezii","accusative-definite-nominative-plural":"hipoesteziile","dative-genitive-indefinite-singular":"hipoestezii","dative-definite-genitive-singular":"hipoesteziei","dative-genitive-indefinite-plural":"hipoestezii","dative-definite-genitive-plural":"hipoesteziilor","singular-vocative":"hipoestezie","plural-vocative":"hipoesteziilor"}},{"word":"hipofag","pos":"adj","definitions":["hippophagous"],"forms":{"feminine-singular":"hipofagă","masculine-plural":"hipofagi","feminine-neuter-plural":"hipofage","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipofag","error-unrecognized-form-feminine-indefinite-singular":"hipofagă","error-unrecognized-form-indefinite-masculine-plural":"hipofagi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipofage","definite-error-unrecognized-form-masculine-neuter-singular":"hipofagul","definite-error-unrecognized-form-feminine-singular":"hipofaga","definite-error-unrecognized-form-masculine-plural":"hipofagii","definite-error-unrecognized-form-feminine-neuter-plural":"hipofagele"}},{"word":"hipofagie","pos":"noun","definitions":["hippophagy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipofagie","accusative-definite-nominative-singular":"hipofagia","accusative-indefinite-nominative-plural":"hipofagii","accusative-definite-nominative-plural":"hipofagiile","dative-genitive-indefinite-singular":"hipofagii","dative-definite-genitive-singular":"hipofagiei","dative-genitive-indefinite-plural":"hipofagii","dative-definite-genitive-plural":"hipofagiilor","singular-vocative":"hipofagie","plural-vocative":"hipofagiilor"}},{"word":"hipofiză","pos":"noun","definitions":["hypophysis"],"forms":{"plural":"hipofize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipofiză","accusative-definite-nominative-singular":"hipofiza","accusative-indefinite-nominative-plural":"hipofize","accusative-definite-nominative-plural":"hipofizele","dative-genitive-indefinite-singular":"hipofize","dative-definite-genitive-singular":"hipofizei","dative-genitive-indefinite-plural":"hipofize","dative-definite-genitive-plural":"hipofizelor","singular-vocative":"hipofiză","plural-vocative":"hipofizelor"}},{"word":"hipofizar","pos":"adj","definitions":["hypophysial, pituitary"],"forms":{"feminine-singular":"hipofizară","masculine-plural":"hipofizari","feminine-neuter-plural":"hipofizare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipofizar","error-unrecognized-form-feminine-indefinite-singular":"hipofizară","error-unrecognized-form-indefinite-masculine-plural":"hipofizari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipofizare","definite-error-unrecognized-form-masculine-neuter-singular":"hipofizarul","definite-error-unrecognized-form-feminine-singular":"hipofizara","definite-error-unrecognized-form-masculine-plural":"hipofizarii","definite-error-unrecognized-form-feminine-neuter-plural":"hipofizarele"}},{"word":"hipofizectomie","pos":"noun","definitions":["hypophysectomy"],"forms":{"plural":"hipofizectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipofizectomie","accusative-definite-nominative-singular":"hipofizectomia","accusative-indefinite-nominative-plural":"hipofizectomii","accusative-definite-nominative-plural":"hipofizectomiile","dative-genitive-indefinite-singular":"hipofizectomii","dative-definite-genitive-singular":"hipofizectomiei","dative-genitive-indefinite-plural":"hipofizectomii","dative-definite-genitive-plural":"hipofizectomiilor","singular-vocative":"hipofizectomie","plural-vocative":"hipofizectomiilor"}},{"word":"hipofoliculinism","pos":"noun","definitions":["hypofolliculinism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipofoliculinism","accusative-definite-nominative-singular":"hipofoliculinismul","accusative-indefinite-nominative-plural":"hipofoliculinisme","accusative-definite-nominative-plural":"hipofoliculinismele","dative-genitive-indefinite-singular":"hipofoliculinism","dative-definite-genitive-singular":"hipofoliculinismului","dative-genitive-indefinite-plural":"hipofoliculinisme","dative-definite-genitive-plural":"hipofoliculinismelor","singular-vocative":"hipofoliculinismule","plural-vocative":"hipofoliculinismelor"}},{"word":"hipofonie","pos":"noun","definitions":["hypophonia"],"forms":{"plural":"hipofonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipofonie","accusative-definite-nominative-singular":"hipofonia","accusative-indefinite-nominative-plural":"hipofonii","accusative-definite-nominative-plural":"hipofoniile","dative-genitive-indefinite-singular":"hipofonii","dative-definite-genitive-singular":"hipofoniei","dative-genitive-indefinite-plural":"hipofonii","dative-definite-genitive-plural":"hipofoniilor","singular-vocative":"hipofonie","plural-vocative":"hipofoniilor"}},{"word":"hipofosfat","pos":"noun","definitions":["hypophosphate"],"forms":{"plural":"hipofosfați","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipofosfat","accusative-definite-nominative-singular":"hipofosfatul","accusative-indefinite-nominative-plural":"hipofosfați","accusative-definite-nominative-plural":"hipofosfații","dative-genitive-indefinite-singular":"hipofosfat","dative-definite-genitive-singular":"hipofosfatului","dative-genitive-indefinite-plural":"hipofosfați","dative-definite-genitive-plural":"hipofosfaților","singular-vocative":"hipofosfatule","plural-vocative":"hipofosfaților"}},{"word":"hipofosfit","pos":"noun","definitions":["hypophosphite"],"forms":{"plural":"hipofosfiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipofosfit","accusative-definite-nominative-singular":"hipofosfitul","accusative-indefinite-nominative-plural":"hipofosfiți","accusative-definite-nominative-plural":"hipofosfiții","dative-genitive-indefinite-singular":"hipofosfit","dative-definite-genitive-singular":"hipofosfitului","dative-genitive-indefinite-plural":"hipofosfiți","dative-definite-genitive-plural":"hipofosfiților","singular-vocative":"hipofosfitule","plural-vocative":"hipofosfiților"}},{"word":"hipofosforic","pos":"adj","definitions":["hypophosphoric"],"forms":{"feminine-singular":"hipofosforică","masculine-plural":"hipofosforici","feminine-neuter-plural":"hipofosforice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipofosforic","error-unrecognized-form-feminine-indefinite-singular":"hipofosforică","error-unrecognized-form-indefinite-masculine-plural":"hipofosforici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipofosforice","definite-error-unrecognized-form-masculine-neuter-singular":"hipofosforicul","definite-error-unrecognized-form-feminine-singular":"hipofosforica","definite-error-unrecognized-form-masculine-plural":"hipofosforicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipofosforicele"}},{"word":"hipofosforos","pos":"adj","definitions":["hypophosphorous"],"forms":{"feminine-singular":"hipofosforoasă","masculine-plural":"hipofosforoși","feminine-neuter-plural":"hipofosforoase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipofosforos","error-unrecognized-form-feminine-indefinite-singular":"hipofosforoasă","error-unrecognized-form-indefinite-masculine-plural":"hipofosforoși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipofosforoase","definite-error-unrecognized-form-masculine-neuter-singular":"hipofosforosul","definite-error-unrecognized-form-feminine-singular":"hipofosforoasa","definite-error-unrecognized-form-masculine-plural":"hipofosforoșii","definite-error-unrecognized-form-feminine-neuter-plural":"hipofosforoasele"}},{"word":"hipofuncție","pos":"noun","definitions":["hypofunction"],"forms":{"plural":"hipofuncții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipofuncție","accusative-definite-nominative-singular":"hipofuncția","accusative-indefinite-nominative-plural":"hipofuncții","accusative-definite-nominative-plural":"hipofuncțiile","dative-genitive-indefinite-singular":"hipofuncții","dative-definite-genitive-singular":"hipofuncției","dative-genitive-indefinite-plural":"hipofuncții","dative-definite-genitive-plural":"hipofuncțiilor","singular-vocative":"hipofuncție","plural-vocative":"hipofuncțiilor"}},{"word":"hipofuncțiune","pos":"noun","definitions":["alternative form of hipofuncție"],"forms":{"plural":"hipofuncțiuni"}},{"word":"hipogastric","pos":"adj","definitions":["hypogastric"],"forms":{"feminine-singular":"hipogastrică","masculine-plural":"hipogastrici","feminine-neuter-plural":"hipogastrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipogastric","error-unrecognized-form-feminine-indefinite-singular":"hipogastrică","error-unrecognized-form-indefinite-masculine-plural":"hipogastrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipogastrice","definite-error-unrecognized-form-masculine-neuter-singular":"hipogastricul","definite-error-unrecognized-form-feminine-singular":"hipogastrica","definite-error-unrecognized-form-masculine-plural":"hipogastricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipogastricele"}},{"word":"hipogastru","pos":"noun","definitions":["hypogastrium"],"forms":{"plural":"hipogastre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipogastru","accusative-definite-nominative-singular":"hipogastrul","accusative-indefinite-nominative-plural":"hipogastre","accusative-definite-nominative-plural":"hipogastrele","dative-genitive-indefinite-singular":"hipogastru","dative-definite-genitive-singular":"hipogastrului","dative-genitive-indefinite-plural":"hipogastre","dative-definite-genitive-plural":"hipogastrelor","singular-vocative":"hipogastrule","plural-vocative":"hipogastrelor"}},{"word":"hipogen","pos":"adj","definitions":["hypogenic"],"pronunciation":"/hi.poˈd͡ʒen/","forms":{"feminine-singular":"hipogenă","masculine-plural":"hipogeni","feminine-neuter-plural":"hipogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipogen","error-unrecognized-form-feminine-indefinite-singular":"hipogenă","error-unrecognized-form-indefinite-masculine-plural":"hipogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipogene","definite-error-unrecognized-form-masculine-neuter-singular":"hipogenul","definite-error-unrecognized-form-feminine-singular":"hipogena","definite-error-unrecognized-form-masculine-plural":"hipogenii","definite-error-unrecognized-form-feminine-neuter-plural":"hipogenele"}},{"word":"hipogenezie","pos":"noun","definitions":["hypogenesis"],"forms":{"plural":"hipogenezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipogenezie","accusative-definite-nominative-singular":"hipogenezia","accusative-indefinite-nominative-plural":"hipogenezii","accusative-definite-nominative-plural":"hipogeneziile","dative-genitive-indefinite-singular":"hipogenezii","dative-definite-genitive-singular":"hipogeneziei","dative-genitive-indefinite-plural":"hipogenezii","dative-definite-genitive-plural":"hipogeneziilor","singular-vocative":"hipogenezie","plural-vocative":"hipogeneziilor"}},{"word":"hipogenitalism","pos":"noun","definitions":["hypogenitalism"],"forms":{"plural":"hipogenitalisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipogenitalism","accusative-definite-nominative-singular":"hipogenitalismul","accusative-indefinite-nominative-plural":"hipogenitalisme","accusative-definite-nominative-plural":"hipogenitalismele","dative-genitive-indefinite-singular":"hipogenitalism","dative-definite-genitive-singular":"hipogenitalismului","dative-genitive-indefinite-plural":"hipogenitalisme","dative-definite-genitive-plural":"hipogenitalismelor","singular-vocative":"hipogenitalismule","plural-vocative":"hipogenitalismelor"}},{"word":"hipogeu","pos":"noun","definitions":["hypogeum, hypogeous"],"forms":{"plural":"hipogei","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipogeu","accusative-definite-nominative-singular":"hipogeul","accusative-indefinite-nominative-plural":"hipogei","accusative-definite-nominative-plural":"hipogeile","dative-genitive-indefinite-singular":"hipogeu","dative-definite-genitive-singular":"hipogeului","dative-genitive-indefinite-plural":"hipogei","dative-definite-genitive-plural":"hipogeilor","singular-vocative":"hipogeule","plural-vocative":"hipogeilor"}},{"word":"hipogeuzie","pos":"noun","definitions":["hypogeusia"],"forms":{"plural":"hipogeuzii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipogeuzie","accusative-definite-nominative-singular":"hipogeuzia","accusative-indefinite-nominative-plural":"hipogeuzii","accusative-definite-nominative-plural":"hipogeuziile","dative-genitive-indefinite-singular":"hipogeuzii","dative-definite-genitive-singular":"hipogeuziei","dative-genitive-indefinite-plural":"hipogeuzii","dative-definite-genitive-plural":"hipogeuziilor","singular-vocative":"hipogeuzie","plural-vocative":"hipogeuziilor"}},{"word":"hipogin","pos":"adj","definitions":["hypogynous"],"forms":{"feminine-singular":"hipogină","masculine-plural":"hipogini","feminine-neuter-plural":"hipogine","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipogin","error-unrecognized-form-feminine-indefinite-singular":"hipogină","error-unrecognized-form-indefinite-masculine-plural":"hipogini","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipogine","definite-error-unrecognized-form-masculine-neuter-singular":"hipoginul","definite-error-unrecognized-form-feminine-singular":"hipogina","definite-error-unrecognized-form-masculine-plural":"hipoginii","definite-error-unrecognized-form-feminine-neuter-plural":"hipoginele"}},{"word":"hipoglicemiant","pos":"adj","definitions":["causing hypoglycemia"],"forms":{"feminine-singular":"hipoglicemiantă","masculine-plural":"hipoglicemianți","feminine-neuter-plural":"hipoglicemiante","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipoglicemiant","error-unrecognized-form-feminine-indefinite-singular":"hipoglicemiantă","error-unrecognized-form-indefinite-masculine-plural":"hipoglicemianți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipoglicemiante","definite-error-unrecognized-form-masculine-neuter-singular":"hipoglicemiantul","definite-error-unrecognized-form-feminine-singular":"hipoglicemianta","definite-error-unrecognized-form-masculine-plural":"hipoglicemianții","definite-error-unrecognized-form-feminine-neuter-plural":"hipoglicemiantele"}},{"word":"hipoglicemie","pos":"noun","definitions":["hypoglycemia"],"forms":{"plural":"hipoglicemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoglicemie","accusative-definite-nominative-singular":"hipoglicemia","accusative-indefinite-nominative-plural":"hipoglicemii","accusative-definite-nominative-plural":"hipoglicemiile","dative-genitive-indefinite-singular":"hipoglicemii","dative-definite-genitive-singular":"hipoglicemiei","dative-genitive-indefinite-plural":"hipoglicemii","dative-definite-genitive-plural":"hipoglicemiilor","singular-vocative":"hipoglicemie","plural-vocative":"hipoglicemiilor"}},{"word":"hipoglos","pos":"adj","definitions":["hypoglossal"],"forms":{"feminine-singular":"hipogloasă","masculine-plural":"hipogloși","feminine-neuter-plural":"hipogloase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipoglos","error-unrecognized-form-feminine-indefinite-singular":"hipogloasă","error-unrecognized-form-indefinite-masculine-plural":"hipogloși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipogloase","definite-error-unrecognized-form-masculine-neuter-singular":"hipoglosul","definite-error-unrecognized-form-feminine-singular":"hipogloasa","definite-error-unrecognized-form-masculine-plural":"hipogloșii","definite-error-unrecognized-form-feminine-neuter-plural":"hipogloasele"}},{"word":"hipogrif","pos":"noun","definitions":["hippogriff"],"forms":{"plural":"hipogrifi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipogrif","accusative-definite-nominative-singular":"hipogriful","accusative-indefinite-nominative-plural":"hipogrifi","accusative-definite-nominative-plural":"hipogrifii","dative-genitive-indefinite-singular":"hipogrif","dative-definite-genitive-singular":"hipogrifului","dative-genitive-indefinite-plural":"hipogrifi","dative-definite-genitive-plural":"hipogrifilor","singular-vocative":"hipogrifule","plural-vocative":"hipogrifilor"}},{"word":"hipohemie","pos":"noun","definitions":["hypohemia"],"forms":{"plural":"hipohemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipohemie","accusative-definite-nominative-singular":"hipohemia","accusative-indefinite-nominative-plural":"hipohemii","accusative-definite-nominative-plural":"hipohemiile","dative-genitive-indefinite-singular":"hipohemii","dative-definite-genitive-singular":"hipohemiei","dative-genitive-indefinite-plural":"hipohemii","dative-definite-genitive-plural":"hipohemiilor","singular-vocative":"hipohemie","plural-vocative":"hipohemiilor"}},{"word":"hipohidroză","pos":"noun","definitions":["hypohydrosis"],"forms":{"plural":"hipohidroze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipohidroză","accusative-definite-nominative-singular":"hipohidroza","accusative-indefinite-nominative-plural":"hipohidroze","accusative-definite-nominative-plural":"hipohidrozele","dative-genitive-indefinite-singular":"hipohidroze","dative-definite-genitive-singular":"hipohidrozei","dative-genitive-indefinite-plural":"hipohidroze","dative-definite-genitive-plural":"hipohidrozelor","singular-vocative":"hipohidroză","plural-vocative":"hipohidrozelor"}},{"word":"hipoid","pos":"adj","definitions":["hypoid"],"forms":{"feminine-singular":"hipoidă","masculine-plural":"hipoizi","feminine-neuter-plural":"hipoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipoid","error-unrecognized-form-feminine-indefinite-singular":"hipoidă","error-unrecognized-form-indefinite-masculine-plural":"hipoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipoide","definite-error-unrecognized-form-masculine-neuter-singular":"hipoidul","definite-error-unrecognized-form-feminine-singular":"hipoida","definite-error-unrecognized-form-masculine-plural":"hipoizii","definite-error-unrecognized-form-feminine-neuter-plural":"hipoidele"}},{"word":"hipoinsulinism","pos":"noun","definitions":["hypoinsulinism"],"forms":{"plural":"hipoinsulinisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipoinsulinism","accusative-definite-nominative-singular":"hipoinsulinismul","accusative-indefinite-nominative-plural":"hipoinsulinisme","accusative-definite-nominative-plural":"hipoinsulinismele","dative-genitive-indefinite-singular":"hipoinsulinism","dative-definite-genitive-singular":"hipoinsulinismului","dative-genitive-indefinite-plural":"hipoinsulinisme","dative-definite-genitive-plural":"hipoinsulinismelor","singular-vocative":"hipoinsulinismule","plural-vocative":"hipoinsulinismelor"}},{"word":"hipolog","pos":"noun","definitions":["hippologist"],"forms":{"plural":"hipologi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipolog","accusative-definite-nominative-singular":"hipologul","accusative-indefinite-nominative-plural":"hipologi","accusative-definite-nominative-plural":"hipologii","dative-genitive-indefinite-singular":"hipolog","dative-definite-genitive-singular":"hipologului","dative-genitive-indefinite-plural":"hipologi","dative-definite-genitive-plural":"hipologilor","singular-vocative":"hipologule","plural-vocative":"hipologilor"}},{"word":"hipologă","pos":"noun","definitions":["female equivalent of hipolog"],"forms":{"plural":"hipologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipologă","accusative-definite-nominative-singular":"hipologa","accusative-indefinite-nominative-plural":"hipologe","accusative-definite-nominative-plural":"hipologele","dative-genitive-indefinite-singular":"hipologe","dative-definite-genitive-singular":"hipologei","dative-genitive-indefinite-plural":"hipologe","dative-definite-genitive-plural":"hipologelor","singular-vocative":"hipologă","plural-vocative":"hipologelor"}},{"word":"hipologic","pos":"adj","definitions":["hippological"],"forms":{"feminine-singular":"hipologică","masculine-plural":"hipologici","feminine-neuter-plural":"hipologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipologic","error-unrecognized-form-feminine-indefinite-singular":"hipologică","error-unrecognized-form-indefinite-masculine-plural":"hipologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipologice","definite-error-unrecognized-form-masculine-neuter-singular":"hipologicul","definite-error-unrecognized-form-feminine-singular":"hipologica","definite-error-unrecognized-form-masculine-plural":"hipologicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipologicele"}},{"word":"hipologie","pos":"noun","definitions":["hippology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipologie","accusative-definite-nominative-singular":"hipologia","accusative-indefinite-nominative-plural":"hipologii","accusative-definite-nominative-plural":"hipologiile","dative-genitive-indefinite-singular":"hipologii","dative-definite-genitive-singular":"hipologiei","dative-genitive-indefinite-plural":"hipologii","dative-definite-genitive-plural":"hipologiilor","singular-vocative":"hipologie","plural-vocative":"hipologiilor"}},{"word":"hipomanție","pos":"noun","definitions":["hypomania"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipomanție","accusative-definite-nominative-singular":"hipomanția","accusative-indefinite-nominative-plural":"hipomanții","accusative-definite-nominative-plural":"hipomanțiile","dative-genitive-indefinite-singular":"hipomanții","dative-definite-genitive-singular":"hipomanției","dative-genitive-indefinite-plural":"hipomanții","dative-definite-genitive-plural":"hipomanțiilor","singular-vocative":"hipomanție","plural-vocative":"hipomanțiilor"}},{"word":"hipomenoree","pos":"noun","definitions":["hypomenorrhea"],"forms":{"plural":"hipomenoree","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipomenoree","accusative-definite-nominative-singular":"hipomenoreea","accusative-indefinite-nominative-plural":"hipomenoree","accusative-definite-nominative-plural":"hipomenoreele","dative-genitive-indefinite-singular":"hipomenoree","dative-definite-genitive-singular":"hipomenoreei","dative-genitive-indefinite-plural":"hipomenoree","dative-definite-genitive-plural":"hipomenoreelor","singular-vocative":"hipomenoree","plural-vocative":"hipomenoreelor"}},{"word":"hipometrie","pos":"noun","definitions":["hypometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipometrie","accusative-definite-nominative-singular":"hipometria","accusative-indefinite-nominative-plural":"hipometrii","accusative-definite-nominative-plural":"hipometriile","dative-genitive-indefinite-singular":"hipometrii","dative-definite-genitive-singular":"hipometriei","dative-genitive-indefinite-plural":"hipometrii","dative-definite-genitive-plural":"hipometriilor","singular-vocative":"hipometrie","plural-vocative":"hipometriilor"}},{"word":"hipometrop","pos":"adj","definitions":["myopic"],"forms":{"feminine-singular":"hipometropă","masculine-plural":"hipometropi","feminine-neuter-plural":"hipometrope","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipometrop","error-unrecognized-form-feminine-indefinite-singular":"hipometropă","error-unrecognized-form-indefinite-masculine-plural":"hipometropi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipometrope","definite-error-unrecognized-form-masculine-neuter-singular":"hipometropul","definite-error-unrecognized-form-feminine-singular":"hipometropa","definite-error-unrecognized-form-masculine-plural":"hipometropii","definite-error-unrecognized-form-feminine-neuter-plural":"hipometropele"}},{"word":"hipometrop","pos":"noun","definitions":["myopic"],"forms":{"plural":"hipometropi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipometrop","accusative-definite-nominative-singular":"hipometropul","accusative-indefinite-nominative-plural":"hipometropi","accusative-definite-nominative-plural":"hipometropii","dative-genitive-indefinite-singular":"hipometrop","dative-definite-genitive-singular":"hipometropului","dative-genitive-indefinite-plural":"hipometropi","dative-definite-genitive-plural":"hipometropilor","singular-vocative":"hipometropule","plural-vocative":"hipometropilor"}},{"word":"hipometropă","pos":"noun","definitions":["female equivalent of hipometrop"],"forms":{"plural":"hipometrope","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipometropă","accusative-definite-nominative-singular":"hipometropa","accusative-indefinite-nominative-plural":"hipometrope","accusative-definite-nominative-plural":"hipometropele","dative-genitive-indefinite-singular":"hipometrope","dative-definite-genitive-singular":"hipometropei","dative-genitive-indefinite-plural":"hipometrope","dative-definite-genitive-plural":"hipometropelor","singular-vocative":"hipometropă","plural-vocative":"hipometropelor"}},{"word":"hipometropie","pos":"noun","definitions":["hypometropia, myopia, nearsightedness"],"forms":{"plural":"hipometropii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipometropie","accusative-definite-nominative-singular":"hipometropia","accusative-indefinite-nominative-plural":"hipometropii","accusative-definite-nominative-plural":"hipometropiile","dative-genitive-indefinite-singular":"hipometropii","dative-definite-genitive-singular":"hipometropiei","dative-genitive-indefinite-plural":"hipometropii","dative-definite-genitive-plural":"hipometropiilor","singular-vocative":"hipometropie","plural-vocative":"hipometropiilor"}},{"word":"hipometru","pos":"noun","definitions":["hippometer"],"forms":{"plural":"hipometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipometru","accusative-definite-nominative-singular":"hipometruul","accusative-indefinite-nominative-plural":"hipometre","accusative-definite-nominative-plural":"hipometrele","dative-genitive-indefinite-singular":"hipometru","dative-definite-genitive-singular":"hipometruului","dative-genitive-indefinite-plural":"hipometre","dative-definite-genitive-plural":"hipometrelor","singular-vocative":"hipometruule","plural-vocative":"hipometrelor"}},{"word":"hipomnezie","pos":"noun","definitions":["hypomnesia"],"forms":{"plural":"hipomnezii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipomnezie","accusative-definite-nominative-singular":"hipomnezia","accusative-indefinite-nominative-plural":"hipomnezii","accusative-definite-nominative-plural":"hipomneziile","dative-genitive-indefinite-singular":"hipomnezii","dative-definite-genitive-singular":"hipomneziei","dative-genitive-indefinite-plural":"hipomnezii","dative-definite-genitive-plural":"hipomneziilor","singular-vocative":"hipomnezie","plural-vocative":"hipomneziilor"}},{"word":"hipomobil","pos":"adj","definitions":["horse-drawn"],"forms":{"feminine-singular":"hipomobilă","masculine-plural":"hipomobili","feminine-neuter-plural":"hipomobile","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipomobil","error-unrecognized-form-feminine-indefinite-singular":"hipomobilă","error-unrecognized-form-indefinite-masculine-plural":"hipomobili","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipomobile","definite-error-unrecognized-form-masculine-neuter-singular":"hipomobilul","definite-error-unrecognized-form-feminine-singular":"hipomobila","definite-error-unrecognized-form-masculine-plural":"hipomobilii","definite-error-unrecognized-form-feminine-neuter-plural":"hipomobilele"}},{"word":"hiponastie","pos":"noun","definitions":["hyponasty"],"forms":{"plural":"hiponastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiponastie","accusative-definite-nominative-singular":"hiponastia","accusative-indefinite-nominative-plural":"hiponastii","accusative-definite-nominative-plural":"hiponastiile","dative-genitive-indefinite-singular":"hiponastii","dative-definite-genitive-singular":"hiponastiei","dative-genitive-indefinite-plural":"hiponastii","dative-definite-genitive-plural":"hiponastiilor","singular-vocative":"hiponastie","plural-vocative":"hiponastiilor"}},{"word":"hiponim","pos":"noun","definitions":["hyponym"],"forms":{"plural":"hiponime","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiponim","accusative-definite-nominative-singular":"hiponimul","accusative-indefinite-nominative-plural":"hiponime","accusative-definite-nominative-plural":"hiponimele","dative-genitive-indefinite-singular":"hiponim","dative-definite-genitive-singular":"hiponimului","dative-genitive-indefinite-plural":"hiponime","dative-definite-genitive-plural":"hiponimelor","singular-vocative":"hiponimule","plural-vocative":"hiponimelor"}},{"word":"hipoparatiroidism","pos":"noun","definitions":["hypoparathyroidism"],"forms":{"plural":"hipoparatiroidisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipoparatiroidism","accusative-definite-nominative-singular":"hipoparatiroidismul","accusative-indefinite-nominative-plural":"hipoparatiroidisme","accusative-definite-nominative-plural":"hipoparatiroidismele","dative-genitive-indefinite-singular":"hipoparatiroidism","dative-definite-genitive-singular":"hipoparatiroidismului","dative-genitive-indefinite-plural":"hipoparatiroidisme","dative-definite-genitive-plural":"hipoparatiroidismelor","singular-vocative":"hipoparatiroidismule","plural-vocative":"hipoparatiroidismelor"}},{"word":"hipopatologie","pos":"noun","definitions":["hippopathology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipopatologie","accusative-definite-nominative-singular":"hipopatologia","accusative-indefinite-nominative-plural":"hipopatologii","accusative-definite-nominative-plural":"hipopatologiile","dative-genitive-indefinite-singular":"hipopatologii","dative-definite-genitive-singular":"hipopatologiei","dative-genitive-indefinite-plural":"hipopatologii","dative-definite-genitive-plural":"hipopatologiilor","singular-vocative":"hipopatologie","plural-vocative":"hipopatologiilor"}},{"word":"hipopepsie","pos":"noun","definitions":["hypopepsy"],"forms":{"plural":"hipopepsii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipopepsie","accusative-definite-nominative-singular":"hipopepsia","accusative-indefinite-nominative-plural":"hipopepsii","accusative-definite-nominative-plural":"hipopepsiile","dative-genitive-indefinite-singular":"hipopepsii","dative-definite-genitive-singular":"hipopepsiei","dative-genitive-indefinite-plural":"hipopepsii","dative-definite-genitive-plural":"hipopepsiilor","singular-vocative":"hipopepsie","plural-vocative":"hipopepsiilor"}},{"word":"hipoplazie","pos":"noun","definitions":["hypoplasia"],"forms":{"plural":"hipoplazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoplazie","accusative-definite-nominative-singular":"hipoplazia","accusative-indefinite-nominative-plural":"hipoplazii","accusative-definite-nominative-plural":"hipoplaziile","dative-genitive-indefinite-singular":"hipoplazii","dative-definite-genitive-singular":"hipoplaziei","dative-genitive-indefinite-plural":"hipoplazii","dative-definite-genitive-plural":"hipoplaziilor","singular-vocative":"hipoplazie","plural-vocative":"hipoplaziilor"}},{"word":"hipopotam","pos":"noun","definitions":["hippopotamus"],"pronunciation":"/ˌhi.po.po.ˈtam/","forms":{"plural":"hipopotami","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipopotam","accusative-definite-nominative-singular":"hipopotamul","accusative-indefinite-nominative-plural":"hipopotami","accusative-definite-nominative-plural":"hipopotamii","dative-genitive-indefinite-singular":"hipopotam","dative-definite-genitive-singular":"hipopotamului","dative-genitive-indefinite-plural":"hipopotami","dative-definite-genitive-plural":"hipopotamilor","singular-vocative":"hipopotamule","plural-vocative":"hipopotamilor"}},{"word":"hipopotami","pos":"noun","definitions":["indefinite plural of hipopotam"],"pronunciation":"[hipopoˈtamʲ]","gender":"m-p"},{"word":"hipoproteinemie","pos":"noun","definitions":["hypoproteinemia"],"forms":{"plural":"hipoproteinemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoproteinemie","accusative-definite-nominative-singular":"hipoproteinemia","accusative-indefinite-nominative-plural":"hipoproteinemii","accusative-definite-nominative-plural":"hipoproteinemiile","dative-genitive-indefinite-singular":"hipoproteinemii","dative-definite-genitive-singular":"hipoproteinemiei","dative-genitive-indefinite-plural":"hipoproteinemii","dative-definite-genitive-plural":"hipoproteinemiilor","singular-vocative":"hipoproteinemie","plural-vocative":"hipoproteinemiilor"}},{"word":"hiporchemă","pos":"noun","definitions":["hyporchema"],"forms":{"plural":"hiporcheme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiporchemă","accusative-definite-nominative-singular":"hiporchema","accusative-indefinite-nominative-plural":"hiporcheme","accusative-definite-nominative-plural":"hiporchemele","dative-genitive-indefinite-singular":"hiporcheme","dative-definite-genitive-singular":"hiporchemei","dative-genitive-indefinite-plural":"hiporcheme","dative-definite-genitive-plural":"hiporchemelor","singular-vocative":"hiporchemă","plural-vocative":"hiporchemelor"}},{"word":"hiporexie","pos":"noun","definitions":["hyporexia"],"forms":{"plural":"hiporexii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiporexie","accusative-definite-nominative-singular":"hiporexia","accusative-indefinite-nominative-plural":"hiporexii","accusative-definite-nominative-plural":"hiporexiile","dative-genitive-indefinite-singular":"hiporexii","dative-definite-genitive-singular":"hiporexiei","dative-genitive-indefinite-plural":"hiporexii","dative-definite-genitive-plural":"hiporexiilor","singular-vocative":"hiporexie","plural-vocative":"hiporexiilor"}},{"word":"hiposceniu","pos":"noun","definitions":["hyposcenium"],"forms":{"plural":"hiposcenii","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiposceniu","accusative-definite-nominative-singular":"hiposceniul","accusative-indefinite-nominative-plural":"hiposcenii","accusative-definite-nominative-plural":"hiposceniile","dative-genitive-indefinite-singular":"hiposceniu","dative-definite-genitive-singular":"hiposceniului","dative-genitive-indefinite-plural":"hiposcenii","dative-definite-genitive-plural":"hiposceniilor","singular-vocative":"hiposceniule","plural-vocative":"hiposceniilor"}},{"word":"hiposecreție","pos":"noun","definitions":["hyposecretion"],"forms":{"plural":"hiposecreții","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiposecreție","accusative-definite-nominative-singular":"hiposecreția","accusative-indefinite-nominative-plural":"hiposecreții","accusative-definite-nominative-plural":"hiposecrețiile","dative-genitive-indefinite-singular":"hiposecreții","dative-definite-genitive-singular":"hiposecreției","dative-genitive-indefinite-plural":"hiposecreții","dative-definite-genitive-plural":"hiposecrețiilor","singular-vocative":"hiposecreție","plural-vocative":"hiposecrețiilor"}},{"word":"hiposensibilitate","pos":"noun","definitions":["hyposensitivity"],"forms":{"plural":"hiposensibilități","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hiposensibilitate","accusative-definite-nominative-singular":"hiposensibilitatea","accusative-indefinite-nominative-plural":"hiposensibilități","accusative-definite-nominative-plural":"hiposensibilitățile","dative-genitive-indefinite-singular":"hiposensibilități","dative-definite-genitive-singular":"hiposensibilității","dative-genitive-indefinite-plural":"hiposensibilități","dative-definite-genitive-plural":"hiposensibilităților","singular-vocative":"hiposensibilitate","plural-vocative":"hiposensibilităților"}},{"word":"hiposmie","pos":"noun","definitions":["hyposmia"],"forms":{"plural":"hiposmii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hiposmie","accusative-definite-nominative-singular":"hiposmia","accusative-indefinite-nominative-plural":"hiposmii","accusative-definite-nominative-plural":"hiposmiile","dative-genitive-indefinite-singular":"hiposmii","dative-definite-genitive-singular":"hiposmiei","dative-genitive-indefinite-plural":"hiposmii","dative-definite-genitive-plural":"hiposmiilor","singular-vocative":"hiposmie","plural-vocative":"hiposmiilor"}},{"word":"hipostază","pos":"noun","definitions":["hypostasis"],"gender":"f"},{"word":"hipostenie","pos":"noun","definitions":["hyposthenia"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipostenie","accusative-definite-nominative":"hipostenia","dative-genitive-indefinite":"hipostenii","dative-definite-genitive":"hiposteniei","vocative":"hipostenie"}},{"word":"hipostil","pos":"noun","definitions":["hypostyle"],"forms":{"plural":"hipostiluri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hipostil","accusative-definite-nominative-singular":"hipostilul","accusative-indefinite-nominative-plural":"hipostiluri","accusative-definite-nominative-plural":"hipostilurile","dative-genitive-indefinite-singular":"hipostil","dative-definite-genitive-singular":"hipostilului","dative-genitive-indefinite-plural":"hipostiluri","dative-definite-genitive-plural":"hipostilurilor","singular-vocative":"hipostilule","plural-vocative":"hipostilurilor"}},{"word":"hiposulfit","pos":"noun","definitions":["hyposulfite"],"forms":{"plural":"hiposulfiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hiposulfit","accusative-definite-nominative-singular":"hiposulfitul","accusative-indefinite-nominative-plural":"hiposulfiți","accusative-definite-nominative-plural":"hiposulfiții","dative-genitive-indefinite-singular":"hiposulfit","dative-definite-genitive-singular":"hiposulfitului","dative-genitive-indefinite-plural":"hiposulfiți","dative-definite-genitive-plural":"hiposulfiților","singular-vocative":"hiposulfitule","plural-vocative":"hiposulfiților"}},{"word":"hipotactic","pos":"adj","definitions":["hypotactic"],"forms":{"feminine-singular":"hipotactică","masculine-plural":"hipotactici","feminine-neuter-plural":"hipotactice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotactic","error-unrecognized-form-feminine-indefinite-singular":"hipotactică","error-unrecognized-form-indefinite-masculine-plural":"hipotactici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotactice","definite-error-unrecognized-form-masculine-neuter-singular":"hipotacticul","definite-error-unrecognized-form-feminine-singular":"hipotactica","definite-error-unrecognized-form-masculine-plural":"hipotacticii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotacticele"}},{"word":"hipotalamic","pos":"adj","definitions":["hypothalamic"],"forms":{"feminine-singular":"hipotalamică","masculine-plural":"hipotalamici","feminine-neuter-plural":"hipotalamice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotalamic","error-unrecognized-form-feminine-indefinite-singular":"hipotalamică","error-unrecognized-form-indefinite-masculine-plural":"hipotalamici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotalamice","definite-error-unrecognized-form-masculine-neuter-singular":"hipotalamicul","definite-error-unrecognized-form-feminine-singular":"hipotalamica","definite-error-unrecognized-form-masculine-plural":"hipotalamicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotalamicele"}},{"word":"hipotalamus","pos":"noun","definitions":["hypothalamus"],"forms":{"plural":"hipotalamusuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hipotalamus","accusative-definite-nominative-singular":"hipotalamusul","accusative-indefinite-nominative-plural":"hipotalamusuri","accusative-definite-nominative-plural":"hipotalamusurile","dative-genitive-indefinite-singular":"hipotalamus","dative-definite-genitive-singular":"hipotalamusului","dative-genitive-indefinite-plural":"hipotalamusuri","dative-definite-genitive-plural":"hipotalamusurilor","singular-vocative":"hipotalamusule","plural-vocative":"hipotalamusurilor"}},{"word":"hipotaxă","pos":"noun","definitions":["hypotaxis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipotaxă","accusative-definite-nominative-singular":"hipotaxa","accusative-indefinite-nominative-plural":"hipotaxe","accusative-definite-nominative-plural":"hipotaxele","dative-genitive-indefinite-singular":"hipotaxe","dative-definite-genitive-singular":"hipotaxei","dative-genitive-indefinite-plural":"hipotaxe","dative-definite-genitive-plural":"hipotaxelor","singular-vocative":"hipotaxă","plural-vocative":"hipotaxelor"}},{"word":"hipotecă","pos":"noun","definitions":["obsolete form of ipotecă"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hipotecă","accusative-definite-nominative":"hipoteca","dative-genitive-indefinite":"hipotece","dative-definite-genitive":"hipotecei","vocative":"hipotecă"}},{"word":"hipotecare","pos":"noun","definitions":["obsolete form of ipotecare"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative":"hipotecare","accusative-definite-nominative":"hipotecarea","dative-genitive-indefinite":"hipotecări","dative-definite-genitive":"hipotecării","vocative":"hipotecare"}},{"word":"hipotenar","pos":"noun","definitions":["hypothenar"],"forms":{"plural":"hipotenare","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipotenar","accusative-definite-nominative-singular":"hipotenarul","accusative-indefinite-nominative-plural":"hipotenare","accusative-definite-nominative-plural":"hipotenarele","dative-genitive-indefinite-singular":"hipotenar","dative-definite-genitive-singular":"hipotenarului","dative-genitive-indefinite-plural":"hipotenare","dative-definite-genitive-plural":"hipotenarelor","singular-vocative":"hipotenarule","plural-vocative":"hipotenarelor"}},{"word":"hipotensiune","pos":"noun","definitions":["hypotension"],"forms":{"plural":"hipotensiuni","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e-e","accusative-indefinite-nominative-singular":"hipotensiune","accusative-definite-nominative-singular":"hipotensiunea","accusative-indefinite-nominative-plural":"hipotensiune","accusative-definite-nominative-plural":"hipotensiunele","dative-genitive-indefinite-singular":"hipotensiune","dative-definite-genitive-singular":"hipotensiunei","dative-genitive-indefinite-plural":"hipotensiune","dative-definite-genitive-plural":"hipotensiunelor","singular-vocative":"hipotensiune","plural-vocative":"hipotensiunelor"}},{"word":"hipotensiv","pos":"noun","definitions":["hypotensive"],"forms":{"plural":"hipotensivi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipotensiv","accusative-definite-nominative-singular":"hipotensivul","accusative-indefinite-nominative-plural":"hipotensivi","accusative-definite-nominative-plural":"hipotensivii","dative-genitive-indefinite-singular":"hipotensiv","dative-definite-genitive-singular":"hipotensivului","dative-genitive-indefinite-plural":"hipotensivi","dative-definite-genitive-plural":"hipotensivilor","singular-vocative":"hipotensivule","plural-vocative":"hipotensivilor"}},{"word":"hipotensivă","pos":"noun","definitions":["female equivalent of hipotensiv"],"forms":{"plural":"hipotensive","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipotensivă","accusative-definite-nominative-singular":"hipotensiva","accusative-indefinite-nominative-plural":"hipotensive","accusative-definite-nominative-plural":"hipotensivele","dative-genitive-indefinite-singular":"hipotensive","dative-definite-genitive-singular":"hipotensivei","dative-genitive-indefinite-plural":"hipotensive","dative-definite-genitive-plural":"hipotensivelor","singular-vocative":"hipotensivă","plural-vocative":"hipotensivelor"}},{"word":"hipotenuză","pos":"noun","definitions":["obsolete form of ipotenuză"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hipotenuză","accusative-definite-nominative":"hipotenuza","dative-genitive-indefinite":"hipotenuze","dative-definite-genitive":"hipotenuzei","vocative":"hipotenuză"}},{"word":"hipotermal","pos":"adj","definitions":["hypothermal"],"forms":{"feminine-singular":"hipotermală","masculine-plural":"hipotermali","feminine-neuter-plural":"hipotermale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotermal","error-unrecognized-form-feminine-indefinite-singular":"hipotermală","error-unrecognized-form-indefinite-masculine-plural":"hipotermali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotermale","definite-error-unrecognized-form-masculine-neuter-singular":"hipotermalul","definite-error-unrecognized-form-feminine-singular":"hipotermala","definite-error-unrecognized-form-masculine-plural":"hipotermalii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotermalele"}},{"word":"hipotermic","pos":"adj","definitions":["hypothermic"],"forms":{"feminine-singular":"hipotermică","masculine-plural":"hipotermici","feminine-neuter-plural":"hipotermice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotermic","error-unrecognized-form-feminine-indefinite-singular":"hipotermică","error-unrecognized-form-indefinite-masculine-plural":"hipotermici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotermice","definite-error-unrecognized-form-masculine-neuter-singular":"hipotermicul","definite-error-unrecognized-form-feminine-singular":"hipotermica","definite-error-unrecognized-form-masculine-plural":"hipotermicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotermicele"}},{"word":"hipotermie","pos":"noun","definitions":["hypothermia"],"forms":{"plural":"hipotermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipotermie","accusative-definite-nominative-singular":"hipotermia","accusative-indefinite-nominative-plural":"hipotermii","accusative-definite-nominative-plural":"hipotermiile","dative-genitive-indefinite-singular":"hipotermii","dative-definite-genitive-singular":"hipotermiei","dative-genitive-indefinite-plural":"hipotermii","dative-definite-genitive-plural":"hipotermiilor","singular-vocative":"hipotermie","plural-vocative":"hipotermiilor"}},{"word":"hipotetic","pos":"adj","definitions":["obsolete form of ipotetic"],"forms":{"feminine-singular":"hipotetică","masculine-plural":"hipotetici","feminine-neuter-plural":"hipotetice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotetic","error-unrecognized-form-feminine-indefinite-singular":"hipotetică","error-unrecognized-form-indefinite-masculine-plural":"hipotetici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotetice","definite-error-unrecognized-form-masculine-neuter-singular":"hipoteticul","definite-error-unrecognized-form-feminine-singular":"hipotetica","definite-error-unrecognized-form-masculine-plural":"hipoteticii","definite-error-unrecognized-form-feminine-neuter-plural":"hipoteticele"}},{"word":"hipoteză","pos":"noun","definitions":["obsolete form of ipoteză"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"hipoteză","accusative-definite-nominative":"hipoteza","dative-genitive-indefinite":"hipoteze","dative-definite-genitive":"hipotezei","vocative":"hipoteză"}},{"word":"hipotipoză","pos":"noun","definitions":["hypotyposis"],"forms":{"plural":"hipotipoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipotipoză","accusative-definite-nominative-singular":"hipotipoza","accusative-indefinite-nominative-plural":"hipotipoze","accusative-definite-nominative-plural":"hipotipozele","dative-genitive-indefinite-singular":"hipotipoze","dative-definite-genitive-singular":"hipotipozei","dative-genitive-indefinite-plural":"hipotipoze","dative-definite-genitive-plural":"hipotipozelor","singular-vocative":"hipotipoză","plural-vocative":"hipotipozelor"}},{"word":"hipotiroidian","pos":"adj","definitions":["hypothyroid"],"forms":{"feminine-singular":"hipotiroidiană","masculine-plural":"hipotiroidieni","feminine-neuter-plural":"hipotiroidiene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotiroidian","error-unrecognized-form-feminine-indefinite-singular":"hipotiroidiană","error-unrecognized-form-indefinite-masculine-plural":"hipotiroidieni","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotiroidiene","definite-error-unrecognized-form-masculine-neuter-singular":"hipotiroidianul","definite-error-unrecognized-form-feminine-singular":"hipotiroidiana","definite-error-unrecognized-form-masculine-plural":"hipotiroidienii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotiroidienele"}},{"word":"hipotiroidiană","pos":"noun","definitions":["female equivalent of hipotiroidian"],"forms":{"plural":"hipotiroidiene","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipotiroidiană","accusative-definite-nominative-singular":"hipotiroidiana","accusative-indefinite-nominative-plural":"hipotiroidiene","accusative-definite-nominative-plural":"hipotiroidienele","dative-genitive-indefinite-singular":"hipotiroidiene","dative-definite-genitive-singular":"hipotiroidienei","dative-genitive-indefinite-plural":"hipotiroidiene","dative-definite-genitive-plural":"hipotiroidienelor","singular-vocative":"hipotiroidiană","plural-vocative":"hipotiroidienelor"}},{"word":"hipotiroidie","pos":"noun","definitions":["hypothyroidism"],"forms":{"plural":"hipotiroidii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipotiroidie","accusative-definite-nominative-singular":"hipotiroidia","accusative-indefinite-nominative-plural":"hipotiroidii","accusative-definite-nominative-plural":"hipotiroidiile","dative-genitive-indefinite-singular":"hipotiroidii","dative-definite-genitive-singular":"hipotiroidiei","dative-genitive-indefinite-plural":"hipotiroidii","dative-definite-genitive-plural":"hipotiroidiilor","singular-vocative":"hipotiroidie","plural-vocative":"hipotiroidiilor"}},{"word":"hipotiroidism","pos":"noun","definitions":["hypothyroidism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipotiroidism","accusative-definite-nominative-singular":"hipotiroidismul","accusative-indefinite-nominative-plural":"hipotiroidisme","accusative-definite-nominative-plural":"hipotiroidismele","dative-genitive-indefinite-singular":"hipotiroidism","dative-definite-genitive-singular":"hipotiroidismului","dative-genitive-indefinite-plural":"hipotiroidisme","dative-definite-genitive-plural":"hipotiroidismelor","singular-vocative":"hipotiroidismule","plural-vocative":"hipotiroidismelor"}},{"word":"hipotonic","pos":"adj","definitions":["hypotonic"],"forms":{"feminine-singular":"hipotonică","masculine-plural":"hipotonici","feminine-neuter-plural":"hipotonice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipotonic","error-unrecognized-form-feminine-indefinite-singular":"hipotonică","error-unrecognized-form-indefinite-masculine-plural":"hipotonici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipotonice","definite-error-unrecognized-form-masculine-neuter-singular":"hipotonicul","definite-error-unrecognized-form-feminine-singular":"hipotonica","definite-error-unrecognized-form-masculine-plural":"hipotonicii","definite-error-unrecognized-form-feminine-neuter-plural":"hipotonicele"}},{"word":"hipotonicitate","pos":"noun","definitions":["hypotonicity"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f","accusative-indefinite-nominative":"hipotonicitate","accusative-definite-nominative":"hipotonicitatea","dative-genitive-indefinite":"hipotonicități","dative-definite-genitive":"hipotonicității","vocative":"-"}},{"word":"hipotonie","pos":"noun","definitions":["hypotonia"],"forms":{"plural":"hipotonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipotonie","accusative-definite-nominative-singular":"hipotonia","accusative-indefinite-nominative-plural":"hipotonii","accusative-definite-nominative-plural":"hipotoniile","dative-genitive-indefinite-singular":"hipotonii","dative-definite-genitive-singular":"hipotoniei","dative-genitive-indefinite-plural":"hipotonii","dative-definite-genitive-plural":"hipotoniilor","singular-vocative":"hipotonie","plural-vocative":"hipotoniilor"}},{"word":"hipotricoză","pos":"noun","definitions":["hypotrichosis"],"forms":{"plural":"hipotricoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipotricoză","accusative-definite-nominative-singular":"hipotricoza","accusative-indefinite-nominative-plural":"hipotricoze","accusative-definite-nominative-plural":"hipotricozele","dative-genitive-indefinite-singular":"hipotricoze","dative-definite-genitive-singular":"hipotricozei","dative-genitive-indefinite-plural":"hipotricoze","dative-definite-genitive-plural":"hipotricozelor","singular-vocative":"hipotricoză","plural-vocative":"hipotricozelor"}},{"word":"hipotrofie","pos":"noun","definitions":["hypotrophy"],"forms":{"plural":"hipotrofii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipotrofie","accusative-definite-nominative-singular":"hipotrofia","accusative-indefinite-nominative-plural":"hipotrofii","accusative-definite-nominative-plural":"hipotrofiile","dative-genitive-indefinite-singular":"hipotrofii","dative-definite-genitive-singular":"hipotrofiei","dative-genitive-indefinite-plural":"hipotrofii","dative-definite-genitive-plural":"hipotrofiilor","singular-vocative":"hipotrofie","plural-vocative":"hipotrofiilor"}},{"word":"hipovitaminoză","pos":"noun","definitions":["hypovitaminosis"],"forms":{"plural":"hipovitaminoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipovitaminoză","accusative-definite-nominative-singular":"hipovitaminoza","accusative-indefinite-nominative-plural":"hipovitaminoze","accusative-definite-nominative-plural":"hipovitaminozele","dative-genitive-indefinite-singular":"hipovitaminoze","dative-definite-genitive-singular":"hipovitaminozei","dative-genitive-indefinite-plural":"hipovitaminoze","dative-definite-genitive-plural":"hipovitaminozelor","singular-vocative":"hipovitaminoză","plural-vocative":"hipovitaminozelor"}},{"word":"hipoxemie","pos":"noun","definitions":["hypoxemia"],"forms":{"plural":"hipoxemii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoxemie","accusative-definite-nominative-singular":"hipoxemia","accusative-indefinite-nominative-plural":"hipoxemii","accusative-definite-nominative-plural":"hipoxemiile","dative-genitive-indefinite-singular":"hipoxemii","dative-definite-genitive-singular":"hipoxemiei","dative-genitive-indefinite-plural":"hipoxemii","dative-definite-genitive-plural":"hipoxemiilor","singular-vocative":"hipoxemie","plural-vocative":"hipoxemiilor"}},{"word":"hipoxie","pos":"noun","definitions":["hypoxia"],"forms":{"plural":"hipoxii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipoxie","accusative-definite-nominative-singular":"hipoxia","accusative-indefinite-nominative-plural":"hipoxii","accusative-definite-nominative-plural":"hipoxiile","dative-genitive-indefinite-singular":"hipoxii","dative-definite-genitive-singular":"hipoxiei","dative-genitive-indefinite-plural":"hipoxii","dative-definite-genitive-plural":"hipoxiilor","singular-vocative":"hipoxie","plural-vocative":"hipoxiilor"}},{"word":"hippy","pos":"adj","definitions":["hippy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hippy","error-unrecognized-form-feminine-indefinite-singular":"hippy","error-unrecognized-form-indefinite-masculine-plural":"hippy","error-unrecognized-form-feminine-indefinite-neuter-plural":"hippy","definite-error-unrecognized-form-masculine-neuter-singular":"-","definite-error-unrecognized-form-feminine-singular":"-","definite-error-unrecognized-form-masculine-plural":"-","definite-error-unrecognized-form-feminine-neuter-plural":"-"}},{"word":"hippy","pos":"noun","definitions":["hippy"],"forms":{"plural":"hippy","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hippy","accusative-definite-nominative-singular":"hippyul","accusative-indefinite-nominative-plural":"hippy","accusative-definite-nominative-plural":"hippyi","dative-genitive-indefinite-singular":"hippy","dative-definite-genitive-singular":"hippyului","dative-genitive-indefinite-plural":"hippy","dative-definite-genitive-plural":"hippylor","singular-vocative":"hippyule","plural-vocative":"hippylor"}},{"word":"hipsocrom","pos":"adj","definitions":["hypsochromic"],"forms":{"feminine-singular":"hipsocromă","masculine-plural":"hipsocromi","feminine-neuter-plural":"hipsocrome","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipsocrom","error-unrecognized-form-feminine-indefinite-singular":"hipsocromă","error-unrecognized-form-indefinite-masculine-plural":"hipsocromi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipsocrome","definite-error-unrecognized-form-masculine-neuter-singular":"hipsocromul","definite-error-unrecognized-form-feminine-singular":"hipsocroma","definite-error-unrecognized-form-masculine-plural":"hipsocromii","definite-error-unrecognized-form-feminine-neuter-plural":"hipsocromele"}},{"word":"hipsocromie","pos":"noun","definitions":["hypsochromia"],"forms":{"plural":"hipsocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipsocromie","accusative-definite-nominative-singular":"hipsocromia","accusative-indefinite-nominative-plural":"hipsocromii","accusative-definite-nominative-plural":"hipsocromiile","dative-genitive-indefinite-singular":"hipsocromii","dative-definite-genitive-singular":"hipsocromiei","dative-genitive-indefinite-plural":"hipsocromii","dative-definite-genitive-plural":"hipsocromiilor","singular-vocative":"hipsocromie","plural-vocative":"hipsocromiilor"}},{"word":"hipsograf","pos":"noun","definitions":["hypsograph"],"forms":{"plural":"hipsografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipsograf","accusative-definite-nominative-singular":"hipsograful","accusative-indefinite-nominative-plural":"hipsografe","accusative-definite-nominative-plural":"hipsografele","dative-genitive-indefinite-singular":"hipsograf","dative-definite-genitive-singular":"hipsografului","dative-genitive-indefinite-plural":"hipsografe","dative-definite-genitive-plural":"hipsografelor","singular-vocative":"hipsografule","plural-vocative":"hipsografelor"}},{"word":"hipsografic","pos":"adj","definitions":["hypsographic"],"forms":{"feminine-singular":"hipsografică","masculine-plural":"hipsografici","feminine-neuter-plural":"hipsografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipsografic","error-unrecognized-form-feminine-indefinite-singular":"hipsografică","error-unrecognized-form-indefinite-masculine-plural":"hipsografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipsografice","definite-error-unrecognized-form-masculine-neuter-singular":"hipsograficul","definite-error-unrecognized-form-feminine-singular":"hipsografica","definite-error-unrecognized-form-masculine-plural":"hipsograficii","definite-error-unrecognized-form-feminine-neuter-plural":"hipsograficele"}},{"word":"hipsografie","pos":"noun","definitions":["hypsography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipsografie","accusative-definite-nominative":"hipsografia","dative-genitive-indefinite":"hipsografii","dative-definite-genitive":"hipsografiei","vocative":"hipsografie"}},{"word":"hipsogramă","pos":"noun","definitions":["hypsogram"],"forms":{"plural":"hipsograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hipsogramă","accusative-definite-nominative-singular":"hipsograma","accusative-indefinite-nominative-plural":"hipsograme","accusative-definite-nominative-plural":"hipsogramele","dative-genitive-indefinite-singular":"hipsograme","dative-definite-genitive-singular":"hipsogramei","dative-genitive-indefinite-plural":"hipsograme","dative-definite-genitive-plural":"hipsogramelor","singular-vocative":"hipsogramă","plural-vocative":"hipsogramelor"}},{"word":"hipsometric","pos":"adj","definitions":["hypsometric"],"forms":{"feminine-singular":"hipsometrică","masculine-plural":"hipsometrici","feminine-neuter-plural":"hipsometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipsometric","error-unrecognized-form-feminine-indefinite-singular":"hipsometrică","error-unrecognized-form-indefinite-masculine-plural":"hipsometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipsometrice","definite-error-unrecognized-form-masculine-neuter-singular":"hipsometricul","definite-error-unrecognized-form-feminine-singular":"hipsometrica","definite-error-unrecognized-form-masculine-plural":"hipsometricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipsometricele"}},{"word":"hipsometrie","pos":"noun","definitions":["hypsometry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hipsometrie","accusative-definite-nominative":"hipsometria","dative-genitive-indefinite":"hipsometrii","dative-definite-genitive":"hipsometriei","vocative":"hipsometrie"}},{"word":"hipsometru","pos":"noun","definitions":["hypsometer"],"forms":{"plural":"hipsometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hipsometru","accusative-definite-nominative-singular":"hipsometrul","accusative-indefinite-nominative-plural":"hipsometre","accusative-definite-nominative-plural":"hipsometrele","dative-genitive-indefinite-singular":"hipsometru","dative-definite-genitive-singular":"hipsometrului","dative-genitive-indefinite-plural":"hipsometre","dative-definite-genitive-plural":"hipsometrelor","singular-vocative":"hipsometrule","plural-vocative":"hipsometrelor"}},{"word":"hipuric","pos":"adj","definitions":["hippuric"],"forms":{"feminine-singular":"hipurică","masculine-plural":"hipurici","feminine-neuter-plural":"hipurice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hipuric","error-unrecognized-form-feminine-indefinite-singular":"hipurică","error-unrecognized-form-indefinite-masculine-plural":"hipurici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hipurice","definite-error-unrecognized-form-masculine-neuter-singular":"hipuricul","definite-error-unrecognized-form-feminine-singular":"hipurica","definite-error-unrecognized-form-masculine-plural":"hipuricii","definite-error-unrecognized-form-feminine-neuter-plural":"hipuricele"}},{"word":"hipurie","pos":"noun","definitions":["hippuria"],"forms":{"plural":"hipurii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hipurie","accusative-definite-nominative-singular":"hipuria","accusative-indefinite-nominative-plural":"hipurii","accusative-definite-nominative-plural":"hipuriile","dative-genitive-indefinite-singular":"hipurii","dative-definite-genitive-singular":"hipuriei","dative-genitive-indefinite-plural":"hipurii","dative-definite-genitive-plural":"hipuriilor","singular-vocative":"hipurie","plural-vocative":"hipuriilor"}},{"word":"hipurit","pos":"noun","definitions":["hippurite"],"forms":{"plural":"hipuriți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hipurit","accusative-definite-nominative-singular":"hipuritul","accusative-indefinite-nominative-plural":"hipuriți","accusative-definite-nominative-plural":"hipuriții","dative-genitive-indefinite-singular":"hipurit","dative-definite-genitive-singular":"hipuritului","dative-genitive-indefinite-plural":"hipuriți","dative-definite-genitive-plural":"hipuriților","singular-vocative":"hipuritule","plural-vocative":"hipuriților"}},{"word":"Hîrb","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrb"}},{"word":"Hîrbovăț","pos":"name","definitions":["a village in Hîrbovăț, Anenii Noi Raion, Moldova","a village in Onișcani, Călărași Raion, Moldova","a commune of Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"Hîrbovățul Nou","pos":"name","definitions":["a village in Anenii Noi, Anenii Noi Raion, Moldova"],"gender":"m"},{"word":"Hîrbu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrbu"}},{"word":"Hîrcă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrcă"}},{"word":"Hîrceanu","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrceanu"}},{"word":"Hîrcești","pos":"name","definitions":["a village in Hîrcești, Ungheni Raion, Moldova","a commune of Ungheni Raion, Moldova"],"gender":"m"},{"word":"Hîrciog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrciog"}},{"word":"Hîrdău","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrdău"}},{"word":"hiriglă","pos":"noun","definitions":["alternative form of șireglă"],"forms":{"plural":"hirigle","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiriglă","accusative-definite-nominative-singular":"hirigla","accusative-indefinite-nominative-plural":"hirigle","accusative-definite-nominative-plural":"hiriglele","dative-genitive-indefinite-singular":"hirigle","dative-definite-genitive-singular":"hiriglei","dative-genitive-indefinite-plural":"hirigle","dative-definite-genitive-plural":"hiriglelor","singular-vocative":"hiriglă","plural-vocative":"hiriglelor"}},{"word":"Hirișeni","pos":"name","definitions":["a village in Hirișeni, Telenești Raion, Moldova","a commune of Telenești Raion, Moldova"],"gender":"m"},{"word":"Hirișești","pos":"name","definitions":["a village in Novaci, Gorj County, Romania"],"gender":"m"},{"word":"hiritiseală","pos":"noun","definitions":["alternative form of firitiseală"],"forms":{"plural":"hiritiseli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hiritiseală","accusative-definite-nominative-singular":"hiritiseala","accusative-indefinite-nominative-plural":"hiritisele","accusative-definite-nominative-plural":"hiritiselele","dative-genitive-indefinite-singular":"hiritisele","dative-definite-genitive-singular":"hiritiselei","dative-genitive-indefinite-plural":"hiritisele","dative-definite-genitive-plural":"hiritiselelor","singular-vocative":"hiritiseală","plural-vocative":"hiritiselelor"}},{"word":"hiritisi","pos":"verb","definitions":["alternative form of firitisi"],"forms":{"canonical":"a hiritisi 4th conjugation","present-singular-third-person":"hiritisește","participle-past":"hiritisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hiritisi","gerund":"hiritisind","first-person-indicative-present-singular":"hiritisesc","indicative-present-second-person-singular":"hiritisești","indicative-present-singular-third-person":"hiritisește","first-person-indicative-plural-present":"hiritisim","indicative-plural-present-second-person":"hiritisiți","indicative-plural-present-third-person":"hiritisesc","first-person-imperfect-indicative-singular":"hiritiseam","imperfect-indicative-second-person-singular":"hiritiseai","imperfect-indicative-singular-third-person":"hiritisea","first-person-imperfect-indicative-plural":"hiritiseam","imperfect-indicative-plural-second-person":"hiritiseați","imperfect-indicative-plural-third-person":"hiritiseau","first-person-indicative-perfect-singular":"hiritisii","indicative-perfect-second-person-singular":"hiritisiși","indicative-perfect-singular-third-person":"hiritisi","first-person-indicative-perfect-plural":"hiritisirăm","indicative-perfect-plural-second-person":"hiritisirăți","indicative-perfect-plural-third-person":"hiritisiră","first-person-indicative-pluperfect-singular":"hiritisisem","indicative-pluperfect-second-person-singular":"hiritisiseși","indicative-pluperfect-singular-third-person":"hiritisise","first-person-indicative-pluperfect-plural":"hiritisiserăm","indicative-pluperfect-plural-second-person":"hiritisiserăți","indicative-pluperfect-plural-third-person":"hiritisiseră","first-person-present-singular-subjunctive":"să hiritisesc","present-second-person-singular-subjunctive":"să hiritisești","present-singular-subjunctive-third-person":"să hiritisească","first-person-plural-present-subjunctive":"să hiritisim","plural-present-second-person-subjunctive":"să hiritisiți","plural-present-subjunctive-third-person":"să hiritisească","imperative-second-person-singular":"hiritisește","imperative-plural-second-person":"hiritisiți","imperative-negative-second-person-singular":"nu hiritisi","imperative-negative-plural-second-person":"nu hiritisiți"}},{"word":"hiritisire","pos":"noun","definitions":["alternative form of firitisire"],"forms":{"plural":"hiritisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hiritisire","accusative-definite-nominative-singular":"hiritisirea","accusative-indefinite-nominative-plural":"hiritisiri","accusative-definite-nominative-plural":"hiritisirile","dative-genitive-indefinite-singular":"hiritisiri","dative-definite-genitive-singular":"hiritisirii","dative-genitive-indefinite-plural":"hiritisiri","dative-definite-genitive-plural":"hiritisirilor","singular-vocative":"hiritisire","plural-vocative":"hiritisirilor"}},{"word":"Hîrjan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hîrjan"}},{"word":"Hîrleșteanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hîrleșteanu"}},{"word":"hirotoni","pos":"verb","definitions":["to ordain"],"forms":{"canonical":"a hirotoni 4th conjugation","present-singular-third-person":"hirotonește","participle-past":"hirotonit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hirotoni","gerund":"hirotonind","first-person-indicative-present-singular":"hirotonesc","indicative-present-second-person-singular":"hirotonești","indicative-present-singular-third-person":"hirotonește","first-person-indicative-plural-present":"hirotonim","indicative-plural-present-second-person":"hirotoniți","indicative-plural-present-third-person":"hirotonesc","first-person-imperfect-indicative-singular":"hirotoneam","imperfect-indicative-second-person-singular":"hirotoneai","imperfect-indicative-singular-third-person":"hirotonea","first-person-imperfect-indicative-plural":"hirotoneam","imperfect-indicative-plural-second-person":"hirotoneați","imperfect-indicative-plural-third-person":"hirotoneau","first-person-indicative-perfect-singular":"hirotonii","indicative-perfect-second-person-singular":"hirotoniși","indicative-perfect-singular-third-person":"hirotoni","first-person-indicative-perfect-plural":"hirotonirăm","indicative-perfect-plural-second-person":"hirotonirăți","indicative-perfect-plural-third-person":"hirotoniră","first-person-indicative-pluperfect-singular":"hirotonisem","indicative-pluperfect-second-person-singular":"hirotoniseși","indicative-pluperfect-singular-third-person":"hirotonise","first-person-indicative-pluperfect-plural":"hirotoniserăm","indicative-pluperfect-plural-second-person":"hirotoniserăți","indicative-pluperfect-plural-third-person":"hirotoniseră","first-person-present-singular-subjunctive":"să hirotonesc","present-second-person-singular-subjunctive":"să hirotonești","present-singular-subjunctive-third-person":"să hirotonească","first-person-plural-present-subjunctive":"să hirotonim","plural-present-second-person-subjunctive":"să hirotoniți","plural-present-subjunctive-third-person":"să hirotonească","imperative-second-person-singular":"hirotonește","imperative-plural-second-person":"hirotoniți","imperative-negative-second-person-singular":"nu hirotoni","imperative-negative-plural-second-person":"nu hirotoniți"}},{"word":"hirotonie","pos":"noun","definitions":["ordination"],"forms":{"plural":"hirotonii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hirotonie","accusative-definite-nominative-singular":"hirotonia","accusative-indefinite-nominative-plural":"hirotonii","accusative-definite-nominative-plural":"hirotoniile","dative-genitive-indefinite-singular":"hirotonii","dative-definite-genitive-singular":"hirotoniei","dative-genitive-indefinite-plural":"hirotonii","dative-definite-genitive-plural":"hirotoniilor","singular-vocative":"hirotonie","plural-vocative":"hirotoniilor"}},{"word":"hirotonire","pos":"noun","definitions":["ordaining"],"forms":{"plural":"hirotoniri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hirotonire","accusative-definite-nominative-singular":"hirotonirea","accusative-indefinite-nominative-plural":"hirotoniri","accusative-definite-nominative-plural":"hirotonirile","dative-genitive-indefinite-singular":"hirotoniri","dative-definite-genitive-singular":"hirotonirii","dative-genitive-indefinite-plural":"hirotoniri","dative-definite-genitive-plural":"hirotonirilor","singular-vocative":"hirotonire","plural-vocative":"hirotonirilor"}},{"word":"hirotonisi","pos":"verb","definitions":["to ordain"],"forms":{"canonical":"a hirotonisi 4th conjugation","present-singular-third-person":"hirotonisește","participle-past":"hirotonisit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hirotonisi","gerund":"hirotonisind","first-person-indicative-present-singular":"hirotonisesc","indicative-present-second-person-singular":"hirotonisești","indicative-present-singular-third-person":"hirotonisește","first-person-indicative-plural-present":"hirotonisim","indicative-plural-present-second-person":"hirotonisiți","indicative-plural-present-third-person":"hirotonisesc","first-person-imperfect-indicative-singular":"hirotoniseam","imperfect-indicative-second-person-singular":"hirotoniseai","imperfect-indicative-singular-third-person":"hirotonisea","first-person-imperfect-indicative-plural":"hirotoniseam","imperfect-indicative-plural-second-person":"hirotoniseați","imperfect-indicative-plural-third-person":"hirotoniseau","first-person-indicative-perfect-singular":"hirotonisii","indicative-perfect-second-person-singular":"hirotonisiși","indicative-perfect-singular-third-person":"hirotonisi","first-person-indicative-perfect-plural":"hirotonisirăm","indicative-perfect-plural-second-person":"hirotonisirăți","indicative-perfect-plural-third-person":"hirotonisiră","first-person-indicative-pluperfect-singular":"hirotonisisem","indicative-pluperfect-second-person-singular":"hirotonisiseși","indicative-pluperfect-singular-third-person":"hirotonisise","first-person-indicative-pluperfect-plural":"hirotonisiserăm","indicative-pluperfect-plural-second-person":"hirotonisiserăți","indicative-pluperfect-plural-third-person":"hirotonisiseră","first-person-present-singular-subjunctive":"să hirotonisesc","present-second-person-singular-subjunctive":"să hirotonisești","present-singular-subjunctive-third-person":"să hirotonisească","first-person-plural-present-subjunctive":"să hirotonisim","plural-present-second-person-subjunctive":"să hirotonisiți","plural-present-subjunctive-third-person":"să hirotonisească","imperative-second-person-singular":"hirotonisește","imperative-plural-second-person":"hirotonisiți","imperative-negative-second-person-singular":"nu hirotonisi","imperative-negative-plural-second-person":"nu hirotonisiți"}},{"word":"hirotonisire","pos":"noun","definitions":["ordination"],"forms":{"plural":"hirotonisiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hirotonisire","accusative-definite-nominative-singular":"hirotonisirea","accusative-indefinite-nominative-plural":"hirotonisiri","accusative-definite-nominative-plural":"hirotonisirile","dative-genitive-indefinite-singular":"hirotonisiri","dative-definite-genitive-singular":"hirotonisirii","dative-genitive-indefinite-plural":"hirotonisiri","dative-definite-genitive-plural":"hirotonisirilor","singular-vocative":"hirotonisire","plural-vocative":"hirotonisirilor"}},{"word":"hirotonisit","pos":"adj","definitions":["ordained"],"forms":{"feminine-singular":"hirotonisită","masculine-plural":"hirotonisiți","feminine-neuter-plural":"hirotonisite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hirotonisit","error-unrecognized-form-feminine-indefinite-singular":"hirotonisită","error-unrecognized-form-indefinite-masculine-plural":"hirotonisiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hirotonisite","definite-error-unrecognized-form-masculine-neuter-singular":"hirotonisitul","definite-error-unrecognized-form-feminine-singular":"hirotonisita","definite-error-unrecognized-form-masculine-plural":"hirotonisiții","definite-error-unrecognized-form-feminine-neuter-plural":"hirotonisitele"}},{"word":"hirotonit","pos":"adj","definitions":["ordained"],"forms":{"feminine-singular":"hirotonită","masculine-plural":"hirotoniți","feminine-neuter-plural":"hirotonite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hirotonit","error-unrecognized-form-feminine-indefinite-singular":"hirotonită","error-unrecognized-form-indefinite-masculine-plural":"hirotoniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hirotonite","definite-error-unrecognized-form-masculine-neuter-singular":"hirotonitul","definite-error-unrecognized-form-feminine-singular":"hirotonita","definite-error-unrecognized-form-masculine-plural":"hirotoniții","definite-error-unrecognized-form-feminine-neuter-plural":"hirotonitele"}},{"word":"hirotonosi","pos":"verb","definitions":["to alternative form of hirotonisi"],"forms":{"canonical":"a hirotonosi 4th conjugation","present-singular-third-person":"hirotonosește","participle-past":"hirotonosit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hirotonosi","gerund":"hirotonosind","first-person-indicative-present-singular":"hirotonosesc","indicative-present-second-person-singular":"hirotonosești","indicative-present-singular-third-person":"hirotonosește","first-person-indicative-plural-present":"hirotonosim","indicative-plural-present-second-person":"hirotonosiți","indicative-plural-present-third-person":"hirotonosesc","first-person-imperfect-indicative-singular":"hirotonoseam","imperfect-indicative-second-person-singular":"hirotonoseai","imperfect-indicative-singular-third-person":"hirotonosea","first-person-imperfect-indicative-plural":"hirotonoseam","imperfect-indicative-plural-second-person":"hirotonoseați","imperfect-indicative-plural-third-person":"hirotonoseau","first-person-indicative-perfect-singular":"hirotonosii","indicative-perfect-second-person-singular":"hirotonosiși","indicative-perfect-singular-third-person":"hirotonosi","first-person-indicative-perfect-plural":"hirotonosirăm","indicative-perfect-plural-second-person":"hirotonosirăți","indicative-perfect-plural-third-person":"hirotonosiră","first-person-indicative-pluperfect-singular":"hirotonosisem","indicative-pluperfect-second-person-singular":"hirotonosiseși","indicative-pluperfect-singular-third-person":"hirotonosise","first-person-indicative-pluperfect-plural":"hirotonosiserăm","indicative-pluperfect-plural-second-person":"hirotonosiserăți","indicative-pluperfect-plural-third-person":"hirotonosiseră","first-person-present-singular-subjunctive":"să hirotonosesc","present-second-person-singular-subjunctive":"să hirotonosești","present-singular-subjunctive-third-person":"să hirotonosească","first-person-plural-present-subjunctive":"să hirotonosim","plural-present-second-person-subjunctive":"să hirotonosiți","plural-present-subjunctive-third-person":"să hirotonosească","imperative-second-person-singular":"hirotonosește","imperative-plural-second-person":"hirotonosiți","imperative-negative-second-person-singular":"nu hirotonosi","imperative-negative-plural-second-person":"nu hirotonosiți"}},{"word":"Hirova","pos":"name","definitions":["a village in Hirova, Călărași Raion, Moldova","a commune of Călărași Raion, Moldova"],"gender":"f"},{"word":"Hîrșoveanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hîrșoveanu"}},{"word":"Hîrșulescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hîrșulescu"}},{"word":"hirsut","pos":"adj","definitions":["hirsute, shaggy"],"forms":{"feminine-singular":"hirsută","masculine-plural":"hirsuți","feminine-neuter-plural":"hirsute","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hirsut","error-unrecognized-form-feminine-indefinite-singular":"hirsută","error-unrecognized-form-indefinite-masculine-plural":"hirsuți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hirsute","definite-error-unrecognized-form-masculine-neuter-singular":"hirsutul","definite-error-unrecognized-form-feminine-singular":"hirsuta","definite-error-unrecognized-form-masculine-plural":"hirsuții","definite-error-unrecognized-form-feminine-neuter-plural":"hirsutele"}},{"word":"hirsutism","pos":"noun","definitions":["hirsutism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hirsutism","accusative-definite-nominative":"hirsutismul","dative-genitive-indefinite":"hirsutism","dative-definite-genitive":"hirsutismului","vocative":"hirsutismule"}},{"word":"hirtă","pos":"noun","definitions":["quarter of a pogon (area unit)"],"forms":{"plural":"hirte","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hirtă","accusative-definite-nominative-singular":"hirta","accusative-indefinite-nominative-plural":"hirte","accusative-definite-nominative-plural":"hirtele","dative-genitive-indefinite-singular":"hirte","dative-definite-genitive-singular":"hirtei","dative-genitive-indefinite-plural":"hirte","dative-definite-genitive-plural":"hirtelor","singular-vocative":"hirtă","plural-vocative":"hirtelor"}},{"word":"Hîrtie","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hîrtie"}},{"word":"Hîrtop","pos":"name","definitions":["a village in Albota de Jos, Taraclia Raion, Moldova","a village in Băiuș, Leova Raion, Moldova","a village in Ghindești, Florești Raion, Moldova","a village in Hîrtop, Cimișlia Raion, Moldova","a village in Pistruieni, Telenești Raion, Moldova"],"gender":"m"},{"word":"Hîrtopul Mare","pos":"name","definitions":["a village in Hîrtopul Mare, Criuleni Raion, Moldova","a commune of Criuleni Raion, Moldova"],"gender":"m"},{"word":"Hîrtopul Mic","pos":"name","definitions":["a village in Hîrtopul Mare, Criuleni Raion, Moldova"],"gender":"m"},{"word":"hirudineu","pos":"noun","definitions":["leech"],"forms":{"plural":"hirudinei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hirudineu","accusative-definite-nominative-singular":"hirudineul","accusative-indefinite-nominative-plural":"hirudinei","accusative-definite-nominative-plural":"hirudineii","dative-genitive-indefinite-singular":"hirudineu","dative-definite-genitive-singular":"hirudineului","dative-genitive-indefinite-plural":"hirudinei","dative-definite-genitive-plural":"hirudineilor","singular-vocative":"hirudineule","plural-vocative":"hirudineilor"}},{"word":"hirudinină","pos":"noun","definitions":["hirudin"],"forms":{"plural":"hirudinine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hirudinină","accusative-definite-nominative-singular":"hirudinina","accusative-indefinite-nominative-plural":"hirudinine","accusative-definite-nominative-plural":"hirudininele","dative-genitive-indefinite-singular":"hirudinine","dative-definite-genitive-singular":"hirudininei","dative-genitive-indefinite-plural":"hirudinine","dative-definite-genitive-plural":"hirudininelor","singular-vocative":"hirudinină","plural-vocative":"hirudininelor"}},{"word":"hirudinizare","pos":"noun","definitions":["hirudinization"],"forms":{"plural":"hirudinizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hirudinizare","accusative-definite-nominative-singular":"hirudinizarea","accusative-indefinite-nominative-plural":"hirudinizări","accusative-definite-nominative-plural":"hirudinizările","dative-genitive-indefinite-singular":"hirudinizări","dative-definite-genitive-singular":"hirudinizării","dative-genitive-indefinite-plural":"hirudinizări","dative-definite-genitive-plural":"hirudinizărilor","singular-vocative":"hirudinizare","plural-vocative":"hirudinizărilor"}},{"word":"hirurg","pos":"noun","definitions":["alternative form of chirurg"],"forms":{"plural":"hirurgi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hirurg","accusative-definite-nominative-singular":"hirurgul","accusative-indefinite-nominative-plural":"hirurgi","accusative-definite-nominative-plural":"hirurgii","dative-genitive-indefinite-singular":"hirurg","dative-definite-genitive-singular":"hirurgului","dative-genitive-indefinite-plural":"hirurgi","dative-definite-genitive-plural":"hirurgilor","singular-vocative":"hirurgule","plural-vocative":"hirurgilor"}},{"word":"hirurgical","pos":"adj","definitions":["alternative form of chirurgical"],"forms":{"feminine-singular":"hirurgicală","masculine-plural":"hirurgicali","feminine-neuter-plural":"hirurgicale","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hirurgical","error-unrecognized-form-feminine-indefinite-singular":"hirurgicală","error-unrecognized-form-indefinite-masculine-plural":"hirurgicali","error-unrecognized-form-feminine-indefinite-neuter-plural":"hirurgicale","definite-error-unrecognized-form-masculine-neuter-singular":"hirurgicalul","definite-error-unrecognized-form-feminine-singular":"hirurgicala","definite-error-unrecognized-form-masculine-plural":"hirurgicalii","definite-error-unrecognized-form-feminine-neuter-plural":"hirurgicalele"}},{"word":"hirurgie","pos":"noun","definitions":["alternative form of chirurgie"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hirurgie","accusative-definite-nominative":"hirurgia","dative-genitive-indefinite":"hirurgii","dative-definite-genitive":"hirurgiei","vocative":"hirurgie"}},{"word":"Hisiaș","pos":"name","definitions":["a village in Ghizela, Timiș County, Romania"],"gender":"f"},{"word":"hisopirel","pos":"noun","definitions":["diminutive of hisopir"],"forms":{"plural":"hisopirei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hisopirel","accusative-definite-nominative-singular":"hisopirelul","accusative-indefinite-nominative-plural":"hisopirei","accusative-definite-nominative-plural":"hisopireii","dative-genitive-indefinite-singular":"hisopirel","dative-definite-genitive-singular":"hisopirelului","dative-genitive-indefinite-plural":"hisopirei","dative-definite-genitive-plural":"hisopireilor","singular-vocative":"hisopirelule","plural-vocative":"hisopireilor"}},{"word":"hispanic","pos":"adj","definitions":["Hispanic"],"pronunciation":"/hisˈpa.nik/","forms":{"feminine-singular":"hispanică","masculine-plural":"hispanici","feminine-neuter-plural":"hispanice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hispanic","error-unrecognized-form-feminine-indefinite-singular":"hispanică","error-unrecognized-form-indefinite-masculine-plural":"hispanici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hispanice","definite-error-unrecognized-form-masculine-neuter-singular":"hispanicul","definite-error-unrecognized-form-feminine-singular":"hispanica","definite-error-unrecognized-form-masculine-plural":"hispanicii","definite-error-unrecognized-form-feminine-neuter-plural":"hispanicele"}},{"word":"hispanism","pos":"noun","definitions":["Hispanism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hispanism","accusative-definite-nominative-singular":"hispanismul","accusative-indefinite-nominative-plural":"hispanisme","accusative-definite-nominative-plural":"hispanismele","dative-genitive-indefinite-singular":"hispanism","dative-definite-genitive-singular":"hispanismului","dative-genitive-indefinite-plural":"hispanisme","dative-definite-genitive-plural":"hispanismelor","singular-vocative":"hispanismule","plural-vocative":"hispanismelor"}},{"word":"hispanist","pos":"noun","definitions":["Hispanist"],"forms":{"plural":"hispaniști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hispanist","accusative-definite-nominative-singular":"hispanistul","accusative-indefinite-nominative-plural":"hispaniști","accusative-definite-nominative-plural":"hispaniștii","dative-genitive-indefinite-singular":"hispanist","dative-definite-genitive-singular":"hispanistului","dative-genitive-indefinite-plural":"hispaniști","dative-definite-genitive-plural":"hispaniștilor","singular-vocative":"hispanistule","plural-vocative":"hispaniștilor"}},{"word":"hispanistă","pos":"noun","definitions":["female equivalent of hispanist"],"forms":{"plural":"hispaniste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hispanistă","accusative-definite-nominative-singular":"hispanista","accusative-indefinite-nominative-plural":"hispaniste","accusative-definite-nominative-plural":"hispanistele","dative-genitive-indefinite-singular":"hispaniste","dative-definite-genitive-singular":"hispanistei","dative-genitive-indefinite-plural":"hispaniste","dative-definite-genitive-plural":"hispanistelor","singular-vocative":"hispanistă","plural-vocative":"hispanistelor"}},{"word":"hispanistică","pos":"noun","definitions":["Hispanic studies, Spanish studies"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative":"hispanistică","accusative-definite-nominative":"hispanistica","dative-genitive-indefinite":"hispanistici","dative-definite-genitive":"hispanisticii","vocative":"hispanistică"}},{"word":"hispanofil","pos":"noun","definitions":["Hispanophile"],"forms":{"plural":"hispanofili","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hispanofil","accusative-definite-nominative-singular":"hispanofilul","accusative-indefinite-nominative-plural":"hispanofili","accusative-definite-nominative-plural":"hispanofilii","dative-genitive-indefinite-singular":"hispanofil","dative-definite-genitive-singular":"hispanofilului","dative-genitive-indefinite-plural":"hispanofili","dative-definite-genitive-plural":"hispanofililor","singular-vocative":"hispanofilule","plural-vocative":"hispanofililor"}},{"word":"hispanofilă","pos":"noun","definitions":["female equivalent of hispanofil"],"forms":{"plural":"hispanofile","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hispanofilă","accusative-definite-nominative-singular":"hispanofila","accusative-indefinite-nominative-plural":"hispanofile","accusative-definite-nominative-plural":"hispanofilele","dative-genitive-indefinite-singular":"hispanofile","dative-definite-genitive-singular":"hispanofilei","dative-genitive-indefinite-plural":"hispanofile","dative-definite-genitive-plural":"hispanofilelor","singular-vocative":"hispanofilă","plural-vocative":"hispanofilelor"}},{"word":"hispid","pos":"adj","definitions":["hispid"],"forms":{"feminine-singular":"hispidă","masculine-plural":"hispizi","feminine-neuter-plural":"hispide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hispid","error-unrecognized-form-feminine-indefinite-singular":"hispidă","error-unrecognized-form-indefinite-masculine-plural":"hispizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"hispide","definite-error-unrecognized-form-masculine-neuter-singular":"hispidul","definite-error-unrecognized-form-feminine-singular":"hispida","definite-error-unrecognized-form-masculine-plural":"hispizii","definite-error-unrecognized-form-feminine-neuter-plural":"hispidele"}},{"word":"histamină","pos":"noun","definitions":["histamine"],"forms":{"plural":"histamine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histamină","accusative-definite-nominative-singular":"histamina","accusative-indefinite-nominative-plural":"histamine","accusative-definite-nominative-plural":"histaminele","dative-genitive-indefinite-singular":"histamine","dative-definite-genitive-singular":"histaminei","dative-genitive-indefinite-plural":"histamine","dative-definite-genitive-plural":"histaminelor","singular-vocative":"histamină","plural-vocative":"histaminelor"}},{"word":"histaminic","pos":"adj","definitions":["histaminic"],"forms":{"feminine-singular":"histaminică","masculine-plural":"histaminici","feminine-neuter-plural":"histaminice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histaminic","error-unrecognized-form-feminine-indefinite-singular":"histaminică","error-unrecognized-form-indefinite-masculine-plural":"histaminici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histaminice","definite-error-unrecognized-form-masculine-neuter-singular":"histaminicul","definite-error-unrecognized-form-feminine-singular":"histaminica","definite-error-unrecognized-form-masculine-plural":"histaminicii","definite-error-unrecognized-form-feminine-neuter-plural":"histaminicele"}},{"word":"histeralgie","pos":"noun","definitions":["hysteralgia"],"forms":{"plural":"histeralgii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histeralgie","accusative-definite-nominative-singular":"histeralgia","accusative-indefinite-nominative-plural":"histeralgii","accusative-definite-nominative-plural":"histeralgiile","dative-genitive-indefinite-singular":"histeralgii","dative-definite-genitive-singular":"histeralgiei","dative-genitive-indefinite-plural":"histeralgii","dative-definite-genitive-plural":"histeralgiilor","singular-vocative":"histeralgie","plural-vocative":"histeralgiilor"}},{"word":"histerectomie","pos":"noun","definitions":["hysterectomy"],"forms":{"plural":"histerectomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histerectomie","accusative-definite-nominative-singular":"histerectomia","accusative-indefinite-nominative-plural":"histerectomii","accusative-definite-nominative-plural":"histerectomiile","dative-genitive-indefinite-singular":"histerectomii","dative-definite-genitive-singular":"histerectomiei","dative-genitive-indefinite-plural":"histerectomii","dative-definite-genitive-plural":"histerectomiilor","singular-vocative":"histerectomie","plural-vocative":"histerectomiilor"}},{"word":"histerezis","pos":"noun","definitions":["hysteresis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"histerezis","accusative-definite-nominative":"histerezisul","dative-genitive-indefinite":"histerezis","dative-definite-genitive":"histerezisului","vocative":"histerezisule"}},{"word":"histeric","pos":"adj","definitions":["obsolete form of isteric"],"forms":{"feminine-singular":"histerică","masculine-plural":"histerici","feminine-neuter-plural":"histerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histeric","error-unrecognized-form-feminine-indefinite-singular":"histerică","error-unrecognized-form-indefinite-masculine-plural":"histerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histerice","definite-error-unrecognized-form-masculine-neuter-singular":"histericul","definite-error-unrecognized-form-feminine-singular":"histerica","definite-error-unrecognized-form-masculine-plural":"histericii","definite-error-unrecognized-form-feminine-neuter-plural":"histericele"}},{"word":"histerie","pos":"noun","definitions":["obsolete form of isterie"],"forms":{"plural":"histerii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histerie","accusative-definite-nominative-singular":"histeria","accusative-indefinite-nominative-plural":"histerii","accusative-definite-nominative-plural":"histeriile","dative-genitive-indefinite-singular":"histerii","dative-definite-genitive-singular":"histeriei","dative-genitive-indefinite-plural":"histerii","dative-definite-genitive-plural":"histeriilor","singular-vocative":"histerie","plural-vocative":"histeriilor"}},{"word":"histerocel","pos":"noun","definitions":["hysterocele"],"forms":{"plural":"histerocele","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"histerocel","accusative-definite-nominative-singular":"histerocelul","accusative-indefinite-nominative-plural":"histerocele","accusative-definite-nominative-plural":"histerocelele","dative-genitive-indefinite-singular":"histerocel","dative-definite-genitive-singular":"histerocelului","dative-genitive-indefinite-plural":"histerocele","dative-definite-genitive-plural":"histerocelelor","singular-vocative":"histerocelule","plural-vocative":"histerocelelor"}},{"word":"histerografie","pos":"noun","definitions":["hysterography"],"forms":{"plural":"histerografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histerografie","accusative-definite-nominative-singular":"histerografia","accusative-indefinite-nominative-plural":"histerografii","accusative-definite-nominative-plural":"histerografiile","dative-genitive-indefinite-singular":"histerografii","dative-definite-genitive-singular":"histerografiei","dative-genitive-indefinite-plural":"histerografii","dative-definite-genitive-plural":"histerografiilor","singular-vocative":"histerografie","plural-vocative":"histerografiilor"}},{"word":"histerologie","pos":"noun","definitions":["hysterology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histerologie","accusative-definite-nominative-singular":"histerologia","accusative-indefinite-nominative-plural":"histerologii","accusative-definite-nominative-plural":"histerologiile","dative-genitive-indefinite-singular":"histerologii","dative-definite-genitive-singular":"histerologiei","dative-genitive-indefinite-plural":"histerologii","dative-definite-genitive-plural":"histerologiilor","singular-vocative":"histerologie","plural-vocative":"histerologiilor"}},{"word":"histerometru","pos":"noun","definitions":["hysterometer"],"forms":{"plural":"histerometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"histerometru","accusative-definite-nominative-singular":"histerometrul","accusative-indefinite-nominative-plural":"histerometre","accusative-definite-nominative-plural":"histerometrele","dative-genitive-indefinite-singular":"histerometru","dative-definite-genitive-singular":"histerometrului","dative-genitive-indefinite-plural":"histerometre","dative-definite-genitive-plural":"histerometrelor","singular-vocative":"histerometrule","plural-vocative":"histerometrelor"}},{"word":"histeropexie","pos":"noun","definitions":["hysteropexy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"histeropexie","accusative-definite-nominative":"histeropexia","dative-genitive-indefinite":"histeropexii","dative-definite-genitive":"histeropexiei","vocative":"histeropexie"}},{"word":"histeroptoză","pos":"noun","definitions":["hysteroptosis"],"forms":{"plural":"histeroptoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histeroptoză","accusative-definite-nominative-singular":"histeroptoza","accusative-indefinite-nominative-plural":"histeroptoze","accusative-definite-nominative-plural":"histeroptozele","dative-genitive-indefinite-singular":"histeroptoze","dative-definite-genitive-singular":"histeroptozei","dative-genitive-indefinite-plural":"histeroptoze","dative-definite-genitive-plural":"histeroptozelor","singular-vocative":"histeroptoză","plural-vocative":"histeroptozelor"}},{"word":"histeroragie","pos":"noun","definitions":["hysterorrhagia"],"forms":{"plural":"histeroragii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histeroragie","accusative-definite-nominative-singular":"histeroragia","accusative-indefinite-nominative-plural":"histeroragii","accusative-definite-nominative-plural":"histeroragiile","dative-genitive-indefinite-singular":"histeroragii","dative-definite-genitive-singular":"histeroragiei","dative-genitive-indefinite-plural":"histeroragii","dative-definite-genitive-plural":"histeroragiilor","singular-vocative":"histeroragie","plural-vocative":"histeroragiilor"}},{"word":"hîsterosalpingografie","pos":"noun","definitions":["hysterosalpingography"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"hîsterosalpingografie","accusative-definite-nominative":"hîsterosalpingografia","dative-genitive-indefinite":"hîsterosalpingografii","dative-definite-genitive":"hîsterosalpingografiei","vocative":"hîsterosalpingografie"}},{"word":"histeroscopie","pos":"noun","definitions":["hysteroscopy"],"forms":{"plural":"histeroscopii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histeroscopie","accusative-definite-nominative-singular":"histeroscopia","accusative-indefinite-nominative-plural":"histeroscopii","accusative-definite-nominative-plural":"histeroscopiile","dative-genitive-indefinite-singular":"histeroscopii","dative-definite-genitive-singular":"histeroscopiei","dative-genitive-indefinite-plural":"histeroscopii","dative-definite-genitive-plural":"histeroscopiilor","singular-vocative":"histeroscopie","plural-vocative":"histeroscopiilor"}},{"word":"histerotomie","pos":"noun","definitions":["hysterotomy"],"forms":{"plural":"histerotomii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histerotomie","accusative-definite-nominative-singular":"histerotomia","accusative-indefinite-nominative-plural":"histerotomii","accusative-definite-nominative-plural":"histerotomiile","dative-genitive-indefinite-singular":"histerotomii","dative-definite-genitive-singular":"histerotomiei","dative-genitive-indefinite-plural":"histerotomii","dative-definite-genitive-plural":"histerotomiilor","singular-vocative":"histerotomie","plural-vocative":"histerotomiilor"}},{"word":"histidină","pos":"noun","definitions":["histidine"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histidină","accusative-definite-nominative-singular":"histidina","accusative-indefinite-nominative-plural":"histidine","accusative-definite-nominative-plural":"histidinele","dative-genitive-indefinite-singular":"histidine","dative-definite-genitive-singular":"histidinei","dative-genitive-indefinite-plural":"histidine","dative-definite-genitive-plural":"histidinelor","singular-vocative":"histidină","plural-vocative":"histidinelor"}},{"word":"histiocit","pos":"noun","definitions":["histiocyte"],"forms":{"plural":"histiocite","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"histiocit","accusative-definite-nominative-singular":"histiocitul","accusative-indefinite-nominative-plural":"histiocite","accusative-definite-nominative-plural":"histiocitele","dative-genitive-indefinite-singular":"histiocit","dative-definite-genitive-singular":"histiocitului","dative-genitive-indefinite-plural":"histiocite","dative-definite-genitive-plural":"histiocitelor","singular-vocative":"histiocitule","plural-vocative":"histiocitelor"}},{"word":"histochimic","pos":"adj","definitions":["histochemical"],"forms":{"feminine-singular":"histochimică","masculine-plural":"histochimici","feminine-neuter-plural":"histochimice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histochimic","error-unrecognized-form-feminine-indefinite-singular":"histochimică","error-unrecognized-form-indefinite-masculine-plural":"histochimici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histochimice","definite-error-unrecognized-form-masculine-neuter-singular":"histochimicul","definite-error-unrecognized-form-feminine-singular":"histochimica","definite-error-unrecognized-form-masculine-plural":"histochimicii","definite-error-unrecognized-form-feminine-neuter-plural":"histochimicele"}},{"word":"histochimie","pos":"noun","definitions":["histochemistry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"histochimie","accusative-definite-nominative":"histochimia","dative-genitive-indefinite":"histochimii","dative-definite-genitive":"histochimiei","vocative":"histochimie"}},{"word":"histodiagnostic","pos":"noun","definitions":["histodiagnostic"],"forms":{"plural":"histodiagnostice","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"histodiagnostic","accusative-definite-nominative-singular":"histodiagnosticul","accusative-indefinite-nominative-plural":"histodiagnostice","accusative-definite-nominative-plural":"histodiagnosticele","dative-genitive-indefinite-singular":"histodiagnostic","dative-definite-genitive-singular":"histodiagnosticului","dative-genitive-indefinite-plural":"histodiagnostice","dative-definite-genitive-plural":"histodiagnosticelor","singular-vocative":"histodiagnosticule","plural-vocative":"histodiagnosticelor"}},{"word":"histofiziologie","pos":"noun","definitions":["histophysiology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histofiziologie","accusative-definite-nominative-singular":"histofiziologia","accusative-indefinite-nominative-plural":"histofiziologii","accusative-definite-nominative-plural":"histofiziologiile","dative-genitive-indefinite-singular":"histofiziologii","dative-definite-genitive-singular":"histofiziologiei","dative-genitive-indefinite-plural":"histofiziologii","dative-definite-genitive-plural":"histofiziologiilor","singular-vocative":"histofiziologie","plural-vocative":"histofiziologiilor"}},{"word":"histogen","pos":"adj","definitions":["histogenic"],"forms":{"feminine-singular":"histogenă","masculine-plural":"histogeni","feminine-neuter-plural":"histogene","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histogen","error-unrecognized-form-feminine-indefinite-singular":"histogenă","error-unrecognized-form-indefinite-masculine-plural":"histogeni","error-unrecognized-form-feminine-indefinite-neuter-plural":"histogene","definite-error-unrecognized-form-masculine-neuter-singular":"histogenul","definite-error-unrecognized-form-feminine-singular":"histogena","definite-error-unrecognized-form-masculine-plural":"histogenii","definite-error-unrecognized-form-feminine-neuter-plural":"histogenele"}},{"word":"histogeneză","pos":"noun","definitions":["histogenesis"],"forms":{"plural":"histogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histogeneză","accusative-definite-nominative-singular":"histogeneza","accusative-indefinite-nominative-plural":"histogeneze","accusative-definite-nominative-plural":"histogenezele","dative-genitive-indefinite-singular":"histogeneze","dative-definite-genitive-singular":"histogenezei","dative-genitive-indefinite-plural":"histogeneze","dative-definite-genitive-plural":"histogenezelor","singular-vocative":"histogeneză","plural-vocative":"histogenezelor"}},{"word":"histogramă","pos":"noun","definitions":["histogram"],"forms":{"plural":"histograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histogramă","accusative-definite-nominative-singular":"histograma","accusative-indefinite-nominative-plural":"histograme","accusative-definite-nominative-plural":"histogramele","dative-genitive-indefinite-singular":"histograme","dative-definite-genitive-singular":"histogramei","dative-genitive-indefinite-plural":"histograme","dative-definite-genitive-plural":"histogramelor","singular-vocative":"histogramă","plural-vocative":"histogramelor"}},{"word":"histoid","pos":"adj","definitions":["histoid"],"forms":{"feminine-singular":"histoidă","masculine-plural":"histoizi","feminine-neuter-plural":"histoide","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histoid","error-unrecognized-form-feminine-indefinite-singular":"histoidă","error-unrecognized-form-indefinite-masculine-plural":"histoizi","error-unrecognized-form-feminine-indefinite-neuter-plural":"histoide","definite-error-unrecognized-form-masculine-neuter-singular":"histoidul","definite-error-unrecognized-form-feminine-singular":"histoida","definite-error-unrecognized-form-masculine-plural":"histoizii","definite-error-unrecognized-form-feminine-neuter-plural":"histoidele"}},{"word":"histoliză","pos":"noun","definitions":["histolysis"],"forms":{"plural":"histolize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histoliză","accusative-definite-nominative-singular":"histoliza","accusative-indefinite-nominative-plural":"histolize","accusative-definite-nominative-plural":"histolizele","dative-genitive-indefinite-singular":"histolize","dative-definite-genitive-singular":"histolizei","dative-genitive-indefinite-plural":"histolize","dative-definite-genitive-plural":"histolizelor","singular-vocative":"histoliză","plural-vocative":"histolizelor"}},{"word":"histolog","pos":"noun","definitions":["histologist"],"forms":{"plural":"histologi","feminine":"equivalent histologă","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"histolog","accusative-definite-nominative-singular":"histologul","accusative-indefinite-nominative-plural":"histologi","accusative-definite-nominative-plural":"histologii","dative-genitive-indefinite-singular":"histolog","dative-definite-genitive-singular":"histologului","dative-genitive-indefinite-plural":"histologi","dative-definite-genitive-plural":"histologilor","singular-vocative":"histologule","plural-vocative":"histologilor"}},{"word":"histologă","pos":"noun","definitions":["female equivalent of histolog"],"forms":{"plural":"histologe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histologă","accusative-definite-nominative-singular":"histologa","accusative-indefinite-nominative-plural":"histologe","accusative-definite-nominative-plural":"histologele","dative-genitive-indefinite-singular":"histologe","dative-definite-genitive-singular":"histologei","dative-genitive-indefinite-plural":"histologe","dative-definite-genitive-plural":"histologelor","singular-vocative":"histologă","plural-vocative":"histologelor"}},{"word":"histologic","pos":"adj","definitions":["histologic"],"pronunciation":"/ˌhis.toˈlo.d͡ʒik/","forms":{"feminine-singular":"histologică","masculine-plural":"histologici","feminine-neuter-plural":"histologice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"histologic","error-unrecognized-form-feminine-indefinite-singular":"histologică","error-unrecognized-form-indefinite-masculine-plural":"histologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histologice","definite-error-unrecognized-form-masculine-neuter-singular":"histologicul","definite-error-unrecognized-form-feminine-singular":"histologica","definite-error-unrecognized-form-masculine-plural":"histologicii","definite-error-unrecognized-form-feminine-neuter-plural":"histologicele"}},{"word":"histologie","pos":"noun","definitions":["histology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"histologie","accusative-definite-nominative":"histologia","dative-genitive-indefinite":"histologii","dative-definite-genitive":"histologiei","vocative":"histologie"}},{"word":"histomonoză","pos":"noun","definitions":["histomoniasis"],"forms":{"plural":"histomonoze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histomonoză","accusative-definite-nominative-singular":"histomonoza","accusative-indefinite-nominative-plural":"histomonoze","accusative-definite-nominative-plural":"histomonozele","dative-genitive-indefinite-singular":"histomonoze","dative-definite-genitive-singular":"histomonozei","dative-genitive-indefinite-plural":"histomonoze","dative-definite-genitive-plural":"histomonozelor","singular-vocative":"histomonoză","plural-vocative":"histomonozelor"}},{"word":"histonă","pos":"noun","definitions":["histone"],"forms":{"plural":"histone","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"histonă","accusative-definite-nominative-singular":"histona","accusative-indefinite-nominative-plural":"histone","accusative-definite-nominative-plural":"histonele","dative-genitive-indefinite-singular":"histone","dative-definite-genitive-singular":"histonei","dative-genitive-indefinite-plural":"histone","dative-definite-genitive-plural":"histonelor","singular-vocative":"histonă","plural-vocative":"histonelor"}},{"word":"histopatologic","pos":"adj","definitions":["histopathologic"],"forms":{"feminine-singular":"histopatologică","masculine-plural":"histopatologici","feminine-neuter-plural":"histopatologice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histopatologic","error-unrecognized-form-feminine-indefinite-singular":"histopatologică","error-unrecognized-form-indefinite-masculine-plural":"histopatologici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histopatologice","definite-error-unrecognized-form-masculine-neuter-singular":"histopatologicul","definite-error-unrecognized-form-feminine-singular":"histopatologica","definite-error-unrecognized-form-masculine-plural":"histopatologicii","definite-error-unrecognized-form-feminine-neuter-plural":"histopatologicele"}},{"word":"histopatologie","pos":"noun","definitions":["histopathology"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histopatologie","accusative-definite-nominative-singular":"histopatologia","accusative-indefinite-nominative-plural":"histopatologii","accusative-definite-nominative-plural":"histopatologiile","dative-genitive-indefinite-singular":"histopatologii","dative-definite-genitive-singular":"histopatologiei","dative-genitive-indefinite-plural":"histopatologii","dative-definite-genitive-plural":"histopatologiilor","singular-vocative":"histopatologie","plural-vocative":"histopatologiilor"}},{"word":"histoplasmoză","pos":"noun","definitions":["histoplasmosis, Darling's disease"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"histoplasmoză","accusative-definite-nominative":"histoplasmoza","dative-genitive-indefinite":"histoplasmoze","dative-definite-genitive":"histoplasmozei","vocative":"histoplasmoză"}},{"word":"historiogramă","pos":"noun","definitions":["time histogram"],"forms":{"plural":"historiograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"historiogramă","accusative-definite-nominative-singular":"historiograma","accusative-indefinite-nominative-plural":"historiograme","accusative-definite-nominative-plural":"historiogramele","dative-genitive-indefinite-singular":"historiograme","dative-definite-genitive-singular":"historiogramei","dative-genitive-indefinite-plural":"historiograme","dative-definite-genitive-plural":"historiogramelor","singular-vocative":"historiogramă","plural-vocative":"historiogramelor"}},{"word":"histoterapie","pos":"noun","definitions":["histotherapy"],"forms":{"plural":"histoterapii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"histoterapie","accusative-definite-nominative-singular":"histoterapia","accusative-indefinite-nominative-plural":"histoterapii","accusative-definite-nominative-plural":"histoterapiile","dative-genitive-indefinite-singular":"histoterapii","dative-definite-genitive-singular":"histoterapiei","dative-genitive-indefinite-plural":"histoterapii","dative-definite-genitive-plural":"histoterapiilor","singular-vocative":"histoterapie","plural-vocative":"histoterapiilor"}},{"word":"histotoxic","pos":"adj","definitions":["histotoxic"],"forms":{"feminine-singular":"histotoxică","masculine-plural":"histotoxici","feminine-neuter-plural":"histotoxice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histotoxic","error-unrecognized-form-feminine-indefinite-singular":"histotoxică","error-unrecognized-form-indefinite-masculine-plural":"histotoxici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histotoxice","definite-error-unrecognized-form-masculine-neuter-singular":"histotoxicul","definite-error-unrecognized-form-feminine-singular":"histotoxica","definite-error-unrecognized-form-masculine-plural":"histotoxicii","definite-error-unrecognized-form-feminine-neuter-plural":"histotoxicele"}},{"word":"histotropism","pos":"noun","definitions":["histotropism"],"forms":{"plural":"histotropisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"histotropism","accusative-definite-nominative-singular":"histotropismul","accusative-indefinite-nominative-plural":"histotropisme","accusative-definite-nominative-plural":"histotropismele","dative-genitive-indefinite-singular":"histotropism","dative-definite-genitive-singular":"histotropismului","dative-genitive-indefinite-plural":"histotropisme","dative-definite-genitive-plural":"histotropismelor","singular-vocative":"histotropismule","plural-vocative":"histotropismelor"}},{"word":"histrion","pos":"noun","definitions":["histrion"],"forms":{"plural":"histrioni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"histrion","accusative-definite-nominative-singular":"histrionul","accusative-indefinite-nominative-plural":"histrioni","accusative-definite-nominative-plural":"histrionii","dative-genitive-indefinite-singular":"histrion","dative-definite-genitive-singular":"histrionului","dative-genitive-indefinite-plural":"histrioni","dative-definite-genitive-plural":"histrionilor","singular-vocative":"histrionule","plural-vocative":"histrionilor"}},{"word":"histrionic","pos":"adj","definitions":["histrionic"],"forms":{"feminine-singular":"histrionică","masculine-plural":"histrionici","feminine-neuter-plural":"histrionice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"histrionic","error-unrecognized-form-feminine-indefinite-singular":"histrionică","error-unrecognized-form-indefinite-masculine-plural":"histrionici","error-unrecognized-form-feminine-indefinite-neuter-plural":"histrionice","definite-error-unrecognized-form-masculine-neuter-singular":"histrionicul","definite-error-unrecognized-form-feminine-singular":"histrionica","definite-error-unrecognized-form-masculine-plural":"histrionicii","definite-error-unrecognized-form-feminine-neuter-plural":"histrionicele"}},{"word":"hit","pos":"noun","definitions":["hit (a success, especially in the entertainment industry)"],"forms":{"plural":"hituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hit","accusative-definite-nominative-singular":"hitul","accusative-indefinite-nominative-plural":"hituri","accusative-definite-nominative-plural":"hiturile","dative-genitive-indefinite-singular":"hit","dative-definite-genitive-singular":"hitului","dative-genitive-indefinite-plural":"hituri","dative-definite-genitive-plural":"hiturilor","singular-vocative":"hitule","plural-vocative":"hiturilor"}},{"word":"Hitiaș","pos":"name","definitions":["a village in Racovița, Timiș County, Romania"],"gender":"f"},{"word":"hitit","pos":"noun","definitions":["Hittite"],"forms":{"plural":"hitiți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hitit","accusative-definite-nominative-singular":"hititul","accusative-indefinite-nominative-plural":"hitiți","accusative-definite-nominative-plural":"hitiții","dative-genitive-indefinite-singular":"hitit","dative-definite-genitive-singular":"hititului","dative-genitive-indefinite-plural":"hitiți","dative-definite-genitive-plural":"hitiților","singular-vocative":"hititule","plural-vocative":"hitiților"}},{"word":"hitită","pos":"noun","definitions":["female equivalent of hitit","Hittite language"],"forms":{"plural":"hitite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hitită","accusative-definite-nominative-singular":"hitita","accusative-indefinite-nominative-plural":"hitite","accusative-definite-nominative-plural":"hititele","dative-genitive-indefinite-singular":"hitite","dative-definite-genitive-singular":"hititei","dative-genitive-indefinite-plural":"hitite","dative-definite-genitive-plural":"hititelor","singular-vocative":"hitită","plural-vocative":"hititelor"}},{"word":"hitlerism","pos":"noun","definitions":["Hitlerism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hitlerism","accusative-definite-nominative-singular":"hitlerismul","accusative-indefinite-nominative-plural":"hitlerisme","accusative-definite-nominative-plural":"hitlerismele","dative-genitive-indefinite-singular":"hitlerism","dative-definite-genitive-singular":"hitlerismului","dative-genitive-indefinite-plural":"hitlerisme","dative-definite-genitive-plural":"hitlerismelor","singular-vocative":"hitlerismule","plural-vocative":"hitlerismelor"}},{"word":"hitlerist","pos":"noun","definitions":["Hitlerite"],"forms":{"plural":"hitleriști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hitlerist","accusative-definite-nominative-singular":"hitleristul","accusative-indefinite-nominative-plural":"hitleriști","accusative-definite-nominative-plural":"hitleriștii","dative-genitive-indefinite-singular":"hitlerist","dative-definite-genitive-singular":"hitleristului","dative-genitive-indefinite-plural":"hitleriști","dative-definite-genitive-plural":"hitleriștilor","singular-vocative":"hitleristule","plural-vocative":"hitleriștilor"}},{"word":"hitleristă","pos":"noun","definitions":["female equivalent of hitlerist"],"forms":{"plural":"hitleriste","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hitleristă","accusative-definite-nominative-singular":"hitlerista","accusative-indefinite-nominative-plural":"hitleriste","accusative-definite-nominative-plural":"hitleristele","dative-genitive-indefinite-singular":"hitleriste","dative-definite-genitive-singular":"hitleristei","dative-genitive-indefinite-plural":"hitleriste","dative-definite-genitive-plural":"hitleristelor","singular-vocative":"hitleristă","plural-vocative":"hitleristelor"}},{"word":"hiton","pos":"noun","definitions":["obsolete form of chiton"],"forms":{"plural":"hitoane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hiton","accusative-definite-nominative-singular":"hitonul","accusative-indefinite-nominative-plural":"hitoane","accusative-definite-nominative-plural":"hitoanele","dative-genitive-indefinite-singular":"hiton","dative-definite-genitive-singular":"hitonului","dative-genitive-indefinite-plural":"hitoane","dative-definite-genitive-plural":"hitoanelor","singular-vocative":"hitonule","plural-vocative":"hitoanelor"}},{"word":"Hladiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hladiuc"}},{"word":"Hlăpești","pos":"name","definitions":["a village in Dragomirești, Neamț County, Romania"],"gender":"m"},{"word":"hlei","pos":"noun","definitions":["clayey soil"],"forms":{"plural":"hleiuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hlei","accusative-definite-nominative-singular":"hleiul","accusative-indefinite-nominative-plural":"hleiuri","accusative-definite-nominative-plural":"hleiurile","dative-genitive-indefinite-singular":"hlei","dative-definite-genitive-singular":"hleiului","dative-genitive-indefinite-plural":"hleiuri","dative-definite-genitive-plural":"hleiurilor","singular-vocative":"hleiule","plural-vocative":"hleiurilor"}},{"word":"hleios","pos":"adj","definitions":["clayey"],"forms":{"feminine-singular":"hleioasă","masculine-plural":"hleioși","feminine-neuter-plural":"hleioase","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hleios","error-unrecognized-form-feminine-indefinite-singular":"hleioasă","error-unrecognized-form-indefinite-masculine-plural":"hleioși","error-unrecognized-form-feminine-indefinite-neuter-plural":"hleioase","definite-error-unrecognized-form-masculine-neuter-singular":"hleiosul","definite-error-unrecognized-form-feminine-singular":"hleioasa","definite-error-unrecognized-form-masculine-plural":"hleioșii","definite-error-unrecognized-form-feminine-neuter-plural":"hleioasele"}},{"word":"Hliboceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hliboceanu"}},{"word":"Hlibocianu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hlibocianu"}},{"word":"Hlihor","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hlihor"}},{"word":"Hlina","pos":"name","definitions":["a village in Hlina, Briceni Raion, Moldova","a commune of Briceni Raion, Moldova"],"gender":"f"},{"word":"Hlinaia","pos":"name","definitions":["a village in Hlinaia, Edineț Raion, Moldova","a commune of Edineț Raion, Moldova"],"gender":"f"},{"word":"Hlinaia Mică","pos":"name","definitions":["a village in Rotunda, Edineț Raion, Moldova"],"gender":"f"},{"word":"Hlincea","pos":"name","definitions":["a village in Ciurea, Iași County, Romania"],"gender":"f"},{"word":"hlipăt","pos":"noun","definitions":["sob, sigh"],"forms":{"plural":"hlipăte","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hlipăt","accusative-definite-nominative-singular":"hlipătul","accusative-indefinite-nominative-plural":"hlipăte","accusative-definite-nominative-plural":"hlipătele","dative-genitive-indefinite-singular":"hlipăt","dative-definite-genitive-singular":"hlipătului","dative-genitive-indefinite-plural":"hlipăte","dative-definite-genitive-plural":"hlipătelor","singular-vocative":"hlipătule","plural-vocative":"hlipătelor"}},{"word":"Hlipiceni","pos":"name","definitions":["a commune of Botoșani County, Romania","a village in Hlipiceni, Botoșani County, Romania"],"gender":"m"},{"word":"hliza","pos":"noun","definitions":["definite nominative/accusative singular of hliză"]},{"word":"hliză","pos":"noun","definitions":["a cultivable field"],"forms":{"plural":"hlize","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hliză","accusative-definite-nominative-singular":"hliza","accusative-indefinite-nominative-plural":"hlize","accusative-definite-nominative-plural":"hlizele","dative-genitive-indefinite-singular":"hlize","dative-definite-genitive-singular":"hlizei","dative-genitive-indefinite-plural":"hlize","dative-definite-genitive-plural":"hlizelor","singular-vocative":"hliză","plural-vocative":"hlizelor"}},{"word":"hlize","pos":"noun","definitions":["inflection of hliză:","indefinite nominative/accusative/genitive/dative plural","indefinite genitive/dative singular"]},{"word":"hlizenie","pos":"noun","definitions":["ugliness"],"forms":{"plural":"hlizenii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hlizenie","accusative-definite-nominative-singular":"hlizenia","accusative-indefinite-nominative-plural":"hlizenii","accusative-definite-nominative-plural":"hlizeniile","dative-genitive-indefinite-singular":"hlizenii","dative-definite-genitive-singular":"hlizeniei","dative-genitive-indefinite-plural":"hlizenii","dative-definite-genitive-plural":"hlizeniilor","singular-vocative":"hlizenie","plural-vocative":"hlizeniilor"}},{"word":"hlizișoară","pos":"noun","definitions":["diminutive of hliză"],"forms":{"plural":"hlizișoare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hlizișoară","accusative-definite-nominative-singular":"hlizișoara","accusative-indefinite-nominative-plural":"hlizișoare","accusative-definite-nominative-plural":"hlizișoarele","dative-genitive-indefinite-singular":"hlizișoare","dative-definite-genitive-singular":"hlizișoarei","dative-genitive-indefinite-plural":"hlizișoare","dative-definite-genitive-plural":"hlizișoarelor","singular-vocative":"hlizișoară","plural-vocative":"hlizișoarelor"}},{"word":"Hlușcă","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Hlușcă"}},{"word":"ho","pos":"intj","definitions":["Used to calm or stop a domestic animal, especially horses; whoa.","Used to calm down a person."],"examples":[{"ro":"Ho! Ușor!","en":"Whoa! Easy!"},{"ro":"Ho! Nu mai țipa !","en":"Whoa! Stop screaming!"}]},{"word":"Hoancă","pos":"name","definitions":["a village in Sohodol, Alba County, Romania","a village in Vidra, Alba County, Romania"],"gender":"m"},{"word":"Hoanca Moțului","pos":"name","definitions":["a river in Bihor, Romania, tributary to the Crișul Băiței"],"gender":"f"},{"word":"hoanghină","pos":"noun","definitions":["old woman, hag"],"forms":{"plural":"hoanghine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoanghină","accusative-definite-nominative-singular":"hoanghina","accusative-indefinite-nominative-plural":"hoanghine","accusative-definite-nominative-plural":"hoanghinele","dative-genitive-indefinite-singular":"hoanghine","dative-definite-genitive-singular":"hoanghinei","dative-genitive-indefinite-plural":"hoanghine","dative-definite-genitive-plural":"hoanghinelor","singular-vocative":"hoanghină","plural-vocative":"hoanghinelor"}},{"word":"hoardă","pos":"noun","definitions":["horde"],"forms":{"plural":"hoarde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoardă","accusative-definite-nominative-singular":"hoarda","accusative-indefinite-nominative-plural":"hoarde","accusative-definite-nominative-plural":"hoardele","dative-genitive-indefinite-singular":"hoarde","dative-definite-genitive-singular":"hoardei","dative-genitive-indefinite-plural":"hoarde","dative-definite-genitive-plural":"hoardelor","singular-vocative":"hoardă","plural-vocative":"hoardelor"}},{"word":"hoașcă","pos":"noun","definitions":["old woman, hag"],"forms":{"plural":"hoaște","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoașcă","accusative-definite-nominative-singular":"hoașca","accusative-indefinite-nominative-plural":"hoaște","accusative-definite-nominative-plural":"hoaștele","dative-genitive-indefinite-singular":"hoaște","dative-definite-genitive-singular":"hoaștei","dative-genitive-indefinite-plural":"hoaște","dative-definite-genitive-plural":"hoaștelor","singular-vocative":"hoașcă","plural-vocative":"hoaștelor"}},{"word":"hoață","pos":"noun","definitions":["female equivalent of hoț"],"forms":{"plural":"hoațe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoață","accusative-definite-nominative-singular":"hoața","accusative-indefinite-nominative-plural":"hoațe","accusative-definite-nominative-plural":"hoațele","dative-genitive-indefinite-singular":"hoațe","dative-definite-genitive-singular":"hoaței","dative-genitive-indefinite-plural":"hoațe","dative-definite-genitive-plural":"hoațelor","singular-vocative":"hoață","plural-vocative":"hoațelor"}},{"word":"Hobaia","pos":"name","definitions":["a village in Ogrezeni, Giurgiu County, Romania"],"gender":"f"},{"word":"hobăl","pos":"noun","definitions":["plane (tool)"],"forms":{"plural":"hobăle","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hobăl","accusative-definite-nominative-singular":"hobălul","accusative-indefinite-nominative-plural":"hobăle","accusative-definite-nominative-plural":"hobălele","dative-genitive-indefinite-singular":"hobăl","dative-definite-genitive-singular":"hobălului","dative-genitive-indefinite-plural":"hobăle","dative-definite-genitive-plural":"hobălelor","singular-vocative":"hobălule","plural-vocative":"hobălelor"}},{"word":"hoban","pos":"noun","definitions":["guy-wire"],"forms":{"plural":"hobane","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hoban","accusative-definite-nominative-singular":"hobanul","accusative-indefinite-nominative-plural":"hobane","accusative-definite-nominative-plural":"hobanele","dative-genitive-indefinite-singular":"hoban","dative-definite-genitive-singular":"hobanului","dative-genitive-indefinite-plural":"hobane","dative-definite-genitive-plural":"hobanelor","singular-vocative":"hobanule","plural-vocative":"hobanelor"}},{"word":"hobby","pos":"noun","definitions":["hobby"],"forms":{"plural":"hobby-uri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hobby","accusative-definite-nominative-singular":"hobby-ul","accusative-indefinite-nominative-plural":"hobby-uri","accusative-definite-nominative-plural":"hobby-urile","dative-genitive-indefinite-singular":"hobby","dative-definite-genitive-singular":"hobby-ului","dative-genitive-indefinite-plural":"hobby-uri","dative-definite-genitive-plural":"hobby-urilor","singular-vocative":"hobby-ule","plural-vocative":"hobby-urilor"}},{"word":"hobbyist","pos":"noun","definitions":["hobbyist"],"forms":{"plural":"hobbyiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hobbyist","accusative-definite-nominative-singular":"hobbyistul","accusative-indefinite-nominative-plural":"hobbyiști","accusative-definite-nominative-plural":"hobbyiștii","dative-genitive-indefinite-singular":"hobbyist","dative-definite-genitive-singular":"hobbyistului","dative-genitive-indefinite-plural":"hobbyiști","dative-definite-genitive-plural":"hobbyiștilor","singular-vocative":"hobbyistule","plural-vocative":"hobbyiștilor"}},{"word":"Hobincă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hobincă"}},{"word":"Hobița","pos":"name","definitions":["a village in Peștișani, Gorj County, Romania","a village in Pui, Hunedoara County, Romania"],"gender":"f"},{"word":"Hobița-Grădiște","pos":"name","definitions":["a village in Sarmizegetusa, Hunedoara County, Romania"],"gender":"m"},{"word":"hobot","pos":"noun","definitions":["bride's veil"],"forms":{"plural":"hobote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hobot","accusative-definite-nominative-singular":"hobotul","accusative-indefinite-nominative-plural":"hobote","accusative-definite-nominative-plural":"hobotele","dative-genitive-indefinite-singular":"hobot","dative-definite-genitive-singular":"hobotului","dative-genitive-indefinite-plural":"hobote","dative-definite-genitive-plural":"hobotelor","singular-vocative":"hobotule","plural-vocative":"hobotelor"}},{"word":"Hoceni","pos":"name","definitions":["a commune of Vaslui County, Romania","a village in Hoceni, Vaslui County, Romania"],"gender":"m"},{"word":"hochei","pos":"noun","definitions":["hockey"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hochei","accusative-definite-nominative":"hocheiul","dative-genitive-indefinite":"hochei","dative-definite-genitive":"hocheiului","vocative":"hocheiule"}},{"word":"hochei pe iarbă","pos":"noun","definitions":["field hockey"]},{"word":"hocheist","pos":"noun","definitions":["hockey player"],"forms":{"plural":"hocheiști","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hocheist","accusative-definite-nominative-singular":"hocheistul","accusative-indefinite-nominative-plural":"hocheisti","accusative-definite-nominative-plural":"hocheistii","dative-genitive-indefinite-singular":"hocheist","dative-definite-genitive-singular":"hocheistului","dative-genitive-indefinite-plural":"hocheisti","dative-definite-genitive-plural":"hocheistilor","singular-vocative":"hocheistule","plural-vocative":"hocheistilor"}},{"word":"hocheton","pos":"noun","definitions":["aketon"],"forms":{"plural":"hochetonuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hocheton","accusative-definite-nominative-singular":"hochetonul","accusative-indefinite-nominative-plural":"hochetonuri","accusative-definite-nominative-plural":"hochetonurile","dative-genitive-indefinite-singular":"hocheton","dative-definite-genitive-singular":"hochetonului","dative-genitive-indefinite-plural":"hochetonuri","dative-definite-genitive-plural":"hochetonurilor","singular-vocative":"hochetonule","plural-vocative":"hochetonurilor"}},{"word":"hochim","pos":"noun","definitions":["order of the Sultan"],"forms":{"plural":"hochimuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hochim","accusative-definite-nominative-singular":"hochimul","accusative-indefinite-nominative-plural":"hochimuri","accusative-definite-nominative-plural":"hochimurile","dative-genitive-indefinite-singular":"hochim","dative-definite-genitive-singular":"hochimului","dative-genitive-indefinite-plural":"hochimuri","dative-definite-genitive-plural":"hochimurilor","singular-vocative":"hochimule","plural-vocative":"hochimurilor"}},{"word":"hochiumat","pos":"noun","definitions":["order of the Sultan to the qadis"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hochiumat","accusative-definite-nominative":"hochiumatul","dative-genitive-indefinite":"hochiumat","dative-definite-genitive":"hochiumatului","vocative":"hochiumatule"}},{"word":"hochparter","pos":"noun","definitions":["raised first floor (US), raised ground floor (UK)"],"forms":{"plural":"hochpartere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hochparter","accusative-definite-nominative-singular":"hochparterul","accusative-indefinite-nominative-plural":"hochpartere","accusative-definite-nominative-plural":"hochparterele","dative-genitive-indefinite-singular":"hochparter","dative-definite-genitive-singular":"hochparterului","dative-genitive-indefinite-plural":"hochpartere","dative-definite-genitive-plural":"hochparterelor","singular-vocative":"hochparterule","plural-vocative":"hochparterelor"}},{"word":"Hociungi","pos":"name","definitions":["a village in Moldoveni, Neamț County, Romania"],"gender":"m"},{"word":"Hodăi Boian","pos":"name","definitions":["a village in Ceanu Mare, Cluj County, Romania"],"gender":"m"},{"word":"Hodaia","pos":"name","definitions":["a village in Fărăgău, Mureș County, Romania"],"gender":"f"},{"word":"Hodaie","pos":"name","definitions":["a village in Cătina, Cluj County, Romania"],"gender":"m"},{"word":"Hodărăști","pos":"name","definitions":["a village in Cornești, Dâmbovița County, Romania"],"gender":"m"},{"word":"Hodaș","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hodaș"}},{"word":"hodină","pos":"noun","definitions":["alternative form of odihnă"],"forms":{"plural":"hodine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hodină","accusative-definite-nominative-singular":"hodina","accusative-indefinite-nominative-plural":"hodine","accusative-definite-nominative-plural":"hodinele","dative-genitive-indefinite-singular":"hodine","dative-definite-genitive-singular":"hodinei","dative-genitive-indefinite-plural":"hodine","dative-definite-genitive-plural":"hodinelor","singular-vocative":"hodină","plural-vocative":"hodinelor"}},{"word":"hodini","pos":"verb","definitions":["alternative form of odihni"],"forms":{"canonical":"a hodini 4th conjugation","present-singular-third-person":"hodinește","participle-past":"hodinit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hodini","gerund":"hodinind","first-person-indicative-present-singular":"hodinesc","indicative-present-second-person-singular":"hodinești","indicative-present-singular-third-person":"hodinește","first-person-indicative-plural-present":"hodinim","indicative-plural-present-second-person":"hodiniți","indicative-plural-present-third-person":"hodinesc","first-person-imperfect-indicative-singular":"hodineam","imperfect-indicative-second-person-singular":"hodineai","imperfect-indicative-singular-third-person":"hodinea","first-person-imperfect-indicative-plural":"hodineam","imperfect-indicative-plural-second-person":"hodineați","imperfect-indicative-plural-third-person":"hodineau","first-person-indicative-perfect-singular":"hodinii","indicative-perfect-second-person-singular":"hodiniși","indicative-perfect-singular-third-person":"hodini","first-person-indicative-perfect-plural":"hodinirăm","indicative-perfect-plural-second-person":"hodinirăți","indicative-perfect-plural-third-person":"hodiniră","first-person-indicative-pluperfect-singular":"hodinisem","indicative-pluperfect-second-person-singular":"hodiniseși","indicative-pluperfect-singular-third-person":"hodinise","first-person-indicative-pluperfect-plural":"hodiniserăm","indicative-pluperfect-plural-second-person":"hodiniserăți","indicative-pluperfect-plural-third-person":"hodiniseră","first-person-present-singular-subjunctive":"să hodinesc","present-second-person-singular-subjunctive":"să hodinești","present-singular-subjunctive-third-person":"să hodinească","first-person-plural-present-subjunctive":"să hodinim","plural-present-second-person-subjunctive":"să hodiniți","plural-present-subjunctive-third-person":"să hodinească","imperative-second-person-singular":"hodinește","imperative-plural-second-person":"hodiniți","imperative-negative-second-person-singular":"nu hodini","imperative-negative-plural-second-person":"nu hodiniți"}},{"word":"hodinit","pos":"adj","definitions":["alternative form of odihnit"],"forms":{"feminine-singular":"hodinită","masculine-plural":"hodiniți","feminine-neuter-plural":"hodinite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hodinit","error-unrecognized-form-feminine-indefinite-singular":"hodinită","error-unrecognized-form-indefinite-masculine-plural":"hodiniți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hodinite","definite-error-unrecognized-form-masculine-neuter-singular":"hodinitul","definite-error-unrecognized-form-feminine-singular":"hodinita","definite-error-unrecognized-form-masculine-plural":"hodiniții","definite-error-unrecognized-form-feminine-neuter-plural":"hodinitele"}},{"word":"Hodiș","pos":"name","definitions":["a village in Bârsa, Arad County, Romania","a village in Holod, Bihor County, Romania"],"gender":"m"},{"word":"Hodișa","pos":"name","definitions":["a village in Socond, Satu Mare County, Romania"],"gender":"f"},{"word":"Hodișan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hodișan"}},{"word":"Hodișel","pos":"name","definitions":["a village in Olcea, Bihor County, Romania"],"gender":"m"},{"word":"Hodișești","pos":"name","definitions":["a village in Bistra, Alba County, Romania"],"gender":"m"},{"word":"Hodișu","pos":"name","definitions":["a village in Poieni, Cluj County, Romania"],"gender":"m"},{"word":"Hodivoaia","pos":"name","definitions":["a village in Putineiu, Giurgiu County, Romania"],"gender":"f"},{"word":"Hodod","pos":"name","definitions":["a commune of Satu Mare County, Romania","a village in Hodod, Satu Mare County, Romania"],"gender":"m"},{"word":"hodograf","pos":"noun","definitions":["hodograph"],"forms":{"plural":"hodografe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hodograf","accusative-definite-nominative-singular":"hodograful","accusative-indefinite-nominative-plural":"hodografe","accusative-definite-nominative-plural":"hodografele","dative-genitive-indefinite-singular":"hodograf","dative-definite-genitive-singular":"hodografului","dative-genitive-indefinite-plural":"hodografe","dative-definite-genitive-plural":"hodografelor","singular-vocative":"hodografule","plural-vocative":"hodografelor"}},{"word":"hodolean","pos":"noun","definitions":["alternative form of odolean"],"forms":{"plural":"hodoleni","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hodolean","accusative-definite-nominative-singular":"hodoleanul","accusative-indefinite-nominative-plural":"hodoleni","accusative-definite-nominative-plural":"hodolenii","dative-genitive-indefinite-singular":"hodolean","dative-definite-genitive-singular":"hodoleanului","dative-genitive-indefinite-plural":"hodoleni","dative-definite-genitive-plural":"hodolenilor","singular-vocative":"hodoleanule","plural-vocative":"hodolenilor"}},{"word":"hodometric","pos":"adj","definitions":["odometrical"],"forms":{"feminine-singular":"hodometrică","masculine-plural":"hodometrici","feminine-neuter-plural":"hodometrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hodometric","error-unrecognized-form-feminine-indefinite-singular":"hodometrică","error-unrecognized-form-indefinite-masculine-plural":"hodometrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"hodometrice","definite-error-unrecognized-form-masculine-neuter-singular":"hodometricul","definite-error-unrecognized-form-feminine-singular":"hodometrica","definite-error-unrecognized-form-masculine-plural":"hodometricii","definite-error-unrecognized-form-feminine-neuter-plural":"hodometricele"}},{"word":"hodometrie","pos":"noun","definitions":["odometry"],"forms":{"plural":"hodometrii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hodometrie","accusative-definite-nominative-singular":"hodometria","accusative-indefinite-nominative-plural":"hodometrii","accusative-definite-nominative-plural":"hodometriile","dative-genitive-indefinite-singular":"hodometrii","dative-definite-genitive-singular":"hodometriei","dative-genitive-indefinite-plural":"hodometrii","dative-definite-genitive-plural":"hodometriilor","singular-vocative":"hodometrie","plural-vocative":"hodometriilor"}},{"word":"hodometru","pos":"noun","definitions":["hodometer"],"forms":{"plural":"hodometre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hodometru","accusative-definite-nominative-singular":"hodometrul","accusative-indefinite-nominative-plural":"hodometre","accusative-definite-nominative-plural":"hodometrele","dative-genitive-indefinite-singular":"hodometru","dative-definite-genitive-singular":"hodometrului","dative-genitive-indefinite-plural":"hodometre","dative-definite-genitive-plural":"hodometrelor","singular-vocative":"hodometrule","plural-vocative":"hodometrelor"}},{"word":"Hodoni","pos":"name","definitions":["a village in Satchinez, Timiș County, Romania"],"gender":"m"},{"word":"Hodora","pos":"name","definitions":["a village in Cotnari, Iași County, Romania"],"gender":"f"},{"word":"Hodoreanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hodoreanu"}},{"word":"Hodoreasca","pos":"name","definitions":["a village in Câlnic, Gorj County, Romania"],"gender":"f"},{"word":"Hodoroabă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hodoroabă"}},{"word":"hodoroagă","pos":"noun","definitions":["female equivalent of hodorog"],"forms":{"plural":"hodoroage","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hodoroagă","accusative-definite-nominative-singular":"hodoroaga","accusative-indefinite-nominative-plural":"hodoroage","accusative-definite-nominative-plural":"hodoroagele","dative-genitive-indefinite-singular":"hodoroage","dative-definite-genitive-singular":"hodoroagei","dative-genitive-indefinite-plural":"hodoroage","dative-definite-genitive-plural":"hodoroagelor","singular-vocative":"hodoroagă","plural-vocative":"hodoroagelor"}},{"word":"Hodorog","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Hodorog"}},{"word":"hodorog","pos":"noun","definitions":["dodderer"],"forms":{"plural":"hodorogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hodorog","accusative-definite-nominative-singular":"hodorogul","accusative-indefinite-nominative-plural":"hodorogi","accusative-definite-nominative-plural":"hodorogii","dative-genitive-indefinite-singular":"hodorog","dative-definite-genitive-singular":"hodorogului","dative-genitive-indefinite-plural":"hodorogi","dative-definite-genitive-plural":"hodorogilor","singular-vocative":"hodorogule","plural-vocative":"hodorogilor"}},{"word":"hodorogi","pos":"verb","definitions":["to make a lot of noise (about old vehicles)","to talk too much and loudly"],"forms":{"canonical":"a hodorogi 4th conjugation","present-singular-third-person":"hodorogește","participle-past":"hodorogit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hodorogi","gerund":"hodorogind","first-person-indicative-present-singular":"hodorogesc","indicative-present-second-person-singular":"hodorogești","indicative-present-singular-third-person":"hodorogește","first-person-indicative-plural-present":"hodorogim","indicative-plural-present-second-person":"hodorogiți","indicative-plural-present-third-person":"hodorogesc","first-person-imperfect-indicative-singular":"hodorogeam","imperfect-indicative-second-person-singular":"hodorogeai","imperfect-indicative-singular-third-person":"hodorogea","first-person-imperfect-indicative-plural":"hodorogeam","imperfect-indicative-plural-second-person":"hodorogeați","imperfect-indicative-plural-third-person":"hodorogeau","first-person-indicative-perfect-singular":"hodorogii","indicative-perfect-second-person-singular":"hodorogiși","indicative-perfect-singular-third-person":"hodorogi","first-person-indicative-perfect-plural":"hodorogirăm","indicative-perfect-plural-second-person":"hodorogirăți","indicative-perfect-plural-third-person":"hodorogiră","first-person-indicative-pluperfect-singular":"hodorogisem","indicative-pluperfect-second-person-singular":"hodorogiseși","indicative-pluperfect-singular-third-person":"hodorogise","first-person-indicative-pluperfect-plural":"hodorogiserăm","indicative-pluperfect-plural-second-person":"hodorogiserăți","indicative-pluperfect-plural-third-person":"hodorogiseră","first-person-present-singular-subjunctive":"să hodorogesc","present-second-person-singular-subjunctive":"să hodorogești","present-singular-subjunctive-third-person":"să hodorogească","first-person-plural-present-subjunctive":"să hodorogim","plural-present-second-person-subjunctive":"să hodorogiți","plural-present-subjunctive-third-person":"să hodorogească","imperative-second-person-singular":"hodorogește","imperative-plural-second-person":"hodorogiți","imperative-negative-second-person-singular":"nu hodorogi","imperative-negative-plural-second-person":"nu hodorogiți"}},{"word":"hodorogire","pos":"noun","definitions":["the noise made by an old vehicle"],"forms":{"plural":"hodorogiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hodorogire","accusative-definite-nominative-singular":"hodorogirea","accusative-indefinite-nominative-plural":"hodorogiri","accusative-definite-nominative-plural":"hodorogirile","dative-genitive-indefinite-singular":"hodorogiri","dative-definite-genitive-singular":"hodorogirii","dative-genitive-indefinite-plural":"hodorogiri","dative-definite-genitive-plural":"hodorogirilor","singular-vocative":"hodorogire","plural-vocative":"hodorogirilor"}},{"word":"hodorogit","pos":"adj","definitions":["degraded, deteriorated"],"forms":{"feminine-singular":"hodorogită","masculine-plural":"hodorogiți","feminine-neuter-plural":"hodorogite","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hodorogit","error-unrecognized-form-feminine-indefinite-singular":"hodorogită","error-unrecognized-form-indefinite-masculine-plural":"hodorogiți","error-unrecognized-form-feminine-indefinite-neuter-plural":"hodorogite","definite-error-unrecognized-form-masculine-neuter-singular":"hodorogitul","definite-error-unrecognized-form-feminine-singular":"hodorogita","definite-error-unrecognized-form-masculine-plural":"hodorogiții","definite-error-unrecognized-form-feminine-neuter-plural":"hodorogitele"}},{"word":"hodorogit","pos":"verb","definitions":["past participle of hodorogi"],"forms":{"participle-past":"of hodorogi"}},{"word":"hodoronc","pos":"intj","definitions":["alternative form of hodorog"]},{"word":"Hodoș","pos":"name","definitions":["a village in Sălard, Bihor County, Romania","a village in Brestovăț, Timiș County, Romania","a village in Darova, Timiș County, Romania"],"gender":"m"},{"word":"Hodoșa","pos":"name","definitions":["a village in Sărmaș, Harghita County, Romania","a commune of Mureș County, Romania","a village in Hodoșa, Mureș County, Romania"],"gender":"f"},{"word":"Hodoșan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Hodoșan"}},{"word":"hofală","pos":"noun","definitions":["deed"],"forms":{"plural":"hofale","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hofală","accusative-definite-nominative-singular":"hofala","accusative-indefinite-nominative-plural":"hofale","accusative-definite-nominative-plural":"hofalele","dative-genitive-indefinite-singular":"hofale","dative-definite-genitive-singular":"hofalei","dative-genitive-indefinite-plural":"hofale","dative-definite-genitive-plural":"hofalelor","singular-vocative":"hofală","plural-vocative":"hofalelor"}},{"word":"hogaș","pos":"noun","definitions":["alternative form of făgaș"],"forms":{"plural":"hogașe","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hogaș","accusative-definite-nominative-singular":"hogașul","accusative-indefinite-nominative-plural":"hogașe","accusative-definite-nominative-plural":"hogașele","dative-genitive-indefinite-singular":"hogaș","dative-definite-genitive-singular":"hogașului","dative-genitive-indefinite-plural":"hogașe","dative-definite-genitive-plural":"hogașelor","singular-vocative":"hogașule","plural-vocative":"hogașelor"}},{"word":"Hogășoaia","pos":"name","definitions":["a surname originating as a matronymic"],"gender":"m","forms":{"dative-genitive":"lui Hogășoaia"}},{"word":"hoge","pos":"noun","definitions":["hodja"],"forms":{"plural":"hogi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoge","accusative-definite-nominative-singular":"hogeul","accusative-indefinite-nominative-plural":"hogi","accusative-definite-nominative-plural":"hogii","dative-genitive-indefinite-singular":"hoge","dative-definite-genitive-singular":"hogeului","dative-genitive-indefinite-plural":"hogi","dative-definite-genitive-plural":"hogilor","singular-vocative":"hogeule","plural-vocative":"hogilor"}},{"word":"hogea","pos":"noun","definitions":["alternative form of hoge"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hogea","accusative-definite-nominative":"hogeaul","dative-genitive-indefinite":"hogea","dative-definite-genitive":"hogeaului","vocative":"hogeaule"}},{"word":"hogeac","pos":"noun","definitions":["alternative form of ogeac"],"forms":{"plural":"hogeacuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hogeac","accusative-definite-nominative-singular":"hogeacul","accusative-indefinite-nominative-plural":"hogeacuri","accusative-definite-nominative-plural":"hogeacurile","dative-genitive-indefinite-singular":"hogeac","dative-definite-genitive-singular":"hogeacului","dative-genitive-indefinite-plural":"hogeacuri","dative-definite-genitive-plural":"hogeacurilor","singular-vocative":"hogeacule","plural-vocative":"hogeacurilor"}},{"word":"hogeag","pos":"noun","definitions":["chimney"],"forms":{"plural":"hogeaguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hogeag","accusative-definite-nominative-singular":"hogeagul","accusative-indefinite-nominative-plural":"hogeaguri","accusative-definite-nominative-plural":"hogeagurile","dative-genitive-indefinite-singular":"hogeag","dative-definite-genitive-singular":"hogeagului","dative-genitive-indefinite-plural":"hogeaguri","dative-definite-genitive-plural":"hogeagurilor","singular-vocative":"hogeagule","plural-vocative":"hogeagurilor"}},{"word":"hogeghean","pos":"noun","definitions":["second rank clerk in the Ottoman Empire"],"forms":{"plural":"hogegheani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hogeghean","accusative-definite-nominative-singular":"hogegheanul","accusative-indefinite-nominative-plural":"hogegheani","accusative-definite-nominative-plural":"hogegheanii","dative-genitive-indefinite-singular":"hogeghean","dative-definite-genitive-singular":"hogegheanului","dative-genitive-indefinite-plural":"hogegheani","dative-definite-genitive-plural":"hogegheanilor","singular-vocative":"hogegheanule","plural-vocative":"hogegheanilor"}},{"word":"hoget","pos":"noun","definitions":["certificate, document"],"pronunciation":"/ˈho.d͡ʒet/","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"hoget","accusative-definite-nominative":"hogetul","dative-genitive-indefinite":"hoget","dative-definite-genitive":"hogetului","vocative":"hogetule"}},{"word":"Hoghilag","pos":"name","definitions":["a commune of Sibiu County, Romania","a village in Hoghilag, Sibiu County, Romania"],"gender":"m"},{"word":"Hoghimaș","pos":"name","definitions":["a river in Covasna, Romania, tributary to the Bâsca Mare"],"gender":"m"},{"word":"Hoghiz","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Hoghiz, Brașov County, Romania"],"gender":"m"},{"word":"Hoginești","pos":"name","definitions":["a village in Hoginești, Călărași Raion, Moldova","a commune of Călărași Raion, Moldova"],"gender":"m"},{"word":"hoher","pos":"noun","definitions":["executioner","dogcatcher"],"forms":{"plural":"hoheri","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoher","accusative-definite-nominative-singular":"hoherul","accusative-indefinite-nominative-plural":"hoheri","accusative-definite-nominative-plural":"hoherii","dative-genitive-indefinite-singular":"hoher","dative-definite-genitive-singular":"hoherului","dative-genitive-indefinite-plural":"hoheri","dative-definite-genitive-plural":"hoherilor","singular-vocative":"hoherule","plural-vocative":"hoherilor"}},{"word":"hoheraș","pos":"noun","definitions":["diminutive of hoher"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"hoheraș","accusative-definite-nominative":"hoherașul","dative-genitive-indefinite":"hoheraș","dative-definite-genitive":"hoherașului","vocative":"hoherașule"}},{"word":"hoheri","pos":"verb","definitions":["to kill in a cruel way"],"forms":{"canonical":"a hoheri 4th conjugation","present-singular-third-person":"hoherește","participle-past":"hoherit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hoheri","gerund":"hoherind","first-person-indicative-present-singular":"hoheresc","indicative-present-second-person-singular":"hoherești","indicative-present-singular-third-person":"hoherește","first-person-indicative-plural-present":"hoherim","indicative-plural-present-second-person":"hoheriți","indicative-plural-present-third-person":"hoheresc","first-person-imperfect-indicative-singular":"hoheream","imperfect-indicative-second-person-singular":"hohereai","imperfect-indicative-singular-third-person":"hoherea","first-person-imperfect-indicative-plural":"hoheream","imperfect-indicative-plural-second-person":"hohereați","imperfect-indicative-plural-third-person":"hohereau","first-person-indicative-perfect-singular":"hoherii","indicative-perfect-second-person-singular":"hoheriși","indicative-perfect-singular-third-person":"hoheri","first-person-indicative-perfect-plural":"hoherirăm","indicative-perfect-plural-second-person":"hoherirăți","indicative-perfect-plural-third-person":"hoheriră","first-person-indicative-pluperfect-singular":"hoherisem","indicative-pluperfect-second-person-singular":"hoheriseși","indicative-pluperfect-singular-third-person":"hoherise","first-person-indicative-pluperfect-plural":"hoheriserăm","indicative-pluperfect-plural-second-person":"hoheriserăți","indicative-pluperfect-plural-third-person":"hoheriseră","first-person-present-singular-subjunctive":"să hoheresc","present-second-person-singular-subjunctive":"să hoherești","present-singular-subjunctive-third-person":"să hoherească","first-person-plural-present-subjunctive":"să hoherim","plural-present-second-person-subjunctive":"să hoheriți","plural-present-subjunctive-third-person":"să hoherească","imperative-second-person-singular":"hoherește","imperative-plural-second-person":"hoheriți","imperative-negative-second-person-singular":"nu hoheri","imperative-negative-plural-second-person":"nu hoheriți"}},{"word":"hohot","pos":"noun","definitions":["guffaw, ha-ha","roar, scream"],"forms":{"plural":"hohote","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"hohot","accusative-definite-nominative-singular":"hohotul","accusative-indefinite-nominative-plural":"hohote","accusative-definite-nominative-plural":"hohotele","dative-genitive-indefinite-singular":"hohot","dative-definite-genitive-singular":"hohotului","dative-genitive-indefinite-plural":"hohote","dative-definite-genitive-plural":"hohotelor","singular-vocative":"hohotule","plural-vocative":"hohotelor"}},{"word":"hohoti","pos":"verb","definitions":["to guffaw, roar (with laughter)","to sob"],"forms":{"canonical":"a hohoti 4th conjugation","present-singular-third-person":"hohotește","participle-past":"hohotit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hohoti","gerund":"hohotind","first-person-indicative-present-singular":"hohotesc","indicative-present-second-person-singular":"hohotești","indicative-present-singular-third-person":"hohotește","first-person-indicative-plural-present":"hohotim","indicative-plural-present-second-person":"hohotiți","indicative-plural-present-third-person":"hohotesc","first-person-imperfect-indicative-singular":"hohoteam","imperfect-indicative-second-person-singular":"hohoteai","imperfect-indicative-singular-third-person":"hohotea","first-person-imperfect-indicative-plural":"hohoteam","imperfect-indicative-plural-second-person":"hohoteați","imperfect-indicative-plural-third-person":"hohoteau","first-person-indicative-perfect-singular":"hohotii","indicative-perfect-second-person-singular":"hohotiși","indicative-perfect-singular-third-person":"hohoti","first-person-indicative-perfect-plural":"hohotirăm","indicative-perfect-plural-second-person":"hohotirăți","indicative-perfect-plural-third-person":"hohotiră","first-person-indicative-pluperfect-singular":"hohotisem","indicative-pluperfect-second-person-singular":"hohotiseși","indicative-pluperfect-singular-third-person":"hohotise","first-person-indicative-pluperfect-plural":"hohotiserăm","indicative-pluperfect-plural-second-person":"hohotiserăți","indicative-pluperfect-plural-third-person":"hohotiseră","first-person-present-singular-subjunctive":"să hohotesc","present-second-person-singular-subjunctive":"să hohotești","present-singular-subjunctive-third-person":"să hohotească","first-person-plural-present-subjunctive":"să hohotim","plural-present-second-person-subjunctive":"să hohotiți","plural-present-subjunctive-third-person":"să hohotească","imperative-second-person-singular":"hohotește","imperative-plural-second-person":"hohotiți","imperative-negative-second-person-singular":"nu hohoti","imperative-negative-plural-second-person":"nu hohotiți"}},{"word":"hohotire","pos":"noun","definitions":["roar (laughter)"],"forms":{"plural":"hohotiri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hohotire","accusative-definite-nominative-singular":"hohotirea","accusative-indefinite-nominative-plural":"hohotiri","accusative-definite-nominative-plural":"hohotirile","dative-genitive-indefinite-singular":"hohotiri","dative-definite-genitive-singular":"hohotirii","dative-genitive-indefinite-plural":"hohotiri","dative-definite-genitive-plural":"hohotirilor","singular-vocative":"hohotire","plural-vocative":"hohotirilor"}},{"word":"hoinar","pos":"adj","definitions":["wandering"],"forms":{"feminine-singular":"hoinară","masculine-plural":"hoinari","feminine-neuter-plural":"hoinare","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"hoinar","error-unrecognized-form-feminine-indefinite-singular":"hoinară","error-unrecognized-form-indefinite-masculine-plural":"hoinari","error-unrecognized-form-feminine-indefinite-neuter-plural":"hoinare","definite-error-unrecognized-form-masculine-neuter-singular":"hoinarul","definite-error-unrecognized-form-feminine-singular":"hoinara","definite-error-unrecognized-form-masculine-plural":"hoinarii","definite-error-unrecognized-form-feminine-neuter-plural":"hoinarele"}},{"word":"hoinar","pos":"noun","definitions":["wanderer"],"forms":{"plural":"hoinari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoinar","accusative-definite-nominative-singular":"hoinarul","accusative-indefinite-nominative-plural":"hoinari","accusative-definite-nominative-plural":"hoinarii","dative-genitive-indefinite-singular":"hoinar","dative-definite-genitive-singular":"hoinarului","dative-genitive-indefinite-plural":"hoinari","dative-definite-genitive-plural":"hoinarilor","singular-vocative":"hoinarule","plural-vocative":"hoinarilor"}},{"word":"hoinară","pos":"noun","definitions":["female equivalent of hoinar"],"forms":{"plural":"hoinare","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hoinară","accusative-definite-nominative-singular":"hoinara","accusative-indefinite-nominative-plural":"hoinare","accusative-definite-nominative-plural":"hoinarele","dative-genitive-indefinite-singular":"hoinare","dative-definite-genitive-singular":"hoinarei","dative-genitive-indefinite-plural":"hoinare","dative-definite-genitive-plural":"hoinarelor","singular-vocative":"hoinară","plural-vocative":"hoinarelor"}},{"word":"hoinăreală","pos":"noun","definitions":["rambling (walking aimlessly)"],"forms":{"plural":"hoinăreli","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"hoinăreală","accusative-definite-nominative-singular":"hoinăreala","accusative-indefinite-nominative-plural":"hoinăreli","accusative-definite-nominative-plural":"hoinărelile","dative-genitive-indefinite-singular":"hoinăreli","dative-definite-genitive-singular":"hoinărelii","dative-genitive-indefinite-plural":"hoinăreli","dative-definite-genitive-plural":"hoinărelilor","singular-vocative":"hoinăreală","plural-vocative":"hoinărelilor"}},{"word":"Hoinărescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Hoinărescu"}},{"word":"hoinări","pos":"verb","definitions":["to wander"],"forms":{"canonical":"a hoinări 4th conjugation","present-singular-third-person":"hoinărește","participle-past":"hoinărit","table-tags":"conjugation-4","inflection-template":"ro-conj-i-esc","infinitive":"a hoinări","gerund":"hoinărind","first-person-indicative-present-singular":"hoinăresc","indicative-present-second-person-singular":"hoinărești","indicative-present-singular-third-person":"hoinărește","first-person-indicative-plural-present":"hoinărim","indicative-plural-present-second-person":"hoinăriți","indicative-plural-present-third-person":"hoinăresc","first-person-imperfect-indicative-singular":"hoinăream","imperfect-indicative-second-person-singular":"hoinăreai","imperfect-indicative-singular-third-person":"hoinărea","first-person-imperfect-indicative-plural":"hoinăream","imperfect-indicative-plural-second-person":"hoinăreați","imperfect-indicative-plural-third-person":"hoinăreau","first-person-indicative-perfect-singular":"hoinării","indicative-perfect-second-person-singular":"hoinăriși","indicative-perfect-singular-third-person":"hoinări","first-person-indicative-perfect-plural":"hoinărirăm","indicative-perfect-plural-second-person":"hoinărirăți","indicative-perfect-plural-third-person":"hoinăriră","first-person-indicative-pluperfect-singular":"hoinărisem","indicative-pluperfect-second-person-singular":"hoinăriseși","indicative-pluperfect-singular-third-person":"hoinărise","first-person-indicative-pluperfect-plural":"hoinăriserăm","indicative-pluperfect-plural-second-person":"hoinăriserăți","indicative-pluperfect-plural-third-person":"hoinăriseră","first-person-present-singular-subjunctive":"să hoinăresc","present-second-person-singular-subjunctive":"să hoinărești","present-singular-subjunctive-third-person":"să hoinărească","first-person-plural-present-subjunctive":"să hoinărim","plural-present-second-person-subjunctive":"să hoinăriți","plural-present-subjunctive-third-person":"să hoinărească","imperative-second-person-singular":"hoinărește","imperative-plural-second-person":"hoinăriți","imperative-negative-second-person-singular":"nu hoinări","imperative-negative-plural-second-person":"nu hoinăriți"}},{"word":"hoinărire","pos":"noun","definitions":["wandering"],"forms":{"plural":"hoinăriri","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hoinărire","accusative-definite-nominative-singular":"hoinărirea","accusative-indefinite-nominative-plural":"hoinăriri","accusative-definite-nominative-plural":"hoinăririle","dative-genitive-indefinite-singular":"hoinăriri","dative-definite-genitive-singular":"hoinăririi","dative-genitive-indefinite-plural":"hoinăriri","dative-definite-genitive-plural":"hoinăririlor","singular-vocative":"hoinărire","plural-vocative":"hoinăririlor"}},{"word":"Hoisești","pos":"name","definitions":["a river in Iași, Romania, tributary to the Bahlui","a village in Dumești, Iași County, Romania","a village in Mărgineni, Neamț County, Romania"],"gender":"m"},{"word":"hoit","pos":"noun","definitions":["carrion, carcass","corpse"],"forms":{"plural":"hoituri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hoit","accusative-definite-nominative-singular":"hoitul","accusative-indefinite-nominative-plural":"hoituri","accusative-definite-nominative-plural":"hoiturile","dative-genitive-indefinite-singular":"hoit","dative-definite-genitive-singular":"hoitului","dative-genitive-indefinite-plural":"hoituri","dative-definite-genitive-plural":"hoiturilor","singular-vocative":"hoitule","plural-vocative":"hoiturilor"}},{"word":"hoitar","pos":"noun","definitions":["Egyptian vulture"],"pronunciation":"/hojˈtar/","forms":{"plural":"hoitari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hoitar","accusative-definite-nominative-singular":"hoitarul","accusative-indefinite-nominative-plural":"hoitari","accusative-definite-nominative-plural":"hoitarii","dative-genitive-indefinite-singular":"hoitar","dative-definite-genitive-singular":"hoitarului","dative-genitive-indefinite-plural":"hoitari","dative-definite-genitive-plural":"hoitarilor","singular-vocative":"hoitarule","plural-vocative":"hoitarilor"}},{"word":"hojma","pos":"adv","definitions":["often"]},{"word":"hojmă","pos":"adv","definitions":["alternative form of hojma"]},{"word":"hojmălău","pos":"noun","definitions":["alternative form of hojmalău"],"forms":{"plural":"hojmălăi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hojmălău","accusative-definite-nominative-singular":"hojmălăuul","accusative-indefinite-nominative-plural":"hojmălăi","accusative-definite-nominative-plural":"hojmălăii","dative-genitive-indefinite-singular":"hojmălău","dative-definite-genitive-singular":"hojmălăuului","dative-genitive-indefinite-plural":"hojmălăi","dative-definite-genitive-plural":"hojmălăilor","singular-vocative":"hojmălăuule","plural-vocative":"hojmălăilor"}},{"word":"hol","pos":"noun","definitions":["hall","lobby"],"forms":{"plural":"holuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"hol","accusative-definite-nominative-singular":"holul","accusative-indefinite-nominative-plural":"holuri","accusative-definite-nominative-plural":"holurile","dative-genitive-indefinite-singular":"hol","dative-definite-genitive-singular":"holului","dative-genitive-indefinite-plural":"holuri","dative-definite-genitive-plural":"holurilor","singular-vocative":"holule","plural-vocative":"holurilor"}},{"word":"holba","pos":"verb","definitions":["to goggle, stare at, ogle"],"forms":{"canonical":"a holba 1st conjugation","present-singular-third-person":"holbează","participle-past":"holbat","table-tags":"conjugation-1","inflection-template":"ro-conj-a-ez","infinitive":"a holba","gerund":"holbând","first-person-indicative-present-singular":"holbez","indicative-present-second-person-singular":"holbezi","indicative-present-singular-third-person":"holbează","first-person-indicative-plural-present":"holbăm","indicative-plural-present-second-person":"holbați","indicative-plural-present-third-person":"holbează","first-person-imperfect-indicative-singular":"holbam","imperfect-indicative-second-person-singular":"holbai","imperfect-indicative-singular-third-person":"holba","first-person-imperfect-indicative-plural":"holbam","imperfect-indicative-plural-second-person":"holbați","imperfect-indicative-plural-third-person":"holbau","first-person-indicative-perfect-singular":"holbai","indicative-perfect-second-person-singular":"holbași","indicative-perfect-singular-third-person":"holbă","first-person-indicative-perfect-plural":"holbarăm","indicative-perfect-plural-second-person":"holbarăți","indicative-perfect-plural-third-person":"holbară","first-person-indicative-pluperfect-singular":"holbasem","indicative-pluperfect-second-person-singular":"holbaseși","indicative-pluperfect-singular-third-person":"holbase","first-person-indicative-pluperfect-plural":"holbaserăm","indicative-pluperfect-plural-second-person":"holbaserăți","indicative-pluperfect-plural-third-person":"holbaseră","first-person-present-singular-subjunctive":"să holbez","present-second-person-singular-subjunctive":"să holbezi","present-singular-subjunctive-third-person":"să holbeze","first-person-plural-present-subjunctive":"să holbăm","plural-present-second-person-subjunctive":"să holbați","plural-present-subjunctive-third-person":"să holbeze","imperative-second-person-singular":"holbează","imperative-plural-second-person":"holbați","imperative-negative-second-person-singular":"nu holba","imperative-negative-plural-second-person":"nu holbați","alternative":"holbi"}},{"word":"Holbănești","pos":"name","definitions":["a village in Fitionești, Vrancea County, Romania"],"gender":"m"},{"word":"holbare","pos":"noun","definitions":["stare"],"forms":{"plural":"holbări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"holbare","accusative-definite-nominative-singular":"holbarea","accusative-indefinite-nominative-plural":"holbări","accusative-definite-nominative-plural":"holbările","dative-genitive-indefinite-singular":"holbări","dative-definite-genitive-singular":"holbării","dative-genitive-indefinite-plural":"holbări","dative-definite-genitive-plural":"holbărilor","singular-vocative":"holbare","plural-vocative":"holbărilor"}},{"word":"holbat","pos":"adj","definitions":["staring"],"forms":{"feminine-singular":"holbată","masculine-plural":"holbați","feminine-neuter-plural":"holbate","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holbat","error-unrecognized-form-feminine-indefinite-singular":"holbată","error-unrecognized-form-indefinite-masculine-plural":"holbați","error-unrecognized-form-feminine-indefinite-neuter-plural":"holbate","definite-error-unrecognized-form-masculine-neuter-singular":"holbatul","definite-error-unrecognized-form-feminine-singular":"holbata","definite-error-unrecognized-form-masculine-plural":"holbații","definite-error-unrecognized-form-feminine-neuter-plural":"holbatele"}},{"word":"Holbav","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Holbav, Brașov County, Romania"],"gender":"m"},{"word":"Holboca","pos":"name","definitions":["a commune of Iași County, Romania","a village in Holboca, Iași County, Romania"],"gender":"f"},{"word":"Holboceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Holboceanu"}},{"word":"Holbură","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Holbură"}},{"word":"holbură","pos":"noun","definitions":["alternative form of volbură"],"forms":{"plural":"holburi"}},{"word":"holcă","pos":"noun","definitions":["noise"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative":"holcă","accusative-definite-nominative":"holca","dative-genitive-indefinite":"holce","dative-definite-genitive":"holcei","vocative":"holcă"}},{"word":"holdă","pos":"noun","definitions":["cultivated field"],"forms":{"plural":"holde","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holdă","accusative-definite-nominative-singular":"holda","accusative-indefinite-nominative-plural":"holde","accusative-definite-nominative-plural":"holdele","dative-genitive-indefinite-singular":"holde","dative-definite-genitive-singular":"holdei","dative-genitive-indefinite-plural":"holde","dative-definite-genitive-plural":"holdelor","singular-vocative":"holdă","plural-vocative":"holdelor"}},{"word":"holdan","pos":"noun","definitions":["a kind of autumn hemp"],"forms":{"plural":"holdani","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"holdan","accusative-definite-nominative-singular":"holdanul","accusative-indefinite-nominative-plural":"holdani","accusative-definite-nominative-plural":"holdanii","dative-genitive-indefinite-singular":"holdan","dative-definite-genitive-singular":"holdanului","dative-genitive-indefinite-plural":"holdani","dative-definite-genitive-plural":"holdanilor","singular-vocative":"holdanule","plural-vocative":"holdanilor"}},{"word":"Holdea","pos":"name","definitions":["a village in Lăpugiu de Jos, Hunedoara County, Romania"],"gender":"f"},{"word":"holding","pos":"noun","definitions":["holding company"],"forms":{"plural":"holdinguri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"holding","accusative-definite-nominative-singular":"holdingul","accusative-indefinite-nominative-plural":"holdinguri","accusative-definite-nominative-plural":"holdingurile","dative-genitive-indefinite-singular":"holding","dative-definite-genitive-singular":"holdingului","dative-genitive-indefinite-plural":"holdinguri","dative-definite-genitive-plural":"holdingurilor","singular-vocative":"holdingule","plural-vocative":"holdingurilor"}},{"word":"Holdița","pos":"name","definitions":["a village in Broșteni, Suceava County, Romania"],"gender":"f"},{"word":"holdiță","pos":"noun","definitions":["diminutive of holdă; small cornfield"],"forms":{"plural":"holdițe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holdiță","accusative-definite-nominative-singular":"holdița","accusative-indefinite-nominative-plural":"holdițe","accusative-definite-nominative-plural":"holdițele","dative-genitive-indefinite-singular":"holdițe","dative-definite-genitive-singular":"holdiței","dative-genitive-indefinite-plural":"holdițe","dative-definite-genitive-plural":"holdițelor","singular-vocative":"holdiță","plural-vocative":"holdițelor"}},{"word":"holdup","pos":"noun","definitions":["hold-up, armed robbery"],"forms":{"plural":"holdupuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"holdup","accusative-definite-nominative-singular":"holdupul","accusative-indefinite-nominative-plural":"holdupuri","accusative-definite-nominative-plural":"holdupurile","dative-genitive-indefinite-singular":"holdup","dative-definite-genitive-singular":"holdupului","dative-genitive-indefinite-plural":"holdupuri","dative-definite-genitive-plural":"holdupurilor","singular-vocative":"holdupule","plural-vocative":"holdupurilor"}},{"word":"Holeciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holeciuc"}},{"word":"Holeiciuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holeiciuc"}},{"word":"holendru","pos":"noun","definitions":["alternative form of holender"],"forms":{"plural":"holendre","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"holendru","accusative-definite-nominative-singular":"holendruul","accusative-indefinite-nominative-plural":"holendre","accusative-definite-nominative-plural":"holendrele","dative-genitive-indefinite-singular":"holendru","dative-definite-genitive-singular":"holendruului","dative-genitive-indefinite-plural":"holendre","dative-definite-genitive-plural":"holendrelor","singular-vocative":"holendruule","plural-vocative":"holendrelor"}},{"word":"Holeră","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Holeră"}},{"word":"holeră","pos":"noun","definitions":["cholera"],"forms":{"plural":"holere","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holeră","accusative-definite-nominative-singular":"holera","accusative-indefinite-nominative-plural":"holere","accusative-definite-nominative-plural":"holerele","dative-genitive-indefinite-singular":"holere","dative-definite-genitive-singular":"holerei","dative-genitive-indefinite-plural":"holere","dative-definite-genitive-plural":"holerelor","singular-vocative":"holeră","plural-vocative":"holerelor"}},{"word":"Holercă","pos":"name","definitions":["a surname"],"gender":"m","forms":{"dative-genitive":"lui Holercă"}},{"word":"holercă","pos":"noun","definitions":["bad quality distilled spirit"],"forms":{"plural":"holerci","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă-i","accusative-indefinite-nominative-singular":"holercă","accusative-definite-nominative-singular":"holerca","accusative-indefinite-nominative-plural":"holerci","accusative-definite-nominative-plural":"holercile","dative-genitive-indefinite-singular":"holerci","dative-definite-genitive-singular":"holercii","dative-genitive-indefinite-plural":"holerci","dative-definite-genitive-plural":"holercilor","singular-vocative":"holercă","plural-vocative":"holercilor"}},{"word":"Holercani","pos":"name","definitions":["a village in Holercani, Dubăsari Raion, Moldova","a commune of Dubăsari Raion, Moldova"],"gender":"m"},{"word":"holercuță","pos":"noun","definitions":["diminutive of holercă"],"forms":{"plural":"holercuțe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holercuță","accusative-definite-nominative-singular":"holercuța","accusative-indefinite-nominative-plural":"holercuțe","accusative-definite-nominative-plural":"holercuțele","dative-genitive-indefinite-singular":"holercuțe","dative-definite-genitive-singular":"holercuței","dative-genitive-indefinite-plural":"holercuțe","dative-definite-genitive-plural":"holercuțelor","singular-vocative":"holercuță","plural-vocative":"holercuțelor"}},{"word":"holeric","pos":"adj","definitions":["choleric"],"forms":{"feminine-singular":"holerică","masculine-plural":"holerici","feminine-neuter-plural":"holerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holeric","error-unrecognized-form-feminine-indefinite-singular":"holerică","error-unrecognized-form-indefinite-masculine-plural":"holerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"holerice","definite-error-unrecognized-form-masculine-neuter-singular":"holericul","definite-error-unrecognized-form-feminine-singular":"holerica","definite-error-unrecognized-form-masculine-plural":"holericii","definite-error-unrecognized-form-feminine-neuter-plural":"holericele"}},{"word":"holerică","pos":"noun","definitions":["female equivalent of holeric"],"forms":{"plural":"holerice","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holerică","accusative-definite-nominative-singular":"holerica","accusative-indefinite-nominative-plural":"holerice","accusative-definite-nominative-plural":"holericele","dative-genitive-indefinite-singular":"holerice","dative-definite-genitive-singular":"holericei","dative-genitive-indefinite-plural":"holerice","dative-definite-genitive-plural":"holericelor","singular-vocative":"holerică","plural-vocative":"holericelor"}},{"word":"holerină","pos":"noun","definitions":["cholerine"],"forms":{"plural":"holerine","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holerină","accusative-definite-nominative-singular":"holerina","accusative-indefinite-nominative-plural":"holerine","accusative-definite-nominative-plural":"holerinele","dative-genitive-indefinite-singular":"holerine","dative-definite-genitive-singular":"holerinei","dative-genitive-indefinite-plural":"holerine","dative-definite-genitive-plural":"holerinelor","singular-vocative":"holerină","plural-vocative":"holerinelor"}},{"word":"holism","pos":"noun","definitions":["holism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"holism","accusative-definite-nominative":"holismul","dative-genitive-indefinite":"holism","dative-definite-genitive":"holismului","vocative":"holismule"}},{"word":"Holm","pos":"name","definitions":["a village in Podu Iloaiei, Iași County, Romania","a village in Pâncești, Neamț County, Romania"],"gender":"m"},{"word":"holm","pos":"noun","definitions":["hill"],"forms":{"plural":"holmuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"holm","accusative-definite-nominative-singular":"holmul","accusative-indefinite-nominative-plural":"holmuri","accusative-definite-nominative-plural":"holmurile","dative-genitive-indefinite-singular":"holm","dative-definite-genitive-singular":"holmului","dative-genitive-indefinite-plural":"holmuri","dative-definite-genitive-plural":"holmurilor","singular-vocative":"holmule","plural-vocative":"holmurilor"}},{"word":"holmiu","pos":"noun","definitions":["holmium (chemical element)"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"holmiu","accusative-definite-nominative":"holmiul","dative-genitive-indefinite":"holmiu","dative-definite-genitive":"holmiului","vocative":"holmiule"}},{"word":"Holobani","pos":"name","definitions":["a village in Lupșa, Alba County, Romania"],"gender":"m"},{"word":"holocaust","pos":"noun","definitions":["holocaust"],"forms":{"plural":"holocausturi","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"holocaust","accusative-definite-nominative-singular":"holocaustul","accusative-indefinite-nominative-plural":"holocausturi","accusative-definite-nominative-plural":"holocausturile","dative-genitive-indefinite-singular":"holocaust","dative-definite-genitive-singular":"holocaustului","dative-genitive-indefinite-plural":"holocausturi","dative-definite-genitive-plural":"holocausturilor","singular-vocative":"holocaustule","plural-vocative":"holocausturilor"}},{"word":"holocen","pos":"noun","definitions":["Holocene"],"forms":{"plural":"holoceni","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"holocen","accusative-definite-nominative-singular":"holocenul","accusative-indefinite-nominative-plural":"holoceni","accusative-definite-nominative-plural":"holocenile","dative-genitive-indefinite-singular":"holocen","dative-definite-genitive-singular":"holocenului","dative-genitive-indefinite-plural":"holoceni","dative-definite-genitive-plural":"holocenilor","singular-vocative":"holocenule","plural-vocative":"holocenilor"}},{"word":"holocristalin","pos":"adj","definitions":["holocrystalline"],"forms":{"feminine-singular":"holocristalină","masculine-plural":"holocristalini","feminine-neuter-plural":"holocristaline","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holocristalin","error-unrecognized-form-feminine-indefinite-singular":"holocristalină","error-unrecognized-form-indefinite-masculine-plural":"holocristalini","error-unrecognized-form-feminine-indefinite-neuter-plural":"holocristaline","definite-error-unrecognized-form-masculine-neuter-singular":"holocristalinul","definite-error-unrecognized-form-feminine-singular":"holocristalina","definite-error-unrecognized-form-masculine-plural":"holocristalinii","definite-error-unrecognized-form-feminine-neuter-plural":"holocristalinele"}},{"word":"Holod","pos":"name","definitions":["a commune of Bihor County, Romania","a village in Holod, Bihor County, Romania"],"gender":"m"},{"word":"Holodniuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holodniuc"}},{"word":"holoedric","pos":"adj","definitions":["holohedral"],"forms":{"feminine-singular":"holoedrică","masculine-plural":"holoedrici","feminine-neuter-plural":"holoedrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holoedric","error-unrecognized-form-feminine-indefinite-singular":"holoedrică","error-unrecognized-form-indefinite-masculine-plural":"holoedrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"holoedrice","definite-error-unrecognized-form-masculine-neuter-singular":"holoedricul","definite-error-unrecognized-form-feminine-singular":"holoedrica","definite-error-unrecognized-form-masculine-plural":"holoedricii","definite-error-unrecognized-form-feminine-neuter-plural":"holoedricele"}},{"word":"holoedrie","pos":"noun","definitions":["holohedry"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"holoedrie","accusative-definite-nominative":"holoedria","dative-genitive-indefinite":"holoedrii","dative-definite-genitive":"holoedriei","vocative":"holoedrie"}},{"word":"holofrastic","pos":"adj","definitions":["holophrastic"],"forms":{"feminine-singular":"holofrastică","masculine-plural":"holofrastici","feminine-neuter-plural":"holofrastice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holofrastic","error-unrecognized-form-feminine-indefinite-singular":"holofrastică","error-unrecognized-form-indefinite-masculine-plural":"holofrastici","error-unrecognized-form-feminine-indefinite-neuter-plural":"holofrastice","definite-error-unrecognized-form-masculine-neuter-singular":"holofrasticul","definite-error-unrecognized-form-feminine-singular":"holofrastica","definite-error-unrecognized-form-masculine-plural":"holofrasticii","definite-error-unrecognized-form-feminine-neuter-plural":"holofrasticele"}},{"word":"hologamie","pos":"noun","definitions":["hologamy"],"forms":{"plural":"hologamii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"hologamie","accusative-definite-nominative-singular":"hologamia","accusative-indefinite-nominative-plural":"hologamii","accusative-definite-nominative-plural":"hologamiile","dative-genitive-indefinite-singular":"hologamii","dative-definite-genitive-singular":"hologamiei","dative-genitive-indefinite-plural":"hologamii","dative-definite-genitive-plural":"hologamiilor","singular-vocative":"hologamie","plural-vocative":"hologamiilor"}},{"word":"holografic","pos":"adj","definitions":["holographic"],"forms":{"feminine-singular":"holografică","masculine-plural":"holografici","feminine-neuter-plural":"holografice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holografic","error-unrecognized-form-feminine-indefinite-singular":"holografică","error-unrecognized-form-indefinite-masculine-plural":"holografici","error-unrecognized-form-feminine-indefinite-neuter-plural":"holografice","definite-error-unrecognized-form-masculine-neuter-singular":"holograficul","definite-error-unrecognized-form-feminine-singular":"holografica","definite-error-unrecognized-form-masculine-plural":"holograficii","definite-error-unrecognized-form-feminine-neuter-plural":"holograficele"}},{"word":"holografie","pos":"noun","definitions":["holography"],"forms":{"plural":"holografii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"holografie","accusative-definite-nominative-singular":"holografia","accusative-indefinite-nominative-plural":"holografii","accusative-definite-nominative-plural":"holografiile","dative-genitive-indefinite-singular":"holografii","dative-definite-genitive-singular":"holografiei","dative-genitive-indefinite-plural":"holografii","dative-definite-genitive-plural":"holografiilor","singular-vocative":"holografie","plural-vocative":"holografiilor"}},{"word":"hologramă","pos":"noun","definitions":["hologram"],"forms":{"plural":"holograme","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"hologramă","accusative-definite-nominative-singular":"holograma","accusative-indefinite-nominative-plural":"holograme","accusative-definite-nominative-plural":"hologramele","dative-genitive-indefinite-singular":"holograme","dative-definite-genitive-singular":"hologramei","dative-genitive-indefinite-plural":"holograme","dative-definite-genitive-plural":"hologramelor","singular-vocative":"hologramă","plural-vocative":"hologramelor"}},{"word":"holom","pos":"noun","definitions":["mound"],"forms":{"plural":"holomuri","table-tags":"no-table-tags","inflection-template":"ro-noun-n-uri","accusative-indefinite-nominative-singular":"holom","accusative-definite-nominative-singular":"holomul","accusative-indefinite-nominative-plural":"holomuri","accusative-definite-nominative-plural":"holomurile","dative-genitive-indefinite-singular":"holom","dative-definite-genitive-singular":"holomului","dative-genitive-indefinite-plural":"holomuri","dative-definite-genitive-plural":"holomurilor","singular-vocative":"holomule","plural-vocative":"holomurilor"}},{"word":"holometabol","pos":"adj","definitions":["holometabolous"],"forms":{"feminine-singular":"holometabolă","masculine-plural":"holometaboli","feminine-neuter-plural":"holometabole","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holometabol","error-unrecognized-form-feminine-indefinite-singular":"holometabolă","error-unrecognized-form-indefinite-masculine-plural":"holometaboli","error-unrecognized-form-feminine-indefinite-neuter-plural":"holometabole","definite-error-unrecognized-form-masculine-neuter-singular":"holometabolul","definite-error-unrecognized-form-feminine-singular":"holometabola","definite-error-unrecognized-form-masculine-plural":"holometabolii","definite-error-unrecognized-form-feminine-neuter-plural":"holometabolele"}},{"word":"holoparazit","pos":"noun","definitions":["holoparasite"],"forms":{"plural":"holoparaziți","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"holoparazit","accusative-definite-nominative-singular":"holoparazitul","accusative-indefinite-nominative-plural":"holoparaziți","accusative-definite-nominative-plural":"holoparaziții","dative-genitive-indefinite-singular":"holoparazit","dative-definite-genitive-singular":"holoparazitului","dative-genitive-indefinite-plural":"holoparaziți","dative-definite-genitive-plural":"holoparaziților","singular-vocative":"holoparazitule","plural-vocative":"holoparaziților"}},{"word":"holoparazită","pos":"noun","definitions":["female equivalent of holoparazit"],"forms":{"plural":"holoparazite","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"holoparazită","accusative-definite-nominative-singular":"holoparazita","accusative-indefinite-nominative-plural":"holoparazite","accusative-definite-nominative-plural":"holoparazitele","dative-genitive-indefinite-singular":"holoparazite","dative-definite-genitive-singular":"holoparazitei","dative-genitive-indefinite-plural":"holoparazite","dative-definite-genitive-plural":"holoparazitelor","singular-vocative":"holoparazită","plural-vocative":"holoparazitelor"}},{"word":"Holoșnița Nouă","pos":"name","definitions":["a village in Palanca, Drochia Raion, Moldova"],"gender":"f"},{"word":"Holostencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holostencu"}},{"word":"Holoștencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holoștencu"}},{"word":"Holotiuc","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Holotiuc"}},{"word":"holoturid","pos":"noun","definitions":["holothurid"],"forms":{"plural":"holoturide","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"holoturid","accusative-definite-nominative-singular":"holoturidul","accusative-indefinite-nominative-plural":"holoturide","accusative-definite-nominative-plural":"holoturidele","dative-genitive-indefinite-singular":"holoturid","dative-definite-genitive-singular":"holoturidului","dative-genitive-indefinite-plural":"holoturide","dative-definite-genitive-plural":"holoturidelor","singular-vocative":"holoturidule","plural-vocative":"holoturidelor"}},{"word":"holoturie","pos":"noun","definitions":["sea cucumber"],"forms":{"plural":"holoturii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"holoturie","accusative-definite-nominative-singular":"holoturia","accusative-indefinite-nominative-plural":"holoturii","accusative-definite-nominative-plural":"holoturiile","dative-genitive-indefinite-singular":"holoturii","dative-definite-genitive-singular":"holoturiei","dative-genitive-indefinite-plural":"holoturii","dative-definite-genitive-plural":"holoturiilor","singular-vocative":"holoturie","plural-vocative":"holoturiilor"}},{"word":"holtei","pos":"noun","definitions":["bachelor"],"forms":{"plural":"holtei","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"holtei","accusative-definite-nominative-singular":"holteiul","accusative-indefinite-nominative-plural":"holtei","accusative-definite-nominative-plural":"holteii","dative-genitive-indefinite-singular":"holtei","dative-definite-genitive-singular":"holteiului","dative-genitive-indefinite-plural":"holtei","dative-definite-genitive-plural":"holteilor","singular-vocative":"holteiule","plural-vocative":"holteilor"}},{"word":"holteiaș","pos":"noun","definitions":["diminutive of holtei; small bachelor"],"forms":{"plural":"holteiași","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"holteiaș","accusative-definite-nominative-singular":"holteiașul","accusative-indefinite-nominative-plural":"holteiași","accusative-definite-nominative-plural":"holteiașii","dative-genitive-indefinite-singular":"holteiaș","dative-definite-genitive-singular":"holteiașului","dative-genitive-indefinite-plural":"holteiași","dative-definite-genitive-plural":"holteiașilor","singular-vocative":"holteiașule","plural-vocative":"holteiașilor"}},{"word":"holteie","pos":"noun","definitions":["bachelorhood"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"holteie","accusative-definite-nominative":"holteia","dative-genitive-indefinite":"holteii","dative-definite-genitive":"holteiei","vocative":"holteie"}},{"word":"holteiesc","pos":"adj","definitions":["bachelor"],"forms":{"feminine-singular":"holteiască","plural":"holteiești","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"holteiesc","error-unrecognized-form-feminine-indefinite-singular":"holteiască","error-unrecognized-form-indefinite-masculine-plural":"holteiești","error-unrecognized-form-feminine-indefinite-neuter-plural":"holteiești","definite-error-unrecognized-form-masculine-neuter-singular":"holteiescul","definite-error-unrecognized-form-feminine-singular":"holteiasca","definite-error-unrecognized-form-masculine-plural":"holteieștii","definite-error-unrecognized-form-feminine-neuter-plural":"holteieștile"}},{"word":"holteraș","pos":"noun","definitions":["diminutive of holter"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative":"holteraș","accusative-definite-nominative":"holterașul","dative-genitive-indefinite":"holteraș","dative-definite-genitive":"holterașului","vocative":"holterașule"}},{"word":"homar","pos":"noun","definitions":["lobster"],"forms":{"plural":"homari","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homar","accusative-definite-nominative-singular":"homarul","accusative-indefinite-nominative-plural":"homari","accusative-definite-nominative-plural":"homarii","dative-genitive-indefinite-singular":"homar","dative-definite-genitive-singular":"homarului","dative-genitive-indefinite-plural":"homari","dative-definite-genitive-plural":"homarilor","singular-vocative":"homarule","plural-vocative":"homarilor"}},{"word":"homeless","pos":"noun","definitions":["homeless"],"forms":{"plural":"homeless","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homeless","accusative-definite-nominative-singular":"homelessul","accusative-indefinite-nominative-plural":"homeless","accusative-definite-nominative-plural":"homelessi","dative-genitive-indefinite-singular":"homeless","dative-definite-genitive-singular":"homelessului","dative-genitive-indefinite-plural":"homeless","dative-definite-genitive-plural":"homelesslor","singular-vocative":"homelessule","plural-vocative":"homelesslor"}},{"word":"Homencu","pos":"name","definitions":["a surname from Ukrainian"],"gender":"m","forms":{"dative-genitive":"lui Homencu"}},{"word":"homeomorfism","pos":"noun","definitions":["homeomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"homeomorfism","accusative-definite-nominative-singular":"homeomorfismul","accusative-indefinite-nominative-plural":"homeomorfisme","accusative-definite-nominative-plural":"homeomorfismele","dative-genitive-indefinite-singular":"homeomorfism","dative-definite-genitive-singular":"homeomorfismului","dative-genitive-indefinite-plural":"homeomorfisme","dative-definite-genitive-plural":"homeomorfismelor","singular-vocative":"homeomorfismule","plural-vocative":"homeomorfismelor"}},{"word":"homeopat","pos":"noun","definitions":["homeopath"],"pronunciation":"/ho.me.oˈpat/","forms":{"plural":"homeopați","feminine":"equivalent homeopată","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homeopat","accusative-definite-nominative-singular":"homeopatul","accusative-indefinite-nominative-plural":"homeopați","accusative-definite-nominative-plural":"homeopații","dative-genitive-indefinite-singular":"homeopat","dative-definite-genitive-singular":"homeopatului","dative-genitive-indefinite-plural":"homeopați","dative-definite-genitive-plural":"homeopaților","singular-vocative":"homeopatule","plural-vocative":"homeopaților"}},{"word":"homeopată","pos":"noun","definitions":["female equivalent of homeopat"],"forms":{"plural":"homeopate","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homeopată","accusative-definite-nominative-singular":"homeopata","accusative-indefinite-nominative-plural":"homeopate","accusative-definite-nominative-plural":"homeopatele","dative-genitive-indefinite-singular":"homeopate","dative-definite-genitive-singular":"homeopatei","dative-genitive-indefinite-plural":"homeopate","dative-definite-genitive-plural":"homeopatelor","singular-vocative":"homeopată","plural-vocative":"homeopatelor"}},{"word":"homeopatic","pos":"adj","definitions":["homeopathic"],"forms":{"feminine-singular":"homeopatică","masculine-plural":"homeopatici","feminine-neuter-plural":"homeopatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homeopatic","error-unrecognized-form-feminine-indefinite-singular":"homeopatică","error-unrecognized-form-indefinite-masculine-plural":"homeopatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"homeopatice","definite-error-unrecognized-form-masculine-neuter-singular":"homeopaticul","definite-error-unrecognized-form-feminine-singular":"homeopatica","definite-error-unrecognized-form-masculine-plural":"homeopaticii","definite-error-unrecognized-form-feminine-neuter-plural":"homeopaticele"}},{"word":"homeopatie","pos":"noun","definitions":["homeopathy"],"forms":{"plural":"homeopatii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"homeopatie","accusative-definite-nominative-singular":"homeopatia","accusative-indefinite-nominative-plural":"homeopatii","accusative-definite-nominative-plural":"homeopatiile","dative-genitive-indefinite-singular":"homeopatii","dative-definite-genitive-singular":"homeopatiei","dative-genitive-indefinite-plural":"homeopatii","dative-definite-genitive-plural":"homeopatiilor","singular-vocative":"homeopatie","plural-vocative":"homeopatiilor"}},{"word":"homeoplazie","pos":"noun","definitions":["homeoplasy"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"homeoplazie","accusative-definite-nominative":"homeoplazia","dative-genitive-indefinite":"homeoplazii","dative-definite-genitive":"homeoplaziei","vocative":"homeoplazie"}},{"word":"homeostat","pos":"noun","definitions":["homeostat"],"forms":{"plural":"homeostate","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"homeostat","accusative-definite-nominative-singular":"homeostatul","accusative-indefinite-nominative-plural":"homeostate","accusative-definite-nominative-plural":"homeostatele","dative-genitive-indefinite-singular":"homeostat","dative-definite-genitive-singular":"homeostatului","dative-genitive-indefinite-plural":"homeostate","dative-definite-genitive-plural":"homeostatelor","singular-vocative":"homeostatule","plural-vocative":"homeostatelor"}},{"word":"homeostatic","pos":"adj","definitions":["homeostatic"],"forms":{"feminine-singular":"homeostatică","masculine-plural":"homeostatici","feminine-neuter-plural":"homeostatice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homeostatic","error-unrecognized-form-feminine-indefinite-singular":"homeostatică","error-unrecognized-form-indefinite-masculine-plural":"homeostatici","error-unrecognized-form-feminine-indefinite-neuter-plural":"homeostatice","definite-error-unrecognized-form-masculine-neuter-singular":"homeostaticul","definite-error-unrecognized-form-feminine-singular":"homeostatica","definite-error-unrecognized-form-masculine-plural":"homeostaticii","definite-error-unrecognized-form-feminine-neuter-plural":"homeostaticele"}},{"word":"homeostază","pos":"noun","definitions":["homeostasis"],"forms":{"plural":"homeostaze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homeostază","accusative-definite-nominative-singular":"homeostaza","accusative-indefinite-nominative-plural":"homeostaze","accusative-definite-nominative-plural":"homeostazele","dative-genitive-indefinite-singular":"homeostaze","dative-definite-genitive-singular":"homeostazei","dative-genitive-indefinite-plural":"homeostaze","dative-definite-genitive-plural":"homeostazelor","singular-vocative":"homeostază","plural-vocative":"homeostazelor"}},{"word":"homeostazie","pos":"noun","definitions":["homeostasis"],"forms":{"plural":"homeostazii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"homeostazie","accusative-definite-nominative-singular":"homeostazia","accusative-indefinite-nominative-plural":"homeostazii","accusative-definite-nominative-plural":"homeostaziile","dative-genitive-indefinite-singular":"homeostazii","dative-definite-genitive-singular":"homeostaziei","dative-genitive-indefinite-plural":"homeostazii","dative-definite-genitive-plural":"homeostaziilor","singular-vocative":"homeostazie","plural-vocative":"homeostaziilor"}},{"word":"homeoterm","pos":"noun","definitions":["warm-blooded"],"forms":{"plural":"homeotermi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homeoterm","accusative-definite-nominative-singular":"homeotermul","accusative-indefinite-nominative-plural":"homeotermi","accusative-definite-nominative-plural":"homeotermii","dative-genitive-indefinite-singular":"homeoterm","dative-definite-genitive-singular":"homeotermului","dative-genitive-indefinite-plural":"homeotermi","dative-definite-genitive-plural":"homeotermilor","singular-vocative":"homeotermule","plural-vocative":"homeotermilor"}},{"word":"homeotermie","pos":"noun","definitions":["homeothermy"],"forms":{"plural":"homeotermii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"homeotermie","accusative-definite-nominative-singular":"homeotermia","accusative-indefinite-nominative-plural":"homeotermii","accusative-definite-nominative-plural":"homeotermiile","dative-genitive-indefinite-singular":"homeotermii","dative-definite-genitive-singular":"homeotermiei","dative-genitive-indefinite-plural":"homeotermii","dative-definite-genitive-plural":"homeotermiilor","singular-vocative":"homeotermie","plural-vocative":"homeotermiilor"}},{"word":"Homer","pos":"name","definitions":["Homer"],"gender":"m"},{"word":"homeric","pos":"adj","definitions":["Homeric"],"forms":{"feminine-singular":"homerică","masculine-plural":"homerici","feminine-neuter-plural":"homerice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homeric","error-unrecognized-form-feminine-indefinite-singular":"homerică","error-unrecognized-form-indefinite-masculine-plural":"homerici","error-unrecognized-form-feminine-indefinite-neuter-plural":"homerice","definite-error-unrecognized-form-masculine-neuter-singular":"homericul","definite-error-unrecognized-form-feminine-singular":"homerica","definite-error-unrecognized-form-masculine-plural":"homericii","definite-error-unrecognized-form-feminine-neuter-plural":"homericele"}},{"word":"homerid","pos":"noun","definitions":["Homerid"],"forms":{"plural":"homerizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homerid","accusative-definite-nominative-singular":"homeridul","accusative-indefinite-nominative-plural":"homerizi","accusative-definite-nominative-plural":"homerizii","dative-genitive-indefinite-singular":"homerid","dative-definite-genitive-singular":"homeridului","dative-genitive-indefinite-plural":"homerizi","dative-definite-genitive-plural":"homerizilor","singular-vocative":"homeridule","plural-vocative":"homerizilor"}},{"word":"homerism","pos":"noun","definitions":["Homerism"],"forms":{"plural":"homerisme","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"homerism","accusative-definite-nominative-singular":"homerismul","accusative-indefinite-nominative-plural":"homerisme","accusative-definite-nominative-plural":"homerismele","dative-genitive-indefinite-singular":"homerism","dative-definite-genitive-singular":"homerismului","dative-genitive-indefinite-plural":"homerisme","dative-definite-genitive-plural":"homerismelor","singular-vocative":"homerismule","plural-vocative":"homerismelor"}},{"word":"Homescu","pos":"name","definitions":["a surname originating as a patronymic"],"gender":"m","forms":{"dative-genitive":"lui Homescu"}},{"word":"Homești","pos":"name","definitions":["a village in Grebănu, Buzău County, Romania"],"gender":"m"},{"word":"homicid","pos":"noun","definitions":["homicide"],"forms":{"plural":"homicizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homicid","accusative-definite-nominative-singular":"homicidul","accusative-indefinite-nominative-plural":"homicizi","accusative-definite-nominative-plural":"homicizii","dative-genitive-indefinite-singular":"homicid","dative-definite-genitive-singular":"homicidului","dative-genitive-indefinite-plural":"homicizi","dative-definite-genitive-plural":"homicizilor","singular-vocative":"homicidule","plural-vocative":"homicizilor"}},{"word":"homicidă","pos":"noun","definitions":["female equivalent of homicid"],"forms":{"plural":"homicide","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homicidă","accusative-definite-nominative-singular":"homicida","accusative-indefinite-nominative-plural":"homicide","accusative-definite-nominative-plural":"homicidele","dative-genitive-indefinite-singular":"homicide","dative-definite-genitive-singular":"homicidei","dative-genitive-indefinite-plural":"homicide","dative-definite-genitive-plural":"homicidelor","singular-vocative":"homicidă","plural-vocative":"homicidelor"}},{"word":"hominid","pos":"noun","definitions":["hominid"],"forms":{"plural":"hominizi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"hominid","accusative-definite-nominative-singular":"hominidul","accusative-indefinite-nominative-plural":"hominizi","accusative-definite-nominative-plural":"hominizii","dative-genitive-indefinite-singular":"hominid","dative-definite-genitive-singular":"hominidului","dative-genitive-indefinite-plural":"hominizi","dative-definite-genitive-plural":"hominizilor","singular-vocative":"hominidule","plural-vocative":"hominizilor"}},{"word":"hominizare","pos":"noun","definitions":["hominization"],"forms":{"plural":"hominizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"hominizare","accusative-definite-nominative-singular":"hominizarea","accusative-indefinite-nominative-plural":"hominizări","accusative-definite-nominative-plural":"hominizările","dative-genitive-indefinite-singular":"hominizări","dative-definite-genitive-singular":"hominizării","dative-genitive-indefinite-plural":"hominizări","dative-definite-genitive-plural":"hominizărilor","singular-vocative":"hominizare","plural-vocative":"hominizărilor"}},{"word":"homo","pos":"noun","definitions":["gay"],"forms":{"plural":"homo","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homo","accusative-definite-nominative-singular":"homoul","accusative-indefinite-nominative-plural":"homo","accusative-definite-nominative-plural":"homoi","dative-genitive-indefinite-singular":"homo","dative-definite-genitive-singular":"homoului","dative-genitive-indefinite-plural":"homo","dative-definite-genitive-plural":"homolor","singular-vocative":"homoule","plural-vocative":"homolor"}},{"word":"homocentric","pos":"adj","definitions":["homocentric"],"forms":{"feminine-singular":"homocentrică","masculine-plural":"homocentrici","feminine-neuter-plural":"homocentrice","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homocentric","error-unrecognized-form-feminine-indefinite-singular":"homocentrică","error-unrecognized-form-indefinite-masculine-plural":"homocentrici","error-unrecognized-form-feminine-indefinite-neuter-plural":"homocentrice","definite-error-unrecognized-form-masculine-neuter-singular":"homocentricul","definite-error-unrecognized-form-feminine-singular":"homocentrica","definite-error-unrecognized-form-masculine-plural":"homocentricii","definite-error-unrecognized-form-feminine-neuter-plural":"homocentricele"}},{"word":"homocerc","pos":"adj","definitions":["homocercal"],"forms":{"feminine-singular":"homocercă","masculine-plural":"homocerci","feminine-neuter-plural":"homocerce","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homocerc","error-unrecognized-form-feminine-indefinite-singular":"homocercă","error-unrecognized-form-indefinite-masculine-plural":"homocerci","error-unrecognized-form-feminine-indefinite-neuter-plural":"homocerce","definite-error-unrecognized-form-masculine-neuter-singular":"homocercul","definite-error-unrecognized-form-feminine-singular":"homocerca","definite-error-unrecognized-form-masculine-plural":"homocercii","definite-error-unrecognized-form-feminine-neuter-plural":"homocercele"}},{"word":"Homocioaia","pos":"name","definitions":["a river in Buzău, Romania, tributary to the Slănic"],"gender":"f"},{"word":"homocromie","pos":"noun","definitions":["homochromy"],"forms":{"plural":"homocromii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"homocromie","accusative-definite-nominative-singular":"homocromia","accusative-indefinite-nominative-plural":"homocromii","accusative-definite-nominative-plural":"homocromiile","dative-genitive-indefinite-singular":"homocromii","dative-definite-genitive-singular":"homocromiei","dative-genitive-indefinite-plural":"homocromii","dative-definite-genitive-plural":"homocromiilor","singular-vocative":"homocromie","plural-vocative":"homocromiilor"}},{"word":"homocron","pos":"adj","definitions":["homochronous"],"forms":{"feminine-singular":"homocronă","masculine-plural":"homocroni","feminine-neuter-plural":"homocrone","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homocron","error-unrecognized-form-feminine-indefinite-singular":"homocronă","error-unrecognized-form-indefinite-masculine-plural":"homocroni","error-unrecognized-form-feminine-indefinite-neuter-plural":"homocrone","definite-error-unrecognized-form-masculine-neuter-singular":"homocronul","definite-error-unrecognized-form-feminine-singular":"homocrona","definite-error-unrecognized-form-masculine-plural":"homocronii","definite-error-unrecognized-form-feminine-neuter-plural":"homocronele"}},{"word":"Homodorean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homodorean"}},{"word":"homofob","pos":"noun","definitions":["homophobe"],"pronunciation":"[homoˈfob]","forms":{"plural":"homofobi","table-tags":"no-table-tags","inflection-template":"ro-noun-m","accusative-indefinite-nominative-singular":"homofob","accusative-definite-nominative-singular":"homofobul","accusative-indefinite-nominative-plural":"homofobi","accusative-definite-nominative-plural":"homofobii","dative-genitive-indefinite-singular":"homofob","dative-definite-genitive-singular":"homofobului","dative-genitive-indefinite-plural":"homofobi","dative-definite-genitive-plural":"homofobilor","singular-vocative":"homofobule","plural-vocative":"homofobilor"}},{"word":"homofobi","pos":"noun","definitions":["plural of homofob"],"gender":"m"},{"word":"homofobic","pos":"adj","definitions":["homophobic"],"pronunciation":"/ˌho.moˈfo.bik/","forms":{"feminine-singular":"homofobică","masculine-plural":"homofobici","feminine-neuter-plural":"homofobice","table-tags":"no-table-tags","inflection-template":"ro-adj-4","error-unrecognized-form-indefinite-masculine-neuter-singular":"homofobic","error-unrecognized-form-feminine-indefinite-singular":"homofobică","error-unrecognized-form-indefinite-masculine-plural":"homofobici","error-unrecognized-form-feminine-indefinite-neuter-plural":"homofobice","definite-error-unrecognized-form-masculine-neuter-singular":"homofobicul","definite-error-unrecognized-form-feminine-singular":"homofobica","definite-error-unrecognized-form-masculine-plural":"homofobicii","definite-error-unrecognized-form-feminine-neuter-plural":"homofobicele"}},{"word":"homofobie","pos":"noun","definitions":["homophobia"],"pronunciation":"[homofoˈbie]","forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"homofobie","accusative-definite-nominative":"homofobia","dative-genitive-indefinite":"homofobii","dative-definite-genitive":"homofobiei","vocative":"homofobie"}},{"word":"homogeneză","pos":"noun","definitions":["homogeny"],"forms":{"plural":"homogeneze","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homogeneză","accusative-definite-nominative-singular":"homogeneza","accusative-indefinite-nominative-plural":"homogeneze","accusative-definite-nominative-plural":"homogenezele","dative-genitive-indefinite-singular":"homogeneze","dative-definite-genitive-singular":"homogenezei","dative-genitive-indefinite-plural":"homogeneze","dative-definite-genitive-plural":"homogenezelor","singular-vocative":"homogeneză","plural-vocative":"homogenezelor"}},{"word":"homogrefă","pos":"noun","definitions":["homotransplantation"],"forms":{"plural":"homogrefe","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ă","accusative-indefinite-nominative-singular":"homogrefă","accusative-definite-nominative-singular":"homogrefa","accusative-indefinite-nominative-plural":"homogrefe","accusative-definite-nominative-plural":"homogrefele","dative-genitive-indefinite-singular":"homogrefe","dative-definite-genitive-singular":"homogrefei","dative-genitive-indefinite-plural":"homogrefe","dative-definite-genitive-plural":"homogrefelor","singular-vocative":"homogrefă","plural-vocative":"homogrefelor"}},{"word":"Homojdia","pos":"name","definitions":["a village in Curtea, Timiș County, Romania"],"gender":"f"},{"word":"homomorf","pos":"adj","definitions":["homomorphic"],"forms":{"feminine-singular":"homomorfă","masculine-plural":"homomorfi","feminine-neuter-plural":"homomorfe","table-tags":"no-table-tags","inflection-template":"ro-decl-adj","error-unrecognized-form-indefinite-masculine-neuter-singular":"homomorf","error-unrecognized-form-feminine-indefinite-singular":"homomorfă","error-unrecognized-form-indefinite-masculine-plural":"homomorfi","error-unrecognized-form-feminine-indefinite-neuter-plural":"homomorfe","definite-error-unrecognized-form-masculine-neuter-singular":"homomorful","definite-error-unrecognized-form-feminine-singular":"homomorfa","definite-error-unrecognized-form-masculine-plural":"homomorfii","definite-error-unrecognized-form-feminine-neuter-plural":"homomorfele"}},{"word":"homomorfia","pos":"noun","definitions":["nominative/accusative definite of homomorfie"],"gender":"f"},{"word":"homomorfie","pos":"noun","definitions":["homomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative":"homomorfie","accusative-definite-nominative":"homomorfia","dative-genitive-indefinite":"homomorfii","dative-definite-genitive":"homomorfiei","vocative":"homomorfie"}},{"word":"homomorfio","pos":"noun","definitions":["vocative of homomorfie"],"gender":"f"},{"word":"homomorfism","pos":"noun","definitions":["homomorphism"],"forms":{"table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative":"homomorfism","accusative-definite-nominative":"homomorfismul","dative-genitive-indefinite":"homomorfism","dative-definite-genitive":"homomorfismului","vocative":"homomorfismule"}},{"word":"homoplastie","pos":"noun","definitions":["homoplasty"],"forms":{"plural":"homoplastii","table-tags":"no-table-tags","inflection-template":"ro-noun-f-ie","accusative-indefinite-nominative-singular":"homoplastie","accusative-definite-nominative-singular":"homoplastia","accusative-indefinite-nominative-plural":"homoplastii","accusative-definite-nominative-plural":"homoplastiile","dative-genitive-indefinite-singular":"homoplastii","dative-definite-genitive-singular":"homoplastiei","dative-genitive-indefinite-plural":"homoplastii","dative-definite-genitive-plural":"homoplastiilor","singular-vocative":"homoplastie","plural-vocative":"homoplastiilor"}},{"word":"homopolimerizare","pos":"noun","definitions":["homopolymerization"],"forms":{"plural":"homopolimerizări","table-tags":"no-table-tags","inflection-template":"ro-noun-f-e","accusative-indefinite-nominative-singular":"homopolimerizare","accusative-definite-nominative-singular":"homopolimerizarea","accusative-indefinite-nominative-plural":"homopolimerizări","accusative-definite-nominative-plural":"homopolimerizările","dative-genitive-indefinite-singular":"homopolimerizări","dative-definite-genitive-singular":"homopolimerizării","dative-genitive-indefinite-plural":"homopolimerizări","dative-definite-genitive-plural":"homopolimerizărilor","singular-vocative":"homopolimerizare","plural-vocative":"homopolimerizărilor"}},{"word":"homopter","pos":"noun","definitions":["homopter"],"forms":{"plural":"homoptere","table-tags":"no-table-tags","inflection-template":"ro-noun-n","accusative-indefinite-nominative-singular":"homopter","accusative-definite-nominative-singular":"homopterul","accusative-indefinite-nominative-plural":"homoptere","accusative-definite-nominative-plural":"homopterele","dative-genitive-indefinite-singular":"homopter","dative-definite-genitive-singular":"homopterului","dative-genitive-indefinite-plural":"homoptere","dative-definite-genitive-plural":"homopterelor","singular-vocative":"homopterule","plural-vocative":"homopterelor"}},{"word":"Homorâciu","pos":"name","definitions":["a village in Izvoarele, Prahova County, Romania"],"gender":"m"},{"word":"Homoriceanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homoriceanu"}},{"word":"Homoroade","pos":"name","definitions":["a commune of Satu Mare County, Romania"],"gender":"m"},{"word":"Homorod","pos":"name","definitions":["a commune of Brașov County, Romania","a village in Homorod, Brașov County, Romania","a village in Geoagiu, Hunedoara County, Romania"],"gender":"m"},{"word":"Homorodan","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homorodan"}},{"word":"Homorodean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homorodean"}},{"word":"Homorodeanu","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homorodeanu"}},{"word":"Homorodu de Jos","pos":"name","definitions":["a village in Homoroade, Satu Mare County, Romania"],"gender":"m"},{"word":"Homorodu de Mijloc","pos":"name","definitions":["a village in Homoroade, Satu Mare County, Romania"],"gender":"m","forms":{"canonical-masculine":"Homorodu de Jos"}},{"word":"Homorodu de Sus","pos":"name","definitions":["a village in Homoroade, Satu Mare County, Romania"],"gender":"m"},{"word":"Homorodul Mare","pos":"name","definitions":["a river in Romania, tributary to the Homorod"],"gender":"m"},{"word":"Homorodul Mic","pos":"name","definitions":["a river in Romania, tributary to the Homorod"],"gender":"m"},{"word":"Homorodul Vechi","pos":"name","definitions":["a river in Brașov, Romania"],"gender":"m"},{"word":"Homorog","pos":"name","definitions":["a village in Mădăras, Bihor County, Romania"],"gender":"m"},{"word":"Homorozean","pos":"name","definitions":["a surname transferred from the place name"],"gender":"m","forms":{"dative-genitive":"lui Homorozean"}}];